@@ -1,55 +1,124 @@
 """BNC Lookup - O(1) word validation and frequency data from the British National Corpus.
 
 Provides instant word existence checking, frequency bucket ranking, and
-per-word relative frequency data for 669,417 word forms from the BNC
+per-word relative frequency data for 669,416 word forms from the BNC
 (100,106,029 tokens across 4,124 documents).
 
 Public API:
-    exists(word)                          -> bool
-    bucket(word)                          -> int | None
+    exists(word, fallback)                -> bool
+    bucket(word, fallback)                -> int | None
     words(bucket)                         -> tuple
     sample(bucket, n)                     -> list
-    relative_frequency(word)              -> float | None
+    relative_frequency(word, fallback)    -> float | None
     expected_count(word, length, rounded) -> float | int | None
-
-All lookups are case-insensitive with automatic plural fallback.
+    zipf(word, fallback)                  -> float | None
+    percentile(word, fallback)            -> float | None
+    word_id(word, fallback)               -> int | None
+    word_ids(words, fallback)             -> array('i')
+    word_from_id(word_id)                 -> str
+    prefix(prefix, k)                     -> list
+    suffix(suffix, k)                     -> list
+    glob(pattern, k)                      -> list
+    suggest(word, max_distance, k)        -> list
+    segment(text)                         -> list
+    english_likeness(text, threshold, confidence) -> dict
+    exists_batch(words, fallback)         -> list
+    bucket_batch(words, fallback)         -> list
+    relative_frequency_batch(words, fallback) -> list
+    zipf_codes(words, fallback)           -> bytes
+    percentile_codes(words, fallback)     -> bytes
+    exists_bytes(token, fallback)         -> bool
+    bucket_bytes(token, fallback)         -> int | None
+    relative_frequency_bytes(token, fallback) -> float | None
+    exists_buffer(buffer, offsets, fallback) -> list
+    bucket_buffer(buffer, offsets, fallback) -> list
+    relative_frequency_buffer(buffer, offsets, fallback) -> list
+    memory_report()                       -> dict
+    compile_overlay(source, output, tokens) -> int
+    load_overlay(path)                    -> int
+    clear_overlay()                       -> None
+    Lexicon(path)                         -> Lexicon
+    load_lexicon(path)                    -> Future[Lexicon]
+    use_lexicon(lexicon)                  -> Lexicon
+
+All lookups are case-insensitive with automatic plural fallback. Pass
+fallback='morph' to exists(), bucket(), relative_frequency() or
+expected_count() to also resolve other inflections (-ies, -ed, -ing,
+irregular plurals) to their base form, or fallback='none' to disable it.
+
+A domain overlay (compile_overlay() / load_overlay()) adds words the BNC
+lacks; exists(), bucket(), relative_frequency() and expected_count()
+consult it before the BNC tables.
+
+load_lexicon() replaces the data tables of a running process with another
+version (an archive written by bnc-build --archive), loaded in the
+background and swapped in atomically: every call to a lookup function of
+this module answers from a single version.
 """
 
+from bnc_lookup.find_batch import FindBatch
 from bnc_lookup.find_bnc import FindBnc
+from bnc_lookup.find_bytes import FindBytes
+from bnc_lookup.find_english import FindEnglish
 from bnc_lookup.find_freq import FindFreq
+from bnc_lookup.find_pattern import FindPattern
 from bnc_lookup.find_rf import FindRF
+from bnc_lookup.find_scores import FindScores
+from bnc_lookup.find_segments import FindSegments
+from bnc_lookup.find_suggestions import FindSuggestions
+from bnc_lookup.find_word_ids import FindWordIds
 from bnc_lookup.find_words import FindWords
-
-
-def exists(input_text: str) -> bool:
+from bnc_lookup.lexicon import Lexicon, consistent, consistent_tokens, load_lexicon, use_lexicon
+from bnc_lookup.memory import memory_report
+from bnc_lookup.overlay import clear_overlay, compile_overlay, load_overlay
+
+# The public API listed above; Lexicon, load_lexicon, use_lexicon, memory_report and the overlay functions are
+# re-exported from their modules
+__all__ = [
+    'Lexicon', 'bucket', 'bucket_batch', 'bucket_buffer', 'bucket_bytes', 'clear_overlay', 'compile_overlay',
+    'english_likeness', 'exists', 'exists_batch', 'exists_buffer', 'exists_bytes', 'expected_count', 'glob',
+    'load_lexicon', 'load_overlay', 'memory_report', 'percentile', 'percentile_codes', 'prefix',
+    'relative_frequency', 'relative_frequency_batch', 'relative_frequency_buffer', 'relative_frequency_bytes',
+    'sample', 'segment', 'suffix', 'suggest', 'use_lexicon', 'word_from_id', 'word_id', 'word_ids', 'words', 'zipf',
+    'zipf_codes',
+]
+
+
+@consistent
+def exists(input_text: str, fallback: str = 'plural') -> bool:
     """Check if a word exists in the BNC corpus.
 
     Includes automatic fallbacks:
     - Plural fallback: "computers" → tries "computer"
     - Contraction fallback: "we'll" → checks "we" + "'ll" exist
+    - Morphological fallback (fallback='morph'): "tweeted" → "tweet"
 
     Args:
         input_text: The word to check.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
 
     Returns:
         True if the word exists in the BNC (directly or via fallback).
     """
-    return FindBnc().exists(input_text)
+    return FindBnc().exists(input_text, fallback=fallback)
 
 
-def bucket(input_text: str) -> int | None:
+@consistent
+def bucket(input_text: str, fallback: str = 'plural') -> int | None:
     """Get frequency bucket for a word.
 
     Args:
         input_text: The word to look up.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
 
     Returns:
         1-100: Bucket number (1=most frequent, 100=least frequent)
         None: Word not found in BNC
     """
-    return FindFreq().bucket(input_text)
+    return FindFreq().bucket(input_text, fallback=fallback)
 
 
+@consistent
 def words(bucket: int) -> tuple:
     """Get all words in a frequency bucket.
 
@@ -65,6 +134,7 @@ def words(bucket: int) -> tuple:
     return FindWords().by_bucket(bucket)
 
 
+@consistent
 def sample(bucket: int, n: int = 10) -> list:
     """Get random sample of words from a bucket.
 
@@ -81,19 +151,23 @@ def sample(bucket: int, n: int = 10) -> list:
     return FindWords().sample(bucket, n)
 
 
-def relative_frequency(word: str) -> float | None:
+@consistent
+def relative_frequency(word: str, fallback: str = 'plural') -> float | None:
     """Relative frequency of word in BNC (raw_count / corpus_size).
 
     Args:
         word: The word to look up.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
 
     Returns:
         Float in range (0, 1), or None if word not in BNC.
     """
-    return FindRF().relative_frequency(word)
+    return FindRF().relative_frequency(word, fallback=fallback)
 
 
-def expected_count(word: str, text_length: int, rounded: bool = False) -> float | int | None:
+@consistent
+def expected_count(word: str, text_length: int, rounded: bool = False,
+                   fallback: str = 'plural') -> float | int | None:
     """Expected number of occurrences of a word in a text of given length.
 
     Based on the word's observed relative frequency in the BNC
@@ -103,8 +177,354 @@ def expected_count(word: str, text_length: int, rounded: bool = False) -> float
         word: The word to look up.
         text_length: Length of the target text in tokens.
         rounded: If True, return a rounded integer.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
 
     Returns:
         Expected count as a float (or int if rounded), or None if word not in BNC.
     """
-    return FindRF().expected_count(word, text_length, rounded=rounded)
+    return FindRF().expected_count(word, text_length, rounded=rounded, fallback=fallback)
+
+
+@consistent
+def zipf(word: str, fallback: str = 'plural') -> float | None:
+    """Zipf score of a word: log10 of its frequency per billion tokens.
+
+    Read from a one-byte code, so the score is within 1/64 of
+    log10(relative_frequency(word)) + 9.
+
+    Args:
+        word: The word to look up.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        Score from 1.0 (seen once in the BNC) to 7.78 ("the"), or None if
+        word not in BNC.
+    """
+    return FindScores(fallback=fallback).zipf(word)
+
+
+@consistent
+def percentile(word: str, fallback: str = 'plural') -> float | None:
+    """Frequency percentile of a word among the BNC word forms.
+
+    Read from a one-byte code, so the percentile is within 0.2 of the
+    exact value.
+
+    Args:
+        word: The word to look up.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        Percentile 0-100 (100=most frequent), or None if word not in BNC.
+    """
+    return FindScores(fallback=fallback).percentile(word)
+
+
+@consistent
+def word_id(word: str, fallback: str = 'plural') -> int | None:
+    """Dense, stable integer ID of a BNC word form.
+
+    IDs run from 0 to 669,415 in frequency bucket order (alphabetical
+    within a bucket), e.g. to index an embedding matrix. Inflections
+    resolve to their base form's ID as in exists().
+
+    Args:
+        word: The word to look up.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        ID, or None if word not in BNC.
+    """
+    return FindWordIds().word_id(word, fallback=fallback)
+
+
+@consistent_tokens
+def word_ids(words, fallback: str = 'plural'):
+    """IDs of many words (see word_id()).
+
+    Args:
+        words: Iterable of words.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        array('i') aligned with words, with -1 for words not in BNC.
+    """
+    return FindWordIds().word_ids(words, fallback=fallback)
+
+
+@consistent
+def word_from_id(word_id: int) -> str:
+    """BNC word form with a given ID (the inverse of word_id()).
+
+    Args:
+        word_id: ID in 0..669,415.
+
+    Returns:
+        The word form.
+
+    Raises:
+        ValueError: If word_id is out of range.
+    """
+    return FindWordIds().word_from_id(word_id)
+
+
+@consistent
+def prefix(prefix: str, k: int | None = 10) -> list:
+    """Find BNC words starting with a prefix, most frequent first.
+
+    Args:
+        prefix: The prefix to match (e.g., 'inter').
+        k: Maximum number of results (default 10), or None for all.
+
+    Returns:
+        List of matching words ordered by frequency.
+    """
+    return FindPattern().prefix(prefix, k)
+
+
+@consistent
+def suffix(suffix: str, k: int | None = 10) -> list:
+    """Find BNC words ending with a suffix, most frequent first.
+
+    Args:
+        suffix: The suffix to match (e.g., 'ness').
+        k: Maximum number of results (default 10), or None for all.
+
+    Returns:
+        List of matching words ordered by frequency.
+    """
+    return FindPattern().suffix(suffix, k)
+
+
+@consistent
+def glob(pattern: str, k: int | None = 10) -> list:
+    """Find BNC words matching a glob pattern, most frequent first.
+
+    Args:
+        pattern: Shell-style pattern with '*', '?' and '[...]' (e.g., 'colo*r').
+        k: Maximum number of results (default 10), or None for all.
+
+    Returns:
+        List of matching words ordered by frequency.
+    """
+    return FindPattern().glob(pattern, k)
+
+
+@consistent
+def suggest(word: str, max_distance: int = 2, k: int = 5) -> list:
+    """Suggest likely intended words for a misspelled word.
+
+    Candidates are ranked by edit distance, then by BNC frequency. The
+    symmetric-delete index is built on first use (several seconds) and
+    cached on disk; see FindSuggestions for a bounded-memory variant.
+
+    Args:
+        word: The word to correct.
+        max_distance: Largest edit distance to consider (0-2, default 2).
+        k: Maximum number of suggestions (default 5).
+
+    Returns:
+        List of up to k words, closest and most frequent first.
+    """
+    return FindSuggestions().suggest(word, max_distance=max_distance, k=k)
+
+
+@consistent
+def segment(text: str) -> list:
+    """Split run-together text into its most probable sequence of words.
+
+    Uses a Viterbi search over split points, scoring each word by
+    -log(relative_frequency).
+
+    Args:
+        text: Run-together text (e.g., 'thequickbrownfox').
+
+    Returns:
+        List of normalized words (e.g., ['the', 'quick', 'brown', 'fox']).
+    """
+    return FindSegments().segment(text)
+
+
+@consistent
+def english_likeness(text: str, threshold: float = 0.8, confidence: float = 0.95) -> dict:
+    """Decide whether a text is English from a random sample of its tokens.
+
+    Tokens are looked up in random order until a sequential probability
+    ratio test can tell, with the given confidence, whether the share of
+    BNC words is above the threshold; long documents usually need a few
+    dozen lookups.
+
+    Args:
+        text: Document text.
+        threshold: In-vocabulary rate above which a text counts as English.
+        confidence: Probability of a correct decision (0.5-1).
+
+    Returns:
+        Dict with 'english' (bool), 'rate', 'sampled', 'tokens' and 'decided'.
+
+    Raises:
+        ValueError: If threshold or confidence is out of range.
+    """
+    return FindEnglish(threshold=threshold, confidence=confidence).likeness(text)
+
+
+@consistent_tokens
+def exists_batch(words, fallback: str = 'plural') -> list:
+    """Check many words at once; each distinct word is looked up once.
+
+    Args:
+        words: Iterable of words.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        List of booleans aligned with words.
+    """
+    return FindBatch(fallback=fallback).exists(words)
+
+
+@consistent_tokens
+def bucket_batch(words, fallback: str = 'plural') -> list:
+    """Get frequency buckets for many words at once.
+
+    Args:
+        words: Iterable of words.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        List aligned with words: bucket number (1-100) or None.
+    """
+    return FindBatch(fallback=fallback).bucket(words)
+
+
+@consistent_tokens
+def relative_frequency_batch(words, fallback: str = 'plural') -> list:
+    """Get relative frequencies for many words at once.
+
+    Args:
+        words: Iterable of words.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        List aligned with words: relative frequency or None.
+    """
+    return FindBatch(fallback=fallback).relative_frequency(words)
+
+
+@consistent_tokens
+def zipf_codes(words, fallback: str = 'plural') -> bytes:
+    """Get Zipf codes for many words at once; each distinct word is looked up once.
+
+    Args:
+        words: Iterable of words.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        One byte per word: 0 if not found, else code c for the score
+        (c + 31) / 32 (see find_scores.ZIPF_VALUES).
+    """
+    return FindScores(fallback=fallback).zipf_codes(words)
+
+
+@consistent_tokens
+def percentile_codes(words, fallback: str = 'plural') -> bytes:
+    """Get percentile codes for many words at once; each distinct word is looked up once.
+
+    Args:
+        words: Iterable of words.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        One byte per word: 0 if not found, else code c for the percentile
+        (c - 1) * 100 / 254 (see find_scores.PERCENTILE_VALUES).
+    """
+    return FindScores(fallback=fallback).percentile_codes(words)
+
+
+@consistent
+def exists_bytes(token: bytes, fallback: str = 'plural') -> bool:
+    """Check if a UTF-8 encoded word exists in BNC, without decoding it.
+
+    Args:
+        token: UTF-8 encoded word.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        True if word exists in BNC.
+    """
+    return FindBytes(fallback=fallback).exists(token)
+
+
+@consistent
+def bucket_bytes(token: bytes, fallback: str = 'plural') -> int | None:
+    """Get the frequency bucket of a UTF-8 encoded word, without decoding it.
+
+    Args:
+        token: UTF-8 encoded word.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        Bucket number (1-100), or None if word not in BNC.
+    """
+    return FindBytes(fallback=fallback).bucket(token)
+
+
+@consistent
+def relative_frequency_bytes(token: bytes, fallback: str = 'plural') -> float | None:
+    """Get the relative frequency of a UTF-8 encoded word, without decoding it.
+
+    Args:
+        token: UTF-8 encoded word.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        Relative frequency, or None if word not in BNC.
+    """
+    return FindBytes(fallback=fallback).relative_frequency(token)
+
+
+@consistent
+def exists_buffer(buffer, offsets=None, fallback: str = 'plural') -> list:
+    """Check every token of a UTF-8 buffer; each distinct token is looked up once.
+
+    Args:
+        buffer: bytes, bytearray, mmap or memoryview.
+        offsets: n + 1 offsets, token i being buffer[offsets[i]:offsets[i + 1]],
+            or None (default) for the tokens separated by ASCII whitespace.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        List of booleans, one per token.
+    """
+    return FindBytes(fallback=fallback).exists_buffer(buffer, offsets)
+
+
+@consistent
+def bucket_buffer(buffer, offsets=None, fallback: str = 'plural') -> list:
+    """Get the frequency bucket of every token of a UTF-8 buffer.
+
+    Args:
+        buffer: bytes, bytearray, mmap or memoryview.
+        offsets: n + 1 offsets, token i being buffer[offsets[i]:offsets[i + 1]],
+            or None (default) for the tokens separated by ASCII whitespace.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        List with one bucket number (1-100) or None per token.
+    """
+    return FindBytes(fallback=fallback).bucket_buffer(buffer, offsets)
+
+
+@consistent
+def relative_frequency_buffer(buffer, offsets=None, fallback: str = 'plural') -> list:
+    """Get the relative frequency of every token of a UTF-8 buffer.
+
+    Args:
+        buffer: bytes, bytearray, mmap or memoryview.
+        offsets: n + 1 offsets, token i being buffer[offsets[i]:offsets[i + 1]],
+            or None (default) for the tokens separated by ASCII whitespace.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        List with one relative frequency or None per token.
+    """
+    return FindBytes(fallback=fallback).relative_frequency_buffer(buffer, offsets)
@@ -0,0 +1,255 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Asyncio API that keeps shard imports and large batches off the event loop.
+
+The first lookup that touches a shard imports its module, which takes a
+few milliseconds; the morphological index may take seconds to build on
+first use. Called from a coroutine, the synchronous API would stall every
+other task on the event loop for that long.
+
+The coroutines in this module first work out which shards a lookup needs
+(the word itself plus its plural and contraction fallback forms). Shards
+that are not loaded yet are imported in a dedicated thread pool, and the
+coroutine awaits the result. Concurrent requests for the same cold shard
+share one load. Once every shard is warm the lookup itself runs inline,
+since it is a hash and a dict probe, through the module-level functions
+of bnc_lookup (or FindBatch for batches), so like them it answers from a
+single lexicon version (see lexicon.py). Batches longer than INLINE_BATCH
+tokens are run entirely in the thread pool.
+
+Usage:
+    from bnc_lookup import aio
+
+    async def handler(request):
+        return await aio.bucket(request.query['word'])
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import bnc_lookup as bnc
+from bnc_lookup import find_bnc, find_freq, find_lemma, find_rf
+from bnc_lookup.find_batch import FindBatch
+from bnc_lookup.find_bnc import _check_fallback, _split_contraction
+from bnc_lookup.normalize import normalize
+
+# Batches longer than this run in the thread pool rather than on the event loop
+INLINE_BATCH = 256
+
+# Threads used for shard loads and large batches
+MAX_WORKERS = 4
+
+# Lookup kind -> (module owning the shard cache, name of its loader function)
+_TABLES = {
+    'exists': (find_bnc, '_get_hash_set'),
+    'bucket': (find_freq, '_get_bucket_dict'),
+    'rf': (find_rf, '_get_rf_dict'),
+}
+
+_executor = None
+
+_executor_lock = threading.Lock()
+
+# (kind, prefix) -> concurrent.futures.Future of a load in progress
+_loads = {}
+
+_loads_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Create the shared thread pool on first use.
+
+    Returns:
+        The module's ThreadPoolExecutor.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='bnc-lookup')
+        return _executor
+
+
+def _prefixes(tokens) -> set:
+    """Collect the shard prefixes a lookup of each token can touch.
+
+    Args:
+        tokens: Iterable of raw tokens.
+
+    Returns:
+        Set of two-character hex prefixes.
+    """
+    prefixes = set()
+    for token in tokens:
+        word = normalize(token)
+        forms = [word]
+        if len(word) > 3 and word.endswith('s'):
+            forms.append(word[:-1])
+        parts = _split_contraction(word)
+        if parts:
+            forms.extend(parts)
+        for form in forms:
+            if form:
+                prefixes.add(find_bnc._calculate_md5(form)[:2])
+    return prefixes
+
+
+def _start_load(key: tuple, load):
+    """Start a load in the thread pool, or join the one already running.
+
+    Args:
+        key: Identifies what is loaded, e.g. ('bucket', '5d').
+        load: Zero-argument function performing the load.
+
+    Returns:
+        concurrent.futures.Future of the load.
+    """
+    with _loads_lock:
+        future = _loads.get(key)
+        if future is None:
+            future = _loads[key] = _get_executor().submit(load)
+            future.add_done_callback(lambda _: _loads.pop(key, None))
+        return future
+
+
+async def _warm(kind: str, tokens, fallback: str) -> None:
+    """Load every cold shard (and index) that looking up tokens can touch.
+
+    Args:
+        kind: Lookup kind: 'exists', 'bucket' or 'rf'.
+        tokens: Tokens about to be looked up.
+        fallback: Inflection fallback mode of the lookup.
+    """
+    module, loader = _TABLES[kind]
+    futures = [
+        _start_load((kind, prefix), lambda prefix=prefix: getattr(module, loader)(prefix))
+        for prefix in _prefixes(tokens)
+        if prefix not in module._cache
+    ]
+    if fallback == 'morph' and 'index' not in find_lemma._cache:
+        futures.append(_start_load(('lemma',), find_lemma._get_index))
+    if futures:
+        await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+
+
+async def _run_batch(kind: str, tokens, fallback: str, method: str) -> list:
+    """Run a FindBatch method inline once warm, or in the pool if large.
+
+    Args:
+        kind: Lookup kind used to find the shards to warm.
+        tokens: Iterable of tokens.
+        fallback: Inflection fallback mode.
+        method: FindBatch method name.
+
+    Returns:
+        List of results aligned with tokens.
+    """
+    _check_fallback(fallback)
+    tokens = list(tokens)
+    lookup = getattr(FindBatch(fallback=fallback), method)
+    if len(tokens) > INLINE_BATCH:
+        return await asyncio.get_running_loop().run_in_executor(_get_executor(), lookup, tokens)
+    await _warm(kind, tokens, fallback)
+    return lookup(tokens)
+
+
+async def exists(input_text: str, fallback: str = 'plural') -> bool:
+    """Check if a word exists in the BNC without blocking the event loop.
+
+    Args:
+        input_text: The word to check.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        True if the word exists in the BNC.
+    """
+    _check_fallback(fallback)
+    await _warm('exists', (input_text,), fallback)
+    return bnc.exists(input_text, fallback=fallback)
+
+
+async def bucket(input_text: str, fallback: str = 'plural') -> int | None:
+    """Get the frequency bucket of a word without blocking the event loop.
+
+    Args:
+        input_text: The word to look up.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        Bucket number 1-100, or None if not found.
+    """
+    _check_fallback(fallback)
+    await _warm('bucket', (input_text,), fallback)
+    return bnc.bucket(input_text, fallback=fallback)
+
+
+async def relative_frequency(word: str, fallback: str = 'plural') -> float | None:
+    """Get the relative frequency of a word without blocking the event loop.
+
+    Args:
+        word: The word to look up.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        Relative frequency, or None if not found.
+    """
+    _check_fallback(fallback)
+    await _warm('rf', (word,), fallback)
+    return bnc.relative_frequency(word, fallback=fallback)
+
+
+async def expected_count(word: str, text_length: int, rounded: bool = False,
+                         fallback: str = 'plural') -> float | int | None:
+    """Get the expected count of a word without blocking the event loop.
+
+    Args:
+        word: The word to look up.
+        text_length: Number of tokens in the text.
+        rounded: If True, return a rounded integer.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        Expected count, or None if the word is not found.
+    """
+    _check_fallback(fallback)
+    await _warm('rf', (word,), fallback)
+    return bnc.expected_count(word, text_length, rounded=rounded, fallback=fallback)
+
+
+async def exists_batch(words, fallback: str = 'plural') -> list:
+    """Check many words without blocking the event loop.
+
+    Args:
+        words: Iterable of words.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        List of booleans aligned with words.
+    """
+    return await _run_batch('exists', words, fallback, 'exists')
+
+
+async def bucket_batch(words, fallback: str = 'plural') -> list:
+    """Get frequency buckets for many words without blocking the event loop.
+
+    Args:
+        words: Iterable of words.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        List aligned with words: bucket number (1-100) or None.
+    """
+    return await _run_batch('bucket', words, fallback, 'bucket')
+
+
+async def relative_frequency_batch(words, fallback: str = 'plural') -> list:
+    """Get relative frequencies for many words without blocking the event loop.
+
+    Args:
+        words: Iterable of words.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+
+    Returns:
+        List aligned with words: relative frequency or None.
+    """
+    return await _run_batch('rf', words, fallback, 'relative_frequency')
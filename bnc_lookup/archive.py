@@ -0,0 +1,319 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Single-file archive of the data tables.
+
+The tables normally ship as 869 generated modules (plus their .pyc files).
+On network file systems and during container layer extraction the per-file
+stat/open cost dominates, both at install time and on every cold shard
+import. A table archive holds every table in one file:
+
+    header   magic, format version, bytecode magic number of the
+             interpreter that wrote it, index length
+    index    marshal'd dict: table name -> (offset, length)
+    data     one marshal'd value per table (frozenset, dict or tuple)
+
+The archive is opened once and memory-mapped; loading a shard is a slice
+of the mapping and a marshal.loads(), with no path lookups, no module
+objects and no bytecode. zipimport was not used: it cannot cache
+bytecode, so every cold import from a zip would recompile a large source
+file.
+
+An archive is used only when BNC_LOOKUP_ARCHIVE names one (or
+use_archive() is called). It is a snapshot of the tables it was written
+from and is not updated when the package is upgraded, so it is never
+picked up implicitly; write it again after every upgrade. Tables missing
+from the archive are imported from their modules as usual, except from
+an exclusive archive (a lexicon version, see lexicon.py), which must not
+be mixed with the installed tables.
+
+Besides the shards, an archive holds the small version-wide tables
+(bucket bounds, contraction tables, score codes and bucket sizes), so one
+file is a complete version of the data.
+
+The marshal format can change between Python versions, so an archive is
+written by the interpreter that will read it (e.g., at install time), and
+an archive written by another Python version is rejected:
+
+    bnc-build --archive /data/tables.bnca
+    BNC_LOOKUP_ARCHIVE=/data/tables.bnca python app.py
+"""
+
+import hashlib
+import importlib
+import importlib.util
+import marshal
+import mmap
+import os
+import struct
+
+# Default file name of an archive
+ARCHIVE_NAME = 'tables.bnca'
+
+# Bump when the archive layout changes
+ARCHIVE_VERSION = 2
+
+_MAGIC = b'BNCARC'
+
+# Magic, format version, bytecode magic number (changes with the marshal format), index length
+_HEADER = struct.Struct('<6sB4sQ')
+
+# Generated modules holding version-wide tables that are not sharded. Their
+# attribute names are not unique ('total'), so they are archived as
+# '<module>.<name>' (see table_key())
+SINGLE_MODULES = (
+    ('bnc_lookup.freq.bounds', ('max_counts', 'total')),
+    ('bnc_lookup.freq.contractions', ('buckets', 'suffix_buckets')),
+    ('bnc_lookup.rf.contractions', ('frequencies', 'suffix_frequencies')),
+    ('bnc_lookup.rf.scores', ('zipf_codes', 'percentile_codes')),
+    ('bnc_lookup.bw.sizes', ('sizes',)),
+)
+
+_SINGLE_NAMES = frozenset(module_name for module_name, _ in SINGLE_MODULES)
+
+
+class TableArchive:
+    """Read-only, memory-mapped table archive.
+
+    Reads are slices of the mapping, so any number of threads can read
+    concurrently.
+    """
+
+    def __init__(self, path: str, exclusive: bool = False):
+        """Open an archive and read its index.
+
+        Args:
+            path: Path of an archive written by write_archive().
+            exclusive: If True, tables missing from the archive are not
+                imported from the installed modules (see import_table()).
+
+        Raises:
+            OSError: If the file cannot be opened or mapped.
+            ValueError: If the file is not a table archive of this version,
+                or was written by another Python version.
+        """
+        self.path = path
+        self.exclusive = exclusive
+        with open(path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f'not a table archive: {path}')
+            magic, version, python_magic, index_length = _HEADER.unpack(header)
+            if magic != _MAGIC or version != ARCHIVE_VERSION:
+                raise ValueError(f'not a version {ARCHIVE_VERSION} table archive: {path}')
+            if python_magic != importlib.util.MAGIC_NUMBER:
+                raise ValueError(f'{path} was written by another Python version; '
+                                 f'write it again with bnc-build --archive')
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data_start = _HEADER.size + index_length
+        self._index = marshal.loads(self._map[_HEADER.size:data_start])
+        self._data_start = data_start
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def read(self, name: str):
+        """Load one table.
+
+        Args:
+            name: Table name (e.g., 'hashes_5d' or 'blocks_07').
+
+        Returns:
+            The table value.
+
+        Raises:
+            KeyError: If the archive has no such table.
+        """
+        offset, length = self._index[name]
+        start = self._data_start + offset
+        return marshal.loads(self._map[start:start + length])
+
+    def digest(self) -> str:
+        """MD5 hex digest of the whole archive file, identifying its data version."""
+        return hashlib.md5(self._map).hexdigest()
+
+    def close(self) -> None:
+        """Unmap the archive."""
+        self._map.close()
+
+
+def table_key(module_name: str, name: str) -> str:
+    """Archive key of a table.
+
+    Args:
+        module_name: Dotted name of the generated module defining it.
+        name: Attribute name of the table.
+
+    Returns:
+        The attribute name for shard tables, which is unique
+        ('hashes_5d'); '<module>.<name>' for the tables of SINGLE_MODULES.
+    """
+    return f'{module_name}.{name}' if module_name in _SINGLE_NAMES else name
+
+
+def read_tables(source: TableArchive | None, module_name: str, names) -> list:
+    """Read tables from an archive, or import them from their module.
+
+    Args:
+        source: Archive to read, or None for the installed modules.
+        module_name: Dotted name of the generated module defining them.
+        names: Attribute names of the tables.
+
+    Returns:
+        List of table values.
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed, or source is
+            exclusive and lacks one of the tables.
+    """
+    if source is not None:
+        keys = [table_key(module_name, name) for name in names]
+        if all(key in source for key in keys):
+            return [source.read(key) for key in keys]
+        if source.exclusive:
+            raise ModuleNotFoundError(f'{module_name} is not in {source.path}', name=module_name)
+    module = importlib.import_module(module_name)
+    return [getattr(module, name) for name in names]
+
+
+def table_modules():
+    """Every sharded data module and the tables it defines.
+
+    Yields:
+        Tuples of (module name, table names).
+    """
+    for package, module, kind in (('hs', 'h', 'hashes'), ('freq', 'f', 'buckets'), ('rf', 'rf', 'frequencies')):
+        for i in range(256):
+            yield f'bnc_lookup.{package}.{module}_{i:02x}', (f'{kind}_{i:02x}',)
+    for bucket in range(1, 101):
+        yield f'bnc_lookup.bw.bw_{bucket:02d}', (f'count_{bucket:02d}', f'heads_{bucket:02d}', f'blocks_{bucket:02d}')
+
+
+def _load_module(module_name: str, directory: str | None):
+    """Load a generated module, from the package or from a bnc-build output directory.
+
+    Args:
+        module_name: Dotted module name (e.g., 'bnc_lookup.hs.h_5d').
+        directory: Directory written by bnc-build --output, or None for
+            the installed package.
+
+    Returns:
+        The module.
+    """
+    if directory is None:
+        return importlib.import_module(module_name)
+    path = os.path.join(directory, *module_name.split('.')[1:]) + '.py'
+    spec = importlib.util.spec_from_file_location(f'_bnc_archive_{module_name}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _module_tables(directory: str | None = None):
+    """Read every table from its generated module.
+
+    Args:
+        directory: Directory written by bnc-build --output, or None for
+            the installed package.
+
+    Yields:
+        Tuples of (archive key, value).
+    """
+    for module_name, names in table_modules():
+        module = _load_module(module_name, directory)
+        for name in names:
+            yield name, getattr(module, name)
+    for module_name, names in SINGLE_MODULES:
+        module = _load_module(module_name, directory)
+        for name in names:
+            yield table_key(module_name, name), getattr(module, name)
+
+
+def write_archive(path: str, tables=None, directory: str | None = None) -> int:
+    """Write a table archive.
+
+    The file is written next to its destination and renamed into place,
+    so readers never see a partial archive.
+
+    Args:
+        path: Destination path.
+        tables: Iterable of (archive key, value); defaults to every table
+            of the generated modules.
+        directory: Read the generated modules from this bnc-build output
+            directory instead of the installed package.
+
+    Returns:
+        Number of tables written.
+    """
+    if tables is None:
+        tables = _module_tables(directory)
+    index, blobs, offset = {}, [], 0
+    for name, value in tables:
+        blob = marshal.dumps(value)
+        index[name] = (offset, len(blob))
+        blobs.append(blob)
+        offset += len(blob)
+    index_blob = marshal.dumps(index)
+
+    tmp = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, ARCHIVE_VERSION, importlib.util.MAGIC_NUMBER, len(index_blob)))
+            f.write(index_blob)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return len(index)
+
+
+def archive_path() -> str | None:
+    """Resolve the archive to use.
+
+    Returns:
+        BNC_LOOKUP_ARCHIVE if set and non-empty, else None.
+    """
+    return os.environ.get('BNC_LOOKUP_ARCHIVE') or None
+
+
+def use_archive(path: str | None) -> TableArchive | None:
+    """Switch loading of the installed tables to an archive, or back to the modules.
+
+    Shards already loaded stay cached; only later loads are affected.
+    While another lexicon version is active (see lexicon.py), the switch
+    takes effect when the installed tables, Lexicon(), are installed again.
+    The previous archive of the installed tables is closed, so a Lexicon()
+    opened before the switch must not be installed after it.
+
+    Args:
+        path: Archive path, or None to import the modules.
+
+    Returns:
+        The opened archive, or None.
+
+    Raises:
+        OSError: If the archive cannot be opened.
+        ValueError: If the file is not a table archive.
+    """
+    global active, installed
+    previous = installed
+    installed = TableArchive(path) if path else None
+    if active is None or not active.exclusive:
+        active = installed
+    if previous is not None:
+        previous.close()
+    return installed
+
+
+# Archive used by shard_loader.import_table(), or None
+active = None
+
+# Archive holding the installed tables, or None for their modules
+installed = None
+
+if archive_path():
+    use_archive(archive_path())
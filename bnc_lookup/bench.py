@@ -0,0 +1,433 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Benchmark suite for tracking lookup performance across releases.
+
+Measures, separately:
+    import      Time to import bnc_lookup in a fresh interpreter
+    cold_load   Time to import each table package (hs, freq, rf, bw) and
+                to load one of its shards
+    warm        Per-call latency of exists/bucket/relative_frequency for
+                hits and misses once every shard is loaded
+    fallback    Per-call latency of words resolved through the plural and
+                contraction fallbacks
+    batch       FindBatch throughput on a Zipf-distributed token stream
+    english     Documents per second of english_likeness() against a full
+                FindBatch scan of every token, on synthetic documents with
+                a range of in-vocabulary rates
+    archive     The per-file table layout against a single table archive
+                (see archive.py): first lookup in a fresh interpreter,
+                cold shard loads, and copying the tables as a stand-in
+                for install and layer extraction cost
+    memory      Peak resident set size of the benchmark process and the
+                deep size of each loaded table (see memory.py)
+
+Results are written as one JSON document (to stdout or --output), with the
+package version, Python version and platform, so runs can be compared
+across releases and storage backends.
+
+Latencies are the median over `repeat` timing runs, each averaging many
+calls, and are reported in nanoseconds per call.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from importlib import metadata
+
+import bnc_lookup as bnc
+from bnc_lookup import archive, find_bnc, find_freq, find_rf, find_words
+from bnc_lookup.find_batch import FindBatch
+from bnc_lookup.find_english import FindEnglish
+from bnc_lookup.memory import memory_report
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+_HEX_KEYS = tuple(f'{i:02x}' for i in range(256))
+
+# Table name -> (module owning the cache, cache attribute, loader, shard keys, shard module name)
+_TABLES = {
+    'hs': (find_bnc, '_cache', find_bnc._get_hash_set, _HEX_KEYS, 'bnc_lookup.hs.h_{}'),
+    'freq': (find_freq, '_cache', find_freq._get_bucket_dict, _HEX_KEYS, 'bnc_lookup.freq.f_{}'),
+    'rf': (find_rf, '_cache', find_rf._get_rf_dict, _HEX_KEYS, 'bnc_lookup.rf.rf_{}'),
+    'bw': (find_words, '_block_cache', find_words._get_bucket_blocks, tuple(range(1, 101)), 'bnc_lookup.bw.bw_{:02d}'),
+}
+
+CONTRACTIONS = ("don't", "can't", "won't", "we'll", "they're", "i've", "i'm", "he'd", "it's", "that's")
+
+
+def _version() -> str:
+    """Installed package version, or 'unknown' when running from a checkout."""
+    try:
+        return metadata.version('bnc-lookup')
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+def _per_call_ns(func, words: list, repeat: int) -> float | None:
+    """Median per-call latency of func over a word list.
+
+    Args:
+        func: Single-word lookup function.
+        words: Words to look up in each timing run.
+        repeat: Number of timing runs.
+
+    Returns:
+        Median nanoseconds per call, or None for an empty word list.
+    """
+    if not words:
+        return None
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for word in words:
+            func(word)
+        runs.append((time.perf_counter_ns() - start) / len(words))
+    return round(statistics.median(runs), 1)
+
+
+def bench_import(repeat: int) -> dict:
+    """Time `import bnc_lookup` in fresh interpreters.
+
+    Args:
+        repeat: Number of interpreters to start.
+
+    Returns:
+        Dict with the median and minimum import time in milliseconds.
+    """
+    code = 'import time; t = time.perf_counter(); import bnc_lookup; print(time.perf_counter() - t)'
+    times = [float(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                  check=True).stdout) * 1000 for _ in range(repeat)]
+    return {'median_ms': round(statistics.median(times), 3), 'min_ms': round(min(times), 3)}
+
+
+def bench_cold_load(shards: int) -> dict:
+    """Time loading shards that are not yet imported, per table.
+
+    The table package and its shards are first dropped from sys.modules and
+    from the cache, and the package import is timed on its own. Each shard
+    is then dropped again before its load is timed, so every load includes
+    the module import.
+
+    Args:
+        shards: Number of shards timed per table.
+
+    Returns:
+        Dict of table -> {package_ms, shards, median_ms, max_ms}.
+    """
+    results = {}
+    for table, (module, cache_name, loader, keys, module_name) in _TABLES.items():
+        package = module_name.rsplit('.', 1)[0]
+        for name in [m for m in sys.modules if m == package or m.startswith(package + '.')]:
+            del sys.modules[name]
+        getattr(module, cache_name).clear()
+        start = time.perf_counter()
+        importlib.import_module(package)
+        package_ms = (time.perf_counter() - start) * 1000
+
+        times = []
+        for key in keys[::max(1, len(keys) // shards)][:shards]:
+            getattr(module, cache_name).pop(key, None)
+            sys.modules.pop(module_name.format(key), None)
+            start = time.perf_counter()
+            loader(key)
+            times.append((time.perf_counter() - start) * 1000)
+        results[table] = {'package_ms': round(package_ms, 3), 'shards': len(times),
+                          'median_ms': round(statistics.median(times), 3), 'max_ms': round(max(times), 3)}
+    return results
+
+
+def _sample_words(n: int, seed: int) -> list:
+    """Deterministic sample of BNC words spread over all buckets.
+
+    Args:
+        n: Number of words.
+        seed: Random seed.
+
+    Returns:
+        List of words.
+    """
+    rng = random.Random(seed)
+    words = [w for b in range(1, 101) for w in find_words._get_bucket_words(b)[::97]]
+    return rng.sample(words, min(n, len(words)))
+
+
+def _preload() -> None:
+    """Load every shard used by the single-word lookups."""
+    for i in range(256):
+        prefix = f'{i:02x}'
+        find_bnc._get_hash_set(prefix)
+        find_freq._get_bucket_dict(prefix)
+        find_rf._get_rf_dict(prefix)
+
+
+def bench_warm(words: list, repeat: int, seed: int) -> dict:
+    """Per-call latency of the lookups for hits and misses with warm shards.
+
+    Args:
+        words: BNC words (hits).
+        repeat: Timing runs per measurement.
+        seed: Random seed for the generated misses.
+
+    Returns:
+        Dict of function -> {hit_ns, miss_ns}.
+    """
+    _preload()
+    rng = random.Random(seed)
+    misses = [f'xq{rng.randrange(10**9)}z' for _ in words]
+    results = {}
+    for name, func in (('exists', bnc.exists), ('bucket', bnc.bucket),
+                       ('relative_frequency', bnc.relative_frequency)):
+        results[name] = {'hit_ns': _per_call_ns(func, words, repeat), 'miss_ns': _per_call_ns(func, misses, repeat)}
+    return results
+
+
+def bench_fallback(words: list, repeat: int) -> dict:
+    """Per-call latency of words that resolve only through a fallback.
+
+    Args:
+        words: BNC words used to derive plural forms.
+        repeat: Timing runs per measurement.
+
+    Returns:
+        Dict of fallback -> {words, exists_ns, bucket_ns, relative_frequency_ns}.
+    """
+    plurals = [w + 's' for w in words if w.isalpha() and len(w) >= 3 and not find_bnc._hash_exists(w + 's')]
+    results = {}
+    for name, forms in (('plural', plurals), ('contraction', list(CONTRACTIONS))):
+        results[name] = {'words': len(forms)}
+        for func_name, func in (('exists', bnc.exists), ('bucket', bnc.bucket),
+                                ('relative_frequency', bnc.relative_frequency)):
+            results[name][f'{func_name}_ns'] = _per_call_ns(func, forms, repeat)
+    return results
+
+
+def bench_batch(words: list, tokens: int, seed: int) -> dict:
+    """FindBatch throughput on a Zipf-distributed token stream.
+
+    Args:
+        words: Vocabulary to draw tokens from.
+        tokens: Stream length.
+        seed: Random seed.
+
+    Returns:
+        Dict of method -> tokens per second.
+    """
+    rng = random.Random(seed)
+    stream = rng.choices(words, weights=[1 / (i + 1) for i in range(len(words))], k=tokens)
+    results = {'tokens': tokens, 'distinct': len(set(stream))}
+    for method in ('exists', 'bucket', 'relative_frequency'):
+        lookup = getattr(FindBatch(), method)
+        start = time.perf_counter()
+        lookup(stream)
+        results[f'{method}_tokens_per_s'] = round(tokens / (time.perf_counter() - start))
+    return results
+
+
+def bench_english(words: list, docs: int, tokens: int, seed: int) -> dict:
+    """english_likeness() against a full scan on synthetic documents.
+
+    Each document draws Zipf-distributed BNC words and replaces a share of
+    them with non-words, for in-vocabulary rates on both sides of the
+    default threshold.
+
+    Args:
+        words: Vocabulary to draw tokens from.
+        docs: Documents per rate.
+        tokens: Tokens per document.
+        seed: Random seed.
+
+    Returns:
+        Dict with 'docs', 'tokens', full-scan and sampled documents per
+        second, the mean number of tokens sampled, and the share of
+        documents where both methods agree.
+    """
+    rng = random.Random(seed)
+    weights = [1 / (i + 1) for i in range(len(words))]
+    documents = []
+    for rate in (0.3, 0.6, 0.95):
+        for _ in range(docs):
+            stream = rng.choices(words, weights=weights, k=tokens)
+            documents.append(' '.join(w if rng.random() < rate else f'xq{rng.randrange(10**9)}z' for w in stream))
+
+    _preload()
+    english = FindEnglish()
+    batch = FindBatch()
+    start = time.perf_counter()
+    scanned = []
+    for text in documents:
+        found = batch.exists(text.split())
+        scanned.append(sum(found) / len(found) >= english.threshold)
+    scan_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sampled = [english.likeness(text) for text in documents]
+    sample_s = time.perf_counter() - start
+
+    return {'docs': len(documents), 'tokens': tokens,
+            'scan_docs_per_s': round(len(documents) / scan_s, 1),
+            'sampled_docs_per_s': round(len(documents) / sample_s, 1),
+            'mean_sampled': round(statistics.mean(r['sampled'] for r in sampled), 1),
+            'agreement': sum(r['english'] == s for r, s in zip(sampled, scanned)) / len(documents)}
+
+
+def _first_lookup_ms(archive_path: str, repeat: int) -> float:
+    """Median time to import bnc_lookup and look up one word in fresh interpreters.
+
+    Args:
+        archive_path: Archive to use, or '' for the per-file modules.
+        repeat: Number of interpreters to start.
+
+    Returns:
+        Median milliseconds.
+    """
+    code = ('import time; t = time.perf_counter(); import bnc_lookup; '
+            "bnc_lookup.bucket('the'); print(time.perf_counter() - t)")
+    env = dict(os.environ, BNC_LOOKUP_ARCHIVE=archive_path)
+    times = [float(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env,
+                                  check=True).stdout) * 1000 for _ in range(repeat)]
+    return round(statistics.median(times), 3)
+
+
+def _copy_ms(copy) -> float:
+    """Time one copy into a fresh temporary directory, in milliseconds."""
+    with tempfile.TemporaryDirectory() as target:
+        start = time.perf_counter()
+        copy(os.path.join(target, 'copy'))
+        return round((time.perf_counter() - start) * 1000, 3)
+
+
+def bench_archive(shards: int, repeat: int) -> dict:
+    """Compare the per-file table layout with a single table archive.
+
+    An archive of the installed tables is written to a temporary directory.
+    Cold shard loads are timed through shard_loader.import_table() with
+    each layout, dropping the shard module first so every per-file load
+    includes its import. Copying the table packages (with their bytecode
+    caches) against copying the archive approximates install and container
+    layer extraction cost, which is dominated by per-file overhead.
+
+    Args:
+        shards: Number of shards timed per table.
+        repeat: Fresh interpreters started per layout.
+
+    Returns:
+        Dict with 'modules' and 'archive' results (files, bytes, copy_ms,
+        first_lookup_ms, and per-table median cold load in milliseconds)
+        and 'write_ms', the time to write the archive.
+    """
+    from bnc_lookup.shard_loader import import_table
+
+    package_dir = os.path.dirname(os.path.abspath(bnc.__file__))
+    table_dirs = [os.path.join(package_dir, table) for table in _TABLES]
+    files = [os.path.join(root, name) for d in table_dirs for root, _, names in os.walk(d) for name in names]
+    names = dict(archive.table_modules())
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, archive.ARCHIVE_NAME)
+        start = time.perf_counter()
+        archive.write_archive(path)
+        write_ms = round((time.perf_counter() - start) * 1000, 3)
+
+        def copy_tables(target):
+            for d in table_dirs:
+                shutil.copytree(d, os.path.join(target, os.path.basename(d)))
+
+        results = {
+            'write_ms': write_ms,
+            'modules': {'files': len(files), 'bytes': sum(os.path.getsize(f) for f in files),
+                        'copy_ms': _copy_ms(copy_tables), 'first_lookup_ms': _first_lookup_ms('', repeat),
+                        'cold_load_ms': {}},
+            'archive': {'files': 1, 'bytes': os.path.getsize(path),
+                        'copy_ms': _copy_ms(lambda target: shutil.copyfile(path, target)),
+                        'first_lookup_ms': _first_lookup_ms(path, repeat), 'cold_load_ms': {}},
+        }
+
+        previous = archive.active
+        try:
+            for table, (_, _, _, keys, module_name) in _TABLES.items():
+                modules = [module_name.format(key) for key in keys[::max(1, len(keys) // shards)][:shards]]
+                for layout, source in (('modules', None), ('archive', archive.TableArchive(path))):
+                    archive.active = source
+                    times = []
+                    for module in modules:
+                        sys.modules.pop(module, None)
+                        start = time.perf_counter()
+                        import_table(module, *names[module])
+                        times.append((time.perf_counter() - start) * 1000)
+                    results[layout]['cold_load_ms'][table] = round(statistics.median(times), 3)
+                    if source is not None:
+                        source.close()
+        finally:
+            archive.active = previous
+    return results
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MiB, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return round(peak / (1 << 20 if sys.platform == 'darwin' else 1 << 10), 1)
+
+
+def run(quick: bool = False, seed: int = 0) -> dict:
+    """Run the whole suite.
+
+    Args:
+        quick: Use fewer samples and repeats (for smoke runs).
+        seed: Random seed for generated words and streams.
+
+    Returns:
+        JSON-serializable results.
+    """
+    repeat = 3 if quick else 7
+    words = _sample_words(500 if quick else 5000, seed)
+    results = {
+        'version': _version(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'quick': quick,
+        'import': bench_import(2 if quick else 5),
+        'cold_load': bench_cold_load(4 if quick else 32),
+        'warm': bench_warm(words, repeat, seed),
+        'fallback': bench_fallback(words, repeat),
+        'batch': bench_batch(words, 20_000 if quick else 500_000, seed),
+        'english': bench_english(words, 3 if quick else 20, 2_000 if quick else 20_000, seed),
+        'archive': bench_archive(4 if quick else 32, 2 if quick else 5),
+    }
+    tables = memory_report()['tables']
+    results['memory'] = {
+        'peak_rss_mb': peak_rss_mb(),
+        'tables_mb': {name: round(table['bytes'] / (1 << 20), 1) for name, table in tables.items() if table['bytes']},
+    }
+    return results
+
+
+def main():
+    """CLI entry point: bnc-bench [--quick] [--output PATH]."""
+    parser = argparse.ArgumentParser(prog='bnc-bench', description='Benchmark bnc_lookup and print JSON results.')
+    parser.add_argument('--output', metavar='PATH', help='write results to a file instead of stdout')
+    parser.add_argument('--quick', action='store_true', help='fewer samples and repeats')
+    parser.add_argument('--seed', type=int, default=0, help='random seed (default: 0)')
+    args = parser.parse_args()
+
+    report = json.dumps(run(quick=args.quick, seed=args.seed), indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + '\n')
+    else:
+        print(report)
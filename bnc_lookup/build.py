@@ -0,0 +1,536 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Regenerate the data tables from the BNC frequency list.
+
+Reads Adam Kilgarriff's `all.num` (plain or gzipped), or any file in the
+same format, and writes every generated module under bnc_lookup/:
+
+    hs/h_XX.py      frozenset of hash suffixes (existence)
+    freq/f_XX.py    hash suffix -> frequency bucket (1-100)
+    rf/rf_XX.py     hash suffix -> relative frequency
+    bw/bw_XX.py     front-coded word list of each bucket
+    bw/sizes.py     number of words in each bucket
+    freq/bounds.py  corpus size and highest count in each bucket
+    freq/contractions.py, rf/contractions.py
+                    resolved bucket / relative frequency of contraction
+                    forms (see resolve_contractions())
+    rf/scores.py    Zipf and percentile code of every distinct relative
+                    frequency (see find_scores.py)
+    */__init__.py   package modules that import shards on attribute access
+
+Input lines are `count word pos ndocs`, one per word/POS pair. The
+`!!WHOLE_CORPUS` line carries the corpus size used as the relative
+frequency denominator; without it, the sum of the counts is used.
+
+The input is read line by line and aggregated per word form (summing over
+POS tags), so memory grows with the vocabulary rather than the input.
+Forms are normalized first, exactly as lookups normalize their input, so
+forms that normalize alike ('Café', 'cafe') are merged into one word and
+forms that normalize to nothing are dropped. Rows taken from the installed
+tables (--from-tables) keep their stored forms, so the tables are
+reproduced exactly as shipped.
+Words are then ranked once, hashed once, and the three hash tables are
+filled from that single pass. Output is deterministic: shard keys and
+bucket words are sorted, and words with equal counts keep their input
+order when ranked, so the same input always produces the same bytes.
+
+The checked-in tables can be turned back into a frequency list with
+source_from_tables(), which lets them be regenerated (and verified
+byte-for-byte) without the original all.num.
+
+Usage:
+    bnc-build all.num.gz                  # rewrite the tables in place
+    bnc-build all.num.gz --output DIR     # write them elsewhere
+    bnc-build all.num.gz --check          # exit 1 if any file would change
+    bnc-build --from-tables --check       # verify the checked-in tables
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+import sys
+from collections import Counter
+
+from bnc_lookup import front_coding
+from bnc_lookup.find_bnc import CONTRACTION_SUFFIXES, S_CONTRACTION_STEMS, _split_contraction
+from bnc_lookup.find_scores import percentile_code, zipf_code
+from bnc_lookup.normalize import normalize
+
+# Pseudo-word whose count is the total number of tokens in the corpus
+TOTAL_MARKER = '!!WHOLE_CORPUS'
+
+# Number of frequency buckets
+BUCKETS = 100
+
+HEADER = '#!/usr/bin/env python\n# -*- coding: UTF-8 -*-\n# AUTO-GENERATED - DO NOT MODIFY\n\n'
+
+# Package -> (shard module prefix, table attribute prefix)
+PACKAGES = {
+    'hs': ('h', 'hashes'),
+    'freq': ('f', 'buckets'),
+    'rf': ('rf', 'frequencies'),
+}
+
+_PREFIXES = tuple(f'{i:02x}' for i in range(256))
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def read_frequency_list(path: str):
+    """Stream the rows of a frequency list.
+
+    Args:
+        path: Path to the list; a .gz suffix is decompressed on the fly.
+
+    Yields:
+        Tuples of (count, word).
+
+    Raises:
+        ValueError: If a non-blank line has fewer than two fields or a
+            non-integer count.
+    """
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            fields = line.split()
+            if not fields:
+                continue
+            if len(fields) < 2 or not fields[0].isdigit():
+                raise ValueError(f'{path}:{number}: expected "count word pos ndocs", got {line.strip()!r}')
+            yield int(fields[0]), fields[1]
+
+
+def aggregate(rows, stored_forms: bool = False) -> tuple[dict, int]:
+    """Sum counts per normalized word form.
+
+    Args:
+        rows: Iterable of (count, word), e.g. from read_frequency_list().
+        stored_forms: Take the words as given, without normalize(): for
+            rows from source_from_tables(), which reproduce the installed
+            tables byte for byte.
+
+    Returns:
+        Tuple of (word -> count in first-seen order, total tokens); the
+        words are normalized unless stored_forms is set.
+    """
+    counts = {}
+    total = None
+    for count, word in rows:
+        if word == TOTAL_MARKER:
+            total = count
+        elif not word.startswith('!!'):
+            # Lookups normalize their input, so a form stored as is could never be found
+            if not stored_forms:
+                word = normalize(word)
+                if not word:
+                    continue
+            counts[word] = counts.get(word, 0) + count
+    if total is None:
+        total = sum(counts.values())
+    return counts, total
+
+
+def assign_buckets(counts: dict) -> dict:
+    """Rank words by count and split the ranking into equal-size buckets.
+
+    Args:
+        counts: Word -> count; words with equal counts keep this order.
+
+    Returns:
+        Word -> bucket (1 = most frequent, BUCKETS = least frequent).
+    """
+    ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+    bucket_size = len(ranked) / BUCKETS
+    return {word: min(int(idx / bucket_size) + 1, BUCKETS) for idx, (word, _) in enumerate(ranked)}
+
+
+def _quote(text: str) -> str:
+    """Single-quoted Python string literal.
+
+    Args:
+        text: String to quote.
+
+    Returns:
+        The literal, escaping backslashes, single quotes, and non-ASCII or
+        non-printable characters (the latter as ascii() does).
+    """
+    text = text.replace('\\', '\\\\').replace("'", "\\'")
+    if not (text.isascii() and text.isprintable()):
+        text = ''.join(char if char.isascii() and char.isprintable() else ascii(char)[1:-1] for char in text)
+    return "'" + text + "'"
+
+
+def render_hash_shard(prefix: str, suffixes) -> str:
+    """Source of an hs/h_XX.py module.
+
+    Args:
+        prefix: Two-character hex prefix.
+        suffixes: Hash suffixes in the shard.
+
+    Returns:
+        Module source.
+    """
+    lines = ''.join(f'    {_quote(suffix)},\n' for suffix in sorted(suffixes))
+    return f'{HEADER}hashes_{prefix} = frozenset({{\n{lines}}})\n'
+
+
+def render_bucket_shard(prefix: str, buckets: dict) -> str:
+    """Source of a freq/f_XX.py module.
+
+    Args:
+        prefix: Two-character hex prefix.
+        buckets: Hash suffix -> bucket.
+
+    Returns:
+        Module source.
+    """
+    lines = ''.join(f'    {_quote(suffix)}: {buckets[suffix]},\n' for suffix in sorted(buckets))
+    return f'{HEADER}buckets_{prefix} = {{\n{lines}}}\n'
+
+
+def render_rf_shard(prefix: str, frequencies: dict) -> str:
+    """Source of an rf/rf_XX.py module.
+
+    Relative frequencies are written with 7 significant digits.
+
+    Args:
+        prefix: Two-character hex prefix.
+        frequencies: Hash suffix -> relative frequency.
+
+    Returns:
+        Module source.
+    """
+    lines = ''.join(f'    {_quote(suffix)}: {frequencies[suffix]:.6e},\n' for suffix in sorted(frequencies))
+    return f'{HEADER}frequencies_{prefix} = {{\n{lines}}}\n'
+
+
+def render_word_bucket(bucket: int, words) -> str:
+    """Source of a bw/bw_XX.py module.
+
+    Args:
+        bucket: Bucket number (1-100).
+        words: Words in the bucket.
+
+    Returns:
+        Module source with the count, block heads and packed blocks.
+    """
+    words = sorted(words)
+    heads, blocks = front_coding.encode(words)
+    heads = ''.join(f'    {_quote(head)},\n' for head in heads)
+    blocks = ''.join(f'    {_quote(block)},\n' for block in blocks)
+    return (f'{HEADER}count_{bucket:02d} = {len(words)}\n\n'
+            f'heads_{bucket:02d} = (\n{heads})\n\n'
+            f'blocks_{bucket:02d} = (\n{blocks})\n')
+
+
+def render_sizes(sizes: list) -> str:
+    """Source of the bw/sizes.py module.
+
+    Args:
+        sizes: Number of words in each bucket, bucket 1 first.
+
+    Returns:
+        Module source.
+    """
+    lines = ''.join(f'    {size},\n' for size in sizes)
+    return f'{HEADER}# Number of words in each bucket (index 0 = bucket 1)\nsizes = (\n{lines})\n'
+
+
+def render_bounds(max_counts: list, total: int) -> str:
+    """Source of the freq/bounds.py module.
+
+    Args:
+        max_counts: Highest word count in each bucket, bucket 1 first.
+        total: Corpus size in tokens.
+
+    Returns:
+        Module source.
+    """
+    lines = ''.join(f'    {count},\n' for count in max_counts)
+    return f'{HEADER}total = {total}\n\n# Highest word count in each bucket (index 0 = bucket 1)\nmax_counts = (\n{lines})\n'
+
+
+def render_scores(counts: dict, total: int) -> str:
+    """Source of the rf/scores.py module.
+
+    A word's percentile is the share of word forms with a lower count,
+    plus half of those with the same count. Keys are written exactly as in
+    the rf shards, so they compare equal to the looked-up frequencies.
+
+    Args:
+        counts: Word -> count.
+        total: Corpus size in tokens.
+
+    Returns:
+        Module source with the zipf_codes and percentile_codes dicts.
+    """
+    forms = Counter(counts.values())
+    less = 0
+    zipf_lines, percentile_lines = [], []
+    for count in sorted(forms):
+        rf = f'{count / total:.6e}'
+        zipf_lines.append(f'    {rf}: {zipf_code(float(rf))},\n')
+        percentile_lines.append(f'    {rf}: {percentile_code(100 * (less + forms[count] / 2) / len(counts))},\n')
+        less += forms[count]
+    return (f'{HEADER}# Zipf code (1-255) of every relative frequency in the rf tables\n'
+            f'zipf_codes = {{\n{"".join(zipf_lines)}}}\n\n'
+            f'# Percentile code (1-255) of every relative frequency in the rf tables\n'
+            f'percentile_codes = {{\n{"".join(percentile_lines)}}}\n')
+
+
+def resolve_contractions(counts: dict, buckets: dict, total: int) -> tuple[dict, dict]:
+    """Precompute how bucket() and relative_frequency() resolve contractions.
+
+    Covers every word form that ends in a contraction suffix and is in the
+    tables (reachable, i.e. already normalized), plus the 's forms of
+    S_CONTRACTION_STEMS. Each is resolved the way the lookups otherwise
+    would at runtime: the split value (the rarer of stem and suffix) wins
+    over the direct entry when it is more frequent. Relative frequencies
+    are compared as written to the rf shards (6 significant digits).
+
+    Args:
+        counts: Normalized word -> count, as returned by aggregate().
+        buckets: Word -> bucket, as returned by assign_buckets().
+        total: Corpus size in tokens.
+
+    Returns:
+        Tuple of (buckets, frequencies): word -> (value, 'direct' or
+        'contraction'), each with a None key holding suffix -> value for
+        the suffixes themselves.
+    """
+    def rf(word):
+        count = counts.get(word)
+        return None if count is None else float(f'{count / total:.6e}')
+
+    forms = {word for word in counts if word.endswith(CONTRACTION_SUFFIXES) and normalize(word) == word}
+    forms.update(f"{stem}'s" for stem in S_CONTRACTION_STEMS)
+    resolved_buckets, resolved_rfs = {}, {}
+    for word in forms:
+        direct_bucket, direct_rf = buckets.get(word), rf(word)
+        bucket_path = rf_path = 'direct'
+        parts = _split_contraction(word)
+        if parts:
+            stem, suffix = parts
+            if buckets.get(stem) is not None and buckets.get(suffix) is not None:
+                split_bucket = max(buckets[stem], buckets[suffix])
+                if direct_bucket is None or split_bucket < direct_bucket:
+                    direct_bucket, bucket_path = split_bucket, 'contraction'
+                split_rf = min(rf(stem), rf(suffix))
+                if direct_rf is None or split_rf > direct_rf:
+                    direct_rf, rf_path = split_rf, 'contraction'
+        if direct_bucket is not None:
+            resolved_buckets[word] = (direct_bucket, bucket_path)
+            resolved_rfs[word] = (direct_rf, rf_path)
+    resolved_buckets[None] = {suffix: buckets.get(suffix) for suffix in CONTRACTION_SUFFIXES}
+    resolved_rfs[None] = {suffix: rf(suffix) for suffix in CONTRACTION_SUFFIXES}
+    return resolved_buckets, resolved_rfs
+
+
+def render_contractions(name: str, label: str, resolved: dict, fmt: str) -> str:
+    """Source of a freq/contractions.py or rf/contractions.py module.
+
+    Args:
+        name: Table attribute name ('buckets' or 'frequencies').
+        label: What the values are, for the comments.
+        resolved: One of the dicts returned by resolve_contractions().
+        fmt: Format spec of the values.
+
+    Returns:
+        Module source.
+    """
+    suffixes = ''.join(f'    {_quote(suffix)}: {"None" if value is None else format(value, fmt)},\n'
+                       for suffix, value in resolved[None].items())
+    words = ''.join(f'    {_quote(word)}: ({format(value, fmt)}, {_quote(path)}),\n'
+                    for word, (value, path) in sorted((w, v) for w, v in resolved.items() if w is not None))
+    return (f'{HEADER}# Contraction suffix -> {label} of the suffix token\n'
+            f'suffix_{name} = {{\n{suffixes}}}\n\n'
+            f"# Contraction form -> (resolved {label}, 'direct' or 'contraction')\n"
+            f'{name} = {{\n{words}}}\n')
+
+
+def render_package_init(package: str) -> str:
+    """Source of a table package __init__.py.
+
+    Shards are imported on first attribute access rather than when the
+    package is imported, so importing one shard does not import all of
+    them. The bw package also serves the decoded words_XX tuples of the
+    format before front coding.
+
+    Args:
+        package: 'hs', 'freq', 'rf' or 'bw'.
+
+    Returns:
+        Module source.
+    """
+    compat = ''
+    if package == 'bw':
+        module, key = 'bw', 'bucket'
+        check = f"kind in ('count', 'heads', 'blocks') and {key}.isdigit()"
+        # words_XX tuples were public before the lists were front-coded; decode them on demand
+        compat = ("    if kind == 'words' and bucket.isdigit():\n"
+                  "        from bnc_lookup.front_coding import decode\n"
+                  "        module = importlib.import_module(f'{__name__}.bw_{bucket}')\n"
+                  "        words = decode(getattr(module, f'heads_{bucket}'), getattr(module, f'blocks_{bucket}'))\n"
+                  "        globals()[name] = words\n"
+                  "        return words\n")
+    else:
+        module, kind = PACKAGES[package]
+        key = 'prefix'
+        check = f"kind == '{kind}' and len({key}) == 2"
+    return (f'{HEADER}import importlib\n\n\n'
+            f'def __getattr__(name):\n'
+            f"    kind, _, {key} = name.partition('_')\n"
+            f'    if {check}:\n'
+            f"        module = importlib.import_module(f'{{__name__}}.{module}_{{{key}}}')\n"
+            f'        return getattr(module, name)\n'
+            f'{compat}'
+            f"    raise AttributeError(f'module {{__name__!r}} has no attribute {{name!r}}')\n")
+
+
+def generate(counts: dict, total: int):
+    """Render every generated module.
+
+    Args:
+        counts: Normalized word -> count, as returned by aggregate().
+        total: Corpus size in tokens.
+
+    Yields:
+        Tuples of (path relative to the bnc_lookup package, source).
+    """
+    buckets = assign_buckets(counts)
+    shards = {prefix: ({}, {}) for prefix in _PREFIXES}
+    by_bucket = {bucket: [] for bucket in range(1, BUCKETS + 1)}
+    max_counts = [0] * BUCKETS
+    for word, count in counts.items():
+        digest = hashlib.md5(word.encode('utf-8')).hexdigest()
+        bucket = buckets[word]
+        bucket_dict, rf_dict = shards[digest[:2]]
+        bucket_dict[digest[2:]] = bucket
+        rf_dict[digest[2:]] = count / total
+        by_bucket[bucket].append(word)
+        max_counts[bucket - 1] = max(max_counts[bucket - 1], count)
+
+    for package in ('hs', 'freq', 'rf', 'bw'):
+        yield os.path.join(package, '__init__.py'), render_package_init(package)
+    for prefix, (bucket_dict, rf_dict) in shards.items():
+        yield os.path.join('hs', f'h_{prefix}.py'), render_hash_shard(prefix, bucket_dict)
+        yield os.path.join('freq', f'f_{prefix}.py'), render_bucket_shard(prefix, bucket_dict)
+        yield os.path.join('rf', f'rf_{prefix}.py'), render_rf_shard(prefix, rf_dict)
+    for bucket, words in by_bucket.items():
+        yield os.path.join('bw', f'bw_{bucket:02d}.py'), render_word_bucket(bucket, words)
+    yield os.path.join('bw', 'sizes.py'), render_sizes([len(words) for words in by_bucket.values()])
+    yield os.path.join('freq', 'bounds.py'), render_bounds(max_counts, total)
+    yield os.path.join('rf', 'scores.py'), render_scores(counts, total)
+    resolved_buckets, resolved_rfs = resolve_contractions(counts, buckets, total)
+    yield os.path.join('freq', 'contractions.py'), render_contractions('buckets', 'bucket', resolved_buckets, 'd')
+    yield os.path.join('rf', 'contractions.py'), render_contractions('frequencies', 'relative frequency', resolved_rfs, '.6e')
+
+
+def build(rows, output: str = _PACKAGE_DIR, stored_forms: bool = False) -> list:
+    """Write every generated module, skipping files that are unchanged.
+
+    Args:
+        rows: Iterable of (count, word), e.g. from read_frequency_list().
+        output: Directory receiving the hs/, freq/, rf/ and bw/ packages
+            (default: the installed bnc_lookup package).
+        stored_forms: Keep the words as given (see aggregate()).
+
+    Returns:
+        Relative paths of the files written.
+    """
+    written = []
+    for path, source in generate(*aggregate(rows, stored_forms)):
+        target = os.path.join(output, path)
+        if _read(target) == source:
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(source)
+        written.append(path)
+    return written
+
+
+def check(rows, output: str = _PACKAGE_DIR, stored_forms: bool = False) -> list:
+    """Compare the generated modules with the files on disk.
+
+    Args:
+        rows: Iterable of (count, word).
+        output: Directory holding the table packages.
+        stored_forms: Keep the words as given (see aggregate()).
+
+    Returns:
+        Relative paths of files that are missing or differ.
+    """
+    return [path for path, source in generate(*aggregate(rows, stored_forms))
+            if _read(os.path.join(output, path)) != source]
+
+
+def _read(path: str) -> str | None:
+    """Contents of a text file, or None if it does not exist."""
+    try:
+        with open(path, encoding='utf-8', newline='') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def source_from_tables(total: int = 100_106_029):
+    """Rebuild frequency-list rows from the installed tables.
+
+    Counts are recovered from the relative frequencies, and rows are
+    ordered so that assign_buckets() reproduces the installed buckets.
+    Words are yielded as stored; pass stored_forms=True to build() or
+    check() so they are hashed that way, as the tables are.
+
+    Args:
+        total: Corpus size the relative frequencies were computed with.
+
+    Yields:
+        Tuples of (count, word), starting with the TOTAL_MARKER row.
+    """
+    from bnc_lookup.find_rf import _get_rf_dict
+    from bnc_lookup.find_words import _get_bucket_words
+
+    rows = []
+    for bucket in range(1, BUCKETS + 1):
+        for word in _get_bucket_words(bucket):
+            digest = hashlib.md5(word.encode('utf-8')).hexdigest()
+            rows.append((round(_get_rf_dict(digest[:2])[digest[2:]] * total), bucket, word))
+    rows.sort(key=lambda row: (-row[0], row[1]))
+    yield total, TOTAL_MARKER
+    for count, _, word in rows:
+        yield count, word
+
+
+def main():
+    """CLI entry point: bnc-build [SOURCE | --from-tables] [--output DIR] [--check] | --archive PATH."""
+    parser = argparse.ArgumentParser(prog='bnc-build', description='Regenerate the bnc_lookup data tables.')
+    parser.add_argument('source', nargs='?', help='frequency list in all.num format (.gz allowed)')
+    parser.add_argument('--from-tables', action='store_true',
+                        help='use the installed tables as the source instead of a frequency list')
+    parser.add_argument('--output', metavar='DIR', default=_PACKAGE_DIR,
+                        help='directory for the table packages (default: the installed package)')
+    parser.add_argument('--check', action='store_true', help='report differing files instead of writing them')
+    parser.add_argument('--archive', metavar='PATH',
+                        help='pack the tables generated in --output (default: the installed tables) into a '
+                             'single archive file, e.g. a lexicon version for load_lexicon()')
+    args = parser.parse_args()
+    if args.archive:
+        if args.source or args.from_tables or args.check:
+            parser.error('--archive takes no SOURCE, --from-tables or --check')
+        from bnc_lookup.archive import write_archive
+        directory = None if os.path.abspath(args.output) == _PACKAGE_DIR else args.output
+        print(f'{write_archive(args.archive, directory=directory)} tables written to {args.archive}')
+        return
+    if bool(args.source) == args.from_tables:
+        parser.error('give either SOURCE or --from-tables')
+
+    rows = source_from_tables() if args.from_tables else read_frequency_list(args.source)
+    if args.check:
+        changed = check(rows, args.output, stored_forms=args.from_tables)
+        for path in changed:
+            print(path)
+        sys.exit(1 if changed else 0)
+    written = build(rows, args.output, stored_forms=args.from_tables)
+    print(f'{len(written)} files written to {args.output}')
@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_01 = (
+count_01 = 6695
+
+heads_01 = (
     '&amp',
-    '&formula',
-    '&pound;1',
-    '&pound;100',
-    '&times',
-    '\'',
-    '\'d',
-    '\'em',
-    '\'ll',
-    '\'m',
-    '\'re',
-    '\'s',
-    '\'ve',
-    '*',
-    '+',
-    '0',
     '000',
-    '1',
-    '1,000',
-    '10',
-    '10%',
-    '10,000',
-    '100',
-    '11',
-    '12',
-    '13',
-    '14',
-    '15',
-    '150',
-    '16',
-    '17',
-    '18',
     '19',
-    '1930s',
-    '1939',
-    '1940',
-    '1945',
-    '1947',
-    '1948',
-    '1950',
-    '1950s',
-    '1957',
-    '1959',
-    '1960',
-    '1960s',
-    '1961',
-    '1962',
-    '1963',
     '1964',
-    '1965',
-    '1966',
-    '1967',
-    '1968',
-    '1969',
-    '1970',
-    '1970s',
-    '1971',
-    '1972',
-    '1973',
-    '1974',
-    '1975',
-    '1976',
-    '1977',
-    '1978',
     '1979',
-    '1980',
-    '1980s',
-    '1981',
-    '1982',
-    '1983',
-    '1984',
-    '1985',
-    '1986',
-    '1987',
-    '1988',
-    '1989',
-    '1990',
-    '1991',
-    '1992',
-    '1993',
     '1994',
-    '19th',
-    '1st',
-    '2',
-    '2,000',
-    '20',
-    '200',
-    '2000',
-    '21',
-    '22',
-    '23',
-    '24',
-    '25',
-    '26',
-    '27',
-    '28',
     '29',
-    '3',
-    '30',
-    '300',
-    '31',
-    '32',
-    '33',
-    '34',
-    '35',
-    '36',
-    '37',
-    '38',
-    '39',
-    '4',
-    '40',
-    '400',
     '41',
-    '42',
-    '43',
-    '44',
-    '45',
-    '48',
-    '5',
-    '50',
-    '500',
-    '55',
-    '6',
-    '60',
-    '65',
-    '7',
-    '70',
-    '75',
     '8',
-    '80',
-    '9',
-    '90',
-    '93',
-    '=',
-    'a',
-    'a.',
-    'a_bit',
-    'a_few',
-    'a_great_deal',
-    'a_little',
-    'a_little_bit',
-    'a_lot',
-    'abandon',
-    'abandoned',
     'abbey',
-    'aberdeen',
-    'abilities',
-    'ability',
-    'able',
-    'abortion',
-    'about',
-    'above',
-    'abroad',
-    'abruptly',
-    'absence',
-    'absent',
-    'absolute',
-    'absolutely',
-    'absorbed',
-    'abstract',
     'abuse',
-    'academic',
-    'academy',
-    'accent',
-    'accept',
-    'acceptable',
-    'acceptance',
-    'accepted',
-    'accepting',
-    'access',
-    'accessible',
-    'accident',
-    'accidents',
-    'accommodate',
-    'accommodation',
-    'accompanied',
     'according_to',
-    'accordingly',
-    'account',
-    'accountability',
-    'accountants',
-    'accounted',
-    'accounting',
-    'accounts',
-    'accuracy',
-    'accurate',
-    'accurately',
-    'accused',
-    'ace',
-    'achieve',
-    'achieved',
-    'achievement',
     'achievements',
-    'achieving',
-    'acid',
-    'acknowledge',
-    'acknowledged',
-    'acquire',
-    'acquired',
-    'acquisition',
-    'acres',
-    'across',
-    'act',
-    'acted',
-    'acting',
-    'action',
-    'actions',
-    'active',
     'actively',
-    'activities',
-    'activity',
-    'actor',
-    'actors',
-    'acts',
-    'actual',
-    'actually',
-    'acute',
-    'ad',
-    'adam',
-    'adapted',
-    'add',
-    'added',
-    'adding',
-    'addition',
     'additional',
-    'address',
-    'addressed',
-    'addresses',
-    'adds',
-    'adequate',
-    'adjustment',
-    'administration',
-    'administrative',
-    'admission',
-    'admit',
-    'admits',
-    'admitted',
-    'adopt',
-    'adopted',
-    'adoption',
     'adult',
-    'adults',
-    'advance',
-    'advanced',
-    'advances',
-    'advantage',
-    'advantages',
-    'adventure',
-    'adverse',
-    'advertising',
-    'advice',
-    'advise',
-    'advised',
-    'adviser',
-    'advisers',
-    'advisory',
     'aesthetic',
-    'affair',
-    'affairs',
-    'affect',
-    'affected',
-    'affecting',
-    'affection',
-    'affects',
-    'afford',
-    'afraid',
-    'africa',
-    'african',
-    'after',
-    'afternoon',
-    'afterwards',
-    'again',
     'against',
-    'age',
-    'aged',
-    'ageing',
-    'agencies',
-    'agency',
-    'agenda',
-    'agent',
-    'agents',
-    'ages',
-    'aggregate',
-    'aggression',
-    'aggressive',
-    'ago',
-    'agree',
-    'agreed',
     'agreement',
-    'agreements',
-    'agricultural',
-    'agriculture',
-    'ah',
-    'aha',
-    'ahead',
-    'ahead_of',
-    'ai',
-    'aid',
-    'aids',
-    'aim',
-    'aimed',
-    'aims',
-    'air',
-    'aircraft',
     'airport',
-    'al',
-    'alan',
-    'alarm',
-    'albeit',
-    'albert',
-    'album',
-    'alcohol',
-    'alert',
-    'alex',
-    'alexander',
-    'alfred',
-    'ali',
-    'alice',
-    'alien',
-    'alike',
     'alison',
-    'alive',
-    'all',
-    'all_but',
-    'all_right',
-    'allegations',
-    'alleged',
-    'allen',
-    'alliance',
-    'allied',
-    'allies',
-    'allocated',
-    'allocation',
-    'allow',
-    'allowance',
-    'allowances',
     'allowed',
-    'allowing',
-    'allows',
-    'almost',
-    'alone',
-    'along',
-    'along_with',
-    'alongside',
-    'already',
-    'alright',
-    'also',
-    'alter',
-    'altered',
-    'alternative',
-    'alternatively',
-    'alternatives',
     'although',
-    'altogether',
-    'always',
-    'am',
-    'amateur',
-    'amazing',
-    'ambition',
-    'ambitious',
-    'ambulance',
-    'amendment',
-    'america',
-    'american',
-    'americans',
-    'among',
-    'amongst',
-    'amount',
     'amounts',
-    'an',
-    'analyse',
-    'analysed',
-    'analyses',
-    'analysis',
-    'ancient',
-    'and',
-    'and/or',
-    'and_so_on',
-    'anderson',
-    'andrew',
-    'andy',
-    'angel',
-    'anger',
-    'angle',
     'angles',
-    'angry',
-    'animal',
-    'animals',
-    'ann',
-    'anna',
-    'anne',
-    'anniversary',
-    'announced',
-    'announcement',
-    'annual',
-    'anonymous',
-    'another',
-    'answer',
-    'answered',
-    'answering',
     'answers',
-    'anthony',
-    'anticipated',
-    'anxiety',
-    'anxious',
-    'any',
-    'anybody',
-    'anyone',
-    'anything',
-    'anyway',
-    'anywhere',
-    'apart',
-    'apart_from',
-    'apartment',
-    'apparent',
-    'apparently',
     'appeal',
-    'appealed',
-    'appeals',
-    'appear',
-    'appearance',
-    'appeared',
-    'appearing',
-    'appears',
-    'appendix',
-    'apple',
-    'applicable',
-    'applicant',
-    'applicants',
-    'application',
-    'applications',
-    'applied',
     'applies',
-    'apply',
-    'applying',
-    'appointed',
-    'appointment',
-    'appointments',
-    'appreciate',
-    'appreciated',
-    'appreciation',
-    'approach',
-    'approached',
-    'approaches',
-    'approaching',
-    'appropriate',
-    'approval',
-    'approved',
     'approximately',
-    'april',
-    'arab',
-    'archbishop',
-    'architect',
-    'architectural',
-    'architecture',
-    'are',
-    'area',
-    'areas',
-    'argue',
-    'argued',
-    'argues',
-    'arguing',
-    'argument',
-    'arguments',
     'arise',
-    'arises',
-    'arising',
-    'arm',
-    'armed',
-    'arms',
-    'army',
-    'arose',
-    'around',
-    'arrange',
-    'arranged',
-    'arrangement',
-    'arrangements',
-    'arrest',
-    'arrested',
-    'arrival',
     'arrive',
-    'arrived',
-    'arriving',
-    'arsenal',
-    'art',
-    'arthur',
-    'article',
-    'articles',
-    'artificial',
-    'artist',
-    'artistic',
-    'artists',
-    'arts',
-    'as',
-    'as_far_as',
-    'as_for',
     'as_if',
-    'as_long_as',
-    'as_opposed_to',
-    'as_soon_as',
-    'as_though',
-    'as_to',
-    'as_usual',
-    'as_well',
-    'as_well_as',
-    'as_yet',
-    'ash',
-    'asia',
-    'asian',
-    'aside',
-    'ask',
-    'asked',
     'asking',
-    'asks',
-    'asleep',
-    'aspect',
-    'aspects',
-    'assault',
-    'assembled',
-    'assembly',
-    'assess',
-    'assessed',
-    'assessing',
-    'assessment',
-    'asset',
-    'assets',
-    'assigned',
-    'assist',
     'assistance',
-    'assistant',
-    'associate',
-    'associated',
-    'association',
-    'associations',
-    'assume',
-    'assumed',
-    'assuming',
-    'assumption',
-    'assumptions',
-    'assurance',
-    'assured',
-    'at',
-    'at_all',
-    'at_first',
     'at_last',
-    'at_least',
-    'at_once',
-    'at_present',
-    'ate',
-    'atlantic',
-    'atmosphere',
-    'attached',
-    'attack',
-    'attacked',
-    'attacking',
-    'attacks',
-    'attempt',
-    'attempted',
-    'attempting',
-    'attempts',
     'attend',
-    'attendance',
-    'attended',
-    'attending',
-    'attention',
-    'attitude',
-    'attitudes',
-    'attract',
-    'attracted',
-    'attraction',
-    'attractive',
-    'attributed',
-    'auction',
-    'audience',
-    'audit',
-    'auditors',
     'aug.',
-    'august',
-    'aunt',
-    'australia',
-    'australian',
-    'austria',
-    'author',
-    'authorities',
-    'authority',
-    'authors',
-    'automatic',
-    'automatically',
-    'autonomy',
-    'autumn',
-    'availability',
-    'available',
     'avenue',
-    'average',
-    'avoid',
-    'avoided',
-    'avoiding',
-    'awake',
-    'award',
-    'awarded',
-    'awards',
-    'aware',
-    'awareness',
-    'away',
-    'away_from',
-    'awful',
-    'awkward',
-    'aye',
     'b',
-    'b.',
-    'babies',
-    'baby',
-    'back',
-    'backed',
-    'background',
-    'backing',
-    'backs',
-    'backwards',
-    'bacon',
-    'bacteria',
-    'bad',
-    'badly',
-    'bag',
-    'bags',
     'baker',
-    'balance',
-    'balanced',
-    'ball',
-    'ballet',
-    'balls',
-    'ban',
-    'band',
-    'bands',
-    'bang',
-    'bank',
-    'banking',
-    'banks',
-    'banned',
-    'bar',
-    'barbara',
     'bare',
-    'barely',
-    'bargaining',
-    'barn',
-    'barnes',
-    'barrier',
-    'barriers',
-    'barry',
-    'bars',
-    'base',
-    'based',
-    'bases',
-    'basic',
-    'basically',
-    'basin',
-    'basis',
     'basket',
-    'bass',
-    'bastard',
-    'bath',
-    'bathroom',
-    'battery',
-    'battle',
-    'bay',
-    'bbc',
-    'be',
-    'beach',
-    'beans',
-    'bear',
-    'bearing',
-    'bears',
-    'beat',
     'beaten',
-    'beating',
-    'beautiful',
-    'beautifully',
-    'beauty',
-    'became',
-    'because',
-    'because_of',
-    'become',
-    'becomes',
-    'becoming',
-    'bed',
-    'bedroom',
-    'bedrooms',
-    'beds',
-    'beef',
     'been',
-    'beer',
-    'before',
-    'began',
-    'begin',
-    'beginning',
-    'begins',
-    'begun',
-    'behalf',
-    'behave',
-    'behaviour',
-    'behind',
-    'being',
-    'beings',
-    'belfast',
-    'belgium',
     'belief',
-    'beliefs',
-    'believe',
-    'believed',
-    'believes',
-    'believing',
-    'bell',
-    'belong',
-    'belonged',
-    'belonging',
-    'belongs',
-    'below',
-    'belt',
-    'ben',
-    'bench',
-    'bend',
     'beneath',
-    'beneficial',
-    'benefit',
-    'benefits',
-    'benjamin',
-    'bent',
-    'berlin',
-    'bernard',
-    'beside',
-    'besides',
-    'best',
-    'bet',
-    'better',
-    'betty',
-    'between',
-    'beyond',
     'bias',
-    'bible',
-    'bid',
-    'big',
-    'bigger',
-    'biggest',
-    'bike',
-    'bile',
-    'bill',
-    'billion',
-    'bills',
-    'billy',
-    'binding',
-    'biological',
-    'bird',
-    'birds',
     'birmingham',
-    'birth',
-    'birthday',
-    'bishop',
-    'bishops',
-    'bit',
-    'bite',
-    'bits',
-    'bitter',
-    'black',
-    'blacks',
-    'blame',
-    'blamed',
-    'blank',
-    'blast',
-    'bleeding',
     'blew',
-    'blind',
-    'block',
-    'blocked',
-    'blocks',
-    'bloke',
-    'blood',
-    'bloody',
-    'blow',
-    'blown',
-    'blue',
-    'blues',
-    'board',
-    'boards',
-    'boat',
-    'boats',
     'bob',
-    'bodies',
-    'body',
-    'bold',
-    'bomb',
-    'bombs',
-    'bond',
-    'bonds',
-    'bone',
-    'bones',
-    'bonus',
-    'book',
-    'booked',
-    'booking',
-    'books',
-    'boom',
     'boost',
-    'boot',
-    'boots',
-    'border',
-    'borders',
-    'bore',
-    'bored',
-    'boring',
-    'born',
-    'borough',
-    'borrow',
-    'borrowed',
-    'borrowing',
-    'boss',
-    'both',
-    'bother',
     'bothered',
-    'bottle',
-    'bottles',
-    'bottom',
-    'bought',
-    'bound',
-    'boundaries',
-    'boundary',
-    'bow',
-    'bowel',
-    'bowl',
-    'box',
-    'boxes',
-    'boxing',
-    'boy',
-    'boys',
     'br',
-    'bradford',
-    'brain',
-    'branch',
-    'branches',
-    'brand',
-    'brass',
-    'brave',
-    'brazil',
-    'breach',
-    'bread',
-    'break',
-    'breakdown',
-    'breakfast',
-    'breaking',
-    'breaks',
     'breast',
-    'breasts',
-    'breath',
-    'breathing',
-    'breed',
-    'breeding',
-    'breeze',
-    'brian',
-    'brick',
-    'bridge',
-    'brief',
-    'briefly',
-    'brigade',
-    'bright',
-    'brighton',
-    'brilliant',
     'bring',
-    'bringing',
-    'brings',
-    'bristol',
-    'britain',
-    'british',
-    'broad',
-    'broadcast',
-    'broadcasting',
-    'broader',
-    'broadly',
-    'broke',
-    'broken',
-    'bronze',
-    'brother',
-    'brothers',
     'brought',
-    'brown',
-    'bruce',
-    'brush',
-    'brussels',
-    'budget',
-    'budgets',
-    'build',
-    'building',
-    'buildings',
-    'built',
-    'bulk',
-    'bull',
-    'bunch',
-    'burden',
-    'bureau',
     'bureaucracy',
-    'buried',
-    'burn',
-    'burned',
-    'burning',
-    'burns',
-    'burnt',
-    'burst',
-    'bus',
-    'buses',
-    'bush',
-    'business',
-    'businesses',
-    'busy',
-    'but',
-    'but_for',
     'butler',
-    'butter',
-    'button',
-    'buy',
-    'buyer',
-    'buyers',
-    'buying',
-    'by',
-    'by_means_of',
-    'by_no_means',
-    'by_now',
-    'by_way_of',
-    'bye',
-    'c',
-    'c.',
-    'ca',
     'cab',
-    'cabinet',
-    'cable',
-    'cake',
-    'calcium',
-    'calculated',
-    'calculations',
-    'california',
-    'call',
-    'called',
-    'calling',
-    'calls',
-    'calm',
-    'cambridge',
-    'came',
-    'camera',
     'camp',
-    'campaign',
-    'campaigns',
-    'campbell',
-    'can',
-    'canada',
-    'canadian',
-    'canal',
-    'cancelled',
-    'cancer',
-    'candidate',
-    'candidates',
-    'canterbury',
-    'cap',
-    'capable',
-    'capacity',
     'capital',
-    'capitalism',
-    'capitalist',
-    'captain',
-    'capture',
-    'captured',
-    'car',
-    'carbon',
-    'card',
-    'cardiff',
-    'cards',
-    'care',
-    'cared',
-    'career',
-    'careers',
-    'careful',
     'carefully',
-    'carers',
-    'caring',
-    'caroline',
-    'carpet',
-    'carriage',
-    'carrie',
-    'carried',
-    'carrier',
-    'carries',
-    'carry',
-    'carrying',
-    'cars',
-    'carter',
-    'carved',
-    'case',
     'cases',
-    'cash',
-    'cast',
-    'castle',
-    'casual',
-    'cat',
-    'catalogue',
-    'catch',
-    'catching',
-    'categories',
-    'category',
-    'catering',
-    'cathedral',
-    'catherine',
-    'catholic',
-    'cats',
     'cattle',
-    'caught',
-    'cause',
-    'caused',
-    'causes',
-    'causing',
-    'caution',
-    'cave',
-    'ceased',
-    'ceiling',
-    'celebrate',
-    'celebrated',
-    'celebration',
-    'cell',
-    'cells',
-    'celtic',
     'central',
-    'centre',
-    'centred',
-    'centres',
-    'centuries',
-    'century',
-    'ceremony',
-    'certain',
-    'certainly',
-    'certainty',
-    'certificate',
-    'chain',
-    'chains',
-    'chair',
-    'chairman',
-    'chairs',
     'challenge',
-    'challenged',
-    'challenges',
-    'challenging',
-    'chamber',
-    'chambers',
-    'champagne',
-    'champion',
-    'champions',
-    'championship',
-    'championships',
-    'chance',
-    'chancellor',
-    'chances',
-    'change',
-    'changed',
     'changes',
-    'changing',
-    'channel',
-    'channels',
-    'chaos',
-    'chap',
-    'chapel',
-    'chapter',
-    'chapters',
-    'character',
-    'characteristic',
-    'characteristics',
-    'characters',
-    'charge',
-    'charged',
-    'charges',
     'charity',
-    'charles',
-    'charlie',
-    'charlotte',
-    'charm',
-    'charming',
-    'chart',
-    'charter',
-    'chase',
-    'chat',
-    'cheap',
-    'cheaper',
-    'check',
-    'checked',
-    'checking',
-    'checks',
     'cheek',
-    'cheeks',
-    'cheese',
-    'chelsea',
-    'cheltenham',
-    'chemical',
-    'chemicals',
-    'chemistry',
-    'cheque',
-    'chest',
-    'chicken',
-    'chief',
-    'child',
-    'childhood',
-    'children',
-    'chin',
     'china',
-    'chinese',
-    'chip',
-    'chips',
-    'chocolate',
-    'choice',
-    'choices',
-    'choose',
-    'choosing',
-    'chose',
-    'chosen',
-    'chris',
-    'christ',
-    'christian',
-    'christianity',
-    'christians',
     'christie',
-    'christmas',
-    'christopher',
-    'chronic',
-    'church',
-    'churches',
-    'churchill',
-    'cigarette',
-    'cigarettes',
-    'cinema',
-    'circle',
-    'circles',
-    'circuit',
-    'circular',
-    'circulation',
-    'circumstances',
     'cited',
-    'cities',
-    'citizen',
-    'citizens',
-    'city',
-    'civil',
-    'civilian',
-    'claim',
-    'claimed',
-    'claiming',
-    'claims',
-    'clare',
-    'clark',
-    'clarke',
-    'clash',
-    'class',
     'classes',
-    'classic',
-    'classical',
-    'classification',
-    'classified',
-    'classroom',
-    'clause',
-    'clauses',
-    'clay',
-    'clean',
-    'cleaning',
-    'clear',
-    'cleared',
-    'clearing',
-    'clearly',
-    'clergy',
     'clerk',
-    'cleveland',
-    'clever',
-    'client',
-    'clients',
-    'cliff',
-    'climate',
-    'climb',
-    'climbed',
-    'climbing',
-    'clinic',
-    'clinical',
-    'clinton',
-    'clock',
-    'close',
-    'closed',
     'closely',
-    'closer',
-    'closing',
-    'closure',
-    'cloth',
-    'clothes',
-    'clothing',
-    'cloud',
-    'clouds',
-    'club',
-    'clubs',
-    'cm',
-    'co',
-    'co-operation',
-    'coach',
-    'coal',
     'coalition',
-    'coast',
-    'coastal',
-    'coat',
-    'code',
-    'codes',
-    'coffee',
-    'coffin',
-    'cognitive',
-    'coin',
-    'coins',
-    'cold',
-    'colin',
-    'collaboration',
-    'collapse',
-    'collapsed',
     'collar',
-    'colleague',
-    'colleagues',
-    'collect',
-    'collected',
-    'collecting',
-    'collection',
-    'collections',
-    'collective',
-    'college',
-    'colleges',
-    'colonel',
-    'colonial',
-    'colour',
-    'coloured',
-    'colours',
     'column',
-    'columns',
-    'combat',
-    'combination',
-    'combine',
-    'combined',
-    'come',
-    'comedy',
-    'comes',
-    'comfort',
-    'comfortable',
-    'comic',
-    'coming',
-    'command',
-    'commander',
-    'comment',
     'commented',
-    'comments',
-    'commerce',
-    'commercial',
-    'commission',
-    'commissioned',
-    'commissioner',
-    'commit',
-    'commitment',
-    'commitments',
-    'committed',
-    'committee',
-    'committees',
-    'common',
-    'commonly',
-    'commons',
     'commonwealth',
-    'communicate',
-    'communication',
-    'communications',
-    'communist',
-    'communists',
-    'communities',
-    'community',
-    'compact',
-    'companies',
-    'companion',
-    'company',
-    'comparable',
-    'comparative',
-    'comparatively',
-    'compare',
     'compared',
-    'comparison',
-    'comparisons',
-    'compensation',
-    'compete',
-    'competence',
-    'competent',
-    'competing',
-    'competition',
-    'competitive',
-    'competitors',
-    'complain',
-    'complained',
-    'complaint',
-    'complaints',
-    'complete',
     'completed',
-    'completely',
-    'completion',
-    'complex',
-    'complexity',
-    'compliance',
-    'complicated',
-    'comply',
-    'component',
-    'components',
-    'composed',
-    'composition',
-    'compound',
-    'comprehensive',
-    'compromise',
-    'compulsory',
     'computer',
-    'computers',
-    'computing',
-    'conceived',
-    'concentrate',
-    'concentrated',
-    'concentrating',
-    'concentration',
-    'concentrations',
-    'concept',
-    'conception',
-    'concepts',
-    'concern',
-    'concerned',
-    'concerning',
-    'concerns',
     'concert',
-    'conclude',
-    'concluded',
-    'conclusion',
-    'conclusions',
-    'concrete',
-    'condemned',
-    'condition',
-    'conditions',
-    'conduct',
-    'conducted',
-    'conference',
-    'conferences',
-    'confidence',
-    'confident',
-    'confined',
     'confirm',
-    'confirmed',
-    'conflict',
-    'conflicts',
-    'confused',
-    'confusion',
-    'congress',
-    'connected',
-    'connection',
-    'connections',
-    'conscience',
-    'conscious',
-    'consciousness',
-    'consensus',
-    'consent',
-    'consequence',
     'consequences',
-    'consequently',
-    'conservation',
-    'conservative',
-    'conservatives',
-    'consider',
-    'considerable',
-    'considerably',
-    'consideration',
-    'considerations',
-    'considered',
-    'considering',
-    'considers',
-    'consist',
-    'consisted',
-    'consistent',
     'consistently',
-    'consisting',
-    'consists',
-    'constable',
-    'constance',
-    'constant',
-    'constantly',
-    'constituency',
-    'constitute',
-    'constitution',
-    'constitutional',
-    'constraints',
-    'construct',
-    'constructed',
-    'construction',
-    'consult',
     'consultant',
-    'consultants',
-    'consultation',
-    'consulted',
-    'consumer',
-    'consumers',
-    'consumption',
-    'contact',
-    'contacts',
-    'contain',
-    'contained',
-    'containing',
-    'contains',
-    'contemporary',
-    'contempt',
-    'content',
     'contents',
-    'contest',
-    'context',
-    'contexts',
-    'continent',
-    'continental',
-    'continually',
-    'continue',
-    'continued',
-    'continues',
-    'continuing',
-    'continuity',
-    'continuous',
-    'contract',
-    'contracts',
-    'contrary',
     'contrary_to',
-    'contrast',
-    'contribute',
-    'contributed',
-    'contribution',
-    'contributions',
-    'control',
-    'controlled',
-    'controlling',
-    'controls',
-    'controversial',
-    'controversy',
-    'convenient',
-    'convention',
-    'conventional',
-    'conventions',
     'conversation',
-    'conversion',
-    'convert',
-    'converted',
-    'convicted',
-    'conviction',
-    'convince',
-    'convinced',
-    'convincing',
-    'cook',
-    'cooked',
-    'cooking',
-    'cool',
-    'cooper',
-    'cooperation',
-    'cope',
     'copies',
-    'copper',
-    'copy',
-    'corbett',
-    'core',
-    'corn',
-    'corner',
-    'corners',
-    'cornwall',
-    'corp',
-    'corporate',
-    'corporation',
-    'corps',
-    'correct',
-    'correctly',
-    'correlation',
     'correspondence',
-    'correspondent',
-    'corresponding',
-    'corridor',
-    'corruption',
-    'cos',
-    'cost',
-    'costs',
-    'cottage',
-    'cotton',
-    'could',
-    'council',
-    'councillor',
-    'councillors',
-    'councils',
-    'counsel',
     'counselling',
-    'count',
-    'counted',
-    'counter',
-    'counties',
-    'counting',
-    'countries',
-    'country',
-    'countryside',
-    'counts',
-    'county',
-    'coup',
-    'couple',
-    'coupled',
-    'couples',
-    'courage',
     'course',
-    'courses',
-    'court',
-    'courts',
-    'cousin',
-    'coventry',
-    'cover',
-    'coverage',
-    'covered',
-    'covering',
-    'covers',
-    'cow',
-    'cows',
-    'crack',
-    'craft',
-    'craig',
     'crash',
-    'crashed',
-    'crazy',
-    'cream',
-    'create',
-    'created',
-    'creates',
-    'creating',
-    'creation',
-    'creative',
-    'creature',
-    'creatures',
-    'credit',
-    'creditors',
-    'crew',
-    'cricket',
     'cried',
-    'crime',
-    'crimes',
-    'criminal',
-    'crisis',
-    'criteria',
-    'criterion',
-    'critical',
-    'criticised',
-    'criticism',
-    'critics',
-    'crop',
-    'crops',
-    'cross',
-    'crossed',
-    'crossing',
     'crowd',
-    'crowded',
-    'crowds',
-    'crown',
-    'crucial',
-    'crude',
-    'cruel',
-    'cry',
-    'crying',
-    'crystal',
-    'cultural',
-    'culture',
-    'cultures',
-    'cup',
-    'cupboard',
-    'cups',
     'cure',
-    'curious',
-    'currency',
-    'current',
-    'currently',
-    'curriculum',
-    'curtain',
-    'curtains',
-    'curve',
-    'custody',
-    'custom',
-    'customer',
-    'customers',
-    'customs',
-    'cut',
-    'cuts',
     'cutting',
-    'cycle',
-    'd',
-    'd\'',
-    'd.',
-    'da',
-    'dad',
-    'daddy',
-    'daily',
-    'damage',
-    'damaged',
-    'damages',
-    'damaging',
-    'damn',
-    'damp',
-    'dance',
     'dancing',
-    'danger',
-    'dangerous',
-    'dangers',
-    'daniel',
-    'dare',
-    'dark',
-    'darkness',
-    'darling',
-    'darlington',
-    'data',
-    'database',
-    'date',
-    'dated',
-    'dates',
-    'dating',
     'daughter',
-    'daughters',
-    'dave',
-    'david',
-    'davies',
-    'davis',
-    'dawn',
-    'day',
-    'days',
-    'dc',
-    'de',
-    'dead',
-    'deaf',
-    'deal',
-    'dealer',
-    'dealers',
     'dealing',
-    'deals',
-    'dealt',
-    'dean',
-    'dear',
-    'death',
-    'deaths',
-    'debate',
-    'debates',
-    'debt',
-    'debts',
-    'debut',
-    'dec',
-    'dec.',
-    'decade',
-    'decades',
     'december',
-    'decent',
-    'decide',
-    'decided',
-    'deciding',
-    'decision',
-    'decision-making',
-    'decisions',
-    'decisive',
-    'deck',
-    'declaration',
-    'declared',
-    'decline',
-    'declined',
-    'decorated',
-    'decrease',
     'dedicated',
-    'deemed',
-    'deep',
-    'deeper',
-    'deeply',
-    'defeat',
-    'defeated',
-    'defence',
-    'defend',
-    'defendant',
-    'defendants',
-    'defender',
-    'defending',
-    'defensive',
-    'deficit',
-    'define',
     'defined',
-    'definite',
-    'definitely',
-    'definition',
-    'definitions',
-    'degree',
-    'degrees',
-    'delay',
-    'delayed',
-    'delegates',
-    'delegation',
-    'deliberate',
-    'deliberately',
-    'delicate',
-    'delight',
-    'delighted',
     'deliver',
-    'delivered',
-    'delivery',
-    'demand',
-    'demanded',
-    'demanding',
-    'demands',
-    'democracy',
-    'democratic',
-    'democrats',
-    'demonstrate',
-    'demonstrated',
-    'demonstration',
-    'demonstrations',
-    'denied',
-    'denmark',
     'dennis',
-    'density',
-    'deny',
-    'department',
-    'departments',
-    'departure',
-    'depend',
-    'depended',
-    'dependence',
-    'dependent',
-    'depending_on',
-    'depends',
-    'deposit',
-    'deposits',
-    'depressed',
-    'depression',
     'depth',
-    'deputies',
-    'deputy',
-    'derby',
-    'derek',
-    'derived',
-    'des',
-    'describe',
-    'described',
-    'describes',
-    'describing',
-    'description',
-    'descriptions',
-    'desert',
-    'deserted',
-    'deserve',
     'design',
-    'designated',
-    'designed',
-    'designer',
-    'designs',
-    'desirable',
-    'desire',
-    'desired',
-    'desk',
-    'desktop',
-    'despair',
-    'desperate',
-    'desperately',
-    'despite',
-    'destroy',
-    'destroyed',
     'destruction',
-    'detail',
-    'detailed',
-    'details',
-    'detect',
-    'detected',
-    'detective',
-    'determination',
-    'determine',
-    'determined',
-    'determining',
-    'develop',
-    'developed',
-    'developing',
-    'development',
-    'developments',
     'device',
-    'devices',
-    'devil',
-    'devised',
-    'devon',
-    'devoted',
-    'di',
-    'diagnosis',
-    'diagram',
-    'dialogue',
-    'diameter',
-    'diana',
-    'diary',
-    'dick',
-    'dictionary',
-    'did',
     'die',
-    'died',
-    'diesel',
-    'diet',
-    'differ',
-    'difference',
-    'differences',
-    'different',
-    'differently',
-    'difficult',
-    'difficulties',
-    'difficulty',
-    'digital',
-    'dignity',
-    'dimension',
-    'dimensions',
     'dining',
-    'dinner',
-    'dioxide',
-    'diplomatic',
-    'direct',
-    'directed',
-    'direction',
-    'directions',
-    'directive',
-    'directly',
-    'director',
-    'directors',
-    'directory',
-    'dirty',
-    'disability',
-    'disabled',
     'disappear',
-    'disappeared',
-    'disappointed',
-    'disappointment',
-    'disaster',
-    'disc',
-    'discharge',
-    'discipline',
-    'discount',
-    'discourse',
-    'discover',
-    'discovered',
-    'discovery',
-    'discretion',
-    'discrimination',
-    'discuss',
     'discussed',
-    'discussing',
-    'discussion',
-    'discussions',
-    'disease',
-    'diseases',
-    'dish',
-    'dishes',
-    'disk',
-    'dismissal',
-    'dismissed',
-    'disorder',
-    'display',
-    'displayed',
-    'displays',
-    'disposal',
     'dispute',
-    'disputes',
-    'distance',
-    'distant',
-    'distinct',
-    'distinction',
-    'distinctive',
-    'distinguish',
-    'distinguished',
-    'distress',
-    'distributed',
-    'distribution',
-    'district',
-    'districts',
-    'disturbed',
-    'disturbing',
     'diverse',
-    'diversity',
-    'divide',
-    'divided',
-    'dividend',
-    'divine',
-    'division',
-    'divisions',
-    'divorce',
-    'dna',
-    'do',
-    'dock',
-    'doctor',
-    'doctors',
-    'doctrine',
-    'document',
     'documentation',
-    'documents',
-    'does',
-    'dog',
-    'dogs',
-    'doing',
-    'dollar',
-    'dollars',
-    'domain',
-    'domestic',
-    'dominant',
-    'dominated',
-    'don',
-    'donald',
-    'done',
-    'door',
     'doors',
-    'doorway',
-    'dorothy',
-    'dose',
-    'dot',
-    'double',
-    'doubled',
-    'doubt',
-    'doubtful',
-    'doubts',
-    'douglas',
-    'down',
-    'downstairs',
-    'dozen',
-    'dr',
-    'dr.',
     'draft',
-    'drag',
-    'dragged',
-    'drama',
-    'dramatic',
-    'dramatically',
-    'drank',
-    'draw',
-    'drawing',
-    'drawings',
-    'drawn',
-    'draws',
-    'dreadful',
-    'dream',
-    'dreams',
-    'dress',
     'dressed',
-    'dressing',
-    'drew',
-    'dried',
-    'drift',
-    'drink',
-    'drinking',
-    'drinks',
-    'drive',
-    'driven',
-    'driver',
-    'drivers',
-    'drives',
-    'driving',
-    'drop',
-    'dropped',
     'dropping',
-    'drops',
-    'drove',
-    'drug',
-    'drugs',
-    'drunk',
-    'dry',
-    'du',
-    'dublin',
-    'duck',
-    'due',
-    'due_to',
-    'duke',
-    'dull',
-    'duncan',
-    'duration',
     'durham',
-    'during',
-    'dust',
-    'dutch',
-    'duties',
-    'duty',
-    'dying',
-    'dynamic',
-    'e',
-    'e.',
-    'e.g.',
-    'each',
-    'each_other',
-    'eager',
-    'eagle',
-    'ear',
     'earl',
-    'earlier',
-    'earliest',
-    'early',
-    'earn',
-    'earned',
-    'earnings',
-    'ears',
-    'earth',
-    'ease',
-    'easier',
-    'easily',
-    'east',
-    'easter',
-    'eastern',
-    'easy',
     'eat',
-    'eaten',
-    'eating',
-    'ec',
-    'echo',
-    'economic',
-    'economics',
-    'economies',
-    'economy',
-    'ed',
-    'eddie',
-    'edge',
-    'edges',
-    'edinburgh',
-    'edition',
-    'editor',
     'educated',
-    'education',
-    'educational',
-    'edward',
-    'edwards',
-    'eec',
-    'effect',
-    'effective',
-    'effectively',
-    'effectiveness',
-    'effects',
-    'efficiency',
-    'efficient',
-    'effort',
-    'efforts',
-    'eg',
     'egg',
-    'eggs',
-    'egypt',
-    'eh',
-    'eight',
-    'eighteen',
-    'eighteenth',
-    'eighth',
-    'eighty',
-    'either',
-    'el',
-    'elaborate',
-    'elder',
-    'elderly',
-    'elected',
-    'election',
     'elections',
-    'electoral',
-    'electric',
-    'electrical',
-    'electricity',
-    'electronic',
-    'electronics',
-    'elegant',
-    'element',
-    'elements',
-    'eleven',
-    'eligible',
-    'eliot',
-    'elite',
-    'elizabeth',
-    'else',
     'elsewhere',
-    'embarrassed',
-    'embarrassment',
-    'embassy',
-    'emerge',
-    'emerged',
-    'emergence',
-    'emergency',
-    'emerging',
-    'emily',
-    'emissions',
-    'emma',
-    'emotion',
-    'emotional',
-    'emotions',
-    'emperor',
     'emphasis',
-    'emphasised',
-    'empire',
-    'empirical',
-    'employ',
-    'employed',
-    'employee',
-    'employees',
-    'employer',
-    'employers',
-    'employment',
-    'empty',
-    'enable',
-    'enabled',
-    'enables',
-    'enabling',
     'enclosed',
-    'encounter',
-    'encountered',
-    'encourage',
-    'encouraged',
-    'encouragement',
-    'encouraging',
-    'end',
-    'ended',
-    'ending',
-    'endless',
-    'ends',
-    'enemies',
-    'enemy',
-    'energy',
-    'enforcement',
     'engage',
-    'engaged',
-    'engagement',
-    'engine',
-    'engineer',
-    'engineering',
-    'engineers',
-    'engines',
-    'england',
-    'english',
-    'enhance',
-    'enhanced',
-    'enjoy',
-    'enjoyed',
-    'enjoying',
-    'enormous',
     'enough',
-    'enquiries',
-    'enquiry',
-    'ensure',
-    'ensuring',
-    'enter',
-    'entered',
-    'entering',
-    'enterprise',
-    'enterprises',
-    'entertainment',
-    'enthusiasm',
-    'enthusiastic',
-    'entire',
-    'entirely',
-    'entitled',
     'entity',
-    'entrance',
-    'entries',
-    'entry',
-    'envelope',
-    'environment',
-    'environmental',
-    'environments',
-    'envisaged',
-    'episode',
-    'equal',
-    'equality',
-    'equally',
-    'equation',
-    'equilibrium',
-    'equipment',
     'equipped',
-    'equity',
-    'equivalent',
-    'er',
-    'era',
-    'eric',
-    'erm',
-    'erosion',
-    'error',
-    'errors',
-    'escape',
-    'escaped',
-    'especially',
-    'essay',
-    'essence',
-    'essential',
     'essentially',
-    'essex',
-    'establish',
-    'established',
-    'establishing',
-    'establishment',
-    'estate',
-    'estates',
-    'estimate',
-    'estimated',
-    'estimates',
-    'et_al',
-    'etc',
-    'etc.',
-    'ethnic',
-    'europe',
     'european',
-    'evaluation',
-    'evans',
-    'eve',
-    'even',
-    'even_if',
-    'even_so',
-    'even_though',
-    'even_when',
-    'evening',
-    'evenings',
-    'event',
-    'events',
-    'eventually',
-    'ever',
-    'every',
     'everybody',
-    'everyday',
-    'everyone',
-    'everything',
-    'everywhere',
-    'evidence',
-    'evident',
-    'evidently',
-    'evil',
-    'evolution',
-    'evolved',
-    'exact',
-    'exactly',
-    'examination',
-    'examinations',
-    'examine',
     'examined',
-    'examining',
-    'example',
-    'examples',
-    'excellent',
-    'except',
-    'except_for',
-    'except_that',
-    'exception',
-    'exceptional',
-    'exceptions',
-    'excess',
-    'excessive',
-    'exchange',
-    'excited',
-    'excitement',
     'exciting',
-    'exclude',
-    'excluded',
-    'exclusion',
-    'exclusive',
-    'exclusively',
-    'excuse',
-    'executed',
-    'execution',
-    'executive',
-    'executives',
-    'exercise',
-    'exercised',
-    'exercises',
-    'exhausted',
-    'exhibition',
     'exhibitions',
-    'exist',
-    'existed',
-    'existence',
-    'existing',
-    'exists',
-    'exit',
-    'expand',
-    'expanded',
-    'expanding',
-    'expansion',
-    'expect',
-    'expectation',
-    'expectations',
-    'expected',
-    'expecting',
     'expects',
-    'expenditure',
-    'expense',
-    'expenses',
-    'expensive',
-    'experience',
-    'experienced',
-    'experiences',
-    'experiment',
-    'experimental',
-    'experiments',
-    'expert',
-    'expertise',
-    'experts',
-    'explain',
-    'explained',
     'explaining',
-    'explains',
-    'explanation',
-    'explanations',
-    'explicit',
-    'explicitly',
-    'exploit',
-    'exploitation',
-    'exploration',
-    'explore',
-    'explored',
-    'explosion',
-    'export',
-    'exports',
-    'exposed',
-    'exposure',
     'express',
-    'expressed',
-    'expressing',
-    'expression',
-    'expressions',
-    'extend',
-    'extended',
-    'extending',
-    'extension',
-    'extensive',
-    'extent',
-    'external',
-    'extra',
-    'extract',
-    'extraordinary',
-    'extreme',
     'extremely',
-    'eye',
-    'eyes',
-    'f',
-    'f.',
-    'fa',
-    'fabric',
-    'face',
-    'faced',
-    'faces',
-    'facilities',
-    'facility',
-    'facing',
-    'fact',
-    'factor',
-    'factories',
     'factors',
-    'factory',
-    'facts',
-    'faculty',
-    'faded',
-    'fail',
-    'failed',
-    'failing',
-    'fails',
-    'failure',
-    'faint',
-    'fair',
-    'fairly',
-    'faith',
-    'fall',
-    'fallen',
     'falling',
-    'falls',
-    'false',
-    'fame',
-    'familiar',
-    'families',
-    'family',
-    'famous',
-    'fan',
-    'fancy',
-    'fans',
-    'fantasy',
-    'far',
-    'far_from',
-    'farm',
-    'farmer',
     'farmers',
-    'farming',
-    'farms',
-    'fascinating',
-    'fashion',
-    'fast',
-    'faster',
-    'fat',
-    'fatal',
-    'fate',
-    'father',
-    'fathers',
-    'fault',
-    'favour',
-    'favourable',
-    'favoured',
     'favourite',
-    'fax',
-    'fear',
-    'feared',
-    'fears',
-    'feature',
-    'featured',
-    'features',
-    'feb.',
-    'february',
-    'fed',
-    'federal',
-    'federation',
-    'fee',
-    'feed',
-    'feedback',
     'feeding',
-    'feel',
-    'feeling',
-    'feelings',
-    'feels',
-    'fees',
-    'feet',
-    'fell',
-    'fellow',
-    'felt',
-    'female',
-    'females',
-    'feminist',
-    'fence',
-    'ferry',
-    'fertility',
     'festival',
-    'fetch',
-    'few',
-    'fewer',
-    'fibre',
-    'fiction',
-    'field',
-    'fields',
-    'fierce',
-    'fifteen',
-    'fifth',
-    'fifty',
-    'fig',
-    'fig.',
-    'fight',
-    'fighting',
     'figure',
-    'figures',
-    'file',
-    'files',
-    'fill',
-    'filled',
-    'filling',
-    'film',
-    'films',
-    'filter',
-    'final',
-    'finally',
-    'finance',
-    'financial',
-    'find',
-    'finding',
     'findings',
-    'finds',
-    'fine',
-    'finest',
-    'finger',
-    'fingers',
-    'finish',
-    'finished',
-    'finishing',
-    'fire',
-    'fired',
-    'fires',
-    'firm',
-    'firmly',
-    'firms',
-    'first',
     'firstly',
-    'fiscal',
-    'fish',
-    'fishing',
-    'fit',
-    'fitness',
-    'fits',
-    'fitted',
-    'fitting',
-    'five',
-    'fix',
-    'fixed',
-    'flag',
-    'flames',
-    'flash',
-    'flat',
     'flats',
-    'flavour',
-    'fled',
-    'fleet',
-    'flesh',
-    'flew',
-    'flexibility',
-    'flexible',
-    'flies',
-    'flight',
-    'flights',
-    'floating',
-    'flood',
-    'floor',
-    'floors',
-    'flora',
     'flow',
-    'flower',
-    'flowers',
-    'flows',
-    'fluid',
-    'fly',
-    'flying',
-    'focus',
-    'focused',
-    'folded',
-    'folk',
-    'follow',
-    'followed',
-    'following',
-    'follows',
-    'fond',
     'food',
-    'foods',
-    'fool',
-    'foot',
-    'football',
-    'for',
-    'for_ever',
-    'for_example',
-    'for_instance',
-    'for_long',
-    'force',
-    'forced',
-    'forces',
-    'forcing',
-    'ford',
-    'forecast',
     'forehead',
-    'foreign',
-    'forest',
-    'forests',
-    'forever',
-    'forget',
-    'forgive',
-    'forgot',
-    'forgotten',
-    'form',
-    'formal',
-    'formally',
-    'format',
-    'formation',
-    'formed',
-    'former',
     'formerly',
-    'forming',
-    'forms',
-    'formula',
-    'forth',
-    'forthcoming',
-    'fortnight',
-    'fortunate',
-    'fortunately',
-    'fortune',
-    'forty',
-    'forum',
-    'forward',
-    'forwards',
-    'foster',
-    'fought',
     'found',
-    'foundation',
-    'foundations',
-    'founded',
-    'founder',
-    'four',
-    'fourteen',
-    'fourth',
-    'fox',
-    'fraction',
-    'fragments',
-    'frame',
-    'framework',
-    'france',
-    'francis',
-    'frank',
     'fraud',
-    'fred',
-    'free',
-    'freedom',
-    'freely',
-    'french',
-    'frequency',
-    'frequent',
-    'frequently',
-    'fresh',
-    'freud',
-    'friday',
-    'friend',
-    'friendly',
-    'friends',
-    'friendship',
     'frightened',
-    'from',
-    'from_time_to_time',
-    'front',
-    'frowned',
-    'frozen',
-    'fruit',
-    'frustration',
-    'fuck',
-    'fucking',
-    'fuel',
-    'fulfil',
-    'full',
-    'full-time',
-    'fully',
-    'fun',
     'function',
-    'functional',
-    'functions',
-    'fund',
-    'fundamental',
-    'funded',
-    'funding',
-    'funds',
-    'funeral',
-    'funny',
-    'furious',
-    'furniture',
-    'further',
-    'furthermore',
-    'fusion',
-    'future',
     'futures',
-    'g',
-    'g.',
-    'gabriel',
-    'gain',
-    'gained',
-    'gaining',
-    'gains',
-    'galleries',
-    'gallery',
-    'game',
-    'games',
-    'gang',
-    'gap',
-    'garage',
-    'garden',
     'gardens',
-    'gary',
-    'gas',
-    'gastric',
-    'gate',
-    'gates',
-    'gather',
-    'gathered',
-    'gathering',
-    'gave',
-    'gay',
-    'gaze',
-    'gear',
-    'gender',
-    'gene',
-    'general',
     'generally',
-    'generate',
-    'generated',
-    'generation',
-    'generations',
-    'generous',
-    'genes',
-    'genetic',
-    'gentle',
-    'gentleman',
-    'gentlemen',
-    'gently',
-    'genuine',
-    'genuinely',
-    'geoff',
-    'geoffrey',
     'geographical',
-    'geography',
-    'george',
-    'german',
-    'germans',
-    'germany',
-    'gesture',
-    'get',
-    'gets',
-    'getting',
-    'ghost',
-    'giant',
-    'gift',
-    'gifts',
-    'girl',
-    'girlfriend',
     'girls',
-    'give',
-    'given',
-    'gives',
-    'giving',
-    'glad',
-    'glance',
-    'glanced',
-    'glasgow',
-    'glass',
-    'glasses',
-    'global',
-    'glory',
-    'gloucester',
-    'gloucestershire',
-    'go',
     'goal',
-    'goals',
-    'god',
-    'gods',
-    'goes',
-    'going',
-    'gold',
-    'golden',
-    'golf',
-    'gon',
-    'gone',
-    'good',
-    'goodbye',
-    'goodness',
-    'goods',
-    'gorbachev',
     'gordon',
-    'got',
-    'gothic',
-    'gould',
-    'governing',
-    'government',
-    'governments',
-    'governor',
-    'governors',
-    'grabbed',
-    'grace',
-    'grade',
-    'gradually',
-    'graham',
-    'grain',
-    'grammar',
     'grand',
-    'grandfather',
-    'grandmother',
-    'grant',
-    'granted',
-    'grants',
-    'graphics',
-    'grasp',
-    'grass',
-    'grateful',
-    'grave',
-    'gravel',
-    'gravity',
-    'gray',
-    'great',
-    'greater',
     'greatest',
-    'greatly',
-    'greece',
-    'greek',
-    'green',
-    'greeted',
-    'grew',
-    'grey',
-    'grief',
-    'grin',
-    'grinned',
-    'grip',
-    'gross',
-    'ground',
-    'grounds',
-    'group',
     'groups',
-    'grow',
-    'growing',
-    'grown',
-    'grows',
-    'growth',
-    'guarantee',
-    'guaranteed',
-    'guard',
-    'guardian',
-    'guards',
-    'guess',
-    'guessed',
-    'guest',
-    'guests',
-    'guidance',
     'guide',
-    'guided',
-    'guidelines',
-    'guilt',
-    'guilty',
-    'guinness',
-    'guitar',
-    'gulf',
-    'gun',
-    'guns',
-    'guy',
-    'guys',
-    'h',
-    'h.',
-    'ha',
-    'habit',
     'habits',
-    'had',
-    'hair',
-    'half',
-    'hall',
-    'halt',
-    'ham',
-    'hamilton',
-    'hampshire',
-    'hand',
-    'handed',
-    'handful',
-    'handicap',
-    'handicapped',
-    'handle',
-    'handled',
     'handling',
-    'hands',
-    'handsome',
-    'hang',
-    'hanging',
-    'happen',
-    'happened',
-    'happening',
-    'happens',
-    'happily',
-    'happiness',
-    'happy',
-    'harbour',
-    'hard',
-    'harder',
-    'hardly',
     'hardware',
-    'harm',
-    'harmony',
-    'harold',
-    'harriet',
-    'harris',
-    'harry',
-    'harsh',
-    'harvey',
-    'has',
-    'hat',
-    'hate',
-    'hated',
-    'have',
-    'having',
-    'he',
     'head',
-    'headed',
-    'heading',
-    'headmaster',
-    'headquarters',
-    'heads',
-    'healing',
-    'health',
-    'healthy',
-    'hear',
-    'heard',
-    'hearing',
-    'heart',
-    'hearts',
-    'heat',
-    'heath',
     'heating',
-    'heaven',
-    'heavily',
-    'heavy',
-    'heels',
-    'height',
-    'held',
-    'helen',
-    'hell',
-    'hello',
-    'help',
-    'helped',
-    'helpful',
-    'helping',
-    'helps',
-    'hence',
     'henry',
-    'her',
-    'here',
-    'heritage',
-    'hero',
-    'hers',
-    'herself',
-    'hesitated',
-    'hey',
-    'hidden',
-    'hide',
-    'hiding',
-    'hierarchy',
-    'high',
-    'higher',
-    'highest',
     'highlight',
-    'highlighted',
-    'highly',
-    'hill',
-    'hills',
-    'him',
-    'himself',
-    'hint',
-    'hire',
-    'hired',
-    'his',
-    'historian',
-    'historians',
-    'historic',
-    'historical',
-    'history',
     'hit',
-    'hitherto',
-    'hitler',
-    'hits',
-    'hiv',
-    'hold',
-    'holder',
-    'holders',
-    'holding',
-    'holdings',
-    'holds',
-    'hole',
-    'holes',
-    'holiday',
-    'holidays',
-    'holland',
     'hollywood',
-    'holy',
-    'home',
-    'homes',
-    'hon.',
-    'honest',
-    'honestly',
-    'honey',
-    'hong',
-    'honour',
-    'honours',
-    'hook',
-    'hope',
-    'hoped',
-    'hopefully',
-    'hopes',
     'hoping',
-    'horizon',
-    'horizontal',
-    'horrible',
-    'horror',
-    'horse',
-    'horses',
-    'hospital',
-    'hospitals',
-    'host',
-    'hostile',
-    'hostility',
-    'hot',
-    'hotel',
-    'hotels',
-    'hour',
     'hours',
-    'house',
-    'household',
-    'households',
-    'houses',
-    'housing',
-    'how',
-    'howard',
-    'however',
-    'huge',
-    'hugh',
-    'hughes',
-    'hull',
-    'human',
-    'humanity',
-    'humans',
     'humour',
-    'hundred',
-    'hundreds',
-    'hung',
-    'hungary',
-    'hungry',
-    'hunt',
-    'hunter',
-    'hunting',
-    'hurried',
-    'hurry',
-    'hurt',
-    'husband',
-    'hut',
-    'hydrogen',
-    'hypothesis',
     'i',
-    'i.',
-    'i.e.',
-    'ian',
-    'ibm',
-    'ice',
-    'ici',
-    'idea',
-    'ideal',
-    'ideally',
-    'ideas',
-    'identical',
-    'identification',
-    'identified',
-    'identify',
-    'identifying',
     'identity',
-    'ideological',
-    'ideology',
-    'ie',
-    'if',
-    'ignore',
-    'ignored',
-    'ignoring',
-    'ii',
-    'iii',
-    'ill',
-    'illegal',
-    'illness',
-    'illustrate',
-    'illustrated',
-    'illustration',
     'image',
-    'images',
-    'imagination',
-    'imagine',
-    'imagined',
-    'immediate',
-    'immediately',
-    'immense',
-    'impact',
-    'imperial',
-    'implement',
-    'implementation',
-    'implemented',
-    'implication',
-    'implications',
-    'implied',
     'implies',
-    'imply',
-    'import',
-    'importance',
-    'important',
-    'importantly',
-    'imported',
-    'imports',
-    'impose',
-    'imposed',
-    'impossible',
-    'impressed',
-    'impression',
-    'impressive',
-    'imprisonment',
-    'improve',
     'improved',
-    'improvement',
-    'improvements',
-    'improving',
-    'in',
-    'in_accordance_with',
-    'in_addition',
-    'in_addition_to',
-    'in_case',
-    'in_charge_of',
-    'in_conjunction_with',
-    'in_connection_with',
-    'in_favour_of',
-    'in_front_of',
-    'in_general',
-    'in_line_with',
     'in_order',
-    'in_part',
-    'in_particular',
-    'in_relation_to',
-    'in_respect_of',
-    'in_response_to',
-    'in_short',
-    'in_spite_of',
-    'in_terms_of',
-    'in_the_light_of',
-    'in_touch_with',
-    'in_view_of',
-    'inadequate',
-    'inappropriate',
-    'inc',
-    'incentive',
     'inch',
-    'inches',
-    'incidence',
-    'incident',
-    'incidents',
-    'inclined',
-    'include',
-    'included',
-    'includes',
-    'including',
-    'income',
-    'incomes',
-    'incorporated',
-    'increase',
-    'increased',
-    'increases',
     'increasing',
-    'increasingly',
-    'incredible',
-    'incurred',
-    'indeed',
-    'independence',
-    'independent',
-    'independently',
-    'index',
-    'india',
-    'indian',
-    'indians',
-    'indicate',
-    'indicated',
-    'indicates',
-    'indicating',
     'indication',
-    'indirect',
-    'individual',
-    'individuals',
-    'induced',
-    'industrial',
-    'industries',
-    'industry',
-    'inevitable',
-    'inevitably',
-    'infant',
-    'infected',
-    'infection',
-    'inflation',
-    'influence',
-    'influenced',
     'influences',
-    'influential',
-    'inform',
-    'informal',
-    'information',
-    'informed',
-    'ingredients',
-    'inhabitants',
-    'inherent',
-    'inheritance',
-    'inherited',
-    'initial',
-    'initially',
-    'initiated',
-    'initiative',
-    'initiatives',
     'injured',
-    'injuries',
-    'injury',
-    'inland',
-    'inn',
-    'inner',
-    'innocent',
-    'innovation',
-    'input',
-    'inquiry',
-    'insects',
-    'inside',
-    'insight',
-    'insist',
-    'insisted',
-    'inspection',
     'inspector',
-    'inspiration',
-    'inspired',
-    'installation',
-    'installed',
-    'instance',
-    'instances',
-    'instant',
-    'instantly',
-    'instead',
-    'instead_of',
-    'institute',
-    'institution',
-    'institutional',
-    'institutions',
-    'instructed',
     'instruction',
-    'instructions',
-    'instrument',
-    'instruments',
-    'insufficient',
-    'insurance',
-    'intact',
-    'integral',
-    'integrated',
-    'integration',
-    'integrity',
-    'intel',
-    'intellectual',
-    'intelligence',
-    'intelligent',
-    'intend',
     'intended',
-    'intense',
-    'intensity',
-    'intensive',
-    'intent',
-    'intention',
-    'intentions',
-    'interaction',
-    'interest',
-    'interested',
-    'interesting',
-    'interests',
-    'interface',
-    'interference',
-    'interim',
-    'interior',
     'intermediate',
-    'internal',
-    'international',
-    'interpret',
-    'interpretation',
-    'interpreted',
-    'interrupted',
-    'interval',
-    'intervals',
-    'intervention',
-    'interview',
-    'interviewed',
-    'interviews',
-    'intimate',
-    'into',
-    'introduce',
     'introduced',
-    'introducing',
-    'introduction',
-    'invariably',
-    'invasion',
-    'invented',
-    'invest',
-    'invested',
-    'investigate',
-    'investigated',
-    'investigating',
-    'investigation',
-    'investigations',
-    'investment',
-    'investments',
-    'investors',
     'invisible',
-    'invitation',
-    'invite',
-    'invited',
-    'involve',
-    'involved',
-    'involvement',
-    'involves',
-    'involving',
-    'ipswich',
-    'ira',
-    'iran',
-    'iraq',
-    'iraqi',
-    'ireland',
-    'irish',
     'iron',
-    'irrelevant',
-    'is',
-    'isabel',
-    'islamic',
-    'island',
-    'islands',
-    'isle',
-    'isolated',
-    'isolation',
-    'israel',
-    'israeli',
-    'issue',
-    'issued',
-    'issues',
-    'it',
     'italian',
-    'italy',
-    'item',
-    'items',
-    'its',
-    'itself',
-    'iv',
-    'j',
-    'j.',
-    'jack',
-    'jacket',
-    'jackson',
-    'jail',
-    'james',
-    'jan',
-    'jan.',
     'jane',
-    'january',
-    'japan',
-    'japanese',
-    'jazz',
-    'jean',
-    'jeans',
-    'jenny',
-    'jesus',
-    'jet',
-    'jewellery',
-    'jewish',
-    'jews',
-    'jim',
-    'jimmy',
-    'joan',
     'job',
-    'jobs',
-    'joe',
-    'john',
-    'johnny',
-    'johnson',
-    'join',
-    'joined',
-    'joining',
-    'joint',
-    'joke',
-    'jokes',
-    'jonathan',
-    'jones',
-    'jordan',
-    'joseph',
     'journal',
-    'journalist',
-    'journalists',
-    'journey',
-    'joy',
-    'joyce',
-    'judge',
-    'judged',
-    'judgement',
-    'judges',
-    'judgment',
-    'judicial',
-    'juice',
-    'julia',
-    'julie',
-    'juliet',
     'july',
-    'jump',
-    'jumped',
-    'junction',
-    'june',
-    'junior',
-    'jurisdiction',
-    'jury',
-    'just',
-    'just_about',
-    'justice',
-    'justification',
-    'justified',
-    'justify',
-    'k',
-    'karen',
     'kate',
-    'keen',
-    'keep',
-    'keeper',
-    'keeping',
-    'keeps',
-    'keith',
-    'kelly',
-    'ken',
-    'kennedy',
-    'kenneth',
-    'kent',
-    'kept',
-    'kevin',
-    'key',
-    'keys',
     'kick',
-    'kicked',
-    'kid',
-    'kids',
-    'kill',
-    'killed',
-    'killer',
-    'killing',
-    'kim',
-    'kind',
-    'kindly',
-    'kinds',
-    'king',
-    'kingdom',
-    'kings',
-    'kinnock',
     'kiss',
-    'kissed',
-    'kit',
-    'kitchen',
-    'km',
-    'knee',
-    'knees',
-    'knew',
-    'knife',
-    'knitting',
-    'knock',
-    'knocked',
-    'know',
-    'knowing',
-    'knowledge',
-    'known',
     'knows',
-    'kong',
-    'korea',
-    'korean',
-    'kuwait',
-    'l',
-    'la',
-    'label',
-    'labelled',
-    'labels',
-    'laboratory',
-    'labour',
-    'lace',
-    'lack',
-    'lacking',
-    'lad',
     'ladder',
-    'ladies',
-    'lads',
-    'lady',
-    'laid',
-    'lake',
-    'lakes',
-    'lamb',
-    'lamont',
-    'lamp',
-    'lancashire',
-    'lancaster',
-    'land',
-    'landed',
-    'landing',
-    'landlord',
     'lands',
-    'landscape',
-    'lane',
-    'language',
-    'languages',
-    'lap',
-    'large',
-    'largely',
-    'larger',
-    'largest',
-    'last',
-    'lasted',
-    'lasting',
-    'late',
-    'later',
-    'latest',
     'latin',
-    'latter',
-    'laugh',
-    'laughed',
-    'laughing',
-    'laughter',
-    'launch',
-    'launched',
-    'laura',
-    'law',
-    'lawrence',
-    'laws',
-    'lawyer',
-    'lawyers',
-    'lay',
-    'layer',
     'layers',
-    'laying',
-    'layout',
-    'le',
-    'lead',
-    'leader',
-    'leaders',
-    'leadership',
-    'leading',
-    'leads',
-    'leaf',
-    'leaflet',
-    'league',
-    'lean',
-    'leaned',
-    'leaning',
     'learn',
-    'learned',
-    'learning',
-    'learnt',
-    'lease',
-    'least',
-    'leather',
-    'leave',
-    'leaves',
-    'leaving',
-    'lecture',
-    'lectures',
-    'led',
-    'lee',
-    'leeds',
-    'left',
     'leg',
-    'legal',
-    'legend',
-    'legislation',
-    'legislative',
-    'legitimate',
-    'legs',
-    'leicester',
-    'leisure',
-    'lemon',
-    'lend',
-    'lending',
-    'length',
-    'lengths',
-    'les',
-    'less',
     'less_than',
-    'lesser',
-    'lesson',
-    'lessons',
-    'let',
-    'let\'s',
-    'letter',
-    'letters',
-    'letting',
-    'level',
-    'levels',
-    'lewis',
-    'liability',
-    'liable',
-    'liberal',
-    'liberation',
     'liberty',
-    'libraries',
-    'library',
-    'licence',
-    'licensing',
-    'lie',
-    'lies',
-    'life',
-    'lifespan',
-    'lifetime',
-    'lift',
-    'lifted',
-    'lifting',
-    'light',
-    'lighting',
-    'lightly',
     'lights',
-    'like',
-    'liked',
-    'likelihood',
-    'likely',
-    'likes',
-    'likewise',
-    'lily',
-    'limit',
-    'limitations',
-    'limited',
-    'limits',
-    'linda',
-    'line',
-    'linear',
-    'lined',
     'lines',
-    'linguistic',
-    'link',
-    'linked',
-    'linking',
-    'links',
-    'lion',
-    'lip',
-    'lips',
-    'liquid',
-    'lisa',
-    'list',
-    'listed',
-    'listen',
-    'listened',
-    'listening',
     'lists',
-    'lit',
-    'literally',
-    'literary',
-    'literature',
-    'little',
-    'live',
-    'lived',
-    'lively',
-    'liver',
-    'liverpool',
-    'lives',
-    'living',
-    'liz',
-    'lloyd',
-    'load',
     'loaded',
-    'loads',
-    'loan',
-    'loans',
-    'local',
-    'locally',
-    'located',
-    'location',
-    'locations',
-    'loch',
-    'lock',
-    'locked',
-    'lodge',
-    'log',
-    'logic',
-    'logical',
     'london',
-    'lonely',
-    'long',
-    'long-term',
-    'longer',
-    'look',
-    'looked',
-    'looking',
-    'looks',
-    'loose',
-    'lord',
-    'lords',
-    'lorry',
-    'los',
-    'lose',
-    'losing',
     'loss',
-    'losses',
-    'lost',
-    'lot',
-    'lots',
-    'loud',
-    'louis',
-    'louise',
-    'lounge',
-    'love',
-    'loved',
-    'lovely',
-    'lover',
-    'lovers',
-    'loves',
-    'loving',
     'low',
-    'lower',
-    'lowered',
-    'lowest',
-    'loyal',
-    'loyalty',
-    'ltd',
-    'ltd.',
-    'luck',
-    'lucky',
-    'lucy',
-    'luke',
-    'lump',
-    'lunch',
-    'luxury',
-    'lying',
     'm',
-    'm.',
-    'ma',
-    'maastricht',
-    'machine',
-    'machinery',
-    'machines',
-    'mad',
-    'made',
-    'magazine',
-    'magazines',
-    'maggie',
-    'magic',
-    'magistrates',
-    'magnetic',
-    'magnificent',
     'mail',
-    'main',
-    'mainly',
-    'mainstream',
-    'maintain',
-    'maintained',
-    'maintaining',
-    'maintenance',
-    'major',
-    'majority',
-    'make',
-    'make-up',
-    'makers',
-    'makes',
-    'making',
-    'malcolm',
     'male',
-    'males',
-    'man',
-    'manage',
-    'managed',
-    'management',
-    'manager',
-    'managerial',
-    'managers',
-    'managing',
-    'manchester',
-    'manner',
-    'manor',
-    'manual',
-    'manufacture',
-    'manufacturer',
     'manufacturers',
-    'manufacturing',
-    'many',
-    'map',
-    'maps',
-    'marble',
-    'march',
-    'margaret',
-    'margin',
-    'marginal',
-    'maria',
-    'marie',
-    'marine',
-    'mark',
-    'marked',
-    'market',
     'marketing',
-    'markets',
-    'marking',
-    'marks',
-    'marriage',
-    'married',
-    'marry',
-    'marshall',
-    'martin',
-    'marvellous',
-    'marx',
-    'marxist',
-    'mary',
-    'mask',
-    'mass',
-    'masses',
     'massive',
-    'master',
-    'masters',
-    'match',
-    'matched',
-    'matches',
-    'matching',
-    'mate',
-    'material',
-    'materials',
-    'mathematical',
-    'mathematics',
-    'matrix',
-    'matter',
-    'matters',
-    'matthew',
     'mature',
-    'maturity',
-    'max',
-    'maximum',
-    'maxwell',
-    'may',
-    'maybe',
-    'mayor',
-    'me',
-    'meal',
-    'meals',
-    'mean',
-    'meaning',
-    'meanings',
-    'means',
-    'meant',
     'meantime',
-    'meanwhile',
-    'measure',
-    'measured',
-    'measurement',
-    'measurements',
-    'measures',
-    'measuring',
-    'meat',
-    'mechanical',
-    'mechanism',
-    'mechanisms',
-    'media',
-    'medical',
-    'medicine',
-    'medieval',
     'mediterranean',
-    'medium',
-    'meet',
-    'meeting',
-    'meetings',
-    'meets',
-    'member',
-    'members',
-    'membership',
-    'memorial',
-    'memories',
-    'memory',
-    'men',
-    'mental',
-    'mentally',
-    'mention',
     'mentioned',
-    'menu',
-    'merchant',
-    'mere',
-    'merely',
-    'merger',
-    'merit',
-    'mess',
-    'message',
-    'messages',
-    'met',
-    'metal',
-    'method',
-    'methods',
-    'metres',
-    'metropolitan',
     'mexico',
-    'mhm',
-    'michael',
-    'mick',
-    'microsoft',
-    'mid',
-    'middle',
-    'middle-class',
-    'middlesbrough',
-    'midland',
-    'midlands',
-    'midnight',
-    'might',
-    'migration',
-    'mike',
-    'mild',
     'mile',
-    'miles',
-    'military',
-    'milk',
-    'mill',
-    'miller',
-    'million',
-    'millions',
-    'mills',
-    'milton',
-    'mind',
-    'minds',
-    'mine',
-    'mineral',
-    'miners',
-    'mines',
     'minimal',
-    'minimum',
-    'mining',
-    'minister',
-    'ministers',
-    'ministry',
-    'minor',
-    'minority',
-    'minus',
-    'minute',
-    'minutes',
-    'mirror',
-    'miserable',
-    'misery',
-    'misleading',
-    'miss',
     'missed',
-    'missing',
-    'mission',
-    'mistake',
-    'mistakes',
-    'mix',
-    'mixed',
-    'mixture',
-    'mm',
-    'mobile',
-    'mobility',
-    'mode',
-    'model',
-    'models',
-    'moderate',
-    'modern',
     'modes',
-    'modest',
-    'modified',
-    'module',
-    'modules',
-    'molecular',
-    'molecules',
-    'moment',
-    'moments',
-    'monday',
-    'monetary',
-    'money',
-    'monitor',
-    'monitoring',
-    'monopoly',
-    'monster',
     'month',
-    'monthly',
-    'months',
-    'mood',
-    'moon',
-    'moore',
-    'moral',
-    'morality',
-    'more',
-    'more_than',
-    'moreover',
-    'morgan',
-    'morning',
-    'morris',
-    'mortality',
-    'mortgage',
     'moscow',
-    'most',
-    'mostly',
-    'mother',
-    'mothers',
-    'motion',
-    'motivation',
-    'motor',
-    'mount',
-    'mountain',
-    'mountains',
-    'mounted',
-    'mouse',
-    'mouth',
-    'move',
-    'moved',
     'movement',
-    'movements',
-    'moves',
-    'movie',
-    'moving',
-    'mozart',
-    'mp',
-    'mps',
-    'mr',
-    'mr.',
-    'mrs',
-    'mrs.',
-    'ms',
-    'much',
-    'mud',
-    'multiple',
     'mum',
-    'mummy',
-    'murder',
-    'murdered',
-    'murmured',
-    'murray',
-    'muscle',
-    'muscles',
-    'museum',
-    'museums',
-    'music',
-    'musical',
-    'musicians',
-    'must',
-    'muttered',
-    'mutual',
     'my',
-    'myself',
-    'mysterious',
-    'mystery',
-    'myth',
-    'n',
-    'n\'t',
-    'na',
-    'nails',
-    'naked',
-    'name',
-    'named',
-    'namely',
-    'names',
-    'narrative',
-    'narrow',
     'nasty',
-    'nation',
-    'national',
-    'nationalist',
-    'nations',
-    'native',
-    'nato',
-    'natural',
-    'naturally',
-    'nature',
-    'naval',
-    'navy',
-    'near',
-    'nearby',
-    'nearer',
-    'nearest',
     'nearly',
-    'neat',
-    'neatly',
-    'necessarily',
-    'necessary',
-    'necessity',
-    'neck',
-    'need',
-    'needed',
-    'needle',
-    'needs',
-    'negative',
-    'neglect',
-    'neglected',
-    'negligence',
-    'negotiate',
     'negotiated',
-    'negotiating',
-    'negotiation',
-    'negotiations',
-    'neighbour',
-    'neighbourhood',
-    'neighbouring',
-    'neighbours',
-    'neil',
-    'neither',
-    'nerve',
-    'nerves',
-    'nervous',
-    'nest',
-    'net',
-    'netherlands',
     'network',
-    'networks',
-    'neutral',
-    'never',
-    'nevertheless',
-    'new',
-    'newcastle',
-    'newly',
-    'news',
-    'newspaper',
-    'newspapers',
-    'newton',
-    'next',
-    'next_to',
-    'nhs',
-    'nice',
     'nicholas',
-    'nick',
-    'nigel',
-    'night',
-    'nightmare',
-    'nights',
-    'nine',
-    'nineteen',
-    'nineteenth',
-    'ninety',
-    'no',
-    'no-one',
-    'no.',
-    'no_doubt',
-    'no_longer',
-    'no_one',
     'noble',
-    'nobody',
-    'nodded',
-    'noise',
-    'none',
-    'nonetheless',
-    'nonsense',
-    'nor',
-    'norfolk',
-    'normal',
-    'normally',
-    'norman',
-    'north',
-    'north-east',
-    'northern',
-    'norway',
     'norwich',
-    'nose',
-    'not',
-    'notable',
-    'notably',
-    'note',
-    'noted',
-    'notes',
-    'nothing',
-    'notice',
-    'noticed',
-    'notion',
-    'nottingham',
-    'nov.',
-    'novel',
-    'novels',
     'november',
-    'now',
-    'now_that',
-    'nowadays',
-    'nowhere',
-    'nt',
-    'nuclear',
-    'number',
-    'numbers',
-    'numerous',
-    'nurse',
-    'nursery',
-    'nurses',
-    'nursing',
-    'o',
-    'o\'clock',
     'oak',
-    'object',
-    'objection',
-    'objections',
-    'objective',
-    'objectives',
-    'objects',
-    'obligation',
-    'obligations',
-    'obliged',
-    'obscure',
-    'observation',
-    'observations',
-    'observe',
-    'observed',
-    'observer',
     'observers',
-    'obtain',
-    'obtained',
-    'obtaining',
-    'obvious',
-    'obviously',
-    'occasion',
-    'occasional',
-    'occasionally',
-    'occasions',
-    'occupation',
-    'occupational',
-    'occupied',
-    'occur',
-    'occurred',
-    'occurring',
     'occurs',
-    'ocean',
-    'oct.',
-    'october',
-    'odd',
-    'odds',
-    'of',
-    'of_course',
-    'off',
-    'offence',
-    'offences',
-    'offenders',
-    'offensive',
-    'offer',
-    'offered',
-    'offering',
     'offers',
-    'office',
-    'officer',
-    'officers',
-    'offices',
-    'official',
-    'officially',
-    'officials',
-    'often',
-    'oh',
-    'oil',
-    'ok',
-    'okay',
-    'old',
-    'old-fashioned',
-    'older',
     'oldest',
-    'oliver',
-    'olympic',
-    'omitted',
-    'on',
-    'on_behalf_of',
-    'on_board',
-    'on_the_part_of',
-    'on_to',
-    'on_top_of',
-    'once',
-    'once_again',
-    'once_more',
-    'one',
-    'one_another',
-    'ones',
     'only',
-    'onto',
-    'onwards',
-    'ooh',
-    'open',
-    'opened',
-    'opening',
-    'openly',
-    'opens',
-    'opera',
-    'operate',
-    'operated',
-    'operates',
-    'operating',
-    'operation',
-    'operational',
     'operations',
-    'operator',
-    'operators',
-    'opinion',
-    'opinions',
-    'opponent',
-    'opponents',
-    'opportunities',
-    'opportunity',
-    'opposed',
-    'opposite',
-    'opposition',
-    'optimistic',
-    'option',
-    'options',
-    'or',
     'oral',
-    'orange',
-    'orchestra',
-    'order',
-    'ordered',
-    'orders',
-    'ordinary',
-    'organ',
-    'organic',
-    'organisation',
-    'organisations',
-    'organise',
-    'organised',
-    'organization',
-    'organizations',
-    'organized',
     'origin',
-    'original',
-    'originally',
-    'origins',
-    'orthodox',
-    'other',
-    'other_than',
-    'others',
-    'otherwise',
-    'ought',
-    'our',
-    'ours',
-    'ourselves',
-    'out',
-    'out_of',
-    'outcome',
     'outer',
-    'outline',
-    'outlined',
-    'outlook',
-    'output',
-    'outside',
-    'outstanding',
-    'oven',
-    'over',
-    'over_there',
-    'overall',
-    'overcome',
-    'overhead',
-    'overnight',
-    'overseas',
-    'overwhelming',
     'owe',
-    'owed',
-    'owen',
-    'own',
-    'owned',
-    'owner',
-    'owners',
-    'ownership',
-    'oxford',
-    'oxfordshire',
-    'oxygen',
-    'ozone',
-    'p',
-    'p.',
-    'pace',
-    'pacific',
     'pack',
-    'package',
-    'packages',
-    'packed',
-    'packet',
-    'page',
-    'pages',
-    'paid',
-    'pain',
-    'painful',
-    'paint',
-    'painted',
-    'painter',
-    'painting',
-    'paintings',
-    'pair',
     'pairs',
-    'pakistan',
-    'palace',
-    'pale',
-    'palm',
-    'pan',
-    'panel',
-    'panic',
-    'paper',
-    'papers',
-    'paragraph',
-    'parallel',
-    'pardon',
-    'parent',
-    'parental',
-    'parents',
     'paris',
-    'parish',
-    'park',
-    'parked',
-    'parker',
-    'parking',
-    'parks',
-    'parliament',
-    'parliamentary',
-    'part',
-    'part-time',
-    'partial',
-    'partially',
-    'participants',
-    'participate',
-    'participation',
     'particles',
-    'particular',
-    'particularly',
-    'parties',
-    'partly',
-    'partner',
-    'partners',
-    'partnership',
-    'parts',
-    'party',
-    'pass',
-    'passage',
-    'passed',
-    'passenger',
-    'passengers',
-    'passes',
     'passing',
-    'passion',
-    'passive',
-    'past',
-    'pat',
-    'patch',
-    'path',
-    'paths',
-    'patience',
-    'patient',
-    'patients',
-    'patrick',
-    'pattern',
-    'patterns',
-    'paul',
-    'pause',
     'paused',
-    'pavement',
-    'pay',
-    'payable',
-    'paying',
-    'payment',
-    'payments',
-    'pays',
-    'pc',
-    'peace',
-    'peaceful',
-    'peak',
-    'peasant',
-    'peasants',
-    'peculiar',
-    'pen',
     'penalty',
-    'pence',
-    'pencil',
-    'penny',
-    'pension',
-    'pensioners',
-    'pensions',
-    'people',
-    'peoples',
-    'per',
-    'per_cent',
-    'perceived',
-    'percent',
-    'percentage',
-    'perception',
-    'perfect',
     'perfectly',
-    'perform',
-    'performance',
-    'performances',
-    'performed',
-    'performing',
-    'perhaps',
-    'period',
-    'periods',
-    'permanent',
-    'permanently',
-    'permission',
-    'permit',
-    'permitted',
-    'persistent',
-    'person',
     'personal',
-    'personality',
-    'personally',
-    'personnel',
-    'persons',
-    'perspective',
-    'persuade',
-    'persuaded',
-    'pet',
-    'pete',
-    'peter',
-    'petition',
-    'petrol',
-    'ph',
-    'phase',
-    'phenomena',
     'phenomenon',
-    'phil',
-    'philip',
-    'phillips',
-    'philosophical',
-    'philosophy',
-    'phone',
-    'phoned',
-    'photo',
-    'photograph',
-    'photographs',
-    'phrase',
-    'phrases',
-    'physical',
-    'physically',
-    'physics',
     'piano',
-    'pick',
-    'picked',
-    'picking',
-    'picture',
-    'pictures',
-    'piece',
-    'pieces',
-    'pig',
-    'pile',
-    'pilot',
-    'pin',
-    'pink',
-    'pint',
-    'pipe',
-    'pit',
     'pitch',
-    'pity',
-    'place',
-    'placed',
-    'places',
-    'placing',
-    'plain',
-    'plaintiff',
-    'plan',
-    'plane',
-    'planet',
-    'planned',
-    'planning',
-    'plans',
-    'plant',
-    'planted',
     'planting',
-    'plants',
-    'plastic',
-    'plate',
-    'plates',
-    'platform',
-    'play',
-    'played',
-    'player',
-    'players',
-    'playing',
-    'plays',
-    'plc',
-    'pleasant',
-    'please',
-    'pleased',
     'pleasure',
-    'plenty',
-    'plot',
-    'plus',
-    'pm',
-    'pocket',
-    'pockets',
-    'poem',
-    'poems',
-    'poet',
-    'poetry',
-    'point',
-    'pointed',
-    'pointing',
-    'points',
-    'poland',
     'pole',
-    'poles',
-    'police',
-    'policeman',
-    'policemen',
-    'policies',
-    'policy',
-    'polish',
-    'polite',
-    'political',
-    'politically',
-    'politicians',
-    'politics',
-    'poll',
-    'pollution',
-    'polytechnic',
     'pond',
-    'pool',
-    'poor',
-    'pop',
-    'pope',
-    'popular',
-    'popularity',
-    'population',
-    'populations',
-    'port',
-    'porter',
-    'portfolio',
-    'portrait',
-    'posed',
-    'position',
-    'positions',
     'positive',
-    'positively',
-    'possess',
-    'possessed',
-    'possession',
-    'possibilities',
-    'possibility',
-    'possible',
-    'possibly',
-    'post',
-    'post-war',
-    'posts',
-    'pot',
-    'potatoes',
-    'potential',
-    'potentially',
     'pound',
-    'pounds',
-    'pour',
-    'poured',
-    'poverty',
-    'powder',
-    'power',
-    'powerful',
-    'powers',
-    'pp.',
-    'practical',
-    'practically',
-    'practice',
-    'practices',
-    'practise',
-    'practised',
     'practitioners',
-    'praise',
-    'pray',
-    'prayer',
-    'preceding',
-    'precious',
-    'precise',
-    'precisely',
-    'precision',
-    'predict',
-    'predicted',
-    'predominantly',
-    'prefer',
-    'preference',
-    'preferred',
-    'pregnancy',
     'pregnant',
-    'prejudice',
-    'preliminary',
-    'premier',
-    'premises',
-    'premium',
-    'preparation',
-    'prepare',
-    'prepared',
-    'preparing',
-    'prescribed',
-    'presence',
-    'present',
-    'presentation',
-    'presented',
-    'presenting',
     'presents',
-    'preserve',
-    'preserved',
-    'presidency',
-    'president',
-    'presidential',
-    'press',
-    'pressed',
-    'pressing',
-    'pressure',
-    'pressures',
-    'preston',
-    'presumably',
-    'pretend',
-    'pretty',
-    'prevent',
     'prevented',
-    'preventing',
-    'prevention',
-    'previous',
-    'previously',
-    'prey',
-    'price',
-    'prices',
-    'pride',
-    'priest',
-    'primarily',
-    'primary',
-    'prime',
-    'primitive',
-    'prince',
-    'princess',
     'principal',
-    'principle',
-    'principles',
-    'print',
-    'printed',
-    'printer',
-    'printing',
-    'prints',
-    'prior',
-    'prior_to',
-    'priorities',
-    'priority',
-    'prison',
-    'prisoner',
-    'prisoners',
-    'private',
     'privately',
-    'privatisation',
-    'privilege',
-    'prize',
-    'probability',
-    'probable',
-    'probably',
-    'probe',
-    'problem',
-    'problems',
-    'procedure',
-    'procedures',
-    'proceed',
-    'proceedings',
-    'proceeds',
-    'process',
     'processes',
-    'processing',
-    'processor',
-    'produce',
-    'produced',
-    'producer',
-    'producers',
-    'produces',
-    'producing',
-    'product',
-    'production',
-    'productive',
-    'productivity',
-    'products',
-    'profession',
-    'professional',
     'professionals',
-    'professor',
-    'profile',
-    'profit',
-    'profitable',
-    'profits',
-    'profound',
-    'program',
-    'programme',
-    'programmes',
-    'programming',
-    'programs',
-    'progress',
-    'progressive',
-    'project',
-    'projects',
     'prominent',
-    'promise',
-    'promised',
-    'promises',
-    'promising',
-    'promote',
-    'promoted',
-    'promoting',
-    'promotion',
-    'prompted',
-    'pronounced',
-    'proof',
-    'proper',
-    'properly',
-    'properties',
-    'property',
     'proportion',
-    'proportions',
-    'proposal',
-    'proposals',
-    'propose',
-    'proposed',
-    'proposition',
-    'prosecution',
-    'prospect',
-    'prospective',
-    'prospects',
-    'protect',
-    'protected',
-    'protecting',
-    'protection',
-    'protective',
     'protein',
-    'proteins',
-    'protest',
-    'protestant',
-    'protested',
-    'protests',
-    'proud',
-    'prove',
-    'proved',
-    'provide',
-    'provided',
-    'provides',
-    'providing',
-    'province',
-    'provincial',
-    'provision',
     'provisions',
-    'psychological',
-    'psychology',
-    'pub',
-    'public',
-    'publication',
-    'publications',
-    'publicity',
-    'publicly',
-    'publish',
-    'published',
-    'publisher',
-    'publishers',
-    'publishing',
-    'pubs',
-    'pull',
     'pulled',
-    'pulling',
-    'pump',
-    'punch',
-    'punishment',
-    'pupil',
-    'pupils',
-    'purchase',
-    'purchased',
-    'purchaser',
-    'purchasing',
-    'pure',
-    'purely',
-    'purple',
-    'purpose',
-    'purposes',
     'pursue',
-    'pursued',
-    'pursuit',
-    'push',
-    'pushed',
-    'pushing',
-    'put',
-    'puts',
-    'putting',
-    'puzzled',
-    'q',
-    'q.v.',
-    'qualification',
-    'qualifications',
-    'qualified',
-    'qualify',
     'qualities',
-    'quality',
-    'quantities',
-    'quantity',
-    'quarter',
-    'quarters',
-    'queen',
-    'question',
-    'questioned',
-    'questioning',
-    'questionnaire',
-    'questions',
-    'quick',
-    'quickly',
-    'quid',
-    'quiet',
     'quietly',
-    'quite',
-    'quote',
-    'quoted',
-    'r',
-    'r.',
-    'rabbit',
-    'race',
-    'races',
-    'rachel',
-    'racial',
-    'racing',
-    'radiation',
-    'radical',
-    'radio',
-    'raf',
     'rage',
-    'raid',
-    'rail',
-    'railway',
-    'railways',
-    'rain',
-    'raise',
-    'raised',
-    'raises',
-    'raising',
-    'rally',
-    'ralph',
-    'ran',
-    'random',
-    'rang',
-    'range',
     'rangers',
-    'ranging',
-    'rank',
-    'ranks',
-    'rape',
-    'rapid',
-    'rapidly',
-    'rare',
-    'rarely',
-    'rate',
-    'rates',
-    'rather',
-    'rather_than',
-    'ratio',
-    'rational',
-    'rats',
     'raw',
-    'ray',
-    're',
-    'reach',
-    'reached',
-    'reaches',
-    'reaching',
-    'react',
-    'reaction',
-    'reactions',
-    'read',
-    'reader',
-    'readers',
-    'readily',
-    'reading',
-    'ready',
     'real',
-    'realise',
-    'realised',
-    'realistic',
-    'reality',
-    'realize',
-    'realized',
-    'really',
-    'rear',
-    'reason',
-    'reasonable',
-    'reasonably',
-    'reasoning',
-    'reasons',
-    'rebels',
-    'recall',
     'recalled',
-    'receive',
-    'received',
-    'receiver',
-    'receives',
-    'receiving',
-    'recent',
-    'recently',
-    'reception',
-    'recession',
-    'recipe',
-    'reckon',
-    'recognise',
-    'recognised',
-    'recognition',
-    'recognize',
     'recognized',
-    'recommend',
-    'recommendation',
-    'recommendations',
-    'recommended',
-    'record',
-    'recorded',
-    'recording',
-    'records',
-    'recover',
-    'recovered',
-    'recovery',
-    'recruitment',
-    'red',
-    'reduce',
-    'reduced',
     'reducing',
-    'reduction',
-    'reductions',
-    'redundant',
-    'ref',
-    'refer',
-    'referee',
-    'reference',
-    'references',
-    'referendum',
-    'referred',
-    'referring',
-    'refers',
-    'reflect',
-    'reflected',
-    'reflecting',
     'reflection',
-    'reflects',
-    'reform',
-    'reforms',
-    'refugees',
-    'refusal',
-    'refuse',
-    'refused',
-    'refusing',
-    'regard',
-    'regarded',
-    'regarding',
-    'regardless',
-    'regime',
-    'regiment',
-    'region',
     'regional',
-    'regions',
-    'register',
-    'registered',
-    'registration',
-    'regret',
-    'regular',
-    'regularly',
-    'regulation',
-    'regulations',
-    'regulatory',
-    'reign',
-    'reinforced',
-    'reject',
-    'rejected',
-    'rejection',
     'relate',
-    'related',
-    'relates',
-    'relating',
-    'relation',
-    'relations',
-    'relationship',
-    'relationships',
-    'relative',
-    'relatively',
-    'relatives',
-    'relax',
-    'relaxed',
-    'release',
-    'released',
-    'relevance',
     'relevant',
-    'reliable',
-    'relied',
-    'relief',
-    'relieved',
-    'religion',
-    'religious',
-    'reluctant',
-    'rely',
-    'remain',
-    'remainder',
-    'remained',
-    'remaining',
-    'remains',
-    'remark',
-    'remarkable',
     'remarkably',
-    'remarked',
-    'remarks',
-    'remedy',
-    'remember',
-    'remembered',
-    'remembering',
-    'remind',
-    'reminded',
-    'remote',
-    'removal',
-    'remove',
-    'removed',
-    'removing',
-    'renewed',
-    'rent',
     'repair',
-    'repairs',
-    'repeat',
-    'repeated',
-    'repeatedly',
-    'replace',
-    'replaced',
-    'replacement',
-    'replacing',
-    'replied',
-    'reply',
-    'report',
-    'reported',
-    'reportedly',
-    'reporter',
-    'reporting',
     'reports',
-    'represent',
-    'representation',
-    'representations',
-    'representative',
-    'representatives',
-    'represented',
-    'representing',
-    'represents',
-    'republic',
-    'republican',
-    'republics',
-    'reputation',
-    'request',
-    'requested',
-    'requests',
     'require',
-    'required',
-    'requirement',
-    'requirements',
-    'requires',
-    'requiring',
-    'rescue',
-    'research',
-    'researchers',
-    'reserve',
-    'reserved',
-    'reserves',
-    'residence',
-    'resident',
-    'residential',
-    'residents',
     'resignation',
-    'resigned',
-    'resist',
-    'resistance',
-    'resolution',
-    'resolve',
-    'resolved',
-    'resort',
-    'resource',
-    'resources',
-    'respect',
-    'respectable',
-    'respected',
-    'respective',
-    'respectively',
-    'respects',
     'respond',
-    'responded',
-    'response',
-    'responses',
-    'responsibilities',
-    'responsibility',
-    'responsible',
-    'rest',
-    'restaurant',
-    'restaurants',
-    'resting',
-    'restoration',
-    'restore',
-    'restored',
-    'restricted',
-    'restriction',
     'restrictions',
-    'result',
-    'resulted',
-    'resulting',
-    'results',
-    'retail',
-    'retain',
-    'retained',
-    'retired',
-    'retirement',
-    'retreat',
-    'return',
-    'returned',
-    'returning',
-    'returns',
-    'reveal',
     'revealed',
-    'revealing',
-    'reveals',
-    'revenue',
-    'revenues',
-    'reverse',
-    'review',
-    'reviewed',
-    'reviews',
-    'revised',
-    'revival',
-    'revolution',
-    'revolutionary',
-    'reward',
-    'rewards',
-    'rhythm',
     'rice',
-    'rich',
-    'richard',
-    'rid',
-    'ride',
-    'ridge',
-    'ridiculous',
-    'riding',
-    'right',
-    'rightly',
-    'rights',
-    'rigid',
-    'ring',
-    'ringing',
-    'rings',
-    'rise',
     'risen',
-    'rises',
-    'rising',
-    'risk',
-    'risks',
-    'ritual',
-    'rival',
-    'rivals',
-    'river',
-    'rivers',
-    'road',
-    'roads',
-    'rob',
-    'robert',
-    'roberts',
-    'robin',
     'robinson',
-    'robyn',
-    'rock',
-    'rocks',
-    'rod',
-    'roger',
-    'role',
-    'roles',
-    'roll',
-    'rolled',
-    'rolling',
-    'rolls',
-    'roman',
-    'romantic',
-    'rome',
-    'ron',
     'roof',
-    'room',
-    'rooms',
-    'root',
-    'roots',
-    'rope',
-    'rose',
-    'roses',
-    'ross',
-    'rough',
-    'roughly',
-    'round',
-    'rounded',
-    'rounds',
-    'route',
-    'routes',
     'routine',
-    'rover',
-    'row',
-    'rows',
-    'roy',
-    'royal',
-    'rubber',
-    'rubbish',
-    'rugby',
-    'rule',
-    'ruled',
-    'rules',
-    'ruling',
-    'rumours',
-    'run',
-    'running',
     'runs',
-    'rural',
-    'rush',
-    'rushed',
-    'russell',
-    'russia',
-    'russian',
-    'russians',
-    'ruth',
-    's',
-    's.',
-    'sa',
-    'sacred',
-    'sad',
-    'sadly',
-    'safe',
     'safely',
-    'safer',
-    'safety',
-    'said',
-    'sail',
-    'sailing',
-    'saint',
-    'sake',
-    'salary',
-    'sale',
-    'sales',
-    'sally',
-    'salmon',
-    'salt',
-    'sam',
-    'same',
     'sample',
-    'samples',
-    'samuel',
-    'san',
-    'sanctions',
-    'sand',
-    'sandy',
-    'sang',
-    'santa',
-    'sara',
-    'sarah',
-    'sat',
-    'satellite',
-    'satisfaction',
-    'satisfactory',
-    'satisfied',
     'satisfy',
-    'saturday',
-    'sauce',
-    'saudi',
-    'save',
-    'saved',
-    'saving',
-    'savings',
-    'saw',
-    'say',
-    'saying',
-    'says',
-    'scale',
-    'scales',
-    'scandal',
-    'scarcely',
     'scared',
-    'scarlet',
-    'scattered',
-    'scene',
-    'scenes',
-    'schedule',
-    'scheduled',
-    'scheme',
-    'schemes',
-    'school',
-    'schools',
-    'science',
-    'sciences',
-    'scientific',
-    'scientist',
-    'scientists',
     'scope',
-    'score',
-    'scored',
-    'scores',
-    'scoring',
-    'scotland',
-    'scots',
-    'scott',
-    'scottish',
-    'screaming',
-    'screen',
-    'screening',
-    'script',
-    'scrutiny',
-    'sculpture',
-    'sea',
     'seal',
-    'sealed',
-    'search',
-    'searching',
-    'season',
-    'seasons',
-    'seat',
-    'seated',
-    'seats',
-    'second',
-    'secondary',
-    'secondly',
-    'seconds',
-    'secret',
-    'secretary',
-    'secrets',
     'section',
-    'sections',
-    'sector',
-    'sectors',
-    'secure',
-    'secured',
-    'securities',
-    'security',
-    'see',
-    'seed',
-    'seeds',
-    'seeing',
-    'seek',
-    'seeking',
-    'seeks',
-    'seem',
     'seemed',
-    'seemingly',
-    'seems',
-    'seen',
-    'sees',
-    'seized',
-    'seldom',
-    'select',
-    'selected',
-    'selection',
-    'selective',
-    'self',
-    'sell',
-    'seller',
-    'selling',
-    'semantic',
     'senate',
-    'send',
-    'sending',
-    'senior',
-    'sensation',
-    'sense',
-    'senses',
-    'sensible',
-    'sensitive',
-    'sensitivity',
-    'sent',
-    'sentence',
-    'sentenced',
-    'sentences',
-    'separate',
-    'separated',
     'separately',
-    'separation',
-    'sept.',
-    'september',
-    'sequence',
-    'sequences',
-    'sergeant',
-    'series',
-    'serious',
-    'seriously',
-    'serum',
-    'servant',
-    'servants',
-    'serve',
-    'served',
-    'server',
     'serves',
-    'service',
-    'services',
-    'serving',
-    'session',
-    'sessions',
-    'set',
-    'sets',
-    'setting',
-    'settle',
-    'settled',
-    'settlement',
-    'settlements',
-    'seven',
-    'seventeen',
-    'seventeenth',
     'seventh',
-    'seventy',
-    'several',
-    'severe',
-    'severely',
-    'sex',
-    'sexual',
-    'sexuality',
-    'shade',
-    'shadow',
-    'shadows',
-    'shake',
-    'shakespeare',
-    'shaking',
-    'shall',
-    'shallow',
     'shame',
-    'shape',
-    'shaped',
-    'shapes',
-    'share',
-    'shared',
-    'shareholders',
-    'shares',
-    'sharing',
-    'sharp',
-    'sharply',
-    'she',
-    'shed',
-    'sheep',
-    'sheer',
-    'sheet',
     'sheets',
-    'sheffield',
-    'shelf',
-    'shell',
-    'shelter',
-    'shelves',
-    'shield',
-    'shift',
-    'shifted',
-    'shifts',
-    'shining',
-    'ship',
-    'shipping',
-    'ships',
-    'shirt',
-    'shit',
     'shock',
-    'shocked',
-    'shoes',
-    'shook',
-    'shoot',
-    'shooting',
-    'shop',
-    'shopping',
-    'shops',
-    'shore',
-    'short',
-    'short-term',
-    'shortage',
-    'shorter',
-    'shortly',
-    'shot',
     'shots',
-    'should',
-    'shoulder',
-    'shoulders',
-    'shout',
-    'shouted',
-    'shouting',
-    'show',
-    'showed',
-    'shower',
-    'showing',
-    'shown',
-    'shows',
-    'shrugged',
-    'shut',
-    'shy',
     'sick',
-    'sickness',
-    'side',
-    'sides',
-    'sigh',
-    'sighed',
-    'sight',
-    'sign',
-    'signal',
-    'signals',
-    'signed',
-    'significance',
-    'significant',
-    'significantly',
-    'signing',
-    'signs',
     'silence',
-    'silent',
-    'silently',
-    'silk',
-    'silly',
-    'silver',
-    'similar',
-    'similarly',
-    'simon',
-    'simple',
-    'simply',
-    'simultaneously',
-    'sin',
-    'since',
-    'sing',
-    'singer',
     'singing',
-    'single',
-    'sink',
-    'sir',
-    'sister',
-    'sisters',
-    'sit',
-    'site',
-    'sites',
-    'sits',
-    'sitting',
-    'situated',
-    'situation',
-    'situations',
-    'six',
-    'sixteen',
     'sixth',
-    'sixties',
-    'sixty',
-    'size',
-    'sizes',
-    'skill',
-    'skilled',
-    'skills',
-    'skin',
-    'skirt',
-    'sky',
-    'sleep',
-    'sleeping',
-    'slept',
-    'slid',
-    'slide',
     'slight',
-    'slightly',
-    'slim',
-    'slip',
-    'slipped',
-    'slope',
-    'slow',
-    'slowly',
-    'small',
-    'smaller',
-    'smart',
-    'smell',
-    'smile',
-    'smiled',
-    'smiling',
-    'smith',
     'smoke',
-    'smoking',
-    'smooth',
-    'snapped',
-    'snow',
-    'so',
-    'so-called',
-    'so_as',
-    'so_far_as',
-    'so_long_as',
-    'so_that',
-    'soap',
-    'soccer',
-    'social',
-    'socialism',
-    'socialist',
     'socially',
-    'societies',
-    'society',
-    'sociology',
-    'soft',
-    'softly',
-    'software',
-    'soil',
-    'solar',
-    'sold',
-    'soldier',
-    'soldiers',
-    'sole',
-    'solely',
-    'solicitor',
-    'solicitors',
     'solid',
-    'solo',
-    'solution',
-    'solutions',
-    'solve',
-    'solved',
-    'some',
-    'somebody',
-    'somehow',
-    'someone',
-    'somerset',
-    'something',
-    'sometimes',
-    'somewhat',
-    'somewhere',
-    'son',
     'song',
-    'songs',
-    'sons',
-    'soon',
-    'sooner',
-    'sophie',
-    'sophisticated',
-    'sorry',
-    'sort',
-    'sort_of',
-    'sorted',
-    'sorts',
-    'sought',
-    'soul',
-    'sound',
-    'sounded',
     'sounds',
-    'soup',
-    'source',
-    'sources',
-    'south',
-    'south-east',
-    'southern',
-    'sovereignty',
-    'soviet',
-    'space',
-    'spaces',
-    'spain',
-    'spanish',
-    'spare',
-    'spatial',
-    'speak',
     'speaker',
-    'speakers',
-    'speaking',
-    'speaks',
-    'special',
-    'specialist',
-    'specialists',
-    'specially',
-    'species',
-    'specific',
-    'specifically',
-    'specification',
-    'specified',
-    'specify',
-    'specimens',
-    'spectacular',
     'spectrum',
-    'speculation',
-    'speech',
-    'speed',
-    'spell',
-    'spencer',
-    'spend',
-    'spending',
-    'spent',
-    'sphere',
-    'spirit',
-    'spirits',
-    'spiritual',
-    'splendid',
-    'split',
-    'spoke',
     'spoken',
-    'spokesman',
-    'sponsored',
-    'sponsorship',
-    'sport',
-    'sporting',
-    'sports',
-    'spot',
-    'spots',
-    'spotted',
-    'spread',
-    'spreading',
-    'spring',
-    'squad',
-    'squadron',
-    'square',
     'st',
-    'st.',
-    'stability',
-    'stable',
-    'staff',
-    'stage',
-    'stages',
-    'stairs',
-    'stake',
-    'stamp',
-    'stance',
-    'stand',
-    'standard',
-    'standards',
-    'standing',
-    'stands',
     'stanley',
-    'star',
-    'stare',
-    'stared',
-    'staring',
-    'stars',
-    'start',
-    'started',
-    'starting',
-    'starts',
-    'state',
-    'stated',
-    'statement',
-    'statements',
-    'states',
-    'static',
     'station',
-    'stations',
-    'statistical',
-    'statistics',
-    'status',
-    'statute',
-    'statutory',
-    'stay',
-    'stayed',
-    'staying',
-    'steadily',
-    'steady',
-    'steam',
-    'steel',
-    'steep',
-    'stem',
     'step',
-    'stephen',
-    'stepped',
-    'steps',
-    'sterling',
-    'steve',
-    'steven',
-    'stewart',
-    'stick',
-    'sticks',
-    'stiff',
-    'still',
-    'stimulus',
-    'stir',
-    'stock',
-    'stocks',
     'stolen',
-    'stomach',
-    'stone',
-    'stones',
-    'stood',
-    'stop',
-    'stopped',
-    'stopping',
-    'stops',
-    'storage',
-    'store',
-    'stored',
-    'stores',
-    'stories',
-    'storm',
-    'story',
     'straight',
-    'straightforward',
-    'strain',
-    'strange',
-    'stranger',
-    'strategic',
-    'strategies',
-    'strategy',
-    'straw',
-    'stream',
-    'street',
-    'streets',
-    'strength',
-    'strengthen',
-    'stress',
-    'stressed',
     'stretch',
-    'stretched',
-    'stretching',
-    'strict',
-    'strictly',
-    'strike',
-    'striker',
-    'strikes',
-    'striking',
-    'string',
-    'strings',
-    'strip',
-    'stroke',
-    'strong',
-    'stronger',
-    'strongly',
     'struck',
-    'structural',
-    'structure',
-    'structured',
-    'structures',
-    'struggle',
-    'struggled',
-    'struggling',
-    'stuart',
-    'stuck',
-    'student',
-    'students',
-    'studied',
-    'studies',
-    'studio',
-    'study',
     'studying',
-    'stuff',
-    'stupid',
-    'style',
-    'styles',
-    'subject',
-    'subject_to',
-    'subjected',
-    'subjects',
-    'submit',
-    'submitted',
-    'subsequent',
-    'subsequently',
-    'subsidiary',
-    'substance',
-    'substances',
     'substantial',
-    'substantially',
-    'substitute',
-    'subtle',
-    'succeed',
-    'succeeded',
-    'success',
-    'successful',
-    'successfully',
-    'succession',
-    'successive',
-    'successor',
-    'such',
-    'such_as',
-    'such_that',
-    'sudden',
     'suddenly',
-    'sue',
-    'suffer',
-    'suffered',
-    'suffering',
-    'sufficient',
-    'sufficiently',
-    'suffolk',
-    'sugar',
-    'suggest',
-    'suggested',
-    'suggesting',
-    'suggestion',
-    'suggestions',
-    'suggests',
-    'suicide',
     'suit',
-    'suitable',
-    'suite',
-    'suited',
-    'suits',
-    'sum',
-    'summary',
-    'summer',
-    'summit',
-    'sums',
-    'sun',
-    'sunday',
-    'sunderland',
-    'sunlight',
-    'sunshine',
-    'super',
     'superb',
-    'superior',
-    'supervision',
-    'supper',
-    'supplement',
-    'supplied',
-    'supplier',
-    'suppliers',
-    'supplies',
-    'supply',
-    'support',
-    'supported',
-    'supporters',
-    'supporting',
-    'supports',
-    'suppose',
     'supposed',
-    'supreme',
-    'sure',
-    'surely',
-    'surface',
-    'surfaces',
-    'surgery',
-    'surplus',
-    'surprise',
-    'surprised',
-    'surprising',
-    'surprisingly',
-    'surrey',
-    'surrounded',
-    'surrounding',
-    'surroundings',
     'survey',
-    'surveys',
-    'survival',
-    'survive',
-    'survived',
-    'surviving',
-    'susan',
-    'suspect',
-    'suspected',
-    'suspended',
-    'suspension',
-    'suspicion',
-    'suspicious',
-    'sussex',
-    'sustain',
-    'sustained',
     'swallowed',
-    'sweat',
-    'sweden',
-    'sweet',
-    'swept',
-    'swift',
-    'swiftly',
-    'swim',
-    'swimming',
-    'swindon',
-    'swing',
-    'swiss',
-    'switch',
-    'switched',
-    'switzerland',
-    'sword',
     'swung',
-    'symbol',
-    'symbolic',
-    'symbols',
-    'sympathetic',
-    'sympathy',
-    'symptoms',
-    'syndrome',
-    'synthesis',
-    'system',
-    'systematic',
-    'systems',
-    't',
-    't.',
-    'ta',
-    'table',
     'tables',
-    'tackle',
-    'tactics',
-    'tail',
-    'take',
-    'taken',
-    'takes',
-    'taking',
-    'tale',
-    'talent',
-    'tales',
-    'talk',
-    'talked',
-    'talking',
-    'talks',
-    'tall',
     'tank',
-    'tanks',
-    'tap',
-    'tape',
-    'tapes',
-    'target',
-    'targets',
-    'task',
-    'tasks',
-    'taste',
-    'taught',
-    'tax',
-    'taxation',
-    'taxes',
-    'taxi',
-    'taylor',
     'tea',
-    'teach',
-    'teacher',
-    'teachers',
-    'teaching',
-    'team',
-    'teams',
-    'tear',
-    'tears',
-    'technical',
-    'technique',
-    'techniques',
-    'technological',
-    'technologies',
-    'technology',
-    'teeth',
     'tel',
-    'telecommunications',
-    'telegraph',
-    'telephone',
-    'television',
-    'tell',
-    'telling',
-    'tells',
-    'temper',
-    'temperature',
-    'temperatures',
-    'temple',
-    'temporarily',
-    'temporary',
-    'tempted',
-    'ten',
     'tenant',
-    'tenants',
-    'tend',
-    'tended',
-    'tendency',
-    'tender',
-    'tends',
-    'tennis',
-    'tense',
-    'tension',
-    'term',
-    'terminal',
-    'terms',
-    'terrace',
-    'terrible',
-    'terribly',
     'territorial',
-    'territories',
-    'territory',
-    'terror',
-    'terry',
-    'test',
-    'testament',
-    'tested',
-    'testing',
-    'tests',
-    'text',
-    'texts',
-    'th',
-    'thames',
-    'than',
-    'thank',
     'thanks',
-    'that',
-    'that_is',
-    'thatcher',
-    'the',
-    'theatre',
-    'theft',
-    'their',
-    'them',
-    'theme',
-    'themes',
-    'themselves',
-    'then',
-    'theoretical',
-    'theories',
-    'theory',
     'therapy',
-    'there',
-    'thereafter',
-    'thereby',
-    'therefore',
-    'these',
-    'thesis',
-    'they',
-    'thick',
-    'thin',
-    'thing',
-    'things',
-    'think',
-    'thinking',
-    'thinks',
-    'third',
     'thirteen',
-    'thirty',
-    'this',
-    'thomas',
-    'thompson',
-    'thoroughly',
-    'those',
-    'though',
-    'thought',
-    'thoughts',
-    'thousand',
-    'thousands',
-    'threat',
-    'threatened',
-    'threatening',
-    'threats',
     'three',
-    'threw',
-    'throat',
-    'throne',
-    'through',
-    'throughout',
-    'throw',
-    'throwing',
-    'thrown',
-    'thrust',
-    'thursday',
-    'thus',
-    'ticket',
-    'tickets',
-    'tide',
-    'tie',
     'tied',
-    'ties',
-    'tight',
-    'tightly',
-    'tiles',
-    'till',
-    'tim',
-    'timber',
-    'time',
-    'times',
-    'timing',
-    'tin',
-    'tiny',
-    'tip',
-    'tips',
-    'tired',
     'tissue',
-    'title',
-    'titles',
-    'to',
-    'tobacco',
-    'today',
-    'together',
-    'together_with',
-    'toilet',
-    'told',
-    'tom',
-    'tommy',
-    'tomorrow',
-    'tone',
-    'tongue',
-    'tonight',
     'tonnes',
-    'tons',
-    'tony',
-    'too',
-    'took',
-    'tool',
-    'tools',
-    'top',
-    'topic',
-    'topics',
-    'tories',
-    'torn',
-    'tory',
-    'total',
-    'totally',
-    'touch',
     'touched',
-    'touching',
-    'tough',
-    'tour',
-    'tourism',
-    'tourist',
-    'tourists',
-    'tournament',
-    'toward',
-    'towards',
-    'tower',
-    'town',
-    'towns',
-    'toxic',
-    'trace',
-    'track',
     'tracks',
-    'trade',
-    'traders',
-    'trades',
-    'trading',
-    'tradition',
-    'traditional',
-    'traditionally',
-    'traditions',
-    'traffic',
-    'tragedy',
-    'tragic',
-    'trail',
-    'train',
-    'trained',
-    'training',
     'trains',
-    'transaction',
-    'transactions',
-    'transfer',
-    'transferred',
-    'transformation',
-    'transformed',
-    'transition',
-    'translated',
-    'translation',
-    'transmission',
-    'transport',
-    'trap',
-    'trapped',
-    'travel',
-    'travelled',
     'travellers',
-    'travelling',
-    'tray',
-    'treasury',
-    'treat',
-    'treated',
-    'treating',
-    'treatment',
-    'treaty',
-    'tree',
-    'trees',
-    'tremendous',
-    'trend',
-    'trends',
-    'trevor',
-    'trial',
     'trials',
-    'tribunal',
-    'tribute',
-    'trick',
-    'tried',
-    'tries',
-    'trip',
-    'trips',
-    'triumph',
-    'troops',
-    'trophy',
-    'tropical',
-    'trouble',
-    'troubled',
-    'trousers',
-    'truck',
     'true',
-    'truly',
-    'trust',
-    'trustees',
-    'trusts',
-    'truth',
-    'try',
-    'trying',
-    'tube',
-    'tuesday',
-    'tune',
-    'tunnel',
-    'turkey',
-    'turkish',
-    'turn',
-    'turned',
     'turning',
-    'turnover',
-    'turns',
-    'tv',
-    'twelve',
-    'twentieth',
-    'twenty',
-    'twice',
-    'twin',
-    'twist',
-    'twisted',
-    'two',
-    'type',
-    'types',
-    'typical',
-    'typically',
     'u',
-    'ugly',
-    'uk',
-    'ulster',
-    'ultimate',
-    'ultimately',
-    'un',
-    'unable',
-    'unacceptable',
-    'unaware',
-    'uncertain',
-    'uncertainty',
-    'uncle',
-    'uncomfortable',
-    'unconscious',
-    'under',
     'underground',
-    'underlying',
-    'underneath',
-    'understand',
-    'understanding',
-    'understood',
-    'undertake',
-    'undertaken',
-    'undertaking',
-    'undoubtedly',
-    'unemployed',
-    'unemployment',
-    'unexpected',
-    'unfair',
-    'unfortunate',
-    'unfortunately',
     'unhappy',
-    'uniform',
-    'union',
-    'unions',
-    'unique',
-    'unit',
-    'united',
-    'units',
-    'unity',
-    'universal',
-    'universe',
-    'universities',
-    'university',
-    'unix',
-    'unknown',
-    'unless',
     'unlike',
-    'unlikely',
-    'unnecessary',
-    'unpleasant',
-    'until',
-    'unusual',
-    'up',
-    'up_to',
-    'update',
-    'upon',
-    'upper',
-    'upright',
-    'upset',
-    'upstairs',
-    'upwards',
-    'urban',
     'urge',
-    'urged',
-    'urgent',
-    'us',
-    'usa',
-    'usage',
-    'use',
-    'used',
-    'useful',
-    'useless',
-    'user',
-    'users',
-    'uses',
-    'using',
-    'ussr',
-    'usual',
     'usually',
-    'utterly',
-    'v',
-    'v.',
-    'vague',
-    'valid',
-    'validity',
-    'valley',
-    'valuable',
-    'value',
-    'valued',
-    'values',
-    'van',
-    'variable',
-    'variables',
-    'variation',
     'variations',
-    'varied',
-    'varies',
-    'varieties',
-    'variety',
-    'various',
-    'vary',
-    'varying',
-    'vast',
-    'vat',
-    'vegetables',
-    'vehicle',
-    'vehicles',
-    'vendor',
-    'venture',
-    'venue',
     'verbal',
-    'verdict',
-    'verse',
-    'version',
-    'versions',
-    'vertical',
-    'very',
-    'vessel',
-    'vessels',
-    'vi',
-    'via',
-    'vice',
-    'victim',
-    'victims',
-    'victoria',
-    'victorian',
     'victory',
-    'video',
-    'video-taped',
-    'vienna',
-    'vietnam',
-    'view',
-    'viewed',
-    'viewing',
-    'views',
-    'villa',
-    'village',
-    'villages',
-    'violence',
-    'violent',
-    'virgin',
-    'virginia',
     'virtually',
-    'virtue',
-    'virus',
-    'visible',
-    'vision',
-    'visit',
-    'visited',
-    'visiting',
-    'visitor',
-    'visitors',
-    'visits',
-    'visual',
-    'vital',
-    'vocabulary',
-    'voice',
-    'voices',
     'volume',
-    'volumes',
-    'voluntary',
-    'volunteers',
-    'vote',
-    'voted',
-    'voters',
-    'votes',
-    'voting',
-    'vulnerable',
-    'w',
-    'w.',
-    'wage',
-    'wages',
-    'waist',
-    'wait',
     'waited',
-    'waiting',
-    'wake',
-    'wales',
-    'walk',
-    'walked',
-    'walker',
-    'walking',
-    'walks',
-    'wall',
-    'walls',
-    'walter',
-    'wan',
-    'want',
-    'wanted',
-    'wanting',
     'wants',
-    'war',
-    'ward',
-    'warm',
-    'warmth',
-    'warned',
-    'warning',
-    'wars',
-    'was',
-    'wash',
-    'washed',
-    'washing',
-    'washington',
-    'waste',
-    'wasted',
-    'watch',
     'watched',
-    'watching',
-    'water',
-    'waters',
-    'watson',
-    'wave',
-    'waved',
-    'waves',
-    'way',
-    'ways',
-    'we',
-    'weak',
-    'weakness',
-    'wealth',
-    'wealthy',
-    'weapon',
     'weapons',
-    'wear',
-    'wearing',
-    'weather',
-    'wedding',
-    'wednesday',
-    'wee',
-    'week',
-    'weekend',
-    'weekly',
-    'weeks',
-    'weight',
-    'welcome',
-    'welcomed',
-    'welfare',
-    'well',
     'well-known',
-    'wells',
-    'welsh',
-    'went',
-    'were',
-    'west',
-    'western',
-    'westminster',
-    'wet',
-    'what',
-    'whatever',
-    'wheel',
-    'wheels',
-    'when',
-    'whenever',
-    'where',
     'whereas',
-    'whereby',
-    'wherever',
-    'whether',
-    'whether_or_not',
-    'which',
-    'while',
-    'whilst',
-    'whisky',
-    'whispered',
-    'white',
-    'who',
-    'whoever',
-    'whole',
-    'wholly',
-    'whom',
     'whose',
-    'why',
-    'wide',
-    'widely',
-    'wider',
-    'widespread',
-    'widow',
-    'wife',
-    'wild',
-    'wildlife',
-    'will',
-    'william',
-    'williams',
-    'willie',
-    'willing',
-    'willingness',
     'wilson',
-    'wimbledon',
-    'win',
-    'wind',
-    'window',
-    'windows',
-    'winds',
-    'wine',
-    'wing',
-    'wings',
-    'winner',
-    'winners',
-    'winning',
-    'wins',
-    'winter',
-    'wiped',
     'wire',
-    'wisdom',
-    'wise',
-    'wish',
-    'wished',
-    'wishes',
-    'wishing',
-    'with',
-    'with_regard_to',
-    'with_respect_to',
-    'withdraw',
-    'withdrawal',
-    'withdrawn',
-    'within',
-    'without',
-    'witness',
     'witnesses',
-    'wives',
-    'wo',
-    'woke',
-    'woman',
-    'women',
-    'won',
-    'wonder',
-    'wondered',
-    'wonderful',
-    'wondering',
-    'wood',
-    'wooden',
-    'woods',
-    'wool',
-    'word',
     'words',
-    'wore',
-    'work',
-    'worked',
-    'worker',
-    'workers',
-    'workforce',
-    'working',
-    'working-class',
-    'works',
-    'workshop',
-    'workshops',
-    'world',
-    'worldwide',
-    'worn',
-    'worried',
     'worries',
-    'worry',
-    'worrying',
-    'worse',
-    'worship',
-    'worst',
-    'worth',
-    'worthwhile',
-    'worthy',
-    'would',
-    'wound',
-    'wounded',
-    'wrapped',
-    'wright',
-    'write',
-    'writer',
     'writers',
-    'writes',
-    'writing',
-    'written',
-    'wrong',
-    'wrote',
-    'x',
-    'y',
-    'ya',
-    'yard',
-    'yards',
-    'ye',
-    'yeah',
-    'year',
-    'years',
-    'yellow',
     'yeltsin',
-    'yep',
-    'yer',
-    'yes',
-    'yesterday',
-    'yet',
-    'yield',
-    'yo',
-    'york',
-    'yorkshire',
-    'you',
-    'young',
-    'younger',
-    'youngest',
-    'youngsters',
-    'your',
     'yours',
-    'yourself',
-    'youth',
-    'yugoslavia',
-    'zealand',
-    'zero',
-    'zone',
+)
+
+blocks_01 = (
+    '!\'formula!\'pound;1("00!%times !\'!!d!"em!"ll!!m!"re!!s!"ve !* !+ !0',
+    ' !1!$,000!!0"!%"$,000"!0!!1!!2!!3!!4!!5"!0!!6!!7!!8',
+    '"#30s#!9""40#!5#!7#!8""50$!s#!7#!9""60$!s#!1#!2#!3',
+    '#!5#!6#!7#!8#!9""70$!s#!1#!2#!3#!4#!5#!6#!7#!8',
+    '""80$!s#!1#!2#!3#!4#!5#!6#!7#!8#!9""90#!1#!2#!3',
+    '""th!"st !2!$,000!!0"!0#!0!!1!!2!!3!!4!!5!!6!!7!!8',
+    ' !3!!0"!0!!1!!2!!3!!4!!5!!6!!7!!8!!9 !4!!0"!0',
+    '!!2!!3!!4!!5!!8 !5!!0"!0!!5 !6!!0!!5 !7!!0!!5',
+    '!!0 !9!!0!!3 != !a!!.!$_bit"#few"*great_deal"&little($_bit#"ot!&bandon\'"ed',
+    '"&erdeen"\'ilities&!y""le"&ortion#"ut#"ve"$road#%uptly"%sence%!t#%olute("ly$$rbed#%tract',
+    '!\'cademic&!y"$cent$"pt&$able\'#nce&"ed&#ing$"ss&$ible#%ident(!s#(ommodate*#ion%&panied',
+    ')"ly$#unt\'\'ability(#nts\'"ed\'#ing\'!s#%uracy&"te("ly$#sed"!e"%hieve\'!d\'$ment',
+    '&#ing""id")knowledge+!d"%quire\'!d%&sition"#res##oss"!t#"ed##ing$"on&!s$"ve',
+    '%%ities\'!y#"or%!s#!s##ual&"ly"#ute!!d""am#$pted"!d#"ed##ing$$tion',
+    '#$ress\'"ed(!s#!s"&equate"(justment",ministration,"ve$%ssion$!t%!s%#ted"#opt%"ed%#ion',
+    '%!s"%vance\'!d\'!s%$tage)!s#&enture$#rse%&tising##ice$"se&!d&!r\'!s%#ory',
+    '!%ffair&!s##ect&"ed&#ing\'"on&!s##ord"$raid##ica&!n"#ter%$noon%%wards!$gain',
+    '"!e#!d##ing#%ncies%!y$"da$!t%!s#!s"\'gregate%%ssion("ve"!o"#ree%!d',
+    ')!s#)icultural*!e!!h"!a"#ead%#_of!!i"!d#!s"!m#"ed#!s"!r#%craft',
+    '!!l""an#"rm"$beit$"rt#"um"%cohol"#ert#!x$%ander"$fred"!i#"ce#"en#"ke',
+    '#"ve"!l#$_but$%right#(egations%"ed$!n#%iance$"ed%!s#&ocated\'#ion$!w%$ance)!s',
+    '%#ing%!s"$most"#one$!g%%_with%$side"%ready#$ight""so"#ter%"ed%&native+"ly+!s',
+    '#\'ogether"$ways!!m"%ateur#$zing"&bition\'"us#&ulance"\'endment#$rica\'!n(!s"#ong%"st##unt',
+    '!!n"%alyse\'!d\'!s&"is"%cient"!d##/or#&_so_on#%erson##rew#!y"#gel$!r#"le',
+    '#"ry"$imal&!s"!n#!a#!e#(iversary#&ounced($ment##ual"\'onymous#$ther"$swer&"ed&#ing',
+    '"%thony#(icipated"%xiety$#ous"!y#$body##one#%thing##way$$here!$part%%_from%$ment"&parent("ly',
+    '&"ed&!s%!r&$ance&"ed&#ing&!s$$ndix#"le$&icable\'"nt)!s\'$tion+!s%"ed',
+    '$!y%#ing#&ointed\'$ment+!s#\'reciate*!d)#ion$$oach("ed)!s(#ing%&priate%#val&"ed',
+    '"#ril!#rab"(chbishop$%itect)$ural+!e"!e#!a$!s"#gue%!d%!s$#ing$$ment(!s',
+    '%!s$#ing"!m#"ed#!s#!y"#ose##und"%range\'!d\'$ment+!s##est&"ed#$ival',
+    '&!d%#ing"%senal"!t##hur#$icle\'!s$&ficial$"st&"ic&!s#!s!!s"\'_far_as$"or',
+    '#\'long_as#*opposed_to#\'soon_as#&though$!o#%usual#$well\'#_as##yet"!h""ia$!n#"de"!k#"ed',
+    '#!s"$leep"$pect&!s"%sault#&embled\'!y$"ss&"ed&#ing&$ment$!t%!s#%igned$"st',
+    '(!t#&ociate)!d(#ion+!s##ume&!d%#ing%%ption*!s$%rance%"ed!!t"$_all#%first',
+    '$$east#$once#\'present"!e"&lantic"(mosphere"&tached%!k&"ed&#ing&!s#$empt\'"ed\'#ing\'!s',
+    '&$ance&"ed&#ing%$tion#%itude(!s#$ract\'"ed\'#ion("ve$&ibuted!&uction"&dience$!t%#ors',
+    '##ust""nt"\'stralia)!n%"ia"$thor&%ities(!y&!s#&omatic)$ally$$nomy##umn!+vailability\'"le',
+    '#$rage"#oid%"ed%#ing!$wake#"rd%"ed%!s$!e%$ness#!y$%_from"#ful"%kward!"ye',
+    '!!.!%abies#!y""ck$"ed$&ground$#ing$!s$%wards#"on#%teria"!d#"ly"!g#!s',
+    '"%lance\'!d#!l$"et$!s"!n#!d$!s#!g#!k$#ing$!s##ned"!r#$bara',
+    '$"ly#\'gaining#!n$"es#$rier\'!s$!y#!s""se$!d$!s#"ic%$ally$!n$!s',
+    '#!s#$tard""th$$room#$tery$"le"!y!"bc!!e"#ach#"ns#!r$#ing$!s#!t',
+    '$#ing#&utiful)"ly%!y"$came$#use\'#_of##ome&!s%#ing"!d#$room\'!s#!s""ef',
+    '#!r"$fore"#gan#"in%$ning%!s#"un"$half$"ve%$iour##ind"#ing%!s"%lfast#$gium',
+    '&!s%"ve\'!d\'!s&#ing#!l##ong&"ed&#ing&!s$!w#!t"!n#"ch#!d',
+    '$&ficial&!t\'!s#%jamin#!t"$rlin#$nard"$side&!s#!t"!t##ter$!y#$ween"$yond',
+    '"#ble"!d"!g##ger%"st""ke""le#!l$#ion$!s$!y"%nding"(ological""rd$!s',
+    '#"th%#day"$shop&!s"!t#!e#!s##ter!$lack%!s#"me%!d#"nk#"st"&eeding',
+    '"#ind"#ock%"ed%!s#"ke#"od%!y#!w$!n""ue$!s!$oard%!s#!t$!s',
+    '"$dies#!y""ld""mb$!s""nd$!s#!e$!s#"us""ok$"ed$#ing$!s#!m',
+    '#!t$!s"$rder&!s#!e$!d##ing#!n#$ough##row&"ed&#ing""ss""th$"er',
+    '##tle&!s$"om"$ught#"nd%%aries\'!y"!w#"el#!l"!x#"es##ing"!y#!s',
+    '"&adford#"in##nch&"es$!d#"ss#"ve##zil"$each$!d$!k%$down%$fast%#ing%!s',
+    '&!s$"th&#ing#"ed%#ing$"ze"#ian#"ck##dge#"ef%"ly#$gade$"ht&"on#&lliant',
+    '%#ing%!s#$stol#$tain$#ish"#oad%$cast)#ing%"er%"ly#"ke%!n##nze#$ther\'!s',
+    '#"wn"#uce#"sh$$sels!%udget&!s"#ild%#ing(!s$!t""lk#!l"#nch"$rden##eau',
+    '##ied#!n$"ed$#ing$!s$!t#"st"!s#"es#!h#%iness("es#!y"!t#$_for',
+    '##ter$"on"!y#"er%!s##ing!!y")_means_of#(no_means%!w#&way_of"!e !c!!.!!a',
+    '#$inet#"le""ke"%lcium$&ulated($ions#\'ifornia#!l$"ed$#ing$!s#!m"\'mbridge#!e$"ra',
+    '$$aign(!s$$bell"!n##ada%#ian$!l#&celled%!r#&didate)!s#\'terbury"!p#$able$$city',
+    '\'#ism)!t#$tain$#ure\'!d"!r##bon#!d$#iff$!s#!e$!d$"er&!s$#ful',
+    '$"rs##ing#%oline##pet#%riage%!e&!d&!r&!s$!y%#ing#!s##ter##ved""se',
+    '#!h#!t$"le##ual"!t#&alogue#"ch%#ing#\'egories\'!y$$ring#&hedral%$rine$$olic#!s',
+    '"$ught#"se%!d%!s$#ing#$tion""ve!%eased"%iling"\'lebrate)!d(#ion#!l$!s##tic',
+    '%!e&!d&!s$%uries&!y"&remony#$tain\'"ly\'"ty$\'ificate!$hain%!s$!r%#man%!s',
+    ')!d)!s(#ing#$mber\'!s$%pagne%#ion(!s)#hip,!s##nce&$llor&!s$"ge&!d',
+    '%#ing$#nel\'!s#"os#!p$"el$#ter\'!s#&racter)%istic.!s)!s$"ge&!d&!s',
+    '$#les%"ie%$otte$!m%#ing$!t%"er#"se#!t"#eap%"er#"ck%"ed%#ing%!s',
+    '%!s$"se#$lsea$&tenham#%mical(!s%$stry##que#"st"%icken#"ef#"ld%$hood%#ren#!n',
+    '$#ese#!p$!s"\'ocolate##ice&!s##ose%#ing#"se%!n"#ris%!t&#ian)#ity)!s',
+    '&#mas&%opher#$onic"$urch&"es&#ill!(igarette)!s"$nema"$rcle&!s$#uit%#lar\'$tion%(mstances',
+    '##ies$#zen\'!s#!y"#vil%#ian!$laim%"ed%#ing%!s#"re$!k%!e#"sh$!s',
+    '%"ic\'"al&(fication("ed%$room##use&!s#!y"#ean%#ing$!r%"ed%#ing%"ly##rgy',
+    '#&veland%!r"$ient&!s#"ff#$mate$!b%"ed%#ing##nic&"al$#ton"#ock#"se%!d',
+    '%!r$#ing$#ure#"th%"es%#ing#"ud%!s""ub$!s!!m!!o"*-operation"#ach#!l',
+    '#"st%"al#!t""de$!s"$ffee$"in"\'gnitive""in$!s""ld#"in#*laboration%#pse(!d',
+    '$%eague)!s%"ct\'"ed\'#ing("on*!s("ve%"ge\'!s#$onel%#ial$"ur&"ed&!s',
+    '&!s"$mbat$\'ination&!e\'!d#!e$"dy$!s#$fort\'$able#"ic$"ng#$mand\'"er$#ent',
+    '\'!s%#rce\'#ial$&ission*"ed+!r%!t&$ment*!s&#ted(!e)!s$"on&"ly&!s',
+    '$\'unicate*#ion-!s\'"st)!s\'$ties(!y#$pact%$nies\'"on&!y%%rable\'$tive+"ly&!e',
+    '&$ison*!s$(ensation%"te\'#nce(!t&#ing\'$tion)"ve(#ors$$lain("ed(!t)!s%#ete',
+    '("ly\'#ion&!x\'#ity%%iance&%cated%!y$%onent)!s%#sed&%ition%#und$)rehensive%%omise$&ulsory',
+    '(!s&#ing"\'nceived%&ntrate+!d*#ing+"on-!s%"pt\'#ion\'!s%"rn\'"ed\'#ing\'!s',
+    '$$lude(!d&$sion*!s$$rete#&demned$%ition)!s$#uct\'"ed#\'ference*!s$&idence(!t%#ned',
+    '\'"ed$$lict(!s$$used&#ion#%gress#&nected\'#ion*!s#\'science&#ous)$ness$%ensus&!t%&quence',
+    ')#tly%\'rvation*"ve,!s$$ider($able+!y)$tion-!s("ed(#ing(!s%"st\'"ed("nt',
+    '\'#ing\'!s$%table&#nce\'!t("ly%\'ituency("te)#ion,"al%&raints&#uct)"ed)#ion$#ult',
+    '*!s($tion\'"ed%#mer(!s&%ption#$tact\'!s%"in\'"ed\'#ing\'!s$(emporary\'!t%"nt',
+    '%"st%"xt\'!s$%inent)"al&%ually\'!e(!d(!s\'#ing("ty\'#ous$$ract(!s&"ry',
+    '&"st%%ibute*!d)#ion,!s%"ol\'#led(#ing\'!s&\'versial*!y#\'venient&$tion*"al*!s',
+    '\'#ion&!t\'"ed$%icted\'#ion%#nce(!d\'#ing""ok$"ed$#ing#!l##per&%ation""pe',
+    '##per#!y"%rbett#!e#!n$"er&!s$$wall#!p$%orate(#ion$!s#$rect\'"ly%&lation',
+    ',!t*#ing$$idor$&uption"!s#!t$!s"%ttage$"on"#uld#$ncil\'#lor*!s\'!s$#sel',
+    '$!t%"ed&!r%#ies&"ng%$ries&!y\'$side%!s%!y#!p$"le&!d&!s#$rage',
+    '&!s$!t%!s##sin"&ventry$!r%#age%"ed%#ing%!s"!w#!s!$rack#"ft#"ig',
+    '%"ed#"zy"#eam$"te&!d&!s%#ing&"on&"ve%#ure(!s##dit&#ors#!w"%icket',
+    '#"me%!s$$inal##sis#%teria\'"on$$ical&$ised(!m&!s""op$!s#"ss%"ed%#ing',
+    '%"ed%!s$!n"%ucial#"de#"el"!y##ing#$stal!\'ultural&!e\'!s"!p#%board#!s',
+    '#$ious#%rency&!t\'"ly$&iculum#$tain\'!s#"ve"%stody%!m&"er(!s&!s"!t#!s',
+    '!$ycle !d!!\'!!.!!a"!d#"dy"#ily"$mage&!d&!s%#ing#!n#!p"#nce',
+    '##ger&#ous&!s##iel""re#!k$$ness#$ling\'#ton""ta$$base#!e$!d$!s##ing',
+    '(!s""ve#"id$"es$!s""wn"!y#!s!!c!!e""ad#!f#!l$"er&!s',
+    '$!s$!t#!n#!r#"th%!s"$bate&!s#!t$!s#"ut"!c#!.##ade&!s',
+    '$"nt##ide&!d%#ing$$sion(\'-making(!s&"ve#!k#(laration&"ed$#ine\'!d#&orated#%rease',
+    '"$emed#!p$"er$"ly"$feat&"ed$#nce%!d&#ant)!s&"er&#ing%$sive#$icit$"ne',
+    '%#ite("ly\'#ion*!s"$gree&!s"#lay%"ed#&egates\'#ion#\'iberate*"ly$$cate$#ght\'"ed',
+    '\'"ed\'!y"$mand&"ed&#ing&!s#&ocracy\'#tic(!s$\'nstrate+!d*#ion-!s"$nied#$mark',
+    '#$sity#!y"(partment*!s&#ure##end&"ed\'#nce(!t&&ing_on&!s#$osit\'!s#&ressed\'#ion',
+    '#%uties%!y"#rby#"ek#$ived"!s#%cribe(!d(!s\'#ing&%ption+!s##ert&"ed%"ve',
+    '&$ated&"ed\'!r&!s$%rable%!e&!d#!k$#top#$pair$%erate)"ly$#ite#$troy\'"ed',
+    '"$tail&"ed&!s##ect&"ed&#ive$)rmination(!e)!d(#ing"%velop\'"ed\'#ing\'$ment+!s',
+    '&!s$!l$#sed#"on$#ted!!i"\'agnosis$#ram#%logue#%meter#"na#"ry""ck#\'tionary"!d',
+    '#!d##sel#!t"$ffer&$ence*!s(!t)"ly$%icult)#ies)!y"%gital#$nity"\'mension)!s',
+    '##ner"%oxide"(plomatic"$rect&"ed&#ion)!s\'"ve&"ly&"or(!s(!y#"ty"(sability%#led',
+    ')"ed&&ointed*$ment$$ster#!c$%harge$&ipline$$ount&#rse%#ver("ed(!y$&retion%)imination$#uss',
+    '\'#ing("on*!s#$ease\'!s#!h$"es#!k#&missal\'"ed#%order#$play\'"ed\'!s$$osal',
+    '\'!s#%tance&!t$$inct(#ion)"ve&%guish+"ed$$ress%&ibuted)#ion&"ct(!s$%urbed\'#ing',
+    '&#ity##ide&!d&"nd$"ne$$sion(!s#$orce!"na!!o""ck##tor&!s$$rine#%ument',
+    '(!s""es"!g#!s"#ing"$llar&!s"$main#%estic#%inant&#ted"!n##ald#!e""or',
+    '$#way"%rothy""se"!t"$uble&!d$!t%#ful%!s#$glas""wn$&stairs"#zen!!r"!.',
+    '#!g$#ged#"ma%#tic($ally#"nk#!w$#ing\'!s$!n$!s"&eadful$!m%!s#"ss',
+    '%#ing#!w"#ied#"ft#"nk%#ing%!s#"ve%!n%!r&!s%!s$#ing""op$#ped',
+    '$!s#"ve""ug$!s#"nk"!y!!u"$blin""ck"!e##_to""ke""ll"$ncan"&ration',
+    '##ing""st"#tch##ies#!y!$ying"%namic !e!!.""g.!#ach$&_other"#ger#"le"!r',
+    '$#ier&"st$!y#!n$"ed$$ings#!s#"th""se##ier$"ly#!t$"er&!n#!y',
+    '#"en##ing!!c""ho"&onomic(!s\'"es&!y!!d"#die""ge$!s"\'inburgh#$tion$"or',
+    '&#ion)"al"$ward&!s!"ec!%ffect&#ive)"ly)$ness&!s#\'iciency(!t##ort&!s!!g',
+    '#!s"#ypt!!h!$ight%#een("th%!h%!y"$ther!!l"\'aborate"#der%"ly"%ected%#ion',
+    '%$oral%#ric("al(#ity&$onic*!s#$gant#$ment\'!s##ven"&igible#"ot#"te#&zabeth""se',
+    '!*mbarrassed)$ment$#ssy"$erge&!d&#nce(!y%#ing"#ily#&ssions""ma"%otion\'"al\'!s"%peror',
+    '("ed##ire%$ical##loy&"ed\'!e(!s\'!r(!s&$ment#"ty!%nable&!d&!s%#ing',
+    '#&ounter)"ed%$rage)!d)$ment(#ing"!d#"ed##ing#$less#!s"%emies$!y##rgy")forcement',
+    '&!d&$ment##ine&"er(#ing(!s&!s#$land$#ish"%hance\'!d"#joy%"ed%#ing"&ormous',
+    '"\'quiries&!y"$sure%#ing"#ter%"ed%#ing%%prise*!s%(tainment#\'husiasm)#tic##ire&"ly$$tled',
+    '#%rance$#ies$!y"&velope#(ironment+"al+!s$%saged!&pisode!$qual%#ity%"ly$$tion#(ilibrium$%pment',
+    '$"ty$&valent!!r"!a""ic"!m"%osion"#ror%!s!%scape&!d"(pecially"#say#$ence%$tial',
+    '$!x"\'tablish)"ed)#ing)$ment$"te&!s#%imate(!d(!s!$t_al"!c#!."$hnic!%urope',
+    '!)valuation#"ns"!e#!n$#_if%"so%&though%$when$#ing\'!s$!t%!s%%ually#!r$!y',
+    '%#day%#one%%thing%%where"&idence&!t\'"ly#!l"\'olution$#ved!$xact%"ly#(mination+!s&!e',
+    '&#ing$#ple\'!s"\'cellent$"pt&$_for\'$that&#ion)"al)!s$"ss&#ive#%hange#$ited&$ment',
+    '#$lude\'!d%$sion\'"ve)"ly##use"&ecuted&#ion\'"ve)!s#%rcise(!d(!s"\'hausted#\'ibition',
+    '"#ist%"ed&#nce%#ing%!s#!t"$pand&"ed&#ing%$sion##ect&%ation+!s&"ed&#ing',
+    '$\'nditure%"se\'!s&#ive$&rience*!d*!s&$ment*"al*!s%!t&#ise&!s#$lain\'"ed',
+    '\'!s%&nation+!s$$icit("ly$#oit\'%ation%&ration&!e\'!d%$sion##ort&!s$#sed%#ure',
+    '\'"ed\'#ing("on*!s"$tend&"ed&#ing%$sion\'"ve%!t$$rnal#"ra%"ct%(ordinary$#eme',
+    '!"ye#!s !f!!.!!a"$bric""ce$!d$!s#\'ilities\'!y$"ng#!t$"or&#ies',
+    '&!y$!s#$ulty"#ded""il$"ed$#ing$!s$#ure#"nt#!r$"ly#"th""ll$"en',
+    '$!s#"se""me#%iliar&"es%!y##ous"!n#"cy#!s#$tasy"!r#%_from#!m$"er',
+    '$#ing$!s")scinating#$hion#!t$"er"!t#"al#!e##her&!s"#ult"$vour&$able&"ed',
+    '"!x!#ear$"ed$!s#$ture\'!d\'!s""b.#%ruary"!d#$eral&$tion"!e#!d$$back',
+    '#!l$#ing\'!s$!s#!s#!t""ll$"ow#!t"$male&!s#%inist"#nce"#rry#&tility',
+    '"#tch"!w#"er!$ibre"%ction"#eld%!s##rce"%fteen$!h$!y"!g#!.#"ht%#ing',
+    '&!s""le$!s#!l$"ed$#ing#!m$!s##ter"#nal%"ly$#nce&#ial#!d$#ing',
+    '$!s#!e$"st##ger&!s##ish&"ed&#ing""re$!d$!s#!m$"ly$!s#"st',
+    '"$scal#!h$#ing"!t#$ness#!s##ted$#ing""ve"!x#"ed!#lag##mes#"sh#!t',
+    '#$vour""ed#"et#"sh#!w#(xibility&"le"#ies##ght&!s"&oating#"od$!r%!s#"ra',
+    '$"er&!s$!s"#uid"!y##ing!$ocus%"ed"$lded#!k##low&"ed&#ing&!s""nd',
+    '$!s#!l#!t$$ball"!r#%_ever%&xample$(instance$$long#"ce%!d%!s$#ing#!d#%ecast',
+    '$#ign$"st&!s$#ver##get$#ive$"ot&#ten#!m$"al&"ly%!t&#ion$"ed%!r',
+    '$#ing$!s$#ula#"th%&coming$%night$%unate)"ly&!e$!y#"um#$ward\'!s"$ster"$ught',
+    '%%ation*!s%"ed&!r#!r$$teen%!h"!x!\'raction#&gments#"me%$work##nce%"is$!k',
+    '""ed#!e$#dom$"ly##nch#&quency\'!t("ly#"sh#"ud"$iday##end&"ly&!s\'#hip',
+    '""om$-_time_to_time#"nt#$wned##zen"#uit#(stration!#uck$#ing""el"$lfil#!l$%-time$!y"!n',
+    '("al(!s#!d$\'amental$"ed$#ing$!s#$eral#"ny"%rious#&niture#$ther\'$more"$sion"$ture',
+    ' !g!!.!&abriel""in$"ed$#ing$!s"\'lleries&!y""me$!s""ng"!p"$rage##den',
+    '#!y"!s#$tric""te$!s##her&"ed&#ing""ve"!y""ze!#ear"$nder#!e$#ral',
+    '&"te(!d\'#ion*!s%#ous$!s$#tic##tle&#man\'"en%!y#$uine\'"ly"#off%#rey',
+    '(!y##rge"$rman&!s&!y"%sture"!t#!s#$ting!$host!$iant""ft$!s""rl$&friend',
+    '""ve$!n$!s##ing!#lad##nce&!d#$sgow$!s%"es"$obal#"ry#\'ucester*%shire!!o',
+    '$!s"!d#!s""es"#ing""ld$"en#!f"!n#!e""od$#bye$$ness$!s"\'rbachev',
+    '"!t##hic"#uld"\'verning&$ment*!s&"or(!s!&rabbed#"ce#"de$%ually##ham#"in#$mmar',
+    '%&father%&mother$!t%"ed%!s#%phics#"sp$!s#%teful#"ve%!l$#ity#!y"#eat%"er',
+    '%"ly##ece$!k$!n$#ted#!w#!y"#ief#!n$#ned#!p"#oss##und&!s$!p',
+    '#!w$#ing$!n$!s$"th!(uarantee)!d$!d%#ian%!s"#ess%"ed$!t%!s"&idance',
+    '%!d%%lines#"lt%!y#%nness##tar""lf"!n#!s"!y#!s !h!!.!!a"#bit',
+    '"!d""ir""lf#!l#!t"!m#%ilton#&pshire""nd$"ed$#ful$$icap(#ped$"le&!d',
+    '$!s%#ome#!g$#ing"$ppen&"ed&#ing&!s$#ily%$ness$!y"%rbour#!d$"er$"ly',
+    '#!m$#ony##old#$riet%!s$!y#"sh##vey"!s"!t#!e$!d""ve##ing!!e',
+    '$"ed$#ing$&master$(quarters$!s#$ling$"th&!y#!r$!d$#ing$!t%!s#!t$!h',
+    '##ven$#ily$!y"#els"$ight""ld#"en#!l$!o#!p$"ed$#ful$#ing$!s"#nce',
+    '"!r#!e#%itage#!o#!s$#elf"\'sitated"!y!%idden#!e##ing"\'erarchy""gh$"er%"st',
+    ')"ed%!y""ll$!s"!m#$self""nt""re$!d"!s#&torian)!s\'!c("al&!y',
+    '#%herto##ler#!s"!v!#old$"er&!s$#ing\'!s$!s#!e$!s#$iday\'!s#$land',
+    '#!y""me$!s""n.##est&"ly$!y#!g##our&!s""ok""pe$!d$%fully$!s',
+    '"%rizon\'#tal#%rible$"or#"se%!s"&spital(!s#!t$#ile&#ity"!t#"el%!s""ur',
+    '#"se%$hold)!s%!s$#ing"!w##ard#$ever!#uge#!h$"es""ll"#man%#ity%!s',
+    '"%ndred\'!s#!g$#ary$"ry#!t$"er$#ing"%rried$!y#!t"%sband"!t!\'ydrogen"(pothesis',
+    '!!.""e.!"an!"bm!"ce"!i!#dea$!l%"ly$!s#&ntical&(fication("ed\'!y(#ing',
+    '#(ological\'!y!!e!!f!%gnore&!d%#ing!!i"!i!"ll#$egal#$ness#\'ustrate*!d)#ion',
+    '%!s$\'ination&!e\'!d"\'mediate)"ly$#nse"$pact#%erial#&lement)%ation)"ed$\'ication+!s%"ed',
+    '$!y##ort&$ance(!t)"ly&"ed&!s$"se&!d%%sible#&ressed\'#ion("ve$(isonment$#ove',
+    '\'$ment+!s&#ing!!n"0_accordance_with$\'ddition+#_to#$case$(harge_of$/onjunction_with&,nection_with#)favour_of$\'ront_of#\'general#)line_with',
+    '#$part\'&icular#+relation_to%(spect_of\'\'onse_to#%short$\'pite_of#(terms_of$+he_light_of$)ouch_with#\'view_of"(adequate#*ppropriate"!c#&entive',
+    '$"es#&idence\'!t(!s#%lined$#ude\'!d\'!s&#ing##ome&!s$(rporated#%rease(!d(!s',
+    '*"ly%%dible#%urred"$deed$(pendence*!t+"ly$!x#"ia%!n&!s$$cate(!d(!s\'#ing',
+    '$$rect$&vidual*!s#$uced$&strial("es\'!y"(evitable)!y"$fant#%ected&#ion#&lation$%uence)!d',
+    '\'$tial##orm&"al\'$tion&"ed")gredients")habitants#%erent%&itance\'"ed"%itial\'"ly&#ted\'#ive*!s',
+    '%#ies%!y"$land"!n#"er#%ocent$&vation"#put"%quiry"%sects##ide$#ght$"st&"ed#\'pection',
+    '$\'iration&"ed#)tallation\'"ed%#nce(!s&!t\'"ly$#ead\'#_of$%itute(#ion+"al+!s$&ructed',
+    '+!s&$ment*!s#)ufficient$%rance"$tact#%egral\'#ted(#ion&#ity$!l%\'lectual&&igence*!t$"nd',
+    '%"se&#ity\'"ve%!t&#ion)!s$\'raction%#est("ed(#ing(!s%$face&&erence%"im&"or',
+    '%#nal\'&tional%$pret)%ation)"ed%&rupted%#val(!s&&ention&#iew)"ed)!s#%imate#!o#&roduce',
+    '(#ing($tion"(variably$$sion#%ented$"st&"ed&%igate+!d*#ing+"on-!s&$ment*!s&#ors',
+    '$&tation%!e&!d#$olve\'!d\'$ment\'!s&#ing!&pswich!"ra#!n#!q$!i"%eland"#ish',
+    '"(relevant!!s"$abel"%lamic$"nd&!s#!e"&olated&#ion"$rael&!i"#sue%!d%!s!!t',
+    '$!y""em$!s"!s##elf!!v !j!!.!#ack$"et$#son""il"#mes"!n#!.',
+    '#$uary"#pan%#ese""zz!#ean$!s"#nny"#sus"!t"\'wellery##ish#!s!"im#"my!#oan',
+    '#!s"!e""hn$"ny$#son""in$"ed$#ing$!t""ke$!s"&nathan#"es"$rdan"$seph',
+    '\'#ist*!s%"ey"!y#"ce!$udge%!d%$ment%!s$$ment#%icial"#ice"#lia$!e%!t',
+    '""mp$"ed"&nction#!e##ior"*risdiction#!y""st$&_about$#ice%(fication\'"ed&!y !k!$aren',
+    '!#een#!p$"er$#ing$!s"#ith"#lly"!n#$nedy%"th#!t""pt"#vin"!y#!s',
+    '$"ed"!d#!s""ll$"ed%!r$#ing"!m""nd$"ly$!s#!g$#dom$!s#$nock',
+    '$"ed"!t#$chen!!m!#nee$!s#!w"#ife#%tting"#ock%"ed#!w$#ing$%ledge$!n',
+    '!#ong"#rea%!n!%uwait !l!!a"#bel%#led%!s#\'oratory$"ur""ce#!k$#ing"!d',
+    '##ies#!s#!y""id""ke$!s""mb##ont#!p"(ncashire&#ter#!d$"ed$#ing$$lord',
+    '%$cape#!e#%guage(!s"!p"#rge%"ly%!r%"st""st$"ed$#ing""te$!r$"st',
+    '##ter"#ugh%"ed%#ing%#ter##nch&"ed#"ra"!w#%rence#!s##yer&!s"!y#"er',
+    '##ing##out!!e""ad$"er&!s\'#hip$#ing$!s#!f$#let##gue#!n$"ed$#ing',
+    '%"ed%#ing%!t#"se$!t#$ther#"ve%!s$#ing"%cture\'!s"!d"!e#"ds""ft',
+    '#"al##end#(islation)"ve$&timate#!s"\'icester#$sure"#mon""nd$#ing##gth&!s"!s#!s',
+    '$"er$"on&!s"!t#"\'s##ter&!s$#ing"#vel%!s"#wis!(iability$"le"%beral&$tion',
+    '#&raries&!y"%cence%$sing"!e#!s""fe$$span$$time#!t$"ed$#ing"#ght%#ing%"ly',
+    '""ke$!d$&lihood%!y$!s$$wise""ly"#mit%&ations%"ed%!s"#nda#!e$"ar$!d',
+    '#\'guistic#!k$"ed$#ing$!s""on"!p#!s"$quid""sa#!t$"ed%!n&"ed&#ing',
+    '"!t#&erally&"ry&$ture##tle""ve$!d$"ly$!r%$pool$!s##ing"!z!$loyd!#oad',
+    '$!s#!n$!s"#cal%"ly$#ted%#ion(!s#!h#!k$"ed"#dge"!g#"ic%"al',
+    '##ely#!g$%-term$"er""ok$"ed$#ing$!s#"se""rd$!s#"ry"!s#!e##ing',
+    '$"es#!t"!t#!s""ud#"is%!e##nge""ve$!d$"ly$!r%!s$!s##ing',
+    '#"er%"ed$"st"#yal%"ty!"td#!.!#uck$!y#!y""ke""mp"#nch"$xury!$ying',
+    '!!.!!a"(astricht"%chine\'"ry\'!s"!d#!e"&gazine(!s##gie#"ic$\'strates#%netic$\'ificent',
+    '#!n$"ly$&stream$$tain("ed(#ing%&enance"#jor%#ity""ke$#-up$"rs$!s##ing"%lcolm',
+    '$!s"!n##age&!d&$ment&!r\'#ial\'!s%#ing#\'chester##ner#"or##ual$\'facture+!r',
+    '*#ing#!y"!p#!s"$rble#"ch#%garet$"in&"al#"ia$!e$"ne#!k$"ed%!t',
+    '&!s$#ing$!s#%riage%"ed$!y#%shall##tin#\'vellous#!x$#ist#!y""sk#!s$"es',
+    '##ter&!s"#tch%"ed&!s%#ing#!e$$rial(!s#)hematical*!s##rix##ter&!s$#hew',
+    '%#ity"!x#$imum#$well"!y#"be#"or!!e""al$!s#!n$#ing\'!s$!s$!t',
+    '$%while#$sure\'!d\'$ment+!s\'!s&#ing#!t"(chanical\'"sm)!s"#dia$#cal%#ine$$eval',
+    '$"um""et$#ing\'!s$!s"$mber&!s\'#hip#%orial&"es%!y"!n##tal&"ly$#ion',
+    '#!u"&rchant#!e$"ly##ger#"it""ss$#age\'!s"!t#"al##hod&!s##res$(opolitan',
+    '!"hm!&ichael#!k#&rosoft"!d##dle&&-class&\'sbrough#$land\'!s#%night"#ght#&ration""ke""ld',
+    '$!s#%itary#!k#!l$"er$#ion\'!s$!s##ton""nd$!s#!e$#ral%!s$!s',
+    '%"um$"ng$$ster(!s&"ry#"or%#ity#"us$"te&!s"$rror"\'serable%!y#\'leading#!s',
+    '$#ing%"on#$take\'!s"!x#"ed#$ture!!m!%obile%#ity""de$!l%!s$$rate%!n',
+    '%!t#%ified##ule&!s"\'lecular\'"es"$ment&!s"$nday#%etary$!y#$itor\'#ing#%opoly#$ster',
+    '%"ly%!s""od#!n#"re"#ral%#ity#!e$%_than$$over##gan#$ning##ris#&tality$$gage',
+    '#!t$"ly"$ther&!s##ion$&vation#"or"#unt%#ain(!s%"ed#"se#"th""ve$!d',
+    '(!s$!s#"ie$"ng"$zart!!p"!s!!r"!."!s#!.!!s!#uch"!d"&ltiple',
+    '#"my"$rder&"ed#%mured##ray"$scle&!s##eum&!s#"ic%"al%$ians#!t"&ttered##ual',
+    '"$self#\'terious&!y""th !n!"\'t!!a"#ils"#ked""me$!d$"ly$!s"\'rrative$"ow',
+    '"$tion&"al(#ist&!s$"ve#!o#$ural\'"ly%!e"#val#!y!#ear$"by$"er%"st',
+    '#!t$"ly")cessarily(!y&#ity#!k""ed$"ed$"le$!s"&gative#$lect\'"ed$&igence#&otiate',
+    '(#ing)"on+!s"\'ighbour)$hood)#ing)!s#!l#$ther"#rve%!s$#ous""st"!t#(herlands',
+    '\'!s"%utral"#ver%\'theless"!w#&castle#"ly#!s$%paper)!s##ton""xt$#_to!"hs!#ice',
+    '#!k"#gel#"ht%$mare%!s""ne$$teen("th%!y!!o"$-one"!."&_doubt#&longer##one',
+    '##ody"$dded"#ise""ne$\'theless#%sense"!r#$folk##mal&"ly%!n#"th%%-east%#ern##way',
+    '""se"!t#$able&!y#!e$!d$!s#$hing##ice&!d$"on#\'tingham""v.#"el%!s',
+    '"!w#%_that#%adays#$here!!t!&uclear"$mber&!s#%erous"#rse%"ry%!s$#ing !o!&\'clock',
+    '!%bject&#ion)!s\'"ve)!s&!s"(ligation*!s%"ed"%scure#(ervation+!s&!e\'!d\'!r',
+    '"$tain&"ed&#ing"%vious\'"ly!\'ccasion("al*"ly(!s#\'upation*"al%#ied$!r%#red&#ing',
+    '"#ean""t.#$ober!"dd#!s!!f"\'_course"!f#$ence\'!s%$ders%$sive$!r%"ed%#ing',
+    '##ice&!r\'!s&!s%#ial("ly(!s"#ten!!h!"il!!k""ay!"ld#*-fashioned#"er',
+    '"$iver"%ympic!&mitted!!n"*_behalf_of$$oard#+the_part_of$!o%$p_of""ce$&_again%$more"!e#(_another#!s',
+    '""to"%wards!"oh!#pen$"ed$#ing$"ly$!s#"ra%"te\'!d\'!s&#ing\'"on)"al',
+    '&"or(!s"%inion\'!s"&ponent(!s$)rtunities*!y$#sed%#ite\'#ion"(timistic$"on&!s!!r',
+    '##nge"\'chestra"#der%"ed%!s#%inary"#gan%"ic&&sation,!s\'!e(!d&&zation,!s\'"ed',
+    '&"al("ly&!s"&thodox!$ther%%_than%!s%$wise!$ught"!r#!s$%elves"!t##_of#$come',
+    '#$line\'!d$#ook##put#$side$\'tanding!#ven#!r$&_there$#all$$come$$head$%night$$seas$(whelming',
+    '#!d#!n"!n#"ed$!r%!s&#hip!%xford&%shire"$ygen!$zone !p!!.!#ace#$ific',
+    '$#age\'!s$"ed%!t""ge$!s""id#!n$#ful$!t%"ed&!r%#ing(!s#!r',
+    '"&kistan"$lace#!e#!m"!n#"el#"ic"#per%!s"\'ragraph$$llel##don##ent&"al&!s',
+    '%!h#!k$"ed%!r$#ing$!s#\'liament*#ary#!t$%-time$#ial\'"ly%\'cipants)"te*#ion',
+    '&$ular*"ly%"es$"ly$#ner\'!s(#hip$!s$!y""ss$#age$"ed%$nger)!s%!s',
+    '%"on%"ve#!t"!t#"ch#!h$!s#%ience&!t\'!s#$rick#$tern\'!s""ul#"se',
+    '"&vement"!y#$able##ing#$ment\'!s#!s!!c!$eace%#ful#!k#$sant\'!s"&culiar"!n',
+    '#"ce$"il#"ny#$sion\'#ers\'!s"$ople&!s"!r#%_cent#&ceived%"nt\'#age%%ption#$fect',
+    '$#orm\'$ance+!s\'"ed\'#ing#$haps##iod&!s#&manent)"ly$&ission%!t&#ted#\'sistent$"on',
+    '(#ity("ly&#nel&!s$\'pective$$uade(!d"!t#!e$!r#%ition##rol!!h"#ase"\'enomena',
+    '""il$"ip$$lips$)osophical)!y"#one%!d#"to%%graph*!s"$rase&!s"&ysical("ly&!s',
+    '""ck$"ed$#ing#$ture\'!s"#ece%!s"!g""le#"ot"!n#!k#!t""pe"!t',
+    '#!y!$lace%!d%!s$#ing#"in%$tiff#!n$!e%!t$#ned%#ing$!s$!t%"ed',
+    '%!s#$stic#"te%!s$$form#!y$"ed%!r&!s$#ing$!s"!c"&easant%!e&!d',
+    '##nty""ot""us!!m!%ocket&!s""em$!s#!t$"ry"#int%"ed%#ing%!s"$land',
+    '$!s##ice&#man\'"en%#ies%!y$"sh$"te%$ical)"ly\'$ians\'!s#!l$%ution#(ytechnic',
+    '""ol#!r"!p#!e#$ular\'#ity&$tion*!s""rt$"er$%folio$$rait"#sed#%ition(!s',
+    '("ly#$sess\'"ed\'#ion$)ibilities*!y&"le\'!y#!t$$-war$!s"!t#%atoes#&ential)"ly',
+    '%!s#!r$"ed"%verty"$wder#"er%#ful%!s!"p.!(ractical)"ly\'!e(!s&"se(!d',
+    '##ise#!y$"er"\'eceding$$ious%"se\'"ly&#ion#$dict\'"ed$)ominantly##fer&$ence&#red#&gnancy',
+    '#&judice#(liminary#$mier%#ses%"um#(paration&!e\'!d&#ing#\'scribed$$ence&!t\'%ation\'"ed\'#ing',
+    '%#rve(!d$&idency(!t)#ial$!s%"ed%#ing%#ure(!s$#ton$&umably#$tend$"ty#$vent',
+    '\'#ing("on$$ious("ly#!y"#ice%!s#"de##est#&marily&!y$!e$%itive##nce&"ss',
+    '\'"le)!s$!t%"ed&!r%#ing%!s#"or%#_to%%ities\'!y##son&"er(!s#$vate',
+    '&\'isation$%ilege#"ze")obability&"le\'!y$!e$#lem\'!s#&cedure)!s%"ed\'$ings\'!s%"ss',
+    '\'#ing\'"or#$duce\'!d\'!r(!s\'!s&#ing&!t\'#ion("ve)#ity\'!s#\'fession*"al',
+    '\'"or$#ile%!t&$able&!s$$ound#$gram\'"me)!s(#ing\'!s%#ess(#ive#$ject\'!s',
+    '%"se\'!d\'!s&#ing$#ote\'!d&#ing\'"on$$pted#\'nounced#"of##per&"ly&$ties\'!y',
+    '*!s%#sal(!s&!e\'!d&%ition#(secution$$pect(#ive(!s#$tect\'"ed\'#ing("on("ve',
+    '\'!s%"st\'#ant\'"ed\'!s#"ud#"ve%!d$#ide\'!d\'!s&#ing%#nce\'#ial%$sion',
+    '!,sychological)!y!"ub##lic&%ation+!s&#ity&"ly%"sh\'"ed(!r)!s\'#ing#!s""ll',
+    '$#ing""mp"#nch#\'ishment"#pil%!s"&rchase(!d(!r\'#ing#!e$"ly##ple$#ose\'!s',
+    '&!d%"it""sh$"ed$#ing"!t#!s#$ting"%zzled !q!#.v.!,ualification-!s\'"ed&!y',
+    '&!y#\'ntities\'!y#$rter\'!s"#een#%stion("ed(#ing(%naire(!s"#ick%"ly#!d#"et',
+    '#"te"#ote%!d !r!!.!%abbit""ce$!s##hel##ial$"ng"\'diation$#cal$!o"!f',
+    '""id#!l$#way\'!s#!n#"se%!d%!s$#ing"#lly#"ph"!n##dom#!g$!e',
+    '$#ing#!k$!s""pe#"id%"ly""re$"ly""te$!s##her&%_than#"io%#nal#!s',
+    '"!y!!e"#ach%"ed&!s%#ing$!t%#ion(!s#!d$"er&!s$#ily%"ng$!y',
+    '$#ise\'!d&#tic%"ty%"ze\'!d$"ly#!r##son&$able)!y&#ing&!s"$bels"$call',
+    '#$eive\'!d\'!r\'!s&#ing$"nt&"ly$%ption$%ssion##ipe##kon#&ognise)!d\'$tion\'"ze',
+    '$%mmend)%ation.!s)"ed$"rd&"ed&#ing&!s$#ver\'"ed\'!y#(ruitment"!d##uce&!d',
+    '%$tion)!s$%ndant"!f#"er%"ee&#nce)!s\'#dum%#red&#ing%!s#$lect\'"ed\'#ing',
+    '\'!s##orm&!s#%ugees$#sal%!e&!d%#ing"$gard&"ed&#ing&$less##ime&"nt$"on',
+    '&!s$$ster("ed&&ration##ret#$ular\'"ly&$tion*!s\'#ory"#ign#\'nforced"$ject&"ed&#ion',
+    '&!d&!s%#ing&"on(!s)#hip,!s&"ve("ly(!s$!x%"ed#$ease\'!d$%vance',
+    '#%iable$"ed%!f%#ved$$gion\'"us#&uctant#!y"$main&#der&"ed&#ing&!s$"rk&$able',
+    '&"ed&!s##edy$$mber("ed(#ing##ind&"ed##ote$#val%!e&!d%#ing"%newed#!t',
+    '&!s##eat&"ed("ly#$lace\'!d\'$ment&#ing$#ied$!y##ort&"ed("ly\'!r&#ing',
+    '#&resent)%ation.!s,"ve.!s)"ed)#ing)!s#%ublic("an(!s$&tation"%quest\'"ed\'!s',
+    '\'!d\'$ment+!s\'!s&#ing"$scue#%earch(#ers$#rve\'!d\'!s#&idence\'!t(#ial(!s',
+    '&"ed$"st&$ance#\'olution%"ve\'!d$"rt$$urce(!s#$pect\'$able\'"ed\'#ive*"ly\'!s',
+    '\'"ed&"se(!s\')ibilities-!y)"le#!t$&aurant*!s$#ing$\'oration&!e\'!d$&ricted(#ion',
+    '##ult&"ed&#ing&!s"$tail%!n&"ed#$ired&$ment#$reat##urn&"ed&#ing&!s"$veal',
+    '&#ing&!s$#nue\'!s$#rse##iew&"ed&!s$#sed$#val#\'olution*#ary"$ward&!s!%hythm',
+    '#!h$#ard"!d#!e#"ge#\'iculous$"ng"#ght%"ly%!s#"id""ng$#ing$!s""se',
+    '$!s##ing#!k$!s"$tual"#val%!s#"er%!s!#oad$!s"!b##ert&!s#"in',
+    '#"yn""ck$!s"!d"#ger""le$!s#!l$"ed$#ing$!s"#man%#tic#!e"!n',
+    '#!m$!s#!t$!s""pe""se$!s#!s"#ugh%"ly#"nd%"ed%!s#"te%!s',
+    '"#ver"!w#!s"!y#"al!%ubber$#ish"#gby""le$!d$!s##ing"%mours"!n#$ning',
+    '"#ral""sh$"ed#$sell$"ia&!n\'!s""th !s!!.!!a"$cred"!d#"ly""fe',
+    '$!r$"ty""id#!l$#ing#"nt""ke"$lary#!e$!s#"ly##mon#!t"!m#!e',
+    '&!s##uel"!n#&ctions#!d$!y#!g#"ta""ra$!h"!t#&ellite#)isfaction)#ory&#ied',
+    '#%urday"#uce#"di""ve$!d##ing&!s"!w"!y##ing#!s!$cale%!s#$ndal#%rcely',
+    '$#let#&ttered"#ene%!s"&hedule(!d$"me&!s##ool&!s"%ience\'!s%%tific\'"st)!s',
+    '#"re%!d%!s$#ing#%tland$!s$!t%#ish"\'reaming$"en&#ing##ipt#%utiny"\'ulpture!"ea',
+    '$"ed##rch&#ing##son&!s#!t$"ed$!s"$cond&#ary&"ly&!s##ret&#ary&!s',
+    '\'!s$"or&!s##ure&!d%%ities\'!y"!e#!d$!s##ing#!k$#ing$!s#!m',
+    '$%ingly$!s#!n#!s"$ized"$ldom##ect&"ed&#ion\'"ve#!f#!l$"er$#ing"&mantic',
+    '#!d$#ing##ior#&sation$!e%!s$$ible%$tive(#ity#!t$$ence(!d(!s"&parate(!d',
+    '\'#ion#"t.$%ember"&quence(!s"&rgeant##ies$#ous\'"ly#"um#$vant\'!s$!e%!d%!r',
+    '$#ice\'!s%"ng"%ssion\'!s"!t#!s#$ting$"le&!d&$ment*!s"#ven%$teen)"th',
+    '&!y$#ral%!e&"ly"!x##ual&#ity!$hade$"ow&!s#"ke%&speare$#ing#"ll%"ow',
+    '#"pe%!d%!s#"re%!d%\'holders%!s$#ing$!p%"ly"!e#!d#"ep$!r$!t',
+    '#&ffield#"lf$!l$#ter$#ves"$ield#"ft%"ed%!s#$ning#!p$$ping$!s#"rt#!t',
+    '%"ed#"es#"ok$!t%#ing#!p$$ping$!s#"re$!t%%-term%#age%"er%"ly#!t',
+    '##uld&"er(!s$!t%"ed%#ing#!w$"ed%!r$#ing$!n$!s"&rugged""ut"!y',
+    '$$ness""de$!s""gh$"ed$!t#!n$"al&!s$"ed$(ificance*!t+"ly%"ng$!s',
+    '%!t&"ly#!k#"ly##ver"%milar\'"ly#"on##ple%!y#+ultaneously"!n#"ce#!g$"er',
+    '$"le#!k"!r"$ster&!s"!t#!e$!s#!s#$ting#%uated&#ion)!s"!x#$teen',
+    '$#ies$!y""ze$!s!$kill%"ed%!s#!n#"rt"!y!$leep%#ing#"pt""id$!e',
+    '&"ly#!m#!p$#ped"#ope#!w$"ly!$mall%"er#"rt"#ell"#ile%!d$#ing#"th',
+    '$#ing##oth!&napped""ow!!o"\'-called"#_as#&far_as#\'long_as#$that""ap"$ccer##ial&#ism(!t',
+    '$%eties&!y$%ology""ft$"ly$$ware""il"#lar#!d$#ier\'!s#!e$"ly#&icitor)!s',
+    '#!o#%ution(!s#"ve%!d""me$$body$#how$#one$$rset$%thing%$imes$$what&#ere"!n',
+    '$!s#!s""on$"er"$phie%(sticated"#rry#!t$#_of$"ed$!s"$ught#!l#"nd%"ed',
+    '#!p##rce&!s#"th%%-east%#ern")vereignty##iet!$pace%!s#"in#$nish#"re#$tial"#eak',
+    '\'!s%#ing%!s#$cial\'#ist*!s\'"ly%"es%#fic($ally)$tion\'"ed&!y%$mens$\'tacular',
+    '$\'ulation##ech$!d#"ll#$ncer$!d%#ing$!t"$here"$irit&!s&#ual"&lendid#"it"#oke',
+    '%$sman#&nsored\'$ship#"rt%#ing%!s#!t$!s$#ted"$read&#ing##ing!$quad%#ron$"re',
+    '"!."\'ability$"le#"ff#"ge%!s##irs#"ke#"mp##nce$!d%#ard(!s%#ing%!s',
+    '#!r$!e%!d$#ing$!s$!t%"ed%#ing%!s#"te%!d%$ment)!s%!s$"ic',
+    '\'!s%&stical)!s$"us%"te&#ory#!y$"ed$#ing"&eadily%!y$!m#"el$!p#!m',
+    '$#hen$#ped$!s#%rling#"ve%!n#$wart"#ick%!s#"ff#"ll#%mulus#!r"#ock%!s',
+    '#$mach#"ne%!s#"od#!p$#ped%#ing$!s#$rage$!e%!d%!s$#ies$!m$!y',
+    '(\'forward%!n$#nge\'!r$%tegic("es\'!y$!w##eam$"et&!s$$ngth("en$"ss&"ed',
+    '\'"ed\'#ing##ict&"ly$"ke&!r&!s%#ing$"ng&!s$!p##oke$"ng&"er&"ly',
+    '%%tural(!e)!d)!s$$ggle(!d\'#ing"$uart#"ck#$dent\'!s$#ied&!s%!o$!y',
+    '#"ff##pid"#yle%!s!&ubject\'#_to\'"ed\'!s##mit&#ted#\'sequent*"ly$&idiary$%tance)!s',
+    '+"ly%%itute##tle"%cceed\'"ed%"ss\'#ful*"ly\'#ion("ve\'"or#!h$#_as%$that"$dden',
+    '"!e"$ffer&"ed&#ing$&icient*"ly$#olk"#gar#$gest\'"ed\'#ing("on*!s\'!s"%icide',
+    '$$able$!e%!d$!s"!m#$mary$"er$"it#!s"!n##day$&erland#%light#%shine"#per',
+    '%#ior%&vision##per$&lement%#ied\'!r(!s\'!s%!y$#ort\'"ed("rs\'#ing\'!s%"se',
+    '#$reme""re$"ly#$face\'!s#$gery#$plus$$rise(!d\'#ing*"ly##rey$&ounded(#ing+!s',
+    '&!s$$ival&!e\'!d&#ing"#san#$pect\'"ed%$nded&$sion$%icion("us##sex#$tain\'"ed',
+    '"#eat##den#"et#"pt"#ift%"ly#!m$$ming#$ndon$!g#"ss##tch&"ed$\'zerland"#ord',
+    '!%ymbol&"ic&!s#(pathetic\'!y$$toms"&ndrome#&thesis"$stem&$atic&!s !t!!.!!a"#ble',
+    '"$ckle#$tics""il""ke$!n$!s##ing""le$"nt$!s#!k$"ed$#ing$!s#!l',
+    '$!s"!p#!e$!s"$rget&!s""sk$!s#"te"$ught"!x#%ation#"es#!i"$ylor',
+    '#"ch%"er\'!s%#ing#!m$!s#!r$!s"\'chnical&#que)!s%(ological*"es)!y"#eth',
+    '#/ecommunications$%graph$%phone$&vision#!l$#ing$!s"$mper&%ature+!s$"le$\'orarily(!y$#ted"!n',
+    '&!s#!d$"ed%#ncy%!r$!s##nis#"se$#ion""rm$$inal$!s#$race$$ible\'!y',
+    ')"es(!y$"or$!y""st$%ament$"ed$#ing$!s""xt$!s!!h"$ames#!n$!k',
+    '#!t$#_is$$cher"!e#$atre#"ft#"ir#!m$!e%!s$&selves#!n#(oretical%#ies%!y',
+    '$!e%%after%"by%$fore#"se$"is#!y"#ick#!n$!g%!s$!k%#ing%!s#"rd',
+    '%!y#!s"$omas$$pson#\'roughly#"se##ugh&!t\'!s$$sand(!s"$reat&$ened(#ing&!s',
+    '$!w##oat$"ne$#ugh\'#out$!w%#ing%!n##ust"&ursday#!s!%icket&!s""de"!e',
+    '#!s"#ght%"ly"#les#!l"!m##ber#!e$!s##ing"!n#!y"!p#!s"#red',
+    '"#tle%!s!!o"%bacco"#day"&gether(%_with"$ilet""ld"!m#"my#%orrow""ne##gue#$ight',
+    '#!s#!y"!o#!k#!l$!s"!p#"ic%!s"$ries#!n#!y"#tal%"ly"#uch',
+    '%#ing#"gh#!r$#ism&!t\'!s$&nament"$ward&!s#"er#!n$!s"#xic!$race$!k',
+    '#"de%"rs%!s$#ing%$tion)"al+"ly)!s#$ffic#$gedy$"ic#"il$!n%"ed%#ing',
+    '#(nsaction+!s%#fer(#red&(ormation)"ed%%ition%%lated(#ion%\'mission%$port#!p$#ped##vel&#led',
+    '\'#ing#!y"&easury$!t%"ed%#ing%$ment%!y#!e$!s#\'mendous#"nd%!s##vor"#ial',
+    '#%bunal%"te#"ck#"ed$!s#!p$!s#$umph"$oops##phy$$ical#$uble\'!d$$sers"#uck',
+    '#"ly#"st%#ees%!s#"th"!y##ing!#ube"%esday""ne##nel"$rkey$#ish#!n$"ed',
+    '$$over$!s!!v!%welve#&ntieth%!y"#ice#!n#"st%"ed"!o!#ype$!s#$ical\'"ly',
+    '!#gly!!k!%lster"&timate("ly!!n"$able#)cceptable#$ware"\'certain)"ty#"le#*omfortable$\'nscious"#der',
+    '%%lying%%neath%%stand*#ing\'#ood%$take)!n(#ing#(oubtedly"(employed($ment#\'xpected"$fair#(ortunate+"ly',
+    '"%iform#"on%!s##que#!t$"ed$!s$!y#&versal\'!e\'%ities)!y#!x"%known"$less',
+    '&"ly")necessary"(pleasant"#til"%usual!!p"#_to"$date""on"#per"%right"#set#%tairs"%wards!$rban',
+    '$!d$"nt!!s"!a#"ge"!e#!d##ful#$less#!r$!s#!s"#ing""sr"#ual',
+    '!&tterly !v!!.!$ague"#lid%#ity##ley#%uable$!e%!d%!s"!n"&riable(!s%$tion',
+    '$"ed%!s%$ties&!y$#ous#!y$#ing""st"!t!)egetables"%hicle\'!s"$ndor#$ture#"ue',
+    '#$dict#"se$#ion\'!s#%tical#!y"$ssel&!s!!i"!a""ce##tim&!s$$oria(!n',
+    '"#deo%&-taped"$enna#$tnam#!w$"ed$#ing$!s"#lla%"ge\'!s"&olence&!t"$rgin&"ia',
+    '%!e#"us"%sible$"on$!t%"ed%#ing%"or\'!s%!s##ual"#tal!)ocabulary"#ice%!s',
+    '&!s$%ntary&$eers""te$!d$"rs$!s##ing!)ulnerable !w!!.!#age$!s"#ist#!t',
+    '$#ing""ke"#les#!k$"ed%!r$#ing$!s#!l$!s##ter"!n#!t$"ed$#ing',
+    '"!r#!d#!m$"th##ned$#ing#!s"!s#!h$"ed$#ing\'#ton#"te%!d"#tch',
+    '%#ing#"er%!s##son""ve$!d$!s"!y#!s!!e""ak$$ness##lth&!y##pon',
+    '#!r$#ing#$ther"%dding#&nesday"!e#!k$#end$"ly$!s"$ight"%lcome\'!d#$fare#!l',
+    '$!s#"sh""nt""re""st$#ern$\'minster"!t!#hat$$ever"#eel%!s#!n$$ever#"re',
+    '%"by%#ver#$ther\'\'_or_not"#ich#"le$"st##sky$%pered#"te"!o#$ever#"le$"ly#!m',
+    '"!y!#ide$"ly$!r$&spread#"ow""fe""ld$$life#!l$#iam\'!s%!e%"ng\'$ness',
+    '"\'mbledon"!n#!d$"ow&!s$!s#!e#!g$!s##ner&!s$#ing#!s##ter"#ped',
+    '"$sdom#!e#!h$"ed%!s$#ing""th$*_regard_to\'(spect_to$$draw("al(!n$"in$#out#$ness',
+    '"#ves!!o""ke"#man#"en"!n##der&"ed&#ful&#ing""od$"en$!s#!l""rd',
+    '#!e#!k$"ed%!r&!s$%force$#ing\'&-class$!s%#hop(!s#"ld%$wide#!n#$ried',
+    '$!y%#ing#"se$#hip$!t#"th%%while%!y"#uld#"nd%"ed!&rapped"$ight#"te%!r',
+    '%!s$#ing$#ten"#ong#"te !x !y!!a""rd$!s!!e""ah#!r$!s"$llow',
+    '"!p"!r"!s#&terday"!t!$ield!!o""rk$%shire"!u#"ng%"er&"st%%sters#!r',
+    '%#elf#"th!)ugoslavia \'zealand""ro!#one',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_02 = (
+count_02 = 6694
+
+heads_02 = (
     '%',
-    '&agr',
-    '&bgr',
-    '&frac12',
-    '&pound;1,000',
-    '&pound;10',
-    '&pound;10,000',
-    '&pound;100,000',
-    '&pound;15',
-    '&pound;150',
-    '&pound;2',
-    '&pound;2,000',
-    '&pound;20',
-    '&pound;20,000',
-    '&pound;200',
-    '&pound;25',
     '&pound;250',
-    '&pound;3',
-    '&pound;30',
-    '&pound;300',
-    '&pound;40',
-    '&pound;400',
-    '&pound;5',
-    '&pound;5,000',
-    '&pound;50',
-    '&pound;50,000',
-    '&pound;500',
-    '\'ave',
-    '\'cos',
-    '\'e',
-    '-1',
-    '/',
     '0.5',
-    '01',
-    '02',
-    '1%',
-    '1,500',
-    '1.1',
-    '1.2',
-    '1.5',
-    '10.30',
-    '100%',
-    '100,000',
-    '1000',
-    '10th',
-    '110',
-    '11th',
-    '120',
     '125',
-    '12th',
-    '130',
-    '13th',
-    '140',
-    '14th',
-    '15%',
-    '15th',
-    '160',
-    '16th',
-    '17th',
-    '180',
-    '1870',
-    '1880',
-    '1880s',
-    '1890',
     '18th',
-    '1900',
-    '1902',
-    '1905',
-    '1906',
-    '1907',
-    '1908',
-    '1909',
-    '1910',
-    '1911',
-    '1912',
-    '1913',
-    '1914',
-    '1915',
-    '1916',
-    '1917',
     '1918',
-    '1919',
-    '1920',
-    '1920s',
-    '1921',
-    '1922',
-    '1923',
-    '1924',
-    '1925',
-    '1926',
-    '1927',
-    '1928',
-    '1929',
-    '1930',
-    '1931',
-    '1932',
     '1933',
-    '1934',
-    '1935',
-    '1936',
-    '1937',
-    '1938',
-    '1940s',
-    '1941',
-    '1942',
-    '1943',
-    '1944',
-    '1946',
-    '1949',
-    '1951',
-    '1952',
-    '1953',
     '1954',
-    '1955',
-    '1956',
-    '1958',
-    '1990s',
-    '1995',
-    '1996',
-    '1997',
-    '2.0',
-    '2.1',
-    '2.2',
-    '2.3',
-    '2.5',
-    '20%',
-    '20,000',
-    '200,000',
     '20th',
-    '21st',
-    '25%',
-    '250',
-    '25th',
-    '26th',
-    '2nd',
-    '3,000',
-    '3.1',
-    '3.2',
-    '3.3',
-    '3.5',
-    '30%',
-    '30,000',
-    '3000',
-    '350',
     '3rd',
-    '4,000',
-    '4.1',
-    '4.2',
-    '4.3',
-    '4.5',
-    '40%',
-    '40,000',
-    '46',
-    '47',
-    '49',
-    '4th',
-    '5%',
-    '5,000',
-    '5.1',
-    '5.2',
     '50%',
-    '50,000',
-    '51',
-    '52',
-    '53',
-    '54',
-    '56',
-    '57',
-    '58',
-    '59',
-    '5th',
-    '6,000',
-    '60%',
-    '600',
-    '61',
-    '62',
     '63',
-    '64',
-    '66',
-    '67',
-    '68',
-    '69',
-    '6th',
-    '70%',
-    '700',
-    '71',
-    '72',
-    '73',
-    '74',
-    '76',
-    '77',
-    '78',
     '79',
-    '7th',
-    '80%',
-    '800',
-    '81',
-    '82',
-    '83',
-    '84',
-    '85',
-    '86',
-    '87',
-    '88',
-    '89',
-    '8th',
-    '90%',
-    '91',
     '92',
-    '94',
-    '95',
-    '95%',
-    '99',
-    '9th',
-    'a.c.',
-    'a.m.',
-    'a_good_deal',
-    'a_great_many',
-    'aa',
-    'abandoning',
-    'abandonment',
-    'abbot',
-    'abdominal',
-    'abingdon',
     'abnormal',
-    'abnormalities',
-    'aboard',
-    'abolish',
-    'abolished',
-    'abolition',
-    'abraham',
-    'abrupt',
-    'absorb',
-    'absorbing',
-    'absorption',
-    'abstraction',
-    'absurd',
-    'abu',
-    'abundance',
-    'abundant',
     'abused',
-    'abuses',
-    'ac',
-    'academics',
-    'accelerate',
-    'accelerated',
-    'acceleration',
-    'accents',
-    'accepts',
-    'accession',
-    'accessories',
-    'accidental',
-    'accidentally',
-    'accommodated',
-    'accompaniment',
-    'accompany',
     'accompanying',
-    'accomplished',
-    'accord',
-    'accorded',
-    'accountable',
-    'accountancy',
-    'accountant',
-    'accumulated',
-    'accumulation',
-    'accusation',
-    'accusations',
-    'accusing',
-    'accustomed',
-    'aching',
-    'acids',
-    'acknowledgement',
     'acknowledges',
-    'acknowledging',
-    'acoustic',
-    'acquaintance',
-    'acquiring',
-    'acquisitions',
-    'acre',
-    'activated',
-    'activating',
-    'activation',
-    'activists',
-    'actress',
-    'ad_hoc',
-    'adams',
-    'adapt',
-    'adaptation',
     'addiction',
-    'addictive',
-    'additionally',
-    'additions',
-    'addressing',
-    'adequately',
-    'adjacent',
-    'adjacent_to',
-    'adjective',
-    'adjectives',
-    'adjoining',
-    'adjourned',
-    'adjust',
-    'adjusted',
-    'adjusting',
-    'adjustments',
     'administer',
-    'administered',
-    'administrator',
-    'administrators',
-    'admirable',
-    'admiral',
-    'admiration',
-    'admire',
-    'admired',
-    'admissions',
-    'admittedly',
-    'admitting',
-    'adolescence',
-    'adolescent',
-    'adopting',
-    'adrian',
     'ads',
-    'advancement',
-    'advancing',
-    'advent',
-    'adventurers',
-    'adventures',
-    'adventurous',
-    'adversely',
-    'advert',
-    'advertise',
-    'advertised',
-    'advertisement',
-    'advertisements',
-    'advisable',
-    'advising',
-    'advocate',
     'advocated',
-    'advocates',
-    'aea',
-    'aerial',
-    'aeroplane',
-    'aerospace',
-    'affinity',
-    'afforded',
-    'afghanistan',
-    'africans',
-    'aftermath',
-    'afternoons',
-    'ag',
-    'agitation',
-    'agnes',
-    'agony',
     'agreeing',
-    'agrees',
-    'ahmed',
-    'aided',
-    'aiming',
-    'airborne',
-    'airfield',
-    'airline',
-    'airlines',
-    'airways',
-    'aisle',
-    'akin',
-    'alain',
-    'alarmed',
-    'alarming',
-    'alas',
     'albania',
-    'albums',
-    'alcoholic',
-    'ale',
-    'alec',
-    'alerted',
-    'alexandra',
-    'alexei',
-    'algae',
-    'algeria',
-    'algorithm',
-    'all_the_same',
-    'allan',
-    'allegedly',
-    'allegiance',
-    'alley',
     'alliances',
-    'allocate',
-    'allocations',
-    'ally',
-    'aloud',
-    'alpha',
-    'alpine',
-    'alps',
-    'altar',
-    'alteration',
-    'alterations',
-    'altering',
-    'alternate',
-    'althusser',
-    'altitude',
-    'alton',
     'aluminium',
-    'amanda',
-    'amazed',
-    'amazement',
-    'ambassador',
-    'amber',
-    'ambiguity',
-    'ambiguous',
-    'ambitions',
-    'amended',
-    'amendments',
-    'amenities',
-    'americas',
-    'amid',
-    'amidst',
-    'amino',
     'amiss',
-    'ammunition',
-    'amnesty',
-    'amounted',
-    'amp',
-    'ample',
-    'amsterdam',
-    'amused',
-    'amusement',
-    'amusing',
-    'amy',
-    'an\'',
-    'ana',
-    'anal',
-    'analogous',
-    'analogue',
     'analogy',
-    'analysing',
-    'analyst',
-    'analysts',
-    'analytical',
-    'anatomy',
-    'anc',
-    'ancestors',
-    'anchor',
-    'and_so_forth',
-    'andrews',
-    'angela',
-    'angeles',
-    'angels',
-    'anglers',
-    'anglia',
     'anglican',
-    'anglo-saxon',
-    'angrily',
-    'anguish',
-    'angular',
-    'angus',
-    'animated',
-    'ankle',
-    'ankles',
-    'annie',
-    'announce',
-    'announcing',
-    'annoyance',
-    'annoyed',
-    'annoying',
-    'annually',
     'anselm',
-    'ant',
-    'antarctic',
-    'anthropologists',
-    'anthropology',
-    'antibiotics',
-    'antibodies',
-    'antibody',
-    'anticipate',
-    'anticipation',
-    'antique',
-    'antiques',
-    'antonio',
-    'ants',
-    'anxieties',
-    'anxiously',
     'any_longer',
-    'anyhow',
-    'anything_but',
-    'apartments',
-    'apologies',
-    'apologise',
-    'apology',
-    'appalled',
-    'appalling',
-    'apparatus',
-    'appealing',
-    'appearances',
-    'appellant',
-    'appetite',
-    'applause',
-    'apples',
     'appliances',
-    'appoint',
-    'appraisal',
-    'apprehension',
-    'apprentice',
-    'apprenticeship',
-    'appropriately',
-    'appropriation',
-    'approve',
-    'approximate',
-    'apron',
-    'apt',
-    'aquarium',
-    'aquitaine',
-    'arabia',
-    'arabic',
     'arable',
-    'arabs',
-    'arbitrary',
-    'arbitration',
-    'arc',
-    'arch',
-    'archaeological',
-    'archaeology',
-    'arched',
-    'archer',
-    'arches',
-    'architects',
-    'archive',
-    'archives',
-    'arctic',
-    'arena',
     'argentina',
-    'arguably',
-    'arisen',
-    'aristocracy',
-    'aristocratic',
-    'arithmetic',
-    'armchair',
-    'armies',
-    'armour',
-    'armoured',
-    'armstrong',
-    'arnold',
-    'aroused',
-    'arranging',
-    'array',
-    'arrears',
     'arrests',
-    'arrives',
-    'arrogance',
-    'arrogant',
-    'arrow',
-    'arrows',
-    'arse',
-    'artefacts',
-    'arthritis',
-    'articulate',
-    'articulated',
-    'artillery',
-    'as_a_whole',
-    'as_against',
-    'as_good_as',
-    'as_it_were',
     'as_of',
-    'as_regards',
-    'ascent',
-    'ascertain',
-    'ashamed',
-    'ashdown',
-    'ashes',
-    'ashley',
-    'ashore',
-    'ashton',
-    'aspirations',
-    'assassination',
-    'assaulted',
-    'assaults',
-    'assay',
-    'assemble',
     'assemblies',
-    'assent',
-    'assert',
-    'asserted',
-    'assertion',
-    'assessments',
-    'assignment',
-    'assignments',
-    'assistants',
-    'assisted',
-    'assisting',
-    'associates',
-    'assumes',
-    'assurances',
-    'assure',
-    'asthma',
     'aston',
-    'astonished',
-    'astonishing',
-    'astonishment',
-    'asylum',
-    'at&amp;t',
-    'at_best',
-    'at_large',
-    'at_length',
-    'at_random',
-    'athelstan',
-    'athens',
-    'athletes',
-    'athletic',
-    'athletics',
-    'atkinson',
     'atmospheric',
-    'atom',
-    'atomic',
-    'atoms',
-    'attach',
-    'attachment',
-    'attacker',
-    'attain',
-    'attained',
-    'attainment',
-    'attendant',
-    'attic',
-    'attorney',
-    'attorney-general',
-    'attracting',
-    'attractions',
     'attracts',
-    'attributable',
-    'attribute',
-    'attributes',
-    'auckland',
-    'audiences',
-    'audio',
-    'auditing',
-    'auditor',
-    'auguste',
-    'auntie',
-    'aura',
-    'austerity',
-    'austin',
-    'austrian',
-    'authentic',
     'authorised',
-    'authoritarian',
-    'authoritative',
-    'authorized',
-    'autobiography',
-    'autonomous',
-    'aviation',
-    'avoidance',
-    'avoids',
-    'avon',
-    'await',
-    'awaited',
-    'awaiting',
-    'awe',
-    'axe',
-    'axes',
     'axis',
-    'b.c.',
-    'ba',
-    'bach',
-    'bachelor',
-    'back-up',
-    'backdrop',
-    'backgrounds',
-    'backward',
-    'bacterial',
-    'badge',
-    'baggage',
-    'baghdad',
-    'bail',
-    'bailey',
-    'bait',
     'bake',
-    'baked',
-    'baking',
-    'balances',
-    'balancing',
-    'balcony',
-    'bald',
-    'baldwin',
-    'balloon',
-    'ballot',
-    'baltic',
-    'banana',
-    'bananas',
-    'banbury',
-    'banged',
-    'banging',
     'bangkok',
-    'bangladesh',
-    'bangor',
-    'banker',
-    'bankers',
-    'bankrupt',
-    'bankruptcy',
-    'banner',
-    'banning',
-    'baptism',
-    'baptist',
-    'barber',
-    'barcelona',
-    'barclays',
-    'bargain',
-    'bark',
     'barker',
-    'barking',
-    'barley',
-    'barnett',
-    'baron',
-    'baroque',
-    'barracks',
-    'barrage',
-    'barred',
-    'barrel',
-    'barrels',
-    'barren',
-    'barrett',
-    'barrister',
-    'barrow',
-    'barton',
     'basal',
-    'baseball',
-    'baseline',
-    'basement',
-    'basil',
-    'baskets',
-    'basque',
-    'bastards',
-    'bat',
-    'batch',
-    'bates',
-    'bathing',
-    'baths',
-    'bats',
-    'batsman',
-    'battalion',
     'battered',
-    'batteries',
-    'batting',
-    'battles',
-    'battling',
-    'batty',
-    'baxter',
-    'bc',
-    'beaches',
-    'beads',
-    'beam',
-    'beams',
-    'bean',
-    'beard',
-    'beast',
-    'beasts',
     'beats',
-    'beck',
-    'bedding',
-    'bedford',
-    'bedside',
-    'bee',
-    'beech',
-    'beers',
-    'bees',
-    'beethoven',
-    'beforehand',
-    'beg',
-    'begged',
-    'begging',
-    'beginnings',
-    'behaved',
     'behaving',
-    'behavioural',
-    'behaviours',
-    'beijing',
-    'beirut',
-    'belgian',
-    'belinda',
-    'bella',
-    'bells',
-    'belly',
-    'beloved',
-    'belts',
-    'benches',
-    'bending',
-    'benedict',
-    'beneficiaries',
     'beneficiary',
-    'benefited',
-    'benign',
-    'benn',
-    'bennett',
-    'benny',
-    'benson',
-    'berkeley',
-    'berkshire',
-    'bernice',
-    'berry',
-    'bert',
-    'beta',
-    'beth',
-    'betrayal',
-    'betrayed',
     'betting',
-    'beware',
-    'bewildered',
-    'biased',
-    'biblical',
-    'bicycle',
-    'bidding',
-    'bids',
-    'bikes',
-    'bilateral',
-    'bin',
-    'binary',
-    'bind',
-    'binoculars',
-    'biography',
-    'biology',
     'biopsy',
-    'births',
-    'biscuit',
-    'biscuits',
-    'bitch',
-    'biting',
-    'bitterly',
-    'bitterness',
-    'bizarre',
-    'blackburn',
-    'blackmail',
-    'blackpool',
-    'bladder',
-    'blade',
-    'blades',
-    'blah',
     'blair',
-    'blake',
-    'blaming',
-    'blanche',
-    'bland',
-    'blanket',
-    'blankets',
-    'blasted',
-    'blaze',
-    'blazing',
-    'bleak',
-    'blend',
-    'bless',
-    'blessed',
-    'blessing',
-    'blinked',
     'bloc',
-    'blocking',
-    'blond',
-    'blonde',
-    'bloom',
-    'blouse',
-    'blowing',
-    'blows',
-    'blunt',
-    'blurred',
-    'bmw',
-    'boarding',
-    'boast',
-    'boasts',
-    'bobby',
-    'bodily',
     'boil',
-    'boiled',
-    'boiler',
-    'boiling',
-    'bolt',
-    'bolton',
-    'bolts',
-    'bomber',
-    'bombers',
-    'bombing',
-    'bonn',
-    'bookings',
-    'booklet',
-    'bookshop',
-    'boosted',
-    'booth',
     'boredom',
-    'boris',
-    'borne',
-    'boroughs',
-    'borrowers',
-    'bosnia',
-    'bosnian',
-    'bosses',
-    'boston',
-    'boswell',
-    'bounce',
-    'bounced',
-    'bouncing',
-    'bounds',
-    'bourgeois',
-    'bourgeoisie',
     'bournemouth',
-    'bowed',
-    'bowler',
-    'bowling',
-    'bowls',
-    'bows',
-    'boxer',
-    'boycott',
-    'boyfriend',
-    'bp',
-    'brackets',
-    'bradley',
-    'brady',
-    'brains',
-    'brake',
-    'brakes',
     'brand_new',
-    'brands',
-    'brandy',
-    'branson',
-    'brazilian',
-    'breaches',
-    'breadth',
-    'breakthrough',
-    'bream',
-    'breathe',
-    'breathed',
-    'breathless',
-    'bred',
-    'breeds',
-    'brenda',
-    'brewers',
     'brewery',
-    'brewing',
-    'bricks',
-    'bride',
-    'bridges',
-    'bridget',
-    'briefing',
-    'brighter',
-    'brightly',
-    'brilliantly',
-    'brink',
-    'brisk',
-    'briskly',
-    'britons',
-    'brittle',
-    'broadcasts',
     'brochure',
-    'broker',
-    'brokers',
-    'brook',
-    'brooke',
-    'brow',
-    'browning',
-    'bruised',
-    'bruno',
-    'brushed',
-    'brushes',
-    'brushing',
-    'brutal',
-    'bryan',
-    'bt',
-    'bubble',
     'bubbles',
-    'buck',
-    'bucket',
-    'buckingham',
-    'buckinghamshire',
-    'bud',
-    'budgetary',
-    'buffer',
-    'buffet',
-    'bugger',
-    'build-up',
-    'builder',
-    'builders',
-    'builds',
-    'built-in',
-    'bulb',
     'bulbs',
-    'bulgaria',
-    'bullet',
-    'bulletin',
-    'bullets',
-    'bum',
-    'bump',
-    'bundle',
-    'bungalow',
-    'bureaucratic',
-    'bureaucrats',
-    'burglary',
-    'burial',
-    'burke',
-    'burma',
-    'burrows',
     'bursting',
-    'bursts',
-    'burton',
-    'burun',
-    'bury',
-    'bushes',
-    'businessman',
-    'businessmen',
-    'bust',
-    'butcher',
-    'butt',
-    'butterflies',
-    'butterfly',
-    'buttons',
-    'buys',
-    'buzz',
     'by-election',
-    'by_and_large',
-    'by_far',
-    'bypass',
-    'byrne',
-    'byzantine',
-    'c.a.',
-    'cabin',
-    'cables',
-    'caesar',
-    'caf&eacute',
-    'cafe',
-    'cage',
-    'cairo',
-    'cakes',
-    'calculate',
     'calculating',
-    'calculation',
-    'calendar',
-    'calf',
-    'calmly',
-    'calories',
-    'calves',
-    'cam',
-    'cambodia',
-    'camel',
-    'cameras',
-    'cameron',
-    'campaigners',
-    'campaigning',
-    'camping',
-    'camps',
     'campus',
-    'canals',
-    'cancel',
-    'cancellation',
-    'cancers',
-    'candle',
-    'candles',
-    'cane',
-    'cannon',
-    'canon',
-    'canopy',
-    'cans',
-    'canteen',
-    'canvas',
-    'capabilities',
-    'capability',
     'capacities',
-    'cape',
-    'capitals',
-    'caps',
-    'cara',
-    'caravan',
-    'carbonate',
-    'cardboard',
-    'cardiac',
-    'cardinal',
-    'careless',
-    'carer',
-    'cares',
-    'caretaker',
-    'cargo',
-    'caribbean',
     'carl',
-    'carla',
-    'carlisle',
-    'carlo',
-    'carlos',
-    'carol',
-    'carolyn',
-    'carp',
-    'carpenter',
-    'carpets',
-    'carr',
-    'carriages',
-    'carriers',
-    'carrots',
-    'carson',
-    'cart',
     'cartoon',
-    'carving',
-    'caspar',
-    'cassette',
-    'casting',
-    'castles',
-    'casually',
-    'casualties',
-    'casualty',
-    'catalogues',
-    'catches',
-    'cater',
-    'catholics',
-    'cathy',
-    'causal',
-    'cautious',
     'cautiously',
-    'cavalry',
-    'caves',
-    'cavity',
-    'cd',
-    'cdna',
-    'cease',
-    'ceasefire',
-    'cecil',
-    'celebrating',
-    'celebrations',
-    'celia',
-    'cellar',
-    'cellular',
-    'cement',
-    'cemetery',
     'censorship',
-    'census',
-    'centenary',
-    'center',
-    'centrally',
-    'cereal',
-    'cereals',
-    'cerebral',
-    'ceremonial',
-    'ceremonies',
-    'certificates',
-    'cf',
-    'ch',
-    'ch.',
-    'chaired',
-    'chairmen',
     'chalk',
-    'chamberlain',
-    'chaotic',
-    'chaplain',
-    'chapman',
-    'chaps',
-    'characterised',
-    'characterized',
-    'charcoal',
-    'charging',
-    'charitable',
-    'charities',
-    'charlton',
-    'chartered',
-    'charts',
-    'chased',
     'chasing',
-    'chatting',
-    'cheapest',
-    'cheaply',
-    'cheat',
-    'cheer',
-    'cheered',
-    'cheerful',
-    'cheerfully',
-    'cheers',
-    'chef',
-    'chelmsford',
-    'chemist',
-    'chemists',
-    'cheques',
-    'cherry',
     'cheshire',
-    'chess',
-    'chester',
-    'chestnut',
-    'chewing',
-    'chicago',
-    'chickens',
-    'chiefly',
-    'chiefs',
-    'childish',
-    'chile',
-    'chill',
-    'chimney',
-    'choir',
-    'choked',
-    'cholesterol',
     'chooses',
-    'chop',
-    'chopped',
-    'chord',
-    'chords',
-    'chorus',
-    'christina',
-    'christine',
-    'chromosome',
-    'chronicle',
-    'chuck',
-    'chuckled',
-    'churchyard',
-    'ci',
-    'cia',
-    'cid',
     'cider',
-    'cigar',
-    'circuits',
-    'circulated',
-    'circulating',
-    'circumstance',
-    'circus',
-    'cis',
-    'citation',
-    'cites',
-    'citizenship',
-    'civic',
-    'civilians',
-    'civilisation',
-    'civilised',
-    'civilization',
     'cl',
-    'claire',
-    'clan',
-    'clara',
-    'clarification',
-    'clarify',
-    'clarity',
-    'clashes',
-    'clasped',
-    'classics',
-    'classrooms',
-    'claudia',
-    'claws',
-    'cleaned',
-    'cleaner',
-    'cleaners',
     'clearance',
-    'clearer',
-    'clenched',
-    'clerical',
-    'clerks',
-    'click',
-    'clifford',
-    'cliffs',
-    'climatic',
-    'climax',
-    'climbers',
-    'climbs',
-    'cling',
-    'clinging',
-    'clinics',
-    'clip',
     'clipped',
-    'clive',
-    'cloak',
-    'clocks',
-    'closes',
-    'closest',
-    'closures',
-    'clough',
-    'clue',
-    'clues',
-    'clumsy',
-    'clung',
-    'cluster',
-    'clusters',
-    'clutch',
-    'clutched',
     'clutching',
-    'clyde',
-    'cnaa',
-    'cnut',
-    'co-operate',
-    'co-operative',
-    'co-ordinate',
-    'co-ordinated',
-    'co-ordinating',
-    'co-ordination',
-    'co-ordinator',
-    'co.',
-    'coaches',
-    'coaching',
-    'coarse',
-    'coastline',
     'coats',
-    'cocaine',
-    'cock',
-    'cockpit',
-    'cocktail',
-    'cocoa',
-    'coding',
-    'cohen',
-    'coherence',
-    'coherent',
-    'cohesion',
-    'coil',
-    'coincide',
-    'coincided',
-    'coincidence',
-    'coke',
     'col.',
-    'colchester',
-    'coldly',
-    'cole',
-    'coleman',
-    'coleridge',
-    'colitis',
-    'collaborative',
-    'collectively',
-    'collector',
-    'collectors',
-    'collins',
-    'collision',
-    'cologne',
-    'colombia',
-    'colon',
     'colonic',
-    'colonies',
-    'colony',
-    'colourful',
-    'colouring',
-    'columbia',
-    'comb',
-    'combinations',
-    'combines',
-    'combining',
-    'comeback',
-    'comfortably',
-    'comforting',
-    'commanded',
-    'commanders',
-    'commanding',
     'commands',
-    'commence',
-    'commenced',
-    'commentary',
-    'commentators',
-    'commenting',
-    'commercially',
-    'commissioners',
-    'commissions',
-    'committing',
-    'commodities',
-    'commodity',
-    'commonplace',
-    'communal',
-    'communicated',
-    'communicating',
     'communicative',
-    'communion',
-    'communism',
-    'companions',
-    'compares',
-    'comparing',
-    'compartment',
-    'compass',
-    'compassion',
-    'compatibility',
-    'compatible',
-    'compelled',
-    'compelling',
-    'compensate',
-    'competitions',
-    'competitiveness',
     'competitor',
-    'compiled',
-    'complaining',
-    'complement',
-    'complementary',
-    'completing',
-    'complexes',
-    'complexities',
-    'complications',
-    'compliment',
-    'composer',
-    'composers',
-    'composite',
-    'compost',
-    'compounded',
-    'compounds',
     'comprehension',
-    'compressed',
-    'compression',
-    'comprise',
-    'comprised',
-    'comprises',
-    'comprising',
-    'compulsion',
-    'computerised',
-    'comrades',
-    'con',
-    'conceal',
-    'concealed',
-    'concede',
-    'conceded',
-    'conceive',
     'concentrates',
-    'conceptions',
-    'conceptual',
-    'concerto',
-    'concerts',
-    'concession',
-    'concessions',
-    'concludes',
-    'concluding',
-    'conclusive',
-    'condemn',
-    'condemnation',
-    'conditional',
-    'conditioned',
-    'conditioning',
-    'conducting',
     'conductor',
-    'cone',
-    'confederation',
-    'conferred',
-    'confess',
-    'confessed',
-    'confession',
-    'confidential',
-    'confidentiality',
-    'confidently',
-    'configuration',
-    'confirmation',
-    'confirming',
-    'confirms',
-    'conflicting',
-    'conform',
     'conformity',
-    'confront',
-    'confrontation',
-    'confronted',
-    'confuse',
-    'confusing',
-    'congestion',
-    'congratulate',
-    'congratulations',
-    'congregation',
-    'congressional',
-    'connect',
-    'connecting',
-    'conquest',
-    'conrad',
-    'consciously',
     'consecutive',
-    'consequent',
-    'conservatism',
-    'consistency',
-    'consolation',
-    'consolidated',
-    'consolidation',
-    'consortium',
-    'conspicuous',
-    'conspiracy',
-    'constituencies',
-    'constituent',
-    'constituents',
-    'constituted',
-    'constitutes',
-    'constrained',
     'constraint',
-    'constructing',
-    'constructive',
-    'construed',
-    'consultancy',
-    'consultations',
-    'consultative',
-    'consulting',
-    'consume',
-    'consumed',
-    'consuming',
-    'contacted',
-    'container',
-    'containers',
-    'contaminated',
-    'contamination',
     'contemplate',
-    'contemplated',
-    'contemplating',
-    'contemporaries',
-    'contention',
-    'contentious',
-    'contested',
-    'contextual',
-    'contingency',
-    'contingent',
-    'continual',
-    'continuation',
-    'continuously',
-    'continuum',
-    'contracted',
-    'contracting',
     'contraction',
-    'contractor',
-    'contractors',
-    'contractual',
-    'contradiction',
-    'contradictions',
-    'contradictory',
-    'contrasted',
-    'contrasting',
-    'contrasts',
-    'contributes',
-    'contributing',
-    'controller',
-    'convenience',
-    'conveniently',
-    'convent',
     'convergence',
-    'conversations',
-    'conversely',
-    'convertible',
-    'converting',
-    'convey',
-    'conveyed',
-    'convictions',
-    'convoy',
-    'cooker',
-    'cookery',
-    'cooling',
-    'cooperative',
-    'coordinate',
-    'coordination',
-    'cop',
     'copied',
-    'coping',
-    'copying',
-    'copyright',
-    'cor',
-    'coral',
-    'cord',
-    'cork',
-    'cornelius',
-    'cornish',
-    'coronary',
-    'coronation',
-    'coroner',
-    'corporal',
-    'corporations',
-    'corpse',
     'corpus',
-    'corrected',
-    'correction',
-    'correlated',
-    'correspond',
-    'corresponds',
-    'corridors',
-    'corrupt',
-    'costa',
-    'costing',
-    'costly',
-    'costume',
-    'costumes',
-    'cosy',
-    'cot',
-    'cottages',
     'couch',
-    'cough',
-    'coun',
-    'counsellor',
-    'countered',
-    'counterpart',
-    'counterparts',
-    'countess',
-    'countless',
-    'coupon',
-    'courtaulds',
-    'courtesy',
-    'courtyard',
-    'cousins',
-    'covenant',
-    'covenants',
     'cowley',
-    'cox',
-    'cracked',
-    'cracking',
-    'cracks',
-    'crafts',
-    'craftsmen',
-    'crammed',
-    'cramped',
-    'crane',
-    'cranston',
-    'crap',
-    'crashing',
-    'crawford',
-    'crawl',
-    'crawled',
     'crawling',
-    'creativity',
-    'creator',
-    'credibility',
-    'credible',
-    'credited',
-    'creditor',
-    'credits',
-    'creed',
-    'creep',
-    'creeping',
-    'creole',
-    'crept',
-    'crescent',
-    'crest',
-    'crews',
     'cries',
-    'criminals',
-    'crises',
-    'crisp',
-    'critic',
-    'critically',
-    'criticise',
-    'criticisms',
-    'criticized',
-    'critique',
-    'croatia',
-    'croatian',
-    'crohn',
-    'cromwell',
-    'crosses',
-    'crossroads',
     'crouched',
-    'crowned',
-    'croydon',
-    'cruelty',
-    'cruise',
-    'cruising',
-    'crumbling',
-    'crumpled',
-    'crusade',
-    'crush',
-    'crushed',
-    'crushing',
-    'crust',
-    'cruz',
-    'crystals',
-    'cs',
     'cuba',
-    'cuban',
-    'cubic',
-    'cue',
-    'cuisine',
-    'cult',
-    'cultivated',
-    'cultivation',
-    'cumbria',
-    'cumulative',
-    'cunning',
-    'cunningham',
-    'cupboards',
-    'curator',
-    'curb',
-    'cured',
     'curiosity',
-    'curiously',
-    'curl',
-    'curled',
-    'curls',
-    'curly',
-    'currencies',
-    'currents',
-    'curry',
-    'curse',
-    'cursed',
-    'curtis',
-    'curvature',
-    'curved',
-    'curves',
-    'cushion',
     'cushions',
-    'customary',
-    'cuttings',
-    'cycles',
-    'cycling',
-    'cyclists',
-    'cylinder',
-    'cynical',
-    'cyprus',
-    'czech',
-    'czechoslovakia',
-    'daft',
-    'dairy',
-    'daisy',
-    'dale',
-    'dam',
     'dame',
-    'damian',
-    'damned',
-    'dan',
-    'dana',
-    'danced',
-    'dancer',
-    'dancers',
-    'dances',
-    'dangerously',
-    'danish',
-    'danny',
-    'dared',
-    'daring',
-    'darkened',
-    'darker',
     'darren',
-    'darwin',
-    'dash',
-    'dashed',
-    'databases',
-    'daunting',
-    'davidson',
-    'dawson',
-    'day-to-day',
-    'daylight',
-    'daytime',
-    'dazzling',
-    'deadline',
-    'deadly',
-    'dealings',
-    'debated',
     'debbie',
-    'deborah',
-    'debris',
-    'debtor',
-    'decay',
-    'deceased',
-    'deception',
-    'decidedly',
-    'decides',
-    'decimal',
-    'declare',
-    'declaring',
-    'declining',
-    'decoration',
-    'decorations',
-    'decorative',
     'decreased',
-    'decreasing',
-    'decree',
-    'dedication',
-    'dee',
-    'deed',
-    'deeds',
-    'deepest',
-    'deer',
-    'default',
-    'defeats',
-    'defect',
-    'defective',
-    'defects',
-    'defences',
-    'defended',
     'defenders',
-    'deferred',
-    'deficiency',
-    'defines',
-    'defining',
-    'definitive',
-    'degradation',
-    'del',
-    'delaney',
-    'delays',
-    'delegate',
-    'delegated',
-    'delete',
-    'deleted',
-    'delhi',
-    'delicious',
     'delightful',
-    'deliveries',
-    'delivering',
-    'delors',
-    'delta',
-    'dementia',
-    'demise',
-    'democrat',
-    'demographic',
-    'demolished',
-    'demolition',
-    'demonstrates',
-    'demonstrating',
-    'demonstrators',
-    'den',
-    'denial',
     'denies',
-    'denis',
-    'denounced',
-    'dense',
-    'dental',
-    'dentist',
-    'denying',
-    'depart',
-    'departed',
-    'departmental',
-    'dependency',
-    'depending',
-    'depicted',
-    'deployed',
-    'deployment',
-    'deposited',
     'deposition',
-    'depot',
-    'depreciation',
-    'depressing',
-    'deprivation',
-    'deprived',
-    'depths',
-    'der',
-    'derbyshire',
-    'deregulation',
-    'derelict',
-    'derive',
-    'derives',
-    'derry',
-    'descend',
-    'descendants',
     'descended',
-    'descending',
-    'descent',
-    'descriptive',
-    'deserved',
-    'deserves',
-    'designers',
-    'designing',
-    'desires',
-    'desmond',
-    'desperation',
-    'despised',
-    'destination',
-    'destined',
-    'destiny',
-    'destroying',
     'destructive',
-    'det',
-    'detached',
-    'detachment',
-    'detained',
-    'detection',
-    'detectives',
-    'detector',
-    'detention',
-    'deter',
-    'deteriorated',
-    'deterioration',
-    'determines',
-    'deterrent',
-    'devaluation',
-    'devastated',
     'devastating',
-    'developer',
-    'developers',
-    'developmental',
-    'develops',
-    'deviation',
-    'devise',
-    'devlin',
-    'devolution',
-    'devote',
-    'devotion',
-    'dexter',
-    'dhss',
-    'diabetes',
-    'diabetic',
-    'diagnosed',
     'diagnostic',
-    'diagonal',
-    'diagrams',
-    'dial',
-    'dialect',
-    'diamond',
-    'diamonds',
-    'diane',
-    'diaries',
-    'diarrhoea',
-    'dickens',
-    'dictate',
-    'dictated',
-    'dictatorship',
-    'dies',
-    'dietary',
     'diets',
-    'differed',
-    'differential',
-    'differentiate',
-    'differentiated',
-    'differentiation',
-    'differing',
-    'differs',
-    'dig',
-    'digest',
-    'digestion',
-    'digging',
-    'dignified',
-    'dilemma',
-    'dim',
-    'diminish',
     'diminished',
-    'diminishing',
-    'dining-room',
-    'dinosaurs',
-    'diocese',
-    'dip',
-    'diploma',
-    'diplomacy',
-    'diplomats',
-    'dipped',
-    'dire',
-    'directing',
-    'directives',
-    'dirt',
-    'disabilities',
-    'disadvantage',
     'disadvantaged',
-    'disadvantages',
-    'disagree',
-    'disagreement',
-    'disappearance',
-    'disappearing',
-    'disappointing',
-    'disapproval',
-    'disarmament',
-    'disasters',
-    'disastrous',
-    'disbelief',
-    'discarded',
-    'discharged',
-    'disciples',
-    'disciplinary',
     'disciplined',
-    'disciplines',
-    'disclose',
-    'disclosed',
-    'disclosure',
-    'disco',
-    'discomfort',
-    'discontent',
-    'discounted',
-    'discounts',
-    'discourage',
-    'discouraged',
-    'discourses',
-    'discoveries',
-    'discovering',
-    'discreet',
     'discrete',
-    'discretionary',
-    'discriminate',
-    'discs',
-    'discusses',
-    'disgrace',
-    'disguise',
-    'disguised',
-    'disgust',
-    'disgusting',
-    'disks',
-    'dislike',
-    'disliked',
-    'dismal',
-    'dismay',
-    'dismiss',
     'disney',
-    'disorders',
-    'dispersed',
-    'displaced',
-    'displaying',
-    'disposable',
-    'dispose',
-    'disposed',
-    'disposition',
-    'disputed',
-    'disregard',
-    'disrupted',
-    'disruption',
-    'dissatisfaction',
-    'dissatisfied',
-    'dissent',
     'dissolution',
-    'dissolve',
-    'dissolved',
-    'distal',
-    'distances',
-    'distinctions',
-    'distinctly',
-    'distinguishing',
-    'distorted',
-    'distortion',
-    'distracted',
-    'distressed',
-    'distribute',
-    'distributor',
-    'distributors',
-    'disturb',
     'disturbance',
-    'disturbances',
-    'ditch',
-    'dive',
-    'dived',
-    'diversion',
-    'divert',
-    'diverted',
-    'dividends',
-    'dividing',
-    'diving',
-    'divisional',
-    'divorced',
-    'dixon',
-    'diy',
-    'doc',
     'docks',
-    'documentary',
-    'documented',
-    'doe',
-    'dole',
-    'doll',
-    'dolls',
-    'dolly',
-    'dolphin',
-    'dolphins',
-    'domains',
-    'dome',
-    'dominance',
-    'dominate',
-    'domination',
-    'donaldson',
     'donated',
-    'donation',
-    'donations',
-    'doncaster',
-    'donkey',
-    'donna',
-    'donor',
-    'donors',
-    'doo',
-    'doomed',
-    'doorstep',
-    'doreen',
-    'dorset',
-    'dos',
-    'doses',
-    'dots',
     'dotted',
-    'doubles',
-    'doubling',
-    'doubted',
-    'doubtless',
-    'doug',
-    'dover',
-    'downhill',
-    'downing',
-    'downs',
-    'downstream',
-    'downward',
-    'downwards',
-    'doyle',
-    'dozens',
-    'drafted',
     'drafting',
-    'dragging',
-    'dragon',
-    'drain',
-    'drainage',
-    'drained',
-    'drains',
-    'draped',
-    'drastic',
-    'drastically',
-    'draught',
-    'drawer',
-    'drawers',
-    'drawing-room',
-    'dread',
-    'dreamed',
     'dreaming',
-    'dresses',
-    'drifted',
-    'drifting',
-    'drill',
-    'drilling',
-    'dripping',
-    'drought',
-    'drowned',
-    'drowning',
-    'drum',
-    'drums',
-    'drunken',
-    'drying',
-    'dti',
-    'dual',
     'dubbed',
-    'dubious',
-    'duchess',
-    'duchy',
-    'ducks',
-    'dudley',
-    'dug',
-    'duly',
-    'dumb',
-    'dummy',
-    'dump',
-    'dumped',
-    'dumping',
-    'dundee',
-    'dunn',
-    'duodenal',
     'dusk',
-    'dustin',
-    'dusty',
-    'dwarf',
-    'dwelling',
-    'dwellings',
-    'dye',
-    'dynamics',
-    'dynasty',
-    'e.r',
-    'eagerly',
-    'eagles',
-    'earnest',
-    'earning',
-    'earthquake',
-    'eased',
     'easiest',
-    'easing',
-    'eccentric',
-    'ecclesiastical',
-    'echoed',
-    'echoes',
-    'ecological',
-    'ecology',
-    'economical',
-    'economically',
-    'economist',
-    'economists',
-    'ecstasy',
-    'eden',
-    'edgar',
-    'edged',
     'edit',
-    'edited',
-    'edith',
-    'editing',
-    'editions',
-    'editorial',
-    'editors',
-    'edmund',
-    'edouard',
-    'edwardian',
-    'edwin',
-    'ee',
-    'effected',
-    'efficacy',
-    'efficiently',
-    'ego',
     'egyptian',
-    'eighteenth-century',
-    'eighties',
-    'eileen',
-    'elaine',
-    'elastic',
-    'elbow',
-    'elbows',
-    'elders',
-    'eldest',
-    'eleanor',
-    'elect',
-    'electorate',
-    'electron',
-    'electrons',
-    'elegance',
     'elementary',
-    'elephant',
-    'elephants',
-    'elevated',
-    'elevation',
-    'eleventh',
-    'eliminate',
-    'eliminated',
-    'elimination',
-    'elinor',
-    'ellen',
-    'ellie',
-    'elliott',
-    'ellis',
-    'elusive',
-    'elvis',
     'em',
-    'emailinc',
-    'emancipation',
-    'embarked',
-    'embarrassing',
-    'embedded',
-    'embodied',
-    'embrace',
-    'embraced',
-    'embryo',
-    'embryos',
-    'emerges',
-    'eminent',
-    'emission',
-    'emotionally',
-    'emphasise',
     'emphasises',
-    'emphasize',
-    'emphasized',
-    'employing',
-    'employs',
-    'emptied',
-    'en',
-    'en_route',
-    'enacted',
-    'enclose',
-    'enclosure',
-    'encounters',
-    'encourages',
-    'endangered',
-    'endeavour',
-    'endill',
     'endorse',
-    'endorsed',
-    'endorsement',
-    'endoscopic',
-    'endowment',
-    'endure',
-    'enduring',
-    'energetic',
-    'energies',
-    'enforce',
-    'enforced',
-    'engagements',
-    'engaging',
-    'engels',
-    'englishman',
-    'enjoyable',
     'enjoyment',
-    'enjoys',
-    'enlarged',
-    'enlightened',
-    'enlightenment',
-    'enormously',
-    'enquired',
-    'ensemble',
-    'ensuing',
-    'ensured',
-    'ensures',
-    'entails',
-    'enters',
-    'entertain',
-    'entertained',
-    'entertaining',
     'enthusiastically',
-    'enthusiasts',
-    'entities',
-    'entitlement',
-    'entrants',
-    'entrepreneurs',
-    'entrusted',
-    'envelopes',
-    'environmentalists',
-    'environmentally',
-    'envisage',
-    'envy',
-    'enzyme',
-    'enzymes',
-    'epic',
-    'epidemic',
     'episodes',
-    'epithelial',
-    'equals',
-    'equations',
-    'equitable',
-    'erect',
-    'erected',
-    'erika',
-    'ernest',
-    'eroded',
-    'erotic',
-    'erupted',
-    'eruption',
-    'escaping',
-    'escort',
-    'escorted',
     'essays',
-    'est.',
-    'establishments',
-    'esther',
-    'estuary',
-    'et',
-    'et_al.',
-    'etcetera',
-    'eternal',
-    'eternity',
-    'ethical',
-    'ethics',
-    'ethiopia',
-    'ethos',
-    'euro',
-    'europeans',
     'eva',
-    'evacuated',
-    'evacuation',
-    'evaluate',
-    'evaluated',
-    'evaluating',
-    'evelyn',
-    'evenly',
-    'eventual',
-    'ever_so',
-    'everton',
-    'evolutionary',
-    'evolve',
-    'ex',
-    'ex_parte',
-    'exaggerated',
     'exam',
-    'examines',
-    'exams',
-    'excavation',
-    'exceed',
-    'exceeded',
-    'exceeding',
-    'exceeds',
-    'excellence',
-    'exceptionally',
-    'excesses',
-    'exchanged',
-    'exchanges',
-    'exchequer',
-    'excise',
-    'exclaimed',
     'excluding',
-    'excursions',
-    'excuses',
-    'exemplified',
-    'exempt',
-    'exemption',
-    'exercising',
-    'exert',
-    'exeter',
-    'exhaust',
-    'exhaustion',
-    'exhibit',
-    'exhibited',
-    'exhibits',
-    'exile',
-    'exotic',
     'expectancy',
-    'expedition',
-    'expelled',
-    'experiencing',
-    'explanatory',
-    'exploded',
-    'exploited',
-    'exploiting',
-    'exploring',
-    'explosions',
-    'explosive',
-    'explosives',
-    'exported',
-    'exporting',
-    'expose',
-    'exposing',
     'expresses',
-    'expressive',
-    'expressly',
-    'exquisite',
-    'extends',
-    'extensions',
-    'extensively',
-    'exterior',
-    'extinct',
-    'extinction',
-    'extracted',
-    'extraction',
-    'extracts',
-    'extraordinarily',
-    'extravagant',
-    'extremes',
     'eyebrow',
-    'eyebrows',
-    'eyed',
-    'fa&ccedil;ade',
-    'fabia',
-    'fabrics',
-    'fabulous',
-    'facial',
-    'facilitate',
-    'faction',
-    'factions',
-    'factual',
-    'fade',
-    'fading',
-    'faecal',
-    'failures',
     'faintly',
-    'fairness',
-    'fairy',
-    'faithful',
-    'faithfully',
-    'fake',
-    'falklands',
-    'fallon',
-    'familiarity',
-    'famine',
-    'fancied',
-    'fantasies',
-    'fantastic',
-    'far-reaching',
-    'fare',
-    'fares',
     'farewell',
-    'farmhouse',
-    'farther',
-    'fascinated',
-    'fascination',
-    'fascism',
-    'fascist',
-    'fashionable',
-    'fastened',
-    'fastest',
-    'fatigue',
-    'fatty',
-    'faults',
-    'faulty',
-    'favourably',
-    'favourites',
     'favours',
-    'faye',
-    'fearful',
-    'feasibility',
-    'feasible',
-    'feast',
-    'feather',
-    'feathers',
-    'featuring',
-    'fed_up',
-    'feeble',
-    'feeds',
-    'felicity',
-    'felipe',
-    'felix',
-    'fellows',
     'fellowship',
-    'feminine',
-    'feminism',
-    'feminists',
-    'fen',
-    'fences',
-    'fencing',
-    'fender',
-    'fenella',
-    'fergie',
-    'fergus',
-    'ferguson',
-    'fernando',
-    'ferrari',
-    'fertile',
-    'festivals',
     'fetched',
-    'feudal',
-    'fever',
-    'fibres',
-    'fictional',
-    'fielding',
-    'fiercely',
-    'fiery',
-    'fifteenth',
-    'fifties',
-    'fighter',
-    'fighters',
-    'fights',
-    'figured',
-    'filed',
-    'filing',
     'fills',
-    'filmed',
-    'filming',
-    'filters',
-    'filthy',
-    'filtration',
-    'finals',
-    'financed',
-    'finances',
-    'financially',
-    'financing',
-    'fined',
-    'finely',
-    'finer',
-    'fines',
-    'finishes',
     'finite',
-    'finland',
-    'finn',
-    'fiona',
-    'firemen',
-    'fireplace',
-    'firing',
-    'first-class',
-    'fisher',
-    'fisheries',
-    'fishermen',
-    'fist',
-    'fists',
-    'fittings',
-    'fitzalan',
-    'five-year',
     'fiver',
-    'fixing',
-    'fixture',
-    'fixtures',
-    'flags',
-    'flame',
-    'flank',
-    'flanked',
-    'flap',
-    'flared',
-    'flashed',
-    'flashing',
-    'flattened',
-    'flee',
-    'fleming',
-    'fletcher',
     'flicked',
-    'flicker',
-    'flickered',
-    'flint',
-    'float',
-    'floated',
-    'flock',
-    'flooded',
-    'flooding',
-    'floods',
-    'floppy',
-    'floral',
-    'florence',
-    'florida',
-    'flour',
-    'flourish',
     'flourished',
-    'flowed',
-    'flowering',
-    'flowing',
-    'flown',
-    'flu',
-    'fluctuations',
-    'flung',
-    'flush',
-    'flushed',
-    'flux',
-    'foam',
-    'focal',
-    'focuses',
-    'focusing',
-    'fog',
     'foil',
-    'fold',
-    'folding',
-    'folds',
-    'foliage',
-    'folks',
-    'follow-up',
-    'follow_up',
-    'followers',
-    'folly',
-    'foolish',
-    'footing',
-    'footpath',
-    'footsteps',
-    'for_certain',
-    'for_good',
     'for_once',
-    'for_sure',
-    'for_the_most_part',
-    'for_the_time_being',
-    'forbidden',
-    'fore',
-    'forecasting',
-    'forecasts',
-    'forefront',
-    'foreigners',
-    'foreman',
-    'foremost',
-    'forensic',
-    'foreseeable',
-    'forestry',
-    'forge',
     'forged',
-    'forgetting',
-    'forgiven',
-    'forgiveness',
-    'fork',
-    'formality',
-    'formations',
-    'formats',
-    'formidable',
-    'formulae',
-    'formulate',
-    'formulated',
-    'formulation',
-    'forster',
-    'fort',
-    'forties',
     'fortress',
-    'fortunes',
-    'forty-five',
-    'fossil',
-    'fossils',
-    'foul',
-    'founding',
-    'fountain',
-    'fours',
-    'fourteenth',
-    'fr',
-    'fractions',
-    'fragile',
-    'fragment',
-    'fragmented',
-    'frail',
     'framed',
-    'frames',
-    'fran',
-    'frances',
-    'franchise',
-    'francisco',
-    'franco',
-    'francs',
-    'frankfurt',
-    'frankie',
-    'franklin',
-    'frankly',
-    'frantic',
-    'frantically',
-    'fraser',
-    'freddie',
     'frederick',
-    'freed',
-    'freeman',
-    'freeze',
-    'freezer',
-    'freezing',
-    'freight',
-    'frenchman',
-    'frequencies',
-    'freshly',
-    'friction',
-    'fridge',
-    'fried',
-    'fright',
-    'frighten',
-    'frightening',
     'fringe',
-    'frog',
-    'frogs',
-    'from_now_on',
-    'frontier',
-    'frontiers',
-    'frost',
-    'frown',
-    'frowning',
-    'froze',
-    'fruitful',
-    'fruits',
-    'frustrated',
-    'frustrating',
-    'fry',
-    'ft',
     'ftse',
-    'fuelled',
-    'fuels',
-    'fulfilled',
-    'fulfilling',
-    'fulfilment',
-    'fuller',
-    'fumes',
-    'functioning',
-    'fundamentally',
-    'fur',
-    'furiously',
-    'furnished',
-    'furnishings',
-    'fury',
-    'fuss',
     'gaelic',
-    'gala',
-    'galaxy',
-    'gale',
-    'gall',
-    'gallons',
-    'gamble',
-    'gambling',
-    'gandhi',
-    'gangs',
-    'gaps',
-    'gardener',
-    'gardeners',
-    'gardening',
-    'gareth',
-    'garlic',
     'garment',
-    'garments',
-    'garrison',
-    'garry',
-    'gases',
-    'gasped',
-    'gastrin',
-    'gastrointestinal',
-    'gateshead',
-    'gateway',
-    'gatt',
-    'gauge',
-    'gaulle',
-    'gavin',
-    'gazed',
-    'gazing',
     'gcse',
-    'gdp',
-    'geared',
-    'gedge',
-    'gel',
-    'gen.',
-    'generals',
-    'generates',
-    'generating',
-    'generator',
-    'generic',
-    'generosity',
-    'generously',
-    'genesis',
-    'geneva',
-    'genius',
     'genre',
-    'gentry',
-    'geological',
-    'geology',
-    'geometric',
-    'geometry',
-    'georgia',
-    'georgian',
-    'gerald',
-    'gerard',
-    'gerry',
-    'gestured',
-    'gestures',
-    'ghastly',
-    'ghosts',
-    'giants',
     'gibson',
-    'gifted',
-    'gig',
-    'gilbert',
-    'giles',
-    'gill',
-    'gillian',
-    'gin',
-    'gina',
-    'ginger',
-    'glamorous',
-    'glamour',
-    'glances',
-    'glancing',
-    'glare',
-    'glared',
     'glazed',
-    'gleaming',
-    'glen',
-    'glider',
-    'glimpse',
-    'glimpsed',
-    'glittering',
-    'globe',
-    'gloom',
-    'gloomy',
-    'gloria',
-    'glorious',
-    'glossy',
-    'gloves',
-    'glow',
-    'glowing',
     'glucose',
-    'glue',
-    'gmt',
-    'gnp',
-    'goalkeeper',
-    'goat',
-    'goats',
-    'goblin',
-    'goddess',
-    'gooch',
-    'goodnight',
-    'goodwill',
-    'goose',
-    'gorgeous',
-    'gospel',
-    'gossip',
     'govern',
-    'governed',
-    'governmental',
-    'gown',
-    'gp',
-    'gps',
-    'grab',
-    'graceful',
-    'gracious',
-    'graded',
-    'grades',
-    'gradient',
-    'gradual',
-    'graduate',
-    'graduated',
-    'graduates',
     'graeme',
-    'grains',
-    'grammatical',
-    'gran',
-    'grandchildren',
-    'grandma',
-    'grandparents',
-    'grandson',
-    'grange',
-    'granite',
-    'granny',
-    'granting',
-    'grapes',
-    'graph',
-    'graphic',
-    'graphical',
     'grasped',
-    'grated',
-    'gratitude',
-    'graves',
-    'gravitational',
-    'grazing',
-    'greed',
-    'greedy',
-    'greeks',
-    'greenbelt',
-    'greene',
-    'greenhouse',
-    'greenpeace',
-    'greens',
-    'greet',
-    'greeting',
     'greg',
-    'gregory',
-    'grid',
-    'grievances',
-    'griffiths',
-    'grill',
-    'grim',
-    'grimly',
-    'grinding',
-    'grinning',
-    'gripped',
-    'gripping',
-    'grips',
-    'groaned',
-    'groom',
-    'groove',
     'grouped',
-    'grouping',
-    'groupings',
-    'grove',
-    'growled',
-    'guarantees',
-    'guarded',
-    'guardians',
-    'guerrilla',
-    'guerrillas',
-    'guides',
-    'guiding',
-    'guido',
-    'guil',
-    'guild',
-    'guinea',
     'guitarist',
-    'guitars',
-    'gut',
-    'guts',
-    'h.l.',
-    'habitat',
-    'habitats',
-    'hague',
-    'hailed',
-    'hairs',
-    'half-time',
-    'half-way',
-    'half_way',
-    'halfway',
-    'halifax',
-    'halls',
     'hallway',
-    'halted',
-    'halved',
-    'hamlet',
-    'hammer',
-    'hammond',
-    'handbag',
-    'handbook',
-    'handing',
-    'handkerchief',
-    'handles',
-    'handwriting',
-    'handy',
-    'hanged',
-    'hangs',
-    'hannah',
     'hans',
-    'happier',
-    'harassment',
-    'hardened',
-    'hardest',
-    'hardship',
-    'hardy',
-    'hare',
-    'hari',
-    'harlow',
-    'harmful',
-    'harmless',
-    'harness',
-    'harper',
-    'harrison',
-    'harrogate',
     'hart',
-    'hartlepool',
-    'harvard',
-    'harvest',
-    'hassan',
-    'haste',
-    'hastily',
-    'hastings',
-    'hatch',
-    'hatred',
-    'hats',
-    'haul',
-    'hauled',
-    'haunted',
-    'haven',
-    'hawkins',
     'hay',
-    'hazard',
-    'hazardous',
-    'hazards',
-    'hazel',
-    'headache',
-    'header',
-    'headings',
-    'headline',
-    'headlines',
-    'heal',
-    'heap',
-    'hearings',
-    'hears',
-    'heated',
-    'heater',
     'heather',
-    'heathrow',
-    'heavens',
-    'heavier',
-    'heavyweight',
-    'hebrew',
-    'hectares',
-    'hectic',
-    'hector',
-    'hedge',
-    'hedges',
-    'heel',
-    'heightened',
-    'heights',
-    'heir',
-    'helicopter',
     'helicopters',
-    'helmet',
-    'helpless',
-    'helplessly',
-    'hemisphere',
-    'hen',
-    'henderson',
-    'henley',
-    'hens',
-    'hepatitis',
-    'herald',
-    'herbert',
-    'herbs',
-    'herd',
-    'hereditary',
-    'hereford',
     'heroes',
-    'heroic',
-    'heroin',
-    'herr',
-    'hertfordshire',
-    'heseltine',
-    'hesitate',
-    'hesitation',
-    'hewlett-packard',
-    'hi',
-    'hid',
-    'hideous',
-    'hierarchical',
-    'higgins',
-    'highland',
-    'highlands',
     'highlights',
-    'highway',
-    'highways',
-    'hilary',
-    'hilda',
-    'hillside',
-    'hilton',
-    'hindsight',
-    'hindu',
-    'hinted',
-    'hints',
-    'hip',
-    'hips',
-    'hiring',
-    'hissed',
-    'historically',
     'histories',
-    'hitting',
-    'hm',
-    'hmm',
-    'ho',
-    'hobby',
-    'hockey',
-    'hollow',
-    'holly',
-    'holmes',
-    'homage',
-    'homeland',
-    'homeless',
-    'homework',
-    'homogeneous',
-    'homosexual',
     'homosexuality',
-    'honesty',
-    'honeymoon',
-    'honorary',
-    'honourable',
-    'honoured',
-    'hood',
-    'hooked',
-    'hooks',
-    'hop',
-    'hopeful',
-    'hopeless',
-    'hopelessly',
-    'hopkins',
-    'horizons',
-    'hormone',
     'horn',
-    'horns',
-    'horrific',
-    'horrified',
-    'horrors',
-    'hospitality',
-    'hostage',
-    'hostages',
-    'hostel',
-    'hosts',
-    'housed',
-    'housekeeper',
-    'housewife',
-    'housework',
-    'hovering',
-    'howe',
     'hp',
-    'hq',
-    'hubert',
-    'hudson',
-    'hugged',
-    'hugo',
-    'huh',
-    'humanitarian',
-    'humanities',
-    'humble',
-    'humiliation',
-    'humorous',
-    'hungarian',
-    'hunger',
-    'hunted',
-    'hunters',
     'hurd',
-    'hurdle',
-    'hurled',
-    'hurricane',
-    'hurriedly',
-    'hurting',
-    'hurts',
-    'husbands',
-    'hussein',
-    'hybrid',
-    'hyde',
-    'hygiene',
-    'hypotheses',
-    'hypothetical',
-    'hysterical',
-    'iain',
     'iceland',
-    'icing',
-    'icl',
-    'icon',
-    'icy',
-    'id',
-    'ideals',
-    'identifiable',
-    'identifier',
-    'identifies',
-    'idiot',
-    'idle',
-    'ignorance',
-    'ignorant',
-    'ignores',
-    'il',
     'illegally',
-    'illnesses',
-    'illuminated',
-    'illusion',
-    'illustrates',
-    'illustrations',
-    'imagery',
-    'imaginary',
-    'imaginative',
-    'imaging',
-    'imagining',
-    'imbalance',
-    'imf',
-    'imitation',
-    'immaculate',
-    'immature',
     'immensely',
-    'immigrants',
-    'immigration',
-    'imminent',
-    'immune',
-    'immunity',
-    'impaired',
-    'impatience',
-    'impatient',
-    'impatiently',
-    'impending',
-    'imperative',
-    'imperialism',
-    'impersonal',
-    'impetus',
-    'implementing',
     'implicated',
-    'implicit',
-    'implicitly',
-    'implying',
-    'imposing',
-    'imposition',
-    'impress',
-    'impressions',
-    'imprisoned',
-    'improves',
-    'impulse',
-    'in-house',
-    'in-service',
-    'in_association_with',
-    'in_between',
-    'in_common',
     'in_common_with',
-    'in_comparison_with',
-    'in_contact_with',
-    'in_excess_of',
-    'in_full',
-    'in_keeping_with',
-    'in_need_of',
-    'in_place_of',
-    'in_private',
-    'in_public',
-    'in_return_for',
-    'in_search_of',
-    'in_so_far_as',
-    'in_support_of',
-    'in_vain',
-    'inability',
     'inaccurate',
-    'incapable',
-    'incentives',
-    'incidentally',
-    'inclination',
-    'inclusion',
-    'inclusive',
-    'incoming',
-    'incompatible',
-    'incomplete',
-    'inconsistent',
-    'inconvenience',
-    'incorporate',
-    'incorporates',
-    'incorporating',
-    'incorporation',
     'incorrect',
-    'incredibly',
-    'incumbent',
-    'indefinitely',
-    'indemnity',
-    'indexing',
-    'indications',
-    'indicative',
-    'indicator',
-    'indicators',
-    'indies',
-    'indifference',
-    'indifferent',
-    'indigenous',
-    'indignation',
-    'indirectly',
     'indispensable',
-    'individually',
-    'indonesia',
-    'indoor',
-    'indoors',
-    'induce',
-    'induction',
-    'indulge',
-    'ineffective',
-    'inefficient',
-    'inequalities',
-    'inequality',
-    'inexperienced',
-    'infancy',
-    'infantry',
-    'infants',
     'infections',
-    'infectious',
-    'inference',
-    'inferior',
-    'infinite',
-    'infinitely',
-    'infinitive',
-    'infirmary',
-    'inflammation',
-    'inflammatory',
-    'inflicted',
-    'influencing',
-    'informative',
-    'informing',
-    'infrastructure',
-    'infusion',
     'ingenious',
-    'ingredient',
-    'inhabited',
-    'inherently',
-    'inhibit',
-    'inhibited',
-    'inhibition',
-    'initiate',
-    'initiation',
-    'injected',
-    'injection',
-    'injunction',
-    'injustice',
-    'ink',
-    'inmates',
-    'innate',
     'inner-city',
-    'innings',
-    'innocence',
-    'innovations',
-    'innovative',
-    'inputs',
-    'inquest',
-    'inquiries',
-    'insect',
-    'insert',
-    'inserted',
-    'inset',
-    'insider',
-    'insights',
-    'insignificant',
-    'insistence',
     'insisting',
-    'insists',
-    'insolvency',
-    'insp',
-    'inspect',
-    'inspected',
-    'inspectorate',
-    'inspectors',
-    'inspire',
-    'instability',
-    'install',
-    'installations',
-    'installing',
-    'instinct',
-    'instinctive',
-    'instinctively',
     'instincts',
-    'institutes',
-    'instructor',
-    'instrumental',
-    'insulation',
-    'insulin',
-    'insult',
-    'insulting',
-    'insured',
-    'insurers',
-    'int',
-    'intake',
-    'integrate',
-    'integrating',
-    'intellect',
-    'intellectuals',
     'intending',
-    'intends',
-    'intensely',
-    'intensified',
-    'intently',
-    'interact',
-    'interactions',
-    'interactive',
-    'intercourse',
-    'interestingly',
-    'interfaces',
-    'interfere',
-    'interiors',
-    'internally',
-    'internationally',
-    'interpretations',
     'interpreter',
-    'interpreting',
-    'interrupt',
-    'interruption',
-    'intervene',
-    'intervened',
-    'intervening',
-    'interventions',
-    'interviewer',
-    'interviewing',
-    'intestinal',
-    'intimacy',
-    'intolerable',
-    'intonation',
-    'intricate',
-    'intrigued',
     'intriguing',
-    'intrinsic',
-    'introduces',
-    'introductory',
-    'intrusion',
-    'intuition',
-    'intuitive',
-    'invaded',
-    'invalid',
-    'invaluable',
-    'invention',
-    'inventory',
-    'inverted',
-    'investigators',
-    'investing',
-    'investor',
     'inviting',
-    'invoice',
-    'invoked',
-    'inward',
-    'ion',
-    'ions',
-    'iranian',
-    'irene',
-    'iris',
-    'ironic',
-    'ironically',
-    'irony',
-    'irrational',
-    'irregular',
-    'irresistible',
-    'irrespective_of',
     'irresponsible',
-    'irritated',
-    'irritating',
-    'irritation',
-    'isaac',
-    'islam',
-    'isles',
-    'isobel',
-    'isolate',
-    'issuing',
-    'italians',
-    'itv',
-    'ivan',
-    'ivory',
-    'ivy',
-    'jackets',
     'jackie',
-    'jacob',
-    'jacques',
-    'jaguar',
-    'jailed',
-    'jake',
-    'jam',
-    'jamaica',
-    'jamie',
-    'janet',
-    'jaq',
-    'jar',
-    'jargon',
-    'jason',
-    'jasper',
-    'jaw',
     'jaws',
-    'jay',
-    'jealous',
-    'jealousy',
-    'jean-claude',
-    'jeep',
-    'jeff',
-    'jeffrey',
-    'jelly',
-    'jenkins',
-    'jenna',
-    'jennifer',
-    'jeremy',
-    'jerked',
-    'jerry',
-    'jersey',
     'jerusalem',
-    'jess',
-    'jessica',
-    'jets',
-    'jew',
-    'jewels',
-    'jill',
-    'jo',
-    'joanna',
-    'joanne',
-    'jockey',
-    'johnston',
-    'joins',
-    'jointly',
-    'joints',
-    'joking',
     'jolly',
-    'jon',
-    'joshua',
-    'journalism',
-    'journals',
-    'journeys',
-    'juan',
-    'jubilee',
-    'judgements',
-    'judging',
-    'judgments',
-    'judiciary',
-    'judith',
-    'judy',
-    'jug',
-    'julian',
     'julius',
-    'jumble',
-    'jumper',
-    'jumping',
-    'jumps',
-    'junctions',
-    'jungle',
-    'junk',
-    'justices',
-    'juvenile',
-    'k.',
-    'karl',
-    'katherine',
-    'kathleen',
-    'katie',
-    'kay',
     'keegan',
-    'kemp',
-    'kenny',
-    'kensington',
-    'kenya',
-    'kerr',
-    'kettle',
-    'keyboard',
-    'keynes',
-    'keynesian',
-    'kg',
-    'kgb',
-    'khan',
-    'kicking',
-    'kicks',
-    'kidney',
     'killings',
-    'kills',
-    'kilometres',
-    'kin',
-    'kind_of',
-    'kindness',
-    'kinship',
-    'kirk',
-    'kisses',
-    'kissing',
-    'kitchens',
-    'kite',
-    'kits',
-    'klerk',
-    'knelt',
-    'knight',
     'knights',
-    'knit',
-    'knitted',
-    'knives',
-    'knocking',
-    'knot',
-    'knots',
-    'kohl',
-    'kpmg',
-    'kurdish',
-    'kylie',
-    'l.',
-    'l.j.',
-    'lab',
-    'labelling',
-    'laboratories',
     'labourers',
-    'labs',
-    'lacked',
-    'lacks',
-    'lager',
-    'lambert',
-    'lambs',
-    'lamps',
-    'landlords',
-    'landmark',
-    'landowners',
-    'landscapes',
-    'lanes',
-    'lang',
-    'lanka',
-    'large-scale',
     'larry',
-    'larvae',
-    'laser',
-    'lasmo',
-    'lass',
-    'lastly',
-    'lasts',
-    'lately',
-    'latent',
-    'lateral',
-    'laughs',
-    'launching',
-    'laundry',
-    'lava',
-    'lavatory',
-    'lavender',
     'lavish',
-    'lawful',
-    'lawn',
-    'lawson',
-    'lays',
-    'lazy',
-    'lb',
-    'lea',
-    'leaflets',
-    'leak',
-    'leaked',
-    'leant',
-    'leap',
-    'leaping',
-    'leapor',
-    'leapt',
     'learner',
-    'learners',
-    'learns',
-    'leas',
-    'leases',
-    'lebanese',
-    'lebanon',
-    'lecturer',
-    'lecturers',
-    'left-hand',
-    'left-wing',
-    'legacy',
-    'legally',
-    'legendary',
-    'legion',
-    'legislature',
     'legitimacy',
-    'leicestershire',
-    'leigh',
-    'leith',
-    'len',
-    'lenders',
-    'lengthy',
-    'lenin',
-    'lens',
-    'lenses',
-    'lent',
-    'leo',
-    'leon',
-    'leonard',
-    'leonora',
-    'lesbian',
     'lesions',
-    'leslie',
-    'lest',
-    'let_alone',
-    'lethal',
-    'lets',
-    'leukaemia',
-    'levelled',
-    'lever',
-    'levy',
-    'lexical',
-    'lexicon',
-    'li',
-    'liabilities',
-    'liaison',
-    'liam',
     'libel',
-    'liberalism',
-    'liberals',
-    'liberties',
-    'librarian',
-    'librarians',
-    'libya',
-    'libyan',
-    'licences',
-    'licensed',
-    'lid',
-    'lied',
-    'lieutenant',
-    'lifeboat',
-    'lifestyle',
-    'lifts',
     'lighter',
-    'lightning',
-    'lightweight',
-    'liking',
-    'lili',
-    'limb',
-    'limbs',
-    'lime',
-    'limestone',
-    'limitation',
-    'limiting',
-    'limp',
-    'lincoln',
-    'lincolnshire',
-    'lindsey',
-    'line-up',
     'linen',
-    'lingering',
-    'linguistics',
-    'lining',
-    'lions',
-    'liquidation',
-    'liquidity',
-    'liquor',
-    'listener',
-    'listeners',
-    'listing',
-    'literacy',
-    'literal',
-    'lithuania',
-    'litigation',
-    'litre',
     'litres',
-    'litter',
-    'livestock',
-    'loading',
-    'loaf',
-    'lobby',
-    'lobbying',
-    'localities',
-    'locality',
-    'locals',
-    'locate',
-    'locke',
-    'locking',
-    'locks',
-    'locomotive',
-    'locomotives',
     'locus',
-    'lodged',
-    'loft',
-    'logging',
-    'logically',
-    'logo',
-    'logs',
-    'lone',
-    'loneliness',
-    'long-standing',
-    'longed',
-    'longest',
-    'longing',
-    'loo',
-    'loop',
-    'loosely',
     'lordship',
-    'lordships',
-    'loretta',
-    'lorries',
-    'loses',
-    'lothian',
-    'lotus',
-    'lou',
-    'louder',
-    'loudly',
-    'lowe',
-    'lowering',
-    'loyalist',
-    'lp',
-    'lucas',
-    'luce',
     'luckily',
-    'lucrative',
-    'ludicrous',
-    'luggage',
-    'lunchtime',
-    'lung',
-    'lungs',
-    'lush',
-    'lust',
-    'luton',
-    'luxembourg',
-    'luxurious',
-    'lydia',
-    'lynn',
-    'lyons',
-    'lyrics',
     'ma\'am',
-    'mac',
-    'macdonald',
-    'macgregor',
-    'macintosh',
-    'macmillan',
-    'madam',
-    'madame',
-    'madeira',
-    'madeleine',
-    'madness',
-    'madonna',
-    'madrid',
-    'magical',
-    'magistrate',
-    'magnitude',
     'mahogany',
-    'maid',
-    'maiden',
-    'mainframe',
-    'mainland',
-    'mains',
-    'maintains',
-    'majesty',
-    'maker',
-    'malaysia',
-    'malta',
-    'mam',
-    'mama',
-    'mammals',
-    'manages',
-    'mandate',
     'mandatory',
-    'mandela',
-    'mandy',
-    'manifest',
-    'manifestation',
-    'manifestations',
-    'manifesto',
-    'manipulate',
-    'manipulated',
-    'manipulation',
-    'mankind',
-    'mann',
-    'manners',
-    'manoeuvre',
-    'manpower',
-    'mansell',
     'mansion',
-    'manslaughter',
-    'mantle',
-    'manufactured',
-    'manuscript',
-    'manuscripts',
-    'mapping',
-    'marathon',
-    'marc',
-    'marched',
-    'marching',
-    'marco',
-    'marcus',
-    'mare',
-    'marginally',
-    'margins',
     'marian',
-    'marina',
-    'mario',
-    'marion',
-    'marital',
-    'maritime',
-    'marjorie',
-    'markedly',
-    'marker',
-    'markers',
-    'marketed',
-    'marriages',
-    'marrying',
-    'mars',
-    'marsh',
-    'marshal',
     'marshes',
-    'martha',
-    'martial',
-    'marxism',
-    'masculine',
-    'masked',
-    'masklin',
-    'masks',
-    'mason',
-    'massachusetts',
-    'massacre',
-    'massage',
-    'mast',
-    'mat',
-    'maternal',
-    'maternity',
     'mates',
-    'maths',
-    'matilda',
-    'mating',
-    'matt',
-    'mattered',
-    'mattress',
-    'maud',
-    'maureen',
-    'maurice',
-    'maxim',
-    'maximise',
-    'maze',
-    'mcallister',
-    'mcdonald',
-    'mclaren',
     'meadow',
-    'meadows',
-    'meagre',
-    'meaningful',
-    'meaningless',
-    'mechanics',
-    'medal',
-    'medals',
-    'medau',
-    'median',
-    'mediated',
-    'medication',
-    'medicines',
-    'meditation',
-    'meg',
-    'melanie',
     'melissa',
-    'mellor',
-    'melody',
-    'melt',
-    'melted',
-    'melting',
-    'membrane',
-    'memoirs',
-    'memorable',
-    'memorandum',
-    'menace',
-    'mentioning',
-    'mentions',
-    'menus',
-    'mercedes',
-    'merchants',
     'mercury',
-    'mercy',
-    'meredith',
-    'merge',
-    'merged',
-    'mergers',
-    'merits',
-    'merrill',
-    'merry',
-    'merseyside',
-    'mesh',
-    'messenger',
-    'metabolism',
-    'metallic',
-    'metals',
-    'metaphor',
     'meter',
-    'methodist',
-    'methodological',
-    'methodology',
-    'metre',
-    'mexican',
-    'mg',
-    'mice',
-    'michel',
-    'michelle',
-    'mickey',
-    'micro',
-    'microcomputer',
-    'microphone',
-    'microscope',
-    'microsystems',
     'microwave',
-    'midday',
-    'middle-aged',
-    'middlesex',
-    'midfield',
-    'midfielder',
-    'midst',
-    'mighty',
-    'miguel',
-    'milan',
-    'mildly',
-    'militant',
-    'militia',
-    'min',
-    'minded',
-    'minerals',
     'mini',
-    'miniature',
-    'minimise',
-    'ministerial',
-    'ministries',
-    'minorities',
-    'mins',
-    'mint',
-    'minton',
-    'mips',
-    'miracle',
-    'miracles',
-    'miranda',
-    'mirrors',
-    'misses',
-    'missile',
     'missiles',
-    'missionary',
-    'missions',
-    'mist',
-    'mistaken',
-    'mister',
-    'mistress',
-    'misunderstanding',
-    'misuse',
-    'mitchell',
-    'mitterrand',
-    'mixing',
-    'ml',
-    'mo',
-    'mob',
-    'mock',
     'mocking',
-    'modelled',
-    'modelling',
-    'moderately',
-    'modification',
-    'modifications',
-    'modify',
-    'modigliani',
-    'modular',
-    'mohammed',
-    'moira',
-    'moist',
-    'moisture',
-    'mole',
-    'molecule',
-    'molla',
     'molly',
-    'momentarily',
-    'momentum',
-    'mon',
-    'monarch',
-    'monarchy',
-    'monastery',
-    'monastic',
-    'monitored',
-    'monitors',
-    'monk',
-    'monkey',
-    'monkeys',
-    'monks',
-    'monopolies',
-    'monsieur',
     'monsters',
-    'montgomery',
-    'montreal',
-    'monument',
-    'monuments',
-    'moonlight',
-    'moor',
-    'moorland',
-    'moors',
-    'morale',
-    'morally',
-    'moran',
-    'morley',
-    'mornings',
-    'morocco',
-    'morrison',
     'morrissey',
-    'morse',
-    'mortal',
-    'mortar',
-    'mortgages',
-    'mortimer',
-    'morton',
-    'mosaic',
-    'mosaics',
-    'moses',
-    'moslem',
-    'mosley',
-    'moss',
-    'motif',
-    'motions',
-    'motivated',
     'motive',
-    'motives',
-    'motoring',
-    'motorists',
-    'motors',
-    'motorway',
-    'mould',
-    'moulded',
-    'mound',
-    'mounting',
-    'mourning',
-    'moustache',
-    'mouths',
-    'movies',
-    'ms-dos',
-    'mucosa',
     'mucosal',
-    'muddy',
-    'muffled',
-    'mug',
-    'multimedia',
-    'multinational',
-    'multiparty',
-    'multiplied',
-    'multiply',
-    'multitude',
-    'mumbled',
-    'mundane',
-    'mungo',
-    'munich',
-    'municipal',
-    'murderer',
     'murdering',
-    'murders',
-    'murdoch',
-    'muriel',
-    'murphy',
-    'muscular',
-    'mushrooms',
-    'musician',
-    'muslim',
-    'muslims',
-    'mustard',
-    'mutant',
-    'mutation',
-    'mutations',
-    'muttering',
-    'mutually',
     'mysteries',
-    'mystical',
-    'myths',
-    'n.',
-    'nail',
-    'naive',
-    'namibia',
-    'naming',
-    'nan',
-    'nancy',
-    'nanny',
-    'napoleon',
-    'narrowed',
-    'narrower',
-    'narrowly',
-    'nathan',
     'nationalism',
-    'nationalists',
-    'nationality',
-    'nationally',
-    'nationals',
-    'nationwide',
-    'natwest',
-    'naughty',
-    'nave',
-    'navigation',
-    'nazi',
-    'nazis',
-    'ncr',
-    'near_to',
-    'nec',
-    'necks',
     'needing',
-    'needles',
-    'needless',
-    'negligible',
-    'nelson',
-    'nephew',
-    'nervously',
-    'nests',
-    'nets',
-    'netware',
-    'networking',
-    'neural',
-    'neutrality',
-    'neville',
-    'newco',
-    'newcomer',
     'newcomers',
-    'newer',
-    'newman',
-    'newsletter',
-    'ni',
-    'nicaragua',
-    'nicely',
-    'niche',
-    'nicholson',
-    'nicky',
-    'nicola',
-    'nicolo',
-    'niece',
-    'nigeria',
-    'nil',
-    'nina',
     'nineteenth-century',
-    'nineties',
-    'ninth',
-    'nitrate',
-    'nitrogen',
-    'nizan',
-    'nme',
-    'no_matter_how',
-    'no_matter_what',
-    'nobility',
-    'nod',
-    'nodding',
-    'node',
-    'nodes',
-    'noel',
-    'noises',
     'noisy',
-    'nominal',
-    'nominated',
-    'nomination',
-    'non',
-    'none_the_less',
-    'noon',
-    'nora',
-    'nordern',
-    'norm',
-    'normandy',
-    'norms',
-    'north-west',
-    'northampton',
-    'northamptonshire',
-    'northumberland',
     'norton',
-    'norwegian',
-    'noses',
-    'nostalgia',
-    'nostrils',
-    'notation',
-    'notebook',
-    'noticeable',
-    'notices',
-    'noticing',
-    'notified',
-    'noting',
-    'notions',
-    'notorious',
-    'notoriously',
-    'nottinghamshire',
     'notwithstanding',
-    'nought',
-    'noun',
-    'nov',
-    'novelist',
-    'novell',
-    'novelty',
-    'novice',
-    'nucleus',
-    'nuisance',
-    'numbered',
-    'numerical',
-    'nun',
-    'nuns',
-    'nut',
-    'nutrients',
     'nutrition',
-    'nutritional',
-    'nuts',
-    'nutty',
-    'nylon',
-    'o\'',
-    'o\'brien',
-    'o\'neill',
-    'o.',
-    'oath',
-    'obedience',
-    'obey',
-    'object-oriented',
-    'objected',
-    'objectivity',
-    'obscene',
     'obscured',
-    'observing',
-    'obsessed',
-    'obsession',
-    'obstacle',
-    'obstacles',
-    'obstruction',
-    'occupants',
-    'occupations',
-    'occupy',
-    'occupying',
-    'occurrence',
-    'oceans',
-    'oct',
-    'oddly',
-    'odour',
     'oecd',
-    'oesophageal',
-    'oesophagus',
-    'offended',
-    'offender',
-    'offending',
-    'offerings',
-    'offline',
-    'offset',
-    'offshore',
-    'offspring',
-    'oi',
-    'oils',
-    'oldham',
-    'olds',
-    'olive',
     'olympics',
-    'omission',
-    'on_account_of',
-    'one\'s',
-    'one-day',
-    'one-off',
-    'one-third',
-    'oneself',
-    'ongoing',
-    'onion',
-    'onions',
-    'online',
-    'onset',
-    'openness',
-    'oppose',
-    'opposing',
     'oppression',
-    'oppressive',
-    'opt',
-    'opted',
-    'optical',
-    'optimal',
-    'optimism',
-    'optimum',
-    'opting',
-    'optional',
-    'oracle',
-    'orbit',
-    'orchard',
-    'ord',
-    'ordeal',
-    'ordering',
     'orderly',
-    'ore',
-    'organisational',
-    'organiser',
-    'organisers',
-    'organising',
-    'organism',
-    'organisms',
-    'organizational',
-    'organize',
-    'organizing',
-    'organs',
-    'oriental',
-    'orientation',
-    'oriented',
-    'originated',
     'orkney',
-    'os/2',
-    'oscar',
-    'ostensibly',
-    'otto',
-    'outbreak',
-    'outcomes',
-    'outdoor',
-    'outfit',
-    'outgoing',
-    'outing',
-    'outlet',
-    'outlets',
-    'outlines',
-    'outputs',
-    'outrage',
     'outraged',
-    'outrageous',
-    'outright',
-    'outset',
-    'outside_of',
-    'outsider',
-    'outsiders',
-    'outskirts',
-    'outward',
-    'outwards',
-    'oval',
-    'over_here',
-    'overlap',
-    'overlapping',
-    'overlooked',
-    'overlooking',
     'overriding',
-    'overs',
-    'overt',
-    'overthrow',
-    'overtime',
-    'overview',
-    'overwhelmed',
-    'overwhelmingly',
-    'owes',
-    'owing_to',
-    'owl',
-    'owls',
-    'owns',
-    'oz',
-    'p.c.',
-    'p.m',
     'p.m.',
-    'pa',
-    'paces',
-    'packaging',
-    'packets',
-    'packing',
-    'packs',
-    'pact',
-    'pad',
-    'padded',
-    'paddy',
-    'pads',
-    'pagan',
-    'paige',
-    'painfully',
-    'pains',
     'painters',
-    'paints',
-    'paisley',
-    'pal',
-    'palestine',
-    'palestinian',
-    'palestinians',
-    'palmer',
-    'palms',
-    'pam',
-    'pamela',
-    'panama',
-    'pancreatic',
-    'panels',
-    'pants',
-    'papa',
     'papal',
-    'paperback',
-    'paperwork',
-    'par',
-    'para',
-    'parachute',
-    'parade',
-    'paradigm',
-    'paradise',
-    'paradox',
-    'paradoxically',
-    'paragraphs',
-    'parallels',
-    'paralysed',
-    'parameter',
-    'parameters',
     'paramount',
-    'parasites',
-    'parcel',
-    'parcels',
-    'parishes',
-    'parkinson',
-    'parlour',
-    'parsons',
-    'parted',
-    'participant',
-    'participated',
-    'participating',
-    'particle',
-    'particulars',
-    'parting',
-    'partition',
     'partnerships',
-    'pascoe',
-    'passages',
-    'passionate',
-    'passport',
-    'pasta',
-    'paste',
-    'pastoral',
-    'pastry',
-    'pasture',
-    'patches',
-    'patent',
-    'pathetic',
-    'pathway',
-    'patiently',
-    'patio',
     'patricia',
-    'patriotic',
-    'patrol',
-    'patron',
-    'patronage',
-    'patrons',
-    'patsy',
-    'patted',
-    'patten',
-    'paula',
-    'pauline',
-    'pavements',
-    'pavilion',
-    'paving',
-    'pcs',
-    'peach',
     'peacock',
-    'peaks',
-    'pearce',
-    'pearl',
-    'pears',
-    'pearson',
-    'peas',
-    'peasantry',
-    'peat',
-    'pedestrian',
-    'peel',
-    'peer',
-    'peered',
-    'peering',
-    'peers',
-    'peg',
     'peggy',
-    'penal',
-    'penalties',
-    'pending',
-    'penetrate',
-    'penetration',
-    'penguin',
-    'peninsula',
-    'penis',
-    'penry',
-    'pens',
-    'pensioner',
-    'pepper',
-    'per_annum',
-    'per_capita',
-    'perceive',
     'perceptions',
-    'perched',
-    'percy',
-    'perfection',
-    'performer',
-    'performers',
-    'performs',
-    'perfume',
-    'perimeter',
-    'periodic',
-    'peripheral',
-    'permits',
-    'permitting',
-    'perpetual',
-    'perry',
-    'persian',
     'persist',
-    'persisted',
-    'persistence',
-    'personalities',
-    'perspectives',
-    'persuading',
-    'persuasion',
-    'persuasive',
-    'perth',
-    'peru',
-    'perverse',
-    'pest',
-    'pesticides',
-    'peterborough',
-    'peters',
-    'petersburg',
     'petroleum',
-    'pets',
-    'petty',
-    'pharmaceutical',
-    'phases',
-    'philippa',
-    'philippines',
-    'philips',
-    'philosopher',
-    'philosophers',
-    'phoenix',
-    'phones',
-    'phosphate',
-    'photographed',
-    'photographer',
-    'photographers',
     'photographic',
-    'photography',
-    'photos',
-    'physician',
-    'physiological',
-    'pi',
-    'picasso',
-    'picks',
-    'picnic',
-    'pictured',
-    'picturesque',
-    'pie',
-    'pier',
-    'pierre',
-    'piers',
-    'pies',
     'pigeons',
-    'pigs',
-    'pike',
-    'piled',
-    'piles',
-    'pilgrimage',
-    'pill',
-    'pillar',
-    'pillars',
-    'pillow',
-    'pills',
-    'pilots',
-    'pinch',
-    'pine',
-    'pinned',
-    'pins',
     'pints',
-    'pioneer',
-    'pioneering',
-    'pip',
-    'pipeline',
-    'piper',
-    'pipes',
-    'piss',
-    'pissed',
-    'pistol',
-    'pitched',
-    'pits',
-    'pizza',
-    'placement',
-    'plague',
-    'plainly',
     'plains',
-    'plaintiffs',
-    'planes',
-    'planets',
-    'planners',
-    'plaque',
-    'plasma',
-    'plaster',
-    'plastics',
-    'plateau',
-    'platelet',
-    'platforms',
-    'plausible',
-    'playground',
-    'plea',
-    'pleaded',
     'pleading',
-    'pleasantly',
-    'pleasing',
-    'pleasures',
-    'pledge',
-    'pledged',
-    'plentiful',
-    'plight',
-    'plo',
-    'plots',
-    'plotting',
-    'plough',
-    'plug',
-    'plump',
-    'plunge',
-    'plunged',
     'plutonium',
-    'plymouth',
-    'pneumonia',
-    'po',
-    'poetic',
-    'poets',
-    'pointless',
-    'poised',
-    'poison',
-    'poisoned',
-    'poisoning',
-    'poisonous',
-    'polar',
-    'policing',
-    'policy-making',
-    'polished',
     'politburo',
-    'politely',
-    'politician',
-    'polling',
-    'polls',
-    'polly',
-    'polo',
-    'polymer',
-    'polymers',
-    'polytechnics',
-    'ponds',
-    'pony',
-    'poole',
-    'pools',
-    'poorer',
-    'poorest',
     'poorly',
-    'popped',
-    'porch',
-    'pork',
-    'portable',
-    'portion',
-    'portions',
-    'portraits',
-    'portrayed',
-    'ports',
-    'portsmouth',
-    'portugal',
-    'portuguese',
-    'pose',
-    'poses',
-    'posh',
     'positioned',
-    'positioning',
-    'possesses',
-    'possessing',
-    'possessions',
-    'postal',
-    'postcard',
-    'posted',
-    'poster',
-    'posters',
-    'postgraduate',
-    'postponed',
-    'posture',
-    'postwar',
-    'potato',
-    'potent',
     'pots',
-    'potter',
-    'pottery',
-    'pounding',
-    'pouring',
-    'powell',
-    'powered',
-    'powerfully',
-    'powerless',
-    'pp',
-    'pr',
-    'practicable',
-    'practising',
-    'practitioner',
-    'pragmatic',
-    'prague',
     'praised',
-    'prayed',
-    'prayers',
-    'praying',
-    'pre-tax',
-    'pre-war',
-    'preaching',
-    'precautions',
-    'preceded',
-    'precedent',
-    'predator',
-    'predators',
-    'predecessor',
-    'predecessors',
-    'predictable',
-    'predicting',
     'prediction',
-    'predictions',
-    'predominant',
-    'preface',
-    'preferable',
-    'preferably',
-    'preferences',
-    'preferring',
-    'prefers',
-    'prejudices',
-    'premature',
-    'premiums',
-    'preoccupation',
-    'preoccupied',
-    'preparations',
-    'prescription',
     'presentations',
-    'presenter',
-    'presently',
-    'preservation',
-    'preserving',
-    'presided',
-    'presidents',
-    'prestige',
-    'prestigious',
-    'presume',
-    'presumed',
-    'presumption',
-    'pretence',
-    'pretended',
-    'pretending',
-    'prevail',
     'prevailed',
-    'prevailing',
-    'prevalence',
-    'prevalent',
-    'preventive',
-    'prevents',
-    'priced',
-    'pricing',
-    'priests',
-    'princes',
-    'principally',
-    'printers',
-    'priory',
-    'prisons',
-    'privacy',
-    'privatised',
     'privatization',
-    'privileged',
-    'privileges',
-    'privy',
-    'prix',
-    'prizes',
-    'pro',
-    'probation',
-    'probes',
-    'problematic',
-    'procedural',
-    'proceeded',
-    'proceeding',
-    'processed',
-    'procession',
-    'processors',
     'proclaimed',
-    'productions',
-    'prof',
-    'professionalism',
-    'professionally',
-    'professions',
-    'profiles',
-    'profitability',
-    'profitboss',
-    'profoundly',
-    'programmed',
-    'progressed',
-    'progression',
-    'progressively',
-    'prohibited',
-    'prohibition',
     'projected',
-    'projection',
-    'projections',
-    'proletariat',
-    'proliferation',
-    'prolonged',
-    'promenade',
-    'prominence',
-    'promoter',
-    'promoters',
-    'promotional',
-    'promotions',
-    'prompt',
-    'promptly',
-    'prone',
-    'pronunciation',
     'prop',
-    'propaganda',
-    'prophet',
-    'proportional',
-    'proposes',
-    'proposing',
-    'propositions',
-    'propped',
-    'proprietary',
-    'proprietor',
-    'prose',
-    'prosecuting',
-    'prosecutions',
-    'prosecutor',
-    'prosperity',
-    'prosperous',
     'prostitutes',
-    'prostitution',
-    'protestants',
-    'protesters',
-    'protesting',
-    'protocol',
-    'prototype',
-    'proudly',
-    'proven',
-    'proves',
-    'provided_that',
-    'providers',
-    'provinces',
-    'proving',
-    'provisional',
-    'provoke',
     'provoked',
-    'proximal',
-    'proximity',
-    'prudent',
-    'ps',
-    'psychiatric',
-    'psychic',
-    'psychoanalysis',
-    'psychologist',
-    'psychologists',
-    'pudding',
-    'pulls',
-    'pulse',
-    'pulses',
-    'pumped',
-    'pumping',
     'pumps',
-    'punched',
-    'punish',
-    'punished',
-    'punk',
-    'puppy',
-    'purchasers',
-    'purchases',
-    'purity',
-    'purse',
-    'pursuant_to',
-    'pursuing',
-    'puzzle',
-    'pylori',
-    'pyramid',
-    'q.b.',
     'q.v',
-    'qc',
-    'qualifying',
-    'qualitative',
-    'quantitative',
-    'quantum',
-    'quarrel',
-    'quarry',
-    'quarterly',
-    'quartet',
-    'quay',
-    'queens',
-    'queried',
-    'queries',
-    'query',
-    'quest',
     'questionable',
-    'questionnaires',
-    'queue',
-    'quicker',
-    'quinn',
-    'quit',
-    'quiz',
-    'quota',
-    'quotas',
-    'quotation',
-    'quotations',
-    'quotes',
-    'quoting',
-    'r&amp;d',
-    'rabbits',
-    'raced',
     'rachaela',
-    'racism',
-    'racist',
-    'rack',
-    'radar',
-    'radiator',
-    'radically',
-    'radicals',
-    'radioactive',
-    'radius',
-    'rag',
-    'ragged',
-    'raids',
-    'rails',
-    'rainbow',
-    'rainforest',
     'raining',
-    'ram',
-    'ramp',
-    'ramsay',
-    'ramsey',
-    'ranged',
-    'ranges',
-    'ranked',
-    'ranking',
-    'rap',
-    'raped',
-    'rash',
-    'rat',
-    'rated',
-    'rating',
-    'ratings',
     'rationale',
-    'rationality',
-    'ratios',
-    'rattled',
-    'raymond',
-    'rays',
-    'razor',
-    'reacted',
-    'reactive',
-    'reactor',
-    'reactors',
-    'readiness',
-    'readings',
-    'reads',
-    'reagan',
-    'realisation',
     'realising',
-    'realism',
-    'realities',
-    'realization',
-    'realm',
-    'reared',
-    'reasoned',
-    'reassurance',
-    'reassure',
-    'reassured',
-    'reassuring',
-    'rebecca',
-    'rebel',
-    'rebellion',
-    'rebuild',
-    'rebuilding',
     'rebuilt',
-    'recalling',
-    'recalls',
-    'receipt',
-    'receipts',
-    'receptionist',
-    'receptor',
-    'receptors',
-    'recipes',
-    'recipient',
-    'recipients',
-    'reciprocal',
-    'reckless',
-    'reckoned',
-    'reckons',
-    'recognises',
     'recognising',
-    'recognizing',
-    'recommending',
-    'recommends',
-    'reconcile',
-    'reconciliation',
-    'reconstruction',
-    'recorder',
-    'recordings',
-    'recourse',
-    'recovering',
-    'recreation',
-    'recreational',
-    'recruit',
-    'recruited',
-    'recruiting',
     'recruits',
-    'rectal',
-    'rectangular',
-    'rector',
-    'recurrence',
-    'recurrent',
-    'recycled',
-    'recycling',
-    'redemption',
-    'redress',
-    'reds',
-    'reduces',
-    'redundancies',
-    'redundancy',
-    'reed',
-    'reef',
     'referral',
-    'referrals',
-    'refined',
-    'reflections',
-    'reflux',
-    'reformed',
-    'reformers',
-    'refreshing',
-    'refuge',
-    'refugee',
-    'refuses',
-    'reg',
-    'reg.',
-    'regain',
-    'regained',
-    'regards',
     'regeneration',
-    'regent',
-    'regimes',
-    'registers',
-    'registrar',
-    'registry',
-    'regression',
-    'regretted',
-    'regulate',
-    'regulated',
-    'regulating',
-    'rehabilitation',
-    'rehearsal',
-    'reich',
-    'reid',
-    'reinforce',
     'reins',
-    'rejecting',
-    'rejects',
-    'relational',
-    'relative_to',
-    'relaxation',
-    'relaxing',
-    'releases',
-    'releasing',
-    'relegation',
-    'reliability',
-    'reliance',
-    'relies',
-    'relieve',
-    'religions',
-    'relish',
     'relocation',
-    'reluctance',
-    'reluctantly',
-    'relying',
-    'remedies',
-    'remembers',
-    'reminder',
-    'reminding',
-    'reminds',
-    'reminiscent',
-    'remit',
-    'remuneration',
-    'renaissance',
-    'renal',
-    'renault',
-    'render',
     'rendered',
-    'rendering',
-    'renew',
-    'renewal',
-    'renowned',
-    'rental',
-    'rented',
-    'rents',
-    'reorganisation',
-    'repaired',
-    'repay',
-    'repayment',
-    'repeating',
-    'repeats',
-    'repertoire',
-    'repetition',
     'repetitive',
-    'replaces',
-    'replay',
-    'replies',
-    'reporters',
-    'repression',
-    'reproduce',
-    'reproduced',
-    'reproduction',
-    'reproductive',
-    'republicans',
-    'requesting',
-    'rescued',
-    'researcher',
-    'resemblance',
-    'resemble',
     'resembled',
-    'resembles',
-    'resented',
-    'resentment',
-    'reservation',
-    'reservations',
-    'reservoir',
-    'reshuffle',
-    'residual',
-    'residue',
-    'residues',
-    'resign',
-    'resistant',
-    'resisted',
-    'resisting',
-    'resolutions',
     'resolving',
-    'resorts',
-    'respiratory',
-    'respondent',
-    'respondents',
-    'responding',
-    'responds',
-    'responsive',
-    'rested',
-    'restless',
-    'restoring',
-    'restrain',
-    'restrained',
-    'restraint',
-    'restrict',
-    'restricting',
     'restrictive',
-    'restructuring',
-    'rests',
-    'resultant',
-    'resume',
-    'resumed',
-    'resurrection',
-    'retailer',
-    'retailers',
-    'retailing',
-    'retaining',
-    'retains',
-    'retention',
-    'retire',
-    'retiring',
-    'retorted',
     'retreated',
-    'retrieval',
-    'retrieve',
-    'retrospect',
-    'retrospective',
-    'reunion',
-    'reuter',
-    'rev',
-    'rev.',
-    'revelation',
-    'revelations',
-    'revenge',
-    'reverend',
-    'reversal',
-    'reversed',
-    'reviewing',
     'revision',
-    'revive',
-    'revived',
-    'revolt',
-    'rewarded',
-    'rewarding',
-    'rex',
-    'reynolds',
-    'rhetoric',
-    'rhodes',
-    'rhythmic',
-    'rhythms',
-    'rib',
-    'ribbon',
-    'ribs',
-    'richards',
     'richardson',
-    'richer',
-    'richest',
-    'richly',
-    'richmond',
-    'rick',
-    'ricky',
-    'ridden',
-    'rider',
-    'riders',
-    'rides',
-    'rifle',
-    'rift',
-    'rig',
-    'right-hand',
-    'right-wing',
     'rigorous',
-    'rim',
-    'rio',
-    'riot',
-    'riots',
-    'rip',
-    'ripe',
-    'ripped',
-    'risc',
-    'risky',
-    'rituals',
-    'rivalry',
-    'riverside',
-    'rna',
-    'roar',
-    'roared',
     'roaring',
-    'roast',
-    'robbed',
-    'robbery',
-    'robbie',
-    'robe',
-    'robertson',
-    'robot',
-    'robson',
-    'robust',
-    'rochester',
-    'rocked',
-    'rocket',
-    'rocking',
-    'rocky',
-    'rode',
     'rods',
-    'rogers',
-    'roland',
-    'roller',
-    'romance',
-    'romania',
-    'romanian',
-    'romans',
-    'ronald',
-    'ronni',
-    'ronnie',
-    'roofs',
-    'rooted',
-    'ropes',
-    'rory',
-    'ros',
     'rosa',
-    'rosemary',
-    'rosie',
-    'rostov',
-    'rot',
-    'rotation',
-    'rotor',
-    'rotten',
-    'roundabout',
-    'routines',
-    'rovers',
-    'rowing',
-    'royalty',
-    'rub',
-    'rubbed',
-    'rubbing',
     'rubble',
-    'ruc',
-    'rude',
-    'rue',
-    'rufus',
-    'rug',
-    'rugs',
-    'ruin',
-    'ruined',
-    'ruins',
-    'ruler',
-    'rulers',
-    'rum',
-    'rumour',
-    'rung',
-    'runner',
     'runners',
-    'runway',
-    'rupert',
-    'rushing',
-    'rusty',
-    'ruthless',
-    'ryan',
-    'ryder',
-    'rye',
-    'sabine',
-    'sack',
-    'sacked',
-    'sacrifice',
-    'saddam',
-    'saddle',
-    'sadness',
     'safeguard',
-    'safeguards',
-    'saga',
-    'sailed',
-    'sailor',
-    'sailors',
-    'sails',
-    'sainsbury',
-    'saints',
-    'salad',
-    'salaries',
-    'salesman',
-    'salisbury',
-    'sally-anne',
-    'salon',
-    'saloon',
     'salvador',
-    'salvation',
-    'sampling',
-    'sanction',
-    'sanctuary',
-    'sandra',
-    'sands',
-    'sandwich',
-    'sandwiches',
-    'sank',
-    'sarajevo',
-    'sas',
-    'satellites',
-    'satin',
-    'satisfactorily',
-    'satisfying',
     'saturated',
-    'saturdays',
-    'saunders',
-    'sausage',
-    'sausages',
-    'savage',
-    'saves',
-    'saxon',
-    'scan',
-    'scandinavian',
-    'scanned',
-    'scanning',
-    'scar',
-    'scarborough',
-    'scarce',
-    'scare',
     'scarf',
-    'scattering',
-    'scenario',
-    'scenery',
-    'scent',
-    'sceptical',
-    'scepticism',
-    'schedules',
-    'scholar',
-    'scholarly',
-    'scholars',
-    'scholarship',
-    'schoolboy',
-    'schooling',
-    'scissors',
-    'sco',
     'scot',
-    'scotch',
-    'scotsman',
-    'scotvec',
-    'scouts',
-    'scrambled',
-    'scrap',
-    'scratch',
-    'scratched',
-    'scratching',
-    'scream',
-    'screamed',
-    'screams',
-    'screened',
-    'screens',
-    'screw',
     'screwed',
-    'screws',
-    'scrub',
-    'sculptures',
-    'scum',
-    'se',
-    'seals',
-    'seamen',
-    'sean',
-    'searched',
-    'searches',
-    'seas',
-    'seaside',
-    'seasonal',
-    'seating',
-    'seb',
     'sebastian',
-    'second-hand',
-    'seconded',
-    'secrecy',
-    'secretariat',
-    'secretaries',
-    'secretary-general',
-    'secretion',
-    'secretly',
-    'secular',
-    'securing',
-    'sediment',
-    'sediments',
-    'seeming',
-    'segment',
-    'segments',
     'segregation',
-    'seize',
-    'selecting',
-    'self-employed',
-    'self-esteem',
-    'selfish',
-    'sellers',
-    'sells',
-    'semi-final',
-    'semi-finals',
-    'semiconductor',
-    'seminar',
-    'seminars',
-    'senator',
-    'sends',
-    'sensational',
     'sensations',
-    'sensed',
-    'sensibly',
-    'sensing',
-    'sensory',
-    'sentencing',
-    'sentiment',
-    'sentimental',
-    'sentiments',
-    'separating',
-    'serbia',
-    'serbian',
-    'serbs',
-    'serial',
-    'seriousness',
-    'servers',
     'servicing',
-    'set-up',
-    'settings',
-    'settlers',
-    'settling',
-    'seventies',
-    'severed',
-    'severity',
-    'severn',
-    'sewage',
-    'sewing',
-    'sexes',
-    'sexually',
-    'sexy',
-    'sh',
-    'sha',
     'shabby',
-    'shades',
-    'shaft',
-    'shah',
-    'shaken',
-    'shaky',
-    'shaping',
-    'shareholder',
-    'sharon',
-    'sharpe',
-    'shattered',
-    'shaw',
-    'sheila',
-    'shelley',
-    'shells',
-    'sheltered',
     'shepherd',
-    'sheriff',
-    'sherry',
-    'shetland',
-    'shields',
-    'shifting',
-    'shillings',
-    'shine',
-    'shiny',
-    'shiona',
-    'shipped',
-    'shirley',
-    'shirts',
-    'shivered',
-    'shivering',
-    'shocking',
     'shoe',
-    'shone',
-    'shoots',
-    'shoppers',
-    'shores',
-    'short-lived',
-    'shortages',
-    'shortcomings',
-    'shortfall',
-    'shorts',
-    'shotgun',
-    'shouts',
-    'shrewd',
-    'shrewsbury',
-    'shrine',
-    'shropshire',
     'shrubs',
-    'shrug',
-    'shuddered',
-    'shuttle',
-    'si',
-    'siberia',
-    'sid',
-    'sideways',
-    'siege',
-    'siemens',
-    'sierra',
-    'sights',
-    'signalled',
-    'signalling',
-    'signature',
-    'signatures',
     'silas',
-    'silicon',
-    'similarities',
-    'similarity',
-    'simpler',
-    'simplest',
-    'simplicity',
-    'simplified',
-    'simpson',
-    'simulation',
-    'simultaneous',
-    'sincere',
-    'sincerely',
-    'singapore',
-    'singers',
-    'singh',
     'singles',
-    'singular',
-    'sinister',
-    'sinking',
-    'sins',
-    'sipped',
-    'sitting-room',
-    'sixteenth',
-    'sizeable',
-    'sized',
-    'skeleton',
-    'sketch',
-    'sketches',
-    'ski',
-    'skies',
-    'skiing',
     'skilful',
-    'skinner',
-    'skins',
-    'skip',
-    'skipper',
-    'skirts',
-    'skull',
-    'slab',
-    'slack',
-    'slam',
-    'slammed',
-    'slap',
-    'slapped',
-    'slashed',
-    'slate',
-    'slaughter',
     'slave',
-    'slavery',
-    'slaves',
-    'sleepy',
-    'sleeve',
-    'sleeves',
-    'slender',
-    'slice',
-    'sliced',
-    'slices',
-    'slides',
-    'sliding',
-    'slightest',
-    'slippery',
-    'slipping',
-    'slips',
     'slogan',
-    'slopes',
-    'slot',
-    'slots',
-    'slowed',
-    'slower',
-    'slowing',
-    'slump',
-    'slumped',
-    'sly',
-    'smallest',
-    'smash',
-    'smashed',
-    'smashing',
-    'smells',
-    'smelt',
     'smiles',
-    'smiths',
-    'smoked',
-    'smokers',
-    'smoothly',
-    'snake',
-    'snakes',
-    'snap',
-    'snatched',
-    'sniffed',
-    'snooker',
-    'so_much_as',
-    'soaked',
-    'soared',
-    'soaring',
-    'sober',
     'socialists',
-    'socio-economic',
-    'sociological',
-    'sociologists',
-    'socket',
-    'socks',
-    'sod',
-    'sodium',
-    'sofa',
-    'softened',
-    'softer',
-    'soils',
-    'solaris',
-    'solemn',
-    'solidarity',
-    'solitary',
     'solvent',
-    'solving',
-    'somalia',
-    'sometime',
-    'sony',
-    'sophistication',
-    'sore',
-    'sorrow',
-    'sorting',
-    'sotheby',
-    'souls',
-    'sounding',
-    'souness',
-    'sour',
-    'south-west',
-    'southampton',
     'sovereign',
-    'spa',
-    'spacious',
-    'span',
-    'sparc',
-    'spared',
-    'spark',
-    'sparked',
-    'sparkling',
-    'sparks',
-    'spat',
-    'specialised',
-    'speciality',
-    'specialized',
-    'specifications',
-    'specificity',
     'specifying',
-    'specimen',
-    'spectacle',
-    'spectacles',
-    'spectator',
-    'spectators',
-    'speculate',
-    'speculative',
-    'speeches',
-    'speeding',
-    'speeds',
-    'speedy',
-    'spelling',
-    'spells',
-    'spelt',
-    'spends',
     'sperm',
-    'spheres',
-    'spider',
-    'spill',
-    'spilled',
-    'spin',
-    'spinal',
-    'spine',
-    'spines',
-    'spinning',
-    'spiral',
-    'spit',
-    'splash',
-    'splitting',
-    'spoil',
-    'spoiled',
     'spokeswoman',
-    'sponge',
-    'sponsor',
-    'sponsors',
-    'spontaneous',
-    'spontaneously',
-    'spoon',
-    'spotlight',
-    'spouse',
-    'spr',
-    'sprang',
-    'spray',
-    'spreads',
-    'spreadsheet',
-    'springs',
-    'spun',
     'spur',
-    'spurs',
-    'spy',
-    'sq_km',
-    'squared',
-    'squares',
-    'squash',
-    'squeeze',
-    'squeezed',
-    'sri',
-    'ssr',
-    'stab',
-    'stabbed',
-    'stables',
-    'stack',
-    'stacked',
     'stadium',
-    'staffing',
-    'staged',
-    'staggered',
-    'staggering',
-    'staging',
-    'stain',
-    'stained',
-    'staining',
-    'staircase',
-    'stakes',
-    'stalin',
-    'stall',
-    'stalls',
-    'stamford',
-    'stamped',
     'stamps',
-    'stan',
-    'standardised',
-    'stark',
-    'starring',
-    'starter',
-    'startled',
-    'startling',
-    'starvation',
-    'starving',
-    'state-owned',
-    'stating',
-    'stationed',
-    'statistically',
-    'statue',
-    'statues',
     'status_quo',
-    'statutes',
-    'stays',
-    'steak',
-    'steal',
-    'stealing',
-    'steaming',
-    'steer',
-    'steering',
-    'stella',
-    'stems',
-    'stephanie',
-    'stepping',
-    'stereo',
-    'stern',
-    'stevens',
     'stevenson',
-    'steward',
-    'stewards',
-    'sticking',
-    'sticky',
-    'stiffly',
-    'stimulate',
-    'stimulated',
-    'stimulating',
-    'stimulation',
-    'stimuli',
-    'sting',
-    'stirling',
-    'stirred',
-    'stirring',
-    'stitch',
     'stitches',
-    'stocking',
-    'stockings',
-    'stockton',
-    'stoke',
-    'stole',
-    'stool',
-    'storing',
-    'stormed',
-    'storms',
-    'stout',
-    'stove',
-    'straightened',
-    'strained',
-    'straining',
-    'strains',
     'strand',
-    'stranded',
-    'strands',
-    'strangely',
-    'strangers',
-    'strap',
-    'straps',
-    'strasbourg',
-    'stratford',
-    'strathclyde',
-    'stray',
-    'streak',
-    'streams',
-    'strengthened',
-    'strengthening',
-    'strengths',
     'stresses',
-    'stressing',
-    'stretches',
-    'stride',
-    'stringent',
-    'striped',
-    'stripes',
-    'stripped',
-    'strips',
-    'strode',
-    'stroked',
-    'strokes',
-    'stroll',
-    'strolled',
-    'strongest',
-    'struggles',
     'stubborn',
-    'studios',
-    'stuffed',
-    'stumbled',
-    'stumbling',
-    'stunned',
-    'stunning',
-    'sturdy',
-    'stylish',
-    'stylistic',
-    'sub',
-    'sub-committee',
-    'subdued',
-    'subjective',
-    'submarine',
-    'submission',
     'submissions',
-    'subordinate',
-    'subordinates',
-    'subscribers',
-    'subscription',
-    'subsection',
-    'subsidiaries',
-    'subsidies',
-    'subsidy',
-    'subsistence',
-    'substantive',
-    'substituted',
-    'substitution',
-    'suburb',
-    'suburban',
-    'suburbs',
     'succeeding',
-    'successes',
-    'successors',
-    'suck',
-    'sucked',
-    'sucking',
-    'sudan',
-    'sued',
-    'sufferer',
-    'sufferers',
-    'suffers',
-    'suffice',
-    'suitably',
-    'suitcase',
-    'sullivan',
-    'sulphur',
     'sultan',
-    'summarised',
-    'summat',
-    'summed',
-    'summoned',
-    'summons',
-    'sundays',
-    'sung',
-    'sunk',
-    'sunny',
-    'sunset',
-    'sunsoft',
-    'superficial',
-    'superintendent',
-    'superiority',
-    'supermarket',
     'supermarkets',
-    'supervise',
-    'supervised',
-    'supervisor',
-    'supplementary',
-    'supplemented',
-    'supplements',
-    'supplying',
-    'supporter',
-    'supportive',
-    'supposedly',
-    'suppress',
-    'suppressed',
-    'suppression',
-    'supremacy',
-    'surge',
     'surgeon',
-    'surgeons',
-    'surgical',
-    'surprises',
-    'surrender',
-    'surrendered',
-    'surround',
-    'surveillance',
-    'surveyed',
-    'surveying',
-    'surveyor',
-    'surveyors',
-    'survives',
-    'survivors',
-    'susceptible',
-    'suspects',
     'suspend',
-    'suspicions',
-    'sustainable',
-    'sutherland',
-    'sutton',
-    'swallow',
-    'swam',
-    'swan',
-    'swansea',
-    'swap',
-    'swear',
-    'sweater',
-    'sweating',
-    'swedish',
-    'sweep',
-    'sweeping',
     'sweets',
-    'swell',
-    'swelling',
-    'swinging',
-    'swings',
-    'switches',
-    'switching',
-    'swollen',
-    'swore',
-    'sworn',
-    'sydney',
-    'syllable',
-    'syllabus',
-    'sylvia',
-    'symmetry',
-    'symphony',
     'symptom',
-    'syntactic',
-    'syntax',
-    'synthetic',
-    'syria',
-    'syrian',
-    'systematically',
-    't-shirt',
-    'tablets',
-    'tack',
-    'tackled',
-    'tackling',
-    'tactic',
-    'tactical',
-    'tag',
-    'tailor',
     'tailored',
-    'tails',
-    'taiwan',
-    'takeover',
-    'talbot',
-    'talented',
-    'talents',
-    'taller',
-    'tan',
-    'tangible',
-    'tangled',
-    'tapped',
-    'tapping',
-    'taps',
-    'targeted',
-    'tariff',
     'tariffs',
-    'tasted',
-    'tastes',
-    'tate',
-    'taxed',
-    'taxpayer',
-    'taxpayers',
-    'tbsp',
-    'teaches',
-    'tearing',
-    'teased',
-    'teasing',
-    'technically',
-    'technicians',
-    'ted',
-    'teddy',
     'tedious',
-    'tee',
-    'teenage',
-    'teenager',
-    'teenagers',
-    'tees',
-    'teesside',
-    'telecom',
-    'telephoned',
-    'telephones',
-    'telescope',
-    'telly',
-    'temperament',
-    'temples',
-    'temporal',
-    'temptation',
     'tempting',
-    'tenancy',
-    'tendencies',
-    'tending',
-    'tens',
-    'tensions',
-    'tent',
-    'tentacle',
-    'tentative',
-    'tenth',
-    'tenure',
-    'ter',
-    'teresa',
-    'termed',
-    'terminals',
-    'terminated',
     'termination',
-    'terminology',
-    'terraces',
-    'terrain',
-    'terrific',
-    'terrified',
-    'terrifying',
-    'terrorism',
-    'terrorist',
-    'terrorists',
-    'tesco',
-    'tess',
-    'testimony',
-    'texas',
-    'textbooks',
-    'textile',
     'textiles',
-    'texture',
-    'tha',
-    'thai',
-    'thailand',
-    'thanked',
-    'thankfully',
-    'that_is_to_say',
-    'theatres',
-    'theatrical',
-    'theda',
-    'thee',
-    'theirs',
-    'theodora',
-    'theological',
-    'theology',
     'theoretically',
-    'theorists',
-    'therapeutic',
-    'therapist',
-    'thereof',
-    'thermal',
-    'theses',
-    'thickness',
-    'thief',
-    'thieves',
-    'thigh',
-    'thighs',
-    'thinly',
-    'thirdly',
-    'thirds',
-    'thirteenth',
     'thirties',
-    'thomson',
-    'thorn',
-    'thornton',
-    'thorough',
-    'thou',
-    'thoughtful',
-    'thoughtfully',
-    'thread',
-    'threads',
-    'threaten',
-    'threatens',
-    'three-dimensional',
-    'three-quarters',
-    'three-year',
-    'threshold',
     'thrill',
-    'thrilled',
-    'thrive',
-    'thriving',
-    'throws',
-    'thumb',
-    'thunder',
-    'thy',
-    'ti',
-    'tick',
-    'tidal',
-    'tidy',
-    'tiger',
-    'tigers',
-    'tighten',
-    'tightened',
     'tightening',
-    'tighter',
-    'tilted',
-    'timetable',
-    'timothy',
-    'tina',
-    'tins',
-    'tipped',
-    'tissues',
-    'toast',
-    'toby',
-    'todd',
-    'toe',
-    'toes',
-    'toilets',
-    'token',
     'tokyo',
-    'tolerance',
-    'tolerate',
-    'tolerated',
-    'tolkien',
-    'toll',
-    'tomato',
-    'tomatoes',
-    'tomb',
-    'ton',
-    'tones',
-    'tonic',
-    'tooth',
-    'topaz',
-    'topped',
-    'tops',
     'torch',
-    'tore',
-    'toronto',
-    'torque',
-    'tort',
-    'torture',
-    'tortured',
-    'toss',
-    'tossed',
-    'totalling',
-    'tottenham',
-    'touches',
-    'tougher',
-    'touring',
-    'tournaments',
-    'tours',
     'towel',
-    'towels',
-    'towers',
-    'townsend',
-    'toy',
-    'toys',
-    'traced',
-    'traces',
-    'tracey',
-    'tracing',
-    'tracking',
-    'tract',
-    'tractor',
-    'traded',
-    'trader',
-    'trafford',
     'trailed',
-    'trailer',
-    'trailing',
-    'trainee',
-    'trainees',
-    'trainer',
-    'trainers',
-    'traits',
-    'tram',
-    'transcription',
-    'transferring',
-    'transfers',
-    'transform',
-    'transforming',
-    'transient',
-    'transit',
     'transitional',
-    'translate',
-    'transmitted',
-    'transparent',
-    'transplant',
-    'transportation',
-    'transported',
-    'traps',
-    'trauma',
-    'traumatic',
-    'traveller',
-    'travels',
-    'travis',
-    'tread',
-    'treasure',
-    'treasurer',
     'treasures',
-    'treaties',
-    'treatments',
-    'treats',
-    'trembling',
-    'trench',
-    'trent',
-    'triangle',
-    'triangular',
-    'tribal',
-    'tribe',
-    'tribes',
-    'tribunals',
-    'tricks',
-    'tricky',
-    'trigger',
     'triggered',
-    'trim',
-    'trinity',
-    'trio',
-    'triple',
-    'triumphant',
-    'trivial',
-    'trolley',
-    'troop',
-    'troubles',
-    'troublesome',
-    'trout',
-    'truce',
-    'trucks',
-    'trunk',
-    'trusted',
     'trustee',
-    'truths',
-    'tsar',
-    'tt',
-    'tubes',
-    'tuck',
-    'tucked',
-    'tudor',
-    'tug',
-    'tuition',
-    'tumbled',
-    'tummy',
-    'tumour',
-    'tumours',
-    'tunes',
-    'tunnels',
     'turbulence',
-    'turbulent',
-    'turf',
-    'turks',
-    'turmoil',
-    'turner',
-    'tutor',
-    'tutors',
-    'tweed',
-    'twelfth',
-    'twenties',
-    'twentieth-century',
-    'twenty-five',
-    'twenty-four',
-    'twenty-one',
-    'twenty-two',
     'twins',
-    'twisting',
-    'two-thirds',
-    'two-year',
-    'tyne',
-    'tyneside',
-    'typed',
-    'typewriter',
-    'typing',
-    'tyre',
-    'tyres',
-    'u.s.',
-    'ukraine',
-    'ukrainian',
-    'ulcer',
-    'ulcerative',
     'ulcers',
-    'um',
-    'umbrella',
-    'unaffected',
-    'unanimous',
-    'unanimously',
-    'unbeaten',
-    'unbelievable',
-    'uncertainties',
-    'unchanged',
-    'unclear',
-    'uncomfortably',
-    'uncommon',
-    'uncovered',
-    'under_way',
-    'undergo',
     'undergoing',
-    'undergone',
-    'undergraduate',
-    'underlined',
-    'undermine',
-    'undermined',
-    'understandable',
-    'understandably',
-    'understands',
-    'undertakings',
-    'undertook',
-    'underwater',
-    'underway',
-    'underwear',
-    'underwent',
-    'undesirable',
     'undue',
-    'unduly',
-    'unease',
-    'uneasy',
-    'unequal',
-    'uneven',
-    'unexpectedly',
-    'unfamiliar',
-    'unification',
-    'unified',
-    'uniforms',
-    'unionist',
-    'unionists',
-    'uniquely',
-    'unitary',
-    'unite',
     'universally',
-    'unlawful',
-    'unlimited',
-    'unlocked',
-    'unlucky',
-    'unmarried',
-    'unmistakable',
-    'unnatural',
-    'unnecessarily',
-    'unofficial',
-    'unpaid',
-    'unpopular',
-    'unprecedented',
-    'unpredictable',
-    'unpublished',
-    'unrealistic',
     'unreasonable',
-    'unrelated',
-    'unreliable',
-    'unrest',
-    'unsatisfactory',
-    'unseen',
-    'unskilled',
-    'unstable',
-    'unsuccessful',
-    'unsuitable',
-    'unsure',
-    'untouched',
-    'unused',
-    'unusually',
-    'unveiled',
-    'unwanted',
     'unwelcome',
-    'unwilling',
-    'up-to-date',
-    'up_to_date',
-    'up_until',
-    'upbringing',
-    'updated',
-    'upgrade',
-    'upheld',
-    'upside_down',
-    'upstream',
-    'upward',
-    'uranium',
-    'urgency',
-    'urgently',
-    'urgh',
     'urging',
-    'urine',
-    'usefully',
-    'usefulness',
-    'usl',
-    'utilities',
-    'utility',
-    'utmost',
-    'utter',
-    'utterance',
-    'utterances',
-    'uttered',
-    'ux',
-    'vacancies',
-    'vacant',
-    'vacuum',
     'vaguely',
-    'val',
-    'vale',
-    'valerie',
-    'validation',
-    'valleys',
-    'valuation',
-    'valve',
-    'vanished',
-    'vapour',
-    'variance',
-    'variant',
-    'variants',
-    'vase',
-    'vastly',
-    'vatican',
     'vaughan',
-    'vauxhall',
-    'vector',
-    'vegetable',
-    'vegetarian',
-    'vegetation',
-    'veil',
-    'vein',
-    'veins',
-    'velocity',
-    'velvet',
-    'vendors',
-    'venezuela',
-    'venice',
-    'ventilation',
-    'ventured',
     'ventures',
-    'venues',
-    'venus',
-    'verb',
-    'verbs',
-    'verge',
-    'versatile',
-    'verses',
-    'versus',
-    'vested',
-    'vet',
-    'veteran',
-    'veterans',
-    'veterinary',
-    'veto',
-    'viability',
     'viable',
-    'vibration',
-    'vic',
-    'vicar',
-    'vice-president',
-    'vice_versa',
-    'vicinity',
-    'vicious',
-    'victor',
-    'victories',
-    'video-tape',
-    'videos',
-    'vietnamese',
-    'viewer',
-    'viewers',
-    'viewpoint',
     'vigorous',
-    'vigorously',
-    'vigour',
-    'vii',
-    'viii',
-    'viking',
-    'villagers',
-    'vincent',
-    'vines',
-    'vintage',
-    'violation',
-    'violently',
-    'violet',
-    'violin',
-    'virtual',
-    'virtues',
     'viruses',
-    'visibility',
-    'visions',
-    'visually',
-    'vitality',
-    'vitamin',
-    'vitamins',
-    'vitor',
-    'vivid',
-    'vividly',
-    'vocal',
-    'vocational',
-    'voiced',
-    'void',
-    'vol',
-    'vol.',
     'volatile',
-    'volcanic',
-    'voltage',
-    'voluntarily',
-    'volunteer',
-    'volunteered',
-    'volvo',
-    'von',
-    'vouchers',
-    'vowed',
-    'voyage',
-    'vs',
-    'vulnerability',
-    'w.l.r.',
-    'wa',
-    'wacc',
     'wade',
-    'wagner',
-    'wagon',
-    'waiter',
-    'waking',
-    'walkers',
-    'wallace',
-    'wallet',
-    'wallpaper',
-    'walsh',
-    'walton',
-    'wander',
-    'wandered',
-    'wandering',
-    'warden',
-    'wardrobe',
     'wards',
-    'warehouse',
-    'warfare',
-    'warmed',
-    'warmer',
-    'warming',
-    'warmly',
-    'warn',
-    'warner',
-    'warnings',
-    'warns',
-    'warrant',
-    'warrants',
-    'warranty',
-    'warren',
-    'warrington',
     'warrior',
-    'warriors',
-    'warsaw',
-    'wartime',
-    'warwick',
-    'wary',
-    'wastes',
-    'wasting',
-    'watches',
-    'watercolour',
-    'waterloo',
-    'watt',
-    'watts',
-    'waving',
-    'wax',
-    'wayne',
     'wea',
-    'weakened',
-    'weakening',
-    'weaker',
-    'weakly',
-    'weaknesses',
-    'wearily',
-    'wears',
-    'weary',
-    'weaving',
-    'web',
-    'webb',
-    'weber',
-    'wed',
-    'wedge',
-    'weed',
     'weeds',
-    'weekends',
-    'weeping',
-    'weigh',
-    'weighed',
-    'weighing',
-    'weighted',
-    'weights',
-    'weir',
-    'weird',
-    'welcoming',
-    'well-being',
-    'wellington',
-    'wembley',
-    'wendy',
-    'wept',
     'wesley',
-    'wexford',
-    'wh',
-    'whale',
-    'whales',
-    'whatsoever',
-    'wheat',
-    'wheelchair',
-    'wheeled',
-    'wheeler',
-    'whereabouts',
-    'whichever',
-    'whip',
-    'whipped',
-    'whisper',
-    'whispering',
     'whistle',
-    'whitehall',
-    'whites',
-    'wholesale',
-    'wicked',
-    'wicket',
-    'wickets',
-    'wide-ranging',
-    'widened',
-    'widening',
-    'widows',
-    'width',
-    'wigan',
-    'wilderness',
-    'wildly',
-    'wilkinson',
     'williamson',
-    'willingly',
-    'willis',
-    'wills',
-    'wiltshire',
-    'winchester',
-    'winding',
-    'windscreen',
-    'windsor',
-    'windy',
-    'wines',
-    'winger',
-    'winston',
-    'winters',
-    'wipe',
-    'wiping',
     'wireless',
-    'wires',
-    'wirral',
-    'wit',
-    'witch',
-    'with_a_view_to',
-    'withdrew',
-    'withstand',
-    'witnessed',
-    'witty',
-    'woken',
-    'wolf',
-    'wolves',
-    'wonderfully',
-    'wonders',
-    'woodland',
     'woollen',
-    'worcester',
-    'worcestershire',
-    'wording',
-    'wordsworth',
-    'workings',
-    'workload',
-    'workmen',
-    'workplace',
-    'workstation',
-    'workstations',
-    'world-wide',
-    'worlds',
-    'worm',
-    'worms',
-    'would-be',
     'wounds',
-    'woven',
-    'wow',
-    'wrap',
-    'wreck',
-    'wrecked',
-    'wretched',
-    'wrist',
-    'wrists',
-    'writ',
-    'writings',
-    'wrongly',
-    'wry',
-    'wwf',
-    'wycliffe',
-    'x-ray',
     'y\'know',
-    'yacht',
-    'yanto',
-    'yarn',
-    'yearly',
-    'yelled',
-    'yen',
-    'yielded',
-    'yields',
-    'youngster',
-    'yourselves',
-    'youthful',
-    'youths',
-    'yuan',
-    'yugoslav',
-    'z',
     'zambia',
-    'zen',
-    'zimbabwe',
-    'zinc',
-    'zones',
-    'zoo',
+)
+
+blocks_02 = (
+    ' $&agr!#bgr!&frac12!+pound;1,000(!0)$,000)%0,000(!5)!0\'!2($,000(!0)$,000)!0(!5',
+    '\'!3(!0)!0\'"40)!0\'!5($,000(!0)$,000)!0 $\'ave!#cos!!e "-1 !/',
+    '!!1!!2 "1%!$,500!".1"!2"!5!$0.30""0%#$,000#!0""th!"10""th!"20',
+    '""th!"30""th!"40""th!"5%""th!"60""th!#7th!"80""70""80$!s""90',
+    '!#900#!2#!5#!6#!7#!8#!9""10#!1#!2#!3#!4#!5#!6#!7',
+    '#!9""20$!s#!1#!2#!3#!4#!5#!6#!7#!8#!9""30#!1#!2',
+    '#!4#!5#!6#!7#!8"#40s#!1#!2#!3#!4#!6#!9""51#!2#!3',
+    '#!5#!6#!8"#90s#!5#!6#!7 #2.0"!1"!2"!3"!5!"0%"$,000"%0,000',
+    '!#1st!"5%"!0""th!#6th!"nd %3,000!".1"!2"!3"!5!"0%"$,000""00!"50',
+    ' %4,000!".1"!2"!3"!5!"0%"$,000!!6!!7!!9!"th "5%!$,000!".1"!2',
+    '"$,000!!1!!2!!3!!4!!6!!7!!8!!9!"th %6,000!"0%"!0!!1!!2',
+    '!!4!!6!!7!!8!!9!"th #70%"!0!!1!!2!!3!!4!!6!!7!!8',
+    '!"th #80%"!0!!1!!2!!3!!4!!5!!6!!7!!8!!9!"th #90%!!1',
+    '!!4!!5"!%!!9!"th $a.c.""m.!*_good_deal#)reat_many!!a!)bandoning\'$ment"#bot"\'dominal"&ingdon',
+    '(%ities"$oard#$lish\'"ed%$tion"%raham##upt"$sorb&#ing%%ption#(traction##urd"!u#&ndance\'!t',
+    '%!s!!c"\'ademics"(celerate*!d)#ion$#nts$#pts$%ssion&%ories#\'idental*"ly#)ommodated%(paniment(!y',
+    '&&lished$"rd&"ed$\'untable(#ncy)!t#(umulated)#ion$&sation*!s%#ing%%tomed"$hing"#ids"-knowledgement',
+    '*#ing"&oustic"*quaintance$%iring%\'sitions""re"\'tivated\'#ing("on%$ists#$ress!%d_hoc"#ams#"pt%%ation',
+    '\'"ve$(tionally(!s#\'ressing"(equately"&jacent(#_to#&ective)!s#&oining$%urned##ust&"ed&#ing&%ments',
+    '*"ed(%rator-!s$%rable&!l&$tion%!e&!d$&ssions$&ttedly&#ing")olescence)!t#%pting"$rian',
+    '")vancement&#ing##ent&%urers)!s(#ous$%rsely%!t&#ise)!d)$ment-!s#&isable%#ing#%ocate',
+    '(!s!"ea"$rial#&oplane$%space!\'ffinity#%orded")ghanistan"&ricans"\'termath%%noons!!g"\'itation"#nes"#ony',
+    '%!s!$hmed!$ided"$ming"&rborne#%field#$line\'!s#$ways"#sle!#kin!$lain#$rmed%#ing#!s',
+    '##ums"\'coholic"!e#!c#$rted#&xandra$"ei"#gae#$eria#&orithm"*l_the_same#"an#&egedly%%iance$!y',
+    '#%ocate\'$ions#!y"#oud"#pha##ine#!s"#tar#\'eration*!s%#ing%$nate#&husser#%itude#"on',
+    '!%manda##zed%$ment"(bassador#"er#&iguity&#ous$%tions"%ended%%ments$%ities#%ricas""id$"st#"no',
+    '"(munition"%nesty"&ounted"!p#"le"\'sterdam"$used%$ment$#ing"!y!"n\'"!a#!l$%ogous&"ue',
+    '$%ysing&!t\'!s%%tical#$tomy"!c#&estors##hor"*d_so_forth#$rews"$gela%"es%!s#$lers$"ia',
+    '$\'o-saxon#$rily#$uish$#lar$!s"&imated"#kle%!s"#nie#%ounce\'#ing$%yance%"ed%#ing#%ually',
+    '"!t#&arctic#,hropologists+!y#(ibiotics%%odies\'!y$&cipate)#ion$#que\'!s#$onio#!s"\'xieties$%ously',
+    '##how#)thing_but!)partments"\'ologies\'"se&!y"&palled&#ing$%ratus#&ealing%&rances$%llant$$tite#%lause$"es',
+    '#$oint#&raisal$(ehension%%ntice*$ship$)opriately*#ion%"ve%&ximate"#ron"!t!\'quarium#&itaine!%rabia%!c',
+    '$!s"\'bitrary\'$tion"!c#!h$*aeological*!y$"ed%!r%!s$&itects%"ve\'!s##tic"#ena',
+    '#%uably"$isen$\'tocracy)#tic#\'thmetic"&mchair##ies##our&"ed#&strong"$nold"%oused"\'ranging$!y#$ears',
+    '#$ives#&ogance\'!t$!w%!s""se"\'tefacts#&hritis#\'iculate*!d$%llery!)s_a_whole$&gainst#\'good_as#\'it_were',
+    '#\'regards"$cent$%rtain"%hamed#$down#"es##ley##ore##ton")pirations"+sassination$%ulted\'!s$!y#%emble',
+    '$"nt$"rt&"ed&#ion$\'ssments#\'ignment*!s$&stants&"ed&#ing#\'ociates#$umes$&rances%!e"$thma',
+    '%%ished(#ing($ment"$ylum!\'t&amp;t"%_best#%large$%ength#&random"\'helstan$"ns#%letes&"ic(!s"&kinson',
+    '""om$"ic$!s"$tach&$ment%#ker$"in&"ed&$ment#&endant#"ic#%orney((-general#\'racting(#ons',
+    '$(ibutable(!e)!s!\'uckland"\'diences$!o$$ting%"or"%guste"$ntie""ra"\'sterity$"in$$rian"\'thentic',
+    '\'&tarian)$tive\'#zed#*obiography$&nomous!\'viation"\'oidance%!s#!n!$wait%"ed%#ing"!e!"xe#!s',
+    ' $b.c.!!a""ch$$elor#$k-up$$drop$\'grounds$$ward#&terial"#dge"%ggage#$hdad""il$"ey#!t',
+    '$!d##ing"&lances&#ing#$cony#!d$#win#$loon%!t##tic"$nana&!s#$bury##ged$#ing',
+    '$&ladesh$"or##ker&!s$$rupt("cy##ner$#ing"%ptism&!t"$rber#&celona$$lays#$gain#!k',
+    '$#ing##ley#$nett#"on$#que#%racks%"ge$"ed%!l&!s%!n%"tt$%ister$"ow##ton',
+    '#%eball$$line$$ment#"il#$kets##que#%tards"!t#"ch#"es#$hing$!s#!s$#man#&talion',
+    '&#ies$#ing$#les%#ing$!y"$xter!!c!&eaches#"ds#!m$!s#!n#"rd#"st%!s',
+    '""ck"%dding#$ford#$side"!e#"ch#"rs#!s#&thoven"(forehand"!g##ged$#ing#\'innings"%haved',
+    '&%oural)!s"%ijing##rut"%lgian#$inda#"la$!s$!y#$oved#"ts"%nches#$ding#%edict$)ficiaries',
+    '&#ted##ign#!n$#ett$!y##son"&rkeley$%shire#$nice#"ry#!t""ta#!h#%rayal&"ed',
+    '"$ware#\'ildered!%iased"&blical"%cycle"%dding#!s"#kes"\'lateral"!n##ary#!d#\'oculars"\'ography#$logy',
+    '"$rths"%scuit\'!s"#tch##ing#%terly&$ness"%zarre!(lackburn%$mail%$pool#$dder$!e%!s#!h',
+    '#"ke#$ming#$nche$!d$#ket\'!s#$sted#"ze$#ing"#eak#"nd#"ss%"ed%#ing"%inked',
+    '$$king#"nd%!e#"om##use#$wing$!s"#unt#$rred!"mw!\'oarding#"st%!s"#bby"$dily',
+    '$"ed%!r$#ing""lt$"on$!s"$mber&!s$#ing""nn"&okings$#let$$shop#$sted#"th',
+    '#"is#"ne#%oughs#&rowers"$snia&!n##ses##ton#$well"$unce&!d%#ing$"ds#&rgeois)"ie',
+    '"#wed##ler$#ing$!s#!s"#xer"%ycott#&friend!!p!\'rackets#$dley$!y##ins#"ke%!s',
+    '%!s%!y$#son#&zilian"&eaches$#dth$(kthrough$!m$#the\'!d&$less#!d##eds##nda#$wers',
+    '$#ing"$icks#"de$#ges&!t#%efing#%ghter&"ly#(lliantly#"nk#"sk%"ly#$tons$#tle"(oadcasts',
+    '##ker&!s#"ok%!e#!w$$ning"%uised#"no#$shed&!s%#ing##tal"#yan!!t!%ubble',
+    '""ck$"et$&ingham*%shire"!d#&getary"$ffer%!t"$gger"&ild-up%"er\'!s%!s$$t-in""lb',
+    '#%garia##let&"in&!s"!m#!p"$ndle#%galow"*reaucratic*!s#%glary##ial#"ke#"ma#$rows',
+    '%!s##ton#"un#!y"$shes#(inessman)"en#!t"%tcher#!t$\'erflies(!y$#ons""ys""zz',
+    '"*_and_large##far"$pass"#rne"\'zantine $c.a.!$abin##les"$esar"(f&eacute#!e""ge"#iro"#kes"\'lculate',
+    ')"on#%endar#!f##mly#%ories##ves"!m#%bodia#"el$#ras%"on#(paigners(#ing$#ing$!s',
+    '"$nals##cel&&lation%"rs##dle&!s#!e##non#"on$"py#!s#$teen##vas"*pabilities)!y',
+    '#!e#%itals#!s""ra$#van#&bonate#&dboard$#iac%#nal#%eless$!r$!s$%taker#"go#&ibbean',
+    '$!a$$isle$!o%!s#"ol%"yn#!p$%enter%"ts#!r$%iages%#ers$#ots##son#!t',
+    '#$ving"$spar#%sette#$ting$#les#%ually&$ties\'!y"(talogues#$ches#"er#&holics$!y"$usal#%tious',
+    '"%valry#"es##ity!!d""na!$ease%$fire"#cil")lebrating)#ons#"ia##lar$$ular"$ment$$tery',
+    '$"us#&tenary%!r$%rally"$real&!s$$bral$&monial("es#)tificates!!f!!h"!."%aired%#men',
+    '#(mberlain#$otic#%plain$#man$!s#*racterised*#zed$$coal$$ging$&itable&#ies$$lton$%tered%!s##sed',
+    '#%tting"&eapest%"ly$!t#"er%"ed%#ful("ly%!s#!f#\'lmsford#$mist\'!s#$ques##rry',
+    '$!s$#ter%#nut#$wing"%icago$$kens#$efly%!s#%ldish$!e$!l#$mney"#oir##ked#(lesterol',
+    '#!p$#ped#"rd%!s$"us"\'ristina(!e#\'omosome$%nicle"#uck%#led#\'rchyard!!i"!a"!d',
+    '"#gar"&rcuits%%lated(#ing%\'mstance%!s"!s"&tation#"es#(izenship"#vic$%lians&&sation\'"ed&&zation',
+    '"$aire#!n#"ra$)ification&!y%"ty#$shes$#ped$$sics%%rooms#$udia#"ws"%eaned&!r\'!s',
+    '%"er#%nched#%rical$"ks"#ick#%fford%!s#%matic%!x$$bers%!s#"ng%#ing$#ics#!p',
+    '#"ve"#oak##cks##ses&!t$$ures##ugh""ue$!s##msy#"ng#$ster\'!s##tch&"ed',
+    '"#yde!#naa""ut!)o-operate)#ive$\'rdinate+!d*#ing+"on*"or"!."%aches%#ing##rse#&stline',
+    '"%caine#!k$#pit$$tail#"oa"$ding"#hen$%rence\'!t$$sion""il#%ncide(!d(#nce""ke',
+    '#\'chester##dly#!e$#man$%ridge#$itis#*laborative$(ectively\'"or)!s$#ins%$sion#$ogne$$mbia$!n',
+    '&"es%!y$%urful&#ing#%umbia""mb$(inations&"es&#ing#%eback#(fortably\'#ing#&manded("rs\'#ing',
+    '$$ence(!d&$tary($tors\'#ing%\'rcially$)issioners*!s%%tting$\'odities(!y%&nplace$$unal&&icated*#ing',
+    '\'"on\'"sm#\'panions%#res&#ing&%tment%"ss\'#ion%(tibility("le$%elled\'#ing%%nsate%\'titions)&veness',
+    '$$iled$\'laining%%ement*#ary&$ting&#xes\'%ities%(ications&$ment$$oser(!s&#ite&!t%%unded(!s',
+    '&$ssed(#ion%#ise(!d(!s\'#ing$&ulsion%\'terised#%rades"!n#$ceal\'"ed%"de\'!d%#ive',
+    '%&ptions\'#ual%#rto\'!s%%ssion*!s$%ludes\'#ing&$sive#$demn\'%ation$\'itional)"ed)#ing$&ucting',
+    '#!e#*federation%$rred%"ss\'"ed\'#ion$(idential,#ity)"ly%(guration%\'rmation\'#ing\'!s$\'licting$#orm',
+    '$$ront(%ation("ed$#use&#ing#\'gestion$(ratulate+$ions%\'egation&\'ssional#$nect\'#ing#%quest##rad#(sciously',
+    '%%quent%\'rvatism$\'istency$\'olation&&idated*#ion%%rtium$\'picuous&$racy$*tituencies*!t+!s(#ted*!s%&rained',
+    '&&ucting*"ve\'"ed$\'ultancy(%tions*"ve\'#ing%"me\'!d&#ing#&tacted%$iner)!s%\'minated*#ion',
+    '+!d*#ing\'\'oraries%%ntion)"us%$sted%%xtual$\'ingency)!t&#ual($tion\'%ously\'"um$&racted(#ing',
+    '("or*!s(#ual&\'diction-!s*#ory&$sted(#ing(!s%&ibutes)#ing%%oller#(venience)#tly&!t',
+    '&\'sations\'#ely&%tible("ng%!y&"ed$\'ictions$"oy"$oker&!y#$ling#(perative#\'rdinate)#ion"!p',
+    '$"ng#$ying$%right"!r#"al#!d#!k#&nelius$#ish#%onary&$tion%"er#%poral\'%tions$"se',
+    '#&rected\'#ion%%lated%%spond*!s$%idors$#upt"#sta$#ing$"ly$#ume\'!s#!y"!t#%tages',
+    '#"gh#!n$&sellor$%tered\'$part+!s&"ss%$less##pon#\'rtaulds%#esy%$yard#$sins"&venant(!s',
+    '"!x!&racked%#ing%!s##fts&#men#$mmed$#ped#"ne$$ston#!p#%shing#%wford$!l%"ed',
+    '"(eativity%"or#(dibility&"le%#ted&"or&!s#"ed$!p%#ing##ole#"pt#%scent$!t#"ws',
+    '#&minals##ses$!p##tic&$ally&#ise("ms\'#zed%#que"%oatia\'!n#"hn#%mwell#$sses%%roads',
+    '#$wned#$ydon"%uelty##ise%#ing#&mbling$$pled#$sade$!h%"ed%#ing$!t#!z"&ystals!!s',
+    '$!n#"ic"!e"%isine""lt$&ivated(#ion"%mbria#\'ulative"%nning\'#ham"\'pboards"%rator#!b#"ed',
+    '%$usly#!l$"ed$!s$!y#\'rencies&"ts$!y#"se%!d##tis#&vature$"ed%!s"%shion',
+    '#&tomary"&ttings!%ycles$#ing%#sts"&linder"%nical"$prus!$zech%)oslovakia $daft"#iry#"sy""le"!m',
+    '##ian##ned"!n#!a##ced%!r&!s%!s#(gerously##ish#"ny"#red##ing#%kened%!r',
+    '##win""sh$"ed"\'tabases"&unting"&vidson"$wson"(y-to-day#%light#$time"&zzling!\'eadline%!y#%lings"%bated',
+    '#$orah##ris##tor"#cay#%eased$%ption#&idedly&!s$#mal#$lare&#ing$%ining#\'oration*!s("ve',
+    '\'#ing%!e"(dication"!e#!d$!s#$pest#!r"%fault#$eats$"ct&#ive&!s$$nces%#ded',
+    '$$rred#\'iciency$#nes%#ing&$tive")gradation"!l#$aney$"ys#%egate(!d$"te&!d#"hi#&icious',
+    '$&veries("ng##ors#"ta"&mentia##ise#%ocrat$\'graphic$&lished&$tion$(nstrates*#ing*#ors"!n##ial',
+    '$!s#&ounced#"se##tal$#ist#$ying"$part&"ed&&mental#\'endency&#ing#%icted#%loyed&$ment#&osited',
+    '$!t#)reciation%%ssing$\'ivation&"ed##ths"!r#\'byshire#)egulation$$lict##ive&!s#"ry"%scend\'$ants',
+    '\'#ing&!t$\'riptive#%erved\'!s#&igners&#ing$#res#$mond#(peration$$ised#(tination&"ed&!y$&roying',
+    '"!t#%ached&$ment$$ined#&ection\'#ves&"or$%ntion$!r%\'iorated*#ion%%mines%$rent")valuation$&stated',
+    '#&eloper)!s\'&mental\'!s#&iation$"se##lin#\'olution$"te%#ion"$xter!#hss!\'iabetes&"ic#&gnosed',
+    '$$onal$$rams#!l$#ect#$mond\'!s#"ne#$ries$%rhoea"%ckens#$tate\'!d&&orship""es#$tary',
+    '"&ffered\'%ntial+"te-!d,#ion&#ing&!s"!g##est&#ion#$ging#&nified"%lemma"!m#%inish',
+    '(#ing")ning-room#&osaurs"%ocese"!p#$loma\'"cy\'"ts##ped""re$%cting\'#ves#!t"*sabilities$(dvantage',
+    ',!s$$gree($ment$)ppearance)#ing&\'ointing&%roval$\'rmament$%sters&$rous#&belief#&carded$&harged$%iples\'%inary',
+    '*!s$$lose(!d\'#ure$!o%%mfort%%ntent%%unted(!s&$rage*!d\'#ses%&veries)"ng$$reet',
+    '\'&ionary%\'iminate$!s$%usses#%grace$$uise(!d%"st\'#ing#"ks#$like\'!d##mal%!y$#iss',
+    '#&orders#&persed$%laced&$ying$&osable&!e\'!d&%ition$$uted#&regard$%upted\'#ion#,satisfaction)#ied$#ent',
+    '&"ve(!d##tal%$nces$(inctions("ly&(guishing$%orted\'#ion$&racted%%essed%%ibute)"or+!s$#urb',
+    '+!s"#tch""ve$!d$%rsion%!t&"ed#&idends%#ing$"ng$&sional#%orced"#xon"!y!"oc',
+    '#(umentary("ed"!e""le#!l$!s$!y#$phin\'!s"%mains#!e#&inance&"te\'#ion"\'naldson',
+    '%#ion(!s#&caster##key#"na#"or%!s"!o##med#%rstep"$reen##set"!s#"es""ts',
+    '"%ubles%#ing$#ted%$less#!g"#ver"&wnhill$#ing$!s%%tream$$ward(!s"#yle"$zens!&rafted',
+    '#%gging$"on#"in%#age%"ed%!s##ped#$stic\'$ally#$ught##wer&!s$(ing-room"#ead$#med',
+    '#$sses"%ifted%#ing#"ll%#ing#%pping"%ought#$wned%#ing""um$!s#$nken"$ying!"ti!#ual',
+    '#$ious"%chess$!y#"ks"$dley"!g""ly""mb#"my#!p$"ed$#ing"$ndee#!n"&odenal',
+    '##tin$!y!$warf"&elling(!s!"ye"&namics$#sty #e.r!&agerly##les"%rnest$#ing#\'thquake"#sed',
+    '$"ng!(ccentric#+lesiastical"$hoed%!s"(ological&!y#\'nomical*"ly\'"st)!s"%stasy!#den"#gar#"ed',
+    '$"ed$!h$#ing%#ons$%orial&!s"$mund"%ouard"\'wardian#"in!!e!\'ffected#%icacy%&iently!"go',
+    '!1ighteenth-century%#ies"$leen!%laine#$stic"#bow%!s"$ders$"st"%eanor#"ct%%orate%#ron(!s#%gance',
+    '#%phant(!s#%vated&#ion$$enth"\'iminate)!d(#ion##nor"#len#"ie$#ott$!s"%usive"#vis',
+    '"&ailinc#)ncipation"&barked%\'rassing#%edded#%odied#$race\'!d$"yo&!s"%erges"%inent#%ssion")otionally"\'phasise',
+    '\'"ze)!d#&loying&!s#$tied!!n"&_route"%acted"%close&#ure#\'ounters%%rages"(dangered#&eavour##ill',
+    '\'!d\'$ment$&scopic$%wment##ure%#ing"\'ergetic%#ies"%force\'!d")gagements%#ing##els#\'lishman"\'joyable',
+    '%!s"&larged#(ightened)$ment"(ormously"&quired"&semble#$uing$#red&!s"%tails##ers%$tain)"ed)#ing',
+    '*!s#%ities%&lement#%rants$)epreneurs$%usted"\'velopes#.ironmentalists-"ly$$sage#!y"$zyme&!s!#pic#%demic',
+    '#\'thelial!%quals$%tions#&itable!$rect%"ed"#ika"$nest"$oded##tic"%upted%#ion!\'scaping##ort&"ed',
+    '""t.#+ablishments##her#$uary!!t"$_al."&cetera"%ernal%#ity"%hical%!s$$opia#"os!#uro$%peans',
+    '#&cuated\'#ion#%luate(!d\'#ing"$elyn##nly$$tual#$r_so$#ton"*olutionary$"ve!!x"&_parte")aggerated',
+    '$$ines$!s"(cavation##eed&"ed&#ing&!s$&llence$)ptionally$$sses#&hanged(!s$%equer##ise#&laimed',
+    '#\'ursions$#ses")emplified%!t&#ion#\'rcising$!t##ter"%haust\'#ion#$ibit\'"ed\'!s"#ile"$otic',
+    '$&dition$$lled$(riencing#(lanatory$$oded%$ited\'#ing%$ring%%sions\'"ve)!s#%orted&#ing$"se%#ing',
+    '\'#ive\'"ly"\'quisite"%tends%%sions\'$vely$$rior#$inct\'#ion#&racted\'#ion\'!s%*ordinarily%&vagant$$emes',
+    '\'!s#!d -fa&ccedil;ade"#bia#$rics#%ulous"$cial$&litate#$tion\'!s$#ual""de##ing"$ecal"&ilures',
+    '#%rness$!y#%thful("ly""ke"\'lklands##lon")miliarity$"ne"%ncied#&tasies&#tic"*r-reaching#!e$!s',
+    '#&mhouse#$ther"(scinated(#ion%"sm&!t#(hionable#%tened%"st"%tigue#"ty"$ults%!y"(vourably&$ites',
+    '""ye!&earful#(sibility&"le$!t#$ther\'!s$%uring"$d_up"$eble#"ds"&licity$"pe$!x#$lows',
+    '"&minine&"sm\'"ts"!n##ces$#ing##der#$ella"$rgie$"us&"on#%nando#$rari#$tile"\'stivals',
+    '"$udal"#ver!%ibres"\'ctional"&elding#%rcely$!y"\'fteenth$#ies"%ghter\'!s%!s#$ured"#led##ing',
+    '##med$#ing#$ters$"hy$&ration"$nals$$nced\'!s&%ially\'"ng#"ed$"ly$!r$!s#%ishes',
+    '#$land#!n"#ona"%remen$%place##ing#(st-class"$sher&#ies&#men#!t$!s"&ttings#%zalan"\'ve-year',
+    '"$xing#$ture\'!s!$lags#"me#"nk%"ed#!p##red#$shed%#ing#&ttened""ee#$ming#%tcher',
+    '&!r\'"ed#"nt"#oat%"ed#"ck#$oded%#ing%!s##ppy##ral$$ence$#ida#"ur%#ish',
+    '##wed%$ring$#ing$!n"!u#)ctuations#"ng#"sh%"ed#!x!#oam"#cal#$uses%#ing"!g',
+    '""ld$#ing$!s#$iage#"ks#&low-up&#_up&#ers$!y"%olish#$ting$$path$%steps")r_certain$$good',
+    '$$sure$-the_most_part(*time_being#&bidden#!e$\'casting(!s$%front$&igners$#man%#ost$$nsic$\'seeable%#try#"ge',
+    '%%tting$$iven(#ess#!k#&mality%%tions&!s$&idable$$ulae\'"te)!d(#ion#$ster#!t$#ies',
+    '$$unes$&y-five"$ssil&!s""ul#%nding$$tain#"rs$&teenth!!r"\'actions#$gile$$ment("ed#"il',
+    '%!s#!n$#ces%$hise%$isco%!o%!s$%kfurt%"ie%#lin&!y$#tic\'$ally##ser"%eddie',
+    '#"ed$#man$"ze&!r%#ing#$ight#&nchman#(quencies#$shly"&iction##dge#"ed##ght&"en(#ing',
+    '""og$!s#(m_now_on#%ntier(!s#"st#"wn%#ing#"ze"&uitful%!s#\'strated(#ing"!y!!t',
+    '!&uelled$!s"\'lfilled\'#ing&$ment##ler"#mes")nctioning#*damentally"!r#&iously#&nished\'$ings#!y""ss',
+    '""la$"xy#!e#!l$#ons"$mble%#ing"$ndhi#"gs""ps"&rdener(!s&#ing##eth##lic',
+    '\'!s#%rison$!y"#ses##ped#$trin%+ointestinal"\'teshead$#way#!t"#uge##lle"#vin"#zed##ing',
+    '!"dp!%eared"#dge"!l""n.#%erals&#tes\'#ing\'"or%"ic%%osity&$usly$#sis$"va##ius',
+    '##try"(ological&!y#&metric\'!y#$rgia\'!n"$rald$"rd#"ry"&stured\'!s!&hastly"$osts!%iants',
+    '"$fted"!g"%lbert#"es#!l$#ian"!n#!a##ger!(lamorous%"ur#$nces%#ing#"re%!d',
+    '"&eaming#!n"$ider#$mpse\'!d#\'ttering"#obe#"om%!y##ria%#ous##ssy##ves#!w$#ing',
+    '#!e!"mt!"np!)oalkeeper#!t$!s"$blin"%ddess"#och#&dnight$$will#"se"&rgeous"$spel##sip',
+    '&"ed&&mental""wn!!p"!s!#rab#%ceful$$ious##ded%!s$$ient$#ual&"te(!d(!s',
+    '##ins#(mmatical#!n$)dchildren%"ma%\'parents%#son$"ge$#ite$"ny$$ting##pes$!h%"ic\'"al',
+    '##ted$%itude##ves$)itational#$zing"#eed%!y$"ks$%nbelt%!e%%house%%peace%!s$!t%#ing',
+    '$#ory""id#\'evances#&ffiths#"ll#!m$"ly#%nding$$ning#$pped%#ing$!s"%oaned#"om$"ve',
+    '%#ing(!s#"ve#$wled!)uarantees$#ded%$ians"\'errilla)!s"$ides$#ing$!o#!l$!d##nea',
+    '&!s"!t#!s $h.l.!&abitat\'!s"#gue"$iled#"rs"\'lf-time%#way$$_way$#way#$ifax#"ls',
+    '##ted##ved"$mlet##mer$#ond"%ndbag%#ook$#ing$(kerchief$#les$\'writing$!y##ged$!s##nah',
+    '"%ppier"(rassment#%dened%"st$$ship$!y#!e#!i##low#$mful$$less#$ness##per#%rison$%ogate',
+    '$&lepool#$vard$#est"$ssan#"te$#ily%#ngs"#tch##red#!s""ul$"ed#$nted"#ven"%wkins',
+    '"$zard&#ous&!s#"el!\'eadache$"er$$ings$$line(!s#!l#!p#%rings$!s##ted%!r',
+    '%#row#$vens$#ier$\'yweight"$brew"&ctares$"ic$"or"#dge%!s""el"(ightened&!s#!r"(licopter',
+    '##met#%pless("ly"(misphere"!n#&derson##ley#!s"\'patitis"$rald#$bert$!s#!d#\'editary$$ford',
+    '$"ic%!n#!r#*tfordshire"\'seltine#%itate\'#ion"-wlett-packard!!i"!d#$eous"*erarchical"%ggins#%hland(!s',
+    '$#way\'!s"$lary#"da#%lside##ton"\'ndsight$!u##ted$!s"!p#!s"$ring"$ssed#)torically',
+    '"%tting!!m"!m!!o"#bby"$ckey"$llow$!y##mes"$mage#%eland%#ess$$work#(ogeneous$&sexual',
+    '"%nesty$%ymoon#%orary$&urable&"ed""od##ked$!s"!p#$eful$$less("ly#$kins"&rizons#$mone',
+    '$!s#%rific\'"ed$#ors")spitality#$tage\'!s$"el$!s"$used%&keeper%$wife&#ork"&vering""we',
+    '!!q!%ubert"$dson"$gged#!o"!h"*manitarian\'#ies##ble#(iliation#%orous"\'ngarian$"er##ted%"rs',
+    '$"le##led#&ricane%$edly#$ting$!s"&sbands#$sein!%ybrid""de"%giene"(potheses\'%tical"(sterical $iain',
+    '"#ing"!l""on"!y!!d"$eals#)ntifiable("er)!s"#iot""le!(gnorance\'!t%"es!!l',
+    '#&nesses#(uminated$$sion%&trates)$ions!&magery$%inary\'$tive&!g&#ing"\'balance"!f"\'itation"(maculate$$ture',
+    '#\'igrants\'$tion$$nent##une%#ity"&paired$&tience(!t)"ly#&ending$&rative%&ialism%%sonal$#tus#)lementing',
+    '&"it("ly$$ying#%osing&$tion#$ress\'$ions$&isoned$$oves#$ulse!\'n-house#\'service"1_association_with#\'between#&common',
+    '&,parison_with%*ntact_with#)excess_of#$full#,keeping_with#\'need_of#(place_of$&rivate$%ublic#*return_for#)search_of$(o_far_as$)upport_of#$vain"\'ability',
+    '"\'capable#\'entives#)identally#(lination$%usion\'"ve#%oming%\'patible&$lete$(nsistent%(venience$\'rporate+!s*#ing+"on',
+    '#\'redibly#&umbent"*definitely$%mnity$$xing#(ications("ve\'"or)!s$"es$(fference*!t$&genous%&nation$&rectly',
+    '$(vidually#&onesia$"or&!s##uce%$tion$#lge")effective%&icient#)qualities)!y#*xperienced"%fancy%#try&!s',
+    '("us$%rence%#ior#%inite("ly\'#ive$%rmary#)lammation)#ory$%icted$\'uencing#(ormative&#ing#+rastructure#%usion',
+    '#\'redient"\'habited#\'erently#$ibit\'"ed\'#ion"&itiate\'#ion"&jected&#ion#\'unction$%stice"!k"%mates"$nate',
+    '#$ings#&ocence$\'vations("ve"$puts"%quest$%iries"$sect$"rt&"ed$!t#$ider$$ghts%(nificant$&stence',
+    '&!s#\'olvency#!p$#ect\'"ed\'%orate)!s$#ire#(tability%"ll\'&ations\'#ing$$inct(#ive+"ly',
+    '%%tutes$&ructor&&mental#\'ulation%"in%!t&#ing$#red&"rs"!t##ake#&egrate(#ing$%llect)$uals',
+    '&!s%$sely&%ified%#tly$$ract($ions)"ve%&course%(estingly%%faces&#ere%$iors%%nally\'(tionally%*pretations',
+    ')#ing%$rupt)#ion%$vene)!d(#ing(%tions&%iewer)#ing$&stinal#%imacy#(olerable$&nation#&ricate%$gued',
+    '%$nsic$&oduces($tory$%usion#&uition\'"ve"%vaded$#lid%%uable#&ention&#ory$$rted$)stigators\'"ng&"or',
+    '#$oice$#ked"$ward!"on#!s!&ranian"#ene""is"$onic&$ally$!y"(rational#&egular$(sistible%*pective_of',
+    '#&itated\'#ing("on!$saac"#lam#"es"$obel#$late"%suing!\'talians"!v!#van"#ory"!y \'jackets',
+    '#"ob#$ques"$guar"$iled""ke"!m#$aica#"ie"#net"!q"!r##gon"#son##per"!w',
+    '"!y!&ealous\'!y#(n-claude""ep""ff$#rey"#lly"%nkins#"na$$ifer"$remy##ked#"ry##sey',
+    '""ss$#ica""ts"!w##els!#ill!!o"$anna%!e"$ckey"&hnston"#ins$#tly%!s"$king',
+    '"!n"$shua"(urnalism\'!s%#eys!#uan"%bilee"(dgements$#ing$%ments#&iciary$"th#!y"!g"$lian',
+    '"$mble##per$#ing$!s"\'nctions##gle#!k"&stices"&venile "k.!#arl"\'therine$$leen#"ie"!y',
+    '""mp"#nny#\'sington#"ya""rr"$ttle"&yboard##nes&#ian!!g"!b!#han!&icking$!s"$dney',
+    '$!s#\'ometres"!n#$d_of$$ness#$ship""rk"$sses$#ing"&tchens#!e#!s!$lerk!$nelt"$ight',
+    '#!t$#ted##ves"&ocking#!t$!s!#ohl!#pmg!&urdish!$ylie "l.""j.!"ab#&elling#)oratories',
+    '#!s"$cked$!s"#ger"%mbert$!s#"ps"\'ndlords$$mark$&owners$&scapes#"es#!g#"ka")rge-scale',
+    '##vae"#ser#"mo#!s##tly$!s"$tely$"nt$#ral"$ughs#&nching$#dry""va$$tory#%ender',
+    '"$wful#!n##son""ys""zy!!b!"ea#%flets#!k$"ed#"nt#!p$#ing$"or$!t',
+    '\'!s%!s#!s$"es"&banese%"on"&cturer(!s"\'ft-hand%$wing"$gacy$#lly#&endary##ion$\'slature',
+    '",icestershire#"gh#"th"!n#$ders#$gthy#"in#!s$"es#!t"!o#!n$#ard$#ora"%sbian',
+    '##lie#!t"\'t_alone##hal#!s"\'ukaemia"&velled$!r#!y"%xical%"on!!i")abilities#$ison#!m',
+    '$&ralism\'!s%$ties#&rarian)!s#"ya%!n"&cences%#sed"!d""ed#\'utenant"&feboat$%style#"ts',
+    '%$ning%&weight"$king""li""mb$!s#!e$%stone#\'itation%#ing#!p"%ncoln\'%shire#$dsey#$e-up',
+    '#&gering$\'uistics##ing"#ons")quidation&#ity$"or"&stener(!s$#ing"&teracy&!l#&huania#\'igation#"re',
+    '##ter"\'vestock!&oading#!f"#bby%#ing"(calities\'!y%!s$"te#"ke$#ing$!s#\'omotive*!s',
+    '"$dged""ft"%gging#&ically#!o#!s""ne$&liness#*g-standing$"ed%"st$#ing"!o#!p#$sely',
+    '(!s#$etta#$ries"#ses"%thian#"us"!u##der$"ly""we$$ring"&yalist!!p!$ucas#!e',
+    '#&rative"\'dicrous"%ggage"\'nchtime#!g$!s""sh#!t"#ton"(xembourg#&urious!$ydia""nn"#ons"$rics',
+    '"!c#&donald#&gregor#&intosh#&millan"#dam%!e#$eira$%leine#$ness#$onna##rid"%gical$&strate#&nitude',
+    '""id$"en#&nframe$$land$!s$%tains"%jesty"#ker"&laysia#"ta"!m#!a#$mals"%nages#$date',
+    '$#ela$!y#%ifest(%ation-!s(!o$&pulate*!d)#ion#$kind#!n$#ers#&oeuvre#%power#$sell',
+    '$(laughter##tle#)ufactured$&script*!s"%pping"&rathon#!c$#hed%#ing$!o$"us#!e#\'ginally&!s',
+    '$"na$!o%!n$#tal%#ime#%jorie#%kedly%!r&!s%#ted#&riages$$ying#!s$!h%"al',
+    '##tha$#ial#$xism"\'sculine##ked$#lin$!s#"on#*sachusetts&"re%"ge#!t"!t#%ernal&#ity',
+    '#"hs#$ilda$"ng#!t$$ered$$ress""ud#$reen$#ice"#xim%#ise""ze!)callister"&donald"%laren',
+    '&!s##gre#\'ningful\'$less"\'chanics"#dal%!s$!u##ian%#ted$&cation%$ines$&tation"!g"%lanie',
+    '##lor##ody#!t$"ed$#ing"&mbrane#$oirs$%rable&$ndum"$nace#\'tioning\'!s#"us"&rcedes$%hants',
+    '$!y#%edith#"ge%!d%"rs##its#$rill$!y#\'seyside""sh#&senger"(tabolism$$llic%!s$$phor',
+    '#&hodist&(ological*!y#"re"%xican!!g!#ice##hel&"le##key#"ro%(computer%%phone%%scope&&ystems',
+    '"$dday$\'le-aged&#sex#%field("er#"st"$ghty##uel"#lan##dly#%itant%"ia"!n##ded#%erals',
+    '$%ature$$mise$\'sterial&$ries#\'orities#!s#!t$"on""ps"%racle\'!s$#nda#$rors"$sses$#ile',
+    '%%onary\'!s#!t$$aken$"er$$ress#-understanding$"se"&tchell#\'terrand"$xing!!l!!o"!b""ck',
+    '"&delled&#ing$&rately#)ification,!s%!y$&gliani#$ular"&hammed"#ira#"st%#ure""le$$cule#"la',
+    '")mentarily&"um"!n#$arch\'!y$%stery&"ic#&itored\'!s#!k$"ey&!s$!s#\'opolies#%sieur',
+    '#\'tgomery$$real#%ument(!s"\'onlight#!r$$land$!s"$rale%"ly$!n##ley#%nings#$occo#%rison',
+    '#"se##tal%!r$%gages$$imer$"on"$saic&!s#"es##lem%!y#!s"#tif$#ons$%vated',
+    '&!s#%oring&#sts%!s%#way"#uld%"ed#"nd$$ting#%rning#&stache##ths"$vies!%s-dos!%ucosa',
+    '"#ddy"%ffled"!g"(ltimedia%(national%%party&$lied\'!y%$tude"%mbled"%ndane#"go##ich%$ipal"&rderer',
+    '&!s$#och##iel##phy"&scular#&hrooms#%ician##lim&!s#$tard"$tant$$tion(!s#&tering#%ually',
+    '$$ical"#ths "n.!#ail#"ve"%mibia$"ng"!n#"cy#"ny"&poleon"&rrowed\'!r&"ly"$than',
+    '*"ts)"ty("ly(!s&$wide#$west"%ughty""ve#\'igation""zi$!s!"cr!&ear_to"!c#"ks',
+    '$#les\'!s"(gligible"$lson"$phew"\'rvously"#sts""ts#$ware$&orking"$ural#\'trality"%ville"#wco%#mer',
+    '#"er##man#\'sletter!!i"\'caragua##ely#"he$%olson#"ky##ola%!o"#ece"%geria"!l""na',
+    '%#ies#"th"%trate$$ogen"#zan!"me!,o_matter_how*$what"&bility"!d#$ding#!e$!s""el"$ises',
+    '"%minal&#ted\'#ion"!n#*e_the_less""on""ra#$dern#!m$$andy$!s#\'th-west%&ampton+%shire%)umberland',
+    '#&wegian"#ses#&talgia$$rils"&tation#%ebook#\'iceable&!s%#ing$$fied$"ng$#ons#&orious)"ly#,tinghamshire',
+    '"$ught#!n"!v#%elist%!l%"ty##ice!&ucleus"&isance"&mbered#&erical"!n#!s"!t#&rients',
+    ')"al#!s#"ty!$ylon "o\'"%brien"%neill!!.!#ath!(bedience#!y"-ject-oriented&"ed&%ivity"%scene',
+    '#&erving$$ssed&#ion#%tacle(!s$\'ruction!(ccupants&%tions%!y&#ing$&rrence"$eans"!t!$ddly"#our',
+    '")sophageal("us!\'ffended\'!r&#ing$%rings#$line##set$$hore$%pring!!i""ls!%ldham#!s"#ive',
+    '!\'mission!,n_account_of"#e\'s#$-day$#off$%third#$self"%going"#ion%!s"$line"#set!\'penness"$pose%#ing',
+    '("ve"!t#"ed#$ical$#mal%#ism%"um$"ng$$onal!%racle"#bit"%chard"!d##eal$$ring',
+    '"!e",ganisational\'"er)!s\'#ing\'!m(!s&(zational\'!e\'#ing%!s"&iental\'$tion&"ed#\'ginated',
+    '!#s/2"#car"(tensibly!#tto!\'utbreak#%comes#$door##fit#%going##ing##let&!s$$ines#$puts#$rage',
+    '\'#ous$$ight##set$&ide_of\'!r(!s$%kirts#$ward\'!s!#val"\'er_here$#lap\'$ping%%ooked(#ing',
+    '$!s$!t%$hrow%#ime$$view$\'whelmed)%ingly!#wes"&ing_to"!l#!s""ns!!z $p.c."!m',
+    '!!a"#ces#&kaging$#ets$#ing$!s#!t"!d##ded$!y#!s"#gan"#ige#&nfully$!s',
+    '%!s#$sley"!l#&estine(#ian+!s##mer$!s"!m##ela"$nama#\'creatic##els#"ts""pa',
+    '#&erback%$work"!r#!a$%chute$"de%#igm&"se%"ox\'&ically$&graphs$%llels%$ysed$%meter)!s',
+    '$%sites##cel&!s#%ishes#&kinson#$lour#$sons##ted$\'icipant)#ted*#ing&"le&%ulars%"ng%$tion',
+    '"$scoe#%sages$&ionate$$port#"ta$!e$$oral$"ry$#ure"%tches##ent#%hetic$#way#&iently$!o',
+    '%$otic$"ol%!n&#age&!s#"sy##ted%!n"#ula$#ine"\'vements#%ilion$"ng!"cs!$each',
+    '#"ks##rce$!l$!s%"on#!s$%antry#!t"(destrian""el#!r$"ed$#ing$!s"!g',
+    '"#nal%$ties#$ding#&etrate(#ion#$guin#&insula$!s#"ry#!s$%ioner"$pper"\'r_annum$&capita#%ceive',
+    '$#hed$!y#\'fection$%ormer)!s\'!s$#ume#&imeter$$odic$&pheral#$mits&$ting#&petual#"ry#$sian',
+    '\'"ed(#nce$)onalities$(pectives$&uading&$sion("ve#"th#!u#%verse""st$&icides"*terborough%!s&$burg',
+    '#!s#"ty!-harmaceutical##ses"&ilippa\'$ines&!s$\'osopher+!s"%oenix##nes#&sphate#)tographed+!r,!s',
+    '*!y%!s"\'ysician%(ological!!i"%casso#"ks##nic#%tured\'$sque"!e#!r$"re$!s#!s',
+    '#!s""ke"#led$!s#\'grimage#!l$"ar&!s$"ow$!s##ots"#nch#!e##ned#!s',
+    '"%oneer\'#ing"!p#%eline$!r$!s""ss$"ed##tol"%tched#!s"#zza!(lacement##gue#$inly',
+    '%%tiffs##nes%"ts$$ners##que##sma$#ter%#ics#$teau%#let$%forms#&usible#\'yground""ea$#ded',
+    '$&santly%#ing%$ures##dge&!d#&ntiful"$ight"!o#"ts$$ting##ugh""ug#"mp##nge&!d',
+    '"&ymouth!(neumonia!!o"$etic$!s"\'intless##sed$"on&"ed&#ing&#ous"#lar#%icing%(y-making$$shed',
+    '%#ely%%ician#$ling$!s$!y#!o#$ymer\'!s$(technics"#nds#!y"#ole$!s##rer%"st',
+    '"$pped"#rch#!k#%table$#ion\'!s$%raits&#yed$!s%%mouth$$ugal&$uese""se$!s#!h',
+    '(#ing#&sesses\'#ing(#ons##tal$$card$"ed%!r&!s$(graduate$%poned$#ure$#war"$tato##ent',
+    '##ter&!y"&unding#$ring"$well$#red%%fully%$less!!p!!r")acticable&$sing&&tioner#&gmatic$"ue',
+    '##yed%"rs$#ing"%e-tax$#war#&aching#(cautions$$eded\'"nt#%dator(!s$\'ecessor+!s$\'ictable\'#ing',
+    '*!s$\'ominant#$face$&erable)!y&%ences&$ring&!s#\'judices#&mature$$iums#*occupation(#ied#)parations#)scription',
+    '\'"er\'"ly%\'rvation\'#ing$$ided\'#nts$$tige\'$ious$#ume\'!d&%ption#%tence&#ded\'#ing#$vail',
+    '\'#ing%%lence(!t$&entive\'!s"$iced$#ing#$ests#$nces%&ipally$$ters##ory#$sons#$vacy%%tised',
+    '$&ileged)!s$!y#!x##zes"!o#&bation$"es$\'lematic#\'cedural%$eded\'#ing%$ssed\'#ion\'#ors',
+    '#(ductions#!f$+essionalism,"ly*!s$$iles%(tability&$boss$&oundly#\'grammed%%essed(#ion)$vely#\'hibited(#ion',
+    '\'#ion*!s#(letariat$)iferation$%onged#&menade$&inence$$oter(!s&%ional)!s$"pt&"ly#"ne$)unciation',
+    '$&aganda$#het$(ortional%#ses&#ing\'%tions$#ped$\'rietary("or#"se%&cuting)#ons("or$&perity\'#ous',
+    ')#ion#(testants\'#ers\'#ing$$ocol%$type#$udly##ven%!s$)ided_that\'"rs%$nces&!g%&sional$#oke',
+    '#%ximal&#ity"%udent!!s")ychiatric&!c%)oanalysis&&logist,!s!&udding"#lls#"se%!s"$mped$#ing',
+    '"%nched##ish&"ed#!k"#ppy"(rchasers(!s##ity#"se$\'uant_to%#ing"$zzle!%ylori"%ramid $q.b.',
+    '!!c!)ualifying%&tative#)ntitative%"um#$rrel%!y$%terly&!t#!y"$eens#$ried&!s$!y#"st',
+    '(&naires#"ue"%icker#"nn#!t#!z"#ota%!s%$tion)!s$"es$#ing \'r&amp;d!&abbits"#ced',
+    '##ism%!t#!k"#dar#%iator$%cally\'!s$\'oactive$"us"!g##ged"#ids#"ls#$nbow$&forest',
+    '"!m#!p##say$"ey"$nged%!s##ked$#ing"!p#"ed""sh"!t#"ed##ing&!s',
+    '(#ity%!s#$tled"%ymond#!s"#zor!&eacted%#ive%"or\'!s#&diness&"gs$!s##gan#(lisation',
+    '&!m%$ties%&zation$!m##red#%soned$\'surance\'!e(!d\'#ing"%becca$!l%$lion#$uild\'#ing',
+    '"\'calling&!s#$eipt\'!s$(ptionist&"or(!s#$ipes%$ient)!s%%rocal#%kless$$oned&!s#\'ognises',
+    '\'$zing$(mmending)!s$%ncile(&iation%)struction$$rder&$ings$$urse$&vering#\'reation*"al$#uit\'"ed\'#ing',
+    '##tal%&ngular$"or#\'urrence(!t#%ycled&#ing"(demption#$ress#!s#$uces$(ndancies)!y""ed#!f',
+    '(!s#$ined#(lections$"ux#%ormed\'"rs#\'reshing##uge&!e$#ses"!g#!.##ain&"ed$#rds',
+    '%!t#$imes$%sters&#rar\'!y#\'ression%$tted#%ulate(!d\'#ing",habilitation#&earsal"#ich#!d#&nforce',
+    '"\'jecting&!s"(lational&%ve_to$&xation%#ing#%eases&#ing$&gation#(iability%#nce$"es%"ve$%gions$"sh',
+    '#\'uctance(#tly#$ying"&medies$%mbers#%inder&#ing&!s%&iscent$!t#)uneration")naissance$!l$#ult##der',
+    '&#ing#"ew%"al#%owned##tal$"ed$!s",organisation"&paired$!y%$ment#&eating&!s$&rtoire$&tition',
+    '#%laces%!y$#ies#&orters#\'ression$%oduce)!d($tion*"ve#(ublicans"(questing"%scued#\'earcher$\'mblance\'!e',
+    '(!s$$nted&$ment$\'rvation+!s&#oir#&huffle#%idual&!e\'!s$"gn$%stant&"ed&#ing#(olutions',
+    '$#rts#(piratory$&ondent*!s\'#ing\'!s&$sive##ted$$less$%oring$$rain("ed(!t%#ict(#ing',
+    '%(ucturing$!s#&ultant$"me&!d$(rrection"&tailer(!s&#ing%$ning&!s#&ention##ire%#ing#%orted',
+    '$%ieval\'!e$&ospect*#ive"%union##ter"!v#!.#\'elation*!s$#nge$$rend%#sal&"ed#&iewing',
+    '$"ve&!d##olt"&warded&#ing"!x"&ynolds!\'hetoric"$odes"&ythmic&!s!"ib##bon#!s"&chards',
+    '$"er%"st$"ly$$mond#!k$!y"$dden#"er%!s$!s"#fle#!t"!g#\'ht-hand&$wing',
+    '"!m"!o#!t$!s"!p#!e##ped""sc#"ky"%tuals"%valry#&erside!"na!#oar$"ed',
+    '#"st"$bbed%"ry$"ie#!e$%rtson#"ot##son##ust"\'chester##ked%!t$#ing$!y""de',
+    '"$gers"$land##ler"%mance%"ia\'!n%!s"$nald#"ni%!e"#ofs##ted"#pes""ry"!s',
+    '#%emary#"ie##tov"!t#%ation#"or##ten"(undabout#%tines"$vers"$wing"%yalty!"ub##bed$#ing',
+    '"!c""de"!e"#fus"!g#!s""in$"ed$!s"#ler%!s"!m##our""ng##ner',
+    '##way"$pert"%shing#"ty"&thless!#yan"#der"!e &sabine""ck$"ed#&rifice"$ddam$"le#$ness',
+    ')!s""ga"$iled$"or&!s$!s#&nsbury$"ts"#lad$$ries#%esman#&isbury#\'ly-anne#"on$"on',
+    '%$tion"&mpling"&nction%$uary##dra$!s$$wich("es#!k"&rajevo"!s"(tellites#"in$*sfactorily&$ying',
+    '%$days"&unders#$sage\'!s"$vage#"es"#xon!#can$(dinavian$#ned%#ing#!r$\'borough$"ce$!e',
+    '#\'ttering"&enario$#ery$!t#&ptical\'#ism"\'hedules#$olar\'"ly\'!s(#hip$%olboy&#ing"&issors"!o',
+    '$"ch$$sman$#vec##uts"\'rambled$!p$#tch\'"ed\'#ing##eam&"ed&!s$$ened&!s$!w',
+    '%!s#"ub"(ulptures#!m!!e"#als##men#!n#%rched\'!s#!s$#ide$$onal#$ting"!b',
+    '")cond-hand&"ed#$recy%&tariat)"es()y-general&#ion&"ly#$ular$$ring"&diment(!s"%eming"%gment\'!s',
+    '"#ize"\'lecting#*f-employed&%steem$#ish#$lers$!s"(mi-final*!s$)conductor$#nar\'!s"%nator#"ds#(sational',
+    '$"ed$$ibly%"ng$#ory#\'tencing$%iment)"al)!s"(parating"$rbia&!n$!s##ial$\'ousness#$vers',
+    '"$t-up#%tings$$lers%#ing"\'venties$#red%#ity%!n"$wage##ing"#xes#%ually#!y!!h"!a',
+    '##des#"ft#!h##ken$!y#$ping#(reholder$"on$"pe#&ttered#!w"$eila#$lley%!s$%tered',
+    '#$riff$"ry#%tland"%ields#%fting#&llings#"ne$!y##ona#$pped#$rley$"ts#%vered&#ing"&ocking',
+    '#"ne##ots#%ppers##res$\'t-lived%$ages%\'comings%$fall%!s#$tgun##uts"$rewd%%sbury##ine#\'opshire',
+    '$!g"\'uddered#$ttle!!i"%beria"!d#%eways"#ege#$mens##rra"$ghts#&nalled\'#ing%$ture)!s',
+    '#$icon"*milarities)!y#$pler&"st%%icity&$fied$#son#\'ulation%\'taneous"%ncere\'"ly#&gapore$#ers$!h',
+    '$$ular#%ister#$king#!s"$pped"*tting-room"\'xteenth"&zeable$!d!\'keleton##tch&"es"!i#"es##ing',
+    '#$nner$!s#!p$#per##rts"#ull!#lab#"ck#!m$#med#!p$#ped#$shed#"te#&ughter',
+    '%"ry%!s"$eepy$"ve&!s#$nder"#ice%!d%!s##des$#ing#&ghtest#%ppery%#ing$!s',
+    '##pes#!t$!s##wed%!r$#ing"#ump%"ed"!y!\'mallest#"sh%"ed%#ing"$ells$!t',
+    '##ths"$oked%"rs#%othly!$nake%!s#!p#%tched"%iffed"%ooker!)o_much_as"$aked##red$#ing"#ber',
+    '$*o-economic%\'logical)#sts##ket$!s"!d##ium""fa#%tened%!r"#ils"%laris##emn#\'idarity$$tary',
+    '$#ing"%malia#%etime""ny",phistication""re##row#$ting"%theby"#uls#%nding$#ess#!r#\'th-west%&ampton',
+    '!"pa#%cious#!n#"rc$"ed$!k%"ed%$ling%!s#!t")ecialised("ty(#zed%)fications(#ity',
+    '%#men$%tacle)!s&#tor)!s$%ulate(#ive#%eches$$ding%!s%!y#%lling%!s$!t##nds',
+    '"%heres"$ider#"ll%"ed#!n$"al$!e%!s$$ning##ral#!t"$lash#&itting"#oil%"ed',
+    '##nge$#sor\'!s$\'taneous+"ly#"on#&tlight##use"!r##ang$!y#$eads\'$heet#$ings""un',
+    '$!s"!y!$q_km"%uared&!s$"sh#$eeze\'!d!"ri!"sr!#tab$#bed$#les#"ck%"ed',
+    '#%ffing##ged$%gered\'#ing$#ing#"in%"ed%#ing$%rcase##kes##lin$!l%!s#%mford$#ped',
+    '#!n$(dardised#"rk$$ring$#ter%#led&#ing$&vation%#ing#(te-owned$#ing%$oned%(stically$"ue&!s',
+    '%#tes#"ys"#eak$!l%#ing$$ming#"er%#ing##lla#"ms#&phanie$$ping##reo$!n#$vens',
+    '#$ward\'!s"&icking%!y#$ffly#&mulate)!d(#ing)"on&!i#"ng#%rling$#red%#ing##tch',
+    '"&ocking(!s%#ton#"ke#"le#"ol#$ring$#med%!s#"ut#"ve"*raightened%#ned&#ing&!s',
+    '&"ed&!s%$gely\'"rs$!p%!s$&sbourg$%tford%&hclyde$!y##eak%"ms$(ngthened*#ing(!s',
+    '&#ing$%tches##ide$%ngent$#ped&!s%#ped%!s##ode$#ked&!s$"ll&"ed$%ngest#&uggles',
+    '#$dios#$ffed#%mbled&#ing#$nned%#ing##rdy"%ylish&#tic!"ub#*-committee#$dued#\'jective#&marine$&ission',
+    '#(ordinate+!s#(scribers\'%ption$&ection$(idiaries\'"es&!y%&stence$\'tantive%&ituted)#ion##urb&"an&!s',
+    '%$sses\'#ors#!k$"ed$#ing"#dan""ed"&fferer(!s&!s$#ice"&itably$$case"&llivan#$phur',
+    '"(mmarised%!t$"ed$$oned&!s"%ndays#!g#!k#"ny##set$#oft")perficial%)intendent&%ority%&market',
+    '%$vise)!d("or#*plementary*"ed*!s%$ying$%orter\'#ive%%sedly$$ress("ed(#ion#&remacy"#rge',
+    '\'!s$$ical#&prises#&render)"ed$$ound#)veillance%#yed&#ing&"or(!s$$ives&#ors")sceptible#%pects',
+    '$&icions#(tainable"(therland##ton!&wallow#!m#!n$#sea#!p"#ear$#ter%#ing#$dish#"ep%#ing',
+    '#"ll%#ing"&inging%!s#%tches&#ing"%ollen#"re$!n!%ydney"&llable&"us##via"&mmetry#%phony',
+    '"\'ntactic%!x$%hetic"#ria%!n",stematically \'t-shirt!&ablets""ck$#led%#ing##tic&"al"!g"$ilor',
+    '$!s##wan"&keover"$lbot#%ented&!s##ler"!n#%gible$#led"$pped$#ing#!s"&rgeted##iff',
+    '"$sted%!s""te"#xed#%payer(!s!#bsp!&eaches#$ring##sed$#ing")chnically\'$ians"!d#"dy',
+    '"!e#$nage\'!r(!s#!s$$side"%lecom$&phoned)!s$%scope#"ly")mperament$#les$$oral$&tation',
+    '"%nancy#\'dencies$#ing#!s$$ions#!t$$acle%$tive$!h##ure"!r##esa##med$%inals\'#ted',
+    '&%ology#%races%"in$$ific\'"ed&$ying$%orism(!t)!s"#sco#!s#&timony"#xas#&tbooks$#ile',
+    '$#ure!"ha#!i$$land#$nked%%fully#+t_is_to_say"&eatres&$ical#"da#!e##irs#%odora$\'logical\'!y',
+    '%$ists#(rapeutic&#ist$#eof$#mal##ses"\'ickness#"ef$#ves#"gh%!s##nly#$rdly%!s$&teenth',
+    '"%omson#"rn%#ton$$ough#!u$&ghtful*"ly"$read&!s%#ten(!s$-e-dimensional&(quarters&$year$%shold',
+    '&"ed$"ve%#ing##ows"#umb#$nder"!y!!i""ck"#dal#!y"#ger%!s#$hten\'"ed',
+    '&!r"$lted"\'metable#$othy""na#!s"$pped"%ssues!$oast""by""dd"!e#!s"%ilets"#ken',
+    '"\'lerance&"te(!d#$kien#!l"$mato&"es#!b"!n#"es#"ic"#oth"#paz##ped#!s',
+    '#!e#$onto##que#!t$#ure\'!d""ss$"ed"\'talling#&tenham"%uches#$gher#$ring$\'naments$!s',
+    '%!s$"rs#%nsend"!y#!s!%raced%!s%!y$#ing$$king$!t%"or##ded%!r#%fford',
+    '&!r%#ing$#nee\'!s&!r\'!s$"ts#!m#*nscription%\'ferring(!s&#orm)#ing%$ient&!t',
+    '%$late%&mitted%&parent&$lant&(ortation)"ed#"ps##uma&#tic#&veller&!s$"is"#ead$$sure(!r',
+    '$$ties%%ments%!s#&mbling##nch$!t"&iangle&$ular##bal$!e%!s$%unals##cks%!y#$gger',
+    '#!m#$nity#!o##ple#\'umphant#$vial"%olley#"op#%ubles(#ome$!t"#uce$"ks#"nk#$sted',
+    '##ths!#sar!!t!$ubes""ck$"ed"#dor"!g"%ition"%mbled#"my##our&!s"#nes#$nels',
+    '(!t#!f#"ks#$moil##ner"#tor%!s!$weed#$lfth#%nties\'*th-century%&y-five(#our\'#one\'#two',
+    '#%sting"(o-thirds$$year!#yne$$side"#ped$&writer##ing""re$!s $u.s.!&kraine&#ian!$lcer%%ative',
+    '!!m"&brella!)naffected#&nimous)"ly"&beaten$(lievable"+certainties#&hanged#$lear#*omfortably%#mon$%vered"\'der_way%"go',
+    '\'"ne&\'raduate%%lined%$mine)!d%)standable-!y*!s%\'takings&#ook%%water\'!y&#ear\'"nt$\'sirable',
+    '$"ly"$ease%!y#$qual##ven#)xpectedly"(familiar")ification%"ed$$orms#%onist(!s#%quely#$tary$!e',
+    '"&lawful#&imited#%ocked#$ucky"\'married#)istakable"\'natural#*ecessarily"(official"$paid#&opular#*recedented%(dictable#(ublished")realistic',
+    '$%lated%%iable$"st",satisfactory##een#&killed#%table#)uccessful$&itable$"re"\'touched"$used$%ually"&veiled"&wanted',
+    '#&illing!)p-to-date"(_to_date#%until"(bringing"%dated"%grade"$held")side_down#%tream"$ward!&ranium"%gency%#tly#!h',
+    '"#ine!\'sefully&$ness"!l!(tilities&!y"$most"#ter%$ance)!s%"ed!!x )vacancies%!t##uum',
+    '"!l#!e$#rie#\'idation#$leys#&uation#"ve"&nished"$pour"&riance&!t\'!s""se##tly"%tican',
+    '#%xhall!%ector"\'getable&$rian&$tion""il#!n$!s"&locity##vet"%ndors#&ezuela##ice#(tilation$$ured',
+    '##ues$!s""rb$!s#"ge#&satile$"es$"us"$sted"!t#$eran\'!s%%inary#!o!(iability',
+    '"\'bration"!c#"ar#+e-president$&_versa#%inity$#ous##tor&#ies"(deo-tape%!s"(etnamese##wer&!s$%point',
+    '("ly$"ur"!i#!i"$king"\'llagers"%ncent#"es#$tage"\'olation$%ently%!t$"in"%rtual%"es',
+    '"(sibility$#ons#%ually"&tality$#min\'!s#"or"#vid%"ly!$ocal$&tional"$iced#!d"!l#!.',
+    '#%canic#$tage#(untarily&#eer)"ed#"vo"!n"&uchers"#wed"$yage!!s!,ulnerability &w.l.r.!!a""cc',
+    '"$gner#"on"$iter"$king"%lkers#$lace$"et$%paper#"sh##ton"$nder&"ed&#ing"$rden$$robe',
+    '#&ehouse#$fare##med%!r$#ing$"ly#!n$"er$$ings$!s#$rant\'!s\'!y$"en$&ington',
+    '\'!s##saw#$time#$wick#!y"$stes$#ing"%tches#(ercolour%#loo#!t$!s"$ving"!x"#yne',
+    '#%kened&#ing%!r$"ly$&nesses#$rily$!s$!y#$ving"!b#!b#"er"!d#"ge""ed',
+    '#%kends#$ping"#igh%"ed%#ing%#ted&!s#!r$!d"\'lcoming#\'l-being$&ington"%mbley"#ndy""pt',
+    '"%xford!!h"#ale%!s#\'tsoever"#eat#\'elchair%"ed&!r#(reabouts"\'ichever#!p$#ped#$sper\'#ing',
+    '#&tehall%!s"\'olesale!%icked%!t&!s"*de-ranging$#ned%#ing##ows#"th"#gan"(lderness$"ly#&kinson',
+    '%$ngly%!s$!s#&tshire"(nchester#$ding$&screen%"or$!y#"es##ger#$ston#$ters""pe##ing',
+    '$!s##ral"!t#"ch#+h_a_view_to$$drew$%stand#&nessed#"ty!$oken""lf##ves")nderfully&!s"&odland',
+    '"\'rcester)%shire#$ding$&sworth#%kings$$load$#men$%place$\'station+!s#\'ld-wide%!s#!m$!s"&uld-be',
+    '"#ven"!w!#rap"#eck%"ed#%tched"#ist%!s#!t$$ings"%ongly"!y!"wf!\'ycliffe %x-ray',
+    '!$acht"#nto""rn!%early"$lled"!n!&ielded%!s!(oungster#\'rselves#%thful%!s!#uan"&goslav !z',
+    '!"en!\'imbabwe""nc!$ones"!o',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_03 = (
+count_03 = 6694
+
+heads_03 = (
     '&agrave',
-    '&dollar;1',
-    '&eacute;lite',
-    '&egr',
-    '&ggr',
-    '&gt',
-    '&khgr',
-    '&lt',
-    '&micro;g',
-    '&micro;l',
-    '&ndash',
-    '&pound',
-    '&pound;1,500',
-    '&pound;12',
-    '&pound;15,000',
-    '&pound;1m',
     '&pound;200,000',
-    '&pound;25,000',
-    '&pound;250,000',
-    '&pound;3,000',
-    '&pound;30,000',
-    '&pound;300,000',
-    '&pound;35',
-    '&pound;4',
-    '&pound;4,000',
-    '&pound;4.99',
-    '&pound;40,000',
-    '&pound;500,000',
-    '&pound;6',
-    '&pound;60',
-    '&pound;60,000',
-    '&pound;600',
     '&pound;7',
-    '&pound;75',
-    '&pound;8',
-    '&pound;80',
-    '\'60s',
-    '\'70s',
-    '\'er',
-    '\'ere',
-    '\'im',
-    '\'n\'',
-    '+0000',
-    '+1',
-    '0.1',
-    '0.2',
-    '031',
-    '04',
     '05',
-    '071',
-    '1,200',
-    '1.3',
-    '1.4',
-    '1.6',
-    '1.7',
-    '1.8',
-    '101',
-    '102',
-    '103',
-    '104',
-    '105',
-    '106',
-    '108',
-    '109',
     '10am',
-    '11%',
-    '111',
-    '112',
-    '113',
-    '114',
-    '115',
-    '119',
-    '12%',
-    '12,000',
-    '1200',
-    '123',
-    '124',
-    '127',
-    '128',
-    '13%',
     '135',
-    '137',
-    '15,000',
-    '1500',
-    '16%',
-    '170',
-    '1700',
-    '175',
-    '18-year-old',
-    '1800',
-    '1815',
-    '1830',
-    '1830s',
-    '1832',
-    '1839',
-    '1840',
     '1840s',
-    '1848',
-    '1850',
-    '1850s',
-    '1851',
-    '1854',
-    '1855',
-    '1856',
-    '1857',
-    '1858',
-    '1859',
-    '1860',
-    '1860s',
-    '1861',
-    '1862',
-    '1863',
     '1864',
-    '1865',
-    '1866',
-    '1867',
-    '1868',
-    '1869',
-    '1870s',
-    '1871',
-    '1872',
-    '1873',
-    '1874',
-    '1875',
-    '1876',
-    '1878',
-    '1879',
-    '1881',
     '1882',
-    '1883',
-    '1884',
-    '1885',
-    '1886',
-    '1887',
-    '1888',
-    '1889',
-    '1890s',
-    '1891',
-    '1892',
-    '1893',
-    '1894',
-    '1895',
-    '1896',
-    '1897',
     '1898',
-    '1899',
-    '190',
-    '1901',
-    '1903',
-    '1904',
-    '1990/91',
-    '2%',
-    '2&ndash;3',
-    '2,500',
-    '2-1',
-    '2.',
-    '2.4',
-    '2.6',
-    '2.7',
-    '2.8',
     '220',
-    '22nd',
-    '230',
-    '23rd',
-    '24-hour',
-    '240',
-    '24th',
-    '25,000',
-    '250,000',
-    '27th',
-    '28th',
-    '29th',
-    '2pm',
-    '3%',
-    '3.0',
-    '3.4',
     '3.6',
-    '3.7',
-    '3.8',
-    '300,000',
-    '30th',
-    '31st',
-    '35%',
-    '3d',
-    '4%',
-    '4.0',
-    '4.4',
-    '4.6',
-    '4.7',
-    '400,000',
-    '4000',
-    '450',
     '5.3',
-    '5.4',
-    '5.5',
-    '500,000',
-    '5000',
-    '50p',
-    '50th',
-    '5ft',
-    '6%',
-    '6.1',
-    '6.2',
-    '6.3',
-    '6.4',
-    '6.5',
-    '60,000',
-    '6000',
     '650',
-    '6ft',
-    '7%',
-    '7,000',
-    '7.1',
-    '7.2',
-    '7.3',
-    '7.30',
-    '7.30pm',
-    '7.5',
-    '70,000',
-    '75%',
-    '750',
-    '7pm',
-    '8%',
-    '8,000',
     '8.1',
-    '8.2',
-    '8.5',
-    '80486',
-    '8pm',
-    '9%',
-    '900',
-    '9000',
-    '96',
-    '97',
-    '98',
-    'a\'s',
-    'a-level',
-    'a.d.',
-    'a.m',
-    'a1',
     'a4',
-    'a_priori',
-    'aah',
-    'aaron',
-    'ab',
-    'aback',
-    'abberley',
-    'abbott',
-    'abc',
-    'abdomen',
-    'abduction',
-    'abdul',
-    'abdullah',
-    'aberystwyth',
-    'abide',
-    'abnormality',
     'aboriginal',
-    'abortions',
-    'abortive',
-    'abound',
-    'abrasive',
-    'abstentions',
-    'absurdity',
-    'abusive',
-    'accelerating',
-    'accelerator',
-    'accentuated',
-    'acceptability',
-    'accessed',
-    'accessibility',
-    'accessory',
-    'acclaim',
     'acclaimed',
-    'accommodating',
-    'accompanies',
-    'accomplish',
-    'accords',
-    'accreditation',
-    'accrued',
-    'accumulate',
-    'accumulating',
-    'accumulator',
-    'accuse',
-    'ache',
-    'ached',
-    'achieves',
-    'acidity',
-    'acorn',
     'acquaintances',
-    'acquainted',
-    'acquires',
-    'acquitted',
-    'acrylic',
-    'activate',
-    'activator',
-    'activist',
-    'acutely',
-    'ada',
-    'adamant',
-    'adaptable',
-    'adaptations',
-    'adapting',
-    'adaptive',
-    'adaptor',
     'addicted',
-    'additives',
-    'adept',
-    'adequacy',
-    'adhere',
-    'adhered',
-    'adherence',
-    'adhesion',
-    'adhesive',
-    'adjournment',
-    'adjudication',
-    'adjustable',
-    'administering',
-    'administrations',
-    'admirably',
-    'admiralty',
     'admirer',
-    'admirers',
-    'admiring',
-    'admissible',
-    'adobe',
-    'adolescents',
-    'adopts',
-    'adored',
-    'adorned',
-    'adorno',
-    'adrenalin',
-    'adrift',
-    'adultery',
-    'adulthood',
-    'advantageous',
-    'adversary',
     'advertisers',
-    'adverts',
-    'advises',
-    'advisor',
-    'advocacy',
-    'advocating',
-    'aerobic',
-    'aerobics',
-    'aeroplanes',
-    'aesthetics',
-    'affectionate',
-    'affidavit',
-    'affiliated',
-    'affiliation',
-    'affiliations',
-    'affirmation',
     'affirmative',
-    'affirmed',
-    'afflicted',
-    'affluent',
-    'affordable',
-    'afghan',
-    'afield',
-    'afloat',
-    'agatha',
-    'aggie',
-    'aggravated',
-    'aggregates',
-    'aggregation',
-    'aggressively',
-    'aggrieved',
-    'agitated',
     'agm',
-    'agnew',
-    'agrarian',
-    'agreeable',
-    'aide',
-    'aides',
-    'ailing',
-    'airports',
-    'airy',
-    'aitken',
-    'aix',
-    'alarms',
-    'alaska',
-    'alastair',
-    'albanian',
-    'albans',
     'albion',
-    'albumin',
-    'alcoholism',
-    'alf',
-    'algerian',
-    'algiers',
-    'algorithms',
-    'alienated',
-    'alienation',
-    'aliens',
-    'alight',
-    'aligned',
-    'alignment',
-    'alistair',
-    'alix',
-    'alkali',
     'alkaline',
-    'all-important',
-    'all-round',
-    'all-time',
-    'all_of_a_sudden',
-    'allegation',
-    'alleging',
-    'allergic',
-    'allergy',
-    'alleviate',
-    'allison',
-    'allocating',
-    'allotment',
-    'allotted',
-    'alloy',
-    'almighty',
     'almond',
-    'almonds',
-    'aloof',
-    'alphabet',
-    'alphabetical',
-    'alternately',
-    'alternating',
-    'alyssia',
-    'amalgamated',
-    'amalgamation',
-    'amateurs',
-    'amazingly',
-    'amazon',
-    'ambassadors',
-    'ambiguities',
-    'ambivalence',
     'ambivalent',
-    'ambush',
-    'amen',
-    'amenable',
-    'amend',
-    'amenity',
-    'amiable',
-    'amis',
-    'ammonia',
-    'amounting',
-    'amplification',
-    'amplified',
-    'amplifier',
-    'amplitude',
-    'amstrad',
-    'amuse',
     'an_awful_lot',
-    'anaemia',
-    'anaesthetic',
-    'analytic',
-    'anarchy',
-    'anatomical',
-    'ancestor',
-    'ancestral',
-    'ancestry',
-    'anchored',
-    'ancillary',
-    'andes',
-    'andr&eacute',
-    'andre',
-    'andrea',
-    'anecdotes',
     'anfield',
-    'angalo',
-    'angered',
-    'angled',
-    'anglesey',
-    'anglian',
-    'angling',
-    'anglo-american',
-    'angola',
-    'animation',
-    'animosity',
-    'anita',
-    'annabel',
-    'announcements',
-    'announces',
-    'annoy',
     'anomalies',
-    'anomalous',
-    'anomaly',
-    'anonymity',
-    'anorexia',
-    'antagonism',
-    'antarctica',
-    'anthem',
-    'anthropological',
-    'anthropologist',
-    'anti',
-    'anti-semitism',
-    'antibiotic',
-    'anticipating',
-    'antics',
-    'antigen',
     'antigens',
-    'antiquities',
-    'antiquity',
-    'antislavery',
-    'antoinette',
-    'anton',
-    'antony',
-    'antrim',
-    'anymore',
-    'ap',
-    'apartheid',
-    'apathy',
-    'apes',
-    'apex',
-    'apollo',
-    'apologetic',
     'apologised',
-    'apologize',
-    'apostles',
-    'applauded',
-    'appointing',
-    'appreciable',
-    'apprehensive',
-    'apprentices',
-    'appropriateness',
-    'approving',
-    'approx',
-    'approximation',
-    'apr',
-    'apricot',
-    'aptly',
-    'aquatic',
     'aquino',
-    'ar',
-    'arafat',
-    'araminta',
-    'arbitrage',
-    'arbitrarily',
-    'arbitrator',
-    'arcade',
-    'archaeologists',
-    'archaic',
-    'archdeacon',
-    'archers',
-    'archie',
-    'ardent',
-    'arduous',
-    'argentine',
     'argyll',
-    'ari',
-    'arid',
-    'aristotle',
-    'arizona',
-    'ark',
-    'armagh',
-    'armchairs',
-    'armenia',
-    'armenian',
-    'aroma',
-    'aromatic',
-    'arousal',
-    'arouse',
-    'arresting',
-    'arrivals',
     'arson',
-    'artefact',
-    'artemis',
-    'arterial',
-    'arteries',
-    'artery',
-    'articulation',
-    'artificially',
-    'artisans',
-    'artwork',
-    'as_a_matter_of_fact',
-    'as_between',
-    'as_from',
-    'asbestos',
-    'ascending',
-    'ascertained',
     'ascot',
-    'ascribed',
-    'asean',
-    'ashtray',
-    'asians',
-    'aside_from',
-    'aspiration',
-    'aspire',
-    'aspirin',
-    'aspiring',
-    'asquith',
-    'ass',
-    'assassin',
-    'assaulting',
-    'assays',
-    'assemblages',
     'assembling',
-    'asserting',
-    'assertions',
-    'assertive',
-    'asserts',
-    'assessors',
-    'assign',
-    'assimilated',
-    'assimilation',
-    'associative',
-    'assorted',
-    'assortment',
-    'astra',
-    'astronomers',
-    'astronomical',
-    'astronomy',
     'astute',
-    'at_most',
-    'at_worst',
-    'athenian',
-    'athlete',
-    'atkins',
-    'atlanta',
-    'atlas',
-    'atrocities',
-    'attaching',
-    'attackers',
-    'attendants',
-    'attends',
-    'attentions',
-    'attentive',
-    'attlee',
     'attractiveness',
-    'au',
-    'aubrey',
-    'audible',
-    'audited',
-    'audition',
-    'auditory',
-    'audits',
-    'audrey',
-    'aug',
-    'augmented',
-    'augustine',
-    'augustus',
-    'aunts',
-    'aunty',
-    'auspices',
     'austen',
-    'austere',
-    'australians',
-    'authenticity',
-    'authorisation',
-    'auto',
-    'automated',
-    'automation',
-    'automobile',
-    'auxiliary',
-    'avail',
-    'avant-garde',
-    'avenues',
-    'averaged',
-    'averages',
-    'averaging',
     'avert',
-    'averted',
-    'awaits',
-    'awakening',
-    'awarding',
-    'awesome',
-    'awfully',
-    'awkwardly',
-    'awoke',
-    'ay',
-    'aycliffe',
-    'aylesbury',
-    'ayr',
-    'ayrshire',
-    'azerbaijan',
-    'aziz',
     'b\'s',
-    'backbone',
-    'backlash',
-    'backside',
-    'backup',
-    'badger',
-    'badgers',
-    'badges',
-    'badminton',
-    'baffled',
-    'baggy',
-    'bakery',
-    'balfour',
-    'ballets',
-    'balliol',
-    'balloons',
     'ballroom',
-    'ballymena',
-    'bamboo',
-    'bandage',
-    'banished',
-    'banners',
-    'banquet',
-    'bans',
-    'baptized',
-    'barbados',
-    'barbarians',
-    'barbecue',
-    'barbed',
-    'barclay',
-    'barefoot',
-    'bargains',
     'barge',
-    'barked',
-    'barlow',
-    'barman',
-    'barnard',
-    'barnet',
-    'barney',
-    'barns',
-    'barnsley',
-    'baroness',
-    'barons',
-    'barristers',
-    'barthes',
-    'bartholomew',
-    'bash',
-    'basics',
     'basingstoke',
-    'basins',
-    'bassett',
-    'bathed',
-    'bathrooms',
-    'bathsheba',
-    'batsmen',
-    'battersea',
-    'battled',
-    'battlefield',
-    'bavaria',
-    'bays',
-    'bazaar',
-    'bcci',
-    'beacon',
-    'beak',
     'beamed',
-    'beaming',
-    'bearded',
-    'bearer',
-    'bearings',
-    'beatles',
-    'beatrice',
-    'beattie',
-    'beaumont',
-    'becker',
-    'beckett',
-    'beckoned',
-    'becky',
-    'bede',
-    'bedfordshire',
-    'bedtime',
     'beetle',
-    'beetles',
-    'beggar',
-    'beggars',
-    'beginner',
-    'beginners',
-    'behaves',
-    'beige',
-    'beleaguered',
-    'belgrade',
-    'believer',
-    'believers',
-    'belle',
-    'bellowed',
-    'belongings',
-    'belville',
     'bemused',
-    'bends',
-    'benefiting',
-    'benevolent',
-    'bentley',
-    'bereaved',
-    'bereavement',
-    'berger',
-    'bernie',
-    'berries',
-    'berth',
-    'berwick',
-    'beryl',
-    'beset',
-    'besieged',
-    'best-known',
     'bestowed',
-    'betray',
-    'betraying',
-    'bets',
-    'bevan',
-    'beveridge',
-    'beverley',
-    'bewildering',
-    'bewilderment',
-    'bgs',
-    'bibliography',
-    'bicarbonate',
-    'bicester',
-    'bicycles',
-    'bidder',
-    'biliary',
     'bilingual',
-    'billing',
-    'billingham',
-    'billions',
-    'binds',
-    'bingham',
-    'bingo',
-    'bins',
-    'biochemical',
-    'biochemistry',
-    'biographical',
-    'biologists',
-    'biotechnology',
-    'birch',
-    'birkenhead',
-    'birthplace',
     'bites',
-    'bitten',
-    'blackboard',
-    'blackened',
-    'blackness',
-    'blacksmith',
-    'blames',
-    'blanc',
-    'blankly',
-    'blatant',
-    'blazed',
-    'bleach',
-    'blended',
-    'blending',
-    'blinded',
-    'blinding',
     'blindly',
-    'blindness',
-    'blinds',
-    'blink',
-    'blinking',
-    'bliss',
-    'blitz',
-    'blockade',
-    'blokes',
-    'blondel',
-    'blooming',
-    'blooms',
-    'bloomsbury',
-    'blossom',
-    'blot',
-    'blueprint',
     'bluff',
-    'bluntly',
-    'blur',
-    'blush',
-    'blushed',
-    'bnfl',
-    'bo',
-    'boar',
-    'boarded',
-    'boardroom',
-    'boasted',
-    'bobbie',
-    'bodie',
-    'boeing',
-    'bog',
-    'bogus',
     'boldly',
-    'bolivia',
-    'bollocks',
-    'bolshevik',
-    'bolsheviks',
-    'bolster',
-    'bolted',
-    'bombardment',
-    'bombay',
-    'bombed',
-    'bona_fide',
-    'bonanza',
-    'bonded',
-    'bonding',
-    'bonfire',
-    'bonnet',
     'bonuses',
-    'bony',
-    'boo',
-    'booklets',
-    'bookseller',
-    'booksellers',
-    'bookshops',
-    'booming',
-    'boon',
-    'booze',
-    'bordeaux',
-    'bordered',
-    'bordering',
-    'boro',
-    'borrower',
-    'borrowings',
     'bosnia-hercegovina',
-    'bosom',
-    'botanical',
-    'botany',
-    'botham',
-    'bothering',
-    'botswana',
-    'bottled',
-    'bottomley',
-    'bottoms',
-    'boulders',
-    'boulevard',
-    'bounded',
-    'bouquet',
-    'bout',
-    'bouts',
     'bowe',
-    'bowing',
-    'bowled',
-    'bowlers',
-    'boxed',
-    'boyd',
-    'boyle',
-    'bra',
-    'brace',
-    'braced',
-    'bracken',
-    'bracket',
-    'bradshaw',
-    'bragg',
-    'branching',
-    'branded',
     'braque',
-    'bravely',
-    'bravery',
-    'bray',
-    'breached',
-    'break-up',
-    'breathtaking',
-    'breeders',
-    'brent',
-    'brentford',
-    'brett',
-    'brew',
-    'brewer',
-    'breweries',
-    'brezhnev',
-    'bribe',
     'bribery',
-    'brickwork',
-    'bridging',
-    'bridle',
-    'briefcase',
-    'briefed',
-    'brigadier',
-    'brightest',
-    'brightness',
-    'brilliance',
-    'britannia',
-    'briton',
-    'brittany',
-    'britten',
-    'brixton',
-    'broadcasters',
     'broaden',
-    'broadened',
-    'broadening',
-    'broadway',
-    'brochures',
-    'bromley',
-    'brood',
-    'brooding',
-    'brooks',
-    'broom',
-    'brother-in-law',
-    'brotherhood',
-    'browne',
-    'brownie',
-    'brownies',
-    'brows',
     'bruises',
-    'bruising',
-    'brunt',
-    'brutality',
-    'brutally',
-    'brute',
-    'bryony',
-    'bs',
-    'bsl',
-    'bu',
-    'bubbling',
-    'buchanan',
-    'bucharest',
-    'buckets',
-    'buckle',
-    'buckley',
     'bucks',
-    'budapest',
-    'buddhist',
-    'budding',
-    'buddy',
-    'budgeting',
-    'buds',
-    'buff',
-    'buffalo',
-    'bug',
-    'bugs',
-    'bukharin',
-    'bulgarian',
-    'bulge',
-    'bulging',
-    'bulky',
     'bulls',
-    'bully',
-    'bullying',
-    'bumped',
-    'bumper',
-    'bumping',
-    'bun',
-    'bundesbank',
-    'bundestag',
-    'bundled',
-    'bundles',
-    'bunk',
-    'bunker',
-    'bunny',
-    'buoyant',
-    'burdens',
     'bureaux',
-    'burgeoning',
-    'burger',
-    'burgess',
-    'burgh',
-    'burglar',
-    'burglars',
-    'burgundy',
-    'burrow',
-    'burying',
-    'busiest',
-    'busily',
-    'bustle',
-    'bustling',
-    'butchers',
-    'buttocks',
     'buxton',
-    'buy-out',
-    'buzzing',
-    'by_reason_of',
-    'byron',
-    'c&amp;p',
-    'c++',
-    'cabaret',
-    'cabbage',
-    'cabinets',
-    'cache',
-    'cad',
-    'cadbury',
-    'caddie',
-    'caf&eacute;s',
-    'cages',
     'cairns',
-    'calais',
-    'calculator',
-    'calcutta',
-    'calder',
-    'caledonian',
-    'calibre',
-    'california-based',
-    'californian',
-    'callaghan',
-    'caller',
-    'callers',
-    'calmed',
-    'calming',
-    'calorie',
-    'cambodian',
     'cambrian',
-    'cambridgeshire',
-    'camcorder',
-    'camden',
-    'camille',
-    'camouflage',
-    'campaigned',
-    'campaigner',
-    'canary',
-    'candy',
-    'cannabis',
-    'canoe',
-    'canons',
-    'cantona',
-    'canvases',
-    'canyon',
     'capitalists',
-    'capped',
-    'capping',
-    'capsule',
-    'capt',
-    'captains',
-    'caption',
-    'captive',
-    'captivity',
-    'captures',
-    'capturing',
-    'caravans',
-    'carbohydrate',
-    'carboniferous',
-    'carcinoma',
-    'cardigan',
     'cardiovascular',
-    'carelessly',
-    'carey',
-    'carlton',
-    'carmen',
-    'carnival',
-    'caro',
-    'carole',
-    'carolina',
-    'carriageway',
-    'carrington',
-    'carroll',
-    'carrot',
-    'cartel',
-    'cartoons',
-    'cartridge',
     'carts',
-    'carve',
-    'cascade',
-    'casey',
-    'casino',
-    'casserole',
-    'cassettes',
-    'cassie',
-    'caste',
-    'castro',
-    'casts',
-    'catalyst',
-    'catalytic',
-    'catastrophe',
-    'catastrophic',
-    'catchment',
     'catered',
-    'catfish',
-    'cathedrals',
-    'catholicism',
-    'causation',
-    'cautioned',
-    'cavalier',
-    'cbi',
-    'cc',
-    'ccg',
-    'cd-rom',
-    'cds',
-    'cdu',
-    'ceases',
-    'ceau&scedil;escu',
-    'ceausescu',
     'cegb',
-    'ceilings',
-    'celebrates',
-    'celebrities',
-    'celebrity',
-    'cellars',
-    'centimetres',
-    'centralised',
-    'centralized',
-    'cents',
-    'ceramic',
-    'ceramics',
-    'certification',
-    'certified',
-    'cervical',
-    'cessation',
     'cf.',
-    'cfcs',
-    'ch&acirc;teau',
-    'chad',
-    'chained',
-    'chairmanship',
-    'challenger',
-    'chancery',
-    'chandler',
-    'chang',
-    'channelled',
-    'chant',
-    'chanting',
-    'chapels',
-    'chaplin',
-    'characterisation',
     'characterise',
-    'characteristically',
-    'characterize',
-    'chargeable',
-    'chariot',
-    'charisma',
-    'charismatic',
-    'charlemagne',
-    'charms',
-    'charters',
-    'chassis',
-    'chateau',
-    'chatted',
-    'chatter',
-    'chattering',
-    'chaucer',
     'chauffeur',
-    'cheated',
-    'cheating',
-    'checklist',
-    'cheeky',
-    'cheering',
-    'cheerio',
-    'cheeses',
-    'chemically',
-    'chemotherapy',
-    'chen',
-    'cherished',
-    'chernobyl',
-    'cherries',
-    'cheryl',
-    'chesterfield',
     'chew',
-    'chewed',
-    'chi',
-    'chic',
-    'chichester',
-    'chick',
-    'chicks',
-    'childbearing',
-    'childbirth',
-    'childcare',
-    'childless',
-    'chilean',
-    'chilled',
-    'chilling',
-    'chilly',
-    'chimneys',
     'chipped',
-    'chipping',
-    'chiswick',
-    'chloride',
-    'chlorine',
-    'chocolates',
-    'choirs',
-    'choke',
-    'choking',
-    'cholera',
-    'chopping',
-    'chops',
-    'choral',
-    'chores',
-    'chrissy',
-    'chromosomes',
     'chronological',
-    'chronology',
-    'chub',
-    'chuckle',
-    'chunk',
-    'chunks',
-    'chunky',
-    'cinemas',
-    'circa',
-    'circled',
-    'circling',
-    'circulate',
-    'cirencester',
-    'cistern',
-    'cite',
-    'citing',
     'civilized',
-    'clad',
-    'claimant',
-    'claimants',
-    'clambered',
-    'clamp',
-    'clamped',
-    'clapham',
-    'clapped',
-    'clarence',
-    'claret',
-    'clarified',
-    'clarinet',
-    'clarissa',
-    'clashed',
-    'classed',
     'classifications',
-    'classify',
-    'clatter',
-    'claude',
-    'claudel',
-    'claw',
-    'clayton',
-    'clean-up',
-    'cleanliness',
-    'cleansing',
-    'clear-cut',
-    'clearest',
-    'cleavage',
-    'clement',
-    'cleo',
-    'clergyman',
     'cleverly',
-    'clicked',
-    'clicking',
-    'client-server',
-    'clientele',
-    'clifton',
-    'climates',
-    'climber',
-    'clinch',
-    'clinched',
-    'clinically',
-    'clips',
-    'clockwise',
-    'clone',
-    'clones',
-    'closeness',
     'closet',
-    'clothed',
-    'clouded',
-    'cloudy',
-    'clover',
-    'clown',
-    'clubhouse',
-    'clump',
-    'clumps',
-    'clustered',
-    'clustering',
-    'clwyd',
-    'cnd',
-    'co-op',
-    'co-operatives',
-    'coals',
     'coasts',
-    'coated',
-    'coating',
-    'coatings',
-    'cobalt',
-    'cobbled',
-    'cobra',
-    'coca',
-    'coca-cola',
-    'cocked',
-    'cockney',
-    'coconut',
-    'cod',
-    'coded',
-    'coefficient',
-    'coefficients',
     'coeliac',
-    'coercion',
-    'coffins',
-    'cohesive',
-    'cohort',
-    'coils',
-    'coinage',
-    'coincides',
-    'coined',
-    'col',
-    'colder',
-    'coldness',
-    'coleraine',
-    'coli',
-    'collaborate',
-    'collapsing',
     'collars',
-    'collects',
-    'collided',
-    'colliery',
-    'collusion',
-    'colonialism',
-    'colorado',
-    'colorectal',
-    'colossal',
-    'colt',
-    'columbus',
-    'coma',
-    'combo',
-    'combustion',
-    'comedian',
-    'comet',
     'comforted',
-    'comforts',
-    'comics',
-    'commando',
-    'commandos',
-    'commemorate',
-    'commencement',
-    'commencing',
-    'commend',
-    'commended',
-    'commentator',
-    'commercials',
-    'commissioning',
-    'committal',
-    'commodore',
-    'commonest',
     'commonsense',
-    'commune',
-    'communiqu&eacute',
-    'commuter',
-    'commuters',
-    'companionship',
-    'compaq',
-    'compartments',
-    'compassionate',
-    'compel',
-    'compensated',
-    'competed',
-    'compilation',
-    'compile',
-    'compiler',
-    'compiling',
     'complacency',
-    'complacent',
-    'complains',
-    'complemented',
-    'completes',
-    'complexion',
-    'complication',
-    'complied',
-    'complimentary',
-    'compliments',
-    'compose',
-    'compositions',
-    'composure',
-    'comprehend',
-    'compromised',
-    'compromises',
     'compulsive',
-    'computational',
-    'computed',
-    'comrade',
-    'concealing',
-    'conceivable',
-    'conceivably',
-    'concerted',
-    'conciliation',
-    'concise',
-    'concomitant',
-    'concorde',
-    'concurrent',
-    'condemning',
-    'condensation',
-    'condensed',
     'condom',
-    'condoms',
-    'conducive',
-    'conductors',
-    'cones',
-    'confer',
-    'confessions',
-    'confided',
-    'configurations',
-    'confine',
-    'confinement',
-    'confines',
-    'confiscated',
-    'confronting',
-    'congenital',
-    'conglomerate',
     'congo',
-    'congratulated',
-    'congregations',
-    'connects',
-    'connie',
-    'connolly',
-    'connor',
-    'connotations',
-    'conquer',
-    'conquered',
-    'cons',
-    'conscientious',
-    'consented',
-    'conservationists',
-    'conservatory',
-    'conserve',
     'conserved',
-    'consignment',
-    'console',
-    'consolidate',
-    'consonant',
-    'conspicuously',
-    'constables',
-    'constabulary',
-    'constantine',
-    'constantinople',
-    'constants',
-    'constipation',
-    'constituting',
-    'constructions',
-    'constructs',
-    'contacting',
     'containment',
-    'contemplation',
-    'contemplative',
-    'contemptuous',
-    'contend',
-    'contended',
-    'contender',
-    'contenders',
-    'contented',
-    'contentment',
-    'contests',
-    'contiguous',
-    'continents',
-    'contours',
-    'contraception',
-    'contraceptive',
     'contractions',
-    'contradict',
-    'contras',
-    'contravention',
-    'contributor',
-    'contributors',
-    'contributory',
-    'contrived',
-    'controllers',
-    'convection',
-    'convened',
-    'conventionally',
-    'conversational',
-    'converse',
-    'conversions',
-    'converts',
     'convex',
-    'conveyance',
-    'conveyancing',
-    'conveying',
-    'conveys',
-    'convict',
-    'convincingly',
-    'convoys',
-    'conway',
-    'cooke',
-    'cooks',
-    'cooled',
-    'cooler',
-    'coolly',
-    'cooperate',
-    'coopers',
     'coordinated',
-    'coordinates',
-    'coordinating',
-    'coordinator',
-    'coped',
-    'copenhagen',
-    'cops',
-    'corals',
-    'cords',
-    'corollary',
-    'corpses',
-    'correcting',
-    'corrective',
-    'correlate',
-    'correlations',
-    'correspondents',
     'correspondingly',
-    'corrosion',
-    'cortex',
-    'cose',
-    'cosmetic',
-    'cosmetics',
-    'cosmic',
-    'cosmo',
-    'cosmopolitan',
-    'cosmos',
-    'cost-effective',
-    'cotswold',
-    'coughed',
-    'coughing',
-    'counsellors',
-    'countenance',
     'counteract',
-    'counters',
-    'countrymen',
-    'coupling',
-    'courageous',
-    'courier',
-    'courteous',
-    'courting',
-    'courtney',
-    'courtship',
-    'cove',
-    'covent',
-    'covert',
-    'coward',
-    'cowboy',
-    'cp',
     'cprw',
-    'cpsu',
-    'cpu',
-    'cr',
-    'crab',
-    'crabs',
-    'crackdown',
-    'cradle',
-    'craftsman',
-    'crag',
-    'crags',
-    'crashes',
-    'crate',
-    'crater',
-    'crates',
-    'craven',
     'cray',
-    'creaking',
-    'creamy',
-    'creations',
-    'credentials',
-    'creek',
-    'creggan',
-    'crete',
-    'crewe',
-    'cricketer',
-    'cricketers',
-    'crilly',
-    'criminology',
-    'crimson',
-    'crippled',
-    'crippling',
     'crisps',
-    'criticising',
-    'criticize',
-    'croats',
-    'crocodile',
-    'croft',
-    'crook',
-    'crooked',
-    'cropped',
-    'crosby',
-    'cross-section',
-    'crossly',
-    'crouching',
-    'crow',
-    'crowns',
-    'crucially',
     'crudely',
-    'cruelly',
-    'crumble',
-    'crumbs',
-    'crunch',
-    'crux',
-    'crypt',
-    'crystalline',
-    'csce',
-    'cu',
-    'cube',
-    'cubes',
-    'cuckoo',
-    'cues',
-    'culinary',
-    'culley',
     'culminated',
-    'culminating',
-    'culmination',
-    'cultivate',
-    'culturally',
-    'cultured',
-    'cumberland',
-    'cumbersome',
-    'cunt',
-    'curate',
-    'curfew',
-    'curling',
-    'current-account',
-    'curricula',
-    'curricular',
-    'currie',
     'cursing',
-    'cursor',
-    'curtailed',
-    'curving',
-    'custard',
-    'custodial',
-    'cutbacks',
-    'cute',
-    'cutlery',
-    'cutter',
-    'cyclic',
-    'cyclist',
-    'cyclosporin',
-    'cylinders',
-    'cynicism',
-    'cynthia',
     'cyril',
-    'cystic',
-    'czechoslovak',
-    'd\'arcy',
-    'd.c.',
-    'daffodils',
-    'dagenham',
-    'dagger',
-    'dal',
-    'dales',
-    'dalgliesh',
-    'dalglish',
-    'dallas',
-    'dalton',
-    'daly',
-    'damascus',
     'damien',
-    'dane',
-    'danes',
-    'dangling',
-    'daniels',
-    'danube',
-    'danzig',
-    'daphne',
-    'darkening',
-    'darkly',
-    'dart',
-    'darted',
-    'darts',
-    'dashing',
-    'dawned',
-    'dazed',
     'dce',
-    'dcs',
-    'de_facto',
-    'deacon',
-    'deadlock',
-    'deane',
-    'dearest',
-    'dearly',
-    'debating',
-    'debentures',
-    'debit',
-    'debtors',
-    'decaying',
-    'deceive',
-    'deceived',
-    'decency',
     'decentralization',
-    'deceptive',
-    'decisively',
-    'decks',
-    'declarations',
-    'declares',
-    'declines',
-    'decor',
-    'decorate',
-    'decorating',
-    'decreases',
-    'decreed',
-    'decrees',
-    'deduce',
-    'deduced',
-    'deducted',
     'deduction',
-    'deductions',
-    'deepened',
-    'deepening',
-    'defeating',
-    'deference',
-    'defiance',
-    'defiant',
-    'defiantly',
-    'deficiencies',
-    'deficient',
-    'deficits',
-    'defied',
-    'defries',
-    'defy',
-    'degenerate',
     'deity',
-    'delaying',
-    'delegations',
-    'deletion',
-    'delia',
-    'deliberations',
-    'delicacy',
-    'delicately',
-    'delights',
-    'delinquent',
-    'delivers',
-    'dell',
-    'della',
-    'dem',
-    'demo',
-    'democracies',
     'demon',
-    'demons',
-    'deng',
-    'denim',
-    'denise',
-    'denning',
-    'denominations',
-    'denote',
-    'denotes',
-    'densely',
-    'densities',
-    'dent',
-    'dentists',
-    'departing',
-    'departures',
-    'dependants',
     'depict',
-    'depicting',
-    'depleted',
-    'depletion',
-    'deploy',
-    'deposed',
-    'deprive',
-    'dept',
-    'derivative',
-    'derivatives',
-    'deriving',
-    'dermot',
-    'derrida',
-    'descendant',
-    'deserts',
-    'deserving',
     'designation',
-    'desirability',
-    'desks',
-    'desolate',
-    'despairing',
-    'despatch',
-    'despatched',
-    'despise',
-    'dessert',
-    'destinations',
-    'destroys',
-    'detailing',
-    'detainees',
-    'detectable',
-    'detecting',
-    'detectors',
     'detergent',
-    'deteriorate',
-    'deteriorating',
-    'determinant',
-    'determinants',
-    'deterred',
-    'deterrence',
-    'detriment',
-    'detrimental',
-    'detroit',
-    'deutsche',
-    'devalued',
-    'devastation',
-    'deviance',
-    'deviant',
-    'deviations',
     'devils',
-    'devious',
-    'devising',
-    'devoid',
-    'devolved',
-    'devout',
-    'dew',
-    'diabetics',
-    'dialects',
-    'dialled',
-    'dice',
-    'dicey',
-    'dichotomy',
-    'dickinson',
-    'dictates',
-    'dictator',
     'dictionaries',
-    'didcot',
-    'diego',
-    'dieter',
-    'dieting',
-    'differentials',
-    'diffuse',
-    'diffusion',
-    'digby',
-    'digested',
-    'digestive',
-    'digits',
-    'digs',
-    'dilemmas',
-    'diligence',
-    'dilute',
     'diluted',
-    'dilution',
-    'dimly',
-    'din',
-    'dinah',
-    'dine',
-    'dinghy',
-    'dinners',
-    'dinosaur',
-    'diocesan',
-    'diplomat',
-    'dipping',
-    'director-general',
-    'directorate',
-    'directories',
-    'directs',
     'disagreed',
-    'disagreements',
-    'disappears',
-    'disapproved',
-    'disarray',
-    'disbanded',
-    'discard',
-    'discern',
-    'discernible',
-    'discharges',
-    'disconcerting',
-    'discontinued',
-    'discos',
-    'discounting',
-    'discovers',
-    'discredited',
     'discreetly',
-    'discrepancies',
-    'discrepancy',
-    'discriminatory',
-    'discursive',
-    'disdain',
-    'disgraceful',
-    'disgruntled',
-    'disgusted',
-    'dishonest',
-    'dishonesty',
-    'disillusioned',
-    'disintegration',
-    'dismantled',
-    'dismantling',
-    'dismayed',
     'dismissing',
-    'dismissive',
-    'disobedience',
-    'disordered',
-    'disparate',
-    'disparity',
-    'dispatch',
-    'dispatched',
-    'dispel',
-    'dispense',
-    'dispensed',
-    'dispersal',
-    'disperse',
-    'displacement',
-    'disposing',
-    'disproportionate',
     'disproportionately',
-    'disqualified',
-    'disregarded',
-    'disrupt',
-    'disruptive',
-    'dissemination',
-    'dissenting',
-    'dissertation',
-    'dissident',
-    'dissidents',
-    'dissimilar',
-    'distaste',
-    'distasteful',
-    'distinguishable',
-    'distinguishes',
-    'distort',
     'distortions',
-    'distract',
-    'distraction',
-    'distraught',
-    'distressing',
-    'distributing',
-    'distributions',
-    'distrust',
-    'disused',
-    'ditches',
-    'diver',
-    'divergence',
-    'divergent',
-    'divers',
-    'diversification',
-    'diversified',
     'divides',
-    'divinity',
-    'dizzy',
-    'dj',
-    'dobson',
-    'docklands',
-    'doctrines',
-    'dodge',
-    'dodgy',
-    'dogged',
-    'dogma',
-    'dogmatic',
-    'domes',
-    'dominates',
-    'dominating',
-    'dominic',
     'dominion',
-    'donate',
-    'donegal',
-    'donovan',
-    'doom',
-    'doorways',
-    'dora',
-    'dorcas',
-    'dorian',
-    'doris',
-    'dormant',
-    'dorothea',
-    'dorsal',
-    'dotty',
-    'doubly',
-    'doubtfully',
     'doubting',
-    'dougal',
-    'dough',
-    'dove',
-    'downfall',
-    'downright',
-    'downturn',
-    'drab',
-    'drafts',
-    'dragons',
-    'draining',
-    'drake',
-    'drawback',
-    'drawbacks',
-    'drawled',
-    'dreaded',
     'dreamt',
-    'dreary',
-    'dresden',
-    'dresser',
-    'dressing-gown',
-    'dressing-room',
-    'drifts',
-    'drilled',
-    'drills',
-    'drily',
-    'drinkers',
-    'drip',
-    'driveway',
-    'drizzle',
-    'drown',
-    'drummer',
     'ds',
-    'dss',
-    'ducked',
-    'duct',
-    'duel',
-    'dues',
-    'duff',
-    'dumps',
-    'dun',
-    'dunbar',
-    'dunes',
-    'dung',
-    'dunlop',
-    'duo',
-    'dup',
-    'duplicate',
     'duplication',
-    'durable',
-    'durkheim',
-    'dustbin',
-    'duvet',
-    'dwarfs',
-    'dwell',
-    'dwellers',
-    'dwindling',
-    'dyed',
-    'dyke',
-    'dylan',
-    'dyson',
-    'eagerness',
-    'ealing',
-    'earls',
     'earmarked',
-    'earners',
-    'earnestly',
-    'earns',
-    'earrings',
-    'earthly',
-    'earthquakes',
-    'east-west',
-    'eastbourne',
-    'easton',
-    'eastwards',
-    'eats',
-    'ebb',
-    'echoing',
-    'eclipse',
-    'ecstatic',
     'ecu',
-    'ecuador',
-    'ecumenical',
-    'eddy',
-    'edging',
-    'edie',
-    'edna',
-    'eds',
-    'educate',
-    'educating',
-    'educators',
-    'eerie',
-    'effluent',
-    'effortlessly',
-    'efta',
-    'eg.',
     'egalitarian',
-    'egyptians',
-    'einstein',
-    'eisenhower',
-    'ejected',
-    'elaborated',
-    'elaboration',
-    'elapsed',
-    'elasticity',
-    'elective',
-    'electors',
-    'electromagnetic',
-    'electronically',
-    'elegantly',
-    'elemental',
-    'elena',
     'elf',
-    'elicit',
-    'eligibility',
-    'eliminating',
-    'eline',
-    'elisabeth',
-    'elise',
-    'elites',
-    'elizabethan',
-    'ella',
-    'elland',
-    'elm',
-    'elongated',
-    'eloquent',
-    'elsie',
-    'elton',
     'elves',
-    'ely',
-    'emanating',
-    'embankment',
-    'embargo',
-    'embark',
-    'embarking',
-    'embody',
-    'embraces',
-    'embracing',
-    'embroidered',
-    'embroidery',
-    'embryonic',
-    'emerald',
-    'emergencies',
-    'emerson',
     'emi',
-    'emigrated',
-    'emigration',
-    'eminently',
-    'emitted',
-    'emmie',
-    'emotive',
-    'empathy',
-    'emperors',
-    'emphasising',
-    'emphasizes',
-    'emphasizing',
-    'emphatic',
-    'emphatically',
-    'empires',
-    'empowered',
     'empress',
-    'emptiness',
-    'emptying',
-    'emu',
-    'emulate',
-    'emulation',
-    'enactment',
-    'enamel',
-    'enchanted',
-    'enclave',
-    'enclosing',
-    'encoded',
-    'encoding',
-    'encompass',
-    'encompasses',
-    'endeavours',
     'endemic',
-    'endlessly',
-    'endoscopy',
-    'endowed',
-    'endurance',
-    'endured',
-    'enforceable',
-    'enforcing',
-    'engineered',
-    'english-speaking',
-    'englishmen',
-    'engraved',
-    'engulfed',
-    'enhancement',
-    'enhances',
-    'enhancing',
     'enid',
-    'enigma',
-    'enigmatic',
-    'enlarge',
-    'enlargement',
-    'enlisted',
-    'enquire',
-    'enquiring',
-    'enraged',
-    'enriched',
-    'enrichment',
-    'enrolled',
-    'enrolment',
-    'enshrined',
-    'ensued',
-    'entail',
     'entailed',
-    'enterprising',
-    'entertainments',
-    'enthalpy',
-    'enthusiast',
-    'entirety',
-    'entrances',
-    'entrenched',
-    'entrepreneur',
-    'entrepreneurial',
-    'entropy',
-    'envoy',
-    'ep',
-    'episcopal',
-    'epithelium',
-    'eqn',
     'equaliser',
-    'equate',
-    'equated',
-    'equip',
-    'equities',
-    'equivalence',
-    'equivalents',
-    'eradicate',
-    'eradication',
-    'erection',
-    'ernie',
-    'ernst',
-    'erratic',
-    'erroneous',
-    'eruptions',
-    'es',
     'escalating',
-    'escapes',
-    'espionage',
-    'esrc',
-    'essentials',
-    'est',
-    'establishes',
-    'esteem',
-    'estimating',
-    'estimation',
-    'estonia',
-    'estranged',
-    'eta',
-    'etched',
-    'ethanol',
-    'ethel',
     'ethernet',
-    'ethic',
-    'ethiopian',
-    'ethnicity',
-    'eton',
-    'eubank',
-    'euphoria',
-    'euston',
-    'evade',
-    'evangelical',
-    'evaporated',
-    'evasion',
-    'ever-increasing',
-    'everest',
-    'evils',
-    'evoke',
     'evoked',
-    'evokes',
-    'evolving',
-    'ewes',
-    'exacerbated',
-    'exaggerate',
-    'exaggeration',
-    'examiner',
-    'examiners',
-    'exasperated',
-    'exasperation',
-    'excavated',
-    'excavations',
-    'exceedingly',
-    'excel',
-    'excessively',
     'exchanging',
-    'excitation',
-    'excitedly',
-    'excludes',
-    'excretion',
-    'excursion',
-    'excused',
-    'execute',
-    'executions',
-    'exemplary',
-    'exempted',
-    'exemptions',
-    'exerted',
-    'exhausting',
-    'exhaustive',
-    'exhibiting',
     'exhilarating',
-    'exiled',
-    'exiles',
-    'exodus',
-    'expands',
-    'expanse',
-    'expedient',
-    'expeditions',
-    'expended',
-    'expenditures',
-    'experimentally',
-    'experimentation',
-    'experimenting',
-    'expire',
-    'expired',
-    'expiry',
     'explode',
-    'exploding',
-    'exploits',
-    'exploratory',
-    'explorer',
-    'explores',
-    'expo',
-    'exponent',
-    'exporter',
-    'exporters',
-    'exposition',
-    'expulsion',
-    'extant',
-    'externally',
-    'extracting',
-    'extradition',
     'extras',
-    'extremists',
-    'eyeing',
-    'eyelids',
-    'eyesight',
-    'eyre',
-    'f&uuml;hrer',
-    'f1',
-    'faber',
-    'facade',
-    'face-to-face',
-    'facets',
-    'facilitated',
-    'facilitating',
-    'facsimile',
-    'faculties',
     'faeces',
-    'fag',
-    'faintest',
-    'fairer',
-    'fairfax',
-    'fairs',
-    'falcon',
-    'faldo',
-    'falkirk',
-    'falsely',
-    'faltered',
-    'famed',
-    'familial',
-    'fanciful',
-    'fanny',
-    'farce',
     'fared',
-    'farmed',
-    'farmland',
-    'farnham',
-    'farrell',
-    'fascists',
-    'fashioned',
-    'fashions',
-    'fasting',
-    'fats',
-    'fauna',
-    'favouring',
-    'fbi',
-    'fc',
-    'fe',
-    'feargal',
     'fearing',
-    'fearsome',
-    'feat',
-    'feb',
-    'feeder',
-    'fella',
-    'felled',
-    'femininity',
-    'fer',
-    'ferdinand',
-    'ferns',
-    'ferocious',
-    'ferranti',
-    'ferret',
-    'ferries',
-    'fertiliser',
     'fervour',
-    'festive',
-    'festivities',
-    'fetal',
-    'fetching',
-    'fi',
-    'fiasco',
-    'fiat',
-    'fibrosis',
-    'fiddle',
-    'fiddling',
-    'fidelity',
-    'fiduciary',
-    'fieldwork',
-    'fife',
-    'figs',
     'fiji',
-    'filename',
-    'filtered',
-    'filtering',
-    'filth',
-    'fin',
-    'finale',
-    'finalised',
-    'finalists',
-    'finch',
-    'fingernails',
-    'fingerprints',
-    'fingertips',
-    'finnish',
-    'fins',
-    'fir',
     'firearms',
-    'fireman',
-    'fireworks',
-    'firmer',
-    'first-hand',
-    'first-time',
-    'firth',
-    'fis',
-    'fished',
-    'fisherman',
-    'fitter',
-    'fitzgerald',
-    'fixation',
-    'flagship',
-    'flair',
-    'flake',
     'flamboyant',
-    'flaming',
-    'flanders',
-    'flanks',
-    'flapping',
-    'flaps',
-    'flare',
-    'flares',
-    'flashes',
-    'flask',
-    'flatly',
-    'flatter',
-    'flattered',
-    'flattering',
-    'flaubert',
-    'flavia',
     'flavoured',
-    'flavours',
-    'flaw',
-    'flawed',
-    'flaws',
-    'fleece',
-    'fleeing',
-    'fleeting',
-    'fleets',
-    'flemish',
-    'flex',
-    'flick',
-    'flickering',
-    'flicking',
-    'flimsy',
-    'flinched',
     'fling',
-    'flip',
-    'flipped',
-    'flipping',
-    'floats',
-    'flocks',
-    'floorboards',
-    'flotation',
-    'flourishing',
-    'flowered',
-    'floyd',
-    'fluent',
-    'fluffy',
-    'fluids',
-    'fluorescent',
-    'flurry',
     'flute',
-    'fluttered',
-    'fluttering',
-    'flynn',
-    'fm',
-    'fmln',
-    'fo',
-    'foal',
-    'focussed',
-    'fodder',
-    'foe',
-    'foetus',
-    'folder',
-    'foley',
-    'folklore',
-    'fondant',
     'font',
-    'fonts',
-    'foodstuffs',
-    'fooled',
-    'fools',
-    'footage',
-    'footballer',
-    'footballers',
-    'footpaths',
-    'footwear',
-    'for_fear_of',
-    'forbes',
-    'forbid',
-    'forbidding',
-    'forceful',
-    'forcefully',
     'forcibly',
-    'forearm',
-    'foregoing',
-    'foreground',
-    'foreigner',
-    'foresee',
-    'foreseen',
-    'formalities',
-    'formative',
-    'formulating',
-    'formulations',
-    'forte',
-    'forthwith',
-    'fortified',
-    'forty-eight',
-    'fostered',
     'fostering',
-    'foucault',
-    'founders',
-    'fountains',
-    'four-year',
-    'four-year-old',
-    'fowler',
-    'foxes',
-    'foyer',
-    'fracture',
-    'fractured',
-    'fragmentation',
-    'fragrance',
-    'fragrant',
-    'framing',
-    'franc',
     'franca',
-    'francesca',
-    'frankenstein',
-    'frankish',
-    'franks',
-    'franz',
-    'fraternity',
-    'frau',
-    'fraudulent',
-    'fraught',
-    'freak',
-    'freedoms',
-    'freehold',
-    'freeing',
-    'freelance',
-    'freer',
     'frenzy',
-    'freshwater',
-    'fret',
-    'fri',
-    'friar',
-    'fridays',
-    'friedman',
-    'friendships',
-    'fringes',
-    'fritz',
-    'frivolous',
-    'frock',
-    'frome',
-    'fronts',
-    'frosty',
-    'frs',
     'fruitless',
-    'frustrations',
-    'frying',
-    'fsa',
-    'ft-se',
-    'fujitsu',
-    'fulham',
-    'full-back',
-    'full-scale',
-    'fullest',
-    'fullness',
-    'fumbled',
-    'functionalist',
-    'functionality',
-    'fund-raising',
-    'fundamentalist',
     'fundholding',
-    'fundraising',
-    'funerals',
-    'fungi',
-    'fungus',
-    'furnace',
-    'furnish',
-    'furnishing',
-    'furthest',
-    'fuse',
-    'fused',
-    'fuselage',
-    'futile',
-    'ga',
-    'gable',
-    'gail',
     'gaily',
-    'galaxies',
-    'galileo',
-    'gallagher',
-    'gallant',
-    'galley',
-    'gallon',
-    'gallop',
-    'galloway',
-    'galway',
-    'gamma',
-    'gaol',
-    'gaping',
-    'garages',
-    'garbage',
-    'gardiner',
     'gardner',
-    'garland',
-    'garrett',
-    'garvey',
-    'gascoigne',
-    'gasp',
-    'gasping',
-    'gastritis',
-    'gatherings',
-    'gatwick',
-    'gaunt',
-    'gaza',
-    'gazette',
-    'gazza',
-    'gazzer',
-    'gdr',
     'ge',
-    'gearbox',
-    'gearing',
-    'gears',
-    'gec',
-    'gedanken',
-    'gee',
-    'geese',
-    'gem',
-    'gemma',
-    'gems',
-    'gen',
-    'generalised',
-    'generality',
-    'generalization',
-    'generalized',
     'generators',
-    'genetically',
-    'genetics',
-    'genus',
-    'geographers',
-    'geographic',
-    'geographically',
-    'geologists',
-    'georges',
-    'georgina',
-    'gesner',
-    'ghana',
-    'ghostly',
-    'gibbs',
-    'gibraltar',
-    'gigantic',
     'giggle',
-    'giggled',
-    'giggling',
-    'gigs',
-    'gilded',
-    'gilt',
-    'gilts',
-    'gingerly',
-    'giovanni',
-    'gipsy',
-    'gis',
-    'glacial',
-    'glacier',
-    'gladly',
-    'gladstone',
-    'glamorgan',
     'gland',
-    'glands',
-    'glaring',
-    'glastonbury',
-    'glazing',
-    'glc',
-    'gleam',
-    'gleamed',
-    'glenn',
-    'glide',
-    'gliding',
-    'glimmer',
-    'glimpses',
-    'glint',
-    'glistening',
-    'glitter',
     'glittered',
-    'gloss',
-    'glove',
-    'glowed',
-    'glued',
-    'glynn',
-    'gm',
-    'go-ahead',
-    'goblins',
-    'godwin',
-    'gogh',
-    'goin\'',
-    'goldberg',
-    'goldfish',
-    'golding',
-    'goldsmith',
     'goldsmiths',
-    'golfer',
-    'golfers',
-    'golfing',
-    'good-looking',
-    'goodies',
-    'goodman',
-    'goodwin',
-    'goody',
-    'gore',
-    'gorge',
-    'gorman',
-    'gosh',
-    'gospels',
-    'gough',
-    'gower',
     'grabbing',
-    'grabs',
-    'gracefully',
-    'grading',
-    'graffiti',
-    'gram',
-    'gramophone',
-    'grampian',
-    'grams',
-    'granada',
-    'grandad',
-    'granddad',
-    'granddaughter',
-    'grandeur',
-    'grandiose',
-    'granules',
     'grape',
-    'graphically',
-    'graphs',
-    'grasping',
-    'grasses',
-    'grassland',
-    'grassy',
-    'grate',
-    'gratefully',
-    'gravely',
-    'graveyard',
-    'gravy',
-    'grazed',
-    'grease',
-    'greasy',
-    'greatness',
     'greenland',
-    'greenwich',
-    'greenwood',
-    'greetings',
-    'grievance',
-    'grieving',
-    'grievous',
-    'griffin',
-    'griffith',
-    'grimma',
-    'grimsby',
-    'grind',
-    'grit',
-    'gritted',
-    'groan',
-    'groin',
     'grossly',
-    'grosvenor',
-    'grotesque',
-    'grounded',
-    'groundwater',
-    'groves',
-    'growers',
-    'grown-up',
-    'grown_up',
-    'grubby',
-    'grumbled',
-    'grunted',
-    'guaranteeing',
-    'guarding',
-    'guatemala',
-    'guessing',
     'guideline',
-    'guildford',
-    'guilds',
-    'guineas',
-    'guise',
-    'gulls',
-    'gully',
-    'gulped',
-    'gum',
-    'gummer',
-    'gunman',
-    'gunmen',
-    'gunners',
-    'gurder',
-    'gutter',
-    'gwen',
     'gwynedd',
-    'gym',
-    'gypsies',
-    'gypsy',
-    'habitual',
-    'hack',
-    'hacking',
-    'hackney',
-    'haemoglobin',
-    'haemorrhage',
-    'hail',
-    'haircut',
-    'hairdresser',
-    'hairy',
-    'haiti',
-    'hal',
     'hale',
-    'half-hour',
-    'half-past',
-    'halliday',
-    'halling',
-    'halves',
-    'hamburg',
-    'hamish',
-    'hamlets',
-    'hammered',
-    'hammering',
-    'hammersmith',
-    'hampered',
-    'hampstead',
-    'hampton',
-    'hangar',
     'hangover',
-    'hank',
-    'hanson',
-    'hants',
-    'haphazard',
-    'happenings',
-    'happiest',
-    'harassed',
-    'harbours',
-    'harden',
-    'harding',
-    'hardness',
-    'harley',
-    'harmonic',
-    'harmonious',
-    'harp',
     'harrods',
-    'harrow',
-    'harshly',
-    'hartley',
-    'harwell',
-    'harwich',
-    'hasan',
-    'hassle',
-    'hastened',
-    'hasty',
-    'hat-trick',
-    'hatched',
-    'hates',
-    'hatfield',
-    'hath',
-    'hating',
     'hatton',
-    'haulage',
-    'hauling',
-    'haunt',
-    'haunting',
-    'haunts',
-    'havel',
-    'havoc',
-    'hawaii',
-    'hawk',
-    'hayes',
-    'haynes',
-    'hayward',
-    'haze',
-    'hazy',
-    'hcima',
     'he/she',
-    'headaches',
-    'headland',
-    'headlights',
-    'headlong',
-    'headmistress',
-    'headphones',
-    'headteacher',
-    'headway',
-    'heady',
-    'healed',
-    'healey',
-    'healthcare',
-    'healthier',
-    'heaps',
-    'hearer',
     'heartbeat',
-    'hearth',
-    'hearty',
-    'heaters',
-    'heathcliff',
-    'heaved',
-    'heavenly',
-    'heaviest',
-    'heaving',
-    'hebrides',
-    'hedgehog',
-    'hedgerows',
-    'heed',
-    'hefty',
-    'hegel',
-    'hegemony',
     'heirs',
-    'helena',
-    'helens',
-    'helm',
-    'helmets',
-    'helmut',
-    'helper',
-    'helpers',
-    'helplessness',
-    'helpline',
-    'helsinki',
-    'hem',
-    'henceforth',
-    'hencke',
-    'hendry',
-    'hennessy',
     'henri',
-    'heparin',
-    'hepatic',
-    'heralded',
-    'herb',
-    'herbal',
-    'hercules',
-    'herds',
-    'hereby',
-    'herefordshire',
-    'heroine',
-    'heron',
-    'herring',
-    'hesitant',
-    'hess',
-    'heterogeneous',
     'heterosexual',
-    'hewitt',
-    'heyday',
-    'hi-fi',
-    'hick',
-    'hicks',
-    'hides',
-    'hierarchies',
-    'high-end',
-    'high-level',
-    'high-pitched',
-    'high-quality',
-    'high-speed',
-    'high-tech',
-    'highbury',
-    'highlighting',
     'highness',
-    'hilarious',
-    'hillsborough',
-    'hind',
-    'hinder',
-    'hinges',
-    'hirst',
-    'his/her',
-    'hiss',
-    'hissing',
-    'histamine',
-    'histological',
-    'hitachi',
-    'hitch',
-    'hive',
-    'hmi',
     'hms',
-    'hmso',
-    'hoarse',
-    'hobbes',
-    'hobbies',
-    'hobbs',
-    'hodge',
-    'hoffman',
-    'hogg',
-    'hoisted',
-    'holistic',
-    'holloway',
-    'holman',
-    'holt',
-    'home-made',
-    'homelessness',
     'homely',
-    'homosexuals',
-    'hon',
-    'honda',
-    'hooded',
-    'hooker',
-    'hooligans',
-    'hoomey',
-    'hooper',
-    'hoover',
-    'hooves',
-    'hopper',
-    'hopping',
-    'hops',
-    'horace',
-    'hordes',
     'horizontally',
-    'hormones',
-    'horne',
-    'horrendous',
-    'horribly',
-    'horrid',
-    'horsemen',
-    'horticultural',
-    'horton',
-    'hose',
-    'hospice',
-    'hosted',
-    'hostels',
-    'hostess',
-    'hostilities',
-    'hotly',
     'houghton',
-    'hound',
-    'hounds',
-    'hourly',
-    'householders',
-    'housekeeping',
-    'housewives',
-    'houston',
-    'hove',
-    'hovered',
-    'howell',
-    'howling',
-    'hub',
-    'huddersfield',
-    'huddled',
-    'hug',
     'hugely',
-    'hugging',
-    'hum',
-    'humane',
-    'humber',
-    'humberside',
-    'hume',
-    'humidity',
-    'humiliated',
-    'humiliating',
-    'humility',
-    'humming',
-    'humphrey',
-    'hunched',
-    'hurdles',
-    'hurrying',
     'hurst',
-    'hush',
-    'hushed',
-    'hutchinson',
-    'huts',
-    'hutton',
-    'huy',
-    'hvk',
-    'hydraulic',
-    'hymn',
-    'hymns',
-    'hype',
-    'hypertension',
-    'hypnosis',
-    'hypocrisy',
-    'hysteria',
     'iago',
-    'ianthe',
-    'ibid',
-    'ibid.',
-    'ibrahim',
-    'ibrox',
-    'ice-cream',
-    'iceberg',
-    'icons',
-    'idealism',
-    'identities',
-    'ideologies',
-    'idiom',
-    'idiosyncratic',
-    'idly',
-    'idol',
     'idyllic',
-    'ie.',
-    'igg',
-    'ignition',
-    'ill-health',
-    'illegitimate',
-    'illicit',
-    'illiterate',
-    'illogical',
-    'ills',
-    'illuminate',
-    'illuminating',
-    'illumination',
-    'illusions',
-    'illustrating',
-    'illustrious',
     'ilp',
-    'im',
-    'imitate',
-    'immersed',
-    'immersion',
-    'immigrant',
-    'immoral',
-    'immortal',
-    'impacts',
-    'impairment',
-    'impartial',
-    'impeccable',
-    'impedance',
-    'imperfect',
-    'implements',
-    'importing',
     'imposes',
-    'impossibility',
-    'impotent',
-    'impoverished',
-    'impractical',
-    'imprint',
-    'improbable',
-    'improper',
-    'improvised',
-    'impulses',
-    'in-depth',
-    'in.',
-    'in_aid_of',
-    'in_answer_to',
-    'in_brief',
-    'in_case_of',
     'in_possession_of',
-    'in_proportion_to',
-    'in_pursuit_of',
-    'in_regard_to',
-    'in_situ',
-    'in_the_main',
-    'in_vitro',
-    'in_vivo',
-    'inaccessible',
-    'inactive',
-    'inadequacies',
-    'inadequacy',
-    'inadvertently',
-    'inaugural',
-    'inaugurated',
-    'incarnation',
     'inception',
-    'incest',
-    'incidental',
-    'incompetence',
-    'incompetent',
-    'incomprehensible',
-    'inconceivable',
-    'inconclusive',
-    'inconsistencies',
-    'inconsistency',
-    'incontinence',
-    'inconvenient',
-    'incorrectly',
-    'incremental',
-    'incubated',
-    'incubation',
     'incur',
-    'indebted',
-    'indecent',
-    'indefinite',
-    'independents',
-    'indexed',
-    'indexes',
-    'indices',
-    'indictment',
-    'indie',
-    'indignant',
-    'indistinguishable',
-    'individualism',
-    'individuality',
-    'indonesian',
-    'indulged',
     'indulgence',
-    'indulging',
-    'industrialisation',
-    'industrialised',
-    'industrialists',
-    'industrialization',
-    'industrialized',
-    'inefficiency',
-    'inert',
-    'inertia',
-    'inescapable',
-    'inexorably',
-    'inexpensive',
-    'inexplicable',
-    'inextricably',
-    'infamous',
     'infarction',
-    'infer',
-    'inferences',
-    'inferred',
-    'infinity',
-    'inflamed',
-    'inflated',
-    'inflationary',
-    'inflexible',
-    'inflict',
-    'influx',
-    'informally',
-    'informants',
-    'informix',
-    'informs',
-    'infrared',
     'infrequent',
-    'infrequently',
-    'infringement',
-    'infuriated',
-    'ingenuity',
-    'inhabit',
-    'inherit',
-    'inhibitors',
-    'inhibitory',
-    'initials',
-    'initiating',
-    'inject',
-    'injecting',
-    'injections',
-    'injunctions',
-    'innocently',
     'inns',
-    'innumerable',
-    'inorganic',
-    'inquired',
-    'insane',
-    'inscribed',
-    'inscription',
-    'insecure',
-    'insecurity',
-    'insensitive',
-    'inseparable',
-    'inserting',
-    'insertion',
-    'insiders',
-    'insignia',
-    'insistent',
     'insofar_as',
-    'insolvent',
-    'inspecting',
-    'inspections',
-    'inspiring',
-    'instalment',
-    'instalments',
-    'instantaneous',
-    'instituted',
-    'instruct',
-    'instructive',
-    'instructors',
-    'insulated',
-    'insults',
-    'insure',
-    'insurer',
     'integer',
-    'intellectually',
-    'intelligentsia',
-    'intelligible',
-    'intensify',
-    'intentional',
-    'intentionally',
-    'inter',
-    'inter-war',
-    'inter_alia',
-    'interacting',
-    'intercept',
-    'intercepted',
-    'interchange',
-    'intercity',
-    'interdependence',
     'interdisciplinary',
-    'interfered',
-    'interfering',
-    'intergovernmental',
-    'interlocking',
-    'intermediaries',
-    'intermediary',
-    'intermittent',
-    'internationals',
-    'interpersonal',
-    'interplay',
-    'interpreters',
-    'interrelated',
-    'interrogation',
-    'interrupting',
-    'intersection',
     'interspersed',
-    'interviewers',
-    'intestine',
-    'intimately',
-    'intimidated',
-    'intimidating',
-    'intimidation',
-    'into_line_with',
-    'intolerance',
-    'intravenous',
-    'intrigue',
-    'intrinsically',
-    'introductions',
-    'intruder',
-    'intrusive',
-    'invade',
     'invaders',
-    'invading',
-    'invent',
-    'inventions',
-    'inventive',
-    'inventor',
-    'inverness',
-    'inverse',
-    'inversion',
-    'invertebrates',
-    'investigates',
-    'investigative',
-    'investigator',
-    'invitations',
-    'invites',
-    'invoices',
     'invoke',
-    'involuntarily',
-    'involuntary',
-    'inwardly',
-    'inwards',
-    'iq',
-    'ir',
-    'irina',
-    'irishman',
-    'ironing',
-    'irons',
-    'irregularities',
-    'irreversible',
-    'irrigation',
-    'irritable',
-    'irritably',
     'irvine',
-    'irwin',
-    'isabella',
-    'islanders',
-    'islay',
-    'islington',
-    'isotope',
-    'israelis',
-    'istanbul',
-    'itinerary',
-    'itn',
-    'ivor',
-    'ix',
-    'jacobite',
-    'jacqueline',
-    'jacqui',
     'jade',
-    'jagged',
-    'jamaican',
-    'jamieson',
-    'jammed',
-    'janice',
-    'jars',
-    'jarvis',
-    'java',
-    'jean-paul',
-    'jean-pierre',
-    'jed',
-    'jefferson',
-    'jehan',
-    'jekyll',
-    'jen',
     'jeopardy',
-    'jerk',
-    'jessamy',
-    'jessie',
-    'jetty',
-    'jewel',
-    'jezrael',
-    'jigsaw',
-    'jinny',
-    'jobless',
-    'jock',
-    'jockeys',
-    'joey',
-    'jogging',
-    'johannesburg',
-    'johns',
     'johnstone',
-    'joked',
-    'jos&eacute',
-    'jose',
-    'josh',
-    'josie',
-    'joyful',
-    'joys',
-    'ju',
-    'judaism',
-    'juices',
-    'jules',
-    'juniors',
-    'juniper',
-    'jupiter',
-    'jurassic',
     'jurisdictions',
-    'jurnet',
-    'jus',
-    'justifiable',
-    'justifies',
-    'justifying',
-    'justin',
-    'kabul',
-    'kaifu',
-    'kane',
-    'kant',
-    'karajan',
-    'karate',
-    'karpov',
-    'kashmir',
-    'kasparov',
     'kath',
-    'kathy',
-    'kazakhstan',
-    'kb',
-    'keating',
-    'keenly',
-    'keepers',
-    'kendall',
-    'kerb',
-    'kernel',
-    'kerry',
-    'kev',
-    'keyword',
-    'khmer',
-    'khrushchev',
-    'kidding',
     'kidnap',
-    'kidnapped',
-    'kidnapping',
-    'kidneys',
-    'kiev',
-    'killers',
-    'kilometre',
-    'kinase',
-    'kinetic',
-    'kingdoms',
-    'kingfisher',
-    'kingsley',
-    'kingston',
-    'kirkby',
-    'kirov',
-    'kirsty',
     'kites',
-    'kitten',
-    'kitty',
-    'klaus',
-    'klein',
-    'knack',
-    'kneeling',
-    'knickers',
-    'knitters',
-    'knob',
-    'knocks',
-    'knotted',
-    'know-how',
-    'knowingly',
-    'knowledgeable',
-    'knox',
     'knuckles',
-    'koi',
-    'kosovo',
-    'kremlin',
-    'kurds',
-    'kurt',
-    'kuwaiti',
-    'kyle',
-    'l&eacute;onie',
-    'laboured',
-    'labourer',
-    'labouring',
-    'labours',
-    'labov',
-    'labyrinth',
-    'laced',
     'lachlan',
-    'ladders',
-    'laden',
-    'lading',
-    'lag',
-    'lain',
-    'laing',
-    'laird',
-    'lais',
-    'laity',
-    'lakeside',
-    'lambeth',
-    'lame',
-    'lan',
-    'lance',
-    'landfill',
     'landings',
-    'landlady',
-    'landmarks',
-    'landowner',
-    'langbaurgh',
-    'langley',
-    'lantern',
-    'laps',
-    'lapse',
-    'lapsed',
-    'lark',
-    'larkin',
-    'las',
-    'lasers',
-    'lashed',
-    'lashes',
     'last-minute',
-    'latch',
-    'latitude',
-    'latterly',
-    'lattice',
-    'latvia',
-    'launches',
-    'laurence',
-    'lautro',
-    'lawns',
-    'lawton',
-    'lazily',
-    'ldcs',
-    'ldp',
-    'leaking',
-    'leaks',
     'leaps',
-    'lear',
-    'leased',
-    'leasing',
-    'leavers',
-    'ledge',
-    'ledger',
-    'legality',
-    'legends',
-    'legislators',
-    'legitimately',
-    'leila',
-    'leisurely',
-    'lemonade',
-    'lender',
-    'lends',
     'leningrad',
-    'lennie',
-    'lennox',
-    'leopard',
-    'leopold',
-    'lesbians',
-    'lesion',
-    'lesley',
-    'lessen',
-    'lester',
-    'lettuce',
-    'leverage',
-    'levers',
-    'levi',
-    'levied',
-    'lewes',
     'leyland',
-    'leys',
-    'liar',
-    'lib',
-    'liberalisation',
-    'liberalization',
-    'liberated',
-    'liberia',
-    'license',
-    'lick',
-    'licked',
-    'licking',
-    'lids',
-    'life-style',
-    'lifeless',
-    'lifelong',
     'lifestyles',
-    'lighted',
-    'lighthouse',
-    'likeness',
-    'lilies',
-    'lilley',
-    'lima',
-    'lindsay',
-    'lineage',
-    'lineker',
-    'liner',
-    'linfield',
-    'linger',
-    'lingered',
-    'linguists',
-    'linkage',
     'linkages',
-    'lionel',
-    'lipid',
-    'lipstick',
-    'liquids',
-    'lisbon',
-    'lisburn',
-    'lissa',
-    'listens',
-    'listings',
-    'literate',
-    'lithuanian',
-    'littered',
-    'littlewoods',
-    'liturgical',
-    'liturgy',
     'livelihood',
-    'livery',
-    'living-room',
-    'livingstone',
-    'liza',
-    'lizzie',
-    'lizzy',
-    'lj',
-    'llanelli',
-    'lloyds',
-    'lms',
-    'lo',
-    'lobster',
-    'localised',
-    'locating',
-    'locker',
     'lockerbie',
-    'lodging',
-    'lodgings',
-    'lofty',
-    'logan',
-    'lombard',
-    'london-based',
-    'londonderry',
-    'londoners',
-    'long-distance',
-    'longer-term',
-    'longitudinal',
-    'longman',
-    'loom',
-    'loomed',
-    'looming',
     'looms',
-    'loops',
-    'loosen',
-    'loosened',
-    'lorna',
-    'lorraine',
-    'lorton',
-    'loser',
-    'losers',
-    'lothar',
-    'lottery',
-    'lough',
-    'loughborough',
-    'louisa',
-    'lousy',
-    'lovingly',
     'low-cost',
-    'low-level',
-    'lowland',
-    'lowly',
-    'loyalists',
-    'loyalties',
-    'lt',
-    'ltp',
-    'lucenzo',
-    'lucia',
-    'lucien',
-    'ludens',
-    'luis',
-    'luminous',
-    'lumps',
-    'lunar',
     'lunatic',
-    'luncheon',
-    'lunches',
-    'lurched',
-    'lure',
-    'lured',
-    'lurking',
-    'luther',
-    'luxuries',
-    'lyle',
-    'lymphocytes',
-    'lymphoma',
-    'lyn',
-    'lynch',
-    'lynda',
-    'lyon',
     'lyric',
-    'lyrical',
-    'm&uuml;ller',
-    'mabel',
-    'macarthur',
-    'macbeth',
-    'macedonia',
-    'macho',
-    'mackay',
-    'mackenzie',
-    'maclean',
-    'macleod',
-    'macroeconomic',
-    'mademoiselle',
-    'madge',
-    'mafia',
     'magee',
-    'maggot',
-    'magician',
-    'magnesium',
-    'magnet',
-    'magnus',
-    'mahmoud',
-    'maids',
-    'maidstone',
-    'mailing',
-    'maine',
-    'mainframes',
-    'maisie',
-    'maize',
-    'maj.-gen',
-    'majestic',
     'makeshift',
-    'mala',
-    'malaria',
-    'malawi',
-    'malaysian',
-    'malice',
-    'malicious',
-    'malignant',
-    'malik',
-    'mall',
-    'malone',
-    'malt',
-    'maltravers',
-    'malvern',
-    'mammal',
-    'mammalian',
     'man-made',
-    'manageable',
-    'mandarin',
-    'mandeville',
-    'manhattan',
-    'manic',
-    'manifested',
-    'manila',
-    'manipulating',
-    'manned',
-    'manning',
-    'manoeuvres',
-    'mansfield',
-    'mantelpiece',
-    'manually',
-    'manuals',
     'manuel',
-    'manufactures',
-    'manure',
-    'manville',
-    'mao',
-    'maple',
-    'mapped',
-    'mar',
-    'marches',
-    'marcos',
-    'margarine',
-    'marianne',
-    'marilyn',
-    'marines',
-    'marius',
-    'marketplace',
     'markham',
-    'markings',
-    'marlborough',
-    'marmalade',
-    'marquee',
-    'marquis',
-    'marr',
-    'marred',
-    'marrow',
-    'marton',
-    'martyn',
-    'martyr',
-    'marxists',
-    'mas',
-    'masai',
-    'masculinity',
     'masonry',
-    'massed',
-    'massively',
-    'mastered',
-    'masterpiece',
-    'mastery',
-    'materialism',
-    'materially',
-    'matey',
-    'matisse',
-    'matrices',
-    'matrimonial',
-    'matron',
-    'mats',
-    'matthews',
-    'maura',
     'mauve',
-    'mavis',
-    'maximize',
-    'mayhew',
-    'mc',
-    'mcc',
-    'mccarthy',
-    'mckenzie',
-    'mclean',
-    'mcleish',
-    'mcmahon',
-    'md',
-    'mead',
-    'measles',
-    'measurable',
-    'mechanic',
     'mechanically',
-    'mediate',
-    'mediation',
-    'medicinal',
-    'medium-sized',
-    'mel',
-    'melancholy',
-    'melbourne',
-    'mellow',
-    'melodic',
-    'membranes',
-    'memo',
-    'menacing',
-    'mend',
-    'meningitis',
-    'menopause',
     'mentality',
-    'mentor',
-    'menzies',
-    'mercantile',
-    'mercer',
-    'merchandise',
-    'mercia',
-    'merging',
-    'mersey',
-    'merton',
-    'mervyn',
-    'messiah',
-    'messing',
-    'messrs',
-    'messy',
-    'metabolic',
     'metaphors',
-    'metaphysical',
-    'meteorological',
-    'meters',
-    'methane',
-    'meticulous',
-    'metric',
-    'metro',
-    'metropolis',
-    'meyer',
-    'mi',
-    'mi5',
-    'mi6',
-    'miami',
-    'michele',
-    'micky',
     'microcomputers',
-    'microprocessor',
-    'microscopic',
-    'mid-1970s',
-    'mid-1980s',
-    'middleton',
-    'midi',
-    'midsummer',
-    'midway',
-    'midweek',
-    'midwife',
-    'migrant',
-    'migrants',
-    'migrate',
-    'mikhail',
-    'milburn',
     'mildred',
-    'mileage',
-    'militancy',
-    'militants',
-    'milking',
-    'milky',
-    'millennium',
-    'millie',
-    'millimetres',
-    'milling',
-    'millionaire',
-    'millwall',
-    'mimic',
-    'mince',
-    'mindless',
-    'miner',
     'mingled',
-    'minibus',
-    'minimize',
-    'mink',
-    'minoan',
-    'minster',
-    'miraculous',
-    'miraculously',
-    'miriam',
-    'mirrored',
-    'miscellaneous',
-    'mischief',
-    'mischievous',
-    'misconduct',
-    'miserably',
-    'misfortune',
     'misgivings',
-    'misguided',
-    'misled',
-    'misplaced',
-    'misrepresentation',
-    'missionaries',
-    'mistakenly',
-    'misty',
-    'misunderstood',
-    'mitch',
-    'mixtures',
-    'mmol/l',
-    'moan',
-    'moaned',
-    'moaning',
-    'moat',
     'mocked',
-    'mockery',
-    'mod',
-    'modem',
-    'moderation',
-    'modernisation',
-    'modernism',
-    'modernist',
-    'modernity',
-    'modernization',
-    'modestly',
-    'modesty',
-    'modifying',
-    'modulus',
-    'mohamed',
-    'mohammad',
     'moi',
-    'molar',
-    'moles',
-    'molten',
-    'mom',
-    'momentary',
-    'momentous',
-    'mona',
-    'monaco',
-    'monarchs',
-    'monasteries',
-    'mondays',
-    'monde',
-    'mongolia',
-    'monica',
-    'monies',
     'monoclonal',
-    'monotonous',
-    'monoxide',
-    'monstrous',
-    'monte',
-    'montrose',
-    'monumental',
-    'moods',
-    'moody',
-    'moored',
-    'mop',
-    'morals',
-    'morbidity',
-    'moroccan',
-    'morphological',
-    'morphology',
     'mortgagee',
-    'mortuary',
-    'moslems',
-    'mosque',
-    'mosquito',
-    'moth',
-    'mother-in-law',
-    'motherhood',
-    'motherwell',
-    'moths',
-    'motifs',
-    'motility',
-    'motionless',
-    'motivate',
-    'motivating',
-    'motivations',
     'motorbike',
-    'motorcycle',
-    'motorist',
-    'motorola',
-    'motorways',
-    'motto',
-    'moulding',
-    'moulds',
-    'mounds',
-    'mountaineering',
-    'mountainous',
-    'mountbatten',
-    'mounts',
-    'mousse',
-    'mouthful',
-    'mowbray',
     'mozambique',
-    'mph',
-    'mrna',
-    'msc',
-    'mu',
-    'muck',
-    'mucus',
-    'muddle',
-    'muddled',
-    'mugs',
-    'muhammad',
-    'multilateral',
-    'multinationals',
-    'multiplication',
-    'multiplicity',
-    'multiplier',
     'multiplying',
-    'mums',
-    'munro',
-    'murderers',
-    'murderous',
-    'murky',
-    'murmur',
-    'mused',
-    'mushroom',
-    'mussolini',
-    'muster',
-    'mute',
-    'muted',
-    'myeloski',
-    'myocardial',
-    'myriad',
     'mysteriously',
-    'mystic',
-    'mythical',
-    'mythology',
-    'na&iuml;ve',
-    'nagging',
-    'nah',
-    'nailed',
-    'nairobi',
-    'nam',
-    'naomi',
-    'napier',
-    'naples',
-    'nappies',
-    'narrator',
-    'narrowing',
     'nasa',
-    'nasal',
-    'nash',
-    'nationalisation',
-    'nationalised',
-    'nationalities',
-    'nationalization',
-    'nationalized',
-    'natives',
-    'naturalist',
-    'nausea',
-    'navigator',
-    'nay',
-    'naylor',
-    'ncc',
-    'ne',
     'nearer_to',
-    'nearing',
-    'neath',
-    'necessitated',
-    'necessities',
-    'necklace',
-    'ned',
-    'needy',
-    'negatively',
-    'negligent',
-    'negotiators',
-    'neighbourhoods',
-    'neill',
-    'nell',
-    'nellie',
-    'neon',
     'nepal',
-    'nervousness',
-    'nesting',
-    'nether',
-    'netting',
-    'networked',
-    'neurons',
-    'neurotic',
-    'neutron',
-    'neutrons',
-    'new-found',
-    'newark',
-    'newborn',
-    'newbury',
-    'newest',
-    'newham',
     'newmarket',
-    'newport',
-    'newry',
-    'nez',
-    'niall',
-    'nicandra',
-    'nicer',
-    'nicked',
-    'nickname',
-    'nicknamed',
-    'nietzsche',
-    'nigerian',
-    'nightclub',
-    'nightly',
-    'nightmares',
-    'niki',
     'nile',
-    'nip',
-    'nipples',
-    'nissan',
-    'nixdorf',
-    'nixon',
-    'noah',
-    'nobel',
-    'nobles',
-    'nocturnal',
-    'noisily',
-    'nolan',
-    'nomadic',
-    'nomes',
-    'nominally',
-    'nominate',
     'nominations',
-    'non-aligned',
-    'non-executive',
-    'non-existent',
-    'non-stop',
-    'non-verbal',
-    'nonconformist',
-    'noreen',
-    'noriega',
-    'normality',
-    'normative',
-    'norris',
-    'north-south',
-    'northallerton',
-    'northeast',
-    'northumbria',
     'northwards',
-    'northwest',
-    'nos.',
-    'nostalgic',
-    'notebooks',
-    'noteworthy',
-    'noticeably',
-    'notification',
-    'notify',
-    'notional',
-    'notts',
-    'nouns',
-    'nova',
-    'novelists',
-    'novices',
-    'nowt',
     'nra',
-    'nuclei',
-    'nude',
-    'nudged',
-    'null',
-    'numb',
-    'numbering',
-    'numeric',
-    'nursed',
-    'nurseries',
-    'nurtured',
-    'o\'connor',
-    'o\'hara',
-    'oaks',
-    'oasis',
-    'oats',
     'obeyed',
-    'obituary',
-    'objectively',
-    'obligatory',
-    'oblige',
-    'oblique',
-    'oblivion',
-    'oblivious',
-    'obscenity',
-    'obscurity',
-    'observable',
-    'observance',
-    'observatory',
-    'observes',
-    'obsessive',
-    'obsolete',
     'obtainable',
-    'obtains',
-    'occult',
-    'occupancy',
-    'occupant',
-    'occupier',
-    'occupies',
-    'occurrences',
-    'oceanic',
-    'octave',
-    'odours',
-    'oed',
-    'oem',
-    'oesophagitis',
-    'off_of',
-    'offa',
     'offend',
-    'offeror',
-    'offside',
-    'ohio',
-    'oily',
-    'old_fashioned',
-    'oldfield',
-    'oligonucleotide',
-    'olives',
-    'olivetti',
-    'olivia',
-    'olympia',
-    'omally',
-    'ombudsman',
-    'ominous',
-    'omissions',
     'on-going',
-    'on-line',
-    'once_and_for_all',
-    'one-man',
-    'one-time',
-    'one-to-one',
-    'one-way',
-    'one-year',
-    'onerous',
-    'ono',
-    'onslaught',
-    'ontario',
-    'ontological',
-    'onus',
-    'onward',
-    'opaque',
     'opec',
-    'open-ended',
-    'opener',
-    'openings',
-    'operas',
-    'operative',
-    'oppressed',
-    'oranges',
-    'orbital',
-    'orbits',
-    'orc',
-    'orchestral',
-    'orcs',
-    'ordained',
-    'ordinarily',
-    'ordination',
     'ordnance',
-    'orient',
-    'orientated',
-    'originality',
-    'originals',
-    'originate',
-    'originating',
-    'orlando',
-    'orleans',
-    'ornament',
-    'ornamental',
-    'ornaments',
-    'ornate',
-    'orphans',
-    'orthodoxy',
-    'orwell',
     'os',
-    'osborne',
-    'osf',
-    'osf/1',
-    'oswald',
-    'otley',
-    'ottoman',
-    'ounce',
-    'ousted',
-    'out_of_date',
-    'outbreaks',
-    'outburst',
-    'outcry',
-    'outdated',
-    'outdoors',
-    'outfits',
     'outings',
-    'outlay',
-    'outlining',
-    'outnumbered',
-    'outpatient',
-    'outspoken',
-    'outstretched',
-    'outweigh',
-    'overalls',
-    'overcame',
-    'overcoat',
-    'overcoming',
-    'overcrowded',
-    'overcrowding',
-    'overdose',
-    'overdraft',
     'overdrive',
-    'overdue',
-    'overflow',
-    'overgrown',
-    'overhaul',
-    'overheads',
-    'overheard',
-    'overlook',
-    'override',
-    'oversee',
-    'overshadowed',
-    'overtake',
-    'overtaken',
-    'overtly',
-    'overtones',
-    'overturned',
     'overweight',
-    'ow',
-    'owing',
-    'owning',
-    'oxfam',
-    'oxide',
-    'oxides',
-    'oyster',
-    'p&amp;o',
-    'p&eacute;rez',
-    'p&lt;0.001',
-    'p&lt;0.01',
-    'p&lt;0.05',
-    'pacing',
-    'packaged',
-    'paddington',
     'paddle',
-    'paddling',
-    'paddock',
-    'paired',
-    'pakistani',
-    'palaces',
-    'palazzo',
-    'palette',
-    'pals',
-    'pamphlet',
-    'pamphlets',
-    'pancreatitis',
-    'panelled',
-    'panicked',
-    'panorama',
-    'pans',
     'panting',
-    'pantomime',
-    'papacy',
-    'papillae',
-    'para.',
-    'parable',
-    'paradoxical',
-    'paraffin',
-    'paramilitary',
-    'paranoid',
-    'parapet',
-    'parasite',
-    'parasitic',
-    'parchment',
-    'parenthood',
-    'parenting',
     'parishioners',
-    'parisian',
-    'parity',
-    'parkin',
-    'parliaments',
-    'parochial',
-    'parody',
-    'parole',
-    'parrot',
-    'parry',
-    'parsley',
-    'parson',
-    'partisan',
-    'pas',
-    'passers-by',
-    'passionately',
     'passions',
-    'passports',
-    'password',
-    'pastel',
-    'pastime',
-    'pastor',
-    'pastures',
-    'patchy',
-    'patel',
-    'patented',
-    'patents',
-    'paterson',
-    'pathogenesis',
-    'pathological',
-    'pathologist',
-    'pathology',
     'pathways',
-    'patriarchal',
-    'patriotism',
-    'patrols',
-    'patronising',
-    'patterned',
-    'patterning',
-    'patterson',
-    'pauses',
-    'pausing',
-    'paved',
-    'pawn',
-    'paws',
-    'payers',
-    'payne',
-    'payroll',
     'pcr',
-    'pe',
-    'peacefully',
-    'peacekeeping',
-    'peacetime',
-    'peaked',
-    'pear',
-    'pearls',
-    'pebbles',
-    'peck',
-    'peculiarly',
-    'pedal',
-    'pedestrians',
-    'pedigree',
-    'pedro',
-    'peeled',
     'peeling',
-    'pegs',
-    'peking',
-    'pellet',
-    'pellets',
-    'pembroke',
-    'pencils',
-    'pendulum',
-    'penelope',
-    'penetrated',
-    'penetrating',
-    'pennies',
-    'pennsylvania',
-    'pentagon',
-    'pentium',
-    'peptic',
     'peptide',
-    'peptides',
-    'per_se',
-    'perce',
-    'percentages',
-    'perceptive',
-    'perceptual',
-    'perch',
-    'perdita',
-    'perennial',
-    'peril',
-    'periodically',
-    'periodicals',
-    'periphery',
-    'perkins',
-    'perks',
     'perm',
-    'permissible',
-    'permissive',
-    'persecution',
-    'persia',
-    'persistently',
-    'persists',
-    'persona',
-    'pertinent',
-    'pervasive',
-    'pessimistic',
-    'pesticide',
-    'pests',
-    'petals',
-    'petitions',
-    'peugeot',
     'phantom',
-    'phased',
-    'phd',
-    'phenomenal',
-    'philadelphia',
-    'philippe',
-    'phillip',
-    'philosophies',
-    'phoebe',
-    'phonemes',
-    'phonetic',
-    'phoning',
-    'phonological',
-    'phyllis',
-    'physicians',
-    'physicist',
     'physicists',
-    'physiology',
-    'physiotherapist',
-    'pianist',
-    'piazza',
-    'piccadilly',
-    'pick-up',
-    'pickering',
-    'picket',
-    'pickup',
-    'pickups',
-    'pictorial',
-    'piecemeal',
-    'pierced',
-    'piercing',
-    'piety',
     'pigeon',
-    'pigment',
-    'pilgrims',
-    'piling',
-    'pilkington',
-    'pillows',
-    'pinched',
-    'pineapple',
-    'pinnacle',
-    'pinpoint',
-    'pioneered',
-    'pioneers',
-    'pious',
-    'piping',
-    'pirate',
-    'pirates',
     'pistols',
-    'pitches',
-    'pitfalls',
-    'pitt',
-    'pivot',
-    'placebo',
-    'placements',
-    'plagued',
-    'planetary',
-    'plank',
-    'planks',
-    'planner',
-    'plantation',
-    'plantations',
-    'plasmid',
-    'plasminogen',
     'plastered',
-    'platinum',
-    'plato',
-    'platoon',
-    'platt',
-    'play-off',
-    'playwright',
-    'plead',
-    'pleas',
-    'pleasurable',
-    'pledges',
-    'plotted',
-    'ploughed',
-    'ploughing',
-    'ploy',
-    'plucked',
     'plugged',
-    'plugs',
-    'plum',
-    'plumage',
-    'plumbing',
-    'plummer',
-    'plunging',
-    'plural',
-    'pluralism',
-    'pluralist',
-    'pnp',
-    'poignant',
-    'pointedly',
-    'pointer',
-    'pointers',
-    'poke',
     'poked',
-    'poker',
-    'poking',
-    'pol',
-    'policyholder',
-    'polishing',
-    'politeness',
-    'polled',
-    'pollen',
-    'pollock',
-    'pollutants',
-    'polluted',
-    'polluting',
-    'poly',
-    'polyester',
-    'polymerase',
     'polyps',
-    'polythene',
-    'pompous',
-    'pondered',
-    'ponies',
-    'pooley',
-    'popping',
-    'poppy',
-    'pops',
-    'popularly',
-    'populated',
-    'populist',
-    'porcelain',
-    'pore',
-    'pores',
-    'porn',
     'pornography',
-    'porridge',
-    'porsche',
-    'portadown',
-    'portal',
-    'porters',
-    'portfolios',
-    'portland',
-    'portray',
-    'portrayal',
-    'posing',
-    'positivist',
-    'postage',
-    'postcards',
-    'posting',
-    'postman',
     'postpone',
-    'postponement',
-    'postscript',
-    'postulated',
-    'potassium',
-    'potency',
-    'potted',
-    'pou',
-    'pouch',
-    'poultry',
-    'powerpc',
-    'pragmatism',
-    'pram',
-    'prawns',
-    'pre-existing',
-    'pre-school',
     'preach',
-    'preached',
-    'preacher',
-    'precarious',
-    'precaution',
-    'precede',
-    'precedence',
-    'precedents',
-    'precipitate',
-    'precipitated',
-    'precipitation',
-    'preclude',
-    'precursor',
-    'predatory',
-    'predetermined',
-    'predicament',
     'predictably',
-    'predictive',
-    'predicts',
-    'preferential',
-    'prehistoric',
-    'prejudiced',
-    'prelude',
-    'prematurely',
-    'premiere',
-    'premiership',
-    'premise',
-    'prentice',
-    'preoccupations',
-    'preparatory',
-    'prepares',
-    'prerequisite',
     'prerogative',
-    'presbyterian',
-    'prescott',
-    'prescribe',
-    'prescribing',
-    'prescriptions',
-    'present-day',
-    'presses',
-    'presupposes',
-    'pretensions',
-    'preview',
-    'priceless',
-    'prick',
-    'priesthood',
-    'prima_facie',
-    'primacy',
     'primal',
-    'primer',
-    'principals',
-    'pringle',
-    'privet',
-    'prized',
-    'probabilities',
-    'probed',
-    'probing',
-    'problem-solving',
-    'proclaim',
-    'proclaiming',
-    'procurement',
-    'professors',
-    'prognosis',
-    'programmer',
     'programmers',
-    'progresses',
-    'progressing',
-    'prohibit',
-    'projecting',
-    'prolific',
-    'prolong',
-    'prominently',
-    'promotes',
-    'prompting',
-    'pronoun',
-    'pronounce',
-    'pronouns',
-    'proofs',
-    'propagation',
-    'propelled',
     'propensity',
-    'prophecy',
-    'prophets',
-    'proponents',
-    'proprietors',
-    'props',
-    'pros',
-    'prosecute',
-    'prosecuted',
-    'prospectus',
-    'prosper',
-    'prost',
-    'prostitute',
-    'protector',
-    'protects',
-    'protocols',
     'protracted',
-    'provider',
-    'proviso',
-    'provocation',
-    'provocative',
-    'provoking',
-    'prowess',
-    'proxy',
-    'prudence',
-    'prudential',
-    'pruning',
-    'prussia',
-    'prussian',
-    'psalm',
-    'psyche',
-    'psychiatrist',
     'psychiatrists',
-    'psychiatry',
-    'psychoanalytic',
-    'psychologically',
-    'pt',
-    'public-sector',
-    'publicised',
-    'publishes',
-    'puddings',
-    'puff',
-    'puffed',
-    'pulmonary',
-    'pulp',
-    'pulpit',
-    'punches',
-    'punching',
     'punctuated',
-    'punctuation',
-    'punishing',
-    'punishments',
-    'punitive',
-    'punjab',
-    'punters',
-    'puppet',
-    'puppets',
-    'puppies',
-    'purge',
-    'purified',
-    'puritan',
-    'purpose-built',
-    'purposeful',
-    'pursed',
     'pursuits',
-    'pushes',
-    'putative',
-    'putt',
-    'puzzles',
-    'puzzling',
-    'pyjamas',
-    'pyrenees',
-    'q.',
-    'qb',
-    'qpr',
-    'quaint',
-    'quaker',
-    'quakers',
-    'qualifier',
-    'quantify',
     'quarries',
-    'quarter-final',
-    'quartz',
-    'quebec',
-    'queensland',
-    'queer',
-    'queues',
-    'quickest',
-    'quieter',
-    'quigley',
-    'quivering',
-    'ra',
-    'rab',
-    'rabbi',
-    'racecourse',
-    'racket',
     'racks',
-    'radcliffe',
-    'radial',
-    'radiant',
-    'radicalism',
-    'radioactivity',
-    'radios',
-    'raffle',
-    'raft',
-    'raged',
-    'raging',
-    'rags',
-    'raided',
-    'raiders',
-    'railings',
-    'raincoat',
     'rained',
-    'rainfall',
-    'rainforests',
-    'rains',
-    'rainy',
-    'rake',
-    'rallied',
-    'rallies',
-    'ramblers',
-    'rambling',
-    'rampant',
-    'randall',
-    'randolph',
-    'randomised',
-    'randomly',
-    'randy',
     'ransom',
-    'ranulf',
-    'rapist',
-    'rapport',
-    'rarity',
-    'ratification',
-    'ratified',
-    'ration',
-    'rationalisation',
-    'rationally',
-    'rationing',
-    'rations',
-    'rattle',
-    'rattling',
-    'rave',
-    'raven',
     'rdbi',
-    're-elected',
-    're-election',
-    'reacting',
-    'reactionary',
-    'readable',
-    'readership',
-    'ready-made',
-    'reaffirmed',
-    'real-time',
-    'realises',
-    'realist',
-    'realistically',
-    'realizing',
-    'realms',
-    'reap',
     'reappeared',
-    'rearing',
-    'reasonableness',
-    'rebate',
-    'rebellious',
-    'receivers',
-    'receptive',
-    'recess',
-    'reckoning',
-    'reclaim',
-    'reclaimed',
-    'recognisable',
-    'recognizable',
-    'recognizes',
-    'recollection',
-    'recollections',
     'recombinant',
-    'reconciled',
-    'reconnaissance',
-    'reconsider',
-    'reconstituted',
-    'reconstruct',
-    'reconstructed',
-    'recorders',
-    'recoverable',
-    'recreate',
-    'rectangle',
-    'rectify',
-    'rectory',
-    'recurring',
-    'redcar',
-    'redeemed',
     'redevelopment',
-    'redistribution',
-    'redwood',
-    'reefs',
-    'reel',
-    'reeling',
-    'rees',
-    'reeve',
-    'reeves',
-    'ref.',
-    'referees',
-    'referenced',
-    'refinement',
-    'refining',
-    'reflectance',
-    'reflective',
     'reflex',
-    'reformation',
-    'reforming',
-    'reformist',
-    'refrain',
-    'refreshment',
-    'refreshments',
-    'refrigerator',
-    'refund',
-    'refurbished',
-    'refurbishment',
-    'regal',
-    'regency',
-    'regiments',
-    'registering',
-    'regrets',
     'regrettable',
-    'regrettably',
-    'regularity',
-    'regulars',
-    'regulator',
-    'regulators',
-    'rehearsals',
-    'rehearsed',
-    'rein',
-    'reinforcement',
-    'reinforcements',
-    'reinforces',
-    'reinforcing',
-    'reinstated',
-    'reiterated',
-    'rejoined',
     'relapse',
-    'relativity',
-    'relay',
-    'relegated',
-    'relentless',
-    'relentlessly',
-    'reliably',
-    'relics',
-    'relieving',
-    'relinquish',
-    'rem',
-    'remand',
-    'remanded',
-    'rembrandt',
-    'remedial',
-    'remembrance',
     'reminders',
-    'remission',
-    'remnants',
-    'remorse',
-    'remotely',
-    'removes',
-    'renamed',
-    'renders',
-    'rendezvous',
-    'renewable',
-    'renovation',
-    'renting',
-    'renwick',
-    'reopened',
-    'reorganization',
-    'rep',
     'repaid',
-    'repairing',
-    'repatriation',
-    'repayments',
-    'repeal',
-    'repercussions',
-    'replacements',
-    'replica',
-    'replication',
-    'replying',
-    'repository',
-    'repressed',
-    'repressive',
-    'reprieve',
-    'reprocessing',
-    'reproducing',
     'reptiles',
-    'reputable',
-    'reputed',
-    'requisite',
-    'researched',
-    'researches',
-    'researching',
-    'resembling',
-    'resent',
-    'resentful',
-    'reservoirs',
-    'reside',
-    'resides',
-    'resilience',
-    'resin',
-    'resolutely',
     'resonance',
-    'resorted',
-    'respectability',
-    'respectful',
-    'respite',
-    'restart',
-    'restraining',
-    'restraints',
-    'resumption',
-    'resurgence',
-    'retaliation',
-    'retarded',
-    'rethink',
-    'retina',
-    'retreating',
-    'retribution',
     'retrieved',
-    'reunification',
-    'reunited',
-    'reverence',
-    'reversing',
-    'reversion',
-    'revert',
-    'reverted',
-    'revise',
-    'revisions',
-    'revolutionaries',
-    'revolutions',
-    'revolver',
-    'revolving',
-    'revulsion',
-    'rhetorical',
     'rhine',
-    'rhino',
-    'rhodesia',
-    'rhyme',
-    'rhymes',
-    'riba',
-    'ribbons',
-    'rica',
-    'riches',
-    'richie',
-    'richness',
-    'riddle',
-    'ridges',
-    'ridicule',
-    'ridley',
-    'rife',
     'rifles',
-    'rightful',
-    'rigidly',
-    'rigorously',
-    'riley',
-    'rincewind',
-    'rind',
-    'rinse',
-    'rioting',
-    'ripon',
-    'ripping',
-    'ripple',
-    'risked',
-    'risking',
-    'rita',
-    'ritchie',
     'rite',
-    'rites',
-    'riven',
-    'ro',
-    'roach',
-    'roadside',
-    'roam',
-    'robbers',
-    'robbins',
-    'roberto',
-    'robes',
-    'robins',
-    'robots',
-    'rochdale',
-    'roche',
-    'rockets',
     'rodney',
-    'roe',
-    'rogue',
-    'rohan',
-    'rohmer',
-    'rollers',
-    'rolls-royce',
-    'romanesque',
-    'romanov',
-    'romeo',
-    'roofing',
-    'roosevelt',
-    'rosy',
-    'rotary',
-    'rotate',
-    'rotating',
     'rotting',
-    'rottweiler',
-    'roubles',
-    'rouge',
-    'rounding',
-    'rourke',
-    'roused',
-    'rousseau',
-    'routinely',
-    'rowland',
-    'roxburgh',
-    'royals',
-    'royalties',
-    'rs/6000',
-    'rsc',
-    'rspb',
     'rspca',
-    'rt',
-    'ruby',
-    'rucksack',
-    'rudder',
-    'rudimentary',
-    'rudolf',
-    'ruefully',
-    'ruffled',
-    'rugged',
-    'rumoured',
-    'rump',
-    'run-up',
-    'runaway',
-    'rune',
-    'runner-up',
     'runners-up',
-    'rushdie',
-    'rushes',
-    'ruskin',
-    'russon',
-    'rust',
-    'rustic',
-    'ruthlessly',
-    'ryedale',
-    'saatchi',
-    'sabbath',
-    'sabotage',
-    'sacking',
-    'sacks',
-    'sacrificed',
-    'sacrifices',
     'sadler',
-    'sae',
-    'safari',
-    'safest',
-    'sage',
-    'sahara',
-    'salads',
-    'salesmen',
-    'salesperson',
-    'salford',
-    'salient',
-    'saline',
-    'saliva',
-    'salts',
-    'salute',
-    'salvage',
     'salzburg',
-    'samantha',
-    'sammy',
-    'sampled',
-    'sanctioned',
-    'sandals',
-    'sanders',
-    'sandstone',
-    'sane',
-    'sanitary',
-    'sanity',
-    'sap',
-    'sarcasm',
-    'sardonic',
-    'sarella',
-    'sartre',
     'satan',
-    'satisfies',
-    'saturation',
-    'saucepan',
-    'saucer',
-    'sauces',
-    'sauna',
-    'savagely',
-    'savers',
-    'saviour',
-    'savoy',
-    'saxons',
-    'sb',
-    'scaffolding',
-    'scaled',
-    'scalp',
     'scandals',
-    'scandinavia',
-    'scanner',
-    'scant',
-    'scarred',
-    'scars',
-    'scary',
-    'scathing',
-    'scatter',
-    'scenarios',
-    'scenic',
-    'scented',
-    'scheduling',
-    'schellenberg',
-    'schema',
-    'schizophrenia',
     'schmidt',
-    'schofield',
-    'schoolchildren',
-    'schoolgirl',
-    'schoolmaster',
-    'scientifically',
-    'scoop',
-    'scooped',
-    'scorer',
-    'scorn',
-    'scorton',
-    'scout',
-    'scramble',
-    'scrambling',
-    'scrape',
-    'scraped',
     'scraping',
-    'scrapped',
-    'scraps',
-    'screwdriver',
-    'scripts',
-    'scripture',
-    'scriptures',
-    'scrolled',
-    'scrubbed',
-    'scruffy',
-    'scrum',
-    'scrum-half',
-    'sculptor',
-    'sd',
-    'sdlp',
-    'sdp',
     'sealing',
-    'seam',
-    'seaman',
-    'seams',
-    'seasoned',
-    'seasoning',
-    'sec',
-    'secession',
-    'secluded',
-    'secretarial',
-    'secretive',
-    'secs',
-    'sect',
-    'sectarian',
-    'securely',
-    'sedgefield',
     'seduced',
-    'seductive',
-    'seedlings',
-    'seeing_that',
-    'segmentation',
-    'segregated',
-    'seismic',
-    'seizing',
-    'seizure',
-    'selby',
-    'selections',
-    'selectively',
-    'selectors',
-    'selects',
-    'self-confidence',
-    'self-conscious',
     'self-contained',
-    'self-control',
-    'self-defence',
-    'self-determination',
-    'self-evident',
-    'self-help',
-    'self-interest',
-    'self-sufficiency',
-    'self-sufficient',
-    'selkirk',
-    'sellafield',
-    'selves',
-    'sem',
-    'semantics',
-    'semi',
-    'senators',
     'sender',
-    'senna',
-    'sensibility',
-    'sensual',
-    'seoul',
-    'sep',
-    'separates',
-    'separatist',
-    'sequel',
-    'sequencing',
-    'sequent',
-    'sequential',
-    'serb',
-    'serene',
-    'sermon',
-    'sermons',
     'serpent',
-    'serviced',
-    'servicemen',
-    'setback',
-    'seth',
-    'settee',
-    'settles',
-    'settlor',
-    'sevens',
-    'seventeenth-century',
-    'seville',
-    'sewers',
-    'sewn',
-    'sexism',
-    'sexist',
-    'seymour',
     'sgt',
-    'shaded',
-    'shadowy',
-    'shady',
-    'shafts',
-    'shakes',
-    'sham',
-    'shameful',
-    'shamir',
-    'shampoo',
-    'shanghai',
-    'shannon',
-    'shareholding',
-    'shark',
-    'sharks',
-    'sharpened',
     'sharper',
-    'sharpness',
-    'shattering',
-    'shaun',
-    'shave',
-    'shaved',
-    'shaving',
-    'shawl',
-    'shear',
-    'shearer',
-    'shedding',
-    'sheds',
-    'sheen',
-    'sheikh',
-    'shelling',
-    'shelters',
     'shepherds',
-    'sheridan',
-    'sherman',
-    'sherwood',
-    'shevardnadze',
-    'shh',
-    'shildon',
-    'shilling',
-    'shimmering',
-    'shines',
-    'shingle',
-    'shipbuilding',
-    'shipment',
-    'shipments',
-    'shire',
-    'shiver',
     'shoal',
-    'shocks',
-    'shopkeeper',
-    'shopkeepers',
-    'shortened',
-    'shortest',
-    'shorthand',
-    'shove',
-    'shoved',
-    'showdown',
-    'showered',
-    'showers',
-    'showroom',
-    'shrank',
-    'shrill',
-    'shrimp',
     'shrink',
-    'shrinking',
-    'shrouded',
-    'shrub',
-    'shrunk',
-    'shudder',
-    'shuddering',
-    'shuffle',
-    'shuffled',
-    'shuffling',
-    'shutters',
-    'shutting',
-    'sib',
-    'siberian',
-    'siblings',
-    'sic',
     'sicily',
-    'sickening',
-    'sickly',
-    'side-effects',
-    'sided',
-    'sidney',
-    'sighted',
-    'sigma',
-    'signatories',
-    'signified',
-    'signify',
-    'silenced',
-    'silhouette',
-    'silky',
-    'sill',
-    'silvery',
     'simmer',
-    'simmons',
-    'simplification',
-    'simplify',
-    'simplistic',
-    'simulated',
-    'sincerity',
-    'sinclair',
-    'singled',
-    'sings',
-    'singularity',
-    'sinks',
-    'sinn_fein',
-    'sip',
-    'sipping',
-    'siren',
     'sister-in-law',
-    'sited',
-    'sixpence',
-    'skeletal',
-    'skeletons',
-    'skelton',
-    'sketched',
-    'skilfully',
-    'skimmed',
-    'skinny',
-    'skis',
-    'skulls',
-    'skye',
-    'skyline',
-    'slabs',
-    'slamming',
     'slapping',
-    'slash',
-    'slater',
-    'slates',
-    'slaughtered',
-    'sleek',
-    'sleeps',
-    'slick',
-    'sling',
-    'slippers',
-    'slit',
-    'sloane',
-    'slogans',
-    'sloping',
-    'slotted',
-    'slough',
     'slovak',
-    'slovakia',
-    'slovenia',
-    'sluggish',
-    'slum',
-    'slums',
-    'slung',
-    'smack',
-    'smacked',
-    'small-scale',
-    'smartly',
-    'smear',
-    'smelled',
-    'smelling',
-    'smelly',
-    'smoky',
     'smoothed',
-    'smoothing',
-    'smug',
-    'smuggled',
-    'smuggling',
-    'smyth',
-    'snack',
-    'snacks',
-    'snag',
-    'snail',
-    'snails',
-    'snapping',
-    'snaps',
-    'snarled',
-    'snatch',
-    'sneak',
     'sniff',
-    'sniffing',
-    'snorted',
-    'snowy',
-    'snp',
-    'so_called',
-    'soak',
-    'soaking',
-    'soar',
-    'sob',
-    'sobbed',
-    'sobbing',
-    'socialization',
-    'sock',
-    'sockets',
-    'soda',
     'soften',
-    'softening',
-    'softness',
-    'soho',
-    'sol',
-    'solemnly',
-    'soles',
-    'solidly',
-    'solids',
-    'solitude',
-    'solomon',
-    'soluble',
-    'solvents',
-    'somali',
-    'sombre',
-    'somerville',
     'son-in-law',
-    'sonata',
-    'sonic',
-    'sonny',
-    'soothing',
-    'sophia',
-    'southeast',
-    'southend',
-    'southport',
-    'southwark',
-    'souvenir',
-    'souvenirs',
-    'soviets',
-    'sow',
-    'sown',
-    'spaced',
     'spacing',
-    'spade',
-    'spaghetti',
-    'spaniards',
-    'spanning',
-    'sparcstation',
-    'sparkle',
-    'sparse',
-    'sparta',
-    'spartan',
-    'spate',
-    'spawning',
-    'spd',
-    'spear',
-    'spears',
-    'specialisation',
     'specialise',
-    'specialises',
-    'specialising',
-    'specialities',
-    'specialization',
-    'specials',
-    'specifies',
-    'spectra',
-    'spectre',
-    'sped',
-    'speedily',
-    'spelled',
-    'spence',
-    'sphincter',
-    'spice',
-    'spices',
     'spiders',
-    'spies',
-    'spike',
-    'spikes',
-    'spilling',
-    'spills',
-    'spilt',
-    'spire',
-    'spirited',
-    'spirituality',
-    'spite',
-    'spitfire',
-    'spitting',
-    'splashed',
-    'splashing',
-    'splendour',
     'splits',
-    'spoiling',
-    'spoils',
-    'spoilt',
-    'spokesmen',
-    'spokesperson',
-    'sponsoring',
-    'sporadic',
-    'sportsmen',
-    'spotting',
-    'spouses',
-    'sprawled',
-    'sprawling',
-    'sprayed',
-    'spraying',
-    'spreadsheets',
     'springing',
-    'sprinkle',
-    'sprint',
-    'spruce',
-    'sprung',
-    'spurious',
-    'spurred',
-    'spying',
-    'sql',
-    'squads',
-    'squarely',
-    'squashed',
-    'squat',
-    'squatting',
-    'squeezing',
-    'squire',
     'squirrel',
-    'ss',
-    'stabbing',
-    'stacks',
-    'staffed',
-    'stafford',
-    'staffordshire',
-    'staffs',
-    'stag',
-    'stagnant',
-    'stainless',
-    'stains',
-    'stair',
-    'stale',
-    'stalk',
-    'stalks',
     'stallion',
-    'stamina',
-    'stamping',
-    'standby',
-    'standpoint',
-    'standstill',
-    'stanford',
-    'staple',
-    'stares',
-    'start-up',
-    'starters',
-    'starve',
-    'starved',
-    'stately',
-    'statesman',
-    'stationary',
     'stationery',
-    'statistic',
-    'stature',
-    'staunch',
-    'stead',
-    'steamed',
-    'steen',
-    'steeply',
-    'steered',
-    'stefan',
-    'stein',
-    'stemmed',
-    'stemming',
-    'stench',
-    'stepfather',
-    'stephens',
     'stephenson',
-    'stereotype',
-    'stereotypes',
-    'sterile',
-    'stew',
-    'stickers',
-    'stiffened',
-    'stiffness',
-    'stifled',
-    'stigma',
-    'stile',
-    'stillness',
-    'stinging',
-    'stinking',
-    'stint',
-    'stipulated',
     'stocked',
-    'stockholm',
-    'stockport',
-    'stoddard',
-    'stony',
-    'stools',
-    'stooped',
-    'storey',
-    'storeys',
-    'storming',
-    'stormy',
-    'strachan',
-    'straighten',
-    'straits',
-    'strangled',
-    'strapped',
     'strata',
-    'strategically',
-    'stratification',
-    'strauss',
-    'strawberries',
-    'strawberry',
-    'streaming',
-    'strenuous',
-    'stressful',
-    'strewn',
-    'stricken',
-    'stricter',
-    'strictures',
-    'strident',
-    'strides',
-    'striding',
     'strife',
-    'strikers',
-    'strikingly',
-    'stripping',
-    'strive',
-    'striving',
-    'stroking',
-    'strolling',
-    'stronghold',
-    'stroud',
-    'structuralist',
-    'structuring',
-    'strung',
-    'stud',
-    'stuffing',
-    'stump',
     'stung',
-    'stunt',
-    'stupidity',
-    'stuttgart',
-    'styled',
-    'styling',
-    'su',
-    'subconscious',
-    'subject-matter',
-    'subjectivity',
-    'sublime',
-    'submarines',
-    'submerged',
-    'submitting',
-    'subordination',
-    'subs',
     'subscribe',
-    'subscribed',
-    'subscriptions',
-    'subset',
-    'subsided',
-    'subsidence',
-    'subsidised',
-    'substitutes',
-    'substituting',
-    'substrate',
-    'subtlety',
-    'subtly',
-    'subversion',
-    'subversive',
-    'succeeds',
-    'succumbed',
     'suede',
-    'suez',
-    'suffrage',
-    'suggestive',
-    'suicidal',
-    'suing',
-    'suitability',
-    'suitcases',
-    'suites',
-    'sullen',
-    'sulphate',
-    'summarise',
-    'summarized',
-    'summerchild',
-    'summers',
-    'summon',
     'sumptuous',
-    'sunglasses',
-    'sunken',
-    'sunrise',
-    'superbly',
-    'superego',
-    'superficially',
-    'superfluous',
-    'superimposed',
-    'superiors',
-    'supernatural',
-    'superseded',
-    'superstar',
-    'superstition',
-    'supervising',
-    'supervisors',
     'supervisory',
-    'supposing',
-    'supt',
-    'surf',
-    'surfaced',
-    'surged',
-    'surname',
-    'surpluses',
-    'surrounds',
-    'survivor',
-    'suspiciously',
-    'sustaining',
-    'suzanne',
-    'svqs',
-    'swallowing',
-    'swallows',
     'swamp',
-    'swamped',
-    'swans',
-    'sway',
-    'swayed',
-    'swaying',
-    'swearing',
-    'sweaty',
-    'sweeney',
-    'sweeps',
-    'sweetheart',
-    'sweetly',
-    'sweetness',
-    'swelled',
-    'swine',
-    'swirling',
     'switchboard',
-    'swords',
-    'sybase',
-    'sybil',
-    'syllables',
-    'syllabuses',
-    'sylvester',
-    'sylvie',
-    'symbolism',
-    'symmetric',
-    'symmetrical',
-    'sympathetically',
-    'sympathies',
-    'symposium',
-    'symptomatic',
-    'syndicate',
     'synod',
-    'synonymous',
-    'syphilis',
-    'syrup',
-    'systemic',
-    't\'ang',
-    't-shirts',
-    'tab',
-    'tabitha',
-    'tabled',
-    'tablet',
-    'tabloid',
-    'tabloids',
-    'taboo',
-    'tacit',
-    'tact',
     'tae',
-    'tags',
-    'tait',
-    'take-off',
-    'take-over',
-    'takeovers',
-    'tallis',
-    'tally',
-    'tamar',
-    'tame',
-    'tamil',
-    'tammuz',
-    'tandem',
-    'tangle',
-    'tanker',
-    'tanned',
     'tanner',
-    'tantrums',
-    'tanzania',
-    'taped',
-    'tapestry',
-    'taping',
-    'tar',
-    'tara',
-    'targeting',
-    'tarmac',
-    'tart',
-    'tartan',
-    'tasting',
-    'tasty',
-    'taunton',
-    'taut',
     'tavern',
-    'tawny',
-    'taxable',
-    'taxing',
-    'taxis',
-    'tcp/ip',
-    'te',
-    'team-mate',
-    'teamed',
-    'teamwork',
-    'teapot',
-    'teas',
-    'tease',
-    'tebbit',
-    'tec',
-    'tech',
     'technician',
-    'teens',
-    'teesdale',
-    'tehran',
-    'telegram',
-    'televised',
-    'telex',
-    'telford',
-    'temperate',
-    'tempered',
-    'template',
-    'templeton',
-    'tempo',
-    'tempt',
-    'tendering',
-    'tenderly',
     'tenderness',
-    'tenders',
-    'tenor',
-    'tentacles',
-    'tentatively',
-    'tents',
-    'tenuous',
-    'terence',
-    'terminate',
-    'terminus',
-    'terraced',
-    'terrestrial',
-    'terrier',
-    'tertiary',
-    'tessa',
-    'testator',
     'testify',
-    'textbook',
-    'textual',
-    'textures',
-    'th&eacute;r&egrave;se',
-    'thankful',
-    'thanking',
-    'thanks_to',
-    'thatched',
-    'thatcherism',
-    'thaw',
-    'thefts',
-    'thematic',
-    'thence',
-    'theo',
-    'theologians',
     'theorem',
-    'therapists',
-    'therein',
-    'theresa',
-    'therese',
-    'thicker',
-    'thickly',
-    'thinker',
-    'thinkers',
-    'thinner',
-    'thinning',
-    'thirst',
-    'thirsty',
-    'thirty-five',
-    'thirty-six',
-    'thistle',
     'thorfinn',
-    'thorne',
-    'thorpe',
-    'thrashing',
-    'three-day',
-    'three-year-old',
-    'threes',
-    'thriller',
-    'thrilling',
-    'throats',
-    'throbbing',
-    'throng',
-    'throttle',
-    'thrush',
-    'thrusting',
-    'thu',
     'thugs',
-    'thumbs',
-    'thump',
-    'thumping',
-    'thwarted',
-    'tibet',
-    'ticked',
-    'ticking',
-    'tides',
-    'tier',
-    'tights',
-    'tile',
-    'tiled',
-    'tiller',
-    'tilt',
-    'timbers',
     'time-consuming',
-    'time_and_again',
-    'timed',
-    'timeless',
-    'timely',
-    'timetables',
-    'timid',
-    'tinned',
-    'tipping',
-    'tiredness',
-    'tiresome',
-    'tiring',
-    'titled',
-    'tits',
-    'tivoli',
-    'tncs',
     'to_and_fro',
-    'toad',
-    'tod',
-    'toddler',
-    'tokens',
-    'tolerant',
-    'tombs',
-    'tongues',
-    'tonne',
-    'topical',
-    'topography',
-    'topping',
-    'toppled',
-    'tor',
-    'torches',
-    'torment',
     'tormented',
-    'torquay',
-    'torrent',
-    'torso',
-    'tossing',
-    'totality',
-    'totalled',
-    'totals',
-    'toughest',
-    'toured',
-    'tow',
-    'towering',
-    'township',
-    'townships',
-    'toxins',
-    'toyota',
     'tracked',
-    'traction',
-    'tracts',
-    'tracy',
-    'tradesmen',
-    'trafalgar',
-    'trafficking',
-    'tragically',
-    'trails',
-    'trait',
-    'traitor',
-    'tramp',
-    'trams',
-    'tramway',
-    'tranmere',
-    'tranquil',
     'tranquillity',
-    'transatlantic',
-    'transcendent',
-    'transcript',
-    'transcripts',
-    'transformations',
-    'transfusion',
-    'transistor',
-    'transitions',
-    'translating',
-    'translations',
-    'translator',
-    'translucent',
-    'transmit',
-    'transmitter',
-    'transmitting',
     'transnational',
-    'transplantation',
-    'transporting',
-    'transverse',
-    'traverse',
-    'trays',
-    'treacherous',
-    'treading',
-    'treason',
-    'treatise',
-    'treble',
-    'trek',
-    'tremble',
-    'trembled',
-    'tremendously',
-    'trenches',
     'trendy',
-    'trespass',
-    'triangles',
-    'tribune',
-    'trickle',
-    'trident',
-    'trifle',
-    'triggers',
-    'trimmed',
-    'trinidad',
-    'tripartite',
-    'tripped',
-    'triumphantly',
-    'triumphs',
-    'trophies',
-    'tropics',
     'trot',
-    'trough',
-    'trouser',
-    'troy',
-    'truman',
-    'trumpet',
-    'trunks',
-    'trusting',
-    'tsb',
-    'tsp',
-    'tub',
-    'tuberculosis',
-    'tubular',
-    'tuc',
-    'tucker',
-    'tue',
     'tugged',
-    'tugging',
-    'tumble',
-    'tumbling',
-    'tuna',
-    'tundra',
-    'tuned',
-    'tunic',
-    'tuning',
-    'tunisia',
-    'tuppe',
-    'turbine',
-    'turbo',
-    'turnbull',
-    'turnout',
-    'turquoise',
     'turtle',
-    'tutorial',
-    'twenty-eight',
-    'twenty-nine',
-    'twenty-seven',
-    'twenty-six',
-    'twenty-three',
-    'twickenham',
-    'twigs',
-    'twilight',
-    'twists',
-    'twitched',
-    'two-day',
-    'two-dimensional',
-    'two-tier',
-    'two-way',
     'two-year-old',
-    'twos',
-    'tying',
-    'tyler',
-    'tyranny',
-    'tyson',
-    'u.k.',
-    'ubiquitous',
-    'ucta',
-    'udf',
-    'uefa',
-    'uganda',
-    'uh',
-    'ultra',
-    'umpire',
-    'unambiguous',
     'unanswered',
-    'unattractive',
-    'unauthorised',
-    'unavailable',
-    'unavoidable',
-    'unbalanced',
-    'unbearable',
-    'unborn',
-    'unbroken',
-    'uncanny',
-    'uncertainly',
-    'uncles',
-    'uncompromising',
-    'unconditional',
-    'unconnected',
-    'unconsciously',
     'uncontrollable',
-    'uncontrolled',
-    'uncover',
-    'under-secretary',
-    'underclass',
-    'undercover',
-    'underestimate',
-    'underestimated',
-    'undergraduates',
-    'undergrowth',
-    'underline',
-    'underlines',
-    'undermining',
-    'underside',
-    'undertaker',
-    'undertakes',
     'underwood',
-    'underworld',
-    'underwriting',
-    'undisclosed',
-    'undisturbed',
-    'undo',
-    'undone',
-    'undoubted',
-    'uneasily',
-    'unequivocal',
-    'unexplained',
-    'unfairly',
-    'unfavourable',
-    'unfinished',
-    'unfit',
-    'unfolded',
     'unfolding',
-    'unforeseen',
-    'unhappily',
-    'unhappiness',
-    'unhealthy',
-    'unhelpful',
-    'unidentified',
-    'uniformed',
-    'uniformity',
-    'uniformly',
-    'unilateral',
-    'unimportant',
-    'unionism',
-    'uniqueness',
-    'unison',
-    'unisys',
     'unita',
-    'unjust',
-    'unkind',
-    'unleaded',
-    'unleashed',
-    'unmarked',
-    'unnamed',
-    'unnoticed',
-    'unorthodox',
-    'unprepared',
-    'unproductive',
-    'unqualified',
-    'unquestionably',
-    'unreal',
-    'unreasonably',
-    'unresolved',
     'unsafe',
-    'unscrupulous',
-    'unsettled',
-    'unspecified',
-    'unspoken',
-    'unsuccessfully',
-    'unthinkable',
-    'untidy',
-    'unto',
-    'untreated',
-    'untrue',
-    'unwell',
-    'unwillingness',
-    'unwise',
-    'unwittingly',
-    'up_front',
     'updating',
-    'upgraded',
-    'upgrading',
-    'upheaval',
-    'uphill',
-    'uphold',
-    'upland',
-    'uplands',
-    'uplift',
-    'uppermost',
-    'uprising',
-    'uproar',
-    'ups',
-    'upsetting',
-    'upsurge',
-    'uptake',
     'upton',
-    'upturn',
-    'urges',
-    'urinary',
-    'urquhart',
-    'ursula',
-    'uruguay',
-    'usable',
-    'usher',
-    'ushered',
-    'utah',
-    'utd',
-    'utilise',
-    'utilised',
-    'utilitarian',
-    'uv',
     'vacancy',
-    'vacation',
-    'vaccination',
-    'vaccine',
-    'vagina',
-    'vaginal',
-    'vain',
-    'valentine',
-    'validated',
-    'valuables',
-    'valuations',
-    'valves',
-    'vancouver',
-    'vandalism',
-    'vandals',
-    'vanessa',
     'vanguard',
-    'vanish',
-    'vanity',
-    'vans',
-    'vantage',
-    'variability',
-    'variously',
-    'varnish',
-    'vascular',
-    'vases',
-    'vault',
-    'vaults',
-    'vax',
-    'vectors',
-    'vegas',
-    'vehemently',
     'veiled',
-    'ven',
-    'venables',
-    'venetian',
-    'vengeance',
-    'venom',
-    'vent',
-    'ventral',
-    'ventricular',
-    'vera',
-    'verdun',
-    'verification',
-    'verified',
-    'verify',
-    'verity',
-    'vernacular',
     'vernon',
-    'veronica',
-    'versailles',
-    'versatility',
-    'vertically',
-    'vest',
-    'vga',
-    'vibrant',
-    'vibrations',
-    'vicarage',
-    'vice-chairman',
-    'vickers',
-    'vicki',
-    'vicky',
-    'victorious',
-    'viewpoints',
     'vile',
-    'villain',
-    'villas',
-    'vine',
-    'vinegar',
-    'vineyards',
-    'vinyl',
-    'viola',
-    'violated',
-    'violations',
-    'viral',
-    'visa',
-    'viscount',
-    'visibly',
-    'visionary',
-    'vitally',
     'vitro',
-    'vladimir',
-    'vms',
-    'vocals',
-    'vocation',
-    'vodka',
-    'vogue',
-    'volatility',
-    'volcano',
-    'volcanoes',
-    'volley',
-    'vologsky',
-    'vomit',
-    'vomiting',
-    'voter',
-    'voucher',
     'vow',
-    'vowel',
-    'vowels',
-    'vulgar',
-    'waged',
-    'wagons',
-    'wailed',
-    'wailing',
-    'waistcoat',
-    'waiters',
-    'waitress',
-    'waits',
-    'wakefield',
-    'wakes',
-    'waldegrave',
-    'walesa',
     'walled',
-    'wallis',
-    'walnut',
-    'walsall',
-    'walters',
-    'wandsworth',
-    'wang',
-    'wardens',
-    'ware',
-    'warehouses',
-    'wares',
-    'warily',
-    'warm-up',
-    'warp',
-    'warranties',
-    'warwickshire',
     'washes',
-    'wasp',
-    'wasps',
-    'wasteful',
-    'watchdog',
-    'watchful',
-    'watercolours',
-    'watered',
-    'waterfall',
-    'waterhouse',
-    'watering',
-    'waterproof',
-    'watershed',
-    'waterways',
-    'watery',
-    'watford',
     'watkins',
-    'waugh',
-    'wavelength',
-    'wavelengths',
-    'wayward',
-    'wc',
-    'weaken',
-    'weathered',
-    'weathering',
-    'weave',
-    'weaver',
-    'weavers',
-    'webster',
-    'weddings',
-    'wedged',
-    'wedgwood',
     'weep',
-    'weighs',
-    'weighting',
-    'welcomes',
-    'well-defined',
-    'well-established',
-    'werner',
-    'wes',
-    'wessex',
-    'weston',
-    'wetlands',
-    'wha',
-    'whaling',
-    'wharf',
-    'whence',
-    'whereupon',
     'whig',
-    'whigs',
-    'whim',
-    'whipping',
-    'whips',
-    'whisk',
-    'whispers',
-    'whistled',
-    'whistling',
-    'whitaker',
-    'whitbread',
-    'whitby',
-    'white-collar',
-    'whitehouse',
-    'whitlock',
-    'whitney',
     'wholemeal',
-    'whore',
-    'wi',
-    'wicker',
-    'wickham',
-    'wide-eyed',
-    'widen',
-    'widest',
-    'widnes',
-    'widowed',
-    'wig',
-    'wight',
-    'wilcox',
-    'wilde',
-    'wilder',
-    'wilko',
     'willi',
-    'willow',
-    'willy',
-    'wilton',
-    'wimpey',
-    'winced',
-    'windsurfing',
-    'wink',
-    'winked',
-    'winnie',
-    'wired',
-    'wiring',
-    'wisely',
-    'wiser',
-    'witchcraft',
-    'witches',
     'with_reference_to',
-    'withdrawals',
-    'withdrawing',
-    'withheld',
-    'withhold',
-    'withholding',
-    'witnessing',
-    'witney',
-    'wits',
-    'wittgenstein',
-    'wizard',
-    'wlr',
-    'wolfgang',
-    'wolverhampton',
-    'wolverton',
-    'womb',
     'woo',
-    'wooded',
-    'woodlands',
-    'woodwork',
-    'woody',
-    'woolf',
-    'woolley',
-    'woolly',
-    'woolwich',
-    'woosnam',
-    'wordperfect',
-    'workable',
-    'workhouse',
-    'worldly',
-    'worsened',
-    'worsening',
     'worshipped',
-    'worthless',
-    'wounding',
-    'wrapping',
-    'wrath',
-    'wreckage',
-    'wren',
-    'wrenched',
-    'wrestling',
-    'wrexham',
-    'wrinkled',
-    'wrongs',
-    'wrought',
-    'wryly',
-    'wyatt',
-    'wycombe',
     'wye',
-    'x-rays',
-    'x.',
-    'x/open',
-    'xerox',
-    'xi',
-    'xiv',
-    'xv',
-    'yachts',
-    'yale',
-    'yarns',
-    'yates',
-    'yawned',
-    'yawning',
-    'year-old',
-    'yearning',
     'yeast',
-    'yeats',
-    'yell',
-    'yelling',
-    'yemen',
-    'yew',
-    'yielding',
-    'yoghurt',
-    'yogurt',
-    'yorks',
-    'yrs',
-    'yu',
-    'yvonne',
-    'zeal',
-    'zebra',
-    'zeinab',
     'zenith',
-    'zip',
-    'zoe',
-    'zoom',
-    'zurich',
-    'zuwaya',
+)
+
+blocks_03 = (
+    '!(dollar;1!+eacute;lite""gr!#ggr"!t!$khgr!"lt!\'micro;g\'!l!%ndash!%pound&&;1,500(!2(%5,000(!m',
+    '(%5,000)%0,000\'%3,000(%0,000)%0,000(!5\'!4($,000(#.99(%0,000\'\'500,000\'!6(!0)$,000)!0',
+    '(!5\'!8(!0 $\'60s!#70s!"er#!e!"im!"n\' %+0000!!1 #0.1"!2!"31!!4',
+    '!"71 %1,200!".3"!4"!6"!7"!8!"01"!2"!3"!4"!5"!6"!8"!9',
+    '!"1%"!1"!2"!3"!4"!5"!9!"2%"$,000""00"!3"!4"!7"!8!"3%',
+    '"!7!%5,000""00!"6%!"70#!0"!5!*8-year-old""00""15""30$!s#!2#!9""40',
+    '#!8""50$!s#!1#!4#!5#!6#!7#!8#!9""60$!s#!1#!2#!3',
+    '#!5#!6#!7#!8#!9"#70s#!1#!2#!3#!4#!5#!6#!8#!9""81',
+    '#!3#!4#!5#!6#!7#!8#!9"#90s#!1#!2#!3#!4#!5#!6#!7',
+    '#!9!"90#!1#!3#!4"%90/91 "2%!(&ndash;3!$,500!"-1!!."!4"!6"!7"!8',
+    '""nd!"30""rd!&4-hour"!0""th!%5,000"%0,000!#7th!#8th!#9th!"pm "3%!".0"!4',
+    '"!7"!8!&00,000""th!#1st!"5%!!d "4%!".0"!4"!6"!7!&00,000#!0!"50',
+    '"!4"!5!&00,000#!0"!p""th!"ft "6%!".1"!2"!3"!4"!5!%0,000""00',
+    '!"ft "7%!$,000!".1"!2"!3#!0$"pm"!5!%0,000!"5%"!0!"pm "8%!$,000',
+    '"!2"!5!$0486!"pm "9%!"00#!0!!6!!7!!8 #a\'s!&-level!#.d."!m!!1',
+    '!\'_priori!"ah"#ron!!b"#ack"&berley##ott"!c"%domen#&uction$!l%#lah")erystwyth"#ide")normality',
+    '$%tions&"ve##und"&rasive")stentions#&urdity"%usive!+ccelerating)"or$\'ntuated$)ptability$$ssed&\'ibility&#ory#$laim',
+    '#*ommodating%&panies&$lish$#rds#*reditation$#ued#\'umulate)#ing)"or$"se""he$!d#%ieves"%idity"#orn',
+    '("ed$$ires%$tted"%rylic"&tivate\'"or%#ist"%utely!"da#$mant#&ptable&%tions%#ing&"ve%"or',
+    '$%tives"#ept#%quacy"$here&!d&#nce$$sion&"ve")journment#)udication$&stable"+ministering(\'rations$%rably&#lty',
+    '\'!s%#ing$&ssible"#obe#(lescents##pts##red$#ned%!o"\'renalin##ift"&ultery%$hood"*vantageous#&ersary',
+    '&!s#$ises%"or#%ocacy&$ting!&erobic\'!s$&planes"(sthetics!+ffectionate#&idavit$&liated(#ion+!s$\'rmation',
+    '&"ed#&licted$$uent#\'ordable"$ghan"$ield"$loat!%gatha"#gie#\'ravated$&egates(#ion%\'ssively$%ieved"&itated',
+    '"#new"&rarian#&eeable!#ide$!s"$ling"&rports#!y"$tken"!x!%larms##ska$$tair"&banian%!s',
+    '#$umin"(coholism"!f"&gerian#$iers#\'orithms"\'ienated\'#ion%!s##ght$#ned%$ment#%stair#!x"$kali',
+    '"+l-important$%round$$time#,_of_a_sudden#\'egation%#ing$$rgic&!y$%viate#$ison#\'ocating$%tment%#ted$!y"&mighty',
+    '&!s"#oof"&phabet($ical")ternately(#ing"%yssia!*malgamated)#ion#%teurs#&zingly$"on")bassadors#(iguities$\'valence',
+    '##ush""en$$able$!d$#ity"%iable#!s"%monia"\'ounting"+plification\'"ed(!r%$tude"%strad"#use',
+    '"%aemia$\'sthetic#%lytic#$rchy#\'tomical"&cestor&#ral\'!y#%hored#&illary"#des#(r&eacute$!e%!a"\'ecdotes',
+    '"$galo#$ered##led%#sey$#ian%"ng$*o-american##ola"\'imation$%osity#"ta"%nabel#*ouncements(!s$!y',
+    '&#ous&!y#&nymity#%rexia"(tagonism$&rctica##hem$+ropological,"st#!i$)-semitism$&biotic$(cipating%!s$#gen',
+    '$\'quities(!y$\'slavery#\'oinette$!n%!y##rim"%ymore!!p"\'artheid##thy""es#!x"$ollo$&ogetic',
+    '\'"ze#%stles"\'plauded#\'ointing#(reciable%\'hensive%&ntices$+opriateness%$ving%!x&\'imation"!r#$icot"#tly!&quatic',
+    '!!r"$afat#%minta"\'bitrage\'$rily\'#tor"$cade#+haeologists%"ic$&deacon$#ers$"ie"$dent#$uous"\'gentine',
+    '"!i#!d#&stotle#$zona"!k"$magh#&chairs#$enia\'!n"#oma%#tic#$usal%!e"\'resting#%ivals',
+    '"&tefact$#mis$$rial&"es%!y#)iculation$(ficially$$sans#$work!2s_a_matter_of_fact#\'between#$from"&bestos"\'cending$\'rtained',
+    '#%ribed"#ean"%htray"$ians#\'de_from"(piration%!e%"in\'!g"%quith"!s#%assin$&ulting$"ys#(emblages',
+    '$%rting\'#ons\'"ve&!s$%ssors##ign$\'milated)#ion#(ociative$$rted&$ment"#tra$\'onomers($ical(!y',
+    '!&t_most#%worst"&henian#$lete"$kins"%lanta$!s"(rocities"\'taching%$kers#\'endants&!s%%tions\'"ve##lee',
+    '!!u"$brey"%dible$#ted%#ion%#ory%!s##rey"!g#&mented#&ustine&"us"#nts$!y"&spices',
+    '%"re$\'ralians"*thenticity$)orisation#!o$%mated\'#ion%%obile"\'xiliary!$vail#(nt-garde"%enues#%raged\'!s&#ing',
+    '%"ed!%waits#&kening#%rding"%esome"%fully"\'kwardly"#oke!!y"&cliffe"\'lesbury"!r#%shire!)zerbaijan""iz',
+    '!\'ackbone$$lash$$side$"up"$dger&!s%!s#&minton"%ffled"#ggy"$kery"%lfour#$lets$#iol$$oons',
+    '$%ymena"$mboo"%ndage#%ished#$ners#$quet#!s"&ptized"&rbados%%rians$$ecue%!d#$clay#%efoot#%gains',
+    '##ked##low##man#$nard$"et%!y$!s%#ley#%oness%!s#\'risters#$thes%&olomew""sh##ics',
+    '%!s#$sett"$thed$%rooms$%sheba#$smen#&tersea$#led&%field"%varia""ys"$zaar!#cci!%eacon#!k',
+    '$#ing#$rded$"er$$ings#$tles$$rice$#tie#%umont"$cker%"tt$$oned$!y""de#)fordshire#$time',
+    '&!s"$ggar&!s#%inner(!s"%haves"#ige")leaguered#%grade#%iever(!s#"le$$owed#\'ongings#%ville',
+    '"#nds#\'efiting$&volent#$tley"&reaved\'$ment##ger##nie#$ries#"th#$wick#"yl"#set#%ieged#\'t-known',
+    '"$tray&#ing#!s"#van#&eridge%#ley")wildering($ment!"gs!+ibliography")carbonate#%ester#%ycles"$dder"%liary',
+    '#$ling\'#ham%#ons"#nds#$gham$!o#!s")ochemical($stry#)graphical#\'logists#*technology"#rch#\'kenhead#\'thplace',
+    '##ten!)lackboard%$ened%$ness%%smith##mes#"nc$#kly#$tant##zed"$each#$nded%#ing"%inded%#ing',
+    '%$ness%!s$!k%#ing#"ss#"tz"&ockade##kes#$ndel#%oming%!s&$bury#$ssom#!t"\'ueprint',
+    '#$ntly#!r#"sh%"ed!#nfl!!o""ar$#ded%$room#$sted"$bbie"#die"$eing"!g#"us',
+    '#$ivia#%locks#&shevik)!s$#ter##ted")mbardment%!y$"ed"\'na_fide$#nza##ded$#ing#$fire##net',
+    '#!y"!o#%klets$&seller*!s%$hops#$ming#!n#"ze"&rdeaux%#red&#ing#!o#%rower&$ings',
+    '#"om"\'tanical%!y##ham$%ering#%swana#$tled$%omley&!s"&ulders$%evard#$nded#$quet#!t$!s',
+    '##ing##led%"rs"#xed""yd#"le!"ra#"ce%!d$#ken&!t#%dshaw#"gg#&nching$#ded',
+    '#$vely%"ry#!y"&eached$$k-up$(thtaking#%eders#"nt%$ford#"tt#!w$"er&#ies#%zhnev"#ibe',
+    '#&ckwork#%dging$"le#&efcase%"ed#&gadier$%htest&$ness#\'lliance#&tannia$"on$$tany%"en#$xton"*oadcasters',
+    '\'"ed\'#ing%#way#&chures#$mley#"od%#ing$"ks$!m#+ther-in-law\'$hood##wne%"ie\'!s$!s',
+    '%#ing#"nt#&tality&"ly$!e"$yony!!s"!l!!u"&bbling"&chanan%$rest#$kets$"le&!y',
+    '"&dapest#%dhist$#ing$!y#&geting#!s""ff$#alo"!g#!s"&kharin"\'lgarian$!e$#ing#"ky',
+    '$!y%#ing"$mped%!r$#ing"!n#\'desbank&#tag$#led&!s#!k$"er#"ny"%oyant"%rdens',
+    '#\'geoning%!r%"ss$!h$#lar\'!s$$undy##row#$ying"%siest$"ly##tle%#ing"&tchers#%tocks',
+    '"%y-out"%zzing!+y_reason_of"#ron \'c&amp;p!"++!&abaret#$bage#%inets"#che"!d#$bury##die"*f&eacute;s"#ges',
+    '"$lais#\'culator%#tta##der#\'edonian#$ibre$,fornia-based*!n#&laghan$"er&!s##med$#ing#$orie"\'mbodian',
+    '&(dgeshire#&corder##den#$ille#\'ouflage#\'paigned)!r"$nary#"dy#%nabis#"oe$"ns#$tona#%vases##yon',
+    '##ped$#ing#$sule#!t$$ains$#ion%"ve&#ity$$ures&#ing"&ravans#)bohydrate%(niferous#&cinoma#%digan',
+    '#\'elessly$!y#$lton##men#%nival#!o$"le%#ina#(riageway%%ngton$#oll%!t##tel$$oons$%ridge',
+    '#"ve"%scade#"ey##ino#&serole%$ttes$"ie#"te$"ro$!s"&talyst&#tic$\'strophe*"ic#&chment',
+    '#$fish#\'hedrals$\'olicism"\'usation#&tioned"&valier!"bi!!c"!g!%d-rom"!s"!u!%eases#-u&scedil;escu$%sescu',
+    '"&ilings"(lebrates&%ities(!y#$lars")ntimetres$\'ralised(#zed$!s"%ramic\'!s#*tification\'"ed#%vical"\'ssation',
+    '""cs!,h&acirc;teau""ad#$ined$(rmanship#\'llenger#%ncery$$dler$!g$&nelled$!t%#ing#$pels$#lin#-racterisation',
+    '+\'tically*"ze$&geable$#iot%#sma(#tic$\'lemagne$"ms$$ters#$ssis#$teau$#ted&!r\'#ing#$ucer',
+    '"%eated%#ing#&cklist##eky$$ring&!o$#ses#\'mically$(otherapy#!n#&rished$%nobyl$$ries$"yl#)sterfield',
+    '$"ed"!i#!c$&hester$!k%!s#)ldbearing&$irth%$care%$less$#ean$#led%#ing%!y#%mneys',
+    '%#ing#%swick"&loride&"ne"(ocolates##irs#"ke$#ing#$lera#%pping$!s##ral$"es"%rissy#(omosomes',
+    ')!y""ub#$ckle#"nk%!s%!y!&inemas"#rca$#led%#ing$%ulate#(encester"%stern""te##ing',
+    '!#lad#%imant(!s#&mbered$!p%"ed#$pham$#ped#%rence%!t$%ified%#net%#ssa#$shed$#sed',
+    '\'!y#$tter##ude&!l#!w#$yton"&ean-up%&liness%$sing$%r-cut%#est$$vage#$ment#!o#&rgyman',
+    '"%icked%#ing#*ent-server&#ele#$fton#%mates$#ber##nch&"ed$&ically#"ps"\'ockwise#"ne%!s#&seness',
+    '#$thed#$uded%!y##ver#"wn"\'ubhouse#"mp%!s#&stered\'#ing"#wyd!"nd!$o-op%(eratives"#als',
+    '##ted$#ing\'!s"$balt#$bled#"ra""ca$%-cola##ked$#ney#$onut"!d#"ed")efficient+!s',
+    '#%rcion"%ffins"&hesive##ort"#ils#$nage$%cides$"ed"!l##der$$ness#&eraine#!i#(laborate%%psing',
+    '$$ects$$ided%#ery$%usion#(onialism$$rado%%ectal$$ssal#!t#%umbus""ma#"bo$&ustion#%edian$!t',
+    '\'!s##ics#%mando(!s$\'emorate%\'ncement\'#ing&!d\'"ed&%tator%&rcials$)issioning%$ttal$%odore%$nest',
+    '$#une&*iqu&eacute%#ter(!s#*panionship%!q%\'rtments%(ssionate$"el%&nsated%#ted$\'ilation&!e\'!r&#ing',
+    ')!t&#ins%\'emented&#tes&$xion%\'ication&"ed&\'mentary*!s$#ose&&itions&#ure$&rehend%&omised*!s',
+    '%(tational&"ed#$rade"(ncealing%&ivable*!y%$rted$(iliation%"se$\'omitant%#rde$&urrent#\'demning%\'nsation\'"ed',
+    '&!s$%ucive&$tors#"es##fer%&ssions$$ided%)gurations%"ne\'$ment\'!s%&scated$\'ronting#\'genital$(lomerate',
+    '$)ratulated%(egations#%nects$"ie$$olly%!r%\'tations#$quer\'"ed#!s$)cientious$%ented%+rvationists)#ory\'!e',
+    '$\'ignment$#ole&%idate%$nant$)picuously$&tables\'%ulary&%ntine*$ople(!s%\'ipation&&tuting%(ructions)!s#\'tacting',
+    '$)emplation+"ve\'%tuous%"nd\'"ed(!r)!s&#ted\'$ment%#sts$&iguous%%nents$$ours$)raception+"ve',
+    '&$dict&!s&\'vention%&ibutor+!s+!y&#ved%&ollers#\'vection%#ned&(tionally%)rsational\'!e\'$ions&"ts',
+    '%%yance)#ing&#ing&!s$#ict%\'ncingly$#oys##way"#oke$!s##led%!r$"ly#&perate&!s',
+    '*!s)#ing)"or"#ped$&nhagen#!s"$rals#"ds#&ollary#$pses#\'recting("ve%$late($ions%)spondents',
+    '$%osion##tex""se#%metic(!s$"ic$!o%\'politan%!s#+t-effective"&tswold"%ughed%#ing#(nsellors$\'tenance',
+    '\'!s%%rymen#%pling#\'rageous$#ier$%teous%#ing%#ney%$ship""ve$"nt$"rt"$ward##boy!!p',
+    '""su"!u!!r""ab$!s#&ckdown##dle#&ftsman#!g$!s#$shes#"te%!r%!s##ven',
+    '"&eaking$"my$%tions#(dentials#"ek#$ggan#"te#"we"\'icketer)!s##lly#(minology$#son#%ppled&#ing',
+    '#(ticising\'"ze"$oats#&codile#"ft#"ok%"ed#$pped##sby$)s-section%"ly#&uching#!w$"ns"\'ucially',
+    '#$elly#$mble%!s##nch#!x"#ypt#(stalline!#sce!!u""be$!s"$ckoo""es"&linary##ley',
+    '(#ing)"on#&tivate$&urally&"ed"(mberland&$some""nt"$rate##few#$ling#,rent-account$%icula)!r%!e',
+    '$"or#&tailed#$ving"%stard$%odial"&tbacks#!e#$lery##ter!%yclic%"st$\'osporin"\'linders"&nicism#$thia',
+    '"$stic!+zechoslovak &d\'arcy!#.c.!(affodils"&genham##ger"!l#"es#&gliesh&"sh##las##ton#!y"&mascus',
+    '""ne$!s#%gling#$iels##ube##zig"$phne"\'rkening$"ly#!t$"ed$!s"%shing"$wned"#zed',
+    '"!s!\'e_facto"$acon#%dlock#"ne#$rest$"ly"&bating#\'entures#"it#$tors"&caying#$eive\'!d$#ncy',
+    '$%ptive#\'isively#"ks#)larations&"es$$ines#"or%#ate\'#ing#&reases%"ed&!s"$duce&!d%#ted',
+    ')!s"&epened&#ing"\'feating$%rence#%iance&!t\'"ly$(ciencies(!t&"ts$"ed#$ries#!y"(generate',
+    '"&laying#(egations$$tion#"ia$)berations$$cacy&$tely$$ghts$&nquent$$vers#!l$!a"!m#!o$\'cracies',
+    '%!s""ng#"im$"se#$ning#*ominations$"te&!s#$sely$%ities#!t$$ists"\'parting&$ures#\'endants',
+    '&#ing#%leted&#ion$"oy#$osed#$rive#!t"(rivative*!s%#ing##mot#$rida"(scendant#$erts%$ving',
+    '$(rability#"ks#%olate#\'pairing%#tch("ed$#ise#$sert#)tinations$$roys"\'tailing%$nees#\'ectable&#ing&#ors',
+    '%&iorate*#ing%&minant+!s%#red\'#nce#&riment)"al$#oit"&utsche"&valued$\'station#%iance&!t%%tions',
+    '$#ous$$sing##oid$$lved$"ut"!w!(iabetics#%lects$#led""ce$!y#&hotomy#&kinson#%tates&"or',
+    '"$dcot"#ego##ter$#ing"+fferentials$#use&#ion"#gby#%ested&#ive##its#!s"&lemmas#&igence##ute',
+    '%#ion"#mly"!n#"ah#!e##ghy#$ners#%osaur"&ocesan"&plomat#$ping".rector-general(#ate(#ies&!s',
+    '(%ments$&ppears&%roved$$rray#&banded#$card$#ern\'$ible$&harges$)oncerting&&tinued%!s%&unting%$vers$\'redited',
+    '&\'pancies*!y%)iminatory$&ursive#$dain#(graceful%&untled$%usted#&honest)!y#*illusioned$*ntegration#\'mantled(#ing%#yed',
+    '("ve#)obedience$&rdered#&parate&#ity%#tch("ed$"el%#nse(!d%$rsal\'!e$(lacement$%osing$,roportionate',
+    '#)qualified#(regarded$#upt\'#ive#*semination%%nting%\'rtation$%ident)!s%%milar#%taste(#ful$+inguishable+"es$#ort',
+    '$$ract(#ion&$ught%&essing%\'ibuting*#ons%#ust#$used"%tches"#ver%%gence(!t%!s&)ification)"ed',
+    '$$nity"#zzy!!j!%obson"\'cklands#&trines"#dge$!y"$gged#"ma%#tic"#mes#&inates\'#ing%"ic',
+    '"$nate#$egal#$ovan""om#%rways""ra##cas##ian$!s#$mant#%othea##sal"#tty"$ubly$&tfully',
+    '##gal$!h""ve"&wnfall$%right$$turn!#rab##fts#$gons#%ining#"ke#%wback(!s$#led"%eaded',
+    '$"ry#$sden$#ser%(ing-gown)$room"$ifts#$lled%!s$!y#%nkers#!p#%veway#$zzle"#own"%ummer',
+    '"!s!%ucked#!t""el#!s""ff"#mps"!n##bar#"es#!g##lop"!o"!p#&licate',
+    '"%rable#%kheim"%stbin"#vet!%warfs"#ell%#ers"\'indling!#yed""ke"#lan"#son )eagerness"$ling"#rls',
+    '#$ners%$stly$!s#%rings#$thly%&quakes"\'st-west$&bourne$"on$%wards""ts!"bb!&choing"%lipse"&static',
+    '#$ador#\'menical!#ddy"$ging""ie""na"!s"%ucate&#ing&#ors!$erie!\'ffluent#)ortlessly""ta!"g.',
+    '"\'yptians!\'instein"(senhower!&jected!)laborated(#ion#$psed#\'sticity"&ective%#ors%*romagnetic\'\'nically#&gantly#&mental#"na',
+    '"$icit#(gibility#(minating#"ne#&sabeth$!e##tes#(zabethan""la$"nd"!m"\'ongated#%quent"#sie"#ton',
+    '"!y!(manating"(bankment$#rgo%!k&#ing##ody#%races&#ing$\'oidered)!y$%yonic"%erald$\'gencies$#son',
+    '#&grated\'#ion#&nently#$tted"#mie"%otive"%pathy#%erors#(hasising\'#zes(#ing%#tic($ally#$ires#&owered',
+    '#&tiness$$ying"!u#$late&#ion!(nactment##mel"\'chanted#$lave$%osing#$oded%#ing$%mpass)"es"(deavours',
+    '#&lessly#&oscopy$#wed#&urance%"ed")forceable&#ing"(gineered#-lish-speaking\'#men#%raved#%ulfed")hancement\'!s&#ing',
+    '##gma&#tic"%large\'$ment#%isted"%quire&#ing"%raged#%iched&$ment#%olled%$ment"\'shrined##ued"$tail',
+    '#)erprising%)tainments#%halpy$&usiast#%irety#&rances$&enched%\'preneur,#ial$#opy"#voy!!p"\'iscopal#\'thelium!"qn',
+    '$"te&!d#"ip$$ties$\'valence)"ts!(radicate(#ion"&ection"#nie#"st"%ratic#&oneous"\'uptions!!s',
+    '$#pes"\'pionage""rc"(sentials"!t#(ablishes##eem#\'imating("on#$onia#&ranged!"ta"$ched"%hanol#"el',
+    '#"ic$%opian#&nicity""on!%ubank"&phoria"$ston!$vade#(ngelical#\'porated#$sion"-er-increasing$#est"#ils"#oke',
+    '%!s#%lving!#wes!*xacerbated#\'ggerate)#ion#%miner(!s#(sperated)#ion"\'cavated\'$ions#(eedingly$!l$\'ssively',
+    '#\'itation%$edly#%ludes#&retion#&ursion$#sed"%ecute&$ions#&mplary%#ted&$ions#$rted"(hausting("ve#\'ibiting',
+    '"$iled%!s"$odus"%pands%"se#&edient&%tions$$nded&&itures$*rimentally+$tion*#ing##ire&!d%!y',
+    '&#ing%#its%&ratory&"er\'!s#!o$$nent$$rter(!s$&sition#&ulsion"$tant#\'ernally#\'racting%&dition',
+    '$&emists!%yeing#$lids#%sight""re +f&uuml;hrer!!1!$aber"$cade#)e-to-face$"ts#(ilitated)#ing#&simile#&ulties',
+    '"!g"&intest##rer$#fax$!s"$lcon#"do#$kirk#$sely#%tered"#med#%ilial"&nciful#"ny"#rce',
+    '##med$$land#$nham#$rell"&scists#&hioned\'!s#$ting""ts"#una"\'vouring!"bi!!c!!e"%argal',
+    '$$some#!t"!b"$eder"#lla$"ed"(mininity"!r#&dinand#"ns#&ocious#%ranti$"et$#ies#\'tiliser',
+    '"%stive&%ities"#tal#%ching!!i"$asco#!t"&brosis"$ddle%#ing#%elity#&uciary"\'eldwork""fe""gs',
+    '"&lename#%tered&#ing$!h"!n##ale%$ised\'"ts#"ch#(gernails&&prints&$tips#$nish#!s"!r',
+    '$#man$%works##mer#\'st-hand&$time#"th"!s##hed%$rman"$tter#\'zgerald"&xation!\'lagship#"ir#"ke',
+    '$#ing#%nders$"ks#%pping$!s#"re%!s#$shes$!k##tly$#ter\'"ed\'#ing#%ubert##via',
+    '\'!s#!w$"ed$!s"$eece$#ing$$ting%!s#$mish#!x"#ick%%ering%#ing##msy#%nched',
+    '#!p$#ped%#ing"$oats##cks#(orboards#&tation#(urishing#%wered#"yd"$uent##ffy##ids#(orescent##rry',
+    '$%tered\'#ing"#ynn!!m""ln!!o""al"&cussed"$dder"!e##tus"$lder#"ey#%klore"%ndant',
+    '$!s"(odstuffs##led$!s#$tage$&baller*!s$%paths$$wear")r_fear_of##bes$"id&$ding#%ceful("ly',
+    '#$earm$%going%%round$%igner$#see\'!n#(malities%$tive$\'ulating)#ons#"te$%hwith$%ified$\'y-eight"&stered',
+    '"&ucault#%nders$%tains#&r-year)$-old"$wler"#xes"#yer!\'racture(!d#*gmentation$%rance\'!t#$ming#"nc',
+    '%$esca$(kenstein%#ish%!s$!z#\'ternity#!u$&dulent$#ght"#eak#%edoms$$hold$#ing$%lance$!r',
+    '#\'shwater#!t"!i#"ar#$days#%edman$\'ndships#$nges#"tz#&volous"#ock#"me##nts##sty"!s',
+    '#)strations"$ying!"sa!$t-se!&ujitsu"$lham#&l-back%%scale$#est$$ness"%mbled"+nctionalist+"ty#)d-raising$*amentalist',
+    '$\'raising#%erals#"gi$"us"%rnace$#ish\'#ing#%thest""se$!d$$lage"$tile "ga"#ble""il',
+    '"&laxies#$ileo#&lagher%"nt$"ey$"on%!p%#way##way"#mma""ol"$ping"%rages#$bage#%diner',
+    '#$land#$rett##vey"\'scoigne#!p$#ing#&tritis"(therings#$wick"#unt""za#$ette#"za$"er!"dr',
+    '"%arbox$#ing$!s"!c"&danken"!e#"se"!m#"ma#!s"!n#(eralised("ty(&zation)"ed',
+    '$\'tically\'!s#"us")ographers("ic*$ally#\'logists#$rges%#ina"$sner!$hana"%ostly!$ibbs#&raltar"&gantic',
+    '&!d%#ing#!s"$lded#!t$!s"&ngerly"&ovanni"#psy"!s!&lacial%"er##dly$%stone#&morgan',
+    '%!s#$ring#(stonbury#$zing"!c"#eam%"ed#"nn"#ide$#ing#$mmer$$pses#"nt#\'stening#$tter',
+    '"#oss#"ve##wed"#ued"#ynn!!m!\'o-ahead"%blins"$dwin""gh"#in\'"&ldberg$$fish$#ing$%smith',
+    '##fer&!s$#ing"*od-looking$#ies$#man$#win$!y""re#"ge##man""sh#$pels"#ugh"#wer',
+    '$!s#\'cefully#$ding#%ffiti#!m$&ophone$$pian$!s#$nada$#dad%#dad\'&ughter%#eur%$iose$$ules',
+    '$\'hically%!s#%sping$#ses%$land%!y#"te%%fully#$vely%$yard$!y##zed"$ease%!y$%tness',
+    '%$wich&#ood$%tings"\'ievance%#ing%#ous#$ffin&"th##mma$#sby#"nd#!t$#ted"#oan#"in',
+    '$%venor#&tesque#%unded&%water##ves#$wers$$n-up%#_up"$ubby#%mbled#$nted!+uaranteeing$$ding#&temala"&essing',
+    '#&ldford%!s#$neas#"se"#lls$!y##ped"!m##mer"$nman$"en#$ners"$rder"$tter!#wen',
+    '!"ym"%psies$!y (habitual""ck$#ing$#ney")emoglobin%&rrhage""il#$rcut$\'dresser$!y#"ti"!l',
+    '#&f-hour%$past#%liday%"ng##ves"%mburg##ish#$lets#%mered&#ing&%smith#%pered$%stead$#ton"$ngar',
+    '#!k##son#"ts"\'phazard#\'penings$$iest"&rassed#%bours##den$#ing$$ness##ley#%monic\'#ous#!p',
+    '%!w#$shly#$tley#$well$#ich"#san##sle#%tened$!y"\'t-trick#$ched#"es#%field#!h##ing',
+    '"%ulage$#ing#"nt%#ing%!s"#vel#"oc"$waii#!k"#yes##nes#$ward""ze#!y!$cima',
+    '"\'adaches$$land%%ights%#ong$(mistress$&phones$\'teacher$#way$!y##led%!y$&thcare&#ier#"ps##rer',
+    '%!h%!y#$ters$&hcliff##ved%#nly$$iest%"ng"&brides"&dgehog%$rows""ed"#fty"#gel$$mony',
+    '"$lena%!s#!m$#ets$"ut##per&!s$(lessness%#ine#%sinki"!m"(nceforth$"ke##dry#%nessy',
+    '"%parin$#tic"&ralded#!b$"al#%cules#"ds##eby$)fordshire#$oine$!n#$ring"&sitant#!s"+terogeneous',
+    '"$witt"$yday!$i-fi""ck$!s"#des")erarchies"&gh-end%%level%\'pitched%\'quality%%speed%$tech$$bury$(lighting',
+    '"\'larious#)lsborough""nd$"er##ges"#rst"%s/her#!s$#ing#&tamine$(ological"%tachi#"ch""ve!"mi',
+    '#!o!%oarse"$bbes$#ies$!s"#dge"%ffman""gg"%isted"&listic#%loway##man#!t"\'me-made$(lessness',
+    '#(osexuals"!n#"da"$oded##ker#&ligans##mey##per##ver%!s"$pper$#ing#!s"$race##des',
+    '#%mones#"ne#\'rendous$$ibly%!d#%semen#*ticultural$"on""se#$pice##ted%"ls%"ss$\'ilities"#tly',
+    '#"nd%!s##rly#)seholders%\'keeping%%wives$#ton""ve$#red"$well#$ling!"ub"*ddersfield$#led"!g',
+    '#$ging"!m##ane##ber&$side#!e#%idity$&liated(#ing&"ty#$ming#%phrey"%nched"%rdles#%rying',
+    '""sh$"ed"(tchinson#!s##ton"!y!"vk!(ydraulic""mn$!s""pe$(rtension#%nosis#&ocrisy"&steria',
+    '"$nthe!#bid$!."%rahim#"ox!(ce-cream#$berg"#ons!\'dealism#\'ntities#\'ologies"#iom$)syncratic""ly""ol',
+    '!"e.!"gg"&nition!)ll-health#)egitimate#$icit$&terate#&ogical#!s#\'uminate)#ing*"on$%sions%\'trating\'$ious',
+    '!!m"%itate"&mersed&#ion#&igrant#$oral%#tal"%pacts$&irment$%rtial#\'eccable$%dance$%rfect#\'lements#&orting',
+    '%(sibility$$tent$(verished#(ractical$#int$&obable%#per%%vised#%ulses!\'n-depth"!."\'_aid_of$(nswer_to#%brief#\'case_of',
+    '$,roportion_to$)ursuit_of#)regard_to#$situ#(the_main#%vitro%"vo"*accessible$$tive#)dequacies)!y$)vertently#&ugural(#ted")carnation',
+    '$"st#\'idental#)ompetence*!t&*rehensible$)nceivable&&lusive%*sistencies,!y%\'tinence%\'venient$\'rrectly#(remental#&ubated\'#ion',
+    '"&debted$$cent$&finite$(pendents$#xed&!s#$ices%%tment$!e$%gnant$-stinguishable$)vidualism+"ty#\'onesian#%ulged',
+    '&#ing$-strialisation,"ed,"ts+&zation,"ed"*efficiency#"rt%"ia#(scapable#\'xorably$\'pensive%\'licable$(tricably"&famous',
+    '#"er%%ences%#red#%inity#%lamed%#ted&&ionary$&exible$#ict$"ux#\'ormally\'#nts&"ix&!s#%rared',
+    '*"ly$(ingement#\'uriated"\'genuity"%habit#$erit#\'ibitors)!y"&itials&$ting"$ject&#ing\'#ons#(unctions"(nocently',
+    '#(umerable"\'organic"&quired"$sane#&cribed&%ption#%ecure\'#ity$\'nsitive$\'parable$%rting\'"on#%iders$$gnia$%stent',
+    '$%lvent#\'pecting(#ons$%iring#\'talment*!s%(ntaneous$&ituted$$ruct(#ive(#ors#&ulated%"ts$"re&!r',
+    '$*llectually&(igentsia($ible$%nsify%&tional+"ly$!r%$-war%%_alia%&acting%$cept)"ed&%hange&#ity%*dependence',
+    '%%fered(#ing%,governmental%\'locking%)mediaries+!y&&ittent%)nationals%(personal&#lay&&reters%\'related&\'ogation&&upting%\'section',
+    '%\'viewers$%stine#\'imately%&idated)#ing*"on#+o_line_with$\'lerance#(ravenous$$igue%(nsically$)oductions$$uder%$sive"$vade',
+    '%#ing##ent&$ions\'"ve&"or$%rness%"se&#ion%(tebrates$(stigates*#ive*"or#(itations%"es#%oices',
+    '$)luntarily*!y"&wardly&!s!!q!!r"#ina#%shman"%oning$!s",regularities$(versible#\'igation$%table(!y',
+    '"#win!\'sabella"\'landers$!y#&ington"%otope"&raelis"&tanbul!(tinerary"!n!#vor!!x (jacobite#\'queline%!i',
+    '"$gged"&maican#%ieson##med"$nice""rs##vis""va!(ean-paul&%ierre"!d"\'fferson"#han"$kyll"!n',
+    '""rk"%ssamy$"ie"#tty"#wel"%zrael!%igsaw"#nny!&obless""ck$#eys""ey"%gging"*hannesburg#"ns',
+    '"#ked"(s&eacute#!e#!h#"ie"$yful#!s!!u"%daism"$ices"#les"%niors$#per"%piter"&rassic',
+    '##net"!s#(tifiable\'"es&$ying%!n %kabul"#ifu""ne#!t"%rajan$"te##pov"%shmir#%parov',
+    '$!y"(zakhstan!!b!&eating"$enly#$pers"%ndall""rb##nel#"ry"!v"%yword!$hmer"(rushchev!&idding',
+    '&#ped\'#ing$#eys""ev"%llers#&ometre"$nase#$etic#%gdoms$&fisher$$sley%#ton"$rkby#"ov##sty',
+    '##ten$!y!$laus"#ein!$nack"&eeling"&ickers#%tters""ob##cks#$tted#%w-how$%ingly$)ledgeable#!x',
+    '!"oi"$sovo!&remlin!$urds#!t"%waiti!#yle -l&eacute;onie!\'aboured\'!r&#ing&!s$!v#&yrinth"#ced',
+    '"%dders#"en##ing"!g""in$!g#"rd#!s#"ty"&keside"%mbeth#!e"!n#"ce#%dfill',
+    '$$lady$%marks$%owner#\'gbaurgh$#ley#$tern""ps$!e%!d""rk$"in"!s##ers##hed%!s',
+    '"#tch#%itude#%terly$#ice##via"&unches#%rence##tro"#wns##ton"$zily!#dcs"!p!&eaking$!s',
+    '#!r##sed$#ing#$vers"#dge%!r"&gality#$ends#(islators$(timately"#ila#&surely"&monade"$nder$!s',
+    '##nie$"ox"%opard$#old"&sbians##ion##ley##sen##ter"%ttuce"&verage%!s#!i$"ed"#wes',
+    '#!s!#iar"!b#+eralisation(&zation&#ted%"ia"%cense#!k$"ed$#ing""ds"(fe-style$$less%#ong',
+    '"%ghted%%house"&keness"$lies##ley""ma"%ndsay#$eage$#ker$!r#%field##ger&"ed$%uists#$kage',
+    '"$onel"#pid#%stick"%quids"$sbon$#urn#"sa#$tens$$ings"&terate#\'huanian#%tered$\'lewoods#\'urgical&!y',
+    '$"ry#(ing-room&%stone""za##zie$!y!!j!\'lanelli"$oyds!"ms!!o"%bster"\'calised$$ting##ker',
+    '"%dging\'!s"#fty"#gan"%mbard"*ndon-based&%derry&#ers#*g-distance$\'er-term$(itudinal$#man""om$"ed$#ing',
+    '#"ps##sen&"ed"#rna#%raine##ton"#ser%!s"$thar#$tery"#ugh%\'borough##isa#"sy"&vingly',
+    '$%level#$land$!y"\'yalists%$ties!!t"!p!&ucenzo#"ia$"en"$dens""is"&minous#"ps"#nar',
+    '#%cheon&!s"%rched#!e$!d#$king"$ther"&xuries!#yle")mphocytes&"ma"!n#"ch#"da""on',
+    '%"al +m&uuml;ller!$abel"\'carthur#$beth#&edonia#"ho##kay$%enzie#$lean%"od#*roeconomic"*demoiselle#"ge"#fia',
+    '##got#%ician#&nesium%!t$"us"%hmoud"#ids%$tone#$ling#"ne$&frames##sie#"ze"&j.-gen#%estic',
+    '""la$#ria$"wi$%ysian##ice%$ious$%gnant$!k#!l##one#!t$&ravers#$vern"$mmal&#ian',
+    '#\'ageable#%darin$&eville#&hattan#"ic$&fested$"la$(pulating##ned$#ing#\'oeuvres#&sfield#(telpiece#%ually&!s',
+    '$(factures$"re#%ville"!o"#ple##ped"!r#$ches$"os#&garine#%ianne$#lyn$#nes$"us#(ketplace',
+    '$$ings#(lborough#&malade#$quee%"is#!r$"ed$"ow##ton$"yn%!r#%xists"!s#"ai#(culinity',
+    '##sed$%ively#%tered&%piece&!y")terialism("ly$!y#$isse#%rices%&monial$"on#!s#%thews"#ura',
+    '"#vis"&ximize"$yhew!!c"!c#%arthy"&kenzie"$lean$#ish"%mahon!!d!#ead#$sles$&urable"&chanic',
+    '"%diate&#ion$%cinal$(um-sized"!l#\'ancholy#&bourne##low#$odic"\'mbranes#!o"&nacing#!d#\'ingitis#&opause',
+    '$"or#$zies"(rcantile$"er$\'handise$"ia#$ging##sey##ton##vyn"%ssiah%"ng$"rs$!y"\'tabolic',
+    '&&ysical#+eorological$"rs#$hane#\'iculous##ric$!o%%polis"#yer!!i"!5"!6"#ami"%chele#"ky',
+    '%)processor%&scopic"\'d-1970s&#80s#&dleton#!i#&summer##way$#eek$#ife"%grant\'!s%"te"%khail"%lburn',
+    '#$eage#&itancy\'"ts#$king$!y#\'lennium$"ie%&metres%"ng%&onaire$$wall"#mic"#nce#%dless#"er',
+    '#$ibus$$mize#!k##oan#$ster"(raculous*"ly##iam#%rored"+scellaneous$$hief\'$vous$&onduct#&erably#\'fortune',
+    '$%uided##led#&placed#.representation#)sionaries#\'takenly$!y#*understood"#tch"&xtures!%mol/l!#oan$"ed$#ing#!t',
+    '%"ry"!d#"em$&ration%(nisation(!m(!t\'"ty\'&zation$$stly&!y#&ifying#$ulus"%hamed%#mad',
+    '"#lar#"es##ten"!m#&entary&#ous""na$"co$$rchs$\'steries#$days$!e#%golia##ica$"es',
+    '$&tonous$$xide#&strous#"te$$rose#\'umental"#ods$!y##red"!p"$rals#&bidity#%occan#*phological)!y',
+    '$$uary"%slems##que%#ito""th$)er-in-law&$hood&$well$!s##ifs$$lity$&onless$$vate\'#ing(#ons',
+    '%%cycle%#ist%#ola%$ways#"to"&ulding%!s##nds$*taineering(#ous%&batten%!s##sse#%thful"%wbray',
+    '!"ph!#rna!"sc!!u""ck#"us"$ddle&!d""gs"&hammad"*ltilateral%)nationals%)plication)#ity("er',
+    '""ms"#nro"\'rderers&#ous#"ky##mur"#sed#%hroom#&solini##ter""te$!d!\'yeloski"(ocardial"$riad',
+    '$"ic"&thical$%ology *na&iuml;ve"%gging"!h"$iled#$robi"!m"#omi"$pier##les#$pies"&rrator$%owing',
+    '$!l#!h"-tionalisation*"ed)$ties)&zation*"ed$#ves#\'uralist"$usea"\'vigator"!y##lor!"cc!!e',
+    '$#ing#"th"*cessitated(#ies#%klace"!d"#edy"(gatively#&ligent#(otiators",ighbourhoods#"ll""ll$"ie""on',
+    '")rvousness"%sting"$ther#$ting#&worked"%urons%#tic#$tron\'!s"\'w-found##ark#$born$#ury##est##ham',
+    '#$port#"ry"!z!$iall"&candra#"er##ked$$name(!d"\'etzsche"&gerian#&htclub%"ly%%mares""ki',
+    '"!p#$ples"$ssan"%xdorf#"on!#oah"#bel##les"\'cturnal"%isily"#lan"%madic#"es#&inally&"te',
+    '")n-aligned$)executive&&istent$$stop$&verbal#*conformist"$reen#$iega#&mality%$tive##ris#(th-south%(allerton%$east%&umbria',
+    '&#est""s.#&talgic"\'tebooks$&worthy#\'iceably$(fication%!y$$onal#"ts"#uns""va#&elists#$ices""wt',
+    '!%uclei""de##ged""ll""mb$%ering#$eric"$rsed%$ries#%tured (o\'connor"$hara!#aks"#sis""ts',
+    '"&ituary")jectively"(ligatory%!e$#que$$vion\'"us"\'scenity$%urity#\'ervable\'#nce\'$tory&"es$%ssive#%olete',
+    '&!s!%ccult$%pancy\'!t%#ier\'!s$\'rrences"%eanic"$tave!%dours!"ed"!m"*sophagitis!%ff_of#!a',
+    '$#ror#$side!#hio!#ily!,ld_fashioned#%field"-igonucleotide##ves%#tti$"ia"%ympia!%mally"\'budsman"%inous#&ssions',
+    '#$line".ce_and_for_all"%e-man$$time%%o-one$#way$$year#$rous"!o"\'slaught"%tario#(ological""us"$ward!%paque',
+    '#\'n-ended$"er$$ings##ras%$tive"\'pressed!&ranges"%bital%!s"!c#\'hestral#!s"&dained#\'inarily&$tion',
+    '"$ient&$ated#(ginality(!s\'"te(#ing"%lando#$eans"&nament("al(!s$"te"%phans"\'thodoxy"$well',
+    '"%borne"!f#"/1"$wald!$tley"%toman!$unce"$sted")t_of_date#&breaks$$urst##cry#%dated$$oors#$fits',
+    '##lay$%ining#(numbered#\'patient#&spoken$(tretched#%weigh!\'veralls$$came%#oat&$ming%&rowded)#ing$$dose%$raft',
+    '%"ue$$flow$%grown$$haul%$eads\'"rd$$look$$ride$#see%\'hadowed$$take(!n%"ly%$ones%%urned',
+    '!!w"#ing"$ning!$xfam"#ide%!s!%yster \'p&amp;o"*eacute;rez"(lt;0.001(!1(!5!%acing#%kaged"(ddington',
+    '%#ing$#ock"$ired"\'kistani"%laces$#zzo#$ette#!s"&mphlet(!s"*ncreatitis#%elled#%icked#%orama#!s',
+    '$%omime"$pacy#%illae"#ra.$#ble$\'doxical$$ffin$(military$$noid$#pet$$site\'"ic#&chment#\'enthood&#ing',
+    '%#ian$"ty##kin#(liaments#&ochial$"dy$"le##rot$!y#$sley$"on#%tisan"!s#\'sers-by$(ionately',
+    '$%ports$$word##tel$#ime$"or$$ures"$tchy#"el$$nted&!s$$rson#)hogenesis%\'logical)"st(!y',
+    '#(riarchal%%otism$#ols%&nising#&terned\'#ing&#son"$uses$#ing"#ved""wn#!s"$yers#"ne#$roll',
+    '!!e"(acefully%\'keeping%$time##ked#!r$"ls"%bbles""ck#\'uliarly"#dal#(estrians#%igree#"ro"$eled',
+    '""gs"$king"$llet&!s"&mbroke"%ncils#%dulum#%elope$&trated(#ing#$nies$(sylvania#%tagon$#ium"$ptic',
+    '\'!s"$r_se#"ce%&ntages%%ptive\'#ual$!h#$dita#&ennial#"il$(odically*!s$%phery#$kins$!s',
+    '$\'issible("ve#(secution$"ia%\'stently\'!s$#ona#&tinent#&vasive")ssimistic#&ticide$!s"$tals#&itions"%ugeot',
+    '##sed"!d"(enomenal"*iladelphia$$ippe$#lip$(osophies"$oebe#%nemes%#tic$#ing$(ological"%yllis#\'sicians\'"st',
+    '%%ology&)therapist!&ianist##zza"(ccadilly#$k-up$%ering%!t$"up&!s#&torial"\'ecemeal#$rced%#ing#"ty',
+    '#$ment"&lgrims##ing#\'kington#$lows"%nched#&eapple#%nacle#%point"\'oneered\'!s#"us"$ping"$rate&!s',
+    '"%tches#%falls#!t"#vot!&lacebo%%ments#$gued#&netary$!k%!s$#ner$&tation*!s#$smid&%nogen',
+    '#%tinum$!o%"on$!t#%y-off$&wright"#ead$!s%&urable#$dges"%otted#%ughed&#ing#!y"%ucked',
+    '$!s#!m$#age$$bing$#mer#%nging##ral&#ism(!t!"np!\'oignant#&ntedly&!r\'!s""ke',
+    '$!r##ing"!l#)icyholder$%shing$&teness##led%!n$#ock$&utants&"ed&#ing#!y$%ester$&merase',
+    '$%thene"%mpous"&ndered##ies"$oley"%pping$!y#!s#&ularly&#ted%#ist"\'rcelain#!e$!s#!n',
+    '#%ridge#$sche#&tadown%!l$#ers$&folios$$land$#ray\'"al"$sing$&tivist#$tage$%cards$#ing$#man',
+    '($ment$&script$&ulated"\'tassium#$ency##ted"!u#"ch#$ltry"%werpc!)ragmatism#!m##wns"*e-existing$&school',
+    '&"ed\'!r#\'carious%%ution$#ede\'#nce("ts$\'ipitate+!d*#ion$$lude$%ursor#&datory$)etermined$\'icament',
+    '\'#ive\'!s#)ferential#(historic#\'judiced#$lude#(maturely$$iere\'$ship%"se#%ntice#+occupations#(paratory&"es#)requisite',
+    '#)sbyterian$$cott%$ribe(#ing\'&ptions$\'ent-day$#ses$\'upposes#(tensions#$view"\'iceless$!k#\'esthood#(ma_facie%"cy',
+    '$"er#\'ncipals$#gle##vet##zed"+obabilities$"ed$#ing$+lem-solving#%claim(#ing$\'urement#\'fessors#&gnosis$&rammer',
+    '%%esses(#ing#%hibit#\'jecting#%lific$#ong#(minently$$otes$%pting#$noun\'"ce\'!s##ofs#(pagation$%elled',
+    '$$hecy&"ts$&onents$\'rietors$!s#!s$%ecute)!d$&pectus&!r$!t%%itute#&tector\'!s$%ocols',
+    '#%vider%"so$\'ocation)"ve%$king#$wess#"xy"&udence&$tial#$ning#$ssia\'!n!$salm"$yche%\'iatrist',
+    ')!y%)oanalytic&)logically!!t!,ublic-sector&$ised%$shes"&ddings""ff$"ed"\'lmonary#!p$"it"%nches%#ing',
+    '(#ion#&ishing&%ments$$tive##jab#$ters"$ppet&!s$#ies"#rge#%ified$#tan#*pose-built\'#ful##sed',
+    '"$shes"&tative#!t"%zzles%#ing!&yjamas"&renees "q.!!b!"pr!%uaint##ker&!s#&lifier#%ntify',
+    '$)ter-final%!z"$ebec#\'ensland$!r##ues"&ickest#$eter#$gley#&vering "ra"!b#"bi"(cecourse##ket',
+    '"\'dcliffe##ial%"nt$&calism$)oactivity%!s"$ffle#!t"#ged##ing#!s"$ided%"rs#%lings#%ncoat',
+    '$$fall%&orests$!s$!y""ke"%llied&!s"&mblers%#ing#$pant"%ndall$$olph%%mised&"ly$!y',
+    '##ulf"$pist#$port"$rity"*tification&"ed$"on&)alisation("ly&#ing&!s##tle%#ing""ve$!n',
+    '!)e-elected(#ion"&acting&%onary#%dable$&ership$&y-made#\'ffirmed#&l-time$$ises&!t\'&ically%$zing$"ms#!p',
+    '#$ring#+sonableness"$bate#\'ellious"\'ceivers$%ptive$"ss#&koning#$laim\'"ed#)ognisable\'%zable("es$(llection,!s',
+    '$&nciled%)naissance%%sider&\'tituted\'$ruct+"ed$%rders$\'verable#%reate#&tangle$#ify$#ory#&urring"$dcar#%eemed',
+    '#+istribution#$wood"#efs#!l$#ing#!s#"ve%!s""f.#%erees&$nced#\'inement%#ing#(lectance\'#ive',
+    '#(ormation&#ing\'"st#$rain$\'eshment+!s$(igerator##und$\'rbished)$ment"#gal#$ency#&iments$\'stering#$rets',
+    '*!y#\'ularity\'!s&#tor)!s"(hearsals\'"ed""in$)forcement-!s)!s(#ing$&stated#\'terated"&joined',
+    '$&tivity$!y#&egated$&ntless*"ly#%iably$"cs$%eving$&nquish"!m##and&"ed#&brandt#%edial$\'mbrance',
+    '$%ssion#%nants#$orse$$tely$#ves"%named#$ders%%zvous#&ewable#\'ovation#$ting#$wick"&opened#+rganization"!p',
+    '%$ring$(triation$&yments##eal$)rcussions#)lacements$#ica\'$tion$$ying#\'ository#&ressed\'#ive$$ieve$(ocessing%&ducing',
+    '#&utable%"ed"\'quisite"(searched)!s(#ing$&mbling$"nt&#ful$&rvoirs##ide&!s$&lience$!n#\'olutely',
+    '$$rted#+pectability\'#ful$#ite#$tart$\'raining("ts#\'umption$&rgence")taliation$$rded#$hink##ina#\'reating$\'ibution',
+    '"+unification%#ted"\'verence%$sing\'"on%!t&"ed##ise%$ions#,olutionaries*!s%#ver&#ing#&ulsion!)hetorical',
+    '$!o"&odesia"#yme%!s!#iba#$bons""ca##hes$"ie$$ness"$ddle##ges#%icule##ley""fe',
+    '"&ghtful#$idly#\'orously"#ley"\'ncewind#!d#"se"%oting"#pon#$ping$"le"$sked$#ing""ta#$chie',
+    '$!s"#ven!!o"#ach#%dside#!m"%bbers$#ins#$erto$!s##ins##ots"&chdale$!e#$kets',
+    '"!e"#gue"#han##mer"%llers$\'s-royce"(manesque%"ov#"eo"%ofing#&sevelt""sy"$tary$"te%#ing',
+    '$&weiler"%ubles#"ge#%nding##rke##sed$$seau#&tinely"%wland"&xburgh"$yals%$ties!&s/6000"!c""pb',
+    '!!t!#uby"&cksack"$dder#(imentary##olf"&efully"%ffled"$gged"&moured#!p"$n-up#$away#!e#&ner-up',
+    '"%shdie$"es##kin##son#!t$"ic"(thlessly!&yedale \'saatchi"%bbath#%otage"%cking$!s#\'rificed)!s',
+    '"!e"$fari##est""ge"$hara"$lads#%esmen%&person#$ford#$ient$"ne$"va#"ts##ute#$vage',
+    '"&mantha#"my#$pled"(nctioned#$dals$#ers$%stone#!e#%itary%!y"!p"%rcasm#%donic#$ella##tre',
+    '#&isfies#\'uration"&ucepan%!r%!s#"na"&vagely##ers#$iour#"oy"$xons!!b!*caffolding##led$!p',
+    '%&inavia$#ner$!t#$rred$!s$!y#%thing$#ter"\'enarios$"ic$#ted"(heduling$(llenberg$"ma#*izophrenia',
+    '#&ofield$*olchildren&$girl&&master",ientifically"#oop%"ed##rer$!n$#ton#"ut"&ramble\'#ing$"pe&!d',
+    '%#ped%!s#(ewdriver#$ipts&#ure)!s#%olled#%ubbed$#ffy$!m%%-half"&ulptor!!d""lp"!p',
+    '#!m$"an$!s#%soned&#ing"!c#&ession#%luded#(retarial&#ive#!s#!t$%arian#%urely"(dgefield',
+    '%$tive"\'edlings#(ing_that"*gmentation#\'regated"%ismic#$zing$#ure"#lby#\'ections\'$vely&#ors&!s#,f-confidence(&scious',
+    ')#rol%\'defence\'+termination%\'evident%$help%(interest%+sufficiency.!t#$kirk#\'lafield##ves"!m#&antics#!i"&nators',
+    '#"na#(sibility$#ual"#oul"!p#&arates\'#ist"$quel%%ncing&!t\'#ial""rb##ene##mon&!s',
+    '#%viced\'#men"%tback#!h##tee$#les%"or"$vens%.teenth-century#$ille"$wers#!n"$xism%!t"%ymour',
+    '!%haded$#owy$!y##fts##kes#!m$$eful$"ir$#poo#%nghai$#non#)reholding$!k%!s$%pened',
+    '%$ness#\'ttering#"un#"ve%!d$#ing#"wl"#ear%"er#%dding$!s#"en##ikh#%lling$$ters',
+    '#%ridan$#man$$wood#)vardnadze"!h"%ildon$$ling#\'mmering##nes$#gle#)pbuilding$$ment(!s#"re##ver',
+    '##cks#\'pkeeper*!s#&rtened&"st%$hand#"ve%!d#%wdown$$ered&!s$$room"$rank##ill$"mp',
+    '&#ing#%ouded#"ub$"nk"%udder\'#ing#$ffle\'!d&#ing#%tters%#ing!"ib#%erian#%lings"!c',
+    '#&kening$"ly"*de-effects$!d##ney"%ghted#"ma#(natories$%ified&!y"&lenced#\'houette#"ky#!l#$very',
+    '$#ons#+plification\'!y&$stic#&ulated"\'ncerity$$lair#$gled$!s$\'ularity#"ks#&n_fein"!p#$ping"#ren',
+    '"#ted"&xpence!\'keletal&#ons$#ton#%tched"\'ilfully#$mmed##nny#!s"$ulls""ye#$line!$labs#%mming',
+    '#"sh##ter%!s#(ughtered"#eek$"ps"#ick#"ng#%ppers#!t"$oane#$gans#$ping#$tted##ugh',
+    '&"ia$$enia"&uggish#!m$!s#"ng!$mack%"ed#(ll-scale#$rtly"#ear#$lled%#ing%!y"#oky',
+    '&#ing""ug$$gled&#ing"#yth!$nack%!s#!g#"il%!s#%pping$!s#$rled##tch"#eak',
+    '%#ing"%orted#"wy"!p!(o_called""ak$#ing#!r"!b##bed$#ing"+cialization#!k$#ets""da',
+    '&#ing$$ness""ho"!l#%emnly$!s#$idly%!s$$tude#$omon#$uble#%vents"$mali##bre#\'erville',
+    '##ata#"ic#"ny"&othing"$phia"\'utheast&"nd%$port%$wark#%venir(!s"%viets"!w#!n!%paced',
+    '#"de#&ghetti#&niards$$ning#)rcstation$#kle$"se$"ta&!n#"te#%wning"!d"#ear%!s#+cialisation',
+    '*!s)#ing($ties(&zation\'!s%$fies$#tra&!e#!d#%edily#$lled##nce"\'hincter"#ice%!s',
+    '#"es#"ke%!s#%lling%!s$!t#"re$$ited&&uality#"te$$fire$$ting"&lashed&#ing#&endour',
+    '"&oiling%!s%!t#&kesmen&&person#\'nsoring#%radic$%tsmen#%tting#$uses"&rawled&#ing$#yed%#ing#)eadsheets',
+    '%#kle%!t##uce$"ng"&urious$#red"$ying!"ql"$uads$$rely$$shed$!t%$ting#&eezing##ire',
+    '!!s!\'tabbing##cks#$ffed%#ord(%shire%!s#!g$$nant#&inless%!s$!r#"le$!k%!s',
+    '#$mina$$ping#$ndby%%point%%still$$ford##ple##res$$t-up%#ers$"ve&!d#$tely%$sman$&ionary',
+    '%$stic$#ure#$unch"#ead$#med#"en$#ply$#red##fan#"in#$mmed%#ing##nch#\'pfather$$hens',
+    '#\'reotype*!s$#ile#!w"&ickers#&ffened%$ness$#led##gma#"le$%lness#%nging$$king$!t#\'pulated',
+    '%$holm%$port#%ddard#"ny##ols$#ped##rey&!s$$ming%!y"&rachan$&ighten%"ts$%ngled$$pped',
+    '%(egically%)ification$#uss$(wberries)!y#&eaming$%nuous$%ssful$"wn#%icken%#ter&$ures$$dent&!s%#ing',
+    '$$kers%%ingly$%pping$"ve%#ing#%oking$%lling$&nghold$"ud#*ucturalist(#ing$"ng""ud#%ffing#"mp',
+    '$!t#&pidity#&ttgart"$yled$#ing!!u"*bconscious#+ject-matter\'%ivity#$lime#\'marines$%erged$&itting#*ordination#!s',
+    ')!d\'&ptions$"et$$ided\'#nce&$ised$\'titutes)#ing%$rate#%tlety%!y#\'version("ve"&cceeds$%umbed',
+    '#!z"&ffrage"(ggestive"&icidal#"ng#(tability$%cases$"es"$llen#%phate"\'mmarise\'#zed$\'erchild&!s$"on',
+    '"(nglasses##ken#$rise"&perbly%#ego%(ficially&%luous%\'imposed&#ors%\'natural%%seded&#tar\'%ition%&vising(#ors',
+    '#&posing#!t""rf$$aced##ged#$name#&pluses#&rounds#%vivor"*spiciously#\'taining"%zanne!#vqs!)wallowing\'!s',
+    '%"ed#"ns#!y$"ed$#ing"&earing$"ty#$eney$"ps$&theart%"ly%$ness#$lled"#ine#%rling',
+    '"$ords!%ybase#"il"\'llables&$uses#&vester$"ie"\'mbolism#&metric)"al#,pathetically\'#ies$%osium$\'tomatic"\'ndicate',
+    '$&nymous"&philis"#rup"&stemic %t\'ang!\'-shirts!"ab#$itha##led%!t$#oid\'!s#"oo"#cit#!t',
+    '""gs""it"&ke-off&#ver$%overs"$llis$!y"#mar#!e#"il##muz"$ndem##gle##ker##ned',
+    '#%trums#%zania"#ped$$stry##ing"!r#!a#&geting##mac#!t$"an"%sting$!y"%unton#!t',
+    '"#wny"%xable##ing$!s!%cp/ip!!e"\'am-mate$"ed$$work##pot#!s$!e"$bbit"!c#!h',
+    '"#ens#%sdale"$hran"&legram$%vised$!x#$ford"\'mperate&"ed$$late%$eton$!o$!t"\'ndering&"ly',
+    '&!s#"or#&tacles%&tively$!s#$uous"%rence#&minate&"us#%raced$\'estrial$#ier#%tiary"#ssa#%tator',
+    '"&xtbook$#ual%#res!4h&eacute;r&egrave;se"&ankful%#ing%$s_to#%tched\'$rism#!w"$efts#%matic##nce#!o$\'logians',
+    '#\'rapists$#ein%"sa&!e"%icker%"ly#$nker\'!s$#ner%#ing##rst&!y$\'ty-five\'#six#$stle',
+    '$"ne$"pe"\'rashing#&ee-day&(year-old%!s#%iller&#ing#$oats$%bbing$"ng$$ttle##ush%$ting"!u',
+    '##mbs$!p%#ing"&warted!$ibet"$cked$#ing"#des""er"$ghts""le$!d##ler#!t"%mbers',
+    '$*_and_again$!d$$less%!y$&tables#"id"$nned"%pping"\'redness$$some##ing"$tled#!s"$voli!#ncs',
+    '""ad"!d#$dler"$kens"&lerant"#mbs"%ngues#"ne"%pical#\'ography#$ping$#led"!r#$ches#$ment',
+    '#$quay#$rent#"so"%ssing"&tality%#led%!s"&ughest##red"!w#%ering#%nship(!s"$xins"$yota',
+    '$$tion%!s$!y#&desmen#&falgar$\'ficking#\'gically##ils$!t%"or#"mp$!s$#way#%nmere$$quil',
+    '$)satlantic%\'cendent&$ript*!s%*formations&%usion%%istor&%tions%&lating)#ons("or&%ucent%#mit(#ter)#ing',
+    '%*plantation&&orting%%verse#%verse#"ys")eacherous$$ding$#son$$tise##ble#!k#$mble\'!d$(endously#%nches',
+    '#%spass"\'iangles#$bune#$ckle#$dent##fle#%ggers#$mmed#%nidad#\'partite$#ped#)umphantly\'!s"&ophies$#ics',
+    '##ugh$#ser#!y"$uman$#pet##nks#%sting!"sb"!p!"ub#)erculosis#$ular"!c##ker"!e',
+    '$#ing"$mble%#ing""na##dra#"ed#"ic$"ng$#sia"#ppe"%rbine$!o#%nbull$#out#&quoise',
+    '"&torial!+wenty-eight\'$nine\'%seven("ix\'%three"(ickenham#"gs#%light##sts#%tched"%o-day%*imensional$$tier$#way',
+    '#!s!$ying"#ler"%ranny"#son $u.k.!)biquitous!#cta!"df!#efa!%ganda!!h!$ltra!%mpire!*nambiguous',
+    '#)ttractive#)uthorised#(vailable$\'oidable"(balanced#\'earable##orn#%roken"%canny#(ertainly##les#+ompromising$)nditional%&nected%(sciously',
+    '*"ed$#ver"-der-secretary%%class&$over%(estimate-!d%)graduates\'$owth%$line)!s%&mining%$side%%taker)!s',
+    '\'#rld&&riting#(isclosed%&turbed#!o$"ne$%ubted"&easily#(quivocal#(xplained"&fairly$(vourable#\'inished$!t#%olded',
+    '$&reseen"\'happily\'$ness#&ealthy$%lpful"*identified#&formed\'#ity\'"ly#\'lateral#(mportant#%onism#\'queness##son$"ys',
+    '"$just"$kind"&leaded%$shed"&marked"%named#&oticed"(orthodox"(prepared$(oductive")qualified$*estionably"$real%\'sonably$&solved',
+    '#)crupulous#&ettled#(pecified$$oken#+uccessfully")thinkable##idy#!o#&reated$"ue"$well#*illingness$"se$\'ttingly!\'p_front',
+    '"&graded&#ing"&heaval##ill##old"$land&!s##ift"\'permost"&rising##oar"!s#&etting#$urge"$take',
+    '##urn!$rges"%inary"&quhart"$sula"%uguay!%sable"#her%"ed!#tah"!d"%ilise\'!d%&tarian!!v',
+    '$$tion#(cination&!e"$gina&!l""in"\'lentine#&idated#&uables%%tions##ves"\'ncouver#&dalism&!s#$essa',
+    '##ish$"ty#!s#$tage")riability$%ously#$nish"&scular#"es"#ult%!s"!x!&ectors"#gas"(hemently',
+    '"!n#%ables#%etian#&geance#"om#!t$#ral%&icular""ra##dun#)ification&"ed%!y$"ty#\'nacular',
+    '#%onica#\'sailles%&tility#\'tically""st!"ga!&ibrant%%tions"&carage#*e-chairman#$kers$!i$!y#\'torious"(ewpoints',
+    '#$lain%!s""ne$#gar$%yards#"yl"#ola%#ted&$ions"#ral""sa#%count#$ibly$%onary"%tally',
+    '!\'ladimir!"ms!%ocals$$tion"#dka"#gue"(latility#$cano\'"es##ley#%ogsky"#mit%#ing"#ter"%ucher',
+    '#"el%!s!%ulgar %waged##ons"$iled$#ing#&stcoat#$ters$$ress$!s"\'kefield$!s"(ldegrave##esa',
+    '$"is##nut#$sall#$ters"(ndsworth#!g"%rdens#!e$&houses$!s##ily#$m-up#!p#\'ranties#)wickshire',
+    '#!p$!s#%teful"&tchdog%#ful#)ercolours%"ed%$fall%%house%#ing%%proof%$shed%$ways%!y#$ford',
+    '"#ugh"(velength*!s"%yward!!c!%eaken#&thered\'#ing#"ve%!r&!s"%bster"&ddings##ged$$wood',
+    '"$ighs%$ting"&lcomes#)l-defined%+established"$rner"!s##sex##ton"&tlands!"ha#$ling#"rf"$ence#&reupon',
+    '$!s#!m#%pping$!s#"sk$$pers$$tled&#ing#%taker$%bread%!y$(e-collar%%house$$lock$#ney',
+    '#"re!!i"$cker$#ham"\'de-eyed$!n$"st##nes#$owed"!g#"ht"$lcox#"de%!r#"ko',
+    '$"ow$!y##ton"$mpey"$nced#(dsurfing#!k$"ed##nie"#red##ing"$sely$!r"(tchcraft%"es',
+    '$\'drawals(#ing$$held%#old(#ing#\'nessing%!y#!s#)tgenstein"$zard!"lr!\'olfgang#*verhampton&#ton""mb',
+    '##ded$%lands$$work$!y#"lf$#ley%!y$$wich#$snam")rdperfect#%kable$%house#$ldly#%sened&#ing',
+    '#&thless"&unding!\'rapping#"th"&eckage#!n$$ched#&stling#$xham"&inkled"$ongs#$ught"#yly!$yatt"%combe',
+    ' &x-rays!!.!%/open!$erox!!i"!v!!v &yachts""le"#rns"#tes"$wned$#ing!\'ear-old$$ning',
+    '#"ts""ll$#ing"#men"!w!\'ielding!&oghurt##urt"#rks!"rs!!u!%vonne $zeal"#bra"$inab',
+    '!"ip!"oe""om!%urich"$waya',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_04 = (
+count_04 = 6694
+
+heads_04 = (
     '&aelig;thelred',
-    '&agrave_la',
-    '&dollar',
-    '&dollar;1,000',
-    '&dollar;10',
-    '&dollar;10,000',
-    '&dollar;100',
-    '&dollar;500',
-    '&frac14',
-    '&micro;m',
-    '&pound;1.5',
-    '&pound;1.50',
-    '&pound;1000',
-    '&pound;120',
-    '&pound;14.99',
-    '&pound;150,000',
     '&pound;16',
-    '&pound;2,500',
-    '&pound;2.50',
-    '&pound;2m',
-    '&pound;3.50',
-    '&pound;3.99',
-    '&pound;350',
-    '&pound;3m',
-    '&pound;400,000',
-    '&pound;45',
-    '&pound;450',
-    '&pound;4m',
-    '&pound;5.99',
-    '&pound;5m',
-    '&pound;6,000',
-    '&pound;70',
     '&pound;700',
-    '&pound;750',
-    '&pound;8,000',
-    '&pound;800',
-    '&pound;9',
-    '&pound;90',
-    '&sgr',
-    '&thgr',
-    '\'80s',
-    '\'ad',
-    '\'cause',
-    '\'is',
-    '\'t',
-    '+0100',
-    '-gen',
-    '0.3',
     '0.4',
-    '0.6',
-    '0.7',
-    '0.8',
-    '03',
-    '07',
-    '08',
-    '0800',
-    '1&frac12',
-    '1&ndash;0',
-    '1&ndash;2',
-    '1&ndash;3',
-    '1(1)',
-    '1,300',
-    '1,800',
-    '1-2-3',
     '1.0',
-    '1.9',
-    '1/2',
-    '10-year',
-    '10.1',
-    '10.2',
-    '10.30am',
-    '10.5',
-    '100g',
-    '100m',
-    '107',
-    '10p',
-    '11,000',
-    '116',
-    '117',
-    '118',
     '11am',
-    '12&ins',
-    '12-year-old',
-    '12.5',
-    '121',
-    '122',
-    '126',
-    '129',
-    '13,000',
-    '1300',
-    '131',
-    '132',
-    '133',
-    '134',
-    '136',
-    '138',
     '139',
-    '14%',
-    '14,000',
-    '14-year-old',
-    '141',
-    '142',
-    '143',
-    '144',
-    '145',
-    '146',
-    '147',
-    '148',
-    '149',
-    '15-year-old',
-    '150,000',
-    '151',
     '152',
-    '153',
-    '154',
-    '155',
-    '156',
-    '157',
-    '158',
-    '159',
-    '16,000',
-    '16-year-old',
-    '1600',
-    '161',
-    '164',
-    '165',
-    '1660',
-    '167',
     '168',
-    '1688',
-    '169',
-    '17%',
-    '17-year-old',
-    '1715',
-    '1750',
-    '1760',
-    '1770',
-    '1775',
-    '1780',
-    '1789',
-    '1790',
-    '1791',
-    '1792',
-    '1793',
     '1794',
-    '1795',
-    '1799',
-    '18%',
-    '1801',
-    '1802',
-    '1803',
-    '1805',
-    '1806',
-    '1810',
-    '1812',
-    '1813',
-    '1814',
-    '1816',
-    '1817',
-    '1818',
     '1820',
-    '1823',
-    '1824',
-    '1825',
-    '1826',
-    '1828',
-    '1829',
-    '1831',
-    '1833',
-    '1834',
-    '1835',
-    '1836',
-    '1837',
-    '1838',
-    '1841',
-    '1842',
     '1843',
-    '1844',
-    '1845',
-    '1846',
-    '1847',
-    '1849',
-    '185',
-    '1852',
-    '1853',
-    '1877',
-    '19%',
-    '19-year-old',
-    '1989&ndash;90',
-    '1989/90',
-    '1990-91',
-    '1991/92',
     '1992/93',
-    '1998',
-    '1999',
-    '19th-century',
-    '1a',
-    '1m',
-    '2&frac12',
-    '2&ndash;0',
-    '2&ndash;1',
-    '2+',
-    '2-0',
-    '2.9',
-    '20-year-old',
-    '2001',
-    '205',
-    '20p',
     '20s',
-    '21%',
-    '21-year-old',
-    '210',
-    '212',
-    '22%',
-    '22-year-old',
-    '225',
-    '23%',
-    '23-year-old',
-    '238',
-    '24%',
-    '24-year-old',
-    '25-year-old',
-    '256',
-    '26-year-old',
     '260',
-    '27%',
-    '270',
-    '28%',
-    '28-year-old',
-    '280',
-    '286',
-    '2a',
-    '2b',
-    '2m',
-    '2p',
-    '3&ndash;0',
-    '3&ndash;1',
-    '3&ndash;4',
-    '3\'',
-    '3,500',
     '3-0',
-    '3-1',
-    '3.',
-    '3.9',
-    '30-year-old',
-    '30s',
-    '32-bit',
-    '320',
-    '33%',
-    '330',
-    '33mhz',
-    '35,000',
-    '36%',
-    '360',
-    '37&deg;c',
-    '370',
     '38%',
-    '380',
-    '386',
-    '3m',
-    '4&ndash;6',
-    '4.8',
-    '4.9',
-    '40th',
-    '45%',
-    '480',
-    '486',
-    '4oz',
-    '4pm',
-    '5\'',
-    '5-asa',
-    '5.0',
     '5.6',
-    '5.7',
-    '5.8',
-    '50mhz',
-    '550',
-    '5b',
-    '5p',
-    '5pm',
-    '6&ndash;4',
-    '6.30',
-    '6.6',
-    '6.7',
-    '6.8',
-    '6.9',
-    '600,000',
-    '60s',
     '64-bit',
-    '65%',
-    '6d',
-    '6in',
-    '6pm',
-    '7.4',
-    '7.6',
-    '70s',
-    '8.3',
-    '8.30',
-    '8.4',
-    '80,000',
-    '80s',
-    '85%',
-    '850',
-    '8oz',
     '9,000',
-    '9.1',
-    '9.2',
-    '9.3',
-    '9.30',
-    '9.5',
-    '999',
-    'a&amp;r',
-    'a.r.',
-    'a2',
-    'a3',
-    'a_good_many',
-    'aargh',
-    'ababa',
-    'abatement',
-    'abbreviated',
     'abbreviations',
-    'abducted',
-    'abel',
-    'aberration',
-    'abiding',
-    'ablaze',
-    'able-bodied',
-    'abnormally',
-    'abode',
-    'abolishing',
-    'abolitionists',
-    'aborigines',
-    'aborted',
-    'abreast',
-    'absences',
-    'absentee',
     'absenteeism',
-    'absently',
-    'absorbs',
-    'abstinence',
-    'abstracted',
-    'abstractions',
-    'abstracts',
-    'absurdly',
-    'abundantly',
-    'abusing',
-    'abyss',
-    'academically',
-    'accessing',
-    'accolade',
-    'accomplice',
-    'accomplishment',
     'accredited',
-    'accrue',
-    'accruing',
-    'aces',
-    'acet',
-    'acetate',
-    'aches',
-    'acheson',
-    'achievable',
-    'achilles',
-    'acidic',
-    'acquiescence',
-    'acrimonious',
-    'acton',
-    'actresses',
-    'actuality',
     'actuarial',
-    'actuaries',
-    'acupuncture',
-    'ad_lib',
-    'adaptability',
-    'addict',
-    'addicts',
-    'addis',
-    'addison',
-    'additive',
-    'addressee',
-    'adelaide',
-    'aden',
-    'adenauer',
-    'adherents',
-    'adidas',
     'adjudicator',
-    'adjunct',
-    'adjutant',
-    'admin',
-    'adolf',
-    'adoral',
-    'adoration',
-    'adore',
-    'adriatic',
-    'adversity',
-    'advertiser',
-    'advisors',
-    'aegean',
-    'aegis',
-    'aerodrome',
-    'aerosol',
     'afar',
-    'affectionately',
-    'affections',
-    'affective',
-    'affiliate',
-    'affinities',
-    'affirm',
-    'affluence',
-    'affords',
-    'affront',
-    'afoot',
-    'afresh',
-    'afro-caribbean',
-    'aft',
-    'afterthought',
-    'age-old',
     'ageism',
-    'agendas',
-    'aggravation',
-    'aghast',
-    'agile',
-    'agility',
-    'agonising',
-    'agrippa',
-    'ahmad',
-    'aib',
-    'aiding',
-    'aileen',
-    'ailments',
-    'aintree',
-    'air-conditioned',
-    'air-conditioning',
     'airbus',
-    'airdrie',
-    'aired',
-    'aires',
-    'airfields',
-    'airing',
-    'airliner',
-    'airmen',
-    'airs',
-    'airtours',
-    'aisles',
-    'akbar',
-    'akram',
-    'alabama',
-    'alarmingly',
-    'alba',
     'albanians',
-    'alberto',
-    'alcove',
-    'alder',
-    'alderman',
-    'aldershot',
-    'aldridge',
-    'alejandro',
-    'alexandria',
-    'alexis',
-    'alfonso',
-    'algebra',
-    'alias',
-    'alibi',
-    'alida',
-    'alienating',
     'alignments',
-    'all-out',
-    'all-party',
-    'allay',
-    'alleges',
-    'allegory',
-    'alleys',
-    'alleyway',
-    'allitt',
-    'allotments',
-    'allowable',
-    'alluded',
-    'allusion',
-    'aloft',
-    'alp',
-    'alt',
     'alters',
-    'althorp',
-    'alto',
-    'altruism',
-    'altruistic',
-    'alumni',
-    'alzheimer',
-    'amalgam',
-    'amaranth',
-    'amassed',
-    'ambience',
-    'ambient',
-    'ambit',
-    'ambrose',
-    'ambulances',
-    'amelia',
     'amending',
-    'amends',
-    'ames',
-    'amicable',
-    'amorphous',
-    'amos',
-    'amphibians',
-    'amplifiers',
-    'amply',
-    'amps',
-    'anabelle',
-    'anaerobic',
-    'anaesthesia',
-    'analogies',
-    'analyser',
-    'analyzed',
     'anathema',
-    'anchorage',
-    'andean',
-    'andersen',
-    'andreas',
-    'andrei',
-    'andrus',
-    'anecdotal',
-    'anecdote',
-    'anew',
-    'angelica',
-    'angie',
-    'angler',
-    'anglo',
-    'anglo-french',
-    'anglo-irish',
     'anguished',
-    'angy',
-    'anjou',
-    'annals',
-    'annamese',
-    'annette',
-    'annex',
-    'annexe',
-    'annexed',
-    'annuity',
-    'anorak',
-    'anorexic',
-    'answerable',
-    'antagonistic',
-    'antagonists',
-    'ante',
     'antecedent',
-    'antecedents',
-    'antenatal',
-    'antennae',
-    'anterior',
-    'anthea',
-    'anthology',
-    'anti-aircraft',
-    'anti-government',
-    'anti-semitic',
-    'anti-social',
-    'anticipates',
-    'antidote',
-    'antipathy',
-    'antiseptic',
-    'antithesis',
     'antoine',
-    'antonia',
-    'antral',
-    'antwerp',
-    'anus',
-    'anwar',
-    'aoun',
-    'ape',
-    'aperture',
-    'apical',
-    'apiece',
-    'apocalypse',
-    'apocalyptic',
-    'apologetically',
-    'apologized',
-    'apostle',
     'app',
-    'appellants',
-    'appellate',
-    'appetites',
-    'applaud',
-    'appleby',
-    'appliance',
-    'applicability',
-    'appointees',
-    'appoints',
-    'appreciably',
-    'appreciating',
-    'appreciative',
-    'apprenticed',
-    'appropriated',
-    'aptitude',
     'apu',
-    'arabian',
-    'aragon',
-    'arbiter',
-    'archaeologist',
-    'archbishops',
-    'archetypal',
-    'archibald',
-    'archipelago',
-    'architectures',
-    'archival',
-    'archway',
-    'arcs',
-    'ards',
-    'arenas',
-    'argentinian',
     'argos',
-    'arguable',
-    'argumentative',
-    'aria',
-    'arias',
-    'ariel',
-    'aristocrat',
-    'aristocrats',
-    'arkansas',
-    'armaments',
-    'armistice',
-    'armitage',
-    'armoury',
-    'arnie',
-    'aromatherapy',
-    'arousing',
     'arran',
-    'arsenic',
-    'artai',
-    'artisan',
-    'arty',
-    'as/400',
-    'asb',
-    'ascendancy',
-    'ascended',
-    'ascii',
-    'asda',
-    'ashworth',
-    'aspired',
-    'assad',
-    'assailant',
-    'assassinated',
     'assassins',
-    'assayed',
-    'assemblage',
-    'assertiveness',
-    'assesses',
-    'assessor',
-    'assignee',
-    'assigning',
-    'assimilate',
-    'assists',
-    'astonishingly',
-    'astounded',
-    'astounding',
-    'astray',
-    'astride',
-    'astrology',
     'astronomer',
-    'asymmetric',
-    'asymmetry',
-    'asynchronous',
-    'atheist',
-    'athenians',
-    'atherton',
-    'atonement',
-    'atop',
-    'atp',
-    'atrophy',
-    'attaches',
-    'attachments',
-    'attainable',
-    'attaining',
-    'attendances',
     'attenuated',
-    'attenuation',
-    'attested',
-    'attractively',
-    'attributing',
-    'attribution',
-    'atypical',
-    'auctioned',
-    'auctioneer',
-    'auctioneers',
-    'auctions',
-    'audi',
-    'audio-visual',
-    'auditorium',
-    'augment',
-    'augusta',
     'auld',
-    'aung',
-    'aurora',
-    'aussie',
-    'authorise',
-    'authorization',
-    'authorship',
-    'autobiographical',
-    'autocratic',
-    'autograph',
-    'automotive',
-    'autonomic',
-    'auvergne',
-    'av.',
-    'avalanche',
-    'averse',
     'aversion',
-    'avery',
-    'avid',
-    'aviv',
-    'aw',
-    'awakened',
-    'award-winning',
-    'awash',
-    'axed',
-    'axial',
-    'axle',
-    'ayatollah',
-    'ayresome',
-    'baa',
-    'babe',
-    'baberton',
     'babur',
-    'babylon',
-    'backbenchers',
-    'backers',
-    'backlog',
-    'backstage',
-    'bacterium',
-    'bade',
-    'bae',
-    'bahamas',
-    'bahrain',
-    'bailiff',
-    'bailiffs',
-    'bain',
-    'baird',
-    'baits',
     'bakers',
-    'balconies',
-    'baldersdale',
-    'balding',
-    'bale',
-    'bales',
-    'bali',
-    'balkans',
-    'ballad',
-    'ballads',
-    'ballesteros',
-    'ballistic',
-    'ballots',
-    'balmoral',
-    'baltimore',
-    'banal',
     'banbridge',
-    'bandages',
-    'banding',
-    'bandits',
-    'bandwagon',
-    'banish',
-    'banked',
-    'banqueting',
-    'banter',
-    'baptised',
-    'barbarian',
-    'barbaric',
-    'barbarossa',
-    'barbican',
-    'barbs',
-    'bared',
     'barges',
-    'barium',
-    'barlaston',
-    'barmaid',
-    'barometer',
-    'baronet',
-    'barr',
-    'barricades',
-    'barrie',
-    'barring',
-    'barron',
-    'bart',
-    'barter',
-    'barth',
-    'bartlett',
-    'bashing',
     'basildon',
-    'basilica',
-    'basing',
-    'basketball',
-    'basses',
-    'batches',
-    'bathe',
-    'batman',
-    'baton',
-    'battalions',
-    'batten',
-    'batter',
-    'battering',
-    'bavarian',
-    'bbc1',
-    'bbc2',
     'bbcbasic(z80)',
-    'bdda',
-    'bea',
-    'bead',
-    'bearers',
-    'beatrix',
-    'beatty',
-    'beauties',
-    'beaver',
-    'beavis',
-    'beccaria',
-    'beckenham',
-    'bedclothes',
-    'bedded',
-    'bedrock',
-    'beecham',
     'begs',
-    'behold',
-    'bel',
-    'belated',
-    'belatedly',
-    'bellamy',
-    'bellow',
-    'bellows',
-    'belmont',
-    'belted',
-    'benchmark',
-    'benedicta',
-    'benefactor',
-    'bengal',
-    'benin',
-    'bentham',
     'bequeathed',
-    'bequest',
-    'bereft',
-    'berg',
-    'bermuda',
-    'bernstein',
-    'bertha',
-    'bertie',
-    'bertrand',
-    'bessie',
-    'best-selling',
-    'bethlehem',
-    'betsy',
-    'beuno',
-    'beverly',
-    'bevin',
     'bhutto',
-    'biases',
-    'bibliographic',
-    'bicker',
-    'bidders',
-    'biddy',
-    'biff',
-    'bigwig',
-    'bikini',
-    'billed',
-    'billie',
-    'billowing',
-    'binder',
-    'binge',
-    'binocular',
-    'biographer',
     'biographies',
-    'biologically',
-    'biologist',
-    'biomass',
-    'biopsies',
-    'birdie',
-    'birdies',
-    'birk',
-    'birt',
-    'birthdays',
-    'bismarck',
-    'bjp',
-    'black-and-white',
-    'blackberry',
-    'blackbird',
-    'blackfriars',
     'blackout',
-    'blackwell',
-    'blakey',
-    'blasphemy',
-    'blasting',
-    'blasts',
-    'blatantly',
-    'blazer',
-    'bleached',
-    'bled',
-    'bleed',
-    'blends',
-    'blenheim',
-    'blessings',
-    'bletchley',
-    'blight',
     'blighted',
-    'blimey',
-    'blistering',
-    'blisters',
-    'bloated',
-    'blob',
-    'blockage',
-    'blocs',
-    'bloodshed',
-    'bloodstream',
-    'blossomed',
-    'blotting',
-    'blunder',
-    'blurring',
-    'blurted',
-    'blushing',
     'blyth',
-    'bma',
-    'bmc',
-    'boasting',
-    'boating',
-    'bobbed',
-    'bobbing',
-    'bodice',
-    'bodo',
-    'bodyguard',
-    'boer',
-    'bogged',
-    'bogs',
-    'bohemia',
-    'bohemian',
-    'boilers',
     'boils',
-    'boisterous',
-    'bolder',
-    'boldwood',
-    'bologna',
-    'bom',
-    'bombarded',
-    'bombings',
-    'bon',
-    'bondage',
-    'bonnie',
-    'bonny',
-    'boogie',
-    'bookcase',
-    'booker',
-    'bookies',
     'bookmakers',
-    'bookman',
-    'boomed',
-    'boosting',
-    'bootle',
-    'borderline',
-    'borland',
-    'borneo',
-    'botanic',
-    'botha',
-    'boulder',
-    'boulogne',
-    'bounty',
-    'bourbon',
-    'bourdieu',
-    'bourne',
     'bovine',
-    'bowels',
-    'bowen',
-    'bower',
-    'bowie',
-    'bowles',
-    'boxers',
-    'boycotted',
-    'boyfriends',
-    'boyhood',
-    'boyish',
-    'bpd',
-    'bracelet',
-    'braces',
-    'bracing',
-    'bracknell',
     'bradbury',
-    'brahms',
-    'braid',
-    'braintree',
-    'braithwaite',
-    'braking',
-    'brambles',
-    'bran',
-    'branding',
-    'brandishing',
-    'brando',
-    'brandon',
-    'brandt',
-    'bras',
-    'brash',
-    'brawl',
     'breadcrumbs',
-    'break-in',
-    'breakage',
-    'breakaway',
-    'breakdowns',
-    'breakers',
-    'breastfeeding',
-    'breathlessly',
-    'breaths',
-    'breeches',
-    'breeder',
-    'bremen',
-    'brendan',
-    'brennan',
-    'brethren',
-    'breton',
     'brewed',
-    'briant',
-    'bribes',
-    'bridal',
-    'bridegroom',
-    'brides',
-    'bridgend',
-    'briefings',
-    'briefs',
-    'brig',
-    'briggs',
-    'brighten',
-    'brightened',
-    'brim',
-    'brimming',
-    'brine',
     'brisbane',
-    'brit',
-    'brits',
-    'brittan',
-    'broadcaster',
-    'broadest',
-    'broccoli',
-    'bromwich',
-    'bronchitis',
-    'bronzes',
-    'brooch',
-    'brooke-rose',
-    'brooklyn',
-    'bros',
-    'broth',
-    'brothel',
     'broughton',
-    'brownlow',
-    'browns',
-    'browse',
-    'browsing',
-    'bruges',
-    'bruise',
-    'brunel',
-    'brutus',
-    'bryant',
-    'bryce',
-    'bsc',
-    'bsp',
-    'bst',
-    'buchan',
-    'buckled',
     'buddha',
-    'buddhism',
-    'budge',
-    'budgeted',
-    'buenos',
-    'buf',
-    'buggers',
-    'buggy',
-    'built-up',
-    'bulletins',
-    'bullied',
-    'bullock',
-    'bullshit',
-    'bumps',
-    'bumpy',
-    'bunches',
     'bungalows',
-    'buns',
-    'buoyancy',
-    'burdened',
-    'bureaucracies',
-    'burglaries',
-    'burgled',
-    'burials',
-    'burlington',
-    'burly',
-    'burmese',
-    'burner',
-    'burnley',
-    'burr',
-    'burt',
-    'bushy',
     'businesslike',
-    'butch',
-    'buttered',
-    'buttoned',
-    'buttress',
-    'butts',
-    'buyout',
-    'buzzard',
-    'buzzed',
-    'by-elections',
-    'by-pass',
-    'by-product',
-    'byrd',
-    'byte',
-    'bytes',
-    'c&eacute;zanne',
     'c&ocirc;te',
-    'c.j.',
-    'c1',
-    'c2',
-    'caa',
-    'cabins',
-    'cadet',
-    'cadets',
-    'cadfael',
-    'cadres',
-    'cafes',
-    'cafeteria',
-    'caffeine',
-    'caged',
-    'cain',
-    'caine',
     'cairn',
-    'caithness',
-    'cal',
-    'calcite',
-    'calendars',
-    'calibration',
-    'callous',
-    'calmer',
-    'calvin',
-    'camels',
-    'cameraman',
-    'cameroon',
-    'camilla',
-    'camped',
-    'camra',
-    'canadians',
     'canberra',
-    'cancelling',
-    'candid',
-    'candida',
-    'candidacy',
-    'candlelight',
-    'canine',
-    'canned',
-    'cannes',
-    'canning',
-    'canny',
-    'canoeing',
-    'canonical',
-    'canton',
-    'canvassed',
-    'canvassing',
     'capacitance',
-    'capacitor',
-    'capillary',
-    'capitalise',
-    'capsules',
-    'captaincy',
-    'captained',
-    'carat',
-    'carbohydrates',
-    'carcass',
-    'carcinomas',
-    'cardinals',
-    'carefree',
-    'carelessness',
-    'caress',
-    'caressed',
     'caressing',
-    'carew',
-    'cargoes',
-    'caricature',
-    'carling',
-    'carnage',
-    'carnegie',
-    'carnivores',
-    'carolingian',
-    'carpenters',
-    'carpeted',
-    'carrick',
-    'cartels',
-    'carton',
-    'cartons',
-    'cartridges',
     'cartwright',
-    'carver',
-    'carvings',
-    'casa',
-    'cashier',
-    'casing',
-    'cast-iron',
-    'caster',
-    'catalan',
-    'cataloguing',
-    'catalysts',
-    'catapult',
-    'categorical',
-    'categorically',
-    'categorised',
-    'caterers',
     'caterpillar',
-    'caterpillars',
-    'caters',
-    'cath',
-    'catterick',
-    'catwalk',
-    'cauldron',
-    'causeway',
-    'caustic',
-    'cavern',
-    'cb',
-    'cbs',
-    'cd4',
-    'ce',
-    'ceasing',
-    'cecilia',
     'cedar',
-    'cedric',
-    'celery',
-    'celestial',
-    'celibacy',
-    'cello',
-    'cellulite',
-    'cellulose',
-    'celsius',
-    'celts',
-    'cemeteries',
-    'censure',
-    'censuses',
-    'centimetre',
-    'centralisation',
-    'centrality',
     'centralization',
-    'centre-right',
-    'centrepiece',
-    'cert',
-    'certainties',
-    'cfa',
-    'cfc',
-    'cha',
-    'chadwick',
-    'chairperson',
-    'challengers',
-    'chalmers',
-    'champ',
-    'chan',
-    'chancel',
-    'chanted',
     'chants',
-    'characterization',
-    'charade',
-    'chardonnay',
-    'charing',
-    'charley',
-    'charmed',
-    'charred',
-    'chases',
-    'chasm',
-    'chatterton',
-    'cheddar',
-    'cheekbones',
-    'cheery',
-    'chefs',
-    'cheney',
     'chepstow',
-    'cherish',
-    'chesarynth',
-    'chests',
-    'childlike',
-    'chilli',
-    'chimpanzee',
-    'chimpanzees',
-    'chisel',
-    'chivalry',
-    'cholangitis',
-    'chomsky',
-    'chopin',
-    'chore',
-    'choreographer',
-    'choreographers',
     'chorley',
-    'chrissie',
-    'christabel',
-    'christchurch',
-    'christendom',
-    'christened',
-    'chromatography',
-    'chrome',
-    'chronically',
-    'chronicler',
-    'chronicles',
-    'chrysler',
-    'chucked',
-    'chum',
-    'churchmen',
-    'churned',
     'churning',
-    'chute',
-    'cichlids',
-    'cigars',
-    'cinderella',
-    'cindy',
-    'cinematic',
-    'cinnamon',
-    'circuitry',
-    'circumcision',
-    'circumference',
-    'circumstantial',
-    'cirrhosis',
-    'cissie',
-    'citadel',
-    'citalia',
     'citations',
-    'citrus',
-    'clacton',
-    'cladding',
-    'clamour',
-    'clamping',
-    'clandestine',
-    'clap',
-    'clapping',
-    'clapton',
-    'clarifying',
-    'clarkson',
-    'clasp',
-    'classically',
-    'classifying',
-    'classless',
     'classy',
-    'clattered',
-    'clattering',
-    'claus',
-    'claustrophobic',
-    'clawed',
-    'clays',
-    'cleanly',
-    'clears',
-    'cleft',
-    'clegg',
-    'clements',
-    'cleopatra',
-    'clergymen',
-    'clerics',
-    'clich&eacute',
     'clicks',
-    'client/server',
-    'clinicians',
-    'clint',
-    'clio',
-    'clipping',
-    'cllr',
-    'clo',
-    'cloakroom',
-    'cloaks',
-    'clocked',
-    'clogged',
-    'cloned',
-    'cloning',
-    'close-up',
-    'cloths',
     'clout',
-    'clove',
-    'cloves',
-    'clovis',
-    'clowes',
-    'clowns',
-    'clumsily',
-    'clutches',
-    'clutter',
-    'cluttered',
-    'co-operating',
-    'co-ordinates',
-    'co2',
-    'coached',
-    'coalfield',
-    'coalitions',
     'coastguard',
-    'cob',
-    'cobbles',
-    'cobol',
-    'cochrane',
-    'cocks',
-    'coe',
-    'coercive',
-    'coffers',
-    'cognac',
-    'cognition',
-    'cohorts',
-    'coiled',
-    'coinciding',
-    'cola',
-    'collaborated',
     'collaborating',
-    'collaborators',
-    'collage',
-    'collagen',
-    'collapses',
-    'collateral',
-    'colliding',
-    'collier',
-    'collisions',
-    'collor',
-    'colombian',
-    'colombo',
-    'colonisation',
-    'colonised',
-    'colonists',
-    'colourless',
     'columnist',
-    'colwyn',
-    'com',
-    'combating',
-    'combed',
-    'comedians',
-    'comer',
-    'comical',
-    'comintern',
-    'comma',
-    'commandant',
-    'commander-in-chief',
-    'commas',
-    'commemorated',
-    'commemorative',
-    'commences',
     'commendable',
-    'commensurate',
-    'commentaries',
-    'commits',
-    'common-sense',
-    'commoner',
-    'commotion',
-    'communicators',
-    'commuting',
-    'compacts',
-    'compensating',
-    'compensatory',
-    'compilers',
-    'complainant',
-    'complements',
-    'completeness',
     'compliant',
-    'complicate',
-    'complicity',
-    'complying',
-    'composing',
-    'compositors',
-    'comprehensible',
-    'comprehensively',
-    'compromising',
-    'compton',
-    'computation',
-    'computer-aided',
-    'computer-based',
-    'computerized',
-    'comte',
-    'concedes',
     'conceding',
-    'concentric',
-    'concessionary',
-    'conciliatory',
-    'conclusively',
-    'concourse',
-    'concurrently',
-    'conditioner',
-    'conductivity',
-    'conducts',
-    'conduit',
-    'conferring',
-    'confers',
-    'confesses',
-    'confide',
-    'configured',
     'confining',
-    'confiscation',
-    'conformation',
-    'conforms',
-    'confounded',
-    'confrontations',
-    'confronts',
-    'congenial',
-    'congested',
-    'conglomerates',
-    'congratulating',
-    'congregational',
-    'conical',
-    'conifers',
-    'coniston',
-    'conjecture',
     'conjunction',
-    'conjure',
-    'conjured',
-    'connecticut',
-    'connector',
-    'connelly',
-    'conner',
-    'connon',
-    'connors',
-    'conqueror',
-    'conran',
-    'conscription',
-    'consecrated',
-    'consensual',
-    'consenting',
-    'consents',
     'consequential',
-    'conservancy',
-    'considerate',
-    'considering_that',
-    'consigned',
-    'consolidating',
-    'consonants',
-    'consort',
-    'conspired',
-    'conspiring',
-    'constanza',
-    'constellation',
-    'consternation',
-    'constitutionally',
-    'constitutions',
-    'constrain',
     'constructively',
-    'consul',
-    'consumerism',
-    'contagious',
-    'contemptuously',
-    'contends',
-    'contestants',
-    'contesting',
-    'contingencies',
-    'continuance',
-    'contorted',
-    'contour',
-    'contra',
-    'contraceptives',
-    'contradicted',
-    'controversies',
     'conurbations',
-    'convene',
-    'convener',
-    'converge',
-    'converging',
-    'convocation',
-    'coolness',
-    'cooney',
-    'copious',
-    'cora-beth',
-    'cordless',
-    'cordon',
-    'corduroy',
-    'cores',
-    'corinth',
-    'corinthian',
     'corinthians',
-    'cornered',
-    'cornerstone',
-    'cornflakes',
-    'corp.',
-    'corporatism',
-    'corporatist',
-    'corrections',
-    'correctness',
-    'correlates',
-    'corresponded',
-    'corrie',
-    'corrosive',
-    'corrugated',
-    'corrupted',
-    'cortical',
     'cosmology',
-    'cossacks',
-    'cost-cutting',
-    'cotswolds',
-    'couched',
-    'counter-attack',
-    'counter-productive',
-    'counterfeit',
-    'coupons',
-    'coursework',
-    'courtiers',
-    'courtroom',
-    'cover-up',
-    'coveted',
-    'cowan',
-    'cowardice',
     'cowardly',
-    'cowboys',
-    'coy',
-    'cracker',
-    'crackers',
-    'crackling',
-    'cradled',
-    'crafted',
-    'craftsmanship',
-    'crafty',
-    'cram',
-    'cramp',
-    'cranes',
-    'craon',
-    'craters',
-    'craving',
     'crawley',
-    'craze',
-    'crazed',
-    'creak',
-    'creaked',
-    'creams',
-    'crease',
-    'creased',
-    'creators',
-    'creb',
-    'credence',
-    'cremation',
-    'crescendo',
-    'cretaceous',
-    'crim',
-    'crimean',
     'criminality',
-    'cripple',
-    'cripps',
-    'criticizing',
-    'croaked',
-    'croat',
-    'crockery',
-    'crooks',
-    'cropping',
-    'croquet',
-    'cross-border',
-    'cross-country',
-    'cross-examination',
-    'cross-legged',
-    'crossings',
-    'crossman',
     'crossword',
-    'crouch',
-    'crowding',
-    'crowe',
-    'crowning',
-    'crows',
-    'crowther',
-    'crp',
-    'crucified',
-    'crucifix',
-    'crucifixion',
-    'cruised',
-    'cruiser',
-    'cruises',
-    'crumbled',
-    'crumwallis',
     'crunching',
-    'crusaders',
-    'crusty',
-    'cryptic',
-    'csa',
-    'ct',
-    'cub',
-    'cubicle',
-    'cubism',
-    'cubist',
-    'cubs',
-    'cucumber',
-    'cuddle',
-    'cuddling',
-    'cuddly',
-    'cuff',
     'cuffs',
-    'cullen',
-    'culprit',
-    'culprits',
-    'cultivating',
-    'cults',
-    'cupped',
-    'curators',
-    'cures',
-    'curia',
-    'curran',
-    'curses',
-    'cursory',
-    'curt',
-    'curtail',
-    'curtly',
     'curzon',
-    'cushioned',
-    'cut-off',
-    'cuthbert',
-    'cutters',
-    'cv',
-    'cycled',
-    'cyclical',
-    'cylindrical',
-    'cynically',
-    'cypress',
-    'cytoplasmic',
-    'd\'you',
-    'd-i-y',
-    'daak',
-    'dab',
     'dabbed',
-    'dada',
-    'dai',
-    'daine',
-    'dainty',
-    'daisies',
-    'dakota',
-    'dalek',
-    'daley',
-    'dalziel',
-    'dammit',
-    'damning',
-    'dampened',
-    'dams',
-    'dandelion',
-    'dandy',
     'dangled',
-    'danielle',
-    'dank',
-    'dante',
-    'darby',
-    'darcy',
-    'daresay',
-    'dark-haired',
-    'darkest',
-    'darting',
-    'dartmoor',
-    'darwinian',
-    'das',
-    'dashboard',
-    'dat',
-    'daughter-in-law',
     'dauntless',
-    'davenport',
-    'davey',
-    'davide',
-    'davison',
-    'davy',
-    'dawning',
-    'dazzled',
-    'dea',
-    'deadlines',
-    'deafening',
-    'deafness',
-    'debatable',
-    'debenture',
-    'debilitating',
-    'decayed',
     'decca',
-    'deceit',
-    'decentralisation',
-    'decentralised',
-    'deceptively',
-    'decision-makers',
-    'declan',
-    'decomposition',
-    'deduct',
-    'deductive',
-    'deep-seated',
-    'deepen',
-    'deeside',
-    'defamation',
-    'defection',
-    'defenceless',
     'defends',
-    'defense',
-    'defensively',
-    'defer',
-    'deflect',
-    'deflected',
-    'deforestation',
-    'deformation',
-    'deformed',
-    'deftly',
-    'defunct',
-    'defuse',
-    'defying',
-    'degeneration',
-    'degraded',
-    'degrading',
     'dei',
-    'deictic',
-    'deirdre',
-    'deities',
-    'deixis',
-    'deliberation',
-    'delightfully',
-    'delinquency',
-    'deliverance',
-    'delusion',
-    'demarcation',
-    'demeanour',
-    'demented',
-    'demised',
-    'democratically',
-    'demography',
     'demolish',
-    'dempster',
-    'denny',
-    'denominator',
-    'denoted',
-    'denoting',
-    'denounce',
-    'denouncing',
-    'dented',
-    'denver',
-    'denys',
-    'dep&ocirc;t',
-    'dependable',
-    'dependant',
-    'depiction',
-    'depicts',
     'deplorable',
-    'deplored',
-    'depopulation',
-    'deportation',
-    'deported',
-    'depositors',
-    'depots',
-    'depress',
-    'depressive',
-    'depriving',
-    'derision',
-    'derivation',
-    'derwent',
-    'descartes',
-    'descends',
-    'desertion',
     'designate',
-    'desolation',
-    'desserts',
-    'destroyer',
-    'detach',
-    'detain',
-    'detergents',
-    'determinedly',
-    'determinism',
-    'detested',
-    'detour',
-    'detract',
-    'deutschmark',
-    'deviate',
-    'devonian',
-    'devonshire',
     'devore',
-    'devotees',
-    'devoured',
-    'dewey',
-    'dg',
-    'diagnose',
-    'diagnoses',
-    'diagonally',
-    'dialectic',
-    'dialectical',
-    'dialogues',
-    'diaphragm',
-    'dickie',
-    'dickson',
-    'dictum',
-    'didier',
     'diesels',
-    'differentiating',
-    'diffused',
-    'digit',
-    'dignitaries',
-    'dilapidated',
-    'diligent',
-    'dillon',
-    'dimensional',
-    'diminution',
-    'diminutive',
-    'dined',
-    'diners',
-    'dingy',
-    'diplock',
-    'diplomas',
     'dips',
-    'directional',
-    'dis',
-    'disablement',
-    'disaffected',
-    'disagreeable',
-    'disallowed',
-    'disappoint',
-    'disappointments',
-    'disapprove',
-    'disapproving',
-    'disarming',
-    'discerned',
-    'discerning',
-    'discharging',
-    'disciple',
     'disclaimer',
-    'disclosures',
-    'disconcerted',
-    'disconnected',
-    'discontinuity',
-    'discord',
-    'discouraging',
-    'discredit',
-    'discriminated',
-    'discriminating',
-    'diseased',
-    'disenchantment',
-    'disgraced',
-    'dishevelled',
-    'dishwasher',
-    'disillusionment',
     'disinfectant',
-    'disintegrated',
-    'disinterested',
-    'dislikes',
-    'dislocation',
-    'dismantle',
-    'dismissals',
-    'dismisses',
-    'dismissively',
-    'disneyland',
-    'disorderly',
-    'disparities',
-    'dispelled',
-    'dispensation',
-    'dispensing',
-    'dispersion',
     'displace',
-    'displeasure',
-    'disposals',
-    'dispositions',
-    'dispossessed',
-    'disqualification',
-    'disquiet',
-    'disraeli',
-    'disrepute',
-    'disrupting',
-    'disseminated',
-    'dissenters',
-    'dissipated',
-    'dissociation',
-    'dissolves',
-    'dissolving',
     'dissuade',
-    'distanced',
-    'distancing',
-    'distantly',
-    'distillation',
-    'distilled',
-    'distillers',
-    'distinctiveness',
-    'distorting',
-    'distracting',
-    'distractions',
-    'ditched',
-    'diverge',
-    'diversify',
-    'diverting',
-    'divisive',
     'dixie',
-    'dixons',
-    'djibouti',
-    'dlp',
-    'dm',
-    'dnase',
-    'do-it-yourself',
-    'docherty',
-    'docile',
-    'dockers',
-    'dockyard',
-    'doctorate',
-    'doctrinal',
-    'dodd',
-    'dodging',
-    'doh',
     'doherty',
-    'doin\'',
-    'dom',
-    'domesday',
-    'domesticated',
-    'domiciled',
-    'domiciliary',
-    'dominican',
-    'dominions',
-    'domino',
-    'dong',
-    'donkeys',
-    'donnelly',
-    'dons',
-    'doone',
-    'doorbell',
     'dope',
-    'dorchester',
-    'dorigo',
-    'dormitory',
-    'dostoevsky',
-    'dounreay',
-    'dour',
-    'doves',
-    'dow',
-    'dowd',
-    'down-to-earth',
-    'downes',
-    'downtown',
-    'downwind',
-    'dowry',
-    'dozed',
     'dp',
-    'dpp',
-    'drachenfels',
-    'drafter',
-    'draftsman',
-    'dragoons',
-    'dramas',
-    'draper',
-    'draughts',
-    'dreadfully',
-    'dreamy',
-    'dredging',
-    'drenched',
-    'dressing-table',
-    'dressings',
-    'drier',
     'dries',
-    'dripped',
-    'drone',
-    'drooping',
-    'droplets',
-    'droppings',
-    'drowsy',
-    'drugged',
-    'drumming',
-    'drummond',
-    'drunkenness',
-    'dryden',
-    'dryer',
-    'dub',
-    'dubai',
-    'duc',
     'ducal',
-    'ducking',
-    'ducts',
-    'duet',
-    'duffy',
-    'dukes',
-    'dully',
-    'dumfries',
-    'dune',
-    'dunfermline',
-    'dungannon',
-    'dunkirk',
-    'duplicated',
-    'durability',
-    'duress',
-    'durie',
     'dusted',
-    'dusting',
-    'dutifully',
-    'duvall',
-    'dwelt',
-    'dwindled',
-    'dyer',
-    'dyes',
-    'dyfed',
-    'dykes',
-    'dynamism',
-    'dynastic',
-    'dysart',
-    'dysfunction',
-    'dyslexia',
-    'e-mail',
     'e.c.r.',
-    'e.e.c.',
-    'ea',
-    'earle',
-    'earner',
-    'earshot',
-    'earthenware',
-    'earthworks',
-    'earthworms',
-    'earthy',
-    'easel',
-    'eastenders',
-    'eastwood',
-    'eaton',
-    'eaves',
-    'ebony',
     'eccentricity',
-    'eclectic',
-    'eclipsed',
-    'eco',
-    'ecologists',
-    'econometric',
-    'ecosystem',
-    'ed.',
-    'edi',
-    'edible',
-    'edifice',
-    'edmunds',
-    'edta',
-    'eduard',
-    'eduardo',
-    'educationalists',
     'eel',
-    'eels',
-    'effecting',
-    'effortless',
-    'egf',
-    'eigenvalues',
-    'eight-year-old',
-    'eire',
-    'elaborately',
-    'elated',
-    'elation',
-    'eldorado',
-    'electing',
-    'elector',
-    'electrically',
-    'electrician',
     'electrification',
-    'electrodes',
-    'elevator',
-    'elgar',
-    'elias',
-    'elicited',
-    'eliminates',
-    'elisa',
-    'elitist',
-    'eliza',
-    'ellesmere',
-    'elliot',
-    'ellwood',
-    'elucidate',
-    'eluded',
-    'embalming',
     'embarrass',
-    'embassies',
-    'ember',
-    'emblem',
-    'embodies',
-    'embodiment',
-    'embroiled',
-    'emergent',
-    'emigrants',
-    'emigrate',
-    'emilia',
-    'eminence',
-    'emirates',
-    'emit',
-    'emmanuel',
-    'empirically',
     'empowerment',
-    'ems',
-    'emulsion',
-    'enact',
-    'encapsulated',
-    'encased',
-    'enchanting',
-    'enchantment',
-    'enclosures',
-    'encompassed',
-    'encompassing',
-    'encore',
-    'encountering',
-    'encroachment',
-    'encyclopaedia',
-    'encyclopedia',
     'endanger',
-    'endeavoured',
-    'endings',
-    'endogenous',
-    'endowments',
-    'enfield',
-    'engages',
-    'engendered',
-    'engraving',
-    'engrossed',
-    'enhancements',
-    'enlist',
-    'enoch',
-    'enrich',
-    'ensue',
-    'entangled',
     'entertainer',
-    'enthused',
-    'entice',
-    'enticing',
-    'entitle',
-    'entitlements',
-    'entourage',
-    'entwined',
-    'enveloped',
-    'enviable',
-    'envied',
-    'envious',
-    'envisages',
-    'epa',
-    'ephemeral',
-    'epidemiological',
     'epidemiology',
-    'epilepsy',
-    'epistemological',
-    'epistemology',
-    'epitome',
-    'epoch',
-    'epsom',
-    'equalised',
-    'equalled',
-    'equator',
-    'equatorial',
-    'eradicated',
-    'erase',
-    'erased',
-    'ere',
-    'erecting',
     'erich',
-    'erik',
-    'erlich',
-    'errand',
-    'erstwhile',
-    'escalation',
-    'esoteric',
-    'esp',
-    'especial',
-    'espoused',
-    'esquire',
-    'esso',
-    'estonian',
-    'estuaries',
-    'etching',
-    'ether',
     'ethnographic',
-    'ethnography',
-    'etiquette',
-    'eucharist',
-    'eugene',
-    'eurobond',
-    'europa',
-    'eurotunnel',
-    'euthanasia',
-    'ev',
-    'evaded',
-    'evaluations',
-    'evangelism',
-    'evaporate',
-    'evaporation',
-    'evasive',
     'ever-present',
-    'everett',
-    'evergreen',
-    'everlasting',
-    'every_so_often',
-    'evesham',
-    'evicted',
-    'eviction',
-    'evidenced',
-    'evocative',
-    'ewan',
-    'ewen',
-    'exacerbate',
-    'exacting',
-    'exaggerating',
-    'exalted',
     'excelled',
-    'excitable',
-    'excite',
-    'exclamation',
-    'exclusions',
-    'executing',
-    'executioner',
-    'executor',
-    'executors',
-    'exemplars',
-    'exertion',
-    'exerts',
-    'exhibitors',
-    'exhilaration',
-    'existential',
-    'exits',
     'exogenous',
-    'expansive',
-    'expatriate',
-    'expatriates',
-    'expectant',
-    'expectantly',
-    'expel',
-    'experiential',
-    'experimented',
-    'experimenter',
-    'expertly',
-    'expires',
-    'explicable',
-    'explorers',
-    'exponents',
-    'exposes',
     'expressionless',
-    'exquisitely',
-    'extinguished',
-    'extracellular',
-    'extravagance',
-    'extremist',
-    'extrovert',
-    'exuberance',
-    'exuberant',
-    'exxon',
-    'eyelashes',
-    'eyelid',
-    'ezra',
-    'fabian',
-    'fabio',
-    'fable',
     'fabliau',
-    'fabliaux',
-    'fabrication',
-    'faceless',
-    'facet',
-    'facilitates',
-    'fades',
-    'fagin',
-    'failings',
-    'fainted',
-    'fairclough',
-    'fairies',
-    'fairway',
-    'falconer',
-    'falkland',
-    'fallacy',
     'faltering',
-    'fanatic',
-    'fanatical',
-    'fanatics',
-    'fancies',
-    'fand',
-    'fanned',
-    'fanshawe',
-    'fao',
-    'far_off',
-    'farmyard',
-    'farnborough',
-    'farr',
-    'fasten',
-    'fastening',
-    'fatally',
     'fateful',
-    'father-in-law',
-    'fathom',
-    'fawcett',
-    'fdp',
-    'fearfully',
-    'fearless',
-    'feats',
-    'federalism',
-    'feebly',
-    'feline',
-    'felixstowe',
-    'feller',
-    'felling',
-    'fellowships',
-    'fells',
     'fenari',
-    'fenced',
-    'fend',
-    'fenn',
-    'fens',
-    'fenton',
-    'fermentation',
-    'fern',
-    'ferocity',
-    'ferrets',
-    'fertilisers',
-    'fertilizer',
-    'fertilizers',
-    'fervent',
-    'fervently',
-    'feud',
     'feudalism',
-    'feverish',
-    'fianc&eacute;e',
-    'fictitious',
-    'fiddled',
-    'fieldfare',
-    'fiesta',
-    'fifteenth-century',
-    'fifty-five',
-    'figs.',
-    'figurative',
-    'filler',
-    'fillings',
-    'filly',
-    'filmmakers',
-    'finality',
     'financier',
-    'finchley',
-    'finesse',
-    'fingerboard',
-    'fingered',
-    'fingering',
-    'finlay',
-    'finlayson',
-    'firefighters',
-    'firelight',
-    'firewood',
-    'firework',
-    'firmness',
-    'first-floor',
-    'first-rate',
-    'first-year',
     'fischer',
-    'fishery',
-    'fishes',
-    'fishkeeping',
-    'fittest',
-    'five-day',
-    'five-year-old',
-    'fives',
-    'fixes',
-    'fl',
-    'flagged',
-    'flagging',
-    'flailing',
-    'flak',
-    'flakes',
-    'flanker',
     'flanking',
-    'flannel',
-    'flapped',
-    'flashman',
-    'flatten',
-    'flattery',
-    'flea',
-    'fleas',
-    'fledgling',
-    'fleetwood',
-    'fleischmann',
-    'fleshy',
-    'flexed',
-    'flinch',
-    'flinging',
-    'flirting',
     'flocked',
-    'flogging',
-    'floodlit',
-    'flooring',
-    'flop',
-    'flopped',
-    'florian',
-    'flotilla',
-    'floy',
-    'fluctuating',
-    'fluctuation',
-    'flue',
-    'fluency',
-    'fluorescence',
-    'flushing',
-    'flustered',
     'flutter',
-    'flyer',
-    'fn',
-    'foggy',
-    'follower',
-    'fon',
-    'fonda',
-    'fondly',
-    'fondness',
-    'foolishly',
-    'footballing',
-    'foothills',
-    'foothold',
-    'footnote',
-    'footnotes',
-    'footprint',
     'footprints',
-    'foraging',
-    'forays',
-    'forbade',
-    'forceps',
-    'forecourt',
-    'forefinger',
-    'forerunner',
-    'foresaw',
-    'foresight',
-    'forester',
-    'foresters',
-    'foreword',
-    'forfeit',
-    'forfeited',
-    'forfeiture',
     'forgery',
-    'forgets',
-    'forging',
-    'forgiving',
-    'forked',
-    'forks',
-    'forlorn',
-    'formalized',
-    'formulas',
-    'forrest',
-    'forsyth',
-    'forthright',
-    'fortran',
-    'forts',
-    'forty-two',
-    'forwarded',
     'foundered',
-    'foundry',
-    'four-day',
-    'fourthly',
-    'fowl',
-    'foxton',
-    'foyle',
-    'fr&auml;ulein',
-    'fractional',
-    'fractures',
-    'fragility',
-    'fragmentary',
-    'frailty',
-    'frameworks',
-    'fran&ccedil;ois',
-    'francesco',
     'franchises',
-    'franchising',
-    'francois',
-    'fray',
-    'frayed',
-    'frazer',
-    'freda',
-    'freddy',
-    'frederica',
-    'free-standing',
-    'frenchmen',
-    'frenzied',
-    'frequented',
-    'frere',
-    'fresco',
-    'frescoes',
     'freshness',
-    'freudian',
-    'friendliness',
-    'frightful',
-    'fringed',
-    'frizzell',
-    'frodo',
-    'front-end',
-    'front-line',
-    'frontage',
-    'frontal',
-    'fronted',
-    'froth',
-    'fruition',
-    'fruity',
-    'frustrate',
     'fucked',
-    'fudge',
-    'fugitive',
-    'fujimori',
-    'fulfils',
-    'full-blown',
-    'full-length',
-    'fumbling',
-    'fuming',
-    'funchal',
-    'functionalism',
-    'functionally',
-    'functioned',
-    'fundamentalism',
-    'fundamentalists',
-    'fundamentals',
     'fundholders',
-    'funk',
-    'funnel',
-    'furlong',
-    'furnaces',
-    'furore',
-    'furry',
-    'furs',
-    'furtive',
-    'fussy',
-    'futility',
-    'fuzzy',
-    'g-7',
-    'gables',
-    'gadgets',
-    'gag',
     'gaiety',
-    'gainsborough',
-    'gait',
-    'gal',
-    'galerie',
-    'gales',
-    'gallacher',
-    'galloped',
-    'galloping',
-    'gallows',
-    'gallup',
-    'galvanised',
-    'ganglion',
-    'gangster',
-    'gaped',
-    'garcia',
     'garner',
-    'garnish',
-    'garter',
-    'garth',
-    'gascony',
-    'gash',
-    'gasps',
-    'gaston',
-    'gatehouse',
-    'gateways',
-    'gathers',
-    'gatting',
-    'gaudy',
-    'gaul',
-    'gauntlet',
-    'gav',
     'gaveston',
-    'gays',
-    'gb',
-    'gc',
-    'gcc',
-    'gce',
-    'gels',
-    'gemini',
-    'genera',
-    'generalisation',
-    'generalisations',
-    'generalizations',
-    'generalize',
-    'generative',
-    'genial',
-    'genital',
     'genoa',
-    'genome',
-    'genomic',
-    'genres',
-    'gent',
-    'genteel',
-    'gentleness',
-    'gentler',
-    'gents',
-    'geochemical',
-    'geologist',
-    'geometrical',
-    'geomorphology',
-    'geophysical',
-    'geordie',
-    'georg',
     'geothermal',
-    'geraldine',
-    'geriatric',
-    'germ',
-    'germanic',
-    'germs',
-    'gertrude',
-    'gestation',
-    'getty',
-    'ghetto',
-    'gibbon',
-    'gibbons',
-    'gifford',
-    'giggles',
-    'giggs',
-    'gilbey',
     'gillespie',
-    'gills',
-    'ginny',
-    'girlfriends',
-    'gist',
-    'git',
-    'glaciers',
-    'gladys',
-    'glasnost',
-    'glassy',
-    'glaxo',
-    'glaze',
-    'gleaned',
-    'glee',
-    'gliders',
-    'glinting',
     'gloomily',
-    'glories',
-    'glossary',
-    'glover',
-    'gluten',
-    'glyn',
-    'gmbh',
-    'goddard',
-    'godfather',
-    'godfrey',
-    'godmother',
-    'goebbels',
-    'goggles',
-    'goldie',
-    'goldman',
-    'gomez',
     'gonorrhoea',
-    'good-natured',
-    'goreng',
-    'gorse',
-    'governance',
-    'governess',
-    'governs',
-    'gowns',
-    'graced',
-    'gradients',
-    'graduating',
-    'graduation',
-    'graf',
-    'graft',
-    'grafted',
-    'grainne',
     'grande',
-    'grander',
-    'grandpa',
-    'grandstand',
-    'grantham',
-    'granville',
-    'grapevine',
-    'graphite',
-    'grassroots',
-    'gratification',
-    'gratified',
-    'gratifying',
-    'grating',
-    'gratuitous',
-    'graze',
-    'greener',
     'greenery',
-    'greenfield',
-    'grenade',
-    'grenades',
-    'grenfell',
-    'greyhound',
-    'grids',
-    'grieve',
-    'grille',
-    'grilled',
-    'grimace',
-    'grimaced',
-    'grimes',
-    'grimm',
-    'grimy',
-    'grins',
     'gritty',
-    'groaning',
-    'grocer',
-    'groceries',
-    'grocery',
-    'grooming',
-    'grooms',
-    'grooves',
-    'groped',
-    'groping',
-    'grounding',
-    'groundwork',
-    'grouse',
-    'growl',
-    'grown-ups',
-    'grub',
     'grudge',
-    'grudging',
-    'grudgingly',
-    'gruelling',
-    'gruesome',
-    'grumble',
-    'grumbling',
-    'grunt',
-    'grunte',
-    'guarantor',
-    'guernsey',
-    'guesses',
-    'guidebook',
-    'guildhall',
-    'guillotine',
-    'guiltily',
     'guisborough',
-    'gull',
-    'gullible',
-    'gulp',
-    'gums',
-    'gunfire',
-    'gunn',
-    'gunner',
-    'gunpowder',
-    'guru',
-    'gus',
-    'gust',
-    'gustave',
-    'gutted',
-    'gutters',
-    'guyana',
     'gwent',
-    'gymnasium',
-    'habermas',
-    'habitation',
-    'habitually',
-    'habituation',
-    'habsburg',
-    'hacked',
-    'hadley',
-    'hadrian',
-    'haggard',
-    'haig',
-    'hairdressers',
-    'hairdressing',
-    'half-brother',
-    'half-hearted',
     'hallmark',
-    'hallo',
-    'halo',
-    'halting',
-    'halve',
-    'hammers',
-    'hamper',
-    'hamstring',
-    'han',
-    'hancock',
-    'hand-held',
-    'handel',
-    'handers',
-    'handicaps',
-    'handmade',
-    'handout',
     'handshake',
-    'handsomely',
-    'handwritten',
-    'hanger',
-    'hankin',
-    'hanley',
-    'hanoi',
-    'hanover',
-    'hansard',
-    'hapless',
-    'harald',
-    'hard-pressed',
-    'hard-working',
-    'hardback',
-    'hardcore',
-    'hardening',
     'hardline',
-    'hardships',
-    'hardwood',
-    'harem',
-    'hares',
-    'hargreaves',
-    'harker',
-    'harlequin',
-    'harlequins',
-    'harmed',
-    'harmonisation',
-    'harnessed',
-    'harrier',
-    'harriers',
-    'harrington',
-    'harrowing',
     'harsher',
-    'harshness',
-    'harsnet',
-    'harvested',
-    'harvesting',
-    'haslemere',
-    'hasten',
-    'hatching',
-    'hateley',
-    'hatt',
-    'hattersley',
-    'haulier',
-    'hauser',
-    'havana',
-    'havisham',
-    'hawaiian',
     'hawick',
-    'hawke',
-    'hawks',
-    'hawthorn',
-    'haydn',
-    'hayling',
-    'hayman',
-    'head-on',
-    'headhunters',
-    'headhunting',
-    'headingley',
-    'headteachers',
-    'heaped',
-    'hearsay',
-    'heartfelt',
-    'heartily',
     'heartland',
-    'heartless',
-    'heats',
-    'heave',
-    'hebden',
-    'heck',
-    'hectare',
-    'hedgehogs',
-    'hedgerow',
-    'hedging',
-    'heidi',
-    'heinrich',
-    'heinz',
-    'heiress',
-    'helicobacter',
-    'helium',
     'helix',
-    'hellenistic',
-    'helpfully',
-    'hemingway',
-    'hendon',
-    'hendrix',
-    'henrietta',
-    'hepzibah',
-    'heresy',
-    'herman',
-    'hermitage',
-    'hernia',
-    'herodotos',
-    'herts',
-    'hesitantly',
-    'heterogeneity',
     'hewlett',
-    'hezbollah',
-    'hg',
-    'hi-tech',
-    'hibs',
-    'high-performance',
-    'high-powered',
-    'high-ranking',
-    'high-rise',
-    'high-risk',
-    'highgate',
-    'highlander',
-    'hijacked',
-    'hike',
-    'hillary',
-    'hillsides',
     'hilly',
-    'hilt',
-    'himalayas',
-    'hindered',
-    'hindrance',
-    'hinduism',
-    'hindus',
-    'hinge',
-    'hinged',
-    'hinkley',
-    'hinterland',
-    'hinting',
-    'hippies',
-    'hippy',
-    'hir',
-    'hitchcock',
     'hiv-1',
-    'hoard',
-    'hoare',
-    'hoarsely',
-    'hoax',
-    'hob',
-    'hobson',
-    'hodder',
-    'hoddle',
-    'hodgson',
-    'hoffmann',
-    'hog',
-    'hogan',
-    'holborn',
-    'holden',
-    'holed',
     'holidaymakers',
-    'holiness',
-    'holism',
-    'hollidaye',
-    'hollows',
-    'holocaust',
-    'holywood',
-    'home-grown',
-    'homer',
-    'homesick',
-    'homicide',
-    'homoeopathic',
-    'homoeopathy',
-    'homogeneity',
-    'homologous',
-    'homology',
     'honduras',
-    'honecker',
-    'hoo',
-    'hooligan',
-    'hooliganism',
-    'hoops',
-    'hooray',
-    'hopelessness',
-    'hopped',
-    'horde',
-    'hormonal',
-    'horrifying',
-    'horse-drawn',
-    'horseback',
-    'horseman',
-    'horseshoe',
     'hosting',
-    'hotline',
-    'hotspur',
-    'hotter',
-    'hottest',
-    'hover',
-    'howarth',
-    'howl',
-    'howled',
-    'hrs',
-    'hse',
-    'hue',
-    'hullo',
-    'humanism',
-    'humanist',
-    'humankind',
     'humid',
-    'hump',
-    'hun',
-    'hundredth',
-    'hungarians',
-    'huntingdon',
-    'hunts',
-    'hurley',
-    'hurling',
-    'hurricanes',
-    'husbandry',
-    'huskily',
-    'husky',
-    'hussey',
-    'huxley',
-    'hyacinth',
     'hybridisation',
-    'hybridization',
-    'hybrids',
-    'hydra',
-    'hydrocarbons',
-    'hypertext',
-    'hypnotic',
-    'hypocrite',
-    'hypoglycaemia',
-    'iaea',
-    'ibanez',
-    'ibn',
-    'iboa',
-    'icc',
-    'iced',
-    'ida',
     'idb',
-    'idealist',
-    'idealistic',
-    'idealized',
-    'identifiers',
-    'ideologically',
-    'idiots',
-    'idleness',
-    'idols',
-    'ignited',
-    'ii\'s',
-    'ilea',
-    'ileal',
-    'ileum',
-    'ill-fated',
-    'illegality',
     'illinois',
-    'illusory',
-    'illustrative',
-    'illustrator',
-    'imaginable',
-    'imagines',
-    'imbalances',
-    'imbued',
-    'imitating',
-    'immaterial',
-    'immediacy',
-    'immobile',
-    'immorality',
-    'immortality',
-    'impair',
-    'impart',
     'impartiality',
-    'impasse',
-    'impassioned',
-    'impassive',
-    'impede',
-    'impeded',
-    'impenetrable',
-    'imperatives',
-    'imperfections',
-    'imperialist',
-    'impervious',
-    'impinge',
-    'implacable',
-    'implant',
-    'implausible',
-    'implementations',
     'importation',
-    'importer',
-    'importers',
-    'impossibly',
-    'impotence',
-    'impracticable',
-    'impressionist',
-    'impressively',
-    'impromptu',
-    'improvisation',
-    'impulsive',
-    'in_accord_with',
-    'in_consultation_with',
-    'in_defence_of',
-    'in_lieu_of',
-    'in_receipt_of',
     'in_reply_to',
-    'inactivity',
-    'inadequately',
-    'inanimate',
-    'inauguration',
-    'inc.',
-    'incapacity',
-    'ince',
-    'incense',
-    'incensed',
-    'incessant',
-    'incineration',
-    'incinerator',
-    'incipient',
-    'incisive',
-    'inclinations',
     'incline',
-    'incoherent',
-    'incomers',
-    'incompatibility',
-    'incongruous',
-    'incredulity',
-    'incredulous',
-    'incredulously',
-    'incurring',
-    'indebtedness',
-    'indecency',
-    'indecision',
-    'indented',
-    'indeterminate',
-    'index-linked',
-    'indiana',
     'indicted',
-    'indigestion',
-    'indignantly',
-    'indigo',
-    'indiscriminate',
-    'individualist',
-    'individualistic',
-    'indo-china',
-    'indomethacin',
-    'inducement',
-    'induces',
-    'inducing',
-    'inductance',
-    'industrialist',
-    'industrious',
-    'ineffectual',
     'ineligible',
-    'inept',
-    'inevitability',
-    'inexorable',
-    'inexperience',
-    'infallible',
-    'infantile',
-    'inferiority',
-    'infested',
-    'infiltration',
-    'inflicting',
-    'inflow',
-    'influenza',
-    'info',
-    'informant',
-    'infra-red',
     'infringed',
-    'infuriating',
-    'infused',
-    'ing',
-    'ingestion',
-    'ingram',
-    'ingres',
-    'ingrid',
-    'inhaled',
-    'inhibiting',
-    'inhibitions',
-    'inhibitor',
-    'inhibits',
-    'inhuman',
-    'injure',
-    'injuring',
     'inkatha',
-    'inkling',
-    'inlaid',
-    'inlet',
-    'innocuous',
-    'input-output',
-    'inquire',
-    'inquisition',
-    'inquisitive',
-    'inroads',
-    'ins',
-    'insanity',
-    'insatiable',
-    'inscriptions',
-    'inserts',
-    'insides',
     'insidious',
-    'insoluble',
-    'inspirational',
-    'instigated',
-    'institutionalised',
-    'institutionalized',
-    'instructing',
-    'instrumentation',
-    'insufficiently',
-    'insulating',
-    'insulted',
-    'insurrection',
-    'intangible',
-    'integers',
-    'intelligently',
-    'intensification',
     'intensively',
-    'interacts',
-    'interception',
-    'interchangeable',
-    'interdependent',
-    'interferon',
-    'interlocutory',
-    'interlude',
-    'interminable',
-    'intermittently',
-    'internment',
-    'interoperability',
-    'interpretative',
-    'interprets',
-    'interrogated',
-    'interruptions',
     'intertwined',
-    'interventionist',
-    'interview(s)',
-    'interviewee',
-    'interviewees',
-    'interwar',
-    'intifada',
-    'intracellular',
-    'intractable',
-    'intrude',
-    'intruders',
-    'intuitively',
-    'inundated',
-    'invalidity',
-    'invasions',
-    'invasive',
     'inventing',
-    'inventories',
-    'invoking',
-    'ionic',
-    'ip',
-    'iranians',
-    'iraqis',
-    'ironed',
-    'irradiation',
-    'irregularly',
-    'irrelevance',
-    'irrevocable',
-    'irrevocably',
-    'irving',
-    'isa',
-    'isabelle',
     'isaiah',
-    'isambard',
-    'isdn',
-    'isolates',
-    'isolating',
-    'italics',
-    'itching',
-    'ives',
-    'iwc',
-    'ixi',
-    'ixora',
-    'izzie',
-    'ja',
-    'jacobs',
-    'jacquard',
-    'jagger',
     'jamming',
-    'jams',
-    'janata',
-    'janeiro',
-    'jannie',
-    'jardine',
-    'jarman',
-    'jasmine',
-    'jc',
-    'je',
-    'jeanne',
-    'jehovah',
-    'jennie',
-    'jennings',
-    'jeopardise',
-    'jeremiah',
     'jerking',
-    'jerome',
-    'jesse',
-    'jesuit',
-    'jett',
-    'jeweller',
-    'jewellers',
-    'jna',
-    'joel',
-    'jog',
-    'jogged',
-    'johann',
-    'johnnie',
-    'joker',
-    'jolt',
-    'jonadab',
     'jonas',
-    'jonathon',
-    'jordanian',
-    'jordanstown',
-    'jorge',
-    'jos',
-    'josef',
-    'josephine',
-    'jostling',
-    'jot',
-    'jotan',
-    'journalistic',
-    'joyous',
-    'jr',
-    'js',
-    'jtr',
     'judas',
-    'jude',
-    'judicious',
-    'judo',
-    'juggling',
-    'jugs',
-    'juicy',
-    'jumbo',
-    'jumpers',
-    'juncture',
-    'jung',
-    'junta',
-    'juries',
-    'jurisdictional',
-    'jurors',
-    'justifiably',
     'justifications',
-    'justly',
-    'jutting',
-    'juveniles',
-    'juxtaposition',
-    'k.b',
-    'kaiser',
-    'kalchu',
-    'kansas',
-    'karelius',
-    'karr',
-    'katharine',
-    'katy',
-    'kaufman',
-    'kaye',
-    'keane',
     'kee',
-    'keel',
-    'kempton',
-    'kendal',
-    'kennel',
-    'kennels',
-    'kentish',
-    'kenton',
-    'kentucky',
-    'kenyan',
-    'kestrel',
-    'keswick',
-    'kettering',
-    'kew',
-    'keyboards',
-    'keyhole',
     'keynote',
-    'keywords',
-    'khaki',
-    'khmers',
-    'khomeini',
-    'kick-off',
-    'kidderminster',
-    'kidnappers',
-    'kieran',
-    'killion',
-    'kilmarnock',
-    'kiln',
-    'kilo',
-    'kilos',
-    'kinda',
-    'kinder',
     'kingship',
-    'kinsman',
-    'kiosk',
-    'kipling',
-    'kirby',
-    'kittens',
-    'kiwi',
-    'knaresborough',
-    'kneel',
-    'knighted',
-    'knighthood',
-    'knighton',
-    'knightsbridge',
-    'knitwear',
-    'knobs',
-    'knock-on',
     'knockout',
-    'knossos',
-    'know_how',
-    'knowles',
-    'koch',
-    'kodak',
-    'koons',
-    'koreans',
-    'kruger',
-    'kuhn',
-    'kumar',
-    'kung_fu',
-    'l&auml;nder',
-    'l&eacute;vi-strauss',
-    'l1',
-    'l3',
     'labor',
-    'laborious',
-    'labrador',
-    'lac',
-    'lacey',
-    'lacquer',
-    'lacuna',
-    'lacy',
-    'lagged',
-    'lagoon',
-    'lags',
-    'laidlaw',
-    'laissez-faire',
-    'lal',
-    'lament',
-    'lamented',
     'lamina',
-    'laminated',
-    'lampard',
-    'lancet',
-    'lancs',
-    'landless',
-    'landscaped',
-    'landscaping',
-    'landslide',
-    'lanfranc',
-    'languid',
-    'lankan',
-    'laos',
-    'lapping',
-    'lapses',
-    'larder',
     'larne',
-    'larval',
-    'lash',
-    'late-night',
-    'latimer',
-    'latitudes',
-    'latvian',
-    'lauda',
-    'laundering',
-    'laurel',
-    'lauren',
-    'laurent',
-    'laurie',
-    'lavas',
-    'lavatories',
-    'lavinia',
     'lavishly',
-    'lawfully',
-    'lawrie',
-    'lax',
-    'layered',
-    'layman',
-    'laymen',
-    'layouts',
-    'lazio',
-    'lbs',
-    'lc',
-    'lddc',
-    'leach',
-    'leaching',
-    'leafy',
-    'leagues',
     'leakage',
-    'leans',
-    'leaped',
-    'leasehold',
-    'leash',
-    'leavis',
-    'lectured',
-    'lecturing',
-    'leech',
-    'left-handed',
-    'legacies',
-    'leger',
-    'leggings',
-    'legislate',
-    'lego',
-    'leighton',
     'leipzig',
-    'lengthened',
-    'lengthening',
-    'lenient',
-    'lennon',
-    'lenny',
-    'leonardo',
-    'leone',
-    'leonie',
-    'lesotho',
-    'lessee',
-    'lessened',
-    'lessor',
-    'lettering',
-    'levelling',
-    'levies',
     'levin',
-    'lexandro',
-    'ley',
-    'lfa',
-    'liaise',
-    'liberally',
-    'liberate',
-    'liberating',
-    'libertarian',
-    'lice',
-    'lichfield',
-    'lien',
-    'life-cycle',
-    'lifeline',
-    'liffe',
-    'ligaments',
     'lighten',
-    'lightness',
-    'likeable',
-    'likened',
-    'likud',
-    'lil',
-    'lilac',
-    'lilian',
-    'limbo',
-    'limelight',
-    'limerick',
-    'limitless',
-    'limousine',
-    'limped',
-    'limping',
-    'lin',
     'line-out',
-    'liners',
-    'linford',
-    'ling',
-    'linguist',
-    'linton',
-    'liquidator',
-    'lire',
-    'lister',
-    'litany',
-    'litem',
-    'lithosphere',
-    'livesey',
-    'livingston',
-    'lizard',
-    'lizards',
     'llandudno',
-    'llewellyn',
-    'lm',
-    'loaned',
-    'loathe',
-    'loathed',
-    'loathing',
-    'loaves',
-    'lob',
-    'lobe',
-    'localized',
-    'lochs',
-    'lockwood',
-    'loco',
-    'lodger',
-    'lodges',
     'logged',
-    'logistic',
-    'logistics',
-    'logos',
-    'lok',
-    'londoner',
-    'long-awaited',
-    'long-established',
-    'long-lasting',
-    'long-range',
-    'long-run',
-    'long-running',
-    'long-stay',
-    'long-time',
-    'longevity',
-    'longstanding',
     'lonsdale',
-    'lookout',
-    'loony',
-    'loosening',
-    'loot',
-    'looted',
-    'looting',
-    'lore',
-    'lorenzo',
-    'lori',
-    'lorimer',
-    'lorne',
-    'lotion',
-    'loudspeaker',
-    'louisiana',
-    'lourdes',
     'louvre',
-    'lovable',
-    'lovell',
-    'low-end',
-    'low-fat',
-    'low-income',
-    'low-key',
-    'low-paid',
-    'lowell',
-    'lowlands',
-    'lowry',
-    'lr',
-    'lsd',
-    'lt.-gen',
-    'lta',
-    'ltte',
     'lucid',
-    'lucie',
-    'lucinda',
-    'lucker',
-    'ludo',
-    'ludovico',
-    'ludwig',
-    'luftwaffe',
-    'luisa',
-    'lukewarm',
-    'lukic',
-    'lull',
-    'lumen',
-    'lumpy',
-    'lunch-time',
-    'lunged',
     'lurch',
-    'lurgan',
-    'lurid',
-    'lustre',
-    'lutheran',
-    'lybrand',
-    'lyell',
-    'lymph',
-    'lynne',
-    'lynx',
-    'm.r.',
-    'm1',
-    'm25',
-    'm4',
-    'mabs',
-    'macabre',
     'macaulay',
-    'macca',
-    'macclesfield',
-    'mace',
-    'macedonian',
-    'mach',
-    'machin',
-    'machine-readable',
-    'mackerel',
-    'mackie',
-    'mackintosh',
-    'macquillan',
-    'macro',
-    'macrophages',
-    'macsharry',
-    'madagascar',
     'madly',
-    'madman',
-    'maestro',
-    'maff',
-    'magdalen',
-    'maggots',
-    'magically',
-    'magma',
-    'magnate',
-    'magnates',
-    'magnetism',
-    'magnets',
-    'magnification',
-    'magnificently',
-    'magnified',
-    'maguire',
     'mahoney',
-    'maidenhead',
-    'mainstay',
-    'maitland',
-    'majorca',
-    'majorities',
-    'majors',
-    'makeup',
-    'mal',
-    'malaise',
-    'malaya',
-    'malevolent',
-    'mali',
-    'mallet',
-    'malnutrition',
-    'malpractice',
     'maltese',
-    'maltings',
-    'maman',
-    'mamma',
-    'mammoth',
-    'mammy',
-    'managements',
-    'mancini',
-    'mane',
-    'manhood',
-    'mania',
-    'maniac',
-    'manifestly',
-    'manifold',
-    'manipulative',
-    'manly',
     'mannheim',
-    'manoeuvred',
-    'manoeuvring',
-    'manors',
-    'mans',
-    'mansions',
-    'manson',
-    'maori',
-    'marbles',
-    'marcel',
-    'marchers',
-    'mares',
-    'margery',
-    'margot',
-    'marguerite',
-    'mariana',
     'marijuana',
-    'mariner',
-    'marino',
-    'markby',
-    'market-place',
-    'marketable',
-    'marley',
-    'marlon',
-    'marlow',
-    'marlowe',
-    'maroon',
-    'marquess',
-    'marries',
-    'marsden',
-    'marseille',
-    'marseilles',
     'marston',
-    'martina',
-    'martyrs',
-    'marvel',
-    'marvellously',
-    'marvin',
-    'marwick',
-    'maryland',
-    'marzipan',
-    'mascara',
-    'mash',
-    'masha',
-    'mashed',
-    'masking',
-    'masons',
-    'massey',
     'massingham',
-    'masterpieces',
-    'masts',
-    'masturbation',
-    'materialise',
-    'materialist',
-    'mathematically',
-    'mathematician',
-    'mathematicians',
-    'matter-of-fact',
-    'matter_of_fact',
-    'matthey',
-    'mattresses',
-    'maturation',
-    'matured',
-    'maturing',
     'maude',
-    'maurin',
-    'maverick',
-    'maximal',
-    'maximising',
-    'maxine',
-    'mayer',
-    'mayfair',
-    'mayhem',
-    'maynard',
-    'mayo',
-    'mayonnaise',
-    'mayors',
-    'mb',
-    'mba',
-    'mcbride',
     'mccann',
-    'mccartney',
-    'mccoist',
-    'mccready',
-    'mcdermott',
-    'mcdougall',
-    'mcenroe',
-    'mcgrath',
-    'mcgregor',
-    'mcintosh',
-    'mckay',
-    'mckenna',
-    'mcleod',
-    'mcmillan',
-    'mcnab',
-    'means-tested',
     'meats',
-    'mecca',
-    'medallist',
-    'mediaeval',
-    'mediator',
-    'medically',
-    'mediocre',
-    'medium-term',
-    'medley',
-    'medrese',
-    'medway',
-    'meek',
-    'meekly',
-    'mega',
-    'meh\'lindi',
-    'mehmed',
     'melodies',
-    'melodrama',
-    'melon',
-    'melrose',
-    'melville',
-    'memoir',
-    'memorabilia',
-    'memoranda',
-    'memorials',
-    'mended',
-    'mending',
-    'menem',
-    'mens',
-    'menstrual',
-    'menstruation',
-    'mercenaries',
     'mercenary',
-    'merchiston',
-    'mercian',
-    'merciful',
-    'mercifully',
-    'merlin',
-    'merovingian',
-    'merrily',
-    'meryl',
-    'merymose',
-    'meself',
-    'messed',
-    'messengers',
-    'metalwork',
-    'metaphorical',
-    'metaphysics',
     'metaplasia',
-    'methodical',
-    'methyl',
-    'meticulously',
-    'mgm',
-    'mhc',
-    'mia',
-    'michelin',
-    'michigan',
-    'microelectronics',
-    'microorganisms',
-    'microphones',
-    'microprocessors',
-    'microscopy',
-    'mid-1960s',
-    'mid-air',
     'mid-nineteenth',
-    'mid-range',
-    'mid-term',
-    'midwinter',
-    'midwives',
-    'migraine',
-    'migrated',
-    'migrating',
-    'miguelito',
-    'milder',
-    'milestone',
-    'milieu',
-    'militarily',
-    'militias',
-    'milkman',
-    'millar',
     'millet',
-    'milligan',
-    'millimetre',
-    'millionaires',
-    'milne',
-    'milosevic',
-    'mime',
-    'minch',
-    'minder',
-    'mindful',
-    'mined',
-    'minefield',
-    'mineralisation',
-    'mingling',
-    'minh',
-    'minimised',
     'minimising',
-    'minnesota',
-    'minnie',
-    'minors',
-    'mira',
-    'mirage',
-    'mirth',
-    'miscarriage',
-    'mislead',
-    'mismanagement',
-    'mismatch',
-    'mississippi',
-    'missus',
-    'mistaking',
-    'mistrust',
-    'mists',
     'misunderstandings',
-    'mitcham',
-    'mite',
-    'mitigate',
-    'mitsubishi',
-    'mixer',
-    'mixes',
-    'miyazawa',
-    'mk',
-    'mmc',
-    'mme',
-    'mmm',
-    'mobilization',
-    'mobilize',
-    'mobs',
-    'modal',
     'moderator',
-    'modernised',
-    'mogadishu',
-    'mogul',
-    'molars',
-    'mold',
-    'moldova',
-    'molluscs',
-    'monet',
-    'moneys',
-    'mongolian',
-    'mono',
-    'monochrome',
-    'monograph',
-    'monolithic',
-    'monologue',
     'monotony',
-    'monroe',
-    'monsoon',
-    'mont',
-    'montagu',
-    'montague',
-    'montenegro',
-    'monty',
-    'moons',
-    'moorish',
-    'mooted',
-    'moratorium',
-    'moray',
-    'morbid',
-    'morenz',
-    'mori',
     'morland',
-    'morphine',
-    'morrow',
-    'mortals',
-    'moseley',
-    'mosquitoes',
-    'motel',
-    'motherboard',
-    'motioned',
-    'motley',
-    'mottled',
-    'mourners',
-    'mouthpiece',
-    'mover',
-    'mower',
-    'moynihan',
     'mt',
-    'mth',
-    'mubarak',
-    'much-needed',
-    'mucking',
-    'mufti',
-    'muftilik',
-    'muir',
-    'mujaheddin',
-    'mulberry',
-    'mule',
-    'mules',
-    'mull',
-    'multi',
-    'multi-million',
-    'multi-national',
     'multi-party',
-    'multi-processing',
-    'multicultural',
-    'multidisciplinary',
-    'multiples',
-    'multiprocessing',
-    'munitions',
-    'mural',
-    'murmuring',
-    'murrayfield',
-    'mus&eacute;e',
-    'muse',
-    'musically',
-    'muslin',
-    'mussels',
-    'musty',
     'mutants',
-    'mutilated',
-    'mutiny',
-    'mutter',
-    'mutton',
-    'muzzle',
-    'mw',
-    'myanma',
-    'myers',
-    'myles',
-    'myra',
-    'mysticism',
-    'mystics',
-    'mystified',
-    'mystique',
-    'nacl',
     'nahum',
-    'najibullah',
-    'nakedness',
-    'nalgo',
-    'nameless',
-    'nana',
-    'nap',
-    'nape',
-    'napkin',
-    'napoleonic',
-    'nappy',
-    'narcotics',
-    'narratives',
-    'nasser',
-    'nat',
-    'natal',
     'natalie',
-    'natasha',
-    'naturalistic',
-    'naturalists',
-    'nautical',
-    'navigate',
-    'nawab',
-    'ncp7',
-    'nct',
-    'nd',
-    'neal',
-    'neared',
-    'nearest_to',
-    'necessitate',
-    'necessitates',
-    'nectar',
     'needham',
-    'negation',
-    'negatives',
-    'neglecting',
-    'negotiable',
-    'negotiator',
-    'negro',
-    'nenna',
-    'neo-classical',
-    'neolithic',
-    'neonatal',
-    'neptune',
-    'nervosa',
-    'ness',
-    'nestling',
-    'netted',
     'nettles',
-    'neurological',
-    'neuron',
-    'neurosis',
-    'neutralisation',
-    'nevil',
-    'nevis',
-    'newfoundland',
-    'newley',
-    'newsagent',
-    'newsagents',
-    'newsletters',
-    'newsome',
-    'newtown',
-    'ngc',
-    'nguyen',
     'nicaraguan',
-    'nicest',
-    'niches',
-    'nicholls',
-    'nichols',
-    'nickel',
-    'nicol',
-    'nicolae',
-    'nicolas',
-    'nicole',
-    'nicotine',
-    'nigger',
-    'night-time',
-    'nightdress',
-    'nightfall',
-    'nightingale',
     'nikolai',
-    'nintendo',
-    'nipped',
-    'nipple',
-    'nippon',
-    'nirvana',
-    'nitrates',
-    'nkrumah',
-    'nm',
-    'no-arbitrage',
-    'nods',
-    'noir',
-    'nome',
-    'nomenclature',
-    'nominee',
-    'nominees',
     'non-governmental',
-    'non-manual',
-    'non-payment',
-    'non-profit',
-    'non-specific',
-    'non-standard',
-    'nonconformists',
-    'none_other',
-    'nope',
-    'nordic',
-    'norma',
-    'normans',
-    'north-eastern',
-    'north-western',
-    'northants',
-    'northerly',
     'northumbrian',
-    'northward',
-    'nos',
-    'notch',
-    'notched',
-    'notoriety',
-    'nourishment',
-    'noxious',
-    'nozzle',
-    'ns',
-    'nsaid',
-    'nsaids',
-    'nsf',
-    'nu',
-    'nuadu',
-    'nuances',
     'nucleic',
-    'nucleotide',
-    'nucleotides',
-    'nudge',
-    'nuffield',
-    'num',
-    'numerically',
-    'nuremberg',
-    'nurture',
-    'nurturing',
-    'nutmeg',
-    'nutrient',
-    'nutritious',
-    'nvq',
-    'o\'donnell',
-    'o\'leary',
     'o\'malley',
-    'o.k.',
-    'oakeshott',
-    'oakley',
-    'oas',
-    'oaths',
-    'oau',
-    'obe',
-    'obedient',
-    'obediently',
-    'obese',
-    'obesity',
-    'obeying',
-    'objectionable',
-    'objectors',
-    'obliging',
     'obliquely',
-    'obliterated',
-    'obnoxious',
-    'observant',
-    'observational',
-    'obstinate',
-    'obstruct',
-    'obstructing',
-    'obstructive',
-    'occasioned',
-    'occupiers',
-    'och',
-    'octagonal',
-    'octopus',
-    'oddity',
-    'oedipus',
     'oft',
-    'oiled',
-    'old-style',
-    'ole',
-    'olga',
-    'oligonucleotides',
-    'olivier',
-    'ollie',
-    'olympus',
-    'oman',
-    'omar',
-    'omen',
-    'omeprazole',
-    'omi',
-    'ominously',
-    'omit',
     'on-site',
-    'one-fifth',
-    'one-party',
-    'one-quarter',
-    'one-sided',
-    'onlookers',
-    'onshore',
-    'oops',
-    'oozing',
-    'op',
-    'op.',
-    'opcs',
-    'open-air',
-    'opencast',
-    'operatic',
-    'operatives',
     'opioid',
-    'opium',
-    'opposes',
-    'opposites',
-    'optic',
-    'orally',
-    'orchards',
-    'orchestras',
-    'orchestrated',
-    'orchid',
-    'orchids',
-    'ord.',
-    'oregon',
-    'organises',
-    'organist',
-    'organizer',
     'organizers',
-    'orgasm',
-    'orgy',
-    'orientations',
-    'originates',
-    'originator',
-    'orion',
-    'orphan',
-    'orphanage',
-    'orpheus',
-    'orrell',
-    'orthopaedic',
-    'orton',
-    'oscillation',
-    'oslo',
-    'osman',
     'ostrich',
-    'oswiu',
-    'othello',
-    'ottawa',
-    'otter',
-    'otters',
-    'ou',
-    'ounces',
-    'oup',
-    'outbursts',
-    'outcrop',
-    'outflow',
-    'outlaw',
-    'outlawed',
-    'outlying',
-    'outs',
     'outwardly',
-    'outweighed',
-    'outwith',
-    'ovation',
-    'ovens',
-    'overboard',
-    'overflowing',
-    'overhanging',
-    'overlaid',
-    'overlaps',
-    'overleaf',
-    'overload',
-    'overloaded',
-    'overlooks',
-    'overly',
-    'overpowering',
     'overruled',
-    'overrun',
-    'overseeing',
-    'oversight',
-    'overtaking',
-    'overthrown',
-    'overtook',
-    'overture',
-    'overtures',
-    'overturn',
-    'overwhelm',
-    'overworked',
-    'owens',
-    'owt',
-    'ox',
-    'oxen',
     'oxidation',
-    'oysters',
-    'p&amp;p',
-    'p&eacute;tain',
-    'p1',
-    'pac',
-    'paced',
-    'pacifist',
-    'padding',
-    'pageant',
-    'pained',
-    'painstaking',
-    'painstakingly',
-    'pairing',
-    'palaeozoic',
-    'palais',
     'palatable',
-    'palate',
-    'palatine',
-    'paler',
-    'pall',
-    'palladium',
-    'palmerston',
-    'palpable',
-    'pan-european',
-    'panamanian',
-    'pancras',
-    'pancreas',
-    'panda',
-    'pane',
-    'panelling',
-    'panes',
     'pang',
-    'panoramic',
-    'pantry',
-    'papua',
-    'paracetamol',
-    'paraded',
-    'parades',
-    'paradigms',
-    'paralleled',
-    'parallelism',
-    'paralysis',
-    'paranoia',
-    'paraphernalia',
-    'paraphrase',
-    'parietal',
-    'parkland',
     'parliamentarians',
-    'parma',
-    'parquet',
-    'parr',
-    'parti',
-    'participatory',
-    'partido',
-    'partisans',
-    'partridge',
-    'pascal',
-    'passageway',
-    'passively',
-    'passivity',
-    'pastels',
-    'patched',
-    'patchwork',
     'patently',
-    'paternal',
-    'patois',
-    'patriarch',
-    'patrician',
-    'patriot',
-    'patrolling',
-    'patting',
-    'paulo',
-    'paw',
-    'pay-off',
-    'payout',
-    'paz',
-    'pb',
-    'pbs',
-    'pea',
     'peanut',
-    'peanuts',
-    'pebble',
-    'peckham',
-    'pecking',
-    'peculiarities',
-    'pecuniary',
-    'pedagogy',
-    'pedals',
-    'pedestal',
-    'pee',
-    'peep',
-    'peeping',
-    'peerage',
-    'pegasus',
-    'pegged',
     'pelvic',
-    'pelvis',
-    'penalised',
-    'penance',
-    'penchant',
-    'pendant',
-    'peng',
-    'penh',
-    'penicillin',
-    'penn',
-    'penniless',
-    'pennine',
-    'pennines',
-    'pensionable',
-    'penultimate',
-    'penzance',
     'pep',
-    'peppers',
-    'pepsinogen',
-    'per_cent.',
-    'perceives',
-    'perceiving',
-    'perceptible',
-    'percussion',
-    'peregrine',
-    'perestroika',
-    'perfected',
-    'perfusion',
-    'perilous',
-    'perils',
-    'periodical',
-    'peripherals',
     'perish',
-    'perished',
-    'permanence',
-    'permeability',
-    'permian',
-    'permissions',
-    'pernicious',
-    'perot',
-    'peroxide',
-    'perpendicular',
-    'perpetrated',
-    'perpetually',
-    'perpetuate',
-    'perplexed',
-    'persecuted',
-    'perseverance',
     'persians',
-    'personalised',
-    'perspiration',
-    'perturbed',
-    'peruvian',
-    'pessimism',
-    'petersfield',
-    'peterson',
-    'petite',
-    'petitioned',
-    'petitioner',
-    'petrified',
-    'pew',
-    'pews',
-    'pewter',
-    'pg',
     'pga',
-    'pharmaceuticals',
-    'pharmacy',
-    'phasing',
-    'pheasant',
-    'phenotype',
-    'philharmonic',
-    'philippine',
-    'phillis',
-    'phnom',
-    'phoneme',
-    'phoney',
-    'phonology',
-    'phosphorus',
-    'phosphorylation',
-    'photocopy',
     'photon',
-    'photosynthesis',
-    'phrasing',
-    'physiotherapy',
-    'physique',
-    'piaget',
-    'pianos',
-    'pic',
-    'picketing',
-    'pickets',
-    'pickle',
-    'pickles',
-    'pied',
-    'pierce',
-    'pietro',
-    'piggott',
     'piggy',
-    'pigments',
-    'pilgrim',
-    'piloted',
-    'piloting',
-    'pines',
-    'ping',
-    'pinning',
-    'pinochet',
-    'piped',
-    'pippin',
-    'pips',
-    'piracy',
-    'pisa',
-    'piston',
-    'pitching',
     'pitiful',
-    'pitted',
-    'pittsburgh',
-    'pius',
-    'pivotal',
-    'pixel',
-    'pixels',
-    'pizzas',
-    'placid',
-    'plaques',
-    'plasmids',
-    'platelets',
-    'plausibility',
-    'plausibly',
-    'playback',
-    'playboy',
     'playful',
-    'playgroup',
-    'playhouse',
-    'plaza',
-    'pleases',
-    'pleated',
-    'pleats',
-    'pleistocene',
-    'plenum',
-    'plethora',
-    'plinth',
-    'plowden',
-    'pluck',
-    'plumber',
-    'plume',
-    'plumes',
     'plummeted',
-    'plums',
-    'plurality',
-    'plush',
-    'plywood',
-    'poached',
-    'poachers',
-    'poaching',
-    'pod',
-    'poise',
-    'poisons',
-    'polarisation',
-    'polarization',
-    'policewoman',
-    'policy-makers',
-    'policyholders',
     'polio',
-    'polybius',
-    'polyethylene',
-    'polypeptide',
-    'polystyrene',
-    'ponder',
-    'pondering',
-    'pons',
-    'pont',
-    'pooh',
-    'pooled',
-    'pooling',
-    'poolside',
-    'popes',
-    'poppies',
-    'populace',
     'pornographic',
-    'porosity',
-    'porous',
-    'portico',
-    'portillo',
-    'porto',
-    'portraiture',
-    'posi',
-    'positional',
-    'positivism',
-    'possessive',
-    'post-mortem',
-    'post_mortem',
-    'posterior',
-    'posterity',
-    'postmodern',
     'postmodernism',
-    'postulate',
-    'potencies',
-    'potentials',
-    'potty',
-    'poulantzas',
-    'pounce',
-    'pounced',
-    'pounded',
-    'powdered',
-    'powders',
-    'powerlessness',
-    'powys',
-    'ppp',
-    'practicalities',
-    'practicality',
     'pradesh',
-    'pragmatics',
-    'praises',
-    'praising',
-    'pratt',
-    'prawn',
-    'pre',
-    'pre-',
-    'pre-eminent',
-    'pre-emptive',
-    'pre-exposure',
-    'pre-trial',
-    'preachers',
-    'preamble',
-    'preamp',
-    'precariously',
     'precautionary',
-    'precedes',
-    'precinct',
-    'precluded',
-    'preconceptions',
-    'precondition',
-    'precursors',
-    'predation',
-    'predicate',
-    'predictability',
-    'predominance',
-    'predominate',
-    'pregnancies',
-    'prejudicial',
-    'preponderance',
-    'preposterous',
     'prescriptive',
-    'preserves',
-    'presiding',
-    'presidium',
-    'presley',
-    'pressurised',
-    'prestel',
-    'presuppositions',
-    'pretends',
-    'pretentious',
-    'pretext',
-    'prevails',
-    'preventative',
-    'pricked',
-    'prickly',
-    'priestley',
     'primaries',
-    'primate',
-    'primates',
-    'primed',
-    'primers',
-    'primeval',
-    'primrose',
-    'princely',
-    'principality',
-    'principled',
-    'pristine',
-    'pritchard',
-    'private-sector',
-    'privatise',
-    'pro-democracy',
-    'proactive',
     'probate',
-    'probyn',
-    'processions',
-    'proclamation',
-    'proctor',
-    'procure',
-    'prodded',
-    'prodigious',
-    'professed',
-    'proffered',
-    'proficiency',
-    'profitably',
-    'profusion',
-    'prohibiting',
-    'prohibitions',
-    'prohibitive',
     'projector',
-    'proletarian',
-    'prologue',
-    'prompts',
-    'promulgated',
-    'pronouncements',
-    'propagated',
-    'propeller',
-    'prophetic',
-    'proportionality',
-    'proportionate',
-    'proportionately',
-    'propria',
-    'propriety',
-    'prosaic',
-    'prosecutors',
     'prospecting',
-    'prospered',
-    'prostaglandin',
-    'prostate',
-    'protagonist',
-    'protagonists',
-    'protectionism',
-    'protectionist',
-    'protestantism',
-    'protestors',
-    'proton',
-    'protons',
-    'prototypes',
-    'protruding',
-    'proust',
-    'provenance',
     'provence',
-    'proverbial',
-    'providence',
-    'providing_that',
-    'provisionally',
-    'provost',
-    'prune',
-    'prying',
-    'psalms',
-    'psbr',
-    'psc',
-    'psi',
-    'psychedelic',
-    'psychosis',
-    'psychotic',
-    'pu',
     'puberty',
-    'publicise',
-    'publicized',
-    'puddephat',
-    'puddle',
-    'puddles',
-    'puerto',
-    'puffing',
-    'pugh',
-    'pull-out',
-    'pullover',
-    'pulsar',
-    'pun',
-    'puncture',
-    'pundits',
-    'pungent',
     'punt',
-    'pup',
-    'pups',
-    'purcell',
-    'purest',
-    'purification',
-    'purport',
-    'purported',
-    'purports',
-    'purposefully',
-    'pursuance',
-    'pushchair',
-    'pussy',
-    'putney',
-    'putter',
-    'puzzlement',
     'pvc',
-    'pwr',
-    'pyramids',
-    'python',
-    'qa',
-    'qq.v.',
-    'quack',
-    'qualifies',
-    'qualitatively',
-    'qualms',
-    'quantification',
-    'quantified',
-    'quarantine',
-    'quarrelled',
-    'quarrels',
-    'quarter-finals',
     'quashed',
-    'quayside',
-    'quell',
-    'quentin',
-    'queuing',
-    'qui',
-    'quickened',
-    'quietness',
-    'quilt',
-    'quirk',
-    'quitting',
-    'quiver',
-    'quivered',
-    'quorum',
-    'rabin',
-    'rac',
     'racer',
-    'racked',
-    'racking',
-    'radiating',
-    'radiators',
-    'radiocarbon',
-    'radiological',
-    'radiotherapy',
-    'radish',
-    'radon',
-    'rae',
-    'rafferty',
-    'rafsanjani',
-    'rafters',
-    'raiding',
-    'rainwater',
     'raisins',
-    'raked',
-    'raking',
-    'raleigh',
-    'rallying',
-    'raman',
-    'ramifications',
-    'rammed',
-    'ramparts',
-    'ramps',
-    'ramshackle',
-    'ranch',
-    'ranger',
-    'rankings',
-    'raoul',
-    'raphael',
     'raping',
-    'rapped',
-    'rarer',
-    'ras',
-    'raskolnikov',
-    'raspberry',
-    'rasped',
-    'ratagan',
-    'ratepayers',
-    'ratify',
-    'rationalism',
-    'rationalization',
-    'raucous',
-    'ravaged',
-    'ravages',
-    'raving',
     'rayner',
-    'rc',
-    'rca',
-    'rcm',
-    'rd',
-    're-entry',
-    're-establish',
-    're-established',
-    'rea',
-    'reacts',
-    'readability',
-    'real-life',
-    'realignment',
-    'realizes',
-    'reappear',
-    'reappraisal',
     'rearguard',
-    'rearmament',
-    'rearrange',
-    'rearranged',
-    'rearrangement',
-    'reassessment',
-    'reassuringly',
-    'rebates',
-    'rebirth',
-    'rebound',
-    'rebuke',
-    'rebuked',
-    'recalcitrant',
-    'recapture',
-    'recaptured',
-    'receded',
     'receding',
-    'receivership',
-    'recesses',
-    'reciprocity',
-    'recital',
-    'recite',
-    'recited',
-    'recklessly',
-    'recklessness',
-    'reclamation',
-    'reconciling',
-    'recounted',
-    'recoup',
-    'rectification',
-    'rectified',
-    'rectum',
     'recur',
-    'recycle',
-    'red-hot',
-    'reddish',
-    'redeem',
-    'redefined',
-    'rediscovered',
-    'redmond',
-    'reeds',
-    'referent',
-    'referential',
-    'refill',
-    'refine',
-    'refinements',
-    'refinery',
-    'reflexes',
     'reformer',
-    'refrained',
-    'refresh',
-    'refreshed',
-    'refrigeration',
-    'refute',
-    'regaining',
-    'regan',
-    'regatta',
-    'reggae',
-    'reggie',
-    'regimental',
-    'reginald',
-    'regis',
-    'registrations',
-    'regressive',
     'regretting',
-    'rehearse',
-    'rehearsing',
-    'reigned',
-    'reigning',
-    'reigns',
-    'reilly',
-    'reimbursement',
-    'reindeer',
-    'reinstatement',
-    'reintroduced',
-    'reiterate',
-    'rejoice',
-    'rejoicing',
-    'rejoin',
-    'relayed',
     'reliant',
-    'relic',
-    'reliefs',
-    'relinquished',
-    'relished',
-    'relocate',
-    'relocated',
-    'remedied',
-    'reminiscences',
-    'remnant',
-    'remoteness',
-    'removable',
-    'ren&eacute',
-    'renewing',
-    'renfe',
-    'rennie',
     'renounce',
-    'renounced',
-    'renovated',
-    'rentokil',
-    'renton',
-    'renunciation',
-    'reopen',
-    'reopening',
-    'repealed',
-    'repel',
-    'repentance',
-    'repertory',
-    'repetitions',
-    'replicate',
-    'repose',
-    'repossessed',
     'reprinted',
-    'reprisals',
-    'reproach',
-    'reproductions',
-    'reps',
-    'repudiated',
-    'reputations',
-    'reputedly',
-    'requiem',
-    'res',
-    'resale',
-    'rescheduling',
-    'rescuing',
-    'resection',
-    'reseller',
-    'resellers',
     'reserving',
-    'reset',
-    'resettlement',
-    'resided',
-    'residences',
-    'resignations',
-    'resigning',
-    'resilient',
-    'resolute',
-    'resonant',
-    'resorting',
-    'resounding',
-    'resourceful',
-    'respectfully',
-    'respecting',
-    'responsiveness',
     'restated',
-    'restitution',
-    'restlessly',
-    'restlessness',
-    'restricts',
-    'restructure',
-    'restructured',
-    'resurrected',
-    'resuscitation',
-    'retainers',
-    'retardation',
-    'reticent',
-    'retinue',
-    'retires',
-    'retort',
-    'retraining',
     'retreats',
-    'retrieving',
-    'retrograde',
-    'retrospectively',
-    'reuters',
-    'revaluation',
-    'revd',
-    'reverb',
-    'revered',
-    'reverie',
-    'reverses',
-    'reversible',
-    'reviewer',
-    'reviewers',
-    'revising',
-    'reviving',
     'revoked',
-    'revolting',
-    'revolves',
-    'rewrite',
-    'rewritten',
-    'rhoda',
-    'rhythmically',
-    'ri',
-    'ribber',
-    'ricardo',
-    'richter',
-    'rickety',
-    'rico',
-    'riddled',
-    'ridiculed',
-    'ridiculously',
     'rifkind',
-    'rigged',
-    'rigging',
-    'righteous',
-    'righteousness',
-    'rigidity',
-    'rigour',
-    'rigours',
-    'rigs',
-    'ringed',
-    'rink',
-    'rinsed',
-    'rioters',
-    'ripley',
-    'rippled',
-    'ripples',
     'rippling',
-    'ritz',
-    'riva',
-    'rivalries',
-    'riveted',
-    'riviera',
-    'roadshow',
-    'roadway',
-    'roadworks',
-    'roamed',
-    'roaming',
-    'roasted',
-    'roasting',
-    'robb',
-    'robber',
-    'robberies',
     'robbing',
-    'robemaker',
-    'rocastle',
-    'rock\'n\'roll',
-    'rocker',
-    'rodents',
-    'roderick',
-    'rodrigo',
-    'rodriguez',
-    'roh',
-    'roi',
-    'roirbak',
-    'roker',
-    'rolle',
-    'rom',
-    'romanians',
     'romanticism',
-    'roost',
-    'rooting',
-    'rosalind',
-    'rosen',
-    'rosenthal',
-    'rosewood',
-    'rostrum',
-    'rosyth',
-    'rota',
-    'rotated',
-    'roth',
-    'rotherham',
-    'rothschild',
-    'rotterdam',
-    'rouble',
     'rouen',
-    'rouges',
-    'round-up',
-    'roundabouts',
-    'rouse',
-    'rousing',
-    'rout',
-    'routed',
-    'rowan',
-    'rowbottom',
-    'rowe',
-    'rowed',
-    'rowntree',
-    'royalist',
-    'royce',
-    'royston',
     'rp',
-    'rpm',
-    'rs',
-    'ruddock',
-    'ruddy',
-    'rueful',
-    'rugose',
-    'ruining',
-    'rumble',
-    'rumbled',
-    'rumbling',
-    'run-down',
-    'run-off',
-    'runcorn',
-    'rupture',
-    'rustle',
     'rustling',
-    'rutherford',
-    'rutland',
-    'ryley',
-    's.a.',
-    's1',
-    'sabah',
-    'sabrina',
-    'sac',
-    'sachs',
-    'sacrament',
-    'sacrificial',
-    'sacrificing',
-    'saddened',
-    'saddled',
-    'sadie',
     'sadistic',
-    'safeguarding',
-    'safeway',
-    'saffron',
-    'sag',
-    'sagged',
-    'sagging',
-    'saigon',
-    'sal',
-    'salaried',
-    'salim',
-    'salman',
-    'salmonella',
-    'salons',
-    'salted',
-    'salty',
     'salutary',
-    'saluted',
-    'salvaged',
-    'sampson',
-    'samson',
-    'sanchez',
-    'sanctity',
-    'sanderson',
-    'sandinista',
-    'sandison',
-    'sandringham',
-    'sanitation',
-    'santiago',
-    'santos',
-    'sao',
-    'sapphire',
     'sarcastic',
-    'sarcastically',
-    'sardines',
-    'sardinia',
-    'sash',
-    'satanic',
-    'satchell',
-    'satire',
-    'satirical',
-    'saucers',
-    'saul',
-    'savagery',
-    'save_for',
-    'savour',
-    'savoury',
-    'sawdust',
     'saxony',
-    'sbus',
-    'sc',
-    'scaffold',
-    'scalar',
-    'scaling',
-    'scandalous',
-    'scans',
-    'scapegoat',
-    'scarcity',
-    'scares',
-    'scargill',
-    'scarman',
-    'scarves',
-    'scathach',
-    'scents',
     'sceptics',
-    'sch',
-    'sched',
-    'schematic',
-    'schizophrenic',
-    'scholarships',
-    'school-leavers',
-    'schoolboys',
-    'schoolteacher',
-    'schubert',
-    'schumacher',
-    'sclerosing',
-    'sclerosis',
-    'scone',
-    'scones',
-    'scorched',
     'scorers',
-    'scornful',
-    'scornfully',
-    'scoured',
-    'scourge',
-    'scouring',
-    'scowled',
-    'scrapping',
-    'scratches',
-    'screech',
-    'screenplay',
-    'screwing',
-    'scribbled',
-    'scribe',
-    'scroll',
-    'scrubbing',
     'scrupulous',
-    'scrutinised',
-    'scsi',
-    'scudamore',
-    'scullery',
-    'sculpted',
-    'sculptors',
-    'sculptural',
-    'sculptured',
-    'scurried',
-    'scurrying',
-    'scuttled',
-    'sds',
-    'seafood',
-    'seafront',
-    'seamless',
     'searing',
-    'searle',
-    'seaton',
-    'seattle',
-    'seaweed',
-    'seclusion',
-    'second-class',
-    'second-half',
-    'seconder',
-    'secondhand',
-    'secondment',
-    'secreted',
-    'secretory',
-    'sectional',
-    'sects',
-    'sedentary',
     'sedimentary',
-    'sedimentation',
-    'seduce',
-    'seduction',
-    'seeded',
-    'seekers',
-    'seeping',
-    'seething',
-    'sefton',
-    'seine',
-    'seizures',
-    'sejm',
-    'selectivity',
-    'selector',
-    'self-catering',
-    'self-consciously',
     'self-consciousness',
-    'self-governing',
-    'self-government',
-    'self-image',
-    'self-pity',
-    'self-respect',
-    'selfishness',
-    'selina',
-    'sell-out',
-    'selwyn',
-    'semantically',
-    'semblance',
-    'semen',
-    'semi-detached',
-    'seminal',
-    'sen',
     'senegal',
-    'senile',
-    'seniority',
-    'seniors',
-    'senseless',
-    'sensibilities',
-    'sensor',
-    'sensors',
-    'sensuality',
-    'sensuous',
-    'sentimentality',
-    'sentry',
-    'sept',
-    'sera',
-    'serafin',
-    'serc',
     'serenity',
-    'serfs',
-    'serge',
-    'sergeants',
-    'sergei',
-    'sergio',
-    'serps',
-    'setbacks',
-    'setup',
-    'seve',
-    'seven-year',
-    'seven-year-old',
-    'seventy-five',
-    'severance',
-    'sew',
-    'sewer',
     'sewerage',
-    'sf',
-    'sfa',
-    'sga',
-    'shading',
-    'shadowed',
-    'shaftesbury',
-    'shaggy',
-    'shai',
-    'shaikh',
-    'shake-up',
-    'shakily',
-    'shale',
-    'shallot',
-    'shaman',
-    'shambles',
     'shane',
-    'shapely',
-    'shareholdings',
-    'shareware',
-    'sharif',
-    'sharpen',
-    'sharpening',
-    'sheath',
-    'sheeting',
-    'sheff',
-    'sheldon',
-    'sheldukher',
-    'shellfish',
-    'sheltering',
-    'shelved',
-    'shelving',
     'shephard',
-    'sheppard',
-    'sherlock',
-    'shia',
-    'shielded',
-    'shielding',
-    'shin',
-    'shipowners',
-    'shipyard',
-    'shoals',
-    'shoddy',
-    'shoplifting',
-    'shoreline',
-    'short-run',
-    'shorten',
-    'shortening',
     'shovel',
-    'shoving',
-    'showbiz',
-    'showcase',
-    'shrapnel',
-    'shredded',
-    'shreds',
-    'shriek',
-    'shrieked',
-    'shrieking',
-    'shrimps',
-    'shrines',
-    'shroud',
-    'shrugging',
-    'shuttered',
-    'shyly',
     'shyness',
-    'sibling',
-    'sicilian',
-    'sickle',
-    'sideboard',
-    'sidelines',
-    'sidings',
-    'sieve',
-    'sighing',
-    'sighs',
-    'sighting',
-    'sightseeing',
-    'signatory',
-    'signifies',
-    'signifying',
-    'signor',
     'signposted',
-    'sihanouk',
-    'sikh',
-    'silences',
-    'silica',
-    'silicone',
-    'silken',
-    'silks',
-    'silt',
-    'silva',
-    'silverstone',
-    'silvia',
-    'simmering',
-    'simone',
-    'sims',
-    'simulate',
     'simulations',
-    'sinatra',
-    'sine',
-    'sinead',
-    'sinful',
-    'single-minded',
-    'singly',
-    'singularly',
-    'sinhalese',
-    'sinner',
-    'sinners',
-    'sirens',
-    'sis',
-    'siting',
-    'siward',
-    'six-month',
     'six-year',
-    'six-year-old',
-    'sixes',
-    'sixteenth-century',
-    'sixty-five',
-    'sizewell',
-    'skating',
-    'sketching',
-    'skidded',
-    'skiers',
-    'skimming',
-    'skinhead',
-    'skinned',
-    'skipped',
-    'skipping',
-    'skipton',
     'skirting',
-    'slade',
-    'slag',
-    'slain',
-    'slalom',
-    'slang',
-    'slant',
-    'slav',
-    'sledge',
-    'sleeper',
-    'sleepers',
-    'sleepless',
-    'slicing',
-    'slime',
-    'slimmer',
-    'slimming',
     'slimy',
-    'slits',
-    'sloped',
-    'sloppy',
-    'slovene',
-    'slowdown',
-    'slowness',
-    'slows',
-    'sludge',
-    'slug',
-    'slugs',
-    'slurry',
-    'smallpox',
-    'smeared',
-    'smog',
-    'smoker',
     'smokes',
-    'smoother',
-    'smoothness',
-    'smothered',
-    'smouldering',
-    'smp',
-    'smugglers',
-    'sna',
-    'snapshot',
-    'snarling',
-    'snatching',
-    'snc',
-    'sneaked',
-    'sneer',
-    'sneered',
-    'snell',
     'snip',
-    'snoring',
-    'snort',
-    'snout',
-    'snowdon',
-    'snowdonia',
-    'snub',
-    'snuff',
-    'snug',
-    'soaps',
-    'soapy',
-    'sobs',
-    'soc',
-    'sociable',
-    'socialisation',
-    'societal',
     'socio-legal',
-    'socioeconomic',
-    'sociologist',
-    'socrates',
-    'sodden',
-    'sofas',
-    'sofia',
-    'soggy',
-    'soiled',
-    'solace',
-    'solidity',
-    'solihull',
-    'soloist',
-    'solos',
-    'sonar',
-    'sonia',
     'sonnet',
-    'sonnets',
-    'soot',
-    'soothe',
-    'soothed',
-    'sooty',
-    'soprano',
-    'sordid',
-    'sorely',
-    'sores',
-    'soundly',
-    'soundtrack',
-    'sourly',
-    'south-eastern',
-    'south-western',
-    'southall',
     'southey',
-    'southgate',
-    'southwards',
-    'southwell',
-    'southwest',
-    'sowing',
-    'sp',
-    'space&ndash;time',
-    'space-time',
-    'spacecraft',
-    'spaceship',
-    'spades',
-    'spaniard',
-    'spanned',
-    'spanner',
-    'spans',
     'spar',
-    'spares',
-    'sparingly',
-    'sparkled',
-    'sparrow',
-    'sparsely',
-    'spasm',
-    'spawn',
-    'spawned',
-    'specialize',
-    'specialty',
-    'speckled',
-    'spectacularly',
-    'spectral',
-    'spectroscopy',
-    'speculated',
     'speculating',
-    'speculations',
-    'speculators',
-    'speechless',
-    'speeded',
-    'spellings',
-    'spencers',
-    'spennymoor',
-    'spenser',
-    'spherical',
-    'spiced',
-    'spicy',
-    'spiked',
-    'spiky',
-    'spin-off',
-    'spinach',
     'spinelets',
-    'spinner',
-    'spinners',
-    'spins',
-    'spinster',
-    'spiralling',
-    'spires',
-    'spiritually',
-    'spleen',
-    'splendidly',
-    'splinter',
-    'spluttered',
-    'spokes',
-    'spontaneity',
-    'spoons',
-    'spores',
     'sported',
-    'sportsman',
-    'sprays',
-    'spree',
-    'springboard',
-    'springfield',
-    'sprinkled',
-    'sprinkling',
-    'sprinter',
-    'sprout',
-    'sprouting',
-    'sprouts',
-    'sprs',
-    'sq_ft',
-    'squadrons',
-    'squalid',
     'squalor',
-    'squatted',
-    'squatters',
-    'squeak',
-    'squid',
-    'squinted',
-    'squires',
-    'squirrels',
-    'sr',
-    'ssap',
-    'ssd',
-    'ssds',
-    'ssp',
-    'stabilise',
-    'stabilization',
-    'stabilize',
     'stacey',
-    'stacking',
-    'stagger',
-    'stagnation',
-    'staircases',
-    'stairway',
-    'stalemate',
-    'stalinist',
-    'stalked',
-    'stalking',
-    'stalled',
-    'stalwart',
-    'stammered',
-    'stand-alone',
-    'stand-off',
-    'standardisation',
     'standardized',
-    'stansted',
-    'staples',
-    'stapleton',
-    'starboard',
-    'starch',
-    'starkly',
-    'starred',
-    'starting-point',
-    'state-of-the-art',
-    'statesmen',
-    'stave',
-    'steadied',
-    'steaks',
-    'stealth',
-    'steamer',
     'steed',
-    'steele',
-    'steely',
-    'steeped',
-    'steeper',
-    'steffi',
-    'steiner',
-    'step-by-step',
-    'stepmother',
-    'stereotyped',
-    'sternly',
-    'steroid',
-    'steroids',
-    'stevie',
-    'stewardship',
-    'sticker',
     'stifle',
-    'stifling',
-    'stimulates',
-    'stink',
-    'stipulation',
-    'stitched',
-    'stitching',
-    'stockbroker',
-    'stockbrokers',
-    'stockists',
-    'stockmarket',
-    'stocky',
-    'stokes',
-    'stomachs',
-    'stoned',
-    'stonework',
     'stoop',
-    'stoppage',
-    'stormont',
-    'stornoway',
-    'stour',
-    'stoves',
-    'stow',
-    'strach',
-    'straightening',
-    'strait',
-    'strangeness',
-    'strangest',
-    'strat',
-    'stratified',
-    'stratosphere',
-    'stratton',
     'stratum',
-    'stravinsky',
-    'strayed',
-    'streaked',
-    'streaks',
-    'streamed',
-    'streamline',
-    'streamlined',
-    'strengthens',
-    'stretcher',
-    'stricture',
-    'stripe',
-    'strove',
-    'structuralism',
-    'structurally',
-    'stu',
     'stubble',
-    'stubbornly',
-    'studded',
-    'studs',
-    'stuffy',
-    'stumble',
-    'stumps',
-    'stunted',
-    'stupidly',
-    'stych',
-    'sub-contractor',
-    'sub-contractors',
-    'sub-section',
-    'subcommittee',
-    'subconsciously',
-    'subdivided',
     'subduction',
-    'subgroup',
-    'subgroups',
-    'submissive',
-    'subordinated',
-    'subscriber',
-    'subservient',
-    'subsidiarity',
-    'subsidise',
-    'subsidized',
-    'substantiate',
-    'substantiated',
-    'subsumed',
-    'subterranean',
-    'subtract',
-    'subunit',
     'subunits',
-    'subway',
-    'successively',
-    'succinctly',
-    'succumb',
-    'sudanese',
-    'sudbury',
-    'sufferings',
-    'suffix',
-    'suffocating',
-    'sugars',
-    'sukarno',
-    'sumatra',
-    'summaries',
-    'summarises',
-    'summarize',
     'summing',
-    'summits',
-    'summoning',
-    'sumner',
-    'sunbathing',
-    'sunburst',
-    'sundry',
-    'sunil',
-    'sunlit',
-    'superpower',
-    'superpowers',
-    'superstitious',
-    'superstore',
-    'superstructure',
-    'supple',
-    'supplementation',
     'supposing_that',
-    'supposition',
-    'suppressing',
-    'supremely',
-    'sur',
-    'surety',
-    'surfers',
-    'surfing',
-    'surgeries',
-    'surging',
-    'surmounted',
-    'surpassed',
-    'surrealism',
-    'surrealist',
-    'surrendering',
-    'surreptitiously',
     'surrogate',
-    'susanna',
-    'susceptibility',
-    'susie',
-    'suspecting',
-    'suspense',
-    'sustainability',
-    'sutcliffe',
-    'suzie',
-    'suzy',
-    'svq',
-    'svr4',
-    'swamps',
-    'swanage',
-    'swapped',
-    'swapping',
     'swastika',
-    'sweaters',
-    'swede',
-    'swedes',
-    'sweeper',
-    'swerved',
-    'swimmer',
-    'swimmers',
-    'swims',
-    'swinton',
-    'swirl',
-    'swirled',
-    'swivel',
-    'swivelled',
-    'swoop',
-    'swooped',
     'sykes',
-    'syl',
-    'symbolically',
-    'symbolized',
-    'sympathise',
-    'symphonies',
-    'synagogue',
-    'synapses',
-    'synaptic',
-    'synonym',
-    'synonyms',
-    'syringe',
-    'tableau',
-    'tablecloth',
-    'tablespoon',
-    'tablespoons',
     'taboos',
-    'tabs',
-    'tacked',
-    'tackles',
-    'tactful',
-    'tactfully',
-    'tactile',
-    'taff',
-    'tagged',
-    'tailed',
-    'tailor-made',
-    'tailoring',
-    'tainted',
-    'taiwanese',
-    'take-up',
-    'takings',
     'taligent',
-    'tallest',
-    'talons',
-    'tam',
-    'tamed',
-    'tang',
-    'tankers',
-    'tantalising',
-    'tantamount',
-    'tapering',
-    'tapestries',
-    'tardis',
-    'tarnished',
-    'tarts',
-    'tat',
-    'tattered',
     'tattoo',
-    'taunted',
-    'taurus',
-    'tax-free',
-    'taxonomic',
-    'tay',
-    'tayside',
-    'tb',
-    'tbilisi',
-    'tc',
-    'tchaikovsky',
-    'tcr',
-    'teachings',
-    'team-mates',
-    'tearful',
-    'teaspoon',
     'techno',
-    'tecs',
-    'tectonic',
-    'tectonics',
-    'teheran',
-    'telephoning',
-    'telescopes',
-    'teletext',
-    'televisions',
-    'tell-tale',
-    'teller',
-    'temperamental',
-    'temperance',
-    'tempers',
-    'tempest',
-    'templates',
     'temptations',
-    'tenacity',
-    'tenancies',
-    'tendered',
-    'tendon',
-    'tenement',
-    'tenements',
-    'tenets',
-    'tennant',
-    'tennessee',
-    'tennyson',
-    'tensed',
-    'tensor',
-    'terminally',
-    'terminating',
-    'terracotta',
     'testified',
-    'tetanus',
-    'tethered',
-    'tewkesbury',
-    'texan',
-    'textured',
-    'thanksgiving',
-    'thatch',
-    'thatcherite',
-    'theodore',
-    'theologian',
-    'theorist',
-    'therapies',
-    'thereto',
-    'thermometer',
-    'thermostat',
     'thesaurus',
-    'thi',
-    'thickened',
-    'thickening',
-    'thicket',
-    'thiercelin',
-    'thinned',
-    'thirsk',
-    'thirtieth',
-    'thirty-eight',
-    'thirty-four',
-    'thirty-one',
-    'thirty-seven',
-    'thirty-three',
-    'thirty-two',
-    'tho',
     'thornaby',
-    'thorns',
-    'thorny',
-    'thrash',
-    'thrashed',
-    'threaded',
-    'three-month',
-    'threefold',
-    'thresholds',
-    'thrift',
-    'thrills',
-    'throb',
-    'thucydides',
-    'thud',
-    'thumped',
-    'thundered',
     'thundering',
-    'thursdays',
-    'thyme',
-    'thyroid',
-    'tiananmen',
-    'tibetan',
-    'tickle',
-    'ticks',
-    'tidied',
-    'tidying',
-    'tiers',
-    'tilting',
-    'timer',
-    'timescale',
-    'timex',
-    'timings',
     'timor',
-    'tinge',
-    'tinged',
-    'tingling',
-    'tinker',
-    'tinted',
-    'tiptoe',
-    'tire',
-    'tireless',
-    'tit',
-    'titanic',
-    'titford',
-    'tito',
-    'toads',
-    'toasted',
-    'toddlers',
     'toffee',
-    'toil',
-    'tolerable',
-    'toleration',
-    'tolls',
-    'tolonen',
-    'tolstoy',
-    'tomlinson',
-    'tonal',
-    'toni',
-    'toolkit',
-    'toothbrush',
-    'toothpaste',
-    'top-down',
-    'topographical',
-    'tornado',
     'torrential',
-    'tortoise',
-    'tortuous',
-    'toshiba',
-    'tossie',
-    'tot',
-    'totalitarian',
-    'totem',
-    'touche',
-    'touchline',
-    'toughness',
-    'toulouse',
-    'tousled',
-    'towed',
-    'towing',
-    'towpath',
     'toxicity',
-    'toxin',
-    'toyed',
-    'tr',
-    'tracksuit',
-    'tractors',
-    'trade-off',
-    'trade-union',
-    'trademark',
-    'traffickers',
-    'tragedies',
-    'trailers',
-    'traitors',
-    'trajectory',
-    'trampled',
-    'tramways',
     'trance',
-    'transcend',
-    'transcribed',
-    'transcriptional',
-    'transfected',
-    'transferable',
-    'transferor',
-    'transfixed',
-    'transformer',
-    'transforms',
-    'transgenic',
-    'translates',
-    'transmissions',
-    'transparency',
-    'transpired',
-    'transvaal',
     'trapping',
-    'trappings',
-    'trash',
-    'traversed',
-    'treachery',
-    'treasured',
-    'tremayne',
-    'tremor',
-    'trepidation',
-    'triassic',
-    'tributes',
-    'tricked',
-    'triggering',
-    'trimming',
-    'trimmings',
-    'tripoli',
     'tripping',
-    'trish',
-    'tristan',
-    'tristram',
-    'triumphed',
-    'trna',
-    'trod',
-    'trolleys',
-    'trooper',
-    'trotsky',
-    'trotted',
-    'trotting',
-    'troubling',
-    'troughs',
-    'troupe',
-    'truancy',
     'trudged',
-    'trump',
-    'trumpets',
-    'truncated',
-    'trunchbull',
-    'truro',
-    'trustworthy',
-    'truthful',
-    'truthfully',
-    'tsarist',
-    'tsu',
-    'tubs',
-    'tucking',
-    'tuesdays',
-    'tufnell',
-    'tumbler',
     'tunbridge',
-    'tung',
-    'tunis',
-    'tunstall',
-    'turbines',
-    'turin',
-    'turk',
-    'turnaround',
-    'turtles',
-    'tuscany',
-    'tut',
-    'tutorials',
-    'tvs',
-    'twelfth-century',
-    'twelfths',
-    'twenty-first',
     'twig',
-    'twinkle',
-    'twinkling',
-    'twitch',
-    'twitching',
-    'two-hour',
-    'two-week',
-    'twoflower',
-    'twofold',
-    'tycoon',
-    'typesetting',
-    'typified',
-    'tyrant',
-    'tyrone',
-    'u-turn',
-    'u.s.a.',
     'u2',
-    'udc',
-    'ugh',
-    'ui',
-    'uist',
-    'ulceration',
-    'ulthuan',
-    'ultimatum',
-    'ultra_vires',
-    'ultrasound',
-    'ultraviolet',
-    'umbrellas',
-    'umm',
-    'umpires',
-    'unaccustomed',
-    'unaltered',
     'unambiguously',
-    'unanimity',
-    'unarmed',
-    'unattended',
-    'unbelievably',
-    'unchallenged',
-    'unchanging',
-    'unchecked',
-    'unclean',
-    'uncomplicated',
-    'unconcerned',
-    'unconstitutional',
-    'unconventional',
-    'unconvinced',
-    'unconvincing',
-    'uncritical',
     'und',
-    'undecided',
-    'undeniable',
-    'undeniably',
-    'under-21',
-    'undercut',
-    'underfoot',
-    'undergravel',
-    'underlie',
-    'underlies',
-    'underlining',
-    'undermines',
-    'underpants',
-    'underpin',
-    'underpinned',
-    'underpinning',
     'understandings',
-    'understatement',
-    'underwriters',
-    'underwritten',
-    'undid',
-    'undisputed',
-    'undoing',
-    'undress',
-    'undressed',
-    'undulating',
-    'unearthed',
-    'uneconomic',
-    'unequivocally',
-    'unesco',
-    'unfairness',
-    'unfashionable',
     'unfettered',
-    'unfold',
-    'unforgettable',
-    'unfounded',
-    'unfriendly',
-    'ungrateful',
-    'unheard',
-    'unicef',
-    'uniforum',
-    'unifying',
-    'unilaterally',
-    'unilever',
-    'unimaginable',
-    'unimpressed',
-    'unintelligible',
-    'unintended',
     'uninterested',
-    'uninteresting',
-    'uninterrupted',
-    'uniting',
-    'univel',
-    'universality',
-    'unix-based',
-    'unixware',
-    'unjustified',
-    'unlawfully',
-    'unload',
-    'unloaded',
-    'unloading',
-    'unlock',
-    'unmistakably',
-    'unmoved',
     'unnaturally',
-    'unnerving',
-    'unobtrusive',
-    'unoccupied',
-    'unopposed',
-    'unpacked',
-    'unparalleled',
-    'unplanned',
-    'unpopularity',
-    'unprofitable',
-    'unprotected',
-    'unravel',
-    'unreadable',
-    'unregistered',
-    'unremarkable',
-    'unrestricted',
     'unrivalled',
-    'unruly',
-    'unscathed',
-    'unsecured',
-    'unsettling',
-    'unsightly',
-    'unsold',
-    'unsolicited',
-    'unspoilt',
-    'unsteady',
-    'unstoppable',
-    'unsuspecting',
-    'unsympathetic',
-    'untenable',
-    'untold',
-    'untoward',
     'untrained',
-    'unveiling',
-    'unwarranted',
-    'unworkable',
-    'unworthy',
-    'unwritten',
-    'updates',
-    'upgrades',
-    'upheavals',
-    'upholding',
-    'upholstery',
-    'upkeep',
-    'upmarket',
-    'upper-class',
-    'upsets',
-    'upshot',
     'upturned',
-    'upwards_of',
-    'usages',
-    'usm',
-    'uterus',
-    'utilisation',
-    'utilising',
-    'utilitarianism',
-    'utilized',
-    'utopia',
-    'utopian',
-    'uttering',
-    'uzbekistan',
-    'v8',
-    'vacated',
-    'vaccines',
     'vagaries',
-    'vagrant',
-    'vagueness',
-    'valence',
-    'valencia',
-    'valiant',
-    'validate',
-    'value-added',
-    'valuer',
-    'valuing',
-    'vampire',
-    'vane',
-    'vanilla',
-    'vanishes',
-    'vanishing',
-    'variegated',
     'vass',
-    'vaulted',
-    'vdu',
-    've',
-    'veal',
-    'veg',
-    'velocities',
-    'veneer',
-    'venerable',
-    'venison',
-    'venous',
-    'ventilated',
-    'ventilator',
-    'vents',
-    'verandah',
-    'verbally',
     'verdicts',
-    'verges',
-    'veritable',
-    'vern',
-    'verona',
-    'vertebrates',
-    'vestry',
-    'vetoed',
-    'vets',
-    'vexed',
-    'viaduct',
-    'vial',
-    'vibrating',
-    'vibrational',
-    'vice-chancellor',
-    'viciously',
     'victorians',
-    'victorine',
-    'viennese',
-    'vigil',
-    'vigilance',
-    'vigilant',
-    'vikings',
-    'viktor',
-    'villains',
-    'vince',
-    'vindicated',
-    'vindictive',
-    'vineyard',
-    'violate',
-    'violating',
-    'vip',
     'virgil',
-    'virginity',
-    'virtuous',
-    'vis-&agrave;-vis',
-    'visas',
-    'viscosity',
-    'viscous',
-    'vista',
-    'visualise',
-    'visualize',
-    'vita',
-    'vivien',
-    'viz',
-    'vociferous',
-    'voicing',
-    'volkswagen',
     'volts',
-    'voluminous',
-    'vortex',
-    'vows',
-    'voyages',
-    'vulcan',
-    'vultures',
-    'vw',
-    'w1',
-    'wabi',
-    'wad',
-    'waddington',
-    'wager',
-    'wail',
-    'wainwright',
-    'waite',
     'waive',
-    'waived',
-    'waiver',
-    'walden',
-    'walkman',
-    'walkway',
-    'waller',
-    'wallingford',
-    'wally',
-    'walpole',
-    'walt',
-    'waltz',
-    'wand',
-    'wanderers',
-    'wanton',
-    'wapping',
     'waqar',
-    'warburg',
-    'wardrobes',
-    'warhammer',
-    'warheads',
-    'warhol',
-    'warnock',
-    'warped',
-    'warranted',
-    'warring',
-    'warships',
-    'warts',
-    'washer',
-    'washing-up',
-    'wastage',
-    'wasteland',
     'watchers',
-    'watchman',
-    'waterfalls',
-    'waterford',
-    'waterfront',
-    'waterman',
-    'waterside',
-    'watersports',
-    'watertight',
-    'wavered',
-    'wavering',
-    'waverley',
-    'wavy',
-    'waxed',
-    'wbc',
-    'weakest',
     'weald',
-    'weaponry',
-    'weariness',
-    'weasel',
-    'webber',
-    'wedges',
-    'wednesdays',
-    'weeding',
-    'week-end',
-    'weekday',
-    'weighty',
-    'weimar',
-    'welch',
-    'weld',
-    'welded',
-    'welding',
     'well-informed',
-    'well-meaning',
-    'well_off',
-    'wellbeing',
-    'wellcome',
-    'welshman',
-    'werewolf',
-    'westbourne',
-    'westerners',
-    'westland',
-    'westward',
-    'westwards',
-    'weu',
-    'whaddon',
-    'wharton',
-    'whe',
     'wheatley',
-    'wheelbarrow',
-    'wheelchairs',
-    'wheeling',
-    'whelan',
-    'wherein',
-    'whiff',
-    'whine',
-    'whining',
-    'whirl',
-    'whirled',
-    'whirling',
-    'whirlwind',
-    'whisked',
-    'whiskers',
-    'whiskey',
     'whiskies',
-    'whistles',
-    'whitechapel',
-    'whitehead',
-    'whitelaw',
-    'whiteness',
-    'whitewashed',
-    'whitley',
-    'wholeheartedly',
-    'wholesalers',
-    'wholesome',
-    'whoops',
-    'whyte',
-    'wick',
-    'wickedness',
-    'widower',
     'widths',
-    'wield',
-    'wielded',
-    'wielding',
-    'wilberforce',
-    'wild-type',
-    'wildest',
-    'wildfowl',
-    'wilfrid',
-    'wilful',
-    'wilkie',
-    'wilkins',
-    'willed',
-    'willoughby',
-    'willows',
-    'winch',
     'windfall',
-    'windmill',
-    'winged',
-    'wintering',
-    'wintry',
-    'wipers',
-    'wishart',
-    'wishful',
-    'wistful',
-    'wistfully',
-    'withered',
-    'withering',
-    'wobbly',
-    'woe',
-    'woking',
-    'wolff',
     'wolsey',
-    'wont',
-    'woodstock',
-    'woodville',
-    'woodvilles',
-    'woodward',
-    'worded',
-    'work-force',
-    'workman',
-    'workmanship',
-    'wormwood',
-    'worshippers',
-    'worthington',
-    'wraps',
-    'wreath',
-    'wrench',
     'wriggle',
-    'wriggled',
-    'wriggling',
-    'wrinkles',
-    'writhing',
-    'writs',
-    'wrongful',
-    'wrought-iron',
-    'wu',
-    'wyresdale',
-    'x\'s',
-    'xerxes',
-    'xii',
-    'y.',
-    'yachting',
-    'yamaha',
     'yang',
-    'yardstick',
-    'yarm',
-    'yarmouth',
-    'yawn',
-    'year-end',
-    'yeo',
-    'yeoman',
-    'yeovil',
-    'yoga',
-    'yoke',
-    'yts',
-    'yugoslavs',
-    'zach',
-    'zagreb',
-    'zaire',
     'zest',
-    'zeta',
-    'zeus',
-    'zipped',
-    'zodiac',
-    'zoological',
+)
+
+blocks_04 = (
+    '"(grave_la!&dollar\'&;1,000)!0*$,000*!0(#500!&frac14!\'micro;m!)pound;1.5*!0(#000("20($4.99(&50,000',
+    '\'%2,500(#.50(!m\'$3.50)"99("50(!m\'\'400,000(!5)!0(!m\'$5.99(!m\'%6,000\'"70',
+    '("50\'%8,000("00\'!9(!0!#sgr!$thgr $\'80s!"ad!%cause!"is!!t %+0100 $-gen #0.3',
+    '"!6"!7"!8!!3!!7!!8""00 (1&frac12"\'ndash;0(!2(!3!#(1)!$,300"#800!$-2-3',
+    '"!9!"/2!&0-year"".1#!2#$30am#!5""0g#!m"!7"!p!%1,000"!6"!7"!8',
+    '!%2&ins")-year-old"".5"!1"!2"!6"!9!%3,000""00"!1"!2"!3"!4"!6"!8',
+    '!"4%"$,000")-year-old"!1"!2"!3"!4"!5"!6"!7"!8"!9!*5-year-old"%0,000"!1',
+    '"!3"!4"!5"!6"!7"!8"!9!%6,000")-year-old""00"!1"!4"!5""60"!7',
+    '#!8"!9!"7%")-year-old""15""50""60""70#!5""80#!9""90#!1#!2#!3',
+    '#!5#!9!"8%""01#!2#!3#!5#!6""10#!2#!3#!4#!6#!7#!8',
+    '#!3#!4#!5#!6#!8#!9""31#!3#!4#!5#!6#!7#!8""41#!2',
+    '#!4#!5#!6#!7#!9"!5#!2#!3""77!"9%")-year-old"+89&ndash;90$#/90"%90-91#$1/92',
+    '#!8#!9"*th-century!!a!!m (2&frac12"\'ndash;0(!1!!+!"-0!".9!*0-year-old""01"!5"!p',
+    '!"1%")-year-old"!0"!2!"2%")-year-old"!5!"3%")-year-old"!8!"4%")-year-old!*5-year-old"!6!*6-year-old',
+    '!"7%"!0!"8%")-year-old"!0"!6!!a!!b!!m!!p )3&ndash;0(!1(!4!!\'!$,500',
+    '"!1!!."!9!*0-year-old"!s!%2-bit"!0!"3%"!0"#mhz!%5,000!"6%"!0!\'7&deg;c"!0',
+    '"!0"!6!!m )4&ndash;6!".8"!9!#0th!"5%!"80"!6!"oz!"pm "5\'!$-asa!".0',
+    '"!7"!8!$0mhz!"50!!b!!p"!m )6&ndash;4!#.30"!6"!7"!8"!9!&00,000"!s',
+    '!"5%!!d!"in!"pm #7.4"!6!"0s #8.3#!0"!4!%0,000"!s!"5%"!0!"oz',
+    '!".1"!2"!3#!0"!5!"99 \'a&amp;r!#.r.!!2!!3!*_good_many!$argh!$baba#&tement")breviated',
+    '"&ducted""el#\'rration"%iding"$laze#(e-bodied"(normally"#ode#\'lishing%(tionists#\'rigines$#ted"%reast"&sences%#tee',
+    '&"ly#$orbs#\'tinence$&racted($ions(!s#%urdly"(undantly#$sing"#yss!+cademically"\'cessing#%olade$&mplice(&shment',
+    '$"ue%#ing""es#!t$#ate"#hes%"on#\'ievable$$lles"$idic"*quiescence")rimonious"#ton#&resses#&uality',
+    '\'"es")upuncture!%d_lib"*aptability"$dict&!s$!s%"on$$tive#&ressee"&elaide#!n$$auer"\'herents"$idas',
+    '$#nct$$tant"#min"#olf##ral%$tion$!e"&riatic"\'versity%%tiser#%isors!%egean#"is"\'rodrome$#sol',
+    '",fectionately)!s\'"ve#&iliate$&nities$"rm#&luence#$ords#$ront"#oot"$resh#+o-caribbean"!t#)erthought!&ge-old',
+    '#$ndas")gravation"$hast"#ile$#ity"\'onising"%rippa!$hmad!"ib"$ding"$leen#%ments"%ntree"-r-conditioned-#ing',
+    '#$drie#"ed$!s#&fields##ing#%liner##men#!s#%tours"$sles!$kbar"#ram!&labama#\'rmingly""ba',
+    '#$erto"$cove"#der%#man%$shot#%ridge"\'ejandro#\'xandria$"is"%fonso"%gebra"#ias#"bi#"da#\'enating',
+    '"%l-out$%party#"ay#$eges%#ory$"ys%#way##itt#\'otments$%wable#$uded$$sion"#oft"!p"!t',
+    '#$horp#!o#%ruism\'#tic"$umni"\'zheimer!&malgam#%ranth#$ssed"&bience&!t$!t#$rose#\'ulances"$elia',
+    '%!s#!s"&icable"\'orphous#!s"(phibians#\'lifiers$!y#!s!\'nabelle#&erobic$\'sthesia#&logies$$yser%#zed',
+    '"\'chorage"$dean$$rsen#$reas%!i$"us"\'ecdotal\'!e#!w"&gelica#"ie##ler$!o%\'-french&%irish',
+    '#!y"#jou"$nals$$mese#$ette$!x%!e&!d#$uity"$orak$$exic"(swerable"*tagonistic*!s#!e',
+    '*!s$%natal%#nae$$rior##hea$%ology#*i-aircraft%*government%\'semitic&%ocial$\'cipates$$dote$%pathy$&septic$&thesis',
+    '$#nia##ral#$werp""us"#war!#oun!"pe#%rture"$ical##ece"(ocalypse(#tic#+logetically&$ized#$stle',
+    '#\'ellants\'"te$%tites#$laud$#eby$%iance%(cability#\'ointees\'!s#(reciably($ting*"ve%&nticed$(opriated"&titude',
+    '!&rabian##gon"%biter"+chaeologist$\'bishops$&etypal$%ibald%&pelago%(tectures%#val$#way#!s""ds"$enas")gentinian',
+    '#%uable$)mentative""ia$!s#"el#\'stocrat*!s"&kansas"\'maments#&istice$$tage#$oury"#nie"*omatherapy#%using',
+    '"%senic"#tai#$isan#!y!%s/400"!b"(cendancy&"ed#"ii""da"&hworth"%pired"#sad$%ilant$(ssinated',
+    '$#yed#\'emblage$)rtiveness$$sses&"or#%ignee&#ing$&milate$#sts"+tonishingly$%unded\'#ing##ray$#ide$%ology',
+    '"(ymmetric(!y#)nchronous!&theist$%nians$$rton"\'onement#!p"!p"%rophy"&taches&%ments$&inable&#ing#(endances',
+    '(#ion$$sted#)ractively$\'ibuting)"on"&ypical!(uctioned("er*!s\'!s""di$(o-visual$&torium"%gment#$usta',
+    '""ng"$rora"$ssie"\'thorise\'&zation&$ship#-obiographical$&cratic$%graph$&motive$%nomic"&vergne!"v."\'alanche"$erse',
+    '$!y""id#!v!!w"&akened#*rd-winning#"sh!#xed"#ial""le!(yatollah"&resome #baa""be$$rton',
+    '#$ylon"*ckbenchers$#ers$#log$%stage#&terium""de"!e"%hamas#$rain"%iliff\'!s#!n#"rd#"ts',
+    '"\'lconies#(dersdale$#ing#!e$!s#!i#$kans##lad&!s$\'esteros$%istic$#ots#%moral#&timore"#nal',
+    '#%dages$#ing%"ts$%wagon##ish##ked#\'queting##ter"&ptised"\'rbarian\'!c&$ossa$$ican$!s#"ed',
+    '##ium#&laston#$maid#&ometer$#net#!r$&icades%!e%"ng$"on#!t$"er$!h$$lett"%shing',
+    '%#ica$"ng#\'ketball##ses"%tches#"he##man#"on#\'talions$"en%!r&#ing"&varian!#bc1#!2',
+    '!#dda!"ea#!d#$rers#$trix$"ty#%uties##ver$"is"&ccaria#&kenham"(dclothes##ded#$rock"%echam',
+    '"$hold"!l#$ated\'"ly#$lamy$"ow&!s#$mont##ted"\'nchmark#&edicta$&factor##gal#"in#$tham',
+    '%"st"$reft#!g#$muda#&nstein##tha$"ie$$rand"$ssie#)t-selling"\'thlehem#"sy"#uno"%verly#"in',
+    '!%iases"+bliographic"$cker"%dders$!y""ff"$gwig"$kini"$lled$"ie$%owing"$nder#"ge#&ocular"(ographer',
+    '#)logically\'"st#$mass#%psies"$rdie&!s#!k#!t$%hdays"&smarck!"jp!.lack-and-white%%berry&#ird%&friars',
+    '%$well##key#&sphemy$$ting%!s#&tantly##zer"&eached#!d#"ed##nds$$heim#&ssings#&tchley"$ight',
+    '##mey#\'stering\'!s"%oated#!b#%ckage$!s#&odshed&%tream#&ssomed#%tting"%under#%rring$#ted#%shing',
+    '!"ma"!c!\'oasting#$ting"$bbed$#ing"$dice#!o#&yguard""er"$gged#!s"%hemia\'!n"%ilers',
+    '#\'sterous"$lder$$wood#$ogna"!m#&barded$$ings"!n#$dage##nie$!y"$ogie#%kcase$"er$#ies',
+    '&!n##med#%sting##tle"(rderline#$land##neo"%tanic#"ha"%ulder$$ogne##nty#$rbon$$dieu$"ne',
+    '"$wels$!n$!r#"ie##les"$xers"\'ycotted#\'friends#$hood##ish!"pd!\'racelet%!s$#ing$%knell',
+    '##hms#"id$%ntree$\'thwaite#$king#%mbles#!n$$ding&%shing%!o&!n%!t#!s$!h#"wl',
+    '$$k-in%#age&#way%%downs%#ers$)stfeeding$(thlessly&!s#%eches$#der##men#$ndan$#nan#%thren$"on',
+    '"$iant##bes##dal$&egroom%!s$$gend#&efings%!s#!g$"gs$$hten("ed#!m$$ming#"ne',
+    '#!t$!s$#tan")oadcaster%#est#%ccoli#%mwich#\'nchitis$#zes##och$\'ke-rose%#lyn#!s#"th%"el',
+    '#%wnlow%!s$"se%#ing"$uges##ise##nel##tus"$yant#"ce!"sc"!p"!t!%uchan#$kled',
+    '%#ism#"ge%#ted"$enos"!f"%ggers$!y"&ilt-up"\'lletins$#ied$#ock$$shit"#mps$!y"%nches',
+    '#!s"&oyancy"&rdened#*eaucracies#\'glaries%"ed#$ials#\'lington$!y#$mese##ner$#ley#!r#!t"#shy',
+    '"#tch#%tered$$oned$$ress$!s"$yout"%zzard$"ed!+y-elections#$pass$&roduct""rd""te$!s .c&eacute;zanne',
+    '!#.j.!!1!!2!"aa"$bins"#det%!s#$fael##res"#fes$%teria#%feine"#ged""in$!e',
+    '#&thness"!l#$cite#&endars#(ibration#$lous##mer##vin"$mels$%raman%#oon#$illa##ped#"ra"\'nadians',
+    '#\'celling##did&!a\'"cy$\'lelight##ine##ned%!s$#ing$!y#%oeing$%nical##ton#&vassed\'#ing',
+    '\'"or#&illary$&talise#%sules#&taincy\'"ed"#rat#*bohydrates#$cass$&inomas#&dinals#%efree$(lessness$"ss&"ed',
+    '$!w#$goes#\'icature#$ling#$nage$$egie$&ivores#(olingian#\'penters%#ted#$rick#$tels$"on&!s$&ridges',
+    '##ver$$ings""sa#$hier##ing#&t-iron$"er"%talan%&oguing%$ysts$$pult#(egorical+"ly(#sed$$rers',
+    '+!s%!s#!h#&terick#$walk"&uldron#%seway$#tic"$vern!!b"!s!"d4!!e"%asing"%cilia',
+    '##ric"$lery$%stial#%ibacy#"lo$%ulite&#ose#$sius#"ts"(meteries"%nsure%#ses#\'timetre$*ralisation("ty',
+    '%\'e-right&%piece""rt$\'ainties!"fa"!c!"ha#%dwick#(irperson#(llengers$$mers#"mp#!n$#cel$#ted',
+    '#-racterization%"de$&donnay$#ing$#ley$#med$#red##ses$!m#\'tterton"%eddar#\'ekbones$"ry#"fs##ney',
+    '#$rish#\'sarynth$"ts"\'ildlike$"li#\'mpanzee*!s##sel#%valry")olangitis#$msky##pin#"re%(ographer-!s',
+    '"&rissie%%tabel&&church&%endom("ed#+omatography%!e$\'nically\'#ler)!s#%ysler"%ucked#!m#&rchmen$#ned',
+    '#"te!\'ichlids"$gars"(nderella$!y#&ematic#%namon"\'rcuitry%\'mcision&\'ference&(stantial#&rhosis"$ssie"%tadel$#lia',
+    '##rus!&lacton#%dding#$mour$$ping#(ndestine#!p$$ping$#ton#\'rifying$$kson#"sp$\'sically&%fying%$less',
+    '#&ttered\'#ing#"us%)trophobic##wed#"ys"%eanly$"rs#"ft#"gg#%ments#&opatra#&rgymen$#ics"*ich&eacute',
+    '#*ent/server#\'nicians$!t#!o#%pping""lr"!o#&akroom%!s#$cked#$gged##ned$#ing#%se-up##ths',
+    '#"ve%!s$"is##wes$"ns"&umsily#%tches$#ter\'"ed!+o-operating$(rdinates"!2"%ached#&lfield$&itions',
+    '"!b#$bles#"ol"&chrane#"ks"!e#%rcive"%ffers"$gnac$%ition"%horts"$iled#\'nciding""la#)laborated',
+    '*#ors%"ge\'!n%$pses%%teral$%iding%"er%%sions$"or#&ombian&!o$(nisation\'"ed\'"ts$&urless',
+    '##wyn"!m#&bating$"ed#&edians$!r#$ical$%ntern#"ma%%ndant\'+er-in-chief%!s$(emorated*#ive%$nces',
+    '&&surate&&taries$#its$(on-sense&"er%$tion$)unicators%$ting#%pacts$(ensating)#ory$%ilers$\'lainant%&ements&&teness',
+    '&$cate\'#ity%$ying$%osing\'$tors$*rehensible+$vely%\'omising$#ton$\'utation&(er-aided)%based($ized#"te"&ncedes',
+    '%%ntric%(ssionary$(iliatory$(lusively$%ourse$(urrently#(ditioner$(uctivity\'!s%"it#\'ferring&!s%$sses$#ide%%gured',
+    '%\'scation$(ormation\'!s%%unded$*rontations(!s#&genial%$sted$)lomerates$*ratulating%)egational#$ical$$fers$$ston#\'jecture',
+    '%"re\'!d#(necticut\'"or%#lly%!r$"on%"rs#&queror##ran#)scription$\'ecrated%%nsual&$ting\'!s',
+    '%&rvancy$\'iderate((ing_that%$gned$)olidating%%nants%"rt$%pired\'#ing$%tanza%(ellation&\'rnation%+itutionally,!s%$rain',
+    '$"ul%&merism#\'tagious$*emptuously%#nds%&stants\'#ing$)ingencies&%uance$%orted%"ur$"ra&(ceptives&&dicted%(oversies',
+    '#$vene\'!r%#rge\'#ing$\'ocation"&olness##ney"%pious"\'ra-beth#%dless$"on$$uroy#"es#$inth\'#ian',
+    '#%nered&%stone$&flakes#"p.$\'oratism*!t#(rections\'$ness%%lates%\'sponded$"ie$%osive$&ugated%$pted#%tical',
+    '#%sacks#)t-cutting"\'tswolds"%uched#+nter-attack(*productive\'$feit#$pons#\'rsework$%tiers%$room"&ver-up$#ted"#wan$%rdice',
+    '#$boys"!y!&racker\'!s%$ling#$dled#$fted%(smanship%!y#!m$!p##nes#"on#$ters#$ving',
+    '#"ze%!d"#eak%"ed$"ms$"se&!d$$tors#!b#%dence#&mation#&scendo#\'taceous""im$#ean',
+    '#$pple%!s#(ticizing"%oaked$!t#%ckery##oks#%pping#$quet#)ss-border&\'country&+examination&&legged%$ings%#man',
+    '##uch#%wding$!e$$ning$!s$$ther"!p"\'ucified\'!x(#ion#$ised&!r&!s#%mbled$&wallis',
+    '#&saders$"ty"%yptic!"sa!!t!"ub#$icle$"sm%!t#!s"&cumber"$ddle%#ing%!y""ff',
+    '"$llen#$prit\'!s#(tivating$!s"$pped"&rators#"es#"ia##ran##ses$#ory#!t$#ail$"ly',
+    '"\'shioned"%t-off#%hbert#$ters!!v!%ycled$$ical")lindrical"\'nically"%press")toplasmic %d\'you!$-i-y!#aak"!b',
+    '""da"!i#"ne$"ty#$sies"$kota"#lek$!y#$ziel"$mmit#$ning#%pened#!s"\'ndelion$!y',
+    '#%ielle#!k#"te"#rby#"cy#$esay#(k-haired$#est#$ting$$moor#&winian"!s#&hboard"!t"-ughter-in-law',
+    '"\'venport$!y##ide$#son#!y"%wning"%zzled!"ea#&dlines#&fening$$ness"\'batable#&enture#)ilitating"%cayed',
+    '##eit$,ntralisation+"ed$\'ptively#,ision-makers##lan#*omposition"$duct&#ive")ep-seated$"en#$side"(famation#&ection$\'nceless',
+    '%"se&%ively$!r#$lect\'"ed#*orestation%&mation&"ed##tly#$unct$"se#$ying"*generation#%raded&#ing',
+    '#$ctic#$rdre#$ties##xis"*liberation$(ghtfully$\'nquency$\'verance#%usion")marcation#&eanour$$nted#$ised#+ocratically$&graphy',
+    '#%pster"#nny#(ominator$#ted%#ing$$unce\'#ing##ted##ver#"ys")p&ocirc;t#\'endable\'"nt#&iction&!s',
+    '&"ed#)opulation$\'rtation&"ed$&sitors$"ts#$ress\'#ive$%iving"&rision$&vation#$went"\'scartes$$ends#&ertion',
+    '#\'olation#%serts#&troyer"$tach$"in#\'ergents%\'minedly(#ism$$sted##our#$ract")utschmark"%viate#%onian%%shire',
+    '$$tees$$ured"#wey!!g!\'iagnose(!s$&onally#&lectic)"al$%ogues#&phragm"$ckie$#son##tum"$dier',
+    '"-fferentiating$$used"#git#(nitaries")lapidated#%igent##lon")mensional#\'inution("ve"#ned$"rs#"gy"%plock%#mas',
+    '")rectional"!s#(ablement$\'ffected$(greeable$&llowed$&ppoint*%ments&$rove)#ing$%rming#&cerned\'#ing$\'harging$$iple',
+    '%&osures$(oncerted&&nected&\'tinuity%"rd%\'uraging$%redit%(iminated+#ing#%eased$*nchantment#&graced#(hevelled$&washer#,illusionment',
+    '%(tegrated\'&rested#%likes$\'ocation#&mantle$&issals\'"es\'%ively#\'neyland#\'orderly#(parities$%elled%\'nsation\'#ing%%rsion',
+    '%&easure$%osals&&itions&&sessed#-qualification%#iet#%raeli$%epute$&upting#)seminated%%nters$&ipated$(ociation%$lves\'#ing',
+    '#&tanced\'#ing&#tly$(illation\'"ed("rs%*nctiveness$&orting$\'racting)#ons"%tched"%verge%$sify%$ting#%isive',
+    '##ons!\'jibouti!"lp!!m!$nase!-o-it-yourself"&cherty##ile#$kers$$yard#&torate$%rinal""dd#$ging"!h',
+    '"#in\'"!m#%esday%\'ticated#&iciled\'$iary$%nican&#ons%!o""ng#$keys#%nelly#!s"#one#%rbell',
+    '"(rchester##igo#&mitory"(stoevsky"&unreay#!r"#ves"!w#!d#*n-to-earth$"es$$town$$wind#"ry"#zed',
+    '"!p!*rachenfels#$fter%$sman#%goons##mas##per#%ughts"(eadfully$"my#%dging#%nched#+ssing-table(!s"#ier',
+    '#$pped"#one#%oping#%plets$%pings##wsy"%ugged#%mming%#ond#(nkenness"$yden#"er!"ub#"ai"!c',
+    '#$king#"ts""et"#ffy"#kes"#lly"&mfries""ne#(fermline#&gannon#$kirk"(plicated"(rability##ess#"ie',
+    '$#ing"\'tifully"$vall!$welt"&indled!#yer#!s"#fed"#kes"&namism$$stic"$sart#(function#%lexia &e-mail',
+    '"$e.c.!!a"#rle##ner#$shot#(thenware%%works("ms%!y"#sel#\'tenders$$wood"#ton"#ves!$bony',
+    '"&lectic#%ipsed"!o#\'logists#(nometric#&system!"d."!i##ble#$fice"%munds""ta"$uard&!o#,cationalists',
+    '#!s!(ffecting#\'ortless!"gf!*igenvalues#+ht-year-old""re!*laborately##ted$#ion"&dorado"&ecting%"or%\'rically(#ian',
+    '&$odes#%vator"#gar"#ias#%cited#\'minates#"sa#$tist#"za"\'lesmere##iot#$wood"\'ucidate##ded!(mbalming',
+    '$%ssies#"er##lem#%odies&$ment#&roiled"&ergent"\'igrants&"te##lia#%nence#%rates#!t"&manuel")pirically',
+    '"!s"&ulsion!$nact"*capsulated$#sed#\'hanting\'$ment#\'losures#(ompassed)#ing$"re$(untering#)roachment#*yclopaedia($edia',
+    '#(eavoured#$ings#\'ogenous$&wments"%field"%gages#\'endered#&raving$%ossed"*hancements"$list"#och"$rich"#sue"\'tangled',
+    '#%hused##ice%#ing$#tle\'%ments#&ourage#%wined"\'veloped#%iable$"ed$#ous$%sages!"pa"\'hemeral"-idemiological',
+    '#%lepsy#,stemological+!y#$tome"#och"#som!(qualised%#led$#tor\'#ial!)radicated#"se%!d"!e#%cting',
+    '#!k"$lich"$rand"\'stwhile!)scalation"&oteric"!p#%ecial#%oused"%quire""so"&tonian#&uaries!&tching"#her',
+    '*!y"\'iquette!(ucharist"$gene"&robond$"pa$&tunnel"(thanasia!!v"$aded#(luations#\'ngelism#&porate(#ion#$sive',
+    '$#ett$%green$\'lasting$*y_so_often#$sham"%icted%#ion#&denced"\'ocative!#wan""en!)xacerbate$$ting#)ggerating#$lted',
+    '#&itable%!e#(lamation$&usions"\'ecuting\'$oner&"or(!s#&mplars#%rtion%!s"(hibitors$(laration")istential#"ts',
+    '"\'pansive$&triate*!s#&ectant)"ly$!l$(riential&&mented+!r%#tly#$ires#\'licable$%orers#&onents$#ses',
+    '")quisitely"*tinguished#*racellular%\'vagance$%emist$%overt"(uberance(!t"#xon!(yelashes$"id!#zra &fabian$!o#"le',
+    '\'!x#(rication"&celess$!t#(ilitates"#des"#gin"&ilings#$nted#\'rclough$#ies$#way"&lconer#%kland#$lacy',
+    '"%natic\'"al\'!s#$cies#!d##ned#%shawe"!o"%r_off#%myard#(nborough#!r"$sten&#ing"%tally',
+    '#*her-in-law$"om"%wcett!"dp!(earfully$$less#"ts"(deralism"$ebly"$line$&xstowe##ler$#ing$\'owships$!s',
+    '##ced#!d#!n#!s##ton"*rmentation#!n#%ocity#$rets#(tilisers\'#zer*!s#$vent\'"ly""ud',
+    '"&verish!-ianc&eacute;e"(ctitious"%ddled"\'eldfare##sta"/fteenth-century$&y-five"#gs.#\'urative"$ller$$ings$!y#\'mmakers"&nality',
+    '#%chley#$esse#(gerboard&"ed&#ing##lay&#son"*refighters$%light$$wood&"rk#%mness#(st-floor&$rate&$year',
+    '#$hery%!s$\'keeping"%ttest"&ve-day%(year-old$!s"#xes!!l"%agged%#ing#%iling#!k$"es#$nker',
+    '$#nel#$pped#%shman#$tten&"ry""ea$!s#&dgling#&etwood#(ischmann##shy##xed"$inch$$ging#%rting',
+    '#%gging#%odlit$$ring#!p$#ped#$rian#%tilla#!y")uctuating)"on#!e$#ncy#)orescence#%shing$%tered',
+    '"#yer!!n!$oggy"&llower"!n#"da$"ly$$ness"\'olishly#(tballing$%hills%#old$$note(!s$%print',
+    '"&raging$"ys#$bade#$ceps#&ecourt$&finger$&runner$#saw%$ight%#ter(!s$$word#$feit\'"ed\'#ure',
+    '%"ts$#ing%$ving##ked$!s#$lorn#\'malized$$ulas#$rest#$syth#\'thright$#ran$!s$%y-two#&warded',
+    '%"ry#%r-day$$thly""wl"$xton"#yle!,r&auml;ulein"(actional%$ures#&gility$\'mentary#$ilty#\'meworks#,n&ccedil;ois$%cesco',
+    '(#ing%#ois#!y$"ed##zer"#eda$"dy$%erica#*e-standing#&nchmen$$zied#\'quented#"re##sco&"es',
+    '#%udian"*iendliness#&ghtful#$nged#%zzell"#odo#&nt-end&$line%#age&!l%"ed#"th"&uition%!y#&strate',
+    '"#dge"&gitive"&jimori"%lfils#\'l-blown%&length"&mbling##ing"%nchal$)tionalism*"ly("ed#+damentalism-"ts+!s',
+    '#!k##nel"%rlong#%naces##ore#"ry#!s#$tive"#ssy"&tility"#zzy #g-7!%ables"%dgets"!g',
+    '#)nsborough#!t"!l#$erie$!s#&lacher$$oped&#ing%"ws$"up#\'vanised"&nglion$$ster"#ped"$rcia',
+    '$#ish##ter$!h"%scony#!h#"ps##ton"\'tehouse$$ways#$hers#$ting"#udy#!l#%ntlet"!v',
+    '""ys!!b!!c"!c"!e!#els"$mini"$nera&(lisation.!s(\'zations)!e&$tive##ial$#tal',
+    '$"me%"ic##res#!t$#eel$&leness&!r$!s")ochemical#&logist#(metrical$)orphology#(physical#$rdie$!g',
+    '"\'raldine#&iatric#!m$$anic$!s#%trude"\'station"#tty!%hetto!%ibbon&!s"%fford"%ggles$!s"$lbey',
+    '$!s"#nny")rlfriends""st"!t!\'laciers##dys#%snost$"sy#"xo#"ze"%eaned#!e"%iders#%nting',
+    '#$ries#%ssary##ver"$uten""yn!#mbh!&oddard#&father$#rey#&mother"&ebbels"%ggles"$ldie$#man"#mez',
+    '"*od-natured"$reng#"se"(vernance&#ess&!s"#wns!%raced#&dients$&uating("on#!f$!t%"ed#$inne',
+    '&!r%"pa%%stand$$tham$%ville#&pevine$$hite#\'ssroots#*tification\'"ed&$ying%"ng$&uitous#"ze"%eener',
+    '%%field#$nade\'!s$$fell#&yhound"#ids##eve##lle&!d#$mace\'!d$"es$!m$!y#"ns',
+    '"&oaning##cer&#ies&!y#%oming%!s$#ves##ped$#ing#&unding&$work$"se#"wl$%n-ups""ub',
+    '%#ing("ly#&elling$$some#$mble&#ing#"nt%!e!(uarantor"&ernsey#$sses"\'idebook#&ldhall$&lotine$$tily',
+    '""ll$$ible#!p""ms"%nfire#!n$"er#&powder""ru"!s#!t$#ave"$tted%"rs"$yana',
+    '!(ymnasium (habermas#\'itation%%ually\'$tion#%sburg"$cked"$dley#$rian"%ggard""ig#)rdressers)#ing"*lf-brother%\'hearted',
+    '$!o#!o#$ting#"ve"%mmers##per#&string"!n#$cock#&d-held$"el%"rs$%icaps$$made$#out',
+    '%%omely$\'written##ger##kin##ley#"oi$#ver#$sard"%pless"$rald#)d-pressed%\'working$$back$$core$%ening',
+    '$%ships$$wood#"em$!s#\'greaves##ker#&lequin)!s##med$)onisation#&nessed#$rier\'!s%%ngton$%owing',
+    '%$ness$#net#&vested\'#ing"\'slemere##ten"&tching#$eley#!t$&ersley"%ulier##ser"$vana#%isham"&waiian',
+    '#"ke$!s#%thorn"#ydn#$ling##man!&ead-on$\'hunters(#ing$&ingley$(teachers##ped#$rsay$%tfelt%#ily',
+    '&#ess#"ts#"ve"$bden""ck#$tare"\'dgehogs%#row$#ing"#idi#%nrich$!z#$ress"*licobacter$"um',
+    '#(lenistic#&pfully"\'mingway"$ndon$#rix#&rietta"&pzibah"$resy##man$%itage##nia#&odotos#"ts"(sitantly"+terogeneity',
+    '"\'zbollah!!g!&i-tech""bs".gh-performance&&owered%\'ranking&#ise(!k$$gate$&lander"&jacked""ke"%llary$%sides',
+    '#!t"\'malayas"&ndered$%rance$$uism%!s#"ge%!d#$kley#\'terland$#ing"%ppies$!y"!r"\'tchcock',
+    '!$oard$!e$$sely#!x"!b##son"$dder$"le#$gson"&ffmann"!g#"an"%lborn##den#"ed',
+    '$$ness$"sm#&lidaye$#ows#&ocaust#%ywood"(me-grown$!r$$sick#%icide#)oeopathic*!y$\'geneity$&logous\'!y',
+    '#%ecker"!o#%ligan(#ism#"ps##ray"*pelessness##ped"#rde#%monal#\'rifying#(se-drawn%$back%#man%$shoe',
+    '"%tline#$spur##ter%"st"#ver"%warth#!l$"ed!"rs!"se!"ue"#llo"&manism\'!t%$kind',
+    '#!p"!n#&dredth#\'garians#\'tingdon$!s"$rley$#ing#\'ricanes"\'sbandry#$kily$!y##sey"$xley!\'yacinth',
+    '\'&zation&!s"#dra$(ocarbons"\'pertext#%notic#&ocrite$)glycaemia $iaea!%banez"!n""oa!"cc""ed!"da',
+    '"&ealist("ic&#zed#(ntifiers#*ologically"$iots"&leness"#ols!&gnited!#i\'s!#lea$!l#"um"\'l-fated#\'egality',
+    '#%usory%\'trative)"or!)maginable&"es"(balances##ued"\'itating"(material#&ediacy#%obile$&rality%&tality"$pair$"rt',
+    '$#sse&%ioned\'"ve##ede&!d$(netrable$\'ratives%(fections%&ialist%%vious#$inge#\'lacable%"nt%&usible$+ementations',
+    '&"er(!s$&ssibly$%tence#*racticable$)essionist($vely$%omptu%(visation#&ulsive!-n_accord_with#1consultation_with#*defence_of#\'lieu_of#*receipt_of',
+    '"(activity#)dequately#&nimate#)uguration""c.#\'apacity#!e$#nse\'!d$%ssant#)ineration)"or$%pient$$sive#)linations',
+    '#\'oherent$$mers%*patibility$\'ngruous#(redulity(#ous+"ly#&urring"*debtedness$%cency%%ision$$nted$)terminate$(x-linked#$iana',
+    '$\'gestion%&nantly%!o$*scriminate$)vidualist-"ic#\'o-china$(methacin#\'ucement&!s%#ing%%tance$)strialist(#ous")effectual',
+    '#"pt#*vitability#\'xorable$(perience"(fallible$%ntile#(eriority$$sted#)iltration#\'licting$"ow$%uenza#!o$%rmant#&ra-red',
+    '#(uriating$#sed"!g#&estion##ram$"es$"id"%haled#\'ibiting(#ons\'"or\'!s#$uman"$jure%#ing',
+    '#$ling"$laid#"et"\'nocuous"*put-output"%quire%&sition)"ve"%roads"!s#%anity$&tiable#)criptions#$erts#$ides',
+    '#&oluble#*pirational#\'tigated%,tutionalised.#zed$\'ructing&)mentation#+ufficiently$&lating%#ted$(rrection"(tangible#%egers$)lligently$+nsification',
+    '$%racts%\'ception&)hangeable%)dependent%%feron%(locutory&#ude%\'minable\'\'ttently%%nment%+operability%)pretative)!s%\'rogated&\'uptions',
+    '%*ventionist&&iew(s))"ee+!s%#war#%ifada#*racellular&%table$#ude\'"rs#(uitively"\'undated"(validity$%sions&"ve',
+    '&%ories#%oking!$onic!!p!\'ranians##qis"$oned")radiation#(egularly$\'levance$\'vocable*!y"$ving!"sa#%belle',
+    '#%mbard""dn"&olates&#ing!&talics"%ching!#ves!"wc!"xi"#ora!$zzie "ja"$cobs#%quard"$gger',
+    '#!s"$nata#$eiro##nie"%rdine##man"%smine!!c!!e"$anne"%hovah"$nnie%#ngs"(opardise"&remiah',
+    '##ome"#sse##uit""tt"&weller(!s!"na!#oel"!g##ged"$hann#$nnie"#ker""lt"%nadab',
+    '$$thon"\'rdanian&%stown#"ge"!s#"ef$%phine#%tling"!t#"an"*urnalistic"$yous!!r!!s!"tr',
+    '#!e#&icious#!o"&ggling#!s"#icy"#mbo#$pers"&ncture#!g#"ta"$ries$*sdictional##ors")stifiably',
+    '$"ly"%tting"\'veniles"+xtaposition #k.b!%aiser"$lchu"$nsas"&relius#!r"\'tharine#!y"%ufman""ye!$eane',
+    '#!l"%mpton"$ndal##nel&!s#$tish$"on$$ucky##yan"%strel#$wick"\'ttering"!w"\'yboards#$hole',
+    '#%words!$haki"$mers"&omeini!\'ick-off"+dderminster#\'nappers"$eran"%llion#\'marnock#!n#!o$!s"#nda$"er',
+    '#$sman"#osk"%pling"#rby"%ttens""wi!,naresborough"#eel"&ighted&$hood&"on&\'sbridge#%twear"#obs#%ck-on',
+    '#$ssos#%w_how$#les!#och"#dak"#ons"%reans!%ruger!#uhn"#mar"%ng_fu +l&auml;nder"1eacute;vi-strauss!!1!!3',
+    '%$ious#%rador"!c#"ey#$quer##una#!y"$gged##oon#!s"%idlaw#*ssez-faire"!l"$ment&"ed',
+    '&#ted#$pard"$ncet$!s#%dless$&scaped(#ing%$lide#%franc#$guid##kan""os"%pping##ses"$rder',
+    '##val""sh"(te-night#$imer$%tudes#$vian"#uda#\'ndering##rel%!n&!t$"ie"#vas$&tories#$inia',
+    '"&wfully##rie"!x"%yered##man$"en#$outs"#zio!"bs!!c!#ddc!$each%#ing#"fy#$gues',
+    '#"ns##ped#&sehold$!h##vis"&ctured&#ing"#ech")ft-handed"&gacies#"er#%gings#&islate#!o"&ighton',
+    '"(ngthened(#ing#$ient##non$!y"&onardo$!e$"ie"%sotho##see%#ned$"or"\'ttering"\'velling##ies',
+    '"&xandro"!y!"fa!%iaise"\'berally&"te\'#ing%&tarian""ce#&hfield""en"(fe-cycle$$line#"fe"\'gaments',
+    '%$ness"&keable$#ned#"ud"!l#"ac##ian"#mbo#&elight$$rick#&itless#&ousine##ped$#ing"!n',
+    '$"rs#$ford#!g$$uist##ton"(quidator""re"$ster"$tany#"em#(hosphere"%vesey#\'ingston"$zard&!s',
+    '"\'ewellyn!!m!%oaned##the&!d%#ing##ves"!b#!e"\'calized#"hs#%kwood#!o"$dger%!s',
+    '#%istic(!s#"os"!k"&ndoner#)g-awaited%+established%\'lasting%%range&"un($ning%$stay%$time$%evity$(standing',
+    '"%okout#"ny#&sening#!t$"ed$#ing""re$#nzo#!i$#mer#"ne"$tion")udspeaker#&isiana#$rdes',
+    '"%vable##ell"%w-end$#fat$&income$#key$$paid##ell#%lands#"ry!!r!"sd!&t.-gen"!a""te',
+    '$!e$#nda##ker""do$$vico##wig"\'ftwaffe"#isa"&kewarm#"ic""ll"#men#"py"(nch-time##ged',
+    '##gan#"id"$stre"&theran!&ybrand"#ell"#mph"#nne#!x $m.r.!!1!"25!!4!#abs"%cabre',
+    '#"ca$(lesfield#!e$&donian#!h$"in&*e-readable#%kerel$"ie%%ntosh#\'quillan#"ro%&phages#&sharry"(dagascar',
+    '##man"%estro""ff"&gdalen#$gots#&ically#"ma#$nate\'!s$%etism&!s$)ification(%ently\'"ed#$uire',
+    '"(idenhead#%nstay#%tland"%jorca%%ities%!s"$keup"!l#$aise$"ya#\'evolent#!i##let#)nutrition#(practice',
+    '$$ings"#man#"ma$#oth$!y")nagements#$cini#!e#$hood#"ia%!c$&festly%#old$(pulative#"ly',
+    '#\'oeuvred(#ing$"rs#!s$$ions$"on"#ori"%rbles##cel$$hers#"es#$gery$"ot$&uerite#$iana',
+    '$#ner%!o##kby$(et-place&$able##ley$"on%!w&!e##oon#%quess#$ries#$sden$%eille)!s',
+    '#$tina$#yrs##vel&&lously$"in#$wick#%yland#%zipan"%scara#!h$!a$"ed#$king##ons##sey',
+    '#)terpieces$!s$(urbation")terialise*!t#+hematically*#ian-!s#+ter-of-fact&(_of_fact$#hey$&resses#\'uration%"ed%#ing',
+    '##rin"&verick"%ximal%%ising$"ne"#yer#$fair##hem#$nard#!o$&nnaise$"rs!!b"!a!&cbride',
+    '$%rtney#$oist#%ready"\'dermott#&ougall"%enroe"%grath$$egor"&intosh"#kay#$enna"$leod"&millan"#nab!+eans-tested',
+    '"#cca"\'dallist#&iaeval%#tor$%cally$$ocre$\'um-term##ley#$rese##way""ek$"ly""ga"\'h\'lindi##med',
+    '%$rama$!n#$rose#%ville"$moir$\'rabilia&#nda%$ials"$nded$#ing#"em#!s$%trual($tion")rcenaries',
+    '$&histon$#ian%#ful("ly##lin#(ovingian#$rily#"yl$$mose"$self##sed%%ngers"\'talwork$(phorical&%ysics',
+    '#\'hodical$"yl#)iculously!"gm!"hc!"ia"&chelin$$igan#-roelectronics%)organisms%&phones&)rocessors%%scopy"\'d-1960s$#air',
+    '$%range$$term#&winter%#ves"&graine%#ted&#ing#&uelito"$lder#&estone##ieu$&tarily%#ias#$kman##lar',
+    '$$igan%%metre%\'onaires#"ne#&osevic""me"#nch##der$#ful#"ed$%field$*ralisation#%gling#!h#&imised',
+    '#&nesota$"ie##ors""ra$"ge#"th")scarriage#$lead#*management%#tch#(sissippi$"us#&taking$$rust$!s',
+    '"%tcham#!e#%igate#\'subishi"#xer$!s"&yazawa!!k!"mc"!e"!m!+obilization\'!e#!s"#dal',
+    '%%nised"\'gadishu#"ul"$lars#!d$#ova#%luscs"#net$"ys#&golian#!o$&chrome$%graph$&lithic%$ogue',
+    '##roe#$soon#!t$#agu\'!e$&enegro$!y"#ons#$rish##ted"(ratorium$!y##bid##enz#!i',
+    '#%phine##row#$tals"%seley#\'quitoes"#tel#(herboard#%ioned##ley#$tled"&urners#\'thpiece"#ver"#wer"&ynihan',
+    '"!h!&ubarak")ch-needed#$king"#fti%#lik""ir"(jaheddin"&lberry#!e$!s#!l#"ti%(-million&(national',
+    '\')rocessing%(cultural%,disciplinary%$ples&)rocessing"\'nitions"#ral#&muring#(rayfield"*s&eacute;e#!e#&ically##lin#$sels#"ty',
+    '#&ilated$"ny##ter$"on"$zzle!!w!%yanma"#ers"#les""ra"\'sticism&!s%$fied%#que $nacl',
+    '"(jibullah"\'kedness"#lgo"&meless""na"!p#!e##kin#\'oleonic#"py"\'rcotics#\'ratives"$sser"!t#"al',
+    '$#sha#)uralistic*!s"&utical"&vigate"#wab!#cp7"!t!!d!#eal##red%%st_to")cessitate+!s##tar',
+    '"&gation&#ves#\'lecting#\'otiable\'#tor#"ro"#nna"+o-classical#&lithic#%natal"%ptune"%rvosa""ss#%tling"$tted',
+    '"*urological%!n%#sis#+tralisation"#vil$!s"*wfoundland##ley#&sagent)!s$\'letters$#ome#$town!"gc"$uyen',
+    '##est##hes$$olls&!s##kel#"ol%"ae&!s%!e$$tine"$gger#\'ht-time%%dress%$fall%&ingale',
+    '"&ntendo"$pped$"le$"on"%rvana"&trates!&krumah!!m!+o-arbitrage""ds""ir""me$(nclature#$inee\'!s',
+    '$&manual$\'payment%%rofit$(specific%\'tandard#+conformists#\'e_other""pe"$rdic#"ma%"ns#*th-eastern&\'western%$ants%$erly',
+    '%$ward"!s"#tch%"ed#&oriety")urishment"%xious"$zzle!!s"#aid%!s"!f!!u"#adu#$nces',
+    '%%otide*!s"#dge"&ffield"!m#(erically"\'remberg#$ture&#ing"$tmeg#%rient%%tious!"vq )o\'donnell"%leary',
+    '!#.k.!(akeshott##ley"!s"#ths"!u!"be#%dient("ly#"se$#ity#$ying"+jectionable&#ors"&liging',
+    '$\'terated"\'noxious"\'servant\'&tional#&tinate$$ruct(#ing)"ve!)ccasioned#&upiers"!h"\'tagonal#$opus!%ddity!&edipus',
+    '!$iled!(ld-style"!e""ga".igonucleotides#$vier"#lie"%ympus!#man#!r""en#\'prazole"!i#&nously#!t',
+    '"\'e-fifth$%party$\'quarter$%sided"\'lookers"%shore!#ops"$zing!!p"!.""cs"&en-air$$cast#%ratic\'#ves',
+    '#"um"%poses%$ites"#tic!%rally"&chards$&estras)#ted$"id&!s""d."$egon"\'ganises\'!t&#zer',
+    '$"sm#!y"*ientations#\'ginates("or#"on"$phan&#age$#eus"$rell")thopaedic#"on!*scillation""lo"#man',
+    '"#wiu!&thello"$tawa#"er%!s!!u"$nces"!p"\'tbursts#$crop#$flow##law&"ed$$ying#!s',
+    '$&eighed$#ith!&vation"#ens#&rboard$\'flowing$\'hanging$$laid&"ps%#eaf%#oad("ed&#oks%!y$(powering',
+    '&!n$&seeing%$ight$&taking%%hrown%#ook%#ure(!s\'!n$%whelm%%orked!$wens"!t!!x""en',
+    '!&ysters \'p&amp;p"+eacute;tain!!1!"ac#"ed#%ifist"%dding"%geant"$ined$\'staking+"ly#$ring"(laeozoic$"is',
+    '%!e%#ine#"er#!l$%adium#\'merston#%pable"*n-european#\'amanian#$cras%#eas#"da#!e$%lling$!s',
+    '#&oramic##try"#pua")racetamol$#ded&!s%$igms$&lleled(#ism%$ysis$$noia$)phernalia&$rase#%ietal#%kland',
+    '#"ma#$quet#!r#"ti%(cipatory%"do%$sans$%ridge"$scal#\'sageway$%ively&#ity#$tels"%tched%$work',
+    '$$rnal##ois#&riarch%$cian%"ot$&olling#$ting"#ulo"!w"%y-off##out"!z!!b"!s!"ea',
+    '&!s"$bble"%ckham$#ing#*uliarities$%niary"&dagogy$"ls#%estal"!e#!p$#ing#$rage"%gasus##ged',
+    '%!s"\'nalised$#nce#%chant#$dant#!g#!h#\'icillin#!n$%iless%"ne\'!s#(sionable#(ultimate#%zance',
+    '#$pers#\'sinogen"\'r_cent.#&ceives\'#ing%&ptible$&ussion#&egrine$\'stroika#&fected$%usion#%ilous%!s$&odical$\'pherals',
+    '&"ed#\'manence$(eability$#ian%&ssions#\'nicious#"ot$$xide#*pendicular%&trated&%ually("te$%lexed#\'secuted%\'verance',
+    '$(onalised$(piration#&turbed#%uvian"\'ssimism")tersfield&"on##ite%%ioned)!r#&rified"!w#!s##ter!!g',
+    '!.harmaceuticals\'!y#$sing"&easant#&notype"*ilharmonic$&ippine$#lis"#nom"%oneme%!y$%ology#\'sphorus(\'ylation#&tocopy',
+    '%)synthesis"&rasing"+ysiotherapy%#que!%iaget##nos"!c#&keting&!s$"le&!s""ed##rce##tro"%ggott',
+    '#%ments"%lgrim#$oted%#ing"#nes#!g#$ning#%ochet"#ped##pin#!s"$racy""sa##ton"&tching',
+    '##ted$&sburgh""us"%votal"#xel%!s"$zzas!%lacid#$ques#%smids#&telets#)usibility\'"ly#%yback%"oy',
+    '$%group$%house#"za"%eases$#ted%!s#(istocene##num#%thora"$inth"%owden"#uck#$mber$!e%!s',
+    '$!s#&rality#"sh"%ywood!&oached&"rs%#ing"!d"#ise$#ons"*larisation&&zation#(icewoman%(y-makers&\'holders',
+    '#%ybius$(ethylene$\'peptide$\'styrene"$nder&#ing#!s#!t""oh##led$#ing$$side"#pes#$pies#%ulace',
+    '#%osity$"us#$tico%#llo$!o$\'raiture""si$&tional&$vism#\'sessive#(t-mortem$\'_mortem$%erior\'"ty$&modern',
+    '$%ulate"\'tencies%%tials#"ty"(ulantzas##nce&!d$#ded"&wdered&!s#*erlessness#"ys!"pp!-racticalities+!y',
+    '#\'gmatics#$ises%#ing#"tt#"wn"!e#!-$\'eminent&%ptive%\'xposure$%trial#&achers$$mble%!p#)cariously',
+    '$$edes$$inct$%luded$*onceptions&&dition$&ursors#&dation$%icate&(tability$(ominance)"te#(gnancies#(judicial#*ponderance%\'sterous',
+    '$%erves$%iding\'"um$#ley$\'surised$#tel$+uppositions#%tends&%tious%"xt#%vails$(entative"%icked%"ly#&estley',
+    '%"te\'!s$"ed%"rs%#val$$rose#%ncely%\'ipality\'#led#%stine#&tchard#+vate-sector&#ise"+o-democracy#&active',
+    '$"yn#(cessions$(lamation$#tor$#ure#$dded$&igious#&fessed$%fered$\'iciency%%tably$%usion#(hibiting)#ons)"ve',
+    '#(letarian$$ogue#$mpts$\'ulgated#+nouncements#\'pagated$%eller$%hetic$+ortionality+"te-"ly$#ria&#ety#$saic$\'ecutors',
+    '&#red$)taglandin&"te#(tagonist+!s$)ectionism,!t%(stantism\'#ors$"on&!s%%types$&ruding##ust#\'venance',
+    '%%rbial$&idence&(ing_that%(sionally$#ost"#une"$ying!%salms""br"!c"!i")ychedelic%$osis&#tic!!u',
+    '#&licise\'#zed"\'ddephat$"le&!s"$erto"%ffing""gh"&ll-out$$over##sar"!n#%cture#$dits#$gent',
+    '"!p#!s"%rcell##est#)ification#$port\'"ed\'!s%\'sefully#&suance"\'shchair#"sy"$tney##ter"(zzlement',
+    '!"wr!\'yramids"$thon "qa!$q.v.!$uack#&lifies%(tatively$"ms#+ntification("ed#\'rantine$&relled\'!s$*ter-finals',
+    '#%yside"#ell#$ntin#$uing"!i#&ckened#&etness#"lt#"rk#%tting##ver&"ed"$orum %rabin"!c',
+    '##ked$#ing"\'diating&#ors$\'ocarbon%\'logical%\'therapy$"sh#"on"!e"&fferty#\'sanjani#$ters"%iding#&nwater',
+    '"#ked##ing"%leigh#%lying"#man#*ifications##med#%parts$!s#\'shackle"#nch##ger#%kings"#oul"%phael',
+    '##ped"#rer"!s#(kolnikov#&pberry$"ed"%tagan#\'epayers##ify$\'onalism)&zation"%ucous"%vaged&!s##ing',
+    '!!c"!a"!m!!d!\'e-entry$(stablish,"ed"!a##cts#(dability#&l-life$\'ignment%#zes#%ppear%&raisal',
+    '$&mament$%range)!d)$ment#)ssessment%\'uringly"%bates#$irth#$ound##uke&!d"*calcitrant$%pture)!d#$eded',
+    '$(ivership$$sses#(iprocity$#tal%!e&!d#\'klessly($ness#(lamation#(onciling$%unted%!p#*tification\'"ed$"um',
+    '#$ycle"%d-hot#$dish##eem$%fined#)iscovered#$mond"#eds"&ferent(#ial##ill$"ne&%ments&"ry#%lexes',
+    '#&rained$#esh\'"ed$)igeration##ute"\'gaining$!n$#tta##gae$"ie#\'imental$$nald$!s%(trations#\'ressive',
+    '"&hearse\'#ing"%igned%#ing%!s##lly#*mbursement#%ndeer$)statement$(troduced#&terate"%joice&#ing%!n"%layed',
+    '$!c$#efs$(nquished$$shed#%ocate(!d"&medied#*iniscences#$nant#\'oteness$%vable"(n&eacute#%ewing#"fe##nie',
+    '(!d$%vated#%tokil%!n#)unciation"$open&#ing"&pealed$!l$&ntance$%rtory$\'titions#&licate##ose%&sessed',
+    '%$sals$$oach%(ductions#!s#\'udiated$\'tations%$edly"%quiem"!s##ale#)cheduling$$uing#&ection$$ller(!s',
+    '$!t%\'tlement#$ided&$nces$(gnations&#ing$%lient#%olute$$nant$%rting$&unding%&rceful#)pectfully\'#ing$*onsiveness',
+    '$\'itution$&lessly($ness$%ricts%&ucture+!d#(urrected$)scitation"\'tainers$\'rdation#%icent$#nue$#res##ort#\'raining',
+    '$&ieving$&ograde%*spectively"%uters")valuation#!d##erb%"ed%"ie%#ses&$ible#%iewer(!s$$sing$$ving',
+    '$%lting%#ves"%write&#ten!$hoda"*ythmically!!i"$bber"%cardo#$hter#$kety#!o"%ddled#&iculed\'%ously',
+    '"$gged$#ing#&hteous)$ness#%idity##our&!s#!s"$nged#!k##sed"%oters"$pley#$pled&!s',
+    '""tz""va$%lries#$eted#$iera!\'oadshow$#way%$orks##med$#ing#$sted%#ing""bb$"er&#ies',
+    '#&emaker"&castle#(k\'n\'roll$"er"%dents$$rick#$rigo&#uez"!h"!i#$rbak"#ker"#lle"!m#&anians',
+    '"#ost#$ting"&salind#"en%$thal$$wood#$trum##yth""ta$#ted#!h$%erham$&schild#&terdam"$uble',
+    '##ges#%nd-up%&abouts#"se$#ing#!t$"ed"#wan#&bottom#!e$!d#%ntree"&yalist#"ce#$ston',
+    '"!m!!s!&uddock$!y"$eful"$gose"%ining"$mble&!d%#ing"&n-down$#off#$corn"%pture"$stle',
+    '"(therford#$land!$yley $s.a.!!1!$abah#$rina"!c#"hs#&rament$\'ificial)"ng"&ddened$#led#"ie',
+    '"*feguarding$#way#$fron"!g##ged$#ing"$igon"!l#%aried#"im##man$&onella##ons##ted$!y',
+    '%"ed#%vaged"%mpson##son"%nchez$$tity#&derson$&inista%#son$\'ringham#\'itation#%tiago$"os"!o"&pphire',
+    ')$ally#%dines&"ia""sh"%tanic#%chell##ire%$ical"%ucers#!l"&vagery#%e_for##our&!y"%wdust',
+    '!#bus!!c"&affold##lar$#ing#\'ndalous$!s#&pegoat#%rcity$"es$$gill$#man$#ves#%thach"$ents',
+    '"!h#"ed$%matic#*izophrenic#)olarships$*ol-leavers&$boys&\'teacher#%ubert$&macher"(lerosing(!s"#one%!s#%rched',
+    '$$nful("ly#$ured%"ge%#ing#$wled"\'rapping$%tches#$eech%%nplay$$wing#&ibbled%!e##oll#&ubbing',
+    '$\'tinised""si"\'udamore#%llery$$pted&#ors&$ural("ed#%rried%$ying#%ttled!"ds!&eafood$$ront#%mless',
+    '$"le##ton$#tle#$weed"\'clusion#)ond-class\'$half&"er&$hand&$ment#%reted&#ory#&tional$!s"\'dentary',
+    ')$tion##uce%$tion"$eded#$kers#$ping#%thing"$fton"#ine#%zures""jm")lectivity&"or#*f-catering&*onsciously',
+    '%)governing+$ment%%image%$pity%\'respect$\'ishness##ina#%l-out##wyn"*mantically#&blance#"en#*i-detached$#nal"!n',
+    '##ile$%ority&!s#&seless$)ibilities$"or&!s$&uality%#ous#+timentality$"ry""pt""ra$#fin#!c',
+    '#"fs#"ge%$ants%!i$"io#"ps"&tbacks#"up""ve$&n-year*$-old%\'ty-five$%rance"!w#"er',
+    '!!f"!a!"ga!&hading$$owed#(ftesbury##ggy#!i$"kh#%ke-up$#ily#"le$#lot##man$$bles',
+    '#$pely#*reholdings%$ware$"if$#pen\'#ing"$eath#%eting#"ff#$ldon%%ukher$%lfish$&tering$#ved%#ing',
+    '$$pard#%rlock""ia#%elded&#ing#!n#\'powners$$yard"$oals##ddy#(plifting#&reline$%t-run%"en\'#ing',
+    '$#ing#$wbiz$$case"&rapnel#%edded%!s##iek&"ed&#ing$#mps$#nes##oud#&ugging"\'uttered"#yly',
+    '!&ibling"&cilian##kle"\'deboard$%lines#$ings"#eve"%ghing$!s$$ting%&seeing#&natory$%ifies&$ying$"or',
+    '"&hanouk""kh"&lences##ica%#one##ken$!s#!t#"va$\'erstone$"ia"\'mmering##one#!s#%ulate',
+    '"%natra#!e$"ad##ful#*gle-minded%!y$&ularly#&halese##ner&!s"$rens"!s"$ting"$ward"\'x-month',
+    '($-old#"es#.teenth-century$&y-five"&zewell!&kating"\'etching"%idded##ers#%mming#%nhead$#ned#$pped%#ing$#ton',
+    '!$lade#!g#"in##lom#"ng$!t#!v"$edge#$eper\'!s%$less"%icing#"me$#mer%#ing',
+    '#"ts"$oped$"py#$vene#%wdown$$ness$!s"$udge#!g$!s##rry!\'mallpox"%eared""og##ker',
+    '#%other&$ness#&thered#(uldering"!p"\'ugglers!"na#%pshot#%rling#&tching"!c"%eaked#"er%"ed#"ll',
+    '"%oring$!t#"ut#$wdon\'"ia""ub#"ff#!g!$oaps$!y""bs"!c#%iable%(lisation$$etal',
+    '%(economic%&logist#%rates"$dden"#fas#"ia"#ggy"$iled"$lace#%idity$$hull#$oist$!s"#nar#"ia',
+    '&!s""ot$"he&!d$!y"%prano"$rdid##ely$!s"%undly%%track##rly#*th-eastern&\'western%#all',
+    '%$gate%%wards&#ell\'"st"$wing!!p".ace&ndash;time%%-time%%craft%$ship##des#%niard$#ned&!r$!s',
+    '$"es$%ingly$$kled$#row$$sely#"sm#"wn%"ed"(ecialize\'"ty$$kled$)tacularly%#ral&&oscopy$&ulated',
+    ')#ons(#ors#\'echless$#ded#&llings#%ncers$&nymoor$#ser"\'herical"$iced$!y##ked$!y#%n-off$#ach',
+    '$#ner\'!s$!s%#ter#\'ralling$"es$\'itually"$leen$&ndidly#%inter#\'uttered"$okes#(ntaneity##ons##res',
+    '%$sman"$rays#"ee#(ingboard&%field%$kled\'#ing%#ter##out&#ing&!s#!s!$q_ft"\'uadrons$#lid',
+    '$$tted\'"rs##eak#"id$$nted$#res%$rels!!r!#sap"!d#!s"!p!(tabilise\'&zation(!e',
+    '$$king#$gger$&nation#\'ircases%#way#&lemate$%inist$#ked%#ing$#led$$wart#&mmered#(nd-alone&#off%*ardisation',
+    '$$sted#$ples&#ton#&rboard$"ch$#kly$#red$*ting-point#-te-of-the-art%$smen#"ve"&eadied$"ks$#lth$#mer',
+    '$"le%!y$#ped&!r##ffi#$iner#)p-by-step$&mother#(reotyped$#nly$#oid\'!s##vie#(wardship"%icker',
+    '%#ing#\'mulates#"nk#(pulation#%tched&#ing")ockbroker+!s%$ists%&market%!y##kes#%machs##ned%$work',
+    '#%ppage#%rmont$%noway#"ur##ves#!w"$rach$)ightening%!t$\'ngeness\'"st$!t%%ified%\'osphere%#ton',
+    '$&vinsky$#yed#%eaked&!s%#med&$line*!d$\'ngthens$%tcher#&icture$"pe##ove#*ucturalism*"ly"!u',
+    '%%ornly#$dded$!s##ffy#$mble$"ps#$nted#%pidly"#ych!-ub-contractor.!s$\'section#)committee%)nsciously#\'divided',
+    '#%group(!s#\'missive#)ordinated#\'scriber$\'ervient$(idiarity\'"se\'#zed$(tantiate,!d$$umed#)terranean$$ract#$unit',
+    '##way"*ccessively$&inctly$#umb"&danese#$bury"(fferings$"ix$\'ocating"$gars"%karno"%matra#&maries\'#ses\'"ze',
+    '%"ts$%oning##ner"(nbathing$$urst##dry#"il##lit"(perpower*!s%(stitious\'#ore\'\'ructure##ple&)mentation',
+    '\'$tion$\'ressing#&remely"!r##ety#$fers$#ing#&geries$#ing#\'mounted#&passed#\'realism)!t%\'ndering%*ptitiously',
+    '"%sanna#+ceptibility#"ie#\'pecting%#nse#+tainability"\'tcliffe"#zie#!y!"vq""r4!%wamps#$nage#$pped%#ing',
+    '"&eaters#"de%!s#$eper#$rved"%immer\'!s$!s#$nton#"rl%"ed##vel&#led"#oop%"ed',
+    '"!l"*mbolically\'#zed#\'pathise$&honies"\'nagogue$$pses%#tic#$onym\'!s"%ringe \'tableau%%cloth%%spoon*!s',
+    '#!s"$cked$#les#$tful\'"ly$#ile""ff"$gged"$iled$\'or-made&#ing#$nted#&wanese"%ke-up#$ings',
+    '#$lest##ons"!m#"ed""ng#$kers#(talising%%mount"&pering$&stries"$rdis#&nished#"ts"!t#%tered',
+    '"%unted##rus"&x-free#&onomic"!y#$side!!b"%ilisi!!c")haikovsky"!r!(eachings#\'m-mates#$rful#%spoon',
+    '#!s#%tonic(!s"%heran")lephoning$&scopes$$text$\'visions#&l-tale$"er"+mperamental\'#nce&!s%"st$%lates',
+    '"&nacity$%ncies#%dered$"on#%ement(!s$"ts#$nant$%essee$$yson##sed$"or"(rminally\'$ting#\'racotta',
+    '"%tanus#%hered"(wkesbury"#xan#%tured!+hanksgiving##tch&%erite"&eodore$&logian$$rist#&rapies$#eto$\'mometer&$stat',
+    '"!i#&ckened\'#ing&!t#\'ercelin#$nned##rsk$%tieth%\'y-eight\'$four\'#one\'%seven\'%three("wo"!o',
+    '%!s%!y"$rash&"ed#%eaded$\'e-month%$fold$&sholds##ift$#lls#"ob"(ucydides#!d#$mped#&ndered',
+    '#&rsdays"#yme#$roid!(iananmen"%betan"$ckle$!s"$died#$ying"#ers"%lting"#mer$%scale$!x#$ings',
+    '"#nge%!d$$ling##ker##ted"$ptoe""re$$less"!t#$anic#$ford#!o!$oads#$sted"&ddlers',
+    '""il"\'lerable&$tion#"ls#$onen#$stoy"\'mlinson"#nal#!i"%olkit#\'thbrush%%paste"&p-down#*ographical"%rnado',
+    '#%toise$$uous"%shiba##sie"!t#)alitarian#"em"$uche%$line#&ghness#%louse#$sled"#wed##ing#$path',
+    '$!n"#yed!!r"\'acksuit$$tors#&de-off&%union%$mark#(ffickers#&gedies#%ilers$$tors#\'jectory#%mpled$$ways',
+    '$%scend&%ribed(\'ptional%&fected\'%rable("or&$ixed&%ormer)!s%%genic%%lates%(missions%\'parency&$ired%$vaal',
+    '(!s#"sh#&versed"\'eachery$%sured#%mayne$"or#(pidation"&iassic#%butes#$cked#\'ggering#%mming(!s#$poli',
+    '#"sh$#tan%#ram#&umphed""na""od#%lleys#$oper#$tsky$#ted%#ing#&ubling$#ghs$"pe"%uancy',
+    '#"mp%#ets#&ncated%%hbull#"ro#(stworthy#%thful("ly!&sarist"!u!#ubs"%cking"&esdays"%fnell"%mbler',
+    '#!g#"is#%stall"&rbines#"in#!k#\'naround#$tles"%scany"!t#&orials!"vs!.welfth-century\'!s#)nty-first',
+    '#$nkle&#ing##tch&#ing"&o-hour$$week#&flower$#old!%ycoon")pesetting#%ified"$rant##one &u-turn!%.s.a.',
+    '!"dc!"gh!!i""st!)lceration"%thuan#&imatum#(ra_vires%%sound%&violet!(mbrellas"!m"%pires!+naccustomed#&ltered',
+    '#&nimity#$rmed#\'ttended"*believably"*challenged%%nging$%ecked#$lean#*omplicated$\'ncerned%+stitutional%)ventional&%inced)#ing#\'ritical',
+    '#&ecided$&niable)!y$$r-21%#cut%$foot%&gravel%#lie(!s\'$ning%%mines%%pants&"in(#ned)#ing',
+    '(&tement%\'writers)#ten#"id$&sputed#$oing#$ress\'"ed#\'ulating"\'earthed#\'conomic#*quivocally##sco"(fairness$)shionable',
+    '##old$)rgettable$%unded#\'riendly"(grateful"%heard"$icef#%forum$$ying#)laterally$$ever#)maginable$\'pressed#+ntelligible&$nded',
+    '*#ing\'&rupted#$ting##vel%\'rsality#\'x-based$$ware")justified"(lawfully##oad&"ed&#ing$"ck"*mistakably#$oved',
+    '#&erving")obtrusive#\'ccupied#&pposed"&packed$(ralleled#&lanned#)opularity#)rofitable%&tected"%ravel#\'eadable$(gistered$(markable$(stricted',
+    '##uly"\'scathed#&ecured$&ttling#&ightly##old%&icited#%poilt#%teady$\'oppable#)uspecting#*ympathetic"\'tenable##old$$ward',
+    '"\'veiling")warranted#\'orkable%#thy#&ritten!&pdates"&grades"\'heavals#&olding%%stery"$keep"&market")per-class"$sets##hot',
+    '"(wards_of!%sages"!m!%terus")ilisation&#ing%)tarianism%#zed"$opia&!n"&tering!)zbekistan "v8!&acated#%cines',
+    '#$rant#&ueness"%lence&"ia#$iant$$date#(ue-added%!r$#ing"%mpire""ne#$illa$$shes&#ing"(riegated',
+    '"%ulted!"du!!e""al"!g"(locities"$neer$%rable#$ison##ous#\'tilated("or$!s"&randah#%bally',
+    '##ges#&itable#!n##ona#(tebrates"$stry"$toed#!s"#xed!&iaduct#!l"\'brating\'$onal"-ce-chancellor#&iously',
+    '\'"ne"&ennese"#gil%$ance\'!t"%kings##tor"&llains"#nce#\'dicated&$tive#%eyard"%olate&#ing"!p',
+    '%$nity#%tuous".s-&agrave;-vis#"as#&cosity%"us#"ta#&ualise\'"ze""ta"$vien"!z!)ociferous"%icing"(lkswagen',
+    '#\'uminous"$rtex""ws"%yages!%ulcan#%tures!!w "w1!#abi"!d#\'dington"#ger""il#\'nwright#"te',
+    '%!d%!r"$lden#$kman$#way##ler$\'ingford$!y#$pole#!t$!z""nd$%erers##ton"%pping',
+    '"%rburg#&drobes#&hammer$$eads$"ol#$nock##ped#&ranted$#ing#%ships#"ts"$sher$&ing-up#$tage$%eland',
+    '%#man#\'erfalls&#ord&$ront%#man%$side&%ports%%tight"%vered%#ing%#ley#!y"#xed!"bc!&eakest',
+    '#%ponry#&riness##sel"$bber"$dges#\'nesdays"%eding#%k-end$#day"%ighty##mar"#lch#!d$"ed$#ing',
+    '%\'meaning$$_off$%being$$come#%shman"&rewolf"(stbourne$&erners$$land$$ward(!s"!u!&haddon#$rton"!e',
+    '#(elbarrow%&chairs%#ing##lan#$rein"#iff#"ne$#ing#"rl%"ed%#ing%$wind#$sked&"rs&!y',
+    '$$tles#(techapel%$head%#law%$ness%&washed$#ley",oleheartedly%&salers&#ome##ops"#yte!#ick$&edness"%dower',
+    '"#eld%"ed%#ing")lberforce#&d-type$#est$$fowl#$frid$"ul##kie%"ns##led$&oughby%"ws"#nch',
+    '$$mill##ged#&tering$"ry"$pers"%shart$#ful#$tful\'"ly"&thered&#ing!%obbly"!e"$king"#lff',
+    '""nt"\'odstock$%ville)!s$$ward"$rded#\'k-force$#man\'$ship#%mwood#(shippers#(thington!$raps"$eath##nch',
+    '\'!d&#ing#%nkles#%thing$!s"&ongful#)ught-iron!!u!(yresdale #x\'s!%erxes!"ii "y.!\'achting"$maha',
+    '"\'rdstick#!m$$outh""wn!\'ear-end"!o##man##vil!#oga""ke!"ts!(ugoslavs $zach"$greb"#ire',
+    '""ta""us!%ipped!%odiac"(ological',
 )
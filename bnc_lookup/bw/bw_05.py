@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_05 = (
+count_05 = 6694
+
+heads_05 = (
     '&ast&ast&ast',
-    '&ast&ast&ast&ast',
-    '&deg',
-    '&dollar;100,000',
-    '&dollar;100m',
-    '&dollar;10m',
-    '&dollar;1m',
-    '&dollar;2',
-    '&dollar;2,000',
-    '&dollar;20',
-    '&dollar;200',
-    '&dollar;3',
-    '&dollar;3,000',
-    '&dollar;5,000',
-    '&dollar;50',
-    '&frac12;in',
     '&ouml;zal',
-    '&pound;1,200',
-    '&pound;1.2',
-    '&pound;100m',
-    '&pound;10m',
-    '&pound;11',
-    '&pound;12,000',
-    '&pound;12.99',
-    '&pound;125',
-    '&pound;13',
-    '&pound;130',
-    '&pound;14',
-    '&pound;140',
-    '&pound;17',
-    '&pound;18',
-    '&pound;2.5',
     '&pound;2.99',
-    '&pound;20m',
-    '&pound;22',
-    '&pound;24',
-    '&pound;28',
-    '&pound;35,000',
-    '&pound;50m',
-    '&pound;55',
-    '&pound;6.95',
-    '&pound;6.99',
-    '&pound;600,000',
-    '&pound;65',
-    '&pound;7,000',
-    '&pound;7.99',
-    '&pound;70,000',
-    '&pound;75,000',
     '&pound;750,000',
-    '&pound;8.99',
-    '&pound;80,000',
-    '&pound;800,000',
-    '&pound;9.95',
-    '&pound;9.99',
-    '&pound;900',
-    '&rarr',
-    '\'50s',
-    '\'90s',
-    '\'93',
-    '\'ow',
-    '***',
-    '****',
-    '-2',
-    '/a/',
     '0.05',
-    '0.1%',
-    '0.25',
-    '0.5%',
-    '0.9',
-    '06',
-    '081',
-    '09',
-    '1&ndash;1',
-    '1&ndash;4',
-    '1,000,000',
-    '1,100',
-    '1,400',
-    '1,600',
-    '1-0',
-    '1-1',
     '1.25',
-    '1.30',
-    '1.5%',
-    '10&ndash;15',
-    '10-year-old',
-    '10.00',
-    '10.3',
-    '10.4',
-    '100g/4oz',
-    '100th',
-    '1066',
-    '10m',
-    '10mm',
-    '10pm',
-    '10s',
-    '11-year-old',
     '11.1',
-    '11.2',
-    '11.3',
-    '11.30',
-    '11.4',
-    '11.5',
-    '1100',
-    '12-month',
-    '12.1',
-    '12.30',
-    '120,000',
-    '13-year-old',
-    '1400',
-    '140k',
-    '1471',
-    '1483',
     '15&ins',
-    '15ml/tbsp',
-    '16-bit',
-    '162',
-    '163',
-    '1640',
-    '1642',
-    '1649',
-    '1650',
-    '166',
-    '1689',
-    '1690',
-    '1692',
-    '16mb',
-    '17,000',
-    '17.5',
     '171',
-    '1710',
-    '172',
-    '1720',
-    '173',
-    '1730',
-    '174',
-    '1740',
-    '1745',
-    '1749',
-    '176',
-    '1763',
-    '1765',
-    '1766',
-    '1768',
-    '177',
     '1771',
-    '1772',
-    '1773',
-    '1774',
-    '1776',
-    '1777',
-    '1778',
-    '1779',
-    '178',
-    '1780s',
-    '1783',
-    '1784',
-    '1785',
-    '1786',
-    '1787',
-    '1788',
     '179',
-    '1790s',
-    '1796',
-    '1797',
-    '1798',
-    '18&ins',
-    '18,000',
-    '1804',
-    '1807',
-    '1808',
-    '1809',
-    '181',
-    '1811',
-    '1819',
-    '182',
-    '1820s',
     '1821',
-    '1822',
-    '1827',
-    '183',
-    '186',
-    '187',
-    '188',
-    '189',
-    '18th-century',
-    '1900s',
-    '191',
-    '192',
-    '193',
-    '195',
-    '196',
-    '197',
     '1979a',
-    '198',
-    '1989-90',
-    '199',
-    '1990&ndash;91',
-    '1991&ndash;92',
-    '1991-92',
-    '1992&ndash;93',
-    '1992-93',
-    '1993/94',
-    '1b',
-    '1lb',
-    '1p',
-    '2&ndash;4',
-    '2(1)',
-    '2.30',
     '2.5%',
-    '20-year',
-    '2005',
-    '200m',
-    '201',
-    '2010',
-    '202',
-    '203',
-    '204',
-    '206',
-    '207',
-    '208',
-    '209',
-    '211',
-    '213',
-    '214',
     '215',
-    '216',
-    '217',
-    '221',
-    '222',
-    '223',
-    '226',
-    '228',
-    '229',
-    '235',
-    '236',
-    '237',
-    '239',
-    '242',
-    '245',
-    '2500',
     '252',
-    '25g',
-    '25p',
-    '26%',
-    '261',
-    '27-year-old',
-    '275',
-    '28,000',
-    '29%',
-    '29-year-old',
-    '290',
-    '2d',
-    '2in',
-    '2oz',
-    '3&frac12',
-    '3&ndash;2',
     '3-2',
-    '3-d',
-    '3.10',
-    '3.30',
-    '301',
-    '303',
-    '31%',
-    '31-year-old',
-    '310',
-    '32%',
-    '325',
-    '32mb',
-    '34%',
-    '340',
-    '350,000',
-    '365',
     '37%',
-    '385',
-    '39%',
-    '3a',
-    '3p',
-    '3pm',
-    '4&deg;c',
-    '4&ndash;0',
-    '4&ndash;1',
-    '4&ndash;5',
-    '4,500',
-    '4.',
-    '4.30',
-    '405',
-    '40mhz',
-    '40s',
     '42%',
-    '420',
-    '43%',
-    '430',
-    '44%',
-    '45,000',
-    '47%',
-    '48%',
-    '4a',
-    '4b',
-    '4in',
-    '4mb',
-    '4p',
-    '5&ndash;6',
-    '5.',
-    '5.30',
     '5.9',
-    '50g',
-    '50g/2oz',
-    '50s',
-    '51%',
-    '512',
-    '55%',
-    '580',
-    '5a',
-    '5c',
-    '5ht',
-    '6&ins',
-    '6&ndash;1',
-    '6&ndash;2',
-    '6&ndash;3',
-    '6(2)',
     '6-2',
-    '6-4',
-    '6.0',
-    '6.30pm',
-    '66mhz',
-    '6a',
-    '6b',
-    '6p',
-    '7.0',
-    '7.7',
-    '7.8',
-    '7.9',
-    '700,000',
-    '7000',
-    '75,000',
-    '8&ndash;10',
     '8.6',
-    '8.7',
-    '8.8',
-    '800,000',
-    '8000',
-    '88open',
-    '9.4',
-    '90&deg',
-    '90,000',
-    '90s',
-    '99%',
-    '9am',
-    '9pm',
-    'a\'',
-    'a-levels',
-    'a.g.m.',
     'a5',
-    'a_la',
-    'aachen',
-    'abated',
-    'abba',
-    'abbas',
-    'abbots',
-    'abbreviation',
-    'abd',
-    'abdel',
-    'abdication',
-    'abi',
-    'abigail',
-    'abject',
-    'ably',
-    'abort',
     'abounded',
-    'abrams',
-    'abseil',
-    'abstain',
-    'abstained',
-    'abstention',
-    'abyssinia',
-    'academia',
-    'acc',
-    'accede',
-    'acceded',
-    'accentuate',
-    'accomplishments',
-    'according',
-    'accretion',
-    'accruals',
     'accuses',
-    'accusingly',
-    'acemi',
-    'acer',
-    'acetic',
-    'ach',
-    'acidification',
-    'acklam',
-    'acknowledgements',
-    'acknowledgment',
-    'ackroyd',
-    'acne',
-    'acoustics',
-    'acquirer',
-    'acquittal',
-    'acreage',
     'acrid',
-    'acropolis',
-    'activates',
-    'activism',
-    'actuary',
-    'acumen',
-    'adage',
-    'add-on',
-    'adduced',
-    'adele',
-    'adenocarcinoma',
-    'adenomas',
-    'adenomatous',
-    'adhering',
-    'adjourn',
-    'adjudged',
     'adjusts',
-    'adler',
-    'admires',
-    'admiringly',
-    'admissibility',
-    'ado',
-    'adolph',
-    'adoptive',
-    'adoring',
-    'adorn',
-    'adrenaline',
-    'adsorption',
-    'adulation',
-    'adventurer',
-    'adverbs',
-    'adversarial',
     'adversaries',
-    'aenarion',
-    'aero',
-    'aerodynamic',
-    'aerosols',
-    'aesthetically',
-    'aetiology',
-    'affable',
-    'affirming',
-    'affliction',
-    'affray',
-    'affronted',
-    'afhq',
-    'afore',
-    'aforementioned',
-    'aforesaid',
     'aga',
-    'agarose',
-    'agassi',
-    'age-group',
-    'aggravate',
-    'aggravating',
-    'aggregated',
-    'aggressor',
-    'aging',
-    'agonised',
-    'ahi',
-    'aimlessly',
-    'aircrew',
-    'airforce',
-    'airframe',
-    'airily',
     'airlift',
-    'airman',
-    'airspace',
-    'airway',
-    'ajar',
-    'akers',
-    'alacrity',
-    'aladdin',
-    'albany',
-    'alberta',
-    'alcoholics',
-    'alderley',
-    'aldington',
-    'aleksandr',
-    'ales',
-    'alexandre',
     'alfa',
-    'alfredo',
-    'algal',
-    'algebraic',
-    'alicia',
-    'alienate',
-    'alighted',
-    'align',
-    'alina',
-    'all-embracing',
-    'all-night',
-    'all-powerful',
-    'all-rounder',
-    'all-weather',
-    'allah',
-    'allege',
     'allegiances',
-    'allegorical',
-    'allenby',
-    'allergies',
-    'alleviated',
-    'alleyways',
-    'alloys',
-    'alluring',
-    'allusions',
-    'alma',
-    'alresford',
-    'alsace',
-    'alsatian',
-    'altars',
-    'alternation',
-    'altitudes',
     'altrincham',
-    'amaze',
-    'amazonian',
-    'ambled',
-    'ambleside',
-    'ambulatory',
-    'ambushed',
-    'amdahl',
-    'amersham',
-    'ami',
-    'amiably',
-    'amiga',
-    'amin',
-    'amir',
-    'amman',
-    'ammonium',
     'amnesia',
-    'amorous',
-    'amphitheatre',
-    'amplify',
-    'amylase',
-    'anachronism',
-    'anachronistic',
-    'analogues',
-    'analyze',
-    'anarchic',
-    'anarchist',
-    'anatoly',
-    'anchoring',
-    'anchors',
-    'anders',
-    'anderton',
     'andr&eacute;e',
-    'androids',
-    'anemone',
-    'anemones',
-    'angelic',
-    'angelina',
-    'angevin',
-    'angina',
-    'anglicans',
-    'anglo-norman',
-    'angolan',
-    'angst',
-    'animate',
-    'ankara',
-    'annan',
-    'annexation',
     'annihilation',
-    'anniversaries',
-    'annotated',
-    'annoys',
-    'annulled',
-    'anointed',
-    'anonymously',
-    'antagonist',
-    'antelope',
-    'anthems',
-    'anti-apartheid',
-    'anti-communist',
-    'anti-fascist',
-    'anti-nuclear',
-    'anti-racist',
-    'anti-terrorist',
     'anti-war',
-    'antigua',
-    'antiquarian',
-    'antiquated',
-    'antiracist',
-    'antlers',
-    'antrum',
-    'anya',
-    'anytime',
-    'apace',
-    'apache',
-    'apathetic',
-    'aphasia',
-    'aphids',
-    'api',
-    'apl',
     'apologising',
-    'apostolic',
-    'apostrophe',
-    'apothecary',
-    'appallingly',
-    'apparition',
-    'appease',
-    'appeasement',
-    'appended',
-    'appendices',
-    'appraisals',
-    'appraised',
-    'appraising',
-    'appreciates',
-    'appreciatively',
-    'apprehend',
     'apprehended',
-    'apprehensively',
-    'approachable',
-    'approvals',
-    'approves',
-    'approvingly',
-    'approx.',
-    'approximations',
-    'apse',
-    'aqueduct',
-    'aqueous',
-    'aquifer',
-    'arabella',
-    'arbitrators',
-    'arbroath',
-    'arbuthnot',
     'arcades',
-    'arcane',
-    'archery',
-    'arching',
-    'arden',
-    'argyle',
-    'ariadne',
-    'aries',
-    'aristide',
-    'aristos',
-    'aristotelian',
-    'arkwright',
-    'armada',
-    'armani',
-    'armenians',
-    'armpits',
     'arranges',
-    'arrays',
-    'arthritic',
-    'articulating',
-    'artifacts',
-    'artistry',
-    'arundel',
-    'asa',
-    'asc',
-    'ascend',
-    'ascension',
-    'ascertaining',
-    'ascetic',
-    'ascites',
-    'ascribe',
-    'ashby',
     'ashford',
-    'ashtrays',
-    'asiatic',
-    'asparagus',
-    'asphalt',
-    'assailants',
-    'assailed',
-    'assam',
-    'assassinate',
-    'assiduously',
-    'assigns',
-    'associating',
-    'assures',
-    'assuring',
-    'ast',
-    'astor',
     'astrologer',
-    'astronaut',
-    'aswan',
-    'asylums',
-    'asymmetrical',
-    'asymptomatic',
-    'atf1',
-    'atheism',
-    'athena',
-    'athletico',
-    'atlantis',
-    'atrium',
-    'atrocious',
-    'atrocity',
-    'attach&eacute',
-    'attenborough',
     'attentively',
-    'attire',
-    'attitudinal',
-    'attributive',
-    'attrition',
-    'attuned',
-    'auburn',
-    'audacious',
-    'audacity',
-    'auden',
-    'aural',
-    'auschwitz',
-    'auspicious',
-    'aussies',
-    'australasia',
-    'austrians',
     'authorial',
-    'authorising',
-    'authoritarianism',
-    'authorize',
-    'authorizing',
-    'autocracy',
-    'autoimmune',
-    'autopsy',
-    'aux',
-    'auxiliaries',
-    'av',
-    'ave',
-    'avenge',
-    'avidly',
-    'avocado',
-    'avoidable',
     'avowed',
-    'avril',
-    'awaken',
-    'awed',
-    'awkwardness',
-    'awry',
-    'ax',
-    'axiomatic',
-    'axminster',
-    'axons',
-    'axp',
-    'ayer',
-    'ayrton',
-    'azerbaijani',
-    'azure',
-    'b1',
     'baba',
-    'babangida',
-    'babble',
-    'babes',
-    'babysitting',
-    'backbench',
-    'backfired',
-    'backpacking',
-    'backwater',
-    'backyard',
-    'bad-tempered',
-    'baden',
-    'baffling',
-    'bagged',
-    'bagpipes',
-    'baie',
     'bailed',
-    'bainbridge',
-    'bairns',
-    'balbinder',
-    'balkan',
-    'ballast',
-    'ballerina',
-    'balm',
-    'balustrade',
-    'banda',
-    'bandaged',
-    'banded',
-    'bandeira',
-    'bandwidth',
-    'bangladeshi',
-    'bangs',
     'banister',
-    'banknotes',
-    'bankruptcies',
-    'bannister',
-    'baptists',
-    'barak',
-    'barbarism',
-    'barbel',
-    'bard',
-    'bargained',
-    'baring',
-    'barmy',
-    'baronial',
-    'barratt',
-    'barre',
-    'barricade',
     'barrington',
-    'barro',
-    'basalt',
-    'basalts',
-    'bashed',
-    'baskerville',
-    'basking',
-    'basle',
-    'bassist',
-    'bastion',
-    'bateman',
-    'batted',
-    'battens',
-    'battleground',
-    'battlements',
-    'baudelaire',
     'bawled',
-    'bayonne',
-    'bayswater',
-    'bcr',
-    'bda',
-    'beached',
-    'beacons',
-    'beaded',
-    'beadle',
-    'beaker',
-    'beaks',
-    'beamish',
-    'bearable',
-    'beards',
-    'beardsley',
-    'beastly',
     'beatings',
-    'beaton',
-    'beau',
-    'beauchamp',
-    'beaufort',
-    'beaverbrook',
-    'bec',
-    'beckoning',
-    'bedroomed',
-    'beefy',
-    'beep',
-    'beet',
-    'beheaded',
-    'behest',
-    'beinn',
-    'belfry',
     'belgians',
-    'belied',
-    'believable',
-    'bellies',
-    'belligerent',
-    'bellowing',
-    'belvedere',
-    'benedictine',
-    'benefactors',
-    'benetton',
-    'benevolence',
-    'bengali',
-    'benghazi',
-    'bennet',
-    'benton',
-    'benzene',
     'bequests',
-    'beresford',
-    'beret',
-    'berks',
-    'bernadette',
-    'berne',
-    'bernhard',
-    'berowne',
-    'berserk',
-    'bes',
-    'besotted',
-    'bestow',
-    'bethnal',
-    'betrays',
-    'better-off',
-    'beverage',
     'beverages',
-    'bey',
-    'bfgf',
-    'bh',
-    'bi',
-    'biarritz',
-    'bib',
-    'bibles',
-    'bibliographical',
-    'bibliographies',
-    'bicameral',
-    'bickering',
-    'biennial',
-    'bikers',
-    'bilbao',
-    'billiard',
     'bindings',
-    'biodiversity',
-    'birkett',
-    'biro',
-    'birthright',
-    'bis',
-    'bishopric',
-    'bismuth',
-    'bistro',
-    'bitches',
-    'blackbirds',
-    'blackcurrant',
-    'blacked',
-    'blackheath',
-    'blanco',
-    'blandford',
     'blandly',
-    'blanks',
-    'blaster',
-    'bleaching',
-    'bleakly',
-    'blindfold',
-    'blindfolded',
-    'blissful',
-    'blissfully',
-    'blithely',
-    'blizzard',
-    'blobs',
-    'blockages',
-    'blockbuster',
-    'bloodied',
-    'bloodless',
     'bloodstained',
-    'blossoming',
-    'blossoms',
-    'blotted',
-    'blouses',
-    'blue-green',
-    'blueprints',
-    'blundell',
-    'blunders',
-    'blunkett',
-    'bnp',
-    'boarders',
-    'boardman',
-    'boathouse',
-    'bobs',
-    'bodyguards',
     'bogey',
-    'bogie',
-    'bogies',
-    'bognor',
-    'bois',
-    'boldness',
-    'bolivian',
-    'bolting',
-    'bombshell',
-    'bonar',
-    'bondholders',
-    'bonfires',
-    'boniface',
-    'bonington',
-    'bono',
-    'bookshelves',
     'boolean',
-    'booms',
-    'booster',
-    'boosts',
-    'booted',
-    'booths',
-    'booty',
-    'borehole',
-    'boreholes',
-    'borrows',
-    'bosch',
-    'bossy',
-    'botanist',
-    'bothers',
-    'bothwell',
-    'bottling',
     'bottom-up',
-    'bottomless',
-    'bougainville',
-    'bough',
-    'boulton',
-    'bouncer',
-    'bounces',
-    'bouncy',
-    'bounding',
-    'boutique',
-    'boutiques',
-    'boutros-ghali',
-    'bowden',
-    'bowers',
-    'bowes',
-    'bowman',
     'box-office',
-    'boyz',
-    'boz',
-    'bracelets',
-    'brackish',
-    'brackley',
-    'brad',
-    'braille',
-    'brainchild',
-    'braked',
-    'bramble',
-    'brampton',
-    'branagh',
-    'branched',
-    'brand-new',
-    'brandenburg',
     'brat',
-    'braun',
-    'bravado',
-    'bravo',
-    'brazen',
-    'brazier',
-    'breaching',
-    'breadwinner',
-    'breaker',
-    'breakfasts',
-    'breather',
-    'breathes',
-    'brecon',
-    'bremner',
-    'bretton',
-    'brevity',
     'bribed',
-    'bridesmaid',
-    'bridesmaids',
-    'bridged',
-    'brig.',
-    'brigades',
-    'brimmer',
-    'bristles',
-    'bristling',
-    'broad-based',
-    'broadhurst',
-    'broads',
-    'brocade',
-    'brocklebank',
-    'brokerage',
-    'brom',
     'brompton',
-    'brooches',
-    'brooklands',
-    'brough',
-    'browne-wilkinson',
-    'browned',
-    'brunei',
-    'brunner',
-    'brunswick',
-    'brusque',
-    'brusquely',
-    'bryn',
-    'bsa',
-    'bse',
-    'bskyb',
-    'btec',
     'bubbled',
-    'bubbly',
-    'bucked',
-    'buckles',
-    'buckmaster',
-    'budgie',
-    'buffered',
-    'buffers',
-    'buffs',
-    'bulger',
-    'bulimia',
-    'bulldog',
-    'bulldozers',
-    'bullies',
-    'bullion',
-    'bullish',
     'bullocks',
-    'bumble',
-    'bums',
-    'bunched',
-    'bundesrat',
-    'bung',
-    'bunkers',
-    'bunting',
-    'bunyan',
-    'burford',
-    'burgers',
-    'burkina',
-    'burnett',
-    'burnham',
-    'burnished',
-    'burroughs',
     'burrowing',
-    'bursa',
-    'busacher',
-    'busby',
-    'busied',
-    'busier',
-    'buster',
-    'bustled',
-    'bute',
-    'buthelezi',
-    'butlin',
-    'butterworth',
-    'buttresses',
-    'bye-law',
-    'byelarus',
-    'bygone',
     'bypassed',
-    'bystanders',
-    'c\'est',
-    'c\'s',
-    'c-jun',
-    'c-terminal',
-    'c.-in-c.',
-    'c/o',
-    'c3',
-    'c64',
-    'cabbages',
-    'cabling',
-    'cabs',
-    'caddies',
-    'cadillac',
-    'cadiz',
     'cadmium',
-    'cadre',
-    'caernarfon',
-    'caesarean',
-    'cairngorms',
-    'calamity',
-    'calculates',
-    'calculators',
-    'calculus',
-    'caldwell',
-    'caledor',
-    'caliban',
-    'calibrated',
-    'call-up',
-    'calvert',
-    'calvinist',
     'camaraderie',
-    'camberwell',
-    'cameo',
-    'camouflaged',
-    'campese',
-    'campion',
-    'campsite',
-    'campuses',
-    'canaries',
-    'candour',
-    'canes',
-    'cannons',
-    'canoes',
-    'cant',
-    'canteens',
-    'canter',
     'canvass',
-    'capel',
-    'capitalisation',
-    'capitalised',
-    'capitation',
-    'capitol',
-    'capri',
-    'capricious',
-    'capricorn',
-    'capt.',
-    'captions',
-    'captivated',
-    'captives',
-    'car-park',
-    'caracas',
-    'caramel',
     'carbonates',
-    'carcasses',
-    'caresses',
-    'carlson',
-    'carmel',
-    'carmichael',
-    'carnations',
-    'carnelian',
-    'carols',
-    'carpeting',
-    'carted',
-    'cartesian',
-    'cartilage',
-    'cascading',
-    'casework',
-    'cashed',
     'cashing',
-    'cashmere',
-    'cask',
-    'casket',
-    'cassidy',
-    'castile',
-    'castleford',
-    'castlereagh',
-    'castor',
-    'casuals',
-    'catalogued',
-    'catalonia',
-    'catechism',
-    'categorisation',
-    'categorized',
-    'caterer',
     'caterina',
-    'catheter',
-    'catriona',
-    'caucasus',
-    'caucus',
-    'cauliflower',
-    'causality',
-    'cautionary',
-    'cautions',
-    'caveat',
-    'cavendish',
-    'cavernous',
-    'caverns',
-    'cavities',
-    'cbe',
-    'cca',
     'ccp',
-    'cd-i',
-    'cdp',
-    'ceaseless',
-    'ceded',
-    'celebratory',
-    'celibate',
-    'celluloid',
-    'cemented',
-    'cements',
-    'censor',
-    'censored',
-    'cent',
-    'centigrade',
-    'centre-half',
-    'centring',
     'centrist',
-    'ceo',
-    'cern',
-    'certify',
-    'cervix',
-    'cesar',
-    'cessna',
-    'cetaceans',
-    'ceylon',
-    'cfe',
-    'cgt',
-    'chagrin',
-    'chainsaw',
-    'chairing',
-    'chalet',
-    'chalets',
     'chalice',
-    'chalker',
-    'chameleon',
-    'chamorro',
-    'championed',
-    'chanced',
-    'chandeliers',
-    'chanel',
-    'changeover',
-    'changez',
-    'channelling',
-    'chantal',
-    'chaplains',
-    'char',
-    'characterises',
-    'characterizes',
     'charger',
-    'chariots',
-    'charman',
-    'charmingly',
-    'charolais',
-    'charted',
-    'charting',
-    'chaser',
-    'chaste',
-    'chastity',
-    'chatham',
-    'chatichai',
-    'chats',
-    'chattels',
-    'chattered',
-    'chauvinism',
     'chavigny',
-    'che',
-    'cheapside',
-    'checkpoint',
-    'cheekbone',
-    'cheerfulness',
-    'chequered',
-    'cher',
-    'cherwell',
-    'chesterton',
-    'chestnuts',
-    'chiang',
-    'chided',
-    'chieftain',
-    'chiffon',
-    'child-rearing',
     'childebert',
-    'childrens',
-    'chilperic',
-    'chiltern',
-    'chimed',
-    'chimes',
-    'chimps',
-    'chink',
-    'chirac',
-    'chloe',
-    'chlorofluorocarbons',
-    'chloroform',
-    'chlothar',
-    'cholecystectomy',
-    'chopper',
-    'choppy',
     'choreography',
-    'christening',
-    'christology',
-    'christy',
-    'chromatic',
-    'chromium',
-    'chromosomal',
-    'chubby',
-    'chucking',
-    'chuckling',
-    'chung',
-    'churn',
-    'cichlid',
-    'cics',
-    'cimetidine',
-    'cincinnati',
     'circulars',
-    'circumscribed',
-    'circumvent',
-    'cistercian',
-    'citrine',
-    'citroen',
-    'civilizations',
-    'clamber',
-    'clambering',
-    'clammy',
-    'clamouring',
-    'clampdown',
-    'clans',
-    'clarendon',
-    'clashing',
-    'clasping',
     'classmates',
-    'claudio',
-    'cleans',
-    'cleanse',
-    'cleansed',
-    'clearances',
-    'cleese',
-    'clelia',
-    'cleric',
-    'cleverness',
-    'cli',
-    'clich&eacute;s',
-    'clift',
-    'clinching',
-    'clipboard',
-    'cloaked',
     'clockwork',
-    'clog',
-    'clogs',
-    'cloister',
-    'cloisters',
-    'clot',
-    'clothe',
-    'clydesdale',
-    'co-founder',
-    'co-operated',
-    'co-opted',
-    'co-star',
-    'coachman',
-    'coal-fired',
-    'coalfields',
-    'coates',
     'coax',
-    'coaxed',
-    'coaxing',
-    'cobbler',
-    'cobham',
-    'coburg',
-    'cobwebs',
-    'cockburn',
-    'cockroaches',
-    'cocktails',
-    'cocky',
-    'cocoon',
-    'codified',
-    'coerced',
-    'coexist',
-    'coexistence',
     'coffees',
-    'cohabitation',
-    'coincidental',
-    'coincidentally',
-    'cold-blooded',
-    'coldest',
-    'colds',
-    'coles',
-    'colette',
-    'colic',
-    'collaborator',
-    'collectivism',
-    'collegiate',
-    'collide',
-    'collie',
-    'collieries',
     'colloquial',
-    'colonization',
-    'colonnade',
-    'colonoscopy',
-    'color',
-    'coloration',
-    'colts',
-    'columnar',
-    'combatants',
-    'combative',
-    'combe',
-    'combing',
-    'combs',
-    'comdex',
-    'comecon',
-    'comedies',
     'comers',
-    'comets',
-    'comfy',
-    'comin\'',
-    'commandment',
-    'commandments',
-    'commemorating',
-    'commemoration',
-    'commendation',
-    'commoners',
-    'communes',
-    'communicates',
-    'communicator',
-    'community-based',
-    'compaction',
-    'compagnie',
     'comparability',
-    'competences',
-    'competes',
-    'competitively',
-    'complicating',
-    'complies',
-    'compositional',
-    'compress',
-    'comptroller',
-    'compulsorily',
-    'compute',
-    'computerisation',
-    'concave',
-    'concealment',
-    'conceals',
-    'conceit',
     'conceptually',
-    'concertos',
-    'conchis',
-    'concocted',
-    'concord',
-    'concur',
-    'concurred',
-    'concussion',
-    'condemns',
-    'condescending',
-    'conditionals',
-    'condone',
-    'condoned',
-    'confectionery',
-    'confessing',
-    'confessional',
     'confessor',
-    'confidant',
-    'confidences',
-    'confiding',
-    'conflicted',
-    'conformed',
-    'conforming',
-    'confounding',
-    'confrontational',
-    'confusions',
-    'congregate',
-    'congresses',
-    'congressmen',
-    'conifer',
-    'conjures',
-    'conjuring',
     'connectivity',
-    'connectors',
-    'conned',
-    'connell',
-    'connery',
-    'connoisseur',
-    'connotation',
-    'conquering',
-    'conquests',
-    'conroy',
-    'consciences',
-    'conscientiously',
-    'conscripts',
-    'consecration',
-    'conserving',
-    'consoled',
     'consoling',
-    'consortia',
-    'conspiratorial',
-    'conspirators',
-    'constitutive',
-    'constraining',
-    'constricted',
-    'constructional',
-    'construe',
-    'consular',
-    'consulate',
-    'consultancies',
-    'consumes',
-    'consummate',
-    'contemporaneous',
-    'contending',
     'contentedly',
-    'continuities',
-    'contradicts',
-    'contraption',
-    'controllable',
-    'convalescent',
-    'convening',
-    'convenor',
-    'conventionalism',
-    'converged',
-    'convergent',
-    'converter',
-    'converters',
-    'conveyancer',
-    'conveyor',
-    'convicts',
     'convoluted',
-    'convulsions',
-    'conwy',
-    'cookers',
-    'cookstown',
-    'coordinators',
-    'copeland',
-    'copernican',
-    'coppell',
-    'coppers',
-    'copse',
-    'copts',
-    'corby',
-    'cordial',
-    'corgi',
-    'coriander',
     'cormack',
-    'cornell',
-    'cornflour',
-    'corpora',
-    'cortes',
-    'cosmological',
-    'cost-effectiveness',
-    'costed',
-    'costings',
-    'cottle',
-    'coun.',
-    'counselled',
-    'countdown',
-    'counterclaim',
-    'countering',
-    'counterpoint',
     'counterproductive',
-    'countryman',
-    'coupe',
-    'couplet',
-    'coups',
-    'courgettes',
-    'courted',
-    'courteously',
-    'courtly',
-    'courtyards',
-    'coverings',
-    'covertly',
-    'cowed',
-    'cowslip',
-    'coyle',
-    'cpus',
     'cr.app.r.',
-    'crabb',
-    'crackle',
-    'crackled',
-    'cradling',
-    'craggy',
-    'craigavon',
-    'cramlington',
-    'cramps',
-    'crank',
-    'cranmer',
-    'crass',
-    'crave',
-    'craved',
-    'crayons',
-    'creases',
     'creatinine',
-    'creatively',
-    'creche',
-    'creditable',
-    'creeps',
-    'crematorium',
-    'crested',
-    'crests',
-    'crevecoeur',
-    'crevices',
-    'crick',
-    'cricketing',
-    'crikey',
-    'crimea',
-    'crispin',
-    'crisply',
     'criticises',
-    'critiques',
-    'croak',
-    'crocodiles',
-    'crofters',
-    'crofting',
-    'cronies',
-    'cropper',
-    'crosland',
-    'cross-channel',
-    'cross-cultural',
-    'cross-curricular',
-    'crossley',
-    'crossover',
-    'crowley',
-    'crucible',
     'crump',
-    'crunched',
-    'crunchy',
-    'crusader',
-    'crusades',
-    'crusading',
-    'crustal',
-    'crutch',
-    'crutches',
-    'crypts',
-    'crystallization',
-    'crystallized',
-    'cse',
-    'cso',
-    'cu&eacute;llar',
-    'cubed',
     'cuddled',
-    'cul-de-sac',
-    'cullam',
-    'culled',
-    'cum',
-    'cummins',
-    'cunningly',
-    'cuppa',
-    'curative',
-    'curbing',
-    'curbs',
-    'curd',
-    'curing',
-    'cusack',
-    'custodian',
-    'custodians',
     'customised',
-    'cut-out',
-    'cut-price',
-    'cuticle',
-    'cyanide',
-    'cyclone',
-    'cynics',
-    'cypriot',
-    'cyrus',
-    'cystitis',
-    'cytokines',
-    'cytoplasm',
-    'cytr',
-    'czechs',
-    'd&eacute;but',
-    'd&eacute;sir&eacute;e',
     'd\'ivoire',
-    'd\'or',
-    'dads',
-    'dae',
-    'daf',
-    'daffodil',
-    'daggers',
-    'dahl',
-    'dailies',
-    'daimler',
-    'dais',
-    'dalai',
-    'daleks',
-    'dalyell',
-    'damnation',
-    'damon',
     'dampen',
-    'damper',
-    'damping',
-    'dampness',
-    'danby',
-    'dappled',
-    'dar',
-    'dares',
-    'darius',
-    'darken',
-    'darkfall',
-    'darnley',
-    'dartford',
-    'dartmouth',
-    'darwinism',
-    'datasets',
     'davie',
-    'daze',
-    'dazzle',
-    'db',
-    'db2',
-    'dbms',
-    'dd',
-    'deana',
-    'deans',
-    'dearer',
-    'dearth',
-    'deathly',
-    'debacle',
-    'debarred',
-    'debenhams',
-    'debussy',
     'decadence',
-    'decadent',
-    'deceiving',
-    'deceleration',
-    'decently',
-    'decentralized',
-    'decider',
-    'deciduous',
-    'decimals',
-    'decimated',
-    'decipher',
-    'decision-maker',
-    'decked',
-    'decker',
-    'deco',
-    'decoding',
     'decommissioning',
-    'decompression',
-    'deconstruction',
-    'decorator',
-    'decorum',
-    'decrepit',
-    'dedicate',
-    'deem',
-    'deep-rooted',
-    'defamatory',
-    'defaults',
-    'defected',
-    'defensible',
-    'deferential',
-    'defies',
-    'definable',
     'deflated',
-    'deflation',
-    'deflection',
-    'defoe',
-    'defraud',
-    'defreitas',
-    'deft',
-    'degas',
-    'degeneracy',
-    'degenerated',
-    'dehydration',
-    'delectable',
-    'deleterious',
-    'deleting',
-    'deletions',
-    'delicatessen',
     'deliciously',
-    'delineated',
-    'delirious',
-    'delirium',
-    'deloitte',
-    'delphi',
-    'deluded',
-    'deluge',
-    'delusions',
-    'deluxe',
-    'delve',
-    'demeaning',
-    'demesne',
-    'democratization',
-    'demolishing',
-    'demonic',
     'demonstrably',
-    'demoralised',
-    'demos',
-    'dempsey',
-    'denham',
-    'denholm',
-    'denials',
-    'denomination',
-    'denominational',
-    'denser',
-    'denton',
-    'denunciation',
-    'departs',
-    'dependents',
-    'deplore',
-    'deploying',
     'depositing',
-    'depressions',
-    'deptford',
-    'deputation',
-    'deranged',
-    'dereliction',
-    'derided',
-    'derisive',
-    'derogatory',
-    'derrick',
-    'dersingham',
-    'deserting',
-    'deservedly',
-    'desist',
-    'despairingly',
-    'despicable',
     'despotism',
-    'destitute',
-    'desultory',
-    'detachable',
-    'detects',
-    'determinate',
-    'determinations',
-    'deterministic',
-    'detest',
-    'detractors',
-    'detritus',
-    'deuterium',
-    'devalue',
-    'devereux',
-    'devonport',
-    'devotes',
     'devoting',
-    'devotional',
-    'devour',
-    'devouring',
-    'devraux',
-    'dewar',
-    'dexterity',
-    'dh',
-    'dhabi',
-    'dhas',
-    'dia',
-    'diabolical',
-    'diagnostics',
-    'dialling',
-    'dials',
-    'dialysis',
     'diameters',
-    'dicks',
-    'dicta',
-    'dictating',
-    'dictation',
-    'dictatorial',
-    'diction',
-    'didactic',
-    'diffident',
-    'diffraction',
-    'digger',
-    'dijon',
-    'dilatation',
-    'dilated',
-    'diligently',
-    'dill',
     'dillons',
-    'diminishes',
-    'dimmed',
-    'dinar',
-    'dinars',
-    'ding',
-    'dinghies',
-    'dino',
-    'dioceses',
-    'diode',
-    'dionysiac',
-    'dior',
-    'dioxins',
-    'diphtheria',
-    'dipole',
-    'directness',
     'dirk',
-    'disabling',
-    'disaffection',
-    'disagrees',
-    'disappointingly',
-    'disarm',
-    'disarmed',
-    'disastrously',
-    'disband',
-    'disbelieving',
-    'discarding',
-    'disclosing',
-    'discoloured',
-    'discontented',
-    'discontinue',
-    'discontinuous',
     'discordant',
-    'discus',
-    'disembodied',
-    'disenchanted',
-    'disentangle',
-    'disfigured',
-    'dishonestly',
-    'disillusion',
-    'disincentive',
-    'disinclined',
-    'disinfection',
-    'disintegrate',
-    'disintegrating',
-    'disjointed',
-    'dislocated',
-    'dislodge',
     'dislodged',
-    'disloyal',
-    'dismounted',
-    'disorganized',
-    'disorientated',
-    'disorientation',
-    'dispassionate',
-    'dispenser',
-    'displeased',
-    'disprove',
-    'disregarding',
-    'disreputable',
-    'disrespect',
-    'dissected',
-    'dissecting',
-    'dissection',
     'disseminate',
-    'dissipate',
-    'dissonance',
-    'distally',
-    'distension',
-    'distillery',
-    'distinctively',
-    'distorts',
-    'distributes',
-    'distributive',
-    'distrusted',
-    'disturbingly',
-    'disuse',
-    'diurnal',
-    'div',
-    'divan',
     'diversions',
-    'dives',
-    'divorces',
-    'divulge',
-    'dizziness',
-    'djs',
-    'dme',
-    'dna-pk',
-    'docked',
-    'documentaries',
-    'documenting',
-    'dodged',
-    'doggedly',
-    'doggy',
-    'doi',
-    'doings',
     'doldrums',
-    'domed',
-    'domestically',
-    'domesticity',
-    'domicile',
-    'donal',
-    'donating',
-    'donne',
-    'donned',
-    'dooley',
-    'doorman',
-    'doorsteps',
-    'doppler',
-    'doric',
-    'dorrell',
-    'dosage',
     'dossier',
-    'doth',
-    'douglas-hamilton',
-    'dowager',
-    'downed',
-    'downgraded',
-    'downpour',
-    'downsizing',
-    'dowty',
-    'dozing',
-    'draconian',
-    'dracula',
-    'drapes',
-    'draughtsman',
-    'draughty',
-    'drawbridge',
     'drawl',
-    'drayton',
-    'dreading',
-    'dreamer',
-    'dreamily',
-    'dredge',
-    'dredged',
-    'dregs',
-    'dribbling',
-    'drinker',
-    'drips',
-    'drooped',
-    'drop-out',
-    'drosophila',
-    'droves',
-    'drudgery',
     'drummed',
-    'drunks',
-    'drury',
-    'dryness',
-    'dsp',
-    'dtp',
-    'dualism',
-    'dulled',
-    'dulles',
-    'dulwich',
-    'dum',
-    'duma',
-    'dumas',
-    'dumbarton',
-    'dummies',
-    'dumplings',
     'duncton',
-    'dundas',
-    'dungeon',
-    'dunning',
-    'dunwoody',
-    'duodenum',
-    'duomo',
-    'duplex',
-    'dupont',
-    'duran',
-    'durance',
-    'durban',
-    'dusky',
-    'dustbins',
-    'dutchman',
-    'dutiful',
     'duty-free',
-    'duxford',
-    'dwarfed',
-    'dwyer',
-    'dyeing',
-    'dynamical',
-    'dynamite',
-    'dynamo',
-    'dysplasia',
-    'e.coli',
-    'e1',
-    'e2',
-    'e5',
-    'eadwine',
-    'earphones',
-    'eases',
     'eastman',
-    'eastward',
-    'easy-going',
-    'eater',
-    'eaters',
-    'ebert',
-    'ebullient',
-    'eccles',
-    'ecgfrith',
-    'echelons',
-    'ecologically',
-    'ecosystems',
-    'ecowas',
-    'ecsc',
-    'eczema',
-    'ed=chambers',
     'edberg',
-    'edc',
-    'eddies',
-    'edgbaston',
-    'edgy',
-    'edict',
-    'edison',
-    'edmond',
-    'edmonds',
-    'edn.',
-    'educationally',
-    'eeg',
-    'effendi',
-    'efl',
-    'egalitarianism',
-    'egan',
     'eggar',
-    'egon',
-    'eight-year',
-    'eights',
-    'eighty-five',
-    'eisa',
-    'electricians',
-    'electrics',
-    'electrified',
-    'electrode',
-    'electrolyte',
-    'electrophoresis',
-    'electrostatic',
-    'elects',
-    'elevate',
-    'elevations',
     'elgin',
-    'elitism',
-    'ell',
-    'elliptical',
-    'elms',
-    'eloise',
-    'eloquence',
-    'eloquently',
-    'elt',
-    'emaciated',
-    'emanated',
-    'embarrassingly',
-    'embattled',
-    'embedding',
-    'embellished',
-    'embers',
     'embittered',
-    'emblazoned',
-    'emblems',
-    'embodying',
-    'embossed',
-    'emil',
-    'emissary',
-    'emitting',
-    'emlyn',
-    'emphases',
-    'empiricism',
-    'empiricist',
-    'empowering',
-    'empty-handed',
-    'en-suite',
-    'en_masse',
     'enamelled',
-    'encampment',
-    'encircled',
-    'encircling',
-    'enclaves',
-    'encode',
-    'encouragingly',
-    'encroaching',
-    'encrusted',
-    'end-user',
-    'endangering',
-    'endearing',
-    'endeavouring',
-    'endocrine',
-    'endorsing',
-    'endothelial',
     'endow',
-    'enema',
-    'energetically',
-    'engender',
-    'englishness',
-    'engravings',
-    'enlarging',
-    'enlighten',
-    'enlightening',
-    'enlivened',
-    'enmity',
-    'enormity',
-    'enriching',
-    'enrique',
-    'enrol',
-    'ensconced',
     'ent',
-    'entertainers',
-    'enthralled',
-    'entitles',
-    'entranced',
-    'entrant',
-    'entrepreneurship',
-    'entry-level',
-    'enumeration',
-    'enunciated',
-    'enveloping',
-    'environmentalist',
-    'environs',
-    'envoys',
-    'epidemics',
-    'epileptic',
     'epistle',
-    'epitaph',
-    'epsilon',
-    'epson',
-    'epstein',
-    'eq',
-    'equates',
-    'equating',
-    'equestrian',
-    'equine',
-    'equivocal',
-    'ercp',
-    'erica',
-    'ericsson',
-    'eritrea',
-    'erode',
     'err',
-    'errands',
-    'errant',
-    'erred',
-    'errol',
-    'ershad',
-    'erskine',
-    'erupt',
-    'esa',
-    'esau',
-    'esc',
-    'escalate',
-    'escalated',
-    'escarpment',
-    'escorting',
-    'escorts',
     'esprit',
-    'essences',
-    'estabrook',
-    'esteemed',
-    'estella',
-    'estoppel',
-    'etchings',
-    'eternally',
-    'ethereal',
-    'ethylene',
-    'etienne',
-    'evacuate',
-    'evacuees',
-    'evading',
-    'evaluative',
-    'evan',
     'evangelicals',
-    'evangelist',
-    'evangelists',
-    'eventful',
-    'eventuality',
-    'everard',
-    'evocation',
-    'evoking',
-    'ewe',
-    'ewing',
-    'ex-wife',
-    'ex.',
-    'exacted',
-    'excepted',
-    'excerpts',
-    'excised',
     'exclusivity',
-    'excrement',
-    'excruciating',
-    'exemplar',
-    'exemplifies',
-    'exemplify',
-    'exercisable',
-    'exerting',
-    'exertions',
-    'exhaled',
-    'exhortation',
-    'exhorted',
-    'existent',
-    'exmoor',
-    'exon',
-    'exorbitant',
     'expediency',
-    'expensively',
-    'experimenters',
-    'explodes',
-    'exploitative',
-    'explorations',
-    'exponential',
-    'exposures',
-    'expounded',
-    'expressionist',
-    'ext',
-    'externalities',
-    'extinguish',
-    'extortion',
-    'extra-mural',
-    'extraneous',
     'extrapolation',
-    'extravaganza',
-    'extremism',
-    'extremities',
-    'extremity',
-    'extricate',
-    'extrinsic',
-    'eye-catching',
-    'eyeballs',
-    'eyewitness',
-    'f&eacute;lix',
-    'f9',
-    'fab',
-    'fabricated',
-    'facelift',
-    'facies',
     'facile',
-    'facilitator',
-    'fact-finding',
-    'factional',
-    'factoring',
-    'fad',
-    'fads',
-    'fael-inis',
-    'fagan',
-    'fagg',
-    'fags',
-    'fahreddin',
-    'fahrenheit',
-    'fainter',
-    'fainting',
-    'fairbairn',
     'fairbrother',
-    'fairford',
-    'fairground',
-    'fairways',
-    'fairy-tale',
-    'fairytale',
-    'faiths',
-    'faked',
-    'fakes',
-    'falcons',
-    'fallible',
-    'fallow',
-    'falmouth',
-    'falsehood',
-    'falsified',
-    'falter',
     'famagusta',
-    'famously',
-    'fanaticism',
-    'fanfare',
-    'fangs',
-    'fanning',
-    'far-fetched',
-    'far-off',
-    'faraday',
-    'farah',
-    'faraway',
-    'farcical',
-    'farewells',
-    'farmhouses',
-    'farquhar',
-    'farr-jones',
     'farrow',
-    'fart',
-    'fashanu',
-    'fast-moving',
-    'fastidious',
-    'fatah',
-    'fatalities',
-    'fates',
-    'fatherland',
-    'fattening',
-    'fatter',
-    'faulkner',
-    'fault-tolerant',
-    'faultless',
-    'faunas',
-    'favouritism',
     'fawn',
-    'faxed',
-    'faxes',
-    'fay',
-    'fayre',
-    'feasting',
-    'feasts',
-    'feathered',
-    'feathery',
-    'featureless',
-    'federations',
-    'fedorov',
-    'feeders',
-    'fei',
-    'fenna',
-    'fenwick',
     'feral',
-    'ferdinando',
-    'fergusson',
-    'fermanagh',
-    'ferment',
-    'fernandez',
-    'ferried',
-    'ferris',
-    'fertilisation',
-    'fertilization',
-    'fertilized',
-    'festooned',
-    'fete',
-    'fetish',
-    'fetus',
-    'feuds',
     'feverishly',
-    'ff',
-    'fianc&eacute',
-    'fianna',
-    'fibreglass',
-    'fibrous',
-    'fickle',
-    'fictions',
-    'fiddler',
-    'fidel',
-    'fielded',
-    'fiend',
-    'fifa',
-    'fiftieth',
-    'fifty-four',
-    'fifty-one',
     'fifty-two',
-    'figaro',
-    'filaments',
-    'fillet',
-    'fillets',
-    'film-maker',
-    'film-makers',
-    'filmer',
-    'fimbra',
-    'finalise',
-    'finalist',
-    'financiers',
-    'fincara',
-    'fingerprint',
-    'finnan',
-    'finsbury',
     'firearm',
-    'fireball',
-    'fireplaces',
-    'fireside',
-    'firmed',
-    'first-ever',
-    'first-half',
-    'first-team',
-    'fishkeepers',
-    'fishy',
-    'fissures',
-    'fitzpatrick',
-    'fitzroy',
-    'fixed-term',
-    'fizz',
-    'fizzy',
     'flabby',
-    'flagrant',
-    'flanagan',
-    'flaring',
-    'flashy',
-    'flattening',
-    'flawless',
-    'flax',
-    'fledged',
-    'fleetingly',
-    'fleury',
-    'flexing',
-    'flicks',
-    'flirt',
-    'flirtation',
-    'flitted',
     'fln',
-    'florentine',
-    'florid',
-    'florist',
-    'florrie',
-    'floundering',
-    'flourishes',
-    'flowery',
-    'fluctuate',
-    'fluctuated',
-    'fluently',
-    'fluff',
-    'fluidity',
-    'fluke',
-    'fluoride',
-    'fluted',
     'flutes',
-    'fly-half',
-    'flyers',
-    'flypast',
-    'flyte',
-    'foals',
-    'foaming',
-    'foci',
-    'focussing',
-    'foes',
-    'foetal',
-    'foiled',
-    'folders',
-    'folio',
-    'folkestone',
-    'follies',
     'fontaine',
-    'fontana',
-    'fontanellato',
-    'foolhardy',
-    'fooling',
-    'footbridge',
-    'footwork',
-    'forage',
-    'foray',
-    'forbids',
-    'forcible',
-    'forearms',
-    'forebears',
-    'foreboding',
-    'foregone',
-    'forestall',
     'forgave',
-    'forges',
-    'forgo',
-    'formaldehyde',
-    'formalised',
-    'formalism',
-    'formalist',
-    'formatting',
-    'formby',
-    'formers',
-    'forrester',
-    'fortifications',
-    'fortitude',
-    'fortnightly',
-    'fortresses',
-    'fortuitous',
     'forty-four',
-    'forty-nine',
-    'forty-one',
-    'forty-seven',
-    'forty-six',
-    'forty-three',
-    'forums',
-    'forward-looking',
-    'forwarding',
-    'fothergill',
-    'fouled',
-    'four-fifths',
-    'fourteenth-century',
-    'fourth-century',
-    'fpr',
-    'fractionally',
     'francie',
-    'franciscan',
-    'franco-german',
-    'frankness',
-    'fraternal',
-    'frauds',
-    'freckled',
-    'freckles',
-    'free-kick',
-    'free-market',
-    'freeholders',
-    'freestyle',
-    'freezes',
-    'frenetic',
-    'fresher',
-    'frets',
     'fretted',
-    'fretting',
-    'frg',
-    'friars',
-    'fridges',
-    'friedrich',
-    'fries',
-    'friesian',
-    'frieze',
-    'frigate',
-    'frigates',
-    'frigid',
-    'frills',
-    'frilly',
-    'frisson',
-    'frith',
     'fro',
-    'frocks',
-    'fronds',
-    'fronting',
-    'frosted',
-    'frosts',
-    'frothy',
-    'fryer',
-    'ft.',
-    'fu',
-    'fuelling',
-    'fuji',
-    'full-size',
-    'fullback',
-    'fulton',
-    'fumed',
     'funerary',
-    'fungal',
-    'funky',
-    'funniest',
-    'funnily',
-    'furby',
-    'furlongs',
-    'furness',
-    'furrow',
-    'furrowed',
-    'furrows',
-    'furtherance',
-    'furthering',
-    'fuses',
-    'fussed',
-    'fussing',
     'futuristic',
-    'g&oacute;mez',
-    'g.p.',
-    'g7',
-    'gabon',
-    'gael',
-    'gagged',
-    'gaidar',
-    'gaitskell',
-    'gajdusek',
-    'galactic',
-    'galapagos',
-    'galbraith',
-    'galilee',
-    'gallantry',
-    'gallic',
     'galore',
-    'gambia',
-    'gambler',
-    'gaming',
-    'gamut',
-    'gandalf',
-    'gangsters',
-    'gangway',
-    'garb',
-    'garc&iacute;a',
-    'garda',
-    'garel-jones',
-    'garfield',
-    'gargy',
-    'garish',
-    'garlands',
     'garrisons',
-    'garvin',
-    'gascon',
-    'gaseous',
-    'gastro-oesophageal',
-    'gauged',
-    'gauges',
-    'gauguin',
-    'gaullist',
-    'gaussian',
-    'gauze',
-    'gchq',
-    'gebrec',
-    'geezer',
-    'gelder',
-    'gelding',
     'generalise',
-    'generalist',
-    'genitals',
-    'genocide',
-    'gens',
-    'genscher',
-    'gentile',
-    'gentiles',
-    'gentlemanly',
-    'geodesic',
-    'geophysics',
-    'georgiades',
-    'georgie',
-    'geranium',
-    'geraniums',
-    'gerhard',
     'gerrard',
-    'gerstner',
-    'gestapo',
-    'gesturing',
-    'getaway',
-    'gettin\'',
-    'gh',
-    'gi',
-    'giddy',
-    'gide',
-    'gillingham',
-    'gilly',
-    'gilman',
-    'gilmour',
-    'gilt-edged',
-    'gimmick',
     'gingerbread',
-    'giorgio',
-    'gipsies',
-    'girdle',
-    'giscard',
-    'gleefully',
-    'glenavon',
-    'glenda',
-    'glens',
-    'glentoran',
-    'gliadin',
-    'glided',
-    'glinted',
-    'globally',
-    'globular',
-    'glorified',
     'gloriously',
-    'glossed',
-    'gloved',
-    'glowered',
-    'glum',
-    'glumly',
-    'glutamate',
-    'glutathione',
-    'glycaemic',
-    'gmc',
-    'gnarled',
-    'gnawing',
-    'gnomes',
-    'goblet',
-    'goddesses',
-    'godly',
     'godolphin',
-    'godstowe',
-    'goering',
-    'goethe',
-    'goff',
-    'goings',
-    'gondola',
-    'gong',
-    'gonz&aacute;lez',
-    'good-bye',
-    'goode',
-    'goodison',
-    'goodwood',
-    'goram',
-    'gorilla',
-    'gosforth',
     'gossiping',
-    'gotten',
-    'gouache',
-    'gourmet',
-    'govan',
-    'governor-general',
-    'gr',
-    'gr&eacute;goire',
-    'graces',
-    'graciously',
-    'grafting',
-    'grafton',
-    'grail',
-    'grammars',
-    'grammatically',
-    'gramsci',
     'grand_prix',
-    'grandchild',
-    'grandly',
-    'grandmothers',
-    'grands',
-    'grant-maintained',
-    'grapefruit',
-    'grapple',
-    'grappling',
-    'grass-roots',
-    'grasslands',
-    'greased',
-    'great-aunt',
-    'great-grandfather',
-    'greats',
-    'greaves',
     'greedily',
-    'greenish',
-    'greenock',
-    'greenway',
-    'greer',
-    'gregarious',
-    'gregg',
-    'gregor',
-    'gregson',
-    'greig',
-    'grenada',
-    'greta',
-    'greying',
-    'greys',
-    'grice',
-    'grime',
     'grindal',
-    'grinstead',
-    'grisly',
-    'grist',
-    'groans',
-    'grobbelaar',
-    'groomed',
-    'grotto',
-    'ground-floor',
-    'groupe',
-    'grower',
-    'growling',
-    'gruff',
-    'gruffly',
-    'grumpy',
-    'grunting',
     'grunts',
-    'gt',
-    'guatemalan',
-    'guberniia',
-    'guernica',
-    'guesswork',
-    'guggenheim',
-    'gui',
-    'guillaume',
-    'guilloche',
-    'guises',
-    'guitarists',
-    'gullies',
-    'gunned',
-    'gunpoint',
-    'gushing',
     'gustav',
-    'gusto',
-    'gusts',
-    'guttering',
-    'gwendolen',
-    'gwr',
-    'gybe',
-    'gymnastics',
-    'h&eacute;lo&iuml;se',
-    'habsburgs',
-    'hacienda',
-    'hacks',
-    'haddock',
-    'hag',
-    'hahnemann',
-    'hailing',
     'hailsham',
-    'haines',
-    'hairdryer',
-    'haired',
-    'hairline',
-    'hairstyle',
-    'haldane',
-    'hallam',
-    'hallmarks',
-    'hallowed',
-    'halloween',
-    'hallucinations',
-    'halton',
-    'halving',
-    'hamas',
-    'hambleton',
     'hamburger',
-    'hamnett',
-    'hampden',
-    'hams',
-    'hamster',
-    'hand-to-hand',
-    'handbags',
-    'handcuffed',
-    'handcuffs',
-    'handfuls',
-    'handkerchiefs',
-    'handler',
-    'handlers',
-    'handley',
-    'handouts',
-    'hands-on',
     'handset',
-    'hangers',
-    'hangings',
-    'hangman',
-    'hanna',
-    'hannele',
-    'hansen',
-    'harare',
-    'harass',
-    'harboured',
-    'harbouring',
-    'harcourt',
-    'hard-hitting',
-    'hardboard',
-    'hardliners',
-    'haringey',
     'harland',
-    'harlem',
-    'harman',
-    'harming',
-    'harmonies',
-    'harmonization',
-    'harnessing',
-    'harpercollins',
-    'harpsichord',
-    'harpy',
-    'harvests',
-    'harwood',
-    'hash',
-    'haslam',
-    'hatches',
-    'hateful',
     'haughty',
-    'haunches',
-    'hav',
-    'havelock',
-    'havens',
-    'haverford',
-    'havvie',
-    'hawes',
-    'hawker',
-    'hawkes',
-    'hawking',
-    'haworth',
-    'hayek',
-    'hayley',
-    'haymarket',
-    'hazlitt',
     'hbv',
-    'hci',
-    'hcl',
-    'hco',
-    'hdtv',
-    'headers',
-    'headington',
-    'headless',
-    'headmen',
-    'headstock',
-    'healer',
-    'health-care',
-    'hearers',
-    'hearse',
-    'heart-shaped',
-    'heartbreak',
     'heartbroken',
-    'heartened',
-    'heartening',
-    'heathen',
-    'heaton',
-    'hebrews',
-    'hedged',
-    'hee',
-    'heeded',
-    'hegelian',
-    'hegemonic',
-    'heifers',
-    'heighten',
-    'heineken',
-    'hela',
-    'hellyer',
     'hemel',
-    'hemispheres',
-    'hemmed',
-    'hemp',
-    'hendrie',
-    'hepburn',
-    'heralds',
-    'herbaceous',
-    'herbivores',
-    'herded',
-    'hereafter',
-    'heredity',
-    'herein',
-    'heretical',
-    'heriot',
-    'hermann',
     'hermes',
-    'hermit',
-    'herod',
-    'herodotus',
-    'heroines',
-    'heroism',
-    'herpes',
-    'hertz',
-    'hesitating',
-    'hesketh',
-    'hester',
-    'heuristic',
-    'hexagonal',
-    'hexham',
-    'hiatus',
-    'hiccup',
     'higgs',
-    'high-class',
-    'high-heeled',
-    'high-profile',
-    'high-technology',
-    'highfield',
-    'highgrove',
-    'highlanders',
-    'hilaire',
-    'hilbert',
-    'hillier',
-    'hilltop',
-    'him/her',
-    'himalayan',
-    'himmler',
-    'hindi',
     'hindley',
-    'hinton',
-    'hiroshima',
-    'histology',
-    'historicism',
-    'hitched',
-    'hiv/aids',
-    'hiya',
-    'hnc',
-    'hnd',
-    'hoarding',
-    'hoards',
-    'hobart',
-    'hobbled',
-    'hodges',
-    'hoe',
     'hogarth',
-    'hoist',
-    'holdall',
-    'holster',
-    'holyfield',
-    'holyhead',
-    'homecoming',
-    'homelands',
-    'homemade',
-    'homeowners',
-    'homing',
-    'honed',
-    'honeysuckle',
-    'hongkong',
-    'honouring',
-    'hons',
     'hoods',
-    'hoof',
-    'hoop',
-    'hoot',
-    'hopefuls',
-    'hornby',
-    'horned',
-    'horowitz',
-    'horsley',
-    'horticulture',
-    'hoskins',
-    'hospitable',
-    'hotelier',
-    'hoteliers',
-    'hounded',
-    'hounslow',
     'householder',
-    'howells',
-    'howls',
-    'hoyle',
-    'hp-ux',
-    'hpv',
-    'hrun',
-    'hs',
-    'hu',
-    'hubble',
-    'huddle',
-    'hues',
-    'hughie',
-    'hugs',
-    'hulk',
-    'hulme',
     'humanistic',
-    'humbly',
-    'humiliate',
-    'hummed',
-    'hummingbird',
-    'humphreys',
-    'humphries',
-    'humps',
-    'hunch',
-    'hungrily',
-    'hurl',
-    'hurtful',
-    'hurtled',
-    'hurtling',
-    'hurworth',
-    'husayn',
     'hussain',
-    'hustle',
-    'hustled',
-    'hutchison',
-    'hvs',
-    'hydro',
-    'hydro-electric',
-    'hydrocarbon',
-    'hydrochloric',
-    'hydroelectric',
-    'hydroxide',
-    'hygienic',
-    'hyperactive',
-    'hyperplasia',
-    'hypersparc',
-    'hypocritical',
     'hypothermia',
-    'hysterically',
-    'hywel',
-    'i\'s',
-    'i/o',
-    'iapx-86',
-    'iba',
-    'ibiza',
-    'ica',
-    'ice-cold',
-    'icelandic',
-    'ico',
-    'iconography',
-    'icrc',
-    'idealised',
-    'idioms',
     'idiopathic',
-    'idiosyncrasies',
-    'igneous',
-    'igor',
-    'iii\'s',
-    'il-6',
-    'ilford',
-    'iliescu',
-    'ilkley',
-    'ill-defined',
-    'ill-informed',
-    'ill-treatment',
-    'illiteracy',
-    'illuminates',
-    'imaginations',
-    'imaginatively',
     'imelda',
-    'imitated',
-    'imitations',
-    'immaculately',
-    'immeasurably',
-    'immovable',
-    'immunisation',
-    'immunoglobulin',
-    'immunological',
-    'immutable',
-    'imp',
-    'impairments',
-    'impaled',
-    'imparted',
-    'impassable',
-    'impeachment',
     'impeccably',
-    'impediment',
-    'impelled',
-    'imperceptible',
-    'imperceptibly',
-    'imperfectly',
-    'imperious',
-    'impertinent',
-    'implanted',
-    'imprecise',
-    'impregnable',
-    'impregnated',
-    'imprinted',
-    'improperly',
-    'impropriety',
-    'improvise',
     'impulsively',
-    'impunity',
-    'impurities',
-    'in-laws',
-    'in-patient',
-    'in_as_much_as',
-    'in_defiance_of',
-    'in_light_of',
-    'inaccuracies',
-    'inaction',
-    'inappropriately',
-    'inasmuch_as',
-    'inaudible',
-    'inbuilt',
-    'inca',
-    'incandescent',
     'incapacitated',
-    'incessantly',
-    'incisors',
-    'incitement',
-    'inciting',
-    'incomparable',
-    'inconsequential',
-    'inconspicuous',
-    'incontinent',
-    'increment',
-    'increments',
-    'incriminating',
-    'incubus',
-    'incurable',
-    'incursions',
-    'indecently',
     'indecisive',
-    'indefensible',
-    'indefinable',
-    'indemnify',
-    'indemnities',
-    'indestructible',
-    'indignity',
-    'indiscriminately',
-    'indisputable',
-    'indistinct',
-    'inducements',
-    'inductive',
-    'indulgent',
-    'inexplicably',
-    'infatuation',
-    'infect',
     'infective',
-    'inferno',
-    'infertile',
-    'infertility',
-    'infestation',
-    'infidelity',
-    'infill',
-    'infiltrate',
-    'infiltrated',
-    'infirm',
-    'inflatable',
-    'informality',
-    'informational',
-    'informationssysteme',
-    'informer',
-    'infringe',
     'ingard',
-    'ingested',
-    'ingleborough',
-    'ingrained',
-    'inhabitant',
-    'inhalation',
-    'inheriting',
-    'inhospitable',
-    'inimical',
-    'initiates',
-    'injurious',
-    'injustices',
-    'inmate',
-    'inmos',
-    'innermost',
-    'innes',
     'innkeeper',
-    'innovators',
-    'innovatory',
-    'inordinate',
-    'inpatient',
-    'input/display',
-    'inscrutable',
-    'insecticides',
-    'insemination',
-    'insensitivity',
-    'inservice',
-    'inshore',
-    'insignificance',
-    'insolent',
-    'insomnia',
-    'inspires',
     'instantaneously',
-    'instigation',
-    'instil',
-    'instilled',
-    'instinctual',
-    'instructional',
-    'insubstantial',
-    'insular',
-    'insulate',
-    'insurmountable',
-    'integrates',
-    'intensifying',
-    'intensional',
-    'intensities',
-    'intents',
-    'inter-governmental',
     'intercom',
-    'interconnected',
-    'interest-free',
-    'interferes',
-    'interlaced',
-    'intermediates',
-    'internationalism',
-    'internationalist',
-    'internet',
-    'interpretive',
-    'interradial',
-    'interrelationships',
-    'interwoven',
-    'intestines',
-    'intimated',
-    'intimidate',
     'intolerant',
-    'intoned',
-    'intoxicated',
-    'intoxicating',
-    'intransigence',
-    'intrepid',
-    'intricacies',
-    'introspection',
-    'intruded',
-    'intruding',
-    'intrusions',
-    'intuitions',
-    'invalidate',
-    'invariable',
-    'invariant',
-    'inventors',
     'inversely',
-    'invertebrate',
-    'investiture',
-    'invests',
-    'invincible',
-    'invisibility',
-    'iodine',
-    'iona',
-    'iran-contra',
-    'irate',
-    'irc',
-    'irena',
-    'irises',
-    'ironical',
-    'ironside',
-    'irradiated',
     'irrationality',
-    'irreconcilable',
-    'irreducible',
-    'irregularity',
-    'irrepressible',
-    'irresistibly',
-    'irreverent',
-    'irritability',
-    'irritant',
-    'irritate',
-    'isaacs',
-    'isbn',
-    'isis',
-    'islamabad',
-    'iso',
-    'isotopes',
     'isotopic',
-    'israelites',
-    'iss',
-    'issuance',
-    'issuer',
-    'issuers',
-    'itch',
-    'itchy',
-    'iteration',
-    'itinerant',
-    'itzhak',
-    'jab',
-    'jabbed',
-    'jacklin',
-    'jacko',
-    'jackpot',
     'jacks',
-    'jacobean',
-    'jacobites',
-    'jacobsen',
-    'jaded',
-    'jaffa',
-    'jahsaxa',
-    'jaime',
-    'jakarta',
-    'jameson',
-    'jamila',
-    'janine',
-    'jarrow',
-    'jaundice',
-    'jaunty',
-    'javed',
     'javier',
-    'jayne',
-    'jealously',
-    'jeanette',
-    'jeeps',
-    'jeered',
-    'jeffery',
-    'jehana',
-    'jensen',
-    'jericho',
-    'jerky',
-    'jessop',
-    'jest',
-    'jester',
-    'jesuits',
-    'jewelled',
     'jewkes',
-    'jiang',
-    'jig',
-    'jihad',
-    'jilly',
-    'jimi',
-    'jingle',
-    'jinkwa',
-    'jm',
-    'jnr',
-    'joiner',
-    'joists',
-    'jolted',
-    'jonah',
-    'jostled',
-    'jourdain',
     'journeyed',
-    'jovial',
-    'joyriders',
-    'joystick',
-    'jp',
-    'jubilant',
-    'judd',
-    'judi',
-    'juggle',
-    'jul',
-    'julio',
-    'jumbled',
-    'jun',
-    'jungles',
-    'juventus',
-    'juxtaposed',
     'kadi',
-    'kafka',
-    'kahn',
-    'kaleidoscope',
-    'kampuchea',
-    'kangaroo',
-    'kaplan',
-    'karabakh',
-    'karachi',
-    'karel',
-    'karim',
-    'katz',
-    'kavanagh',
-    'keats',
-    'keele',
-    'keenan',
     'keener',
-    'keighley',
-    'keller',
-    'kelso',
-    'kelvin',
-    'kenyon',
-    'kepler',
-    'kernaghan',
-    'kersey',
-    'kha-khan',
-    'khartoum',
-    'khasbulatov',
-    'kidd',
-    'kiddies',
-    'kidlington',
-    'kiff',
     'kilburn',
-    'kilns',
-    'kilograms',
-    'kilt',
-    'kimberley',
-    'kindergarten',
-    'kindred',
-    'kinky',
-    'kinnear',
-    'kinsey',
-    'kinsmen',
-    'kirkwall',
-    'km/h',
-    'knackered',
-    'knesset',
-    'knitter',
     'knock-out',
-    'knocker',
-    'knowsley',
-    'knuckle',
-    'kolchinsky',
-    'kop',
-    'kopyion',
-    'koran',
-    'koresh',
-    'kravchuk',
-    'kuala',
-    'kufra',
-    'kuomintang',
-    'kurdistan',
-    'laboriously',
-    'labour-controlled',
     'labour-intensive',
-    'lacan',
-    'laces',
-    'lacklustre',
-    'ladbroke',
-    'ladbrokes',
-    'laddie',
-    'ladyship',
-    'lafferty',
-    'lagging',
-    'lagos',
-    'laibon',
-    'lair',
-    'lakeland',
-    'lama',
-    'lambing',
     'lamely',
-    'lanark',
-    'lanarkshire',
-    'land-based',
-    'land-use',
-    'landforms',
-    'landsat',
-    'langdale',
-    'langer',
-    'langton',
-    'lansdowne',
-    'lanterns',
-    'lao',
-    'lapel',
-    'lapels',
-    'lapped',
     'larceny',
-    'larsen',
-    'larva',
-    'larynx',
-    'lasagne',
-    'lashing',
-    'latency',
-    'laterally',
-    'latex',
-    'latham',
-    'lathe',
-    'latter-day',
-    'laudable',
-    'lauder',
-    'laughable',
-    'laughton',
     'launcher',
-    'launderette',
-    'laurels',
-    'lausanne',
-    'lavished',
-    'law-abiding',
-    'lawler',
-    'lawless',
-    'lawsuit',
-    'layton',
-    'lazarus',
-    'laziness',
-    'lch',
-    'ld',
-    'leaded',
-    'leaden',
     'leaner',
-    'leanings',
-    'leathery',
-    'ledgers',
-    'ledges',
-    'leek',
-    'leeks',
-    'lees',
-    'leese',
-    'leeway',
-    'lefevre',
-    'leftist',
-    'legible',
-    'legions',
-    'legislatures',
-    'legitimation',
     'lehmann',
-    'leinster',
-    'leland',
-    'lemons',
-    'lena',
-    'lendl',
-    'lengthen',
-    'leniency',
-    'lentils',
-    'leonid',
-    'leopards',
-    'lessening',
-    'lessing',
-    'lethargic',
-    'lethargy',
-    'levine',
     'lewisham',
-    'lexicographers',
-    'lexington',
-    'leyton',
-    'libby',
-    'libido',
-    'librarianship',
-    'libretto',
-    'libyans',
-    'licensee',
-    'licensees',
-    'licenses',
-    'lichen',
-    'lichens',
-    'licks',
-    'lieutenant-colonel',
     'lieutenants',
-    'life-long',
-    'life-saving',
-    'life-size',
-    'life-threatening',
-    'lifeboats',
-    'lifetimes',
-    'ligament',
-    'ligand',
-    'ligands',
-    'light-hearted',
-    'light-years',
-    'lightened',
-    'lightest',
-    'like-minded',
-    'lille',
     'limestones',
-    'limoges',
-    'limousin',
-    'limply',
-    'lina',
-    'lineages',
-    'linearly',
-    'linesman',
-    'lingers',
-    'linguistically',
-    'linings',
-    'link-up',
-    'linker',
-    'linlithgow',
-    'lino',
-    'linoleum',
     'linseed',
-    'lintel',
-    'liphook',
-    'liqueur',
-    'liquidated',
-    'lira',
-    'lisabeth',
-    'lithe',
-    'litigants',
-    'little-known',
-    'livid',
-    'llewelyn',
-    'loath',
-    'lobbied',
-    'lobbies',
-    'lobes',
     'locational',
-    'loci',
-    'lodgers',
-    'loftus',
-    'logistical',
-    'loins',
-    'loire',
-    'lomax',
-    'lombardy',
-    'lomond',
-    'loner',
-    'long-lived',
-    'longitude',
-    'longterm',
-    'lonrho',
-    'look-out',
     'look-up',
-    'lookin\'',
-    'looped',
-    'loophole',
-    'loopholes',
-    'looser',
-    'lopez',
-    'lorenz',
-    'lorrimer',
-    'loss-making',
-    'lotta',
-    'loudest',
-    'loudspeakers',
-    'lounges',
-    'lounging',
-    'louth',
     'lovat',
-    'love-making',
-    'lovejoy',
-    'lovemaking',
-    'low-lying',
-    'lowers',
-    'lowestoft',
-    'lowther',
-    'lps',
-    'lsi',
-    'lt.',
-    'lt.-col.',
-    'lubor',
-    'luch',
-    'lucifer',
-    'lucille',
     'ludlow',
-    'luigi',
-    'luk&aacute;cs',
-    'lumbered',
-    'lumbering',
-    'luminal',
-    'lumpur',
-    'lumsden',
-    'lunatics',
-    'lundy',
-    'lunge',
-    'lurching',
-    'lurk',
-    'lurked',
-    'luscious',
-    'lute',
     'lutyens',
-    'luv',
-    'luxor',
-    'lymington',
-    'lyneham',
-    'lytham',
-    'm2',
-    'm3',
-    'm6',
-    'macao',
-    'macari',
-    'machine-gun',
-    'machine-guns',
-    'mack',
-    'macpherson',
-    'macroeconomics',
     'macroscopic',
-    'macs',
-    'madison',
-    'madras',
-    'madrigal',
-    'mae',
-    'maeve',
-    'mag',
-    'magdalene',
-    'magilton',
-    'magnificence',
-    'magnifying',
-    'magnolia',
-    'magnum',
-    'magpie',
-    'magritte',
     'mahler',
-    'mahmud',
-    'mahon',
-    'mai',
-    'mail-order',
-    'mailed',
-    'mainz',
-    'mair',
-    'maison',
-    'mait',
-    'maj.',
-    'majlis',
-    'make-believe',
-    'malabsorption',
-    'malamute',
-    'malay',
     'maliciously',
-    'malignancy',
-    'mallachy',
-    'mallard',
-    'malleable',
-    'mallender',
-    'malton',
-    'manageress',
-    'manchuria',
-    'mandarins',
-    'mandible',
-    'mandibles',
-    'manfred',
-    'manganese',
-    'mangled',
-    'mango',
     'manifests',
-    'manipulations',
-    'manley',
-    'mannerisms',
-    'manometry',
-    'manse',
-    'manx',
-    'maradona',
-    'marauding',
-    'marbled',
-    'marconi',
-    'marek',
-    'margate',
-    'marginalised',
-    'marilla',
-    'mariners',
     'mark-up',
-    'marlene',
-    'marlin',
-    'marmite',
-    'marne',
-    'marriott',
-    'marshalled',
-    'marshalling',
-    'marshy',
-    'mart',
-    'martens',
-    'martinez',
-    'martinho',
-    'martini',
-    'martins',
-    'marty',
     'martyrdom',
-    'marvelled',
-    'marylebone',
-    'mascot',
-    'maskell',
-    'masonic',
-    'masquerade',
-    'masquerading',
-    'mass-produced',
-    'massachusetts-based',
-    'massacred',
-    'massacres',
-    'massaged',
-    'massaging',
-    'massif',
-    'masterful',
     'mastering',
-    'masterly',
-    'materialised',
-    'materialistic',
-    'mathilde',
-    'matsushita',
-    'matted',
-    'mattie',
-    'matting',
-    'matures',
-    'mauritania',
-    'mauritius',
-    'mausoleum',
-    'maximilian',
-    'maximisation',
-    'maximizing',
     'maxims',
-    'maya',
-    'mayne',
-    'mazda',
-    'mazowiecki',
-    'mbe',
-    'mcalpine',
-    'mccabe',
-    'mccall',
-    'mcclair',
-    'mccormack',
-    'mcdonnell',
-    'mcdunn',
-    'mcewan',
-    'mcfarlane',
-    'mcgee',
     'mcgowan',
-    'mcguinness',
-    'mchale',
-    'mci',
-    'mcillvanney',
-    'mckeown',
-    'mclaughlin',
-    'mcloughlin',
-    'mcmanus',
-    'mcnamara',
-    'mcneill',
-    'mcpherson',
-    'mcqueen',
-    'mdc',
-    'meander',
-    'meandering',
     'meaningfully',
-    'mechanistic',
-    'med',
-    'medallion',
-    'meddling',
-    'mediating',
-    'mediators',
-    'medics',
-    'mediocrity',
-    'meditations',
-    'medmelton',
-    'meehan',
-    'megan',
-    'melanoma',
-    'melodramatic',
-    'melons',
     'melton',
-    'melts',
-    'melvyn',
-    'melwas',
-    'memento',
-    'memos',
-    'memphis',
-    'menacingly',
-    'mendez',
-    'menial',
-    'mep',
-    'merchandising',
-    'merchantable',
-    'merciless',
-    'mercilessly',
-    'mercurial',
     'merest',
-    'meridian',
-    'merited',
-    'merson',
-    'mesmerised',
-    'mesopotamia',
-    'mesozoic',
-    'messianic',
-    'metamorphosis',
-    'metaphorically',
-    'metcalfe',
-    'meted',
-    'meteorites',
-    'methanol',
-    'methodically',
-    'methodism',
     'methodists',
-    'methodologies',
-    'mews',
-    'mg/kg',
-    'mg/ml',
-    'michaelmas',
-    'michelangelo',
-    'micro-organisms',
-    'microbes',
-    'microcosm',
-    'microfilm',
-    'microkernel',
-    'microscopes',
-    'mid-1950s',
-    'mid-afternoon',
-    'mid-day',
     'mid-december',
-    'mid-january',
-    'mid-june',
-    'mid-march',
-    'mid-morning',
-    'mid-november',
-    'mid-october',
-    'mid-september',
-    'mid-week',
-    'middleweight',
-    'midge',
-    'midlothian',
-    'midsole',
-    'midwifery',
-    'mightily',
-    'migratory',
     'milanese',
-    'mildew',
-    'milestones',
-    'miletti',
-    'milford',
-    'millennia',
-    'milly',
-    'milner',
-    'milroy',
-    'mimicked',
-    'mimicking',
-    'mimicry',
-    'mimosa',
-    'mina',
-    'minced',
-    'minders',
     'minding',
-    'mineworkers',
-    'mingle',
-    'miniatures',
-    'minimalist',
-    'minimized',
-    'minimizing',
-    'minogue',
-    'mints',
-    'minuscule',
-    'mir',
-    'mir&oacute',
-    'mire',
-    'mirroring',
-    'misbehaviour',
-    'miscarriages',
     'misconception',
-    'misconceptions',
-    'misfortunes',
-    'mishap',
-    'misinterpreted',
-    'misjudged',
-    'misnomer',
-    'misread',
-    'missouri',
-    'mistletoe',
-    'mistresses',
-    'misunderstand',
-    'misused',
-    'mit',
-    'mites',
-    'mitigated',
     'mitigation',
-    'mitochondrial',
-    'mitre',
-    'mnr',
-    'moans',
-    'mobilisation',
-    'mobilise',
-    'mobilised',
-    'mobilized',
-    'mobutu',
-    'mockingly',
-    'modems',
-    'moderates',
-    'modern-day',
-    'modernise',
-    'modi',
     'modulation',
-    'moffat',
-    'moldavia',
-    'moma',
-    'monaghan',
-    'monetarist',
-    'monetarists',
-    'monklands',
-    'monmouth',
-    'monographs',
-    'mononuclear',
-    'monopolist',
-    'monopolistic',
-    'monsignor',
-    'montagne',
-    'montana',
     'montfort',
-    'montgomerie',
-    'mooney',
-    'moonlit',
-    'moores',
-    'mooring',
-    'moorings',
-    'moose',
-    'moot',
-    'mopped',
-    'mopping',
-    'mor',
-    'morag',
-    'morecambe',
-    'mores',
-    'moribund',
     'morose',
-    'morsel',
-    'mortars',
-    'mosques',
-    'mosses',
-    'mot',
-    'mothering',
-    'motivates',
-    'motivational',
-    'motorbikes',
-    'mott',
-    'mouldings',
-    'mouldy',
-    'mountainside',
-    'mourn',
-    'mourned',
     'mournful',
-    'mouthed',
-    'movable',
-    'movers',
-    'mowing',
-    'mp/con',
-    'mpg',
-    'mprp',
-    'mri',
-    'mrp',
-    'ms.',
-    'mss',
-    'mucky',
-    'mucous',
-    'mugabe',
-    'mugged',
     'muldoon',
-    'muller',
-    'mulroney',
-    'multi-coloured',
-    'multi-disciplinary',
-    'multi-media',
-    'multi-user',
-    'multiprocessor',
-    'mumbling',
-    'munch',
-    'munching',
-    'munster',
-    'murmurs',
-    'muscled',
-    'muses',
-    'musgrave',
     'music-hall',
-    'musicals',
-    'musselburgh',
-    'mutated',
-    'mutilation',
-    'mv',
-    'mvs',
-    'myc',
-    'mythic',
-    'mythological',
-    'n-oct',
-    'n.b.',
-    'n1',
-    'nab',
-    'nacab',
-    'nacional',
     'nadir',
-    'nadirpur',
-    'naff',
-    'nag',
-    'nagorny',
-    'nairn',
-    'naivety',
-    'namesake',
-    'namibian',
-    'napkins',
-    'narration',
-    'narrowness',
-    'narrows',
-    'nascent',
-    'natalia',
-    'nathaniel',
     'nationale',
-    'nationalistic',
-    'nativity',
-    'naturalism',
-    'natures',
-    'navel',
-    'navigational',
-    'nazarean',
-    'nazareth',
-    'nazism',
-    'nb',
-    'nearness',
-    'necklaces',
-    'neckline',
-    'necrosis',
-    'nee',
     'negate',
-    'negligently',
-    'nehru',
-    'nelly',
-    'nep',
-    'nephews',
-    'nero',
-    'nested',
-    'nestle',
-    'nestled',
-    'netball',
-    'nettle',
-    'neumann',
-    'neurones',
-    'neuropathy',
-    'neutrinos',
     'neutrophils',
-    'nevada',
-    'never-ending',
-    'new-born',
-    'newall',
-    'newby',
-    'newell',
-    'newgate',
-    'newington',
-    'newsprint',
-    'newsroom',
-    'newtonian',
-    'next-door',
-    'nextstep',
-    'nexus',
-    'nfu',
     'ng',
-    'nibbled',
-    'nibbling',
-    'niceties',
-    'nichol',
-    'nicklaus',
-    'nicknames',
-    'nicosia',
-    'nicra',
-    'niger',
-    'niggling',
-    'nightclubs',
-    'nightlife',
-    'nikkei',
-    'nikos',
-    'nilsson',
     'nimble',
-    'nine-year-old',
-    'ninian',
-    'niro',
-    'nitric',
-    'nld',
-    'nmda',
-    'nmr',
-    'nn',
-    'no-nonsense',
-    'nobleman',
-    'noblemen',
-    'nodules',
-    'nogai',
-    'nomads',
-    'nomic',
     'non-',
-    'non-communist',
-    'non-compliance',
-    'non-human',
-    'non-league',
-    'non-linear',
-    'non-members',
-    'non-party',
-    'non-political',
-    'non-proliferation',
-    'non-resident',
-    'non-smokers',
-    'non-statutory',
-    'non-stick',
-    'non-traditional',
-    'non-violent',
     'nona',
-    'nonchalantly',
-    'nonconformity',
-    'nonsensical',
-    'noodles',
-    'noose',
-    'normalisation',
-    'normalization',
-    'norse',
-    'northgate',
-    'northwich',
-    'norwegians',
-    'norwood',
-    'notables',
-    'notepad',
-    'notepaper',
     'nothingness',
-    'notting',
-    'nourish',
-    'nourished',
-    'nourishing',
-    'nouveau',
-    'nowak',
-    'np',
-    'npfl',
-    'npv',
-    'nspcc',
-    'nuance',
-    'nucleation',
-    'nudes',
-    'nudging',
-    'numbness',
     'numeracy',
-    'nupe',
-    'nv',
-    'nvqs',
-    'ny',
-    'nz',
-    'o\'connell',
-    'o\'reilly',
-    'o\'rourke',
-    'o\'sullivan',
-    'oars',
-    'oates',
-    'ob',
-    'oban',
-    'objecting',
-    'obligingly',
     'oblong',
-    'oboe',
-    'obscures',
-    'obscuring',
-    'obsessions',
-    'obstructed',
-    'obviate',
-    'ochre',
-    'oct-1',
-    'octamer',
-    'octreotide',
-    'odd-knut',
-    'ode',
-    'odeon',
-    'odyssey',
-    'oedema',
     'oems',
-    'oestrogen',
-    'off-duty',
-    'off-licence',
-    'offhand',
-    'officialdom',
-    'offshoot',
-    'oglethorpe',
-    'ointment',
-    'olazabal',
-    'old-age',
-    'oligarchy',
-    'olsen',
-    'olson',
-    'omagh',
-    'omega',
     'omelette',
-    'omitting',
-    'omnibus',
-    'on-board',
-    'on-screen',
-    'oncoming',
-    'one-dimensional',
-    'one-half',
-    'onstage',
-    'ooze',
-    'open-mouthed',
-    'operand',
-    'opportunism',
-    'opportunist',
-    'opportunistic',
-    'oppositions',
     'opt-out',
-    'optics',
-    'optimised',
-    'opulent',
-    'opus',
-    'orator',
-    'oratory',
-    'orb',
-    'orbiting',
-    'ordinance',
-    'ordovician',
-    'ores',
-    'organically',
-    'ormesby',
-    'ormond',
-    'ornamented',
     'orphaned',
-    'ortega',
-    'osaka',
-    'oscars',
-    'oscillations',
-    'osiris',
-    'ossetia',
-    'ossie',
-    'ostentatious',
-    'osteoporosis',
-    'otago',
-    'otc',
-    'otis',
-    'ouch',
-    'ould',
-    'ouse',
     'oust',
-    'out-of-date',
-    'out_of_touch_with',
-    'outboard',
-    'outbound',
-    'outbuildings',
-    'outcast',
-    'outcrops',
-    'outgoings',
-    'outgrown',
-    'outlandish',
-    'outlaws',
-    'outmoded',
-    'outnumber',
-    'outpost',
-    'outreach',
     'outstandingly',
-    'outstripped',
-    'overbearing',
-    'overcast',
-    'overcomes',
-    'overdo',
-    'overestimate',
-    'overgrowth',
-    'overhang',
-    'overhauled',
-    'overheating',
-    'overjoyed',
-    'overland',
-    'overlapped',
-    'overlay',
-    'overlord',
     'overlying',
-    'overpowered',
-    'overridden',
-    'overseen',
-    'overstated',
-    'overturning',
-    'ovulation',
-    'owner-occupiers',
-    'oxbridge',
-    'oxon',
-    'oy',
-    'p&amp;l',
-    'p.a.',
-    'p.c',
-    'p.s.',
-    'p5',
     'p53',
-    'pablo',
-    'pacifism',
-    'pacifists',
-    'packard',
-    'packer',
-    'pacts',
-    'padlock',
-    'padre',
-    'paediatric',
-    'pagemaker',
-    'paine',
-    'painkillers',
-    'painless',
-    'paintwork',
-    'pakistanis',
     'paled',
-    'palermo',
-    'pallets',
-    'pallid',
-    'pallister',
-    'pallor',
-    'palma',
-    'palsy',
-    'paltry',
-    'pampered',
-    'panacea',
-    'panache',
-    'panasonic',
-    'pancake',
-    'pancakes',
-    'pandora',
     'panicking',
-    'panted',
-    'pantheon',
-    'panther',
-    'panto',
-    'paolo',
-    'pap',
-    'paperbacks',
-    'par_excellence',
-    'parables',
-    'paradoxes',
-    'paragon',
-    'paraguay',
-    'paramilitaries',
-    'paras',
-    'parc',
     'parched',
-    'pardoned',
-    'parentage',
-    'pareto',
-    'pargeter',
-    'parkes',
-    'parrots',
-    'parrott',
-    'parsing',
-    'part-timers',
-    'participative',
-    'partitioned',
-    'partitions',
-    'parvis',
-    'passable',
-    'passer-by',
     'passover',
-    'pasted',
-    'pastiche',
-    'pastimes',
-    'paternalism',
-    'paternalistic',
-    'pathetically',
-    'pathfinder',
-    'pathogenic',
-    'pathogens',
-    'pathos',
-    'patriarchy',
-    'patrimony',
-    'patriots',
-    'patrolled',
-    'patronizing',
     'patter',
-    'paucity',
-    'pauper',
-    'paupers',
-    'pave',
-    'pavel',
-    'pavilions',
-    'pavlov',
-    'pawns',
-    'paxton',
-    'payer',
-    'payton',
-    'pcbs',
-    'pcc',
-    'pcf',
-    'pcp',
     'pds',
-    'peace-keeping',
-    'peaches',
-    'peake',
-    'pearly',
-    'peaty',
-    'peavey',
-    'peculiarity',
-    'pedagogic',
-    'pedagogical',
-    'peebles',
-    'peek',
-    'peeped',
-    'pelican',
-    'pemberton',
-    'pembrokeshire',
     'pencilled',
-    'penda',
-    'penetrates',
-    'penge',
-    'penguins',
-    'penned',
-    'penrose',
-    'pent-up',
-    'pentagonal',
-    'pentecost',
-    'penthouse',
-    'pentland',
-    'pepe',
-    'peppercorns',
-    'peps',
-    'pepsi',
     'pepsin',
-    'percutaneous',
-    'perennials',
-    'peres',
-    'perez',
-    'perfectionist',
-    'perforated',
-    'perfumed',
-    'perfumes',
-    'perfunctory',
-    'pericles',
-    'perilously',
-    'perinatal',
-    'perishable',
-    'perk',
-    'perkin',
     'permeated',
-    'permed',
-    'permissiveness',
-    'permutations',
-    'perpetrator',
-    'perpetrators',
-    'perpetuated',
-    'perrier',
-    'pers',
-    'persisting',
-    'personified',
-    'perspex',
-    'persuasions',
-    'pert',
-    'pertaining_to',
-    'perthshire',
     'pervaded',
-    'perversely',
-    'perversion',
-    'pervert',
-    'perverted',
-    'petal',
-    'petered',
-    'petion',
-    'petit',
-    'petitioning',
-    'petrochemical',
-    'petticoat',
-    'petulant',
-    'pfa',
-    'pfk',
-    'pge',
     'phallic',
-    'pharaoh',
-    'pharisees',
-    'pharmacist',
-    'pheasants',
-    'phelps',
-    'phenomenological',
-    'pheromones',
-    'phew',
-    'philanthropic',
-    'philanthropy',
-    'philosophically',
-    'philpott',
-    'phipps',
-    'phobia',
-    'phonemic',
     'phosphatase',
-    'phosphates',
-    'photocopied',
-    'photocopier',
-    'photocopies',
-    'photocopying',
-    'photographing',
-    'photons',
-    'phrased',
-    'physio',
-    'pickerage',
-    'pickings',
-    'pickled',
-    'pickwick',
-    'picnics',
-    'picts',
     'pilate',
-    'pilger',
-    'pinching',
-    'pinks',
-    'pinot',
-    'pipelines',
-    'pipette',
-    'pipework',
-    'pipkin',
-    'pitman',
-    'pittance',
-    'pkk',
-    'pl',
-    'pla',
-    'placards',
-    'placate',
     'placings',
-    'plaid',
-    'plaintive',
-    'plait',
-    'plankton',
-    'plantagenet',
-    'planters',
-    'plasticine',
-    'plated',
-    'plating',
-    'platonic',
-    'platter',
-    'play-offs',
-    'playfully',
-    'plc-',
-    'pleadings',
     'pleat',
-    'pledging',
-    'plenary',
-    'plessey',
-    'plodding',
-    'plotters',
-    'ploughman',
-    'ploughs',
-    'plover',
-    'plucking',
-    'plugging',
-    'plumb',
-    'plunder',
-    'plundered',
-    'pluralistic',
-    'pluralists',
     'pluto',
-    'ply',
-    'pmol/l',
-    'pneumatic',
-    'pocketed',
-    'podium',
-    'pods',
-    'poindexter',
-    'poitiers',
-    'polaris',
-    'polarised',
-    'polarity',
-    'polarized',
-    'polemic',
-    'polemical',
-    'politic',
     'polity',
-    'pollard',
-    'pollsters',
-    'pollute',
-    'polluters',
-    'polygon',
-    'polygons',
-    'polypropylene',
-    'polyunsaturated',
-    'polyurethane',
-    'pomerania',
-    'pomp',
-    'pompeii',
-    'pompey',
-    'pompidou',
-    'ponderous',
     'pontefract',
-    'pontypool',
-    'poodle',
-    'poplar',
-    'popper',
-    'populous',
-    'porpoise',
-    'portability',
-    'portals',
-    'portia',
-    'porting',
-    'portraying',
-    'portrays',
-    'posidonius',
-    'posse',
-    'possessor',
     'post-graduate',
-    'post-industrial',
-    'post-operative',
-    'postcode',
-    'posthumous',
-    'postmodernist',
-    'postoperative',
-    'postponing',
-    'postprandial',
-    'postsynaptic',
-    'postures',
-    'potentialities',
-    'potters',
-    'potting',
-    'potts',
-    'pours',
     'pout',
-    'pouting',
-    'power-sharing',
-    'powergen',
-    'powerhouse',
-    'ppm',
-    'practises',
-    'pragmatist',
-    'prairie',
-    'prat',
-    'pravda',
-    'praxis',
-    'pre-election',
-    'pre-eminence',
-    'pre-empt',
-    'pre-industrial',
     'pre-season',
-    'precepts',
-    'precipitating',
-    'precipitous',
-    'precludes',
-    'precocious',
-    'preconceived',
-    'preconditions',
-    'predicated',
-    'predicates',
-    'predictor',
-    'predisposition',
-    'prednisolone',
-    'predominated',
-    'prefix',
-    'preheat',
     'prelates',
-    'premiers',
-    'prep',
-    'preparedness',
-    'prerequisites',
-    'prerogatives',
-    'pres',
-    'presbyterians',
-    'presbytery',
-    'presentable',
-    'presenters',
-    'preset',
-    'preside',
-    'pressured',
-    'prestwick',
-    'presuppose',
     'pretences',
-    'pretender',
-    'pretoria',
-    'pretreatment',
-    'prettier',
-    'prettiest',
-    'pri',
-    'prided',
-    'prides',
-    'priestly',
-    'prim',
-    'priming',
-    'primordial',
-    'primroses',
-    'princesse',
-    'princesses',
     'princeton',
-    'printout',
-    'prioress',
-    'prise',
-    'prised',
-    'privatising',
-    'privatized',
-    'probabilistic',
-    'problematical',
-    'proclaims',
-    'procured',
-    'procuring',
-    'prod',
-    'prodding',
-    'prodigal',
-    'prodigy',
     'profess',
-    'proficient',
-    'profited',
-    'profusely',
-    'progeny',
-    'prohibits',
-    'proliferate',
-    'proliferative',
-    'prolonging',
-    'prom',
-    'promiscuity',
-    'promiscuous',
-    'pronouncement',
-    'propagate',
-    'propel',
-    'propellers',
     'prophecies',
-    'proportioned',
-    'propping',
-    'propulsion',
-    'proscribed',
-    'prosser',
-    'prostacyclin',
-    'protectorate',
-    'protestations',
-    'proverb',
-    'provident',
-    'provokes',
-    'prowling',
-    'prs',
-    'prudhoe',
-    'pruned',
     'psd',
-    'psoe',
-    'psychosomatic',
-    'psychotherapy',
-    'pta',
-    'pubic',
-    'publican',
-    'puffs',
-    'puffy',
-    'pulsating',
-    'pulsed',
-    'pulsing',
-    'pumpkin',
-    'punchcard',
-    'punctured',
-    'punishable',
     'punks',
-    'punter',
-    'puny',
-    'pur&eacute;e',
-    'purgatory',
-    'purged',
-    'purists',
-    'puritans',
-    'purporting',
-    'purposely',
-    'purring',
-    'pursuer',
-    'pursuers',
-    'pursues',
-    'pus',
-    'pushkin',
     'pushy',
-    'putts',
-    'putty',
-    'pw',
-    'pylons',
-    'pythagoras',
-    'pyy',
-    'q.c',
-    'q.t.',
-    'qatar',
-    'qq.v',
-    'qua',
-    'quad',
-    'quadrant',
-    'quadruple',
-    'quail',
     'quake',
-    'qualifiers',
-    'quangos',
-    'quantifiable',
-    'quantitatively',
-    'quarks',
-    'quarrelling',
-    'quarrying',
-    'quartets',
-    'quash',
-    'quaternary',
-    'quattro',
-    'quayle',
-    'que',
-    'questioner',
-    'queued',
     'queueing',
-    'quickening',
-    'quiescent',
-    'quilted',
-    'quine',
-    'quintet',
-    'quipped',
-    'quirky',
-    'quiss',
-    'quits',
-    'quizzed',
-    'quizzical',
-    'quizzically',
-    'r1',
-    'r2',
-    'r4000',
     'racers',
-    'racially',
-    'rackets',
-    'radiance',
-    'radiate',
-    'radiated',
-    'rafael',
-    'rafaelo',
-    'raffles',
-    'rafts',
-    'rages',
-    'raider',
-    'railing',
-    'railroad',
-    'raine',
-    'raj',
     'rajiv',
-    'ramble',
-    'ramos',
-    'rampage',
-    'rampart',
-    'rams',
-    'ramsden',
-    'rand',
-    'rangoon',
-    'ranitidine',
-    'rank-and-file',
-    'ransacked',
-    'rao',
-    'rapes',
-    'rapidity',
-    'rapids',
     'rapprochement',
-    'rapt',
-    'rapture',
-    'rarest',
-    'rashid',
-    'raspberries',
-    'rasping',
-    'ratcliffe',
-    'rateable',
-    'rathbone',
-    'rationalise',
-    'rationalist',
-    'rationalize',
-    'rationed',
-    'ravel',
-    'ravenna',
     'ravine',
-    'ravishing',
-    'rawls',
-    'raybestos',
-    'raynor',
-    'rb',
-    'rbge',
-    're-enter',
-    're-examine',
-    're-open',
-    're-opened',
-    're-run',
-    're-use',
-    'reactivity',
-    'reagents',
-    'realists',
     'realizations',
-    'reaped',
-    'reaping',
-    'reappearance',
-    'rearranging',
-    'reassert',
-    'reasserted',
-    'reassess',
-    'rebelled',
-    'reborn',
-    'rebuffed',
-    'receptions',
-    'recessed',
-    'recessions',
-    'recharge',
-    'recitals',
     'reciting',
-    'reclining',
-    'recluse',
-    'recogniser',
-    'recoil',
-    'recoiled',
-    'recollect',
-    'recompense',
-    'reconsideration',
-    'reconsidered',
-    'reconstructions',
-    'record-breaking',
-    'recount',
-    'recounting',
-    'recounts',
-    'recovers',
     'recreated',
-    'recreating',
-    'recriminations',
-    'rectangles',
-    'red-faced',
-    'reddened',
-    'redeemable',
-    'redefine',
-    'redesign',
-    'redesigned',
-    'redgrave',
-    'redistributive',
-    'redness',
-    'reeled',
-    'reels',
-    'refectory',
     'refereeing',
-    'referents',
-    'refilled',
-    'refineries',
-    'reflector',
-    'refreshingly',
-    'refrigerators',
-    'refs',
-    'refuelling',
-    'refuted',
-    'regenerate',
-    'regimen',
-    'regina',
-    'regionally',
-    'registrars',
-    'regress',
     'regretfully',
-    'regulates',
-    'reimbursed',
-    'reims',
-    'reincarnation',
-    'reinstate',
-    'reinsurance',
-    'reintroduce',
-    'reintroduction',
-    'reissue',
-    'rejoiced',
-    'relativism',
-    'relaxations',
-    'relented',
-    'relishing',
-    'remarking',
     'remarriage',
-    'remarried',
-    'reminiscence',
-    'remittance',
-    'rendition',
-    'rene',
-    'renegade',
-    'renfrew',
-    'renoir',
-    'rentals',
-    'reorganise',
-    'reorganised',
-    'reorganized',
-    'reparations',
-    'repelled',
-    'repellent',
     'repent',
-    'replenish',
-    'replicas',
-    'replicated',
-    'repossessions',
-    'representational',
-    'repress',
-    'reprimand',
-    'reprimanded',
-    'reprint',
-    'reproduces',
-    'reptile',
-    'repudiate',
-    'repudiation',
-    'repugnant',
-    'repulsive',
     'rescinded',
-    'rescuers',
-    'rescues',
-    'reshaping',
-    'residency',
-    'residing',
-    'residuals',
-    'resins',
-    'resistor',
-    'resists',
-    'resolves',
-    'respiration',
-    'resplendent',
-    'responsibly',
-    'restful',
-    'restorative',
     'resumes',
-    'resuming',
-    'retainer',
-    'retaliate',
-    'retd',
-    'rethinking',
-    'reticence',
-    'retinal',
-    'retrace',
-    'retraced',
-    'retracted',
-    'retrial',
-    'revamped',
-    'revelled',
-    'revellers',
-    'revelling',
     'reverting',
-    'revisionist',
-    'revisited',
-    'revoke',
-    'revolts',
-    'revolve',
-    'revolved',
-    'revue',
-    'rewriting',
-    'reynard',
-    'rfu',
-    'rha',
-    'rhee',
-    'rheumatism',
-    'rheumatoid',
-    'rhinoceros',
     'rhinos',
-    'rhubarb',
-    'rhyl',
-    'rhyming',
-    'rhys',
-    'ribbed',
-    'richmondshire',
-    'rickie',
-    'riga',
-    'rigby',
-    'rightness',
-    'riotous',
-    'ripen',
-    'ripening',
-    'ripper',
-    'risc-based',
     'risk-free',
-    'risley',
-    'rivera',
-    'riverbank',
-    'riveting',
-    'rm',
-    'rn',
-    'rnli',
-    'roars',
-    'roberta',
-    'rocard',
-    'rockers',
-    'rocketed',
-    'rococo',
-    'rodent',
-    'rodgers',
     'roebuck',
-    'rogues',
-    'roma',
-    'romances',
-    'romany',
-    'romford',
-    'romp',
-    'ronaldsay',
-    'rooftops',
-    'rook',
-    'rooks',
-    'roomy',
-    'rooney',
-    'rootstock',
-    'roped',
-    'roper',
     'rosenberg',
-    'rosette',
-    'rosettes',
-    'rosheen',
-    'rossi',
-    'rotational',
-    'rothmans',
-    'rotors',
-    'rotted',
-    'rottweilers',
-    'roundly',
-    'router',
-    'routing',
-    'roving',
-    'rowdy',
-    'rowlands',
     'rozanov',
-    'rpi',
-    'rpr',
-    'rr',
-    'rs/6000s',
-    'ru',
-    'rubens',
-    'rubs',
-    'ruck',
-    'rudd',
-    'rudely',
-    'rudeness',
-    'ruff',
-    'ruhr',
-    'ruinous',
-    'rulebook',
     'rulings',
-    'rumbelows',
-    'rummaged',
-    'rumpled',
-    'run-time',
-    'rundown',
-    'runny',
-    'ruptured',
-    'ruse',
-    'russ',
-    'rusted',
-    'rusting',
-    'rut',
-    'ruthlessness',
-    'ruthven',
-    'rutter',
     'rwanda',
-    'rya',
-    'ryker',
-    'ryzhkov',
-    's.l.t.',
-    's.tdy',
-    's/he',
-    's2',
-    's3',
-    'saab',
-    'sabatini',
-    'sabha',
-    'sabre',
-    'sacraments',
-    'sadat',
-    'saddles',
     'safeguarded',
-    'safrane',
-    'saintly',
-    'salah',
-    'salami',
-    'salinity',
-    'salmond',
-    'salome',
-    'salomon',
-    'saloons',
-    'saltburn',
-    'salvadorean',
-    'samaritan',
-    'samaritans',
-    'samoa',
-    'sampras',
     'samsung',
-    'sanctuaries',
-    'sandinistas',
-    'sandstones',
-    'sandwiched',
-    'sandys',
-    'sanguine',
-    'sans',
-    'sanskrit',
-    'santerre',
-    'santo',
-    'sapt',
-    'saracens',
-    'sarawak',
-    'sardonically',
-    'sargent',
     'satisfactions',
-    'saturn',
-    'saucepans',
-    'saucy',
-    'sauntered',
-    'saussure',
-    'savaged',
-    'savages',
-    'savannah',
-    'save_that',
-    'saver',
-    'savile',
-    'saville',
-    'savoured',
-    'savouring',
-    'sawing',
     'sawn',
-    'saws',
-    'sawyer',
-    'sax',
-    'sayings',
-    'scala',
-    'scalable',
-    'scalpel',
-    'scamp',
-    'scampered',
-    'scanners',
-    'scanty',
-    'sceptic',
-    'schemata',
-    'scheming',
-    'schiller',
     'schism',
-    'schneider',
-    'schoenberg',
-    'scholastic',
-    'schooldays',
-    'schooled',
-    'schoolgirls',
-    'schoolroom',
-    'schramm',
-    'schumann',
-    'schweppes',
-    'sclerotherapy',
-    'scoffed',
-    'scolded',
-    'scooping',
-    'scorching',
     'scoreline',
-    'scorned',
-    'scorpio',
-    'scorpion',
-    'scotia',
-    'scouting',
-    'scowl',
-    'scowling',
-    'scrabble',
-    'scrabbled',
-    'scrabbling',
-    'scrapes',
-    'scrappy',
-    'scrawled',
-    'screeched',
-    'screeching',
     'scribble',
-    'scribbling',
-    'scribes',
-    'scrolls',
-    'scruples',
-    'scrupulously',
-    'scrutinized',
-    'scuba',
-    'scud',
-    'scuffle',
-    'scunthorpe',
-    'se&ntilde;or',
-    'se&ntilde;orita',
-    'sea-level',
-    'seabed',
-    'seagulls',
     'sealink',
-    'seamus',
-    'searcher',
-    'sears',
-    'seaward',
-    'sec.',
-    'second-rate',
-    'secretions',
-    'sectoral',
-    'securitate',
-    'sed',
-    'sedate',
-    'sedation',
-    'sedition',
-    'seedy',
-    'seep',
     'seeped',
-    'sega',
-    'segmental',
-    'segmented',
-    'sekers',
-    'seles',
-    'self-awareness',
-    'self-centred',
-    'self-confident',
-    'self-discipline',
-    'self-evaluation',
-    'self-expression',
-    'self-imposed',
-    'self-indulgent',
-    'self-made',
-    'self-portrait',
     'self-proclaimed',
-    'self-regulation',
-    'self-service',
-    'self-styled',
-    'selfless',
-    'selhurst',
-    'sema',
-    'semi-circular',
-    'semi-skilled',
-    'sendei',
-    'sendero',
-    'seneschal',
-    'sensitively',
-    'sensitivities',
-    'sentries',
-    'separable',
     'separations',
-    'separatism',
-    'sequenced',
-    'sequentially',
-    'sequoia',
-    'serfdom',
-    'sergeant-major',
-    'serials',
-    'serotonin',
-    'serpentine',
-    'serrano',
-    'serviceable',
-    'sesame',
-    'set-aside',
-    'seton',
-    'seventy-two',
     'sever',
-    'severing',
-    'sewell',
-    'seychelles',
-    'sgt.',
-    'shack',
-    'shadowing',
-    'shadwell',
-    'shae',
-    'shag',
-    'shales',
-    'shallower',
-    'shallows',
-    'shalt',
-    'shamed',
-    'shamen',
     'shankill',
-    'shanks',
-    'shanti',
-    'shanty',
-    'shapeless',
-    'shards',
-    'sharpest',
-    'shatter',
-    'sheaf',
-    'shearing',
-    'shears',
-    'sheepishly',
-    'sheepskin',
-    'sheikha',
-    'shekhar',
-    'shelled',
     'sheraton',
-    'sheringham',
-    'shetlanders',
-    'shied',
-    'shifty',
-    'shih',
-    'shilton',
-    'shimmered',
-    'shipman',
-    'shipyards',
-    'shires',
-    'shite',
-    'shivers',
-    'shod',
-    'shoemaker',
-    'shoot-out',
     'shootings',
-    'shopper',
-    'shorn',
-    'short-sighted',
-    'shorthorn',
-    'shortlist',
-    'shostakovich',
-    'shouldered',
-    'showbusiness',
-    'showpiece',
-    'showrooms',
-    'shred',
-    'shrewdly',
-    'shrieks',
-    'shrinkage',
-    'shrinks',
     'shrivelled',
-    'shrugs',
-    'shunned',
-    'shunt',
-    'shutdown',
-    'shuts',
-    'shutter',
-    'sickened',
-    'sidelined',
-    'siding',
-    'siegfried',
-    'siena',
-    'sift',
-    'sifted',
-    'sifting',
-    'sightings',
     'sigmar',
-    'signe',
-    'signet',
-    'signification',
-    'signifier',
-    'signora',
-    'signorina',
-    'signpost',
-    'signposts',
-    'sikes',
-    'sikhs',
-    'silage',
-    'silhouetted',
-    'silurian',
-    'sim',
-    'simmel',
     'simmonds',
-    'simplifying',
-    'simulator',
-    'sinai',
-    'single-handed',
-    'single-sex',
-    'singleton',
-    'singularities',
-    'sinusoidal',
-    'siobhan',
-    'sire',
-    'sirith',
-    'sitter',
-    'sittings',
-    'situational',
-    'sixty-four',
     'sizzling',
-    'skate',
-    'skates',
-    'sketchy',
-    'skewed',
-    'skid',
-    'skim',
-    'skinheads',
-    'skinnergate',
-    'skips',
-    'skirmish',
-    'skirmishes',
-    'skirted',
-    'skylight',
-    'sl',
-    'sla',
     'slacks',
-    'slams',
-    'slander',
-    'slanted',
-    'slanting',
-    'slashing',
-    'slaven',
-    'slavonic',
-    'slavs',
-    'sleepily',
-    'sleet',
-    'sligo',
-    'slipper',
-    'slithered',
-    'slithering',
-    'sliver',
     'slog',
-    'slorc',
-    'slow-moving',
-    'slumber',
-    'slur',
-    'slurred',
-    'slut',
-    'slyly',
-    'smacking',
-    'smacks',
-    'smallholders',
-    'smallholding',
-    'smarter',
-    'smears',
-    'smelting',
-    'smirk',
     'smithy',
-    'smock',
-    'smolensk',
-    'smother',
-    'smudge',
-    'smugly',
-    'snags',
-    'snappy',
-    'snapshots',
-    'snare',
-    'snarl',
-    'snatches',
-    'sneaking',
-    'sneering',
-    'sneeze',
-    'snipe',
     'sniper',
-    'snippets',
-    'snob',
-    'snobbery',
-    'snodgrass',
-    'snore',
-    'snorting',
-    'snowball',
-    'snowdrops',
-    'snowing',
-    'snows',
-    'snugly',
-    'so-and-so',
-    'soames',
-    'sobering',
-    'soberly',
     'sociability',
-    'socio-political',
-    'sociolinguistic',
-    'sojourn',
-    'solarium',
-    'solder',
-    'solent',
-    'soliciting',
-    'soloists',
-    'solubility',
-    'solute',
-    'solves',
-    'something_like',
-    'somme',
-    'sonatas',
-    'songwriter',
     'soothingly',
-    'sophy',
-    'sorcery',
-    'sorrel',
-    'sorrows',
-    'sortie',
-    'sorties',
-    'sos',
-    'souffl&eacute',
-    'sought-after',
-    'soundness',
-    'soups',
-    'soured',
-    'southerly',
-    'southward',
-    'sovereigns',
     'soweto',
-    'sows',
-    'soy',
-    'soya',
-    'spalding',
-    'spaniel',
-    'sparcstations',
-    'sparring',
-    'sparrows',
-    'spartak',
-    'spartans',
-    'spasms',
-    'spatially',
-    'spearhead',
-    'spearheaded',
-    'spec',
     'specialisms',
-    'specializing',
-    'specialties',
-    'speck',
-    'specs',
-    'speedway',
-    'speke',
-    'spellbound',
-    'spender',
-    'spicer',
-    'spied',
-    'spielberg',
-    'spillage',
-    'spindle',
-    'spirals',
-    'spiro',
     'spiteful',
-    'spits',
-    'splashes',
-    'splayed',
-    'splintered',
-    'splinters',
-    'spluttering',
-    'sponges',
-    'spooky',
-    'spoonful',
-    'spotless',
-    'spotlights',
-    'spotty',
-    'spout',
-    'sprawl',
-    'springboks',
     'springsteen',
-    'springtime',
-    'springy',
-    'sprinkler',
-    'sprinted',
-    'sprinting',
-    'spurned',
-    'spurt',
-    'squabbling',
-    'squandered',
-    'squeaked',
-    'squeaky',
-    'squeal',
-    'squealed',
-    'squealing',
-    'squint',
     'squinting',
-    'squirmed',
-    'squirt',
-    'sse',
-    'ssrs',
-    'sta',
-    'stabilisation',
-    'stabilised',
-    'stabilising',
-    'staccato',
-    'stags',
-    'stairwell',
-    'staked',
-    'stalling',
-    'stalwarts',
-    'stances',
     'stand-up',
-    'standardization',
-    'stanhope',
-    'stank',
-    'stanton',
-    'stanza',
-    'stardom',
-    'starfish',
-    'starlings',
-    'starr',
-    'startlingly',
-    'stasi',
-    'stasis',
-    'state-run',
-    'statisticians',
-    'status.',
     'stavanger',
-    'stavrogin',
-    'stc',
-    'steadying',
-    'steals',
-    'steamy',
-    'steeple',
-    'steers',
-    'stellar',
-    'stenosis',
-    'stent',
-    'stepney',
-    'stereotypical',
-    'stereotyping',
-    'sterilisation',
-    'sterne',
     'stiffen',
-    'stiffer',
-    'stilled',
-    'stills',
-    'stilted',
-    'stimulant',
-    'stings',
-    'stinks',
-    'stipulate',
-    'stirs',
-    'stok',
-    'stoke-on-trent',
-    'stokesley',
-    'stonehenge',
-    'stonehouse',
-    'stooping',
     'storyline',
-    'stowe',
-    'stowed',
-    'stowey',
-    'straggling',
-    'straightaway',
-    'strangeways',
-    'strangle',
-    'stranglehold',
-    'strapping',
-    'strategists',
-    'stratigraphical',
-    'stratospheric',
-    'straws',
-    'straying',
-    'streamers',
     'strenuously',
-    'strictest',
-    'stringer',
-    'strongholds',
-    'strut',
-    'struts',
-    'stub',
-    'stubbs',
-    'stubby',
-    'stucco',
-    'stumped',
-    'stunts',
-    'stupendous',
-    'stupor',
-    'stv',
-    'stylist',
     'stylistics',
-    'stylus',
-    'sub-committees',
-    'sub-continent',
-    'subcontinent',
-    'subcontractors',
-    'subculture',
-    'subcutaneous',
-    'subdivision',
-    'subdivisions',
-    'subdue',
-    'subjecting',
-    'subjection',
-    'submits',
-    'subsections',
-    'subsequent_to',
     'subsystem',
-    'subsystems',
-    'subtler',
-    'subtleties',
-    'subtracting',
-    'suburbia',
-    'subvert',
-    'succinct',
-    'succulent',
-    'sucker',
-    'sucks',
-    'suction',
-    'sufficiency',
-    'suffocated',
-    'suffocation',
-    'suffused',
     'sugary',
-    'sugden',
-    'suharto',
-    'suicides',
-    'sulking',
-    'sulky',
-    'sulphide',
-    'sulphuric',
-    'sultry',
-    'summarily',
-    'summarising',
-    'summation',
-    'summertime',
-    'summonses',
-    'sundial',
-    'sunflower',
     'sunni',
-    'sunselect',
-    'superannuation',
-    'supercomputer',
-    'superhuman',
-    'superman',
-    'supernatant',
-    'superscalar',
-    'supersonic',
-    'supersparc',
-    'superstars',
-    'supine',
-    'supplanted',
-    'supplementing',
-    'supposes',
-    'supranational',
     'supremo',
-    'suragai',
-    'surcharge',
-    'surere',
-    'surfacing',
-    'surkov',
-    'surly',
-    'surnames',
-    'surreal',
-    'susannah',
-    'suspending',
-    'suspensions',
-    'sustains',
-    'sustenance',
-    'suture',
-    'suzuki',
     'svr4.2',
-    'sw',
-    'sw1',
-    'swahili',
-    'swain',
-    'swales',
-    'swann',
-    'swapo',
-    'swaps',
-    'swarm',
-    'swarmed',
-    'swarming',
-    'swathe',
-    'swathed',
-    'swaziland',
-    'sweated',
     'sweatshirt',
-    'sweetcorn',
-    'sweeter',
-    'sweetest',
-    'sweetie',
-    'swells',
-    'swig',
-    'swimsuit',
-    'swish',
-    'swooping',
-    'swordfish',
-    'sycamore',
-    'sycorax',
-    'syd',
-    'symbolise',
-    'symbolised',
     'synchronous',
-    'syndicates',
-    'synergy',
-    'synopsis',
-    'synthesised',
-    'synthesized',
-    'syrians',
-    'syringes',
-    't\'',
-    't2',
-    't9000',
-    'tabernacle',
-    'tabular',
-    'tacitly',
-    'tacky',
-    'tadpole',
     'tadpoles',
-    'taffeta',
-    'tagging',
-    'tailors',
-    'taipei',
-    'tajikistan',
-    'takeaway',
-    'takers',
-    'takeshita',
-    'tal',
-    'talkative',
-    'talkin\'',
-    'tampered',
-    'tampering',
-    'tandy',
-    'tanganyika',
     'tangent',
-    'tankard',
-    'tanning',
-    'tantrum',
-    'tapered',
-    'tariq',
-    'tarn',
-    'tartly',
-    'tashie',
-    'tasmania',
-    'tass',
-    'tasteful',
-    'tastefully',
-    'tasteless',
-    'tatters',
-    'tattooed',
     'tattoos',
-    'tatty',
-    'taunting',
-    'tawdry',
-    'tawno',
-    'taxonomy',
-    'tccb',
-    'tcga',
-    'tcr-',
-    'teacher-training',
-    'teague',
-    'teak',
-    'teatime',
-    'technicalities',
-    'technologically',
-    'technologists',
     'tedium',
-    'teeming',
-    'teen',
-    'teething',
-    'tel.',
-    'telecoms',
-    'templeman',
-    'temps',
-    'ten-year',
-    'ten-year-old',
-    'tenable',
-    'tenacious',
-    'tendons',
-    'tendrils',
-    'tenerife',
-    'tenner',
     'tensile',
-    'tenths',
-    'terminator',
-    'termites',
-    'tern',
-    'terns',
-    'terra',
-    'terrors',
-    'terse',
-    'tersely',
-    'test-tube',
-    'testers',
-    'testicles',
-    'testimonial',
-    'texaco',
-    'thame',
     'themistokles',
-    'theorizing',
-    'thereabouts',
-    'thereon',
-    'thereupon',
-    'thermodynamics',
-    'thermonuclear',
-    'thingy',
-    'third-party',
-    'third-world',
-    'thirty-nine',
-    'thom',
-    'thoo',
-    'thoroughbred',
-    'thoroughfare',
-    'thoroughness',
     'thorp',
-    'thoughtless',
-    'threadbare',
-    'three-hour',
-    'three-piece',
-    'three-quarter',
-    'three-way',
-    'three-week',
-    'threshing',
-    'thrived',
-    'thrives',
-    'throbbed',
-    'throes',
-    'thrombolytic',
-    'thrombosis',
-    'thromboxane',
     'thronged',
-    'throughput',
-    'thrusts',
-    'thudding',
-    'thug',
-    'thunderous',
-    'thwart',
-    'tickling',
-    'tight-lipped',
-    'tightness',
-    'tilda',
-    'tilley',
-    'tills',
-    'tilly',
-    'time-honoured',
-    'time-scale',
     'timeshare',
-    'timetabling',
-    'timmy',
-    'tingle',
-    'tiniest',
-    'tinkering',
-    'tint',
-    'tiptoed',
-    'tirana',
-    'tirelessly',
-    'titan',
-    'titanium',
-    'tithe',
-    'tl',
-    'tm',
-    'tnc',
     'tobago',
-    'togo',
-    'toiletries',
-    'tommaso',
-    'tomography',
-    'toner',
-    'tonga',
-    'tongs',
-    'toning',
-    'toothache',
-    'tooting',
-    'top-class',
-    'topless',
-    'topple',
-    'topsoil',
-    'torbay',
     'torchlight',
-    'torness',
-    'torpedo',
-    'torrance',
-    'tortoises',
-    'touchdown',
-    'touchy',
-    'tout',
-    'towelling',
-    'towered',
-    'toying',
-    'tpa',
-    'tracer',
-    'tradesman',
-    'traditionalists',
-    'trajectories',
     'trampling',
-    'tramps',
-    'tranche',
-    'tranquillizers',
-    'trans',
-    'transcended',
-    'transcendental',
-    'transcriptions',
-    'transfection',
-    'transferee',
-    'transference',
-    'transformational',
-    'transfusions',
-    'transgression',
-    'transistors',
-    'transitory',
     'translators',
-    'transmitters',
-    'transplanted',
-    'transplants',
-    'transporter',
-    'transports',
-    'transposed',
-    'transputer',
-    'transvestite',
-    'traumas',
-    'travers',
-    'travesty',
-    'treacle',
-    'treads',
-    'trebled',
-    'tree-lined',
     'trekking',
-    'trellis',
-    'tremolo',
-    'tremors',
-    'trespasser',
-    'trespassing',
-    'trestle',
-    'tribesmen',
-    'tributaries',
-    'tributary',
-    'trickled',
-    'trickling',
-    'trifling',
-    'trillion',
-    'trilogy',
-    'tripod',
     'trite',
-    'triumphal',
-    'trivia',
-    'trodden',
-    'trojan',
-    'troll',
-    'trollope',
-    'trolls',
-    'troopers',
-    'trotter',
-    'trowel',
-    'truer',
-    'truffles',
-    'trundled',
-    'truss',
-    'trusteeship',
     'trusty',
-    'tu',
-    'tubby',
-    'tubers',
-    'tubing',
-    'tufted',
-    'tufts',
-    'tulips',
-    'tumultuous',
-    'tuner',
-    'tungsten',
-    'tuppence',
-    'turning-point',
-    'turnips',
-    'turnpike',
-    'turntable',
     'turret',
-    'turrets',
-    'tuscan',
-    'tusks',
-    'tussle',
-    'tutilo',
-    'tuxedo',
-    'tvei',
-    'twinge',
-    'two-',
-    'two-and-a-half',
-    'two-part',
-    'two-party',
-    'two-storey',
-    'tyndale',
-    'typeface',
     'typewriters',
-    'typist',
-    'typography',
-    'typology',
-    'tyrants',
-    'tyron',
-    'tyrosine',
-    'uae',
-    'uda',
-    'udcs',
-    'ufo',
-    'ugliness',
-    'uk-based',
-    'ukcc',
-    'ukrainians',
-    'ultra-violet',
     'ultrasonic',
-    'ulysses',
-    'umbilical',
-    'una',
-    'unaccompanied',
-    'unaccountably',
-    'unaided',
-    'unannounced',
-    'unanticipated',
-    'unashamedly',
-    'unassailable',
-    'unassuming',
-    'unattainable',
-    'unauthorized',
-    'unawares',
-    'unbearably',
     'unbeatable',
-    'unbiased',
-    'unbuttoned',
-    'uncaring',
-    'unced',
-    'uncharacteristic',
-    'uncharacteristically',
-    'unconditionally',
-    'unconsciousness',
-    'uncontrollably',
-    'uncontroversial',
-    'uncovering',
-    'undamaged',
-    'undaunted',
-    'undefined',
-    'undemanding',
     'undemocratic',
-    'under-fives',
-    'undercarriage',
-    'underdeveloped',
-    'undergoes',
-    'underlay',
-    'underpins',
-    'understated',
-    'understudy',
-    'undertakers',
-    'undervalued',
-    'underwrite',
-    'undetected',
-    'undeterred',
-    'undeveloped',
-    'undifferentiated',
     'undignified',
-    'undiscovered',
-    'undivided',
-    'une',
-    'uneasiness',
-    'uneducated',
-    'unenforceable',
-    'unep',
-    'unethical',
-    'unevenly',
-    'uneventful',
-    'unexplored',
-    'unfaithful',
-    'unfavourably',
-    'unfolds',
-    'unforgivable',
     'unfulfilled',
-    'unguarded',
-    'unharmed',
-    'unhcr',
-    'unholy',
-    'unhurried',
-    'unhurt',
-    'unicameral',
-    'unicorn',
-    'unify',
-    'unimaginative',
-    'uninformed',
-    'uninhabited',
-    'uninhibited',
-    'unintentional',
-    'unites',
     'unjustifiable',
-    'unkempt',
-    'unkindly',
-    'unlisted',
-    'unlit',
-    'unmanageable',
-    'unmet',
-    'unnerved',
-    'uno',
-    'unobserved',
-    'unobtrusively',
-    'unofficially',
-    'unopened',
-    'unpack',
-    'unpalatable',
-    'unperturbed',
     'unpleasantly',
-    'unpleasantness',
-    'unpredictability',
-    'unpromising',
-    'unquestioned',
-    'unravelling',
-    'unreality',
-    'unrecognised',
-    'unregulated',
-    'unrelenting',
-    'unremitting',
-    'unrepentant',
-    'unreported',
-    'unrepresentative',
-    'unresponsive',
-    'unsatisfied',
     'unsavoury',
-    'unscientific',
-    'unseemly',
-    'unshaven',
-    'unsolved',
-    'unsophisticated',
-    'unsound',
-    'unspeakable',
-    'unsteadily',
-    'unstressed',
-    'unstructured',
-    'unstuck',
-    'unsuited',
-    'unsung',
-    'unsupported',
-    'unsurprisingly',
     'unsuspected',
-    'unthinking',
-    'untimely',
-    'untroubled',
-    'untypical',
-    'unusable',
-    'unveil',
-    'unwary',
-    'unwashed',
-    'unwieldy',
-    'unwillingly',
-    'unwin',
-    'unwind',
-    'unwrapped',
-    'unyielding',
-    'uos',
     'up-market',
-    'upbeat',
-    'upholstered',
-    'uplifting',
-    'uprooted',
-    'upside-down',
-    'uptight',
-    'upwind',
-    'urals',
-    'urbanisation',
-    'urbanization',
-    'urchin',
-    'urea',
-    'urethra',
-    'urn',
-    'urns',
     'user-friendly',
-    'utensils',
-    'utilization',
-    'utilize',
-    'utrecht',
-    'uttar',
-    'utterson',
-    'v6',
-    'vacations',
-    'vaclav',
-    'vainly',
-    'validating',
-    'valium',
-    'valour',
-    'vance',
-    'vandalised',
     'vargas',
-    'varices',
-    'varnished',
-    'vassal',
-    'vassals',
-    'vaulting',
-    'veered',
-    'vegetarians',
-    'vehemence',
-    'vehement',
-    'veils',
-    'velcro',
-    'vellum',
-    'venereal',
-    'venezuelan',
-    'vengeful',
     'venomous',
-    'ventura',
-    'venturing',
-    'veranda',
-    'verbatim',
-    'verde',
-    'verderers',
-    'verdi',
-    'vere',
-    'vermin',
-    'vertebrae',
-    'vertebrate',
-    'verve',
-    'vesicles',
-    'vestige',
-    'vestiges',
     'vestments',
-    'vests',
-    'vetting',
-    'vhs',
-    'vibe',
-    'vibes',
-    'vibrate',
-    'vicarious',
-    'viceroy',
-    'vices',
-    'vichy',
-    'victors',
-    'videotape',
-    'vie',
-    'vietminh',
-    'viewdata',
     'villiers',
-    'vilnius',
-    'vin',
-    'vindication',
-    'vinnie',
-    'vinny',
-    'violets',
-    'violinist',
-    'violins',
-    'virgins',
-    'virgo',
-    'virtuoso',
-    'virulent',
-    'visceral',
-    'visitation',
-    'visor',
     'vistas',
-    'visualisation',
-    'visualized',
-    'vitae',
-    'viv',
-    'vivienne',
-    'vivo',
-    'viz.',
-    'vocalist',
-    'vole',
-    'volga',
-    'volkov',
-    'vols.',
-    'volt',
-    'voltaire',
-    'volunteering',
     'voluptuous',
-    'vous',
-    'vox',
-    'vp',
-    'vulgarity',
-    'vulture',
-    'vying',
-    'wacky',
-    'waddle',
-    'waded',
-    'waders',
-    'wading',
-    'waffle',
-    'wafted',
-    'wag',
-    'wagging',
     'waging',
-    'wah',
-    'waistband',
-    'waiting-room',
-    'wakeham',
-    'wallabies',
-    'wallaby',
-    'wallasey',
-    'wallets',
-    'walling',
-    'wallington',
-    'walnuts',
-    'walsingham',
-    'waltham',
-    'walthamstow',
-    'walworth',
     'wanders',
-    'wane',
-    'waned',
-    'waning',
-    'wanker',
-    'wantage',
-    'war-torn',
-    'wardle',
-    'wardship',
-    'warehousing',
-    'warlord',
-    'warmest',
-    'warship',
-    'washable',
-    'wasim',
-    'watcher',
     'watercress',
-    'watergate',
-    'waterlogged',
-    'waterway',
-    'waveform',
-    'wayside',
-    'wealthier',
-    'wealthiest',
-    'weaning',
-    'wearer',
-    'webs',
-    'wedded',
-    'weedy',
-    'week-long',
-    'weekdays',
-    'well-balanced',
     'well-developed',
-    'well-dressed',
-    'well-equipped',
-    'well-off',
-    'well-to-do',
-    'well-worn',
-    'wella',
-    'welled',
-    'weller',
-    'wellies',
-    'welling',
-    'wellingtons',
-    'welshpool',
-    'welt',
-    'welter',
-    'welwyn',
     'wench',
-    'wensleydale',
-    'wentworth',
-    'wesleyan',
-    'wester',
-    'westerly',
-    'westmorland',
-    'westphalian',
-    'westwood',
-    'wetherby',
-    'wetland',
-    'wetter',
-    'wetting',
-    'weymouth',
-    'whack',
-    'wheezing',
     'whimper',
-    'whimpering',
-    'whims',
-    'whined',
-    'whiplash',
-    'whirlpool',
-    'whirring',
-    'whisker',
-    'whistler',
-    'whit',
-    'white-faced',
-    'whitewash',
-    'whitfield',
-    'whiting',
-    'whittaker',
-    'whittington',
     'whizz',
-    'wholeness',
-    'wholesaler',
-    'whooping',
-    'whores',
-    'wi\'',
-    'wickedly',
-    'widdicombe',
-    'wigs',
-    'wilds',
-    'wilfred',
-    'wilfully',
-    'wilhelm',
-    'wilts',
-    'wily',
-    'wince',
     'windermere',
-    'windings',
-    'windmills',
-    'windowsill',
-    'windscale',
-    'windswept',
-    'windward',
-    'winifred',
-    'winnings',
-    'winterbottom',
-    'wiry',
-    'wisconsin',
-    'wispy',
-    'witham',
-    'wither',
-    'withington',
     'wiv',
-    'wobble',
-    'wobbling',
-    'woburn',
-    'woes',
-    'wogan',
-    'wolds',
-    'wolfe',
-    'woman-centred',
-    'womanhood',
-    'wonderland',
-    'wondrous',
-    'woodchester',
-    'woodhouse',
-    'woodpecker',
-    'woodrow',
     'woodruffe',
-    'woodwind',
-    'woodworker',
-    'woof',
-    'woolworth',
-    'woolworths',
-    'wootton',
-    'wordstar',
-    'workgroup',
-    'workgroups',
-    'workmates',
-    'workout',
-    'workplaces',
-    'worksheet',
-    'world-class',
-    'world-famous',
     'world-view',
-    'worsen',
-    'worships',
-    'worsley',
-    'worthing',
-    'wp',
-    'wpc',
-    'wrangling',
-    'wrappers',
-    'wray',
-    'wrecking',
-    'wrecks',
-    'wrestle',
-    'wrestled',
-    'wrongfully',
-    'wrung',
     'wuthering',
-    'wyn',
-    'wyndham',
-    'wynne-jones',
-    'wyre',
-    'x-windows',
-    'xanthe',
-    'xiaoping',
-    'xiii',
-    'xvi',
-    'xx',
-    'yakovlev',
-    'yanked',
-    'yankee',
-    'yarrow',
-    'yds',
     'yea',
-    'year-long',
-    'yearned',
-    'yegan',
-    'yellowing',
-    'yellowish',
-    'yeremi',
-    'ymca',
-    'yolk',
-    'yolks',
-    'yon',
-    'yorker',
-    'yorkshireman',
-    'younis',
-    'yous',
-    'yum',
     'yuppie',
-    'yuri',
-    'yussuf',
-    'yusuf',
-    'yves',
-    'z88',
-    'za&iuml;re',
-    'zacco',
-    'zack',
-    'zambian',
-    'zander',
-    'zealous',
-    'zeppelin',
-    'zeros',
-    'zhivkov',
-    'zig-zag',
     'zimbabwean',
-    'zimmerman',
-    'zips',
-    'zoology',
-    'zoos',
-    'zzap',
+)
+
+blocks_05 = (
+    ',$&ast!#deg"-ollar;100,000+!m*!m)!m(!2)$,000)!0*!0(!3)$,000(%5,000)!0!)frac12;in',
+    '!+pound;1,200(".2(#00m)!m(!1(%2,000)#.99)!5(!3)!0(!4)!0(!7(!8\'#2.5',
+    '("0m(!2(!4(!8\'&35,000\'#50m(!5\'$6.95*!9(&00,000(!5\'%7,000(#.99(%0,000(%5,000',
+    '\'$8.99(%0,000)%0,000\'$9.95*!9("00!$rarr $\'50s!#90s"!3!"ow #***#!* "-2 #/a/',
+    '""1%""25""5%"!9!!6!"81!!9 )1&ndash;1(!4!(,000,000"#100"#400"#600!"-0"!1',
+    '""30""5%!*0&ndash;15")-year-old"#.00#!3#!4"&0g/4oz#"th""66"!m#!m""pm"!s!*1-year-old',
+    '#!2#!3$!0#!4#!5""00!\'2-month"".1#"30"%0,000!*3-year-old!#400#!k""71""83',
+    '"\'ml/tbsp!%6-bit"!2"!3""40#!2#!9""50"!6""89""90#!2""mb!%7,000"".5',
+    '#!0"!2#!0"!3#!0"!4#!0#!5#!9"!6#!3#!5#!6#!8"!7',
+    '#!2#!3#!4#!6#!7#!8#!9"!8#"0s#!3#!4#!5#!6#!7#!8',
+    '#"0s#!6#!7#!8!%8&ins"$,000""04#!7#!8#!9"!1#!1#!9"!2#"0s',
+    '#!2#!7"!3"!6"!7"!8"!9"*th-century!$900s"!1"!2"!3"!5"!6"!7',
+    '"!8#$9-90"!9#*0&ndash;91#*1&ndash;92$#-92#*2&ndash;93$#-93#$3/94!!b!"lb!!p )2&ndash;4!#(1)!#.30',
+    '!&0-year""05#!m"!1#!0"!2"!3"!4"!6"!7"!8"!9!"11"!3"!4',
+    '"!6"!7!"21"!2"!3"!6"!8"!9!"35"!6"!7"!9!"42"!5!#500',
+    '"!g"!p!"6%"!1!*7-year-old"!5!%8,000!"9%")-year-old"!0!!d!"in!"oz (3&frac12"\'ndash;2',
+    '"!d!#.10""30!"01"!3!"1%")-year-old"!0!"2%"!5""mb!"4%"!0!&50,000!"65',
+    '!"85!"9%!!a!!p"!m \'4&deg;c"\'ndash;0(!1(!5!$,500!!.""30!"05"#mhz"!s',
+    '"!0!"3%"!0!"4%!%5,000!"7%!"8%!!a!!b!"in!"mb!!p )5&ndash;6!!.""30',
+    '!"0g#$/2oz"!s!"1%"!2!"5%!"80!!a!!c!"ht %6&ins"\'ndash;1(!2(!3!#(2)',
+    '"!4!".0"$30pm!$6mhz!!a!!b!!p #7.0"!7"!8"!9!&00,000#!0!%5,000 *8&ndash;10',
+    '"!7"!8!&00,000#!0!%8open #9.4!%0&deg"$,000"!s!"9%!"am!"pm "a\'!\'-levels!%.g.m.',
+    '!#_la!%achen!%bated""ba$!s##ots#)reviation"!d#"el#\'ication"!i#$gail"$ject""ly"#ort',
+    '"$rams"$seil#$tain\'"ed$&ention"\'yssinia!\'cademia"!c##ede&!d$&ntuate#,omplishments$%rding#&retion$$uals',
+    '%%ingly"#emi#!r##tic"!h"+idification"$klam#-nowledgements*$ment#$royd""ne"\'oustics"&quirer%$ttal"%reage',
+    '#&opolis"\'tivates%#ism#$uary"$umen!$dage"$d-on#$uced"#ele#+nocarcinoma%#mas\'$tous"&hering"%journ#%udged',
+    '"#ler"%mires%%ingly$)ssibility"!o##lph#%ptive#$ring$!n"(renaline"(sorption"\'ulation"(venturer$#rbs%&sarial',
+    '!\'enarion""ro$\'dynamic$$sols"+sthetically"\'tiology!&ffable#&irming#\'liction##ray$%onted""hq"#ore%)mentioned%$said',
+    '#$rose##ssi"\'e-group"\'gravate(#ing$&egated%$ssor"#ing"&onised!"hi!(imlessly"%rcrew#%force$$rame##ily',
+    '##man#%space##way!#jar!$kers!\'lacrity#$ddin"$bany#$erta"(coholics"&derley#&ington"\'eksandr#!s#&xandre',
+    '#$redo"#gal#&ebraic"$icia#%enate#%ghted$!n#"na"+l-embracing$%night$(powerful$\'rounder$\'weather#"ah##ege',
+    '%&orical$#nby$%rgies$&viated$%yways##oys#%uring$%sions""ma"\'resford"$sace$$tian"$tars#(ernation#&itudes',
+    '!$maze$%onian"$bled%$side#\'ulatory$$shed"$dahl"&ersham"!i#$ably#"ga#!n#!r"#man#%onium',
+    '"%orous"*phitheatre#$lify"%ylase!*nachronism*#tic#&logues$#yze#%rchic\'"st#$toly"\'choring&!s"$ders%#ton',
+    '$$oids"%emone\'!s"%gelic&"na$#vin##ina#&licans$(o-norman#$olan#"st"%imate"$kara"#nan#\'exation',
+    '$)versaries#&otated$"ys#%ulled"&ointed#(nymously"(tagonist#%elope#$hems#+i-apartheid%)communist%\'fascist%\'nuclear%&racist%)terrorist',
+    '$#gua$\'quarian\'#ted$&racist#$lers##rum""ya#$time!$pace$"he#&thetic"%hasia##ids"!i"!l',
+    '#&stolic%%rophe#\'thecary")pallingly$&rition#$ease\'$ment$$nded&$ices#\'raisals\'"ed\'#ing$\'eciates)%ively%$hend',
+    '(&sively$(oachable%$vals&"es&%ingly%"x.&(imations""se!\'queduct$#ous#$ifer!\'rabella")bitrators#%roath#&uthnot',
+    '$"ne#$hery$#ing"#den"$gyle"%iadne#"es#%stide%"os&&telian"\'kwright"$mada$"ni#&enians#$pits',
+    '$"ys"\'thritic#)iculating$%facts$$stry"%undel!"sa"!c##end%$sion$(rtaining$#tic#$ites#$ribe"#hby',
+    '#%trays"%iatic"\'paragus#$halt"(sailants&"ed$!m$\'ssinate#(iduously$#gns#(ociating#$ures%#ing"!t#"or',
+    '%$naut"#wan"%ylums#)mmetrical$(ptomatic!#tf1"%heism$"na#&letico"&lantis"$rium#&ocious&"ty"+tach&eacute#)enborough',
+    '##ire$\'tudinal#(ributive%$tion#$uned!%uburn"\'dacious&"ty#"en"#ral"\'schwitz#\'picious#$sies#(tralasia%$ians',
+    '\'$sing\')tarianism\'"ze(#ing#&ocracy$&immune$#psy"!x#(iliaries!!v"!e##nge"$idly"%ocado#&idable',
+    '"#ril!%waken""ed")kwardness""ry!!x"\'iomatic"\'minster"#ons"!p!#yer"$rton!*zerbaijani"#ure "b1',
+    '$%ngida##ble#"es#(ysitting"\'ckbench$%fired$\'packing$%water$$yard"*d-tempered#"en"&ffling"$gged#%pipes""ie',
+    '#\'nbridge##rns"\'lbinder##kan#$last$%erina#!m#\'ustrade"#nda%#ged$"ed%#ira$%width#(gladeshi$!s',
+    '#&knotes$(ruptcies#&nister"&ptists"#rak#&barism$"el#!d#&gained##ing#"my#%onial#$ratt$!e$%icade',
+    '$!o"$salt&!s##hed#(kerville$#ing#"le#$sist#$tion"%teman##ted%"ns$(leground&%ments"(udelaire',
+    '"%yonne#&swater!"cr!"da!&eached$#ons##ded$"le##ker$!s#$mish#%rable$"ds&#ley#$stly',
+    '$"on#!u$%champ$$fort#(verbrook"!c#&koning"\'droomed"#efy#!p#!t"&headed$"st"#inn"$lfry',
+    '##ied%%vable#$lies%&gerent$%owing#&vedere")nedictine$\'factors$$tton$\'volence#$gali$$hazi##net##ton#$zene',
+    '"\'resford$!t#"ks#\'nadette$!e$$hard#$owne#$serk"!s#%otted##tow"%thnal#$rays#\'ter-off"&verage',
+    '"!y!#fgf!!h!!i"&arritz"!b##les$+iographical,"es"\'cameral#&kering"&ennial"$kers"$lbao#%liard',
+    '"*odiversity"%rkett#!o#\'thright"!s#&hopric#$muth##tro"%tches!)lackbirds%\'currant%"ed%%heath##nco$%dford',
+    '$"ks#$ster"\'eaching$#kly"\'indfold)"ed#%ssful("ly#%thely#%zzard"#obs#&ckages%&buster#%odied%$less',
+    '#\'ssoming\'!s#$tted#$uses"(ue-green$&prints#%ndell&"rs$$kett!"np!\'oarders%#man#&thouse""bs"(dyguards',
+    '#"ie%!s##nor""is"&ldness#%ivian#$ting"\'mbshell"#nar#(dholders#%fires#%iface$%ngton#!o")okshelves',
+    '#"ms#$ster%!s##ted$"hs$!y"&rehole(!s#$rows"#sch#"sy"&tanist#$hers$$well#%tling',
+    '&$less"*ugainville$!h#$lton#$ncer&!s%!y$$ding#%tique(!s$)ros-ghali"$wden##ers$!s##man',
+    '""yz"!z!(racelets$$kish%#ley#!d#$ille$&nchild##ked#$mble$$pton#$nagh$$ched$%d-new%&enburg',
+    '#"un#$vado$!o##zen$#ier"\'eaching$\'dwinner$#ker%%fasts$$ther\'!s##con#$mner#$tton#$vity',
+    '#\'desmaid*!s$#ged#"g.$$ades#$mmer#%stles&#ing")oad-based%%hurst%!s#$cade$\'klebank#&kerage#!m',
+    '#%oches$&klands##ugh#-wne-wilkinson&!d"$unei$#ner$%swick#$sque\'"ly""yn!"sa"!e"#kyb!#tec',
+    '%!y"$cked$#les$&master"$dgie"&ffered&!s$!s"$lger#$imia#$ldog&$zers$#ies%"on%"sh',
+    '"$mble#!s"%nched#&desrat#!g#$kers#$ting##yan"%rford#$gers#$kina#$nett$#ham$%ished#&roughs',
+    '#"sa"&sacher#"by##ied%!r##ter$#led""te#&helezi##lin#(terworth$&resses!&ye-law#%larus"$gone',
+    '"(standers %c\'est"!s!$-jun"(terminal!\'.-in-c.!"/o!!3!"64!\'abbages#$ling#!s"%ddies#%illac$!z',
+    '#"re"(ernarfon#&sarean"(irngorms"&lamity#\'culates(#ors&"us#%dwell#$edor#$iban%%rated#$l-up#$vert$%inist',
+    '#\'berwell#"eo#(ouflaged#$pese$#ion$$site$$uses"&naries#$dour#"es#$nons##oes#!t$$eens%!r',
+    '"#pel#+italisation)"ed&$tion%"ol#"ri%%cious&#orn#"t.$$ions%%vated&"es"&r-park#$acas$#mel',
+    '#&casses#%esses#$lson##mel$&ichael#\'nations$%elian##ols#&peting##ted%$sian$%ilage"\'scading#%ework##hed',
+    '$$mere#!k$"et#$sidy#$tile$&leford&%reagh$"or#$uals"(talogued&#nia#&echism$*gorisation(#zed$#rer',
+    '#%heter#%riona"&ucasus$"us#(liflower#&sality#\'tionary\'!s"$veat$%ndish$%rnous&!s#%ities!"be!"ca',
+    '!#d-i"!p!(easeless"#ded")lebratory#%ibate#&luloid"&mented&!s"$nsor&"ed#!t$&igrade$\'re-half%#ing',
+    '"!o""rn#$tify##vix"#sar##sna"\'taceans"$ylon!"fe!"gt!&hagrin#%insaw$$ring##let&!s',
+    '$#ker#&meleon$$orro$&pioned#$nced$\'deliers$"el$&geover&!z$\'nelling$#tal#&plains#!r$)acterises*#zes',
+    '$$iots$#man%%ingly$%olais$#ted%#ing##ser$"te%#ity#$tham$%ichai$!s$$tels&#red#\'uvinism',
+    '"!e#&apside#\'ckpoint#&ekbone$(rfulness#&quered#!r$$well#\'sterton%$nuts"$iang##ded#&eftain#$ffon#*ld-rearing',
+    '%$rens$%peric$$tern##med%!s$"ps#"nk##rac"#loe$/rofluorocarbons\'#orm$$thar"-olecystectomy#$pper%!y',
+    '")ristening&%ology&!y#&omatic%#ium%&osomal"$ubby#%cking%$ling#"ng#"rn!&ichlid#!s"(metidine"(ncinnati',
+    '%(mscribed&$vent"(stercian"%trine$#oen"+vilizations!&lamber\'#ing$"my$&ouring$%pdown#"ns#&rendon#%shing$$ping',
+    '#$udio"$eans&!e\'!d$&rances##ese##lia##ric#\'verness"!i#+ch&eacute;s#"ft#&nching#&pboard"%oaked',
+    '#!g$!s#%ister(!s#!t$"he"(ydesdale!)o-founder#(operated%#ted#$star"&achman#\'l-fired$&fields##tes',
+    '$"ed$#ing"%bbler##ham##urg#$webs"&ckburn$\'roaches$%tails$!y##oon"&dified"%erced#$xist\'$ence',
+    '"*habitation"*incidental,"ly"*ld-blooded$#est$!s#"es$#tte#"ic#)laborator$(ectivism%%giate$#ide%!e&$ries',
+    '#)onization%$nade%&oscopy$!r%%ation#"ts#%umnar"(mbatants&#ive$!e$#ing$!s##dex#$econ$$dies',
+    '$"ts#"fy##in\'#(mandment+!s$)emorating+"on%\'ndation$%oners$$unes&&icates*"or\'(ty-based#\'paction%$gnie',
+    '$\'etences\'!s&\'itively$(licating&"es$)ositional$$ress$\'troller$(ulsorily%"te\'(risation"%ncave$\'ealment\'!s%"it',
+    '%$rtos$#his$%octed%"rd$"ur&#red%%ssion#%demns%(scending$(itionals$#one\'!d#*fectionery%%ssing($onal',
+    '$%idant&%ences&#ing$&licted$%ormed\'#ing%&unding$+rontational$&usions#\'gregate&$sses(#men#$ifer#%jures&#ing',
+    '\'#ors%!d%"ll%"ry$\'oisseur%&tation#\'quering&#sts##roy#(sciences(\'tiously%%ripts$(ecration%%rving$$oled',
+    '%$rtia$*piratorial+!s$(titutive%\'raining&%icted&(uctional\'!e$$ular\'"te&\'tancies%#mes&$mate#,temporaneous%%nding',
+    '$(inuities$\'radicts&%ption%\'ollable#)valescent$%ening&"or&)tionalism%$rged("nt&#ter)!s%&yancer&"or$$icts',
+    '$\'ulsions#"wy"%okers$%stown#)rdinators"&peland$&rnican#$pell%"rs#"se#"ts"#rby#$dial#"gi#&iander',
+    '#$nell$%flour#$pora##tes"*smological#/t-effectiveness$"ed$$ings"$ttle"#un.$&selled$%tdown%\'erclaim\'#ing\'%point',
+    '%%ryman#"pe$#let$!s#\'rgettes$#ted&%ously%"ly%%yards"\'verings%#tly"#wed#$slip"#yle!#pus',
+    '"#abb#$ckle\'!d#%dling##ggy#&igavon#(mlington$"ps#"nk$#mer#"ss#"ve%!d#$yons"%eases',
+    '&$vely##che#\'ditable##eps#(matorium#$sted%!s#\'vecoeur$$ices"#ick%%eting##key##mea#$spin%"ly',
+    '%$ques"#oak#\'codiles#%fters%#ing#$nies#$pper#%sland$)s-channel\'\'ultural((rricular%#ley%$over#$wley"&ucible',
+    '#%nched&!y#%sader\'!s&#ing$#tal##tch&"es"$ypts#,stallization*"ed!"se"!o!-u&eacute;llar"#bed',
+    '"(l-de-sac##lam$"ed"!m#$mins"\'nningly"#ppa"&rative#$bing$!s#!d##ing"$sack#&todian)!s',
+    '"%t-out$%price#$icle!&yanide"%clone"$nics"%priot"#rus"&stitis"\'tokines$%plasm#!r!%zechs ,d&eacute;but),sir&eacute;e',
+    '""or!#ads"!e"!f#%fodil"%ggers""hl"%ilies#$mler#!s"#lai##eks#$yell"\'mnation#"on',
+    '%!r$#ing$$ness"#nby"%ppled"!r#"es##ius##ken$$fall#$nley#%tford$%mouth#&winism"&tasets',
+    '""ze##zle!!b"!2""ms!!d!$eana$!s##rer$"th#$thly"%bacle$$rred#&enhams#$ussy',
+    '\'!t#&eiving$(leration$$ntly&\'ralized#$ider%$uous$$mals&#ted$$pher$*sion-maker##ked%!r#!o$$ding',
+    '%(pression$*nstruction$%rator%"um#%repit"&dicate""em#(p-rooted"(famatory$$ults#%ected$&nsible$\'rential##ies$%nable',
+    '&#ion$&ection#"oe#$raud$%eitas#!t"#gas#\'eneracy(#ted")hydration"(lectable$\'terious%#ing&#ons#)icatessen',
+    '$&neated$%rious&"um#%oitte##phi#$uded$"ge$%sions$"xe#"ve"\'meaning$#sne#,ocratization$\'lishing$#nic',
+    '$\'ralised$!s#$psey"$nham$#olm#$ials#)omination,"al##ser##ton#)unciation"%parts#\'endents#$lore%$ying',
+    '#(ressions#%tford#\'utation"&ranged#(eliction#$ided$$sive#\'ogatory#$rick#\'singham"\'serting%%vedly##ist#)pairingly$&icable',
+    '#&titute#&ultory"(tachable#$ects$\'rminate*$ions(%istic$"st#\'ractors$$itus"\'uterium"%value#%ereux#&onport$#tes',
+    '&$onal$"ur&#ing#$raux"#war"\'xterity!!h"#abi#!s!"ia#\'bolical#(gnostics#%lling$!s$$ysis',
+    '"#cks#"ta%$ting\'"on&%orial$#ion"&dactic"\'ffident$\'raction"$gger"#jon"(latation%"ed#\'igently#!l',
+    '"(minishes##med"#nar%!s#!g$$hies#!o"&oceses#"de#&nysiac#!r#$xins"(phtheria##ole"(rectness',
+    '"\'sabling$(ffection$%grees$+ppointingly$"rm&"ed$(strously#$band$(elieving#\'carding$&losing$\'oloured%\'ntented\'$inue*#ous',
+    '$"us#(embodied$(nchanted%&tangle#\'figured#(honestly#(illusion$(ncentive&%lined%\'fection%\'tegrate+#ing#\'jointed#\'located%#dge',
+    '%#yal#\'mounted#)organized%(ientated+#ion#*passionate$%enser$&leased$$rove#)regarding%\'putable%%spect#&sected\'#ing("on',
+    '$%ipate$&onance#%tally$&ension$&illery%(nctively$$orts$\'ributes)#ive%%usted$(urbingly##use"%urnal"!v#"an',
+    '$!s#%orces#$ulge"\'zziness!"js!"me!%na-pk!%ocked#*umentaries(#ing"$dged"&ggedly$!y"!i##ngs',
+    '"#med$(stically(#ity#%icile"#nal$$ting#"ne%!d"$oley#$rman$%steps"%ppler"#ric#$rell"$sage',
+    '""th".uglas-hamilton"%wager##ned$&graded$$pour$&sizing#"ty"$zing!(raconian$#ula##pes#(ughtsman\'!y#\'wbridge',
+    '#$yton"&eading$#mer%#ily##dge&!d#"gs"\'ibbling#$nker#"ps"%ooped#%p-out#\'sophila##ves"&udgery',
+    '##nks#"ry"%yness!"sp!"tp!&ualism"$lled%!s#$wich"!m#!a$!s#&barton#$mies#&plings',
+    '##das#$geon#$ning#%woody"&odenum#"mo"$plex##ont"#ran%"ce##ban"#sky#%tbins"&tchman#$iful',
+    '"%xford!&warfed"#yer!%yeing"\'namical&"te%!o"\'splasia &e.coli!!1!!2!!5!&adwine"\'rphones"#ses',
+    '$$ward#\'y-going"#ter%!s!$bert"\'ullient!%ccles"&gfrith"&helons"*ologically#\'systems##was""sc"$zema!*d=chambers',
+    '"!c"$dies"\'gbaston#!y"#ict##son"$mond&!s""n."+ucationally!"eg!&ffendi"!l!-galitarianism#!n',
+    '""on!)ight-year%!s%&y-five""sa!+lectricians(!s\'$fied&#ode\'$lyte\'(phoresis\'&static%!s#$vate&$ions',
+    '"%itism"!l#\'iptical""ms"$oise#&quence\'#tly"!t!(maciated#%nated",barrassingly$%ttled#&edding$\'llished$"rs',
+    '#\'lazoned$#ems#&odying$$ssed""il#%ssary#%tting"#lyn"&phases#\'iricism)!t#\'owering#)ty-handed!\'n-suite"&_masse',
+    '"(campment#&ircled\'#ing#%laves##ode$)uragingly#(roaching$%usted"&d-user#(angering#&earing%\'vouring#&ocrine$%rsing$\'thelial',
+    '"#ema#*rgetically"&gender#(lishness#\'ravings"\'larging#&ighten)#ing$%vened"$mity"&ormity"\'riching$#que#"ol"\'sconced',
+    '#)ertainers#\'hralled#%itles#&ranced&!t$,epreneurship$\'y-level")umeration#\'nciated"(veloping#-ironmentalist\'!s##oys!(pidemics#&leptic',
+    '#$taph"%silon#"on#$tein!!q"%uates%#ing#\'estrian##ine$%vocal!#rcp"#ica$$sson#$trea"#ode',
+    '#$ands%!t#"ed#"ol"$shad#$kine"#upt!"sa#!u"!c#%alate(!d$&rpment#&orting&!s',
+    '"&sences"\'tabrook#%eemed$#lla#%oppel!\'tchings"\'ernally"&hereal#%ylene"%ienne!\'vacuate%#ees#$ding#\'luative#!n',
+    '("st*!s"&entful%&uality#$rard"\'ocation#$king!"we"#ing!&x-wife"!."%acted"&cepted$$rpts#$ised',
+    '#&rement$(uciating"&emplar&%ifies(!y#(rcisable$$ting&#ons"%haled#(ortation&"ed"&istent"$moor""on#\'rbitant',
+    '$\'nsively$)rimenters#%lodes%\'itative%\'rations#(onential$%sures$%unded#*ressionist"!t#*ernalities#\'inguish#&ortion#(ra-mural%%neous',
+    '%\'vaganza$%emism\'$ties(!y$%icate%$nsic!+ye-catching#%balls#\'witness ,f&eacute;lix!!9!"ab#\'ricated"&celift##ies',
+    '%&itator#)t-finding$%ional$%oring"!d#!s"\'el-inis"#gan#!g#!s"\'hreddin%%nheit"%inter%#ing#&rbairn',
+    '$$ford$&ground$$ways$&y-tale%$tale##ths"#ked$!s"%lcons#%lible$"ow#%mouth#&sehood$%ified##ter',
+    '#%ously"(naticism#$fare#"gs#$ning")r-fetched$#off#$aday$!h$#way#%cical#&ewells#\'mhouses#%quhar#\'r-jones',
+    '#!t"%shanu#(t-moving$&idious"#tah$&lities#"es#\'herland#&tening%!r"&ulkner$*t-tolerant%$less##nas")vouritism',
+    '"#xed$!s"!y#"re!\'easting%!s#&thered\'!y$\'ureless")derations#$orov"%eders"!i"#nna#$wick',
+    '#\'dinando#&gusson#&managh$#ent#&nandez#$ried%!s#*tilisation\'&zation("ed"\'stooned""te##ish#"us"#uds',
+    '!!f!+ianc&eacute$"na"(breglass$#ous"$ckle#%tions"%ddler#"el"%elded#"nd""fa#%tieth$&y-four&#one',
+    '"$garo"\'laments##let&!s#\'m-maker*!s$"er"$mbra"&nalise\'!t$&nciers#$cara#(gerprint##nan#%sbury',
+    '$$ball$&places$$side##med#\'st-ever&$half&$team")shkeepers$!y#%sures")tzpatrick$#roy"(xed-term""zz$!y',
+    '#%grant#%nagan#$ring##shy#\'ttening#%wless#!x"%edged#\'etingly##ury#$xing"$icks#"rt%%ation#$tted',
+    '"(orentine$"id%"st$#rie#(undering$&rishes#$wery"\'uctuate)!d#%ently#"ff#%idity#"ke#%oride##ted',
+    '"&y-half##ers#$past#"te!$oals#$ming""ci#&ussing""es##tal"$iled"%lders#"io#\'kestone#$lies',
+    '%"na&&ellato"\'olhardy$#ing#\'tbridge$$work"$rage$!y#$bids#%cible#%earms$%bears%%oding$$gone$%stall',
+    '$"es$!o#)maldehyde&$ised(!m(!t%%tting$"by$#ers#&rester#+tifications%$tude$\'nightly$&resses$&uitous',
+    '&$nine&#one&%seven\'"ix&%three##ums#,ward-looking\'#ing"(thergill"$uled#(r-fifths$.teenth-century%)h-century!"pr!+ractionally',
+    '&$scan%(o-german$%kness#&ternal##uds"&eckled\'!s#&e-kick%&market$\'holders$%style$#zes#%netic#$sher#"ts',
+    '%#ing"!g"$iars#$dges#&edrich$!s%#ian$"ze#$gate\'!s$"id##lls%!y#$sson#"th',
+    '##cks##nds$$ting#$sted%!s##thy"#yer!"t.!!u"&elling""ji"\'ll-size$$back##ton"#med',
+    '##gal#"ky#%niest%"ly"#rby#%longs#$ness##row&"ed&!s#(therance\'#ing"#ses##sed$#ing',
+    ' ,g&oacute;mez!#.p.!!7!$abon""el"$gged"$idar#&tskell"&jdusek"&lactic$%pagos#&braith#$ilee#&lantry$"ic',
+    '"$mbia$#ler##ing#"ut"%ndalf#&gsters$#way""rb#*c&iacute;a#"da#(el-jones#%field#"gy##ish#%lands',
+    '##vin"$scon#$eous#/tro-oesophageal"$uged%!s$#uin#%llist#%ssian#"ze!#chq!%ebrec"$ezer"$lder$#ing',
+    ')!t#%itals#%ocide#!s$$cher#$tile\'!s$\'lemanly"&odesic#\'physics#\'rgiades&!e"&ranium(!s#$hard',
+    '#%stner"%stapo$%uring"%taway#$tin\'!!h!!i"#ddy#!e"(llingham$!y##man$#our#\'t-edged"%mmick',
+    '"%orgio"%psies"$rdle"%scard!(leefully#%navon$"da$!s$%toran"%iadin##ded#$nted"&obally$$ular#&rified',
+    '#$ssed##ved#%wered""um$"ly#&tamate%&thione"\'ycaemic!"mc!&narled#$wing"$omes!%oblet"\'ddesses#"ly',
+    '#%stowe"%ering##the""ff"$ings"%ndola#!g#,z&aacute;lez"&od-bye$!e$$ison$$wood"#ram#$illa"&sforth',
+    '"$tten"%uache#$rmet"#van#-ernor-general!!r"-&eacute;goire"$aces$&iously#%fting%"on#"il#%mmars&\'tically$#sci',
+    '%%child%"ly%\'mothers%!s$,t-maintained#\'pefruit$#ple&#ing#(ss-roots%%lands"%eased$&t-aunt&+grandfather%!s$#ves',
+    '$$nish%#ock%#way$!r#\'garious$!g$"or$#son#"ig#$nada#"ta#$ying$!s"#ice#"me',
+    '$%stead##sly$!t"$oans#\'bbelaar#$omed##tto#)und-floor$"pe##wer$$ling"#uff%"ly##mpy#%nting',
+    '!!t!)uatemalan"\'berniia"&ernica#&sswork"(ggenheim"!i#&llaume%$oche##ses#\'tarists"%llies"$nned#%point"%shing',
+    '$!o$!s"\'ttering!(wendolen"!r!#ybe"(mnastics 3h&eacute;lo&iuml;se!(absburgs"&cienda#"ks"%ddock"!g"\'hnemann"%iling',
+    '##nes#&rdryer$"ed$$line$%style"%ldane##lam$%marks$$owed\'"en$*ucinations##ton#$ving"#mas#&bleton',
+    '#$nett#$pden#!s$#ter"*nd-to-hand$$bags$&cuffed(!s$$fuls$)kerchiefs$#ler\'!s&!y$$outs$$s-on',
+    '#$gers$$ings$#man#"na$#ele##sen"$rare$"ss#&boured\'#ing#%court#)d-hitting$%board$&liners#%ingey',
+    '$"em##man$#ing$%onies\'&zation#\'nessing#*percollins$\'sichord$!y#%vests#$wood""sh##lam"%tches#$eful',
+    '#%nches"!v#%elock$"ns$%rford##vie"#wes##ker%!s$#ing#$orth"#yek##ley#&market"%zlitt',
+    '!"ci"!l"!o!#dtv!&eaders$&ington$$less$#men$%stock##ler$\'th-care#$rers$"se$(t-shaped%%break',
+    '%$ened\'#ing#$then$"on"%brews"$dged"!e##ded"&gelian$%monic"%ifers#%ghten#%neken""la#$lyer',
+    '#(ispheres##med#!p"%ndrie"%pburn"%ralds#\'baceous$&ivores##ded#&eafter$$dity$"in$%tical##iot#$mann',
+    '$"it#"od%$otus$$ines%"sm##pes#"tz"(sitating#$keth##ter"\'uristic"\'xagonal##ham!%iatus"$ccup',
+    '#\'h-class%&heeled%\'profile%*technology$%field$%grove$\'landers"%laire#$bert#$lier$#top"%m/her#&alayan#$mler"#ndi',
+    '##ton"\'roshima"\'stology%&ricism"%tched"&v/aids""ya!"nc"!d!\'oarding%!s"$bart#$bled"$dges"!e',
+    '"#ist"%ldall#$ster#&yfield$$head"(mecoming$%lands$$made$&owners##ing"#ned$\'ysuckle#%gkong#&ouring#!s',
+    '#!f#!p#!t"&pefuls"$rnby$"ed#%owitz#$sley#)ticulture"%skins#\'pitable"&telier(!s"%unded$$slow',
+    '"%wells#"ls"#yle!$p-ux"!v!#run!!s!!u"$bble"$ddle""es"$ghie#!s""lk#"me',
+    '##bly#&iliate##med$\'ingbird#&phreys&#ies$!s"#nch#%grily""rl#$tful$#led%#ing#%worth"$sayn',
+    '##tle&!d"\'tchison!"vs!$ydro%)-electric%&carbon&&hloric%(electric%$xide"&gienic")peractive%&plasia%%sparc#)ocritical',
+    '"*sterically"#wel #i\'s!"/o!&apx-86!"ba"#iza!"ca"&e-cold#&landic"!o#(nography""rc!(dealised"$ioms',
+    '$*syncrasies!&gneous""or!$ii\'s!#l-6"$ford"%iescu"$kley")l-defined$(informed$)treatment#\'iteracy#(uminates!+maginations)$vely',
+    '"&itated&$ions"*maculately#)easurably#&ovable#)unisation%)oglobulin&\'logical$%table"!p#(airments$#led$$rted$&ssable#(eachment',
+    '$&diment$$lled$)rceptible,!y%&fectly%$ious%&tinent#&lanted#&recise%&gnable(#ted$%inted$&operly&%riety%$vise',
+    '$$nity$&rities!&n-laws#\'patient"+_as_much_as#+defiance_of#(light_of"*accuracies$$tion#,ppropriately#(smuch_as#&udible"%built""ca$(ndescent',
+    '#(essantly#%isors$&tement%#ing#)omparable$+nsequential&\'picuous%&tinent#&rement)!s$)iminating#$ubus$%rable%%sions"(decently',
+    '$(fensible%&inable$%mnify\'$ties$*structible#&ignity$,scriminately%\'putable%%tinct#(ucements%$tive$%lgent"*explicably")fatuation##ect',
+    '$#rno%$tile(#ity$\'station#\'idelity$"ll%%trate*!d$"rm#\'latable#(ormality\'&tional+(ssysteme&"er#%ringe',
+    '#%ested#)leborough#&rained"(habitant$&lation#\'eriting#)ospitable"&imical#&tiates"\'jurious$&stices"$mate#"os"\'nermost$!s',
+    '#\'ovators)!y"(ordinate"\'patient#*ut/display")scrutable#)ecticides$(mination$)nsitivity$%rvice#$hore#+ignificance#%olent$$mnia#%pires',
+    '$\'igation%!l&#led%&nctual$)ructional#*ubstantial$#lar&"te$*rmountable"(tegrates$(nsifying\'$onal\'$ties%"ts$.r-governmental',
+    '\'\'nnected%(est-free%%feres%%laced%(mediates%+nationalism/!t&"et%\'pretive%&radial&,elationships%%woven$&stines#&imated%%idate',
+    '$#ned$\'xicated)#ing#*ransigence$$epid$\'icacies$)ospection$$uded&#ing%%sions#\'uitions"(validate$&riable\'"nt#&entors',
+    '%\'tebrate$\'stiture&!s#\'incible$(sibility!%odine""na!*ran-contra#"te"!c"#ena"$ises"&onical$$side"(radiated',
+    '#+econcilable$\'ducible$(gularity$)pressible$(sistibly$&verent#)itability&"nt&"te!%saacs""bn""is"\'lamabad"!o#%topes',
+    '"(raelites"!s#%uance$"er&!s!#tch$!y"\'eration"\'inerant"$zhak #jab##bed"%cklin$!o$#pot',
+    '#%obean%$ites%#sen"#ded"#ffa"%hsaxa"#ime"%karta"%meson##ila"$nine"$rrow"&undice$"ty"#ved',
+    '"#yne!(ealously#%nette"#eps##red"%ffery"$hana"$nsen"%richo#"ky"$ssop#!t$"er#$uits"&welled',
+    '!$iang"!g"#had"#lly""mi"$ngle##kwa!!m!"nr!%oiner##sts"$lted"#nah"%stled"&urdain',
+    '"$vial"\'yriders#%stick!!p!\'ubilant""dd#!i"$ggle"!l#"io"%mbled"!n#$gles"&ventus"(xtaposed',
+    '"#fka""hn"*leidoscope"\'mpuchea"&ngaroo"$plan"&rabakh$#chi#"el#"im""tz"&vanagh!$eats"#ele##nan',
+    '"&ighley"$ller#"so##vin"$nyon"$pler"\'rnaghan##sey!\'ha-khan#%rtoum#(sbulatov!#idd$#ies#\'lington""ff',
+    '#"ns#&ograms#!t"\'mberley"*ndergarten$#red#"ky#$near##sey$#men"&rkwall!#m/h!(nackered"%esset"%itter',
+    '%"er#%wsley"%uckle!)olchinsky"!p#$yion"#ran##esh!\'ravchuk!$uala"#fra"(omintang"\'rdistan +laboriously$-ur-controlled',
+    '"#can#"es#\'klustre"&dbroke(!s##die#%yship"&fferty"%gging#"os"$ibon#!r"&keland""ma#$bing',
+    '"$nark&%shire#\'d-based%#use$%forms$#sat#%gdale$"er$#ton#&sdowne#%terns"!o"#pel%!s##ped',
+    '##sen#"va##ynx"%sagne#$hing"%tency$%rally$!x##ham$!e#\'ter-day"&udable$"er#&ghable%#ton',
+    '$\'derette#$rels#%sanne"&vished")w-abiding##ler%"ss#$suit"$yton"%zarus#%iness!"ch!!d!%eaded%!n',
+    '$$ings#%thery"%dgers%!s""ek$!s#!s$!e##way"%fevre#$tist"%gible$#ons$(slatures$(timation',
+    '"&inster"$land"$mons""na#"dl#%gthen#%iency#$tils"$onid#%pards"\'ssening$#ing"\'thargic\'!y"$vine',
+    '",xicographers$%ngton"$yton!$ibby##ido#*rarianship$$etto#$yans"&censee(!s\'!s##hen&!s#"ks"0eutenant-colonel',
+    '"\'fe-long%&saving&#ize%+threatening$%boats$%times"&gament$"nd&!s#*ht-hearted&%years%$ened&"st")ke-minded"#lle',
+    '#$oges$$usin##ply""na#%eages%#rly$$sman#$gers$*uistically#$ings#$k-up$"er#\'lithgow#!o$$leum',
+    '##tel"%phook"%queur$&idated""ra"&sabeth"#the#&igants#)tle-known"#vid!\'lewelyn!$oath"%bbied&!s#"es',
+    '#!i"%dgers"$ftus"(gistical"#ins#"re"#max#%bardy##ond"#ner#\'g-lived$%itude$$term##rho"&ok-out',
+    '$#in\'##ped$$hole(!s##ser"#pez"$renz#%rimer")ss-making"#tta"%udest$(speakers#$nges%#ing#"th',
+    '#(e-making$#joy$&making"\'w-lying##ers$%stoft#$ther!"ps!"si!"t.#%-col.!$ubor""ch#$ifer$#lle',
+    '"#igi"+k&aacute;cs"&mbered&#ing#$inal##pur#$sden"&natics#"dy#"ge"&rching#!k$"ed"&scious""te',
+    '"!v"#xor!(ymington"%neham"$tham "m2!!3!!6!$acao$"ri#(hine-gun+!s#!k#\'pherson#+roeconomics',
+    '#!s"%dison##ras$$igal"!e#"ve"!g#&dalene#%ilton#)nificence&$ying$$olia$"um##pie#%ritte',
+    '##mud#"on"!i#\'l-order$"ed#"nz#!r##son#!t""j.##lis"*ke-believe"+labsorption$$mute$!y',
+    '$&gnancy#%lachy%"rd$%eable%$nder##ton"(nageress#&churia#&darins$$ible(!s#$fred#&ganese$#led$!o',
+    '$)pulations##ley#\'nerisms#&ometry#"se#!x"&radona$%uding#$bled#$coni#"ek#$gate$(inalised#$illa$$ners',
+    '#$lene$"in#$mite#"ne#%riott#\'shalled(#ing%!y#!t$#ens$$inez&"ho&!i&!s$!y',
+    '#&velled#\'ylebone"$scot#$kell#$onic#\'querade)#ing#*s-produced$/achusetts-based&#red(!s%#ged&#ing$"if#&terful',
+    '&"ly"*terialised*#tic#%hilde#\'sushita##ted$"ie%"ng#$ures"(uritania&#ius#&soleum"(ximilian&&sation&$zing',
+    '""ya#"ne"#zda#\'owiecki!"be!\'calpine"$cabe$"ll#$lair#&ormack"\'donnell##unn"$ewan"\'farlane"#gee',
+    '#\'uinness"$hale"!i#(llvanney"%keown"(laughlin#\'oughlin"%manus"&namara#$eill"\'pherson"%queen!"dc!&eander\'#ing',
+    '")chanistic"!d#&allion#%dling#&iating&#ors$"cs$&ocrity$\'tations#&melton"$ehan"#gan"&lanoma#)odramatic$"ns',
+    '$!s##vyn##was"%mento#"os#$phis"(nacingly##dez##ial"!p"+rchandising\'%table$%iless)"ly$%urial',
+    '#%idian$#ted##son"(smerised#(opotamia$$zoic#&sianic"+tamorphosis$*phorically#%calfe#"ed$&orites#%hanol$(odically\'"sm',
+    '&\'ologies""ws!$g/kg#"ml!)ichaelmas$(elangelo#,ro-organisms%#bes%$cosm%$film%&kernel%&scopes"\'d-1950s$)afternoon$#day',
+    '$\'january%#une$%march%&orning$(november$\'october$)september$$week#)dleweight#"ge#\'lothian#$sole#&wifery"&ghtily#&ratory',
+    '##dew#\'estones$#tti#$ford#&lennia$!y##ner##roy"&micked&#ing%"ry##osa""na##ced#$ders',
+    '#(eworkers##gle#\'iatures$&malist%$ized\'#ing#$ogue#"ts#&uscule"!r#\'&oacute#!e#&roring"*sbehaviour#)carriages',
+    '-!s#(fortunes##hap#+interpreted#&judged#%nomer#$read#%souri#&tletoe$&resses#*understand$#sed"!t#"es#&igated',
+    '#*ochondrial#"re!"nr!$oans"*bilisation\'!e(!d&#zed##utu"\'ckingly"$dems$%rates%%n-day&#ise#!i',
+    '"$ffat"&ldavia""ma"&naghan#\'etarist*!s#&klands#%mouth#\'ographs$\'nuclear$&polist*"ic#&signor#%tagne%"na',
+    '$\'gomerie"$oney$#lit##res$#ing\'!s#"se#!t"$pped$#ing"!r#"ag#&ecambe$!s#%ibund',
+    '##sel#$tars"%sques##ses"!t#&hering#&ivates\'%ional#\'orbikes#!t"\'uldings%!y#)ntainside#"rn%"ed',
+    '#$thed"%vable##ers"$wing!%p/con"!g""rp!"ri"!p!"s."!s!$ucky##ous"$gabe##ged',
+    '##ler#%roney#+ti-coloured&,disciplinary&%media&$user%)processor"&mbling"#nch%#ing#$ster"%rmurs"%scled#"es#%grave',
+    '%#als#(selburgh"%tated#\'ilation!!v"!s!"yc"$thic$(ological %n-oct!#.b.!!1!"ab"#cab#%ional',
+    '%#pur""ff"!g#$orny"#irn#$vety"&mesake#%ibian"%pkins"\'rration$&owness&!s"%scent"%talia#&haniel',
+    '(%istic$$vity#\'uralism%"es"#vel#)igational"&zarean&"th##ism!!b!\'earness"\'cklaces%#ine#%rosis"!e',
+    '#(ligently"#hru"#lly"!p#$hews""ro"$sted$"le&!d"%tball##tle"%umann#%rones%%pathy#&trinos',
+    '"$vada#)er-ending"&w-born##all#"by##ell#$gate#&ington#&sprint$$room#&tonian"\'xt-door$$step#"us!"fu',
+    '!&ibbled%#ing"&ceties##hol#%klaus$%names#$osia#"ra"#ger#%gling#\'htclubs%$life"$kkei#"os"%lsson',
+    '"+ne-year-old##ian""ro"$tric!"ld!#mda"!r!!n!*o-nonsense"&bleman&"en"%dules"#gai"$mads#"ic',
+    '$)communist\'\'pliance$%human$&league%%inear$\'members$%party%(olitical%,roliferation$(resident$\'smokers%(tatutory&#ick$+traditional$\'violent',
+    '#)chalantly$)onformity#(sensical"%odles#"se"+rmalisation\'&zation#"se#&thgate%$wich#\'wegians$#ood"&tables#$epad&#per',
+    '#$ting"%urish\'"ed\'#ing#$veau"#wak!!p""fl"!v!$spcc!%uance"(cleation"#des#$ging"&mbness',
+    '""pe!!v""qs!!y!!z )o\'connell"&reilly#%ourke"(sullivan!#ars"#tes!!b""an"\'jecting"(ligingly',
+    '""oe"&scures&#ing#\'essions#\'tructed"%viate!$chre"#t-1#$amer#\'reotide!\'dd-knut"!e#"on"%yssey!%edema',
+    '"\'strogen!\'ff-duty$\'licence#$hand#(icialdom#%shoot!)glethorpe!\'intment!\'lazabal"%d-age"\'igarchy"#sen#"on!$magh"#ega',
+    '"&itting"%nibus!\'n-board#&screen"&coming"-e-dimensional$$half"%stage!#oze!+pen-mouthed#$rand")portunism*!t+"ic$\'sitions',
+    '##ics$%mised"%ulent#!s!%rator&!y"!b#%iting"\'dinance#\'ovician""es")ganically"%mesby##ond"(namented',
+    '"$tega!$saka"$cars#)illations"$iris"%setia#"ie"*tentatious$(oporosis!$tago"!c""is!#uch""ld""se',
+    '")t-of-date#._of_touch_with#%board%#und$(uildings#$cast$$rops#&goings$$rown#\'landish%"ws#%moded#&number#$post#%reach',
+    '%&ripped!*verbearing$$cast%$omes$"do$(estimate$&growth$$hang&$uled%&eating$%joyed$$land&$pped&!y%#ord',
+    '$\'powered$&ridden$$seen%%tated$\'turning"\'ulation!.wner-occupiers!\'xbridge""on!!y \'p&amp;l!#.a."!c""s.!!5',
+    '!$ablo"&cifism\'"ts#$kard$"er#"ts"%dlock#"re"(ediatric"\'gemaker"#ine$\'killers$$less$%twork"(kistanis',
+    '$#rmo#$lets$"id%$ster$"or#"ma#"sy##try"&mpered"%nacea%"he$%sonic#$cake\'!s#$dora',
+    '##ted$$heon&!r$!o"#olo"!p#\'erbacks",r_excellence#%ables$%doxes$#gon%#uay$*militaries$!s#!c',
+    '#%doned#&entage$"to#%geter##kes#$rots&!t#$sing#(t-timers$)icipative%&tioned)!s##vis"&ssable$%er-by',
+    '##ted$$iche%#mes")ternalism*#tic#)hetically$&finder$&ogenic(!s%!s#\'riarchy%$mony%#ots$%olled%&nizing',
+    '"%ucity##per&!s""ve$!l#&ilions##lov"#wns"$xton"#yer##ton!#cbs"!c"!f"!p',
+    '!,eace-keeping$#hes#"ke##rly#"ty##vey")culiarity"\'dagogic)"al"%ebles#!k##ped"%lican"\'mberton$)rokeshire',
+    '#"da#\'etrates#"ge$$uins##ned#$rose#$t-up$&agonal$%ecost$%house$$land""pe#(percorns#!s$!i',
+    '"*rcutaneous#\'ennials$!s$!z#*fectionist$&orated$$umed\'!s%&nctory#%icles$&lously$%natal$&shable#!k$"in',
+    '%!d$*issiveness$(utations#(petrator+!s&%uated#$rier#!s$&isting$\'onified$#pex$\'uasions#!t$)aining_to$&hshire',
+    '$&ersely\'#ion&!t\'"ed"#tal#$ered##ion$!t%&ioning#*rochemical#&ticoat#%ulant!"fa"!k!"ge',
+    '#$raoh$%isees$&macist"\'easants##lps#-nomenological#\'romones#!w"+ilanthropic+!y$+osophically$$pott##pps"$obia#%nemic',
+    '("es#(tocopied*!r*!s($ying%(graphing%"ns"%rased"$ysio!(ickerage$$ings$#led$$wick#$nics#"ts',
+    '##ger"&nching#"ks#"ot"\'pelines$#tte$$work##kin"$tman#%tance!"kk!!l"!a#%cards%"te',
+    '#"id$%ntive$!t#%nkton$\'tagenet%#ers#\'sticine##ted$#ing$$onic$#ter#&y-offs$%fully""c-"\'eadings',
+    '#%dging#$nary#$ssey"&odding#%tters#&ughman&!s##ver"&ucking#%gging#"mb#$nder\'"ed#(ralistic)!s',
+    '"!y!%mol/l!(neumatic!\'ocketed"$dium#!s"(indexter#%tiers"%laris\'"ed&"ty&#zed#$emic\'"al#$itic',
+    '#$lard$%sters$#ute\'"rs#$ygon\'!s$)propylene$+unsaturated%\'rethane"\'merania#!p$#eii%!y$$idou"\'nderous',
+    '$%ypool"$odle"$plar##per#%ulous"&rpoise#(tability%"ls$"ia%"ng$&raying\'!s"(sidonius#"se%$ssor',
+    '%*industrial%)operative$$code$&humous$)modernist$)operative$&poning%\'randial$(synaptic$$ures",tentialities#$ters$#ing$!s"#urs',
+    '$#ing"+wer-sharing%#gen%%house!"pm!(ractises#\'gmatist#$irie#!t##vda##xis"*e-election%\'minence&"pt$*industrial',
+    '#%cepts$)ipitating(#ous$%ludes$&ocious%\'nceived&\'ditions#\'dicated)!s&#tor%)sposition$(nisolone$(ominated##fix#$heat',
+    '#%miers#!p$(aredness#*requisites$(ogatives#!s$)byterians)!y$\'entable\'#ers%!t$#ide$%sured$%twick$&uppose',
+    '&#der$$oria$(reatment$$tier\'"st"!i##ded%!s#%estly#!m$#ing$&ordial$%roses#&ncesse)!s',
+    '$$tout#%oress#"se%!d#(vatising\'#zed"+obabilistic$)lematical#&claims$$ured&#ing#!d$$ding$$igal&!y',
+    '$&icient%#ted$%usely#$geny#&hibits#(liferate*#ive$&onging#!m$\'iscuity(#ous#*nouncement#&pagate$"el&$lers',
+    '$(ortioned$$ping$&ulsion#\'scribed$#ser$(tacyclin#)tectorate%(stations#$verb$%ident$$okes#%wling"!s"%udhoe##ned',
+    '""oe"+ychosomatic&\'therapy!"ta!$ubic#%lican"#ffs$!y"\'lsating$"ed$#ing"%mpkin"\'nchcard$%tured#\'ishable',
+    '##ter#!y"*r&eacute;e#&gatory$"ed#$ists$$tans#\'porting%$sely#$ring#$suer\'!s&!s"!s#$hkin',
+    '"#tts$!y!!w!%ylons"(thagoras"!y #q.c""t.!$atar!#q.v!"ua#!d$$rant%$uple#"il',
+    '#\'lifiers#$ngos$(tifiable&(tatively##rks$\'relling%$ying$$tets#"sh#\'ternary$#tro##yle"!e#\'stioner##ued',
+    '"(ickening#&escent#$lted#"ne$#tet#$pped##rky#"ss#"ts#$zzed%$ical)"ly "r1!!2!$4000',
+    '#%ially#$kets"&diance%"te\'!d"$fael&!o#$fles#"ts"#ges"$ider#$ling$$road#"ne"!j',
+    '"$mble#"os#$page%"rt#!s$#den""nd#$goon#\'itidine#*k-and-file#&sacked"!o"#pes#%idity%!s',
+    '#!t$#ure"$rest"$shid#(pberries$#ing"\'tcliffe#%eable#%hbone#(ionalise*!t)"ze&"ed"#vel$#nna',
+    '$%shing"#wls"\'ybestos##nor!!b""ge!\'e-enter$&xamine#$open\'"ed##run##use"(activity#%gents#%lists',
+    '##ped$#ing$(pearance#(rranging#%ssert("ed&"ss"&belled##orn#%uffed"(ceptions$$ssed&$ions#%harge#%itals',
+    '#&lining$#use#\'ogniser$"il&"ed$%llect$&mpense$+nsideration*"ed&)tructions$+rd-breaking$#unt\'#ing\'!s$$vers',
+    '\'#ing$*iminations#\'tangles"\'d-faced#%dened#\'eemable$$fine$$sign("ed#%grave#+istributive#$ness"$eled$!s"\'fectory',
+    '&#nts#%illed$&neries#&lector#)reshingly$)igerators#!s#\'uelling$#ted"(generate#$imen$"na$&onally$&strars#$ress',
+    '#&ulates"(imbursed$!s#*ncarnation$%state%&urance$\'troduce*$tion#$ssue"&joiced"(lativism$\'xations#%ented#&ishing"\'marking',
+    '\'"ed#)iniscence$&ttance"\'ndition#!e$$gade#$frew##oir#$tals"(organise*!d(#zed")parations#%elled\'"nt',
+    '#&lenish$$icas\'#ted#*ossessions#-resentational&!s$%imand)"ed%"nt$&oduces#$tile#&udiate(#ion$%gnant$%lsive',
+    '$$uers&!s#&haping#&idency%#ing%$uals$"ns$$stor&!s#%olves#(piration$\'lendent$\'onsibly#$tful$\'orative',
+    '%#ing"&tainer$%liate#!d#\'hinking#&icence$#nal#$race\'!d&#ted$#ial"&vamped#%elled\'"rs&#ing',
+    '#(isionist&#ted##oke$#lts%"ve\'!d#"ue"\'writing"%ynard!"fu!"ha""ee#\'umatism\'#oid"(inoceros',
+    '"%ubarb""yl#$ming#!s!%ibbed"+chmondshire##kie""ga#"by#&htness"%otous"#pen%#ing##per"(sc-based',
+    '##ley"$vera%$bank$$ting!!m!!n""li!$oars"%berta"$card#$kers%#ted##oco"$dent#$gers',
+    '"$gues""ma$$nces%!y#$ford#!p"\'naldsay"&oftops#!k$!s#"my##ney#&tstock"#ped$!r',
+    '$#tte\'!s#$heen#"si"(tational#%hmans##ors##ted$\'weilers"%undly##ter$#ing"$ving"#wdy#%lands',
+    '!"pi"!r!!r!\'s/6000s!!u"$bens#!s""ck""dd##ely$$ness""ff""hr"%inous"&lebook',
+    '"\'mbelows#%maged#$pled"&n-time#$down#"ny"&ptured""se#!s##ted$#ing"!t#)hlessness$#ven##ter',
+    '!"ya"#ker"%zhkov &s.l.t."#tdy!#/he!!2!!3!#aab"&batini#"ha#"re"(craments"#dat#$dles',
+    '#$rane"%intly"#lah$"mi#%inity#$mond##ome%"on$#ons#%tburn#(vadorean"\'maritan)!s#"oa#$pras',
+    '")nctuaries#(dinistas$&stones$&wiched$"ys#%guine#!s$$krit#%terre$!o""pt"&racens$#wak#)donically#$gent',
+    '##urn"\'ucepans$!y#&ntered#%ssure"%vaged&!s$$nnah#&e_that$!r##ile%"le#%oured&#ing"$wing',
+    '#!s##yer"!x"%yings!$cala%#ble$#pel#"mp%$ered#%nners$"ty"%eptic"&hemata%#ing#%iller',
+    '#&neider#\'oenberg$&lastic$&oldays&"ed&%girls&$room#$ramm#%umann#&weppes"+lerotherapy"%offed#$lded#%oping#&rching',
+    '$#ned$#pio\'!n##tia#%uting#"wl%#ing"&rabble(!d\'#ing$#pes%"py$$wled#&eeched\'#ing',
+    '\'#ing%"es#$olls#%uples%\'ulously$\'tinized"#uba#!d#$ffle#\'nthorpe!+e&ntilde;or,#ita"\'a-level##bed#%gulls',
+    '##mus#%rcher$!s#$ward""c.#(ond-rate#\'retions#%toral#\'uritate"!d##ate%#ion#%ition"#edy#!p',
+    '""ga#&mental\'"ed"$kers"#les#+f-awareness%\'centred&(onfident%*discipline%*evaluation&)xpression%\'imposed&(ndulgent%$made%(portrait',
+    '%*regulation%\'service&%tyled$$less#%hurst""ma#*i-circular%\'skilled"$ndei%"ro#&eschal#(sitively(%ities#%tries"\'parable',
+    '("sm"\'quenced&&tially$#oia"%rfdom#+geant-major#$ials#&otonin#\'pentine#$rano#(viceable"$same"\'t-aside#"on")venty-two',
+    '%#ing"$well"(ychelles!#gt.!$hack#&dowing$$well#!e#!g##les$%lower\'!s$!t##med%!n',
+    '%!s$"ti%!y#&peless##rds$$pest#$tter"#eaf$$ring%!s#\'epishly%$skin#$ikha#$khar#$lled',
+    '$&ingham#(tlanders"#ied##fty#!h#$lton#&mmered#$pman$%yards##res#"te#$vers""od#&emaker#&ot-out',
+    '#$pper#"rn$)t-sighted%$horn%$list#)stakovich#\'uldered#)wbusiness$%piece$%rooms"#red$$wdly#$ieks$%nkage&!s',
+    '##ugs"%unned$!t#%tdown$!s$#ter!\'ickened"\'delined##ing"\'egfried#"na""ft$"ed$#ing"\'ghtings',
+    '#"ne%!t$)ification\'"er$#ora&#ina$$post(!s"#kes#"hs"$lage#(houetted#%urian"!m##mel',
+    '#(plifying#&ulator"#nai#*gle-handed\'#sex&#ton$)ularities#\'usoidal"%obhan""re##ith"$tter$$ings#(uational"(xty-four',
+    '!$kate%!s"%etchy##wed""id#!m#&nheads$\'nergate#"ps#%rmish("es$#ted"&ylight!!l"!a',
+    '#"ms#$nder$#ted%#ing#%shing##ven$$onic$!s"&eepily$!t"#igo#$pper#&thered\'#ing##ver',
+    '#"rc#(w-moving"%umber#!r$#red#!t"#yly!\'macking%!s#)llholders)#ing#$rter"$ears#%lting"#irk',
+    '"#ock#%lensk#$ther"$udge##gly!$nags##ppy$%shots#"re$!l#%tches"&eaking#%ering$"ze"#ipe',
+    '$$pets""ob$$bery#&dgrass#"re$$ting#%wball$%drops$#ing$!s"$ugly!(o-and-so"$ames"&bering%"ly',
+    '$+o-political%*linguistic"%journ"&larium##der##ent#\'iciting#%oists#\'ubility$"te##ves",mething_like#"me"%natas#\'gwriter',
+    '"#phy"%rcery##rel$#ows##tie&!s"!s"+uffl&eacute#)ght-after#&ndness#"ps##red#&therly%$ward"(vereigns',
+    '#!s"!y#!a!\'palding#$niel#*rcstations$$ring%#ows$#tak&"ns##sms#&tially"\'earhead)"ed#!c',
+    '($zing\'$ties$!k$!s#%edway#"ke#\'llbound#$nder"$icer#"ed$%lberg#%llage#$ndle#$rals$!o',
+    '$!s"&lashes$#yed#\'intered(!s#(uttering"%onges##oky$$nful#%tless%%ights$"ty#"ut"$rawl#\'ingboks',
+    '&$time&!y%$kler%#ted&#ing"%urned$!t!)quabbling$&ndered#%eaked&!y%!l&"ed&#ing##int',
+    '$$rmed%!t!"se""rs!"ta#*bilisation("ed(#ing#%ccato#"gs#&irwell##ked#%lling$%warts#$nces',
+    '%*ardization$$hope$!k$#ton$"za#$rdom$$fish$%lings$!r$\'tlingly#"si%!s#&te-run$)isticians$#us.',
+    '$%rogin"!c"\'eadying$"ls$"my#$eple$"rs#$llar#%nosis$!t#$pney#*reotypical*"ng$)ilisation$"ne',
+    '&!r#$lled%!s$#ted#&mulant##ngs$"ks#&pulate#"rs""ok$*e-on-trent%$sley#\'nehenge&$ouse#%oping',
+    '#"we%!d%!y"(raggling$(ightaway$\'ngeways&"le($hold$%pping$\'tegists%*igraphical%(ospheric$"ws$$ying#&eamers',
+    '#&ictest$$nger#(ongholds#"ut%!s""ub$"bs%!y##cco#$mped##nts#\'pendous$"or"!v"%ylist',
+    '$"us!-ub-committees&\'ntinent#)continent\'\'ractors$&ulture%\'taneous#(division+!s$"ue#\'jecting("on#$mits#(sections%(quent_to',
+    ')!s#$tler&$ties$\'racting#%urbia#$vert"&ccinct$%ulent##ker$!s#$tion")fficiency$&ocated(#ion$$used',
+    '##den"%harto"&icides"%lking$!y#%phide%$uric##try"\'mmarily\'$sing%$tion$&ertime$%onses"%ndial#&flower',
+    '#&select",perannuation%(computer%%human%#man%&natant%&scalar&$onic&$parc&$tars##ine#\'planted%(ementing$$oses#*ranational',
+    '"%ragai#&charge##ere#&facing##kov#"ly#%names#$real"&sannah#\'pending&%sions#%tains$&enance"$ture"$zuki',
+    '!!w"!1"%ahili#"in##les#"nn#"po$!s#"rm%"ed%#ing##the&!d#&ziland"%eated',
+    '#&etcorn%"er&"st%"ie##lls""ig#%msuit#"sh"&ooping#&rdfish!\'ycamore#$orax"!d"\'mbolise)!d',
+    '#\'dicates#$ergy#%opsis#(thesised(#zed"%rians$$nges "t\'!!2!$9000!)abernacle#$ular"%citly#"ky"%dpole',
+    '"%ffeta"%gging"%ilors##pei"(jikistan"&keaway$"rs$%shita"!l#&kative$#in\'"&mpered&#ing"#ndy#\'ganyika',
+    '#$kard#$ning#$trum"%pered"#riq#!n##tly"$shie#%mania#!s#%teful("ly%$less"%tters$$ooed',
+    '$!y"&unting"$wdry#"no"&xonomy!#ccb""ga""r-!/eacher-training##gue#!k#$time",chnicalities%*ologically*#sts',
+    '"%eming#!n#%thing""l.#%ecoms"\'mpleman$!s"&n-year($-old#$able$%cious#$dons$$rils#%erife##ner',
+    '##ths"(rminator%#tes#!n$!s#"ra$#ors#"se%"ly"\'st-tube$#ers$%icles%&monial"$xaco!$hame',
+    '#\'orizing#(reabouts%"on%$upon$*modynamics&\'nuclear"$ingy#(rd-party&%world$\'ty-nine""om#!o#)roughbred($fare($ness',
+    '#(ughtless"(readbare$&e-hour&%piece&\'quarter&#way\'#eek$%shing#$ived&!s#%obbed$"es$(mbolytic\'#sis\'$xane',
+    '$&ughput#$usts"&udding#!g#\'nderous"$wart!\'ickling"*ght-lipped%$ness"#lda##ley$!s$!y"+me-honoured%%scale',
+    '$\'tabling#"my"$ngle#$iest#&kering#!t"%ptoed"$rana#\'elessly"#tan%#ium#"he!!l!!m!"nc',
+    '""go"(iletries"%mmaso#\'ography"#ner#"ga$!s##ing"\'othache$#ing"\'p-class#$less##ple#$soil"$rbay',
+    '#$ness#$pedo#%rance#&toises"\'uchdown%!y#!t"\'welling$#red"$ying!"pa!%racer#&desman$+itionalists#)jectories',
+    '%!s#$nche$*quillizers$!s%&cended*$ntal&(riptions%\'fection\'#ree)#nce&*ormational&&usions%(gression%&istors&$tory',
+    '%\'mitters%\'planted*!s&%orter)!s\'#sed&$uter%\'vestite#$umas#$vers%#sty"%eacle$"ds#$bled#\'e-lined',
+    '#$llis#$molo%"rs#\'spasser(#ing$#tle"\'ibesmen$\'utaries(!y#%ckled&#ing#%fling#%llion$#ogy##pod',
+    '#&umphal##via"%odden##jan#"ll%#ope%!s#%opers#$tter##wel"#uer#%ffles#%ndled#"ss$\'teeship',
+    '!!u"#bby##ers##ing"$fted$!s"$lips"(multuous"#ner#%gsten"&ppence"+rning-point%"ps$$pike$%table',
+    '&!s"$scan#"ks##sle"$tilo"$xedo!#vei!%winge""o-$*and-a-half$$part(!y$&storey!&yndale"&peface',
+    '##ist#\'ography$$logy"%rants#"on$$sine #uae!"da""cs!"fo!\'gliness!\'k-based""cc"(rainians!+ltra-violet',
+    '"%ysses!(mbilical!"na#*ccompanied&\'untably#$ided#(nnounced$)ticipated#(shamedly$(sailable%%uming#)ttainable#)uthorized#%wares"(bearably',
+    '#%iased#\'uttoned"&caring#"ed#-haracteristic0$ally#,onditionally%*sciousness%)trollably(\'versial$&vering"\'damaged$%unted#&efined$\'manding',
+    '$\'r-fives%(carriage%)developed%$goes%#lay%$pins%&stated\'#udy%&takers%&valued%%write$&tected&$rred$\'veloped#-ifferentiated',
+    '$(scovered$%vided"!e#\'asiness#\'ducated#*nforceable#!p#&thical#%venly&$tful#\'xplored"(faithful$(vourably#$olds$(rgivable',
+    '"\'guarded"&harmed#"cr##oly#&urried%!t"(icameral$#orn#"fy#*maginative#\'nformed$\'habited%&ibited$)tentional##tes',
+    '"%kempt#%indly"&listed$!t"*manageable#"et"&nerved"!o#\'bserved$)trusively#)fficially#%pened"$pack$\'latable#(erturbed',
+    '*$ness#-redictability$\'omising"*questioned")ravelling#&eality$(cognised$\'gulated$\'lenting$\'mitting$\'pentant%%orted%+resentative$(sponsive")satisfied',
+    '#)cientific#%eemly#%haven#%olved$+phisticated$#und#(peakable#\'teadily$&ressed%\'uctured$#uck#%uited$"ng$\'pported$*rprisingly',
+    '"(thinking#%imely#\'roubled#&ypical"&usable"$veil"$wary$$shed#%ieldy$\'llingly$!n%!d#&rapped"(yielding!"os',
+    '"$beat")holstered"\'lifting"&rooted")side-down"%tight"$wind!$rals"*banisation&&zation"$chin""ea#$thra"!n#!s',
+    '!\'tensils")ilization&!e"%recht"#tar#%erson "v6!(acations##lav"$inly"(lidating$"um##our"#nce#\'dalised',
+    '#$ices#&nished"$ssal&!s"&ulting!%eered")getarians"\'hemence\'!t"#ils"$lcro##lum"&nereal$&zuelan#%geful',
+    '#$tura&#ing"%randa#%batim#"de%$rers$!i#!e##min#&tebrae("te#"ve"&sicles#$tige\'!s',
+    '$!s"%tting!"hs!#ibe$!s#$rate"\'carious#$eroy$!s#"hy#$tors"\'deotape"!e#%tminh#%wdata',
+    '#$nius"!n#(dication##nie$!y"%olets$%inist&!s"%rgins$!o#%tuoso#%ulent"&sceral#\'itation#"or',
+    '#*ualisation\'#zed"#tae"!v#%ienne#!o""z.!\'ocalist""le#"ga##kov#"s.#!t$$aire#)unteering',
+    '""us"!x!!p!(ulgarity#$ture!$ying %wacky"$ddle#"ed$"rs##ing"$ffle##ted"!g#$ging',
+    '"!h"\'istband#)ting-room"%keham"\'llabies&!y%#sey$#ets$#ing\'#ton#$nuts#\'singham#$tham\'$stow#%worth',
+    '#!e$!d##ing##ker#$tage"&r-torn##dle$$ship#(ehousing#$lord#$mest#$ship"&shable#"im"%tcher',
+    '%$gate%&logged%#way"&veform"%yside!(ealthier("st#$ning##rer""bs"$dded"#edy#&k-long$$days"+ll-balanced',
+    '&&ressed%(equipped%#off%%to-do%$worn$!a$"ed%!r$#ies%"ng\'$tons#&shpool#!t$"er##wyn',
+    '#(sleydale#&tworth"&sleyan##ter&"ly$\'morland$\'phalian$$wood"&therby#$land##ter$#ing"&ymouth!$hack"&eezing',
+    '\'#ing$!s##ned#%plash#&rlpool$$ring#$sker$$tler#!t$\'e-faced%$wash$%field$#ing$%taker%&ington',
+    '"\'oleness%%saler#%oping##res!"i\'"&ckedly"(ddicombe""gs"#lds#$fred$$ully#$helm#"ts#!y"#nce',
+    '$$ings$%mills$&owsill$%scale%$wept$$ward#%ifred#%nings#)terbottom""ry"\'sconsin#"py"$tham$"er$&ington',
+    '!%obble%#ing##urn""es"#gan"#lds#"fe"+man-centred%$hood"(nderland$$rous")odchester$%house$&pecker$#row',
+    '$$wind%%orker#!f#&lworth)!s#$tton"&rdstar#&kgroup)!s$%mates$#out$&places$%sheet#(ld-class&&famous',
+    '##sen$$hips$#ley#%thing!!p"!c!(rangling#%ppers#!y"&ecking%!s#$stle\'!d"(ongfully"#ung',
+    '!"yn#$dham#(ne-jones""re )x-windows!%anthe!\'iaoping""ii!"vi!!x (yakovlev"$nked%!e"$rrow!"ds',
+    '#&r-long$#ned"#gan"\'llowing\'"sh"$remi!#mca!#olk$!s"!n"$rker$(shireman"$unis#!s!"um',
+    '""ri"$ssuf#"uf!#ves #z88!)a&iuml;re"#cco#!k"%mbian"$nder!&ealous"&ppelin"#ros!&hivkov!&ig-zag',
+    '#&merman""ps!&oology#!s!#zap',
 )
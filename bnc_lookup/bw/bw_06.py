@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_06 = (
+count_06 = 6694
+
+heads_06 = (
     '&agrave_la_carte',
-    '&amp&dollar',
-    '&amp;c',
-    '&circ',
-    '&deg;c',
-    '&dgr',
-    '&dollar;1,500',
-    '&dollar;15',
-    '&dollar;30',
-    '&dollar;300',
-    '&dollar;400',
-    '&dollar;5',
-    '&dollar;50,000',
-    '&eacute;lites',
-    '&frac34',
-    '&lgr',
     '&mdash;the',
-    '&micro;g/ml',
-    '&micro;mol/l',
-    '&ngr',
-    '&pgr',
-    '&phgr',
-    '&pound;1.25',
-    '&pound;1.3',
-    '&pound;1.5m',
-    '&pound;1.99',
-    '&pound;10.99',
-    '&pound;110',
-    '&pound;12.50',
-    '&pound;12.95',
-    '&pound;120,000',
-    '&pound;12m',
     '&pound;13,000',
-    '&pound;14,000',
-    '&pound;14.95',
-    '&pound;15.99',
-    '&pound;15m',
-    '&pound;16.99',
-    '&pound;160',
-    '&pound;17,000',
-    '&pound;170',
-    '&pound;175',
-    '&pound;18,000',
-    '&pound;180',
-    '&pound;19.95',
-    '&pound;19.99',
-    '&pound;200m',
-    '&pound;21',
     '&pound;225',
-    '&pound;26',
-    '&pound;3,500',
-    '&pound;3.5',
-    '&pound;3.95',
-    '&pound;30m',
-    '&pound;32',
-    '&pound;350,000',
-    '&pound;4.50',
-    '&pound;4.95',
-    '&pound;40m',
-    '&pound;5.00',
-    '&pound;5.95',
-    '&pound;5000',
-    '&pound;550',
-    '&pound;6.50',
     '&pound;650',
-    '&pound;6m',
-    '&pound;7.50',
-    '&pound;7.95',
-    '&pound;700,000',
-    '&pound;85',
-    '&pound;9,000',
-    '&pound;90,000',
-    '&pound;95',
-    '&pound;99',
-    '&rehy',
-    '\'91',
-    '\'92',
-    '\'i',
-    '\'ome',
-    '\'un',
     '**',
-    '+2',
-    '+44',
-    '-20&deg;c',
-    '-3',
-    '/&egr/',
-    '/h',
-    '0&ndash;1',
-    '0.01',
-    '0.75',
-    '0d.',
-    '1&ins',
-    '1&ndash;5',
-    '1(2)',
-    '1,700',
-    '10&ins',
     '10&ndash;12',
-    '10&ndash;20',
-    '10.6',
-    '10000',
-    '10cm',
-    '10k',
-    '11.00',
-    '11.6',
-    '11pm',
-    '12.2',
-    '12.3',
-    '1290',
-    '130,000',
-    '14.5',
-    '15&ndash;20',
-    '150th',
     '1540',
-    '1547',
-    '1558',
-    '1559',
-    '1560',
-    '15p',
-    '16.5',
-    '1603',
-    '1620',
-    '1630',
-    '1640s',
-    '1645',
-    '1648',
-    '1651',
-    '1652',
-    '1653',
     '1659',
-    '1662',
-    '1666',
-    '1670',
-    '1675',
-    '1685',
-    '1693',
-    '1694',
-    '16s',
-    '1701',
-    '1702',
-    '1707',
-    '1713',
-    '1714',
-    '1717',
-    '1721',
     '1727',
-    '1739',
-    '1746',
-    '1747',
-    '1751',
-    '1752',
-    '1754',
-    '1755',
-    '1756',
-    '1757',
-    '1758',
-    '1759',
-    '1760s',
-    '1761',
-    '1762',
-    '1764',
     '1767',
-    '1769',
-    '1770s',
-    '1781',
-    '1782',
-    '17th-century',
-    '18&ndash;30',
-    '180&deg',
-    '184',
-    '1914&ndash;18',
-    '194',
-    '1977a',
-    '1982a',
-    '1983a',
-    '1984&ndash;5',
-    '1985a',
     '1985b',
-    '1986a',
-    '1987a',
-    '1988&ndash;89',
-    '1988-89',
-    '1988/89',
-    '1988a',
-    '1989a',
-    '1993&ndash;94',
-    '1:1',
-    '1gb',
-    '1in',
-    '1mm',
-    '1oz',
-    '1pm',
-    '1s',
     '2&ndash;5',
-    '2(2)',
-    '2,000,000',
-    '2,200',
-    '2,300',
-    '2,400',
-    '2-3',
-    '2.00',
-    '2.10',
-    '2.15',
-    '2.25',
-    '20&ndash;30',
-    '2020',
-    '20pc',
-    '20th-century',
-    '21,000',
     '218',
-    '219',
-    '22,000',
-    '224',
-    '225g',
-    '225g/8oz',
-    '227',
-    '23,000',
-    '231',
-    '232',
-    '233',
-    '234',
-    '24&ins',
-    '24,000',
-    '241',
-    '243',
     '246',
-    '248',
-    '249',
-    '251',
-    '254',
-    '255',
-    '257',
-    '258',
-    '259',
-    '25g/1oz',
-    '25mhz',
-    '26,000',
-    '262',
-    '265',
-    '267',
-    '268',
     '27,000',
-    '271',
-    '272',
-    '273',
-    '274',
-    '276',
-    '277',
-    '278',
-    '281',
-    '287',
-    '288',
-    '289',
-    '295',
-    '297',
-    '2am',
-    '2ft',
     '2lb',
-    '2s',
-    '3&ins',
-    '3&ndash;5',
-    '3&ndash;6',
-    '3(1)',
-    '3-4',
-    '3.11',
-    '3.14',
-    '30&ndash;40',
-    '30-year',
-    '302',
-    '304',
-    '305',
-    '306',
-    '309',
     '30cm',
-    '30p',
-    '312',
-    '313',
-    '315',
-    '32-year-old',
-    '33-year-old',
-    '332',
-    '333',
-    '34-year-old',
-    '35-year-old',
-    '3500',
-    '353',
-    '35mm',
-    '36p',
-    '37-year-old',
     '375',
-    '384',
-    '390',
-    '3b',
-    '3i',
-    '3in',
-    '4&frac12',
-    '4\'s',
-    '4-1',
-    '4-2',
-    '4.10',
-    '4.30pm',
-    '400m',
-    '404',
-    '40p',
-    '41%',
     '410',
-    '415',
-    '425',
-    '440',
-    '45&deg',
-    '450g/1lb',
-    '46%',
-    '460',
-    '470',
-    '48p',
-    '49%',
-    '490',
-    '4c',
-    '4d',
-    '4gl',
-    '4lb',
     '4m',
-    '5&ndash;1',
-    '5&ndash;10',
-    '5&ndash;7',
-    '5(1)',
-    '5-1',
-    '50mm',
-    '52%',
-    '520',
-    '54%',
-    '55,000',
-    '555',
-    '56%',
-    '57%',
-    '5750',
-    '58%',
     '5cm',
-    '5m',
-    '6&ndash;7',
-    '6&ndash;8',
-    '6(3)',
-    '6-1',
-    '6-3',
-    '6.',
-    '61%',
-    '617',
-    '62%',
-    '620',
-    '63%',
-    '64%',
-    '640',
-    '64mb',
     '660',
-    '67%',
-    '68%',
-    '6:30',
-    '6d.',
-    '6m',
-    '6oz',
-    '7&ndash;5',
-    '7&ndash;6',
-    '7-6',
-    '72%',
-    '737',
-    '747',
-    '75th',
-    '76%',
-    '76(a)',
     '77%',
-    '78%',
-    '7am',
-    '7p',
-    '8&ins',
-    '8-bit',
-    '8.0',
-    '8.30pm',
-    '80386',
-    '80th',
-    '82%',
-    '83%',
-    '86%',
-    '88000',
-    '89%',
-    '8am',
     '8in',
-    '8mb',
-    '8p',
-    '9.6',
-    '9.7',
-    '9.8',
-    '9.9',
-    '950',
-    '96%',
-    '97%',
-    '98%',
-    '9p',
-    'a2b',
-    'a_good_few',
-    'a_hell_of_a_lot',
-    'a_la_carte',
     'aaa',
-    'aba',
-    'abandons',
-    'abate',
-    'abattoir',
-    'abbeys',
-    'abdallah',
-    'abdicated',
-    'abe',
-    'abercrombie',
-    'aberrant',
-    'abetted',
-    'abeyance',
-    'abhorrent',
-    'abolitionist',
-    'abominable',
     'abounds',
-    'abrasion',
-    'abs',
-    'abseiling',
-    'absentees',
-    'absolution',
-    'absolved',
-    'absorbent',
-    'abusers',
-    'abysmal',
-    'academies',
-    'acas',
-    'accelerates',
-    'acceptances',
-    'accesses',
-    'accommodates',
     'accomplices',
-    'accordion',
-    'accumulates',
-    'accumulations',
-    'accumulators',
-    'acetylcholine',
-    'acidly',
-    'acinar',
-    'acquiesce',
-    'acquiesced',
-    'acquisitive',
-    'acrimony',
-    'acronym',
-    'acrylics',
-    'actin',
-    'actionable',
     'actualization',
-    'ad1',
-    'adair',
-    'adamson',
-    'adaptors',
-    'adapts',
-    'adcc',
-    'addendum',
-    'adeane',
-    'adherent',
-    'adjectival',
-    'adjudicate',
-    'administers',
-    'administratively',
-    'adml',
-    'admonished',
     'adopters',
-    'adorable',
-    'adores',
-    'adt',
-    'adverb',
-    'ae',
-    'aeration',
-    'aerials',
-    'aerobatic',
-    'aerobatics',
-    'aeronautical',
-    'aeronautics',
-    'aes',
-    'aeschylus',
-    'aethelbald',
-    'aethelred',
     'af',
-    'affectation',
-    'affiliates',
-    'affirms',
-    'affixed',
-    'affording',
-    'afforestation',
-    'after-dinner',
-    'after-tax',
-    'afterlife',
-    'aftershave',
-    'again\'',
-    'agape',
-    'aggressiveness',
-    'aggro',
-    'agnostic',
     'agonies',
-    'agonistes',
-    'agonizing',
-    'agreeably',
-    'aground',
-    'ahhh',
-    'aidan',
-    'ail',
-    'ailment',
-    'aimless',
-    'ain',
-    'ainsworth',
-    'air-raid',
-    'airbrakes',
-    'aire',
-    'airlock',
     'airplane',
-    'airship',
-    'airshow',
-    'airspeed',
-    'airstrip',
-    'airtight',
-    'airwaves',
-    'ajax',
-    'ajdabiya',
-    'aka',
-    'alarmist',
-    'alaskan',
-    'albatross',
-    'albie',
-    'albino',
-    'albrecht',
     'alcatel',
-    'alchemy',
-    'alcock',
-    'alcuin',
-    'aldus',
-    'alerting',
-    'alertness',
-    'alfie',
-    'alford',
-    'algarve',
-    'algernon',
-    'alia',
-    'all-male',
-    'all-over',
-    'all-purpose',
-    'allele',
     'alleles',
-    'allende',
-    'alleviating',
-    'alligator',
-    'allocates',
-    'allot',
-    'allure',
-    'alluvial',
-    'alms',
-    'alphabetically',
-    'alphanumeric',
-    'alston',
-    'altdorf',
-    'alum',
-    'alvin',
-    'alwyn',
     'amal',
-    'amateurish',
-    'amazonia',
-    'amelie',
-    'amelioration',
-    'american-style',
-    'amethyst',
-    'amicably',
-    'amiens',
-    'amino-acid',
-    'amphetamines',
-    'amphibious',
-    'amplitudes',
-    'amputated',
-    'amputation',
-    'amusements',
     'an\'all',
-    'anaemic',
-    'anaesthetised',
-    'analgesia',
-    'analytically',
-    'analyzing',
-    'anarchists',
-    'anastomosis',
-    'anatolia',
-    'ancients',
-    'andf',
-    'andover',
-    'andreotti',
-    'andrewes',
-    'andropulos',
-    'ange',
     'angell',
-    'angelo',
-    'angharad',
-    'anglo-italian',
-    'anglo-welsh',
-    'annabelle',
-    'annadale',
-    'annealing',
-    'annesley',
-    'annihilated',
-    'announcer',
-    'annuals',
-    'ansi',
-    'antenna',
-    'anti-',
-    'anti-abortion',
     'anti-climax',
-    'anti-competitive',
-    'anti-inflammatory',
-    'anti-slavery',
-    'anti-tank',
-    'anticipatory',
-    'antiracism',
-    'antitrust',
-    'anvil',
-    'apb',
-    'apc',
-    'aphrodisiac',
-    'apis',
-    'aplomb',
-    'aplysia',
-    'apocryphal',
     'apolitical',
-    'apollinaire',
-    'apolline',
-    'apoptosis',
-    'apparel',
-    'appendages',
-    'appleton',
-    'apportioned',
-    'apportionment',
-    'apposite',
-    'appraise',
-    'appropriates',
-    'approver',
-    'approximated',
-    'apps',
-    'apricots',
     'aprons',
-    'aquaria',
-    'aquarius',
-    'aquifers',
-    'aquinas',
-    'ar&ecirc;te',
-    'arab-israeli',
-    'arachidonic',
-    'aran',
-    'arcadia',
-    'architecturally',
-    'archiving',
-    'archivist',
-    'archivists',
-    'ardiles',
-    'ardour',
     'arf',
-    'argus',
-    'ariane',
-    'armagnac',
-    'armament',
-    'armful',
-    'armpit',
-    'arrestable',
-    'arrhythmias',
-    'arsehole',
-    'arsonists',
-    'art_nouveau',
-    'arte',
-    'artful',
-    'arthropods',
-    'articled',
     'articulates',
-    'artifice',
-    'artistes',
-    'artistically',
-    'artois',
-    'arun',
-    'ascendant',
-    'ascents',
-    'asexual',
-    'ashcroft',
-    'ashen',
-    'ashenden',
-    'ashfield',
-    'ashington',
-    'ashmolean',
-    'asia-pacific',
     'askew',
-    'asp',
-    'aspirated',
-    'assassinations',
-    'assembler',
-    'asshe',
-    'assiduous',
-    'assisi',
-    'asterisk',
-    'astern',
-    'asthmatic',
-    'asthmatics',
-    'astrid',
-    'astronauts',
-    'ata',
-    'atari',
     'atb',
-    'atheists',
-    'atholl',
-    'atmospheres',
-    'atrophic',
-    'attainments',
-    'attest',
-    'attica',
-    'attired',
-    'attractor',
-    'attributions',
-    'audiovisual',
-    'auditions',
-    'audley',
-    'auerbach',
-    'authenticated',
     'authorises',
-    'autistic',
-    'autobahn',
-    'autobiographies',
-    'autocar',
-    'autographs',
-    'automobiles',
-    'autumnal',
-    'avenging',
-    'aviary',
-    'aviemore',
-    'avignon',
-    'aviion',
-    'avionics',
-    'avuncular',
-    'awe-inspiring',
     'awhile',
-    'awning',
-    'axiom',
-    'axioms',
-    'aylwin',
-    'ayton',
-    'azores',
-    'azt',
-    'b&eacute;arn',
-    'b.p.',
-    'b/d',
-    'b/w',
-    'b2',
-    'babbling',
-    'babel',
-    'baboon',
     'baboons',
-    'babs',
-    'babylonian',
-    'babysitter',
-    'bacchus',
-    'bachelors',
-    'back-to-back',
-    'backache',
-    'backbencher',
-    'backcloth',
-    'backer',
-    'backspace',
-    'backswing',
-    'backwardness',
-    'baddies',
-    'bagehot',
     'baillie',
-    'baines',
-    'bairn',
-    'baited',
-    'baiting',
-    'baize',
-    'bakewell',
-    'bakhtin',
-    'baku',
-    'balaclava',
-    'balboa',
-    'balcon',
-    'baleful',
-    'balinese',
-    'ballantyne',
-    'ballater',
     'ballooning',
-    'ballyclare',
-    'ballymoney',
-    'balmy',
-    'balor',
-    'bam',
-    'bamford',
-    'banality',
-    'banco',
-    'bandit',
-    'bane',
-    'banff',
-    'banfield',
-    'banger',
-    'banisters',
-    'banquets',
     'bantam',
-    'banyan',
-    'baptiste',
-    'barbarous',
-    'barbecues',
-    'barbie',
-    'bari',
-    'baritone',
-    'barks',
-    'barnabas',
-    'barnacles',
-    'barrack',
-    'barrows',
-    'barrymore',
-    'bartocci',
-    'bartram',
     'bas',
-    'basaltic',
-    'basel',
-    'bask',
-    'basolateral',
-    'basques',
-    'basquiat',
-    'bassoon',
-    'bastide',
-    'bastions',
-    'bateson',
-    'battleship',
-    'batts',
-    'bawdy',
-    'bayonet',
-    'bayonets',
     'bb',
-    'bcg',
-    'bcl-2',
-    'bcp',
-    'bcrs',
-    'be_that_as_it_may',
-    'beagle',
-    'beale',
-    'beauvoir',
-    'becher',
-    'becket',
-    'beddow',
-    'bedelia',
-    'bedevilled',
-    'bedlam',
-    'bedraggled',
     'bedsit',
-    'bedspread',
-    'bedwyr',
-    'beeb',
-    'beeches',
-    'beehive',
-    'beetroot',
-    'bef',
-    'befall',
-    'befits',
-    'befriended',
-    'beguiling',
-    'begum',
-    'behavior',
-    'behaviourism',
-    'behaviourist',
     'behind-the-scenes',
-    'bein\'',
-    'bekaa',
-    'belay',
-    'belched',
-    'belching',
-    'belies',
-    'belize',
-    'belorussia',
-    'benchers',
-    'benchmarks',
-    'beneficially',
-    'benelux',
-    'beni',
-    'benstede',
-    'beowulf',
     'berdichev',
-    'berets',
-    'bergen',
-    'bergg',
-    'bergman',
-    'berliners',
-    'bermondsey',
-    'berths',
-    'bertram',
-    'bespectacled',
-    'bespoke',
-    'bess',
-    'best-seller',
-    'bestseller',
-    'betjeman',
-    'betrothed',
     'betterment',
-    'betts',
-    'bev',
-    'bewick',
-    'bewitched',
-    'bf',
-    'bfs',
-    'biceps',
-    'bien',
-    'biennale',
-    'biggs',
-    'bigotry',
-    'bihar',
-    'biker',
-    'biking',
-    'billet',
     'billeted',
-    'billiards',
-    'bimbo',
-    'bingley',
-    'binyon',
-    'bio',
-    'biodegradable',
-    'biogeography',
-    'biographers',
-    'biomedical',
-    'biosphere',
-    'bipolar',
-    'birdsong',
-    'birkbeck',
-    'biscay',
-    'bischoff',
     'bisexual',
-    'bishopsgate',
-    'bistable',
-    'bitumen',
-    'bjorn',
-    'bl',
-    'blackadder',
-    'blackberries',
-    'blacker',
-    'blackmore',
-    'blacksmiths',
-    'blackthorn',
-    'blagg',
-    'blaise',
-    'blameless',
-    'blanched',
     'blaring',
-    'blasphemous',
-    'bleedin\'',
-    'bleep',
-    'blemish',
-    'blemishes',
-    'blender',
-    'blinkered',
-    'blip',
-    'blissett',
-    'blister',
-    'blistered',
-    'bloch',
-    'bloggs',
-    'blondes',
-    'blood-red',
     'bloodshot',
-    'bloomfield',
-    'blots',
-    'blower',
-    'bloxham',
-    'blue-eyed',
-    'bluebell',
-    'bluebells',
-    'blufton',
-    'blundered',
-    'blundering',
-    'blunted',
-    'blustery',
-    'blythe',
-    'bm',
-    'bn',
     'boars',
-    'boatman',
-    'boatmen',
-    'boatyard',
-    'bobo',
-    'bodleian',
-    'bodmin',
-    'bodrum',
-    'bodywork',
-    'bogart',
-    'boggy',
-    'bogot&aacute',
-    'bogwood',
-    'boleyn',
-    'bolger',
-    'bollards',
     'bolsover',
-    'bolstered',
-    'bolus',
-    'bonaparte',
-    'bonhomie',
-    'bonner',
-    'booed',
-    'bookcases',
-    'bookselling',
-    'bookshelf',
-    'bop',
-    'bordon',
-    'bores',
-    'borg',
-    'borstal',
-    'bosworth',
     'botanists',
-    'bothy',
-    'bottleneck',
-    'boughs',
-    'boulestin',
-    'boulevards',
-    'bouncers',
-    'boundless',
-    'bouquets',
-    'boutros',
-    'bovis',
-    'bowyer',
-    'boyce',
-    'brac',
-    'brachiopods',
-    'bradman',
     'bradstreet',
-    'brae',
-    'braer',
-    'braided',
-    'branwell',
-    'brasserie',
-    'bratislava',
-    'braved',
-    'break-even',
-    'break-ins',
-    'breakwater',
-    'brecht',
-    'breezes',
-    'breezy',
-    'brentwood',
-    'brereton',
     'brest',
-    'bri',
-    'briar',
-    'bricklayer',
-    'bridgewater',
-    'bridhe',
-    'bridlington',
-    'briefest',
-    'bright-eyed',
-    'brightening',
-    'brigitte',
-    'brill',
-    'bristle',
-    'bristled',
-    'bristow',
-    'britta',
     'brittain',
-    'britton',
-    'broach',
-    'broached',
-    'broad-shouldered',
-    'broadbent',
-    'broadsheet',
-    'broadside',
-    'brodie',
-    'broking',
-    'bromborough',
-    'bromide',
-    'bronchial',
-    'bronte',
-    'bronzed',
-    'brooded',
     'brookes',
-    'brookside',
-    'broome',
-    'brothels',
-    'brotherly',
-    'brownish',
-    'brugge',
-    'bruiser',
-    'brundle',
-    'brutish',
-    'bs5750',
-    'bsb',
-    'bsdi',
-    'bucking',
-    'buckland',
-    'buddie',
     'buffeted',
-    'bugged',
-    'buggered',
-    'buggery',
-    'buid',
-    'bulbous',
-    'bulged',
-    'bulges',
-    'bulkhead',
-    'bulldozer',
-    'bulwark',
-    'bunks',
-    'buoy',
-    'buoyed',
-    'bupa',
-    'burdensome',
     'bureaucrat',
-    'burghley',
-    'burghs',
-    'burgundians',
-    'burleigh',
-    'burnell',
-    'burners',
-    'burney',
-    'bursar',
-    'burundi',
-    'business-like',
-    'businesswoman',
-    'bust-up',
-    'busted',
-    'busts',
-    'butane',
     'butchered',
-    'butterfield',
-    'buttery',
-    'buy-outs',
-    'buzzards',
-    'buzzer',
-    'bv',
-    'by-products',
-    'bye-bye',
-    'byelaws',
-    'bypassing',
-    'byre',
-    'bystander',
-    'byzantium',
-    'bzw',
-    'c&eacute;sar',
     'c.l.r.',
-    'c4',
-    'c5',
-    'cabernet',
-    'cacophony',
-    'cactus',
-    'cadogan',
-    'caecum',
-    'caen',
-    'caerulein',
-    'cagney',
-    'cai',
-    'caked',
-    'calcareous',
-    'caledonia',
-    'calibra',
     'calico',
-    'callahan',
-    'callanish',
-    'calligraphy',
-    'callow',
-    'cally',
-    'calmness',
-    'calving',
-    'camcorders',
-    'camelot',
-    'cameramen',
-    'campanile',
-    'cams',
-    'camus',
-    'cancerous',
-    'candidature',
     'candidly',
-    'candlestick',
-    'candlesticks',
-    'canister',
-    'canisters',
-    'cannae',
-    'cannibalism',
-    'cannock',
-    'canoeists',
-    'canopies',
-    'canto',
-    'cantos',
-    'capacious',
-    'capacitors',
-    'capers',
-    'capillaries',
     'capitalize',
-    'capitulated',
-    'capitulation',
-    'capm',
-    'capriati',
-    'captors',
-    'carapace',
-    'carcinogenic',
-    'carcinogens',
-    'cardigans',
-    'caricom',
-    'carlsberg',
-    'carlyle',
-    'carmarthen',
-    'carn',
-    'carnal',
     'carnation',
-    'carne',
-    'carnivorous',
-    'carousel',
-    'carpentry',
-    'carrickfergus',
-    'carrion',
-    'carrow',
-    'cartier',
-    'cartographic',
-    'cartoonist',
-    'cary',
-    'casablanca',
-    'cascaded',
-    'cascades',
-    'casement',
     'cash-flow',
-    'casinos',
-    'casks',
-    'caspian',
-    'cass',
-    'cassell',
-    'cassowary',
-    'castes',
-    'castigated',
-    'castings',
-    'castrated',
-    'castration',
-    'catalysed',
-    'catamaran',
-    'catapulted',
-    'cataract',
     'catchy',
-    'categorise',
-    'categorization',
-    'categorize',
-    'caterham',
-    'catesby',
-    'cathie',
-    'cathode',
-    'cations',
-    'cato',
-    'caucasian',
-    'causa',
-    'causally',
-    'causative',
-    'caveats',
-    'caved',
     'cavell',
-    'caviar',
-    'cawthorne',
-    'cbc',
-    'cck',
-    'ccpr',
-    'cd8',
-    'cdc',
-    'cdr',
-    'celeste',
-    'cellophane',
-    'central-local',
-    'centre-forward',
-    'centre-left',
-    'centrifugal',
-    'centrifugation',
     'centrifuged',
-    'centurion',
-    'cepacia',
-    'certificated',
-    'certiorari',
-    'cgmp',
-    'chaff',
-    'chagall',
-    'chairwoman',
-    'chalked',
-    'chalky',
-    'champs',
-    'chancellors',
-    'chandelier',
-    'chandos',
-    'chandra',
     'changeable',
-    'channing',
-    'chantry',
-    'charlatans',
-    'charleston',
-    'charmer',
-    'charterhouse',
-    'chas',
-    'chastened',
-    'chatto',
-    'chatty',
-    'chauvinist',
-    'cheapness',
-    'cheats',
-    'check-out',
-    'check-up',
     'checklists',
-    'checkout',
-    'checkpoints',
-    'chedworth',
-    'cheerily',
-    'cheesecake',
-    'cheetah',
-    'cheetahs',
-    'cheltenham/gloucestershire',
-    'chem',
-    'chemiluminescence',
-    'chequers',
-    'cherbourg',
-    'chertsey',
-    'chester-le-street',
-    'chevron',
     'chewong',
-    'chianti',
-    'chico',
-    'chieftains',
-    'child-care',
-    'chilton',
-    'chime',
-    'chins',
-    'chintz',
-    'chipboard',
-    'chirpy',
-    'chiselled',
-    'chisholm',
-    'chives',
-    'chlorophyll',
-    'cho',
     'chola',
-    'choreographed',
-    'choruses',
-    'chow',
-    'christi',
-    'chronicled',
-    'chroniclers',
-    'chronologically',
-    'chrysalis',
-    'chrysanthemums',
-    'chubb',
-    'chuffed',
-    'chums',
-    'churchman',
-    'churlish',
-    'ciaran',
     'cicely',
-    'cicero',
-    'cilla',
-    'circulatory',
-    'circumspect',
-    'circuses',
-    'cisapride',
-    'ciskei',
-    'cisterns',
-    'cit',
-    'civilisations',
-    'civility',
-    'clair',
-    'clam',
-    'clamps',
-    'clang',
     'clanking',
-    'claridge',
-    'clarion',
-    'clary',
-    'clasper',
-    'classicism',
-    'claudine',
-    'claudius',
-    'claustrophobia',
-    'clawing',
-    'clearinghouses',
-    'cleaver',
-    'clef',
-    'clem',
-    'clematis',
-    'clench',
     'clenching',
-    'clerkenwell',
-    'cleverer',
-    'cliche',
-    'cliches',
-    'cliftonville',
-    'climes',
-    'clings',
-    'clinician',
-    'clipper',
-    'clippings',
-    'clique',
-    'clitoris',
-    'clocking',
-    'clogging',
-    'close-knit',
     'clothier',
-    'clothiers',
-    'cloudless',
-    'clubhead',
-    'clydebank',
-    'cmhts',
-    'cmos',
-    'cms',
-    'cnn',
-    'co-author',
-    'co-exist',
-    'co-ordinators',
-    'co-workers',
-    'coarser',
-    'coasting',
-    'coaxial',
     'cobblers',
-    'cockcroft',
-    'cocker',
-    'cockerel',
-    'cocteau',
-    'codification',
-    'codon',
-    'coetzee',
-    'cogent',
-    'cognate',
-    'cohabiting',
-    'coherently',
-    'cohn',
-    'coincidences',
-    'coincident',
-    'coker',
     'colbert',
-    'colebrooke',
-    'coleby',
-    'colectomy',
-    'collate',
-    'collated',
-    'collating',
-    'collectivist',
-    'collectivities',
-    'collimore',
-    'collingridge',
-    'collinson',
-    'collocation',
-    'collocations',
-    'colman',
-    'colne',
     'colonized',
-    'colourings',
-    'columba',
-    'comically',
-    'comings',
-    'commandeered',
-    'comme',
-    'commemorates',
-    'commercialism',
-    'commode',
-    'common-law',
-    'commonality',
-    'commute',
-    'commuted',
-    'como',
-    'comp',
     'compacted',
-    'companionway',
-    'compatriots',
-    'compendium',
-    'compensations',
-    'competencies',
-    'competently',
-    'complementing',
-    'complicates',
-    'complimented',
-    'composites',
-    'compositor',
-    'compounding',
-    'comprehended',
-    'compressor',
-    'compuadd',
     'computations',
-    'computer-generated',
-    'comradeship',
-    'conceiving',
-    'conceptualization',
-    'concordance',
-    'condescension',
-    'conditioners',
-    'condolences',
-    'condor',
-    'conductance',
-    'conduction',
-    'conductive',
-    'confetti',
-    'confidentially',
-    'conflagration',
     'confluence',
-    'conformations',
-    'confound',
-    'confuses',
-    'confusingly',
-    'congealed',
-    'congressman',
-    'congruence',
-    'congruent',
-    'coniferous',
-    'conjectures',
-    'conjugal',
-    'conjunctions',
-    'connaught',
-    'connective',
-    'conquerors',
     'consecutively',
-    'conservationist',
-    'consett',
-    'consignee',
-    'consignments',
-    'constancy',
-    'constanze',
-    'constellations',
-    'constipated',
-    'construing',
-    'consummation',
-    'contaminants',
-    'contaminate',
-    'contemplates',
-    'contemptible',
-    'continence',
     'contingents',
-    'contradicting',
-    'contravene',
-    'contravened',
-    'contrive',
-    'controversially',
-    'conundrum',
-    'conurbation',
-    'convalescence',
-    'conveniences',
-    'conversant',
-    'conversationally',
-    'convertibility',
-    'convivial',
-    'convulsively',
-    'cookie',
     'cools',
-    'coombs',
-    'cooped',
-    'cooperating',
-    'cooperatives',
-    'copernicus',
-    'copes',
-    'copperwheat',
-    'coptic',
-    'corcoran',
-    'corfu',
-    'corks',
-    'corkscrew',
-    'corky',
-    'corman',
-    'corned',
     'cornhill',
-    'cornice',
-    'corning',
-    'cornmill',
-    'cornwell',
-    'corona',
-    'coroners',
-    'coronet',
-    'corosini',
-    'corporals',
-    'corrado',
-    'corroded',
-    'corrupting',
-    'corset',
-    'corsica',
-    'corsican',
     'cortina',
-    'corydoras',
-    'cosmid',
-    'cossack',
-    'cost-benefit',
-    'costner',
-    'coterie',
-    'cots',
-    'cottee',
-    'cou',
-    'coughs',
-    'coulter',
-    'counsellee',
-    'counter-revolutionary',
-    'counterbalance',
-    'counterbalanced',
     'counterparty',
-    'countervailing',
-    'coursing',
-    'courtauld',
-    'courtenay',
-    'courtier',
-    'coutts',
-    'couture',
-    'covalent',
-    'coves',
-    'cowards',
-    'cowering',
-    'cowie',
-    'coyly',
-    'cpd',
-    'cpe',
     'cpp',
-    'cpre',
-    'crabbe',
-    'cramer',
-    'cramming',
-    'cranberry',
-    'craned',
-    'cranfield',
-    'cranko',
-    'crazily',
-    'cre',
-    'credo',
-    'creepy',
-    'cremated',
-    'cress',
-    'cresson',
     'crib',
-    'crickets',
-    'criminally',
-    'cringe',
-    'cringing',
-    'crinkled',
-    'criss-crossed',
-    'criticizes',
-    'crochet',
-    'crocker',
-    'crofts',
-    'cromer',
-    'crompton',
-    'cross-party',
-    'cross-reference',
-    'cross-references',
     'cross-sectional',
-    'crossbar',
-    'crossbow',
-    'crotch',
-    'crowed',
-    'cru',
-    'cruisers',
-    'crumb',
-    'crustaceans',
-    'crusts',
-    'cryer',
-    'crystallised',
-    'csm',
-    'csu',
-    'ctc',
-    'ctl',
     'cubans',
-    'cubicles',
-    'cuckoos',
-    'cud',
-    'culham',
-    'cull',
-    'culling',
-    'culloden',
-    'culminate',
-    'culpable',
-    'cultivators',
-    'cumbernauld',
-    'cumbrian',
-    'cummings',
-    'cupid',
-    'cupping',
     'curated',
-    'curbed',
-    'curlers',
-    'curlew',
-    'currant',
-    'currants',
-    'cursive',
-    'curtailment',
-    'curtained',
-    'cushioning',
-    'cusick',
-    'cusp',
-    'customarily',
-    'cut-throat',
-    'cutaway',
-    'cutler',
     'cuvier',
-    'cuzco',
-    'cw',
-    'cyclase',
-    'cymru',
-    'cynic',
-    'cytochrome',
-    'cytology',
-    'czechoslovakian',
-    'd&eacute;cor',
-    'd&eacute;tente',
-    'd\'arquebus',
-    'd\'estaing',
-    'd\'urberville',
-    'd1',
-    'd2',
     'd6',
-    'dabbling',
-    'dabs',
-    'dace',
-    'dacourt',
-    'dacre',
-    'daedalus',
-    'daemon',
-    'daemons',
-    'daggerboard',
-    'dairies',
-    'dali',
-    'dalmatia',
-    'dalrymple',
-    'damask',
-    'damsel',
     'danziger',
-    'dapper',
-    'dara',
-    'darlings',
-    'darn',
-    'daryl',
-    'dashes',
-    'daubed',
-    'daunted',
-    'davers',
-    'dawes',
-    'dawns',
-    'dbase',
-    'dcf',
-    'dcm',
-    'deacons',
     'dead-end',
-    'deadlocked',
-    'deadweight',
-    'deafened',
-    'deanery',
-    'dears',
-    'deathbed',
-    'debased',
-    'debenham',
-    'debits',
-    'debugging',
-    'debuts',
-    'decanter',
-    'decapitated',
-    'decays',
-    'deceitful',
     'decode',
-    'decomposed',
-    'decorators',
-    'decoy',
-    'deductible',
-    'deems',
-    'deep-sea',
-    'deepens',
-    'def',
-    'defecation',
-    'defectors',
-    'deferring',
-    'definitively',
-    'deflationary',
-    'deformity',
-    'defused',
     'degrade',
-    'dehydrated',
-    'deindustrialization',
-    'dejected',
-    'delegating',
-    'delgard',
-    'delicacies',
-    'delinquents',
-    'delos',
-    'delving',
-    'democratisation',
-    'demoiselles',
-    'demonstrable',
-    'demonstrative',
-    'demonstrator',
-    'demoralising',
     'demoted',
-    'demotion',
-    'dems',
-    'demure',
-    'demurely',
-    'demurred',
-    'denbigh',
-    'dene',
-    'denigrate',
-    'denizens',
-    'deportees',
-    'depraved',
-    'depravity',
-    'depredations',
-    'depressingly',
-    'depute',
     'derisively',
-    'derisory',
-    'descriptors',
-    'desertification',
-    'desiccated',
-    'desiring',
-    'desk-top',
-    'desktops',
-    'despaired',
-    'despatches',
-    'despenser',
-    'despondency',
-    'despondent',
-    'destroyers',
-    'detachments',
-    'deterring',
     'detonated',
-    'detoxification',
-    'deuce',
-    'deutschland',
-    'deutschmarks',
-    'dev',
-    'devastatingly',
-    'devilish',
-    'devine',
-    'devizes',
-    'devolve',
-    'dey',
-    'df',
-    'dha',
-    'diagenetic',
-    'diagnosing',
     'diagrammatic',
-    'dialog',
-    'diametrically',
-    'diarist',
-    'diced',
-    'dichotic',
-    'dickensian',
-    'diddle',
-    'didi',
-    'dieppe',
-    'dierdriu',
-    'dietrich',
-    'diff',
-    'differentiates',
-    'diffidence',
-    'digesting',
     'diggers',
-    'diggory',
-    'digitised',
-    'dimbleby',
-    'dimity',
-    'dimmer',
-    'dimness',
-    'dimorphism',
-    'diner',
-    'dingwall',
-    'diniz',
-    'dint',
-    'dionne',
-    'dioxin',
-    'diplomatically',
-    'dir',
     'directorship',
-    'direktor',
-    'disagreeing',
-    'disappearances',
-    'disbursements',
-    'discipleship',
-    'disciplining',
-    'discloses',
-    'disconcertingly',
-    'disconnect',
-    'discontinuities',
-    'discouragement',
-    'disdainful',
-    'disequilibrium',
-    'disguises',
-    'disguising',
     'dished',
-    'dishonour',
-    'disingenuous',
-    'disloyalty',
-    'dismally',
-    'dismembered',
-    'dismount',
-    'disobedient',
-    'disorganised',
-    'disparaging',
-    'dispassionately',
-    'dispatches',
-    'dispensers',
-    'dispersing',
-    'dispirited',
-    'dispiriting',
     'displacing',
-    'disposes',
-    'disputing',
-    'disquieting',
-    'disrepair',
-    'disruptions',
-    'disseminating',
-    'dissension',
-    'disservice',
-    'dissipation',
-    'dissociate',
-    'dissociated',
-    'distributional',
-    'disturbs',
-    'disunity',
-    'dithering',
     'ditto',
-    'diuretic',
-    'diverged',
-    'diversifying',
-    'divider',
-    'divinely',
-    'divisible',
-    'dms',
-    'dna-binding',
-    'dnas',
-    'dnestr',
-    'docking',
-    'dockside',
-    'doctoral',
-    'doctrinaire',
-    'doddle',
     'dodger',
-    'dodson',
-    'dog-whelks',
-    'dogmas',
-    'dogmatism',
-    'dolomite',
-    'dolores',
-    'domineering',
-    'domingo',
-    'dominique',
-    'dominoes',
-    'donleavy',
-    'donson',
-    'doon',
-    'door-to-door',
-    'dopey',
     'dormitories',
-    'dorn',
-    'dosed',
-    'dosh',
-    'dosing',
-    'doubters',
-    'doughnut',
-    'doughty',
-    'dougie',
-    'doused',
-    'dovercourt',
-    'dowdy',
-    'dower',
-    'downcast',
-    'downgrading',
-    'downland',
     'downpatrick',
-    'downside',
-    'doze',
-    'dp-1',
-    'dpr',
-    'dra',
-    'dragonflies',
-    'dragonfly',
-    'drags',
-    'dram',
-    'dramatist',
-    'drape',
-    'drapery',
-    'dreadnought',
-    'dredger',
-    'dressage',
     'dressmaker',
-    'dribble',
-    'dribbled',
-    'drift-net',
-    'driftwood',
-    'drink-driving',
-    'droop',
-    'drs',
-    'drug-taking',
-    'druid',
-    'druids',
-    'drunkenly',
-    'dryly',
-    'dso',
-    'dual-purpose',
-    'duality',
     'dubcek',
-    'dubiously',
-    'dubois',
-    'duckling',
-    'dude',
-    'dullness',
-    'dumbfounded',
-    'dumpy',
-    'dundalk',
-    'dunedin',
-    'dungarees',
-    'dungeons',
-    'dunne',
-    'dunstable',
-    'dunstaple',
-    'duped',
     'duplicating',
-    'duplicity',
-    'durables',
-    'duroc',
-    'durrant',
-    'dusseldorf',
-    'duster',
-    'dwayne',
-    'dwight',
-    'dworkin',
-    'dynamically',
-    'dynasties',
-    'dynmouth',
-    'dysentery',
-    'dyslexic',
-    'dysphagia',
     'dystrophy',
-    'e\'s',
-    'e.c.j.',
-    'e3',
-    'e4',
-    'e6',
-    'e7',
-    'eachuinn',
-    'eamonn',
-    'earldom',
-    'early-morning',
-    'easington',
-    'easterly',
-    'eastleigh',
-    'eau',
-    'eavesdropping',
     'eb',
-    'ebbed',
-    'ebrd',
-    'eccentricities',
-    'ecomog',
-    'econometrics',
-    'eddery',
-    'edenderry',
-    'edgware',
-    'edirne',
-    'editorials',
-    'editorship',
-    'edmonton',
-    'edn',
-    'educative',
-    'edwina',
     'eea',
-    'eerily',
-    'efficiencies',
-    'effigy',
-    'effluents',
-    'ega',
-    'egbert',
-    'egerton',
-    'egoism',
-    'egos',
-    'eh8',
-    'eiffel',
-    'eighty-eight',
-    'eighty-four',
-    'eighty-seven',
-    'eighty-six',
     'eighty-two',
-    'ejaculation',
-    'eject',
-    'ejection',
-    'el-ahrairah',
-    'elapse',
-    'elasticated',
-    'elasticities',
-    'elbowed',
-    'elderslie',
-    'electioneering',
-    'electrifying',
-    'electrolytes',
-    'elevators',
-    'eli',
-    'eliciting',
     'elijah',
-    'ellipse',
-    'ellison',
-    'elmer',
-    'elongation',
-    'elsa',
-    'elucidation',
-    'elude',
-    'emanate',
-    'emanuel',
-    'embalmer',
-    'embalmers',
-    'embankments',
-    'embellishment',
-    'embezzlement',
-    'emburey',
     'emeralds',
-    'emery',
-    'emf',
-    'emile',
-    'emilio',
-    'emir',
-    'emits',
-    'emporium',
-    'empower',
-    'empties',
-    'emulated',
-    'emulating',
-    'emulator',
-    'enacting',
-    'enalapril',
-    'enamoured',
     'encapsulate',
-    'encephalopathy',
-    'encina',
-    'encodes',
-    'encroached',
-    'end-users',
-    'endara',
-    'endometriosis',
-    'endonuclease',
-    'endorsements',
-    'endorses',
-    'endoscopically',
-    'endothelium',
-    'eng',
-    'engulf',
-    'enmeshed',
     'enniskillen',
-    'eno',
-    'enrolments',
-    'ensembles',
-    'ensign',
-    'enslaved',
-    'ensues',
-    'entailing',
-    'enteric',
-    'enthalpies',
-    'enthralling',
-    'enthusiasms',
-    'enticed',
-    'entrails',
-    'entrust',
-    'enya',
     'enzymatic',
-    'eo',
-    'ephemera',
-    'ephraim',
-    'epics',
-    'epidermal',
-    'epidermis',
-    'epidural',
-    'epilogue',
-    'epinephrine',
-    'epithet',
-    'epitomised',
-    'eplf',
-    'eponymous',
-    'epping',
-    'eps',
     'eqn.',
-    'equalise',
-    'equanimity',
-    'equilibria',
-    'equipping',
-    'erasmus',
-    'ergonomics',
-    'eritrean',
-    'ermine',
-    'eroding',
-    'erratically',
-    'erroneously',
-    'erudite',
-    'erupting',
-    'escalator',
-    'escapism',
     'eschew',
-    'eschewed',
-    'escobar',
-    'esk',
-    'espouse',
-    'estrangement',
-    'et-1',
-    'et_cetera',
-    'ethnically',
-    'ethologists',
-    'etna',
-    'etruscan',
-    'eucalyptus',
-    'eucharistic',
-    'eugenics',
-    'eukaryotic',
     'eunuchs',
-    'euphemism',
-    'euphoric',
-    'euro-currency',
-    'eurobonds',
-    'eustace',
-    'evaluates',
-    'evaporates',
-    'evensong',
-    'ever-changing',
-    'ever-growing',
-    'evergreens',
-    'evict',
-    'evidential',
-    'evolves',
-    'ex-husband',
     'excellency',
-    'excellently',
-    'excepting',
-    'exchange-rate',
-    'excision',
-    'excitatory',
-    'excites',
-    'exclaim',
-    'exclamations',
-    'excommunicated',
-    'excommunication',
-    'excreted',
-    'exhaustively',
-    'exhausts',
-    'exhilarated',
-    'exhortations',
     'exigencies',
-    'expanses',
-    'expansionist',
-    'expend',
-    'expendable',
-    'expiration',
-    'explicitness',
-    'expressionism',
-    'expropriation',
-    'extermination',
-    'externality',
-    'extractor',
-    'extravagantly',
-    'exuded',
-    'eyadema',
-    'eye-witness',
     'eyeball',
-    'eyeshadow',
-    'eyesore',
-    'f&mdash',
-    'f&mdash;ing',
-    'f&uuml;r',
-    'f-plan',
-    'fa&ccedil;ades',
-    'faa',
-    'fabled',
-    'facades',
-    'faerie',
-    'fair-haired',
-    'fairest',
-    'fait_accompli',
-    'fakrid',
     'falkenhayn',
-    'fall-out',
-    'fallout',
-    'falsification',
-    'falsity',
-    'falstaff',
-    'familiarise',
-    'family-run',
-    'fang',
-    'fanon',
-    'fanzine',
-    'fap',
-    'far-flung',
-    'far-sighted',
-    'farley',
-    'farmsteads',
     'farraday',
-    'farrar',
-    'farrier',
-    'farthest',
-    'farthing',
-    'fascia',
-    'fast-growing',
-    'fatalism',
-    'fatality',
-    'fathered',
-    'fathoms',
-    'fatima',
-    'fatuous',
-    'faulted',
-    'favor',
-    'fayoud',
     'fca',
-    'fda',
-    'fearon',
-    'featherstone',
-    'featherweight',
-    'feckless',
-    'fecundity',
-    'federated',
-    'feethams',
-    'feigned',
-    'feigning',
-    'feldwebel',
-    'fellas',
-    'fellers',
-    'felony',
-    'femur',
     'fennel',
-    'fernand',
-    'fernie',
-    'ferociously',
-    'ferreting',
-    'ferryhill',
-    'fertilised',
-    'festering',
-    'fevered',
-    'fevers',
-    'ffestiniog',
-    'ffr',
-    'fgd',
-    'fiance',
-    'fiancee',
-    'fiddly',
     'fidgeted',
-    'fidgeting',
-    'fief',
-    'fieldworker',
-    'fiercest',
-    'fifth-century',
-    'fifths',
-    'fifty-eight',
-    'fifty-seven',
-    'fifty-six',
-    'fifty-three',
-    'figural',
-    'figurehead',
-    'figurines',
-    'figuring',
-    'fijian',
     'fillers',
-    'fillip',
-    'film-making',
-    'finalized',
-    'finder',
-    'findlay',
-    'fine-grained',
-    'finery',
-    'fingernail',
-    'fingertip',
-    'finishers',
-    'fink',
-    'finnegan',
-    'finney',
-    'firefly',
-    'firepower',
     'first-round',
-    'firsts',
-    'fishbane',
-    'fishkeeper',
-    'fishwick',
-    'fisons',
-    'fission',
-    'fissure',
-    'fistful',
-    'fitch',
-    'fitful',
-    'fitters',
-    'fittingly',
-    'fitzormonde',
-    'fitzwilliam',
-    'five-minute',
     'five-star',
-    'fixedly',
-    'flagstones',
-    'flaked',
-    'flaking',
-    'flamed',
-    'flamenco',
-    'flamingo',
-    'flammable',
-    'flashback',
-    'flashlight',
-    'flasks',
-    'flatmate',
-    'flaunt',
-    'flaunting',
-    'flavouring',
     'fleck',
-    'flecks',
-    'flexibly',
-    'flinching',
-    'flippant',
-    'flirted',
-    'flitting',
-    'flo',
-    'flocking',
-    'flog',
-    'flogged',
-    'floodgates',
-    'floodlights',
-    'floored',
-    'flops',
-    'floss',
     'flounder',
-    'floundered',
-    'flouted',
-    'flouting',
-    'flt',
-    'flushes',
-    'flysheet',
-    'flyweight',
-    'fmi',
-    'fms',
-    'fogerty',
-    'follow-on',
-    'foolishness',
-    'foolproof',
-    'footprinting',
-    'footswitch',
     'forbearance',
-    'fordham',
-    'fords',
-    'forecasters',
-    'forefathers',
-    'forego',
-    'forerunners',
-    'foreshadowed',
-    'foreshore',
-    'forestalled',
-    'forested',
-    'foretaste',
-    'forgeries',
-    'forgetful',
-    'forgetfulness',
-    'formalists',
     'formatted',
-    'formica',
-    'forsake',
-    'forsaken',
-    'fosters',
-    'fouchard',
-    'fouling',
-    'foulkes',
-    'four-hour',
-    'four-part',
-    'four-poster',
-    'four-wheel',
-    'fourfold',
-    'fourier',
-    'foursome',
-    'foursomes',
     'fowey',
-    'foxy',
-    'fp',
-    'fpcr',
-    'fra',
-    'fracas',
-    'frampton',
-    'franchisees',
-    'francia',
-    'freaks',
-    'frederic',
-    'free-trade',
-    'freebie',
-    'freemantle',
-    'freephone',
-    'frees',
     'freewheeling',
-    'freezers',
-    'freiburg',
-    'freighter',
-    'french-speaking',
-    'frick',
-    'frighteningly',
-    'frightens',
-    'frightfully',
-    'frill',
-    'frilled',
-    'froggy',
-    'fromage_frais',
-    'front-bench',
-    'front-page',
-    'frontages',
     'frontline',
-    'frowns',
-    'fru',
-    'frugal',
-    'frye',
-    'fsln',
-    'fugitives',
-    'fugue',
-    'full-blooded',
-    'full-year',
-    'fulling',
-    'fully-fledged',
-    'fumble',
-    'fume',
-    'functionaries',
-    'fundic',
     'furtively',
-    'fusing',
-    'fuzz',
-    'fx',
-    'fyfe',
-    'g17',
-    'gaddafi',
-    'gadget',
-    'gaffer',
-    'gage',
-    'gags',
-    'galashiels',
-    'galicia',
-    'galleys',
-    'galling',
-    'galton',
     'gambit',
-    'gambled',
-    'gamblers',
-    'gamekeeper',
-    'gammon',
-    'gamsakhurdia',
-    'ganglia',
-    'gantry',
-    'gare',
-    'garnet',
-    'garnett',
-    'garnished',
-    'garret',
-    'garrick',
-    'gas-fired',
-    'gaskell',
     'gasoline',
-    'gassendi',
-    'gasworks',
-    'gatekeeper',
-    'gauche',
-    'gaviria',
-    'gawd',
-    'gaynor',
-    'gazelle',
-    'gazes',
-    'geddes',
-    'gelatine',
-    'geldof',
-    'gendered',
-    'genealogical',
-    'genealogy',
     'genet',
-    'genie',
-    'genitalia',
-    'genoese',
-    'genotype',
-    'gentility',
-    'geochemistry',
-    'geographer',
-    'germinate',
-    'germination',
-    'gestational',
-    'get-together',
-    'ghent',
-    'ghettos',
-    'ghi',
-    'ghs',
     'gianni',
-    'gibb',
-    'gibbet',
-    'giddens',
-    'gideon',
-    'gil',
-    'gilfoyle',
-    'gilles',
-    'gilligan',
-    'gimmelmann',
-    'giraffe',
-    'girders',
-    'girlish',
-    'giro',
-    'girth',
-    'gittens',
     'giulio',
-    'giuseppe',
-    'giveaway',
-    'giver',
-    'gl',
-    'glade',
-    'glandular',
-    'glanville',
-    'glassware',
-    'glaswegian',
-    'glean',
-    'gleneagles',
-    'glenys',
-    'glib',
-    'glistened',
-    'glitzy',
     'glowering',
-    'glows',
-    'glut',
-    'gnawed',
-    'gnome',
-    'go-between',
-    'goa',
-    'goaded',
-    'goalkeepers',
-    'goalkeeping',
-    'goalless',
-    'goalscorer',
-    'god-given',
-    'godsend',
-    'goings-on',
-    'golan',
     'gold-plated',
-    'golly',
-    'gonna',
-    'gonzalez',
-    'goo',
-    'good-humoured',
-    'good-night',
-    'goodall',
-    'goodbyes',
-    'googol',
-    'gooseneck',
-    'gorbals',
-    'gore-tex',
-    'gorges',
-    'gorillas',
-    'gory',
     'gothenburg',
-    'gotta',
-    'gouged',
-    'goulding',
-    'gout',
-    'governorship',
-    'gow',
-    'goya',
-    'gracie',
-    'gradation',
-    'grainger',
-    'gramps',
-    'granary',
-    'grand-daughter',
-    'grandest',
-    'grandmaster',
     'grangemouth',
-    'grant-aid',
-    'granular',
-    'grasmere',
-    'gravestones',
-    'grayson',
-    'gre',
-    'greaseproof',
-    'great-uncle',
-    'greatcoat',
-    'greenaway',
-    'greengrocer',
-    'greenham',
-    'greenhouses',
-    'greenidge',
-    'greening',
     'greets',
-    'gregorian',
-    'grendon',
-    'grenoble',
-    'gresham',
-    'greville',
-    'grey-green',
-    'grey-haired',
-    'greyish',
-    'grierson',
-    'grieved',
-    'grilling',
-    'grinder',
-    'gris',
-    'gritstone',
-    'grizzled',
     'grocers',
-    'groovy',
-    'grossman',
-    'grotesquely',
-    'groundless',
-    'grout',
-    'growths',
-    'grundy',
-    'grunge',
-    'gs',
-    'gti',
-    'gu&eacute;rigny',
-    'guardianship',
-    'gubernatorial',
-    'guidebooks',
-    'guile',
     'guillermo',
-    'guinea-bissau',
-    'gulliver',
-    'gulping',
-    'gundovald',
-    'gunnell',
-    'gunning',
-    'gunshot',
-    'guntram',
-    'guppy',
-    'gurgling',
-    'gurney',
-    'gurus',
-    'guscott',
-    'gushed',
-    'guthrie',
     'gutsy',
-    'guttural',
-    'gwyneth',
-    'gynaecologist',
-    'gynaecology',
-    'h.q',
-    'h1',
-    'habitable',
-    'hacker',
-    'hacksaw',
-    'hades',
-    'haemophiliacs',
-    'haggling',
-    'hah',
-    'hair-raising',
-    'haircuts',
     'hairpin',
-    'haitian',
-    'hakim',
-    'half-a-dozen',
-    'half-an-hour',
-    'half-back',
-    'half-century',
-    'half-closed',
-    'half-day',
-    'half-dozen',
-    'half-empty',
-    'half-life',
-    'half-light',
-    'half-open',
-    'half-sister',
-    'half-timbered',
     'half-year',
-    'halle',
-    'halley',
-    'halogen',
-    'halstead',
-    'halts',
-    'hambledon',
-    'hamburgers',
-    'hamer',
-    'hamlyn',
-    'hampers',
-    'hampson',
-    'hand-in-hand',
-    'hand-made',
-    'handbooks',
-    'handbrake',
     'handgun',
-    'handheld',
-    'handiwork',
-    'handlebars',
-    'handover',
-    'handsworth',
-    'hanks',
-    'hanky',
-    'hannover',
-    'hanns',
-    'hans-dietrich',
-    'haphazardly',
-    'harassing',
-    'harbor',
-    'harbury',
-    'hard-boiled',
     'hard-earned',
-    'hard-line',
-    'hard-up',
-    'hard-won',
-    'hardbroom',
-    'hardie',
-    'hardman',
-    'hardwick',
-    'hardwoods',
-    'hardworking',
-    'harems',
-    'harewood',
-    'harford',
-    'hargreave',
-    'hark',
-    'harmonics',
     'harmonise',
-    'harmonised',
-    'harms',
-    'harnesses',
-    'harried',
-    'haskins',
-    'hast',
-    'hatchback',
-    'hatchet',
-    'hatherby',
-    'haughey',
-    'haughton',
-    'haute',
-    'hauxwell',
-    'havant',
-    'hawthorne',
     'hayden',
-    'haydock',
-    'hb',
-    'hbsag',
-    'hc',
-    'hdl',
-    'headboard',
-    'headgear',
-    'headley',
-    'headlined',
-    'headman',
-    'headmasters',
-    'headroom',
-    'headship',
-    'healers',
-    'healthily',
     'healy',
-    'hearn',
-    'heart-throb',
-    'heartache',
-    'heartbreaking',
-    'hearted',
-    'heathcoat-amory',
-    'heathcote',
-    'heathland',
-    'heaths',
-    'heavies',
-    'heaviness',
-    'heavy-duty',
-    'heavy-handed',
-    'hedley',
-    'hegarty',
     'heifer',
-    'heinemann',
-    'heinous',
-    'hekmatyar',
-    'helical',
-    'helices',
-    'hellenic',
-    'hellish',
-    'helmsley',
-    'helpings',
-    'hemiplegic',
-    'hemispheric',
-    'hempstead',
-    'hepatocytes',
-    'hepworth',
-    'heraldic',
     'herbarium',
-    'herbicides',
-    'herbie',
-    'hereabouts',
-    'hereinafter',
-    'heretics',
-    'hereto',
-    'hereward',
-    'herluin',
-    'herons',
-    'herrick',
-    'herrings',
-    'herriot',
-    'hertford',
-    'hesitancy',
-    'hesitations',
     'hessian',
-    'heterosexuality',
-    'heterosexuals',
-    'hetherington',
-    'heyford',
-    'heywood',
-    'hiccups',
-    'hickey',
-    'hickson',
-    'hideously',
-    'high-energy',
-    'high-fibre',
-    'high-flying',
-    'high-handed',
-    'high-pressure',
-    'higham',
     'highbrow',
-    'higher-level',
-    'highs',
-    'hijack',
-    'hijacking',
-    'hiking',
-    'hilarity',
-    'hindering',
-    'hippie',
-    'hippocampus',
-    'hire-purchase',
-    'hirer',
-    'hirsch',
-    'hispanic',
-    'histologically',
-    'historiography',
     'hitching',
-    'hither',
-    'hives',
-    'hl',
-    'hla',
-    'hoardings',
-    'hobbling',
-    'hobhouse',
-    'hochhauser',
-    'hockney',
-    'hodgkin',
-    'hodkinson',
-    'hodson',
-    'holdsworth',
-    'holford',
-    'holidaying',
     'hollis',
-    'hollowed',
-    'holm',
-    'holme',
-    'holroyd',
-    'holyrood',
-    'holywell',
-    'homeward',
-    'homo',
-    'homo_sapiens',
-    'homophobia',
-    'honor',
-    'hooke',
-    'hooking',
-    'hooted',
-    'hoppers',
     'horan',
-    'horner',
-    'horny',
-    'horoscope',
-    'horoscopes',
-    'horrocks',
-    'horse-riding',
-    'horsepower',
-    'horsham',
-    'horus',
-    'hosepipe',
-    'hoses',
-    'hosiery',
-    'hoskyns',
-    'hostelry',
-    'hour-long',
     'house-building',
-    'housebound',
-    'housebuilding',
-    'hovercraft',
-    'howdendyke',
-    'howes',
-    'howie',
-    'hoy',
-    'hoylake',
-    'hr',
-    'hrawi',
-    'hrh',
-    'hrt',
-    'ht-29',
-    'hubbard',
-    'hubbub',
     'hubby',
-    'huff',
-    'hulls',
-    'humanly',
-    'humbled',
-    'humbler',
-    'humbug',
-    'humdrum',
-    'humourless',
-    'hungerford',
-    'hunk',
-    'hunslet',
-    'hunterston',
-    'huntington',
-    'huntley',
-    'huntsmen',
     'hural',
-    'hurdler',
-    'husrev',
-    'huw',
-    'huyton',
-    'hwim',
-    'hydrophobic',
-    'hydroxyl',
-    'hyperbole',
-    'hypergastrinaemia',
-    'hyperglycaemia',
-    'hypersensitive',
-    'hypertensive',
-    'hypnotised',
-    'hypnotist',
-    'hypoxaemia',
     'hysterectomy',
-    'hysterics',
-    'hyundai',
-    'hz',
-    'i.e',
-    'iaaf',
-    'ibs',
-    'icam-1',
-    'icily',
-    'idaho',
-    'idc',
-    'idcode=',
-    'ide',
-    'idem',
-    'identically',
-    'identifications',
     'idiomatic',
-    'idiotic',
-    'idling',
-    'idyll',
-    'iga',
-    'ignatius',
-    'ignite',
-    'ii.',
-    'ile',
-    'ilk',
-    'ill-advised',
-    'ill-equipped',
-    'ill-fitting',
-    'illegible',
-    'illegitimacy',
-    'illuminations',
     'illustrators',
-    'imaginings',
-    'imam',
-    'imitative',
-    'immaturity',
-    'immemorial',
-    'immerse',
-    'imminence',
-    'immobility',
-    'immunities',
-    'immunology',
-    'impacted',
-    'imparting',
-    'impassively',
-    'impediments',
-    'imperium',
     'impersonation',
-    'impetuous',
-    'impinged',
-    'implants',
-    'implored',
-    'impounded',
-    'impoverishment',
-    'impresario',
-    'impressing',
-    'impressionable',
-    'impressionism',
-    'impressionistic',
-    'impressionists',
-    'improbably',
-    'improvising',
-    'impure',
     'impurity',
-    'imputed',
-    'imran',
-    'ims',
-    'in-built',
-    'inaccuracy',
-    'inadmissible',
-    'inadvertent',
-    'inalienable',
-    'inapplicable',
-    'inarticulate',
-    'inborn',
-    'incalculable',
-    'incarcerated',
-    'incarceration',
-    'incarnate',
     'incendiary',
-    'incestuous',
-    'inched',
-    'incinerators',
-    'incised',
-    'incision',
-    'incisor',
-    'incomprehension',
-    'incongruity',
-    'incongruously',
-    'inconsiderable',
-    'incubator',
-    'incumbents',
-    'incursion',
-    'indefatigable',
-    'indelible',
     'indescribable',
-    'indexation',
-    'indianapolis',
-    'indifferently',
-    'indigestible',
-    'indiscreet',
-    'indiscretion',
-    'individualised',
-    'individualists',
-    'indivisible',
-    'indochina',
-    'indoctrination',
-    'indomitable',
-    'inductivist',
-    'industry-wide',
-    'ineffectiveness',
     'inelastic',
-    'ineptitude',
-    'inequitable',
-    'inescapably',
-    'inexhaustible',
-    'infarct',
-    'infatuated',
-    'infiltrating',
-    'infinitesimal',
-    'infirmity',
-    'inflection',
-    'inflows',
-    'informers',
-    'infrastructural',
-    'infringements',
-    'infringing',
     'ingham',
-    'ingmar',
-    'inhale',
-    'inhaling',
-    'inheritors',
-    'inhumanity',
-    'inimitable',
-    'iniquity',
-    'initialled',
-    'inks',
-    'inky',
-    'inlay',
-    'inlets',
-    'innards',
-    'innocents',
-    'innovate',
     'innovator',
-    'innuendo',
-    'inoculation',
-    'inordinately',
-    'input/output',
-    'inquiring',
-    'inquisitor',
-    'insecticide',
-    'insincere',
-    'insipid',
-    'insistently',
-    'instonians',
-    'instructs',
-    'insufficiency',
-    'insuperable',
-    'insurances',
     'insurgency',
-    'insurgents',
-    'intakes',
-    'integrative',
-    'integrator',
-    'integrators',
-    'intelligibility',
-    'inter-agency',
-    'inter-american',
-    'inter-related',
-    'interbank',
-    'interconnect',
-    'interconnection',
-    'interconnections',
-    'intercontinental',
-    'interfacing',
     'intergraph',
-    'interjected',
-    'interlinked',
-    'internalized',
-    'internationale',
-    'interned',
-    'interposed',
-    'interrelationship',
-    'interrogate',
-    'interrupts',
-    'intersect',
-    'intersections',
-    'interstate',
-    'interstellar',
-    'intervenes',
-    'intestate',
     'intimation',
-    'intoxication',
-    'intraepithelial',
-    'intragastric',
-    'intraluminal',
-    'intransigent',
-    'intravenously',
-    'intrigues',
-    'intro',
-    'introns',
-    'introspective',
-    'introverted',
-    'inuit',
-    'invader',
-    'invalidated',
-    'invective',
     'inventiveness',
-    'invert',
-    'inveterate',
-    'invidious',
-    'invigorating',
-    'invocation',
-    'invokes',
-    'ionian',
-    'iota',
-    'iowa',
-    'ipc',
-    'ipuky',
-    'iran-iraq',
-    'irishmen',
-    'irksome',
-    'ironwork',
     'ironworks',
-    'irreparable',
-    'irreplaceable',
-    'irresponsibility',
-    'irretrievably',
-    'irritates',
-    'isay',
-    'ischaemic',
-    'ismail',
-    'isomers',
-    'isotropic',
-    'ita',
-    'italia',
-    'italianate',
-    'italic',
-    'itc',
     'iterations',
-    'ith',
-    'ivanisevic',
-    'izetbegovic',
-    'jabbing',
-    'jacobson',
-    'jacquie',
-    'jacuzzi',
-    'jag',
-    'jails',
-    'jakobson',
-    'jammu',
-    'jangling',
-    'jarred',
-    'jarrett',
-    'jarring',
     'jaundiced',
-    'jaunt',
-    'javelin',
-    'jazzbeaux',
-    'jd',
-    'jealousies',
-    'jean-marie',
-    'jeering',
-    'jejunal',
-    'jekub',
-    'jellies',
-    'jellyfish',
-    'jem',
-    'jenner',
-    'jeopardised',
-    'jeopardize',
     'jerks',
-    'jerseys',
-    'jervis',
-    'jespersen',
-    'jessamyn',
-    'jewry',
-    'jez',
-    'jib',
-    'jilted',
-    'jitters',
-    'jo&atilde;o',
-    'joachim',
-    'jobbing',
-    'jobson',
-    'jocelyn',
-    'joffre',
     'jogger',
-    'johan',
-    'johanna',
-    'johannes',
-    'jointed',
-    'jokingly',
-    'joni',
-    'jonson',
-    'josiah',
-    'jottings',
-    'journeymen',
-    'joyfully',
-    'joyriding',
-    'jubilation',
-    'juggernaut',
-    'jukebox',
     'juliette',
-    'jumpy',
-    'junkers',
-    'junkie',
-    'junkies',
-    'jura',
-    'jurisprudence',
-    'jurists',
-    'justine',
-    'justinian',
-    'jute',
-    'jutted',
-    'k&amacr;li',
-    'kadilik',
-    'kahlo',
-    'kai',
     'kapil',
-    'karaoke',
-    'kat',
-    'kathmandu',
-    'kathryn',
-    'katrina',
-    'kaunda',
-    'kawasaki',
-    'kayak',
-    'kazakh',
-    'kcl',
-    'kda',
-    'ke',
-    'kebabs',
-    'keg',
-    'kell',
     'kempe',
-    'kenilworth',
-    'ketchup',
-    'keyed',
-    'keynesians',
-    'khalid',
-    'khedive',
-    'ki',
-    'kiah',
-    'kilbride',
-    'kildare',
-    'kilkenny',
-    'kilogram',
-    'kimon',
-    'kindest',
-    'kindled',
     'kindling',
-    'kinetics',
-    'kinghorn',
-    'kingman',
-    'kingsholm',
-    'kington',
-    'kip',
-    'kirgizstan',
-    'kirkcaldy',
-    'kirkpatrick',
-    'kirkwood',
-    'kissinger',
-    'kitchenette',
-    'kitsch',
-    'kitson',
-    'kiwis',
     'kj',
-    'kleinwort',
-    'knapp',
-    'knead',
-    'kneading',
-    'knell',
-    'knife-edge',
-    'knightly',
-    'knits',
-    'knobbly',
-    'knott',
-    'konrad',
-    'korda',
-    'kosher',
-    'kozyrev',
-    'kp',
     'krajina',
-    'kramer',
-    'krishna',
-    'kronweiser',
-    'ks',
-    'kursk',
-    'kuwaitis',
-    'kw',
-    'kyi',
-    'kyte',
-    'l.c.c.',
-    'l.e.d.',
-    'labourism',
-    'laconic',
-    'lacquered',
-    'ladle',
     'lagan',
-    'lagerfeld',
-    'lagoons',
-    'lahore',
-    'laid-back',
-    'lairds',
-    'lakatos',
-    'laker',
-    'lam',
-    'lambda',
-    'lamentable',
-    'laments',
-    'laminin',
-    'land-rover',
-    'landau',
-    'lander',
     'landowning',
-    'langford',
-    'languidly',
-    'languishing',
-    'lanky',
-    'laparotomy',
-    'lapillus',
-    'lapis',
-    'laplace',
-    'laptop',
-    'lara',
-    'lard',
-    'largesse',
-    'larks',
-    'laserjet',
-    'lasses',
     'lassie',
-    'last-ditch',
-    'latched',
-    'lateness',
-    'lateran',
-    'lather',
-    'laud',
-    'lauderdale',
-    'launchers',
-    'laundered',
-    'laureate',
-    'laverne',
-    'lawlessness',
-    'lawsuits',
-    'laxatives',
-    'lay-by',
     'lay-off',
-    'lay-out',
-    'layering',
-    'layfield',
-    'lazuli',
-    'lb.',
-    'lbw',
-    'lcc',
-    'lcd',
-    'ldl',
-    'leaderships',
-    'leaky',
-    'leamington',
-    'lean-to',
-    'leanne',
-    'leathers',
     'lech',
-    'lectern',
-    'leeches',
-    'leeming',
-    'leer',
-    'leeward',
-    'left-arm',
-    'left-back',
-    'left-hander',
-    'legalistic',
-    'legalized',
-    'legate',
-    'legation',
-    'legionnaires',
-    'lehman',
-    'lei',
     'lemmings',
-    'leonidas',
-    'leonore',
-    'leper',
-    'lepine',
-    'leprosy',
-    'lesbianism',
-    'lesley-jane',
-    'letterbox',
-    'letterman',
-    'lettings',
-    'leucine',
-    'levant',
-    'levellers',
-    'levelly',
-    'leven',
     'leveraged',
-    'levered',
-    'levinson',
-    'levitt',
-    'levying',
-    'lewin',
-    'lex',
-    'lexicographer',
-    'lexis',
-    'lhasa',
-    'liaising',
-    'liaisons',
-    'libra',
-    'liddell',
-    'lido',
-    'liechtenstein',
     'liege',
-    'life-styles',
-    'lifes',
-    'light-headed',
-    'lightening',
-    'lillian',
-    'lineout',
-    'lingerie',
-    'lingfield',
-    'linley',
-    'linthorpe',
-    'lipids',
-    'lipman',
-    'lipoprotein',
-    'lipton',
-    'liquidators',
     'liquorice',
-    'lisbie',
-    'listless',
-    'liszt',
-    'lite',
-    'lithium',
-    'lithotripsy',
-    'litigant',
-    'litters',
-    'littlejohn',
-    'liu',
-    'livelihoods',
-    'liven',
-    'livers',
-    'livings',
-    'll',
     'llangollen',
-    'ln',
-    'loam',
-    'loathsome',
-    'lobbyists',
-    'lobsters',
-    'locale',
-    'localisation',
-    'locates',
-    'lockers',
-    'locket',
-    'lockheed',
-    'locomotion',
-    'locos',
-    'logarithm',
-    'logogen',
     'lois',
-    'loitering',
-    'lola',
-    'lolling',
-    'lollipop',
-    'long-haired',
-    'long-legged',
-    'long-lost',
-    'long-serving',
-    'long-suffering',
-    'longings',
-    'longish',
-    'longs',
-    'lookalike',
-    'looping',
-    'loopy',
     'loos',
-    'loosed',
-    'lopsided',
-    'lordly',
-    'lothians',
-    'lounged',
-    'louts',
-    'loveless',
-    'loveliest',
-    'lovey',
-    'low-grade',
-    'low-pass',
-    'lower-level',
-    'lows',
-    'loyally',
-    'lse',
     'ltb',
-    'ltr',
-    'lu',
-    'lubricant',
-    'luca',
-    'luckless',
-    'ludicrously',
-    'lugubrious',
-    'lulled',
-    'lulling',
-    'lully',
-    'lumber',
-    'luminaries',
-    'luminescence',
-    'luminosity',
-    'luminoso',
     'lumley',
-    'lump-sum',
-    'lumped',
-    'luna',
-    'lunacy',
-    'lunn',
-    'lurks',
-    'lusaka',
-    'lustrous',
-    'lusty',
-    'luxemburg',
-    'luxuriant',
-    'lwt',
-    'lx',
-    'lydon',
-    'lyman',
     'lyme',
-    'lymphocyte',
-    'lymphoid',
-    'lyndon',
-    'lysis',
-    'lysosomal',
-    'lysozyme',
-    'm40',
-    'm5',
-    'ma&icirc;tre',
-    'macdonalds',
-    'machair',
-    'machinations',
-    'machining',
-    'machismo',
-    'machynlleth',
     'macintyre',
-    'maclaren',
-    'macro-economic',
-    'maddening',
-    'made-up',
-    'madra',
-    'madrigals',
-    'maelstrom',
-    'magenta',
-    'magi',
-    'magicians',
-    'magill',
-    'magnitudes',
-    'magnox',
-    'magpies',
-    'mags',
     'magwitch',
-    'mahathir',
-    'mahdi',
-    'maidens',
-    'mailer',
-    'maimed',
-    'mainline',
-    'major-general',
-    'makepeace',
-    'makings',
-    'maladministration',
-    'malai',
-    'malais',
-    'malc',
-    'maldives',
-    'male-dominated',
     'maleness',
-    'malfunction',
-    'malham',
-    'malibu',
-    'malign',
-    'malinowski',
-    'mallory',
-    'malmesbury',
-    'maloney',
-    'malpass',
-    'maltote',
-    'mamur',
-    'managua',
-    'mandamus',
-    'mandru',
-    'manescu',
     'manger',
-    'manhole',
-    'manicured',
-    'manifestos',
-    'mann-whitney',
-    'mannered',
-    'manometric',
-    'manorial',
-    'manservant',
-    'maoist',
-    'maples',
-    'marathons',
-    'marchioness',
-    'marcia',
-    'marg',
-    'marge',
     'marginalized',
-    'marinade',
-    'marje',
-    'marketer',
-    'marksman',
-    'marlboro',
-    'marler',
-    'maronite',
-    'marooned',
-    'marquetry',
-    'marshalls',
-    'marshland',
-    'marske',
-    'marten',
-    'martian',
-    'marvelling',
     'marvels',
-    'marxist-leninist',
-    'maslin',
-    'mastermind',
-    'masterminded',
-    'matchbox',
-    'matchsticks',
-    'mated',
-    'materiality',
-    'materialize',
-    'mathers',
-    'matheson',
-    'matinee',
-    'matlock',
-    'matthias',
-    'maturities',
     'maudlin',
-    'maugham',
-    'maul',
-    'mawhinney',
-    'maxima',
-    'maximised',
-    'maybury',
-    'mayoress',
-    'maypole',
-    'mca',
-    'mccallen',
-    'mccallum',
-    'mcclellan',
-    'mcclelland',
-    'mccloy',
-    'mcconnell',
     'mccormick',
-    'mccoy',
-    'mccreery',
-    'mcculloch',
-    'mccullough',
-    'mcdowell',
-    'mcevoy',
-    'mcfall',
-    'mcgeechan',
-    'mcguire',
-    'mcgurk',
-    'mcinnes',
-    'mcintyre',
-    'mckee',
-    'mckinsey',
-    'mcnally',
     'mcnealy',
-    'mcquaid',
-    'mcrae',
-    'mctear',
-    'mcwhirter',
-    'meacher',
-    'meade',
-    'mealtimes',
-    'meanders',
-    'meanness',
-    'meaty',
-    'mechanisation',
-    'mechanised',
-    'mechanization',
-    'meciar',
-    'medallions',
     'meddle',
-    'medell&iacute;n',
-    'medici',
-    'medina',
-    'meditate',
-    'meditative',
-    'medoc',
-    'medreses',
-    'megabytes',
-    'melford',
-    'mellitus',
-    'mello',
-    'mellon',
-    'mellowed',
-    'memet',
-    'memorably',
     'memorise',
-    'men-at-arms',
-    'menaces',
-    'mendel',
-    'mendelssohn',
-    'menlo',
-    'menswear',
-    'meps',
-    'mercians',
-    'merlyn',
-    'mermaid',
-    'merriment',
-    'mesenchyme',
-    'messrs.',
-    'metallurgical',
-    'metallurgy',
     'metamorphic',
-    'metaphoric',
-    'metastases',
-    'meteor',
-    'meteoric',
-    'meteorite',
-    'meteorology',
-    'metering',
-    'methadone',
-    'metrical',
-    'metropole',
-    'mettle',
-    'mezzanine',
-    'mhz',
-    'miandad',
-    'mica',
     'michels',
-    'microalbuminuria',
-    'microbial',
-    'microbiological',
-    'microbiology',
-    'microfiche',
-    'microlight',
-    'micron',
-    'microwaves',
-    'mid-1990',
-    'mid-1990s',
-    'mid-1991',
-    'mid-april',
-    'mid-august',
-    'mid-century',
-    'mid-eighties',
     'mid-february',
-    'mid-july',
-    'mid-may',
-    'mid-price',
-    'mid-seventies',
-    'mid-sixties',
-    'mid-victorian',
-    'mid-wales',
-    'mid-way',
-    'middleham',
-    'middlemen',
-    'middling',
-    'midges',
-    'midgley',
-    'midriff',
-    'migrations',
     'mil',
-    'militarism',
-    'milked',
-    'millan',
-    'milled',
-    'millers',
-    'millett',
-    'milliseconds',
-    'millstone',
-    'mimics',
-    'minehead',
-    'minerva',
-    'ming',
-    'mini-bar',
-    'minis',
-    'minke',
     'minneapolis',
-    'minnows',
-    'minoans',
-    'minstrel',
-    'minted',
-    'minto',
-    'minutely',
-    'minutiae',
-    'mirren',
-    'mis',
-    'misappropriation',
-    'miscellany',
-    'mischievously',
-    'misconceived',
-    'misdemeanour',
-    'misdemeanours',
     'misdirected',
-    'misinterpretation',
-    'misogyny',
-    'misrepresented',
-    'mistook',
-    'mitchum',
-    'miti',
-    'mitigating',
-    'mitochondria',
-    'mitotic',
-    'mitsotakis',
-    'mix-up',
-    'mixers',
-    'mobilising',
-    'mobilizing',
-    'mobuto',
     'moby',
-    'moderated',
-    'modernising',
-    'modernize',
-    'modernized',
-    'modernizing',
-    'modicum',
-    'modifies',
-    'modrow',
-    'mods',
-    'modulated',
-    'moduli',
-    'moistened',
-    'moisturiser',
-    'moisturising',
-    'mol',
     'molassi',
-    'moldavian',
-    'molland',
-    'mollie',
-    'molloy',
-    'molyneux',
-    'monetarism',
-    'mongol',
-    'mongrel',
-    'monie',
-    'monique',
-    'monogamous',
-    'monogamy',
-    'monotone',
-    'monro',
-    'monrovia',
     'montaine',
-    'monteverdi',
-    'montpellier',
-    'moodie',
-    'moodily',
-    'moorlake',
-    'moorlands',
-    'moped',
-    'mops',
-    'moralistic',
-    'moralists',
-    'morass',
-    'morel',
-    'moreton',
-    'morey',
-    'morgue',
     'moritz',
-    'mornin\'',
-    'morosely',
-    'morpeth',
-    'morpurgo',
-    'mort',
-    'mortally',
-    'mortgaged',
-    'mortified',
-    'mossad',
-    'mossley',
-    'mossy',
-    'motets',
-    'motherland',
-    'motherly',
-    'motorcycles',
     'motorised',
-    'moult',
-    'moulton',
-    'mounce',
-    'mountaineer',
-    'mountaineers',
-    'mourne',
-    'moussa',
-    'moustaches',
-    'mouthfuls',
-    'mouthing',
-    'mouvement',
-    'mow',
-    'mown',
-    'mpg6',
-    'mphil',
     'mrc',
-    'mtv',
-    'much-loved',
-    'mueller',
-    'muesli',
-    'muggeridge',
-    'muggers',
-    'mugging',
-    'mughal',
-    'mulch',
-    'mullen',
-    'mullin',
-    'mullins',
-    'multhrop',
-    'multi-cultural',
-    'multi-faceted',
     'multi-millionaire',
-    'multi-purpose',
-    'multi-racial',
-    'multi-storey',
-    'multilingual',
-    'multivariate',
-    'mumble',
-    'mundi',
-    'municipalities',
-    'munn',
-    'munros',
-    'muon',
-    'murad',
-    'murals',
-    'murine',
-    'murtach',
     'mus',
-    'musa',
-    'mush',
-    'mushy',
-    'music-making',
-    'musing',
-    'musk',
-    'mussel',
-    'mustafa',
-    'mustered',
-    'myopic',
-    'myrtle',
-    'n\'',
-    'n-terminal',
-    'nadine',
-    'nagged',
     'naively',
-    'nannies',
-    'nantes',
-    'narcissism',
-    'narcissistic',
-    'narcotic',
-    'narrowest',
-    'naseby',
-    'nashville',
-    'nassau',
-    'nasties',
-    'nastiness',
-    'nate',
-    'nation-state',
-    'nation-wide',
-    'naturalness',
     'naught',
-    'nauru',
-    'nauseating',
-    'nauseous',
-    'navarre',
-    'navigable',
-    'navigating',
-    'navigators',
-    'navratilova',
-    'naw',
-    'nawaz',
-    'nbc',
-    'nc',
-    'ncb',
-    'nco',
-    'ndp',
     'nea',
-    'neale',
-    'neanderthal',
-    'nearside',
-    'neater',
-    'neatness',
-    'nebulous',
-    'necessitating',
-    'needlessly',
-    'needlework',
-    'negated',
-    'neglects',
-    'neighbourly',
-    'nematodes',
-    'nemesis',
-    'nene',
     'neneh',
-    'neo-nazi',
-    'neoclassical',
-    'neoplasia',
-    'nepalese',
-    'nepotism',
-    'nerc',
-    'neue',
-    'neuronal',
-    'neurone',
-    'neurotransmitter',
-    'neutralise',
-    'neutralised',
-    'neutrino',
-    'neutrophil',
-    'nev',
     'nevin',
-    'new-look',
-    'new-style',
-    'newbolt',
-    'newbridge',
-    'newhaven',
-    'newly-formed',
-    'newnham',
-    'newsworthy',
-    'newt',
-    'newtownards',
-    'nf-l',
-    'nfs',
-    'ngos',
-    'nibble',
-    'nic',
     'nicholl',
-    'nicking',
-    'nico',
-    'nicodemus',
-    'nicolson',
-    'nidri',
-    'nieces',
-    'nielsen',
-    'nigh',
-    'nightgown',
-    'nightie',
-    'nike',
-    'nikki',
-    'nikon',
-    'nimbus',
-    'nines',
     'ninety-five',
-    'ninety-four',
-    'ninety-nine',
-    'ninety-one',
-    'ninety-three',
-    'ninety-two',
-    'nipping',
-    'nirex',
-    'nisodemus',
-    'nithard',
-    'nitrite',
-    'nitrous',
-    'niven',
-    'no-go',
-    'no.1',
-    'no.8',
     'no_matter_where',
-    'nobly',
-    'noddy',
-    'nominating',
-    'nomura',
-    'non-academic',
-    'non-alignment',
-    'non-christian',
-    'non-commercial',
-    'non-committal',
-    'non-domestic',
-    'non-equity',
-    'non-european',
-    'non-fiction',
-    'non-hodgkin',
-    'non-insulin',
     'non-intervention',
-    'non-medical',
-    'non-nuclear',
-    'non-specialist',
-    'non-toxic',
-    'non-uk',
-    'non-violence',
-    'non-zero',
-    'nonchalant',
-    'nondescript',
-    'none_the',
-    'nonlinear',
-    'nook',
-    'norbert',
-    'nord',
-    'normalized',
     'northbound',
-    'nosed',
-    'nosey',
-    'nostril',
-    'nosy',
-    'nothin\'',
-    'noticeboard',
-    'notre',
-    'nour',
-    'novelties',
-    'nox',
-    'npa',
-    'npc',
-    'npt',
-    'nr',
-    'nsa',
     'nub',
-    'nudity',
-    'nuisances',
-    'nullity',
-    'numbed',
-    'numerals',
-    'nunn',
-    'nunnery',
-    'nutshell',
-    'nutter',
-    'nw',
-    'nyerere',
-    'nymph',
-    'nymphs',
-    'o\'er',
-    'o\'keeffe',
     'o\'neil',
-    'o\'s',
-    'o\'shea',
-    'o\'toole',
-    'oar',
-    'oases',
-    'oatmeal',
-    'obiter',
-    'obituaries',
-    'objectification',
-    'objector',
-    'obliges',
-    'obliterate',
-    'obs',
-    'obscenities',
-    'obscurely',
     'obsessional',
-    'obsessively',
-    'obsolescence',
-    'obstetric',
-    'obstinacy',
-    'obstinately',
-    'obstructions',
-    'obtrusive',
-    'obtuse',
-    'obverse',
-    'occam',
-    'occlusion',
-    'ocker',
-    'ockleton',
-    'oct-11',
-    'octagon',
     'octaves',
-    'od',
-    'oda',
-    'oddities',
-    'odette',
-    'odhar',
-    'odious',
-    'oeuvre',
-    'off-farm',
-    'off-peak',
-    'off-putting',
-    'off-road',
-    'offal',
-    'offends',
-    'offiah',
-    'offing',
     'offsetting',
-    'offstage',
-    'ohms',
-    'oilfield',
-    'okapi',
-    'oki',
-    'oklahoma',
-    'ol',
-    'olaf',
-    'oldies',
-    'oleg',
-    'olfactory',
-    'olympian',
-    'omens',
-    'omf',
-    'omits',
     'omnipotent',
-    'one-and-a-half',
-    'one-handed',
-    'one-parent',
-    'one-tenth',
-    'onlooker',
-    'oozed',
-    'opal',
-    'open-minded',
-    'operands',
-    'oppenheim',
-    'opportune',
-    'oppositional',
-    'ops',
-    'optician',
-    'optimisation',
     'optimise',
-    'optimist',
-    'optimistically',
-    'optimists',
-    'opulence',
-    'orang-utan',
-    'orbitals',
-    'orchestration',
-    'ordinances',
-    'ordinariness',
-    'oreste',
-    'orf',
-    'orford',
-    'organists',
-    'organizes',
-    'oriel',
     'ormskirk',
-    'ornamentation',
-    'ornithologist',
-    'ornithology',
-    'ors',
-    'orthogonal',
-    'orthographic',
-    'osbern',
-    'oscillating',
-    'oscillator',
-    'osi',
-    'osmotic',
-    'ostensible',
-    'ostentatiously',
-    'oswestry',
-    'ot',
     'otherness',
-    'ottery',
-    'ousting',
-    'out-of-town',
-    'out-patient',
-    'outclassed',
-    'outdone',
-    'outermost',
-    'outlived',
-    'outpatients',
-    'outposts',
-    'outrageously',
-    'outrages',
-    'outsize',
-    'outweighs',
-    'ovaries',
     'over-zealous',
-    'overawed',
-    'overdone',
-    'overdrafts',
-    'overdrawn',
-    'overestimated',
-    'overflowed',
-    'overheated',
-    'overkill',
-    'overloading',
-    'overpriced',
-    'overrule',
-    'overseer',
-    'overseers',
-    'oversees',
-    'oversized',
     'overspend',
-    'overspending',
-    'overspill',
-    'ovum',
-    'owd',
-    'owner-occupation',
-    'owner-occupied',
-    'oz.',
-    'p&acirc;t&eacute',
-    'p\'s',
-    'p.225',
-    'p2',
-    'p3a',
-    'p4',
-    'p6',
-    'paba-udca',
     'paceman',
-    'paddled',
-    'paddlers',
-    'paddles',
-    'paediatrician',
-    'paganism',
-    'pagans',
-    'pagham',
-    'paging',
-    'pahl',
-    'pail',
-    'painlessly',
-    'palatial',
-    'paley',
-    'palin',
-    'palladian',
     'pallet',
-    'palliative',
-    'palo',
-    'pandemonium',
-    'pangs',
-    'panic-stricken',
-    'panicky',
-    'pankhurst',
-    'panties',
-    'papandreou',
-    'papilla',
-    'parachutes',
-    'parading',
-    'parcelforce',
-    'paris-based',
-    'parke',
     'parkhead',
-    'parkside',
-    'parlance',
-    'parliamentarian',
-    'parlours',
-    'parmesan',
-    'parse',
-    'parser',
-    'parsifal',
-    'partake',
-    'partiality',
-    'participates',
-    'partick',
-    'particularity',
-    'partisanship',
-    'partitioning',
     'partnered',
-    'pasha',
-    'passageways',
-    'pastries',
-    'pate',
-    'pater',
-    'pathfinders',
-    'patina',
-    'paton',
-    'patrese',
-    'patronise',
-    'patronised',
-    'patton',
-    'pau',
-    'paulie',
-    'pausanias',
     'pavarotti',
-    'paye',
-    'pc.',
-    'pcb',
-    'pcna',
-    'pd',
-    'pdc',
-    'peacocks',
-    'pearse',
-    'pease',
-    'pecked',
-    'pectoral',
-    'pedalling',
-    'pedantic',
-    'peddling',
-    'pedlar',
     'peels',
-    'pegg',
-    'pejorative',
-    'pelham',
-    'pelmet',
-    'peloponnesian',
-    'pelted',
-    'penalise',
-    'penang',
-    'pendlebury',
-    'peninsular',
-    'penitent',
-    'penknife',
-    'pennant',
-    'penrith',
-    'pentonville',
     'peopled',
-    'peppered',
-    'pepys',
-    'perambulations',
-    'percival',
-    'peremptory',
-    'perfecting',
-    'perforation',
-    'perforce',
-    'perfused',
-    'peripatetic',
-    'peristalsis',
-    'perjury',
-    'permeable',
-    'permeate',
-    'permeates',
     'perms',
-    'peroxidase',
-    'perpetuating',
-    'perpetuity',
-    'perplexing',
-    'perplexity',
-    'perrin',
-    'persevere',
-    'persevered',
-    'personification',
-    'persuasively',
-    'pertwee',
-    'pervades',
-    'perversity',
-    'peseta',
-    'pestered',
     'pestering',
-    'petitioners',
-    'petra',
-    'petre',
-    'petrochemicals',
-    'petrograd',
-    'petticoats',
-    'petula',
-    'pflp',
-    'pgce',
-    'ph.d',
-    'pharmacists',
-    'pharmacology',
-    'phelan',
-    'phena',
-    'phenomenology',
     'phenotypic',
-    'phenylalanine',
-    'philistine',
-    'philistines',
-    'philosophic',
-    'phone-in',
-    'phospholipid',
-    'phospholipids',
-    'photochemical',
-    'phraseology',
-    'phylogenetic',
-    'physic',
-    'physiotherapists',
-    'phytoplankton',
-    'piaroa',
-    'pickers',
     'piero',
-    'piglets',
-    'pile-up',
-    'pimlico',
-    'pimp',
-    'pinder',
-    'pinewood',
-    'pinnacles',
-    'pinpointed',
-    'pippa',
-    'pipped',
-    'pissing',
-    'piste',
-    'pistons',
-    'pitcher',
-    'pithy',
     'pitifully',
-    'pitts',
-    'pituitary',
-    'pivoting',
-    'placard',
-    'placenta',
-    'placental',
-    'placidly',
-    'plagues',
-    'plaice',
-    'plaited',
-    'planar',
-    'plasterboard',
-    'plasterwork',
-    'playable',
-    'player-manager',
     'playgrounds',
-    'playgroups',
-    'playroom',
-    'plc.',
-    'pleads',
-    'pleasantries',
-    'plexus',
-    'pliable',
-    'plied',
-    'pliers',
-    'pliny',
-    'plod',
-    'plodded',
-    'plotter',
-    'plt.off',
-    'plucky',
     'plumbers',
-    'plummeting',
-    'plumped',
-    'plundering',
-    'plunges',
-    'plutarch',
-    'plying',
-    'pmr',
-    'pnc',
-    'poach',
-    'poacher',
-    'poe',
-    'poetics',
-    'pogo',
-    'point-blank',
-    'pointes',
     'poisson',
-    'poitou',
-    'polaroid',
-    'policed',
-    'policewomen',
-    'polisario',
-    'pollination',
-    'pollitt',
-    'pollutant',
-    'polluter',
-    'polyacrylamide',
-    'polymeric',
-    'polymorphism',
-    'polynomial',
-    'polynomials',
-    'polyp',
     'ponders',
-    'pontificate',
-    'pontypridd',
-    'poo',
-    'popcorn',
-    'populism',
-    'por',
-    'porcine',
-    'porpoises',
-    'porta',
-    'ported',
-    'porterfield',
-    'porthmadog',
-    'portly',
-    'portman',
-    'portobello',
     'portrush',
-    'posited',
-    'posix',
-    'post-election',
-    'post-modern',
-    'postbag',
-    'posthumously',
-    'postings',
-    'postlethwaite',
-    'postnatal',
-    'postnominal',
-    'postulates',
-    'posturing',
-    'potash',
-    'potentiality',
-    'potholes',
     'potion',
-    'potions',
-    'potsdam',
-    'potteries',
-    'pouches',
-    'pouchitis',
-    'pow',
-    'powdery',
-    'powering',
-    'pows',
-    'pox',
-    'ppt',
-    'prado',
-    'prams',
-    'prancing',
-    'pre-arranged',
     'pre-christmas',
-    'pre-empted',
-    'pre-emption',
-    'pre-raphaelite',
-    'pre-set',
-    'precambrian',
-    'precept',
-    'precincts',
-    'precipice',
-    'predicative',
-    'predilection',
-    'predisposed',
-    'predominates',
-    'prefabricated',
-    'prefaced',
-    'prefect',
     'preferentially',
-    'prehistory',
-    'preliminaries',
-    'premeditated',
-    'premised',
-    'premonition',
-    'prenatal',
-    'prescot',
-    'prescribes',
-    'preservative',
-    'preservatives',
-    'president-elect',
-    'presides',
-    'presocratics',
-    'pressurized',
-    'prestatyn',
     'presumes',
-    'presuming',
-    'presumptuous',
-    'presupposed',
-    'presupposition',
-    'pretension',
-    'prettily',
-    'preventable',
-    'previews',
-    'prewar',
-    'preyed',
-    'pricey',
-    'pricking',
-    'priestess',
-    'prima',
-    'primitives',
     'primly',
-    'print-out',
-    'prism',
-    'privatisations',
-    'privity',
-    'prize-winning',
-    'pro-active',
-    'probationary',
-    'procter',
-    'proctocolectomy',
-    'procurator',
-    'profane',
-    'profit-making',
-    'profligate',
-    'profumo',
-    'prognostic',
     'programmable',
-    'prokofiev',
-    'proliferated',
-    'proliferating',
-    'prolongation',
-    'promontory',
-    'pronouncing',
-    'propagating',
-    'prophesied',
-    'prophylactic',
-    'propitious',
-    'proponent',
-    'proportionally',
-    'propounded',
-    'prospectuses',
-    'prostaglandins',
     'prostatic',
-    'prostrate',
-    'prot&eacute;g&eacute',
-    'protections',
-    'protectively',
-    'protectors',
-    'protractor',
-    'proverbs',
-    'provocatively',
-    'prow',
-    'proximally',
-    'prp',
-    'pru',
-    'prudently',
-    'prue',
-    'prunella',
     'prussians',
-    'pry',
-    'ps/2',
-    'psalter',
-    'pseudonym',
-    'psycho',
-    'psychosocial',
-    'ptolemy',
-    'pts',
-    'publicans',
-    'publicising',
-    'publicize',
-    'puckered',
-    'puffin',
-    'pulley',
-    'pullman',
     'puma',
-    'pumfrey',
-    'pumice',
-    'punctual',
-    'punctuality',
-    'punjabi',
-    'puns',
-    'purer',
-    'purges',
-    'purging',
-    'purify',
-    'purist',
-    'puritanical',
-    'purley',
-    'purposive',
-    'purr',
     'purred',
-    'purvis',
-    'pv',
-    'pye',
-    'pyjama',
-    'pyloric',
-    'pym',
-    'pyongyang',
-    'pyrenean',
-    'q&lsqb;x&rsqb',
-    'qaddafi',
-    'qdm',
-    'qian',
-    'qt',
-    'quadratic',
-    'quadrupled',
     'quantifying',
-    'quarrelsome',
-    'quartered',
-    'quarto',
-    'quasar',
-    'quays',
-    'queasy',
-    'queene',
-    'queenie',
-    'queensferry',
-    'questioningly',
-    'quex',
-    'quibble',
-    'quiche',
-    'quicken',
-    'quieten',
     'quietened',
-    'quill',
-    'quilts',
-    'quincey',
-    'quincx',
-    'quinine',
-    'quins',
-    'quintessential',
-    'quintin',
-    'quirks',
-    'quotient',
-    'r.a.f.',
-    'r5',
-    'rabat',
-    'rabble',
-    'rabia',
     'rabid',
-    'rabies',
-    'racal',
-    'racehorse',
-    'rachael',
-    'rachmaninov',
-    'racy',
-    'rada',
-    'radioimmunoassay',
-    'rafiq',
-    'rafting',
-    'rahman',
-    'railfreight',
-    'railwaymen',
-    'rainbows',
-    'raindrops',
     'rainey',
-    'raison_d\'&ecirc;tre',
-    'ramadan',
-    'rambler',
-    'rambles',
-    'rambo',
-    'rampton',
-    'ramsgate',
-    'rancid',
-    'rancour',
-    'randomisation',
-    'rant',
-    'ranting',
-    'rapists',
-    'rapper',
-    'rapturous',
     'rarefied',
-    'rasbora',
-    'rashly',
-    'rasp',
-    'rassemblement',
-    'ratchet',
-    'rationalised',
-    'rationalized',
-    'ratner',
-    'ravenous',
-    'ravens',
-    'raves',
-    'rawlings',
-    'rawp',
-    'rayleigh',
-    'rbg',
     'rcn',
-    'rds',
-    're-create',
-    're-creation',
-    're-emerged',
-    're-emergence',
-    're-entered',
-    're-establishing',
-    're-establishment',
-    're-examination',
-    're-examined',
-    're-opening',
-    're-read',
-    're-used',
-    'readies',
-    'readjustment',
     'reaffirm',
-    'reagent',
-    'real-world',
-    'realisable',
-    'reappears',
-    'reappointed',
-    'rear-view',
-    'reassessed',
-    'rebellions',
-    'rebleeding',
-    'rebuff',
-    'recap',
-    'recast',
-    'recede',
-    'recessionary',
-    'recessive',
     'reciprocated',
-    'recitative',
-    'reclaiming',
-    'recollected',
-    'recombination',
-    'reconstructing',
-    'recoveries',
-    'rectitude',
-    'recurred',
-    'recurrences',
-    'recurs',
-    'recyclable',
-    'red-haired',
-    'redditch',
-    'reddy',
-    'redeeming',
     'redefining',
-    'redefinition',
-    'redford',
-    'redhead',
-    'redirect',
-    'redirected',
-    'rediscover',
-    'rediscovery',
-    'redistribute',
-    'redistributed',
-    'redolent',
-    'redoubtable',
-    'redpath',
-    'redruth',
-    'reductionism',
-    'reductionist',
     'reebok',
-    'reece',
-    'referencing',
-    'referendums',
-    'refit',
-    'reflectively',
-    'reflexive',
-    'reformulation',
-    'refractory',
-    'refresher',
-    'refrigerated',
-    'refuges',
-    'refunded',
-    'refunds',
-    'refurbishing',
-    'refusals',
     'refutation',
-    'regalia',
-    'regularities',
-    'rehabilitate',
-    'rehabilitated',
-    'rehoused',
-    'rehydration',
-    'reimburse',
-    'reined',
-    'reinterpretation',
-    'reissued',
-    'reiterating',
-    'reith',
-    'rejuvenated',
-    'rekindled',
-    'relaunch',
     'relaunched',
-    'relaxes',
-    'relaying',
-    'relays',
-    'relieves',
-    'religiously',
-    'relinquishing',
-    'relive',
-    'reliving',
-    'relocating',
-    'remake',
-    'remittances',
-    'remitted',
-    'remix',
-    'remodelled',
-    'remodelling',
     'remorseless',
-    'remorselessly',
-    'remoter',
-    'remotest',
-    'remover',
-    'reneged',
-    'renegotiate',
-    'renovating',
-    'renown',
-    'repainted',
-    'repairer',
-    'reparation',
-    'repatriated',
-    'repayable',
-    'repaying',
-    'replete',
     'replicators',
-    'repositories',
-    'repossession',
-    'repressor',
-    'reprieved',
-    'reproachfully',
-    'reproducible',
-    'repton',
-    'republicanism',
-    'repulsed',
-    'repulsion',
-    'repute',
-    'requisitions',
-    'rescheduled',
-    'rescind',
-    'rescission',
     'rescuer',
-    'resell',
-    'resemblances',
-    'resentfully',
-    'resentments',
-    'reservists',
-    'reshape',
-    'reshuffled',
-    'resignedly',
-    'resistances',
-    'resistors',
-    'resonances',
-    'resource-based',
-    'resourcing',
-    'responders',
-    'restarted',
     'restatement',
-    'restores',
-    'resurfaced',
-    'resurrect',
-    'resuspended',
-    'retails',
-    'retaliated',
-    'retaliatory',
-    'retinoic',
-    'retirements',
-    'retract',
-    'retrenchment',
-    'returners',
-    'revamp',
-    'revel',
-    'revels',
     'reverently',
-    'reversals',
-    'reverts',
-    'reviled',
-    'revitalise',
-    'revitalised',
-    'revocation',
-    'revolted',
-    'revolutionised',
-    'revs',
-    'rewind',
-    'reworked',
-    'reworking',
-    'reyburn',
-    'reza',
-    'rheims',
     'rhetorically',
-    'rhineland',
-    'rhode',
-    'rhodesian',
-    'rhododendron',
-    'rhododendrons',
-    'rhythmical',
-    'ribcage',
-    'ric',
-    'rican',
-    'richmann',
-    'rics',
-    'riddick',
-    'riddles',
-    'ridgeway',
-    'riff',
     'rifting',
-    'rifts',
-    'right-back',
-    'right-handed',
-    'right-on',
-    'rightfully',
-    'rilla',
-    'rime',
-    'rims',
-    'rinsing',
-    'riposte',
-    'rips',
-    'ripstop',
-    'ritualistic',
-    'ritually',
-    'rivets',
     'rix',
-    'riyadh',
-    'rmi',
-    'roald',
-    'robotic',
-    'robustness',
-    'roc',
-    'rockwell',
-    'roddy',
-    'rodin',
-    'rodo',
-    'rodr&iacute;guez',
-    'rogan',
-    'roget',
-    'rolf',
-    'rolfe',
     'rollins',
-    'romano',
-    'romano-british',
-    'romantically',
-    'romantics',
-    'romero',
-    'romped',
-    'ronan',
-    'ronny',
-    'roofed',
-    'rooftop',
-    'rosalba',
-    'rosamund',
-    'rosary',
-    'roscoe',
-    'roskill',
     'rossendale',
-    'rossini',
-    'roster',
-    'rotates',
-    'rotations',
-    'rote',
-    'rothermere',
-    'rougher',
-    'roughness',
-    'roundhouse',
-    'routledge',
-    'roux',
-    'rowbotham',
-    'rowdies',
-    'rowley',
-    'roxie',
     'royle',
-    'rpc',
-    'rpf',
-    'rsa',
-    'rsfsr',
-    'rte',
-    'rubbers',
-    'rubbery',
-    'rubies',
-    'rubinstein',
-    'rucksacks',
-    'rudi',
-    'rudiments',
-    'rudolph',
-    'rufous',
-    'rumblings',
     'rumbold',
-    'rummage',
-    'rummaging',
-    'runcie',
-    'rungs',
-    'runways',
-    'rupees',
-    'rush-hour',
-    'russet',
-    'rustled',
-    'ruts',
-    'rutskoi',
-    'rutted',
-    'rylands',
-    's&amp;p500',
-    's&atilde;o',
     's.a.s.',
-    's4',
-    's6',
-    'sabbatical',
-    'saboteurs',
-    'sacco',
-    'sacrosanct',
-    'saddest',
-    'sagittarius',
-    'sainsburys',
-    'sakes',
-    'salamanca',
-    'saleable',
-    'salespeople',
-    'salinas',
-    'salivary',
     'salle',
-    'sallow',
-    'saltash',
-    'salter',
-    'saltire',
-    'salver',
-    'salvo',
-    'sameness',
-    'sampdoria',
-    'sampler',
-    'sams',
-    'samuelson',
-    'sanctified',
-    'sanctioning',
-    'sanctum',
-    'sander',
     'sandford',
-    'sandhurst',
-    'sanding',
-    'sandown',
-    'sangster',
-    'sanson',
-    'santander',
-    'santis',
-    'saplings',
-    'sapped',
-    'sar',
-    'saracen',
-    'sarcophagus',
-    'sark',
-    'satchel',
-    'sats',
     'saudis',
-    'sauvignon',
-    'savimbi',
-    'saxophone',
-    'saxton',
-    'sayers',
-    'sbu',
-    'scalded',
-    'scalding',
-    'scallops',
-    'scaly',
-    'scam',
-    'scathingly',
-    'scavengers',
-    'scavenging',
-    'sceptre',
     'schemas',
-    'schleiermacher',
-    'schlesinger',
-    'schmeichel',
-    'school-based',
-    'school-leaving',
-    'schopenhauer',
-    'schuman',
-    'schumpeter',
-    'schuster',
-    'schwartz',
-    'schwarzenegger',
-    'schwarzkopf',
-    'sci',
-    'scintillating',
-    'scolding',
     'scooter',
-    'scorpions',
-    'scorsese',
-    'scotrail',
-    'scotty',
-    'scour',
-    'scouse',
-    'scrawny',
-    'scree',
-    'scriptural',
-    'scrolling',
-    'scrooge',
-    'scrubs',
-    'scruff',
-    'scrutinise',
-    'scrutinising',
     'scuffed',
-    'scuttle',
-    'scuttling',
-    'scythe',
-    'sdr',
-    'se1',
-    'seabirds',
-    'seaboard',
-    'seagull',
-    'sealant',
-    'searchlight',
-    'searchlights',
-    'seashore',
-    'seasonally',
-    'seatbelt',
-    'seater',
     'second-largest',
-    'second-order',
-    'second-year',
-    'seconding',
-    'secrete',
-    'secreting',
-    'sectioned',
-    'secures',
-    'securicor',
-    'sedative',
-    'sedgwick',
-    'seditious',
-    'see-through',
-    'seeing_as',
-    'seeker',
-    'selborne',
     'self-appointed',
-    'self-appraisal',
-    'self-assessment',
-    'self-assured',
-    'self-confessed',
-    'self-deception',
-    'self-defeating',
-    'self-denial',
-    'self-doubt',
-    'self-effacing',
-    'self-employment',
-    'self-evidently',
-    'self-explanatory',
-    'self-financing',
-    'self-inflicted',
-    'self-interested',
     'self-knowledge',
-    'self-preservation',
-    'self-regulating',
-    'self-regulatory',
-    'self-reliance',
-    'self-respecting',
-    'self-righteous',
-    'self-sacrifice',
-    'self-satisfaction',
-    'self-satisfied',
-    'self-supporting',
-    'self-taught',
-    'sell-off',
-    'sellotape',
-    'semaphore',
-    'semi-automatic',
     'semiconductors',
-    'seminary',
-    'semtex',
-    'sentinel',
-    'separatists',
-    'sepia',
-    'sepsis',
-    'septic',
-    'seq',
-    'serenade',
-    'serenely',
-    'serpents',
-    'serra',
-    'servile',
-    'servitude',
-    'servo',
     'sett',
-    'seven-day',
-    'seven-thirty',
-    'seventy-four',
-    'sewed',
-    'sexton',
-    'seymour-strachey',
-    'sgi',
-    'sgsa',
-    'sgurr',
-    'shackles',
-    'shackleton',
-    'shaker',
-    'shakespearean',
-    'shamans',
-    'shameless',
     'shamelessly',
-    'shamlou',
-    'shampoos',
-    'shamrock',
-    'shaven',
-    'shawls',
-    'sheathed',
-    'sheaves',
-    'sheepish',
-    'sheldrake',
-    'shelford',
-    'sherborne',
-    'sheriffs',
-    'shimmer',
-    'shins',
-    'shipbuilders',
     'shipper',
-    'shipton',
-    'shipwreck',
-    'shitty',
-    'shiva',
-    'sho',
-    'shogun',
-    'shop-floor',
-    'shopfloor',
-    'shoreditch',
-    'short-',
-    'short-range',
-    'shortlisted',
-    'shovels',
-    'showman',
-    'showmen',
     'showy',
-    'shrew',
-    'shrift',
-    'shrouds',
-    'shrubbery',
-    'shrunken',
-    'shun',
-    'shunted',
-    'shunting',
-    'shush',
-    'siamese',
-    'sian',
-    'sidacai',
-    'side-effect',
-    'sidecar',
-    'sidekick',
     'sideline',
-    'sidelong',
-    'sidewalk',
-    'sidled',
-    'sidonius',
-    'sien',
-    'siesta',
-    'sigmoid',
-    'signalman',
-    'signifiers',
-    'signings',
-    'silencing',
-    'silesia',
-    'silhouettes',
-    'sills',
-    'silvio',
     'simeon',
-    'simile',
-    'simms',
-    'simons',
-    'simplifies',
-    'sind',
-    'sinewy',
-    'sing-song',
-    'single-handedly',
-    'single-parent',
-    'sinker',
-    'sinned',
-    'sinton',
-    'sinuous',
-    'sinus',
-    'siphon',
     'sips',
-    'sirius',
-    'sirs',
-    'sisulu',
-    'sitcom',
-    'sitters',
-    'six-day',
-    'six-week',
-    'sixsmith',
-    'sixteen-year-old',
-    'sixth-form',
-    'sixty-one',
-    'sixty-six',
-    'sizable',
-    'skaters',
-    'skegness',
     'skerne',
-    'skidding',
-    'skier',
-    'skimpy',
-    'skippers',
-    'skyscrapers',
-    'slackened',
-    'slackening',
-    'slated',
-    'slats',
-    'slaughterhouse',
-    'slaughtering',
-    'slay',
-    'slaying',
-    'sleazy',
-    'sledges',
     'sleeping-bag',
-    'sleight',
-    'slew',
-    'slings',
-    'slippage',
-    'slither',
-    'slivers',
-    'sloan',
-    'slocombe',
-    'sloth',
-    'slouched',
-    'slowest',
-    'sluice',
-    'slush',
-    'sm',
-    'small-town',
     'smallholder',
-    'smallish',
-    'smarting',
-    'smirked',
-    'smithfield',
-    'smithkline',
-    'smithsonian',
-    'smitten',
-    'smothering',
-    'smudged',
-    'smuggle',
-    'snaked',
-    'snaking',
-    'snape',
-    'sneaky',
-    'sneezing',
     'snipers',
-    'sniping',
-    'snow-covered',
-    'snowed',
-    'snowman',
-    'snubbed',
-    'snuffed',
-    'snuggled',
-    'snyde',
-    'soane',
-    'soars',
-    'sobered',
-    'socialised',
-    'socialising',
-    'socialized',
-    'sodding',
     'sods',
-    'soe',
-    'softbench',
-    'soiling',
-    'soldered',
-    'solemnity',
-    'solicit',
-    'solicitor-general',
-    'solicitous',
-    'soliloquy',
-    'solly',
-    'solowka',
-    'solvency',
-    'solway',
-    'som',
-    'somatostatin',
     'someday',
-    'songwriting',
-    'sorcerers',
-    'soundings',
-    'south-facing',
-    'southbound',
-    'southwestern',
-    'sowerby',
-    'spadefoot',
-    'spanking',
-    'sparing',
-    'sparkbrook',
-    'sparking',
-    'spars',
-    'spasmodic',
-    'spasticity',
     'spattered',
-    'spatz',
-    'specialism',
-    'specifics',
-    'specks',
-    'specmarks',
-    'spectrometer',
-    'speculatively',
-    'speedboat',
-    'spenders',
-    'sphinx',
-    'spiderglass',
-    'spindly',
-    'spiny',
-    'spitalfields',
-    'spitfires',
     'spittals',
-    'spittle',
-    'spla',
-    'splattered',
-    'splenic',
-    'spliced',
-    'splicing',
-    'spongy',
-    'sporadically',
-    'sportswear',
-    'sporty',
-    'spot_on',
-    'spp.',
-    'sprightly',
-    'sprigs',
-    'springall',
     'springbok',
-    'springer',
-    'sprinters',
-    'sprouted',
-    'spuds',
-    'spunk',
-    'spurgeon',
-    'sputum',
-    'spycatcher',
-    'sq_m',
-    'squabble',
-    'squabbles',
-    'squamous',
-    'squaring',
-    'squeaking',
-    'squeaks',
     'squeamish',
-    'squidgy',
-    'squig',
-    'squirming',
-    'srebrenica',
-    'sro',
-    'ss.',
-    'ssc',
-    'sshh',
-    'sssis',
-    'stabilized',
-    'stabilizing',
-    'stabled',
-    'staffroom',
-    'stagecoach',
-    'staid',
     'stained-glass',
-    'staking',
-    'stalingrad',
-    'stalinism',
-    'stalker',
-    'stallions',
-    'stammer',
-    'stand-by',
-    'stand-in',
-    'standardise',
-    'starched',
-    'stardust',
-    'starlight',
-    'starry',
-    'startle',
-    'statehood',
     'stationers',
-    'stator',
-    'statuary',
-    'statuette',
-    'staunchly',
-    'staunton',
-    'staves',
-    'steadfastly',
-    'steady-state',
-    'stealthily',
-    'steamers',
-    'steelworks',
-    'steeplechase',
-    'stena',
-    'stencil',
-    'stepan',
     'stepson',
-    'sterilised',
-    'sterland',
-    'sterner',
-    'stethoscope',
-    'stevenage',
-    'stewardess',
-    'stewed',
-    'stich',
-    'stickiness',
-    'stiffening',
-    'stilton',
-    'stilts',
-    'stipulates',
-    'stirrings',
-    'stirrup',
     'stochastic',
-    'stockade',
-    'stockbroking',
-    'stockist',
-    'stockpile',
-    'stockwell',
-    'stoker',
-    'stolid',
-    'stoppages',
-    'stopper',
-    'storehouse',
-    'storeroom',
-    'stork',
-    'stortford',
-    'story-telling',
-    'storyteller',
     'stott',
-    'stoutly',
-    'stowmarket',
-    'strabane',
-    'straddled',
-    'straddling',
-    'straighter',
-    'straightforwardly',
-    'straitjacket',
-    'strandli',
-    'strangling',
-    'stranraer',
-    'stratford-upon-avon',
-    'stratigraphy',
-    'stratus',
-    'strays',
     'streamlining',
-    'streatham',
-    'streetwise',
-    'stretchers',
-    'stringency',
-    'stringing',
-    'stripper',
-    'strives',
-    'stuarts',
-    'stubbed',
-    'stubbornness',
-    'stubs',
-    'studentships',
-    'studiously',
-    'stun',
-    'stunningly',
     'stylised',
-    'stylistically',
-    'stylized',
-    'suave',
-    'sub-contract',
-    'sub-culture',
-    'sub-divided',
-    'sub-group',
-    'sub-saharan',
-    'sub-standard',
-    'sub-system',
-    'sub-text',
-    'subcontracting',
-    'subcontractor',
-    'subcultures',
-    'subjectively',
     'subjugation',
-    'submersible',
-    'subroutine',
-    'subscribing',
-    'subservience',
-    'subsets',
-    'subside',
-    'subsidising',
-    'substitutions',
-    'substrates',
-    'subsurface',
-    'subtitled',
-    'subtracted',
-    'subtraction',
-    'subverted',
-    'succour',
     'succumbing',
-    'such-and-such',
-    'suchinda',
-    'suckers',
-    'suckling',
-    'sucralfate',
-    'sucrose',
-    'suddenness',
-    'suffixes',
-    'suitor',
-    'suitors',
-    'sulk',
-    'sullenly',
-    'sulphurous',
-    'sultanas',
-    'sumitomo',
     'summarizes',
-    'summarizing',
-    'sunningdale',
-    'suns',
-    'suntan',
-    'supercalc',
-    'supercomputers',
-    'superconducting',
-    'superlative',
-    'supernova',
-    'supersede',
-    'superstitions',
-    'superstores',
-    'suppers',
-    'supplant',
-    'supplemental',
     'suppleness',
-    'supply-side',
-    'suppressor',
-    'surges',
-    'surgically',
-    'surmise',
-    'surmised',
-    'surpass',
-    'surplus-value',
-    'suzi',
-    'svend',
-    'swagger',
-    'swaledale',
-    'swarms',
-    'swarthy',
-    'swatch',
     'swathes',
-    'swears',
-    'sweats',
-    'sweetened',
-    'swegen',
-    'swifts',
-    'swimming-pool',
-    'swindle',
-    'swindon/wiltshire',
-    'swipe',
-    'swire',
-    'swop',
-    'syllabic',
-    'symbiotic',
-    'symbolises',
-    'symbolize',
     'symbolizes',
-    'symons',
-    'sympathisers',
-    'sympathize',
-    'sympathizers',
-    'symphonic',
-    'synapse',
-    'synchronised',
-    'syndromes',
-    'syntactically',
-    'synthesise',
-    'syracuse',
-    't-cell',
-    't.v.',
-    'tabby',
-    'tableaux',
     'tablecloths',
-    'tableware',
-    'taciturn',
-    'tacking',
-    'tactically',
-    'tactless',
-    'taczek',
-    'taekwondo',
-    'taheb',
-    'taint',
-    'taj',
-    'take-away',
-    'taliesin',
-    'talisman',
-    'tallboy',
-    'tamils',
     'taming',
-    'tampa',
-    'tamsin',
-    'tangles',
-    'tango',
-    'tannoy',
-    'tans',
-    'tansy',
-    'tantalisingly',
-    'tanya',
-    'tao',
-    'tape-recorder',
-    'taper',
-    'tapie',
-    'tapwater',
-    'tarot',
     'tarpaulin',
-    'tarred',
-    'tarzan',
-    'taskopruzade',
-    'taster',
-    'taunt',
-    'taunts',
-    'tavistock',
-    'taxman',
-    'td',
-    'tdc',
-    'tea-time',
-    'tea/coffee',
-    'teacup',
-    'teal',
-    'teaming',
     'teaspoonful',
-    'teaspoons',
-    'technicality',
-    'teetering',
-    'tei',
-    'telecaster',
-    'telecommunication',
-    'telegrams',
-    'telekom',
-    'telescopic',
-    'telethon',
-    'temerity',
-    'temperaments',
-    'templars',
-    'tempos',
-    'ten-minute',
     'tencel',
-    'tendulkar',
-    'tenet',
-    'tensing',
-    'tenures',
-    'tepid',
-    'tepilit',
-    'terminates',
-    'terre',
-    'terrence',
-    'terriers',
-    'tesserae',
-    'testable',
-    'tester',
-    'testifies',
-    'testily',
     'tether',
-    'tetley',
-    'tetras',
-    'thacker',
-    'thallium',
-    'thamesdown',
-    'thanet',
-    'thank-you',
-    'thawed',
-    'thebes',
-    'theist',
-    'thelma',
-    'theorising',
-    'therefrom',
-    'thermals',
-    'thermodynamic',
     'thermos',
-    'theseus',
-    'thessaly',
-    'theta',
-    'thicken',
-    'thickets',
-    'thicknesses',
-    'thierry',
-    'thieving',
-    'think-tank',
-    'thinness',
-    'thirteenth-century',
-    'thoracic',
-    'thorax',
-    'thorpey',
-    'thought-provoking',
     'thousandth',
-    'thrall',
-    'threading',
-    'threateningly',
-    'three-',
-    'three-and-a-half',
-    'three-storey',
-    'threepence',
-    'thresher',
-    'thrifty',
-    'thrillers',
-    'throgmorton',
-    'thrombolysis',
-    'thrower',
-    'thru',
-    'thumbed',
     'thumbnail',
-    'thunderbirds',
-    'thunderstorm',
-    'thurrock',
-    'thurso',
-    'thymocytes',
-    'thymus',
-    'tic',
-    'tickled',
-    'tidily',
-    'tidings',
-    'tiff',
-    'tiffany',
-    'tightrope',
-    'til',
-    'tiling',
     'timetabled',
-    'timisoara',
-    'timman',
-    'tingled',
-    'tinkers',
-    'tinnitus',
-    'tinsel',
-    'tip-off',
-    'tipperary',
-    'tipple',
-    'tipsy',
-    'tirade',
-    'tis',
-    'titch',
-    'tithes',
-    'titian',
     'title-page',
-    'titration',
-    'titus',
-    'tnf',
-    'tnt',
-    'to-day',
-    'toaster',
-    'toasting',
-    'toasts',
-    'tobermory',
-    'tobias',
-    'tock',
-    'togetherness',
-    'toiled',
-    'tokugawa',
-    'tolby',
     'toledo',
-    'tollemarche',
-    'tombstone',
-    'tombstones',
-    'tome',
-    'tomkins',
-    'tone-unit',
-    'toned',
-    'tong',
-    'tongue-tied',
-    'tonics',
-    'tonnage',
-    'toothless',
-    'top-level',
-    'top-up',
-    'topmost',
     'topology',
-    'topper',
-    'toppling',
-    'tormenting',
-    'torpedoes',
-    'torrents',
-    'torsion',
-    'tortoiseshell',
-    'torts',
-    'torturing',
-    'tosh',
-    'toshiki',
-    'totalization',
-    'tote',
-    'tots',
-    'tottering',
     'touchstone',
-    'toughened',
-    'toulon',
-    'touted',
-    'touting',
-    'townsfolk',
-    'townspeople',
-    'toxoplasmosis',
-    'toxteth',
-    'tp',
-    'tqm',
-    'traceable',
-    'tracery',
-    'trachea',
-    'traditionalist',
-    'traidcraft',
     'tramped',
-    'tramping',
-    'trample',
-    'tran',
-    'tranquillisers',
-    'transactional',
-    'transcendence',
-    'transcends',
-    'transcribe',
-    'transept',
-    'transferability',
-    'transformers',
-    'transgene',
-    'transgressive',
-    'transmits',
-    'transpires',
     'transposition',
-    'transsexual',
-    'transylvania',
-    'trapdoor',
-    'traversing',
-    'trawl',
-    'trawler',
-    'treadmill',
-    'treasurers',
-    'treatises',
-    'tremulous',
-    'trentham',
-    'trespassers',
-    'trevelyan',
-    'triad',
-    'tribulations',
     'tricia',
-    'trickery',
-    'trieste',
-    'trilby',
-    'trilobites',
-    'tripled',
-    'triplets',
-    'tripos',
-    'trippier',
-    'tris',
-    'tritium',
-    'triton',
-    'trombone',
-    'trooped',
-    'trouble-free',
-    'troublemakers',
     'trudging',
-    'truism',
-    'trumper',
-    'trumps',
-    'truncheon',
-    'trussed',
-    'trythall',
-    'ts',
-    'tsongas',
-    'tsunami',
-    'tuan',
-    'tuathal',
-    'tudjman',
-    'tuft',
-    'tugs',
-    'tulip',
     'tully',
-    'tumbleweed',
-    'tumult',
-    'tun',
-    'tundrish',
-    'tunisian',
-    'tunnelling',
-    'tunney',
-    'turban',
-    'turgid',
-    'turkeys',
-    'turkmenistan',
-    'turn-off',
-    'turn-out',
-    'turnkey',
-    'tutelage',
     'tutoring',
-    'twain',
-    'tweeds',
-    'twine',
-    'twinkled',
-    'twinning',
-    'twirled',
-    'twit',
-    'two-fold',
-    'two-month',
-    'two-seater',
-    'two-stage',
-    'twomey',
-    'twyford',
-    'tyburn',
-    'tynemouth',
     'typefaces',
-    'typescript',
-    'typhoid',
-    'typists',
-    'typographical',
-    'tyrannical',
-    'tyrell',
-    'tyrrell',
-    'u-boat',
-    'u.',
-    'udr',
-    'uff',
-    'ugandan',
-    'ulterior',
-    'ultrasonography',
-    'ultrix',
     'umberto',
-    'umpteen',
-    'unabashed',
-    'unabated',
-    'unacceptably',
-    'unaccountable',
-    'unacknowledged',
-    'unaco',
-    'unanswerable',
-    'unashamed',
-    'unattached',
-    'unbelief',
-    'unblemished',
-    'unblinking',
-    'unbounded',
-    'unbridled',
     'unceremoniously',
-    'uncharted',
-    'uncluttered',
-    'uncommitted',
-    'uncommonly',
-    'uncompetitive',
-    'uncomprehending',
-    'unconfirmed',
-    'unconstrained',
-    'uncooperative',
-    'uncouth',
-    'uncritically',
-    'uncut',
-    'undated',
-    'undefeated',
-    'under-age',
     'under-represented',
-    'undercurrent',
-    'underdevelopment',
-    'underfunded',
-    'underfunding',
-    'underhand',
-    'underhill',
-    'underparts',
-    'underprivileged',
-    'underrated',
-    'undertones',
-    'underwriter',
-    'undiminished',
-    'undisciplined',
-    'undisguised',
-    'undistinguished',
     'undry',
-    'unearthly',
-    'unending',
-    'unenviable',
-    'unfailing',
-    'unfastened',
-    'unfeeling',
-    'unflattering',
-    'unfocused',
-    'unforgiving',
-    'unfpa',
-    'ungainly',
-    'ungrammatical',
-    'unheeded',
-    'unhindered',
-    'uninitiated',
     'uninspiring',
-    'unintentionally',
-    'uninvited',
-    'uniplex',
-    'unitarian',
-    'universals',
-    'universes',
-    'unjustly',
-    'unknowing',
-    'unknowingly',
-    'unknowns',
-    'unlabelled',
-    'unleash',
-    'unlicensed',
-    'unlocking',
-    'unloved',
     'unmatched',
-    'unmodified',
-    'unmoving',
-    'unobtainable',
-    'unpacking',
-    'unpretentious',
-    'unproblematic',
-    'unprofessional',
-    'unproven',
-    'unprovoked',
-    'unquestioning',
-    'unravelled',
-    'unrecognized',
-    'unrecorded',
-    'unreservedly',
-    'unrestrained',
     'unrolled',
-    'unruffled',
-    'unscheduled',
-    'unselfish',
-    'unsigned',
-    'unsmiling',
-    'unspoiled',
-    'unstated',
-    'unsubstantiated',
-    'unsupervised',
-    'unsustainable',
-    'untac',
-    'untapped',
-    'untested',
-    'untied',
-    'untitled',
     'untouchable',
-    'untried',
-    'unveils',
-    'unwisely',
-    'unwitting',
-    'unwound',
-    'up-and-coming',
-    'upcoming',
-    'upfront',
-    'uplifted',
-    'uprights',
-    'upriver',
-    'upstage',
-    'upvc',
-    'ur',
-    'uranus',
     'urbane',
-    'urchins',
-    'urethritis',
-    'urokinase',
-    'ursodeoxycholic',
-    'us&dollar',
-    'us&dollar;1,000',
-    'us-based',
-    'us-soviet',
-    'usaf',
-    'usc',
-    'usk',
-    'uss',
-    'usurpation',
-    'usurped',
-    'utilizing',
     'uva',
-    'uvf',
-    'uxbridge',
-    'uzbek',
-    'v&amp;a',
-    'v.4',
-    'vaccinated',
-    'vagrants',
-    'valance',
-    'valdez',
-    'valentin',
-    'valet',
-    'validly',
-    'valois',
-    'valuers',
-    'vandal',
     'vanquished',
-    'vapours',
-    'var',
-    'variceal',
-    'varicose',
-    'variscan',
-    'vasco',
-    'vaseline',
-    'vastness',
-    'vats',
-    'vaz',
-    'vc',
-    'vcr',
-    'vecchi',
-    'vechey',
-    'vega',
     'veined',
-    'vellayati',
-    'velvety',
-    'vendetta',
-    'vending',
-    'veneration',
-    'venetians',
-    'venezia',
-    'venturous',
-    'verging',
-    'verifiable',
-    'verifying',
-    'vermont',
-    'versed',
-    'vertigo',
-    'verulamium',
     'vestibule',
-    'vetch',
-    'vetted',
-    'vg',
-    'vhf',
-    'vibrated',
-    'vicars',
-    'vice-captain',
-    'vice-chancellors',
-    'vice-presidents',
-    'vicente',
-    'vicissitudes',
-    'victimisation',
-    'vidal',
-    'videoconferencing',
-    'videodisc',
     'viet',
-    'viewfinder',
-    'ville',
-    'vindicate',
-    'violates',
-    'violette',
-    'virginal',
-    'virile',
-    'virility',
-    'virtuosity',
-    'vis-a-vis',
-    'visualised',
-    'visualization',
-    'visuals',
-    'vitriolic',
-    'viva',
     'vivacious',
-    'vivian',
-    'vme',
-    'vmw175',
-    'vo',
-    'vodafone',
-    'voe',
-    'vogel',
-    'voiceless',
-    'voidable',
-    'voids',
-    'vojvodina',
-    'volatiles',
-    'volenti',
-    'volition',
-    'volleyball',
     'voltages',
-    'vomited',
-    'voodoo',
-    'vor',
-    'voracious',
-    'vouch',
-    'vr',
-    'vt2',
-    'vue',
-    'waaf',
-    'waddell',
-    'wadi',
-    'wafer',
-    'wagged',
-    'waggon',
-    'wainfleet',
     'waistcoats',
-    'waitresses',
-    'waitrose',
-    'waken',
-    'walkabout',
-    'walkways',
-    'wallop',
-    'wallowing',
-    'wanda',
-    'wanderings',
-    'war-time',
-    'warbler',
-    'warblers',
-    'warburton',
-    'warders',
-    'warenne',
     'wariness',
-    'warlike',
-    'warlords',
-    'warms',
-    'warne',
-    'warnie',
-    'warton',
-    'washers',
-    'wastepaper',
-    'watchdogs',
-    'water-based',
-    'waterlilies',
-    'waterstones',
-    'watkin',
-    'wattana',
-    'wavebreaker',
     'waver',
-    'waxing',
-    'waxy',
-    'waybill',
-    'waymarked',
-    'wbo',
-    'weakens',
-    'wean',
-    'weaned',
-    'wearside',
-    'weathers',
-    'weaves',
-    'webbing',
-    'webbs',
-    'weberian',
-    'weiner',
     'weiss',
-    'welford',
-    'well-built',
-    'well-designed',
-    'well-documented',
-    'well-drained',
-    'well-educated',
-    'well-founded',
-    'well-intentioned',
-    'well-organised',
-    'well-paid',
-    'well-placed',
-    'well-stocked',
-    'well-trained',
-    'wellingborough',
-    'wen',
     'wenceslas',
-    'wessels',
-    'westinghouse',
-    'wetness',
-    'wfs',
-    'wg',
-    'whacked',
-    'whadcoat',
-    'whalley',
-    'whatsit',
-    'wheeze',
-    'whey',
-    'whillan',
-    'whimpered',
-    'whimsical',
-    'whingeing',
     'white-haired',
-    'white-painted',
-    'whitehaven',
-    'whitely',
-    'whiter',
-    'whitish',
-    'whittingham',
-    'whittle',
-    'whittled',
-    'whitton',
-    'whoa',
-    'whole-school',
-    'wholehearted',
-    'wholes',
-    'wholly-owned',
-    'whoop',
-    'whorls',
     'wickes',
-    'wicketkeeper',
-    'wid',
-    'widens',
-    'wigg',
-    'wigmore',
-    'wilcock',
-    'wilcoxon',
-    'wildcat',
-    'wilding',
-    'wildness',
-    'wilkes',
-    'will-power',
-    'willesden',
-    'willington',
-    'willpower',
     'willy-nilly',
-    'wilt',
-    'wimp',
-    'wincing',
-    'wind-up',
-    'winding-up',
-    'windowless',
-    'windows-based',
-    'windsurf',
-    'windsurfers',
-    'wingate',
-    'wingers',
-    'winking',
-    'winnipeg',
-    'winsor',
-    'winterton',
     'wipes',
-    'wisbech',
-    'wisden',
-    'wiseman',
-    'wisest',
-    'wisps',
-    'withdraws',
-    'withers',
-    'withstood',
-    'wizardry',
-    'wizards',
-    'wizened',
-    'wobbled',
-    'woefully',
-    'wokingham',
-    'wold',
     'wolfenden',
-    'wolski',
-    'womens',
-    'wonderingly',
-    'wong',
-    'woodcock',
-    'woodford',
-    'woodhead',
-    'woodworking',
-    'woodworm',
-    'wooed',
-    'wooing',
-    'woolton',
-    'wor',
-    'word-processing',
-    'word-processor',
     'wordings',
-    'wordless',
-    'wordlessly',
-    'workbench',
-    'workbook',
-    'workflow',
-    'workforces',
-    'workhouses',
-    'working-set',
-    'workington',
-    'workroom',
-    'worksheets',
-    'worktop',
-    'worn-out',
-    'worshipping',
-    'worsted',
     'wove',
-    'wrangle',
-    'wrapper',
-    'wrasse',
-    'wreak',
-    'wreathed',
-    'wreaths',
-    'wrenching',
-    'wretch',
-    'wring',
-    'wringing',
-    'wrinkling',
-    'wristwatch',
-    'write-off',
-    'writhed',
-    'wrongdoing',
     'wronged',
-    'ws',
-    'wyllie',
-    'wyman',
-    'wynn',
-    'wynne',
-    'wyvis',
-    'x-terminals',
-    'x1',
-    'xenophobia',
-    'xinhua',
-    'xs',
-    'xxx',
-    'yac',
-    'yah',
-    'yahweh',
     'yank',
-    'yanks',
-    'yanomami',
-    'yasser',
-    'yassir',
-    'yaxlee',
-    'year-round',
-    'yearbook',
-    'yearn',
-    'yegor',
-    'yeh',
-    'yek',
-    'yellows',
-    'yells',
-    'yeomen',
-    'yerself',
     'yesteryear',
-    'yiddish',
-    'yin',
-    'yonder',
-    'yorick',
-    'york-based',
-    'yorke',
-    'yorkers',
-    'yorkist',
-    'yow',
-    'ypres',
-    'yugoslavian',
-    'yuk',
-    'yuppies',
-    'z.',
-    'zak',
     'zamora',
-    'zande',
-    'zanzibar',
-    'zapt',
-    'zborowski',
-    'zealander',
-    'zealanders',
-    'zealots',
-    'zemin',
-    'zeno',
-    'zhao',
-    'zia',
-    'zigzag',
-    'zimmer',
-    'zion',
-    'zionist',
     'zollinger-ellison',
-    'zombie',
-    'zoomed',
-    'zooming',
-    'zoser',
-    'zulu',
+)
+
+blocks_06 = (
+    '")mp&dollar$";c!$circ!%deg;c""gr"+ollar;1,500)!5("30*!0(#400(!5)%0,000!,eacute;lites!&frac34!#lgr',
+    '")icro;g/ml\'%mol/l!#ngr!#pgr"#hgr")ound;1.25)!3)"5m)"99($0.99("10($2.50*"95)%0,000)!m',
+    '(%4,000)#.95($5.99)!m($6.99)!0(%7,000)!0)!5(%8,000)!0($9.95+!9\'$200m(!1',
+    '(!6\'%3,500(".5)"95("0m(!2(&50,000\'$4.50)"95("0m\'$5.00)"95(#000("50\'$6.50',
+    '(!m\'$7.50)"95(&00,000\'"85\'%9,000(%0,000(!5(!9!$rehy #\'91"!2!!i!#ome!"un',
+    ' "+2!"44 )-20&deg;c!!3 &/&egr/!!h )0&ndash;1!#.01""75!"d. %1&ins"\'ndash;5!#(2)!$,700!%0&ins',
+    ')"20"".6"#000""cm"!k!$1.00#!6""pm!#2.2#!3""90!&30,000!#4.5!*5&ndash;20"#0th',
+    '#!7""58#!9""60"!p!#6.5""03""20""30"#40s#!5#!8""51#!2#!3',
+    '""62#!6""70#!5""85""93#!4"!s!#701#!2#!7""13#!4#!7""21',
+    '""39""46#!7""51#!2#!4#!5#!6#!7#!8#!9"#60s#!1#!2#!4',
+    '#!9"#70s""81#!2"*th-century!*8&ndash;30"%0&deg"!4!,914&ndash;18"!4"#77a"#82a#"3a#)4&ndash;5#"5a',
+    '#"6a#"7a#*8&ndash;89$#-89$#/89$!a#"9a"+93&ndash;94!":1!"gb!"in!"mm!"oz!"pm!!s',
+    '!#(2)!(,000,000"#200"#300"#400!"-3!#.00""10#!5""25!*0&ndash;30""20""pc"*th-century!%1,000',
+    '"!9!%2,000"!4""5g$$/8oz"!7!%3,000"!1"!2"!3"!4!%4&ins"$,000"!1"!3',
+    '"!8"!9!"51"!4"!5"!7"!8"!9"%g/1oz"#mhz!%6,000"!2"!5"!7"!8',
+    '"!1"!2"!3"!4"!6"!7"!8!"81"!7"!8"!9!"95"!7!"am!"ft',
+    '!!s %3&ins"\'ndash;5(!6!#(1)!"-4!#.11#!4!*0&ndash;40"%-year"!2"!4"!5"!6"!9',
+    '"!p!"12"!3"!5!*2-year-old!*3-year-old"!2"!3!*4-year-old!*5-year-old""00"!3""mm!"6p!*7-year-old',
+    '!"84!"90!!b!!i"!n (4&frac12!"\'s!"-1"!2!#.10"$30pm!#00m"!4"!p!"1%',
+    '"!5!"25!"40!%5&deg"&0g/1lb!"6%"!0!"70!"8p!"9%"!0!!c!!d!"gl!"lb',
+    ' )5&ndash;1)!0(!7!#(1)!"-1!#0mm!"2%"!0!"4%!%5,000"!5!"6%!"7%""50!"8%',
+    '!!m )6&ndash;7(!8!#(3)!"-1"!3!!.!"1%"!7!"2%"!0!"3%!"4%"!0""mb',
+    '!"7%!"8%!#:30!"d.!!m!"oz )7&ndash;5(!6!"-6!"2%!"37!"47!#5th!"6%"#(a)',
+    '!"8%!"am!!p %8&ins!$-bit!".0"$30pm!$0386""th!"2%!"3%!"6%!$8000!"9%!"am',
+    '!"mb!!p #9.6"!7"!8"!9!"50!"6%!"7%!"8%!!p #a2b!)_good_few"-hell_of_a_lot"(la_carte',
+    '!"ba#%ndons#"te$$toir"$beys"&dallah#&icated"!e#(rcrombie$$rant#$tted#%yance"\'horrent"*olitionist#\'minable',
+    '"&rasion"!s#&eiling$%ntees#\'olution%#ved$%rbent"%users"%ysmal!(cademies#!s")celerates$\'ptances$$sses#)ommodates',
+    '$%rdion#(umulates)$ions)#ors"+etylcholine"$idly##nar"\'quiesce)!d%&sitive"&rimony#$onym#%ylics"#tin$&onable',
+    '!"d1"#air#$mson#%ptors%!s""cc"&dendum"$eane"&herent"(jectival#\'udicate")ministers((ratively#!l#\'onished',
+    '#%rable$"es"!t"$verb!!e"&ration#$ials#&obatic)!s$(nautical*!s"!s#&chylus"(thelbald&#red',
+    '")fectation#\'iliates$#rms$#xed#&ording%(estation"*ter-dinner&#tax%$life%%shave!%gain\'#"pe",gressiveness$!o"&nostic',
+    '%$stes%$zing"\'reeably#$ound!#hhh!$idan"!l#$ment"%mless"!n#&sworth"&r-raid#&brakes#!e#$lock',
+    '#$ship%"ow$$peed$$trip#%tight#%waves!#jax"&dabiya!"ka!\'larmist#$skan"\'batross#"ie$"no#%recht',
+    '#$hemy##ock##uin"#dus"&erting%$ness"#fie##ord"%garve#%ernon""ia"&l-male$$over$\'purpose##ele',
+    '$#nde$\'viating#&igator#&ocates$!t##ure$$vial""ms",phabetically%\'numeric"$ston"%tdorf""um"#vin"#wyn',
+    '#\'teurish#%zonia"$elie%\'oration#+rican-style#%thyst"&icably##ens#\'no-acid"*phetamines$&ibious#\'litudes#&utated\'#ion"(usements',
+    '"%aemic$)sthetised#&lgesia$(ytically%$zing#\'rchists#(stomosis#%tolia"&cients""df#$over#&reotti%#wes$&opulos""ge',
+    '%!o#%harad#*lo-italian&%welsh"\'nabelle$$dale#&ealing$$sley#(ihilated#&ouncer#$uals""si"%tenna#"i-%(abortion',
+    '&*ompetitive%,inflammatory%\'slavery%$tank$(cipatory$&racism$%trust"#vil!"pb"!c")hrodisiac""is"$lomb#$ysia"(ocryphal',
+    '$\'linaire\'!e#&ptosis"%parel#\'endages#%leton#(ortioned)$ment$$site#%raise$(opriates%#ver%\'ximated#!s"&ricots',
+    '!&quaria&"us#%ifers$#nas!*r&ecirc;te"*ab-israeli#(chidonic#!n"%cadia#,hitecturally%$ving\'"st)!s"%diles##our',
+    '"#gus"$iane"&magnac$$ment##ful##pit"(restable#(hythmias"&sehole#&onists")t_nouveau#!e##ful#\'hropods#%icled',
+    '$$fice$$stes&&ically##ois""un!(scendant%"ts"%exual"&hcroft#"en%#den#%field#&ington#&molean"*ia-pacific',
+    '"!p#&irated",sassinations#&embler#"he#&iduous$"si"&terisk%!n#&hmatic)!s##rid$&onauts!"ta#"ri',
+    '"&heists##oll")mospheres"&rophic")tainments##est##ica$#red#&ractor$(ibutions!*udiovisual$%tions##ley"&erbach"+thenticated',
+    '#%istic#%obahn%*iographies$#car$&graphs$\'mobiles#%umnal!\'venging"$iary#%emore#$gnon##ion#%onics"\'uncular!,we-inspiring',
+    '"$ning!$xiom%!s!%ylwin"#ton!%zores"!t ,b&eacute;arn!#.p.!"/d"!w!!2!\'abbling#"el##oon',
+    '#!s#\'ylonian$&sitter"%cchus#&helors#)k-to-back$$ache$\'bencher$%cloth$"er$%space%$wing$(wardness"%ddies"%gehot',
+    '##nes#"rn##ted$#ing#"ze"&kewell#$htin#!u"\'laclava##boa##con#$eful#%inese#\'lantyne%#ter',
+    '$&yclare%%money#"my#"or"!m#$ford"&nality#"co##dit#!e#"ff$$ield##ger#&isters#%quets',
+    '##yan"&ptiste"\'rbarous$%ecues$"ie#!i$$tone#"ks#%nabas%$cles#$rack$#ows$%ymore#%tocci$#ram',
+    '#%altic#"el#!k#(olateral#$ques%#iat#$soon#$tide%#ons"%teson#\'tleship$!s"#wdy"%yonet\'!s',
+    '!"cg"#l-2"!p""rs!0e_that_as_it_may"$agle#"le#%uvoir"$cher##ket"$ddow#$elia$&villed##lam#\'raggled',
+    '$%pread##wyr""eb#$ches#$hive#%troot"!f##all##its#\'riended"\'guiling$!m"&havior\'%urism+!t',
+    '"#in\'"#kaa"#lay#$ched%#ing##ies$"ze#\'orussia"&nchers%%marks#)eficially$#lux#!i#%stede"%owulf',
+    '##ets##gen$!g$#man#&liners#\'mondsey##ths$#ram"*spectacled$#oke#!s#(t-seller$&seller"&tjeman#&rothed',
+    '$!s"!v"$wick$%tched!!f"!s!%iceps""en$$nale"#ggs#$otry"#har"#ker##ing"$llet',
+    '$%iards"#mbo"%ngley##yon"!o#*degradable#)geography$\'raphers#\'medical#&sphere"%polar"&rdsong#%kbeck"$scay$$hoff',
+    '#(hopsgate#%table"%tumen!$jorn!!l"(ackadder%\'berries%"er%$more%&smiths%%thorn#"gg##ise#&meless#%nched',
+    '#(sphemous"&eedin\'$!p#$mish\'"es#$nder"\'inkered#!p#%ssett$#ter\'"ed"#och##ggs#$ndes#&od-red',
+    '$&mfield#"ts##wer#$xham"\'ue-eyed$$bell(!s#$fton#&ndered\'#ing$#ted#%stery"$ythe!!m!!n',
+    '#$tman%"en$$yard""bo"&dleian##min##rum#%ywork"$gart#"gy#)ot&aacute#$wood"$leyn##ger#%lards',
+    '$%tered#"us"\'naparte#%homie##ner"#oed#&kcases$\'selling%$helf"!p"$rdon#"es#!g#$stal"&sworth',
+    '#"hy#\'tleneck"$ughs#&lestin%%vards#%ncers$%dless#%quets#$tros"#vis"$wyer"#yce!#rac$\'hiopods#$dman',
+    '#!e$!r#$ided#%nwell#&sserie#\'tislava##ved"(eak-even&#ins%%water##cht#$ezes%!y#&ntwood#%reton',
+    '"!i#"ar#\'cklayer#(dgewater$"he$\'lington#%efest#(ght-eyed&%ening$$itte#"ll#$stle\'!d%"ow##tta',
+    '%"on"$oach&"ed$,d-shouldered%$bent%%sheet&#ide##die#$king#(mborough$#ide#&nchial$"te$#zed#$oded',
+    '%$side$"me#%thels&#rly#%wnish"$ugge#$iser#$ndle#$tish!%s5750"!b""di!&ucking$$land"$ddie',
+    '"$gged%#red&!y""id"%lbous##ged%!s#%khead#&ldozer#$wark"#nks""oy$"ed""pa"(rdensome',
+    '#%ghley%!s$\'undians#%leigh#$nell%"rs%!y##sar#$undi"+siness-like(%woman#$t-up$"ed$!s"$tane',
+    '#(terfield&!y"&y-outs"&zzards$"er!!v!*y-products"%e-bye#$laws"\'passing""re"\'stander"\'zantium!"zw ,c&eacute;sar',
+    '!!4!!5!\'abernet"\'cophony##tus"%dogan"$ecum#!n#&rulein"$gney"!i"#ked"(lcareous#&edonia#$ibra',
+    '#%lahan%$nish$\'igraphy$"ow$!y#%mness#$ving"(mcorders#$elot$%ramen#&panile#!s#"us"\'ncerous#(didature',
+    '$\'lestick+!s#%ister(!s##nae$\'ibalism$#ock#&oeists$$pies#"to%!s"\'pacious&$tors##ers#(illaries',
+    '%&ulated)#ion#!m#%riati#$tors"&rapace#)cinogenic*!s#&digans#$icom#&lsberg$#yle#\'marthen#!n$"al',
+    '$!e$\'ivorous#%ousel#&pentry#*rickfergus%"on$"ow#$tier$(ographic%%onist#!y"(sablanca#%caded\'!s#%ement',
+    '#$inos#"ks#$pian#!s$#ell$%owary##tes$&igated%#ngs$%rated\'#ion"\'talysed$%maran$&pulted$$ract',
+    '#\'egorise(&zation)!e$$rham$#sby##hie$#ode#$ions#!o"\'ucasian#"sa%#lly%$tive"%veats$!d',
+    '##iar"\'wthorne!"bc!"ck""pr!"d8"!c"!r!&eleste#\'lophane"+ntral-local%)e-forward\'$left%&ifugal*$tion',
+    '$%urion"%pacia"*rtificated%%orari!#gmp!$haff#$gall#\'irwoman#$lked%!y##mps#(ncellors$&delier%"os%"ra',
+    '$$ning$#try#\'rlatans%%eston$#mer$(terhouse#!s$%tened##tto%!y#\'uvinist"\'eapness$"ts#&ck-out&"up',
+    '%#out%&points#&dworth#%erily$&secake$#tah\'!s#7ltenham/gloucestershire#!m$-iluminescence#%quers#&rbourg$$tsey#.ster-le-street#$vron',
+    '"%ianti#"co#\'eftains#\'ld-care$#ton#"me#"ns$"tz#&pboard##rpy#&selled$$holm##ves")lorophyll"!o',
+    '#*reographed$$uses#!w"%risti#\'onicled)"rs%*ologically#&ysalis&(nthemums"#ubb#$ffed#"ms#&rchman$$lish!%iaran',
+    '$"ro"#lla")rculatory%&mspect%#ses"\'sapride##kei#%terns"!t"+vilisations&"ty!$lair#!m$"ps#"ng',
+    '#%ridge%"on$!y#$sper$&sicism#%udine&"us$*strophobia#$wing",earinghouses$#ver#!f#!m$$atis##nch',
+    '#(rkenwell#%verer"$iche&!s#)ftonville##mes##ngs$%ician#$pper%$ings##que#%toris"&ocking#%gging#\'se-knit',
+    '(!s#&udless"&ubhead"\'ydebank!$mhts""os"!s!"nn!(o-author#%exist#*ordinators#\'workers"%arser#%sting#$xial',
+    '"\'ckcroft$"er&"el#$teau"*dification#"on"%etzee"$gent#$nate"(habiting#\'erently#!n"*incidences)!t"#ker',
+    '#\'ebrooke%!y$%ctomy#$late\'!d&#ing$(ectivist*$ties$%imore%\'ngridge&#son$\'ocation+!s##man#"ne',
+    '$&urings#$umba"\'mically$#ngs#)mandeered$!e%\'morates%(rcialism$#ode%%n-law&%ality$#ute\'!d#!o#!p',
+    '%\'nionway%&triots$&endium&\'sations%\'tencies(#tly$)lementing%&icates&&mented$&osites("or%&unding$(rehended&$ssor$$uadd',
+    '&,er-generated#(radeship"(nceiving%,ptualization$\'ordance#*descension$(itioners$\'olences%!r$\'uctance\'#ion("ve#%fetti$*identially$)lagration',
+    '$)ormations%#und$$uses&%ingly#&gealed$\'ressman%%uence(!t#\'iferous#(jectures$$ugal%\'nctions#&naught$&ective#\'querors',
+    '%*rvationist%"tt$%ignee\'%ments$%tancy\'"ze%)ellations%&ipated%%ruing$(ummation#)taminants)"te$(emplates\'%tible$&inence',
+    '$)radicting&$vene*!d%#ive%*oversially#&undrum$\'rbation#*valescence$(eniences%%rsant((tionally&(tibility$%ivial$(ulsively"$okie',
+    '##mbs##ped%&rating)#ves"(pernicus$!s#(perwheat##tic"&rcoran#"fu#"ks%$crew$!y##man##ned',
+    '$#ice%"ng$$mill$$well##ona%#ers&!t$$sini#&porals#$rado$$oded$&upting##set$#ica\'!n',
+    '#&ydoras"$smid#$sack#)t-benefit$#ner"%terie#!s##tee"!u##ghs#$lter#\'nsellee$1ter-revolutionary\'\'balance.!d',
+    '\'\'vailing#%rsing$%tauld%$enay%#ier##tts$#ure"&valent#"es"%wards#%ering#"ie"#yly!"pd"!e',
+    '""re!%rabbe##mer$$ming#&nberry$"ed$%field$"ko#$zily"!e#"do##epy#%mated#"ss%"on',
+    '#%ckets#\'minally##nge%#ing$$kled#*ss-crossed#\'ticizes"%ochet$#ker##fts##mer$$pton#(ss-party&)reference/!s',
+    '%#bar&"ow##tch##wed"!u#%isers#"mb#(staceans%!s"#yer#)stallised!"sm"!u!"tc"!l',
+    '#%icles"%ckoos"!d"$lham#!l$#ing$$oden#&minate#%pable#(tivators")mbernauld$$rian#%mings"#pid#$ping',
+    '##bed#$lers%!w#$rant\'!s#$sive#(tailment&#ned"(shioning##ick#!p#(tomarily"(t-throat#$away##ler',
+    '"#zco!!w!&yclase"#mru"#nic"(tochrome$$logy!.zechoslovakian ,d&eacute;cor)%tente!)\'arquebus"\'estaing"*urberville!!1!!2',
+    '!\'abbling#!s""ce#$ourt#"re"&edalus##mon&!s")ggerboard"%iries""li#%matia#&rymple"$mask##sel',
+    '"$pper""ra#%lings#!n#"yl"$shes"$ubed#$nted"$vers"#wes#"ns!$base!"cf"!m!&eacons',
+    '$&locked$&weight#%fened#$nery#"rs#%thbed"%based#%enham##its#&ugging$"ts"&canter$\'pitated$"ys#&eitful',
+    '$&mposed$&rators$!y"(ductible"#ems#%p-sea$#ens"!f#\'ecation%$tors$%rring#)initively#)lationary#&ormity#$used',
+    '"(hydrated"1industrialization"&jected"(legating#$gard#\'icacies$\'nquents#"os#$ving"-mocratisation$\'iselles$(nstrable)$tive*"or$(ralising',
+    '%#ion#!s##ure&"ly%#red"%nbigh#!e#&igrate$$zens"\'portees#%raved&#ity$(edations%\'ssingly##ute',
+    '%#ory")scriptors#,ertification#\'iccated$$ring#%k-top$$tops#&paired%%tches$%enser$\'ondency)!t#\'troyers")tachments#&erring',
+    '$*xification"#uce#(tschland\'%marks"!v#*astatingly#%ilish$"ne$#zes#$olve"!y!!f!"ha!)iagenetic$&nosing',
+    '##log#*metrically#$rist"#ced#%hotic#\'kensian"$ddle#!i"$eppe#%rdriu#%trich""ff$*erentiates$&idence"\'gesting',
+    '$#ory#&itised"&mbleby##ity##mer#$ness#\'orphism"#ner#%gwall#"iz#!t"$onne##xin",plomatically"!r',
+    '$$ktor")sagreeing$*ppearances#*bursements#)cipleship\'%ining$%loses$+oncertingly&$nect&)tinuities%)uragement#\'dainful#+equilibrium#&guises\'#ing',
+    '$%onour#)ingenuous#\'loyalty#%mally$\'embered$$ount#(obedient$(rganised#(paraging%*ssionately%%tches$&ensers%%rsing$&irited(#ing',
+    '$$oses$%uting#(quieting#&repair$\'uptions#*seminating%%nsion%%rvice$\'ipation$&ociate*!d#+tributional$$urbs#%unity"\'thering',
+    '"&uretic"&verged%\'sifying#$ider$$nely$%sible!"ms!*na-binding#!s"$estr!&ocking$$side#%toral$\'rinaire"$ddle',
+    '##son"(g-whelks##mas%$tism"&lomite$#res")mineering%"go%$ique%#oes"&nleavy##son""on#)r-to-door"#pey',
+    '#!n"#sed#!h##ing"&ubters#%ghnut%"ty$"ie##sed"(vercourt"#wdy#"er#%ncast$\'grading$$land',
+    '$$side""ze!#p-1"!r!"ra#(gonflies(!y$!s#!m$%atist#"pe%"ry")eadnought#$dger#%ssage',
+    '"%ibble\'!d#&ft-net%$wood#*nk-driving"#oop"!s")ug-taking#"id%!s#&nkenly"#yly!"so!+ual-purpose$#ity',
+    '#&iously##ois"&ckling""de"&llness")mbfounded#"py"%ndalk#$edin#&garees$$eons#"ne#&stable&#ple"#ped',
+    '&#ity"&rables#"oc#$rant"(sseldorf##ter!%wayne"$ight"%orkin!*ynamically$%sties#%mouth"\'sentery#%lexic#&phagia',
+    ' #e\'s!%.c.j.!!3!!4!!6!!7!\'achuinn"$monn"%rldom$)y-morning"\'sington#%terly$%leigh"!u"+vesdropping',
+    '"#bed""rd!-ccentricities"$omog#)nometrics!%ddery"\'enderry"%gware"$irne#\'torials&$ship"&monton"!n"\'ucative"$wina',
+    '"$rily!+fficiencies$"gy#&luents!"ga"$bert"%erton"$oism#!s!"h8!%iffel"*ghty-eight\'$four\'%seven("ix',
+    '!*jaculation"#ect%#ion!*l-ahrairah"$apse#(sticated\'%ities"%bowed"\'derslie",ectioneering%\'rifying&&olytes#&vators"!i#&citing',
+    '"%lipse$#son"#mer"(ongation""sa")ucidation#"de!&manate$#uel"&balmer(!s$\'nkments#*ellishment$(zzlement#$urey',
+    '$!y"!f"#ile$"io#!r#"ts"&porium$#wer#$ties"&ulated&#ing&"or!\'nacting#&lapril#&moured',
+    '#+ephalopathy##ina#$odes#\'roached"\'d-users##ara#*ometriosis$(nuclease$(rsements\'!s$*scopically$\'thelium"!g##ulf"&meshed',
+    '"!o"(rolments"\'sembles##ign#%laved##ues"\'tailing#$eric#\'halpies$\'ralling$\'usiasms#$iced#%rails$#ust""ya',
+    '!!o!\'phemera#$raim"#ics#&dermal\'"is$$ural#%logue#(nephrine#$thet$&omised""lf"\'onymous"$ping"!s',
+    '"&ualise$&nimity#\'ilibria$%pping!&rasmus"(gonomics"&itrean"$mine"%oding")ratically#(oneously"%udite#%pting!(scalator$$pism',
+    '&"ed#$obar"!k"%pouse"*trangement!#t-1"\'_cetera"(hnically#(ologists""na"&ruscan!)ucalyptus#(haristic"&genics"(karyotic',
+    '"\'phemism$$oric"+ro-currency$%bonds"%stace!(valuates#\'porates"&ensong#*r-changing%\'growing$&greens"#ict#\'dential"%olves!)x-husband',
+    '(#tly$%pting#*hange-rate#%ision$&tatory%"es#$laim%\'mations#+ommunicated,#ion#%reted"*haustively\'!s#(ilarated#)ortations',
+    '"&panses&&ionist##end&$able#\'iration#)licitness#*ressionism$)opriation"+termination%&nality#&ractor%(vagantly"$uded!&yadema")e-witness',
+    '#&shadow$#ore \'f&mdash\'$;ing"&uuml;r!%-plan!-a&ccedil;ades"!a"$bled"%cades"$erie")ir-haired$#est#*t_accompli"$krid',
+    '#%l-out$#out#*sification%"ty$$taff")miliarise%%y-run""ng#"on#$zine"!p"\'r-flung$\'sighted##ley#\'msteads',
+    '%!r$#ier#%thest%#ing"$scia#)t-growing"&talism&"ty#%hered$#oms##ima#$uous"%ulted"#vor"$youd',
+    '!"da!%earon#)therstone\'&weight"&ckless#&undity"\'derated"&ethams"%igned%#ing"\'ldwebel##las$#ers##ony"#mur',
+    '"%rnand$"ie#(ociously#&reting$%yhill#\'tilised"\'stering"%vered%!s!)festiniog"!r!"gd!%iance&!e"$ddly',
+    '&#ing""ef#(ldworker#%rcest"+fth-century%!s$\'y-eight&%seven\'"ix&%three"%gural%%ehead%$ines\'!g"$jian',
+    '$"ip#(m-making"\'nalized##der$#lay#)e-grained$"ry#\'gernail&#tip#&ishers#!k#%negan%!y"%refly$%power',
+    '%!s"&shbane$&keeper$$wick##ons#$sion$#ure#$tful"#tch##ful#$ters$%ingly#(zormonde$\'william")ve-minute',
+    '"%xedly!)lagstones##ked$#ing##med%#nco$$ingo$%mable#&shback%%light$"ks#%tmate##unt&#ing#\'vouring',
+    '%!s#%xibly"\'inching#%ppant#$rted#%tting"!o#%cking#!g$#ged#\'odgates%&lights$#red#"ps#"ss',
+    '("ed$#ted%#ing"!t"%ushes"&ysheet#&weight!"mi"!s!&ogerty"\'llow-on")olishness$%proof#)tprinting$&switch',
+    '#$dham$!s#(ecasters$\'fathers$"go$\'runners$(shadowed&#ore%&talled&"ed$%taste#&geries%$tful)$ness#\'malists',
+    '$#ica#$sake\'!n"%sters"&uchard#$ling$#kes#&r-hour%$part&%oster%%wheel$$fold$#ier$$some(!s',
+    '""xy!!p""cr!"ra##cas#%mpton#(nchisees%"ia"$eaks#%deric#\'e-trade$#bie$&mantle$%phone$!s',
+    '$$zers#%iburg$%ghter#,nch-speaking"#ick#*ghteningly(!s&%fully#"ll%"ed"$oggy#*mage_frais#(nt-bench&$page%$ages',
+    '##wns"!u##gal""ye!#sln!(ugitives#"ue"*ll-blooded%$year$#ing$)y-fledged"$mble#!e"+nctionaries##dic',
+    '"$sing""zz!!x!#yfe #g17!&addafi##get"$ffer""ge#!s"(lashiels#$icia#$leys$#ing##ton',
+    '$#led&"rs#\'ekeeper##mon#)sakhurdia"%nglia##try""re##net&!t$%ished##ret$#ick"\'s-fired#$kell',
+    '#%sendi#%works"(tekeeper"$uche"%viria""wd"$ynor"%zelle$!s!%eddes"&latine##dof"&ndered#)ealogical(!y',
+    '#"ie$%talia#$oese$$type#&tility"*ochemistry#\'grapher"\'rminate(#ion")stational"*t-together!$hent#$ttos"!i"!s',
+    '""bb$"et"%ddens##eon"!l#%foyle##les$$igan"(mmelmann"%raffe#$ders#$lish#!o#"th"%ttens',
+    '#%seppe"&veaway$!r!!l"#ade#&ndular$%ville#&ssware$&wegian"#ean#\'neagles$"ys""ib#&stened##tzy',
+    '$!s""ut!%nawed"#ome!)o-between"!a##ded#(lkeepers(#ing$$less$&scorer"\'d-given#$send"\'ings-on"#lan',
+    '#"ly"#nna#%zalez"!o#*d-humoured%%night$#all$$byes##gol#&seneck"%rbals#%e-tex##ges#%illas#!y',
+    '#"ta"$uged#%lding#!t"*vernorship"!w""ya!%racie#&dation#%inger##mps#$nary$*d-daughter%#est%&master',
+    '$%t-aid$$ular#%smere#(vestones#$yson"!e#(aseproof$\'t-uncle%$coat#&enaway%&grocer%#ham&%ouses%$idge&"ng',
+    '#&gorian#$ndon$$oble#$sham#%ville#\'y-green%&haired$#ish"&ierson$#ved#%lling#$nder#!s#&tstone#%zzled',
+    '##ovy#%ssman#(tesquely#\'undless$!t#$wths"$undy$"ge!!s!"ti!.u&eacute;rigny"*ardianship"+bernatorial"(idebooks#"le',
+    '#*nea-bissau"&lliver#$ping"\'ndovald#$nell$#ing#$shot#$tram"#ppy"&rgling##ney#"us"%scott##hed"%thrie',
+    '#%tural!&wyneth!,ynaecologist*!y #h.q!!1!(abitable"$cker$#saw"#des"+emophiliacs"&ggling"!h"*ir-raising$$cuts',
+    '#$tian"#kim"*lf-a-dozen&&n-hour%$back%\'century&%losed%#day&$ozen%%empty%$life\'#ght%$open%&sister%(timbered',
+    '#"le%!y#$ogen#%stead#"ts"\'mbledon$&urgers#"er##lyn#$pers$#son"*nd-in-hand%$made$%books%$rake',
+    '$$held$%iwork$&lebars$$over$&sworth#"ks$!y#%nover$!s#*s-dietrich")phazardly"\'rassing##bor$#ury#(d-boiled',
+    '%$line%"up%#won$%broom$"ie$#man$$wick%$oods&%rking##ems$$wood#$ford#&greave#!k#&monics',
+    ')!d$!s#&nesses#$ried"%skins#!t"\'tchback%"et#%herby"%ughey%#ton#"te#%xwell"$vant"\'wthorne',
+    '$#ock!!b"#sag!!c!"dl!(eadboard$$gear$#ley%$ined$#man&%sters$$room$$ship#$lers$%thily',
+    '#"rn$\'t-throb%$ache%(breaking%"ed#,thcoat-amory\'"te%$land%!s#$vies%$ness$&y-duty&&handed"$dley"%garty',
+    '#&nemann$#ous"\'kmatyar"%lical%"es#%lenic$#ish#%msley#%pings"(miplegic$\'spheric#&pstead")patocytes#%worth"&raldic',
+    '$&icides%!e#\'eabouts$\'inafter$$tics%!o$$ward#$luin##ons#$rick%#ngs%"ot#%tford"\'sitancy&%tions',
+    '"-terosexuality,!s#)herington"%yford#$wood!&iccups##key$#son"\'deously")gh-energy%%fibre&%lying%&handed%(pressure$"am',
+    '$(er-level$!s"$jack&#ing"$king"&larity"\'ndering"$ppie$\'ocampus"+re-purchase$!r##sch"&spanic#+tologically%)riography',
+    '##her"#ves!!l"!a!(oardings"&bbling#%house"(chhauser#$kney"%dgkin#&kinson##son"(ldsworth#$ford#\'idaying',
+    '$$owed#!m$!e#$royd#%yrood$$well"&meward#!o$(_sapiens$&phobia"#nor"#oke$#ing##ted"%ppers',
+    '##ner$!y#&oscope)!s#%rocks#)se-riding%%power$#ham#"us"&sepipe$!s#$iery#$kyns#%telry"\'ur-long',
+    '%%bound&\'uilding"(vercraft"(wdendyke#"es#"ie"!y#$lake!!r"#awi"!h"!t!$t-29!&ubbard$"ub',
+    '""ff"#lls"%manly#$bled&!r$"ug#$drum#\'ourless"(ngerford#!k#$slet#\'terston$&ington$#ley$$smen',
+    '#$dler"$srev"!w"$yton!#wim!*ydrophobic%#xyl"\'perbole%,gastrinaemia&(lycaemia%)sensitive%\'tensive#\'notised(!t#\'oxaemia',
+    '&#ics"%undai!!z #i.e!#aaf!"bs!%cam-1"#ily!$daho"!c#$ode="!e#!m#(ntically&)fications',
+    '$#tic"$ling"#yll!"ga"&natius##ite!"i.!"le"!k")l-advised$(equipped$\'fitting#&egible&&timacy#*uminations',
+    '!)maginings#!m"\'itative"(maturity#\'emorial$#rse#&inence#\'obility#\'unities%%ology"&pacted$%rting$\'ssively#(ediments$$rium',
+    '$%tuous#%inged#%lants$$ored#&ounded$*verishment#\'resario&$sing(&onable*#ism,#tic-!s$&obably%&vising##ure',
+    '$#ted"#ran"!s!\'n-built"(accuracy#)dmissible$\'vertent#(lienable#)pplicable#)rticulate"$born"*calculable$(rcerated*#ion%$nate',
+    '$&stuous##hed#)inerators$#sed%#ion%"or#,omprehension$\'ngruity(%ously%)siderable#&ubator$&mbents$%rsion"+defatigable$%lible',
+    '$&xation#)ianapolis$)fferently$(gestible$&screet($tion$*vidualised,"ts&%sible#&ochina%)trination$\'mitable#(uctivist$)stry-wide"-effectiveness',
+    '#\'ptitude#(quitable#(scapably#*xhaustible"%farct$&tuated#)iltrating$)nitesimal$%rmity#\'lection$#ows#&ormers#,rastructural$)ingements\'#ing',
+    '##mar"$hale%#ing#\'eritors#\'umanity"(imitable#%quity#\'tialled""ks#!y"#lay##ets"%nards#&ocents$$vate',
+    '#%uendo")oculation#)rdinately"*put/output"\'quiring%%sitor")secticide#&incere$#pid$\'stently#\'tonians$%ructs#*ufficiency$\'perable$&rances',
+    '("ts"%takes#(egrative("or*!s$+lligibility$(r-agency\'\'merican&\'related%$bank%\'connect,#ion/!s((tinental%&facing',
+    '%&jected%&linked%\'nalized\'\'tionale&"ed%%posed%,relationship&%ogate&$upts%$sect)$ions&$tate\'%ellar%%venes$%state',
+    '#)oxication#,raepithelial%\'gastric%\'luminal%\'nsigent%(venously$%igues$!o%"ns%(spective%&verted"#uit"%vader$\'lidated#&ective',
+    '$"rt$&terate#&idious$(gorating#\'ocation$#kes!%onian""ta""wa!"pc"#uky!(ran-iraq"&ishmen"%ksome"&onwork',
+    '")reparable%(laceable$,sponsibility$)trievably#&itates!#say"\'chaemic"$mail"%omers#&tropic!"ta##lia&$nate%!c"!c',
+    '"!h!)vanisevic!*zetbegovic \'jabbing"&cobson#$quie#$uzzi"!g"#ils"&kobson"#mmu"&ngling"$rred%"tt$#ing',
+    '$!t"%velin"\'zzbeaux!!d!)ealousies#\'n-marie"%ering"%junal"#kub"%llies$%yfish"!m"$nner")opardised("ze',
+    '#$seys##vis"\'spersen#%samyn"#wry"!z!"ib"$lted"%tters!*o&atilde;o"%achim"%bbing##son"%celyn"$ffre',
+    '"#han%"na&"es"%inted"&kingly""ni##son"$siah"&ttings"(urneymen"&yfully#&riding!)ubilation"(ggernaut"%kebox',
+    '"#mpy"%nkers$"ie&!s""ra#*isprudence%"ts"%stine&#ian""te##ted *k&amacr;li!&adilik"#hlo"!i',
+    '"%raoke"!t#&hmandu$#ryn#$rina"$unda"&wasaki"#yak"$zakh!"cl!"da!!e"$babs"!g""ll',
+    '"(nilworth"%tchup"#yed#\'nesians!%halid"%edive!!i""ah"&lbride#$dare#%kenny#%ogram"#mon"%ndest$#led',
+    '#%etics#%ghorn$#man$%sholm$#ton"!p"(rgizstan#&kcaldy$\'patrick$$wood"\'ssinger")tchenette##sch$"on"#wis',
+    '!(leinwort!$napp"#ead%#ing#"ll"(ife-edge#%ghtly#"ts"%obbly#"tt!%onrad"#rda"$sher"%zyrev!!p',
+    '##mer"%ishna"(onweiser!!s!$ursk"&waitis!!w!"yi""te &l.c.c."$e.d.!(abourism"%conic#&quered"#dle',
+    '#&erfeld#$oons"$hore"\'id-back##rds"%katos#"er"!m##bda#\'entable&!s#$inin"(nd-rover$"au$"er',
+    '#%gford$%uidly&%shing#"ky"(parotomy#%illus$!s#$lace##top""ra#!d#%gesse#"ks"&serjet##ses',
+    '#\'t-ditch"%tched#%eness$#ran##her""ud$&erdale#&nchers$%dered#%reate"%verne")wlessness#%suits"\'xatives"$y-by',
+    '%"ut#%ering#%field"$zuli!"b."!w!"cc"!d!"dl!*eaderships#"ky#\'mington#$n-to$"ne#%thers',
+    '#$tern"%eches#$ming#!r#$ward"&ft-arm%$back%&hander"(galistic&#zed$"te%#ion#)ionnaires"$hman"!i',
+    '"&onidas$#ore"#per##ine#$rosy"(sbianism#(ley-jane"\'tterbox&#man$$ings"%ucine"$vant#&ellers&!y$!n',
+    '%"ed#%inson$"tt#$ying"#win"!x#*icographer$!s!$hasa!\'iaising%#ons"#bra"%ddell#!o"+echtenstein',
+    '")fe-styles$!s"*ght-headed%%ening"%llian"%neout#%gerie$%field##ley#&thorpe"$pids##man#(oprotein##ton")quidators',
+    '"$sbie#%tless#"zt""te#$hium$\'otripsy#%igant#$ters$&lejohn"!u")velihoods$!n$"rs#$ings!!l',
+    '!!n!#oam#&thsome"\'bbyists#%sters"$cale%\'isation$#tes#$kers%!t$$heed#\'omotion$!s"\'garithm#$ogen',
+    '#&tering""la#$ling%#pop")ng-haired%&legged&#ost%\'serving&(uffering$$ings%"sh$!s"\'okalike#$ping$!y',
+    '$"ed"&psided"$rdly"&thians"%unged#"ts"&veless%$iest$!y"\'w-grade$$pass#(er-level#!s"%yally!"se',
+    '"!r!!u"\'bricant""ca#%kless")dicrously"(gubrious"$lled$#ing$!y"$mber#\'inaries%\'escence%%osity\'!o',
+    '#%p-sum$"ed""na$"cy#!n"#rks"$saka#%trous$!y"\'xemburg#&uriant!"wt!!x!$ydon"#man',
+    '#\'phocyte&"id"$ndon"#sis#&osomal$$zyme #m40!!5!+a&icirc;tre"(cdonalds#$hair$(inations&#ing%#smo$\'ynlleth',
+    '#%laren#+ro-economic"\'ddening#$e-up#"ra$%igals"\'elstrom"%genta#!i$%cians$"ll#\'nitudes$"ox#$pies#!s',
+    '"&hathir#"di"%idens##ler##med#%nline"+jor-general"\'kepeace#$ings"/ladministration$!i%!s#!c#%dives#+e-dominated',
+    '#(function##ham##ibu$"gn$&nowski#$lory#\'mesbury#$oney#$pass#$tote"#mur"%nagua#%damus$"ru#$escu',
+    '#$hole#&icured$&festos#)n-whitney$$ered#\'ometric$$rial#\'servant"$oist"$ples"\'rathons#(chioness$"ia#!g$!e',
+    '#%inade#"je#%keter$$sman#%lboro$"er#%onite$$oned#&quetry#&shalls%$land$"ke##ten$#ian#\'velling',
+    '#-xist-leninist"$slin#\'termind*"ed"&tchbox%&sticks#"ed$\'riality)"ze#$hers%#son#$inee#$lock#%thias#\'urities',
+    '#$gham#!l"\'whinney"$xima%$ised"%ybury#%oress#$pole!"ca"&callen&"um#&lellan)!d$"oy#&onnell',
+    '$!y#%reery#&ulloch\'#ugh"&dowell"$evoy"$fall"\'geechan#$uire$"rk"%innes$$tyre"#kee#%insey"%nally',
+    '"%quaid"#rae"$tear"\'whirter!&eacher#"de#&ltimes#%nders$$ness#"ty"+chanisation("ed\'&zation##iar"(dallions',
+    '#,ell&iacute;n##ici$"na$$tate\'#ive#"oc#%reses"\'gabytes"%lford#%litus$!o%!n%#wed"#met#&orably',
+    '")n-at-arms#$aces##del&%ssohn#"lo#%swear""ps"&rcians##lyn#$maid#&riment"(senchyme#$srs."+tallurgical)!y',
+    '$&phoric$&stases##eor&"ic\'"te&%ology$$ring#&hadone#%rical$%opole##tle"\'zzanine!"hz!&iandad""ca',
+    '#-roalbuminuria%$bial\'(ological+!y%%fiche%%light%!n%%waves"&d-1990(!s\'!1$%april%%ugust$\'century$(eighties',
+    '$$july$#may$%price$)seventies%&ixties$)victorian$%wales&!y#&dleham&#men%#ing##ges$#ley#$riff"(grations',
+    '#\'itarism##ked##lan$"ed%"rs%"tt$(iseconds$%stone"$mics"&nehead$#rva#!g#%i-bar$!s#"ke',
+    '$#ows#$oans#%strel##ted$!o#%utely%#iae"$rren"!s#-appropriation#\'cellany$)hievously$(onceived#)demeanour,!s',
+    '#.interpretation#%ogyny#+represented#$took"%tchum#!i$&gating#)ochondria$#tic#\'sotakis"$x-up##ers!)obilising&$zing##uto',
+    '"\'derated%&nising\'"ze)!d(#ing#$icum$$fies##row#!s#&ulated%!i"\'istened%&uriser)#ing"!l',
+    '#&davian#$land$"ie$"oy#%yneux"(netarism##gol$#rel#"ie$#que#\'ogamous\'!y$$tone#"ro%#via',
+    '$&everdi$\'pellier"$odie%"ly#%rlake&#nds"#ped#!s"(ralistic(!s$"ss#"el$#ton$!y##gue',
+    '#$nin\'#%osely#$peth$$urgo#!t$$ally$%gaged$%ified"$ssad$#ley$!y"$tets#\'herland\'!y#(orcycles',
+    '"#ult%"on##nce$\'taineer+!s##rne##ssa$&taches#&thfuls%#ing#&vement"!w#!n!#pg6"#hil',
+    '!"tv!)uch-loved"%eller##sli"(ggeridge&!s$#ing##hal"#lch##len$"in&!s#%throp$*i-cultural&\'faceted',
+    '&\'purpose&&racial&&storey%\'lingual%\'variate"$mble"#ndi#+icipalities#!n##ros""on"#rad$"ls##ine#$tach',
+    '#!a#!h$!y#)ic-making$"ng#!k##sel#$tafa$$ered!%yopic"$rtle "n\'!)-terminal!%adine"$gged',
+    '"%nnies##tes"(rcissism)#tic$$otic#&rowest"$seby#&hville##sau#$ties%$ness""te#)ion-state\'$wide#(uralness',
+    '#"ru#\'seating%#ous"%varre#&igable&$ting\'#ors#(ratilova"!w#"az!"bc!!c"!b"!o!"dp',
+    '#"le#(nderthal#%rside##ter$$ness"&bulous"+cessitating"(edlessly&$work"%gated#%lects")ighbourly"\'matodes#$esis""ne',
+    '"&o-nazi#)classical#&plasia"&palese#%otism""rc""ue#%ronal&!e%+transmitter#\'tralise*!d%#ino%%ophil"!v',
+    '"&w-look$%style#$bolt$%ridge#%haven#)ly-formed#$nham#\'sworthy#!t$\'ownards!#f-l"!s!#gos!%ibble"!c',
+    '#$king#!o$%demus$$lson"#dri"$eces#$lsen""gh$%tgown%"ie""ke#"ki#"on"$mbus"#nes',
+    '(#our\'$nine\'#one\'%three("wo"%pping"#rex"\'sodemus"%thard#$rite$#ous"#ven!$o-go"".1#!8',
+    '"#bly"#ddy"(minating##ura"*n-academic%(lignment$)christian%)ommercial(%ittal$(domestic$&equity%\'uropean$\'fiction$\'hodgkin$\'insulin',
+    '$\'medical$\'nuclear$*specialist$%toxic$"uk$(violence$$zero#\'chalant#(descript#%e_the#&linear""ok"%rbert#!d#\'malized',
+    '"#sed$!y#$tril#!y"%thin\'#(iceboard#"re""ur"\'velties"!x!"pa"!c"!t!!r!"sa',
+    '"$dity"\'isances"%llity"$mbed#%erals""nn$#ery"&tshell##ter!!w!&yerere"#mph%!s $o\'er"&keeffe',
+    '"!s##hea"%toole!"ar"#ses"%tmeal!%biter$&uaries"-jectification&"or"%liges$&terate"!s#(cenities$%urely',
+    '\'$vely#)olescence#&tetric$%inacy\'$tely$(ructions"\'trusive##use"%verse!$ccam#&lusion"#ker#%leton"$t-11#$agon',
+    '!!d"!a"&dities"$ette"#har"$ious!%euvre!\'ff-farm$$peak%&utting$$road#"al#$ends##iah$"ng',
+    '$$tage!#hms!\'ilfield!$kapi"!i"&lahoma!!l""af"$dies""eg"\'factory"&ympian!$mens"!f"#its',
+    '!-ne-and-a-half$&handed$&parent$%tenth"&looker!$ozed!#pal")en-minded#%rands"\'penheim#&ortune$(sitional"!s"&tician$(misation',
+    '\'!t(&ically(!s"&ulence!)rang-utan"&bitals"+chestration"(dinances&&riness"$este"!f##ord"\'ganists&#zes"#iel',
+    '"+namentation#*ithologist*!y"!s"(thogonal&&raphic!%sbern")cillating("or"!i"%motic"(tensible%)tatiously"&westry!!t',
+    '"$tery!&usting")t-of-town$\'patient#\'classed#$done#&ermost#%lived#(patients$$osts#)rageously\'!s#$size#&weighs!&varies',
+    '$$awed$$done%%rafts\'"wn$)estimated$&flowed$&heated$$kill$\'loading$&priced$$rule$$seer(!s\'!s%$ized',
+    ')#ing&#ill""um!"wd".ner-occupation+#ied!"z. 0p&acirc;t&eacute!"\'s!$.225!!2!"3a!!4!!6!(aba-udca',
+    '"%ddled&"rs&!s"+ediatrician"&ganism%!s##ham##ing""hl""il#\'nlessly"&latial#"ey#"in#&ladian',
+    '$&iative#!o")ndemonium#"gs#+ic-stricken%"ky#&khurst#$ties"(pandreou#$illa"(rachutes$$ding#(celforce#(is-based#"ke',
+    '$$side#%lance$+iamentarian$$ours#%mesan#"se%!r$$ifal#$take$&iality%\'cipates&!k&\'ularity%\'sanship%\'tioning',
+    '"#sha#(sageways#%tries""te$!r#(hfinders##ina#"on#$rese$%onise)!d##ton"!u##lie#&sanias',
+    '""ye!"c."!b""na!!d"!c!\'eacocks##rse#"se"$cked#%toral"\'dalling$$ntic#%dling##lar',
+    '""gg"(jorative"$lham##met#*oponnesian##ted"&nalise$"ng#\'dlebury#\'insular$$tent#%knife#$nant#$rith#(tonville',
+    '"&ppered#"ys",rambulations#%cival#\'emptory#\'fecting$\'oration&"ce$$used#(ipatetic$\'stalsis#$jury#&meable&"te(!s',
+    '#\'oxidase#)petuating\'#ity$&lexing("ty##rin#&severe)!d$+onification$(uasively#$twee#%vades$&ersity"$seta#%tered',
+    '")titioners#"ra$!e$*ochemicals%$grad#\'ticoats##ula!#flp!#gce!#h.d")armacists\'%ology"$elan#"na$)omenology',
+    '$)ylalanine"(ilistine*!s$\'osophic"&one-in#)spholipid,!s#*tochemical")raseology"*ylogenetic##sic%+otherapists#*toplankton!%iaroa"%ckers',
+    '"%glets"%le-up"%mlico#!p"$nder#%ewood#&nacles#\'pointed"#ppa$"ed"%ssing#"te$#ons"%tcher#"hy',
+    '#"ts#&uitary"&voting!&lacard$$enta(!l$$idly#$gues##ice$#ted##nar#)sterboard\'$work#%yable$*er-manager',
+    '("ps$$room""c."$eads$(santries##xus"%iable#"ed$"rs#"ny""od$#ded#$tter"%t.off"$ucky',
+    '$&meting$#ped#\'ndering$#ges#%tarch"$ying!"mr!"nc!$oach%"er"!e#$tics""go")int-blank%"es',
+    '##tou"&laroid#$iced&%women$%sario#(lination%"tt$%utant&"er#+yacrylamide$%meric%\'orphism$&nomial*!s$!p',
+    '#(tificate$&ypridd"!o"%pcorn#%ulism"!r#$cine#&poises#"ta$"ed%&rfield$&hmadog$"ly$#man$&obello',
+    '"%sited$!x#*t-election%&modern$#bag$(humously$$ings$)lethwaite$%natal%&ominal$&ulates%$ring"$tash#)entiality#%holes',
+    '&!s#$sdam#&teries"%uches%$itis"!w#$dery#%ering#!s"!x!"pt!$rado#"ms#%ncing"*e-arranged',
+    '$&empted(#ion$*raphaelite$#set#(cambrian$#ept$%incts%$pice#(dicative%\'lection%&sposed$(ominates#*fabricated%#ced$#ect',
+    '#\'history#*liminaries#)meditated$$ised$\'onition#%natal#$scot%%ribes$(ervative,!s$+ident-elect\'!s$(ocratics$\'surized$%tatyn',
+    '&#ing&&ptuous%&pposed)%ition#\'tension$$tily#(ventable$$iews##war##yed"$icey$$king#&estess#"ma$&itives',
+    '#&nt-out#"sm#+vatisations$#ity#*ze-winning"(o-active#)bationary#$cter%*ocolectomy$&urator#$fane$)it-making$&ligate$#umo#\'gnostic',
+    '#&kofiev#)liferated*#ing$(ongation#\'montory#(nouncing#(pagating$&hesied%\'ylactic$&itious$%onent%)rtionally%%unded#)spectuses$*taglandins',
+    '%$rate#1t&eacute;g&eacute$\'ections($vely\'#ors$&ractor#%verbs$)ocatively#!w#\'ximally"!p"!u#&dently#!e#%nella',
+    '"!y!#s/2"%alter"\'eudonym"$ycho&&social!&tolemy"!s!(ublicans&%ising\'"ze"&ckered"$ffin"$lley$#man',
+    '#$frey##ice"&nctual(#ity#$jabi#!s"#rer##ges$#ing##ify$"st$\'tanical##ley#&posive#!r',
+    '##vis!!v!"ye"$jama"%loric"!m"\'ongyang"&renean -q&lsqb;x&rsqb!&addafi!"dm!#ian!!t!(uadratic%%upled',
+    '#(rrelsome$%tered%!o##sar#"ys"$easy##ene%"ie%&sferry#*stioningly#!x"%ibble##che$#ken#$eten',
+    '#"ll$"ts#$ncey%!x$#ine$!s$*tessential%"in##rks"&otient &r.a.f.!!5!$abat##ble#"ia',
+    '$"es"#cal#&ehorse#$hael$\'maninov#!y""da#-ioimmunoassay"#fiq#$ting"$hman")ilfreight$&waymen#%nbows$%drops',
+    '#0son_d\'&ecirc;tre"%madan#$bler&!s$!o#$pton#%sgate"$ncid$#our#*domisation#!t$#ing"%pists##per#&turous',
+    '"%sbora##hly#!p#*semblement"%tchet#)ionalised)#zed##ner"&venous%!s$!s"&wlings#!p"&yleigh!"bg',
+    '!"ds!(e-create(#ion#\'emerged)#nce$&ntered$+stablishing,$ment$*xamination)"ed#\'opening#$read#$used"%adies$(justment',
+    '#$gent#\'l-world$&isable#&ppears%&ointed#&r-view#\'ssessed"(bellions#\'leeding##uff"#cap$"st##ede$(ssionary\'"ve',
+    '$&tative#\'laiming#(ollected$)mbination$*nstructing$&veries#&titude#%urred\'$nces%!s#\'yclable"(d-haired#%ditch$!y#&eeming',
+    '($tion#$ford#$head#%irect("ed$&scover*!y%\'tribute,!d#%olent$\'ubtable#$path#$ruth#)uctionism+!t',
+    '#"ce")ferencing\'$dums#"it#)lectively%$xive#*ormulation#\'ractory$%esher$(igerated#$uges$$nded&!s$(rbishing$$sals',
+    '"%galia#)ularities"*habilitate,!d#%oused#(ydration"\'imburse##ned$,terpretation#%ssued#(terating$!h")juvenated"\'kindled"&launch',
+    '$#xes$$ying%!s#%ieves$\'giously$)nquishing$"ve%#ing#\'ocating"$make#(ittances&"ed$!x#\'odelled(#ing',
+    '+"ly$#ter&"st$#ver"%neged%&otiate#\'ovating$"wn"\'painted%#rer$&ration$\'triated$%yable%#ing#$lete',
+    '#)ositories%\'session#&ressor$%ieved$)oachfully%\'ducible##ton#*ublicanism$$lsed&#ion$"te"*quisitions")scheduled$#ind%%ssion',
+    '##ell$(mblances$\'ntfully&%ments$&rvists#$hape$&uffled#\'ignedly$\'stances&#ors#\'onances$*urce-based\'#ing#\'ponders#&tarted',
+    '$$ores#\'urfaced%$rect$\'spended"%tails$&liated(#ory#%inoic$\'rements#$ract$(enchment#&urners"$vamp#"el%!s',
+    '%$sals%"ts#$iled$&talise*!d#\'ocation$$lted%)utionised#!s"$wind#%orked&#ing"%yburn""za!%heims',
+    '"\'ineland"#ode%$sian$(odendron,!s"(ythmical!&ibcage"!c#"an#%hmann#!s"%ddick$#les#%geway""ff',
+    '$!s"(ght-back&&handed&"on%%fully"#lla""me#!s"%nsing"%poste#!s$#top")tualistic&"ly"$vets',
+    '"$yadh!"mi!$oald"%botic#\'ustness"!c#%kwell"#ddy#"in#!o#-r&iacute;guez"#gan#"et""lf$!e',
+    '"$mano&(-british%\'tically(!s##ero##ped"#nan#"ny"$ofed$#top"%salba$$mund$"ry##coe#$kill',
+    '$#ini##ter"%tates%$ions#!e#\'hermere"%ugher%$ness#\'ndhouse#&tledge#!x"\'wbotham#$dies##ley"#xie',
+    '!"pc"!f!"sa"#fsr!"te!&ubbers&!y##ies$&nstein"\'cksacks""di$%ments#$olph"$fous"\'mblings',
+    '#$mage&#ing"$ncie#"gs#$ways"$pees"\'sh-hour##set#$tled""ts$#koi##ted!&ylands *s&amp;p500#\'tilde;o',
+    '!!4!!6!)abbatical#&oteurs"#cco#\'rosanct"%ddest")gittarius"(insburys"#kes"\'lamanca#%eable$\'speople#$inas$$vary',
+    '$"ow#$tash$"er$#ire##ver$!o"&meness#&pdoria$#ler#!s#&uelson"(nctified&%oning%"um##der',
+    '$%hurst$#ing$#own#%gster##son#&tander$"is"&plings##ped"!r#$acen#(cophagus#!k"%tchel#!s',
+    '#&vignon"%vimbi"\'xophone##ton"$yers!"bu!&calded%#ing$$lops$!y#!m#\'thingly#\'vengers\'#ing"%eptre',
+    '#+leiermacher%&singer#\'meichel#)ool-based\'\'leaving$(penhauer#$uman%%peter$$ster#%wartz&(zenegger\'$kopf"!i#*ntillating"&olding',
+    '#&rpions$$sese#%trail$"ty#"ur$"se"%rawny#"ee#\'iptural#&olling$#oge##ubs$"ff$&tinise)#ing',
+    '#$ttle&#ing"$ythe!"dr!"e1"&abirds$$oard#$gull#$lant#(rchlight+!s#%shore$&onally#%tbelt$"er',
+    '\'%order\'$year&#ing#$rete&#ing#&tioned#$ures%$icor"&dative#%gwick#&itious")e-through#&ing_as##ker"&lborne',
+    '(&raisal&)ssessment($ured%)confessed%)deception\'\'feating\'$nial&$oubt%(effacing&)mployment&(vidently&*xplanatory%)financing%)inflicted\'(terested',
+    '%,preservation%*regulating,#ory\'&liance\'(specting&(ighteous%)sacrifice\'*tisfaction+#ied&)upporting%&taught#%l-off$%otape"\'maphore#+i-automatic',
+    '$$nary##tex"&ntinel")paratists#"ia##sis##tic"!q"&renade%#ely#%pents#"ra#$vile%$tude$!o',
+    '"\'ven-day&&thirty%\'ty-four"#wed"$xton".ymour-strachey!"gi""sa"#urr!\'hackles\'#ton##ker%(spearean#$mans$%eless',
+    '$#lou$$poos$$rock##ven##wls"&eathed$#ves#%epish#&ldrake$$ford#&rborne$$iffs"%immer#"ns#)pbuilders',
+    '$#ton$%wreck##tty#"va"!o##gun#\'p-floor$%floor#\'reditch$"t-&%range%&listed#$vels#$wman%"en',
+    '"#rew##ift#$ouds#&ubbery$$nken""un$#ted%#ing#"sh!&iamese#!n"%dacai#(e-effect$#car$$kick',
+    '%#ong$$walk##led#%onius""en##sta"%gmoid#&nalman$&ifiers%#ngs"\'lencing$#sia#(houettes#"ls##vio',
+    '##ile#"ms##ons#\'plifies""nd##ewy#&g-song$+le-handedly\'&parent##ker##ned##ton#$uous$!s"$phon',
+    '"$rius#!s"$sulu"$tcom#$ters"%x-day$$week#%smith#-teen-year-old$&h-form$%y-one&#six"%zable!&katers"&egness',
+    '"&idding#"er##mpy#%ppers")yscrapers!(lackened\'#ing##ted$!s#+ughterhouse)#ing#!y$#ing"$eazy#$dges',
+    '#$ight#!w"$ings#%ppage#$ther#$vers"#oan#%combe#"th#%uched#$west"$uice#"sh!!m"(all-town',
+    '%#ish#%rting"%irked#\'thfield%%kline%&sonian$#ten"(othering"%udged#$ggle!%naked$#ing#"pe"$eaky#%ezing',
+    '$#ing"*ow-covered$"ed$#man"%ubbed#$ffed#%ggled"#yde!$oane#"rs"%bered"(cialised(#ing\'#zed"%dding',
+    '"!e"\'ftbench"%iling"&ldered#&emnity#$icit\'*or-general("us$%loquy#"ly#$owka#%vency##way"!m#)atostatin',
+    '")ngwriting"\'rcerers"\'undings#)th-facing%%bound%\'western"%werby!(padefoot#%nking#$ring$&kbrook%#ing$!s#&smodic$&ticity',
+    '$!z"(ecialism%$fics$"ks$%marks$(trometer$)ulatively#&edboat#%nders"$hinx")iderglass#$ndly$!y#)talfields$%fires',
+    '%"le""la$&ttered#$enic#$iced%#ing"$ongy#)radically$&tswear%!y#$t_on""p."\'rightly%!s$%ngall',
+    '&"er%$ters#%outed"#uds#"nk#%rgeon##tum"(ycatcher!#q_m"&uabble(!s$$mous$$ring#&eaking&!s',
+    '#$idgy$!g$%rming!)rebrenica"!o!"s."!c""hh"#sis!)tabilized(#ing$#led#&ffroom#\'gecoach#"id',
+    '#$king#\'lingrad&#ism$#ker$%lions#$mmer#%nd-by&"in%&ardise#%rched$$dust$%light$"ry$#tle#&tehood',
+    '$"or$$uary%$ette#&unchly%#ton##ves")eadfastly%\'y-state$&lthily$$mers#\'elworks$(plechase#"na$#cil##pan',
+    '#\'rilised$$land$#ner#(thoscope#&venage#\'wardess$"ed"#ich$&kiness#\'ffening#$lton%!s#\'pulates#&rrings%"up',
+    '$$kade%\'broking%#ist%$pile%$well##ker##lid#&ppages%"er#\'rehouse%$room$!k$%tford$)y-telling%&teller',
+    '#$utly#\'wmarket"&rabane$%ddled\'#ing$&ighter()forwardly%\'tjacket$$ndli%%gling%$raer$/tford-upon-avon%\'igraphy%"us$"ys',
+    '%$tham$&etwise$&tchers#\'ingency&#ing$$pper$#ves"%uarts#$bbed%\'ornness$!s#)dentships$&iously#!n$&ningly',
+    '&\'tically%#zed!$uave"*b-contract%&ulture$\'divided$%group$\'saharan%\'tandard%%ystem$$text#+contracting+"or$\'ultures#)jectively',
+    '#(mersible#\'routine#(scribing$(ervience%"ts$#ide&%ising$)titutions%%rates$&urface#&titled$&racted(#ion#&verted"%ccour',
+    '#*h-and-such$$inda#$kers$$ling#\'ralfate$#ose"(ddenness"&ffixes"$itor&!s""lk#%lenly#\'phurous#%tanas"&mitomo',
+    '(#ing")nningdale#!s##tan"\'percalc&(omputers\'(nducting%&lative%$nova%$sede&\'titions\'$ores#$pers$$lant%\'emental',
+    '%&y-side$&ressor"$rges$&ically#$mise\'!d#$pass$)lus-value""zi!$vend!&wagger#&ledale##rms$#thy##tch',
+    '"$ears$"ts#&etened##gen"$ifts#*mming-pool#$ndle%,on/wiltshire#"pe#"re""op!\'yllabic"\'mbiotic$&olises\'"ze',
+    '##ons#)pathisers("ze*"rs$%honic"%napse#)chronised#&dromes#*tactically$&hesise"&racuse &t-cell!#.v.!$abby#%leaux',
+    '%$ware"&citurn#$king#\'tically$$less##zek"\'ekwondo"#heb"#int"!j"\'ke-away"&liesin$$sman#$lboy"$mils',
+    '#"pa##sin"%ngles$!o##noy#!s$!y#*talisingly#"ya"!o"+pe-recorder$!r#"ie#%water"#rot',
+    '##red##zan"*skopruzade##ter"#unt%!s"\'vistock"$xman!!d"!c!\'ea-time#\'/coffee##cup#!l#$ming',
+    '(!s"*chnicality"\'etering"!i"(lecaster%,ommunication$%grams$#kom$&scopic$$thon"&merity#)peraments$$lars$"os"(n-minute',
+    '#&dulkar#"et#$sing#$ures"#pid$#lit"(rminates#"re%#nce$$iers"&sserae#%table$"er$%ifies%"ly',
+    '##ley##ras!&hacker#%llium#\'mesdown##net$%k-you##wed"$ebes##ist##lma#\'orising#&refrom$$mals%(odynamic',
+    '#$seus$$saly#"ta"%icken&"ts%&nesses#$erry$$ving#\'nk-tank$$ness#/rteenth-century"&oracic%!x$#pey#.ught-provoking',
+    '"$rall#&eading%(teningly$"e-&*and-a-half&&storey%%pence$$sher#$ifty$%llers#(ogmorton$(mbolysis$#wer#!u"%umbed',
+    '#)nderbirds\'%storm#%rrock$"so"(ymocytes$"us!"ic#$kled"$dily$#ngs""ff$#any"\'ghtrope"!l##ing',
+    '#&isoara##man"%ngled#$kers#%nitus##sel"%p-off#&perary$"le#"sy"$rade"!s"#tch##hes##ian',
+    '#&ration#"us!"nf"!t!%o-day"%aster%#ing%!s"\'bermory##ias""ck"*getherness"$iled"&kugawa"#lby',
+    '#(lemarche"\'mbstone)!s#!e#$kins"\'ne-unit$!d#!g$\'ue-tied##ics#$nage"\'othless"\'p-level$"up#$most',
+    '##per$$ling"(rmenting#&pedoes#%rents#$sion#*toiseshell$!s$%uring""sh$#iki"*talization#!e#!s#&tering',
+    '#&ghened##lon##ted$#ing"\'wnsfolk%&people"+xoplasmosis#$teth!!p!"qm!(raceable%"ry$#hea#+ditionalist#\'idcraft',
+    '%#ing%"le#!n$*quillisers$)sactional%(cendence)!s&$ribe%#ept%*ferability&&ormers%$gene&\'ressive%$mits%%pires',
+    '%&sexual%\'ylvania#%pdoor#\'versing#"wl%"er"\'eadmill$&surers$%tises#&mulous#%ntham#(spassers#&velyan"#iad#)bulations',
+    '$$kery#$este##lby$&obites#$pled&"ts$"os$$pier#!s#$tium$"on"&ombone#$oped#)uble-free\'&makers',
+    '##ism#$mper%!s#&ncheon#$ssed"&ythall!!s"%ongas"%unami!#uan#$thal"%djman""ft""gs"#lip',
+    '"(mbleweed##ult"!n#%drish#%isian#\'nelling%!y"$rban##gid#$keys$(menistan#%n-off&"ut$#key"&telage',
+    '!$wain"$eeds"#ine$$kled$$ning#$rled#!t"&o-fold$%month$&seater%$tage##mey"%yford!%yburn"\'nemouth',
+    '$&script#$hoid#$ists#*ographical"(rannical##ell#$rell &u-boat!!.!"dr!"ff!&gandan!\'lterior#,rasonography$"ix',
+    '"%pteen!(nabashed%#ted#)cceptably%(ountable$*knowledged$!o#)nswerable#&shamed#\'ttached"&belief#(lemished$&inking#&ounded#&ridled',
+    '#&harted#(luttered#(ommitted&$only%(petitive&)rehending$\'nfirmed%(strained$)operative$#uth#)ritically#"ut"%dated#\'efeated$%r-age',
+    '%\'current%+development%&funded)#ing%$hand&#ill%%parts&)rivileged%%rated%%tones%&writer#)iminished$)sciplined%&guised%*tinguished',
+    '"\'earthly#%nding$&viable"\'failing$&stened#&eeling#)lattering#&ocused$\'rgiving#"pa"&gainly#*rammatical"&heeded#\'indered")initiated',
+    '$+tentionally$%vited#$plex#&tarian#\'versals\'"es"&justly"\'knowing)"ly&"ns"(labelled#$eash#\'icensed#&ocking$#ved',
+    '#\'odified$$ving"*obtainable"\'packing#*retentious$)oblematic%)fessional%#ven&$oked"+questioning"(ravelled#)ecognized&$rded$(servedly%\'trained',
+    '#&uffled")scheduled#&elfish#%igned#&miling#&poiled#%tated#,ubstantiated$(pervised$)stainable"#tac$$pped#%ested##ied$$tled',
+    '#$ried"%veils"&wisely$%tting#$ound!,p-and-coming"&coming"%front"&lifted"&rights$#ver"%stage""vc!!r"$anus',
+    '"%chins"(ethritis"\'okinase"-sodeoxycholic!(s&dollar)&;1,000"&-based#&soviet""af"!c"!k"!s"(urpation%"ed!(tilizing',
+    '"!f!\'xbridge!$zbek \'v&amp;a!".4!)accinated"&grants"%lance##dez#%entin$!t#$idly##ois#$uers"$ndal',
+    '"%pours"!r#%iceal%#ose$$scan"#sco#%eline#%tness""ts"!z!!c"!r!%ecchi##hey""ga',
+    '"\'llayati#$vety"&ndetta$#ing#\'eration$%tians$#zia#&turous"%rging#\'ifiable%$ying#$mont##sed#$tigo#\'ulamium',
+    '"#tch##ted!!g!"hf!\'ibrated"$cars#)e-captain&*hancellors%*presidents$#nte#)issitudes#*timisation"#dal#.eoconferencing%$disc',
+    '#\'wfinder"#lle"\'ndicate"&olates$$ette"&rginal##ile%#ity#\'tuosity"\'s-a-vis#\'ualised\'&zation&!s"\'triolic""va',
+    '##ian!"me"$w175!!o"&dafone"!e"#gel"\'iceless#%dable$!s"\'jvodina"\'latiles#$enti#%ition#\'leyball',
+    '"%mited"$odoo"!r#&acious"#uch!!r!"t2!"ue $waaf"%ddell#!i"#fer"$gged$"on"\'infleet',
+    '#\'tresses%#ose"#ken"\'lkabout$$ways##lop%$wing"#nda$&erings"&r-time#$bler\'!s$%urton#$ders#$enne',
+    '#$like$$ords#"ms#"ne$"ie##ton"%shers#\'tepaper"\'tchdogs#(er-based%&lilies%&stones##kin#$tana")vebreaker',
+    '"$xing#!y"%ybill#&marked!"bo!&eakens#!n$"ed#%rside#%thers##ves"%bbing$!s#%erian"$iner',
+    '"%lford#\'l-built%(designed&)ocumented&&rained%(educated%\'founded%+intentioned%)organised%$paid&%laced%\'stocked%\'trained$*ingborough"!n',
+    '"%ssels#)tinghouse"%tness!"fs!!g!&hacked#%dcoat#$lley#$tsit"$eeze#!y"%illan#&mpered$%sical#&ngeing',
+    '&\'painted%%haven%"ly%!r$#ish$\'tingham%"le\'!d%"on""oa#)le-school%\'hearted$(ly-owned#"op##rls',
+    '%\'tkeeper"!d##ens""gg#$more"%lcock%#xon#$dcat$#ing$$ness##kes#\'l-power$%esden$&ington$%power',
+    '#!t""mp"%ncing#$d-up$&ing-up$&owless&\'s-based$$surf(#ers#$gate$#ers#$king#%nipeg##sor#&terton',
+    '"%sbech##den#$eman$"st#"ps"\'thdraws$#ers$%stood"&zardry&!s#$ened!&obbled"&efully"\'kingham""ld',
+    '##ski"$mens")nderingly#!g"&odcock$$ford$$head$\'working\'!m#"ed##ing#$lton"!r#,d-processing,"or',
+    '$$less("ly#&kbench%#ook$$flow%%orces$&houses$\'ing-set\'#ton$$room$&sheets$#top#%n-out#(shipping$#ted',
+    '!&rangle#$pper##sse"#eak$$thed&!s#&nching##tch"#ing%#ing$%kling#\'stwatch#&te-off$#hed"(ongdoing',
+    '!!s!%yllie"#man""nn$!e"#vis +x-terminals!!1!)enophobia!%inhua!!s!"xx #yac"!h##weh',
+    '$!s#%omami"$sser$"ir"$xlee!)ear-round$$book$!n"#gor"!h"!k"%llows$!s"$omen"%rself',
+    '!&iddish"!n!%onder"$rick#\'k-based$!e%"rs$#ist"!w!$pres!*ugoslavian"!k"%ppies "z.!"ak',
+    '"#nde#%zibar""pt!(borowski!(ealander)!s$#ots"#min""no!#hao!"ia"$gzag"$mmer""on$#ist',
+    '"$mbie"$omed$#ing"#ser!#ulu',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_07 = (
+count_07 = 6695
+
+heads_07 = (
     '&bgr&ggr',
-    '&bgr;-',
-    '&bgr;2',
-    '&copy',
-    '&dollar;1.5',
-    '&dollar;12',
-    '&dollar;15,000',
-    '&dollar;150m',
-    '&dollar;20,000',
-    '&dollar;200,000',
-    '&dollar;20m',
-    '&dollar;25',
-    '&dollar;25,000',
-    '&dollar;250',
-    '&dollar;250,000',
-    '&dollar;2m',
     '&dollar;300,000',
-    '&dollar;4',
-    '&dollar;4,000',
-    '&dollar;500,000',
-    '&dollar;5m',
-    '&dollar;6',
-    '&dollar;600',
-    '&dollar;7',
-    '&dollar;700',
-    '&dollar;8',
-    '&dollar;800',
-    '&eacute;mile',
-    '&frac12;in.',
-    '&mdash;and',
-    '&mdash;see',
-    '&micro',
     '&micro;g/l',
-    '&ouml;vp',
-    '&pound;1,800',
-    '&pound;1.00',
-    '&pound;1.2m',
-    '&pound;1.3m',
-    '&pound;1.4',
-    '&pound;1.7',
-    '&pound;1.8',
-    '&pound;1.95',
-    '&pound;10.95',
-    '&pound;11,000',
-    '&pound;11.95',
-    '&pound;140,000',
-    '&pound;15.95',
-    '&pound;16,000',
     '&pound;16.95',
-    '&pound;19',
-    '&pound;1bn',
-    '&pound;2.00',
-    '&pound;2.25',
-    '&pound;2.95',
-    '&pound;2000',
-    '&pound;220',
-    '&pound;23',
-    '&pound;240',
-    '&pound;25m',
-    '&pound;27',
-    '&pound;275',
-    '&pound;29.99',
-    '&pound;3.00',
-    '&pound;3.25',
     '&pound;325',
-    '&pound;33',
-    '&pound;36',
-    '&pound;38',
-    '&pound;4.5',
-    '&pound;44',
-    '&pound;45,000',
-    '&pound;5.50',
-    '&pound;500m',
-    '&pound;55,000',
-    '&pound;7,500',
-    '&pound;7m',
-    '&pound;8.95',
-    '&pound;850',
-    '&pound;8m',
-    '&rgr',
     '&tgr',
-    '\'90',
-    '\'as',
-    '\'elp',
-    '\'ouse',
-    '*****',
-    '*new',
-    '-&bgr',
-    '-10',
-    '-5',
-    '/diploma',
-    '0&ndash;0',
-    '0.2%',
-    '0.9%',
-    '00',
-    '00:19',
     '00:20',
-    '00:21',
-    '00:40',
-    '0532',
-    '0891',
-    '0898',
-    '1(3)',
-    '1,500,000',
-    '1.',
-    '1.15',
-    '1.30pm',
-    '1.5m',
-    '10&deg',
-    '10&ndash;11',
-    '10-day',
-    '10.7',
     '10.8',
-    '100mm',
-    '1016',
-    '1024',
-    '10in',
-    '10lb',
-    '10pc',
-    '10s.',
-    '11&ndash;12',
-    '11-12',
-    '11.8',
-    '110,000',
-    '1150',
-    '12.4',
-    '1259',
-    '125g',
     '1297',
-    '12ft',
-    '12p',
-    '13.1',
-    '13.2',
-    '13.3',
-    '13.4',
-    '13.5',
-    '13.6',
-    '1330',
-    '1340',
-    '1377',
-    '1381',
-    '14.1',
-    '140,000',
-    '1470',
     '1470s',
-    '1475',
-    '15-16',
-    '15-year',
-    '15.1',
-    '1520',
-    '1522',
-    '1536',
-    '1542',
-    '1543',
-    '1545',
-    '1549',
-    '1550',
-    '1555',
-    '1580',
-    '1588',
     '1589',
-    '1597',
-    '15cm',
-    '15ml',
-    '16&ndash;19',
-    '16+',
-    '16.1',
-    '1601',
-    '1602',
-    '1604',
-    '1609',
-    '1610',
-    '1618',
-    '1621',
-    '1624',
-    '1625',
     '1626',
-    '1628',
-    '1630s',
-    '1638',
-    '1641',
-    '1643',
-    '1644',
-    '1647',
-    '1650s',
-    '1654',
-    '1655',
-    '1656',
-    '1658',
-    '1660s',
-    '1661',
-    '1665',
     '1667',
-    '1668',
-    '1672',
-    '1674',
-    '1679',
-    '1680',
-    '1680s',
-    '1682',
-    '1683',
-    '1690s',
-    '1691',
-    '1695',
-    '1696',
-    '1697',
-    '1698',
-    '1699',
     '16th-century',
-    '16v',
-    '17-year-olds',
-    '1703',
-    '1704',
-    '1709',
-    '1712',
-    '1716',
-    '1718',
-    '1719',
-    '1724',
-    '1725',
-    '1726',
-    '1728',
-    '1731',
-    '1732',
     '1734',
-    '1736',
-    '1740s',
-    '1741',
-    '1742',
-    '1743',
-    '1744',
-    '1748',
-    '1750s',
-    '1753',
-    '18-month',
-    '19&ins',
-    '1978a',
-    '1979b',
-    '1980&ndash;1',
-    '1980&ndash;81',
     '1980a',
-    '1982b',
-    '1983b',
-    '1984a',
-    '1984b',
-    '1985&ndash;6',
-    '1986b',
-    '1987/88',
-    '1988b',
-    '1990a',
-    '1993-94',
-    '1c',
-    '1cm',
-    '1mb',
-    '1min',
-    '1s.',
     '2&ins',
-    '2&ndash;2',
-    '2(3)',
-    '2,600',
-    '2-2',
-    '2.30pm',
-    '20&deg;c',
-    '20&ndash;25',
-    '20-minute',
-    '2003',
-    '2025',
-    '20ft',
-    '20mm',
-    '2200',
-    '2400',
-    '244',
     '247',
-    '253',
-    '25mm',
-    '263',
-    '264',
-    '266',
-    '269',
-    '27/10/93',
-    '279',
-    '282',
-    '283',
-    '284',
-    '285',
-    '293',
-    '294',
-    '296',
     '298',
-    '2:1',
-    '2c',
-    '2gb',
-    '2mb',
-    '3(2)',
-    '3.12',
-    '3.13',
-    '3.15',
-    '3.30pm',
-    '3.5%',
-    '3.5&ins',
-    '3/4',
-    '30&deg',
-    '307',
-    '308',
     '30ml',
-    '314',
-    '316',
-    '317',
-    '318',
-    '321',
-    '322',
-    '326',
-    '328',
-    '32nd',
-    '33,000',
-    '335',
-    '337',
-    '338',
-    '339',
-    '343',
     '345',
-    '355',
-    '356',
-    '357',
-    '35p',
-    '36&ins',
-    '36,000',
-    '36-year-old',
-    '362',
-    '363',
-    '366',
-    '367',
-    '371',
-    '372',
-    '376',
-    '38,000',
     '38-year-old',
-    '387',
-    '388',
-    '38th',
-    '394',
-    '395',
-    '396',
-    '3am',
-    '3c',
-    '3ft',
-    '3lb',
-    '3mm',
-    '3oz',
-    '4&ft',
-    '4&ins',
-    '4-5',
     '4.00',
-    '4.11',
-    '4.15',
-    '4.5%',
-    '40-year-old',
-    '402',
-    '403',
-    '408',
-    '409',
-    '413',
-    '418',
-    '423',
-    '429',
-    '42nd',
-    '43-year-old',
-    '432',
     '433',
-    '435',
-    '47-year-old',
-    '48&ins',
-    '4d.',
-    '4ft',
-    '5&ndash;2',
-    '5,500',
-    '5-0',
-    '5-2',
-    '5-6',
-    '5.00',
-    '5.10',
-    '5.30pm',
-    '50&ndash;50',
-    '50/50',
     '500th',
-    '501',
-    '50m',
-    '50pc',
-    '53%',
-    '540',
-    '560',
-    '59%',
-    '5am',
-    '5in',
-    '5mm',
-    '5s',
-    '6&ndash;0',
-    '6&ndash;9',
-    '6(1)',
-    '6-7',
     '6.00',
-    '6.10',
-    '601',
-    '60mph',
-    '60p',
-    '60th',
-    '61(1)',
-    '625',
-    '65,000',
-    '66%',
-    '685',
-    '69%',
-    '6am',
-    '7&ndash;8',
-    '7(4)',
-    '7,500',
     '7.',
-    '7.00',
-    '707',
-    '71%',
-    '720',
-    '73%',
-    '74%',
-    '740',
-    '750,000',
-    '75g',
-    '75g/3oz',
-    '75p',
-    '768',
-    '79%',
-    '7lb',
-    '8&ndash;9',
     '8(2)',
-    '8.',
-    '8.00',
-    '8.9',
-    '800m',
-    '80486-based',
-    '81%',
-    '84%',
-    '840',
-    '85,000',
-    '87%',
-    '88%',
-    '88110',
-    '8d.',
-    '8ft',
-    '8lb',
     '9&ins',
-    '9&ndash;1',
-    '9.00',
-    '9.30am',
-    '900,000',
-    '911',
-    '92%',
-    '94%',
-    '9in',
-    'a&amp;m',
-    'a.a.',
-    'a.g.',
-    'a66',
-    'abacus',
-    'abashed',
-    'abbe',
     'abbess',
-    'abdulkerim',
-    'aberdeenshire',
-    'abergavenny',
-    'abie',
-    'abingdon/oxfordshire',
-    'abkhazia',
-    'ablation',
-    'abomination',
-    'above-average',
-    'abridged',
-    'abrogated',
-    'abscess',
-    'abscesses',
-    'absent-minded',
-    'absent-mindedly',
     'absolutes',
-    'absolutism',
-    'abstaining',
-    'abstracting',
-    'absurdities',
-    'abta',
-    'abul',
-    'ac-asa',
-    'acanthus',
-    'accademia',
-    'accelerators',
-    'accented',
-    'accompaniments',
-    'accomplishing',
-    'accosted',
-    'achievers',
     'acidified',
-    'ackner',
-    'acorns',
-    'acp',
-    'acquaint',
-    'acquit',
-    'actinomycin',
-    'activators',
-    'actus',
-    'acuity',
-    'adamantly',
-    'adapter',
-    'add-in',
-    'addams',
-    'adder',
-    'addictions',
     'adduce',
-    'adenoidectomy',
-    'adenoma',
-    'adenylate',
-    'adhesives',
-    'adkin',
-    'admirals',
-    'admittance',
-    'admonition',
-    'adn',
-    'adolfo',
-    'adonis',
-    'adorning',
-    'adornment',
-    'adp',
-    'advantaged',
     'adverbial',
-    'aeg',
-    'aeneas',
-    'aeons',
-    'aerodynamics',
-    'afc',
-    'affidavits',
-    'affix',
-    'afflict',
-    'afghans',
-    'aficionados',
-    'afp',
-    'afpfl',
-    'afrikaner',
-    'afro',
-    'after-care',
     'after-effects',
-    'after-sales',
-    'age-groups',
-    'age-related',
-    'ageist',
-    'agence',
-    'aggressors',
-    'agincourt',
-    'agitators',
-    'agonist',
-    'agonized',
-    'agr',
-    'agra',
-    'ahem',
-    'ahilar',
-    'aigburth',
     'ainslie',
-    'airbrake',
-    'airflow',
-    'airless',
-    'airlifted',
-    'airmail',
-    'airworthiness',
-    'airworthy',
-    'ajayi',
-    'al-din',
-    'alabaster',
-    'alamein',
-    'alasdair',
-    'alban',
-    'alchemist',
-    'alcohol-free',
     'aldeburgh',
-    'aldermaston',
-    'aldermen',
-    'alderson',
-    'aldfrith',
-    'aldhelm',
-    'aldo',
-    'aldous',
-    'aldrich',
-    'alerts',
-    'alessandro',
-    'alfoxden',
-    'algy',
-    'alianor',
-    'aline',
-    'aliquots',
     'alkalinity',
-    'all-clear',
-    'all-day',
-    'all-in-one',
-    'all-ireland',
-    'all-union',
-    'allayed',
-    'allegro',
-    'alleviation',
-    'allocative',
-    'alluding',
-    'alnwick',
-    'aloofness',
-    'alot',
-    'altercation',
-    'alternated',
     'alternator',
-    'altman',
-    'altos',
-    'alun',
-    'alveolar',
-    'alvey',
-    'amabel',
-    'amalgamate',
-    'amalgamations',
-    'amalgamemnon',
-    'amass',
-    'amassing',
-    'amato',
-    'amazes',
-    'amble',
-    'ambulancemen',
     'amd',
-    'ameliorate',
-    'amery',
-    'amines',
-    'amniocentesis',
-    'amoco',
-    'amoral',
-    'ampeg',
-    'amphibian',
-    'amundsen',
-    'amyloid',
-    'anaesthetics',
-    'anaesthetist',
-    'analgesics',
-    'anand',
-    'anaphor',
     'anaphora',
-    'anaphoric',
-    'anaximander',
-    'andalusia',
-    'andersonstown',
-    'andersson',
-    'andorra',
-    'android',
-    'anerley',
-    'angelfish',
-    'angers',
-    'angioplasty',
-    'angiotensin',
-    'anglais',
-    'anglicanism',
-    'anglo-catholic',
     'angoul&ecirc;me',
-    'angrier',
-    'anions',
-    'anlt',
-    'annes',
-    'annihilate',
-    'annuities',
-    'annulment',
-    'annunciation',
-    'annunziata',
-    'anointing',
-    'anon',
-    'anoraks',
-    'anson',
-    'answerphone',
-    'antagonise',
     'antagonisms',
-    'antall',
-    'ante-natal',
-    'anthologies',
-    'anthropomorphic',
-    'anti-clockwise',
-    'anti-drug',
-    'anti-inflation',
-    'anti-lock',
-    'anti-pollution',
-    'anti-trust',
-    'anti-virus',
-    'antibacterial',
-    'anticlockwise',
-    'antidepressants',
-    'antineutrophil',
     'antioch',
-    'antiquaries',
-    'antisera',
-    'antiserum',
-    'antisocial',
-    'antithetical',
-    'aoc',
-    'apertures',
-    'apgpr',
-    'aphrodite',
-    'aplin',
-    'apogee',
-    'apologizing',
-    'apothecaries',
-    'apotheosis',
-    'apparatuses',
     'appellation',
-    'append',
-    'appendage',
-    'appendicitis',
-    'applauding',
-    'apportion',
-    'apprehensions',
-    'apprenticeships',
-    'approbation',
-    'appropriations',
-    'approximates',
-    'approximating',
-    'aptitudes',
-    'aqib',
-    'aqua',
-    'aquamarine',
     'ara',
-    'arazi',
-    'arbitrariness',
-    'arbitrations',
-    'arboretum',
-    'arbour',
-    'archangel',
-    'archbishopric',
-    'archetype',
-    'archimedes',
-    'archly',
-    'archways',
-    'arco',
-    'areal',
-    'arens',
-    'arghatun',
     'argyrophil',
-    'aristophanes',
-    'arithmetical',
-    'arkle',
-    'arles',
-    'arlington',
-    'arlott',
-    'armageddon',
-    'armand',
-    'arming',
-    'arnhem',
-    'aromas',
-    'arouses',
-    'arp',
-    'arrogantly',
-    'arsenals',
     'artichokes',
-    'artificiality',
-    'artworks',
-    'aryan',
-    'asfv',
-    'ashe',
-    'asher',
-    'ashleys',
-    'ashok',
-    'asides',
-    'askance',
-    'aspen',
-    'aspires',
-    'asses',
-    'assessable',
-    'assimilating',
     'assizes',
-    'associability',
-    'assuage',
-    'assuaged',
-    'assuredly',
-    'asteroids',
-    'astral',
-    'astrological',
-    'astrophysics',
-    'asturias',
-    'atc',
-    'atenolol',
-    'atherosclerosis',
-    'atkin',
-    'atm',
-    'atoll',
     'atomistic',
-    'atropine',
-    'att',
-    'attainers',
-    'attains',
-    'attenders',
-    'attests',
-    'attics',
-    'attila',
-    'au_pair',
-    'aubergine',
-    'aubergines',
-    'audibly',
-    'auditioning',
-    'aught',
-    'augmentation',
     'augsburg',
-    'augustinian',
-    'augusto',
-    'aurae',
-    'aurangzeb',
-    'auspex',
-    'aust',
-    'austria-hungary',
-    'austro-hungarian',
-    'authentically',
-    'authoritatively',
-    'automate',
-    'automaton',
-    'autoradiography',
-    'auxerre',
-    'avant_garde',
     'avarice',
-    'averting',
-    'avitus',
-    'awnings',
-    'awoken',
-    'axelrod',
-    'axles',
-    'axon',
-    'ayling',
-    'ayodhya',
-    'ayres',
-    'azaleas',
-    'aztec',
-    'b&amp;b',
-    'b&eacute;r&eacute;govoy',
-    'b.e.t.',
     'b5',
-    'bacilli',
-    'bacillus',
-    'back-bench',
-    'back-benchers',
-    'backfire',
-    'backroom',
-    'bacteriological',
-    'baden-powell',
-    'baffle',
-    'bafta',
-    'bagshaw',
-    'bailie',
-    'bains',
-    'bakker',
-    'bala',
     'balance-of-payments',
-    'balanchine',
-    'balcombe',
-    'baldly',
-    'baldock',
-    'ballard',
-    'ballpoint',
-    'ballycastle',
-    'balzac',
-    'bambi',
-    'bandied',
-    'bandstand',
-    'bangers',
-    'bangles',
-    'banishing',
-    'banishment',
     'bann',
-    'banque',
-    'banstead',
-    'bantu',
-    'bao',
-    'baptismal',
-    'barb',
-    'barbour',
-    'barbra',
-    'barclaycard',
-    'bardot',
-    'bardsley',
-    'barest',
-    'barged',
-    'barging',
-    'barnardo',
     'barra',
-    'barricaded',
-    'bashir',
-    'basinger',
-    'basra',
-    'bassetlaw',
-    'basten',
-    'bastille',
-    'bate',
-    'bathers',
-    'batons',
-    'battlefields',
-    'battleships',
-    'bauer',
-    'bauxite',
-    'bawling',
     'bayezid',
-    'bayfield',
-    'bayley',
-    'bazaars',
-    'bd',
-    'beachy',
-    'beading',
-    'beady',
-    'beakers',
-    'beasant',
-    'beater',
-    'beaters',
-    'beaujolais',
-    'beaux',
-    'beaux-arts',
-    'beavers',
     'bebington',
-    'beckford',
-    'beckons',
-    'beckwith',
-    'bedale',
-    'bedchamber',
-    'beddington',
-    'bedstead',
-    'bedworth',
-    'beeching',
-    'beeston',
-    'beeswax',
-    'befallen',
-    'befell',
-    'befitted',
-    'begrudge',
     'beholden',
-    'beith',
-    'belch',
-    'belgrave',
-    'belittle',
-    'belladonna',
-    'bellingham',
-    'beloff',
-    'belting',
-    'belvoir',
-    'bemoaning',
-    'benazir',
-    'benbecula',
-    'bence',
-    'bender',
-    'benedetti',
     'benediction',
-    'beneficent',
-    'benefices',
-    'benefitted',
-    'benighted',
-    'benignly',
-    'beregovoy',
-    'berenice',
-    'beretta',
-    'bergerac',
-    'berghaus',
-    'berkley',
-    'berliner',
-    'berlioz',
-    'berlusconi',
-    'bern',
     'bernardo',
-    'berndt',
-    'bernini',
-    'berwickshire',
-    'bessmertnykh',
-    'bestial',
-    'bestowing',
-    'betide',
-    'betrothal',
-    'better-known',
-    'bettered',
-    'betters',
-    'bexley',
-    'bharatiya',
-    'bhopal',
-    'bhp',
     'bhutan',
-    'bi-monthly',
-    'bicc',
-    'bicentenary',
-    'bide',
-    'biding',
-    'bidirectional',
-    'bidwell',
-    'biffen',
-    'bifida',
-    'big-time',
-    'biggin',
-    'bigorre',
-    'bigoted',
-    'bilingualism',
-    'bilirubin',
     'billboard',
-    'billeting',
-    'billingsley',
-    'billionaire',
-    'billowed',
-    'binaries',
-    'binders',
-    'bing',
-    'biotic',
-    'bipartisan',
-    'biplane',
-    'birches',
-    'bird-watching',
-    'birkdale',
-    'birse',
-    'bishoprics',
     'bison',
-    'bissett',
-    'bitchy',
-    'bitter-sweet',
-    'bivalves',
-    'bivouac',
-    'biya',
-    'bizarrely',
-    'blackbeard',
-    'blackest',
-    'blackmailed',
-    'blackmailing',
-    'blackstone',
-    'blackwood',
-    'bladders',
-    'blaenau',
     'blaine',
-    'blakelock',
-    'blancs',
-    'blanked',
-    'blazes',
-    'bleary',
-    'bleasdale',
-    'bleating',
-    'bleeds',
-    'blenkinsop',
-    'bleomycin',
-    'blockaded',
-    'blockers',
-    'blois',
-    'blood-pressure',
-    'blood-stained',
     'bloodthirsty',
-    'bloomed',
-    'blotched',
-    'blotches',
-    'blotchy',
-    'blotter',
-    'blue-black',
-    'blue-grey',
-    'bluebird',
-    'bluffing',
-    'bluish',
-    'blurb',
-    'blusher',
-    'blushes',
-    'blustering',
-    'blyton',
     'bmk',
-    'boa',
-    'boarding-school',
-    'boastful',
-    'bobbies',
-    'bobbin',
-    'boddy',
-    'bode',
-    'bodied',
-    'bodin',
-    'boffins',
-    'bogeyman',
-    'bogota',
-    'bohr',
-    'boiotia',
-    'bolinger',
     'bolshevism',
-    'bolshoi',
-    'boltzmann',
-    'bonard',
-    'bondgate',
-    'boned',
-    'bongo',
-    'bonnard',
-    'bonnets',
-    'bonsai',
-    'boobs',
-    'book-keeping',
-    'bookie',
-    'bookkeeping',
-    'bookmaker',
-    'boos',
     'boothroyd',
-    'borrowdale',
-    'bosanquet',
-    'bosnians',
-    'bot',
-    'botched',
-    'bottlenecks',
-    'boucher',
-    'boudoir',
-    'bountiful',
-    'bourn',
-    'bovary',
-    'bovril',
-    'bowring',
-    'boycotting',
-    'boyo',
     'bpx',
-    'br&uuml;ckner',
-    'brabham',
-    'bracewell',
-    'bracketed',
-    'bradwell',
-    'braemar',
-    'bragad',
-    'brainstorming',
-    'brainy',
-    'bramall',
-    'bramley',
-    'brassard',
-    'brasses',
-    'brassy',
-    'braver',
     'braverman',
-    'bravest',
-    'bravura',
-    'brazilians',
-    'brdu',
-    'breadth-first',
-    'breakfasted',
-    'breakout',
-    'breakspear',
-    'breakthroughs',
-    'breast-feeding',
-    'breathable',
-    'bren',
-    'brenner',
-    'brews',
-    'brewster',
     'bribing',
-    'bric-a-brac',
-    'brice',
-    'brick-built',
-    'bridgeman',
-    'bridgnorth',
-    'bridgwater',
-    'bridled',
-    'bridles',
-    'brie',
-    'brigham',
-    'brindle',
-    'bristly',
-    'britain\'',
-    'britannica',
-    'british-born',
     'britt',
-    'brize',
-    'brm',
-    'bro',
-    'broadleaved',
-    'broadmoor',
-    'broadstairs',
-    'broca',
-    'brock',
-    'broderick',
-    'brogues',
-    'bronx',
-    'broods',
-    'broomfield',
-    'brooms',
-    'broomstick',
     'brunette',
-    'brut',
-    'bryson',
-    'bsi',
-    'btr',
-    'buccal',
-    'buccleuch',
-    'buckling',
-    'budd',
-    'buddhists',
-    'buddies',
-    'buffaloes',
-    'bugging',
-    'buick',
-    'bulldozed',
-    'buller',
     'bullseye',
-    'bunce',
-    'bundespost',
-    'bundling',
-    'bungay',
-    'bungled',
-    'bungling',
-    'bunn',
-    'bunty',
-    'buoys',
-    'bureaus',
-    'burghers',
-    'burgundian',
-    'burmah',
-    'burnside',
-    'burnt-out',
     'burrell',
-    'burrowed',
-    'bursaries',
-    'bursary',
-    'bus-stop',
-    'busting',
-    'butlins',
-    'buts',
-    'butted',
-    'buttermere',
-    'buttonhole',
-    'buttressed',
-    'butyrate',
-    'buy-in',
-    'by-passed',
-    'bye-laws',
     'byelorussia',
-    'bypasses',
-    'c.b.',
-    'cabbie',
-    'cabochon',
-    'cabra',
-    'caches',
-    'cackle',
-    'cackled',
-    'caddis',
-    'caddying',
-    'cade',
-    'cadence',
-    'caerphilly',
-    'caesarian',
-    'cafod',
     'cagey',
-    'cagliari',
-    'cahill',
-    'cairngorm',
-    'cajole',
-    'cajoled',
-    'cajun',
-    'calatin',
-    'caldaire',
-    'calgary',
-    'callinicos',
-    'callum',
-    'calmodulin',
-    'calvinism',
-    'camber',
-    'camberley',
     'cambs',
-    'cameos',
-    'cameroun',
-    'cammell',
-    'camomile',
-    'campers',
-    'campo',
-    'campra',
-    'canaan',
-    'canaletto',
-    'cancellations',
-    'cancels',
-    'candelabra',
-    'candlelit',
-    'cann',
-    'cannibal',
     'cannoned',
-    'cantata',
-    'cantons',
-    'cap\'n',
-    'caper',
-    'capes',
-    'capetian',
-    'cappella',
-    'capsaicin',
-    'capsized',
-    'captivating',
-    'carbide',
-    'carburettor',
-    'carcase',
-    'carcases',
-    'cardia',
     'careered',
-    'careering',
-    'caribou',
-    'caricatures',
-    'carlotta',
-    'carly',
-    'carnaby',
-    'carnitine',
-    'carnivore',
-    'carr&eacute',
-    'carradine',
-    'carruthers',
-    'carshalton',
-    'carte_blanche',
-    'carters',
-    'carthage',
     'cartland',
-    'carvers',
-    'cas',
-    'case-study',
-    'cased',
-    'casein',
-    'cashflow',
-    'cashman',
-    'casseroles',
-    'castells',
-    'castelnau',
-    'casualness',
-    'caswell',
-    'cataclysmic',
-    'cataracts',
-    'catarrh',
     'catastrophes',
-    'catcher',
-    'catchphrase',
-    'cathay',
-    'cati',
-    'caudal',
-    'cauthen',
-    'cautioning',
-    'cavalcade',
-    'cavan',
-    'caveman',
-    'caving',
-    'caxton',
-    'cayman',
-    'ccc',
-    'ccw',
     'cdnas',
-    'cease-fire',
-    'ceaselessly',
-    'cec',
-    'ced',
-    'cedars',
-    'cede',
-    'ceilidh',
-    'celie',
-    'cellnet',
-    'cellos',
-    'cementation',
-    'censorious',
-    'censors',
-    'censured',
-    'centaur',
     'centralising',
-    'centralism',
-    'centrifuge',
-    'centuries-old',
-    'cftr',
-    'cga',
-    'ch\'i',
-    'chafing',
-    'challis',
-    'chamonix',
-    'chancellery',
-    'chandon',
-    'changer',
-    'channon',
-    'chansons',
-    'chaovalit',
     'chaplaincy',
-    'chappie',
-    'characterising',
-    'chard',
-    'chargee',
-    'charlene',
-    'charleroi',
-    'charlwood',
-    'charsky',
-    'chartist',
-    'chater',
-    'chattel',
-    'chatterley',
-    'chauffeur-driven',
-    'cheadle',
-    'check-in',
     'checker',
-    'cheekily',
-    'cheele',
-    'cheerless',
-    'cheng',
-    'cherub',
-    'chesney',
-    'chevalier',
-    'chez',
-    'chieh',
-    'child-bearing',
-    'child-centred',
-    'childminder',
-    'chills',
-    'chilterns',
-    'chimera',
     'chimp',
-    'chinatown',
-    'chingford',
-    'chippendale',
-    'chippendales',
-    'chippenham',
-    'chippings',
-    'chisels',
-    'chit',
-    'chivalrous',
-    'chlorinated',
-    'cholangiopancreatography',
-    'cholecystokinin',
-    'cholesteryl',
-    'choo',
-    'choosy',
     'chopra',
-    'choreographic',
-    'chp',
-    'christmases',
-    'chs',
-    'chu',
-    'chuckles',
-    'chutes',
-    'chutney',
-    'ciba-geigy',
-    'cicadas',
-    'cics/6000',
-    'cinders',
-    'cinque',
-    'cinzia',
-    'ciob',
     'cipher',
-    'circuitous',
-    'circulates',
-    'circumcised',
-    'circumvented',
-    'cisplatin',
-    'citibank',
-    'citicorp',
-    'citrate',
-    'citro&euml;n',
-    'civilising',
-    'civitas',
-    'clairol',
-    'clams',
-    'clancy',
-    'clanging',
     'clarifies',
-    'clarinets',
-    'class-based',
-    'classificatory',
-    'cle',
-    'clean-shaven',
-    'cleanest',
-    'cleanser',
-    'cleary',
-    'cleaved',
-    'clemency',
-    'clemens',
-    'clerestory',
-    'clermont',
-    'cleverest',
-    'cley',
     'cliff-top',
-    'climactic',
-    'climatology',
-    'clink',
-    'clods',
-    'close-ups',
-    'closed-loop',
-    'clotted',
-    'clouding',
-    'clowning',
-    'cloying',
-    'clubbed',
-    'cluny',
-    'cm.',
-    'cmea',
-    'cmnd',
     'cmnd.',
-    'cnes',
-    'co-existence',
-    'co-pilot',
-    'coagulation',
-    'coal-mining',
-    'coalesce',
-    'coalescence',
-    'coalification',
-    'coarsely',
-    'coaster',
-    'coastguards',
-    'coastlines',
-    'coatbridge',
-    'cobb',
-    'cobbett',
     'cobweb',
-    'cock-up',
-    'cocking',
-    'cockroach',
-    'coco',
-    'cocom',
-    'cocooned',
-    'coda',
-    'code-named',
-    'codesa',
-    'codling',
-    'coerce',
-    'coffee-table',
-    'cog',
-    'cogs',
-    'cohesiveness',
     'cohse',
-    'coiling',
-    'coire',
-    'col.-gen',
-    'coldfield',
-    'coldstream',
-    'coldwater',
-    'coll',
-    'collaborations',
-    'collages',
-    'collation',
-    'collectable',
-    'collectivity',
-    'collegiality',
-    'collett',
-    'colley',
     'collin',
-    'collusive',
-    'colm',
-    'colnaghi',
-    'colonels',
-    'colosseum',
-    'colossus',
-    'colquhoun',
-    'columnists',
-    'colvin',
-    'comely',
-    'comfortingly',
-    'commercialisation',
-    'commercialization',
-    'commissariat',
-    'communique',
     'comoros',
-    'companionable',
-    'compasses',
-    'compatriot',
-    'compels',
-    'compensates',
-    'competency',
-    'compilations',
-    'complacently',
-    'complainants',
-    'completions',
-    'comprehensiveness',
-    'compunction',
-    'conan',
-    'conceited',
-    'conceives',
     'conceptualized',
-    'concisely',
-    'concoction',
-    'concurrence',
-    'condense',
-    'conditionally',
-    'condoning',
-    'coney',
-    'conferencing',
-    'confidante',
-    'config.sys',
-    'configure',
-    'conformance',
-    'conformational',
-    'conformist',
-    'conglomeration',
     'congratulation',
-    'congregated',
-    'congregationalists',
-    'conjugate',
-    'conjugated',
-    'conker',
-    'connectives',
-    'connexion',
-    'conning',
-    'connoisseurs',
-    'conor',
-    'conscript',
-    'conservatively',
-    'conservatories',
-    'conservators',
-    'consign',
     'conspire',
-    'constitutionality',
-    'constriction',
-    'constructivist',
-    'constructors',
-    'consul-general',
-    'consuls',
-    'consumables',
-    'contaminating',
-    'contemnor',
-    'contentions',
-    'contestable',
-    'contestant',
-    'context-specificity',
-    'continuo',
-    'contoured',
     'contraband',
-    'contractile',
-    'contractually',
-    'contralto',
-    'contravening',
-    'contrite',
-    'contrivance',
-    'conversing',
-    'conveyancers',
-    'convinces',
-    'convulsed',
-    'convulsive',
-    'coo',
-    'cooed',
-    'cooing',
-    'cookbook',
     'cookies',
-    'coolies',
-    'coombes',
-    'coop',
-    'cooperated',
-    'coote',
-    'copiously',
-    'copley',
-    'coprocessor',
-    'copt',
-    'copulation',
-    'copyrights',
-    'corazon',
-    'corbyn',
-    'cordelia',
-    'corden',
     'cordially',
-    'cordillera',
-    'cordoned',
-    'corker',
-    'cormac',
-    'cormorants',
-    'cornea',
-    'cornford',
-    'cornices',
-    'corny',
-    'correspondences',
-    'corrigan',
-    'corroborated',
-    'corroboration',
-    'corsair',
-    'corsets',
     'corso',
-    'corticosteroids',
-    'cortot',
-    'cosmas',
-    'cossiga',
-    'costello',
-    'cosworth',
-    'cote',
-    'cotherstone',
-    'coton',
-    'cottagers',
-    'coulson',
-    'counsellees',
-    'counsels',
-    'counter-culture',
-    'counterpane',
     'countrywide',
-    'couplets',
-    'courageously',
-    'courgette',
-    'courmont',
-    'courtesies',
-    'courthouse',
-    'covariance',
-    'coverlet',
-    'cowdrey',
-    'cowes',
-    'cowl',
-    'cowper',
-    'coxswain',
-    'cpa',
-    'cpcz',
     'cpl',
-    'cpm',
-    'cprs',
-    'cps',
-    'cpv',
-    'cr&ecirc;pe',
-    'cr&egrave;me',
-    'craddock',
-    'crampons',
-    'crangle',
-    'cranial',
-    'craning',
-    'cranks',
-    'cranky',
-    'crannies',
-    'cravat',
     'cravings',
-    'craxi',
-    'crayon',
-    'creamed',
-    'credulity',
-    'creeds',
-    'creepers',
-    'creme',
-    'crepe',
-    'cretan',
-    'crevice',
-    'crewed',
-    'crewman',
-    'crewmen',
-    'crier',
-    'criminologists',
     'cringed',
-    'crinkly',
-    'crispy',
-    'criss-cross',
-    'cristiani',
-    'croaking',
-    'crocus',
-    'crocuses',
-    'croissants',
-    'crone',
-    'cronin',
-    'cross-examined',
-    'cross-spar',
-    'crothers',
-    'crowbar',
-    'crowninshield',
     'crozier',
-    'cruciform',
-    'cruder',
-    'crufts',
-    'cruickshank',
-    'crumbles',
-    'crumlin',
-    'crus',
-    'crusoe',
-    'crystal-clear',
-    'crystallize',
-    'crystallographic',
-    'cubists',
-    'cuddles',
-    'cuellar',
-    'culkin',
     'culminates',
-    'culpability',
-    'culvert',
-    'cumin',
-    'cumming',
-    'cumulus',
-    'cupola',
-    'curatorial',
-    'curdle',
-    'curds',
-    'curiosities',
-    'curtailing',
-    'curvilinear',
-    'custom-built',
-    'cutback',
-    'cutty',
     'cy',
-    'cymbals',
-    'cypriots',
-    'cyrene',
-    'cysts',
-    'cytomegalovirus',
-    'd&uuml;sseldorf',
-    'd\'art',
-    'd\'s',
-    'd-day',
-    'd-mark',
-    'd3',
-    'd4',
-    'd5',
-    'dabbing',
-    'dabble',
     'dabbled',
-    'dacha',
-    'dadda',
-    'dagmar',
-    'daintily',
-    'daiwa',
-    'dakar',
-    'dalby',
-    'dall',
-    'dallam',
-    'dalradian',
-    'damiani',
-    'damped',
-    'dandruff',
-    'dangerfield',
-    'dangle',
     'dann',
-    'dannii',
-    'dans',
-    'dark-eyed',
-    'darkroom',
-    'darned',
-    'darnell',
-    'darrell',
-    'dartington',
-    'data-base',
-    'datable',
-    'dataquest',
-    'dataset',
-    'datum',
-    'daunbey',
-    'dauphin',
     'daventry',
-    'davos',
-    'dawg',
-    'dawkins',
-    'daydream',
-    'dcsls',
-    'ddt',
-    'de_luxe',
-    'deadpan',
-    'deano',
-    'dearlove',
-    'death-bed',
-    'debauchery',
-    'debited',
-    'debonair',
-    'decibels',
     'decoded',
-    'decomposing',
-    'decrement',
-    'deducting',
-    'deep-set',
-    'defaced',
-    'defaulted',
-    'defaulters',
-    'defeatist',
-    'defections',
-    'defector',
-    'definitional',
-    'deflate',
-    'deflecting',
-    'deformities',
-    'defrost',
     'deg',
-    'degenerative',
-    'delaunay',
-    'delaware',
-    'delft',
-    'deli',
-    'delightedly',
-    'delighting',
-    'delimited',
-    'delineate',
-    'delineation',
-    'delle',
-    'delved',
-    'demi',
-    'demirel',
-    'demobilization',
     'democritus',
-    'demoralized',
-    'demur',
-    'denims',
-    'dennison',
-    'denominated',
-    'dens',
-    'dentdale',
-    'dentine',
-    'dentistry',
-    'dentures',
-    'denuded',
-    'denunciations',
-    'deodorant',
-    'deop2',
-    'depardieu',
     'dependencies',
-    'depictions',
-    'deploring',
-    'deportations',
-    'depositions',
-    'depositor',
-    'depreciated',
-    'deprivations',
-    'deprives',
-    'dere',
-    'deregulated',
-    'dermatitis',
-    'descriptor',
-    'desecration',
-    'deserters',
-    'designating',
     'designations',
-    'deskside',
-    'despising',
-    'despondently',
-    'despot',
-    'dessie',
-    'destabilise',
-    'destabilising',
-    'destabilize',
-    'destinies',
-    'destitution',
-    'deteriorates',
-    'detonation',
-    'deutsch',
-    'deux',
-    'devenish',
     'deviants',
-    'deviated',
-    'devotee',
-    'devotions',
-    'dewi',
-    'dewsbury',
-    'dfc',
-    'dhac',
-    'dhaka',
-    'diaspora',
-    'diatom',
-    'dibble',
-    'dickhead',
-    'dickon',
-    'dicky',
-    'dictators',
     'dido',
-    'die-hard',
-    'dielectric',
-    'dieulafoy',
-    'differentially',
-    'diffidently',
-    'digestible',
-    'digests',
-    'digitized',
-    'digression',
-    'dili',
-    'diluting',
-    'dimitri',
-    'dimitrov',
-    'dinamo',
-    'dingle',
     'dinkins',
-    'dinky',
-    'diodorus',
-    'dion',
-    'dionysius',
-    'diphe',
-    'disable',
-    'disadvantageous',
-    'disapprovingly',
-    'disarmingly',
-    'disbanding',
-    'disbelieve',
-    'disbelievingly',
-    'discernment',
-    'discharger',
-    'discomfiture',
     'disconsolate',
-    'discontents',
-    'discourages',
-    'discoverer',
-    'discrediting',
-    'discriminates',
-    'disembarked',
-    'disenfranchised',
-    'disengage',
-    'disengaged',
-    'disengagement',
-    'disharmony',
-    'dishing',
-    'dishwashers',
-    'disincentives',
-    'disinfectants',
     'disinterest',
-    'disliking',
-    'disobey',
-    'disobeyed',
-    'disowned',
-    'disparagingly',
-    'dispensary',
-    'displacements',
-    'disproved',
-    'disqualify',
-    'disrespectful',
-    'diss',
-    'dissect',
-    'dissertations',
-    'dissonant',
-    'dissuaded',
     'distemper',
-    'distended',
-    'distilleries',
-    'distilling',
-    'distractedly',
-    'distributable',
-    'disulphate',
-    'ditching',
-    'dithered',
-    'ditton',
-    'diva',
-    'diverging',
-    'divest',
-    'divested',
-    'divestment',
-    'divorcee',
     'divorcing',
-    'dizzying',
-    'dk',
-    'dmitri',
-    'dmitry',
-    'dobbs',
-    'docker',
-    'dockland',
-    'doctored',
-    'doctoring',
-    'documenta',
-    'dod',
-    'dodds',
-    'dodo',
-    'doggie',
-    'dolan',
     'doleful',
-    'domenico',
-    'dominica',
-    'dona',
-    'donaghy',
-    'donington',
-    'donning',
-    'donny',
-    'donoghue',
-    'doomsday',
-    'doormat',
-    'dopamine',
-    'doping',
-    'doran',
-    'dordogne',
-    'dore',
     'dorking',
-    'dorling',
-    'dormer',
-    'dortmund',
-    'doting',
-    'dottie',
-    'double-breasted',
-    'double-decker',
-    'double-edged',
-    'double-sided',
-    'doughnuts',
-    'dowie',
-    'dowling',
-    'downey',
-    'downpipe',
-    'downy',
     'dowsing',
-    'doyen',
-    'dozy',
-    'dragoon',
-    'drainpipe',
-    'drapers',
-    'dreamers',
-    'drenching',
-    'dressmaking',
-    'drexel',
-    'drift-nets',
-    'droit',
-    'droll',
-    'droned',
-    'drones',
-    'droning',
     'drooling',
-    'drop-in',
-    'dross',
-    'droughts',
-    'drowsiness',
-    'drucker',
-    'drummers',
-    'drunkard',
-    'dt',
-    'duart',
-    'dubrovnik',
-    'ducklings',
-    'dud',
-    'duffel',
-    'duffield',
-    'dugout',
     'dukeries',
-    'dul&eacute',
-    'dulcie',
-    'duller',
-    'dumbly',
-    'dunblane',
-    'dundonald',
-    'dungarvan',
-    'dunham',
-    'dunhill',
-    'dunkeld',
-    'duns',
-    'duodenitis',
-    'duopoly',
-    'duplicates',
-    'durations',
     'durbeyfield',
-    'durkin',
-    'duval',
-    'dvi',
-    'dw',
-    'dwarves',
-    'dwells',
-    'dwindle',
-    'dx',
-    'dysfunctional',
-    'dyspepsia',
-    'dyspnoea',
-    'e.g',
-    'e.r.',
-    'eadmer',
-    'eames',
     'eamon',
-    'earnestness',
-    'earnings-related',
-    'earpiece',
-    'earring',
-    'earthed',
-    'earthen',
-    'easels',
-    'easements',
-    'easingwold',
-    'easy-to-use',
-    'eavesdrop',
-    'ebbing',
-    'ebenezer',
-    'ecgberht',
-    'echinoderms',
     'ecj',
-    'eclecticism',
-    'eclipses',
-    'ecole',
-    'ecologist',
-    'ecus',
-    'edam',
-    'educator',
-    'effector',
-    'effeminate',
-    'efficacious',
-    'effigies',
-    'eggshell',
-    'eglinton',
-    'eglr',
-    'egocentric',
     'egotistical',
-    'eider',
-    'eiderdown',
-    'eigenvalue',
-    'eiger',
-    'eight-hour',
-    'eight-thirty',
-    'eighteen-year-old',
-    'eis',
-    'elaborating',
-    'elan',
-    'elbe',
-    'eldon',
-    'electorally',
-    'electorates',
-    'electrochemical',
     'elegiac',
-    'elegy',
-    'eleven-year-old',
-    'eleventh-century',
-    'elixir',
-    'ellery',
-    'ellipses',
-    'elspeth',
-    'elsworth',
-    'eltham',
-    'elucidated',
-    'eluted',
-    'emanates',
-    'emancipated',
-    'embalmed',
-    'emboldened',
     'emeritus',
-    'emigrant',
-    'emigrating',
-    'emissaries',
-    'emmeline',
-    'emmerdale',
-    'emoluments',
-    'empowers',
-    'encapsulates',
-    'enchantments',
-    'encloses',
-    'encroach',
-    'encroachments',
-    'encumbered',
-    'endear',
-    'endeared',
     'endearment',
-    'endotoxin',
-    'endures',
-    'enemas',
-    'engagingly',
-    'english-language',
-    'engraver',
-    'enhancer',
-    'enjoined',
-    'enlisting',
-    'enliven',
-    'enquirer',
-    'enquiringly',
-    'enrolling',
-    'entanglement',
-    'enteritis',
     'enteropathy',
-    'enterprise-wide',
-    'enthroned',
-    'entitling',
-    'entr&eacute;e',
-    'enumerated',
-    'environmentalism',
-    'environmentally-friendly',
-    'envisaging',
-    'eochaid',
-    'ephesians',
-    'ephesus',
-    'episcopate',
-    'episodic',
-    'epistemic',
-    'epitomized',
     'epochs',
-    'epoxy',
-    'eprdf',
-    'eq.',
-    'equalisation',
-    'eradicating',
-    'eras',
-    'erasure',
-    'erhard',
-    'erin',
-    'eros',
-    'erosions',
-    'eroticism',
-    'erudition',
-    'erupts',
-    'erwin',
     'escalators',
-    'escapade',
-    'escapades',
-    'escapement',
-    'eskimo',
-    'esplanade',
-    'esq',
-    'ess',
-    'essentialist',
-    'ester',
-    'eston',
-    'ethically',
-    'ethology',
-    'etruscans',
-    'euboia',
-    'euclid',
     'eug&eacute;nie',
-    'eugenie',
-    'eugenius',
-    'eunuch',
-    'euphemistically',
-    'eurasian',
-    'eureka',
-    'euripides',
-    'eurocurrency',
-    'eurodisney',
-    'eurofighter',
-    'evaluators',
-    'evangelistic',
-    'evans-pritchard',
-    'evaporating',
-    'even-handed',
     'eventualities',
-    'evert',
-    'everthorpe',
-    'everyman',
-    'evictions',
-    'evinced',
-    'evolutionism',
-    'ewart',
-    'ex-servicemen',
-    'ex-soviet',
-    'ex_gratia',
-    'ex_officio',
-    'exaltation',
-    'excalibur',
-    'excavate',
-    'excavating',
     'excavator',
-    'excels',
-    'excelsior',
-    'excitements',
-    'exclaiming',
-    'exe',
-    'exec',
-    'executioners',
-    'exegesis',
-    'exempting',
-    'exhorting',
-    'existents',
-    'exited',
-    'exiting',
-    'exocet',
-    'exocrine',
     'exonerated',
-    'exorcism',
-    'expandable',
-    'expansionary',
-    'expansions',
-    'expedite',
-    'expeditionary',
-    'expelling',
-    'exponentially',
-    'expound',
-    'expressiveness',
-    'expropriated',
-    'extinctions',
-    'extinguishers',
-    'extinguishing',
-    'extolling',
     'extortionate',
-    'extra-curricular',
-    'extra-marital',
-    'extradite',
-    'extradited',
-    'extrapolate',
-    'extrapolated',
-    'extrapolating',
-    'extruded',
-    'exultant',
-    'exultation',
-    'ey',
-    'eyres',
-    'eysenck',
-    'f&ecirc;te',
-    'f.l.r.',
     'f2',
-    'f3',
-    'fabians',
-    'fabien',
-    'fabius',
-    'fables',
-    'facetious',
-    'facilitation',
-    'factsheet',
-    'factually',
-    'fahd',
-    'faint-hearted',
-    'fair-minded',
-    'fairbanks',
-    'fairchild',
-    'fairfield',
     'fairham',
-    'fairley',
-    'faisal',
-    'faithfulness',
-    'faithless',
-    'faking',
-    'falangist',
-    'falk',
-    'fallacious',
-    'fallopian',
-    'falsifiable',
-    'falsificationist',
-    'falsify',
-    'fam.',
-    'familiarly',
-    'famlio',
     'fantasia',
-    'fantastically',
-    'faring',
-    'farmstead',
-    'faroe',
-    'farouk',
-    'farquharson',
-    'farrah',
-    'farts',
-    'fascinate',
-    'fashionably',
-    'fashioning',
-    'fast-flowing',
-    'fast-food',
-    'fasted',
-    'fasteners',
     'fastenings',
-    'fatalistic',
-    'fated',
-    'fatherly',
-    'fatigues',
-    'fatten',
-    'fatwa',
-    'faust',
-    'faustus',
-    'fave',
-    'fawkes',
-    'fax.',
-    'fddi',
-    'fealty',
-    'federalist',
-    'federalists',
     'federico',
-    'fee-paying',
-    'feedstock',
-    'feltham',
-    'felton',
-    'femme',
-    'feng',
-    'fenland',
-    'fennell',
-    'ferdi',
-    'fergal',
-    'fermented',
-    'fermenting',
-    'ferreira',
-    'ferrers',
-    'ferrier',
     'ferrous',
-    'ferrying',
-    'fetid',
-    'feuding',
-    'fey',
-    'ffeatherstonehaugh',
-    'fg',
-    'fgf-4',
-    'fhcima',
-    'fibre-rich',
-    'fibroblasts',
-    'fiddles',
-    'fido',
-    'fiefs',
-    'field-worker',
-    'fielder',
     'fiendish',
-    'fiennes',
-    'fiercer',
-    'fif',
-    'fightback',
-    'figment',
-    'filament',
-    'filial',
-    'filigree',
-    'filipino',
-    'filipinos',
-    'filmmaking',
-    'filo',
-    'filofax',
-    'finalising',
-    'finches',
     'fingerspelling',
-    'finniston',
-    'firebird',
-    'first-aid',
-    'first-order',
-    'first-past-the-post',
-    'fisa',
-    'fitfully',
-    'fittipaldi',
-    'five-a-side',
-    'five-door',
-    'five-point',
-    'five-year-olds',
-    'fivefold',
-    'fixated',
-    'fixings',
     'fjord',
-    'fl.',
-    'flan',
-    'flannels',
-    'flannery',
-    'flat-rate',
-    'flatness',
-    'flayed',
-    'flecked',
-    'flier',
-    'fliers',
-    'flints',
-    'floating-point',
-    'flodden',
-    'flopping',
-    'flores',
     'florey',
-    'flotsam',
-    'flounced',
-    'flout',
-    'flowerbeds',
-    'fluctuates',
-    'flues',
-    'fobbed',
-    'foinavon',
-    'fokine',
-    'fondling',
-    'fontainebleau',
-    'footloose',
-    'footman',
-    'footplate',
-    'footsie',
     'foregrounding',
-    'foreign-owned',
-    'foremen',
-    'foresees',
-    'foreskin',
-    'foretold',
-    'forewarned',
-    'forlornly',
-    'formalin',
-    'forman',
-    'formless',
-    'fornication',
-    'fortieth',
-    'fortification',
-    'fosdyke',
-    'foundationalism',
     'foundling',
-    'foundries',
-    'fount',
-    'four-letter',
-    'four-month',
-    'fourpence',
-    'fourteen-year-old',
-    'fourths',
-    'fractious',
-    'fracturing',
-    'fragrances',
-    'fran&ccedil;ais',
-    'fran&ccedil;aise',
-    'franchisee',
-    'franck',
-    'frans',
     'fraudulently',
-    'free-for-all',
-    'free-range',
-    'freehand',
-    'freeholder',
-    'freemasonry',
-    'freemen',
-    'freepost',
-    'freestanding',
-    'freitas',
-    'frescos',
-    'fresh-faced',
-    'fretboard',
-    'fretful',
-    'fribble',
-    'frictional',
     'friendlier',
-    'friern',
-    'fringing',
-    'frivolity',
-    'frontispiece',
-    'frontman',
-    'frothing',
-    'fruiting',
-    'fuchs',
-    'fuchsia',
-    'fucker',
-    'fuckin\'',
-    'fulcrum',
-    'fulfill',
-    'fulk',
-    'fulke',
     'full-page',
-    'fullerton',
-    'fulmars',
-    'fulsome',
-    'fun-loving',
-    'funboard',
-    'funnier',
-    'furthered',
-    'fusiliers',
-    'fw',
-    'g.w.',
-    'g/l',
-    'gabled',
-    'gabrielle',
-    'gadgetry',
-    'gaff',
     'gagging',
-    'gaggle',
-    'galatians',
-    'galleon',
-    'gallie',
-    'gallipoli',
-    'gallium',
-    'gallops',
-    'galvanized',
-    'galvone',
-    'gamal',
-    'gamely',
-    'ganges',
-    'gangplank',
-    'gangrene',
-    'gannon',
     'gaoler',
-    'gaols',
-    'gape',
-    'garbled',
-    'gargantuan',
-    'gargoyles',
-    'garnered',
-    'garrard',
-    'garston',
-    'gasket',
-    'gassed',
-    'gastronomic',
-    'gastroscopy',
-    'gated',
-    'gatherers',
-    'gaultier',
     'gauss',
-    'gaye',
-    'gayle',
-    'gbh',
-    'gda',
-    'gdansk',
-    'gdynia',
-    'geary',
-    'geikie',
-    'gemmell',
-    'gendarme',
-    'general-purpose',
-    'generalities',
-    'generational',
-    'genevieve',
-    'geniuses',
     'geomagnetic',
-    'geomorphological',
-    'georgi',
-    'georgians',
-    'ger',
-    'gere',
-    'germain',
-    'germaine',
-    'gesticulating',
-    'getting_on_for',
-    'ggf',
-    'gh5',
-    'gharr',
-    'ghoulish',
-    'giacometti',
-    'giardia',
     'gielgud',
-    'gilberd',
-    'gilchrist',
-    'gildas',
-    'gilding',
-    'gilford',
-    'gillick',
-    'gilmore',
-    'gilroy',
-    'gim',
-    'gimmicks',
-    'gimms',
-    'ginsberg',
-    'giovanna',
-    'girder',
-    'girl-friend',
     'girlie',
-    'girobank',
-    'giselle',
-    'gladiators',
-    'glam',
-    'glass-fronted',
-    'gleeful',
-    'glencoe',
-    'glendinning',
-    'glides',
-    'glimmering',
-    'gloating',
-    'globes',
-    'globules',
-    'glorification',
-    'glorify',
     'glos',
-    'glosses',
-    'glues',
-    'gluing',
-    'glutamine',
-    'glycine',
-    'glycoprotein',
-    'glyndebourne',
-    'gmb',
-    'gmtv',
-    'goad',
-    'goalie',
-    'goalposts',
-    'gob',
-    'gobble',
-    'gobbled',
     'goblets',
-    'goddam',
-    'goddamn',
-    'godhead',
-    'godoy',
-    'goffman',
-    'gog',
-    'goldmine',
-    'goldring',
-    'golds',
-    'goldstein',
-    'goldthorpe',
-    'goliath',
-    'gollancz',
-    'good-quality',
-    'goodfellow',
     'goodly',
-    'gooseberries',
-    'gooseberry',
-    'goran',
-    'gosling',
-    'gosport',
-    'goss',
-    'gosse',
-    'gossips',
-    'goth',
-    'goths',
-    'gotobed',
-    'gouge',
-    'government-sponsored',
-    'gpa',
-    'gpc',
     'grachev',
-    'grafts',
-    'grahame',
-    'grainy',
-    'grammes',
-    'grand-m&egrave;re',
-    'grandfathers',
-    'grandparent',
-    'grandsons',
-    'grangetown',
-    'granites',
-    'granpa',
-    'grant-aided',
-    'granulated',
-    'granule',
-    'granulocytes',
     'grappled',
-    'gras',
-    'grasshopper',
-    'grasshoppers',
-    'gravelled',
-    'gravelly',
-    'graveney',
-    'gravesend',
-    'graveside',
-    'gravest',
-    'gravestone',
-    'graveyards',
-    'gravitation',
-    'great-grandmother',
-    'grecian',
-    'greenbank',
     'greenberg',
-    'greenfly',
-    'greyer',
-    'greyhounds',
-    'greyness',
-    'griffon',
-    'grilles',
-    'grimacing',
-    'grimond',
-    'grimwood',
-    'gringo',
-    'griselda',
-    'gritting',
-    'grizzly',
-    'grom',
-    'grotty',
     'groundsman',
-    'grover',
-    'growls',
-    'grp',
-    'gruagach',
-    'grubb',
-    'grubs',
-    'grumbles',
-    'grumman',
-    'grunwick',
-    'guam',
-    'guanine',
-    'guardsman',
-    'guardsmen',
-    'gubberford',
-    'guerilla',
     'guide-lines',
-    'guider',
-    'guillemots',
-    'gulps',
-    'gurgle',
-    'gush',
-    'gusting',
-    'guv',
-    'gwendoline',
-    'gwenellen',
-    'gwynne',
-    'gynaecological',
-    'gypsum',
-    'h&ocirc;tel',
-    'h.c.',
-    'h.m',
     'ha\'penny',
-    'habeas_corpus',
-    'habib',
-    'habitus',
-    'hackers',
-    'hackett',
-    'hackles',
-    'haematoxylin',
-    'haemophilia',
-    'haemorrhagic',
-    'hafez',
-    'hagans',
-    'hagen',
-    'haggis',
-    'haggle',
-    'haile',
     'hailes',
-    'hails',
-    'hairbrush',
-    'hairflair',
-    'hairstyles',
-    'halcyon',
-    'hales',
-    'half-baked',
-    'half-eaten',
-    'half-finished',
-    'half-heartedly',
-    'half-mile',
-    'half-naked',
-    'half-smile',
-    'half-term',
-    'halfpenny',
     'hallelujah',
-    'halliwell',
-    'hallucination',
-    'halons',
-    'halsbury',
-    'halsey',
-    'halter',
-    'halvard',
-    'hambro',
-    'hambros',
-    'hamlin',
-    'hammock',
-    'hammonds',
-    'hamsters',
-    'hand-outs',
-    'hand-painted',
     'hand-picked',
-    'hand-written',
-    'handedness',
-    'handicrafts',
-    'handrail',
-    'handyman',
-    'hang-ups',
-    'hangars',
-    'hangers-on',
-    'hangovers',
-    'hankering',
-    'hannibal',
-    'hannon',
-    'hanoverian',
-    'harbinger',
-    'harborough',
     'hard-currency',
-    'hard-fought',
-    'hard-nosed',
-    'hard-wearing',
-    'hard_up',
-    'hardens',
-    'harmlessly',
-    'harmoniously',
-    'harmonium',
-    'harmonize',
-    'harpenden',
-    'harpers',
-    'harries',
-    'hartnell',
-    'harvester',
-    'haryana',
     'hashemi',
-    'hashish',
-    'hassles',
-    'hastening',
-    'hathaway',
-    'hatter',
-    'hattie',
-    'haughtily',
-    'hauliers',
-    'havre',
-    'hays',
-    'hazell',
-    'hd',
-    'head-dress',
-    'headband',
-    'headdress',
     'headlamps',
-    'headlands',
-    'headset',
-    'headstone',
-    'headstrong',
-    'heals',
-    'hearsay-ii',
-    'heart-stopping',
-    'hearths',
-    'hearthwares',
-    'heartlands',
-    'heathwood',
-    'heavyweights',
-    'hebridean',
-    'hedonism',
-    'hedonistic',
     'heedless',
-    'heeled',
-    'heh',
-    'heidelberg',
-    'heidrick',
-    'heightening',
-    'heine',
-    'heisenberg',
-    'heller',
-    'helmsman',
-    'helplines',
-    'hemline',
-    'hemlington',
-    'hemmings',
-    'hems',
-    'henceforward',
     'henning',
-    'henson',
-    'hepatocyte',
-    'heraldry',
-    'herbicide',
-    'herdbook',
-    'herding',
-    'heretic',
-    'heriot-watt',
-    'heroics',
-    'herrmann',
-    'herta',
-    'herzog',
-    'heselton',
-    'hesitates',
-    'heslop',
     'hesse',
-    'heston',
-    'heterosexism',
-    'hewn',
-    'hexagon',
-    'hgt-1',
-    'hibernation',
-    'hibernian',
-    'hickman',
-    'hideaway',
-    'hiding-place',
-    'hierarchically',
-    'high-backed',
-    'high-bay',
-    'high-ceilinged',
-    'high-grade',
     'high-minded',
-    'high-resolution',
-    'high-spirited',
-    'highwayman',
-    'hijackers',
-    'hillingdon',
-    'hillman',
-    'hinders',
-    'hindquarters',
-    'hinds',
-    'hines',
-    'hippo',
-    'hippocampal',
-    'histogram',
-    'historicist',
-    'historicity',
     'hitchin',
-    'hitman',
-    'hlcas',
-    'hmip',
-    'hmv',
-    'hn',
-    'hobbit',
-    'hobsbawn',
-    'hoc',
-    'hocazade',
-    'hoccleve',
-    'hock',
-    'hodgkinson',
-    'hofmann',
-    'hoisting',
-    'holbein',
     'holderness',
-    'holiday-makers',
-    'holist',
-    'holists',
-    'holkham',
-    'hollins',
-    'hols',
-    'holstein',
-    'home-school',
-    'homebase',
-    'homeric',
-    'homesickness',
-    'homespun',
-    'homestead',
-    'homeworkers',
-    'hominid',
     'homme',
-    'homoclinic',
-    'homogenates',
-    'homophobic',
-    'honduran',
-    'honeywell',
-    'honourably',
-    'honourary',
-    'hoofs',
-    'hooting',
-    'hoots',
-    'hoped-for',
-    'horatia',
-    'horbury',
-    'horncastle',
-    'hornet',
     'horseradish',
-    'horst',
-    'hosanna',
-    'hoskin',
-    'hosni',
-    'hospitalised',
-    'hot-air',
-    'hot-water',
-    'hothouse',
-    'hotplate',
-    'hough',
-    'house-to-house',
-    'housemaid',
-    'housman',
-    'hovers',
-    'hovis',
     'howards',
-    'howden',
-    'hsia',
-    'hsv-1',
-    'ht',
-    'htv',
-    'hua',
-    'huang',
-    'hubris',
-    'hubs',
-    'huey',
-    'hulks',
-    'humanely',
-    'humbucker',
-    'humbuckers',
-    'humerus',
     'humorously',
-    'humped',
-    'humpty',
-    'humus',
-    'hunky',
-    'hunter-blair',
-    'husameddin',
-    'husk',
-    'huston',
-    'hutch',
-    'hyacinths',
-    'hyatt',
-    'hybridised',
-    'hybridized',
-    'hydration',
-    'hydrochlorothiazide',
     'hydrological',
-    'hydrolysis',
-    'hyman',
-    'hyped',
-    'hyper',
-    'hyperion',
-    'hypersensitivity',
-    'hypertrophic',
-    'hyphen',
-    'hypnotherapy',
-    'hypnotized',
-    'hypocrites',
-    'hypotenuse',
-    'hypothesized',
-    'i-',
-    'ia',
     'ib',
-    'iberian',
-    'ibf',
-    'ic',
-    'icaew',
-    'icao',
-    'icd',
-    'ice-t',
-    'icj',
-    'icm',
-    'ics',
-    'idealists',
-    'idolatry',
-    'idris',
-    'iff',
-    'iffy',
     'ifl',
-    'ifn',
-    'ifs',
-    'ig',
-    'igm',
-    'ignominious',
-    'iia',
-    'iii.',
-    'ill-conceived',
-    'ill-considered',
-    'ill-effects',
-    'ill-feeling',
-    'ill-treated',
-    'illingworth',
-    'illus',
-    'ilo',
     'ilsa',
-    'ilse',
-    'imaged',
-    'imc',
-    'imitators',
-    'immanent',
-    'immeasurable',
-    'immobilised',
-    'immortalised',
-    'immunodeficiency',
-    'immunofluorescence',
-    'immunohistochemical',
-    'immunoreactivity',
-    'imo',
-    'impartially',
-    'impedances',
     'impeding',
-    'imperfection',
-    'imperialists',
-    'imperiously',
-    'impermeable',
-    'impersonality',
-    'impertinence',
-    'impinges',
-    'impinging',
-    'implantation',
-    'implicature',
-    'impliedly',
-    'impolite',
-    'impresses',
-    'imprinting',
-    'imprints',
     'imprison',
-    'imprisoning',
-    'improv',
-    'imprudent',
-    'impudent',
-    'imputation',
-    'imre',
-    'imro',
-    'in-flight',
-    'in-form',
-    'in-patients',
-    'in-store',
-    'in_cooperation_with',
-    'in_face_of',
-    'in_the_order_of',
-    'ina',
     'inaccurately',
-    'inactivation',
-    'inane',
-    'inbred',
-    'incited',
-    'incl.',
-    'inclusions',
-    'incognito',
-    'incoherence',
-    'incontrovertible',
-    'incubating',
-    'inculcate',
-    'incurs',
-    'ind',
-    'indelibly',
-    'indentation',
     'indenture',
-    'inder',
-    'indeterminacy',
-    'indexical',
-    'indictable',
-    'indignities',
-    'indiscipline',
-    'indiscretions',
-    'individuation',
-    'indolent',
-    'indulgently',
-    'indus',
-    'industrially',
-    'indy',
-    'indycar',
-    'ine',
     'inedible',
-    'ineffable',
-    'inefficiencies',
-    'inertial',
-    'inez',
-    'infanticide',
-    'inferential',
-    'inflammable',
-    'inflate',
-    'inflections',
-    'inflexibility',
-    'infliction',
-    'infuriatingly',
-    'inge',
-    'ingeniously',
-    'ingleton',
     'inglis',
-    'ingratitude',
-    'inhabiting',
-    'inhabits',
-    'inherits',
-    'inhumane',
-    'initiator',
-    'injectors',
-    'inlays',
-    'innervation',
-    'innsbruck',
-    'inoffensive',
-    'insecurities',
-    'inside_out',
-    'insolence',
-    'inspirals',
     'instabilities',
-    'instep',
-    'instigate',
-    'instigator',
-    'instillation',
-    'institut',
-    'instituting',
-    'instrumentalists',
-    'insularity',
-    'insuring',
-    'intarsia',
-    'integrin',
-    'integrins',
-    'intensifies',
-    'inter-city',
-    'inter-departmental',
     'inter-party',
-    'interactional',
-    'intercellular',
-    'intercepting',
-    'intercession',
-    'interchangeably',
-    'interdepartmental',
-    'interdict',
-    'interlocutor',
-    'interludes',
-    'internationalisation',
-    'internationalization',
-    'internecine',
-    'interpol',
-    'interpolation',
-    'interrogating',
     'intersecting',
-    'interstitial',
-    'intestacy',
-    'intra',
-    'intraperitoneal',
-    'intricately',
-    'intriguingly',
-    'intron',
-    'invalids',
-    'inverting',
-    'inviolable',
-    'invisibly',
-    'invoicing',
-    'invulnerable',
-    'inward-looking',
-    'iodide',
     'ionising',
-    'iras',
-    'irascible',
-    'irb',
-    'ire',
-    'iridescent',
-    'irigaray',
-    'irked',
-    'iro',
-    'ironies',
-    'ironstone',
-    'irrecoverable',
-    'irrefutable',
-    'irrigated',
-    'irritatingly',
-    'irritations',
     'irs',
-    'is.',
-    'ischaemia',
-    'ise',
-    'islander',
-    'isolationism',
-    'isosceles',
-    'isoud',
-    'iterative',
-    'itf',
-    'iud',
-    'ivf',
-    'izvestiya',
-    'j.b.',
-    'jabir',
-    'jabs',
     'jacky',
-    'jacobitism',
-    'jaffery',
-    'jaggers',
-    'jancey',
-    'jangled',
-    'janis',
-    'jansher',
-    'jared',
-    'jaruzelski',
-    'jb',
-    'jebel',
-    'jedburgh',
-    'jeddah',
-    'jeers',
-    'jeeves',
     'jeez',
-    'jefferies',
-    'jeffries',
-    'jejunum',
-    'jena',
-    'jenkin',
-    'jenks',
-    'jeopardized',
-    'jerkily',
-    'jerkin',
-    'jerzy',
-    'jet-lag',
-    'jetting',
-    'jettisoned',
-    'jewitt',
-    'jfk',
     'jh',
-    'jibe',
-    'jigs',
-    'jimbo',
-    'jinx',
-    'jittery',
-    'jj',
-    'joao',
-    'jochen',
-    'jocular',
-    'jodami',
-    'joggers',
-    'johannsen',
-    'johansson',
-    'john-william',
-    'joiners',
     'joinery',
-    'joint-stock',
-    'jolting',
-    'jong',
-    'jonquil',
-    'jordi',
-    'josephs',
-    'joshi',
-    'joss',
-    'journeying',
-    'journeyman',
-    'jousting',
-    'jovi',
-    'jovian',
-    'jowett',
-    'jozsef',
     'judaea',
-    'judgemental',
-    'judicially',
-    'judiciously',
-    'jugular',
-    'juliana',
-    'julien',
-    'juridical',
-    'jurist',
-    'juron',
-    'k.b.',
-    'k2',
-    'ka',
-    'kaas',
-    'kadhafi',
-    'kandinsky',
     'kandyan',
-    'kanemaru',
-    'kang',
-    'kangaroos',
-    'kano',
-    'kantian',
-    'kaptan',
-    'karadzic',
-    'karak',
-    'karma',
-    'karnataka',
-    'karrimor',
-    'karsten',
-    'katarina',
-    'katya',
-    'kc',
     'keaton',
-    'keenest',
-    'keep-fit',
-    'keevins',
-    'kegan',
-    'kegs',
-    'kelley',
-    'kenamun',
-    'kennet',
-    'kennington',
-    'kenwood',
-    'keown',
-    'kernels',
-    'kerosene',
-    'kerslake',
-    'ketamine',
     'kettles',
-    'keynes/buckinghamshire',
-    'keystone',
-    'khamenei',
-    'kick-start',
-    'kidnapper',
-    'kiefer',
-    'kier',
-    'kilda',
-    'kildalton',
-    'kilpatrick',
-    'kimono',
-    'kincardine',
-    'kindersley',
-    'king-duke',
-    'kingsdale',
     'kingswood',
-    'kink',
-    'kinkel',
-    'kinross',
-    'kinsai',
-    'kiosks',
-    'kipper',
-    'kippers',
-    'kislev',
-    'kitchener',
-    'kitted',
-    'kiwomya',
-    'klee',
-    'klemperer',
-    'klift',
-    'kline',
     'klm',
-    'kms',
-    'kmt',
-    'kn',
-    'knacker',
-    'knave',
-    'knee-length',
-    'kneecap',
-    'knelle',
-    'knifed',
-    'knitmaster',
-    'kno',
-    'knoll',
-    'knotting',
-    'knotty',
-    'knutsford',
     'ko',
-    'koehler',
-    'konstantin',
-    'kooning',
-    'koraloona',
-    'korn/ferry',
-    'kos',
-    'kraal',
-    'kraft',
-    'kragan',
-    'krakatoa',
-    'krakow',
-    'kray',
-    'krenz',
-    'kristeva',
-    'ku',
     'kudos',
-    'kunsthalle',
-    'kwik',
-    'kyoto',
-    'l&aacute;zn&euml',
-    'l\'or&eacute;al',
-    'l-shaped',
-    'l.a.',
-    'l.c.',
-    'l.e.d.s',
-    'l.r.',
-    'l2',
-    'laban',
-    'labour-saving',
-    'lacing',
-    'laconically',
     'lacroix',
-    'lactose',
-    'lada',
-    'ladislav',
-    'ladybird',
-    'ladylike',
-    'lafayette',
-    'lai',
-    'lakoff',
-    'lalage',
-    'lamarck',
-    'lamarckism',
-    'lambourn',
-    'lamenting',
-    'laminar',
-    'laminate',
     'lamp-post',
-    'lamplight',
-    'lamplugh',
-    'lancastrian',
-    'lancelot',
-    'lances',
-    'lanchester',
-    'lancia',
-    'landfall',
-    'landor',
-    'landry',
-    'landsbergis',
-    'landward',
-    'langdon',
-    'lange',
-    'langham',
     'lank',
-    'lankans',
-    'lansbury',
-    'lanyon',
-    'lanzarote',
-    'laparoscopic',
-    'lapointe',
-    'larch',
-    'largo',
-    'lars',
-    'laski',
-    'laterality',
-    'lathes',
-    'latrine',
-    'latrines',
-    'lauded',
     'laughingly',
-    'lawford',
-    'lawnmower',
-    'laxative',
-    'lay-offs',
-    'lbc',
-    'lcy',
-    'leached',
-    'lead-free',
-    'leafed',
-    'leafing',
-    'leafless',
-    'leah',
-    'leakages',
-    'leary',
-    'leather-bound',
     'leatherhead',
-    'leered',
-    'leering',
-    'leftover',
-    'leftovers',
-    'legalised',
-    'legato',
-    'legco',
-    'legge',
-    'legged',
-    'leggy',
-    'legislated',
-    'legislating',
-    'legislator',
-    'legitimating',
-    'legitimise',
     'legless',
-    'leif',
-    'lemarchand',
-    'lengthways',
-    'leominster',
-    'leopardstown',
-    'leotard',
-    'lepers',
-    'leprechaun',
-    'leroy',
-    'lerwick',
-    'let-down',
-    'letter-box',
-    'lettered',
-    'letts',
-    'lettuces',
     'lev',
-    'level-headed',
-    'leveller',
-    'leviathan',
-    'leviticus',
-    'lewd',
-    'lexicons',
-    'leyburn',
-    'lf',
-    'lfas',
-    'lfs',
-    'lh',
-    'liars',
-    'liber',
-    'liberal-democratic',
-    'liberator',
     'liberian',
-    'libor',
-    'licence-holder',
-    'liddy',
-    'lieu',
-    'lieutenant-general',
-    'life-force',
-    'life-support',
-    'life-time',
-    'lifeblood',
-    'lifeguard',
-    'lifelike',
-    'lighters',
-    'lightheart',
-    'lighthearted',
-    'lighthouses',
     'lignite',
-    'liken',
-    'lilith',
-    'lillie',
-    'lilliput',
-    'lilly',
-    'lillywhite',
-    'lilt',
-    'lilting',
-    'lim',
-    'limes',
-    'limo',
-    'limousines',
-    'limpar',
-    'limpid',
-    'lincs',
     'linden',
-    'lindisfarne',
-    'linighan',
-    'linnaeus',
-    'linnet',
-    'lioness',
-    'lionisers',
-    'lip-service',
-    'lipase',
-    'liqueurs',
-    'lisle',
-    'lisp',
-    'listlessly',
-    'literatures',
-    'lithographs',
-    'lithospheric',
     'lithuanians',
-    'live-in',
-    'livelier',
-    'liveliness',
-    'livermore',
-    'llanberis',
-    'lng',
-    'lo_and_behold',
-    'loach',
-    'lobbed',
-    'loc',
-    'localism',
-    'localization',
-    'lochan',
-    'lock-up',
-    'locusts',
     'loe',
-    'loftily',
-    'logarithmic',
-    'logarithms',
-    'loggerheads',
-    'loggers',
-    'logie',
-    'lolled',
-    'lolly',
-    'lom&eacute',
-    'long-eared',
-    'long-held',
-    'long-tailed',
-    'long-wave',
-    'long-winded',
-    'longchamp',
     'longingly',
-    'looe',
-    'loose-leaf',
-    'loren',
-    'lottie',
-    'loudness',
-    'loudon',
-    'louis-napoleon',
-    'loulou',
-    'louse',
-    'lout',
-    'low-calorie',
-    'low-status',
-    'low-voltage',
-    'lowndes',
-    'lozenge',
     'luanda',
-    'lubricants',
-    'lubricated',
-    'lucerne',
-    'luciano',
-    'lucidity',
-    'luckier',
-    'luff',
-    'lugard',
-    'lulu',
-    'lumbar',
-    'lunched',
-    'lunching',
-    'lupus',
-    'lures',
-    'luring',
     'lusignan',
-    'luxuriously',
-    'lvmh',
-    'lyall',
-    'lyceum',
-    'lycra',
-    'lyddy',
-    'lydney',
-    'lyles',
-    'lymphomas',
-    'lynagh',
-    'lyonnais',
-    'lyotard',
-    'lyricism',
-    'lysosomes',
-    'lytton',
     'm&amp;a',
-    'm-19',
-    'm.a.',
-    'm.p.h.',
-    'mab',
-    'macbride',
-    'macfadyen',
-    'macfarlane',
-    'machiavellian',
-    'mackeson',
-    'mackinnon',
-    'maclennan',
-    'macrae',
-    'macros',
-    'madden',
-    'madder',
     'maddox',
-    'madhouse',
-    'mafouz',
-    'magda',
-    'magellan',
-    'maggiore',
-    'magherafelt',
-    'maghreb',
-    'maginnis',
-    'magisterial',
-    'magmas',
-    'magna',
-    'magnanimous',
-    'mahal',
-    'maharajah',
-    'mailings',
     'mainman',
-    'mais',
-    'maisonette',
-    'maizi&egrave;re',
-    'majestically',
-    'malachi',
-    'maldon',
-    'malevolence',
-    'mallia',
-    'mallik',
-    'malls',
-    'malnourished',
-    'malting',
-    'manc',
-    'manchu',
-    'mandalay',
     'mandale',
-    'mandated',
-    'mandates',
-    'mandelson',
-    'manet',
-    'manfully',
-    'mangle',
-    'mangrove',
-    'maniacs',
-    'manifesting',
-    'manna',
-    'manoeuvrability',
-    'manolo',
-    'mantel',
-    'manton',
-    'mantra',
     'mapplethorpe',
-    'mar&iacute;a',
-    'mara',
-    'marbella',
-    'marcelle',
-    'marginality',
-    'mari&aacute;nsk&eacute',
-    'marie-christine',
-    'marigold',
-    'marin',
-    'maritima',
-    'marketers',
-    'markov',
-    'markovic',
-    'marksmen',
-    'markus',
     'marland',
-    'marques',
-    'marshals',
-    'martell',
-    'marti',
-    'martine',
-    'martyred',
-    'marwood',
-    'marxism-leninism',
-    'masefield',
-    'masham',
-    'masochism',
-    'masochistic',
-    'masque',
-    'mass-production',
-    'massing',
     'mastercard',
-    'mastic',
-    'masud',
-    'matchplay',
-    'matchstick',
-    'mater',
-    'materia',
-    'materialized',
-    'mather',
-    'mathew',
-    'mathews',
-    'matriculated',
-    'matriculation',
-    'matrilineal',
-    'matrimony',
-    'matta',
     'matter-of-factly',
-    'matterhorn',
-    'mau',
-    'maudie',
-    'mauled',
-    'mauling',
-    'maung',
-    'maw',
-    'maxi',
-    'maxillae',
-    'maximization',
-    'mayall',
-    'mayday',
-    'mays',
-    'mazes',
-    'mbo',
     'mcavennie',
-    'mccaw',
-    'mccluskey',
-    'mccrea',
-    'mcdonalds',
-    'mcgill',
-    'mcgovern',
-    'mchugh',
-    'mckendrick',
-    'mckinnon',
-    'mclachlan',
-    'mcmanaman',
-    'mcmaster',
-    'mcmenemy',
-    'mcmullen',
-    'mcmurdo',
     'mcneil',
-    'mcphee',
-    'mcstay',
-    'mcwilliams',
-    'meadowbank',
-    'meana',
-    'meandered',
-    'meanest',
-    'meaningfulness',
-    'meccano',
-    'medial',
-    'mediates',
-    'medic',
-    'medicare',
-    'medications',
-    'meditating',
     'mediums',
-    'medusa',
-    'medvedev',
-    'meech',
-    'megarry',
-    'megawatts',
-    'melanesian',
-    'melee',
-    'melinda',
-    'melodious',
-    'melvin',
-    'mem',
-    'memberships',
-    'mementoes',
-    'memorize',
-    'mena',
     'menagerie',
-    'mendes',
-    'mendip',
-    'menfolk',
-    'mengistu',
-    'mentors',
-    'mercedes-benz',
-    'mercies',
-    'merck',
-    'merges',
-    'meringue',
-    'mermaids',
-    'merrick',
-    'merthyr',
-    'merv',
-    'mes',
     'mesa',
-    'mesalazine',
-    'messaging',
-    'messes',
-    'metabolites',
-    'metamorphosed',
-    'metastatic',
-    'methanogenic',
-    'methinks',
-    'methylated',
-    'metronidazole',
-    'meuse',
-    'mexicans',
-    'mflops',
-    'mfn',
-    'mg/litre',
     'mgcl',
-    'mgn',
-    'mgr',
-    'mic',
-    'michelis',
-    'michell',
-    'microchip',
-    'microeconomic',
-    'microns',
-    'micros',
-    'mid-',
-    'mid-1930s',
-    'mid-1989',
-    'mid-1993',
-    'mid-field',
-    'mid-fifties',
     'mid-point',
-    'mid-summer',
-    'mid-thirties',
-    'mid-twenties',
-    'mid-year',
-    'middle-income',
-    'middlemass',
-    'midget',
-    'midlife',
-    'midshipman',
-    'miffed',
-    'miliband',
-    'military-industrial',
-    'militate',
-    'militiamen',
-    'miliutin',
     'milken',
-    'mille',
-    'millionth',
-    'mimed',
-    'mimetic',
-    'miming',
-    'mincemeat',
-    'mind-boggling',
-    'mineralogy',
-    'minicomputer',
-    'minigrams',
-    'minima',
-    'minimally',
-    'minimises',
-    'minions',
-    'minister-delegate',
     'ministrations',
-    'minna',
-    'minnies',
-    'minsk',
-    'minter',
-    'minuet',
-    'miocene',
-    'mip-1',
-    'miro',
-    'misadventure',
-    'misapprehension',
-    'miscalculation',
-    'misdeeds',
-    'miseries',
-    'misfire',
-    'mishaps',
     'misinformation',
-    'mislaid',
-    'misleadingly',
-    'mispricing',
-    'mispricings',
-    'misshapen',
-    'missioner',
-    'misusers',
-    'mkm',
-    'mmmm',
-    'mn',
-    'mnemonic',
-    'mnp',
-    'mo&euml;t',
-    'moated',
-    'mobbed',
     'modalities',
-    'moderne',
-    'modernists',
-    'moderns',
-    'modifier',
-    'modulate',
-    'moguls',
-    'mohair',
-    'mohan',
-    'molby',
-    'moldovan',
-    'molested',
-    'molesworth',
-    'moll',
-    'mollified',
-    'moloch',
     'molyneaux',
-    'mombasa',
-    'monarchical',
-    'monarchist',
-    'monarchists',
-    'mond',
-    'monika',
-    'monktonhall',
-    'monnet',
-    'monologues',
-    'monomer',
-    'monosyllabic',
-    'monotonic',
-    'monotype',
-    'mons',
-    'monstrosity',
     'montage',
-    'montego',
-    'montgomeryshire',
-    'month-long',
-    'montparnasse',
-    'montserrat',
-    'monza',
-    'mood-altering',
-    'morar',
-    'moravia',
-    'mordecai',
-    'moreau',
-    'morgenthau',
-    'moro',
-    'moron',
-    'morpheme',
     'morphemes',
-    'morphologically',
-    'morrell',
-    'morsels',
-    'mortgagees',
-    'mortgagor',
-    'mortise',
-    'mosca',
-    'moscovici',
-    'moshe',
-    'mosse',
-    'mostar',
-    'motability',
-    'mothercare',
-    'motivator',
-    'motorcyclist',
     'motown',
-    'mouncy',
-    'mountjoy',
-    'mournfully',
-    'moveable',
-    'mowlam',
-    'moxon',
-    'mozambican',
-    'mp.',
-    'mpc',
-    'mpla-pt',
-    'mtm',
-    'muawad',
-    'muffin',
-    'muftis',
-    'mugger',
     'muirfield',
-    'mulholland',
-    'mulled',
-    'mulling',
-    'multi-dimensional',
-    'multi-processor',
-    'multicoloured',
-    'multiculturalism',
-    'multifarious',
-    'multiracial',
-    'multitudes',
-    'mummies',
-    'munched',
-    'municipality',
-    'murchison',
-    'murdock',
     'muscat',
-    'muscovy',
-    'musculature',
-    'museo',
-    'mushtaq',
-    'musique',
-    'musket',
-    'muskets',
-    'mutely',
-    'mutinous',
-    'mutterings',
-    'mutters',
-    'mutuality',
-    'muzzled',
-    'mx',
-    'myeloperoxidase',
     'mylar',
-    'myrcans',
-    'mystification',
-    'mythologies',
-    'n&eacute;e',
-    'naas',
-    'nabisco',
-    'nac',
-    'nader',
-    'nae',
-    'nafta',
-    'nagasaki',
-    'nagel',
-    'naipaul',
-    'nairu',
-    'nanking',
     'naoh',
-    'napoli',
-    'narcissus',
-    'narouz',
-    'narrated',
-    'narrow-minded',
-    'narthex',
-    'nas',
-    'nasogastric',
-    'nastier',
-    'nastily',
-    'nationhood',
-    'natty',
-    'naturalized',
-    'navies',
-    'navvies',
     'navy-blue',
-    'ncm',
-    'ncos',
-    'neapolitan',
-    'nears',
-    'nebraska',
-    'nebula',
-    'negativity',
-    'negotiates',
-    'negroes',
-    'neilson',
-    'nematode',
-    'neo-marxist',
-    'nerina',
-    'nervy',
-    'nessie',
     'nestl&eacute',
-    'nettie',
-    'neurology',
-    'neuropeptide',
-    'neurophysiological',
-    'neuroses',
-    'neurotransmitters',
-    'neutralising',
-    'neutralize',
-    'newcastle-upon-tyne',
-    'newcomen',
-    'newent',
-    'newlands',
-    'newness',
-    'newquay',
-    'newson',
     'newsreader',
-    'newsreel',
-    'newtownabbey',
-    'newts',
-    'next-generation',
-    'nfl',
-    'ng/ml',
-    'niagara',
-    'nicks',
-    'nics',
-    'nie',
-    'nifty',
-    'nightcap',
-    'nightmarish',
-    'nih',
-    'nilp',
     'nils',
-    'nimbly',
-    'nineteen-year-old',
-    'ninja',
-    'ninth-century',
-    'nl',
-    'nlp',
-    'no-fly',
-    'noblest',
-    'nomad',
-    'non-advanced',
-    'non-aggression',
-    'non-agricultural',
-    'non-alcoholic',
-    'non-attendance',
-    'non-custodial',
     'non-diabetic',
-    'non-disabled',
-    'non-essential',
-    'non-financial',
-    'non-industrial',
-    'non-invasive',
-    'non-linguistic',
-    'non-literary',
-    'non-member',
-    'non-natural',
-    'non-oil',
-    'non-residents',
-    'non-smoker',
-    'non-steroidal',
-    'non-teaching',
-    'non-technical',
     'non-union',
-    'non-voting',
-    'non-white',
-    'non-words',
-    'non-working',
-    'nonchalance',
-    'nonplussed',
-    'noo',
-    'nooks',
-    'noorda',
-    'normalised',
-    'norseman',
-    'north-facing',
-    'northerners',
-    'northwestern',
-    'nosing',
     'notations',
-    'notches',
-    'note-taking',
-    'notifying',
-    'notionally',
-    'nous',
-    'nouvelle',
-    'novelistic',
-    'novo',
-    'nozick',
-    'nozzles',
-    'nrc',
-    'nsc',
-    'nucella',
-    'nullified',
-    'nullify',
     'numbing',
-    'nur',
-    'nursemaid',
-    'nutcracker',
-    'nutritionist',
-    'nuttall',
-    'nuzzled',
-    'nvala',
-    'nw1',
-    'nyse',
-    'nzrfu',
-    'oa',
-    'oakes',
-    'oakland',
-    'oald',
-    'oaldce',
     'obelisk',
-    'obeys',
-    'obispal',
-    'objectstore',
-    'obliteration',
-    'obsidian',
-    'obstetrician',
-    'obstetrics',
-    'ocr',
-    'ocs',
-    'oct-2',
-    'octavia',
-    'odder',
-    'oddest',
-    'odell',
-    'odes',
     'odiham',
-    'odorous',
-    'oedipal',
-    'oeec',
-    'off-beat',
-    'off-line',
-    'off-shore',
-    'off-site',
-    'off-the-shelf',
-    'off_guard',
-    'offlined',
-    'offsets',
-    'oftel',
-    'ogden',
-    'ogilvy',
-    'ohm',
     'oilfields',
-    'oilseed',
-    'ol\'',
-    'ola',
-    'olde',
-    'olden',
-    'olszewski',
-    'oltp',
-    'olwyn',
-    'om',
-    'omni',
-    'omnipotence',
-    'omnipresent',
-    'omniscient',
-    'on-the-spot',
-    'on/off',
     'one-eyed',
-    'one-hour',
-    'one-piece',
-    'one-sixth',
-    'one-stop',
-    'oneness',
-    'onslow',
-    'ontology',
-    'onyx',
-    'oo',
-    'oocytes',
-    'oot',
-    'op&eacute;ra',
-    'opacity',
-    'open-loop',
-    'open-necked',
     'open-plan',
-    'openers',
-    'openview',
-    'openvms',
-    'operant',
-    'operetta',
-    'ophelia',
-    'ophthalmic',
-    'opiate',
-    'opinionated',
-    'oppressors',
-    'opren',
-    'opticians',
-    'optimality',
-    'opts',
-    'opv',
     'oracle7',
-    'orcadai',
-    'ordain',
-    'orfe',
-    'orgies',
-    'orifice',
-    'originators',
-    'ormanroyd',
-    'orme',
-    'ormeau',
-    'ornithological',
-    'orphanages',
-    'orr',
-    'orthodoxies',
-    'osborn',
-    'oscillate',
     'osf/motif',
-    'osmosis',
-    'ostend',
-    'osvaldo',
-    'otaku',
-    'oth',
-    'oui',
-    'out_of_line_with',
-    'outback',
-    'outcasts',
-    'outfall',
-    'outflows',
-    'outgrowth',
-    'outhouse',
-    'outhouses',
-    'outlawing',
     'outlays',
-    'outlooks',
-    'outplayed',
-    'outpouring',
-    'outpourings',
-    'outside-half',
-    'outstrip',
-    'outstripping',
-    'outwit',
-    'ovarian',
-    'ovary',
-    'ovenproof',
-    'over-optimistic',
-    'over-production',
-    'over-represented',
-    'over-riding',
     'over-simplification',
-    'over-subscribed',
-    'over-the-counter',
-    'overblown',
-    'overburden',
-    'overburdened',
-    'overcoats',
-    'overdoing',
-    'overhear',
-    'overhung',
-    'overlays',
-    'overlords',
-    'overpaid',
-    'overpower',
-    'overran',
-    'overrated',
     'overrides',
-    'overshadow',
-    'overshoot',
-    'overshot',
-    'oversimplification',
-    'overstretched',
-    'oversubscribed',
-    'overthrew',
-    'overthrowing',
-    'overwork',
-    'oxidase',
-    'ozawa',
-    'p&eacute;rignon',
-    'p&lt;0.0001',
-    'p&lt;0.005',
-    'p&lt;0.02',
     'p(a)',
-    'p-40',
-    'p.c.b',
-    'p.o.s.',
-    'p3',
-    'p7',
-    'pacemaker',
-    'pacify',
-    'paddocks',
-    'padlocked',
-    'padua',
-    'paf',
-    'paget',
-    'pagoda',
-    'paid-up',
-    'paignton',
     'pails',
-    'painswick',
-    'paintbrush',
-    'pak',
-    'palaeolithic',
-    'palaeontology',
-    'pamella',
-    'pandas',
-    'pander',
-    'panics',
-    'panned',
-    'panning',
-    'panopticon',
-    'pansies',
-    'pant',
-    'panthers',
     'pantomimes',
-    'papered',
-    'papert',
-    'papillomavirus',
-    'papyrus',
-    'paracelsus',
-    'parachuting',
-    'paradigmatic',
-    'paralyse',
-    'paralysing',
-    'paramedics',
-    'parametric',
-    'paraphrased',
-    'parasol',
-    'paratroopers',
-    'paratuberculosis',
     'pare',
-    'pared',
-    'parent-child',
-    'parentheses',
-    'parfois',
-    'parkhurst',
-    'parmiter',
-    'parodies',
-    'parried',
-    'parsimony',
-    'parsnips',
-    'parsonage',
-    'parsytec',
-    'parthenon',
-    'particulate',
-    'partnering',
     'parton',
-    'partridges',
-    'pasa',
-    'pasok',
-    'passim',
-    'passwords',
-    'pasteur',
-    'pasting',
-    'pastors',
-    'pasty',
-    'patching',
-    'pateman',
-    'patency',
-    'patenting',
-    'paternity',
-    'pathologists',
     'patricio',
-    'patronized',
-    'pats',
-    'paulette',
-    'paunch',
-    'pawnbroker',
-    'pay-offs',
-    'payback',
-    'paymaster',
-    'payoff',
-    'payoffs',
-    'pcx',
-    'pdpa',
-    'peabody',
-    'peaceable',
-    'peaking',
     'peal',
-    'peats',
-    'pedalled',
-    'peddle',
-    'pedestrianisation',
-    'pedestrianised',
-    'pediment',
-    'peeking',
-    'peeved',
-    'pelagic',
-    'pele',
-    'pelt',
-    'penalized',
-    'pendants',
-    'pender',
-    'pennethorne',
     'pennington',
-    'pensive',
-    'pentagastrin',
-    'pentatonic',
-    'penumbra',
-    'peppermint',
-    'perceptibly',
-    'perching',
-    'pereira',
-    'performance-related',
-    'pergamon',
-    'perinuclear',
-    'periodontal',
-    'perishing',
-    'peristaltic',
-    'perky',
     'perpetuation',
-    'persephone',
-    'personable',
-    'personage',
-    'personalized',
-    'perspiring',
-    'persuades',
-    'perturbations',
-    'perugia',
-    'perusal',
-    'pervade',
-    'pervading',
-    'peshawar',
-    'peso',
-    'pesos',
-    'pessimists',
     'pestilence',
-    'peterhead',
-    'peterlee',
-    'petipa',
-    'petits',
-    'peto',
-    'petr',
-    'petri',
-    'petrova',
-    'petworth',
-    'pevensey',
-    'peyton',
-    'pf',
-    'pfeiffer',
-    'pfennigs',
-    'pg/mg',
     'pgc',
-    'phage',
-    'phaistos',
-    'phantoms',
-    'pharaohs',
-    'pharmacological',
-    'phenol',
-    'phenylketonuria',
-    'pheromone',
-    'phetam',
-    'phiala',
-    'philanthropist',
-    'philanthropists',
-    'philharmonia',
-    'philology',
-    'phlegm',
     'phlegmatic',
-    'phoenician',
-    'phonetically',
-    'phonetics',
-    'phosphatidylcholine',
-    'phosphorylated',
-    'photocopiers',
-    'phyla',
-    'phylogeny',
-    'phylum',
-    'physiologically',
-    'pianists',
-    'pickard',
-    'picturing',
-    'pieced',
-    'piecing',
     'piedmont',
-    'pieter',
-    'pigmentation',
-    'pilgrimages',
-    'pilkingtons',
-    'pillage',
-    'pillaged',
-    'pin-up',
-    'pindar',
-    'pineapples',
-    'pinkie',
-    'pinkish',
-    'pinky',
-    'pinpoints',
-    'pinstripe',
-    'pinter',
     'pinto',
-    'pion',
-    'pipit',
-    'piquant',
-    'pique',
-    'pirelli',
-    'pisces',
-    'pissarro',
-    'pitchfork',
-    'pitfall',
-    'pith',
-    'pitied',
-    'pitting',
-    'pixie',
-    'pla2',
-    'plagiarism',
     'plaintively',
-    'plaits',
-    'planck',
-    'planing',
-    'planter',
-    'plas',
-    'plastering',
-    'plasters',
-    'plateaux',
-    'platitudes',
-    'platters',
-    'plaudits',
-    'playschool',
-    'playwrights',
-    'plebeian',
-    'plebiscite',
     'pleural',
-    'plexiglass',
-    'plimsolls',
-    'plonk',
-    'plop',
-    'ploys',
-    'plug-in',
-    'plumbed',
-    'plummet',
-    'plumpton',
-    'plunger',
-    'pluses',
-    'pmodel',
-    'pocock',
-    'poetical',
-    'poignancy',
     'poignantly',
-    'point-of-sale',
-    'point-to-point',
-    'point_blank',
-    'poirot',
-    'poisoner',
-    'polanski',
-    'polemics',
-    'polis',
-    'politicised',
-    'politicized',
-    'pollack',
-    'pollinators',
-    'polymerases',
-    'polynesia',
-    'polynesian',
     'polypeptides',
-    'polyphonic',
-    'polyphony',
-    'polyposis',
-    'pomiane',
-    'pomposity',
-    'ponce',
-    'ponderously',
-    'ponte',
-    'pontoon',
-    'pop-up',
-    'popery',
-    'popish',
-    'poplars',
-    'popularized',
-    'porches',
     'porcupine',
-    'poring',
-    'porno',
-    'porritt',
-    'porte',
-    'portentous',
-    'portmanteau',
-    'poseidon',
-    'positives',
-    'positivists',
-    'positivity',
-    'posits',
-    'post-1945',
-    'post-colonial',
-    'post-natal',
-    'postdoctoral',
     'postgraduates',
-    'postmaster',
-    'poststructuralism',
-    'posy',
-    'potentiation',
-    'pou&lsqb;c&rsqb',
-    'poundage',
-    'poussin',
-    'pouted',
-    'poverty-stricken',
-    'powell/swindon',
-    'pozsgay',
-    'ppb',
-    'ppd',
-    'ppg',
-    'ppl',
     'pragmatically',
-    'pragmatists',
-    'prairies',
-    'praiseworthy',
-    'prank',
-    'prays',
-    'prd',
-    'pre-campaign',
-    'pre-capitalist',
-    'pre-determined',
-    'pre-match',
-    'pre-paid',
-    'pre-recorded',
-    'pre-s1',
-    'pre-s2',
-    'pre-vocational',
     'preaches',
-    'predestination',
-    'predictors',
-    'predispose',
-    'preferment',
-    'prefixes',
-    'premadasa',
-    'premi&egrave;re',
-    'premisses',
-    'prenton',
-    'preobrazhensky',
-    'preoperative',
-    'prepatent',
-    'preposition',
-    'pres.',
-    'preschool',
     'presences',
-    'presentational',
-    'presocratic',
-    'presto',
-    'presumptions',
-    'presumptive',
-    'presynaptic',
-    'prettiness',
-    'previewed',
-    'prickle',
-    'primaflora',
-    'primes',
-    'primo',
-    'principalities',
-    'printable',
-    'privately-owned',
     'privatize',
-    'pro-am',
-    'pro-government',
-    'pro-iraqi',
-    'pro-life',
-    'pro_forma',
-    'pro_rata',
-    'probity',
-    'proby',
-    'proclamations',
-    'procrastination',
-    'procreation',
-    'proctors',
-    'productively',
-    'professorship',
-    'profiling',
     'profiting',
-    'profuse',
-    'prohibitively',
-    'projectors',
-    'promissory',
-    'promulgation',
-    'prongs',
-    'proofed',
-    'proofing',
-    'propagandist',
-    'propane',
-    'propelling',
-    'prophylaxis',
-    'propositional',
-    'proprietorial',
-    'prospectively',
     'prospero',
-    'protester',
-    'protruded',
-    'proudest',
-    'proven&ccedil;al',
-    'providential',
-    'prowl',
-    'prowled',
-    'prunes',
-    'pseudo',
-    'psion',
-    'psychogeriatric',
-    'psycholinguistic',
-    'psychometric',
-    'psychopath',
-    'psychopathic',
     'psychotherapist',
-    'pt-gliadin',
-    'pte',
-    'ptt',
-    'pty',
-    'puccini',
-    'puck',
-    'puffins',
-    'pugnacious',
-    'pugwash',
-    'puke',
-    'pulleys',
-    'pulsars',
-    'pulsatance',
-    'punctilious',
-    'punta',
     'pupae',
-    'pupillage',
-    'purifying',
-    'puritanism',
-    'purplish',
-    'purportedly',
-    'purses',
-    'purveyor',
-    'purveyors',
-    'purview',
-    'pushers',
-    'puss',
-    'putrid',
-    'pwllheli',
-    'pwrs',
-    'pyke',
     'pylon',
-    'pyre',
-    'q1',
-    'q2',
-    'qichen',
-    'qing',
-    'quadrangle',
-    'quagmire',
-    'quails',
-    'quandary',
-    'quark',
-    'quarried',
-    'quart',
-    'quarterback',
-    'quasars',
-    'quatre',
     'queen-dowager',
-    'queensway',
-    'quelled',
-    'quench',
-    'querying',
-    'questor',
-    'quicksilver',
-    'quietest',
-    'quills',
-    'quince',
-    'quinta',
-    'quinton',
-    'quip',
-    'quirked',
-    'quixote',
-    'quorn',
     'r&amp;b',
-    'r&eacute;gime',
-    'r-series',
-    'r.m.s.',
-    'r3',
-    'r4',
-    'raasay',
-    'rabbis',
-    'racehorses',
-    'racetrack',
-    'racists',
-    'racketeering',
-    'rad',
-    'radford',
-    'radiates',
-    'radiations',
     'radioed',
-    'radiography',
-    'radiolabelled',
-    'radiology',
-    'radiometer',
-    'radionuclides',
-    'radulfus',
-    'rafa',
-    'raggedly',
-    'rahmi',
-    'rai',
-    'railed',
-    'rainer',
-    'rakes',
-    'rakovsky',
-    'ralemberg',
     'ralf',
-    'ramming',
-    'ramon',
-    'rampaging',
-    'ramprakash',
-    'ranald',
-    'rance',
-    'ranching',
-    'randomness',
-    'rannoch',
-    'ransome',
-    'ranulph',
-    'rap74',
-    'rapacious',
-    'rappers',
-    'rapping',
     'raps',
-    'rarities',
-    'rashes',
-    'ratners',
-    'rattles',
-    'ratty',
-    'raunchy',
-    'ravenscraig',
-    'ravines',
-    'rayon',
-    'razed',
-    'razor-sharp',
-    'rcc',
-    'rcd',
-    're-',
-    're-emerge',
     're-enacted',
-    're-enactment',
-    're-engineering',
-    're-evaluation',
-    're-formed',
-    're-organisation',
-    're-reading',
-    're-think',
-    're-write',
-    'reactants',
-    'readmission',
-    'readmitted',
-    'reaffirming',
-    'reallocation',
-    'reams',
-    'reaper',
     'reassembled',
-    'reassertion',
-    'reassurances',
-    'rebecque',
-    'rebounded',
-    'rebuttal',
-    'rec',
-    'recce',
-    'receivable',
-    'receptacle',
-    'receptionists',
-    'recession-hit',
-    'recherche',
-    'reciprocate',
-    'recitation',
-    'recognisably',
     'recognizably',
-    'reconsidering',
-    'reconvened',
-    'record-keeping',
-    'recouped',
-    'recreations',
-    'recrimination',
-    'red-brick',
-    'redcliffe-maud',
-    'redder',
-    'redecoration',
-    'redeployed',
-    'redeployment',
-    'redesigning',
-    'redevelop',
-    'redeveloped',
     'redfern',
-    'redirection',
-    'rediscovering',
-    'redknapp',
-    'redland',
-    'redshank',
-    'reducible',
-    'reductive',
-    'reductivist',
-    'reek',
-    'reeking',
-    'rees-mogg',
-    'refinancing',
-    'reflectors',
-    'refractive',
-    'refuel',
     'refuelled',
-    'refurbish',
-    'regaled',
-    'regenerating',
-    'regenerative',
-    'regents',
-    'regimens',
-    'regimented',
-    'regionalism',
-    'regressed',
-    'regretful',
-    'regulationist',
-    'rehabilitative',
-    'reichmann',
-    'reichsf&uuml;hrer',
-    'reichstag',
     'reigate',
-    'reina',
-    'reine',
-    'reiner',
-    'reintegration',
-    'reinterpreted',
-    'reinvested',
-    'reiteration',
-    'rejoinder',
-    'rejoining',
-    'rejuvenation',
-    'rekindle',
-    'relapsed',
-    'relativistic',
-    'relent',
-    'reliquary',
     'relishes',
-    'relived',
-    'remarry',
-    'remedying',
-    'remonstrated',
-    'removals',
-    'rename',
-    'renaming',
-    'renamo',
-    'renee',
-    'reneging',
-    'renegotiated',
-    'renegotiation',
-    'reni',
-    'reno',
-    'renouncing',
     'renovate',
-    'renovations',
-    'reordering',
-    'reorganising',
-    'reorganize',
-    'reorientation',
-    'repeater',
-    'replanting',
-    'replayed',
-    'replays',
-    'replenished',
-    'replicating',
-    'repo',
-    'reprehensible',
-    'representativeness',
-    'reprisal',
     'reproached',
-    'reptilian',
-    'requisition',
-    'requisitioned',
-    'reschedule',
-    'resenting',
-    'reshaped',
-    'resigns',
-    'resistivity',
-    'resold',
-    'resourced',
-    'restate',
-    'restive',
-    'restorations',
-    'restorer',
-    'restorers',
     'resurfacing',
-    'retching',
-    'retford',
-    'retinopathy',
-    'retraction',
-    'retriever',
-    'reuben',
-    'reunions',
-    'reunite',
-    'reuse',
-    'reused',
-    'revalued',
-    'reverberated',
-    'reverberation',
-    'reverent',
-    'revisit',
     'revitalising',
-    'revivals',
-    'revolutionise',
-    'revved',
-    'revving',
-    'rey',
-    'reykjavik',
-    'rf',
-    'rfl',
-    'rh',
-    'rhapsody',
-    'rheme',
-    'rhesus',
-    'rhondda',
-    'rhone',
-    'rhs',
     'ribble',
-    'ribosomal',
-    'ricci',
-    'rickenbacker',
-    'ricks',
-    'ridding',
-    'rideout',
-    'ridged',
-    'ridgery',
-    'riemann',
-    'rifleman',
-    'rigg',
-    'right-angled',
-    'righted',
-    'rimmer',
-    'ringer',
     'ringo',
-    'ringside',
-    'rios',
-    'rip-off',
-    'ripa',
-    'riscs',
-    'risk-averse',
-    'risk-taking',
-    'riskless',
-    'risotto',
-    'ritschl',
-    'rivalled',
-    'rivet',
-    'rivulets',
-    'rizzo',
-    'rj2.2.5',
     'road-building',
-    'roadblock',
-    'roadblocks',
-    'roadwatch',
-    'robbe-grillet',
-    'robina',
-    'robocop',
-    'robotics',
-    'rochefort',
-    'rochelle',
-    'rockall',
-    'rockefeller',
-    'rockingham',
-    'roddick',
-    'rodeo',
-    'rodger',
     'roehampton',
-    'rogatory',
-    'role-play',
-    'rolled-up',
-    'rollercoaster',
-    'rommel',
-    'romney',
-    'romsey',
-    'rona',
-    'ronson',
-    'rood',
-    'rookie',
-    'roosting',
-    'rootless',
-    'rorim',
-    'roseanne',
     'rosebery',
-    'rossetti',
-    'rossiter',
-    'rotherhithe',
-    'rotunda',
-    'roughage',
-    'roulette',
-    'round-the-clock',
-    'roundel',
-    'roundup',
-    'routers',
-    'roxborough',
-    'roxy',
-    'royale',
-    'royalists',
-    'roz',
     'rozario',
-    'rsi',
-    'rubberneck',
-    'rubin',
-    'rubric',
-    'rudy',
-    'rudyard',
-    'ruffians',
-    'ruffle',
-    'ruggiero',
-    'rule-based',
-    'run-in',
-    'run-of-the-mill',
-    'rupee',
-    'ruritania',
-    'rushton',
     'ruud',
-    'rx',
-    's\'pose',
-    's.i.b.',
-    's5',
-    's739',
-    's8',
-    'saa',
-    'saad',
-    'saaf',
-    'sabina',
-    'sable',
-    'sabotaged',
-    'sachets',
-    'sacramental',
-    'sacramento',
     'sacrilege',
-    'sacs',
-    'sadder',
-    'sade',
-    'sadf',
-    'sadism',
-    'sadist',
-    'sagely',
-    'sahel',
-    'sakata',
-    'sakharov',
-    'salaam',
-    'salamis',
-    'salbutamol',
-    'saleh',
-    'salem',
     'salience',
-    'salmeterol',
-    'salutes',
-    'saluting',
-    'salve',
-    'samana',
-    'samir',
-    'samos',
-    'samurai',
-    'sanatorium',
-    'sanctimonious',
-    'sandalwood',
-    'sandbags',
-    'sanded',
-    'sandpaper',
-    'sandpiper',
     'sankey',
-    'sardinian',
-    'sari',
-    'sartorial',
-    'sassoon',
-    'savory',
-    'sawn-off',
-    'sayin\'',
-    'scab',
-    'scabs',
-    'scaevola',
-    'scallop',
-    'scapa',
-    'scapegoats',
-    'scarabae',
-    'scarecrow',
     'scaremongering',
-    'scaring',
-    'scarring',
-    'scats',
-    'scavenge',
-    'sce',
-    'sceptically',
-    'scfa',
-    'schaffer',
-    'schematically',
-    'scherzo',
-    'schleswig-holstein',
-    'schloss',
-    'scholes',
-    'schoolmasters',
-    'schoolteachers',
     'schooner',
-    'schr&ouml;dinger',
-    'schwann',
-    'schwarzschild',
-    'scilly',
-    'scipio',
-    'sclerites',
-    'scoff',
-    'scold',
-    'scoops',
-    'scorch',
-    'scoreboard',
-    'scrapbook',
-    'scraper',
-    'scratchy',
-    'scre',
     'screenings',
-    'screwdrivers',
-    'scrip',
-    'scripted',
-    'scrummage',
-    'scrums',
-    'scuppered',
-    'scurrilous',
-    'scurvy',
-    'sda',
-    'sdi',
-    'sds-page',
-    'sea-bed',
-    'sea-floor',
-    'seaham',
-    'seamer',
     'searchers',
-    'seared',
-    'seascale',
-    'seawater',
-    'seawitch',
-    'secateurs',
-    'secede',
-    'secessionist',
-    'second-in-command',
-    'second-placed',
-    'second-round',
-    'secord',
-    'sectarianism',
-    'secularism',
-    'sedately',
-    'seddon',
     'seducing',
-    'seeding',
-    'seer',
-    'seethed',
-    'segal',
-    'sehcat',
-    'seizes',
-    'self-',
-    'self-assurance',
-    'self-critical',
-    'self-criticism',
-    'self-destruction',
-    'self-destructive',
-    'self-fulfilling',
-    'self-importance',
-    'self-important',
     'self-incrimination',
-    'self-indulgence',
-    'self-management',
-    'self-reliant',
-    'self-righteousness',
-    'self-serving',
-    'self-sustaining',
-    'selfridges',
-    'sellars',
-    'semai',
-    'semi-arid',
-    'semi-autonomous',
-    'semi-circle',
-    'semiotic',
-    'semiotics',
-    'semis',
     'senegalese',
-    'senescence',
-    'seng',
-    'senga',
-    'senility',
-    'sentencers',
-    'separateness',
-    'sepoy',
-    'sepoys',
-    'septimus',
-    'sequestration',
-    'sequins',
-    'serena',
-    'serf',
-    'serjeant',
-    'seroconversion',
     'serological',
-    'serpell',
-    'serrated',
-    'ses',
-    'set-piece',
-    'setting-up',
-    'settler',
-    'setts',
-    'sevenoaks',
-    'seventeen-year-old',
-    'seventy-nine',
-    'seventy-seven',
-    'severity=error',
-    'sg',
-    'sgml',
-    'sgr',
     'shackled',
-    'shacks',
-    'shahs',
-    'shallots',
-    'shambling',
-    'shamefaced',
-    'shaming',
-    'shandy',
-    'shangkun',
-    'shank',
-    'shankar',
-    'shapiro',
-    'shavings',
-    'shearman',
-    'sheehy',
-    'sheena',
     'sheepdog',
-    'sheeted',
-    'shelf-life',
-    'shell-shocked',
-    'shelly',
-    'shep',
-    'shepherded',
-    'sherpa',
-    'shetlands',
-    'shiel',
-    'shingles',
-    'shinwell',
-    'shipowner',
-    'shippers',
-    'shipwrecked',
-    'shirk',
     'shockingly',
-    'shoemakers',
-    'shoestring',
-    'shopped',
-    'shoreham',
-    'short-cut',
-    'short-eared',
-    'short-sleeved',
-    'shortcoming',
-    'shortfalls',
-    'shortness',
-    'shotguns',
-    'shouldering',
-    'shovelling',
-    'showering',
-    'shrewdness',
     'shrews',
-    'shrilly',
-    'shrink-wrapped',
-    'shultz',
-    'sibelius',
-    'sickert',
-    'side-by-side',
-    'sideshow',
-    'sidi',
-    'sidon',
-    'sieges',
-    'sigarup',
-    'sightseers',
-    'sigismund',
-    'sigmoidoscopy',
-    'sigmund',
     'silicate',
-    'silkily',
-    'silos',
-    'silvered',
-    'silverman',
-    'silverware',
-    'simmental',
-    'simplex',
-    'simulating',
-    'simulators',
-    'sinews',
-    'sinfonia',
-    'singed',
-    'single-party',
-    'single-storey',
-    'singling',
     'sinuses',
-    'sired',
-    'sisson',
-    'sit-in',
-    'six-foot',
-    'six-inch',
-    'six-thirty',
-    'sixth-century',
-    'sixths',
-    'sixty-eight',
-    'sixty-seven',
-    'sixty-three',
-    'sixty-two',
-    'siyad',
-    'sizing',
-    'sj',
     'skateboard',
-    'skein',
-    'skewer',
-    'skied',
-    'skimmer',
-    'skincare',
-    'skint',
-    'skoda',
-    'skulking',
-    'skylark',
-    'skyscraper',
-    'slacken',
-    'slanging',
-    'slaps',
-    'slapstick',
-    'slatted',
     'slavishly',
-    'sledgehammer',
-    'sleeveless',
-    'slicked',
-    'slimbridge',
-    'slimline',
-    'slimmed',
-    'slimmers',
-    'slob',
-    'slobodan',
-    'slop',
-    'slopping',
-    'slotting',
-    'slouch',
-    'slovenes',
-    'slovenian',
     'slovenly',
-    'slumping',
-    'slumps',
-    'slunk',
-    'small-time',
-    'smallfry',
-    'smallness',
-    'smartest',
-    'smarties',
-    'smartstream',
-    'smashes',
-    'smattering',
-    'smearing',
-    'smedley',
-    'smee',
-    'smilingly',
     'smirking',
-    'smithers',
-    'smokescreen',
-    'smollett',
-    'snapper',
-    'snares',
-    'snh',
-    'sni',
-    'snide',
-    'sniffs',
-    'snigger',
-    'sniggered',
-    'snm',
-    'snmp',
-    'snobbish',
-    'snooping',
     'snoopy',
-    'snooze',
-    'snores',
-    'snorkelling',
-    'snowden',
-    'snowflakes',
-    'snowstorm',
-    'soares',
-    'socialise',
-    'socio-cultural',
-    'sociobiology',
-    'sociolinguistics',
-    'sociolinguists',
-    'softens',
-    'softpc',
-    'softwood',
     'solbourne',
-    'soldering',
-    'solenoid',
-    'solicited',
-    'solidified',
-    'solver',
-    'somalis',
-    'somatic',
-    'some_one',
-    'somersault',
-    'somethin\'',
-    'songwriters',
-    'sonorous',
-    'sophocles',
-    'soppy',
-    'sorbonne',
     'sorcerer',
-    'soreness',
-    'sorrento',
-    'sorrowful',
-    'soulless',
-    'sounder',
-    'soundless',
-    'soundlessly',
-    'source=metapi',
-    'sourced',
-    'southerners',
-    'southernmost',
-    'southwold',
-    'sp&ouml',
-    'spaciousness',
-    'spam',
     'spanners',
-    'sparc-based',
-    'spasmodically',
-    'spastic',
-    'spastics',
-    'speared',
-    'spearman',
-    'specint92',
-    'specious',
-    'spectrometry',
-    'speculator',
-    'speechreading',
-    'speedier',
-    'speelman',
-    'spewed',
-    'sphincterotomy',
     'spillovers',
-    'spina',
-    'spindles',
-    'spine-like',
-    'spink',
-    'spinnaker',
-    'spinoza',
-    'spiralled',
-    'spiritualist',
-    'splice',
-    'splintering',
-    'spock',
-    'spoof',
-    'spool',
-    'spooned',
-    'spooner',
     'spp',
-    'sprained',
-    'spred',
-    'sprig',
-    'spurted',
-    'sq',
-    'sqn',
-    'squall',
-    'squalls',
-    'squats',
-    'squatter',
-    'squawk',
-    'squawking',
-    'squeezes',
-    'squirm',
-    'squirted',
     'src',
-    'srs',
-    'ssb',
-    'sssi',
-    'sst',
-    'stabiliser',
-    'stabs',
-    'stadia',
-    'stadiums',
-    'stager',
-    'staines',
-    'stainton',
-    'stairways',
-    'stallone',
-    'stampede',
-    'standardize',
     'standish',
-    'stanleys',
-    'stannard',
-    'stanzas',
-    'star-studded',
-    'starling',
-    'start-ups',
-    'stashed',
-    'stat',
-    'state-controlled',
-    'stateside',
-    'statistician',
-    'stats',
-    'statuettes',
-    'staveley',
-    'stb',
     'steadfast',
-    'steadman',
-    'stealthy',
-    'steamatic',
-    'steamship',
-    'steeled',
-    'steen\'s',
-    'steepest',
-    'steering-wheel',
-    'stefano',
-    'stencilled',
-    'stenson',
-    'stents',
-    'steppes',
-    'stepwise',
-    'sterility',
     'stewarts',
-    'stews',
-    'still-life',
-    'stillborn',
-    'stimulants',
-    'stipend',
-    'stipendiary',
-    'stipulating',
-    'stirlingshire',
-    'stirrups',
-    'stock-in-trade',
-    'stockman',
-    'stockpiles',
-    'stoddart',
-    'stodgy',
-    'stoic',
     'stoked',
-    'stoltenberg',
-    'stone-built',
-    'stonily',
-    'stoppard',
-    'storr',
-    'storytelling',
-    'stoughton',
-    'stourbridge',
-    'strachey',
-    'straddle',
-    'stragglers',
-    'straggly',
-    'straight_forward',
-    'strang',
-    'strangulation',
     'stratagem',
-    'strategist',
-    'strath',
-    'stratigraphic',
-    'stratocaster',
-    'streaking',
-    'streaky',
-    'streamliner',
-    'streisand',
-    'stretford',
-    'stringy',
-    'striven',
-    'strutted',
-    'strutting',
-    'stubbly',
-    'studious',
     'stuffs',
-    'stukeley',
-    'sturge',
-    'stutter',
-    'stuttered',
-    'sub-',
-    'sub-community',
-    'sub-contracting',
-    'sub-groups',
-    'sub-paragraph',
-    'sub-regional',
-    'sub-systems',
-    'subclass',
-    'subcontract',
-    'subliminal',
-    'subnormal',
     'subsiding',
-    'subsidize',
-    'subsisting',
-    'subsoil',
-    'substandard',
-    'subterfuge',
-    'subtitle',
-    'subtitles',
-    'subtype',
-    'suchlike',
-    'sues',
-    'suet',
-    'sufficed',
-    'suffices',
-    'suffocate',
-    'suffragettes',
     'suisse',
-    'sukey',
-    'suleiman',
-    'suleyman',
-    'sullom',
-    'sulphasalazine',
-    'summative',
-    'summerfield',
-    'summerhouse',
-    'summing-up',
-    'sump',
-    'sunburn',
-    'sunflowers',
-    'sunos',
-    'sunroof',
-    'sunsets',
     'sup',
-    'superbike',
-    'supercilious',
-    'supercomputing',
-    'superglue',
-    'superordinate',
-    'superoxide',
-    'superposition',
-    'surest',
-    'surfeit',
-    'surfer',
-    'surinam',
-    'surmount',
-    'surreptitious',
-    'surrogacy',
-    'surtees',
     'survivals',
-    'suspenders',
-    'sussed',
-    'suu',
-    'suzannah',
-    'sven',
-    'svidrigailov',
-    'swayne',
-    'swb',
-    'sweatshirts',
-    'sweeten',
-    'sweetener',
-    'sweeteners',
-    'sweltering',
-    'swerve',
-    'swinbrook',
     'swingeing',
-    'swirls',
-    'swishing',
-    'swivelling',
-    'swoon',
-    'swum',
-    'sydenham',
-    'symbiosis',
-    'sympathised',
-    'sympathized',
-    'synchronized',
-    'syndicated',
-    'synoptic',
-    'synoptics',
-    'synth',
-    'synthase',
     'systolic',
-    't\'s',
-    't.s.',
-    't1',
-    'table-top',
-    'tabulated',
-    'tac',
-    'tachycardia',
-    'tacks',
-    'tad',
-    'tadcaster',
-    'tadeusz',
-    'taggart',
-    'tagh',
-    'taif',
-    'tajan',
     'take-home',
-    'taker',
-    'talker',
-    'tallies',
-    'tamburlaine',
-    'tamper',
-    'tampons',
-    'tamworth',
-    'tandoori',
-    'tangential',
-    'tangerine',
-    'tangier',
-    'tangy',
-    'tania',
-    'tannin',
-    'tantalizing',
     'tanu',
-    'tanzanian',
-    'taplow',
-    'tapper',
-    'tarragon',
-    'tarrah',
-    'tashkent',
-    'tasker',
-    'tassels',
-    'tatum',
-    'tatyana',
-    'tau',
-    'tautly',
-    'tavernas',
-    'taverns',
-    'tawney',
     'taxa',
-    'taxi-driver',
-    'taylors',
-    'tbs',
-    'teardrop',
-    'teasingly',
-    'technocratic',
-    'technocrats',
-    'teclis',
-    'teddington',
-    'teeny',
-    'teetotal',
-    'tele',
-    'teleological',
-    'telepathic',
-    'telepathy',
     'telephony',
-    'televising',
-    'temp',
-    'templar',
-    'templecombe',
-    'ten-thirty',
-    'tenaciously',
-    'tenanted',
-    'tenascin',
-    'tench',
-    'tendentious',
-    'tenfold',
-    'tensors',
-    'tequila',
-    'termini',
-    'termly',
     'terracing',
-    'terrify',
-    'terrine',
-    'terrorised',
-    'testamentary',
-    'testaments',
-    'testes',
-    'testifying',
-    'testimonials',
-    'testosterone',
-    'tetra',
-    'teutonic',
-    'tgwu',
-    'thackeray',
-    'thakin',
-    'thalidomide',
     'theatrically',
-    'theism',
-    'theobald',
-    'theodor',
-    'theoreticians',
-    'thermopylai',
-    'thessy',
-    'thetford',
-    'thickens',
-    'thickest',
-    'thine',
-    'thinnest',
-    'thistles',
-    'thither',
-    'thor',
-    'thorburn',
     'thornfield',
-    'thoroughgoing',
-    'threadneedle',
-    'three-course',
-    'three-fold',
-    'three-man',
-    'three-part',
-    'threlfall',
-    'throaty',
-    'thrones',
-    'throwaway',
-    'throwback',
-    'thrushes',
-    'thudded',
-    'thunderbolt',
-    'thunderstorms',
     'thuringia',
-    'thyself',
-    'thyssen',
-    'tiao',
-    'tiara',
-    'tidiness',
-    'tightens',
-    'tilbury',
-    'timber-framed',
-    'timbered',
-    'timbre',
-    'time-cues',
-    'time-out',
-    'timers',
-    'timescales',
-    'timidly',
     'tinder',
-    'tinkle',
-    'tinkling',
-    'tinny',
-    'tintern',
-    'tints',
-    'tipper',
-    'tiredly',
-    'titans',
-    'titbits',
-    'tite',
-    'titfords',
-    'titmuss',
-    'titron',
-    'tlr',
-    'to-morrow',
     'tobacconist',
-    'tobie',
-    'todorov',
-    'toenails',
-    'toga',
-    'toggle',
-    'toiling',
-    'tolerances',
-    'tombola',
-    'tomes',
-    'tonality',
-    'tonbridge',
-    'tongue-in-cheek',
-    'tonkin',
-    'tonsils',
-    'toolbox',
     'toothed',
-    'top-end',
-    'topographic',
-    'tora',
-    'torah',
-    'torino',
-    'torments',
-    'torpor',
-    'torre',
-    'torres',
-    'torrid',
-    'torridon',
-    'tortious',
-    'torturers',
-    'toscanini',
-    'totalitarianism',
     'tottered',
-    'touchingly',
-    'tour_de_force',
-    'touts',
-    'townshend',
-    'townsmen',
-    'trackway',
-    'trad',
-    'trade-offs',
-    'trademarks',
-    'tragedians',
-    'trans-atlantic',
-    'transacted',
-    'transcending',
-    'transcribing',
-    'transducer',
     'transection',
-    'transepts',
-    'transgressions',
-    'transitive',
-    'transkei',
-    'translocation',
-    'transmutation',
-    'transmuted',
-    'transparencies',
-    'transparently',
-    'transput',
-    'treeless',
-    'trelawney',
-    'trem',
-    'trenchant',
-    'trenchcoat',
     'tresses',
-    'trestles',
-    'trevino',
-    'triads',
-    'triathlon',
-    'trickles',
-    'trier',
-    'triforium',
-    'triglyceride',
-    'trigram',
-    'trimble',
-    'trimmer',
-    'trims',
-    'trinkets',
-    'tripe',
-    'triples',
     'triplet',
-    'triplicate',
-    'trippers',
-    'trippy',
-    'triptych',
-    'tris-hcl',
-    'triticale',
-    'troilus',
-    'trombones',
-    'troon',
-    'trophic',
-    'troupes',
-    'trove',
-    'truant',
-    'truculent',
-    'trudge',
     'trudgill',
-    'trudy',
-    'trueman',
-    'truest',
-    'truetype',
-    'trumpeted',
-    'truncheons',
-    'trundling',
-    'trypsin',
-    'tsars',
-    'tuareg',
-    'tuba',
-    'tuckett',
-    'tucks',
-    'tudors',
-    'tues',
     'tuileries',
-    'tumbles',
-    'tunics',
-    'tuple',
-    'turbocharged',
-    'turd',
-    'turnip',
-    'turpentine',
-    'turpin',
-    'tutankhamun',
-    'tutor-organiser',
-    'tutored',
-    'tv-am',
-    'tw',
-    'twang',
-    'twat',
     'twe',
-    'tweak',
-    'tweezers',
-    'twelve-year-old',
-    'twelves',
-    'twenty-fifth',
-    'twiggy',
-    'twirling',
-    'twittering',
-    'two-fifths',
-    'two-goal',
-    'two-handed',
-    'two-pronged',
-    'tynecastle',
-    'typeset',
-    'typesetter',
     'typewritten',
-    'typhoon',
-    'typifies',
-    'typify',
-    'tyrion',
-    'tyrol',
-    'tyrolean',
-    'tzann',
-    'u21',
-    'ubs',
-    'uc',
-    'ucca',
-    'ufc',
-    'ugt',
-    'ulema',
-    'ullapool',
     'ullman',
-    'ulpian',
-    'ulrich',
-    'ultramar',
-    'umpteenth',
-    'unaccounted',
-    'unadorned',
-    'unadulterated',
-    'unafraid',
-    'unassisted',
-    'unavoidably',
-    'unbreakable',
-    'uncannily',
-    'unceasing',
-    'unclassified',
-    'uncompromisingly',
     'uncooked',
-    'uncoordinated',
-    'undeclared',
-    'under-used',
-    'underachievement',
-    'underclothes',
-    'undercoat',
-    'underdog',
-    'underestimates',
-    'underestimating',
-    'underpaid',
-    'undersea',
-    'undersides',
-    'undertone',
-    'undervalue',
-    'undeserved',
     'undiluted',
-    'undressing',
-    'undying',
-    'uneconomical',
-    'unelected',
-    'unemotional',
-    'unencumbered',
-    'unenthusiastic',
-    'unequalled',
-    'unexciting',
-    'unfailingly',
-    'unfathomable',
-    'unfilled',
-    'unfortunates',
-    'unfurled',
-    'unheated',
     'unhurriedly',
-    'uni',
-    'unimpaired',
-    'unimpeded',
-    'unimpressive',
-    'unincorporated',
-    'uninjured',
-    'uninspired',
-    'unknowable',
-    'unleashing',
-    'unmade',
-    'unmanned',
-    'unmasked',
-    'unmitigated',
-    'unpaired',
-    'unpolluted',
     'unprincipled',
-    'unquestionable',
-    'unquote',
-    'unread',
-    'unrealised',
-    'unreasonableness',
-    'unrecognisable',
-    'unrecognizable',
-    'unreliability',
-    'unrelieved',
-    'unrepresented',
-    'unrequited',
-    'unrewarding',
-    'unsaid',
-    'unsaturated',
-    'unscrew',
     'unscrewed',
-    'unseeing',
-    'unsettle',
-    'unshakeable',
-    'unsurpassed',
-    'unsurprising',
-    'unswerving',
-    'untainted',
-    'untamed',
-    'unthinkingly',
-    'untie',
-    'untrammelled',
-    'untrustworthy',
-    'unwavering',
-    'unwinding',
-    'unworldly',
     'unzipped',
-    'up-front',
-    'upjohn',
-    'upped',
-    'upperparts',
-    'uppers',
-    'uprating',
-    'uprisings',
-    'uproot',
-    'upstaged',
-    'upstart',
-    'upwardly',
-    'urbanized',
-    'urdu',
-    'urethral',
-    'us-led',
     'usability',
-    'uselessly',
-    'username',
-    'usurp',
-    'usurper',
-    'utilises',
-    'uuuc',
-    'uv5',
-    'uvb',
-    'uzi',
-    'uzzell',
-    'v2',
-    'va',
-    'vacate',
-    'vaccinia',
-    'vacuous',
     'vadinamia',
-    'vagabonds',
-    'vagotomy',
-    'vaguest',
-    'valenzuela',
-    'valery',
-    'valiantly',
-    'valle',
-    'valueless',
-    'vampires',
-    'vance-owen',
-    'vanuatu',
-    'variable-reluctance',
-    'variances',
-    'varley',
-    'varsity',
     'vasey',
-    'vaudeville',
-    'vaunted',
-    'vaux',
-    'vax/vms',
-    'vd',
-    'vee',
-    'veer',
-    'veering',
-    'veers',
-    'vegetative',
-    'veneers',
-    'vented',
-    'venting',
-    'venturi',
-    'ver',
     'veracity',
-    'verdant',
-    'verifiers',
-    'verisimilitude',
-    'veritas',
-    'vermilion',
-    'vernage',
-    'vert',
-    'vesting',
-    'vesuvius',
-    'vexatious',
-    'vfm',
-    'vibrancy',
-    'vibrato',
-    'vicariously',
-    'vice-admiral',
     'vice-chair',
-    'vice-premier',
-    'vice-versa',
-    'victimised',
-    'victimization',
-    'vied',
-    'vigilante',
-    'vigilantes',
-    'vigo',
-    'villager',
-    'villous',
-    'villus',
-    'vinaigrette',
-    'vinci',
-    'violas',
-    'viper',
     'vips',
-    'visconti',
-    'viscose',
-    'visigoths',
-    'vitiated',
-    'vitrinite',
-    'vivaldi',
-    'vive',
-    'vixen',
-    'vl',
-    'vocabularies',
-    'vociferously',
-    'volcanism',
-    'voles',
-    'volker',
-    'volkskammer',
     'voss',
-    'votive',
-    'vowing',
-    'voyager',
-    'vulva',
-    'vzv',
-    'w.c.',
-    'w1v',
-    'waddled',
-    'waft',
-    'wafting',
-    'wage-earners',
-    'wagnerian',
-    'waigel',
-    'waimea',
-    'wain',
     'wakefulness',
-    'wakened',
-    'walk-in',
-    'wallow',
-    'wallpapers',
-    'wallsend',
-    'walrus',
-    'wanderer',
-    'wank',
-    'wanly',
-    'warbird',
-    'warbirds',
-    'warder',
-    'warhead',
-    'wark',
-    'warley',
     'warm-blooded',
-    'washbasin',
-    'washburn',
-    'washout',
-    'washroom',
-    'wat',
-    'watanabe',
-    'watchmaker',
-    'watchword',
-    'watercourse',
-    'watercourses',
-    'waterfowl',
-    'waterproofs',
-    'waterwheel',
-    'waterworks',
-    'watkinson',
     'watling',
-    'wavertree',
-    'waxes',
-    'waylaid',
-    'wc2',
-    'wealden',
-    'weaved',
-    'wedd',
-    'wednesbury',
-    'weeded',
-    'weedon',
-    'weeklies',
-    'weetabix',
-    'weft',
-    'wehrmacht',
-    'wei',
     'weightless',
-    'weill',
-    'weinberger',
-    'weldon',
-    'well-behaved',
-    'well-bred',
-    'well-cut',
-    'well-earned',
-    'well-fed',
-    'well-formed',
-    'well-heeled',
-    'well-kept',
-    'well-lit',
-    'well-made',
-    'well-organized',
-    'well-planned',
     'well-run',
-    'well-wishers',
-    'welles',
-    'welterweight',
-    'wendell',
-    'westbound',
-    'westbury',
-    'western-style',
-    'westerns',
-    'westfield',
-    'weston-super-mare',
-    'wetherall',
-    'wets',
-    'wettest',
-    'wham',
-    'wharves',
     'whelks',
-    'wherewithal',
-    'whet',
-    'whin',
-    'whist',
-    'whitchurch',
-    'white-hot',
-    'whitehill',
-    'whiteside',
-    'whither',
-    'whitlow',
-    'whitsun',
-    'whitworth',
-    'whizzing',
-    'whole-hearted',
     'whoosh',
-    'wicks',
-    'widgery',
-    'widgets',
-    'widowhood',
-    'wiggle',
-    'wigley',
-    'wiles',
-    'wilf',
-    'wilfridi',
-    'wilks',
-    'willard',
-    'willem',
-    'wilmot',
-    'wilting',
-    'wim',
     'wincanton',
-    'winchelsea',
-    'winchelsey',
-    'winches',
-    'wind-blown',
-    'winded',
-    'winder',
-    'window-sill',
-    'windowing',
-    'windpipe',
-    'wing-tips',
-    'winkle',
-    'winks',
-    'winstanley',
-    'wis',
-    'wisp',
     'with-profits',
-    'witt',
-    'witton',
-    'wm',
-    'wmc',
-    'woil',
-    'wok',
-    'wolfson',
-    'womanly',
-    'womenfolk',
-    'wonderment',
-    'woodbine',
-    'woodbridge',
-    'woodcuts',
-    'woodhall',
-    'woodpeckers',
     'woodside',
-    'work-out',
-    'workaholic',
-    'workhorse',
-    'workmanlike',
-    'worksop',
-    'worrell',
-    'worriedly',
-    'worryingly',
-    'worshipful',
-    'worshipper',
-    'wot',
-    'wou',
-    'wrest',
-    'wrestler',
-    'wrestlers',
     'wretchedly',
-    'wrinkle',
-    'wroughton',
-    'wru',
-    'wt',
-    'wulfhere',
-    'wulfstan',
-    'wychwood',
-    'wylie',
-    'wyoming',
-    'wysiwyg',
-    'x-rayed',
-    'x.desktop',
-    'xavier',
-    'xl',
-    'xmas',
     'xviii',
-    'xy',
-    'xyz',
-    'y/n',
-    'yak',
-    'yalta',
-    'yardley',
-    'yasmin',
-    'yazov',
-    'ybreska',
-    'year-olds',
-    'year-on-year',
-    'yellowed',
-    'yelp',
-    'yelped',
-    'yemeni',
     'yevgeny',
-    'yi',
-    'yitzhak',
-    'yobs',
-    'yolande',
-    'yong',
-    'youngish',
-    'youngs',
-    'yr',
-    'yt',
-    'yule',
-    'yup',
-    'yusupov',
-    'z-score',
-    'zadak',
-    'zamzam',
     'zany',
-    'zanya',
-    'zap',
-    'zbigniew',
-    'zebras',
-    'zechstein',
-    'zeebrugge',
-    'zeke',
-    'zeneca',
-    'zeolite',
-    'zhelev',
-    'zhukov',
-    'zionism',
-    'zipper',
-    'znf',
-    'zola',
     'zombies',
-    'zonal',
-    'zoned',
-    'zoning',
-    'zoologist',
-    'zuckerman',
-    'zx',
+)
+
+blocks_07 = (
+    '$";-%!2!$copy!*dollar;1.5)!2)%5,000*"0m(&20,000*%0,000*!m)!5*$,000*!0+$,000)!m',
+    '(!4)$,000(\'500,000)!m(!6)"00(!7)"00(!8)"00!+eacute;mile!*frac12;in.!)mdash;and\'#see"$icro',
+    '!\'ouml;vp!+pound;1,800(#.00)"2m)"3m)!4)!7)!8)"95($0.95(%1,000)#.95(&40,000($5.95(%6,000',
+    '(!9("bn\'$2.00)"25)"95(#000("20(!3("40("5m(!7)!5($9.99\'$3.00)"25',
+    '(!3(!6(!8\'#4.5(!4(%5,000\'$5.50(#00m(%5,000\'%7,500(!m\'$8.95("50(!m!#rgr',
+    ' #\'90!"as!#elp!$ouse %*****!#new %-&bgr!"10!!5 (/diploma )0&ndash;0!#.2%""9%!!0"#:19',
+    '$!1#"40!#532!#891#!8 $1(3)!(,500,000!!.""15"$30pm""5m!%0&deg#(ndash;11"$-day"".7',
+    '"#0mm""16""24""in""lb""pc""s.!*1&ndash;12"#-12"".8"%0,000""50!#2.4""59#!g',
+    '""ft"!p!#3.1#!2#!3#!4#!5#!6""30""40""77""81!#4.1"%0,000""70',
+    '#!5!$5-16#$year"".1""20#!2""36""42#!3#!5#!9""50#!5""80#!8',
+    '""97""cm""ml!*6&ndash;19"!+"".1""01#!2#!4#!9""10#!8""21#!4#!5',
+    '#!8"#30s#!8""41#!3#!4#!7"#50s#!4#!5#!6#!8"#60s#!1#!5',
+    '#!8""72#!4#!9""80$!s#!2#!3"#90s#!1#!5#!6#!7#!8#!9',
+    '"!v!+7-year-olds""03#!4#!9""12#!6#!8#!9""24#!5#!6#!8""31#!2',
+    '#!6"#40s#!1#!2#!3#!4#!8"#50s#!3!\'8-month!%9&ins"#78a#"9b"*80&ndash;1+"81',
+    '#"2b#"3b#"4a$!b#)5&ndash;6#"6b#$7/88#"8b"#90a#$3-94!!c"!m!"mb""in!"s.',
+    '"\'ndash;2!#(3)!$,600!"-2!%.30pm!\'0&deg;c#(ndash;25"\'-minute""03""25""ft""mm!#200!#400"!4',
+    '!"53""mm!"63"!4"!6"!9!\'7/10/93"!9!"82"!3"!4"!5!"93"!4"!6',
+    '!":1!!c!"gb!"mb $3(2)!#.12#!3#!5"$30pm""5%#$&ins!"/4!%0&deg"!7"!8',
+    '!"14"!6"!7"!8!"21"!2"!6"!8""nd!%3,000"!5"!7"!8"!9!"43',
+    '!"55"!6"!7"!p!%6&ins"$,000")-year-old"!2"!3"!6"!7!"71"!2"!6!%8,000',
+    '"!7"!8""th!"94"!5"!6!"am!!c!"ft!"lb!"mm!"oz $4&ft"#ins!"-5',
+    '""11#!5""5%!*0-year-old"!2"!3"!8"!9!"13"!8!"23"!9""nd!*3-year-old"!2',
+    '"!5!*7-year-old!%8&ins!"d.!"ft )5&ndash;2!$,500!"-0"!2"!6!#.00""10"$30pm!*0&ndash;50"#/50',
+    '"!1"!m""pc!"3%!"40!"60!"9%!"am!"in!"mm!!s )6&ndash;0(!9!#(1)!"-7',
+    '""10!"01"#mph"!p""th!$1(1)!"25!%5,000!"6%!"85!"9%!"am )7&ndash;8!#(4)!$,500',
+    '""00!"07!"1%!"20!"3%!"4%"!0!&50,000"!g#$/3oz"!p!"68!"9%!"lb )8&ndash;9',
+    '!!.""00"!9!#00m")486-based!"1%!"4%"!0!%5,000!"7%!"8%"#110!"d.!"ft!"lb',
+    '"\'ndash;1!#.00"$30am!&00,000!"11!"2%!"4%!"in \'a&amp;m!#.a.""g.!"66!%bacus#$shed""be',
+    '"(dulkerim"+erdeenshire$\'gavenny""ie#1ngdon/oxfordshire"&khazia"&lation")omination#*ve-average"&ridged#&ogated"%scess\'"es#*ent-minded-"ly',
+    '\'#ism#\'taining$\'racting#(urdities""ta""ul!%c-asa"&anthus"\'cademia#)elerators$$nted#+ompaniments&\'lishing$$sted"\'hievers',
+    '"$kner"$orns"!p"&quaint$"it")tinomycin$&vators#"us"$uity!(damantly#$pter"$d-in##ams#"er#\'ictions',
+    '"+enoidectomy%"ma$%ylate"\'hesives"#kin"&mirals$&ttance#\'onition"!n"$olfo##nis#%rning%$ment"!p"(vantaged',
+    '!"eg"$neas"#ons"*rodynamics!"fc"(fidavits$!x#$lict"%ghans")icionados"!p#"fl"\'rikaner#!o"(ter-care',
+    '&%sales!)ge-groups$\'related##ist##nce"(gressors"\'incourt#&tators"%onist%#zed"!r#!a!#hem"$ilar!\'igburth',
+    '"&rbrake#$flow#$less$%ifted#$mail#*worthiness(!y!$jayi!%l-din"\'abaster#$mein#%sdair"#ban"\'chemist#)ohol-free',
+    '$\'rmaston&"en%#son#%frith#$helm#!o$"us#$rich"$erts#\'ssandro"&foxden""gy"%ianor#"ne#%quots',
+    '"\'l-clear$#day$&in-one%&reland$%union#$ayed#$egro$\'viation#\'ocative#%uding"%nwick"\'oofness#!t")tercation%%nated',
+    '##man#"os""un"&veolar$!y!%mabel#\'lgamate)$ions\'%emnon#"ss%#ing#"to##zes"#ble#)ulancemen',
+    '"(eliorate#"ry"$ines"+niocentesis"#oco##ral"#peg#&hibian"&undsen"%yloid!+naesthetics*"st#\'lgesics#"nd#$phor',
+    '\'"ic#(ximander"\'dalusia#*ersonstown&#son#$orra#$roid"%erley"\'gelfish$"rs#(ioplasty%&tensin#$lais$\'icanism$*o-catholic',
+    '#$rier"$ions""lt"#nes#\'ihilate#&uities$%lment$(nciation%%ziata"\'ointing#!n#$raks"#son#(werphone"(tagonise',
+    '$"ll#\'e-natal#(hologies$+ropomorphic#+i-clockwise%$drug%)inflation%$lock%)pollution%%trust%%virus$)bacterial$)clockwise$+depressants$*neutrophil',
+    '$\'quaries$$sera\'"um%%ocial$(thetical!"oc!(pertures"#gpr"\'hrodite"#lin"$ogee#(logizing#)thecaries&$osis")paratuses',
+    '$"nd&#age&&icitis#\'lauding#&ortion#*rehensions%*nticeships$\'obation%)priations%\'ximates*#ing"\'titudes!#qib""ua$&marine',
+    '#"zi"+bitrariness\'%tions#&oretum$"ur"\'changel$)bishopric$%etype$&imedes$"ly$$ways#!o"#eal#"ns"&ghatun',
+    '"*istophanes#)thmetical"#kle"#les#&ington##ott"(mageddon$"nd##ing"$nhem"$omas#$uses"!p"(rogantly"&senals',
+    '$)ficiality#%works"#yan!#sfv""he$!r#$leys#"ok"$ides"%kance"#pen#$ires"#ses%%sable#)imilating',
+    '#*ociability#$uage\'!d$%redly"\'teroids##ral$(ological%\'physics#%urias!"tc"&enolol"-herosclerosis"#kin"!m"#oll',
+    '"&ropine"!t#&ainers&!s#&enders$#sts##ics$"la!&u_pair"\'bergine)!s"%dibly$\'tioning"#ght#)mentation',
+    '#(ustinian&!o"#rae$%ngzeb"$spex#!t$+ria-hungary%+o-hungarian"+thentically$+oritatively#%omate\'"on$+radiography"%xerre!*vant_garde',
+    '"&erting"$itus!&wnings"$oken!&xelrod"#les""on!%yling"%odhya"#res!&zaleas"#tec \'b&amp;b"5eacute;r&eacute;govoy!%.e.t.',
+    '!&acilli&"us#\'k-bench*#ers$$fire$$room#,teriological"*den-powell"$ffle#"ta"%gshaw"$ilie#"ns"$kker""la',
+    '&$hine#%combe##dly$#ock#$lard$%point$\'ycastle##zac"#mbi"%ndied$%stand#$gers$#les#&ishing&$ment',
+    '##que#%stead#"tu"!o"\'ptismal""rb$#our$"ra#(claycard##dot$$sley##est##ged$#ing#%nardo',
+    '$&icaded"$shir#%inger#"ra#&setlaw##ten$$ille""te#$hers##ons#)tlefields&%ships"#uer#$xite"%wling',
+    '#%field##ley"%zaars!!d!%eachy#$ding$!y#$kers#$sant##ter&!s#\'ujolais$!x%%-arts#$vers',
+    '"&ckford$#ons$$with"$dale#\'chamber#\'dington#%stead#%worth"&eching#$ston$#wax"&fallen##ell#%itted"&grudge',
+    '"#ith"#lch#%grave#%ittle#\'ladonna$&ingham##off#$ting#$voir"\'moaning"%nazir#&becula#"ce##der#&edetti',
+    '$&ficent(!s&$tted#&ighted%#nly"\'regovoy$$nice$#tta#%gerac$$haus#$kley#%liner%"oz$&usconi#!n',
+    '$"dt$#ini#)wickshire"*ssmertnykh#$tial$%owing"$tide#&rothal#)ter-known&"ed&!s"$xley!(haratiya"$opal"!p',
+    '!)i-monthly""cc#(entenary""de##ing$)rectional#$well"$ffen##ida"&g-time##gin#$orre$#ted"*lingualism$%rubin',
+    '$%eting$\'ingsley%&onaire$$owed"&naries#$ders#!g"$otic"(partisan#$lane"%rches#*d-watching#%kdale#"se"(shoprics',
+    '#$sett"$tchy#)ter-sweet"&valves#$ouac""ya"\'zarrely!)lackbeard%#est%&mailed)#ing%%stone%$wood#%dders#$enau',
+    '#&kelock##ncs$#ked##zes"$eary$%sdale$$ting##eds#\'nkinsop#&omycin"\'ockaded%#ers#"is#+od-pressure&\'stained',
+    '$#med#%tched\'!s&!y$#ter"(ue-black%$grey$$bird#%ffing##ish#"rb#$sher&!s$&tering"$yton',
+    '!"oa#,rding-school#%stful"%bbies%!n"#ddy#!e##ied$!n"%ffins"&geyman##ota""hr"%iotia"&linger',
+    '%"oi#&tzmann"$nard#%dgate#"ed#"go#$nard$#ets##sai"#obs#)k-keeping$"ie$\'keeping$%maker#!s',
+    '"(rrowdale"\'sanquet#%nians"!t#$ched#(tlenecks"%ucher#$doir#&ntiful#"rn"$vary##ril"%wring"(ycotting#!o',
+    '!,r&uuml;ckner"%abham#&cewell$%keted#%dwell#$emar##gad#*instorming%!y#$mall$#ley#%ssard%"es%!y##ver',
+    '%"st$#ura#\'zilians""du"+eadth-first$\'kfasted%#out%%spear%(throughs$*st-feeding$&thable#!n$#ner#"ws%#ter',
+    '#(c-a-brac$!e$\'k-built#&dgeman%%north%%water$#led&!s#!e#$gham#$ndle#$stly#%tain\'%%nnica$(ish-born',
+    '#"ze"!m"!o#(adleaved%$moor%&stairs#"ca$!k#&derick#$gues#"nx##ods$&mfield%!s&$tick',
+    '#!t"$yson!"si!"tr!%uccal$%leuch#%kling""dd$%hists$#ies"\'ffaloes"%gging"#ick"\'lldozed$"er',
+    '"#nce#\'despost$$ling##gay$#led%#ing#!n#"ty"#oys"%reaus#%ghers$&undian##mah#%nside$%t-out',
+    '$$owed#&saries&!y"&s-stop#$ting"%tlins#!s##ted%%rmere$&onhole$&ressed#%yrate"$y-in!(y-passed"&e-laws',
+    '"&passes $c.b.!%abbie#%ochon#"ra"$ches##kle&!d"$ddis$$ying#!e$#nce"(erphilly#&sarian"#fod',
+    '#%liari"$hill"\'irngorm"$jole&!d#"un"%latin#%daire#$gary#\'linicos$"um#\'modulin#&vinism"$mber&#ley',
+    '##eos$$roun#$mell#%omile#$pers$!o$"ra"$naan$%letto#*cellations&!s#\'delabra$%lelit#!n$$ibal',
+    '#$tata$#ons"#p\'n#"er$!s$$tian#%pella#&saicin$$ized#(tivating"%rbide$\'urettor#$case\'!s##dia',
+    '&#ing#$ibou$\'catures#%lotta$!y#$naby$%itine%$vore#(r&eacute$%adine$&uthers#\'shalton#*te_blanche%"rs$$hage',
+    '#$vers"!s#\'e-study$!d$"in#%hflow$#man#\'seroles#%tells&#nau#\'ualness#$well")taclysmic$%racts%"rh',
+    '#$cher%&phrase##hay#!i"$udal#$then$&ioning"\'valcade$!n#$eman##ing"$xton"$yman!"cc"!w',
+    '!)ease-fire%&lessly"!c"!d##ars#!e"%ilidh"#lie#$lnet$"os")mentation"(nsorious&!s$$ured#$taur',
+    ')!m%%ifuge$)uries-old!#ftr!"ga!#h\'i"%afing#$llis#%monix#(ncellery$#don$#ger$#non$$sons#&ovalit',
+    '$#pie#+racterising$!d$#gee$$lene&#roi%$wood$#sky$$tist##ter$#tel&$rley#-uffeur-driven"%eadle#%ck-in',
+    '#%ekily$"le$%rless#"ng##rub#$sney#&valier#!z"#ieh#*ld-bearing&\'centred%&minder$"ls$%terns#$mera',
+    '#&natown$%gford#(ppendale+!s\'#ham%$ings#$sels#!t#\'valrous")lorinated"6olangiopancreatography$+ecystokinin%&steryl#!o$"sy',
+    '#*reographic"!p")ristmases"!s"!u#%ckles##tes$#ney!)iba-geigy"%cadas#&s/6000"%nders##que##zia""ob',
+    '"(rcuitous%%lates%&mcised&&vented"\'splatin"&tibank$$corp#$rate$(o&euml;n"(vilising$#tas!&lairol#"ms##ncy$$ging',
+    '%$nets#(ss-based%)ificatory"!e#)an-shaven%#est%#ser$"ry$#ved#%mency&!s#\'restory$$mont#&verest#!y',
+    '#&mactic%&tology#"nk"#ods#&se-ups%&d-loop#$tted#%uding#%wning#$ying"%ubbed#"ny!"m.""ea""nd',
+    '!#nes!+o-existence#%pilot")agulation#(l-mining$$esce(#nce$)ification#%rsely#$ster%&guards%%lines#\'tbridge""bb$#ett',
+    '"%ck-up$#ing$%roach#!o$!m$$oned""da#\'e-named$"sa#$ling"$erce"*ffee-table"!g#!s"*hesiveness',
+    '"%iling#"re"&l.-gen#&dfield$&stream$%water#!l$*aborations%#ges%$tion$\'ectable\'%ivity%\'giality%"tt%!y',
+    '$%usive#!m#%naghi#%onels$%sseum&"us#&quhoun#\'umnists##vin"$mely#)fortingly#.mercialisation+&zation$(issariat$&unique',
+    '#*panionable%$sses%%triot$#els%&nsates%%tency$(ilations$(lacently&&inants%&etions$-rehensiveness$\'unction"#nan#&ceited&#ves',
+    '$%isely$&oction$\'urrence#%dense$)itionally$%oning#"ey#)ferencing$&idante%%g.sys&#ure$\'ormance(&tional\'#ist#+glomeration',
+    '%&egated))ionalists#&jugate)!d##ker#(nectives%$xion$#ing$(oisseurs#"or#&script$*ervatively)%ories+!s$#ign',
+    '$-titutionality%\'riction&(uctivist)#ors$*ul-general&!s%&mables#*taminating$%emnor%&ntions%&stable("nt%.xt-specificity$$inuo$%oured',
+    '&%ctile(%ually&#lto&&vening%#ite&%vance#\'versing%\'yancers$%inces$%ulsed\'#ive"!o#"ed##ing#%kbook',
+    '#$lies#$mbes#!p$&erated#"te"\'piously##ley#(rocessor#!t#\'ulation#\'yrights"%razon##byn#%delia%!n',
+    '%%llera$$oned##ker##mac$&orants##nea$$ford$$ices$!y#,respondences$$igan$(oborated*#ion#$sair$#ets',
+    '#,ticosteroids$"ot"$smas#$siga#%tello#%worth""te#(herstone#"on#&tagers"%ulson#(nsellees\'!s$+ter-culture\'$pane',
+    '#%plets#)rageously$%gette$$mont$&tesies%%house"(variance#%erlet"%wdrey#"es#!l##per"&xswain!"pa""cz',
+    '"!m""rs"!s"!v!*r&ecirc;pe$(grave;me"&addock#%mpons#$ngle$#ial%"ng$"ks%!y$$nies##vat',
+    '#"xi##yon"%eamed#&dulity##eds$$pers#"me#"pe##tan#$vice##wed$#man%"en"#ier#+minologists',
+    '$#kly##spy$\'s-cross$%tiani"&oaking##cus&"es#\'issants#"ne$"in#+ss-examined&$spar#%thers#$wbar$)ninshield',
+    '"\'uciform##der##fts#(ickshank#%mbles$#lin#!s$"oe"+ystal-clear\'$lize((ographic!&ubists"%ddles"%ellar"$lkin',
+    '#(pability#$vert"#min#$ming#$ulus"$pola"(ratorial##dle$!s#(iosities#\'tailing#(vilinear"*stom-built"%tback#"ty',
+    '"%mbals"&priots"$rene"#sts"-tomegalovirus /d&uuml;sseldorf!$\'art"!s!$-day"$mark!!3!!4!!5!&abbing$"le',
+    '"#cha"#dda"$gmar"&intily#"wa"#kar"#lby#!l$"am#&radian"%miani##ped"&ndruff#(gerfield$"le',
+    '$"ii#!s"\'rk-eyed$$room##ned%"ll#$rell#\'tington"\'ta-base$#ble$%quest$#set#"um"%unbey#$phin',
+    '#"os""wg#$kins"&ydream!$csls!"dt!&e_luxe"%adpan#"no#%rlove#&th-bed"(bauchery#$ited#%onair"&cibels',
+    '$\'mposing#&rement"\'ducting"&ep-set"%faced$%ulted("rs#&eatist$&ctions&"or#)initional#$late$&ecting#(ormities#$rost',
+    '#)enerative"&launay$$ware#"ft#!i$\'ghtedly\'#ing$%mited$%neate(#ion#"le##ved""mi$#rel#+obilization',
+    '$\'ralized#"ur"$nims#%nison#(ominated#!s#%tdale$#ine%$stry$$ures#$uded$)nciations"\'odorant#"p2"\'pardieu',
+    '#\'ictions#&loring#)ortations$\'sitions\'"or#(reciated$(ivations&"es""re$\'gulated#\'matitis"(scriptor#(ecration$%rters#(ignating',
+    '#%kside#&pising$(ondently%!t##sie#(tabilise*#ing)"ze$%inies%&tution"*teriorates#\'onation"%utsch#!x"&venish',
+    '%#ted#$otee%$ions""wi#%sbury!"fc!#hac#"ka!\'iaspora##tom"$bble"&ckhead$"on$!y#&tators',
+    '"&e-hard#\'lectric#&ulafoy",fferentially$\'idently"(gestible&!s#&itized#\'ression""li#%uting"%mitri&"ov"$namo##gle',
+    '$!y"&odorus#!n$%ysius"#phe"%sable$+dvantageous$*pprovingly$\'rmingly#\'banding$&elieve)%ingly#(cernment$&harger$(omfiture',
+    '&%tents%&urages%%verer$(rediting%(iminates#(embarked$+nfranchised%$gage)!d)$ment#\'harmony$#ing$\'washers#*incentives%(fectants',
+    '#&liking#$obey\'"ed$$wned#*paragingly$&ensary$)lacements$%roved#\'qualify#*respectful#!s$#ect%(rtations$%onant$%uaded',
+    '%$nded$(illeries\'#ing$(ractedly%(ibutable#\'ulphate"&tching#%hered##ton""va#&erging$"st&"ed&$ment#%orcee',
+    '"&zzying!!k!%mitri%!y!$obbs"$cker$$land#%tored&#ing#&umenta"!d#"ds#!o"$ggie"#lan',
+    '"&menico#%inica""na$#ghy#&ington#$ning$!y#%oghue"&omsday#$rmat"&pamine##ing"#ran#%dogne#!e',
+    '#$ling##mer#%tmund"$ting##tie"-uble-breasted\'&decker\'%edged\'%sided#&ghnuts"#wie#$ling##ney$$pipe$!y',
+    '"#yen""zy!&ragoon#&inpipe#$pers"&eamers#&nching#(ssmaking##xel"(ift-nets"#oit#"ll##ned%!s$#ing',
+    '#$p-in#"ss#%ughts#\'wsiness"%ucker#%mmers#%nkard!!t!$uart"\'brovnik"\'cklings"!d"$ffel$$ield"$gout',
+    '"(l&eacute##cie##ler"$mbly"&nblane#&donald#&garvan##ham$#ill#$keld#!s"(odenitis#$poly"(plicates"\'rations',
+    '##kin"#val!"vi!!w"%arves"$ells"%indle!!x!,ysfunctional#&pepsia$$noea #e.g""r.!%admer"#mes',
+    '")rnestness$,ings-related#%piece#$ring#$thed&!n"$sels$%ments#\'ingwold#(y-to-use"\'vesdrop!%bbing"&enezer!\'cgberht")hinoderms',
+    '")lecticism#%ipses"#ole$%ogist""us!#dam"&ucator!\'ffector$&minate#(icacious$$gies!\'ggshell"&linton#!r"(ocentric',
+    '!$ider%$down"(genvalue$!r#\'ht-hour&&thirty%,een-year-old"!s!*laborating#!n""be"#don")ectorally(#tes%*rochemical',
+    '$!y#,ven-year-old&*th-century"$ixir"$lery#%ipses"%speth#%worth"$tham"(ucidated##ted!\'manates$\'cipated"&balmed#\'oldened',
+    '"&igrant&$ting#\'ssaries"&meline$%rdale"(oluments"&powers!+ncapsulates#)hantments#%loses#%roach(%ments#\'umbered"$dear&"ed',
+    '#&otoxin#$ures"$emas"(gagingly#-lish-language#%raver"&hancer"&joined"\'listing$#ven"&quirer&%ingly"\'rolling"*tanglement#&eritis',
+    '%*prise-wide#&hroned#&itling#*r&eacute;e"(umerated".vironmentalism-+ly-friendly$&saging!&ochaid!(phesians%"us"(iscopate$$odic$%temic#\'tomized',
+    '#"xy"#rdf!"q."*ualisation!*radicating#!s$#ure"$hard""in""os$$ions#&ticism"\'udition##pts"#win',
+    '$$pade(!s%%ement"$kimo"\'planade"!q"!s#)entialist"#ter#"on!(thically#%ology"\'ruscans!%uboia"$clid',
+    '#$enie&"us"$nuch"-phemistically"&rasian##eka#&ipides#)ocurrency$&disney$\'fighter!)valuators#)ngelistic$+s-pritchard#(porating")en-handed',
+    '#"rt%%horpe$$yman"\'ictions#$nced"*olutionism!$wart!,x-servicemen$%oviet"\'_gratia#\'officio"(altation"\'calibur$$vate\'#ing',
+    '##els&#ior#(itements#\'laiming"!e#!c$(utioners#%gesis#&mpting"\'horting"\'istents##ted$#ing"$ocet$$rine',
+    '#%rcism"(pandable%\'sionary)!s#%edite\'&ionary$%lling#*onentially$#und#+ressiveness$(opriated")tinctions%(guishers*#ing#&olling',
+    '#-ra-curricular&\'marital%$dite)!d%&polate+!d*#ing$$uded"&ultant&$tion!!y"#res"%senck *f&ecirc;te!%.l.r.',
+    '!!3!&abians$"en$"us##les"\'cetious#)ilitation#&tsheet$%ually""hd"+int-hearted#(r-minded$%banks$%child$%field',
+    '$#ley##sal#)thfulness%$less"$king"\'langist#!k#\'lacious$%opian#(sifiable\')cationist&!y""m.#\'iliarly##lio',
+    '&\'tically"$ring#&mstead#"oe$"uk#(quharson##rah#"ts"\'scinate#(hionably\'#ing#)t-flowing&#ood$"ed%$ners',
+    '"(talistic#"ed#%herly#%igues##ten#"wa"#ust%"us""ve"$wkes""x.!#ddi!%ealty"(deralist*!s',
+    '"(e-paying#&dstock"%ltham$"on"#mme""ng#$land#$nell"#rdi##gal#&mented\'#ing#%reira%"rs$#ier',
+    '$$ying"#tid"%uding"!y!1featherstonehaugh!!g"#f-4!%hcima!)ibre-rich$\'oblasts"%ddles#!o"#efs#)ld-worker%"er',
+    '$#nes#$rcer"!f"\'ghtback#$ment"&lament##ial$$gree$$pino(!s#\'mmaking#!o$#fax"(nalising#$ches',
+    '#&niston"&rebird#&st-aid&%order&-past-the-post""sa"&tfully#\'tipaldi")ve-a-side%$door%%point%)year-olds$$fold"%xated#$ings',
+    '!"l.""an$$nels&"ry#&t-rate$$ness##yed"%ecked"#ier%!s##nts",oating-point#$dden#%pping##res',
+    '#$tsam#%unced$!t#\'werbeds"(uctuates#"es!%obbed"&inavon"$kine"&ndling#*tainebleau"\'otloose$#man$%plate$#sie',
+    '$)ign-owned$#men$$sees%#kin$$told$&warned#&lornly#%malin%!n$$less#(nication#%tieth%(fication"%sdyke"-undationalism',
+    '%$ries$!t#(r-letter%%month$%pence$-teen-year-old%"hs!(ractious%%uring#\'grances#,n&ccedil;ais/!e$&chisee%!k$!s',
+    '"*ee-for-all%%range$$hand%%older$\'masonry%"en$$post$(standing#$itas#$scos$\'h-faced#&tboard$#ful"%ibble#\'ctional',
+    '$"rn#%nging#&volity"*ontispiece%#man#%thing"&uiting!$uchs%"ia##ker$#in\'"%lcrum#$fill#!k$!e',
+    '$%erton#$mars#$some"(n-loving#%board#$nier"\'rthered"\'siliers!!w $g.w.!"/l!%abled#&rielle"&dgetry""ff',
+    '$"le"\'latians#$leon$"ie%$poli%"um$#ops#\'vanized$#one"#mal##ely"$nges$%plank$$rene##non',
+    '$!s""pe"%rbled#\'gantuan$%oyles#%nered#$rard#$ston"$sket##sed#(tronomic&%scopy"#ted#&herers"&ultier',
+    '""ye#"le!"bh!"da##nsk"$ynia!$eary"$ikie"%mmell"&ndarme#,eral-purpose\'%ities&&tional$%vieve#%iuses',
+    '$,orphological##rgi&#ans"!r#!e#$main\'!e"+sticulating",tting_on_for!"gf!"h5"#arr"&oulish!)iacometti#$rdia',
+    '"%lberd#&christ##das$#ing#$ford#$lick#$more##roy"!m#%micks$!s"&nsberg"&ovanna"$rder#(l-friend',
+    '#%obank"%selle!)ladiators#!m#*ss-fronted"%eeful#$ncoe$\'dinning"$ides#\'mmering"&oating##bes$$ules#*rification&!y',
+    '$#ses"#ues##ing#&tamine"%ycine$(oprotein#)ndebourne!"mb""tv!#oad##lie$%posts"!b##ble&!d',
+    '"$ddam&!n#$head#"oy"%ffman"!g"&ldmine$$ring$!s%$tein$&thorpe#$iath#%lancz"*od-quality$&fellow',
+    '#)seberries)!y"#ran"%sling#$port#!s$!e$#ips""th$!s#$obed"#uge"2vernment-sponsored!"pa"!c',
+    '##fts#$hame##iny#$mmes#.nd-m&egrave;re%\'fathers%&parent%$sons$&getown$$ites$"pa$\'t-aided$&ulated&!e&&ocytes',
+    '#!s$\'shopper+!s#&velled\'!y%#ney%$send&#ide&!t\'#one%%yards$\'itation"/eat-grandmother#$cian#&enbank',
+    '%#fly##yer$&hounds$$ness"%iffon#$lles#&macing$#ond$$wood##ngo#%selda#%tting#$zzly""om##tty',
+    '##ver##wls"!p"&uagach#"bb$!s#%mbles$#man#%nwick!#uam#$nine#&rdsman\'"en"(bberford"&erilla',
+    '%!r#\'llemots"#lps"$rgle""sh#$ting"!v!)wendoline$%ellen"$ynne!-ynaecological"$psum +h&ocirc;tel!#.c."!m',
+    '"+beas_corpus#"ib$#tus"%ckers%"tt$#les"*ematoxylin$\'ophilia%\'rrhagic"#fez"$gans#"en##gis$"le"#ile',
+    '$!s#&rbrush$%flair$&styles"%lcyon#"es#\'f-baked%%eaten%(finished%)heartedly%$mile%%naked%%smile%$term$%penny',
+    '$%iwell$)ucination##ons#%sbury$"ey##ter#$vard"$mbro&!s##lin#$mock%#nds#%sters"\'nd-outs%\'painted',
+    '%\'written$&edness$\'icrafts$$rail$$yman#%g-ups$#ars$&ers-on$%overs#&kering#%nibal$"on#\'overian"\'rbinger$&orough',
+    '%&fought%%nosed%\'wearing$#_up$#ens#\'mlessly$(oniously\'"um\'"ze#&penden%"rs#$ries#%tnell#&vester#$yana',
+    '$#ish#$sles#&tening"&thaway##ter$"ie"\'ughtily#%liers"#vre""ys"$zell!!d!)ead-dress$$band$%dress',
+    '&#nds$#set%$tone&$rong#"ls#\'rsay-ii$*t-stopping%"hs&%wares%%lands#&thwood#)vyweights"\'bridean"&donism\'#tic',
+    '##led"!h"(idelberg$$rick#(ghtening#"ne#\'senberg"$ller#%msman#&plines"%mline&$gton#%mings#!s"*nceforward',
+    '##son"(patocyte"&raldry#&bicide#%dbook$#ing#$etic#(iot-watt#$oics#%rmann#"ta##zog"&selton#&itates##lop',
+    '##ton"*terosexism""wn"%xagon!$gt-1!*ibernation&#ian"%ckman"&deaway#)ing-place",erarchically")gh-backed\'!y%)ceilinged%%grade',
+    '%*resolution%(spirited$&wayman"\'jackers"(llingdon$#man"%nders$(quarters$!s#"es"#ppo%&campal"\'stogram%&ricist)"ty',
+    '##man!$lcas!#mip"!v!!n!%obbit#%sbawn"!c#%azade#%cleve#!k"(dgkinson"%fmann"&isting"%lbein',
+    '#+iday-makers$"st&!s#$kham#$lins#!s$$tein")me-school$$base$#ric$(sickness%#pun%$tead$\'workers#$inid',
+    '#\'oclinic$\'genates$&phobic"&nduran#&eywell#\'ourably\'"ry"#ofs#$ting$!s"\'ped-for"%ratia#$bury#\'ncastle$"et',
+    '$!t"%sanna##kin#"ni#)pitalised"%t-air$%water#%house#%plate"#ugh#+se-to-house%$maid$#man"$vers#"is',
+    '##den!#sia"#v-1!!t"!v!"ua#"ng"$bris#!s""ey"#lks"&manely#&bucker)!s#$erus',
+    '##ped$"ty#"us"#nky#)ter-blair"(sameddin#!k##ton"#tch!(yacinths#"tt"(bridised\'#zed"\'dration$/ochlorothiazide',
+    '&$ysis"#man"#ped$!r%#ion%+sensitivity%\'trophic##hen#)notherapy&$ized#\'ocrites$&tenuse%\'hesized "i-!!a',
+    '"%erian"!f!!c"#aew#!o"!d"#e-t"!j"!m"!s!(dealists"&olatry"#ris!"ff#!y',
+    '"!n"!s!!g"!m")nominious!"ia""i.!,ll-conceived\'\'sidered$\'effects$\'feeling$\'treated#(ingworth#"us"!o',
+    '#!e!%maged"!c"\'itators"&manent#)easurable#(obilised$(rtalised#-unodeficiency&,fluorescence&-histochemical&*reactivity"!o")partially#\'edances',
+    '$(rfection%\'ialists&%ously%&meable%(sonality%\'tinence#%inges&#ing#)lantation$\'icature%$edly#%olite#&resses$&inting\'!s',
+    '(#ing$"ov$%udent#%udent$&tation""re#!o!(n-flight$#orm#(patients#%store"1_cooperation_with#\'face_of#,the_order_of"!a',
+    '$(tivation#"ne"$bred"%cited#"l.$&usions#&ognito$\'herence$,ntrovertible#\'ubating$%lcate$"rs"!d#&elibly$\'ntation',
+    '$!r$)terminacy$%xical#\'ictable$\'gnities$(scipline&\'retions$)viduation#%olent#(ulgently$!s%\'trially#!y$#car"!e',
+    '#&ffable%)iciencies#%rtial#!z")fanticide#(erential#(lammable%"te$\'ections%(xibility$&iction#*uriatingly""ge$\'niously#%leton',
+    '#(ratitude"(habiting\'!s#%erits#%umane"\'itiator"\'jectors"$lays")nervation#&sbruck")offensive"*securities#\'ide_out#&olence#&pirals',
+    '$"ep$%igate("or%\'llation%#tut(#ing$,rumentalists#\'ularity$$ring"&tarsia#%egrin(!s$\'nsifies$&r-city&,departmental',
+    '%(actional%(cellular\'%pting\'%ssion&)hangeably%,departmental&#ict%\'locutor&$udes%/nationalisation.&zation&%ecine%#pol(%ation%(rogating',
+    '&&titial$%stacy#"ra%*peritoneal$\'icately%\'guingly$"on"&valids#&erting#\'iolable$%sibly#&oicing#)ulnerable",ward-looking!%odide',
+    '!#ras$%cible"!b"!e"(idescent#%garay"#ked"!o#$nies$%stone"+recoverable$\'futable#&igated$(tatingly(#ons',
+    '!"s."\'chaemia"!e"&lander"*olationism#&sceles#"ud!(terative"!f!"ud!"vf!(zvestiya $j.b.!$abir#!s',
+    '#\'obitism"%ffery"%ggers"$ncey#$gled#"is#$sher"#red#\'uzelski!!b!$ebel"&dburgh##dah"#ers##ves',
+    '"\'fferies$$ries"%junum""na##kin$!s")opardized"%rkily%!n#"zy"%t-lag#$ting%%soned"$witt!"fk',
+    '!#ibe""gs"#mbo""nx"%ttery!!j!#oao"$chen#$ular"$dami"%ggers"\'hannsen%$sson#)n-william"%iners',
+    '$\'t-stock"%lting""ng#$quil"#rdi"%sephs#"hi#!s"(urneying\'#man#%sting""vi$"an"$wett"$zsef',
+    '#(gemental#\'icially&%ously"%gular"%liana$"en"\'ridical$"st#"on $k.b.!!2!!a""as"%dhafi"\'ndinsky',
+    '#%emaru#!g$%aroos#!o#$tian"$ptan"&radzic$!k#"ma#&nataka#%rimor#$sten"&tarina#"ya!!c',
+    '"%enest#%p-fit#$vins"#gan#!s"$lley"%namun##net$&ington#$wood"#own"%rnels#%osene#%slake"&tamine',
+    '"4ynes/buckinghamshire#%stone!\'hamenei!)ick-start"\'dnapper"$efer#!r"#lda%$lton#\'patrick"$mono"(ncardine#\'dersley#&g-duke$%sdale',
+    '#!k$"el#$ross##sai"$osks"$pper&!s"$slev"\'tchener##ted"%womya!#lee#&mperer"#ift#"ne',
+    '!"ms"!t!!n"%acker#"ve")ee-length$#cap##lle"$ifed#\'tmaster"!o#"ll#%tting%!y"\'utsford',
+    '"%ehler"(nstantin"%oning"\'raloona#\'n/ferry"!s!$raal#"ft##gan#%katoa$"ow#!y"#enz"&isteva!!u',
+    '"(nsthalle!#wik!$yoto 0l&aacute;zn&euml!-\'or&eacute;al!\'-shaped!#.a.""c."%e.d.s""r.!!2!$aban#*our-saving"$cing#(onically',
+    '#$tose""da#%islav#%ybird$$like"\'fayette"!i"$koff"$lage"%marck\'#ism#%bourn#&enting#$inar&"te',
+    '$%light%#ugh")ncastrian$$elot%!s$&hester$"ia#%dfall$"or$"ry$\'sbergis$$ward#$gdon$!e$#ham',
+    '$#ans#%sbury##yon#&zarote"*paroscopic#%ointe"#rch#"go#!s"#ski"(terality##hes#$rine\'!s"$uded',
+    '"%wford#&nmower"&xative"&y-offs!"bc!"cy!&eached#&d-free##fed$#ing$$less#!h#%kages#"ry#*ther-bound',
+    '"$ered$#ing"&ftover(!s"\'galised$"to#"co#"ge%!d$!y#\'islated(#ing("or$(timating\'#ise',
+    '""if"(marchand"(ngthways"(ominster#)pardstown#$tard"$pers#\'rechaun"#roy#$wick"&t-down#\'ter-box&"ed$!s$$uces',
+    '#)el-headed%#ler#&iathan$%ticus""wd"&xicons"%yburn!!f""as"!s!!h!$iars"#ber%-al-democratic&#tor',
+    '#"or",cence-holder"#ddy""eu$.tenant-general"(fe-force%\'support%$time$%blood$%guard$$like"&ghters%%heart*"ed&%ouses',
+    '"#ken"$lith##lie%#put$!y%%white#!t$#ing"!m#"es#!o$&usines##par$"id"#ncs',
+    '$\'isfarne#%ighan#%naeus$"et"%oness$%isers")p-service##ase"&queurs"#sle#!p#\'tlessly")teratures#(hographs%\'spheric',
+    '"%ve-in$$lier&$ness$%rmore!(lanberis!"ng!,o_and_behold"#ach"$bbed"!c#%alism&&zation##han#$k-up#$usts',
+    '"%ftily")garithmic)!s#(gerheads&!s#"ie"$lled$!y"(m&eacute"(ng-eared%$held%&tailed%$wave&%inded$%champ',
+    '""oe#\'se-leaf"#ren"$ttie"&udness$"on#+is-napoleon##lou#"se#!t")w-calorie$&status$\'voltage#$ndes"%zenge',
+    '"(bricants\'#ted"%cerne#$iano$$dity#$kier""ff"$gard""lu"$mbar"%nched%#ing"#pus"#res##ing',
+    '")xuriously!#vmh!$yall"$ceum#"ra"#ddy##ney"#les"\'mphomas"$nagh"&onnais#$tard"&ricism"\'sosomes"$tton',
+    '!#-19!#.a."$p.h.!"ab"&cbride#&fadyen%%rlane#*hiavellian#%keson$%innon#&lennan##rae$"os"$dden%!r',
+    '#%house"$fouz"#gda#%ellan#%giore#(herafelt$#reb#%innis$\'sterial##mas#"na%&nimous"#hal$%rajah"&ilings',
+    '#!s$&onette#,zi&egrave;re"*jestically"%lachi##don#(evolence##lia%!k$!s#)nourished#$ting""nc$"hu#%dalay',
+    '%#ted\'!s$%elson#"et#%fully##gle$$rove#$iacs$\'festing#"na#,oeuvrability$"lo##tel$"on$"ra',
+    '"*r&iacute;a#!a#%bella#%celle#(ginality#3i&aacute;nsk&eacute$+e-christine$$gold$!n$$tima#&keters$"ov&"ic$$smen$"us',
+    '#$ques#%shals#$tell$!i%"ne$$yred#$wood#-xism-leninism"\'sefield##ham#&ochism(#tic##que#,s-production$#ing',
+    '$"ic#"ud"\'tchplay%%stick#"er%"ia\'%lized##her%!w&!s#)riculated*#ion%&lineal%$mony#"ta',
+    '&$horn"!u##die##led$#ing#"ng"!w""xi$$llae$(mization"$yall##day#!s"#zes!"bo',
+    '"#caw#&luskey##rea"\'donalds"$gill#%overn"$hugh"(kendrick#%innon"\'lachlan"\'manaman$$ster#%enemy#%ullen$#rdo',
+    '"$phee"$stay"(williams!)eadowbank#"na$%dered$#est$*ingfulness"%ccano"$dial%#tes$!c%#are&%tions$&tating',
+    '##usa#%vedev"#ech"%garry$%watts"(lanesian#"ee#$inda#&odious##vin"!m#(berships#&entoes#%orize""na',
+    '##des$"ip#$folk#%gistu#$tors"+rcedes-benz$#ies$!k##ges#%ingue#%maids#$rick#$thyr#!v"!s',
+    '$&lazine#&saging$"es")tabolites$)morphosed$&static#)hanogenic$$inks$&ylated#*ronidazole"#use"&xicans!%flops"!n!\'g/litre',
+    '"!n"!r!"ic#%helis&!l#&rochip%(economic%"ns%!s""d-$%1930s&"89&"93$%field&%fties',
+    '$&summer$(thirties%\'wenties$$year#*dle-income&$mass##get#$life#\'shipman"$ffed"&liband$/tary-industrial&"te%%iamen$$utin',
+    '#"le$%ionth"#med$#tic##ing"\'ncemeat#*d-boggling#\'eralogy#)icomputer$%grams$"ma&#lly%$ises$#ons$-ster-delegate',
+    '#"na$#ies#"sk##ter##uet"%ocene"#p-1""ro"*sadventure$+pprehension#+calculation#%deeds#%eries#$fire#$haps',
+    '#$laid$(eadingly#\'pricing*!s#&shapen$%ioner#%users!"km!#mmm!!n"&emonic"!p!(o&euml;t"$ated"$bbed',
+    '#$erne&$ists&!s#%ifier#%ulate"$guls"$hair$!n"#lby#%dovan#%ested%%worth#!l$%ified##och',
+    '"%mbasa")narchical("st*!s#!d##ika#(ktonhall##net#\'ologues$#mer$(syllabic$%tonic%#ype#!s$\'trosity',
+    '$#ego$+gomeryshire$&h-long$(parnasse$&serrat#"za"+od-altering"#rar$#via#%decai##eau#\'genthau#!o$!n#%pheme',
+    '%*ologically#$rell#$sels#\'tgagees\'"or$#ise"#sca$%ovici#"he#"se##tar"(tability#\'hercare#&ivator#)orcyclist',
+    '"$uncy$$tjoy#\'rnfully"&veable"$wlam"#xon"(zambican!"p."!c"%la-pt!"tm!%uawad"$ffin##tis"$gger',
+    '"(lholland##led$#ing#.ti-dimensional&)processor%(coloured&*ulturalism%\'farious%&racial%%tudes"%mmies"%nched#)icipality"\'rchison#$dock',
+    '$#ovy$\'ulature#"eo#$htaq#$ique##ket&!s"$tely#%inous#\'terings&!s#&uality"%zzled!!x!.yeloperoxidase',
+    '"%rcans"+stification")thologies *n&eacute;e!#aas"%bisco"!c"#der"!e"#fta"&gasaki#"el"%ipaul#"ru"%nking',
+    '"$poli"\'rcissus##ouz#%rated$)ow-minded#$thex"!s#(ogastric#$tier%"ly"(tionhood#"ty#(uralized"$vies#$vies',
+    '!"cm""os!)eapolitan#"rs"&braska##ula"(gativity#\'otiates#$roes"%ilson"&matode")o-marxist"$rina#"vy"$ssie',
+    '"$ttie"\'urology%\'peptide&,hysiological%#ses%,transmitters#)tralising("ze"1wcastle-upon-tyne$$omen##ent#%lands#$ness#$quay##son',
+    '&"el#)townabbey$!s"-xt-generation!"fl!$g/ml!&iagara"#cks#!s"!e"#fty"&ghtcap%&marish"!h""lp',
+    '"$mbly"/neteen-year-old#"ja#*th-century!!l"!p!%o-fly"%blest"#mad"*n-advanced%)ggression&*ricultural%(lcoholic%)ttendance$)custodial',
+    '&&sabled$)essential$)financial$*industrial&&vasive$*linguistic&&terary$&member$\'natural$#oil$)residents$&smoker%(teroidal$(teaching&\'chnical',
+    '$&voting$%white%$ords\'$king#(chalance#\'plussed"!o#"ks##rda"(rmalised#%seman#)th-facing%&erners%\'western"$sing',
+    '#$ches#(e-taking#&ifying$&onally""us#%velle"(velistic#!o"$zick#$zles!"rc!"sc!&ucella"\'llified&!y',
+    '"!r#&semaid"(tcracker#)ritionist#$tall"%zzled!$vala!"w1!#yse!$zrfu "oa"#kes#$land""ld$"ce',
+    '#"ys"%ispal")jectstore"*literation"&sidian#)tetrician)!s!"cr"!s"#t-2#$avia!$dder$"st"#ell#!s',
+    '"%orous!&edipal""ec!\'ff-beat$$line$%shore%#ite$)the-shelf#&_guard#%lined#$sets"#tel!$gden"$ilvy!"hm',
+    '#$seed!"l\'"!a""de$!n"\'szewski""tp"#wyn!!m""ni$\'potence%&resent$&scient!*n-the-spot"$/off',
+    '$$hour$%piece$%sixth%#top#$ness"$slow"&tology""yx!!o"%cytes"!t!+p&eacute;ra"%acity"\'en-loop%&necked',
+    '$#ers$$view%"ms#$rant$$etta"%helia#\'thalmic"$iate#(nionated"(pressors"#ren"\'ticians$&mality#!s"!v',
+    '"%cadai"$dain""fe"$gies"%ifice#(ginators"\'manroyd#!e$"au",nithological"(phanages"!r")thodoxies!%sborn"\'cillate',
+    '"%mosis"$tend"%valdo!$taku"!h!"ui".t_of_line_with#$back#%casts#$fall$$lows#&growth#%house(!s#&lawing',
+    '$$ooks#&played$&ouring*!s#)side-half$$trip($ping##wit!&varian$!y"\'enproof#,r-optimistic%*production%+represented&%iding',
+    '&)ubscribed%+the-counter$%blown%%urden*"ed$%coats$%doing$$hear%#ung$$lays%$ords$$paid%$ower$#ran&#ted',
+    '$&shadow&#oot\'!t%-implification%(tretched%)ubscribed$%threw\'%owing$$work!&xidase!$zawa /p&eacute;rignon")lt;0.0001)!5(!2',
+    '!#-40!$.c.b"$o.s.!!3!!7!(acemaker##ify"&ddocks#&locked#"ua"!f"#get##oda"%id-up#%gnton',
+    '#&nswick$&tbrush"!k"*laeolithic&\'ntology"%mella"$ndas$"er##ics##ned$#ing#\'opticon#$sies#!t$$hers',
+    '"%pered%!t#+illomavirus#$yrus"(racelsus%&huting$(digmatic$$lyse\'#ing$&medics&$tric$\'phrased$#sol$(troopers%+uberculosis',
+    '$!d$(nt-child&%heses#$fois#&khurst#%miter#%odies#$ried#&simony$$nips$%onage$$ytec#&thenon$\'iculate$&nering',
+    '$&ridges""sa#"ok##sim$%words#$teur$#ing$#ors$!y"&tching#$eman$#ncy%$ting$%rnity#)hologists',
+    '$&onized#!s"&ulette##nch"(wnbroker"&y-offs#$back#&master##off&!s!"cx!#dpa!&eabody#&ceable#$king',
+    '#"ts"&dalled##dle#.estrianisation,"ed#%iment"%eking##ved"%lagic#!e#!t"\'nalized#%dants$"er#(nethorne',
+    '#$sive#)tagastrin%%tonic#%umbra"(ppermint")rceptibly$$hing#$eira#0formance-related#%gamon#(inuclear$\'odontal$%shing%&taltic#"ky',
+    '#\'sephone$&onable\'"ge\'%lized$&piring$%uades#*turbations#$ugia$#sal#$vade&#ing"&shawar#!o$!s#\'simists',
+    '"\'terhead%#lee##ipa$"ts#!o#!r$!i$#ova#%worth"&vensey"$yton!!f"&eiffer#%nnigs!$g/mg',
+    '!$hage#%istos#%ntoms#%raohs$+macological"$enol$+ylketonuria#&romone##tam"$iala#+lanthropist.!s$(harmonia$%ology"$legm',
+    '"(oenician#)netically(!s#0sphatidylcholine&(orylated#)tocopiers"#yla$%ogeny$"um#,siologically!\'ianists"%ckard#&turing"$eced$#ing',
+    '##ter"*gmentation")lgrimages#(kingtons#$lage\'!d"$n-up##dar#\'eapples##kie%"sh$!y#&points#&stripe##ter',
+    '""on"#pit"%quant$!e"%relli"$sces#%sarro"\'tchfork#$fall#!h##ied#$ting"#xie!#la2#\'giarism',
+    '$"ts##nck$#ing$#ter#!s$&tering\'!s#%teaux$&itudes$$ters#%udits#\'yschool$\'wrights"&ebeian$&iscite',
+    '#\'xiglass"\'imsolls"#onk#!p#"ys"%ug-in#$mbed$#met$$pton#$nger##ses!%model!%ocock"&etical"\'ignancy',
+    '#*nt-of-sale&(to-point%&_blank##rot#%soner"&lanski#%emics#"is$\'ticised(#zed#$lack$\'inators#(ymerases$%nesia)!n',
+    '%%honic(!y%$osis"%miane#&posity"#nce#(derously#"te$#oon"$p-up##ery##ish#$lars#(ularized"%rches',
+    '##ing#"no#$ritt#"te%%ntous$\'manteau"&seidon#&itives\'$ists("ty%!s#&t-1945%(colonial%%natal$(doctoral',
+    '$&master$-structuralism#!y"*tentiation"-u&lsqb;c&rsqb#%ndage#$ssin##ted".verty-stricken",well/swindon"%zsgay!"pb"!d"!g"!l',
+    '(#sts#%iries$(seworthy#"nk#"ys"!d"*e-campaign&(pitalist$*determined$%match$$paid$(recorded$"s1%!2$*vocational',
+    '#+destination$&ictors%%spose#\'ferment$$ixes#&madasa$+i&egrave;re%$sses#$nton#+obrazhensky$(perative#&patent$\'osition#"s.$%chool',
+    '&(tational$\'ocratic$"to$(umptions)"ve$\'ynaptic#\'ttiness#&viewed"%ickle#\'maflora$"es$!o#+ncipalities$%table#,vately-owned',
+    '"$o-am$*government$%iraqi$$life#&_forma$$rata#$bity$!y#*clamations$+rastination%&eation$$tors#)ductively#*fessorship$%iling',
+    '$#use#*hibitively#\'jectors#\'missory$(ulgation##ngs#$ofed%#ing#)pagandist%"ne$&elling$\'hylaxis$)ositional$)rietorial#*spectively',
+    '#&tester$%ruded#%udest#-ven&ccedil;al$(idential#"wl%"ed"$unes!%seudo"#ion"-ychogeriatric&*linguistic&&metric&$path*"ic',
+    '!)t-gliadin"!e"!t"!y!&uccini#!k"%ffins"(gnacious#$wash""ke"%lleys#$sars%%tance")nctilious#"ta',
+    '#&illage"\'rifying$&tanism#%plish$\'ortedly##ses#%veyor(!s$#iew"%shers#!s"$trid!\'wllheli""rs!#yke',
+    '""re "q1!!2!%ichen""ng!)uadrangle#%gmire##ils#%ndary#"rk$$ried$!t%&erback#$sars##tre',
+    '%$sway#$lled##nch#%rying#$stor")icksilver#%etest##lls##nce$"ta%"on#!p#$rked#$xote"#orn',
+    '"+eacute;gime!\'-series!%.m.s.!!3!!4!%aasay"$bbis"(cehorses$%track#$ists#)keteering"!d#$ford#%iates&$ions',
+    '%&graphy%(labelled&#ogy%%meter%(nuclides#%ulfus""fa"&ggedly"#hmi"!i##led##ner"#kes#%ovsky"\'lemberg',
+    '"%mming#"on#&paging$&rakash"$nald#"ce$$hing#\'domness#$noch#$some#$ulph"#p74#&acious#$pers$#ing',
+    '"&rities"$shes"%tners#$tles$!y"%unchy")venscraig#$ines"#yon"#zed#(or-sharp!"cc"!d!"e-#&emerge',
+    '($ment%)gineering$)valuation#&formed#,organisation#\'reading#%think#%write"\'actants#(dmission&$tted#(ffirming#)llocation#"ms##per',
+    '&%rtion%\'urances"&becque#&ounded#%uttal"!c#"ce#\'eivable$&ptacle&\'ionists$)ssion-hit#&herche#(iprocate$&tation#)ognisably',
+    '$)nsidering%%vened$*rd-keeping$$uped#(reations$)imination"\'d-brick#+cliffe-maud##der#)ecoration$&ployed($ment$\'signing$%velop)"ed',
+    '#(irection$)scovering#%knapp#$land#%shank#&ucible%$tive(#ist""ek$#ing#&s-mogg")financing#\'lectors#\'ractive##uel',
+    '$%rbish"%galed#)enerating*"ve%"ts#%imens\'#ted$\'onalism#&ressed%$tful#*ulationist",habilitative"\'ichmann%,sf&uuml;hrer&#tag',
+    '#"na$!e%!r$)tegration&\'rpreted$&vested#(teration"\'joinder&#ing#)uvenation"&kindle"&lapsed$(tivistic##ent#&iquary',
+    '$#ved"%marry#&edying#)onstrated$$vals"$name%#ing%!o#"ee$$ging%\'otiated*#ion#!i#!o$&uncing',
+    '\'$ions"(ordering$(ganising("ze$)ientation"&peater#\'lanting%#yed&!s$\'enished$\'icating#!o#*rehensible%-sentativeness$$isal',
+    '#&tilian")quisition+"ed"(schedule#&enting#%haped#$igns$\'stivity##old$%urced#$tate$#ive$(orations&"er(!s',
+    '"&tching#$ford#(inopathy#\'raction$%iever"$uben#%nions%"te#"se%!d"&valued#)erberated*#ion%#ent#$isit',
+    '$$vals#*olutionise##ved$#ing"!y#&kjavik!!f"!l!!h"&apsody"#eme##sus"%ondda$!e"!s',
+    '#&osomal"#cci#)kenbacker$!s"%dding#$eout##ged%"ry"%emann"&fleman""gg#)ht-angled%"ed"$mmer"$nger',
+    '$$side""os"%p-off#!a"#scs#(k-averse%&taking$$less#$otto"%tschl"&valled#"et#%ulets"#zzo!&j2.2.5',
+    '$%block)!s$%watch"+bbe-grillet##ina#$ocop$$tics"\'chefort%#lle#$kall$\'efeller$&ingham"%ddick#"eo##ger',
+    '"&gatory"\'le-play#&led-up%(rcoaster"$mmel##ney##sey""na##son""od##kie#%sting#%tless"#rim"&seanne',
+    '#%setti$$iter")therhithe#$unda"&ughage#%lette#,nd-the-clock%"el%"up#$ters"(xborough#!y"$yale%$ists"!z',
+    '!"si!)ubberneck#"in##ric""dy$#ard"&ffians$"le"&ggiero"(le-based"$n-in$+of-the-mill"#pee"\'ritania"%shton',
+    '!!x &s\'pose!%.i.b.!!5!#739!!8!"aa#!d#!f"$bina#"le#&otaged"%chets#(ramental)!o',
+    '#!s"$dder#!e#!f##ism%!t"$gely"#hel"$kata#%harov"$laam$#mis#\'butamol#"eh$!m',
+    '#\'meterol#$utes%#ing#"ve"$mana#"ir#"os#$urai"(natorium#*ctimonious#\'dalwood$$bags$"ed$%paper%$iper',
+    '"\'rdinian#!i#&torial"%ssoon"$vory"&wn-off"$yin\'!#cab$!s#%evola#$llop#"pa$&egoats#%rabae$%ecrow',
+    '$#ing$$ring#"ts#%venge"!e#(ptically""fa"&haffer#*ematically$#rzo#/leswig-holstein$#oss#$oles$)olmasters&(teachers',
+    '#-r&ouml;dinger#$wann%(rzschild"$illy##pio"\'lerites"#off#"ld##ops##rch$&eboard"\'rapbook%"er$$tchy#!e',
+    '$(wdrivers#"ip%#ted#&ummage%!s"\'uppered#\'rrilous$"vy!"da"!i"&s-page!&ea-bed$%floor##ham##mer',
+    '$"ed#%scale#%water$$itch"\'cateurs##ede$(ssionist#.ond-in-command\'&placed\'%round$"rd#)tarianism#\'ularism"&dately##don',
+    '"%eding#!r#$thed"#gal"$hcat"$izes"#lf-%)assurance%(critical+#ism%+destruction."ve%*fulfilling%*importance-!t',
+    '\'(dulgence%*management%\'reliant&,ighteousness%\'serving&)ustaining$&ridges#$lars"#mai#&i-arid&)utonomous%&circle$$otic(!s$!s',
+    '$&scence#!g$!a#%ility#\'tencers"*parateness#"oy%!s#%timus"+questration$#ins"$rena#!f#%jeant#+oconversion',
+    '#$pell#%rated"!s"\'t-piece#\'ting-up$#ler$!s"\'venoaks%-teen-year-old&&y-nine(%seven$*rity=error!!g""ml"!r',
+    '%!s#"hs#%llots#&mbling$&efaced$#ing##ndy$$gkun$!k%"ar#$piro#%vings"&earman##ehy$"na',
+    '$#ted#\'lf-life$)l-shocked%!y#!p$&herded##rpa#&tlands"#iel#%ngles$$well#&powner$$pers$\'wrecked#"rk',
+    '#\'emakers$&string#$pped#%reham$%t-cut&%eared&\'sleeved%&coming%%falls%$ness#%tguns#(uldering#\'velling#&wering"(rewdness',
+    '#$illy$*nk-wrapped"$ultz!\'ibelius"%ckert"*de-by-side$$show#!i#"on"$eges"%garup#\'htseers#&ismund#*moidoscopy$#und',
+    '#$kily#"os#%vered&#man&$ware"\'mmental#$plex#\'ulating\'#ors"$news#%fonia##ged$(le-party\'&storey%#ing',
+    '"#red"$sson"$t-in"&x-foot$$inch$&thirty#*th-century%!s$\'y-eight&%seven&%three\'"wo"#yad"$zing!!j',
+    '"#ein##wer"#ied#$mmer#%ncare$!t"#oda"&ulking"%ylark#\'scraper!&lacken#%nging#"ps%$tick#$tted',
+    '"*edgehammer#\'eveless"%icked#\'mbridge$$line$#med&"rs""ob$$odan#!p$$ping#%tting##uch#%venes&#ian',
+    '"&umping%!s#"nk!)mall-time%#fry%$ness#%rtest%#ies%&stream#$shes#\'ttering"&earing#$dley#!e"\'ilingly',
+    '#%thers")okescreen#%llett!&napper##res"!h"!i#"de##ffs#$gger\'"ed"!m#!p"&obbish#%oping',
+    '$"ze##res$\'kelling#$wden$&flakes$%storm!%oares"\'cialise$*o-cultural%\'biology%+linguistics-!s"%ftens$"pc$$wood',
+    '#&dering#%enoid#&icited$&dified##ver"%malis$#tic#%e_one$&rsault$%thin\'")ngwriters#%orous"\'phocles#"py"&rbonne',
+    '#%eness#%rento$%owful"&ulless#$nder%$less)"ly#*rce=metapi&!d#(therners($most%$wold!&p&ouml"*aciousness#!m',
+    '#(rc-based#*smodically$#tic\'!s"%eared%#man#&cint92%#ous$(trometry$&ulator#*echreading$$dier$$lman##wed",hincterotomy',
+    '#"na$$dles$&e-like$!k$%naker$#oza#&ralled$(itualist"$lice$\'ntering"#ock#"of$!l$#ned&!r',
+    '"&rained#"ed#"ig"%urted!!q"!n"$uall&!s$"ts%#ter$"wk&#ing#%eezes##irm%#ted',
+    '"!s!"sb""si"!t!)tabiliser$!s##dia%#ums##ger#$ines%#ton$%rways#%llone#%mpede#(ndardize',
+    '$$leys$$nard$#zas#)r-studded$$ling$%t-ups#$shed#!t$,e-controlled%$side$(istician$!s$&uettes#%veley"!b',
+    '%#man$$lthy$%matic%$ship#$eled$#n\'s$$pest$*ring-wheel#$fano#\'ncilled$#son$"ts#$ppes$$wise#&rility',
+    '$!s"(ill-life%$born#\'mulants#$pend\'$iary$\'ulating#*rlingshire$$rups",ock-in-trade%#man%%piles#%ddart$"gy#"ic',
+    '#(ltenberg#(ne-built$#ily#%ppard#"rr$(ytelling#&ughton$\'rbridge"&rachey$$ddle$&gglers\'!y$,ight_forward$"ng&\'ulation',
+    '%%egist%!h%(igraphic%\'ocaster#&eaking&!y%&mliner$%isand$%tford#$ingy$#ven#%utted&#ing"%ubbly#%dious',
+    '#%keley##rge#$tter\'"ed!#ub-$)community&)ntracting$&groups$)paragraph$(regional$\'systems#%class$\'ontract#\'liminal#&normal',
+    '\'"ze%%sting$#oil$\'tandard#\'terfuge$$itle(!s$#ype"&chlike""es#!t"&fficed\'!s$%ocate$(ragettes',
+    '"#key"&leiman$$yman##lom#+phasalazine"\'mmative$\'erfield&%house$&ing-up#!p"%nburn#\'flowers#"os#$roof#$sets',
+    '#&erbike%\'cilious&(omputing%$glue%(ordinate&$xide%(position"$rest#$feit%!r#$inam#%mount#*reptitious$%ogacy#$tees',
+    '"(spenders##sed"!u"&zannah!#ven"*idrigailov!%wayne"!b")eatshirts#$eten\'"er)!s#\'ltering##rve"\'inbrook',
+    '##rls#%shing#\'velling"#oon""um!\'ydenham"\'mbiosis#(pathised(#zed"*nchronized#\'dicated#%optic(!s#"th%#ase',
+    ' #t\'s!#.s.!!1!(able-top#&ulated"!c#(hycardia#"ks"!d#&caster#$eusz"%ggart#!h""if"#jan',
+    '$!r"$lker#$lies")mburlaine##per$#ons#%worth"&ndoori#\'gential%$rine$#ier$!y#"ia##nin#(talizing',
+    '#&zanian"$plow##per"&rragon%!h"&shkent##ker#$sels"#tum#$yana"!u##tly"&vernas&!s"$wney',
+    '#(i-driver"%ylors!"bs!\'eardrop#&singly"*chnocratic*!s##lis"(ddington"#eny#%total""le$(ological$&pathic(!y',
+    '$&vising""mp$#lar%&ecombe"(n-thirty#(aciously$$nted$$scin#"ch#(dentious#$fold#$sors"%quila"%rmini$"ly',
+    '$#ify%"ne$&orised"*stamentary)!s$"es$&ifying%\'monials$(osterone"#tra"&utonic!#gwu!(hackeray##kin#(lidomide',
+    '##ism#%obald$#dor$)reticians#(rmopylai##ssy#%tford"&ickens&"st#"ne$$nest#%stles#$ther""or$$burn',
+    '$)oughgoing"*readneedle$(e-course&$fold&#man&$part$%lfall#$oaty$#nes$%waway%$back#%ushes"%udded#(nderbolt\'&storms',
+    '"%yself$#sen!#iao#"ra"&diness"&ghtens"%lbury"+mber-framed&"ed$"re#&e-cues%#out$"rs$&scales#$idly',
+    '##kle%#ing#"ny#$tern$!s"$pper"%redly"$tans#$bits#!e#%fords#$muss##ron!"lr!(o-morrow',
+    '#"ie"%dorov"&enails""ga##gle"%iling"(lerances"%mbola#"es"&nality#&bridge#,gue-in-cheek##kin#$sils"%olbox',
+    '"%p-end#(ographic""ra$!h##ino#%ments##por#"re%!s$"id&"on#%tious$%urers"\'scanini"-talitarianism',
+    '"(uchingly#*r_de_force#"ts"\'wnshend%#men!\'rackway#!d$&e-offs%%marks#\'gedians#+ns-atlantic%%acted%\'cending&&ribing%%ducer',
+    '&#pts%)gressions%%itive%#kei%(location%(mutation("ed%)parencies*#tly&"ut"&eeless#&lawney#!m#&nchant&$coat',
+    '$$tles#$vino"$iads$%thlon#%ckles#"er#&forium#)glyceride$#ram#$mble$#mer$!s#%nkets#"pe$#les',
+    '%%icate$$pers%!y$$tych#%s-hcl#&ticale"%oilus#&mbones#"on#$phic#$upes#"ve"$uant#&culent##dge',
+    '$!y#$eman$"st$$type#&mpeted#\'ncheons$%dling"%ypsin!$sars!%uareg""ba"%ckett$!s"$dors""es',
+    '"%mbles"$nics"#ple"*rbocharged#!d##nip#\'pentine$"in")tankhamun#,or-organiser%"ed!$v-am!!w"#ang#!t',
+    '#"ak#%ezers#,lve-year-old&!s#)nty-fifth"$iggy#%rling#\'ttering"(o-fifths$$goal$&handed$\'pronged!)ynecastle"%peset\'#ter',
+    '#$hoon#%ifies%!y"$rion#"ol%#ean!$zann #u21!"bs!!c""ca!"fc!"gt!$lema"&lapool',
+    '"$pian"$rich"&tramar!(mpteenth!*naccounted#&dorned$)ulterated#%fraid#\'ssisted#(voidably")breakable"\'cannily#&easing#)lassified#-ompromisingly',
+    '%(rdinated"(declared$&r-used%+achievement%\'clothes&#oat%#dog%)estimates,#ing%$paid%#sea&$ides%$tone%%value$&served',
+    '#\'ressing#$ying"*economical#&lected#(motional#)ncumbered$*thusiastic#\'qualled#\'xciting")failingly$(thomable#%illed#)ortunates#%urled"&heated',
+    '"!i#\'mpaired%$eded%\'ressive#+ncorporated$%jured$&spired"(knowable"(leashing"$made$$nned$$sked#(itigated"&paired#\'olluted',
+    '",questionable$#ote"$read%%lised%+sonableness$*cognisable)%zable$)liability&$eved$)presented$&quited$\'warding"$said$\'turated#$crew',
+    '#%eeing$$ttle#(hakeable#(urpassed&&rising#\'werving"\'tainted$#med#)hinkingly#"ie#)rammelled$)ustworthy"(wavering#&inding#&orldly',
+    '!\'p-front"$john"#ped$&rparts%!s"&rating#&isings##oot"&staged%"rt"&wardly!(rbanized""du"&ethral!%s-led',
+    '"\'elessly#%rname"#urp%"er!\'tilises!#uuc!"v5"!b!"zi"$zell "v2!!a"$cate#%cinia#$uous',
+    '"\'gabonds#%otomy#$uest"(lenzuela$"ry#&iantly#"le#&ueless"&mpires"(nce-owen#$uatu"1riable-reluctance%$nces##ley#$sity',
+    '"(udeville#$nted#!x"%x/vms!!d!"ee#!r$#ing$!s"(getative"%neers##ted$#ing$#uri"!r',
+    '#$dant#&ifiers$*similitude$#tas#&milion#$nage#!t"%sting#%uvius"\'xatious!"fm!\'ibrancy%"to")cariously#)e-admiral',
+    '%\'premier%%versa#\'timised\'&zation""ed"\'gilante)!s#!o"&llager$#ous$"us")naigrette#"ci"$olas"#per',
+    '"&sconti%"se#&igoths"&tiated#&rinite"%valdi#!e"#xen!!l!+ocabularies#)iferously"\'lcanism#"es##ker$\'skammer',
+    '"$tive"$wing"%yager!$ulva!"zv $w.c.!"1v!&addled""ft$#ing"*ge-earners#&nerian"$igel##mea#!n',
+    '$#ned"%lk-in##low$&papers$$send##rus"&nderer#!k#"ly"%rbird\'!s##der#$head#!k##ley',
+    '"\'shbasin%#urn$#out$$room"!t#%anabe#\'chmaker%$word#(ercourse+!s%$fowl%&proofs%%wheel&$orks#&kinson',
+    '"\'vertree"#xes"%ylaid!"c2!&ealden##ved""dd#\'nesbury"$eded$"on#%klies#%tabix""ft"\'hrmacht"!i',
+    '#"ll#\'nberger"$ldon#)l-behaved&#red%#cut%&earned%#fed&%ormed%&heeled%$kept%#lit%$made%)organized%\'planned',
+    '%\'wishers$"es#)terweight"%ndell"\'stbound%#ury$)ern-style\'!s$%field$-on-super-mare"\'therall#!s#$test!#ham#$rves',
+    '#(rewithal#!t""in#"st#\'tchurch$%e-hot%$hill%$side$#her$#low$#sun$%worth#%zzing"+ole-hearted%!s',
+    '!$icks"%dgery%"ts#&owhood"$ggle##ley"#les#!f$$ridi#"ks#$lard$"em##mot#$ting"!m',
+    '$&helsea)!y&!s#\'d-blown$"ed%!r$\'ow-sill&#ing$$pipe#&g-tips##kle$!s#\'stanley"!s#!p',
+    '#!t$"on!!m"!c!#oil"!k"%lfson"%manly#&enfolk"(nderment"&odbine%%ridge$$cuts$$hall$\'peckers',
+    '"&rk-out$&aholic$%horse$\'manlike$#sop#$rell$%iedly$&yingly#\'shipful\'#per"!t"!u!$rest%#ler(!s',
+    '"%inkle"\'oughton"!u!!t!\'ulfhere$$stan!\'ychwood"#lie"%oming"%siwyg \'x-rayed!(.desktop!%avier!!l!#mas',
+    '!!y"!z #y/n!"ak"#lta"%rdley"$smin"#zov!&breska!(ear-olds&&n-year"&llowed#!p$"ed"$meni',
+    '!!i"%tzhak!#obs"%lande""ng"&ungish%!s!!r!!t!#ule"!p"%supov \'z-score!$adak"$mzam',
+    '$!a"!p!\'bigniew!%ebras"\'chstein"\'ebrugge""ke"$neca"%olite!%helev"$ukov!&ionism"$pper!"nf!#ola',
+    '"#nal#"ed##ing"\'ologist!(uckerman!!x',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_08 = (
+count_08 = 6694
+
+heads_08 = (
     '&bgr;1',
-    '&dollar;1.2m',
-    '&dollar;1.3m',
-    '&dollar;1.5m',
-    '&dollar;1.7m',
-    '&dollar;150',
-    '&dollar;150,000',
-    '&dollar;18',
-    '&dollar;2,500',
-    '&dollar;2.5m',
-    '&dollar;200m',
-    '&dollar;30,000',
-    '&dollar;300m',
-    '&dollar;30m',
-    '&dollar;3m',
-    '&dollar;40',
     '&dollar;400m',
-    '&dollar;40m',
-    '&dollar;4m',
-    '&dollar;50m',
-    '&dollar;6,000',
-    '&dollar;60',
-    '&dollar;9',
-    '&dollar;insert',
-    '&eacute;litist',
-    '&eacute;migr&eacute',
-    '&eegr',
-    '&flat',
-    '&frac13',
-    '&ggr;-interferon',
-    '&ins',
-    '&ogr',
     '&plus',
-    '&plusmn',
-    '&pound;1,100',
-    '&pound;1,300',
-    '&pound;1.1',
-    '&pound;1.4m',
-    '&pound;1.6',
-    '&pound;1.75',
-    '&pound;10.50',
-    '&pound;105',
-    '&pound;115',
-    '&pound;125,000',
-    '&pound;13.99',
-    '&pound;130,000',
-    '&pound;14m',
-    '&pound;1500',
     '&pound;150m',
-    '&pound;16.50',
-    '&pound;17.50',
-    '&pound;17.95',
-    '&pound;17.99',
-    '&pound;175,000',
-    '&pound;195',
-    '&pound;2.5m',
-    '&pound;2.75',
-    '&pound;23,000',
-    '&pound;230',
-    '&pound;250m',
-    '&pound;270',
-    '&pound;29',
-    '&pound;29.95',
-    '&pound;295',
     '&pound;3.5m',
-    '&pound;3.75',
-    '&pound;3000',
-    '&pound;300m',
-    '&pound;320',
-    '&pound;37',
-    '&pound;39',
-    '&pound;39.99',
-    '&pound;400m',
-    '&pound;43',
-    '&pound;450,000',
-    '&pound;48',
-    '&pound;49',
-    '&pound;52',
-    '&pound;58',
-    '&pound;6.25',
     '&pound;6.5',
-    '&pound;69',
-    '&pound;9.50',
-    '&pound;900,000',
-    '&verbar',
-    '\'89',
-    '\'course',
-    '\'eard',
-    '\'the',
-    '\'tis',
-    '\'you',
-    '**altered',
-    '-reuter',
-    '.1',
-    '.2',
-    '/r/',
     '0%',
-    '0&deg',
-    '0.3%',
-    '0.4%',
-    '0.8%',
-    '00:17',
-    '00:24',
-    '00:25',
-    '010',
-    '0232',
-    '0d',
-    '1&ndash;6',
-    '1,024',
-    '1,250',
-    '1,900',
-    '1-2',
     '1.00',
-    '1.11',
-    '1.2%',
-    '1.2m',
-    '1.75',
-    '1.8%',
-    '10&ndash;1',
-    '10,000,000',
-    '10-1',
-    '10-11',
-    '100000',
-    '100mhz',
-    '100mph',
-    '1086',
-    '109s',
-    '10ft',
     '10km',
-    '11&ndash;14',
-    '11&ndash;16',
-    '11.15',
-    '11.30am',
-    '11.7',
-    '11p',
-    '12&ndash;13',
-    '12&ndash;15',
-    '12(1)',
-    '12-13',
-    '12-hour',
-    '12-inch',
-    '12-string',
-    '12-year',
-    '12.00',
     '12.30pm',
-    '12.5%',
-    '12.6',
-    '12.7',
-    '1215',
-    '1234',
-    '125,000',
-    '1250',
-    '1258',
-    '1277',
-    '1280',
-    '128mb',
-    '1294',
-    '12in',
-    '12oz',
-    '13-14',
     '1307',
-    '1322',
-    '1323',
-    '1327',
-    '1337',
-    '1346',
-    '1348',
-    '1350',
-    '1360',
-    '13p',
-    '14&ndash;16',
-    '14-15',
-    '14.2',
-    '14.3',
-    '1450',
-    '1453',
     '1469',
-    '1480',
-    '1492',
-    '14p',
-    '15-minute',
-    '15.2',
-    '15.4',
-    '15.5',
-    '1500m',
-    '150ml',
-    '150mm',
-    '1529',
-    '1530',
-    '1534',
-    '1539',
-    '1544',
     '1546',
-    '1552',
-    '1553',
-    '1554',
-    '1581',
-    '1598',
-    '15ft',
-    '15s',
-    '16&ins',
-    '16&ndash;18',
-    '16-',
-    '16-17',
-    '16-valve',
-    '16-year-olds',
-    '16.2',
-    '160,000',
     '1605',
-    '1607',
-    '1611',
-    '1612',
-    '1613',
-    '1614',
-    '1616',
-    '1617',
-    '1619',
-    '1620s',
-    '1623',
-    '1627',
-    '1629',
-    '1631',
-    '1632',
-    '1633',
     '1634',
-    '1635',
-    '1637',
-    '1646',
-    '1657',
-    '1663',
-    '1664',
-    '1669',
-    '1670s',
-    '1673',
-    '1676',
-    '1677',
-    '1678',
-    '1681',
-    '1686',
-    '1687',
     '16p',
-    '17.3',
-    '17.5%',
-    '170,000',
-    '1705',
-    '1706',
-    '1708',
-    '1711',
-    '1720s',
-    '1722',
-    '1723',
-    '1729',
-    '1730s',
-    '1735',
-    '1737',
-    '1738',
     '175g',
-    '18-19',
-    '18-hole',
-    '18-year-olds',
-    '180,000',
-    '1800s',
-    '18c',
-    '18in',
-    '19,000',
-    '1930\'s',
-    '1939&ndash;45',
-    '1960\'s',
-    '1970\'s',
-    '1976a',
-    '1978b',
-    '1979&ndash;80',
     '1980\'s',
-    '1981&ndash;2',
-    '1981a',
-    '1981b',
-    '1983&ndash;4',
-    '1983&ndash;84',
-    '1986&ndash;7',
-    '1986&ndash;87',
-    '1986/87',
-    '1987&ndash;8',
-    '1987&ndash;88',
-    '1987b',
-    '1989b',
-    '1991&ndash;2',
-    '1992&ndash;3',
-    '19c',
     '1:25',
-    '1:50',
-    '1am',
-    '2&ft',
-    '2,700',
-    '2,800',
-    '2-d',
-    '2-litre',
-    '2.11',
-    '2.12',
-    '2.2%',
-    '2.5cm',
-    '2.5m',
-    '2.7%',
-    '2030',
-    '20cm',
     '2100',
-    '22-23',
-    '22.5',
-    '25&ndash;30',
-    '25-year',
-    '250cc',
-    '25pc',
-    '26-27',
-    '26/10/93',
-    '29/10/93',
-    '291',
-    '292',
-    '299',
-    '2mm',
-    '2s.',
-    '3&ndash;3',
     '3,000,000',
-    '3,300',
-    '3,600',
-    '3.00',
-    '3.16',
-    '3.20',
-    '3.25',
-    '3/11/93',
-    '30-minute',
-    '300dpi',
-    '30ft',
-    '30pc',
-    '32,000',
-    '323',
-    '324',
-    '327',
     '3270',
-    '329',
-    '331',
-    '334',
-    '336',
-    '33rd',
-    '341',
-    '342',
-    '346',
-    '347',
-    '348',
-    '349',
-    '354',
-    '359',
-    '35th',
-    '361',
     '364',
-    '368',
-    '369',
-    '36th',
-    '37,000',
-    '373',
-    '374',
-    '377',
-    '378',
-    '379',
-    '381',
-    '382',
-    '386sx',
-    '39-year-old',
-    '391',
-    '392',
     '393',
-    '397',
-    '398',
-    '3com',
-    '3s',
-    '4&ndash;2',
-    '4(1)',
-    '4(2)',
-    '4-0',
-    '4-3',
-    '4-6',
-    '4/11/93',
-    '401',
-    '406',
-    '407',
-    '411',
     '412',
-    '414',
-    '416',
-    '42,000',
-    '42-year-old',
-    '426',
-    '427',
-    '428',
-    '431',
-    '434',
-    '437',
-    '44,000',
-    '44-year-old',
-    '442',
-    '444',
-    '44th',
     '45-year-old',
-    '450g',
-    '451',
-    '456',
-    '457',
-    '45p',
-    '45th',
-    '46-year-old',
-    '461',
-    '465',
-    '475',
-    '476',
-    '481',
-    '485',
-    '486sx',
-    '4am',
     '4cm',
-    '4s',
-    '4wd',
-    '4x12',
-    '5&deg',
-    '5&ndash;0',
-    '5-3',
-    '5-4',
-    '5-7',
-    '5.11',
-    '5.12',
-    '5.13',
-    '5.14',
-    '5.15',
-    '5.5%',
-    '50-year-old',
     '508',
-    '50ft',
-    '510',
-    '511',
-    '514',
-    '525',
-    '530',
-    '532',
-    '570',
-    '577',
-    '582',
-    '585',
-    '5lb',
-    '5ml',
-    '5oz',
-    '6&ft',
     '6,500',
-    '6.11',
-    '6.15',
-    '6.20',
-    '6.25',
-    '6.5%',
-    '60-year-old',
-    '603',
-    '605',
-    '606',
-    '60mhz',
-    '624',
-    '626',
-    '630',
-    '633',
-    '654',
     '65th',
-    '664',
-    '666',
-    '670',
-    '678',
-    '680',
-    '68000',
-    '686',
-    '6c',
-    '6ins',
-    '6lb',
-    '6mm',
-    '6s.',
-    '7&ndash;1',
-    '7&ndash;10',
-    '7&ndash;2',
     '7(3)',
-    '7(5)',
-    '7-1',
-    '7-2',
-    '7-5',
-    '7.15',
-    '7.45',
-    '7.5%',
-    '705',
-    '706',
-    '70th',
-    '7100',
-    '715',
-    '716',
-    '727',
-    '729',
     '730',
-    '760',
-    '780',
-    '7ft',
-    '7in',
-    '7s',
-    '8&ndash;1',
-    '8,500',
-    '8-9',
-    '8.15',
-    '8.5%',
-    '808',
-    '80860',
-    '820',
-    '830',
-    '85(1)',
     '880',
-    '8d',
-    '8m',
-    '9&ndash;10',
-    '9&ndash;2',
-    '9&ndash;4',
-    '9-10',
-    '9.',
-    '9.0',
-    '9.15',
-    '9.30pm',
-    '90-minute',
-    '90th',
-    '93%',
-    '99p',
-    'a&amp;e',
     'a.j.',
-    'a/s',
-    'a19',
-    'a7',
-    'ab_initio',
-    'abating',
-    'abdicate',
-    'abelard',
-    'aberconwy',
-    'aberrations',
-    'abetting',
-    'abhor',
-    'abhorred',
-    'abhorrence',
-    'abidjan',
-    'ablest',
     'abo',
-    'above-mentioned',
-    'abrahams',
-    'absconded',
-    'absolutist',
-    'absolve',
-    'absorbance',
-    'abstractedly',
-    'abstruse',
-    'abundances',
-    'abuser',
-    'abut',
-    'abyssinian',
-    'aca',
-    'acacia',
-    'academe',
     'acca',
-    'accentuates',
-    'acceptor',
-    'accessions',
-    'acclamation',
-    'accommodations',
-    'accomodation',
-    'accoutrements',
-    'accra',
-    'accrington',
-    'accrual',
-    'accrues',
-    'acerbic',
-    'acetaldehyde',
-    'acetone',
-    'achingly',
     'acme',
-    'aconite',
-    'acoustic-phonetic',
-    'acoustically',
-    'acrobatic',
-    'acrobatics',
-    'acrobats',
-    'acronyms',
-    'across-the-board',
-    'action-packed',
-    'acyclovir',
-    'ad&egrave;le',
-    'ad/cycle',
-    'ad_infinitum',
-    'adagio',
-    'adai',
     'adas',
-    'adb',
-    'adc',
-    'addamax',
-    'additionality',
-    'adduct',
-    'ade',
-    'adelphi',
-    'adenosine',
-    'adf',
-    'adjoined',
-    'adjoins',
-    'adjuncts',
-    'adjuster',
-    'adjusters',
-    'adjuvant',
     'adrienne',
-    'adroitly',
-    'adulterous',
-    'advertises',
-    'aec',
-    'aer',
-    'aeroflot',
-    'aerospatiale',
-    'aetiological',
-    'affably',
-    'afferent',
-    'affixes',
-    'afflicting',
-    'afflicts',
-    'afrc',
-    'after-school',
     'aftercare',
-    'afterward',
-    'agar',
-    'ageless',
-    'aggregating',
-    'aggregations',
-    'agitating',
-    'aglow',
-    'agonists',
-    'agora',
-    'agrochemicals',
-    'ahh',
-    'aigina',
-    'aileron',
-    'ailsa',
-    'airbase',
     'airedale',
-    'airframes',
-    'airliners',
-    'airships',
-    'airtime',
-    'aitchison',
-    'ajr',
-    'akali',
-    'akce',
-    'akimbo',
-    'al-assad',
-    'ala',
-    'alamos',
-    'alchemical',
-    'aldate',
-    'alderney',
     'aldgate',
-    'alehouse',
-    'aleppo',
-    'alesi',
-    'alexia',
-    'alfieri',
-    'alhambra',
-    'alibis',
-    'alighting',
-    'aligning',
-    'alija',
-    'alimentary',
-    'alkalis',
-    'all-american',
-    'all-comers',
-    'all-conquering',
     'all-encompassing',
-    'all-german',
-    'all-pervading',
-    'all-pervasive',
-    'all-white',
-    'alla',
-    'allcock',
-    'allerton',
-    'allingham',
-    'alliss',
-    'alliteration',
-    'alloa',
-    'alludes',
-    'aloysius',
-    'alphabetic',
-    'alphonse',
     'altarpiece',
-    'alter_ego',
-    'alternates',
-    'altimeter',
-    'alumina',
-    'alvarez',
-    'amadeus',
-    'amateurism',
-    'amazons',
-    'ambassadorial',
-    'ambiguously',
-    'ambushes',
-    'americana',
-    'amicus',
-    'aminotransferase',
-    'ammo',
     'amok',
-    'amour',
-    'amphetamine',
-    'amplifying',
-    'ams',
-    'amu',
-    'amusingly',
-    'amv',
-    'anaesthetized',
-    'analgesic',
-    'analysers',
-    'anap',
-    'anaphors',
-    'anatolian',
-    'anchorages',
-    'anchovy',
     'ancien_r&eacute;gime',
-    'andante',
-    'andr&eacute;s',
-    'andriessen',
-    'androgynous',
-    'androgyny',
-    'andropov',
-    'aneurin',
-    'angiography',
-    'anglo-saxons',
-    'anhydrite',
-    'animism',
-    'animus',
-    'anion',
-    'anisminic',
-    'anne-marie',
     'anneka',
-    'annotation',
-    'annotations',
-    'anodyne',
-    'anomie',
-    'anorectal',
-    'anserina',
-    'anstey',
-    'antagonize',
-    'ante-room',
-    'antechamber',
-    'antelopes',
-    'anthelmintic',
-    'anti-american',
-    'anti-democratic',
-    'anti-discrimination',
     'anti-drugs',
-    'anti-mouse',
-    'anti-smoking',
-    'anti-soviet',
-    'anti-viral',
-    'antichrist',
-    'anticlimax',
-    'antilles',
-    'antiochus',
-    'antisemitism',
-    'aonach',
-    'aorta',
-    'apanage',
-    'apec',
-    'aperitif',
-    'aphorism',
     'aphorisms',
-    'aplenty',
-    'apologises',
-    'apologist',
-    'apologists',
-    'apostate',
-    'appalachian',
-    'apparitions',
-    'appeased',
-    'appertaining',
-    'appetising',
-    'applegarth',
-    'appleyard',
-    'appointee',
-    'apportioning',
-    'apposition',
     'appropriating',
-    'apses',
-    'apsidal',
-    'apts',
-    'aquarian',
-    'aquariums',
-    'aquatics',
-    'aquatint',
-    'aquiline',
-    'aragorn',
-    'aramaic',
-    'aranyos',
-    'arbiters',
-    'arboreal',
-    'arcaded',
-    'archon',
     'ardently',
-    'arg',
-    'argon',
-    'argumentation',
-    'arianna',
-    'aright',
-    'arpeggios',
-    'arranger',
-    'arras',
-    'arrayed',
-    'arrowsmith',
-    'artemision',
-    'artfully',
-    'articulatory',
-    'artifact',
-    'asaph',
     'ascends',
-    'ascertainment',
-    'asceticism',
-    'aschmann',
-    'ascorbic',
-    'ascribing',
-    'ashi',
-    'asif',
-    'asimov',
-    'askin\'',
-    'asmar',
-    'aspel',
-    'aspinall',
-    'aspirant',
-    'aspirants',
-    'aspirins',
     'assembles',
-    'assented',
-    'asshole',
-    'assize',
-    'assynt',
-    'astaire',
-    'asterix',
-    'asteroid',
-    'asthenosphere',
-    'astley',
-    'astoria',
-    'astorre',
-    'astringent',
-    'astropath',
-    'asunder',
-    'asylum-seekers',
     'asymptotic',
-    'atavistic',
-    'athenaeum',
-    'athleticism',
-    'atk',
-    'atlases',
-    'ats',
-    'attache',
-    'attendees',
-    'attentional',
-    'attorneys',
-    'attwood',
-    'atv',
-    'auditioned',
-    'audubon',
-    'auger',
     'augmenting',
-    'augur',
-    'augustan',
-    'aut',
-    'authoring',
-    'autocrat',
-    'autoexec.bat',
-    'automata',
-    'autonomously',
-    'avalanches',
-    'avenged',
-    'avian',
-    'avila',
-    'awa',
-    'awami',
-    'awestruck',
     'awfulness',
-    'awl',
-    'axel',
-    'axing',
-    'aydid',
-    'ayesha',
-    'azmaveth',
-    'b&amp;q',
-    'b12',
-    'b6',
-    'ba\'ath',
-    'baal',
-    'babcock',
-    'babylonians',
-    'babysit',
-    'back-row',
     'backdated',
-    'backdrops',
-    'backpack',
-    'backsides',
-    'backstroke',
-    'backtrack',
-    'backwash',
-    'baddeley',
-    'badlands',
-    'bagging',
-    'baggio',
-    'bailee',
-    'bailing',
-    'bakeries',
-    'bakufu',
-    'bal',
     'baldness',
-    'baldry',
-    'balerno',
-    'balestre',
-    'balladur',
-    'ballvalve',
-    'ballynahinch',
-    'bamber',
-    'bancroft',
-    'bandaging',
-    'banjo',
-    'bankside',
-    'bannen',
-    'banshee',
-    'bantering',
-    'baptise',
     'barco',
-    'barenboim',
-    'barents',
-    'barham',
-    'barmen',
-    'barnes/oxford',
-    'baronetcy',
-    'baronne',
-    'barony',
-    'barracking',
-    'barrios',
-    'bartender',
-    'bartlemas',
-    'baryte',
-    'barzani',
-    'bascombe',
     'basf',
-    'bashful',
-    'basked',
-    'basrah',
-    'bassano',
-    'basset',
-    'bassoons',
-    'bathgate',
-    'bathrobe',
-    'bathymetric',
-    'bator',
-    'battler',
-    'baubles',
-    'baulk',
-    'baulked',
-    'bayer',
     'bayern',
-    'bayes',
-    'bayeux',
-    'baying',
-    'bayles',
-    'bcs',
-    'beaconsfield',
-    'beano',
-    'beatle',
-    'beazley',
-    'beckman',
-    'beckon',
-    'bed-and-breakfast',
-    'bedfellows',
-    'bedridden',
-    'bedsits',
     'beecher',
-    'beechwood',
-    'beefeater',
-    'beeney',
-    'beerbohm',
-    'beeson',
-    'beeton',
-    'befriend',
-    'befriending',
-    'begg',
-    'begonias',
-    'beguiled',
-    'behaviourists',
-    'beheld',
-    'beholder',
-    'beida',
     'belau',
-    'belcher',
-    'belemnite',
-    'belgravia',
-    'bellevue',
-    'bellicose',
-    'belligerence',
-    'belligerently',
-    'bellini',
-    'bellis',
-    'belloc',
-    'belmodes',
-    'belorussian',
-    'belpan',
-    'bem',
-    'benchmarking',
     'benet',
-    'benfica',
-    'benidorm',
-    'benjy',
-    'bequeath',
-    'berated',
-    'bere',
-    'berenson',
-    'bergson',
-    'bering',
-    'berisha',
-    'berkhamsted',
-    'berthed',
-    'besieging',
-    'best-loved',
-    'bestselling',
     'bette',
-    'beuys',
-    'bewitching',
-    'bfass',
-    'bg-base',
-    'bhs',
-    'bidden',
-    'bideford',
-    'bidet',
-    'bie',
-    'bifurcation',
-    'biggins',
-    'biggish',
-    'biggles',
-    'bilaterally',
-    'bilbo',
     'biles',
-    'bilious',
-    'billboards',
-    'billets',
-    'billig',
-    'billings',
-    'billingsgate',
-    'billington',
-    'binns',
-    'binomial',
-    'biomorphs',
-    'bios',
-    'biotinylated',
-    'bir',
-    'birdied',
-    'birdwatching',
     'birks',
-    'birth-rate',
-    'birthweight',
-    'bissell',
-    'bitmap',
-    'bituminous',
-    'biz',
-    'black-haired',
-    'black-out',
-    'blacken',
-    'blackie',
-    'blacking',
-    'blackish',
-    'blacklist',
-    'blackman',
-    'blackspot',
     'blackwomen',
-    'blakeney',
-    'blanca',
-    'blancmange',
-    'blandishments',
-    'blankness',
-    'blared',
-    'blaydon',
-    'blazers',
-    'bleakness',
-    'bleary-eyed',
-    'bleeper',
-    'bleiburg',
-    'blighty',
-    'blinder',
-    'blindingly',
     'blinkers',
-    'blithe',
-    'blitzed',
-    'bloating',
-    'block-like',
-    'blockbusters',
-    'blocker',
-    'bloodbath',
-    'blooded',
-    'bloodstains',
-    'bloodstock',
-    'bloodworm',
-    'blubber',
-    'bludgeoned',
-    'blue-and-white',
-    'blue-chip',
     'blue-collar',
-    'bluebeard',
-    'blueness',
-    'blum',
-    'bluntness',
-    'bluster',
-    'bms',
-    'bmws',
-    'boac',
-    'boardrooms',
-    'boardwalk',
-    'boaz',
-    'bobble',
-    'boc',
-    'bod',
-    'boden',
     'boesky',
-    'boffin',
-    'bofors',
-    'bogdan',
-    'bohemians',
-    'boks',
-    'bolan',
-    'boldon',
-    'bolero',
-    'bolstering',
-    'bombard',
-    'bombarding',
-    'bonaventure',
-    'boneless',
-    'bonham',
-    'bonjour',
     'bonkers',
-    'bonney',
-    'booby',
-    'bookable',
-    'bookish',
-    'bookmark',
-    'boone',
-    'bootleg',
-    'boozing',
-    'boozy',
-    'bophuthatswana',
-    'born-again',
-    'boroughbridge',
-    'boroughmuir',
-    'borthwick',
-    'bosoms',
     'botley',
-    'botticelli',
-    'bottomed',
-    'bourke',
-    'bowater',
-    'bower-bird',
-    'bowis',
-    'bowlby',
-    'bowmen',
-    'bowmore',
-    'boycotts',
-    'boyne',
-    'boyson',
-    'brabant',
-    'braden',
-    'brahmin',
     'brainless',
-    'brainwashed',
-    'brainwave',
-    'bramwell',
-    'brandished',
-    'brandon-bravo',
-    'branfoot',
-    'brannigan',
-    'brats',
-    'brava',
-    'braving',
-    'brawling',
-    'brawn',
-    'breads',
-    'breakneck',
-    'breakup',
     'brearley',
-    'breasted',
-    'breath-taking',
-    'breathlessness',
-    'brechin',
-    'brescia',
-    'brickell',
-    'bride-to-be',
-    'brideshead',
-    'bridie',
-    'bridleway',
-    'bridleways',
-    'briefer',
-    'brightman',
-    'brimstone',
-    'brindley',
     'briony',
-    'britches',
-    'brno',
-    'broadband',
-    'broadens',
-    'broadly-based',
-    'broadwater',
-    'broch',
-    'brogue',
-    'brokered',
-    'brolly',
-    'bromsgrove',
-    'bronson',
-    'bront&euml',
-    'brougham',
-    'brownings',
     'browsed',
-    'bruckner',
-    'brundtland',
-    'bruner',
-    'brushwood',
-    'brutes',
-    'bryden',
-    'brymbo',
-    'btw',
-    'bubonic',
-    'buc',
-    'buccaneer',
-    'buckram',
-    'buckthorn',
-    'budweiser',
-    'buffeting',
     'buffy',
-    'bugatti',
-    'bugle',
-    'bulawayo',
-    'bulgarians',
-    'bullens',
-    'bullet-proof',
-    'bullingdon',
-    'bulmer',
-    'bumbling',
-    'bumpers',
-    'bunching',
-    'bungee',
-    'bungle',
-    'bunter',
-    'buntings',
     'burberry',
-    'burge',
-    'burgesses',
-    'burghgesh',
-    'burley',
-    'burnet',
-    'burston',
-    'busybody',
-    'butchery',
-    'butler-sloss',
-    'butlers',
-    'buttercream',
-    'buttercups',
-    'butterfat',
-    'butterley',
-    'butties',
     'butting',
-    'butty',
-    'buxom',
-    'buxtehude',
-    'bx',
-    'by-laws',
-    'byers',
-    'bygones',
-    'byways',
-    'byword',
-    'c-myc',
-    'c.c.',
-    'c.t.',
-    'c.v.',
-    'c.w.',
-    'cabled',
     'cac',
-    'cackling',
-    'cacti',
-    'cadaver',
-    'cadences',
-    'caduta',
-    'cadwallon',
-    'caesium',
-    'caird',
-    'caitlin',
-    'cajoling',
-    'calabria',
-    'calamitous',
-    'calculi',
-    'calderwood',
-    'cale',
     'calfa',
-    'cali',
-    'caliph',
-    'calor',
-    'calvary',
-    'calverton',
-    'calvinists',
-    'calypso',
-    'camborne',
-    'camembert',
-    'camillo',
-    'camp-crp',
-    'campbells',
-    'campden',
-    'camper',
-    'campesino',
     'campesinos',
-    'candice',
-    'candidiasis',
-    'canis',
-    'cannibals',
-    'cannula',
-    'canoeist',
-    'cantal',
-    'cantankerous',
-    'cantatas',
-    'cantered',
-    'cantonese',
-    'cantor',
-    'canute',
-    'caparo',
-    'capenhurst',
     'capitalising',
-    'capitalized',
-    'capitulate',
-    'caplan',
-    'cappuccino',
-    'capsize',
-    'captor',
-    'caradon',
-    'carafe',
-    'carb',
-    'carbamylated',
-    'carbonaceous',
-    'carcinogenesis',
-    'carcinoid',
-    'cardus',
-    'caretakers',
     'caribbeans',
-    'caricatured',
-    'carina',
-    'carinthia',
-    'carlile',
-    'carlin',
-    'carlsson',
-    'carman',
-    'carmella',
-    'carmine',
-    'carno',
-    'carpark',
-    'carping',
-    'carrefour',
-    'carrera',
-    'cartagena',
     'carte',
-    'cartography',
-    'cartoonists',
-    'carys',
-    'casanova',
-    'cashiers',
-    'cashline',
-    'casings',
-    'cassandra',
-    'cassava',
-    'cassius',
-    'casson',
-    'cast-off',
-    'castelli',
-    'castello',
-    'casterbridge',
     'casters',
-    'casterton',
-    'castilian',
-    'castillo',
-    'castlemorton',
-    'catalase',
-    'catalysis',
-    'catania',
-    'catch-all',
-    'categorising',
-    'catharsis',
-    'cathartic',
-    'catton',
-    'caulfield',
-    'caustically',
-    'cavaliers',
     'cavorting',
-    'caw',
-    'cayenne',
-    'cbd',
-    'ccetsw',
-    'cd-roms',
-    'cd2',
-    'cd68',
-    'cda',
-    'cdm',
-    'cdtv',
-    'ceb',
-    'cebit',
-    'cecily',
-    'ceda',
-    'ceefax',
     'celebes',
-    'celebi',
-    'cementing',
-    'cenotaph',
-    'centauri',
-    'centers',
-    'centesimal',
-    'centile',
-    'cento',
-    'centralise',
-    'centre-back',
-    'centre-line',
-    'centreline',
-    'centro',
-    'cer',
-    'ceteris_paribus',
     'cezanne',
-    'cfm',
-    'cgi',
-    'ch.d.',
-    'chablis',
-    'chadli',
-    'chafed',
-    'chaillot',
-    'chaim',
-    'chaining',
-    'chalon',
-    'chambermaid',
-    'chameleons',
-    'chamois',
-    'champagnes',
-    'championing',
     'chandrasekhar',
-    'change-over',
-    'chanson',
-    'chantilly',
-    'character-based',
-    'characterful',
-    'charades',
-    'charlatan',
-    'charlesworth',
-    'chartres',
-    'chasers',
-    'chastised',
-    'chatsworth',
-    'chatterbox',
-    'chauthala',
-    'chauvinistic',
     'checkerboard',
-    'chekhov',
-    'chelonians',
-    'chenille',
-    'chequebook',
-    'cherokee',
-    'cheshires',
-    'chettle',
-    'chews',
-    'chewy',
-    'chicory',
-    'chieveley',
-    'chihana',
-    'chilcott',
-    'childishly',
-    'childline',
     'childs',
-    'chili',
-    'chiller',
-    'chiming',
-    'chinaman',
-    'ching',
-    'chipset',
-    'chirk',
-    'chissano',
-    'chit-chat',
-    'chitty',
-    'chivalric',
-    'choi',
-    'cholecystolithotomy',
-    'cholinergic',
-    'chong',
     'chope',
-    'chopsticks',
-    'chorused',
-    'christensen',
-    'christophe',
-    'chromatin',
-    'chromatographic',
-    'churchwarden',
-    'churchwardens',
-    'churchyards',
-    'churns',
-    'ci5',
-    'cic',
-    'cichlasoma',
-    'cinder',
-    'cine',
     'cipfa',
-    'circularity',
-    'cirque',
-    'cisco',
-    'citizenry',
-    'civilizing',
-    'cizek',
-    'cla',
-    'clairvoyant',
-    'clamoured',
-    'claremont',
-    'clarins',
-    'clarks',
-    'clasps',
-    'class-room',
-    'classifies',
     'claydon',
-    'clearinghouse',
-    'clearings',
-    'cleavages',
-    'cleave',
-    'clemence',
-    'clich&eacute;d',
-    'clifftop',
-    'climaxes',
-    'cline',
-    'clinked',
-    'clinking',
-    'clippers',
-    'clobber',
-    'clobbered',
-    'closed-circuit',
     'closeted',
-    'clots',
-    'clotting',
-    'clownfish',
-    'cloze',
-    'clubbing',
-    'clumsiness',
-    'clunk',
-    'clydeside',
-    'clynol',
-    'cnt',
-    'co-',
-    'co-chairman',
-    'co-defendant',
-    'co-opt',
-    'co-option',
     'co-processor',
-    'coalesced',
-    'coalite',
-    'coalport',
-    'coburn',
-    'cockerton',
-    'coconuts',
-    'codenamed',
-    'codex',
-    'codron',
-    'cody',
-    'coeur',
-    'coexisted',
-    'coexisting',
-    'cogency',
-    'cogently',
     'cognisance',
-    'cohere',
-    'cointreau',
-    'colander',
-    'coldharbour',
-    'coleslaw',
-    'coley',
-    'coliseum',
-    'collapsible',
-    'collarbone',
-    'collared',
-    'collectivization',
-    'collegians',
-    'colliers',
-    'collingwood',
-    'colloquially',
     'collude',
-    'colonise',
-    'colourways',
-    'coltrane',
-    'comatose',
-    'combatant',
-    'comber',
-    'combinatorial',
-    'combustible',
-    'come-back',
-    'comm',
-    'commendations',
-    'commercialised',
-    'comms',
-    'communally',
-    'communicable',
     'companionably',
-    'complementarity',
-    'compline',
-    'comprehending',
-    'comprehensives',
-    'compressing',
-    'computationally',
-    'computer-assisted',
-    'computer-controlled',
-    'computerization',
-    'computervision',
-    'concertina',
-    'conciliar',
-    'condensing',
-    'confection',
-    'confectioners',
     'confederacy',
-    'confederate',
-    'confederations',
-    'confidence-building',
-    'confiscate',
-    'conflation',
-    'confucius',
-    'cong',
-    'congleton',
-    'congratulatory',
-    'congregationalist',
-    'coningsby',
-    'conjectured',
-    'conjuncture',
-    'conkers',
-    'conlon',
     'conn',
-    'connivance',
-    'conoco',
-    'conradin',
-    'conscripted',
-    'consoles',
-    'conspiracies',
-    'conspiratorially',
-    'constantin',
-    'constitutionalism',
-    'constricting',
-    'constructivism',
-    'consummated',
-    'conte',
-    'contemporaneously',
-    'context-dependent',
     'contextually',
-    'conti',
-    'continentals',
-    'continuations',
-    'contracted-out',
-    'contraflow',
-    'contrapuntal',
-    'contrastive',
-    'contravener',
-    'contrition',
-    'converges',
-    'convertibles',
-    'convulsion',
-    'cookson',
-    'coolant',
-    'coolie',
     'cooling-off',
-    'coombe',
-    'copier',
-    'copperfield',
-    'coppice',
-    'coppola',
-    'coq',
-    'cor.',
-    'corbridge',
-    'corded',
-    'cordoba',
-    'cordon_bleu',
-    'coreldraw',
-    'corfe',
-    'coriolanus',
-    'cornering',
     'cornerstones',
-    'cornucopia',
-    'corporates',
-    'corporeal',
-    'corral',
-    'corrects',
-    'correlating',
-    'correlative',
-    'corrupts',
-    'corsie',
-    'cory',
-    'cosh',
-    'coshh',
-    'cosily',
-    'cosine',
-    'cosiness',
     'cosla',
-    'cosseted',
-    'costain',
-    'cottons',
-    'cottrell',
-    'couches',
-    'coulby',
-    'coulthard',
-    'counter-reformation',
-    'counter-revolution',
-    'counteracted',
-    'counterparties',
-    'counterweight',
-    'couplings',
-    'cour',
-    'couriers',
     'coursed',
-    'coven',
-    'coverdale',
-    'covermaster',
-    'coverts',
-    'covet',
-    'cower',
-    'cowered',
-    'cowling',
-    'cpc',
-    'cpr',
-    'cr&egrave;che',
-    'crabtree',
-    'crackpot',
-    'cracow',
-    'cradles',
     'cranberries',
-    'cranny',
-    'crappy',
-    'crawls',
-    'crawshaw',
-    'crayfish',
-    'crc',
-    'creag',
-    'creaks',
-    'cream-coloured',
-    'creatine',
-    'creditworthiness',
-    'creeks',
-    'creeper',
-    'cressida',
-    'crestfallen',
     'crimp',
-    'cristofori',
-    'crock',
-    'crofter',
-    'cromarty',
-    'crookes',
-    'crooned',
-    'crooning',
-    'cross-national',
-    'cross-referenced',
-    'cross-referencing',
-    'crossfire',
-    'crosslinking',
-    'crosswords',
-    'crowing',
-    'crudest',
     'cruellest',
-    'crumbly',
-    'crumple',
-    'crushes',
-    'crusted',
-    'cryptically',
-    'cryptocoryne',
-    'cryptosporidium',
-    'crystallisation',
-    'cska',
-    'ctcs',
-    'ctrl',
-    'cubitt',
-    'cucumbers',
-    'cuffed',
-    'cultural-ideological',
     'cumbermound',
-    'cumnock',
-    'cunliffe',
-    'cunnane',
-    'cunninghame',
-    'cuntona',
-    'cup-tie',
-    'curle',
-    'curragh',
-    'curtsy',
-    'customise',
-    'cut-backs',
-    'cuv&eacute;e',
-    'cyclamen',
-    'cypher',
-    'cypresses',
     'cyst',
-    'cystoscopy',
-    'cytokine',
-    'cytotoxic',
-    'czar',
-    'd&amp;b',
-    'd&eacute;b&acirc;cle',
-    'd&eacute;j&agrave_vu',
-    'd&eacute;mocratique',
-    'd\'alembord',
-    'd\'arcos',
-    'd\'aubigny',
-    'd\'orsay',
-    'd\'ye',
-    'd\'yer',
-    'd.h.',
     'd.l.r.',
-    'dado',
-    'dail',
-    'daimler-benz',
-    'dairying',
-    'dakin',
-    'daler-rowney',
-    'dalgety',
-    'dalian',
-    'dalkeith',
-    'dalliance',
-    'dally',
-    'dalmatian',
-    'dames',
-    'dammed',
-    'dampening',
     'dan-air',
-    'danakil',
-    'dance-floor',
-    'dancefloor',
-    'dandelions',
-    'daniele',
-    'danu',
-    'danuese',
-    'daphnia',
-    'daredevil',
-    'daresbury',
-    'darley',
-    'darning',
-    'darryl',
-    'dataease',
-    'dateline',
     'datuk',
-    'daurog',
-    'day-care',
-    'day-long',
-    'daybreak',
-    'daylights',
-    'daz',
-    'dazedly',
-    'dcsl',
-    'ddi',
-    'ddl',
-    'de-skilling',
-    'deaconess',
-    'deadening',
-    'deakin',
-    'dealership',
     'dearg',
-    'dearie',
-    'deb',
-    'debasement',
-    'debord',
-    'debriefing',
-    'deceptions',
-    'decibel',
-    'deciphering',
-    'decisiveness',
-    'deckchair',
-    'deckchairs',
-    'declarative',
-    'decoder',
-    'decompose',
-    'decorous',
     'deducing',
-    'defaulting',
-    'defecate',
-    'defensiveness',
-    'deferment',
-    'defile',
-    'defray',
-    'defusing',
-    'degenerating',
-    'degrades',
-    'dehydrogenase',
-    'deigned',
-    'dejection',
-    'delacroix',
-    'delgado',
-    'deliberated',
     'deliberative',
-    'delicatessens',
-    'deltas',
-    'delude',
-    'dem.',
-    'demarcated',
-    'deme',
-    'dementing',
-    'demerger',
-    'demeter',
-    'demobilisation',
-    'demobilized',
-    'dendrites',
-    'dendritic',
-    'denice',
-    'denigrated',
     'denigration',
-    'denison',
-    'denktash',
-    'denman',
-    'denner',
-    'denouement',
-    'dents',
-    'denudation',
-    'dependability',
-    'deplete',
-    'depleting',
-    'deplores',
-    'deport',
-    'deportment',
-    'depose',
-    'depositional',
     'depreciate',
-    'depresses',
-    'deputising',
-    'derailed',
-    'dermatologists',
-    'descents',
-    'description=',
-    'desdemona',
-    'deserter',
-    'desiccation',
-    'desiderius',
-    'designaknit',
-    'desirous',
-    'despensers',
-    'despises',
-    'despotic',
     'destabilization',
-    'destabilizing',
-    'detente',
-    'determinist',
-    'deterrents',
-    'deters',
-    'detonate',
-    'detonator',
-    'detours',
-    'detracts',
-    'dettori',
-    'deuteronomy',
-    'devastate',
-    'deverill',
-    'devi',
-    'devolving',
     'dewhurst',
-    'dgse',
-    'dhani',
-    'dhia',
-    'diagenesis',
-    'diaghilev',
-    'diagonals',
-    'diagrammatically',
-    'dialogic',
-    'dianne',
-    'diarrhoeal',
-    'diastolic',
-    'diatoms',
-    'diatonic',
-    'diatribe',
-    'diaz',
     'dictatorships',
-    'diderot',
-    'diehard',
-    'diem',
-    'dieters',
-    'dieu',
-    'diffuser',
-    'diffusing',
-    'digitally',
-    'digitizing',
-    'digress',
-    'dilutions',
-    'dilworth',
-    'dime',
-    'dimpled',
-    'dinas',
     'dinsdale',
-    'diocletian',
-    'diodes',
-    'dionysus',
-    'diphthong',
-    'diploid',
-    'dipper',
-    'diptera',
-    'directorial',
-    'directorships',
-    'dirkin',
-    'dirtier',
-    'dirtiest',
-    'disafforestment',
-    'disaggregated',
-    'disapproves',
     'disbursed',
-    'disbursement',
-    'disciplinarian',
-    'disclaim',
-    'disclaimers',
-    'discman',
-    'discomfited',
-    'discomforts',
-    'disconnection',
-    'discontinuance',
-    'discotheque',
-    'discriminations',
-    'disdainfully',
-    'disembark',
-    'disentangled',
-    'disfavour',
     'disgorged',
-    'disgustedly',
-    'disheartened',
-    'disheartening',
-    'dishonourable',
-    'disinclination',
-    'disinformation',
-    'disinherited',
-    'disjunction',
-    'dislocations',
-    'dismemberment',
-    'disoriented',
-    'disown',
-    'dispatching',
-    'dispelling',
-    'disregards',
     'disrupts',
-    'distil',
-    'distrustful',
-    'dither',
-    'ditty',
-    'diuretics',
-    'divergences',
-    'diversionary',
-    'diverts',
-    'dividers',
-    'divination',
-    'djinn',
-    'djohar',
-    'dmj',
-    'dmu',
-    'dn',
     'dockyards',
-    'dodgers',
-    'doge',
-    'dollop',
-    'dolomites',
-    'domain-specific',
-    'domaine',
-    'domestication',
-    'don\'ts',
-    'donnington',
-    'dont',
-    'doodle',
-    'doohan',
-    'doolittle',
-    'doped',
-    'dornier',
     'dory',
-    'dost',
-    'dot-matrix',
-    'double-glazing',
-    'doublet',
-    'douglas-home',
-    'doulton',
-    'douse',
-    'dowding',
-    'dowel',
-    'downgrade',
-    'downhearted',
-    'downpipes',
-    'downswing',
-    'downtrodden',
-    'dowson',
     'dozzell',
-    'drago',
-    'drakes',
-    'dramatics',
-    'dramatised',
-    'dramatists',
-    'draping',
-    'dras',
-    'drawn-out',
-    'drda',
-    'dressers',
-    'drg',
-    'driest',
-    'driffield',
-    'drifter',
-    'drink-drive',
     'droitwich',
-    'drovers',
-    'drowns',
-    'drtf1/e2f',
-    'drubbing',
-    'drug-related',
-    'druze',
-    'dsc',
-    'dtt',
-    'dualistic',
-    'duane',
-    'dubbing',
-    'duchamp',
-    'duchenne',
-    'duckworth',
-    'duclos',
     'ductile',
-    'duelling',
-    'duets',
-    'dug-out',
-    'duggan',
-    'duhamel',
-    'dukakis',
-    'dumpty',
-    'dungeness',
-    'dunkel',
-    'dunleavy',
-    'dunlin',
-    'dunoon',
-    'dunstan',
-    'dupe',
-    'dupes',
     'duplexes',
-    'durnin',
-    'dursley',
-    'dury',
-    'dushanbe',
-    'dustman',
-    'dutton',
-    'duvets',
-    'dweller',
-    'dybbuk',
-    'dyers',
-    'dyestuffs',
-    'e.m.f.',
-    'eadberht',
-    'eadie',
-    'eadric',
     'ear-rings',
-    'eardwulf',
-    'earthbound',
-    'earthworm',
-    'eastbound',
-    'easterbrook',
-    'easterhouse',
-    'easygoing',
-    'ebbw',
-    'eben',
-    'ec1',
-    'ecc',
-    'eccleshall',
-    'ecg',
-    'ecgd',
-    'echolocation',
     'economise',
-    'ecori',
-    'ecstatically',
-    'ect',
-    'ectopic',
-    'editor-in-chief',
-    'edits',
-    'educationists',
-    'eelam',
-    'efa',
-    'effectual',
-    'effervescent',
-    'effete',
-    'effrontery',
-    'effusion',
-    'effusive',
     'egged',
-    'egham',
-    'egoistic',
-    'egotism',
-    'egremont',
-    'ei',
-    'eia',
-    'eicosanoid',
-    'eight-day',
-    'eight-week',
-    'eighteenth-',
-    'eighty-nine',
-    'eighty-one',
-    'eighty-three',
-    'ein',
-    'eindhoven',
     'eisteddfod',
-    'elaborations',
-    'electro',
-    'electro-acoustic',
-    'electro-magnetic',
-    'electrolysis',
-    'electromagnetism',
-    'electrophoresed',
-    'electrophysiological',
-    'elephantine',
-    'eleusis',
-    'elevating',
-    'eleven-plus',
-    'elfed',
-    'elicitation',
-    'elicits',
     'elisha',
-    'elitists',
-    'elkington',
-    'elle',
-    'ellers',
-    'ellipsis',
-    'eln',
-    'elonex',
-    'elphinstone',
-    'elstree',
-    'eltis',
-    'eludes',
-    'email',
-    'embarkation',
-    'embarrassments',
-    'embed',
     'embellish',
-    'embellishments',
-    'emblematic',
-    'embryology',
-    'emg',
-    'emmy',
-    'emor',
-    'empedocles',
-    'emphysema',
-    'empiricists',
-    'emplacement',
-    'emyr',
-    'en_bloc',
-    'ena',
-    'enactments',
-    'enacts',
     'encamped',
-    'encampments',
-    'encircle',
-    'encyclopaedias',
-    'encyclopaedic',
-    'end-of-season',
-    'end-of-year',
-    'end-product',
-    'endearments',
-    'endoprosthesis',
-    'endoscope',
-    'endothelin-1',
-    'energised',
-    'energy-efficient',
-    'energy-saving',
-    'enfeebled',
     'enforces',
-    'engel',
-    'engenders',
-    'englishwoman',
-    'engulfing',
-    'enigmatically',
-    'ennis',
-    'enquirers',
-    'enraptured',
-    'enright',
-    'enslavement',
-    'entanglements',
-    'entente',
-    'enteral',
-    'enterochromaffin',
-    'enteroglucagon',
     'entertains',
-    'enthuse',
-    'enthuses',
-    'enumerate',
-    'enviously',
-    'environment-friendly',
-    'enzo',
-    'eocene',
-    'eoin',
-    'eos',
-    'eosin',
-    'epaulettes',
-    'eph.',
-    'epicentre',
-    'epiphany',
-    'epistles',
     'epithelia',
-    'epithets',
-    'epitomises',
-    'epitope',
-    'epitot',
-    'equable',
-    'equalising',
-    'equalize',
-    'equalling',
-    'equilateral',
-    'erc',
-    'erceldoun',
-    'erdle',
-    'ergo',
-    'erotica',
-    'erring',
     'erythrocyte',
-    'es/mp',
-    'esas',
-    'escapist',
-    'escherichia',
-    'eschewing',
-    'esher',
-    'eskdale',
-    'eskimos',
-    'esl',
-    'espana',
-    'espousal',
-    'esq.',
-    'essen',
-    'essenes',
-    'essentialism',
     'estelle',
-    'esters',
-    'estimator',
-    'estimators',
-    'etch-resist',
-    'ethiopians',
-    'ethnocentric',
-    'ethyl',
-    'etonian',
-    'etty',
-    'etymology',
-    'eu',
-    'euclidean',
-    'eukaryotes',
-    'eulogy',
-    'eunice',
     'euphemisms',
-    'euphrates',
-    'euro-dollar',
-    'eurocheques',
-    'europe-wide',
-    'evacuating',
-    'evangelisation',
-    'evasions',
-    'evens',
-    'eventing',
-    'evermore',
-    'everqueen',
-    'evidences',
-    'evolutionists',
-    'ex-army',
-    'ex-directory',
     'ex-president',
-    'ex-service',
-    'ex-soldier',
-    'exacerbates',
-    'exacerbating',
-    'exasperating',
-    'excavators',
-    'excerpt',
-    'exchanger',
-    'exclusionary',
-    'exclusiveness',
-    'excreta',
-    'excruciatingly',
-    'excusing',
-    'executes',
-    'exemplifying',
     'existentialist',
-    'exons',
-    'exorcise',
-    'expansionism',
-    'expansively',
-    'expiratory',
-    'explosively',
-    'expounding',
-    'expressible',
-    'expressionlessly',
-    'expulsions',
-    'extensional',
-    'exteriors',
-    'exterminated',
-    'externalization',
-    'extinguisher',
     'extolled',
-    'extra-parliamentary',
-    'extra-time',
-    'extraterrestrial',
-    'exude',
-    'exudes',
-    'exuding',
-    'eyeliner',
-    'eynsham',
-    'f&aacute;il',
-    'f.w.',
-    'f4',
-    'f5',
-    'faberg&eacute',
-    'fabricate',
-    'fabricating',
     'faccenda',
-    'faceted',
-    'facilitators',
-    'facings',
-    'factionalism',
-    'factum',
-    'faggots',
-    'fairbank',
-    'fairey',
-    'fal',
-    'falange',
-    'falangists',
-    'falconry',
-    'fallibility',
-    'falsetto',
-    'fama',
     'familiarisation',
-    'fantastical',
-    'fanzines',
-    'faor',
-    'far-away',
-    'far-right',
-    'farabundo',
-    'farc',
-    'faringdon',
-    'farmworkers',
-    'farrer',
-    'farringdon',
-    'farting',
-    'fascinates',
-    'fastener',
-    'fastest-growing',
     'fastidiously',
-    'fatherhood',
-    'fatherless',
-    'fatigued',
-    'fattened',
-    'faulting',
-    'faustina',
-    'faversham',
-    'fawcus',
-    'faxing',
-    'fayed',
-    'fcib',
-    'fdr',
-    'fe(iii)',
-    'fearlessly',
-    'fearnley',
     'federally',
-    'feed-back',
-    'feherty',
-    'feigen',
-    'fel',
-    'feldman',
-    'feldspar',
-    'felicitous',
-    'felon',
-    'femaleness',
-    'fenders',
-    'fending',
-    'fern&aacute;ndez',
-    'ferraris',
-    'ferryman',
-    'fetches',
     'fetter',
-    'fettered',
-    'fetters',
-    'fetuses',
-    'fev',
-    'fewest',
-    'fez',
-    'fibre-optic',
-    'fibronectin',
-    'fide',
-    'fidgety',
-    'field-work',
-    'fieldworkers',
-    'fierceness',
-    'fifteen-year-old',
-    'fifthly',
     'fig.1',
-    'fig.2',
-    'figuratively',
-    'figurine',
-    'filamentous',
-    'filbert',
-    'filey',
-    'filip',
-    'filippo',
-    'fille',
-    'fillies',
-    'fillmore',
-    'fineness',
-    'fingerprinting',
-    'finisher',
-    'finns',
     'fireflies',
-    'firmament',
-    'firmin',
-    'firs',
-    'first-born',
-    'first-person',
-    'firstborn',
-    'fishmonger',
-    'fistula',
-    'fistulas',
-    'five-hour',
-    'five-man',
-    'five-part',
-    'five-thirty',
-    'fivers',
-    'fixative',
     'fixed-rate',
-    'fizzled',
-    'flab',
-    'flabbergasted',
-    'flaccid',
-    'flack',
-    'flaherty',
-    'flail',
-    'flailed',
-    'flaky',
-    'flashpoint',
-    'flatulence',
-    'fleeces',
-    'flees',
-    'flemings',
-    'fleur',
     'flexes',
-    'flg.off',
-    'flickers',
-    'flings',
-    'flips',
-    'flirtatious',
-    'flit',
-    'floodlight',
-    'floorboard',
-    'florio',
-    'floured',
-    'flowerpots',
-    'fluffed',
-    'fluoridation',
-    'flurries',
-    'fluval',
     'flyover',
-    'flywheel',
-    'fob',
-    'foch',
-    'focusses',
-    'fodor',
-    'fogarty',
-    'fogs',
-    'foh',
-    'foibles',
-    'foie',
-    'foisted',
-    'folic',
-    'follicles',
-    'fondled',
-    'fondue',
     'foo',
-    'footlights',
-    'footmen',
-    'footway',
-    'fordism',
-    'forehand',
-    'foreheads',
-    'forelegs',
-    'foreplay',
-    'forethought',
-    'forints',
-    'formalise',
-    'formulaic',
-    'forres',
-    'fortescue',
-    'fortnum',
     'fortuitously',
-    'foss',
-    'fosse',
-    'fossilised',
-    'fossilized',
-    'foulds',
-    'four-fold',
-    'four-man',
-    'four-piece',
-    'four-star',
-    'four-storey',
-    'four-week',
-    'four-wheel-drive',
-    'four-year-olds',
-    'fournier',
-    'fox-hunting',
     'foxgloves',
-    'foxley',
-    'fp&ouml',
-    'fractal',
-    'fractionation',
-    'fragmenting',
-    'frailties',
-    'framlingham',
-    'france-presse',
-    'franchised',
-    'franco-prussian',
-    'francophone',
-    'franjo',
-    'franked',
-    'fraxilly',
-    'fraying',
     'free-fall',
-    'free-living',
-    'free-running',
-    'free-swimming',
-    'freedman',
-    'freemans',
-    'frelimo',
-    'fremont',
-    'frenchay',
-    'frequenting',
-    'freshen',
-    'freshest',
-    'freya',
-    'frida',
-    'frieda',
-    'friedmann',
     'friel',
-    'friendless',
-    'friendlies',
-    'friezes',
-    'frinton',
-    'frisky',
-    'frizingley',
-    'frizzy',
-    'froggatt',
-    'frohnmayer',
-    'frolic',
-    'front-runner',
-    'frostbite',
-    'fruitfully',
-    'frustratingly',
-    'fs',
     'fuchsias',
-    'fuelwood',
-    'fuhrer',
-    'full-',
-    'full-backs',
-    'full-bodied',
-    'full-colour',
-    'full-sized',
-    'fulmar',
-    'functionalists',
-    'funders',
-    'fundoplication',
-    'funereal',
-    'funfair',
-    'fungicide',
-    'fungicides',
     'funnell',
-    'futurist',
-    'fylde',
-    'g4',
-    'gaap',
-    'gabbled',
-    'gabbling',
-    'gabby',
-    'gaby',
-    'gaffe',
-    'gainers',
-    'gairloch',
-    'gaiters',
-    'gallantly',
-    'galleria',
-    'galliano',
     'gamekeepers',
-    'gametes',
-    'gangland',
-    'gangling',
-    'gannets',
-    'garbo',
-    'gardai',
-    'garde',
-    'gargoyle',
-    'garrulous',
-    'gartner',
-    'gashed',
-    'gasification',
-    'gasthof',
-    'gastrectomy',
-    'gastroenterology',
     'gastropods',
-    'gatekeepers',
-    'gatsby',
-    'gaughan',
-    'gauging',
-    'gawping',
-    'gazebo',
-    'gazelles',
-    'gazeta',
-    'gcs',
-    'gcses',
-    'gd',
-    'gearboxes',
-    'geiger',
-    'gelada',
-    'gemms',
     'gendarmerie',
-    'generalizing',
-    'generically',
-    'geneticist',
-    'geneticists',
-    'gennady',
-    'genomes',
-    'genotypes',
-    'gentlest',
-    'gentrification',
-    'genuineness',
-    'geodesics',
-    'geologically',
-    'geometrically',
-    'geomorphic',
-    'georgetown',
     'geraint',
-    'gerber',
-    'geriatrics',
-    'german-speaking',
-    'germane',
-    'germanies',
-    'gesta',
-    'gestalt',
-    'gestural',
-    'ghanaian',
-    'ghulam',
-    'giancarlo',
-    'gibbering',
-    'gibberish',
-    'gidding',
-    'gilgamesh',
     'gillis',
-    'gingham',
-    'ginnie',
-    'ginseng',
-    'gioella',
-    'giotto',
-    'gironella',
-    'girton',
-    'gits',
-    'gittel',
-    'giulia',
-    'give-away',
-    'glaciation',
-    'glades',
-    'glaringly',
-    'glasshouse',
     'glaucous',
-    'gleams',
-    'glebe',
-    'gleeson',
-    'glenrothes',
-    'glial',
-    'glidewell',
-    'glimmered',
-    'glitz',
-    'gloat',
-    'globalization',
-    'glosters',
-    'glucagon',
-    'glutinous',
-    'gluttony',
-    'glycerol',
     'glycol',
-    'glycoproteins',
-    'gnashing',
-    'gnaw',
-    'goading',
-    'goal-line',
-    'goalmouth',
-    'goalscoring',
-    'gobbling',
-    'godalming',
-    'godmanchester',
-    'godparents',
-    'godson',
-    'goibniu',
-    'gollum',
-    'gombrich',
     'gomes',
-    'goneril',
-    'good-naturedly',
-    'goodenache',
-    'gooding',
-    'goodyear',
-    'gooey',
-    'gorazde',
-    'gorbad',
-    'goring',
-    'gorky',
-    'gormless',
-    'gorton',
-    'gossamer',
-    'gotthard',
-    'gouges',
     'gourami',
-    'gouramis',
-    'government-backed',
-    'government-funded',
-    'government-owned',
-    'govett',
-    'gradations',
-    'grained',
-    'grammar-school',
-    'grammarians',
-    'grandees',
-    'grandison',
-    'granger',
-    'grannies',
-    'grasps',
-    'grassed',
     'gratuitously',
-    'gravels',
-    'gravis',
-    'grays',
-    'grazes',
-    'greco',
-    'greenblatt',
-    'greenhill',
-    'greenness',
-    'greenslade',
-    'greenspan',
-    'grenadier',
-    'grenadiers',
-    'grenville',
-    'greyfriars',
-    'greystones',
     'grief-stricken',
-    'grievously',
-    'grigson',
-    'grills',
-    'grim-faced',
-    'grimshaw',
-    'grimsilk',
-    'grinds',
-    'gripe',
-    'groningen',
-    'grooved',
-    'grope',
-    'gros',
-    'grossed',
-    'groucho',
-    'ground-based',
     'groundsheet',
-    'groundswell',
-    'grovelling',
-    'grubbing',
-    'grudges',
-    'gruel',
-    'gst',
-    'guarantors',
-    'guardedly',
-    'guardia',
-    'gucci',
-    'guiana',
-    'guilders',
-    'guinevere',
-    'guis',
-    'gujarat',
     'gulbenkian',
-    'gullet',
-    'gullit',
-    'gunships',
-    'guppies',
-    'gupta',
-    'gur',
-    'gurgled',
-    'gusty',
-    'gwyn',
-    'gx',
-    'gyggle',
-    'gynaecologists',
-    'gyro',
-    'gysi',
-    'h-bomb',
     'haas',
-    'haavikko',
-    'hackneyed',
-    'haddington',
-    'haddon',
-    'hadleigh',
-    'hae',
-    'haematological',
-    'haider',
-    'haifa',
-    'haigh',
-    'hain',
-    'hairless',
-    'hairspray',
-    'halen',
-    'halewood',
     'haley',
-    'half-board',
-    'half-brothers',
-    'half-full',
-    'half-hidden',
-    'half-moon',
-    'half-price',
-    'half-truths',
-    'half-turned',
-    'halford',
-    'hallowe\'en',
-    'hallucinatory',
-    'hamble',
-    'hamed',
-    'hamid',
-    'hammadi',
     'hammam',
-    'hampering',
-    'hand-out',
-    'handicraft',
-    'handlebar',
-    'handrails',
-    'handshakes',
-    'hankies',
-    'hann',
-    'hannam',
-    'hansom',
-    'happy-go-lucky',
-    'harber',
-    'hard-core',
-    'hard-headed',
-    'harefield',
     'harkin',
-    'harlech',
-    'harlot',
-    'harmon',
-    'harmonica',
-    'harmonizing',
-    'harshest',
-    'hassock',
-    'hauls',
-    'haussmann',
-    'haute_couture',
-    'havers',
-    'haves',
-    'havilland',
-    'haw',
-    'hawthorns',
     'haycocks',
-    'haydon',
-    'hayton',
-    'hazelnut',
-    'hazelwood',
-    'hbeag',
-    'hcs',
-    'hdf',
-    'head-to-head',
-    'headhunter',
-    'headphone',
-    'headscarf',
-    'headstones',
-    'headword',
-    'healthiest',
-    'heart-rending',
     'heartbeats',
-    'heartburn',
-    'heathers',
-    'heatwave',
-    'heil',
-    'heirloom',
-    'helga',
-    'helmeted',
-    'helms',
-    'hemifield',
-    'hemispherical',
-    'hemming',
-    'henchmen',
-    'hendrique',
-    'hendron',
-    'henna',
     'hepes',
-    'hera',
-    'heralding',
-    'herbage',
-    'herbivorous',
-    'hercynian',
-    'heresies',
-    'hereunder',
-    'heritable',
-    'hermeneutic',
-    'hermione',
-    'hermiston',
-    'herms',
-    'herne',
-    'heroically',
-    'herrera',
     'herschel',
-    'heterozygous',
-    'hetty',
-    'hewett',
-    'heymouth',
-    'hf',
-    'hfs',
-    'hi-tec',
-    'hibiscus',
-    'high-cost',
-    'high-frequency',
-    'high-street',
-    'highers',
-    'highfields',
-    'hikes',
-    'hillock',
     'him/herself',
-    'himalaya',
-    'hin',
-    'hinchley',
-    'hinchliffe',
-    'hincmar',
-    'hindenburg',
-    'hip-hop',
-    'hippodrome',
-    'hippopotamus',
-    'hislop',
-    'hisses',
-    'histocompatibility',
-    'histograms',
-    'histone',
-    'historia',
     'histrionic',
-    'hit-and-run',
-    'hitches',
-    'hiv-infected',
-    'hizir',
-    'hla-b53',
-    'hla-dr',
-    'hlca',
-    'hmg',
-    'hmmm',
-    'hoarded',
-    'hoary',
-    'hobbesian',
-    'hobbyist',
-    'hobsbawm',
-    'hoechst',
     'hoey',
-    'hoggatt',
-    'hogmanay',
-    'hokkaido',
-    'holbrook',
-    'hold-all',
-    'hold-up',
-    'holidaymaker',
-    'holing',
-    'hollar',
-    'holliday',
-    'hollies',
-    'hologram',
-    'holovich',
-    'home-based',
-    'home-produced',
     'homebuyers',
-    'homed',
-    'hometown',
-    'homicidal',
-    'homogenous',
-    'homologies',
-    'homozygous',
-    'hone',
-    'honeycomb',
-    'honeyed',
-    'honolulu',
-    'hooton',
-    'hopkin',
-    'horatio',
-    'hornblower',
-    'hornets',
     'horrendously',
-    'horsey',
-    'hospitalisation',
-    'hospitalized',
-    'hostesses',
-    'hots',
-    'hotting',
-    'hou',
-    'hounding',
-    'housebuilders',
-    'housecoat',
-    'housemaster',
-    'houseplants',
-    'hovel',
-    'hovels',
-    'howey',
     'howson',
-    'hplc',
-    'hpr',
-    'huber',
-    'hucknall',
-    'huguenot',
-    'hulton',
-    'humanists',
-    'humberto',
-    'humbling',
-    'humboldt',
-    'humiliations',
-    'humoured',
-    'humping',
-    'hunchback',
-    'hunches',
     'hundredths',
-    'huntly',
-    'huntsman',
-    'husak',
-    'husbandmen',
-    'husks',
-    'hussars',
-    'hustings',
-    'hustling',
-    'hutchins',
-    'hutt',
-    'hyderabad',
-    'hydraulics',
-    'hydrology',
-    'hydrostatic',
-    'hydrothermal',
     'hyenas',
-    'hymenoptera',
-    'hyperactivity',
-    'hyperbolic',
-    'hyperinflation',
-    'hypermarket',
-    'hyperventilation',
-    'hypodermic',
-    'hypoglycaemic',
-    'hypotension',
-    'hypothesised',
-    'hypoxia',
-    'hythe',
-    'iasc',
-    'iberia',
-    'ic1',
     'ic2',
-    'icas',
-    'ice-blue',
-    'icebergs',
-    'icecream',
-    'ices',
-    'ich',
-    'icicles',
-    'iconic',
-    'icta',
-    'idealization',
-    'ideologues',
-    'idi',
-    'idiocy',
-    'ie-3',
-    'ieee',
     'ieuan',
-    'iffley',
-    'ifn-&ggr',
-    'ifor',
-    'ignoble',
-    'ignominiously',
-    'ignominy',
-    'ihta',
-    'ilchester',
-    'ileostomy',
-    'ill-prepared',
-    'ill-tempered',
-    'imbecile',
-    'imbert',
-    'imi',
-    'immensity',
     'immersing',
-    'immobilized',
-    'immunised',
-    'immunization',
-    'immunohistochemistry',
-    'immunoreactive',
-    'imogen',
-    'impairing',
-    'impairs',
-    'imparts',
-    'impecunious',
-    'implacably',
-    'implicate',
-    'implicating',
-    'implicatures',
-    'imploring',
     'imprecision',
-    'imprimatur',
-    'improbability',
-    'in-between',
-    'in-fighting',
-    'in-situ',
-    'in-tray',
-    'in_absentia',
-    'in_camera',
-    'inaccessibility',
-    'inactivated',
-    'inadvisable',
-    'inappropriateness',
-    'inaugurate',
-    'inbound',
-    'incantations',
     'incas',
-    'inching',
-    'inchoate',
-    'incidences',
-    'incinerated',
-    'incite',
-    'incl',
-    'inclining',
-    'incommunicado',
-    'incomparably',
-    'incompleteness',
-    'inconsiderate',
-    'inconvenienced',
-    'incorrigible',
-    'incriminate',
-    'ind&eacute;pendants',
     'indecipherable',
-    'indemnified',
-    'indent',
-    'indentations',
-    'indictments',
-    'indira',
-    'indisputably',
-    'individualized',
-    'indonesians',
-    'inductor',
-    'indulgences',
-    'industrialism',
-    'inefficiently',
-    'inestimable',
-    'inexcusable',
-    'infallibility',
     'infecting',
-    'infects',
-    'infernal',
-    'inferring',
-    'infers',
-    'infidel',
-    'infighting',
-    'infilling',
-    'inflating',
-    'inflected',
-    'inflicts',
-    'infolink',
-    'informatics',
-    'infuse',
-    'infusions',
-    'ingenuous',
     'ingots',
-    'ingratiating',
-    'inhaler',
-    'iniquitous',
-    'injector',
-    'inkjet',
-    'innately',
-    'inner-urban',
-    'innkeepers',
-    'innovating',
-    'inoculated',
-    'inoperable',
-    'inositol',
-    'inpatients',
-    'inquests',
-    'inquisitorial',
     'insanely',
-    'insanitary',
-    'insertions',
-    'insincerity',
-    'insinuating',
-    'insouciance',
-    'inspects',
-    'inspiral',
-    'inspirations',
-    'installs',
-    'instigating',
-    'instilling',
-    'instrumentalist',
-    'insubordination',
-    'insufferable',
-    'insulator',
     'insupportable',
-    'intangibles',
-    'inter-bank',
-    'inter-continental',
-    'inter-personal',
-    'inter-relationships',
-    'inter-state',
-    'interacted',
-    'interactionism',
-    'interactionist',
-    'interactionists',
-    'interactively',
-    'interbase',
-    'interchanges',
-    'interconnecting',
-    'interest-rate',
     'interfax',
-    'intergenerational',
-    'interglacial',
-    'interleaf',
-    'interleukin',
-    'interlocked',
-    'intermarriage',
-    'intermingled',
-    'internalised',
-    'internalization',
-    'interplanetary',
-    'interred',
-    'interregnum',
-    'interrelation',
-    'interrogative',
-    'interrogator',
     'intersected',
-    'interweaving',
-    'intimations',
-    'intolerably',
-    'intrauterine',
-    'intricacy',
-    'inverkeithing',
-    'inversions',
-    'inverts',
-    'investigatory',
-    'invitingly',
-    'invoiced',
-    'involvements',
-    'ioc',
-    'ionization',
-    'ipg',
     'ipso_facto',
-    'ipv',
-    'ipx',
-    'irkutsk',
-    'irlr',
-    'ironbridge',
-    'irrationally',
-    'irreversibly',
-    'isc',
-    'ishaq',
-    'isla',
-    'islets',
-    'isoform',
-    'isoforms',
-    'isolationist',
-    'isostatic',
     'israelite',
-    'isthmus',
-    'isvs',
-    'it\'',
-    'italiana',
-    'italicised',
-    'itar-tass',
-    'itemised',
-    'itineraries',
-    'itt',
-    'iu',
-    'iv.',
-    'iva',
-    'ivanov',
-    'iverson',
-    'ivo',
     'izzat',
-    'j&uuml;rgen',
-    'j.c.',
-    'j.f.',
-    'j.m.',
-    'j.s.',
-    'jaci',
-    'jackal',
-    'jacked',
-    'jackman',
-    'jacopo',
-    'jaffna',
-    'jaguars',
-    'jahangir',
-    'jailer',
-    'jaipur',
     'jakob',
-    'jamaicans',
-    'jamboree',
-    'jangle',
-    'janie',
-    'janman',
-    'janner',
-    'jardin',
-    'jauntily',
-    'javanese',
-    'jawline',
-    'jays',
-    'jazzy',
-    'jci',
-    'jct',
-    'jean-baptiste',
     'jean-jacques',
-    'jean-louis',
-    'jeannie',
-    'jeer',
-    'jeffreys',
-    'jelka',
-    'jellicoe',
-    'jemima',
-    'jenkinson',
-    'jeopardising',
-    'jet-black',
-    'jetted',
-    'jettison',
-    'jibes',
-    'jiri',
-    'jj.',
     'jmu',
-    'jn',
-    'jobcentre',
-    'jockeying',
-    'jodhpurs',
-    'jodie',
-    'jody',
-    'joelle',
-    'johnathan',
-    'jointing',
-    'joist',
-    'jokers',
-    'jokey',
-    'jollity',
-    'jonna',
-    'jonny',
     'jose-maria',
-    'josephus',
-    'josey',
-    'jostle',
-    'jotted',
-    'jove',
-    'jowl',
-    'joyless',
-    'joyously',
-    'jozef',
-    'juba',
-    'judah',
-    'judaic',
-    'judicature',
-    'jun-core',
-    'junker',
     'juno',
-    'jurgen',
-    'juror',
-    'jutland',
-    'kadiliks',
-    'kai-shek',
-    'kalashnikov',
-    'kali',
-    'kamara',
-    'kanu',
-    'kappa',
-    'karimov',
-    'karlinsky',
-    'katabatic',
-    'katmandu',
-    'kattina',
     'kauffman',
-    'kayaks',
-    'kaysone',
-    'kd',
-    'kearney',
-    'keeler',
-    'keir',
-    'keld',
-    'kendall-hume',
-    'kendrick',
-    'kennett',
-    'kerala',
-    'kermit',
-    'kern',
-    'kerouac',
-    'kerrison',
     'kershaw',
-    'kestrels',
-    'ketch',
-    'keyes',
-    'keynesianism',
-    'keypad',
-    'khaled',
-    'khalifa',
-    'kharkov',
-    'khruschev',
-    'khz',
-    'kicker',
-    'kielder',
-    'kierkegaard',
-    'kiernan',
-    'kiichi',
     'kiku',
-    'kilfedder',
-    'kilowatt',
-    'kilowatts',
-    'kimber',
-    'kimura',
-    'kinases',
-    'kingly',
-    'kinks',
-    'kinsella',
-    'kinshasa',
-    'kirghizia',
-    'kirkham',
-    'kirkland',
-    'kirkuk',
-    'kirsten',
     'kirwan',
-    'kismayu',
-    'kittyhawk',
-    'klan',
-    'kleenex',
-    'klingfeld',
-    'knee-deep',
-    'knee-jerk',
-    'knockers',
-    'knowledge-based',
-    'kobold',
-    'kohlberg',
-    'kok',
-    'kokos',
-    'kollwitz',
-    'kompong',
     'korg',
-    'kowloon',
-    'kpnlf',
-    'kr',
-    'krabbe',
-    'krashen',
-    'krauss',
-    'krebs',
-    'krona',
-    'kroner',
-    'kronor',
-    'kubla',
-    'kubrick',
-    'kuhlmann',
-    'kundera',
-    'kunst',
     'kuo',
-    'kynaston',
-    'kyubin',
-    'l&eacute;ger',
-    'l&eacute;on',
-    'l.jj.',
-    'l.t.',
-    'labour-only',
-    'laburnum',
-    'labyrinthine',
-    'lacanian',
-    'lacerations',
-    'lactation',
-    'lactoferrin',
-    'lady-in-waiting',
-    'lafontaine',
     'lagers',
-    'lagonda',
-    'lally',
-    'lambarde',
-    'lamborghini',
-    'lambton',
-    'lamotte',
-    'lampreys',
-    'lancers',
-    'landfills',
-    'landownership',
-    'langue',
-    'languished',
-    'languor',
-    'lans',
-    'lapsing',
     'larger-than-life',
-    'lartington',
-    'lascivious',
-    'lashings',
-    'laszlo',
-    'latches',
-    'latecomers',
-    'lattices',
-    'laudanum',
-    'launder',
-    'lavant',
-    'lavenham',
-    'lavery',
-    'law-making',
-    'lawley',
-    'laxity',
     'laz',
-    'lazar',
-    'lazenby',
-    'lazing',
-    'lccieb',
-    'ldc',
-    'ldoce',
-    'ldr',
-    'leadbetter',
-    'leaver',
-    'lecherous',
-    'lectureship',
-    'ledu',
-    'left-over',
-    'leftists',
-    'legalisation',
     'legalization',
-    'legg',
-    'legitimated',
-    'legitimize',
-    'legumes',
-    'leibniz',
-    'leiden',
-    'leigh-pemberton',
-    'leisured',
-    'lemma',
-    'leninist',
-    'lennox-boyd',
-    'lenten',
-    'leonards',
-    'less-favoured',
-    'lessees',
     'lessens',
-    'letterhead',
-    'leucocytes',
-    'leverhulme',
-    'levinas',
-    'lexy',
-    'libellous',
-    'liberalising',
-    'lichtenstein',
-    'lieder',
-    'liese',
-    'life-giving',
-    'life-span',
-    'lifespan&mdash;user',
-    'lift-off',
-    'lifter',
     'light-coloured',
-    'lightbody',
-    'lij',
-    'likeliest',
-    'liley',
-    'lilleshall',
-    'limavady',
-    'limehouse',
-    'lindley',
-    'lindy',
-    'linearity',
-    'lingo',
-    'linotype',
-    'lint',
-    'liquidate',
-    'lis',
     'liskeard',
-    'lisnagarvey',
-    'liss',
-    'listeria',
-    'lithography',
-    'litmus',
-    'littering',
-    'littlewood',
-    'littoral',
-    'liveliest',
-    'liverpudlian',
-    'livres',
-    'llandrindod',
-    'llanfair',
-    'lld',
-    'llyn',
     'lner',
-    'loader',
-    'loadings',
-    'loafers',
-    'lobon-gur',
-    'local-government',
-    'locales',
-    'lockable',
-    'locksmith',
-    'locum',
-    'locust',
-    'lode',
-    'lofthouse',
-    'lofts',
-    'logbook',
-    'loin',
     'lomas',
-    'lone-parent',
-    'lonesome',
-    'long-',
-    'long-dead',
-    'long-drawn-out',
-    'long-forgotten',
-    'longest-serving',
-    'longford',
-    'longhorn',
-    'longitudinally',
-    'longleat',
-    'longtime',
-    'looking-glass',
-    'loosing',
-    'looters',
     'lop-sided',
-    'loped',
-    'loperamide',
-    'loppe',
-    'lopped',
-    'lorca',
-    'lorentz',
-    'lorrimores',
-    'lothern',
-    'lotions',
-    'lotto',
-    'louisville',
-    'loveliness',
-    'lovett',
-    'low-',
-    'low-budget',
     'low-energy',
-    'low-flying',
-    'low-frequency',
-    'low-profile',
-    'low-risk',
-    'lowden',
-    'lower-class',
-    'lowyer',
-    'loxford',
-    'lrdg',
-    'ls',
-    'ltc',
-    'lte',
-    'lubrication',
-    'luc',
-    'lucca',
     'lucian',
-    'luciferi',
-    'lucius',
-    'lucozade',
-    'lufthansa',
-    'lug',
-    'lugano',
-    'lugging',
-    'lugh',
-    'luib',
-    'luiza',
-    'lukes',
-    'lullaby',
-    'lumberjack',
-    'lund',
-    'lune',
     'lunging',
-    'luqa',
-    'lustful',
-    'lux',
-    'luz',
-    'lymphatic',
-    'lyne',
-    'lynsey',
-    'lyonette',
-    'lyre',
-    'lyrically',
-    'm&amp;c',
-    'm&amp;s',
-    'm&ecirc;l&eacute;e',
-    'm&oslash;ller',
-    'm&oslash;n',
     'm&uuml;ncheberg',
-    'm-derived',
-    'm.d.',
-    'm.p.s',
-    'm.sc',
-    'm13',
-    'm16',
-    'm50',
-    'm62',
-    'm8',
-    'mabbutt',
-    'macaroni',
-    'macauley',
-    'maccabees',
-    'macedon',
-    'macedonians',
     'machete',
-    'machiavelli',
-    'machined',
-    'machinists',
-    'maclane',
-    'macleans',
-    'macrophage',
-    'madcap',
-    'maddened',
-    'maddison',
-    'madeiran',
-    'madeline',
-    'madmen',
-    'magharba',
-    'maghull',
-    'maginn',
     'magna_carta',
-    'magnanimity',
-    'magnetosphere',
-    'magnificat',
-    'magnify',
-    'mah',
-    'maharashtra',
-    'maher',
-    'maidment',
-    'mailbox',
-    'maim',
-    'main-line',
-    'mainsail',
-    'mairi',
-    'maj',
-    'malady',
     'malaga',
-    'malan',
-    'malayan',
-    'malays',
-    'male-female',
-    'male-identified',
-    'male/female',
-    'malekith',
-    'maligned',
-    'malkin',
-    'mallaig',
-    'malling',
-    'mallon',
-    'maltby',
-    'malthus',
-    'mambo',
     'man-machine',
-    'mancunian',
-    'mandolin',
-    'manes',
-    'mangosuthu',
-    'manhandled',
-    'manicure',
-    'manipulator',
-    'manitoba',
-    'mantis',
-    'manweb',
-    'many-one',
-    'manzoni',
-    'mappings',
-    'maputo',
-    'marauders',
     'marchant',
-    'marche',
-    'marcuse',
-    'marginalization',
-    'marginals',
-    'marigolds',
-    'marinated',
-    'marjoram',
-    'marjory',
-    'market-makers',
-    'market-orientated',
-    'marketeers',
-    'maronites',
-    'marque',
-    'marquees',
-    'marryat',
     'marslen-wilson',
-    'marsupial',
-    'marsupials',
-    'mart&iacute',
-    'mart&iacute;nez',
-    'martindale',
-    'martinique',
-    'maryhill',
-    'maslow',
-    'mass-market',
-    'massine',
-    'masson',
-    'matador',
-    'matchless',
-    'math',
-    'mathilda',
     'matin&eacute;e',
-    'matings',
-    'matins',
-    'matrons',
-    'matte',
-    'matza',
-    'mauchline',
-    'maudling',
-    'maxham',
-    'maxie',
-    'maximally',
-    'maximized',
-    'maximus',
-    'maxton',
-    'mayan',
-    'mayfield',
     'mayoral',
-    'mbuna',
-    'mbus',
-    'mcadam',
-    'mcallion',
-    'mcateer',
-    'mcavoy',
-    'mcclure',
-    'mccolgan',
-    'mcconville',
-    'mccracken',
-    'mcdonough',
-    'mcgann',
-    'mcgarry',
-    'mcginley',
-    'mcgoldrick',
     'mcguigan',
-    'mciver',
-    'mcivor',
-    'mckechnie',
-    'mckeever',
-    'mckillop',
-    'mcknight',
-    'mclennan',
-    'mcluhan',
-    'mcmullan',
-    'mcshane',
-    'mdf',
-    'me.',
-    'meall',
-    'meals-on-wheels',
-    'meath',
     'mecdi',
-    'mechanized',
-    'medallists',
-    'medica',
-    'meese',
-    'megabyte',
-    'megalithic',
-    'megara',
-    'mehta',
-    'meiji',
-    'meiko',
-    'mein',
-    'meiotic',
-    'mek',
-    'melancholic',
-    'melanomas',
     'melin',
-    'meltdown',
-    'meme',
-    'memes',
-    'memorized',
-    'menaced',
-    'menai',
-    'mencap',
-    'mendoza',
-    'menelik',
-    'mensa',
-    'mensheviks',
-    'mentle',
-    'meow',
-    'mepc',
-    'mer',
     'mercier',
-    'mercosur',
-    'meritocracy',
-    'meritocratic',
-    'meritorious',
-    'merry-go-round',
-    'merseysiders',
-    'mesenteric',
-    'mesic',
-    'mesmerising',
-    'mesmerized',
-    'messerschmitt',
-    'messina',
-    'metallica',
-    'metalworking',
-    'metastasis',
     'meteors',
-    'metered',
-    'methacrylate',
-    'methile',
-    'methuen',
-    'methylation',
-    'methylene',
-    'metopes',
-    'metronome',
-    'metz',
-    'mg/l',
-    'mh',
-    'miasma',
-    'michaels',
-    'michie',
-    'microelectronic',
     'micrometres',
-    'microsparc',
-    'mid-atlantic',
-    'mid-eighteenth',
-    'mid-forties',
-    'mid-oceanic',
-    'mid-sentence',
-    'mid-west',
-    'mid-winter',
-    'midas',
-    'middle-earth',
-    'middle-of-the-road',
-    'midfielders',
-    'midline',
-    'midshires',
-    'midstream',
     'midwest',
-    'miggs',
-    'mightiest',
-    'miki',
-    'mikva',
-    'milano',
-    'mild-mannered',
-    'mildenhall',
-    'mildest',
-    'militaristic',
-    'millard',
-    'millbank',
-    'millicent',
-    'milligrams',
-    'millisecond',
-    'milnes',
     'milo&scaron',
-    'milwaukee',
-    'mimi',
-    'mincing',
-    'mineralogical',
-    'mini-bus',
-    'mini-series',
-    'minibar',
-    'ministering',
-    'minstrels',
-    'mintel',
-    'mirror-image',
-    'mirthless',
-    'mirza',
-    'misappropriated',
-    'miscalculated',
     'misch',
-    'miser',
-    'miserly',
-    'misfits',
-    'misgiving',
-    'misinformed',
-    'misreading',
-    'missa',
-    'missive',
-    'misted',
-    'mistral',
-    'mistreated',
-    'mistreatment',
-    'mistrusted',
-    'mitford',
-    'mitogenic',
     'mitsui',
-    'mladenov',
-    'mmd',
-    'mobil',
-    'mock-up',
-    'mocks',
-    'moderating',
-    'moderators',
-    'modulations',
-    'moffatt',
-    'moila',
-    'moisten',
-    'moisturisers',
-    'moisturizer',
-    'molasses',
-    'mollusc',
     'momma',
-    'monarchies',
-    'mondeo',
-    'money-go-round',
-    'money-making',
-    'moneylenders',
-    'mongols',
-    'monmouthshire',
-    'monocle',
-    'monogram',
-    'monolingual',
-    'monolith',
-    'monopolise',
-    'monopolize',
-    'monopolized',
-    'monosyllables',
     'monotheism',
-    'montaigne',
-    'monteith',
-    'montevideo',
-    'moo',
-    'moonies',
-    'moorcock',
-    'moorcroft',
-    'moorgate',
-    'morales',
-    'more-or-less',
-    'morn',
-    'mortaring',
-    'mortensen',
-    'morthen',
-    'mortification',
     'mosaicist',
-    'mossadeq',
-    'mota',
-    'motes',
-    'motet',
-    'mother-of-pearl',
-    'moto',
-    'motorcycling',
-    'motored',
-    'mouldering',
-    'moulin',
-    'moulting',
-    'mountings',
-    'mousetrap',
-    'mousy',
-    'mouth-watering',
     'mouthwatering',
-    'movingly',
-    'mowers',
-    'mozzarella',
-    'mucin',
-    'mucked',
-    'muddling',
-    'muderris',
-    'mudflats',
-    'muds',
-    'mudstones',
-    'muffins',
-    'muirhead',
-    'mujahedin',
-    'mullah',
-    'mullahs',
     'mullioned',
-    'multi-ethnic',
-    'multi-level',
-    'multi-nationals',
-    'multidimensional',
-    'multiplex',
-    'multiplies',
-    'multiprocessors',
-    'mumbles',
-    'mumby',
-    'murdo',
-    'murison-bowie',
-    'murk',
-    'muscovite',
-    'muscularis',
-    'museveni',
     'mushroomed',
-    'mushrooming',
-    'musica',
-    'musicianship',
-    'musings',
-    'musky',
-    'mustakimzade',
-    'mustapha',
-    'mustering',
-    'mustill',
-    'mutagenesis',
-    'mutineers',
-    'muzak',
-    'muzzles',
-    'mycenae',
-    'mycobacteria',
     'mycoplasma',
-    'myddle',
-    'myopia',
-    'myriads',
-    'naafi',
-    'nabiyev',
-    'nacro',
-    'nadia',
-    'nadu',
-    'naggaroth',
-    'nagy',
-    'nail-biting',
-    'nailing',
-    'namaliu',
-    'names&dollar',
-    'nanette',
     'nannie',
-    'nao',
-    'napalm',
-    'napping',
-    'narasimha',
-    'narcissi',
-    'nassim',
-    'nastiest',
-    'nath',
-    'nation-states',
-    'natter',
-    'natured',
-    'navajo',
-    'navan',
-    'nazarbayev',
-    'nazionale',
     'ncp',
-    'ncube',
-    'ncvq',
-    'ndo',
-    'ndt',
-    'ne\'er',
-    'neasham',
-    'necropsy',
-    'neighbourliness',
-    'nemo',
-    'neo-fascist',
-    'neo-nazis',
-    'nepali',
-    'nephropathy',
-    'ner',
-    'nerve-racking',
     'nestles',
-    'neston',
-    'netwise',
-    'neutered',
-    'neutralized',
-    'neutrally',
-    'neutrals',
-    'new-fangled',
-    'newcombe',
-    'newsmen',
-    'newsnight',
-    'newsom',
-    'newsweek',
-    'nfc',
-    'ngo',
-    'nh',
     'ni&ntilde;o',
-    'nib',
-    'nibbles',
-    'niccol&ograve',
-    'niceness',
-    'nidal',
-    'nielson',
-    'niggers',
-    'niggle',
-    'nightingales',
-    'nightshirt',
-    'nii',
-    'nijinsky',
-    'nik',
-    'nikko',
-    'nilsen',
     'nine-month',
-    'nine-tenths',
-    'nine-thirty',
-    'nine-year',
-    'nineteenth-',
-    'ninety-eight',
-    'ninety-six',
-    'nippy',
-    'nirc',
-    'nisbet',
-    'niskanen',
-    'nissen',
-    'nits',
-    'no\'',
-    'no-man\'s-land',
-    'no.2',
     'no_matter_who',
-    'nodal',
-    'noded',
-    'nodular',
-    'noes',
-    'noiselessly',
-    'non-bank',
-    'non-basic',
-    'non-binding',
-    'non-completion',
-    'non-conformist',
-    'non-contributory',
-    'non-departmental',
-    'non-ec',
-    'non-economic',
-    'non-elected',
     'non-english',
-    'non-exclusive',
-    'non-fatal',
-    'non-government',
-    'non-literate',
-    'non-local',
-    'non-market',
-    'non-metropolitan',
-    'non-military',
-    'non-native',
-    'non-partisan',
-    'non-performance',
-    'non-productive',
-    'non-professional',
-    'non-racial',
-    'non-renewable',
     'non-selective',
-    'non-singular',
-    'non-slip',
-    'non-smoking',
-    'non-starter',
-    'non-threatening',
-    'non-transferable',
-    'non-western',
-    'nonexistent',
-    'nonsmokers',
-    'nonstop',
-    'noodle',
-    'noone',
-    'nooty',
-    'norah',
-    'normativist',
     'norodom',
-    'norsk',
-    'northcliffe',
-    'northernmost',
-    'nostro',
-    'notary',
-    'notching',
-    'noughts',
-    'nourse',
-    'novgorod',
-    'nrpb',
-    'nsdap',
-    'nse',
-    'nss',
-    'nsw',
-    'ntsc',
     'nubenehem',
-    'nuclear-free',
-    'nuclease',
-    'nuffink',
-    'nugget',
-    'nuggets',
-    'nuln',
-    'numbly',
-    'numerator',
-    'nuneaton',
-    'nunthorpe',
-    'nus',
-    'nutritionally',
-    'nutritionists',
-    'nva',
-    'nvocc',
     'nye',
-    'nylons',
-    'nynex',
-    'o\'brian',
-    'o\'dell',
-    'o\'hagan',
-    'o\'hare',
-    'o\'keefe',
-    'o\'mara',
-    'o\'neal',
-    'o-level',
-    'o-levels',
-    'o2',
-    'oaps',
-    'oat',
-    'obdurate',
     'object-based',
-    'objets_d\'art',
-    'oblast',
-    'obliterating',
-    'oboes',
-    'obsequious',
-    'observances',
-    'observatories',
-    'obstetricians',
-    'oc',
-    'occasioning',
-    'occluded',
-    'ochirbat',
-    'ocu',
-    'ocular',
-    'oddball',
     'oddness',
-    'odds-on',
-    'odessa',
-    'odinga',
-    'odonata',
-    'ofahengaue',
-    'off-balance',
-    'off-centre',
-    'off-season',
-    'off-white',
-    'offensives',
-    'officious',
-    'offload',
-    'offs',
-    'offshoots',
-    'offworlder',
     'ofthe',
-    'og',
-    'ogre',
-    'oil-rich',
-    'oiling',
-    'okinawa',
-    'old-established',
-    'oldenburg',
-    'oleic',
-    'oligo',
-    'omelettes',
-    'omg',
-    'on-off',
-    'on-the-job',
-    'onboard',
-    'oncology',
     'one-',
-    'one-night',
-    'one-woman',
-    'one-year-old',
-    'ons',
-    'ontos',
-    'oonagh',
-    'oooh',
-    'oozes',
-    'op._cit.',
-    'opel',
-    'openshaw',
-    'operationally',
-    'ophiacantha',
-    'opiates',
-    'opined',
     'opioids',
-    'oppenheimer',
-    'opportunists',
-    'oppress',
-    'oppressions',
-    'opted-out',
-    'optically',
-    'optimising',
-    'optimization',
-    'optimize',
-    'optimized',
-    'oracles',
-    'orang',
-    'orang-utans',
-    'orangs',
-    'oratorio',
     'orcadian',
-    'orchestrate',
-    'orderlies',
-    'orderliness',
-    'oregano',
-    'orgasms',
-    'orientate',
-    'orimulsion',
-    'orl&eacute;ans',
-    'ormerod',
-    'ornately',
-    'ornithologists',
-    'orogeny',
-    'orpington',
-    'orson',
-    'orthography',
     'ortiz',
-    'oscar-winning',
-    'oshkosh',
-    'oskar',
-    'osprey',
-    'ostentation',
-    'ostia',
-    'ostracism',
-    'oswin',
-    'ottomans',
-    'ouija',
-    'oulton',
-    'out-and-out',
-    'out-migration',
-    'out-of-court',
-    'out-of-work',
     'out-patients',
-    'outbid',
-    'outdo',
-    'outhwaite',
-    'outlast',
-    'outlive',
-    'outmanoeuvred',
-    'outpaced',
-    'outperform',
-    'outram',
-    'outrun',
-    'outstrips',
-    'outwitted',
-    'ovals',
-    'over-all',
-    'over-excited',
     'over-reacting',
-    'over-reaction',
-    'overarching',
-    'overcapacity',
-    'overdoses',
-    'overflows',
-    'overhearing',
-    'overlain',
-    'overlordship',
-    'overmuch',
-    'overproduction',
-    'overrode',
-    'overshadowing',
-    'overstate',
-    'overstepped',
-    'overwrought',
     'ovid',
-    'owers',
-    'oxidative',
-    'oxidised',
-    'oxleas',
-    'oxo',
-    'oyston',
-    'ozone-depleting',
-    'p&ouml;hl',
-    'p\'',
-    'p/e',
-    'p24',
-    'p450',
-    'p=',
-    'pa-risc',
-    'paba',
     'pacey',
-    'packers',
-    'packman',
-    'pactus',
-    'pacy',
-    'paddler',
-    'padlocks',
-    'pageantry',
-    'pager',
-    'pah',
-    'paice',
-    'painterly',
-    'pairings',
-    'palaeontologists',
-    'palatinate',
-    'pales',
     'palest',
-    'palettes',
-    'pallium',
-    'palme',
-    'palpably',
-    'palpitations',
-    'palumbo',
-    'pampas',
-    'pandering',
-    'panmure',
-    'panoply',
-    'paperless',
-    'paperweight',
-    'paprika',
-    'papworth',
-    'parabola',
     'paraclete',
-    'parallax',
-    'paralytic',
-    'paranormal',
-    'paraphrases',
-    'paraprofessional',
-    'pardons',
-    'parenteral',
-    'parenthesis',
-    'parities',
-    'parkway',
-    'parlement',
-    'parler',
-    'parmenides',
-    'parnell',
-    'parodic',
     'parodied',
-    'parsed',
-    'parses',
-    'parsheen',
-    'partei',
-    'parthenogenesis',
-    'partying',
-    'pask',
-    'pasties',
-    'pastoralists',
-    'paternoster',
-    'pathogen',
-    'patrice',
-    'patrilineal',
-    'patristic',
-    'pattered',
     'patti',
-    'patty',
-    'pauls',
-    'pav',
-    'pawing',
-    'pawsey',
-    'payed',
-    'payee',
-    'payload',
-    'paymasters',
-    'pc-based',
-    'pc-nfs',
-    'pci',
-    'pcl',
-    'pcmcia',
-    'pct',
     'peaceably',
-    'peacekeepers',
-    'peacemaker',
-    'peckinpah',
-    'peddled',
-    'peer-group',
-    'peer-to-peer',
-    'peerages',
-    'pegging',
-    'peirce',
-    'pelargoniums',
-    'peloponnese',
-    'pelting',
-    'penalising',
-    'pendle',
-    'penetrative',
     'penfold',
-    'penises',
-    'penitence',
-    'penitential',
-    'penman',
-    'penney',
-    'pentateuch',
-    'pentiums',
-    'pentos',
-    'penury',
-    'peony',
-    'perceptively',
-    'perceptron',
-    'perchance',
-    'perches',
-    'percussive',
     'pergola',
-    'periodicity',
-    'perked',
-    'perming',
-    'perpetuates',
-    'perrett',
-    'pershing',
-    'pershore',
-    'personae',
-    'personages',
-    'persuasiveness',
-    'pertain',
-    'pertains',
-    'perturbation',
-    'pesc',
-    'pesetas',
     'pessimist',
-    'pesto',
-    'pethidine',
-    'petrel',
-    'petrels',
-    'petrie',
-    'petting',
-    'pettitt',
-    'petulance',
-    'pff',
-    'pfi',
-    'phalangist',
-    'phallus',
-    'pharmacia',
-    'phase-out',
-    'phasor',
     'phenomenally',
-    'phenotypes',
-    'phi',
-    'philby',
-    'phillipson',
-    'philological',
-    'phobias',
-    'phonic',
-    'phonograph',
-    'phosphor',
-    'photogenic',
-    'photolysis',
-    'phylloxera',
-    'physiologist',
-    'physiologists',
-    'picard',
     'pick-ups',
-    'picketed',
-    'pictish',
-    'picton',
-    'pidgin',
-    'pieper',
-    'piglet',
-    'pigsty',
-    'pigtails',
-    'pik',
-    'pikes',
-    'pilade',
-    'pilchards',
-    'pillbox',
-    'pillion',
-    'pilloried',
     'pilton',
-    'pimps',
-    'pin-point',
-    'pinafore',
-    'pinatubo',
-    'pincers',
-    'pinches',
-    'ping-pong',
-    'pining',
-    'pinner',
-    'pinpointing',
-    'pinsent',
-    'pipers',
-    'piquet',
-    'piranha',
-    'pirated',
     'pitiless',
-    'pittodrie',
-    'pitying',
-    'pivots',
-    'piw',
-    'pixies',
-    'pj',
-    'pl.',
-    'place-names',
-    'plainer',
-    'plainsong',
-    'planking',
-    'plantagenets',
-    'plantings',
-    'plasticity',
-    'plate-glass',
     'plateful',
-    'platoons',
-    'play-acting',
-    'playfulness',
-    'plaything',
-    'playtime',
-    'pleadingly',
-    'pleasanter',
-    'pleasingly',
-    'plebs',
-    'plec',
-    'pliant',
-    'plonked',
-    'plonker',
-    'plovers',
-    'pls.',
     'plumed',
-    'plunkett',
-    'png',
-    'po-faced',
-    'pocketing',
-    'pocklington',
-    'podgy',
-    'pokes',
-    'poky',
-    'polgar',
-    'policymakers',
-    'politicization',
-    'poll-tax',
-    'polonium',
-    'polonius',
-    'polos',
     'poltergeist',
-    'polygonal',
-    'polygram',
-    'polygynous',
-    'polymorphic',
-    'pong',
-    'ponting',
-    'ponytail',
-    'pook',
-    'poop',
-    'popov',
-    'poppet',
-    'popplewell',
-    'populaire',
-    'popularised',
-    'poraway',
     'porfiry',
-    'port-au-prince',
-    'portables',
-    'portage',
-    'portent',
-    'pos',
-    'posit',
-    'possessively',
-    'possessiveness',
-    'possum',
-    'post-glacial',
-    'post-retirement',
-    'post-revolutionary',
-    'post-tax',
-    'post_hoc',
-    'postern',
     'postine',
-    'postmark',
-    'postmen',
-    'postural',
-    'pottering',
-    'poweropen',
-    'powick',
-    'poxy',
-    'pps',
-    'pranks',
-    'prasad',
-    'pre-1914',
-    'pre-condition',
-    'pre-eminently',
-    'pre-empting',
-    'pre-heated',
     'pre-natal',
-    'pre-operative',
-    'pre-production',
-    'pre-programmed',
-    'pre-retirement',
-    'prearranged',
-    'precis',
-    'predated',
-    'predominating',
-    'preece',
-    'preening',
-    'prefects',
-    'prefecture',
-    'preheated',
-    'premiss',
-    'prendergast',
     'prenominal',
-    'prepositions',
-    'preregistration',
-    'presaged',
-    'press-ups',
-    'pressure-group',
-    'pretreated',
-    'previn',
-    'preying',
-    'prickling',
-    'pricks',
-    'priestesses',
-    'prig',
-    'primakov',
-    'principessa',
-    'printouts',
     'prion',
-    'prioritise',
-    'prioritize',
-    'priscilla',
-    'prising',
-    'prisms',
-    'privation',
-    'privations',
-    'prize-money',
-    'pro-independence',
-    'pro-western',
-    'prob',
-    'proconsul',
-    'prof.',
-    'professes',
-    'profiteering',
     'progastrin',
-    'progenitor',
-    'progesterone',
-    'programmatic',
-    'progressions',
-    'progressives',
-    'prolog',
-    'prometheus',
-    'promo',
-    'pronominal',
-    'pronunciations',
-    'propagandists',
-    'propensities',
-    'propertied',
-    'property-owning',
-    'prophesy',
     'proposer',
-    'proprietorship',
-    'protege',
-    'provisioning',
-    'provisos',
-    'proxies',
-    'proximate',
-    'prt',
-    'pss',
-    'psv',
-    'psychoanalyst',
-    'psychoanalysts',
-    'psychodynamic',
-    'psychopathology',
-    'psychotropic',
-    'pthrp',
     'ptolemaic',
-    'public-spirited',
-    'publicist',
-    'pueblo',
-    'pug',
-    'pugin',
-    'pumblechook',
-    'pummelled',
-    'pumpkins',
-    'punchline',
-    'punctuate',
-    'pundit',
-    'pupil-teacher',
-    'purbeck',
-    'purdy',
-    'purnell',
     'pursuivant',
-    'pushchairs',
-    'pushover',
-    'puttnam',
-    'pybus',
-    'pygmalion',
-    'pygmies',
-    'pygmy',
-    'pyle',
-    'pynchon',
-    'pyramidal',
-    'pythagorean',
-    'q&amp;a',
-    'q.b.d.',
-    'qp',
-    'qu',
     'quadripartite',
-    'quailed',
-    'quaintly',
-    'quaking',
-    'quango',
-    'quantock',
-    'quartermaster',
-    'quatro',
-    'quatt',
-    'quavers',
-    'quechua',
-    'quenched',
-    'querida',
-    'querulous',
-    'questing',
-    'quicksand',
     'quid_pro_quo',
-    'quintessentially',
-    'quito',
-    'quixotic',
-    'quizzes',
-    'quo',
-    'r.a.',
-    'r.b.',
-    'r.e',
-    'r.s.c.',
-    'r3000',
-    'ra&uacute;l',
-    'rabbani',
-    'racquet',
-    'radians',
-    'radice',
     'radii',
-    'radionuclide',
-    'radley',
-    'radnor',
-    'radovan',
-    'ragga',
-    'ragtime',
-    'raimes',
-    'rainald',
-    'raincoats',
-    'rainstorm',
-    'raison_d\'etre',
-    'raisonn&eacute',
-    'raja',
-    'rajasthan',
-    'raji',
     'rakish',
-    'ram&oacute;n',
-    'rama',
-    'ramblings',
-    'rameau',
-    'ramiz',
-    'ramsar',
-    'ramses',
-    'ranches',
-    'randomized',
-    'rankin',
-    'rankled',
-    'rantzen',
-    'raper',
-    'rapier',
-    'raring',
     'rascal',
-    'rashers',
-    'rasmussen',
-    'raster',
-    'rate-capping',
-    'ratepayer',
-    'ratifying',
-    'ratsiraka',
-    'rattan',
-    'rattlesnake',
-    'raul',
-    'rauschenberg',
-    'ravi',
-    'raytheon',
-    'razors',
-    'rbl',
     'rbs',
-    're-arranged',
-    're-education',
-    're-entering',
-    're-training',
-    're-written',
-    'reactivate',
-    'readying',
-    'reaffirmation',
-    'realignments',
-    'realizable',
-    'reappearing',
-    'reapply',
-    'rearrangements',
-    'rears',
-    'reassemble',
     'reasserting',
-    'rebelling',
-    'rebut',
-    'rebutted',
-    'receptivity',
-    'rechar',
-    'rechargeable',
-    'recharged',
-    'recharging',
-    'reclusive',
-    'reconditioned',
-    'reconstitute',
-    'reconstitution',
-    'reconvene',
-    'recumbent',
-    'recuperate',
     'recuperation',
-    'recursive',
-    'red-and-white',
-    'red-figure',
-    'red-handed',
-    'red-rimmed',
-    'redbridge',
-    'redburn',
-    'reddening',
-    'redecorated',
-    'redecorating',
-    'redemptive',
-    'redhill',
-    'redken',
-    'redoubled',
-    'redrafting',
     'redrawing',
-    'redrawn',
-    'redressed',
-    'redskins',
-    'reedy',
-    'refilling',
-    'refitting',
-    'reflexivity',
-    'reflexology',
-    'reformism',
-    'reformists',
-    'reformulate',
-    'reformulated',
-    'refracted',
-    'refraction',
-    'refraining',
     'refrigerate',
-    'regenerated',
-    'regius',
-    'regnal',
-    'regroup',
-    'regrouped',
-    'regurgitated',
-    'rehousing',
-    'reinvestment',
-    'reiterates',
-    'rejections',
-    'rejoices',
-    'relaid',
-    'relapsing',
-    'relatedness',
-    'relegate',
     'rematch',
-    'reminiscing',
-    'remunerated',
-    'rendell',
-    'renege',
-    'renewables',
-    'renfrewshire',
-    'renin',
-    'renshaw',
-    'rent-free',
-    'reopens',
-    'reorganisations',
-    'reorganizing',
-    'rep.',
-    'repairers',
-    'repartee',
     'repays',
-    'repeatable',
-    'rephrase',
-    'replaceable',
-    'replanted',
-    'replenishment',
-    'replicator',
-    'reportage',
-    'repossess',
-    'repressing',
-    'reprints',
-    'reprise',
-    'reproachful',
-    'reprocessed',
-    'reproducibility',
-    'reproof',
     'reproved',
-    'republished',
-    'repugnance',
-    'repurchase',
-    'rescript',
-    'reselection',
-    'resents',
-    'resettled',
-    'resonate',
-    'resourcefulness',
-    'respirator',
-    'restaurateur',
-    'restaurateurs',
-    'resurgent',
-    'resuscitate',
-    'ret',
     'retake',
-    'retard',
-    'retelling',
-    'reticulum',
-    'retorts',
-    'retracing',
-    'retractable',
-    'retrain',
-    'retributive',
-    'retro',
-    'reusable',
-    'revaluations',
-    'reverberate',
-    'reverberating',
-    'reverberations',
-    'reverential',
     'revie',
-    'revitalisation',
-    'revitalize',
-    'revivalist',
-    'revolutionized',
-    'rewrote',
-    'rh&ocirc;ne',
-    'rh&ocirc;ne-poulenc',
-    'rheumatic',
-    'rhuddlan',
-    'rialto',
-    'ribald',
-    'ribbing',
-    'riddell',
-    'riff-raff',
-    'riffs',
     'rifled',
-    'righting',
-    'rigueur',
-    'rimini',
-    'rimmed',
-    'ringlets',
-    'rioja',
-    'rioted',
-    'ripened',
-    'risborough',
-    'riser',
-    'risers',
-    'risings',
-    'riskier',
-    'ritualised',
-    'ritzy',
     'riverton',
-    'rmc',
-    'roadmap',
-    'roan',
-    'robed',
-    'rober\'',
-    'robin-anne',
-    'robs',
-    'robustly',
-    'rocamar',
-    'rocco',
-    'rochford',
-    'rocke',
-    'rocketing',
-    'rockies',
-    'rockin\'',
     'rodber',
-    'rojas',
-    'rokkaku',
-    'role-playing',
-    'rolex',
-    'roll-out',
-    'roll-over',
-    'roll-up',
-    'roller-coaster',
-    'rollicking',
-    'rollin',
-    'rom.',
-    'romaine',
-    'roof-top',
-    'roos',
-    'roquelaure',
     'roseberry',
-    'rosenbaum',
-    'rosenbloom',
-    'roslavl\'',
-    'rosslyn',
-    'rostock',
-    'rothesay',
-    'rothko',
-    'rots',
-    'rotund',
-    'roughest',
-    'roughshod',
-    'round-the-world',
-    'roundels',
-    'rounder',
-    'rounders',
     'roundness',
-    'rowell',
-    'rower',
-    'rowse',
-    'rrp',
-    'ruari',
-    'rubella',
-    'rudakov',
-    'rudge',
-    'ruffling',
-    'rug-making',
-    'rumania',
-    'rumbles',
-    'ruminants',
-    'rummidge',
-    'rumpus',
     'rundell',
-    'rundle',
-    'runes',
-    'runoff',
-    'runs=0:10',
-    'ruslan',
-    'russel',
-    'russells',
-    'ruthie',
-    'ruthin',
-    'rvf',
-    'rwandan',
-    'ryle',
-    'ryman',
-    's\'s',
-    's-r',
     's.1',
-    's.e.',
-    's.i',
-    'saarc',
-    'sabotaging',
-    'sachet',
-    'sacheverell',
-    'sackville',
-    'sacp',
-    'sacral',
-    'sacristy',
-    'sadcc',
-    'sadducees',
-    'safe-keeping',
-    'safes',
-    'sagas',
     'sagawa',
-    'sailings',
-    'sainz',
-    'salacious',
-    'salako',
-    'salamander',
-    'salamanders',
-    'samba',
-    'sami',
-    'sancha',
-    'sandie',
-    'sant\'',
-    'sanyo',
-    'sapphires',
-    'sarcoma',
-    'sardine',
     'sasha',
-    'saskia',
-    'saty&amacr;graha',
-    'satyr',
-    'saunderson',
-    'sauntering',
-    'saut&eacute',
-    'sava',
-    'savanna',
-    'sawed',
-    'sawmill',
-    'saxophonist',
-    'sayer',
-    'sbs',
-    'scabbard',
-    'scabies',
     'scampering',
-    'scampi',
-    'scandalised',
-    'scandinavians',
-    'scarcer',
-    'scarp',
-    'scavenger',
-    'scenting',
-    'sched.',
-    'schizoid',
-    'schnabel',
-    'schoolfriends',
-    'schoolhouse',
-    'schoolwork',
-    'schultz',
-    'schutz',
     'sci-fi',
-    'sciaf',
-    'scion',
-    'sciorto',
-    'scotsmen',
-    'scotts',
-    'scoundrel',
-    'scp',
-    'scrawl',
-    'scrope',
-    'scrotum',
-    'scrubby',
-    'scrutinize',
-    'scrutton',
-    'scse',
-    'scuffles',
     'scuffling',
-    'scullion',
-    'scully',
-    'scythes',
-    'sdpj',
-    'sdrs',
-    'sea-birds',
-    'sea-trout',
-    'seaborne',
-    'seabrook',
-    'seac',
-    'seafarers',
-    'seafaring',
-    'seaford',
-    'seaforth',
-    'seamanship',
     'seamed',
-    'seamlessly',
-    'sear',
-    'searchingly',
-    'seasick',
-    'seasiders',
-    'second-best',
-    'second-century',
-    'second-generation',
-    'secondees',
-    'secondments',
-    'secularisation',
-    'secularist',
-    'sedan',
-    'sedated',
-    'sedatives',
     'sedbergh',
-    'sedge',
-    'seducer',
-    'seductively',
-    'see-saw',
-    'seebohm',
-    'seedling',
-    'seepage',
-    'seeps',
-    'seers',
-    'segregate',
-    'selassie',
-    'selden',
-    'self-absorbed',
-    'self-advocacy',
-    'self-deprecating',
     'self-development',
-    'self-disgust',
-    'self-examination',
-    'self-fulfilment',
-    'self-improvement',
-    'self-perpetuating',
-    'self-poisoning',
-    'self-protection',
-    'self-report',
-    'self-restraint',
-    'self-seeking',
-    'self-study',
-    'self-worth',
-    'selfishly',
-    'selim',
-    'sell-by',
     'selsey',
-    'selvedge',
-    'semi-darkness',
-    'semi-finalists',
-    'semi-permanent',
-    'semi-skimmed',
-    'semi-structured',
-    'semicircular',
-    'seminaries',
-    'semitone',
-    'send-off',
-    'senders',
-    'seneca',
-    'sentential',
-    'sentient',
-    'septicaemia',
     'sepulchre',
-    'sequence-specific',
-    'sequestered',
-    'serengeti',
-    'serially',
-    'seroconverted',
-    'seropositive',
-    'seru',
-    'sessile',
-    'set-back',
-    'set-off',
-    'set-ups',
-    'setters',
-    'seven-year-olds',
-    'seventy-eight',
-    'seventy-one',
     'seventy-six',
-    'seventy-three',
-    'severally',
-    'severest',
-    'severin',
-    'sexiest',
-    'sexing',
-    'sfo',
-    'sgs-thomson',
-    'sh.ct.',
-    'shaffer',
-    'shagging',
-    'shaikhs',
-    'shake-out',
-    'shakespearian',
-    'shamefully',
     'shan',
-    'shankly',
-    'shapechanger',
-    'shaposhnikov',
-    'sharia',
-    'sharp-eyed',
-    'sharpener',
-    'shas',
-    'shatov',
-    'shatters',
-    'shavante',
-    'she/he',
-    'sheared',
-    'shearson',
-    'sheba',
-    'sheerness',
     'shel',
-    'shelbourne',
-    'shelton',
-    'shelve',
-    'shenanigans',
-    'shepton',
-    'sherds',
-    'shergold',
-    'shias',
-    'shiite',
-    'shill',
-    'shimon',
-    'shits',
-    'shitting',
-    'shivery',
-    'shocker',
     'shooed',
-    'shooter',
-    'short-termism',
-    'short-time',
-    'shortbread',
-    'shortlived',
-    'shortsighted',
-    'shotton',
-    'shoulder-length',
-    'shovelled',
-    'shower/wc',
-    'showground',
-    'showjumping',
-    'shredding',
-    'shrilled',
-    'shrimpton',
     'shrimpy',
-    'shrivel',
-    'shudders',
-    'shut-down',
-    'shylock',
-    'siban',
-    'sickeningly',
-    'sidcup',
-    'siddeley',
-    'side-stepped',
-    'sidestep',
-    'sidetracked',
-    'siegel',
-    'sienna',
-    'sieves',
-    'sieving',
     'sighthill',
-    'sightless',
-    'sigibert',
-    'signer',
-    'silencer',
-    'silicates',
-    'sillars',
-    'silliness',
-    'silmarillion',
-    'silversmith',
-    'simenon',
-    'simla',
-    'simmered',
-    'simonova',
-    'simpkin',
-    'simple-minded',
     'simplifications',
-    'simpsons',
-    'sine_qua_non',
-    'sinew',
-    'sinfulness',
-    'single-celled',
-    'single-member',
-    'single-mindedness',
-    'single-tier',
-    'single-user',
-    'sinn_f&eacute;in',
-    'sioux',
-    'siporax',
-    'sipotai',
-    'sistine',
-    'situate',
     'situationist',
-    'situationists',
-    'six-part',
-    'sizzle',
-    'skater',
-    'skelmersdale',
-    'sketchbook',
-    'skewers',
-    'ski-ing',
-    'skids',
-    'skinning',
-    'skippered',
-    'skittles',
-    'skivvy',
-    'skua',
-    'skuas',
     'skunk',
-    'skywards',
-    'slagging',
-    'slags',
-    'slavering',
-    'slavic',
-    'slaving',
-    'slavish',
-    'slavonia',
-    'sleaford',
-    'sleaze',
-    'sleigh',
-    'slinging',
-    'slinky',
-    'slippy',
-    'slipway',
     'sloop',
-    'slopped',
-    'slorne',
-    'slovaks',
-    'sluggishly',
-    'slumbering',
-    'sma',
-    'smallholdings',
-    'smelter',
-    'smiley',
-    'smoke-filled',
-    'smokeless',
-    'smokey',
-    'smouldered',
-    'smr',
-    'sms',
     'smt',
-    'smudges',
-    'smuggler',
-    'smugness',
-    'smurfit',
-    'smythe',
-    'snagged',
-    'snaith',
-    'snared',
-    'sneakers',
-    'sneezed',
-    'snegur',
-    'sniffer',
-    'sniffy',
-    'snipped',
-    'snodin',
     'snodland',
-    'snooty',
-    'snored',
-    'snorts',
-    'snotlings',
-    'snow-white',
-    'snowfall',
-    'snr',
-    'snuffling',
-    'soapbox',
-    'sobriety',
-    'soci&eacute;t&eacute',
-    'socialiste',
-    'socialite',
-    'socializing',
-    'sociologically',
     'sodom',
-    'sodomy',
-    'soed',
-    'softest',
-    'sohail',
-    'soldiering',
-    'solicitude',
-    'solstice',
-    'sombrely',
-    'somers',
-    'somersaulted',
-    'somersaults',
-    'sonja',
-    'sontag',
-    'sonya',
-    'soon-yi',
     'sop',
-    'soporific',
-    'sor',
-    'sorbie',
-    'sorceress',
-    'sorghum',
-    'soros',
-    'soto',
-    'souffle',
-    'soul-searching',
-    'soulful',
-    'sourcing',
-    'souter',
-    'southeastern',
-    'southerner',
-    'southsea',
     'souza',
-    'sowed',
-    'sp1',
-    'spangled',
-    'sparcbook',
-    'sparcserver',
-    'spas',
-    'spatio-temporal',
-    'spatula',
-    'specfp92',
-    'specializes',
-    'spectres',
-    'speculates',
-    'speculum',
-    'speechreader',
-    'speeder',
     'speedie',
-    'speller',
-    'sperber',
-    'sperms',
-    'spew',
-    'spewing',
-    'speyside',
-    'spf',
-    'spidery',
-    'spiel',
-    'spiers',
-    'spillages',
-    'spin-offs',
-    'spineless',
-    'splendours',
-    'splints',
     'split-second',
-    'splutter',
-    'spongiform',
-    'sponging',
-    'spoonfuls',
-    'spooning',
-    'sportsmanship',
-    'spotlessly',
-    'spouting',
-    'sprayer',
-    'springfields',
-    'sprinklers',
-    'sprite',
-    'sps',
-    'spss',
-    'spurn',
     'spurting',
-    'spurts',
-    'sputnik',
-    'squander',
-    'squandering',
-    'squashing',
-    'squawked',
-    'squeals',
-    'squelching',
-    'squigs',
-    'srinagar',
-    'sros',
-    'sru',
-    'ssa',
-    'ssaps',
-    'ssh',
     'ssi',
-    'ssl',
-    'st\'lyan',
-    'stabilisers',
-    'stableford',
-    'stablemate',
-    'stabling',
-    'staggers',
-    'stagnate',
-    'stakeholders',
-    'stakis',
-    'stalinvast',
-    'stammering',
-    'standardising',
-    'stansfield',
-    'starchy',
     'starlet',
-    'startup',
-    'stateless',
-    'stationing',
-    'statutorily',
-    'steel-maitland',
-    'steels',
-    'steinholz',
-    'stenhouse',
-    'stepdaughter',
-    'steppe',
-    'stepping-stone',
-    'sternum',
-    'stg',
-    'sti',
-    'stiles',
     'stiletto',
-    'stimulatory',
-    'stipulations',
-    'stoat',
-    'stockdale',
-    'stockpiling',
-    'stoddards',
-    'stoically',
-    'stoicism',
-    'stokle',
-    'stolidly',
-    'stolypin',
-    'stoma',
-    'stomped',
-    'stomping',
-    'stonemason',
     'stonesfield',
-    'stop-gap',
-    'stopcock',
-    'stopwatch',
-    'story-teller',
-    'strabo',
-    'straddles',
-    'straggle',
-    'straight-forward',
-    'straights',
-    'streatley',
-    'streep',
-    'streicher',
-    'streptomycin',
-    'strippers',
-    'striptease',
     'stripy',
-    'stromness',
-    'strong-willed',
-    'stronsay',
-    'structuralists',
-    'structuration',
-    'strugglers',
-    'stultifying',
-    'stumbles',
-    'stumpy',
-    'sturgeon',
-    'sturt',
-    'stuttering',
-    'styal',
-    'stylishly',
-    'stylists',
     'sub-cultures',
-    'sub-divisions',
-    'sub-let',
-    'sub-units',
-    'subaltern',
-    'subaru',
-    'subclasses',
-    'subcloned',
-    'subcommittees',
-    'subcontracted',
-    'subcultural',
-    'subcutaneously',
-    'subdivide',
-    'subic',
-    'subjectivities',
-    'subjugated',
     'subjunctive',
-    'submatrix',
-    'submerge',
-    'subpoena',
-    'subscript',
-    'subsides',
-    'subsidizing',
-    'subspecies',
-    'substratum',
-    'subtext',
-    'subtropical',
-    'subverting',
-    'suckle',
-    'suckler',
-    'suffragette',
-    'sugared',
     'suger',
-    'suggestively',
-    'sukenick',
-    'sulawesi',
-    'sulked',
-    'sulkily',
-    'sulphides',
-    'sultans',
-    'sumo',
-    'sun-dried',
-    'sunbathe',
-    'sunbeam',
-    'sunbed',
-    'sundance',
-    'sunderby',
-    'sunley',
     'sunnyvale',
-    'sunpro',
-    'sunscreen',
-    'sununu',
-    'super-ego',
-    'super-middleweight',
-    'super-sara',
-    'supercar',
-    'superfamily',
-    'superficiality',
-    'supergun',
-    'superimpose',
-    'superintendents',
-    'supernatants',
-    'supersedes',
-    'supervises',
     'supplication',
-    'suppositions',
-    'suppresses',
-    'surer',
-    'sureties',
-    'surpasses',
-    'surpassing',
-    'surrealists',
-    'surrenders',
-    'surridge',
-    'sus',
-    'susceptibilities',
-    'suttons',
-    'sutures',
-    'suva',
-    'sw3',
     'swab',
-    'swabs',
-    'swaggered',
-    'swainson',
-    'swale',
-    'swamping',
-    'swampy',
-    'swanson',
-    'sward',
-    'swarf',
-    'swashbuckling',
-    'sweet-smelling',
-    'sweethearts',
-    'sweetmeats',
-    'swerving',
-    'swifter',
     'swiftness',
-    'swill',
-    'swished',
-    'swod',
-    'swoops',
-    'swopped',
-    'swot',
-    'syllabub',
-    'symbolising',
-    'symbolizing',
-    'symonds',
-    'synods',
-    'syntagmatic',
-    'synthesiser',
-    'synthesize',
-    'syphon',
     'szekeres',
-    't\'ai',
-    't.l.r.',
-    't4',
-    'ta-ta',
-    'table_d\'h&ocirc;te',
-    'tachistoscopic',
-    'tacitus',
-    'tafari',
-    'taggy',
-    'tahiti',
-    'tailing',
-    'tailplane',
-    'tajik',
-    'take-overs',
-    'taken-for-granted',
     'taki',
-    'talabani',
-    'talb',
-    'talcum',
-    'tallinn',
-    'tallow',
-    'talyllyn',
-    'tamara',
-    'tammy',
-    'tankards',
-    'taoiseach',
-    'taormina',
-    'taos',
-    'tape-recorded',
-    'tape-slide',
-    'tapers',
     'taq',
-    'tardy',
-    'tarry',
-    'tartar',
-    'tas',
-    'tasmanian',
-    'tata',
-    'tatars',
-    'tatham',
-    'tatra',
-    'tatung',
-    'taverna',
-    'tavett',
-    'tawell',
-    'taxied',
-    'teabags',
     'tearaway',
-    'tearfully',
-    'technicolour',
-    'technologist',
-    'tedder',
-    'teddies',
-    'teds',
-    'tee-shirt',
-    'teetered',
-    'teifi',
-    'tektronix',
-    'telefonica',
-    'telephoto',
-    'tellers',
-    'tellin\'',
-    'tellingly',
     'telomeric',
-    'temperamentally',
-    'tempestuous',
-    'temporalities',
-    'temporally',
-    'temptress',
-    'ten-day',
-    'tenby',
-    'tenon',
-    'tensely',
-    'tenses',
-    'tenth-century',
-    'termite',
-    'terrifically',
-    'terrifyingly',
-    'tes',
     'tescos',
-    'testicular',
-    'testimonies',
-    'testis',
-    'tetbury',
-    'tetchy',
-    'tetrachloride',
-    'tex',
-    'texas-based',
-    'texel',
-    'textural',
-    'tfiia',
-    'tfiif',
-    'tgat',
-    'thales',
-    'thane',
     'thankless',
-    'thankyou',
-    'thatching',
-    'thawing',
-    'theater',
-    'theirselves',
-    'theists',
-    'themed',
-    'theodoric',
-    'theodosia',
-    'theologically',
-    'theorems',
-    'ther',
-    'thesauri',
-    'theuderic',
-    'think-tanks',
     'third-class',
-    'third-person',
-    'third-year',
-    'thirteen-year-old',
-    'tho\'',
-    'thoreau',
-    'thorneycroft',
-    'thornhill',
-    'thoroughfares',
-    'thorstvedt',
-    'thoughtfulness',
-    'thoughtlessly',
-    'thrace',
-    'three-legged',
-    'three-match',
-    'three-minute',
     'three-point',
-    'three-times',
-    'threepenny',
-    'threesome',
-    'thrice',
-    'thrifts',
-    'throttled',
-    'throw-in',
-    'thuc.',
-    'thumbing',
-    'thumps',
-    'thwaites',
-    'tibetans',
-    'tie-up',
-    'tiered',
-    'tig',
     'tiga',
-    'tight-fitting',
-    'tightest',
-    'tigress',
-    'tikhon',
-    'tilberthwaite',
-    'tillich',
-    'tilling',
-    'tilts',
-    'time-series',
-    'timidity',
-    'tinfoil',
-    'ting',
-    'tinkled',
-    'tinkler',
-    'tip-toe',
     'tip-top',
-    'tippett',
-    'tipss',
-    'tiree',
-    'tires',
-    'tirpitz',
-    'tissier',
-    'titillating',
-    'titre',
-    'titres',
-    'tiverton',
-    'tizard',
-    'tobin',
-    'todays',
-    'tolerably',
-    'tolerating',
     'tomahawk',
-    'toman',
-    'tomboy',
-    'toms',
-    'tonks',
-    'tooling',
-    'toolset',
-    'top-heavy',
-    'top-of-the-range',
-    'top-quality',
-    'topside',
-    'toraja',
-    'tormentor',
-    'tormentors',
-    'toroidal',
-    'torpedoed',
     'torrington',
-    'torus',
-    'toryism',
-    'toshack',
-    'tosses',
-    'totalizing',
-    'totnes',
-    'totter',
-    'totteridge',
-    'towcester',
-    'toxicology',
-    'toynbee',
-    'trackbed',
-    'tracker',
-    'trackers',
-    'tractable',
     'traditionalism',
-    'traitorous',
-    'trajan',
-    'trampoline',
-    'tranquility',
-    'trans-pennine',
-    'trans-siberian',
-    'transact',
-    'transarc',
-    'transducers',
-    'transduction',
-    'transformants',
-    'transgressed',
-    'transmembrane',
-    'transplanting',
-    'transpose',
     'transvestites',
-    'transworld',
-    'trapeze',
-    'trapper',
-    'traumatised',
-    'travail',
-    'traverses',
-    'trawlers',
-    'trawling',
-    'traynor',
-    'treatable',
-    'treetops',
-    'treks',
-    'treloar',
-    'trespasses',
-    'tretyakov',
     'trev',
-    'triangulation',
-    'trickier',
-    'trickster',
-    'tricycle',
-    'trie',
-    'triennial',
-    'trifles',
-    'trill',
-    'trilling',
-    'trilobite',
-    'tring',
-    'triomphe',
-    'tripods',
-    'trist',
-    'triumvirate',
     'troika',
-    'trois',
-    'trolleybus',
-    'trolleybuses',
-    'trondheim',
-    'tropez',
-    'tropic',
-    'trotskyist',
-    'troubadour',
-    'trounced',
-    'troyes',
-    'trumpeter',
-    'trusses',
-    'truthfulness',
-    'tshisekedi',
-    'tubifex',
     'tubulin',
-    'tulloch',
-    'tum',
-    'tumblers',
-    'tuneful',
-    'tuples',
-    'tupperware',
-    'tureen',
-    'turgut',
-    'turing',
-    'turkoman',
-    'turnham',
-    'turnings',
-    'turnstiles',
-    'tusk',
-    'tussaud',
     'twa',
-    'tweaked',
-    'tweaking',
-    'twee',
-    'twenty-second',
-    'twenty-third',
-    'twenty-year-old',
-    'twill',
-    'twined',
-    'twining',
-    'twinned',
-    'twitchy',
-    'two\'s',
-    'two-bedroom',
-    'two-man',
-    'two-mile',
     'two-piece',
-    'two-plus-four',
-    'two-stroke',
-    'two-tone',
-    'ty',
-    'tyndall',
-    'typhus',
-    'typifications',
-    'typographic',
-    'typologies',
-    'u-boats',
-    'u/pb',
-    'ubiquity',
-    'ucas',
-    'ucr',
-    'udder',
     'ufos',
-    'ugliest',
-    'uhum',
-    'uitf',
-    'ukaea',
-    'ulan',
-    'ulsterman',
-    'ultramarine',
-    'umar',
-    'umber',
-    'umbria',
-    'umno',
-    'un-sponsored',
-    'unalterable',
-    'unappealing',
-    'unapproachable',
     'unascertained',
-    'unbeknown',
-    'unbelieving',
-    'unbidden',
-    'unblock',
-    'unbound',
-    'unbridgeable',
-    'uncapped',
-    'unclaimed',
-    'uncompleted',
-    'uncomprehendingly',
-    'uncontaminated',
-    'unconverted',
-    'uncorrelated',
-    'uncovers',
-    'uncrossed',
     'undefended',
-    'under-',
-    'underbelly',
-    'undercurrents',
-    'undercutting',
-    'underemployment',
-    'underlease',
-    'undernourished',
-    'underpass',
-    'underpriced',
-    'undersized',
-    'understaffed',
-    'understate',
-    'underweight',
-    'underwing',
-    'undeserving',
     'undetectable',
-    'undetermined',
-    'undp',
-    'undulations',
-    'unearned',
-    'unearth',
-    'uneaten',
-    'unemployable',
-    'unequally',
-    'unerring',
-    'unerringly',
-    'unevenness',
-    'unexceptional',
-    'unexploded',
-    'unfamiliarity',
-    'unflinching',
     'unforgiven',
-    'ungenerous',
-    'unglamorous',
-    'ungodly',
-    'unhesitatingly',
-    'unhinged',
-    'unhygienic',
-    'unidentifiable',
-    'unidirectional',
-    'unimpeachable',
-    'uninhabitable',
-    'uninsured',
-    'unionization',
-    'unionized',
-    'unip',
-    'unipart',
     'uniprocessor',
-    'unities',
-    'unjustifiably',
-    'unlined',
-    'unmediated',
-    'unmentionable',
-    'unmixed',
-    'unpredictably',
-    'unprepossessing',
-    'unprofor',
-    'unpunished',
-    'unquestioningly',
-    'unquoted',
-    'unrealistically',
-    'unrealized',
-    'unreconstructed',
     'unrefined',
-    'unreleased',
-    'unremarked',
-    'unsalted',
-    'unsatisfying',
-    'unseated',
-    'unseeingly',
-    'unselfconscious',
-    'unsocial',
-    'unspectacular',
-    'unsuitability',
-    'unsystematic',
-    'untidily',
-    'untutored',
-    'up-to-the-minute',
-    'upended',
     'uprated',
-    'uprooting',
-    'upstanding',
-    'upswing',
-    'uptown',
-    'upwelling',
-    'urban-rural',
-    'ure',
-    'urease',
-    'uri',
-    'urinating',
-    'urry',
-    'usaaf',
-    'usaid',
-    'ushering',
-    'ushers',
     'usurping',
-    'usury',
-    'uterine',
-    'utters',
-    'utv',
-    'v\'s',
-    'v-shaped',
-    'v.4.2',
-    'v/v',
-    'v12',
-    'vac',
-    'vaccinations',
-    'vadim',
-    'vagrancy',
-    'valentino',
-    'valera',
     'vamp',
-    'vardon',
-    'varna',
-    'varnishes',
-    'vars',
-    'vas',
-    'vasectomy',
-    'vdus',
-    'vegan',
-    'vegetarianism',
-    'vehicular',
-    'velar',
-    'vendelin',
-    'venerated',
-    'ventilators',
-    'ventriloquist',
     'verkhovensky',
-    'verne',
-    'verney',
-    'veronese',
-    'versace',
-    'vertex',
-    'vesicular',
-    'vesta',
-    'vestigial',
-    'vexation',
-    'vibrator',
-    'victimized',
-    'videotaped',
-    'vila',
-    'vilified',
-    'villa-flotilla',
     'villainous',
-    'villainy',
-    'vimy',
-    'vincenzo',
-    'vinelott',
-    'vino',
-    'vipers',
-    'virago',
-    'virulence',
-    'viscoelastic',
-    'visegrad',
-    'visigothic',
-    'visionaries',
-    'visitations',
-    'vito',
-    'vittorio',
     'vivacity',
-    'vividness',
-    'viyella',
-    'vlasov',
-    'vocations',
-    'voice-over',
-    'voigt',
-    'volleyed',
-    'volleys',
-    'voluble',
-    'voluntarism',
-    'vortices',
-    'voyeur',
-    'vr1',
-    'vron',
-    'vs.',
     'vuk',
-    'vulgaris',
-    'w.h.',
-    'w2',
-    'waaagh',
-    'waco',
-    'waddy',
-    'wafers',
-    'waggle',
-    'waggled',
-    'waggler',
-    'waggons',
-    'waist-high',
-    'waists',
-    'waiving',
-    'wakelate',
     'waldheim',
-    'waldron',
-    'walford',
-    'walkout',
-    'wall-mounted',
-    'wallowa',
-    'walterkin',
-    'walther',
-    'waltzed',
-    'waltzes',
-    'wankers',
-    'wanless',
-    'wanstead',
-    'wantonly',
-    'warding',
-    'wareing',
     'warhurst',
-    'waring',
-    'warlock',
-    'warm-hearted',
-    'warningly',
-    'warr',
-    'warrens',
-    'wart',
-    'washington-based',
-    'waste-paper',
-    'watchfulness',
-    'water-skiing',
-    'waterlily',
-    'waterline',
-    'waterproofing',
-    'waterskiing',
     'watney',
-    'wattage',
-    'wattling',
-    'waveforms',
-    'waxworks',
-    'wcm',
-    'weardale',
-    'wearers',
-    'wearied',
-    'weasels',
-    'weatherall',
-    'weatherbury',
-    'weatherproof',
-    'webbed',
-    'wedderburn',
-    'wedding-dress',
     'wedge-shaped',
-    'wedlock',
-    'weeps',
-    'wegener',
-    'weidenfeld',
-    'weight-loss',
-    'weightings',
-    'weirdo',
-    'weirs',
-    'weismann',
-    'welder',
-    'well-appointed',
-    'well-chosen',
-    'well-deserved',
-    'well-groomed',
-    'well-loved',
     'well-nigh',
-    'well-ordered',
-    'well-preserved',
-    'well-publicised',
-    'well-qualified',
-    'well-used',
-    'well-written',
-    'welland',
-    'welly',
-    'welshmen',
-    'welts',
-    'wemmick',
-    'wenlock',
-    'westerner',
-    'westgate',
-    'wetted',
     'wey',
-    'weybridge',
-    'wfp',
-    'whacking',
-    'whalers',
-    'whammy',
-    'whatnot',
-    'whatsername',
-    'wheal',
-    'wheedling',
-    'wheelbase',
-    'wheezed',
-    'wherefore',
-    'whereof',
-    'whernside',
-    'whessoe',
     'whetted',
-    'whi',
-    'whimsy',
-    'whinge',
-    'whirred',
-    'whisking',
-    'whiston',
-    'whitburn',
-    'whiteley',
-    'whitened',
-    'whitman',
-    'whoo',
-    'whooped',
-    'whopping',
-    'whys',
-    'wicksted',
     'widdecombe',
-    'widget',
-    'wields',
-    'wien',
-    'wiener',
-    'wiggins',
-    'wightman',
-    'wilby',
-    'wild-eyed',
-    'wildebeest',
-    'wilekin',
-    'wilenius',
-    'wiley',
-    'wilikins',
-    'willey',
-    'willmott',
     'wilted',
-    'wimpy',
-    'wimsatt',
-    'winched',
-    'windfalls',
-    'windhoek',
-    'windless',
-    'windproof',
-    'windrush',
-    'wing-bar',
-    'wing-like',
-    'wing-tip',
-    'winging',
-    'winkles',
-    'winnick',
-    'winslow',
     'wiper',
-    'wisteria',
-    'witless',
-    'wodehouse',
-    'wolstenholme',
-    'wonky',
-    'woodborough',
-    'woodcut',
-    'woodforde',
-    'woodham',
-    'woodie',
-    'woodleigh',
-    'woodley',
-    'woodlice',
-    'woodworkers',
-    'word-processors',
     'word-recognition',
-    'wordsworths',
-    'wordy',
-    'work-place',
-    'work-related',
-    'workaday',
-    'workfare',
-    'workloads',
-    'workmate',
-    'workouts',
-    'workspace',
-    'worktops',
-    'wort',
-    'worthies',
-    'wracked',
-    'wragg',
     'wraith',
-    'wrangles',
-    'wrappings',
-    'wreaked',
-    'wrens',
-    'wrested',
-    'wrigley',
-    'write-offs',
-    'ww',
-    'wyse',
-    'wytch',
-    'x-terminal',
-    'x86',
-    'xenophobic',
-    'xenopus',
-    'xinjiang',
     'xla',
-    'xpg4',
-    'xt',
-    'xu',
-    'xxii',
-    'yachtsman',
-    'yachtsmen',
-    'yacs',
-    'yadav',
-    'yangtze',
-    'yapping',
-    'yardsticks',
-    'yasu',
-    'yaw',
-    'yawns',
-    'ycs',
     'yelping',
-    'yeomanry',
-    'yggdrasil',
-    'ymor',
-    'ynys',
-    'yob',
-    'yore',
-    'ytp',
-    'yucatan',
-    'yuck',
-    'yuletide',
-    'yummy',
-    'yury',
-    'zaborski',
-    'zahedi',
-    'zaidie',
     'zamoyski',
-    'zara',
-    'zarathustra',
-    'zaria',
-    'ze',
-    'zealot',
-    'zeiss',
-    'zeitung',
-    'zell',
-    'zena',
-    'zenda',
-    'zener',
-    'zhu',
-    'zidovudine',
-    'ziggy',
-    'zimm',
     'zipping',
-    'ziyang',
-    'zloty',
-    'zo&euml',
-    'zoologists',
-    'zurachina',
+)
+
+blocks_08 = (
+    '!+dollar;1.2m*"3m*"5m*"7m)"50+$,000)!8(%2,500)#.5m)#00m(&30,000*"0m*!m)!m("40',
+    '*!m)!m(#50m(%6,000)!0(!9(&insert!-eacute;litist(+migr&eacute"#egr!$flat"%rac13!/ggr;-interferon!#ins!#ogr',
+    '%"mn"*ound;1,100)#300(".1)"4m)!6)"75($0.50)!5("15(&25,000($3.99)%0,000("4m(#500',
+    '($6.50($7.50*"95+!9)%5,000("95\'$2.5m)"75(%3,000)!0(#50m("70(!9)#.95)!5',
+    ')"75(#000*!m("20(!7(!9)#.99\'$400m(!3(&50,000(!8(!9\'"52(!8\'$6.25',
+    '(!9\'$9.50(&00,000!&verbar #\'89!&course!$eard!#the""is!#you )**altered \'-reuter ".1!!2 #/r/',
+    '!$&deg!#.3%""4%""8%!$0:17#"24$!5!"10!#232!!d )1&ndash;6!$,024"#250"#900!"-2',
+    '""11""2%#!m""75""8%!)0&ndash;1"(,000,000""-1$!1"$0000##mhz$"ph""86""9s""ft',
+    '!*1&ndash;14*!6"#.15#$30am#!7"!p!*2&ndash;13*!5"#(1)"#-13#$hour#$inch#&string#$year"#.00',
+    '#"5%#!6#!7""15""34"%5,000#!0#!8""77""80#"mb""94""in""oz!$3-14',
+    '""22#!3#!7""37""46#!8""50""60"!p!*4&ndash;16"#-15"".2#!3""50#!3',
+    '""80""92"!p!(5-minute"".2#!4#!5"#00m#"ml$!m""29""30#!4#!9""44',
+    '""52#!3#!4""81""98""ft"!s!%6&ins#(ndash;18"!-#"17#%valve#)year-olds"".2"%0,000',
+    '#!7""11#!2#!3#!4#!6#!7#!9"#20s#!3#!7#!9""31#!2#!3',
+    '#!5#!7""46""57""63#!4#!9"#70s#!3#!6#!7#!8""81#!6#!7',
+    '!#7.3#"5%"%0,000#!5#!6#!8""11"#20s#!2#!3#!9"#30s#!5#!7#!8',
+    '!$8-19#$hole#)year-olds"%0,000#"0s"!c""in!%9,000"$30\'s#*9&ndash;45"$60\'s"$70\'s#"6a#"8b#*9&ndash;80',
+    '#)1&ndash;2$!a$!b#)3&ndash;4+"84#)6&ndash;7+"87$#/87#)7&ndash;8,!8$!b#"9b"*91&ndash;2#)2&ndash;3"!c',
+    '""50!"am $2&ft!$,700"#800!"-d"%litre!#.11#!2""2%"#5cm#!m""7%!#030""cm',
+    '!$2-23"".5!*5&ndash;30"%-year"#0cc""pc!$6-27"&/10/93!\'9/10/93"!1"!2"!9!"mm!"s. )3&ndash;3',
+    '"#300"#600!#.00""16""20#!5!&/11/93!(0-minute"$0dpi""ft""pc!%2,000"!3"!4"!7',
+    '"!9!"31"!4"!6""rd!"41"!2"!6"!7"!8"!9!"54"!9""th!"61',
+    '"!8"!9""th!%7,000"!3"!4"!7"!8"!9!"81"!2"#6sx!*9-year-old"!1"!2',
+    '"!7"!8!#com!!s )4&ndash;2!#(1)""2)!"-0"!3"!6!&/11/93!"01"!6"!7!"11',
+    '"!4"!6!%2,000")-year-old"!6"!7"!8!"31"!4"!7!%4,000")-year-old"!2"!4""th',
+    '""0g"!1"!6"!7"!p""th!*6-year-old"!1"!5!"75"!6!"81"!5"#6sx!"am',
+    '!!s!"wd!#x12 %5&deg"\'ndash;0!"-3"!4"!7!#.11#!2#!3#!4#!5""5%!*0-year-old',
+    '""ft!"10"!1"!4!"25!"30"!2!"70"!7!"82"!5!"lb!"ml!"oz $6&ft',
+    '!#.11#!5""20#!5""5%!*0-year-old"!3"!5"!6"#mhz!"24"!6!"30"!3!"54',
+    '!"64"!6!"70"!8!"80#"00"!6!!c!#ins!"lb!"mm!"s. )7&ndash;1)!0(!2',
+    '""5)!"-1"!2"!5!#.15""45""5%!"05"!6""th!#100"!5"!6!"27"!9',
+    '!"60!"80!"ft!"in!!s )8&ndash;1!$,500!"-9!#.15""5%!"08#"60!"20!"30!$5(1)',
+    '!!d!!m *9&ndash;10(!2(!4!#-10!!."!0""15"$30pm!(0-minute""th!"3%!"9p \'a&amp;e',
+    '!"/s!"19!!7!(b_initio"%ating"&dicate"%elard#&rconwy$\'rations#%tting"#hor%#red\'#nce"%idjan"$lest',
+    '#,ve-mentioned"&rahams"\'sconded#\'olutist%"ve$&rbance#)tractedly%#use"(undances##ser#!t"(yssinian!"ca##cia#$deme',
+    '#(entuates$$ptor$&ssions#(lamation#+ommodations%\'odation$)utrements#"ra$&ington$#ual%"es"%erbic#)taldehyde$#one"&hingly',
+    '"%onite#.ustic-phonetic($ally"\'robatic)!s\'!s$$nyms$,ss-the-board"+tion-packed"\'yclovir!+d&egrave;le"&/cycle"*_infinitum"$agio#!i',
+    '"!b"!c"%damax#*itionality##uct"!e#$lphi#&nosine"!f"&joined&!s#%uncts$$ster(!s$$vant',
+    '#%oitly"(ulterous"(vertises!"ec"!r#%oflot$(spatiale"*tiological!&ffably#%erent#$ixes#\'licting\'!s""rc"*ter-school',
+    '%$ward!#gar"%eless")gregating)#ons"\'itating"#low"&onists#"ra"+rochemicals!"hh!%igina"%leron#"sa"%rbase',
+    '#&frames#&liners#%ships#$time"\'tchison!"jr!$kali""ce"$imbo!\'l-assad"!a##mos"(chemical"$date#%erney',
+    '"&ehouse##ppo#"si##xia"%fieri"&hambra"$ibis#&ghting$$ning#"ja#\'mentary"%kalis"*l-american$&comers&(nquering',
+    '$&german$)pervading)$sive$%white#!a#$cock#%erton#&ingham$"ss$(teration#"oa#$udes"&oysius"(phabetic$$onse',
+    '#&er_ego%%nates#&imeter"%umina"%varez!&madeus#\'teurism#$zons"+bassadorial#(iguously#%ushes"\'ericana"$icus#-notransferase""mo',
+    '#"ur")phetamine#\'lifying"!s"!u#&singly"!v!,naesthetized#&lgesic$%ysers#!p$$hors#&tolian"(chorages%"vy',
+    '"%dante#*r&eacute;s$&iessen$\'ogynous(!y%#pov"%eurin")giography#)lo-saxons"\'hydrite"%imism$"us#"on#&sminic"(ne-marie',
+    '#\'otation*!s"%odyne##mie#&rectal"&serina##tey"(tagonize#&e-room$\'chamber$%lopes#)helmintic#*i-american%*democratic&-iscrimination',
+    '%%mouse%\'smoking&%oviet%%viral$&christ%%limax$$lles$%ochus$(semitism!%onach"#rta!&panage""ec#%ritif"&horism',
+    '"%lenty"(ologises(!t)!s#%state")palachian$\'ritions#%eased$(rtaining$&tising#\'legarth%$yard#&ointee$(rtioning$&sition',
+    '"#ses#$idal""ts!\'quarian&#ums$$tics&"nt#%iline!&ragorn#$maic#$nyos"&biters#%oreal"%caded##hon',
+    '"!g#"on#*umentation"%ianna##ght"\'peggios"&ranger$!s$#yed#\'owsmith"(temision#%fully#)iculatory$$fact!$saph',
+    '$)rtainment$&ticism#%hmann#%orbic#&ribing""hi""if##mov"$kin\'"#mar"#pel#%inall$$rant(!s%#ins',
+    '$$nted#$hole##ize##ynt"%taire#$erix%#oid#*henosphere##ley#$oria%"re#\'ringent$%opath"%under",ylum-seekers',
+    '!(tavistic"\'henaeum#(leticism"!k"%lases"!s"%tache#&endees%&tional#&orneys#$wood"!v!)uditioned#$ubon"#ger',
+    '#"ur$$stan"!t#&horing#%ocrat$(exec.bat$$mata$(nomously!)valanches"%enged"#ian#"la!"wa#"mi"\'estruck',
+    '"!l!#xel"#ing!$ydid"$esha!\'zmaveth \'b&amp;q!"12!!6!%a\'ath""al"%bcock#(ylonians$#sit"&ck-row',
+    '%$rops$$pack$%sides%%troke$%track$$wash"&ddeley#%lands"%gging%!o"$ilee$#ing"&keries##ufu"!l',
+    '$"ry#$erno$$stre#%ladur$%valve$(ynahinch"$mber"&ncroft#&daging#"jo#%kside##nen#$shee#&tering"%ptise',
+    '#&enboim%"ts##ham##men#*nes/oxford#&onetcy%"ne%!y#\'racking$#ios#&tender$%lemas##yte#$zani"&scombe',
+    '#$hful##ked##rah#$sano$"et$$oons"&thgate$$robe$\'ymetric#"or#$tler"%ubles#"lk%"ed"#yer',
+    '$!s$"ux##ing##les!"cs!+eaconsfield#"no##tle#$zley"%ckman$"on"/d-and-breakfast#\'fellows#&ridden#$sits',
+    '%$wood#&feater##ney#%rbohm##son##ton"&friend(#ing""gg#%onias#%uiled"+haviourists##eld#%older"#ida',
+    '#$cher#&emnite#&gravia#%levue$%icose%\'gerence*#tly%"ni%!s$"oc#%modes#(orussian##pan"!m"*nchmarking',
+    '#$fica#%idorm#"jy"&queath"%rated#!e$$nson#$gson##ing$#sha#(khamsted#$thed"\'sieging#\'t-loved$\'selling',
+    '"#uys"(witching!$fass!&g-base!"hs!%idden#%eford$!t"!e")furcation"%ggins%"sh$#les")laterally#"bo',
+    '#$ious#\'lboards$#ets$"ig%#ngs($gate\'#ton"#nns#%omial"\'omorphs#!s#)tinylated"!r#$died$(watching',
+    '#\'th-rate%&weight"%ssell"$tmap#\'uminous"!z!+lack-haired&#out%"en%"ie&"ng&"sh%$list%#man%$spot',
+    '#%keney##nca%%mange$)dishments$%kness##red#$ydon#$zers"\'eakness$\'ry-eyed#$eper#%iburg"%ighty#$nder%%ingly',
+    '##the$#zed"&oating#\'ck-like%\'busters%"er#&odbath%"ed%&stains\'#ock%$worm"%ubber#\'dgeoned#+e-and-white%$chip',
+    '$%beard$$ness#!m#&ntness#$ster!"ms""ws!#oac#\'rdrooms%$walk#!z"$bble"!c"!d#"en',
+    '"$ffin##ors"$gdan"\'hemians""ks"#lan##don##ero#\'stering"%mbard\'#ing")naventure#%eless##ham#$jour',
+    '##ney"#oby#%kable$#ish$$mark#"ne#$tleg#$zing$!y",phuthatswana"(rn-again#*oughbridge\'$muir#&thwick"$soms',
+    '#\'ticelli$$omed"$urke"%water#\'er-bird#"is##lby##men$#ore"&ycotts#"ne##son!&rabant##den#$hmin',
+    '%&washed\'"ve#%mwell#\'ndished%(on-bravo$$foot$%nigan#"ts#"va$#ing#%wling$!n"$eads$%kneck%"up',
+    '$$sted$)th-taking&(lessness#$chin#$scia"&ickell#(de-to-be%%shead$"ie$%leway)!s#$efer#&ghtman#&mstone#%ndley',
+    '#%tches""no"\'oadband%#ens%(ly-based%%water#"ch##gue#%kered##lly#\'msgrove#$nson$&t&euml#%ugham#&wnings',
+    '"&uckner#\'ndtland$"er#&shwood##tes"$yden##mbo!"tw!&ubonic"!c#&caneer#$kram$%thorn"\'dweiser"\'ffeting',
+    '"%gatti#"le"&lawayo#\'garians#$lens%\'t-proof$&ingdon##mer"&mbling#$pers"&nching##gee$"le##ter$$ings',
+    '#"ge%$sses$%hgesh##ley##net#$ston"&sybody"&tchery#)ler-sloss&!s#(tercream\'#ups&#fat&#ley$#ies',
+    '$!y"#xom#&tehude!!x!&y-laws"#ers"%gones"$ways##ord %c-myc!#.c.""t.""v.""w.!%abled',
+    '#%kling#"ti"%daver#%ences##uta#&wallon"%esium"#ird#$tlin"&joling"&labria$&mitous#$culi#\'derwood#!e',
+    '#!i$"ph#"or#$vary$%erton$&inists#$ypso"&mborne#&embert#$illo#%p-crp$%bells$#den$"er%$sino',
+    '"%ndice%&diasis#"is#&nibals$#ula#%oeist##tal%\'nkerous%#tas$$ered$%onese%!r##ute"$paro#\'enhurst',
+    '(#zed%%ulate##lan#\'puccino#$size##tor"%radon$"fe#!b$(amylated$(onaceous#+cinogenesis\'"id##dus#\'etakers',
+    '$\'catured$"na%$thia#$lile%!n$$sson##man$$ella$#ine#"no#$park$#ing#&refour%"ra#&tagena',
+    '$\'ography%&onists#"ys"&sanova#%hiers$$line#$ings#&sandra%"va$#ius$"on#%t-off$$elli\'!o%\'rbridge',
+    '&#ton$%ilian&"lo$(lemorton"&talase%$ysis$#nia#&ch-all#)egorising#&harsis&#tic##ton"\'ulfield#(stically"\'valiers',
+    '"!w"%yenne!"bd!%cetsw!&d-roms"!2""68"!a"!m""tv!"eb#"it"$cily""da"$efax',
+    '%!i"\'menting"&notaph#%tauri$#ers%%simal$#ile$!o$&ralise%&e-back\'$line&$line%!o"!r"-teris_paribus',
+    '!"fm!"gi!$h.d."%ablis##dli##fed#%illot$!m$$ning##lon#(mbermaid$&eleons$#ois$&pagnes%&ioning',
+    '$\'ge-over$#son$%tilly#,racter-based)#ful%#des$%latan%\'esworth$$tres#$sers$%tised#\'tsworth$&terbox#&uthala$(vinistic',
+    '#$khov#\'lonians#%nille#\'quebook#%rokee#&shires#$ttle#"ws$!y"%icory#&eveley#$hana#%lcott$&dishly%$line',
+    '$!i$#ler#$ming#%naman$!g#$pset#"rk#%ssano#&t-chat$"ty#&valric""oi#0lecystolithotomy$\'inergic#"ng',
+    '$&sticks#%rused")ristensen&$ophe#&omatin\'(ographic"*urchwarden,!s&%yards$"ns!"i5"!c#\'hlasoma"$nder#!e',
+    '")rcularity##que"#sco"\'tizenry"(vilizing"#zek!"la#(irvoyant#&moured#&remont$#ins$"ks##sps$&s-room%%ifies',
+    '"+earinghouse(!s$%vages%!e#%mence",ich&eacute;d#%fftop#%maxes#"ne$#ked%#ing#%ppers"%obber\'"ed#+sed-circuit',
+    '#"ts$$ting#&wnfish#"ze"&ubbing#\'msiness#"nk"\'ydeside##nol!"nt!"o-#(chairman#)defendant##opt&#ion',
+    '"\'alesced$#ite$$port"$burn"\'ckerton#%onuts"\'denamed$!x##ron#!y"#eur#&xisted\'#ing"%gency%#tly',
+    '"$here"\'intreau"&lander#(dharbour#%eslaw$!y#%iseum#(lapsible%%rbone&"ed$,ectivization%%gians$$iers%&ngwood$(oquially',
+    '#%onise$&urways#%trane"&matose#&batant$"er$)inatorial$\'ustible#&e-back#!m$)endations%)rcialised$!s$&unally&&icable',
+    '$+lementarity%#ine$)rehending)%sives&%ssing$+utationally&+er-assisted)*controlled(\'ization(&vision"(ncertina$%iliar#\'densing#\'fection*#ers',
+    ')"te*$ions$/idence-building%%scate$&lation$%ucius#!g$%leton$*ratulatory%,egationalist#&ingsby#(jectured$\'uncture#$kers##lon',
+    '$&ivance##oco#%radin#(scripted$$oles$(piracies((torially$&tantin%,itutionalism%\'ricting&(uctivism$\'ummated#"te%,mporaneously%,xt-dependent',
+    '$!i%\'nentals&\'uations$*racted-out&$flow&&puntal&%stive&%vener%%ition#&verges&&tibles$&ulsion"%okson#$lant$"ie',
+    '##mbe"$pier#(perfield$#ice$#ola"!q""r.#&bridge##ded$#oba%&n_bleu#&eldraw#"fe#\'iolanus#&nering',
+    '$&ucopia#\'porates&#eal##ral$$ects%&lating)"ve$$upts##sie#!y""sh$!h##ily$"ne&"ss',
+    '#%seted#$tain"%ttons$$rell"%uches##lby$%thard#0nter-reformation*(volution\'%acted\'\'parties\'&weight#&plings#!r$$iers',
+    '"#ven$%rdale%&master%"ts$!t"#wer%"ed#$ling!"pc"!r!,r&egrave;che"&abtree#%ckpot$"ow#$dles',
+    '$"ny##ppy##wls$$shaw#%yfish"!c"#eag$"ks$*m-coloured$$tine#-ditworthiness##eks$#per#%ssida$\'tfallen',
+    '#\'stofori"#ock#$fter#%marty#$okes$#ned%#ing#+ss-national&*referenced.#ing%$fire%\'linking%%words#$wing"%udest',
+    '#$mbly$#ple#$shes$#ted")yptically%\'ocoryne&)sporidium#,stallisation!#ska!#tcs""rl!%ubitt"\'cumbers"$ffed"2ltural-ideological',
+    '#$nock"&nliffe#$nane$\'inghame#$tona"%p-tie"#rle#$ragh##tsy"\'stomise"\'t-backs"*v&eacute;e!\'yclamen"$pher#&resses',
+    '$&oscopy"&tokine$%toxic!#zar \'d&amp;b"2eacute;b&acirc;cle)+j&agrave_vu)*mocratique!)\'alembord#$rcos#&ubigny"%orsay""ye$!r!#.h.',
+    '!#ado""il#)mler-benz#%rying"#kin"*ler-rowney#$gety##ian#%keith#&liance$!y#&matian"#mes##med#&pening',
+    '#$akil#(ce-floor%%floor#\'delions#$iele#!u$#ese"%phnia"\'redevil$%sbury##ley#$ning##ryl"&taease#%eline',
+    '"$urog"&y-care$$long#%break#&lights"!z#$edly!#csl!"di"!l!*e-skilling"\'aconess#&dening##kin#\'lership',
+    '$"ie"!b#\'asement##ord#\'riefing"(ceptions#$ibel$\'phering$(siveness#&kchair)!s#(larative#$oder$%mpose$$rous',
+    '"(faulting#%ecate$)nsiveness$%rment##ile##ray#%using"*generating#%rades"+hydrogenase"%igned"\'jection"\'lacroix#$gado#(iberated',
+    '$)catessens##tas##ude""m.#\'arcated#!e$%nting$$rger$#ter#+obilisation(#zed"\'ndrites\'"ic##ice$&grated',
+    '$#son#%ktash##man##ner#\'ouement#"ts#\'udation"+pendability#$lete&#ing$$ores##ort&$ment$"se%\'itional',
+    '%$sses#\'utising"&railed#+matologists"&scents$(ription=#&demona#%erter#(iccation$&derius$\'gnaknit$$rous#\'pensers$$ises$$otic',
+    '*#ing"%tente$\'rminist%%rents%!s#%onate\'"or$#urs#%racts#$tori")uteronomy"\'vastate#%erill#!i#&olving',
+    '!#gse!$hani""ia!)iagenesis$%hilev$%onals$,rammatically#%logic##nne#\'rrhoeal#&stolic#$toms%#nic$$ribe#!z',
+    '"%derot"%ehard#!m#$ters#!u"&ffuser&#ing"\'gitally%%izing#$ress"\'lutions#%worth""me#$pled"#nas',
+    '"(ocletian##des#%nysus"\'phthong#$loid##per#$tera")rectorial(%ships##kin#$tier&"st"-safforestment$)ggregated$\'pproves',
+    '($ment#+ciplinarian$$laim(#ers$#man$\'omfited\'$orts%(nnection&(tinuance%&theque$+riminations#)dainfully#&embark$(ntangled#&favour',
+    '$\'ustedly#)heartened*#ing$)onourable#+inclination%)formation%\'herited#(junction#)locations#*memberment#(oriented$"wn#(patching$&elling#\'regards',
+    '##til$\'rustful"$ther#"ty"\'uretics")vergences%\'sionary%"ts#%iders$&nation!$jinn"$ohar!"mj"!u!!n',
+    '"%dgers""ge"$llop#&omites"-main-specific&!e#*estication"$n\'ts#\'nington#!t"$odle##han#&little"#ped"%rnier',
+    '""st"(t-matrix",uble-glazing&!t#)glas-home#$lton#"se"%wding#"el#&ngrade$\'hearted$%pipes$%swing$\'trodden##son',
+    '!$rago##kes#&matics\'#sed("ts#$ping#!s#&wn-out""da"&essers"!g"$iest#&ffield$#ter#(nk-drive',
+    '#$vers##wns"\'tf1/e2f"&ubbing#)g-related#"ze!"sc!"tt!(ualistic#"ne"%bbing"%champ$$enne#&kworth##los',
+    '"&elling#"ts"%g-out##gan"%hamel"%kakis"$mpty"\'ngeness##kel#%leavy$"in##oon#$stan""pe$!s',
+    '"$rnin#$sley#!y"&shanbe#$tman"$tton"$vets!&weller!%ybbuk"#ers#&stuffs &e.m.f.!\'adberht#"ie##ric',
+    '#%dwulf#\'thbound%$worm"\'stbound$\'erbrook&%house#&ygoing!#bbw""en!"c1"!c#\'leshall"!g#!d"*holocation',
+    '#"ri"*statically"!t#$opic!.ditor-in-chief$!s"+ucationists!$elam!"fa"\'fectual$(rvescent$"te#\'rontery#%usion&"ve',
+    '"#ham"&oistic#$tism"&remont!!i"!a"(cosanoid"\'ght-day&$week%&eenth-%&y-nine\'#one\'%three"!n#&dhoven',
+    '!+laborations"%ectro\')-acoustic((magnetic\'%lysis\')magnetism\'(phoresed)+ysiological#(phantine#$usis#&vating$\'en-plus"#fed")icitation&!s',
+    '#%tists"\'kington""le$"rs#%ipsis"!n"$onex")phinstone"%stree"#tis"$udes!$mail")barkation%)rassments#"ed',
+    ')%ments#\'lematic#\'ryology"!g""my""or"(pedocles#&hysema#(iricists#(lacement""yr!&n_bloc"!a#\'ctments%!s',
+    '&%ments#%ircle#+yclopaedias,!c"+d-of-season\'$year$\'product#(earments#+oprosthesis$%scope$(thelin-1"\'ergised%+y-efficient\'&saving"\'feebled',
+    '"#gel$%nders#)lishwoman#&ulfing"+igmatically"#nis"\'quirers"(raptured#$ight")slavement"+tanglements#$ente$#ral%+ochromaffin&(glucagon',
+    '#$huse\'!s"\'umerate"\'viously$0ronment-friendly""zo!%ocene""in"!s#"in!)paulettes""h."\'icentre#%phany#%stles',
+    '&"ts$&omises%"pe%!t!&quable$&lising&"ze%$ling#(ilateral!"rc#&eldoun"#dle""go"%otica"$ring',
+    '!$s/mp""as"&capist#(herichia%$wing"#her"%kdale#$imos"!l"$pana#%ousal""q."#sen%"es%\'tialism',
+    '$"rs#&imator)!s!*tch-resist"(hiopians#)nocentric#"yl"%onian""ty"\'ymology!!u"\'clidean"(karyotes"$logy"$nice',
+    '$%rates")ro-dollar$\'cheques$\'pe-wide!)vacuating#+ngelisation#%sions"#ens$$ting#%rmore$%queen"\'idences"+olutionists!&x-army#)directory',
+    '#\'service$&oldier")acerbates)#ing#)sperating"(cavators#$erpt#&hanger#)lusionary\'&veness#$reta$*uciatingly#%using"&ecutes#)mplifying',
+    '"#ons#%rcise"*pansionism\'$vely#\'iratory#(losively#\'ounding#(ressible((onlessly#\'ulsions")tensional$%riors%\'minated%*nalization#)inguisher',
+    '#0ra-parliamentary&$time%+terrestrial"#ude%!s$#ing!\'yeliner"%nsham +f&aacute;il!#.w.!!4!!5!,aberg&eacute#&ricate(#ing',
+    '#$eted#)ilitators$#ngs#)tionalism$"um"%ggots"&irbank$"ey"!l#$ange&$ists#%conry#(libility#%setto""ma',
+    '")ntastical#%zines""or"&r-away$%right#&abundo#!c#&ingdon#(mworkers##rer$&ingdon#$ting"(scinates#%tener%*st-growing',
+    '"(therhood&$less#%igued#%tened"&ulting#%stina"\'versham"$wcus"$xing"#yed!#cib!"dr!&e(iii)"(arlessly$$nley',
+    '"\'ed-back"%herty"$igen"!l#$dman$$spar#\'icitous#"on"(maleness"%nders$#ing".rn&aacute;ndez#%raris$$yman"%tches',
+    '&"ed&!s#$uses"!v"$west"!z!*ibre-optic$\'onectin""de#$gety"(eld-work%\'workers#\'rceness".fteen-year-old$#hly',
+    '$!2#)uratively%#ine")lamentous#$bert#"ey#"ip%"po#"le$#ies$$more"&neness#+gerprinting#%isher#"ns',
+    '#&mament$"in#!s$&t-born&&person%$born"(shmonger#$tula\'!s"\'ve-hour%#man%$part%&thirty$"rs"&xative',
+    '"%zzled!#lab$)bergasted#$ccid$!k#%herty#"il%"ed#"ky#\'shpoint#\'tulence"%eeces$!s#%mings#"ur',
+    '"%g.off"&ickers##ngs#"ps#(rtatious#!t"(oodlight$&rboard##rio#$ured#\'werpots"%uffed#)oridation#%rries##val',
+    '#%wheel!"ob""ch#%usses"#dor"%garty#!s"!h"%ibles#!e#$sted"#lic#&licles"%ndled$"ue',
+    '#\'tlights$#men$#way"%rdism#%ehand%$eads$$legs$$play$\'thought#$ints#&malise$%ulaic##res#&tescue$#num',
+    '""ss$!e$&ilised\'#zed"$ulds#&r-fold%#man%%piece%$star\'$orey%$week&*heel-drive%)year-olds$$nier")x-hunting',
+    '##ley!&p&ouml!&ractal%(ionation#(gmenting#&ilties#(mlingham#*nce-presse%%hised%*o-prussian&%phone$"jo$#ked#%xilly#$ying',
+    '%&living%\'running%(swimming$$dman$$mans#$limo#$mont#%nchay#(quenting#$shen&"st#"ya"#ida##eda%$mann',
+    '$&ndless\'#ies$#zes#$nton##sky#\'zingley$"zy"&oggatt#\'hnmayer##lic#)nt-runner#&stbite"(uitfully#*stratingly!!s',
+    '"&elwood"$hrer"#ll-%%backs&%odied%&colour%%sized##mar",nctionalists#$ders$*oplication#%ereal#$fair#&gicide)!s',
+    '"&turist!$ylde "g4!#aap"%bbled%#ing$!y#!y"#ffe"%iners#%rloch#$ters"\'llantly$$eria$$iano',
+    '$#tes"&ngland%#ing#$nets"#rbo##dai$!e#%goyle#&rulous#$tner"$shed#)ification#$thof$\'rectomy%+oenterology',
+    '")tekeepers##sby"%ughan$#ing"%wping"$zebo$$lles$"ta!"cs#"es!!d!(earboxes"$iger"$lada"#mms',
+    '#)eralizing%&ically$&ticist*!s#$nady#$omes$%types#%tlest$*rification#(uineness"\'odesics#)logically#*metrically$&orphic#\'rgetown',
+    '##ber#\'iatrics#,man-speaking&!e&#ies"#sta%"lt$$ural!\'hanaian"$ulam!(iancarlo"\'bbering\'"sh"%dding"\'lgamesh',
+    '"%ngham##nie#$seng"%oella##tto"\'ronella##ton""ts##tel"$ulia"\'ve-away!)laciation##des#&ringly#\'sshouse',
+    '"$eams#"be#$eson#\'nrothes"#ial#&dewell#&mmered#"tz"#oat#*balization#%sters"&ucagon#&tinous$$tony"&ycerol',
+    '%(proteins!\'nashing#!w!&oading#&l-line$%mouth$\'scoring"&bbling"\'dalming#*manchester#\'parents##son"%ibniu"$llum"&mbrich',
+    '"%neril",od-naturedly$&enache$#ing$$year#"ey"%razde##bad##ing#"ky#%mless##ton"&ssamer"&tthard"$uges',
+    '\'!s"/vernment-backed+&funded+%owned$"tt!)radations#$ined#+mmar-school\'$ians#%ndees%$ison$#ger$$nies##sps$#sed',
+    '#$vels$"is#"ys##zes"#eco#\'enblatt%$hill%$ness%%slade&#pan#&nadier)!s$%ville#\'yfriars$&stones',
+    '$&vously#$gson##lls#\'m-faced$$shaw%#ilk##nds#"pe"\'oningen#$oved#"pe#!s$#sed#$ucho$(nd-based',
+    '\'$well#\'velling"&ubbing#$dges#"el!"st!)uarantors$%dedly%"ia"#cci"$iana#%lders#&nevere#!s"%jarat',
+    '##let$"it"&nships"%ppies#"ta"!r#$gled"#sty!#wyn!!x!%yggle",naecologists""ro""si &h-bomb',
+    '#%vikko"\'ckneyed"(ddington$"on#%leigh"!e#+matological"$ider#"fa#"gh#!n#%rless$%spray"#len$$wood',
+    '#\'f-board&\'rothers%$full%&hidden%$moon%%price%&truths&%urned$#ord#\'lowe\'en$)ucinatory"$mble#"ed#"id#$madi',
+    '#&pering"&nd-out$&icraft$%lebar$%rails$&shakes#$kies#!n$"am##som",ppy-go-lucky"$rber#&d-core%&headed#&efield',
+    '#$lech$"ot##mon&#ica\'$zing#%shest"%ssock"#uls#&ssmann#*te_couture"$vers$!s#&illand"!w#&thorns',
+    '##don##ton"&zelnut%$wood!$beag!"cs!"df!+ead-to-head$&hunter$%phone$%scarf%%tones$$word#\'lthiest#*rt-rending',
+    '&#urn#%thers$$wave""il#%rloom"#lga#%meted$!s"\'mifield$)spherical#$ming"&nchmen#&drique%"on#"na',
+    '""ra$%lding#$bage$\'ivorous#&cynian#%esies$%under#&itable#(meneutic$$ione%$ston$!s#"ne#\'oically#$rera',
+    '"*terozygous#"ty"$wett"&ymouth!!f"!s!%i-tec"&biscus"\'gh-cost%)frequency%&street$#ers$&fields"#kes"%llock',
+    '#%alaya"!n#%chley&$iffe$#mar#\'denburg"%p-hop#\'podrome%\'potamus"$slop##ses#/tocompatibility%%grams%"ne%#ria',
+    '")t-and-run#$ches"*v-infected"#zir!&la-b53$"dr""ca!"mg""mm!&oarded$!y"\'bbesian$$yist#%sbawm"%echst',
+    '"%ggatt#%manay"&kkaido"&lbrook#%d-all%"up#)idaymaker$"ng##lar$$iday%"es#%ogram$$vich"(me-based%(produced',
+    '$!d$$town#&icidal#\'ogenous$&logies$&zygous""ne$%ycomb%"ed#%olulu"$oton"$pkin"%ratio#\'nblower$#ets',
+    '##sey"-spitalisation)#zed#&tesses""ts#$ting"!u#%nding#*sebuilders%$coat%&master%&plants"#vel%!s"#wey',
+    '!#plc"!r!$uber"&cknall"&guenot"$lton"\'manists#%berto$$ling$$oldt#)iliations#%oured#$ping"\'nchback%"es',
+    '##tly$$sman"#sak#\'bandmen#"ks#$sars#%tings$$ling"&tchins#!t!(yderabad#\'raulics$%ology%&static%\'thermal',
+    '")menoptera"+peractivity%%bolic%)inflation%&market%+ventilation#\'odermic$)glycaemic$\'tension%\'hesised$#xia"#the $iasc!%beria!"c1',
+    '""as"&e-blue#%bergs#%cream#!s"!h"%icles"$onic""ta!+dealization#\'ologues"!i##ocy!#e-3""ee',
+    '!%ffley"&n-&ggr""or!&gnoble$)miniously\'!y!#hta!(lchester"\'eostomy"*l-prepared$(tempered!\'mbecile$"rt"!i"\'mensity',
+    '#(obilized#&unised&&zation%/ohistochemistry&(reactive"$ogen"\'pairing&!s$#rts#(ecunious#\'lacably$%icate(#ing($ures$%oring',
+    '$&imatur$)obability!)n-between#(fighting#$situ#$tray")_absentia#&camera"-accessibility$\'tivated#(dvisable#.ppropriateness#\'ugurate"%bound"*cantations',
+    '#$hing$$oate#\'idences$\'nerated$"te#!l$%ining#*ommunicado%\'parably&(leteness$)nsiderate%)venienced$(rrigible#(riminate"1d&eacute;pendants',
+    '$\'mnified$"nt&&ations#(ictments$"ra$(sputably$*vidualized#(onesians#%uctor$\'lgences$)strialism"+efficiently#(stimable#(xcusable"+fallibility',
+    '&!s$$rnal%$ring%!s#$idel$&ghting$%lling#&lating$%ected$$icts#%olink$\'rmatics##use%$ions"\'genuous',
+    '#)ratiating"%haler"(iquitous"&jector"$kjet"&nately#(er-urban#\'keepers#\'ovating"(oculated#\'perable#%sitol"(patients"&quests$)isitorial',
+    '%%itary#\'ertions#(incerity%&uating#(ouciance#%pects$$iral\'%tions#%talls$\'igating%%lling$+rumentalist#,ubordination$(fferable$%lator',
+    '")tangibles#\'er-bank&+continental&(personal&-relationships&%state%%acted(&ionism-!t.!s)$vely%$base%\'changes&)onnecting%(est-rate',
+    '%,generational&&lacial%$leaf\'$ukin&%ocked%(marriage&&ingled%\'nalised)&zation%)planetary%#red\'$gnum\'&lation&\'ogative*"or',
+    '%\'weaving#(imations#(olerably#)rauterine$%icacy"+verkeithing%%sions%"ts$)stigatory#\'itingly#%oiced$(lvements!"oc"(nization!"pg',
+    '"!v"!x!&rkutsk""lr"(onbridge"*rationally#)eversibly!"sc"#haq""la##ets"%oform\'!s#)lationist#&static',
+    '"%thmus""vs!"t\'"&aliana%%cised#&r-tass"&emised")ineraries"!t!!u!"v."!a##nov"%erson"!o',
+    ' +j&uuml;rgen!#.c.""f.""m.""s.!#aci##kal$"ed$#man##opo"$ffna"%guars"&hangir"$iler##pur',
+    '"\'maicans#%boree"$ngle#"ie##man##ner"$rdin"&untily"&vanese"%wline""ys"#zzy!"ci"!t!,ean-baptiste',
+    '%%louis$#nie""er"&ffreys"#lka#%licoe"$mima"\'nkinson"*opardising"\'t-black##ted$$ison!$ibes""ri!"j.',
+    '!!n!(obcentre"\'ckeying"&dhpurs#"ie#!y"$elle"\'hnathan"&inting#"st"$kers$!y"%llity"#nna$!y',
+    '$$phus$!y##tle"$tted""ve""wl"%yless#%ously"#zef!#uba"#dah$"ic#\'icature"&n-core##ker',
+    '"$rgen#"or"%tland (kadiliks"&i-shek")lashnikov#!i"$mara""nu"#ppa"%rimov#&linsky"\'tabatic#%mandu#$tina',
+    '"$yaks#$sone!!d!&earney"$eler""ir""ld"*ndall-hume$$rick#$nett"$rala##mit#!n#$ouac#%rison',
+    '"&strels"#tch"#yes#)nesianism##pad!%haled$#ifa#$rkov"\'ruschev"!z!%icker"%elder#(rkegaard$#nan"$ichi',
+    '"\'lfedder#%owatt(!s"$mber##ura"%nases##gly#"ks#%sella$$hasa"\'rghizia#$kham$$land$"uk#$sten',
+    '"%smayu"\'ttyhawk!#lan"%eenex"\'ingfeld!(nee-deep%$jerk"&ockers#,wledge-based!%obold"&hlberg"!k#"os"&llwitz"%mpong',
+    '"%wloon!$pnlf!!r"$abbe#$shen##uss"#ebs"#ona$"er$"or!$ubla#$rick"&hlmann"%ndera#"st',
+    '!\'ynaston"$ubin ,l&eacute;ger)"on!$.jj.""t.!*abour-only#%urnum#)yrinthine"&canian#(erations#&tation$\'oferrin"-dy-in-waiting"(fontaine',
+    '#$onda"#lly"&mbarde$\'orghini$#ton#$otte#%preys"%ncers#&dfills$)ownership##gue%%ished%"or#!s"%psing',
+    '#\'tington"(scivious#%hings##zlo"%tches#\'ecomers#%tices"&udanum#$nder"$vant#%enham$"ry"(w-making##ley"$xity',
+    '#"ar#$enby##ing!%ccieb!"dc"#oce"!r!)eadbetter##ver"\'cherous#(tureship""du"\'ft-over$$ists"*galisation',
+    '#!g#(itimated\'#ize#$umes"%ibniz##den#,gh-pemberton#%sured"#mma"&ninist#(nox-boyd##ten"&onards"+ss-favoured$#ees',
+    '"(tterhead"(ucocytes"(verhulme#$inas""xy!(ibellous$(ralising"*chtenstein"$eder#"se")fe-giving%$span$/span&mdash;user#%t-off$"er',
+    '%$body"!j"\'keliest"#ley#\'leshall"&mavady#&ehouse"%ndley$!y#&earity#"go#%otype#!t"\'quidate"!s',
+    '#(nagarvey#!s#%teria")thography##mus#&tering$&lewood$$oral"\'veliest$(rpudlian##res!*landrindod$$fair"!d""yn',
+    '!%oader$$ings#$fers"\'bon-gur".cal-government%"es#%kable$%smith#"um$"st""de"\'fthouse$!s"%gbook""in',
+    '")ne-parent$$some#"g-%$dead&(rawn-out%)forgotten$+est-serving$$ford$$horn$*itudinally$$leat$$time"+oking-glass#$sing#$ters',
+    '#"ed$&ramide#"pe%!d"#rca#$entz#\'rimores"%thern#$ions#"to"(uisville"(veliness$"tt""w-$&budget',
+    '$&flying%(requency$\'profile$$risk##den#(er-class##yer"%xford!#rdg!!s!"tc"!e!*ubrication"!c#"ca',
+    '$$feri$"us#%ozade"\'fthansa"!g##ano#$ging#!h""ib#"za"#kes"%llaby"(mberjack""nd#!e',
+    '""qa"%stful"!x"!z!(ymphatic""ne##sey"&onette""re#&ically \'m&amp;c&!s"0ecirc;l&eacute;e"+oslash;ller)!n',
+    '!(-derived!#.d."#p.s""sc!"13"!6!"50!"62!!8!&abbutt"&caroni$$uley#&cabees#$edon\'$ians',
+    '$\'iavelli%#ned&$ists#$lane$$eans#\'rophage"$dcap#%dened$$ison#%eiran$$line##men"&gharba$#ull##inn',
+    '%&nimity$)etosphere$&ificat&!y"!h#(arashtra#"er"&idment#$lbox#!m#&n-line$$sail#"ri"!j"$lady',
+    '$!n$#yan%!s#(e-female%*identified$\'/female$$kith#%igned##kin#$laig$#ing$"on##tby$#hus"#mbo',
+    '#&cunian#%dolin#"es#\'gosuthu#\'handled#%icure$\'pulator$$toba##tis##web#%y-one#$zoni"&ppings##uto"\'rauders',
+    '%!e$#use#,ginalization(!s#&igolds$%nated#%joram&!y#*ket-makers\'*orientated&$eers#&onites##que&"es#$ryat',
+    '$%upial)!s#(t&iacute+$;nez$&indale&$ique#%yhill"$slow#(s-market$#ine$"on"%tador#&chless#!h$$ilda',
+    '%"gs%!s#$rons#"te#"za"\'uchline#%dling"$xham#"ie$%mally%$ized%"us##ton"#yan#%field',
+    '!$buna#!s!%cadam#%llion#$teer##voy"%clure#%olgan$&nville#&racken"\'donough"$gann$#rry#%inley#\'oldrick',
+    '"$iver$"or"\'kechnie$$ever#%illop#%night"&lennan#$uhan"&mullan"%shane!"df!"e."#all$+s-on-wheels#"th',
+    '#\'hanized"(dallists##ica"#ese"&gabyte$&lithic$"ra"#hta"#iji#"ko#!n#$otic"!k")lancholic%$omas',
+    '#%tdown""me$!s#&orized"%naced$!i##cap#$doza#$elik#"sa$&heviks##tle""ow""pc"!r',
+    '$$osur#(itocracy)#tic&%rious#+ry-go-round#)seysiders"(senteric#"ic#(merising\'#zed#*serschmitt$#ina"\'tallica%\'working$&stasis',
+    '$#red#)hacrylate$#ile$#uen$\'ylation&#ene#$opes#&ronome#!z!#g/l!!h!%iasma"&chaels$"ie#,roelectronic',
+    '%%sparc"*d-atlantic$*eighteenth$\'forties$\'oceanic$(sentence$$west%%inter#"as#)dle-earth\'+of-the-road#(fielders#$line#&shires$%tream',
+    '"#ggs#&htiest""ki#"va"$lano#*d-mannered$&enhall%"st#)itaristic#$lard$$bank$%icent%%grams%&second##nes',
+    '#&waukee""mi"%ncing#*eralogical#%i-bus%&series$#bar$\'stering#&strels##tel"*rror-image#&thless#"za"-sappropriated#*calculated',
+    '#"er%"ly#$fits#&giving#(informed#\'reading#"sa$#ive##ted$#ral%%eated($ment%%usted"%tford#&ogenic',
+    '!\'ladenov!"md!$obil"%ck-up$!s"(derating\'#ors#(ulations"%ffatt"#ila#$sten%\'urisers(#zer"&lasses#$lusc',
+    '"(narchies##deo#+ey-go-round&&making%\'lenders#$gols#*mouthshire#$ocle$$gram$\'lingual&"th$&polise("ze*!d$)syllables',
+    '#&taigne$$eith%%video"!o#$nies#%rcock%$roft$$gate"%rales#)e-or-less#!n#&taring$%ensen$#hen$)ification',
+    '#%sadeq""ta#"es$!t#,her-of-pearl#!o$(rcycling%"ed"(uldering$"in$$ting#&ntings#&setrap$!y#+th-watering',
+    '"&vingly"$wers"(zzarella!$ucin##ked"&ddling#%erris#%flats#!s$%tones"%ffins"&irhead"\'jahedin"$llah&!s',
+    '#)ti-ethnic&%level&)nationals%+dimensional%$plex\'#ies&)rocessors"%mbles$!y"#rdo#*ison-bowie#!k"\'scovite$&ularis#%eveni',
+    '(#ing##ica%\'ianship$#ngs#"ky#)takimzade%#pha$%ering$#ill")tagenesis#&ineers"#zak#$zles!&ycenae#)obacteria',
+    '"$ddle"$opia"%riads %naafi"%biyev"#cro"#dia#!u"\'ggaroth#!y")il-biting$#ing"%maliu#)es&dollar"%nette',
+    '"!o"$palm#$ping"\'rasimha#%cissi"$ssim#%tiest""th#*ion-states##ter#$ured"$vajo$!n"(zarbayev#&ionale',
+    '"#ube""vq!"do"!t!$e\'er"%asham"&cropsy"-ighbourliness""mo")o-fascist$%nazis"$pali#(hropathy"!r#*ve-racking',
+    '$"on"%twise"&utered$\'ralized\'"ly\'!s")w-fangled#%combe#$smen$%night$"om$$week!"fc!"go!!h',
+    '"!b#$bles"+ccol&ograve#%eness"#dal"%elson"%ggers$"le#)htingales%%shirt"!i"&jinsky"!k#"ko"$lsen',
+    '%&tenths&%hirty%$year$\'teenth-%\'y-eight\'#six"#ppy""rc"$sbet#%kanen##sen""ts!"o\'"+-man\'s-land"".2',
+    '"#dal#"ed#$ular""es")iselessly"&n-bank&#sic%&inding$*completion&(nformist\')tributory$,departmental$"ec&&onomic%&lected',
+    '%(xclusive$%fatal$*government$(literate%$ocal$&market%+etropolitan%\'ilitary$&native$(partisan%*erformance%)roductive\')fessional$&racial%(enewable',
+    '%\'ingular%#lip%&moking%&tarter$+threatening%+ransferable$\'western#(existent#\'smokers$#top"$odle#"ne#"ty"#rah#(mativist',
+    '#"sk#(thcliffe%\'ernmost"$stro"$tary#%ching"%ughts##rse"&vgorod!#rpb!$sdap"!e"!s"!w!#tsc',
+    '"*clear-free&"se"%ffink"$gget&!s""ln"$mbly#&erator"&neaton#&thorpe"!s"+tritionally)$ists!"va"#occ',
+    '"$lons"#nex \'o\'brian"$dell"%hagan$"re"%keefe"$mara"$neal!&-level\'!s!!2!#aps"!t!\'bdurate',
+    '$(ts_d\'art"$last#)iterating"#oes"(sequious$\'rvances\'&tories#*tetricians!!c")casioning#%luded"&hirbat"!u##lar!&ddball',
+    '#$s-on"$essa"$inga"%onata!)fahengaue")f-balance$&centre$&season$%white#\'ensives#&icious#$load#!s$%hoots#\'worlder',
+    '!!g""re!\'il-rich##ing!&kinawa!.ld-established#&enburg"#eic"#igo!(melettes"!g!%n-off#\'the-job"%board"&cology',
+    '$%night$%woman$(year-old"!s"#tos!%onagh""oh"#zes!\'p._cit.""el#%nshaw#*rationally")hiacantha"%iates##ned',
+    '")penheimer#)ortunists#$ress\'$ions"\'ted-out#&ically$&mising&&zation\'!e(!d!&racles#"ng%&-utans%!s#%torio',
+    '#(hestrate"\'derlies\'$ness"%egano"%gasms"\'ientate#\'mulsion",l&eacute;ans"%merod"&nately#+ithologists"%ogeny"\'pington"#son")thography',
+    '!,scar-winning"%hkosh"#kar"$prey")tentation#"ia#&racism"#win!\'ttomans!$uija"$lton")t-and-out$)migration$(of-court\'$work',
+    '##bid#"do#&hwaite#$last$#ive#*manoeuvred#%paced$&erform##ram$"un#&strips#&witted!$vals"&er-all%\'excited',
+    '+"on$\'arching$(capacity$%doses$%flows$\'hearing$$lain%\'ordship$$much$*production$$rode$)shadowing%$tate&%epped$\'wrought',
+    '!$wers!(xidative$$ised"$leas"!o!%yston!.zone-depleting )p&ouml;hl!!\'!"/e!"24!#450!!=!&a-risc""ba',
+    '#$kers$#man##tus#!y"%ddler#%locks"\'geantry$!r"!h"#ice#&nterly#%rings".laeontologists$&tinate#"es',
+    '$$ttes#$lium#"me#%pably$(itations#$umbo"$mpas"\'ndering#$mure#$oply"\'perless%&weight#$rika#%worth"&rabola',
+    '$$llax%$ytic$&normal$\'phrases%+rofessional#$dons#\'enteral&%hesis#%ities#$kway#&lement%!r#\'menides#$nell#$odic',
+    '##sed%!s$$heen##tei$+henogenesis$$ying""sk#$ties$(oralists")ternoster#%hogen#$rice%&lineal%$stic#%tered',
+    '$!y"#uls"!v"$wing##sey"#yed$!e#$load#\'masters!\'c-based##nfs"!i"!l"$mcia"!t',
+    '%\'keepers%%maker"\'ckinpah"%ddled"(er-group%\'to-peer$$ages"%gging"$irce"*largoniums#(oponnese#$ting"(nalising##dle#(etrative',
+    '#$ises$%tence\'$tial##man##ney#\'tateuch$$iums$"os##ury"#ony"*rceptively\'#ron$%hance%"es$&ussive',
+    '#(iodicity##ked#$ming#(petuates#$rett#%shing%#ore$$onae\'#ges$*uasiveness#$tain\'!s$(urbation""sc#$etas',
+    '#"to"\'thidine##rel&!s$"ie#$ting%"tt#&ulance!"ff"!i!)halangist$#lus#&rmacia#&se-out$"or',
+    '%%types"!i##lby$&lipson$(ological"%obias##nic$&ograph#%sphor#\'togenic%%lysis"(ylloxera#)siologist,!s!%icard',
+    '$$eted#$tish$"on"$dgin"$eper"$glet##sty#%tails"!k#"es"$lade#&chards#$lbox$#ion$%oried',
+    '"#mps"\'n-point#%afore$$tubo#$cers$#hes#&g-pong##ing##ner#(pointing#$sent"$pers"$quet"%ranha$#ted',
+    '#&todrie#$ying"$vots"!w"$xies!!j!"l.")ace-names#$iner%$song#%nking$(tagenets%$ings#\'sticity#(te-glass',
+    '$$oons#(y-acting$\'fulness$%thing%#ime"(eadingly$&santer%%ingly#"bs#!c"$iant"%onked&!r#$vers""s.',
+    '#%nkett!"ng!\'o-faced"\'cketing$\'lington"#dgy"#kes#!y"$lgar#)icymakers$*ticization#%l-tax#%onium\'!s$!s',
+    '#&ygonal%#ram%%ynous$\'morphic""ng#$ting#%ytail""ok#!p"#pov##pet$&lewell#&ulaire&%rised"%raway',
+    '#+t-au-prince$%ables%"ge$#ent"!s#"it#)sessively*$ness$"um#)t-glacial%*retirement\'+volutionary%#tax$$_hoc$#ern',
+    '$$mark%"en$$ural"\'ttering"\'weropen##ick""xy!"ps!%ranks##sad"&e-1914$)condition$)eminently&%pting$&heated',
+    '$)operative$*production\'\'grammed$*retirement#(arranged##cis#%dated$)ominating##ece$$ning#%fects\'#ure#&heated#$miss#(ndergast',
+    '#)positions#,registration#%saged$%s-ups%)ure-group#\'treated##vin#$ying"\'ickling%!s#(estesses#!g#%makov#(ncipessa$%touts',
+    '$&ritise("ze#&scilla$#ing$"ms#&vation)!s#(ze-money".o-independence$\'western#!b#&consul#"f.$%esses$(iteering',
+    '$&enitor%\'sterone$(rammatic%\'essions)#ves##log#\'metheus$!o#\'nominal$*unciations#*pagandists$(ensities%%rtied\'(y-owning$$hesy',
+    '$*rietorship#$tege#)visioning&"os#$xies%$mate"!t!"ss"!v"+ychoanalyst-!s&\'dynamic&)pathology&&tropic!$thrp',
+    '!.ublic-spirited&#ist"$eblo"!g#"in")mblechook#&melled#%pkins"\'nchline$%tuate##dit"+pil-teacher"%rbeck#"dy#$nell',
+    '"(shchairs$$over"%ttnam!$ybus"\'gmalion$#ies$!y""le"%nchon"\'ramidal")thagorean \'q&amp;a!%.b.d.!!p!!u',
+    '#$iled$$ntly#$king##ngo$$tock#*rtermaster##tro$!t#$vers"%echua#%nched#$rida$%ulous#%sting"\'icksand',
+    '#-ntessentially#"to#%xotic#$zzes"!o $r.a.""b."!e"$s.c.!$3000!*a&uacute;l"%bbani"%cquet"%dians$"ce',
+    '$(onuclide##ley##nor#$ovan"#gga#$time"$imes#$nald$%coats$%storm#*son_d\'etre&(n&eacute""ja$%sthan#!i',
+    '"*m&oacute;n#!a#&blings##eau#"iz##sar$"es"%nches#\'domized##kin$#led#$tzen"#per##ier"$ring',
+    '#$hers#&mussen##ter"*te-capping$%payer#&ifying#&siraka##tan$\'lesnake""ul#)schenberg""vi"&ytheon"$zors!"bl',
+    '!*e-arranged#)education$\'ntering#(training#\'written"(activate#%dying#*ffirmation#)lignments%%zable#(ppearing%"ly#+rrangements$!s#\'ssemble',
+    '"\'belling#"ut%#ted")ceptivity##har&&geable(!d\'#ing#&lusive#*onditioned%\'stitute+#ion%$vene#&umbent$&perate',
+    '$%rsive"+d-and-white$&figure$&handed$&rimmed#&bridge$#urn#&dening#(ecorated)#ing$&mptive#$hill##ken#&oubled#\'rafting',
+    '&!n$%essed#%skins"#edy"\'filling$%tting#(lexivity&%ology#&ormism("ts&%ulate+!d#&racted\'#ion%%ining',
+    '")generated##ius##nal#$roup\'"ed#)urgitated"\'housing"*investment#\'terates"(jections#%oices"$laid$%psing$\'tedness#%egate',
+    '#(iniscing#(unerated"%ndell##ege$&wables#)frewshire#"in#$shaw#&t-free"%opens#,rganisations($zing""p.#&airers$$rtee',
+    '#\'eatable#%hrase#(laceable%$nted$)enishment$&icator#&ortage$%ssess#\'ressing$$ints%"se$\'oachful%&cessed%*ducibility%"of',
+    '#(ublished$&gnance$&rchase"&script#(election$#nts$%ttled#%onate$+urcefulness#\'pirator#)taurateur,!s#&urgent$\'scitate"!t',
+    '$"rd#&elling#&iculum#$orts#&racing&%table%"in$\'ibutive$!o"&usable"*valuations#(erberate*#ing+#ons%&ential',
+    '$*talisation("ze$&valist#+olutionized"%wrote!*h&ocirc;ne+(-poulenc"\'eumatic"&uddlan!%ialto"$bald#$bing"%ddell"\'ff-raff$!s',
+    '"&ghting#$ueur"$mini##med"&nglets"#oja##ted"%pened"(sborough#"er%!s#$ings#$kier"(tualised#"zy',
+    '!"mc!&oadmap#!n"#bed$"r\'#\'in-anne#!s#%ustly"%camar#"co#%hford#"ke%$ting$#ies%"n\'',
+    '"#jas"%kkaku"*le-playing$!x#%l-out&#ver%"up$*er-coaster$&icking%!n""m.#$aine"&of-top#!s"(quelaure',
+    '$%nbaum&$loom#%lavl\'#$slyn#$tock"&thesay$"ko#!s##und"&ughest%$shod#,nd-the-world%#els&!r\'!s',
+    '"$well$!r#"se!"rp!$uari"%bella"%dakov#"ge"&ffling"(g-making"%mania#$bles#&inants#%midge##pus',
+    '$"le#"es##off#&s=0:10"$slan##sel&"ls"$thie%!n!"vf!&wandan!#yle"#man #s\'s!"-r',
+    '""e."!i!$aarc"(botaging"$chet%&verell#&kville#!p##ral$$isty"#dcc#&ducees"*fe-keeping$!s"#gas',
+    '"&ilings#"nz"\'lacious$"ko$&mander*!s"#mba#!i"$ncha##die#"t\'#"yo"\'pphires"%rcoma#$dine',
+    '##kia".ty&amacr;graha$!r"(underson$&tering#(t&eacute""va$#nna"#wed#$mill")xophonist"#yer!"bs!\'cabbard$#ies',
+    '%!i#(ndalised%(inavians#$rcer$!p#&venger"&enting"$hed.#%izoid#%nabel#*oolfriends&%house&$work#$ultz$"tz',
+    '#"af#"on$#rto"&otsmen$"ts#&undrel"!p"$rawl##ope$#tum#$ubby$&tinize%#ton""se"&uffles',
+    '#%llion%!y"%ythes!#dpj""rs!(ea-birds$%trout#%borne$$rook#!c#&farers&#ing$#ord&"th#\'manship',
+    '$&lessly#!r$\'chingly#$sick%$ders")cond-best\'\'century\'*generation&#ees&%ments#+ularisation)!t"#dan$#ted%$ives',
+    '#"ge#$ucer%&tively"%e-saw#$bohm#%dling#$page$!s#"rs"\'gregate"&lassie##den#*f-absorbed&\'dvocacy%+deprecating',
+    '&&isgust%+examination%*fulfilment%+improvement%,perpetuating&(oisoning&)rotection%&report\'\'straint%\'seeking&$tudy%%worth$%ishly#"im#$l-by',
+    '#%vedge"+mi-darkness%)finalists%)permanent%\'skimmed&)tructured$(circular$&naries$$tone"&nd-off$#ers##eca#\'tential$$ient")pticaemia',
+    '"/quence-specific%&stered"\'rengeti#%ially#*oconverted$(positive#!u"%ssile"&t-back$#off$#ups#$ters"-ven-year-olds%(ty-eight(#one',
+    '(%three$%rally%#est%"in"%xiest$"ng!"fo!*gs-thomson!%h.ct."%affer#%gging#$ikhs#&ke-out%(spearian#\'mefully',
+    '$#kly#)pechanger$(oshnikov##ria$&p-eyed%$ener#!s##tov$$ters#%vante"$e/he#$ared%#son#"ba#&erness',
+    '$&bourne$#ton$"ve#(nanigans#$pton##rds$$gold"#ias##ite#"ll##mon#"ts$$ting#$very"%ocker',
+    '$#ter#*rt-termism\'#ime%%bread%%lived%\'sighted#$tton#,ulder-length#&velled#&wer/wc$&ground$\'jumping"\'redding#%illed$%mpton',
+    '$#vel"&udders#&t-down"%ylock!$iban")ckeningly"$dcup#%deley#)e-stepped$$step$\'tracked"$egel##nna##ves$#ing',
+    '%$less#%ibert##ner"&lencer#&icates#$lars$%iness#)marillion#(versmith"%menon#"la#%mered#%onova#$pkin$)le-minded',
+    '$$sons"*ne_qua_non$!w#\'fulness#*gle-celled\'&member()indedness\'$tier\'$user#-n_f&eacute;in"#oux"%porax$#tai"%stine"%tuate',
+    ',!s"&x-part"$zzle!%kater"*elmersdale#\'tchbook#$wers"%i-ing#"ds#%nning#&ppered#%ttles##vvy""ua$!s',
+    '"&ywards!\'lagging$!s#&vering$"ic%"ng%"sh$$onia"&eaford$"ze##igh"&inging$"ky##ppy$#way',
+    '#$pped##rne#$vaks"(uggishly#\'mbering!"ma#*llholdings"%elter"$iley"*oke-filled%$less%!y#\'uldered"!r"!s',
+    '"%udges#%ggler$$ness#$rfit"$ythe!&nagged##ith##red"&eakers#$ezed##gur"%iffer%!y#$pped"$odin',
+    '##oty##red$"ts#&tlings#\'w-white$$fall"!r"\'uffling!&oapbox"&briety"2ci&eacute;t&eacute$&aliste\'"te\'$zing$*ologically',
+    '%!y""ed"%ftest"$hail"(ldiering#\'icitude#%stice"&mbrely##ers&&aulted*!s"#nja##tag#"ya"%on-yi',
+    '#&orific"!r##bie#&ceress#$ghum#"os""to"%uffle#+l-searching$#ful#%rcing##ter$(heastern&$rner%#sea',
+    '"#wed!"p1"&angled#&rcbook%&server#!s#,tio-temporal$#ula"&ecfp92$\'ializes$$tres$&ulates&"um#)echreader$#der',
+    '#$ller#$rber$"ms#!w$#ing#%yside"!f"%idery#"el$"rs#&llages#&n-offs$%eless"(lendours#$ints',
+    '#%utter"(ongiform&"ng#&onfuls%#ing#*rtsmanship#\'tlessly#%uting"%rayer#)ingfields%%klers$"te"!s#!s"#urn',
+    '%!s#$tnik!\'quander(#ing$%shing$$wked#$eals$&lching##igs!\'rinagar""os"!u!"sa#"ps"!h',
+    '"!l!&t\'lyan")abilisers$&leford&$mate%#ing#%ggers$$nate#)keholders$"is#\'linvast#\'mmering#*ndardising$&sfield#$rchy',
+    '$#tup#&teless$&ioning$\'utorily",eel-maitland%!s#&inholz#&nhouse#)pdaughter$"pe%)ing-stone#$rnum"!g"!i##les',
+    '#(mulatory#)pulations"#oat#&ckdale%&piling#&ddards#&ically%#ism##kle#%lidly$$ypin#"ma$#ped%#ing#\'nemason',
+    '#%p-gap$$cock$%watch#)ry-teller"$rabo$%ddles$$ggle$,ight-forward(!s#&eatley$"ep$%icher$(ptomycin#&ippers%%tease',
+    '#&omness$)ng-willed%#say#+ucturalists)$tion$&gglers")ultifying#%mbles$"py#%rgeon$!t#\'ttering"#yal#&lishly&"ts',
+    '$)divisions$#let$%units#&altern$"ru#\'classes%$oned$)ommittees%(ntracted$\'ultural%)taneously#&divide#"ic#+jectivities$&ugated',
+    '#&matrix$$erge#%poena#&script$$ides&%izing$&pecies$&tratum#$text$\'ropical#\'verting"$ckle&!r")ffragette"%gared',
+    '#)gestively"&kenick"&lawesi##ked$#ily#&phides#$tans""mo"\'n-dried#%bathe$#eam%!d#%dance$$erby##ley',
+    '##pro#&screen##unu"\'per-ego&,middleweight&$sara%#car%&family&(iciality%#gun%&impose&)ntendents%\'natants%%sedes%%vises',
+    '$(ositions$&resses"#rer$$ties#&passes\'#ing#(realists%%nders$$idge"!s#-ceptibilities"%ttons#$ures""va!"w3',
+    '$!s#&ggered#%inson#"le#%mping%!y#$nson#"rd$!f#*shbuckling",eet-smelling%&hearts%%meats#%rving"%ifter',
+    '#"ll#$shed""od##ops#$pped#!t!\'yllabub")mbolising\'$zing#$onds"$nods#(tagmatic$\'hesiser("ze"$phon',
+    ' $t\'ai!%.l.r.!!4!$a-ta"0ble_d\'h&ocirc;te",chistoscopic#$itus"$fari"#ggy"$hiti"%iling$%plane"#jik"(ke-overs$-n-for-granted',
+    '"&labani#!b##cum#$linn$"ow#%yllyn"$mara#"my"&nkards"\'oiseach#%rmina#!s"+pe-recorded%%slide$"rs',
+    '"#rdy#"ry##tar"!s#&manian""ta$"rs##ham#"ra##ung"%verna$"tt"$well"$xied!&eabags',
+    '$%fully"*chnicolour%\'ologist"$dder$#ies#!s"\'e-shirt#%tered"#ifi"\'ktronix"(lefonica$%photo#$lers$#in\'&#gly',
+    '"-mperamentally%&stuous$)oralities("ly$%tress"%n-day#"by#"on#$sely%!s#*th-century"%rmite#)rifically&&yingly"!s',
+    '#\'ticular%&monies%!s"%tbury##chy#*rachloride"!x#(as-based#"el#%tural!$fiia$!f!#gat!%hales#"ne',
+    '%#you#&tching#$wing"%eater#(irselves$#sts##med#&odoric&#sia$)logically$$rems#!r#%sauri#&uderic")ink-tanks',
+    '&&person&$year$-teen-year-old""o\'#$reau$(neycroft%$hill$)oughfares$&stvedt#+ughtfulness\'&lessly"$race#)ee-legged&%match\'%inute',
+    '&%times%%penny%$some##ice$#fts#&ottled$$w-in"#uc.#%mbing$"ps"&waites!\'ibetans"$e-up##red"!g',
+    '#*ht-fitting%#est#$ress"$khon"+lberthwaite#$lich%"ng#"ts")me-series#%idity"%nfoil#!g#$kled&!r"%p-toe',
+    '#$pett#"ss"#ree$!s#$pitz"%ssier")tillating#"re%!s"&verton"$zard!$obin"$days"\'lerably&$ting',
+    '$!n##boy#!s"#nks"%oling$#set"\'p-heavy$,of-the-range$\'quality#$side"$raja#&mentor)!s#%oidal#&pedoed',
+    '#"us#$yism"%shack##ses"(talizing##nes##ter&$idge"\'wcester"(xicology"%ynbee!\'rackbed%"er\'!s$%table',
+    '#\'itorous##jan#\'mpoline#(nquility$)s-pennine&(siberian%#act&"rc%&ducers($tion%(formants%\'gressed%(membrane%(planting&#ose',
+    '%%world#$peze$#per#(umatised#$vail$%erses#%wlers%#ing#$ynor"\'eatable#%etops#"ks#$loar#\'spasses#&tyakov',
+    '"+iangulation#%ckier%$ster$$ycle#!e$%nnial#$fles#"ll%#ing$%obite#"ng#%omphe#$pods#"st#(umvirate',
+    '$!s#\'lleybus*"es#&ndheim##pez$"ic#\'tskyist#\'ubadour$$nced##yes"\'umpeter#$sses#)thfulness!)shisekedi!&ubifex',
+    '"%lloch"!m#%blers"%neful"$ples#\'perware"$reen##gut##ing#%koman#$nham$$ings$&stiles""sk#$saud',
+    '"%eaked%#ing#!e#*nty-second\'%third\'(year-old"#ill##ned$#ing$#ned#$tchy"#o\'s#(-bedroom$#man%#ile',
+    '%(lus-four$&stroke$$tone!!y"%ndall"$phus#*ifications#(ographic$&logies \'u-boats!#/pb!\'biquity!#cas"!r!$dder',
+    '!&gliest!#hum!#itf!$kaea!#lan"\'sterman")tramarine!#mar"#ber##ria""no!+n-sponsored")alterable#(ppealing%)roachable',
+    '"\'beknown$\'lieving#%idden#$lock#$ound#)ridgeable"&capped#&laimed#(ompleted&+rehendingly$*ntaminated%&verted$(rrelated$$vers#&rossed',
+    '$"r-%%belly%(currents\'%tting%*employment%%lease%)nourished%$pass&%riced%%sized&&taffed("te%&weight&#ing$\'serving',
+    '&&rmined#!p#(ulations"&earned%"th$#ten#)mployable#&qually#%rring("ly#\'venness#*xceptional$&ploded"+familiarity#(linching',
+    '"(generous#(lamorous#$odly",hesitatingly#%inged#\'ygienic",identifiable$*irectional#*mpeachable#*nhabitable$%sured#)onization\'"ed#!p$#art',
+    '#$ties"+justifiably"%lined"(mediated$)ntionable#$ixed"+predictably%*possessing$$ofor#\'unished"-questioningly$$oted"-realistically\'#zed$+constructed',
+    '$&leased$&marked"&salted$(tisfying#%eated$&eingly$+lfconscious#%ocial#*pectacular#*uitability#)ystematic"&tidily#&utored!/p-to-the-minute"%ended',
+    '#&ooting"(standing#$wing"$town"\'welling!*rban-rural"!e##ase"!i#&nating""ry!$saaf#"id"&hering%!s',
+    '$!y!&terine"$ters"!v #v\'s!\'-shaped!$.4.2!"/v!"12!"ac#)cinations"#dim"&grancy"\'lentino$"ra',
+    '"$rdon#"na$%ishes#!s"!s#&ectomy!#dus!$egan#*etarianism"\'hicular"#lar"&ndelin#&erated#(tilators$)riloquist',
+    '#"ne%!y#%onese#$sace##tex"\'sicular#"ta$%igial"&xation!\'ibrator"(ctimized"(deotaped""la#%ified#+la-flotilla',
+    '\'!y""my"&ncenzo#%elott#!o"$pers"$rago#&ulence"*scoelastic#%egrad#\'igothic$\'onaries$\'tations""to#%torio',
+    '#&idness"%yella!%lasov!(ocations"(ice-over#"gt"&lleyed&!s#$uble$\'ntarism"&rtices"$yeur!"r1""on!"s.',
+    '"&lgaris $w.h.!!2!%aaagh""co"#ddy"$fers"$ggle&!d&!r$#ons"(ist-high%!s#$ving"&kelate',
+    '$#ron#$ford#$kout#)l-mounted$#owa#&terkin$#her$#zed&!s"%nkers#$less#%stead#%tonly"%rding#$eing',
+    '##ing#$lock#)m-hearted#&ningly#!r$#ens#!t".shington-based#(te-paper"*tchfulness#)er-skiing%$lily\'"ne%(proofing%&skiing',
+    '#$tage$$ling"\'veforms"&xworks!"cm!\'eardale$#ers$#ied#$sels#\'therall\'$bury\'%proof"$bbed"(dderburn$)ing-dress',
+    '#$lock"#eps"%gener"(idenfeld#(ght-loss&$ings##rdo$!s#%smann"$lder#+l-appointed%&chosen%(deserved%\'groomed%%loved',
+    '%\'ordered%)preserved&)ublicised%)qualified%$used%\'written$#and$!y#%shmen#"ts"%mmick"%nlock"\'sterner$$gate"$tted',
+    '#&bridge!"fp!\'hacking#$lers##mmy#$tnot$\'sername"#eal#&edling$%lbase$#zed#&refore%"of$%nside#$ssoe',
+    '"!i##msy##nge#$rred#%sking$#ton#%tburn$$eley%#ned$#man""oo$#ped#%pping""ys!\'icksted',
+    '##get"$elds#!n$"er"%ggins#%htman"#lby#&d-eyed$&ebeest#$ekin$$nius$!y#%ikins##ley$$mott',
+    '"#mpy#$satt"%nched#&dfalls$$hoek$$less$%proof$$rush#%g-bar%$like%#tip$#ing#$kles#$nick#$slow',
+    '"&steria"%tless!(odehouse"*lstenholme"#nky")odborough$#cut$%forde$#ham$"ie$%leigh&!y%#ice$\'workers"-rd-processors',
+    '$\'sworths$!y#\'k-place%\'related$$aday$$fare$%loads$$mate$$outs$%space$$tops#!t$$hies!&racked#"gg',
+    '#%ngles#&ppings"%eaked#"ns#$sted"%igley#\'te-offs!!w!#yse"#tch *x-terminal!"86!)enophobic%"us!\'injiang',
+    '!#pg4!!t!!u!#xii )yachtsman\'"en#!s"#dav"%ngtze"%pping"(rdsticks""su"!w#"ns!"cs',
+    '"&omanry!(ggdrasil!#mor!#nys!"ob""re!"tp!&ucatan#!k"&letide"#mmy""ry (zaborski"$hedi"$idie',
+    '""ra$\'thustra#"ia!!e"$alot"#iss#$tung""ll""na#"da#"er!"hu!)idovudine"#ggy""mm',
+    '"$yang!$loty!&o&euml"(ologists!(urachina',
 )
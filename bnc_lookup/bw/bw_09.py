@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_09 = (
+count_09 = 6694
+
+heads_09 = (
     '&aacute;ngel',
-    '&bgr;-thromboglobulin',
-    '&ccedil;a',
-    '&commat',
-    '&deg;s',
-    '&dgr;h',
-    '&dgr;s',
-    '&dollar;1,000m',
-    '&dollar;1,200',
-    '&dollar;1,300',
-    '&dollar;1.1m',
-    '&dollar;1.2',
-    '&dollar;1.50',
-    '&dollar;12m',
-    '&dollar;13',
-    '&dollar;15m',
     '&dollar;16',
-    '&dollar;25m',
-    '&dollar;3,500',
-    '&dollar;3.5m',
-    '&dollar;350',
-    '&dollar;40,000',
-    '&dollar;60,000',
-    '&dollar;7,000',
-    '&dollar;70',
-    '&dollar;8,000',
-    '&dollar;8m',
-    '&dollar;9,000',
-    '&dollar;sup14',
-    '&formula;1',
-    '&frac14;in',
-    '&frac18',
     '&frac34;in',
-    '&mdash;a',
-    '&pound;1,000,000',
-    '&pound;1,250',
-    '&pound;1,400',
-    '&pound;1,600',
-    '&pound;1.7m',
-    '&pound;1.80',
-    '&pound;1.8m',
-    '&pound;11.99',
-    '&pound;135',
-    '&pound;135,000',
-    '&pound;13m',
-    '&pound;145',
-    '&pound;149',
-    '&pound;160,000',
     '&pound;165',
-    '&pound;16m',
-    '&pound;18.50',
-    '&pound;18.95',
-    '&pound;180,000',
-    '&pound;190',
-    '&pound;199',
-    '&pound;1million',
-    '&pound;2,400',
-    '&pound;2.1m',
-    '&pound;2.2m',
-    '&pound;2.3',
-    '&pound;2.3m',
-    '&pound;21,000',
-    '&pound;210',
-    '&pound;22,000',
     '&pound;24,000',
-    '&pound;24.95',
-    '&pound;260',
-    '&pound;27,000',
-    '&pound;28,000',
-    '&pound;280',
-    '&pound;2bn',
-    '&pound;31',
-    '&pound;32,000',
-    '&pound;34',
-    '&pound;340',
-    '&pound;35m',
-    '&pound;360',
-    '&pound;375',
-    '&pound;39.95',
-    '&pound;395',
     '&pound;4,500',
-    '&pound;4.5m',
-    '&pound;42',
-    '&pound;420',
-    '&pound;475',
-    '&pound;49.99',
-    '&pound;5.5m',
-    '&pound;53',
-    '&pound;54',
-    '&pound;56',
-    '&pound;6.5m',
-    '&pound;60m',
-    '&pound;65,000',
-    '&pound;650,000',
-    '&pound;66',
-    '&pound;7.25',
     '&pound;70m',
-    '&pound;8,500',
-    '&pound;8.50',
-    '&pound;85,000',
-    '&pound;89',
-    '&pound;950',
-    '&pound;9m',
-    '&sup2',
-    '\'\'',
-    '\'30s',
-    '\'and',
-    '\'ard',
-    '\'aving',
-    '\'bout',
-    '\'ear',
-    '\'keeper',
     '\'n',
-    '\'phone',
-    '-&agr',
-    '-4',
-    '-g',
-    '-ing',
-    '-row',
-    '.3',
-    '0&ndash;4',
-    '0&ndash;60mph',
-    '0.02',
-    '0.05%',
-    '0.15',
-    '0.6%',
-    '00:18',
-    '00:22',
     '0839',
-    '0865',
-    '0900',
-    '1,2',
-    '1-3',
-    '1.1%',
-    '1.10',
-    '1.3%',
-    '1.4%',
-    '1.45',
-    '1.5cm',
-    '1.8m',
-    '1/11/93',
-    '1/4',
-    '10&deg;c',
-    '10&ft',
     '10(1)',
-    '10-15',
-    '10-minute',
-    '10.',
-    '10.0',
-    '10.45',
-    '10.9',
-    '1001',
-    '100k',
-    '100ml',
-    '100p',
-    '100pc',
-    '1018',
-    '1023',
-    '1027',
-    '1030',
     '1050',
-    '1093',
-    '1099',
-    '10baset',
-    '11-year',
-    '1120',
-    '1130',
-    '1152',
-    '1154',
-    '1184',
-    '1199',
-    '12&ndash;14',
-    '12,500',
-    '12-14',
-    '12-member',
-    '12.8',
     '12.9',
-    '1204',
-    '1254',
-    '1264',
-    '1265',
-    '1275',
-    '1279',
-    '1282',
-    '1285',
-    '1296',
-    '12c',
-    '12mm',
-    '12s',
-    '13&ndash;14',
-    '13.7',
-    '13.8',
     '13.9',
-    '1313',
-    '1314',
-    '1316',
-    '1317',
-    '1326',
-    '1334',
-    '1341',
-    '1369',
-    '1370s',
-    '1380',
-    '13s.',
-    '14-day',
-    '14-year',
-    '14-year-olds',
-    '14.4',
     '14.6',
-    '14.8',
-    '1473',
-    '1474',
-    '1484',
-    '1485',
-    '14c',
-    '15&ndash;16',
-    '15(1)',
-    '15-17',
-    '15-member',
-    '15.3',
-    '15.6',
-    '15.7',
-    '150g',
-    '150mhz',
     '150ml/&frac14',
-    '1513',
-    '1515',
-    '1520s',
-    '1525',
-    '1530s',
-    '1533',
-    '1538',
-    '1540s',
-    '1541',
-    '1557',
-    '1563',
-    '1564',
-    '1566',
-    '1570',
-    '1575',
     '1582',
-    '1583',
-    '1584',
-    '1585',
-    '1586',
-    '1587',
-    '1590',
-    '1592',
-    '1594',
-    '1599',
-    '15m',
-    '15mm',
-    '16&ndash;1',
-    '16-19',
-    '16.3',
-    '16.6',
     '1600&ndash;1840',
-    '1606',
-    '1615',
-    '1622',
-    '1636',
-    '1639',
-    '1671',
-    '16c',
-    '17&ins',
-    '17-18',
-    '17.1',
-    '17.2',
-    '17.4',
-    '17.8',
-    '1733',
-    '175g/6oz',
     '17p',
-    '18&ndash;19',
-    '18.3',
-    '18.30',
-    '18.5',
-    '180c/350f/gas',
-    '19-20',
-    '19.1',
-    '19.5',
-    '1950\'s',
-    '1976b',
-    '1978&ndash;79',
-    '1978&ndash;9',
-    '1978-79',
-    '1979/80',
-    '1980b',
     '1982&ndash;3',
-    '1984&ndash;85',
-    '1985&ndash;86',
-    '1987-88',
-    '1988&ndash;9',
-    '1990&ndash;1',
-    '1990.',
-    '1990b',
-    '1991a',
-    '1992/3',
-    '1994/95',
-    '19p',
-    '1d',
-    '1hr',
-    '1pc',
-    '2,100',
     '2-4',
-    '2-year',
-    '2.1.1',
-    '2.1.2',
-    '2.14',
-    '2.20',
-    '2.3%',
-    '2.45',
-    '2.6%',
-    '2.75',
-    '2.8%',
-    '2/11/93',
-    '20-21',
-    '20.2',
-    '200-mile',
-    '2002',
     '200c/400f/gas',
-    '200g',
-    '200th',
-    '201&ndash;995',
-    '2011',
-    '21-22',
-    '21.4',
-    '21.5',
-    '21.6',
-    '21/10/93',
-    '220,000',
-    '2300',
-    '24-25',
-    '24.7',
-    '25-26',
-    '25-yard',
     '256mb',
-    '260,000',
-    '2600',
-    '27-28',
-    '28-29',
-    '29,000',
-    '29-30',
-    '2bp',
-    '2cm',
-    '2x12',
-    '3&ft',
-    '3(4)',
-    '3+',
-    '3-3',
-    '3.18',
-    '3.19',
     '3.4%',
-    '3.6%',
-    '3.7%',
-    '3/e',
-    '30-day',
-    '30000',
-    '30mph',
-    '31,000',
-    '311',
-    '319',
-    '34th',
-    '358',
-    '360&deg',
-    '3600',
-    '36mhz',
-    '37th',
     '383',
-    '389',
-    '399',
-    '39th',
-    '3:1',
-    '3cm',
-    '3s.',
-    '4.12',
-    '4.2%',
-    '4.7%',
-    '4.8%',
-    '40-year',
-    '40ft',
-    '40pc',
-    '41-year-old',
-    '417',
     '419',
-    '41st',
-    '421',
-    '422',
-    '424',
-    '4300',
-    '438',
-    '441',
-    '443',
-    '446',
-    '447',
-    '448',
-    '450,000',
-    '453',
-    '455',
-    '458',
     '459',
-    '45mhz',
-    '462',
-    '467',
-    '46th',
-    '471',
-    '472',
-    '474',
-    '479',
-    '48-hour',
-    '48-year-old',
-    '498',
-    '499',
-    '49ers',
-    '4ad',
-    '5&deg;c',
     '5&frac12',
-    '5&ins',
-    '5&ndash;3',
-    '5&ndash;4',
-    '5&ndash;8',
-    '5&ndash;9',
-    '5(2)',
-    '5,000,000',
-    '5-year',
-    '5.1%',
-    '5.25',
-    '5.3.1',
-    '5.3.2',
-    '500m',
-    '507',
-    '512mb',
     '51st',
-    '522',
-    '529',
-    '531',
-    '534',
-    '536',
-    '53rd',
-    '545',
-    '549',
-    '5500',
-    '561',
-    '562',
-    '567',
-    '57,000',
-    '575',
-    '576',
     '57th',
-    '581',
-    '586',
-    '587',
-    '5pc',
-    '6&ndash;10',
-    '6-0',
-    '60&deg',
-    '60\'s',
-    '602',
-    '610',
-    '629',
-    '634',
-    '638',
-    '642',
-    '647',
     '649',
-    '64th',
-    '65&deg;c',
-    '655',
-    '662',
-    '667',
-    '673',
-    '675',
-    '68040',
-    '687',
-    '688',
-    '690',
-    '7&ndash;0',
-    '7&ndash;9',
-    '7-8',
-    '7.10',
     '7.2.2',
-    '7.30am',
-    '7.45pm',
-    '708',
-    '70mph',
-    '70p',
-    '710',
-    '725',
-    '731',
-    '741',
-    '754',
-    '75mm',
-    '767',
-    '770',
-    '777',
-    '795',
     '796',
-    '7a',
-    '8&ndash;12',
-    '8(1)',
-    '8-1',
-    '8.10',
-    '8.30am',
-    '801',
-    '806',
-    '80p',
-    '825',
-    '837',
-    '839',
-    '8a',
-    '9&ndash;12',
-    '9&ndash;3',
     '9&ndash;5',
-    '9&ndash;6',
-    '9.45',
-    '90p',
-    '91%',
-    '923',
-    '928',
-    '930',
-    '940',
-    '960',
-    '96345',
-    '980',
-    '987',
-    '9lb',
-    '9mm',
-    'a-',
     'a-z',
-    'a12',
-    'a34',
-    'a40',
-    'a55',
-    'a6',
-    'a71',
-    'a9',
-    'a_fortiori',
-    'aarau',
-    'abb',
-    'abbado',
-    'abbotsfield',
-    'abbs',
-    'abduct',
-    'aberfeldy',
     'abn',
-    'abolishes',
-    'aboody',
-    'aboriginals',
-    'abounding',
-    'about-turn',
-    'abram',
-    'abrasions',
-    'abridgement',
-    'abrogation',
-    'abruptness',
-    'absconding',
-    'abse',
-    'absentmindedly',
-    'abuelo',
-    'acad&eacute;mie',
     'academician',
-    'acapulco',
-    'accentuating',
-    'acceptably',
-    'acclimatise',
-    'acclimatised',
-    'accolades',
-    'accordance',
-    'accursed',
-    'accustom',
-    'achille',
-    'achnacarry',
-    'ackerley',
-    'acolytes',
-    'acquiescent',
-    'acrobat',
     'acted-upon',
-    'actualized',
-    'ad_nauseam',
-    'adamec',
-    'adamus',
-    'adapters',
-    'adaption',
-    'add-ons',
-    'adders',
-    'addled',
-    'adducts',
-    'adenovirus',
-    'adheres',
-    'adie',
-    'adieu',
-    'adj',
     'adjudicated',
-    'adjudicating',
-    'adjudicative',
-    'adley',
-    'adlib',
-    'adminstration',
-    'adrar',
-    'adroit',
-    'aegina',
-    'aeneid',
-    'aerobically',
-    'aff',
-    'affability',
-    'affirmations',
-    'african-american',
-    'afro-caribbeans',
     'agamemnon',
-    'agen',
-    'agg',
-    'agglomeration',
-    'agitate',
-    'agitatedly',
-    'agitations',
-    'agitator',
-    'agnese',
-    'agnosticism',
-    'agonisingly',
-    'agoraphobia',
-    'agribusiness',
-    'ague',
-    'ahn',
-    'aida',
     'aideed',
-    'aiken',
-    'ailerons',
-    'airey',
-    'aj',
-    'akhenaten',
-    'al-makesh',
-    'alam',
-    'alaric',
-    'alatas',
-    'albini',
-    'albuquerque',
-    'alcester',
-    'alchemilla',
-    'alchemists',
-    'alcohols',
     'alcoves',
-    'alders',
-    'algerians',
-    'alkaloids',
-    'alkyd',
-    'alkyl',
-    'all-black',
-    'all-consuming',
-    'all-female',
-    'all-inclusive',
-    'all-india',
-    'all-new',
-    'all-russian',
-    'all-seater',
-    'all-ticket',
-    'allegheny',
     'allegretto',
-    'alligators',
-    'allon',
-    'allrounder',
-    'allsop',
-    'allusive',
-    'allyah',
-    'almanac',
-    'almeida',
-    'almshouses',
-    'als',
-    'alu',
-    'alvaro',
-    'alves',
-    'alyn',
-    'alyson',
     'ama',
-    'amadou',
-    'amalgamating',
-    'amantani',
-    'ambitiously',
-    'ambling',
-    'amerindian',
-    'amira',
-    'amity',
-    'amniotic',
-    'amor',
-    'amoxicillin',
-    'amulets',
-    'amyloidosis',
-    'an\'_all',
-    'anagram',
     'analogical',
-    'anatomically',
-    'anatomist',
-    'anaxagoras',
-    'anaximenes',
-    'andhra',
-    'andres',
-    'andretti',
-    'andromeda',
-    'angiosperms',
-    'anglaise',
-    'angleby',
-    'anglophone',
-    'angora',
-    'anguilla',
-    'animatedly',
     'aniseed',
-    'ankle-deep',
-    'annales',
-    'anneliese',
-    'annexes',
-    'annihilating',
-    'annoyingly',
-    'annul',
-    'annunciata',
-    'anode',
-    'anorexics',
-    'anova',
-    'anpetuwi',
-    'ans',
-    'anscombe',
-    'ant&oacute;nio',
     'antares',
-    'anteroom',
-    'anthracite',
-    'anthropic',
-    'anti-british',
-    'anti-cancer',
-    'anti-communism',
-    'anti-depressants',
-    'anti-dumping',
-    'anti-establishment',
-    'anti-jewish',
-    'anti-lactoferrin',
-    'anti-monopoly',
-    'anti-nazi',
-    'anti-rex',
-    'anti-sexist',
     'anti-socialist',
-    'anti-union',
-    'anti-us',
-    'antigenic',
-    'antihypertensive',
-    'antimony',
-    'antipodean',
-    'antiracists',
-    'antisemitic',
-    'ao',
-    'aol',
-    'aortic',
-    'apa',
-    'apennines',
-    'aphid',
-    'apo',
     'apologia',
-    'apparatchiks',
-    'appealingly',
-    'appel',
-    'appetizing',
-    'appin',
-    'apsley',
-    'aqueducts',
-    'arabesque',
-    'arap',
-    'ararat',
-    'arbitrate',
-    'arcading',
-    'arcady',
-    'arced',
-    'arch-rival',
     'archdiocese',
-    'archduke',
-    'archetypes',
-    'ardakke',
-    'argentinians',
-    'argol',
-    'aridity',
-    'arlene',
-    'arm\'s-length',
-    'armando',
-    'arnaud',
-    'arnica',
-    'arnulf',
-    'aronson',
-    'arpeggio',
-    'arraigned',
     'arrowhead',
-    'arrowheads',
-    'ars',
-    'arsenide',
-    'arsenio',
-    'artegall',
-    'artemisia',
-    'artichoke',
-    'artificers',
-    'artiste',
-    'artless',
-    'arturo',
-    'arum',
-    'ascertainable',
-    'ascribes',
-    'ascriptive',
     'asea',
-    'aseptic',
-    'ashbourne',
-    'ashraf',
-    'ashwell',
-    'asi',
-    'asik',
-    'asl',
-    'asmara',
-    'asprey',
-    'assignation',
-    'assurer',
-    'assyrian',
-    'asterisks',
-    'astrologers',
-    'asuryan',
     'asw',
-    'asws',
-    'asymmetries',
-    'ata\'i',
-    'atolls',
-    'atone',
-    'atrophied',
-    'attitudinist',
-    'au_fait',
-    'aube',
-    'auberge',
-    'auberon',
-    'auchinleck',
-    'auf',
-    'augmentations',
-    'augustin',
     'auk',
-    'austell',
-    'austral',
-    'authentication',
-    'autoantibodies',
-    'autocad',
-    'autodesk',
-    'autographed',
-    'autonomization',
-    'autopilot',
-    'avalon',
-    'avaricious',
-    'avebury',
-    'avenger',
-    'avengers',
-    'avenida',
     'averred',
-    'aversive',
-    'aviator',
-    'avium',
-    'avocados',
-    'avowedly',
-    'avro',
-    'awakenings',
-    'awb',
-    'axil',
-    'axl',
-    'ayliffe',
-    'azhag',
-    'azharuddin',
-    'azor',
-    'aztecs',
     'azul',
-    'b-cell',
-    'b-side',
-    'b.a.',
-    'b.sc',
-    'b3',
-    'baath',
-    'babar',
-    'babbage',
-    'babbled',
-    'babushka',
-    'baby-sitter',
-    'babyish',
-    'babyliss',
-    'bacall',
-    'bacci',
     'baccy',
-    'bachelard',
-    'back-breaking',
-    'backbenches',
-    'backhand',
-    'backpackers',
-    'backstreet',
-    'backward-looking',
-    'backwaters',
-    'baddie',
-    'badgering',
-    'badness',
-    'bafflement',
-    'baffles',
-    'baggley',
-    'bagshot',
     'baikal',
-    'baileys',
-    'bailiwick',
-    'bailment',
-    'bakatin',
-    'balaclavas',
-    'baled',
-    'balham',
-    'balked',
-    'balloted',
-    'balloting',
-    'bally',
-    'balsam',
-    'balvinder',
-    'bamako',
-    'bamhi',
     'banbury/oxfordshire',
-    'bandy',
-    'bangalore',
-    'banham',
-    'bannockburn',
-    'banns',
-    'banquo',
-    'bantamweight',
-    'baptisms',
-    'barbadian',
-    'barbarity',
-    'barbecued',
-    'barbiturates',
-    'barbuda',
-    'barce',
-    'barfield',
     'barnaby',
-    'barnacle',
-    'barnes/reporting',
-    'barnstaple',
-    'barnum',
-    'barny',
-    'barraclough',
-    'barracuda',
-    'barrenness',
-    'bartering',
-    'bartle',
-    'bartley',
-    'barwick',
-    'base-line',
-    'baseless',
-    'baselines',
     'basements',
-    'baser',
-    'bassey',
-    'bath-house',
-    'bath/shower',
-    'bathtime',
-    'bathurst',
-    'bathwater',
-    'batsford',
-    'battened',
-    'battery-operated',
-    'battery-powered',
-    'battleaxe',
-    'battledress',
-    'baudrillard',
-    'bauhaus',
     'bauwens',
-    'bawden',
-    'bayliss',
-    'bbfc',
-    'beador',
-    'beaumaris',
-    'beavering',
-    'beazer',
-    'becalmed',
-    'beckmann',
-    'bedcover',
-    'bedecked',
-    'bedhead',
-    'bedlington',
-    'bedu',
-    'bedwelty',
     'befitting',
-    'beggs',
-    'beheading',
-    'behoves',
-    'belial',
-    'belie',
-    'belligerents',
-    'bello',
-    'bellybutton',
-    'belov',
-    'belton',
-    'beluga',
-    'belugas',
-    'belushi',
-    'bendy',
-    'benji',
     'benz',
-    'berber',
-    'bergamot',
-    'berk',
-    'berkshire-based',
-    'berle',
-    'bernese',
-    'berri',
-    'berridge',
-    'beseeching',
-    'besetting',
-    'best-ever',
-    'bestows',
-    'bethel',
-    'bethesda',
-    'bett',
     'bettino',
-    'bevel',
-    'bevelled',
-    'bevy',
-    'bewdley',
-    'bi-annual',
-    'bianco',
-    'bibby',
-    'bibliometric',
-    'biblioth&egrave;que',
-    'bic',
-    'bicknell',
-    'biddle',
-    'big\'uns',
-    'big-money',
-    'big-name',
     'biggar',
-    'bigots',
-    'bigram',
-    'billericay',
-    'bimbos',
-    'bina',
-    'bingeing',
-    'binges',
-    'binks',
-    'biochemists',
-    'biofeedback',
-    'biogas',
-    'biomorph',
-    'birchall',
-    'bird-like',
-    'birdland',
     'birdlife',
-    'birdwatchers',
-    'birkin',
-    'birthrate',
-    'bisham',
-    'bispham',
-    'bitching',
-    'bitez',
-    'bittern',
-    'bitters',
-    'bla',
-    'black-figure',
-    'black-headed',
-    'blackcurrants',
-    'blackett',
-    'blacklisted',
     'blackouts',
-    'blackshirts',
-    'blackwells',
-    'blagden',
-    'blaize',
-    'blakemore',
-    'blamey',
-    'blanch',
-    'blandness',
-    'blaney',
-    'blas&eacute',
-    'bldsc',
-    'ble',
-    'bleat',
-    'bleeps',
-    'bleu',
     'blighter',
-    'blindside',
-    'blockley',
-    'bloodiest',
-    'bloods',
-    'bloody-minded',
-    'bloomers',
-    'bloomiehall',
-    'blowers',
-    'bloxwich',
-    'blurry',
-    'blurs',
-    'blustered',
-    'bmj',
-    'bmp-2',
-    'bnb',
     'bnd',
-    'bnl',
-    'bo\'ness',
-    'boas',
-    'boat-house',
-    'boater',
-    'bobbins',
-    'boca',
-    'bodenland',
-    'bodes',
-    'bodley',
-    'bodyline',
-    'boehringer',
-    'boeuf',
-    'bogeys',
-    'bogside',
     'bohm',
-    'bohunt',
-    'bolam',
-    'boldest',
-    'bolingbroke',
-    'bolland',
-    'bollard',
-    'bollinger',
-    'bolognese',
-    'bolshie',
-    'bolsters',
-    'bombardments',
-    'bomberg',
-    'bombie',
-    'bonefish',
-    'bong',
     'bonsor',
-    'bookbinder',
-    'bookstall',
-    'boomerang',
-    'boorish',
-    'borderlands',
-    'borja',
-    'bosigran',
-    'bott',
-    'bottlenose',
-    'bougainvillaea',
-    'bought-in',
-    'bourges',
-    'bournville',
-    'bourse',
-    'bourton',
     'bouton',
-    'bouverie',
-    'bowley',
-    'boy-friend',
-    'boyden',
-    'boyes',
-    'braddock',
-    'bradl',
-    'brag',
-    'bragging',
-    'braids',
-    'brailsford',
-    'brainstorm',
-    'brainwashing',
-    'brandies',
-    'brandreth',
     'brannen',
-    'brasenose',
-    'brasher',
-    'brasier',
-    'brasov',
-    'brawls',
-    'brawny',
-    'braying',
-    'brazauskas',
-    'brazenly',
-    'brdurd',
-    'bread-and-butter',
-    'breadwinners',
-    'break-clause',
-    'break-out',
-    'breastfeed',
     'breaststroke',
-    'breathtakingly',
-    'breathy',
-    'breccias',
-    'breech',
-    'breezed',
-    'bresslaw',
-    'breuer',
-    'bricked',
-    'bridewell',
-    'bridger',
-    'bridgetown',
-    'briefcases',
-    'brierley',
-    'brigands',
-    'brighouse',
     'brightens',
-    'brimmed',
-    'brind',
-    'brinkley',
-    'british-based',
-    'broadgreen',
-    'broadlands',
-    'broadman',
-    'broadwick',
-    'brocklehurst',
-    'broken-down',
-    'bromine',
-    'broomhead',
-    'brotton',
-    'browner',
-    'browser',
     'brs',
-    'brummie',
-    'brunch',
-    'brunton',
-    'brusilov',
-    'bruton',
-    'brynner',
-    'btg',
-    'buccaneers',
-    'budgies',
-    'buffering',
-    'buffets',
-    'buffoon',
-    'buggies',
-    'bugis',
-    'bugsy',
     'buildup',
-    'bulkheads',
-    'bull-running',
-    'bullen',
-    'bultmann',
-    'bund',
-    'bunnies',
-    'bunnymen',
-    'bunsen',
-    'burchill',
-    'bureaucratization',
-    'burgos',
-    'burlesque',
-    'burman',
-    'burne-jones',
-    'burp',
     'burridge',
-    'bushel',
-    'buskers',
-    'buss',
-    'bustard',
-    'busters',
-    'busying',
-    'busyness',
-    'buttercup',
-    'butterflyfish',
-    'buttering',
-    'buttock',
-    'buttonholes',
-    'buttoning',
-    'buyouts',
-    'bw',
     'by-passing',
-    'byatt',
-    'byelaw',
-    'byelorussian',
-    'byline',
-    'byng',
-    'byrnes',
-    'c&amp;a',
-    'c\'m',
-    'c\'mon',
-    'c.-in-c',
-    'c.e.',
-    'c.n.l.',
-    'c/ebp&dgr/nf-il6&bgr',
-    'c6',
-    'ca-unicenter',
     'cabal',
-    'cabby',
-    'cabriolet',
-    'cabx',
-    'cached',
-    'caci',
-    'cad/cam',
-    'caddy',
-    'cadw',
-    'cae',
-    'caedwalla',
-    'caerleon',
-    'caernarvon',
-    'caius',
-    'cala',
-    'calamities',
     'caldecott',
-    'calderdale',
-    'caleb',
-    'californians',
-    'call-out',
-    'callender',
-    'callously',
-    'callousness',
-    'calms',
-    'calorific',
-    'calton',
-    'calvados',
-    'calyx',
-    'camb',
-    'cambridge-based',
-    'camdessus',
     'camellias',
-    'campbell-savours',
-    'campbeltown',
-    'campesina',
-    'campfire',
-    'campsites',
-    'canavan',
-    'candied',
-    'candle-lit',
-    'canguilhem',
-    'canines',
-    'canna',
-    'cannigione',
-    'canongate',
-    'canopied',
-    'canova',
     'cantonal',
-    'canvassers',
-    'canyons',
-    'capella',
-    'capital-intensive',
-    'capitalization',
-    'capp',
-    'capper',
-    'caprice',
-    'capron',
-    'carabinieri',
-    'caravaggio',
-    'carbolic',
-    'carbons',
-    'carcinogen',
-    'cardholders',
     'cardiologist',
-    'cardiomyopathy',
-    'cardoso',
-    'cardwell',
-    'carewscourt',
-    'carex',
-    'carfax',
-    'carmelite',
-    'carolingians',
-    'carreras',
-    'carriageways',
-    'carrycot',
-    'carterton',
-    'carting',
-    'case-control',
-    'caseload',
     'cassio',
-    'cassock',
-    'castaway',
-    'castell',
-    'castellated',
-    'castlerock',
-    'castors',
-    'catacombs',
-    'catalyse',
-    'catapults',
-    'catchers',
-    'catechesis',
-    'catechist',
-    'catford',
-    'cathal',
-    'catheters',
     'cation',
-    'cationic',
-    'catkins',
-    'cattanach',
-    'catwalks',
-    'cauchy',
-    'cavers',
-    'caviare',
-    'cawdor',
-    'cay',
-    'cbot',
-    'cc:mail',
-    'ccd',
-    'cck-33',
-    'ccm',
-    'ccr',
     'ccs',
-    'cct',
-    'cellist',
-    'centered',
-    'centrale',
-    'centralist',
-    'centralizing',
-    'centre-piece',
-    'centre-stage',
-    'cerean',
-    'cerebellum',
-    'ceres',
-    'ceri',
-    'cerise',
-    'certifying',
-    'cet',
     'cfc-free',
-    'cfs',
-    'cgli',
-    'ch&acirc;teaux',
-    'ch&eacute;rie',
-    'ch\'a',
-    'chadian',
-    'chafe',
-    'chaffinch',
-    'chainsword',
-    'chaise',
-    'challengingly',
-    'chaman',
-    'chamberlin',
-    'chamomile',
-    'chamoun',
     'chancellorship',
-    'chantries',
-    'chao',
-    'chapelcross',
-    'chaperon',
-    'chaperone',
-    'chappell',
-    'chappy',
-    'characterizing',
-    'characterless',
-    'chardin',
-    'chargers',
-    'charitably',
-    'charivari',
-    'charterers',
-    'chasms',
     'chatam',
-    'chauffeurs',
-    'check-list',
-    'checkland',
-    'checkmate',
-    'cheesed',
-    'cheetham',
-    'chelonian',
-    'cheque-book',
-    'cheroot',
-    'cherubs',
-    'chesapeake',
-    'chesham',
-    'chesnais',
-    'chessboard',
-    'chet',
     'chetniks',
-    'cheviot',
-    'chevrolet',
-    'chid',
-    'chignell',
-    'childeric',
-    'childishness',
-    'childlessness',
-    'childminders',
-    'chine',
-    'chinks',
-    'chippie',
-    'chiropodist',
-    'chiropody',
-    'chiropractic',
-    'chirped',
     'chirwa',
-    'chislehurst',
-    'chittenden',
-    'chivers',
-    'chlamydia',
-    'choak',
-    'choc',
-    'cholangiography',
-    'cholecystitis',
-    'cholestasis',
-    'choonhaven',
-    'chordal',
-    'choristers',
-    'christen',
-    'christianson',
-    'christies',
     'christoph',
-    'chrysanthemum',
-    'chuan',
-    'chuff',
-    'chugged',
-    'chugging',
-    'chummy',
-    'church-going',
-    'churchgoers',
-    'ciao',
-    'cib',
-    'cicciolina',
-    'cie',
-    'cigs',
-    'cilia',
-    'cip',
     'ciprofloxacin',
-    'circadian',
-    'circlet',
-    'circulations',
-    'circumspection',
-    'cirrus',
-    'cissy',
-    'citb',
-    'citron',
-    'city-centre',
-    'ciu',
-    'civitates',
-    'civvies',
-    'cj',
-    'ckr',
-    'cl100',
     'clacking',
-    'clairvaux',
-    'clanged',
-    'clank',
-    'clapped-out',
-    'claps',
-    'clarenceaux',
-    'claro',
-    'classicist',
-    'clausal',
-    'clawback',
-    'claybury',
-    'clean-cut',
-    'clear-up',
-    'clearcut',
-    'clearwater',
     'cleaving',
-    'cleethorpes',
-    'cleeve',
-    'clemente',
-    'clevedon',
-    'cleveleys',
-    'cliburn',
-    'cliffe',
-    'climbdown',
-    'clingfilm',
-    'clinique',
-    'clip-on',
-    'cliques',
-    'clitheroe',
-    'cloches',
-    'cloistered',
     'close-fitting',
-    'close-range',
-    'closets',
-    'clovers',
-    'clozapine',
-    'clubbers',
-    'clubface',
-    'clubland',
-    'clubmate',
-    'clucking',
-    'clumber',
-    'clumped',
-    'clun',
-    'cluttering',
-    'clutton-brock',
-    'cnc',
     'co-accused',
-    'co-developed',
-    'co-educational',
-    'co-operatively',
-    'co-ops',
-    'coalbrookdale',
-    'coalisland',
-    'coarseness',
-    'coasted',
-    'coatham',
-    'cobain',
-    'cobble',
-    'cobblestones',
-    'cobras',
-    'cockfield',
-    'cockle',
     'cockles',
-    'codicil',
-    'coed',
-    'coelenterates',
-    'coffee-cup',
-    'coffey',
-    'coggan',
-    'cognos',
-    'cognoscenti',
-    'coining',
-    'coitus',
-    'colditz',
-    'collard',
-    'collectives',
-    'collegial',
-    'colluded',
     'colluding',
-    'colobus',
-    'colonizing',
-    'colonnades',
-    'colonoscopic',
-    'colorado-based',
-    'colore',
-    'colostomy',
-    'colour-coded',
-    'colouration',
-    'coloureds',
-    'combos',
-    'combsburgh',
-    'comebacks',
-    'comedienne',
-    'comital',
     'commendably',
-    'commends',
-    'commissar',
-    'commodious',
-    'community-wide',
-    'compactness',
-    'company-wide',
-    'comparably',
-    'compatibles',
-    'complexions',
-    'complimenting',
-    'compostela',
-    'composts',
-    'comprador',
-    'compresses',
-    'compressors',
     'compulsively',
-    'computerise',
-    'conceptualisation',
-    'conceptualise',
-    'conceptualised',
-    'conceptualize',
-    'conch',
-    'concierge',
-    'conciliate',
-    'conclave',
-    'concoct',
-    'concordances',
-    'concordat',
-    'concreted',
-    'concretely',
-    'concretion',
     'concubine',
-    'concussed',
-    'conde',
-    'condenser',
-    'condolence',
-    'conduits',
-    'confides',
-    'confirmatory',
-    'congestive',
-    'congolese',
-    'congratulates',
-    'coniscliffe',
-    'conjectural',
-    'conjuror',
-    'conmen',
-    'connah',
     'connived',
-    'conniving',
-    'connote',
-    'consciousness-raising',
-    'conservatoire',
-    'conservator',
-    'consigning',
-    'consolations',
-    'consonance',
-    'consorts',
-    'constantius',
-    'constrains',
-    'constructor',
-    'consults',
-    'consumerist',
-    'contagion',
     'contig',
-    'contigs',
-    'continental-margin',
-    'contortions',
-    'contouring',
-    'contralateral',
-    'contravenes',
-    'convents',
-    'conversed',
-    'convexity',
-    'conveyances',
-    'convicting',
-    'conviviality',
-    'cooder',
-    'cookhouse',
-    'coolest',
     'coppery',
-    'coppicing',
-    'copses',
-    'copulate',
-    'copycat',
-    'copyist',
-    'corba',
-    'corbetts',
-    'corbusier',
-    'cordite',
-    'cordons',
-    'corduroys',
-    'corinne',
-    'cormorant',
-    'cornfield',
-    'cornfields',
     'cornflower',
-    'cornforth',
-    'corniche',
-    'coronal',
-    'coronations',
-    'corpulent',
-    'corpuscular',
-    'corries',
-    'corroborate',
-    'corry',
-    'corticosteroid',
-    'corvette',
-    'cosford',
-    'cost-effectively',
-    'coterminous',
-    'cotterell',
     'cotton-wool',
-    'cotyledon',
-    'council-owned',
-    'countenanced',
-    'counter-argument',
-    'counter-insurgency',
-    'counter-intelligence',
-    'counter-offensive',
-    'counter-offer',
-    'counteracting',
-    'counterfactual',
-    'countermanded',
-    'country-wide',
-    'counts.',
-    'coup_d\'&eacute;tat',
-    'coupla',
     'courtesan',
-    'couturier',
-    'cov',
-    'covenanted',
-    'covenanters',
-    'covenantor',
-    'cowdray',
-    'cowrie',
-    'cowries',
-    'coyne',
-    'coyote',
-    'cpve',
-    'cr&eacute;cy',
-    'cr&eacute;dit',
-    'cr.app.r',
-    'crackles',
     'craggs',
-    'craigendarroch',
-    'cramb',
-    'cramond',
-    'cramping',
-    'crampon',
-    'cranborne',
-    'cranked',
-    'cranleigh',
-    'cranwell',
-    'crash-landed',
-    'cratering',
-    'craves',
-    'craziness',
-    'creaky',
-    'creaney',
     'creasing',
-    'creches',
-    'cred',
-    'crediton',
-    'credulous',
-    'crenellated',
-    'creoles',
-    'creosote',
-    'cresswell',
-    'crewing',
-    'crichton',
-    'cricklewood',
-    'crim.l.r.',
-    'crimewatch',
-    'criminological',
-    'crimped',
     'crinkle',
-    'cripples',
-    'crispies',
-    'criss-crossing',
-    'critchley',
-    'criterion-referenced',
-    'croce',
-    'crocheted',
-    'crockett',
-    'crockford',
-    'crocks',
-    'croissant',
-    'croisset',
-    'cromadex',
-    'crombie',
-    'cronenberg',
     'cronje',
-    'crosbie',
-    'cross-examine',
-    'cross-fertilisation',
-    'cross-over',
-    'crossbows',
-    'crossbred',
-    'crossland',
-    'crotchet',
-    'crotchets',
-    'croup',
-    'crowland',
-    'crucifixes',
-    'crudity',
-    'cruelties',
-    'cruikshank',
     'crummy',
-    'crumpet',
-    'crumpets',
-    'crusher',
-    'crustacean',
-    'cryptosporidiosis',
-    'crystallise',
-    'crystallites',
-    'crystallography',
-    'csf',
-    'ctd',
-    'cuboid',
-    'cuckney',
-    'cuddesdon',
-    'cued',
-    'cuillin',
     'culboon',
-    'culottes',
-    'culpeper',
-    'cultivars',
-    'cultra',
-    'culver',
-    'cumani',
-    'cumulatively',
-    'cunard',
-    'cunts',
-    'cup-winners',
-    'cupids',
-    'cur',
-    'curable',
-    'curbishley',
-    'cureton',
     'curettage',
-    'curfews',
-    'curie',
-    'curlews',
-    'curries',
-    'curvaceous',
-    'custom-made',
-    'cut-down',
-    'cut-glass',
-    'cut-outs',
-    'cuticles',
-    'cutlets',
-    'cutts',
-    'cvp',
-    'cvs',
-    'cwm',
     'cyclades',
-    'cycladic',
-    'cyclo-oxygenase',
-    'cyclops',
-    'cyclotron',
-    'cygnus',
-    'cypa',
-    'cyrillic',
-    'cytherean',
-    'cytometry',
-    'cytotoxicity',
-    'd&aacute;il',
-    'd&eacute;mocratie',
-    'd&uuml;rer',
-    'd\'azur',
-    'd\'indy',
     'd\'offay',
-    'd\'oyly',
-    'd.p.p',
-    'dag',
-    'dahlias',
-    'dako',
-    'dakotas',
-    'dambusters',
-    'damming',
-    'dampers',
-    'damsels',
-    'dang',
-    'danie',
-    'danse',
-    'danzigers',
-    'dardanelles',
     'daringly',
-    'darrel',
-    'dashwood',
-    'dass',
-    'dastardly',
-    'data-gathering',
-    'datapost',
-    'datsun',
-    'daub',
-    'davids',
-    'davout',
-    'dawdled',
-    'dawdling',
-    'dax',
-    'day-glo',
-    'day-time',
     'daydreaming',
-    'daydreams',
-    'dayton',
-    'db2/6000',
-    'dc-10',
-    'dcl',
-    'ddr',
-    'de-differentiation',
-    'de_jure',
-    'deadwood',
-    'deanes',
-    'dearden',
-    'debility',
-    'debugger',
-    'decamped',
-    'decanted',
     'decapitation',
-    'decision-taking',
-    'decking',
-    'declaimed',
-    'decnet',
-    'decoders',
-    'deconstructive',
-    'decontamination',
-    'decorously',
-    'decried',
-    'dedicating',
-    'dedications',
-    'deee-lite',
-    'deep-water',
-    'deepdale',
-    'defeatism',
     'defecting',
-    'deferentially',
-    'deferral',
-    'defiled',
-    'deflating',
-    'defrauding',
-    'dejectedly',
-    'deletes',
-    'delineating',
-    'dell\'arte',
-    'delphic',
-    'deluged',
-    'delves',
-    'demilitarisation',
-    'demilitarized',
-    'demobbed',
     'demographics',
-    'demonstratives',
-    'demoralisation',
-    'demoralization',
-    'demoralizing',
-    'demosthenes',
-    'denatured',
-    'dench',
-    'dendrochronology',
-    'denigrating',
-    'dennett',
-    'denounces',
-    'deoxycholate',
-    'deployments',
-    'depository',
-    'deprave',
     'dept.',
-    'depth-first',
-    'derailment',
-    'derain',
-    'dermatology',
-    'derogation',
-    'derogations',
-    'dervish',
-    'desai',
-    'desalination',
-    'desecrated',
-    'designates',
-    'deskjet',
-    'despatching',
-    'destructiveness',
-    'detaching',
     'detaining',
-    'detective-sergeant',
-    'determinable',
-    'determinative',
-    'determiner',
-    'detestable',
-    'detonators',
-    'detracted',
-    'detracting',
-    'detrital',
-    'deum',
-    'devaluations',
-    'devaluing',
-    'developmentally',
-    'deveraugh',
-    'deviates',
     'deviating',
-    'devoutly',
-    'dextrose',
-    'df=1',
-    'dflp',
-    'dhamma',
-    'diadem',
-    'diadora',
-    'dichotomous',
-    'dicke',
-    'diehards',
-    'dienstbier',
-    'dietitian',
-    'diffuses',
-    'dijk',
-    'dilatory',
     'dilettante',
-    'dilhorne',
-    'dilys',
-    'dimer',
-    'dimerization',
-    'dimers',
-    'dimming',
-    'dimple',
-    'dimples',
-    'dinard',
-    'dinda',
-    'dines',
-    'dinka',
-    'dinnertime',
-    'diogenes',
-    'diphthongs',
     'dirac',
-    'dirge',
-    'disaggregation',
-    'disallow',
-    'disappoints',
-    'disavowed',
-    'dischargers',
-    'discography',
-    'discoloration',
-    'disconnections',
-    'disconsolately',
-    'discourteous',
-    'discreditable',
-    'discrepant',
-    'discriminant',
-    'disentangling',
     'disestablishment',
-    'disfigurement',
-    'disfiguring',
-    'disgustingly',
-    'dishonoured',
-    'dishy',
-    'disinfected',
-    'disintegrates',
-    'diskless',
-    'dislodging',
-    'dismounting',
-    'disobeying',
-    'dispensable',
-    'dispensations',
-    'dispenses',
-    'displaces',
     'dista',
-    'distalmost',
-    'diverges',
-    'divined',
-    'divines',
-    'divulged',
-    'dizzily',
-    'dn10',
-    'dobermann',
-    'dods',
-    'doers',
-    'dog-eared',
-    'doggett',
-    'dogsbody',
-    'doisneau',
-    'dol',
     'dolby',
-    'dollies',
-    'donaghadee',
-    'donee',
-    'donegall',
-    'doody',
-    'doogie',
-    'doorknob',
-    'dorado',
-    'dorm',
-    'dorman',
-    'dormouse',
-    'dorsalmost',
-    'dosages',
-    'dose-response',
-    'doss',
     'doted',
-    'double-barrelled',
-    'double-blind',
-    'double-handed',
-    'doubleday',
-    'dovecot',
-    'dovetail',
-    'dowdney',
-    'downbeat',
-    'downer',
-    'download',
-    'downriver',
-    'downton',
-    'drainer',
-    'draperies',
-    'draughtsmanship',
     'draughtsmen',
-    'dray',
-    'dreads',
-    'dream-like',
-    'dreamlike',
-    'drennan',
-    'dressing-rooms',
-    'dressing-up',
-    'dreyfus',
-    'dried-up',
-    'drinkable',
-    'drivel',
-    'dromore',
-    'drop-outs',
-    'droplet',
-    'drouot',
     'drowsily',
-    'drs6000',
-    'drubbins',
-    'dryers',
-    'drysdale',
-    'drystone',
-    'dsu',
-    'dualist',
-    'dubliners',
-    'dubuffet',
-    'dudek',
-    'duels',
-    'dugdale',
-    'dujon',
-    'dullest',
-    'dulling',
     'dumb-bell',
-    'dumfriesshire',
-    'duncombe',
-    'dunford',
-    'dunmurry',
-    'dunston',
-    'dunvegan',
-    'duodenogastric',
-    'dusters',
-    'dustpan',
-    'dux',
-    'dvorak',
-    'dwarfing',
-    'dyce',
-    'dyck',
-    'dyspeptic',
     'dystrophin',
-    'e&amp;y',
-    'e.t.',
-    'eadred',
-    'eagleburger',
-    'eaglescliffe',
-    'eagleton',
-    'eales',
-    'earache',
-    'eardrums',
-    'earnshaw',
-    'earths',
-    'earthwork',
-    'easement',
-    'eccentrics',
-    'ecclesiastics',
     'eccleston',
-    'ece',
-    'eck',
-    'eclipsing',
-    'ecm',
-    'economy-wide',
-    'ecuadorian',
-    'ecumenism',
-    'edelman',
-    'edicts',
-    'edifices',
-    'edifying',
-    'edinburgh-based',
-    'edt',
-    'educationalist',
-    'effie',
     'effusions',
-    'egg-laying',
-    'eggleton',
-    'egm',
-    'egregious',
-    'eh1',
-    'ehm',
-    'eib',
-    'eicosanoids',
-    'eicosapentaenoic',
-    'eighth-century',
-    'eightieth',
-    'ek',
-    'eke',
-    'elaborates',
-    'elba',
     'elderflower',
-    'eldridge',
-    'electrolytic',
-    'electrophoretic',
-    'elevates',
-    'elfin',
-    'eliminator',
-    'ellington',
-    'elly',
-    'elmwood',
-    'elongate',
-    'elucidating',
-    'elven',
-    'elvin',
-    'elvira',
-    'elwood',
     'emasculated',
-    'embarks',
-    'embroider',
-    'emc',
-    'emigres',
-    'emitter',
-    'emode',
-    'empathise',
-    'employments',
-    'empson',
-    'emptor',
-    'enamels',
-    'encapsulating',
-    'enchanter',
-    'encoder',
-    'encryption',
     'encyclical',
-    'encyclopedias',
-    'end-of-term',
-    'endoplasmic',
-    'endotoxaemia',
-    'enfolded',
-    'enforceability',
-    'enfranchised',
-    'engine-room',
-    'engined',
-    'enlarges',
-    'enp',
-    'enriches',
-    'enrico',
-    'enrile',
-    'enshrine',
     'enshrines',
-    'entailment',
-    'enterocytes',
-    'enthronement',
-    'enticingly',
-    'entrancing',
-    'entreaties',
-    'entrusting',
-    'enuresis',
-    'eosinophils',
-    'epc',
-    'eph',
-    'epicurus',
-    'epitomise',
-    'epitopes',
-    'eqns',
     'equably',
-    'equalization',
-    'equidistant',
-    'equilibration',
-    'equinox',
-    'equitably',
-    'erasing',
-    'erato',
-    'erdf',
-    'erfurt',
-    'ergonomic',
-    'erikson',
-    'erith',
-    'erne',
-    'ernesto',
-    'erosive',
     'erotically',
-    'erp',
-    'ersatz',
-    'erythrocytes',
-    'escapees',
-    'eschews',
-    'escoffier',
-    'esperanto',
-    'espousing',
-    'esprit_de_corps',
-    'esse/l',
-    'est&eacute;e',
-    'estimations',
-    'estoril',
-    'estuarine',
-    'ethnology',
     'ethnomethodology',
-    'etruria',
-    'eugenia',
-    'eurasia',
-    'euratom',
-    'euro-sceptics',
-    'eurocheque',
-    'eurodollar',
-    'eurovision',
-    'eusebius',
-    'eutrophication',
-    'evacuee',
-    'evander',
-    'evangelicalism',
-    'evaporites',
-    'evasively',
     'evenwood',
-    'ever-expanding',
-    'every-day',
-    'evian',
-    'evolutionist',
-    'ewbank',
-    'ewood',
-    'ex-',
-    'ex-croydon',
-    'ex-girlfriend',
-    'exactions',
-    'exaggeratedly',
-    'exaggerates',
-    'exchangeable',
-    'exclaims',
-    'executable',
     'exhibitor',
-    'exhort',
-    'existentialism',
-    'exmouth',
-    'exorcised',
-    'exotics',
-    'exp',
-    'expedients',
-    'expeditiously',
-    'expiring',
-    'expletives',
-    'explicate',
-    'explication',
-    'exploiters',
-    'expressionists',
-    'expressively',
     'expressway',
-    'extendable',
-    'extender',
-    'extents',
-    'exterminate',
-    'extol',
-    'extorted',
-    'extracorporeal',
-    'extractive',
-    'extrajudicial',
-    'extrapolations',
-    'extricated',
-    'extrusion',
-    'eye-level',
-    'eye-opener',
-    'eyelets',
     'eyemouth',
-    'eyepiece',
-    'eyewitnesses',
-    'eynon',
-    'eyrie',
-    'f.a.',
-    'f/l',
-    'f6',
-    'fabre',
-    'fabulously',
-    'facsimiles',
-    'factortame',
-    'faience',
-    'fail-safe',
-    'fairlie',
-    'fairyland',
     'faithfull',
-    'faithfullly',
-    'fakintil',
-    'falco',
-    'falcone',
-    'fall-back',
-    'fall-off',
-    'fallacies',
-    'falsifying',
-    'fam\'ly',
-    'familiarize',
-    'family-owned',
-    'famines',
-    'famished',
-    'fancy-dress',
-    'fancying',
     'fangio',
-    'fantasise',
-    'farag',
-    'fareham',
-    'farmlands',
-    'faroese',
-    'farooq',
-    'farquar',
-    'farraline',
-    'farriers',
-    'farriery',
-    'farrington',
-    'farted',
-    'faso',
-    'fastens',
-    'father-of-two',
     'faunal',
-    'faur&eacute',
-    'fawley',
-    'fawlty',
-    'fawning',
-    'fawr',
-    'fcs',
-    'fdi',
-    'feathering',
-    'febrile',
-    'fecund',
-    'fed-up',
-    'federman',
-    'fedpol',
-    'feelers',
-    'feign',
     'feldspars',
-    'felicit&agrave',
-    'fellatio',
-    'felons',
-    'felt-tip',
-    'femme_fatale',
-    'fended',
-    'fenniway',
-    'fenny',
-    'ferrar',
-    'ferrara',
-    'ferric',
-    'festuca',
-    'fetes',
-    'fetishism',
-    'fettle',
     'feynman',
-    'fforde',
-    'fhsas',
-    'fibrillation',
-    'fibrin',
-    'fibrinogen',
-    'fibroblast',
-    'fidget',
-    'fielders',
-    'fiends',
-    'fiesole',
-    'fifty-fifty',
-    'fifty-nine',
-    'fig.3',
-    'figuration',
-    'fijians',
     'filings',
-    'final-year',
-    'finalize',
-    'financi&egrave;re',
-    'fine-tuning',
-    'finials',
-    'finicky',
-    'fining',
-    'finnegans',
-    'fire-fighting',
-    'firebomb',
-    'firebrand',
-    'firestone',
-    'first-',
-    'first-century',
-    'first-choice',
     'fishers',
-    'fishmongers',
-    'fisk',
-    'fitments',
-    'fitt',
-    'fitton',
-    'fitzsimmons',
-    'five-fold',
-    'five-mile',
-    'five-speed',
-    'five-week',
-    'fixed-point',
-    'fixed-wing',
-    'fixer',
-    'fixit',
-    'fixity',
     'fizzing',
-    'fjords',
-    'fjortoft',
-    'flagpole',
-    'flagrantly',
-    'flamboyance',
-    'flamingos',
-    'flare-up',
-    'flashbacks',
-    'flat-topped',
-    'flaunted',
-    'flavourings',
-    'flaxton',
-    'fleecy',
-    'fleshed',
-    'flexure',
     'flightless',
-    'flighty',
-    'flinders',
-    'flintshire',
-    'flinty',
-    'flip-flop',
-    'flip-flops',
-    'flippers',
-    'floaters',
-    'floorcovering',
-    'floriade',
-    'florin',
-    'florists',
-    'flowchart',
-    'flowerpot',
-    'flt.lt',
     'flukes',
-    'fluticasone',
-    'fluxes',
-    'flycatcher',
-    'flying-boat',
-    'fmc',
-    'foetuses',
-    'foils',
-    'foix',
-    'fokker',
-    'fomenting',
-    'fondle',
-    'footballs',
-    'footed',
-    'footholds',
-    'footings',
     'footy',
-    'fop',
-    'force_majeure',
-    'forebodings',
-    'foreclosure',
-    'foregrounded',
-    'foregrounds',
-    'foreign-exchange',
-    'foreland',
-    'foreseeing',
-    'foreshadowing',
-    'foreshortened',
-    'foretell',
-    'forfar',
-    'forfeiting',
-    'forger',
     'forget-me-nots',
-    'forgettable',
-    'forgone',
-    'forking',
-    'forklift',
-    'formalizing',
-    'formen',
-    'formosa',
-    'forteviot',
-    'fortify',
-    'fortune-teller',
-    'foul-mouthed',
-    'foulness',
-    'fouls',
-    'foundationalist',
-    'four-',
     'four-bedroom',
-    'four-legged',
-    'four-square',
-    'four-terminal',
-    'four-way',
-    'fourth-year',
-    'fowls',
-    'foxbat',
-    'foxhunting',
-    'foy',
-    'fr.',
-    'fractionated',
-    'fractor',
-    'fram',
-    'francoist',
-    'frankincense',
     'franky',
-    'fraudsters',
-    'frazier',
-    'frc',
-    'free-floating',
-    'freebies',
-    'freemasons',
-    'freeway',
-    'freighters',
-    'freire',
-    'frenchwoman',
-    'frente',
-    'freshened',
-    'freshers',
-    'freshman',
-    'frey',
     'friary',
-    'fricative',
-    'friedlander',
-    'friendliest',
-    'frigging',
-    'frisch',
-    'frobisher',
-    'froebe',
-    'frolics',
-    'frostily',
-    'frud',
-    'fsm',
-    'fta',
-    'ftc',
-    'fuego',
-    'fuehrer',
     'fulani',
-    'fulford',
-    'fulltime',
-    'fund-holding',
-    'fundectomy',
-    'funicular',
-    'funnelled',
-    'furnishes',
-    'furred',
-    'fusions',
-    'futurism',
-    'fyt',
-    'g&ouml;ttingen',
-    'g/dl',
-    'g2',
-    'g34',
     'g5',
-    'gaas',
-    'gab',
-    'gaba',
-    'gabbiadini',
-    'gabrieli',
-    'gadfly',
-    'gagosian',
-    'gaius',
-    'galas',
-    'galena',
-    'gallen',
-    'galls',
-    'galvanise',
-    'galvin',
-    'gambles',
     'gameplay',
-    'gan',
-    'gangways',
-    'gannet',
-    'gao',
-    'garang',
-    'gard&eacute;e',
-    'garibaldi',
-    'garni',
-    'garratt',
-    'garrod',
-    'garstang',
-    'garty',
-    'gashes',
-    'gasifier',
-    'gassing',
     'gastroenteritis',
-    'gastropathy',
-    'gastrulation',
-    'gateau',
-    'gatfield',
-    'gaullists',
-    'gauloises',
-    'gauthier',
-    'gautier',
-    'gbw',
-    'geaga',
-    'ged',
-    'geertz',
-    'geffen',
-    'gemstones',
-    'gendarmes',
     'genders',
-    'genealogies',
-    'generalising',
-    'generalists',
-    'genn',
-    'gentech',
-    'geo',
-    'geordies',
-    'georgios',
-    'gerbils',
-    'gerd',
-    'germanys',
-    'germinated',
-    'gershwin',
-    'gertie',
-    'gesso',
     'get-up',
-    'gethsemane',
-    'gettier',
-    'gev',
-    'geyser',
-    'ghia',
-    'ghouls',
-    'ghozali',
-    'ghq',
-    'ghyll',
-    'giap',
-    'gibco',
-    'gibling',
-    'giemsa',
-    'gigged',
-    'gigging',
     'gilkes',
-    'gill-nets',
-    'gillan',
-    'gillette',
-    'gillie',
-    'gillies',
-    'gilmerton',
-    'gimignano',
-    'gins',
-    'giraffes',
-    'giraud',
-    'girt',
-    'giuliano',
-    'giza',
-    'gkn',
-    'gkr',
     'gladiator',
-    'gladioli',
-    'gladness',
-    'glares',
-    'glasgow-based',
-    'glasser',
-    'glasshouses',
-    'glazes',
-    'glazier',
-    'gleizes',
-    'glenelg',
-    'glenfiddich',
-    'glennerster',
-    'glennie',
-    'glibly',
-    'glick',
     'glitch',
-    'glittery',
-    'gloomier',
-    'gloriana',
-    'gloried',
-    'glu',
-    'glug',
-    'glycerine',
-    'glycogen',
-    'gnat',
-    'gnats',
-    'gnostic',
-    'gobsmacked',
-    'god-fearing',
-    'god-like',
-    'godard',
     'goddamned',
-    'godfathers',
-    'godforsaken',
-    'godless',
-    'godliness',
-    'godman',
-    'goh',
-    'golders',
-    'goldmann',
-    'goldsborough',
-    'goldstone',
-    'gonzalo',
-    'goodchild',
-    'goodier',
-    'goofy',
-    'goole',
     'goon',
-    'goons',
-    'gorged',
-    'gorm',
-    'gossiped',
-    'gossipy',
-    'gotcha',
-    'gottfried',
-    'gotti',
-    'gouging',
-    'gourlay',
-    'governesses',
-    'gowrie',
-    'gozo',
-    'gpo',
-    'gpt',
     'gqozo',
-    'gradings',
-    'grady',
-    'granaries',
-    'granby',
-    'grandee',
-    'grandes',
-    'grandmasters',
-    'granton',
-    'granulation',
-    'granulomas',
-    'graptolites',
-    'grates',
-    'gratify',
-    'grattan',
-    'gratuities',
     'gravitate',
-    'gravitated',
-    'grebes',
-    'green-eyed',
-    'greengrocers',
-    'greenways',
-    'gremlins',
-    'gresley',
-    'gretna',
-    'greve',
-    'grey-brown',
-    'greyson',
-    'gribben',
-    'griddle',
-    'grieg',
-    'grieves',
     'griff',
-    'grimaces',
-    'grimaud',
-    'grimmer',
-    'grimness',
-    'grinders',
-    'gripper',
-    'gristle',
-    'gro',
-    'groa',
-    'groeger',
-    'grogan',
-    'groggy',
-    'grosz',
-    'groupies',
-    'groupware',
     'grovel',
-    'gruncher',
-    'gruppo',
-    'gruy&egrave;re',
-    'gtp',
-    'gu',
-    'guadeloupe',
-    'guangdong',
-    'gubernii',
-    'guerra',
-    'guerre',
-    'guevara',
-    'guileless',
-    'guillamon',
-    'gulley',
-    'gumperz',
     'gung-ho',
-    'gunnery',
-    'gunter',
-    'gurani',
-    'guttersnipe',
-    'guv\'nor',
-    'guyanese',
-    'guzm&aacute;n',
-    'gv',
-    'gw',
-    'gwili',
-    'gwilym',
-    'gy',
-    'gyle',
-    'gysin',
-    'h.d.g.',
     'h2',
-    'h4',
-    'h5',
-    'habitations',
-    'habituated',
-    'habyarimana',
-    'hackman',
-    'hadlee',
-    'haemodynamic',
-    'haemorrhaging',
-    'hagan',
-    'hagar',
-    'hagfishes',
-    'hagley',
-    'hahn',
-    'haidar',
     'hailey',
-    'hainault',
-    'haircare',
-    'hairpins',
-    'hajar',
-    'halden',
-    'half-formed',
-    'half-man',
-    'half-marathon',
-    'half-yearly',
-    'halidon',
-    'hallett',
-    'hallucinating',
-    'hallucinogenic',
-    'haltingly',
-    'hana',
     'hanbury',
-    'handball',
-    'handbills',
-    'handguns',
-    'handicapper',
-    'handscomb',
-    'handsets',
-    'hanker',
-    'hankie',
-    'hanlon',
-    'hansel',
-    'hapcs',
-    'hapsburg',
-    'harbourmaster',
-    'hard-edged',
-    'hardcastle',
     'hardisty',
-    'hardwicke',
-    'hare-woman',
-    'hareton',
-    'haring',
-    'harking',
-    'harkness',
-    'harmer',
-    'harmonising',
-    'harmonized',
-    'harpies',
-    'harping',
-    'harpo',
-    'harpoon',
-    'harr&eacute',
-    'harriman',
     'harrying',
-    'hartford',
-    'hartington',
-    'hartman',
-    'hartwell',
-    'harvesters',
-    'harvey-jones',
-    'hashemite',
-    'hashimoto',
-    'hatful',
-    'hau',
-    'haute_cuisine',
-    'hauteur',
-    'hautvillers',
-    'have-nots',
-    'hawaiians',
     'hawkbit',
-    'hawkshead',
-    'hawksmoor',
-    'hawn',
-    'hayhurst',
-    'haystack',
-    'haystacks',
-    'hayter',
-    'haywood',
-    'hazarded',
-    'hazelnuts',
-    'hazily',
-    'hbk',
-    'hbv-dna',
-    'headcount',
-    'headleand',
     'headquartered',
-    'heald',
-    'hearne',
-    'hearst',
-    'heatedly',
-    'heathfield',
-    'heathlands',
-    'heatley',
-    'heavenwards',
-    'heavy-lidded',
-    'hebburn',
-    'hebron',
-    'heckled',
-    'heckling',
-    'heffer',
-    'heighington',
     'heinkel',
-    'heirlooms',
-    'heli',
-    'helium-3',
-    'hell-bent',
-    'hellenism',
-    'hellfire',
-    'helluva',
-    'hemsworth',
-    'henchman',
-    'henniker',
-    'henriques',
-    'hep3b',
-    'hepatocellular',
-    'herakles',
-    'herculaneum',
     'hercule',
-    'herculean',
-    'herdsman',
-    'herdsmen',
-    'hereof',
-    'herewith',
-    'heritability',
-    'hermaphrodite',
-    'hermeneutics',
-    'hermetic',
-    'herringbone',
-    'hervey',
-    'herzegovina',
-    'hes',
-    'hesiod',
-    'heswall',
     'hev',
-    'hever',
-    'hex',
-    'hey_presto',
-    'hiatal',
-    'hiboux',
-    'hic',
-    'hidb',
-    'hieroglyphics',
-    'high-definition',
-    'high-density',
-    'high-pass',
-    'high-power',
-    'high-spending',
-    'high-status',
-    'high-temperature',
     'high-voltage',
-    'higher-order',
-    'hightown',
-    'higueras',
-    'hijacker',
-    'hilltops',
-    'hinckley',
-    'hindbrain',
-    'hinde',
-    'hindhead',
-    'hinkle',
-    'hinsley',
-    'hippos',
-    'hires',
-    'histopathological',
-    'hiv-positive',
     'hived',
-    'hjerson',
-    'hmis',
-    'hno',
-    'hoarseness',
-    'hodai',
-    'hoeing',
-    'hoggart',
-    'hol',
-    'hold-ups',
-    'holdaway',
-    'holgate',
-    'hollowly',
-    'hollowness',
-    'holst',
-    'holton',
     'holyroodhouse',
-    'home-cooked',
-    'home-owners',
-    'homily',
-    'hominoid',
-    'honderich',
-    'honey-coloured',
-    'honeymooners',
-    'honeypot',
-    'honing',
-    'honiton',
-    'honking',
-    'honor&eacute',
-    'hoodwinked',
-    'hookers',
-    'hoovering',
     'horden',
-    'horkheimer',
-    'horse-racing',
-    'horsewoman',
-    'horta',
-    'hortense',
-    'hortensia',
-    'hospitalization',
-    'hospitaller',
-    'hotbed',
-    'hotteterre',
-    'houseboat',
-    'hoving',
-    'howerd',
-    'howler',
-    'hoxha',
     'hoyland',
-    'hst',
-    'hud',
-    'huddling',
-    'huffing',
-    'huggett',
-    'hui',
-    'hullabaloo',
-    'hullavington',
-    'human-rights',
-    'humanoid',
-    'humblest',
-    'hummersknott',
-    'humours',
-    'humpback',
-    'humphry',
     'humphrys',
-    'hums',
-    'hundredweight',
-    'huns',
-    'hunte',
-    'huntingdonshire',
-    'hurls',
-    'hurly-burly',
-    'huron',
-    'hurrah',
-    'hurries',
-    'hurtle',
-    'hussa',
-    'hussy',
-    'hustler',
-    'hutchings',
     'hyam',
-    'hydraulically',
-    'hydrochloride',
-    'hymes',
-    'hyperdesk',
-    'hypermedia',
-    'hypertrophy',
-    'hypnotherapist',
-    'hypo',
-    'hypochlorite',
-    'hypochondria',
-    'hypotonic',
-    'hyssop',
-    'hysteresis',
-    'i\'',
-    'iba&ntilde;ez',
     'ibis',
-    'ibm-compatible',
-    'ice-creams',
-    'icke',
-    'iconoclasm',
-    'iconoclastic',
-    'icr',
-    'ideologue',
-    'idolised',
-    'iea',
-    'if/alt',
-    'ifa',
-    'igg1',
-    'iggy',
-    'igniting',
-    'iis',
     'ike',
-    'ilbrec',
-    'ileocolonic',
-    'iliad',
-    'ill-formed',
-    'ill-founded',
-    'ill-gotten',
-    'ill-judged',
-    'ill-mannered',
-    'ill-will',
-    'illich',
-    'illiquid',
-    'illogicality',
-    'illogically',
-    'ilona',
-    'ils',
     'imbibed',
-    'immatures',
-    'immortals',
-    'immunoassay',
-    'immunosuppressive',
-    'impedes',
-    'impeller',
-    'impish',
-    'implexion',
-    'importunate',
-    'impregnation',
-    'impudence',
-    'impugned',
-    'in_that',
-    'inattention',
-    'inattentive',
     'inauspicious',
-    'inbreeding',
-    'incantation',
-    'incarnations',
-    'incautious',
-    'inclement',
-    'inclines',
-    'incoherently',
-    'incompletely',
-    'inconsolable',
-    'inconveniences',
-    'inconveniently',
-    'incorruptible',
-    'incrementalism',
-    'incubate',
-    'inculcated',
     'incurably',
-    'indelicate',
-    'indexer',
-    'indica',
-    'indigent',
-    'indirection',
-    'indolence',
-    'indrawn',
-    'indubitably',
-    'inducted',
-    'inebriated',
-    'ineffectually',
-    'inelegant',
-    'inequities',
-    'inequity',
-    'inexact',
     'inf',
-    'infantryman',
-    'infantrymen',
-    'infeasible',
-    'inferiors',
-    'infinitives',
-    'inflame',
-    'information-based',
-    'infringes',
-    'infuriate',
-    'ingest',
-    'inglewood',
-    'inglorious',
-    'ingrams',
-    'ingratiate',
-    'ingress',
     'ini',
-    'iniquities',
-    'initialised',
-    'injudicious',
-    'inoperative',
-    'inopportune',
-    'inputting',
-    'inquirer',
-    'insidiously',
-    'insinuated',
-    'insolently',
-    'inspector-general',
-    'inspectorates',
-    'installer',
-    'installers',
-    'institutionalization',
     'institutionally',
-    'insurgent',
-    'integrals',
-    'intellects',
-    'intemperate',
-    'intentionality',
-    'intentioned',
-    'inter-',
-    'inter-disciplinary',
-    'inter-ethnic',
-    'inter-library',
-    'inter-regional',
-    'inter-relationship',
-    'interactivity',
-    'interagency',
-    'intercede',
     'intercepts',
-    'interest-bearing',
-    'interfaced',
-    'interims',
-    'interintell',
-    'interleukin-2',
-    'interlock',
-    'interlocutors',
-    'interloper',
-    'interlopers',
-    'intermission',
-    'internat',
-    'interoperate',
-    'interpet',
-    'interpolated',
-    'interpretable',
     'interrogations',
-    'interrogatories',
-    'interrogators',
-    'interstices',
-    'intertidal',
-    'intimacies',
-    'intra-ec',
-    'intrahepatic',
-    'intraoesophageal',
-    'introvert',
-    'intrudes',
-    'intubation',
-    'invades',
-    'invalided',
-    'invents',
-    'inverclyde',
     'invergordon',
-    'invigorated',
-    'inviolability',
-    'inviolate',
-    'io',
-    'ionia',
-    'ionized',
-    'ipcc',
-    'irenaeus',
-    'irma',
-    'ironmonger',
-    'iroquois',
-    'irr',
-    'irredeemable',
-    'irredeemably',
-    'irregulars',
     'irretrievable',
-    'isas',
-    'isherwood',
-    'ishmael',
-    'iskandara',
-    'islami',
-    'islet',
-    'isleworth',
-    'islwyn',
-    'isotonic',
-    'ist',
-    'itched',
-    'iterated',
-    'iu/l',
-    'iucn',
-    'iveco',
     'izz',
-    'izzy',
-    'j.a.',
-    'j.d.',
-    'j.h.',
-    'j.p.',
-    'jaa',
-    'jackdaw',
-    'jackdaws',
-    'jacoby',
-    'jadeite',
-    'jaeger',
-    'jago',
-    'jakes',
-    'jakki',
-    'jakowski',
     'jalal',
-    'jamb',
-    'jammy',
-    'jana',
-    'jansen',
-    'janssen',
-    'janus',
-    'jap',
-    'japonica',
-    'japs',
-    'jatiya',
-    'jauncey',
-    'jcb',
-    'jde',
-    'jean-luc',
-    'jean-michel',
     'jennens',
-    'jenni',
-    'jeopardizing',
-    'jermyn',
-    'jes',
-    'jessel',
-    'jesu',
-    'jetsam',
-    'jeu',
-    'jeune',
-    'jigsaws',
-    'jin',
-    'jist',
-    'jive',
-    'jmb',
-    'jo-ann',
     'joaquim',
-    'jobbers',
-    'jobcentres',
-    'jochim',
-    'jocks',
-    'jogs',
-    'johnnies',
-    'johnsen',
-    'joint-venture',
-    'jordanians',
-    'jovially',
-    'jovic',
-    'jovite',
-    'jowls',
-    'joyrider',
-    'jsp',
     'ju88',
-    'judgmental',
-    'juggled',
-    'juke',
-    'jumblatt',
-    'junk-bond',
-    'juntas',
-    'just-in-time',
-    'justiciar',
-    'jut',
-    'juxtapositions',
-    'k\'s',
-    'k-type',
-    'k1',
-    'kabrit',
-    'kadan',
     'kaiserslautern',
-    'kalahari',
-    'kaldor',
-    'kale',
-    'kaliningrad',
-    'kamikaze',
-    'kampala',
-    'kampuchean',
-    'kanchelskis',
-    'kandel',
-    'kandy',
-    'kanza',
-    'kao',
-    'kaolin',
-    'kaprun',
-    'kara',
     'karadjordje',
-    'karami',
-    'karin',
-    'kart',
-    'kashmiri',
-    'kasmin',
-    'kassel',
-    'kata',
-    'kazan',
-    'kazasker',
-    'kean',
-    'kebab',
-    'keble',
-    'keeble',
-    'keeley',
-    'keene',
     'keenness',
-    'keepsake',
-    'keightley',
-    'kelleher',
-    'kellerman',
-    'kellett',
-    'kellett-bowman',
-    'kellogg',
-    'kelman',
-    'kelsall',
-    'kelsey',
-    'kemble',
-    'kemsley',
-    'kenyatta',
-    'kerbside',
-    'kerly',
     'kermode',
-    'kessler',
-    'kevan',
-    'kevlar',
-    'khadra',
-    'khalil',
-    'khanate',
-    'khans',
-    'khieu',
-    'khthons',
-    'kidnappings',
-    'kiel',
-    'kiet',
-    'kikuyu',
-    'kilchoman',
-    'kilwinning',
     'kinane',
-    'kindertransporte',
-    'kingdon',
-    'kingfishers',
-    'kingmaker',
-    'kingstonian',
-    'kingsway',
-    'kirchhoff',
-    'kirghiz',
-    'kirgiz',
-    'kiribati',
-    'kirkleatham',
-    'kirklees',
-    'kisling',
-    'kitemark',
-    'kittiwakes',
     'kitzbuhel',
-    'klagenfurt',
-    'kleiber',
-    'klepner',
-    'klondyke',
-    'klux',
-    'knapsack',
-    'knee-high',
-    'kneels',
-    'knick-knacks',
-    'knightley',
-    'knock-down',
-    'knockabout',
-    'knockglen',
-    'knopf',
-    'knowable',
     'knowledgeably',
-    'knuth',
-    'koc',
-    'koffigoh',
-    'koirala',
-    'komeito',
-    'koo',
-    'kosuth',
-    'kouros',
-    'kraemer',
-    'kraus',
-    'krays',
-    'kremer',
-    'krill',
-    'kristin',
-    'krone',
     'krypton',
-    'krzysztof',
-    'kt',
-    'kts',
-    'kuan',
-    'kubota',
-    'kung',
-    'kurd',
-    'kurunagala',
-    'kwh',
-    'kyodo',
-    'l&oacute;pez',
-    'l-r',
-    'l/cpl',
-    'l4',
-    'l7',
     'labia',
-    'laboulbeniales',
-    'labour-market',
-    'lacayo',
-    'lacerated',
-    'lachy',
-    'lactic',
-    'lactulose',
-    'ladd',
-    'ladram',
-    'laguna',
-    'lalonde',
-    'lamarr',
-    'lambswool',
-    'lameness',
-    'lamentably',
     'lamentations',
-    'lamming',
-    'lampshade',
-    'lampshades',
-    'lancasters',
-    'lance-corporal',
-    'lanced',
-    'lancing',
-    'landes',
-    'landform',
-    'landholding',
-    'landholdings',
-    'landladies',
-    'landlocked',
-    'landslides',
-    'laney',
     'langan',
-    'languish',
-    'languorous',
-    'lanier',
-    'lantastic',
-    'lapland',
-    'laporte',
-    'lapwai',
-    'larger-scale',
-    'largish',
-    'larking',
-    'larkins',
-    'larksoken',
-    'larkspur',
-    'larson',
-    'lartin',
     'larwood',
-    'lary',
-    'laryngeal',
-    'laslett',
-    'lassitude',
-    'lat',
-    'lateralisation',
-    'lateralised',
-    'lath',
-    'latino',
-    'lattre',
-    'launceston',
-    'lavandera',
-    'lavelle',
-    'lavoisier',
-    'law-enforcement',
     'lawes',
-    'lawmakers',
-    'laxton',
-    'lazarsfeld',
-    'lcci',
-    'le&oacute;n',
-    'leakey',
-    'leapfrog',
-    'leaseholders',
-    'leck',
-    'leconte',
-    'leeson',
-    'leetle',
-    'left-of-centre',
-    'left-right',
-    'left-to-right',
     'left-wingers',
-    'legates',
-    'legent',
-    'legionnaire',
-    'legitimized',
-    'leguminosae',
-    'leica',
-    'leics',
-    'lek',
-    'lekhanya',
-    'lemmon',
-    'leng',
-    'leniently',
-    'lenihan',
-    'lennis',
-    'lentil',
     'lepidoptera',
-    'leppard',
-    'lesser-known',
-    'lessingham',
-    'let-up',
-    'letter-writing',
-    'letty',
-    'leuchars',
-    'leukocytes',
-    'leukotriene',
-    'levanti&eacute;re',
-    'levein',
-    'levis',
-    'levitation',
-    'levity',
-    'lew',
     'lewisian',
-    'lexeme',
-    'lexically',
-    'leyden',
-    'leyshon',
-    'leytonstone',
-    'lg',
-    'lgs',
-    'liberalise',
-    'liberality',
-    'liberalize',
-    'libertarians',
-    'lidded',
-    'liddesdale',
-    'liddle',
-    'lie-in',
     'lieutenant-commander',
-    'ligation',
-    'light-sensitive',
-    'lightfoot',
-    'likens',
-    'lillee',
-    'limassol',
-    'lime-green',
-    'limpet',
-    'linchpin',
-    'lind',
-    'lineaments',
-    'linens',
-    'linesmen',
-    'lineup',
-    'lingua_franca',
     'lini',
-    'linn',
-    'linnean',
-    'linoleic',
-    'lip-reading',
-    'lipoproteins',
-    'lipsey',
-    'lipsticks',
-    'liquefied',
-    'liquidations',
-    'lise',
-    'liston',
-    'literariness',
-    'litherland',
-    'littlehampton',
-    'littler',
     'lived-in',
-    'livewire',
-    'livin\'',
-    'ljubljana',
-    'llama',
-    'llaneilian',
-    'lmc',
-    'lnu',
-    'loadable',
-    'local-authority',
-    'localiser',
-    'locally-based',
-    'locator',
-    'lochaber',
-    'lochalsh',
-    'lochinver',
     'lockhart',
-    'lockyer',
-    'loggia',
-    'logica',
-    'logics',
-    'lolita',
-    'lombards',
-    'lombroso',
-    'long-ago',
-    'long-handled',
-    'long-haul',
-    'long-sleeved',
-    'longhand',
-    'longlands',
-    'longmans',
-    'longshore',
     'lonnie',
-    'loon',
-    'loonies',
-    'loping',
-    'lorean',
-    'lorrimore',
-    'lossiemouth',
-    'lotteries',
-    'loughlin',
-    'loughran',
-    'loughton',
-    'lovelier',
-    'lovelock',
-    'low-alcohol',
-    'low-pitched',
-    'low-power',
     'low-slung',
-    'lowood',
-    'lozenges',
-    'lpg',
-    'lubavitch',
-    'lubbers',
-    'lucan',
-    'lucio',
-    'luckiest',
-    'ludendorff',
-    'ludgate',
-    'ludovic',
-    'lugged',
-    'lukacs',
-    'lukanov',
-    'lunchtimes',
     'luney',
-    'lungfish',
-    'lupins',
-    'lurches',
-    'lurex',
-    'lusts',
-    'lvf',
-    'lwb',
-    'lydham',
-    'lymphocytic',
-    'lyndhurst',
-    'lyndsey',
-    'lyricist',
-    'lysine',
-    'm&aacute;rquez',
-    'm.p',
     'm.p.',
-    'm0',
-    'maan',
-    'macaques',
-    'macaskill',
-    'maccabe',
-    'macdiarmid',
-    'macduff',
-    'machineheads',
-    'machinist',
-    'machu',
-    'maciver',
-    'mackey',
-    'macready',
-    'macroscopically',
-    'madani',
     'maddeningly',
-    'madeley',
-    'madhya',
-    'mafeking',
-    'magdalena',
-    'mage',
-    'mages',
-    'maggi',
-    'magister',
-    'magyar',
-    'mails',
-    'mainsheet',
-    'maintainable',
-    'maire',
-    'maisonettes',
-    'makarenko',
     'makassar',
-    'make-over',
-    'makin\'',
-    'maktoum',
-    'mal&aacute',
-    'maladaptive',
-    'malagasy',
-    'malarial',
-    'malcontents',
-    'malduin',
-    'malformations',
-    'malfunctioning',
-    'malignancies',
-    'mallards',
-    'mallett',
-    'malo',
     'malory',
-    'malplacket',
-    'malted',
-    'maltreatment',
-    'maltster',
-    'manchester-based',
-    'mandibular',
-    'mange',
-    'mangoes',
-    'mani',
-    'manic-depressive',
-    'manilow',
-    'manipulates',
-    'manmade',
-    'mannerism',
-    'manningham',
     'mantles',
-    'mantua',
-    'manuela',
-    'manufactory',
-    'marais',
-    'marcella',
-    'marcello',
-    'marcellus',
-    'marchbank',
-    'marcher',
-    'mardenborough',
-    'margarita',
-    'marginalisation',
-    'mariano',
-    'marie-claire',
-    'marinas',
     'marinello',
-    'mariot',
-    'maris',
-    'marischal',
-    'maritza',
-    'market-based',
-    'market-oriented',
-    'marketability',
-    'marko',
-    'marl',
-    'marling',
-    'marmaduke',
-    'marmeladov',
-    'marple',
-    'marseillaise',
-    'marshlands',
     'marvell',
-    'marxian',
-    'mary-claude',
-    'marys',
-    'masailand',
-    'masala',
-    'maskelyne',
-    'masochist',
-    'masques',
-    'massalia',
-    'masterclass',
-    'masterman',
-    'masterminding',
-    'masthead',
-    'mastitis',
-    'masturbate',
     'mata',
-    'match-winning',
-    'mathias',
-    'mattli',
-    'matty',
-    'maudsley',
-    'maule',
-    'maurier',
-    'mauro',
-    'mawr',
-    'maxse',
-    'may-june',
-    'mazzin',
-    'mcarthur',
-    'mcauley',
-    'mccafferty',
     'mccloskey',
-    'mccourt',
-    'mccrory',
-    'mcfadden',
-    'mcgavran',
-    'mcghee',
-    'mcgimpsey',
-    'mcginlay',
-    'mckean',
-    'mckinlay',
-    'mcnulty',
-    'mdc\'s',
-    'mdp',
-    'meads',
-    'meal-times',
-    'meaner',
     'measly',
-    'mebbe',
-    'medea',
-    'medellin',
-    'medians',
-    'meditated',
-    'meditator',
-    'medlock',
-    'meeting-place',
-    'megalomania',
-    'megalomaniac',
-    'megaphone',
-    'megatape',
-    'mehdi',
-    'mei',
-    'meiosis',
     'mekong',
-    'melancholia',
-    'melatonin',
-    'melia',
-    'membranous',
-    'memorised',
-    'menchu',
-    'mendips',
-    'mengele',
-    'menopausal',
-    'merc',
-    'mercator',
-    'merchantability',
-    'mercurian',
-    'merovingians',
-    'meshed',
     'mesmeric',
-    'mestizo',
-    'meta-analysis',
-    'metabolite',
-    'metalinguistic',
-    'metasediments',
-    'metazoan',
-    'methionine',
-    'methodologically',
-    'meths',
-    'metternich',
-    'metzinger',
-    'mev',
-    'mevleviyet',
-    'mewing',
-    'mg/day',
     'mgb',
-    'michaela',
-    'micro-instruction',
-    'microbe',
-    'microchips',
-    'microfilming',
-    'microscopical',
-    'microscopically',
-    'mid-1992',
-    'mid-19th',
-    'mid-glamorgan',
-    'mid-life',
-    'mid-nineteenth-century',
-    'mid-ocean',
-    'mid-season',
-    'mid-seventeenth',
     'midbrain',
-    'middle-',
-    'middle-age',
-    'middle-ranking',
-    'middleman',
-    'middles',
-    'middlesborough',
-    'midrib',
-    'mig',
-    'migraines',
-    'mildmay',
-    'militated',
-    'militates',
-    'milkmen',
-    'milks',
-    'millenium',
     'millfield',
-    'millilitres',
-    'millstones',
-    'milngavie',
-    'milward',
-    'mimms',
-    'min.',
-    'mind-body',
-    'mind-numbing',
-    'mindanao',
-    'mini-skirt',
-    'minicab',
-    'minicomputers',
-    'minimalism',
-    'minimisation',
-    'minion',
     'ministered',
-    'minotaur',
-    'minpins',
-    'mins.',
-    'minsky',
-    'minuses',
-    'minuted',
-    'minx',
-    'miroslav',
-    'misbehaving',
-    'miscarried',
-    'misconstrued',
-    'miscreants',
-    'misfit',
-    'misguidedly',
-    'mish-mash',
     'mishandling',
-    'misinterpret',
-    'mismanaged',
-    'misogynist',
-    'misrepresent',
-    'misspellings',
-    'mitchley',
-    'mizuno',
-    'mla',
-    'mlr',
-    'mls',
-    'mmi',
-    'mmol',
-    'mnemonics',
-    'mobbing',
-    'mobbs',
     'modality',
-    'modeller',
-    'modena',
-    'modularity',
-    'modulating',
-    'modus',
-    'modus_operandi',
-    'modus_vivendi',
-    'moh',
-    'mohicans',
-    'moiety',
-    'mojo',
-    'mol/l',
-    'mola',
-    'moledom',
-    'molina',
     'molineux',
-    'molotov',
-    'moltke',
-    'monboddo',
-    'monchauzet',
-    'mondrian',
-    'monkou',
-    'monkton',
-    'monocytes',
-    'monofilament',
-    'monolayer',
-    'monopolised',
-    'monotheistic',
-    'monstrously',
-    'montenegrin',
-    'montesquieu',
     'mooning',
-    'moorfields',
-    'moorhen',
-    'moorhouse',
-    'moping',
-    'moralist',
-    'moralizing',
-    'morbidly',
-    'mordant',
-    'morelli',
-    'moriarty',
-    'morillon',
-    'moronic',
-    'morte',
-    'mos',
-    'moscato',
     'moser',
-    'mosquitos',
-    'motels',
-    'mothballs',
-    'motherboards',
-    'motiveless',
-    'motor-car',
-    'motorized',
-    'motorsport',
-    'mottram',
-    'moults',
-    'mountfield',
-    'mountford',
-    'moustached',
-    'mouthparts',
-    'mouton',
     'movimiento',
-    'mowatt',
-    'mowed',
-    'moxie',
-    'moy',
-    'moz',
-    'mp/lab',
-    'mravinsky',
-    'mrf',
-    'mrnas',
-    'much-vaunted',
-    'muddied',
-    'muffle',
-    'muggings',
-    'mulberries',
-    'mulcahy',
     'mulford',
-    'mullan',
-    'multi-',
-    'multi-agency',
-    'multi-layered',
-    'multi-lingual',
-    'multi-processors',
-    'multi-tasking',
-    'multi-vendor',
-    'multicellular',
-    'multifactorial',
-    'multipoint',
-    'mulvey',
-    'mumbo-jumbo',
-    'mumford',
-    'mummified',
     'munby',
-    'munton',
-    'muoi',
-    'mup',
-    'muppet',
-    'murderess',
-    'murmansk',
-    'murrell',
-    'mus&eacute;es',
-    'musics',
-    'musketeers',
-    'mussorgsky',
-    'mustang',
-    'mutch',
-    'mutt',
-    'myeloma',
     'myrrh',
-    'mystifying',
-    'n&icirc;mes',
-    'n-grams',
-    'n.c.',
-    'n2',
-    'n3',
-    'n=10',
-    'n=4',
-    'na&iuml;vet&eacute',
-    'naga',
-    'nagaland',
-    'nailsworth',
-    'naish',
-    'nakayama',
-    'naked-eye',
     'nakhichevan',
-    'nanna',
-    'nannerl',
-    'nantwich',
-    'nara',
-    'narmada',
-    'narrating',
-    'nashwan',
-    'nathalie',
-    'naughtiness',
-    'nauseated',
-    'nav',
-    'navarro',
-    'navigated',
-    'naxos',
-    'nayar',
     'nazi-soviet',
-    'nbs',
-    'ncd',
-    'neagh',
-    'neanderthals',
-    'neb',
-    'neckband',
-    'necropolis',
-    'necrotic',
-    'needling',
-    'nefarious',
-    'neh',
-    'nellist',
-    'neo-gothic',
-    'neocortex',
-    'neonates',
     'neons',
-    'neoplastic',
-    'nepomuk',
-    'nerve-wracking',
-    'nes',
-    'nesbitt',
-    'nescafe',
-    'nestor',
-    'netherlandish',
-    'nett',
-    'networker',
-    'neurologist',
-    'neuromuscular',
-    'neurophysiology',
-    'neuroscience',
-    'neurotics',
     'neuter',
-    'neva',
-    'nevill',
-    'nevilles',
-    'newbegin',
-    'newfound',
-    'newish',
-    'newly-elected',
-    'newly-weds',
-    'newsline',
-    'newsreels',
-    'nf',
-    'nhbc',
-    'niba',
-    'nicaea',
-    'nickleby',
     'nicu',
-    'nigerians',
-    'niggles',
-    'nigh_on',
-    'nigra',
-    'nihilism',
-    'nimrod',
-    'nin',
-    'nine-day',
-    'ninetieth',
-    'nino',
-    'nio',
-    'nippv',
-    'nips',
-    'nitrocellulose',
-    'nkomo',
     'nla',
-    'nms',
-    'no-hopers',
-    'noades',
-    'noakes',
-    'nocturne',
-    'noelle',
-    'noirs',
-    'nomenklatura',
-    'non-appearance',
-    'non-availability',
-    'non-book',
-    'non-competitive',
-    'non-consensual',
-    'non-core',
-    'non-deglutitive',
     'non-denominational',
-    'non-diabetics',
-    'non-discrimination',
-    'non-emergency',
-    'non-executives',
-    'non-existence',
-    'non-ferrous',
-    'non-inflammatory',
-    'non-interference',
-    'non-maori',
-    'non-negative',
-    'non-parametric',
-    'non-payers',
-    'non-private',
-    'non-profit-making',
-    'non-recurring',
     'non-sexist',
-    'non-sexual',
-    'non-state',
-    'non-tariff',
-    'non-us',
-    'non-users',
-    'noncommittal',
-    'nonentity',
-    'nonesuch',
-    'nonni',
-    'nonzero',
-    'noradrenaline',
-    'norbury',
-    'normalise',
-    'normanby',
-    'normanton',
     'northam',
-    'northeastern',
-    'northfield',
-    'northwick',
-    'nostalgically',
-    'note-making',
-    'nothings',
-    'notifications',
-    'nott',
-    'nouveaux',
-    'novation',
-    'novello',
-    'novotel',
-    'npp',
-    'nque',
-    'nsp',
     'nth',
-    'ntps',
-    'nubile',
-    'nuer',
-    'nuj',
-    'nujoma',
-    'numeral',
-    'numerate',
-    'nuptial',
-    'nuri',
-    'nurserymen',
-    'nursultan',
-    'nutt',
-    'nutting',
-    'nuzzling',
-    'o\'dowd',
     'o\'farrell',
-    'o\'groats',
-    'o\'kane',
-    'oaf',
-    'oap',
-    'oarsmen',
-    'obeisance',
-    'obex',
-    'obfuscation',
-    'obscenely',
-    'obsolescent',
-    'occidental',
-    'occipital',
-    'octane',
-    'oddbins',
-    'odilo',
     'odium',
-    'odo',
-    'odourless',
-    'ods',
-    'oe',
-    'oestrus',
-    'of\'',
-    'ofa',
-    'off-hand',
-    'off-licences',
-    'off-side',
-    'off-the-peg',
-    'officiate',
-    'officii',
-    'ogata',
-    'ogilvie',
     'ohhh',
-    'oil-producing',
-    'oilskins',
-    'okey-doke',
-    'old-time',
-    'oldman',
-    'oleate',
-    'olf',
-    'oligopolistic',
-    'oligopoly',
-    'olive-green',
-    'olivine',
-    'olney',
-    'omer',
-    'on-chip',
-    'on-loan',
     'onassis',
-    'once-over',
-    'oncogenes',
-    'one-armed',
-    'one-legged',
-    'one-liners',
-    'one-one',
-    'one-person',
-    'onscreen',
-    'oolitic',
-    'oop',
-    'oor',
-    'open-cast',
-    'open-door',
-    'open-field',
-    'open-market',
     'oppressor',
-    'optimally',
-    'orange-red',
-    'orators',
-    'orchestrating',
-    'organics',
-    'orienteering',
-    'orienting',
-    'origen',
-    'ormrod',
-    'orne',
-    'oromo',
-    'orrin',
-    'ortf',
-    'oscillates',
-    'osmond',
     'osred',
-    'oss',
-    'ostriches',
-    'oswaldston',
-    'other-worldly',
-    'otmoor',
-    'otway',
-    'ourself',
-    'out-of-school',
-    'out-of-the-way',
-    'outer-city',
-    'outfield',
-    'outflanked',
-    'outliers',
-    'outperformed',
-    'outriders',
     'outsole',
-    'outta',
-    'outward-looking',
-    'ov',
-    'ova',
-    'ove',
-    'over-',
-    'over-ambitious',
-    'over-confident',
-    'over-enthusiastic',
-    'over-estimated',
-    'over-reacted',
-    'over-simplified',
-    'over-the-top',
-    'over-use',
-    'overdressed',
     'overeating',
-    'overgrazing',
-    'overhangs',
-    'overpopulation',
-    'overruling',
-    'overruns',
-    'oversimplified',
-    'overstressed',
-    'oversupply',
-    'overton',
-    'overtone',
-    'overvalued',
-    'overviews',
-    'overwinter',
-    'overwintering',
-    'ovoid',
     'own-label',
-    'oxygenated',
-    'oxyntic',
-    'ozal',
-    'ozone-friendly',
-    'p&egrave;re',
-    'p-e',
-    'p-labelled',
-    'p.1',
-    'p.a',
-    'p.s.i.',
-    'p.wickerhamii',
-    'p10',
-    'p11',
-    'p=0.02',
-    'pacemakers',
     'pacified',
-    'pacino',
-    'packhorse',
-    'padmore',
-    'paediatrics',
-    'pagnell',
-    'pain\'',
-    'paki',
-    'palacio',
-    'paladin',
-    'palaeontological',
-    'pale-blue',
-    'paleness',
-    'paleontologists',
-    'palestrina',
-    'paling',
     'palisade',
-    'pally',
-    'pamper',
-    'pampering',
-    'pampers',
-    'pandy',
-    'paneth',
-    'pankratin',
-    'pansy',
-    'pantograph',
-    'paparazzi',
-    'papingo',
-    'parabolic',
-    'parachuted',
-    'parachutist',
-    'paradis',
     'paralleling',
-    'paramedic',
-    'paramedical',
-    'paraprofessionals',
-    'parasitology',
-    'parasols',
-    'parcelled',
-    'parcplace',
-    'parcs',
-    'pariah',
-    'paring',
-    'parishioner',
-    'parisians',
-    'parka',
-    'parlous',
-    'parnham',
     'parricide',
-    'parris',
-    'pars',
-    'parsimonious',
-    'particularities',
-    'particulates',
-    'pas_de_deux',
-    'passer',
-    'passers',
-    'passmore',
-    'pastas',
-    'pastes',
-    'paston',
-    'patagonia',
-    'pathophysiological',
-    'pathophysiology',
     'patios',
-    'patriarchate',
-    'patronisingly',
-    'patronize',
-    'pattaya',
-    'pattering',
-    'pattinson',
-    'pattison',
-    'pavia',
-    'pavillon',
-    'paviour',
-    'pavlova',
-    'pawnshop',
-    'pax',
-    'pax&lsqb;b&rsqb',
-    'pay-out',
     'payouts',
-    'pbd',
-    'pbl',
-    'pdf',
-    'peacemakers',
-    'peacemaking',
-    'peaky',
-    'pear-shaped',
-    'pecham',
-    'pedantry',
-    'pedestals',
-    'pedigrees',
-    'pedlars',
-    'peeing',
-    'peerless',
-    'peevish',
     'peevishly',
-    'pelicans',
-    'peloponnesians',
-    'pembridge',
-    'pen-based',
-    'penarth',
-    'pendentives',
-    'penicillium',
-    'penitentiary',
-    'pennants',
-    'penning',
-    'pensione',
-    'pentecostal',
-    'peonies',
-    'pepin',
-    'peppercorn',
     'perambulation',
-    'peremptorily',
-    'perennially',
-    'perforations',
-    'perfumery',
-    'periglacial',
-    'peritoneal',
-    'peritonitis',
-    'permafrost',
-    'permanganate',
-    'peron',
-    'peronist',
-    'perquisites',
-    'persecute',
-    'persecuting',
-    'persecutions',
     'persepolis',
-    'persevering',
-    'persil',
-    'personhood',
-    'pertex',
-    'peruse',
-    'perused',
-    'perusing',
-    'perversions',
-    'perverts',
-    'pesaro',
-    'pestle',
-    'petersen',
-    'petrographic',
-    'petrography',
-    'petrology',
     'pettigrew',
-    'pettiness',
-    'petulantly',
-    'pevsner',
-    'pg/ml',
-    'pgl',
-    'ph.d.',
-    'phalanx',
-    'pham',
-    'phan',
-    'phantasm',
-    'phantasy',
-    'pharisee',
-    'pharmacies',
-    'phc',
-    'phial',
     'philipson',
-    'philomel',
-    'phoenicians',
-    'phospholipase',
-    'phosphorescent',
-    'photosynthetic',
-    'phrasal',
-    'physicality',
-    'pia',
-    'pica',
-    'picador',
-    'picardy',
-    'picchu',
-    'piccolo',
-    'pickford',
-    'pickfords',
     'pickpockets',
-    'pico',
-    'picon',
-    'piecework',
-    'pienaar',
-    'pierpont',
-    'pierrot',
-    'pigmented',
-    'pil',
-    'pilasters',
-    'pillaging',
-    'pillared',
-    'pillowcases',
-    'pimpernel',
-    'pimples',
-    'pims',
     'pin-ups',
-    'pininfarina',
-    'pinioned',
-    'pinker',
-    'pipettes',
-    'piphros',
-    'pipits',
-    'piraeus',
-    'pirouette',
-    'pitta',
-    'pivoted',
-    'pizarro',
-    'pkc',
-    'placated',
-    'placating',
-    'plagioclase',
     'plain-clothes',
-    'plainclothes',
-    'plainness',
-    'plaint',
-    'planetarium',
-    'planktonic',
-    'plante',
-    'plasterer',
-    'platz',
-    'playability',
-    'playfair',
-    'playmate',
-    'playmates',
-    'playthings',
-    'plcs',
-    'pled',
     'plekhanov',
-    'plenipotentiary',
-    'plosive',
-    'plp',
-    'plumford',
-    'pm.',
-    'pmol',
-    'pms',
-    'pock-marked',
-    'poetically',
-    'pogrom',
-    'pogues',
-    'pointon',
-    'pointy',
-    'polarities',
-    'polarizing',
     'policy-maker',
-    'polka',
-    'pollinated',
-    'pollutions',
-    'polychlorinated',
-    'polychrome',
-    'polyclonal',
-    'polygyny',
-    'polymerisation',
-    'polymorphisms',
-    'polytheism',
-    'polyunsaturates',
-    'pomeranian',
-    'pontins',
-    'pontius',
-    'poof',
     'popham',
-    'pople',
-    'poppa',
-    'popple',
-    'populate',
-    'populists',
-    'pored',
-    'portakabin',
-    'portcullis',
-    'portents',
-    'portes',
-    'porthole',
-    'poser',
-    'positing',
-    'positivistic',
-    'possessors',
     'post-',
-    'post-16',
-    'post-classical',
-    'post-communist',
-    'post-independence',
-    'post-match',
-    'post-production',
-    'post-punk',
-    'post-school',
-    'postclassical',
-    'postcranial',
-    'postmortem',
-    'poststructuralist',
-    'pot-bellied',
-    'potable',
-    'potentilla',
     'pothole',
-    'pottz',
-    'poul',
-    'poulenc',
-    'powerboat',
-    'powerhead',
-    'powers-that-be',
-    'powis',
-    'ppa',
-    'prabhakar',
-    'practicability',
-    'prattle',
-    'prc',
-    'pre-christian',
-    'pre-columbian',
-    'pre-conquest',
     'pre-date',
-    'pre-dawn',
-    'pre-defined',
-    'pre-exposed',
-    'pre-marital',
-    'pre-menstrual',
-    'pre-packed',
-    'pre-raphaelites',
-    'pre-requisite',
-    'pre-revolutionary',
-    'pre-training',
-    'prean',
-    'precluding',
-    'predate',
-    'predates',
-    'predeceased',
     'predefined',
-    'predestined',
-    'predilections',
-    'predisposing',
-    'prefaces',
-    'prefixed',
-    'preincubation',
-    'prejudge',
-    'prejudicing',
-    'preludes',
-    'premarital',
-    'preordained',
-    'presbyterianism',
-    'prescient',
-    'pressmen',
-    'pressurise',
     'prest',
-    'pretenders',
-    'pretentiousness',
-    'preterm',
-    'prevarication',
-    'price-fixing',
-    'price-performance',
-    'price/performance',
-    'prickled',
-    'priestgate',
-    'primatial',
-    'prime-time',
-    'primitivism',
-    'primogeniture',
-    'primus',
-    'print-outs',
     'printmaking',
-    'priors',
-    'prisoners-of-war',
-    'pritchett',
-    'private-eye',
-    'privates',
-    'prize-giving',
-    'prizewinners',
-    'pro-european',
-    'pro-soviet',
-    'probationer',
-    'probationers',
-    'proboscis',
-    'proclivities',
-    'professing',
-    'professional-managerial',
     'professionality',
-    'proffer',
-    'proffering',
-    'profiled',
-    'profit-sharing',
-    'prog',
-    'projectile',
-    'proline',
-    'prong',
-    'proofread',
-    'proops',
-    'propionate',
-    'prosodic',
-    'prospectors',
-    'prospering',
-    'prostration',
     'prot&eacute;g&eacute;s',
-    'protean',
-    'protectiveness',
-    'proteolytic',
-    'prototypical',
-    'protozoa',
-    'protrude',
-    'proudie',
-    'prout',
-    'provisionals',
-    'provos',
-    'prozac',
-    'prudish',
-    'prurient',
-    'pryce',
-    'ps.',
     'ps2/30',
-    'psa',
-    'pseudomelanosis',
-    'psl',
-    'psoriasis',
-    'psp',
-    'psr',
-    'pst',
-    'psychoanalytical',
-    'psychobiology',
-    'public-school',
-    'publicizing',
-    'publics',
-    'puffer',
-    'puk',
-    'pull-down',
     'pullovers',
-    'punchy',
-    'punctures',
-    'puncturing',
-    'punishers',
-    'punishes',
-    'punts',
-    'puree',
-    'puri',
-    'purl',
-    'purposeless',
-    'purser',
-    'purves',
-    'pusey',
-    'push-button',
-    'push-fit',
     'pusher',
-    'put-down',
-    'putnam',
-    'putrefaction',
-    'putsch',
-    'putters',
-    'puwp',
-    'pwl',
-    'pyroclastic',
-    'pythagoreans',
-    'q.c.',
-    'q3',
-    'qaly',
-    'qbd',
-    'qe2',
-    'qed',
     'quacks',
-    'quadra',
-    'qualm',
-    'quanta',
-    'quashing',
-    'quasi',
-    'quasi-judicial',
-    'quatrain',
-    'quaver',
-    'quavering',
-    'quelling',
-    'quenching',
-    'quick-witted',
-    'quickens',
-    'quickie',
-    'quickness',
     'quiescence',
-    'quin',
-    'quintus',
-    'quips',
-    'quirke',
-    'quoits',
-    'r&eacute;publique',
-    'r&eacute;union',
-    'r&ocirc;le',
-    'r\'',
-    'r.s.',
-    'r.t.r.',
-    'r/3',
-    'r/t',
-    'r4400',
-    'raab',
     'raaf',
-    'rabbiting',
-    'raby',
-    'racecourses',
-    'racedown',
-    'racegoers',
-    'racialism',
-    'raconteur',
-    'radars',
-    'radcliffe-brown',
-    'radially',
-    'radiative',
-    'radiographic',
-    'radiometric',
-    'radishes',
-    'radium',
     'rafter',
-    'ragbag',
-    'ragusa',
-    'railroads',
-    'railwayman',
-    'raimundo',
-    'rain-soaked',
-    'rainford',
-    'raiser',
-    'raisers',
-    'raison',
-    'raith',
-    'ralarth',
-    'ramaphosa',
-    'ramsbottom',
-    'ramsbum',
     'ramus',
-    'ranchers',
-    'randomization',
-    'rangy',
-    'ranson',
-    'ranted',
-    'ranters',
-    'ranunculus',
-    'rap30',
-    'raptors',
-    'rapturously',
-    'rassendyll',
-    'rasta',
-    'rathcoole',
-    'rationalising',
-    'rationalizing',
     'ravaging',
-    'raved',
-    'ravenously',
-    'ravers',
-    'rawlinson',
-    'rawson',
-    'rayne',
-    'razzmatazz',
-    'rcaf',
-    'rdbms',
-    'rdc',
-    're-assessment',
-    're-employment',
-    're-enact',
-    're-erected',
-    're-evaluate',
     're-examining',
-    're-introduced',
-    're-issue',
-    're-issued',
-    're-named',
-    're-released',
-    're-routed',
-    're-united',
-    'reactance',
-    'readied',
-    'readjust',
-    'readout',
-    'reappointment',
-    'rear-admiral',
-    'reassures',
-    'rebekah',
     'recapitulate',
-    'recapitulation',
-    'recasting',
-    'recedes',
-    'reciprocating',
-    'reciprocation',
-    'recitatives',
-    'recoiling',
-    'recommence',
-    'reconnection',
-    'recruiter',
-    'rectifier',
-    'rectifying',
-    'recuperating',
-    'recycles',
-    'red-brown',
     'red-eyed',
-    'red-gold',
-    'redcurrant',
-    'redding',
-    'reddish-brown',
-    'redecorate',
-    'redeemer',
-    'redeploy',
-    'redistributing',
-    'redman',
-    'redoubt',
-    'redressing',
-    'reeked',
-    'reenan',
-    'refereed',
-    'refitted',
     'refluxed',
-    'reforestation',
-    'reform-minded',
-    'refundable',
-    'refutes',
-    'regains',
-    'regeling',
-    'reggane',
-    'registrable',
-    'registries',
-    'regnum',
-    'regressions',
-    'regrowth',
-    'regurgitation',
-    'reheat',
-    'rehouse',
     'reiksguard',
-    'reinfection',
-    'reinforcer',
-    'reinhard',
-    'reinstating',
-    'reinterpret',
-    'reintroducing',
-    'reinvest',
-    'reissues',
-    'relapses',
-    'relativist',
-    'relevancy',
-    'relns',
-    'remade',
-    'reminisce',
-    'reminisced',
     'remits',
-    'remixed',
-    'remixes',
-    'remo',
-    'remorseful',
-    'remunerative',
-    'remy',
-    'renate',
-    'renews',
-    'rennes',
-    'renumbered',
-    'repaint',
-    'repainting',
-    'repealing',
-    'repens',
-    'repentant',
     'repented',
-    'replant',
-    'replicates',
-    'reposition',
-    'repositioned',
-    'repositioning',
-    'reproaches',
-    'repudiating',
-    'requisites',
-    'reread',
-    'rerun',
-    'resected',
-    'reselling',
-    'resenence',
-    'resettle',
-    'residuum',
     'resistive',
-    'resit',
-    'resounded',
-    'respectably',
-    'restitutionary',
-    'resurface',
-    'resuscitated',
-    'retched',
-    'retinas',
-    'retinues',
-    'retiral',
-    'returnable',
-    'reuptake',
-    'reuss',
-    'revalue',
-    'revamping',
     'revelatory',
-    'revelry',
-    'revere',
-    'revisionism',
-    'revisiting',
-    'revives',
-    'revlon',
-    'revoking',
-    'revolvers',
-    'rework',
-    'rewrites',
-    'rfc',
-    'rib-cage',
-    'riccardo',
-    'richelieu',
-    'richman',
     'rickards',
-    'rickshaw',
-    'ricocheted',
-    'riddance',
-    'ridiculing',
-    'riesling',
-    'right-thinking',
-    'right-wingers',
-    'righthand',
-    'rightist',
-    'rightists',
-    'righto',
-    'rigidities',
-    'rigmarole',
-    'rijksmuseum',
-    'rik',
     'riled',
-    'rimbaud',
-    'ringaskiddy',
-    'ringleaders',
-    'rioch',
-    'ripeness',
-    'rippon',
-    'risible',
-    'ritualized',
-    'rivington',
-    'rivoli',
-    'rjr',
-    'rnas',
-    'rnase',
-    'rnr',
-    'roadways',
     'robarts',
-    'roch',
-    'rock-bottom',
-    'rockery',
-    'rodolfo',
-    'roel',
-    'roguish',
-    'rokeya',
-    'roll-call',
-    'roll-on',
-    'romana',
-    'romanies',
-    'romer',
-    'romping',
-    'romulus',
-    'ronay',
     'rondo',
-    'roofless',
-    'rootstocks',
-    'ropati',
-    'ropley',
-    'rosario',
-    'roscarrock',
-    'rose-tinted',
-    'rosebud',
-    'rosedale',
-    'rossmayne',
-    'rosso',
-    'rosters',
-    'rotas',
-    'rother',
-    'rothman',
     'rotonde',
-    'rough-hewn',
-    'roughed',
-    'roughened',
-    'roughs',
-    'round-robin',
-    'roundhay',
-    'rowers',
-    'rrna',
-    'rtc',
-    'rtr',
-    'rua',
-    'ruane',
-    'ruben',
-    'rubra',
-    'rudston',
     'rugger',
-    'ruislip',
-    'rumbustious',
-    'runciman',
-    'runefang',
-    'rural-urban',
-    'rusk',
-    'russo',
-    'rutherglen',
-    'rw',
-    's&aacute;nchez',
-    's&amp;m',
-    's&amp;p',
-    's&egrave;vres',
-    's-transferase',
-    's.2',
     's.a.e.',
-    's.t',
-    's/l',
-    's13',
-    'saadi',
-    'saavedra',
-    'sacha',
-    'sachin',
-    'sackler',
-    'sacrilegious',
-    'sadberge',
-    'saddler',
-    'saddlery',
-    'saddling',
-    'sagacity',
-    'sages',
     'saharan',
-    'sahn',
-    'sajudis',
-    'salcey',
-    'saleroom',
-    'salerooms',
-    'salesforce',
-    'salop',
-    'salperton',
-    'salubrious',
-    'salutation',
-    'salvaging',
-    'salvatore',
-    'samara',
-    'samian',
-    'samoan',
     'samphan',
-    'samplers',
-    'samsonov',
-    'samuels',
-    'samways',
-    'sancho',
-    'sandal',
-    'sanday',
-    'sandbank',
-    'sandgrouse',
-    'sandor',
-    'sandpipers',
-    'sandpit',
-    'sandrat',
-    'sanford',
-    'sangria',
     'sanhedrin',
-    'sanitised',
-    'sankoff',
-    'sapling',
-    'sapping',
-    'saragossa',
-    'saratoga',
-    'saratov',
-    'sarcoidosis',
-    'sardis',
-    'sarfu',
-    'sarge',
-    'sars',
-    'sarum',
-    'saruman',
-    'sashes',
     'sated',
-    'satie',
-    'satiety',
-    'satirist',
-    'satisfyingly',
-    'saunas',
-    'saunter',
-    'savacentre',
-    'saviours',
-    'savvy',
-    'sayeed',
-    'sbk',
-    'scafell',
-    'scalloped',
-    'scamper',
-    'scantily',
     'scatters',
-    'scawsby',
-    'scc',
-    'scd2',
-    'scheer',
-    'schengen',
-    'schiaparelli',
-    'schiffer',
-    'schizophrenics',
-    'schmitt',
-    'schnapps',
-    'scholl',
-    'school-age',
-    'schoolfriend',
-    'schott',
-    'schweitzer',
     'sciatica',
-    'science-fiction',
-    'scintillation',
-    'sclerite',
-    'scoot',
-    'scorning',
-    'scourie',
-    'scratchplate',
-    'screwed-up',
-    'scribbles',
-    'scriptwriter',
-    'scrivener',
-    'scroungers',
-    'scrummaging',
-    'scrumpy',
-    'scrunched',
     'scruple',
-    'scruton',
-    'scs',
-    'scsi-2',
-    'scudding',
-    'scuffing',
-    'sculley',
-    'sculpting',
-    'scurry',
-    'scythed',
-    'se&ntilde;ora',
-    'seabird',
-    'seacombe',
-    'seafield',
-    'seagate',
-    'seager',
     'seagram',
-    'sealer',
-    'seance',
-    'seaport',
-    'seaq',
-    'seascape',
-    'seasonality',
-    'seato',
-    'seaview',
-    'seawards',
-    'sebadoh',
-    'second-',
-    'secondaries',
-    'secondarily',
-    'secularization',
-    'sederunt',
     'sedgemoor',
-    'seemly',
-    'segmenting',
-    'segni',
-    'seigneur',
-    'seko',
-    'sela',
-    'selectable',
-    'selene',
-    'selenium',
-    'self-absorption',
-    'self-analysis',
-    'self-assertion',
-    'self-belief',
-    'self-build',
-    'self-concept',
     'self-congratulation',
-    'self-declared',
-    'self-definition',
-    'self-monitoring',
-    'self-portraits',
-    'self-possessed',
-    'self-reflection',
-    'self-rule',
-    'self-same',
-    'self-understanding',
-    'selfridge',
-    'sell-offs',
-    'semester',
-    'semi-official',
-    'semicircle',
-    'semiology',
     'semitic',
-    'semple',
-    'senatorial',
-    'senor',
-    'sens',
-    'sensationalism',
-    'sensationally',
-    'sensitised',
-    'sensitization',
-    'sensuously',
-    'sentencer',
-    'sequels',
-    'ser',
-    'sergia',
-    'seri',
-    'serie',
     'serif',
-    'serine',
-    'serota',
-    'serried',
-    'serviceman',
-    'sese',
-    'sesostris',
-    'setter',
-    'seurat',
-    'seventh-century',
-    'severus',
-    'seveso',
-    'sexless',
-    'sez',
-    'shabba',
-    'shakers',
     'shambled',
-    'shambolic',
-    'shampooing',
-    'shand',
-    'shaper',
-    'shard',
-    'shatalin',
-    'shaughnessy',
-    'shaver',
-    'shawcross',
-    'sheedy',
-    'sheehan',
-    'sheik',
-    'shelduck',
-    'shellac',
-    'shellfire',
     'sheppey',
-    'sherd',
-    'shereen',
-    'sheron',
-    'shew',
-    'shipley',
-    'shiraz',
-    'shirking',
-    'shoeing',
-    'shoelaces',
-    'shona',
-    'shoo',
-    'shooters',
-    'shoplifters',
-    'shorelines',
-    'short-changed',
     'short-list',
-    'short-listed',
-    'short-sightedness',
-    'short-wave',
-    'shortcuts',
-    'shortens',
-    'shotover',
-    'showmanship',
-    'shp',
-    'shreeves',
-    'shuffles',
-    'shutt',
-    'shuttles',
-    'shying',
-    'siam',
-    'side-street',
     'side-streets',
-    'sideburns',
-    'sidereal',
-    'sideshows',
-    'sidestepped',
-    'sidgwick',
-    'sidling',
-    'sight-seeing',
-    'signally',
-    'signalmen',
-    'signers',
-    'signore',
-    'signposting',
-    'sii',
-    'silber',
-    'silo',
     'silted',
-    'silting',
-    'silty',
-    'silver-grey',
-    'silver-plated',
-    'silvers',
-    'silvester',
-    'simonds',
-    'simpering',
-    'sindy',
-    'single-person',
-    'single-step',
-    'singlet',
-    'sinhala',
-    'sinning',
-    'sino-british',
     'sino-soviet',
-    'sion',
-    'sippl',
-    'sires',
-    'sisley',
-    'sissons',
-    'sisterhood',
-    'sisterly',
-    'sisters-in-law',
-    'sit-down',
-    'site-specific',
-    'sitka',
-    'sittin\'',
-    'sitwell',
-    'six-figure',
-    'six-hour',
     'six-month-old',
-    'sixth-formers',
-    'sixty-nine',
-    'sizzled',
-    'sjahrir',
-    'skated',
-    'skew',
-    'skiff',
-    'skimmers',
-    'skimp',
-    'skirmishers',
-    'skirmishing',
-    'sky-high',
-    'skylarks',
-    'slackness',
-    'sladen',
     'slane',
-    'slashes',
-    'slatter',
-    'slayer',
-    'sleepiness',
-    'sleeved',
-    'sleuth',
-    'slewed',
-    'slighted',
-    'slipshod',
-    'slipstream',
-    'slitting',
-    'slogging',
-    'slow-growing',
-    'slow-motion',
-    'slr',
     'slumming',
-    'slurp',
-    'slurring',
-    'small-signal',
-    'smaller-scale',
-    'smalley',
-    'smarten',
-    'smc',
-    'smeaton',
-    'smelters',
-    'smg',
-    'smocks',
-    'smogs',
-    'smote',
-    'smoulder',
-    'smyrna',
     'sn',
-    'snarls',
-    'sniggering',
-    'snippet',
-    'snivelling',
-    'snizort',
-    'snobs',
-    'snog',
-    'snook',
-    'snot',
-    'snotty',
-    'snow-capped',
-    'snowballs',
-    'snowflake',
-    'snuggle',
-    'snuggling',
     'soaks',
-    'sobchak',
-    'social-security',
-    'sociocultural',
-    'socratic',
-    'softener',
-    'softie',
-    'soldiery',
-    'solicitously',
-    'solidify',
-    'solipsism',
-    'solitaire',
-    'soma',
-    'somervillians',
-    'somoza',
-    'soo',
     'soonest',
-    'soothes',
-    'soper',
-    'sopranos',
-    'sorbet',
-    'soren',
-    'sorge',
-    'sorley',
-    'sorrowfully',
-    'souk',
-    'soule',
-    'soundblaster',
-    'soundtracks',
-    'sous',
-    'sousa',
-    'soutine',
     'sowerberry',
-    'spaak',
-    'space-age',
-    'space-like',
-    'space-times',
-    'spaceport',
-    'spaceships',
-    'spacesuit',
-    'spaniels',
-    'sparcs',
-    'sparkles',
-    'sparkly',
-    'sparky',
-    'spassky',
-    'spats',
-    'spattering',
     'spearheading',
-    'spearmen',
-    'specfp',
-    'speciale',
-    'specint',
-    'spect',
-    'speedwell',
-    'spendthrift',
-    'spey',
-    'spg',
-    'sphagnum',
-    'spinsters',
-    'spitefully',
-    'splat',
-    'splatter',
-    'split-level',
     'splurge',
-    'spoiler',
-    'sponsorships',
-    'spook',
-    'spotter',
-    'spotters',
-    'spouts',
-    'sprague',
-    'sprain',
-    'spreadeagled',
-    'spring-loaded',
-    'sprites',
-    'spru',
-    'spry',
-    'spuc',
-    'spud',
     'spume',
-    'squelched',
-    'squier',
-    'squiggles',
-    'squirts',
-    'sry',
-    'stac',
-    'stacker',
-    'staffer',
-    'staffers',
-    'stage-managed',
-    'staggeringly',
-    'stalactites',
-    'stamens',
-    'stamfordham',
-    'standalone',
     'standin\'',
-    'standpoints',
-    'stanger',
-    'stanislav',
-    'stapled',
-    'starke',
-    'starkey',
-    'starline',
-    'starry-eyed',
-    'starship',
-    'stash',
-    'statham',
-    'stationer',
-    'stationmaster',
-    'statuesque',
-    'statuses',
     'ste',
-    'steadiness',
-    'stealer',
-    'steamroller',
-    'steams',
-    'steeds',
-    'steeling',
-    'steelwork',
-    'steep-sided',
-    'steerage',
-    'steinberg',
-    'stenness',
-    'step-father',
-    'step-mother',
-    'stepbrother',
-    'stephan',
     'stepping-stones',
-    'stereos',
-    'stereoscopic',
-    'sterilising',
-    'sterilization',
-    'sterilized',
-    'stewing',
-    'stiarkoz',
-    'stickleback',
-    'stig',
-    'stigmata',
-    'stigmatised',
-    'stigmatized',
-    'stingy',
-    'stinker',
-    'stipends',
     'stm',
-    'sto',
-    'stocker',
-    'stockholders',
-    'stockholding',
-    'stockinged',
-    'stockpiled',
-    'stocktaking',
-    'stoichiometry',
-    'stoking',
-    'stomp',
-    'stompie',
-    'stoner',
-    'stoney',
-    'stony-faced',
-    'stooges',
     'stoops',
-    'stop-go',
-    'stopes',
-    'store-room',
-    'storeman',
-    'storks',
-    'stourhead',
-    'stoute',
-    'stouter',
-    'straight-backed',
-    'straitened',
-    'straker',
-    'strana',
-    'strangford',
-    'strawson',
-    'streamer',
     'strelsau',
-    'streptokinase',
-    'stretchered',
-    'stretton',
-    'strewth',
-    'strickland',
-    'stridently',
-    'striping',
-    'strobe',
-    'strolls',
-    'strong-minded',
-    'stroppy',
-    'strummer',
-    'strumming',
-    'strychnine',
-    'student-centred',
     'stumping',
-    'stunner',
-    'stuntman',
-    'stupefied',
-    'sturdily',
-    'sub-assemblies',
-    'sub-editor',
-    'sub-national',
-    'sub-species',
-    'sub-title',
-    'sub-tropical',
-    'subcortical',
-    'subducted',
-    'subduing',
-    'subfamily',
-    'subject-based',
     'subjectivism',
-    'sublet',
-    'submucosal',
-    'subpolar',
-    'subroutines',
-    'subsist',
-    'subsisted',
-    'subversives',
-    'successions',
-    'sud',
-    'sudden-death',
-    'suds',
-    'sufferance',
-    'sui_generis',
-    'sulgrave',
-    'sulks',
     'sullied',
-    'summerhill',
-    'summery',
-    'sun-drenched',
-    'sunbeams',
-    'sunburnt',
-    'sunconnect',
-    'sundown',
-    'sunless',
-    'sunnet',
-    'sunning',
-    'sunscreens',
-    'sunspots',
-    'superannuated',
-    'superconductivity',
-    'superconductor',
     'superimposing',
-    'superlatives',
-    'supermodels',
-    'supersight',
-    'supra',
-    'supranationalism',
-    'surbiton',
-    'surcharges',
-    'surfed',
-    'susanne',
-    'suspender',
-    'suss',
-    'suvarov',
-    'svalbard',
-    'swaddled',
-    'swag',
     'swaggering',
-    'swags',
-    'swansong',
-    'swat',
-    'swayze',
-    'sweatshop',
-    'sweepers',
-    'sweeties',
-    'sweetman',
-    'swilled',
-    'swilling',
-    'swimfeeder',
-    'swinburne',
-    'swiped',
-    'sx',
-    'sy',
     'sycophantic',
-    'sydrome',
-    'symap',
-    'symmetrically',
-    'symmetries',
-    'symposia',
-    'synchronisation',
-    'synchronise',
-    'synchronization',
-    'synchrotron',
-    'syndicat',
-    'synergistic',
-    'syntactical',
-    'synthesising',
-    'synthesizer',
-    'synthetics',
     'sys',
-    'systemes',
-    't&ouml;pfer',
-    't-junction',
-    't7',
-    'tabard',
-    'tabasco',
-    'tabletop',
-    'tace',
-    'tactician',
-    'tadjikistan',
-    'taffy',
-    'tagset',
-    'tagsets',
-    'tai_chi',
-    'tail-end',
     'taille',
-    'tailpiece',
-    'takin\'',
-    'talc',
-    'talmud',
-    'tambourine',
-    'tambov',
-    'tameside',
-    'tampax',
-    'tangling',
-    'tanjug',
-    'tanners',
-    'tannery',
-    'tarantula',
-    'tarbes',
-    'targetted',
     'tarnish',
-    'taro',
-    'tarvaras',
-    'tasman',
-    'tasselled',
-    'tatar',
-    'tatarstan',
-    'tatiana',
-    'tatler',
-    'tatton',
-    'taverner',
-    'tavernier',
-    'tax-efficient',
-    'tax-exempt',
-    'tax-payers',
-    'tbc',
     'teacher-pupil',
-    'teacups',
-    'tealtaoich',
-    'teammates',
-    'teapots',
-    'tear-stained',
-    'teaser',
-    'teases',
-    'teat',
-    'teats',
-    'technicolor',
-    'teflon',
-    'tek',
-    'telefon',
-    'telegraphic',
-    'teleology',
     'telephonist',
-    'teleprinter',
-    'televisa',
-    'telltale',
-    'tempi',
-    'temporality',
-    'tendring',
-    'tenors',
-    'tented',
-    'term-time',
-    'terri',
-    'territoriality',
-    'testicle',
-    'testy',
-    'text-book',
-    'textuality',
     'tg',
-    'thais',
-    'thematically',
-    'theogonist',
-    'thera',
-    'thereunder',
-    'thermally',
-    'thesiger',
-    'thespian',
-    'thinkin\'',
-    'thins',
-    'thir',
-    'third-century',
-    'third-placed',
-    'third-round',
-    'thorndyke',
     'thought-out',
-    'thr',
-    'thrale',
-    'three-bedroomed',
-    'three-cornered',
-    'three-door',
-    'three-fifths',
-    'three-mile',
-    'three-stage',
-    'three-tier',
-    'thrombin',
-    'thrombus',
-    'throttles',
-    'through_thick_and_thin',
-    'throwers',
-    'thruppence',
     'thumbs-up',
-    'thun',
-    'thunderbird',
-    'thunders',
-    'thurs',
-    'thwarting',
-    'tiare',
-    'tiberius',
-    'tidier',
-    'tie-in',
-    'tierney',
-    'tierra',
-    'tighthead',
-    'tigre',
-    'tigris',
-    'tiler',
     'tilney',
-    'timber-frame',
-    'time-table',
-    'time-wasting',
-    'timekeeping',
-    'timelessness',
-    'timeliness',
-    'timms',
-    'timpani',
-    'tinbergen',
-    'tindle',
-    'tinkered',
-    'tintagel',
-    'tiphook',
-    'tippy',
-    'tiptoeing',
     'tit-for-tat',
-    'titania',
-    'titcombe',
-    'titillation',
-    'titius',
-    'titter',
-    'titular',
-    'tj',
-    'tma',
-    'tnf-&agr',
-    'tobolsk',
-    'tobruk',
-    'today/',
-    'toddington',
-    'toff',
-    'toffees',
     'toils',
-    'tokai',
-    'tokamak',
-    'tolling',
-    'tomas',
-    'tomba',
-    'tomlin',
-    'tongan',
-    'tonsure',
-    'toot',
-    'toothbrushes',
-    'toothy',
-    'top-notch',
-    'topknot',
-    'topsy',
-    'topsy-turvy',
     'torfaen',
-    'tornadoes',
-    'torsades',
-    'tortilla',
-    'torturer',
-    'tortures',
-    'totemic',
-    'touchdowns',
-    'toughen',
-    'touraine',
-    'tourniquet',
-    'townscape',
-    'tplf',
-    'tps',
-    'tr&egrave;s',
-    'tr1',
     'tra',
-    'tracheal',
-    'trackside',
-    'tracksuits',
-    'trade-in',
-    'traffic-free',
-    'tramcar',
-    'tramcars',
-    'transceiver',
-    'transfer-listed',
-    'transfigured',
-    'transgress',
-    'transients',
-    'transmissible',
-    'transmittal',
-    'transom',
     'transpennine',
-    'transporters',
-    'transputers',
-    'transracial',
-    'traor&eacute',
-    'trattoria',
-    'trax',
-    'trazior',
-    'treadwell',
-    'treasonable',
-    'treasuries',
-    'trebles',
-    'treeline',
-    'trefoil',
-    'trekked',
-    'trembles',
     'tremulously',
-    'trepolov',
-    'treuhand',
-    'trevi',
-    'treviso',
-    'triano',
-    'triaxis',
-    'trice',
-    'tricolour',
-    'tricyclic',
-    'trig',
-    'trimdon',
-    'trinidadian',
-    'trios',
-    'tristar',
-    'trivers',
     'triviality',
-    'trocadero',
-    'trooping',
-    'trouble-makers',
-    'truants',
-    'truckers',
-    'truffle',
-    'trujillo',
-    'tryin\'',
-    'tsarism',
-    'tsr',
-    'ttt',
-    'tuckey',
-    'tucson',
-    'tuff',
-    'tug-of-war',
     'tullichettle',
-    'tumbledown',
-    'tuners',
-    'tunguska',
-    'tunings',
-    'tunnelled',
-    'tupper',
-    'turakina',
-    'turbid',
-    'turgenev',
-    'turmeric',
-    'turn-of-the-century',
-    'turn-taking',
-    'turners',
-    'turnovers',
-    'turpi',
     'turvey',
-    'tutted',
-    'tutti',
-    'tutu',
-    'twaddle',
-    'twenty-four-hour',
-    'twenty-fourth',
-    'twice-weekly',
-    'twiddling',
-    'twin-engined',
-    'twinges',
-    'twirl',
-    'twitches',
-    'twite',
-    'two-bedroomed',
-    'two-car',
     'two-edged',
-    'two-faced',
-    'two-horse',
-    'two-litre',
-    'two-parent',
-    'two-phase',
-    'two-volume',
-    'twopence',
-    'twosome',
-    'tww',
-    'tycoons',
-    'tylor',
-    'tynedale',
-    'typewriting',
-    'tyrannosaurus',
-    'tzu',
     'u-shaped',
-    'u/l',
-    'u/ml',
-    'ub',
-    'ub40',
-    'ud',
-    'uf9',
-    'ugc',
-    'uhm',
-    'ulf',
-    'ulm',
-    'ultra-right',
-    'ultrastructural',
-    'umbrage',
-    'umpiring',
-    'unambitious',
     'unappreciated',
-    'unasked',
-    'unavailability',
-    'unbecoming',
-    'unbeliever',
-    'unbleached',
-    'unbutton',
-    'unchallengeable',
-    'unchangeable',
-    'uncharitable',
-    'unclimbed',
-    'unco-operative',
-    'uncollected',
-    'unconcern',
-    'unconditioned',
-    'unconformity',
     'uncongenial',
-    'unconscionable',
-    'unconsidered',
-    'uncontested',
-    'unconvincingly',
-    'uncrowded',
-    'unctad',
-    'uncultivated',
-    'under-15',
-    'under-16',
-    'under-19',
-    'under-21s',
-    'under-developed',
-    'under-estimated',
-    'underarm',
-    'undercroft',
     'underdogs',
-    'underframe',
-    'underlain',
-    'underlings',
-    'underpinnings',
-    'underscored',
-    'undertow',
-    'underused',
-    'undies',
-    'undocumented',
-    'unearthing',
-    'unendurable',
-    'unexamined',
-    'unfaithfulness',
-    'unforeseeable',
-    'unfurnished',
     'unger',
-    'ungovernable',
-    'ungracious',
-    'ungraciously',
-    'unheard-of',
-    'unigate',
-    'unilateralism',
-    'unilinear',
-    'uninformative',
-    'unintelligent',
-    'univ',
-    'universalism',
-    'unlovely',
-    'unmistakeable',
-    'unmolested',
-    'unnerve',
     'unobstructed',
-    'unorganised',
-    'unp',
-    'unpainted',
-    'unplayable',
-    'unplugged',
-    'unquantifiable',
-    'unromantic',
-    'unsaleable',
-    'unschooled',
-    'unseat',
-    'unsociable',
-    'unspeakably',
-    'unspecific',
-    'untcok',
-    'untidiness',
     'untouchables',
-    'untranslated',
-    'untruth',
-    'unturned',
-    'unvarying',
-    'unwelcoming',
-    'unwholesome',
-    'unwins',
-    'unwrap',
-    'uph',
-    'upholds',
-    'uplifts',
-    'uppsala',
-    'upraised',
-    'upstarts',
-    'urbino',
     'urinal',
-    'urinate',
-    'urr',
-    'uruguayan',
-    'us&dollar;10,000',
-    'us&dollar;2,000',
-    'us.',
-    'usborne',
-    'usdollars',
-    'uselessness',
-    'user-supplied',
-    'ut',
-    'utero',
-    'uts',
-    'vacantly',
-    'vacuuming',
     'vagabond',
-    'vaguer',
-    'valedictory',
-    'valency',
-    'validates',
-    'valkyrie',
-    'valor',
-    'value-for-money',
-    'value-free',
-    'vanavskaya',
-    'vanbrugh',
-    'vandalized',
-    'vashinov',
-    'vasquez',
-    'vassiliou',
-    'vauban',
     'veblen',
-    'velvets',
-    'veneered',
-    'veneto',
-    'venn',
-    'ventilate',
-    'verba',
-    'verbivore',
-    'verbose',
-    'verger',
-    'verities',
-    'vermeer',
-    'vermuyden',
-    'vernons',
-    'verrill',
-    'vers',
     'vertebra',
-    'vertiginous',
-    'vespers',
-    'vessey',
-    'veuve',
-    'vezir',
-    'vi\'s',
-    'viaducts',
-    'vibrates',
-    'vice-marshal',
-    'vice-presidency',
-    'vice-presidential',
-    'vicini',
-    'viciousness',
-    'vico',
-    'vicomte',
     'videocassette',
-    'videotapes',
-    'vidor',
-    'vieira',
-    'vienne',
-    'vientiane',
-    'vigils',
-    'vignette',
-    'vignettes',
-    'vii\'s',
-    'viii\'s',
-    'vilification',
-    'vincennes',
-    'vindictiveness',
-    'viol',
-    'violeta',
     'virgilio',
-    'visage',
-    'visser',
-    'vistula',
-    'visualising',
-    'visualizing',
-    'vitali',
-    'vitreous',
-    'vitus',
-    'vivisection',
-    'vladislav',
-    'vldl',
-    'vocalists',
-    'vocally',
-    'vocationally',
-    'vols',
     'voltmeter',
-    'vos',
-    'voyeurism',
-    'voyeuristic',
-    'vries',
-    'vsam',
-    'vt',
-    'vu',
-    'vukovar',
-    'w&ouml;rner',
-    'waafs',
-    'waals',
-    'waddesdon',
-    'wadding',
-    'wadham',
-    'wads',
     'wadsworth',
-    'wafts',
-    'wage-earning',
-    'waggling',
-    'waif',
-    'wails',
-    'waistline',
-    'waitin\'',
-    'wakeful',
-    'wal',
-    'walcott',
-    'waldo',
-    'waldorf',
-    'walid',
-    'walk-out',
-    'walkies',
     'walkinshaw',
-    'wall-to-wall',
-    'walla',
-    'wallas',
-    'wallenberg',
-    'wallerstein',
-    'wallflowers',
-    'wallowed',
-    'walmsley',
-    'wandjina',
-    'wands',
-    'wanes',
-    'wanking',
-    'warhorse',
-    'waringstown',
-    'warners',
     'warping',
-    'washed-out',
-    'watchmen',
-    'water-borne',
-    'water-colours',
-    'waterbus',
-    'waterlogging',
-    'watermark',
-    'watermen',
-    'watermill',
-    'wattle',
-    'waveney',
-    'wba',
-    'wc1',
-    'wcc',
-    'wcs',
     'wd',
-    'weal',
-    'weapons/armour',
-    'wearable',
-    'wearisome',
-    'weathercock',
-    'webern',
-    'weedkiller',
-    'weepy',
-    'wegerle',
-    'weinberg',
-    'weirdly',
-    'weirdos',
-    'welders',
-    'welds',
-    'well-attended',
     'well-connected',
-    'well-mannered',
-    'well-oiled',
-    'well-prepared',
-    'well-respected',
-    'well-rounded',
-    'well-shaped',
-    'well-structured',
-    'wellesley',
-    'wer',
-    'westcott',
-    'westmacott',
-    'westport',
-    'wetly',
-    'wgms',
-    'wharfe',
     'whats',
-    'wheelbarrows',
-    'wheelchair-bound',
-    'wheelhouse',
-    'wherefores',
-    'whinney',
-    'whipple',
-    'whirr',
-    'white-washed',
-    'whitefly',
-    'whiteleys',
-    'whitty',
-    'whiz',
-    'whizzed',
-    'wholegrain',
-    'wicklow',
     'widdowson',
-    'wide-angle',
-    'wide-open',
-    'widely-used',
-    'widowers',
-    'wigeon',
-    'wigglesworth',
-    'wijeratne',
-    'wil',
-    'wilbur',
-    'wildfire',
-    'wildflowers',
-    'willowy',
-    'wilmslow',
-    'winchcombe',
-    'winckelmann',
     'wind-surfing',
-    'windscreens',
-    'windshield',
-    'windsurfer',
-    'windus',
-    'wined',
-    'winfield',
-    'winfrith',
-    'winkler',
-    'wintered',
-    'winterthur',
-    'winton',
-    'witcher',
-    'withel',
-    'withstanding',
-    'wittering',
     'wittily',
-    'wivenhoe',
-    'woeful',
-    'wolfish',
-    'wolfwood',
-    'wolof',
-    'wolvercote',
-    'wom',
-    'women-only',
-    'wood-burning',
-    'woodall',
-    'woodcarver',
-    'woodman',
-    'woolmer',
-    'woos',
-    'wooster',
     'wopsle',
-    'worcs',
-    'work-load',
-    'workbooks',
-    'workwear',
-    'world-system',
-    'world-weary',
-    'wormed',
-    'worsens',
-    'worthiness',
-    'worthlessness',
-    'wortley',
-    'wrangler',
-    'wrap-around',
-    'wraysford',
-    'wreaking',
     'wretchedness',
-    'wretches',
-    'writhe',
-    'wrvs',
-    'wta',
-    'wyld',
-    'wyvern',
-    'x-rated',
-    'x-window',
-    'x2',
-    'x25',
-    'xa',
-    'xenon',
-    'xenophon',
-    'xm',
-    'xorandor',
     'xxiii',
-    'y\'',
-    'y-mp',
-    'yamaichi',
-    'yamamoto',
-    'yan',
-    'yarnton',
-    'yasa',
-    'yavlinsky',
-    'year-to-year',
-    'yearnings',
-    'yeasts',
-    'yes/no',
-    'yo-yo',
-    'yoked',
-    'yokohama',
     'yorath',
-    'yorks.',
-    'yoruba',
-    'yosemite',
-    'yoshida',
-    'yousefi',
-    'youthfulness',
-    'yukon',
-    'yul',
-    'yusef',
-    'yvette',
-    'z&lsqb;x&rsqb',
-    'z1',
-    'z2',
-    'zahara',
-    'zapp',
     'zbo',
-    'zehnder',
-    'zeit',
-    'zelah',
-    'zelda',
-    'zemstvos',
-    'zeolites',
-    'zephyr',
-    'zero-rated',
-    'zetland',
-    'zhang',
-    'ziegler',
-    'zig',
-    'zimbala',
-    'zimmermann',
-    'zionists',
     'zoete',
-    'zoff',
-    'zooplankton',
-    'zsa',
-    'zu',
-    'zuwayi',
+)
+
+blocks_09 = (
+    '!4bgr;-thromboglobulin!(ccedil;a"%ommat!%deg;s"$gr;h%!s",ollar;1,000m*#200*#300)#.1m*!2*"50)"2m)!3)"5m',
+    '(#25m(%3,500)#.5m)"50(&40,000(&60,000(%7,000)!0(%8,000)!m(%9,000(%sup14!)formula;1"(rac14;in&!8',
+    '!\'mdash;a!/pound;1,000,000)#250)#400)#600(#.7m)"80*!m($1.99("35*$,000)!m("45)!9(&60,000',
+    ')!m($8.50*"95)%0,000("90)!9(\'million\'%2,400(#.1m)"2m)!3*!m(%1,000)!0(%2,000',
+    ')#.95("60(%7,000(%8,000)!0("bn\'"31(%2,000(!4)!0("5m("60("75($9.95)!5',
+    '(#.5m(!2)!0("75($9.99\'$5.5m(!3(!4(!6\'$6.5m("0m(%5,000)%0,000(!6\'$7.25',
+    '\'%8,500(#.50(%5,000(!9\'#950(!m!$sup2 "\'\'!#30s!#and""rd"$ving!$bout!#ear!&keeper',
+    '!%phone %-&agr!!4!!g!#ing!#row ".3 )0&ndash;4(%60mph!#.02#"5%""15""6%!$0:18#"22',
+    '""65!#900 #1,2!"-3!#.1%#!0""3%""4%#!5"#5cm""8m!&/11/93"!4!\'0&deg;c#"ft',
+    '"#-15#&minute"!.#!0#"45#!9""01#!k#"ml#!p$!c""18""23#!7""30',
+    '""93#!9"%baset!&1-year""20""30""52#!4""84""99!*2&ndash;14"$,500"#-14#&member"".8',
+    '""04""54""64#!5""75#!9""82#!5""96"!c""mm"!s!*3&ndash;14"".7#!8',
+    '""13#!4#!6#!7""26""34""41""69"#70s""80""s.!%4-day#$year\'%-olds"".4',
+    '#!8""73#!4""84#!5"!c!*5&ndash;16"#(1)"#-17#&member"".3#!6#!7""0g##mhz',
+    '""13#!5"#20s#!5"#30s#!3#!8"#40s#!1""57""63#!4#!6""70#!5',
+    '#!3#!4#!5#!6#!7""90#!2#!4#!9"!m#!m!)6&ndash;1"#-19"".3#!6',
+    '#!6""15""22""36#!9""71"!c!%7&ins"#-18"".1#!2#!4#!8""33"&5g/6oz',
+    '!*8&ndash;19"".3$!0#!5"+0c/350f/gas!$9-20"".1#!5"$50\'s"#76b#*8&ndash;79+!9$#-79#$9/80"#80b',
+    '#*4&ndash;85#*5&ndash;86#$7-88#)8&ndash;9"*90&ndash;1$!.$!b#"1a##2/3#$4/95"!p!!d!"hr!"pc %2,100',
+    '"$year!$.1.1$!2#!4""20""3%""45""6%""75""8%!&/11/93!$0-21"".2"&0-mile#!2',
+    '#!g#"th"+1&ndash;995#!1!$1-22"".4#!5#!6"&/10/93!&20,000!#300!$4-25"".7!$5-26#$yard',
+    '!&60,000#!0!$7-28!$8-29!%9,000"#-30!"bp!"cm!#x12 $3&ft!#(4)!!+!"-3!#.18#!9',
+    '""6%""7%!"/e!%0-day"#000"#mph!%1,000"!1"!9!#4th!"58!&60&deg#!0"#mhz!#7th',
+    '"!9!"99""th!":1!"cm!"s. $4.12""2%""7%""8%!&0-year""ft""pc!*1-year-old"!7',
+    '""st!"21"!2"!4!#300"!8!"41"!3"!6"!7"!8!&50,000"!3"!5"!8',
+    '"#mhz!"62"!7""th!"71"!2"!4"!9!&8-hour#(year-old!"98"!9"#ers!"ad \'5&deg;c',
+    '"#ins"\'ndash;3(!4(!8(!9!#(2)!(,000,000!%-year!#.1%""25"#3.1$!2!#00m"!7!$12mb',
+    '!"22"!9!"31"!4"!6""rd!"45"!9!#500!"61"!2"!7!%7,000"!5"!6',
+    '!"81"!6"!7!"pc *6&ndash;10!"-0!%0&deg""\'s"!2!"10!"29!"34"!8!"42"!7',
+    '""th!\'5&deg;c"!5!"62"!7!"73"!5!$8040"!7"!8!"90 )7&ndash;0(!9!"-8!#.10',
+    '"$30am"$45pm!"08"#mph"!p!"10!"25!"31!"41!"54""mm!"67!"70"!7!"95',
+    '!!a *8&ndash;12!#(1)!"-1!#.10"$30am!"01"!6"!p!"25!"37"!9!!a *9&ndash;12(!3',
+    '(!6!#.45!"0p!"1%!"23"!8!"30!"40!"60"#345!"80"!7!"lb!"mm "a-',
+    '!"12!"34!"40!"55!!6!"71!!9!)_fortiori!$arau!"bb##ado#(otsfield#!s"$duct"\'erfeldy',
+    '"\'olishes##ody#(riginals#&unding$&t-turn"#ram$%sions#(idgement#\'ogation#\'uptness"(sconding#!e$*ntmindedly"$uelo!.cad&eacute;mie',
+    '#%pulco"*centuating$&ptably#(limatise+!d#&olades$&rdance#%ursed$$stom"%hille#\'nacarry"&kerley"&olytes")quiescent"%robat',
+    '#\'ualized!)d_nauseam"$amec$"us#%pters%#ion"%d-ons##ers##led#$ucts"(enovirus"%heres""ie$!u"!j',
+    ')#ing*"ve"#ley#"ib"+minstration"#rar##oit!%egina"$neid")robically!"ff#\'ability#)irmations".rican-american#,o-caribbeans',
+    '""en"!g#*lomeration"%itate\'#dly&$ions&"or"$nese#(osticism")onisingly#(raphobia"*ribusiness""ue!"hn!#ida',
+    '"#ken"&lerons"#rey!!j!(khenaten!(l-makesh""am##ric##tas"$bini#(uquerque"&cester#\'hemilla\'#sts#%ohols',
+    '"$ders"\'gerians"\'kaloids#"yd$!l"\'l-black$)consuming$&female$)inclusive&#dia$#new$\'russian$&seater$&ticket#&egheny',
+    '#\'igators#"on#\'rounder##sop#%usive##yah"%manac#$eida#\'shouses"!s"!u"$varo#"es""yn##son',
+    '##dou#)lgamating#%ntani")bitiously#$ling"(erindian"#ira#"ty"&niotic""or#(xicillin"%ulets")yloidosis!&n\'_all"%agram',
+    '#)tomically\'"st#\'xagoras$&imenes"$dhra##res%#tti$%omeda")giosperms#%laise$#eby$&ophone##ora#%uilla"(imatedly',
+    '"(kle-deep"%nales#&eliese$#xes#)ihilating#\'oyingly#"ul$&nciata"#ode#&rexics#"va"&petuwi"!s#%combe",t&oacute;nio',
+    '#%eroom#\'hracite%$opic#)i-british%&cancer&(ommunism%+depressants&&umping%-establishment%&jewish%+lactoferrin%(monopoly%$nazi%#rex%&sexist',
+    '%%union&!s$%genic$,hypertensive$$mony$&podean$\'racists$\'semitic!!o"!l"$rtic!"pa"\'ennines"#hid"!o',
+    '"*paratchiks#(ealingly$!l$&tizing#"in"$sley!(queducts!(rabesque#!p##rat"\'bitrate"&cading%!y#"ed#\'h-rival',
+    '%#uke$&etypes"%dakke"*gentinians#"ol"%idity"$lene"*m\'s-length#$ando"$naud##ica##ulf"%onson"&peggio"\'raigned',
+    ')!s"!s#%enide&!o"&tegall$%misia#&ichoke$&ficers$#ste#$less##uro""um!,scertainable#%ribes%%ptive',
+    '#$ptic"\'hbourne##raf#$well"!i#!k"!l"$mara"$prey")signation#$urer#%yrian"\'terisks#(rologers"%uryan',
+    '#!s")ymmetries!$ta\'i"$olls#"ne"\'rophied"*titudinist!&u_fait""be$#rge%"on"(chinleck"!f"+gmentations#%ustin',
+    '"%stell$#ral",thentication#+oantibodies$#cad$$desk$\'graphed$*nomization$%pilot!%valon#\'ricious"%ebury#$nger\'!s$#ida',
+    '$$sive"%iator#"um"&ocados#%wedly""ro!)wakenings"!b!#xil"!l!&yliffe!$zhag$&ruddin""or"$tecs',
+    ' &b-cell"$side!#.a.""sc!!3!$aath"#bar#$bage$#led#%ushka#(y-sitter$#ish$$liss"$call#"ci',
+    '#&helard#*k-breaking$\'benches$$hand$\'packers$&street$,ward-looking&$ters"$ddie#&gering#$ness"(fflement&!s"%ggley#$shot',
+    '#$leys$%iwick$$ment"%katin"(laclavas#"ed##ham##ked#%loted&#ing$!y##sam#&vinder"$mako#"hi',
+    '#"dy#&galore##ham#(nockburn$!s##quo#)tamweight"&ptisms"\'rbadian%$rity$%ecued$(iturates$#uda#"ce#%field',
+    '%#cle$,es/reporting$&staple$"um$!y#(raclough&#uda$&enness#&tering$"le&!y#$wick"\'se-line$$less%$ines',
+    '$!r##sey"(th-house$\'/shower$$time$$urst$%water#%sford#%tened%+ry-operated(\'powered$%leaxe&%dress")udrillard#$haus',
+    '"$wden"%yliss!#bfc!%eador#&umaris#&vering##zer"&calmed#%kmann"&dcover#%ecked#$head#\'lington#!u#%welty',
+    '"#ggs"\'heading#$oves"$lial$!e#)ligerents$!o$\'ybutton#"ov##ton##uga&!s$#shi"#ndy#"ji',
+    '"$rber#%gamot#!k$+shire-based#"le#$nese#"ri%#dge"(seeching$%tting#&t-ever$#ows"$thel%#sda#!t',
+    '"#vel%#led#!y"%wdley!(i-annual"$anco"#bby#)liometric&-th&egrave;que"!c#%knell"$ddle"%g\'uns#&-money$$name',
+    '##ots##ram"(llericay"$mbos""na#%geing%!s#"ks")ochemists#(feedback##gas#%morph"&rchall#&d-like$$land',
+    '$(watchers##kin#&thrate"$sham#$pham"&tching#"ez#$tern&!s!"la#)ck-figure&&headed%(currants%#ett%&listed',
+    '%&shirts%%wells#$gden##ize#&kemore##mey##nch$%dness$"ey#(s&eacute"#dsc"!e#"at##eps#!u',
+    '#&ndside"&ockley#&odiest%!s%(y-minded$$mers%&iehall#$wers#%xwich"$urry$!s#&stered!"mj"#p-2!"nb',
+    '"!l!&o\'ness""as#\'t-house$"er"%bbins""ca"\'denland$!s##ley#%yline"(ehringer#"uf"$geys#$side',
+    '##unt"#lam#$dest#(ingbroke#$land%"rd$%inger#&ognese#$shie$$ters"*mbardments$#erg$"ie"&nefish#!g',
+    '"(okbinder$%stall#&merang#$rish")rderlands#"ja"&sigran""tt$&lenose",ugainvillaea$%ht-in#$rges$&nville$"se$#ton',
+    '#%verie"$wley"(y-friend##den#"es!\'raddock$!l#!g$$ging##ids$&lsford$&nstorm%\'washing#%ndies%$reth',
+    '#&senose$#her$#ier$"ov##wls$"ny#$ying#\'zauskas$$enly"$durd".ead-and-butter%\'winners$(k-clause&#out$&stfeed',
+    '$*thtakingly&!y#%ccias##ech$#zed#%sslaw##uer"%icked#&dewell$#ger&$town#\'efcases$$rley#%gands$%house',
+    '#$mmed#"nd$$kley#*tish-based"(oadgreen%%lands%#man%$wick#)cklehurst#(ken-down#$mine#&omhead#$tton#$wner$#ser',
+    '"%ummie##nch$#ton#%silov##ton"%ynner!"tg!)uccaneers"%dgies"\'ffering%"ts$#oon"%ggies#"is#"sy',
+    '"\'lkheads#)l-running$"en#%tmann""nd#$nies$$ymen##sen"&rchill#.eaucratization##gos#&lesque##man#(ne-jones#!p',
+    '"$shel#$kers#!s#$tard$#ers#$ying$$ness"\'ttercup&\'flyfish&#ing$#ock%&nholes&#ing"%youts!!w',
+    '"#att"$elaw$(orussian"$line""ng"$rnes \'c&amp;a!"\'m#"on!&.-in-c""e."$n.l.!3/ebp&dgr/nf-il6&bgr!!6!+a-unicenter',
+    '#"by#&riolet#!x"$ched#!i"%d/cam#"dy#!w"!e#&dwalla#%rleon$&narvon"#ius""la$&mities',
+    '%%rdale#"eb#)ifornians#%l-out$%ender$%ously\'$ness#"ms#&orific##ton#%vados#"yx""mb$+ridge-based#&dessus',
+    '#-pbell-savours\'$town$%esina$$fire$%sites"%navan#$died$&le-lit#\'guilhem#$ines#"na$&igione#&ongate$$pied$"va',
+    '#\'vassers#$yons"%pella#.ital-intensive\'\'ization#!p$"er#$rice$"on")rabinieri$&vaggio#%bolic%"ns#\'cinogen#(dholders',
+    '&(myopathy$#oso$$well#(ewscourt$!x##fax#&melite#)olingians#%reras$(iageways$$ycot#&terton$#ing"*se-control$$load',
+    '$#ock#%taway$#ell\'$ated$&lerock$#ors"\'tacombs$$lyse$%pults#%chers#\'echesis&#ist#$ford##hal$%eters',
+    '&"ic#$kins#&tanach#%walks"$uchy"$vers#$iare"$wdor"!y!#bot!&c:mail"!d"$k-33"!m"!r',
+    '"!t!&ellist"&ntered$$rale\'#ist($zing%\'e-piece\'%stage"$rean$&bellum$!s#!i$"se#\'tifying"!t',
+    '"!s!#gli!-h&acirc;teaux#*eacute;rie""\'a"%adian#"fe$%finch#\'insword$"se#*llengingly##man$&berlin$%omile%"un',
+    '$%tries#!o#(pelcross%#ron(!e$$pell%!y#+racterizing)$less$#din$$gers$&itably%$vari$&terers##sms',
+    '#\'uffeurs"(eck-list%$land%$mate#$esed$$tham#&lonian#(que-book#$root$#ubs#\'sapeake$#ham$$nais$&sboard#!t',
+    '#$viot$%rolet""id#%gnell#&lderic%\'ishness%(lessness%\'minders#"ne$"ks#$ppie#(ropodist(!y&&ractic$#ped',
+    '#(slehurst#\'ttenden#$vers"\'lamydia"#oak#!c#,langiography$)ecystitis%&stasis#\'onhaven#$rdal$&isters"&risten&&ianson\'"es',
+    '#*ysanthemum"#uan#"ff#$gged%#ing##mmy#)rch-going&%goers!#iao"!b"(cciolina"!e""gs"#lia"!p',
+    '"\'rcadian$#let$(ulations%)mspection##rus"#ssy""tb##ron#(y-centre"!u"\'vitates#$vies!!j!"kr!$l100',
+    '#&irvaux#$nged$!k#(pped-out$!s#(renceaux$!o#\'ssicist#$usal#%wback#%ybury"\'ean-cut$$r-up%#cut%%water',
+    '#(ethorpes$"ve#%mente#%vedon%$leys"%iburn##ffe#&mbdown#&ngfilm$$ique#$p-on#$ques#&theroe"%oches#\'istered',
+    '&%range%"ts#$vers#&zapine"&ubbers$$face$$land$$mate#%cking#$mber$#ped#!n#\'ttering%(on-brock!"nc',
+    '#)developed#+educational#+operatively%!s"+albrookdale$&island#\'rseness#$sted#$tham"$bain##ble&&stones##ras"\'ckfield$"le',
+    '"%dicil""ed#*lenterates"(ffee-cup%!y"$ggan##nos&%centi"%ining##tus"%lditz#$lard$\'ectives%$gial$$uded',
+    '#$obus$&nizing%%nades%\'oscopic$*rado-based%!e$%stomy$(ur-coded&%ation&#eds"$mbos$&sburgh#&ebacks$&dienne#$ital',
+    '\'!s$%issar$&odious$*unity-wide#(pactness%\'ny-wide%%rably%&tibles$\'lexions%(imenting$&ostela\'!s$%rador%%esses(#ors',
+    '%&terise"/nceptualisation,!e-!d+"ze$!h$%ierge%%liate$$lave$#oct%\'rdances(!t$%reted("ly\'#ion',
+    '%$ssed#"de%$nser$&olence$$uits#%fides%\'rmatory#\'gestive$%olese$)ratulates#(iscliffe#(jectural$$uror##men##nah',
+    '&#ing$#ote#2sciousness-raising$)ervatoire*!r$&igning$(olations%%nance%#rts$\'tantius%%rains&%uctor$$ults%&merist#&tagion',
+    '&!s%-nental-margin$\'ortions%%uring$)ralateral&%venes#%vents%$rsed%$xity%&yances$&icting%\'viality"$oder#&khouse#$lest',
+    '$%icing##ses#%ulate#$ycat$#ist"#rba$$etts$%usier#$dite$#ons$%uroys#$inne#&morant#&nfield)!s',
+    '%$orth$$iche#$onal&%tions#&pulent%&scular#$ries$\'oborate$!y#+ticosteroid#%vette"%sford#-t-effectively")terminous#&terell',
+    '#&yledon"+uncil-owned$(tenanced&*r-argument(*insurgency**telligence()offensive,!r\'&acting\'\'factual\'&manded%\'ry-wide%"s.#/p_d\'&eacute;tat$"la',
+    '#&turier"!v#\'enanted)"rs("or"%wdray##rie&!s"#yne##ote!#pve!+r&eacute;cy*#dit"&.app.r"&ackles',
+    '#+igendarroch#"mb$#ond$$ping%"on#&nborne$#ked$%leigh$$well#)sh-landed#&tering##ves#&ziness"$eaky$#ney',
+    '#$ches#!d$$iton$%ulous#(nellated#$oles$$sote#&sswell#$wing"&ichton$\'klewood#&m.l.r.$&ewatch$*inological$#ped',
+    '#%pples#%spies$*s-crossing#&tchley$0erion-referenced"#oce$%heted$$kett%$ford%!s#&issant&"et#%madex$#bie#\'nenberg',
+    '#$sbie$)s-examine&-fertilisation&$over%$bows&#red%$land#%tchet(!s#"up#%wland"(ucifixes#$dity#&elties#\'ikshank',
+    '$#pet\'!s#$sher$&tacean"/yptosporidiosis#(stallise)#tes(\'ography!"sf!"td!%uboid"%ckney"\'ddesdon""ed"%illin',
+    '#%ottes#%peper#&tivars$"ra##ver"$mani#)ulatively"$nard#"ts")p-winners##ids"!r#$able#\'bishley#$eton',
+    '#$fews#"ie#$lews#$ries#\'vaceous")stom-made"&t-down$%glass$$outs#%icles#$lets#"ts!"vp"!s!"wm',
+    '&"ic$+o-oxygenase%"ps%$tron"$gnus""pa"&rillic"\'therean#&ometry$(toxicity +d&aacute;il"/eacute;mocratie"(uuml;rer!%\'azur"$indy',
+    '##yly!$.p.p!"ag"%hlias""ko$#tas"(mbusters#$ming#$pers#$sels""ng#"ie#"se#&zigers")rdanelles',
+    '##rel"&shwood#!s#&tardly",ta-gathering$$post##sun""ub"$vids##out"%wdled%#ing"!x"%y-glo$$time',
+    '(!s##ton!\'b2/6000!$c-10"!l!"dr!1e-differentiation"%_jure"&adwood##nes#$rden"&bility#%ugger"&camped$$nted',
+    '#,ision-taking#$king#&laimed##net#%oders$*nstructive%*tamination$&rously#$ried"(dicating(#ons"\'ee-lite#\'p-water$$dale"\'featism',
+    '$)rentially%#ral#$iled#&lating#\'rauding"(jectedly"%letes#(ineating#&l\'arte#$phic#$uged##ves".militarisation*#zed#%obbed',
+    '$*nstratives$*ralisation(&zation)#ing$\'sthenes"\'natured#"ch#-drochronology#(igrating#$nett#&ounces"*oxycholate")ployments#\'ository#$rave',
+    '$\'h-first"(railment%!n#(matology#\'ogation*!s#$vish"#sai$(lination#\'ecrated#\'ignates#$kjet#(patching#,tructiveness"\'taching',
+    '#/ective-sergeant$(rminable)$tive("er$&stable#\'onators#&racted\'#ing$$ital""um"*valuations&#ing#,elopmentally$%raugh#%iates',
+    '#%outly"&xtrose!#f=1""lp!%hamma!%iadem$#ora")chotomous#"ke"&ehards#\'nstbier#&titian"&ffuses""jk"&latory',
+    '#%horne#"ys"#mer%\'ization%!s#$ming##ple&!s"$nard#"da#"es#"ka#\'nertime"&ogenes"(phthongs',
+    '#"ge",saggregation$$llow$\'ppoints$%vowed#(chargers$\'ography%(loration%)nnections&(solately%\'urteous$)reditable&$pant%\'iminant#*entangling',
+    '#*figurement(#ing#)gustingly#(honoured$!y#(infected%(tegrates#%kless#\'lodging#(mounting#\'obeying#(pensable(%tions\'"es$%laces',
+    '%%lmost"&verges#$ined&!s#%ulged"%zzily!#n10!(obermann""ds"#ers"\'g-eared#$gett#%sbody"&isneau"!l',
+    '#$lies"(naghadee#"ee$$gall"#ody##gie#%rknob"$rado#!m$"an$$ouse#\'salmost"%sages#*e-response#!s',
+    '".uble-barrelled($lind\'&handed&#day"%vecot$$tail"%wdney#%nbeat$"er$$load$%river$#ton!&rainer#&peries#,ughtsmanship',
+    '#!y"$eads$&m-like%$like#$nnan#+ssing-rooms)"up#$yfus"&ied-up#&nkable##vel"%omore#&p-outs$#let##uot',
+    '"%s6000"&ubbins"$yers#%sdale$$tone!"su!&ualist"\'bliners#%uffet"#dek"#els"%gdale"#jon"%llest$#ing',
+    '#*friesshire"&ncombe#$ford#%murry#$ston#%vegan",odenogastric"%sters$#pan"!x!%vorak!\'warfing!#yce#!k"\'speptic',
+    ' \'e&amp;y!#.t.!%adred")gleburger%\'scliffe%#ton"#les"%rache#%drums#%nshaw##ths%$work"&sement!)ccentrics#*lesiastics',
+    '"!e"!k"\'lipsing"!m"*onomy-wide"(uadorian#&menism!&delman"$icts#%fices$$ying#,nburgh-based"!t",ucationalist!$ffie',
+    '!)gg-laying#%leton"!m"\'regious!"h1"!m!"ib")cosanoids&*pentaenoic",ghth-century%$ieth!!k"!e!)laborates""ba',
+    '#%ridge"*ectrolytic\'(phoretic#%vates"#fin"(iminator"\'lington#!y"%mwood"&ongate")ucidating"#ven#"in$"ra"$wood',
+    '"%barks#&roider"!c"%igres#$tter"#ode"\'pathise#(loyments##son##tor!&namels"+capsulating#&hanter#$oder#\'ryption',
+    '&\'opedias")d-of-term#(oplasmic$(toxaemia"&folded$*rceability#)ranchised")gine-room&!d"&larges"!p"&riches%!o$"le"&shrine',
+    '"(tailment#(erocytes#)hronement#\'icingly#\'rancing$&eaties$&usting"&uresis!*osinophils!"pc"!h"&icurus#&tomise%#pes!#qns',
+    '$(lization#(idistant$)libration$#nox$%tably!&rasing#"to""df"$furt"\'gonomic"%ikson#"th""ne$#sto"%osive',
+    '"!p"$satz"*ythrocytes!\'scapees#$hews#&offier"\'peranto#&ousing#,rit_de_corps"$se/l"*t&eacute;e#(imations#$oril#&uarine!(thnology',
+    '"%ruria!&ugenia"%rasia$#tom#*o-sceptics$&cheque$&dollar$&vision"&sebius",trophication!&vacuee#$nder$*gelicalism#\'porites#&sively',
+    '#+r-expanding$%y-day"#ian"*olutionist!%wbank"#ood!"x-#\'croydon#*girlfriend"\'actions#*ggeratedly*!s"*changeable#%laims"(ecutable',
+    '##ort",istentialism"%mouth"\'orcised#$tics"!p#\'edients&\'tiously#%iring#\'letives$%icate(#ion$&oiters#+ressionists($vely',
+    '"(tendable&"er%"ts$\'rminate#"ol$$rted#+racorporeal&$tive%(judicial%)polations$&icated$%usion!(ye-level$&opener#$lets',
+    '#%piece#)witnesses"#non"#rie $f.a.!"/l!!6!$abre#\'ulously"(csimiles#\'tortame"%ience#&l-safe#$rlie$%yland',
+    ')"ly"&kintil"#lco%"ne#&l-back%#off$%acies#\'sifying"$m\'ly#(iliarize%\'y-owned$#nes$$shed")ncy-dress%#ing',
+    '#&tasise"#rag#$eham#&mlands#$oese$"oq#$quar#&raline$$iers\'!y%%ngton##ted""so#$tens"+ther-of-two',
+    '#(r&eacute"$wley$"ty#$ning#!r!"cs!"di!)eathering"%brile"$cund"$d-up#%erman##pol"%elers"#ign',
+    '#+icit&agrave#%latio##ons#%t-tip"*mme_fatale"$nded#%niway$!y"$rrar&!a$"ic"%stuca"#tes#&ishism##tle',
+    '!%forde!$hsas!+ibrillation%!n&$ogen$&oblast"$dget"&elders##nds#$sole")fty-fifty&$nine"#g.3#\'uration"%jians',
+    '"(nal-year%#ize$-nci&egrave;re#(e-tuning#$ials$#cky$"ng#&negans"+re-fighting$$bomb%$rand$%stone##st-&\'century\'%hoice',
+    '$\'mongers#!k"&tments#!t$"on#(zsimmons"\'ve-fold%$mile%%speed%$week")xed-point&$wing$!r#"it%!y',
+    '!%jords$$toft!\'lagpole$&rantly#(mboyance$%ingos#%re-up#\'shbacks#(t-topped#%unted#(vourings#$xton"$eecy#$shed#$xure',
+    '&!y#%nders$&tshire%!y#&p-flop)!s$$pers"&oaters#*orcovering#%riade%!n%#sts#&wchart$%erpot"$t.lt',
+    '#(ticasone##xes"(ycatcher#(ing-boat!"mc!\'oetuses"#ils#!x"$kker"\'menting"$ndle"\'otballs$"ed$%holds$$ings',
+    '"!p"+rce_majeure#(ebodings$\'closure$(grounded*!s$,ign-exchange$$land$&seeing%(hadowing&\'ortened$$tell##far$&eiting##ger',
+    '&%table$#one#$king$$lift#(malizing$"en$#osa#&teviot$#ify$*une-teller"*ul-mouthed$$ness$!s#,ndationalist#"r-',
+    '%&legged%&square%(terminal%#way$\'th-year"#wls"$xbat#\'hunting"!y!"r."*actionated%"or#!m#&ncoist$(kincense',
+    '#\'udsters#$zier"!c"+ee-floating$$bies$&masons$#way#\'ighters$"re#(nchwoman$"te#&shened&"rs%#man#!y',
+    '#&cative#(edlander$\'ndliest#%gging##sch"\'obisher##ebe#$lics#%stily""ud!"sm!"ta"!c!$uego#$hrer',
+    '#$ford#%ltime"*nd-holding$&ectomy#&icular#&nelled"\'rnishes##red"%sions"&turism!"yt .g&ouml;ttingen!#/dl!!2!"34',
+    '!#aas"!b#!a#\'biadini#%rieli"$dfly"&gosian"#ius"#las##ena##len$!s#&vanise$"in"%mbles',
+    '"!n#%gways##net"!o"$rang#*d&eacute;e#&ibaldi#"ni#$ratt$"od#%stang#"ty"$shes#%ifier#$sing',
+    '&%pathy%\'ulation"$teau#%field"\'ullists$%oises#%thier$#ier!"bw!$eaga"!d"$ertz"$ffen"\'mstones"\'ndarmes',
+    '#(ealogies$(ralising)"ts#!n#$tech"!o#%rdies$$gios"%rbils#!d#%manys$&inated#%shwin##tie"#sso',
+    '#\'hsemane#$tier"!v"$yser!#hia"$ouls#$zali"!q"#yll!#iap"#bco#$ling"$emsa"$gged$#ing',
+    '#&l-nets$"an$$ette$"ie&!s#&merton"\'mignano""ns"&raffes$"ud#!t"&uliano""za!"kn"!r',
+    '%#oli$$ness##res#*sgow-based$#ser%&houses##zes$#ier"%eizes#$nelg$\'fiddich$\'nerster%"ie"$ibly#"ck',
+    '$$tery"&oomier#%riana%"ed"!u#!g"\'ycerine$$ogen!#nat$!s"%ostic!)obsmacked")d-fearing$$like##ard',
+    '#\'fathers$\'orsaken#$less$%iness##man"!h"%lders$$mann$(sborough%$tone"%nzalo"\'odchild$#ier#"fy#"le',
+    '$!s"$rged#!m"&ssiped&!y"$tcha#&tfried$!i"%uging#$rlay")vernesses"$wrie""zo!"po"!t',
+    '!\'radings$!y#&naries$"by$#dee&!s%\'masters$#ton$\'ulation&$omas#(ptolites##tes$#ify$#tan$&uities',
+    ')!d"$ebes#\'en-eyed%\'grocers%$ways#%mlins#$sley##tna#"ve#\'y-brown$#son"%ibben#$ddle#"eg$#ves',
+    '#%maces%"ud$#mer$$ness#%nders#$pper#$stle"!o#!a#$eger##gan$"gy#"sz#%upies%$ware',
+    '"&uncher##ppo#+y&egrave;re!"tp!!u"(adeloupe#&ngdong"&bernii"$erra%!e#$vara"\'ileless$%lamon"$lley"%mperz',
+    '#$nery##ter"$rani")ttersnipe"%v\'nor"&yanese"+zm&aacute;n!!v!!w"#ili$"ym!!y""le"#sin &h.d.g.',
+    '!!4!!5!*abitations%%uated#(yarimana"%ckman"$dlee"*emodynamic%(rrhaging"#gan$!r#&fishes##ley""hn"$idar',
+    '#%nault#%rcare$$pins"#jar"$lden#(f-formed%#man\'&rathon%&yearly#$idon#$lett$)ucinating(&ogenic#&tingly""na',
+    '#%dball%$ills$$guns$\'icapper$%scomb%#ets##ker$"ie##lon##sel"#pcs#%sburg"+rbourmaster#\'d-edged$&castle',
+    '$%wicke#\'e-woman$#ton##ing#$king$$ness##mer$\'onising\'#zed#$pies%"ng$!o%"on#(r&eacute$$iman',
+    '#%tford$&ington$#man$$well#\'vesters%\'y-jones"\'shemite$%imoto"$tful"!u#*te_cuisine%"ur$\'villers"\'ve-nots"\'waiians',
+    '$%shead%$moor#!n"&yhurst#%stack(!s##ter#$wood"&zarded#&elnuts##ily!"bk"%v-dna!(eadcount$%leand',
+    '#"ld##rne$"st#%tedly$&hfield%%lands$#ley#(venwards$(y-lidded"%bburn##ron"%ckled%#ing"$ffer")ighington',
+    '#&rlooms""li$$um-3#&l-bent$%enism$$fire$#uva"\'msworth"&nchman#%niker#&riques"#p3b#+atocellular"&rakles#(culaneum',
+    '\'"an#%dsman&"en##eof$$with#)itability#*maphrodite$(eneutics%#tic#(ringbone##vey#(zegovina"!s##iod#$wall',
+    '#"er"!x"(y_presto!%iatal"$boux"!c""db"+eroglyphics"-gh-definition\'%nsity%$pass&$ower%(spending&%tatus%+temperature',
+    '$(er-order$$town#%ueras"&jacker"&lltops"&nckley#&dbrain$!e$$head##kle#$sley"$ppos"#res"/stopathological"*v-positive',
+    '!&jerson!#mis!"no!)oarseness"#dai"$eing"%ggart"!l#%d-ups$$away#$gate#%lowly&$ness#"st##ton',
+    '")me-cooked%&owners##ily$$noid"\'nderich#+ey-coloured%\'mooners%#pot##ing$#ton#$king#)or&eacute"(odwinked#$kers#&vering',
+    '#\'kheimer#)se-racing%%woman#"ta$$ense\'"ia"-spitalization(#ler"$tbed#\'teterre"\'useboat"$ving"$werd##ler"#xha',
+    '!"st!"ud#%dling"%ffing"%ggett"!i"(llabaloo%\'vington"*man-rights%#oid#%blest#)mersknott#$ours#%pback$#hry',
+    '#!s"+ndredweight#!s#"te$+ingdonshire"#rls$\'y-burly#"on##rah$#ies##tle"#ssa$!y#$tler"\'tchings',
+    '"+draulically$)ochloride"#mes"\'perdesk%%media%&trophy#+notherapist#!o$(chlorite&&ondria$%tonic"$ssop#\'teresis "i\'!,ba&ntilde;ez',
+    '",m-compatible!)ce-creams""ke"(onoclasm)#tic"!r!(deologue"&olised!"ea!%f/alt"!a!#gg1#!y"&niting!"is',
+    '!%lbrec")eocolonic"#iad"(l-formed&%unded$&gotten$&judged$(mannered$$will##ich$$quid#)ogicality)"ly"#ona"!s',
+    '"\'matures#&ortals#(unoassay&+suppressive"%pedes$$ller##ish#&lexion#(ortunate#)regnation#&udence$$gned!&n_that")attention)"ve',
+    '"(breeding")cantation$(rnations$&utious#&lement$$ines#)oherently$(mpletely$(nsolable%)veniences+#tly$)rruptible#+rementalism#%ubate$&lcated',
+    '"(delicate$#xer##ica$$gent$\'rection#&olence#$rawn#(ubitably$$cted"(ebriated#*ffectually#&legant#\'quities\'!y#$xact',
+    '#(antryman)"en#\'easible$%riors#(initives#$lame#.ormation-based#&ringes#&uriate"$gest#&lewood$&orious#$rams%%tiate$#ess',
+    '#\'quities#(tialised")judicious")operative$\'portune"\'putting"&quirer")sidiously$&nuated#\'olently#.pector-general)$ates#&taller)!s$0itutionalization',
+    '#&urgent"\'tegrals$&llects$\'mperate$*ntionality)"ed$"r-&,disciplinary&&ethnic&\'library&(regional(*lationship%(activity&%gency%$cede',
+    '%+est-bearing%%faced%#ims&%ntell%(leukin-2&#ock(%utors\'#per*!s%\'mission%#nat%\'operate%#pet&&olated&\'retable',
+    '*%ories,!s%&stices%%tidal#\'imacies#%ra-ec%\'hepatic%+oesophageal$%overt$$udes#\'ubation"%vades$%lided#$ents$&rclyde',
+    '#(igorated$)olability\'"te!!o"#nia$#zed!#pcc!\'renaeus""ma"(onmonger#%quois"!r#)edeemable+!y$&gulars',
+    '!#sas"\'herwood#$mael"\'kandara"$lami#"et$%worth##wyn"&otonic"!t!%tched"&erated!#u/l""cn!$veco',
+    '#!y $j.a.""d.""h.""p.!"aa"%ckdaw\'!s##oby"%deite"$eger""go"#kes#"ki#%owski',
+    '""mb#"my""na##sen$#sen#"us"!p#%onica#!s"$tiya"%uncey!"cb!"de!\'ean-luc%&michel',
+    '$!i"*opardizing"$rmyn"!s##sel#!u"$tsam"!u#"ne!&igsaws"!n""st""ve!"mb!%o-ann',
+    '"%bbers#\'centres"$chim#"ks""gs"&hnnies$#sen"+int-venture"(rdanians"&vially$!c$"te"#wls"&yrider!"sp',
+    '"(dgmental"%ggled""ke"&mblatt"\'nk-bond##tas"*st-in-time$%iciar"!t",xtapositions #k\'s!%-type!!1!%abrit"#dan',
+    '"&lahari##dor#!e#(iningrad"&mikaze#$pala$&uchean")nchelskis##del$!y#"za"!o##lin"$prun""ra',
+    '$"mi#"in#!t"&shmiri##min##sel""ta"#zan$$sker!#ean"#bab#"le"$eble##ley#"ne',
+    '#%psake"\'ightley"&lleher%$rman%"tt\'\'-bowman$#ogg##man#$sall$"ey"$mble#$sley"&nyatta"&rbside#"ly',
+    '"%ssler"#van##lar!%hadra##lil#$nate$!s"#ieu"%thons!*idnappings""el#!t"$kuyu"\'lchoman#\'winning',
+    '#-dertransporte#$gdon$\'fishers$%maker$\'stonian%#way"\'rchhoff#$ghiz$"iz#%ibati#(kleatham&"es"%sling"&temark#\'tiwakes',
+    '!)lagenfurt"%eiber#$pner"&ondyke""ux!\'napsack"\'ee-high$"ls"*ick-knacks#&ghtley"(ock-down%%about%$glen#"pf#%wable',
+    '"#uth!"oc"&ffigoh"%irala"%meito"!o"$suth"$uros!&raemer#"us#"ys"$emer"#ill#$stin"#one',
+    '"\'zysztof!!t"!s!#uan"$bota""ng""rd#\'unagala!"wh!$yodo ,l&oacute;pez!"-r!$/cpl!!4!!7',
+    '#+oulbeniales%(r-market"$cayo#&erated#"hy##tic$%ulose""dd##ram"$guna"%londe"$marr#&bswool#%eness%%tably',
+    '#$ming#&pshade)!s"(ncasters$*e-corporal%!d$#ing##des$$form$\'holding+!s$&ladies%%ocked$&slides#"ey',
+    '$$uish%%orous##ier#&tastic"%pland#$orte##wai"*rger-scale$#ish#$king&!s$%soken%#pur##son##tin',
+    '#!y$%ngeal"%slett#&situde"!t#+eralisation)"ed#!h##ino##tre"(unceston"\'vandera#$elle#&oisier"-w-enforcement',
+    '#&makers"$xton"(zarsfeld!#cci!*e&oacute;n"$akey#%pfrog#)seholders""ck#$onte"$eson##tle",ft-of-centre%%right%(to-right',
+    '"%gates##ent#(ionnaire$\'timized#(uminosae"#ica$!s"!k#%hanya"$mmon""ng#&iently$#han##nis##til',
+    '#$pard"*sser-known$&ingham"$t-up#+ter-writing$!y"&uchars#\'kocytes%&triene"/vanti&eacute;re##ein#"is$&tation%!y"!w',
+    '"$xeme#&ically"$yden#$shon#(tonstone!!g"!s!)iberalise("ty("ze%\'tarians"$dded%%sdale$"le"$e-in',
+    '"&gation#,ht-sensitive%$foot"$kens"$llee"&massol#\'e-green##pet"&nchpin#!d#\'eaments$"ns$$smen$"up#*gua_franca',
+    '#!n$#ean#%oleic")p-reading#)oproteins##sey$%ticks"\'quefied$(idations""se##ton"*terariness#\'herland#*tlehampton&!r',
+    '$$wire##in\'!(jubljana!$lama#\'neilian!"mc!"nu!\'oadable"-cal-authority%$iser%(ly-based$#tor#%haber%#lsh$%inver',
+    '$#yer"$ggia##ica%!s"$lita"&mbards$$roso"&ng-ago%\'handled\'"ul%\'sleeved$$hand$%lands$$mans$%shore',
+    '""on$#ies"$ping"$rean#&rimore")ssiemouth"\'tteries"&ughlin%#ran%#ton"&velier%#ock")w-alcohol$\'pitched%$ower',
+    '##ood"&zenges!"pg!(ubavitch#$bers"#can#"io#%kiest"(dendorff#$gate#$ovic"$gged"$kacs$#nov"(nchtimes',
+    '#%gfish"$pins"%rches#"ex"#sts!"vf!"wb!%ydham")mphocytic"\'ndhurst$#sey"&ricist"$sine .m&aacute;rquez!".p',
+    '!!0!#aan"&caques$%skill#$cabe#\'diarmid$#uff#)hineheads&#ist$!u#$iver##key#%ready$+oscopically"$dani',
+    '#$eley##hya"&feking"\'gdalena#!e$!s#"gi#%ister##yar"#ils#&nsheet$(tainable#"re#(sonettes"\'karenko',
+    '#&e-over##in\'#$toum"(l&aacute#(adaptive$$gasy$$rial#(contents#$duin#*formations$*unctioning#)ignancies#%lards$#ett#!o',
+    '#\'placket##ted$(reatment$$ster".nchester-based#\'dibular#"ge$#oes#!i$,c-depressive$#low$\'pulates#$made#&nerism$&ingham',
+    '$"ua#$uela$\'factory"$rais#%cella\'!o\'"us$%hbank%"er#*denborough#&garita$+inalisation#$iano$(e-claire$#nas',
+    '$"ot$!s%$chal$#tza#)ket-based\'(oriented&\'ability$!o#!l$#ing#&maduke$&eladov##ple#)seillaise$&hlands',
+    '#$xian#(y-claude$!s"\'sailand$"la#&kelyne#&ochist#$ques#%salia#(terclass&#man\'&inding$$head$$itis$&urbate',
+    '#*ch-winning#$hias##tli$!y"&udsley#"le#$rier$!o""wr"#xse"&y-june"$zzin!\'carthur#$uley"(cafferty',
+    '#$ourt#$rory"&fadden"&gavran##hee#&impsey$$nlay"$kean#%inlay"%nulty!$dc\'s"!p!$eads#\'l-times##ner',
+    '"#bbe"#dea$$llin#$ians$%tated\'"or#$lock"+eting-place")galomania+!c$%phone$$tape"#hdi"!i#$osis',
+    '")lancholia$%tonin#"ia"(mbranous#&orised"$nchu#$dips#$gele#\'opausal""rc$$ator$+hantability$%urian#)ovingians"$shed',
+    '#$tizo"+ta-analysis$&bolite$*linguistic$)sediments$$zoan#\'hionine$,odologically$!s#\'ternich#&zinger"!v#\'leviyet"$wing!%g/day',
+    '!\'ichaela#.ro-instruction%"be%%chips%\'filming%(scopical-"ly"&d-1992&"th$)glamorgan$$life$2nineteenth-century$%ocean$&season&)venteenth',
+    '#$dle-\'#age\'\'ranking&#man&!s\'\'borough##rib"!g#&raines"%ldmay#&itated(!s#$kmen$!s#&lenium',
+    '$\'ilitres$&stones#&ngavie#$ward"#mms""n.#&d-body%\'numbing$$anao#\'i-skirt$#cab%(omputers$&malism%\'isation$"on',
+    '#%otaur#$pins#"s.$"ky#$uses$#ted#!x"&roslav")sbehaving#\'carried$(onstrued$&reants##fit#(guidedly#&h-mash',
+    '#)interpret#\'managed#\'ogynist#)represent#)spellings"&tchley"$zuno!"la"!r"!s!"mi""ol!(nemonics!&obbing$!s',
+    '#%eller$"na#\'ularity&$ting$!s%)_operandi&\'vivendi"!h#%icans"$iety""jo"#l/l#!a#$edom##ina',
+    '#$otov##tke"&nboddo#\'chauzet#%drian##kou$#ton#&ocytes$(filament$%layer$\'polised$(theistic#(strously#(tenegrin%&squieu',
+    '#\'rfields$#hen%$ouse"$ping"&ralist&$zing#%bidly#$dant#$elli#%iarty$$llon#$onic#"te"!s#$cato',
+    '#&quitos"$tels#&hballs$(erboards#\'iveless#&or-car%$ized%%sport#$tram"$ults#\'ntfield&#ord#\'stached#\'thparts$"on',
+    '"$watt#"ed"#xie"!y"!z!%p/lab!(ravinsky"!f"#nas!+uch-vaunted"%ddied"$ffle"&ggings"(lberries#$cahy',
+    '##lan##ti-&&agency&\'layered\'&ingual&*processors&\'tasking&&vendor%(cellular%)factorial%%point##vey")mbo-jumbo#$ford#&mified',
+    '##ton""oi"!p##pet"\'rderess#%mansk#$rell"+s&eacute;es##ics#\'keteers#\'sorgsky#$tang"#tch#!t!&yeloma',
+    '"(stifying +n&icirc;mes!&-grams!#.c.!!2!!3!#=10"!4!1a&iuml;vet&eacute""ga$$land"(ilsworth#"sh"&kayama#&ed-eye',
+    '"#nna$#erl#%twich""ra#$mada#&rating"%shwan"&thalie")ughtiness#&seated"!v#$arro#&igated"#xos"#yar',
+    '!"bs!"cd!$eagh#)nderthals"!b"&ckband#\'ropolis%#tic"&edling"\'farious"!h"%llist"(o-gothic#&cortex#%nates',
+    '#\'plastic"%pomuk",rve-wracking"!s#$bitt#$cafe##tor"+therlandish#!t#&worker")urologist%(muscular%*physiology%\'science%$tics',
+    '""va##ill&"es"&wbegin#%found##ish#*ly-elected&$weds#%sline$%reels!!f!#hbc!#iba"$caea#%kleby',
+    '"\'gerians#$gles#$h_on#"ra"&hilism"$mrod"!n#%e-day$%tieth#!o"!o"#ppv#!s",trocellulose!$komo',
+    '!"ms!(o-hopers"$ades##kes"&cturne"$elle"#irs"*menklatura",n-appearance%+vailability$$book$+competitive&(nsensual&"re$+deglutitive',
+    '%(iabetics&,scrimination$)emergency%)xecutives&\'istence$\'ferrous$,inflammatory&*terference$%maori$(negative$*parametric&$yers%&rivate&+ofit-making$)recurring',
+    '\'#ual%$tate$&tariff$"us&#ers#)committal#&entity$$such#"ni#$zero"+radrenaline#$bury#&malise%#nby&#ton',
+    '%\'eastern%%field%$wick"+stalgically")te-making#%hings#*ifications#!t"&uveaux"&vation#$ello#$otel!"pp!#que!"sp',
+    '""ps!%ubile""er"!j##oma"%meral&"te"%ptial""ri#\'serymen$%ultan""tt$#ing"&zzling &o\'dowd',
+    '"&groats"$kane!"af"!p"%rsmen!(beisance#!x")fuscation"\'scenely#(olescent!)ccidental$%pital"$tane!&ddbins"#ilo',
+    '"!o#&urless"!s!!e"%strus!"f\'"!a"&f-hand$(licences$$side$\'the-peg#&iciate&!i!$gata"%ilvie',
+    '!,il-producing#%skins!(key-doke!\'ld-time##man"$eate"!f"+igopolistic(!y#(ve-green$#ine"#ney!#mer!&n-chip#$loan',
+    '"\'ce-over#&ogenes"\'e-armed$&legged%%iners$#one$&person"&screen!&olitic"!p"!r!(pen-cast%$door%%field%&market',
+    '"\'timally!)range-red#$tors"+chestrating"&ganics"*ienteering&#ing##gen"$mrod""ne"#omo"#rin""tf!)scillates"$mond',
+    '"!s"\'triches"(waldston!,ther-worldly"$moor"#way!&urself"+t-of-school\'\'the-way#\'er-city#%field$&lanked#%liers#)performed#&riders',
+    '#"ta#,ward-looking!!v"!a"!e#"r-%)ambitious%)confident%,enthusiastic&(stimated%\'reacted%*simplified%\'the-top%#use$\'dressed',
+    '$\'grazing$%hangs$*population$&ruling&"ns$*simplified%\'tressed%%upply$#ton\'!e$&valued%$iews$&winter*#ing"#oid',
+    '!)xygenated#$ntic!#zal",one-friendly +p&egrave;re!"-e"(labelled!".1"!a"$s.i."+wickerhamii!"10"!1!%=0.02!)acemakers',
+    '$"no#&khorse"%dmore")ediatrics"%gnell"#in\'""ki"%lacio$#din$,eontological#&e-blue$$ness$+ontologists$&strina##ing',
+    '#"ly"$mper&#ing&!s"#ndy##eth#&kratin#"sy#\'tograph"\'parazzi#$ingo"\'rabolic$&chuted(#ist$#dis',
+    '$%medic)"al$-professionals$(sitology%#ols#&celled$%place$!s##iah$"ng$\'shioner%$ians#"ka#$lous#$nham',
+    '%!s#!s$(imonious#,ticularities)#tes")s_de_deux##ser&!s$$more##tas$"es$"on"\'tagonia#/hophysiological.!y',
+    '#)riarchate$)onisingly\'"ze#$taya$%ering$%inson%#son"#via$$llon$#our#$lova"&wnshop"!x#,&lsqb;b&rsqb"%y-out',
+    '!"bd"!l!"df!*eacemakers(#ing#"ky#(r-shaped"$cham"&dantry#&estals#&igrees#$lars"$eing#%rless#$vish',
+    '"&licans#+oponnesians"\'mbridge"\'n-based#$arth#(dentives#(icillium$(tentiary#%nants$#ing#%sione#(tecostal"%onies"#pin#\'percorn',
+    '#)emptorily$\'nnially#)forations$%umery#(iglacial$&toneal\'$itis#\'mafrost%\'nganate#"on%#ist#(quisites#&secute(#ing)#ons',
+    '%&vering$"il$&onhood##tex##use&!d%#ing#(versions&"ts"$saro##tle"&tersen#)rographic*!y%$logy',
+    '%$ness#\'ulantly"%vsner!$g/ml"!l!$h.d."%alanx#!m#!n$$tasm\'!y#%risee$&macies"!c"#ial',
+    '$$omel")oenicians#*spholipase\'\'rescent#+tosynthetic"%rasal")ysicality!"ia""ca$#dor$#rdy##chu$#olo#%kford(!s',
+    '#!o$!n"\'ecework#$naar#%rpont$#rot"\'gmented"!l#&asters#&laging%#red$\'owcases"\'mpernel$#les#!s',
+    '#(infarina$$oned##ker"&pettes#$hros##its"%raeus#&ouette"#tta"%voted"%zarro!"kc!\'lacated&#ing#(gioclase',
+    '%\'clothes%$ness%!t#(netarium$&ktonic$"te#&sterer#"tz#(yability$$fair$$mate(!s$&things""cs""ed',
+    '#,nipotentiary"%osive"!p"&umford!"m.""ol"!s!*ock-marked"(etically"$grom##ues"%inton%!y"(larities&$zing',
+    '#"ka#\'linated$&utions#,ychlorinated&$rome%%lonal$$gyny$*merisation%(orphisms$&theism$+unsaturates"(meranian"%ntins%"us""of',
+    '#"le#"pa$"le#%ulate%$ists"#red#\'takabin$&cullis$$ents%!s$$hole"#ser#%iting&&vistic#\'sessors',
+    '%"16%)classical&(ommunist%,independence%%match%*production&#unk%&school$)classical%&ranial$&mortem$-structuralist")t-bellied#$able#\'entilla',
+    '#"tz""ul$#enc"\'werboat%$head%)s-that-be#"is!"pa!(rabhakar#+cticability#$ttle"!c"+e-christian%(olumbian&&nquest',
+    '&"wn%&efined$\'exposed$\'marital%(enstrual$&packed$+raphaelites%(equisite&+volutionary$(training#"an#\'cluding#$date\'!s$\'eceased',
+    '%&stined$)ilections%\'sposing#%faces$$ixed#*incubation#%judge&%icing#%ludes#\'marital#(ordained#,sbyterianism$%cient$$smen%%urise',
+    '#\'tenders&)tiousness%"rm#*varication"*ice-fixing&+performance%,/performance$$kled#\'estgate#&matial$&e-time$\'itivism$)ogeniture$"us#\'nt-outs',
+    '##ors#-soners-of-war#&tchett#(vate-eye\'!s#)ze-giving%\'winners"*o-european$&soviet#(bationer+!s$%oscis#)clivities#\'fessing(/onal-managerial',
+    '$#fer\'#ing$$iled%)t-sharing#!g#\'jectile#$line#"ng#&ofread$"ps#\'pionate#%sodic$\'pectors&$ring$\'tration',
+    '$#ean%)ctiveness%&olytic$(otypical%#zoa$$rude#$udie$!t#)visionals$"os##zac"%udish#%rient"#yce!"s.',
+    '"!a"-eudomelanosis"!l"\'oriasis"!p"!r"!t".ychoanalytical&\'biology!,ublic-school&%izing&!s"$ffer"!k"\'ll-down',
+    '"$nchy$%tures\'#ing#&ishers\'!s#"ts"#ree#!i#!l#(poseless##ser##ves"#sey#(h-button%#fit',
+    '"&t-down##nam#)refaction##sch#$ters""wp!"wl!*yroclastic"*thagoreans $q.c.!!3!#aly!"bd!"e2"!d',
+    '##dra#"lm##nta#%shing$!i%)-judicial#%train##ver&#ing"&elling#&nching"*ick-witted%#ens%"ie%$ness',
+    '#!n$#tus#"ps##rke"$oits 1r&eacute;publique)%union"(ocirc;le!!\'!#.s."$t.r.!"/3"!t!$4400!#aab',
+    '"\'bbiting#!y")cecourses$$down$%goers#&ialism#&onteur"$dars#,cliffe-brown#%ially%$tive$(ographic%&metric$$shes$"um',
+    '"$gbag##usa"\'ilroads$&wayman#%mundo#(n-soaked$$ford##ser&!s$"on#"th"%larth"\'maphosa#\'sbottom%"um',
+    '"&nchers#*domization#"gy##son##ted%"rs#\'unculus"#p30#$tors$\'urously"(ssendyll#"ta"\'thcoole#*ionalising)$zing',
+    '#"ed$&nously$"rs"\'wlinson##son"#yne"(zzmatazz!#caf!$dbms"!c!,e-assessment#*employment$$nact$&rected$\'valuate',
+    '#*introduced$$ssue(!d#%named#(released$%outed#&united"\'actance#$died$$just$#out#*ppointment#)r-admiral#&ssures"%bekah',
+    '+#ion$%sting#$edes#*iprocating+"on$\'tatives#&oiling$&mmence$(nnection#&ruiter#&tifier&$ying#)uperating#%ycles"\'d-brown',
+    '$$gold#\'currant#$ding%(sh-brown#\'ecorate$$emer$$ploy#+istributing##man#$oubt#\'ressing"$eked##nan"&fereed#%itted',
+    '#*orestation%(m-minded#\'undable$#tes"%gains#%eling#$gane#(istrable\'#ies##num#(ressions$$owth#*urgitation"$heat#$ouse',
+    '#(nfection%%orcer$$hard$\'stating$\'terpret%(roducing$$vest#%ssues"&lapses$&tivist#&evancy#"ns"$made#&inisce)!d',
+    '$#xed&!s#!o$&rseful#)unerative#!y"$nate##ews##nes#\'umbered"%paint\'#ing#&ealing$"ns%$tant',
+    '#$lant$&icates#\'osition*"ed*#ing#\'roaches#(udiating"(quisites"$read#"un"&sected$%lling$%nence$$ttle#%iduum',
+    '$!t#&ounded#(pectably#+titutionary#&urface$(scitated"%tched#$inas%#ues$#ral#\'urnable"&uptake#"ss"%value$%mping',
+    '%"ry$"re#(isionism&$ting$#ves##lon#%oking$%lvers"$work#%rites!"fc!\'ib-cage"&ccardo#&helieu$#man',
+    '$$shaw#\'ocheted"&ddance#\'iculing"&esling",ght-thinking&\'wingers%$hand%#ist(!s%!o#\'idities#&marole")jksmuseum"!k',
+    '"%mbaud")ngaskiddy$\'leaders"#och"&peness##pon"%sible"(tualized"\'vington##oli!"jr!#nas$!e"!r!\'oadways',
+    '""ch#(k-bottom$#ery"%dolfo""el"%guish"$keya"\'ll-call%"on"$mana%#ies#"er#$ping#$ulus"#nay',
+    '"&ofless#\'tstocks"$pati##ley"%sario#\'carrock#(e-tinted$#bud$$dale#&smayne$!o#$ters"#tas##her$#man',
+    '"(ugh-hewn%"ed&#ned%!s#(nd-robin%#hay"$wers!#rna!"tc"!r!"ua#"ne"#ben#"ra"%dston',
+    '"%islip")mbustious"&nciman#%efang")ral-urban""sk#"so"(therglen!!w .s&aacute;nchez#$mp;m&!p"+egrave;vres!,-transferase!".2',
+    '"!t!"/l!"13!$aadi#%vedra"#cha$"in#$kler#)rilegious"&dberge#$dler\'!y%#ing"&gacity#"es',
+    '#!n"%judis"$lcey#%eroom(!s$&sforce#"op#&perton#\'ubrious$&tation#&vaging%$tore"$mara##ian##oan',
+    '$$lers#%sonov#$uels#$ways"$ncho##dal%!y$$bank$&grouse$"or$&pipers&!t$#rat#$ford#$gria',
+    '#&itised#$koff"%pling#$ping"\'ragossa$$toga&!v#(coidosis##dis#"fu#"ge#!s#"um%"an"$shes',
+    '#"ie%"ty$$rist$(sfyingly"$unas$#ter"(vacentre#%iours#"vy"$yeed!"bk!&cafell#&lloped#$mper#%ntily',
+    '#$wsby"!c""d2"$heer$$ngen#)iaparelli$$ffer$*zophrenics#$mitt#%napps##oll$&ol-age&&friend$"tt#\'weitzer',
+    '#,ence-fiction#*ntillation"&lerite"#oot#%rning#$urie"*ratchplate#\'ewed-up#&ibbles$(ptwriter$%vener#\'oungers#(ummaging%"py$%nched',
+    '$#ton"!s##i-2"&udding#%ffing#$lley$%pting##rry"%ythed!,e&ntilde;ora"%abird#%combe#%field#$gate$"er',
+    '##ler##nce#$port#!q#%scape$\'onality#"to#$view#%wards"%badoh"%cond-&%aries)"ly#+ularization"&derunt',
+    '"$emly"(gmenting#"ni"&igneur""ko""la#\'ectable$"ne%#ium#,f-absorption&\'nalysis&(ssertion%&belief&$uild%\'concept',
+    '%(declared\'(finition%*monitoring%)portraits\'\'ssessed%*reflection&#ule%$same%-understanding$%ridge#&l-offs"&mester#*i-official$&circle$%ology',
+    '##ple"(natorial#"or#!s$*ationalism+"ly$&itised\'&zation$&uously#&tencer"%quels"!r##gia#!i$!e',
+    '$"ne##ota#$ried#\'viceman""se#&ostris"$tter"$urat"-venth-century$#rus$"so"%xless"!z!%habba#$kers',
+    '%$olic$&pooing#"nd##per#"rd#%talin#(ughnessy##ver#&wcross"$eedy$#han#"ik#%lduck$#lac%$fire',
+    '#"rd$#een$"on#!w"%ipley##raz$$king"%oeing$%laces#"na#!o$$ters#(plifters#\'relines$)t-changed',
+    '*"ed&+sightedness&$wave%$cuts%#ens#%tover#(wmanship"!p"&reeves"&uffles#"tt%#les"$ying!#iam")de-street',
+    '$%burns$$real$%shows%&tepped#%gwick#$ling"*ght-seeing#%nally&#men$#ers$#ore$\'posting"!i"$lber#!o',
+    '$#ing$!y#(ver-grey\'&plated&!s%$ster"%monds#&pering"#ndy#*gle-person\'$step&!t#$hala#$ning#)o-british',
+    '""on"#ppl"#res"$sley#$sons#\'terhood&"ly&(s-in-law"&t-down#*e-specific#"ka#$tin\'#$well"(x-figure$$hour',
+    '#*th-formers$&y-nine"%zzled!&jahrir!%kated""ew"#iff#%mmers$!p#(rmishers(#ing"&y-high#%larks!(lackness##den',
+    '#$shes#$tter##yer"(eepiness$#ved##uth##wed"&ighted#%pshod%%tream#%tting"&ogging#)w-growing%&motion"!r',
+    '#"rp$$ring!+mall-signal%(er-scale&!y#$rten"!c"%eaton#%lters"!g"$ocks#"gs#"te#%ulder"$yrna',
+    '"$arls"(iggering#$ppet#\'velling#$zort"#obs#!g#"ok#!t$"ty#(w-capped$%balls$%flake"%uggle&#ing',
+    '"%bchak"-cial-security$)ocultural#%ratic"&ftener$"ie"&ldiery#)icitously$$dify$%psism$%taire""ma#*ervillians##oza"!o',
+    '#$thes"#per#%ranos"$rbet#"en#"ge##ley#(rowfully""uk#"le#)ndblaster%&tracks#!s$!a#$tine',
+    '!$paak#&ce-age&$like&%times%$port%%ships&#uit#%niels##rcs$$kles&!y%!y#$ssky#"ts$&tering',
+    '%#men##cfp$$iale%"nt$!t#&edwell#(ndthrift#!y"!g"&hagnum"\'insters#\'tefully"#lat%#ter#(it-level',
+    '"%oiler#)nsorships#"ok#$tter\'!s##uts"%rague$"in#)eadeagled#*ing-loaded$#tes#!u#!y""uc#!d',
+    '!(quelched##ier$%ggles$#rts!"ry!#tac$#ker#$ffer\'!s#*ge-managed$(geringly#(lactites#$mens$\'fordham#\'ndalone',
+    '%&points$#ger$%islav#$pled##rke&!y$$line$\'ry-eyed$$ship#"sh#$tham$%ioner\'&master$&uesque%#ses',
+    '#\'adiness$#ler$\'mroller%!s##eds$$ling%$work$\'p-sided$$rage#&inberg#%nness#(p-father%&mother$\'brother$#han',
+    '#$reos\'%copic$\'ilising\'&zation("ed#$wing"&iarkoz#(ckleback#!g$$mata\'$ised(#zed##ngy$#ker#%pends',
+    '"!o#$cker%\'holders)#ing%%inged%%piled%&taking#*ichiometry#$king#"mp%"ie##ner%!y$\'y-faced#$oges',
+    '#$p-go$"es#\'re-room%#man$"ks#&urhead$"te&!r"-raight-backed%%tened$#ker$"na%%gford$$wson#%eamer',
+    '$)ptokinase$\'tchered%#ton$#wth#\'ickland$&dently$$ping##obe$#lls$)ng-minded$#ppy#%ummer&#ing#\'ychnine"-udent-centred',
+    '#$nner$$tman#&pefied#%rdily!-ub-assemblies$&editor$(national$\'species$%title%\'ropical#(cortical#&ducted%#ing#&family#*ject-based',
+    '##let#\'mucosal#%polar#(routines#$sist\'"ed#(versives")ccessions"!d#)den-death#!s"(fferance")i_generis"&lgrave#"ks',
+    '"(mmerhill&!y"*n-drenched#%beams$$urnt#\'connect#$down#$less##net$#ing#\'screens$$pots"+perannuated%,conductivity,"or',
+    '%\'latives%&models%%sight#"ra%+nationalism"&rbiton#\'charges##fed"%sanne#&pender#!s"%varov!\'valbard!\'waddled#!g',
+    '$!s#%nsong#!t##yze"\'eatshop#%epers$$ties%#man"%illed%#ing#\'mfeeder#&nburne##ped!!x!!y',
+    '"%drome"#map#*metrically("es#%posia"-nchronisation*!e)&zation\'$tron#%dicat#(ergistic#(tactical$(hesising(#zer&$tics',
+    '#%temes +t&ouml;pfer!)-junction!!7!%abard$#sco#%letop""ce#&tician")djikistan"#ffy"$gset&!s"%i_chi#%l-end',
+    '$%piece"$kin\'""lc##mud"(mbourine%!v#%eside##pax"&ngling##jug#$ners&!y"\'rantula##bes#&getted',
+    '#!o#%varas"$sman#&selled"#tar%$stan#$iana##ler##ton"&verner&#ier"+x-efficient%%xempt$&payers!"bc',
+    '$#ups#\'ltaoich#&mmates#$pots#)r-stained##ser%!s#!t$!s")chnicolor"$flon"!k"%lefon$\'graphic$%ology',
+    '%&rinter$$visa#%ltale"#mpi$\'orality"&ndring##ors##ted"\'rm-time#"ri%)toriality"&sticle$!y"\'xt-book$&uality',
+    '!$hais"*ematically#\'ogonist#"ra$&eunder$%mally#%siger$$pian"&inkin\'$!s#!r$)d-century&&placed&%round"\'orndyke',
+    '"!r##ale#,ee-bedroomed&(cornered&$door&&fifths&$mile&%stage&$tier#%ombin&"us$%ttles$2ugh_thick_and_thin$$wers#\'uppence',
+    '#!n$\'derbird\'!s#"rs"\'warting!$iare"&berius"$dier"$e-in#$rney$"ra"\'ghthead#"re$"is"#ler',
+    '"*mber-frame#\'e-table%\'wasting$\'keeping$(lessness%%iness#"ms#$pani"\'nbergen##dle#%kered#%tagel"%phook#"py#&toeing',
+    '#$ania#%combe#(illation$"us##ter#$ular!!j!"ma!\'nf-&agr!&obolsk##ruk"$day/#\'dington""ff$#ees',
+    '"#kai$#mak"%lling"#mas#"ba##lin"$ngan#$sure""ot$(hbrushes%!y"\'p-notch#$knot#"sy%&-turvy',
+    '#&nadoes#%sades#%tilla$$urer\'!s"%temic"(uchdowns#$ghen#%raine$&niquet"\'wnscape!#plf"!s!*r&egrave;s"!1',
+    '#%cheal$%kside&$uits#%de-in#)ffic-free#$mcar\'!s#(nsceiver%*fer-listed&&igured%%gress%%ients%(missible\'$ttal%"om',
+    '&&orters&%uters%&racial#)or&eacute#&ttoria#!x#$zior"\'eadwell$\'sonable%%uries#$bles#%eline#$foil#$kked#%mbles',
+    '#%polov#%uhand#"vi%"so"$iano$#xis#"ce$%olour$%yclic#!g#$mdon#(nidadian#"os#$star#$vers',
+    '"\'ocadero#%oping#+uble-makers"%uants#%ckers#$ffle#%jillo"$yin\'!&sarism"!r!"tt!%uckey##son""ff"(g-of-war',
+    '"(mbledown"$ners#%guska#$ings#&nelled"$pper"&rakina##bid#%genev#%meric#0n-of-the-century%&taking$#ers$%overs#"pi',
+    '"$tted$!i#!u!&waddle".enty-four-hour+"th"*ice-weekly#&ddling#)n-engined$#ges#"rl#%tches$!e"+o-bedroomed$#car',
+    '$%faced$%horse$%litre$&parent%$hase$&volume#%pence#$some"!w!&ycoons"#lor"&nedale")pewriting"+rannosaurus!"zu',
+    '!"/l""ml!!b""40!!d!"f9!"gc!"hm!"lf"!m")tra-right%*structural!&mbrage"&piring!*nambitious',
+    '#$sked#+vailability"(becoming$&liever#\'leached#%utton"-challengeable%\'ngeable%\'ritable#&limbed#+o-operative$\'llected$%ncern%(ditioned%\'formity',
+    '%)scionable&&idered%&tested%)vincingly#&rowded##tad#)ultivated"&der-15\'!6\'!9&#21s&)developed&)estimated%#arm%%croft',
+    '%%frame%$lain&$ings%(pinnings%&scored%#tow%$used##ies#)ocumented"(earthing#(ndurable#\'xamined",faithfulness#*oreseeable#(urnished',
+    '#)overnable#\'racious*"ly"(heard-of"%igate#*lateralism$%inear#*nformative$)telligent#!v$(ersalism"&lovely"+mistakeable#\'olested"%nerve',
+    '#(rganised"!p#&ainted#\'layable$%ugged",quantifiable"(romantic"(saleable#\'chooled##eat#\'ociable#(peakably%%cific"$tcok#\'idiness',
+    '#)ranslated$#uth#%urned"\'varying")welcoming#(holesome##ins##rap!"ph#$olds"%lifts"%psala"&raised"&starts!%rbino',
+    '%"te"!r"\'uguayan!/s&dollar;10,000*%2,000"!."%borne"\'dollars")elessness#*r-supplied!!t"#ero"!s (vacantly#&uuming',
+    '##uer")ledictory$#ncy#&idates#%kyrie#"or#,ue-for-money\'#ree"(navskaya#%brugh#\'dalized"&shinov#$quez#&siliou"$uban',
+    '"%lvets"&neered$"to#!n#&tilate"#rba$%ivore$#ose##ger#%ities#$meer$%uyden#$nons#$rill#!s',
+    '$\'iginous"%spers##sey"#uve"#zir!#i\'s"&aducts"&brates"*ce-marshal%*presidency-$tial##ini$\'ousness#!o$#mte',
+    '%%tapes#"or"$eira##nne$%tiane"$gils#%nette(!s"#i\'s##i\'s"*lification"\'ncennes#+dictiveness""ol$#eta',
+    '"$sage##ser#$tula#(ualising\'$zing"$tali#%reous#"us")visection!(ladislav""dl!(ocalists%"ly$(tionally""ls',
+    '"!s"\'yeurism(#tic!$ries!#sam!!t!!u"%kovar +w&ouml;rner!$aafs#"ls"\'ddesdon$#ing##ham#!s',
+    '"#fts"*ge-earning#%gling""if#"ls#&stline#$tin\'"%keful"!l#$cott#"do%"rf#"id#%k-out$#ies',
+    '#)l-to-wall$!a%!s$&enberg%&rstein$\'flowers$$owed#%msley"&ndjina$!s#"es#$king"&rhorse#(ingstown#$ners',
+    '"(shed-out"&tchmen#(er-borne&\'colours%#bus%\'logging%$mark&"en&#ill##tle"%veney!"ba!"c1"!c"!s',
+    '!#eal#+pons/armour#%rable$%isome#(thercock"$bern"(edkiller#"py"%gerle"&inberg#$rdly%"os"%lders$!s#*l-attended',
+    '%(mannered%%oiled%(prepared%)respected&&ounded%&shaped&)tructured$%esley"!r"&stcott$&macott$$port"#tly!#gms!%harfe',
+    '"*eelbarrows%+chair-bound%%house#\'refores"%inney#$pple#"rr#)te-washed%#fly%$leys$"ty#!z$#zed"(olegrain!&icklow',
+    '#\'e-angle%$open$\'ly-used#%owers"$geon#)glesworth"\'jeratne"!l##bur#%dfire%&lowers#$lowy#%mslow"(nchcombe$\'kelmann',
+    '$\'screens%%hield%%urfer$"us#"ed#%field$$rith#$kler#%tered&$thur$"on"%tcher##hel$(standing#&tering',
+    '"&venhoe!%oeful"%lfish$$wood#"of#\'vercote"!m#\'en-only"*od-burning$#all$&carver$#man#$lmer#!s$#ter',
+    '"#rcs#&k-load$%books$$wear#)ld-system&%weary##med#$sens#\'thiness%(lessness$#ley!\'rangler#(p-around#&ysford"&eaking',
+    '\'!s"$ithe""vs!"ta!#yld"$vern \'x-rated"&window!!2"!5!!a!$enon$$phon!!m!\'orandor',
+    ' "y\'!#-mp!\'amaichi$$moto"!n"%rnton""sa"\'vlinsky!+ear-to-year$%nings##sts"$s/no!$o-yo"#ked#%ohama',
+    '##ks.##uba"&semite#$hida"%usefi#)thfulness!$ukon"!l"#sef!%vette -z&lsqb;x&rsqb!!1!!2!%ahara""pp',
+    '!&ehnder""it"#lah#"da"&mstvos"&olites"$phyr"(ro-rated"%tland!$hang!&iegler"!g"%mbala#\'mermann"&onists',
+    '""ff")oplankton!"sa!!u"$wayi',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_10 = (
+count_10 = 6694
+
+heads_10 = (
     '&agr;-',
-    '&amp;g',
-    '&dollar;0.01',
-    '&dollar;0.03',
-    '&dollar;0.10',
-    '&dollar;1.1',
-    '&dollar;1.3',
-    '&dollar;1.48',
-    '&dollar;1.49',
-    '&dollar;1.4m',
-    '&dollar;1.51',
-    '&dollar;1.52',
-    '&dollar;1.7',
-    '&dollar;1.8',
-    '&dollar;1.8m',
-    '&dollar;1.9m',
     '&dollar;12,000',
-    '&dollar;14',
-    '&dollar;17',
-    '&dollar;18,000',
-    '&dollar;1bn',
-    '&dollar;2.1m',
-    '&dollar;2.3m',
-    '&dollar;2.5',
-    '&dollar;2.6m',
-    '&dollar;35',
-    '&dollar;4.5m',
-    '&dollar;45',
-    '&dollar;500m',
-    '&dollar;6m',
-    '&dollar;75',
-    '&dollar;7m',
     '&eacute;migr&eacute;s',
-    '&eacute;pernay',
-    '&micro;ci',
-    '&micro;g/kg',
-    '&pound;1.1m',
-    '&pound;1.20',
-    '&pound;1.6m',
-    '&pound;1.9',
-    '&pound;10.00',
-    '&pound;11.50',
-    '&pound;110,000',
-    '&pound;11m',
-    '&pound;12,500',
-    '&pound;13.95',
-    '&pound;155',
-    '&pound;17m',
     '&pound;18.99',
-    '&pound;185',
-    '&pound;19,000',
-    '&pound;2,200',
-    '&pound;2.1',
-    '&pound;2.2',
-    '&pound;2.4',
-    '&pound;2.8',
-    '&pound;22.50',
-    '&pound;24.99',
-    '&pound;26,000',
-    '&pound;290',
-    '&pound;299',
-    '&pound;330',
-    '&pound;34.99',
-    '&pound;4.25',
     '&pound;4.75',
-    '&pound;41',
-    '&pound;46',
-    '&pound;47',
-    '&pound;48,000',
-    '&pound;5,500',
-    '&pound;5.5',
-    '&pound;59',
-    '&pound;5bn',
-    '&pound;6,500',
-    '&pound;6000',
-    '&pound;600m',
-    '&pound;62',
-    '&pound;64',
-    '&pound;69.99',
-    '&pound;7.00',
     '&pound;7.5',
-    '&pound;79',
-    '&pound;850,000',
-    '\'40s',
-    '\'appen',
-    '\'appened',
-    '\'ead',
-    '\'ello',
-    '\'it',
-    '\'ope',
-    '\'til',
-    '\'what',
-    '*the',
-    '+10',
-    '-300bp',
-    '-50',
     '-6',
-    '-70&deg;c',
-    '-aer',
-    '-gen.',
-    '-ray',
-    '-style',
-    '-the',
-    '.38',
-    '.4',
-    '.5',
-    '/hco',
-    '/s',
-    '/t/',
-    '0&deg;c',
-    '0&ndash;3',
-    '0-0',
     '0.001',
-    '0.03',
-    '0.04',
-    '0.10',
-    '0.35',
-    '0.45',
-    '0.7%',
-    '007',
-    '021',
-    '0245',
-    '0504',
-    '061',
-    '1&ndash;10',
-    '1&ndash;7',
-    '1.1.1',
-    '1.12',
     '1.22',
-    '1.3.2',
-    '1.3m',
-    '1.5.1',
-    '1.5.3',
-    '1.6%',
-    '1.7%',
-    '1.9%',
-    '10&ndash;13',
-    '10(3)',
-    '10,000m',
-    '10-12',
-    '10-fold',
-    '10-point',
-    '10.00am',
-    '10.15',
     '10.20',
-    '10.30pm',
-    '10.5%',
-    '100&deg;c',
-    '1004',
-    '1006',
-    '100ft',
-    '1013',
-    '1017',
-    '1035',
-    '10min',
-    '10ml',
-    '10oz',
-    '11&ndash;18',
-    '11,500',
-    '11-13',
     '11.20',
-    '11.9',
-    '1155',
-    '1156',
-    '1170',
-    '1179',
-    '1189',
-    '1198',
-    '12&ft',
-    '12&ndash;1',
-    '12&ndash;16',
-    '12-1',
-    '12.45',
-    '1210',
-    '1230',
-    '1245',
     '125cc',
-    '1270',
-    '1272',
-    '1273',
-    '1274',
-    '1278',
-    '1283',
-    '1284',
-    '1286',
-    '1290s',
-    '1291',
-    '1292',
-    '1295',
-    '1298',
-    '12lb',
-    '12m',
     '12v',
-    '13&ndash;15',
-    '13(1)',
-    '13-15',
-    '1305',
-    '1306',
-    '1308',
-    '1311',
-    '1315',
-    '1318',
-    '1321',
-    '1324',
-    '1325',
-    '1328',
-    '1333',
-    '1338',
     '1340s',
-    '1347',
-    '135,000',
-    '1370',
-    '1375',
-    '1376',
-    '14&ins',
-    '14&ndash;1',
-    '14&ndash;15',
-    '14-16',
-    '14.7',
-    '1420',
-    '1460s',
-    '1461',
-    '1476',
-    '1490',
     '1493',
-    '14oz',
-    '14th-century',
-    '15/10/93',
-    '1512',
-    '1516',
-    '1517',
-    '1519',
-    '1521',
-    '1524',
-    '1527',
-    '1532',
-    '1535',
-    '1537',
-    '1548',
-    '1551',
     '1562',
-    '1565',
-    '1567',
-    '1568',
-    '1569',
-    '1571',
-    '1572',
-    '1573',
-    '1576',
-    '1578',
-    '1579',
-    '1591',
-    '1595',
-    '1596',
-    '15c',
-    '16&ndash;17',
     '16-18',
-    '16.4',
-    '1608',
-    '1684',
-    '17&ndash;18',
-    '17-year',
-    '17.6',
-    '17.7',
-    '1700s',
-    '175,000',
-    '17c',
-    '18-month-old',
-    '18.1',
-    '18.4',
-    '18p',
-    '18s',
     '19&ndash;20',
-    '19-21',
-    '19.2',
-    '19.3',
-    '190,000',
-    '1969&ndash;70',
-    '1972a',
-    '1975a',
-    '1977&ndash;81',
-    '1977b',
-    '1980/81',
-    '1981&ndash;82',
-    '1982&ndash;83',
-    '1984&ndash;90',
-    '1984/5',
-    '1984/85',
     '1985/6',
-    '1985/86',
-    '1986-87',
-    '1990\'s',
-    '1995/96',
-    '19xx',
-    '1:10',
-    '1:100',
-    '1nf',
-    '2&ndash;6',
-    '2-fold',
-    '2.00pm',
-    '2.13',
-    '2.16',
-    '2.2.1',
-    '2.2.2',
     '2.4%',
-    '2.50',
-    '2.9%',
-    '2/3',
-    '20&ndash;24',
-    '20-yard',
-    '20.1',
-    '20.3',
-    '20.5',
-    '200%',
-    '200&deg;c',
-    '200mb',
-    '2015',
-    '20m',
-    '20mhz',
-    '22.7',
     '22/10/93',
-    '22mm',
-    '23.5',
-    '23.7',
-    '24.3',
-    '24p',
-    '24v',
-    '25&deg;c',
-    '25-27',
-    '25/10/93',
-    '250g',
-    '250ml',
-    '25cm',
-    '27-29',
-    '2700',
-    '27p',
     '28/10/93',
-    '2e',
-    '2h',
-    '2pc',
-    '3(3)',
-    '3(5)',
-    '3,200',
-    '3,400',
-    '3,800',
-    '3-5',
-    '3.1%',
-    '3.17',
-    '3.2%',
-    '3.21',
-    '3.3%',
-    '3.3.1',
     '3.75',
-    '3.8%',
-    '3.9%',
-    '30&deg;c',
-    '30&ins',
-    '30-31',
-    '30-strong',
-    '300ml',
-    '300mm',
-    '30m',
-    '325i',
-    '33p',
-    '344',
-    '351',
-    '36720-22',
-    '37.5',
     '37838',
-    '37914',
-    '380,000',
-    '381313',
-    '38211',
-    '3dmenu',
-    '3eb',
-    '3ins',
-    '4&ndash;3',
-    '4&ndash;7',
-    '4&ndash;8',
-    '4&ndash;9',
-    '4+',
-    '4,000,000',
-    '4,200',
-    '4.13',
     '4.2.1',
-    '4.3%',
-    '4.3.1',
-    '4.3.2',
-    '4.45',
-    '4.6%',
-    '4.9%',
-    '40&ndash;50',
-    '400g/14oz',
-    '400th',
-    '40mb',
-    '40mm',
-    '40s.',
-    '41,000',
-    '42&deg;c',
-    '43,000',
     '436',
-    '439',
-    '43rd',
-    '445',
-    '449',
-    '45-minute',
-    '4500',
-    '452',
-    '454',
-    '468',
-    '47,000',
-    '477',
-    '478',
-    '47th',
-    '4800',
-    '483',
     '486dx',
-    '487',
-    '489',
-    '49-year-old',
-    '493',
-    '495',
-    '496',
-    '497',
-    '4ins',
-    '4mm',
-    '4x4',
-    '5&ft',
-    '5&ndash;16',
-    '5(3)',
-    '5-string',
-    '5.1.2',
     '5.17',
-    '5.2.1',
-    '5.2.2',
-    '5.25&ins',
-    '5.4%',
-    '5.6%',
-    '5.7%',
-    '50&ndash;100',
-    '50&ndash;60',
-    '504',
-    '505',
-    '509',
-    '50mph',
-    '513',
-    '516',
-    '517',
     '518',
-    '52,000',
-    '521',
-    '524',
-    '537',
-    '538',
-    '539',
-    '54-year-old',
-    '547',
-    '55-year-old',
-    '556',
-    '557',
-    '55th',
-    '57-year-old',
-    '571',
-    '574',
     '578',
-    '588',
-    '589',
-    '591',
-    '592',
-    '5min',
-    '5ml/tsp',
-    '5s.',
-    '6-8',
-    '6.00pm',
-    '6.1.1',
-    '6.12',
-    '6.14',
-    '6.2.1',
-    '6.2.2',
-    '6.22',
     '6.3.1',
-    '6.45',
-    '6.7%',
-    '60&deg;c',
-    '60&ndash;70',
-    '600dpi',
-    '604',
-    '609',
-    '60cm',
-    '60ft',
-    '60m',
-    '60pc',
-    '613',
-    '614',
-    '615',
-    '619',
     '622',
-    '623',
-    '627',
-    '63-year-old',
-    '631',
-    '636',
-    '64,000',
-    '641',
-    '643',
-    '644',
-    '645',
-    '65-year-old',
-    '656',
-    '658',
-    '65p',
-    '661',
     '668',
-    '669',
-    '672',
-    '68,000',
-    '68th',
-    '6s',
-    '7&frac12',
-    '7&ins',
-    '7&ndash;3',
-    '7-0',
-    '7-4',
-    '7.11',
-    '7.15pm',
-    '7.3.1',
-    '7.6%',
-    '70\'s',
     '70-year-old',
-    '702',
-    '709',
-    '714',
-    '72nd',
-    '73-year-old',
-    '734',
-    '735',
-    '736',
-    '745',
-    '748',
-    '752',
-    '753',
-    '757',
-    '761',
-    '773510',
     '774',
-    '776',
-    '778',
-    '785',
-    '790',
-    '791',
-    '792',
-    '798',
-    '7m',
-    '8&frac12',
-    '8&ft',
-    '8-10',
-    '8.15pm',
-    '8.25',
-    '8.45',
-    '80-year-old',
     '80286',
-    '803',
-    '805',
-    '810',
-    '814',
-    '815',
-    '822',
-    '829',
-    '82nd',
-    '833',
-    '836',
-    '85(3)',
-    '870',
-    '877',
-    '88th',
-    '8mm',
     '8pc',
-    '9&ft',
-    '9&ndash;11',
-    '9&ndash;13',
-    '9(4)',
-    '9-11',
-    '9-2',
-    '9.1%',
-    '9.5%',
-    '90\'s',
-    '90-day',
-    '9000s',
-    '90210',
-    '90mph',
-    '90pc',
-    '955',
     '970',
-    '99.99a',
-    '990',
-    '991',
-    '9a',
-    '9d',
-    'a&yuml',
-    'a-g',
-    'a/ux',
-    'a11',
-    'a2u',
-    'a45',
-    'a:c',
-    'abattoirs',
-    'abdou',
-    'abducting',
     'aber',
-    'abergele',
-    'abington',
-    'abkhaz',
-    'ablett',
-    'ablutions',
-    'abm',
-    'abou',
-    'absolon',
-    'absorbers',
-    'absorptive',
-    'abudah',
-    'abuja',
-    'abutting',
-    'abwehr',
-    'abydos',
     'abyssal',
-    'ac30',
-    'academicals',
-    'acceding',
-    'accident-prone',
-    'accompanist',
-    'according_as',
-    'accreted',
-    'accuser',
-    'accusers',
-    'acidosis',
-    'acl',
-    'acland',
-    'acquaintanceship',
-    'acquiescing',
-    'acteson',
     'actioned',
-    'activity-based',
-    'actuated',
-    'acyl',
-    'adalard',
-    'adcock',
-    'addington',
-    'addressees',
-    'addy',
-    'adiabatic',
-    'adimov',
-    'adjudicators',
-    'admonishing',
-    'adorns',
-    'adstar',
-    'advani',
     'advantageously',
-    'adventuring',
-    'adverbal',
-    'adverbials',
-    'advisedly',
-    'aeeu',
-    'aegon',
-    'aelfwald',
-    'aeolian',
-    'aerated',
-    'aerodromes',
-    'aeronca',
-    'aethelberht',
-    'afbd',
-    'afflictions',
-    'affordability',
     'afforested',
-    'afrikaans',
-    'after-life',
-    'afterbirth',
-    'afterglow',
-    'agassiz',
-    'agate',
-    'age-specific',
-    'agenais',
-    'agia',
-    'agog',
-    'agonizingly',
-    'agriculturalists',
-    'agriculturally',
-    'agrochemical',
-    'ahoy',
     'aibs',
-    'aider',
-    'aimar',
-    'ainsdale',
-    'air-cooled',
-    'airbag',
-    'airbags',
-    'airbrush',
-    'aircrews',
-    'aird',
-    'airlie',
-    'airplanes',
-    'aisha',
-    'ait',
-    'aix/6000',
-    'akademie',
     'akashi',
-    'akayev',
-    'akihito',
-    'al-farajh',
-    'al_fresco',
-    'alameda',
-    'alanine',
-    'albemarle',
-    'alberti',
-    'albertina',
-    'albret',
-    'albright',
-    'aldergrove',
-    'aldwych',
-    'aled',
-    'alfreton',
     'algebraically',
-    'alianza',
-    'alick',
-    'alimony',
-    'alkanes',
-    'all-in',
-    'all-or-nothing',
-    'all-seeing',
-    'allard',
-    'allegories',
-    'alleluia',
-    'allergens',
-    'alleyne',
-    'allianz',
-    'allied-lyons',
-    'allo',
     'allsorts',
-    'allude',
-    'allus',
-    'alluvium',
-    'allying',
-    'almondsbury',
-    'aloe',
-    'aloysia',
-    'alpaca',
-    'alpha-based',
-    'alphabets',
-    'alpina',
-    'alsatians',
-    'alsys',
-    'alta',
-    'altai',
     'alternations',
-    'altun',
-    'alvar',
-    'amalfi',
-    'amaryllis',
-    'ambrogio',
-    'amec',
-    'ameliorated',
-    'amex',
-    'amiodarone',
-    'ammonites',
-    'ammonoids',
-    'amoeba',
-    'amory',
-    'amplifies',
-    'amputations',
     'amr',
-    'amritsar',
-    'anabolic',
-    'anarchism',
-    'anas',
-    'anatomists',
-    'anchovies',
-    'andalusian',
-    'andesite',
-    'andreyev',
-    'andries',
-    'andrzej',
-    'aneurysm',
-    'ang',
-    'angkor',
-    'anglo-dutch',
     'anglo-german',
-    'anglo-scottish',
-    'anil',
-    'aniline',
-    'animations',
-    'anisotropic',
-    'ankle-length',
-    'annandale',
-    'annely',
-    'annualized',
-    'ano',
-    'anser',
-    'antagonized',
-    'ante-post',
-    'anthias',
-    'anthrax',
     'anthropogenic',
-    'anti-americanism',
-    'anti-catholic',
-    'anti-christian',
-    'anti-corruption',
-    'anti-hepatitis',
-    'anti-hero',
-    'anti-imperialist',
-    'anti-inflationary',
-    'anti-iraqi',
-    'anti-labour',
-    'anti-neutrophil',
-    'anti-racism',
-    'antiarrhythmic',
-    'antibes',
-    'anticlerical',
     'anticlericalism',
-    'anticodon',
-    'anticolon',
-    'anticompetitive',
-    'antimicrobial',
-    'antiparallel',
-    'antiparticles',
-    'antipodes',
-    'antiquary',
-    'antisense',
-    'antiulcer',
-    'antler',
-    'antonietta',
-    'antonine',
-    'antonis',
-    'anythin\'',
     'anyways',
-    'apaches',
-    'apoplectic',
-    'aposematic',
-    'apostasy',
-    'appenzell',
-    'applecross',
-    'applix',
-    'appn',
-    'apprised',
-    'apra',
-    'apropos',
-    'aprs',
-    'arber',
-    'arbitrageurs',
-    'arbitral',
     'arbor',
-    'arc/info',
-    'archbold',
-    'archdeacons',
-    'architrave',
-    'archived',
-    'ardrossan',
-    'ares',
-    'arfur',
-    'argent',
-    'argentines',
-    'arian',
-    'aristotelians',
-    'arkan',
-    'arkell',
-    'arm-in-arm',
     'armbands',
-    'armfuls',
-    'armhole',
-    'arminian',
-    'armorial',
-    'armory',
-    'armourers',
-    'armstrongs',
-    'arno',
-    'arnott',
-    'arrear',
-    'arrese',
-    'arrhythmia',
-    'arrowe',
-    'arrowed',
-    'arses',
     'art-historical',
-    'artefactual',
-    'artemesia',
-    'artis',
-    'artisoft',
-    'artur',
-    'arusha',
-    'as/400s',
-    'ascription',
-    'ash-wednesday',
-    'ashanti',
-    'ashrawi',
-    'ashton-under-lyne',
-    'ashurst',
-    'asics',
-    'askham',
     'aslef',
-    'aspartate',
-    'aspe',
-    'asperity',
-    'asphyxia',
-    'aspic',
-    'aspidistra',
-    'assail',
-    'assembly-line',
-    'associateship',
-    'astonish',
-    'astutely',
-    'asyut',
-    'atelier',
-    'aten',
-    'athene',
     'athey',
-    'athos',
-    'atlantoaxial',
-    'atomism',
-    'atonal',
-    'atrial',
-    'attach&eacute;s',
-    'attali',
-    'attender',
-    'attentiveness',
-    'attenuate',
-    'attractors',
-    'attributives',
-    'au_revoir',
-    'auctioning',
-    'auks',
     'aunties',
-    'auratic',
-    'aureole',
-    'aurigny',
-    'aus',
-    'auslan',
-    'austerely',
-    'authenticate',
-    'authorizes',
-    'autism',
-    'auto-immune',
-    'autocorrelation',
-    'autocover',
-    'autocue',
-    'autorotation',
-    'availed',
     'avant',
-    'avars',
-    'avc',
-    'avec',
-    'aveling',
-    'avelorn',
-    'aviators',
-    'avis',
-    'avonmouth',
-    'avs',
-    'awakens',
-    'awlad',
-    'axisymmetric',
-    'ayckbourn',
-    'ayers',
-    'aylmer',
     'aymer',
-    'ayre',
-    'aysgarth',
-    'azad',
-    'azadi',
-    'azalea',
-    'azanian',
-    'azeri',
-    'azimuth',
-    'b&flat',
-    'b\'nai',
-    'b\'rith',
-    'b.b.c.',
-    'b.m.f.l.',
-    'b17',
-    'b4',
     'babby',
-    'babyhood',
-    'babysitters',
-    'back-street',
-    'backbones',
-    'backdoor',
-    'backlight',
-    'backslash',
-    'backstreets',
-    'backtracking',
-    'backwardation',
-    'backwoods',
-    'backyards',
-    'bacteriology',
-    'bacteriophage',
-    'baden-w&uuml;rttemberg',
     'bader',
-    'badgered',
-    'baf',
-    'bagnold',
-    'bah',
-    'bahamian',
-    'baht',
-    'bailes',
-    'bakes',
-    'bakhtiar',
-    'balb/c',
-    'balder',
-    'balearic',
-    'balefully',
-    'baling',
-    'ballantine',
     'ballooned',
-    'ballymacarrett',
-    'baluchistan',
-    'balustrades',
-    'bamburgh',
-    'banalities',
-    'banca',
-    'bandar',
-    'banditry',
-    'bandsmen',
-    'bangemann',
-    'bangladeshis',
-    'bankrupted',
-    'baptistery',
-    'bara',
-    'barbed-wire',
     'barbell',
-    'barbers',
-    'barbirolli',
-    'barchester',
-    'bards',
-    'barford',
-    'bargepole',
-    'barmby',
-    'barnardos',
-    'barrages',
-    'barrow-in-furness',
-    'bart&oacute;k',
-    'bartered',
-    'baselitz',
-    'basilican',
-    'basilicas',
     'basmati',
-    'bassline',
-    'bastin',
-    'basting',
-    'basw',
-    'bated',
-    'batey',
-    'bathtub',
-    'batista',
-    'batley',
-    'bayreuth',
-    'baywatch',
-    'bazin',
-    'bbc-tv',
-    'bcc',
-    'bcu',
     'bdo',
-    'bearsden',
-    'beasley',
-    'beastie',
-    'beastline',
-    'beatitudes',
-    'beaulieu',
-    'beautician',
-    'beaverbrooks',
-    'beckley',
-    'beda',
-    'bedlinen',
-    'bedouin',
-    'bedsteads',
-    'bedwetting',
-    'beeding',
     'beefburgers',
-    'beeny',
-    'beesley',
-    'befuddled',
-    'bejewelled',
-    'belarus',
-    'belays',
-    'belgrano',
-    'belittling',
-    'bellotti',
-    'belsen',
-    'bembridge',
-    'bemoan',
-    'bemoaned',
-    'benedetto',
-    'benedictines',
     'benefice',
-    'benefitting',
-    'benyon',
-    'benzodiazepines',
-    'berchtesgaden',
-    'berge',
-    'berlitz',
-    'berman',
-    'bernal',
-    'bernhardt',
-    'bernier',
-    'berwick-upon-tweed',
-    'besant',
-    'best-sellers',
-    'bestsellers',
-    'beswick',
     'betas',
-    'bethell',
-    'bettelheim',
-    'betteridge',
-    'betwixt',
-    'bevins',
-    'beynon',
-    'bez',
-    'bharatpur',
-    'bhattarai',
-    'bheinn',
-    'biannual',
-    'bickerstaffe',
-    'bielecki',
-    'bienvida',
-    'bier',
     'biggest-ever',
-    'biggleswade',
-    'bigwigs',
-    'bijou',
-    'bil',
-    'bilayer',
-    'billion-worth',
-    'binbrook',
-    'binned',
-    'biochemist',
-    'biopic',
-    'bioplan',
-    'bioremediation',
-    'biosensors',
-    'biosynthesis',
-    'bipedal',
     'biphenyls',
-    'biplanes',
-    'bira',
-    'birdseye',
-    'birkitt',
-    'birmingham-based',
-    'biros',
-    'birthing',
-    'bisected',
-    'bisexuality',
-    'bitstream',
-    'bitterest',
-    'bittersweet',
-    'bitty',
-    'bivariate',
-    'bjaaland',
     'blaby',
-    'black-backed',
-    'blackening',
-    'blackjack',
-    'blackmoor',
-    'blackrock',
-    'blackwater',
-    'blaikie',
-    'blanchard',
-    'blanketed',
-    'blarney',
-    'blastocysts',
-    'blauner',
-    'bleaches',
-    'bleaklow',
-    'blearily',
     'bleated',
-    'blefuscu',
-    'bligh',
-    'blitzkrieg',
-    'blizzards',
-    'blockades',
-    'blockading',
-    'blocky',
-    'blondie',
-    'blood-borne',
-    'blood-letting',
-    'blood-soaked',
-    'bloodhound',
-    'blow-up',
-    'bloye',
-    'bludgeon',
     'blurt',
-    'bnf',
-    'boadicea',
-    'board-level',
-    'boarder',
-    'bock',
-    'boddington',
-    'boded',
-    'bodelwyddan',
-    'boggle',
-    'boiotian',
-    'boipatong',
-    'boland',
-    'boll',
-    'bombardier',
-    'bombast',
     'bombastic',
-    'bondi',
-    'bonhams',
-    'bonk',
-    'bonking',
-    'bonne',
-    'booing',
-    'bookbinding',
-    'booklist',
-    'bookstore',
-    'boomer',
-    'boosters',
-    'boothby',
-    'boothferry',
-    'boozer',
-    'bor',
     'bord',
-    'borden',
-    'boringly',
-    'borromeo',
-    'bosnia-herzegovina',
-    'botero',
-    'botica',
-    'botolph',
-    'bouchard',
-    'boudiaf',
-    'boughton',
-    'bourani',
-    'bourbons',
-    'bournonville',
-    'bouterse',
-    'bouzy',
     'bowd/reporting',
-    'bown',
-    'boyer',
-    'bpi',
-    'brabazon',
-    'brackenbury',
-    'braham',
-    'brain-damaged',
-    'branchial',
-    'brandywell',
-    'braniel',
-    'brant',
-    'brassicas',
-    'brassiere',
-    'braudel',
-    'brazzaville',
     'breakages',
-    'breaking-point',
-    'breast-fed',
-    'breastplate',
-    'breathalyser',
-    'breckland',
-    'breen',
-    'breezily',
-    'brel',
-    'brentano',
-    'brenton',
-    'bret',
-    'bricklayers',
-    'bridgehead',
-    'bridport',
-    'briers',
     'brigg',
-    'brightly-coloured',
-    'brightside',
-    'bringer',
-    'brinkmanship',
-    'brisker',
-    'britannic',
-    'british-made',
-    'british-owned',
-    'brittleness',
-    'brixham',
-    'broad-minded',
-    'brockway',
-    'brodsky',
-    'brokenly',
-    'bronchi',
     'bronchodilators',
-    'broody',
-    'brothers-in-law',
-    'browsers',
-    'bruhel',
-    'brunskill',
-    'brushwork',
-    'bsd',
-    'bsd/386',
-    'btv',
-    'bucketful',
-    'buda',
-    'buddleia',
-    'budgen',
-    'budgerigar',
-    'buffet-style',
     'buggering',
-    'builth',
-    'bullett',
-    'bulloch',
-    'bullwood',
-    'bumf',
-    'bumface',
-    'burbage',
-    'burbank',
-    'burble',
-    'burgoyne',
-    'buries',
-    'burned-out',
-    'burscough',
-    'bushey',
-    'busker',
     'butchering',
-    'buttermilk',
-    'butterworths',
-    'butyl',
-    'buy-back',
-    'buyoya',
-    'buzzes',
-    'buzzword',
-    'by_the_by',
-    'byfleet',
-    'byrds',
-    'byzantines',
-    'bzip',
-    'bzz',
-    'c&acirc;mara',
-    'c&amp;w',
     'c\'zinsit',
-    'c-',
-    'c-in-c',
-    'c.c.a.',
-    'c.s.',
-    'c02',
-    'caballero',
-    'cabbies',
-    'cabo',
-    'cabrera',
-    'caccini',
-    'cachet',
-    'cadavers',
-    'caddied',
-    'caer',
-    'caff',
     'cairncross',
-    'caisson',
-    'cajamarca',
-    'calcavecchia',
-    'calcified',
-    'caldmore',
-    'calero',
-    'calibrate',
-    'callas',
-    'calloused',
-    'calluna',
-    'calum',
-    'cambodians',
-    'cambric',
-    'camco',
-    'camellia',
     'camisole',
-    'campari',
-    'camphor',
-    'canaris',
-    'cancer-causing',
-    'caning',
-    'cannings',
-    'cannonball',
-    'canonic',
-    'canonised',
-    'canopus',
-    'cantilever',
-    'capacitive',
-    'capetians',
-    'capitalistic',
-    'capo',
     'capstan',
-    'captaining',
-    'captioned',
-    'caravanning',
-    'carbachol',
-    'carbonic',
-    'cardamom',
-    'carding',
-    'cardington',
-    'cardiopulmonary',
-    'caretaking',
-    'cariad',
-    'carinii',
-    'carinish',
-    'carlen',
-    'carleton',
     'carlie',
-    'carlists',
-    'carnarvon',
-    'carnforth',
-    'carolan',
-    'carotid',
-    'carpathians',
-    'carrier-bag',
-    'carron',
-    'carry-on',
-    'carthaginians',
-    'cartographer',
-    'cartwheels',
-    'caruso',
-    'carvery',
-    'carvin',
     'casaubon',
-    'case-by-case',
-    'case-studies',
-    'cashew',
-    'cashguard',
-    'casio',
-    'caskets',
-    'cassis',
-    'cast-offs',
-    'castellans',
-    'castigate',
-    'castleton',
-    'castrol',
-    'cataclysm',
-    'catalans',
-    'catamarans',
     'catatonic',
-    'catchments',
-    'categorizing',
-    'cathcart',
-    'cauldrons',
-    'cauliflowers',
-    'cavallo',
-    'caversham',
-    'cawley',
-    'cayley',
-    'cbp100',
-    'cbr',
-    'cbt',
-    'cchem',
-    'ccitt',
-    'cck-8',
     'ccoo',
-    'cd-a',
-    'cdai',
-    'ceau&scedil;escus',
-    'cecchini',
-    'cedarwood',
-    'cei',
-    'celebrant',
-    'celeriac',
-    'celestine',
-    'cella',
-    'cellini',
-    'century-fox',
-    'cephalic',
-    'cerberus',
-    'ceredigion',
     'ceremoniously',
-    'cerne',
-    'cerruti',
-    'cesare',
-    'cess',
-    'cetacean',
-    'cftc',
-    'cgdk',
-    'chai',
-    'chainstore',
-    'chairlift',
-    'chalford',
-    'chalks',
-    'chaloner',
-    'chambre',
-    'chamlong',
     'championship-winning',
-    'champney',
-    'chancy',
-    'chandlers',
-    'channell',
-    'chapelle',
-    'chapple',
-    'chapple-hyam',
-    'charabanc',
-    'characterisations',
-    'charg&eacute_d\'affaires',
-    'charlbury',
-    'charles-henri',
-    'charterer',
-    'chartering',
-    'charvel',
     'chastise',
-    'chauvinists',
-    'chavez',
-    'chay',
-    'chea',
-    'cheam',
-    'check-ups',
-    'cheesy',
-    'chertro',
-    'cherubic',
-    'chesser',
-    'chessington',
-    'cheval',
-    'cheyne',
-    'chiddingfold',
-    'chief-of-staff',
     'chigwell',
-    'chihuahua',
-    'chilblains',
-    'child-like',
-    'childhoods',
-    'childminding',
-    'childrearing',
-    'chillingly',
-    'chinon',
-    'chintzy',
-    'chipie',
-    'chippy',
-    'chittagong',
-    'chlor-chemicals',
-    'choicest',
-    'choirboy',
     'choker',
-    'chokes',
-    'choline',
-    'cholmondeley',
-    'chomping',
-    'chortled',
-    'chou',
-    'christmassy',
-    'christo',
-    'chucks',
-    'chuffing',
-    'chug',
-    'ciampi',
-    'cinderford',
-    'ciphers',
-    'cipriani',
     'circumferential',
-    'circumnavigation',
-    'circumventing',
-    'cirrhotic',
-    'cistercians',
-    'cit&eacute',
-    'city-state',
-    'civil-law',
-    'civvy',
-    'claes',
-    'clairvoyance',
-    'clamorous',
-    'claptrap',
-    'claris',
-    'clashfern',
-    'classico',
     'claud',
-    'claudette',
-    'claverham',
-    'cleansers',
-    'clear-out',
-    'cleat',
-    'cleland',
-    'clementina',
-    'clerides',
-    'clicquot',
-    'climatological',
-    'climaxed',
-    'clincher',
-    'clingy',
-    'clip-art',
-    'cliveden',
     'cloche',
-    'cloke',
-    'clonard',
-    'cloners',
-    'close-cropped',
-    'close-set',
-    'cloughie',
-    'clubman',
-    'clucked',
-    'clueless',
-    'clumping',
-    'clytemnestra',
-    'cmc',
-    'cme',
-    'cmi',
-    'cml',
     'cngsb',
-    'co-citation',
-    'co-director',
-    'co-driver',
-    'co-existed',
-    'co-occurrence',
-    'co-partners',
-    'co-sponsored',
-    'co-stars',
-    'co-written',
-    'coade',
-    'coase',
-    'cobden',
-    'cobs',
-    'cocello',
-    'cockermouth',
     'codify',
-    'codons',
-    'coenwulf',
-    'coetzer',
-    'coffee-pot',
-    'coghill',
-    'cognitively',
-    'cohn-casson',
-    'cojuangco',
-    'colborn',
-    'colcutt',
-    'cold-hearted',
-    'coldingham',
-    'coldunell',
-    'coleford',
-    'colet',
     'collaboratively',
-    'collectorship',
-    'collegium',
-    'collings',
-    'colloidal',
-    'colloquium',
-    'colonialists',
-    'colonials',
-    'colonnaded',
-    'colossians',
-    'colourfully',
-    'colourists',
-    'columned',
-    'colville',
-    'combats',
-    'comforter',
     'comfrey',
-    'comit&eacute',
-    'commending',
-    'commentating',
-    'commie',
-    'commiserate',
-    'commiserated',
-    'commodification',
-    'communicants',
-    'comparator',
-    'compere',
-    'compeyson',
-    'compi&egrave;gne',
-    'complexed',
-    'composting',
-    'compstation',
     'computes',
-    'comradely',
-    'comrie',
-    'comt&eacute',
-    'conceptualising',
-    'concocting',
-    'concoctions',
-    'concordia',
-    'concubines',
-    'confectioner',
-    'confirmations',
-    'confiscating',
-    'conflictual',
-    'confounds',
-    'confucianism',
-    'confusedly',
     'conger',
-    'congregating',
-    'conjugation',
-    'conman',
-    'connectionist',
-    'connotes',
-    'conseil',
-    'consignor',
-    'consolidates',
-    'constitutively',
-    'cont',
-    'contiguity',
-    'contraptions',
-    'contraventions',
-    'contriving',
-    'convalescing',
     'convective',
-    'convector',
-    'conventionalist',
-    'conventionality',
-    'cookham',
-    'cooperativity',
-    'coot',
-    'cop-out',
-    'copiers',
-    'copland',
-    'copped',
-    'copperplate',
-    'copra',
-    'copywriter',
-    'corelli',
-    'corneal',
     'cornet',
-    'corney',
-    'corns',
-    'corporately',
-    'corpuscles',
-    'correctional',
-    'correctionalism',
-    'corrinne',
-    'corroborative',
-    'corrugations',
-    'corsham',
-    'cort&eacute;s',
-    'cortege',
-    'coryza',
-    'cosatu',
-    'cosby',
     'cosgrove',
-    'cosi',
-    'cosmeston',
-    'cosmids',
-    'cosmonauts',
-    'cost-conscious',
-    'costless',
-    'costliest',
-    'cottam',
-    'cotter',
-    'cottoned',
-    'coundon',
-    'counter-attacks',
-    'counter-examples',
-    'country-house',
-    'cournot',
     'coursebook',
-    'court-martial',
-    'courtesans',
-    'couscous',
-    'cousteau',
-    'couville',
-    'covariant',
-    'covetous',
-    'covetousness',
-    'cowal',
-    'cowdenbeath',
-    'cowen',
-    'cowles',
-    'coworkers',
-    'coypu',
-    'cozens',
     'cozy',
-    'cp.',
-    'cr&egrave;ches',
-    'cra',
-    'craftspeople',
-    'craigie',
-    'cranbrook',
-    'cranham',
-    'cranium',
-    'cranking',
-    'cranley',
-    'crapper',
-    'cratered',
-    'creaming',
-    'credit-card',
-    'crediting',
     'creutzfeldt-jakob',
-    'crevasse',
-    'crevasses',
-    'crf',
-    'crieff',
-    'crinan',
-    'crinkling',
-    'crispness',
-    'croagh',
-    'croke',
-    'croll',
-    'cromford',
-    'cromwellian',
-    'crookedly',
-    'crosfield',
-    'cross-dressing',
     'cross-eyed',
-    'cross-sections',
-    'cross-spars',
-    'crossmaglen',
-    'crucify',
-    'crucis',
-    'crumpling',
-    'cruse',
-    'crustacea',
-    'crystallinity',
-    'crystallizing',
-    'csd',
-    'csi',
-    'csp',
-    'cuckmere',
-    'cufflinks',
     'cultivations',
-    'cultivator',
-    'culture-ideology',
-    'cupertino',
-    'cupolas',
-    'curacy',
-    'curates',
-    'curdled',
-    'curies',
-    'curley',
-    'curly-haired',
-    'curried',
-    'curtain-raiser',
-    'curtius',
-    'curtsey',
-    'curval',
     'cushy',
-    'cusps',
-    'custodianship',
-    'cuticular',
-    'cutoff',
-    'cvr',
-    'cwmbran',
-    'cwt.',
-    'cyan',
-    'cybernetic',
-    'cybernetics',
-    'cygni',
-    'cymbeline',
-    'cyprio',
-    'cyrano',
-    'cyrix',
     'cysteine',
-    'cytogenetic',
-    'cytosine',
-    'czerny',
-    'd&eacute;by',
-    'd&uuml',
-    'd\'un',
-    'd\'urbervilles',
-    'd.j',
-    'd.sc',
-    'd10',
-    'daa&eacute',
-    'dacron',
-    'daffy',
-    'dafydd',
-    'dah',
     'dahabeeyah',
-    'dahrendorf',
-    'dairyman',
-    'dallied',
-    'dalston',
-    'damnable',
-    'damnedest',
-    'damocles',
-    'damply',
-    'damson',
-    'danubian',
-    'dari',
-    'dario',
-    'dark-blue',
-    'dark-brown',
-    'dark-coloured',
     'dark-skinned',
-    'darlin\'',
-    'darman',
-    'darmstadt',
-    'data-processing',
-    'datafile',
-    'daughters-in-law',
-    'daunt',
-    'davidoff',
-    'dawa',
-    'day-lewis',
-    'dayglo',
-    'daysack',
-    'dazzlingly',
-    'db/2',
-    'dba',
     'dc(s)',
-    'dcac',
-    'dd-mmm-yyyy',
-    'dda',
-    'deadliest',
-    'dealerships',
-    'deauville',
-    'debilitated',
-    'debs',
-    'debt-ridden',
-    'debutant',
-    'decaffeinated',
-    'decathlon',
-    'decelerate',
-    'decentralise',
-    'decentralize',
     'decidendi',
-    'decimus',
-    'deciphered',
-    'declamatory',
-    'declarer',
-    'decolonization',
-    'decoratively',
-    'decoys',
-    'decry',
-    'ded',
-    'deform',
-    'deformations',
-    'defrauded',
-    'degenerates',
-    'deified',
-    'deliberating',
     'delimitation',
-    'delon',
-    'delphiniums',
-    'delyn',
-    'demetrius',
-    'demi-caract&egrave;re',
-    'demob',
-    'demolitions',
-    'denaturation',
-    'denbighshire',
-    'denitrification',
-    'densest',
-    'denzil',
-    'deodorants',
-    'deploys',
-    'depreciating',
     'deputise',
-    'derbies',
-    'deregulate',
-    'dering',
-    'derivations',
-    'derwentwater',
-    'deryck',
-    'desertions',
-    'destabilisation',
-    'desulphurisation',
-    'detainee',
-    'detentions',
-    'dethroned',
-    'detinue',
-    'deus',
-    'deuterons',
     'devascularisation',
-    'deviancy',
-    'devil-may-care',
-    'devises',
-    'devotedly',
-    'dewy',
-    'dgr',
-    'dh&amacr;mi',
-    'dhu',
-    'diachronic',
-    'dial-up',
-    'diamond-shaped',
-    'diaper',
-    'dichotomies',
-    'didsbury',
-    'dietician',
     'diffs',
-    'dikes',
-    'diktat',
-    'dilapidation',
-    'dilate',
-    'dilation',
-    'dildo',
-    'dimethylhydrazine',
-    'dinantian',
-    'ding-dong',
-    'dinh',
-    'dinner-party',
-    'dinucleotide',
-    'diomede',
-    'diouf',
-    'dip.he',
     'dippy',
-    'directorates',
-    'direst',
-    'disaffiliation',
-    'disafforested',
-    'disassociate',
-    'disavow',
-    'disavowal',
-    'discards',
-    'discernable',
-    'disclaimed',
-    'discolouration',
-    'disconnecting',
-    'disconnects',
-    'discontinuing',
-    'discotheques',
     'discounters',
-    'discourtesy',
-    'discworld',
-    'disembarking',
-    'disgorging',
-    'disgracefully',
-    'dishcloth',
-    'diskette',
-    'disley',
-    'dismaying',
-    'dismember',
-    'dismembering',
-    'disneyworld',
-    'disorientating',
-    'disparage',
-    'dispersals',
     'displease',
-    'displeasing',
-    'dispositive',
-    'disproportion',
-    'dissented',
-    'dissenter',
-    'dissimulation',
-    'dissipating',
-    'dissociating',
-    'dissolute',
-    'dissonances',
-    'distaff',
-    'distention',
-    'distinctness',
-    'divesting',
-    'divi',
     'divisor',
-    'divorcees',
-    'dix',
-    'dixit',
-    'dl',
-    'dl1',
-    'dlv',
-    'dmem',
-    'dna-protein',
-    'dnj',
-    'dns',
-    'docility',
-    'docs',
-    'dodder',
-    'dodecamer',
-    'dodges',
     'dodman',
-    'doer',
-    'dogfight',
-    'dogfish',
-    'doggerel',
-    'dolce',
-    'doled',
-    'dolefully',
-    'dollops',
-    'dombey',
-    'domestics',
-    'domine',
-    'don\'',
-    'donnison',
-    'dooling',
-    'doormen',
     'dopacs',
-    'dorma',
-    'dorman-smith',
-    'dornoch',
-    'dossiers',
-    'douaumont',
-    'double-check',
-    'double-glazed',
-    'double-headed',
-    'dovecote',
-    'dowels',
-    'down-market',
-    'downhole',
-    'downloaded',
-    'downmarket',
-    'downsize',
     'downstage',
-    'draco',
-    'draftsmen',
-    'draining-board',
-    'drainpipes',
-    'dramatise',
-    'dramatized',
-    'drawstring',
-    'drax',
-    'dreadlocks',
-    'dreamflight',
-    'dreamless',
-    'dressmakers',
-    'dribbles',
-    'drift-netting',
-    'driscoll',
     'drive-in',
-    'drizzling',
-    'drogheda',
-    'dronfield',
-    'droopy',
-    'drp',
-    'drug-trafficking',
-    'drugging',
-    'dry-eyed',
-    'dsd',
-    'dtb',
-    'dts',
-    'duchesse',
-    'ducky',
-    'dudes',
-    'dudgeon',
     'duds',
-    'duffle',
-    'duich',
-    'dulux',
-    'dulverton',
-    'dumb-bells',
-    'dumbo',
-    'dumbstruck',
-    'dumper',
-    'dumpling',
-    'dunmore',
-    'dunno',
-    'dunnock',
-    'dunrossness',
-    'dunton',
-    'durant',
     'durex',
-    'durrell',
-    'dust-free',
-    'dustmen',
-    'duvalier',
-    'dv',
-    'dvo&rcaron&aacute;k',
-    'dzerzhinsky',
-    'e&flat',
-    'e-cadherin',
-    'e.c.',
-    'e.m.',
-    'e.p.s.p.',
-    'e2f',
-    'e8',
-    'eachus',
     'eagle-eyed',
-    'ealdorman',
-    'ealhfrith',
-    'ear-splitting',
-    'eardley',
-    'eardrum',
-    'early-day',
-    'early-season',
-    'earwigs',
-    'eas',
-    'easterners',
-    'eastham',
-    'eberhard',
-    'ebury',
-    'ec-wide',
-    'ecalpemos',
     'ecclestone',
-    'echelon',
-    'ecl',
-    'economize',
-    'ecstasies',
-    'ede',
-    'edgehill',
-    'edgeworth',
-    'edgily',
-    'edhi',
-    'ediacaran',
-    'edis',
-    'edmondson',
-    'edo',
-    'educationist',
-    'edwardians',
     'eeb',
-    'eeig',
-    'ef',
-    'efrem',
-    'egg-shaped',
-    'eggle',
-    'eggshells',
-    'eh9',
-    'ehret',
-    'eidetic',
-    'eight-month-old',
-    'eight-way',
-    'eireann',
-    'eisenstein',
-    'ejaculate',
-    'ejaculated',
     'ejecta',
-    'ejecting',
-    'el-jorr',
-    'elbowing',
-    'electrocardiogram',
-    'electrocuted',
-    'electrophone',
-    'eleven-thirty',
-    'eley',
-    'elie',
-    'elision',
-    'elk',
-    'ellcock',
-    'elmore',
-    'elocution',
-    'elsbeth',
     'elswick',
-    'eluding',
-    'elwyn',
-    'elys&eacute;e',
-    'elys&eacute;es',
-    'emancipatory',
-    'emanuele',
-    'emap',
-    'embargoes',
-    'embezzled',
-    'embrasure',
-    'embryogenesis',
-    'emirate',
-    'empathetic',
-    'employability',
-    'emsa',
     'emulsions',
-    'enabler',
-    'encasing',
-    'encephalitis',
-    'encores',
-    'encumbrances',
-    'encyclopedic',
-    'end-point',
-    'end-to-end',
-    'endangerment',
-    'endangers',
-    'endearingly',
-    'endgame',
-    'endoscopies',
-    'endothermic',
-    'endowing',
     'energetics',
-    'energising',
-    'enforcer',
-    'enfranchisement',
-    'engado',
-    'engendering',
-    'engholm',
-    'engrossing',
-    'ennals',
-    'ennobled',
-    'ennui',
-    'ens',
-    'enslave',
-    'ensnared',
-    'ensuite',
-    'entablature',
     'entertainingly',
-    'enthusing',
-    'entombed',
-    'entrapped',
-    'entreaty',
-    'entrench',
-    'entropic',
-    'enumerative',
-    'envelop',
-    'envisioned',
-    'eoc',
-    'epigastric',
-    'episcopalian',
-    'epitomizes',
-    'epl',
-    'equalizer',
     'equerry',
-    'equestrianism',
-    'equipments',
-    'equivalences',
-    'equivocation',
-    'eraser',
-    'erections',
-    'eretz',
-    'ernestine',
-    'erodes',
-    'erosional',
-    'ers',
-    'eruptive',
-    'es/9000',
-    'escalates',
-    'escudo',
     'esmerelda',
-    'espresso',
-    'esquires',
-    'essayist',
-    'essoldo',
-    'estimable',
-    'estopped',
-    'etch',
-    'ethidium',
-    'ethnocentrism',
-    'ethnographer',
-    'ethnographers',
-    'ethological',
-    'etonians',
-    'ets',
-    'ettrick',
     'etymological',
-    'eugenic',
-    'euric',
-    'euro-rebels',
-    'eurodollars',
-    'euromarkets',
-    'eusebio',
-    'evanescent',
-    'evangelista',
-    'ever-widening',
-    'everdene',
-    'everglades',
-    'evershed',
-    'eversley',
-    'evolutionarily',
-    'ew',
     'ewer',
-    'ex-employee',
-    'ex-england',
-    'ex-lover',
-    'ex-members',
-    'ex-soldiers',
-    'ex-yugoslavia',
-    'exacerbation',
-    'exactitude',
-    'exactness',
-    'exaggerations',
-    'exalt',
-    'excrete',
-    'excusable',
-    'execs',
-    'exempts',
     'exhale',
-    'exhibitionism',
-    'exhibitionist',
-    'exhilarator',
-    'exhumed',
-    'existences',
-    'exley',
-    'exogenously',
-    'exonerate',
-    'exoskeleton',
-    'exothermic',
-    'exotica',
-    'expectancies',
-    'expeditious',
-    'expending',
-    'expos&eacute',
     'expositions',
-    'expository',
-    'expunge',
-    'expunged',
-    'externalized',
-    'externals',
-    'extort',
-    'extra-judicial',
-    'extractions',
-    'extrahepatic',
-    'extraintestinal',
-    'extraordinaire',
-    'extravagances',
-    'exultantly',
-    'exulted',
-    'eye-spots',
     'eye-witnesses',
-    'eyelash',
-    'eyles',
-    'ezekiel',
-    'f\'s',
-    'f-16',
-    'f.c.',
-    'f8',
-    'fabbiano',
-    'faceplate',
-    'faggot',
-    'fahey',
-    'fai',
-    'fairmile',
-    'fairweather',
-    'falciparum',
     'falsehoods',
-    'fancier',
-    'fanclub',
-    'fantasising',
-    'faris',
-    'faro',
-    'fasb',
-    'fast-track',
-    'fastidiousness',
-    'fastness',
-    'fasts',
-    'fat*',
-    'fat-free',
-    'father-figure',
-    'father-of-three',
-    'fatness',
     'faure',
-    'faux_pas',
-    'fav',
-    'favell',
-    'fayeds',
-    'fdic',
-    'feasted',
-    'fec',
-    'fedora',
-    'feebleness',
-    'feed-and-expansion',
-    'feedstuffs',
-    'feinstein',
-    'feisty',
-    'felice',
-    'felines',
     'fellowes',
-    'fels',
-    'femmes',
-    'fenner',
-    'feoffees',
-    'ferd',
-    'ferg',
-    'fermi',
-    'ferrero',
-    'fester',
-    'fet',
-    'feted',
-    'feu',
-    'ff.',
-    'ffl',
-    'ffs',
     'fhsa',
-    'fia',
-    'fib',
-    'fieldhouse',
-    'fiendishly',
-    'fifteen-minute',
-    'fifteenths',
-    'fil',
-    'filenames',
-    'filmy',
-    'finaghy',
-    'financials',
-    'fing',
-    'finnigan',
-    'finnis',
-    'fiorenza',
     'firbank',
-    'firebombs',
-    'firebrace',
-    'firefighting',
-    'fireproof',
-    'firming',
-    'first-generation',
-    'first-night',
-    'first-preference',
-    'fishfinger',
-    'fishman',
-    'fishnet',
-    'fisticuffs',
-    'fitz',
-    'fitzjohn',
-    'fitzosbert',
     'fitzwater',
-    'five-member',
-    'five-month',
-    'five-piece',
-    'five-pound',
-    'five-storey',
-    'fixed-interest',
-    'flagellation',
-    'flagstone',
-    'flamborough',
-    'flange',
-    'flasher',
-    'flat-bottomed',
-    'flattens',
-    'flatters',
-    'flatworms',
     'flautist',
-    'flay',
-    'fledglings',
-    'flintstones',
-    'flippancy',
-    'flipper',
-    'floatplane',
-    'floes',
-    'floodlighting',
-    'floodwater',
-    'floorcoverings',
-    'floppies',
-    'floras',
-    'floribundas',
-    'floristic',
-    'flory',
     'floury',
-    'flowerbed',
-    'flr',
-    'fluorite',
-    'flupper',
-    'fluting',
-    'flutters',
-    'fluvial',
-    'fly-drive',
-    'flycatchers',
-    'flyovers',
-    'foamed',
-    'fogg',
-    'foggerty',
-    'fokin',
-    'follicle',
     'fomm',
-    'fondation',
-    'fonder',
-    'foodstuff',
-    'foolscap',
-    'footer',
-    'footfalls',
-    'footie',
-    'footpads',
-    'footstep',
-    'footstool',
-    'fora',
-    'fordist',
-    'fordyce',
-    'forecaster',
-    'foredeck',
     'forefoot',
-    'foreign-language',
-    'forestalling',
-    'forgivable',
-    'forgives',
-    'forint',
-    'fork-lift',
-    'forkful',
-    'formalize',
-    'forme',
-    'formidably',
-    'formulary',
-    'formwork',
-    'forsythe',
-    'forwarders',
-    'foucard',
     'fouchet',
-    'foul-smelling',
-    'foulis',
-    'founds',
-    'four-and-a-half',
-    'four-course',
-    'four-match',
-    'four-minute',
-    'four-page',
-    'four-party',
-    'four-point',
-    'four-speed',
-    'four-thirty',
-    'four-track',
-    'four-wheeled',
-    'fovea',
     'fowles',
-    'foxe',
-    'foxed',
-    'foxglove',
-    'fractals',
-    'fragolli',
-    'frak',
-    'framers',
-    'framingham',
-    'franchisor',
-    'frankfurter',
-    'frankland',
-    'franklyn',
-    'franois',
-    'frantz',
-    'fraserburgh',
     'frazzled',
-    'freaked',
-    'freakish',
-    'fredegar',
-    'free-lance',
-    'free-wheeling',
-    'freeborn',
-    'freeholds',
-    'freesias',
-    'freeth',
-    'freeze-dried',
-    'frejji',
-    'freshening',
-    'fretless',
-    'fretter',
-    'fretwork',
     'friable',
-    'friarage',
-    'fricker',
-    'frictions',
-    'friesians',
-    'frisby',
-    'frittered',
-    'frodsham',
-    'frogmen',
-    'front-row',
-    'front-runners',
-    'frost-free',
-    'frosting',
-    'frsc',
-    'fruitbat',
-    'fruitlessly',
     'fryers',
-    'frying-pan',
-    'fucks',
-    'fudged',
-    'fudging',
-    'fug',
-    'fulminant',
-    'fumaroli',
-    'fumigation',
-    'functionary',
-    'fund-raiser',
-    'fund-raisers',
-    'fundraisers',
-    'fundus',
-    'fur-lined',
-    'furies',
     'furling',
-    'futurists',
-    'g&acirc;teau',
-    'g&ouml;ring',
-    'g&uuml;nter',
-    'g-24',
-    'g-mex',
-    'g6',
-    'gaa',
-    'gabcikovo',
-    'gaberdine',
-    'gabriela',
-    'gad',
-    'gaffes',
-    'gagauz',
-    'gaia',
     'gainford',
-    'gainful',
-    'gainfully',
-    'galadriel',
-    'galahad',
-    'galleried',
-    'gallstones',
-    'gallus',
-    'galsworthy',
-    'galt',
-    'galwey',
-    'gamma-ray',
-    'gander',
-    'ganged',
-    'ganging',
-    'gardenia',
     'garfunkel',
-    'garlanded',
-    'garnets',
-    'garnham',
-    'garryowen',
-    'garscadden',
-    'garton',
-    'gas-cooled',
-    'gaselee',
-    'gasifiers',
-    'gastroduodenal',
-    'gatepost',
-    'gateposts',
-    'gauls',
-    'gault',
-    'gauntlett',
     'gawain',
-    'gawky',
-    'gcd',
-    'gcr',
-    'geena',
-    'geezers',
-    'gehlen',
-    'gelled',
-    'geller',
-    'gemayel',
-    'gemmill',
-    'genette',
-    'genghis',
-    'genocidal',
-    'gentlewoman',
-    'geometries',
     'geomorphologists',
-    'geophysicists',
-    'georef',
-    'georgiana',
-    'gerbil',
-    'gerda',
-    'gergiev',
-    'gerrit',
-    'gerson',
-    'gert',
-    'gervase',
-    'gesell',
-    'gflops',
-    'gg',
-    'ghettoes',
-    'ghorbanifar',
     'ghosh',
-    'ghoul',
-    'giacomo',
-    'gianluigi',
-    'giffen',
-    'giggly',
-    'gilberto',
-    'gilg',
-    'gilliland',
-    'gilpin',
-    'gimbert',
-    'gimson',
-    'gingery',
-    'giordano',
-    'giorgione',
-    'girl-friends',
     'girlhood',
-    'giry',
-    'gittings',
-    'gittins',
-    'giuliani',
-    'givenchy',
-    'givers',
-    'givin\'',
-    'glac&eacute',
-    'gladiatorial',
-    'glan',
-    'glas',
-    'glassfibre',
-    'glaucoma',
-    'gleaning',
-    'glengormley',
     'glenmore',
-    'glenpatrick',
-    'gleys',
-    'glisten',
-    'gloag',
-    'glomerular',
-    'gluck',
-    'gluons',
-    'glurs',
-    'glutaraldehyde',
-    'glutton',
-    'glycosylated',
-    'glynde',
-    'glynis',
-    'gmt0bst',
-    'gnassingbe',
     'gneiss',
-    'go-go',
-    'go-kart',
-    'gobbets',
-    'gobies',
-    'goers',
-    'gold-rimmed',
-    'golden-brown',
-    'goldfinger',
-    'goldwyn',
-    'gongs',
-    'gonococcal',
-    'gonococcus',
-    'good-humouredly',
-    'good-sized',
-    'goodhart',
     'goodie',
-    'goodway',
-    'gorby',
-    'gorgon',
-    'gortari',
-    'gossage',
-    'goto',
-    'gouaches',
-    'goulash',
-    'government-appointed',
-    'government-controlled',
-    'government-in-exile',
-    'governorships',
-    'gowie',
-    'graceless',
-    'gracey',
     'graciousness',
-    'gradualism',
-    'gradualist',
-    'graeco-roman',
-    'graff',
-    'grainstones',
-    'gramophones',
-    'grandiloquent',
-    'grandstands',
-    'grandtully',
-    'granitic',
-    'grantley',
-    'grantor',
-    'graseby',
-    'grassi',
-    'grater',
     'gratings',
-    'gratuity',
-    'graver',
-    'gravitas',
-    'grayling',
-    'grayshott',
-    'grazers',
-    'grazie',
-    'greasepaint',
-    'great-gran',
-    'great-grandson',
-    'grebe',
-    'greenall',
-    'greenbaum',
-    'gregorio',
-    'gretel',
     'gribbin',
-    'griefs',
-    'grigoriev',
-    'grilly',
-    'grimethorpe',
-    'grimley',
-    'grindelwald',
-    'grindlewood-gryke',
-    'grindley',
-    'gripes',
-    'gristy',
-    'grommets',
-    'ground-breaking',
-    'groundbait',
-    'gru',
-    'grumpily',
     'grunfeld',
-    'grupo',
-    'grypesh',
-    'gsm',
-    'gt4',
-    'gte',
-    'guadalajara',
-    'guano',
-    'guanylate',
-    'gubbins',
-    'gubbio',
-    'gudgeon',
-    'guercino',
-    'guerillas',
-    'guesthouse',
-    'guffaw',
     'guffawed',
-    'guffaws',
-    'guglielmi',
-    'guidi',
-    'guildenstern',
-    'guilder',
-    'guillemot',
-    'gul',
-    'gulag',
-    'gulbuddin',
-    'gulden',
-    'gulfstream',
-    'gullholm',
-    'gullibility',
-    'gummed',
-    'gundobad',
     'gunnar',
-    'gunnerside',
-    'gunshots',
-    'gusfield',
-    'gustavo',
-    'gutting',
-    'gymnastic',
-    'gyula',
-    'h&eacute;caen',
-    'h.m.',
-    'h.p.',
-    'habr&eacute',
-    'hachette',
-    'haematology',
-    'haemorrhoids',
-    'hai',
     'haiku',
-    'haileybury',
-    'hairdo',
-    'haitians',
-    'halberd',
-    'half-asleep',
-    'half-backs',
-    'half-buried',
-    'half-caste',
-    'half-circle',
-    'half-dead',
-    'half-field',
-    'half-filled',
-    'half-forgotten',
-    'half-pay',
-    'half-starved',
     'halfa',
-    'halibut',
-    'halite',
-    'hallamshire',
-    'hallows',
-    'hallways',
-    'hallworth',
-    'halon',
-    'halpern',
-    'halsall',
-    'hamiltons',
-    'hammett',
-    'hand-knitted',
-    'handcuff',
-    'handicapping',
-    'handpainted',
     'hands-off',
-    'hang-gliding',
-    'hanif',
-    'hankered',
-    'hannaford',
-    'hapgood',
-    'haploid',
-    'haplotype',
-    'har',
-    'harangue',
-    'harar',
-    'harbingers',
-    'hard-bitten',
-    'hard-hit',
-    'hardbacks',
-    'hardener',
     'hardier',
-    'hardiness',
-    'hardliner',
-    'hardraw',
-    'hardwearing',
-    'hareem',
-    'harks',
-    'harlesden',
-    'harmondsworth',
-    'harmonia',
-    'harps',
-    'harpsichords',
-    'harridan',
-    'harrod',
-    'harte',
-    'harter',
     'hartland',
-    'hartmann',
-    'has-been',
-    'hashing',
-    'hasler',
-    'hassled',
-    'hathor',
-    'hatreds',
-    'hatta',
-    'haunch',
-    'hauntingly',
-    'hausa',
-    'haverfordwest',
-    'haverhill',
-    'havering',
-    'haversack',
     'haw-haw',
-    'hawarden',
-    'hawkers',
-    'hawkeye',
-    'haymaking',
-    'haywire',
-    'hcfcs',
-    'hcr',
-    'hdur',
-    'hdz',
-    'headlamp',
-    'headlease',
-    'headlight',
-    'headscarves',
-    'health-conscious',
-    'health-related',
     'heaney',
-    'hearing-aid',
-    'heart-breaking',
-    'heart-warming',
-    'hearthrug',
-    'heathens',
-    'heatherton',
-    'heaves',
-    'heckler',
-    'hectoring',
-    'hedonist',
-    'heenan',
-    'hefted',
-    'heide',
-    'heightens',
-    'hein',
     'heiresses',
-    'hel',
-    'helblaster',
-    'helene',
-    'helier',
-    'helios',
-    'hell-fire',
-    'hellen',
-    'helmholtz',
-    'helots',
-    'helpfulness',
-    'helter-skelter',
-    'hemlock',
-    'henman',
-    'hentzau',
-    'her/his',
     'herbivore',
-    'hercegovina',
-    'herm&egrave;s',
-    'hermia',
-    'hermits',
-    'herzberg',
-    'herzen',
-    'het',
-    'heterodimers',
-    'heterodoxy',
-    'hew',
-    'hewson',
-    'hexane',
-    'heydrich',
-    'heysel',
-    'hibbert',
     'hibernate',
-    'hickory',
-    'hickton',
-    'hidebound',
-    'hideout',
-    'hieratic',
-    'hieu',
-    'higginson',
-    'high-altitude',
-    'high-flyers',
-    'high-necked',
-    'high-protein',
-    'high-school',
-    'high-security',
-    'high-volume',
-    'highwaymen',
     'hignett',
-    'hijras',
-    'hikers',
-    'hilali',
-    'hilariously',
-    'hildyard',
-    'hillhouse',
-    'hilliard',
-    'hillwalking',
-    'himem',
-    'hinterlands',
-    'hird',
-    'his197',
-    'hispanics',
-    'hispaniola',
-    'hitch-hiking',
     'hitchens',
-    'hitter',
-    'hj',
-    'hncs',
-    'hnds',
-    'hoad',
-    'hobble',
-    'hobbyists',
-    'hoby',
-    'hoch',
-    'hocking',
-    'hockley',
-    'hocks',
-    'hoeth',
-    'hof',
-    'hoffmann-la',
     'hoflin',
-    'hoggets',
-    'hohner',
-    'holdalls',
-    'holdfast',
-    'hole-in-one',
-    'holiest',
-    'holler',
-    'hollingsworth',
-    'hollingworth',
-    'hollyhurst',
-    'holograms',
-    'holographic',
-    'holstered',
-    'home-help',
-    'homegrown',
     'homeopathy',
-    'homilies',
-    'hominids',
-    'hominoids',
-    'homogenised',
-    'homophones',
-    'honeydew',
-    'honorarium',
-    'honorific',
-    'honorius',
-    'hooley',
-    'hooped',
-    'hooter',
-    'hoovered',
-    'hopkinson',
-    'hopton',
     'hor',
-    'horderley',
-    'horley',
-    'hornbills',
-    'hornsea',
-    'hornsey',
-    'horsebox',
-    'horsehair',
-    'horsemanship',
-    'horseracing',
-    'hosing',
-    'hospices',
-    'hospitallers',
-    'hotch-potch',
-    'hotchpotch',
-    'hotpoint',
     'houphou&euml;t-boigny',
-    'housekeepers',
-    'houseman',
-    'howlers',
-    'howlett',
-    'howsoever',
-    'hsc',
-    'hsds',
-    'hsu',
-    'hubel',
-    'huddles',
-    'huddleston',
-    'huffed',
-    'hulking',
-    'humbert',
-    'humic',
     'hummingbirds',
-    'humoral',
-    'humouring',
-    'hump-backed',
-    'humph',
-    'hungrier',
-    'hunks',
-    'hunter-gatherer',
-    'huntingford',
-    'hurray',
-    'hurtado',
-    'hus',
-    'husbandman',
-    'hush-hush',
-    'husked',
-    'husseini',
     'hutcheon',
-    'hutcheson',
-    'hybridizing',
-    'hydrangeas',
-    'hydrolase',
-    'hyena',
-    'hygienist',
-    'hymen',
-    'hynes',
-    'hyper-inflation',
-    'hyper-text',
-    'hypercard',
-    'hyperkinetic',
-    'hyperlipidaemia',
-    'hypermarkets',
-    'hypersurface',
     'hypertriglyceridaemia',
-    'hyphenated',
-    'hypnotism',
-    'hypocaust',
-    'hypochondriac',
-    'hypotensive',
-    'hypothalamus',
-    'hypothesi',
-    'hypothesize',
-    'hypoxaemic',
-    'hzds',
-    'i\'d',
-    'i.c.',
-    'i860',
-    'ib4e',
-    'ibmers',
     'ibsen',
-    'icom',
-    'icu',
-    'identikit',
-    'ideologists',
-    'ides',
-    'idg',
-    'idiosyncrasy',
-    'idled',
-    'ido',
-    'ifc',
-    'ife',
-    'ifr',
-    'iguana',
-    'iht',
-    'iirs',
     'ikeda',
-    'ileoanal',
-    'iles',
-    'ilias',
-    'ill-starred',
-    'ill-suited',
-    'illite',
-    'illiterates',
-    'ilott',
-    'ilya',
-    'ilyushin',
-    'imhv',
-    'imitates',
-    'immanuel',
-    'immodest',
-    'immunoglobulins',
     'impeach',
-    'impeached',
-    'imperil',
-    'imperishable',
-    'impermanence',
-    'impermanent',
-    'impersonate',
-    'impersonating',
-    'impetuosity',
-    'implicates',
-    'implore',
-    'imponderables',
-    'improver',
-    'improvisations',
-    'in-car',
-    'in-group',
     'in-kind',
-    'in-law',
-    'in-line',
-    'in-vitro',
-    'in_extremis',
-    'in_memoriam',
-    'incendiaries',
-    'incomer',
-    'incubators',
-    'indecisiveness',
-    'indexicals',
-    'indisposed',
-    'indissoluble',
-    'indium-111',
-    'indo-chinese',
-    'indo-european',
     'indoctrinated',
-    'indulges',
-    'industrie',
-    'indwelling',
-    'ineffectively',
-    'inelegantly',
-    'inexpressible',
-    'inflexion',
-    'information-processing',
-    'infra',
-    'infradental',
-    'infrastructures',
-    'ingesting',
-    'inglenook',
-    'ings',
-    'inguinal',
     'inhalers',
-    'inheritances',
-    'inigo',
-    'initiators',
-    'injects',
-    'injures',
-    'injuria',
-    'injury-hit',
-    'inked',
-    'inla',
-    'inman',
-    'insectivores',
-    'insensible',
-    'inseparably',
-    'insightful',
-    'insinuate',
     'insinuations',
-    'insolvencies',
-    'institutionalisation',
-    'insulators',
-    'insulin-dependent',
-    'insulins',
-    'insures',
-    'intasun',
-    'intelligibly',
-    'intelsat',
-    'inter-company',
-    'inter-generational',
-    'inter-group',
-    'interbreed',
-    'interbreeding',
-    'interceptions',
     'interceptor',
-    'interchanging',
-    'interest-group',
-    'interfacial',
-    'intergroup',
-    'interjection',
-    'interjections',
-    'interleaved',
-    'interlink',
-    'intermediation',
-    'interment',
-    'intermingling',
-    'intermolecular',
-    'intern',
-    'internationalists',
-    'internees',
     'interoperable',
-    'interquartile',
-    'intersects',
-    'interventionism',
-    'intimates',
-    'intra-group',
-    'intracranial',
-    'intransitive',
-    'inundation',
-    'inveraray',
-    'inverleith',
-    'inverted-u',
-    'inxs',
-    'iod',
-    'ionised',
-    'ionophore',
     'iot',
-    'irby',
-    'irian',
-    'iritnefert',
-    'iron-grey',
-    'ironmongers',
-    'ironmongery',
-    'irreducibles',
-    'irreducibly',
-    'irreligious',
-    'irresponsibly',
-    'irreverence',
-    'irrigate',
-    'ish',
-    'isi',
-    'isidore',
     'islip',
-    'isolde',
-    'isomer',
-    'isomerism',
-    'israeli-occupied',
-    'israeli-palestinian',
-    'istituto',
-    'italiano',
-    'ito',
-    'itto',
-    'iu/ml',
-    'iupac',
-    'iv\'s',
-    'ive',
-    'ivermectin',
-    'izzard',
     'j\'s',
-    'j.p',
-    'j.w.',
-    'j/44',
-    'jackals',
-    'jackey',
-    'jacki',
-    'jacksons',
-    'jacobi',
-    'jafaar',
-    'jailing',
-    'jalo',
-    'jam-packed',
-    'jama',
-    'janette',
-    'janey',
     'janitor',
-    'janos',
-    'javer',
-    'jeanie',
-    'jebb',
-    'jemmy',
-    'jencks',
-    'jerez',
-    'jersey-based',
-    'jesses',
-    'jetties',
-    'jettisoning',
-    'jfit',
-    'jiffy',
-    'jiggled',
-    'jimenez',
     'jimmie',
-    'jingles',
-    'jingling',
-    'jinxed',
-    'jit',
-    'jmp-1',
-    'joanie',
-    'joaqu&iacute;n',
-    'johansen',
-    'joie_de_vivre',
-    'jolts',
-    'jonesy',
-    'joo',
-    'joplin',
-    'jopling',
-    'jotting',
     'jour',
-    'joust',
-    'jth',
-    'juanita',
-    'juda',
-    'juggler',
-    'jump-off',
-    'junket',
-    'justiciable',
-    'juxtaposing',
-    'jvc',
-    'k&ouml;nigsberg',
-    'kadis',
-    'kaleida',
-    'kaleidoscopic',
-    'kaliber',
     'kam',
-    'kamal',
-    'kamil',
-    'kaposi',
-    'karaman',
-    'karateka',
-    'karenina',
-    'karlsson',
-    'karst',
-    'kasabat',
-    'katelina',
-    'kathie',
-    'katib',
-    'katrin',
-    'kcal',
-    'keeling',
     'keening',
-    'keeton',
-    'keinya',
-    'keiretsu',
-    'kellaway',
-    'kellner',
-    'kells',
-    'kelp',
-    'kenchester',
-    'kenne',
-    'kensal',
-    'kenward',
-    'kenyans',
-    'kerbs',
-    'kerchief',
-    'kerrey',
     'kerrigan',
-    'keying',
-    'keystrokes',
-    'keyworth',
-    'kh',
-    'khaine',
-    'khan-penrose',
-    'khatm',
-    'khyber',
-    'kibbutz',
-    'kidder',
-    'kilfoyle',
-    'kilimanjaro',
-    'kilkeel',
-    'killarney',
-    'kilts',
     'kimball',
-    'kimbell',
-    'kimberly',
-    'kind-hearted',
-    'kindle',
-    'kindliness',
-    'king-size',
-    'kingscote',
-    'kingsmill',
-    'kinloss',
-    'kinsbourne',
-    'kintyre',
-    'kio',
-    'kirchner',
-    'kirillov',
-    'kirkdale',
     'kirkistown',
-    'kirkman',
-    'kirsch',
-    'kirtlington',
-    'kirton',
-    'kitchenware',
-    'kitts',
-    'kk',
-    'kleine',
-    'kleisthenes',
-    'kleomenes',
-    'klf',
-    'klosters',
-    'kluge',
-    'knapman',
-    'kneaded',
     'knebworth',
-    'knees-up',
-    'knin',
-    'knockdown',
-    'knopfler',
-    'knowhow',
-    'knut',
-    'koblenz',
-    'koeman',
-    'koenig',
-    'koestler',
-    'kogan',
-    'koh',
-    'kolingba',
-    'komsomol',
-    'konica',
     'konstantinos',
-    'korma',
-    'korn',
-    'kosi',
-    'kozloduy',
-    'kpa',
-    'kph',
-    'kress',
-    'krispies',
-    'kristensen',
-    'kristian',
-    'kryuchkov',
-    'kuchma',
-    'kurtz',
-    'kwame',
-    'kwik-fit',
     'kydd',
-    'l\'art',
-    'l\'s',
-    'l-glutamate',
-    'l.g.r.',
-    'l.jj',
-    'labial',
-    'labour-power',
-    'lachman',
-    'lackenby',
-    'lackeys',
-    'lacrosse',
-    'lactate',
-    'ladurie',
-    'ladybirds',
-    'laetitia',
     'laggan',
-    'laid-out',
-    'laissez_faire',
-    'lamarckian',
-    'lambasted',
-    'lambie',
-    'lamentation',
-    'laming',
-    'lamport',
-    'lamppost',
-    'lamprey',
-    'land-owning',
-    'land-users',
-    'language-game',
-    'lappish',
-    'laptops',
     'lapwing',
-    'lapworth',
-    'larnaca',
-    'larner',
-    'laserwriter',
-    'lassus',
-    'last-gasp',
-    'latif',
-    'latowa',
-    'latticed',
-    'laundries',
-    'laurance',
-    'laurens',
-    'lavage',
-    'law-breaking',
-    'lawer',
     'lawfulness',
-    'lawrenson',
-    'layard',
-    'layby',
-    'laze',
-    'lazlo',
-    'lcfa',
-    'leaderless',
-    'leander',
-    'least-squares',
-    'leat',
-    'leavitt',
-    'lec',
-    'leclerc',
-    'leds',
-    'leed',
     'lefebvre',
-    'left-',
-    'left-handers',
-    'left-overs',
-    'left-sided',
-    'left-winger',
-    'lefthand',
-    'leftwards',
-    'leftwing',
-    'legalise',
-    'legalism',
-    'legalize',
-    'legatee',
-    'legendre',
-    'legering',
-    'leggatt',
     'legibility',
-    'legit',
-    'leisurewear',
-    'leitch',
-    'leitmotif',
-    'leman',
-    'lemonheads',
-    'lemony',
-    'lemurs',
-    'lengthens',
-    'lengthwise',
-    'leonine',
-    'leotards',
-    'lep',
-    'lerner',
-    'letchworth',
     'letelier',
-    'leukotrienes',
-    'levi-strauss',
-    'lias',
-    'lib-lab',
-    'libelled',
-    'liberaci&oacute;n',
-    'liberalised',
-    'liberalizing',
-    'liberates',
-    'liberationists',
-    'liberman',
-    'libertas',
-    'libertine',
-    'libidinal',
-    'librettist',
     'libs',
-    'licenced',
-    'licencees',
-    'liebermann',
-    'liessa',
-    'life-chances',
-    'life-history',
-    'lifeguards',
-    'lifers',
-    'lifespans',
-    'ligachev',
-    'light-middleweight',
-    'lightbulb',
-    'likenesses',
-    'limed',
-    'liming',
     'limpets',
-    'lincolns',
-    'lindop',
-    'lingua',
-    'linh',
-    'linkworth',
-    'lintels',
-    'linz',
-    'lio!rt',
-    'liposomes',
-    'lipski',
-    'lisson',
-    'listrel',
-    'literati',
-    'lithographic',
-    'lithology',
     'litigious',
-    'liveried',
-    'liveries',
-    'living-in',
-    'ljj',
-    'llamas',
-    'llandaff',
-    'llandovery',
-    'llb',
-    'llosa',
-    'lnwr',
-    'load-bearing',
-    'lobbyist',
-    'lobelia',
-    'lobos',
-    'localise',
     'lochans',
-    'lock-out',
-    'lodsworth',
-    'loess',
-    'lofoten',
-    'login',
-    'logon',
-    'loiter',
-    'lollapalooza',
-    'lollipops',
-    'lollo',
-    'loneliest',
-    'long-delayed',
-    'long-overdue',
-    'longed-for',
-    'look-alike',
     'looker',
-    'lop',
-    'loquacious',
-    'lor',
-    'loreto',
-    'lorre',
-    'louie',
-    'louvres',
-    'lovatt',
-    'lovelace',
-    'lovesick',
-    'low-cut',
-    'low-density',
-    'low-down',
-    'low-speed',
-    'low-wage',
     'lower-middle',
-    'loyden',
-    'lozano',
-    'lqts',
-    'lrt',
-    'lso',
-    'lubow',
-    'lubricate',
-    'lucasta',
-    'lucidly',
-    'lucier',
-    'lugbara',
-    'lugg',
-    'luker',
-    'lum',
-    'luminescent',
     'lurcher',
-    'lustily',
-    'lynched',
-    'lys',
-    'lysander',
-    'lysate',
-    'lysates',
-    'lyso',
-    'lyte',
-    'lytic',
-    'm&eacute;tro',
-    'macadam',
-    'macaque',
-    'macau',
-    'maccabean',
-    'macdougall',
     'macgee',
-    'machico',
-    'macinnes',
-    'macintoshes',
-    'mackworth',
-    'maclaine',
-    'macmahon',
-    'macon',
-    'maconie',
-    'macromolecules',
-    'mada',
-    'maddock',
-    'made-to-measure',
-    'madigan',
-    'madreidetic',
-    'maelor',
     'maesteg',
-    'magdeburg',
-    'maghera',
-    'magnetically',
-    'magnetics',
-    'magnetite',
-    'magnifications',
-    'magnusson',
-    'magyars',
-    'maharishi',
-    'mahmood',
-    'maidservant',
-    'maigret',
-    'mailshot',
-    'mainspring',
-    'maiolica',
     'majid',
-    'make-or-break',
-    'makita',
-    'malacca',
-    'malachite',
-    'maladjusted',
-    'malawian',
-    'malcesine',
-    'male-oriented',
-    'malengin',
-    'mallorca',
-    'malmo',
-    'malthusian',
-    'malvinas',
-    'mammon',
-    'man-eating',
     'man-hours',
-    'mana',
-    'management-employee',
-    'mandel',
-    'mangroves',
-    'mangy',
-    'manhunt',
-    'maniacal',
-    'manipur',
-    'manjiku',
-    'manliness',
-    'mannaia',
-    'manne',
-    'mannequin',
-    'mannequins',
-    'mannion',
     'mantegna',
-    'mantela',
-    'mantini',
-    'mantlepiece',
-    'manu',
-    'manures',
-    'many-to-many',
-    'maplin',
-    'mappin',
-    'maquis',
-    'maran',
-    'marden',
-    'mardonios',
-    'marenches',
-    'mareva',
-    'margi',
     'margo',
-    'margrida',
-    'marham',
-    'mariam',
-    'marinate',
-    'marise',
-    'market-led',
-    'market-maker',
-    'marky',
-    'marquand',
-    'marrakech',
-    'marriageable',
-    'marriner',
-    'marron',
-    'marsha',
-    'marshka',
     'martineau',
-    'martinet',
-    'marwan',
-    'maser',
-    'mashing',
-    'maspar',
-    'massawa',
-    'massimo',
-    'mastectomy',
-    'masturbating',
-    'masur',
-    'matchmaker',
-    'materialists',
-    'matif',
-    'matra',
-    'matriarchal',
     'matroc',
-    'maubisson',
-    'maundy',
-    'mauricio',
-    'mauritanian',
-    'maurizio',
-    'maury',
-    'mawdsley',
-    'mawson',
-    'maxilla',
-    'maximises',
-    'maximizes',
-    'maxplan',
-    'mayle',
-    'maylie',
-    'mcandrew',
     'mcardle',
-    'mccaffrey',
-    'mccauley',
-    'mccrone',
-    'mcduff',
-    'mcelroy',
-    'mcewen',
-    'mcgiven',
-    'mcilroy',
-    'mcilvanney',
-    'mckelvey',
-    'mckinley',
-    'mckittrick',
-    'mckoy',
-    'mcnair',
-    'mcs',
     'mctaggart',
-    'mctavish',
-    'mcveigh',
-    'mdbs',
-    'mds',
-    'mdu',
-    'mea',
-    'meadowell',
-    'meadowland',
-    'meaninglessness',
-    'medes',
-    'medeva',
-    'medewich',
-    'medicaid',
-    'medicals',
-    'medicated',
     'medium-',
-    'medstead',
-    'mee',
-    'megastar',
-    'megaw',
-    'mehq',
-    'meikle',
-    'meir',
-    'meirion',
-    'meisel',
-    'meissen',
-    'melanesia',
-    'melanin',
-    'melling',
-    'melly',
-    'mementos',
     'memorising',
-    'memorizing',
-    'mendelian',
-    'mendoros',
-    'menstruating',
-    'mentmore',
-    'menuhin',
-    'meo',
-    'mercers',
-    'merchantmen',
-    'merci',
-    'meretricious',
-    'meretz',
-    'meridians',
-    'merkuts',
-    'merleau-ponty',
     'merrier',
-    'merrion',
-    'merseytravel',
-    'merz',
-    'meshes',
-    'mesons',
-    'mesopotamian',
-    'messer',
-    'messerschmitts',
-    'messiaen',
-    'messier',
-    'messines',
-    'mesure',
-    'meta',
-    'metalled',
-    'metamorphism',
     'metaplastic',
-    'metcalf',
-    'metrocentre',
-    'metrologie',
-    'meunier',
-    'mevleviyets',
-    'mew',
-    'meyers',
-    'mfi',
-    'mhcima',
-    'mib',
-    'micawber',
-    'micraster',
-    'microcode',
-    'micronesia',
-    'microtitre',
     'microvascular',
-    'microvitec',
-    'mid-career',
-    'mid-class',
-    'mid-off',
-    'mid-section',
-    'mid-table',
-    'mid-teens',
-    'mid-twentieth',
-    'mid-ulster',
-    'middlemarch',
-    'midhurst',
-    'midrange',
-    'mightier',
-    'mikado',
-    'mikael',
     'mikes',
-    'mikl&oacute;s',
-    'miklosko',
-    'mildness',
-    'mile-long',
-    'miletos',
-    'milkmaid',
-    'millenarian',
-    'millichip',
-    'millpond',
-    'milltown',
-    'millward',
-    'milsom',
-    'miltiades',
-    'milwall',
-    'minaret',
     'minarets',
-    'mindlessly',
-    'minefields',
-    'minesweepers',
-    'mini-cab',
-    'mini-enterprise',
-    'minim',
-    'minimis',
-    'minkowski',
-    'minnow',
-    'minuets',
-    'minutest',
-    'miras',
-    'mircea',
-    'misbehave',
-    'misdirection',
     'miserables',
-    'misheard',
-    'misjudge',
-    'misjudgement',
-    'mismatches',
-    'misrepresentations',
-    'misrepresenting',
-    'misrule',
-    'missal',
-    'missioners',
-    'misspelling',
-    'misusing',
-    'mitres',
-    'mitzi',
-    'mixed-up',
-    'mkii',
     'mkn45g',
-    'mlitt',
-    'mmrc',
-    'moamer',
-    'mobiles',
-    'moda\'i',
-    'modals',
-    'modellers',
-    'modifiers',
-    'modish',
-    'modulator',
-    'moe',
-    'moet',
-    'moir',
-    'moldava',
-    'molesting',
     'moli&egrave;re',
-    'mollies',
-    'molluscan',
-    'molton',
-    'molybdenum',
-    'monasticism',
-    'moncada',
-    'moncrieff',
-    'mondano',
-    'money-lender',
-    'moneyed',
-    'mongoose',
-    'monism',
-    'monist',
-    'monkfish',
-    'monoculture',
     'monogrammed',
-    'monolayers',
-    'monoliths',
-    'monomers',
-    'monopoles',
-    'monostable',
-    'monotonously',
-    'montacune',
-    'montane',
-    'montenegrins',
-    'montini',
-    'montpelier',
-    'mooch',
-    'moonless',
-    'moonlighting',
-    'moorhens',
     'moralising',
-    'morden',
-    'morels',
-    'moreno',
-    'morita',
-    'mormon',
-    'mormons',
-    'morphometric',
-    'mortice',
-    'mortlake',
-    'mosaicists',
-    'moselle',
-    'mossop',
-    'most-favoured-nation',
-    'mote',
-    'mother-child',
     'motif-based',
-    'motional',
-    'motioning',
-    'motor-bike',
-    'motor-cycle',
-    'motorcade',
-    'motorcar',
-    'motorcyclists',
-    'motta',
-    'mountie',
-    'mourns',
-    'mousa',
-    'mowat',
-    'mowlem',
-    'moya',
-    'mozarts',
     'mpd',
-    'mpla',
-    'mpp',
-    'mpx',
-    'mq',
-    'mqm',
-    'mra',
-    'mrds',
-    'mrnd',
-    'msm',
-    'msv',
-    'mtoe',
-    'much-maligned',
-    'much-publicised',
-    'muckle',
-    'muff',
     'muggy',
-    'muhammed',
-    'muirend',
-    'mujjaddedi',
-    'mullet',
-    'mulligan',
-    'multi-employer',
-    'multicentre',
-    'multifaceted',
-    'multiprotocol',
-    'multitudinous',
-    'mungall',
-    'muni',
-    'muons',
-    'mururoa',
-    'muscling',
     'musgrove',
-    'musicale',
-    'musicman',
-    'mustards',
-    'mustoe',
-    'muswell',
-    'mutalibov',
-    'mutandis',
-    'mutate',
-    'mutatis',
-    'mutilating',
-    'mutinies',
-    'muzzy',
-    'mwinyi',
-    'myanman',
-    'myanmar',
     'mycobacterial',
-    'myler',
-    'mynydd',
-    'myopathy',
-    'myrcan',
-    'n.e.',
-    'n.w.',
-    'n=3',
-    'n=5',
-    'n=6',
-    'n=8',
-    'na&iuml;vely',
-    'nabi',
-    'nablus',
-    'naep',
-    'naevi',
     'nagarythe',
-    'nagasyu',
-    'nagorno-karabakh',
-    'nags',
-    'nahda',
-    'naivete',
-    'nakajima',
-    'nameplate',
-    'namibians',
-    'nano',
-    'nant',
-    'naphtha',
-    'naps',
-    'nar',
-    'nark',
-    'nasir',
     'nastase',
-    'nasturtiums',
-    'nationalrat',
-    'natural-looking',
-    'naturalisation',
-    'naturalised',
-    'naturalization',
-    'naulls',
-    'nautilus',
-    'navvy',
-    'nazareans',
-    'nazimov',
-    'nbfis',
-    'nca',
-    'nch',
-    'ndlovu',
     'neatest',
-    'neave',
-    'necessaries',
-    'necked',
-    'neds',
-    'needful',
-    'needlebed',
-    'neeps',
-    'neff',
-    'negates',
-    'nehemiah',
-    'nein',
-    'nel',
-    'neo',
-    'nephrite',
-    'nerve-ends',
     'nerveless',
-    'nesle',
-    'nessy',
-    'netherton',
-    'nettled',
-    'nettleton',
-    'neuropsychological',
-    'neuropsychology',
-    'neutralizing',
-    'newbery',
-    'newcastle-based',
-    'newly-appointed',
-    'newly-built',
-    'newlyn',
-    'newlyweds',
-    'newsman',
     'newsround',
-    'newstead',
-    'nfi',
-    'nibs',
-    'nicam',
-    'nicaraguans',
-    'nice-looking',
-    'nickell',
-    'nicki',
-    'nicolai',
-    'niels',
-    'niggled',
-    'night-club',
-    'nightshade',
-    'nighttime',
-    'nightwatchman',
     'nihilistic',
-    'nikita',
-    'nikol\'skaia',
-    'nikolaus',
-    'nine-month-old',
-    'ninepence',
-    'nir',
-    'nisse',
-    'nit',
-    'nitty',
-    'nix',
-    'nls',
-    'nmol/l',
-    'no&euml;l',
-    'no-confidence',
-    'no-man',
     'no-smoking',
-    'no.4',
-    'no_matter_which',
-    'nobler',
-    'nodule',
-    'noisier',
-    'nokia',
-    'nomole',
-    'non-cash',
-    'non-catholic',
-    'non-commissioned',
-    'non-controversial',
-    'non-cooperation',
-    'non-deictic',
-    'non-destructive',
-    'non-disclosure',
     'non-fundholders',
-    'non-legal',
-    'non-lexical',
-    'non-material',
-    'non-observation',
-    'non-pecuniary',
-    'non-permanent',
-    'non-rational',
-    'non-religious',
-    'non-residential',
-    'non-respondents',
-    'non-restrictive',
-    'non-russian',
-    'non-significant',
-    'non-socialist',
-    'non-trading',
     'non-uniform',
-    'non-vocational',
-    'non-volatile',
-    'noolan',
-    'nop',
-    'nordhausen',
-    'normalize',
-    'normalizing',
-    'normativism',
-    'normski',
-    'norrie',
-    'norte',
-    'northerner',
-    'northolt',
-    'northop',
-    'northumbrians',
     'norw.',
-    'nosh',
-    'nostra',
-    'not_withstanding',
-    'notated',
-    'note-book',
-    'noticeboards',
-    'nottm',
-    'nouvel',
-    'nouvelle_cuisine',
-    'novak',
-    'novaya',
-    'novus',
-    'nowthen',
-    'nrm',
-    'nsfu',
     'nsr',
-    'nts',
-    'nuala',
-    'nubian',
-    'nucleated',
-    'nudges',
-    'nugent',
-    'nup',
-    'nutters',
-    'nuwm',
-    'nvc',
-    'nwr',
-    'nymphaea',
-    'o\'gorman',
-    'o\'grady',
-    'o\'shaughnessy',
     'oahu',
-    'oakham',
-    'oberon',
-    'objectified',
-    'obligated',
-    'oblt',
-    'obote',
-    'obstructs',
-    'occured',
-    'oceanographic',
-    'oceanography',
-    'oct-11a',
-    'octopuses',
-    'oddments',
-    'oder-neisse',
-    'odin',
     'odysseus',
-    'off-chance',
-    'off-loaded',
-    'off-set',
-    'off-spinner',
-    'offbeat',
-    'offe',
-    'offensively',
-    'offeree',
-    'officiated',
-    'officiating',
-    'ofwat',
-    'ogmore',
-    'ogres',
-    'oil-based',
-    'oil-fired',
     'oil-related',
-    'oilskin',
-    'oisin',
-    'okra',
-    'old-world',
-    'oldie',
-    'oligarchic',
-    'olinton',
-    'oliva',
-    'ollokot',
-    'ombudsmen',
-    'omniscience',
-    'omnivorous',
-    'omon',
-    'omron',
-    'onanuga',
     'once-and-for-all',
-    'oncogenic',
-    'one-eighth',
-    'one-shot',
-    'one-to-many',
-    'one-two',
-    'ooo',
-    'ophthalmology',
-    'opie',
-    'oppressively',
-    'opprobrium',
-    'opting-out',
-    'orangery',
-    'oration',
-    'orbach',
-    'ordeals',
     'ordinal',
-    'ordinands',
-    'orfeo',
-    'organelles',
-    'organizationally',
-    'orgiastic',
-    'orientalism',
-    'orifices',
-    'orkneys',
-    'orogen',
-    'orogenic',
-    'orogens',
-    'orphic',
-    'orrie',
-    'oscilloscope',
-    'ostertagiasis',
     'ostpolitik',
-    'ostracised',
-    'otiose',
-    'otitis',
-    'ottaviani',
-    'out-door',
-    'out-of-doors',
-    'out-of-hours',
-    'outfitters',
-    'outgrow',
-    'outpointed',
-    'outremer',
-    'outshine',
-    'outshone',
-    'outsourcing',
-    'outturn',
     'ovations',
-    'over-50s',
-    'over-anxious',
-    'over-estimate',
-    'over-large',
-    'over-representation',
-    'over-run',
-    'over-used',
-    'overactive',
-    'overcharged',
-    'overfed',
-    'overhauling',
-    'overheat',
-    'overing',
-    'overlaying',
-    'overpayment',
     'overplayed',
-    'overreacting',
-    'oversaw',
-    'oversensitive',
-    'overslept',
-    'overspent',
-    'overstatement',
-    'overstep',
-    'overtakes',
-    'overuse',
-    'ovver',
-    'owsla',
-    'oxidising',
-    'oxton',
-    'oxygenating',
-    'oystercatcher',
     'oystermouth',
-    'p&eacute;rigord',
-    'p&gt;0.05',
-    'p\'raps',
-    'p.5',
-    'p.g.a.',
-    'p45',
-    'p=0.001',
-    'p=0.03',
-    'pa&iacute;s',
-    'pacification',
-    'paco',
-    'paddick',
-    'paddies',
-    'paean',
-    'paella',
     'pageants',
-    'pagers',
-    'pahdra',
-    'pahlavi',
-    'pain-killers',
-    'painkiller',
-    'palaeomagnetic',
-    'palaeontologist',
-    'palates',
-    'palau',
-    'palaver',
-    'palely',
-    'palladio',
-    'pallas',
-    'palmas',
-    'palmtop',
     'paloma',
-    'palomar',
-    'pamphleteer',
-    'pamplona',
-    'pan-africanist',
-    'panam',
-    'panamanians',
-    'pankin',
-    'pannier',
-    'panofsky',
-    'panoramas',
-    'pantaloons',
-    'pantiles',
-    'paper-based',
-    'papering',
-    'papery',
     'papinian',
-    'parachutists',
-    'paradiso',
-    'paragliding',
-    'paralinguistic',
-    'parallelistic',
-    'parapets',
-    'paras.',
-    'paratrooper',
-    'paratroops',
-    'pardy',
-    'parent-teacher',
-    'parents-in-law',
-    'pareto-efficient',
-    'parham',
-    'paribas',
     'parisienne',
-    'parker-bowles',
-    'parklands',
-    'parley',
-    'parlourmaid',
-    'parochialism',
-    'parrish',
-    'part-timer',
-    'partito',
-    'party-political',
-    'parys',
-    'pasadena',
-    'pascal-trouillot',
-    'paschal',
-    'pass&eacute',
-    'passchendaele',
     'passing-off',
-    'past-life',
-    'pasteurised',
-    'pasts',
-    'patentable',
-    'paternalist',
-    'pathe',
-    'pathname',
-    'pathologically',
-    'patroness',
-    'paulinus',
-    'paulus',
-    'pawar',
-    'pawed',
-    'paxman',
-    'pbc',
     'pbk',
-    'pbr322',
-    'pce',
-    'pdci',
-    'peacefulness',
-    'peckish',
-    'pecks',
-    'pectorals',
-    'pedagogies',
-    'pedant',
-    'peden',
-    'pediments',
-    'peed',
-    'peedie',
-    'pekinese',
-    'pell',
     'pelts',
-    'penalises',
-    'penalize',
-    'penicuik',
-    'penistone',
-    'penrhyn',
-    'pensively',
-    'pentium-based',
-    'penzias',
-    'peo',
-    'peop',
-    'peoplesoft',
-    'peppard',
-    'percentile',
-    'percolate',
-    'percolated',
     'peregrines',
-    'pergolas',
-    'perihelion',
-    'permeating',
-    'permo-triassic',
-    'permutation',
-    'pernod',
-    'peroxides',
-    'perpignan',
-    'perrie',
-    'personam',
-    'perspectival',
-    'pertained',
-    'pertinently',
-    'peruvians',
-    'pervasiveness',
     'pesci',
-    'pester',
-    'petiole',
-    'petrey',
-    'petrological',
-    'petrushka',
-    'petty-bourgeois',
-    'peuple',
-    'peyer',
-    'pflp-gc',
-    'phantasms',
-    'pharmacopoeia',
-    'pharynx',
-    'philatelic',
-    'philimore',
-    'philistinism',
     'phillimore',
-    'philo',
-    'phizacklea',
-    'phlogiston',
-    'phomvihane',
-    'phonogram',
-    'phonologically',
-    'photographically',
-    'phrenology',
-    'pht',
-    'phuket',
-    'phyl',
-    'picassos',
-    'picker',
-    'pickerstaff',
-    'pickett',
     'pickpocket',
-    'picnicking',
-    'pics',
-    'piece-work',
-    'piercingly',
-    'piercy',
-    'piet',
-    'piggies',
-    'piggyback',
-    'pikey',
-    'piladu',
-    'pilfering',
-    'pill-box',
-    'pillowcase',
-    'pils',
-    'pin-striped',
     'pinball',
-    'pince-nez',
-    'pincer',
-    'pincher',
-    'pincombe',
-    'pine-needles',
-    'pineal',
-    'pined',
-    'pinhole',
-    'pinion',
-    'pint-sized',
-    'pintail',
-    'piotr',
-    'piously',
-    'pipedream',
-    'piquancy',
     'piqued',
-    'piratical',
-    'pisses',
-    'pistachio',
-    'pitcairn',
-    'piteous',
-    'pitiable',
-    'pitlochry',
-    'pitot',
-    'pitt-rivers',
-    'pittencrieff',
-    'pityingly',
-    'pki',
-    'placatory',
-    'plage',
-    'plaguing',
     'planed',
-    'plantago',
-    'plasteel',
-    'plat',
-    'plateaus',
-    'plath',
-    'platitude',
-    'platypus',
-    'playa',
-    'playmaster',
-    'playoff',
-    'plenitude',
-    'pliocene',
-    'plopped',
-    'plowright',
-    'plughole',
     'plumpness',
-    'pmt',
-    'pn',
-    'pndc',
-    'pneumocystis',
-    'poa',
-    'pocket-sized',
-    'pogroms',
-    'pointlessly',
-    'pointlessness',
-    'polarising',
-    'poliomyelitis',
-    'poliovirus',
-    'polisher',
-    'politicisation',
-    'politicking',
     'politics/security',
-    'pollinate',
-    'pollutes',
-    'polo-neck',
-    'polydor',
-    'polygamy',
-    'polygraph',
-    'polytheistic',
-    'polyvinyl',
-    'pomegranate',
-    'pomeshchiks',
-    'pommel',
-    'pompously',
-    'ponderosa',
-    'pondicherry',
-    'ponsonby',
     'ponthieu',
-    'pontifical',
-    'pony-trekking',
-    'poodles',
-    'poppins',
-    'popularise',
-    'porchester',
-    'porky',
-    'porlock',
-    'porsches',
-    'portholes',
-    'portrayals',
-    'portstewart',
-    'porua',
-    'poshekhonov',
-    'poskonov',
     'poss',
-    'possessory',
-    'post-cold',
-    'post-mortems',
-    'post-roman',
-    'post-structuralist',
-    'postbox',
-    'postcodes',
-    'postcrania',
-    'postholder',
-    'postmenopausal',
-    'postulating',
-    'pot-pourri',
-    'pot_pourri',
-    'potpourri',
-    'pott',
     'poultice',
-    'poulton',
-    'pouncing',
-    'pounder',
-    'pountney',
-    'powdering',
-    'powell/reporting',
-    'power-base',
-    'powerheads',
-    'pownall',
-    'ppc',
-    'pranced',
-    'praxsys',
-    'pre-colonial',
-    'pre-filter',
-    'pre-independence',
     'pre-intermediate',
-    'pre-occupied',
-    'pre-packaged',
-    'pre-printed',
-    'pre-roman',
-    'pre-service',
-    'prebendary',
-    'precatory',
-    'precentor',
-    'precession',
-    'precipitates',
-    'predisposes',
-    'predispositions',
-    'predominately',
-    'preen',
-    'preened',
     'preincubated',
-    'premenstrual',
-    'premia',
-    'premiered',
-    'preoccupy',
-    'prepayment',
-    'prescience',
-    'presenile',
-    'preserver',
-    'presets',
-    'pretax',
-    'prevaricated',
-    'previewing',
-    'prichard',
-    'priggish',
-    'prima_donna',
     'primary-school',
-    'primula',
-    'prinz',
-    'prioritised',
-    'prisoner-of-war',
-    'pristina',
-    'privately-held',
-    'privileging',
-    'prizewinner',
-    'prn',
-    'pro-',
-    'pro-iranian',
-    'probands',
-    'problem-orientated',
-    'proctitis',
-    'procurator-fiscal',
     'prodigies',
-    'profligacy',
-    'profundity',
-    'progenitors',
-    'progr&egrave;s',
-    'projective',
-    'prokaryotes',
-    'proletarians',
-    'prolongs',
-    'promptings',
-    'pronounces',
-    'pronto',
-    'propagator',
-    'prophesying',
-    'proprieties',
-    'proprietress',
     'prosaically',
-    'prosthetic',
-    'prostrated',
-    'protease',
-    'protein-protein',
-    'proteinase',
-    'protheroe',
-    'proudfoot',
-    'provincials',
-    'provocateurs',
-    'prowler',
-    'prunskiene',
-    'prunus',
-    'pryor',
-    'pscs',
-    'pseudo-obstruction',
     'pseudonyms',
-    'psychedelia',
-    'psychical',
-    'psychics',
-    'psychologies',
-    'psychopaths',
-    'psychotherapists',
-    'ptarmigan',
-    'ptas',
-    'pto',
-    'ptr&num',
-    'publicists',
-    'puce',
-    'pucker',
-    'pud',
-    'pudgy',
     'pula',
-    'pulsatilla',
-    'pulverised',
-    'pummelling',
-    'pump-priming',
-    'punch-up',
-    'punctually',
-    'pungency',
-    'punning',
-    'pupa',
-    'purchas',
-    'purloined',
-    'purples',
-    'purton',
-    'pushbike',
-    'pussycat',
     'putted',
-    'pvo',
-    'px',
-    'pylorus',
-    'pyne',
-    'pyrotechnics',
-    'pythons',
-    'q\'s',
-    'qbasic',
-    'qdms',
-    'qts',
-    'quadrants',
-    'quadrilateral',
-    'quadrupole',
-    'quainton',
-    'quant',
     'quarterdeck',
-    'quartile',
-    'quartzite',
-    'quasi-government',
-    'quasi-governmental',
-    'quavered',
-    'quel',
-    'question-mark',
-    'quests',
-    'quids',
-    'quiff',
-    'quilting',
-    'quintessence',
-    'quivers',
-    'quizzing',
-    'quoc',
     'qur\'an',
-    'r30',
-    'rabuka',
-    'racialist',
-    'racine',
-    'rackham',
-    'racquets',
-    'radiantly',
-    'radiologist',
-    'radnorshire',
-    'raffaella',
-    'raffish',
-    'raglan',
-    'ragwort',
-    'rainhill',
-    'raisin',
     'rajab',
-    'ramaswamy',
-    'rameses',
-    'ramlal',
-    'ramrod',
-    'ranasinghe',
-    'randalstown',
-    'randomizing',
-    'ranh',
-    'rante',
-    'ranteallo',
-    'rapporteur',
-    'raquel',
-    'rasputin',
-    'rastani',
-    'ratatouille',
     'rationalisations',
-    'rationalistic',
-    'rationalists',
-    'ratu',
-    'ravenhill',
-    'ravished',
-    'rawlins',
-    'rawness',
-    'rawnsley',
-    'rcp',
-    'rdb/vms',
-    're-created',
-    're-creating',
-    're-export',
-    're-investigation',
-    're-launch',
     're-ordering',
-    're-sale',
-    're-sell',
-    're-usable',
-    'reactivated',
-    'reactivation',
-    'read-only',
-    'read-out',
-    'readjusted',
-    'readjustments',
-    'reaffirms',
-    'reale',
-    'realpolitik',
-    'reappraise',
-    'reassessing',
-    'reawakened',
     'rebuking',
-    'rebus',
-    'recalcitrance',
-    'recapturing',
-    'rechem',
-    'recites',
-    'reckitt',
-    'reclassification',
-    'reclined',
-    'recoils',
-    'recommenced',
-    'reconciles',
-    'reconnoitre',
-    'recreates',
-    'rectilinear',
-    'red-blooded',
     'red-headed',
-    'redbrick',
-    'redden',
-    'redemptions',
-    'redmire',
-    'redouble',
-    'redraft',
-    'redrafted',
-    'redshift',
-    'reeks',
-    'reeth',
-    'referenda',
-    'reformative',
-    'reformulations',
-    'refrains',
-    'regale',
     'regality',
-    'reger',
-    'regicide',
-    'regimentation',
-    'rego',
-    'regrading',
-    'regrouping',
-    'regurgitate',
-    'rehabilitating',
-    'reichmanns',
-    'reification',
-    'reik',
-    'reinforcers',
-    'reinhardt',
-    'reinscription',
-    'reinvent',
     'rejuvenate',
-    'relearn',
-    'relevantly',
-    'reloaded',
-    'remediable',
-    'remissions',
-    'remonstrate',
-    'remortgage',
-    'remotely-sensed',
-    'renati',
-    'rendcomb',
-    'rendel',
-    'renderings',
-    'renegades',
-    'renewals',
-    'rennes-le-chateau',
     'rensburg',
-    'repatriate',
-    'repatriations',
-    'repealers',
-    'repelling',
-    'repertoires',
-    'repetitious',
-    'reposed',
-    'repressions',
-    'reprinting',
-    'reprobate',
-    'reprocess',
-    'reprovingly',
-    'requisitioning',
-    'resetting',
-    'residuary',
     'resisters',
-    'resonator',
-    'restating',
-    'resupply',
-    'resurrecting',
-    'retaliating',
-    'retch',
-    'retentive',
-    'rethought',
-    'retix',
-    'retold',
-    'retrained',
-    'retroactive',
-    'retroviral',
-    'retroviruses',
-    'returner',
     'reus',
-    'reveille',
-    'reversionary',
-    'revisionists',
-    'revolutionize',
-    'rfi',
-    'rflp',
-    'rhizomes',
-    'rho',
-    'rhodium',
-    'rhodri',
-    'rhombic',
-    'rhus',
-    'rhymed',
-    'rhynchosaurs',
-    'rhyolite',
     'rias',
-    'ribas',
-    'ribblehead',
-    'ribeiro',
-    'ribena',
-    'ribera',
-    'ricard',
-    'riccio',
-    'ricketts',
-    'rickman',
-    'rickmansworth',
-    'ricocheting',
-    'ricotta',
-    'ridings',
-    'rievaulx',
-    'rifat',
     'riffled',
-    'rifling',
-    'right-angles',
-    'right-winger',
-    'righton',
-    'rigoberta',
-    'rigor_mortis',
-    'ringers',
-    'ringleader',
-    'ripens',
-    'risqu&eacute',
-    'ritu',
-    'rivalling',
-    'riverbed',
-    'riverstown',
-    'riveter',
     'riveters',
-    'rm1',
-    'rms',
-    'rmw',
-    'roaches',
-    'roadie',
-    'roadshows',
-    'roadsides',
-    'roasts',
-    'robarchek',
-    'robben',
-    'robbo',
-    'robespierre',
-    'robles',
-    'rocha',
-    'rock-hard',
     'rock-solid',
-    'rockabilly',
-    'roden',
-    'rodomonte',
-    'rog',
-    'rogal',
-    'rohde',
-    'rok',
-    'rokovssky',
-    'rollo',
-    'rollover',
-    'rolt',
-    'roly-poly',
-    'romanovs',
-    'ronseal',
-    'rooster',
     'ros&eacute',
-    'rosalie',
-    'rose-coloured',
-    'rose-pink',
-    'rosea',
-    'rosebuds',
-    'rosemarie',
-    'rosemount',
-    'rosencrantz',
-    'rosenfeld',
-    'ross-shire',
-    'rossignol',
-    'rosten',
-    'rothenberg',
-    'rough-and-ready',
-    'rougvie',
     'round-table',
-    'rousay',
-    'roussel',
-    'routiers',
-    'roved',
-    'roxanne',
-    'royalbion',
-    'rs232',
-    'rsnc',
-    'rts',
-    'rtz',
-    'ruched',
-    'ruffles',
-    'ruggia',
-    'rukh',
-    'rule-of-thumb',
     'rumanian',
-    'rumi',
-    'rumney',
-    'run-out',
-    'run-through',
-    'runaways',
-    'runnels',
-    'runnin\'',
-    'runnymede',
-    'ruritanian',
-    'rustenburg',
-    'rutshire',
-    'ruy',
-    'ry',
-    'ryans',
-    'rydal',
     'ryde',
-    'rymer',
-    's&iacute',
-    's&ucirc;ret&eacute',
-    's-class',
-    's.139(1)',
-    's.2(1)',
-    's.92(1)',
-    's.c.',
-    's.d.',
-    's.m.e.t.',
-    's.pombe',
-    's.s.',
-    's.s.o.',
-    's740',
-    's80',
     'sa&uacute;l',
-    'sabena',
-    'saboteur',
-    'saccharine',
-    'sackings',
-    'sadiq',
-    'sado-masochistic',
-    'saf',
-    'safekeeping',
-    'safeways',
-    'sagramoso',
-    'sahib',
-    'sahlins',
-    'saibou',
-    'saint-jean',
-    'saks',
     'sala',
-    'salam',
-    'salerno',
-    'salesmanship',
-    'sali',
-    'salih',
-    'salonika',
-    'saltation',
-    'saltires',
-    'saltley',
-    'saltmarsh',
-    'saltpetre',
-    'salut',
-    'salvadoreans',
-    'samaria',
-    'samarkand',
     'sanctification',
-    'sandbanks',
-    'sandberg',
-    'sandvik',
-    'sandy-haired',
-    'saner',
-    'sanga',
-    'sanger',
-    'sanjay',
-    'sann',
-    'santana',
-    'santorini',
-    'sappers',
-    'sappho',
-    'sarazen',
-    'saris',
     'saskatchewan',
-    'satanism',
-    'satiated',
-    'satraps',
-    'satriani',
-    'satyrs',
-    'sau-leyan',
-    'sauce-boats',
-    'saud',
-    'sauron',
-    'saussurean',
-    'savary',
-    'saverplus',
-    'savill',
-    'say-so',
-    'saye',
     'scalability',
-    'scaled-down',
-    'scalps',
-    'scams',
-    'scanlon',
-    'scarlett',
-    'scat',
-    'scdi',
-    'scf',
-    'sch&uuml;ssler',
-    'schaefer',
-    'schemed',
-    'schering',
-    'scheveningen',
-    'schiff',
-    'schiphol',
     'schl&uuml;ter',
-    'schlegel',
-    'schoolmates',
-    'schooners',
-    'schreider',
-    'schroder',
-    'schroeder',
-    'schule',
-    'schulz',
-    'schwantz',
-    'schwarz',
-    'schwyz',
-    'scientificity',
-    'scientism',
-    'scn',
-    'scobie',
     'scooters',
-    'scotched',
-    'scotsport',
-    'scottie',
-    'scottishpower',
-    'scousers',
-    'scowcroft',
-    'scrambler',
-    'scrambles',
-    'scrapyard',
-    'screenwriter',
-    'scripting',
-    'scrounge',
-    'scrubber',
-    'scrubland',
-    'scrumptious',
     'scrutinies',
-    'sculpt',
-    'scupper',
-    'sdf',
-    'sea-change',
-    'sea-front',
-    'sea-going',
-    'seacat',
-    'seamstress',
-    'seaplane',
-    'seasickness',
-    'seasonings',
-    'seawright',
-    'second-floor',
-    'secondary-school',
-    'secretaryship',
     'securitisation',
-    'seedless',
-    'seein\'',
-    'seige',
-    'seius',
-    'sel',
-    'self-access',
-    'self-adhesive',
-    'self-contradictory',
-    'self-delusion',
-    'self-destruct',
-    'self-discovery',
-    'self-induced',
-    'self-injury',
-    'self-mockery',
-    'self-mocking',
     'self-mutilation',
-    'self-pitying',
-    'self-possession',
-    'self-presentation',
-    'self-promotion',
-    'selfhood',
-    'selfsame',
-    'sella',
-    'selznick',
-    'semi-conscious',
-    'semi-independent',
-    'semi-literate',
-    'semi-professional',
-    'semitones',
-    'semolina',
-    'sending-off',
     'sensationalist',
-    'sensiq',
-    'sensitized',
-    'sentimentally',
-    'sepulchral',
-    'ser-249',
-    'serendipity',
-    'service-providers',
-    'servility',
-    'servos',
-    'sessional',
-    'set-pieces',
-    'settees',
-    'sevastopol',
-    'seven-inch',
-    'seven-member',
     'seventeenth-',
-    'seventieth',
-    'severable',
-    'severiano',
-    'severs',
-    'sexed',
-    'sexier',
-    'seyh',
-    'shabbiness',
-    'shallowness',
-    'shams',
-    'shang',
-    'shanties',
-    'sharelink',
-    'sharjah',
-    'sharkey',
     'sharma',
-    'sharpens',
-    'sharps',
-    'shat',
-    'shawfield',
-    'shearwater',
-    'shearwaters',
-    'sheaths',
-    'sheikhs',
-    'shenzhen',
-    'shepard',
-    'shepherding',
-    'sher',
-    'sherbet',
-    'sherpas',
-    'sherwin',
     'shi',
-    'shils',
-    'shipboard',
-    'shirl',
-    'shirt-sleeves',
-    'shirtsleeves',
-    'shoaling',
-    'shoot-to-kill',
-    'shored',
-    'shoring',
-    'short-handed',
-    'short-stay',
-    'shortcut',
-    'shorthold',
-    'shortish',
-    'shottery',
     'shou',
-    'shoulder-blades',
-    'show-off',
-    'showcases',
-    'showings',
-    'shu',
-    'shunning',
-    'shunter',
-    'shunters',
-    'shuttleworth',
-    'sicam-1',
-    'sichuan',
-    'sickroom',
-    'side-step',
-    'side-tracked',
-    'sideboards',
     'sidewalks',
-    'sieved',
-    'sig',
-    'significances',
-    'signifieds',
-    'sigsworth',
-    'silayev',
-    'silbermann',
-    'silcock',
-    'silliest',
-    'sillitoe',
-    'silly-willie',
-    'silsoe',
-    'silts',
-    'silver-haired',
-    'silverfish',
     'silverweed',
-    'silvikrin',
-    'simian',
-    'similars',
-    'similes',
-    'simpleton',
-    'simplistically',
-    'simularity',
-    'simulates',
-    'simultaneity',
-    'sinfield',
-    'single-breasted',
-    'single-chip',
-    'single-engined',
-    'single-track',
-    'singsong',
     'sinistrals',
-    'sinitta',
-    'siphoned',
-    'sir/madam',
-    'sirloin',
-    'sitcoms',
-    'sivapithecus',
-    'six-cylinder',
-    'six-fold',
-    'six-monthly',
-    'six-point',
-    'sizwe',
-    'sk',
-    'skeins',
-    'skerrett',
-    'skerries',
     'sketchbooks',
-    'skewered',
-    'skillstart',
-    'skittered',
-    'skittish',
-    'skomer',
-    'skulduggery',
-    'sky-blue',
-    'skybolt',
-    'skylights',
-    'skymaster',
-    'skyward',
-    'slake',
-    'slampacker',
-    'slap-up',
-    'slattery',
     'slaughterhouses',
-    'slazenger',
-    'sled',
-    'sledging',
-    'sleeplessness',
-    'sleepwalking',
-    'slenderer',
-    'slicker',
-    'slicks',
-    'slider',
-    'slimness',
-    'slink',
-    'slinking',
-    'sloppiness',
-    'slops',
-    'sloshing',
     'slow-down',
-    'sluices',
-    'slumbers',
-    'slurs',
-    'slynn',
-    'small-minded',
-    'smalltalk',
-    'smetana',
-    'smethwick',
-    'smithereens',
-    'smithson',
-    'smoke-free',
-    'smoothest',
-    'smooths',
-    'smut',
-    'smuts',
     'snazzy',
-    'sneers',
-    'sneezes',
-    'snipping',
-    'snobby',
-    'snogging',
-    'snouts',
-    'snubs',
-    'snuffled',
-    'so&amp;sub2',
-    'sobers',
-    'sobriquet',
-    'socata',
-    'social-democratic',
-    'sociobiologists',
-    'sof&iacute;a',
     'soft-spoken',
-    'sogit',
-    'soiree',
-    'soissons',
-    'solaris-on-intel',
-    'solarz',
-    'solchaga',
-    'soldiered',
-    'soleil',
-    'soley',
-    'solicitation',
-    'soliloquies',
-    'solipsist',
-    'solland',
-    'soloing',
-    'solomons',
     'solon',
-    'solzhenitsyn',
-    'somaliland',
-    'sonnabend',
-    'sonority',
-    'sopwith',
-    'sorrowing',
-    'sotto_voce',
-    'soul-destroying',
-    'sourness',
-    'south-westerly',
-    'southland',
-    'southlands',
-    'southwood',
-    'southworth',
-    'soyuz',
     'spacers',
-    'spake',
-    'spandau',
-    'sparcsystems',
-    'spatter',
-    'spearheads',
-    'spearing',
-    'speciation',
-    'specie',
-    'specificities',
-    'specifiers',
-    'spectrometers',
-    'spectrophotometer',
-    'spectroscopic',
-    'speedometer',
-    'spens',
     'spermatozoa',
-    'spick',
-    'spiegel',
-    'spiking',
-    'spinney',
-    'spiritualism',
-    'spiritualists',
-    'spiritualized',
-    'spitsbergen',
-    'spitzer',
-    'splattering',
-    'spliff',
-    'splint',
-    'split-brain',
-    'splutters',
-    'spooked',
     'spore',
-    'spot-on',
-    'spouted',
-    'sprat',
-    'spratt',
-    'spreader',
-    'springhill',
-    'sprints',
-    'spurring',
-    'squaddies',
-    'squib',
-    'squirting',
-    'sram',
-    'ssm',
-    'stabbings',
-    'stabler',
     'stagflation',
-    'stagnated',
-    'staindrop',
-    'staithes',
-    'stakeholder',
-    'staley',
-    'stallholders',
-    'stanchion',
-    'stand-offs',
-    'standard-bearer',
-    'staphylococcus',
-    'stapleford',
-    'starkness',
-    'state-sponsored',
-    'statesmanship',
-    'staughton',
     'staverton',
-    'std',
-    'steadfastness',
-    'steadier',
-    'stearns',
-    'steepness',
-    'steersman',
-    'steg',
-    'steinbeck',
-    'steinmark',
-    'stencils',
-    'step-parents',
-    'stepchildren',
-    'sternberg',
-    'stetch',
-    'stetson',
     'stewardesses',
-    'steyn',
-    'stickler',
-    'stiffens',
-    'stiffs',
-    'stifles',
-    'stiglitz',
-    'stillbirth',
-    'stingray',
-    'stints',
-    'stipe',
-    'stoats',
-    'stockbridge',
-    'stockmarkets',
-    'stockton-on-tees',
-    'stoday',
     'stoical',
-    'stone-flagged',
-    'stone-throwing',
-    'stonebird',
-    'stoneleigh',
-    'stoneware',
-    'stoning',
-    'stopover',
-    'storm-troopers',
-    'stourport',
-    'stowage',
-    'stowell',
-    'stowing',
-    'stoy',
-    'stradey',
-    'straight-line',
     'strainer',
-    'strait-jacket',
-    'straiton',
-    'stranglers',
-    'strapless',
-    'strasse',
-    'stratagems',
-    'strathmore',
-    'streetlights',
-    'streptococcal',
-    'stress-related',
-    'striders',
-    'stringed',
-    'stringently',
-    'stroma',
-    'strombolian',
     'strong-arm',
-    'strophic',
-    'studentship',
-    'studley',
-    'sty',
-    'su&aacute;rez',
-    'sub-atomic',
-    'sub-clause',
-    'sub-division',
-    'sub-heading',
-    'sub-headings',
-    'sub-human',
-    'sub-optimal',
-    'sub-station',
-    'sub-zero',
-    'sub_judice',
     'subaerial',
-    'subatomic',
-    'subclinical',
-    'sublimation',
-    'sublimely',
-    'sublimity',
-    'submergence',
-    'subscripts',
-    'subsea',
-    'subsume',
-    'subtypes',
-    'suburbanization',
-    'succumbs',
-    'suchocka',
-    'suckled',
-    'sucralose',
     'sugar-cane',
-    'suiting',
-    'sulphates',
-    'sulphonamides',
-    'sumerian',
-    'summonsed',
-    'sumptuously',
-    'sunlink',
-    'sunnis',
-    'sunsail',
-    'sunspot',
-    'sunstroke',
-    'suntanned',
-    'suntory',
-    'supercharged',
-    'superconductors',
     'superdrug',
-    'superimposition',
-    'supermodel',
-    'supernumerary',
-    'supervga',
-    'supping',
-    'supplanting',
-    'sureness',
-    'surfactants',
-    'surplice',
-    'surrogates',
-    'sushi',
-    'suspends',
-    'sussexdown',
-    'sustad',
-    'suzerainty',
     'svga',
-    'svr',
-    'swabia',
-    'swanning',
-    'swastikas',
-    'swatches',
-    'sways',
-    'swe',
-    'swellings',
-    'swiftair',
-    'swigging',
-    'swimwear',
-    'switchable',
-    'switchback',
-    'swithland',
-    'swordsman',
     'sybille',
-    'sycophancy',
-    'symantec',
-    'symington',
-    'syn-gas',
-    'synagogues',
-    'synchronic',
-    'synodontis',
-    'syntheses',
-    'synthesisers',
-    'synthesizing',
-    'syquest',
-    'syrupy',
-    'szdsz',
-    't\'zin',
-    'tabor',
     'tabulation',
-    'taco',
-    'taft',
-    'tagan',
-    'tagliatelle',
-    'tagore',
-    'tai',
-    'tailbacks',
-    'tailings',
-    'tak',
-    'take-aways',
-    'takeoff',
-    'talcott',
-    'talkers',
-    'talkin',
-    'tamely',
     'tamoxifen',
-    'tampon',
-    'tancred',
-    'tandragee',
-    'tangerines',
-    'tangmere',
-    'tannadice',
-    'tannins',
-    'tansley',
-    'tanssie',
-    'tapas',
-    'tape-recording',
-    'tape/slide',
-    'taramasalata',
-    'tarpaulins',
-    'tarquin',
     'tarrant',
-    'tartans',
-    'tarty',
-    'tash',
-    'task-centred',
-    'tassel',
-    'taters',
-    'tauntingly',
-    'tautology',
-    'taverners',
-    'taw',
-    'taxonomists',
-    'taya',
-    'tbm',
-    'tcp',
-    'tcs',
     'tds',
-    'teammate',
-    'tear-gas',
-    'tearoom',
-    'tebb',
-    'tech-green',
-    'technocrat',
-    'techs',
-    'teeside',
-    'teetotaller',
-    'teichm&uuml;ller',
-    'telegraphy',
-    'telemarketing',
-    'telesales',
-    'teleworking',
-    'telexes',
     'telfer',
-    'tempera',
-    'tempering',
-    'tempts',
-    'tempy',
-    'ten-mile',
-    'ten-week',
-    'ten-year-olds',
-    'tennent',
-    'tenterden',
-    'tenterhooks',
-    'teodor',
-    'tephra',
-    'ter-petrosyan',
-    'terminations',
-    'terrapins',
     'terrifies',
-    'territorially',
-    'terrorise',
-    'terrorising',
-    'terrorized',
-    'tessas',
-    'tessellated',
-    'texans',
-    'text-books',
-    'textermination',
-    'tey',
-    'tgf',
-    'thabane',
-    'thach',
-    'thameslink',
-    'thatcherites',
     'theakston',
-    'theatricality',
-    'theban',
-    'thelwall',
-    'themself',
-    'thenceforth',
-    'theophylline',
-    'theoretician',
-    'theorise',
-    'therapeutics',
-    'therewith',
-    'thermometers',
-    'thermostatic',
-    'thessalian',
-    'theudebert',
-    'thick-set',
     'thimble',
-    'thingie',
-    'things.',
-    'third-rate',
-    'thomlinson',
-    'thomson-csf',
-    'thong',
-    'thongs',
-    'thorney',
-    'thorntree',
-    'thorough-going',
-    'thoth',
-    'thoughtlessness',
-    'three-bedroom',
-    'three-foot',
-    'three-inch',
     'three-phase',
-    'three-pronged',
-    'three-sided',
-    'three-star',
-    'three-year-olds',
-    'threshed',
-    'throatily',
-    'thronging',
-    'throttling',
-    'throw-away',
-    'thuds',
-    'thuggery',
-    'thur',
-    'thurlstone',
-    'thwaite',
-    'thymidine',
     'thymocyte',
-    'thynne',
-    'ti\'ko',
-    'tiber',
-    'tibia',
-    'tickles',
-    'ticklish',
-    'tidbury',
-    'tie-back',
-    'tie-ins',
-    'tiebout',
-    'tiggywinkles',
-    'tight-head',
-    'tight-knit',
-    'tightener',
-    'tigi',
     'tildy',
-    'tillage',
-    'tilled',
-    'tillers',
-    'tilson',
-    'time-dependent',
-    'time-limit',
-    'time-saving',
-    'time-scales',
-    'time-span',
-    'time-zone',
-    'timeframe',
-    'timespan',
-    'timmins',
-    'timorous',
-    'tincture',
     'tines',
-    'tinplate',
-    'tinto',
-    'tintoretto',
-    'tipler',
-    'tippee',
-    'tiranoc',
-    'tisdall',
-    'titbit',
-    'tithonus',
-    'tittle-tattle',
-    'tmp',
-    'toa',
-    'toadstool',
-    'toadstools',
-    'toasters',
     'tockington',
-    'tockwith',
-    'tocqueville',
-    'todger',
-    'todor',
-    'toggles',
-    'toileting',
-    'tokenism',
-    'tolba',
-    'tolerates',
-    'tolled',
-    'tom&eacute',
-    'tomcat',
-    'tomlins',
-    'tompkins',
-    'tonsillitis',
     'toolkits',
-    'toothpick',
-    'top-floor',
-    'top-secret',
-    'top_of',
-    'topically',
-    'topological',
-    'tornados',
-    'toro',
-    'torpid',
-    'torque/rotor',
-    'torque/speed',
-    'torsional',
-    'torsos',
-    'tosca',
-    'toting',
     'toto',
-    'totten',
-    'toulouse-lautrec',
-    'tourer',
-    'townend',
-    'tows',
-    'towyn',
-    'toxoplasma',
-    'trackways',
-    'trainload',
-    'trainspotter',
-    'traipsing',
-    'tralee',
-    'tranches',
-    'tranquilliser',
-    'transaid',
     'transcontinental',
-    'transcriptase',
-    'transend',
-    'transfiguration',
-    'transhepatic',
-    'transience',
-    'transiently',
-    'transjordan',
-    'translational',
-    'transmigration',
-    'transportable',
-    'transsexuals',
-    'transylvanian',
-    'tranter',
-    'traore',
-    'trappers',
     'trawled',
-    'tre',
-    'treacherously',
-    'treacy',
-    'treadmills',
-    'tree-planting',
-    'tres',
-    'triable',
-    'triazolam',
-    'tricking',
-    'trifolium',
-    'trigonometry',
-    'trigrams',
-    'trilled',
-    'trimester',
-    'trimmler',
     'triumphing',
-    'troms&oslash',
-    'tron',
-    'troposphere',
-    'trots',
-    'troubadours',
-    'troubleshooter',
-    'trouper',
-    'trow',
-    'trowbridge',
-    'troyna',
-    'trp',
-    'trucker',
-    'trucking',
-    'trumpeting',
-    'trundle',
     'truth-conditional',
-    'tryst',
-    'ts-1',
-    'tsai',
-    'ttc',
-    'tubercle',
-    'tubwell',
-    'tufa',
-    'tulle',
-    'tumim',
-    'tummel',
-    'tuneless',
-    'tuns',
-    'turbans',
-    'turbidity',
-    'turboprop',
     'turds',
-    'tureens',
-    'turkestan',
-    'turkic',
-    'turkmenia',
-    'turnround',
-    'turnstile',
-    'turreted',
-    'tutte',
-    'tuttle',
-    'tuzla',
-    'twanging',
-    'tweedie',
-    'tween',
-    'twen',
-    'twenty-minute',
     'twenty-sixth',
-    'twenty-year',
-    'twiddled',
-    'twisty',
-    'two-colour',
-    'two-headed',
-    'two-inch',
-    'two-match',
-    'two-minute',
-    'two-person',
-    'two-seat',
-    'two-thirty',
-    'tydfil',
-    'tye',
-    'tyke',
-    'typescripts',
     'typological',
-    'tyr',
-    'u-turns',
-    'u/v',
-    'uci',
-    'uckington',
-    'ucp',
-    'udo',
-    'uf',
-    'uffizi',
-    'uglier',
-    'uic',
-    'uists',
-    'ukias',
-    'ulcerated',
-    'ulcerations',
     'ulfa',
-    'uls/ce',
-    'ultra-modern',
-    'umist',
-    'umkhonto',
-    'un-english',
-    'un-named',
-    'un-supervised',
-    'unacceptability',
-    'unadjusted',
-    'unaffiliated',
-    'unalloyed',
-    'unbelievers',
-    'unbending',
-    'unblinkingly',
-    'unblocking',
     'unbuckled',
-    'unburden',
-    'unbuttoning',
-    'uncalled',
-    'unceasingly',
-    'uncivilised',
-    'unclipped',
-    'unclothed',
-    'unco-ordinated',
-    'uncommunicative',
-    'uncomplaining',
-    'unconsolidated',
-    'uncontentious',
-    'uncorrected',
-    'unctuous',
-    'undead',
     'under-18',
-    'under-funding',
-    'under-privileged',
-    'under-rated',
-    'underestimation',
-    'underfloor',
-    'underlexicalisation',
-    'underpricing',
-    'underscore',
-    'undertenant',
-    'undesired',
-    'undiagnosed',
-    'undigested',
-    'undramatic',
-    'undreamed',
-    'unexceptionable',
     'unexpectedness',
-    'unexpired',
-    'unexpressed',
-    'unfasten',
-    'unfitness',
-    'unflappable',
-    'unformed',
-    'unfree',
-    'unhelpfully',
-    'unheralded',
-    'uni&oacute;n',
-    'unicorns',
-    'uniface',
-    'unifil',
-    'unigram',
-    'unigram.x',
     'uninfected',
-    'uninviting',
-    'uninvolved',
-    'unionisation',
-    'unionised',
-    'unir',
-    'unisex',
-    'unladylike',
-    'unlearn',
-    'unlocks',
-    'unluckily',
-    'unmake',
-    'unmemorable',
-    'unmercifully',
-    'unobservable',
-    'unorganized',
     'unpasteurised',
-    'unpatriotic',
-    'unpaved',
-    'unpick',
-    'unplug',
-    'unpolished',
-    'unprecedentedly',
-    'unprocessed',
-    'unpronounceable',
-    'unproved',
-    'unquenchable',
-    'unravels',
-    'unreasoning',
-    'unreformed',
-    'unrepeatable',
-    'unresisting',
     'unrewarded',
-    'unroll',
-    'unseeded',
-    'unselected',
-    'unsentimental',
-    'unshaded',
-    'unshed',
-    'unsteadiness',
-    'unsullied',
-    'unsurprised',
-    'unsworth',
-    'untangle',
-    'untaxed',
-    'untiring',
-    'untraceable',
-    'untreatable',
     'untypically',
-    'unvarnished',
-    'unworried',
-    'up_to_the_minute',
-    'upfield',
-    'upgradable',
-    'upholder',
-    'upholders',
-    'upni',
-    'uppark',
-    'upper-middle',
-    'upping',
-    'uppingham',
-    'uppity',
-    'upside',
-    'ural',
     'urbanised',
-    'urbanity',
-    'urc',
-    'urinals',
-    'urng',
-    'urticaria',
-    'urwick',
-    'us&dollar;100,000,000',
-    'us&dollar;50,000,000',
-    'us-backed',
-    'uta',
-    'utilitarians',
-    'utopianism',
-    'utopias',
-    'uup',
-    'uzbeks',
     'v1',
-    'vacillating',
-    'vacillation',
-    'vai',
-    'vail',
-    'valentines',
-    'valesio',
-    'valladolid',
-    'valletta',
-    'vanishingly',
-    'vanities',
-    'variegata',
-    'vasari',
-    'vase-painting',
-    'vasilissa',
-    'vasily',
     'vasoactive',
-    'vecchio',
-    'vedic',
-    'vegetal',
-    'vel&aacute;zquez',
-    'vela',
-    'venal',
-    'venality',
-    'ventilating',
-    'ventre',
-    'ventricle',
-    'verbiage',
-    'verbum',
-    'verged',
-    'verhoeven',
-    'verifier',
     'verily',
-    'vermouth',
-    'versant',
-    'verso',
-    'vertebral',
-    'verticals',
-    'vesicle',
-    'vestey',
-    'vexing',
-    'vfr',
-    'vials',
-    'vibrancer',
-    'victuallers',
-    'victuals',
-    'videoed',
-    'vietcong',
     'viewfield',
-    'vijay',
-    'viljoen',
-    'villi',
-    'viney',
-    'vins',
-    'vintages',
-    'vintners',
-    'virani',
-    'viscountess',
-    'vishnu',
-    'vit',
-    'vitesse',
-    'vitriol',
-    'vizier',
-    'vladivostok',
     'vlsi',
-    'vm',
-    'vogts',
-    'voided',
-    'voight',
-    'voil&agrave',
-    'volost\'',
-    'volta',
-    'volte-face',
-    'voraciously',
-    'vosges',
-    'vouched',
-    'vsel',
-    'vuitton',
-    'vupp',
-    'vytautas',
     'w&uuml;rzburg',
-    'w.g.',
-    'waddling',
-    'wader',
-    'wafer-thin',
-    'wage-earner',
-    'waggoner',
-    'wagtail',
-    'waist-hip',
-    'waiting-rooms',
-    'wakening',
-    'wakerley',
-    'wakey',
-    'walahfrid',
-    'walkie-talkie',
-    'wallchart',
     'wallcoverings',
-    'wallonia',
-    'walloped',
-    'walsham',
-    'waltzing',
-    'wanna',
-    'wardenship',
-    'wardour',
-    'wareham',
-    'warehouseman',
-    'warrender',
-    'warty',
-    'washbasins',
-    'wasl',
-    'waspishly',
-    'wastelands',
     'wastell',
-    'water-colour',
-    'water-resistant',
-    'watsonians',
-    'watton',
-    'wavefunction',
-    'waverers',
-    'waxen',
-    'waybills',
-    'wayfarer',
-    'wayfarers',
-    'wayland',
-    'weakling',
-    'weals',
-    'weapons-grade',
-    'wearying',
     'weather-beaten',
-    'weatherill',
-    'webley',
-    'weddell',
-    'week-ends',
-    'weigh-in',
-    'weighbridge',
-    'weil',
-    'weirder',
-    'weirdest',
-    'weirdness',
-    'weizmann',
-    'weizs&auml;cker',
-    'welbeck',
-    'well-',
-    'well-armed',
     'well-illustrated',
-    'well-liked',
-    'well-maintained',
-    'well-managed',
-    'well-motivated',
-    'well-publicized',
-    'well-read',
-    'well-timed',
-    'well-tried',
-    'well-trodden',
-    'welton',
-    'wesker',
-    'wesson',
-    'westborough',
-    'westbrook',
-    'westerman',
     'westernised',
-    'westley',
-    'westonbirt',
-    'westphalia',
-    'wether',
-    'wetsuit',
-    'weyl',
-    'wharfedale',
-    'wheatgerm',
-    'wheats',
-    'wheatstone',
-    'whee',
-    'wheedled',
-    'wheelers',
-    'wheelwright',
-    'wheezy',
     'wherry',
-    'whinfield',
-    'whippet',
-    'whirlpools',
-    'whistle-stop',
-    'white-tailed',
-    'whiteout',
-    'whitsuntide',
-    'whole-heartedly',
-    'whole-tone',
-    'whomever',
-    'whomsoever',
-    'whoopee',
-    'whooper',
-    'whoopi',
-    'whoring',
     'wicket-keeper',
-    'wide-awake',
-    'wide-brimmed',
-    'wie',
-    'wiesbaden',
-    'wiggled',
-    'wiggly',
-    'wigston',
-    'wildavsky',
-    'wildcats',
-    'wildman',
-    'wilkerson',
-    'wilkin',
-    'willenhall',
-    'willett',
-    'willies',
     'willmore',
-    'willys',
-    'wilma',
-    'wilmington',
-    'wilshire',
-    'wilsons',
-    'wimborne',
-    'wimpole',
-    'wimps',
-    'windblown',
-    'winding-sheet',
-    'window-seat',
-    'windstopper',
-    'winfax',
-    'wingti',
-    'winnicott',
     'winserver',
-    'winsome',
-    'winsy',
-    'winterbone',
-    'winterbotham',
-    'winterburn',
-    'wintertime',
-    'wintour',
-    'wir',
-    'wirs',
-    'wistfulness',
-    'witch-hunt',
-    'witticism',
-    'wittisham',
-    'woad',
-    'woan',
     'wobbles',
-    'woh',
-    'wojciech',
-    'wolfenstein',
-    'wolfprince',
-    'womaniser',
-    'woodbrook',
-    'woodburn',
-    'woodifield',
-    'woodline',
-    'woodsmoke',
-    'wooldridge',
-    'woollens',
-    'woollies',
-    'woolridge',
-    'wools',
     'woonerf',
-    'worked-out',
-    'workin\'',
-    'world-renowned',
-    'worldliness',
-    'worrall',
-    'worst-case',
-    'worswick',
-    'wotton',
-    'wpm',
-    'wr',
-    'wrecker',
-    'wreford',
-    'wriggles',
-    'write-down',
-    'written-off',
     'wrongdoers',
-    'wrongness',
-    'wsr',
-    'wuz',
-    'wyke',
-    'wykeham',
-    'wythenshawe',
-    'xanadu',
-    'xd4',
-    'xe4',
-    'xenophanes',
-    'xix',
-    'xj',
-    'xjs',
-    'xpg',
-    'xtra',
     'xvii',
-    'xxxx',
-    'xylophone',
-    'yam',
-    'yanayev',
-    'yankees',
-    'yanking',
-    'yannis',
-    'yardage',
-    'yeadon',
-    'yearling',
-    'yearns',
-    'yehudi',
-    'yelton',
-    'yeti',
-    'yilmaz',
     'yoghurts',
-    'yoko',
-    'yonge',
-    'youse',
-    'ysgol',
-    'yucky',
-    'yugo',
-    'yukio',
-    'yurt',
-    'ywam',
-    'zacchaeus',
-    'zacharias',
-    'zachary',
-    'zadar',
-    'zafonic',
-    'zaibatsu',
     'zaid',
-    'zaki',
-    'zandvoort',
-    'zanu',
-    'zanu-pf',
-    'zanuck',
-    'zanussi',
-    'zaragoza',
-    'zbb',
-    'zealously',
-    'zed',
-    'zedong',
-    'zeitgeist',
-    'zemlya',
-    'zermatt',
-    'zhdanov',
     'zhelyu',
-    'zikr',
-    'zilch',
-    'zn',
-    'zoffany',
-    'zopfan',
+)
+
+blocks_10 = (
+    '"$mp;g!+dollar;0.01+!3*"10(#1.1*!3*"48+!9+!m*"51+!2*!7*!8+!m*"9m',
+    ')!4)!7)%8,000)"bn($2.1m*"3m*!5*"6m("35($4.5m)!5($500m("6m("75)!m',
+    '(&pernay!(micro;ci\'$g/kg!*pound;1.1m)"20)"6m)!9($0.00($1.50)%0,000)!m(%2,500($3.95("55("7m',
+    ')!5(%9,000\'%2,200(".1)!2)!4)!8($2.50($4.99(%6,000("90)!9\'#330($4.99\'$4.25',
+    '(!1(!6(!7(%8,000\'%5,500(".5(!9("bn\'%6,500(#000*!m(!2(!4($9.99\'$7.00',
+    '(!9\'\'850,000 $\'40s!%appen&"ed!#ead"#llo!"it!#ope!#til!$what $*the #+10 &-300bp!"50',
+    '!(70&deg;c!#aer!$gen.!#ray!%style!#the #.38!!4!!5 $/hco!!s!"t/ \'0&deg;c"\'ndash;3!"-0',
+    '#!3#!4""10""35""45""7%!"07!"21""45!#504!"61 *1&ndash;10(!7!$.1.1#!2',
+    '"#3.2#!m"#5.1$!3""6%""7%""9%!*0&ndash;13"#(3)"%,000m"#-12#$fold#%point"%.00am#"15',
+    '#$30pm#"5%"\'0&deg;c#!4#!6#"ft""13#!7""35"#min#!l""oz!*1&ndash;18"$,500"#-13',
+    '#!9""55#!6""70#!9""89""98!$2&ft#\'ndash;1*!6""-1"#.45""10""30""45',
+    '""70#!2#!3#!4#!8""83#!4#!6"#90s#!1#!2#!5#!8""lb"!m',
+    '!*3&ndash;15"#(1)"#-15""05#!6#!8""11#!5#!8""21#!4#!5#!8""33#!8',
+    '#!7"%5,000""70#!5#!6!%4&ins#\'ndash;1*!5"#-16"".7""20"#60s#!1""76""90',
+    '""oz"*th-century!\'5/10/93""12#!6#!7#!9""21#!4#!7""32#!5#!7""48""51',
+    '#!5#!7#!8#!9""71#!2#!3#!6#!8#!9""91#!5#!6"!c!*6&ndash;17',
+    '"".4""08""84!*7&ndash;18"%-year"".6#!7"#00s"%5,000"!c!+8-month-old"".1#!4"!p"!s',
+    '"#-21"".2#!3"%0,000"+69&ndash;70"#72a#"5a#*7&ndash;81$!b"%80/81#*1&ndash;82#*2&ndash;83#*4&ndash;90$"/5%"85',
+    '%"86#$6-87"$90\'s#$5/96""xx!#:10$!0!"nf )2&ndash;6!%-fold!%.00pm""13#!6"#2.1$!2',
+    '""50""9%!"/3!*0&ndash;24"%-yard"".1#!3#!5""0%#&&deg;c#"mb""15"!m#"hz!#2.7',
+    '""mm!#3.5#!7!#4.3"!p"!v!\'5&deg;c"#-27"&/10/93""0g#"ml""cm!$7-29""00"!p',
+    '!!e!!h!"pc $3(3)""5)!$,200"#400"#800!"-5!#.1%#!7""2%#!1""3%#".1',
+    '""8%""9%!\'0&deg;c##ins"#-31#&strong"#0ml$!m"!m!#25i!"3p!"44!"51!\'6720-22!#7.5',
+    '"#914!&80,000"$1313"#211!%dmenu!"eb!#ins )4&ndash;3(!7(!8(!9!!+!(,000,000"#200!#.13',
+    '""3%#".1$!2""45""6%""9%!*0&ndash;50"\'0g/14oz#"th""mb#!m""s.!%1,000!\'2&deg;c!%3,000',
+    '"!9""rd!"45"!9!(5-minute""00"!2"!4!"68!%7,000"!7"!8""th!#800"!3',
+    '"!7"!9!*9-year-old"!3"!5"!6"!7!#ins!"mm!"x4 $5&ft"(ndash;16!#(3)!\'-string!$.1.2',
+    '"#2.1$!2#%5&ins""4%""6%""7%!+0&ndash;100)"60"!4"!5"!9"#mph!"13"!6"!7',
+    '!%2,000"!1"!4!"37"!8"!9!*4-year-old"!7!*5-year-old"!6"!7""th!*7-year-old"!1"!4',
+    '!"88"!9!"91"!2!#min"%l/tsp!"s. #6-8!%.00pm"#1.1#!2#!4"#2.1$!2#!2',
+    '""45""7%!\'0&deg;c#(ndash;70"$0dpi"!4"!9""cm""ft"!m""pc!"13"!4"!5"!9',
+    '"!3"!7!*3-year-old"!1"!6!%4,000"!1"!3"!4"!5!*5-year-old"!6"!8"!p!"61',
+    '"!9!"72!%8,000""th!!s (7&frac12"#ins"\'ndash;3!"-0"!4!#.11##5pm"#3.1""6%!#0\'s',
+    '"!2"!9!"14!#2nd!*3-year-old"!4"!5"!6!"45"!8!"52"!3"!7!"61!%73510',
+    '"!6"!8!"85!"90"!1"!2"!8!!m (8&frac12#!t!#-10!%.15pm""25""45!*0-year-old',
+    '"!3"!5!"10"!4"!5!"22"!9""nd!"33"!6!$5(3)!"70"!7!#8th!"mm',
+    ' $9&ft"(ndash;11)!3!#(4)!#-11"!2!#.1%""5%!#0\'s"$-day"#00s"#210"#mph""pc!"55',
+    '!%9.99a"!0"!1!!a!!d &a&yuml!"-g!#/ux!"11!"2u!"45!":c!(battoirs"#dou#&ucting',
+    '$$gele"&ington"$khaz"$lett#&utions"!m""ou"%solon$%rbers%%ptive"$udah#"ja#%tting"$wehr"$ydos',
+    '!#c30")ademicals"&ceding#+ident-prone#(ompanist$(rding_as#%reted#$user\'!s"&idosis"!l##and".quaintanceship$\'iescing"%teson',
+    '$*vity-based#%uated""yl!&dalard"$cock"\'dington#\'ressees#!y"\'iabatic##mov"*judicators")monishing"$orns"$star"$vani',
+    '#(enturing$$rbal&$ials#&isedly!#eeu"#gon"&lfwald"%olian"%rated#\'odromes$#nca")thelberht!#fbd")flictions#*ordability',
+    '"\'rikaans"(ter-life%%birth%$glow!&gassiz#"te"*e-specific#$nais""ia""og#(nizingly".riculturalists,"ly#)ochemical!#hoy',
+    '"#der"#mar"&nsdale"(r-cooled##bag&!s$$rush#%crews#!d##lie#&planes"#sha"!t"&x/6000!\'kademie',
+    '##yev"%ihito!(l-farajh"\'_fresco"%ameda#$nine"\'bemarle$#rti\'"na##ret$$ight"(dergrove#$wych""ed"&freton',
+    '"%ianza#"ck#$mony"%kanes"$l-in$*or-nothing$&seeing##ard#\'egories$$luia$%rgens$#yne#$ianz$(ed-lyons#!o',
+    '##ude$!s$$vium#$ying")mondsbury""oe#$ysia"$paca#(ha-based%$bets##ina"\'satians#"ys""ta$!i',
+    '#"un"#var!%malfi#&ryllis"&brogio""ec#(liorated#!x"(iodarone"\'monites%$oids"$oeba#"ry"\'plifies#(utations',
+    '#%itsar!\'nabolic#&rchism#!s#\'tomists"\'chovies"(dalusian#%esite#%reyev$#ies$#zej"&eurysm"!g##kor#(lo-dutch',
+    '&(scottish""il$#ine#\'mations#(sotropic"*kle-length"\'nandale##ely#\'ualized"!o"#ser")tagonized#&e-post#$hias$#rax',
+    '#-i-americanism%(catholic&(hristian&)orruption%)hepatitis\'"ro%+imperialist&+nflationary&$raqi%&labour%*neutrophil%&racism$*arrhythmic$#bes$(clerical',
+    '%$odon&#lon&)mpetitive$)microbial$(parallel\'&ticles%$odes$%quary$%sense$%ulcer##ler#\'onietta&"ne&!s"&ythin\'',
+    '!&paches"(oplectic#\'sematic$$tasy"\'penzell#\'lecross$"ix#!n#%rised""ra#$opos#!s!$rber#)itrageurs\'!l',
+    '"&c/info#%hbold$\'deacons$&itrave%#ved"\'drossan""es"#fur"$gent&$ines"#ian#*stotelians"#kan##ell"(m-in-arm',
+    '#$fuls#$hole#%inian#%orial%!y$%urers#\'strongs""no$"tt"$rear$"se#\'hythmia##owe&!d"#ses',
+    '#(efactual$%mesia#"is%#oft#"ur"$usha!&s/400s"(cription"+h-wednesday#$anti#$rawi#.ton-under-lyne#$urst"#ics"$kham',
+    '"\'partate#!e$$rity#%hyxia#"ic$&distra"$sail#*embly-line#*ociateship"&tonish#%utely"#yut!&telier#!n"$hene',
+    '#"os"*lantoaxial"%omism##nal"$rial"-tach&eacute;s$"li#%ender%(tiveness%$uate#\'ractors$(ibutives!(u_revoir"(ctioning""ks',
+    '"%ratic#$eole#$igny"!s##lan#&terely"*thenticate$&orizes##ism#(o-immune$+correlation&#ver%"ue$(rotation!&vailed',
+    '#"rs"!c""ec#$ling$#orn"&iators#!s"\'onmouth"!s!&wakens"#lad!+xisymmetric!(yckbourn"#ers"$lmer',
+    '""re"&sgarth!#zad$!i##lea#$nian"#eri"%imuth &b&flat!$\'nai"$rith!%.b.c."&m.f.l.!"17!!4',
+    '#%yhood$\'sitters")ck-street$%bones$$door$%light$%slash%&treets$(tracking$)wardation%$oods$%yards#)teriology(%phage"4den-w&uuml;rttemberg',
+    '#%gered"!f"%gnold"!h#%amian#!t"$iles"#kes#%htiar"$lb/c##der#%earic$%fully##ing#\'lantine',
+    '$*ymacarrett#(uchistan$\'strades"&mburgh"(nalities#"ca##dar$$itry$$smen#&gemann$(ladeshis#\'krupted"(ptistery""ra#(bed-wire',
+    '%"rs$&irolli#\'chester#"ds#$ford#&gepole##mby#&nardos#%rages$-ow-in-furness#*t&oacute;k$$ered"&selitz#&ilican(!s',
+    '#%sline##tin&!g#!w"#ted$!y#$htub#$ista##ley"&yreuth#%watch"#zin!%bc-tv!"cc"!u',
+    '!\'earsden#$sley$#tie%$line#\'titudes#%ulieu$&tician#)verbrooks"%ckley""da#%linen#$ouin#&steads#\'wetting"%eding',
+    '#"ny#$sley"\'fuddled"(jewelled"%larus$"ys#%grano#\'ittling#%lotti##sen"\'mbridge##oan&"ed"\'nedetto%\'ictines',
+    '&%tting##yon#,zodiazepines"+rchtesgaden#"ge#$litz##man##nal$%hardt$#ier#/wick-upon-tweed"$sant#)t-sellers$\'sellers#$wick',
+    '#$hell#\'telheim%%ridge#$wixt"$vins"$ynon"!z!(haratpur#&ttarai"$einn!\'iannual"*ckerstaffe"&elecki#%nvida#!r',
+    '$\'leswade#$wigs"#jou"!l#$ayer#*lion-worth"&nbrook##ned"(ochemist##pic$#lan#+remediation#\'sensors$(ynthesis"%pedal',
+    '#%lanes""ra#%dseye#$kitt#-mingham-based#"os#%thing"&sected$\'xuality"\'tstream#&terest&%sweet$!y"\'variate!\'jaaland',
+    '#)ck-backed%%ening%$jack%$moor%$rock%%water#$ikie#&nchard$%keted#$rney#(stocysts#$uner"&eaches$$klow$$rily',
+    '#%fuscu"#igh#\'tzkrieg#&zzards"\'ockades\'#ing%!y#$ndie#(od-borne&\'letting&&soaked%%hound#$w-up#"ye"&udgeon',
+    '!"nf!\'oadicea#(rd-level%"er""ck"(ddington#"ed$\'lwyddan"$ggle"&iotian#&patong"$land#!l"(mbardier%"st',
+    '"#ndi#$hams#!k$#ing#"ne"$oing#(kbinding$$list$%store##mer#%sters#$thby%%ferry##zer"!r',
+    '$"en#%ingly#%romeo"0snia-herzegovina"$tero##ica#$olph"&uchard#$diaf#%ghton#$rani$$bons$(nonville#%terse#"zy',
+    '#!n"#yer!"pi!\'rabazon#(ckenbury##ham#*in-damaged#&nchial$&dywell$#iel$!t#&ssicas&#ere#$udel#(zzaville',
+    '%)ing-point$&st-fed&%plate$(thalyser#&ckland#"en$$zily#!l#%ntano%"on#!t")icklayers#\'dgehead$$port##ers',
+    '$-htly-coloured&$side#$nger$(kmanship#$sker#&tannic$(ish-made(%owned$\'tleness#$xham"*oad-minded#%ckway#$dsky#%kenly#$nchi',
+    '##ody#,thers-in-law#%wsers"$uhel#&nskill#&shwork!"sd#$/386!"tv!(ucketful""da#%dleia##gen%%rigar"*ffet-style',
+    '"$ilth"%llett$#och$$wood""mf$#ace"%rbage%"nk$"le#%goyne##ies#\'ned-out#&scough"$shey##ker',
+    '#\'termilk&&worths#"yl"&y-back##oya"$zzes$$word!(y_the_by"%fleet"#rds"(zantines!#zip"!z ,c&acirc;mara#$mp;w',
+    '!!-"$in-c!%.c.a.""s.!"02!(aballero#$bies#!o#$rera"%ccini##het"&davers#$died""er""ff',
+    '#$sson"\'jamarca"*lcavecchia$%ified#%dmore##ero#&ibrate##las$%oused$#una#"um"(mbodians$#ric#"co#%ellia',
+    '#$pari$#hor"%naris#+cer-causing##ing#%nings$&onball#$onic&#sed$#pus#\'tilever"(pacitive#&etians#)italistic#!o',
+    '#\'taining$%ioned")ravanning#&bachol$$onic#%damom$#ing\'#ton%*opulmonary#\'etaking##iad$#nii&"sh##len%#ton',
+    '%#sts#&narvon$%forth#$olan$#tid#(pathians#(rier-bag$"on$$y-on#*thaginians$(ographer$&wheels##uso#$very$"in',
+    '#)e-by-case%\'studies##hew$%guard#"io#$kets##sis#&t-offs$&ellans$%igate$%leton$#rol"\'taclysm$$lans$&marans',
+    '#\'chments#)egorizing#%hcart"\'uldrons$(iflowers"%vallo#&ersham"$wley"$yley!%bp100"!r"!t!$chem"#itt"#k-8',
+    '!#d-a""ai!0eau&scedil;escus"&cchini"\'darwood"!i"\'lebrant$$riac$%stine#"la$#ini")ntury-fox"&phalic"&rberus#\'edigion',
+    '#"ne#$ruti"$sare#!s"&tacean!#ftc!#gdk!#hai$&nstore$%rlift#%lford$"ks$$oner#$mbre$$long',
+    '%#ney##ncy$%dlers$$nell#%pelle$#ple\'%-hyam#&rabanc%,cterisations$3g&eacute_d\'affaires$%lbury%(es-henri$%terer\'#ing$#vel',
+    '#(uvinists##vez#!y""ea$!m#&ck-ups##esy#$rtro$$ubic#$sser%&ington##val##yne"*iddingfold#+ef-of-staff',
+    '#&huahua#\'lblains$&d-like%%hoods%\'minding%\'rearing$&lingly##non$#tzy##pie$"py#\'ttagong"-lor-chemicals"&oicest$$rboy',
+    '%!s#$line$(mondeley#%mping#%rtled#!u")ristmassy&!o"$ucks#%ffing#!g!%iampi"(nderford"%phers#%riani',
+    '&*navigation&\'venting#&rhotic")stercians"(t&eacute#\'y-state"\'vil-law#"vy!$laes#)irvoyance#&morous#%ptrap##ris#&shfern$$sico',
+    '%$ette#&verham"\'eansers$%r-out$!t#$land#\'mentina#%rides"&icquot#+matological%#xed#%ncher$"gy#%p-art#%veden',
+    '#"ke#$nard$#ers#*se-cropped&#set#%ughie"%ubman#$cked#%eless#%mping"*ytemnestra!"mc"!e"!i"!l',
+    '!*o-citation#(director$%river#\'existed#*occurrence#(partners#)sponsored$$tars#\'written"#ade#"se"$bden#!s"%cello#(kermouth',
+    '##ons"&enwulf#$tzer"(ffee-pot"%ghill#(nitively")hn-casson"\'juangco"%lborn#$cutt#)d-hearted$&ingham$%unell#%eford$!t',
+    '$)ectorship%$gium$$ings$%oidal%%quium#)onialists(!s%%naded$&ssians$\'urfully&$ists#%umned#%ville"%mbats#&forter',
+    '#)it&eacute#\'mending&&tating$"ie%&serate+!d$+odification$(unicants#\'parator$#ere%$yson$,i&egrave;gne$%lexed$&osting$\'station',
+    '#&radely$"ie#(t&eacute"-nceptualising$&octing(#ons%$rdia$&ubines#)fectioner$)irmations%\'scating$\'lictual$%ounds$(ucianism%%sedly',
+    '$(regating#(jugation##man#*nectionist$$otes#$seil$%ignor$(olidates$*titutively#!t$&iguity$(raptions&(ventions%%iving#)valescing',
+    '\'"or%*ntionalist-"ty"%okham#*perativity#!t"%p-out#$iers#$land##ped%&rplate#"ra#\'ywriter"%relli#$neal',
+    '%!y$!s#(porately$&uscles#)rectional,#ism$$inne$)oborative$(ugations#$sham#*t&eacute;s$#ege##yza"$satu#"by',
+    '#!i#&meston$#ids$&onauts#+t-conscious$$less%$iest"$ttam$"er$$oned"%undon$+ter-attacks((examples%(ry-house#$rnot',
+    '$)t-martial%%esans#%scous$$teau#%ville"\'variant#%etous($ness"#wal#(denbeath#"en##les#&orkers"#ypu"$zens',
+    '!"p.!-r&egrave;ches"!a#)ftspeople#$igie#&nbrook$#ham$#ium$$king$#ley#$pper#%tered"&eaming#(dit-card&#ing',
+    '#%vasse(!s"!f"$ieff##nan$%kling#&spness"$oagh#"ke#"ll#%mford$\'wellian#&okedly#&sfield$*s-dressing',
+    '&(sections\'$pars%&maglen"%ucify%!s#&mpling#"se$%tacea"+ystallinity)$zing!"sd"!i"!p!\'uckmere"\'fflinks',
+    '("or$,ure-ideology"\'pertino#$olas"$racy$#tes#$dled##ies##ley$(y-haired#$ried#+tain-raiser$#ius$#sey##val',
+    '#"ps#*todianship"\'ticular##off!"vr!&wmbran""t.!#yan"(bernetic*!s"#gni"\'mbeline"$prio"$rano#"ix',
+    '")togenetic$$sine!%zerny +d&eacute;by"$uuml!#\'un#*rbervilles!".j""sc!"10!)aa&eacute"$cron"#ffy##ydd"!h',
+    '#\'rendorf"&iryman"%llied#$ston"&mnable$%edest#%ocles##ply##son"&nubian""ri$!o#&k-blue&$rown%(coloured',
+    '#$lin\'##man$%stadt"-ta-processing$$file".ughters-in-law#"nt"&vidoff""wa"\'y-lewis##glo#$sack"(zzlingly!#b/2"!a',
+    '""ac!*d-mmm-yyyy"!a!(eadliest#(lerships#&uville")bilitated#!s#(t-ridden#%utant"+caffeinated$%thlon#\'elerate$(ntralise*"ze',
+    '$#mus$&phered#(lamatory%#rer#+olonization$(ratively$"ys#"ry"!d"$form&&ations#&rauded")generates"%ified"*liberating',
+    '#"on#(phiniums#"yn"\'metrius#2i-caract&egrave;re#"ob$\'litions"*naturation#)bighshire#,itrification#$sest##zil"(odorants"%ploys#)reciating',
+    '"%rbies#\'egulate##ing$\'vations#)wentwater##yck"(sertions#,tabilisation#-ulphurisation"&tainee#\'entions#&hroned#$inue""us#&terons',
+    '#%iancy$*l-may-care$#ses#&otedly""wy!"gr!*h&amacr;mi"!u!)iachronic#$l-up#+mond-shaped##per")chotomies"&dsbury"\'etician',
+    '"#kes##tat"*lapidation$"te%#ion#"do"/methylhydrazine"\'nantian#&g-dong#!h#)ner-party#)ucleotide"%omede#"uf"$p.he',
+    '"*rectorates$"st",saffiliation&\'orested$(ssociate$#vow\'"al#%cards$\'ernable$&laimed$*olouration%(nnecting*!s&\'tinuing%\'theques',
+    '&%rtesy$%world#)embarking#\'gorging$)racefully#&hcloth#%kette##ley#&maying$%ember)#ing#(neyworld#+orientating#&parage$&ersals',
+    '(#ing$\'ositive$)roportion#&sented(!r$)imulation%&pating$(ociating%$lute%&nances#$taff$&ention$(inctness"\'vesting#!i',
+    '#&orcees"!x#"it!!l"!1"!v!#mem!*na-protein"!j"!s!\'ocility#!s"$dder#&ecamer##ges',
+    '""er"&gfight%"sh#%gerel"#lce#"ed$%fully#$lops"$mbey#&estics##ine""n\'#%nison"%oling#$rmen',
+    '"#rma%\'n-smith#$noch"&ssiers"\'uaumont#)ble-check\'&glazed\'&headed"&vecote"$wels#(n-market$$hole$&loaded$&market$$size',
+    '!$raco#&ftsmen#+ining-board%%pipes#&matise\'#zed#\'wstring#!x"(eadlocks$\'mflight%$less#(ssmakers"&ibbles#*ft-netting#%scoll',
+    '#&zzling"&ogheda#&nfield##opy"!p".ug-trafficking$$ging"&y-eyed!"sd!"tb"!s!\'uchesse#"ky"#des#$geon',
+    '"$ffle"#ich"#lux#&verton"(mb-bells$!o$&struck##per$$ling"%nmore#"no%"ck#(rossness##ton"$rant',
+    '#$rell"\'st-free$#men"&valier!!v"1o&rcaron&aacute;k!*zerzhinsky &e&flat!)-cadherin!#.c.""m."&p.s.p.!"2f!!8!%achus',
+    '"\'ldorman#&hfrith"+r-splitting#$dley$#rum#&ly-day&&season#$wigs"!s#\'terners$#ham!\'berhard"#ury!&c-wide"\'alpemos',
+    '"%helon"!l"\'onomize"\'stasies!"de"&gehill$%worth##ily""hi"\'iacaran#!s"\'mondson"!o"*ucationist"(wardians',
+    '""ig!!f"#rem!)gg-shaped#"le#&shells!"h9"#ret!&idetic"-ght-month-old&#way"%reann"(senstein!(jaculate)!d',
+    '%#ing!&l-jorr"&bowing"/ectrocardiogram($uted\'%phone#*ven-thirty#!y""ie#$sion"!k"%lcock"$more"\'ocution"%sbeth',
+    '"%uding"#wyn"+ys&eacute;e-!s!+mancipatory$$uele#!p"\'bargoes#&ezzled#&rasure$)yogenesis"%irate"(pathetic#*loyability""sa',
+    '!&nabler"&casing#)ephalitis#$ores#)umbrances#)yclopedic"\'d-point$&to-end#)angerment(!s#(earingly#$game#(oscopies$\'thermic$$wing',
+    '%%ising"&forcer#,ranchisement"$gado#(endering#$holm#\'rossing"$nals#%obled#"ui"!s#$lave#%nared#$uite")tablature',
+    '#&husing#%ombed#&rapped$$eaty%#nch$$opic")umerative"%velop#\'isioned!"oc!)pigastric#)scopalian#\'tomizes"!l!(qualizer',
+    '$)strianism#\'ipments$(valences%\'ocation!%raser"\'ections#"tz"\'nestine"$odes#&sional"!s"&uptive!&s/9000"\'calates##udo',
+    '"&presso"&quires"&sayist#$oldo"\'timable#%opped!#tch"&hidium#*nocentrism%\'grapher,!s#(ological"&onians"!s"%trick',
+    '!&ugenic"#ric#(o-rebels$\'dollars$\'markets"%sebio!)vanescent$\'gelista"+er-widening$$dene$&glades$$shed%#ley",olutionarily!!w',
+    '!*x-employee$&ngland#%lover#\'members#(soldiers#*yugoslavia"*acerbation$&titude%$ness#*ggerations#"lt"%crete#&usable"#ecs#$mpts',
+    '#*ibitionism,!t$\'larator#$umed"(istences"#ley")ogenously#&nerate#(skeleton#\'thermic$#ica"*pectancies$\'ditious$%nding#)os&eacute',
+    '\'#ory#$unge\'!d"*ternalized(!s##ort#+ra-judicial%&ctions%\'hepatic%*intestinal%)ordinaire%(vagances"(ultantly%"ed!(ye-spots',
+    '#$lash"#les!&zekiel #f\'s!#-16!#.c.!!8!\'abbiano"\'ceplate"$ggot"#hey"!i#%rmile$\'weather"(lciparum',
+    '"%ncier$#lub#(tasising"#ris#!o""sb#\'t-track$*idiousness$$ness$!s""t*#%-free#*her-figure\'(of-three#$ness',
+    '#%x_pas"!v##ell"$yeds!#dic!&easted"!c"$dora"(ebleness#/d-and-expansion$&stuffs"\'instein##sty"$lice$#nes',
+    '#!s"$mmes"$nner"&offees""rd#!g#"mi#$rero"$ster"!t#"ed"!u!"f."!l"!s',
+    '!"ia"!b"(eldhouse#\'ndishly",fteen-minute\'#ths"!l#&enames#"my"%naghy$&ncials#!g#%nigan%!s"&orenza',
+    '#&ebombs%$race$(fighting$%proof#$ming#-st-generation&%night&*preference"(shfinger$#man$#net#\'ticuffs""tz$$john$&osbert',
+    '")ve-member&$onth%%piece&$ound%&storey",xed-interest!+lagellation$%stone#(mborough##nge#$sher#*t-bottomed$$tens&"rs$%worms',
+    '#!y"(edglings")intstones#&ppancy%"er"(oatplane#"es#*odlighting%%water$*rcoverings#%ppies##ras$\'ibundas%$stic$!y',
+    '#&werbed"!r"&uorite#$pper#$ting$$ters#$vial"\'y-drive#(catchers#%overs!%oamed""gg$$erty"#kin"&llicle',
+    '"\'ndation$"er"\'odstuff#%lscap##ter$%falls$"ie$$pads$$step&#ool""ra#$dist$#yce#\'ecaster$$deck',
+    '$,ign-language$(stalling#\'givable&"es##int#&k-lift$#ful#&malize$!e$&idably$%ulary$$work#%sythe#\'warders"%ucard',
+    '#*l-smelling$"is##nds#,r-and-a-half%&course%%match&%inute%$page\'#rty&$oint%%speed%&thirty&$rack%\'wheeled"#vea',
+    '""xe$!d#%glove!\'ractals#%golli#!k#$mers$&ingham#\'nchisor$\'kfurter%$land&"yn$#ois$"tz#(serburgh',
+    '"%eaked%#ish#%degar#\'e-lance%(wheeling$$born$%holds$$sias$"th$(ze-dried##jji#\'shening#%tless$#ter$$work',
+    '$$rage#$cker$%tions#&esians##sby#&ttered"&odsham#$gmen#&nt-row\'&unners#\'st-free%#ing""sc"&uitbat%&lessly',
+    '#\'ing-pan!$ucks"$dged$#ing"!g"\'lminant"&maroli#\'igation")nctionary#(d-raiser+!s$\'raisers$"us"\'r-lined##ies',
+    '"\'turists ,g&acirc;teau")ouml;ring")uuml;nter!#-24"#mex!!6!"aa"\'bcikovo#&erdine#%riela"!d"$ffes"$gauz""ia',
+    '%"ul\'"ly"\'ladriel$#had#&leried$&stones$"us#\'sworthy#!t##wey"\'mma-ray"$nder##ged$#ing"&rdenia',
+    '#&landed#$nets$#ham#&ryowen#\'scadden##ton"(s-cooled#$elee#&ifiers#+troduodenal"&tepost(!s"#uls$!t#&ntlett',
+    '#"ky!"cd"!r!$eena#$zers"$hlen"$lled%!r"%mayel#$mill"%nette#$ghis#&ocidal#(tlewoman"(ometries',
+    '#*physicists##ref$%giana"$rbil#"da#$giev##rit##son#!t#$vase"$sell!%flops!!g!\'hettoes")orbanifar',
+    '#"ul!&iacomo#&nluigi"$ffen"$ggly"&lberto#!g#&liland##pin"%mbert##son"%ngery"&ordano$%gione"*rl-friends',
+    '#!y"&ttings&!s"&uliani"&venchy$"rs##in\'!*lac&eacute#)diatorial#!n#!s$&sfibre#%ucoma"&eaning#(ngormley',
+    '$\'patrick#"ys"%isten"#oag#\'merular"#uck##ons#"rs#+taraldehyde$#ton"*ycosylated##nde$"is!&mt0bst!)nassingbe',
+    '!$o-go#$kart"%bbets##ies"#ers")ld-rimmed$(en-brown$&finger$#wyn"#ngs#\'ococcal("us"-od-humouredly%%sized$$hart',
+    '$#way"#rby##gon#$tari"%ssage""to"&uaches#$lash"2vernment-appointed+*controlled+(in-exile&\'orships"#wie!(raceless%!y',
+    '#\'dualism)!t#)eco-roman#"ff#(instones#(mophones#*ndiloquent%&stands%%tully$$itic$$tley%"or#$seby$"si##ter',
+    '$$uity##ver$$itas#%yling$%shott#$zers$"ie")easepaint$&t-gran*$dson#"be#%enall%$baum#%gorio##tel',
+    '##efs#&goriev##lly#(methorpe$#ley#(ndelwald%,lewood-gryke\'!y##pes##sty"&ommets#,und-breaking&$bait"!u#%mpily',
+    '#"po"%ypesh!"sm!"t4"!e!*uadalajara#"no$%ylate"%bbins%!o"%dgeon"&ercino$%illas#\'sthouse"$ffaw',
+    '&!s"\'glielmi"#idi#)ldenstern&!r$%lemot"!l#"ag#&buddin##den#\'fstream#%lholm$\'ibility"$mmed"&ndobad',
+    '$&erside#%shots"&sfield#$tavo"%tting!(ymnastic"#ula -h&eacute;caen!#.m.""p.!*abr&eacute"&chette")ematology$(orrhoids"!i',
+    '#\'leybury##rdo#%tians"%lberd#(f-asleep%%backs&%uried%%caste&%ircle%$dead%%field\'$lled&(orgotten%#pay%\'starved',
+    '#$ibut$"te#(lamshire$#ows$$ways%$orth#"on#$pern#$sall"\'miltons#$mett"*nd-knitted$$cuff$(icapping$\'painted',
+    '#)g-gliding#"if#%kered#&naford"%pgood#$loid%$type"!r#%angue$!r#\'bingers#(d-bitten%#hit$%backs$$ener',
+    '%$ness$%liner$#raw$\'wearing##eem#"ks#&lesden#*mondsworth&"ia#"ps%\'ichords#%ridan$"od#"te%!r',
+    '$$mann"&s-been#$hing##ler#$sled"$thor#$reds#"ta"$unch$&tingly#"sa"+verfordwest%$hill%#ing%$sack',
+    '#%arden#$kers%"ye"\'ymaking#$wire!$cfcs"!r!#dur"!z!\'eadlamp%$ease%$ight$\'scarves#-lth-conscious\'\'related',
+    '#(ring-aid$*t-breaking&\'warming%$hrug#%thens&$rton##ves"%ckler#&toring"&donist"$enan"$fted"#ide#&ghtens#!n',
+    '"!l#\'blaster##ene##ier$"os#&l-fire$"en#&mholtz##ots#(pfulness#+ter-skelter"%mlock"$nman#$tzau"%r/his',
+    '#(cegovina#*m&egrave;s$"ia%"ts#%zberg$"en"!t#)erodimers\'#oxy"!w##son"$xane"&ydrich##sel!&ibbert',
+    '"%ckory$#ton"\'debound$#out"&eratic#!u"\'gginson#*h-altitude%&flyers%&necked%\'protein%&school&\'ecurity%&volume$&waymen',
+    '"$jras"$kers"$lali$\'riously#%dyard#&lhouse$$iard$\'walking"#mem")nterlands""rd"$s197#&panics\'#ola"*tch-hiking',
+    '##ter!!j!#ncs""ds!#oad"$bble$%yists#!y""ch#$king$#ley$!s"#eth"!f#(fmann-la',
+    '"%ggets"$hner"&ldalls$$fast#(e-in-one#$iest##ler$)ingsworth\'%worth$&yhurst#&ograms\'$phic#&stered"\'me-help$%grown',
+    '#%ilies$$nids%$oids#(ogenised$&phones"&neydew#\'orarium%$ific&"us"$oley##ped##ter#%vered"\'pkinson##ton',
+    '#&derley##ley#&nbills$#sea&!y#%sebox%$hair%\'manship%&racing"$sing#%pices%\'tallers")tch-potch%%potch#%point',
+    '#)sekeepers%#man"%wlers%"tt#&soever!"sc""ds"!u!$ubel"%ddles\'#ton"$ffed"%lking"%mbert#"ic',
+    '#$oral$%uring#(p-backed$!h"&ngrier#"ks#,ter-gatherer$\'ingford"$rray#$tado"!s#\'bandman#&h-hush##ked#%seini',
+    '&#son!*ybridizing"(drangeas$%olase"#ena"\'gienist"#men"#nes"-per-inflation&$text%$card%\'kinetic%*lipidaemia%\'markets%\'surface',
+    '#\'henated#&notism#&ocaust%(hondriac$\'tensive%\'halamus&#esi)"ze$&xaemic!#zds #i\'d!#.c.!#860!#b4e"$mers',
+    '!#com"!u!(dentikit#(ologists#!s"!g"*iosyncrasy"#led"!o!"fc"!e"!r!%guana!"ht!#irs',
+    '!\'leoanal#!s"#ias")l-starred%%uited##ite&%rates"#ott""ya#%ushin!#mhv"&itates"&manuel#%odest#,unoglobulins',
+    '\'"ed$#ril&&shable%\'manence*!t%&sonate*#ing$\'tuosity#\'licates$#ore#*onderables#%rover&(isations!%n-car#%group',
+    '##law$#ine#%vitro")_extremis#(memoriam"*cendiaries#$omer#\'ubators",decisiveness$&xicals#\'isposed%\'soluble$&um-111#)o-chinese%(european',
+    '#%ulges$%strie#\'welling"+effectively#(legantly#*xpressible"\'flexion#3ormation-processing#"ra%&dental%*structures"\'gesting#&lenook#!s#%uinal',
+    '#)eritances"#igo#\'tiators"%jects#$ures%"ia%%y-hit"#ked""la"#man"*sectivores$&nsible$\'parably#\'ightful$%nuate',
+    '#)olvencies#1titutionalisation#\'ulators%,in-dependent\'!s$#res"%tasun#)elligibly%#sat$)r-company&,generational\'$roup%%breed*#ing%(ceptions',
+    '&\'hanging%)est-group%&facial%%group%\'jection,!s%&leaved&#ink%)mediation\'"nt&\'ingling&(olecular%!n&+ationalists&#ees',
+    '%(quartile%%sects%*ventionism#&imates#(ra-group%\'cranial%\'nsitive"(undation"\'veraray%%leith%%ted-u""xs!"od"%nised#&ophore',
+    '!#rby"#ian#\'tnefert"\'on-grey$\'mongers*!y"*reducibles*!y$\'ligious$)sponsibly$\'verence#%igate!"sh"!i#$dore',
+    '"$olde##mer&#ism".raeli-occupied(+palestinian"&tituto!\'taliano"!o""to!$u/ml"#pac!#v\'s"!e#\'rmectin!%zzard',
+    '!".p""w.!#/44!&ackals$"ey$!i$$sons##obi"$faar"%iling""lo"(m-packed#!a"%nette$!y',
+    '#"os"#ver!%eanie""bb"#mmy"$ncks"#rez#)sey-based"$sses"%tties%&soning!#fit!$iffy"%ggled"%menez',
+    '"%ngles%#ing##xed"!t!$mp-1!%oanie#+qu&iacute;n"&hansen"+ie_de_vivre"#lts"$nesy"!o"$plin&!g"%tting',
+    '#"st!"th!&uanita""da"%ggler"&mp-off"$nket")sticiable")xtaposing!"vc /k&ouml;nigsberg!$adis"%leida&\'oscopic#$iber',
+    '#"al#"il"$posi"%raman$$teka#%enina#%lsson#"st"%sabat"&telina##hie#"ib##rin!#cal!&eeling',
+    '##ton"$inya#%retsu"&llaway$#ner$!s#!p"(nchester#"ne##sal#$ward#$yans"#rbs#%chief##rey',
+    '"$ying#\'strokes#%worth!!h"$aine#)n-penrose#"tm"$yber!&ibbutz"$dder"&lfoyle#(imanjaro#$keel#&larney#"ts',
+    '$#ell%#rly"*nd-hearted$"le%%iness#&g-size$%scote%$mill#$loss#\'sbourne#$tyre"!o"&rchner#%illov#%kdale',
+    '$#man##sch#(tlington$"on")tchenware#"ts!!k!%leine$\'sthenes#&omenes"!f"&osters"#uge!&napman"%eaded',
+    '#%es-up""in"\'ockdown#%pfler#$whow""ut!&oblenz"$eman##nig#%stler"#gan"!h"&lingba"&msomol"$nica',
+    '"#rma#!n""si"&zloduy!"pa"!h!$ress"&ispies$&tensen%#ian"\'yuchkov!%uchma"#rtz!$wame"&ik-fit',
+    ' %l\'art"!s!*-glutamate!%.g.r.""jj!%abial#)our-power"%chman#%kenby%"ys#%rosse#$tate"%durie#&ybirds"&etitia',
+    '"&id-out#*ssez_faire"(marckian#&basted$"ie#(entation##ing#$port$$post$#rey")nd-owning%%users#*guage-game"%ppish#$tops',
+    '$$orth"%rnaca$"er")serwriter##sus#&t-gasp"#tif##owa#%ticed"\'undries#%rance$#ens"$vage"*w-breaking#"er',
+    '#&renson"$yard#"by""ze#"lo!#cfa!)eaderless#$nder#*st-squares#!t#$vitt"!c#$lerc""ds""ed',
+    '#"t-%\'handers%%overs%%sided%&winger$$hand$%wards%#ing"&galise\'!m&"ze$#tee#%endre$$ring#$gatt',
+    '$!t")isurewear##tch$%motif"#man#\'onheads%!y##urs"\'ngthens&$wise"%onine#%tards"!p"$rner"(tchworth',
+    '"*ukotrienes"*vi-strauss!#ias"%b-lab#%elled$-raci&oacute;n&%lised($zing&#tes\'\'ionists%#man%#tas&#ine#&idinal#\'rettist',
+    '"&cenced\'"es"(ebermann##ssa"*fe-chances%\'history$&guards$"rs$%spans"&gachev#/ht-middleweight%$bulb"(kenesses"#med##ing',
+    '"&ncolns##dop##gua#!h#&kworth#$tels#!z"$o!rt"\'posomes##ski"$sson#$trel"&terati#)hographic%$logy',
+    '"&veried\'!s#&ing-in!"jj!%lamas#%ndaff%%overy"!b"#osa!#nwr!+oad-bearing"&bbyist#$elia#"os"&calise',
+    '#%k-out"\'dsworth"#ess"%foten"#gin#"on"$iter"*llapalooza$%ipops$!o"\'neliest#)g-delayed%\'overdue$&ed-for"(ok-alike',
+    '"!p"(quacious"!r##eto#"re"#uie#$vres"$vatt#%elace$$sick"%w-cut$\'density%#own$%speed$$wage',
+    '"$yden"$zano!#qts!"rt!"so!$ubow#&ricate"%casta#$idly$"er"%gbara#!g"#ker"!m#(inescent',
+    '"%stily!&ynched"!s#%ander$"te&!s#!o""te#"ic ,m&eacute;tro!&acadam$#que$!u#&cabean#\'dougall',
+    '#$hico#%innes%&toshes#&kworth#%laine#%mahon#"on%"ie#+romolecules""da#$dock#,e-to-measure#$igan#(reidetic"$elor',
+    '"\'gdeburg#$hera#)netically(!s\'"te$*ifications$%usson#$yars"\'harishi#$mood")idservant#$gret#%lshot#\'nspring#%olica',
+    '"+ke-or-break##ita"%lacca%$hite$\'djusted$$wian#&cesine#*e-oriented$$ngin#%lorca#"mo#\'thusian#%vinas"$mmon"(n-eating',
+    '#!a$/gement-employee##del#&groves$!y#$hunt#%iacal$#pur#$jiku#&liness#$naia$!e%$quin)!s$#ion',
+    '%"la$#ini$\'lepiece#!u$#res#)y-to-many"$plin##pin"$quis"#ran##den$%onios#&enches$"va#"gi',
+    '$$rida##ham##iam$$nate$"se#\'ket-led\'%maker$!y#%quand#&rakech$(iageable%#ner$"on##sha%"ka',
+    '\'!t##wan"#ser#$hing##par#$sawa$#imo#\'tectomy$(urbating#"ur"(tchmaker#)erialists#"if#"ra$\'iarchal',
+    '"\'ubisson##ndy#%ricio%&tanian%#zio$!y"&wdsley##son"%xilla$%mises&#zes#$plan"#yle$"ie!\'candrew',
+    '"\'caffrey$$uley#$rone"$duff"%elroy##wen"%given"%ilroy$&vanney"&kelvey#%inley$&ttrick#"oy"$nair"!s',
+    '$$vish"%veigh!#dbs"!s"!u!"ea#&dowell&$land#,ninglessness"#des$"va$$wich#%icaid&"ls&#ted',
+    '#%stead"!e"&gastar$!w""hq"$ikle#!r$#ion##sel$#sen"\'lanesia%"in#$ling$!y"&mentos',
+    '&$zing"\'ndelian$$oros#)struating#%tmore#$uhin"!o"%rcers$\'hantmen$!i#)etricious%!z#&idians#$kuts#*leau-ponty',
+    '%"on#)seytravel#!z"$shes##ons$(potamian##ser&(schmitts$$iaen%"er%#nes##ure""ta$$lled$(morphism',
+    '#$calf#(rocentre%%logie"%unier")vleviyets"!w"$yers!"fi!%hcima!"ib"&cawber#&raster$%ocode%%nesia%%titre',
+    '&$itec"(d-career%$lass$#off$\'section$%table%$eens%(wentieth$&ulster#(dlemarch#%hurst#%range"&ghtier"$kado$"el',
+    '#*l&oacute;s$$osko"&ldness#&e-long$#tos#%kmaid#(lenarian$%ichip$$pond$$town$$ward##som#&tiades#$wall"%naret',
+    '#\'dlessly#\'efields$(sweepers#%i-cab%*enterprise$!m%"is#&kowski##now#$uets$$test"#ras##cea"\'sbehave#)direction',
+    '#%heard#%judge($ment#\'matches#/representations,#ing$#ule##sal$&ioners$\'pelling#%using"$tres#"zi"&xed-up!#kii',
+    '!$litt!#mrc!%oamer"%biles"$da\'i$"ls#&ellers#&ifiers$"sh#&ulator"!e#!t""ir"%ldava#&esting',
+    '#$lies$%uscan##ton#\'ybdenum")nasticism#$cada$%rieff#$dano#)ey-lender%"ed#%goose##ism%!t#%kfish#(oculture',
+    '$&layers%$iths$$mers$%poles$&stable$(tonously#&tacune%"ne$(enegrins$#ini$&pelier"#och#%nless%\'ighting#%rhens',
+    '##den##els$"no##ita##mon&!s#)phometric#$tice$$lake"(saicists#$elle##sop#1t-favoured-nation""te#)her-child',
+    '$$onal&#ing#\'or-bike&%cycle%$cade\'!r&\'yclists#"ta"%untie##rns#"sa"#wat##lem""ya"%zarts',
+    '""la"!p"!x!!q"!m!"ra""ds""nd!"sm"!v!#toe!,uch-maligned%*publicised##kle""ff',
+    '"&hammed"%irend"(jjaddedi"$llet$$igan#+ti-employer%&centre%\'faceted%(protocol%(tudinous"%ngall#!i"#ons"%ruroa"&scling',
+    '#%icale%#man#%tards$"oe#$well"\'talibov$$ndis$"te%"is#\'ilating$$nies"#zzy!%winyi!&yanman&!r',
+    '"#ler"$nydd"&opathy"$rcan $n.e.""w.!"=3"!5"!6"!8!+a&iuml;vely""bi##lus""ep#"vi',
+    '$#syu#-orno-karabakh#!s"#hda"%ivete"&kajima"\'meplate#&ibians""no#!t"%phtha#!s"!r#!k"#sir',
+    '$\'urtiums")tionalrat#,ural-looking\'\'isation)"ed(&zation"$ulls#%tilus"#vvy"\'zareans#$imov!$bfis!"ca"!h!%dlovu',
+    '#"ve")cessaries##ked""ds"%edful$%lebed#"ps""ff"%gates"&hemiah""in"!l"!o"&phrite"(rve-ends',
+    '"#sle#"sy"\'therton#$tled&#ton"0uropsychological.!y#)tralizing"%wbery#,castle-based#,ly-appointed&%built%!n%$weds#$sman',
+    '$$tead!"fi!#ibs"#cam$\'raguans#)e-looking#$kell$!i#$olai"#els"%ggled#\'ht-club%%shade%$time%(watchman',
+    '"$kita#(ol\'skaia%#aus",ne-month-old$%pence"!r"#sse"!t#"ty"!x!"ls!%mol/l!(o&euml;l"+-confidence##man',
+    '"".4"-_matter_which"$bler"$dule"%isier"#kia"$mole"&n-cash&&tholic%+ommissioned&+ntroversial&)operation$\'deictic&)structive%)isclosure',
+    '$%legal&%xical$(material$+observation$)pecuniary&\'rmanent$(rational%(eligious&)sidential\'(pondents\'(trictive%&ussian$+significant%(ocialist$\'trading',
+    '$*vocational&&latile"$olan"!p"(rdhausen#&malize(#ing%&tivism$#ski##rie#"te$&herner%#olt&!p%(umbrians',
+    '""sh##tra".t_withstanding#$ated#&e-book#)iceboards#"tm"$uvel&*le_cuisine"#vak$"ya#"us"%wthen!"rm!#sfu',
+    '!"ts!$uala"$bian"\'cleated"$dges"$gent"!p"%tters""wm!"vc!"wr!\'ymphaea (o\'gorman#$rady"+shaughnessy',
+    '"$kham!%beron")jectified"\'ligated#!t"#ote"\'structs!&ccured"+eanographic+!y"%t-11a#&opuses!\'ddments")er-neisse""in',
+    '!)ff-chance$&loaded$#set%&pinner#$beat#!e$\'nsively$#ree#\'iciated(#ing"#wat!%gmore"#res!(il-based$%fired',
+    '#$skin"#sin!#kra!(ld-world#"ie"(igarchic#$nton#"va"%lokot!(mbudsmen")niscience$&vorous""on"#ron!&nanuga',
+    '#&ogenic"(e-eighth$$shot$\'to-many%"wo!"oo!,phthalmology""ie"*pressively$&obrium"(ting-out!\'rangery#$tion"$bach"%deals',
+    '&#nds"#feo"(ganelles%+izationally#&iastic")ientalism#%fices"%kneys"$ogen&"ic&!s"$phic"#rie!+scilloscope"+tertagiasis',
+    '#\'racised!%tiose##tis"\'taviani!\'ut-door$(of-doors\'%hours#\'fitters#$grow#\'pointed#%remer#%shine%#one$\'ourcing#$turn',
+    '"&er-50s%\'anxious%(estimate%%large%.representation&"un%$used$&active$\'charged$#fed$\'hauling%#eat$#ing$&laying$\'payment',
+    '$(reacting$#saw%(ensitive%$lept%$pent%(tatement&"ep$%takes$#use"#ver!$wsla!(xidising"#ton")ygenating!,ystercatcher',
+    ' /p&eacute;rigord"\'gt;0.05!%\'raps!".5"$g.a.!"45!&=0.001%!3!*a&iacute;s"*cification#!o"%ddick%"es"#ean##lla',
+    '$"rs"$hdra#$lavi"*in-killers$&killer",laeomagnetic&)ntologist$#tes$!u$#ver##ely#%ladio%!s##mas$#top',
+    '&!r")mphleteer$$lona",n-africanist#"am%&anians##kin#$nier#%ofsky$%ramas#\'taloons$$iles")per-based%#ing%!y',
+    '"*rachutists$$diso$\'gliding$*linguistic%(lelistic$$pets$"s.$\'trooper)!s#"dy#+ent-teacher&(s-in-law$,to-efficient##ham#$ibas',
+    '#*ker-bowles$%lands##ley$\'ourmaid#)ochialism#$rish#\'t-timer$#ito$+y-political#"ys"&sadena#-cal-trouillot$#hal#(s&eacute$)chendaele',
+    '#&t-life$\'eurised$!s"(tentable$\'rnalist#"he$$name$*ologically#&roness"&ulinus$"us"#war#"ed"$xman!"bc',
+    '"$r322!"ce!#dci!+eacefulness"%ckish$!s#&torals"(dagogies$"nt#"en#&iments""ed$"ie"&kinese""ll',
+    '"\'nalises&"ze#%icuik$%stone#$rhyn#&sively#*tium-based#$zias"!o#!p$&lesoft"%ppard"(rcentile$%olate)!d',
+    '#%golas#\'ihelion#\'meating$*o-triassic$\'utation##nod#&oxides#&pignan##rie#%sonam$(pectival#&tained$\'inently#&uvians#*vasiveness',
+    '##ter"%tiole##rey$(ological$%ushka#,ty-bourgeois"$uple"#yer!&flp-gc!(hantasms#*rmacopoeia$#ynx"(ilatelic$%imore%\'stinism',
+    '$!o#\'zacklea"(logiston"(omvihane#&nogram%)logically#-tographically"(renology"!t"$uket""yl!\'icassos##ker&%staff%"tt',
+    '#\'nicking#!s"(ece-work#\'rcingly%!y#!t"%ggies$%yback"#key"$ladu#&fering#%l-box$&owcase#!s")n-striped',
+    '#&ce-nez%!r$#her$$ombe#)e-needles$"al$!d#$hole##ion#\'t-sized$#ail"#otr#$usly"\'pedream"&quancy',
+    '"\'ratical"$sses#&tachio"&tcairn#$eous#%iable#&lochry#"ot#(t-rivers$(encrieff#&yingly!"ki!(lacatory#"ge$$uing',
+    '$$tago#%steel#!t$$eaus$!h$%itude$$ypus#"ya$&master$#off"\'enitude"&iocene"%opped#&wright"&ughole',
+    '!"mt!!n""dc"*eumocystis!"oa"*cket-sized"%groms")intlessly)$ness"(larising#*iomyelitis%%virus$$sher$*ticisation\'$king',
+    '#&linate$$utes#&o-neck#$ydor$$gamy%$raph$(theistic$%vinyl")megranate$\'shchiks##mel#&pously"\'nderosa$\'icherry#%sonby',
+    '$&ifical#*y-trekking"%odles"%ppins#\'ularise"(rchester#"ky#$lock#%sches#&tholes$&rayals$\'stewart#"ua")shekhonov#%konov',
+    '$&essory#&t-cold%\'mortems%%roman%-structuralist$#box$%codes%%rania$&holder$*menopausal$\'ulating"(t-pourri#\'_pourri#&pourri#!t',
+    '%"on#%ncing$#der$$tney"\'wdering#-ell/reporting$&r-base%%heads#$nall!"pc!&ranced#$xsys"*e-colonial$&filter$,independence',
+    '$(occupied$(packaged%&rinted$%roman$\'service#\'bendary#&catory$%entor%%ssion$(ipitates#(disposes)&itions$)ominately#"en%"ed',
+    '#)menstrual$"ia%$ered#&occupy#\'payment#\'science$%enile%$rver%"ts##tax#)varicated$&iewing"&ichard#%ggish#(ma_donna',
+    '$#ula#"nz#(oritised#,soner-of-war$$tina#+vately-held$\'ileging#(zewinner"!n""o-$\'iranian#%bands$.lem-orientated#&ctitis$-urator-fiscal',
+    '#\'fligacy$&undity#(genitors$*r&egrave;s#\'jective#(karyotes#)letarians$$ongs#\'mptings#\'nounces$"to#\'pagator$\'hesying$\'rieties($ress',
+    '$&thetic%%rated#%tease%*in-protein\'#ase$%heroe#&udfoot#(vincials$(ocateurs#$wler"(unskiene$"us"#yor!#scs"0eudo-obstruction',
+    '")ychedelia%$ical\'!s%\'ologies&%paths&*therapists!(tarmigan#!s"!o"%r&num!)ublicists""ce##ker"!d#"gy',
+    '#\'satilla#\'verised"(mmelling#)p-priming"&nch-up$&tually#%gency#$ning""pa"%rchas#&loined#$ples##ton"&shbike#%sycat',
+    '!"vo!!x!&ylorus""ne"*rotechnics"%thons #q\'s!%basic!#dms!"ts!(uadrants%(ilateral%%upole#%inton#"nt',
+    '%#ile%$zite#-si-government0"al#%vered""el#*stion-mark%!s"#ids#"ff#%lting#)ntessence#$vers#%zzing""oc',
+    ' #r30!%abuka"\'cialist$"ne#$kham#%quets"\'diantly$\'ologist#(norshire"\'ffaella$#ish"$glan#$wort"&inhill##sin',
+    '"\'maswamy#$eses##lal##rod"(nasinghe#(dalstown$\'omizing#!h#"te%$allo"(pporteur"$quel"&sputin#$tani")tatouille',
+    '*#tic+!s#!u"\'venhill#%ished"%wlins#$ness$$sley!"cp!&db/vms!)e-created(#ing#&export#-investigation#&launch',
+    '#$sale$#ell#&usable")activated)#ion#&d-only&"ut$&justed(%ments#&ffirms#"le$\'politik#\'ppraise#(ssessing#\'wakened',
+    '$!s"+calcitrance$\'pturing##hem#$ites#$kitt#-lassification$$ined#$oils$\'mmenced$&nciles%&noitre#&reates#(tilinear")d-blooded',
+    '#%brick##den#(emptions#$mire#%ouble#$raft\'"ed#%shift"#eks#"th"\'ferenda#(ormative&(ulations#%rains"$gale',
+    '#"er#%icide$)mentation#!o#&rading$&ouping#(urgitate",habilitating"(ichmanns#(fication#!k#(nforcers$%hardt$)scription$$vent',
+    '"%learn$&vantly#%oaded"(mediable#\'issions#(onstrate$&rtgage$+tely-sensed"$nati#%dcomb$"el%%rings#&egades$$wals#.nes-le-chateau',
+    '"(patriate)$ions#&ealers$%lling$\'rtoires$\'titious#$osed#(ressions$&inting$%obate%$cess%&vingly",quisitioning"\'setting#&iduary',
+    '#&onator#&tating#%upply$(rrecting")taliating#"ch#&entive#&hought#"ix##old#&rained$\'oactive%%viral($uses#%urner',
+    '"&veille$(rsionary#)isionists#*olutionize!"fi""lp!\'hizomes"!o#$dium$"ri#$mbic""us"$ymed#)nchosaurs#%olite',
+    '"#bas#\'blehead#$eiro$"na$"ra"$card##cio#%ketts$#man\'&sworth#(ocheting$#tta"%dings"&evaulx"#fat',
+    '#$ling"*ght-angles&&winger%"on#&oberta$(r_mortis"%ngers$&leader"$pens"*squ&eacute""tu"\'valling#%erbed%%stown$#ter',
+    '!"m1"!s"!w!&oaches##die$%shows%$ides##sts"\'barchek##ben$!o#(espierre##les"#cha#&k-hard',
+    '$&abilly"#den#&omonte"!g#"al"#hde"!k#&ovssky"#llo%#ver#!t#&y-poly"&manovs"%nseal"%oster',
+    '#$alie#*e-coloured%$pink$!a$$buds$%marie%$ount$\'ncrantz%$feld#\'s-shire$%ignol##ten"(thenberg"-ugh-and-ready$#vie',
+    '##say$#sel#%tiers"#ved"%xanne"\'yalbion!$s232""nc!"ts"!z!%uched"%ffles"$ggia""kh"+le-of-thumb',
+    '#!i##ney"%n-out$\'through#%aways#$nels$#in\'$%ymede"(ritanian"(stenburg"&tshire"!y!!y"#ans"#dal',
+    '"#mer (s&iacute"0ucirc;ret&eacute!&-class!\'.139(1)"$2(1)"%92(1)""c.""d."&m.e.t."%pombe""s.$"o.!#740!"80',
+    '"$bena#%oteur"(ccharine#%kings"#diq#-o-masochistic"!f#(ekeeping$$ways"\'gramoso"#hib#$lins"$ibou#\'nt-jean""ks',
+    '$!m#$erno$(smanship#!i$!h#%onika#&tation$$ires$#ley$%marsh$%petre#"ut#)vadoreans"%maria%$kand',
+    '#&dbanks%#erg$#vik$(y-haired#"er#"ga$"er##jay#!n#$tana$%orini"%ppers$"ho"%razen#"is',
+    '"&tanism#%iated#$raps$$iani##yrs"\'u-leyan#(ce-boats#!d##ron#\'ssurean"$vary#&erplus##ill"$y-so#!e',
+    '$\'ed-down$"ps#"ms#$nlon#%rlett#!t""di"!f",h&uuml;ssler#%aefer#$emed$$ring$(veningen##iff$$phol',
+    '$$egel#(oolmates%$ners#&reider$$oder%$eder##ule%!z#%wantz%"rz$"yz"+ientificity\'"sm"!n"$obie',
+    '#%tched$%sport$#tie&\'shpower#%users#&wcroft"\'rambler(!s$%pyard#)eenwriter#&ipting#%ounge#%ubber%$land$\'mptious',
+    '"$ulpt#$pper!"df!)ea-change$%front$%going##cat#\'mstress#%plane#(sickness$&onings#&wright"*cond-floor&*ary-school#*retaryship',
+    '"&edless##in\'"#ige#"us"!l#(f-access&\'dhesive%-contradictory%(delusion\'&struct&(iscovery%\'induced\'$jury%\'mockery)#ing',
+    '%\'pitying&)ossession&+resentation\'\'omotion$$hood$$same#"la#%znick",mi-conscious%+independent%(literate%,professional$%tones#%olina")nding-off',
+    '$"iq%%tized#*timentally"(pulchral"%r-249#(endipity#.vice-providers%$lity$"os"\'ssional"(t-pieces#$tees"(vastopol#\'en-inch&&member',
+    '&$ieth$%rable%$iano%!s"#xed##ier""yh!)habbiness#(llowness#"ms#"ng$$ties#&relink$#jah$#key',
+    '$$pens%!s#!t#&wfield"(earwater*!s$#ths#$ikhs#%nzhen#$pard$\'herding#!r$#bet$#pas$#win',
+    '#"ls#&pboard#"rl$)t-sleeves%\'sleeves"&oaling#*ot-to-kill##red$#ing$(t-handed&$stay%#cut%$hold%#ish#%ttery',
+    '$+lder-blades#%w-off$%cases$$ings"!u#%nning$#ter\'!s#)ttleworth!&icam-1#$huan#%kroom"\'de-step%\'tracked$&boards',
+    '"$eved"!g#*nificances\'#eds#&sworth"%layev#\'bermann#$cock#%liest%#toe$(y-willie##soe#"ts#*ver-haired&$fish',
+    '$%ikrin"$mian$$lars%"es#&pleton%)istically#\'ularity&#tes%\'taneity"&nfield#,gle-breasted\'$chip\'\'engined\'%track$$song',
+    '$#tta"&phoned"\'r/madam#$loin"%tcoms"*vapithecus"*x-cylinder$$fold$\'monthly$%point"#zwe!!k"$eins#%rrett%#ies',
+    '#%wered"(illstart#&ttered%#ish"$omer")ulduggery"&y-blue#$bolt#&lights#&master#$ward!$lake#\'mpacker#$p-up#%ttery',
+    '#&zenger""ed$$ging#*eplessness%\'walking#&nderer"%icker%!s##der#%mness#"nk%#ing"(oppiness$!s#%shing',
+    '"%uices#%mbers#"rs"#ynn!+mall-minded%$talk"%etana$%hwick")ithereens%#son"(oke-free#&othest&!s""ut$!s',
+    '"$eers$#zes"&ipping"$obby#%gging##uts"#ubs#%ffled!*o&amp;sub2"$bers#&riquet"$cata#.ial-democratic$+obiologists"*f&iacute;a',
+    '"#git"$iree#%ssons".laris-on-intel%!z#%chaga#&diered##eil$!y#)icitation$\'loquies$%psist#$land#$oing$$mons',
+    '#)zhenitsyn"(maliland"\'nnabend#%ority"%pwith"\'rrowing"(tto_voce"-ul-destroying#%rness#+th-westerly%$land)!s%$wood\'#rth"#yuz',
+    '#"ke#$ndau#)rcsystems#$tter"(earheads%#ing#\'ciation%!e%(ficities\'#ers$)trometers\'*photometer\'&scopic#(edometer#"ns',
+    '"#ick#$egel#$king#$nney#)ritualism+"ts*#zed#(tsbergen$#zer")lattering##iff$"nt$\'t-brain#&utters"%ooked',
+    '#$t-on#$uted"#rat%!t#%eader#\'inghill%"ts"&urring!(quaddies#"ib$%rting!#ram!"sm!(tabbings$#ler',
+    '$%nated#&indrop$$thes#(keholder##ley$(lholders#&nchion$&d-offs%*ard-bearer#+phylococcus$&leford#&rkness#,te-sponsored%(smanship#&ughton',
+    '"!d"+eadfastness%#ier$#rns#&epness$%rsman#!g#&inbeck%$mark#%ncils#)p-parents$(children#&rnberg##tch$#son',
+    '#"yn"&ickler#%ffens%!s$#les#%glitz#\'llbirth#%ngray$"ts#"pe"$oats#(ckbridge%\'markets%+ton-on-tees##day',
+    '#*ne-flagged&(throwing%$bird%%leigh%$ware$#ing#%pover#+rm-troopers#&urport#$wage$#ell$#ing#!y"%radey$)ight-line',
+    '%(t-jacket&"on$&nglers$%pless$#sse$&tagems%%hmore#)eetlights$)ptococcal$*ss-related#%iders$$nged\'$ntly##oma%&bolian',
+    '$$phic")udentship$#ley"!y!,u&aacute;rez"(b-atomic$&clause$(division$\'heading+!s%$uman$\'optimal$\'station$$zero#\'_judice',
+    '$%tomic#(clinical#(limation&#ely&#ity#(mergence#\'scripts$"ea$#ume#%types#,urbanization"&ccumbs#%hocka#$kled#&ralose',
+    '"%iting"\'lphates%(onamides"&merian#&monsed#(ptuously"%nlink##nis#$sail$#pot$%troke#&tanned$#ory"*percharged&)onductors',
+    '%*imposition%%model%(numerary%#vga#$ping$\'lanting"&reness#(factants#%plice#\'rogates"#shi#%pends#\'sexdown##tad"(zerainty',
+    '"!r!%wabia#%nning#&stikas#%tches#"ys"!e#&llings"&iftair#%gging#%mwear#\'tchable&$back$%hland"\'ordsman',
+    '"(cophancy"&mantec#&ington"%n-gas#\'agogues#\'chronic#\'odontis#&theses\'%isers($zing"%quest"$rupy!$zdsz %t\'zin!$abor',
+    '""co""ft"#gan#(liatelle##ore"!i#&lbacks$$ings"!k#\'e-aways$#off"%lcott#$kers$"in"$mely',
+    '##pon"%ncred#&dragee#\'gerines$$mere#&nadice$#ins#$sley$#sie"#pas#+e-recording$&/slide"*ramasalata#\'paulins#$quin',
+    '#$tans$!y""sh#)k-centred##sel"$ters"(untingly#&tology"\'verners"!w")xonomists""ya!"bm!"cp"!s',
+    '!\'eammate#%r-gas$#oom""bb"(ch-green$&nocrat$!s"%eside#(totaller".ichm&uuml;ller"(legraphy$)marketing$%sales$\'working$#xes',
+    '"%mpera&#ing$"ts$!y"&n-mile$$week$)year-olds#$nent#&terden&%hooks"$odor"$phra"+r-petrosyan#)minations#&rapins',
+    '%(torially$%orise(#ing\'#zed"$ssas$\'ellated"$xans#\'t-books$*ermination"!y!"gf!&habane#"ch#\'meslink#)tcherites',
+    '$)tricality##ban#%lwall#%mself#(nceforth#)ophylline$(retician%#ise#)rapeutics$%ewith$(mometers&&static#\'ssalian#\'udebert"\'ick-set',
+    '#$ngie%"s.#\'rd-rate"(omlinson$\'son-csf#"ng%!s#$rney%$tree$*ough-going#"th#,ughtlessness"+ree-bedroom&$foot&$inch',
+    '\'&ronged&%sided\'#tar&)year-olds$$shed#&oatily$%nging$&ttling$&w-away"#uds#%ggery#!r$&lstone"%waite"\'ymidine',
+    '##nne!$i\'ko"#ber#"ia"%ckles%#ish"%dbury"&e-back$#ins#$bout"*ggywinkles#\'ht-head&$knit%$ener#!i',
+    '#$lage$"ed%"rs##son",me-dependent%%limit%&saving&%cales&#pan%$zone$%frame$$span#$mins#%orous"&ncture',
+    '#%plate#"to%%retto"$pler##pee"%ranoc"%sdall"$tbit#%honus#*tle-tattle!"mp!"oa#&dstool)!s#%sters',
+    '$$with#(queville"$dger#"or"%ggles"\'ileting"&kenism"#lba#&erates##led"(m&eacute##cat#$lins#%pkins")nsillitis',
+    '#&thpick"\'p-floor$&secret##_of#&ically#(ological"&rnados#!o##pid#)que/rotor\'%speed#&sional$"os"#sca"$ting',
+    '##ten".ulouse-lautrec##rer"%wnend#!s#"yn"(xoplasma!(rackways#&inload%\'spotter$%psing##lee#%nches$)quilliser$$said',
+    '&\'riptase%#end%*figuration%\'hepatic%%ience(#tly%&jordan%(lational%)migration%(portable%\'sexuals%(ylvanian$#ter##ore#%ppers',
+    '"!e#*acherously%!y$&dmills#*e-planting#!s"%iable$%zolam#%cking#&folium#)gonometry$$rams#$lled#&mester$$mler',
+    '"*oms&oslash#!n#(posphere#"ts#(ubadours%)leshooter$#per#!w$&bridge##yna"!p"%ucker%#ing#\'mpeting#$ndle',
+    '"#yst!#s-1""ai!"tc!\'ubercle#$well""fa"#lle"#mim##mel"&neless#!s"%rbans$%idity$%oprop',
+    '#$eens#&kestan$"ic$%menia#&nround$%stile#%reted"#tte$"le"#zla!\'wanging"%eedie$!n#!n$)ty-minute',
+    '\'$year"&iddled##sty"(o-colour$&headed$$inch$%match%%inute$&person$$seat$&thirty!%ydfil"!e""ke")pescripts',
+    '"!r \'u-turns!"/v!"ci"\'kington"!p!"do!!f"$fizi!%glier!"ic"#sts!$kias!(lcerated\'$ions',
+    '"$s/ce"*tra-modern!$mist"&khonto!)n-english#%named#*supervised"-acceptability#\'djusted#)ffiliated#&lloyed")believers$%nding#)linkingly$&ocking',
+    '$$rden$\'ttoning"&called#(easingly#(ivilised#&lipped$%othed#+o-ordinated$+mmunicative%(plaining$*nsolidated%(tentious$\'rrected#%tuous"$dead',
+    '&\'funding&*privileged&%rated%*estimation%%floor%.lexicalisation%\'pricing%%score%&tenant$%sired#(iagnosed$&gested#\'ramatic$%eamed"-exceptionable',
+    '%$ired%&ressed"&fasten#&itness#(lappable#%ormed##ree")helpfully$&ralded"*i&oacute;n#%corns#$face$"il#$gram\'".x',
+    '$&viting%%olved#)onisation\'"ed#!r##sex"(ladylike#$earn#$ocks#&uckily"$make#(emorable$(rcifully"*observable#(rganized',
+    '$\'triotic$#ved##ick##lug#\'olished#,recedentedly$\'ocessed%*nounceable%#ved"*quenchable"&ravels#(easoning$&formed$(peatable$\'sisting',
+    '##oll"&seeded$&lected$)ntimental#%haded$"ed#)teadiness#&ullied$\'rprised#%worth"&tangle$#xed#%iring#(raceable$\'eatable',
+    '")varnished"\'worried!/p_to_the_minute"%field"(gradable"&holder(!s""ni"$park#)er-middle##ing&#ham$"ty"$side!#ral',
+    '&"ty"!c"%inals""ng"\'ticaria"$wick!4s&dollar;100,000,000**50,000,000"\'-backed!"ta"*ilitarians"(opianism&!s!"up!%zbeks',
+    '!*acillating)"on"!i#!l"(lentines$#sio#\'ladolid$$etta")nishingly$$ties"\'riegata"$sari#*e-painting#&ilissa%!y',
+    '!&ecchio"#dic"%getal".l&aacute;zquez#!a"#nal%#ity#(tilating$"re%$icle"&rbiage$"um##ged#&hoeven#%ifier',
+    '#%mouth#$sant$!o#&tebral$%icals"%sicle##tey"$xing!"fr!$ials"\'brancer")ctuallers\'!s"%deoed"&etcong',
+    '"#jay"%ljoen#"li"#ney#!s#%tages$$ners"$rani")scountess##hnu"!t#$esse#$riol"$zier!*ladivostok',
+    '!!m!$ogts"$ided##ght#(l&agrave"%lost\'#"ta$&e-face")raciously"$sges"%uched!#sel!&uitton""pp!\'ytautas',
+    '!#.g.!\'addling#"er"(fer-thin")ge-earner#%goner#$tail"\'ist-hip#*ting-rooms"&kening$$rley$!y"\'lahfrid#*kie-talkie#&lchart',
+    '$$onia%#ped#$sham#%tzing"#nna"(rdenship$#our#$eham%\'ouseman#&render#"ty"(shbasins#!l#&pishly#\'telands',
+    '"*ter-colour&)resistant#\'sonians##ton"*vefunction$$rers"#xen"&ybills#%farer(!s#$land!\'eakling#"ls#*pons-grade#%rying',
+    '\'#ill"$bley"%ddell"\'ek-ends"&igh-in%&bridge#!l#$rder&"st%$ness#%zmann$+s&auml;cker"%lbeck#"l-%%armed',
+    '%%liked%*maintained\'%naged&(otivated%*publicized%$read%%timed&$ried\'%odden##ton"$sker##son#(tborough%$rook$%erman',
+    '$#ley$&onbirt$&phalia"$ther#$suit""yl!)harfedale"\'eatgerm%!s&$tone#!e$$dled$$lers%&wright$"zy',
+    '"\'infield#$ppet#\'rlpools#)stle-stop#)te-tailed%#out$\'suntide"-ole-heartedly&$tone#%mever$&soever#$opee&!r%!i#$ring',
+    '"(de-awake%\'brimmed"!e#&sbaden"%ggled%!y#$ston"\'ldavsky$$cats$#man#&kerson$"in#\'lenhall%"tt$#ies',
+    '$"ys#"ma$&ington#%shire$#ons"&mborne#$pole$!s"\'ndblown$)ing-sheet$\'ow-seat$\'stopper##fax##gti#&nicott',
+    '$#ome$!y#\'terbone($tham\'#urn&$time$#our"!r#!s")stfulness"(tch-hunt#&ticism%$sham!#oad#!n',
+    '"!h"&jciech")lfenstein$&prince"\'maniser"\'odbrook%#urn$&ifield$$line$%smoke#\'ldridge$$lens%#ies$%ridge$!s',
+    '"(rked-out$#in\'#+ld-renowned%&liness#$rall#\'st-case$$wick"$tton!"pm!!r"%ecker#$ford"&iggles#\'te-down$\'ten-off',
+    '%$ness!"sr!"uz!#yke$#ham")thenshawe &xanadu!"d4!"e4"(nophanes!"ix!!j"!s!"pg!#tra',
+    '!#xxx!(ylophone #yam"%nayev#$kees$#ing##nis"%rdage!%eadon#%rling$"ns"$hudi"$lton""ti!%ilmaz',
+    '""ko"#nge"#use!$sgol!$ucky""go"#kio""rt!#wam )zacchaeus#&harias&!y"#dar"%fonic"&ibatsu',
+    '""ki"\'ndvoort#!u$#-pf$"ck$#ssi"&ragoza!"bb!(ealously"!d##ong"\'itgeist"$mlya"%rmatt!&hdanov',
+    '!#ikr"#lch!!n!&offany"$pfan',
 )
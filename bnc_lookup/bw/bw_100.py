@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_100 = (
+count_100 = 6694
+
+heads_100 = (
     '!*?*',
-    '%/100',
-    '%295',
-    '%5,000',
-    '%able-e',
-    '%able-w',
-    '%addr',
-    '%age',
-    '%and',
-    '%c',
-    '%correct',
-    '%dcl-i-supersede',
-    '%earning',
-    '%of',
-    '%return',
-    '%s',
     '&aacute;ed',
-    '&aacute;ed&aacute;n',
-    '&aacute;il&iacute',
-    '&aacute_propos',
-    '&acirc_la_mode',
-    '&aelig',
-    '&aelig;dericus',
-    '&aelig;dwardi',
-    '&aelig;gelnod',
-    '&aelig;lf.',
-    '&aelig;lfgar',
-    '&aelig;lfgifu.',
-    '&aelig;lfweard',
-    '&aelig;lfwig',
-    '&aelig;scferth',
-    '&aelig;scwig',
     '&aelig;sir',
-    '&aelig;t',
-    '&aelig;the&aelig;r',
-    '&aelig;thelburga',
-    '&aelig;thelingadene',
-    '&aelig;thelmund',
-    '&aelig;thelsige',
-    '&aelig;thelwine',
-    '&agr&bgr&ggr',
-    '&agr&dgr',
-    '&agr&tgr',
-    '&agr/',
-    '&agr/2',
-    '&agr/g',
-    '&agr;-&lsqb',
-    '&agr;-/-',
     '&agr;-32p',
-    '&agr;-actin',
-    '&agr;-adrenergic',
-    '&agr;-emitters',
-    '&agr;-globin',
-    '&agr;-granule-derived',
-    '&agr;-helical',
-    '&agr;-herpesviruses',
-    '&agr;-hydrogen',
-    '&agr;-hydroxy',
-    '&agr;-ifn',
-    '&agr;-keto',
-    '&agr;-mem',
-    '&agr;-phenylenediamineto',
-    '&agr;-tbp',
-    '&agr;-tropomyosin',
     '&agr;.',
-    '&agr;1(1)',
-    '&agr;2&bgr;1',
-    '&agr;2(1)',
-    '&agr;2-',
-    '&agr;achr',
-    '&agr;antigen',
-    '&agr;chain',
-    '&agr;f',
-    '&agr;gp',
-    '&agr;grs',
-    '&agr;iib&agr;3',
-    '&agr;x&bgr;-/-',
-    '&agrave_la_carte.',
-    '&amacr&sacute;rama',
-    '&amacr;c&amacr;rya',
     '&amacr;go',
-    '&amacr;graha',
-    '&amacr;nanda',
-    '&amp%',
-    '&amp&amp',
-    '&amp&deg;c',
-    '&amp&dollar;14',
-    '&amp&dollar;15,000',
-    '&amp&dollar;16',
-    '&amp&dollar;180bn',
-    '&amp&dollar;2',
-    '&amp&dollar;25',
-    '&amp&dollar;250',
-    '&amp&dollar;29',
-    '&amp&dollar;2m',
-    '&amp&dollar;3.3',
     '&amp&dollar;3bn',
-    '&amp&dollar;5.3',
-    '&amp&dollar;60',
-    '&amp&dollar;900',
-    '&amp&frac12',
-    '&amp/',
-    '&amp/2',
-    '&amp;01944',
-    '&amp;0d',
-    '&amp;1/2',
-    '&amp;16',
-    '&amp;18',
-    '&amp;2',
-    '&amp;2.99',
-    '&amp;20',
-    '&amp;23',
     '&amp;3',
-    '&amp;30',
-    '&amp;36',
-    '&amp;4000',
-    '&amp;50',
-    '&amp;6.2',
-    '&amp;7f',
-    '&amp;82',
-    '&amp;accounts',
-    '&amp;add',
-    '&amp;addr',
-    '&amp;agrell',
-    '&amp;albon',
-    '&amp;ann',
-    '&amp;berry',
-    '&amp;beta',
     '&amp;binot',
-    '&amp;bolton',
-    '&amp;boyd',
-    '&amp;brown',
-    '&amp;brushes',
-    '&amp;buy',
-    '&amp;byways',
-    '&amp;c000',
-    '&amp;cairnmuir',
-    '&amp;carpenter',
-    '&amp;carriage',
-    '&amp;children-in-arms',
-    '&amp;chilingar',
-    '&amp;choquette',
-    '&amp;clarification',
-    '&amp;clarkson',
     '&amp;coleman',
-    '&amp;commissioners',
-    '&amp;commonwealth',
-    '&amp;confidential',
-    '&amp;consumer',
-    '&amp;crc-check-output',
-    '&amp;customers',
-    '&amp;daily',
-    '&amp;davidson',
-    '&amp;dean',
-    '&amp;decker',
-    '&amp;degree',
-    '&amp;design',
-    '&amp;dining',
-    '&amp;documentation',
-    '&amp;dope',
     '&amp;dredging',
-    '&amp;druckman',
-    '&amp;durney',
-    '&amp;ef',
-    '&amp;equals',
-    '&amp;eriksson',
-    '&amp;estates',
-    '&amp;exports',
-    '&amp;f',
-    '&amp;fehr',
-    '&amp;ferm',
-    '&amp;ffff',
-    '&amp;figs',
-    '&amp;folk',
-    '&amp;frac12;tsp',
-    '&amp;frac34',
     '&amp;frakes',
-    '&amp;friedman',
-    '&amp;galloway',
-    '&amp;games',
-    '&amp;gay',
-    '&amp;general',
-    '&amp;gillies',
-    '&amp;glover',
-    '&amp;grace',
-    '&amp;growth',
-    '&amp;guildford',
-    '&amp;h300',
-    '&amp;h308',
-    '&amp;hammond',
-    '&amp;hanks',
-    '&amp;harris',
     '&amp;hayes',
-    '&amp;hedges',
-    '&amp;hein',
-    '&amp;henderson',
-    '&amp;henshaw',
-    '&amp;herdmen',
-    '&amp;hill',
-    '&amp;hosey',
-    '&amp;house',
-    '&amp;houston',
-    '&amp;hoy',
-    '&amp;hughes',
-    '&amp;humphreys',
-    '&amp;industry',
-    '&amp;institutional',
-    '&amp;int',
     '&amp;introduction',
-    '&amp;its',
-    '&amp;james',
-    '&amp;journal',
-    '&amp;kendall',
-    '&amp;kgf/m&sup2',
-    '&amp;komar',
-    '&amp;ladders',
-    '&amp;lahann',
-    '&amp;lane',
-    '&amp;lerche',
-    '&amp;lewis',
-    '&amp;link',
-    '&amp;lohmann',
-    '&amp;lybrand',
-    '&amp;magic',
     '&amp;marten',
-    '&amp;mary',
-    '&amp;mason',
-    '&amp;maynard',
-    '&amp;mayo',
-    '&amp;mazzullo',
-    '&amp;measures',
-    '&amp;minus0.5',
-    '&amp;minus1.1',
-    '&amp;minus4&deg;c',
-    '&amp;minus:2750',
-    '&amp;minus:4920',
-    '&amp;murray',
-    '&amp;murrell',
-    '&amp;national',
-    '&amp;nea',
     '&amp;north',
-    '&amp;oa',
-    '&amp;okuzumi',
-    '&amp;oldershaw',
-    '&amp;oring',
-    '&amp;p.',
-    '&amp;parkin',
-    '&amp;parsons',
-    '&amp;peace/ucm',
-    '&amp;peat',
-    '&amp;pentland',
-    '&amp;places',
-    '&amp;plans',
-    '&amp;platt',
-    '&amp;polymers',
-    '&amp;poors',
     '&amp;powders',
-    '&amp;prosper',
-    '&amp;quality',
-    '&amp;r/l',
-    '&amp;rammler',
-    '&amp;rec',
-    '&amp;regional',
-    '&amp;reliable',
-    '&amp;rose',
-    '&amp;s4',
-    '&amp;s5',
-    '&amp;sager',
-    '&amp;salary',
-    '&amp;sales',
-    '&amp;schmidt',
-    '&amp;schot',
     '&amp;scoffin',
-    '&amp;sears',
-    '&amp;see',
-    '&amp;services',
-    '&amp;shaxson',
-    '&amp;sime',
-    '&amp;sinclair',
-    '&amp;smithers',
-    '&amp;snack',
-    '&amp;somerset',
-    '&amp;sons',
-    '&amp;spell',
-    '&amp;spencers',
-    '&amp;spottiswoode',
-    '&amp;spotts',
-    '&amp;steele',
     '&amp;stenstrom',
-    '&amp;sub2',
-    '&amp;sup1',
-    '&amp;sup143nd',
-    '&amp;sup147sm',
-    '&amp;sup219',
-    '&amp;sup220',
-    '&amp;sup3',
-    '&amp;sup4',
-    '&amp;surdam',
-    '&amp;swift',
-    '&amp;szabo',
-    '&amp;szczuczko',
-    '&amp;table',
-    '&amp;team-building',
-    '&amp;tears',
     '&amp;technological',
-    '&amp;thursday',
-    '&amp;till',
-    '&amp;titles',
-    '&amp;tobi',
-    '&amp;tone',
-    '&amp;training',
-    '&amp;treasurer',
-    '&amp;trumbull',
-    '&amp;unwin',
-    '&amp;van',
-    '&amp;w-powered',
-    '&amp;warren',
-    '&amp;waugh',
-    '&amp;webb',
-    '&amp;wedderburn',
     '&amp;weiser',
-    '&amp;wells',
-    '&amp;wesson',
-    '&amp;west',
-    '&amp;white',
-    '&amp;whitney',
-    '&amp;whitrow',
-    '&amp;wilkinson',
-    '&amp;williams',
-    '&amp;wilson',
-    '&amp;wireless',
-    '&amp;xe8',
-    '&amp;y',
-    '&amp;yet',
-    '&amp;zaki',
-    '&amp;zeitungen',
     '&ape',
-    '&ape;dh',
-    '&ape;kt',
-    '&aring;-resolution',
-    '&aring;bo',
-    '&aring;ngelholm',
-    '&aring;rdal',
-    '&auml;gypten',
-    '&auml;rmste',
-    '&auml_la',
-    '&bgr&gt',
-    '&bgr&gt;0',
-    '&bgr:sub2',
-    '&bgr;-/-',
-    '&bgr;-blockade',
-    '&bgr;-blocker',
     '&bgr;-blockers',
-    '&bgr;-elimination',
-    '&bgr;-error',
-    '&bgr;-gal',
-    '&bgr;-globulin',
-    '&bgr;-lactam',
-    '&bgr;-lactamase',
-    '&bgr;-lactamase-producing',
-    '&bgr;-lactams',
-    '&bgr;-monosulphate',
-    '&bgr;-naphthylamide',
-    '&bgr;-oxidation',
-    '&bgr;-particles',
-    '&bgr;-peak',
-    '&bgr;-ray',
-    '&bgr;-reverse',
     '&bgr;-turns',
-    '&bgr;1&ndash;3',
-    '&bgr;1.1',
-    '&bgr;1.2',
-    '&bgr;1.3',
-    '&bgr;2-m',
-    '&bgr;chains',
-    '&bgr=-0.29',
-    '&bgr=-0.58',
-    '&bquo&lsqb;i&rsqb;f',
-    '&bquo;o&equo/gcse',
-    '&bquo;s&equo;s',
-    '&bsol&commat*&pound',
-    '&bsol&gt;keyb',
-    '&bsol*',
-    '&bsol*.',
     '&bsol;3dmenu&bsol*.',
-    '&bsol;a&bsol',
-    '&bsol;amipro&bsol;docs&bsol;count.sam',
-    '&bsol;ansi.sys',
-    '&bsol;are',
-    '&bsol;b&bsol',
-    '&bsol;c',
-    '&bsol;darren',
-    '&bsol;dos&bsol;display.sys',
-    '&bsol;dos&bsol;expand.',
-    '&bsol;dos&bsol;q*',
-    '&bsol;dos&bsol;qbasic.exe',
-    '&bsol;dos&bsol;qbasic.hlp',
-    '&bsol;dos&bsol;qbasic.ini',
-    '&bsol;dustbin',
-    '&bsol;etc.',
     '&bsol;fi',
-    '&bsol;fp',
-    '&bsol;nort6&bsol',
-    '&bsol;p',
-    '&bsol;phant&bsol*.',
-    '&bsol;s',
-    '&bsol;temp',
-    '&bsol;util',
-    '&bsol;w',
-    '&bsol;win',
-    '&bsol;windows&bsol;system',
-    '&bsol;worksheet',
-    '&bull;at',
-    '&bull;ciro',
-    '&bull;daniel',
-    '&bull;ferdinand',
     '&bull;gian',
-    '&bull;giovanni',
-    '&bull;guercino',
-    '&bull;henry',
-    '&bull;il',
-    '&bull;inlaid',
-    '&bull;jusepe',
-    '&bull;les',
-    '&bull;many',
-    '&bull;nicholas',
-    '&bull;pirro',
-    '&bull;readers',
-    '&bull;salvator',
-    '&bull;sandy',
-    '&bull;see',
-    '&bull;self-employed',
     '&bull;success',
-    '&bull;surrey',
-    '&bull;that',
-    '&bull;there',
-    '&bull;thirty-six',
-    '&bull;up',
-    '&bull;valuable',
-    '&bull;verily',
-    '&bull;wolverhampton',
-    '&ccaron',
-    '&ccaron;a&ccaron;ak',
-    '&ccaron;aj',
-    '&ccaron;akavski',
-    '&ccaron;apek',
-    '&ccaron;e&ccaron;ova',
-    '&ccaron;ech',
     '&ccaron;en&ecaron;k',
-    '&ccaron;esk&eacute',
-    '&ccaron;etniks',
-    '&ccaron;i',
-    '&ccedil;eri',
-    '&check',
-    '&check;s',
-    '&circ;10',
-    '&circ;2',
-    '&circ;b6',
-    '&circ;d2',
-    '&circ;g',
-    '&circ;s',
-    '&circ;vg',
-    '&circ;y',
-    '&commat&commat',
     '&commat&commat&commat',
-    '&commat&dollar;382',
-    '&commat;15%',
-    '&commat;ahead',
-    '&commat;base',
-    '&commat;date',
-    '&commat;date(92,7,12)',
-    '&commat;date(92,9,11)',
-    '&commat;fv(&dollar;b&dollar;4',
-    '&commat;h3',
-    '&commat;if(principal&gt;taxthresh',
-    '&commat;pmt(principal-taxthresh',
-    '&commat;sys&dollar;lifespan',
-    '&commat;sys&dollar;lifespan:lslive',
-    '&commat;tco920121000',
-    '&commat;time',
     '&commat;time(9,0,0)',
-    '&commat;yellowlist',
-    '&commat;your',
-    '&copy;1985',
-    '&copy;1989',
-    '&copy;1992',
-    '&copy;dalesman',
-    '&copy;phil',
-    '&copy;wizmatic',
-    '&deg;c/min',
-    '&deg;t',
-    '&dgr&micro',
-    '&dgr&ngr=+1',
-    '&dgr&tgr',
-    '&dgr;63',
-    '&dgr;71',
     '&dgr;d/&dgr;r',
-    '&dgr;h5',
-    '&dgr;indo',
-    '&dgr;k',
-    '&dgr;m',
-    '&dgr;mu',
-    '&dgr;r/c',
-    '&dgr;scf',
-    '&dgr;w/',
-    '&dgr;x',
-    '&divide;l',
-    '&dollar%&circ',
-    '&dollar&dollar;176,131',
-    '&dollar&dollar;53.4m',
-    '&dollar&dollar;9.50',
-    '&dollar&frac12',
     '&dollar&frac14;m',
-    '&dollar\'39.95',
-    '&dollar:365',
-    '&dollar;.1*75',
-    '&dollar;.10',
-    '&dollar;0',
-    '&dollar;0&middot;43',
-    '&dollar;0.',
-    '&dollar;0.000602',
-    '&dollar;0.000623',
-    '&dollar;0.0006735',
-    '&dollar;0.0048',
-    '&dollar;0.0048/&dollar;0.0001',
-    '&dollar;0.00846',
-    '&dollar;0.00896',
-    '&dollar;0.0387',
     '&dollar;0.055',
-    '&dollar;0.1294',
-    '&dollar;0.142',
-    '&dollar;0.1443',
-    '&dollar;0.1684',
-    '&dollar;0.1m',
-    '&dollar;0.2',
-    '&dollar;0.3m',
-    '&dollar;0.41',
-    '&dollar;0.54',
-    '&dollar;0.545',
-    '&dollar;0.565',
-    '&dollar;0.629',
-    '&dollar;0.673',
-    '&dollar;0.67m',
-    '&dollar;0.68',
     '&dollar;0.6m',
-    '&dollar;0.8',
-    '&dollar;0.8035',
-    '&dollar;0.83',
-    '&dollar;0.84',
-    '&dollar;0.84m',
-    '&dollar;0.87',
-    '&dollar;0.8m',
-    '&dollar;0.90',
-    '&dollar;0.91',
-    '&dollar;0.94',
-    '&dollar;0.97',
-    '&dollar;1&frac14',
-    '&dollar;1&ndash;1.2',
-    '&dollar;1&ndash;1.4',
-    '&dollar;1&ndash;1.8',
     '&dollar;1&ndash;16',
-    '&dollar;1,000&ndash;5,000',
-    '&dollar;1,000.',
-    '&dollar;1,000.00',
-    '&dollar;1,0000',
-    '&dollar;1,000m-a-year',
-    '&dollar;1,001,400,000',
-    '&dollar;1,001.5m',
-    '&dollar;1,002.9m',
-    '&dollar;1,005',
-    '&dollar;1,009',
-    '&dollar;1,019.8m',
-    '&dollar;1,020m',
-    '&dollar;1,022',
-    '&dollar;1,024,647',
-    '&dollar;1,030',
     '&dollar;1,032',
-    '&dollar;1,035m',
-    '&dollar;1,060m',
-    '&dollar;1,062,000',
-    '&dollar;1,070.6m',
-    '&dollar;1,071.4m',
-    '&dollar;1,073',
-    '&dollar;1,082',
-    '&dollar;1,090m',
-    '&dollar;1,101m',
-    '&dollar;1,109',
-    '&dollar;1,119,943',
-    '&dollar;1,135',
-    '&dollar;1,137',
-    '&dollar;1,137.28',
-    '&dollar;1,138',
     '&dollar;1,140',
-    '&dollar;1,150m',
-    '&dollar;1,152',
-    '&dollar;1,160',
-    '&dollar;1,160m',
-    '&dollar;1,165',
-    '&dollar;1,165,000',
-    '&dollar;1,165,477',
-    '&dollar;1,168.6m',
-    '&dollar;1,168m',
-    '&dollar;1,169,000',
-    '&dollar;1,170',
-    '&dollar;1,172.0m',
-    '&dollar;1,180',
-    '&dollar;1,187m',
-    '&dollar;1,193,000',
     '&dollar;1,195',
-    '&dollar;1,200,000',
-    '&dollar;1,204,300',
-    '&dollar;1,205.3m',
-    '&dollar;1,210',
-    '&dollar;1,230-&dollar;2,195',
-    '&dollar;1,233,300',
-    '&dollar;1,235,000',
-    '&dollar;1,236',
-    '&dollar;1,245',
-    '&dollar;1,250m',
-    '&dollar;1,251.2m',
-    '&dollar;1,255.7m',
-    '&dollar;1,259.3m',
-    '&dollar;1,260',
-    '&dollar;1,260,000',
     '&dollar;1,261,650',
-    '&dollar;1,280m',
-    '&dollar;1,290m',
-    '&dollar;1,292',
-    '&dollar;1,296.7m',
-    '&dollar;1,320',
-    '&dollar;1,322.6m',
-    '&dollar;1,330,000',
-    '&dollar;1,333',
-    '&dollar;1,340',
-    '&dollar;1,350,000',
-    '&dollar;1,356,500,000',
-    '&dollar;1,362m',
-    '&dollar;1,365',
-    '&dollar;1,370m',
-    '&dollar;1,373m',
     '&dollar;1,384',
-    '&dollar;1,395',
-    '&dollar;1,399',
-    '&dollar;1,400billion',
-    '&dollar;1,409.4m',
-    '&dollar;1,410',
-    '&dollar;1,438.6m',
-    '&dollar;1,440,000',
-    '&dollar;1,442.5m',
-    '&dollar;1,445.8m',
-    '&dollar;1,450,000',
-    '&dollar;1,460,000',
-    '&dollar;1,463.9m',
-    '&dollar;1,467',
-    '&dollar;1,470',
-    '&dollar;1,472.5',
     '&dollar;1,475,927',
-    '&dollar;1,476.1m',
-    '&dollar;1,480',
-    '&dollar;1,490m',
-    '&dollar;1,500,800,000',
-    '&dollar;1,500.',
-    '&dollar;1,500each',
-    '&dollar;1,514',
-    '&dollar;1,516m',
-    '&dollar;1,519m',
-    '&dollar;1,520',
-    '&dollar;1,520,000',
-    '&dollar;1,530,000&ndash;2,295,000',
-    '&dollar;1,550m',
-    '&dollar;1,559',
-    '&dollar;1,572,283',
     '&dollar;1,575m',
-    '&dollar;1,588',
-    '&dollar;1,592',
-    '&dollar;1,600.',
-    '&dollar;1,6000m',
-    '&dollar;1,603.50',
-    '&dollar;1,610',
-    '&dollar;1,610,345',
-    '&dollar;1,611m',
-    '&dollar;1,617.5m',
-    '&dollar;1,620m',
-    '&dollar;1,626.7m',
-    '&dollar;1,629m',
-    '&dollar;1,640',
-    '&dollar;1,640,625',
-    '&dollar;1,644',
     '&dollar;1,650',
-    '&dollar;1,660',
-    '&dollar;1,670',
-    '&dollar;1,677',
-    '&dollar;1,680',
-    '&dollar;1,685m',
-    '&dollar;1,690',
-    '&dollar;1,690.9m',
-    '&dollar;1,694m',
-    '&dollar;1,697.2m',
-    '&dollar;1,700,000,000,000',
-    '&dollar;1,702',
-    '&dollar;1,705.2m',
-    '&dollar;1,708',
-    '&dollar;1,710m',
-    '&dollar;1,713',
     '&dollar;1,727m',
-    '&dollar;1,729m',
-    '&dollar;1,735,531',
-    '&dollar;1,736.4',
-    '&dollar;1,740',
-    '&dollar;1,746.4m',
-    '&dollar;1,758',
-    '&dollar;1,760m',
-    '&dollar;1,773',
-    '&dollar;1,780',
-    '&dollar;1,790m',
-    '&dollar;1,793.4m',
-    '&dollar;1,798,077',
-    '&dollar;1,823,600',
-    '&dollar;1,840',
-    '&dollar;1,840m',
     '&dollar;1,855m',
-    '&dollar;1,872m',
-    '&dollar;1,875',
-    '&dollar;1,884m',
-    '&dollar;1,900,000',
-    '&dollar;1,903.4',
-    '&dollar;1,906.7m',
-    '&dollar;1,909.7m',
-    '&dollar;1,914.1m',
-    '&dollar;1,919m',
-    '&dollar;1,920',
-    '&dollar;1,932',
-    '&dollar;1,940',
-    '&dollar;1,942m',
-    '&dollar;1,950m',
-    '&dollar;1,960m',
     '&dollar;1,968',
-    '&dollar;1,973.9m',
-    '&dollar;1,976',
-    '&dollar;1,982',
-    '&dollar;1,988',
-    '&dollar;1-&dollar;2',
-    '&dollar;1-million',
-    '&dollar;1.0',
-    '&dollar;1.00=&pound;0.50',
-    '&dollar;1.00=&pound;s90.1971',
-    '&dollar;1.00=1,410',
-    '&dollar;1.00=1,610,000',
-    '&dollar;1.00=1.053',
-    '&dollar;1.00=1.095',
-    '&dollar;1.00=1.512',
-    '&dollar;1.00=1.693',
     '&dollar;1.00=12.7',
-    '&dollar;1.00=14',
-    '&dollar;1.00=14.23',
-    '&dollar;1.00=143',
-    '&dollar;1.00=2.6',
-    '&dollar;1.00=21',
-    '&dollar;1.00=22',
-    '&dollar;1.00=3.2',
-    '&dollar;1.00=3.3495',
-    '&dollar;1.00=4,000',
-    '&dollar;1.00=47',
-    '&dollar;1.00=5,600',
-    '&dollar;1.00=60-90',
-    '&dollar;1.00=60.404',
-    '&dollar;1.00=800',
-    '&dollar;1.00=814',
     '&dollar;1.00=9,500',
-    '&dollar;1.00=k23',
-    '&dollar;1.00=k40',
-    '&dollar;1.00=p21.094',
-    '&dollar;1.00=p21.5',
-    '&dollar;1.00=p21.737',
-    '&dollar;1.00=p22.44',
-    '&dollar;1.00=p23.5',
-    '&dollar;1.00=tsh138',
-    '&dollar;1.00=tsh145',
-    '&dollar;1.00=tsh180',
-    '&dollar;1.00=zl11,100',
-    '&dollar;1.032',
-    '&dollar;1.036',
-    '&dollar;1.036billion',
-    '&dollar;1.036bn',
     '&dollar;1.039m',
-    '&dollar;1.054',
-    '&dollar;1.05bn',
-    '&dollar;1.07',
-    '&dollar;1.09',
-    '&dollar;1.11',
-    '&dollar;1.132',
-    '&dollar;1.13m',
-    '&dollar;1.14m',
-    '&dollar;1.1517',
-    '&dollar;1.15m',
-    '&dollar;1.1686',
-    '&dollar;1.17',
-    '&dollar;1.19',
-    '&dollar;1.20-a-week',
-    '&dollar;1.22',
     '&dollar;1.24',
-    '&dollar;1.25&ndash;1.75',
-    '&dollar;1.25s',
-    '&dollar;1.26',
-    '&dollar;1.28',
-    '&dollar;1.3&ndash;2',
-    '&dollar;1.31',
-    '&dollar;1.32',
-    '&dollar;1.33',
-    '&dollar;1.3billion',
-    '&dollar;1.4&ndash;1.6m',
-    '&dollar;1.4&ndash;2.1m',
-    '&dollar;1.4.2',
-    '&dollar;1.40625',
-    '&dollar;1.4207',
-    '&dollar;1.4280',
     '&dollar;1.4317',
-    '&dollar;1.4330',
-    '&dollar;1.43bn',
-    '&dollar;1.4440',
-    '&dollar;1.4472',
-    '&dollar;1.4490',
-    '&dollar;1.4491',
-    '&dollar;1.4495',
-    '&dollar;1.45/&pound;1',
-    '&dollar;1.4555',
-    '&dollar;1.45m',
-    '&dollar;1.46m',
-    '&dollar;1.4735',
-    '&dollar;1.4767',
-    '&dollar;1.4825',
-    '&dollar;1.4890',
     '&dollar;1.4945',
-    '&dollar;1.4billion',
-    '&dollar;1.5&ndash;1.8',
-    '&dollar;1.5&ndash;2.3',
-    '&dollar;1.5-&dollar;2.0',
-    '&dollar;1.5-million',
-    '&dollar;1.51/&pound;1',
-    '&dollar;1.525',
-    '&dollar;1.54m',
-    '&dollar;1.55m',
-    '&dollar;1.57/word',
-    '&dollar;1.5715',
-    '&dollar;1.5775',
-    '&dollar;1.57m',
-    '&dollar;1.5billion',
-    '&dollar;1.6020',
     '&dollar;1.6045',
-    '&dollar;1.6050',
-    '&dollar;1.6080',
-    '&dollar;1.6130',
-    '&dollar;1.625',
-    '&dollar;1.640',
-    '&dollar;1.65m',
-    '&dollar;1.66',
-    '&dollar;1.675m',
-    '&dollar;1.68/&pound',
-    '&dollar;1.69',
-    '&dollar;1.7&ndash;2.55',
-    '&dollar;1.7145',
-    '&dollar;1.71one',
-    '&dollar;1.7215',
-    '&dollar;1.7263',
     '&dollar;1.74/&pound',
-    '&dollar;1.7420',
-    '&dollar;1.75&ndash;2',
-    '&dollar;1.75&ndash;2.25',
-    '&dollar;1.75&ndash;2.65m',
-    '&dollar;1.7724',
-    '&dollar;1.7billion',
-    '&dollar;1.7bn',
-    '&dollar;1.8&ndash;2.2',
-    '&dollar;1.8&ndash;2.8',
-    '&dollar;1.86.',
-    '&dollar;1.87/&pound;1',
-    '&dollar;1.88m',
-    '&dollar;1.95m',
-    '&dollar;1/2m.',
-    '&dollar;10&frac12',
     '&dollar;10&ndash;14,000',
-    '&dollar;10&ndash;15,000',
-    '&dollar;10,000&ndash;100,000',
-    '&dollar;10,000&ndash;12,000',
-    '&dollar;10,000-&dollar;20,000',
-    '&dollar;10,000-70,000',
-    '&dollar;10,000.',
-    '&dollar;10,215',
-    '&dollar;10,223',
-    '&dollar;10,290',
-    '&dollar;10,307m',
-    '&dollar;10,337',
-    '&dollar;10,400',
-    '&dollar;10,420',
-    '&dollar;10,457m',
-    '&dollar;10,550m',
     '&dollar;10,737',
-    '&dollar;10,750m',
-    '&dollar;10,800',
-    '&dollar;10,822',
-    '&dollar;10,890',
-    '&dollar;10,900',
-    '&dollar;10,919',
-    '&dollar;10,926.4',
-    '&dollar;10,950',
-    '&dollar;10-&dollar;15',
-    '&dollar;10-an-hour',
-    '&dollar;10.000',
-    '&dollar;10.18',
-    '&dollar;10.2',
-    '&dollar;10.3',
-    '&dollar;10.53',
     '&dollar;10.56',
-    '&dollar;10.6',
-    '&dollar;10.65',
-    '&dollar;10.75m',
-    '&dollar;10.9',
-    '&dollar;10/lb',
-    '&dollar;100&ndash;150',
-    '&dollar;100&ndash;160,000',
-    '&dollar;100&ndash;175,000',
-    '&dollar;100&ndash;200,000',
-    '&dollar;100,00',
-    '&dollar;100,000&ndash;125,000',
-    '&dollar;100,000&ndash;250,000',
-    '&dollar;100,000m',
-    '&dollar;100,378',
-    '&dollar;100,900',
     '&dollar;100-&pound;300',
-    '&dollar;100-an-hour',
-    '&dollar;100.2bn',
-    '&dollar;100.5m',
-    '&dollar;100.6m',
-    '&dollar;100.9',
-    '&dollar;1000&ndash;2000',
-    '&dollar;1000/m3',
-    '&dollar;100000',
-    '&dollar;1000m',
-    '&dollar;100bil',
-    '&dollar;100billion',
-    '&dollar;100m-&dollar;150m-a-year',
-    '&dollar;100m.',
-    '&dollar;101',
-    '&dollar;101,000',
     '&dollar;101,000,000',
-    '&dollar;101,100,000',
-    '&dollar;101,190',
-    '&dollar;101,500&ndash;121,850',
-    '&dollar;101,900',
-    '&dollar;101.305%',
-    '&dollar;101.375',
-    '&dollar;101.6m',
-    '&dollar;101.78%',
-    '&dollar;101.7m',
-    '&dollar;1012232',
-    '&dollar;101m',
-    '&dollar;102,000&ndash;120,000',
-    '&dollar;102,000,000',
-    '&dollar;102,500',
-    '&dollar;102.2m',
     '&dollar;102.4m',
-    '&dollar;102.5m',
-    '&dollar;103,000',
-    '&dollar;103.34%',
-    '&dollar;103million',
-    '&dollar;104,040',
-    '&dollar;104,800',
-    '&dollar;104.4m',
-    '&dollar;104.6m',
-    '&dollar;105,500',
-    '&dollar;105.2m',
-    '&dollar;105.3m',
-    '&dollar;105.5m',
-    '&dollar;105.7m',
-    '&dollar;106',
-    '&dollar;106,000',
     '&dollar;106,500',
-    '&dollar;106.2m',
-    '&dollar;106.3m',
-    '&dollar;107,000m',
-    '&dollar;107.3m',
-    '&dollar;107.8m',
-    '&dollar;107.9m',
-    '&dollar;108,600',
-    '&dollar;108,800&ndash;136,000',
-    '&dollar;108,908',
-    '&dollar;108.3m',
-    '&dollar;108.5m',
-    '&dollar;108.8m',
-    '&dollar;108bn',
-    '&dollar;109',
-    '&dollar;109,000&ndash;146,000',
     '&dollar;109,390',
-    '&dollar;109.2m',
-    '&dollar;109.4',
-    '&dollar;109.6',
-    '&dollar;109.7m',
-    '&dollar;1097m',
-    '&dollar;1099.00',
-    '&dollar;10m-&dollar;14m',
-    '&dollar;10m-&dollar;20m',
-    '&dollar;11&ndash;14,000',
-    '&dollar;11,020.0',
-    '&dollar;11,100&ndash;14,800',
-    '&dollar;11,375',
-    '&dollar;11,400',
-    '&dollar;11,500m',
-    '&dollar;11,700',
     '&dollar;11,771',
-    '&dollar;11.0',
-    '&dollar;11.09',
-    '&dollar;11.39',
-    '&dollar;11.3m',
-    '&dollar;11.50',
-    '&dollar;11.6',
-    '&dollar;11.65',
-    '&dollar;11.7',
-    '&dollar;11.875',
-    '&dollar;11.88',
-    '&dollar;11.95',
-    '&dollar;11.99',
-    '&dollar;110&ndash;150,000',
-    '&dollar;110,000,000',
-    '&dollar;110,000m',
     '&dollar;110,573',
-    '&dollar;110-150,000',
-    '&dollar;110-a-share',
-    '&dollar;110.4m',
-    '&dollar;110.5m',
-    '&dollar;110.9m',
-    '&dollar;1100',
-    '&dollar;110billion',
-    '&dollar;111',
-    '&dollar;111,000&ndash;148,000',
-    '&dollar;111,000,000',
-    '&dollar;111.9m',
-    '&dollar;112,000',
-    '&dollar;112,600',
-    '&dollar;112.2m',
-    '&dollar;112.9m',
     '&dollar;113,00',
-    '&dollar;113,000',
-    '&dollar;113,150',
-    '&dollar;113.3m',
-    '&dollar;113.9m',
-    '&dollar;1130',
-    '&dollar;113m',
-    '&dollar;114,500',
-    '&dollar;114,900',
-    '&dollar;114.4m',
-    '&dollar;114.6m',
-    '&dollar;1142',
-    '&dollar;1148.00',
-    '&dollar;114m',
-    '&dollar;115,000,000',
-    '&dollar;115,200',
     '&dollar;115.6m',
-    '&dollar;115.75',
-    '&dollar;115.9m',
-    '&dollar;116,600',
-    '&dollar;116.4m',
-    '&dollar;116.75',
-    '&dollar;117,000',
-    '&dollar;117,500',
-    '&dollar;117,825',
-    '&dollar;117.1m',
-    '&dollar;117.8bn',
-    '&dollar;118,087',
-    '&dollar;118.2m',
-    '&dollar;118.6m',
-    '&dollar;119,000',
-    '&dollar;119,630',
     '&dollar;119m',
-    '&dollar;11billion',
-    '&dollar;11bn',
-    '&dollar;11million',
-    '&dollar;12&ndash;18,000',
-    '&dollar;12&ndash;50',
-    '&dollar;12,000-&dollar;15,000',
-    '&dollar;12,100,000',
-    '&dollar;12,200',
-    '&dollar;12,230',
-    '&dollar;12,365',
-    '&dollar;12,400',
-    '&dollar;12,495',
-    '&dollar;12,500&ndash;18,000',
-    '&dollar;12,600',
-    '&dollar;12,675',
     '&dollar;12,750',
-    '&dollar;12,800',
-    '&dollar;12,863',
-    '&dollar;12,900',
-    '&dollar;12.00',
-    '&dollar;12.0m',
-    '&dollar;12.2',
-    '&dollar;12.3',
-    '&dollar;12.30',
-    '&dollar;12.4',
-    '&dollar;12.40',
-    '&dollar;12.7',
-    '&dollar;120&ndash;180,000',
-    '&dollar;120,000&ndash;140,000',
-    '&dollar;120,000&ndash;150,000',
-    '&dollar;120.2',
     '&dollar;120.3m',
-    '&dollar;120.5m',
-    '&dollar;120.9m',
-    '&dollar;1200',
-    '&dollar;12000',
-    '&dollar;1200m',
-    '&dollar;121,100',
-    '&dollar;121,850&ndash;162,500',
-    '&dollar;121.7m',
-    '&dollar;121.8m',
-    '&dollar;1215m',
-    '&dollar;121m',
-    '&dollar;122.6m',
-    '&dollar;123',
-    '&dollar;123,000,000',
-    '&dollar;123,600,000',
     '&dollar;123.6bn',
-    '&dollar;124',
-    '&dollar;124,100',
-    '&dollar;124,400',
-    '&dollar;124.6m',
-    '&dollar;124.9m',
-    '&dollar;124m',
-    '&dollar;125&ndash;180,000',
-    '&dollar;125,100',
-    '&dollar;125.00',
-    '&dollar;12500-&dollar;17500',
-    '&dollar;125m-a-time',
-    '&dollar;126,500',
-    '&dollar;126,600',
-    '&dollar;126.7',
-    '&dollar;126m',
     '&dollar;127',
-    '&dollar;127,000',
-    '&dollar;127,000,000',
-    '&dollar;127.8m',
-    '&dollar;128.1m',
-    '&dollar;128m',
-    '&dollar;128m-worth',
-    '&dollar;129,000',
-    '&dollar;129,200',
-    '&dollar;129.7m',
-    '&dollar;129.8m',
-    '&dollar;129m',
-    '&dollar;13,000,000',
-    '&dollar;13,0000',
-    '&dollar;13,058m',
-    '&dollar;13,100',
     '&dollar;13,200m',
-    '&dollar;13,243',
-    '&dollar;13,257,970',
-    '&dollar;13,385',
-    '&dollar;13,390',
-    '&dollar;13,393m',
-    '&dollar;13,400',
-    '&dollar;13,500,000',
-    '&dollar;13,500m',
-    '&dollar;13,513',
-    '&dollar;13,580&ndash;17,450',
-    '&dollar;13,600',
-    '&dollar;13,750',
-    '&dollar;13,750,000',
-    '&dollar;13,800,000',
-    '&dollar;13,850,000',
     '&dollar;13,931m',
-    '&dollar;13,974',
-    '&dollar;13.00',
-    '&dollar;13.05',
-    '&dollar;13.0m',
-    '&dollar;13.1',
-    '&dollar;13.3',
-    '&dollar;13.4m',
-    '&dollar;13.50',
-    '&dollar;13.75',
-    '&dollar;13.8',
-    '&dollar;130&ndash;150,000',
-    '&dollar;130&ndash;160,000',
-    '&dollar;130,260',
-    '&dollar;130-million',
-    '&dollar;130.6m',
     '&dollar;1300m',
-    '&dollar;130billion',
-    '&dollar;131,200',
-    '&dollar;131,400',
-    '&dollar;131m',
-    '&dollar;132',
-    '&dollar;132,400',
-    '&dollar;132,480',
-    '&dollar;132.8',
-    '&dollar;133.6m',
-    '&dollar;133m',
-    '&dollar;134,000,000',
-    '&dollar;134.0m',
-    '&dollar;134.5m',
-    '&dollar;134billion',
-    '&dollar;134m',
     '&dollar;135,600',
-    '&dollar;135.1',
-    '&dollar;135.6m',
-    '&dollar;135.7m',
-    '&dollar;136,088',
-    '&dollar;136,551',
-    '&dollar;136,866',
-    '&dollar;136.6m',
-    '&dollar;136.9m',
-    '&dollar;136bn',
-    '&dollar;136m',
-    '&dollar;137,000',
-    '&dollar;137,200',
-    '&dollar;137.1',
-    '&dollar;137m',
-    '&dollar;138,101',
     '&dollar;138,480',
-    '&dollar;138.1m',
-    '&dollar;138.8',
-    '&dollar;139,500',
-    '&dollar;139.2',
-    '&dollar;139.4m',
-    '&dollar;139.8m',
-    '&dollar;13bn',
-    '&dollar;13million',
-    '&dollar;14&ndash;15m',
-    '&dollar;14,065',
-    '&dollar;14,100',
-    '&dollar;14,200',
-    '&dollar;14,231',
-    '&dollar;14,330',
-    '&dollar;14,500,000',
     '&dollar;14,500m',
-    '&dollar;14,580',
-    '&dollar;14,650',
-    '&dollar;14,838',
-    '&dollar;14.1b',
-    '&dollar;14.3bn',
-    '&dollar;14.5',
-    '&dollar;14.8million',
-    '&dollar;14.99',
-    '&dollar;140&ndash;175,000',
-    '&dollar;140&ndash;180,000',
-    '&dollar;140,000&ndash;180,000',
-    '&dollar;140,000&ndash;195,000',
-    '&dollar;140,830,531',
-    '&dollar;140.6m',
-    '&dollar;14000',
     '&dollar;1403m',
-    '&dollar;141.1m',
-    '&dollar;141.2m',
-    '&dollar;141.6m',
-    '&dollar;141.7m',
-    '&dollar;141m',
-    '&dollar;142,000',
-    '&dollar;142,000,000',
-    '&dollar;142,100&ndash;162,500',
-    '&dollar;142,500',
-    '&dollar;142,800',
-    '&dollar;142.6m',
-    '&dollar;142.8',
-    '&dollar;143.3',
-    '&dollar;143.6',
-    '&dollar;144',
     '&dollar;144,000,000',
-    '&dollar;144.4',
-    '&dollar;144bn',
-    '&dollar;144m',
-    '&dollar;145,165',
-    '&dollar;145-150',
-    '&dollar;145.0m',
-    '&dollar;145.8m',
-    '&dollar;146',
-    '&dollar;146,800',
-    '&dollar;146.4m',
-    '&dollar;146m',
-    '&dollar;147',
-    '&dollar;147,200',
-    '&dollar;147,940',
-    '&dollar;147.6m',
     '&dollar;147m',
-    '&dollar;148,000&ndash;186,000',
-    '&dollar;148,135',
-    '&dollar;148.6m',
-    '&dollar;148.8',
-    '&dollar;148m',
-    '&dollar;149,000',
-    '&dollar;149.2m',
-    '&dollar;149.3m',
-    '&dollar;149m',
-    '&dollar;14m-a-year',
-    '&dollar;15&ndash;20',
-    '&dollar;15,000&ndash;25,000',
-    '&dollar;15,000-32,000',
-    '&dollar;15,196',
-    '&dollar;15,200',
     '&dollar;15,300',
-    '&dollar;15,390',
-    '&dollar;15,400',
-    '&dollar;15,480',
-    '&dollar;15,500',
-    '&dollar;15,500&ndash;20,700',
-    '&dollar;15,800',
-    '&dollar;15,972',
-    '&dollar;15,990',
-    '&dollar;15-&dollar;5',
-    '&dollar;15.',
-    '&dollar;15.05',
-    '&dollar;15.28m',
-    '&dollar;15.2m',
-    '&dollar;15.4',
-    '&dollar;15.80',
     '&dollar;15.9',
-    '&dollar;15.95',
-    '&dollar;150&ndash;250,000',
-    '&dollar;150,000-plus',
-    '&dollar;150-&dollar;2,400',
-    '&dollar;150-200',
-    '&dollar;150-million',
-    '&dollar;150.',
-    '&dollar;150.2m',
-    '&dollar;150.3m',
-    '&dollar;150.9m',
-    '&dollar;1500m',
-    '&dollar;150bn',
-    '&dollar;150m-200m',
-    '&dollar;150million',
-    '&dollar;151,000,000',
     '&dollar;151,515',
-    '&dollar;151.0m',
-    '&dollar;151.4m',
-    '&dollar;151m',
-    '&dollar;151m-worth',
-    '&dollar;152',
-    '&dollar;152,400&ndash;190,500',
-    '&dollar;152.7m',
-    '&dollar;153',
-    '&dollar;153,000',
-    '&dollar;153,000&ndash;220,500',
-    '&dollar;153,000&ndash;229,500',
-    '&dollar;153,600',
-    '&dollar;153.1',
-    '&dollar;153.4m',
-    '&dollar;153.8m',
     '&dollar;1530m',
-    '&dollar;153m',
-    '&dollar;154,170',
-    '&dollar;154,255',
-    '&dollar;154.6m',
-    '&dollar;154.7m',
-    '&dollar;155',
-    '&dollar;155,000,000',
-    '&dollar;155,375',
-    '&dollar;155,600',
-    '&dollar;155.1bn',
-    '&dollar;155.2m',
-    '&dollar;155.3m',
-    '&dollar;15500',
-    '&dollar;156,600&ndash;175,800',
-    '&dollar;156.2m',
     '&dollar;156.5m',
-    '&dollar;157,000',
-    '&dollar;157.5m',
-    '&dollar;157.6m',
-    '&dollar;157.7m',
-    '&dollar;158',
-    '&dollar;158,000',
-    '&dollar;158,000&ndash;223,000',
-    '&dollar;158,800',
-    '&dollar;158,800,000',
-    '&dollar;158.6m',
-    '&dollar;158.7m',
-    '&dollar;159',
-    '&dollar;159.7m',
-    '&dollar;159.8m',
-    '&dollar;15billion',
     '&dollar;15bn',
-    '&dollar;15m.',
-    '&dollar;15million',
-    '&dollar;16,000,000',
-    '&dollar;16,000m',
-    '&dollar;16,000m-plus',
-    '&dollar;16,050',
-    '&dollar;16,070',
-    '&dollar;16,400',
-    '&dollar;16,400m',
-    '&dollar;16,410m',
-    '&dollar;16,480m',
-    '&dollar;16,500,000',
-    '&dollar;16,500m',
-    '&dollar;16,600',
-    '&dollar;16,800',
     '&dollar;16,865',
-    '&dollar;16,977',
-    '&dollar;16.03',
-    '&dollar;16.0m',
-    '&dollar;16.1',
-    '&dollar;16.18',
-    '&dollar;16.25',
-    '&dollar;16.2bn',
-    '&dollar;16.3bn',
-    '&dollar;16.4m',
-    '&dollar;16.5m',
-    '&dollar;16.60',
-    '&dollar;160,000,000',
-    '&dollar;160,000m',
-    '&dollar;160.5m',
-    '&dollar;1600',
     '&dollar;160bil',
-    '&dollar;161,812',
-    '&dollar;161.4bn',
-    '&dollar;161.4m',
-    '&dollar;161.9m',
-    '&dollar;162,700',
-    '&dollar;162.7m',
-    '&dollar;162.9m',
-    '&dollar;162m',
-    '&dollar;163',
-    '&dollar;163,000',
-    '&dollar;163,305',
-    '&dollar;163,600,000',
-    '&dollar;163.4m',
-    '&dollar;163m',
-    '&dollar;164',
     '&dollar;164.5m',
-    '&dollar;164.8m',
-    '&dollar;1643m',
-    '&dollar;164billion',
-    '&dollar;165,000,000-worth',
-    '&dollar;165.8m',
-    '&dollar;165bn',
-    '&dollar;166,000',
-    '&dollar;166,300',
-    '&dollar;166,400',
-    '&dollar;166,500&ndash;245,000',
-    '&dollar;166.3m',
-    '&dollar;167,000',
-    '&dollar;167,000,000',
-    '&dollar;167,400',
-    '&dollar;167m',
     '&dollar;168,000,000',
-    '&dollar;168,793-a-year',
-    '&dollar;168,800',
-    '&dollar;168.1m',
-    '&dollar;168.9m',
-    '&dollar;168m',
-    '&dollar;169',
-    '&dollar;169,531',
-    '&dollar;169.2m',
-    '&dollar;16m-a-year',
-    '&dollar;16m.',
-    '&dollar;16million',
-    '&dollar;17&ndash;34,000',
-    '&dollar;17,000,000',
-    '&dollar;17,052',
-    '&dollar;17,200,000',
     '&dollar;17,200m',
-    '&dollar;17,300',
-    '&dollar;17,400',
-    '&dollar;17,500&ndash;26,000',
-    '&dollar;17,500m',
-    '&dollar;17,587',
-    '&dollar;17,600m',
-    '&dollar;17.1',
-    '&dollar;17.12',
-    '&dollar;17.125',
-    '&dollar;17.14m',
-    '&dollar;17.2m',
-    '&dollar;17.30',
-    '&dollar;17.40',
-    '&dollar;17.41',
-    '&dollar;17.5b',
     '&dollar;17.6',
-    '&dollar;17.6&ndash;23.3',
-    '&dollar;17.60',
-    '&dollar;17.65',
-    '&dollar;17.7',
-    '&dollar;17.70',
-    '&dollar;17.75',
-    '&dollar;17.81',
-    '&dollar;17.93',
-    '&dollar;17.97',
-    '&dollar;17.9bn',
-    '&dollar;170&ndash;205,000',
-    '&dollar;170,000&ndash;255,000',
-    '&dollar;17000/year',
-    '&dollar;171',
-    '&dollar;171,859',
     '&dollar;171.1m',
-    '&dollar;171.4m',
-    '&dollar;172,000,000',
-    '&dollar;172,500',
-    '&dollar;172.4m',
-    '&dollar;172.5',
-    '&dollar;172.6',
-    '&dollar;172.7m',
-    '&dollar;173,000',
-    '&dollar;173,650',
-    '&dollar;173.1m',
-    '&dollar;174',
-    '&dollar;174,505',
-    '&dollar;174.4',
-    '&dollar;174.5m',
-    '&dollar;174m',
     '&dollar;175,462',
-    '&dollar;175,624',
-    '&dollar;175.2m',
-    '&dollar;175.9',
-    '&dollar;176,586',
-    '&dollar;176,816',
-    '&dollar;176.1m',
-    '&dollar;176.4m',
-    '&dollar;176m',
-    '&dollar;177',
-    '&dollar;177,600',
-    '&dollar;1773m',
-    '&dollar;177m',
-    '&dollar;178',
-    '&dollar;178,000',
-    '&dollar;178,000,000',
     '&dollar;178,400,000',
-    '&dollar;178.5m',
-    '&dollar;1785.3m',
-    '&dollar;179',
-    '&dollar;179,200',
-    '&dollar;179,400,000',
-    '&dollar;179,800',
-    '&dollar;179.1m',
-    '&dollar;179.95',
-    '&dollar;179bn',
-    '&dollar;17billion',
-    '&dollar;17bn',
-    '&dollar;18&ndash;23.00',
-    '&dollar;18&ndash;25,000',
-    '&dollar;18,211,061',
-    '&dollar;18,265',
     '&dollar;18,400',
-    '&dollar;18,480',
-    '&dollar;18,500m',
-    '&dollar;18,800,000',
-    '&dollar;18,800m',
-    '&dollar;18,970',
-    '&dollar;18.00',
-    '&dollar;18.0m',
-    '&dollar;18.15',
-    '&dollar;18.2',
-    '&dollar;18.5',
-    '&dollar;18.50',
-    '&dollar;18.80',
-    '&dollar;18.84',
-    '&dollar;18.9',
-    '&dollar;18.91',
     '&dollar;180&ndash;265,000',
-    '&dollar;180,000,000',
-    '&dollar;180s',
-    '&dollar;181',
-    '&dollar;181,200',
-    '&dollar;181,331',
-    '&dollar;182',
-    '&dollar;182,000',
-    '&dollar;182,400',
-    '&dollar;182m',
-    '&dollar;183',
-    '&dollar;183,700',
-    '&dollar;183.7m',
-    '&dollar;184.1m',
-    '&dollar;185,000&ndash;279,000',
-    '&dollar;185.0m',
     '&dollar;1850.2m',
-    '&dollar;185m-a-year',
-    '&dollar;186&ndash&dollar;1240',
-    '&dollar;186.0m',
-    '&dollar;187',
-    '&dollar;187,000',
-    '&dollar;187,0000',
-    '&dollar;187,012',
-    '&dollar;187,500',
-    '&dollar;187m',
-    '&dollar;188',
-    '&dollar;188.1m',
-    '&dollar;188.2',
-    '&dollar;189,000',
-    '&dollar;189.3m',
-    '&dollar;189000',
     '&dollar;189m',
-    '&dollar;18billion',
-    '&dollar;19&ndash;22,000',
-    '&dollar;19&ndash;95',
-    '&dollar;19,000m',
-    '&dollar;19,100',
-    '&dollar;19,240',
-    '&dollar;19,400m',
-    '&dollar;19,700',
-    '&dollar;19.1',
-    '&dollar;19.11',
-    '&dollar;19.125',
-    '&dollar;19.25',
-    '&dollar;19.27',
-    '&dollar;19.40',
-    '&dollar;19.45',
     '&dollar;19.4m',
-    '&dollar;19.5',
-    '&dollar;19.50',
-    '&dollar;19.58',
-    '&dollar;19.60',
-    '&dollar;190,000,000',
-    '&dollar;190.4',
-    '&dollar;190.4m',
-    '&dollar;190.7',
-    '&dollar;1906m',
-    '&dollar;192',
-    '&dollar;192m',
-    '&dollar;193,000&ndash;236,000',
-    '&dollar;193.1m',
-    '&dollar;193m',
-    '&dollar;193million',
     '&dollar;195,000&ndash;223,000',
-    '&dollar;196,000',
-    '&dollar;196,200',
-    '&dollar;196,512m',
-    '&dollar;198,000,000',
-    '&dollar;198.2m',
-    '&dollar;198m',
-    '&dollar;19bn',
-    '&dollar;1b',
-    '&dollar;1bil',
-    '&dollar;1m&ndash;7m',
-    '&dollar;1m+',
-    '&dollar;1m-3m',
-    '&dollar;1m-5m',
-    '&dollar;1m-7m',
-    '&dollar;2&ndash;2.5',
     '&dollar;2&ndash;8',
-    '&dollar;2,000&ndash;2,400',
-    '&dollar;2,000-&dollar;2,5000',
-    '&dollar;2,000.',
-    '&dollar;2,000m-a-year',
-    '&dollar;2,004,433',
-    '&dollar;2,011m',
-    '&dollar;2,014m',
-    '&dollar;2,016.7m',
-    '&dollar;2,023.5m',
-    '&dollar;2,024,000',
-    '&dollar;2,029m',
-    '&dollar;2,048m',
-    '&dollar;2,060',
-    '&dollar;2,065m',
-    '&dollar;2,069,100',
     '&dollar;2,070',
-    '&dollar;2,070,479',
-    '&dollar;2,073.2m',
-    '&dollar;2,080',
-    '&dollar;2,098',
-    '&dollar;2,107.0m',
-    '&dollar;2,112',
-    '&dollar;2,121',
-    '&dollar;2,125',
-    '&dollar;2,127.2m',
-    '&dollar;2,133',
-    '&dollar;2,160',
-    '&dollar;2,166',
-    '&dollar;2,166m',
-    '&dollar;2,194m',
-    '&dollar;2,200,000',
     '&dollar;2,200m',
-    '&dollar;2,204m',
-    '&dollar;2,213',
-    '&dollar;2,215',
-    '&dollar;2,227.50',
-    '&dollar;2,228.4m',
-    '&dollar;2,238.7m',
-    '&dollar;2,240.6m',
-    '&dollar;2,256m',
-    '&dollar;2,268.8m',
-    '&dollar;2,268m',
-    '&dollar;2,273m',
-    '&dollar;2,280m',
-    '&dollar;2,306,000',
-    '&dollar;2,315',
-    '&dollar;2,320',
     '&dollar;2,355',
-    '&dollar;2,360',
-    '&dollar;2,390',
-    '&dollar;2,391,354',
-    '&dollar;2,400,000',
-    '&dollar;2,421',
-    '&dollar;2,435m',
-    '&dollar;2,441m',
-    '&dollar;2,446',
-    '&dollar;2,448m',
-    '&dollar;2,457,758',
-    '&dollar;2,457.8m',
-    '&dollar;2,479.8m',
-    '&dollar;2,480',
-    '&dollar;2,490',
-    '&dollar;2,525m',
     '&dollar;2,532',
-    '&dollar;2,540',
-    '&dollar;2,540m',
-    '&dollar;2,567',
-    '&dollar;2,570m',
-    '&dollar;2,600,000',
-    '&dollar;2,616m',
-    '&dollar;2,617m',
-    '&dollar;2,622,352',
-    '&dollar;2,626.5m',
-    '&dollar;2,629m',
-    '&dollar;2,630',
-    '&dollar;2,640',
-    '&dollar;2,660',
-    '&dollar;2,694m',
-    '&dollar;2,700m',
     '&dollar;2,714m',
-    '&dollar;2,728m',
-    '&dollar;2,730',
-    '&dollar;2,750m',
-    '&dollar;2,778m',
-    '&dollar;2,780m',
-    '&dollar;2,785',
-    '&dollar;2,786',
-    '&dollar;2,790m',
-    '&dollar;2,795.5m',
-    '&dollar;2,795m',
-    '&dollar;2,796.5m',
-    '&dollar;2,800&ndash;38,300',
-    '&dollar;2,800m',
-    '&dollar;2,801m',
-    '&dollar;2,810m',
     '&dollar;2,817',
-    '&dollar;2,827m',
-    '&dollar;2,850',
-    '&dollar;2,890',
-    '&dollar;2,900,000',
-    '&dollar;2-2.5',
-    '&dollar;2-3',
-    '&dollar;2-million-a-year',
-    '&dollar;2.',
-    '&dollar;2.0',
-    '&dollar;2.00/bbl',
-    '&dollar;2.08m',
-    '&dollar;2.15-&dollar;2.45/bbl',
-    '&dollar;2.15m',
-    '&dollar;2.1630',
-    '&dollar;2.1bn',
     '&dollar;2.2&ndash;2.8',
-    '&dollar;2.2.3.1.2',
-    '&dollar;2.2.3.1.3',
-    '&dollar;2.2.4.1',
-    '&dollar;2.20',
-    '&dollar;2.21',
-    '&dollar;2.22',
-    '&dollar;2.23',
-    '&dollar;2.25&ndash;3',
-    '&dollar;2.26',
-    '&dollar;2.26m',
-    '&dollar;2.28',
-    '&dollar;2.2bn',
-    '&dollar;2.30',
-    '&dollar;2.31',
-    '&dollar;2.32',
     '&dollar;2.42',
-    '&dollar;2.45',
-    '&dollar;2.46',
-    '&dollar;2.48',
-    '&dollar;2.4billion',
-    '&dollar;2.5&ndash;4.5',
-    '&dollar;2.50-3.00',
-    '&dollar;2.50.',
-    '&dollar;2.58',
-    '&dollar;2.58bn',
-    '&dollar;2.5b',
-    '&dollar;2.62m',
-    '&dollar;2.63',
-    '&dollar;2.65',
-    '&dollar;2.7&ndash;3.6',
-    '&dollar;2.71',
     '&dollar;2.74',
-    '&dollar;2.75m',
-    '&dollar;2.75million',
-    '&dollar;2.8&ndash;3.2',
-    '&dollar;2.8&ndash;3.5',
-    '&dollar;2.82',
-    '&dollar;2.83',
-    '&dollar;2.84',
-    '&dollar;2.86',
-    '&dollar;2.88',
-    '&dollar;2.95',
-    '&dollar;2.96bn',
-    '&dollar;2.99bn',
-    '&dollar;20&ndash;26,000',
-    '&dollar;20&ndash;27,000',
-    '&dollar;20&ndash;40',
     '&dollar;20,000&ndash;25,000',
-    '&dollar;20,000.',
-    '&dollar;20,200,000',
-    '&dollar;20,235',
-    '&dollar;20,250',
-    '&dollar;20,254',
-    '&dollar;20,600m',
-    '&dollar;20,800m',
-    '&dollar;20,900',
-    '&dollar;20-&dollar;30,000',
-    '&dollar;20-30',
-    '&dollar;20-billion',
-    '&dollar;20.00',
-    '&dollar;20.1',
-    '&dollar;20.125',
-    '&dollar;20.1m',
     '&dollar;20.22',
-    '&dollar;20.24',
-    '&dollar;20.25',
-    '&dollar;20.4m',
-    '&dollar;20.7',
-    '&dollar;20.7m',
-    '&dollar;20.8',
-    '&dollar;20.8b',
-    '&dollar;20.8million',
-    '&dollar;200&ndash;265,000',
-    '&dollar;200,714',
-    '&dollar;200-million',
-    '&dollar;200.00',
-    '&dollar;200.9m',
-    '&dollar;200bn',
-    '&dollar;200m-plus',
     '&dollar;200million',
-    '&dollar;201.3m',
-    '&dollar;202,000',
-    '&dollar;202,396',
-    '&dollar;202,500',
-    '&dollar;202.6m',
-    '&dollar;203.4m',
-    '&dollar;203m',
-    '&dollar;204',
-    '&dollar;204,357',
-    '&dollar;204,600',
-    '&dollar;204,800',
-    '&dollar;204.0m',
-    '&dollar;204.2m',
-    '&dollar;204m',
-    '&dollar;205',
     '&dollar;205,000',
-    '&dollar;205,000&ndash;244,800',
-    '&dollar;205m',
-    '&dollar;206',
-    '&dollar;206.1m',
-    '&dollar;206.6',
-    '&dollar;207,000',
-    '&dollar;208',
-    '&dollar;208m',
-    '&dollar;20bil',
-    '&dollar;20bn',
-    '&dollar;20m-&dollar;30m',
-    '&dollar;20m-a-year',
-    '&dollar;20m-worth',
-    '&dollar;20m.',
-    '&dollar;20million',
     '&dollar;21&frac12',
-    '&dollar;21&ndash;32,000',
-    '&dollar;21,000m',
-    '&dollar;21,200',
-    '&dollar;21,485,000',
-    '&dollar;21,600m',
-    '&dollar;21,700',
-    '&dollar;21.1m',
-    '&dollar;21.26',
-    '&dollar;21.2m',
-    '&dollar;21.4',
-    '&dollar;21.58',
-    '&dollar;21.6',
-    '&dollar;21.65',
-    '&dollar;21.8',
-    '&dollar;21.95',
     '&dollar;210',
-    '&dollar;210&ndash;270,000',
-    '&dollar;210&ndash;315,000',
-    '&dollar;210,000,000',
-    '&dollar;210.5m',
-    '&dollar;210.6',
-    '&dollar;2104.7m',
-    '&dollar;211',
-    '&dollar;211,000',
-    '&dollar;211m',
-    '&dollar;212',
-    '&dollar;212,710',
-    '&dollar;213,775',
-    '&dollar;213,800',
-    '&dollar;213.4m',
-    '&dollar;213m',
     '&dollar;214',
-    '&dollar;214,100',
-    '&dollar;214.5m',
-    '&dollar;214.6m',
-    '&dollar;215&ndash;265,000',
-    '&dollar;215&ndash;320,000',
-    '&dollar;215,250',
-    '&dollar;215,778',
-    '&dollar;215.1m',
-    '&dollar;216',
-    '&dollar;216,000',
-    '&dollar;216,000,000',
-    '&dollar;216,300',
-    '&dollar;216.3m',
-    '&dollar;2160m',
-    '&dollar;217,000',
     '&dollar;217m',
-    '&dollar;218,000',
-    '&dollar;218.8m',
-    '&dollar;219,000',
-    '&dollar;219.3m',
-    '&dollar;21m-worth',
-    '&dollar;22&ndash;26,000',
-    '&dollar;22&ndash;32,000',
-    '&dollar;22&ndash;35,000',
-    '&dollar;22,000,000',
-    '&dollar;22,200',
-    '&dollar;22,300',
-    '&dollar;22,400m',
-    '&dollar;22,500',
-    '&dollar;22,500m',
-    '&dollar;22,700',
     '&dollar;22,775',
-    '&dollar;22,900&ndash;28,700',
-    '&dollar;22.0m',
-    '&dollar;22.125',
-    '&dollar;22.3m',
-    '&dollar;22.7m',
-    '&dollar;220&ndash;270,000',
-    '&dollar;220.2m',
-    '&dollar;220.3m',
-    '&dollar;220.863m',
-    '&dollar;220.9m',
-    '&dollar;22000',
-    '&dollar;221,000',
-    '&dollar;221m',
-    '&dollar;222',
-    '&dollar;222,000',
     '&dollar;222,000,000',
-    '&dollar;222,580,000',
-    '&dollar;223.4m',
-    '&dollar;224,000,000',
-    '&dollar;224,700',
-    '&dollar;224.4m',
-    '&dollar;224m',
-    '&dollar;225,000&ndash;300,000',
-    '&dollar;22500',
-    '&dollar;2252',
-    '&dollar;225million',
-    '&dollar;226',
-    '&dollar;226,000',
-    '&dollar;226.1m',
-    '&dollar;226.9m',
-    '&dollar;226m',
     '&dollar;227,000,000',
-    '&dollar;227,200',
-    '&dollar;227.0m',
-    '&dollar;227m',
-    '&dollar;228.6',
-    '&dollar;229,000&ndash;306,000',
-    '&dollar;229,446',
-    '&dollar;22billion',
-    '&dollar;22bn',
-    '&dollar;22m.',
-    '&dollar;23,000&ndash;38,250',
-    '&dollar;23,000,000',
-    '&dollar;23,000-25,000',
-    '&dollar;23,100,000',
-    '&dollar;23,125m',
-    '&dollar;23,333',
     '&dollar;23,400',
-    '&dollar;23,600m',
-    '&dollar;23.3m',
-    '&dollar;23.4',
-    '&dollar;23.5',
-    '&dollar;23.9',
-    '&dollar;230&ndash;280,000',
-    '&dollar;230&ndash;300,000',
-    '&dollar;230,314',
-    '&dollar;231.5m',
-    '&dollar;2310m',
-    '&dollar;232,000',
-    '&dollar;232,500',
-    '&dollar;233',
-    '&dollar;233,200',
-    '&dollar;234',
     '&dollar;235,000',
-    '&dollar;235.4m',
-    '&dollar;235m',
-    '&dollar;236.3m',
-    '&dollar;237,000',
-    '&dollar;237,900',
-    '&dollar;237.5m',
-    '&dollar;238.4m',
-    '&dollar;238.8m',
-    '&dollar;239.7m',
-    '&dollar;24,123,709',
-    '&dollar;24,165',
-    '&dollar;24,200,000',
-    '&dollar;24,300',
-    '&dollar;24,600',
-    '&dollar;24,690',
     '&dollar;24,746',
-    '&dollar;24,800,000',
-    '&dollar;24.1m',
-    '&dollar;24.3m',
-    '&dollar;24.7m',
-    '&dollar;241,000',
-    '&dollar;241,000,000',
-    '&dollar;241,158',
-    '&dollar;241.6m',
-    '&dollar;242,000',
-    '&dollar;242,640',
-    '&dollar;242.5m',
-    '&dollar;242m',
-    '&dollar;243',
-    '&dollar;243,000',
-    '&dollar;243,200',
     '&dollar;243,700',
-    '&dollar;243.0m',
-    '&dollar;243.6m',
-    '&dollar;243million',
-    '&dollar;244,000',
-    '&dollar;244,000,000',
-    '&dollar;244,703',
-    '&dollar;244.8m',
-    '&dollar;245,574',
-    '&dollar;245m',
-    '&dollar;246',
-    '&dollar;246.8m',
-    '&dollar;247,149',
-    '&dollar;247.5m',
-    '&dollar;247m',
-    '&dollar;248million',
     '&dollar;249m',
-    '&dollar;25&ndash;275,000',
-    '&dollar;25&ndash;30,000',
-    '&dollar;25&ndash;45,000',
-    '&dollar;25,000&ndash;35,000',
-    '&dollar;25,040',
-    '&dollar;25,100',
-    '&dollar;25,230',
-    '&dollar;25,300',
-    '&dollar;25,342',
-    '&dollar;25,400',
-    '&dollar;25,700',
-    '&dollar;25.00',
-    '&dollar;25.125',
-    '&dollar;25.1m',
-    '&dollar;25.2m',
     '&dollar;25.4m',
-    '&dollar;25.5',
-    '&dollar;25.50&ndash;27.50',
-    '&dollar;25.6m',
-    '&dollar;25.74',
-    '&dollar;25.95',
-    '&dollar;250,000&ndash;280,000',
-    '&dollar;250,069',
-    '&dollar;250,400',
-    '&dollar;250.1m',
-    '&dollar;250.5m',
-    '&dollar;2500',
-    '&dollar;250000',
-    '&dollar;251',
-    '&dollar;252,000',
-    '&dollar;252,000,000',
     '&dollar;253',
-    '&dollar;253,000',
-    '&dollar;255m',
-    '&dollar;256',
-    '&dollar;256,000m',
-    '&dollar;256.9m',
-    '&dollar;257',
-    '&dollar;259',
-    '&dollar;259&ndash;420',
-    '&dollar;259,000',
-    '&dollar;259,500',
-    '&dollar;259.7m',
-    '&dollar;259m',
-    '&dollar;25bil',
-    '&dollar;25m-40m',
-    '&dollar;25m-a-year',
     '&dollar;25m.',
-    '&dollar;26,000-plus',
-    '&dollar;26,000m',
-    '&dollar;26,400',
-    '&dollar;26,486',
-    '&dollar;26,600',
-    '&dollar;26,640m',
-    '&dollar;26,900',
-    '&dollar;26.25',
-    '&dollar;26.3m',
-    '&dollar;26.6bn',
-    '&dollar;26.7m',
-    '&dollar;26.8',
-    '&dollar;260&ndash;350,000',
-    '&dollar;260&ndash;435,000',
-    '&dollar;260-million',
     '&dollar;260.5m',
-    '&dollar;260.6m',
-    '&dollar;260bn',
-    '&dollar;261,000',
-    '&dollar;261.6m',
-    '&dollar;261m',
-    '&dollar;262',
-    '&dollar;262,000-worth',
-    '&dollar;262,500',
-    '&dollar;262,600,000',
-    '&dollar;263',
-    '&dollar;263,000',
-    '&dollar;264,000',
-    '&dollar;264.7m',
-    '&dollar;265&ndash;315,000',
-    '&dollar;265&ndash;340,000',
     '&dollar;265&ndash;354,000',
-    '&dollar;265,000,000',
-    '&dollar;265.5m',
-    '&dollar;266',
-    '&dollar;266,900',
-    '&dollar;266.1m',
-    '&dollar;266.2m',
-    '&dollar;266.6m',
-    '&dollar;268,000',
-    '&dollar;269',
-    '&dollar;269,000&ndash;307,700',
-    '&dollar;26bn',
-    '&dollar;27,100',
-    '&dollar;27,150',
-    '&dollar;27,300,000',
-    '&dollar;27,500',
     '&dollar;27,900',
-    '&dollar;27.1',
-    '&dollar;27.10',
-    '&dollar;27.1m',
-    '&dollar;27.2',
-    '&dollar;27.5',
-    '&dollar;27.50',
-    '&dollar;27.6m',
-    '&dollar;27.7',
-    '&dollar;27.70',
-    '&dollar;27.8',
-    '&dollar;27.97',
-    '&dollar;270.7m',
-    '&dollar;271,000',
-    '&dollar;271.2m',
-    '&dollar;272.2m',
     '&dollar;272m',
-    '&dollar;273,000,000',
-    '&dollar;273m',
-    '&dollar;274',
-    '&dollar;274,754',
-    '&dollar;274.7m',
-    '&dollar;274.9m',
-    '&dollar;274000',
-    '&dollar;274m',
-    '&dollar;275,000&ndash;306,000',
-    '&dollar;275,500',
-    '&dollar;276',
-    '&dollar;276,000,000',
-    '&dollar;276m',
-    '&dollar;2770m',
-    '&dollar;278',
     '&dollar;279',
-    '&dollar;279,000&ndash;371,000',
-    '&dollar;279.6m',
-    '&dollar;28,000/day',
-    '&dollar;28,044',
-    '&dollar;28,301',
-    '&dollar;28,500m',
-    '&dollar;28,570',
-    '&dollar;28,792',
-    '&dollar;28,800',
-    '&dollar;28,850',
-    '&dollar;28,989',
-    '&dollar;28-odd',
-    '&dollar;28.20',
-    '&dollar;28.35',
-    '&dollar;28.4m',
     '&dollar;28.50',
-    '&dollar;28.60',
-    '&dollar;28.65',
-    '&dollar;28.9',
-    '&dollar;28.9m',
-    '&dollar;280&ndash;320,000',
-    '&dollar;280.7m',
-    '&dollar;2800m',
-    '&dollar;280bil',
-    '&dollar;280m-&dollar;285m',
-    '&dollar;281',
-    '&dollar;281,600',
-    '&dollar;281m',
-    '&dollar;282,900',
-    '&dollar;282,978',
-    '&dollar;282m',
     '&dollar;283.6m',
-    '&dollar;2830m',
-    '&dollar;2837m',
-    '&dollar;285',
-    '&dollar;285,000n',
-    '&dollar;285,700',
-    '&dollar;286',
-    '&dollar;286,000',
-    '&dollar;286.3m',
-    '&dollar;287m',
-    '&dollar;288,300',
-    '&dollar;288.9m',
-    '&dollar;289,010',
-    '&dollar;289.7m',
-    '&dollar;28k',
-    '&dollar;29,100&ndash;48,500',
     '&dollar;29,356',
-    '&dollar;29,600',
-    '&dollar;29.0',
-    '&dollar;29.10',
-    '&dollar;29.4',
-    '&dollar;29.4bn',
-    '&dollar;29.5',
-    '&dollar;29.50',
-    '&dollar;29.75',
-    '&dollar;29.7m',
-    '&dollar;290,000,000',
-    '&dollar;290.5m',
-    '&dollar;2900',
-    '&dollar;291,000',
-    '&dollar;291.3m',
-    '&dollar;292',
     '&dollar;292,000',
-    '&dollar;292,361',
-    '&dollar;292m',
-    '&dollar;293.5m',
-    '&dollar;294',
-    '&dollar;294,110',
-    '&dollar;294.8m',
-    '&dollar;295.0m',
-    '&dollar;296',
-    '&dollar;297,000',
-    '&dollar;297.7m',
-    '&dollar;297m',
-    '&dollar;298,000',
-    '&dollar;298.4m',
-    '&dollar;299',
-    '&dollar;299,000',
     '&dollar;299,000,000',
-    '&dollar;299,700',
-    '&dollar;29bn',
-    '&dollar;2billions',
-    '&dollar;2bn-a-year',
-    '&dollar;2m&ndash&dollar;4m',
-    '&dollar;2million',
-    '&dollar;3&ndash;3.5',
-    '&dollar;3&ndash;4,000',
-    '&dollar;3&ndash;4.5',
-    '&dollar;3,000-per-licence',
-    '&dollar;3,000bn',
-    '&dollar;3,050',
-    '&dollar;3,050m',
-    '&dollar;3,060',
-    '&dollar;3,060m',
     '&dollar;3,074',
-    '&dollar;3,100m',
-    '&dollar;3,105',
-    '&dollar;3,120,000',
-    '&dollar;3,125m',
-    '&dollar;3,150',
-    '&dollar;3,163.3m',
-    '&dollar;3,190',
-    '&dollar;3,219m',
-    '&dollar;3,250',
-    '&dollar;3,260',
-    '&dollar;3,280',
-    '&dollar;3,298m',
-    '&dollar;3,320.2m',
-    '&dollar;3,320m',
-    '&dollar;3,325',
     '&dollar;3,335.4m',
-    '&dollar;3,345',
-    '&dollar;3,350&ndash;3,750',
-    '&dollar;3,355',
-    '&dollar;3,360',
-    '&dollar;3,370m',
-    '&dollar;3,375m',
-    '&dollar;3,390',
-    '&dollar;3,4000',
-    '&dollar;3,434.1m',
-    '&dollar;3,440',
-    '&dollar;3,454m',
-    '&dollar;3,476.93',
-    '&dollar;3,500,000',
-    '&dollar;3,510',
-    '&dollar;3,530.',
     '&dollar;3,530m',
-    '&dollar;3,555m',
-    '&dollar;3,560',
-    '&dollar;3,578.2m',
-    '&dollar;3,590',
-    '&dollar;3,590m',
-    '&dollar;3,600,000',
-    '&dollar;3,6000',
-    '&dollar;3,600m',
-    '&dollar;3,620m',
-    '&dollar;3,626m',
-    '&dollar;3,672m',
-    '&dollar;3,682,522',
-    '&dollar;3,700m',
-    '&dollar;3,715,000',
-    '&dollar;3,730m',
     '&dollar;3,760',
-    '&dollar;3,771',
-    '&dollar;3,831m',
-    '&dollar;3,840',
-    '&dollar;3,850',
-    '&dollar;3,899',
-    '&dollar;3,900&ndash;5,800',
-    '&dollar;3,900m',
-    '&dollar;3,905.8m',
-    '&dollar;3,941',
-    '&dollar;3,944,476',
-    '&dollar;3,975',
-    '&dollar;3,990',
-    '&dollar;3-&dollar;4',
-    '&dollar;3-&dollar;4bn',
-    '&dollar;3.1&ndash;8.8',
     '&dollar;3.15',
-    '&dollar;3.19',
-    '&dollar;3.2.1.3',
-    '&dollar;3.2billion',
-    '&dollar;3.3bn',
-    '&dollar;3.4billion',
-    '&dollar;3.4bn',
-    '&dollar;3.5&ndash;4.5',
-    '&dollar;3.5&ndash;5.3m',
-    '&dollar;3.58',
-    '&dollar;3.5bn',
-    '&dollar;3.5m.',
-    '&dollar;3.63',
-    '&dollar;3.68',
-    '&dollar;3.6bn',
-    '&dollar;3.728',
     '&dollar;3.75bn',
-    '&dollar;3.75m',
-    '&dollar;3.79',
-    '&dollar;3.85',
-    '&dollar;3.875',
-    '&dollar;3.8bn',
-    '&dollar;3.90',
-    '&dollar;3.95',
-    '&dollar;3.9bn',
-    '&dollar;30&ndash&dollar;40',
-    '&dollar;30&ndash;36,000',
-    '&dollar;30&ndash;40m',
-    '&dollar;30,000&ndash;40,000',
-    '&dollar;30,186',
-    '&dollar;30,400',
-    '&dollar;30,500,000',
     '&dollar;30,770',
-    '&dollar;30,900',
-    '&dollar;30,950,000',
-    '&dollar;30-40',
-    '&dollar;30.',
-    '&dollar;30.125',
-    '&dollar;30.4m',
-    '&dollar;30.8',
-    '&dollar;30.8m',
-    '&dollar;300&ndash;400',
-    '&dollar;300&ndash;450,000',
-    '&dollar;300,000-plus',
-    '&dollar;300-a-night',
-    '&dollar;30000',
-    '&dollar;300000',
-    '&dollar;300bn',
     '&dollar;300million',
-    '&dollar;301,000',
-    '&dollar;301.5m',
-    '&dollar;302',
-    '&dollar;302,000',
-    '&dollar;302.9m',
-    '&dollar;303.2m',
-    '&dollar;303million',
-    '&dollar;304,313',
-    '&dollar;304,750',
-    '&dollar;3050m',
-    '&dollar;305m',
-    '&dollar;306',
-    '&dollar;306,000',
-    '&dollar;306,000&ndash;459,000',
-    '&dollar;306.5m',
     '&dollar;307,000',
-    '&dollar;307,200',
-    '&dollar;307.3m',
-    '&dollar;307.4m',
-    '&dollar;308.9m',
-    '&dollar;309.6m',
-    '&dollar;30m.',
-    '&dollar;30million',
-    '&dollar;31,200',
-    '&dollar;31,200m',
-    '&dollar;31,312m',
-    '&dollar;31,600',
-    '&dollar;31,800',
-    '&dollar;31,808m',
-    '&dollar;31.4m',
-    '&dollar;31.5m',
     '&dollar;31.60',
-    '&dollar;31.7m',
-    '&dollar;31.9',
-    '&dollar;310',
-    '&dollar;310&ndash;400,000',
-    '&dollar;310,000,000',
-    '&dollar;31000',
-    '&dollar;310m',
-    '&dollar;311,000',
-    '&dollar;311.2m',
-    '&dollar;311.3m',
-    '&dollar;312m',
-    '&dollar;313,127',
-    '&dollar;313.99',
-    '&dollar;313m',
-    '&dollar;314,000',
     '&dollar;314,422',
-    '&dollar;314.2m',
-    '&dollar;315',
-    '&dollar;315&ndash;420,000',
-    '&dollar;316,000',
-    '&dollar;316.1m',
-    '&dollar;319m',
-    '&dollar;32,095m',
-    '&dollar;32,280',
-    '&dollar;32,500',
-    '&dollar;32,500,000',
-    '&dollar;32.0',
-    '&dollar;32.18',
-    '&dollar;32.1m',
-    '&dollar;32.50',
-    '&dollar;32.6',
     '&dollar;32.8m',
-    '&dollar;32.95',
-    '&dollar;32.9m',
-    '&dollar;320,000,000',
-    '&dollar;320,391',
-    '&dollar;321m',
-    '&dollar;322,000',
-    '&dollar;322.5m',
-    '&dollar;323,000',
-    '&dollar;323,000&ndash;342,600',
-    '&dollar;323.4m',
-    '&dollar;323m',
-    '&dollar;324.6m',
-    '&dollar;324m',
-    '&dollar;325&ndash;360,000',
-    '&dollar;325,000,000',
     '&dollar;325.3m',
-    '&dollar;325.4m',
-    '&dollar;325million',
-    '&dollar;326,000',
-    '&dollar;326.8m',
-    '&dollar;327m',
-    '&dollar;328,000',
-    '&dollar;328,500&ndash;456,000',
-    '&dollar;329',
-    '&dollar;329m',
-    '&dollar;33,000,000',
-    '&dollar;33,000.',
-    '&dollar;33,280',
-    '&dollar;33,900,000',
-    '&dollar;33.25',
-    '&dollar;33.9m',
     '&dollar;330',
-    '&dollar;330,000,000',
-    '&dollar;330,335',
-    '&dollar;331,000',
-    '&dollar;331,079',
-    '&dollar;331.3m',
-    '&dollar;333,250',
-    '&dollar;333.4m',
-    '&dollar;333.6m',
-    '&dollar;334.4m',
-    '&dollar;335,000,000',
-    '&dollar;335,302',
-    '&dollar;335.6m',
-    '&dollar;336,000',
-    '&dollar;336.70',
-    '&dollar;336m',
     '&dollar;337,000,000',
-    '&dollar;337.9',
-    '&dollar;338',
-    '&dollar;338.2m',
-    '&dollar;339,000',
-    '&dollar;33bil',
-    '&dollar;33billion',
-    '&dollar;33m.',
-    '&dollar;34&ndash;51,000',
-    '&dollar;34&ndash;52,000',
-    '&dollar;34&ndash;70,000',
-    '&dollar;34,100',
-    '&dollar;34,501',
-    '&dollar;34,600,000',
-    '&dollar;34,800',
-    '&dollar;34.00',
     '&dollar;34.1m',
-    '&dollar;34.3',
-    '&dollar;34.3m',
-    '&dollar;34.5m',
-    '&dollar;34.6m.',
-    '&dollar;34.78',
-    '&dollar;34.8m',
-    '&dollar;34.93',
-    '&dollar;34.95',
-    '&dollar;340&ndash;415,000',
-    '&dollar;340,812',
-    '&dollar;341.5',
-    '&dollar;341.8m',
-    '&dollar;341.9m',
-    '&dollar;342,000',
-    '&dollar;342,000,000',
     '&dollar;342m',
-    '&dollar;343',
-    '&dollar;344,000',
-    '&dollar;344.9m',
-    '&dollar;345,500,000',
-    '&dollar;345.6m',
-    '&dollar;346',
-    '&dollar;346,000,000',
-    '&dollar;346,700',
-    '&dollar;346.8m',
-    '&dollar;347,000,000',
-    '&dollar;348,000',
-    '&dollar;348,000,000',
-    '&dollar;348.5m',
-    '&dollar;349,000',
-    '&dollar;34m',
     '&dollar;35&ndash;45,000',
-    '&dollar;35&ndash;50,000',
-    '&dollar;35,000&ndash;45,000',
-    '&dollar;35,000,000-50,000,000',
-    '&dollar;35,190',
-    '&dollar;35,249',
-    '&dollar;35,500,000',
-    '&dollar;35,593,953',
-    '&dollar;35,795.91',
-    '&dollar;35,800',
-    '&dollar;35,834',
-    '&dollar;35,897,421',
-    '&dollar;35-&dollar;40',
-    '&dollar;35-45,000,000',
-    '&dollar;35-billion',
-    '&dollar;35.0m',
     '&dollar;35.2',
-    '&dollar;35.3m',
-    '&dollar;35.6',
-    '&dollar;35.9m',
-    '&dollar;350,000&ndash;450,000',
-    '&dollar;350,000&ndash;550,000',
-    '&dollar;350-per-workstation',
-    '&dollar;351',
-    '&dollar;352',
-    '&dollar;352,800',
-    '&dollar;352m',
-    '&dollar;353,000',
-    '&dollar;353.2m',
-    '&dollar;353m',
-    '&dollar;354&ndash;442,000',
-    '&dollar;354.8m',
     '&dollar;354m',
-    '&dollar;355',
-    '&dollar;355m',
-    '&dollar;356.50',
-    '&dollar;356.8m',
-    '&dollar;357',
-    '&dollar;358,000,000',
-    '&dollar;358m',
-    '&dollar;35bn',
-    '&dollar;36&ndash;42,000',
-    '&dollar;36&ndash;55,000',
-    '&dollar;36,300&ndash;54,400',
-    '&dollar;36,400',
-    '&dollar;36,500&ndash;58,500',
-    '&dollar;36,666',
-    '&dollar;36,900',
     '&dollar;36,970,000',
-    '&dollar;36.4',
-    '&dollar;36.5m',
-    '&dollar;36.6m',
-    '&dollar;360&ndash;550,000',
-    '&dollar;360,000,000',
-    '&dollar;360.000',
-    '&dollar;3600',
-    '&dollar;361,000',
-    '&dollar;361.2',
-    '&dollar;362.00/&dollar;362.50',
-    '&dollar;362m',
-    '&dollar;363,000',
-    '&dollar;364,300',
-    '&dollar;364,444',
-    '&dollar;364.5m',
     '&dollar;364.6m',
-    '&dollar;364m',
-    '&dollar;366',
-    '&dollar;367',
-    '&dollar;367.84',
-    '&dollar;368m',
-    '&dollar;36bn',
-    '&dollar;37&ndash;50',
-    '&dollar;37,000,000',
-    '&dollar;37,400',
-    '&dollar;37,720',
-    '&dollar;37.0m.net',
-    '&dollar;37.1m',
-    '&dollar;37.31',
-    '&dollar;37.5bn',
-    '&dollar;37.5m.',
     '&dollar;37.7',
-    '&dollar;37.8',
-    '&dollar;370.2m',
-    '&dollar;371',
-    '&dollar;371.3m',
-    '&dollar;372,000',
-    '&dollar;373m',
-    '&dollar;374,000,000',
-    '&dollar;375,000&ndash;450,000',
-    '&dollar;375m',
-    '&dollar;376',
-    '&dollar;376.1m',
-    '&dollar;378',
-    '&dollar;378,000',
-    '&dollar;379,000',
-    '&dollar;38,100',
     '&dollar;38,720',
-    '&dollar;38,915',
-    '&dollar;38,982',
-    '&dollar;38-billion',
-    '&dollar;38.1m',
-    '&dollar;38.25',
-    '&dollar;38.2m',
-    '&dollar;38.4m',
-    '&dollar;38.5bn',
-    '&dollar;38.9m.',
-    '&dollar;380,109',
-    '&dollar;380.7m',
-    '&dollar;3800',
-    '&dollar;380m-a-year',
-    '&dollar;381m',
-    '&dollar;382',
     '&dollar;383.2m',
-    '&dollar;384',
-    '&dollar;384,000',
-    '&dollar;384,000,000',
-    '&dollar;384,800',
-    '&dollar;385',
-    '&dollar;385,000',
-    '&dollar;385,470',
-    '&dollar;3850',
-    '&dollar;385million',
-    '&dollar;386,400,000',
-    '&dollar;387,000,000',
-    '&dollar;387,455.',
-    '&dollar;388,000',
-    '&dollar;388,000,000',
-    '&dollar;389',
     '&dollar;389.1m',
-    '&dollar;38m-a-year',
-    '&dollar;39,468',
-    '&dollar;39,500,000',
-    '&dollar;39-million',
-    '&dollar;39.0m',
-    '&dollar;39.2',
-    '&dollar;39.2m',
-    '&dollar;39.3m',
-    '&dollar;39.6',
-    '&dollar;39.60',
-    '&dollar;39.8m',
-    '&dollar;39.9',
-    '&dollar;390',
-    '&dollar;390m',
-    '&dollar;391',
     '&dollar;391,000',
-    '&dollar;393,000',
-    '&dollar;3938',
-    '&dollar;394m',
-    '&dollar;395,000,000',
-    '&dollar;395m',
-    '&dollar;396,000,000',
-    '&dollar;396m',
-    '&dollar;397',
-    '&dollar;39billion',
-    '&dollar;39bn',
-    '&dollar;3bn-&dollar;4bn',
-    '&dollar;3m-4m',
-    '&dollar;3million',
-    '&dollar;4&ndash;6',
-    '&dollar;4,000&ndash;6,000',
     '&dollar;4,000-a-month',
-    '&dollar;4,016',
-    '&dollar;4,045',
-    '&dollar;4,058,160',
-    '&dollar;4,065m',
-    '&dollar;4,080m',
-    '&dollar;4,086,000',
-    '&dollar;4,095,520',
-    '&dollar;4,125m',
-    '&dollar;4,135',
-    '&dollar;4,140',
-    '&dollar;4,145',
-    '&dollar;4,157m',
-    '&dollar;4,172,000',
-    '&dollar;4,175',
-    '&dollar;4,196',
     '&dollar;4,200m',
-    '&dollar;4,220',
-    '&dollar;4,221,250',
-    '&dollar;4,234',
-    '&dollar;4,300&ndash;6,000',
-    '&dollar;4,300,000',
-    '&dollar;4,324m',
-    '&dollar;4,400',
-    '&dollar;4,415',
-    '&dollar;4,420m',
-    '&dollar;4,421,900',
-    '&dollar;4,427,500',
-    '&dollar;4,430',
-    '&dollar;4,435',
-    '&dollar;4,490',
-    '&dollar;4,500.',
     '&dollar;4,500m',
-    '&dollar;4,540',
-    '&dollar;4,580,000',
-    '&dollar;4,650',
-    '&dollar;4,665',
-    '&dollar;4,700,000',
-    '&dollar;4,780',
-    '&dollar;4,826m',
-    '&dollar;4,870',
-    '&dollar;4,914',
-    '&dollar;4,965m',
-    '&dollar;4,967',
-    '&dollar;4,995',
-    '&dollar;4-billion-worth',
-    '&dollar;4.0',
-    '&dollar;4.03',
     '&dollar;4.07',
-    '&dollar;4.0m',
-    '&dollar;4.13',
-    '&dollar;4.1m.',
-    '&dollar;4.22',
-    '&dollar;4.25m',
-    '&dollar;4.35',
-    '&dollar;4.37',
-    '&dollar;4.3bn',
-    '&dollar;4.45m',
-    '&dollar;4.4bn',
-    '&dollar;4.5&ndash;6.5',
-    '&dollar;4.5.2',
-    '&dollar;4.54',
-    '&dollar;4.5billion',
-    '&dollar;4.5million',
     '&dollar;4.66',
-    '&dollar;4.6billion',
-    '&dollar;4.75',
-    '&dollar;4.75m',
-    '&dollar;4.78',
-    '&dollar;4.86',
-    '&dollar;4.95bn',
-    '&dollar;4.96',
-    '&dollar;40&ndash;70,000',
-    '&dollar;40,000&ndash;50,000',
-    '&dollar;40,342',
-    '&dollar;40-&dollar;10',
-    '&dollar;40-&dollar;100',
-    '&dollar;40-&dollar;50m',
-    '&dollar;40-plus',
-    '&dollar;40.2m',
     '&dollar;40.4m',
-    '&dollar;40.5m',
-    '&dollar;40.75',
-    '&dollar;40.9m',
-    '&dollar;400,000.',
-    '&dollar;400/kw',
-    '&dollar;4000,000',
-    '&dollar;400000000',
-    '&dollar;400m-a-year',
-    '&dollar;400million',
-    '&dollar;402,000,000',
-    '&dollar;402.3m',
-    '&dollar;403,714',
-    '&dollar;403,829',
-    '&dollar;404',
-    '&dollar;404,000',
     '&dollar;405,000',
-    '&dollar;406',
-    '&dollar;406,000,000',
-    '&dollar;407.4m',
-    '&dollar;408,000',
-    '&dollar;40bn',
-    '&dollar;41,200',
-    '&dollar;41,300',
-    '&dollar;41,500,000',
-    '&dollar;41,900m',
-    '&dollar;41.2m',
-    '&dollar;41.4',
-    '&dollar;41.5m',
-    '&dollar;41.6m',
-    '&dollar;41.8m',
-    '&dollar;410m',
     '&dollar;411',
-    '&dollar;411,247',
-    '&dollar;412m',
-    '&dollar;413,100',
-    '&dollar;413m',
-    '&dollar;414',
-    '&dollar;414.2m',
-    '&dollar;415',
-    '&dollar;415m',
-    '&dollar;416,000',
-    '&dollar;416million',
-    '&dollar;417',
-    '&dollar;418,500,000',
-    '&dollar;418.2m',
-    '&dollar;418m',
-    '&dollar;419',
     '&dollar;419.9m',
-    '&dollar;42,176',
-    '&dollar;42,400',
-    '&dollar;42,456,000',
-    '&dollar;42,500',
-    '&dollar;42,600,000',
-    '&dollar;42,800&ndash;55,000',
-    '&dollar;42,840',
-    '&dollar;42.2m',
-    '&dollar;42.3m',
-    '&dollar;42.3million',
-    '&dollar;42.9m',
-    '&dollar;421',
-    '&dollar;423,000',
-    '&dollar;423,404',
-    '&dollar;423,827',
     '&dollar;424,000',
-    '&dollar;424,000,000',
-    '&dollar;425.1m',
-    '&dollar;4250',
-    '&dollar;426',
-    '&dollar;426,000,000',
-    '&dollar;426,471',
-    '&dollar;426.7m',
-    '&dollar;426m',
-    '&dollar;427m',
-    '&dollar;429,000&ndash;643,300',
-    '&dollar;43&ndash;60,000',
-    '&dollar;43,000,000',
-    '&dollar;43,096',
-    '&dollar;43,200',
-    '&dollar;43,533',
     '&dollar;43,984',
-    '&dollar;43.6m',
-    '&dollar;43.7',
-    '&dollar;43.75m',
-    '&dollar;430,156',
-    '&dollar;430,300',
-    '&dollar;431200',
-    '&dollar;431m',
-    '&dollar;432,000,000',
-    '&dollar;433m',
-    '&dollar;434',
-    '&dollar;434billion',
-    '&dollar;436,000,000',
-    '&dollar;436,900,000',
-    '&dollar;437,000',
-    '&dollar;437.7m',
     '&dollar;437m',
-    '&dollar;439',
-    '&dollar;439m',
-    '&dollar;43billion',
-    '&dollar;43m.',
-    '&dollar;44,000&ndash;67,000',
-    '&dollar;44,000,000',
-    '&dollar;44,300',
-    '&dollar;44,530',
-    '&dollar;44.3m',
-    '&dollar;44.4m',
-    '&dollar;440&ndash;615,000',
-    '&dollar;441,000',
-    '&dollar;441-million',
-    '&dollar;443,000',
-    '&dollar;443.8m',
     '&dollar;445',
-    '&dollar;445,000',
-    '&dollar;445,000,000',
-    '&dollar;445,869',
-    '&dollar;446',
-    '&dollar;446,000',
-    '&dollar;448,000',
-    '&dollar;448,273',
-    '&dollar;448,616',
-    '&dollar;449.7m',
-    '&dollar;44m.',
-    '&dollar;45&ndash;63,000',
-    '&dollar;45,100',
-    '&dollar;45,300&ndash;63,500',
-    '&dollar;45,400',
-    '&dollar;45,475',
     '&dollar;45,820',
-    '&dollar;45,900',
-    '&dollar;45.1m',
-    '&dollar;45.2m',
-    '&dollar;45.2m.',
-    '&dollar;45.4',
-    '&dollar;45.8m',
-    '&dollar;450,000&ndash;650,000',
-    '&dollar;450,000&ndash;750,000',
-    '&dollar;450.5',
-    '&dollar;451',
-    '&dollar;453,500',
-    '&dollar;455.6m',
-    '&dollar;455million',
-    '&dollar;456,000',
-    '&dollar;458,450,000',
     '&dollar;458.4m',
-    '&dollar;459,000&ndash;612,000',
-    '&dollar;459,487',
-    '&dollar;45m.',
-    '&dollar;46,000&ndash;76,500',
-    '&dollar;46,100&ndash;50,000',
-    '&dollar;46,200',
-    '&dollar;46,300',
-    '&dollar;46,600',
-    '&dollar;46.1m',
-    '&dollar;46.375',
-    '&dollar;46.4m',
-    '&dollar;46.50',
-    '&dollar;46.5m',
-    '&dollar;46.8m',
-    '&dollar;460,000',
     '&dollar;460,000,000',
-    '&dollar;460.0m',
-    '&dollar;460m',
-    '&dollar;463.9m',
-    '&dollar;4635m',
-    '&dollar;464,000',
-    '&dollar;465.6m',
-    '&dollar;467',
-    '&dollar;467,000',
-    '&dollar;469m',
-    '&dollar;47,000,000',
-    '&dollar;47,000-up',
-    '&dollar;47,600',
-    '&dollar;47,900m',
-    '&dollar;47.25',
-    '&dollar;47.4m',
     '&dollar;47.50',
-    '&dollar;47.6m',
-    '&dollar;47.7m',
-    '&dollar;47.8m',
-    '&dollar;47.9',
-    '&dollar;4700',
-    '&dollar;471,000',
-    '&dollar;472,900',
-    '&dollar;473,000,000',
-    '&dollar;473.3m',
-    '&dollar;474,500',
-    '&dollar;474m',
-    '&dollar;475,000,000',
-    '&dollar;476',
-    '&dollar;476,000',
-    '&dollar;476.3m',
     '&dollar;477,000',
-    '&dollar;47million',
-    '&dollar;48,000&ndash;64,000',
-    '&dollar;48,000&ndash;80,000',
-    '&dollar;48,000,000',
-    '&dollar;48,100',
-    '&dollar;48,400',
-    '&dollar;48,468',
-    '&dollar;48,500m',
-    '&dollar;48.3m',
-    '&dollar;48.50',
-    '&dollar;48.6',
-    '&dollar;48.9',
-    '&dollar;48.9m',
-    '&dollar;481,000',
-    '&dollar;482,000',
     '&dollar;483.3m',
-    '&dollar;483m',
-    '&dollar;485,000,000',
-    '&dollar;485.5m',
-    '&dollar;487,000',
-    '&dollar;4877m',
-    '&dollar;488',
-    '&dollar;488,000',
-    '&dollar;4880m',
-    '&dollar;489',
-    '&dollar;489,606',
-    '&dollar;489.5m',
-    '&dollar;48million',
-    '&dollar;49,036',
-    '&dollar;49,856',
-    '&dollar;49,920',
     '&dollar;49.2m',
-    '&dollar;49.4m',
-    '&dollar;49.5m',
-    '&dollar;49.7m',
-    '&dollar;49.8m',
-    '&dollar;49.90',
-    '&dollar;49.95',
-    '&dollar;490.50',
-    '&dollar;4900',
-    '&dollar;491,000',
-    '&dollar;491.5m',
-    '&dollar;492m',
-    '&dollar;493',
-    '&dollar;495.4',
-    '&dollar;495m',
-    '&dollar;497',
     '&dollar;497,000',
-    '&dollar;498m',
-    '&dollar;499m',
-    '&dollar;4billion',
-    '&dollar;4billion-worth',
-    '&dollar;4m-a-year',
-    '&dollar;5&frac12',
-    '&dollar;5&ndash;10',
-    '&dollar;5&ndash;6',
-    '&dollar;5&ndash;7',
-    '&dollar;5&ndash;8,000',
-    '&dollar;5&ndash;8,500',
-    '&dollar;5,000&ndash;10,000',
-    '&dollar;5,000-&dollar;6,000',
-    '&dollar;5,000.',
-    '&dollar;5,009m.figures',
     '&dollar;5,070',
-    '&dollar;5,084',
-    '&dollar;5,100&ndash;6,900',
-    '&dollar;5,100m',
-    '&dollar;5,130',
-    '&dollar;5,183m',
-    '&dollar;5,240',
-    '&dollar;5,337,000',
-    '&dollar;5,337m',
-    '&dollar;5,390m',
-    '&dollar;5,400,000',
-    '&dollar;5,405m.conversion',
-    '&dollar;5,434m',
-    '&dollar;5,463m',
-    '&dollar;5,468',
-    '&dollar;5,471m',
     '&dollar;5,475',
-    '&dollar;5,480',
-    '&dollar;5,495',
-    '&dollar;5,500&ndash;9,000',
-    '&dollar;5,595',
-    '&dollar;5,600,000',
-    '&dollar;5,645',
-    '&dollar;5,700,000',
-    '&dollar;5,728,800',
-    '&dollar;5,750',
-    '&dollar;5,750&ndash;9,600',
-    '&dollar;5,750m',
-    '&dollar;5,800m',
-    '&dollar;5,840',
-    '&dollar;5,840m',
-    '&dollar;5,885',
     '&dollar;5,913',
-    '&dollar;5,975',
-    '&dollar;5,987',
-    '&dollar;5-10',
-    '&dollar;5-a-week',
-    '&dollar;5-per-day',
-    '&dollar;5.',
-    '&dollar;5.0m',
-    '&dollar;5.125',
-    '&dollar;5.1bn',
-    '&dollar;5.25m',
-    '&dollar;5.28',
-    '&dollar;5.29',
-    '&dollar;5.2bn',
-    '&dollar;5.37',
-    '&dollar;5.40',
     '&dollar;5.57bn',
-    '&dollar;5.6bn',
-    '&dollar;5.75m',
-    '&dollar;5.80',
-    '&dollar;5.93',
-    '&dollar;50&ndash;60,000',
-    '&dollar;50&ndash;80',
-    '&dollar;50&ndash;80,000',
-    '&dollar;50,000&ndash;60,000',
-    '&dollar;50,000&ndash;80,000',
-    '&dollar;50,000-a-seat',
-    '&dollar;50,000.',
-    '&dollar;50,0000',
-    '&dollar;50,000m',
-    '&dollar;50,212',
-    '&dollar;50,720m',
     '&dollar;50-&dollar;100',
-    '&dollar;50.00',
-    '&dollar;50.125',
-    '&dollar;50.1m',
-    '&dollar;50.2m',
-    '&dollar;50.3m',
-    '&dollar;50.5m',
-    '&dollar;50.7m',
-    '&dollar;50.8m',
-    '&dollar;50/kw',
-    '&dollar;500,000&ndash',
-    '&dollar;500,000,000-worth',
-    '&dollar;500,000-plus',
-    '&dollar;500-&dollar;700,000',
-    '&dollar;500.00',
-    '&dollar;500000',
     '&dollar;5000m',
-    '&dollar;500k',
-    '&dollar;500m-1',
-    '&dollar;500m-a-year',
-    '&dollar;500m-plus',
-    '&dollar;500m-worth',
-    '&dollar;501',
-    '&dollar;501,500',
-    '&dollar;503',
-    '&dollar;503,000',
-    '&dollar;505,840',
-    '&dollar;506.6m',
-    '&dollar;508.2m',
-    '&dollar;50k',
-    '&dollar;50m.',
-    '&dollar;51,015',
     '&dollar;51,270',
-    '&dollar;51,500',
-    '&dollar;51.125',
-    '&dollar;51.6',
-    '&dollar;51/2m',
-    '&dollar;510,033',
-    '&dollar;510.1m',
-    '&dollar;511m',
-    '&dollar;512',
-    '&dollar;512,272',
-    '&dollar;512.9',
-    '&dollar;513',
-    '&dollar;514,000,000',
-    '&dollar;514m',
-    '&dollar;516',
-    '&dollar;516,817',
     '&dollar;517.0m',
-    '&dollar;517.6m',
-    '&dollar;519',
-    '&dollar;52,150',
-    '&dollar;52,800',
-    '&dollar;52.125',
-    '&dollar;52.2',
-    '&dollar;52.50',
-    '&dollar;520&ndash;860,000',
-    '&dollar;520m',
-    '&dollar;521',
-    '&dollar;522,894',
-    '&dollar;524,411',
-    '&dollar;524,548',
-    '&dollar;524.4m',
-    '&dollar;524.6m',
     '&dollar;526',
-    '&dollar;526,000',
-    '&dollar;529m',
-    '&dollar;52m',
-    '&dollar;53&ndash;88,000',
-    '&dollar;53,000,000',
-    '&dollar;53,800,000',
-    '&dollar;53.1m',
-    '&dollar;53.2m',
-    '&dollar;53.4',
-    '&dollar;53.4m',
-    '&dollar;53.5',
-    '&dollar;53.6m',
-    '&dollar;53.7m',
-    '&dollar;53.9m',
-    '&dollar;53.9million',
     '&dollar;530&ndash;14,000',
-    '&dollar;530&ndash;800,000',
-    '&dollar;530&ndash;880,000',
-    '&dollar;530,000',
-    '&dollar;530,900',
-    '&dollar;530.0m',
-    '&dollar;530m',
-    '&dollar;531,000,000',
-    '&dollar;531.4m',
-    '&dollar;533.5m',
-    '&dollar;535,000',
-    '&dollar;536',
-    '&dollar;536.3m',
-    '&dollar;536.4m',
-    '&dollar;537',
-    '&dollar;537,000',
     '&dollar;537m',
-    '&dollar;54,000',
-    '&dollar;54,400',
-    '&dollar;54,400&ndash;72,500',
-    '&dollar;54,600,000',
-    '&dollar;540.9m',
-    '&dollar;542m',
-    '&dollar;543,780',
-    '&dollar;544m',
-    '&dollar;546.7m',
-    '&dollar;547.9m',
-    '&dollar;548,000',
-    '&dollar;548,460',
-    '&dollar;548m',
-    '&dollar;549.7',
-    '&dollar;549m',
     '&dollar;54million',
-    '&dollar;55,430',
-    '&dollar;55,432',
-    '&dollar;55,700',
-    '&dollar;55,700&ndash;74,300',
-    '&dollar;55,738',
-    '&dollar;55,783,466.76',
-    '&dollar;55,800',
-    '&dollar;55-million',
-    '&dollar;55.1m',
-    '&dollar;55.8m',
-    '&dollar;55.9m',
-    '&dollar;550&ndash;725,000',
-    '&dollar;550,000,000',
-    '&dollar;550m',
-    '&dollar;551',
     '&dollar;551,000',
-    '&dollar;551.4m',
-    '&dollar;551.8m',
-    '&dollar;552.5m',
-    '&dollar;556m',
-    '&dollar;558,000',
-    '&dollar;558,600',
-    '&dollar;558.3m',
-    '&dollar;558m',
-    '&dollar;55m.',
-    '&dollar;56,000,000',
-    '&dollar;56,400,000',
-    '&dollar;56,600',
-    '&dollar;56.25',
-    '&dollar;56.5m',
-    '&dollar;56.7m',
     '&dollar;56.9',
-    '&dollar;560,000',
-    '&dollar;56000',
-    '&dollar;561.1m',
-    '&dollar;563,000,000',
-    '&dollar;563.6m',
-    '&dollar;567.7',
-    '&dollar;567million',
-    '&dollar;568m',
-    '&dollar;569,000,000',
-    '&dollar;569.1m',
-    '&dollar;56m.',
-    '&dollar;57,000,000',
-    '&dollar;57,064',
-    '&dollar;57,300',
-    '&dollar;57,600',
     '&dollar;57.5m',
-    '&dollar;57.7m',
-    '&dollar;57.9m',
-    '&dollar;570',
-    '&dollar;570.2m',
-    '&dollar;5700',
-    '&dollar;571,000',
-    '&dollar;573m',
-    '&dollar;574,783',
-    '&dollar;575,000',
-    '&dollar;577,000',
-    '&dollar;578',
-    '&dollar;579,500',
-    '&dollar;579,800',
-    '&dollar;58',
-    '&dollar;58,000',
     '&dollar;58,100',
-    '&dollar;58,140',
-    '&dollar;58,200&ndash;77,600',
-    '&dollar;58,269',
-    '&dollar;58,600m',
-    '&dollar;58,700&ndash;78,300',
-    '&dollar;58,800',
-    '&dollar;58,823m',
-    '&dollar;58.3',
-    '&dollar;58.4',
-    '&dollar;58.5m',
-    '&dollar;58.7m',
-    '&dollar;581.4m',
-    '&dollar;583',
-    '&dollar;583,000',
-    '&dollar;584,000,000',
     '&dollar;585,000',
-    '&dollar;587m',
-    '&dollar;589m',
-    '&dollar;58m-worth',
-    '&dollar;58million',
-    '&dollar;59',
-    '&dollar;59,000',
-    '&dollar;59.1m',
-    '&dollar;59.2m',
-    '&dollar;59.4m',
-    '&dollar;59.7m',
-    '&dollar;59.8m',
-    '&dollar;59.95',
-    '&dollar;59.9m',
-    '&dollar;590',
-    '&dollar;591,000,000',
     '&dollar;592,000',
-    '&dollar;594',
-    '&dollar;595,000',
-    '&dollar;597,000',
-    '&dollar;599.95',
-    '&dollar;5billion-plus',
-    '&dollar;5m-&dollar;10m',
-    '&dollar;5m-6m',
-    '&dollar;5m-a-year',
-    '&dollar;6&frac12',
-    '&dollar;6&ndash;7',
-    '&dollar;6&ndash;8,000',
-    '&dollar;6&ndash;9,000',
-    '&dollar;6,000&ndash;8,000',
-    '&dollar;6,000&ndash;9,000',
-    '&dollar;6,000-&dollar;7,000',
     '&dollar;6,065',
-    '&dollar;6,100',
-    '&dollar;6,110m',
-    '&dollar;6,128m',
-    '&dollar;6,191,500',
-    '&dollar;6,200m',
-    '&dollar;6,222.6m',
-    '&dollar;6,310',
-    '&dollar;6,342',
-    '&dollar;6,495',
-    '&dollar;6,586',
-    '&dollar;6,600m',
-    '&dollar;6,700m',
-    '&dollar;6,750',
-    '&dollar;6,765',
-    '&dollar;6,799',
     '&dollar;6,900&ndash;8,600',
-    '&dollar;6,918m',
-    '&dollar;6,950',
-    '&dollar;6,990',
-    '&dollar;6-an-hour',
-    '&dollar;6.09',
-    '&dollar;6.125',
-    '&dollar;6.154bn',
-    '&dollar;6.15m',
-    '&dollar;6.16',
-    '&dollar;6.23',
-    '&dollar;6.25',
-    '&dollar;6.29',
-    '&dollar;6.375',
-    '&dollar;6.4',
-    '&dollar;6.4million',
     '&dollar;6.50',
-    '&dollar;6.525m',
-    '&dollar;6.5m-a-year',
-    '&dollar;6.6',
-    '&dollar;6.625',
-    '&dollar;6.65',
-    '&dollar;6.70',
-    '&dollar;6.75',
-    '&dollar;6.7bn',
-    '&dollar;6.8',
-    '&dollar;6.8&ndash;10.2',
-    '&dollar;6.9&ndash;9.9',
-    '&dollar;6.9bn',
-    '&dollar;60,220',
-    '&dollar;60,400,000',
-    '&dollar;60,600',
     '&dollar;60,800',
-    '&dollar;60,970',
-    '&dollar;60.0m',
-    '&dollar;60.1m',
-    '&dollar;60.2m',
-    '&dollar;60.3m',
-    '&dollar;60.4m',
-    '&dollar;600&ndash;800',
-    '&dollar;600&ndash;900,000',
-    '&dollar;600,000&ndash;900,000',
-    '&dollar;600,000,800,000',
-    '&dollar;600,000-&dollar;800,000',
-    '&dollar;600/800,000',
-    '&dollar;600m-plus',
-    '&dollar;601,000',
-    '&dollar;602',
     '&dollar;602,000',
-    '&dollar;604',
-    '&dollar;609,000',
-    '&dollar;60bn',
-    '&dollar;60m.',
-    '&dollar;60s',
-    '&dollar;61',
-    '&dollar;61,000',
-    '&dollar;61,164',
-    '&dollar;61,265',
-    '&dollar;61,500,000',
-    '&dollar;61.1m',
-    '&dollar;61.3m',
-    '&dollar;61.6m',
-    '&dollar;61.8m',
-    '&dollar;610',
     '&dollar;610&ndash;790,000',
-    '&dollar;610,000,000',
-    '&dollar;611,000',
-    '&dollar;612,000&ndash;918,000',
-    '&dollar;612,000,000',
-    '&dollar;612,696',
-    '&dollar;612.9m',
-    '&dollar;613,000',
-    '&dollar;614',
-    '&dollar;614,603',
-    '&dollar;615&ndash;800,000',
-    '&dollar;615,000',
-    '&dollar;616,000',
-    '&dollar;616.6m',
-    '&dollar;616m',
-    '&dollar;617,000',
     '&dollar;617.4m',
-    '&dollar;619,000,000',
-    '&dollar;62,000,000',
-    '&dollar;62,560',
-    '&dollar;62,631',
-    '&dollar;62,800m',
-    '&dollar;62.00',
-    '&dollar;62.1m',
-    '&dollar;62.3',
-    '&dollar;62.5',
-    '&dollar;620',
-    '&dollar;620,000',
-    '&dollar;620.3m',
-    '&dollar;622,705',
-    '&dollar;623.7m',
-    '&dollar;625,000',
     '&dollar;626,315',
-    '&dollar;63,000,000',
-    '&dollar;63,100',
-    '&dollar;63,120',
-    '&dollar;63,500&ndash;81,600',
-    '&dollar;63.6m',
-    '&dollar;63.8m',
-    '&dollar;630m',
-    '&dollar;633,000',
-    '&dollar;635',
-    '&dollar;635,000,000',
-    '&dollar;638,000',
-    '&dollar;638,000,000',
-    '&dollar;639,00&ndash;821,000',
-    '&dollar;64,000&ndash;82,000',
-    '&dollar;64,000,000',
     '&dollar;64,200',
-    '&dollar;64,300',
-    '&dollar;64,400',
-    '&dollar;64,900',
-    '&dollar;64.3',
-    '&dollar;64.5',
-    '&dollar;64.6m',
-    '&dollar;64.6m.',
-    '&dollar;64.8m',
-    '&dollar;640',
-    '&dollar;640,000,000',
-    '&dollar;64000',
-    '&dollar;641m',
-    '&dollar;641million',
-    '&dollar;643,900',
-    '&dollar;644',
     '&dollar;645',
-    '&dollar;646,000,000',
-    '&dollar;647,000',
-    '&dollar;65,500,000',
-    '&dollar;65,700',
-    '&dollar;65,777',
-    '&dollar;65,825',
-    '&dollar;65-&dollar;26',
-    '&dollar;65-billion',
-    '&dollar;65.4m',
-    '&dollar;65.5m',
-    '&dollar;65.7m',
-    '&dollar;65.8m',
-    '&dollar;650',
-    '&dollar;650.3m',
-    '&dollar;650m-&dollar;700m',
     '&dollar;652,000',
-    '&dollar;652m',
-    '&dollar;653',
-    '&dollar;654,000',
-    '&dollar;655',
-    '&dollar;658,000',
-    '&dollar;658m',
-    '&dollar;66',
-    '&dollar;66,700',
-    '&dollar;66,880',
-    '&dollar;66.1',
-    '&dollar;66.2m',
-    '&dollar;66.7m',
-    '&dollar;66.8',
-    '&dollar;66.9m',
-    '&dollar;660m',
     '&dollar;664.6',
-    '&dollar;665,000',
-    '&dollar;666',
-    '&dollar;67,000,000',
-    '&dollar;67,200',
-    '&dollar;67,500',
-    '&dollar;67,711',
-    '&dollar;67.3m',
-    '&dollar;67.54',
-    '&dollar;67.7m.',
-    '&dollar;67.8',
-    '&dollar;67.95',
-    '&dollar;670',
-    '&dollar;670,000',
-    '&dollar;670million',
-    '&dollar;671,000',
     '&dollar;672.1m',
-    '&dollar;672.4m',
-    '&dollar;672.7m',
-    '&dollar;675',
-    '&dollar;676,000',
-    '&dollar;67bn',
-    '&dollar;68,235m',
-    '&dollar;68,730',
-    '&dollar;68,957',
-    '&dollar;68.0m',
-    '&dollar;681,000',
-    '&dollar;681,000,000',
-    '&dollar;681.5m',
-    '&dollar;682,255',
-    '&dollar;683',
-    '&dollar;683,000',
     '&dollar;683.6m',
-    '&dollar;683.9',
-    '&dollar;684,000',
-    '&dollar;684.6m',
-    '&dollar;685m',
-    '&dollar;686',
-    '&dollar;686,000',
-    '&dollar;6877m',
-    '&dollar;688,000',
-    '&dollar;688,513',
-    '&dollar;688.0m',
-    '&dollar;688m',
-    '&dollar;69',
-    '&dollar;69,710',
-    '&dollar;69,800',
-    '&dollar;69.1m',
     '&dollar;69.3m',
-    '&dollar;69.4m',
-    '&dollar;69.5m',
-    '&dollar;69.7m',
-    '&dollar;69.95',
-    '&dollar;690,000',
-    '&dollar;691,000',
-    '&dollar;691m',
-    '&dollar;692.5m',
-    '&dollar;693,251',
-    '&dollar;694,000',
-    '&dollar;694m',
-    '&dollar;695',
-    '&dollar;6950m',
-    '&dollar;699,000',
-    '&dollar;699,103',
     '&dollar;6million',
-    '&dollar;7&frac12',
-    '&dollar;7&ndash;9,000',
-    '&dollar;7\'/z',
-    '&dollar;7,000&ndash;10,000',
-    '&dollar;7,000&ndash;9,000',
-    '&dollar;7,000-&dollar;8,000',
-    '&dollar;7,000.',
-    '&dollar;7,011',
-    '&dollar;7,050',
-    '&dollar;7,065m',
-    '&dollar;7,100m',
-    '&dollar;7,140',
-    '&dollar;7,246,667',
-    '&dollar;7,247m',
-    '&dollar;7,270',
     '&dollar;7,280',
-    '&dollar;7,300,000',
-    '&dollar;7,313m',
-    '&dollar;7,365',
-    '&dollar;7,450',
-    '&dollar;7,590',
-    '&dollar;7,600m',
-    '&dollar;7,610m',
-    '&dollar;7,626',
-    '&dollar;7,650',
-    '&dollar;7,740,000',
-    '&dollar;7,750&ndash;11,650',
-    '&dollar;7,780m',
-    '&dollar;7,825',
-    '&dollar;7,905,279',
-    '&dollar;7,905,279.',
     '&dollar;7,998,375',
-    '&dollar;7.00',
-    '&dollar;7.0m',
-    '&dollar;7.1',
-    '&dollar;7.10',
-    '&dollar;7.25',
-    '&dollar;7.3',
-    '&dollar;7.38',
-    '&dollar;7.47',
-    '&dollar;7.55',
-    '&dollar;7.5billion',
-    '&dollar;7.6',
-    '&dollar;7.60',
-    '&dollar;7.9',
-    '&dollar;7.9bn',
-    '&dollar;70&ndash;100,000',
     '&dollar;70&ndash;106,000',
-    '&dollar;70&ndash;90',
-    '&dollar;70&ndash;90,00',
-    '&dollar;70,000&ndash;100,000',
-    '&dollar;70,000&ndash;90,000',
-    '&dollar;70,000m',
-    '&dollar;70,300',
-    '&dollar;70,400',
-    '&dollar;70,500',
-    '&dollar;70,684',
-    '&dollar;70,865',
-    '&dollar;70,992',
-    '&dollar;70.19',
-    '&dollar;70.9m',
-    '&dollar;700&ndash;1m',
-    '&dollar;700&ndash;800,000',
     '&dollar;700,000&ndash;1m',
-    '&dollar;700-&dollar;800',
-    '&dollar;700000',
-    '&dollar;705,000',
-    '&dollar;708,000,000',
-    '&dollar;708m',
-    '&dollar;709,000',
-    '&dollar;709.3',
-    '&dollar;70million-plus',
-    '&dollar;71,580,000',
-    '&dollar;71,900m',
-    '&dollar;71.0m',
-    '&dollar;71.2m',
-    '&dollar;71.3m',
-    '&dollar;71.4m',
-    '&dollar;71.82',
     '&dollar;710m',
-    '&dollar;710million',
-    '&dollar;711m',
-    '&dollar;712,500,000',
-    '&dollar;712.10',
-    '&dollar;713m',
-    '&dollar;714,000',
-    '&dollar;715',
-    '&dollar;715,797',
-    '&dollar;716m',
-    '&dollar;717,824',
-    '&dollar;719,000',
-    '&dollar;71m',
-    '&dollar;72,500',
-    '&dollar;72,782',
-    '&dollar;72.1m',
     '&dollar;72.50',
-    '&dollar;72.7',
-    '&dollar;720,000',
-    '&dollar;720,000,000',
-    '&dollar;7200',
-    '&dollar;720m',
-    '&dollar;722,000',
-    '&dollar;722m',
-    '&dollar;723,000',
-    '&dollar;723,800',
-    '&dollar;724m',
-    '&dollar;726.8m',
-    '&dollar;72bn',
-    '&dollar;73&ndash;111',
-    '&dollar;73,921',
-    '&dollar;730',
     '&dollar;730,000',
-    '&dollar;730m',
-    '&dollar;731,000',
-    '&dollar;732,000',
-    '&dollar;733,418',
-    '&dollar;733m',
-    '&dollar;737,000',
-    '&dollar;739m',
-    '&dollar;74,300&ndash;93,000',
-    '&dollar;74,753',
-    '&dollar;74.0m',
-    '&dollar;74.1m',
-    '&dollar;74.4m',
-    '&dollar;74.5m',
-    '&dollar;74.6m',
-    '&dollar;74.7m',
     '&dollar;74.95',
-    '&dollar;740,000,000',
-    '&dollar;740,957',
-    '&dollar;740.3m',
-    '&dollar;740m-2.2',
-    '&dollar;741,000',
-    '&dollar;741m',
-    '&dollar;742,360',
-    '&dollar;743,000',
-    '&dollar;743,000&ndash;929,000',
-    '&dollar;744.2m',
-    '&dollar;745',
-    '&dollar;745,000',
-    '&dollar;746,000',
-    '&dollar;746m',
-    '&dollar;749,000',
     '&dollar;74m',
-    '&dollar;75&ndash;100,000',
-    '&dollar;75,200',
-    '&dollar;75-million',
-    '&dollar;75.3m',
-    '&dollar;75.8m',
-    '&dollar;75.9m',
-    '&dollar;750,000,000',
-    '&dollar;750,000-&dollar;1',
-    '&dollar;750.9m',
-    '&dollar;75000',
-    '&dollar;750million',
-    '&dollar;751.1m',
-    '&dollar;751m',
-    '&dollar;754,107',
-    '&dollar;754.1m',
     '&dollar;754.2',
-    '&dollar;755,000,000',
-    '&dollar;758,000',
-    '&dollar;758,318',
-    '&dollar;76',
-    '&dollar;76,900',
-    '&dollar;76.2m',
-    '&dollar;76.3m',
-    '&dollar;76.6m',
-    '&dollar;76.8m',
-    '&dollar;76.9m',
-    '&dollar;760million',
-    '&dollar;761',
-    '&dollar;761m',
-    '&dollar;763,000,000',
-    '&dollar;764,818',
     '&dollar;764m',
-    '&dollar;765,431',
-    '&dollar;766m',
-    '&dollar;767,000',
-    '&dollar;769,975',
-    '&dollar;77,000,000',
-    '&dollar;77,100',
-    '&dollar;77,500',
-    '&dollar;77,600',
-    '&dollar;77,600&ndash;116,400',
-    '&dollar;77,600&ndash;116,500',
-    '&dollar;77.2m',
-    '&dollar;77.4m',
-    '&dollar;77.6m',
-    '&dollar;77.7',
-    '&dollar;77.9m',
     '&dollar;770',
-    '&dollar;770,000,000',
-    '&dollar;771.9m',
-    '&dollar;773,000',
-    '&dollar;775',
-    '&dollar;776',
-    '&dollar;777',
-    '&dollar;779,000',
-    '&dollar;78,000,000',
-    '&dollar;78,191',
-    '&dollar;78,230',
-    '&dollar;78.1',
-    '&dollar;78.1m',
-    '&dollar;78.3m',
-    '&dollar;78.50',
-    '&dollar;78.8m',
     '&dollar;78.9m',
-    '&dollar;780,000,000',
-    '&dollar;780.2m',
-    '&dollar;781,600,000',
-    '&dollar;782,000',
-    '&dollar;785,000',
-    '&dollar;785,000,000',
-    '&dollar;787',
-    '&dollar;79',
-    '&dollar;79,900',
-    '&dollar;79.2m',
-    '&dollar;79.3m',
-    '&dollar;79.4m',
-    '&dollar;79.5',
-    '&dollar;79.615',
-    '&dollar;79.95',
     '&dollar;790m',
-    '&dollar;791,300,000',
-    '&dollar;792,000',
-    '&dollar;793,000',
-    '&dollar;794,000',
-    '&dollar;795,667',
-    '&dollar;799,066',
-    '&dollar;7bn\'',
-    '&dollar;8&ndash;95',
-    '&dollar;8,000&ndash;12,000',
-    '&dollar;8,000/day',
-    '&dollar;8,048',
-    '&dollar;8,200',
-    '&dollar;8,300',
-    '&dollar;8,300&ndash;10,000',
-    '&dollar;8,400m',
     '&dollar;8,445',
-    '&dollar;8,450',
-    '&dollar;8,470',
-    '&dollar;8,473',
-    '&dollar;8,655',
-    '&dollar;8,900m',
-    '&dollar;8,950',
-    '&dollar;8.3',
-    '&dollar;8.57',
-    '&dollar;8.6',
-    '&dollar;8.7',
-    '&dollar;8.70',
-    '&dollar;8.75',
-    '&dollar;8.7billion',
-    '&dollar;8.8b',
-    '&dollar;8.9&ndash;11.7',
     '&dollar;8.99',
-    '&dollar;80&ndash;100,000',
-    '&dollar;80&ndash;90,000',
-    '&dollar;80,000&ndash;100,000',
-    '&dollar;80.0m',
-    '&dollar;80.2m',
-    '&dollar;80.5',
-    '&dollar;800&ndash;1,000,000',
-    '&dollar;800&ndash;1.2',
-    '&dollar;800,000&ndash&dollar;1',
-    '&dollar;800,000&ndash;1.2',
-    '&dollar;800,927',
-    '&dollar;800.',
-    '&dollar;800.8m',
-    '&dollar;8000',
-    '&dollar;802,729',
     '&dollar;803m',
-    '&dollar;804,356',
-    '&dollar;805,000',
-    '&dollar;806,237',
-    '&dollar;809,000',
-    '&dollar;80bil',
-    '&dollar;80bn',
-    '&dollar;81&frac58',
-    '&dollar;81,383',
-    '&dollar;81,400,000',
-    '&dollar;81.0m',
-    '&dollar;81.1m',
-    '&dollar;81.6m',
-    '&dollar;81.7m.',
-    '&dollar;81.9m',
-    '&dollar;811,000',
     '&dollar;811.6m',
-    '&dollar;812,000',
-    '&dollar;812,000,000',
-    '&dollar;814,000',
-    '&dollar;814.2m',
-    '&dollar;815',
-    '&dollar;819',
-    '&dollar;819,000',
-    '&dollar;82.2m',
-    '&dollar;82.5m',
-    '&dollar;82.72',
-    '&dollar;82.8m',
-    '&dollar;82.9m',
-    '&dollar;820',
-    '&dollar;820.1',
-    '&dollar;821,000',
     '&dollar;824',
-    '&dollar;825bn',
-    '&dollar;826.3',
-    '&dollar;827,000',
-    '&dollar;828,000',
-    '&dollar;829',
-    '&dollar;829.2m',
-    '&dollar;83,200',
-    '&dollar;83,300',
-    '&dollar;83.1m',
-    '&dollar;83.2m',
-    '&dollar;83.3m',
-    '&dollar;83.5m',
-    '&dollar;83.6m',
-    '&dollar;83.7m',
-    '&dollar;83.8m',
     '&dollar;830',
-    '&dollar;832,087',
-    '&dollar;832,500',
-    '&dollar;832.2m',
-    '&dollar;833',
-    '&dollar;838,000,000',
-    '&dollar;839m',
-    '&dollar;83m',
-    '&dollar;84,835',
-    '&dollar;84.0m',
-    '&dollar;84.5m',
-    '&dollar;84.9m',
-    '&dollar;840,000,000',
-    '&dollar;840m',
-    '&dollar;845',
-    '&dollar;846,808',
     '&dollar;848',
-    '&dollar;85&ndash;105,000',
-    '&dollar;85,000&ndash;102,000',
-    '&dollar;85,680',
-    '&dollar;85.1m',
-    '&dollar;85.6m',
-    '&dollar;8500',
-    '&dollar;850m',
-    '&dollar;851,000',
-    '&dollar;852,000,000',
-    '&dollar;853,000',
-    '&dollar;853.9m',
-    '&dollar;855,000,000',
-    '&dollar;855.9m',
-    '&dollar;858',
-    '&dollar;859,517',
     '&dollar;86,550',
-    '&dollar;86,800',
-    '&dollar;86,900',
-    '&dollar;86.1m',
-    '&dollar;86.3m',
-    '&dollar;86.55',
-    '&dollar;86.6m',
-    '&dollar;860',
-    '&dollar;860,025',
-    '&dollar;860m',
-    '&dollar;861,000',
-    '&dollar;862,000',
-    '&dollar;863,000',
-    '&dollar;864',
-    '&dollar;864,000',
-    '&dollar;865',
     '&dollar;865,000,000',
-    '&dollar;865.50',
-    '&dollar;865m',
-    '&dollar;866,000,000',
-    '&dollar;866.2m',
-    '&dollar;867',
-    '&dollar;868,000',
-    '&dollar;868,000,000',
-    '&dollar;869,020',
-    '&dollar;87&ndash;174,000',
-    '&dollar;87,500',
-    '&dollar;87,700',
-    '&dollar;87.1m',
-    '&dollar;87.5m',
-    '&dollar;870,000',
-    '&dollar;870,000,000',
     '&dollar;871,000',
-    '&dollar;871.3m',
-    '&dollar;874',
-    '&dollar;875m',
-    '&dollar;878',
-    '&dollar;878,200',
-    '&dollar;878m',
-    '&dollar;879,508',
-    '&dollar;88',
-    '&dollar;88,000,000',
-    '&dollar;88,400',
-    '&dollar;88.3m',
-    '&dollar;88.6m',
-    '&dollar;881,000,000',
-    '&dollar;881.4m',
-    '&dollar;885,000',
     '&dollar;885,000,000',
-    '&dollar;886,000,000',
-    '&dollar;887,000',
-    '&dollar;888,000',
-    '&dollar;888,000,000',
-    '&dollar;889',
-    '&dollar;889,000',
-    '&dollar;89,000',
-    '&dollar;89,000,000',
-    '&dollar;89,500,000',
-    '&dollar;89,700',
-    '&dollar;89.1',
-    '&dollar;89.1m',
-    '&dollar;89.4m',
-    '&dollar;89.6m',
-    '&dollar;89.95',
     '&dollar;890,000,000',
-    '&dollar;890bn',
-    '&dollar;891,000',
-    '&dollar;893,000',
-    '&dollar;894,100',
-    '&dollar;8billion',
-    '&dollar;8m-10m',
-    '&dollar;9&frac12',
-    '&dollar;9&ndash;10',
-    '&dollar;9,000,000',
-    '&dollar;9,000.',
-    '&dollar;9,063',
-    '&dollar;9,160',
-    '&dollar;9,200',
-    '&dollar;9,295',
-    '&dollar;9,300',
     '&dollar;9,300,000',
-    '&dollar;9,357,000',
-    '&dollar;9,440',
-    '&dollar;9,500m',
-    '&dollar;9,600',
-    '&dollar;9,625',
-    '&dollar;9,700',
-    '&dollar;9,755',
-    '&dollar;9,800',
-    '&dollar;9,866',
-    '&dollar;9,890,000',
-    '&dollar;9,995',
-    '&dollar;9,999.00',
-    '&dollar;9.1',
-    '&dollar;9.1million',
-    '&dollar;9.2',
     '&dollar;9.23m',
-    '&dollar;9.29m',
-    '&dollar;9.4',
-    '&dollar;9.4b',
-    '&dollar;9.54bn',
-    '&dollar;9.62',
-    '&dollar;9.625',
-    '&dollar;9.80',
-    '&dollar;9.85m',
-    '&dollar;90&ndash;110,000',
-    '&dollar;90&ndash;150,000',
-    '&dollar;90&ndash;180,000',
-    '&dollar;90,600',
-    '&dollar;90,700&ndash;108,800',
-    '&dollar;90,973',
-    '&dollar;90.4m',
     '&dollar;90.5m',
-    '&dollar;90.9m',
-    '&dollar;900,00',
-    '&dollar;900,000&ndash;1.3m',
-    '&dollar;900.',
-    '&dollar;904',
-    '&dollar;906,000',
-    '&dollar;907,000',
-    '&dollar;907,294',
-    '&dollar;90m-&dollar;110m',
-    '&dollar;90m-a-year',
-    '&dollar;91',
-    '&dollar;91,000&ndash;109,500',
-    '&dollar;91,700&ndash;122,000',
-    '&dollar;91,800&ndash;122,000',
-    '&dollar;91.1m',
     '&dollar;91.5m.',
-    '&dollar;91.6m',
-    '&dollar;91.7m',
-    '&dollar;91.8m',
-    '&dollar;911,467',
-    '&dollar;913,000',
-    '&dollar;914.7m',
-    '&dollar;918,000&ndash;1,224,000',
-    '&dollar;91m.',
-    '&dollar;92',
-    '&dollar;92,000,000',
-    '&dollar;92,000m',
-    '&dollar;92,202',
-    '&dollar;92,240',
-    '&dollar;92.1m',
-    '&dollar;92.8m',
     '&dollar;920.1m',
-    '&dollar;923&ndash;16,900',
-    '&dollar;924,000',
-    '&dollar;925,000',
-    '&dollar;925m',
-    '&dollar;927,000',
-    '&dollar;927.7m',
-    '&dollar;928m',
-    '&dollar;93',
-    '&dollar;93,000,000',
-    '&dollar;93,300',
-    '&dollar;93,312',
-    '&dollar;93.5',
-    '&dollar;93.6m',
-    '&dollar;93.8m',
-    '&dollar;930,000',
     '&dollar;930m',
-    '&dollar;935',
-    '&dollar;937,000',
-    '&dollar;938,135',
-    '&dollar;938m',
-    '&dollar;94',
-    '&dollar;94,000',
-    '&dollar;94,170',
-    '&dollar;94,300',
-    '&dollar;94,392',
-    '&dollar;94,500',
-    '&dollar;94.1m',
-    '&dollar;94.3m',
-    '&dollar;94.5',
-    '&dollar;94.5m',
-    '&dollar;940.4m',
     '&dollar;940m',
-    '&dollar;941,000,000',
-    '&dollar;944,000',
-    '&dollar;944m',
-    '&dollar;946,780',
-    '&dollar;949,000',
-    '&dollar;949.3m',
-    '&dollar;95,000,000',
-    '&dollar;95,240',
-    '&dollar;95.4m',
-    '&dollar;95.6',
-    '&dollar;950,000',
-    '&dollar;950,000&ndash;1.1m',
-    '&dollar;950,000,000',
-    '&dollar;950m',
-    '&dollar;951,000',
     '&dollar;952.1m',
-    '&dollar;953,100',
-    '&dollar;957',
-    '&dollar;958.0m',
-    '&dollar;959',
-    '&dollar;959,000',
-    '&dollar;96,000,000',
-    '&dollar;96,000m',
-    '&dollar;96,200',
-    '&dollar;96.0m',
-    '&dollar;96.1m',
-    '&dollar;96.2m',
-    '&dollar;96.3m',
-    '&dollar;96.9',
-    '&dollar;964',
-    '&dollar;965',
     '&dollar;965,380',
-    '&dollar;966',
-    '&dollar;968,105',
-    '&dollar;97,825',
-    '&dollar;97,900&ndash;117,500',
-    '&dollar;97.19',
-    '&dollar;97.1m',
-    '&dollar;97.2',
-    '&dollar;97.6m',
-    '&dollar;97.939%',
-    '&dollar;970,000',
-    '&dollar;972,000',
-    '&dollar;974,000',
-    '&dollar;974.1m',
-    '&dollar;975m',
-    '&dollar;976m',
     '&dollar;98',
-    '&dollar;98.2m',
-    '&dollar;98.512%',
-    '&dollar;98.6m',
-    '&dollar;98.90%',
-    '&dollar;980,000',
-    '&dollar;980,000,000',
-    '&dollar;980.8m',
-    '&dollar;980m',
-    '&dollar;982',
-    '&dollar;983,000',
-    '&dollar;985',
-    '&dollar;986,876',
-    '&dollar;987,000',
-    '&dollar;98m',
-    '&dollar;99,000',
     '&dollar;99.047%',
-    '&dollar;99.195%',
-    '&dollar;99.1m',
-    '&dollar;99.33%',
-    '&dollar;99.34%',
-    '&dollar;99.419%',
-    '&dollar;99.43%',
-    '&dollar;99.44%',
-    '&dollar;99.546%',
-    '&dollar;99.557%',
-    '&dollar;99.58%',
-    '&dollar;99.596%',
-    '&dollar;99.7m',
-    '&dollar;99.85%',
-    '&dollar;99.87m',
-    '&dollar;99.904%',
     '&dollar;992,000',
-    '&dollar;998',
-    '&dollar;999',
-    '&dollar;999,000',
-    '&dollar;a1.2',
-    '&dollar;a1.36bn',
-    '&dollar;a100',
-    '&dollar;a15',
-    '&dollar;a150',
-    '&dollar;a232m',
-    '&dollar;a3.6',
-    '&dollar;a40',
-    '&dollar;a49,529',
-    '&dollar;a5',
-    '&dollar;a500',
-    '&dollar;a55,818',
     '&dollar;a65,837',
-    '&dollar;a75-a-head',
-    '&dollar;a96',
-    '&dollar;addr',
-    '&dollar;ae3',
-    '&dollar;assign',
-    '&dollar;b&dollar;5/12',
-    '&dollar;b5=f&dollar;2',
-    '&dollar;bn',
-    '&dollar;by',
-    '&dollar;c&dollar;12',
-    '&dollar;can125m',
-    '&dollar;can30',
-    '&dollar;can9',
-    '&dollar;d&dollar;t&dollar;g',
-    '&dollar;disk3',
     '&dollar;disk7',
-    '&dollar;e5*f&dollar;3,0',
-    '&dollar;edit',
-    '&dollar;ev&mdash;user',
-    '&dollar;exit',
-    '&dollar;f&dollar;4',
-    '&dollar;f&dollar;4&ndash;1',
-    '&dollar;i8-',
-    '&dollar;l',
-    '&dollar;m=',
-    '&dollar;march',
-    '&dollar;me',
-    '&dollar;nz100,000',
-    '&dollar;nz2,500',
-    '&dollar;obj&mdash;id',
-    '&dollar;obj&mdash;state',
     '&dollar;obj&mdash;user',
-    '&dollar;oil',
-    '&dollar;p',
-    '&dollar;parks',
-    '&dollar;peter',
-    '&dollar;s',
-    '&dollar;s100',
-    '&dollar;s2,200',
-    '&dollar;sup5',
-    '&dollar;t2,700,000',
-    '&dollar;t40,000,000',
-    '&dollar;these',
-    '&dollar;us100',
-    '&dollar;us130,000,000',
-    '&dollar;us2,000,000',
-    '&dollar;us350,000,000',
     '&dollar;us4,000',
-    '&dollar;us40,800,000',
-    '&dollar;us500-&dollar;us',
-    '&dollar;us6000',
-    '&dollar;us75',
-    '&dollar;us80,000,000',
-    '&dollar;us850,000',
-    '&dollar;us9,650,000',
-    '&dollar;v',
-    '&dollar;xd4',
-    '&dollar;xe4',
-    '&dollar;xx-m',
-    '&dollar;y',
-    '&dollar;yy',
-    '&eacute',
-    '&eacute;an',
     '&eacute;auiement',
-    '&eacute;aulements',
-    '&eacute;blouir',
-    '&eacute;cartel&eacute',
-    '&eacute;change',
-    '&eacute;chapp&eacute',
-    '&eacute;chapp&eacute;s',
-    '&eacute;conomies',
-    '&eacute;conomiques',
-    '&eacute;corch&eacute',
-    '&eacute;corch&eacute;s',
-    '&eacute;cossaise',
-    '&eacute;cossaises',
-    '&eacute;coute',
-    '&eacute;couter',
-    '&eacute;couv&eacute',
     '&eacute;couve',
-    '&eacute;crire',
-    '&eacute;crits',
-    '&eacute;crivain',
-    '&eacute;cus_once',
-    '&eacute;cuyer',
-    '&eacute;dain',
-    '&eacute;delweiss',
-    '&eacute;ducation',
-    '&eacute;gal',
-    '&eacute;galit&eacute',
-    '&eacute;ire',
-    '&eacute;l&eacute;ment',
-    '&eacute;l&eacute;mentaires',
-    '&eacute;l&eacute;ments',
-    '&eacute;l&egrave;ve',
     '&eacute;lite.',
-    '&eacute;litim',
-    '&eacute;lixir',
-    '&eacute;loge',
-    '&eacute;luard',
-    '&eacute;lys&eacute;e',
-    '&eacute;lys&eacute;es',
-    '&eacute;migr&eacute;e',
-    '&eacute;minence_grise',
-    '&eacute;minences',
-    '&eacute;missaire',
-    '&eacute;missole',
-    '&eacute;nergetiques',
-    '&eacute;nergie',
-    '&eacute;nonciation',
-    '&eacute;pandage',
     '&eacute;pater-les-bourgeois',
-    '&eacute;pergne',
-    '&eacute;ph&egrave;be',
-    '&eacute;pic',
-    '&eacute;picier',
-    '&eacute;pinal',
-    '&eacute;pinards',
-    '&eacute;pisode',
-    '&eacute;poux',
-    '&eacute;quilibr&eacute',
-    '&eacute;quipe',
-    '&eacute;quipes',
-    '&eacute;quivoques',
-    '&eacute;rotique',
-    '&eacute;sa',
-    '&eacute;stime',
     '&eacute;tablissement',
-    '&eacute;tang',
-    '&eacute;tatique',
-    '&eacute;tehi',
-    '&eacute;tendue',
-    '&eacute;tiez',
-    '&eacute;tions',
-    '&eacute;toffe',
-    '&eacute;toiler',
-    '&eacute;toiles',
-    '&eacute;trang&egrave;re',
-    '&eacute;trange',
-    '&eacute;troit',
-    '&eacute;tudi&eacute',
-    '&eacute;tudiante',
-    '&eacute;tudiantine',
     '&eacute;tuis',
-    '&eacute;urop&eacute;en',
-    '&eacute;v&egrave;nement',
-    '&eacute;vangelique',
-    '&eacute;venements',
-    '&eacute;vora',
-    '&ecaron',
-    '&ecirc;chelon',
-    '&eegr/',
-    '&egr&infin',
-    '&egr&ugr&tgr&egr&lgr&eegr&sgr',
-    '&egr;-&zgr=',
-    '&egr;-optimal',
-    '&egr;k',
-    '&egr;m',
-    '&egrave;l&egrave;vation',
     '&egrave;mile',
-    '&egrave;tapes',
-    '&egrave;tre',
-    '&emacr&iuml&omacr;n',
-    '&equo',
-    '&euml;256,700',
-    '&flat;2',
-    '&flat;5',
-    '&flat;5,1',
-    '&flat;5th',
-    '&formula&formula;x3',
-    '&formula;-in',
-    '&formula;1&formula;2',
-    '&formula;1i-',
-    '&formula;i-a',
-    '&formula;kg',
     '&formula;km',
-    '&formula;o',
-    '&formula;of',
-    '&formula;positions',
-    '&formula;r',
-    '&formula;t',
-    '&formula;tl',
-    '&formula;vots',
-    '&formula;whose',
-    '&formula_in',
-    '&frac12%-1%',
-    '&frac12&mdash;1',
-    '&frac12&ndash&frac34',
-    '&frac12&ndash;1',
-    '&frac12&ndash;10',
-    '&frac12&ndash;1in',
     '&frac12&ndash;7',
-    '&frac12\'we',
-    '&frac12:s',
-    '&frac12;-&frac12',
-    '&frac12;-3',
-    '&frac12;-97',
-    '&frac12;-a',
-    '&frac12;-day',
-    '&frac12;-hour',
-    '&frac12;-millisecond',
-    '&frac12;-time',
-    '&frac12;.',
-    '&frac12;b',
-    '&frac12;hours',
-    '&frac12;hp',
-    '&frac12;hr',
     '&frac12;in-thick',
-    '&frac12;km',
-    '&frac12;lb.',
-    '&frac12;million',
-    '&frac12;min',
-    '&frac12;n',
-    '&frac12;oz/15g',
-    '&frac12;pint',
-    '&frac12;st',
-    '&frac12;yd',
-    '&frac13%',
-    '&frac13&ins',
-    '&frac13;d.',
-    '&frac13;x',
-    '&frac13;yd',
-    '&frac13=',
     '&frac14&deg',
-    '&frac14&ndash&frac12;oz',
-    '&frac14;d',
-    '&frac14;ins',
-    '&frac14;kg',
-    '&frac14;m',
-    '&frac14;m-a-year',
-    '&frac14;p',
-    '&frac14;pint',
-    '&frac15&ndash&frac14',
-    '&frac15;th',
-    '&frac17',
-    '&frac17;granule',
-    '&frac18;-nm',
-    '&frac19',
-    '&frac23*',
     '&frac23:oz',
-    '&frac23;in',
-    '&frac23;km',
-    '&frac23;rd',
-    '&frac23;rds',
-    '&frac34%',
-    '&frac34&ins&ndash;1&ins',
-    '&frac34;-length',
-    '&frac34;-mile',
-    '&frac34;d.',
-    '&frac34;hours',
-    '&frac34;ips',
-    '&frac34;km',
-    '&frac34;sec',
-    '&frac38%',
-    '&frac38&ins;.',
     '&frac38;-in',
-    '&frac38;etc.',
-    '&frac38;in.',
-    '&frac38;ins.',
-    '&frac38;ths',
-    '&frac56,0',
-    '&frac58;ths',
-    '&frac78;thbred',
-    '&frac78;ths',
-    '&ge;0',
-    '&ge;0.05',
-    '&ge;0.2',
-    '&ggr&ggr',
-    '&ggr/',
-    '&ggr;-adh',
-    '&ggr;-counter',
     '&ggr;-irradiation',
-    '&ggr;-oxygen',
-    '&ggr;-p',
-    '&ggr;0',
-    '&ggr;b&ggr;3&deg',
-    '&ggr;does',
-    '&ggr;f',
-    '&ggr;v',
-    '&grave_but',
-    '&grave_ne',
-    '&gt&gt;2',
-    '&gt&gt;results.txt',
-    '&gt;-35',
-    '&gt;-7',
-    '&gt;0.033',
-    '&gt;0.05',
     '&gt;0.12',
-    '&gt;0.2mm',
-    '&gt;0.500',
-    '&gt;0.5w',
-    '&gt;0.6',
-    '&gt;0.75%',
-    '&gt;1.7',
-    '&gt;1/600',
-    '&gt;10/&lt;10',
-    '&gt;105',
-    '&gt;130',
-    '&gt;14',
-    '&gt;141',
-    '&gt;15&ndash;20',
-    '&gt;150&times;10/l',
-    '&gt;16',
     '&gt;17',
-    '&gt;18',
-    '&gt;180',
-    '&gt;2,000',
-    '&gt;2.65',
-    '&gt;2.85',
-    '&gt;20%',
-    '&gt;21',
-    '&gt;24',
-    '&gt;240',
-    '&gt;25',
-    '&gt;25%',
-    '&gt;26.9%',
-    '&gt;3+',
-    '&gt;30%',
-    '&gt;30/min',
     '&gt;300ng/ml',
-    '&gt;37.5&deg;c',
-    '&gt;4&times;10/l',
-    '&gt;4.0',
-    '&gt;40%',
-    '&gt;45',
-    '&gt;5.0',
-    '&gt;50%',
-    '&gt;500',
-    '&gt;500&micro;mol/l',
-    '&gt;515',
-    '&gt;6.9',
-    '&gt;6000',
-    '&gt;65',
-    '&gt;7.8',
-    '&gt;70',
     '&gt;70%',
-    '&gt;70/min',
-    '&gt;72%',
-    '&gt;7=24.2',
-    '&gt;8',
-    '&gt;8.3',
-    '&gt;8000',
-    '&gt;9',
-    '&gt;9&ndash;12',
-    '&gt;90',
-    '&gt;d',
-    '&gt;results.txt',
-    '&gt=',
-    '&gt=0',
-    '&gt=1.25',
-    '&gt=1/10000',
     '&gt=100',
-    '&gt=12',
-    '&gt=160',
-    '&gt=21',
-    '&gt=37',
-    '&gt=38',
-    '&gt=4',
-    '&gt=54',
-    '&gt=splenic',
-    '&half;oz',
-    '&half;pint',
-    '&hearts_in',
-    '&hstrok',
-    '&iacute',
-    '&iacute;safj&ouml&dstrok;3ur',
-    '&iacute;safj&ouml;rdur',
     '&icirc',
-    '&icirc;lot',
-    '&iexcl;ceramicas',
-    '&iexcl;el',
-    '&iexcl;patatas',
-    '&iexcl;por',
-    '&iexcl;seguro',
-    '&iexcl;viva',
-    '&ins;either',
-    '&iquest;cuantos',
-    '&iquest;es',
-    '&iquest;gaseosa',
-    '&iquest;inca',
-    '&iquest;policia',
-    '&iquest;que',
-    '&iquest;yo',
     '&khgr;1',
-    '&le;0.1',
-    '&le;10',
-    '&le;50000/mm',
-    '&le;6',
-    '&le;90',
-    '&le;90%',
-    '&lgr&prime',
-    '&lgr&prime/20',
-    '&lgr;gt10',
-    '&lgr;pl(209)/f\'',
-    '&lgr=0.154',
-    '&lowbar&lowbar&lowbar&lowbar',
-    '&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar',
-    '&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar',
-    '&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar;baked',
     '&lowbar&lowbar;1950s',
-    '&lowbar;there',
-    '&lsqb;b&rsqb;oth',
-    '&lsqb;c&rsqb;ollective',
-    '&lsqb;d&rsqb;ecisions',
-    '&lsqb;e&rsqb;mpirical',
-    '&lsqb;f&rsqb;or',
-    '&lsqb;i&rsqb;niquities',
-    '&lsqb;j&rsqb;udges',
-    '&lsqb;l',
-    '&lsqb;l&rsqb;aws',
-    '&lsqb;l&rsqb;eave',
-    '&lsqb;l&rsqb;iberty',
-    '&lsqb;m&rsqb;onopoly',
-    '&lsqb;p&rsqb;eople',
-    '&lsqb;s&rsqb;hort-termism',
     '&lsqb;s&rsqb;ince',
-    '&lsqb;s&rsqb;peculations',
-    '&lsqb;t&rsqb;hat',
-    '&lsqb;t&rsqb;his',
-    '&lsqb;t&rsqb;hus',
-    '&lsqb;t&rsqb;o',
-    '&lsqb;w&rsqb;hat',
-    '&lsqb;w&rsqb;hen',
-    '&lsqb;w&rsqb;here',
-    '&lsqb;w*rsqb;hether',
-    '&lstrok;eba',
-    '&lstrok;ukaszewski',
-    '&lstrok;upawa',
-    '&lt&egr&gt/',
-    '&lt&lt',
-    '&lt+-&gt;50ft',
     '&lt;0.00005',
-    '&lt;0.025',
-    '&lt;0.03',
-    '&lt;0.1',
-    '&lt;0.1&ndash;1.3',
-    '&lt;0.1-',
-    '&lt;0.11',
-    '&lt;0.14',
-    '&lt;0.35',
-    '&lt;0.4',
-    '&lt;0.5',
-    '&lt;0.80',
-    '&lt;1&ndash;1.1%',
-    '&lt;1&ndash;5.0%',
-    '&lt;1.0',
-    '&lt;1.25',
     '&lt;1.5',
-    '&lt;10.5',
-    '&lt;1000',
-    '&lt;10ghz',
-    '&lt;11',
-    '&lt;12',
-    '&lt;12.5',
-    '&lt;13',
-    '&lt;132.6',
-    '&lt;14',
-    '&lt;140',
-    '&lt;150',
-    '&lt;160',
-    '&lt;17',
-    '&lt;170',
-    '&lt;18',
     '&lt;180mw',
-    '&lt;1:100',
-    '&lt;1f&gt',
-    '&lt;2&frac12',
-    '&lt;2&ndash;43',
-    '&lt;2.2',
-    '&lt;2.4-23',
-    '&lt;2.8',
-    '&lt;20/min',
-    '&lt;2000',
-    '&lt;24',
-    '&lt;25',
-    '&lt;25%',
-    '&lt;3&times;10/l',
-    '&lt;3.0',
-    '&lt;300dpi',
     '&lt;35%',
-    '&lt;36',
-    '&lt;38',
-    '&lt;40',
-    '&lt;40%',
-    '&lt;400',
-    '&lt;400/mm',
-    '&lt;44',
-    '&lt;4=',
-    '&lt;5.4',
-    '&lt;6&ndash;140',
-    '&lt;6-',
-    '&lt;60%',
-    '&lt;7',
-    '&lt;7.30',
-    '&lt;7.5',
     '&lt;70&times;10/l',
-    '&lt;76',
-    '&lt;8.5',
-    '&lt;88.7228392',
-    '&lt;95%',
-    '&lt;a',
-    '&lt;a&gt/',
-    '&lt;alt&gt',
-    '&lt;alt-f5&gt',
-    '&lt;apolline',
-    '&lt;at',
-    '&lt;back&gt',
-    '&lt;backspace&gt',
-    '&lt;body&gt',
-    '&lt;break&gt',
-    '&lt;cheikh',
     '&lt;comprenez&gt',
-    '&lt;config&gt',
-    '&lt;configfile&gt',
-    '&lt;ctrl&gt&lt;alt&gt&lt;shift&gt&lt;f3&gt',
-    '&lt;cue',
-    '&lt;d&gt',
-    '&lt;databases&gt',
-    '&lt;dd-mmm-yyyy&gt',
-    '&lt;device&gt',
-    '&lt;device-name&gt',
-    '&lt;div&gt;s',
-    '&lt;div1&gt',
-    '&lt;div2&gt',
-    '&lt;div7&gt',
-    '&lt;double',
-    '&lt;e&gt',
     '&lt;end&gt',
-    '&lt;esc&gt;.',
-    '&lt;f&gt',
-    '&lt;f10&gt',
-    '&lt;f5&gt',
-    '&lt;f9&gt',
-    '&lt;ff',
-    '&lt;final',
-    '&lt;front&gt',
-    '&lt;giggle&gt',
-    '&lt;gloat',
-    '&lt;groan',
-    '&lt;have',
-    '&lt;he',
-    '&lt;he/the',
-    '&lt;he/you&gt',
     '&lt;he/you/the',
-    '&lt;home&gt',
-    '&lt;i',
-    '&lt;if-alt',
-    '&lt;if-assoc&gt',
-    '&lt;illg&gt',
-    '&lt;implicature&gt',
-    '&lt;initial',
-    '&lt;input',
-    '&lt;insert',
-    '&lt;it',
-    '&lt;it&gt',
-    '&lt;its',
-    '&lt;keyword&gt',
-    '&lt;laughs&gt',
-    '&lt;load&gt',
     '&lt;m&gt',
-    '&lt;main&gt',
-    '&lt;metaphysical&gt',
-    '&lt;nxr',
-    '&lt;o&gt',
-    '&lt;one&gt',
-    '&lt;ovfl&gt',
-    '&lt;package',
-    '&lt;page',
-    '&lt;para',
-    '&lt;paradox&gt',
-    '&lt;pastantial',
-    '&lt;pfffttt',
-    '&lt;ph',
-    '&lt;plant',
-    '&lt;process&mdash;name&gt;.com',
     '&lt;process-name&gt',
-    '&lt;process-name&gt;.com',
-    '&lt;quit&gt',
-    '&lt;return&gt',
-    '&lt;rls',
-    '&lt;rotfl&gt',
-    '&lt;sniff&gt',
-    '&lt;some',
-    '&lt;sp&gt_&lt/sp&gt\'s',
-    '&lt;stop&gt',
-    '&lt;substitution',
-    '&lt;tab&gt',
-    '&lt;tall',
-    '&lt;that',
-    '&lt;they&gt',
-    '&lt;together',
     '&lt;transfer&gt&lt;clear&gt&lt;window&gt',
-    '&lt;two',
-    '&lt;user',
-    '&lt;vera',
-    '&lt;voyez&gt',
-    '&lt;window&gt&lt;cascade&gt',
-    '&lt;windows&gt&lt;tile&gt',
-    '&lt;x',
-    '&lt;y&gt',
-    '&lt;your',
-    '&lt=',
-    '&lt=24',
-    '&lt=35',
-    '&lt=4.81',
-    '&lt=530',
-    '&mdash',
     '&mdash%dcl-i-supersede',
-    '&mdash&bgr',
-    '&mdash&mdash&mdash&mdash&mdash&mdash',
-    '&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash',
-    '&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash',
-    '&mdash&mdash;actions',
-    '&mdash&mdash;lots',
-    '&mdash&pound;69',
-    '&mdash\'',
-    '&mdash\'a',
-    '&mdash\'anxious',
-    '&mdash\'give',
-    '&mdash\'how',
-    '&mdash\'nonsense',
-    '&mdash\'star',
-    '&mdash\'they',
     '&mdash\'till',
-    '&mdash\'were',
-    '&mdash*',
-    '&mdash/2',
-    '&mdash/thou',
-    '&mdash;.81',
-    '&mdash;0.7',
-    '&mdash;0.9',
-    '&mdash;1,450,000',
-    '&mdash;1.2',
-    '&mdash;10,71',
-    '&mdash;11',
-    '&mdash;112',
-    '&mdash;115',
-    '&mdash;116',
-    '&mdash;124',
     '&mdash;137',
-    '&mdash;154&mdash;5',
-    '&mdash;156',
-    '&mdash;184',
-    '&mdash;2',
-    '&mdash;20',
-    '&mdash;205',
-    '&mdash;216',
-    '&mdash;231',
-    '&mdash;234',
-    '&mdash;235',
-    '&mdash;239',
-    '&mdash;250,000',
-    '&mdash;260,000',
-    '&mdash;263',
-    '&mdash;264',
     '&mdash;3',
-    '&mdash;30',
-    '&mdash;301',
-    '&mdash;325,000',
-    '&mdash;345',
-    '&mdash;450,000',
-    '&mdash;81',
-    '&mdash;88',
-    '&mdash;95',
-    '&mdash;96',
-    '&mdash;accentuated',
-    '&mdash;actress',
-    '&mdash;acts',
-    '&mdash;ada',
-    '&mdash;administered',
-    '&mdash;affinic',
     '&mdash;again',
-    '&mdash;against',
-    '&mdash;all&mdash;games',
-    '&mdash;aloud',
-    '&mdash;alpha-tubulin',
-    '&mdash;also',
-    '&mdash;also&mdash',
-    '&mdash;alternately',
-    '&mdash;am&mdash',
-    '&mdash;amato',
-    '&mdash;another',
-    '&mdash;any&mdash',
-    '&mdash;any&mdash;team',
-    '&mdash;appendix',
-    '&mdash;approximately',
-    '&mdash;auction',
     '&mdash;backs',
-    '&mdash;bad&mdash',
-    '&mdash;bank',
-    '&mdash;barrington',
-    '&mdash;bathing',
-    '&mdash;be',
-    '&mdash;beanery',
-    '&mdash;because',
-    '&mdash;before',
-    '&mdash;began',
-    '&mdash;beloved',
-    '&mdash;below',
-    '&mdash;beset',
-    '&mdash;between',
-    '&mdash;big&mdash',
-    '&mdash;blackhall',
     '&mdash;bosnian',
-    '&mdash;both',
-    '&mdash;bpx',
-    '&mdash;broke',
-    '&mdash;burnopfield',
-    '&mdash;business',
-    '&mdash;bye-bye',
-    '&mdash;call',
-    '&mdash;called',
-    '&mdash;can',
-    '&mdash;can&mdash',
-    '&mdash;canada',
-    '&mdash;chapter',
-    '&mdash;chihuahua',
-    '&mdash;ciu',
-    '&mdash;class',
     '&mdash;clubmen',
-    '&mdash;coal',
-    '&mdash;come',
-    '&mdash;community',
-    '&mdash;complacency',
-    '&mdash;composition',
-    '&mdash;compounded',
-    '&mdash;concentrated',
-    '&mdash;concerning',
-    '&mdash;conducted',
-    '&mdash;conservative',
-    '&mdash;consett',
-    '&mdash;continued',
-    '&mdash;cosmid',
-    '&mdash;could',
-    '&mdash;court',
     '&mdash;covasna',
-    '&mdash;cover',
-    '&mdash;coxhoe',
-    '&mdash;cp',
-    '&mdash;crude',
-    '&mdash;dance',
-    '&mdash;dc',
-    '&mdash;dead',
-    '&mdash;deerness',
-    '&mdash;deny',
-    '&mdash;depending',
-    '&mdash;deputy',
-    '&mdash;derived',
-    '&mdash;deviate',
-    '&mdash;directly',
-    '&mdash;discussions',
     '&mdash;display',
-    '&mdash;do',
-    '&mdash;do&mdash',
-    '&mdash;doing',
-    '&mdash;down',
-    '&mdash;dpmne',
-    '&mdash;dyp',
-    '&mdash;each',
-    '&mdash;ed.',
-    '&mdash;edward',
-    '&mdash;eel',
-    '&mdash;elements',
-    '&mdash;eleusis',
-    '&mdash;embraced',
-    '&mdash;emphasis',
-    '&mdash;engaged',
     '&mdash;enough',
-    '&mdash;eunuchs',
-    '&mdash;evenwood',
-    '&mdash;every',
-    '&mdash;executed',
-    '&mdash;expected',
-    '&mdash;f',
-    '&mdash;faisal',
-    '&mdash;fast-improving',
-    '&mdash;favourite',
-    '&mdash;feeling',
-    '&mdash;filesa',
-    '&mdash;filing',
-    '&mdash;first',
-    '&mdash;flat',
-    '&mdash;for&mdash',
     '&mdash;foreign',
-    '&mdash;former',
-    '&mdash;fornara',
-    '&mdash;forty',
-    '&mdash;foundations',
-    '&mdash;full',
-    '&mdash;fundamental',
-    '&mdash;garden',
-    '&mdash;gc',
-    '&mdash;general',
-    '&mdash;george',
-    '&mdash;get',
-    '&mdash;getting',
-    '&mdash;gladly',
-    '&mdash;glass',
-    '&mdash;got',
     '&mdash;gouvernement',
-    '&mdash;government',
-    '&mdash;graeme',
-    '&mdash;great&mdash',
-    '&mdash;green',
-    '&mdash;guffawed',
-    '&mdash;harry',
-    '&mdash;has&mdash',
-    '&mdash;have',
-    '&mdash;have&mdash',
-    '&mdash;having',
-    '&mdash;here',
-    '&mdash;hetton',
-    '&mdash;his&mdash;match',
-    '&mdash;hold',
-    '&mdash;hollywood',
     '&mdash;however',
-    '&mdash;huge',
-    '&mdash;i&mdash',
-    '&mdash;if&mdash',
-    '&mdash;if&mdash;there',
-    '&mdash;ignoring',
-    '&mdash;increased',
-    '&mdash;indicates',
-    '&mdash;individual',
-    '&mdash;instructing',
-    '&mdash;insurance',
-    '&mdash;international&mdash',
-    '&mdash;invoked',
-    '&mdash;involved',
-    '&mdash;involving',
-    '&mdash;ionic',
     '&mdash;iran',
-    '&mdash;iron',
-    '&mdash;is&mdash',
-    '&mdash;is&mdash;ever&mdash;wrong&mdash;with&mdash;her',
-    '&mdash;italy',
-    '&mdash;its',
-    '&mdash;jealous',
-    '&mdash;jeanne',
-    '&mdash;john',
-    '&mdash;joo',
-    '&mdash;just',
-    '&mdash;karl',
-    '&mdash;ke',
-    '&mdash;kissed',
-    '&mdash;known',
-    '&mdash;kpnlf',
     '&mdash;labelled',
-    '&mdash;larger',
-    '&mdash;laura',
-    '&mdash;leading',
-    '&mdash;left',
-    '&mdash;let',
-    '&mdash;liberals',
-    '&mdash;lies',
-    '&mdash;line',
-    '&mdash;looking',
-    '&mdash;love',
-    '&mdash;lucas',
-    '&mdash;lysed',
-    '&mdash;made',
-    '&mdash;man',
-    '&mdash;mapam',
     '&mdash;marine',
-    '&mdash;market',
-    '&mdash;marketed',
-    '&mdash;martin',
-    '&mdash;marxist',
-    '&mdash;may',
-    '&mdash;mcdunn',
-    '&mdash;meant',
-    '&mdash;mentioned',
-    '&mdash;methyl-d-aspartate',
-    '&mdash;metre',
-    '&mdash;might&mdash',
-    '&mdash;monitored',
-    '&mdash;mostly',
-    '&mdash;mum',
-    '&mdash;musavat',
     '&mdash;my',
-    '&mdash;namely',
-    '&mdash;naval',
-    '&mdash;neat',
-    '&mdash;neither',
-    '&mdash;never',
-    '&mdash;non',
-    '&mdash;none',
-    '&mdash;north-east',
-    '&mdash;now',
-    '&mdash;often',
-    '&mdash;old',
-    '&mdash;oligonucleotide',
-    '&mdash;only&mdash',
-    '&mdash;opinion',
-    '&mdash;or&mdash',
     '&mdash;ori',
-    '&mdash;ornatus',
-    '&mdash;orthorhombic',
-    '&mdash;oulton',
-    '&mdash;oup',
-    '&mdash;our',
-    '&mdash;outside',
-    '&mdash;paint',
-    '&mdash;panting',
-    '&mdash;patrick',
-    '&mdash;per',
-    '&mdash;perhaps',
-    '&mdash;peter',
-    '&mdash;phil',
-    '&mdash;picc',
-    '&mdash;picture',
     '&mdash;pindar',
-    '&mdash;pl',
-    '&mdash;pla',
-    '&mdash;play&mdash',
-    '&mdash;point',
-    '&mdash;post',
-    '&mdash;presumably',
-    '&mdash;presumed',
-    '&mdash;pretty',
-    '&mdash;probably',
-    '&mdash;protesting',
-    '&mdash;psp',
-    '&mdash;puppy',
-    '&mdash;queen',
-    '&mdash;racing',
-    '&mdash;radical',
     '&mdash;ran',
-    '&mdash;rather',
-    '&mdash;read',
-    '&mdash;reading',
-    '&mdash;recall',
-    '&mdash;receiving',
-    '&mdash;recent',
-    '&mdash;remember',
-    '&mdash;reportedly',
-    '&mdash;representative',
-    '&mdash;residents',
-    '&mdash;s',
-    '&mdash;said',
-    '&mdash;samuel',
-    '&mdash;sanjiv',
-    '&mdash;saves&mdash;.',
     '&mdash;scandinavia',
-    '&mdash;scheduled',
-    '&mdash;sd',
-    '&mdash;sdlp',
-    '&mdash;section',
-    '&mdash;seeing',
-    '&mdash;sherry',
-    '&mdash;sick',
-    '&mdash;signs',
-    '&mdash;since',
-    '&mdash;sjp',
-    '&mdash;socialisation',
-    '&mdash;socially',
-    '&mdash;solids',
-    '&mdash;sonic',
-    '&mdash;sp&ouml',
     '&mdash;spa',
-    '&mdash;special',
-    '&mdash;spurs&mdash',
-    '&mdash;stars',
-    '&mdash;stayed',
-    '&mdash;stern',
-    '&mdash;stockton',
-    '&mdash;stretched',
-    '&mdash;sun',
-    '&mdash;sunday&mdash',
-    '&mdash;t',
-    '&mdash;tableaux',
-    '&mdash;take',
-    '&mdash;takes',
-    '&mdash;tea',
-    '&mdash;technically&mdash',
     '&mdash;techniques',
-    '&mdash;ten',
-    '&mdash;the&mdash',
-    '&mdash;their',
-    '&mdash;them&mdash',
-    '&mdash;therefore',
-    '&mdash;thinks&mdash',
-    '&mdash;third',
-    '&mdash;those',
-    '&mdash;three',
-    '&mdash;threw',
-    '&mdash;title',
-    '&mdash;today',
-    '&mdash;tomorrow',
-    '&mdash;too',
-    '&mdash;took',
     '&mdash;tory',
-    '&mdash;trained',
-    '&mdash;tried',
-    '&mdash;trimdon',
-    '&mdash;tubulin',
-    '&mdash;tunisia',
-    '&mdash;ubiquitous',
-    '&mdash;under',
-    '&mdash;until',
-    '&mdash;vane',
-    '&mdash;variously',
-    '&mdash;ve',
-    '&mdash;venezuela',
-    '&mdash;vol.',
-    '&mdash;whether',
-    '&mdash;whoops',
     '&mdash;why&mdash',
-    '&mdash;will',
-    '&mdash;wilson',
-    '&mdash;winner',
-    '&mdash;word',
-    '&mdash;wording',
-    '&mdash;world',
-    '&mdash;wounded',
-    '&mdash;wpe',
-    '&mdash;yac',
-    '&mdash;yacs',
-    '&mdash;yet',
-    '&mdash;zee',
-    '&mgr&agr&rgr&agr&thgr&ohgr&ngr',
-    '&mgr;-',
-    '&mgr;gal',
     '&mgr;mol',
-    '&mgr;molmol',
-    '&mgr;u/ml',
-    '&micro/kg/day',
-    '&micro;-component',
-    '&micro;-components',
-    '&micro;-direction',
-    '&micro;by',
-    '&micro;can',
-    '&micro;ci/&micro;g',
-    '&micro;ci/kg',
-    '&micro;ci/l',
-    '&micro;ci/ml',
-    '&micro;ci/mm',
-    '&micro;comparison',
-    '&micro;eq',
     '&micro;eq/l',
-    '&micro;especially',
-    '&micro;g/10',
-    '&micro;gcholera',
-    '&micro;l/cm',
-    '&micro;l/min/g',
-    '&micro;m-100',
-    '&micro;m/l',
-    '&micro;mol.1',
-    '&micro;mol.l',
-    '&micro;mol/15',
-    '&micro;mol/h',
-    '&micro;mol/hr',
-    '&micro;sv',
-    '&micro;sv/hour',
-    '&middot',
     '&nacute;e',
-    '&ndash&ndash&ndash&ndash',
-    '&ndash&ndash&ndash;norwich',
-    '&ndash&pound;18',
-    '&ndash:very',
-    '&ndash;1.95',
-    '&ndash;1.99/50ml',
-    '&ndash;10&amp;sup5',
-    '&ndash;10&amp;sup6',
-    '&ndash;100',
-    '&ndash;10m',
-    '&ndash;1136',
-    '&ndash;1185',
-    '&ndash;12.95',
-    '&ndash;120m',
-    '&ndash;1245',
     '&ndash;1328',
-    '&ndash;1387',
-    '&ndash;1459/60',
-    '&ndash;1484',
-    '&ndash;15.2m',
-    '&ndash;1536',
-    '&ndash;1576',
-    '&ndash;1598',
-    '&ndash;1602',
-    '&ndash;1625',
-    '&ndash;1635',
-    '&ndash;1660',
-    '&ndash;1669',
-    '&ndash;1674',
-    '&ndash;17',
-    '&ndash;1714',
     '&ndash;1746',
-    '&ndash;1747',
-    '&ndash;1761',
-    '&ndash;1762',
-    '&ndash;1770',
-    '&ndash;1781',
-    '&ndash;1792',
-    '&ndash;18.95',
-    '&ndash;1807',
-    '&ndash;1812',
-    '&ndash;1814',
-    '&ndash;1836',
-    '&ndash;1842',
-    '&ndash;1857',
-    '&ndash;1864',
-    '&ndash;1872',
     '&ndash;189.48',
-    '&ndash;1912',
-    '&ndash;1948',
-    '&ndash;20&ndash;14&ndash;17',
-    '&ndash;23',
-    '&ndash;24',
-    '&ndash;24.99',
-    '&ndash;25,000',
-    '&ndash;26',
-    '&ndash;29.95',
-    '&ndash;2f',
-    '&ndash;2x10',
-    '&ndash;3&ndash;15&ndash;16&ndash;6',
-    '&ndash;3()s',
-    '&ndash;30',
-    '&ndash;3096',
     '&ndash;33',
-    '&ndash;370',
-    '&ndash;4',
-    '&ndash;4.',
-    '&ndash;4.00p.m.',
-    '&ndash;4.95',
-    '&ndash;40,000',
-    '&ndash;444',
-    '&ndash;469',
-    '&ndash;4838',
-    '&ndash;49',
-    '&ndash;4ft',
-    '&ndash;4p.m.',
-    '&ndash;500',
-    '&ndash;502',
-    '&ndash;513',
     '&ndash;6.00p.m',
-    '&ndash;60%',
-    '&ndash;600m',
-    '&ndash;602',
-    '&ndash;7',
-    '&ndash;74',
-    '&ndash;7474',
-    '&ndash;75',
-    '&ndash;75&deg',
-    '&ndash;750',
-    '&ndash;79',
-    '&ndash;7p.m.',
-    '&ndash;8.49',
-    '&ndash;8000',
-    '&ndash;8637',
-    '&ndash;9%',
     '&ndash;91',
-    '&ndash;975',
-    '&ndash;98%',
-    '&ndash;ailed',
-    '&ndash;animal',
-    '&ndash;any',
-    '&ndash;anyone',
-    '&ndash;bach',
-    '&ndash;backward',
-    '&ndash;bad',
-    '&ndash;birthday',
-    '&ndash;bishop',
-    '&ndash;board',
-    '&ndash;buck',
-    '&ndash;c1200',
-    '&ndash;c1250',
     '&ndash;c1500',
-    '&ndash;community',
-    '&ndash;contained',
-    '&ndash;d.',
-    '&ndash;darling',
-    '&ndash;denderah',
-    '&ndash;dismissal\'',
-    '&ndash;does',
-    '&ndash;easy',
-    '&ndash;eg',
-    '&ndash;en',
-    '&ndash;england',
-    '&ndash;er',
-    '&ndash;fulfil&ndash',
-    '&ndash;full',
-    '&ndash;full-back',
     '&ndash;george',
-    '&ndash;gingerbread&ndash',
-    '&ndash;great',
-    '&ndash;her',
-    '&ndash;hey',
-    '&ndash;his',
-    '&ndash;hut',
-    '&ndash;i',
-    '&ndash;ind',
-    '&ndash;indian',
-    '&ndash;lothian',
-    '&ndash;many',
-    '&ndash;mar',
-    '&ndash;married',
-    '&ndash;normal',
-    '&ndash;now',
     '&ndash;ny',
-    '&ndash;ome',
-    '&ndash;one',
-    '&ndash;operation',
-    '&ndash;our',
-    '&ndash;p',
-    '&ndash;passengers',
-    '&ndash;preconstruction\'',
-    '&ndash;proportionality\'',
-    '&ndash;provision',
-    '&ndash;quasi-stellar',
-    '&ndash;rain',
-    '&ndash;rap',
-    '&ndash;re',
-    '&ndash;relate',
-    '&ndash;rom',
     '&ndash;sewell',
-    '&ndash;so',
-    '&ndash;sorry',
-    '&ndash;stand-off&ndash',
-    '&ndash;subordination',
-    '&ndash;t',
-    '&ndash;that',
-    '&ndash;their&ndash',
-    '&ndash;then',
-    '&ndash;these',
-    '&ndash;toronto',
-    '&ndash;tote',
-    '&ndash;unctions.43',
-    '&ndash;unorthodox&ndash',
-    '&ndash;ute',
-    '&ndash;vb',
     '&ndash;ve',
-    '&ndash;wal1970.tmp',
-    '&ndash;when',
-    '&ndash;why',
-    '&ndash;whyever',
-    '&ndash;wicked',
-    '&ndash;x5',
-    '&ngr/&kgr',
-    '&ngr;subn',
-    '&ngr=&ohgr',
-    '&num;150,000,000',
-    '&num;5',
-    '&num;6',
-    '&num;elected',
-    '&num;l',
-    '&oacute\'briain',
     '&oacute;0deion',
-    '&oacute;csa',
-    '&oacute;e',
-    '&oacute;noma',
-    '&oacute;sas',
-    '&oacute;thinn',
-    '&ohgr\'',
-    '&ohgr;-3',
-    '&oslash;lve',
-    '&oslash;nsker',
-    '&oslash;rslev',
-    '&oslash;rslev-1',
-    '&oslash;sterdal',
-    '&oslash;sterlars',
-    '&oslash;ystein',
-    '&otilde;be',
     '&ouml;dp',
-    '&ouml;dp***',
-    '&ouml;ffentlicher',
-    '&ouml;ffentlichrechtliche',
-    '&ouml;hman',
-    '&ouml;kologisch-demokratische',
-    '&ouml;l',
-    '&ouml;l-d&uuml',
-    '&ouml;l-d&uuml;r-&uuml;l-e-mi-yecek-ti',
-    '&ouml;land',
-    '&ouml;ldziyhutagiyn',
-    '&ouml;r&aelig;faj&ouml;kull',
-    '&ouml;raf&aelig;j&ouml;kull',
-    '&ouml;ren',
-    '&ouml;rn',
-    '&ouml;stasiatiska',
     '&ouml;sterreichisches',
-    '&ouml;sterreichring',
-    '&ouml;sterreichs&mdash;fp&ouml&mdash;whose',
-    '&ouml;sterreichs&mdash;sp&ouml',
-    '&ouml;tztaler',
-    '&ouml;vp&mdash;austrian',
-    '&ouml;vp&mdash;defence',
-    '&ouml;vp&mdash;economic',
-    '&ouml;vp&mdash;foreign',
-    '&ouml;vp&mdash;vice-chancellor',
-    '&ouml;zg&uuml;r',
-    '&pgr&tgr&ohgr;xo&phgr;apmakon',
-    '&pgr/2',
-    '&pgr/k',
-    '&pgr:1',
-    '&pgr;-allyl',
     '&pgr;-bonding',
-    '&pgr;-electrons',
-    '&pgr;-prototype',
-    '&pgr;-systems',
-    '&pgr;227',
-    '&pgr;d',
-    '&phgr;80d',
-    '&phgr=1/6',
-    '&plus;0.026',
-    '&plus;0.09',
-    '&plus;0.090',
-    '&plus;0.115',
-    '&plus;0.140',
-    '&plus;0.155',
-    '&plus;0.159',
-    '&plus;0.160',
     '&plus;0.167',
-    '&plus;0.171',
-    '&plus;0.175',
-    '&plus;0.180',
-    '&plus;0.250',
-    '&plus;1',
-    '&plus;11',
-    '&plus;2',
-    '&plus;2.00',
-    '&plus;3',
-    '&plus;3&deg',
-    '&plus;5',
-    '&plus;6976',
-    '&plus;7',
-    '&plus;7&deg',
-    '&plus;8339',
     '&plusmn;0.0002',
-    '&plusmn;0.001a/hour',
-    '&plusmn;0.001ah&amp;sup-1',
-    '&plusmn;0.01',
-    '&plusmn;0.016',
-    '&plusmn;0.01nm',
-    '&plusmn;0.02nm',
-    '&plusmn;0.1',
-    '&plusmn;0.5%',
-    '&plusmn;10',
-    '&plusmn;15db',
-    '&plusmn;16db',
-    '&plusmn;17db',
-    '&plusmn;2&deg;c',
-    '&plusmn;22db',
-    '&plusmn;25',
     '&plusmn;30',
-    '&plusmn;4',
-    '&plusmn;47',
-    '&plusmn;50',
-    '&plusmn;5db',
-    '&plusmn;6',
-    '&plusmn;60',
-    '&plusmn;forces',
-    '&plusmn;moldova',
-    '&pound%',
-    '&pound&amp;3/8',
-    '&pound&dollar',
-    '&pound&frac12;million',
-    '&pound&frac18',
-    '&pound&mdash',
-    '&pound&pound',
     '&pound&pound&pound&pound&pound',
-    '&pound&pound&pound&pound&pound&pound;s',
-    '&pound&pound;10',
-    '&pound&pound;s',
-    '&pound+39.99',
-    '&pound+99.99',
-    '&pound;.5',
-    '&pound;.743',
-    '&pound;.779',
-    '&pound;.99',
-    '&pound;0-&pound;4',
-    '&pound;0.00',
-    '&pound;0.0328',
-    '&pound;0.03bn',
-    '&pound;0.0759',
-    '&pound;0.08bn',
     '&pound;0.1',
-    '&pound;0.1027',
-    '&pound;0.1198',
-    '&pound;0.1198m',
-    '&pound;0.11bn',
-    '&pound;0.14bn',
-    '&pound;0.17bn',
-    '&pound;0.20bn',
-    '&pound;0.22bn',
-    '&pound;0.24bn',
-    '&pound;0.25m',
-    '&pound;0.28bn',
-    '&pound;0.2m',
-    '&pound;0.39m',
-    '&pound;0.442m',
-    '&pound;0.4m',
     '&pound;0.50',
-    '&pound;0.50&ndash;0.60',
-    '&pound;0.54p',
-    '&pound;0.56p',
-    '&pound;0.58m',
-    '&pound;0.59m',
-    '&pound;0.5m.',
-    '&pound;0.6',
-    '&pound;0.65',
-    '&pound;0.68',
-    '&pound;0.698712',
-    '&pound;0.6bn',
-    '&pound;0.70',
-    '&pound;0.74',
-    '&pound;0.75bn',
-    '&pound;0.7bn',
     '&pound;0.7m.',
-    '&pound;0.92',
-    '&pound;0.98',
-    '&pound;0.99',
-    '&pound;000s',
-    '&pound;1&frac12;-million',
-    '&pound;1&frac14',
-    '&pound;1&middot;50',
-    '&pound;1&ndash;1.3',
-    '&pound;1&ndash;1.5m',
-    '&pound;1&ndash;15',
-    '&pound;1&ndash;2',
-    '&pound;1&ndash;2,000',
-    '&pound;1&ndash;2m',
-    '&pound;1&ndash;7',
-    '&pound;1,000&rehy;worth',
     '&pound;1,000-&pound;1,250',
-    '&pound;1,000-&pound;1,400',
-    '&pound;1,000-&pound;9,000',
-    '&pound;1,000-a-day',
-    '&pound;1,000-a-month',
-    '&pound;1,000-a-week',
-    '&pound;1,000-plus',
-    '&pound;1,000-pounds',
-    '&pound;1,000.00',
-    '&pound;1,000.50',
-    '&pound;1,000/year',
-    '&pound;1,000s',
-    '&pound;1,001&ndash&pound;1,667',
-    '&pound;1,002.99',
-    '&pound;1,003,207',
-    '&pound;1,004.',
     '&pound;1,005',
-    '&pound;1,006',
-    '&pound;1,008.90',
-    '&pound;1,010,113',
-    '&pound;1,011,000m',
-    '&pound;1,012,000',
-    '&pound;1,016',
-    '&pound;1,017',
-    '&pound;1,021',
-    '&pound;1,025m',
-    '&pound;1,027',
-    '&pound;1,030.54',
-    '&pound;1,030m',
-    '&pound;1,031,262.50',
-    '&pound;1,034,000',
-    '&pound;1,034,390',
     '&pound;1,034m',
-    '&pound;1,036',
-    '&pound;1,037',
-    '&pound;1,037,000',
-    '&pound;1,038',
-    '&pound;1,040',
-    '&pound;1,040,822',
-    '&pound;1,042',
-    '&pound;1,043',
-    '&pound;1,045',
-    '&pound;1,050.',
-    '&pound;1,058',
-    '&pound;1,060.50',
-    '&pound;1,061',
-    '&pound;1,064',
-    '&pound;1,066',
     '&pound;1,073',
-    '&pound;1,076,885',
-    '&pound;1,077,000',
-    '&pound;1,078',
-    '&pound;1,079,399',
-    '&pound;1,080.24',
-    '&pound;1,080m',
-    '&pound;1,082.391',
-    '&pound;1,084',
-    '&pound;1,087',
-    '&pound;1,088m',
-    '&pound;1,090-a-term',
-    '&pound;1,090-odd',
-    '&pound;1,102',
-    '&pound;1,103',
-    '&pound;1,108',
     '&pound;1,110',
-    '&pound;1,114',
-    '&pound;1,116',
-    '&pound;1,117.73',
-    '&pound;1,120,000',
-    '&pound;1,126',
-    '&pound;1,137',
-    '&pound;1,138,000',
-    '&pound;1,145m',
-    '&pound;1,146',
-    '&pound;1,151',
-    '&pound;1,152',
-    '&pound;1,157',
-    '&pound;1,158',
-    '&pound;1,161',
-    '&pound;1,162,306',
     '&pound;1,162,536',
-    '&pound;1,163',
-    '&pound;1,164,000',
-    '&pound;1,167.00',
-    '&pound;1,168',
-    '&pound;1,169,950',
-    '&pound;1,170',
-    '&pound;1,173',
-    '&pound;1,175',
-    '&pound;1,176,409',
-    '&pound;1,179',
-    '&pound;1,182,300',
-    '&pound;1,183',
-    '&pound;1,185,971',
-    '&pound;1,188',
-    '&pound;1,192',
     '&pound;1,195',
-    '&pound;1,198',
-    '&pound;1,1oo',
-    '&pound;1,200&ndash;1,800',
-    '&pound;1,200-&pound;1,500',
-    '&pound;1,214',
-    '&pound;1,215,928',
-    '&pound;1,217',
-    '&pound;1,220m',
-    '&pound;1,222',
-    '&pound;1,223',
-    '&pound;1,224',
-    '&pound;1,224.42',
-    '&pound;1,225',
-    '&pound;1,225,724',
-    '&pound;1,228.13',
     '&pound;1,230.50',
-    '&pound;1,233',
-    '&pound;1,235',
-    '&pound;1,240.00',
-    '&pound;1,244',
-    '&pound;1,245',
-    '&pound;1,248',
-    '&pound;1,250&ndash&pound;3,450',
-    '&pound;1,250-a-term',
-    '&pound;1,250.00',
-    '&pound;1,252',
-    '&pound;1,253',
-    '&pound;1,256',
-    '&pound;1,260',
-    '&pound;1,261',
-    '&pound;1,265',
     '&pound;1,270',
-    '&pound;1,274',
-    '&pound;1,275',
-    '&pound;1,275,000',
-    '&pound;1,280,000',
-    '&pound;1,284.40',
-    '&pound;1,286',
-    '&pound;1,295.95',
-    '&pound;1,298.25',
-    '&pound;1,304',
-    '&pound;1,307',
-    '&pound;1,307,571',
-    '&pound;1,312',
-    '&pound;1,312.88',
-    '&pound;1,314.53',
-    '&pound;1,315',
     '&pound;1,320',
-    '&pound;1,322',
-    '&pound;1,325,300',
-    '&pound;1,328,500',
-    '&pound;1,329',
-    '&pound;1,330',
-    '&pound;1,333',
-    '&pound;1,333m',
-    '&pound;1,334',
-    '&pound;1,335,000',
-    '&pound;1,336',
-    '&pound;1,336,289',
-    '&pound;1,336,792',
-    '&pound;1,338,825.45p',
-    '&pound;1,341',
-    '&pound;1,342,000',
     '&pound;1,342m',
-    '&pound;1,343',
-    '&pound;1,344',
-    '&pound;1,346m',
-    '&pound;1,350.',
-    '&pound;1,352,000',
-    '&pound;1,355',
-    '&pound;1,360,000',
-    '&pound;1,368',
-    '&pound;1,371,000',
-    '&pound;1,381',
-    '&pound;1,387,000',
-    '&pound;1,392.8',
-    '&pound;1,395',
-    '&pound;1,397',
-    '&pound;1,399',
     '&pound;1,400m',
-    '&pound;1,400m.',
-    '&pound;1,405',
-    '&pound;1,411',
-    '&pound;1,411,384',
-    '&pound;1,412',
-    '&pound;1,412,336',
-    '&pound;1,424,554',
-    '&pound;1,427',
-    '&pound;1,428',
-    '&pound;1,431',
-    '&pound;1,437',
-    '&pound;1,440',
-    '&pound;1,444',
-    '&pound;1,456-odd',
-    '&pound;1,458',
     '&pound;1,466.54',
-    '&pound;1,467m',
-    '&pound;1,473.00',
-    '&pound;1,491',
-    '&pound;1,492',
-    '&pound;1,493',
-    '&pound;1,495',
-    '&pound;1,499',
-    '&pound;1,500&ndash;4,000',
-    '&pound;1,500,000,000',
-    '&pound;1,500,000-worth',
-    '&pound;1,500-a-year',
-    '&pound;1,500/2,000',
-    '&pound;1,500/3,000',
-    '&pound;1,503,425',
-    '&pound;1,504',
     '&pound;1,505',
-    '&pound;1,514,000',
-    '&pound;1,520',
-    '&pound;1,526',
-    '&pound;1,530',
-    '&pound;1,545',
-    '&pound;1,55',
-    '&pound;1,555',
-    '&pound;1,565',
-    '&pound;1,569,130',
-    '&pound;1,571',
-    '&pound;1,571,000',
-    '&pound;1,573',
-    '&pound;1,574',
-    '&pound;1,575.',
-    '&pound;1,576',
     '&pound;1,580',
-    '&pound;1,580,000',
-    '&pound;1,583',
-    '&pound;1,588',
-    '&pound;1,589',
-    '&pound;1,590',
-    '&pound;1,597',
-    '&pound;1,598',
-    '&pound;1,599,163.71',
-    '&pound;1,5oo',
-    '&pound;1,606m',
-    '&pound;1,616,249',
-    '&pound;1,619.80',
-    '&pound;1,621',
-    '&pound;1,622',
-    '&pound;1,627,000',
     '&pound;1,629',
-    '&pound;1,631',
-    '&pound;1,633',
-    '&pound;1,633,000',
-    '&pound;1,634,000',
-    '&pound;1,635',
-    '&pound;1,639',
-    '&pound;1,641',
-    '&pound;1,642,000',
-    '&pound;1,650m',
-    '&pound;1,651',
-    '&pound;1,660',
-    '&pound;1,665.24',
-    '&pound;1,668&ndash&pound;45,000',
-    '&pound;1,670',
-    '&pound;1,677',
     '&pound;1,679',
-    '&pound;1,680,076,000',
-    '&pound;1,681',
-    '&pound;1,682',
-    '&pound;1,689',
-    '&pound;1,700m.',
-    '&pound;1,704',
-    '&pound;1,707',
-    '&pound;1,710',
-    '&pound;1,728,685',
-    '&pound;1,730',
-    '&pound;1,731.25',
-    '&pound;1,735',
-    '&pound;1,738.57',
-    '&pound;1,745',
-    '&pound;1,749',
     '&pound;1,754',
-    '&pound;1,762',
-    '&pound;1,762-a-night',
-    '&pound;1,765',
-    '&pound;1,767',
-    '&pound;1,771,500',
-    '&pound;1,773',
-    '&pound;1,773,115',
-    '&pound;1,775',
-    '&pound;1,776m',
-    '&pound;1,779',
-    '&pound;1,789',
-    '&pound;1,791',
-    '&pound;1,800-odd',
-    '&pound;1,800m',
-    '&pound;1,810m',
     '&pound;1,811,996',
-    '&pound;1,819',
-    '&pound;1,826',
-    '&pound;1,826,000',
-    '&pound;1,828',
-    '&pound;1,832,000',
-    '&pound;1,838',
-    '&pound;1,851,000',
-    '&pound;1,854m',
-    '&pound;1,858',
-    '&pound;1,859m',
-    '&pound;1,860,000',
-    '&pound;1,860,000&ndash;2,130,000',
-    '&pound;1,868',
-    '&pound;1,875',
-    '&pound;1,879',
     '&pound;1,883',
-    '&pound;1,886,000',
-    '&pound;1,892',
-    '&pound;1,895,000',
-    '&pound;1,896',
-    '&pound;1,896,000',
-    '&pound;1,900-a-game',
-    '&pound;1,908',
-    '&pound;1,912',
-    '&pound;1,914.4s.0d.',
-    '&pound;1,920',
-    '&pound;1,925',
-    '&pound;1,930,500',
-    '&pound;1,932',
-    '&pound;1,935',
-    '&pound;1,945,000',
     '&pound;1,960',
-    '&pound;1,964',
-    '&pound;1,970',
-    '&pound;1,980',
-    '&pound;1,984',
-    '&pound;1,996',
-    '&pound;1,996,000',
-    '&pound;1-&pound;1,500,000',
-    '&pound;1-2bn',
-    '&pound;1-5-0',
-    '&pound;1-a-go',
-    '&pound;1-a-share',
-    '&pound;1-for-&pound;1',
-    '&pound;1-level',
-    '&pound;1.0',
-    '&pound;1.00=dm2.52',
     '&pound;1.00=dm2.778',
-    '&pound;1.015m',
-    '&pound;1.01m',
-    '&pound;1.025',
-    '&pound;1.027bn',
-    '&pound;1.03m',
-    '&pound;1.04bn',
-    '&pound;1.04m',
-    '&pound;1.054',
-    '&pound;1.056m',
-    '&pound;1.060',
-    '&pound;1.06m',
-    '&pound;1.06m.',
-    '&pound;1.07bn',
-    '&pound;1.07m',
-    '&pound;1.08&mdash&pound;1.80',
     '&pound;1.089m.',
-    '&pound;1.09/200ml',
-    '&pound;1.09/50g',
-    '&pound;1.098m',
-    '&pound;1.09bn.',
-    '&pound;1.1.',
-    '&pound;1.10p',
-    '&pound;1.115',
-    '&pound;1.118m',
-    '&pound;1.11m',
-    '&pound;1.12&frac12;p',
-    '&pound;1.12.5d',
-    '&pound;1.12m',
-    '&pound;1.145',
-    '&pound;1.14p',
-    '&pound;1.152n',
     '&pound;1.154m',
-    '&pound;1.15bn',
-    '&pound;1.15m',
-    '&pound;1.15s.0d.',
-    '&pound;1.16m',
-    '&pound;1.185',
-    '&pound;1.18m',
-    '&pound;1.18million',
-    '&pound;1.19m',
-    '&pound;1.19stg',
-    '&pound;1.1million',
-    '&pound;1.1s.0d.',
-    '&pound;1.1s.3d',
-    '&pound;1.2&ndash;1.46',
-    '&pound;1.206m',
-    '&pound;1.20p',
     '&pound;1.21',
-    '&pound;1.224bn',
-    '&pound;1.225',
-    '&pound;1.23',
-    '&pound;1.24',
-    '&pound;1.24m.',
-    '&pound;1.25&mdash&pound;1.35',
-    '&pound;1.25&ndash;1.7',
-    '&pound;1.25-&pound;1.50',
-    '&pound;1.25billion',
-    '&pound;1.25bn',
-    '&pound;1.25million',
-    '&pound;1.265',
-    '&pound;1.269m',
-    '&pound;1.26million',
-    '&pound;1.27bn',
     '&pound;1.285m',
-    '&pound;1.29-&pound;1.69',
-    '&pound;1.29/300ml',
-    '&pound;1.291billion',
-    '&pound;1.29bn',
-    '&pound;1.2m-rated',
-    '&pound;1.3&ndash;3',
-    '&pound;1.31m',
-    '&pound;1.32',
-    '&pound;1.323bn',
-    '&pound;1.32bn',
-    '&pound;1.32m',
-    '&pound;1.334',
-    '&pound;1.357bn',
-    '&pound;1.35bn.',
-    '&pound;1.35m.',
     '&pound;1.35p',
-    '&pound;1.368m',
-    '&pound;1.37',
-    '&pound;1.375',
-    '&pound;1.38',
-    '&pound;1.3billion',
-    '&pound;1.3s',
-    '&pound;1.4&ndash;1.8',
-    '&pound;1.415m.',
-    '&pound;1.41m',
-    '&pound;1.41million',
-    '&pound;1.449m',
-    '&pound;1.45bn',
-    '&pound;1.469',
-    '&pound;1.46m',
-    '&pound;1.48m',
     '&pound;1.48million',
-    '&pound;1.49million',
-    '&pound;1.4m-plus',
-    '&pound;1.4m.',
-    '&pound;1.4s.0d',
-    '&pound;1.4s.0d.',
-    '&pound;1.5&ndash&pound;2',
-    '&pound;1.5.0d',
-    '&pound;1.50&mdash&pound;1.90',
-    '&pound;1.50+50p',
-    '&pound;1.50-&pound;15',
-    '&pound;1.50p',
-    '&pound;1.50p&mdash&pound;2.10',
-    '&pound;1.51m',
-    '&pound;1.52/300ml',
-    '&pound;1.544bn',
     '&pound;1.55m',
-    '&pound;1.55p',
-    '&pound;1.56',
-    '&pound;1.582m',
-    '&pound;1.594m',
-    '&pound;1.59million',
-    '&pound;1.5b',
-    '&pound;1.5m.',
-    '&pound;1.5million-rated',
-    '&pound;1.6&ndash;2.3',
-    '&pound;1.6&ndash;2.4',
-    '&pound;1.60&ndash&pound;2.65',
-    '&pound;1.60/60ml',
-    '&pound;1.61m',
-    '&pound;1.62&frac12&mdash&pound;2.22&frac12',
-    '&pound;1.63',
     '&pound;1.64',
-    '&pound;1.643',
-    '&pound;1.65/100ml',
-    '&pound;1.65bn',
-    '&pound;1.66&ndash;2.33',
-    '&pound;1.665m.',
-    '&pound;1.67',
-    '&pound;1.67m',
-    '&pound;1.69/300ml',
-    '&pound;1.69/75ml',
-    '&pound;1.6m.',
-    '&pound;1.6mworth',
-    '&pound;1.6s.',
-    '&pound;1.6s.0d.',
-    '&pound;1.6s.8d',
-    '&pound;1.700',
     '&pound;1.701',
-    '&pound;1.709',
-    '&pound;1.72m',
-    '&pound;1.74',
-    '&pound;1.75-&pound;5.70',
-    '&pound;1.768m',
-    '&pound;1.76m',
-    '&pound;1.77m',
-    '&pound;1.78bn',
-    '&pound;1.78m',
-    '&pound;1.7s.6d.',
-    '&pound;1.8&ndash;2.4',
-    '&pound;1.806m',
-    '&pound;1.81',
-    '&pound;1.82m',
-    '&pound;1.83',
     '&pound;1.83million',
-    '&pound;1.83p',
-    '&pound;1.85bn',
-    '&pound;1.88m',
-    '&pound;1.89/100ml',
-    '&pound;1.8945',
-    '&pound;1.904',
-    '&pound;1.92m',
-    '&pound;1.93',
-    '&pound;1.94bn',
-    '&pound;1.95&ndash&pound;8.95',
-    '&pound;1.95/25',
-    '&pound;1.95/250ml',
-    '&pound;1.97',
-    '&pound;1.99/12',
-    '&pound;1.99/200ml',
     '&pound;1.99/300ml',
-    '&pound;1.99/3g',
-    '&pound;1.9bn',
-    '&pound;1.9s.0d.',
-    '&pound;1/12&shilling;0',
-    '&pound;1/4,000',
-    '&pound;1/4m',
-    '&pound;1/8',
-    '&pound;1/kg',
-    '&pound;1/unwaged',
-    '&pound;10&ndash&pound;100',
-    '&pound;10&ndash&pound;20',
-    '&pound;10&ndash;12,000',
-    '&pound;10&ndash;15m',
-    '&pound;10&ndash;30',
-    '&pound;10&ndash;5',
     '&pound;10&ndash;50',
-    '&pound;10,00',
-    '&pound;10,000&mdash&pound;20,000',
-    '&pound;10,000&ndash;40,000',
-    '&pound;10,000+',
-    '&pound;10,000-&pound;11,500',
-    '&pound;10,000-a-day',
-    '&pound;10,000-rated',
-    '&pound;10,000.',
-    '&pound;10,000.00',
-    '&pound;10,000m',
-    '&pound;10,045',
-    '&pound;10,120',
-    '&pound;10,120,000',
-    '&pound;10,152',
-    '&pound;10,185',
     '&pound;10,200',
-    '&pound;10,208',
-    '&pound;10,250',
-    '&pound;10,261',
-    '&pound;10,270',
-    '&pound;10,280',
-    '&pound;10,295',
-    '&pound;10,298',
-    '&pound;10,322,000',
-    '&pound;10,340',
-    '&pound;10,346',
-    '&pound;10,380',
-    '&pound;10,406',
-    '&pound;10,422',
-    '&pound;10,425-a-year',
-    '&pound;10,458',
     '&pound;10,460',
-    '&pound;10,466',
-    '&pound;10,518',
-    '&pound;10,571',
-    '&pound;10,576',
-    '&pound;10,585',
-    '&pound;10,600',
-    '&pound;10,609',
-    '&pound;10,625',
-    '&pound;10,650',
-    '&pound;10,660',
-    '&pound;10,695',
-    '&pound;10,715',
-    '&pound;10,719',
-    '&pound;10,737',
-    '&pound;10,757',
     '&pound;10,780,000',
-    '&pound;10,785',
-    '&pound;10,800',
-    '&pound;10,800-&pound;12,400',
-    '&pound;10,850',
-    '&pound;10,862',
-    '&pound;10,903',
-    '&pound;10,916',
-    '&pound;10,940',
-    '&pound;10,950',
-    '&pound;10,985',
-    '&pound;10,995',
-    '&pound;10,999',
-    '&pound;10-&pound;15',
-    '&pound;10-&pound;22',
-    '&pound;10-&pound;99',
     '&pound;10-0-0',
-    '&pound;10-11',
-    '&pound;10-12m',
-    '&pound;10-15,000',
-    '&pound;10-a-month',
-    '&pound;10-but',
-    '&pound;10.07m',
-    '&pound;10.08',
-    '&pound;10.09',
-    '&pound;10.12s.6d.',
-    '&pound;10.26m',
-    '&pound;10.2bn',
-    '&pound;10.31',
-    '&pound;10.324m.',
-    '&pound;10.36',
-    '&pound;10.43',
     '&pound;10.45',
-    '&pound;10.48',
-    '&pound;10.49',
-    '&pound;10.52',
-    '&pound;10.55',
-    '&pound;10.5bn',
-    '&pound;10.5million',
-    '&pound;10.5s.6d.',
-    '&pound;10.60',
-    '&pound;10.67',
-    '&pound;10.72',
-    '&pound;10.77',
-    '&pound;10.82',
-    '&pound;10.845',
-    '&pound;10.8m.',
-    '&pound;10.8million',
     '&pound;10.9',
-    '&pound;10.93',
-    '&pound;10.95.',
-    '&pound;10.96',
-    '&pound;10.98',
-    '&pound;10.99&ndash&pound;179.99',
-    '&pound;10/&dollar;20',
-    '&pound;10/&pound;7.50/&pound;5&pound',
-    '&pound;10/&pound;7.50/&pound;5/free',
-    '&pound;10/15',
-    '&pound;10/tonne',
-    '&pound;100&ndash&pound;10,000',
-    '&pound;100&ndash&pound;165',
-    '&pound;100&ndash&pound;190',
-    '&pound;100&ndash;150',
-    '&pound;100,000&ndash;120,000',
     '&pound;100,000-added',
-    '&pound;100,000-plus',
-    '&pound;100,000-signing',
-    '&pound;100,000.',
-    '&pound;100,000/&pound;101,200',
-    '&pound;100,750',
-    '&pound;100,945',
-    '&pound;100,980',
-    '&pound;100-&pound;1,000',
-    '&pound;100-&pound;120',
-    '&pound;100-&pound;175',
-    '&pound;100-&pound;275',
-    '&pound;100-a&rehy;ticket',
-    '&pound;100-a-night',
-    '&pound;100-apiece',
-    '&pound;100-per',
     '&pound;100-per-decoder',
-    '&pound;100-plus',
-    '&pound;100-worth',
-    '&pound;100.000',
-    '&pound;100.1',
-    '&pound;100.2m',
-    '&pound;100.3m',
-    '&pound;100.56',
-    '&pound;100.6m',
-    '&pound;100.74',
-    '&pound;100.77',
-    '&pound;100/1.1',
-    '&pound;100/120',
-    '&pound;100/ha',
-    '&pound;1000&ndash;1400',
-    '&pound;1000*',
     '&pound;1000+',
-    '&pound;1000-a-man',
-    '&pound;1000-worth',
-    '&pound;100000000',
-    '&pound;1002m',
-    '&pound;10085',
-    '&pound;100k',
-    '&pound;100m.',
-    '&pound;100mn',
-    '&pound;101,000',
-    '&pound;101,443',
-    '&pound;101,658',
-    '&pound;101.1m',
-    '&pound;101.378m',
-    '&pound;101.3m',
-    '&pound;101.50',
     '&pound;101.62',
-    '&pound;101.65',
-    '&pound;101.6m',
-    '&pound;101.8m',
-    '&pound;101.92',
-    '&pound;101/2m',
-    '&pound;1010',
-    '&pound;1012',
-    '&pound;10150',
-    '&pound;102&ndash&pound;170',
-    '&pound;102,102.52',
-    '&pound;102,694',
-    '&pound;102,700',
-    '&pound;102,750',
-    '&pound;102,950',
-    '&pound;102.15',
     '&pound;102.2m',
-    '&pound;102.50',
-    '&pound;102.56',
-    '&pound;1021.27',
-    '&pound;1028',
-    '&pound;1029',
-    '&pound;103,000&ndash;146,000',
-    '&pound;103,000&ndash;154,800',
-    '&pound;103,000,000',
-    '&pound;103,040',
-    '&pound;103,100&ndash;154,600',
-    '&pound;103,350',
-    '&pound;103,400',
-    '&pound;103,608',
-    '&pound;103,804',
-    '&pound;103,804m',
     '&pound;103.09375',
-    '&pound;103.1',
-    '&pound;103.2m',
-    '&pound;103.3s.8d.',
-    '&pound;103.4',
-    '&pound;103.40',
-    '&pound;103.50',
-    '&pound;103.9m',
-    '&pound;1032',
-    '&pound;1033',
-    '&pound;1035m',
-    '&pound;103million',
-    '&pound;104,000',
-    '&pound;104,081',
-    '&pound;104,500',
-    '&pound;104,900',
     '&pound;104,975',
-    '&pound;104.0',
-    '&pound;104.41',
-    '&pound;104.43',
-    '&pound;104.55',
-    '&pound;104.57',
-    '&pound;104.99',
-    '&pound;1041',
-    '&pound;1049',
-    '&pound;105,000,000',
-    '&pound;105,000pa',
-    '&pound;105,100&ndash;126,200',
-    '&pound;105,200',
-    '&pound;105,272',
-    '&pound;105,575',
-    '&pound;105,900',
     '&pound;105.',
-    '&pound;105.00',
-    '&pound;105.16',
-    '&pound;105.3m',
-    '&pound;105.50',
-    '&pound;105.75',
-    '&pound;105.9',
-    '&pound;105.9m',
-    '&pound;1056.9m',
-    '&pound;106,162',
-    '&pound;106,162.50',
-    '&pound;106,250',
-    '&pound;106,666',
-    '&pound;106,750',
-    '&pound;106,875',
-    '&pound;106.1',
     '&pound;106.1m',
-    '&pound;106.2m',
-    '&pound;106.95',
-    '&pound;1060',
-    '&pound;1067',
-    '&pound;106million',
-    '&pound;107,950',
-    '&pound;107-&pound;714',
-    '&pound;107.00',
-    '&pound;107.20',
-    '&pound;107.40',
-    '&pound;107.8m',
-    '&pound;107million',
-    '&pound;108,000,000',
-    '&pound;108,000-',
-    '&pound;108,043.33',
     '&pound;108,749',
-    '&pound;108,950',
-    '&pound;108.30',
-    '&pound;108.4m',
-    '&pound;108.6m',
-    '&pound;1080',
-    '&pound;1087',
-    '&pound;1089',
-    '&pound;1089m',
-    '&pound;109,561',
-    '&pound;109,680',
-    '&pound;109,950',
-    '&pound;109.02',
-    '&pound;109.50',
-    '&pound;109.65',
-    '&pound;109.6m',
     '&pound;109.98',
-    '&pound;109.99',
-    '&pound;1093.95',
-    '&pound;10:1:0',
-    '&pound;10deducted',
-    '&pound;10k&ndash&pound;18k',
-    '&pound;10m-worth',
-    '&pound;10o',
-    '&pound;11&ndash;12000',
-    '&pound;11&ndash;13,000',
-    '&pound;11&ndash;15,000',
-    '&pound;11,000&ndash&pound;13,000',
-    '&pound;11,000,000',
-    '&pound;11,000-&pound;2,000',
-    '&pound;11,000-a-year',
-    '&pound;11,006',
     '&pound;11,022,000',
-    '&pound;11,026',
-    '&pound;11,072',
-    '&pound;11,084',
-    '&pound;11,105',
-    '&pound;11,109',
-    '&pound;11,110',
-    '&pound;11,140',
-    '&pound;11,154',
-    '&pound;11,159',
-    '&pound;11,197',
-    '&pound;11,198',
-    '&pound;11,210',
-    '&pound;11,220',
-    '&pound;11,230',
-    '&pound;11,236',
     '&pound;11,250',
-    '&pound;11,259',
-    '&pound;11,283',
-    '&pound;11,295',
-    '&pound;11,300,000',
-    '&pound;11,320',
-    '&pound;11,325',
-    '&pound;11,370&ndash&pound',
-    '&pound;11,375',
-    '&pound;11,400',
-    '&pound;11,486',
-    '&pound;11,500&ndash;17,500',
-    '&pound;11,536',
-    '&pound;11,545',
-    '&pound;11,586',
-    '&pound;11,600',
     '&pound;11,610',
-    '&pound;11,614,000',
-    '&pound;11,720',
-    '&pound;11,723',
-    '&pound;11,743',
-    '&pound;11,804',
-    '&pound;11,832',
-    '&pound;11,832.00',
-    '&pound;11,920',
-    '&pound;11,925',
-    '&pound;11,955',
-    '&pound;11,957',
-    '&pound;11,960',
-    '&pound;11,998',
-    '&pound;11.00(&pound;12.00)',
-    '&pound;11.05',
     '&pound;11.07',
-    '&pound;11.10s',
-    '&pound;11.15',
-    '&pound;11.1million',
-    '&pound;11.2',
-    '&pound;11.24',
-    '&pound;11.28',
-    '&pound;11.30',
-    '&pound;11.33',
-    '&pound;11.36',
-    '&pound;11.37',
-    '&pound;11.43',
-    '&pound;11.46bn',
-    '&pound;11.47',
-    '&pound;11.49',
-    '&pound;11.4m.',
     '&pound;11.53',
-    '&pound;11.54',
-    '&pound;11.58m',
-    '&pound;11.60',
-    '&pound;11.627',
-    '&pound;11.64m',
-    '&pound;11.65',
-    '&pound;11.6million',
-    '&pound;11.77bn',
-    '&pound;11.7s.',
-    '&pound;11.80',
-    '&pound;11.82bn',
-    '&pound;11.84',
-    '&pound;11.87',
-    '&pound;11.90',
-    '&pound;11.97',
     '&pound;11.99bn',
-    '&pound;11.9m',
-    '&pound;11/ha',
-    '&pound;11/hr',
-    '&pound;110&ndash&pound;120',
-    '&pound;110&ndash;125',
-    '&pound;110&ndash;170,000',
-    '&pound;110,700',
-    '&pound;110,891',
-    '&pound;110.00',
-    '&pound;110.25',
-    '&pound;110.625',
-    '&pound;110.6million',
-    '&pound;110/&pound;120',
-    '&pound;1105',
-    '&pound;111,100',
     '&pound;111,700',
-    '&pound;111,857',
-    '&pound;111.6',
-    '&pound;111.70',
-    '&pound;111.8',
-    '&pound;111.85',
-    '&pound;111.95',
-    '&pound;111116',
-    '&pound;111ma',
-    '&pound;112,390',
-    '&pound;112.098m',
-    '&pound;112.1m',
-    '&pound;112.30',
-    '&pound;1125',
-    '&pound;112million',
-    '&pound;113,000&ndash;169,500',
     '&pound;113,663.33',
-    '&pound;113,770',
-    '&pound;113.10',
-    '&pound;113.1m',
-    '&pound;113.2m',
-    '&pound;113.4m',
-    '&pound;113.8',
-    '&pound;113.9m',
-    '&pound;1134',
-    '&pound;114,218.81',
-    '&pound;114,300',
-    '&pound;114,668,095',
-    '&pound;114.00',
-    '&pound;114.1m',
-    '&pound;114.4',
-    '&pound;114.5',
     '&pound;114.6',
-    '&pound;114.9',
-    '&pound;114.9m',
-    '&pound;1149',
-    '&pound;115&ndash;145,000',
-    '&pound;115,957',
-    '&pound;115.',
-    '&pound;115.08',
-    '&pound;115.45',
-    '&pound;115.6',
-    '&pound;115.60',
-    '&pound;115.9m',
-    '&pound;1152m',
-    '&pound;115million',
-    '&pound;116,124',
-    '&pound;116,346',
     '&pound;116.1',
-    '&pound;116.10',
-    '&pound;1162132',
-    '&pound;1163.25',
-    '&pound;1164.00',
-    '&pound;1167',
-    '&pound;1168',
-    '&pound;116million',
-    '&pound;117&frac58',
-    '&pound;117.60',
-    '&pound;117.85',
-    '&pound;117.8m',
-    '&pound;117.95m.',
-    '&pound;1170m',
-    '&pound;118,749',
-    '&pound;118.54',
     '&pound;118.90',
-    '&pound;118million',
-    '&pound;119,500',
-    '&pound;119.5m',
-    '&pound;119.60',
-    '&pound;119.95',
-    '&pound;1193',
-    '&pound;1194',
-    '&pound;119m',
-    '&pound;11bn',
-    '&pound;11mfar',
-    '&pound;12&frac14;m',
-    '&pound;12&ndash&pound;2,000',
-    '&pound;12&ndash;14,000',
-    '&pound;12,000&ndash&pound;16,000',
-    '&pound;12,000&ndash;15,000',
     '&pound;12,000&ndash;16,000',
-    '&pound;12,000-a-man',
-    '&pound;12,000-a-year',
-    '&pound;12,004',
-    '&pound;12,031',
-    '&pound;12,050',
-    '&pound;12,086&ndash&pound;22,311',
-    '&pound;12,090',
-    '&pound;12,185',
-    '&pound;12,196',
-    '&pound;12,200',
-    '&pound;12,210',
-    '&pound;12,230',
-    '&pound;12,250',
-    '&pound;12,260',
-    '&pound;12,295',
     '&pound;12,386',
-    '&pound;12,386.',
-    '&pound;12,390',
-    '&pound;12,400',
-    '&pound;12,407',
-    '&pound;12,418',
-    '&pound;12,421',
-    '&pound;12,423',
-    '&pound;12,430',
-    '&pound;12,436',
-    '&pound;12,448',
-    '&pound;12,468',
-    '&pound;12,495',
-    '&pound;12,500&ndash;18,000',
-    '&pound;12,500&ndash;20,000',
-    '&pound;12,604&ndash&pound;13,955',
     '&pound;12,610',
-    '&pound;12,631',
-    '&pound;12,638',
-    '&pound;12,670',
-    '&pound;12,672',
-    '&pound;12,696',
-    '&pound;12,700',
-    '&pound;12,728',
-    '&pound;12,734',
-    '&pound;12,750&ndash;15,000',
-    '&pound;12,756',
-    '&pound;12,796',
-    '&pound;12,833.06',
-    '&pound;12,857',
-    '&pound;12,877',
-    '&pound;12,900',
     '&pound;12-&pound;15,000',
-    '&pound;12-ahead',
-    '&pound;12.02',
-    '&pound;12.05',
-    '&pound;12.07',
-    '&pound;12.07bn',
-    '&pound;12.1',
-    '&pound;12.10s.',
-    '&pound;12.12',
-    '&pound;12.12&shilling;6d',
-    '&pound;12.15',
-    '&pound;12.1bn',
-    '&pound;12.23',
-    '&pound;12.42',
-    '&pound;12.4m',
-    '&pound;12.50-&pound;32.',
     '&pound;12.50/100ml',
-    '&pound;12.55p',
-    '&pound;12.58',
-    '&pound;12.5bn',
-    '&pound;12.60',
-    '&pound;12.6bn',
-    '&pound;12.73',
-    '&pound;12.74',
-    '&pound;12.75/30ml',
-    '&pound;12.77',
-    '&pound;12.78',
-    '&pound;12.7m',
-    '&pound;12.86',
-    '&pound;12.8m',
-    '&pound;12.93',
-    '&pound;12.937',
     '&pound;12.95/m',
-    '&pound;12.964m',
-    '&pound;12.9m',
-    '&pound;12/hr',
-    '&pound;12/kw/year',
-    '&pound;12/month',
-    '&pound;120&ndash&pound;130',
-    '&pound;120&ndash&pound;150,000',
-    '&pound;120&ndash&pound;190',
-    '&pound;120&ndash&pound;210',
-    '&pound;120,000&ndash;150,000',
-    '&pound;120,000&ndash;160,000',
-    '&pound;120,000&ndash;180,000',
-    '&pound;120,000-a-year',
-    '&pound;120,000tagged',
-    '&pound;120,319',
     '&pound;120,460',
-    '&pound;120,500',
-    '&pound;120-150,000',
-    '&pound;120-a-week',
-    '&pound;120-plus',
-    '&pound;120.8m',
+)
+
+blocks_100 = (
+    ' %%/100!#295!%5,000!&able-e&!w"#ddr""ge""nd!!c"&orrect!/dcl-i-supersede!\'earning!"of!&return!!s',
+    '*)&aacute;n()il&iacute\'\'_propos",circ_la_mode"$elig&(;dericus(%wardi\'&gelnod\'#lf.)#gar*$ifu.)%weard*"ig\'\'scferth)#wig',
+    '\'!t(*he&aelig;r*&lburga+(ingadene+$mund+$sige+$wine"*gr&bgr&ggr%#dgr%#tgr$!/%!2%!g$\';-&lsqb&"/-',
+    '&%actin\')drenergic&(emitters&&globin\'.ranule-derived&\'helical(+rpesviruses\'\'ydrogen+"xy&#ifn&$keto&#mem&2phenylenediamineto&#tbp\'*ropomyosin',
+    '%$1(1)%\'2&bgr;1&#(1)&!-%$achr&&ntigen%%chain%!f%"gp&"rs%)iib&agr;3%)x&bgr;-/-$-ave_la_carte."0macr&sacute;rama&,;c&amacr;rya',
+    '($raha\'%nanda#"p%$$&amp%%deg;c&(ollar;14-%5,000-!6-$80bn,!2-!5.!0-!9-!m,#3.3',
+    ',#5.3,"60,#900%&frac12$!/%!2$&;01944&!d%#1/2&!6&!8%!2&#.99&!0&!3',
+    '&!0&!6%$4000%"50%#6.2%"7f%"82%(accounts&"dd(!r&%grell&$lbon&"nn%%berry\'"ta',
+    '&%olton\'"yd&$rown\'%ushes&"uy&%yways%$c000&(airnmuir\'\'rpenter(%riage&/hildren-in-arms)%ingar\'\'oquette&,larification)$kson',
+    '\'+mmissioners)(onwealth\'*nfidential(%sumer&/rc-check-output&(ustomers%%daily\'&vidson&#ean\'$cker\'$gree\'$sign&%ining&,ocumentation\'"pe',
+    '\'&uckman&%urney%"ef&%quals&\'riksson&&states&&xports%!f&#ehr\'"rm&#fff&#igs&#olk&)rac12;tsp)"34',
+    '\'&iedman%(galloway\'#mes\'!y&&eneral&&illies&%lover&$race\'$owth&(uildford%$h300(!8&&ammond\'#nks\'$rris',
+    '&%edges\'"in\'\'nderson($shaw\'%rdmen&#ill&$osey\'#use)#ton\'!y&%ughes\'\'mphreys%(industry\'+stitutional\'!t',
+    '&"ts%%james&&ournal%\'kendall&)gf/m&sup2&$omar%\'ladders\'$hann\'"ne&%erche\'#wis&#ink&&ohmann&&ybrand%%magic',
+    '(!y\'#son\'%ynard(!o\'&zzullo&\'easures&\'inus0.5*#1.1*\'4&deg;c*%:2750+$4920&%urray)#ell%(national&"ea',
+    '%"oa&&kuzumi&(ldershaw&$ring%"p.&%arkin($sons&(eace/ucm(!t\'&ntland&%laces("ns("tt&\'olymers\'#ors',
+    '&&rosper%\'quality%#r/l&&ammler&"ec\'&gional\'&liable&#ose%"s4&!5&$ager\'$lary("es&&chmidt("ot',
+    '&$ears\'!e\'&rvices&&haxson&#ime\'&nclair&\'mithers&$nack&\'omerset\'"ns&$pell(%ncers\'*ottiswoode*!s&%teele',
+    '&#ub2\'"p1)$43nd*#7sm(#219)"20(!3(!4\'$rdam&$wift&$zabo\'\'czuczko%%table&,eam-building("rs',
+    '&\'hursday&#ill\'$tles&#obi\'"ne&\'raining\'\'easurer\'&umbull%%unwin%#van%)w-powered&%arren\'#ugh&#ebb\'(dderburn',
+    '\'#lls\'$sson(!t&$hite)#ney)#row&(ilkinson(%liams(#son\'&reless%#xe8%!y&"et%$zaki&(eitungen',
+    '$#;dh%"kt"0ring;-resolution\'"bo\'(ngelholm\'$rdal"*uml;gypten&%rmste%#_la!&bgr&gt\'";0$%:sub2$$;-/-&(blockade+"er',
+    '&+elimination\'$rror&#gal\'\'lobulin&&lactam,#ase/*-producing,!s&,monosulphate&-naphthylamide&)oxidation&)particles\'#eak&#ray\'&everse',
+    '%)1&ndash;3&".1\'!2\'!3%#2-m%&chains$&=-0.29("58"1quo&lsqb;i&rsqb;f%,;o&equo/gcse&(s&equo;s"1sol&commat*&pound&\'gt;keyb%!*&!.',
+    '&&a&bsol\'>mipro&bsol;docs&bsol;count.sam\'\'nsi.sys\'"re&&b&bsol&!c&&darren\'3os&bsol;display.sys/\'expand./"q*0)basic.exe6#hlp6#ini\'&ustbin&$etc.',
+    '\'!p&*nort6&bsol&!p\'+hant&bsol*.&!s&$temp&$util&!w\'"in)0dows&bsol;system\'(orksheet"&ull;at&$ciro&&daniel&)ferdinand',
+    '(&ovanni\'\'uercino&%henry&"il\'%nlaid&&jusepe&#les&$many&(nicholas&%pirro&\'readers&(salvator(#ndy\'"ee(+lf-employed',
+    '($rrey&$that(#ere((irty-six&"up&(valuable\'%erily&-wolverhampton!&ccaron\',;a&ccaron;ak)!j)&kavski)#pek(,e&ccaron;ova)"ch',
+    '))sk&eacute)%tniks(!i#(edil;eri"$heck&";s"&irc;10&!2&"b6&"d2&!g&!s&"vg&!y",ommat&commat',
+    '(*dollar;382\'$;15%(%ahead($base($date,)(92,7,12)0%9,11)(5fv(&dollar;b&dollar;4("h3(9if(principal&gt;taxthresh(7pmt(principal-taxthresh(3sys&dollar;lifespan;\':lslive(,tco920121000)#ime',
+    '(*yellowlist)#our#\'py;1985)!9("92&(dalesman&$phil&(wizmatic!)deg;c/min%!t"(gr&micro%&ngr=+1%#tgr$#;63%"71',
+    '%"h5%$indo%!k%!m&!u%#r/c%#scf%"w/%!x"\'ivide;l"+ollar%&circ\'/&dollar;176,131/%53.4m/$9.50(&frac12',
+    '\'&\'39.95\'$:365\'&;.1*75*!0(!0)*&middot;43)!.*&000602."23.#735,"48.//&dollar;0.0001,#846-"96+#387',
+    '*$1294+"42,"43+#684+!m*!2*"3m*"41*"54,!5+"65*#629+"73,!m+!8',
+    '*!8+#035+!3+!4,!m+!7+!m*"90+!1+!4+!7((1&frac14*)ndash;1.22!42!8',
+    ')0,000&ndash;5,000-!.."00-!0-(m-a-year,)1,400,000-#.5m,$2.9m,!5,!9+%19.8m+#20m,!2,%4,647+"30',
+    ',"5m+#60m,%2,000+%70.6m,$1.4m,!3+"82+#90m*$101m,!9+&19,943+"35,!7-#.28,!8',
+    '+#50m,!2+"60-!m,!5-$,000.#477,$8.6m-!m,%9,000+"70,$2.0m+"80,"7m+&93,000',
+    '*\'200,000,%4,300,$5.3m+"10+030-&dollar;2,195,%3,300,%5,000,!6+"45+#50m,$1.2m,$5.7m,$9.3m+"60-$,000',
+    '+#80m+#90m,!2,$6.7m*#320,$2.6m+&30,000,!3+"40+&50,000,)6,500,000+#62m,!5+#70m,"3m',
+    '+"95,!9**400billion,$9.4m+"10+%38.6m+&40,000,$2.5m,$5.8m+&50,000+&60,000,$3.9m,!7+"70,#2.5',
+    ',$6.1m+"80+#90m*+500,800,000-!.-$each+"14,"6m,"9m+"20-$,000+630,000&ndash;2,295,000+#50m,!9+&72,283',
+    '+"88+"92*$600.-"0m,$3.50+"10-$,345,"1m,$7.5m+#20m,$6.7m,"9m+"40-$,625,!4',
+    '+"60+"70,!7+"80,"5m+"90-#.9m,"4m,$7.2m*/700,000,000,000,!2,$5.2m,!8+#10m,!3',
+    ',"9m+&35,531,#6.4+"40,$6.4m+"58+#60m+"73+"80+#90m,$3.4m,%8,077*\'823,600+"40-!m',
+    '+#72m,!5+#84m*\'900,000,#3.4,$6.7m,$9.7m+%14.1m,"9m+"20+"32+"40,"2m+#50m+#60m',
+    '+%73.9m,!6+"82,!8)*-&dollar;2*\'million)".0+-0=&pound;0.504(s90.1971-%1,410/\'610,000.$.0530"95/#512/#693',
+    '.!4/#.23/!3-#2.6.!1.!2-#3.2/$3495-%4,000.!7-%5,600-%60-90/$.404-#800."14',
+    '-#k23."40-\'p21.0941!51#737/$2.44/#3.5-&tsh1381"451"80-(zl11,100+"32,!6-\'billion.!n',
+    '+"54,"bn+!7+!9*"11+"32,!m+"4m+#517,!m+#686+!7+!9*)20-a-week+!2',
+    '+,5&ndash;1.75,!s+!6+!8*)3&ndash;2+!1+!2+!3+\'billion*,4&ndash;1.6m2$2.1m+".2+$0625+#207,"80',
+    ',"30,"bn+#440,"72,"90-!1-!5+*5/&pound;1,"55,!m+"6m+#735,"67+#825,"90',
+    '+\'billion*+5&ndash;1.82#2.3+,-&dollar;2.0,\'million+*1/&pound;1+"25+"4m+"5m+&7/word,"15,"75,!m+\'billion*$6020',
+    ',"50,"80+#130+"25+"40+"5m+!6+#75m+(8/&pound+!9*,7&ndash;2.55+#145,#one+#215,"63',
+    ',"20+)5&ndash;24#.255#65m+#724+\'billion,!n*+8&ndash;2.24!8+"6.+*7/&pound;1+"8m*#95m)$/2m.)(0&frac12',
+    '2%5,000*2,000&ndash;100,0006%2,000./-&dollar;20,000/&70,000.!.+#215,"23,"90+$307m,"37+#400,"20,#57m+$550m',
+    ',#50m+#800,"22,"90+#900,"19,$26.4,"50*+-&dollar;15+\'an-hour*$.000+"18+!2+!3+"53',
+    '+!6,!5+#75m+!9*#/lb*+0&ndash;1503&60,0003&75,0002\'200,000+#,00./0&ndash;125,0006\'250,000/!m,#378,#900',
+    ',\'an-hour+$.2bn,"5m,"6m,!9+,0&ndash;2000,#/m3,"00,!m+#bil.$lion+5m-&dollar;150m-a-year,!.*!1+$,000',
+    ',\'100,000-"90,1500&ndash;121,850,#900+%.305%-"75,"6m,#78%-!m+$2232+!m*32,000&ndash;120,000/$,000,#500+#.2m',
+    ',"5m*%3,000+$.34%+\'million*%4,040,#800+#.4m,"6m*%5,500+#.2m,"3m,"5m,"7m*!6+$,000',
+    '+#.2m,"3m*&7,000m+#.3m,"8m,"9m*%8,600,1800&ndash;136,000,#908+#.3m,"5m,"8m+"bn*!9+2,000&ndash;146,000',
+    '+#.2m,!4,!6,"7m+"7m+$9.00*-m-&dollar;14m4#20m).1&ndash;14,000*&,020.0+0100&ndash;14,800+#375+#400+$500m+#700',
+    '*".0,!9+"39,!m+"50+!6,!5+!7+#875,!8+"95,!9*/0&ndash;150,000+(,000,000/!m',
+    '+(-150,000,\'a-share+#.4m,"5m,"9m+!0+\'billion*!1+2,000&ndash;148,000/$,000+#.9m*%2,000,#600+#.2m,"9m',
+    '.!0,#150+#.3m,"9m+!0+!m*%4,500,#900+#.4m,"6m+!2+$8.00+!m*)5,000,000,#200',
+    ',"75,"9m*%6,600+#.4m,"75*%7,000,#500,#825+#.1m,#8bn*%8,087+#.2m,"6m*%9,000,#630',
+    '*\'billion+!n*\'million).2&ndash;18,0001"50*3,000-&dollar;15,000+\'100,000+#200,"30+#365+#400,"95+0500&ndash;18,000+#600,"75',
+    '+#800,"63+#900*#.00,!m+!2+!3,!0+!4,!0+!7*/0&ndash;180,000+2,000&ndash;140,0007&50,000+".2',
+    ',"5m,"9m+!0,!0,!m*%1,100,1850&ndash;162,500+#.7m,"8m+"5m+!m*$2.6m*!3+(,000,000,\'600,000',
+    '*!4+$,100,#400+#.6m,"9m+!m*/5&ndash;180,000+$,100+#.00+000-&dollar;17500+(m-a-time*%6,500,#600+".7+!m',
+    '+$,000/$,000+#.8m*$8.1m+!m,&-worth*%9,000,#200+#.7m,"8m+!m))3,000,000.!0,#58m+#100',
+    ',"43,&57,970+#385,"90-"3m+#400+\'500,000.!m,"13,/80&ndash;17,450+#600+#750.$,000+\'800,000,&50,000',
+    ',"74*#.00,!5,!m+!1+!3+"4m+"50+"75+!8*/0&ndash;150,0003&60,000+$,260+(-million+#.6m',
+    '+\'billion*%1,200,#400+!m*!2+$,400-"80+".8*$3.6m+!m*)4,000,000+#.0m,"5m+\'billion+!m',
+    '+".1,"6m,"7m*%6,088,#551,#866+#.6m,"9m+"bn+!m*%7,000,#200+".1+!m*%8,101',
+    '+#.1m,!8*%9,500+".2,"4m,"8m*"bn*\'million)+4&ndash;15m*$,065+#100+#200,"31+#330+\'500,000',
+    ',"80+#650+#838*#.1b+#3bn+!5+(8million+"99*/0&ndash;175,0003&80,000+2,000&ndash;180,0007&95,000,\'830,531+#.6m+"00',
+    '*$1.1m,"2m,"6m,"7m+!m*%2,000/$,000,1100&ndash;162,500,#500,#800+#.6m,!8*#3.3,!6*!4',
+    '+".4+"bn+!m*%5,165+$-150+#.0m,"8m*!6+$,800+#.4m+!m*!7+$,200,#940+#.6m',
+    '*38,000&ndash;186,000,#135+#.6m,!8+!m*%9,000+#.2m,"3m+!m*(m-a-year)*5&ndash;20*1,000&ndash;25,000.\'-32,000+#196+#200',
+    ',"90+#400,"80+#500.-&ndash;20,700+#800+#972,"90**-&dollar;5*!.+"05+#28m,!m+!4+"80',
+    ',!5*/0&ndash;250,000+),000-plus+.-&dollar;2,400,#200,\'million+!.,"2m,"3m,"9m+"0m+"bn+&m-200m,&illion*)1,000,000',
+    '+#.0m,"4m+!m,&-worth*!2+2,400&ndash;190,500+#.7m*!3+$,000/.&ndash;220,5008%9,500,#600+".1,"4m,"8m',
+    '+!m*%4,170,#255+#.6m,"7m*!5+(,000,000,#375,#600+$.1bn,"2m,"3m+"00*36,600&ndash;175,800+#.2m',
+    '*%7,000+#.5m,"6m,"7m*!8+$,000/.&ndash;223,000,#800/$,000+#.6m,"7m*!9+#.7m,"8m*\'billion',
+    '*"m.+&illion))6,000,000.!m/%-plus,"50,"70+#400.!m,#10m,#80m+\'500,000.!m+#600+#800',
+    '+#977*#.03,!m+!1,!8+"25,"bn+#3bn+"4m+"5m+"60*)0,000,000/!m+#.5m+!0',
+    '*%1,812+$.4bn-!m,"9m*%2,700+#.7m,"9m+!m*!3+$,000,#305,\'600,000+#.4m+!m*!4',
+    ',"8m+"3m+\'billion*/5,000,000-worth+#.8m+"bn*%6,000,#300,#400,1500&ndash;245,000+#.3m*%7,000/$,000,#400+!m',
+    ',*793-a-year,#800+#.1m,"9m+!m*!9+$,531+#.2m*(m-a-year+!.+&illion).7&ndash;34,000*(,000,000,"52+\'200,000',
+    '+#300+#400+0500&ndash;26,000.!m,"87+$600m*".1,!2-!5,"4m+"2m+"30+"40,!1+"5b',
+    ',+&ndash;23.3,!0,!5+!7,!0,!5+"81+"93,!7,"bn*/0&ndash;205,000+2,000&ndash;255,000+\'00/year*!1+$,859',
+    ',"4m*)2,000,000,#500+#.4m,!5,!6,"7m*%3,000,#650+#.1m*!4+$,505+".4,"5m+!m',
+    ',#624+#.2m,!9*%6,586,#816+#.1m,"4m+!m*!7+$,600+"3m+!m*!8+$,000/$,000',
+    '+#.5m+$5.3m*!9+$,200,\'400,000,#800+#.1m,"95+"bn*\'billion+!n)-8&ndash;23.002%5,000*(,211,061,"65',
+    ',"80+$500m+\'800,000.!m+#970*#.00,!m+"15+!2+!5,!0+"80,!4+!9,!1',
+    '+(,000,000+!s*!1+$,200,#331*!2+$,000,#400+!m*!3+$,700+#.7m*$4.1m*35,000&ndash;279,000+#.0m',
+    '+(m-a-year*36&ndash&dollar;1240+#.0m*!7+$,000/!0-"12,#500+!m*!8+#.1m,!2*%9,000+#.3m+#000',
+    '*\'billion).9&ndash;22,0001"95*%,000m+#100+#240+$400m+#700*".1,!1,"25+"25,!7+"40,!5',
+    '+!5,!0,!8+"60*)0,000,000+".4-!m,!7+"6m*!2+!m*33,000&ndash;236,000+#.1m+!m,&illion',
+    '*%6,000,#200,$512m*)8,000,000+#.2m+!m*"bn)!b*"il)*m&ndash;7m*!+*#-3m+"5m+"7m(+2&ndash;2.5',
+    ')0,000&ndash;2,400-/-&dollar;2,5000-!.-(m-a-year,%4,433+#11m,"4m,$6.7m+%23.5m,%4,000,"9m+#48m+"60,"5m,%9,100',
+    '-$,479,$3.2m+"80+"98*&107.0m+"12+"21,!5,$7.2m+"33+"60,!6-!m+#94m*\'200,000',
+    ',"4m+"13,!5+%27.50,$8.4m+%38.7m+%40.6m+#56m+%68.8m-!m+#73m+#80m*\'306,000+"15+"20',
+    '+"60+"90,%1,354*\'400,000+"21+#35m+#41m,!6,"8m+&57,758-#.8m+%79.8m+"80+"90*$525m',
+    '+"40-!m+"67+#70m*\'600,000+#16m,"7m+&22,352,$6.5m,"9m+"30+"40+"60+#94m*$700m',
+    '+#28m+"30+#50m+#78m+#80m,!5,!6+#90m,$5.5m-!m,$6.5m*0800&ndash;38,300-!m,"1m+#10m',
+    '+#27m+"50+"90*\'900,000)$-2.5*!3*.million-a-year)!.*!0+%0/bbl+"8m*315-&dollar;2.45/bbl,!m+#630+"bn',
+    '+&.3.1.20!3,#4.1+!0+!1+!2+!3+)5&ndash;3+!6,!m+!8+"bn*"30+!1+!2',
+    '+!5+!6+!8+\'billion*+5&ndash;4.5+&0-3.00,!.+!8,"bn+!b*#62m+!3+!5*+7&ndash;3.6+!1',
+    '+"5m-&illion*+8&ndash;3.24!5+!2+!3+!4+!6+!8*"95+#6bn+#9bn).0&ndash;26,0002%7,0001"40',
+    '.!.+\'200,000,"35,"50-!4+$600m+$800m+#900*/-&dollar;30,000+"30+\'billion*#.00+!1,"25,!m',
+    ',!4,!5+"4m+!7,!m+!8,!b,\'million*/0&ndash;265,000+$,714+(-million+#.00,"9m+"bn+&m-plus',
+    '*$1.3m*%2,000,#396,#500+#.6m*$3.4m+!m*!4+$,357,#600,#800+#.0m,"2m+!m*!5',
+    '/.&ndash;244,800+!m*!6+#.1m,!6*%7,000*!8+!m*#bil+!n*-m-&dollar;30m,&a-year,%worth+!.+&illion',
+    '+,ndash;32,000*%,000m+#200+\'485,000+$600m+#700*#.1m+"26,!m+!4+"58+!6,!5+!8+"95',
+    '+.&ndash;270,0002\'315,000+(,000,000+#.5m,!6+$4.7m*!1+$,000+!m*!2+$,710*%3,775,#800+#.4m+!m',
+    '+$,100+#.5m,"6m*/5&ndash;265,0002\'320,000+$,250,#778+#.1m*!6+$,000/$,000,#300+#.3m+"0m*%7,000',
+    '*%8,000+#.8m*%9,000+#.3m*\'m-worth).2&ndash;26,0001&32,0002%5,000*(,000,000+#200+#300+$400m+#500.!m+#700',
+    '+0900&ndash;28,700*#.0m+#125+"3m+"7m*/0&ndash;270,000+#.2m,"3m,$863m,"9m+"00*%1,000+!m*!2+$,000',
+    ',\'580,000*$3.4m*)4,000,000,#700+#.4m+!m*35,000&ndash;300,000+"00+!2+\'million*!6+$,000+#.1m,"9m+!m',
+    ',#200+#.0m+!m*#8.6*39,000&ndash;306,000,#446*\'billion+!n*"m.)23,000&ndash;38,250.$,000.\'-25,000+\'100,000,#25m+#333',
+    '+$600m*#.3m+!4+!5+!9*/0&ndash;280,0002\'300,000+$,314*$1.5m+"0m*%2,000,#500*!3+$,200*!4',
+    '+#.4m+!m*$6.3m*%7,000,#900+#.5m*$8.4m,"8m*$9.7m))4,123,709,"65+\'200,000+#300+#600,"90',
+    '+\'800,000*#.1m+"3m+"7m*%1,000/$,000,#158+#.6m*%2,000,#640+#.5m+!m*!3+$,000,#200',
+    '+#.0m,"6m+\'million*%4,000/$,000,#703+#.8m*%5,574+!m*!6+#.8m*%7,149+#.5m+!m*(8million',
+    ')/5&ndash;275,0001&30,0001&45,000*1,000&ndash;35,000,"40+#100+#230+#300,"42+#400+#700*#.00+#125,!m+"2m',
+    '+!5,-0&ndash;27.50+"6m+"74+"95*30,000&ndash;280,000-"69,#400+#.1m,"5m+!0,"00*!1*%2,000/$,000',
+    '+$,000*"5m*!6+%,000m+#.9m*!7*!9+*&ndash;420+$,000,#500+#.7m+!m*#bil*%m-40m,&a-year',
+    ')*6,000-plus.!m+#400,"86+#600,#40m+#900*#.25+"3m+#6bn+"7m+!8*/0&ndash;350,0002\'435,000+(-million',
+    ',"6m+"bn*%1,000+#.6m+!m*!2+*,000-worth,#500,\'600,000*!3+$,000*%4,000+#.7m*/5&ndash;315,0003&40,000',
+    '+(,000,000+#.5m*!6+$,900+#.1m,"2m,"6m*%8,000*!9+2,000&ndash;307,700*"bn)%7,100,"50+\'300,000+#500',
+    '*".1,!0,!m+!2+!5,!0+"6m+!7,!0+!8+"97*$0.7m*%1,000+#.2m*$2.2m',
+    '*)3,000,000+!m*!4+$,754+#.7m,"9m+#000+!m*35,000&ndash;306,000,#500*!6+(,000,000+!m*#70m*!8',
+    '+2,000&ndash;371,000+#.6m))8,000/day,"44+#301+$500m,"70+#792+#800,"50+#989*$-odd*#.20+"35+"4m',
+    '+"60,!5+!9,!m*/0&ndash;320,000+#.7m+"0m+#bil+.m-&dollar;285m*!1+$,600+!m*%2,900-"78+!m',
+    '+"0m+"7m*!5+%,000n,#700*!6+$,000+#.3m*"7m*%8,300+#.9m*%9,010+#.7m*!k)29,100&ndash;48,500',
+    '+#600*".0+"10+!4,"bn+!5,!0+"75,!m*)0,000,000+#.5m+!0*%1,000+#.3m*!2',
+    ',#361+!m*$3.5m*!4+$,110+#.8m*$5.0m*!6*%7,000+#.7m+!m*%8,000+#.4m*!9+$,000',
+    ',#700*"bn)(billions*(n-a-year)1m&ndash&dollar;4m*&illion(+3&ndash;3.50%4,0001".5)0,000-per-licence-"bn+"50-!m+"60-!m',
+    '*$100m,!5+&20,000,"5m+"50+%63.3m+"90*$219m+"50+"60+"80+#98m*&320.2m-!m,!5',
+    '+"45+.50&ndash;3,750,!5+"60+#70m,"5m+"90*$4000+%34.1m+"40+#54m+%76.93*\'500,000+"10+#30.',
+    '+#55m+"60+%78.2m+"90-!m*\'600,000-!0-!m+#20m,"6m+#72m+&82,522*$700m+&15,000+#30m',
+    '+"71*$831m+"40+"50+"99*/900&ndash;5,800-!m,$5.8m+"41,%4,476+"75+"90)*-&dollar;43"bn),.1&ndash;8.8',
+    '+!9*%2.1.3+\'billion*#3bn*(4billion,!n*+5&ndash;4.52$5.3m+!8+"bn+"m.*"63+!8+"bn*#728',
+    ',!m+!9*"85+"75+"bn*"90+!5+"bn)10&ndash&dollar;400\';36,0001#40m*1,000&ndash;40,000+#186+#400+\'500,000',
+    '+#900,&50,000*#-40*!.+#125+"4m+!8,!m*+0&ndash;4003&50,000+),000-plus+(-a-night+"00-!0+"bn',
+    '*%1,000+#.5m*!2+$,000+#.9m*$3.2m+\'million*%4,313,#750*#50m+!m*!6+$,000/.&ndash;459,000+#.5m',
+    ',#200+#.3m,"4m*$8.9m*$9.6m*"m.+&illion)%1,200.!m+$312m+#600+#800-"8m*#.4m+"5m',
+    '+"7m+!9*!0+.&ndash;400,000+(,000,000+"00+!m*%1,000+#.2m,"3m*"2m*%3,127+#.99+!m*%4,000',
+    '+#.2m*!5+.&ndash;420,000*%6,000+#.1m*"9m)&2,095m+#280+#500.$,000*".0+"18,!m+"50+!6',
+    '+"95,!m*)0,000,000,#391*"1m*%2,000+#.5m*%3,000/.&ndash;342,600+#.4m+!m*$4.6m+!m*/5&ndash;360,000+(,000,000',
+    ',"4m+\'million*%6,000+#.8m*"7m*%8,000,1500&ndash;456,000*!9+!m))3,000,000.!.+#280+\'900,000*#.25+"9m',
+    '+(,000,000,#335*%1,000-"79+#.3m*%3,250+#.4m,"6m*$4.4m*)5,000,000,#302+#.6m*%6,000+#.70+!m',
+    '+".9*!8+#.2m*%9,000*#bil-$lion*"m.).4&ndash;51,0002%2,0001&70,000*$,100+#501+\'600,000+#800*#.00',
+    '+!3,!m+"5m+#6m.+"78+"8m+"93,!5*/0&ndash;415,000+$,812*#1.5,"8m,"9m*%2,000/$,000',
+    '*!3*%4,000+#.9m*)5,500,000+#.6m*!6+(,000,000,#700+#.8m*)7,000,000*%8,000/$,000+#.5m*%9,000*!m',
+    '1&50,000*1,000&ndash;45,000./,000-50,000,000+#190+#249+\'500,000,&93,953+&795.91+#800,"34,&97,421*+-&dollar;40+*45,000,000+\'billion*#.0m',
+    '+"3m+!6+"9m*30,000&ndash;450,0006\'550,000+0-per-workstation*!1*!2+$,800+!m*%3,000+#.2m+!m*/4&ndash;442,000+#.8m',
+    '*!5+!m*$6.50,"8m*!7*)8,000,000+!m*"bn).6&ndash;42,0001&55,000*1,300&ndash;54,400+#400+0500&ndash;58,500+#666+#900',
+    '*".4+"5m+"6m*/0&ndash;550,000+(,000,000+$.000+!0*%1,000+".2*32.00/&dollar;362.50+!m*%3,000*%4,300,#444+#.5m',
+    '+!m*!6*!7+#.84*"8m*"bn)*7&ndash;50*(,000,000+#400+#720*\'.0m.net+"1m+"31+#5bn,"m.',
+    '+!8*$0.2m*!1+#.3m*%2,000*"3m*)4,000,000*35,000&ndash;450,000+!m*!6+#.1m*!8+$,000*%9,000)%8,100',
+    '+#915,"82*(-billion*#.1m+"25,!m+"4m+#5bn+#9m.*%0,109+#.7m+!0+(m-a-year*"1m*!2',
+    '*!4+$,000/$,000,#800*!5+$,000,#470+!0+\'million*)6,400,000*)7,000,000,$455.*%8,000/$,000*!9',
+    '*(m-a-year)%9,468+\'500,000*(-million*#.0m+!2,!m+"3m+!6,!0+"8m+!9*!0+!m*!1',
+    '*%3,000+!8*"4m*)5,000,000+!m*)6,000,000+!m*!7*\'billion+!n).bn-&dollar;4bn)$m-4m*&illion()4&ndash;6)0,000&ndash;6,000',
+    '+"16+"45+&58,160+#65m+#80m,%6,000+&95,520*$125m+"35+"40,!5+#57m+&72,000,!5+"96',
+    '+"20,%1,250+"34*/300&ndash;6,000-$,000+#24m*#400+"15+#20m,%1,900,%7,500+"30,!5+"90*$500.',
+    '+"40+&80,000*#650+"65*\'700,000+"80*$826m+"70*#914+#65m,!7+"95).-billion-worth)".0+!3',
+    '+!m*"13+"m.*"22+"5m*"35+!7+"bn*#45m+"bn*+5&ndash;6.5+".2+!4+\'billion+\'million',
+    '+\'billion*"75,!m+!8*"86*$95bn+!6).0&ndash;70,000*1,000&ndash;50,000+#342*+-&dollar;105!03#50m+$plus*#.2m',
+    '+"5m+"75+"9m*&0,000.+#/kw+%0,000,%00000+(m-a-year,&illion*)2,000,000+#.3m*%3,714,#829*!4+$,000',
+    '*!6+(,000,000*$7.4m*%8,000*"bn)%1,200+#300+\'500,000+$900m*#.2m+!4+"5m+"6m+"8m*"0m',
+    '+$,247*"2m*%3,100+!m*!4+#.2m*!5+!m*%6,000+\'million*!7*)8,500,000+#.2m+!m*!9',
+    ')%2,176+#400,&56,000+#500+\'600,000+0800&ndash;55,000,"40*#.2m+"3m-&illion+"9m*!1*%3,000,#404,#827',
+    '/$,000*$5.1m+!0*!6+(,000,000,#471+#.7m+!m*"7m*39,000&ndash;643,300).3&ndash;60,000*(,000,000,"96+#200+#533',
+    '*#.6m+!7,"5m*%0,156,#300*$1200+!m*)2,000,000*"3m*!4+\'billion*)6,000,000,\'900,000*%7,000+#.7m',
+    '*!9+!m*\'billion*"m.)24,000&ndash;67,000.$,000+#300+#530*#.3m+"4m*/0&ndash;615,000*%1,000+(-million*%3,000+#.8m',
+    '+$,000/$,000,#869*!6+$,000*%8,000,#273,#616*$9.7m*"m.).5&ndash;63,000*$,100+0300&ndash;63,500+#400,"75',
+    '+#900*#.1m+"2m-!.+!4+"8m*30,000&ndash;650,0006\'750,000+".5*!1*%3,500*$5.6m+\'million*%6,000*)8,450,000',
+    '*39,000&ndash;612,000,#487*"m.)26,000&ndash;76,500+0100&ndash;50,000+#200+#300+#600*#.1m+#375+"4m+"50,!m+"8m*%0,000',
+    '+#.0m+!m*$3.9m+"5m*%4,000*$5.6m*!7+$,000*"9m))7,000,000.#-up+#600+$900m*#.25+"4m',
+    '+"6m+"7m+"8m+!9*"00*%1,000*%2,900*)3,000,000+#.3m*%4,500+!m*)5,000,000*!6+$,000+#.3m',
+    '*\'million)28,000&ndash;64,0005&80,000.$,000+#100+#400,"68+$500m*#.3m+"50+!6+!9,!m*%1,000*%2,000',
+    '+!m*)5,000,000+#.5m*%7,000+"7m*!8+$,000+"0m*!9+$,606+#.5m*\'million)%9,036+#856+#920',
+    '+"4m+"5m+"7m+"8m+"90,!5*$0.50+!0*%1,000+#.5m*"2m*!3*#5.4+!m*!7',
+    '*"8m*"9m)\'billion0&-worth)(m-a-year((5&frac12*(ndash;100!60!70%8,0002#500)1,000&ndash;10,000-.-&dollar;6,000-!.,*9m.figures',
+    '+"84*/100&ndash;6,900-!m+"30+#83m*#240*\'337,000-!m+#90m*\'400,000,-5m.conversion+#34m+#63m,!8+#71m',
+    '+"80+"95*/500&ndash;9,000+"95*\'600,000+"45*\'700,000+&28,800+"50-,&ndash;9,600-!m*$800m+"40-!m+"85',
+    '+"75+"87)#-10*&a-week*\'per-day)!.*"0m*#125+"bn*#25m+!8+!9+"bn*"37*"40',
+    '*#6bn*#75m*"80*"93).0&ndash;60,0001"803$,000*1,000&ndash;60,0005&80,000.\'-a-seat.!..!0.!m+#212+$720m',
+    '*#.00+#125,!m+"2m+"3m+"5m+"7m+"8m*#/kw*+0,000&ndash/*,000-worth/%-plus+0-&dollar;700,000+#.00+#000',
+    '+!k+#m-1-&a-year-$plus-%worth*!1+$,500*!3+$,000*%5,840*$6.6m*$8.2m*!k*"m.)%1,015',
+    '+#500*$.125+!6*#/2m*%0,033+#.1m*"1m*!2+$,272+".9*!3*)4,000,000+!m*!6+$,817',
+    ',"6m*!9)%2,150+#800*$.125+!2+"50*/0&ndash;860,000+!m*!1*%2,894*%4,411,#548+#.4m,"6m',
+    '+$,000*"9m*!m).3&ndash;88,000*(,000,000+\'800,000*#.1m+"2m+!4,!m+!5+"6m+"7m+"9m-&illion',
+    '2\'800,0003&80,000+$,000,#900+#.0m+!m*)1,000,000+#.4m*$3.5m*%5,000*!6+#.3m,"4m*!7+$,000',
+    ')%4,000+#400.-&ndash;72,500+\'600,000*$0.9m*"2m*%3,780*"4m*$6.7m*$7.9m*%8,000,#460+!m*#9.7+!m',
+    ')%5,430-!2+#700.-&ndash;74,300,"38,)83,466.76+#800*(-million*#.1m+"8m+"9m*/0&ndash;725,000+(,000,000+!m*!1',
+    '+#.4m,"8m*$2.5m*"6m*%8,000,#600+#.3m+!m*"m.))6,000,000+\'400,000+#600*#.25+"5m+"7m',
+    '*%0,000+"00*$1.1m*)3,000,000+#.6m*#7.7+\'million*"8m*)9,000,000+#.1m*"m.))7,000,000,"64+#300+#600',
+    '+"7m+"9m*!0+#.2m+!0*%1,000*"3m*%4,783*%5,000*%7,000*!8*%9,500,#800)!8*$,000',
+    ',"40+0200&ndash;77,600,"69+$600m+0700&ndash;78,300+#800,#23m*".3+!4+"5m+"7m*$1.4m*!3+$,000*)4,000,000',
+    '*"7m*"9m*\'m-worth+&illion)!9*$,000*#.1m+"2m+"4m+"7m+"8m+"95,!m*!0*)1,000,000',
+    '*!4*%5,000*%7,000*$9.95),billion-plus)-m-&dollar;10m+"6m+&a-year((6&frac12*\'ndash;70%8,0000%9,000)0,000&ndash;8,0004%9,000-.-&dollar;7,000',
+    '*#100+#10m+#28m+&91,500*$200m+%22.6m*#310+"42*#495*#586*$600m*$700m+"50+"65+"99',
+    '+#18m+"50+"90)(-an-hour)#.09*#125+$54bn,!m+!6*"23+!5+!9*#375*!4+\'million',
+    '+#25m+(m-a-year*!6+"25+!5*"70+!5+"bn*!8++&ndash;10.2*+9&ndash;9.9+"bn)%0,220+\'400,000+#600',
+    '+#970*#.0m+"1m+"2m+"3m+"4m*+0&ndash;8002\'900,000+2,000&ndash;900,000/(,800,000/0-&dollar;800,000+(/800,000+&m-plus*%1,000*!2',
+    '*!4*%9,000*"bn*"m.*!s)!1*$,000+#164+#265+\'500,000*#.1m+"3m+"6m+"8m*!0',
+    '+(,000,000*%1,000*32,000&ndash;918,000/$,000,#696+#.9m*%3,000*!4+$,603*/5&ndash;800,000+$,000*%6,000+#.6m+!m*%7,000',
+    '*)9,000,000))2,000,000+#560+#631+$800m*#.00+"1m+!3+!5*!0+$,000+#.3m*%2,705*$3.7m*%5,000',
+    '))3,000,000+#100,"20+0500&ndash;81,600*#.6m+"8m*"0m*%3,000*!5+(,000,000*%8,000/$,000*29,00&ndash;821,000)24,000&ndash;82,000.$,000',
+    '+#300+#400+#900*".3+!5+"6m-!.+"8m*!0+(,000,000+"00*"1m,&illion*%3,900*!4',
+    '*)6,000,000*%7,000))5,500,000+#700,"77+#825*+-&dollar;26+\'billion*#.4m+"5m+"7m+"8m*!0+#.3m+.m-&dollar;700m',
+    '+!m*!3*%4,000*!5*%8,000+!m)!6*$,700+#880*".1+"2m+"7m+!8+"9m*"0m',
+    '*%5,000*!6))7,000,000+#200+#500+#711*#.3m+"54+#7m.+!8+"95*!0+$,000+\'million*%1,000',
+    ',"4m,"7m*!5*%6,000*"bn)&8,235m+#730+#957*#.0m*%1,000/$,000+#.5m*%2,255*!3+$,000',
+    ',!9*%4,000+#.6m*"5m*!6+$,000*#77m*%8,000,#513+#.0m+!m)!9*$,710+#800*#.1m',
+    '+"4m+"5m+"7m+"95*%0,000*%1,000+!m*$2.5m*%3,251*%4,000+!m*!5+"0m*%9,000,#103',
+    '((7&frac12*+ndash;9,000)#\'/z)1,000&ndash;10,0004%9,000-.-&dollar;8,000-!.+"11+"50+#65m*$100m+"40*\'246,667,"7m+"70',
+    '*\'300,000+#13m+"65*#450*#590*$600m+#10m+"26+"50*\'740,000+/50&ndash;11,650+#80m*#825*\'905,2791!.',
+    ')#.00+!m*!1+!0*"25*!3+!8*"47*"55+\'billion*!6+!0*!9+"bn)/0&ndash;100,000',
+    '1"903#,00*2,000&ndash;100,0005&90,000.!m+#300+#400+#500+#684+#865+#992*#.19+"9m**0&ndash;1m2\'800,000',
+    '+,-&dollar;800+#000*%5,000*)8,000,000+!m*%9,000+".3*,million-plus))1,580,000+$900m*#.0m+"2m+"3m+"4m+"82',
+    ',&illion*"1m*)2,500,000+#.10*"3m*%4,000*!5+$,797*"6m*%7,824*%9,000*!m)%2,500+#782*#.1m',
+    '+!7*%0,000/$,000+!0+!m*%2,000+!m*%3,000,#800*"4m*$6.8m*"bn)+3&ndash;111*$,921*!0',
+    '+!m*%1,000*%2,000*%3,418+!m*%7,000*"9m)24,300&ndash;93,000+#753*#.0m+"1m+"4m+"5m+"6m+"7m',
+    '*)0,000,000,#957+#.3m+%m-2.2*%1,000+!m*%2,360*%3,000/.&ndash;929,000*$4.2m*!5+$,000*%6,000+!m*%9,000',
+    ')/5&ndash;100,000*$,200*(-million*#.3m+"8m+"9m*)0,000,000/*-&dollar;1+#.9m+"00+\'million*$1.1m+!m*%4,107+#.1m',
+    '*)5,000,000*%8,000,#318)!6*$,900*#.2m+"3m+"6m+"8m+"9m*(0million*!1+!m*)3,000,000*%4,818',
+    '*%5,431*"6m*%7,000*%9,975))7,000,000+#100+#500+#600..&ndash;116,4009#500*#.2m+"4m+"6m+!7+"9m',
+    '+(,000,000*$1.9m*%3,000*!5*!6*!7*%9,000))8,000,000+#191+#230*".1,!m+"3m+"50+"8m',
+    '*)0,000,000+#.2m*)1,600,000*%2,000*%5,000/$,000*!7)!9*$,900*#.2m+"3m+"4m+!5+#615+"95',
+    '*)1,300,000*%2,000*%3,000*%4,000*%5,667*%9,066)#bn\'(*8&ndash;95)1,000&ndash;12,000-$/day+"48*#200*#300--&ndash;10,000*$400m',
+    '+"50+"70,!3*#655*$900m+"50)".3*"57*!6*!7+!0+!5+\'billion*"8b*,9&ndash;11.7',
+    ')/0&ndash;100,0001&90,000*2,000&ndash;100,000*#.0m+"2m+!5*10&ndash;1,000,0003".2+3,000&ndash&dollar;15$;1.2,#927+!.,"8m+!0*%2,729',
+    '*%4,356*%5,000*%6,237*%9,000*#bil+!n)(1&frac58*$,383+\'400,000*#.0m+"1m+"6m+#7m.+"9m*%1,000',
+    '*%2,000/$,000*%4,000+#.2m*!5*!9+$,000)$2.2m+"5m+"72+"8m+"9m*!0+".1*%1,000',
+    '*#5bn*#6.3*%7,000*%8,000*!9+#.2m)%3,200+#300*#.1m+"2m+"3m+"5m+"6m+"7m+"8m',
+    '*%2,087,#500+#.2m*!3*)8,000,000*"9m*!m)%4,835*#.0m+"5m+"9m*)0,000,000+!m*!5*%6,808',
+    ')/5&ndash;105,000*2,000&ndash;102,000+#680*#.1m+"6m*"00+!m*%1,000*)2,000,000*%3,000+#.9m*)5,000,000+#.9m*!8*%9,517',
+    '+#800+#900*#.1m+"3m+"55+"6m*!0+$,025+!m*%1,000*%2,000*%3,000*!4+$,000*!5',
+    '+#.50+!m*)6,000,000+#.2m*!7*%8,000/$,000*%9,020)/7&ndash;174,000*$,500+#700*#.1m+"5m*%0,000/$,000',
+    '+#.3m*!4*"5m*!8+$,200+!m*%9,508)!8*(,000,000+#400*#.3m+"6m*)1,000,000+#.4m*%5,000',
+    '*)6,000,000*%7,000*%8,000/$,000*!9+$,000)%9,000.$,000+\'500,000+#700*".1,!m+"4m+"6m+"95',
+    '+"bn*%1,000*%3,000*%4,100)\'billion)%m-10m((9&frac12*(ndash;10)(,000,000-!.+"63*#160*#200+"95*#300',
+    '+&57,000*#440*$500m*#600+"25*#700+"55*#800+"66+&90,000*#995,$9.00)".1+\'million*!2',
+    '+"9m*!4+!b*$54bn*"62,!5*"80+"5m)/0&ndash;110,0002&50,0002&80,000*$,600+1700&ndash;108,800+#973*#.4m',
+    '+"9m*$0,00.,0&ndash;1.3m+!.*!4*%6,000*%7,000,#294*.m-&dollar;110m,&a-year)!1*2,000&ndash;109,500+1700&ndash;122,000+1800&ndash;122,000*#.1m',
+    '+"6m+"7m+"8m*%1,467*%3,000*$4.7m*58,000&ndash;1,224,000*"m.)!2*(,000,000.!m+#202,"40*#.1m+"8m',
+    '*.3&ndash;16,900*%4,000*%5,000+!m*%7,000+#.7m*"8m)!3*(,000,000+#300,"12*".5+"6m+"8m*%0,000',
+    '*!5*%7,000*%8,135+!m)!4*$,000+#170+#300,"92+#500*#.1m+"3m+!5,!m*$0.4m',
+    '*)1,000,000*%4,000+!m*%6,780*%9,000+#.3m))5,000,000+#240*#.4m+!6*%0,000/+&ndash;1.1m/$,000+!m*%1,000',
+    '*%3,100*!7*$8.0m*!9+$,000))6,000,000.!m+#200*#.0m+"1m+"2m+"3m+!9*!4*!5',
+    '*!6*%8,105)%7,825+1900&ndash;117,500*#.19,!m+!2+"6m+$939%*%0,000*%2,000*%4,000+#.1m*"5m*"6m',
+    '*#.2m+$512%+"6m+#90%*%0,000/$,000+#.8m+!m*!2*%3,000*!5*%6,876*%7,000*!m)%9,000',
+    '+$195%,!m+#33%,"4%+$419%,"3%,"4%+$546%,#57%,"8%,#96%+"7m+#85%,"7m+$904%',
+    '*!8*!9+$,000($a1.2+$36bn*"00*!5+!0)$232m)#3.6)"40*%9,529)!5*"00*%5,818',
+    '))75-a-head)"96)#ddr)"e3)%ssign(-b&dollar;5/12),5=f&dollar;2)!n)!y(+c&dollar;12)&an125m+"30+!9(3d&dollar;t&dollar;g)$isk3',
+    '(/e5*f&dollar;3,0)#dit),v&mdash;user)#xit(*f&dollar;42(&ndash;1(#i8-(!l("m=)$arch)!e()nz100,000*%2,500(,obj&mdash;id2%state',
+    ')"il(!p)$arks)$eter(!s)#100)%2,200)#up5(*t2,700,000)*40,000,000)$hese(%us100+*30,000,000*)2,000,000*+350,000,000',
+    '+)0,800,000*.500-&dollar;us*$6000*"75**80,000,000+&50,000*)9,650,000(!v(#xd4)"e4)#x-m(!y)!y!&eacute\'#;an',
+    '*\'lements(&blouir(-cartel&eacute)%hange+)pp&eacute4";s)\'onomies.$ques**rch&eacute4";s*&ssaise0!s*#ute-!r+(v&eacute',
+    ')$rire+"ts+$vain)\'us_once*#yer($dain)\'elweiss)\'ucation(#gal+)it&eacute(#ire(-l&eacute;ment5%aires5!s+(grave;ve',
+    '+"im*#xir)#oge)$uard)+ys&eacute;e4!s(-migr&eacute;e*+nence_grise/!s*&ssaire,#ole(+nergetiques,"ie))onciation(\'pandage',
+    ')%ergne)+h&egrave;be)"ic+#ier*#nal,#rds*$sode)#oux(.quilibr&eacute+"pe-!s+&voques(\'rotique("sa)$time',
+    '*"ng*%tique)#ehi*$ndue)#iez*#ons)$offe*$iler-!s).rang&egrave;re-!e*#oit)*udi&eacute,$ante/#ine',
+    '(.urop&eacute;en(/v&egrave;nement))angelique)(enements)#ora"%caron#*irc;chelon"$egr/"(gr&infin%8ugr&tgr&egr&lgr&eegr&sgr$\';-&zgr=&\'optimal%!k%!m$3ave;l&egrave;vation',
+    '(%tapes)"re"1macr&iuml&omacr;n"#quo"+uml;256,700!&flat;2&!5\'",1\'"th"1ormula&formula;x3($;-in)+1&formula;2*"i-)#i-a)"kg',
+    ')!o*!f))positions)!r)!t*!l)$vots)%whose(#_in")rac12%-1%\'(&mdash;1(,ndash&frac34-";1/!0/"in',
+    '\'#\'we\'":s\');-&frac12)!3)"97)!a)#day)$hour)+millisecond)$time(!.(!b(%hours)!p)!r',
+    '("km(#lb.(\'million*!n(!n(&oz/15g($pint("st("yd&"3%\'$&ins\'#;d.(!x("yd\'!=',
+    '(/ndash&frac12;oz\'";d(#ins("kg(!m)\'-a-year(!p)#int&.5&ndash&frac14\'#;th&!7\'(;granule&%8;-nm&!9%#23*',
+    '\'#;in("km("rd*!s%#34%\'0&ins&ndash;1&ins\'(;-length)$mile("d.(%hours(#ips("km(#sec&"8%\'&&ins;.',
+    '($etc.(#in.*"s.(#ths%$56,0&%8;ths%)78;thbred*!s!$ge;0%#.05&!2"&gr&ggr$!/$%;-adh&\'counter',
+    '&&oxygen&!p%!0%+b&ggr;3&deg%$does%!f%!v"(rave_but\'"ne"&t&gt;2\'+results.txt#$;-35%!7$%0.033\'!5',
+    '&#2mm&#500\'!w&!6&#75%$#1.7%$/600%(0/&lt;10&!5%"30%!4&!1%*5&ndash;20&,0&times;10/l%!6',
+    '%!8&!0$%2,000%#.65&"85%"0%%!1%!4&!0%!5&!%%$6.9%$"3+%"0%&$/min',
+    '%)7.5&deg;c$,4&times;10/l%".0%"0%%!5$#5.0%"0%&!0\',&micro;mol/l%"15$#6.9%#000%!5$#7.8%!0',
+    '&$/min%"2%%%=24.2$!8%".3%#000$!9%)&ndash;12%!0$!d$+results.txt#!=$!0$$1.25%&/10000',
+    '%!2%"60$"21$"37%!8$!4$"54$\'splenic!\'half;oz&$pint"(earts_in"%strok!&iacute\'5;safj&ouml&dstrok;3ur1%;rdur',
+    '&$;lot".excl;ceramicas\'"el\'\'patatas("or\'&seguro\'$viva")ns;either"-quest;cuantos("es(\'gaseosa($inca(\'policia(#que("yo',
+    '!&le;0.1$"10$(50000/mm$!6$"90&!%"(gr&prime*#/20$%;gt10%*pl(209)/f\'$&=0.154":owbar&lowbar&lowbar&lowbar<C&lowbar&lowbar&lowbar&lowbar&lowbar_\'&lowbarf4&lowbar&lowbar;baked',
+    '\'&;there".sqb;b&rsqb;oth&0c&rsqb;ollective&/d&rsqb;ecisions&/e&rsqb;mpirical&)f&rsqb;or&0i&rsqb;niquities&,j&rsqb;udges&!l\')&rsqb;aws-$eave-&iberty&.m&rsqb;onopoly&,p&rsqb;eople&3s&rsqb;hort-termism',
+    '-+peculations&*t&rsqb;hat."is."us-!o&*w&rsqb;hat."en/"re\',*rsqb;hether#(trok;eba(*ukaszewski)$pawa")t&egr&gt/$"lt#*+-&gt;50ft',
+    '\'"25\'!3&!1\'*&ndash;1.3\'!-\'!1\'!4&"35&!4&!5&"80$,1&ndash;1.1%,$5.0%%".0&"25',
+    '%#0.5&"00&#ghz%!1%!2&".5%!3&#2.6%!4&!0%"50%"60%!7&!0%!8',
+    '%$:100%$f&gt$(2&frac12&(ndash;43%".2&$4-23&!8%%0/min&"00%!4%!5&!%$,3&times;10/l%".0%%00dpi',
+    '%!6%!8$"40&!%&!0\'#/mm%!4%!=$#5.4$+6&ndash;140%!-%"0%$!7%#.30&!5',
+    '%!6$#8.5%)8.7228392$#95%$!a%$&gt/%%lt&gt\'&-f5&gt%\'polline%!t$\'back&gt((space&gt%&ody&gt%\'reak&gt$&cheikh',
+    '&\'nfig&gt*\'file&gt%Etrl&gt&lt;alt&gt&lt;shift&gt&lt;f3&gt%"ue$$d&gt%+atabases&gt%-d-mmm-yyyy&gt%(evice&gt*(-name&gt%\'iv&gt;s\'$1&gt\'$2&gt\'$7&gt%%ouble$$e&gt',
+    '%\'sc&gt;.$$f&gt%%10&gt%$5&gt%$9&gt%!f%$inal%\'ront&gt$)giggle&gt%$loat%$roan$$have%!e&$/the\'&you&gt',
+    '%&ome&gt$!i%%f-alt(\'ssoc&gt%&llg&gt%-mplicature&gt%&nitial&#put&$sert%!t&#&gt&!s$*keyword&gt$)laughs&gt%&oad&gt',
+    '%&ain&gt%.etaphysical&gt$#nxr$$o&gt%%ne&gt%&vfl&gt$\'package&"ge&"ra(&dox&gt&(stantial%&fffttt%!h%$lant%9rocess&mdash;name&gt;.com',
+    '3%;.com$\'quit&gt$)return&gt%"ls%\'otfl&gt$(sniff&gt%#ome%0p&gt_&lt/sp&gt\'s%&top&gt%+ubstitution$&tab&gt&"ll%#hat&%ey&gt%\'ogether',
+    '%"wo$$user$$vera%\'oyez&gt$7window&gt&lt;cascade&gt*/s&gt&lt;tile&gt$!x$$y&gt%#our#!=$"24$"35$$4.81$#530!%mdash',
+    '&$&bgr\'=mdash&mdash&mdash&mdash&mdashD2&mdash&mdash&mdashVn&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash&mdash,(;actions-$lots\'(pound;69&!\'\'!a(&nxious\'$give\'#how\'(nonsense\'$star\'$they',
+    '\'$were&!*&"/2\'$thou&$;.81\'#0.7)!9\')1,450,000(".2($0,71(!1)!2)!5)!6("24',
+    '(*54&mdash;5)!6("84\'!2(!0)!5("16("31)!4)!5)!9(&50,000(&60,000)!3)!4',
+    '(!0)!1(&25,000("45\'\'450,000\'"81(!8\'"95(!6\'+accentuated)%tress*!s("da)*ministered(&ffinic',
+    ',"st(.ll&mdash;games)#oud)+pha-tubulin)"so+&&mdash))ternately(\'m&mdash)#ato(&nother)\'y&mdash0%;team(\'ppendix**roximately(&uction',
+    ')\'d&mdash)"nk)(rrington)%thing(!e)%anery)%cause)$fore)#gan)%loved+!w)#set)%tween((ig&mdash((lackhall',
+    ')"th("px($roke(*urnopfield)&siness(&ye-bye\'$call+"ed)!n*&&mdash*#ada(&hapter)\'ihuahua("iu($lass',
+    '(#oal)"me*&munity*(placency+\'osition,%unded)*ncentrated,%rning*&ducted*)servative,"tt*&tinued)$smid)#uld*"rt',
+    '*"er)$xhoe(!p($rude\'%dance(!c(#ead)&erness)"ny)\'pending*#uty)%rived)%viate(\'irectly))scussions',
+    '(!o)&&mdash)#ing)"wn($pmne("yp\'$each("d.)$ward("el(\'lements*$usis(\'mbraced)&phasis(&ngaged',
+    '(&unuchs(\'venwood*"ry(\'xecuted)&pected\'!f(%aisal),st-improving)\'vourite(&eeling(%ilesa*#ing)#rst(#lat((or&mdash',
+    '*#mer*$nara*"ty))undations(#ull))ndamental\'&garden(!c(&eneral)$orge)!t*$ting(%ladly*"ss("ot',
+    ')(vernment(%raeme))eat&mdash*"en(\'uffawed\'%harry)\'s&mdash)"ve+&&mdash*#ing(#ere)$tton(.is&mdash;match(#old*&lywood',
+    '(#uge\'\'i&mdash(\'f&mdash/&;there(\'gnoring((ncreased)\'dicates+&vidual))structing*&urance)1ternational&mdash)%voked+$lved-#ing($onic',
+    ')"on(\'s&mdash/F;ever&mdash;wrong&mdash;with&mdash;her($taly)!s\'\'jealous*#nne(#ohn)!o(#ust\'$karl(!e(%issed($nown($pnlf',
+    ')$rger)#ura(&eading)"ft)!t(\'iberals)"es)"ne(&ooking)"ve($ucas($ysed\'$made)!n)#pam',
+    '*#ket-"ed*#tin*$xist)!y(%cdunn($eant)\'ntioned)0thyl-d-aspartate*"re(*ight&mdash((onitored)$stly("um)%savat',
+    '\'&namely)#val(#eat)%ither)#ver("on*!e)(rth-east)!w\'%often("ld)-igonucleotide()nly&mdash(&pinion(\'r&mdash',
+    ')%natus)*thorhombic(%ulton)!p)!r)%tside\'%paint)%nting)%trick("er*$haps)#ter(#hil(#icc*$ture',
+    '(!l)!a*\'y&mdash($oint)"st()resumably-"ed*#tty)&obably*\'testing("sp($uppy\'%queen\'&racing)%dical',
+    ')$ther(#ead+#ing)$call*&eiving+"nt)&member)(portedly*+resentative)\'sidents\'!s(#aid)$muel)$njiv)+ves&mdash;.',
+    ')\'heduled(!d)"lp(&ection)$eing(%herry(#ick)#gns)#nce("jp(,ocialisation-"ly)$lids)#nic(&p&ouml',
+    ')%ecial))urs&mdash($tars*#yed)#ern)&ockton)\'retched("un*)day&mdash\'!t(\'ableaux)"ke+!s("ea)/chnically&mdash',
+    ')!n((he&mdash*"ir*\'m&mdash*&refore)*inks&mdash*"rd)#ose)#ree+!w($itle($oday)&morrow)!o*!k',
+    '(&rained)#ied*$mdon(&ubulin)%nisia\'*ubiquitous($nder)#til\'$vane)\'riously(!e)\'nezuela(#ol.\'\'whether)$oops',
+    '(#ill*#son)$nner(#ord+#ing*"ld)%unded("pe\'#yac*!s("et\'#zee"<gr&agr&rgr&agr&thgr&ohgr&ngr$";-%#gal',
+    '(#mol%$u/ml"+icro/kg/day&+;-component1!s()direction\'"by\'#can(*i/&micro;g*"kg*!l*"ml+!m()omparison\'"eq',
+    '()specially\'$g/10(\'cholera\'$l/cm)%min/g\'%m-100("/l($ol.1+!l*#/15+!h,!r\'"sv)%/hour#$ddot',
+    '"6dash&ndash&ndash&ndash2(;norwich\'(pound;18&%:very&%;1.95*&9/50ml(*0&amp;sup51!6)!0)!m(#136)"85($2.95)"0m)"45',
+    ')"87(&459/60)"84($5.2m)"36)"76)"98(#602)"25)"35)"60*!9)"74(!7)"14',
+    '*!7)"61*!2)"70)"81)"92($8.95)"07)"12*!4)"36)"42)"57)"64)"72',
+    '(#912)"48\'420&ndash;14&ndash;17(!3(!4)#.99(%5,000(!6($9.95(!f(#x10\';3&ndash;15&ndash;16&ndash;6(#()s(!0)"96',
+    '("70\'!4(!.)&00p.m.)"95(%0,000("44("69(#838(!9("ft($p.m.\'#500)!2("13',
+    '("0%)"0m)!2\'!7(!4)"74(!5)$&deg)!0(!9($p.m.\'$8.49(#000(#637\'"9%',
+    '("75("8%\'%ailed(%nimal)!y*#one\'$bach*%kward)!d(\'irthday)$shop($oard(#uck\'%c1200*"50',
+    '((ommunity)\'ntained\'"d.(&arling(\'enderah()ismissal\'(#oes\'$easy(!g(!n)%gland(!r\',fulfil&ndash*!l+%-back',
+    '(0ingerbread&ndash($reat\'#her)!y("is("ut\'!i("nd*#ian\'\'lothian\'$many)!r*$ried\'&normal)!w',
+    '\'#ome("ne((peration("ur\'!p()assengers(/reconstruction\').oportionality\'*&vision\'-quasi-stellar\'$rain)!p(!e)$late("om',
+    '(!o)#rry(.tand-off&ndash(,ubordination\'!t(#hat))eir&ndash*!n*"se(&oronto)"te\'+unctions.43).orthodox&ndash("te\'"vb',
+    '\'+wal1970.tmp(#hen)!y*$ever(%icked\'"x5"\'gr/&kgr$%;subn$&=&ohgr".um;150,000,000%!5%!6%\'elected%!l!-oacute\'briain',
+    '(#csa(!e($noma(#sas(%thinn"$hgr\'%#;-3")slash;lve(%nsker(%rslev-"-1(\'sterdal,$lars(&ystein"(tilde;be',
+    '(#***&+ffentlicher/*rechtliche&$hman&7kologisch-demokratische&!l\'\'-d&uuml.8;r-&uuml;l-e-mi-yecek-ti\'#and\',dziyhutagiyn&5r&aelig;faj&ouml;kull\'4af&aelig;j&ouml;kull\'"en\'!n&+stasiatiska',
+    '/$ring/;s&mdash;fp&ouml&mdash;whose7\'sp&ouml&\'tztaler&1vp&mdash;austrian/\'defence/(economic/\'foreign//vice-chancellor&)zg&uuml;r!<pgr&tgr&ohgr;xo&phgr;apmakon$"/2%!k$":1$\';-allyl',
+    '&)electrons&)prototype&\'systems%#227%!d"\'hgr;80d%$=1/6")lus;0.026)!9*!0(#115)"40)"55*!9)"60',
+    ')"71*!5)"80(#250&!1\'!1&!2\'#.00&!3\'$&deg&!5&$6976&!7\'$&deg&$8339',
+    ',\'1a/hour.+h&amp;sup-1+!1,!6,"nm+#2nm*!1*"5%("10)#5db)#6db)#7db(\'2&deg;c)#2db)!5',
+    '(!4)!7("50)"db(!6)!0(&forces(\'moldova"%ound%&(&amp;3/8\'&dollar\'.frac12;million,!8\'%mdash\'%pound',
+    '>(&pound;s,#;10-!s&&+39.99\'%99.99&#;.5(#743)"79("99\'*0-&pound;4(#.00*#328+"bn*#759*#8bn',
+    '*#027*#198-!m+"bn*#4bn*#7bn)$20bn*#2bn*#4bn*"5m*#8bn*!m)#39m)$442m*!m',
+    '++&ndash;0.60*"4p*"6p*"8m*"9m*"m.)!6*!5*!8*%98712*"bn)"70*!4*#5bn*"bn',
+    ')"92*!8*!9(#00s\'11&frac12;-million.!4))middot;50))ndash;1.31"5m0!5/!20$,0000!m/!7(/,000&rehy;worth',
+    '6#4004%9,000-%a-day/%month/$week-$plus.%ounds,#.00-"50,%/year,!s+31&ndash&pound;1,667+$2.99+%3,207+"4.',
+    '+!6+$8.90*&10,113+&1,000m+%2,000+!6+!7*"21+"5m+!7*%30.54,!m+(1,262.50+%4,000-#390',
+    '+!6+!7,$,000+!8*"40,$,822+!2+!3+!5*#50.+!8*%60.50+!1+!4+!6',
+    '+%6,885+%7,000+!8+%9,399*%80.24,!m+%2.391+!4+!7+"8m*)90-a-term-#odd)#102+!3+!8',
+    '+!4+!6+$7.73*&20,000+!6*"37+%8,000*#45m+!6*"51+!2+!7+!8*"61+%2,306',
+    '+!3+%4,000+$7.00+!8+%9,950*"70+!3+!5+%6,409+!9*&82,300+!3+%5,971+!8*"92',
+    '+!8*"oo)/200&ndash;1,800,--&pound;1,500*"14+%5,928+!7*#20m+!2+!3+!4,#.42+!5,$,724+$8.13',
+    '+!3+!5*%40.00+!4+!5+!8*450&ndash&pound;3,450,\'-a-term,#.00+!2+!3+!6*"60+!1+!5',
+    '+!4+!5,$,000*&80,000+$4.40+!6*%95.95+$8.25)#304+!7,$,571*"12,#.88+$4.53+!5',
+    '+!2+%5,300+%8,500+!9*"30+!3,!m+!4+%5,000+!6,$,289-#792+)8,825.45p*"41+%2,000',
+    '+!3+!4+"6m*#50.+%2,000+!5*&60,000+!8*&71,000*"81+%7,000*$92.8+!5+!7+!9',
+    '-!.+!5*"11,$,384+!2,$,336*&24,554+!7+!8*"31+!7*"40+!4*&56-odd+!8',
+    '+"7m*%73.00*"91+!2+!3+!5+!9)/500&ndash;4,000,(,000,0000&-worth,\'-a-year,&/2,000-%3,000+%3,425+!4',
+    '*&14,000*"20+!6*"30*"45*!5+!5*"65+%9,130*"71,$,000+!3+!4+"5.+!6',
+    ',$,000+!3+!8+!9*"90+!7+!8+(9,163.71*"oo)$606m*&16,249+$9.80*"21+!2+%7,000',
+    '*"31+!3,$,000+%4,000+!5+!9*"41+%2,000*#50m+!1*"60+$5.24+48&ndash&pound;45,000*"70+!7',
+    '**80,076,000+!1+!2+!9)%700m.+!4+!7*"10*&28,685*"30+$1.25+!5+$8.57*"45+!9',
+    '*"62,(-a-night+!5+!7*&71,500+!3,$,115+!5+"6m+!9*"89*"91)\'800-odd,!m*#10m',
+    '+!9*"26,$,000+!8*&32,000+!8*&51,000+"4m+!8+"9m*&60,00000&ndash;2,130,000+!8*"75+!9',
+    '+%6,000*"92+%5,000+!6,$,000)*900-a-game+!8*"12+(4.4s.0d.*"20+!5*&30,500+!2+!5*&45,000',
+    '+!4*"70*"80+!4*"96,$,000(1-&pound;1,500,000)#2bn)#5-0)$a-go+%share),for-&pound;1)%level(".0*(0=dm2.52',
+    '*#15m+!m*"25+#7bn*"3m*#4bn+!m*"54+"6m*"60+!m,!.*#7bn+!m*28&mdash&pound;1.80',
+    '*\'9/200ml,#50g+"8m+#bn.)"1.*"0p*"15+"8m+!m**2&frac12;p+#.5d+!m*"45+!p*#52n',
+    '+"bn+!m+%s.0d.*"6m*"85+!m,&illion*"9m+#stg*\'million*%s.0d.,"3d),2&ndash;1.46*#06m+!p',
+    '*$24bn+!5*!3*!4+"m.*25&mdash&pound;1.35,)ndash;1.7+,-&pound;1.50+\'billion,!n+\'million*"65+"9m+\'million*#7bn',
+    '*-9-&pound;1.69+&/300ml+(1billion+"bn*\'m-rated))3&ndash;3*"1m*!2+#3bn+"bn+!m*"34*$57bn+#bn.+"m.',
+    '*#68m*!7+!5*!8*\'billion*!s)+4&ndash;1.8*$15m.+!m,&illion*#49m*#5bn*"69+!m*"8m',
+    '*(9million*&m-plus+!.*$s.0d.!.)/5&ndash&pound;2*#.0d*20&mdash&pound;1.90+$+50p+*-&pound;15+!p,1&mdash&pound;2.10*"1m*\'2/300ml*$44bn',
+    '+!p*!6*#82m*#94m+\'million*!b*"m.+,illion-rated)+6&ndash;2.33!4*20&ndash&pound;2.65+%/60ml*"1m*@2&frac12&mdash&pound;2.22&frac12*!3',
+    '+!3*\'5/100ml+"bn*,6&ndash;2.33+#5m.*!7+!m*\'9/300ml,$75ml*"m.+%worth*"s.,#0d.,"8d)#700',
+    '+!9*"2m*!4*-5-&pound;5.70*#68m+!m*"7m*#8bn+!m*%s.6d.)+8&ndash;2.4*#06m*!1*"2m*!3',
+    '+!p*#5bn*"8m*\'9/100ml+"45)#904*"2m*!3*#4bn*25&ndash&pound;8.95+#/25.#0ml*!7*$9/12,%200ml',
+    '-!g*"bn*%s.0d.(./12&shilling;0)%4,000*!m)!8)"kg)\'unwaged(10&ndash&pound;1006"20/\';12,0001"5m0"300!5',
+    ')#,00,40&mdash&pound;20,000.,ndash;40,000-!+-.-&pound;11,500.%a-day.%rated-!.."00-!m+"45*#120-$,000+"52+"85',
+    ',!8+"50+"61+"70+"80+"95,!8*\'322,000+"40,!6+"80*#406+"22,(5-a-year+"58',
+    ',!6*#518+"71,!6+"85*#600,!9+"25+"50+"60+"95*#715,!9+"37+"57',
+    ',!5*#800-.-&pound;12,400+"50+"62*#903+"16+"40+"50+"85+"95,!9)*-&pound;151"221"99',
+    '*"11+"2m+%5,000*\'a-month*#but)$.07m+!8+!9*\'12s.6d.*#26m+"bn*"31+$24m.+!6*"43',
+    '+!8+!9*"52+!5+"bn+\'million+%s.6d.*"60+!7*"72+!7*"82+"45+"m.,&illion',
+    '+!3+"5.+!6+!8+49&ndash&pound;179.99)+/&dollar;20+9pound;7.50/&pound;5&pound>%/free*"15*%tonne)40&ndash&pound;10,0008"658"900$;150*2,000&ndash;120,000',
+    '/$plus/\'signing.!..//&pound;101,200+#750+#945,"80*--&pound;1,0003"203"752#275+-a&rehy;ticket,&-night,%piece+#per',
+    ',#lus+%worth*$.000+!1+"2m+"3m+"56+"6m+"74,!7*$/1.1,"20+"ha*,0&ndash;1400+!*',
+    '+&-a-man,%worth+%00000*"2m*"85*!k*"m.+!n)%1,000+#443+#658*#.1m+$378m,!m+"50',
+    ',!5,!m+"8m+"92*#/2m*!0*!2*"50)12&ndash&pound;170*\',102.52+#694+#700,"50+#950*#.15',
+    '+"50,!6*$1.27*!8*!9)33,000&ndash;146,0006&54,800.$,000,"40+1100&ndash;154,600+#350+#400+#608+#804.!m',
+    '+!1+"2m+&3s.8d.+!4,!0+"50+"9m*!2*!3*"5m*\'million)%4,000,"81+#500+#900',
+    '*".0+"41,!3+"55,!7+"99*!1*!9))5,000,000."pa+1100&ndash;126,200+#200,"72+#575+#900',
+    '+"00+"16+"3m+"50+"75+!9,!m*$6.9m)%6,162.#.50+#250+#666+#750+#875*".1',
+    '+"2m+"95*!0*!7*\'million)%7,950*+-&pound;714*#.00+"20+"40+"8m*\'million))8,000,000.!-,%43.33',
+    '+#950*#.30+"4m+"6m*!0*!7*!9+!m)%9,561+#680+#950*#.02+"50+"65,!m',
+    ',!9*$3.95)$:1:0)(deducted)1k&ndash&pound;18k)\'m-worth)!o(-1&ndash;120001%3,0001%5,000)7,000&ndash&pound;13,000-$,000---&pound;2,000.&a-year,!6',
+    ',!6+"72+"84*#105,!9+"10+"40+"54,!9+"97,!8*#210+"20+"30,!6',
+    ',!9+"83+"95*\'300,000+"20,!5+.70&ndash&pound,!5*#400+"86*0500&ndash;17,500+"36+"45+"86*#600',
+    ',%4,000*#720,!3+"43*#804+"32-#.00*#920,!5+"55,!7+"60+"98)1.00(&pound;12.00)+!5',
+    '*#10s+!5+\'million*!2+!4+!8*"30+!3+!6+!7*"43+#6bn+!7+!9+"m.',
+    '+!4+"8m*"60+"27+"4m+!5+\'million*$77bn+"s.*"80+#2bn+!4+!7*"90+!7',
+    '+!m)#/ha+!r)10&ndash&pound;1200$;1252&70,000*$,700+#891*#.00+"25+#625,\'million*+/&pound;120*!5)%1,100',
+    '+#857*".6+"70+!8,!5+"95*#116*"ma)%2,390*%.098m+"1m+"30*!5*\'million)33,000&ndash;169,500',
+    '+#770*#.10,!m+"2m+"4m+!8+"9m*!4)(4,218.81+#300+\'668,095*#.00+"1m+!4+!5',
+    '+!9,!m*!9)/5&ndash;145,000*$,957*!.+"08+"45+!6,!0+"9m*"2m*\'million)%6,124+#346',
+    ',!0*$2132*$3.25*$4.00*!7*!8*\'million)(7&frac58*#.60+"85,!m+$95m.*"0m)%8,749*#.54',
+    '*\'million)%9,500*#.5m+"60+"95*!3*!4*!m)"bn)$mfar(*2&frac14;m*1ndash&pound;2,000/\';14,000)7,000&ndash&pound;16,0003\';15,000',
+    '-&-a-man0$year,!4+"31+"50+586&ndash&pound;22,311+"90*#185+"96*#200+"10+"30+"50+"60+"95',
+    '-!.+"90*#400,!7+"18+"21,!3+"30,!6+"48+"68+"95*0500&ndash;18,0004&20,000*6604&ndash&pound;13,955',
+    '+"31,!8+"70,!2+"96*#700+"28+"34+/50&ndash;15,000,!6+"96*&833.06+"57+"77*#900',
+    '*%ahead)#.02+!5+!7,"bn*!1+#0s.+!2,,&shilling;6d+!5+"bn*"23*"42+!m*-50-&pound;32.',
+    '+"5p+!8+"bn*"60+"bn*"73+!4+&5/30ml+!7+!8+!m*"86+!m*"93,!7',
+    '+#64m+!m)#/hr*\'kw/year*%month)10&ndash&pound;1308&50,0008"907#210*2,000&ndash;150,0006&60,0006&80,000.\'-a-year.&tagged+#319',
+    '+#500*(-150,000+&a-week+$plus*#.8m',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_11 = (
+count_11 = 6694
+
+heads_11 = (
     '&aelig;lfgifu',
-    '&aelig;lfheah',
-    '&aelig;lfric',
-    '&agr&bgr',
-    '&amp;d',
-    '&amp;name',
-    '&cir',
-    '&dollar;0.05',
-    '&dollar;0.08',
-    '&dollar;1.4',
-    '&dollar;1.53',
-    '&dollar;1.54',
-    '&dollar;11',
-    '&dollar;16m',
-    '&dollar;2.7m',
-    '&dollar;250m',
     '&dollar;3.2m',
-    '&dollar;3.3m',
-    '&dollar;600,000',
-    '&dollar;60m',
-    '&dollar;70,000',
-    '&dollar;750',
-    '&dollar;900',
-    '&eacute;chelle',
-    '&eacute;cole',
-    '&eacute;tranger',
-    '&formula;.',
-    '&formula;i',
-    '&frac23',
-    '&lt;0.05',
-    '&mgr',
-    '&micro;mol',
     '&phgr;29',
-    '&pound;1,700',
-    '&pound;1.40',
-    '&pound;115,000',
-    '&pound;14.50',
-    '&pound;15.50',
-    '&pound;18m',
-    '&pound;2,300',
-    '&pound;2.30',
-    '&pound;2.49',
-    '&pound;2.6',
-    '&pound;2.6m',
-    '&pound;2.7',
-    '&pound;2.7m',
-    '&pound;21m',
-    '&pound;2500',
     '&pound;27.50',
-    '&pound;2million',
-    '&pound;3.2m',
-    '&pound;3.40',
-    '&pound;3.6',
-    '&pound;3.7m',
-    '&pound;34,000',
-    '&pound;36,000',
-    '&pound;380',
-    '&pound;4000',
-    '&pound;425',
-    '&pound;49.95',
-    '&pound;495',
-    '&pound;5.25',
-    '&pound;575',
-    '&pound;6.00',
     '&pound;6.75',
-    '&pound;63',
-    '&pound;68',
-    '&pound;78',
-    '&pound;8000',
-    '&pound;800m',
-    '&pound;80m',
-    '&pound;86',
-    '&pound;9.25',
-    '&pound;9.5',
-    '&pound;l',
-    '&pound;x',
-    '&zgr',
-    '\'20s',
-    '\'86',
-    '\'88',
     '\'a',
-    '\'alf',
-    '\'allo',
-    '\'uns',
-    '\'we',
-    '\'yes',
-    '+3',
-    '--',
-    '-20',
-    '-a',
-    '-b',
-    '-ed',
-    '-loss',
-    '.',
-    '.22',
-    '0&ndash;2',
     '0&ndash;5',
-    '0-6-0',
-    '0.01%',
-    '0.33',
-    '00:23',
-    '00:38',
-    '01.01a',
-    '0272',
-    '0483',
-    '051',
-    '0642',
-    '0904',
-    '0908',
-    '0v',
-    '1&frac14',
-    '1&ndash;16',
     '1&ndash;8',
-    '1\'s',
-    '1(5)',
-    '1*',
-    '1,000lb',
-    '1,25',
-    '1,750',
-    '1-',
-    '1.13',
-    '1.18',
-    '1.19',
-    '1.44mb',
-    '1.50',
-    '1.5p',
-    '1.7m',
-    '10&ndash;14',
     '10(2)',
-    '10,500',
-    '10-mile',
-    '10.10',
-    '10.13',
-    '10.25',
-    '10.40',
-    '100&mgr;m',
-    '100-share',
-    '100km',
-    '1014',
-    '1020',
-    '1033',
-    '1040',
-    '1072',
-    '1080',
     '1095',
-    '10a',
-    '10ins',
-    '10st',
-    '11&ndash;15',
-    '11(1)',
-    '11-plus',
-    '11.',
-    '11.0',
-    '11.00am',
-    '11.10',
-    '11.11',
-    '11.30pm',
-    '1102',
-    '1105',
-    '1176',
     '1180',
-    '1183',
-    '1187',
-    '1190',
-    '12&frac12',
-    '12&ndash;18',
-    '12-',
-    '12.',
-    '12.0',
-    '1201',
-    '1202',
-    '1205',
-    '120mb',
-    '1213',
-    '125g/4oz',
-    '125th',
     '1260',
-    '1268',
-    '1289',
-    '1293',
-    '1299',
-    '12a',
-    '13&ndash;16',
-    '13-year',
-    '1301',
-    '1303',
-    '1310',
-    '1312',
-    '1319',
-    '1320',
-    '1335',
-    '1345',
     '1350s',
-    '1356',
-    '1371',
-    '1373',
-    '13c',
-    '14(1)',
-    '14,500',
-    '14.5%',
-    '14.9',
-    '1401',
-    '140mph',
-    '1415',
-    '1430',
-    '1472',
-    '1478',
-    '1479',
     '1482',
-    '1489',
-    '14a',
-    '14s',
-    '15&deg',
-    '15&ndash;30',
-    '15,000,000',
-    '15-month',
-    '15-year-olds',
-    '15000',
-    '1509',
-    '150ft',
-    '1514',
-    '1518',
-    '1523',
-    '1526',
     '1528',
-    '1556',
-    '1561',
-    '1577',
-    '1590s',
-    '1593',
-    '15min',
-    '15pc',
-    '16&ndash;20',
-    '16,500',
-    '16-1',
-    '16-year',
-    '16.7',
-    '16.8',
-    '16/18',
-    '165,000',
     '16mm',
-    '16pc',
-    '17&ndash;19',
-    '17.9',
-    '18&ndash;20',
-    '18.2',
-    '18.6',
-    '18.9',
-    '180&deg;c',
-    '19.4',
-    '1920\'s',
-    '1921&ndash;2',
-    '1970a',
-    '1979-80',
-    '1980-87',
-    '1982/83',
     '1983/4',
-    '1986/7',
-    '1987/8',
-    '1989.',
-    '1989c',
-    '1991b',
-    '1993/4',
-    '1994-95',
-    '1:20',
-    '1:50,000',
-    '1tbsp',
-    '2&frac14',
-    '2\'s',
-    '2,500,000',
-    '2.1%',
-    '2.1.3',
     '2.18',
-    '2.55',
-    '20&ins',
-    '20&ndash;1',
-    '20(1)',
-    '20-mile',
-    '20000',
-    '200ft',
-    '200mhz',
-    '200ml',
-    '200mm',
-    '2050',
-    '20mb',
-    '22.1',
-    '22.2',
-    '22.3',
     '22.6',
-    '22.8',
-    '221&sol;89',
-    '22p',
-    '23-24',
-    '23.1',
-    '23.2',
-    '23.4',
-    '230,000',
-    '23cm',
-    '24.5',
-    '24.6',
-    '25&ndash;29',
-    '25ft',
-    '25m',
-    '26-28',
     '26-way',
-    '28-30',
-    '2800',
-    '2900',
-    '29p',
-    '2d.',
-    '2hr',
-    '2tbsp',
-    '2x',
-    '3,000m',
-    '3,700',
-    '3-6',
-    '3-series',
-    '3-wood',
-    '3.2.0',
-    '3.2.1',
     '3.23',
-    '3.40',
-    '3.5-inch',
-    '3.50',
-    '3/2',
-    '30&ndash;35',
-    '30.5',
-    '300m',
-    '300ml/&frac12',
-    '30c',
-    '30min',
-    '30mm',
-    '3200',
-    '34,000',
-    '350g/12oz',
-    '352',
     '35pc',
-    '360,000',
-    '370,000',
-    '37112-13',
-    '37335',
-    '37372',
-    '37870',
-    '37931',
-    '38314',
-    '38361',
-    '3:2',
-    '3d.',
-    '3pc',
-    '4,300',
-    '4,700',
-    '4-7',
     '4.1%',
-    '4.1.1',
-    '4.2.2',
-    '4.20',
-    '40&ndash;1',
-    '40(1)',
-    '40-minute',
-    '401st',
-    '40g',
-    '42.5',
-    '45cm',
-    '45s',
-    '46,000',
-    '464',
-    '466',
-    '469',
     '473',
-    '482',
-    '484',
-    '488',
-    '48th',
-    '491',
-    '49th',
-    '4s.',
-    '4x10',
-    '5&ndash;14',
-    '5.16',
-    '5.2%',
-    '5.20',
-    '5.25-inch',
-    '5.3.3',
-    '5.40',
     '5.9%',
-    '50&deg',
-    '50&deg;c',
-    '50+',
-    '50-year',
-    '50000',
-    '500mm',
-    '502',
-    '503',
-    '506',
-    '50:50',
-    '51-year-old',
-    '512kb',
-    '515',
-    '519',
-    '52-year-old',
     '526',
-    '53,000',
-    '53-year-old',
-    '533',
-    '535',
-    '54,000',
-    '541',
-    '542',
-    '543',
-    '546',
-    '54th',
-    '551',
-    '559',
-    '55p',
-    '56,000',
-    '563',
     '568',
-    '573',
-    '579',
-    '583',
-    '584',
-    '58th',
-    '59-year-old',
-    '59/60',
-    '590',
-    '596',
-    '5v',
-    '6(4)',
-    '6-string',
-    '6.13',
-    '6.16',
-    '6.17',
     '6.3%',
-    '6.30am',
-    '61-year-old',
-    '62,000',
-    '62-year-old',
-    '621',
-    '628',
-    '62nd',
-    '632',
-    '635',
-    '637',
-    '640k',
-    '650,000',
-    '651',
-    '652',
-    '665',
     '671',
-    '674',
-    '676',
-    '679',
-    '689',
-    '692',
-    '696',
-    '6cm',
-    '6h',
-    '7&agr;-hydroxy-4-cholesten-3-one',
-    '7(1)',
-    '7.00pm',
-    '7.13',
-    '7.2.1',
-    '7.20',
-    '7.50',
     '7.7%',
-    '7/jg',
-    '704',
-    '70pc',
-    '71st',
-    '72&deg;c',
-    '724',
-    '739',
-    '755',
-    '758',
-    '75mhz',
-    '762',
-    '765',
-    '772',
-    '775',
-    '779',
     '782',
-    '787',
-    '788',
-    '789',
-    '799',
-    '7b',
-    '7pc',
-    '8.11',
-    '8.20',
-    '8.3%',
-    '8.6%',
-    '8.8%',
-    '80\'s',
-    '80586',
-    '80pc',
-    '812',
     '82(1)',
-    '828',
-    '831',
-    '832',
-    '834',
-    '838',
-    '842',
-    '843',
-    '854',
-    '857',
-    '85th',
-    '860',
-    '864',
-    '888',
-    '890',
-    '8ins',
     '9&ndash;0',
-    '9&ndash;7',
-    '9-1',
-    '9-5',
-    '9.10',
-    '9.3%',
-    '9.9%',
-    '935',
-    '937',
-    '95p',
-    '961',
-    '962',
-    '963',
-    '994',
-    '9m',
-    'a*',
     'a-gliadin',
-    'a-side',
-    'a.s',
-    'a.w',
-    'abb&eacute',
-    'abby',
-    'abductions',
-    'abed',
-    'abernethy',
-    'abhors',
-    'abjectly',
-    'abominably',
-    'above-ground',
-    'abrasives',
-    'abscond',
-    'abseiled',
     'abseils',
-    'absorbency',
-    'abstemious',
-    'abutment',
-    'abysmally',
-    'accentuation',
-    'accost',
-    'accretions',
-    'accusatory',
-    'acetyl',
-    'acid-base',
-    'ack',
-    'ackerman',
-    'ackford',
-    'acolyte',
-    'acquiror',
     'acquisitiveness',
-    'ad-hoc',
-    'ad.',
-    'adenine',
-    'adenoids',
-    'adhesions',
-    'adjourning',
-    'admixture',
-    'adolphus',
-    'adoringly',
-    'adrenal',
-    'adriaan',
-    'adrien',
-    'adrspach',
-    'adsorbed',
-    'adss',
     'adulteration',
-    'advancements',
-    'adventitious',
-    'adventurism',
-    'advisability',
-    'adze',
-    'aei',
-    'aeon',
-    'aeromagnetic',
-    'aesop',
-    'aesthete',
-    'aestheticism',
-    'aethelheard',
-    'aeu',
-    'affirmatively',
-    'affric',
     'aficionado',
-    'aflame',
-    'africaine',
-    'africanus',
-    'afro-american',
-    'afshar',
-    'afters',
-    'age-sex',
-    'agfa',
-    'agnathans',
-    'agoraphobic',
-    'agrostis',
-    'aguilar',
-    'aguirre',
-    'aherne',
-    'ahistorical',
     'aide-de-camp',
-    'aids-related',
-    'air-borne',
-    'air-raids',
-    'aircoupe',
-    'airdrops',
-    'airshows',
-    'airstrips',
-    'airy-fairy',
-    'ais',
-    'aisled',
-    'aisling',
-    'akersfield',
-    'akhtar',
-    'al-bashir',
-    'al-fatah',
     'al-husseini',
-    'al-kassar',
-    'al.',
-    'aladi',
-    'alamo',
-    'alans',
-    'albedo',
-    'alcan',
-    'alcohol-related',
-    'aldaniti',
-    'alderton',
-    'aleksander',
-    'alethea',
-    'alfalfa',
-    'alfons',
-    'alger',
     'alhred',
-    'alienates',
-    'aliquot',
-    'alizarin',
-    'all-action',
-    'all-girl',
-    'all-or-none',
-    'all-star',
-    'allason',
-    'allie',
-    'allis',
-    'allister',
-    'alliterative',
-    'allman',
-    'allophones',
-    'allott',
     'allotting',
-    'alloway',
-    'allt',
-    'alma_mater',
-    'aloneness',
-    'alors',
-    'alphas',
-    'alsager',
-    'also-rans',
-    'alsthom',
-    'aluinn',
-    'alzheimers',
-    'amanuensis',
-    'amanullah',
-    'amarc',
-    'ambushing',
     'amenorrhoea',
-    'amer',
-    'amerada',
-    'american-led',
-    'american-owned',
-    'amess',
-    'amiability',
-    'amiloride',
-    'amine',
-    'ammonite',
-    'ampersand',
-    'amphora',
-    'amulet',
-    'amur',
-    'amuses',
-    'ana-h',
     'anachronisms',
-    'anastasia',
-    'anciently',
-    'ancillaries',
-    'andernesse',
-    'andrex',
-    'aneuploidy',
-    'angeli',
-    'angevins',
-    'anglepoise',
-    'anglophile',
-    'animating',
-    'animator',
-    'anionic',
-    'annexing',
-    'annotate',
     'announcers',
-    'anstruther',
-    'antacids',
-    'antagonising',
-    'anthers',
-    'anthropoid',
-    'anthropomorphism',
-    'anti-avoidance',
-    'anti-colonial',
-    'anti-crisis',
-    'anti-depressant',
-    'anti-european',
-    'anti-fascists',
-    'anti-feminist',
-    'anti-german',
-    'anti-human',
     'anti-hunt',
-    'anti-immigrant',
-    'anti-japanese',
-    'anti-mafia',
-    'anti-missile',
-    'anti-peptide',
-    'anti-tory',
-    'anti-western',
-    'anticipations',
-    'antidepressant',
-    'antigone',
-    'antimalarial',
-    'antimatter',
-    'antipathetic',
-    'antisymmetric',
-    'antiviral',
     'antoni',
-    'antonov',
-    'anzac',
-    'aped',
-    'aphrodisias',
-    'aping',
-    'apla',
-    'apoplexy',
-    'apor2',
-    'appleshare',
-    'appleson',
-    'appletalk',
-    'appliqu&eacute',
-    'appointment.',
-    'appraisingly',
-    'apprehending',
     'appurtenances',
-    'apr.',
-    'aptidon',
-    'apulia',
-    'aqaba',
-    'aquarist',
-    'aquila',
-    'arabesques',
-    'arad',
-    'arakan',
-    'aral',
-    'arantxa',
-    'arbitrageur',
-    'arcadian',
-    'archiepiscopal',
-    'ardakkeans',
     'ardis',
-    'ardley',
-    'arfon',
-    'arfu',
-    'argot',
-    'argyllshire',
-    'arie',
-    'arion',
-    'arkhina',
-    'arkleton',
-    'armadillo',
-    'armband',
-    'armouries',
-    'arne',
-    'aromatics',
-    'arpa',
     'arps',
-    'arsed',
-    'arsenical',
-    'arsonist',
-    'art-form',
-    'artaud',
-    'artemia',
-    'arthropod',
-    'arthurian',
-    'arthurton',
-    'articular',
-    'articulations',
-    'aru',
-    'aruba',
-    'arup',
-    'asahi',
     'asap',
-    'ascoli',
-    'ascom',
-    'ashburton',
-    'ashbury',
-    'ashen-faced',
-    'ashkenazy',
-    'asic',
-    'asil',
-    'askaris',
-    'aslam',
-    'aslan',
-    'asmodeus',
-    'asphyxiation',
-    'aspin',
-    'assemblers',
     'assignees',
-    'assignor',
-    'astbury',
-    'aster',
-    'astuteness',
-    'asvat',
-    'aswell',
-    'ataturk',
-    'atheistic',
-    'atpase',
-    'attempters',
-    'attenuator',
-    'attesting',
-    'atwood',
-    'aubagne',
-    'auer',
     'augurs',
-    'aurelio',
-    'aurelius',
-    'aureus',
-    'auriol',
-    'australis',
-    'autarchy',
-    'authoress',
-    'authorisations',
-    'autocatalyst',
-    'automating',
-    'ava',
-    'avcs',
-    'avens',
-    'average-sized',
-    'avize',
     'avogadro',
-    'awol',
-    'axillary',
-    'ayes',
-    'aylesbury/buckinghamshire',
-    'ayloch',
-    'az&oacute;car',
-    'aza&ntilde;a',
-    'azapo',
-    'azerbaijanis',
-    'b&amp;h',
-    'b&ouml;lkow',
-    'b-2',
-    'b-52s',
-    'b-movie',
-    'b-tree',
     'b15',
-    'baa-baas',
-    'bab',
-    'babergh',
-    'baby-sitting',
-    'babycham',
-    'babylonia',
-    'bac',
-    'bacardi',
-    'bacher',
-    'bachman',
-    'back-arc',
-    'back-door',
-    'backchat',
-    'backgammon',
-    'backhanded',
     'backley',
-    'backlist',
-    'backlit',
-    'backplane',
-    'backref',
-    'backstairs',
-    'backups',
-    'bada',
-    'badenoch',
-    'baedeker',
-    'baer',
-    'bagnall',
-    'bagpipe',
-    'baguette',
-    'bahadur',
-    'bahdu',
     'bahia',
-    'baidoa',
-    'bakehouse',
-    'bakelite',
-    'bakr',
-    'balaguer',
-    'balbirnie',
-    'balcerowicz',
-    'bald-headed',
-    'baleen',
-    'balk',
-    'ball-tampering',
-    'ballerinas',
-    'balletic',
-    'ballistics',
-    'balls-up',
     'balmain',
-    'balsa',
-    'baluster',
-    'bamboos',
-    'bampton',
-    'band-pass',
-    'banderas',
-    'bandsaw',
-    'bandung',
-    'bannisters',
-    'banshees',
-    'bantams',
-    'bantock',
-    'bantustan',
-    'bar-room',
-    'bar-tailed',
     'barbe',
-    'barberini',
-    'barbon',
-    'barbusse',
-    'barden',
-    'bardic',
-    'baresi',
-    'bargemen',
-    'barkers',
-    'barkley',
-    'barnbrook',
-    'barnstorming',
-    'barnton',
-    'baroda',
-    'barque',
-    'barrantes',
     'barrelled',
-    'barrio',
-    'bart-williams',
-    'bartolomeo',
-    'barts',
-    'bassanio',
-    'basta',
-    'bataille',
-    'batchelor',
-    'bather',
-    'bathos',
-    'batik',
-    'battista',
-    'battle-scarred',
-    'battus',
-    'battuta',
     'battyburn',
-    'baumol',
-    'bawl',
-    'baxendale',
-    'baynton',
-    'bbmf',
-    'bbs',
-    'beagles',
-    'beagrie',
-    'beaky',
-    'beal',
-    'bearish',
-    'beaubourg',
-    'beaufighters',
-    'beauteous',
-    'bechtel',
     'becks',
-    'bed-sitting',
-    'bedge',
-    'bedi',
-    'bedivere',
-    'beefburger',
-    'beeline',
-    'beery',
-    'beezer',
-    'begat',
-    'beget',
-    'begets',
-    'begonia',
-    'begotten',
-    'behemoth',
-    'behrens',
     'beira',
-    'belhaven',
-    'bell-shaped',
-    'bellagio',
-    'bellied',
-    'bellman',
-    'bellsouth',
-    'belper',
-    'belying',
-    'bencher',
-    'bene',
-    'benevolently',
-    'benito',
-    'benns',
-    'benoit',
-    'benthic',
     'benzimidazoles',
-    'berating',
-    'berbizier',
-    'bernd',
-    'berners',
-    'bernician',
-    'berret',
-    'beryllium',
-    'beseech',
-    'beseechingly',
-    'besiege',
-    'best-dressed',
-    'best-kept',
-    'best-looking',
-    'bestiality',
-    'bestiary',
     'betel',
-    'betelgeux',
-    'bethan',
-    'bethany',
-    'bethe',
-    'better-paid',
-    'bettina',
-    'bettinson',
-    'bf109s',
-    'bg',
-    'bhrca',
-    'bi-directional',
-    'biafra',
-    'bianchi',
-    'biba',
-    'bicmos',
     'bicycling',
-    'biddable',
-    'biddlecombe',
-    'biddulph',
-    'bidston',
-    'big-headed',
-    'bight',
-    'bilal',
-    'bilge',
-    'bilinguals',
-    'billows',
-    'bilsthorpe',
-    'bindweed',
-    'binoche',
-    'bint',
-    'biocontrol',
     'bionic',
-    'biophysical',
-    'birchfield',
-    'birendra',
-    'birth-control',
-    'birthmark',
-    'birtwistle',
-    'bishkek',
-    'biswas',
-    'bitc',
-    'bite-sized',
-    'bitingly',
-    'bitmaps',
-    'bivalve',
-    'bizet',
-    'black-clad',
     'black-eyed',
-    'black-market',
-    'blackacre',
-    'blackboards',
-    'blackeyes',
-    'blackhall',
-    'blacklegs',
-    'blackly',
-    'blackmailer',
-    'blackshirt',
-    'blackspots',
-    'blacon',
-    'blanchflower',
-    'blanketweed',
-    'blantyre',
-    'blare',
     'blasters',
-    'blea',
-    'bleaker',
-    'blencowe',
-    'blessedly',
-    'blest',
-    'blighton',
-    'blinks',
-    'blips',
-    'blix',
-    'blockwork',
-    'blood-sugar',
-    'bloody-mindedness',
-    'bloomin\'',
-    'bloor',
-    'blount',
     'blowpipe',
-    'blu-tack',
-    'bluecoat',
-    'bluesy',
-    'bluey',
-    'bluffs',
-    'blumler',
-    'blummin',
-    'bmp',
-    'boaters',
-    'boban',
-    'bockingford',
-    'bodicote',
-    'bodkin',
-    'bods',
-    'bodyweight',
     'bogarde',
-    'boggles',
-    'bogle',
-    'bohun',
-    'boilermakers',
-    'boilie',
-    'boing',
-    'bokhara',
-    'bole',
-    'bolney',
-    'bolt-hole',
-    'bomb-making',
-    'bonapartism',
-    'bone-marrow',
-    'boney',
-    'bonhoeffer',
     'bonito',
-    'bonnington',
-    'booby-trapped',
-    'book-lined',
-    'bookstores',
-    'boole',
-    'borderers',
-    'borderland',
-    'boreal',
-    'boreham',
-    'boron',
-    'borrie',
-    'borussia',
-    'borwick',
-    'bose',
-    'bosnich',
     'boso',
-    'bosphorus',
-    'bossed',
-    'botch',
-    'bothies',
-    'bouffant',
-    'boulez',
-    'bourassa',
-    'boutin',
-    'bovver',
-    'bow-tie',
-    'bowd/oxford',
-    'bowness',
-    'boxwood',
-    'boxy',
-    'bps',
     'brachiopod',
-    'bracketing',
-    'bradlaugh',
-    'bragged',
-    'brahman',
-    'braised',
-    'brakspear',
-    'bram',
-    'bramshill',
-    'branco',
-    'bransby',
-    'bransford',
-    'brashness',
-    'brayed',
-    'brc',
-    'bre',
     'breadline',
-    'breakeven',
-    'breakfast-time',
-    'breakfasting',
-    'breakwaters',
-    'breastbone',
-    'bretonnia',
-    'bretons',
-    'breughel',
-    'brewhouse',
-    'briars',
-    'bricklaying',
-    'brief-case',
-    'brien',
-    'brigadier-general',
-    'brigid',
     'brin',
-    'brindisi',
-    'brio',
-    'briquettes',
-    'briscoe',
-    'bristol-based',
-    'britian',
-    'britishness',
-    'broad-leaved',
-    'broadgate',
-    'broadsheets',
-    'broadsides',
-    'brockwell',
-    'brockworth',
-    'brody',
-    'brogan',
     'broncos',
-    'brontosaurus',
-    'brooking',
-    'brora',
-    'brumby',
-    'brunhild',
-    'brylcreem',
-    'bryonia',
-    'bsm',
-    'bt3',
-    'bubye',
-    'buffing',
-    'buffon',
-    'bugbear',
-    'buksh',
-    'bulimic',
     'bulleid',
-    'bulmers',
-    'bumph',
-    'bundesliga',
-    'bundeswehr',
-    'bunged',
-    'bungy',
-    'bunkered',
-    'bur',
-    'burbled',
-    'burbling',
-    'burbulis',
-    'burdon',
-    'burgeoned',
-    'burkett',
-    'burmans',
     'burnage',
-    'burrough',
-    'burrs',
-    'burtons',
-    'busch',
-    'bushell',
-    'bushmen',
-    'business.',
-    'businesspeople',
-    'busking',
-    'busuttil',
-    'busybodies',
-    'butchell',
-    'butthole',
-    'buzzcocks',
-    'by-law',
     'by-line',
-    'by-passes',
-    'byambasuren',
-    'byproduct',
-    'byu',
-    'c&amp;g',
-    'c\'',
-    'c-reactive',
-    'c.i.d.',
-    'c.m.c.',
-    'c.o.',
-    'c/ebp&dgr',
-    'caballeros',
-    'cabinda',
-    'cabinet-maker',
-    'cable-car',
     'cabral',
-    'caching',
-    'cacl',
-    'caddick',
-    'cadge',
-    'cadherins',
-    'caecal',
-    'caesars',
-    'caf',
-    'cairns-smith',
-    'calculable',
-    'calder&oacute;n',
-    'caldera',
-    'caldy',
-    'caligula',
-    'call-box',
     'call-slip',
-    'calle',
-    'calpol',
-    'calumny',
-    'calved',
-    'calvinistic',
-    'calvino',
-    'camargue',
-    'cambrelle',
-    'cambuslang',
-    'camelford',
-    'camphill',
-    'campos',
-    'cana',
-    'canap&eacute;s',
-    'canapes',
     'canard',
-    'cancun',
-    'candace',
-    'candle-light',
-    'caned',
-    'canjuers',
-    'cannibalistic',
-    'cantering',
-    'cantharus',
-    'cantus',
-    'capellan',
-    'capercaillie',
-    'capering',
-    'capirossi',
-    'capitalizing',
-    'capone',
     'caracalla',
-    'caradoc',
-    'carbon-bearing',
-    'carbonyl',
-    'carborundum',
-    'carboxyl',
-    'carbs',
-    'carcinoids',
-    'carded',
-    'care-giving',
-    'career-best',
-    'carel',
-    'cargill',
-    'carlow',
-    'carnogursky',
-    'caron',
     'carousing',
-    'carport',
-    'carrell',
-    'carstairs',
-    'carthaginian',
-    'carty',
-    'carvoeiro',
-    'caryl',
-    'cas.',
-    'casamance',
-    'cascarino',
-    'caseloads',
-    'casements',
-    'caserta',
-    'cash-limited',
-    'cash-strapped',
     'caskie',
-    'castanets',
-    'castel',
-    'castigating',
-    'castlebar',
-    'castlewellan',
-    'castrate',
-    'cat-like',
-    'catalina',
-    'cataloguer',
-    'catarrhal',
-    'catastrophically',
-    'catcalls',
-    'cate',
-    'categorizations',
-    'cattell',
     'cattini',
-    'caucasians',
-    'caucuses',
-    'caudillo',
-    'cauterets',
-    'cava',
-    'cavaco',
-    'cavalrymen',
-    'cavemen',
-    'cawson',
-    'cazolet',
-    'cctv',
-    'cd3',
-    'cd45r0',
-    'cdu/csu',
-    'cefn',
     'cel',
-    'celebs',
-    'celomer',
-    'celsus',
-    'celt',
-    'cemaleddin',
-    'censoring',
-    'centennial',
-    'centipede',
-    'centralize',
-    'centripetal',
-    'centrodorsal',
-    'centromere',
-    'cenwulf',
-    'ceolwulf',
-    'cephalaspids',
     'cerebrospinal',
-    'cerebrovascular',
-    'cerezo',
-    'cerska',
-    'certitude',
-    'cervantes',
-    'ces',
-    'cfsu',
-    'chaise_longue',
-    'chaka',
-    'chamberlains',
-    'chamden',
-    'chamfer',
-    'champing',
-    'changeless',
-    'changing-room',
     'chaotically',
-    'characterizations',
-    'charcoal-grey',
-    'chargehand',
-    'charioteer',
-    'charmless',
-    'charnel',
-    'charnwood',
-    'charring',
-    'charrington',
-    'chartists',
-    'chary',
-    'chastisement',
-    'chateaux',
-    'chatterjee',
-    'chatwin',
     'chauffeured',
-    'chc',
-    'cheall',
-    'cheapo',
-    'check-off',
-    'checkers',
-    'checkouts',
-    'checkover',
-    'cheesemaking',
-    'cheesemonger',
-    'chela',
-    'cherishes',
-    'cherishing',
-    'cheshunt',
-    'chev&egrave;nement',
-    'chevenement',
     'chevy',
-    'cheyenne',
-    'chiaroscuro',
-    'chicane',
-    'chicanery',
-    'chicherin',
-    'chicken-pox',
-    'chickened',
-    'chickweed',
-    'chiding',
-    'chignon',
-    'childwall',
-    'chillies',
-    'chillis',
-    'chiluba',
-    'chino',
     'chirico',
-    'chiropractor',
-    'chirping',
-    'chitin',
-    'chloroplasts',
-    'chlothild',
-    'chock-a-block',
-    'choiseul',
-    'chok',
-    'cholecystectography',
-    'choleric',
-    'choosers',
-    'chorale',
-    'chorionic',
-    'choux',
-    'chr&eacute;tien',
     'chrace',
-    'chrissake',
-    'christa',
-    'chromaticism',
-    'chump',
-    'chun',
-    'chunnel',
-    'churchgoer',
-    'churchward',
-    'ciba',
-    'ciefl',
-    'cig',
-    'cinematograph',
-    'cinq',
-    'circumlocution',
-    'citric',
     'city-wide',
-    'cityscape',
-    'civilly',
-    'cixous',
-    'cl.',
-    'clachan',
-    'clack',
-    'clackmannan',
-    'clairmont',
-    'clammed',
-    'clandeboye',
-    'clandestinely',
-    'clanger',
-    'clanked',
-    'clansmen',
-    'clarac',
     'claridges',
-    'clariion',
-    'classicists',
-    'classlessness',
-    'classmate',
-    'clastic',
-    'claverhouse',
-    'claversal',
-    'cle-i',
-    'cleanup',
-    'clear-sighted',
-    'clicker',
-    'clinker',
-    'clintons',
-    'cloakrooms',
-    'clock-tower',
     'clogstoun-willmott',
-    'clonal',
-    'clos',
-    'clouted',
-    'cloven',
-    'clownish',
-    'cluanie',
-    'clubcall',
-    'cluedo',
-    'cluff',
-    'clutterbuck',
-    'cmht',
-    'cmv',
-    'cnp',
-    'cnrs',
-    'cns',
     'co-defendants',
-    'co-existing',
-    'co-opting',
-    'co-owner',
-    'co-produced',
-    'co-production',
-    'co-wrote',
-    'coalfish',
-    'coalman',
-    'cobbling',
-    'cobe',
-    'cochabamba',
-    'cochinchina',
-    'cochran',
-    'cockatoo',
-    'cockerell',
     'cockerill',
-    'cockpits',
-    'cockroft',
-    'codd',
-    'code-name',
-    'codeine',
-    'coffer',
-    'cognisant',
-    'cohabit',
-    'coiffure',
-    'coinages',
-    'coir',
-    'cokes',
-    'colbeck',
-    'coleoptera',
-    'colinear',
     'colinton',
-    'collectivisation',
-    'collet',
-    'collides',
-    'collis',
-    'collocational',
-    'colloids',
-    'colloredo',
-    'colonel-in-chief',
-    'colonialist',
-    'coloratura',
-    'colors',
-    'colston',
-    'columbian',
-    'colwell',
-    'colwill',
     'come-uppance',
-    'cometh',
-    'comeuppance',
-    'comfortless',
-    'comity',
-    'commandeer',
-    'commercialized',
-    'commonsensical',
-    'communing',
-    'communist-dominated',
-    'communist-led',
-    'communitarian',
-    'compania',
-    'compaore',
-    'complicit',
-    'composted',
     'comprehensibility',
-    'compton-burnett',
-    'computerwoche',
-    'computerworld',
-    'comunista',
-    'comyn',
-    'conable',
-    'conc',
-    'concatenation',
-    'conceits',
-    'conceptualizations',
-    'concertante',
-    'concessional',
-    'concessive',
-    'conciliator',
-    'concomitants',
     'concordant',
-    'concurs',
-    'condemnations',
-    'condensate',
-    'condones',
-    'conducteur',
-    'cone-shaped',
-    'confederal',
-    'confidants',
-    'configurable',
-    'configurational',
-    'conflated',
-    'confluent',
-    'confucian',
-    'congruity',
-    'conjoined',
     'connectedness',
-    'connoisseurship',
-    'consecrate',
-    'consideringly',
-    'consolingly',
-    'conspirator',
-    'constant-k',
-    'constrict',
-    'constrictions',
-    'consuelo',
-    'consumable',
-    'consumptive',
-    'contaminant',
-    'contessa',
-    'contestability',
-    'context-free',
     'contracting-out',
-    'contradistinction',
-    'contrivances',
-    'contrives',
-    'conundrums',
-    'convalesce',
-    'convecting',
-    'conyers',
-    'coolers',
-    'cooperators',
-    'coots',
-    'coppock',
-    'copsey',
-    'copulating',
-    'corbels',
-    'corder',
     'corked',
-    'corless',
-    'corms',
-    'cornard',
-    'cornishmen',
-    'corp-based',
-    'corrary',
-    'corrode',
-    'corydon',
-    'cosic',
-    'cosier',
-    'cost-leadership',
-    'costakis',
-    'cotte',
-    'coughlan',
-    'couloir',
     'counter-arguments',
-    'counter-claims',
-    'counterattack',
-    'counterfeiting',
-    'counterpoints',
-    'countersigned',
-    'countersunk',
-    'counterurbanization',
-    'county-wide',
-    'coup_de_gr&acirc;ce',
-    'coupes',
-    'coupland',
-    'coursebooks',
-    'court-ordered',
-    'covalently',
-    'coverslip',
     'coverslips',
-    'cowled',
-    'cowshed',
-    'coxi',
-    'coxless',
-    'coyness',
-    'cpi',
-    'craftily',
-    'craftwork',
-    'cragg',
-    'craigbarnet',
-    'craigmillar',
-    'cramant',
-    'cran',
-    'crankshaft',
-    'crated',
     'crathie',
-    'crawfords',
-    'craziest',
-    'credit-worthiness',
-    'cree',
-    'creevey',
-    'creighton',
-    'crescents',
-    'crickmer',
-    'criminalised',
-    'crinoids',
-    'crinoline',
-    'cristo',
-    'croatians',
-    'crom',
-    'crony',
     'crooner',
-    'cropmarks',
-    'cross-',
-    'cross-boundary',
-    'cross-checking',
-    'cross-currents',
-    'cross-cut',
-    'cross-examining',
-    'crosse',
-    'crosswind',
-    'croucher',
-    'crouches',
-    'croupier',
-    'crowes',
-    'croxteth',
-    'crs',
     'crues',
-    'crunchie',
-    'cruyff',
-    'cruzcampo',
-    'cryostat',
-    'cryptogenic',
-    'crystallising',
-    'csoi',
-    'csrg',
-    'csys',
-    'ctp',
-    'cts',
-    'ctt',
-    'cuckolded',
-    'cudgel',
-    'cudgels',
     'cueing',
-    'culler',
-    'cultivates',
-    'culturing',
-    'cundy',
-    'cunha',
-    'cuomo',
-    'cur&eacute',
-    'curiae',
-    'curial',
-    'curiam',
-    'curios',
-    'curlicues',
-    'curtilage',
-    'curtsied',
-    'curvy',
     'curwen',
-    'cushendall',
-    'custer',
-    'customisation',
-    'cutaneous',
-    'cvcp',
-    'cynon',
-    'cytological',
-    'cytoprotection',
-    'd&iacute;az',
-    'd\'automne',
-    'd\'isere',
-    'd\'oro',
-    'd\'une',
-    'd-type',
-    'd.f.',
     'd9',
-    'dac',
-    'dachshund',
-    'daddies',
-    'daemonic',
-    'dahlia',
-    'daihatsu',
-    'daimyo',
-    'dak',
-    'dalesman',
-    'dalzell',
-    'damaratos',
-    'damme',
-    'damp-proof',
-    'danaher',
-    'danjit',
     'danson',
-    'dap',
-    'daphnis',
-    'dark-green',
-    'darwen',
-    'darwinians',
-    'dasilva',
-    'dassault',
-    'data-types',
-    'databank',
-    'datapoint',
-    'daum',
-    'daumier',
-    'dawdle',
-    'dawe',
-    'dawyck',
     'day-dreaming',
-    'dci',
-    'dcm/cys177ser',
-    'de-industrialization',
-    'deadened',
-    'deadness',
-    'deafeningly',
-    'death-rate',
-    'debar',
-    'debase',
-    'debauched',
-    'debby',
-    'deben',
-    'debr&eacute',
-    'debra',
-    'debutante',
     'decanters',
-    'deceits',
-    'deceives',
-    'decencies',
-    'decentralizing',
-    'decimate',
-    'declaiming',
-    'declamation',
-    'decommissioned',
-    'deconcentration',
-    'deconstructed',
-    'decpc',
-    'decrepitude',
-    'dedham',
-    'deeming',
-    'deeps',
     'defibrillator',
-    'degli',
-    'deification',
-    'deign',
-    'deira',
-    'deja_vu',
-    'dekker',
-    'delamere',
-    'delano',
-    'delimit',
-    'deliverable',
-    'deliverer',
-    'dello',
-    'deluding',
-    'demarcate',
-    'demarcations',
     'demean',
-    'demes',
-    'demian',
-    'democr&aacute;tica',
-    'demonology',
-    'demystification',
-    'denaturing',
-    'denby',
-    'deneuve',
-    'deni',
-    'denominators',
-    'denting',
-    'dentition',
-    'depeche',
-    'depolarisation',
-    'depolarization',
     'depoliticization',
-    'deprecating',
-    'deputations',
-    'deputed',
-    'derbys',
-    'deride',
-    'dermatological',
-    'dermott',
-    'dern',
-    'dervishes',
-    'derwentside',
-    'describable',
-    'desisted',
-    'deskilling',
-    'despatcher',
-    'despoiled',
     'despots',
-    'detestation',
-    'deutscher',
-    'deva',
-    'devalues',
-    'deviousness',
-    'devours',
-    'devoy',
-    'dfl',
-    'dharma',
-    'diamant&eacute',
-    'dianagate',
-    'diaphanous',
-    'dias',
-    'diazepam',
-    'dicing',
     'dickerson',
-    'dickheads',
-    'die-hards',
-    'dieback',
-    'dientzenhofer',
-    'diff&eacute;rance',
-    'diffugere',
-    'diggs',
-    'digitising',
-    'dignam',
-    'digressions',
-    'dilating',
-    'dimly-lit',
-    'dina',
-    'dining-table',
-    'dinner-time',
     'dionysos',
-    'dipstick',
-    'directionless',
-    'disabused',
-    'disambiguation',
-    'disapplication',
-    'disbandment',
-    'disbarred',
-    'discoverable',
-    'disdained',
-    'diseconomies',
-    'disengaging',
-    'disfigure',
-    'disgorge',
-    'disinfect',
-    'disjunctive',
     'diskettes',
-    'disknet',
-    'disparaged',
-    'disparagement',
-    'dispels',
-    'dispersers',
-    'disperses',
-    'dispossession',
-    'disqualifications',
-    'dissemble',
-    'dissidence',
-    'dissimilarities',
-    'dissipates',
-    'distractors',
-    'distracts',
-    'distressingly',
     'disulphide',
-    'ditties',
-    'divans',
-    'diversities',
-    'diyarbakir',
-    'djp',
-    'dm2.46',
-    'dm2.47',
-    'dm2.49',
-    'dm3',
-    'dmso',
-    'do&ntilde;a',
-    'do-gooders',
-    'dobry',
-    'doctorates',
-    'doddie',
     'dodgems',
-    'dodgson',
-    'dogmatically',
-    'dominantly',
-    'dominicans',
-    'don\'t',
-    'doodles',
-    'doodling',
-    'doom-laden',
-    'doorframe',
-    'doorpost',
-    'dormice',
-    'dornberg',
-    'dorrainge',
-    'dorrit',
-    'dossers',
     'dostam',
-    'dotes',
-    'dottore',
-    'double-axe',
-    'double-dealing',
-    'double-digit',
-    'double-length',
-    'double-page',
-    'double-stranded',
-    'douce',
-    'doune',
-    'dovetailing',
-    'dovey',
-    'dowden',
-    'dowell',
-    'downcounter',
     'downham',
-    'dpc',
-    'dpk',
-    'dps',
-    'dpx/20',
-    'drabness',
-    'dramatisation',
-    'drams',
-    'drat',
-    'draughting',
-    'drawcord',
-    'dreamcoat',
-    'drearily',
-    'dreariness',
-    'dreyer',
-    'dri',
     'drifters',
-    'drizzly',
-    'droids',
-    'drool',
-    'drop-down',
-    'dropper',
-    'druce',
-    'druggist',
-    'drunkards',
-    'dry-mouthed',
-    'dry-stone',
-    'dryads',
-    'dubh',
-    'dubliner',
-    'dubs',
-    'duce',
     'duckie',
-    'ducting',
-    'duddingston',
-    'duffer',
-    'dumenil',
-    'dunan',
-    'dunce',
-    'dundela',
-    'dunk',
-    'dunster',
-    'dunwich',
-    'duomatic',
-    'dupion',
-    'duplications',
-    'dur&aacute;n',
-    'durances',
     'durlston',
-    'dutchmen',
-    'duveen',
-    'duxbury',
-    'dvr',
-    'dyad',
-    'dyadic',
-    'dziekanowski',
-    'e-type',
-    'e.p.',
-    'each-way',
-    'ealdred',
-    'earhole',
-    'earnout',
-    'earthing',
-    'easby',
     'east&mdash;west',
-    'east-facing',
-    'eastnor',
-    'easy-to-follow',
-    'ebeneezer',
-    'ebullience',
-    'ecclesiastic',
-    'echinoderm',
-    'eckersley',
-    'economism',
-    'ecover',
-    'ecr',
-    'eddington',
-    'edfax',
-    'edgcote',
-    'edifact',
     'edrich',
-    'ef-1&agr',
-    'efendi',
-    'effervescence',
-    'efflux',
-    'egging',
-    'egoist',
-    'egret',
-    'ehrenburg',
-    'eigenvector',
-    'eigenvectors',
-    'eight-',
-    'eight-month',
-    'eight-year-olds',
-    'eightfold',
-    'eked',
     'ekland',
-    'eladeldi',
-    'electra',
-    'electrocardiographic',
-    'elektra',
-    'elevenses',
-    'eling',
-    'ellerman',
-    'eloped',
-    'elsevier',
-    'elson',
-    'elterwater',
-    'emanations',
-    'embarrasses',
-    'embolism',
-    'emden',
     'emitters',
-    'emmental',
-    'emmet',
-    'emmett',
-    'emollient',
-    'emotionality',
-    'emotionless',
-    'emp',
-    'emplacements',
-    'employable',
-    'emulates',
-    'encapsulation',
-    'enchant',
-    'encirclement',
-    'encomiast',
-    'encomium',
     'encumbrance',
-    'endo',
-    'endorphins',
-    'endosonography',
-    'endothelin',
-    'endotoxins',
-    'endows',
-    'endpoint',
-    'energise',
-    'enfant_terrible',
-    'enfolding',
-    'english-based',
-    'engravers',
-    'enigmas',
-    'enlarger',
-    'enmities',
     'enquires',
-    'enrage',
-    'enron',
-    'enstone',
-    'enthoven',
-    'enticement',
-    'entity-relationship',
-    'entomology',
-    'entrap',
-    'ents',
-    'entwistle',
-    'enunciation',
-    'env',
-    'envelops',
-    'enver',
-    'envying',
     'enzensberger',
-    'epictetus',
-    'epicurean',
-    'epigenetic',
-    'epigram',
-    'epigrams',
-    'epigraph',
-    'epileptogenic',
-    'epiphone',
-    'episcopacy',
-    'epistolary',
-    'epitomize',
-    'epoxide',
-    'equalized',
-    'equivalently',
-    'erects',
     'erg',
-    'erickson',
-    'eritreans',
-    'ermisch',
-    'errington',
-    'esaf',
-    'escapee',
-    'escapers',
-    'escarpments',
-    'esf',
-    'esix',
-    'espa&ntilde;a',
-    'espadrilles',
-    'espouses',
-    'esr',
-    'essene',
     'este',
-    'estevan',
-    'estrada',
-    'etudes',
-    'euan',
-    'eudo',
-    'euphemistic',
-    'euramco',
-    'euro-mp',
-    'eurythmics',
-    'ev\'ry',
-    'evangelising',
-    'evenin\'',
-    'evenness',
-    'evennett',
-    'ever-popular',
     'everex',
-    'everytime',
-    'eves',
-    'evilly',
-    'evince',
-    'evocations',
-    'ex-boyfriend',
-    'ex-communist',
-    'ex-employees',
-    'ex-minister',
-    'ex-officio',
-    'ex-prime',
-    'exchangers',
-    'excitingly',
-    'excommunicate',
-    'exhalation',
     'exhaling',
-    'exhorts',
-    'exorcisms',
-    'exotically',
-    'experimentalists',
-    'expletive',
-    'exploitable',
-    'extenuating',
-    'extra-statutory',
-    'extra-terrestrial',
-    'extramural',
-    'extraterrestrials',
-    'extricating',
-    'extroverts',
-    'exulting',
-    'eye-opening',
     'eyeless',
-    'f&ecirc;ted',
-    'f&sharp',
-    'f-15',
-    'f/o',
-    'fabianism',
-    'fabrications',
-    'fac',
-    'face-lift',
-    'face-saving',
-    'fach',
-    'faintness',
-    'fair-sized',
-    'fairall',
-    'faire',
-    'fairgrounds',
     'fait',
-    'falseness',
-    'falsifications',
-    'falters',
-    'fam',
-    'famber',
-    'familiars',
-    'fantasised',
-    'farmoor',
-    'farnell',
-    'faroes',
-    'farrel',
-    'farrelly',
-    'farthings',
-    'fast-breeder',
-    'fast-paced',
     'fatchett',
-    'fathomless',
-    'faubourg',
-    'faulds',
-    'faulks',
-    'fault-finding',
-    'faultlessly',
-    'fauves',
-    'fawcetts',
-    'faxgrabber',
-    'fazakerley',
-    'fazisi',
-    'fcc',
-    'feare',
-    'feather-light',
-    'feedforward',
     'feint',
-    'female-identified',
-    'fenemore',
-    'ferenc',
-    'fermoy',
-    'fernandes',
-    'ferrule',
-    'fertilise',
-    'fes',
-    'festivity',
-    'festoon',
-    'fettes',
-    'fibre-filler',
-    'fibrinolytic',
-    'fictionality',
-    'ficus',
     'fiddlers',
-    'fiedler',
-    'fieldnotes',
-    'fifi',
-    'fifo',
-    'figure-hugging',
-    'filched',
-    'fildes',
-    'fine-boned',
-    'fings',
-    'finnage',
-    'fiord',
-    'firbas',
-    'firebox',
-    'firefighter',
-    'firenze',
     'firmest',
-    'firmware',
-    'first-degree',
-    'first-line',
-    'firsthand',
-    'fishbourne',
-    'fishguard',
-    'fitment',
-    'five-figure',
-    'five-match',
-    'fixations',
-    'fixed-price',
-    'fizzed',
-    'fizzle',
-    'flagon',
-    'flamingoes',
     'flanges',
-    'flashbulb',
-    'flashpoints',
-    'flashport',
-    'flatman',
-    'flatmates',
-    'flavoursome',
-    'fleurs',
-    'flexi',
-    'flexifoil',
-    'flexiloan',
-    'flexitime',
-    'flight-muscles',
-    'flits',
-    'floaty',
-    'floodplain',
     'flook',
-    'florets',
-    'florida-based',
-    'florins',
-    'flotillas',
-    'flounces',
-    'flounders',
-    'flower-beds',
-    'flowerdew',
-    'fluka',
-    'flummoxed',
-    'fluorine',
-    'flyaway',
-    'foaling',
-    'foams',
-    'fogged',
     'foggiest',
-    'foghorn',
-    'foin',
-    'foist',
-    'folios',
-    'folksy',
-    'followings',
-    'foment',
-    'fomented',
-    'fontenoy',
-    'foote',
-    'footfall',
-    'footstraps',
-    'foragers',
-    'foramen',
-    'forbear',
     'forbears',
-    'forde',
-    'forebear',
-    'forebrain',
-    'foreclose',
-    'foreign-policy',
-    'forensics',
-    'foreseeability',
-    'foresterhill',
-    'forewarning',
-    'forewing',
-    'forgrave',
-    'formalisation',
-    'formalising',
-    'formalistic',
-    'formalization',
     'formamide',
-    'formentera',
-    'formes',
-    'formulates',
-    'forsaking',
-    'forsythia',
-    'fortissimo',
-    'fortunatus',
-    'forty-year-old',
-    'forwarder',
-    'foster-parents',
-    'fou',
-    'fouch&eacute',
-    'founder-member',
-    'foundering',
-    'four-bedroomed',
     'four-cylinder',
-    'four-goal',
-    'four-mile',
-    'four-ply',
-    'four-processor',
-    'four-seater',
-    'fouroux',
-    'fourth-round',
-    'foveal',
-    'fowle',
-    'foxtrot',
-    'fpcs',
-    'frag',
-    'francais',
-    'francine',
-    'franciscans',
     'franjieh',
-    'fraulein',
-    'freaky',
-    'freddi',
-    'free-flowing',
-    'free-rider',
-    'free-thinking',
-    'freefall',
-    'freemason',
-    'freetown',
-    'freie',
-    'french-style',
-    'frensham',
-    'fresh-water',
-    'freshmen',
-    'fretfully',
     'fricatives',
-    'friedan',
-    'frisbee',
-    'fritter',
-    'frn',
-    'froissart',
-    'fromm',
-    'frond',
-    'front-door',
-    'front-ends',
-    'fructose',
-    'frugality',
-    'frugivores',
-    'fruitcake',
-    'fruitfulness',
-    'frustrates',
     'fsp',
-    'fsr',
-    'fuel-injected',
-    'ful',
-    'full-grown',
-    'full-strength',
-    'fully-equipped',
-    'funai',
-    'fundraiser',
-    'funnels',
-    'furled',
-    'furlough',
-    'furnisher',
-    'furtw&auml;ngler',
-    'furze',
-    'fusil',
     'g&eacute;n&eacute;rale',
-    'g&ndash;h',
-    'g&ouml;ncz',
-    'g.a.',
-    'g.c.',
-    'g/kg',
-    'g1',
-    'g3',
-    'g8',
-    'gabonese',
-    'gabor',
-    'gabriella',
-    'gaels',
-    'gaijin',
-    'gale-force',
-    'galen',
     'galician',
-    'gallaudet',
-    'galle',
-    'galleons',
-    'gallivanting',
-    'gallo-roman',
-    'gals',
-    'galtres',
-    'gambian',
-    'gambo',
-    'gameboy',
-    'gangliosides',
-    'gangly',
-    'gantt',
-    'gaolers',
-    'gap-toothed',
     'garbed',
-    'garbett',
-    'gargery',
-    'gargle',
-    'garonne',
-    'garside',
-    'garters',
-    'gartmore',
-    'gartree',
-    'gaskets',
-    'gaslight',
-    'gastropod',
-    'gateaux',
-    'gating',
-    'gauntlets',
-    'gavel',
     'gavrilov',
-    'gazetteer',
-    'gcos',
-    'gdfcf',
-    'gdo',
-    'gedling',
-    'gelatin',
-    'gelon',
-    'gender-specific',
-    'general-secretary',
-    'generalisable',
-    'genially',
-    'genitive',
-    'gennaro',
-    'geopolitical',
-    'georgette',
     'georgy',
-    'geoscience',
-    'geostationary',
-    'geotechnical',
-    'geplacea',
-    'gerasimov',
-    'germanium',
-    'gershuny',
-    'gesellschaft',
-    'geste',
-    'geza',
-    'gggccc',
-    'ggt',
-    'ghandi',
-    'ghatak',
-    'gherkins',
     'ghofar',
-    'gian',
-    'gianfranco',
-    'giddiness',
-    'gie',
-    'gif',
-    'gift-wrapped',
-    'gigi',
-    'gigli',
-    'gilda',
-    'gillard',
-    'gillett',
-    'gilling',
-    'gillray',
-    'gimmicky',
-    'girdles',
     'girly',
-    'girolamo',
-    'girvan',
-    'gisela',
-    'gita',
-    'gladio',
-    'glamis',
-    'glass-fibre',
-    'glass-topped',
-    'glaswegians',
-    'gleb',
-    'gledhill',
-    'glendenen',
-    'glenshee',
-    'glimmers',
-    'glints',
     'glitters',
-    'gloaming',
-    'gloated',
-    'globalisation',
-    'globe-trotting',
-    'glorifying',
-    'glorying',
-    'glossing',
-    'glossop',
-    'gloster',
-    'glovers',
-    'glower',
-    'glue-sniffing',
-    'glycated',
-    'glycosylation',
-    'gmp',
     'gnathostomes',
-    'goal-scoring',
-    'goatee',
-    'gobbledegook',
-    'goby',
-    'god-king',
-    'godden',
-    'godlike',
-    'goer',
-    'goggled',
-    'goin',
-    'gold-digger',
-    'goldney',
-    'goldsworthy',
-    'gombe',
-    'gomorrah',
     'gonads',
-    'gondar',
-    'gondolas',
-    'gondoliers',
-    'gondwana',
-    'goner',
-    'gonne',
-    'gonzales',
-    'gooden',
-    'goodlet',
-    'goodrich',
-    'gooin\'',
-    'gor',
-    'gorbachov',
-    'gordian',
-    'gorelli',
     'gorging',
-    'gorham',
-    'gormley',
-    'gosbank',
-    'gosden',
-    'goshawk',
-    'gotha',
-    'goudie',
-    'gouled',
-    'gourd',
-    'gourmets',
-    'gouts',
-    'gp160',
-    'gpg',
-    'gracias',
-    'grammy',
     'granddaughters',
-    'granta',
-    'grapheme',
-    'graphology',
-    'grassington',
-    'grassmarket',
-    'gratin',
-    'gratis',
-    'grave-goods',
-    'graz',
-    'greenalls',
-    'greenest',
-    'greenly',
-    'greensand',
-    'greenside',
-    'gregan',
     'grenadines',
-    'greycoats',
-    'gridiron',
-    'grigg',
-    'grigory',
-    'grimoire',
-    'groats',
-    'grocott',
-    'groined',
-    'gromyko',
-    'groome',
-    'grossness',
-    'grottoes',
-    'ground-level',
-    'groupie',
-    'grouting',
     'grugel',
-    'grundig',
-    'grunwald',
-    'gsi',
-    'gtf',
-    'gudgin',
-    'guesthouses',
-    'guidon',
-    'guillain-barr&eacute',
-    'guillotined',
-    'guillotines',
-    'guilt-ridden',
-    'guiseley',
-    'gummy',
-    'gumtree',
-    'gunge',
     'gunwale',
-    'gurdon',
-    'gurkha',
-    'gurkhas',
-    'gusev',
-    'gustavus',
-    'gusted',
-    'gutenberg',
-    'gutless',
-    'gwynn',
-    'gybing',
-    'gyford',
-    'gyles',
-    'gymnasia',
-    'gynn',
-    'gyrations',
     'h&eacute;l&egrave;ne',
-    'h&eacute;loise',
-    'h&ouml;chstetter',
-    'h&ouml;fner',
-    'h&ouml;lderlin',
-    'h&uuml;sker',
-    'h.e',
-    'h.m.s.',
-    'h.o',
-    'h.t.',
-    'h3',
-    'habash',
-    'haberdashers',
-    'haberdashery',
-    'haeckel',
-    'haematite',
     'haemonchosis',
-    'haemorrhages',
-    'haemostasis',
-    'haemostatic',
-    'haffey',
-    'hags',
-    'hair-like',
-    'haj',
-    'haji',
-    'hake',
-    'hakon',
-    'halema',
-    'halesowen',
-    'half-a-mile',
-    'half-bottle',
-    'half-crown',
     'half-decent',
-    'half-inch',
-    'half-pint',
-    'half-remembered',
-    'half-share',
-    'half-truth',
-    'halfling',
-    'halflings',
-    'halim',
-    'halitosis',
-    'hamad',
-    'hamadan',
-    'hambrecht',
-    'hamel',
-    'hamelin',
-    'hamill',
     'hammocks',
-    'hammy',
-    'hamstrung',
-    'hand-cart',
-    'hand-crafted',
-    'hand-over',
-    'handmaid',
-    'hang-up',
-    'hani',
-    'hannington',
-    'hanseatic',
-    'hanworth',
-    'hapsburgs',
-    'haq',
-    'har-roomf',
-    'haranguing',
     'hard-backed',
-    'hard-drinking',
-    'hard-faced',
-    'hard-hearted',
-    'hardcopy',
-    'hardcover',
-    'hardiest',
-    'harked',
-    'harthacnut',
-    'hartke',
-    'harty',
-    'haselhurst',
-    'haskey',
-    'hasted',
-    'hat-tricks',
-    'hatcher',
     'hatherley',
-    'hatters',
-    'hautbois',
-    'havard',
-    'havin\'',
-    'hawk-like',
-    'hawkwind',
-    'hawley',
-    'hawton',
-    'hayfield',
-    'haylock',
-    'haymo',
-    'haywards',
-    'hayworth',
-    'hbcag',
-    'hd-doms',
     'hds',
-    'hdv',
-    'head-dresses',
-    'head-first',
-    'headdresses',
-    'headhunted',
-    'headlining',
-    'headwaters',
-    'headwords',
-    'heaping',
-    'heart-lung',
-    'heartwood',
-    'heaterstat',
-    'heathery',
-    'heber',
-    'hecklers',
     'heclo',
-    'hectolitres',
-    'heddle',
-    'heggie',
-    'heidegger',
-    'heir-apparent',
-    'heliopolis',
-    'hellebores',
-    'helliwell',
-    'hellraiser',
-    'helplist',
-    'helvetica',
-    'helvin',
-    'hemispherectomy',
-    'hemlines',
-    'hendy',
     'heng',
-    'henley-on-thames',
-    'hep',
-    'hepatectomy',
-    'hepplewhite',
-    'hepwood',
-    'heraclitus',
-    'herder',
-    'hermetically',
-    'hern&aacute;ndez',
-    'hernias',
-    'heros',
-    'herron',
-    'hersh',
-    'heterologous',
-    'heterostracans',
     'hetton',
-    'heuil',
-    'heuristics',
-    'hexagons',
-    'heysham',
-    'hezb-i-islami',
-    'hibernating',
-    'hide-and-seek',
-    'hie',
-    'higgledy-piggledy',
-    'high-capacity',
-    'high-flown',
-    'high-yield',
-    'higher-status',
-    'highest-ranking',
-    'highly-rated',
     'hijra',
-    'hiker',
-    'hilborne',
-    'hilderbridge',
-    'hill-top',
-    'hill-walking',
-    'hillhead',
-    'hillmarden',
-    'hillocks',
-    'hillsdown',
-    'hillwalkers',
-    'hinchcliffe',
-    'hinksey',
-    'hinrich',
-    'hippocrates',
-    'hiram',
     'hirschi',
-    'histidine',
-    'histrionics',
-    'hive-up',
-    'hoar',
-    'hoaxer',
-    'hobbits',
-    'hodgskin',
-    'hoes',
-    'hogging',
-    'hogs',
-    'hojatolislam',
-    'hoko',
-    'holies',
-    'hollands',
-    'hollered',
     'hollyhocks',
-    'holomisa',
-    'holsters',
-    'holybourne',
-    'hom&oelig;opathic',
-    'home-baked',
-    'home-making',
-    'home-town',
-    'homecare',
-    'homeopathic',
-    'homeostasis',
-    'homerton',
-    'homesteads',
-    'hommes',
-    'homoerotic',
-    'homogeneously',
     'homogenisation',
-    'homologue',
-    'hooch',
-    'hoodlums',
-    'hookworm',
-    'hopley',
-    'hopscotch',
-    'hopwood',
-    'horatian',
-    'hordern',
-    'hormuz',
-    'hornchurch',
-    'hors',
-    'hors_d\'oeuvres',
-    'horse-trading',
-    'horseplay',
     'horsy',
-    'horwich',
-    'hosed',
-    'hosking',
-    'hoss',
-    'hostas',
-    'hot-line',
-    'hotelkeeper',
-    'hotspots',
-    'houdini',
-    'housebuilder',
-    'housemaids',
-    'housings',
-    'howitzer',
-    'hsbc',
-    'hsp',
     'hsts',
-    'hswp',
-    'huaiwiri',
-    'huckleberry',
-    'hudd',
-    'huffily',
-    'huffy',
-    'huggins',
-    'humanitarianism',
-    'humidities',
-    'hummel',
-    'hunh',
-    'hunniford',
-    'huntsville',
-    'hur',
-    'hurdling',
     'hurlock',
-    'hurst/cheltenham',
-    'hurwitz',
-    'hury',
-    'hutches',
-    'hutson',
-    'hutu',
-    'hva',
-    'hyams',
-    'hybridisations',
-    'hydrangea',
-    'hydrated',
-    'hydrotherapy',
-    'hylton',
-    'hyperbola',
-    'hypercholesterolaemia',
     'hyperpepsinogenaemia',
-    'hypertensives',
-    'hyphens',
-    'hyping',
-    'hypokalaemia',
-    'hyponymy',
-    'hyposplenism',
-    'hypothesise',
-    'hypothetically',
-    'hypothyroidism',
-    'hyslop',
-    'i-v',
-    'i/we',
-    'iachimo',
-    'iapx-86-based',
-    'ias',
     'iata',
-    'ibbetson',
-    'ibbotson',
-    'icam-3',
-    'icbms',
-    'ice-free',
-    'iconoclast',
-    'icp',
-    'ideational',
-    'idf',
-    'idiotically',
-    'ieatp',
-    'igf-i',
-    'igloo',
-    'ignatia',
-    'iib',
     'iida',
-    'ij',
-    'ikea',
-    'il-8',
-    'ila',
-    'ilfracombe',
-    'ill-at-ease',
-    'ill-concealed',
-    'ill-educated',
-    'ill-lit',
-    'ill-treating',
-    'illiberal',
-    'illicitly',
-    'illocutionary',
-    'illuminative',
-    'illyrian',
     'ilr',
-    'image-making',
-    'imbeciles',
-    'imbue',
-    'img',
-    'immortalized',
-    'immunise',
-    'immunosuppression',
-    'impaction',
-    'impasto',
-    'impersonally',
-    'impersonations',
-    'impersonator',
-    'imperturbable',
-    'impetuously',
-    'impey',
     'impious',
-    'impishly',
-    'implanting',
-    'import-export',
-    'impositions',
-    'impotently',
-    'impulsiveness',
-    'impute',
-    'imputing',
-    'in-',
-    'in_toto',
-    'inaudibly',
-    'inaugurating',
-    'inboard',
-    'incapacitation',
-    'inchbad',
     'incidentals',
-    'incisions',
-    'income-related',
-    'income-tax',
-    'incommensurable',
-    'inconclusively',
-    'inconsequentially',
-    'inconspicuously',
-    'incontestable',
-    'incrementally',
-    'incremented',
-    'incriminated',
-    'inculcating',
-    'incumbency',
-    'indentures',
-    'india-may',
     'indigenization',
-    'indissolubly',
-    'indo-pakistan',
-    'inducible',
-    'inductively',
-    'industrialising',
-    'industry-standard',
-    'ineluctable',
-    'ineradicable',
-    'inexpert',
-    'infamy',
-    'infante',
-    'infidels',
-    'infinities',
-    'infirmities',
-    'inflectional',
     'influxes',
-    'informals',
-    'information-gathering',
-    'ingenuously',
-    'ingleby',
-    'ingrow',
-    'injectable',
-    'injunctive',
-    'innuendoes',
-    'inoculations',
-    'inquires',
-    'inquiringly',
-    'inroad',
-    'inscribe',
-    'insectivorous',
-    'insinuation',
     'insomniac',
-    'insouciant',
-    'inst',
-    'instants',
-    'instigators',
-    'instill',
-    'instituto',
-    'instrument-maker',
-    'instrumentalism',
-    'insula',
-    'insultingly',
-    'insurrections',
-    'integrally',
-    'integrationist',
-    'integument',
-    'intel-based',
     'intelligences',
-    'inter-club',
-    'inter-country',
-    'inter-island',
-    'inter-korean',
-    'inter-provincial',
-    'interbedded',
-    'interchanged',
-    'intercommunal',
-    'interdependencies',
-    'intergranular',
-    'interject',
-    'interlending',
-    'interlinking',
-    'interludium',
-    'interminably',
     'internalize',
-    'internetworking',
-    'interop',
-    'interpenetration',
-    'interradially',
-    'interrelate',
-    'interrelations',
-    'intersegmental',
-    'interspecific',
-    'intertwining',
-    'interveniens',
-    'intonational',
-    'intra-',
-    'intracommodity',
-    'intractability',
-    'intramural',
     'intrastat',
-    'invalidating',
-    'invariance',
-    'inverdarroch',
-    'invulnerability',
-    'iodine-131',
-    'ionisation',
-    'ionizing',
-    'ipa',
-    'ipkf',
-    'ipm',
-    'ipr',
-    'ips',
-    'iqbal',
-    'iqs',
-    'irfu',
     'iri',
-    'iridescence',
-    'iridium',
-    'irish-american',
-    'irish-americans',
-    'irna',
-    'irradiance',
-    'irreducibility',
-    'irreparably',
-    'irreversibility',
-    'irritants',
-    'irvin',
-    'isam',
-    'isfahan',
-    'islamist',
-    'island-driving',
     'ism',
-    'isometric',
-    'isomorphic',
-    'issachar',
-    'italo',
-    'itemise',
-    'itemized',
-    'ithaca',
-    'itu',
-    'ivana',
-    'ivanhoe',
-    'ivories',
-    'j.j.',
-    'jabbering',
-    'jac',
-    'jacking',
     'jagen',
-    'janusz',
-    'jape',
-    'jaunts',
-    'jawara',
-    'jaya',
-    'jaz',
-    'jean-marc',
-    'jeane',
-    'jemson',
-    'jesmond',
-    'jewishness',
-    'jewson',
-    'jezebel',
-    'jibril',
-    'jigging',
     'jinneth',
-    'jip',
-    'jitka',
-    'job-related',
-    'jodrell',
-    'jog/jog',
-    'johanson',
-    'joicey',
-    'joined-up',
-    'jolla',
-    'jolyon',
-    'joneses',
-    'jonjo',
-    'jonsson',
-    'jordanhill',
-    'jordanian-palestinian',
     'josquin',
-    'jourgensen',
-    'journo',
-    'journos',
-    'jowitt',
-    'joxe',
-    'joyride',
-    'jpl',
-    'jps',
-    'jsb',
-    'jt',
-    'ju87',
-    'judaeo-christian',
-    'juddering',
-    'judea',
-    'juggernauts',
     'jugnauth',
-    'jumped-up',
-    'junto',
-    'juts',
-    'jvp',
-    'k&ouml;nig',
-    'k-ras',
-    'kadets',
-    'kagan',
-    'kahane',
-    'kahnweiler',
-    'kaley',
-    'kalimantan',
-    'kalm',
-    'kalmar',
-    'kama',
     'kamchatka',
-    'kammerer',
-    'kan',
-    'kandinskaya',
-    'kantor',
-    'kaolinite',
-    'kapellmeister',
-    'kapuscinski',
-    'karakoram',
-    'karens',
-    'karlovy',
-    'karlsruhe',
-    'karnak',
-    'karter',
-    'katkov',
-    'kaufmann',
     'kaur',
-    'kavner',
-    'kdp',
-    'kearns',
-    'keddie',
-    'kedgeree',
-    'keepin\'',
-    'kel',
-    'kellard',
-    'kelpie',
-    'kelvingrove',
-    'kemal',
-    'kemira',
-    'kensit',
-    'keraing',
-    'kerekou',
     'kesteven',
-    'keyboarding',
-    'keycard',
-    'kezia',
-    'kg/m',
-    'kgs',
-    'kharg',
-    'kharin',
-    'khin',
-    'kiddy',
-    'kieslowski',
-    'kiki',
-    'killick',
-    'killinghall',
-    'kilmeny',
-    'kilogramme',
     'kilogrammes',
-    'kilometers',
-    'kilted',
-    'kilter',
-    'kilvert',
-    'kinematic',
-    'kinematics',
-    'kingsland',
-    'kingsmarkham',
-    'kinloch',
-    'kinneil',
-    'kinswoman',
-    'kinton',
-    'kirknewton',
-    'kirkton',
-    'kit-kat',
     'kitching',
-    'kittyhawks',
-    'kitzinger',
-    'kl',
-    'klea',
-    'kleon',
-    'klima',
-    'km&amp;sup2',
-    'kneale',
-    'kneecaps',
-    'kneeled',
-    'knifepoint',
-    'knighthoods',
-    'knobelsdorf',
-    'knowledges',
-    'knuckled',
     'knudsen',
-    'kobe',
-    'kohn',
-    'kojak',
-    'koko',
-    'kontrax',
-    'kopek',
-    'kostroma',
-    'kox2',
-    'kpn',
-    'kraftwerk',
-    'krasner',
-    'krieger',
-    'kring',
-    'krishnapur',
-    'kriss',
     'krug',
-    'krupp',
-    'ku\'damm',
-    'kucan',
-    'kuchuk',
-    'kv',
-    'kwazulu',
-    'ky',
-    'kyaw',
-    'kyrenia',
-    'kyrie',
-    'kyushu',
-    'l&eacute;vy-bruhl',
-    'l\'arc',
-    'l\'auberge',
-    'l\'empereur',
     'l\'histoire',
-    'l\'oeil',
-    'l-arginine',
-    'l.e.d',
-    'l69',
-    'labile',
-    'labradors',
-    'labrooy',
-    'labyrinths',
-    'lacalle',
-    'lace-up',
-    'lacunae',
-    'ladled',
-    'lahr',
-    'lairg',
-    'lajos',
     'laminates',
-    'laminations',
-    'lancastrians',
-    'lance-shaped',
-    'land-cover',
-    'land-locked',
-    'landmass',
-    'landmine',
-    'landon',
-    'landranger',
-    'landrover',
-    'landslip',
-    'langholm',
-    'langland',
-    'langstone',
-    'language-games',
     'languedoc',
-    'laparoscopy',
-    'lapd',
-    'lapp',
-    'largs',
-    'larnach',
-    'larsson',
-    'larus',
-    'lascaux',
-    'lashley',
-    'lassies',
-    'last-named',
-    'latching',
-    'latinos',
-    'latins',
-    'latvians',
     'lau',
-    'laugharne',
-    'law-and-order',
-    'lawers',
-    'layabouts',
-    'laycock',
-    'layoffs',
-    'lcs',
-    'leacock',
-    'lead-up',
-    'leadenhall',
-    'leaf-mould',
-    'leaven',
-    'leblanc',
-    'leblond',
-    'lecher',
     'lecithin',
-    'leeds-based',
-    'leff',
-    'left/right',
-    'lefty',
-    'leg-spinner',
-    'legalizing',
-    'leghorn',
-    'legionary',
-    'legis',
-    'legitimizing',
-    'leighs',
-    'lele',
-    'lemmy',
-    'lengthier',
-    'leos',
     'leprechauns',
-    'lessors',
-    'leszek',
-    'letraset',
-    'letterpress',
-    'leucocyte',
-    'leukaemias',
-    'levamisole',
-    'levante',
-    'levene',
-    'levering',
-    'lexicographic',
-    'leyhill',
-    'lfa-1',
-    'li&egrave;ge',
-    'liaised',
     'lib&eacute;ration',
-    'libre',
-    'licentiate',
-    'licentious',
-    'lieberman',
-    'lieutenant-governor',
-    'life-blood',
-    'life-cycles',
-    'lifecycle',
-    'lifelines',
-    'lifo',
-    'ligated',
-    'light-heavyweight',
-    'light-weight',
-    'lightbown',
-    'lightless',
     'lightman',
-    'ligier',
-    'ligulf',
-    'lila',
-    'lilacs',
-    'lilliputians',
-    'limber',
-    'limbering',
-    'limbic',
-    'limericks',
-    'limey',
-    'lindblom',
-    'lindner',
-    'linea',
-    'linnhe',
-    'lionesses',
     'lionfish',
-    'liotta',
-    'lipari',
-    'lipchitz',
-    'lipped',
-    'liquidating',
-    'liquitex',
-    'liquors',
-    'literae',
-    'lithgow',
-    'litho',
-    'lithological',
-    'lithologies',
-    'little-used',
-    'littleborough',
-    'liturgies',
     'livebearers',
-    'livened',
-    'livsey',
-    'loa',
-    'loaches',
-    'locative',
-    'lochnagar',
-    'lochsong',
-    'lockett',
-    'loeb',
-    'logicals',
-    'loitered',
-    'loki',
-    'lolium',
-    'loll',
-    'lollies',
     'lombok',
-    'lome',
-    'london-born',
-    'loners',
-    'long-necked',
-    'long-playing',
-    'longbridge',
-    'longer-lasting',
-    'longfield',
-    'longhill',
-    'longhouse',
-    'longhouses',
-    'longner',
-    'longuet',
-    'lookalikes',
-    'loose-head',
     'looseness',
-    'loosens',
-    'lopes',
-    'loraine',
-    'loran',
-    'lord-lieutenant',
-    'lorry-driver',
-    'lostock',
-    'loth',
-    'lothario',
-    'lotte',
-    'loudoun',
-    'lounger',
-    'louvred',
-    'love-affair',
-    'love-life',
     'loveable',
-    'loveitt',
-    'lovelorn',
-    'lovins',
-    'low-ceilinged',
-    'low-growing',
-    'low-interest',
-    'low-quality',
-    'low-rise',
-    'low-sulphur',
-    'low-tech',
-    'lower-middle-class',
-    'lower-paid',
-    'loyalism',
-    'lprp',
-    'ls6',
     'lstrain',
-    'lsw',
-    'ltom',
-    'lts',
-    'lubbock',
-    'lubricating',
-    'lubyanka',
-    'lucchesi',
-    'lucile',
-    'luckmann',
-    'lud',
-    'luddite',
-    'luft',
-    'luger',
-    'lugs',
-    'lulach',
     'lumpen',
-    'lumping',
-    'lunch-hour',
-    'lunges',
-    'lupton',
-    'lutz',
-    'luxuriating',
-    'luyt',
-    'luzern',
-    'lvov',
-    'lw',
-    'ly',
-    'lyc&eacute;e',
-    'lycoming',
-    'lyttelton',
-    'm&eacute;nage',
     'm&egrave;re',
-    'm\'',
-    'm\'lady',
-    'm\'sieur',
-    'm-forty',
-    'm11',
-    'maa',
-    'maazel',
-    'macaw',
-    'maccoby',
-    'mackinlay',
-    'macklin',
-    'maclachlan',
-    'macphail',
-    'macroura',
-    'macrovascular',
     'madding',
-    'madeirans',
-    'madonnas',
-    'madre',
-    'magistracy',
-    'magmatic',
-    'magnentius',
-    'magnetized',
-    'magnetopause',
-    'magnolias',
-    'maha',
-    'mahatma',
-    'maida',
-    'maincrop',
-    'maintainance',
-    'mainwaring',
     'maitre',
-    'mak',
-    'malabsorbed',
-    'maladies',
-    'malathion',
-    'maldita',
-    'malebranche',
-    'maleeva',
-    'malefactors',
-    'malformation',
-    'malins',
-    'mallow',
-    'malodorous',
-    'malpas',
-    'malraux',
-    'maltreated',
     'malts',
-    'mamadou',
-    'mamba',
-    'mamelukes',
-    'man-of-the-match',
-    'man-power',
-    'manacled',
-    'managerialism',
-    'managerialist',
-    'mandrake',
-    'manga',
-    'manh',
-    'manhandling',
-    'manholes',
-    'manilla',
-    'manipulators',
     'mannerist',
-    'manoeuvrable',
-    'manoeuvrings',
-    'mansdorf',
-    'mansur',
-    'mantes',
-    'mantras',
-    'manyara',
-    'manyattas',
-    'maoris',
-    'mapper',
-    'marchand',
-    'maree',
-    'margherita',
-    'mari',
-    'marietta',
     'marisa',
-    'marissa',
-    'marita',
-    'markup',
-    'marlott',
-    'marot',
-    'marrakesh',
-    'marram',
-    'marrows',
-    'marshalsea',
-    'marshmallow',
-    'marshmallows',
-    'martel',
-    'martelli',
-    'martians',
-    'martin-in-the-fields',
     'martinis',
-    'martino',
-    'martlesham',
-    'mary-ann',
-    'maryon',
-    'maserati',
-    'masjid',
-    'masoud',
-    'massager',
-    'massages',
-    'masterplan',
-    'mastership',
-    'masterworks',
-    'matadial',
-    'matchwinner',
-    'mathieson',
     'mathieu',
-    'matronly',
-    'matteo',
-    'maughan',
-    'mauls',
-    'maus',
-    'mawkish',
-    'mayerling',
-    'mayes',
-    'mayflower',
-    'mayrhofen',
-    'mbq',
-    'mccain',
-    'mcclean',
-    'mccowan',
-    'mccray',
     'mcdermid',
-    'mcdevitt',
-    'mcdiarmid',
-    'mcgirk',
-    'mcguckin',
-    'mcjannet',
-    'mckellar',
-    'mckellen',
-    'mclintock',
-    'mcofs',
-    'mcvitie',
-    'me-6',
-    'mealy',
-    'mealy-mouthed',
-    'means-testing',
-    'meat-eating',
     'meaulnes',
-    'mec',
-    'medium-range',
-    'meekness',
-    'meer',
-    'megadeth',
-    'mehmet',
-    'meier',
-    'melamine',
-    'melanisms',
-    'melba',
-    'melding',
-    'meldrew',
-    'meli',
-    'melinar',
-    'melksham',
     'mellings',
-    'mellors',
-    'melsonby',
-    'melusina',
-    'memorex',
-    'mend&egrave;s-france',
-    'menil',
-    'menotti',
-    'menshevik',
-    'mental-health',
-    'meon',
-    'mephistco',
-    'mercurius',
-    'mercutio',
-    'merde',
-    'meredith-lee',
     'merisel',
-    'merle',
-    'merrell',
-    'merriman',
-    'merritt',
-    'merrydown',
-    'mersea',
-    'merwe',
-    'mesenchymal',
-    'mesoderm',
-    'mesolithic',
-    'meson',
-    'messager',
-    'messiahs',
-    'messily',
-    'metall',
     'metamorphoses',
-    'metaphase',
-    'methanogenesis',
-    'methylase',
-    'metonymy',
-    'metrics',
-    'mf',
-    'mg/24',
-    'mg/kg/day',
-    'mhor',
-    'miach',
-    'mian',
-    'miaow',
-    'mias',
-    'micelles',
-    'micheal',
     'michelet',
-    'michio',
-    'michoac&aacute;n',
-    'micro-computer',
-    'micro-kernel',
-    'microeconomics',
-    'microfibre',
-    'micrograms',
-    'micrograph',
-    'micrographs',
-    'microprobe',
-    'microprose',
-    'microstructure',
-    'microtext',
-    'mid-\'70s',
-    'mid-\'80s',
     'mid-1920s',
-    'mid-1988',
-    'mid-70s',
-    'mid-80s',
-    'mid-engined',
-    'mid-on',
-    'mid-sixteenth',
-    'mid-stream',
-    'mid-western',
-    'midani',
-    'middenheim',
-    'middle-sized',
-    'middleborough',
-    'middleton-in-teesdale',
-    'middleware',
-    'middx',
     'middy',
-    'mielke',
-    'mien',
-    'miert',
-    'migrates',
-    'mikey',
-    'mikoian',
-    'mildewed',
-    'mileages',
-    'miletus',
-    'militantly',
-    'military-political',
-    'millesimal',
-    'million-dollar',
-    'million-plus',
-    'millom',
     'milongo',
-    'milpitas',
-    'mimes',
-    'mimesis',
-    'mind-blowing',
-    'mini-skirts',
-    'miniaturisation',
-    'minibuses',
-    'minimizes',
-    'miniscule',
-    'minnelli',
-    'minos',
-    'minsmere',
-    'minsters',
-    'mio',
-    'mirages',
     'mired',
-    'mires',
-    'misbehaved',
-    'miscalculations',
-    'miscible',
-    'miscue',
-    'misfired',
-    'misha',
-    'mishandled',
-    'mishmash',
-    'misinterpreting',
-    'misnamed',
-    'misprint',
-    'misquoted',
-    'missis',
-    'missives',
     'misspelled',
-    'misting',
-    'mistrustful',
-    'mitosis',
-    'mitra',
-    'mitred',
-    'mittens',
-    'mitterand',
-    'mitts',
-    'mixed-ability',
-    'mkn45',
-    'mlu',
-    'mmb',
-    'moats',
-    'mobsters',
-    'mock-ups',
     'moderations',
-    'module(s)',
-    'mogg',
-    'moggie',
-    'moghul',
-    'mohawk',
-    'mohr',
-    'moine',
-    'moishe',
-    'moisturise',
-    'moledet',
-    'moleskin',
-    'molest',
-    'molestation',
-    'mollify',
-    'moluccas',
     'momoh',
-    'moncur',
-    'money-laundering',
-    'money-lenders',
-    'money-spinning',
-    'monied',
-    'monkees',
-    'monkhouse',
-    'monoplane',
-    'monopolists',
-    'monterey',
-    'montmartre',
-    'monumentally',
-    'moonshine',
-    'moraine',
-    'morant',
     'moravian',
-    'moresby',
-    'morgans',
-    'morison',
-    'morkie',
-    'morningside',
-    'mornington',
-    'moroccans',
-    'morons',
-    'morphogenesis',
-    'morrisons',
-    'mosfet',
-    'mostyn',
-    'motd',
-    'moth-eaten',
-    'mothballed',
     'mother-of-two',
-    'mother-tongue',
-    'mothers-in-law',
-    'motocross',
-    'motte',
-    'mouland',
-    'moule',
-    'moules',
-    'mountainsides',
-    'mournes',
-    'mouthpieces',
-    'mouthwash',
-    'moveables',
-    'mowden',
-    'mowgli',
-    'mox',
     'moxton',
-    'moyle',
-    'moyra',
-    'mpr',
-    'mrd',
-    'msf',
-    'mtdna',
-    'mtfs',
-    'mti',
-    'much-travelled',
-    'mucosae',
-    'muddles',
-    'mudhoney',
-    'muffling',
-    'mujtaba',
-    'mullions',
     'multavia',
-    'multi-member',
-    'multi-plant',
-    'multichip',
-    'multimillion',
-    'multiplicand',
-    'multiplicative',
-    'multitasking',
-    'mumm',
-    'mummery',
-    'mumps',
-    'munday',
-    'munter',
-    'murgatroyd',
-    'murmurings',
-    'murren',
     'murton',
-    'musketry',
-    'muspratt',
-    'mutilate',
-    'mutilations',
-    'mutinously',
-    'mycenaean',
-    'mycobacterium',
-    'myenteric',
-    'myosin',
-    'mystify',
-    'n-',
-    'n.y.',
-    'n/n',
-    'n25',
-    'n6',
     'n7',
-    'n=',
-    'n=1',
-    'n=2',
-    'nabbed',
-    'nad',
-    'nagle',
-    'nagoya',
-    'naira',
-    'nakasone',
-    'namas',
-    'namurian',
-    'nanometres',
-    'narbonne',
-    'narcog',
-    'narrators',
     'nasals',
-    'natfhe',
-    'nationalise',
-    'naughton',
-    'naze',
-    'nba',
-    'ncdad',
-    'ndc',
-    'ndembu',
-    'ndf',
-    'neame',
-    'near-by',
-    'near-perfect',
-    'near-surface',
-    'nearn',
-    'nebulae',
     'necking',
-    'necklines',
-    'necromancer',
-    'nectarines',
-    'neddy',
-    'nederland',
-    'needs-led',
-    'negating',
-    'neglectful',
-    'negus',
-    'nei',
-    'nella',
-    'nemeth',
-    'neo-colonialism',
-    'neoclassicism',
-    'neonate',
     'neophyte',
-    'nephrotoxicity',
-    'nephthys',
-    'neroli',
-    'neruda',
-    'nest-egg',
-    'nesta',
-    'nestlings',
-    'netherland',
-    'nettos',
-    'neues',
-    'neurosurgery',
-    'neutering',
-    'neutralism',
-    'neutrogena',
-    'neverland',
     'nevers',
-    'newborns',
-    'newcastle-under-lyme',
-    'newleys',
-    'newly-created',
-    'newly-established',
-    'newly-opened',
-    'newly-qualified',
-    'newoed1',
-    'news-sheet',
-    'newscaster',
-    'newsflash',
-    'next-of-kin',
-    'nfer',
-    'ng.ml',
-    'nga',
     'ngu',
-    'nguza',
-    'nicad',
-    'nichola',
-    'nicht',
-    'nicoll',
-    'nield',
-    'nietzschean',
-    'niggardly',
-    'night-shift',
-    'nightclothes',
-    'nightdresses',
-    'nih3t3',
-    'nihilist',
-    'nihon',
-    'nimslo',
     'nimu&euml',
-    'ninagawa',
-    'nine-member',
-    'ninety-seven',
-    'nipper',
-    'nisi',
-    'nit-picking',
-    'nitrogenous',
-    'niue',
-    'nivea',
-    'nives',
-    'nj',
-    'nkvd',
-    'nmj',
-    'no-hoper',
-    'no.3',
     'no1',
-    'no2',
-    'noaa',
-    'nob',
-    'nobbs',
-    'nobby',
-    'noboru',
-    'nobs',
-    'nochlin',
-    'nociceptive',
-    'nogan',
-    'noisiest',
-    'nolte',
-    'non-assertive',
-    'non-associative',
-    'non-audit',
     'non-breeding',
-    'non-british',
-    'non-broadcast',
-    'non-business',
-    'non-capitalist',
-    'non-committally',
-    'non-conformity',
-    'non-consent',
-    'non-consumer',
-    'non-delivery',
-    'non-discriminatory',
-    'non-enrollers',
-    'non-formal',
-    'non-fundholding',
-    'non-graduating',
-    'non-hierarchical',
     'non-interest',
-    'non-interventionist',
-    'non-jewish',
-    'non-jurisdictional',
-    'non-litigation',
-    'non-manufacturing',
-    'non-marxist',
-    'non-metallic',
-    'non-metals',
-    'non-monetary',
-    'non-negotiable',
-    'non-participation',
-    'non-parties',
-    'non-physical',
-    'non-playing',
-    'non-polar',
     'non-price',
-    'non-relational',
-    'non-responders',
-    'non-response',
-    'non-return',
-    'non-scientific',
-    'non-sectarian',
-    'non-trivial',
-    'non-university',
-    'non-urgent',
-    'non-whites',
-    'noonday',
-    'normalising',
-    'normangate',
-    'normotensive',
-    'norster',
     'north-westerly',
-    'northway',
-    'northwood',
-    'not-too-distant',
-    'notational',
-    'notifiable',
-    'notifies',
-    'novella',
-    'novosibirsk',
-    'now-defunct',
-    'noyon',
-    'np1450l',
-    'ntbs',
-    'ntt',
-    'nuclear-powered',
-    'nuncio',
     'nunes',
-    'nuova',
-    'nuovo',
-    'nutcase',
-    'nwa',
-    'nyasha',
-    'o\'callaghan',
-    'o\'flaherty',
-    'o\'gara',
-    'o\'meara',
-    'oag',
-    'oak-panelled',
-    'oaksey',
-    'oan',
-    'oarsman',
-    'oast',
     'obair',
-    'obduracy',
-    'ober',
-    'oberland',
-    'objectivist',
-    'obviates',
-    'obviating',
-    'obviousness',
-    'oca',
-    'ocean-going',
-    'oceania',
-    'oceanus',
-    'oct-11b',
-    'octavian',
-    'octogenarian',
-    'odd-looking',
     'oddballs',
-    'oder',
-    'odom',
-    'odt',
-    'oe.',
-    'oedematous',
-    'oestrogens',
-    'off-air',
-    'off-colour',
-    'off-exchange',
-    'off-guard',
-    'off-key',
-    'off-limits',
-    'off-load',
-    'off-market',
-    'off-sale',
     'off-screen',
-    'off-stage',
-    'offcuts',
-    'office-holders',
-    'officepower',
-    'officinalis',
-    'ogle',
-    'ogling',
-    'ohmann',
-    'oil-lamp',
-    'okey',
-    'old-timers',
-    'oldknow',
-    'oligocene',
-    'oligodendrocyte',
-    'oliphant',
     'ollier',
-    'olly',
-    'olver',
-    'olympiad',
-    'omani',
-    'omicron',
-    'on-farm',
-    'on-stage',
-    'onc',
-    'once-in-a-lifetime',
-    'one-bedroom',
-    'one-match',
-    'one-month',
-    'one-point',
-    'one-room',
-    'one-term',
     'one-twelfth',
-    'one-week',
-    'ontologically',
-    'opals',
-    'open-top',
-    'open-topped',
-    'ophiolite',
-    'oppressing',
-    'opt-outs',
-    'optionally',
-    'optometrists',
-    'oracular',
-    'orcadians',
-    'ordo',
-    'orfs',
-    'orgasmic',
     'orientals',
-    'origami',
-    'origination',
-    'orinoco',
-    'orissa',
-    'orlick',
-    'ormesher',
-    'ormolu',
-    'ormonde',
-    'orsz&aacute;ggy&uuml;l&eacute;s',
-    'orthopaedics',
-    'orville',
-    'oryx',
-    'os/400',
-    'osbert',
-    'osgood',
     'osh',
-    'osmolality',
-    'ossett',
-    'ossified',
-    'ostertagia',
-    'ostinato',
-    'ostler',
-    'oswine',
-    'ott',
-    'ouko',
-    'oumar',
-    'oundle',
-    'ouster',
-    'out-dated',
-    'out-of-season',
-    'outa',
     'outbuilding',
-    'outnumbering',
-    'outpace',
-    'outsides',
-    'outspread',
-    'outvoted',
-    'outworkers',
-    'oval-shaped',
-    'ovaltine',
-    'over-capacity',
-    'over-confidence',
-    'over-emphasis',
-    'over-emphasised',
-    'over-exposure',
-    'over-generous',
-    'over-indulgence',
     'over-population',
-    'over-priced',
-    'over-protective',
-    'over-rated',
-    'over-reliance',
-    'over-ripe',
-    'over-sensitive',
-    'over-supply',
-    'over-valued',
-    'overbalanced',
-    'overcharging',
-    'overcooked',
-    'overdid',
-    'overemphasised',
-    'overfeeding',
-    'overfishing',
     'overhauls',
-    'overlong',
-    'overmanning',
-    'oversimplify',
-    'oversize',
-    'overstates',
-    'overstocked',
-    'overstuffed',
-    'overweening',
-    'overwhelms',
-    'overwrite',
-    'oviduct',
-    'ovipositor',
-    'owain',
-    'ower',
-    'oxford-based',
     'oxidized',
-    'oxley',
-    'oystercatchers',
-    'ozbek',
-    'p.b.',
-    'p.c.a.',
-    'p.d.',
-    'p.e',
-    'p.j.',
-    'p.o.',
-    'p.p.',
-    'p.r.',
-    'p14',
-    'p=0.0001',
-    'p=0.01',
-    'p=0.05',
     'paatelainen',
-    'pabx',
-    'pacer',
-    'pache',
-    'pacs',
-    'padi',
-    'paediatricians',
-    'paedophile',
-    'paestum',
-    'paganini',
-    'pagett',
-    'pagodas',
-    'paintbox',
-    'pairwise',
-    'palance',
-    'pale-faced',
     'palfrey',
-    'palimpsest',
-    'palmers',
-    'pammy',
-    'pan-arab',
-    'panchayat',
-    'panmunjom',
-    'pannick',
-    'pantell',
-    'pantisocracy',
-    'pao',
-    'paolozzi',
-    'papin',
-    'papists',
-    'papyri',
-    'paraformaldehyde',
     'parakeet',
-    'parallelogram',
-    'paraphrasing',
-    'paraplegic',
-    'parchments',
-    'parenthetical',
-    'pari',
-    'parishad',
-    'parkgate',
-    'parsers',
-    'parsnip',
-    'parsys',
-    'part-exchange',
-    'partaking',
-    'partes',
-    'parthenogenetic',
     'particulary',
-    'partings',
-    'partygoers',
-    'pascall',
-    'paseo',
-    'paso',
-    'passap',
-    'passenger-seat',
-    'passionless',
-    'passives',
-    'pastiches',
-    'pastis',
-    'pastoralism',
-    'pastorals',
-    'pastrami',
-    'pastureland',
     'patchouli',
-    'pates',
-    'pathogenetic',
-    'pati&ntilde;o',
-    'patriarchs',
-    'patterdale',
-    'pattie',
-    'paves',
-    'pawnbrokers',
-    'pawned',
-    'pay-as-you-go',
-    'pay-outs',
-    'paykel',
-    'payslips',
-    'pca',
-    'pcas',
     'pcd',
-    'pda',
-    'pdgf',
-    'peachy',
-    'peals',
-    'peatlands',
-    'peckle',
-    'pedersen',
-    'peeked',
-    'peeler',
-    'peelings',
-    'peeps',
-    'pelee',
-    'pelmets',
-    'peloton',
-    'pemberley',
     'pena',
-    'pendero',
-    'pendleton',
-    'penhill',
-    'penile',
-    'pennsylvanian',
-    'penny-pinching',
-    'penrice',
-    'pent',
-    'pentlands',
-    'penwith',
-    'pepi',
-    'peppery',
-    'perceptrons',
-    'percolator',
-    'pere',
     'perfectionism',
-    'perfidious',
-    'perfidy',
-    'perfusate',
-    'peri',
-    'perignon',
-    'perimeters',
-    'perineal',
-    'peripherally',
-    'peripheries',
-    'periscope',
-    'perlman',
-    'permanency',
-    'permeation',
-    'peroxidation',
-    'perpetrate',
     'perseus',
-    'person-to-person',
-    'persona_non_grata',
-    'personify',
-    'pertinence',
-    'pertussis',
-    'pes',
-    'peta',
-    'petar',
-    'petchey',
-    'petherbridge',
-    'petit_bourgeois',
-    'petrarch',
-    'petunias',
-    'pex',
-    'pfennig',
     'pfl',
-    'pfm',
-    'pfr',
-    'ph7.4',
-    'phaidon',
-    'phar',
-    'philandering',
-    'philologist',
-    'philomena',
-    'phlox',
-    'phobic',
-    'phonelink',
-    'phosphatidylethanolamine',
-    'phosphorescence',
-    'photoelectron',
-    'phrygian',
     'phworgh',
-    'physiognomy',
-    'picaresque',
-    'picc',
-    'pickaxe',
-    'picky',
-    'pictorially',
-    'picturesquely',
-    'pictus',
-    'pierrepont',
-    'pierson',
-    'pig-headed',
-    'pigdon',
-    'pigging',
-    'pigou',
-    'pigtail',
     'pilar',
-    'pilcher',
-    'pillai',
-    'pilling',
-    'pillock',
-    'pillory',
-    'pillsbury',
-    'pinewoods',
-    'pinfield',
-    'pinkerton',
-    'pinnock',
-    'pinny',
-    'pino',
-    'pinstripes',
-    'pinus',
-    'piranhas',
     'pirouettes',
-    'piroxicam',
-    'pisan',
-    'pitti',
-    'placemen',
-    'plainest',
-    'plaistow',
-    'plaiting',
-    'planation',
-    'planer',
-    'platitudinous',
-    'playlist',
-    'playpen',
-    'pleasance',
-    'pleasantness',
-    'pleasurably',
     'plecs',
-    'plectrum',
-    'pleiades',
-    'pleurisy',
-    'pli',
-    'plimsoll',
-    'plockton',
-    'ploeg',
-    'plotinus',
-    'plr',
-    'plummy',
-    'plurals',
-    'plut',
-    'pmsf',
-    'pochard',
-    'pocket-money',
     'pockmarked',
-    'poetess',
-    'pois',
-    'poitevin',
-    'polam',
-    'polarise',
-    'polecat',
-    'polices',
-    'poling',
-    'polishes',
-    'polje',
-    'pollensa',
-    'pollinating',
-    'pollution-free',
-    'pollux',
-    'polruan',
     'poltava',
-    'polyadenylation',
-    'polycarbonate',
-    'polychromos',
-    'polygamous',
-    'polymath',
-    'polymorphonuclear',
-    'polynesians',
-    'polytechnique',
-    'pom',
-    'pomfret',
-    'pommes',
-    'poncho',
-    'pontificating',
-    'pony-tail',
-    'ponyboy',
     'pooch',
-    'poore',
-    'popeye',
-    'popsey',
-    'popularize',
-    'porcupines',
-    'porosities',
-    'porphyry',
-    'porteneil',
-    'porteous',
-    'porton',
-    'portree',
-    'pos.',
-    'posies',
-    'position-independent',
-    'posner',
     'possibles',
-    'post-1997',
-    'post-apartheid',
-    'post-experience',
-    'post-imperial',
-    'post-modernism',
-    'post-modernist',
-    'post-structuralism',
-    'postgate',
-    'postoperatively',
-    'pot-holes',
-    'potentiometer',
-    'pottered',
-    'potton',
-    'povera',
-    'powerhaus',
     'powerpoint',
-    'poyntz',
-    'poznan',
-    'pp3',
-    'pra',
-    'practiced',
-    'prahu',
-    'prahus',
-    'praia',
-    'praslin',
-    'prattling',
-    'prayerful',
-    'pre-booked',
-    'pre-dated',
-    'pre-dinner',
-    'pre-flight',
     'pre-historic',
-    'pre-installed',
-    'pre-linguistic',
-    'pre-literate',
-    'pre-occupation',
-    'pre-planned',
-    'pre-planning',
-    'pre-release',
-    'prebend',
-    'preclinical',
-    'preconception',
-    'prednisone',
-    'preeminent',
-    'prefab',
-    'preformed',
-    'prelate',
     'premalignant',
-    'prematurity',
-    'premieres',
-    'premonitions',
-    'premultiplication',
-    'prepaid',
-    'preparative',
-    'preparers',
-    'prepositional',
-    'presage',
-    'presages',
-    'presbyteries',
-    'prestbury',
-    'presupposing',
-    'prevalences',
-    'prevaricate',
     'priam',
-    'price-sensitive',
-    'prickles',
-    'pridmore',
-    'prieto',
-    'primavera',
-    'principe',
-    'print-on-paper',
-    'priories',
-    'prioritizing',
-    'prissy',
-    'privateer',
-    'privateering',
-    'privatizations',
-    'privatizing',
-    'pro-choice',
     'pro-forma',
-    'pro-french',
-    'pro-rata',
-    'pro-reform',
-    'pro-social',
-    'prober',
-    'probert',
-    'proc',
-    'procedurally',
-    'processional',
-    'proclivity',
-    'procyclic',
-    'prodrive',
-    'profanity',
-    'professionalisation',
-    'professionalization',
     'professionalized',
-    'professorial',
-    'profit-oriented',
-    'projectionist',
-    'prolapse',
-    'promisee',
-    'promisor',
-    'promontories',
-    'proms',
-    'propagates',
-    'propels',
-    'propertius',
-    'property-owners',
-    'propulsive',
-    'proscription',
-    'prosody',
     'prospector',
-    'prospers',
-    'protein-tyrosine',
-    'proteon',
-    'proteus',
-    'prothero',
-    'prototyping',
-    'protozoan',
-    'protozoans',
-    'protrudes',
-    'provocations',
-    'prudery',
-    'pseudo-scientific',
-    'pseudoobstruction',
-    'psst',
-    'psyched',
     'psycholinguistics',
-    'psychophysical',
-    'psychotherapeutic',
-    'psyllium',
-    'ptfe',
-    'pubescent',
-    'public-relations',
-    'puckering',
-    'puerile',
-    'pugo',
-    'pulped',
-    'pulpits',
-    'pulverized',
-    'pumlumon',
-    'punisher',
-    'punky',
     'punting',
-    'pur',
-    'purdah',
-    'purpurea',
-    'purrs',
-    'pursing',
-    'push-over',
-    'push-pull',
-    'putti',
-    'pva',
-    'pvda',
-    'pyracantha',
-    'pyrex',
-    'pyrimidines',
-    'pyrite',
-    'pyro',
     'pyrrhic',
-    'pyx',
-    'qao',
-    'qpo',
-    'quads',
-    'quang',
-    'quantal',
-    'quantas',
-    'quantifier',
-    'quantifiers',
-    'quantocks',
-    'quarter-century',
-    'quartering',
-    'quarts',
-    'quasi-arbitrator',
-    'queensberry',
     'queers',
-    'quem',
-    'questioners',
-    'quibbling',
-    'quick-thinking',
-    'quicklime',
-    'quicktime',
-    'quist',
-    'qumran',
-    'qv',
-    'r&amp;a',
-    'r&eacute;giment',
-    'r&eacute;sum&eacute',
-    'r\'s',
-    'r-1',
-    'r-a-f',
     'r.j.',
-    'r.w.',
-    'rabbie',
-    'rabbinic',
-    'rabbinical',
-    'radials',
-    'radiograph',
-    'radiographs',
-    'radstock',
-    'raeburn',
-    'raffia',
-    'rag-1',
-    'ragusan',
-    'railcoach',
-    'railcoaches',
-    'railhead',
     'railside',
-    'raistrick',
-    'ralston',
-    'ramallah',
-    'rambled',
-    'ramirez',
-    'ramones',
-    'rancho',
-    'randi',
-    'ranganathan',
-    'ranjan',
-    'rankles',
-    'ransomed',
-    'rapacity',
-    'rapeseed',
-    'rapidcad',
     'raptures',
-    'rascals',
-    'rastafarian',
-    'rata',
-    'ratcliff',
-    'ratho',
-    'rationales',
-    'ravage',
-    'ravenglass',
-    'ravening',
-    'ravensworth',
-    'ravings',
-    'ravioli',
-    'rayer',
-    'rayners',
-    'rdb',
     'rdna',
-    're-apply',
-    're-appointed',
-    're-appointment',
-    're-building',
-    're-cycled',
-    're-design',
-    're-emerging',
-    're-enacting',
-    're-evaluated',
-    're-form',
-    're-instated',
-    're-introduce',
-    're-introduction',
-    're-structuring',
-    're-using',
     're-writing',
-    're:joyce',
-    'reactionaries',
-    'read/write',
-    'readier',
-    'readman',
-    'ready-mixed',
-    'ready-to-wear',
-    'real-balance',
-    'realign',
-    'realigned',
-    'reallocate',
-    'reallocated',
-    'reaps',
-    'rearrested',
-    'reassembling',
     'reawakening',
-    'reboot',
-    'rebounding',
-    'rebukes',
-    'recalculated',
-    'receptacles',
-    'rechtsstaat',
-    'reclassified',
-    'recognitions',
-    'recollecting',
-    'recollects',
-    'recompiled',
-    'reconnected',
-    'reconquest',
-    'reconstituting',
-    'record-player',
     'recruiters',
-    'recs',
-    'rectors',
-    'rectosigmoid',
-    'recursively',
-    'red-breasted',
-    'red-necked',
-    'red-throated',
-    'red-tiled',
-    'redcurrants',
-    'redheads',
-    'redirecting',
-    'redon',
-    'redraw',
-    'redshanks',
-    'redstarts',
     'redwing',
-    'reece-carlton',
-    'reestablish',
-    'refinance',
-    'refloat',
-    'refocus',
-    'reformat',
-    'regaling',
-    'regarders',
-    'regattas',
-    'regazzoni',
-    'registrar-general',
-    'regressing',
-    'regularized',
-    'rehearing',
-    'reinfarction',
     'reinterpreting',
-    'reinvented',
-    'reinventing',
-    'reinvigorated',
-    'reiss',
-    'relator',
-    'relegating',
-    'relenting',
-    'religiosity',
-    'reload',
-    'remainders',
-    'remaking',
-    'remediation',
-    'remington',
-    'remodel',
-    'remote-control',
     'remote-sensing',
-    'rending',
-    'rennenkampf',
-    'reorder',
-    'reordered',
-    'reorganizations',
-    'repackaging',
-    'repast',
-    'repatriating',
-    'repels',
-    'repenters',
-    'reperfusion',
-    'rephrased',
-    'replenishing',
-    'repressors',
-    'repulse',
     'rereading',
-    'resettling',
-    'residencies',
-    'resonators',
-    'resoundingly',
-    'respirators',
-    'resting-place',
-    'resubmitted',
-    'retailed',
-    'retaken',
-    'retarding',
-    'retinoblastoma',
-    'retinol',
-    'retrievable',
-    'retrofit',
-    'retsina',
     'revealingly',
-    'revell',
-    'reveries',
-    'revill',
-    'revitalization',
-    'revitalized',
-    'revolucionario',
-    'rewired',
-    'rewiring',
-    'rfls',
-    'rg',
-    'rhas',
-    'rheidol',
-    'rhind',
-    'rhine-westphalia',
-    'rhinitis',
     'rhm',
-    'rhodesians',
-    'rhombus',
-    'rhos',
-    'ria',
-    'ribblesdale',
-    'ribeira',
-    'ricardou',
-    'richey',
-    'rickets',
-    'ricochet',
-    'rictus',
-    'rie',
-    'rigel',
-    'rigger',
-    'right-minded',
     'right-ons',
-    'rightwing',
-    'rile',
-    'rimmel',
-    'rin',
-    'ringgits',
-    'ringstrasse',
-    'ringway',
-    'rinks',
-    'ritter',
-    'rivulet',
-    'rl',
-    'rmcs',
-    'rmt',
-    'roadtanks',
-    'robey',
     'rockingbirds',
-    'rocktron',
-    'rockwork',
-    'roding',
-    'rodrigues',
-    'roelof',
-    'rohingya',
-    'rollright',
-    'roly',
-    'romain',
-    'romanciers',
-    'rommetveit',
-    'romps',
-    'rooke',
-    'rooker',
-    'roomful',
     'roosts',
-    'ropey',
-    'roping',
-    'ropy',
-    'roquefort',
-    'rosat',
-    'roscommon',
-    'rosenior',
-    'rosetta',
-    'rosewater',
-    'rospa',
-    'rossa',
-    'rossall',
-    'rotaries',
-    'rotha',
-    'rothschilds',
     'rothstein',
-    'rouged',
-    'rous',
-    'rpt',
-    'rt-pa',
-    'rto',
-    'rtpa',
-    'ruach',
-    'rubberised',
-    'rubbished',
-    'rucking',
-    'rudderless',
-    'rudders',
-    'ruder',
-    'ruffian',
-    'ruiz',
     'rule-breaking',
-    'rule-governed',
-    'rule-making',
-    'rumen',
-    'ruminant',
-    'rumpole',
-    'runrig',
-    'ruptures',
-    'rupturing',
-    'rushmere',
-    'rusks',
-    'russe',
-    'russo-japanese',
-    'ruwang',
-    'rvh',
-    'rw&amp;p',
     'rwc',
-    'ry10',
-    'ryokan',
-    'ryrs',
-    's-bahn',
-    's.15',
-    's.20',
-    's.3',
-    's.47',
-    's.5(1)',
-    's.j.',
-    's11',
-    's12',
-    'saar',
-    'saarland',
-    'sabin',
     'saccharin',
-    'sacher',
-    'sackcloth',
-    'sacre',
-    'sacredness',
-    'saddlers',
-    'saddleworth',
-    'sags',
-    'sah',
-    'saintes',
-    'saintfield',
-    'sainthood',
-    'saith',
-    'sakhalin',
-    'salade',
-    'saladin',
     'salame',
-    'salicae',
-    'salinisation',
-    'salivate',
-    'salix',
-    'sallies',
-    'saltcoats',
-    'salters',
-    'saltman',
-    'salvationists',
-    'salvator',
-    'samaras',
-    'sambo',
-    'samosas',
-    'sandbag',
-    'sandeman',
     'sanderstown',
-    'sandiford',
-    'sandon',
-    'sansom',
-    'sant',
-    'saphery',
-    'sapiens',
-    'sapper',
-    'saps',
-    'sardar',
-    'sargasso',
-    'sarney',
-    'sarong',
-    'sarraute',
-    'sartori',
-    'sarvodaya',
     'sassou-nguesso',
-    'satins',
-    'satires',
-    'satiric',
-    'satrap',
-    'saturating',
-    'satz',
-    'sauchiehall',
-    'saughton',
-    'saute',
-    'savannas',
-    'savouries',
-    'sawmills',
-    'saxony-anhalt',
-    'sayed',
-    'sayle',
     'sberbank',
-    'scabby',
-    'scabious',
-    'scald',
-    'scale-like',
-    'scalfaro',
-    'scandalized',
-    'scapula',
-    'scarpered',
-    'scarps',
-    'scatty',
-    'scenically',
-    'sch&auml;tzchen',
-    'sch&auml;uble',
-    'schaffhausen',
-    'schaller',
     'scheduler',
-    'scheffau',
-    'schillings',
-    'schisms',
-    'schist',
-    'schlieffen',
-    'school-leaver',
-    'schoolkids',
-    'schoolmistress',
-    'schopenhauerian',
-    'science-based',
-    'scissor',
-    'scoffing',
-    'scofield',
-    'sconces',
-    'scorcher',
     'scotti',
-    'scoundrels',
-    'scraggy',
-    'scramblers',
-    'scrapheap',
-    'screenplays',
-    'scriabin',
-    'scribing',
-    'scriptwriters',
-    'scrounged',
-    'scrounging',
-    'scrubbers',
-    'scrutineers',
-    'scrutinizing',
-    'scu',
-    'scuds',
     'scummy',
-    'scylla',
-    'scything',
-    'sdpp',
-    'sea-green',
-    'sea-urchin',
-    'seabourne',
-    'seadocs',
-    'seagoing',
-    'seale',
-    'seamers',
-    'seaweeds',
-    'seaworthy',
-    'sebasti&aacute;n',
-    'sechem',
-    'secker',
     'secombe',
-    'second-biggest',
-    'second-person',
-    'secretes',
-    'sedgemore',
-    'sedgewick',
-    'sedimentological',
-    'sedley',
-    'seefeld',
-    'seekings',
-    'sefic',
-    'segregating',
-    'seiko',
-    'sein',
-    'selectronics',
-    'self-administered',
     'self-care',
-    'self-denying',
-    'self-directed',
-    'self-drive',
-    'self-justification',
-    'self-loathing',
-    'self-love',
-    'self-propelled',
-    'self-raising',
-    'self-realisation',
-    'self-realization',
-    'self-regarding',
-    'self-replicating',
-    'self-reproach',
-    'selflessly',
-    'seligman',
     'selma',
-    'selvey',
-    'semer',
-    'semi-',
-    'semi-acoustic',
-    'semi-annual',
-    'semi-desert',
-    'semi-feudal',
-    'semi-finalist',
-    'semi-literacy',
-    'semi-natural',
-    'semi-regular',
-    'semicolon',
-    'semper',
-    'send-up',
-    'senhora',
     'separator',
-    'seraglio',
-    'serbo-croat',
-    'serialisation',
-    'serialised',
-    'serialism',
-    'serjeants',
-    'servan-schreiber',
-    'seven-month',
-    'sevenths',
-    'seward',
-    'sey',
-    'sgb',
-    'shabbily',
-    'shafting',
-    'shagged',
     'shakeshaft',
-    'shalcross',
-    'shama',
-    'shames',
-    'shamus',
-    'shanahan',
-    'sharman',
-    'sharpish',
-    'shastri',
-    'shaven-headed',
-    'she-she',
-    'shea',
-    'shearers',
-    'shee',
-    'sheepdogs',
-    'sheerman',
     'shelby',
-    'shepherdess',
-    'sheree',
-    'sherif',
-    'sherrin',
-    'shhh',
-    'shiels',
-    'shiites',
-    'shillington',
-    'shinto',
-    'ship-building',
-    'shipbuilder',
-    'shipmates',
-    'shirlie',
-    'shklovsky',
-    'shkod&euml;r',
     'shockwaves',
-    'shoebox',
-    'shoelace',
-    'shop-bought',
-    'shopfront',
-    'short-circuit',
-    'short-cuts',
-    'short-legged',
-    'short-tempered',
-    'shortcrust',
-    'shorter-term',
-    'shorthorns',
-    'shortlisting',
-    'shoulder-bag',
-    'show-down',
-    'showery',
     'shredder',
-    'shrewish',
-    'shrivelling',
-    'shriver',
-    'shrove',
-    'shui',
-    'shulman',
-    'shuriken',
-    'shute',
-    'shuttling',
-    'siad',
-    'sibilant',
-    'siddle',
-    'side-stepping',
-    'side-table',
-    'siderite',
     'sidh',
-    'sidhu',
-    'sidle',
-    'siemens-nixdorf',
-    'sigmoidoscopic',
-    'sigourney',
-    'siii',
-    'sikorsky',
-    'silchester',
-    'silkstone',
-    'silvering',
-    'silvertown',
-    'sime',
-    'simkin',
-    'simm',
-    'simpered',
     'simpkins',
-    'simulacrum',
-    'sinbad',
-    'sinclair-stevenson',
-    'sinfonietta',
-    'singer-songwriter',
-    'single-mindedly',
-    'sinha',
-    'sinistrality',
-    'sisal',
-    'sit-ins',
-    'sit-ups',
-    'sitar',
-    'siva',
-    'six-member',
-    'six-mile',
     'sixfold',
-    'sixtieth',
-    'ska',
-    'skateboarding',
-    'skaven',
-    'skeg',
-    'skil',
-    'skin-tight',
-    'skittering',
-    'skiving',
-    'skol',
-    'slaanesh',
-    'slabby',
-    'slackly',
-    'slains',
-    'slanders',
     'sledge-hammer',
-    'sleep/wake',
-    'slickers',
-    'slieve',
-    'slighter',
-    'slights',
-    'slip-up',
-    'slithers',
-    'slobbering',
-    'sloshed',
-    'slouching',
-    'sloughed',
-    'slovo',
-    'slugged',
-    'slugging',
-    'sluggishness',
     'sluiced',
-    'sluicing',
-    'slurped',
-    'slurping',
-    'sma-aa',
-    'small-talk',
-    'smartness',
-    'smarts',
-    'smillie',
-    'smithwick',
-    'smokestack',
-    'smoothie',
-    'smutty',
-    'snake-like',
-    'snead',
-    'sneaks',
     'snes',
-    'sniggers',
-    'snips',
-    'snoop',
-    'snoozing',
-    'snorkel',
-    'snowballing',
-    'snowfalls',
-    'snubbing',
-    'snyder',
-    'so-so',
-    'socialista',
-    'socialites',
-    'sociality',
-    'socialize',
-    'sociedad',
     'society-as-parent',
-    'socio-demographic',
-    'soft-hearted',
-    'softy',
-    'soir',
-    'sokolov',
-    'sola',
-    'solanki',
-    'solid-state',
-    'solidifies',
-    'solidifying',
-    'sologne',
-    'solvay',
-    'solveig',
-    'sombro',
-    'somersaulting',
     'sommerville',
-    'somnolent',
-    'sonning',
-    'sopping',
-    'soprintendenza',
-    'sorp',
-    'sorvino',
-    'sot',
-    'soton',
-    'souring',
-    'sousan',
-    'southend-on-sea',
-    'southfield',
-    'southmead',
-    'sower',
-    'spacelab',
     'spaceman',
-    'spacemen',
-    'spacetime',
-    'spacings',
-    'spackman',
-    'spaghetti_bolognese',
-    'spandrels',
-    'spanish-speaking',
-    'sparkes',
-    'sparkler',
-    'sparklers',
-    'spasmo',
-    'specialisations',
-    'specialix',
-    'specmark',
-    'spectaculars',
     'speedo',
-    'speich',
-    'spengler',
-    'spermicide',
-    'speyer',
-    'spherically',
-    'spicules',
-    'spillover',
-    'spinks',
-    'spinward',
-    'splay',
-    'spm',
-    'spo',
-    'spoilsport',
-    'spokespersons',
-    'sponged',
     'spooling',
-    'spools',
-    'spoor',
-    'sportscar',
-    'spotlit',
-    'sprains',
-    'sprake',
-    'spread-eagled',
-    'sq._km',
-    'sqn.ldr',
-    'squashy',
-    'ss-20',
-    'ssdp',
-    'ssrc',
-    'ssrp1',
-    'sssh',
     'st-cloud',
-    'st3',
-    'stabilises',
-    'stableyard',
-    'stadler',
-    'staffel',
-    'stagnating',
-    'stainless-steel',
-    'stalagmites',
-    'stallholder',
-    'stanchions',
-    'stand-offish',
-    'stanislaw',
-    'stanmore',
-    'stapling',
-    'star-shaped',
     'starkie',
-    'starlit',
-    'starmer-smith',
-    'statementing',
-    'station-building',
-    'staufen',
-    'staunchest',
-    'staurosporine',
-    'staved',
-    'staying-on',
-    'stealers',
-    'steam-powered',
-    'steamboat',
-    'steamships',
-    'steel-making',
-    'steelers',
     'steelworkers',
-    'steerable',
-    'stellenbosch',
-    'stempel',
-    'stenographer',
-    'stenting',
-    'step-families',
-    'step-ladder',
-    'step-parent',
-    'step-up',
-    'stepanakert',
-    'stepdad',
-    'stephane',
-    'steric',
-    'sterilise',
-    'stetches',
     'stevedore',
-    'stevedores',
-    'sticklebacks',
-    'stieglitz',
-    'stillbirths',
-    'stilling',
-    'stimson',
-    'stimulus-response',
-    'stirrer',
-    'stob',
-    'stock-still',
-    'stock-taking',
-    'stockhausen',
-    'stockley',
-    'stodge',
-    'stokenchurch',
     'stonier',
-    'stooge',
-    'stopfordian',
-    'stopfordians',
-    'stopgap',
-    'stoppers',
-    'store-rooms',
-    'storehouses',
-    'storerooms',
-    'storrington',
-    'storylines',
-    'stowaway',
-    'stowbridge',
-    'stp',
-    'strafed',
-    'strafing',
     'straggled',
-    'strahler',
-    'straightens',
-    'strandings',
-    'strange-looking',
-    'strangelove',
-    'strangles',
-    'stratabound',
-    'strategical',
-    'stratford-on-avon',
-    'strats',
-    'street-corner',
-    'streeter',
-    'stress-energy',
-    'stressors',
-    'stretchy',
     'strett',
-    'strewing',
-    'striations',
-    'strictness',
-    'stringers',
-    'stripey',
-    'stroessner',
-    'strollers',
-    'stromal',
-    'strongman',
-    'strontium',
-    'strutt',
-    'stubbing',
-    'studland',
-    'stuffiness',
-    'stygian',
     'stymied',
-    'styrofoam',
-    'suan',
-    'sub-assembly',
-    'sub-contracted',
-    'sub-directory',
-    'sub-disciplines',
-    'sub-licences',
-    'sub-lieutenant',
-    'sub-lithospheric',
-    'sub-machine',
-    'sub-paragraphs',
-    'sub-purchaser',
-    'sub-sample',
-    'sub-sections',
-    'sub-sector',
     'sub-set',
-    'sub-unit',
-    'subareas',
-    'subba',
-    'subjugate',
-    'subletting',
-    'sublimated',
-    'subliminally',
-    'subluxation',
-    'submucosa',
-    'subordinating',
-    'subpoenas',
-    'subscribes',
-    'subsections.',
-    'subsists',
-    'substation',
     'subtests',
-    'subtlest',
-    'subtractions',
-    'suc',
-    'succussion',
-    'suchard',
-    'sudeley',
-    'suffragan',
-    'sugar-free',
-    'suggs',
-    'suilven',
-    'sukhumi',
-    'suki',
-    'sukova',
-    'sul',
-    'sulien',
     'sultanate',
-    'sumatran',
-    'sumatriptan',
-    'summer-house',
-    'summerbee',
-    'summerson',
-    'summertown',
-    'sun-god',
-    'sunbathed',
-    'sunbeds',
-    'sunbury',
-    'sunda',
-    'sunloungers',
-    'sunnie',
-    'sunnier',
-    'super-powers',
     'supercoiled',
-    'superdiagonal',
-    'superfund',
-    'supersaturated',
-    'superseding',
-    'superserver',
-    'supersparc+',
-    'supplykits',
-    'supra-national',
-    'suprised',
-    'sure-fire',
-    'sure-footed',
-    'surface-to-air',
-    'surfactant',
-    'surfboard',
-    'surmounting',
     'surrey-based',
-    'susa',
-    'sutch',
-    'suter',
-    'sv',
-    'sw6',
-    'sw7',
-    'swa',
-    'swaddling',
-    'swail',
-    'swanton',
-    'swanwick',
-    'swash',
-    'swatting',
-    'swearing-in',
-    'sweetex',
     'swerves',
-    'swimbladder',
-    'swimsuits',
-    'swindled',
-    'swipes',
-    'switch-on',
-    'switchboards',
-    'switham',
-    'swopping',
-    'syed',
-    'sylphides',
-    'sylvan',
-    'sylvestris',
-    'symbolist',
-    'sympathiser',
-    'symptomless',
     'sync',
-    'synchronicity',
-    'synchrony',
-    'syncopated',
-    'syndicalist',
-    'syndication',
-    'syon',
-    'syphilitic',
-    'sys&dollar;lifespan',
-    'system-wide',
-    'systematization',
-    'systematized',
-    'systemhouse',
-    't&agrave;pies',
-    't&amp;l',
-    'table-tennis',
     'tabula_rasa',
-    'tachistoscope',
-    'tachograph',
-    'tackler',
-    'tadjik',
-    'tagg',
-    'tailless',
-    'tailwheel',
-    'takali',
-    'take-offs',
-    'talkback',
-    'tallentire',
-    'tallied',
-    'tamarisks',
-    'tamas',
-    'tambo',
     'tamer',
-    'tanaka',
-    'tangents',
-    'tantalizingly',
-    'tante',
-    'tappert',
-    'tarbert',
-    'targetting',
-    'tasha',
-    'tasked',
-    'tatras',
-    'tats',
-    'tattershall',
-    'tavalouze',
-    'tbp',
-    'tbsps',
     'tcv-309',
-    'tea-break',
-    'tea-room',
-    'tea-tray',
-    'teach-in',
-    'teacher-days',
-    'teale',
-    'teallach',
-    'team-building',
-    'tear-off',
-    'tearaways',
-    'teargas',
-    'teatro',
-    'technics',
-    'teed',
-    'tegucigalpa',
     'teignmouth',
-    'telegraphed',
-    'telesis',
-    'temperature-sensitive',
-    'ten-foot',
-    'tendril',
-    'teng',
-    'teng-hui',
-    'tennents',
-    'tenons',
-    'tenseness',
-    'terminological',
-    'terms_of',
-    'terris',
-    'territorials',
-    'tertullian',
     'tet',
-    'tetleys',
-    'teviot',
-    'text710',
-    'tgi',
-    'tgv',
-    'th\'',
-    'thackray',
-    'thalamus',
-    'thankfulness',
-    'thats',
-    'theatr',
-    'theatre-goers',
-    'theatricals',
-    'theistic',
-    'theodosius',
     'theosophy',
-    'thermoluminescence',
-    'thermostatically',
-    'thermostats',
-    'theroux',
-    'thersites',
-    'thick-skinned',
-    'thickset',
-    'thiepval',
-    'thin-skinned',
-    'thingies',
-    'third-generation',
-    'thirlmere',
-    'thirty-year',
-    'thirtysomething',
-    'thnn',
     'tholen',
-    'thora',
-    'thorez',
-    'thornburgh',
-    'thousandths',
-    'thre',
-    'threadworms',
-    'threarah',
-    'three\'s',
-    'three-figure',
-    'three-goal',
-    'three-member',
-    'three-ninetieth',
-    'three-page',
-    'three-putted',
-    'three-thirty',
     'three-toed',
-    'throbs',
-    'throngs',
-    'thrumming',
-    'thurnham',
-    'thurston',
-    'thymic',
-    'thyssen-bornemisza',
-    'tia',
-    'tian',
-    'tibbles',
-    'tibbs',
-    'tibbu',
-    'ticker',
-    'tics',
-    'tikka',
     'tilford',
-    'tillett',
-    'tillotson',
-    'tillyard',
-    'tilth',
-    'timaeus',
-    'time-frame',
-    'time-keeping',
-    'time-lag',
-    'time-like',
-    'time-travellers',
-    'timepiece',
-    'tinkerbell',
-    'tinners',
-    'tinseltown',
-    'tinsley',
     'tiptree',
-    'tissue-specific',
-    'tissue-typing',
-    'titillate',
-    'titrated',
-    'tittered',
-    'titty',
-    'tizer',
-    'tls',
-    'tmam',
-    'to-do',
-    'to-night',
-    'toboggan',
-    'tocsin',
-    'toddling',
-    'toehold',
     'toffs',
-    'tofu',
-    'togolese',
-    'togs',
-    'toilette',
-    'tokamaks',
-    'tokes',
-    'tolbooth',
-    'tolerantly',
-    'tolson',
-    'tom-cat',
-    'tomforde',
-    'tomy',
-    'tone-units',
-    'tonelessly',
-    'tonnages',
     'took-off',
-    'toolbar',
-    'tooled',
-    'top-flight',
-    'top-selling',
-    'topcoat',
-    'topiary',
-    'topicality',
-    'topp',
-    'toppers',
-    'torched',
-    'torday',
-    'torques',
-    'torrie',
-    'torrijos',
-    'tortillas',
     'torvill',
-    'torygraph',
-    'tossell',
-    'tosser',
-    'totems',
-    'totted',
-    'totting',
-    'toughening',
-    'toupee',
-    'tour&eacute',
-    'towelled',
-    'townhouse',
-    'townley',
-    'townscapes',
-    'townsman',
-    'towplane',
     'toyboy',
-    'toye',
-    'toytown',
-    'tozer',
-    'tpc-a',
-    'tr2',
-    'trabant',
-    'tracheae',
-    'tracings',
-    'trackless',
-    'trade-weighted',
-    'tradeable',
-    'tradespeople',
-    'traffic-calming',
-    'trafficker',
-    'train-shed',
     'tramroad',
-    'trance-like',
-    'tranquillizer',
-    'tranquilly',
-    'transacting',
-    'transactivation',
-    'transfused',
-    'transgressing',
-    'transhipment',
-    'transpiration',
-    'transpire',
-    'transposing',
-    'transpositions',
-    'transputer-based',
-    'transubstantiation',
-    'trashy',
     'travails',
-    'travel-to-work',
-    'travelogue',
-    'traversal',
-    'traviata',
-    'travolta',
-    'trawsfynydd',
-    'trebizond',
-    'trebling',
-    'trebyan',
-    'tree-tops',
-    'trefusis',
-    'trekkers',
-    'trending',
-    'trespassed',
-    'tri',
     'tri-pacer',
-    'trial-and-error',
-    'tribalism',
-    'triceps',
-    'trigger-happy',
-    'trilateral',
-    'trills',
-    'trinket',
-    'triphosphate',
-    'triplane',
-    'tripp',
-    'trisha',
-    'triumphalism',
-    'triumphalist',
-    'trivialities',
-    'troizen',
     'trojans',
-    'trompe',
-    'troopship',
-    'tropes',
-    'tropicals',
-    'troth',
-    'trotskyists',
-    'trotters',
-    'troublemaker',
-    'trouville',
-    'trumped',
-    'trusthouse',
-    'trustworthiness',
-    'truth-claims',
-    'trw',
-    'tryfan',
     'tryon',
-    'trypanosomes',
-    'tse-tung',
-    'tsetse',
-    'tshwete',
-    'tuaregs',
-    'tubal',
-    'tubbs',
-    'tudhoe',
-    'tufting',
-    'tukey',
-    'tula',
-    'tulagai',
-    'tumin',
-    'tumor',
-    'tupac',
     'turbot',
-    'turfed',
-    'turkmen',
-    'turlis',
-    'turn-on',
-    'turnberry',
-    'turnpikes',
-    'turps',
-    'tutor-organisers',
-    'tuvalu',
-    'tvr',
-    'twats',
-    'tweeddale',
-    'tweedy',
-    'tweet',
-    'twelve-inch',
     'twelve-month',
-    'twenty-odd',
-    'twenty-one-year-old',
-    'twenty-seventh',
-    'twice-yearly',
-    'twiddle',
-    'twigged',
-    'twirls',
-    'two-foot',
-    'two-level',
-    'two-night',
-    'two-speed',
-    'two-storeyed',
-    'two-year-olds',
-    'txb',
-    'tyas',
     'tykes',
-    'tyminski',
-    'tympanum',
-    'typecast',
-    'typification',
-    'tyrannies',
-    'tywyn',
-    'tyzack',
-    'u.s.s.r.',
-    'ua',
-    'ubr',
-    'ucla',
-    'udders',
-    'udi',
-    'uh-huh',
-    'uli',
     'ulimo',
-    'ullswater',
-    'ulric',
-    'ulrika',
-    'ulstermen',
-    'ultrasonagraphy',
-    'ulverston',
-    'unachievable',
-    'unacquainted',
-    'unadventurous',
-    'unappetising',
-    'unapproved',
-    'unavailing',
-    'unbalance',
-    'unblocked',
-    'uncharged',
     'unclenched',
-    'unclouded',
-    'uncomplimentary',
-    'unconfined',
-    'uncoupled',
-    'uncurled',
-    'undemonstrative',
-    'under-14',
-    'under-funded',
-    'under-reporting',
-    'under-representation',
-    'underemployed',
-    'underplayed',
-    'underpowered',
-    'understandingly',
-    'undesirability',
     'undesirables',
-    'undimmed',
-    'undirected',
-    'undistorted',
-    'unenlightened',
-    'uneventfully',
-    'unfeminine',
-    'unflinchingly',
-    'unforced',
-    'unfreezing',
-    'ungentlemanly',
-    'ungerson',
-    'ungulates',
-    'unhampered',
-    'unhooked',
-    'unidroit',
     'unilateralist',
-    'unimaginably',
-    'unimagined',
-    'unimportance',
-    'unimproved',
-    'unipolar',
-    'unissued',
-    'unit-linked',
-    'univariate',
-    'unladen',
-    'unleavened',
-    'unnervingly',
-    'unobjectionable',
-    'unoriginal',
-    'unpicked',
-    'unplaced',
     'unpleasing',
-    'unpremeditated',
-    'unreachable',
-    'unremittingly',
-    'unrepentantly',
-    'unreserved',
-    'unrolling',
-    'uns',
-    'unscramble',
-    'unsheathed',
-    'unshielded',
-    'unspent',
-    'unsporting',
-    'unstained',
-    'unstinting',
-    'unsubtle',
     'unsuitably',
-    'untarnished',
-    'untended',
-    'unter',
-    'unwrapping',
-    'up-and-down',
-    'up-dated',
-    'up-river',
-    'updike',
-    'upholsterer',
-    'uproariously',
-    'upstate',
-    'ura',
-    'uraemic',
-    'urethane',
-    'urination',
     'ursa',
-    'us&dollar;1,600',
-    'us-style',
-    'usair',
-    'user-defined',
-    'ushaw',
-    'utp',
-    'utrillo',
-    'uttermost',
-    'uttley',
-    'uttoxeter',
-    'uulaa',
-    'v-neck',
-    'v-sign',
-    'v.-c.',
-    'vacuumed',
     'vadinamian',
-    'vagal',
-    'valentinian',
-    'vales',
-    'valetta',
-    'valhalla',
-    'valiance',
-    'vall&eacute;e',
-    'vallance',
-    'valorem',
-    'valuational',
-    'valuev',
-    'valvestate',
-    'vander',
-    'vango',
-    'vann',
     'vapid',
-    'variably',
-    'vasoconstriction',
-    'vassiliki',
-    'vcrs',
-    'vegetated',
-    'vegetational',
-    'veitch',
-    'velour',
-    'veness',
-    'venetia',
-    'venkataraman',
-    'venomously',
-    'venoms',
-    'vento',
-    'verderer',
     'verminous',
-    'verreaux',
-    'verticality',
-    'verts',
-    'verzenay',
-    'vestment',
-    'veterinarian',
-    'veterinarians',
-    'vexin',
-    'vgp',
-    'vhai',
-    'vhp',
-    'vibrancers',
-    'vibrantly',
-    'vice-adml',
-    'vice-like',
     'vice-minister',
-    'vice-principal',
-    'vick',
-    'vickery',
-    'vict.',
-    'victoriana',
-    'victualling',
-    'vid',
-    'videodiscs',
-    'videoing',
-    'vieux',
-    'vill',
-    'villette',
-    'vincente',
-    'violators',
-    'viridian',
     'vis',
-    'viscera',
-    'viscoelasticity',
-    'visors',
-    'visuo-spatial',
-    'vitaly',
-    'vitiate',
-    'viticulture',
-    'vittoria',
-    'vituperative',
-    'vlok',
-    'vltava',
-    'voile',
-    'voix',
-    'volcanos',
-    'volk',
     'volte_face',
-    'voluntary-aided',
-    'voor',
-    'vouchsafed',
-    'vxworks',
-    'vyacheslav',
-    'w.b.',
-    'w/c',
-    'w/v',
-    'w6',
-    'waffles',
-    'waffling',
-    'wags',
-    'waifs',
-    'waikiki',
-    'wal-mart',
     'walberswick',
-    'walk-on',
-    'walkie',
-    'walking-stick',
-    'wallcovering',
-    'walloon',
-    'wallpapering',
-    'walpole-bond',
-    'warble',
-    'warbling',
-    'wardell',
-    'wardley',
-    'warplanes',
-    'warrenpoint',
-    'wash-basin',
-    'washing-machine',
     'wassall',
-    'waste-disposal',
-    'water-filled',
-    'water-powered',
-    'water-soluble',
-    'water-table',
-    'watered-down',
-    'waterston',
-    'waterwheels',
-    'watsons',
-    'wcuk',
-    'wearin\'',
-    'weather-vane',
-    'weatherman',
-    'weathermen',
-    'webbe',
     'wedging',
-    'weekes',
-    'weenie',
-    'weeny',
-    'weevils',
-    'weightier',
-    'weightlessness',
-    'weightlifting',
-    'well-adjusted',
-    'well-aimed',
-    'well-constructed',
-    'well-furnished',
-    'well-meant',
-    'well-presented',
-    'well-proportioned',
-    'well-spoken',
     'well_as',
-    'wellhead',
-    'welsh-speaking',
-    'wemyss',
-    'wending',
-    'wenger',
-    'wesleyans',
-    'westernized',
-    'wharram',
-    'wheatear',
-    'wheatsheaf',
-    'wheedle',
-    'wheezes',
-    'whelk',
-    'wheway',
-    'whinnied',
     'whirligig',
-    'whirls',
-    'whiskery',
-    'white-coated',
-    'whitefield',
-    'whitefriars',
-    'whitgift',
-    'whittling',
-    'whizz-kid',
-    'wholefood',
-    'wholesaling',
-    'wholewheat',
-    'whs',
-    'wichita',
-    'wickram',
-    'wickrithe',
     'widely-held',
-    'widmer',
-    'wiechula',
-    'wiggling',
-    'wihtred',
-    'wildenstein',
-    'wildflower',
-    'wilfulness',
-    'willingham',
-    'willowfield',
-    'wimpol',
-    'windeler',
-    'winderman',
-    'window-dressing',
-    'windowed',
-    'windows-on-unix',
     'windowsills',
-    'winery',
-    'wing-half',
-    'wingfield',
-    'wingless',
-    'wingtip',
-    'winkelmann',
-    'winsford',
-    'winthrop',
-    'winwaed',
-    'wireframe',
-    'wishy-washy',
-    'wisley',
-    'witcombe',
-    'witte',
-    'wiz',
     'woebegone',
-    'wolfhound',
-    'wollstonecraft',
-    'wolmar',
-    'wombat',
-    'wood-panelled',
-    'woodbines',
-    'woodchurch',
-    'woodcutters',
-    'woodruff',
-    'woodvale',
-    'woonerven',
-    'word-meaning',
-    'wordsworthian',
-    'work-outs',
-    'workpeople',
     'workpiece',
-    'worldly-wise',
-    'worming',
-    'worrier',
-    'worst-hit',
-    'worsthorne',
-    'wotherspoon',
-    'wrangham',
-    'wraparound',
-    'wrekin',
-    'wrenches',
-    'wresting',
-    'wrinkly',
-    'write-downs',
-    'write-up',
-    'wrong-doing',
     'wrong-footed',
-    'wrong-headed',
-    'wrongdoer',
-    'wroxeter',
-    'wspu',
-    'wullie',
-    'wurlitzer',
-    'wyeth',
-    'wynd',
-    'wyrmberg',
-    'x-',
-    'x-box',
-    'x400',
-    'xanthine',
-    'xba',
-    'xenografts',
     'xhibition',
-    'ximena',
-    'xplorer',
-    'xr3i',
-    'xsoft',
-    'xvt',
-    'xxi',
-    'y\'s',
-    'yaga',
-    'yaks',
-    'yam-ma',
-    'yams',
-    'yao',
-    'yaobang',
-    'yashkin',
-    'yatton',
     'yc',
-    'yccc',
-    'yearlings',
-    'yellow-green',
-    'yelps',
-    'yentob',
-    'yerevan',
-    'yews',
-    'yha',
-    'ying',
-    'ylang-ylang',
-    'yogi',
-    'yom',
-    'yonks',
-    'yorkie',
-    'yorkshiremen',
     'yoweri',
-    'yu-wei',
-    'yucca',
-    'yun',
-    'yunnan',
-    'yvresse',
-    'z3',
-    'zag',
-    'zakopane',
-    'zakro',
-    'zambezi',
-    'zapped',
-    'zarei',
-    'zayed',
-    'zebrafish',
-    'zeelenberg',
     'zeks',
-    'zenobia',
-    'zeppelins',
-    'zero-sum',
-    'zervos',
-    'zhou',
-    'zig-zagging',
-    'zig-zags',
-    'zigzags',
-    'zing',
-    'zippy',
-    'zircon',
-    'znf11a',
-    'zona',
-    'zonation',
-    'zou',
     'zp',
-    'zuccarelli',
-    'zur',
-    'zvi',
-    'zviad',
-    'zvornik',
+)
+
+blocks_11 = (
+    ')$heah)#ric"&gr&bgr"$mp;d%$name!#cir!+dollar;0.05+!8(#1.4*"53+!4)!1)"6m($2.7m)#50m',
+    '*"3m(\'600,000*!m(&70,000)"50(#900!-eacute;chelle)#ole(\'tranger!)formula;.)!i"%rac23!\'lt;0.05!#mgr"(icro;mol',
+    '"*ound;1,700(#.40(&15,000($4.50($5.50("8m\'%2,300(#.30)"49)!6*!m)!7*!m("1m(#500',
+    '(\'million\'$3.2m)"40)!6)"7m(%4,000(%6,000("80\'$4000("25($9.95)!5\'$5.25("75\'$6.00',
+    '(!3(!8\'"78\'$8000*!m)!m(!6\'$9.25)!5\'!l\'!x!#zgr $\'20s!"86"!8',
+    '""lf#"lo!#uns!"we!#yes "+3 "--!"20!!a!!b!"ed!$loss !.!"22 )0&ndash;2',
+    '!$-6-0!$.01%""33!$0:23#"38!%1.01a!#272!#483!"51!#642!#904#!8!!v (1&frac14"(ndash;16',
+    '!"\'s!#(5)!!*!&,000lb""25"#750!!-!#.13#!8#!9"$44mb""50#!p""7m!*0&ndash;14',
+    '"$,500"%-mile"#.10$!3#"25#"40"\'0&mgr;m#&-share#"km""14""20""33""40""72""80',
+    '"!a"#ins""st!*1&ndash;15"#(1)"%-plus"!.#!0$#0am#"10$!1#$30pm""02#!5""76',
+    '#!3#!7""90!(2&frac12#(ndash;18"!-"!.#!0""01#!2#!5#"mb""13"&5g/4oz#"th',
+    '#!8""89""93#!9"!a!*3&ndash;16"%-year""01#!3""10#!2#!9""20""35""45',
+    '#!6""71#!3"!c!$4(1)"$,500"#.5%#!9""01##mph""15""30""72#!8#!9',
+    '#!9"!a"!s!%5&deg#(ndash;30"(,000,000"&-month#)year-olds"#000#!9#"ft""14#!8""23#!6',
+    '""56""61""77"#90s#!3"#min""pc!*6&ndash;20"$,500""-1#$year"".7#!8"#/18"%5,000',
+    '""pc!*7&ndash;19"".9!*8&ndash;20"".2#!6#!9"\'0&deg;c!#9.4"$20\'s#)1&ndash;2"#70a#$9-80"%80-87#$2/83',
+    '##6/7##7/8#"9.$!c"#91b##3/4#$4-95!#:20"&50,000!$tbsp (2&frac14!"\'s!(,500,000!#.1%#".3',
+    '""55!%0&ins#\'ndash;1"#(1)"%-mile"#000#"ft##mhz$!l$!m""50""mb!#2.1#!2#!3',
+    '#!8"(1&sol;89"!p!$3-24"".1#!2#!4"%0,000""cm!#4.5#!6!*5&ndash;29""ft"!m!$6-28',
+    '!$8-30""00!#900"!p!"d.!"hr!$tbsp!!x &3,000m"#700!"-6"&series"$wood!$.2.0$!1',
+    '""40"&5-inch#!0!"/2!*0&ndash;35"".5""0m$)l/&frac12"!c"#min#!m!#200!%4,000!(50g/12oz"!2',
+    '!&60,000!&70,000"&112-13"#335#"72"#870"#931!$8314#"61!":2!"d.!"pc %4,300"#700!"-7',
+    '#".1"#2.2#!0!)0&ndash;1"#(1)"\'-minute"#1st"!g!#2.5!#5cm"!s!%6,000"!4"!6"!9',
+    '!"82"!4"!8""th!"91""th!"s.!#x10 *5&ndash;14!#.16""2%#!0#&5-inch"#3.3""40',
+    '!%0&deg&";c"!+"%-year"#000#"mm"!2"!3"!6"#:50!*1-year-old"#2kb"!5"!9!*2-year-old',
+    '!%3,000")-year-old"!3"!5!%4,000"!1"!2"!3"!6""th!"51"!9"!p!%6,000"!3',
+    '!"73"!9!"83"!4""th!*9-year-old"#/60"!0"!6!!v $6(4)!\'-string!#.13#!6#!7',
+    '##0am!*1-year-old!%2,000")-year-old"!1"!8""nd!"32"!5"!7!#40k!&50,000"!1"!2!"65',
+    '"!4"!6"!9!"89!"92"!6!"cm!!h @7&agr;-hydroxy-4-cholesten-3-one!#(1)!%.00pm""13"#2.1#!0""50',
+    '!#/jg!"04""pc!#1st!\'2&deg;c"!4!"39!"55"!8"#mhz!"62"!5!"72"!5"!9',
+    '"!7"!8"!9!"99!!b!"pc $8.11""20""3%""6%""8%!#0\'s"#586""pc!"12',
+    '"!8!"31"!2"!4"!8!"42"!3!"54"!7""th!"60"!4!"88!"90!#ins',
+    '(!7!"-1"!5!#.10""3%""9%!"35"!7!"5p!"61"!2"!3!"94!!m "a*',
+    '"$side!".s"!w!)bb&eacute#!y"(ductions""ed#&rnethy"$hors"&jectly"(ominably#)ve-ground"\'rasives"%scond#%eiled',
+    '#\'orbency#\'temious"&utment"\'ysmally!+ccentuation##ost#\'retions#\'usatory"$etyl"\'id-base"!k#%erman#$ford"%olyte"&quiror',
+    '!%d-hoc"!."%enine$$oids"\'hesions"(journing"\'mixture"&olphus#&ringly"%renal#$iaan$"en#%spach"&sorbed#!s',
+    '"*vancements#)entitious&%urism#)isability""ze!"ei""on"*romagnetic"#sop#%thete\'%icism")thelheard"!u!,ffirmatively##ric',
+    '"$lame"\'ricaine&#nus#*o-american"$shar"$ters!&ge-sex""fa"\'nathans")oraphobic"&rostis"%uilar$#rre!%herne")istorical',
+    '#)s-related"\'r-borne$%raids#%coupe#%drops#%shows$%trips#\'y-fairy"!s##led$#ing!)kersfield"$htar!(l-bashir#%fatah',
+    '#&kassar"!."#adi#"mo#"ns"$bedo"#can#,ohol-related"&daniti#%erton"(eksander#$thea"%falfa##ons"#ger',
+    '"\'ienates#$quot#%zarin"(l-action$$girl$\'or-none$$star#$ason#"ie$!s%#ter$(terative##man#\'ophones$"tt',
+    '$#way#!t"(ma_mater"\'oneness#"rs"$phas"%sager#&o-rans#$thom"$uinn"(zheimers!)manuensis%$llah#"rc"\'bushing',
+    '#!r$#ada$(ican-led)%owned#"ss"(iability#&loride#"ne"&monite"\'persand#$hora"$ulet#!r##ses!$na-h',
+    '#&stasia"\'ciently$\'llaries"(dernesse##rex"(euploidy"$geli$$vins#\'lepoise$&ophile"\'imating&"or#$onic"&nexing#%otate',
+    '"(struther"&tacids$(gonising#$hers$&ropoid((morphism#+i-avoidance%(colonial&%risis%*depressant%(european%(fascists&\'eminist%&german%%human',
+    '%)immigrant%(japanese%%mafia&&issile%\'peptide%$tory%\'western$)cipations$*depressant$$gone$(malarial&$tter$(pathetic$)symmetric$%viral',
+    '%"ov"#zac!#ped")hrodisias"#ing""la"&oplexy#"r2"(pleshare&"on%$talk$*iqu&eacute#)ointment.#)raisingly$(ehending',
+    '""r."%tidon"$ulia!$qaba"&uarist##ila!)rabesques#!d##kan#!l#$ntxa")bitrageur"&cadian#+hiepiscopal"(dakkeans',
+    '##ley"#fon#!u"#got#(yllshire""ie#"on"%khina#%leton"\'madillo#$band#&ouries""ne"\'omatics""pa',
+    '"#sed$%nical#%onist"&t-form##aud#$emia#&hropod$%urian&#ton#&icular(%tions"!u#"ba#!p!$sahi',
+    '"$coli$!m"\'hburton&!y#(en-faced#&kenazy""ic#!l"%karis"#lam$!n"&modeus"*phyxiation#"in"(semblers',
+    '&"or"%tbury#"er#\'uteness"#vat"$well!&taturk"\'heistic"$pase"(tempters$&nuator$%sting"$wood!&ubagne""er',
+    '"%relio&"us$"us##iol"\'stralis"&tarchy#&horess&(isations#)ocatalyst$&mating!"va""cs"#ens#*rage-sized"#ize',
+    '!#wol!\'xillary!#yes"7lesbury/buckinghamshire##och!,z&oacute;car"*a&ntilde;a#"po"*erbaijanis \'b&amp;h")ouml;lkow!"-2"#52s"%movie"$tree',
+    '!\'aa-baas"!b#$ergh#)y-sitting$$cham$%lonia"!c#$ardi##her$#man#%k-arc%$door$$chat$&gammon$&handed',
+    '%#ist&!t$%plane$#ref$&stairs$#ups""da#%enoch"&edeker#!r"%gnall#$pipe#%uette"%hadur#"du',
+    '"$idoa"\'kehouse$$lite#!r"&laguer#&birnie#(cerowicz#(d-headed##een#!k#+l-tampering$&erinas%#tic$&istics$$s-up',
+    '#"sa#%uster"%mboos#$pton"\'nd-pass$$eras$#saw$#ung#\'nisters#%shees#$tams$#ock$%ustan"&r-room$&tailed',
+    '%$rini$"on$$usse##den$"ic##esi#%gemen#$kers$#ley#&nbrook$(storming$#ton##oda##que#&rantes',
+    '$"io#*t-williams$&olomeo$!s"&ssanio#"ta"&taille#&chelor##her$"os#"ik#%tista$*le-scarred$"us%"ta',
+    '"$umol""wl"\'xendale"%ynton!#bmf"!s!&eagles$#rie#"ky#!l#$rish#&ubourg$(fighters$%teous"%chtel',
+    '")d-sitting#"ge#!i$$vere"(efburger#$line#"ry##zer"#gat#"et%!s#$onia$$tten"&hemoth#$rens',
+    '"&lhaven#(l-shaped$$agio$#ied$#man$%south##per#$ying"%ncher#!e$(volently##ito#"ns##oit#$thic',
+    '"&rating#&bizier#"nd$#ers$%ician##ret#&yllium"%seech\'%ingly#$iege#)t-dressed%$kept%\'looking$&iality&"ry',
+    '%$geux##han&!y$!e#(ter-paid$#ina&#son!%f109s!!g!$hrca!-i-directional"$afra#$nchi""ba"$cmos',
+    '"&ddable$\'lecombe$$ulph#$ston"(g-headed#"ht"#lal#"ge#\'inguals#$lows#\'sthorpe"&ndweed#$oche#!t"(ocontrol',
+    '#(physical"(rchfield#%endra#*th-control%$mark$&wistle"%shkek##was""tc#\'e-sized#%ingly#$maps"%valve"#zet!)lack-clad',
+    '&&market%$acre%&boards%$eyes%$hall%$legs&!y%&mailer%%shirt&$pots$"on#)nchflower$\'ketweed$$tyre#"re',
+    '""ea$#ker#%ncowe#&ssedly$!t"&ighton##nks#"ps#!x"\'ockwork#(od-sugar%,y-mindedness$$min\'$!r##unt',
+    '"&u-tack#%ecoat$"sy$!y##ffs#$mler$#min!"mp!&oaters"#ban")ckingford"&dicote##kin#!s#\'yweight',
+    '#$gles#"le"#hun"*ilermakers$"ie#"ng"%khara""le##ney#&t-hole")mb-making")napartism#(e-marrow$!y#\'hoeffer',
+    '#\'nington"+oby-trapped#\'k-lined$&stores#"le"\'rderers&$land##eal$#ham#"on##rie#%ussia#$wick""se#$nich',
+    '#&phorus##sed"#tch#$hies"&uffant##lez#%rassa##tin"$vver"%w-tie#(d/oxford#$ness"%xwood#!y!"ps',
+    '$&keting#&dlaugh#$gged#$hman#$ised#&kspear#!m$%shill##nco$#sby%$ford#&shness##yed"!c"!e',
+    '$%keven%)fast-time)#ing%&waters$&stbone#&tonnia&!s#%ughel#&whouse"$iars#(cklaying#\'ef-case$!n#.gadier-general$"id',
+    '$$disi#!o#\'quettes#$scoe$)tol-based#$tian%&shness"*oad-leaved%$gate%&sheets&$ides#&ckwell&$orth#"dy##gan',
+    '$(tosaurus#%oking#"ra"$umby#%nhild"\'ylcreem#$onia!"sm!"t3!$ubye"%ffing$"on"%gbear"#ksh"%limic',
+    '#$mers"#mph"(ndesliga&$wehr##ged$!y#%kered"!r#$bled%#ing$$ulis##don#&geoned#$kett#$mans',
+    '#%rough$!s#$tons"#sch#$hell$#men#&iness.(&people#$king#%uttil#\'ybodies"&tchell#%thole"\'zzcocks!%y-law',
+    '#&passes")ambasuren"\'product"!u \'c&amp;g!!\'!)-reactive!%.i.d."$m.c.""o.!(/ebp&dgr!)aballeros#$inda%(et-maker#&le-car',
+    '"%ching#!l"%ddick#"ge#&herins"$ecal#$sars"!f"*irns-smith"(lculable#,der&oacute;n&!a$!y#%igula#%l-box',
+    '$!e##pol#$umny##ved$\'inistic&!o"&margue#&brelle$&uslang#&elford#%phill$"os""na$*p&eacute;s%"es',
+    '##cun#$dace$(le-light#"ed#%juers#*nibalistic#&tering$%harus$"us"&pellan$(rcaillie%#ing#&irossi$(talizing##one',
+    '$#doc#+bon-bearing&"yl%&rundum%#xyl$!s#\'cinoids##ded#(e-giving$\'er-best$!l#$gill##low#(nogursky#"on',
+    '#$port#$rell#&stairs#)thaginian$!y#&voeiro#"yl""s.#&amance#&carino#&eloads$%ments$#rta#)h-limited%(strapped',
+    '#&tanets$"el$\'igating$%lebar&&wellan$$rate"&t-like#%alina%%oguer$%rrhal$,strophically#%calls#!e$+gorizations#$tell',
+    '"(ucasians$$uses#%dillo#&terets""va$"co$&lrymen#$emen"$wson"%zolet!#ctv!"d3"$45r0"%u/csu!#efn',
+    '##ebs#$omer##sus#!t"(maleddin"\'nsoring#\'tennial$%ipede$&ralize%&ipetal%\'odorsal&$mere#$wulf"&olwulf"*phalaspids',
+    '\'(vascular$"zo##ska#&titude#&vantes"!s!#fsu!,haise_longue#"ka#)mberlains$#den$#fer$$ping#\'ngeless%(ing-room',
+    '#.racterizations$)coal-grey$&gehand$&ioteer$%mless$#nel%$wood$$ring(#ton$%tists$!y#)stisement#%teaux$&terjee$#win',
+    '"!c"$eall$"po#&ck-off%#ers%$outs&#ver#)esemaking\'%onger#"la#&rishes\'#ing#%shunt#/v&egrave;nement$\'enement',
+    '#%yenne")iaroscuro#$cane\'"ry$%herin$\'ken-pox\'"ed%$weed#$ding#$gnon#&ldwall$$lies&!s$#uba#"no',
+    '$(opractor$$ping##tin"*loroplasts$%thild"+ock-a-block#%iseul#!k#0lecystectography%#ric#%osers#$rale$%ionic#"ux"-r&eacute;tien',
+    '#&issake%"ta#)omaticism"#ump#!n$#nel#\'rchgoer&$ward!#iba"#efl"!g"+nematograph#!q",rcumlocution"$tric',
+    '$%scape"%villy"$xous!"l."%achan$!k%&mannan#&irmont#$mmed#\'ndeboye&\'stinely$#ger$#ked$$smen##rac',
+    '%#ion#(ssicists%(lessness%$mate$#tic#(verhouse&#sal"#e-i#$anup$)r-sighted"%icker#$nker$$tons"(oakrooms#(ck-tower',
+    '##nal#!s#$uted##ven#%wnish"%uanie#%bcall##edo#"ff#(tterbuck!#mht"!v!"np""rs"!s',
+    '#(existing#&opting$$wner#(produced)$tion#%wrote"&alfish$#man"&bbling#!e"(chabamba$\'inchina$#ran#%katoo$%erell',
+    '$$pits$$roft""dd#&e-name$#ine"$ffer"\'gnisant"%habit"&iffure#%nages#!r"#kes"%lbeck#\'eoptera#%inear',
+    '#-lectivisation%!t$$ides%!s$)ocational%#ids%$redo#-onel-in-chief%&ialist$&ratura%!s#$ston#&umbian#$well$#ill',
+    '$"th$\'uppance#(fortless##ity#\'mandeer$*ercialized$*onsensical$%uning\',st-dominated*#led\'&tarian#%pania%#ore$%licit$%osted',
+    '$+ton-burnett$)uterwoche*#rld#&unista#"yn"%nable#!c$)atenation$$eits%-ptualizations%&rtante%\'ssional("ve$\'iliator$(omitants',
+    '$#urs#*demnations%%nsate$$ones$&ucteur#(e-shaped#\'federal$&idants%\'gurable)&tional$%lated%$uent$%ucian#&gruity#&joined',
+    '$+oisseurship#\'secrate$)ideringly$\'olingly$\'pirator$&tant-k%$rict)$ions$$uelo%%mable&%ptive#(taminant$$essa&(tability%\'xt-free',
+    '&+distinction%\'ivances\'"es#\'undrums#\'valesce$&ecting#$yers"%olers#(perators#"ts"%ppock##sey#\'ulating"%rbels##der',
+    '#$less#"ms#$nard$&ishmen#\'p-based#$rary$#ode#$ydon"#sic$"er#,t-leadership$$akis"#tte"&ughlan#$loir',
+    '(&claims\'&attack\'\'feiting\'&points\'&signed(#unk\',urbanization%&y-wide#0p_de_gr&acirc;ce$"es$$land#(rsebooks$)t-ordered"(valently#&erslip',
+    '"$wled#$shed""xi#$less"%yness!"pi!\'raftily%$work#"gg#(igbarnet%&millar#$mant#!n$&kshaft##ted',
+    '#&wfords#%ziest"/edit-worthiness#!e$#vey#&ighton#&scents"&ickmer#)minalised#%noids%$line##sto"\'oatians#!m#"ny',
+    '#&pmarks##ss-&(boundary&(checking\'\'urrents(!t&)examining%!e%$wind#%ucher\'!s$$pier##wes#%xteth"!s',
+    '#%nchie##yff#&zcampo"&yostat#(ptogenic#*stallising!#soi""rg""ys!"tp"!s"!t!(uckolded"$dgel&!s',
+    '"$ller#\'tivates$%uring"#ndy#"ha"#omo"(r&eacute##iae%!l%!m$"os#&licues#&tilage$$sied#"vy',
+    '"(shendall##ter$)omisation"\'taneous!#vcp!$ynon")tological$*protection +d&iacute;az!(\'automne"%isere"#oro"#une!%-type!#.f.',
+    '!"ac#&hshund"%ddies"&emonic"$hlia"&ihatsu##myo"!k"&lesman#$zell"\'maratos#"me#\'p-proof"%naher##jit',
+    '"!p#$hnis"(rk-green##wen$&inians"%silva#%sault"(ta-types$$bank$%point""um$#ier"$wdle#!e##yck',
+    '!"ci"+m/cys177ser!3e-industrialization"&adened$$ness#(feningly#\'th-rate"#bar$"se$%uched#"by#"en#(r&eacute$!a#&utante',
+    '#$eits%#ves$%ncies%)tralizing#%imate#\'laiming%&mation#+ommissioned$+ncentration%(structed#"pc#(repitude"$dham"%eming#"ps',
+    '"#gli")ification#"gn#"ra"%ja_vu"$kker"&lamere$"no#$imit$\'verable\'"er#"lo#%uding"\'marcate($ions',
+    '$!s##ian#/ocr&aacute;tica$&nology#,ystification"(naturing#"by#$euve#!i#)ominators#$ting%$tion"%peche#+olarisation(&zation',
+    '#(recating#(utations%"ed"$rbys##ide#+matological$#ott#!n#&vishes#(wentside")scribable#%isted#\'killing#\'patcher$%oiled',
+    '")testation"\'utscher""va$$lues#(iousness#$ours$!y!"fl!%harma!-iamant&eacute#&nagate#\'phanous#!s#%zepam"$cing',
+    '$%heads"\'e-hards#$back#*ntzenhofer"/ff&eacute;rance$%ugere"#ggs#\'itising##nam#(ressions"&lating"\'mly-lit""na#)ing-table#(ner-time',
+    '"&pstick"+rectionless"\'sabused$*mbiguation$*pplication#(bandment%$rred#)coverable#&dained#)economies$\'ngaging#&figure#%gorge#&infect#(junctive',
+    '$#net#\'paraged)$ment$#els%%rsers(!s$)ossession#.qualifications#&semble$&idence%*milarities%%pates#(tractors(!s%(essingly',
+    '"%tties"$vans#(ersities"(yarbakir!"jp!%m2.46%!7%!9"!3""so!*o&ntilde;a"(-gooders"#bry"(ctorates"$ddie',
+    '$#son"*gmatically"(minantly%%icans"#n\'t"%odles%#ing#\'m-laden#&rframe$$post"%rmice#%nberg#&rainge$"it"%ssers',
+    '"#tes#$tore"(uble-axe\'\'dealing($igit\'&length\'$page\'(stranded#"ce#"ne")vetailing$!y"$wden##ell#(ncounter',
+    '!"pc"!k"!s"$x/20!\'rabness#*matisation$!s#!t#\'ughting#%wcord"\'eamcoat$$rily&$ness##yer"!i',
+    '#$zzly"$oids#"ol#&p-down$#per"#uce#%ggist#&nkards")y-mouthed$%stone##ads!#ubh#%liner#!s""ce',
+    '#$ting")ddingston"$ffer"%menil"#nan#"ce#$dela#!k#$ster#$wich"&omatic"$pion#)lications"*r&aacute;n#%ances',
+    '"&tchmen"$veen"%xbury!"vr!#yad$"ic!+ziekanowski &e-type!#.p.!\'ach-way"%ldred"%rhole#$nout#%thing"#sby',
+    '$\'-facing$#nor#+y-to-follow!(beneezer"(ullience!+cclesiastic"(hinoderm"\'kersley"\'onomism##ver"!r!(ddington"#fax"%gcote"%ifact',
+    '!\'f-1&agr"$endi"+fervescence##lux!%gging"$oist"#ret!(hrenburg!*igenvector+!s##ht-&%month&)year-olds%$fold!#ked',
+    '!\'ladeldi"%ectra&.ocardiographic#$ktra#&venses"#ing"&lerman"$oped"&sevier#"on"(terwater!)manations")barrasses#%olism"#den',
+    '"&mental$!t%!t"\'ollient#)tionality\'$less"!p#)lacements$&oyable"&ulates!,ncapsulation#$hant#)irclement#&omiast&"um',
+    '""do$&rphins$*sonography$&thelin%%oxins$"ws#%point"&ergise"-fant_terrible#&olding"+glish-based#&ravers"%igmas"&larger"&mities',
+    '"$rage#"on"%stone"&thoven#\'icement$/ty-relationship#\'omology##rap#!s#&wistle")unciation"!v#%elops$!r#$ying',
+    '!(pictetus$%urean#\'genetic$#ram\'!s&"ph#*leptogenic#%phone#\'scopacy$&tolary#&tomize"%oxide!(qualized#)ivalently!%rects',
+    '"&ickson#&treans"%misch"\'rington!#saf"%capee&"rs$\'rpments"!f""ix"+pa&ntilde;a$\'drilles#%ouses"!r"$sene',
+    '$#van#$rada!%tudes!#uan""do")phemistic"%ramco#$o-mp#\'ythmics!$v\'ry"*angelising"%enin\'$$ness&"tt#)r-popular',
+    '$%ytime#!s"$illy##nce"(ocations!+x-boyfriend#)communist#)employees#(minister#\'officio#%prime"(changers#\'itingly#*ommunicate"(halation',
+    '#$orts"\'orcisms#\'tically".perimentalists#&letive$\'oitable")tenuating#,ra-statutory&+terrestrial%%mural%,terrestrials$\'icating$&overts"&ulting!*ye-opening',
+    ' +f&ecirc;ted"%sharp!#-15!"/o!(abianism#)rications"!c#&e-lift%&saving#!h"\'intness#\'r-sized$#all$!e$\'grounds',
+    '"\'lseness$*ifications#$ters"!m##ber#&iliars"(ntasised"%rmoor#$nell##oes##rel&"ly#&things"*st-breeder%%paced',
+    '#\'homless"&ubourg##lds$"ks$)t-finding%&lessly##ves"&wcetts"(xgrabber"(zakerley##isi!"cc!$eare#*ther-light")edforward',
+    '"/male-identified"&nemore"$renc##moy#&nandes#$rule#&tilise"!s#&tivity$#oon"$ttes!+ibre-filler$(inolytic"*ctionality#"us',
+    '"%edler#\'ldnotes""fi#!o",gure-hugging"%lched##des"(ne-boned#"gs#$nage"#ord"$rbas#$ebox$\'fighter$#nze',
+    '$$ware#)st-degree&$line%$hand"(shbourne$%guard"%tment")ve-figure%%match"\'xations#(ed-price"$zzed$"le!%lagon#\'mingoes',
+    '#&shbulb%&points\'"rt#$tman&#tes#(voursome"$eurs#"xi%$foil%$loan%$time",ight-muscles#"ts"$oaty#\'odplain',
+    '#$rets$)ida-based%"ns#&tillas#%unces%$ders#(wer-beds&#dew"#uka#&mmoxed#%orine"%yaway!&oaling#"ms"$gged',
+    '#$horn""in#"st"$lios##ksy#\'lowings"$ment&"ed"&ntenoy"#ote$$fall$&straps"&ragers$#men#$bear',
+    '#"de#%ebear%$rain$%close$*ign-policy$%nsics$*seeability%\'terhill$\'warning%#ing#%grave#*malisation(#ing(#tic\'&zation',
+    '$&entera%!s$&ulates#&saking$%ythia#\'tissimo$&unatus$*y-year-old#&warder",ster-parents"!u#)ch&eacute#+nder-member\'#ing#+r-bedroomed',
+    '%$goal%$mile%#ply&(rocessor%&seater$#oux$(th-round"$veal"#wle"%xtrot!#pcs!#rag#%ncais%#ine&%scans',
+    '#%ulein"$eaky##ddi#)e-flowing%%rider%(thinking$$fall$%mason$$town#"ie#)nch-style$$sham#(sh-water%#men#&tfully',
+    '#$edan#$sbee#$tter"!n"\'oissart#"mm#"nd$&t-door&$ends"&uctose#&gality$&ivores#&itcake%\'fulness#\'strates',
+    '"!r!,uel-injected"!l#\'l-grown%(strength$*y-equipped"#nai#\'draiser#$nels"$rled$$ough#&nisher#-tw&auml;ngler#"ze"#sil',
+    '"\'ndash;h"(ouml;ncz!#.a.""c.!#/kg!!1!!3!!8!\'abonese$!r#&riella"#els"$ijin"(le-force$!n',
+    '#&laudet$!e%#ons$(ivanting$\'o-roman#!s#$tres"%mbian$!o#$eboy"*ngliosides%!y#"tt"%olers")p-toothed',
+    '%"tt#$gery$"le#$onne#$side#$ters$$more$#ree"%skets#%light#&tropod"%teaux##ing"\'untlets"#vel',
+    '"\'zetteer!#cos!$dfcf"!o!&edling"%latin#"on"-nder-specific#.eral-secretary\'&isable#%ially$$tive#$naro"*opolitical#&rgette',
+    '#\'science$)tationary#)technical"&placea"\'rasimov#&manium#%shuny"*sellschaft#"te""za!%ggccc"!t!%handi##tak"&erkins',
+    '!#ian$&franco"\'ddiness"!e"!f#)t-wrapped""gi#"li"#lda#$lard$#ett$#ing$#ray"&mmicky"%rdles',
+    '#%olamo##van"$sela""ta!%ladio##mis#(ss-fibre&&topped$\'wegians""eb#%dhill#&ndenen$$shee"&immers##nts',
+    '"&oaming$#ted#*balisation$*e-trotting#\'rifying$$ying#%ssing%"op$#ter#$vers##wer"+ue-sniffing"&ycated$)osylation!"mp',
+    '!+oal-scoring##tee"*bbledegook#!y"&d-king##den#$like""er"%ggled""in")ld-digger$#ney$\'sworthy"#mbe#%orrah',
+    '##dar$$olas&$iers$$wana#"er#"ne#%zales"$oden$#let$$rich##in\'"!r#&bachov#$dian#$elli',
+    '##ham#$mley"%sbank##den#$hawk"#tha"$udie##led#"rd$$mets#"ts!$p160"!g!&racias##mmy',
+    '$"ta#%pheme%%ology#(ssington%&market##tin%!s#(ve-goods#!z"\'eenalls%#est%"ly%$sand&#ide##gan',
+    '#&ycoats"&idiron#"gg$#ory#%moire"$oats#$cott#$ined#$myko##ome#&ssness#%ttoes#)und-level$#pie$$ting',
+    '#$ndig$$wald!"si!"tf!%udgin")esthouses"$idon#1llain-barr&eacute%&otined*!s$(t-ridden#%seley"#mmy#$tree"#nge',
+    '"$rdon##kha&!s"#sev#%tavus$"ed"\'tenberg#$less!$wynn!%ybing"$ford"#les"&mnasia""nn"\'rations',
+    '*$oise".ouml;chstetter\'$fner\'\'lderlin")uuml;sker!".e"$m.s."!o""t.!!3!%abash#)erdashers+!y"%eckel#&matite',
+    '%\'rrhages%&stasis(#tic"$ffey""gs"\'ir-like"!j#!i""ke#"on"$lema$%sowen#(f-a-mile%&bottle%%crown',
+    '%$inch%$pint%*remembered%%share%%truth$$ling(!s#"im$%tosis"#mad%"an#&brecht#"el%"in##ill',
+    '$!y#&strung"\'nd-cart&&rafted%$over$$maid#$g-up#!i#\'nington#&seatic#%worth"\'psburgs"!q"\'r-roomf#\'anguing',
+    '%(drinking%%faced%\'hearted$$copy&#ver$$iest##ked#\'thacnut$"ke$!y"(selhurst##key##ted"(t-tricks#$cher',
+    '#$ters"&utbois"$vard##in\'"\'wk-like$$wind##ley##ton"&yfield#$lock#"mo#%wards$$orth!$bcag!&d-doms',
+    '"!v!+ead-dresses%%first$\'dresses$&hunted$&lining$&waters%$ords#$ping#\'rt-lung%$wood#\'terstat$$hery"#ber"&cklers',
+    '#(tolitres"$ddle"$ggie"\'idegger#*r-apparent"(liopolis#\'lebores$%iwell$&raiser#%plist#&vetica$"in"-mispherectomy#%lines"#ndy',
+    '#-ley-on-thames"!p#(atectomy#(plewhite#$wood"(raclitus##der#)metically#-n&aacute;ndez$#ias#"os##ron#"sh"*terologous&(stracans',
+    '"#uil#\'ristics"&xagons"%ysham"+zb-i-islami!*ibernating"+de-and-seek"!e"/ggledy-piggledy#*h-capacity%%flown%%yield$)er-status%*st-ranking$(ly-rated',
+    '"#ker"&lborne#)derbridge#%l-top%\'walking$$head$&marden$$ocks$%sdown$\'walkers")nchcliffe#$ksey#$rich")ppocrates"#ram',
+    '"\'stidine$\'rionics"%ve-up!#oar##xer"%bbits"&dgskin""es"%gging#!s"*jatolislam""ko"$lies#%lands$$ered',
+    '#%omisa#%sters#\'ybourne"/m&oelig;opathic#\'e-baked%&making%$town$$care$\'opathic%&stasis$$rton$&steads##mes#\'oerotic$)geneously',
+    '$%logue"#och#%dlums#%kworm"$pley#&scotch#$wood"&ratian#$dern##muz#\'nchurch#!s$*_d\'oeuvres$)e-trading%$play',
+    '#$wich"#sed#$king#!s##tas"&t-line#(elkeeper#%spots"%udini#)sebuilder%%maids$$ings"&witzer!#sbc"!p',
+    '""wp!\'uaiwiri")ckleberry""dd"%ffily$!y"%ggins"-manitarianism#\'idities##mel""nh#&niford#\'tsville"!r#%dling',
+    '#-st/cheltenham#$witz#!y"%tches##son#!u!"va!$yams",bridisations"\'drangea%#ted$(otherapy"$lton"\'perbola%0cholesterolaemia',
+    '%(tensives#$hens##ing#)okalaemia$$nymy$(splenism$\'thesise\'\'tically&(yroidism"$slop #i-v!#/we!&achimo"+px-86-based"!s',
+    '!\'bbetson#%otson!%cam-3"#bms"&e-free"(onoclast"!p!)deational"!f")iotically!$eatp!$gf-i"#loo"%natia!"ib',
+    '!!j!#kea!#l-8"!a"(fracombe")l-at-ease$)concealed$(educated$#lit$(treating#&iberal$%citly#*ocutionary#)uminative#%yrian',
+    '!+mage-making"\'beciles#"ue"!g"*mortalized#%unise%,osuppression"\'paction$#sto#)ersonally)%tions*"or%(turbable$\'tuously$!y',
+    '$$shly#\'lanting#*ort-export$\'sitions$&tently#*ulsiveness$"te%#ing!"n-"%_toto"\'audibly$(gurating"%board",capacitation#$hbad',
+    '$%sions#+ome-related\'#tax%*mensurable$*nclusively%,sequentially&)picuously%(testable#*rementally)"ed$(iminated#(ulcating$&mbency"(dentures#&ia-may',
+    '$(ssolubly#*o-pakistan#&ucible%&tively$+strialising\'*y-standard")eluctable#)radicable#%xpert"$famy$#nte#%idels$&nities$\'rmities#)lectional',
+    '#&ormals\'.tion-gathering")genuously#$leby##row"(jectable#\'unctive"(nuendoes"*oculations"&quires&%ingly"$road"&scribe#*ectivorous#(inuation',
+    '$&uciant#!t$$ants$\'igators%"ll%$tuto$,rument-maker*%alism##ula%&tingly$)rrections"(tegrally\'\'tionist%%ument$\'l-based',
+    '$&r-club\'&ountry&&island&&korean&*provincial%&bedded%\'changed&\'ommunal%,dependencies%(granular%$ject%\'lending&&inking&%udium%\'minably',
+    '&)etworking%"op%+penetration%(radially&%elate*$ions%)segmental&\'pecific%\'twining%\'veniens#)onational##ra-%)commodity&(tability%%mural',
+    '"*validating$&riance#)erdarroch#,ulnerability!)odine-131"(nisation$$zing!"pa""kf"!m"!r"!s!$qbal"!s!#rfu',
+    '#(descence$#ium#+sh-american.!s""na"(radiance#+educibility$\'parably$+versibility#&itants"#vin!#sam"%fahan"&lamist$*nd-driving',
+    '"\'ometric$&orphic"&sachar!$talo"%emise%#zed"$haca"!u!$vana$#hoe"%ories $j.j.!(abbering"!c#$king',
+    '"$nusz""pe"$unts"$wara""ya"!z!(ean-marc$!e"$mson"%smond"(wishness##son"%zebel!%ibril"%gging',
+    '"!p"#tka!*ob-related"%drell"%g/jog"&hanson"$icey#&ned-up"#lla##yon"%neses#"jo#$sson"(rdanhill&/ian-palestinian',
+    '"(urgensen$"no&!s"$witt""xe"%yride!"pl"!s!"sb!!t!#u87".daeo-christian#&dering#"ea")ggernauts',
+    '"\'mped-up"#nto""ts!"vp *k&ouml;nig!$-ras!%adets"#gan"$hane#\'nweiler"#ley#\'imantan#!m$"ar""ma',
+    '#%merer"!n#(dinskaya##tor"\'olinite"+pellmeister#(uscinski"\'rakoram##ens#$lovy$%sruhe##nak##ter"$tkov"&ufmann',
+    '"$vner!"dp!%earns"$ddie#%geree"%epin\'"!l#$lard##pie#(vingrove"#mal##ira"$nsit"%raing#$ekou',
+    '")yboarding#$card"#zia!#g/m"!s!$harg$"in""in!$iddy"(eslowski""ki"%llick%&nghall#$meny#\'ogramme',
+    '$&meters##ted%!r#$vert"\'nematic)!s#&gsland%\'markham#$loch#$neil#&swoman##ton"(rknewton$#ton"%t-kat',
+    '#\'tyhawks#&zinger!!l""ea#"on"#ima!*m&amp;sup2!%neale#%ecaps$#led"(ifepoint#(ghthoods")obelsdorf#\'wledges"&uckled',
+    '!#obe""hn"#jak""ko"%ntrax"#pek"&stroma""x2!"pn!(raftwerk#$sner"%ieger#"ng#\'shnapur$!s',
+    '#"pp!&u\'damm"#can##huk!!v!&wazulu!!y""aw"%renia#"ie"$ushu 1l&eacute;vy-bruhl!$\'arc#&uberge"(empereur',
+    '"$oeil!)-arginine!$.e.d!"69!%abile#&radors$#ooy#\'yrinths"%calle#$e-up#$unae"$dled""hr"#irg"#jos',
+    '\'$ions"*ncastrians$(e-shaped#\'d-cover%&locked$$mass%#ine$"on$&ranger%$over$$slip#%gholm$$land$%stone$*uage-games',
+    '")paroscopy#!d#!p"#rgs#$nach#$sson#"us"%scaux#$hley#$sies#\'t-named"&tching#$inos%!s#%vians',
+    '#&gharne"+w-and-order##ers"\'yabouts#$cock#$offs!"cs!&eacock#$d-up$&enhall#\'f-mould##ven"%blanc$#ond"$cher',
+    '")eds-based""ff#\'t/right$!y")g-spinner#\'alizing#$horn#&ionary$!s$(timizing"$ighs""le"#mmy"\'ngthier""os',
+    '"%ssors##zek"&traset#(terpress"\'ucocyte#\'kaemias"(vamisole$#nte##ene$$ring"+xicographic"%yhill!$fa-1!+i&egrave;ge"%aised',
+    '#"re"(centiate\'#ous"\'eberman#0utenant-governor"(fe-blood%&cycles$%cycle$%lines#!o"%gated#.ht-heavyweight&&weight%$bown%$less',
+    '##ier##ulf""la$"cs#)liputians"$mber&#ing$"ic#&ericks$!y"&ndblom$#ner#"ea##nhe"\'onesses',
+    '##tta"$pari#%chitz##ped")quidating%#tex$#ors"%terae#$hgow$!o%\'logical)"es#(tle-used&\'borough#&urgies',
+    '$#ned##sey!"oa#$ches"&cative#&hnagar$$song#$kett""eb"&gicals"&itered""ki"$lium#!l$#ies',
+    '#!e")ndon-born##ers#(g-necked%\'playing$&bridge$*er-lasting$%field$$hill%$ouse)!s$#ner$#uet"(okalikes#\'se-head',
+    '&!s"#pes"%raine$!n#,d-lieutenant#)ry-driver"%stock""th$$ario#"te"%udoun#$nger#$vred")ve-affair%$life',
+    '$#itt$$lorn##ins"+w-ceilinged$\'growing$(interest$\'quality$$rise$\'sulphur$$tech#/er-middle-class&$paid"&yalism!#prp!"s6',
+    '"!w!#tom"!s!&ubbock#(ricating#%yanka"&cchesi##ile#%kmann"!d#$dite""ft"#ger#!s"$lach',
+    '$#ing"(nch-hour##ges"$pton""tz")xuriating""yt"$zern!#vov!!w!!y"*c&eacute;e#%oming"\'ttelton -m&eacute;nage',
+    '!!\'"$lady"%sieur!&-forty!"11!"aa##zel"#caw#$coby#&kinlay$#lin#\'lachlan#%phail#%roura%(vascular',
+    '#&eirans#%onnas#"re"(gistracy#%matic#\'nentius%%tized&&opause$%olias""ha$#tma"#ida#%ncrop$(tainance$&waring',
+    '"!k")labsorbed$$dies$%thion#$dita#(ebranche$#eva$\'factors#)formation##ins##low#\'odorous##pas#$raux#\'treated',
+    '"%madou#"ba#&elukes".n-of-the-match$%power#%acled$)gerialism,!t#%drake#"ga#!h$\'andling$$oles#$illa$(pulators',
+    '#)oeuvrable($ings#%sdorf$"ur##tes$#ras#$yara%$ttas"$oris"$pper"&rchand#"ee#\'gherita#!i$$etta',
+    '%"sa$"ta##kup#$lott#"ot#&rakesh%!m$#ows#\'shalsea%&mallow+!s##tel&"li$$ians%/n-in-the-fields',
+    '&!o$&lesham#%y-ann$"on"&serati##jid##oud#%sager\'!s#\'terplan&$ship&%works"&tadial#(chwinner#&hieson',
+    '#%ronly##teo"%ughan#"ls#!s"%wkish"\'yerling$!s#&flower#&rhofen!"bq!%ccain#$lean#$owan##ray',
+    '$$vitt#&iarmid"$girk#%uckin"&jannet"&kellar&"en"\'lintock"#ofs"%vitie!#e-6"#aly%(-mouthed#*ns-testing#(t-eating',
+    '"!c"*dium-range"&ekness#!r"&gadeth"$hmet"#ier"&lamine$%nisms#"ba#$ding$#rew#!i$#nar#%ksham',
+    '$#ors#%sonby#%usina"%morex"2nd&egrave;s-france#"il#$otti#&shevik#*tal-health""on"\'phistco"\'rcurius%#tio#"de#)edith-lee',
+    '#"le#$rell$$iman%"tt$%ydown##sea#"we")senchymal#%oderm$&lithic$!n#%sager$$iahs%"ly"$tall',
+    '$%phase#+hanogenesis$%ylase#%onymy#$rics!!f!$g/24#&kg/day!#hor!$iach#!n#"ow#!s"&celles#$heal',
+    '$"io$,oac&aacute;n#+ro-computer&&kernel%)economics%%fibre%%grams("ph*!s%%probe("se%)structure%$text"&d-\'70s%#80s',
+    '&"88$#70s$#80s$\'engined$"on$)sixteenth%%tream$\'western##ani#\'denheim$(le-sized&\'borough&/ton-in-teesdale&$ware$!x',
+    '"$elke#!n#"rt"&grates"#key#$oian"&ldewed#%eages$#tus#\'itantly&,ry-political#\'lesimal$*ion-dollar($plus$"om',
+    '#%pitas"#mes%"is"*nd-blowing#(i-skirts$+aturisation$%buses$%mizes$%scule#%nelli#"os#%smere$$ters"!o"%rages',
+    '$!s"(sbehaved#,calculations$$ible$"ue#%fired#"ha%%ndled$$mash#,interpreting#%named#%print#&quoted##sis%#ves',
+    '#$ting$\'rustful"%tosis#"ra$"ed#$tens%$rand$!s"+xed-ability!$kn45!"lu!"mb!$oats"&bsters"&ck-ups',
+    '#&ule(s)""gg$"ie##hul"$hawk#!r"#ine##she$&turise"%ledet$$skin%!t&%ation#$lify#%uccas',
+    '"$ncur#-ey-laundering\'&enders&(spinning##ied#$kees$%house#&oplane%&olists#%terey$&martre#)umentally"\'onshine"%raine$"nt',
+    '#$esby#$gans#$ison##kie#(ningside\'#ton#&occans$"ns#*phogenesis#&risons"$sfet##tyn""td#\'h-eaten$&balled',
+    '\'&tongue&(s-in-law#&ocross#"te"%uland$!e%!s#*ntainsides#$rnes#(thpieces%$wash"\'veables"$wden##gli"!x',
+    '"#yle#"ra!"pr!"rd!"sf!$tdna""fs"!i!-uch-travelled#$osae"%ddles#%honey"&ffling"%jtaba"&llions',
+    '$(i-member&%plant%$chip%\'million%\'plicand*$tive%\'tasking""mm$#ery#"ps"$nday##ter"(rgatroyd#\'murings##ren',
+    '"&sketry#%pratt"&tilate\'$ions$&nously!(ycenaean#*obacterium"\'enteric"$osin"%stify "n-!#.y.!"/n!"25!!6',
+    '!!="!1"!2!%abbed"!d"#gle##oya"#ira"&kasone"#mas#%urian"(nometres"&rbonne##cog#&rators',
+    '"$tfhe#(ionalise"&ughton""ze!"ba!$cdad!"dc"$embu"!f!$eame#$r-by%\'perfect%\'surface$!n"%bulae',
+    '$%lines#(romancer#\'tarines"#ddy#&erland"\'eds-led"&gating#\'lectful#"us"!i"#lla"$meth"-o-colonialism#*classicism#$nate',
+    '",phrotoxicity$$thys"$roli##uda"&st-egg$!a$%lings"(therland##tos"#ues#)rosurgery#&tering$&ralism%%ogena"\'verland',
+    '"&wborns#1castle-under-lyme#$leys$)y-created&+established&&opened&)qualified#$oed1#\'s-sheet$&caster$%flash")xt-of-kin!#fer!$g.ml"!a',
+    '#"za!$icad#$hola$!t##oll"#eld#(tzschean"\'ggardly#(ht-shift%\'clothes%\'dresses"$h3t3#%ilist#"on"$mslo',
+    '"&nagawa#(e-member$(ty-seven"$pper""si")t-picking#(rogenous""ue"#vea$!s!!j!#kvd!"mj!\'o-hoper"".3',
+    '"!2""aa"!b#"bs$!y##oru#!s"%chlin#(iceptive"#gan"&isiest"#lte"+n-assertive\'(ociative%$udit',
+    '&%itish&\'oadcast%\'usiness$*capitalist%*ommittally&(nformity\'$sent($umer$(delivery%-iscriminatory$)enrollers$&formal%*undholding$*graduating$,hierarchical',
+    ')*ventionist$&jewish%-urisdictional$*litigation$-manufacturing&%rxist%\'etallic)!s%\'onetary$*negotiable$-participation)"es%\'hysical%&laying%$olar',
+    '$*relational&(sponders*"se&$turn$*scientific%(ectarian$\'trivial$*university%%rgent$&whites"%onday")rmalising%%ngate$(otensive#$ster',
+    '%#way&#ood"-t-too-distant#\'ational#\'ifiable&"es"%vella#(osibirsk")w-defunct"#yon!&p1450l!#tbs"!t!.uclear-powered"$ncio',
+    '"#ova$!o"%tcase!"wa!%yasha +o\'callaghan"(flaherty"$gara"%meara!"ag"*k-panelled##sey"!n"%rsman""st',
+    '"&duracy""er$$land")jectivist"&viates&#ing$\'ousness!"ca")ean-going%"ia%"us"%t-11b#%avian#)ogenarian!*dd-looking',
+    '""er""om"!t!"e."(dematous"(strogens!&ff-air$&colour$(exchange$%guard$#key$&limits%#oad$&market$$sale',
+    '%$tage#$cuts#+ice-holders&%power%&inalis!#gle##ing!%hmann!\'il-lamp!#key!)ld-timers#$know"\'igocene%*dendrocyte#%phant',
+    '#!y"#ver"&ympiad!$mani"%icron!&n-farm#%stage"!c#/e-in-a-lifetime")e-bedroom$%match%$onth$%point$$room$$term',
+    '$$week"+tologically!$pals"&en-top(#ped"\'hiolite"(pressing"&t-outs#\'ionally#)ometrists!\'racular"\'cadians""do""fs"&gasmic',
+    '#$gami$\'ination#$noco##ssa"$lick"&mesher##olu$#nde"=sz&aacute;ggy&uuml;l&eacute;s"*thopaedics"%ville""yx!%s/400"$bert"$good',
+    '"(molality"$sett#%ified"(tertagia#%inato##ler"$wine!"tt!#uko"#mar"$ndle"$ster"\'t-dated$)of-season#!a',
+    '#)numbering#$pace#%sides$%pread#%voted#\'workers!*val-shaped$$tine"+er-capacity&)onfidence%(emphasis-"ed&\'xposure%(generous%*indulgence',
+    '&%riced\'(otective%%rated&\'eliance&#ipe%)sensitive&%upply%&valued$(balanced$(charging%%ooked$#did$*emphasised$\'feeding%&ishing',
+    '$$long$\'manning$(simplify&"ze%%tates&%ocked&%uffed$\'weening%%helms%$rite"%iduct#\'positor!$wain""er!+xford-based',
+    '"#ley!-ystercatchers!$zbek $p.b."$c.a.""d."!e""j.""o.""p.""r.!"14!\'=0.0001%!1%!5',
+    '""bx"#cer#"he#!s""di",ediatricians$&ophile#$stum"&ganini##ett#$odas"&intbox#%rwise"%lance#\'e-faced',
+    '#\'impsest#$mers"#mmy"&n-arab#&chayat#&munjom#$nick#$tell$(isocracy"!o#%lozzi"#pin$#sts##yri".raformaldehyde',
+    '$)llelogram$(phrasing%%legic#\'chments#*enthetical#!i$$shad#%kgate#$sers$#nip$"ys#*t-exchange$%aking$"es$+henogenetic',
+    '%#ngs$&ygoers"%scall#"eo#!o##sap$*enger-seat$\'ionless%#ves#&tiches%!s$\'oralism(!s$$rami$\'ureland',
+    '#"es#)hogenetic#*i&ntilde;o#\'riarchs#\'terdale$"ie"#ves")wnbrokers$"ed"+y-as-you-go$$outs##kel#%slips!"ca#!s',
+    '!"da""gf!%eachy#"ls#&tlands"$ckle"&dersen"$eked##ler$$ings#"ps"#lee#$mets#$oton"\'mberley',
+    '#$dero$%leton#$hill##ile#*nsylvanian$*y-pinching#$rice#!t$%lands#$with""pi#$pery")rceptrons$&olator#!e',
+    '$&idious&!y$%usate#!i$$gnon$&meters$$neal$(pherally(#ies$%scope#$lman#\'manency$&eation#)oxidation#\'petrate',
+    '$,on-to-person&+a_non_grata&#ify#\'tinence$%ussis"!s""ta$!r#$chey#)herbridge#,it_bourgeois#%rarch#%unias"!x!&fennig',
+    '"!m"!r!$h7.4"%aidon#!r"*ilandering$\'ologist%$mena"#lox"$obic#&nelink#5sphatidylethanolamine&)orescence#*toelectron"&rygian',
+    '")ysiognomy!)icaresque#!c#$kaxe$!y#(torially$)uresquely%!s"(errepont$#son"(g-headed##don#$ging#"ou#$tail',
+    '#$cher##lai$#ing$#ock%"ry$%sbury"\'newoods#%field#&kerton#$nock$!y#!o#\'stripes#"us"&ranhas',
+    '$%xicam"#san"#tti!\'lacemen#%inest$$stow$$ting#&nation$"er#*titudinous#%ylist$#pen"\'easance\'%tness%&urably',
+    '$$trum#%iades#%urisy"!i#%msoll"&ockton#"eg#%tinus"!r"$ummy#$rals#!t!#msf!&ochard#)ket-money',
+    '"%etess""is#%tevin"#lam$$rise#$ecat#$ices$"ng$$shes#"je#%lensa$\'inating$*ution-free%!x#$ruan',
+    '#,yadenylation$)carbonate%&hromos$&gamous$$math%,orphonuclear$\'nesians$)technique"!m#$fret##mes"$ncho#*tificating#&y-tail$#boy',
+    '#"re"$peye##sey#\'ularize"(rcupines#\'osities#%phyry#&teneil%#ous$"on$#ree""s.##ies$0tion-independent##ner',
+    '#&t-1997%)apartheid%*experience%(imperial%)modernism-!t%-structuralism$$gate$+operatively"\'t-holes#*entiometer#%tered$"on"$vera"\'werhaus',
+    '"$yntz"$znan!"p3!"ra#&cticed#"hu%!s#"ia#$slin#&ttling#&yerful"(e-booked$%dated%%inner$&flight',
+    '$)installed$*linguistic&&terate$*occupation$\'planned)#ing$\'release#$bend#(clinical$)onception#\'dnisone#\'eminent##fab$%ormed#$late',
+    '%&turity$%ieres$(onitions$-ultiplication#$paid%&rative&#ers$)ositional#$sage\'!s$(byteries$%tbury$(upposing#(valences%&ricate',
+    '#,ce-sensitive$$kles#%dmore##eto#&mavera#%ncipe$*t-on-paper#%ories&&tizing##ssy#&vateer)#ing&(izations(#ing"(o-choice',
+    '%%rench$$rata%%eform$&social##ber&!t#!c$(edurally%\'ssional$&livity$%yclic#%drive#&fanity$/essionalisation-&zation',
+    '\'%orial$+it-oriented#*jectionist#%lapse#%misee&"or$(ontories$!s#\'pagates$#els%%rtius\'(y-owners$&ulsive#)scription$#ody',
+    '&"rs#-tein-tyrosine%"on%"us$$hero$\'otyping%$zoan)!s$%rudes#)vocations"%udery!0seudo-scientific&+obstruction""st"%yched',
+    '&(physical&+therapeutic#%llium!#tfe!(ubescent#-lic-relations"\'ckering"%erile""go"$lped$#its#\'verized"&mlumon"&nisher#"ky',
+    '"!r##dah#%purea#"rs#$sing"\'sh-over%$pull"#tti!"va""da!)yracantha#"ex#(imidines$"te#!o',
+    '"!x #qao!"po!$uads#"ng$#tal&!s%%ifier*!s%$ocks#,rter-century\'#ing%!s#-si-arbitrator")eensberry',
+    '#!m#(stioners"\'ibbling#+ck-thinking%$lime%$time#"st"$mran!!v \'r&amp;a"-eacute;giment)*sum&eacute!"\'s!"-1"#a-f',
+    '""w.!%abbie%#nic("al"%dials$&ograph*!s#%stock"%eburn"$ffia"#g-1#$usan"\'ilcoach)"es$$head',
+    '#&strick"%lston"&mallah#$bled#$irez#$ones"$ncho#"di#(ganathan##jan#$kles#%somed"&pacity#%eseed#%idcad',
+    '"%scals#(tafarian""ta#%cliff#"ho#\'ionales"$vage#\'englass%#ing%&sworth#$ings$#oli"#yer#$ners!"db',
+    '!\'e-apply&&ointed*$ment#(building#&cycled#&design#(emerging$\'nacting$(valuated#$form#(instated%\'troduce+$tion#+structuring#%using',
+    '"&:joyce"+actionaries#\'d/write$#ier$#man$\'y-mixed&\'to-wear#)l-balance$#ign\'"ed$&locate*!d#"ps#\'rrested#)ssembling',
+    '"$boot$&unding#$ukes"*calculated#(eptacles#(htsstaat#)lassified#)ognitions$(llecting)!s$&mpiled$\'nnected%%quest%)stituting$)rd-player',
+    '#!s#$tors%\'sigmoid#(ursively"*d-breasted$&necked$(throated%$iled#(currants#%heads#(irecting#"on##raw#&shanks$%tarts',
+    '"+ece-carlton#(stablish"\'finance#$loat#$ocus$$rmat"&galing$%rders$$ttas$%zzoni#.istrar-general#\'ressing#(ularized"\'hearing"*infarction',
+    '$&vented(#ing%(igorated#"ss"%lator#\'egating$%nting#(igiosity##oad"(mainders$$king#(ediation#&ington#$odel$*te-control',
+    '"%nding#(nenkampf"%order\'"ed$+ganizations")packaging$"st$(triating##els$%nters$\'rfusion#&hrased#)lenishing#\'ressors#$ulse',
+    '"(settling#(idencies#\'onators$(undingly#(pirators#*ting-place#(ubmitted"&tailed$#ken$%rding#+inoblastoma&!l#(rievable$$ofit#$sina',
+    '$"ll$$ries##ill$*talization)"ed#+olucionario"%wired%#ing!#fls!!g!#has"%eidol"#ind$,e-westphalia$$itis',
+    '"(odesians#$mbus#!s!"ia")bblesdale#$eira"&cardou##hey#$kets#%ochet##tus"!e"#gel##ger#)ht-minded',
+    '%$wing""le"$mmel"!n#%ggits$\'strasse$#way#"ks"$tter"%vulet!!l!#mcs"!t!(oadtanks"#bey',
+    '$$tron$$work"$ding#&rigues"$elof"&hingya"\'llright#!y"$main$&nciers#\'metveit#"ps"#oke%!r#$mful',
+    '"#pey##ing#!y"\'quefort"#sat#&common#%enior$#tta$%water#"pa#"sa%"ll"&taries#"ha$\'schilds',
+    '"$uged#!s!"pt!$t-pa"!o""pa!$uach"(bberised$%ished"%cking"(dderless&!s#"er"%ffian""iz',
+    '%(governed%&making"#men#%inant#$pole"$nrig"&ptures&#ing"&shmere#"ks#"se$*o-japanese"$wang!"vh!\'w&amp;p',
+    '!#y10"$okan""rs &s-bahn!#.15""20"!3""47"$5(1)""j.!"11"!2!#aar$$land"#bin',
+    '##her#&kcloth#"re%%dness"&ddlers&%worth""gs"!h"%intes%%field%$hood#"th"&khalin"$lade%"in',
+    '#$icae$(nisation$$vate$!x#$lies#&tcoats$#ers$#man#*vationists&"or"%maras#"bo#$osas"%ndbag$$eman',
+    '$%iford$"on##som#!t"%phery#$iens##per#!s"$rdar#%gasso##ney##ong#%raute#$tori#&vodaya',
+    '"$tins$#res%"ic##rap#\'urating#!z")uchiehall#%ghton#"te"&vannas#&ouries"&wmills"+xony-anhalt"#yed#"le',
+    '!%cabby$$ious#"ld$&e-like$$faro#(ndalized#$pula#&rpered%!s##tty"(enically"-h&auml;tzchen)$uble#)affhausen$$ller',
+    '$$ffau#\'illings$#sms%!t#\'lieffen#*ool-leaver&$kids&(mistress$+penhauerian"+ience-based#$ssor"&offing$$ield#$nces#%rcher',
+    '#\'undrels"%raggy$&mblers$%pheap#(eenplays#%iabin$$bing$)ptwriters#&ounged\'#ing#&ubbers$\'tineers\'%izing"!u#"ds',
+    '"$ylla#%thing!#dpp!(ea-green$&urchin#&bourne#$docs#%going#"le#$mers#%weeds$%orthy".basti&aacute;n"$chem##ker',
+    '$*nd-biggest\'&person#%retes"\'dgemore%$wick#-imentological##ley"%efeld#%kings"#fic")gregating"#iko#!n"*lectronics#.f-administered',
+    '%\'denying&\'irected&$rive%-justification%(loathing\'"ve%)propelled%\'raising&*ealisation*&zation\'\'garding\')plicating(%roach$&lessly#%igman',
+    '##vey"#mer#"i-%(acoustic&%nnual%&desert%&feudal&\'inalist%(literacy%\'natural%\'regular$%colon##per"%nd-up#$hora',
+    '"&raglio#(bo-croat#*ialisation("ed(!m#&jeants#-van-schreiber")ven-month%#ths"$ward"!y!"gb!\'habbily#%fting#$gged',
+    '#&lcross#"ma$"es$"us#%nahan#$rman$$pish#$stri#*ven-headed"%e-she#!a$$rers#!e$%pdogs$$rman',
+    '#(pherdess##ree$"if$#rin""hh"$iels#$ites#(llington##nto#*p-building$\'builder$%mates#$rlie"\'klovsky#)od&euml;r',
+    '#$ebox$$lace#(p-bought$%front#*rt-circuit\'#uts&&legged&(tempered%%crust%\'er-term%%horns%\'listing#)ulder-bag#&w-down$#ery',
+    '$$wish#(ivelling&!r##ove""ui#$lman#%riken#"te$%tling!#iad"&bilant"$ddle#*e-stepping%%table$$rite',
+    '$!u#"le"-emens-nixdorf",gmoidoscopic#&ourney""ii"&korsky"(lchester#&kstone#&vering&$town""me##kin#!m#%pered',
+    '#\'ulacrum"$nbad#/clair-stevenson#(fonietta#.ger-songwriter$+le-mindedly#"ha#)istrality"#sal"%t-ins$#ups#"ar""va"(x-member%#ile',
+    '#%tieth!"ka#*teboarding##ven""eg""il#\'n-tight#\'ttering#$ving""ol!\'laanesh##bby#$ckly##ins#%nders',
+    '#\'ep/wake"&ickers##eve#%ghter&!s#$p-up#%thers"(obbering#$shed#&uching$$ghed#"vo"%ugged%#ing&&shness',
+    '%#ing#$rped%#ing!%ma-aa#\'ll-talk#&rtness%!s"%illie#&thwick"(okestack#%othie"$utty!)nake-like"#ead$"ks',
+    '"&iggers#"ps"#oop$$zing#$rkel#(wballing$%falls"&ubbing"$yder!$o-so"(cialista\'#tes(!y\'"ze$$edad',
+    '$-o-demographic"*ft-hearted$!y""ir"%kolov""la$#nki#(id-state%%ifies\'$ying#$ogne##vay$#eig"$mbro#*ersaulting',
+    '#&nolent"%nning"%pping#+rintendenza""rp#$vino"!t#"on"%uring##san#,thend-on-sea%%field%$mead"#wer!\'pacelab',
+    '&"en%$time$$ings$$kman#0ghetti_bolognese#&ndrels$,ish-speaking#$rkes%#ler(!s##smo"-ecialisations(!x$$mark$(taculars',
+    '##ich#%ngler#\'rmicide##yer")herically"&icules#&llover##nks$$ward"#lay"!m"!o#\'ilsport#*kespersons#$nged',
+    '%!s$!r#&rtscar#$tlit"%rains$"ke#*ead-eagled!%q._km"%n.ldr"%uashy!$s-20""dp""rc#"p1""sh',
+    '"!3"(abilises$&leyard#$dler#$ffel#\'gnating#,inless-steel#(lagmites$\'lholder#\'nchions$(d-offish$%islaw$$more#%pling#(r-shaped',
+    '$#lit$)mer-smith#)tementing$,ion-building#$ufen$&nchest$)rosporine##ved#\'ying-on"&ealers$)m-powered%$boat%%ships#)el-making%#ers',
+    '$%rable#)llenbosch#$mpel#)nographer$$ting#*p-families%&ladder%&parent%"up$\'anakert$#dad$$hane##ric%$lise#%tches',
+    ')!s"*icklebacks#&eglitz#(llbirths%#ing#$mson$-ulus-response#$rrer""ob#(ck-still&&taking%&hausen%#ley##dge#)kenchurch',
+    '##oge#(pfordian+!s$#gap$$pers#(re-rooms%&houses%%rooms$\'rington$&ylines#%waway$&bridge"!p"%rafed%#ing',
+    '$$hler$\'ightens$&ndings%*ge-looking\'$love&#les$\'tabound%&egical%,ford-on-avon%!s#*eet-corner&"er$)ss-energy&#ors$$tchy',
+    '$$wing#\'iations$&ctness$%ngers$#pey#\'oessner$%llers$#mal$%ngman%$tium##utt"&ubbing#%dland#\'ffiness"%ygian',
+    '#&rofoam!#uan"*b-assembly$*contracted$)directory&)sciplines$(licences&(eutenant&*thospheric$\'machine$*paragraphs%(urchaser$&sample%\'ections("or',
+    '$$unit#%areas#"ba#&jugate#\'letting$&imated&&inally$\'uxation#&mucosa#*ordinating#&poenas#\'scribes$(ections.$$ists$&tation',
+    '$$lest$(ractions"!c#\'cussion#$hard"%deley"\'ffragan"(gar-free#"gs"%ilven"%khumi#!i##ova"!l##ien',
+    '"&matran&%iptan#)mer-house&#bee&#son&$town"%n-god#&bathed$#eds$#ury#"da#(loungers##nie&!r"*per-powers',
+    '%(diagonal%$fund%)saturated&%eding\'$rver&%parc+#\'plykits#+ra-national$$ised"\'re-fire&%ooted#+face-to-air&$tant$%board#(mounting',
+    '""sa"#tch#"er!!v!"w6"!7"!a#&ddling#"il#$nton$$wick#"sh#%tting")earing-in#$etex',
+    '")imbladder$%suits#%ndled##pes#&tch-on&&boards$#ham"&opping!#yed"\'lphides##van$&estris"\'mbolist#(pathiser$\'tomless',
+    '$)hronicity(!y$&opated#(dicalist\'$tion""on"(philitic"1s&dollar;lifespan#(tem-wide&)atization*"ed&%house -t&agrave;pies#$mp;l!+able-tennis',
+    '"+chistoscope$&ograph#$kler"$djik""gg"&illess$%wheel"$kali#&e-offs"&lkback#\'lentire$#ied"\'marisks$!s#"bo',
+    '"$naka#%gents#*talizingly$!e"%ppert"%rbert#\'getting"#sha##ked"$tras#!s#(tershall"\'valouze!"bp"#sps',
+    '!(ea-break$$room$$tray#%ch-in%\'er-days#"le$$lach#*m-building#%r-off$%aways$#gas##tro"&chnics""ed")gucigalpa',
+    '")legraphed$#sis"3mperature-sensitive"&n-foot#$dril#!g$$-hui#%nents##ons#&seness",rminological$$s_of##ris%\'torials#\'tullian',
+    '#$leys"$viot"%xt710!"gi"!v!"h\'"&ackray#%lamus#)nkfulness#"ts"$eatr&\'e-goers&%icals#%istic#\'odosius',
+    '#/rmoluminescence&*statically*!s$#oux$%sites"+ick-skinned%#set#%epval#)n-skinned$$gies#-rd-generation$%lmere$\'ty-year&)something""nn',
+    '#"ra$"ez$&nburgh#(usandths""re$\'adworms%#rah$#e\'s%\'-figure&$goal&&member&)ninetieth&$page\'%utted&&thirty',
+    '##obs$#ngs#&umming"&urnham$$ston"$ymic#/ssen-bornemisza!"ia#!n"%bbles$!s$!u"$cker#!s"#kka',
+    '#$lett$%otson$$yard#"th"%maeus#\'e-frame%\'keeping%#lag&#ike%*travellers$%piece"(nkerbell#$ners#\'seltown$#ley',
+    '"-ssue-specific\'&typing"\'tillate#%rated#%tered$!y"#zer!"ls!#mam!$o-do#%night"&boggan"$csin"&ddling"%ehold',
+    '#!u"&golese#!s"&ilette"&kamaks#"es"&lbooth#\'erantly##son"%m-cat#%forde#!y"(ne-units$&lessly#%nages',
+    '#$lbar$"ed"(p-flight$\'selling#$coat#$iary$&cality#!p$#ers"%rched##day#$ques##rie%#jos#&tillas',
+    '#&ygraph"%ssell%!r"$tems##ted$#ing"(ughening##pee#(r&eacute"&welled#&nhouse$#ley$&scapes%#man#%plane',
+    '#!e#$town"#zer!$pc-a!"r2"%abant#%cheae$$ings$%kless#+de-weighted%$able%\'speople#,ffic-calming\'#ker#\'in-shed',
+    '#(nce-like$)quillizer)!y$\'sacting)&vation%%fused%(gressing%\'hipment%(piration(!e&%osing)%tions&*uter-based%-ubstantiation##shy',
+    '$*el-to-work&$ogue%$rsal$$iata$$olta#(wsfynydd"\'ebizond$$ling$#yan#&e-tops#%fusis#%kkers#%nding#\'spassed"!i',
+    '#,al-and-error#&balism#$ceps#*gger-happy#\'lateral$"ls#$nket#)phosphate$$lane$!p##sha#)umphalism+!t#)vialities"%oizen',
+    '##mpe#&opship##pes$%icals#"th$\'skyists$$ters#)ublemaker$%ville"%umped#\'sthouse%*worthiness#)th-claims"!w"$yfan',
+    '#)panosomes!\'se-tung##tse"%hwete!&uaregs"#bal#"bs"$dhoe"%fting"#key""la$#gai"#min#"or"#pac',
+    '##fed#$kmen##lis#$n-on$%berry$%pikes#"ps".tor-organisers"$valu!"vr!$wats"\'eeddale%!y$!t#(lve-inch',
+    '#\'nty-odd(+ne-year-old\'\'seventh"*ice-yearly#$ddle#$gged##rls"&o-foot$%level$%night$%speed%\'toreyed$)year-olds!"xb!#yas',
+    '"&minski#%panum"&pecast#)ification"\'rannies"#wyn"$zack (u.s.s.r.!!a!"br!#cla!%dders"!i!%h-huh!"li',
+    '"\'lswater"#ric$"ka"\'stermen"-trasonagraphy"\'verston!+nachievable$(quainted#*dventurous#)ppetising%%roved#\'vailing"\'balance#&locked"\'charged',
+    '$%ouded#,omplimentary$&nfined$%upled#%urled"-demonstrative$$r-14&&funded&)reporting)+resentation%(employed%&played&&owered%*standingly$*sirability',
+    '#%immed$&rected$\'storted"+enlightened#)ventfully"(feminine#*linchingly#%orced#\'reezing"+gentlemanly$$rson#&ulates"(hampered#%ooked"&idroit',
+    '#)maginably("ed$(portance%%roved#%polar#%ssued#(t-linked#\'variate"%laden#\'eavened")nervingly"-objectionable#\'riginal"&picked#%laced',
+    '#+remeditated")reachable$)mittingly$)pentantly$&served#&olling"!s#\'cramble#\'heathed$&ielded#$pent$&orting#&tained$&inting#%ubtle',
+    '")tarnished#%ended$!r"(wrapping!*p-and-down#%dated#%river"$dike")holsterer"*roariously"%state!"ra#$emic"&ethane"\'ination',
+    '!.s&dollar;1,600"&-style"#air"*er-defined"#haw!"tp"%rillo"\'termost##ley#&oxeter!$ulaa &v-neck"$sign!$.-c.!\'acuumed',
+    '"#gal")lentinian$!s$#tta#%halla#%iance#*l&eacute;e$$ance#$orem#(uational$"ev#\'vestate"$nder#"go#!n',
+    '"&riably".soconstriction#&siliki!#crs!(egetated\'%ional"$itch"$lour"$ness$#tia#)kataraman#\'omously%!s#"to"&rderer',
+    '#%reaux#(ticality$!s#%zenay"&stment"*terinarian,!s"#xin!"gp!#hai"!p!)ibrancers&#tly"\'ce-adml%$like',
+    '%)principal#!k$#ery#"t.$&oriana$\'ualling"!d#\'eodiscs%#ing"#eux""ll$$ette"&ncente"\'olators"&ridian',
+    '#$cera$+oelasticity##ors#*uo-spatial"$taly#$iate$\'culture#%toria#)uperative!#lok"$tava!$oile#!x"&lcanos#!k',
+    '#,untary-aided""or"(uchsafed!&xworks!)yacheslav $w.b.!"/c"!v!!6!&affles%#ing""gs"#ifs#$kiki"&l-mart',
+    '#$k-on$"ie%(ng-stick#)lcovering$#oon$(papering#)pole-bond"$rble%#ing#$dell$#ley#&planes#(renpoint"(sh-basin$+ing-machine',
+    '#+te-disposal"*ter-filled&\'powered&\'soluble&%table%\'ed-down%$ston%&wheels#$sons!#cuk!&earin\'#)ther-vane\'#man("en"#bbe',
+    '"$ekes##nie$!y#$vils"\'ightier&(lessness\'&ifting"+ll-adjusted&$imed%+constructed%)furnished%%meant%)presented\'*oportioned%&spoken',
+    '$$head#+sh-speaking"$myss"%nding##ger"\'sleyans#(ternized!&harram"&eatear%%sheaf#$edle$#zes#"lk##way"&innied',
+    '%!s#%skery#)te-coated%%field&%riars$$gift$%tling#&zz-kid"\'olefood%&saling%%wheat"!s!&ichita#$kram%$ithe',
+    '##mer"&echula"&ggling"%htred")ldenstein$&flower#\'fulness#\'lingham$\'owfield"$mpol"&ndeler%$rman$+ow-dressing&"ed&)s-on-unix',
+    '##ery#&g-half$%field$$less$#tip#\'kelmann#%sford#%throp#$waed"\'reframe")shy-washy##ley"&tcombe#"te"!z',
+    '"\'lfhound#+lstonecraft##mar"$mbat"+od-panelled$%bines$&church%&utters$$ruff$$vale#&nerven"*rd-meaning$)sworthian#&k-outs$&people',
+    '#)ldly-wise#$ming#$rier#&st-hit%%horne")therspoon!\'rangham#\'paround"$ekin#%nches#%sting"%inkly#(te-downs&"up")ong-doing',
+    '&&headed%$doer#%xeter!#spu!%ullie"\'rlitzer!$yeth""nd"&rmberg "x-"#box!#400!\'anthine!"ba!)enografts',
+    '!%imena!&plorer!#r3i!$soft!"vt!"xi #y\'s!#aga""ks"$m-ma#!s"!o#$bang"%shkin"$tton',
+    '""cc!(earlings"*llow-green#"ps"$ntob"%revan""ws!"ha!#ing!*lang-ylang!#ogi"!m"#nks"$rkie$(shiremen',
+    '!%u-wei"#cca"!n##nan!&vresse "z3!"ag"&kopane#"ro"%mbezi"$pped"#rei"#yed!(ebrafish"(elenberg',
+    '"%nobia"\'ppelins"&ro-sum##vos!#hou!*ig-zagging\'!s#$zags""ng"#ppy"$rcon!%nf11a!#ona$$tion"!u',
+    '!)uccarelli"!r!"vi#"ad"%ornik',
 )
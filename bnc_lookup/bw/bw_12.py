@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_12 = (
+count_12 = 6694
+
+heads_12 = (
     '&aelig;thelstan',
-    '&agr;-subunit',
-    '&amp;c.',
-    '&bsol',
-    '&commat;tab1',
-    '&dgr;t',
-    '&dollar;0.02',
-    '&dollar;0.04',
-    '&dollar;1,400',
-    '&dollar;1,600',
-    '&dollar;1.47',
-    '&dollar;1.75',
-    '&dollar;100,000,000',
-    '&dollar;11m',
-    '&dollar;125m',
-    '&dollar;13m',
     '&dollar;19',
-    '&dollar;2,000m',
-    '&dollar;2,800',
-    '&dollar;2.2m',
-    '&dollar;2.8m',
-    '&dollar;2.9m',
-    '&dollar;23m',
-    '&dollar;24',
-    '&dollar;3.4m',
-    '&dollar;3.5',
-    '&dollar;35,000',
-    '&dollar;4,500',
-    '&dollar;400,000',
-    '&dollar;750,000',
-    '&dollar;80',
-    '&dollar;80,000',
     '&dollar;800,000',
-    '&eacute;lan',
-    '&frac12&ins',
-    '&frac38;in',
-    '&ft',
-    '&half;inch',
-    '&icirc;le',
-    '&kgr',
-    '&lowbar',
-    '&mdash;but',
-    '&mdash;in',
-    '&mgr;m',
-    '&pound;1,750',
-    '&pound;1.05',
-    '&pound;1.1bn',
-    '&pound;1.25m',
     '&pound;1.30',
-    '&pound;1.49',
-    '&pound;1.60',
-    '&pound;1.90',
-    '&pound;1.9m',
-    '&pound;10,500',
-    '&pound;129',
-    '&pound;13.50',
-    '&pound;130m',
-    '&pound;139',
-    '&pound;160m',
-    '&pound;169',
-    '&pound;189',
-    '&pound;19.50',
-    '&pound;2.4m',
-    '&pound;2.8m',
     '&pound;20.00',
-    '&pound;215',
-    '&pound;225,000',
-    '&pound;23m',
-    '&pound;240,000',
-    '&pound;245',
-    '&pound;24m',
-    '&pound;25.00',
-    '&pound;275,000',
-    '&pound;27m',
-    '&pound;29.50',
-    '&pound;3.1',
-    '&pound;3.3',
-    '&pound;3.49',
-    '&pound;3.60',
-    '&pound;310',
     '&pound;34.95',
-    '&pound;375,000',
-    '&pound;38,000',
-    '&pound;4,200',
-    '&pound;4.00',
-    '&pound;4.1',
-    '&pound;4.49',
-    '&pound;42,000',
-    '&pound;480',
-    '&pound;5.2m',
-    '&pound;525',
-    '&pound;550,000',
-    '&pound;59.99',
-    '&pound;61',
-    '&pound;68,000',
-    '&pound;700m',
     '&pound;72,000',
-    '&pound;74',
-    '&pound;77',
-    '&pound;84',
-    '&pound;88',
-    '&pound;9,500',
-    '&pound;90m',
-    '&pound;99.95',
-    '&pound;xxx',
-    '&psgr',
-    '&sim',
-    '\'84',
-    '\'bye',
-    '\'mill',
-    '\'old',
-    '\'orrible',
     '\'till',
-    '\'ud',
-    '++',
-    '+aer',
-    '-40',
-    '-80&deg;c',
-    '-and',
-    '-column',
-    '-g.',
-    '-rna',
-    '-strands',
-    '-type',
-    '.6',
-    '/2',
-    '0&ndash;24',
-    '0.06',
     '0.07',
-    '0.08',
-    '0.09',
-    '0.12',
-    '0.14',
-    '0.25%',
-    '0.50',
-    '0.5mm',
-    '0/1',
-    '00:16',
-    '01.01',
-    '0252',
-    '0273',
-    '0293',
-    '0306',
-    '0345',
     '0524',
-    '0600',
-    '0624',
-    '0700',
-    '0730',
-    '0752',
-    '0772',
-    '091',
-    '0s.',
-    '1&frac12&ins',
-    '1&frac12&ndash;2',
-    '1&ndash;100',
-    '1&ndash;15',
-    '1,000m',
-    '1,200,000',
-    '1-4',
     '1.14',
-    '1.17',
-    '1.20',
-    '1.3.1',
-    '1.3.3',
-    '1.5.2',
-    '1.8-litre',
-    '1/',
-    '10&frac12',
-    '10&mgr;m',
-    '10&ndash;0',
-    '10&ndash;20%',
-    '10(9)',
-    '10-month-old',
-    '10.40pm',
-    '1009',
     '100a',
-    '1012',
-    '101st',
-    '1025',
-    '1070',
-    '10lbs',
-    '10q11.2',
-    '11&ndash;13',
-    '11&ndash;2',
-    '11-year-olds',
-    '11.4%',
-    '11.45',
-    '11.5%',
-    '1103',
-    '1124',
-    '1135',
     '1140',
-    '1147',
-    '115,000',
-    '1165',
-    '1166',
-    '1173',
-    '1174',
-    '1178',
-    '1185',
-    '1186',
-    '11m',
-    '12-mile',
-    '12-week',
-    '12.10',
-    '12.12',
-    '12.3%',
     '12.9%',
-    '1206',
-    '1217',
-    '1225',
-    '1235',
-    '1240',
-    '1255',
-    '1256',
-    '1257',
-    '125mph',
-    '1263',
-    '1281',
-    '12s.',
-    '12st',
-    '12th-century',
-    '13&ndash;17',
     '13,500',
-    '13-member',
-    '13.5%',
-    '1332',
-    '1336',
-    '1343',
-    '1361',
-    '1364',
-    '1379',
-    '1385',
-    '1387',
-    '13pc',
-    '13th-century',
-    '14&ndash;6',
-    '14-month',
-    '1410',
     '1416',
-    '1440',
-    '1455',
-    '1460',
-    '1465',
-    '1477',
-    '1486',
-    '1487',
-    '1494',
-    '15&ndash;17',
-    '15&ndash;18',
-    '15&ndash;19',
-    '15&ndash;24',
-    '15&ndash;3',
-    '15-20',
-    '15.',
     '15.4%',
-    '15.8',
-    '150g/5oz',
-    '150mph',
-    '1510',
-    '1531',
-    '1550s',
-    '1560s',
-    '1570s',
-    '1580s',
-    '15a',
-    '15th-century',
-    '16(2)',
-    '16-man',
-    '16.',
-    '16.5%',
     '1600s',
-    '1660&ndash;1690',
-    '16a',
-    '16ft',
-    '16in',
-    '17&ndash;20',
-    '17(1)',
-    '17-20',
-    '17-member',
-    '18&ndash;21',
-    '18-20',
-    '18-21',
-    '18.',
-    '19&ndash;21',
-    '19-year-olds',
-    '190c/375f/gas',
     '1913&ndash;14',
-    '1916&ndash;17',
-    '1917&ndash;18',
-    '1929&ndash;30',
-    '1938&ndash;39',
-    '1949&ndash;50',
-    '1962/63',
-    '1971a',
-    '1972&ndash;3',
-    '1973&ndash;74',
-    '1973b',
-    '1974/75',
-    '1975&ndash;76',
-    '1979&ndash;83',
-    '1981/82',
-    '1984-85',
     '1987&ndash;89',
-    '1988&ndash;91',
-    '1991/2',
-    '1992b',
-    '1993&ndash;4',
-    '19a',
-    '1:2',
-    '1e',
-    '1h',
-    '1kg',
-    '1km',
-    '1x12',
-    '2&egrave;me',
-    '2(4)',
-    '2-6',
-    '2-bit',
     '2.17',
-    '2.2.3',
-    '2.3.1',
-    '2.4.0',
-    '2.4m',
-    '2.5p',
-    '20&ndash;40',
-    '20-1',
-    '20-22',
-    '20.4',
-    '2006',
-    '20g',
-    '20s.',
-    '21&ndash;23',
-    '21-year',
-    '21.7',
     '21.8',
-    '21p',
-    '22&ndash;24',
-    '22.',
-    '225,000',
-    '23-25',
-    '23p',
-    '24-valve',
-    '24.2',
-    '24.4',
-    '240,000',
-    '24in',
-    '25&ndash;1',
-    '25&ndash;35',
-    '250m',
-    '250th',
     '25s',
-    '26.6',
-    '270&deg',
-    '272578',
-    '280,000',
-    '29.5',
-    '29.9',
-    '2ins',
-    '2km',
-    '2n',
-    '3,100',
-    '3-day',
-    '3-dimensional',
-    '3.2.2',
-    '3.22',
-    '3.24',
     '3.3.2',
-    '3.45',
-    '3.7.2',
-    '30&ndash;50',
-    '30&ndash;60',
-    '30-second',
-    '30-yard',
-    '300th',
-    '31(2)',
-    '33-1',
-    '33.3%',
-    '330,000',
-    '34p',
-    '35&ndash;40',
-    '360k',
-    '36986',
     '37-c',
-    '37450',
-    '37639',
-    '37773',
-    '37868',
-    '37915',
-    '37927',
-    '37930',
-    '38165',
-    '38166',
-    '38307',
-    '38308',
-    '38353',
-    '38452',
-    '3849+10',
-    '38548',
     '3900',
-    '4&deg',
-    '4,600',
-    '4,800',
-    '4.00pm',
-    '4.14',
-    '4.17',
-    '4.2.0',
-    '4.25',
-    '4.4%',
-    '4.4.2',
-    '40&deg',
-    '40&deg;c',
-    '400mm',
-    '4400',
-    '45&deg;c',
     '4600',
-    '463',
-    '46p',
-    '48,000',
-    '49/50',
-    '492',
-    '494',
-    '4pc',
-    '5\'s',
-    '5*',
-    '5,800',
-    '5-fluorouracil',
-    '5.1.1',
-    '5.1.3',
-    '5.2.3',
-    '5.3%',
     '5.45',
-    '50&ndash;1',
-    '50\'s',
-    '50-50',
-    '500ml',
-    '50ml',
-    '512k',
-    '523',
-    '527',
-    '548',
-    '55&deg;c',
-    '550,000',
-    '552',
-    '553',
-    '56-year-old',
-    '564',
     '565',
-    '572',
-    '58,000',
-    '598',
-    '5:1',
-    '5asa',
-    '5d',
-    '5km',
-    '5q',
-    '6&frac12',
-    '6+',
-    '6.1%',
-    '6.2%',
-    '6.4%',
-    '600ml/1',
-    '608',
     '60ml',
-    '611',
-    '63,000',
-    '639',
-    '63rd',
-    '64-year-old',
-    '6500',
-    '653',
-    '663',
-    '66th',
-    '675678',
-    '67th',
-    '680x0',
-    '684',
-    '69(1)',
-    '693',
     '7&ndash;11',
-    '7&ndash;12',
-    '7&ndash;4',
-    '7-3',
-    '7.1%',
-    '7.12',
-    '7.14',
-    '7.2.3',
-    '7.4%',
-    '7.5cm',
-    '70&ndash;80',
-    '71,000',
-    '711',
-    '719',
-    '720k',
-    '732',
     '733',
-    '73rd',
-    '74-year-old',
-    '75-year-old',
-    '7500',
-    '75069',
-    '75cl',
-    '766',
-    '771',
-    '786',
-    '79th',
-    '7c',
-    '8&ndash;11',
-    '8.1%',
-    '8.13',
-    '8.4%',
     '8.75',
-    '80&ndash;90',
-    '80/20',
-    '80486sx',
-    '807',
-    '8086',
-    '80mph',
-    '811',
-    '817',
-    '821',
-    '827',
-    '835',
-    '841',
-    '847',
-    '850,000',
-    '855',
     '858',
-    '875',
-    '876',
-    '89p',
-    '8f',
-    '8s',
-    '9,500',
-    '9-3',
-    '9.00am',
-    '9.2.0',
-    '9.25',
-    '9.8%',
-    '90-year-old',
-    '904',
-    '908',
-    '925',
     '929',
-    '95th',
-    '965',
-    '968',
-    '976',
-    '977',
-    '978',
-    '992',
-    '9d.',
-    '9ft',
-    '9pc',
-    '9v',
-    'a-c',
-    'a-measure',
-    'a-t',
-    'a-team',
     'a.e.',
-    'a1(m)',
-    'a167',
-    'a41',
-    'a68',
-    'a8',
-    'aaah',
-    'aagh',
-    'abalkin',
-    'abbreviate',
-    'abdicating',
-    'abdulla',
-    'aberavon',
-    'abercorn',
-    'aberdare',
-    'aborigine',
     'abraded',
-    'abrc',
-    'absalom',
-    'absorber',
-    'absurdum',
-    'abubakar',
-    'abyssinians',
-    'accentual',
-    'acci&oacute;n',
-    'accidently',
-    'acclimatisation',
-    'acclimatized',
-    'accommodationist',
-    'accrediting',
-    'accs',
-    'acetylation',
     'achiever',
-    'acidophilic',
-    'acker',
-    'ackermann',
-    'ackland',
-    'acpo',
-    'acquirers',
-    'acquittals',
-    'acr',
-    'acs',
-    'actives',
-    'actuals',
-    'ad2',
-    'ad_hominem',
-    'adacom',
-    'adalbert',
     'adana',
-    'adaptec',
-    'addenbrooke',
-    'adenocarcinomas',
-    'adis',
-    'admonish',
-    'admonitions',
-    'adnan',
-    'adopter',
-    'adoptions',
-    'adornments',
-    'adour',
-    'adr',
-    'adulterers',
-    'adumbrated',
-    'adventist',
     'ael',
-    'aerate',
-    'aerofoil',
-    'aethelwald',
-    'aether',
-    'afdc',
-    'affinity-purified',
-    'africanist',
-    'afrika',
-    'after-shave',
-    'aftertaste',
-    'agadir',
-    'aggradation',
-    'aggrandisement',
-    'agitprop',
-    'agnelli',
     'agroforestry',
-    'ahlberg',
-    'ahmet',
-    'aho',
-    'aht',
-    'aig',
-    'aimee',
-    'aimlessness',
-    'air-filled',
-    'air-to-air',
-    'aischines',
-    'aix/esa',
-    'aja',
-    'akabusi',
-    'akbulut',
-    'akehurst',
     'akragas',
-    'aksarayi',
-    'akzo',
-    'al-kaysi',
-    'alar',
-    'alassio',
-    'alb',
-    'albatrosses',
-    'albers',
-    'albertine',
-    'albumen',
-    'alcatraz',
-    'alderdice',
-    'aldis',
-    'aldosterone',
-    'ale-house',
     'aleister',
-    'alesis',
-    'alessandra',
-    'alexandrian',
-    'alfons&iacute;n',
-    'alfort',
-    'algar',
-    'algarde',
-    'algol',
-    'alhaji',
-    'aliases',
-    'alisdair',
-    'alistaire',
-    'alkaloid',
-    'alkar',
-    'all-',
     'all-england',
-    'all-metal',
-    'all-singing',
-    'allelic',
-    'allerdale',
-    'alligin',
-    'allograft',
-    'allometry',
-    'allophonic',
-    'almond-shaped',
-    'also-ran',
-    'altair',
-    'alternants',
-    'alumnus',
-    'alured',
-    'alva',
     'am486',
-    'amasya',
-    'amatory',
-    'amberley',
-    'ambrosia',
-    'ambulanceman',
-    'ambulant',
-    'ameliorating',
-    'amenhotep',
-    'american-born',
-    'amf(l)',
-    'amherst',
-    'amidships',
-    'amigo',
-    'ammeter',
-    'amo',
     'amon',
-    'ampa',
-    'amphitheatres',
-    'ampleforth',
-    'amplexus',
-    'ampthill',
-    'amputate',
-    'amun',
-    'amyas',
-    'amytal',
-    'analog',
-    'analogously',
-    'anchorman',
-    'ancistrus',
-    'ancona',
-    'and/',
     'andaman',
-    'andra',
-    'andros',
-    'aneuploid',
-    'angelus',
-    'angiogenesis',
-    'anglicized',
-    'angularity',
-    'animates',
-    'anis',
-    'anjelica',
-    'ann-marie',
-    'annis',
-    'anno',
-    'annualised',
-    'annular',
     'annus_horribilis',
-    'anomalously',
-    'anoxic',
-    'ansell',
-    'anta',
-    'anteater',
-    'anteaters',
-    'antediluvian',
-    'antenor',
-    'anteriorly',
-    'anthelmintics',
-    'anthy',
-    'anti-clerical',
-    'anti-clericalism',
-    'anti-crime',
-    'anti-discriminatory',
     'anti-french',
-    'anti-insider',
-    'anti-intellectual',
-    'anti-iraq',
-    'anti-maastricht',
-    'anti-poaching',
-    'anti-poverty',
-    'anti-semites',
-    'anti-state',
-    'anti-static',
-    'anti-submarine',
-    'anti-theft',
-    'antidotes',
-    'antifeminist',
-    'antigliadin',
-    'antioxidant',
     'antioxidants',
-    'antiquarks',
-    'antiseptics',
-    'antonin',
-    'aonbs',
-    'ap1-88',
-    'ape-like',
-    'aperitifs',
-    'apf',
-    'aphasic',
-    'aphrodisiacs',
-    'apoptotic',
-    'appalachia',
-    'apparatchik',
-    'appeasing',
-    'appi',
     'appian',
-    'aquatints',
-    'aranda',
-    'arandt',
-    'archeologists',
-    'arcing',
-    'ardakkean',
-    'ardamal',
-    'ardennes',
-    'ardnamurchan',
-    'arendale',
-    'areopagus',
-    'argo',
-    'arien',
-    'arimathea',
-    'aristeides',
     'aristocracies',
-    'arius',
-    'arm-twisting',
-    'armfield',
-    'armiger',
-    'arminianism',
-    'arminians',
-    'armour-plated',
-    'arndale',
-    'arnot',
-    'aromatherapist',
-    'aromatherapists',
-    'arpad',
-    'arr',
-    'arrowroot',
-    'arseholes',
     'arsenicum',
-    'arterial-alveolar',
-    'arthit',
-    'artificer',
-    'artisanal',
-    'ascorbate',
-    'ase',
-    'ashburnham',
-    'ashmead',
-    'ashmore',
-    'aslib',
-    'aspartame',
-    'aspersions',
-    'aspirate',
-    'aspirates',
-    'assab',
     'assertively',
-    'assignable',
-    'asst',
-    'assyria',
-    'astigmatism',
-    'astound',
-    'astro',
-    'astronomically',
-    'astrophil',
-    'asturian',
-    'asunci&oacute;n',
-    'asymptotically',
-    'at1',
-    'at2',
-    'athan',
-    'atheroma',
     'atherosclerotic',
-    'athlone',
-    'athulathmudali',
-    'atmospherics',
-    'atn',
-    'attention-seeking',
-    'attitude-holder',
-    'attitudinism',
-    'atwell',
-    'aubeterre',
-    'aubusson',
-    'augments',
-    'augured',
-    'august-september',
-    'aurelia',
-    'aurum',
     'australasian',
-    'authored',
-    'autocatalysts',
-    'automatics',
-    'automatism',
-    'autopsies',
-    'autrefois',
-    'autres',
-    'avant-gardes',
-    'avionic',
-    'awakes',
-    'ayah',
-    'ayaz',
-    'azathioprine',
-    'azide',
-    'azinger',
     'b&eacute;nard',
-    'b&ndash;17s',
-    'b-1',
-    'b-52',
-    'b.2',
-    'b.ed',
-    'b.r.',
-    'b7',
-    'baas',
-    'babington',
-    'bachrach',
-    'back-bencher',
-    'back-end',
-    'back-pass',
-    'back-room',
-    'back-translation',
     'back-ups',
-    'backcross',
-    'backless',
-    'backline',
-    'backtracked',
-    'bacs',
-    'baculovirus',
-    'badinage',
-    'badran',
-    'baghoomian',
-    'bagley',
-    'bai',
-    'baibing',
-    'bailor',
-    'bair',
-    'bairstow',
     'baiters',
-    'balaam',
-    'balcha',
-    'balla',
-    'balled',
-    'balling',
-    'ballvalves',
-    'ballygrant',
-    'balusters',
-    'balustraded',
-    'bamberg',
-    'bamboozled',
-    'bananarama',
-    'banc',
-    'bangle',
-    'banjul',
     'bankable',
-    'bankrupts',
-    'bantustans',
-    'baptize',
-    'barbary',
-    'barbiturate',
-    'bardul',
-    'bareback',
-    'bargh',
-    'barisan',
-    'barlinnie',
-    'barnsdale',
-    'barnwell',
-    'baronage',
-    'baronets',
-    'basilect',
     'basketwork',
-    'basks',
-    'bassman',
-    'basso',
-    'baste',
-    'batholith',
-    'batstone',
-    'batt',
-    'battambang',
-    'battersby',
-    'battlefront',
-    'bauble',
-    'baughan',
-    'bauman',
-    'bauthumley',
-    'bavarians',
     'baz',
-    'bazar',
-    'bba',
-    'bca',
-    'bce',
-    'bdh',
-    'be-all',
-    'beachside',
-    'beag',
-    'beaked',
-    'bearcat',
-    'bearpark',
-    'beastliness',
-    'beatnik',
-    'beaufighter',
-    'beaumont-dark',
     'beaverton',
-    'beccles',
-    'bed-sitter',
-    'bedsheets',
-    'bedsitter',
-    'bee-line',
-    'beefed',
-    'beefheart',
-    'beekeepers',
-    'beeps',
-    'before-position',
-    'before/after',
-    'beguile',
-    'behbehanian',
-    'behr',
-    'bela',
     'belfast-based',
-    'belig',
-    'belittled',
-    'bellarmine',
-    'belles',
-    'bellgrove',
-    'below-average',
-    'belsey',
-    'beltrami',
-    'belving',
-    'bemba',
-    'benbow',
-    'benefactions',
-    'beneficence',
-    'beng',
-    'benichou',
     'benina',
-    'bennetts',
-    'bentinck',
-    'bentwood',
-    'bequeathing',
-    'ber',
-    'berate',
-    'berbera',
-    'berberis',
-    'berkoff',
-    'berlinetta',
-    'bernardino',
-    'berti',
-    'berton',
-    'beseeched',
-    'besiegers',
     'bessarabia',
-    'betamax',
-    'bethanechol',
-    'betoken',
-    'betrayals',
-    'betrayer',
-    'bettering',
-    'bewley',
-    'bexhill',
-    'beyer',
-    'bfi',
-    'bhc',
-    'biasing',
-    'bicentennial',
-    'bickerton',
-    'bidault',
     'big-hearted',
-    'bigamy',
-    'bigot',
-    'bilberries',
-    'bilberry',
-    'billow',
-    'bin-liner',
-    'bindery',
-    'biochemically',
-    'biochemicals',
-    'biolayer',
-    'biomaterials',
-    'biotechnological',
-    'birbeck',
-    'birchwood',
-    'bird\'s-eye',
     'birth-rates',
-    'birtwell',
-    'biscayne',
-    'bishopstow',
-    'bisley',
-    'bisto',
-    'bit-part',
-    'biter',
-    'bith',
-    'bivar',
-    'bivvy',
-    'black-and-whites',
-    'black-tailed',
-    'blackfoot',
-    'blackhorse',
-    'blackwall',
     'blain',
-    'blaker',
-    'blameworthy',
-    'blanching',
-    'blase',
-    'blazoned',
-    'bleeder',
-    'bleeping',
-    'blenders',
-    'blenheims',
-    'blesses',
-    'blighters',
-    'blockbusting',
-    'blok',
-    'blom-cooper',
-    'bloodily',
     'bloodline',
-    'bloomer',
-    'blouson',
-    'blowed',
-    'blowlamp',
-    'blowtorch',
-    'bludgeoning',
-    'blue-white',
-    'bluer',
-    'bluesman',
-    'blumlein',
-    'blundellsands',
-    'blunden',
-    'blunset',
-    'blunter',
-    'blurting',
     'bmi',
-    'bmr',
-    'bna',
-    'bo-bo',
-    'boal',
-    'boarded-up',
-    'boarding-house',
-    'boateng',
-    'bobbles',
-    'boccaccio',
-    'boccioni',
-    'boddingtons',
-    'bodices',
-    'bodyshell',
-    'boepd',
-    'boethius',
     'bogtrotter',
-    'boi',
-    'boilerhouse',
-    'bol&iacute;var',
-    'bola',
-    'bolide',
-    'bolt-on',
-    'boltwood',
-    'bona',
-    'bonapartist',
-    'bonham-carter',
-    'bonifacio',
-    'booby-trap',
-    'bookers',
-    'bookkeeper',
-    'bookmaking',
     'bookmarks',
-    'booties',
-    'bootlegging',
-    'borage',
-    'bordelais',
-    'borges',
-    'borghese',
-    'bormann',
-    'boromir',
-    'bos',
-    'bosham',
-    'bostock',
-    'bosun',
-    'botanically',
-    'bothersome',
-    'boto',
     'bou',
-    'bould',
-    'boult',
-    'boulting',
-    'bourner',
-    'bowland',
-    'boxful',
-    'bozo',
-    'br.',
-    'bradfield',
-    'brah',
-    'brahma',
-    'brahmins',
-    'braiding',
-    'brainstem',
-    'brancusi',
     'brand-name',
-    'branston',
-    'brasilia',
-    'brassey',
-    'brassi&egrave;re',
-    'bratby',
-    'bravd',
-    'braziers',
-    'breadhead',
-    'breakable',
-    'breast-band',
-    'breastfed',
-    'breckenridge',
-    'brecknock',
-    'bredon',
-    'bremer',
     'brenin',
-    'brera',
-    'bressingham',
-    'bretonnian',
-    'brets',
-    'brichardi',
-    'brightlingsea',
-    'brims',
-    'brindled',
-    'britains',
-    'britoil',
-    'brix',
-    'broadford',
-    'broadstone',
-    'brobdingnag',
-    'broderie',
     'broglie',
-    'bromberg',
-    'brooked',
-    'brooker',
-    'brookfield',
-    'brookhouse',
-    'broom-parker',
-    'broomsticks',
-    'bros.',
-    'brotherton',
-    'brownstone',
-    'brrr',
-    'brucan',
-    'brucie',
-    'brummer',
-    'brun',
     'brunettes',
-    'brunnen',
-    'brunswijk',
-    'brutalised',
-    'bsad',
-    'bta',
-    'btu',
-    'bubo',
-    'buckfastleigh',
-    'buckhaven',
-    'buckler',
-    'buckminsterfullerene',
-    'bucknall',
-    'bucknor',
-    'bucks.',
-    'buckton',
     'bucolic',
-    'budded',
-    'bude',
-    'budgens',
-    'buffa',
-    'bufi',
-    'bukhara',
-    'bulkier',
-    'bull\'s-eye',
-    'bulldogs',
-    'bullitt',
-    'bulow',
-    'bulwarks',
-    'bumblebee',
-    'bummer',
-    'bundy',
     'burdening',
-    'burdett',
-    'bure',
-    'burgling',
-    'burnard',
-    'burnishing',
-    'burntisland',
-    'burped',
-    'burping',
-    'burslem',
-    'burton-on-trent',
-    'bushels',
-    'bushmills',
-    'bushnell',
-    'bussed',
-    'bustin',
     'buswell',
-    'butters',
-    'byelection',
-    'byes',
-    'bykov',
-    'byrkin',
-    'byrom',
-    'c&aacute;rdenas',
-    'c&eacute;line',
-    'c-r',
-    'c.g.',
-    'c.h.',
-    'c.r.',
-    'c2s',
-    'c7',
-    'c8',
     'cacheing',
-    'caesarea',
-    'caesium-137',
-    'cagoule',
-    'cahn',
-    'cahoots',
-    'cainozoic',
-    'caister',
-    'caixa',
-    'calcraft',
-    'calendula',
-    'calipers',
-    'call-girl',
-    'calley',
-    'calligrapher',
-    'callin\'',
     'calliper',
-    'callus',
-    'calman',
-    'calorimeter',
-    'cals',
-    'calvi',
-    'cambrai',
-    'camera_obscura',
-    'camerons',
-    'campana',
-    'campsie',
-    'campylobacter',
-    'canaria',
-    'canetti',
-    'canford',
-    'canizares',
     'cannois',
-    'cannulation',
-    'canonry',
-    'canthari',
-    'canvasses',
-    'canzoni',
-    'caparisoned',
-    'capitano',
-    'capote',
-    'capra',
-    'capriccio',
-    'caprices',
-    'capsizing',
-    'captivate',
-    'captive-bred',
-    'car-bomb',
     'caraway',
-    'carberry',
-    'carbery',
-    'carbon-14',
-    'carbon-based',
-    'carbon-free',
-    'carcassonne',
-    'cardiology',
-    'carin&aelig',
-    'carlism',
-    'carlist',
-    'carloman',
-    'carmakers',
-    'carmody',
-    'carnivals',
-    'carpet-bag',
     'carrara',
-    'carre',
-    'carrian',
-    'carrott',
-    'carryduff',
-    'carsberg',
-    'cartwheel',
-    'carve-out',
-    'cash-starved',
-    'casimir',
-    'cassel',
-    'cast-on',
-    'castellan',
-    'castille',
-    'castletown',
-    'catalyses',
     'catchword',
-    'catechists',
-    'catenary',
-    'catharine',
-    'cathbad',
-    'cather',
-    'catherwood',
-    'cathodoluminescence',
-    'caton',
-    'catty',
-    'cause-and-effect',
-    'caux',
-    'cavorted',
-    'cazenove',
-    'cd45ra',
-    'cdt',
     'ceding',
-    'celica',
-    'cellphone',
-    'cen',
-    'centaurs',
-    'centipedes',
-    'central-government',
-    'centre-periphery',
-    'centrefold',
-    'centrists',
-    'ceos',
-    'cephalopods',
-    'cerecloth',
-    'ceremonially',
-    'cerf',
-    'cf/cf',
     'cfi',
-    'cfp',
-    'cg',
-    'ch&egrave;re',
-    'ch\'un',
-    'chaffinches',
-    'chaffing',
-    'chairmanships',
-    'chaise-longue',
-    'chalatenango',
-    'chalcedony',
-    'chalerm',
-    'chalking',
-    'champenoise',
-    'champneys',
-    'changeling',
     'chanter',
-    'chaperoned',
-    'chapmans',
-    'chapped',
-    'charabancs',
-    'charcuterie',
-    'charibert',
-    'charterail',
-    'chartism',
-    'chartreuse',
-    'charybdis',
-    'chastel',
-    'chatfield',
-    'chau',
-    'cheapen',
-    'chechen',
     'chee',
-    'cheep',
-    'cheerleaders',
-    'chelt',
-    'chemise',
-    'chemoattractant',
-    'chequebooks',
-    'cherrywood',
-    'chervil',
-    'chesara',
-    'chesil',
-    'chested',
-    'chesterford',
-    'chesty',
-    'chetnik',
-    'chevet',
     'chiaro',
-    'chicago-based',
-    'chickenpox',
-    'chien',
-    'chiesa',
-    'child-minding',
-    'childe',
-    'chilliness',
-    'chinook',
-    'chipmunk',
-    'chiral',
-    'chiron',
-    'chirp',
-    'chiselling',
-    'chloroquine',
-    'chodorow',
     'choirmaster',
-    'cholestatic',
-    'cholsey',
-    'chomp',
-    'chon',
-    'chondrites',
-    'chordates',
-    'chortle',
-    'chortling',
-    'chorzow',
-    'choses',
-    'christenings',
-    'christianized',
-    'christiansen',
-    'chronicling',
-    'chronometer',
     'chuntering',
-    'church-based',
-    'church-goers',
-    'churchgoing',
-    'chutzpah',
-    'ciccolini',
-    'cincom',
-    'cipolla',
-    'cir',
-    'circumnavigate',
-    'circumscribe',
-    'circumspectly',
-    'citadels',
-    'city-states',
-    'civilianisation',
-    'ck',
     'clade',
-    'clapper',
-    'clappers',
-    'clarice',
-    'clarinettist',
-    'class-a',
-    'classwork',
-    'clasts',
-    'clavigera',
-    'claymore',
-    'clear-eyed',
-    'clear-headed',
-    'clearness',
-    'clefts',
-    'cleg',
-    'clementine',
     'clenbuterol',
-    'clerval',
-    'cleve',
-    'cliffhanger',
-    'climatologists',
-    'clod',
-    'clonmacnoise',
-    'close-run',
-    'closeknit',
-    'cloud-author',
-    'cloudburst',
-    'clovenstone',
-    'clow',
-    'cluck',
-    'clued',
-    'cluj',
     'clunch',
-    'cly',
-    'clyst',
-    'cmr',
-    'co-authored',
-    'co-determination',
-    'co-extensive',
-    'co-religionists',
-    'co-starring',
-    'coagulopathy',
-    'coalescing',
-    'coaling',
-    'coasters',
-    'coastlands',
-    'cobbe',
-    'cobuild',
     'cockneys',
-    'code-switching',
-    'codename',
-    'coen',
-    'coggeshall',
-    'cognizance',
-    'coilus',
-    'coking',
-    'col&oacute;n',
-    'colas',
-    'colleen',
-    'collias',
-    'colliculus',
-    'collies',
-    'colonising',
-    'colonize',
     'colonoscopies',
-    'colons',
-    'colourist',
-    'cols',
-    'coltheart',
-    'coltman',
-    'columbine',
-    'combers',
-    'comdisco',
-    'come-on',
-    'comic-strip',
-    'commanche',
-    'commedia',
-    'commemorations',
-    'commies',
-    'commiseration',
     'commissars',
-    'commissary',
-    'committals',
-    'commodes',
-    'commonalty',
-    'commonplaces',
-    'communaut&eacute',
-    'communicant',
-    'community-acquired',
-    'commutes',
-    'comorbidity',
-    'compassionately',
-    'compellingly',
-    'compiles',
-    'compo',
-    'computer-readable',
     'computone',
-    'conceptualizing',
-    'concerti',
-    'concomitantly',
-    'concretions',
-    'condenses',
-    'conder',
-    'condiments',
-    'confections',
-    'confino',
-    'congenitally',
-    'conjoint',
-    'connemara',
-    'connexions',
-    'connoted',
-    'conodonts',
     'conquers',
-    'consorting',
-    'conspecific',
-    'consuela',
-    'cont&eacute',
-    'contemplatives',
-    'contemporain',
-    'contemporaneity',
-    'contenting',
-    'contestation',
-    'contraindication',
-    'contributorily',
-    'conveyors',
-    'convolutions',
-    'cookware',
-    'cooley',
     'copei',
-    'copepods',
-    'copolymers',
-    'coppermalt',
-    'coppiced',
-    'coppices',
-    'copter',
-    'copybook',
-    'copyhold',
-    'copyists',
-    'coracle',
-    'corbet',
-    'cordle',
-    'cored',
-    'corel',
-    'coren',
     'corncrake',
-    'cornelia',
-    'cornelissen',
-    'cornflowers',
-    'cornishman',
-    'cornmarket',
-    'corollaries',
-    'coronets',
-    'corrib',
-    'corroborating',
-    'corroding',
-    'corsage',
-    'corstorphine',
-    'cort&egrave;ge',
-    'cos&igrave',
-    'cosmologies',
     'cosmonaut',
-    'cost-accounting',
-    'cost-saving',
-    'costumed',
-    'cotes',
-    'couldnt',
-    'coulton',
-    'council-run',
-    'countable',
-    'counter-balance',
-    'counter-claim',
-    'counter-example',
-    'counter-measures',
-    'counter-terrorism',
-    'counterculture',
-    'counternotice',
     'countertrade',
-    'coup_d\'etat',
-    'coup_de_grace',
-    'cours',
-    'course-work',
-    'courtelle',
-    'covector',
-    'coverages',
-    'coveralls',
-    'coveting',
-    'cow-dung',
-    'cowell',
-    'cowslips',
-    'coxe',
-    'cpag',
-    'cpi(m)',
     'cpo',
-    'cpt',
-    'cr-1409',
-    'crabbed',
-    'cracknell',
-    'cradley',
-    'crafting',
-    'craganour',
-    'craigforth',
-    'craik',
-    'crampton',
-    'craw',
-    'crayford',
-    'crazier',
-    'crazies',
-    'creamery',
     'creamy-white',
-    'creance',
-    'credibly',
-    'crem',
-    'cremona',
-    'cremonese',
-    'crepuscular',
-    'crescent-shaped',
-    'cressey',
-    'cretin',
-    'crich',
-    'cristina',
-    'croc',
-    'croix',
-    'crome',
-    'croner',
     'cross-check',
-    'cross-cutting',
-    'cross-disciplinary',
-    'cross-hatched',
-    'cross-infection',
-    'cross-linked',
-    'cross-roads',
-    'cross-tabulations',
-    'crossbones',
-    'crosslinks',
-    'crossrail',
-    'crosthwaite',
-    'cruiserweight',
-    'cruithin',
-    'crunches',
-    'crushingly',
     'cruzeiros',
-    'crystallite',
-    'cs-us',
-    'csiro',
-    'csr',
-    'cst',
-    'cubbage',
-    'cubby',
-    'cubby-hole',
-    'cubbyhole',
-    'cuc',
-    'cuckold',
-    'cuddy',
-    'cuff-links',
-    'culbone',
-    'cully',
     'culshaw',
-    'cultic',
-    'cumnor',
-    'cunnilingus',
-    'cup-tied',
-    'cup-winning',
-    'cupar',
-    'cupful',
-    'cuprinol',
-    'curare',
-    'cure-all',
-    'curiouser',
-    'currys',
-    'customized',
-    'cutlers',
-    'cutout',
     'cuttingly',
-    'cybele',
-    'cyclophosphamide',
-    'cymbal',
-    'cyp',
-    'cyphers',
-    'cytometric',
-    'cytosolic',
-    'd\'action',
-    'd\'amour',
-    'd\'argenlieu',
-    'd\'italia',
-    'd-d',
-    'd-i-yer',
-    'd.e.s.',
-    'd.g.',
     'd.p.c.',
-    'd7',
-    'daalny',
-    'dacia',
-    'daedalic',
-    'daffs',
-    'daguerreotype',
-    'dalmeny',
-    'damant',
-    'dangles',
-    'daniell',
-    'danvers',
-    'dao',
-    'dappling',
-    'darkens',
-    'darlington-based',
     'darlow',
-    'darne',
-    'darrowby',
-    'dartboard',
-    'datec',
-    'dauntingly',
-    'davenant',
-    'davidson/rspca',
-    'davina',
-    'day-release',
-    'day-today',
-    'day-trippers',
-    'db(a)',
-    'dbs',
-    'dc-3',
-    'dcc',
     'ddu',
-    'de\'',
-    'de\'ath',
-    'de-industrialisation',
-    'de-regulation',
-    'deaden',
-    'deaf-aid',
-    'deanne',
-    'deare',
-    'dearing',
-    'deaves',
-    'debentureholders',
-    'debug',
-    'debunking',
-    'debutantes',
-    'decameron',
     'decathlete',
-    'decelerating',
-    'decembrists',
-    'decennial',
-    'deck-chairs',
-    'declaratory',
-    'decomposes',
-    'deconstruct',
-    'decretals',
-    'dedlock',
-    'deedes',
-    'deep-freeze',
-    'deep-fried',
-    'deere',
-    'deerness',
-    'dees',
     'defacing',
-    'defamiliarization',
-    'defilement',
-    'definately',
-    'definiteness',
-    'deflects',
-    'deforested',
-    'defrosted',
-    'deftness',
-    'deganwy',
-    'degranulation',
-    'degreaser',
-    'dehumanising',
-    'deighton',
-    'deiran',
-    'dej',
     'delahunt',
-    'delectation',
-    'deller',
-    'delorean',
-    'deltic',
-    'dem&oacute;crata',
-    'demagogue',
-    'demand-led',
-    'demand-side',
-    'dement',
-    'demerara',
-    'demerits',
-    'demesnes',
-    'demidenko',
-    'demilitarization',
-    'democr&aacute;tico',
     'demographers',
-    'demotic',
-    'demystify',
-    'dengue',
-    'denizen',
-    'deo',
-    'deoxyribonucleic',
-    'dep',
-    'depolarized',
-    'deporting',
-    'deportivo',
-    'derangement',
-    'deregulating',
-    'dermatologist',
-    'dersinghams',
-    'desi',
     'desiderata',
-    'designatory',
-    'deskilled',
-    'desperado',
-    'detonating',
-    'dettol',
-    'deus_ex_machina',
-    'deveril',
-    'devilishly',
-    'dexamethasone',
-    'dgh',
-    'dhlakama',
-    'dialectal',
-    'dialectics',
-    'diallo',
-    'diamante',
     'dicken',
-    'didacticism',
-    'dieldrin',
-    'dien',
-    'dif',
-    'different-coloured',
-    'differentiations',
-    'digitalis',
-    'digitech',
-    'digitiser',
-    'dignify',
-    'digoxin',
-    'digressing',
-    'dihedral',
-    'diii',
-    'dilley',
     'dilly',
-    'dimarzio',
-    'dimethyl',
-    'diminuendo',
-    'dimitur',
-    'dingley',
-    'directionally',
-    'dirks',
-    'diro',
-    'dirtied',
-    'disaggregate',
-    'disallowing',
-    'disapprobation',
-    'disassociated',
-    'disbelieved',
-    'disburse',
     'discerns',
-    'discod',
-    'discolour',
-    'disconcert',
-    'discontinuation',
-    'discoverers',
-    'discretely',
-    'discriminative',
-    'disembarkation',
-    'disembowelled',
-    'dishwashing',
-    'disinfecting',
-    'disjuncts',
-    'dismutase',
-    'disorganisation',
-    'disorganization',
     'dispensaries',
-    'disproportionality',
-    'disproving',
-    'disputation',
-    'dissembling',
-    'dissipative',
-    'distastefully',
-    'distresses',
-    'disyllabic',
-    'dittmar',
-    'divertimento',
-    'divulging',
-    'dm2.51',
-    'dm2.84',
-    'dm2.85',
-    'dm2.87',
     'dml',
-    'dmus',
-    'dna-dependent',
-    'dobbin',
-    'dodecanese',
-    'dodecyl',
-    'doffed',
-    'dog-leg',
-    'dog-tired',
-    'dog-whelk',
-    'dolcis',
-    'doles',
-    'dolgellau',
-    'dolittle',
-    'dolled',
-    'dolmen',
     'domanov',
-    'domestos',
-    'dominus',
-    'domus',
-    'donahue',
-    'donnellan',
-    'doolally',
-    'door-frame',
-    'door-jamb',
-    'doorkeeper',
-    'dormeuse',
-    'dors',
-    'dos-based',
-    'dotage',
-    'dote',
-    'dotting',
     'double-deck',
-    'double-deckers',
-    'double-take',
-    'dousing',
-    'dovetailed',
-    'dowland',
-    'down-and-outs',
-    'down-at-heel',
-    'down-payment',
-    'downlands',
-    'downtime',
-    'downturns',
-    'dowries',
-    'dpi',
-    'dq',
-    'drabble',
     'dragooned',
-    'dramatize',
-    'drawing-board',
-    'drawing-rooms',
-    'drawling',
-    'drebin',
-    'drenthe',
-    'dressy',
-    'driers',
-    'driftnet',
-    'drink-driver',
-    'drinkwise',
-    'driveways',
-    'drooled',
-    'drt',
-    'dru',
     'drudge',
-    'drudy',
-    'drug-free',
-    'drug-induced',
-    'drummle',
-    'drummonds',
-    'drus',
-    'dryish',
-    'dsm',
-    'du&scaron;an',
-    'dublin-based',
-    'dubroca',
-    'ducati',
-    'dug-outs',
-    'dugald',
-    'dugard',
     'duguit',
-    'duiker',
-    'dukedom',
-    'dulcimer',
-    'dunked',
-    'dunluce',
-    'dunphy',
-    'dupuytren',
-    'durand',
-    'durf',
-    'durn.',
-    'dusts',
-    'duthie',
-    'duva',
-    'dwelling-house',
-    'dwindles',
     'dyed-in-the-wool',
-    'dyp',
-    'dz',
-    'e\'er',
-    'e.h.r.r.',
-    'e.j.',
-    'e45',
-    'e6000',
-    'eadt',
-    'earley',
-    'earlies',
-    'earmarking',
-    'earth-bound',
-    'earth-shattering',
-    'earthwatch',
-    'easterside',
     'eateries',
-    'ebor',
-    'ecclesia',
-    'ecclesiastes',
-    'edale',
-    'edd',
-    'eddied',
-    'edelson',
-    'edf',
-    'edfu',
-    'edgeways',
-    'edginess',
-    'edgings',
-    'edification',
-    'educates',
-    'edvard',
     'ees',
-    'effing',
-    'effusively',
-    'egghead',
-    'eggleston',
-    'eglantine',
-    'egress',
-    'eha',
-    'eigen',
-    'eigg',
-    'eight-match',
-    'eight-minute',
-    'eight-point',
-    'eight-processor',
-    'eight-track',
-    'eildon',
     'eilean',
-    'eine',
-    'eisenman',
-    'eismark',
-    'eisner',
-    'either/or',
-    'eking',
-    'elapses',
-    'elastoplast',
-    'eldritch',
-    'electricity-generating',
-    'electrochemistry',
-    'elided',
-    'elil',
-    'eliots',
-    'elizabethans',
     'ello',
-    'elr',
-    'elution',
-    'emaciation',
-    'emancipate',
-    'emarginata',
-    'embargoed',
-    'emberton',
-    'embezzling',
-    'embl',
-    'embroideries',
-    'embroidering',
-    'embsay',
-    'emeryville',
-    'emetic',
-    'emigr&eacute',
     'emm',
-    'emmanuelle',
-    'emmaus',
-    'emme',
-    'emmerich',
-    'emmerson',
-    'emo',
-    'empathic',
-    'empathize',
-    'empire-building',
-    'emptily',
-    'emulators',
-    'en_suite',
-    'enablers',
-    'encashment',
-    'enchantress',
     'encircles',
-    'encourager',
-    'encrusting',
-    'end-1990',
-    'end-all',
-    'end-labelled',
-    'end-result',
-    'end-september',
-    'enderby',
-    'enders',
-    'endoderm',
-    'endometrial',
-    'endpapers',
-    'energize',
-    'energized',
-    'energy-intensive',
     'englishing',
-    'engorged',
-    'enhancers',
-    'enjoyably',
-    'enlargements',
-    'enlistment',
-    'enlivening',
-    'ensa',
-    'enshrining',
-    'entrapment',
-    'entreated',
-    'entrenchment',
-    'entryphone',
-    'envies',
-    'eod',
-    'eoe',
     'eorpwald',
-    'ep1242l',
-    'ephesos',
-    'ephialtes',
-    'epoch-making',
-    'epos',
-    'eppendorf',
-    'equalizing',
-    'equilibrated',
-    'equips',
-    'erconwald',
-    'erdinger',
-    'erectus',
-    'erlend',
-    'ermentrude',
-    'error-free',
     'escaper',
-    'eschatological',
-    'eschenbach',
-    'esh',
-    'esmat',
-    'esme',
-    'espa&ntilde;ola',
-    'espace',
-    'essay-writing',
-    'essayed',
-    'essayists',
-    'essinger',
-    'estonians',
-    'etb',
-    'eugenists',
-    'euler',
     'eup',
-    'euphronios',
-    'eurame',
-    'eurocrats',
-    'eurosport',
-    'eurosterling',
-    'eutectic',
-    'evaluator',
-    'evasiveness',
-    'evie',
-    'evil-looking',
-    'evil-smelling',
-    'evolutions',
-    'ex-dividend',
-    'ex-king',
-    'ex-wives',
     'exasperatedly',
-    'excitability',
-    'excreting',
-    'excursionists',
-    'execution-only',
-    'exemplification',
-    'exfoliative',
-    'exorcist',
-    'exoticism',
-    'expensive-looking',
-    'expiation',
-    'export-import',
-    'ext.',
-    'exterminatus',
-    'exters',
-    'extra-large',
     'extra-linguistic',
-    'extra-sensory',
-    'extramarital',
-    'exuberantly',
-    'exult',
-    'eyam',
-    'f&amp;s',
-    'f&ecirc;tes',
-    'f&mdash;ed',
-    'f***ing',
-    'f.e.',
-    'f7',
-    'faber-castell',
-    'fabula',
-    'face-down',
-    'facia',
     'factfile',
-    'facto',
-    'factorial',
-    'factorisation',
-    'factota',
-    'factotum',
-    'failsafe',
-    'fairbairns',
-    'fairburn',
-    'fairy-tales',
-    'fall-rise',
-    'falsifiability',
-    'familiarising',
-    'fanatically',
-    'fantasias',
-    'fantasize',
     'fantasized',
-    'farber',
-    'farces',
-    'fargo',
-    'farm-workers',
-    'farman',
-    'farnese',
-    'farnworth',
-    'farrago',
-    'farren',
-    'farrowing',
-    'farsighted',
-    'fascinatingly',
-    'fascinations',
-    'fashion-conscious',
-    'fast-changing',
     'fateha',
-    'fathering',
-    'fattest',
-    'fauconnier',
-    'fauvism',
-    'faverwell',
-    'favorite',
-    'fawsley',
-    'fayol',
-    'fazed',
-    'fdc',
-    'fdr-fmln',
-    'fearlessness',
-    'feelgood',
-    'feist',
-    'felcourt',
     'felted',
-    'felucca',
-    'fenchurch',
-    'fenian',
-    'ferri',
-    'ferriday',
-    'fertilize',
-    'festered',
-    'festoons',
-    'feta',
-    'feuerbach',
-    'fhimah',
-    'fiata',
-    'fibreboard',
-    'fibril',
-    'fibrils',
     'fibs',
-    'fickleness',
-    'fictionalised',
-    'fielden',
-    'fiestas',
-    'fifty-year-old',
-    'figments',
-    'figure-of-eight',
-    'filenet',
-    'filmmaker',
-    'fils',
-    'filton',
-    'finalizing',
-    'financings',
-    'finders',
-    'fine-class',
     'finger-tips',
-    'fingerstyle',
-    'finikounda',
-    'finzi',
-    'fire-engine',
-    'fire-fighters',
-    'fireback',
-    'firkin',
-    'first-innings',
-    'first-level',
-    'first-name',
-    'fishburn',
-    'fishless',
-    'fissile',
-    'fissured',
-    'fitc',
     'fitzherbert',
-    'five-',
-    'fkgp',
-    'flag-waving',
-    'flagons',
-    'flails',
-    'flam',
-    'flamboyantly',
-    'flapper',
-    'flashings',
-    'flat-chested',
-    'flat-out',
-    'flat-roofed',
-    'flatfish',
-    'flavio',
-    'flemyng',
     'fleshless',
-    'flettner',
-    'flightcase',
-    'flippantly',
-    'flipside',
-    'flirts',
-    'flitcroft',
-    'floggings',
-    'floor-length',
-    'floribunda',
-    'floristry',
-    'flotations',
-    'flounce',
-    'flours',
-    'fluffing',
-    'flunkey',
     'fluorescein',
-    'fly-by-night',
-    'fly-in',
-    'foakes',
-    'foetid',
-    'foix-b&eacute;arn',
-    'folate',
-    'fold-up',
-    'folklinguistic',
-    'follow-through',
-    'fondest',
-    'fono',
-    'fonteyn',
-    'footrest',
-    'foots',
-    'for_keeps',
     'foraged',
-    'forbore',
-    'force-fed',
-    'forcefulness',
-    'fore-edge',
-    'forearmed',
-    'forelimbs',
-    'forelock',
-    'foreshadows',
-    'forfarshire',
-    'forfeits',
-    'forget-me-not',
-    'forgoing',
-    'formatter',
-    'fornara',
-    'forskolin',
     'fortepiano',
-    'fortifying',
-    'fortress-monastery',
-    'fos',
-    'four-dimensional',
-    'four-inch',
-    'four-month-old',
-    'fourniers',
-    'fowler-troon',
-    'foxhounds',
-    'fpc',
-    'fptp',
-    'fraenkel',
-    'fragonard',
-    'framemaker',
-    'francorum',
     'franke',
-    'frano',
-    'frasque',
-    'fraternities',
-    'fratton',
-    'fraudster',
-    'frayn',
-    'frcn',
-    'frear',
-    'frears',
-    'fredericks',
-    'free-draining',
-    'free-form',
-    'freeland',
-    'freeways',
-    'frei',
     'frequents',
-    'freshener',
-    'fribbins',
-    'friedrichstrasse',
-    'frisk',
-    'frisked',
-    'fritters',
-    'frivolously',
-    'frizz',
-    'frns',
-    'fro-ing',
-    'frocester',
-    'frogmarched',
-    'frogmore',
-    'frolicking',
-    'frontenac',
     'frosterley',
-    'frumpy',
-    'frunze',
-    'frustratedly',
-    'fse',
-    'ft/min',
-    'ftp',
-    'fuckers',
-    'fuddy-duddy',
-    'fugues',
-    'fukuyama',
-    'fulfillment',
-    'full-fat',
-    'full-screen',
-    'fullonica',
-    'fulminating',
     'fumbles',
-    'funakoshi',
-    'fungible',
-    'funnelling',
-    'furnishers',
-    'furse',
-    'fussell',
-    'fustian',
-    'futon',
-    'futurity',
-    'g&eacute;rard',
-    'g\'s',
-    'g-c',
-    'g.k.',
-    'g/t',
-    'g9',
     'gabble',
-    'gabriele',
-    'gadaffi',
-    'gadarene',
-    'gadd',
-    'gaelic-speaking',
-    'gagarin',
-    'galatasaray',
-    'galilei',
-    'galium',
-    'galla',
-    'gallaher',
-    'gallanach',
-    'gallardo',
-    'galled',
-    'galli&eacute;ni',
     'gallo',
-    'gambon',
-    'gans',
-    'gantries',
-    'gapes',
-    'gar',
-    'garber',
-    'garbutt',
-    'garman',
-    'garotting',
-    'garsington',
-    'gascons',
-    'gasset',
-    'gasthaus',
-    'gastrooesophageal',
-    'gatcombe',
     'gatherer',
-    'gaudi',
-    'gauloise',
-    'gavarnie',
-    'gavaskar',
-    'gawped',
-    'gawthorpe',
-    'gayoom',
-    'gaz',
-    'gazzaniga',
-    'gbagbo',
-    'gca',
-    'geac',
-    'geddit',
-    'geek',
-    'gees',
     'geest',
-    'geis',
-    'genealogist',
-    'generale',
-    'geniality',
-    'genito-urinary',
-    'genitourinary',
-    'gentian',
-    'geoffroy',
-    'geophysicist',
-    'gep',
-    'geraci',
-    'geremek',
-    'gerlach',
-    'german-born',
-    'germania',
     'gerontion',
-    'gerontology',
-    'gertlinger',
-    'geschichte',
-    'gesticulated',
-    'get-out',
-    'get-togethers',
-    'ggfhbs5',
-    'ggfs',
-    'gheorghe',
-    'ghosted',
-    'giardini',
-    'gibbered',
-    'gibe',
-    'gigolo',
-    'gill-net',
     'gillam',
-    'gillman',
-    'gilsland',
-    'gimcrack',
-    'gimenez',
-    'gimmer',
-    'ginger-haired',
-    'ginormous',
-    'girardelli',
-    'girding',
-    'girdled',
-    'girdlestone',
-    'girouard',
-    'girths',
-    'gismondi',
-    'gissing',
     'giveaways',
-    'givens',
-    'giverny',
-    'gla',
-    'glace',
-    'glaciated',
-    'glaciations',
-    'gladstonian',
-    'glancey',
-    'glans',
-    'glarus',
-    'glassfish',
-    'glenburrell',
-    'glencairn',
-    'glennon',
-    'glimpsing',
     'glistens',
-    'glockenspiel',
-    'glottal',
-    'glumdalclitch',
-    'glur',
-    'gna',
-    'gnomic',
-    'gnosticism',
-    'gnostics',
-    'go-betweens',
-    'goal-kicking',
-    'goan',
-    'gobi',
-    'goblander',
-    'godiva',
-    'godley',
     'godzilla',
-    'gogar',
-    'gogarth',
-    'going-away',
-    'goldeneye',
-    'goldin',
-    'goldstar',
-    'goldwater',
-    'golf-club',
-    'goma',
-    'gondii',
-    'good-for-nothing',
-    'good-time',
-    'goodenough',
-    'goodey',
-    'goodfellas',
     'goodlad',
-    'goodson',
-    'goodwin/gloucester',
-    'gordons',
-    'gordonstoun',
-    'gorgeously',
-    'gossard',
-    'gott',
-    'gottlieb',
-    'gottwald',
-    'gougers',
-    'gouldner',
-    'goult',
-    'gourds',
-    'gouzenko',
-    'gowers',
     'gpu',
-    'graben',
-    'gracing',
-    'grammaticality',
-    'grampians',
-    'grampus',
-    'granard',
-    'grandmet',
-    'granodiorite',
-    'graptolite',
-    'gratifications',
-    'gravediggers',
-    'graven',
-    'graydon',
-    'greasing',
-    'greatbatch',
     'greatham',
-    'greek-cypriot',
-    'greeley',
-    'green-fingered',
-    'greengross',
-    'greenkeeper',
-    'greenstone',
-    'greenwell',
-    'greeny',
-    'greiner',
-    'grenadine',
-    'gresford',
-    'grete',
-    'gretton',
-    'grey-blue',
-    'gridded',
     'grindstone',
-    'grisedale',
-    'grits',
-    'grob',
-    'grommet',
-    'grosmont',
-    'grosse',
-    'grosser',
-    'grossing',
-    'grosso',
-    'groundmass',
-    'groupwork',
-    'grrr',
-    'grye',
-    'gryphon',
-    'gsp',
     'guar',
-    'guardroom',
-    'guava',
-    'gubb',
-    'guentchev',
-    'guesclin',
-    'guest-house',
-    'guesting',
-    'guff',
-    'guide-book',
-    'guilford',
-    'guinea-pig',
-    'guinean',
-    'gujarati',
-    'gujerati',
-    'gulfs',
     'gulleys',
-    'gumbo',
-    'gumboots',
-    'gumption',
-    'gun-toting',
-    'gunboats',
-    'gunfight',
-    'gunther',
-    'guo',
-    'gurgles',
-    'guylines',
-    'guzzling',
-    'gymnast',
-    'gyrating',
-    'gyrus',
-    'h.q.',
     'h6',
-    'ha&ccedil;ienda',
-    'haan',
-    'haarlem',
-    'haberdasher',
-    'haddenham',
-    'haematuria',
-    'haemophiliac',
-    'hair-do',
-    'hairdryers',
-    'halberdiers',
-    'half-expected',
-    'half-landing',
-    'half-lives',
-    'half-mast',
-    'half-witted',
     'halftime',
-    'halkopous',
-    'halleluja',
-    'halles',
-    'hallidayan',
-    'hallin',
-    'hallow',
-    'hallstein',
-    'haloed',
-    'haloes',
-    'halpin',
-    'halstock',
-    'halyard',
-    'ham-fisted',
-    'hamdan',
-    'hamilton-phillips',
     'hamza',
-    'hand-loom',
-    'handbill',
-    'handcart',
-    'handcrafted',
-    'handford',
-    'handsomest',
-    'hannan',
-    'hannigan',
-    'hanoverians',
-    'hanvey',
-    'hap',
-    'harangued',
-    'hard-liners',
-    'hard-on',
-    'harddisk',
     'hare-brained',
-    'harfleur',
-    'hariri',
-    'harle',
-    'harmsworth',
-    'harrap',
-    'harringtons',
-    'harrop',
-    'harrowgate',
-    'hart-davis',
-    'hartburn',
-    'hartston',
-    'harz',
-    'hassling',
-    'hatchard',
-    'hatchbacks',
     'hatchway',
-    'hauptmann',
-    'hause',
-    'hawked',
-    'hawksley',
-    'hayfever',
-    'hayle',
-    'hcp',
-    'he-man',
-    'headbands',
-    'headlam',
-    'headsail',
-    'headstart',
-    'headvoice',
-    'healthmaster',
-    'heart-beat',
     'hearthware',
-    'heartlessly',
-    'heartwarming',
-    'heaven-sent',
-    'heavenward',
-    'heavy-based',
-    'hebbert',
-    'hedilla',
-    'heeding',
-    'heffernan',
-    'heilbron',
-    'heiton',
-    'hellenes',
-    'hellespont',
-    'hellinckx',
-    'hellman',
     'helsby',
-    'helston',
-    'heminges',
-    'hen-house',
-    'hendrik',
-    'heneage',
-    'hengist',
-    'hensley',
-    'herbalist',
-    'herbivory',
-    'herby',
-    'herefords',
-    'hernando',
-    'hero-worship',
-    'herren',
-    'herringman',
     'heshang',
-    'heterodox',
-    'heterosexually',
-    'hewart',
-    'hexadecimal',
-    'hexagram',
-    'hezarfen',
-    'hezb-e',
-    'hh',
-    'hiatt',
-    'hiccough',
-    'hierarchic',
-    'hieroglyphs',
-    'high-fat',
-    'high-flier',
-    'high-flyer',
     'high-income',
-    'high-water',
-    'high-yielding',
-    'highly-paid',
-    'highpoint',
-    'hiked',
-    'hiller',
-    'hillyard',
-    'hilts',
-    'hindle',
-    'hine',
-    'hinks',
-    'hippias',
-    'hippocratic',
-    'hippolytus',
-    'hiroshi',
     'hiscock',
-    'histoire',
-    'historiographical',
-    'hit-list',
-    'hitters',
-    'hla-b35',
-    'hnatiuk',
-    'hohenstaufen',
-    'hohenzollern',
-    'hoi_polloi',
-    'hoists',
-    'hola',
-    'holbrooke',
-    'holiday-maker',
-    'hollander',
-    'hollering',
     'hollow-eyed',
-    'holly-jack',
-    'holmfirth',
-    'holmroyd',
-    'holtby',
-    'holyoak',
-    'hom',
-    'homburg',
-    'home-coming',
-    'home/school',
-    'homebuilt',
-    'homecover',
-    'homemaker',
-    'homeotherms',
-    'homewards',
-    'homeworking',
     'homophonic',
-    'honegger',
-    'honeycombed',
-    'honk',
-    'honorifics',
-    'honved',
-    'hoo-woo',
-    'hoon',
-    'hopps',
-    'hoppy',
-    'horemheb',
-    'horn-rimmed',
-    'hornbeam',
-    'hornpipe',
-    'hornsby',
-    'horridge',
     'horseferry',
-    'horseriding',
-    'horsfall',
-    'hosta',
-    'hostelries',
-    'hot-blooded',
-    'hot-dog',
-    'hot-spot',
-    'hoult',
-    'housemartins',
-    'houseplant',
-    'housewifery',
-    'howitzers',
-    'howley',
-    'hows',
-    'hox',
     'hox-b1',
-    'hoyte',
-    'hp4',
-    'hrolf',
-    'hsdr',
-    'huggy',
-    'hughey',
-    'huguenots',
-    'huissier',
-    'huistra',
-    'hula',
-    'humaniores',
-    'humanness',
-    'hummocks',
-    'hunching',
-    'hundredfold',
     'hungover',
-    'hunter-gatherers',
-    'hup',
-    'hurst/gloucester',
-    'hussar',
-    'husserl',
-    'hustlers',
-    'hw',
-    'hwicce',
-    'hydrogels',
-    'hydrogen-bonds',
-    'hydrographic',
-    'hydrophilic',
-    'hydrophobicity',
-    'hydroxides',
-    'hygienically',
     'hyland',
-    'hymnody',
-    'hyong',
-    'hyperplastic',
-    'hyperspace',
-    'hypertonic',
-    'hypoalbuminaemia',
-    'hypobiosis',
-    'hyponym',
-    'i.b.c.',
-    'iacocca',
-    'ibc',
-    'ic3',
-    'icarus',
-    'ice-bound',
-    'ice-cap',
     'ice-sheet',
-    'ichiro',
-    'ichthus',
-    'icicle',
-    'idea-handling',
-    'idealize',
-    'identifier/title',
-    'idolized',
-    'igfbp-1',
-    'igg2',
-    'iglesias',
-    'ignatieff',
-    'ignoramus',
-    'iguanas',
-    'ih',
-    'ikon',
     'ileitis',
-    'ilex',
-    'ilie',
-    'ill-served',
-    'illusionism',
-    'imamu',
-    'imbricating',
-    'imho',
-    'immanence',
-    'immaterialism',
-    'immobilise',
-    'immobilising',
-    'immunoblotting',
-    'immunologically',
-    'immunoprecipitation',
-    'immunostaining',
     'impaling',
-    'impatiens',
-    'imperilled',
-    'implementers',
-    'imploringly',
-    'imponderable',
-    'import/export',
-    'impost',
-    'imposter',
-    'impoverish',
-    'impracticability',
-    'imprecations',
-    'improvers',
-    'improvident',
-    'imps',
-    'in-bureau',
     'in-migration',
-    'in-school',
-    'in_favor_of',
-    'in_quest_of',
-    'inactivate',
-    'inanely',
-    'inanity',
-    'inanna',
-    'inchcape',
-    'incompatibilities',
-    'incompetents',
-    'incomprehensibly',
-    'inconsistently',
-    'indemnifier',
-    'indenbaum',
-    'indentured',
     'independent-minded',
-    'indescribably',
-    'indistinctly',
-    'indo',
-    'indubitable',
-    'inductivists',
-    'industrializing',
-    'industriously',
-    'inextricable',
-    'infestations',
-    'infidelities',
-    'infilled',
-    'infiltrators',
-    'infinitival',
-    'inflight',
-    'info.',
     'information-seeking',
-    'informatique',
-    'infractions',
-    'infrasound',
-    'infuriates',
-    'infusoria',
-    'ingleston',
-    'ingolstadt',
-    'inhomogeneous',
-    'inhouse',
-    'inhumation',
-    'innervated',
-    'inning',
-    'innit',
-    'innuendos',
-    'inside-forward',
     'inside-out',
-    'insole',
-    'instal',
-    'instanced',
-    'instantiate',
-    'institutionalise',
-    'insufferably',
-    'intellectualism',
-    'intelligence-gathering',
-    'inter-republican',
-    'interchangeability',
-    'interestedly',
-    'interferometer',
-    'intergalactic',
-    'interlining',
-    'intermittency',
     'interneurons',
-    'interpose',
-    'intertemporal',
-    'intertwine',
-    'intimidatory',
-    'intra-abdominal',
-    'intracerebroventricular',
-    'introversion',
-    'intv',
-    'inured',
-    'invercargill',
-    'invesco',
-    'investitures',
-    'invicta',
-    'invictus',
-    'invigilator',
     'invitational',
-    'inwardness',
-    'ionians',
-    'ionosphere',
-    'iraqgate',
-    'irchester',
-    'irenius',
-    'irix',
-    'iron-age',
-    'ironmaster',
-    'irrawaddy',
-    'irrelevancies',
-    'irremediable',
-    'irresolute',
-    'irreverently',
-    'is-lm',
     'isaacson',
-    'isothermal',
-    'issa',
-    'isuzu',
-    'isv',
-    'itches',
-    'itel',
-    'itgwu',
-    'itinerants',
-    'itoh',
-    'ivel',
-    'ixos',
-    'iznik',
-    'j.t.',
-    'jabber',
-    'jacek',
     'jacobin',
-    'jaderow',
-    'jagatan',
-    'jailhouse',
-    'jal',
-    'jamal',
-    'jamel',
-    'janissaries',
-    'janneau',
-    'japanese-style',
-    'jaramillo',
-    'jaromil',
-    'jawbone',
-    'jazzie',
-    'jean-bertrand',
-    'jeeta',
     'jelinek',
-    'jellied',
-    'jenrette',
-    'jens',
-    'jet-lagged',
-    'jethro',
-    'jf',
-    'ji',
-    'jiggling',
-    'jigme',
-    'jingoism',
-    'jinnah',
-    'jiving',
-    'job-sharing',
-    'jocularly',
-    'johnson-laird',
     'johnsonian',
-    'joinville',
-    'jordaens',
-    'jorvik',
-    'joujou',
-    'jovellanos',
-    'jowell',
-    'joyces',
-    'jr.',
-    'ju87s',
-    'ju88s',
-    'jubilate',
-    'juddered',
-    'jugglers',
-    'jugoslavia',
-    'julians',
     'july-august',
-    'jumpsuit',
-    'junctional',
-    'june/july',
-    'jungfrau',
-    'jungian',
-    'junor',
-    'justiciary',
-    'justificatory',
-    'justitie',
-    'justtext',
-    'juv&eacute;nal',
-    'juxtapose',
-    'k!sdra',
-    'kachin',
-    'kadijevic',
     'kaduna',
-    'kairos',
-    'kalashnikovs',
-    'kalb',
-    'kalms',
-    'kampfner',
-    'kamuzu',
-    'kanga',
-    'kanji',
-    'kanter',
-    'kanunname',
-    'kaohsiung',
-    'karabiner',
-    'karl-heinz',
-    'karol',
-    'kartoffel',
     'kasner',
-    'kaszubes',
-    'kaszubians',
-    'katia',
-    'kato',
-    'katrine',
-    'kauai',
-    'kauntze',
-    'kautsky',
-    'kbs',
-    'kcb',
-    'kcmg',
-    'keach',
-    'kebbel',
-    'kedleston',
-    'keelan',
     'keeled',
-    'keels',
-    'keifer',
-    'keitel',
-    'keith-lucas',
-    'kelburne',
-    'kelsen',
-    'kenan',
-    'kendo',
-    'keneally',
-    'kenner',
-    'kenney',
-    'kentigern',
-    'kep',
-    'keppel',
-    'ker',
     'keren',
-    'kerton',
-    'kesk',
-    'kettlewell',
-    'keystroke',
-    'khaleda',
-    'khalili',
-    'khamtay',
-    'khat',
-    'kibble',
-    'kickers',
-    'kiddie',
-    'kilbrandon',
-    'kilcline',
-    'killeen',
-    'killigrew',
     'killingworth',
-    'killjoy',
-    'kilmer',
-    'kilmuir',
-    'kilroy',
-    'kimmy',
-    'kincaid',
-    'kine',
-    'king-sized',
-    'kingham',
-    'kinlochewe',
-    'kippur',
-    'kirchberg',
-    'kiri',
-    'kirkbymoorside',
-    'kirkcudbright',
     'kirkley',
-    'kirkup',
-    'kisser',
-    'kiteline',
-    'kittiwake',
-    'kitto',
-    'klass',
-    'klaxon',
-    'klimt',
-    'kluck',
-    'knatchbull',
-    'kneed',
-    'knoedler',
-    'knollys',
-    'knowingness',
-    'knowledgeware',
     'knowlton',
-    'knoydart',
-    'knu',
-    'kocinski',
-    'kode',
-    'kokoschka',
-    'kola',
-    'kom',
-    'kopp',
-    'koranic',
-    'koreas',
-    'kossoff',
-    'kossuth',
-    'kovacks',
-    'kprp',
-    'krafft-ebing',
     'krajicek',
-    'kraprayoon',
-    'krause',
-    'kravis',
-    'kreuzberg',
-    'kribensis',
-    'krip-toe-korin',
-    'kristallnacht',
-    'kropotkin',
-    'kruskal-wallis',
-    'kryptonite',
-    'ksa',
-    'kuiper',
-    'kureishi',
-    'kurgan',
-    'kurile',
     'kwangju',
-    'kyalami',
-    'kylesku',
-    'kyowa',
-    'l\'amour',
-    'l\'est',
-    'l5',
-    'lachesis',
-    'lackey',
-    'lacma',
-    'lactating',
-    'ladies-in-waiting',
-    'laffer',
-    'lafferty/gloucester',
-    'lam&eacute',
-    'lamacq',
     'lamellae',
-    'lamerie',
-    'lamp-posts',
-    'lampeter',
-    'lampoon',
-    'lampposts',
-    'lancome',
-    'landing-stage',
-    'landlordism',
-    'landsats',
-    'landseer',
-    'langney',
-    'langridge',
-    'languishes',
-    'lanhydrock',
-    'lansley',
     'lap-top',
-    'lapps',
-    'lar',
-    'larders',
-    'larissa',
-    'larrain',
-    'lascelles',
-    'lassiter',
-    'lastability',
-    'late-victorian',
-    'latencies',
-    'laterals',
-    'laths',
-    'lathwell',
-    'latifundia',
-    'latin-american',
     'laundrette',
-    'lav',
-    'lavaux',
-    'laver',
-    'laverty',
-    'lawbreakers',
-    'lawnmarket',
-    'lawnmowers',
-    'laws-of-war',
-    'layabout',
-    'layback',
-    'lazard',
-    'lazaris',
-    'lazed',
-    'lda',
-    'leahy',
     'leaseholds',
-    'leathart',
-    'leavened',
-    'leavy',
-    'lechery',
-    'lechlade',
-    'leckey',
-    'ledbury',
-    'leeds-united',
-    'leeman',
-    'left-foot',
-    'leftward',
-    'legalities',
-    'legered',
-    'legionella',
-    'legitimates',
     'legitimised',
-    'legitimising',
-    'legitimization',
-    'legroom',
-    'leguminous',
-    'lehzen',
-    'leiston',
-    'leitmotifs',
-    'leitzig',
-    'lelong',
-    'lemond',
-    'leni',
-    'lenton',
-    'leoni',
-    'leprous',
-    'lettice',
     'leu',
-    'leukemia',
-    'leukocyte',
-    'levantine',
-    'level-crossing',
-    'leverrier',
-    'levington',
-    'levites',
-    'levon',
-    'lewitt',
-    'lewontin',
-    'lexicography',
-    'leyland-daf',
-    'lgc',
-    'liaises',
-    'lianne',
     'lib-dem',
-    'liban',
-    'liberal-minded',
-    'liberalized',
-    'libet',
-    'libf',
-    'libran',
-    'library&dollar;disk',
-    'librettos',
-    'libreville',
-    'libro',
-    'licencing',
-    'licentiousness',
-    'life-expectancy',
-    'life-forms',
-    'life-saver',
     'life-sized',
-    'lifesize',
-    'liffey',
-    'light-heartedly',
-    'lignocaine',
-    'likening',
-    'likert',
-    'lilov',
-    'limited-overs',
-    'lindbergh',
-    'linde',
-    'lindi',
-    'lindos',
-    'line-outs',
-    'line-ups',
-    'lineal',
     'lineen',
-    'lineside',
-    'lingdale',
-    'lingeringly',
-    'linkers',
-    'linklater',
-    'lipoxygenase',
-    'lipreading',
-    'liquified',
-    'lisboa',
-    'lithograph',
-    'littermates',
-    'littleton',
-    'liverpool-born',
-    'liveseys',
-    'llambias',
     'llanidloes',
-    'llanthony',
-    'llewellyn-jones',
-    'lm1',
-    'lme',
-    'loadsamoney',
-    'loafer',
-    'loams',
-    'loaning',
-    'loathes',
-    'lobbing',
-    'lobkovic',
-    'lobs',
-    'lodes',
-    'lodging-house',
-    'lodz',
     'loehr',
-    'loftier',
-    'logger',
-    'logitech',
-    'loincloth',
-    'lol',
-    'lolloping',
-    'lom',
-    'lomellini',
-    'lon',
-    'london-brabant',
-    'long-firm',
-    'long-gone',
-    'long-life',
-    'long-net',
-    'longbow',
     'longthorne',
-    'look-in',
-    'lookouts',
-    'loose-fitting',
-    'loose-limbed',
-    'lopping',
-    'lordy',
-    'losberne',
-    'louis-dreyfus',
-    'louis-philippe',
-    'loutish',
-    'louvain',
-    'love-hate',
-    'love-nest',
-    'lovebirds',
-    'lovin\'',
     'low-life',
-    'low-powered',
-    'low-pressure',
-    'low-price',
-    'low-priced',
-    'lowdown',
-    'lower-income',
-    'lowes',
-    'lowing',
-    'lowish',
-    'lowlanders',
-    'loxton',
-    'loyd',
-    'lpo',
-    'lro',
-    'lslive',
     'lst',
-    'lsurrna',
-    'lubin',
-    'lucaroni',
-    'lucknow',
-    'lucretia',
-    'lufc',
-    'lufkin',
-    'lukyanov',
-    'lumumba',
-    'luncheons',
-    'lunt',
-    'luo',
-    'lurchers',
-    'lusted',
-    'lutterworth',
     'luzon',
-    'lydian',
-    'lydiard',
-    'lyfing',
-    'lymphadenopathy',
-    'lymphoblastic',
-    'lynching',
-    'lynchpin',
-    'lyness',
-    'lyra',
-    'lysed',
-    'lysette',
-    'm&eacute;tier',
-    'm&yacute;vatn',
-    'm\'s',
-    'm.c.',
     'm.p.h',
-    'm20',
-    'm7',
-    'ma(general)',
-    'ma(honours)',
-    'macallister',
-    'macaws',
-    'macedo',
-    'macgillivray',
-    'macgowan',
-    'mackintoshes',
-    'mackman',
-    'mackmurdo',
-    'macnab',
-    'macnamara',
-    'macrobert',
     'macrory',
-    'madrigalian',
-    'mafart',
-    'maggott',
-    'maggs',
-    'magnesia',
-    'magnesian',
-    'magnetised',
-    'magnetometer',
-    'magnetron',
-    'magniac',
-    'magnifies',
-    'mahabharata',
-    'mahe',
-    'maiming',
-    'mainlan',
     'maintenance-free',
-    'majorism',
-    'malam',
-    'malcolmson',
-    'malden',
-    'malevich',
-    'malevolently',
-    'malformed',
-    'malkovich',
-    'mallarm&eacute',
-    'mallerstang',
-    'mallets',
-    'mallion',
-    'malpractices',
-    'mamaloni',
-    'mammal-like',
     'mammoths',
-    'man-management',
-    'manacles',
-    'mancarelli',
-    'manderley',
-    'mangles',
-    'mannesmann',
-    'manny',
-    'mansel',
-    'manta',
-    'mantelshelf',
-    'manufactories',
-    'manwaring',
-    'many-sided',
-    'march-april',
-    'mardi',
     'mardon',
-    'marenzio',
-    'margaux',
-    'marginalize',
-    'marienburg',
-    'marillion',
-    'marini',
-    'marioc',
-    'marionettes',
-    'maritz',
-    'market-driven',
-    'markethill',
-    'marketmakers',
-    'markka',
-    'marksmanship',
-    'marmi',
     'marnier',
-    'marriot',
-    'marta',
-    'martello',
-    'martin-jenkins',
-    'maru',
-    'mary-lou',
-    'mask-like',
-    'mass.',
-    'massie',
-    'masterwork',
-    'mastiff',
-    'masturbated',
-    'match-play',
-    'match-winner',
-    'matcham',
     'matchmaking',
-    'matiba',
-    'matin',
-    'matriarch',
-    'matson',
-    'matt.',
-    'mauleverer',
-    'mauroy',
-    'max.',
-    'maxillary',
-    'maxime',
-    'maxwells',
-    'mayfest',
-    'mayflies',
-    'mayfly',
-    'mayli',
     'mayoralty',
-    'maythorpe',
-    'mbb',
-    'mbeki',
-    'mbs',
-    'mcaleese',
-    'mccartan',
-    'mccausland',
-    'mcdaid',
-    'mcglashan',
-    'mcglinchey',
-    'mcgonagle',
-    'mcgough',
-    'mcgrady',
-    'mcinally',
-    'mckeag',
     'mckie',
-    'mckinsey-ge',
-    'mckinstry',
-    'mclaggan',
-    'mclellan',
-    'mcmichael',
-    'mcmunn',
-    'mcp',
-    'mcrobbie',
-    'mcsharry',
-    'mctt',
-    'mcvie',
-    'mcwilliam',
-    'me-10',
-    'meanderings',
-    'measurably',
     'meatballs',
-    'mechanicals',
-    'medved',
-    'meeks',
-    'megacolon',
-    'megadrive',
-    'megawatt',
-    'meghalaya',
-    'meguid',
-    'meirionnydd',
-    'meistersinger',
-    'melanesians',
-    'mellifluous',
-    'mellissa',
-    'mellowes',
-    'mellowing',
     'member-states',
-    'menarche',
-    'mendeleev',
-    'mendicant',
-    'meng',
-    'meninas',
-    'menu-driven',
-    'menuetto',
-    'meriden',
-    'merovech',
-    'merrivale',
-    'mesne',
-    'messieurs',
-    'metabolised',
-    'metabolising',
-    'metal-working',
     'metalliferous',
-    'metallurgist',
-    'metastability',
-    'metazoans',
-    'meteorologists',
-    'methyltransferase',
-    'metrolink',
-    'meurs',
-    'meursault',
-    'mg/',
-    'michiko',
-    'mickie',
-    'micra',
-    'micro-electronics',
-    'microdialysis',
-    'microenvironment',
     'microflora',
-    'microgenesys',
-    'micromuse',
-    'microprocessor-based',
-    'microwaved',
-    'micturition',
-    'mid-\'60s',
-    'midden',
-    'middenland',
-    'middlewich',
-    'midshipmen',
-    'mii',
-    'mijnheer',
-    'mikila',
-    'milettis',
-    'milieux',
     'militarization',
-    'military-style',
-    'millbrook',
-    'milliner',
-    'millipedes',
-    'milln',
-    'milos',
-    'milosh',
-    'mim',
-    'minas',
-    'mindedness',
-    'mineralised',
-    'minford',
-    'minginish',
-    'mini-budget',
-    'mini-golf',
     'miniaturist',
-    'minimization',
-    'minitab',
-    'minitel',
-    'miniver',
-    'minting',
-    'mintzberg',
-    'miocenia',
-    'mirabilis',
-    'miracle-worker',
-    'misapplied',
-    'miscarry',
-    'mischa',
-    'miscreant',
-    'misjudgment',
-    'misleads',
     'mismatched',
-    'missio',
-    'mission-critical',
-    'misspelt',
-    'misstatement',
-    'mistimed',
-    'misunderstands',
-    'mk2',
-    'ml/min',
-    'mlp',
-    'mn/m',
-    'mnarja',
-    'mo\'',
-    'moab',
-    'mobster',
-    'mockingbird',
     'moggach',
-    'mohawks',
-    'mohican',
-    'moin',
-    'moistening',
-    'mollis',
-    'moloney',
-    'mommy',
-    'monck',
-    'money-saving',
-    'moneylender',
-    'monochromatic',
-    'monocular',
-    'monocultures',
-    'monophosphate',
-    'monopolisation',
     'monopolising',
-    'monorail',
-    'monosyllable',
-    'monozygotic',
-    'monpazier',
-    'monstrosities',
-    'montefiore',
-    'montepulciano',
-    'moonbeam',
-    'moonbeams',
-    'mopsa',
-    'mora',
-    'morale-boosting',
-    'moreira',
-    'morgen',
-    'morphia',
     'morphogenetic',
-    'mortalities',
-    'mortared',
-    'mortgaging',
-    'mortis',
-    'moscovitch',
-    'mosul',
-    'mother-of-three',
-    'motorboat',
-    'motorcars',
-    'mots',
-    'moughton',
-    'moulder',
-    'mountain-top',
-    'mousses',
-    'moustaine',
     'mp/labour',
-    'mpeg',
-    'mrcs',
-    'msg',
-    'mts',
-    'mtwtv',
-    'mu/l',
-    'muccio',
-    'much-quoted',
-    'much-respected',
-    'muezzin',
-    'mujahideen',
-    'mulches',
-    'mulching',
-    'mullach',
-    'mulm',
     'multi-faith',
-    'multi-function',
-    'multi-skilled',
-    'multi-threading',
-    'multicurrency',
-    'multifunctional',
-    'multilateralism',
-    'multilevel',
-    'multiple-choice',
-    'multiplications',
-    'multipliers',
-    'multiproduct',
-    'multiuser',
-    'multiview',
-    'mun',
-    'muncaster',
     'munificence',
-    'muppets',
-    'murat',
-    'mures',
-    'muscly',
-    'muscovites',
-    'mustangs',
-    'musters',
-    'mutability',
-    'mutable',
-    'mutational',
-    'muvver',
-    'muzzling',
-    'my/our',
-    'myasthenia',
-    'myelin',
     'myitkyina',
-    'myocardium',
-    'n\'est',
-    'n-gram',
-    'n.s.',
-    'n79',
-    'n=7',
-    'nacionalista',
-    'nakamura',
-    'nama',
-    'name&gt',
-    'namoi',
-    'nance',
-    'nanjing',
-    'napo',
-    'narnia',
     'narrate',
-    'narrow-gauge',
-    'nasturtium',
-    'nationalisms',
-    'nationalize',
-    'nationalizing',
-    'nationaux',
-    'natriuretic',
-    'nattering',
-    'nautiloids',
-    'navaho',
-    'navigations',
-    'naville',
-    'nazaire',
-    'nazca',
-    'nccl',
     'ndb',
-    'near-monopoly',
-    'nebamun',
-    'needle-like',
-    'neeld',
-    'negev',
-    'negligee',
-    'negroid',
-    'neigh',
-    'neo-classicism',
-    'neoprene',
-    'neretva',
-    'nescaf&eacute',
-    'net2',
-    'neuralgia',
-    'neurosurgeon',
     'neurosurgical',
-    'neutralist',
-    'never-never',
-    'nevile',
-    'newel',
-    'newlove',
-    'newsdesk',
-    'newsreaders',
-    'newtons',
-    'nfa',
-    'ngune',
-    'ni-night',
-    'nicety',
-    'nicolaus',
-    'nicolette',
-    'nid',
     'niello',
-    'nifedipine',
-    'nig',
-    'night-life',
-    'night-light',
-    'nighties',
-    'nightjar',
-    'nightshift',
-    'nihilists',
-    'nijmegen',
-    'nimes',
-    'nine-to-five',
-    'niner',
-    'nineteens',
-    'nineveh',
-    'ninny',
     'nithsdale',
-    'nitroprusside',
-    'nivelle',
-    'nns',
-    'no-frills',
-    'no-win',
-    'nobbled',
-    'nobodies',
-    'noggin',
-    'noguchi',
-    'noiseless',
-    'nolde',
-    'nominates',
-    'non-acceptance',
-    'non-accidental',
-    'non-believers',
     'non-empty',
-    'non-experimental',
-    'non-finite',
-    'non-fossil',
-    'non-german',
-    'non-gonococcal',
-    'non-ideal',
-    'non-inflationary',
-    'non-insulin-dependent',
-    'non-japanese',
-    'non-life',
-    'non-linearity',
-    'non-living',
-    'non-married',
-    'non-muslim',
-    'non-past',
     'non-person',
-    'non-qualifying',
-    'non-sailing',
-    'non-speaking',
-    'non-taxpayers',
-    'non-work',
-    'nonsexist',
-    'nonstandard',
-    'norham',
-    'normand',
-    'normande',
-    'norsemen',
-    'north/south',
-    'northcote',
-    'northrop',
-    'nose-down',
     'nosedive',
-    'not-for-profit',
-    'notaries',
-    'noth',
-    'nourishes',
-    'novi',
-    'npl',
-    'nuanced',
-    'nudist',
-    'nuit',
-    'nullifying',
-    'number-one',
-    'numberless',
-    'numeroso',
-    'nunavut',
-    'nureyev',
     'nurseryman',
-    'nutritive',
-    'nvocc\'s',
-    'nyunt',
-    'o&amp;y',
-    'o\'doherty',
-    'o\'donovan',
-    'oaken',
-    'oakwood',
-    'obliterates',
-    'observables',
-    'obviated',
-    'occhi',
-    'occupationally',
-    'ochs',
-    'oclc',
     'octavo',
-    'octel',
-    'odometer',
-    'oesophagopharyngeal',
-    'off-the-cuff',
-    'off-the-job',
-    'off-the-shoulder',
-    'offenbach',
-    'offerors',
-    'office-holder',
-    'offloading',
-    'ofgas',
-    'ofr',
-    'oft-repeated',
-    'oggy',
-    'ohp',
     'oilmen',
-    'ointments',
-    'okavango',
-    'okey-dokey',
-    'old-boy',
-    'old-growth',
-    'oldbury',
-    'oligomers',
-    'oliveira',
-    'oloron',
-    'olsalazine',
-    'olwen',
-    'omaha',
-    'omnes',
-    'omnibuses',
-    'omt',
     'on-exchange',
-    'oncogene',
-    'ondrus',
-    'one-bedroomed',
-    'one-design',
-    'one-inch',
-    'one-on-one',
-    'one-page',
-    'one-thirty',
-    'one-upmanship',
-    'one-word',
-    'ongo',
-    'onrush',
-    'onsite',
-    'onslaughts',
-    'open-sided',
     'openagent',
-    'operculum',
-    'ophioprium',
-    'ophthalmologist',
-    'oporto',
-    'opp',
-    'optima',
-    'oralism',
-    'orange-yellow',
-    'orangutan',
-    'orbiter',
-    'orbs',
-    'ord&oacute&ntilde;ez',
-    'ordainers',
-    'orderings',
-    'ordinate',
     'ordure',
-    'organisationally',
-    'organon',
-    'organza',
-    'orgreave',
-    'orientalist',
-    'orman',
-    'ormondroyd',
-    'orsett',
-    'orynthia',
-    'osbourne',
-    'oscillated',
-    'oscillators',
-    'oscillatory',
-    'oso',
-    'ospreys',
     'osric',
-    'ossian',
-    'ost',
-    'osteoarthritis',
-    'osteopath',
-    'ostland',
-    'osyth',
-    'otello',
-    'oualie',
-    'ousley',
-    'out-of-bounds',
-    'out-of-control',
-    'out-of-pocket',
-    'outcidence',
-    'outcries',
-    'outflank',
     'outgrew',
-    'outgrowths',
-    'outlasted',
-    'outmanoeuvre',
-    'outperforms',
-    'output-capital',
-    'outside-right',
-    'outworking',
-    'outworn',
-    'over-60s',
-    'over-arching',
-    'over-cautious',
-    'over-eager',
-    'over-elaborate',
-    'over-exploitation',
-    'over-extended',
     'over-fishing',
-    'over-long',
-    'over-react',
-    'over-ride',
-    'over-sized',
-    'over-stretched',
-    'overaccumulation',
-    'overclyst',
-    'overdetermined',
-    'overdeveloped',
-    'overexpression',
-    'overfeed',
-    'overfly',
-    'overhand',
-    'overlie',
-    'overrunning',
     'overstating',
-    'overtired',
-    'overtype',
-    'overwintered',
-    'overwritten',
-    'overy',
-    'oviedo',
-    'owner-occupier',
-    'oxidants',
-    'oxidise',
-    'oximetry',
-    'oxtail',
-    'oxygenation',
-    'ozzy',
-    'p&amp;g',
-    'p.2',
     'p.20',
-    'p.3',
-    'p.4',
-    'p.6',
-    'p.g.',
-    'p.h.',
-    'p.p.m.',
-    'p/b',
-    'p100',
-    'p35',
-    'p46',
-    'p=0.04',
-    'pa05l',
-    'pacta',
-    'padraig',
-    'padstow',
     'paedophilia',
-    'paheri',
-    'paid-for',
-    'pais',
-    'pakeezah',
-    'pakenham',
-    'palings',
-    'palled',
-    'palliatives',
-    'palmed',
-    'palustris',
-    'pamidronate',
-    'panch',
-    'pandemic',
-    'panegyric',
-    'panellists',
     'pangbourne',
-    'pankracova',
-    'pannell',
-    'panniers',
-    'pannone',
-    'pantanal',
-    'panton',
-    'panyarachun',
-    'panzer',
-    'papaya',
-    'pape',
-    'paper-making',
-    'paper-thin',
-    'paperweights',
-    'papist',
-    'para-military',
     'parachutistes',
-    'paragons',
-    'paraguayan',
-    'paramour',
-    'parasitical',
-    'parasitism',
-    'parastatal',
-    'parco',
-    'parenchyma',
-    'parfitt',
-    'paros',
-    'paroxysm',
-    'paroxysms',
-    'parrett',
-    'partially-sighted',
-    'participators',
     'participle',
-    'participles',
-    'partij',
-    'partington',
-    'partook',
-    'party-goers',
-    'pasmore',
-    'passat',
-    'passelewe',
-    'passu',
-    'patchily',
-    'paterfamilias',
-    'pathless',
-    'patinated',
-    'patination',
-    'patisserie',
     'patna',
-    'patria',
-    'patric',
-    'patrington',
-    'patronal',
-    'pauly',
-    'paume',
-    'pavlovian',
-    'paxford',
-    'pb/',
-    'pco',
-    'pcw',
-    'pdg',
-    'peace-loving',
-    'peace-making',
-    'peace-time',
     'peach-coloured',
-    'pearman',
-    'pebbled',
-    'pebbly',
-    'pebs',
-    'pecan',
-    'peckoltia',
-    'pedler',
-    'pedulla',
-    'peephole',
-    'pei',
-    'peinture',
-    'pelleas',
-    'pelleted',
-    'pellucid',
-    'pemex',
     'pen-pals',
-    'pencom',
-    'penetrance',
-    'penology',
-    'pensioned',
-    'pentatonics',
-    'pentax',
-    'pepita',
-    'pepsinogen-i',
-    'perceivable',
-    'perceiver',
-    'percepts',
-    'percipient',
-    'perera',
-    'perfunctorily',
-    'perianal',
     'period-doubling',
-    'perishables',
-    'peristyle',
-    'perking',
-    'permeabilities',
-    'peroration',
-    'perpetrating',
-    'perplex',
-    'perplexities',
-    'perquisite',
-    'persecutors',
-    'person(s)',
-    'personalise',
-    'peskova',
-    'pesth',
-    'petain',
     'petard',
-    'peterken',
-    'petrol-engined',
-    'petrov',
-    'pett',
-    'pettifer',
-    'peveril',
-    'phaeton',
-    'phagocytes',
-    'pharyngeal',
-    'phb',
-    'phds',
-    'pheidias',
-    'phenolic',
-    'phenomenologists',
-    'phials',
     'philadelphus',
-    'philippi',
-    'philologists',
-    'philpot',
-    'phone-calls',
-    'phone-ins',
-    'phonemically',
-    'phony',
-    'phosphorylates',
-    'photocall',
-    'photocells',
-    'photoelectric',
-    'photovoltaic',
-    'phu',
-    'phyllisia',
-    'phys',
     'piaf',
-    'pianissimo',
-    'pianoforte',
-    'piatakov',
-    'pibs',
-    'pick-me-up',
-    'pickling',
-    'picnicked',
-    'pie\'oh\'pah',
-    'piebald',
-    'piechnik',
-    'pieds',
-    'pierces',
-    'pietermaritzburg',
-    'piezo',
-    'piggeries',
     'pikemen',
-    'pilotage',
-    'pimm',
-    'pimple',
-    'pimply',
-    'pincott',
-    'pinking',
-    'pinocchio',
-    'pinpricks',
-    'pinstriped',
-    'pinta',
-    'pinza',
-    'pipe-smoking',
-    'pir',
-    'piranesi',
-    'pirouetted',
     'pistachios',
-    'pistes',
-    'pit-1',
-    'pitchers',
-    'piteously',
-    'pithead',
-    'pithily',
-    'pitkin',
-    'pittston',
-    'pittura',
-    'pizazz',
-    'pizzeria',
-    'pizzicato',
-    'pkb',
-    'pl/i',
-    'place-name',
     'placebos',
-    'placer',
-    'plangent',
-    'plantain',
-    'plantarum',
-    'plataia',
-    'platelet-rich',
-    'platelet-specific',
-    'platies',
-    'platzer',
-    'player-coach',
-    'playne',
-    'pleasantest',
-    'pleating',
-    'plebeians',
-    'plentifully',
     'plessis',
-    'plies',
-    'plinths',
-    'ploidy',
-    'ploughmen',
-    'pls',
-    'plucks',
-    'plugger',
-    'plus/minus',
-    'pmdb',
-    'pmis',
-    'pnv',
-    'poc',
-    'pocked',
-    'podkrepa',
-    'podzols',
     'poges',
-    'pohl',
-    'poi',
-    'pointe',
-    'poker-faced',
-    'pokey',
-    'polecats',
-    'poled',
-    'poliakoff',
-    'police-sergeant',
-    'polises',
-    'polishers',
-    'political-economic',
-    'politika',
-    'pollinator',
-    'polonaise',
     'polozkov',
-    'poly(a)',
-    'polyandry',
-    'polyanthus',
-    'polychemotherapy',
-    'polycotton',
-    'polyglot',
-    'polymerization',
-    'polyneuritis',
-    'polynucleotide',
-    'polysyllabic',
-    'polysyllables',
-    'pomegranates',
-    'ponta',
-    'ponteland',
-    'pontiff',
     'pontoons',
-    'poofter',
-    'poolewe',
-    'poppers',
-    'popsters',
-    'popularizing',
-    'pornographer',
-    'portacabin',
-    'portentously',
-    'portosystemic',
-    'portsea',
-    'posc',
-    'posher',
-    'positron',
-    'positrons',
-    'post-acute',
     'post-christmas',
-    'post-implantation',
-    'post-medieval',
-    'post-operatively',
-    'post-partum',
-    'postmistress',
-    'postmultiply',
-    'postprandially',
-    'poststructuralists',
-    'pot\'ma',
-    'potentate',
-    'potentates',
-    'potentiated',
-    'potentillas',
-    'potomac',
-    'pouncey',
     'power-assisted',
-    'powerbook',
-    'poynton',
-    'ppu',
-    'praag',
-    'practicing',
-    'praed',
-    'prance',
-    'pratchett',
-    'pre-dates',
-    'pre-entry',
-    'pre-heat',
-    'pre-modern',
-    'pre-ordained',
-    'pre-publication',
-    'pre-race',
     'pre-sale',
-    'pre-tour',
-    'pre-verbal',
-    'preambles',
-    'precariousness',
-    'precipitately',
-    'precociously',
-    'predication',
-    'predicator',
-    'preempt',
-    'prefigured',
-    'prehensile',
-    'prem',
-    'premultiply',
-    'prep8-cftr',
-    'prepass',
     'prerecorded',
-    'presentments',
-    'preshous',
-    'presse',
-    'pressuring',
-    'pressurised-water',
-    'pressurising',
-    'pressurize',
-    'prestonpans',
-    'prestwich',
-    'pretexts',
-    'pretrial',
-    'preys',
-    'price-cutting',
-    'pricewell',
-    'priddle',
     'prideaux',
-    'primarch',
-    'primulas',
-    'princeps',
-    'principia',
-    'prioritising',
-    'privateers',
-    'privies',
-    'pro-file',
-    'pro-labour',
-    'pro-nuclear',
-    'pro-syrian',
-    'probables',
-    'proctologist',
-    'prodigiously',
-    'prods',
     'profit-maximizing',
-    'profiteers',
-    'profitis',
-    'proforma',
-    'progressiveness',
-    'projectiles',
-    'prolactin',
-    'proletarianisation',
-    'promega',
-    'promenades',
-    'promisingly',
-    'promptness',
-    'promulgate',
-    'promulgating',
-    'proof-reading',
-    'proofreading',
     'propellant',
-    'propellants',
-    'propertyless',
-    'prophesies',
-    'propitiate',
-    'propound',
-    'propranolol',
-    'proscenium',
-    'prosciutto',
-    'prosecutorial',
-    'prot&eacute;g&eacute;e',
-    'proteasome',
-    'protein-dna',
-    'proteoglycan',
-    'protestation',
-    'prothrombin',
     'protrusion',
-    'protuberance',
-    'provable',
-    'proverbially',
-    'province-wide',
-    'prude',
-    'psalmist',
-    'pseudomonas',
-    'psr1706&ndash;44',
-    'psti',
-    'psu',
-    'psych',
-    'psychically',
-    'psycho-sexual',
-    'psycho-social',
-    'psychogenic',
     'psycholinguists',
-    'psychoses',
-    'psychosexual',
-    'psykers',
-    'ptes',
-    'publishable',
-    'puckish',
-    'pudsey',
-    'puerperal',
-    'pulitzer',
-    'pullen',
-    'pulsation',
-    'pumas',
-    'punch-drunk',
-    'puncher',
-    'punchestown',
     'punic',
-    'puno',
-    'pupil/teacher',
-    'purdey',
-    'purebred',
-    'purgative',
-    'purines',
-    'purlieus',
-    'purpose-designed',
-    'purpose-made',
-    'purse-strings',
-    'purveyed',
-    'put-downs',
-    'put-in',
-    'putatively',
-    'putting-out',
     'puy',
-    'pyrexia',
-    'pyrotechnic',
-    'q4',
-    'qaboos',
-    'qalys',
-    'qantas',
-    'qi',
-    'qpd',
-    'quacking',
-    'quadrupling',
-    'quai',
-    'quarter-mile',
-    'quasi-religious',
-    'quatermass',
-    'quattrocento',
     'queasiness',
-    'queensbury',
-    'queenstown',
-    'quelch',
-    'question-and-answer',
-    'quibbles',
-    'quietening',
-    'quiffs',
-    'quigly',
-    'quinlan',
-    'quintets',
-    'quisling',
-    'quod',
-    'qureshi',
-    'quy',
-    'qwerty',
     'r&eacute;volution',
-    'r.c.',
-    'r.h.',
-    'r.m.',
-    'r/2',
-    'r6',
-    'rabi',
-    'rabscuttle',
-    'racs',
-    'radchenko',
-    'radclyffe',
-    'radek',
-    'radicalization',
-    'radio-cassette',
-    'radioactively',
-    'radiohead',
     'radu',
-    'raff',
-    'rag-bag',
-    'ragazzi',
-    'railtrack',
-    'rain\'',
-    'rain-forest',
-    'rainham',
-    'rainstorms',
-    'rais',
-    'rajya',
-    'rakyat',
-    'ram&iacute;rez',
-    'ramada',
-    'ramage',
-    'rampaged',
     'rampling',
-    'ramtron',
-    'rana',
-    'rancorous',
-    'rankers',
-    'ransoms',
-    'rants',
-    'rapp',
-    'rarebit',
-    'rasboras',
-    'rasen',
-    'rashness',
-    'rath',
-    'rathfriland',
-    'rathlin',
-    'ratiocination',
     'raton',
-    'ratso',
-    'rattray',
-    'raucously',
-    'rauschning',
-    'raynes',
-    'rdp',
-    're-affirmed',
-    're-armament',
-    're-assembled',
-    're-cycling',
-    're-designed',
-    're-elect',
-    're-emerges',
-    're-emphasised',
-    're-enters',
     're-equipment',
-    're-equipped',
-    're-equipping',
-    're-fit',
-    're-heat',
-    're-invent',
-    're-live',
-    're-match',
-    're-opens',
-    're-order',
-    're-orientation',
-    're-recorded',
-    're-start',
-    're-thinking',
-    're-unification',
-    're-vamped',
     're-working',
-    'reachable',
-    'reactant',
-    'readerships',
-    'readmissions',
-    'reaganites',
-    'real-estate',
-    'real-wage',
-    'realigning',
-    'realisations',
-    'reaney',
-    'reapplied',
-    'reasoner',
-    'reassessments',
-    'reassigned',
-    'reay',
     'rebelliousness',
-    'rebounds',
-    'rebuck',
-    'recantation',
-    'receivables',
-    'receptiveness',
-    'receptor-mediated',
-    'reciprocally',
-    'reckonable',
-    'recline',
-    'recombinants',
-    'recombine',
-    'reconcilable',
-    'reconciliations',
-    'recondite',
-    'reconnect',
     'reconquer',
-    'record-holder',
-    'recordable',
-    'recoverability',
-    'recursion',
-    'redcliffe',
-    'redcoats',
-    'redeems',
-    'rediffusion',
-    'redox',
-    'reductio',
-    'reductivism',
-    'redworth',
-    'reedbed',
-    'reefer',
-    'reese',
     'refills',
-    'reflexively',
-    'refocusing',
-    'reformatting',
-    'refurbishments',
-    'refuting',
-    'regensburg',
-    'reggio',
-    'regionalist',
-    'regna',
-    'regulative',
-    'reheated',
-    'reheating',
-    'reified',
-    'reikland',
-    'reimposed',
     'reincarnated',
-    'reinhold',
-    'reintroduces',
-    'rejectionist',
-    'rejoins',
-    'relict',
-    'reliquaries',
-    'reloading',
-    'remands',
-    'reme',
-    'remem',
-    'remiss',
-    'removers',
-    'ren',
-    'ren&eacute;e',
-    'rena',
     'renascia',
-    'renato',
-    'rend',
-    'rentiers',
-    'renunciations',
-    'reocclusion',
-    'reoccupied',
-    'repetitively',
-    'replaying',
-    'reprimands',
-    'repro',
-    'reproving',
-    'rerum',
-    'research-based',
-    'resets',
-    'reshuffles',
     'reshuffling',
-    'resits',
-    'resolvable',
-    'resonates',
-    'resorption',
-    'resound',
-    'respecter',
-    'restock',
-    'restocking',
-    'restorationist',
-    'restrictively',
-    'restyled',
-    'retardant',
-    'rete',
-    'retinitis',
-    'retitled',
     'retouching',
-    'retracting',
-    'retributivism',
-    'retrievers',
-    'retrieves',
-    'retrogressive',
-    'returnees',
-    'reuniting',
-    'revers',
-    'reversions',
-    'revises',
-    'revitalizing',
-    'revivalists',
-    'revues',
-    'rewinding',
-    'rewire',
     'rewording',
-    'rewound',
-    'reyes',
-    'rfa',
-    'rhea',
-    'rhenish',
-    'rheumatology',
-    'rhiannon',
-    'rhineland-palatinate',
-    'rhizome',
-    'rhos-y-bol',
-    'rhum',
-    'rhydoldog',
-    'rials',
-    'riband',
-    'ribao',
     'ribbentrop',
-    'ribosome',
-    'rice-salt',
-    'ricercari',
-    'richborough',
-    'riche',
-    'rickshaws',
-    'ridgway',
-    'riffling',
-    'riggindale',
-    'right-to-buy',
-    'righteously',
-    'rightwards',
-    'rigoletto',
-    'rijkaard',
-    'rima',
     'rimless',
-    'ringwood',
-    'ringworm',
-    'rip-roaring',
-    'riskiness',
-    'rittner',
-    'rive',
-    'rivel',
-    'riverbanks',
-    'rizla',
-    'rmp',
-    'roa',
-    'roadworthy',
-    'robby',
-    'rockfall',
-    'rodchenko',
     'rodda',
-    'rodez',
-    'rodier',
-    'rodinal',
-    'rodwell',
-    'roedean',
-    'roeg',
-    'rohm',
-    'roll-off',
-    'rolph',
-    'rolston',
-    'romanticised',
-    'romanticized',
-    'roms',
-    'roof-tops',
-    'room-mate',
     'rore',
-    'rorschach',
-    'rosamond',
-    'rosaries',
-    'rosch',
-    'rosengarten',
-    'rosenkavalier',
-    'roshanara',
-    'rosina',
-    'ross-on-wye',
-    'rosser',
-    'rostovtsev',
-    'rotaract',
-    'rothbury',
-    'rothenstein',
-    'rothley',
     'rothwell',
-    'rotifers',
-    'rou',
-    'rough-looking',
-    'roulade',
-    'round-headed',
-    'roundheads',
-    'route-finding',
-    'routh',
-    'rove',
-    'rowbottom/oxford',
-    'rowntrees',
-    'royally',
-    'royline',
-    'rpb',
-    'rpg',
     'rsgb',
-    'rsx',
-    'rt-pcr',
-    'rtf',
-    'rubbishing',
-    'rudest',
-    'rudman',
-    'ruether',
-    'rufford',
-    'rugosa',
-    'ruhollah',
-    'ruination',
-    'rule-following',
-    'rulemaking',
-    'ruminated',
-    'ruminating',
     'runabout',
-    'runtime',
-    'rupe',
-    'russification',
-    'rusticated',
-    'rustlers',
-    'rustlings',
-    'ruston',
-    'rutley',
-    'rutting',
-    'ryley/environment',
-    'ryton',
-    's\'il',
-    's.18',
-    's.5(4)',
-    's.62',
     's.a',
-    's.b.',
-    's.i.',
-    's.today',
-    's14',
-    's37',
-    'saalbach',
-    'sabres',
-    'sackful',
-    'sacra',
-    'sadako',
-    'saddens',
-    'saddlebag',
-    'sado-masochism',
-    'sadr',
-    'saeed',
     'safaris',
-    'safdarjung',
-    'sagittarian',
-    'sai',
-    'sainte',
-    'sainteny',
-    'sairi',
-    'salas',
-    'salazar',
-    'salicylate',
-    'salieri',
-    'salinger',
-    'salivation',
-    'salt-water',
-    'saltwater',
-    'samoans',
     'sana',
-    'sandbach',
-    'sandro',
-    'sandwell',
-    'sansome',
-    'santerres',
-    'saouma',
-    'sarb',
-    'sarfraz',
-    'sargeant',
-    'sarin',
-    'saru',
-    'sassy',
-    'satinwood',
-    'satirically',
-    'satirists',
     'satsuma',
-    'saturates',
-    'saucony',
-    'sauropods',
-    'saux',
-    'savaging',
-    'savernake',
-    'savery',
-    'saxe-weimar',
-    'sayre',
-    'sbc',
-    'scalds',
-    'scallywag',
-    'scano',
-    'scarcities',
-    'scarlatti',
     'scarth',
-    'scatterplot',
-    'scavenged',
-    'sccs',
-    'sch&ouml;nberg',
-    'scheckter',
-    'schemer',
-    'schimmel',
-    'schindler',
-    'schistosomiasis',
-    'schlumberger',
-    'schmincke',
-    'scholz',
-    'school-children',
-    'schoolbooks',
-    'schoolchild',
     'schr&ouml;der',
-    'schroders',
-    'schumi',
-    'sciatic',
-    'scientology',
-    'scintigraphy',
-    'sclm',
-    'scolds',
-    'sconce',
-    'scorecard',
-    'scoreless',
-    'scorns',
-    'scot-free',
-    'scotches',
-    'scotmid',
-    'scouser',
     'scragg',
-    'scrapie',
-    'scrapings',
-    'screamer',
-    'screes',
-    'scribal',
-    'scribblers',
-    'scritti',
-    'scrunch',
-    'scullions',
-    'sculls',
-    'scutt',
-    'scuttles',
-    'se99',
-    'sea-water',
-    'seagoe',
     'sealants',
-    'seamstresses',
-    'seaports',
-    'seat-belt',
-    'seayak',
-    'sebaceous',
-    'sebastiano',
-    'second-rank',
-    'second-tier',
-    'secretarial/office',
-    'sedgley',
-    'sedimented',
-    'sedum',
-    'seed-bed',
-    'seelig',
-    'seely',
     'seesaw',
-    'sef',
-    'segers',
-    'segura',
-    'seineldin',
-    'seisin',
-    'seldon',
-    'self-advertisement',
-    'self-assertive',
-    'self-aware',
-    'self-congratulatory',
-    'self-consistent',
-    'self-educated',
-    'self-effacement',
-    'self-fertile',
-    'self-generating',
     'self-hatred',
-    'self-healing',
-    'self-identity',
-    'self-instructional',
-    'self-managing',
-    'self-opinionated',
-    'self-paced',
-    'self-parody',
-    'self-referential',
-    'self-regard',
-    'self-reported',
-    'self-sacrificing',
-    'self-selected',
-    'selflessness',
-    'selleck',
-    'selly',
     'selo',
-    'selous',
-    'selva',
-    'semi-conductor',
-    'semi-deserts',
-    'semi-rural',
-    'semi-transparent',
-    'semiological',
-    'sendak',
-    'senecio',
-    'sense-experience',
-    'sensitisation',
-    'sensorites',
-    'sensually',
-    'sententious',
-    'seperate',
     'seq.',
-    'sequelae',
-    'sequencer',
-    'sequestrated',
-    'sequinned',
-    'serafine',
-    'serb-held',
-    'serbian-dominated',
-    'serenades',
-    'serfaty',
-    'seronegative',
-    'seroprevalence',
-    'serosal',
-    'serviette',
-    'servings',
-    'set-nets',
     'seu',
-    'seven-point',
-    'seventy-fifth',
-    'sewing-machine',
-    'sexiness',
-    'sextant',
-    'sexualities',
-    'sexually-transmitted',
-    'sfi',
-    'sfx',
-    'sh2',
-    'sh3',
-    'shaa',
-    'shacked',
-    'shackle',
-    'shadowlands',
     'shags',
-    'shakespear',
-    'shakhrai',
-    'shallowly',
-    'shamanic',
-    'shamanism',
-    'shamanistic',
-    'shamefacedly',
-    'shampooed',
-    'shangri-la',
-    'shanklin',
-    'sharad',
-    'sharp-edged',
-    'sharrock',
-    'sharron',
-    'shatner',
     'shaunagh',
-    'shaves',
-    'shawn',
-    'shaws',
-    'shaykh',
-    'sheers',
-    'shekel',
-    'shen',
-    'sherburn',
-    'shersby',
-    'shettleston',
-    'shi\'ite',
-    'shieldaig',
-    'shiftwork',
-    'shiloh',
-    'shipshape',
     'shipwrecks',
-    'shipwrights',
-    'shl',
-    'shock-absorbing',
-    'shockwave',
-    'shoe-string',
-    'shoosmith',
-    'shopfronts',
-    'shoplifter',
-    'shorrocks',
-    'short-acting',
-    'short-circuited',
-    'shortwave',
-    'shotts',
-    'showcards',
-    'showtime',
     'shrilling',
-    'shrinkwrapped',
-    'shrivenham',
-    'shrouding',
-    'shrubby',
-    'shunts',
-    'shurton',
-    'shuttering',
-    'shwe',
-    'sibiu',
-    'sibton',
-    'sibylle',
-    'siddiqui',
-    'side-saddle',
-    'sidmouth',
-    'sids',
     'sie',
-    'sierras',
-    'sigeberht',
-    'sightlessly',
-    'sightscreens',
-    'signing-on',
-    'sigua',
-    'silesian',
-    'silverdale',
-    'simmone',
-    'simplicities',
-    'sinecure',
-    'singalong',
-    'single-issue',
-    'singleness',
-    'sino-us',
     'sintered',
-    'sinusoidally',
-    'sirte',
-    'sissy',
-    'six-man',
-    'sixer',
-    'sixpenny',
-    'sixteenth-',
-    'skandia',
-    'skarsnik',
-    'skateboards',
-    'skerritt',
-    'skerrymor',
-    'skewing',
-    'skewness',
-    'skillful',
     'skimped',
-    'skimping',
-    'skims',
-    'skin-care',
-    'skinflint',
-    'skinful',
-    'skinners',
-    'skirtings',
-    'skittle',
-    'skubiszewski',
-    'skylines',
-    'slacker',
-    'slagged',
-    'slanderous',
-    'slate-grey',
-    'slattern',
     'sld',
-    'sleeping-bags',
-    'sleeping-car',
-    'sleepwalker',
-    'slenderness',
-    'slicer',
-    'slingsby',
-    'slippered',
-    'slitted',
-    'sloman',
-    'sloths',
-    'slt',
-    'sludgy',
-    'slushy',
-    'sm2',
-    'smailes',
     'smale',
-    'small-',
-    'smallwood',
-    'smarmy',
-    'smartdrv',
-    'smasher',
-    'smcc',
-    'smite',
-    'smoking-related',
-    'smooth-talking',
-    'smothers',
-    'smrs',
-    'sn-2',
-    'snagging',
-    'snappers',
-    'sniffers',
     'snotling',
-    'snowballed',
-    'snowfields',
-    'snowhill',
-    'snowshill',
-    'snub-nosed',
-    'so2',
-    'soakaway',
-    'soaped',
-    'soaraway',
-    'soc.',
-    'societe',
-    'socio-technical',
-    'soffex',
-    'soft-bodied',
-    'soglo',
     'soir&eacute;es',
-    'soke',
-    'sold-out',
-    'solheim',
-    'solper',
-    'sombrero',
-    'someplace',
-    'somes',
-    'sondheim',
-    'sonicated',
-    'soothsayer',
-    'sophronia',
-    'soprintendente',
-    'soraya',
-    'sorbus',
-    'sorrier',
     'sorters',
-    'sou',
-    'soudley',
-    'souffl&eacute;s',
-    'soundcheck',
-    'soundest',
-    'soundhole',
-    'soundproofed',
-    'source=able',
-    'south-easterly',
-    'southwick',
-    'soviet-made',
-    'soyer',
-    'sp.',
-    'spaced-out',
-    'spag',
     'spanish-american',
-    'spank',
-    'sparrowhawk',
-    'spartacus',
-    'spaxton',
-    'spayed',
-    'spck',
-    'spe',
-    'spean',
-    'special-purpose',
-    'specializations',
-    'species-rich',
-    'specifiable',
-    'spectacled',
-    'spector',
-    'spectrophotometers',
     'speechread',
-    'speedlink',
-    'speer',
-    'speirs',
-    'spellbinding',
-    'spellers',
-    'sperry',
-    'speyhawk',
-    'spice-box',
-    'spiderman',
-    'spidex',
-    'spile',
-    'spilsby',
-    'spin-out',
-    'spiritedly',
-    'spithead',
     'splitter',
-    'spokespeople',
-    'spoleto',
-    'spooks',
-    'sprague-dawley',
-    'sprigged',
-    'spriggs',
-    'spring/summer',
-    'springburn',
-    'sputtering',
-    'squabbled',
-    'square-headed',
-    'squarer',
-    'squarish',
-    'squaw',
-    'squeamishness',
     'squelch',
-    'squibb',
-    'squids',
-    'squirearchy',
-    'sra',
-    'srn',
-    'srrna',
-    'st-denis',
-    'sta&euml;l',
-    'stabilizer',
-    'stabilizers',
-    'stably',
-    'staff-room',
-    'stainforth',
-    'stainmore',
-    'stainrod',
     'staleness',
-    'stalkers',
-    'stanbrook',
-    'standard-setting',
-    'standardizing',
-    'standi',
-    'stanier',
-    'stanislaus',
-    'stanislavsky',
-    'stanlow',
-    'stanworth',
-    'star-struck',
-    'starches',
-    'starlets',
-    'start/finish',
-    'state-funded',
     'statelet',
-    'stateroom',
-    'states-led',
-    'statesmanlike',
-    'station-master',
-    'statist',
-    'stax',
-    'stay-at-home',
-    'stayer',
-    'steam-engine',
-    'stedelijk',
-    'stedman',
-    'steel-rimmed',
-    'steenie',
-    'steepening',
-    'steetley',
     'steinberger',
-    'stemp',
-    'stendhal',
-    'stented',
-    'step-children',
-    'steph',
-    'steptoe',
-    'sternal',
-    'sternest',
-    'sternness',
-    'stick-on',
-    'stiff-necked',
-    'stiffest',
-    'stilettos',
-    'stirland',
-    'stitt',
     'stock-market',
-    'stockmar',
-    'stoichiometric',
-    'stoics',
-    'stokill',
-    'stokowski',
-    'stoll',
-    'stomata',
-    'stone-walled',
-    'stonegate',
-    'stonehaven',
-    'stonemasons',
-    'stonham',
-    'stop-motion',
-    'stop-over',
-    'stop-start',
     'storekeeper',
-    'story-tellers',
-    'storytellers',
-    'stottie',
-    'str',
-    'strada',
-    'strafford',
-    'straightest',
-    'strand-on-the-green',
-    'stranding',
-    'strangler',
-    'strangulated',
-    'stratagene',
-    'strathbeg',
-    'strathspeld',
-    'strathspey',
     'streek',
-    'street-level',
-    'streetlamps',
-    'strega',
-    'streptavidin',
-    'streptococcus',
-    'stresa',
-    'strew',
-    'striated',
-    'strichen',
-    'stridency',
-    'strife-torn',
-    'strike-slip',
-    'stringfellow',
-    'stroke-play',
-    'strophes',
     'stroud/gloucestershire',
-    'stroudwater',
-    'strudwick',
-    'strum',
-    'sts',
-    'stuccoed',
-    'stuck-up',
-    'studd',
-    'stuffings',
-    'stunters',
-    'suavely',
-    'sub-aqua',
-    'sub-degree',
-    'sub-discipline',
-    'sub-editors',
-    'sub-letting',
     'sub-packages',
-    'sub-post',
-    'sub-underwriters',
-    'subadditivity',
-    'subcrop',
-    'subdirectories',
-    'subdominant',
-    'subhadra',
-    'subjectivist',
-    'sublease',
-    'submachine',
-    'submatrices',
-    'submerging',
-    'submissiveness',
-    'suboptimal',
-    'subsidises',
     'subss.',
-    'substantiating',
-    'substantively',
-    'substitutability',
-    'subtenants',
-    'subtotal',
-    'subvention',
-    'subverts',
-    'subways',
-    'suchet',
-    'sudetenland',
-    'sueing',
-    'sufi',
-    'sugarbeet',
-    'sugarcubes',
-    'suggestible',
     'suggestiveness',
-    'suh',
-    'sui',
-    'sulaiman',
-    'sully',
-    'sultana',
-    'sumerians',
-    'summala',
-    'sun-kissed',
-    'sun-tanned',
-    'sun/star',
-    'sunblock',
-    'suncream',
-    'sunday-school',
-    'sundered',
-    'sundress',
     'sundries',
-    'sunexpress',
-    'sunniest',
-    'super-power',
-    'super-rich',
-    'superantigens',
-    'superbowl',
-    'supercoiling',
-    'superheated',
-    'superhelical',
-    'superintend',
-    'supermen',
-    'supermini',
-    'supernormal',
-    'supernovae',
-    'superposed',
     'supersparcs',
-    'superstate',
-    'superstructures',
-    'supped',
-    'suppliant',
-    'surface-mounted',
-    'surrealistic',
-    'sutra',
-    'sutured',
-    'svengali',
-    'svetlana',
-    'sw1p',
-    'sw1w',
-    'swabbed',
-    'swami',
-    'swanky',
     'swath',
-    'sweatshops',
-    'sweepstake',
-    'sweetening',
-    'swiftest',
-    'swindling',
-    'swinger',
-    'swiss-based',
-    'switchgear',
-    'swivels',
-    'swooned',
-    'swooning',
-    'swordsmen',
-    'sycamores',
-    'sycophants',
-    'syllabubs',
     'syllogism',
-    'sylphide',
-    'symes',
-    'sympathises',
-    'symphonie',
-    'syms',
-    'syncope',
-    'syncordia',
-    'syndicalism',
-    'syne',
-    'synergies',
-    'syngman',
-    'synonymy',
-    'synovial',
-    'synthetase',
-    'syphoning',
     'syrett',
-    'syrian-backed',
-    'szell',
-    't&ecirc;te',
-    't-section',
-    't.4',
-    't5',
-    't805',
-    'ta&iuml',
-    'table(s)',
-    'tabling',
-    'tabriz',
-    'tabulate',
-    'tacker',
-    'tacoma',
-    'tadchester',
     'tain',
-    'tala-tala',
-    'talentless',
-    'talkie',
-    'talon',
-    'tambour',
-    'tambourines',
-    'tamm',
-    'tammuz\'',
-    'tanqueray',
-    'tap1',
-    'tap2',
-    'tappings',
-    'taproom',
-    'tarbuck',
-    'tares',
     'tarland',
-    'tarns',
-    'tarr',
-    'tarsus',
-    'task-oriented',
-    'tastebuds',
-    'taubman',
-    'taurean',
-    'taureg',
-    'tautological',
-    'taxi-drivers',
-    'taxidermist',
-    'taxonomies',
-    'taxos',
-    'taxying',
-    'taylorism',
     'tea-towel',
-    'teacakes',
-    'techniquest',
-    'tediously',
-    'teeing',
-    'teemed',
-    'teenaged',
-    'teeter',
-    'teetotallers',
-    'tef-1',
-    'tehiya',
-    'teignbridge',
-    'teldec',
-    'telefunken',
-    'telegraphs',
-    'telemann',
     'telemetry',
-    'telephonic',
-    'telephonists',
-    'telepoint',
-    'telescoped',
-    'teleuts',
-    'televisual',
-    'tellenor',
-    'tellies',
-    'telomeres',
-    'tem',
-    'tempests',
-    'temping',
-    'temptingly',
-    'ten-man',
-    'tengiz',
     'tentorium',
-    'tenuously',
-    'tenurial',
-    'teradata',
-    'tercentenary',
-    'terentia',
-    'terhune',
-    'terkel',
-    'terling',
-    'terra_firma',
-    'terrains',
-    'terranes',
-    'terrorize',
-    'terylene',
-    'tesfaye',
-    'tethers',
     'tethlis',
-    'tetracycline',
-    'tetrahedral',
-    'tetrahymena',
-    'tetrazolium',
-    'tetris',
-    'teversham',
-    'texturised',
-    'tfp',
-    'tglp-1',
-    'thalassiothrix',
-    'thalberg',
-    'thasos',
-    'thatchers',
-    'thaxted',
-    'the_most_part',
     'thea',
-    'theatregoers',
-    'thegns',
-    'thein',
-    'theocracy',
-    'theorization',
-    'theorize',
-    'theorized',
-    'therapeutically',
-    'therefor',
-    'theresia',
-    'thermoplastic',
-    'theron',
-    'thespians',
-    'thinkpad',
-    'thinners',
     'third-largest',
-    'thirkett',
-    'thirsting',
-    'thirty-minute',
-    'thirty-odd',
-    'thirty-year-old',
-    'thompsons',
-    'thoresby',
-    'thorium',
-    'thorkell',
-    'thornbury',
-    'thornycroft',
-    'thoroughbreds',
-    'thorpeness',
-    'thorsbury',
-    'three-night',
     'three-volume',
-    'thresh',
-    'thrigg',
-    'thro',
-    'throckmorton',
-    'thrushcross',
-    'thrusters',
-    'thunderclap',
-    'thunderstruck',
-    'thunk',
-    'thuringiensis',
-    'thurn',
-    'tickell',
-    'ticketing',
-    'tiddly',
-    'tidies',
     'tie-break',
-    'tien',
-    'tight-fisted',
-    'timbres',
-    'timbury',
-    'time-bomb',
-    'time-lapse',
-    'time-varying',
-    'timebomb',
-    'times-herald',
-    'timorese',
-    'tine',
-    'tink',
-    'tinning',
-    'tinting',
-    'tippex',
     'tipton',
-    'tirades',
-    'tirgu',
-    'title-holder',
-    'tittering',
-    'tiw',
-    'tme',
-    'tml',
-    'tnps',
-    'to-ing',
-    'toastmaster',
-    'tobacconists',
-    'today/20.10.93',
-    'todi',
-    'toe-nails',
-    'toffler',
     'tog',
-    'tolbukhin',
-    'toll-free',
-    'tolly',
-    'toluene',
-    'tonalities',
-    'tonally',
-    'tongued',
-    'tonner',
-    'tooltalk',
-    'tootal',
-    'top-rated',
-    'topcliffe',
-    'topham',
-    'topic-shift',
-    'tormentum',
     'torode',
-    'torque/position',
-    'totalities',
-    'touch&eacute',
-    'tough-guy',
-    'touquet',
-    'tournai',
-    'touvier',
-    'towerlands',
-    'town-planning',
-    'townswomen',
-    'towpaths',
-    'toxocara',
-    'toyland',
-    'trabajadores',
-    'traceried',
     'tracers',
-    'tracheotomy',
-    'trainor',
-    'traipse',
-    'transaminase',
-    'transceivers',
-    'transfections',
-    'transgressors',
-    'transits',
-    'transmanche',
-    'transmural',
-    'transnationals',
-    'transponder',
-    'transposons',
-    'transversely',
-    'trap-door',
     'traquair',
-    'trashed',
-    'travnik',
-    'treaty-making',
-    'tredegar',
-    'tree-house',
-    'tree-like',
-    'tregaron',
-    'trellises',
-    'tretchikoff',
-    'treuhandanstalt',
-    'trew',
-    'triadha',
-    'triadic',
-    'trias',
-    'trible',
     'trickett',
-    'trickiest',
-    'tricksters',
-    'tricord',
-    'triglycerides',
-    'trillions',
-    'trinitarian',
-    'trisomy',
-    'trivialise',
-    'trnas',
-    'trnc',
-    'trocchi',
-    'trog',
-    'trolling',
-    'trollop',
-    'trope',
     'trott',
-    'trouble-maker',
-    'trouble-shooting',
-    'trousseau',
-    'troutbeck',
-    'truckle',
-    'truculently',
-    'truisms',
-    'trumping',
-    'truncation',
-    'truscott',
-    'trustingly',
-    'tse',
-    'tskhinvali',
-    'tuam',
-    'tuber',
     'tubules',
-    'tudorbury',
-    'tull',
-    'tullivers',
-    'tumbril',
-    'tummyache',
-    'tunable',
-    'tunelessly',
-    'tungus',
-    'tupolev',
-    'turbo-charged',
-    'turenne',
-    'turhan',
-    'turku',
-    'turn-around',
-    'turn-round',
     'turnoff',
-    'turrican',
-    'tussauds',
-    'tussles',
-    'tussock',
-    'tussocks',
-    'tussocky',
-    'tut-tutted',
-    'tut-tutting',
-    'tutbury',
-    'tuthanach',
-    'tutting',
-    'tvl',
-    'tweddle',
-    'twelve-thirty',
-    'twenty-',
     'twenty-eighth',
-    'twerp',
-    'twilit',
-    'twin-bedded',
-    'twiston-davies',
-    'twittered',
-    'two-for-one',
-    'two-hourly',
-    'two-one',
-    'two-page',
-    'two-player',
-    'two-round',
-    'two-timing',
-    'two-up',
-    'tycho',
-    'tyme',
     'tynagh',
-    'tynan',
-    'typesetters',
-    'tyro',
-    'tyumen',
-    'tzani-bey',
-    'u\'s',
-    'u-21',
-    'u.d.c.',
-    'ubaldo',
-    'ubogu',
-    'ucc',
-    'uckfield',
-    'ucl',
-    'uddingston',
-    'udg',
     'ufa',
-    'uffington',
-    'ug/litre',
-    'ugarte',
-    'uhuru',
-    'uig',
-    'uim/x',
-    'ukranian',
-    'ulna',
-    'ultima',
-    'ultimatums',
-    'ultra-orthodox',
-    'ultradian',
-    'ultrastructure',
-    'un-',
-    'unarguable',
     'unassociated',
-    'unaudited',
-    'unawareness',
-    'unbanning',
-    'unbend',
-    'unbolted',
-    'unbowed',
-    'unbundling',
-    'unburdened',
-    'unburied',
-    'unburnt',
-    'uncarpeted',
-    'uncensored',
-    'unchained',
-    'uncharitably',
-    'uncivilized',
     'unclasped',
-    'uncoiled',
-    'uncommercial',
-    'unconcealed',
-    'uncorked',
-    'uncorroborated',
-    'uncreative',
-    'unction',
-    'uncurtained',
-    'undeformed',
-    'under-estimate',
-    'under-secretaries',
-    'underbrush',
-    'undercity',
-    'underfed',
-    'undergarments',
     'underling',
-    'undernoted',
-    'underplay',
-    'underscores',
-    'undershot',
-    'underspent',
-    'understeer',
-    'understorey',
-    'undismayed',
-    'undoes',
-    'undoubtably',
-    'unedifying',
-    'unfastening',
-    'unfenced',
-    'unfertilized',
-    'unfiltered',
     'unfitted',
-    'unflagging',
-    'unforgivably',
-    'unfreeze',
-    'unfrozen',
-    'unfunded',
-    'unfunny',
-    'unfurl',
-    'unfurling',
-    'ung',
-    'ungar',
-    'unglazed',
-    'unhistorical',
-    'uninfluenced',
-    'unisoft',
-    'universalist',
     'universalistic',
-    'unleashes',
-    'unlikeliest',
-    'unlovable',
-    'unmanly',
-    'unmask',
-    'unmentioned',
-    'unmissable',
-    'unmotivated',
-    'unnumbered',
-    'unpardonable',
-    'unprejudiced',
-    'unprintable',
-    'unpropitious',
-    'unregenerate',
-    'unripe',
     'unrwa',
-    'unscrewing',
-    'unsealed',
-    'unseasonably',
-    'unseasonal',
-    'unselfconsciously',
-    'unselfishly',
-    'unselfishness',
-    'unsinkable',
-    'unsliced',
-    'unsweetened',
-    'unthreatening',
-    'untruths',
-    'unutterable',
-    'unutterably',
-    'unvented',
     'unviable',
-    'unwaged',
-    'unworthiness',
-    'up-date',
-    'upgradeable',
-    'upholsterers',
-    'upminster',
-    'upp',
-    'upper-intermediate',
-    'upper-middle-class',
-    'upson',
-    'upto',
-    'uralmash',
-    'urbanely',
-    'urbanism',
-    'uriah',
     'uric',
-    'urna',
-    'urology',
-    'us&dollar;1,500',
-    'us&dollar;2,500',
-    'us&dollar;200',
-    'us&dollar;200,000,000',
-    'us&dollar;4,000',
-    'us&dollar;400,000,000',
-    'us&dollar;500,000,000',
-    'us-made',
-    'useable',
-    'usherette',
-    'usta',
-    'ustinov',
-    'uthwatt',
     'utilizes',
-    'utterer',
-    'uv-b',
-    'uvistat',
-    'uwe',
-    'v&eacute;zelay',
-    'v&ouml;lkisch',
-    'v-bombers',
-    'v-c',
-    'v.r.',
-    'vacating',
-    'vacuity',
-    'vagnorius',
-    'vainglorious',
-    'vaisey',
-    'val&eacute;ry',
     'valentia',
-    'valeria',
-    'valli',
-    'vallis',
-    'value-laden',
-    'vanadium',
-    'vanderbilt',
-    'vanes',
-    'vangmoor',
-    'vantage-point',
-    'vaporised',
-    'vardy',
-    'varela',
-    'varney',
-    'varnishing',
-    'vasilariov',
     'vasili',
-    'vaster',
-    'vaughn',
-    'vcam-1',
-    'veiling',
-    'velasquez',
-    'velde',
-    'verandas',
-    'verbier',
-    'verdon',
-    'verena',
-    'verey',
-    'vergil',
-    'verlag',
-    'veronique',
-    'vertices',
     'vertue',
-    'verveine',
-    'vesa',
-    'vestal',
-    'vestibules',
-    'vetoes',
-    'viareggio',
-    'vibram',
-    'viburnum',
-    'vicenzo',
-    'vicus',
-    'vieille',
-    'vigneron',
-    'viktring',
-    'vim',
-    'vina',
     'viols',
-    'vires',
-    'virgie',
-    'virginia-based',
-    'virtuously',
-    'vis_a_vis',
-    'visby',
-    'viscounts',
-    'visible-trade',
-    'visix',
-    'vite',
-    'vitez',
-    'vitrodur',
-    'vitruvius',
-    'vlps',
-    'vmark',
     'vmebus',
-    'vocalisation',
-    'voce',
-    'vocs',
-    'volcanics',
-    'volumetric',
-    'volutes',
-    'volvos',
-    'vorarlberg',
-    'vosper',
-    'voyagers',
-    'vp7',
-    'vranitzky',
-    'vronsky',
-    'vroom',
-    'vulcanian',
     'vulnerabilities',
-    'vyborg',
-    'vygotsky',
-    'vyrnwy',
-    'w.i.',
-    'w.r.',
-    'w1n',
-    'waal',
-    'wacc-la/c',
-    'wada',
-    'waddon',
-    'wadis',
-    'wadkins',
-    'wagered',
-    'wagers',
-    'wagstaff',
     'wah-wah',
-    'wahl',
-    'wai',
-    'waikato',
-    'waivers',
-    'wakeman',
-    'wakil',
-    'wali',
-    'walkin\'',
-    'walkmans',
-    'walkover',
-    'wallenstein',
-    'wallflower',
-    'walvis',
-    'wanamaker',
-    'wanderlust',
     'wangle',
-    'warhorses',
-    'warmers',
-    'warminster',
-    'warnes',
-    'warthog',
-    'warwicks',
-    'wasdale',
-    'washbrook',
-    'washed-up',
-    'washing-machines',
-    'washings',
-    'washingtons',
-    'washoe',
-    'washstand',
-    'waspish',
     'wastefully',
-    'waster',
-    'wasters',
-    'watchable',
-    'watchtower',
-    'water-bottle',
-    'water-logged',
-    'water-tight',
-    'waterborne',
-    'waterboys',
-    'watercolourists',
-    'waterfield',
-    'watermelon',
-    'watersheds',
-    'waterson',
-    'waterstone',
     'wath',
-    'waveband',
-    'wavenumber',
-    'wayans',
-    'waywardness',
-    'wb',
-    'weatherbeaten',
-    'webb-bowen',
-    'wedding-ring',
-    'wedgewood',
-    'weds',
-    'weedkillers',
-    'weel',
-    'weem',
-    'weight-training',
-    'weightlifter',
     'weis',
-    'well-controlled',
-    'well-endowed',
-    'well-planted',
-    'well-proven',
-    'well-rehearsed',
-    'well-suited',
-    'well-versed',
-    'weltanschauung',
-    'wend',
-    'wended',
-    'wenders',
-    'wendler',
-    'wendover',
-    'wensley',
-    'wessel',
     'westergaard',
-    'westmoreland',
-    'westway',
-    'wgec',
-    'whacks',
-    'whaley',
-    'wheatcroft',
-    'wheaton',
-    'wheelie',
-    'whelp',
-    'whetstone',
-    'whicker',
-    'whiggish',
-    'whillans',
-    'whimbrel',
-    'whimpers',
     'whines',
-    'whippets',
-    'whiskas',
-    'whisks',
-    'whitbreads',
-    'white-fronted',
-    'whitehorn',
-    'whitehorse',
-    'whitelocke',
-    'whites-only',
-    'whitesnake',
-    'whitey',
-    'whitmore',
-    'whittler',
-    'whole-class',
-    'wholesomeness',
     'whooshing',
-    'whoppers',
-    'whosoever',
-    'wicken',
-    'wickens',
-    'wickerwork',
-    'wide-screen',
-    'wiggles',
-    'wigtown',
-    'wildernesses',
-    'wildwood',
-    'wile',
-    'wilfried',
-    'wilhelmshaven',
-    'willmot',
-    'willses',
     'wimmin',
-    'wimpish',
-    'win32',
-    'winching',
-    'wind/u',
-    'windle',
-    'window-frame',
-    'wineskin',
-    'wingspan',
-    'winn',
-    'winnable',
-    'winningly',
-    'winnowing',
-    'winos',
-    'wirth',
-    'wisard',
     'wish-fulfilment',
-    'witching',
-    'withe',
-    'witheringly',
-    'within\'',
-    'witter',
-    'witticisms',
-    'wittiest',
-    'wittingly',
-    'wjec',
-    'wlf',
-    'wogs',
-    'wolfkings',
-    'wolfram',
-    'woll',
-    'wollo',
     'wolseley',
-    'womanising',
-    'wombles',
-    'wood-way',
-    'woodenly',
-    'wooderson',
-    'woodpile',
-    'woodturning',
-    'woolacombe',
-    'wooley',
-    'woolies',
-    'woosie',
-    'word-of-mouth',
-    'word-oriented',
-    'word-play',
-    'word-strings',
     'wordlist',
-    'wordprocessing',
-    'work-based',
-    'workhorses',
-    'workrooms',
-    'world-beating',
-    'worlde',
-    'worldview',
-    'worsdale',
-    'wpp',
-    'wrac',
-    'wraiths',
-    'writerly',
-    'wtb',
-    'wtn',
-    'wurgh',
     'wwf-uk',
-    'wwr',
-    'wylam',
-    'wymondham',
-    'x-1',
-    'x100',
-    'xanthopoulos',
-    'xarkon',
-    'xd5',
-    'xenix',
-    'xenobiotic',
-    'xenoliths',
-    'xf6',
-    'xg7',
-    'xh558',
-    'xian',
     'xj220',
-    'xtree',
-    'xuxa',
-    'xxiv',
-    'xxviii',
-    'y-fronts',
-    'y1',
-    'ya4c5',
-    'yag&uuml;e',
-    'yahoos',
-    'yalden',
-    'yalikavak',
-    'yallop',
-    'yanek',
-    'yangon',
-    'yannick',
     'yaound&eacute',
-    'yap',
-    'yaqub',
-    'yarrundi',
-    'yasak',
-    'yat',
-    'yate',
-    'yd',
-    'ye-es',
-    'year-ago',
-    'yeb',
-    'yellowstone',
-    'yellowy',
-    'yenan',
-    'yenisei',
-    'yeovilton',
     'yesterdays',
-    'yfc',
-    'yippee',
-    'yobbos',
-    'yokel',
-    'youngman',
-    'ys',
-    'yung',
-    'yvon',
-    'zab',
-    'zabriskie',
-    'zafy',
-    'zam',
-    'zambians',
-    'zappa',
-    'zarco',
     'zbs',
-    'zee',
-    'zemstvo',
-    'zeng',
-    'zero-coupon',
-    'zeroed',
-    'ziggie',
-    'zigzagged',
-    'zigzagging',
-    'zinoviev',
-    'zip-up',
-    'zippo',
-    'zita',
-    'zither',
-    'zlorf',
-    'znf25',
-    'znf33a',
     'zog',
-    'zulus',
-    'zum',
-    'zverev',
-    'zygomatic',
-    'zygote',
+)
+
+blocks_12 = (
+    '"+gr;-subunit"%mp;c.!$bsol!+commat;tab1!%dgr;t"*ollar;0.02+!4(%1,400*#600)#.47*"75)*00,000,000)"1m)#25m)"3m',
+    '(&2,000m*#800)#.2m*"8m*"9m)"3m)!4($3.4m*!5)%5,000(%4,500)&00,000(\'750,000("80*$,000',
+    '!*eacute;lan!*frac12&ins%%38;in"!t!)half;inch!(icirc;le!#kgr!&lowbar!)mdash;but\'"in"$gr;m!+pound;1,750(#.05)#1bn)#25m',
+    ')"49)"60)"90*!m(%0,500("29($3.50)"0m)!9(#60m)!9("89($9.50\'$2.4m)"8m',
+    '("15(&25,000("3m(&40,000)!5)!m($5.00(&75,000)!m($9.50\'#3.1)!3)"49)"60("10',
+    '(&75,000(%8,000\'%4,200(#.00)!1)"49(%2,000("80\'$5.2m("25(&50,000($9.99\'"61(%8,000\'$700m',
+    '(!4(!7\'"84(!8\'%9,500("0m($9.95\'#xxx"#sgr!#sim #\'84!#bye!$mill!#old"&rrible',
+    '!"ud "++!#aer #-40!(80&deg;c!#and!&column!"g.!#rna!\'strands!$type ".6 "/2 *0&ndash;24!#.06',
+    '#!8#!9""12#!4"#25%""50#"mm!"/1!$0:16!$1.01!#252""73""93!#306""45',
+    '!#600""24!#700""30""52""72!"91!"s. ,1&frac12&ins)\'ndash;2")ndash;100)!5!%,000m"\'200,000!"-4',
+    '#!7""20"#3.1$!3"#5.2"\'8-litre!!/!(0&frac12#%mgr;m#\'ndash;0)#20%"#(9)"*-month-old"%.40pm""09',
+    '""12#"st""25""70"#lbs"%q11.2!*1&ndash;13)!2"*-year-olds"#.4%$!5#"5%""03""24""35',
+    '#!7"%5,000""65#!6""73#!4#!8""85#!6"!m!&2-mile#$week"#.10$!2#"3%',
+    '""06""17""25""35""40""55#!6#!7##mph""63""81""s.#!t"*th-century!*3&ndash;17',
+    '"\'-member"#.5%""32#!6""43""61#!4""79""85#!7""pc"*th-century!)4&ndash;6"&-month""10',
+    '""40""55""60#!5""77""86#!7""94!*5&ndash;17*!8*!9)"24)!3"#-20"!.',
+    '#!8"&0g/5oz##mph""10""31"#50s"#60s"#70s"#80s"!a"*th-century!$6(2)"$-man"!.#"5%',
+    '"-60&ndash;1690"!a""ft""in!*7&ndash;20"#(1)"#-20#&member!*8&ndash;21"#-20$!1"!.!*9&ndash;21"*-year-olds"+0c/375f/gas',
+    '#*6&ndash;17#*7&ndash;18"+29&ndash;30"+38&ndash;39"+49&ndash;50"%62/63"#71a#)2&ndash;3#*3&ndash;74$!b#$4/75#*5&ndash;76#*9&ndash;83"%81/82#$4-85',
+    '#*8&ndash;91"$91/2#"2b#)3&ndash;4"!a!":2!!e!!h!"kg"!m!#x12 +2&egrave;me!#(4)!"-6"#bit',
+    '"#2.3"#3.1"#4.0#!m""5p!*0&ndash;40""-1#"22"".4""06"!g""s.!*1&ndash;23"%-year"".7',
+    '"!p!*2&ndash;24"!."%5,000!$3-25"!p!\'4-valve"".2#!4"%0,000""in!)5&ndash;1)"35""0m#"th',
+    '!#6.6!&70&deg"$2578!&80,000!#9.5#!9!#ins!"km!!n %3,100!$-day#*imensional!$.2.2#!2#!4',
+    '""45"#7.2!*0&ndash;50)"60"\'-second#$yard"#0th!$1(2)!#3-1"#.3%"%0,000!"4p!*5&ndash;40!#60k"#986',
+    '"#450"#639"#773"#868"#915#"27#"30!$8165$!6"#307$!8#"53"#452#$9+10"#548',
+    ' %4&deg!$,600"#800!%.00pm""14#!7"#2.0#!5""4%#".2!%0&deg&";c"#0mm!#400!\'5&deg;c',
+    '"!3"!p!%8,000!$9/50"!2"!4!"pc #5\'s!!*!$,800!--fluorouracil!$.1.1$!3"#2.3""3%',
+    '!)0&ndash;1""\'s"#-50"#0ml""ml!#12k!"23"!7!"48!\'5&deg;c"%0,000"!2"!3!*6-year-old"!4',
+    '!"72!%8,000!"98!":1!#asa!!d!"km!!q (6&frac12!!+!#.1%""2%""4%!&00ml/1"!8',
+    '!"11!%3,000"!9""rd!*4-year-old!#500"!3!"63""th!%75678""th!$80x0"!4!$9(1)"!3',
+    ')!2(!4!"-3!#.1%#!2#!4"#2.3""4%"#5cm!*0&ndash;80!%1,000"!1"!9!#20k!"32',
+    '""rd!*4-year-old!*5-year-old""00#"69""cl!"66!"71!"86!#9th!!c *8&ndash;11!#.1%#!3""4%',
+    '!*0&ndash;90"#/20"%486sx"!7""86"#mph!"11"!7!"21"!7!"35!"41"!7!&50,000"!5',
+    '!"75"!6!"9p!!f!!s %9,500!"-3!%.00am"#2.0#!5""8%!*0-year-old"!4"!8!"25',
+    '!#5th!"65"!8!"76"!7"!8!"92!"d.!"ft!"pc!!v #a-c"\'measure"!t##eam',
+    '!$1(m)""67!"41!"68!!8!#aah""gh!&balkin"(breviate"(dicating#$ulla"&eravon$$corn$$dare"\'origine',
+    '#!c"%salom#%orber#%urdum"&ubakar")yssinians!(ccentual#*i&oacute;n$&dently#,limatisation)#zed#-ommodationist#(rediting#!s")etylation',
+    '")idophilic"#ker%$mann#$land""po"\'quirers%%ttals"!r"!s"%tives#$uals!"d2"(_hominem"$acom#%lbert',
+    '#$ptec")denbrooke"-enocarcinomas""is"&monish&%tions"#nan"%opter%$ions#\'rnments#"ur"!r"(ulterers#\'mbrated"\'ventist',
+    '"$rate#%ofoil"(thelwald%!r!#fdc"/finity-purified"(ricanist$"ka")ter-shave%%taste!%gadir")gradation%)ndisement"&itprop"%nelli',
+    '!&hlberg"#met"!o"!t!"ig"#mee#(lessness"(r-filled$&to-air"\'schines"%x/esa!"ja!&kabusi"%bulut"&ehurst',
+    '"&sarayi""zo!\'l-kaysi""ar#$ssio"!b#(atrosses##ers%$tine#$umen"&catraz"\'derdice#"is#(osterone"\'e-house',
+    '##sis$&sandra#(xandrian"-fons&iacute;n$"rt"#gar%"de#"ol"$haji"%iases#%sdair$%taire"&kaloid$!r""l-',
+    '$%metal$\'singing#$elic$%rdale#$igin#&ograft$%metry$&phonic"+mond-shaped"&so-ran"$tair#\'ernants"%umnus##red""va',
+    '"$asya#$tory"&berley#%rosia#)ulanceman\'!t"*eliorating#&nhotep#*rican-born"$f(l)"%herst"\'idships#"go"%meter"!o',
+    '""pa#*hitheatres#\'leforth%#xus#%thill#%utate""un"#yas##tal!%nalog&%ously"\'chorman#&istrus##ona""d/',
+    '#"ra$"os"\'euploid"%gelus#)iogenesis#\'licized#\'ularity"&imates#!s"&jelica"\'n-marie#"is#!o#\'ualised$#lar',
+    '")omalously##xic"$sell""ta#%eater(!s$(diluvian$#nor$&riorly#*helmintics$!y#*i-clerical-#ism&$rime%.discriminatory',
+    '%\'insider\'*tellectual&#raq%*maastricht%(poaching\'%verty%\'semites&$tate)"ic&(ubmarine%%theft$%dotes$(feminist$\'gliadin$\'oxidant',
+    '$&quarks$\'septics#$onin!$onbs!%p1-88"&e-like#&ritifs"!f"%hasic#)rodisiacs"\'optotic"(palachia$\'ratchik#&easing#!i',
+    '!(quatints!%randa%!t"+cheologists##ing"\'dakkean$#mal#%ennes#)namurchan"&endale#&opagus""go"#ien#&mathea#\'steides',
+    '#"us"*m-twisting#%field#$iger$\'nianism(!s#*our-plated"%ndale#"ot",omatherapist.!s"#pad"!r#&owroot"\'seholes',
+    '"/terial-alveolar##hit#&ificer$%sanal!(scorbate"!e"(hburnham#$mead$#ore"#lib"\'partame#\'ersions#%irate(!s"#sab',
+    '#\'ignable#!t#$yria")tigmatism#$ound#"ro%)nomically%$phil#%urian"-unci&oacute;n",ymptotically!"t1"!2"#han#%eroma',
+    '#$lone#+ulathmudali"*mospherics"!n"/tention-seeking#,itude-holder\'%inism"$well!(ubeterre#%usson"&gments#$ured$,st-september"%relia#"um',
+    '"&thored#*ocatalysts$&matics("sm$%psies#&refois%!s!+vant-gardes"%ionic!%wakes!#yah#!z!+zathioprine"#ide#$nger',
+    '")ndash;17s!"-1""52!".2""ed""r.!!7!#aas"\'bington"&chrach#)k-bencher%#end%$pass%$room%+translation',
+    '$%cross$$less%#ine$\'tracked#!s#(ulovirus"&dinage##ran"(ghoomian##ley"!i#$bing##lor#!r$$stow',
+    '"$laam##cha#"la$"ed$#ing$&valves$&ygrant#&usters&%raded"%mberg$&oozled"(nanarama#!c##gle##jul',
+    '$%rupts#\'tustans"%ptize"%rbary$\'iturate##dul#%eback#"gh#$isan#&linnie#&nsdale$$well#%onage%#ets"&silect',
+    '$!s#$sman$!o#"te"\'tholith#%stone#!t$&ambang$%ersby$\'lefront"$uble#$ghan##man#\'thumley"\'varians',
+    '#"ar!"ba!"ca"!e!"dh!%e-all"\'achside#!g##ked#$rcat$$park#(stliness#$tnik#(ufighter$)mont-dark',
+    '"%ccles"(d-sitter#&sheets$%itter"&e-line##fed$%heart#\'keepers#"ps"-fore-position&&/after"%guile")hbehanian#!r""la',
+    '#"ig$%ttled#\'larmine$"es$%grove#*ow-average##sey#%trami#$ving"#mba"$nbow#)efactions%&icence#!g#%ichou',
+    '#%netts#%tinck$$wood")queathing"!r##ate#$bera&"is#$koff#\'linetta#\'nardino#"ti$"on"\'seeched#&iegers',
+    '"%tamax#(hanechol#$oken#&rayals&"er#&tering"$wley"%xhill"#yer!"fi!"hc!&iasing"*centennial#&kerton"%dault',
+    '##amy#"ot"(lberries\'!y##low"\'n-liner#$dery"+ochemically+!s#%layer#)materials#-technological"%rbeck#&chwood#\'d\'s-eye',
+    '$$well"&scayne#\'hopstow##ley#"to"&t-part#"er#!h"#var#"vy!/lack-and-whites&&tailed%$foot%%horse%$wall',
+    '##ker#(meworthy#&nching#"se#%zoned"%eeder$$ping#%nders$%heims#$sses"\'ighters"*ockbusting#!k#(m-cooper#%odily',
+    '$#mer#$uson##wed$$lamp$%torch")udgeoning#\'e-white$!r$$sman#%mlein#*ndellsands&!n$#set$#ter#%rting',
+    '"!r!"na!$o-bo""al#\'rded-up%)ing-house#$teng"%bbles"\'ccaccio$$ioni")ddingtons#$ices#&yshell"#epd#%thius',
+    '"!i#(lerhouse",l&iacute;var#!a##ide#$t-on$$wood""na$\'partist#*ham-carter#&ifacio"(oby-trap#$kers$&keeper$&making',
+    '#$ties$\'legging"$rage#&delais##ges$$hese#$mann#$omir"!s##ham#$tock#"un")tanically#\'hersome#!o',
+    '#"ld$!t%#ing#$rner"%wland"$xful""zo!"r."\'adfield#!h$"ma%#ins#%iding$%nstem#%ncusi',
+    '$$ston#%silia$#sey%+i&egrave;re##tby#"vd#%ziers"\'eadhead$%kable$\'st-band&#fed#)ckenridge%$nock##don##mer',
+    '#"ra#(ssingham#\'tonnian$!s"\'ichardi#*ghtlingsea#"ms#%ndled#%tains$#oil#!x"\'oadford%%stone#(bdingnag#%derie',
+    '#%mberg#$oked&!r%%field%%house$(m-parker%&sticks#"s.#\'therton#\'wnstone""rr"$ucan$"ie#$mmer#!n',
+    '$#nen$%swijk#\'talised!#sad!"ta"!u!#ubo"+ckfastleigh$%haven$#ler$0minsterfullerene$$nall%"or$"s.$#ton',
+    '"$dded#!e#$gens"#ffa#!i"%khara"%lkier#\'l\'s-eye$$dogs$#itt#"ow#%warks"\'mblebee##mer"#ndy',
+    '%"tt#!e#%gling#$nard$&ishing$\'tisland##ped$#ing#$slem#,ton-on-trent"%shels$%mills$$nell##sed##tin',
+    '"%tters!)yelection#!s"#kov"$rkin#"om /c&aacute;rdenas"+eacute;line!"-r!#.g.""h.""r.!"2s!!7!!8',
+    '"&esarea$\'ium-137"%goule""hn#$oots"\'inozoic#$ster#"xa"&lcraft#&endula#%ipers#&l-girl$"ey$(igrapher%"n\'',
+    '$"us##man#(orimeter#!s#"vi"%mbrai#+era_obscura%#ons#$pana$#sie$)ylobacter"%naria#$etti#$ford#&izares',
+    '$\'ulation#$onry#%thari#&vasses#$zoni")parisoned#%itano##ote#"ra$%iccio&"es#&sizing#&tivate&&e-bred"&r-bomb',
+    '#%berry&!y$%on-14\'%based\'$free#(cassonne#\'diology#(in&aelig#$lism&!t$$oman#&makers$#ody#&nivals#\'pet-bag',
+    '$!e$#ian$#ott$%yduff#%sberg#&twheel#&ve-out"*sh-starved#$imir##sel#$t-on$%ellan$$ille$&letown"\'talyses',
+    '#\'echists$$nary#&harine$#bad$"er&$wood$/odoluminescence#"on#"ty".use-and-effect#!x"&vorted"&zenove!%d45ra"!t',
+    '"$lica#&lphone"!n#%taurs$&ipedes$.ral-government%+e-periphery&$fold%$ists""os")phalopods"\'recloth$(monially#!f!$f/cf',
+    '"!p!!g!+h&egrave;re"#\'un")affinches\'!g#*irmanships$)se-longue#)latenango$&cedony$#erm$$king#(mpenoise%$neys#\'ngeling',
+    '#\'peroned$$mans$#ped#\'rabancs$\'cuterie$%ibert$&terail%#ism%%reuse$%ybdis#$stel#&tfield#!u"%eapen#$chen',
+    '$!p$(rleaders#"lt#$mise$+oattractant#(quebooks#\'rrywood$#vil#$sara$"il$#ted&%rford%!y#$tnik##vet',
+    '#*cago-based$&kenpox#"en$"sa#*ld-minding%!e$&liness#$nook#%pmunk##ral$"on$!p#\'selling")loroquine"&odorow',
+    '#(lestatic$#sey#"mp#!n$&drites#&rdates$#tle&#ing$#zow##ses"*ristenings&\'ianized)#sen#(onicling%&ometer',
+    '#)rch-based\'%goers&%going#%tzpah!(iccolini"$ncom"%polla"!r#+cumnavigate&&scribe\'&pectly"&tadels#(y-states"-vilianisation!!k',
+    '#$pper\'!s#$rice%\'nettist#$ss-a%$work$"ts#&vigera#%ymore"(ear-eyed&&headed%$ness##fts#!g#\'mentine',
+    '#$rval#"ve")iffhanger#+matologists""od#)nmacnoise#&se-run%$knit#)ud-author%%burst#(venstone#!w"#uck#"ed#!j',
+    '"!y#"st!"mr!*o-authored#-determination#)extensive#,religionists#(starring"*agulopathy#\'lescing$#ing#%sters%%lands"#bbe#$uild',
+    '",de-switching$$name""en"(ggeshall#\'nizance"$ilus"$king"*l&oacute;n#"as#$leen$#ias%%culus%"es#\'onising&"ze',
+    '%!s$%urist#!s#&theart$#man#&umbine"%mbers#%disco#$e-on#(ic-strip#&manche$$edia%)morations$#ies%(seration',
+    ')!y%%ttals$$odes%%nalty&&places$,unaut&eacute&%icant\'+ty-acquired%#tes#(orbidity#,passionately$(ellingly$$iles$!o$-uter-readable',
+    '"-nceptualizing%#rti$)omitantly$\'retions#&denses%!r$&iments#(fections$#ino#)genitally#%joint#&nemara%%xions$$oted#&odonts',
+    '#\'sorting$\'pecific$$uela#(t&eacute$*emplatives\'%orain*%neity%%nting%\'station$,raindication%)ibutorily#&veyors$(olutions"&okware##ley',
+    '$$pods#\'olymers#\'permalt$$iced\'!s##ter#%ybook$$hold$$ists"%racle##bet##dle#"ed$!l$!n',
+    '$$elia\'$ssen$\'flowers$&ishman$&market#(ollaries$$nets##rib$)oborating%$ding#$sage$(torphine#+t&egrave;ge"(s&igrave#(mologies',
+    '#,t-accounting%&saving$$umed"#tes"%uldnt$#ton#(ncil-run$%table%*er-balance(%claim(\'example((measures()terrorism\'\'culture\'&notice',
+    '#(p_d\'etat&\'e_grace#"rs%&e-work$%telle"&vector$%rages&#lls$$ting"&w-dung##ell#%slips""xe!#pag"$i(m)',
+    '"!t!&r-1409"%abbed#&cknell#$dley#%fting#&ganour#\'igforth$!k#%mpton#!w#%yford#$zier&!s"&eamery',
+    '$#nce#%dibly#!m$#ona&#ese#(puscular#,scent-shaped$#sey##tin"#ich#%stina""oc#"ix#"me##ner',
+    '\'&utting&,disciplinary&\'hatched&)infection&&linked&%roads&+tabulations%%bones%%links%$rail$\'thwaite"+uiserweight$$thin#%nches#\'shingly',
+    '")ystallite!$s-us"#iro"!r"!t!&ubbage$!y%%-hole%$hole"!c#$kold"#ddy"(ff-links"%lbone#"ly',
+    '##tic"$mnor")nnilingus"&p-tied$\'winning#"ar##ful#%rinol"$rare#%e-all#&iouser##rys"(stomized"%tlers##out',
+    '!%ybele".clophosphamide"$mbal"!p#$hers"(tometric$%solic (d\'action#$mour#(rgenlieu"&italia!"-d"%i-yer!%.e.s.""g.',
+    '!!7!%aalny"#cia"&edalic"#ffs"+guerreotype"%lmeny"$mant"%ngles#$iell#$vers"!o"&ppling"%rkens#-lington-based',
+    '#"ne#%rowby#&tboard"#tec"(untingly"&venant#+idson/rspca$"na")y-release$%today%\'rippers!$b(a)"!s!#c-3"!c',
+    '!"e\'##ath"2-industrialisation#*regulation"$aden#%f-aid##nne#"re$#ing##ves".bentureholders#"ug$%nking$&tantes"\'cameron',
+    '#)elerating$\'mbrists$%nnial#(k-chairs#(laratory#\'omposes$\'nstruct#&retals"%dlock"$edes#(p-freeze\'#ied#"re$$ness#!s',
+    '$-miliarization#\'ilement$&nately%\'iteness#%lects#\'orested#&rosted#%tness"%ganwy#*ranulation$%easer"*humanising"&ighton##ran"!j',
+    '#(ectation##ler#%orean##tic".m&oacute;crata#&agogue$&nd-led\'$side##ent$$rara%#its$$snes#&idenko$,litarization#/ocr&aacute;tico',
+    '$#tic#&ystify"$ngue#$izen"!o#-xyribonucleic"!p#(olarized$%rting\'"vo")rangement#)egulating#*matologist#(singhams""si',
+    '$\'gnatory#&killed#&perado"(tonating##tol"-us_ex_machina"%veril#\'ilishly"+xamethasone!"gh!\'hlakama!(ialectal\'#ics$"lo#%mante',
+    '")dacticism"&eldrin#!n"!f#/ferent-coloured)\'iations"\'gitalis%#ech%$iser#$nify#$oxin#\'ressing"&hedral""ii"$lley',
+    '"&marzio#%ethyl#\'inuendo$#tur"%ngley"+rectionally#"ks#!o#$tied"*saggregate$\'llowing$*pprobation$)ssociated#(believed$$urse',
+    '$"od%$lour%%ncert&)tinuation%&verers$&retely%)iminative#+embarkation&\'owelled#(hwashing#)infecting#&juncts#&mutase#,organisation)&zation',
+    '$.roportionality&$ving$\'utation#(sembling$\'ipative#*tastefully$&resses#\'yllabic"%ttmar"*vertimento#&ulging!%m2.51$"84%!5%!7',
+    '""us!,na-dependent!%obbin"(decanese%"yl"$ffed"%g-leg$%tired$%whelk"$lcis#"es#&gellau#%ittle##led##men',
+    '#%estos#$inus#"us"%nahue#&nellan"&olally#\'r-frame%$jamb$&keeper"&rmeuse#!s"\'s-based"$tage#!e#$ting',
+    '+#ers\'$take#$sing"(vetailed"%wland#*n-and-outs&&t-heel%\'payment$%lands$$time%$urns#$ries!"pi!!q!&rabble',
+    '#&matize#*wing-board(%rooms$$ling"$ebin#$nthe##ssy"$iers#%ftnet#)nk-driver%$wise#&veways"%ooled"!t"!u',
+    '$!y#&g-free%\'induced#$mmle%$onds#!s"$yish!"sm!+u&scaron;an"*blin-based#$roca"$cati"&g-outs##ald$"rd',
+    '"$iker"%kedom"&lcimer"$nked#$luce##phy"\'puytren"$rand#!f#"n."#sts"$thie""va!-welling-house"&indles',
+    '"!p!!z $e\'er!\'.h.r.r.""j.!"45!$6000!#adt"$rley$#ies#\'marking#(th-bound&*shattering%%watch"(sterside',
+    '!#bor!\'cclesia($stes!$dale"!d##ied"%elson"!f#!u"&geways#%iness%"gs")ification"&ucates"$vard',
+    '!%ffing#\'usively!&gghead#&leston"\'lantine"$ress!"ha!$igen#!g#(ht-match\'%inute&%point\'(rocessor&%track"$ldon',
+    '""ne"&senman#$mark##ner"\'ther/or!$king!&lapses#(stoplast"&dritch"4ectricity-generating&*ochemistry"$ided#!l##ots#)zabethans',
+    '"!r"%ution!)maciation#\'ncipate#\'rginata"\'bargoed#%erton$&zzling#!l#)roideries*"ng##say"(eryville##tic"*igr&eacute',
+    '#\'anuelle$"us#!e$$rich%#son"!o"&pathic\'"ze#,ire-building#$tily"\'ulators!\'n_suite"&ablers"(cashment#(hantress',
+    '#\'ourager#\'rusting"&d-1990$#all$(labelled$&result$)september#$erby%!s#%oderm$\'metrial#&papers"&ergize(!d%+y-intensive',
+    '#%orged"\'hancers"\'joyably"*largements#\'istment$&vening""sa#\'hrining"(trapment$%eated%\'nchment$&yphone"$vies!"od"!e',
+    '!&p1242l"%hesos#&ialtes"*och-making#!s"\'pendorf!)qualizing#)ilibrated$"ps!(rconwald"&dinger"%ectus"$lend"(mentrude"(ror-free',
+    '#+hatological$&enbach"!h"#mat#!e"-pa&ntilde;ola$"ce"+say-writing%"ed%$ists#%inger"\'tonians!"tb!(ugenists"#ler',
+    '#\'hronios"$rame#&ocrats$%sport%\'terling"&tectic!(valuator#(siveness""ie#)l-looking%(smelling"(olutions!*x-dividend#$king#%wives',
+    '"*citability#&reting#*ursionists",ecution-only#,mplification")foliative"&orcist#&ticism"/pensive-looking#&iation#*ort-import""t.#)erminatus%!s#(ra-large',
+    '&\'sensory%\'marital")uberantly#"lt!#yam \'f&amp;s")ecirc;tes"(mdash;ed!&***ing!#.e.!!7!,aber-castell##ula"\'ce-down#"ia',
+    '$!o%$rial\'&sation%"ta&"um"&ilsafe#\'rbairns%#urn$\'y-tales"\'ll-rise#+sifiability"+miliarising")natically#&tasias\'"ze',
+    '"$rber##ces#"go#)m-workers$"an#$nese$%worth#$rago$"en$%owing#\'sighted"+scinatingly)#ons#.hion-conscious#*t-changing',
+    '#&hering#$test"(uconnier#$vism"\'verwell#%orite"%wsley"#yol"#zed!"dc"&r-fmln!+earlessness"&elgood"#ist"&lcourt',
+    '#$ucca"\'nchurch##ian"#rri%#day#&tilize"&stered$$oons""ta"\'uerbach!%himah!$iata"(breboard$"il&!s',
+    '"(ckleness#*tionalised"%elden#$stas",fty-year-old"&gments#,ure-of-eight"%lenet#&mmaker#!s##ton"(nalizing$&ncings#$ders#\'e-class',
+    '&%style#\'ikounda#"zi")re-engine%(fighters$$back##kin#*st-innings&%level&$name"&shburn$$less#$sile$$ured""tc',
+    '"#ve-!#kgp!*lag-waving$#ons##ils#!m$(boyantly#$pper#&shings#)t-chested%#out%&roofed$$fish##vio"%emyng',
+    '#%ttner"(ightcase#\'ppantly$$side##rts#&tcroft"\'oggings#)or-length#\'ribunda%$stry#\'tations#$unce$"rs"&uffing#$nkey',
+    '"*y-by-night$"in!%oakes"$etid"/ix-b&eacute;arn"$late#$d-up#+klinguistic#+low-through"%ndest#!o#$teyn"&otrest$!s"\'r_keeps',
+    '#$bore#&ce-fed%\'fulness#&e-edge$%armed$%limbs%#ock$\'shadows#(farshire$$eits#*get-me-not$$oing#&matter#$nara#&skolin',
+    '$&ifying$.ress-monastery"!s".ur-dimensional%$inch%)month-old$%niers"*wler-troon"\'xhounds!"pc""tp!\'raenkel#&gonard#\'memaker#&ncorum',
+    '$!o#$sque#)ternities$#ton#&udster#"yn""cn"#ear%!s#\'dericks#*e-draining%$form$$land$$ways#!i',
+    '#&shener"&ibbins#-edrichstrasse#"sk%"ed#%tters#(volously#"zz""ns"%o-ing#&cester#(gmarched%#ore#\'licking#&ntenac',
+    '"$umpy##nze#)stratedly!"se!%t/min"!p!&uckers")ddy-duddy"$gues"&kuyama")lfillment#%l-fat%&screen$%onica#(minating',
+    '"\'nakoshi#%gible#\'nelling"(rnishers#"se"%ssell#$tian"#ton#%urity -g&eacute;rard!"\'s!"-c!#.k.!"/t!!9',
+    '#%riele"%daffi$$rene#!d"-elic-speaking"%garin")latasaray#$ilei$"um#"la%#her%$nach%#rdo$"ed$+i&eacute;ni',
+    '"$mbon""ns#%tries"#pes"!r##ber$#utt##man#&otting#\'sington"%scons##set#%thaus$-rooesophageal"&tcombe',
+    '"#udi#%loise"&varnie$$skar"$wped#&thorpe"$yoom"!z#&zaniga!%bagbo!"ca!#eac"$ddit""ek#!s',
+    '""is")nealogist$$rale#&iality$*to-urinary&\'urinary#$tian"&offroy#)physicist"!p"$raci#$emek#$lach#(man-born&"ia',
+    '&%ology#\'tlinger"(schichte#)ticulated"%t-out$)togethers!&gfhbs5#!s!\'heorghe"%osted!\'iardini"&bbered#!e"$golo"&ll-net',
+    '$#man#%sland"&mcrack#$enez##mer"+nger-haired#&ormous"(rardelli#$ding$#led&%stone#%ouard##ths"&smondi#$sing',
+    '$"ns$#rny!"la#"ce$%iated\'$ions#(dstonian#$ncey$!s##rus#&ssfish")enburrell$%cairn$#non"\'impsing',
+    '"*ockenspiel#$ttal"+umdalclitch#!r!"na"$omic#\'sticism\'!s!*o-betweens"*al-kicking#!n""bi#&lander"$diva##ley',
+    '"#gar%"th"(ing-away"\'ldeneye$"in$$star$%water#&f-club""ma"$ndii".od-for-nothing%$time$&enough%!y$&fellas',
+    '$#son$.win/gloucester"%rdons\'$toun#\'geously"%ssard""tt$$lieb$$wald"%ugers#%ldner$!t##rds#%zenko"$wers',
+    '!%raben#$cing#+mmaticality$%pians%"us#$nard$$dmet$(odiorite#\'ptolite#+tifications#)vediggers%!n#$ydon"&easing$&tbatch',
+    '#*ek-cypriot$#ley$*n-fingered%%gross%&keeper%%stone%$well%!y#$iner#&nadine#%sford#"te$#ton#&y-blue"%idded',
+    '#&sedale#"ts""ob#$mmet#%smont$"se&!r%#ing%!o#\'undmass$%pwork""rr""ye#$phon!"sp',
+    '$%droom#"va""bb"\'entchev#%sclin$\'t-house%#ing""ff"(ide-book#%lford#\'nea-pig&!n"&jarati#%erati"#lfs',
+    '"#mbo%#ots#%ption"(n-toting#%boats#%fight#$ther"!o"%rgles"&ylines"&zzling!&ymnast"&rating#"us $h.q.',
+    '!.a&ccedil;ienda""an#$rlem")berdasher"\'ddenham"(ematuria$(ophiliac"%ir-do$&dryers")lberdiers#*f-expected%\'landing&$ives%$mast%&witted',
+    '#&kopous#&leluja%!s$&idayan%!n$"ow$%stein##oed%!s##pin#%stock#$yard"(m-fisted##dan#.ilton-phillips',
+    '"\'nd-loom$$bill$$cart%&rafted$$ford$&somest##nan$$igan#(overians##vey"!p"\'rangued#(d-liners%"on$$disk',
+    '#%fleur##iri#"le#\'msworth##rap$\'ingtons$"op%%wgate#\'t-davis$$burn$$ston#!z"&ssling"&tchard%%backs',
+    '"\'uptmann#"se"$wked$$sley"&yfever#"le!"cp!%e-man"\'adbands$#lam$$sail%$tart$%voice#)lthmaster#\'rt-beat',
+    '%&lessly%\'warming#(ven-sent&$ward$\'y-based"%bbert"%dilla"%eding"\'ffernan"&ilbron##ton"&llenes%%spont$%inckx$#man',
+    '$#ton"&minges"\'n-house#$drik#$eage#$gist#$sley"\'rbalist$%ivory$!y#&efords#%nando#)o-worship##ren$&ingman',
+    '"\'terodox&(sexually"$wart")xadecimal$$gram"&zarfen##b-e!!h!$iatt"&ccough"(erarchic$\'oglyphs"&gh-fat&$lier\'#yer',
+    '%%water%(yielding$\'ly-paid$%point"#ked"$ller$$yard#"ts"$ndle#!e#"ks"%ppias$\'ocratic%%lytus"%roshi',
+    '#%toire%,riographical"&t-list#$ters!&la-b35!&natiuk!+ohenstaufen%\'zollern"(i_polloi##sts""la#&brooke#*iday-maker#&lander$%ering',
+    '$&y-jack#&mfirth$$royd##tby#$yoak"!m#$burg#(e-coming$\'/school$%built$%cover$%maker$\'otherms$%wards%&orking',
+    '"&negger$\'ycombed#!k#\'orifics##ved"%o-woo#!n"#pps$!y"&remheb#(n-rimmed$$beam$$pipe$#sby#%ridge',
+    '%&riding$$fall"#sta$&elries")t-blooded$#dog$$spot"#ult#)semartins%%plant%&wifery"\'witzers##ley#!s"!x',
+    '"#yte!"p4!$rolf!#sdr!$uggy##hey#&uenots"&issier$#tra""la"(maniores%$ness#%mocks"&nching#(dredfold',
+    '#-ter-gatherers"!p".rst/gloucester"$ssar$#erl#%tlers!!w"$icce!(ydrogels\'\'n-bonds&&raphic%&philic\'\'obicity%%xides"*gienically',
+    '"%mnody"#ong"*perplastic%%space%%tonic#-oalbuminaemia$&biosis$#nym &i.b.c.!&acocca!"bc!"c3"$arus"\'e-bound$#cap',
+    '"$hiro#$thus"$icle!,dea-handling$$lize#-ntifier/title"&olized!&gfbp-1""g2"&lesias"\'natieff#&oramus"%uanas!!h!#kon',
+    '#!x""ie"(l-served#(usionism!$mamu")bricating""ho"\'manence$)terialism#\'obilise)#ing#+unoblotting&)logically&-precipitation&(staining',
+    '$%tiens#\'erilled#)lementers$\'oringly#)onderable$)rt/export$"st&"er$&verish#-racticability$(ecations$%overs&%ident#!s!(n-bureau',
+    '#&school")_favor_of#(quest_of"(activate#$nely$#ity$"na"&chcape#.ompatibilities&&etents&*rehensibly$*nsistently")demnifier$%nbaum%%tured',
+    '$)scribably#)istinctly#!o#(ubitable$(ctivists$+strializing(%ously"*extricable"*festations#)idelities$$lled%\'trators$\'nitival#%light#"o.',
+    ')#que#(ractions%%sound#\'uriates$%soria"\'gleston#\'olstadt"+homogeneous$#use#\'umation"(nervated##ing$!t#&uendos",side-forward',
+    '##ole##tal%$nced&%tiate$,itutionalise#)ufferably"-tellectualism&0igence-gathering$,r-republican%-changeability%\'estedly%)ferometer%(galactic%&lining%(mittency',
+    '%$pose%(temporal&$wine#)imidatory#,ra-abdominal%2cerebroventricular$(oversion#!v"$ured"*vercargill$#sco%\'titures#$icta&"us$\'gilator',
+    '"(wardness!&onians#\'osphere!\'raqgate"\'chester"%enius""ix"&on-age$&master"\'rawaddy#*elevancies$(mediable$&solute$(verently!$s-lm',
+    '"(othermal""sa"#uzu"!v!%tches""el"#gwu"(inerants""oh!#vel!#xos!$znik $j.t.!%abber"#cek',
+    '"%derow"%gatan"\'ilhouse"!l"#mal#"el")nissaries#$neau",panese-style"\'ramillo#$omil"%wbone"$zzie!,ean-bertrand"#eta',
+    '#$lied"&nrette#!s"(t-lagged##hro!!f!!i"&ggling#"me"&ngoism##nah"$ving!*ob-sharing"\'cularly"+hnson-laird',
+    '"\'inville"&rdaens##vik"$ujou"(vellanos"$well"$yces!"r.!$u87s#"8s"&bilate"&ddered"&gglers#\'oslavia"%lians',
+    '"&mpsuit"(nctional#&e/july#%gfrau$#ian#"or"(sticiary%(ficatory%#tie$$text",v&eacute;nal"\'xtapose &k!sdra!%achin"\'dijevic',
+    '"$iros"*lashnikovs#!b#"ms"&mpfner##uzu"#nga#"ji##ter#&unname"\'ohsiung"\'rabiner#\'l-heinz#"ol#&toffel',
+    '#%zubes&$ians"#tia#!o#$rine"#uai#$ntze#$tsky!"bs!"cb""mg!$each"$bbel"\'dleston"$elan',
+    '$!s"$ifer##tel$\'h-lucas"&lburne##sen"#nan#"do#%eally##ner%!y#&tigern"!p##pel"!r',
+    '##ton""sk"(ttlewell"\'ystroke!&haleda$#ili#$mtay#!t!%ibble"%ckers"$ddie"(lbrandon#%cline#$leen$%igrew',
+    '$#joy##mer$#uir##roy"#mmy"%ncaid#!e#\'g-sized$#ham#\'lochewe"$ppur"\'rchberg#!i#+kbymoorside$)cudbright',
+    '$"up"$sser"&teline#&tiwake$!o!$lass##xon"#imt"#uck!)natchbull"#eed"&oedler#$llys#(wingness$)ledgeware',
+    '#%ydart"!u!\'ocinski""de"\'koschka""la"!m""pp"%ranic##eas"%ssoff$#uth"%vacks!#prp!+rafft-ebing',
+    '#\'prayoon##use##vis"\'euzberg"\'ibensis#+p-toe-korin#*stallnacht"\'opotkin",uskal-wallis"(yptonite!"sa!%uiper"&reishi##gan##ile',
+    '!&yalami"%lesku"#owa \'l\'amour"#est!!5!\'achesis##key#"ma#&tating"/dies-in-waiting"$ffer&-ty/gloucester"(m&eacute##acq',
+    '$#rie#\'p-posts$$eter$#oon$%posts"%ncome#*ding-stage$\'lordism$$sats%#eer#$gney$%ridge$&uishes#\'hydrock#$sley',
+    '#"ps"!r#$ders#$issa#$rain"\'scelles#%siter#(tability",te-victorian$%ncies$$rals#"hs$$well#\'ifundia$*n-american',
+    '"!v##aux#"er%"ty")wbreakers#\'nmarket%%owers#(s-of-war"&yabout#$back"$zard%"is#"ed!"da!$eahy',
+    '#%thart#%vened$!y"%chery$$lade##key"%dbury"*eds-united##man"\'ft-foot$$ward"(galities#$ered#\'ionella$\'timates',
+    ')#ing(&zation#$room#\'uminous"$hzen"%iston#\'tmotifs$#zig"$long"$mond""ni##ton"#oni"%prous"%ttice',
+    '#%kemia$%ocyte"\'vantine#+el-crossing$%rrier#&ington$#tes#"on"$witt#%ontin"*xicography")yland-daf!"gc!&iaises##nne',
+    '#"an#+eral-minded\'$ized$!t#!f##ran%.ry&dollar;disk$%ettos%%ville$!o"\'cencing%)tiousness"-fe-expectancy%%forms%%saver',
+    '$$size##fey"-ght-heartedly#\'nocaine"&kening$"rt"#lov"+mited-overs"\'ndbergh$!e$!i$"os#&e-outs%#ups$"al',
+    '$$side#%gdale$\'eringly#$kers$%later"*poxygenase#\'reading"\'quified"$sboa"(thograph#(termates$%leton",verpool-born$$seys!\'lambias',
+    '$%thony"-ewellyn-jones!"m1"!e!*oadsamoney##fer#"ms#$ning#$thes"%bbing#%kovic#!s"#des#*ging-house#!z',
+    '"%ftier"$gger#%itech"\'incloth"!l#&loping"!m#&ellini"!n#+don-brabant#&g-firm%$gone%$life%#net$#bow',
+    '"%ok-in$$outs#*se-fitting&&limbed"%pping"#rdy"&sberne"+uis-dreyfus&(philippe#$tish#$vain"\'ve-hate%$nest$%birds##in\'',
+    '$\'powered%\'ressure&#ice)!d#$down#)er-income$!s##ing$"sh#\'landers"$xton""yd!"po!"ro!%slive',
+    '"%urrna!$ubin"&caroni#$know#%retia""fc##kin"&kyanov"%mumba"\'ncheons#!t"!o"&rchers"$sted")tterworth',
+    '!%ydian%"rd"$fing"-mphadenopathy%(oblastic"&nching%#pin##ess""ra"#sed$#tte -m&eacute;tier"+yacute;vatn!"\'s!#.c.',
+    '!"20!!7!*a(general)#(honours)")callister$"ws##edo#)gillivray$$owan#)kintoshes$#man%$urdo##nab%$mara#&robert',
+    '")drigalian"$fart"%ggott$!s#%nesia(!n%%tised&&ometer&#ron$#iac%$fies")habharata#!e"%iming#$nlan',
+    '"&jorism"#lam#\'colmson##den#%evich%\'olently#&formed#&kovich#+larm&eacute$\'erstang%"ts$#ion#)practices"&maloni#(mal-like',
+    '",n-management#%acles#\'carelli#&derley#$gles#\'nesmann$!y##sel#"ta$\'elshelf#*ufactories#&waring#\'y-sided")rch-april#"di',
+    '#%enzio#$gaux$\'inalize#\'ienburg$%llion$"ni$"oc%&nettes$"tz#*ket-driven&$hill&&makers$"ka$(smanship#"mi',
+    '#$riot#"ta$$ello$*in-jenkins#!u#%y-lou"\'sk-like#"s.$"ie#\'terwork$#iff$\'urbated"(tch-play&&winner%"am',
+    '##iba$!n#&riarch##son#"t."(uleverer##roy""x.#&illary$"me#%wells"%yfest$$lies%!y#"li',
+    '#&thorpe!"bb"#eki"!s!\'caleese"&cartan$&usland"$daid"\'glashan$&inchey#&onagle$#ugh#$rady"&inally"$keag',
+    '$\'nsey-ge&#try"&laggan#%ellan"\'michael##unn"!p"&robbie"&sharry""tt"#vie"\'william!$e-10")anderings#\'surably',
+    '")chanicals"$dved"#eks"\'gacolon$%drive$$watt#&halaya##uid")irionnydd#*stersinger")lanesians#(lifluous%#ssa$$owes&#ing',
+    '"&narche#&deleev$%icant#!g#$inas#(u-driven$$etto"%riden#%ovech#&rivale"#sne#&sieurs")tabolised)#ing$)l-working',
+    '&&urgist$)stability$%zoans#+eorologists#.hyltransferase#&rolink"#urs%$ault!"g/!&ichiko##kie#"ra$-o-electronics%(dialysis%+environment',
+    '%\'genesys%$muse%/processor-based%%waved#(turition"&d-\'60s##den&$land$&lewich#\'shipmen"!i"&jnheer"$kila"&lettis#$ieux',
+    '\'\'y-style#&lbrook$$iner%%pedes$!n#"os%!h"!m"#nas#\'dedness#(eralised#$ford#&ginish#(i-budget%$golf',
+    '$(mization$#tab%"el$#ver#$ting$%zberg"&ocenia"\'rabilis$*cle-worker"(sapplied#%carry$"ha$%reant#(judgment#%leads',
+    '##sio&*n-critical$$pelt$(tatement#%timed#+understands!"k2!%l/min"!p!#n/m"$arja!"o\'""ab"%bster")ckingbird',
+    '"%hawks#$ican""in#\'stening"$llis#$oney"#mmy"#nck#)ey-saving%&lender#*ochromatic%$ular\'%tures$)phosphate%)olisation',
+    '$$rail$(syllable$\'zygotic#&pazier#*strosities#\'tefiore%(pulciano"&onbeam(!s"#psa""ra$+le-boosting#$eira##gen#$phia',
+    '#(talities%#red$&gaging$"is"(scovitch#"ul"-ther-of-three#&orboat%$cars#!s"&ughton#$lder#)ntain-top#$sses$%taine',
+    '""eg!#rcs!"sg!"ts"#wtv!#u/l"$ccio#(h-quoted%)respected"%ezzin"(jahideen"%lches%#ing#$lach#!m',
+    '\'\'unction&\'skilled&)threading%(currency%*functional%*lateralism&$evel%*ple-choice\'(ications(#ers&&roduct%$user%$view"!n#&caster',
+    '"%ppets"#rat#"es"$scly$&ovites#%tangs$#ers"(tability%"le$&tional"$vver"&zzling!%y/our"(asthenia"$elin',
+    '"(ocardium %n\'est!%-gram!#.s.!"79!"=7!+acionalista"&kamura""ma#$e&gt#"oi"#nce#$jing""po"$rnia',
+    '$(ow-gauge"(sturtium"*tionalisms)"ze*#ing\'"ux#(riuretic#&tering"(utiloids"$vaho#(igations$#lle"%zaire#"ca!#ccl',
+    '!,ear-monopoly"%bamun")edle-like#"ld"#gev#%ligee#$roid"#igh",o-classicism#%prene"%retva"+scaf&eacute""t2"\'uralgia$(osurgeon',
+    '#\'tralist")ver-never##ile"#wel#$love#%sdesk$\'readers#$tons!"fa!$gune!\'i-night"$cety#%olaus%$ette"!d',
+    '"(fedipine"!g#\'ht-life(#ght%#ies%#jar%%shift"\'hilists"&jmegen"#mes"*ne-to-five$!r$%teens$#veh#"ny',
+    '#*roprusside"%velle!"ns!(o-frills##win"%bbled#%odies"$ggin#$uchi"\'iseless"#lde"\'minates",n-acceptance\'\'idental$)believers',
+    '%+xperimental$&finite%%ossil$&german%)onococcal$%ideal%+nflationary&/sulin-dependent$(japanese$$life&\'nearity&$ving$\'married%%uslim$$past',
+    '$*qualifying$\'sailing%\'peaking$)taxpayers$$work#&sexist$\'tandard"$rham#$mand\'!e#%semen#(th/south%$cote%#rop"\'se-down',
+    '",t-for-profit#%aries#!h"\'urishes""vi!"pl!&uanced"$dist""it"(llifying"(mber-one&$less#%eroso"%navut"%reyev',
+    '"\'tritive!&vocc\'s!$yunt \'o&amp;y!(\'doherty$%novan!$aken#$wood!*bliterates")servables"&viated!$cchi#+upationally""hs""lc',
+    '#"el!\'dometer!2esophagopharyngeal!+ff-the-cuff(#job((shoulder#&enbach$$rors#*ice-holder#\'loading"#gas"!r"*t-repeated!#ggy!"hp',
+    '"\'ntments!\'kavango"(ey-dokey!&ld-boy$&growth#$bury"\'igomers#%veira"$oron"(salazine"#wen!$maha"#nes#&ibuses"!t',
+    '"&cogene"$drus"+e-bedroomed$&design$$inch$&on-one$$page$&thirty$)upmanship$$word""go"$rush"$site#\'laughts!)pen-sided',
+    '#&rculum"(hioprium#,thalmologist"$orto"!p"$tima!&ralism#*nge-yellow%$utan"%biter#!s"2d&oacute&ntilde;ez#&ainers#&erings#%inate',
+    '".ganisationally%"on%"za#%reave")ientalist"#man#\'ondroyd"$sett"&ynthia!\'sbourne"(cillated(#ors*!y"!o"%preys',
+    '"$sian"!t#+eoarthritis%$path#$land"#yth!%tello!%ualie"$sley"+t-of-bounds\'\'control\'&pocket#\'cidence$$ries#%flank',
+    '%%owths#&lasted#)manoeuvre#(performs$*ut-capital#*side-right#\'working&!n!\'ver-60s%\'arching%(cautious%%eager&(laborate&+xploitation\'&tended',
+    '%$long%%react&#ide%%sized&(tretched$,accumulation$%clyst$*determined&\'veloped$*expression$$feed%"ly$$hand$#lie$\'running',
+    '$%tired%#ype$(wintered%&ritten$!y"$iedo!-wner-occupier!\'xidants$#ise#%metry"$tail")ygenation!#zzy \'p&amp;g!".2',
+    '"!3"!4"!6""g.""h."$p.m.!"/b!#100!"35!"46!%=0.04!$a05l"#cta"%draig#$stow',
+    '"$heri"&id-for#!s"&keezah$$nham"%lings##led$\'iatives##med#&ustris")midronate"#nch#%demic#&egyric$&llists',
+    '#\'kracova#$nell$$iers$#one#%tanal$"on#(yarachun##zer"$paya#!e$(r-making&$thin%\'weights##ist"+ra-military',
+    '$$gons%%uayan$$mour$\'sitical("sm%%tatal#"co#\'enchyma#$fitt#"os$$xysm(!s#$rett#.tially-sighted%(cipators',
+    '*!s%!j%%ngton$#ook$\'y-goers"%smore##sat$%elewe$!u"&tchily#*erfamilias#%hless#&inated\'#ion$&sserie',
+    '##ria%!c%%ngton$$onal"#uly#"me"\'vlovian"%xford!"b/!"co"!w!"dg!+eace-loving&&making&$time',
+    '#$rman"%bbled%!y#!s"#can#&koltia"$dler#$ulla"&ephole"!i#%nture"%lleas%#ted$$ucid"#mex',
+    '##com#\'etrance#%ology#&sioned#(tatonics%!x"$pita#)sinogen-i")rceivable\'"er%#pts$&ipient##era#*functorily#%ianal',
+    '$\'shables%$tyle#$king#+meabilities#\'oration#)petrating$#lex\'%ities#\'quisite#(secutors$%on(s)&%alise"%skova#"th"$tain',
+    '#%erken#+rol-engined%!v#!t$$ifer"%veril!&haeton#\'gocytes#\'ryngeal"!b""ds"&eidias#%nolic%+menologists"$ials',
+    '$$ippi$(ologists$#pot")one-calls&#ins%\'mically$!y#+sphorylates#&tocall&$ells%(electric%\'voltaic"!u"\'yllisia#!s',
+    '#\'nissimo$&oforte#%takov""bs"(ck-me-up$$ling#&nicked"(e\'oh\'pah#$bald#%chnik#"ds#$rces#-termaritzburg#"zo"\'ggeries',
+    '"&lotage""mm##ple%!y"%ncott#$king#&occhio#&pricks#\'striped#"ta#"za"*pe-smoking"!r#%anesi#\'ouetted',
+    '$"es"#t-1#%chers#&eously#$head$#ily##kin#%tston$#ura"$zazz#%zeria$%icato!"kb!#l/i"(ace-name',
+    '%!r#%ngent$$tain&#rum#$taia$)elet-rich)(specific$#ies$#zer#)yer-coach$"ne")easantest$$ting#&beians#(ntifully',
+    '"#ies#$nths"$oidy#&ughmen"!s"$ucks#$gger#\'s/minus!#mdb""is!"nv!"oc##ked"&dkrepa#$zols',
+    '""hl"!i##nte")ker-faced$!y"&lecats$!d#&iakoff$+ce-sergeant$#ses%$hers$.tical-economic&"ka#\'linator#&onaise',
+    '#$y(a)$%andry&$thus$,chemotherapy%%otton$$glot$*merization$(neuritis%)ucleotide$(syllabic*#les"*megranates"#nta$%eland$#iff',
+    '"%ofter#$lewe"%ppers#%sters#)ularizing"*rnographer#\'tacabin$(entously$)osystemic$#sea""sc##her#%itron(!s#\'t-acute',
+    '%,implantation%(medieval%+operatively%&partum$(mistress%\'ultiply$*prandially$.structuralists"$t\'ma#&entate)!s&%iated\'$llas#$omac"%uncey',
+    '%$book"%ynton!"pu!$raag#\'cticing#"ed##nce#&tchett"\'e-dates$%entry$$heat$&modern$(ordained$+publication$$race',
+    '$$tour$&verbal#&ambles#+cariousness$)ipitately$(ociously#(dication("or#$empt#\'figured#\'hensile#!m$\'ultiply#\'p8-cftr$#ass',
+    '#)sentments$$hous$"se%%uring()sed-water)#ing("ze$\'tonpans%$wich#%texts$$rial#"ys"+ice-cutting%$well#$ddle',
+    '#%march$$ulas#%nceps%$ipia#)oritising#\'vateers$#ies"&o-file$&labour$\'nuclear$&syrian#&bables#)ctologist#)digiously$!s',
+    '&$eers&"is$$orma#,gressiveness#(jectiles#&lactin$.etarianisation#$mega%%nades$\'isingly$&ptness$&ulgate)#ing#*of-reading%\'reading',
+    '*!s%\'rtyless$&hesies$&itiate$$ound$\'ranolol#\'scenium%%iutto$)ecutorial#3t&eacute;g&eacute;e$&easome%&in-dna%\'oglycan%\'station$\'hrombin',
+    '$(uberance#%vable$(erbially$)ince-wide"#ude!\'salmist")eudomonas".r1706&ndash;44""ti"!u"#ych%&ically%(o-sexual(%ocial&%genic',
+    '&#ses($xual#$kers!#tes!*ublishable"%ckish"$dsey"\'erperal"&litzer##len#&sation"#mas")nch-drunk%"er&%stown',
+    '#!o"+pil/teacher"$rdey#%ebred#&gative#$ines#%lieus#-pose-designed($made#*se-strings#%veyed"\'t-downs$"in#\'atively#(ting-out',
+    '!&yrexia#(otechnic "q4!%aboos"#lys"$ntas!!i!"pd!\'uacking#(drupling#!i#)rter-mile#,si-religious#\'termass$(trocento',
+    '#\'ensbury&$town##lch#0stion-and-answer"&ibbles#\'etening##ffs##gly#$nlan$$tets#%sling""od"%reshi"!y!%werty',
+    '!#.c.""h.""m.!"/2!!6!#abi#\'scuttle""cs"\'dchenko$%lyffe#"ek#+icalization$*o-cassette%(actively%$head',
+    '""ff"%g-bag#$azzi"\'iltrack#"n\'$\'-forest$#ham$&storms#!s"#jya"$kyat",m&iacute;rez##ada$"ge#%paged',
+    '#$tron""na#&corous#$kers#$soms#"ts""pp"%rebit"&sboras#"en#%hness""th$\'friland$#lin#*iocination',
+    '#"so#$tray"\'ucously#\'schning"$ynes!"dp!*e-affirmed$\'rmament$(ssembled#\'cycling#(designed#%elect$&merges%(phasised$%nters',
+    '(#ped)#ing##fit#$heat#&invent#$live#%match#%opens$$rder%)ientation#(recorded#%start#(thinking#+unification#&vamped',
+    '"\'achable$$tant#(derships$(missions#\'ganites#(l-estate%$wage$&igning%\'sations##ney#&pplied#%soner$)sessments%%igned#!y',
+    '#%ounds##uck")cantation#(eivables$)ptiveness&+or-mediated#)iprocally#\'konable#$line#)ombinants(!e$(ncilable(\'iations%$dite%$nect',
+    '$)rd-holder&$able$*verability#&ursion"\'dcliffe$$oats#$eems#(iffusion#"ox#%uctio\'$vism#%worth"%edbed##fer#"se',
+    '#(lexively#\'ocusing$(rmatting#+urbishments$$ting"(gensburg##gio#(ionalist#"na#\'ulative"&heated&#ing"%ified#%kland#&mposed',
+    '$$hold$(troduces"*jectionist#$oins"$lict$\'quaries#&oading"%mands#!e$!m##iss#%overs"!n#)&eacute;e#!a',
+    '$"to#!d#%tiers#*unciations")occlusion%%upied"*petitively#&laying#\'rimands$!o%$ving"#rum",search-based$"ts#\'huffles',
+    '##its#\'olvable$%nates$&rption$#und#&pecter#$tock\'#ing%)rationist$)rictively$$yled"\'tardant#!e#&initis$$tled',
+    '#\'racting$)ibutivism%%evers(!s$)ogressive#&urnees"\'uniting"$vers&$ions#$ises$(talizing$\'valists##ues"\'winding$"re',
+    '$#und"#yes!"fa!#hea#$nish#)umatology"&iannon#1neland-palatinate#$zome"(os-y-bol""um"\'ydoldog!$ials"$band$!o',
+    '#%osome"\'ce-salt$%rcari#(hborough$!e#&kshaws"%dgway"&ffling"(ggindale#)ht-to-buy%&eously%%wards#&oletto"&jkaard""ma',
+    '"&ngwood&"rm")p-roaring"\'skiness"%ttner""ve$!l$&rbanks"#zla!"mp!"oa#\'dworthy"#bby"&ckfall"\'dchenko',
+    '#"ez##ier$#nal#$well"%edean#!g""hm"&ll-off#"ph#$ston"*manticised)#zed#!s"\'of-tops#&m-mate',
+    '#&schach"&samond$$ries#"ch#(engarten%(kavalier#&hanara##ina#(s-on-wye$"er#\'tovtsev"&taract#%hbury$\'enstein$#ley',
+    '#%ifers"!u#*gh-looking#$lade#)nd-headed%%heads#*te-finding$!h""ve".wbottom/oxford#&ntrees"%yally#$line!"pb"!g',
+    '"!x!%t-pcr"!f!)ubbishing"$dest##man"%ether"%fford"$gosa"&hollah"\'ination",le-following$&making"\'minated\'#ing',
+    '#$time""pe"+ssification#\'ticated$$lers%$ings$"on"$tley#$ting!0yley/environment"#ton $s\'il!#.18"$5(4)""62',
+    '""b.""i."%today!"14!"37!\'aalbach"$bres"%ckful#"ra"$dako#$dens$%lebag#+o-masochism#!r"#eed',
+    '#\'darjung")gittarian"!i##nte&"ny#"ri"#las$#zar#\'icylate$#eri$$nger$&vation#\'t-water$%water"%moans',
+    '#%dbach$"ro$$well#$some#&terres"$ouma""rb#$fraz#%geant#"in#!u"#ssy"\'tinwood$\'rically&#sts',
+    '#&urates"%ucony#&ropods#!x"&vaging#&ernake%!y")xe-weimar"#yre!"bc!%calds$%lywag#"no#\'rcities$%latti',
+    '#(tterplot#&venged""cs",h&ouml;nberg#&eckter$#mer#%immel$%ndler$+stosomiasis#)lumberger#&mincke##olz$+ol-children&%books&%child',
+    '$%oders##umi"%iatic#(entology#)ntigraphy""lm"$olds##nce#&recard%$less$"ns#&t-free$$ches$#mid#$user',
+    '$#pie&#ngs#%eamer$"es#$ibal%%blers$#tti#$unch"\'ullions%!s#"tt%#les!#e99"\'a-water##goe',
+    '#)mstresses#%ports#&t-belt##yak"\'baceous$&stiano")cond-rank\'$tier#/retarial/office"%dgley#\'imented#"um"&ed-bed##lig$!y',
+    '"!f"$gers##ura"\'ineldin##sin"$ldon#/f-advertisement&(ssertive&$ware%.congratulatory(\'sistent%(educated&)ffacement%\'fertile%*generating',
+    '&&ealing%(identity&,nstructional%(managing%+opinionated%%paced\'$rody%+referential\'$gard\'&ported%+sacrificing&\'elected$(lessness#$leck$!y',
+    '$"us#"va",mi-conductor%\'deserts%%rural%+transparent$(ological"$ndak#$ecio#-se-experience$)itisation$&orites$%ually#(tentious"&perate',
+    '#%uelae%$ncer%\'strated$%inned"&rafine#&b-held$-ian-dominated#&enades#$faty#)onegative$*prevalence$#sal#&viette%#ngs"&t-nets',
+    '")ven-point%(ty-fifth",wing-machine"&xiness#$tant#(ualities&.ly-transmitted!"fi"!x!"h2"!3""aa#$cked%"le#(dowlands',
+    '#\'kespear$$hrai#&llowly#%manic\'"sm(#tic$(efacedly$%pooed#\'ngri-la$$klin##rad$\'p-edged$$rock&!n#$tner',
+    '##ves#"wn$!s##ykh"$eers##kel#!n#%rburn$#sby#(ttleston"%i\'ite#&eldaig#&ftwork##loh#&pshape',
+    '&%ights"!l"-ock-absorbing%$wave#(e-string#&osmith#\'pfronts$&lifter#&rrocks$(t-acting&)circuited%$wave##tts#&wcards$$time',
+    '$)nkwrapped$&venham#&ouding#$ubby"$unts#$rton#\'ttering""we!$ibiu##ton#$ylle"&ddiqui#(e-saddle#%mouth#!s',
+    '#$rras"\'geberht#(htlessly%\'screens#\'ning-on#"ua"&lesian#\'verdale"%mmone#)plicities"&necure#&galong$(le-issue&$ness#$o-us',
+    '#)usoidally"#rte"#ssy"%x-man#"er#%penny#\'teenth-!&kandia#%rsnik#(teboards"&erritt%$ymor#$wing$$ness"&illful',
+    '%#ing$!s#&n-care$%flint%"ul$$ners#&rtings#$ttle"*ubiszewski"&ylines!&lacker#$gged#\'nderous#\'te-grey$$tern',
+    '"+eeping-bags)#car%&walker#(nderness"$icer#%ngsby#&ppered#$tted"$oman##ths"!t"$udgy##shy!"m2"%ailes',
+    '$"l-%$wood##rmy$$tdrv#$sher""cc"#ite"-oking-related#+oth-talking#%thers""rs!#n-2"&agging#%ppers"&iffers',
+    '#\'wballed$&fields$$hill$%shill"(ub-nosed!"o2"&akaway##ped#%raway""c.#$iete$+o-technical"$ffex#(t-bodied"#glo',
+    '""ke"&ld-out#$heim##per"&mbrero#&eplace$!s"&ndheim#&icated"(othsayer"\'phronia#+rintendente"$raya##bus#$rier',
+    '"!u#$dley#,ffl&eacute;s#\'ndcheck%#est%$hole%\'proofed#(rce=able#+th-easterly%$wick")viet-made"#yer!"p."(aced-out#!g',
+    '$!k#(rrowhawk$%tacus#$xton##yed""ck"!e#"an#,cial-purpose\'(izations%\'es-rich%&fiable$&tacled%"or%-rophotometers',
+    '$%dlink$!r##irs#)llbinding%#ers##rry#%yhawk"\'ice-box#&derman%!x#"le$#sby#%n-out#\'ritedly#%thead',
+    '"*okespeople#$leto##oks",rague-dawley#%igged&!s$)ng/summer&$burn"(uttering!(quabbled$)re-headed&!r%#ish$!w#*eamishness',
+    '##ibb$"ds$\'rearchy!"ra"!n"#rna!\'t-denis"(a&euml;l#\'bilizer*!s$"ly#\'ff-room#\'inforth%$more%#rod',
+    '$$kers#&nbrook$,dard-setting(%izing%!i$#ier%%slaus($vsky$#low$%worth#(r-struck$$ches$$lets$(t/finish#)te-funded',
+    '%$room%%s-led&\'manlike$*ion-master%"st#!x#)y-at-home$"er"*eam-engine#&delijk$#man#)el-rimmed$#nie$&pening$$tley',
+    '#"mp#%ndhal$#ted#*p-children$!h$#toe#$rnal%#est%$ness"&ick-on#)ff-necked%#est#&lettos#%rland#"tt',
+    '%#mar#+ichiometric%!s#$kill$%owski#"ll#$mata#)ne-walled%$gate%%haven%&masons$#ham#(p-motion%$over%%start',
+    '$)y-tellers%\'tellers#$ttie"!r##ada$%fford$\'ightest$/nd-on-the-green&#ing%$gler&&ulated$&tagene%$hbeg&%speld)!y',
+    '%\'t-level&%lamps$"ga$(ptavidin&\'ococcus$"sa$!w#%iated$$chen$%dency$\'fe-torn$\'ke-slip$(ngfellow#(oke-play$$phes',
+    '&%water#&udwick$!m"!s"&uccoed$$k-up#"dd#&ffings#%nters!&uavely"&b-aqua$&degree%)iscipline$\'editors$\'letting',
+    '%#ost$,underwriters#*additivity#$crop#+directories$\'ominant#%hadra#)jectivist#%lease#\'machine%&trices$&erging$*issiveness#\'optimal#\'sidises',
+    '$*tantiating)$vely%+itutability#\'tenants$$otal#\'vention%#rts#$ways"$chet")detenland"$eing""fi"\'garbeet%%cubes#(gestible',
+    '"!h"!i"&laiman#"ly#$tana"\'merians#$mala"(n-kissed$&tanned#%/star#%block#%cream#*day-school$$ered$$ress',
+    '#\'express#%niest")per-power&$rich%(antigens%$bowl%\'coiling%&heated\'%lical%&intend%#men&#ini%&normal\'#vae%%posed',
+    '&$tate\'(ructures##ped$%liant"-rface-mounted#)realistic"#tra#$ured!\'vengali#%tlana!#w1p#!w"%abbed#"mi##nky',
+    '"(eatshops#\'epstake$&tening"&iftest#&ndling$#ger#(ss-based#\'tchgear#$vels"%ooned%#ing#&rdsmen!(ycamores#\'ophants"\'llabubs',
+    '#%phide"#mes#(pathises$%honie#!s"%ncope%$rdia#(dicalism#!e$%rgies#$gman#%onymy$$vial#\'thetase"\'phoning',
+    '#*ian-backed!$zell *t&ecirc;te!(-section!".4!!5!#805!&a&iuml"&ble(s)$#ing##riz#%ulate"$cker##oma"(dchester',
+    '"\'la-tala#\'entless##kie#"on"%mbour\'$ines#!m$#uz\'"\'nqueray""p1#!2#%pings#$room"%rbuck#"es',
+    '#"ns#!r##sus"+sk-oriented#&tebuds"%ubman#$rean%!g#)tological"*xi-drivers$\'dermist#\'onomies$!s#$ying"\'ylorism',
+    '#%cakes")chniquest"\'diously"$eing##med#%naged##ter$(otallers"#f-1"$hiya")ignbridge"$ldec#\'efunken$&graphs$$mann',
+    '$&phonic)#sts%$oint$&scoped$#uts$&visual#%lenor$#ies#&omeres"!m#%pests$#ing$&tingly"%n-man##giz',
+    '#&uously$$rial"&radata#)centenary#%entia#$hune##kel#$ling#(ra_firma%#ins%#nes$%orize#%ylene"%sfaye"%thers',
+    '#)racycline%&hedral&%ymena%&zolium$"is"\'versham"(xturised!"fp!%glp-1!-halassiothrix$$berg##sos#&tchers#$xted"+e_most_part',
+    '$(tregoers##gns#"in#&ocracy$(rization\'!e(!d#,rapeutically$$efor%#sia$)moplastic$"on#&spians"&inkpad$$ners',
+    '$$kett$%sting$)ty-minute\'#odd\'(year-old"\'ompsons#%resby$#ium$$kell$%nbury%&ycroft$)oughbreds$&peness$%sbury")ree-night',
+    '$"sh##igg#!o$(ckmorton#(ushcross%$ters")underclap\'&struck$!k#*ringiensis$!n!&ickell%$ting"$ddly##ies',
+    '#!n"*ght-fisted"%mbres$#ury#&e-bomb%%lapse%\'varying$$bomb$(s-herald#%orese""ne#!k#$ning#$ting"$ppex',
+    '"%rades#"gu"*tle-holder#&tering"!w!"me"!l!#nps!%o-ing")astmaster"*bacconists",day/20.10.93#!i"\'e-nails"%ffler',
+    '"\'lbukhin#&l-free$!y#$uene"(nalities%"ly#$gued##ner"&oltalk##tal"\'p-rated#&cliffe##ham#(ic-shift"\'rmentum',
+    '#,que/position"(talities"*uch&eacute#&gh-guy#$quet#$rnai#$vier"(werlands#*n-planning$&swomen#%paths"&xocara"%yland!+rabajadores#&ceried',
+    '$\'heotomy#$inor$#pse#)nsaminase%\'ceivers%(fections%(gressors%#its%&manche&$ural%)nationals%&ponder\'$sons%\'versely#&p-door',
+    '#$shed#$vnik"+eaty-making#%degar#\'e-house%$like#%garon#&llises#(tchikoff#,uhandanstalt#!w"%iadha%"ic$!s##ble',
+    '%$iest%%sters$#ord#*glycerides#&llions#(nitarian#$somy#\'vialise"#nas#!c"%occhi#!g#%lling%"op#"pe',
+    '#*uble-maker((shooting$%sseau$%tbeck"%uckle$\'ulently#$isms#%mping#\'ncation#%scott$&tingly!"se"(khinvali!#uam"#ber',
+    '"\'dorbury""ll$%ivers"%mbril#&myache"%nable#\'elessly##gus"%polev"+rbo-charged#$enne##han#"ku#(n-around%%round',
+    '#%rican"&ssauds$#les$#ock\'!s\'!y"(t-tutted(#ing#$bury#&hanach#$ting!"vl!&weddle#*lve-thirty#$nty-',
+    '#"rp"$ilit#(n-bedded#+ston-davies#&ttered")o-for-one$&hourly$#one$$page%%layer$%round$&timing$"up!$ycho""me',
+    '$!n")pesetters""ro"$umen!(zani-bey #u\'s!#-21!%.d.c.!%baldo"#ogu!"cc"&kfield"!l!)ddingston"!g',
+    '"\'fington!\'g/litre"$arte!$huru!"ig"#m/x!\'kranian!#lna"$tima&$tums#+ra-orthodox%$dian%)structure!"n-"(arguable',
+    '#&udited#(wareness"\'banning##end#%olted$#wed#\'undling$&rdened%#ied%"nt"(carpeted#\'ensored#&hained%\'ritably#(ivilized',
+    '#%oiled$(mmercial$\'ncealed$$rked%)roborated#\'reative#$tion#(urtained"(deformed$*r-estimate&+secretaries%%brush%$city%#fed%(garments',
+    '%%noted%$play%&scores&#hot&$pent&$teer\'$orey#\'ismayed##oes$\'ubtably"(edifying")fastening#%enced$(rtilized#\'iltered',
+    '#\'lagging#)orgivably#%reeze$$ozen#%unded%"ny$"rl&#ing"!g#"ar#%lazed"*historical"*influenced#$soft#)versalist',
+    '"\'leashes#(ikeliest#&ovable"%manly$"sk#(entioned#\'issable#(otivated"(numbered"*pardonable#)rejudiced$\'intable$(opitious"*regenerate##ipe',
+    '"(screwing#%ealed%\'sonably)!l$-lfconsciously&%ishly)$ness#\'inkable#%liced#(weetened"+threatening#%ruths")utterable*!y"&vented',
+    '"%waged#)orthiness!&p-date")gradeable"*holsterers"\'minster"!p#/er-intermediate&,middle-class"#son""to!\'ralmash"&banely%#ism"#iah',
+    '""na"%ology!.s&dollar;1,500*%2,500+"00-(,000,000*%4,000+*00,000,000*+500,000,000"%-made"%eable"\'herette""ta#$inov!&thwatt',
+    '"%terer!#v-b"%istat!"we .v&eacute;zelay"+ouml;lkisch!(-bombers"!c!#.r.!\'acating#$uity"\'gnorius"*inglorious##sey"+l&eacute;ry',
+    '$#ria#"li%!s#(ue-laden"&nadium#\'derbilt#"es#%gmoor#*tage-point"\'porised"#rdy##ela##ney$&ishing"(silariov',
+    '##ter"$ughn!%cam-1!&eiling"\'lasquez#"de"&randas#$bier##don##ena$!y##gil##lag#&onique#%tices',
+    '#%veine""sa##tal$&ibules"$toes!(iareggio"$bram#%urnum"%cenzo#"us"%eille"&gneron"&ktring"!m""na',
+    '"#res##gie%)nia-based#\'tuously"\'s_a_vis#"by#&counts#*ible-trade$!x""te$!z#%rodur$%uvius!#lps!$mark',
+    '!+ocalisation#!e#!s"\'lcanics#\'umetric$#tes##vos"(rarlberg"$sper"&yagers!"p7!(ranitzky"%onsky#"om!(ulcanian',
+    '!%yborg"&gotsky"$rnwy $w.i.""r.!"1n!#aal"\'cc-la/c""da##don#"is#$kins"%gered%!s#%staff',
+    '#!l"!i#$kato#$vers"%keman#"il""li#$kin\'$$mans$$over#(lenstein$&flower##vis"\'namaker#\'derlust',
+    '"\'rhorses#$mers$&inster##nes#$thog#%wicks"%sdale#&hbrook$%ed-up$,ing-machines\'!s\'$tons$"oe$%stand#$pish',
+    '%!r&!s"\'tchable%%tower#)er-bottle&&logged&%tight%%borne\'"ys%*colourists%%field%%melon%%sheds&"on&$tone',
+    '"&veband$&number"$yans#(wardness!!b!,eatherbeaten"(bb-bowen"*dding-ring#&gewood#!s")edkillers#!l#!m"-ight-training&&lifter',
+    '"-ll-controlled%\'endowed%\'planted&%roven%)rehearsed%&suited%&versed#+tanschauung""nd$"ed%"rs$#ler$$over#$sley"$ssel',
+    '$(moreland$#way!#gec!%hacks##ley"(eatcroft%"on#$elie#"lp#&tstone"%icker#%ggish#%llans#%mbrel$$pers',
+    '#%ppets#$skas%!s#\'tbreads$)e-fronted%$horn("se%%locke%&s-only&$nake%!y$$more$$tler")ole-class%(someness',
+    '#%ppers#&soever!%icken&!s%%rwork")de-screen"%ggles#$town"*ldernesses$$wood#!e#%fried#*helmshaven#$lmot$#ses',
+    '#$pish"#n32#%ching##d/u$"le$(ow-frame#%eskin#%gspan#!n$$able$%ingly$%owing#"os"#rth"$sard',
+    '"&tching#"he%&ringly$#in\'##ter$&icisms%#est%$ngly!#jec!"lf!#ogs"\'lfkings$#ram#!l$!o',
+    '"(manising#$bles"&od-way$$enly%$rson$$pile$\'turning#\'lacombe$"ey$#ies##sie"+rd-of-mouth&\'riented%$play%\'strings',
+    '$*processing#\'k-based$&horses$%rooms#*ld-beating%!e%$view#%sdale!"pp!#rac#$iths"&iterly!"tb"!n!$urgh',
+    '"!r!$ylam"\'mondham #x-1!#100!+anthopoulos"$rkon!"d5!$enix#\'obiotic$%liths!"f6!"g7!$h558!#ian',
+    '!$tree!#uxa!#xiv"$viii (y-fronts!!1!$a4c5"(g&uuml;e"$hoos"$lden#&ikavak##lop"#nek##gon#$nick',
+    '"!p"#qub"&rrundi"#sak"!t#!e!!d!$e-es"&ar-ago"!b")llowstone&!y"#nan#$isei"\'ovilton',
+    '!"fc!%ippee!%obbos"#kel"&ungman!!s!#ung!#von #zab#&riskie""fy"!m#%bians"#ppa"#rco',
+    '!"ee"%mstvo""ng")ro-coupon$"ed!%iggie#&zagged\'#ing"&noviev"$p-up#"po""ta##her!$lorf!$nf25',
+    '!$ulus"!m!%verev!(ygomatic$"te',
 )
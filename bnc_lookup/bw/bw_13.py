@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_13 = (
+count_13 = 6695
+
+heads_13 = (
     '&aacute',
-    '&aelig;thelnoth',
-    '&agr;-truncated',
-    '&amp;p',
-    '&ast&ast',
-    '&bgr;-globin',
-    '&darr',
-    '&dgr;g',
-    '&dollar;0.20',
-    '&dollar;1,000,000',
-    '&dollar;1,100',
-    '&dollar;1,600m',
-    '&dollar;1,700',
-    '&dollar;1,900',
-    '&dollar;1.25',
-    '&dollar;1.6',
     '&dollar;1.6m',
-    '&dollar;1.80',
-    '&dollar;100&ndash;150,000',
-    '&dollar;1000',
-    '&dollar;120',
-    '&dollar;120,000',
-    '&dollar;125',
-    '&dollar;13,000',
-    '&dollar;130m',
-    '&dollar;150,000,000',
-    '&dollar;16,000',
-    '&dollar;160,000',
-    '&dollar;17,000',
-    '&dollar;17m',
-    '&dollar;180',
-    '&dollar;2.4m',
     '&dollar;22',
-    '&dollar;22m',
-    '&dollar;28',
-    '&dollar;3,300',
-    '&dollar;3.9m',
-    '&dollar;4.2m',
-    '&dollar;4.3m',
-    '&dollar;400,000,000',
-    '&dollar;45,000',
-    '&dollar;450',
-    '&dollar;5,500',
-    '&dollar;5.3m',
-    '&dollar;50,000,000',
-    '&dollar;5000',
-    '&dollar;55',
-    '&dollar;600m',
     '&dollar;65',
-    '&dollar;7,500',
-    '&dollar;75,000',
-    '&dollar;8.6m',
-    '&dollar;800m',
-    '&dollar;90',
-    '&dollar;99',
-    '&dollar;9m',
-    '&eacute;litism',
-    '&frac14&ins',
-    '&frac15',
-    '&frac34&ins',
-    '&micro;mol/g',
-    '&ohgr',
-    '&pound;1.19',
-    '&pound;1.2bn',
     '&pound;1.70',
-    '&pound;1.89',
-    '&pound;10.5',
-    '&pound;109',
-    '&pound;10bn',
-    '&pound;118',
-    '&pound;119',
-    '&pound;120m',
-    '&pound;128',
-    '&pound;136',
-    '&pound;145,000',
-    '&pound;159',
-    '&pound;17,500',
-    '&pound;170,000',
-    '&pound;190m',
-    '&pound;2,600',
     '&pound;2,700',
-    '&pound;2,800',
-    '&pound;2.80',
-    '&pound;205',
-    '&pound;220,000',
-    '&pound;22m',
-    '&pound;23.50',
-    '&pound;235',
-    '&pound;249',
-    '&pound;265',
-    '&pound;26m',
-    '&pound;27.99',
-    '&pound;28.50',
-    '&pound;28m',
-    '&pound;3.3m',
-    '&pound;3.4',
     '&pound;3.7',
-    '&pound;309',
-    '&pound;31m',
-    '&pound;320,000',
-    '&pound;35.00',
-    '&pound;350m',
-    '&pound;370',
-    '&pound;385',
-    '&pound;399',
-    '&pound;3bn',
-    '&pound;3million',
-    '&pound;4,800',
-    '&pound;4.8',
-    '&pound;43m',
-    '&pound;44,000',
-    '&pound;440',
     '&pound;450m',
-    '&pound;460',
-    '&pound;499',
-    '&pound;4bn',
-    '&pound;5.75',
-    '&pound;51',
-    '&pound;52,000',
-    '&pound;520',
-    '&pound;55m',
-    '&pound;57',
-    '&pound;58,000',
-    '&pound;59.95',
-    '&pound;6.3',
-    '&pound;6.6',
-    '&pound;630',
-    '&pound;66,000',
     '&pound;67',
-    '&pound;695',
-    '&pound;6bn',
-    '&pound;7.75',
-    '&pound;750m',
-    '&pound;75m',
-    '&pound;795',
-    '&pound;8.00',
-    '&pound;8.5',
-    '&pound;81',
-    '&pound;82',
-    '&pound;92',
-    '&pound;93',
-    '&pound;95,000',
-    '&pound;97',
-    '&pound;98',
     '&pound;99.99',
-    '&scaron;tanjel',
-    '&sharp',
-    '&times;10',
-    '&times;75',
-    '\'87',
-    '\'ell',
-    '\'flu',
-    '\'he',
-    '\'imself',
-    '\'she',
-    '+/-',
-    '+4',
-    '-15',
-    '-9',
-    '-axis',
     '-but',
-    '-e',
-    '-induced',
-    '-like',
-    '/a',
-    '/c',
-    '/f',
-    '0&middot;5',
-    '0&ndash;14',
-    '0&ndash;6&ndash;0',
-    '0&ndash;60',
-    '0.16',
-    '0.22',
-    '0.26',
-    '0.28',
-    '0.32',
     '0.38',
-    '0.5&ins',
-    '0.60',
-    '0.66',
-    '0.75%',
-    '0.85',
-    '0.88',
-    '0.95',
-    '0000',
-    '001',
-    '00:14',
-    '0206',
-    '041',
-    '0481',
-    '0500',
-    '0602',
     '0603',
-    '0604',
-    '0703',
-    '0734',
-    '0753',
-    '090&deg',
-    '0bn',
-    '1&frac34',
-    '1&ndash;11',
-    '1&ndash;12',
-    '1&ndash;2-3',
-    '1&shilling',
-    '1(4)',
-    '1,050',
-    '1,150',
-    '1,2,3',
     '1,280',
-    '1,300,000',
-    '1,350',
-    '1,500m',
-    '1-iron',
-    '1.0%',
-    '1.1.3',
-    '1.16',
-    '1.2.1',
-    '1.21',
-    '1.3.4',
-    '1.30&ndash;4.30pm',
-    '1.30am',
-    '1.35',
-    '1.37',
-    '1.40',
     '1.55',
-    '1.5mm',
-    '1.65',
-    '1.6m',
-    '1/3',
-    '10&ndash;15%',
-    '10&ndash;5',
-    '10-14',
-    '10-member',
-    '10-week',
-    '10.16',
-    '10.35',
-    '10.4%',
-    '10.6%',
-    '10.9%',
-    '10/65',
     '100&ndash;1',
-    '100&ndash;200',
-    '100-fold',
-    '100-mile',
-    '100-year-old',
-    '1003',
-    '1005',
-    '100kg',
-    '1010',
-    '1022',
-    '1026',
-    '1028',
-    '103/4',
-    '1031',
-    '1042',
-    '1051',
     '1056',
-    '1063',
-    '1096',
-    '1097',
-    '10b-5',
-    '10cms',
-    '10p11.2',
-    '11&frac12',
-    '11&ft',
-    '11&ins',
-    '11&ndash;1',
-    '11&ndash;8',
-    '11-14',
-    '11-month',
-    '11.12',
-    '11.13',
     '11.2%',
-    '11.3%',
-    '11.8%',
-    '1101',
-    '1106',
-    '1108',
-    '110mph',
-    '1111',
-    '112,000',
-    '1125',
-    '1127',
-    '1159',
-    '1160',
-    '1171',
-    '1177',
-    '1181',
     '1191',
-    '11a',
-    '11ft',
-    '11pc',
-    '11s',
-    '12(2)',
-    '12,000,000',
-    '12-15',
-    '12.15',
-    '12.20',
-    '120&deg',
-    '1203',
-    '1207',
-    '120p',
-    '1212',
-    '1214',
     '1216',
-    '1220',
-    '1227',
-    '1236',
-    '1238',
-    '1244',
-    '1247',
-    '1248',
-    '1266',
-    '1287',
-    '12b',
-    '13.',
-    '1309',
-    '1331',
-    '1339',
-    '1349',
     '134a',
-    '1355',
-    '1358',
-    '1362',
-    '1367',
-    '1368',
-    '1372',
-    '1386',
-    '1390',
-    '1399',
-    '13ft',
-    '13s',
-    '14&ndash;18',
-    '14(2)',
-    '14(3)',
-    '14-1',
     '14-inch',
-    '14.75',
-    '1402',
-    '1412',
-    '1422',
-    '1429',
-    '1433',
-    '1435',
-    '1444',
-    '1448',
-    '145,000',
-    '1456',
-    '1459',
-    '1468',
-    '14in',
-    '15-10',
     '15-12',
-    '15-13',
-    '15-day',
-    '150%',
-    '1501',
-    '1506',
-    '1574',
-    '15g',
-    '15oz',
-    '15s.',
-    '16-page',
-    '16.00',
-    '16.9',
-    '16/17',
-    '16m',
-    '16mhz',
     '17,500',
-    '17-19',
-    '17.',
-    '18&ndash;24',
-    '18+',
-    '18-year',
-    '18.5%',
-    '186,000',
-    '18ft',
-    '19-year',
-    '19.6',
-    '19.7',
-    '1911&ndash;12',
-    '1912&ndash;13',
-    '1933a',
-    '1939&ndash;40',
     '1945&ndash;51',
-    '1960&ndash;64',
-    '1964&ndash;70',
-    '1970&ndash;71',
-    '1971b',
-    '1972b',
-    '1973&ndash;4',
-    '1973a',
-    '1974&ndash;7',
-    '1975b',
-    '1977&ndash;78',
-    '1977&ndash;8',
-    '1979&ndash;81',
-    '1981&ndash;85',
-    '1986-88',
-    '1988&ndash;90',
     '1988.',
-    '1988/9',
-    '1989&ndash;91',
-    '1990c',
-    '1991-95',
-    '1991.',
-    '1992.',
-    '1992a',
-    '1994&ndash;95',
-    '1995-96',
-    '1g',
-    '1oab',
-    '1sec',
-    '2&deg;c',
-    '2&frac34',
-    '2(8)',
     '2,3',
-    '2-5',
-    '2.19',
-    '2.23',
-    '2.30am',
-    '2.35',
-    '2.4.2',
-    '2.40',
-    '2.5-litre',
-    '2.5cm/1in',
-    '20&ndash;21',
-    '20&ndash;22',
-    '20&ndash;26',
-    '20&ndash;29',
-    '20,000,000',
-    '20-30',
     '20-foot',
-    '20.00.',
-    '20.7',
-    '20/20',
-    '200&ndash;300',
-    '2004',
-    '2007',
-    '20cm/8in',
-    '20km',
-    '20lb',
-    '20min',
-    '20mph',
-    '21-23',
-    '21.1',
-    '21.2',
-    '21.3',
     '210,000',
-    '22-24',
-    '22-25',
-    '22.4',
-    '22.9',
-    '23.3',
-    '24-26',
-    '24-member',
-    '24.1',
-    '240k',
-    '246&sol;89',
-    '24h',
-    '24ins',
-    '25-mile',
-    '25.5',
-    '256kb',
     '25kda/50kda',
-    '26&ndash;27',
-    '26.2',
-    '26p',
-    '27.5',
-    '28.2',
-    '28.5',
-    '28mm',
-    '28p',
-    '29&ndash;30',
-    '2f',
-    '2i',
-    '2min',
-    '2tsp',
-    '2x1',
-    '3&ndash;7',
     '3&ndash;8',
-    '3,500,000',
-    '3-litre',
-    '3-year',
-    '3-year-old',
-    '3.05',
-    '3.1.1',
-    '3.1.2',
-    '3.27',
-    '3.28',
-    '3.35',
-    '3.3v',
-    '3.4.1',
-    '30&ndash;40%',
-    '30-40',
-    '30.4',
     '300&ndash;400',
-    '30g',
-    '32p',
-    '32v',
-    '3300',
-    '340,000',
-    '350&deg;f',
-    '35s',
-    '36.5',
-    '36541-42',
-    '37.5%',
-    '37040',
-    '37107',
-    '37245',
-    '37260',
-    '37313',
     '37322',
-    '37471',
-    '37523',
-    '37526',
-    '37527',
-    '37535',
-    '37608',
-    '37631-41',
-    '37661',
-    '37718',
-    '37774',
-    '37899',
-    '37957',
-    '37958',
-    '37964',
-    '37979',
     '38.5',
-    '38006',
-    '38096',
-    '38110',
-    '38155',
-    '38164',
-    '38289',
-    '38298',
-    '38309',
-    '38340',
-    '38355',
-    '38458',
-    '38532',
-    '386dx',
-    '38922',
-    '39,000',
     '39008',
-    '39p',
-    '3n',
-    '4*',
-    '4-4',
-    '4-ply',
-    '4-string',
-    '4.1.2',
-    '4.16',
-    '4.2.3',
-    '4.30am',
-    '4.4.1',
-    '4.5.1',
-    '4/5',
-    '40&ndash;60',
-    '400&deg;f',
     '400dpi',
-    '400g',
-    '40cm',
-    '40m',
-    '40mph',
-    '4100',
-    '42&ins',
-    '424mb',
-    '426mb',
-    '42s',
-    '430s',
-    '45&ndash;50',
-    '45&ndash;60',
-    '45&ndash;64',
-    '450mm',
-    '46.4',
     '48h',
-    '49p',
-    '4:1',
-    '5&ndash;10%',
-    '5&ndash;11',
-    '5&ndash;24',
-    '5,200',
-    '5,600',
-    '5-10',
-    '5-8',
-    '5-aminosalicylic',
-    '5-series',
-    '5-star',
-    '5-year-old',
-    '5.00pm',
-    '5.19',
     '5.21',
-    '5.29',
-    '5.3.4',
-    '5.30am',
-    '5.39',
-    '5.4.1',
-    '5.4.2',
-    '5.4.3',
-    '5.50',
-    '5.8%',
-    '5/6',
-    '500cc',
-    '501s',
-    '50hz',
-    '51,000',
-    '528',
     '52nd',
-    '54(4)',
-    '544',
-    '550c',
-    '554',
-    '558',
-    '569',
-    '56th',
-    '58-year-old',
-    '594',
-    '597',
-    '59th',
-    '5d.',
-    '5gb',
-    '6&ndash;12',
-    '6&ndash;5',
     '6,000,000',
-    '6,600',
-    '6,800',
-    '6-5',
-    '6-inch',
-    '6.18',
-    '6.19',
-    '6.2.3',
-    '6.23',
-    '6.24',
-    '6.3.2',
-    '6.4.1',
-    '6.5&ndash;7.0',
-    '6.6%',
-    '6.8%',
-    '6.9%',
     '6/7',
-    '60&ndash;64',
-    '60-day',
-    '60-member',
-    '600cc',
-    '600mm',
-    '600p',
-    '60mw',
-    '612',
-    '616',
-    '61st',
-    '64k',
-    '65&ndash;74',
-    '65+',
-    '66-year-old',
-    '6600',
     '67-year-old',
-    '6700',
-    '677',
-    '68040-based',
-    '681',
-    '682',
-    '683',
-    '69-year-old',
-    '691',
-    '695',
-    '697',
-    '69p',
-    '69th',
-    '6f',
-    '6km',
-    '6x',
     '7,200',
-    '7-9',
-    '7.2%',
-    '7.25',
-    '7.3%',
-    '7.3.2',
-    '7.6cm',
-    '7.75',
-    '7.8%',
-    '70&deg',
-    '70&deg;c',
-    '70&deg;f',
-    '70000',
-    '700s',
-    '703',
-    '71-year-old',
     '72,000',
-    '72-year-old',
-    '721',
-    '722',
-    '726',
-    '738',
-    '743',
-    '74th',
-    '75mph',
-    '76,000',
-    '764',
-    '769',
-    '77th',
-    '78,000',
-    '781',
-    '784',
     '78rpm',
-    '78th',
-    '793',
-    '794',
-    '7cm',
-    '7lbs',
-    '7oz',
-    '8&ndash;6',
-    '8,000,000',
-    '8.00am',
-    '8.12',
-    '8.2.2',
-    '8.33',
-    '80&deg',
-    '80&deg;c',
-    '804',
     '80486dx2',
-    '809',
-    '80ft',
-    '80mb',
-    '81-year-old',
-    '82-year-old',
-    '823',
-    '83,000',
-    '8400',
-    '849',
-    '85p',
-    '865',
-    '866',
-    '86th',
-    '871',
-    '873',
     '8b',
-    '8c',
-    '8cm',
-    '9&frac12',
-    '9(1)',
-    '9(3)',
-    '9-0',
-    '9-4',
-    '9.14',
-    '9.15am',
-    '9.18',
-    '9.20',
-    '9.3.0',
-    '9.45am',
-    '9.5.0',
-    '9.6%',
     '901',
-    '902',
-    '907',
-    '909',
-    '90cm',
-    '910',
-    '912',
-    '921',
-    '924',
-    '936',
-    '942',
-    '943',
-    '95&deg;c',
-    '95,000',
-    '959',
-    '964',
     '969',
-    '971',
-    '972',
-    '975',
-    '=0',
-    'a-b',
-    'a-d',
-    'a-line',
-    'a-u',
-    'a.b.',
-    'a.h',
-    'a.p.',
-    'a/b',
-    'a38',
-    'a64',
-    'a74',
     'aahs',
-    'aamir',
-    'aardvark',
-    'abbeville',
-    'abbotsbury',
-    'abdelkader',
-    'abdoulaye',
-    'abdullahi',
-    'abeam',
-    'abelson',
-    'aberdeen-based',
-    'aberdour',
-    'aberdulais',
-    'abet',
-    'abjection',
-    'abjure',
     'abney',
-    'abomasum',
-    'abominations',
-    'aboot',
-    'aborting',
-    'aboyeur',
-    'abridge',
-    'abrogate',
-    'abruzzo',
-    'absented',
-    'ac/dc',
-    'acceleration/deceleration',
-    'accelerations',
-    'accredit',
-    'acetylated',
-    'acetylene',
     'achlorhydria',
-    'achlorhydric',
-    'achtung',
-    'acid-free',
-    'acini',
-    'acqua',
-    'acromegaly',
-    'acrylix',
-    'actaeon',
-    'actio',
-    'acupuncturist',
-    'adagietto',
-    'adamantium',
-    'addenda',
-    'adebayo',
-    'adepts',
     'adi',
-    'adit',
-    'adjacency',
-    'adjoin',
-    'adman',
-    'admen',
-    'admonitory',
-    'adrenergic',
-    'adsw',
-    'adulterated',
-    'adulterer',
-    'adur',
-    'aero-engines',
-    'aerogrammes',
-    'aesthetes',
-    'aethelwealh',
     'afb',
-    'affinis',
-    'afire',
-    'afrique',
-    'after-hours',
-    'agers',
-    'agglomerations',
-    'agglutination',
-    'aggrandizement',
-    'aggravates',
-    'aggravations',
-    'agin',
-    'agisters',
-    'agriculturalist',
-    'agrokomerc',
-    'agronomists',
     'aguinaldo',
-    'ahds',
-    'ahidjo',
-    'aikau',
-    'aikhomu',
-    'ails',
-    'aimer',
-    'ainley',
-    'ainscough',
-    'ainsley',
-    'air-dried',
-    'air-launched',
-    'air-sea',
-    'air-traffic',
-    'airds',
-    'airhead',
     'airlifts',
-    'airlocks',
-    'airplay',
-    'airstream',
-    'aisne',
-    'ak-47',
-    'ak47',
-    'akass',
-    'al-',
-    'al-arab',
-    'al-hakim',
-    'al-khalifa',
-    'al-nahayan',
-    'al-thani',
-    'alamans',
-    'albatros',
     'albertville',
-    'albi',
-    'albicans',
-    'albinism',
-    'alborne',
-    'alcibiades',
-    'ald.',
-    'aldborough',
-    'aleena',
-    'aleksandur',
-    'alfreda',
-    'alga',
-    'algeciras',
-    'alghero',
-    'alicante',
-    'aligns',
     'alitalia',
-    'alkalinisation',
-    'all-dancing',
-    'all-enveloping',
-    'all-rounders',
-    'all-share',
-    'all-women',
-    'allaying',
-    'allhallows',
-    'allium',
-    'allocator',
-    'allover',
-    'almanacs',
-    'almshouse',
-    'alois',
-    'aloni',
     'alopecia',
-    'alphawindow',
-    'alphawindows',
-    'alte',
-    'alterity',
-    'althusserian',
-    'alun-jones',
-    'alyssum',
-    'am.',
-    'amanieu',
-    'amaru',
-    'amberley/pulborough',
-    'amboise',
-    'ambra',
-    'ambrosiano',
-    'america/caribbean',
     'americanism',
-    'amethysts',
-    'amies',
-    'aminoglycosides',
-    'amitha',
-    'amlwch',
-    'ammianus',
-    'amoebae',
-    'amortisation',
-    'amortised',
-    'ampicillin',
-    'amputee',
-    'amtrak',
-    'anaglypta',
-    'anagrams',
-    'analogizing',
     'anarchical',
-    'anathemas',
-    'anchoress',
-    'andaluc&iacute;a',
-    'anderlecht',
-    'andesites',
-    'andrade',
-    'anemometer',
-    'anglians',
-    'anglicised',
-    'angotti',
-    'anh',
-    'animacy',
-    'animators',
-    'animosities',
-    'anker',
     'ankh',
-    'ankh-morpork',
-    'annal',
-    'annam',
-    'annelids',
-    'annulling',
-    'annus_mirabilis',
-    'anoint',
-    'ansbacher',
-    'antennas',
-    'anthill',
-    'anthranoid',
-    'anti-conservative',
-    'anti-corn',
-    'anti-cruelty',
-    'anti-foreigner',
     'anti-heroes',
-    'anti-matter',
-    'anti-perspirant',
-    'anti-rabbit',
-    'anti-religious',
-    'anti-slave',
-    'anti-trade',
-    'antigravity',
-    'antihistamines',
-    'antinuclear',
-    'antiparticle',
-    'antonescu',
-    'antoninus',
-    'anubis',
-    'anz',
-    'aob',
     'aoncrf',
-    'aotearoa',
-    'aphrosyne',
-    'apnoea',
-    'apollon',
-    'apologetics',
-    'apologizes',
-    'apostolate',
-    'appal',
-    'appetitive',
-    'applauds',
-    'applique',
-    'apraxia',
-    'april/may',
-    'apv',
-    'aquacryl',
     'aquaculture',
-    'aquavit',
-    'aquileia',
-    'arabie',
-    'aragonite',
-    'arak',
-    'arbil',
-    'arch-enemy',
-    'archdeaconry',
-    'archiv',
-    'archosaurs',
-    'arcos',
-    'arcturus',
-    'ardneavie',
-    'aris',
-    'ariston',
     'arithmetically',
-    'arkady',
-    'arkaig',
-    'arks',
-    'armadale',
-    'armadillos',
-    'armas',
-    'armature',
-    'armley',
-    'armourer',
-    'arnaldo',
-    'arrancay',
-    'arrangers',
-    'arrant',
-    'arrhenius',
-    'arridge',
     'arrondissement',
-    'arrow&gt',
-    'artemidorus',
-    'artex',
-    'artic',
-    'arts/science',
-    'arussi',
-    'asbach',
-    'asbestosis',
-    'ash-shar',
-    'ashlar',
-    'ashy',
-    'askaig',
-    'aske',
-    'askrigg',
-    'asocial',
     'aspectual',
-    'assholes',
-    'assignations',
-    'assoc',
-    'assonance',
-    'assr',
-    'assumpsit',
-    'assyrians',
-    'astoundingly',
-    'astrakhan',
-    'astrolabe',
-    'astrophysicist',
-    'asutrames',
-    'asymmetrically',
-    'atalanta',
-    'atco',
     'atg',
-    'ath',
-    'atheromatous',
-    'athletically',
-    'atms',
-    'atomisation',
-    'atrimonides',
-    'att.',
-    'aughton',
-    'aurea',
-    'aurel',
-    'aussa',
-    'auster',
-    'austerities',
-    'australopithecus',
-    'australs',
     'auto-pilot',
-    'autoroute',
-    'autun',
-    'aver',
-    'averagely',
-    'avgas',
-    'aviaries',
-    'avidity',
-    'avonlea',
-    'avowal',
-    'awesomely',
-    'axa',
-    'axeman',
-    'ayala',
-    'aylesford',
-    'ayurvedic',
     'azlan',
-    'azzedine',
-    'b&amp;i',
-    'b&eacute;n&eacute;teau',
-    'b&egrave;gles',
-    'b&ndash;17',
-    'b-17',
-    'b.c.c.i.',
-    'b.s.',
-    'b.subtilis',
-    'baabda',
-    'babic',
-    'baby-sit',
-    'baccarat',
-    'back-slapping',
-    'back-stage',
     'backbiting',
-    'backpacker',
-    'backseat',
-    'backsliding',
-    'baddy',
-    'badr',
-    'baez',
-    'bagatelle',
-    'bagels',
-    'baiji',
-    'bailiwicks',
-    'bails',
-    'baker-finch',
-    'bakerloo',
-    'balberith',
-    'balbindor',
     'baler',
-    'ball-point',
-    'ballachulish',
-    'ballade',
-    'ballay',
-    'ballgown',
-    'ballo',
-    'baloo',
-    'balthasar',
-    'bank/organisation',
-    'banknote',
-    'bannon',
-    'banyon',
-    'baps',
-    'barashevo',
-    'barbels',
     'barbondale',
-    'bardera',
-    'bardon',
-    'barefooted',
-    'barling',
-    'barmouth',
-    'barnett/gloucester',
-    'barometric',
-    'baronies',
-    'barrell',
-    'bartman',
-    'bartok',
-    'bartolini',
-    'barwell',
-    'baryon',
-    'baskervilles',
     'basslets',
-    'bastardy',
-    'bat-eared',
-    'batasuna',
-    'batavia',
-    'bateau',
-    'batters',
-    'batteur',
-    'batticaloa',
-    'battle-dress',
-    'battlegrounds',
-    'baulks',
-    'baum',
-    'baveno',
-    'bawdsey',
-    'bax',
     'baydon',
-    'bayly',
-    'bayne',
-    'bazille',
-    'bazoft',
-    'bci',
-    'bdn',
-    'beanbag',
-    'beanpole',
-    'bearskin',
-    'beatific',
-    'bebop',
-    'beca',
-    'bed-sit',
-    'bed-wetting',
-    'bedcovers',
     'beddoes',
-    'bedell',
-    'bedfellow',
-    'bedpost',
-    'bedser',
-    'bedspreads',
-    'beeby',
-    'beechey',
-    'beefed-up',
-    'beelzebub',
-    'begbroke',
-    'begetter',
-    'begone',
-    'behan',
-    'behaviouristic',
-    'behesht',
     'behrensmeyer',
-    'bel-shamharoth',
-    'beldam',
-    'belgica',
-    'belhadj',
-    'bell-like',
-    'bell-szekeres',
-    'bellends',
-    'bellerby',
-    'below-the-line',
-    'belsize',
-    'beltane',
-    'beltex',
-    'bemoans',
-    'bemusedly',
-    'bemusement',
     'bended',
-    'benitses',
-    'bensonhurst',
-    'benthamite',
-    'benvenuto',
-    'bergamo',
-    'berghofer',
-    'beria',
-    'bermudas',
-    'berni',
-    'bersatu',
-    'berta',
-    'bertelli',
-    'berthe',
-    'bested',
-    'bestowal',
     'bests',
-    'betula',
-    'bewilderingly',
-    'bf109es',
-    'bf110',
-    'bfpo',
-    'bfv',
-    'bhumibol',
-    'biasion',
-    'bibliophile',
-    'bifurcated',
-    'bifurcations',
-    'big-city',
-    'big-game',
-    'big-spending',
-    'biggie',
     'bigod',
-    'bihi',
-    'bikinis',
-    'billson',
-    'bim',
-    'bimodal',
-    'binkie',
-    'bio-rad',
-    'biocompatibility',
-    'biosensor',
-    'biosystems',
-    'biotech',
-    'bipartite',
-    'biphasic',
-    'bird-watcher',
-    'birdcage',
     'birdman',
-    'birdsall',
-    'birdwatcher',
-    'birkleigh',
-    'birley',
-    'birrell',
-    'birsay',
-    'birthmarks',
-    'bischof',
-    'bishopstone',
-    'bishopton',
-    'bistros',
-    'bitow',
-    'blackaby',
-    'blackamoor',
-    'blackgrass',
     'blackheads',
-    'blacklock',
-    'blacksell',
-    'blands',
-    'blandy',
-    'blaris',
-    'blastocyst',
-    'blastomeres',
-    'blatch',
-    'bleakest',
-    'bledisloe',
-    'blemley',
-    'blimp',
-    'blisworth',
-    'bloemfontein',
-    'blood-curdling',
     'blood-spattered',
-    'blood-sucking',
-    'bloodletting',
-    'bloodlust',
-    'bloomingdales',
-    'blotch',
-    'blow-dried',
-    'blr&amp;dd',
-    'blue-blooded',
-    'blue-veined',
-    'bluebirds',
-    'bluebottle',
-    'bluffed',
-    'blumenthal',
-    'blunderbuss',
-    'bmg',
     'bnc',
-    'boase',
-    'bobkins',
-    'boboli',
-    'bodensee',
-    'bodger',
-    'body-blow',
-    'bodybuilding',
-    'boehm',
-    'bogdanov',
-    'bok',
-    'bolivians',
-    'bollock',
-    'bollocking',
-    'bolognaise',
-    'bolter',
     'boma',
-    'bona_fides',
-    'bonemeal',
-    'bonnards',
-    'bons',
-    'bonzo',
-    'boob',
-    'boobyer',
-    'booke',
-    'bookfund',
-    'bookpoint',
-    'bookstock',
-    'bookwork',
-    'bookworms',
-    'boop',
-    'bootham',
     'booting',
-    'bootlaces',
-    'borealis',
-    'borehamwood',
-    'borgo',
-    'borinage',
-    'boscastle',
-    'boscawen',
-    'boscombe',
-    'bossing',
-    'bottle-green',
-    'bottle-wrack',
-    'boudin',
-    'bounder',
-    'bounties',
-    'bourgois',
     'bourses',
-    'bouvard',
-    'bowery',
-    'bowran',
-    'bowsprit',
-    'bowstring',
-    'boyishly',
-    'bq',
-    'bracts',
-    'bradycardia',
-    'braehead',
-    'brahe',
-    'brahmac&amacr;rya',
-    'braidwood',
-    'brain-dead',
-    'braine',
     'bramhall',
-    'brammall',
-    'branko',
-    'brasil',
-    'braughing',
-    'braves',
-    'brayne',
-    'brayshay',
-    'brayton',
-    'break-down',
-    'break-through',
-    'brean',
-    'bregawn',
-    'brendel',
-    'brendon',
-    'brettell',
     'bric-&agrave;-brac',
-    'brick-red',
-    'brickworks',
-    'bridge-building',
-    'bridgenorth',
-    'bright-red',
-    'brightwell',
-    'brimful',
-    'brioche',
-    'briskness',
-    'british-built',
-    'britishers',
-    'brl',
-    'broad-brimmed',
-    'broader-based',
-    'broadfoot',
     'broadminded',
-    'brocaded',
-    'broek',
-    'brogden',
-    'broken-hearted',
-    'broker/dealer',
-    'bromhead',
-    'bromodeoxyuridine',
-    'bronchodilator',
-    'bronislaw',
-    'broodingly',
-    'brookner',
-    'brouhaha',
-    'browbeat',
-    'browbeaten',
-    'brownian',
     'bruces',
-    'bruch',
-    'brum',
-    'brumhill',
-    'brurgh',
-    'brush-off',
-    'brussels-based',
-    'brutalities',
-    'brzezinski',
-    'bsia',
-    'bub',
-    'bubble-gum',
-    'bubblegum',
-    'bucaram',
-    'buccaneering',
-    'buchlyvie',
     'buckau',
-    'buckskin',
-    'budhoo',
-    'budworth',
-    'buffed',
-    'bug-eyed',
-    'bugler',
-    'buhler',
-    'bui',
-    'bulganin',
-    'bulked',
-    'bulldozing',
-    'bulling',
-    'bumpkin',
-    'bunbury',
-    'bunging',
     'bureaucratisation',
-    'bures',
-    'burg',
-    'burkitt',
-    'burn-out',
-    'burnings',
-    'burnsall',
-    'busmen',
-    'bustier',
-    'busty',
-    'butis',
-    'button-down',
-    'buwayz',
-    'buzzell',
-    'bwlch',
-    'by_and_by',
     'byblos',
-    'byford',
-    'bygraves',
-    'byker',
-    'bysshe',
-    'bzns',
-    'c&oacute;rdoba',
-    'c-130',
-    'c.z.',
-    'c1300',
-    'ca.',
-    'cable-tv',
-    'cablecar',
-    'caborn',
-    'cabot',
-    'cacophonous',
     'cadalora',
-    'cadaverous',
-    'cadell',
-    'cadenet',
-    'cadieux',
-    'cadmus',
-    'caereinion',
-    'caernarfonshire',
-    'caeruloplasmin',
-    'cahal',
-    'cahors',
-    'caicos',
-    'calcutt',
-    'caldbeck',
-    'calendrical',
-    'calf-length',
     'calidris',
-    'callable',
-    'callander',
-    'callbox',
-    'callejas',
-    'callil',
-    'callosum',
-    'calloway',
-    'calmac',
-    'caloric',
-    'calorie-free',
-    'calshot',
-    'calvet',
-    'camara',
-    'camilo',
-    'campeanu',
     'canaanite',
-    'canada-based',
-    'canalicular',
-    'canalside',
-    'candide',
-    'candlish',
-    'candyfloss',
-    'caninum',
-    'canker',
-    'cannavino',
-    'canonisation',
-    'canonization',
-    'canticles',
-    'cantilevered',
-    'cantonment',
-    'cantwell',
     'canvey',
-    'capably',
-    'capacitances',
-    'caped',
-    'capewell',
-    'capital-labour',
-    'capitularies',
-    'capitulating',
-    'capriciously',
-    'caput',
-    'car-parking',
-    'caramelised',
-    'carats',
-    'carbine',
-    'carbonated',
-    'carboxy',
     'carburettors',
-    'carden',
-    'cardiganshire',
-    'cardiotocography',
-    'cardy',
-    'careca',
-    'cared-for',
-    'careerism',
-    'careerist',
-    'carefulness',
-    'caressingly',
-    'caries',
-    'carmarthenshire',
-    'carmelites',
-    'carmona',
-    'carnaval',
     'carotene',
-    'carswell',
-    'carthusian',
-    'carvajal',
-    'carves',
-    'carvill',
-    'casabona',
-    'cash-in',
-    'cashpoint',
-    'casper',
-    'cassa',
-    'cassells',
-    'cassino',
-    'castrating',
-    'casuistry',
-    'cat-and-mouse',
     'catalog',
-    'catchphrases',
-    'categorial',
-    'catwoman',
-    'cauldhame',
-    'cause-effect',
-    'cause_c&eacute;l&egrave;bre',
-    'cautiousness',
-    'cavaillon',
-    'cavalli',
-    'cavalryman',
-    'cawing',
-    'cazalet',
-    'cc\'',
-    'ccff',
-    'ccl',
     'cdi',
-    'ceaucescu',
-    'cees',
-    'celebrants',
-    'celestion',
-    'cells/mm',
-    'censures',
-    'centering',
-    'centerline',
-    'centrepoint',
-    'ceolred',
-    'cephei',
-    'cepheid',
-    'cept',
-    'cercle',
-    'ceremonials',
     'ceremonious',
-    'certifies',
-    'cerulean',
-    'cesspit',
-    'cesspool',
-    'cesspools',
-    'cette',
-    'cetus',
-    'cfd',
-    'cfln',
-    'cgmp-gated',
-    'ch\'in',
-    'chab',
-    'chaetodon',
-    'chain-guilloche',
-    'chain-smoking',
     'chairer',
-    'chakras',
-    'chalais',
-    'chalfont',
-    'challow',
-    'cham',
-    'chambered',
-    'chambermaids',
-    'champers',
-    'chancer',
-    'chancing',
-    'chand',
-    'chandigarh',
-    'changing-rooms',
-    'chantler',
-    'chapel-le-dale',
     'chappel',
-    'charente',
-    'charg&eacute',
-    'chargees',
-    'charlottenburg',
-    'charpentier',
-    'chartwell',
-    'chastening',
-    'chatrier',
-    'chaumont',
-    'chavan',
-    'chd',
-    'cheapening',
-    'chechnia',
-    'cheek-bones',
-    'cheeseboard',
     'cheesecloth',
-    'chemical-sensitive',
-    'chemotaxis',
-    'chengdu',
-    'cherie',
-    'chernayev',
-    'chert',
-    'chesters',
-    'chewton',
-    'chickpeas',
-    'chidley',
-    'child-minders',
-    'childers',
-    'chileans',
-    'chillim',
-    'chinese-style',
     'chirruped',
-    'chirton',
-    'chivvying',
-    'chlorambucil',
-    'chocs',
-    'choirboys',
-    'cholecystoscopy',
-    'chomskyan',
-    'choppers',
-    'chorea',
-    'choropleth',
-    'choudhury',
-    'choughs',
-    'chouilly',
-    'chrimes',
-    'chrism',
     'christiana',
-    'chronologies',
-    'chukka',
-    'church-related',
-    'churt',
-    'chutneys',
-    'cicada',
-    'cicourel',
-    'cicr',
-    'cienfuegos',
-    'cim',
-    'cima',
-    'cinch',
-    'cinchona',
-    'cinematography',
-    'circe',
     'circumpolar',
-    'city-based',
-    'city-dwellers',
-    'ciyms',
-    'clairville',
-    'clapboard',
-    'clarets',
-    'clarifications',
-    'class-conscious',
-    'classe',
-    'classique',
-    'clean-living',
-    'cleanness',
-    'cleanses',
-    'clearly-defined',
-    'cleaves',
     'clee',
-    'cleef',
-    'clementinum',
-    'clerkship',
-    'clientelism',
-    'climaxing',
-    'clinches',
-    'clipboards',
-    'cloaca',
-    'cloaking',
-    'clobbering',
-    'clop',
-    'close-packed',
-    'clostridium',
-    'clothworkers',
-    'cloudiness',
     'clovelly',
-    'cloverleaf',
-    'clr',
-    'club-mate',
-    'clumpy',
-    'cmd.',
-    'cmdr',
-    'cmg',
-    'cmsn',
-    'co-chairs',
-    'co-incidence',
-    'co-owners',
-    'co-processors',
-    'co-producer',
-    'co-transport',
-    'coachload',
     'coachmen',
-    'coad',
-    'coal-black',
-    'coalface',
-    'coalmining',
-    'coarsened',
-    'coarsest',
-    'coat-tails',
-    'coathanger',
-    'coaxingly',
-    'cobley',
-    'coch',
-    'cockerels',
-    'cockfighting',
-    'coddle',
-    'codetermination',
     'codger',
-    'codicils',
-    'codie',
-    'codifying',
-    'cofactors',
-    'coffin-maker',
-    'cognitio',
-    'cognitive&ndash;behaviour',
-    'cohens',
-    'coimbra',
-    'coin-op',
-    'colberg',
-    'colburn',
-    'colchicine',
-    'colclough',
-    'cold-war',
     'colebrook',
-    'coleherne',
-    'colgate',
-    'collagenase',
-    'collarless',
-    'collectivized',
-    'collider',
-    'colligative',
-    'colling',
-    'collinge',
-    'collocates',
-    'colloid',
-    'colombians',
-    'colonizers',
-    'colorados',
-    'colostrum',
     'colour-blind',
-    'colourants',
-    'colson',
-    'comas',
-    'combatting',
-    'combes',
-    'comforters',
-    'commensurately',
-    'commercialise',
-    'commissionaire',
-    'communality',
-    'communautaire',
-    'compartmentalised',
-    'compartmentalized',
-    'compartmented',
-    'complainer',
     'compleat',
-    'compressive',
-    'comps',
-    'comptes',
-    'compulsions',
-    'conal',
-    'concavity',
-    'concentrator',
-    'concert-hall',
-    'concreteness',
-    'condescend',
-    'condescended',
-    'condiment',
-    'condon',
-    'conferment',
-    'confessors',
     'confidingly',
-    'configuring',
-    'confiscations',
-    'confocal',
-    'conformable',
-    'conga',
-    'congdon',
-    'congreve',
-    'conjonctures',
-    'conjurer',
-    'connacht',
-    'connive',
-    'conon',
-    'consciousnesses',
-    'conservative-controlled',
-    'considerately',
     'consortiums',
-    'consumer-price',
-    'contango',
-    'conteh',
-    'context-independent',
-    'contextualisation',
-    'continent-wide',
-    'contortionist',
-    'contortus',
-    'contractility',
-    'contractionary',
-    'contrariwise',
-    'contreras',
-    'contritely',
-    'controllability',
-    'conversationalist',
     'conversationalists',
-    'convocations',
-    'convolvulus',
-    'coolants',
-    'coolidge',
-    'coomassie',
-    'coon',
-    'cooperatively',
-    'copolymer',
-    'coppes',
-    'copping',
-    'copthorne',
-    'copyholders',
-    'coram',
-    'cordiality',
-    'corea',
     'corgis',
-    'coriolis',
-    'corizo',
-    'corley',
-    'cornerhouse',
-    'corolla',
-    'corot',
-    'corpn',
-    'corr',
-    'corralled',
-    'correa',
-    'corris',
-    'corruptible',
-    'corruptions',
-    'corsa',
-    'cortisol',
     'corton',
-    'cortona',
-    'coruna',
-    'corunna',
-    'corvan',
-    'cos-1',
-    'cosmogony',
-    'cosmologists',
-    'cosmopolitanism',
-    'cosset',
-    'cossins',
-    'cost/benefit',
-    'costall',
-    'costlier',
-    'cotingas',
-    'cotman',
     'cottager',
-    'cottenham',
-    'couchman',
-    'council-house',
-    'counter-attacked',
-    'counterexample',
-    'counterfoil',
-    'counterinsurgency',
-    'counterintelligence',
-    'countermeasures',
-    'counterplay',
-    'couper',
-    'coupler',
-    'courcier',
-    'court-martialled',
-    'cous',
     'couturiers',
-    'covenanting',
-    'cowlings',
-    'cowls',
-    'coyotes',
-    'coz',
-    'cp/m',
-    'crackbene',
-    'crackline',
-    'crackly',
-    'craigleith',
-    'cranog',
-    'cranswick',
-    'crecquillon',
-    'creda',
-    'creditably',
     'creel',
-    'cremations',
-    'crematoria',
-    'cresci',
-    'crespigny',
-    'cresta',
-    'crewkerne',
-    'cribb',
-    'crickhowell',
-    'cripes',
-    'crisis-hit',
-    'crisper',
-    'cristiano',
-    'croaks',
-    'croesus',
-    'cross-addictive',
     'cross-breeding',
-    'cross-class',
-    'cross-equation',
-    'cross-fertilization',
-    'cross-licensing',
-    'cross-shareholdings',
-    'cross-town',
-    'crossbowmen',
-    'crowden',
-    'crowfoot',
-    'crowood',
-    'cruciate',
-    'cruzados',
-    'crystallises',
-    'cses',
-    'cuisines',
     'cuk',
-    'cuka',
-    'cul',
-    'cullbridge',
-    'culpably',
-    'culs-de-sac',
-    'culturali',
-    'culturalist',
-    'culyer',
-    'cuneiform',
-    'cup-shaped',
-    'cup-ties',
-    'currer',
-    'cursorily',
-    'cursors',
-    'curtaining',
     'curtin',
-    'curtiss',
-    'cushing',
-    'cuss',
-    'customising',
-    'cusworth',
-    'cut-away',
-    'cut-back',
-    'cuthberts',
-    'cuthbertson',
-    'cuttlefish',
-    'cwt',
-    'cx',
-    'cycleway',
-    'cyclically',
-    'cyclones',
     'cyclophilin',
-    'cygnets',
-    'cynewulf',
-    'cytosine-c',
-    'cytosol',
-    'czechoslovaks',
-    'd&eacute;fense',
-    'd&eacute;gorgement',
-    'd&eacute;veloppement',
-    'd\'ancona',
-    'd\'arby',
-    'd\'compress',
-    'd\'este',
-    'd\'honneur',
-    'd\'oliveira',
-    'd.f.c.',
     'd.s.',
-    'd8',
-    'daks',
-    'dallta',
-    'dalvaine',
-    'damory',
-    'dancehall',
-    'dandies',
-    'dando',
-    'danforth',
-    'dangerousness',
-    'dani',
-    'danios',
-    'danquah',
-    'dany',
-    'darbyshire',
     'dari&eacute;n',
-    'darjeeling',
-    'darnford',
-    'darras',
-    'darty',
-    'darulhadis',
-    'dasa',
-    'datafiles',
-    'datastream',
-    'daw',
-    'dawlish',
-    'day-by-day',
-    'day-dream',
-    'dayes',
-    'daywork',
-    'dazibao',
     'dde',
-    'ddp',
-    'dead-pan',
-    'dead-weight',
-    'deanna',
-    'deanses',
-    'deathless',
-    'debater',
-    'debrace',
-    'debrief',
-    'debuted',
-    'deceiver',
-    'decentralising',
-    'decentred',
-    'decile',
-    'decimation',
     'decin',
-    'deckard',
-    'deckhouse',
-    'decodes',
-    'decompensation',
-    'deconstructionist',
-    'decontrol',
-    'decreeing',
-    'decstation',
-    'deeley',
-    'deemy',
-    'deep-down',
-    'deerhurst',
-    'def.',
-    'deface',
-    'defamed',
     'defence-related',
-    'deferens',
-    'defibrillation',
-    'deflections',
-    'defoliation',
-    'defrosting',
-    'deleuze',
-    'delimiting',
-    'delineates',
-    'deliriously',
-    'delius',
-    'delrina',
-    'deltaic',
-    'deltoid',
-    'demagogy',
-    'demobilised',
     'democratized',
-    'demographically',
-    'demoralise',
-    'demurrer',
-    'demystified',
-    'denationalization',
-    'denknetzeyan',
-    'denotation',
-    'denotational',
-    'densitometry',
-    'denvir',
-    'denyer',
-    'dep&ocirc;ts',
-    'dependence/independence',
-    'deplorably',
-    'depo-provera',
     'depopulated',
-    'depositum',
-    'derail',
-    'deregulatory',
-    'dereham',
-    'dermal',
-    'derogate',
-    'descriptively',
-    'designworks',
-    'desiree',
-    'destructively',
-    'desultorily',
-    'detectorist',
-    'detectorists',
-    'dexterous',
-    'dfr',
     'dfs',
-    'dharjees',
-    'dhuoda',
-    'diabolic',
-    'diagrammed',
-    'dialectically',
-    'dialectology',
-    'diapers',
-    'diaphragmatic',
-    'diatomic',
-    'diatribes',
-    'dic',
-    'didn',
-    'didst',
-    'diebenkorn',
-    'diemen',
     'differentiable',
-    'diffusive',
-    'digestives',
-    'digiboard',
-    'digitisation',
-    'dike',
-    'dilke',
-    'dimorphic',
-    'diod.',
-    'dios',
-    'dippers',
-    'direct-grant',
-    'dirtiness',
-    'disambiguate',
-    'disassembled',
-    'discretions',
     'disdaining',
-    'disembedded',
-    'disgruntlement',
-    'disinherit',
-    'disinterred',
-    'disjuncture',
-    'dispatcher',
-    'dispositional',
-    'dissimilarity',
-    'distamycin',
-    'distiller',
-    'distrain',
-    'disunited',
-    'disutility',
-    'dit',
-    'ditcher',
     'dithiothreitol',
-    'divas',
-    'dive-bombing',
-    'diverticular',
-    'diviner',
-    'divining',
-    'divinities',
-    'divots',
-    'dm2.42',
-    'dm2.48',
-    'dm2.86',
-    'dnaasei',
-    'doak',
-    'doberman',
-    'dobie',
-    'docket',
     'dogan',
-    'dogging',
-    'doghouse',
-    'dogmatics',
-    'dogwood',
-    'doha',
-    'dolgarrog',
-    'doling',
-    'domical',
-    'donard',
-    'donat',
-    'donizetti',
-    'donnie',
-    'door-handle',
-    'doppelg&auml;nger',
-    'dor',
     'dormancy',
-    'dornford',
-    'dosshell',
-    'dostoievsky',
-    'double-figure',
-    'double-fronted',
-    'doumen',
-    'dove-grey',
-    'dowelling',
-    'down-town',
-    'downfield',
-    'downlights',
-    'downpours',
-    'dphil',
-    'drabs',
-    'drachmas',
     'drafters',
-    'dragnet',
-    'draincock',
-    'dramatising',
-    'draoicht',
-    'draskovic',
-    'dratted',
-    'draughtproofing',
-    'draycott',
-    'dreadnoughts',
-    'dreyfuss',
-    'dried-out',
-    'drillo',
-    'drina',
-    'drivin\'',
-    'dro',
     'dron',
-    'dropout',
-    'drought-stricken',
-    'drover',
-    'drs/nx',
-    'drugstore',
-    'drumcree',
-    'drumsticks',
-    'dry-cleaning',
-    'dryad',
-    'dryland',
-    'drymen',
-    'dryopithecus',
-    'drysuit',
-    'dtc',
-    'dual-processor',
     'dualisms',
-    'duarte',
-    'dub&ccaron;ek',
-    'dubrovlag',
-    'ducats',
-    'duces',
-    'duckboards',
-    'duddon',
-    'duddy',
-    'duisburg',
-    'dulbecco',
-    'dulnain',
-    'dun-coloured',
-    'dunaway',
-    'dunbartonshire',
-    'dundonnell',
     'dungiven',
-    'dunkin',
-    'dunkley',
-    'dunmow',
-    'dunnachie',
-    'dunnell',
-    'dunnocks',
-    'duplicitous',
-    'dur&eacute;e',
-    'durkan',
-    'durkheimian',
-    'duw',
-    'dwelled',
-    'dwyfor',
-    'dx2',
-    'dy',
     'dyirbal',
-    'dykstra',
-    'dynamos',
-    'dysgraphia',
-    'dysplastic',
-    'dysuria',
-    'e\'',
-    'e.p.s.ps',
-    'e2/3',
-    'e2f-1',
-    'ear-marked',
-    'eardisley',
-    'earlobe',
-    'earth-moving',
-    'earwig',
-    'eastgate',
     'easthope',
-    'eavesdropped',
-    'ebbrell',
-    'ebbs',
-    'ebu',
-    'eccentrically',
-    'ecclesial',
-    'echinodorus',
-    'eco-friendly',
-    'economizing',
-    'ecosoc',
-    'ecp',
-    'ecstacy',
-    'ecuadorean',
-    'eddying',
-    'eddystone',
     'edel',
-    'edenwort',
-    'edingley',
-    'editorially',
-    'edwardes',
-    'edwy',
-    'eeh',
-    'efferent',
-    'effluvia',
-    'egidius',
-    'egil',
-    'ego-identity',
-    'egta',
-    'egton',
-    'ehos',
-    'eiders',
     'eighteen-year-olds',
-    'eighths',
-    'el-kefevi',
-    'elancyl',
-    'elderberry',
-    'ele',
-    'elean',
-    'elec',
-    'electives',
-    'electrify',
-    'electro-mechanical',
-    'electrocution',
-    'electroencephalogram',
-    'electrolux',
-    'electromechanical',
-    'eleven-year-olds',
     'elevens',
-    'elia',
-    'eliezer',
-    'ellice',
-    'ellon',
-    'ells',
-    'ellsworth',
-    'ellyrion',
-    'eltharion',
-    'elvers',
-    'elysian',
-    'emanation',
-    'embellishing',
-    'emecheta',
-    'emendation',
-    'emerse',
     'emigre',
-    'emilie',
-    'emmanuelli',
-    'emolument',
-    'emplaced',
-    'emporio',
-    'empty-headed',
-    'encopresis',
-    'encouragements',
-    'end-products',
-    'enda',
-    'endocytosis',
-    'endometrium',
-    'endoscopical',
-    'endoscopist',
-    'endothermy',
     'endurable',
-    'enfants',
-    'enforcers',
-    'engelbrecht',
-    'ennerdale',
-    'enopla',
-    'ensigns',
-    'ensnare',
-    'entel',
-    'entendres',
-    'entf&uuml;hrung',
-    'entomologist',
-    'entomologists',
-    'entrained',
-    'entre',
-    'entrenching',
     'enumerating',
-    'enumerators',
-    'enunciate',
-    'enunciating',
-    'eon',
-    'ephron',
-    'epiblast',
-    'epicure',
-    'epicycles',
-    'epidemiologist',
-    'epidemiologists',
-    'epiphytes',
-    'erbb2',
-    'ergonomically',
-    'ergonomist',
-    'ergs',
     'ericson',
-    'erl',
-    'erle',
-    'ermengilde',
-    'erogenous',
-    'ers-1',
-    'erythema',
-    'esca',
-    'eschatology',
-    'escrow',
-    'escudos',
-    'escutcheon',
-    'esse',
-    'estes',
-    'estevez',
-    'estrin',
     'et-1-ir',
-    'etheric',
-    'etheridge',
-    'ethers',
-    'etive',
-    'ettore',
-    'etymologically',
-    'eucs',
-    'eudoxus',
-    'eug&egrave;ne',
-    'euphony',
-    'euro-elections',
-    'euro-sceptic',
-    'eurocentric',
-    'european-wide',
-    'evacuations',
     'evades',
-    'evened',
-    'everage',
-    'everlastingly',
-    'evicting',
-    'evidence-transcendent',
-    'evison',
-    'evita',
-    'evocatively',
-    'ewell',
-    'ex-british',
-    'ex-colonial',
-    'ex-communists',
-    'ex-member',
-    'ex-military',
-    'ex-patriots',
     'exalting',
-    'excelling',
-    'excluders',
-    'excrescences',
-    'excretions',
-    'exhalations',
-    'exminster',
-    'exothermicities',
-    'expedited',
-    'expediting',
-    'explicated',
-    'exploiter',
-    'export-led',
-    'export-oriented',
-    'exportable',
-    'expostulated',
     'expounds',
-    'extempore',
-    'extensible',
-    'extensification',
-    'extorting',
-    'extra-embryonic',
-    'extra-legal',
-    'extraditables',
-    'extrasystoles',
-    'extravaganzas',
-    'exudate',
-    'eyas',
-    'eyeful',
-    'eyeglass',
-    'eyesores',
-    'eyton',
     'f&eacute;camp',
-    'f(x)',
-    'f+',
-    'f.r.',
-    'f40',
-    'fabriano',
-    'factsheets',
-    'faddy',
-    'fadge',
-    'faecalis',
-    'fairport',
-    'faither',
-    'faithfuls',
-    'fakenham',
-    'falati',
-    'faliraki',
     'family-based',
-    'family-sized',
-    'fan-shaped',
-    'fanciable',
-    'fanciers',
-    'fancifully',
-    'fanfares',
-    'fanlight',
-    'fantail',
-    'fantasizing',
-    'far-carrying',
-    'faramir',
-    'fardine',
-    'farfetched',
-    'farquarson',
-    'farrakhan',
     'farthingdales',
-    'fash',
-    'fast-talking',
-    'fath',
-    'fatiguing',
-    'fault-tolerance',
-    'faustian',
-    'faux',
-    'favelas',
-    'fazio',
-    'fbl',
-    'fearsomely',
-    'feedbacks',
-    'feel-good',
-    'feelin\'',
-    'feelingly',
     'feeny',
-    'fef',
-    'feigenbaum',
-    'feldstein',
-    'felis',
-    'fellah',
-    'fellow-countrymen',
-    'fellow-feeling',
-    'fellow-travellers',
-    'fellside',
-    'felse',
-    'felsic',
-    'felstead',
-    'feltons',
-    'femoral',
-    'fenced-off',
     'fenwicks',
-    'ferndown',
-    'fernhill',
-    'ferny',
-    'ferrabosco',
-    'ferri&egrave;res',
-    'ferromet',
-    'ferteth',
-    'fertilizing',
-    'fest',
-    'festa',
-    'fgf',
-    'fiana',
-    'fiascos',
-    'fiats',
-    'fibre*',
     'fibrotic',
-    'fidler',
-    'fie',
-    'fig.4',
-    'figgis-hewett',
-    'figure-ground',
-    'filibuster',
-    'filippa',
-    'filled-in',
-    'filleted',
-    'filmic',
-    'filter-feeders',
-    'finchingfield',
-    'fine-tune',
-    'fine-tuned',
-    'finger-nails',
     'fingerboards',
-    'fini',
-    'fininvest',
-    'finite-state',
-    'finlaggan',
-    'finta',
-    'finubar',
-    'fionn',
-    'firdaus',
-    'fireater',
-    'firebombed',
-    'fireguard',
-    'firelit',
-    'firm-specific',
-    'firmus',
-    'first-timer',
     'fiscally',
-    'fish-only',
-    'fishbone',
-    'fishing-boats',
-    'fishtank',
-    'fit-again',
-    'five-month-old',
-    'five-way',
-    'five-yearly',
-    'fixers',
-    'flagellants',
-    'flanged',
-    'flann',
-    'flannelette',
-    'flaschner',
-    'flashlights',
     'flat-footed',
-    'flattener',
-    'flatties',
-    'flattish',
-    'flatus',
-    'flav',
-    'flavian',
-    'fleet/norstar',
-    'flesh-and-blood',
-    'flesh-coloured',
-    'fleshly',
-    'flett',
-    'flexion',
-    'flexor',
-    'flic',
-    'flintstone',
     'flnks',
-    'floater',
-    'flocculation',
-    'flocculus',
-    'floorspace',
-    'florals',
-    'flore',
-    'florentines',
-    'floridians',
-    'flossie',
-    'flotta',
-    'flouts',
-    'flower-filled',
-    'flu-like',
-    'flurried',
-    'fluttery',
     'fly-past',
-    'flypaper',
-    'fmcg',
-    'fnm',
-    'foamy',
-    'foca',
-    'foinmen',
-    'foliated',
-    'follett',
-    'follow-ups',
-    'footwall',
-    'footways',
-    'foppish',
-    'force-landed',
-    'foreclosed',
-    'foregate',
     'foreign-based',
-    'foreignness',
-    'foreleg',
-    'forenoon',
-    'foreshadow',
-    'formalisms',
-    'forseeable',
-    'forsook',
-    'fortes',
-    'fortran90',
-    'fortuna',
-    'forty-odd',
-    'fortyish',
-    'forward-thinking',
-    'fossa',
-    'foucauldian',
     'foully',
-    'four-door',
-    'fowlers',
-    'fpi',
-    'fran&ccedil;a',
-    'francaise',
-    'franco-british',
-    'francoise',
-    'francoism',
-    'francome',
-    'frankl',
-    'fraxillian',
-    'frays',
-    'fre',
-    'freaking',
-    'freame',
     'fredegund',
-    'fredric',
-    'free-ranging',
-    'freefone',
-    'freelancers',
-    'freelances',
-    'freelink',
-    'freeze-frame',
-    'freeze-thaw',
-    'frege',
-    'freitag',
-    'frenziedly',
-    'fribourg',
-    'frictionless',
-    'frigidity',
-    'frimley',
     'froing',
-    'frolicked',
-    'frothed',
-    'froude',
-    'frs3',
-    'frugally',
-    'fry-up',
-    'fuddled',
-    'fuentes',
-    'full-featured',
-    'full-fledged',
-    'full-price',
-    'full-timers',
-    'fullerenes',
-    'fulsomely',
-    'fun-filled',
     'fundaci&oacute',
-    'funnies',
-    'funnyman',
-    'furby/reporting',
-    'furniss',
-    'furthers',
-    'fusilier',
-    'fussily',
-    'fussiness',
-    'futura',
-    'fuw',
-    'g&ndash',
-    'g\'bai',
-    'g-string',
-    'g.b.',
-    'g.s.',
     'g40',
-    'g418',
-    'g60',
-    'gabbro',
-    'gabellah',
-    'gaborone',
-    'galtieri',
-    'galvanic',
-    'galvanize',
-    'gama',
-    'gambits',
-    'gandell',
-    'ganesh',
-    'gangsterism',
-    'gargling',
-    'garishly',
     'garrett/reporting',
-    'garrimperos',
-    'garrisoned',
-    'garros',
-    'garsdale',
-    'garvie',
-    'gas-filled',
-    'gascoyne',
-    'gaskin',
-    'gassy',
-    'gastroenterologists',
-    'gat',
-    'gaudily',
-    'gaumont-british',
-    'gauzy',
-    'gaver',
     'gavron',
-    'gec-marconi',
-    'geisha',
-    'gelatinous',
-    'geldart',
-    'gelignite',
-    'gellner',
-    'geminis',
-    'gemstone',
-    'general&iacute;simo',
-    'generalissimo',
-    'generalizes',
-    'generis',
-    'genetical',
-    'genetically-engineered',
-    'geneva-based',
     'geniculate',
-    'gentium',
-    'geoghegan',
-    'geographies',
-    'gerashchenko',
-    'gerhardt',
-    'german-soviet',
-    'germinal',
-    'get-rich-quick',
-    'gff',
-    'ggf-ii',
-    'ghali',
-    'ghar',
-    'gharrgoyles',
-    'ghost-like',
-    'ghostbusters',
     'gib',
-    'gibeau',
-    'giblets',
-    'gibsons',
-    'gift-giving',
-    'gild',
-    'gilgul',
-    'gillen',
-    'gilliam',
-    'gilt-framed',
-    'gimmickry',
-    'gingivitis',
-    'gino',
-    'gird',
-    'girling',
-    'giudice',
     'giugiaro',
-    'givenness',
-    'gizzard',
-    'glaser',
-    'glassworks',
-    'glaziers',
-    'glcabs',
-    'gleanings',
-    'gleann',
-    'glenarm',
-    'glendower',
-    'glenlivet',
-    'glenlola',
-    'glf',
-    'glissando',
-    'glitterati',
     'globin',
-    'globule',
-    'glos.',
-    'glossies',
-    'gloucs',
-    'glucose-6-phosphate',
-    'glyndyfrdwy',
-    'gmts',
-    'gnash',
-    'gneisses',
-    'gnoll',
-    'goal-less',
-    'goalscorers',
-    'gobbledygook',
-    'god-awful',
-    'god-forsaken',
     'goetz',
-    'goggle',
-    'gogol',
-    'gojkovic',
-    'gold-mining',
-    'goldenacre',
-    'goldilocks',
-    'goldschmidt',
-    'golem',
-    'golf-course',
-    'golgi',
-    'golkar',
-    'gombert',
-    'good\'un',
-    'good-hearted',
-    'good-tempered',
     'googly',
-    'goolden',
-    'gora',
-    'gordale',
-    'gores',
-    'gorfang',
-    'gorthie',
-    'goslings',
-    'gouda',
-    'gouger',
-    'gouraud',
-    'gover',
-    'government-run',
-    'govt',
-    'govt.',
-    'gowned',
     'gra',
-    'graecopithecus',
-    'graffito',
-    'gragareth',
-    'gram-negative',
-    'gramm-rudman-hollings',
-    'grammarian',
-    'gramme',
-    'grandiflora',
-    'grannie',
-    'gransden',
-    'grantee',
-    'granulocyte',
-    'granulomatosis',
-    'grapeseed',
-    'graphing',
     'graphological',
-    'gratifyingly',
-    'grave-digger',
-    'gravellier',
-    'gravier',
-    'gravity-fed',
-    'grea',
-    'great-great-grandfather',
-    'greek-speaking',
-    'greenhalgh',
-    'greeves',
-    'gremlin',
-    'grenside',
-    'greshorns',
-    'gretchen',
-    'gretsch',
     'greylag',
-    'greystoke',
-    'gridlock',
-    'grieco',
-    'griggs',
-    'grimoires',
-    'grimsdale',
-    'gringos',
-    'griping',
-    'groggily',
-    'grolier',
-    'grooving',
-    'ground-state',
-    'groundnut',
-    'groundnuts',
-    'groundspeed',
     'grouper',
-    'grown_ups',
-    'gruber',
-    'grudged',
-    'grumblings',
-    'gstaad',
-    'guangming',
-    'guangzhou',
-    'guarnaccia',
-    'guerin',
-    'guerlain',
-    'guha',
-    'guide-books',
-    'guidewire',
-    'guildsoft',
-    'guiltless',
     'gujral',
-    'gunship',
-    'gunslinger',
-    'gunwales',
-    'guruji',
-    'gushes',
-    'guti&eacute;rrez',
-    'gutteridge',
-    'guvnor',
-    'guyland',
-    'guzzle',
-    'gwenda',
-    'gymnaestrada',
-    'gymnasts',
-    'gyms',
-    'gyproc',
     'h&eacute;ctor',
-    'h-thymidine',
-    'h.t.s',
-    'h/b',
-    'h7',
-    'haagen-dazs',
-    'habgood',
-    'hachani',
-    'haci',
-    'haddad',
-    'hadden',
-    'haden',
-    'hadfield',
-    'haemolysis',
-    'hagiography',
-    'hailstones',
     'hairpiece',
-    'halberds',
-    'halcion',
-    'haleiwa',
-    'half-a-million',
-    'half-completed',
-    'half-point',
-    'half-smoked',
-    'half-submerged',
-    'haliborange',
-    'halil',
-    'halloran',
-    'halofantrine',
-    'hals',
-    'hambury',
-    'hamm',
     'hammerstein',
-    'hamming',
-    'hamptons',
-    'hamrouche',
-    'hamstrings',
-    'hanan',
-    'hand-built',
-    'hand-me-down',
-    'hand-operated',
-    'hand-printed',
-    'hand-reared',
-    'handbell',
-    'handedly',
-    'handhold',
-    'handpump',
-    'handshaking',
     'handsomeness',
-    'handstands',
-    'haney',
-    'hanger-on',
-    'hankamer',
-    'hannay',
-    'hanne',
-    'hanney',
-    'hao',
-    'harari',
-    'harbottle',
-    'hard-left',
-    'hard-man',
-    'hard-wired',
-    'hardiman',
-    'haricot',
     'harney',
-    'harpist',
-    'harpo/chico',
-    'harpsden',
-    'harri',
-    'harrisons',
-    'hartnoll',
-    'hartridge',
-    'hartsop',
-    'hartwig',
-    'harveys',
-    'has-beens',
-    'hasidic',
-    'hasina',
-    'haskell',
-    'hassall',
     'hassocks',
-    'hata',
-    'hatchards',
-    'hatchery',
-    'hater',
-    'hatless',
-    'haus',
-    'hauxwells',
-    'havent',
-    'hawksworth',
-    'hawtrey',
-    'haycock',
-    'hayzen',
-    'hazels',
-    'hbs',
-    'hbss',
     'hcg',
-    'hdmac',
-    'hdt.',
-    'headage',
-    'header-format-is',
-    'headfirst',
-    'headsets',
-    'headwind',
-    'healings',
-    'health-giving',
-    'healthful',
-    'hear-it',
-    'heartiness',
-    'heartwatch',
-    'heat-resistant',
-    'heav\'n',
     'heavy-eyed',
-    'hebert',
-    'hecataeus',
-    'hed',
-    'hedda',
-    'hee-haw',
-    'hegemon',
-    'heid',
-    'heidsieck',
-    'heist',
-    'hella',
-    'hellas',
-    'hellige',
-    'hells',
-    'hendaye',
-    'hendre',
     'hendrick',
-    'henly',
-    'hennes',
-    'henrik',
-    'hep-2',
-    'herbalists',
-    'herders',
-    'herdwick',
-    'heretofore',
-    'hering',
-    'hern',
-    'hernandez',
-    'herol',
-    'herri',
-    'hershey',
-    'hessenberg',
     'hetero',
-    'hetfield',
-    'heu',
-    'hewer',
-    'hewison',
-    'hi-jacked',
-    'hian',
-    'hibbs',
-    'hiero',
-    'hieroglyphic',
-    'hieronymus',
-    'high-born',
-    'high-fliers',
-    'high-gloss',
-    'high-octane',
-    'high-priced',
     'high-scoring',
-    'higher-income',
-    'higher-pitched',
-    'highest-paid',
-    'highly-skilled',
-    'highly-trained',
-    'hijackings',
-    'hilditch',
-    'hill-fort',
-    'hillbilly',
-    'hinkes',
-    'hipped',
-    'hipper',
-    'hippolyte',
-    'hipster',
-    'hipsters',
     'hirohito',
-    'hirondelle',
-    'his15',
-    'histopathology',
-    'hit-man',
-    'hitch-hike',
-    'hitch-hiker',
-    'hitch-hikers',
-    'hitchen',
-    'hiv-related',
-    'hk',
-    'hlasek',
-    'hmc',
-    'hmos',
-    'hobo',
-    'hobs',
     'hockenheim',
-    'hoddle/swindon',
-    'hoelzer',
-    'hoeveler',
-    'hofburg',
-    'hoffs',
-    'hoggett',
-    'hoi',
-    'holborough',
-    'holcombe',
-    'holey',
-    'holier',
-    'holier-than-thou',
-    'holocene',
-    'holter',
-    'home-base',
     'home-brewed',
-    'homeboy',
-    'homicides',
-    'homogenate',
-    'homolog',
-    'homologues',
-    'homonyms',
-    'homophony',
-    'honiara',
-    'honky',
-    'hookability',
-    'hooters',
-    'hopewell',
-    'hopi',
-    'horovitz',
-    'horseshoes',
     'hosea',
-    'hospital-based',
-    'hostage-taking',
-    'hot-headed',
-    'hot-tempered',
-    'hot-wire',
-    'hotfoot',
-    'hotham',
-    'hotness',
-    'hour-and-a-half',
-    'hourcade',
-    'house-buyers',
-    'houseful',
-    'housegroup',
-    'houseproud',
-    'housesitter',
     'hpc',
-    'hrs.',
-    'hsiao',
-    'htfiia',
-    'htfs',
-    'huerter',
-    'huismans',
-    'human-computer',
-    'humanae',
-    'humorist',
-    'hund',
-    'hundens',
-    'huntin\'',
-    'hurst/reporting',
-    'huss',
-    'hybridise',
     'hybridising',
-    'hydrants',
-    'hydrogel',
-    'hydrogen-bonded',
-    'hydrogeological',
-    'hydrogeology',
-    'hydrographer',
-    'hydrolysed',
-    'hydroxy',
-    'hydroxyapatite',
-    'hymnal',
-    'hyper-medium',
-    'hypercalcaemia',
-    'hyperglycaemic',
-    'hypersecretion',
-    'hypnagogic',
     'hypo-ors',
-    'i-a',
-    'i.m.',
-    'i.r.a.',
-    'i9x',
-    'iambic',
-    'iasi',
-    'iatrogenic',
-    'ibadan',
-    'ibmer',
-    'ibstock',
-    'icbm',
-    'ice-axe',
-    'ice-box',
-    'ice-covered',
-    'iciness',
     'icms',
-    'icn',
-    'iconographic',
-    'icp4',
-    'ideal-type',
-    'identifiably',
-    'idlers',
-    'idolatrous',
-    'idomeneo',
-    'idriss',
-    'idu',
-    'ifi',
-    'igglesden',
-    'ignacio',
-    'ignites',
-    'iguanodon',
     'iki',
-    'il2',
-    'ileorectal',
-    'iliffe',
-    'ilkeston',
-    'ill-luck',
-    'ill-matched',
-    'ill-timed',
-    'illinois-based',
-    'illsley',
-    'illuminator',
-    'illumined',
-    'illus.',
-    'illyrians',
-    'imago',
-    'imams',
     'imax',
-    'imbalanced',
-    'imbedded',
-    'imbibing',
-    'imhotep',
-    'imminently',
-    'immiscible',
-    'immobilize',
-    'immoderate',
-    'immunoassays',
-    'immunocytochemistry',
-    'immunofluorescent',
-    'immunohistological',
-    'immunoprecipitated',
-    'immunosorbent',
-    'immured',
     'immutability',
-    'impacting',
-    'impalpable',
-    'impedimenta',
-    'impermissible',
-    'imperturbably',
-    'implausibility',
-    'implausibly',
-    'implosion',
-    'importuning',
-    'impostor',
-    'impostors',
-    'impoverishing',
-    'impracticality',
-    'improvidence',
-    'improvisatory',
     'in-company',
-    'in-hospital',
-    'in_loco_parentis',
-    'inadvertence',
-    'incandescence',
-    'incapacitate',
-    'incapacitating',
-    'incautiously',
-    'incisiveness',
-    'incompetently',
-    'incompressible',
-    'incongruities',
-    'inconstancy',
-    'incontrovertibly',
-    'incorporeal',
-    'inculcation',
     'indecisively',
-    'indents',
-    'indiaman',
-    'indivisibility',
-    'indraugnir',
-    'inductivism',
-    'inductors',
-    'industrialise',
-    'industrialize',
-    'ineptly',
-    'inessential',
-    'inexpertly',
-    'infallibly',
-    'infiltrates',
-    'infinitary',
-    'inflates',
     'infomatics',
-    'informations',
-    'infraction',
-    'infrequency',
-    'infusing',
-    'ingatestone',
-    'ingelheim',
-    'ingersoll',
-    'ingle',
-    'inheritor',
-    'injury-time',
-    'inklings',
-    'inmost',
-    'innisfree',
-    'innocent-looking',
-    'inquisitiveness',
     'insensibility',
-    'install/deinstall',
-    'instantiation',
-    'institutionalize',
-    'instrumentally',
-    'insulates',
-    'insurrectionary',
-    'insy',
-    'intaglio',
-    'integrix',
-    'intelligenty',
-    'inter-parliamentary',
-    'inter-racial',
-    'inter-university',
-    'inter-urban',
-    'interatomic',
     'intercalation',
-    'intercrystalline',
-    'intercut',
-    'interdependency',
-    'interflora',
-    'interlacing',
-    'interlanguage',
-    'intermediate-level',
-    'intermediate-range',
-    'intermixed',
-    'internalisation',
-    'interpenetrating',
-    'interposing',
-    'intertextual',
-    'interview.',
-    'intikhab',
     'intimating',
-    'intis',
-    'intones',
-    'intoning',
-    'intra-industry',
-    'intra-oceanic',
-    'intragranular',
-    'intramuscular',
-    'intronic',
-    'introverts',
-    'invalidates',
-    'invariants',
-    'inveigle',
-    'inveigled',
-    'invigorate',
-    'invocations',
     'iom',
-    'iorwerth',
-    'ipf',
-    'ipx/spx',
-    'irangate',
-    'iraqui',
-    'irishness',
-    'ironmasters',
-    'irrelevantly',
-    'irruption',
-    'ishihara',
-    'ishtar',
-    'isms',
-    'isolators',
-    'isomorphism',
-    'isotherm',
     'ispra',
-    'istria',
-    'istvan',
-    'iti',
-    'ivashko',
-    'ivrigar',
-    'iwan',
-    'ixmaritians',
-    'iyad',
-    'iying',
-    'izquierda',
-    'izvestia',
-    'j&ouml;rg',
-    'j\'',
-    'jades',
-    'jaffe',
     'jaffray',
-    'jailers',
-    'jalalabad',
-    'janacek',
-    'janequin',
-    'janes',
-    'japlish',
-    'jaques',
-    'jardines',
-    'jarmusch',
-    'jarrad',
-    'jas',
-    'jatoi',
-    'jawless',
-    'jaywick',
-    'jcp',
     'jcr',
-    'jeanneau',
-    'jeannette',
-    'jebeau',
-    'jelly-like',
-    'jenjin',
-    'jerkins',
-    'jests',
-    'jharkhand',
-    'jibed',
-    'jingoistic',
-    'jiu',
-    'jlp',
-    'job-seekers',
-    'jocasta',
-    'jodi',
     'john-augustus',
-    'joky',
-    'jongleur',
-    'jons',
-    'jonty',
-    'jordans',
-    'joslin',
-    'jospin',
-    'josselin',
-    'joszef',
-    'joubert',
-    'jouglet',
-    'jounieh',
-    'joviality',
-    'jpeg',
-    'jube',
     'jubilantly',
-    'jugoslavs',
-    'juke-box',
-    'jukeboxes',
-    'jumi&egrave;ges',
-    'jumna',
-    'junejo',
-    'jurisprudential',
-    'justicialist',
-    'justus',
-    'jutta',
-    'juvenal',
-    'juxtaposes',
-    'k&auml;the',
-    'k&uuml;nste',
-    'k-sb3',
     'k4',
-    'kabir',
-    'kael',
-    'kaftan',
-    'kalamazoo',
-    'kalendar',
-    'kalgoorlie',
-    'kallicharran',
-    'kallinkova',
-    'kalman',
-    'kamala',
-    'kambli',
-    'kankkunen',
-    'kaput',
-    'karan',
-    'karbala',
     'katerina',
-    'katsikas',
-    'kbe',
-    'kefalov',
-    'keke',
-    'kelmscott',
-    'kelvedon',
-    'kenco',
-    'kennan',
-    'kennedys',
-    'keratin',
-    'kerensky',
-    'kerfuffle',
-    'kerman',
-    'kerrie',
-    'ketterings',
     'keynsham',
-    'kf',
-    'kft',
-    'kg.',
-    'khafji',
-    'khai',
-    'khmara',
-    'khorramshahr',
-    'kia',
-    'kickbacks',
-    'kidwelly',
-    'kieron',
-    'kigali',
-    'kiley',
-    'kilgour',
-    'kilham',
     'killifish',
-    'killyleagh',
-    'kilnsey',
-    'kilobases',
-    'kilotons',
-    'kilsyth',
-    'kindnesses',
-    'kinema',
-    'king-fisher',
-    'kinnaird',
-    'kinsfolk',
-    'kintsch',
-    'kir',
-    'kirkyard',
-    'kirstie',
-    'kitbag',
     'kitingan',
-    'klenow',
-    'km.',
-    'kmno',
-    'knaves',
-    'knifeman',
-    'knolls',
-    'knorr',
-    'knotts',
-    'know-all',
-    'koala',
-    'kohlrabi',
-    'kokusai',
-    'komarek',
-    'kong-based',
-    'konstant',
     'kor',
-    'koruna',
-    'koskotas',
-    'kouroi',
-    'kowtow',
-    'kox',
-    'kraken',
-    'krantz',
-    'kris',
-    'ksr1',
-    'kuhl',
-    'kulaks',
-    'kumquats',
-    'kun',
-    'kunstmuseum',
-    'kuntar',
     'kunz',
-    'kuoni',
-    'kurz',
-    'kurzlinger',
-    'kustow',
-    'kuzbass',
-    'kwai',
-    'kwiksave',
-    'kws',
-    'kypov',
-    'l&eacute;otard',
-    'l\'ecole',
-    'l\'homme',
-    'l\'humanite',
-    'l\'isle',
-    'l+',
     'l-c',
-    'l.b.',
-    'l.g.',
-    'l.j.q.b.',
-    'l/r',
-    'labeled',
-    'lace-making',
-    'lace-ups',
-    'laceration',
-    'lack-lustre',
-    'lackadaisical',
-    'laclotte',
-    'lacoste',
-    'laddered',
-    'lade',
-    'ladles',
     'ladywood',
-    'laggards',
-    'lago',
-    'lalande',
-    'lambe',
-    'lamborne',
-    'lamia',
-    'lamine',
-    'lamond',
-    'lampitt',
-    'lamplighter',
-    'lamplit',
-    'lampooned',
-    'lanc&ocirc;me',
-    'landholders',
-    'landrovers',
     'landslips',
-    'landsurface',
-    'landtag',
-    'langport',
-    'langside',
-    'langston',
-    'langtry',
-    'language-system',
-    'languorously',
-    'lanolin',
-    'laon',
-    'lapwings',
-    'larches',
-    'laspeyres',
-    'lasso',
-    'lasswade',
     'last-checked-issue',
-    'latest-issue',
-    'lathered',
-    'latitudinal',
-    'lauds',
-    'laughably',
-    'laughland',
-    'lauraceae',
-    'laureates',
-    'laval',
-    'lavondyss',
-    'lavvy',
-    'law-breakers',
-    'lawlor',
-    'lbos',
-    'leadon',
     'leaf-like',
-    'leafleting',
-    'leapfrogging',
-    'leather-clad',
-    'leatherbound',
-    'leaved',
-    'leavening',
-    'lecercle',
-    'leconfield',
-    'lecs',
-    'lecter',
-    'ledbetter',
-    'lederer',
-    'leery',
-    'lefeuvre',
-    'left-leaning',
     'lefties',
-    'leftish',
-    'leftism',
-    'leg-up',
-    'legatees',
-    'legations',
-    'legibly',
-    'legionaries',
-    'legolas',
-    'legrand',
-    'legspinner',
-    'leisure-time',
-    'leithen',
-    'leitmotiv',
-    'leitz',
-    'leks',
     'lemur',
-    'lend-lease',
-    'lennart',
-    'leofric',
-    'leonean',
-    'less-developed',
-    'lestor',
-    'lethally',
-    'letitia',
-    'letterkenny',
-    'level-of-analysis',
-    'leverson',
-    'levison',
-    'levkas',
-    'lgb',
-    'li%',
     'lianes',
-    'liang',
-    'liartes',
-    'liathach',
-    'lib.',
-    'libels',
-    'liberal-national',
-    'liberators',
-    'libero',
-    'libert&eacute',
-    'libidinous',
-    'liebchen',
-    'lieberson',
-    'life-form',
-    'life-line',
-    'life-sustaining',
     'lifesaver',
-    'lifesaving',
-    'lifters',
-    'ligature',
-    'ligeti',
-    'light/dark',
-    'lightens',
-    'liguria',
-    'like-for-like',
-    'likelier',
-    'liminal',
-    'liminality',
-    'lindsell',
-    'line-printer',
-    'lingard',
-    'lingham',
     'liniment',
-    'linnets',
-    'lintorn',
-    'lionan',
-    'lipsky',
-    'liquidiser',
-    'lithotrite',
-    'little\'un',
-    'littlechild',
-    'littlecote',
-    'liv',
-    'liverpool-based',
-    'liverworts',
-    'livingstonii',
-    'livre',
-    'livy',
     'lizhi',
-    'llandeilo',
-    'llangefni',
-    'llanrwst',
-    'lmsr',
-    'lna',
-    'loafing',
-    'lobov',
-    'lochgair',
-    'lochy',
-    'lockout',
-    'loex',
-    'lofted',
-    'lohengrin',
-    'loi',
-    'loiseau',
     'loma',
-    'loncar',
-    'londons',
-    'long-abandoned',
-    'long-ball',
-    'long-chain',
-    'long-cherished',
-    'long-fingered',
-    'long-line',
-    'long-service',
-    'longden',
-    'longer-run',
-    'longest-running',
-    'longfellow',
-    'longhope',
-    'longhorns',
     'longitudes',
-    'longue',
-    'loosemore',
-    'lope',
-    'loremaster',
-    'lossie',
-    'lott',
-    'louche',
-    'loughgall',
-    'loughtonians',
-    'louren&ccedil;o',
-    'lov',
-    'loveridge',
-    'low-heeled',
-    'low-voiced',
-    'lowbrow',
     'lower-case',
-    'lowthorpe',
-    'loy',
-    'loyola',
-    'lp*',
-    'lpga',
-    'lpi',
-    'lpk',
-    'lsa-1',
-    'lsx',
-    'lu6.2',
-    'luard',
-    'lubricious',
-    'lucre',
-    'lucretius',
-    'luddism',
     'luddites',
-    'ludic',
-    'lui',
-    'luka',
-    'lula',
-    'lumb',
-    'lundgren',
-    'lungfuls',
-    'lunia',
-    'lurago',
-    'luridly',
-    'lurpak',
-    'lusitania',
-    'lusting',
-    'lutes',
-    'lutton',
     'luxuriantly',
-    'lydeard',
-    'lyin\'',
-    'lynde',
-    'lynton',
-    'lyster',
-    'lyttleton',
-    'lz',
-    'm&eacute;decins',
-    'm&eacute;lange',
-    'm&ouml;llemann',
-    'm\'dear',
-    'm\'lord',
-    'm-1',
-    'm-type',
-    'm-way',
     'm.i.',
-    'm.i.ex',
-    'm42',
-    'm9',
-    'macairth',
-    'macbrayne',
-    'macculloch',
-    'macfie',
-    'macgill',
-    'machetes',
-    'macians',
-    'mackerras',
-    'macleods',
-    'macminimum',
-    'macnaghten',
-    'macneice',
     'macneill',
-    'macroeconomists',
-    'macromolecular',
-    'macy',
-    'maddalena',
-    'maddocks',
-    'madox',
-    'madrigali',
-    'madsen',
-    'magaziner',
-    'magisterially',
-    'magowan',
-    'magus',
-    'mahaddie',
-    'mahamat',
-    'mailshots',
     'mainframe-based',
-    'mainframe-class',
-    'mains-voltage',
-    'mainstays',
-    'majesties',
-    'majorcan',
-    'makaa',
-    'makati',
-    'make-shift',
-    'maketh',
-    'makeweight',
-    'makin',
-    'maladjustment',
-    'malcom',
-    'malfunctions',
-    'malingering',
     'malleson',
-    'malleus',
-    'malley',
-    'maltsters',
-    'malvern/worcestershire',
-    'mamas',
-    'man-sized',
-    'managerially',
-    'managership',
-    'manchurian',
-    'mangolds',
-    'manhandle',
-    'manhom',
-    'mannikin',
-    'manningtree',
-    'mannish',
     'mansio',
-    'manston',
-    'manvell',
-    'marble-topped',
-    'marbling',
-    'marburg',
-    'marchais',
-    'marchmont',
-    'marid',
-    'marinus',
-    'marionette',
-    'marj',
-    'markedness',
-    'markowitz',
-    'marnham',
-    'marples',
     'marquez',
-    'marsham',
-    'martlew',
-    'marts',
-    'maryport',
-    'maryse',
-    'masada',
-    'masaryk',
-    'masculine/feminine',
-    'masher',
-    'mass-media',
-    'massa',
-    'massacring',
-    'masterson',
-    'masterstroke',
-    'masterworkshop',
     'masturbatory',
-    'mat&eacute',
-    'matchfacts',
-    'mateo',
-    'materialises',
-    'matinees',
-    'matriliny',
-    'mattes',
-    'maturin',
-    'maturity-depth',
-    'matutes',
-    'mauer',
-    'mauna',
-    'mauriac',
-    'mauricien',
-    'mauss',
     'mavericks',
-    'mawby',
-    'maxentius',
-    'maxted',
-    'may/june',
-    'maybelle',
-    'mayson',
-    'mccandless',
-    'mccarthyism',
-    'mccoll',
-    'mccool',
-    'mccorquodale',
-    'mccs',
-    'mccullin',
-    'mccullouch',
-    'mccutcheon',
     'mcellhoney',
-    'mcfadyean',
-    'mcgahern',
-    'mcgibbon',
-    'mcgiff',
-    'mcgillicuddy',
-    'mcgilligan',
-    'mcharg',
-    'mcinerney',
-    'mckitrick',
-    'mcnaught',
-    'mcnaughton',
-    'mcnee',
-    'mcvey',
-    'mdina',
-    'meadowbrook',
     'meadowfield',
-    'meagaidh',
-    'mealtime',
-    'mearns',
-    'meatless',
-    'meatus',
-    'meckel',
-    'medawar',
-    'meditatively',
-    'medium-size',
-    'medjay',
-    'medjays',
-    'medulla',
-    'meggitt',
-    'meister',
-    'melange',
     'melas',
-    'melchett',
-    'meldrum',
-    'meliaceae',
-    'mellanby',
-    'mellion',
-    'meloch',
-    'meltwater',
-    'menachem',
-    'menard',
-    'meningococcal',
-    'mentiply',
-    'menzel',
-    'menzieshill',
-    'merchandisers',
-    'mercuric',
     'merganser',
-    'meringues',
-    'merino',
-    'meriting',
-    'merseburg',
-    'meshing',
-    'mespot',
-    'mesquida',
-    'messe',
-    'messel',
-    'metabolise',
-    'metamorphose',
-    'metaphysically',
-    'meteorologist',
-    'methyltransfer',
-    'metromedia',
     'metros',
-    'mex',
-    'meyrick',
-    'mfm',
-    'miah',
-    'micah',
-    'micro-',
-    'micro-computers',
-    'microbiologist',
-    'microbiologists',
-    'microcirculation',
-    'microcontroller',
-    'microgravity',
-    'microhabitat',
-    'microlights',
-    'microorganism',
     'microport',
-    'microsystem',
-    'microwaving',
-    'mid-18th',
-    'mid-1994',
-    'mid-thirteenth',
-    'mid-water',
-    'mid-wicket',
-    'midazolam',
-    'middle-horned',
-    'midgeley',
-    'midgetman',
-    'midgets',
-    'midlanders',
-    'midpoint',
-    'midwestern',
     'midwicket',
-    'miele',
-    'mies',
-    'miglia',
-    'mihai',
-    'mihal',
-    'miinnehoma',
-    'mikhailichenko',
-    'milada',
-    'milebrook',
-    'milk-white',
-    'millennial',
-    'millham',
-    'milliners',
-    'millinery',
-    'millington',
     'million-worth',
-    'millionairess',
-    'millionths',
-    'millwright',
-    'milo',
-    'mind-bending',
-    'mingles',
-    'minimax',
-    'minimiser',
-    'minims',
-    'minister-designate',
-    'ministero',
-    'minnesota-based',
-    'minns',
-    'minny',
-    'minorca',
     'minse',
-    'minsterley',
-    'minya',
-    'misallocation',
-    'misapprehensions',
-    'miscegenation',
-    'mishkin',
-    'mishra',
-    'misjudging',
-    'miskin',
-    'misogynistic',
-    'misspent',
-    'missy',
-    'mist-shrouded',
-    'mita',
-    'mithra',
     'mittelland',
-    'mitton',
-    'mix-and-match',
-    'mize',
-    'mkiii',
-    'ml/',
-    'mlc',
-    'mmol/h',
-    'mmol/kg',
-    'mmt',
-    'mnd',
-    'mnps',
-    'mochdre',
-    'model-making',
-    'modernizers',
-    'modulates',
     'module-relations-are',
-    'moebius',
-    'moeketsi',
-    'moeri',
-    'moggies',
-    'moineau',
-    'moise',
-    'mojave',
-    'monads',
-    'monckton',
-    'mondial',
-    'money-back',
-    'moneyer',
-    'moneyers',
-    'monochromator',
-    'monographic',
     'monomorphic',
-    'monosodium',
-    'monotones',
-    'monsoons',
-    'montag',
-    'month-old',
-    'montreux',
-    'moonshake',
-    'moore/reporting',
-    'mopeds',
-    'mopsus',
-    'moquette',
-    'moraines',
-    'moralities',
-    'mordaunt',
-    'mordechai',
     'mordor',
-    'moreen',
-    'morfa',
-    'morin',
-    'morling',
-    'mortimore',
-    'mortmain',
-    'moschino',
-    'mosely',
-    'mosey',
-    'moshoeshoe',
-    'moss-covered',
-    'mostafa',
-    'moston',
-    'motherless',
-    'motor-cars',
     'motor-racing',
-    'motorfair',
-    'motorhead',
-    'mounsey',
-    'mourner',
-    'mouser',
-    'moussaka',
-    'movimento',
-    'movin\'',
-    'moyer',
-    'mp/lib',
-    'mpas',
-    'mpe',
-    'mpl',
-    'mrg',
-    'mrta',
     'msec',
-    'msl',
-    'mtb',
-    'much-hyped',
-    'mudchute',
-    'muderrises',
-    'muderrislik',
-    'mudguards',
-    'mudstone',
-    'muffler',
-    'muggleton',
-    'muk',
-    'mulsanne',
-    'multi-activity',
-    'multi-colour',
-    'multi-denominational',
     'multi-effects',
-    'multi-functional',
-    'multi-individual',
-    'multi-layer',
-    'multi-talented',
-    'multi-threaded',
-    'multi-year',
-    'multiculturalist',
-    'multiculturalists',
-    'multipurpose',
-    'multispectral',
-    'multistorey',
-    'multivitamin',
-    'munchausen',
-    'munition',
-    'munroe',
     'muntjac',
-    'mur',
-    'murcia',
-    'murderously',
-    'murid',
-    'murie',
-    'muriella',
-    'murrells',
-    'murti',
-    'muscarinic',
-    'muscle-bound',
-    'music-room',
-    'musicality',
-    'musicology',
-    'musingly',
-    'muso',
     'mutagenic',
-    'mutes',
-    'mutty',
-    'muzorewa',
-    'mwafrika',
-    'myc+max',
-    'mycotoxins',
-    'myofibroblasts',
-    'myres',
-    'myrick',
-    'myriophyllum',
-    'mystically',
-    'myxomatosis',
-    'n&uuml;rburgring',
-    'n\'est-ce',
-    'n\'pani',
     'n.a.',
-    'n.i.',
-    'na&iuml;vety',
-    'naacp',
-    'nablab',
-    'nablabs',
-    'nabokov',
-    'nacf',
-    'nadel',
-    'naevus',
-    'nagas',
-    'naisbitt',
-    'nannette',
-    'naphthalene',
-    'narrates',
-    'narwhal',
     'nation-building',
-    'naturists',
-    'naughtie',
-    'nauman',
-    'nauplii',
-    'nava',
-    'naves',
-    'naysmith',
-    'ncf',
-    'ncp7b',
-    'ncpr',
-    'ncs',
-    'near-infrared',
-    'nebul&aelig',
-    'necktie',
-    'necromancy',
     'necromunda',
-    'nectaries',
-    'needle-sharp',
-    'needled',
-    'neffe',
-    'negatived',
-    'negress',
-    'negros',
-    'neighing',
-    'neile',
-    'neilsen',
-    'neizvestny',
-    'nematocysts',
-    'neo-conservative',
-    'neo-marxists',
-    'neoplasms',
     'nephritis',
-    'nerd',
-    'nerve-endings',
-    'nerved',
-    'nervos',
-    'nesbit',
-    'neste',
-    'netdirector',
-    'netview',
-    'neu',
-    'neubert',
-    'neuritic',
-    'neuroleptic',
-    'neurologically',
-    'neuropathic',
-    'neutralization',
     'neverless',
-    'nevermind',
-    'new-age',
-    'newbald',
-    'newbiggin',
-    'newbigin',
-    'newburgh',
-    'newhouse',
-    'newly-arrived',
-    'newly-crowned',
-    'newly-discovered',
-    'newly-hatched',
-    'newly-independent',
-    'newsons',
-    'newspaperman',
-    'newton-le-willows',
     'nf-h',
-    'ngaio',
-    'nguema',
-    'ngugi',
-    'nia',
-    'niamey',
-    'nidd',
-    'niddrie',
-    'nige',
-    'nigella',
-    'nightspots',
-    'nightwear',
-    'nikola',
-    'nikwax',
-    'nine-hole',
-    'nine-hour',
     'nine-year-olds',
-    'ninfania',
-    'nis',
-    'nissel',
-    'nitrites',
-    'nitroblue',
-    'nitty-gritty',
-    'niyazov',
-    'nlm',
-    'no.6',
-    'no8',
-    'nobile',
-    'noces',
-    'nofomela',
-    'noi',
-    'noisome',
     'non-a',
-    'non-aggressive',
-    'non-american',
-    'non-b',
-    'non-cardiac',
-    'non-christians',
-    'non-co-operative',
-    'non-colinear',
-    'non-combatant',
-    'non-combatants',
-    'non-competition',
-    'non-conventional',
-    'non-corporate',
-    'non-criminal',
-    'non-cumulative',
-    'non-directive',
     'non-expert',
-    'non-ibm',
-    'non-infected',
-    'non-interlaced',
-    'non-ionic',
-    'non-key',
-    'non-marketable',
-    'non-marxists',
-    'non-matching',
-    'non-meanings',
-    'non-media',
-    'non-participating',
-    'non-performing',
-    'non-preferred',
-    'non-print',
-    'non-punitive',
     'non-randomised',
-    'non-recourse',
-    'non-reinforced',
-    'non-resistance',
-    'non-returnable',
-    'non-routine',
-    'non-specialists',
-    'non-surgical',
-    'non-taxable',
-    'non-turbulent',
-    'non-ulcer',
-    'non-unionized',
-    'non-uraemic',
-    'non-use',
-    'non-vesicular',
-    'non-viable',
     'non-word',
-    'nonlinearity',
-    'nonna',
-    'nonprofit',
-    'nonspecific',
-    'nonwords',
-    'norber',
-    'norbrook',
-    'norcross',
-    'norling',
-    'norm-referenced',
-    'normalcy',
-    'normals',
-    'normandie',
-    'normoglycaemia',
-    'north-easterly',
     'northanger',
-    'northside',
-    'norweb',
-    'nots',
-    'nouakchott',
-    'nouveau_riche',
-    'nouveaux_riches',
-    'novotna',
-    'nprc',
-    'nsu',
-    'ntsb',
-    'ntv',
-    'nuclear-armed',
-    'nuclear-power',
-    'nucleolin',
-    'nucleosome',
     'nuee',
-    'nuees',
-    'nugatory',
-    'nuke',
-    'numan',
-    'number-dependent',
-    'nunc',
-    'nurburgring',
-    'nuremburg',
-    'nurturance',
-    'nutrasweet',
-    'nuzzle',
-    'nw3',
-    'nystatin',
-    'o\'carroll',
-    'o\'casey',
     'o\'conor',
-    'o\'dwyer',
-    'o\'hanlon',
-    'o\'kelly',
-    'oakhill',
-    'oapa',
-    'oapec',
-    'oatcakes',
-    'obeid',
-    'obelisks',
-    'obersturmfuhrer',
-    'objectivism',
-    'obligate',
-    'obscurantism',
-    'obscurantist',
-    'obscurities',
     'obsequies',
-    'observationally',
-    'obstreperous',
-    'obstruent',
-    'obuchi',
-    'occultation',
-    'occurence',
-    'oceanis',
-    'ochiltree',
-    'ochoa',
-    'octarine',
-    'octet',
-    'oculist',
-    'oddi',
-    'oddie',
-    'odorant',
     'oecs',
-    'off-campus',
-    'off-loading',
-    'off-spring',
-    'off-street',
-    'offenses',
-    'offloaded',
-    'offspinner',
-    'ogee',
-    'oginga',
-    'ogwen',
-    'ohh',
-    'ohn',
-    'ohrid',
-    'oil-free',
-    'oilcloth',
     'oilseeds',
-    'olas',
-    'olav',
-    'olduvai',
-    'oligarchies',
-    'oligarchs',
-    'oligosaccharides',
-    'olive-skinned',
-    'ollerton',
-    'olomouc',
-    'ols',
-    'olsson',
-    'olympians',
-    'omanis',
-    'omb',
-    'omdurman',
     'omittd',
-    'omnipresence',
-    'omsk',
-    'on-shore',
-    'once-for-all',
-    'one-all',
-    'one-liner',
-    'one-minute',
-    'one-nil',
-    'one-offs',
-    'one-phase-on',
-    'one-seventh',
-    'ongar',
-    'onomatopoeic',
-    'onside',
-    'ontogeny',
     'oodles',
-    'oohs',
-    'oomph',
-    'op._cit',
-    'opac',
-    'openside',
-    'openvision',
-    'opera-house',
-    'operationalized',
-    'optimizing',
-    'optoelectronic',
-    'oram',
-    'orange-coloured',
-    'orangemen',
-    'orangey',
-    'oratorical',
     'orbison',
-    'orbited',
-    'orca',
-    'ordaining',
-    'ordinaries',
-    'orestes',
-    'org',
-    'organochlorines',
-    'orlov',
-    'ormiston',
-    'ormolu-mounted',
-    'oro',
-    'orphism',
-    'ort',
-    'orthoptera',
-    'ortiz-pati&ntilde;o',
     'orwellian',
-    'osijek',
-    'osmonds',
-    'osorio',
-    'ossetian',
-    'ossification',
-    'ostankino',
-    'osteopathy',
-    'osterlind',
-    'ostlers',
-    'ostracized',
-    'otherworld',
-    'otranto',
-    'otton',
-    'outfalls',
-    'outgrowing',
     'outperforming',
-    'outspokenness',
-    'outstations',
-    'ouzo',
-    'over-65s',
-    'over-consumption',
-    'over-eating',
-    'overbridge',
-    'overcook',
-    'overdosed',
-    'overestimating',
-    'overground',
-    'overpainting',
-    'overpricing',
-    'overprotective',
-    'overreach',
     'overreact',
-    'overripe',
-    'overshadows',
-    'oversimplifies',
-    'overstocking',
-    'oviducts',
-    'owenism',
-    'owenite',
-    'owlish',
-    'owner-managers',
-    'oxenhope',
-    'oxidisation',
-    'p%',
-    'p&amp;w',
-    'p&eacute;rigueux',
-    'p&lt;0.00001',
     'p&lt;0.002',
-    'p-38',
-    'p.7',
-    'p.w.',
-    'p/o',
-    'p17',
-    'p185',
-    'p22',
-    'p30',
-    'p9',
-    'pabxs',
-    'pacab3',
-    'pacab4',
-    'pacem',
-    'pacepa',
-    'pachytene',
     'paderborn',
-    'paged',
-    'paicv',
-    'pailin',
-    'pain-killing',
-    'pain-language',
-    'paish',
-    'pakis',
-    'palaeography',
-    'paleontology',
-    'palichuk',
-    'pall-bearers',
-    'pallanza',
-    'palliation',
-    'palpation',
-    'pamina',
     'pamphleteers',
-    'pan-african',
-    'pan-am',
-    'pan-american',
-    'pangaea',
-    'pangenesis',
-    'panna',
-    'pantiled',
-    'papier-m&acirc;ch&eacute',
-    'papier_m&acirc;ch&eacute',
-    'papier_mache',
-    'pappy',
-    'par-4',
-    'par-5',
-    'parakeets',
-    'parallelisms',
     'paratone',
-    'paratroop',
-    'pardoe',
-    'pardonable',
-    'pardoning',
-    'parin',
-    'parkers',
-    'parkeston',
-    'parque',
-    'part-owner',
-    'partakes',
-    'particularistic',
-    'parturition',
-    'parva',
-    'paskevich',
-    'passe',
     'passerines',
-    'patchiness',
-    'patil',
-    'patronizingly',
-    'pauli',
-    'paulin',
-    'paunchy',
-    'pavers',
-    'pawley',
-    'pawning',
-    'paxos',
-    'payday',
-    'payphones',
-    'pdp',
-    'pdp-11',
-    'pdr',
     'pea-green',
-    'peatland',
-    'pecs',
-    'pedaloes',
-    'peelers',
-    'pees',
-    'peet',
-    'peewit',
-    'pelling',
-    'pencilling',
-    'peniel',
-    'pension-fund',
-    'penta',
-    'pentagons',
-    'pentium-ready',
-    'peppermints',
     'per&oacute;n',
-    'percolation',
-    'perdition',
-    'perfecto',
-    'performative',
-    'periodontitis',
-    'periwinkle',
-    'perkin-elmer',
-    'peronists',
-    'perrins',
-    'perrot',
-    'pers.',
-    'personalty',
-    'perspicuous',
-    'pertly',
-    'perturb',
     'pesca',
-    'pessarane',
-    'pessaries',
-    'pessimistically',
-    'pethick-lawrence',
-    'petit-bourgeois',
-    'petrine',
-    'petrobras',
-    'petrock',
-    'petrol-driven',
-    'petted',
-    'pettersson',
-    'peu',
-    'ph/pco',
-    'ph2',
-    'phalarope',
     'phalle',
-    'pharaonic',
-    'phare',
-    'phat',
-    'phenobarbital',
-    'phenol-chloroform',
-    'philippians',
-    'phillipa',
-    'philly',
-    'phoebus',
-    'phokians',
-    'phone-call',
-    'phosphatic',
-    'phosphoinositide',
-    'phosphorous',
-    'photochemistry',
     'photostat',
-    'pi&egrave;ce_de_r&eacute;sistance',
-    'piacenza',
-    'piazzale',
-    'picabia',
-    'picnickers',
-    'piddling',
-    'piercebridge',
-    'pierremont',
-    'pigeon-hole',
-    'pigott',
-    'pigskin',
-    'pilaster',
-    'pilau',
-    'pilchard',
-    'pilferage',
     'pillboxes',
-    'piller',
-    'pim',
-    'pimms',
-    'pin-pointed',
-    'pinar',
-    'pindown',
-    'pinehurst',
-    'pink-eyed',
-    'pinkney',
-    'pinnegar',
-    'pinprick',
-    'pipping',
-    'piscis',
-    'pitch-black',
-    'pitheavlis',
     'pithers',
-    'piton',
-    'pitons',
-    'pittsburg',
-    'pk',
-    'placatingly',
-    'plasmodium',
-    'plastic-covered',
-    'plasticisers',
-    'player-boss',
-    'playin\'',
-    'playmaker',
-    'plein',
-    'pleven',
-    'plinian',
-    'plomer',
     'plonking',
-    'ploughshares',
-    'plowman',
-    'plum-coloured',
-    'plumping',
-    'plus-fours',
-    'pmdl',
-    'pneumococcal',
-    'poincar&eacute',
-    'poinsettias',
-    'poisonings',
-    'polanyi',
-    'polartec',
-    'poli',
-    'police-officers',
-    'politicos',
     'polities',
-    'politique',
-    'pollini',
-    'pollster',
-    'polperro',
-    'polycrystalline',
-    'polyesters',
-    'polykrates',
-    'polysaccharides',
-    'pomander',
-    'pomeroy',
-    'pomgol',
-    'poms',
-    'pontiac',
-    'pontin',
-    'pontino',
     'pontormo',
-    'pontrhydyfen',
-    'pooh-poohed',
-    'poona',
-    'poor-quality',
-    'popova',
-    'poppadoms',
-    'popularising',
-    'population-based',
-    'porgy',
-    'portaferry',
-    'portnahaven',
-    'portraitist',
-    'portside',
-    'posers',
-    'posix-compliant',
     'posses',
-    'post-1979',
-    'post-coital',
-    'post-conquest',
-    'post-dated',
-    'post-dissolution',
-    'post-impressionist',
-    'post-office',
-    'post-qualification',
-    'post-world',
-    'postmarked',
-    'postmaster-general',
-    'postmultiplication',
-    'postponements',
-    'potemkin',
-    'potently',
     'pouffe',
-    'poutsma',
-    'povey',
-    'powerplant',
-    'powicke',
-    'ppyacrc5',
-    'praetorian',
-    'prakash',
-    'pramual',
-    'prandtl',
-    'prattled',
-    'pre-bookable',
-    'pre-conciliar',
-    'pre-conditions',
-    'pre-contract',
-    'pre-dating',
     'pre-hearing',
-    'pre-history',
-    'pre-implantation',
-    'pre-loaded',
-    'pre-meeting',
-    'pre-prepared',
-    'pre-reformation',
-    'pre-selected',
-    'pre-trained',
-    'precipices',
-    'precognition',
-    'preconditioning',
-    'predestinarian',
-    'predicaments',
-    'prefacing',
-    'prefatory',
     'premaxilla',
-    'premeditation',
-    'preminger',
-    'preoccupying',
-    'preponderant',
-    'prepossessing',
-    'preprogrammed',
-    'prescribers',
-    'prescriptives',
-    'pressings',
-    'presteigne',
-    'prevaricating',
-    'prigs',
-    'primera',
-    'primetime',
-    'princetown',
     'print&num',
-    'prioritisation',
-    'prismatic',
-    'pritt',
-    'prize-winners',
-    'prizewinning',
-    'pro-american',
-    'pro-communist',
-    'pro-conservative',
-    'pro-nazi',
-    'procrastinating',
-    'procreate',
-    'production-line',
-    'professional/client',
-    'professorships',
-    'profit-maximising',
     'profoundest',
-    'profs',
-    'prognostications',
-    'programme-makers',
-    'progressivism',
-    'proletarianization',
-    'prophase',
-    'propinquity',
-    'proposers',
-    'propositioned',
-    'propounding',
-    'propylene',
-    'protectable',
-    'protectorship',
-    'proteinuria',
-    'protek',
     'protrusions',
-    'protuberances',
-    'provisioned',
-    'provo',
-    'pruritus',
-    'prynn',
-    'psdr',
-    'pseudoaneurysms',
-    'pso',
-    'psychedelics',
-    'psyches',
-    'psychologism',
-    'psychotics',
-    'ptah',
-    'ptgi',
-    'public-service',
     'publicly-funded',
-    'puddin\'',
-    'puente',
-    'puking',
-    'pullets',
-    'pullin',
-    'pulpy',
-    'pummel',
-    'pungently',
-    'punsalmaagiyn',
-    'pupal',
-    'pupil-centred',
-    'puppeteer',
-    'puppetry',
-    'puppyhood',
-    'purlins',
     'purulent',
-    'purveyance',
-    'puttin\'',
-    'pws',
-    'pyridine',
-    'q\'',
-    'q.t',
-    'qacs',
-    'qbe',
-    'qin',
-    'qm',
-    'qu&eacute;becois',
-    'quadrats',
-    'quadrupeds',
-    'quaich',
-    'quakes',
     'qualix',
-    'quantick',
-    'quarantined',
-    'quarrymen',
-    'quarter-inch',
-    'quartier',
-    'quasiregular',
-    'quatrains',
-    'questura',
-    'quiberon',
-    'quiches',
-    'quick-tempered',
-    'quiggers',
-    'quilter',
-    'quim',
-    'quimper',
     'quindale',
-    'quinquennial',
-    'quintas',
-    'quintianus',
-    'quire',
-    'quli',
-    'quotable',
-    'r&amp;t',
-    'r&eacute;gimes',
-    'r.e.m.',
-    'r/',
-    'r25',
-    'r5868',
-    'r74',
-    'r8',
-    'rabble-rousing',
     'rabelais',
-    'rabta',
-    'rach',
-    'rack-mounted',
-    'radburn',
-    'raddled',
-    'radiologists',
-    'rads',
-    'radway',
-    'raga',
-    'ragamuffin',
-    'ragu',
-    'railcar',
-    'railway-building',
-    'raksi',
-    'ram-raiding',
     'ramey',
-    'ramped',
-    'rancher',
-    'randell',
-    'ranter',
-    'rappaport',
-    'raptor',
-    'rat-catcher',
-    'rathaus',
-    'rationalizations',
-    'rattlesnakes',
-    'rauf',
-    'ravello',
-    'rawalpindi',
-    'rawcliffe',
-    'rawdon',
     'rawlsian',
-    'raynsford',
-    'rb211',
-    'rdi',
-    're-allocation',
-    're-appear',
-    're-appoint',
-    're-crossed',
-    're-development',
-    're-educate',
-    're-emphasise',
-    're-enacts',
-    're-invented',
-    're-invest',
-    're-offending',
-    're-sold',
     're-trial',
-    're-union',
-    'reactivating',
-    'reafforestation',
-    'realty',
-    'reanalysis',
-    'reappraised',
-    'rearview',
-    'reassignment',
-    'rebel-held',
-    'rebuffs',
-    'rebuilds',
-    'rebutting',
-    'recanalisation',
-    'recant',
-    'recency',
     'rechristened',
-    'recidivism',
-    'recouping',
-    'recuperated',
-    'recuperative',
-    'recusants',
-    'recyclers',
-    'red-green',
-    'red-light',
-    'red-roofed',
-    'red-tailed',
-    'redlands',
-    'redo',
-    'redondo',
-    'redone',
-    'ree',
     'reekie',
-    'referable',
-    'refines',
-    'reflation',
-    'reflectivity',
-    'refugia',
-    'regally',
-    'regionals',
-    'registrants',
-    'regularised',
-    'regulationists',
-    'rehearses',
-    'reindeers',
-    'reining',
-    'reintroductions',
-    'reiter',
     'reivers',
-    'rel',
-    'relaunching',
-    'relearning',
-    'relist',
-    'relives',
-    'remaindered',
-    'remaisnil',
-    'remarrying',
-    'reminiscently',
-    'remount',
-    'renata',
-    'renationalise',
-    'renault-williams',
-    'rendall',
-    'renditions',
     'rennet',
-    'repeals',
-    'repeaters',
-    'replanning',
-    'replicable',
-    'repopulation',
-    'reposing',
-    'reprimanding',
-    'reprographics',
-    'repudiates',
-    'reputational',
-    'reseeding',
-    'resignalling',
-    'resinous',
-    'resler',
-    'resonating',
     'restarting',
-    'restates',
-    'resultative',
-    'resum&eacute',
-    'retaking',
-    'retirees',
-    'retook',
-    'retrovirus',
-    'rettie',
-    'retuning',
-    'reutemann',
-    'revelstoke',
-    'revenue-raising',
-    'reverberant',
-    'reverberates',
-    'reversibility',
     'reviewable',
-    'revocable',
-    'revolucionaria',
-    'revolutionising',
-    'rexel',
-    'rhona',
-    'rhone-poulenc',
-    'riboflavin',
-    'ribonucleic',
-    'riccarton',
-    'richardsons',
-    'richens',
-    'rickett',
-    'ricoh',
-    'riffaterre',
-    'rifkin',
     'riggs',
-    'right-',
-    'right-hander',
-    'rightsizing',
-    'rightward',
-    'rigney',
-    'riksdag',
-    'rimington',
-    'rinds',
-    'rindt',
-    'rinses',
-    'riofinex',
-    'riotously',
-    'rip-offs',
-    'ris',
-    'rissington',
     'rivendell',
-    'rizzi',
-    'rj',
-    'rnib',
-    'ro-ro',
-    'roadcare',
-    'roadies',
-    'roadster',
-    'robinsons',
-    'rocca',
-    'rocher',
-    'roches',
-    'rock-climbing',
-    'rocking-chair',
-    'rockling',
-    'rockman',
     'rod-like',
-    'roderigo',
-    'rodet',
-    'roeder',
-    'rolando',
-    'ronde',
-    'rookery',
-    'roomette',
-    'roraima',
-    'rosanna',
-    'rosberg',
-    'rosin',
-    'roslin',
-    'rossiya',
-    'rostron',
-    'rotax',
     'rotter',
-    'rouget',
-    'roughley',
-    'round-faced',
-    'rowdyism',
-    'royces',
-    'roycroft',
-    'royd',
-    'rpp',
-    'rra',
-    'rsno',
-    'rss',
-    'rsspcc',
-    'rsv',
-    'ruabon',
-    'rubato',
     'rubber-like',
-    'rubber-stamped',
-    'rubicon',
-    'rubio',
-    'rubles',
-    'rucks',
-    'ructions',
-    'rudby',
-    'ruffs',
-    'ruggedness',
-    'ruling-class',
-    'rumelhart',
-    'rumeli',
-    'run-on',
-    'runefangs',
-    'runt',
     'russian-speaking',
-    'ruthyn',
-    'rutledge',
-    'ruz',
-    's-plane',
-    's-shaped',
-    's.3(1)',
-    's.4',
-    's.6',
-    's.g.',
-    's.p.a',
-    's.r.o.',
-    's.w.',
-    's/z',
-    's1(1)',
-    's18',
     's34',
-    's677',
-    's83',
-    'sa\'adoun',
-    'saber',
-    'sabraxis',
-    'sacrae',
-    'saddle-bags',
-    'safi',
-    'sagacious',
-    'sagan',
-    'sago',
-    'sahnoun',
-    'sailboat',
-    'sailfish',
-    'saimaa',
     'saintliness',
-    'saintonge',
-    'sakkrat',
-    'salan',
-    'salander',
-    'salariat',
-    'saleswoman',
-    'sallied',
-    'saltford',
-    'samavia',
-    'samburu',
-    'same-sex',
-    'sammlung',
-    'samrin',
-    'sancerre',
-    'sanctus',
     'sandham',
-    'sandhopper',
-    'sandman',
-    'sangsad',
-    'sano',
-    'sans-papiers',
-    'sanusi',
-    'sapient',
-    'sapir',
-    'sard',
-    'sasaki',
-    'saspac91',
-    'sat.',
-    'satiny',
-    'satipur',
-    'satsumas',
     'saturate',
-    'saturnine',
-    'saty&amacr;grahi',
-    'saumur',
-    'sauvy',
-    'savak',
-    'savant',
-    'savours',
-    'saxelby',
-    'saxifrage',
-    'sayles',
-    'sca',
-    'scaife',
-    'scalpels',
-    'scarisbrick',
-    'scarlets',
     'scarsdale',
-    'scawd',
-    'schalck-golodkowski',
-    'scharnhorst',
-    'schein',
-    'scherer',
-    'schiehallion',
-    'schinkel',
-    'schisgal',
-    'schizotypal',
-    'scholasticism',
-    'schoolbag',
-    'schoolbook',
-    'schoolmate',
-    'schwarzendorn',
-    'schweinfurt',
     'schwitters',
-    'scientia',
-    'scimitar',
-    'scions',
-    'sconul',
-    'scooby',
-    'scopus',
-    'scorecards',
-    'scoter',
-    'scotton',
-    'scotus',
-    'scourges',
-    'scours',
-    'scouted',
-    'scr',
-    'scrapbooks',
     'scrapers',
-    'scratchings',
-    'scrawls',
-    'screeches',
-    'scrimgeour',
-    'scrimshaw',
-    'scuffled',
-    'scull',
-    'sculling',
-    'scythian',
-    'se11',
-    'sea-borne',
-    'sea-king',
-    'sea-urchins',
-    'seaco',
-    'seafarer',
     'sealers',
-    'seaming',
-    'seamy',
-    'seascapes',
-    'sebba',
-    'sebokeng',
-    'secam',
-    'seceded',
-    'second-level',
-    'secondee',
-    'seconders',
-    'sectorisation',
-    'sedges',
-    'sedimentology',
-    'seduces',
-    'seed-heads',
     'seedbed',
-    'seelisberg',
-    'segall',
-    'segovia',
-    'segundo',
-    'sei',
-    'seigneurial',
-    'seismology',
-    'seitz',
-    'seladang',
-    'seldes',
-    'self-abuse',
-    'self-actualisation',
-    'self-addressed',
-    'self-assembly',
-    'self-censorship',
     'self-controlled',
-    'self-deprecation',
-    'self-education',
-    'self-indexing',
-    'self-levelling',
-    'self-motivated',
-    'self-neglect',
-    'self-reference',
-    'self-reflexive',
-    'self-revelation',
-    'self-selection',
-    'selwood',
-    'semi-derelict',
-    'semi-formal',
-    'semi-private',
-    'semi-public',
     'semi-roundels',
-    'semmens',
-    'semyonov',
-    'seneschals',
-    'senfed',
-    'senhor',
-    'sentinels',
-    'seraphic',
-    'serenata',
-    'serious-minded',
-    'serius',
-    'sermisy',
-    'serology',
-    'servitors',
-    'setae',
-    'seumas',
     'seven-month-old',
-    'sevenfold',
-    'sevilla',
-    'sex-change',
-    'sex-role',
-    'sextet',
-    'sextus',
-    'seyed',
-    'sforza',
-    'sgs',
-    'shafted',
-    'shap',
-    'shape-specific',
-    'shapland',
-    'sharer',
-    'sharers',
     'sharmas',
-    'sharples',
-    'shatt',
-    'she-devil',
-    'shearmen',
-    'sheepskins',
-    'shehabuddin',
-    'shekels',
-    'shelagh',
-    'shellerton',
-    'shellhole',
-    'shellsuit',
-    'shenley',
-    'shepperton',
-    'sherard',
-    'shere',
     'sherek',
-    'sherratt',
-    'sherrington',
-    'shibboleth',
-    'shilly-shallying',
-    'shimmers',
-    'shinier',
-    'shinning',
-    'shipmaster',
-    'shirked',
-    'shirty',
-    'shithouse',
-    'shitless',
-    'shiv',
-    'shlomo',
-    'shoaib',
     'shonfield',
-    'shoot-outs',
-    'shop-window',
-    'shoplift',
-    'shopworkers',
-    'short-haired',
-    'short-haul',
-    'shoulder-high',
-    'show-business',
-    'shrubberies',
-    'shufflebotham',
-    'shug',
-    'shuker',
-    'shushing',
-    'shutdowns',
-    'shuttled',
     'sibley',
-    'sica',
-    'sicken',
-    'sickles',
-    'sidestepping',
-    'sienese',
-    'sieveking',
-    'sifts',
-    'signal-to-noise',
-    'signalbox',
-    'significations',
-    'sigouri',
-    'sikkim',
-    'silene',
-    'siliceous',
-    'silke',
     'silkworm',
-    'sillery',
-    'sillier',
-    'siltstone',
-    'silvaticum',
-    'silversmiths',
-    'silverstein',
-    'silvery-green',
-    'simbel',
-    'simplesse',
-    'simpliciter',
-    'sinar',
-    'single-cell',
-    'single-mode',
-    'single-seat',
-    'single-sided',
     'singlehanded',
-    'singlehandedly',
-    'singspiel',
-    'sinistral',
-    'sinix',
-    'sinn',
-    'sino-japanese',
-    'sintra',
-    'sinuously',
-    'siphoning',
-    'sira',
-    'siro',
-    'sisyphus',
-    'sit-com',
-    'situates',
-    'six-',
     'six-pack',
-    'six-yard',
-    'six-year-olds',
-    'sixthly',
-    'sj&ouml;gren',
-    'skelwith',
-    'skive',
-    'skopje',
-    'skulk',
-    'skunks',
-    'slacking',
-    'slaley',
-    'slapton',
-    'slateford',
-    'slaved',
-    'sledgehammers',
     'sli',
-    'slickly',
-    'sligachan',
-    'slims',
-    'slosh',
-    'slp',
-    'sm-b',
-    'sm1',
-    'small-holding',
-    'smalls',
-    'smarted',
-    'smarticons',
-    'smes',
-    'smirke',
-    'smirnoff',
-    'smithies',
     'smmt',
-    'smooth-skinned',
-    'smudgy',
-    'smythson',
-    'sn-1',
-    'snaffle',
-    'snaresbrook',
-    'sncf',
-    'snelling',
-    'snobbishness',
-    'snowbound',
-    'snowdrop',
-    'snuffing',
-    'so-',
-    'soaping',
-    'sobhuza',
     'socials',
-    'soco',
-    'sodomite',
-    'soffit',
-    'softies',
-    'softlab',
-    'solair',
-    'solar-powered',
-    'solders',
-    'soldierly',
-    'solidarity-led',
-    'solipsistic',
-    'soliton',
-    'solitons',
-    'solti',
-    'somalian',
     'somites',
-    'songsters',
-    'sonne',
-    'sonorities',
-    'sons-in-law',
-    'sonship',
-    'sorta',
-    'souks',
-    'sound-proofed',
-    'sounion',
-    'souped-up',
-    'southam',
-    'soviet-american',
-    'soviet-style',
-    'soyabean',
-    'space-saving',
     'spacer',
-    'spacey',
-    'spangles',
-    'sparccenter',
-    'sparsity',
-    'spawns',
-    'spaying',
-    'speedboats',
-    'speenhamland',
-    'speight',
-    'spes',
-    'speywood',
-    'spicers',
-    'spigot',
-    'spillane',
-    'spindrift',
     'spinosus',
-    'spinsterhood',
-    'spittal',
-    'spitzbergen',
-    'spivs',
-    'splaying',
-    'splices',
-    'splodge',
-    'splurge-weed',
-    'spong',
-    'sportingly',
-    'sportster',
-    'spotlighting',
-    'spray-on',
-    'sprayers',
-    'sprayway',
     'spreaders',
-    'sprees',
-    'sprocket',
-    'spunky',
-    'spurling',
-    'spurning',
-    'spurns',
-    'sq.',
-    'sq._ft',
-    'sq.ft',
-    'squaddie',
-    'squawks',
-    'squeaky-clean',
-    'squeegee',
-    'squinches',
-    'squints',
     'sr.',
-    'srihari',
-    'ssafa',
-    'stahl',
-    'stalactite',
-    'stalinists',
-    'stampeded',
-    'stanage',
-    'standard-rated',
-    'standings',
-    'standlake',
-    'stantonbury',
-    'starfield',
-    'starker',
-    'starsuit',
-    'statemented',
     'staten',
-    'staterooms',
-    'statoil',
-    'steak-and-kidney',
-    'stearic',
-    'stearman',
-    'stearn',
-    'steel-grey',
-    'steelmaking',
-    'steepened',
-    'steeplechaser',
-    'steinitz',
-    'steink&uuml;hler',
-    'steinway',
-    'stencilling',
-    'stennett',
     'stenton',
-    'stentorian',
-    'stepsister',
-    'steriliser',
-    'sterna',
-    'stet',
-    'steuart',
-    'stewarding',
-    'stewpid',
-    'steyning',
-    'stiff-legged',
-    'stigmatising',
-    'stilk',
-    'stillington',
-    'stockmen',
-    'stockroom',
     'stonebridge',
-    'stoneman',
-    'stooks',
-    'stop-watch',
-    'stoppered',
-    'storah',
-    'storie',
-    'storm-tossed',
-    'storybook',
-    'stoup',
-    'straight-faced',
-    'straightforwardness',
-    'straightjacket',
-    'stranmillis',
-    'strathtay',
-    'stream-of-consciousness',
     'street-lamps',
-    'street-porter',
-    'street-wise',
-    'strensall',
-    'strephon',
-    'stress-free',
-    'stretcher-bearers',
-    'strike-breaking',
-    'stripped-down',
-    'stroheim',
-    'strongyles',
-    'strummed',
-    'strumpet',
-    'stupidest',
-    'stylisation',
-    'stylolites',
     'styrene',
-    'styria',
-    'styx',
-    'sub-areas',
-    'sub-clauses',
-    'sub-licensees',
-    'sub-prior',
-    'sub-sales',
-    'sub-samples',
-    'subarctic',
-    'subdirectory',
-    'subdividing',
-    'subepithelial',
-    'subheadings',
-    'subject-specific',
-    'submissively',
     'subskills',
-    'subsoils',
-    'substage',
-    'substituents',
-    'subtropics',
-    'suburbanites',
-    'succussions',
-    'sucre',
-    'suedehead',
-    'suffragist',
-    'sugarcane',
-    'suis',
-    'sula',
-    'sulcus',
-    'summerslam',
-    'sumptuary',
     'sun-baked',
-    'sunthorn',
-    'supercritical',
-    'superfine',
-    'supergiant',
-    'superhero',
-    'superintending',
-    'supermarine',
-    'superscript',
-    'supersport',
-    'suppertime',
-    'supplicant',
-    'suppressive',
-    'suppuration',
-    'supraconal',
-    'suprasegmental',
     'supraventricular',
-    'surya',
-    'sustrans',
-    'susy',
-    'suttee',
-    'suturing',
-    'sv40',
-    'sverdlovsk',
-    'swank',
-    'swatted',
-    'sweeting',
-    'swept-back',
-    'swi',
-    'swigged',
-    'swingers',
-    'swissair',
     'swordtails',
-    'symon',
-    'sympathising',
-    'sympathizer',
-    'sympatry',
-    'synaspismos',
-    'synchronize',
-    'syncretism',
-    'synectics',
-    'syphoned',
-    'system/36',
-    'systemically',
-    'szabo',
-    't&ecirc;te-&agrave;-t&ecirc;te',
-    't-1',
-    't-test',
     't3',
-    't9000s',
-    'taatgarat',
-    'tabkay',
-    'table-cloth',
-    'table_d\'hote',
-    'tablers',
-    'tabouret-keller',
-    'tagamet',
-    'taha',
-    'taher',
-    'tailboard',
-    'tailcoat',
-    'takamine',
-    'takeaways',
-    'talabecland',
     'talespinner',
-    'talisker',
-    'talkies',
-    'talybont',
-    'tampico',
-    'tanay',
-    'tanberg',
-    'tandri',
-    'tangentially',
-    'tangibly',
-    'tankful',
-    'tannic',
-    'tarasova',
-    'tarling',
-    'tarmacadam',
-    'taskforce',
     'taskmaster',
-    'tasmin',
-    'tasso',
-    'tastings',
-    'tattooing',
-    'tautologous',
-    'tax-deductible',
-    'tax-raising',
-    'tc-99m',
-    'tc1',
-    'tca',
-    'tcc',
-    'tea-bag',
-    'tea-bags',
-    'tea-making',
-    'tea-party',
     'teabag',
-    'teacher-librarian',
-    'tearooms',
-    'teasdale',
-    'teashop',
-    'technocracy',
-    'teck',
-    'teessiders',
-    'teixeira',
-    'telecomms',
-    'telecottages',
-    'telematics',
-    'telephone-tapping',
-    'televise',
-    'telnet',
-    'tempe',
     'templepatrick',
-    'ten-fold',
-    'ten-inch',
-    'tenderest',
-    'tendonitis',
-    'tenison',
-    'tennants',
-    'tenpence',
-    'teplice',
-    'terephthalate',
-    'terminologies',
-    'ternary',
-    'tertiis',
-    'test-bed',
-    'testators',
-    'tetrahedron',
     'tetsu',
-    'tewkesbury/gloucestershire',
-    'th&eacute;oden',
-    'th&eacute;odore',
-    'thackrah',
-    'tham',
-    'thang',
-    'thanh',
-    'thau',
-    'theirself',
-    'thelodonts',
-    'thenceforward',
-    'theologies',
-    'theorised',
-    'therborn',
-    'thermocouple',
     'thietmar',
-    'thirstily',
-    'thirty-first',
-    'thistledown',
-    'thon',
-    'thorkel',
-    'thorndike',
-    'thornes',
-    'thorntons',
-    'thos',
-    'thread-like',
-    'three-month-old',
-    'three-party',
-    'three-wheeled',
-    'threequarters',
-    'thrillingly',
     'thro\'',
-    'thumper',
-    'thunderbolts',
-    'thundery',
-    'thurlbeck',
-    'thurloe',
-    'tich',
-    'ticino',
-    'tick-tock',
-    'tiddlers',
-    'tiebreaker',
-    'tiepolo',
-    'tiergarten',
-    'tigerish',
-    'tignes',
-    'tigray',
     'timbmet',
-    'time-warner',
-    'tingles',
-    'tipster',
-    'tiptoes',
-    'titicaca',
-    'titillated',
-    'titters',
-    'tittle',
-    'tk',
-    'tk50',
-    'tmi',
-    'toastrack',
-    'toc',
-    'toddled',
-    'toed',
     'toefl',
-    'toenail',
-    'tof-sars',
-    'toft',
-    'toftingall',
-    'tol',
-    'tolpuddle',
-    'tom&aacute;s',
-    'tommorrow',
-    'tomorrows',
-    'tomsk',
-    'toneless',
-    'tonk',
-    'toohoolhoolzote',
-    'tooley',
-    'top-of-the-line',
     'top-scored',
-    'topographically',
-    'toppings',
-    'topples',
-    'torben',
-    'torit',
-    'torr',
-    'torrens',
-    'torridge',
-    'tors',
-    'tortfeasor',
-    'toubon',
-    'tough-minded',
-    'toughly',
-    'toussaint',
-    'tovarisch',
     'tow-path',
-    'towne',
-    'townies',
-    'tox',
-    'toxaemia',
-    'toxicological',
-    'tpc',
-    'tradable',
-    'traherne',
-    'train\'',
-    'tramlines',
-    'transboundary',
-    'transformative',
-    'transgenics',
-    'transitivity',
-    'transjugular',
     'transmat',
-    'transvestism',
-    'trantridge',
-    'trapezius',
-    'trapp',
-    'trashing',
-    'trau',
-    'treacly',
-    'treadle',
-    'trebor',
-    'treffry',
-    'trelawny',
-    'trenchard',
-    'tretorn',
-    'triage',
-    'trialled',
     'tribesman',
-    'tribespeople',
-    'tribulation',
-    'tricycles',
-    'trimm',
-    'trimmers',
-    'trincomalee',
-    'tringa',
-    'triple-a',
-    'triremes',
-    'triseliotis',
-    'tritiated',
-    'tritsis',
-    'trivially',
-    'trobriand',
-    'tropospheric',
     'trousered',
-    'trowels',
-    'trower',
-    'truanting',
-    'truces',
-    'trug',
-    'trumped-up',
-    'truncal',
-    'truth-value',
-    'try-out',
-    'try-scoring',
-    'tryptic',
-    'tsarina',
-    'tsk',
-    'tsl',
-    'tsunamis',
     'tubercular',
-    'tuebrook',
-    'tulsa',
-    'tumulus',
-    'tunny',
-    'turbocharger',
-    'turkana',
-    'turn-ups',
-    'turnabout',
-    'turton',
-    'tuthill',
-    'twanged',
-    'tweedle',
-    'tweedledee',
-    'twenty-fourthers',
-    'twenty-ninth',
     'twerton',
-    'twin-track',
-    'twister',
-    'twitchers',
-    'two-child',
-    'two-digit',
-    'two-legged',
-    'two-nil',
-    'two-sided',
-    'two-star',
-    'two-step',
-    'two-term',
-    'two-to-one',
-    'two-wheeled',
-    'tyger',
-    'tylers',
     'tyndrum',
-    'type-faces',
-    'typhimurium',
-    'u.c.l.',
-    'uaru',
-    'ueberroth',
-    'uezd',
-    'ufology',
-    'ugix',
-    'uglow',
-    'uh-oh',
-    'uhf',
-    'uk-ors',
-    'ulrike',
-    'uls/jn',
-    'ultar',
     'ultrabasic',
-    'ultrafax',
-    'umbrian',
-    'umbro',
-    'ump',
-    'umw',
-    'unamended',
-    'unamuno',
-    'unamused',
-    'unanalysed',
-    'unappetizing',
-    'unarguably',
-    'uncircumcised',
-    'uncleared',
-    'unclenching',
-    'uncombed',
     'uncompressed',
-    'unconcernedly',
-    'unconjugated',
-    'unconstitutionally',
-    'uncounted',
-    'under-16s',
-    'under-17',
-    'under-achievement',
-    'under-employed',
-    'under-resourced',
-    'under-secretary-general',
-    'under-utilised',
-    'underage',
-    'underbidder',
-    'underframes',
-    'underpainting',
     'underrate',
-    'underrepresented',
-    'undersigned',
-    'understaffing',
-    'undervalues',
-    'underwrote',
-    'undescribed',
-    'undischarged',
-    'undulated',
-    'unelectable',
-    'unemotionally',
-    'unenthusiastically',
-    'unexploited',
-    'unfrequented',
-    'unfruitful',
-    'unfudgeability',
     'ungermann-bass',
-    'unhappiest',
-    'unhook',
-    'uniate',
-    'unifies',
-    'unikix',
-    'unitarianism',
-    'unitarians',
-    'unitree',
-    'units/week',
-    'unliquidated',
-    'unloving',
-    'unmanaged',
-    'unmasking',
-    'unmeasured',
-    'unmusical',
     'unnoticeable',
-    'unperceived',
-    'unpicking',
-    'unpolitical',
-    'unpopulated',
-    'unprompted',
-    'unquiet',
-    'unreason',
-    'unreconciled',
-    'unreflective',
-    'unrelentingly',
-    'unscripted',
-    'unserviceable',
-    'unshackled',
-    'unshakable',
-    'unsoundness',
     'unspecialized',
-    'unsupportable',
-    'unsupportive',
-    'unsympathetically',
-    'untangled',
-    'untying',
-    'unventilated',
-    'unwaveringly',
-    'unwed',
-    'unwonted',
-    'up-',
-    'up-grade',
-    'upanishads',
-    'uppal',
-    'uproarious',
-    'upswept',
     'upthrust',
-    'upwood',
-    'urgings',
-    'urologist',
-    'ursu',
-    'ursus',
-    'urvill',
-    'us&dollar;1,800',
-    'us&dollar;10,000,000',
-    'us&dollar;100',
-    'us&dollar;20,000',
-    'us&dollar;3,000',
-    'us-owned',
-    'user-id',
-    'utah-based',
-    'utensil',
     'v.3.2',
-    'v4',
-    'vacuums',
-    'vadose',
-    'vaizey',
-    'vakuf',
-    'valenciennes',
-    'valets',
-    'valise',
-    'vallejo',
-    'vansittart',
-    'vaporisation',
-    'varadi',
-    'varro',
-    'vassoir',
-    'vauxhalls',
     'vaxes',
-    'vaxs',
-    'vcs',
-    'velazquez',
-    'vena',
-    'venda',
-    'vendettas',
-    'venial',
-    'ventilatory',
-    'ventnor',
-    'ventralmost',
-    'ventriloquism',
-    'venturers',
-    'verbena',
-    'verbosity',
-    'verma',
     'vermiculite',
-    'verne-smith',
-    'vertus',
-    'verzy',
-    'vesey',
-    'vetter',
-    'vf',
-    'vhpb',
-    'vhs-c',
-    'vi.',
-    'vibrators',
-    'vice-prime',
-    'vici',
-    'victimize',
-    'videophone',
-    'videotronic',
     'viglen',
-    'vignerons',
-    'viking-based',
-    'vileness',
-    'villalobos',
-    'villeneuve',
-    'vincentius',
-    'vindicates',
-    'vindicating',
-    'vine-lott',
-    'vinegars',
-    'vinyls',
-    'violinists',
-    'vir',
-    'virtuosi',
-    'virtuosic',
     'virulently',
-    'visionware',
-    'vitale',
-    'vitalis',
-    'viticultural',
-    'vituperation',
-    'viva_voce',
-    'vives',
-    'vizcaya',
-    'vocative',
-    'vodkas',
-    'voice-overs',
-    'voila',
-    'volo',
-    'voronov-vaux',
-    'vp2',
     'vp3',
-    'vpn',
-    'vuillard',
-    'vulgarly',
-    'vung',
-    'w8',
-    'wack',
-    'wacko',
-    'wadhurst',
-    'wadsley',
-    'wagonload',
-    'wagtails',
-    'waif-like',
-    'waismann',
-    'waist-deep',
-    'wait-and-see',
     'waites',
-    'waives',
-    'wale',
-    'walkabouts',
-    'walken',
-    'walking-sticks',
-    'wall-hung',
-    'wall-paintings',
-    'wallachia',
-    'wallen',
-    'wallpapered',
-    'wano',
-    'wansford',
-    'wanta-wee',
-    'war-ravaged',
-    'warbled',
     'warded',
-    'wardroom',
-    'warehousemen',
-    'warfarin',
-    'warnaweera',
-    'warps',
-    'warranting',
-    'warzycha',
-    'wash-house',
-    'wash-out',
-    'washday',
-    'wast',
-    'watchwords',
-    'water-lily',
-    'water-power',
-    'waterhole',
     'waterlane',
-    'waterlooville',
-    'waterworth',
-    'watlington',
-    'watteau',
-    'wavefront',
-    'wavell',
-    'wavers',
-    'waylay',
-    'waymark',
-    'weak-kneed',
-    'weans',
-    'wearmouth',
-    'weatherhead',
-    'weatherley',
-    'websters',
     'wedtech',
-    'weightlifters',
-    'weighton',
-    'well-disciplined',
-    'well-fitting',
-    'well-integrated',
-    'well-marked',
-    'well-practised',
-    'well-protected',
-    'well-received',
-    'well-rotted',
-    'well-thumbed',
-    'well-understood',
-    'wellie',
-    'wenches',
-    'wendt',
     'wenner',
-    'werder',
-    'wernicke',
-    'wertheim',
-    'west-country',
-    'westcliff',
-    'westray',
-    'whacky',
-    'whalebone',
-    'whatley',
-    'wheee',
-    'wheeler-dealer',
-    'whetstones',
-    'whew',
-    'whey-faced',
-    'whickham',
     'whiled',
-    'whimsically',
-    'whinny',
-    'whitcroft',
-    'white-skinned',
-    'whiten',
-    'whitening',
-    'whitminster',
-    'whitten',
-    'whizzkid',
-    'whopper',
-    'whorehouse',
-    'widemouth',
-    'wides',
-    'wiesel',
-    'wifely',
     'wiggler',
-    'wignall',
-    'wilbraham',
-    'wildig',
-    'wilhelmina',
-    'willa',
-    'willaert',
-    'willans',
-    'willersley',
-    'willes',
-    'williamsburg',
-    'wilts.',
-    'win.ini',
-    'winces',
-    'wind-driven',
-    'wind-swept',
     'windbreak',
-    'windlass',
-    'wine-making',
-    'winemaker',
-    'winemakers',
-    'wining',
-    'winnington',
-    'wino',
-    'wintrobe',
-    'wire-mesh',
-    'wishbone',
-    'wissenschaft',
-    'withstands',
-    'witney/oxfordshire',
-    'woden',
-    'wolfed',
     'wollaton',
-    'wolman',
-    'womack',
-    'womanizer',
-    'woodcraft',
-    'woodhill',
-    'woodmill',
-    'wooler',
-    'wop',
-    'word-paths',
-    'wordplay',
-    'wordprocessor',
-    'wordsmith',
-    'work-in-progress',
-    'work-shy',
-    'worknet',
     'worley',
-    'worst-affected',
-    'wouldham',
-    'wouldn\'t',
-    'wrack',
-    'wrathful',
-    'wrist-watch',
-    'written-down',
-    'writtle',
-    'wroxham',
-    'wulstan',
-    'wwii',
-    'wydyr',
-    'wyton',
-    'x-y',
-    'x.25',
     'x.laevis',
-    'x11r5',
-    'xbase',
-    'xcelerated',
-    'xe8',
-    'xerophthalmia',
-    'xeu',
-    'xho',
-    'xpress',
-    'xps',
-    'xtc',
-    'xxix',
-    'xxvi',
-    'xxvii',
-    'xylene',
-    'yair',
     'yakuza',
-    'yamato',
-    'yamoussoukro',
-    'yardages',
-    'yasin',
-    'yassin',
-    'yasushi',
-    'ybarra',
-    'yearsley',
-    'yir',
-    'yngwie',
-    'yodelling',
-    'yokes',
-    'yolanda',
-    'yongchaiyut',
-    'yorkgate',
     'yorktown',
-    'youds',
-    'ysp',
-    'yttrium',
-    'yuppy',
-    'yurtsever',
-    'z&uuml;rich',
-    'zadok',
-    'zadokites',
-    'zahid',
-    'zahir',
-    'zahira',
-    'zakir',
-    'zantac',
-    'zapping',
-    'zawn',
     'zebedee',
-    'zeebeecee',
-    'zeide',
-    'zeitlin',
-    'zhivago',
-    'zig-zagged',
-    'zilog',
-    'zimbalan',
-    'zitney',
-    'zlotys',
-    'znf11b',
-    'znf33',
-    'zollverein',
-    'zooms',
-    'zoroaster',
     'zoroastrian',
-    'zoroastrianism',
-    'zosie',
-    'zulei',
-    'zup',
-    'zweig',
-    'zyl',
+)
+
+blocks_13 = (
+    '"-elig;thelnoth"-gr;-truncated"$mp;p"&st&ast!+bgr;-globin!$darr"$gr;g"*ollar;0.20()1,000,000*#100*$600m*#700*#900)#.25*!6',
+    '*"80)000&ndash;150,000+!0)"20+$,000*!5)%3,000*"0m)*50,000,000)%6,000*%0,000)%7,000*!m)"80($2.4m',
+    '*!m)!8(%3,300)#.9m($4.2m*"3m)*00,000,000)%5,000*!0(%5,500)#.3m))0,000,000*"00)!5($600m',
+    '(%7,500)%5,000($8.6m)#00m("90)!9)!m!-eacute;litism!*frac14&ins&!5%&34&ins!+micro;mol/g!$ohgr!*pound;1.19)#2bn',
+    ')"89(#0.5)!9)"bn("18)!9(#20m)!8("36(&45,000("59(%7,500)%0,000(#90m\'%2,600',
+    ')#800(#.80("05(&20,000)!m($3.50)!5("49("65)!m($7.99($8.50)!m\'$3.3m)!4',
+    '("09("1m(&20,000($5.00)"0m("70("85("99("bn(\'million\'%4,800(".8("3m(%4,000)!0',
+    '("60("99("bn\'$5.75(!1(%2,000)!0("5m(!7(%8,000($9.95\'#6.3)!6("30(%6,000',
+    '("95("bn\'$7.75(#50m)!m("95\'$8.00)!5(!1(!2\'"92(!3(%5,000(!7(!8',
+    '!-scaron;tanjel"$harp!(times;10\'"75 #\'87!#ell!#flu!"he!&imself!#she #+/-!!4 #-15!!9!$axis',
+    '!!e!\'induced!$like "/a!!c!!f *0&middot;5"(ndash;14()6&ndash;0)!0!#.16""22#!6#!8""32',
+    '"%5&ins""60#!6"#75%""85#!8""95!#000"!1"#:14!#206!"41""81!#500!#602',
+    '#!4!#703""34""53!&90&deg!"bn (1&frac34"(ndash;11)!2(#2-3"(shilling!#(4)!$,050"#150"#2,3',
+    '"\'300,000#"50"$500m!%-iron!#.0%"#1.3#!6"#2.1#!1"#3.4#.0&ndash;4.30pm$"am#!5#!7""40',
+    '#"mm""65#!m!"/3!+0&ndash;15%)!5"#-14#&member#$week"#.16#"35#"4%#"6%#"9%"#/65',
+    '*#200#%-fold$$mile$(year-old#!3#!5#"kg""10""22#!6#!8"#3/4#!1""42""51',
+    '""63""96#!7"#b-5"#cms"%p11.2!(1&frac12$!t##ins#\'ndash;1)!8"#-14#%month"#.12$!3',
+    '#"3%#"8%""01#!6#!8##mph""11"%2,000#!5#!7""59""60""71#!7""81',
+    '"!a""ft""pc"!s!$2(2)"(,000,000"#-15"#.15#"20"%0&deg#!3#!7#!p""12#!4',
+    '""20#!7""36#!8""44#!7#!8""66""87"!b!"3.""09""31#!9""49',
+    '""55#!8""62#!7#!8""72""86""90#!9""ft"!s!*4&ndash;18"#(2)#"3)""-1',
+    '"#.75""02""12""22#!9""33#!5""44#!8"%5,000#!6#!9""68""in!$5-10',
+    '$!3##day""0%#!1#!6""74"!g""oz""s.!&6-page"#.00#!9"#/17"!m#"hz',
+    '"#-19"!.!*8&ndash;24"!+"%-year"#.5%"%6,000""ft!&9-year"".6#!7"+11&ndash;12#*2&ndash;13"#33a#*9&ndash;40',
+    '"+60&ndash;64#*4&ndash;70"+70&ndash;71#"1b#"2b#)3&ndash;4$!a#)4&ndash;7#"5b#*7&ndash;78+!8#*9&ndash;81"+81&ndash;85#$6-88#*8&ndash;90',
+    '$"/9#*9&ndash;91"#90c#$1-95$!.#"2.$!a#*4&ndash;95#$5-96!!g!#oab!#sec \'2&deg;c"&frac34!#(8)',
+    '!"-5!#.19""23"$30am#!5"#4.2#!0"\'5-litre#&cm/1in!*0&ndash;21*!2*!6*!9"(,000,000"#-30',
+    '"$.00.#!7"#/20"+0&ndash;300#!4#!7"&cm/8in""km""lb"#min#"ph!$1-23"".1#!2#!3',
+    '!$2-24$!5"".4#!9!#3.3!$4-26#&member"".1""0k"(6&sol;89"!h"#ins!&5-mile"".5"#6kb',
+    '!*6&ndash;27"".2"!p!#7.5!#8.2#!5""mm"!p!*9&ndash;30!!f!!i!#min!#tsp!"x1 )3&ndash;7',
+    '!(,500,000!&-litre"$year&$-old!#.05"#1.1$!2""27#!8""35#!v"#4.1!+0&ndash;40%"#-40"".4',
+    '"!g!"2p"!v!#300!&40,000!(50&deg;f"!s!#6.5"&541-42!$7.5%"#040"#107"#245#"60"#313',
+    '"#471"#523$!6$!7#"35"#608#%31-41#"61"#718#"74"#899"#957$!8#"64#"79',
+    '"#006#"96"#110#"55#"64"#289#"98"#309#"40#"55"#458"#532"#6dx"#922!%9,000',
+    '"!p!!n "4*!"-4"#ply"&string!$.1.2#!6"#2.3"$30am"#4.1"#5.1!"/5!*0&ndash;60"\'0&deg;f',
+    '#!g""cm"!m#"ph!#100!%2&ins"#4mb"#6mb"!s!#30s!*5&ndash;50)"60*!4"#0mm!#6.4',
+    '!"9p!":1 +5&ndash;10%)!1("24!$,200"#600!#-10"!8".aminosalicylic"&series##tar"(year-old!%.00pm""19',
+    '#!9"#3.4##0am#!9"#4.1$!2$!3""50""8%!"/6!$00cc""1s""hz!%1,000!"28',
+    '!$4(4)"!4!#50c"!4"!8!"69""th!*8-year-old!"94"!7""th!"d.!"gb *6&ndash;12(!5',
+    '"#600"#800!"-5"$inch!#.18#!9"#2.3#!3#!4"#3.2"#4.1"+5&ndash;7.0""6%""8%""9%',
+    '!*0&ndash;64"$-day#&member"#0cc#"mm#!p""mw!"12"!6""st!"4k!*5&ndash;74"!+!*6-year-old""00',
+    '""00"!7!*8040-based"!1"!2"!3!*9-year-old"!1"!5"!7"!p""th!!f!"km!!x',
+    '!"-9!#.2%#!5""3%#".2"#6cm""75""8%!%0&deg&";c\'!f"#000#!s"!3!*1-year-old',
+    '")-year-old"!1"!2"!6!"38!"43""th!$5mph!%6,000"!4"!9!#7th!%8,000"!1"!4',
+    '""th!"93"!4!"cm!#lbs!"oz )8&ndash;6!(,000,000!%.00am""12"#2.2""33!%0&deg&";c"!4',
+    '"!9""ft""mb!*1-year-old!*2-year-old"!3!%3,000!#400"!9!"5p!"65"!6""th!"71"!3',
+    '!!c"!m (9&frac12!#(1)""3)!"-0"!4!#.14##5am#!8""20"#3.0"$45am"#5.0""6%',
+    '"!2"!7"!9""cm!"10"!2!"21"!4!"36!"42"!3!\'5&deg;c"$,000"!9!"64',
+    '!"71"!2"!5 "=0 #a-b"!d"$line"!u!#.b."!h""p.!"/b!"38!"64!"74',
+    '"#mir"&rdvark!(bbeville#\'otsbury"(delkader#&oulaye#&ullahi"#eam#$lson#+rdeen-based%#our%%ulais#!t"\'jection##ure',
+    '"&omasum$(inations#"ot#%rting#$yeur"%ridge#%ogate#$uzzo"&sented!$c/dc"7celeration/deceleration,!s#%redit"(etylated&#ene',
+    '+!c#$tung"\'id-free#"ni"#qua"(romegaly#$ylix"%taeon#"io"+upuncturist!(dagietto#\'mantium"%denda"%ebayo##pts',
+    '#!t"\'jacency##oin"#man#"en#\'onitory"(renergic""sw")ulterated\'"er#!r!+ero-engines$\'grammes"\'sthetes")thelwealh',
+    '"%finis"#ire"%rique")ter-hours!$gers",glomerations$)utination#+randizement%%vates($ions""in#%sters"-riculturalist#\'okomerc$\'nomists',
+    '!#hds"$idjo!$ikau#$homu""ls"#mer"$nley#&scough$#ley"\'r-dried$(launched$#sea$\'traffic#"ds#$head',
+    '$$ocks#$play#&stream"#sne!$k-47""47"#ass!"l-#$arab#%hakim#\'khalifa#\'nahayan#%thani"%amans"&batros',
+    '#!i$$cans$$nism#$orne"(cibiades""d.#\'borough"$eena#\'ksandur"%freda""ga#&eciras#$hero"&icante##gns',
+    '",kalinisation")l-dancing$*enveloping$(rounders$%share$%women#%aying#\'hallows##ium#&ocator$#ver"&manacs#&shouse"#ois#"ni',
+    '")phawindow+!s""te$$rity#)husserian"(un-jones"%yssum!"m."%anieu#"ru"1berley/pulborough#$oise#"ra$&osiano"/erica/caribbean',
+    '#&thysts"#ies#,noglycosides##tha"$lwch"&mianus"%oebae#)rtisation\'"ed"(picillin#$utee"$trak!(naglypta$$rams#(logizing',
+    '#&themas"\'choress".daluc&iacute;a#\'erlecht$%sites#$rade"(emometer"&glians%%cised#$otti"!h"%imacy%$tors$\'osities"#ker',
+    '$(-morpork"#nal$!m#%elids#&ulling$+s_mirabilis"$oint"\'sbacher"&tennas#$hill$&ranoid#.i-conservative\'"rn&&ruelty%)foreigner',
+    '%&matter%*perspirant%&rabbit&(eligious%%slave%%trade$\'gravity$*histamines$\'nuclear$(particle#&onescu%$inus"$ubis"!z!"ob',
+    '"&tearoa!(phrosyne"$noea"%ollon$\'ogetics&$izes#\'stolate"#pal#\'etitive#%lauds$$ique"%raxia#&il/may"!v!\'quacryl',
+    '$#vit#%ileia!%rabie#&gonite#!k"#bil"(ch-enemy$(deaconry$"iv$&osaurs#"os#%turus"\'dneavie""is$#ton',
+    '"$kady$"ig#!s"&madale%%illos$!s$$ture##ley#%ourer"%naldo"&rancay%$gers%!t#&henius#$idge',
+    '$$w&gt")temidorus$!x#"ic#)s/science"$ussi!%sbach#\'estosis"&h-shar##lar#!y"$kaig#!e#$rigg"%ocial',
+    '"&sholes#)ignations#"oc$%nance#!r#&umpsit#&yrians"*toundingly#&rakhan$%olabe%)physicist"\'utrames",ymmetrically!\'talanta""co',
+    '"!h#)eromatous#)letically""ms")omisation")rimonides""t.!&ughton"#rea$!l"#ssa##ter&%ities$,ralopithecus\'!s',
+    '$%route#"un!#ver$%agely"#gas"&iaries#$dity"%onlea##wal!(wesomely!"xa"$eman!$yala"\'lesford"\'urvedic',
+    '"&zedine \'b&amp;i"4eacute;n&eacute;teau#*grave;gles"(ndash;17!#-17!\'.c.c.i.""s.#\'ubtilis!%aabda"#bic#%y-sit"&ccarat#*k-slapping&$tage',
+    '$&packer$$seat%&liding"#ddy#!r""ez"\'gatelle##els"#iji#\'liwicks$!s")ker-finch%#loo"\'lberith$%indor',
+    '#\'l-point$(achulish%"de%!y$$gown$!o#"oo#&thasar"/nk/organisation$$note##non##yon""ps"\'rashevo#$bels',
+    '#$dera$"on#\'efooted#$ling#%mouth#/nett/gloucester#\'ometric$$nies#$rell#$tman$"ok%$lini#$well##yon"*skervilles',
+    '#%tardy"\'t-eared#%asuna$#via##eau#$ters%"ur$&icaloa$(le-dress&\'grounds"$ulks#!m"$veno"%wdsey"!x',
+    '#"ly#"ne"%zille##oft!"ci!"dn!&eanbag$$pole#%rskin#%tific"#bop""ca"%d-sit$\'wetting#&covers',
+    '##ell#&fellow#$post##ser$&preads"#eby#$chey#&fed-up#&lzebub"&gbroke#%etter##one"#han$*viouristic#$esht',
+    '",l-shamharoth##dam#$gica#$hadj#&l-like%(szekeres$$ends%#rby#+ow-the-line#$size#$tane$"ex"%moans#&usedly&$ment',
+    '#%itses#(sonhurst#\'thamite#&venuto"%rgamo$%hofer#"ia#%mudas#"ni#$satu#"ta$$elli$"he"$sted$$owal',
+    '"$tula"+wilderingly!&f109es#"10""po"!v!\'humibol!&iasion")bliophile"(furcated($ions"&g-city$$game$(spending##gie',
+    '""hi"%kinis"%llson"!m#$odal"$nkie"%o-rad#-compatibility#&sensor$&ystems#$tech"\'partite#%hasic"*rd-watcher$$cage',
+    '$$sall$\'watcher#&kleigh##ley#$rell##say#\'thmarks"%schof#(hopstone&#ton#$tros"#tow!\'lackaby&$moor%%grass',
+    '%$lock%$sell##nds%!y##ris#\'stocyst&%meres##tch"&eakest#&disloe#$mley"#imp#&sworth"*oemfontein#+od-curdling',
+    '\'&ucking%\'letting&#ust$)mingdales##tch#\'w-dried"(r&amp;dd"*ue-blooded%&veined$%birds%%ottle#$ffed#\'menthal#(nderbuss!"mg',
+    '!$oase"%bkins##oli"&densee##ger#&y-blow$(building"#ehm"&gdanov"!k"\'livians#$lock\'#ing#\'ognaise##ter',
+    '"(na_fides#%emeal#%nards#!s#"zo""ob$#yer#"ke$$fund$%point$%stock$$work\'"ms#!p#$tham',
+    '$%laces"&realis$\'hamwood#"go#%inage"\'scastle%#wen$$ombe#$sing"*ttle-green\'%wrack"$udin#$nder$$ties#%rgois',
+    '#$vard"$wery##ran#%sprit$%tring"&yishly!!q!%racts#(dycardia#%ehead#"he$-mac&amacr;rya#&idwood$&n-dead%!e',
+    '$$mall##nko##sil#&ughing##ves##yne$$shay$#ton"(eak-down&\'through$!n#$gawn#$ndel%"on#%ttell',
+    '$%k-red%%works#,dge-building&%north#\'ght-red&$well#$mful#$oche#&skness#*tish-built\'#ers"!l"+oad-brimmed%(er-based%$foot',
+    '#%caded#"ek#$gden#+ken-hearted%(r/dealer#%mhead$-odeoxyuridine#+nchodilator$%islaw#\'odingly$$kner#%uhaha#%wbeat("en$$nian',
+    '$!h#!m$$hill##rgh#&sh-off$*sels-based#(talities"(zezinski!#sia!"ub#\'ble-gum&#gum"%caram#)caneering#&hlyvie',
+    '$$skin"$dhoo#%worth"$ffed"&g-eyed##ler"$hler"!i"&lganin##ked#\'ldozing$#ing"%mpkin"%nbury#$ging',
+    '$!s#!g#$kitt#%n-out$$ings$$sall"$smen#$tier$!y"#tis#(ton-down"$wayz"%zzell!$wlch!(y_and_by',
+    '"$ford"&graves"#ker"$sshe!#zns .c&oacute;rdoba!$-130!#.z.!$1300!"a."&ble-tv%#car##orn$!t")cophonous',
+    '$&verous##ell$#net#$ieux##mus"(ereinion$+narfonshire$*uloplasmin"#hal##ors"$icos"%lcutt#%dbeck#(endrical#(f-length',
+    '#%lable%$nder$#box$$ejas$"il$$osum%#way##mac#$oric&&e-free#$shot##vet"$mara##ilo#%peanu',
+    '$(da-based$\'licular%$side#$dide$$lish$&yfloss#$inum##ker#&navino#)onisation&&zation#&ticles%\'levered$&onment$$well',
+    '"%pably$(citances#"ed$$well#+ital-labour%\'ularies($ting#)riciously#"ut")r-parking#(amelised$"ts#$bine$&onated%"xy',
+    '##den$)iganshire%+otocography$!y##eca$%d-for$%erism(!t$\'fulness$\'ssingly##ies#,marthenshire$&elites$#ona#%naval',
+    '#%swell#\'thusian#%vajal$"es$#ill"&sabona#$h-in$%point##per#"sa$$ells$#ino#\'trating#&uistry"+t-and-mouse',
+    '#)chphrases#\'egorial#%woman"\'uldhame#)se-effect%6_c&eacute;l&egrave;bre#)tiousness"\'vaillon$#lli%%ryman"$wing"%zalet!"c\'""ff"!l',
+    '!(eaucescu""es"(lebrants$%stion#%ls/mm"&nsures#&tering&$line$\'repoint"%olred"$phei&!d#!t"$rcle#(emonials',
+    '#&tifies#%ulean"%sspit%#ool(!s"#tte#"us!"fd""ln!)gmp-gated!$h\'in""ab#&etodon#,in-guilloche&\'smoking',
+    '#$kras#$lais$$font$#low#!m$%bered\'%maids$$pers#$ncer%#ing$!d%%igarh$*ging-rooms$$tler#+pel-le-dale',
+    '#%rente$(g&eacute%#ees$*lottenburg$\'pentier$%twell#\'stening#%trier#%umont##van"!d"(eapening#%chnia#(ek-bones$\'seboard',
+    '#/mical-sensitive$&otaxis#$ngdu##rie$%nayev$!t#%sters#$wton"\'ickpeas#$dley#*ld-minders%#ers$$eans$#lim#*nese-style',
+    '$#ton#&vvying"*lorambucil"#ocs#&irboys#,lecystoscopy#&mskyan#%ppers##rea$&opleth#&udhury$#ghs$$illy"%rimes$"sm',
+    '#)onologies"$ukka#+rch-related$!t#%tneys!%icada#%ourel#!r"(enfuegos"!m#!a"#nch%#ona#+ematography"#rce',
+    '"(ty-based%(dwellers"#yms!)lairville#&pboard#$rets$*ifications#,ss-conscious%!e%$ique"*ean-living%$ness%#ses$+rly-defined$#ves',
+    '$!f#(mentinum#&rkship")ientelism#&maxing#%nches#\'pboards"$oaca$$king#\'bbering#!p#)se-packed$\'tridium#)thworkers#\'udiness',
+    '%%rleaf"!r"\'ub-mate##mpy!#md.#!r"!g""sn!(o-chairs#)incidence#&owners#*processors&%ducer#)transport"\'achload',
+    '#!d#\'l-black$$face$&mining#&rsened&"st#\'t-tails$&hanger#&xingly"$bley""ch#&kerels$(fighting"$ddle#,etermination',
+    '#%icils$!e$%fying"\'factors#)fin-maker"&gnitio\'2ve&ndash;behaviour"$hens"%imbra#$n-op"%lberg$#urn#\'chicine$%lough#%d-war',
+    '$%herne#$gate#(lagenase%%rless$)ectivized$$ider%&gative%"ng\'!e$&ocates%"id#\'ombians$&nizers$%rados$%strum',
+    '&$ants##son"#mas#\'batting$"es#\'forters#+mensurately%(rcialise$*issionaire$\'unality\'&utaire#.partmentalised.#zed+"ed$&lainer',
+    '$\'ressive$!s$#tes$\'ulsions"#nal#&cavity$(entrator%\'rt-hall$(reteness#\'descend*"ed$%iment$"on#\'ferment%%ssors',
+    '%&guring%(scations$$ocal%&rmable#"ga$#don$$reve#)jonctures$$urer#%nacht$#ive#"on#,sciousnesses$3ervative-controlled$)iderately',
+    '$*umer-price#%tango$"eh%.xt-independent\'*ualisation$*inent-wide$)ortionist\'"us$)ractility)%onary&&riwise%$eras%%itely%*ollability#.versationalist',
+    '$(ocations%&lvulus"&olants$$idge#&massie#!n#*peratively"\'polymer##pes$#ing#&thorne#(yholders"#ram#\'diality#"ea',
+    '#%iolis$"zo##ley#(nerhouse#$olla$!t#"pn#!r$%alled$"ea$"is$\'uptible(#ons#"sa#%tisol',
+    '&!a##una%"na##van"#s-1#&mogony%\'logists%*politanism##set$#ins#)t/benefit$#all$$lier"&tingas##man',
+    '$%enham"&uchman#*ncil-house$,ter-attacked\'\'example\'$foil\'*insurgency)*telligence\'(measures\'$play##per$#ler#%rcier$,t-martialled#!s',
+    '")venanting"&wlings$!s"%yotes"!z!#p/m!(rackbene%$line&!y#\'igleith##nog$%swick")ecquillon#"da$&itably',
+    '#\'mations&$oria##sci$%pigny$"ta#&wkerne"#ibb#(ckhowell##pes#\'sis-hit$#per$%tiano"$oaks#$esus#,ss-addictive',
+    '&%class&(equation&-fertilization&)licensing&-shareholdings&$town%&bowmen#$wden$$foot$#ood"&uciate#%zados"*ystallises!#ses!\'uisines',
+    '#!a"!l#\'lbridge#%pably#(s-de-sac#&turali)"st##yer"\'neiform"(p-shaped$$ties"$rrer#&sorily&!s#\'taining',
+    '%"ss"%shing#!s#(tomising#%worth"&t-away$$back#&hberts)"on#\'tlefish!"wt!!x!\'ycleway$&ically$$ones',
+    '"%gnets"&newulf"(tosine-c%"ol!,zechoslovaks .d&eacute;fense))gorgement)+veloppement!\'\'ancona##rby"(compress"$este"\'honneur"(oliveira!%.f.c.',
+    '!!8!#aks"$llta#%vaine"$mory"\'ncehall#$dies$!o#%forth#*gerousness#!i$"os#$quah#!y"(rbyshire',
+    '#\'jeeling#%nford##ras#"ty#\'ulhadis""sa"\'tafiles$&stream"!w#$lish"(y-by-day$%dream#"es#$work"%zibao',
+    '"!p!\'ead-pan%&weight##nna$#ses#&thless"%bater#$race$#ief#$uted"&ceiver$*ntralising\'"ed##ile$&mation',
+    '#$kard$%house#$odes$*mpensation$-nstructionist%$trol#&reeing#\'station"$eley#"my#&p-down#&rhurst""f.##ace$#med',
+    '$$rens#+ibrillation#(lections#(oliation#\'rosting"%leuze#\'imiting$&neates$\'riously$"us#$rina#$taic$#oid"&magogy#(obilised',
+    '$+graphically$&ralise#%urrer#(ystified"/nationalization#)knetzeyan#\'otation*"al#)sitometry##vir##yer"*p&ocirc;ts#4endence/independence#\'lorably#)o-provera',
+    '$%situm"$rail#)egulatory$#ham##mal#%ogate"+scriptively#(ignworks$#ree#*tructively#(ultorily")tectorist+!s"\'xterous!"fr',
+    '!\'harjees"$uoda!\'iabolic#\'grammed#*lectically\'%ology#$pers$)hragmatic#%tomic$%ribes"!c""dn#"st"(ebenkorn##men',
+    '$%usive"(gestives#&iboard$(tisation""ke"#lke"\'morphic"#od.#!s"%ppers"*rect-grant#&tiness"*sambiguate$(ssembled#(cretions',
+    '#(embedded#+gruntlement#\'inherit%&terred#(juncture#\'patcher$)ositional#*similarity#\'tamycin$%iller$$rain#&united$&tility"!t#$cher',
+    '"#vas#)e-bombing$(rticular#$iner%#ing&$ties##ots!%m2.42%!8$"86!&naasei!#oak"&berman#"ie"$cket',
+    '#$ging#%house#&matics#$wood""ha"\'lgarrog##ing"%mical"$nard$!t#&izetti##nie")or-handle"/ppelg&auml;nger"!r',
+    '#%nford"&sshell#(toievsky"+uble-figure(&ronted##men"\'ve-grey"\'welling#&n-town$%field$&lights$%pours!$phil!$rabs#%chmas',
+    '#$gnet#&incock#(matising#%oicht#&skovic#$tted#,ughtproofing#%ycott"*eadnoughts#%yfuss"\'ied-out##llo#"na#$vin\'"!o',
+    '#$pout#-ught-stricken##ver"$s/nx"\'ugstore#%mcree$&sticks"*y-cleaning#"ad#$land##men#)opithecus#$suit!"tc!-ual-processor',
+    '##rte"+b&ccaron;ek#&rovlag"$cats#"es#\'kboards"$ddon$!y"&isburg"&lbecco#$nain"*n-coloured#$away#+bartonshire#\'donnell',
+    '##kin$#ley##mow#&nachie$#ell$$ocks")plicitous"*r&eacute;e##kan$\'heimian"!w!&welled"$yfor!"x2!!y',
+    '"%kstra"%namos"(sgraphia#\'plastic#$uria "e\'!\'.p.s.ps!#2/3"#f-1!)ar-marked#&disley#$lobe#)th-moving##wig"&stgate',
+    '"*vesdropped!&bbrell#!s"!u!,ccentrically#&lesial")hinodorus"*o-friendly#(nomizing##soc"!p"%stacy"(uadorean!&ddying$%stone',
+    '#%nwort"&ingley#(torially"&wardes#!y!"eh!\'fferent#%luvia!&gidius#!l"*o-identity""ta#"on!#hos!%iders',
+    '%"hs!(l-kefevi"%ancyl"(derberry"!e#"an#!c$%tives%$rify&,o-mechanical\'&cution\'-encephalogram\'#lux\'*mechanical#-ven-year-olds',
+    '""ia#$ezer"$lice#"on#!s$%worth#%yrion"\'tharion"$vers"%ysian!(manation"*bellishing"&echeta#\'ndation##rse',
+    '##lie"(manuelli"\'olument"&placed#$orio#)ty-headed!)ncopresis$*uragements"*d-products#!a#(ocytosis$\'metrium$(scopical)"st$&thermy',
+    '"%fants#&orcers")gelbrecht"\'nerdale"$opla"%signs#$nare"#tel$%ndres#,f&uuml;hrung#)omologist,!s#&rained$!e%&nching',
+    '(#ors#&nciate(#ing!"on!%phron"&iblast#$cure$%ycles#+demiologist.!s#&phytes!$rbb2"+gonomically("st#!s',
+    '"!l#!e"(mengilde"\'ogenous"#s-1"&ythema!#sca#(hatology##row#$udos$&tcheon""se"#tes$#vez##rin',
+    '"%heric&#dge%!s"#ive"$tore",ymologically!#ucs"%doxus"+g&egrave;ne"%phony",ro-elections%\'sceptic$\'centric$)pean-wide!*vacuations',
+    '"$ened#$rage$)lastingly"&icting#2dence-transcendent##son#"ta")ocatively!$well!)x-british#(colonial%(mmunists#&member$\'ilitary#(patriots',
+    '"\'celling#&luders#)rescences%%tions")halations"\'minster"-othermicities"\'pedited\'#ing#\'licated$%oiter#\'ort-led\'(oriented&$able$(stulated',
+    '"\'tempore$&nsible\'(fication#&orting#,ra-embryonic&%legal%(ditables%(systoles%(vaganzas"%udate!#yas"$eful#%glass#%sores"#ton',
+    '!#(x)!!+!#.r.!"40!\'abriano"(ctsheets"#ddy#"ge"&ecalis"&irport#$ther%$fuls"&kenham"$lati#%iraki',
+    '\'%sized"(n-shaped#&ciable%#ers%%fully#%fares#%light#$tail%&sizing"*r-carrying#$amir#$dine#\'fetched#\'quarson#&rakhan',
+    '""sh#)t-talking""th#&iguing"-ult-tolerance#%stian#!x"%velas"#zio!"bl!)earsomely"\'edbacks#&l-good$#in\'&#gly',
+    '"!f"(igenbaum"\'ldstein#"is##lah$-ow-countrymen\'\'feeling\'*travellers$$side#"se$"ic$$tead#$tons"%moral"(nced-off',
+    '"&rndown$$hill$!y#\'rabosco$,i&egrave;res$$omet#$teth$\'ilizing""st$!a!"gf!$iana#$scos#"ts"$bre*',
+    '"$dler"!e"#g.4#*gis-hewett#*ure-ground"(libuster$#ppa#&led-in%#ted##mic#+ter-feeders"+nchingfield#&e-tune)!d#)ger-nails',
+    '#!i$%nvest$(te-state#&laggan#"ta#$ubar"#onn"%rdaus#%eater$&bombed$%guard$#lit#*m-specific$"us#(st-timer',
+    '#&h-only$$bone$)ing-boats$$tank"\'t-again",ve-month-old%#way%&yearly"$xers!*lagellants#$nged$!n%&elette#&schner$\'hlights',
+    '$%tener%#ies&"sh$"us#!v$#ian"+eet/norstar#,sh-and-blood&(coloured%"ly#"tt#$xion$"or""ic#\'ntstone',
+    '"%oater#)cculation\'"us#\'orspace#$rals$!e%&ntines$&idians#$ssie##tta##uts#*wer-filled"&u-like#%rried#%ttery',
+    '#%paper!#mcg!"nm!$oamy""ca"%inmen"&liated#$lett$&ow-ups"&otwall&"ys"%ppish"*rce-landed#\'eclosed$$gate',
+    '\'$ness$#leg$$noon$&shadow#\'malisms#\'seeable$#ook##tes$%ran90$#una$%y-odd%#ish#-ward-thinking"#ssa")ucauldian',
+    '#&r-door"%wlers!"pi!,ran&ccedil;a$%caise%)o-british&#ise(!m&"me$"kl#\'xillian#"ys"!e#%aking$"me',
+    '$#ric#)e-ranging$$fone$\'lancers)!s%#ink$(ze-frame\'$thaw#"ge#$itag#\'nziedly"&ibourg#)ctionless#&gidity#$mley',
+    '#&licked#$thed##ude""s3"&ugally"$y-up!&uddled"%entes"+ll-featured&&ledged%%price%&timers$&erenes#&somely"(n-filled',
+    '#$nies$$yman"-rby/reporting#$niss#%thers"&silier#$sily%$ness"$tura"!w \'g&ndash!$\'bai!\'-string!#.b.""s.',
+    '""18!"60!%abbro#%ellah#%orone"&ltieri#%vanic\'"ze""ma#$bits"%ndell##esh#(gsterism"&rgling#%ishly',
+    '$\'imperos%%soned$"os#%sdale##vie"(s-filled#%coyne##kin#"sy#0troenterologists"!t"%udily#,mont-british#"zy"#ver',
+    '!*ec-marconi"$isha"(latinous#$dart#&ignite#$lner"%minis#%stone"1neral&iacute;simo\'&issimo(#zes%"is$%tical)-ly-engineered$(va-based',
+    '#$tium"\'oghegan$\'raphies"*rashchenko#%hardt#*man-soviet$$inal",t-rich-quick!"ff!%gf-ii!$hali#!r$\'rgoyles"(ost-like%\'busters',
+    '##eau#$lets#$sons")ft-giving""ld##gul##len$#iam#(t-framed"\'mmickry"(ngivitis#!o""rd#$ling"%udice',
+    '"\'venness"%zzard!%laser$&sworks#%ziers"$cabs"\'eanings%!n#$narm$%dower$%livet%#ola"!f"\'issando#\'tterati',
+    '$#ule#"s.$$sies##ucs"1ucose-6-phosphate")yndyfrdwy!#mts!$nash"&eisses"#oll!(oal-less$\'scorers"*bbledygook"\'d-awful$(forsaken',
+    '"$ggle#"ol"&jkovic")ld-mining$&enacre$&ilocks$\'schmidt#"em#(f-course#"gi##kar"%mbert"%od\'un$(-hearted%(tempered',
+    '#$lden""ra#$dale#"es#$fang#$thie"&slings"#uda##ger#$raud"#ver%)nment-run#!t$!."$wned',
+    '#+ecopithecus#%ffito#&gareth#*m-negative$1m-rudman-hollings%%arian%!e#(ndiflora$#nie$$sden$#tee$\'ulocyte\'\'matosis#&peseed$$hing',
+    '#)tifyingly#)ve-digger%%llier$#ier%&ty-fed""ea$3t-great-grandfather#+ek-speaking$&nhalgh$#ves#$mlin#%nside#&shorns#%tchen$#sch',
+    '$%stoke"&idlock##eco##ggs#&moires$%sdale#$ngos#$ping"&oggily#$lier#%oving#)und-state&#nut)!s&%speed',
+    '#&wn_ups"$uber#$dged#\'mblings!%staad!(uangming%$zhou#\'rnaccia"$erin$$lain""ha")ide-books%$wire#&ldsoft$%tless',
+    '"%nship$&linger#%wales"$ruji"$shes".ti&eacute;rrez#\'teridge"$vnor"%yland"$zzle!%wenda!+ymnaestrada%#sts#!s"$proc',
+    '!*-thymidine!$.t.s!"/b!!7!*aagen-dazs"%bgood"%chani#!i"$ddad$"en#"en#%field"(emolysis")giography"(ilstones',
+    '"&lberds#$cion#$eiwa#+f-a-million%)completed%%point%&smoked&(ubmerged#(iborange$!l#%loran#)ofantrine#!s"%mbury#!m',
+    '$#ing#%ptons#&rouche#\'strings"#nan#\'d-built%\'me-down%(operated%\'printed%&reared$$bell$$edly$$hold$$pump$\'shaking',
+    '%%tands#"ey#&ger-on#%kamer##nay$!e%!y"!o"$rari#&bottle#&d-left%#man%%wired$$iman#$icot',
+    '#$pist$\'o/chico$$sden#"ri%$sons#%tnoll$%ridge$#sop$#wig#$veys"\'s-beens#$idic$"na#$kell#$sall',
+    '""ta#&chards%#ery#"er#$less""us#&xwells"$vent"(wksworth#$trey"%ycock##zen"$zels!"bs#!s',
+    '!$dmac""t.!&eadage$,er-format-is$%first$$sets$$wind#%lings$)th-giving&#ful#$r-it$&tiness%%watch#+t-resistant##v\'n',
+    '"$bert"\'cataeus"!d#"da"%e-haw"%gemon""id$%sieck#"st"#lla%!s$#ige$!s"%ndaye$"re',
+    '#"ly##nes##rik"#p-2"(rbalists#$ders$$wick#\'etofore##ing#!n$%andez#"ol#"ri#$shey"(ssenberg',
+    '#%field"!u"#wer#$ison!(i-jacked""an"#bbs"#ero%\'glyphic%%nymus"\'gh-born%&fliers%%gloss%&octane%&priced',
+    '$)er-income\'\'pitched%\'st-paid$*ly-skilled\'\'trained"(jackings"&lditch#&l-fort$%billy"$nkes"$pped%!r$%olyte#$ster\'!s',
+    '$&ndelle"#s15#+topathology"%t-man#\'ch-hike*!r+!s%"en")v-related!!k!%lasek!"mc""os!#obo#!s',
+    '",ddle/swindon"%elzer#%veler"%fburg#"fs"%ggett"!i"(lborough#%combe#"ey##ier&*-than-thou#%ocene##ter"\'me-base',
+    '$#boy#&icides#\'ogenate$#log\'#ues$$nyms$%phony"%niara#"ky")okability#$ters"&pewell#!i"&rovitz#\'seshoes',
+    '#+pital-based#+tage-taking"(t-headed$(tempered$$wire#$foot##ham#$ness"-ur-and-a-half$$cade#)se-buyers%#ful%%group%%proud%&sitter',
+    '!#rs.!$siao!%tfiia#!s!&uerter"&ismans",man-computer%"ae#%orist""nd$#ens#$tin\'"-rst/reporting""ss!(ybridise',
+    '"&drants$$ogel\'(n-bonded\'(ological+!y&&rapher%%lysed%"xy\'\'apatite"$mnal"*per-medium%)calcaemia%)glycaemic%)secretion#\'nagogic',
+    ' #i-a!#.m."$r.a.!"9x!%ambic""si"(trogenic!%badan"#mer"%stock!#cbm"%e-axe$#box$\'covered"%iness',
+    '"!n"*onographic""p4!)deal-type#)ntifiably"$lers"(olatrous#%meneo"$riss"!u!"fi!(gglesden"%nacio#$ites"\'uanodon',
+    '!"l2"(eorectal"$iffe"&keston"&l-luck$\'matched$%timed#+inois-based#$sley#(uminator\'"ed$"s.#&yrians!$mago#"ms',
+    '"(balanced#%edded#%ibing"%hotep"(minently$&scible#\'obilize$&derate#)unoassays&-cytochemistry&+fluorescent&,histological&,precipitated&\'sorbent$#red',
+    '"\'pacting$&lpable#(edimenta$)rmissible%(turbably#+lausibility)"ly$%osion#(ortuning$$stor(!s$)verishing#+racticality$(ovidence\'&satory',
+    '#(hospital"._loco_parentis"*advertence"+candescence$(pacitate+#ing$(utiously#)isiveness#*ompetently&(ressible$)ngruities%&stancy%+trovertibly$\'rporeal#(ulcation',
+    '$#nts#%iaman$*visibility#\'raugnir#(uctivism&#ors$)strialise+"ze"%eptly#(ssential#\'xpertly"(fallibly#(iltrates$&nitary#%lates',
+    '$(rmations#\'raction$\'equency#%using")gatestone#&elheim$%rsoll#"le"\'heritor")jury-time"&klings"$most"\'nisfree#-ocent-looking"-quisitiveness',
+    '#.tall/deinstall%(ntiation$,itutionalize$*rumentally#&ulates$+rrectionary#!y"&taglio#%egrix$(lligenty$/r-parliamentary&&racial&*university\'$rban%&atomic',
+    '&*rystalline&"ut%*dependency%%flora%&lacing\'&nguage%-mediate-level-%range&$ixed%*nalisation%+penetrating&%osing%\'textual%%view.#%ikhab',
+    '$!s#$ones%#ing#+ra-industry&\'oceanic%(granular%(muscular$$onic%%verts")validates$&riants#%eigle(!d#\'igorate#(ocations',
+    '"&rwerth!"pf"%x/spx!\'rangate##qui"\'ishness")onmasters"*relevantly#&uption!\'shihara##tar""ms"\'olators#(morphism#%therm',
+    '"$tria##van!"ti!&vashko"%rigar!#wan!*xmaritians!#yad"#ing!(zquierda"&vestia )j&ouml;rg!!\'!$ades"#ffe',
+    '"%ilers"\'lalabad"%nacek#%equin$!s"%plish"$ques"&rdines#%musch##rad"!s"#toi"%wless"%ywick!"cp',
+    '!\'eanneau&#tte"$beau"(lly-like"$njin"%rkins"#sts!(harkhand!$ibed"(ngoistic"!u!"lp!*ob-seekers"%casta""di',
+    '""ky"&ngleur#!s#"ty"%rdans"$slin##pin#%selin##zef"%ubert#$glet#$nieh"\'viality!#peg!#ube',
+    '"\'goslavs"&ke-box$%boxes"-mi&egrave;ges#"na"$nejo"-risprudential"*sticialist$"us"#tta"%venal"(xtaposes *k&auml;the")uuml;nste!$-sb3',
+    '!$abir""el"$ftan"\'lamazoo#%endar#\'goorlie#)licharran%%nkova##man"$mala##bli"\'nkkunen"#put"#ran#$bala',
+    '#%sikas!"be!&efalov""ke"\'lmscott#%vedon"#nco##nan$$edys"%ratin#%ensky#&fuffle##man##rie"(tterings',
+    '!!f"!t!"g.!%hafji#!i"$mara"*orramshahr!"ia"\'ckbacks"&dwelly"$eron"$gali"#ley#$gour##ham',
+    '$&yleagh#$nsey#&obases$$tons#$syth"(ndnesses##ema#(g-fisher#%naird#%sfolk#$tsch"!r#%kyard#$stie"$tbag',
+    '!%lenow!"m.""no!%naves"&ifeman"$olls#"rr##tts#%w-all!$oala"&hlrabi"%kusai"%marek"(ng-based#%stant',
+    '##una"&skotas"$uroi"$wtow"!x!%raken##ntz""is!#sr1!#uhl"$laks"&mquats"!n#(stmuseum##tar',
+    '"#oni""rz$&linger"$stow"%zbass!#wai"&iksave"!s!$ypov .l&eacute;otard!&\'ecole"%homme#\'umanite"$isle!!+',
+    '!#.b.""g."&j.q.b.!"/r!&abeled")ce-making%#ups$&ration#(k-lustre$)adaisical#%lotte#$oste"&ddered#!e##les',
+    '"&ggards#!o"%lande"#mbe$$orne#"ia$"ne##ond#$pitt$\'lighter&!t$%ooned"+nc&ocirc;me#(dholders$&rovers',
+    '%&urface$#tag#%gport$$side%#ton$#try$+uage-system%\'orously#$olin""on"&pwings"%rches"\'speyres#"so$$wade',
+    '"*test-issue#%hered#(itudinal"#uds#&ghably%$land#&raceae$%eates"#val#&ondyss#"vy"*w-breakers##lor!#bos!%eadon',
+    '$&leting#)pfrogging#)ther-clad\'%bound##ved%$ning"&cercle#\'onfield#!s##ter"\'dbetter#$erer"#ery"&feuvre#)t-leaning',
+    '%"sh&!m"$g-up#%atees%$ions#$ibly$\'onaries#$olas#$rand#\'spinner"*isure-time#$then$%motiv$!z""ks',
+    '"(nd-lease#$nart"%ofric#$nean",ss-developed##tor"&thally#$itia#(terkenny"/vel-of-analysis$$rson#$ison##kas!"gb!"i%',
+    '$!g#$rtes#%thach""b.##els$,ral-national&$tors%!o%(t&eacute#\'idinous"&ebchen$%erson"\'fe-form%$line%*sustaining',
+    '\'#ing#$ters"&gature##eti#\'ht/dark%#ens#$uria"+ke-for-like$$lier"%minal\'#ity"&ndsell#)e-printer#$gard$#ham',
+    '#$nets#$torn"$onan"$psky"(quidiser"(thotrite#&tle\'un&%child\'#ote"!v#,erpool-based%%worts#)ingstonii#"re#!y',
+    '!(landeilo$%gefni$$rwst!#msr!"na!&oafing"#bov"&chgair$!y#$kout""ex"$fted"\'hengrin"!i#$seau',
+    '"$ncar#$dons#+g-abandoned%$ball%%chain\'\'erished%(fingered%$line%\'service$#den$&er-run%*st-running$&fellow$$hope&#rns',
+    '$"ue"\'osemore""pe"(remaster"$ssie""tt"$uche#&ghgall%\'tonians#,ren&ccedil;o"!v#&eridge"(w-heeled$&voiced#$brow',
+    '#&thorpe"!y##ola!"p*""ga"!i"!k!$sa-1"!x!$u6.2"#ard"(bricious"#cre%$tius"%ddism',
+    '#"ic"!i""ka""la""mb"&ndgren#%gfuls#"ia"$rago#$idly##pak"\'sitania#$ting"#tes##ton',
+    '!&ydeard"#in\'"#nde##ton"$ster"\'ttleton!!z /m&eacute;decins)%lange",ouml;llemann!%\'dear"$lord!"-1"$type"#way',
+    '$"ex!"42!!9!\'acairth#&brayne#\'culloch##fie#$gill#%hetes#$ians#&kerras#%leods#\'minimum#\'naghten$$eice',
+    '#,roeconomists%)molecular#!y"\'ddalena$$ocks#"ox#&rigali##sen"\'gaziner#*isterially#$owan#"us"&haddie$#mat"\'ilshots',
+    '*%class$)s-voltage%$tays"\'jesties#%orcan"#kaa$"ti#\'e-shift$"th$&weight#"in"+ladjustment##com#)functions#(ingering',
+    '%"us%!y#&tsters#3vern/worcestershire"#mas"\'n-sized#)agerially\'$ship#\'churian#%golds#&handle$"om#%nikin%&ngtree%"sh',
+    '$#ton#$vell"+rble-topped%#ing$#urg#%chais%$mont#"id$#nus$&onette#!j#\'kedness$%owitz#$nham#$ples',
+    '#$sham#$tlew$!s#%yport$"se"$sada$#ryk#/culine/feminine##her#\'s-media$!a%%cring#&terson\'%troke&(workshop',
+    '"(t&eacute#\'chfacts#"eo$(rialises#%inees#&riliny##tes#$urin&(ty-depth$#tes"#uer#"na#$riac%$cien#"ss',
+    '"#wby"\'xentius##ted"&y/june#%belle##son!)ccandless$\'rthyism##oll$"ol$(rquodale#!s#%ullin&$ouch$&tcheon',
+    '"\'fadyean"&gahern#%ibbon$"ff$(llicuddy\'#gan"$harg"\'inerney"\'kitrick"&naught("on#"ee"#vey!$dina!*eadowbrook',
+    '#%gaidh#%ltime##rns#%tless$"us"$ckel"%dawar#)itatively$\'um-size##jay&!s#$ulla"%ggitt"%ister"%lange',
+    '#%chett#$drum#&iaceae#%lanby$#ion##och#&twater"&nachem$"rd#*ingococcal#%tiply##zel$\'ieshill"+rchandisers$$uric',
+    '#&ingues%!o$$ting#&seburg"%shing##pot#%quida#"se%!l"(tabolise$(morphose$*physically#*eorologist#+hyltransfer#\'romedia',
+    '"!x"%yrick!"fm!#iah"#cah##ro-&)computers%)biologist.!s%+circulation&)ontroller%\'gravity%\'habitat%&lights%(organism',
+    '%&system%&waving"&d-18th%#994$*thirteenth$%water%%icket#&azolam#*dle-horned#%geley%$tman&!s#\'landers#%point#\'western',
+    '"#ele#!s"$glia"#hai$!l"(innehoma",khailichenko"$lada#&ebrook#\'k-white#\'lennial$#ham$%iners(!y&$gton',
+    '\'&airess\'#ths$&wright#!o"*nd-bending#$gles#$imax%$iser%!s$.ster-designate(!o#,nesota-based$!s$!y#$orca',
+    '$&terley#"ya"+sallocation$,pprehensions#*cegenation#$hkin$"ra#\'judging##kin#)ogynistic#%spent$!y#*t-shrouded""ta##hra',
+    '$"on"+x-and-match""ze!$kiii!"l/"!c!%mol/h%"kg"!t!"nd""ps!&ochdre"*del-making$\'rnizers#&ulates',
+    '"%ebius#%ketsi#"ri"%ggies"%ineau#"se"$jave"$nads#%ckton#$dial#\'ey-back%"er\'!s#*ochromator$\'graphic',
+    '$&sodium$%tones#%soons##tag$%h-old$$reux"\'onshake#,re/reporting"$peds##sus"&quette"&raines$&lities#%daunt$%echai',
+    '##een#"fa#"in#$ling#&timore$$main"&schino##ely$!y#\'hoeshoe#)s-covered#$tafa$"on"(therless#\'or-cars',
+    '%$fair%$head"%unsey#$rner##ser$$saka"\'vimento$"n\'"#yer!%p/lib""as"!e"!l!"rg""ta',
+    '"!l!"tb!)uch-hyped"&dchute#\'errises(#lik#&guards#%stone"%ffler"\'ggleton"!k"&lsanne#+ti-activity&&colour&.denominational',
+    '&*functional&*individual&%layer&(talented\'\'hreaded&$year%+culturalist0!s%\'purpose%(spectral&%torey%\'vitamin"(nchausen#%ition##roe',
+    '"!r##cia#(derously#"id$!e%#lla#%rells#"ti"(scarinic$(le-bound#\'ic-room%%ality%%ology$$ngly#!o',
+    '#"es#"ty"&zorewa!\'wafrika!&yc+max#\'otoxins",ofibroblasts"#res##ick$(ophyllum"(stically")xomatosis 0n&uuml;rburgring!\'\'est-ce"$pani',
+    '""i.!+a&iuml;vety"#acp"$blab&!s#$okov""cf"#del"$evus"#gas"&isbitt"&nnette")phthalene"&rrates#$whal',
+    '#&urists"&ughtie##man#$plii""va#"es"&ysmith!"cf"#p7b#!r"!s!,ear-infrared")bul&aelig"%cktie#\'romancy',
+    '#&taries"*edle-sharp&!d"#ffe"\'gatived#$ress$"os"&ighing#"le$#sen#\'zvestny")matocysts".o-conservative$(marxists#&plasms',
+    '""rd#*ve-endings%!d$"os"$sbit#"te")tdirector#$view"!u#$bert#%ritic$\'oleptic&(ogically%&pathic#+tralization',
+    '%$mind"%w-age#$bald$%iggin&"in$$urgh#%house#*ly-arrived&\'crowned&*discovered&\'hatched&+independent#$sons$(paperman#.ton-le-willows',
+    '!$gaio"$uema#"gi!"ia##mey""dd$#rie""ge$#lla#\'htspots%$wear"$kola##wax"\'ne-hole\'"ur',
+    '#%fania"!s##sel"&trites$%oblue#)ty-gritty"%yazov!"lm!#o.6"!8"$bile"#ces"&fomela"!i#$some',
+    '%)ggressive%\'merican$!b$\'cardiac%)hristians%+o-operative&&linear&\'mbatant-!s\'(petition&*nventional&\'rporate%\'riminal%)umulative$)directive',
+    '$#ibm%\'nfected&(terlaced%$onic$#key$*marketable\'%xists&&tching%\'eanings&#dia$-participating%)erforming%(referred&#int%\'unitive',
+    '%\'ecourse&(inforced&(sistance&(turnable%&outine$+specialists%\'urgical$\'taxable%(urbulent$%ulcer%(nionized%&raemic%"se$)vesicular%%iable',
+    '#)linearity#"na#&profit#(specific#%words"$rber$$rook#%cross#$ling#,m-referenced$$alcy&!s%$ndie$*oglycaemia#+th-easterly',
+    '%$side##web""ts"(uakchott#*veau_riche\'(x_riches"%votna!#prc!"su!#tsb"!v!,uclear-armed(%power%$olin&$some',
+    '$!s"&gatory""ke"#man#-ber-dependent""nc")rburgring#&emburg#\'turance"(trasweet"$zzle!"w3!\'ystatin )o\'carroll$#sey',
+    '"%dwyer"&hanlon"%kelly!&akhill""pa#"ec"&tcakes!$beid#%lisks#,rsturmfuhrer")jectivism"&ligate"*scurantism+!t&%ities',
+    '$+rvationally#)treperous%$uent"$uchi!*ccultation$%rence"%eanis"\'hiltree#"oa"&tarine#"et"%ulist!#ddi$!e"%orant',
+    '!)ff-campus$\'loading$&spring%%treet#%enses#&loaded#\'spinner!#gee"$inga"#wen!"hh"!n"#rid!\'il-free#%cloth',
+    '!#las#!v"%duvai")igarchies(!s$,osaccharides#*ve-skinned"&lerton"%omouc"!s##son"\'ympians!%manis"!b"&durman',
+    '"*nipresence""sk!\'n-shore"*ce-for-all"%e-all$%liner$&minute$#nil$$offs$(phase-on$\'seventh"#gar"*omatopoeic"$side"&togeny',
+    '""hs"#mph!&p._cit""ac"&enside$&vision#(ra-house%*tionalized"(timizing#+oelectronic!#ram#,nge-coloured&#men&!y#\'torical',
+    '$#ted""ca"\'daining#\'inaries"%estes"!g#,anochlorines"#lov"&miston#+olu-mounted"!o"%phism"!t#\'hoptera#0iz-pati&ntilde;o',
+    '!%sijek"%monds"$orio"&setian#)ification"\'tankino#\'eopathy$%rlind#$lers#\'racized!)therworld"%ranto"#ton!\'utfalls#\'growing',
+    '#*spokenness$\'tations""zo!\'ver-65s%+consumption%&eating$&bridge$$cook$%dosed$*estimating$&ground$(painting%&ricing&(otective$%reach',
+    '%#ipe$\'shadows%)implifies%\'tocking"&iducts!&wenism%"te"$lish",ner-managers!\'xenhope")idisation "p%!&&amp;w".eacute;rigueux"*lt;0.00001',
+    '!#-38!".7""w.!"/o!"17""85!"22!"30!!9!$abxs"$cab3%!4#"em$"pa#&hytene',
+    '"#ged"#icv##lin#)n-killing%(language#"sh"#kis"*laeography#)eontology#%ichuk#)l-bearers$$anza$&iation#&pation"$mina',
+    '")n-african%!m&&erican#$gaea$&enesis#"na#%tiled"6pier-m&acirc;ch&eacute&2_m&acirc;ch&eacute($ache#"py"#r-4$!5#&akeets$(llelisms',
+    '%$roop##doe%%nable&#ing#"in#$kers%$ston##que#\'t-owner$$akes$+icularistic$\'urition#"va"\'skevich#"se',
+    '"(tchiness#"il#*ronizingly"#uli%!n#$nchy"$vers"$wley#$ning"#xos"$yday#&phones!"dp##-11"!r',
+    '#%tland""cs"&daloes"%elers#!s#!t##wit"%lling"(ncilling##iel#)sion-fund#"ta%$gons$)ium-ready")ppermints',
+    '#(colation#&dition#%fecto$(ormative#*iodontitis$&winkle#)kin-elmer#&onists#$rins$"ot#"s.$&onalty$\'picuous##tly$#urb',
+    '#&sarane&#ies$+imistically".thick-lawrence#,it-bourgeois#$rine$%obras%"ck%(l-driven##ted%%rsson"!u!%h/pco"!2"\'alarope',
+    '#&raonic$!e#!t"+enobarbital%,l-chloroform")ilippians$$lipa%!y"%oebus#%kians#\'ne-call#\'sphatic&*oinositide\'$rous#+tochemistry',
+    '!@i&egrave;ce_de_r&eacute;sistance"&acenza#%zzale"%cabia#\'nickers"&ddling"*ercebridge$&remont")geon-hole##ott#$skin"&laster$!u#%chard#&ferage',
+    '$"er"!m#"ms")n-pointed#"ar#$down#&ehurst#&k-eyed$#ney#%negar#%prick"%pping"$scis")tch-black#\'heavlis',
+    '#"on%!s#&tsburg!!k!*lacatingly#\'smodium$+tic-covered\'%isers#(yer-boss$#in\'$%maker"#ein##ven"%inian"$omer',
+    '#)ughshares#$wman"+um-coloured$$ping#\'s-fours!#mdl!+neumococcal!-oincar&eacute$\'settias#\'sonings"%lanyi$$rtec#!i$+ce-officers$%ticos',
+    '&#que#$lini$$ster#%perro#,ycrystalline$&esters$&krates$+saccharides"&mander#$eroy##gol#!s"%ntiac%!n&!o',
+    '$(rhydyfen")oh-poohed#"na#)r-quality"$pova#&padoms#)ularising&*tion-based"#rgy#\'taferry$\'nahaven$\'raitist$$side"$sers#,ix-compliant',
+    '#&t-1979%&coital\'&nquest%%dated&*issolution%-impressionist%&office%-qualification%%world$&marked&,ster-general%-ultiplication$)ponements"&temkin$$ntly',
+    '#$tsma"#vey"(werplant#$icke!\'pyacrc5!)raetorian#$kash#$mual#$ndtl#%ttled"*e-bookable$)conciliar\'\'ditions\'%tract$&dating',
+    '%&istory$,implantation$&loaded$\'meeting$(prepared$+reformation$(selected$\'trained#\'cipices$(ognition%*nditioning#+destinarian$(icaments#&facing%$tory',
+    '$)editation$%inger#)occupying#)ponderant%(ssessing$)rogrammed#(scribers\'&ptives$%sings$&teigne#*varicating"#igs#$mera%$time#\'ncetown',
+    '#+oritisation#&smatic#"tt#*ze-winners%\'winning"*o-american$)communist&*nservative$$nazi#,crastinating%$eate#,duction-line#0fessional/client\'\'orships$-it-maximising',
+    '$!s#-gnostications$,ramme-makers%(essivism#/letarianization#%phase$\'inquity$%osers&\'itioned%&unding$%ylene#(tectable\'&orship%&inuria%!k',
+    '$)uberances#(visioned$!o"&uritus"#ynn!#sdr"-eudoaneurysms"!o"*ychedelics&!s%\'ologism&$tics!#tah""gi!-ublic-service',
+    '"%ddin\'"$ente"$king"%llets$"in#"py"$mmel"\'ngently#*salmaagiyn"#pal#*il-centred#&peteer&"ry$%yhood"%rlins',
+    '#\'veyance"%ttin\'!"ws!\'yridine "q\'!".t!#acs!"be!"in!!m!/u&eacute;becois"&adrats%%upeds##ich##kes',
+    '#%ntick#(rantined$%rymen$(ter-inch%#ier#)siregular#&trains"&estura"&iberon#$ches$*k-tempered#%ggers#$lter#!m$#per',
+    '$(quennial$#tas%%ianus#"re""li"&otable \'r&amp;t",eacute;gimes!%.e.m.!!/!"25!$5868!"74!!8!-abble-rousing',
+    '#"ta""ch#)k-mounted"%dburn#$dled#)iologists#!s##way""ga$&muffin#!u"%ilcar$,way-building"#ksi")m-raiding',
+    '##ped"%ncher#$dell##ter"\'ppaport##tor")t-catcher#$haus#-ionalizations#)tlesnakes""uf"%vello"(walpindi#&cliffe##don',
+    '"\'ynsford!$b211!"di!,e-allocation$%ppear&$oint#\'crossed#+development#\'educate$(mphasise$%nacts#(invented\'"st#)offending#$sold',
+    '#%union"*activating#,fforestation##lty#\'nalysis#(ppraised#%rview#)ssignment"(bel-held#$uffs$$ilds$%tting",canalisation%!t#$ency',
+    '#\'idivism#&ouping#(uperated)#ive$%sants#&yclers"\'d-green$%light$&roofed$&tailed#%lands#!o$#ndo%!e"!e',
+    '"\'ferable#$ines#&lation$(ectivity#$ugia"%gally#&ionals$\'strants#(ularised&(tionists"\'hearses"\'indeers$#ing$+troductions##ter',
+    '"!l#(aunching#\'earning##ist$#ves")maindered%$snil$&rrying#*iniscently#$ount"$nata%(ionalise$,ult-williams#$dall$&itions',
+    '"%peals%$ters#\'lanning$&icable#)opulation$$sing#)rimanding$)ographics#\'udiates$(tational"\'seeding#)ignalling$$nous##ler#\'onating',
+    '%#tes#(ultative$(m&eacute"&taking#%irees##ook#\'rovirus##tie#%uning"\'utemann"(velstoke$+nue-raising$\'rberant)#tes%(sibility',
+    '#&ocable$*lucionaria&)tionising"#xel!$hona$)e-poulenc!)iboflavin$\'nucleic"\'ccarton#(hardsons$#ens#$kett#"oh"(ffaterre##kin',
+    '##ht-&&hander%&sizing%$ward##ney"%ksdag"\'mington"#nds$!t##ses"&ofinex#&tously"&p-offs"!s#\'sington',
+    '"#zzi!!j!#nib!$o-ro"&adcare$#ies$$ster"\'binsons"#cca##her%!s#*k-climbing$)ing-chair$$ling$#man',
+    '#%erigo$!t"$eder"%lando"#nde"%okery#%mette"%raima"%sanna#$berg#"in##lin#$siya#$tron"#tax',
+    '"$uget$$hley#(nd-faced"&wdyism"$yces$$roft#!d!"pp!"ra!#sno"!s##pcc"!v!%uabon"$bato',
+    '\'\'stamped#$icon$!o##les"#cks#%tions"#dby"#ffs"(ggedness"*ling-class"\'melhart%!i"$n-on#&efangs#!t',
+    '"$thyn#%ledge"!z \'s-plane"&shaped!%.3(1)"!4"!6""g."#p.a"$r.o.""w.!"/z!$1(1)"!8',
+    '!#677!"83!\'a\'adoun"#ber#%raxis"$crae")ddle-bags""fi"\'gacious$!n#!o"%hnoun"&ilboat$$fish##maa',
+    '%$onge"%kkrat"#lan%#der$$riat#\'eswoman#$lied#%tford"%mavia#$buru#%e-sex#%mlung##rin"&ncerre$#tus',
+    '%%opper$#man#$gsad#!o#)s-papiers##usi"%pient$!r""rd"$saki#%pac91""t.##iny$#pur#%sumas',
+    '%$nine#-y&amacr;grahi"$umur#"vy"#vak$"nt#$ours"%xelby#&ifrage"$yles!"ca##ife#%lpels#(risbrick$$lets',
+    '#"wd"1halck-golodkowski$\'rnhorst##ein$#rer#)iehallion$$nkel$$sgal$\'zotypal#*olasticism$%olbag\'#ook&$mate#*warzendorn$\'einfurt',
+    '"&ientia#%mitar##ons"$onul##oby##pus#\'recards##ter$#ton$"us#%urges%!s$#ted"!r#\'apbooks',
+    '$\'tchings$#wls#&eeches#\'imgeour%$shaw"&uffled#"ll%#ing"&ythian!#e11"\'a-borne$$king$\'urchins#"co#%farer',
+    '#$ming$!y#&scapes"#bba#%okeng"#cam#$eded#)ond-level&"ee\'"rs#*torisation"$dges#*imentology#$uces"(ed-heads',
+    '#\'lisberg"$gall#$ovia#$undo"!i#(gneurial#\'smology#"tz"&ladang##des#\'f-abuse&,ctualisation&(ddressed&\'ssembly%*censorship',
+    '%+deprecation%)education%(indexing%)levelling%)motivated%\'neglect%)reference(&lexive\'(velation%)selection#$wood"+mi-derelict%&formal%\'private&%ublic',
+    '#$mens#%yonov"(neschals##fed##hor#&tinels"&raphic#%enata#+ious-minded$"us#$misy#%ology#&vitors"#tae"$umas',
+    '%$fold#$illa"(x-change$$role##tet$"us"#yed!%forza!"gs!&hafted#!p$*e-specific$$land##rer&!s',
+    '$$ples#"tt"\'e-devil#%armen#\'epskins#(habuddin#$kels#$lagh$&lerton%$hole%$suit#$nley#\'pperton#$rard$!e',
+    '$$ratt%&ington"(ibboleth#-lly-shallying#%mmers#$nier$$ning#\'pmaster#$rked$"ty#&thouse$$less#!v"$lomo"$oaib',
+    '#\'ot-outs#(p-window$$lift$\'workers#)rt-haired("ul#*ulder-high#*w-business")rubberies"+ufflebotham#!g##ker#%shing#&tdowns$$tled',
+    '""ca##ken$#les"*destepping"%enese#&veking"#fts"-gnal-to-noise&#box$*ifications#$ouri"$kkim"$lene#&iceous#"ke',
+    '#$lery$#ier#&tstone#\'vaticum$(ersmiths\'$tein&\'y-green"$mbel#&plesse%&iciter"#nar#(gle-cell\'$mode\'$seat($ided',
+    ',"ly$%spiel#&istral$!x#!n#*o-japanese##tra#&uously"\'phoning""ra#!o"&syphus"%t-com#%uates""x-',
+    '$$yard%(ear-olds#$thly!+j&ouml;gren!\'kelwith"#ive"$opje"#ulk##nks!\'lacking##ley#$pton#&teford##ved"+edgehammers',
+    '#$ckly#&gachan#"ms"#osh"!p!#m-b"!1"+all-holding%!s#$rted%%icons""es"$irke$$noff#%thies',
+    '",ooth-skinned"$udgy"&ythson!#n-1"%affle#(resbrook""cf"&elling"*obbishness#&wbound$$drop"&uffing!"o-"%aping"%bhuza',
+    '#!o"&domite"$ffit#$ties$#lab"$lair$)r-powered#$ders$%ierly#+idarity-led$\'psistic$#ton\'!s#"ti"&malian',
+    '"\'ngsters#"ne#\'orities#(s-in-law$#hip"#rta"#uks#*nd-proofed$#ion#&ped-up#$tham"-viet-american\'%style"&yabean!+pace-saving',
+    '%!y#%ngles#(rccenter$$sity##wns#$ying"(eedboats$(nhamland#$ight#!s#%ywood"%icers##got#%llane#&ndrift',
+    '$(sterhood#$ttal$\'zbergen#"vs"&laying#$ices#$odge#)urge-weed"#ong#\'rtingly%$ster#)tlighting"&ray-on%#ers%#way',
+    '$"es#%ocket"$unky#%rling$$ning%!s!"q.##_ft#"ft"&uaddie$#wks#*eaky-clean$$egee#&inches%"ts',
+    '"%ihari!$safa!$tahl#\'lactite$&inists#&mpeded#$nage$*dard-rated%$ings%$lake$\'tonbury#&rfield$#ker$$suit#(temented',
+    '%%rooms$#oil".eak-and-kidney$#ric%#man%!n#\'el-grey%&making$%pened%(lechaser#%initz%+k&uuml;hler%#way#(ncilling$$nett',
+    '&$rian#\'psister#\'riliser$"na#!t#$uart#\'warding$#pid#%yning"*iff-legged#)gmatising#"lk$\'lington"&ockmen%$room',
+    '%#man##oks#\'p-watch$%pered##rah$"ie$(m-tossed$%ybook#"up",raight-faced(+forwardness(&jacket$\'nmillis$%thtay#4eam-of-consciousness',
+    '\'&porter\'$wise$%nsall$$phon$\'ss-free$-tcher-bearers#,ike-breaking$)pped-down#%oheim$&ngyles#%ummed%#pet"\'upidest")ylisation$&olites',
+    '$"ia#!x!(ub-areas$\'clauses$)licensees$%prior$%sales&%mples#&arctic#)directory%&viding#*epithelial#(headings#-ject-specific#)missively',
+    '$$oils$$tage%\'ituents#\'tropics#)urbanites")ccussions#"re"\'edehead"(ffragist"\'garcane""is""la##cus"(mmerslam#&ptuary',
+    '#%thorn"+percritical%$fine%%giant%$hero%)intending%&marine%&script&$port#\'pertime$&licant$\'ressive$\'uration#\'raconal%)segmental',
+    '"#rya"&strans#!y"$ttee#%uring!#v40"(erdlovsk!$wank#$tted"&eeting#\'pt-back"!i#$gged#%ngers#%ssair',
+    '!$ymon#)pathising(#zer&"ry")naspismos#(chronize$&retism#&ectics"&phoned"\'stem/36&&ically!$zabo >t&ecirc;te-&agrave;-t&ecirc;te!"-1"$test',
+    '!%9000s!(aatgarat"$bkay#(le-cloth%\'_d\'hote%"rs#,ouret-keller"%gamet""ha#"er"\'ilboard$$coat"&kamine#&eaways")labecland',
+    '#%isker#$kies#%ybont"%mpico"#nay#$berg##dri#)gentially$$ibly#$kful##nic"&rasova#$ling#\'macadam"\'skforce',
+    '##min#"so#%tings"\'ttooing")utologous",x-deductible$\'raising!%c-99m"!1"!a"!c!&ea-bag\'!s$&making$%party',
+    '#.cher-librarian#%rooms#%sdale$#hop")chnocracy#!k"(essiders"&ixeira"\'lecomms&&ttages$&matics$-phone-tapping$$vise##net"#mpe',
+    '"&n-fold$$inch#&derest$&onitis#$ison#%nants#%pence"%plice"+rephthalate#*minologies#$nary#$tiis"&st-bed$%ators")trahedron',
+    '"8wkesbury/gloucestershire!-h&eacute;oden,#ore"&ackrah#!m#"ng$!h#!u"\'eirself#\'lodonts#*nceforward#\'ologies$%rised#%rborn$(mocouple',
+    '#&rstily$(ty-first#(stledown""on#$rkel$%ndike%"es%$tons#!s")read-like$+e-month-old&%party&\'wheeled%(quarters#(illingly',
+    '"%umper#)nderbolts\'!y#&rlbeck%"oe!#ich##ino#&k-tock"&ddlers"(ebreaker#$polo#\'rgarten"&gerish##nes##ray',
+    '#(e-warner"%ngles"%pster#$toes"&ticaca$&llated#$ters$"le!!k""50!"mi!(oastrack"!c"%ddled""ed',
+    '#$nail"&f-sars#!t$&ingall"!l#&puddle"*m&aacute;s#&morrow#&orrows#"sk"&neless#!k"-ohoolhoolzote##ley"-p-of-the-line',
+    '#,ographically#%pings$#les"$rben#"it#!r$#ens$$idge#!s#\'tfeasor"$ubon#)gh-minded%"ly#&ssaint"\'varisch',
+    '#"ne$#ies"!x#%aemia#*icological!"pc!\'radable#%herne##in\'#&mlines#*nsboundary%)formative%&genics%\'itivity%\'jugular',
+    '%\'vestism$&tridge#&pezius$!p#%shing#!u"%eacly$#dle##bor#$ffry#%lawny#&nchard#$torn"$iage$$lled',
+    '&&people$\'ulation#&cycles#"mm%#ers#(ncomalee$"ga#%ple-a#%remes#(seliotis#&tiated$#sis#&vially"\'obriand#)pospheric',
+    '#$wels%!r"\'uanting##ces#!g#\'mped-up#$ncal#(th-value"%y-out$\'scoring#$ptic!&sarina"!k"!l"&unamis',
+    '"&ebrook"#lsa"%mulus"#nny"*rbocharger#$kana#%n-ups$%about##ton"%thill!&wanged"%eedle\'#dee#-nty-fourthers\'%ninth',
+    '"(in-track#$ster#&tchers"\'o-child$%digit$&legged$#nil$%sided%#tar&"ep$$term%%o-one$\'wheeled!$yger"$lers',
+    '"(pe-faces#(himurium &u.c.l.!#aru!(eberroth""zd!&fology!#gix"#low!$h-oh"!f!%k-ors!%lrike"$s/jn"#tar',
+    '%#fax!&mbrian$!o"!p"!w!(namended$#uno%#sed#\'nalysed#)ppetizing#\'rguably"+circumcised#&leared%&nching#%ombed',
+    '$)ncernedly%\'jugated%-stitutionally$%unted"\'der-16s\'!7&+achievement&(employed&)resourced&1secretary-general&(utilised%#age%&bidder%&frames%(painting',
+    '&*epresented%&signed&\'taffing%&values%%wrote$\'scribed#)ischarged#&ulated")electable#*motionally#/nthusiastically#(xploited"*frequented$&uitful#+udgeability',
+    '"(happiest##ook"$iate#$fies##kix#)tarianism)!s$#ree$&s/week"*liquidated#%oving"\'managed$%sking#\'easured#&usical',
+    '")perceived#&icking#(olitical$\'pulated#\'rompted"%quiet"&reason$(conciled$(flective$)lentingly"(scripted#*erviceable#\'hackled%%kable#(oundness',
+    '#*upportable)#ive#.ympathetically"\'tangled#$ying"*ventilated"*waveringly#"ed#%onted!"p-#%grade"(anishads"#pal"(roarious"%swept',
+    '"$wood!&rgings"\'ologist""su$!s"$vill!.s&dollar;1,800+)0,000,000,!0*&20,000*%3,000"&-owned"%er-id!)tah-based"%ensil',
+    '!!4!&acuums"$dose"$izey"#kuf"*lenciennes$"ts##ise#$lejo"(nsittart"*porisation"$radi#"ro"%ssoir"\'uxhalls',
+    '#!s!"cs!(elazquez""na#"da$%ettas##ial#(tilatory$#nor$\'ralmost%(iloquism$%urers"%rbena$%osity#"ma',
+    '#(ne-smith##tus#"zy"#sey"$tter!!f!#hpb"#s-c!"i."\'brators"(ce-prime#!i#&timize"(deophone%&tronic',
+    '#&nerons"*king-based"&leness#\'lalobos$&eneuve"(ncentius#\'dicates(#ing#&e-lott$$gars##yls"(olinists"!r#%tuosi(!c',
+    '"(sionware"$tale%"is#)icultural#)uperation"\'va_voce#"es"%zcaya!\'ocative"$dkas")ice-overs#"la""lo"*ronov-vaux!"p2',
+    '"!n!\'uillard"&lgarly""ng "w8!#ack$!o"&dhurst#$sley"\'gonload#%tails"\'if-like#%smann$&t-deep#)t-and-see',
+    '##ves""le#\'kabouts$"en$*ing-sticks#&l-hung%)paintings$%achia$"en$\'papered""no#%sford#&ta-wee")r-ravaged#$bled',
+    '$$room#)ehousemen#%farin#\'naweera#"ps#\'ranting#%zycha"(sh-house%#out$#day#!t"(tchwords#\'er-lily&%power%$hole',
+    '&\'ooville%%worth#\'lington#$teau"\'vefront$"ll$"rs"$ylay#$mark!)eak-kneed#"ns#&rmouth#(therhead\'#ley"&bsters',
+    '"+ightlifters&"on".ll-disciplined%\'fitting%*integrated%&marked%)practised\'\'otected%(received&%otted%\'thumbed%*understood$"ie"%nches#"dt',
+    '"$rder#%nicke#%theim"*st-country$%cliff$#ray!%hacky#&lebone#$tley"#eee$*ler-dealer#\'tstones#!w#\'y-faced"&ickham',
+    '#(msically##nny#&tcroft$)e-skinned%!n&#ing$\'minster$#ten#%zzkid"%opper#\'rehouse!(idemouth$!s"$esel"$fely',
+    '#$nall"\'lbraham##dig#\'helmina#"la%#ert%"ns$&ersley%!s$(iamsburg##ts."%n.ini##ces#(d-driven%%swept',
+    '$$lass#(e-making$%maker)!s##ing#\'nington#!o#%trobe"\'re-mesh"&shbone#)senschaft"(thstands#/ney/oxfordshire!$oden"$lfed',
+    '##man"$mack$%nizer"\'odcraft$$hill$$mill##ler"!p"(rd-paths$$play%(rocessor$%smith#-k-in-progress%#shy$#net',
+    '#+st-affected"&uldham%#n\'t!$rack#%thful")ist-watch#)tten-down%"le"%oxham!&ulstan!#wii!$ydyr"#ton #x-y!#.25',
+    '!$11r5!$base!)celerated!"e8"+rophthalmia"!u!"ho!%press"!s!"tc!#xix""vi$!i!%ylene $yair',
+    '"$mato#)oussoukro"&rdages"#sin##sin#$ushi!%barra!\'earsley!"ir!%ngwie!(odelling"#kes"%landa")ngchaiyut"&rkgate',
+    '"#uds!"sp!&ttrium!$uppy"\'rtsever +z&uuml;rich!$adok%$ites"#hid$!r%!a"#kir"$ntac"%pping""wn',
+    '"\'ebeecee"#ide#$tlin!&hivago!)ig-zagged"#log"&mbalan"$tney!%lotys!%nf11b#"33%!a!)ollverein"#oms"\'roaster',
+    '+#ism"#sie!$ulei"!p!$weig!"yl',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_14 = (
+count_14 = 6694
+
+heads_14 = (
     '&agr+',
-    '&agr;-glucosidase',
-    '&agr;-tocopherol',
-    '&amacr;tman',
-    '&amp;times',
-    '&aring',
-    '&bgr;-actin',
-    '&commat%',
-    '&divide',
-    '&dollar;0.11',
-    '&dollar;0.15',
-    '&dollar;0.16',
-    '&dollar;0.17',
-    '&dollar;0.25',
-    '&dollar;1,800',
-    '&dollar;1.55',
     '&dollar;1.92',
-    '&dollar;130',
-    '&dollar;14,000',
-    '&dollar;175',
-    '&dollar;180,000',
-    '&dollar;18m',
-    '&dollar;2,100',
-    '&dollar;2,200',
-    '&dollar;2,600',
-    '&dollar;24m',
-    '&dollar;3,200',
-    '&dollar;3.1m',
-    '&dollar;3.7m',
-    '&dollar;300,000,000',
-    '&dollar;350,000',
-    '&dollar;35m',
     '&dollar;36',
-    '&dollar;4,800',
-    '&dollar;4.5',
-    '&dollar;4.8m',
-    '&dollar;500,000,000',
-    '&dollar;55,000',
-    '&dollar;55m',
-    '&dollar;64,000',
-    '&dollar;65m',
-    '&dollar;7.2m',
-    '&dollar;7.5m',
-    '&dollar;700,000',
-    '&dollar;700m',
-    '&dollar;80m',
-    '&dollar;850',
-    '&dollar;9.5m',
     '&dollar;900,000',
-    '&dollar;90m',
-    '&eacute;v&eacute;nements',
-    '&egr;-&zgr',
-    '&frac12;tsp',
-    '&khgr&amp;sup2',
-    '&lt;esc&gt',
-    '&lt;pb',
-    '&micro;g/h',
-    '&micro;g/kg/h',
-    '&pound;1,050',
-    '&pound;1.29',
-    '&pound;1.35',
-    '&pound;1.3bn',
-    '&pound;1.5bn',
-    '&pound;104',
     '&pound;105,000',
-    '&pound;108',
-    '&pound;10million',
-    '&pound;116',
-    '&pound;15.00',
-    '&pound;18.75',
-    '&pound;192',
-    '&pound;1m.',
-    '&pound;2,000,000',
-    '&pound;2.40',
-    '&pound;2.55',
-    '&pound;2.60',
-    '&pound;2.85',
-    '&pound;2.9',
-    '&pound;20&ndash;30,000',
-    '&pound;215m',
     '&pound;229',
-    '&pound;230,000',
-    '&pound;244.5bn',
-    '&pound;26.95',
-    '&pound;270,000',
-    '&pound;280,000',
-    '&pound;285',
-    '&pound;29,000',
-    '&pound;2m.',
-    '&pound;3,250',
-    '&pound;3.2',
-    '&pound;3.20',
-    '&pound;3.6m',
-    '&pound;3.8',
-    '&pound;30&ndash;40,000',
-    '&pound;32.50',
     '&pound;32m',
-    '&pound;33,000',
-    '&pound;349',
-    '&pound;34m',
-    '&pound;369',
-    '&pound;37m',
-    '&pound;38m',
-    '&pound;390',
-    '&pound;39m',
-    '&pound;4.3m',
-    '&pound;4.9',
-    '&pound;43,000',
-    '&pound;440,000',
-    '&pound;45m',
-    '&pound;470',
-    '&pound;47m',
     '&pound;5.2',
-    '&pound;5.4',
-    '&pound;50bn',
-    '&pound;56,000',
-    '&pound;590',
-    '&pound;595',
-    '&pound;599',
-    '&pound;6.3m',
-    '&pound;6.7',
-    '&pound;675',
-    '&pound;7.5m',
-    '&pound;7.6',
-    '&pound;720',
-    '&pound;780',
-    '&pound;79.99',
-    '&pound;7bn',
     '&pound;8.25',
-    '&pound;840',
-    '&pound;9.00',
-    '&pound;9.4m',
-    '&pound;m',
-    '&times;38',
-    '\'69',
-    '\'70',
-    '\'71',
-    '\'82',
-    '\'94',
-    '\'ands',
-    '\'appy',
-    '\'do',
-    '\'fraid',
-    '\'no',
     '\'s_a',
-    '*delete',
-    '+20',
-    '-30',
-    '-ap',
-    '-atpase',
-    '-hco',
-    '-ly',
-    '-s',
-    '-sensitive',
-    '.45',
-    '//',
-    '/g',
-    '/l/',
-    '/p/',
-    '0&middot;2',
     '0&ndash;9',
-    '0.',
-    '0.0001',
-    '0.005',
-    '0.02%',
-    '0.1mm',
-    '0.23',
-    '0.36',
-    '0.37',
-    '0.39',
-    '0.44',
-    '0.55',
-    '0.5p',
-    '0.91',
-    '0.94',
-    '0.98',
     '00:12',
-    '00:15',
-    '00:26',
-    '00:29',
-    '0202',
-    '0203',
-    '0223',
-    '0225',
-    '0255',
-    '0420',
-    '0442',
-    '0533',
-    '07.00',
-    '0742',
-    '08.00',
-    '0839&ndash;666',
     '0nh',
-    '0s',
-    '1&deg;c',
-    '1&frac12;in',
-    '1&ndash;2&ndash;3',
-    '1&ndash;20',
-    '1(a)',
-    '1,000-strong',
-    '1,400,000',
-    '1-5',
-    '1.05',
-    '1.1m',
-    '1.2.2',
-    '1.33',
-    '1.4.4',
-    '1.44',
     '1.4m',
-    '1.6-litre',
-    '1/100',
-    '10,000ft',
-    '10-',
-    '10-0',
-    '10-13',
-    '10.1%',
-    '10.12',
-    '10.75',
-    '10.8%',
-    '100,000,000',
-    '100-strong',
-    '100hz',
-    '100mb',
-    '1015',
     '1019',
-    '1036',
-    '1039',
-    '105,000',
-    '1057',
-    '1064',
-    '1065',
-    '1067',
-    '1094',
-    '1098',
-    '10am-5pm',
-    '10base-t',
-    '10p11.2-q11.2',
-    '11(4)',
-    '11-15',
-    '11.1%',
     '11.35',
-    '11.75',
-    '11000',
-    '1109',
-    '1115',
-    '1139',
-    '1150s',
-    '1153',
-    '1167',
-    '1188',
-    '1196',
-    '1197',
-    '11in',
-    '11lb',
-    '11st',
-    '12(3)',
     '12-day',
-    '120%',
-    '120-member',
-    '1208',
-    '1209',
-    '1211',
-    '1219',
-    '1222',
-    '1228',
-    '1246',
-    '1252',
-    '1253',
-    '125ml/5fl',
-    '1261',
-    '1262',
-    '1288',
     '128kb',
-    '12cm',
-    '12mb',
-    '13&ft',
-    '1304',
-    '1329',
-    '1342',
-    '1351',
-    '1359',
-    '1378',
-    '1380s',
-    '1382',
-    '1394',
-    '1395',
-    '13a',
-    '14&ft',
     '14&ndash;17',
-    '14-17',
-    '14.8%',
-    '140p',
-    '1413',
-    '1419',
-    '1431',
-    '1437',
-    '1457',
-    '1462',
-    '1488',
-    '1495',
-    '1496',
-    '1497',
-    '14ft',
-    '14m',
     '14pc',
-    '15&deg;c',
-    '15-18',
-    '15-9',
-    '15-man',
-    '15-month-old',
-    '15.3%',
-    '15/16',
-    '1502',
-    '1505',
-    '1508',
-    '150m',
-    '1511',
-    '1558&ndash;1603',
-    '16&ndash;2',
-    '16&ndash;3',
     '16(1)',
-    '16-processor',
-    '16.7%',
-    '17&ndash;21',
-    '17-inch',
-    '17.00',
-    '17.30',
-    '17.4%',
-    '17.9%',
-    '17ft',
-    '17pc',
-    '18.7',
-    '18.8',
-    '18mm',
-    '19-inch',
-    '19.4%',
     '190&deg;c',
-    '1920&ndash;21',
-    '1928&ndash;29',
-    '1935&ndash;36',
-    '1940&ndash;41',
-    '1940\'s',
-    '1953&ndash;54',
-    '1957&ndash;58',
-    '1960&ndash;61',
-    '19605',
-    '1968&ndash;69',
-    '1969&ndash;73',
-    '1970&ndash;1',
-    '1970s/1980s',
-    '1974&ndash;5',
-    '1974&ndash;75',
     '1974&ndash;8',
-    '1975&ndash;6',
-    '1980-81',
-    '1981-82',
-    '1982&ndash;4',
-    '1982-83',
-    '1984&ndash;88',
-    '1986&ndash;88',
-    '1987.',
-    '1989-91',
-    '1990/1',
-    '1991&ndash;1992',
-    '1991\'s',
-    '1995&ndash;96',
-    '1:250',
-    '1:27',
     '1:5',
-    '1:8',
-    '1ft',
-    '1n',
-    '1sa',
-    '1tsp',
-    '2&commat;1/2',
-    '2&frac12%',
-    '2&frac12;p',
-    '2&ndash;11',
-    '2&ndash;8',
-    '2(5)',
-    '2(b)',
-    '2*',
-    '2,250',
-    '2,750',
     '2,900',
-    '2-',
-    '2-cell',
-    '2.15pm',
-    '2.2.4',
-    '2.21',
-    '2.24',
-    '2.3.3',
-    '2.33',
-    '2.4.3',
-    '2.5.0',
-    '2.6.1',
-    '2.8&aring',
-    '2/4',
-    '20&deg',
-    '20&ndash;23',
     '20+',
-    '20-25',
-    '20-page',
-    '20.00',
-    '200-300',
-    '200-year-old',
-    '2008',
-    '200g/7oz',
-    '200p',
-    '20k',
-    '20ml',
-    '21&ndash;22',
-    '21-24',
-    '21.',
-    '21.9',
-    '21s',
     '22&ndash;23',
-    '22,500',
-    '220c/425f/gas',
-    '23pc',
-    '23s',
-    '24&ndash;26',
-    '24-bit',
-    '240p',
-    '240v',
-    '247645',
-    '24m',
-    '25&deg',
-    '25&ndash;27',
-    '25-1',
-    '25-28',
-    '25-30',
     '25-member',
-    '25.3',
-    '25.4',
-    '26&ndash;28',
-    '26.5',
-    '27-30',
-    '270,000',
-    '28&ndash;30',
-    '29(2)',
-    '29.8',
-    '2cv',
-    '2g',
-    '2nds',
-    '2x10',
-    '3&deg',
-    '3&ndash;9',
     '3,000ft',
-    '3.00pm',
-    '3.3.3',
-    '3.4.2',
-    '3.5m',
-    '3.5p',
-    '3.8.0',
-    '30-mile',
-    '3000m',
-    '3050',
-    '30km',
-    '3100',
-    '320,000',
-    '32kb',
-    '32s',
-    '33&ndash;1',
     '33.5',
-    '330ml',
-    '34(2)',
-    '3440',
-    '3450',
-    '35&deg;c',
-    '35a',
-    '36-hole',
-    '36450-51',
-    '37041',
-    '37239',
-    '37267',
-    '37311',
-    '37312',
-    '37602',
-    '37641',
     '37659',
-    '37694',
-    '37697',
-    '37712',
-    '37727',
-    '37759',
-    '37764',
-    '37772',
-    '37784',
-    '37851',
-    '37867',
-    '37929',
-    '37959',
-    '37968',
-    '37969',
-    '38022',
     '38102',
-    '38109',
-    '38119',
-    '38151',
-    '38180',
-    '38194',
-    '38199',
-    '38216',
-    '38217',
-    '38312',
-    '38320',
-    '38373',
-    '38430',
-    '38537',
-    '38682',
-    '38716',
     '38923',
-    '38967',
-    '38p',
-    '3:16',
-    '3h',
-    '3hr',
-    '3min',
-    '3t3',
-    '4&ndash;4',
-    '4,400',
-    '4,500,000',
-    '4-6-0',
-    '4-star',
-    '4-year-old',
-    '4.18',
-    '4.29',
     '4.3.3',
-    '4.40',
-    '4.5.2',
-    '4.75',
-    '4.90',
-    '4/4',
-    '40&ndash;44',
-    '40-hour',
-    '40000',
-    '4001',
-    '400mb',
-    '40g/1&frac12;oz',
-    '40km',
-    '42.2',
-    '420,000',
-    '44141',
     '4472',
-    '44p',
-    '45ml',
-    '45mm',
-    '45pc',
-    '46.5',
-    '470s',
-    '48(2)',
-    '4f',
-    '4gb',
-    '5(4)',
-    '5,700',
-    '5.0%',
-    '5.23',
-    '5.28',
-    '5.5p',
     '50-mile',
-    '50-minute',
-    '500-strong',
-    '500g',
-    '525mb',
-    '593',
-    '599',
-    '5g',
-    '5k',
-    '5kg',
-    '6&ndash;11',
-    '6,200',
-    '6-month',
-    '6.1.2',
-    '6.21',
-    '6.25%',
     '6.4.2',
-    '6.6&ndash;7.0',
-    '6/8',
-    '60000',
-    '60hz',
-    '62p',
-    '640kb',
-    '646',
-    '64kb',
-    '65/66',
-    '68-year-old',
-    '694',
-    '699',
-    '6dj',
-    '6g11',
-    '7&frac12;p',
     '7(2)',
-    '7(3a)',
-    '7,000,000',
-    '7-10',
-    '7.4.2',
-    '7.5p',
-    '7.75%',
-    '7.9%',
-    '700m',
-    '701',
-    '70ft',
-    '71000',
-    '712',
-    '713',
-    '715/33',
-    '718',
     '723',
-    '73,000',
-    '74,000',
-    '749',
-    '759',
-    '75cm',
-    '75pc',
-    '763',
-    '76th',
-    '77-year-old',
-    '773',
-    '78-year-old',
-    '7879',
-    '78s',
-    '797',
-    '79p',
     '7:1',
-    '7s.',
-    '7st',
-    '7ty',
-    '8&ndash;0',
-    '8&ndash;13',
-    '8&ndash;14',
-    '8&ndash;2',
-    '8&ndash;3',
-    '8(3)',
-    '8,9',
-    '8-3',
-    '8.16',
-    '8.2%',
-    '8.7%',
-    '8.9%',
     '80&deg;f',
-    '80486s',
-    '8080',
-    '80mhz',
-    '813',
-    '81st',
-    '83rd',
-    '84th',
-    '85-year-old',
-    '87th',
-    '88,000',
-    '8800',
-    '881',
-    '893',
-    '897',
-    '8:1',
     '8kb',
-    '8s.',
-    '9&ndash;8',
-    '9(2)',
-    '9,000,000',
-    '9-12',
-    '9.13',
-    '9.2%',
-    '9.4%',
-    '9.7%',
-    '906',
-    '918',
-    '92-year-old',
-    '920',
-    '927',
-    '933',
     '94&deg;c',
-    '944',
-    '950i',
-    '973',
-    '985',
-    '99.9',
-    '997',
-    '9s',
-    '9st',
-    'a-1',
-    'a-f',
-    'a-road',
-    'a.1',
-    'a.s.m.',
-    'a.t',
-    'a/c',
     'a23187',
-    'a27',
-    'aage',
-    'aagpc',
-    'aalborg',
-    'abbeydale',
-    'abbotsford',
-    'abdelhamid',
-    'abdol',
-    'abductor',
-    'abductors',
-    'abel-smith',
-    'abides',
-    'ablewhite',
-    'about-face',
-    'abpc',
     'abri',
-    'abrogating',
-    'absolving',
-    'abutments',
-    'aby',
-    'abyssicola',
-    'ac-5-asa',
-    'academical',
-    'academicians',
-    'academicism',
-    'acads',
-    'acarbose',
-    'access/one',
-    'accidentals',
-    'acclimatization',
-    'acclimatize',
     'accomplishes',
-    'accountabilities',
-    'accretionary',
-    'accucard',
-    'accumulative',
-    'acdp',
-    'ace/id',
-    'aceh',
-    'acharya',
-    'acomb',
-    'acquavella',
-    'act-up',
-    'acta',
-    'actualities',
-    'adatom',
-    'addition_to',
     'addresser',
-    'adduces',
-    'adema',
-    'adgey',
-    'adipose',
-    'adisa',
-    'adjunctive',
-    'adkins',
-    'adulteress',
-    'adulyadej',
-    'adv',
-    'adversative',
-    'adverted',
-    'advertorial',
-    'aef-1&agr',
-    'aelfflaed',
     'aerodynamically',
-    'aet',
-    'aethelburh',
-    'affaire',
-    'affines',
-    'affleck',
-    'afrikaners',
-    'after-effect',
-    'aftershocks',
-    'agb',
-    'age-',
-    'age-range',
-    'agentes',
-    'agnostics',
-    'agostino',
-    'agronomic',
     'ah3',
-    'ahm',
-    'ahs',
-    'ahumic',
-    'aide_memoire',
-    'aikido',
-    'aikman',
-    'aindow',
-    'ainger',
-    'aint',
-    'airfix',
-    'airgun',
-    'airlife',
-    'aitch',
-    'aitches',
-    'aix-en-provence',
     'ak',
-    'akpata',
-    'akrotiri',
-    'al-amin',
-    'al-karim',
-    'al-masri',
-    'al-megrahi',
-    'al_dente',
-    'albacete',
-    'albacore',
-    'aldana',
-    'aldebaran',
-    'aldridge-brownhills',
-    'aleksei',
-    'alembic',
-    'alertly',
     'aleutian',
-    'alexai',
-    'alexon',
-    'alfresco',
-    'algirdas',
-    'algorithmic',
-    'alights',
-    'aliysa',
-    'all-too',
-    'all-year-round',
-    'alle',
-    'alledged',
-    'allegra',
-    'allinson',
-    'allophone',
-    'alloying',
     'allsopp',
-    'almahawi',
-    'almsmead',
-    'alpha-1',
-    'alport',
-    'alshawi',
-    'alternators',
-    'alvarado',
-    'alveoli',
-    'amad&eacute',
-    'amaldi',
-    'amand',
-    'amaury',
-    'ambivalences',
-    'ambonnay',
-    'amedeo',
     'ameliorates',
-    'american-made',
-    'american/caribbean',
-    'americanised',
-    'amesbury',
-    'amidated',
-    'amina',
-    'aminoglycoside',
-    'ammophila',
-    'amnesties',
-    'amorality',
-    'amours',
-    'amp&egrave;re',
-    'amphipolis',
-    'ampoules',
-    'amsler',
     'amtico',
-    'anadolu',
-    'anaheim',
-    'anaya',
-    'ancaster',
-    'andalucia',
-    'andras',
-    'andreeva',
-    'andrevitch',
-    'andrey',
-    'androulis',
-    'aneurysms',
-    'angeles-based',
-    'angelou',
-    'angering',
-    'anglo-catholics',
     'anglo-indian',
-    'anglo-scots',
-    'angola-workers',
-    'angolans',
-    'angustifolium',
-    'anhydride',
-    'anima',
-    'animal-like',
-    'animality',
-    'anise',
-    'anisotropy',
-    'anl',
-    'annealed',
-    'anomala',
-    'anoxia',
-    'anp',
     'ansah',
-    'ansaphone',
-    'anschluss',
-    'antagonised',
-    'antennal',
-    'anthemius',
-    'anthus',
-    'anti-&agr',
-    'anti-a',
-    'anti-abortionists',
-    'anti-bcl-2',
-    'anti-bonding',
-    'anti-capitalist',
-    'anti-dog',
-    'anti-papal',
-    'anti-polish',
     'anti-poll',
-    'anti-realism',
-    'anti-realist',
-    'anti-roll',
-    'anti-roman',
-    'anti-vivisection',
-    'antiguan',
-    'antipasto',
-    'antipathies',
-    'antiphonal',
-    'antisecretory',
-    'antitheses',
-    'antroduodenal',
-    'anymole',
-    'aoi',
-    'aor',
     'ap&eacute;ritif',
-    'apartado',
-    'apgood',
-    'apocrypha',
-    'apoel',
-    'apollinaris',
-    'aponogeton',
-    'apostrophes',
-    'appalachians',
-    'appellations',
-    'appertain',
-    'appetiser',
-    'appraisers',
-    'aprotinin',
-    'aps',
-    'aptness',
     'aquachamp',
-    'aquascape',
-    'aquilegia',
-    'aquitanian',
-    'arabel',
-    'aram',
-    'aranjuez',
-    'arbalest',
-    'arbitrating',
-    'arbuckle',
-    'arce',
-    'arch-rivals',
-    'archaean',
-    'archaeologically',
-    'archeological',
-    'archer-shee',
     'archimandrite',
-    'architraves',
-    'arcsec',
-    'ardmore',
-    'ardoyne',
-    'arenson',
-    'arezzo',
-    'argan',
-    'argentiere',
-    'argentinas',
-    'arif',
-    'ariosto',
-    'arista',
-    'aristides',
-    'arjan',
-    'arjuna',
     'armin',
-    'armless',
-    'armrest',
-    'arnside',
-    'aron',
-    'arrhythmic',
-    'arrivederci',
-    'arrowana',
-    'art-school',
-    'artesian',
-    'arunachal',
-    'arundell',
-    'aryans',
-    'asaimara',
-    'ascetics',
-    'ascher',
     'ashkenazi',
-    'asia/pacific',
-    'askatasuna',
-    'askwith',
-    'asmussen',
-    'asn',
-    'asnett',
-    'asphyxiated',
-    'assandun',
-    'assassinating',
-    'assemblyman',
-    'assents',
-    'assiduity',
-    'associational',
-    'associatively',
-    'associatives',
     'associativity',
-    'asters',
-    'astonishes',
-    'astrophysical',
-    'atherstone',
-    'athol',
-    'athwart',
-    'atonality',
-    'atria',
-    'attestation',
-    'attis',
-    'atwater',
-    'auch',
-    'auchterarder',
-    'augury',
-    'august/september',
     'auric',
-    'austins',
-    'australe',
-    'australian-born',
-    'austrasia',
-    'autarchic',
-    'auteur',
-    'authigenic',
-    'autochrome',
-    'autoexec',
-    'autoradiogram',
-    'autoradiograph',
-    'autoset',
-    'auvers',
-    'avedon',
-    'averland',
     'avison',
-    'avm',
-    'avocet',
-    'avtar',
-    'awacs',
-    'aways',
-    'awford',
-    'axonal',
-    'ayacucho',
-    'aydin',
-    'aymara',
-    'azhar',
-    'aznar',
-    'b&amp;w',
-    'b&eacute;nezet',
-    'b&eacute;roff',
     'b&ecirc;te_noire',
-    'b&uuml;rgertum',
-    'b-form',
-    'b-sides',
-    'b-trees',
-    'b.b.',
-    'b.m.t.',
-    'b8',
-    'b=3',
-    'babbitt',
-    'babri',
-    'bachofen',
-    'bachop',
-    'back-handed',
-    'back-seat',
-    'backdraft',
     'backfill',
-    'backlogs',
-    'backpacks',
-    'backstay',
-    'bacteriologist',
-    'badcock',
-    'badcox',
-    'baffin',
-    'bagful',
-    'bahama',
-    'bajan',
-    'balanitis',
-    'balazs',
-    'baldy',
-    'ball-bearings',
-    'balladeer',
     'balleny',
-    'ballinger',
-    'ballrooms',
-    'ballyhoo',
-    'ballykelly',
-    'ballymurphy',
-    'baloney',
-    'baltusrol',
-    'bamfield',
-    'banffshire',
-    'banishes',
-    'banquette',
-    'banville',
-    'bap',
-    'bar_mitzvah',
-    'baran',
     'barat',
-    'barbizon',
-    'bare-faced',
-    'bareboat',
-    'bares',
-    'barm',
-    'barmaids',
-    'barn-like',
-    'barnham',
-    'barracked',
-    'barrowclough',
-    'bartell',
-    'baryshnikov',
-    'bas-relief',
-    'baseboard',
-    'basie',
     'basilisk',
-    'basler',
-    'basse-navarre',
-    'bast',
-    'bastian',
-    'bath/wc',
-    'bathes',
-    'bathhouse',
-    'batholiths',
-    'battison',
-    'bauen',
-    'bavduin',
-    'bayle',
-    'bayser',
-    'bazooka',
-    'bbdo',
     'bbn',
-    'bcl',
-    'bcnf',
-    'beachcomber',
-    'beadles',
-    'beales',
-    'beamer',
-    'beanstalk',
-    'beasties',
-    'beatitude',
-    'beaune',
-    'beaut',
-    'beautify',
-    'beautifying',
-    'beauvais',
-    'bebe',
     'beckenbauer',
-    'becton',
-    'bedevil',
-    'bedevils',
-    'bedpan',
-    'bedpans',
-    'bedsitters',
-    'bedtimes',
-    'beechgrove',
-    'beefcake',
-    'beehives',
-    'beeping',
-    'beetlejuice',
-    'befriends',
-    'begley',
-    'behaviouralists',
     'behaviourally',
-    'behinds',
-    'behn',
-    'bei',
-    'belbin',
-    'belemnites',
-    'belford',
-    'belgacom',
-    'belgo',
-    'bell-push',
-    'bell-ringing',
-    'bellicosity',
-    'belling',
-    'bellinger',
-    'bellissima',
-    'bellway',
     'belouch',
-    'belshazzar',
-    'benares',
-    'benavides',
-    'benching',
-    'bendjedid',
-    'benefaction',
-    'benevento',
-    'bentsen',
-    'benzodiazepine',
-    'berenger',
-    'bergsson',
-    'berkowitz',
-    'bernicia',
-    'bernwood',
-    'berthing',
     'berthold',
-    'berwyn',
-    'besets',
-    'besiktas',
-    'bessemer',
-    'best-fit',
-    'bestrode',
-    'bethlem',
-    'bethune-baker',
-    'beto',
-    'better-than-expected',
-    'beurre',
-    'bewitchment',
-    'bf110s',
-    'bfg',
-    'bhagavad',
     'bhutanese',
-    'biafran',
-    'bianca',
-    'bibliographer',
-    'bibs',
-    'bibury',
-    'bicep',
-    'bicester/oxfordshire',
-    'bickers',
-    'bicycled',
-    'biennials',
-    'biermann',
-    'biffa',
-    'big-boned',
-    'big-wave',
-    'bigg',
     'bildt',
-    'billabong',
-    'binaural',
-    'binchy',
-    'binnacle',
-    'binning',
-    'bintley',
-    'biofuels',
-    'biogeochemical',
-    'biogeographical',
-    'biomechanical',
-    'biosociety',
-    'biota',
-    'bip',
-    'bipedalism',
-    'bird-song',
     'birdlip',
-    'birlik',
-    'biron',
-    'birtley',
-    'bisects',
-    'bisque',
-    'bisset',
-    'bitchiness',
-    'bitmapped',
-    'bivouacs',
-    'biwott',
-    'bizarro',
-    'bj',
-    'bjornsson',
-    'bk',
-    'bka',
     'black-faced',
-    'black-robed',
-    'black-tipped',
-    'blackbushe',
-    'blackface',
-    'blackford',
-    'blackguard',
-    'blackleg',
-    'blackley',
-    'blackmailers',
-    'bladed',
-    'bladud',
-    'blanketing',
-    'blatchford',
-    'blaxhall',
-    'blazon',
     'blemished',
-    'blighting',
-    'blobby',
-    'blom',
-    'blonde-haired',
-    'blood-groups',
-    'bloodcurdling',
-    'bloodstain',
-    'blow-by-blow',
-    'blow-out',
-    'blowsy',
-    'blub',
-    'bluefin',
-    'blurgh',
-    'bmx',
-    'boaden',
     'boathook',
-    'boatload',
-    'boche',
-    'bodenham',
-    'bodiam',
-    'body-building',
-    'body-snatchers',
-    'boelcke',
-    'boers',
-    'boggling',
-    'bohemianism',
-    'boilies',
-    'bolckow',
-    'bolkiah',
-    'bombards',
-    'bondagers',
     'bone-structure',
-    'bonfield',
-    'bonheur',
-    'bonnerjea',
-    'bookstalls',
-    'bookworm',
-    'boorman',
-    'boosey',
-    'bootees',
-    'bootstraps',
-    'booz',
-    'booze-up',
-    'boozers',
-    'bopd',
-    'bordello',
-    'bordes',
     'bore-holes',
-    'boren',
-    'borodin',
-    'bossi',
-    'bossiness',
-    'bossu',
-    'boswells',
-    'botting',
-    'bottle-fed',
-    'bottle-feeding',
-    'bottle-nosed',
-    'bottlenecked',
-    'bottome',
-    'bottoming',
-    'botulism',
-    'bouilhet',
     'bouillabaisse',
-    'bouillon',
-    'boule',
-    'boules',
-    'boulle',
-    'bourg',
-    'bourgogne',
-    'bourr&eacute;e',
-    'bousfield',
-    'bow-legged',
-    'bowdon',
-    'bowhill',
-    'bowler-hatted',
-    'box-like',
-    'boxtree',
-    'boyars',
     'bpxc',
-    'br&eacute;tigny',
-    'br&uuml;cke',
-    'br&uuml;ning',
-    'brachiosaurus',
-    'bracingly',
-    'bracy',
-    'bradfords',
-    'braga',
-    'braggart',
-    'brain\'',
-    'bramham',
-    'bramshott',
-    'brashly',
-    'brassica',
-    'brasso',
     'brathwaite',
-    'braybrooke',
-    'brazils',
-    'breakaways',
-    'breakpoint',
-    'breakwell',
-    'breathability',
-    'breathalysed',
-    'breavman',
-    'brentwoods',
-    'bretagne',
-    'brewin',
-    'briavels',
-    'brickbats',
-    'bridgford',
-    'bridgland',
     'brightly-lit',
-    'brigstock',
-    'brisket',
-    'brissett',
-    'britt-marie',
-    'broaching',
-    'broad-brush',
-    'broadview',
-    'brod',
-    'brodick',
-    'brokof',
-    'bromyard',
-    'bronco',
-    'bronwen',
-    'brophy',
-    'brown-haired',
     'browny',
-    'broxbourne',
-    'brr',
-    'brs/search',
-    'brueghel',
-    'bruin',
-    'brunelleschi',
-    'bruv',
-    'bryer',
-    'brynteg',
-    'bryophytes',
-    'bryozoans',
-    'bto',
-    'bubiyan',
-    'bubwith',
-    'bucketing',
     'buckhurst',
-    'buddle',
-    'budged',
-    'buff-coloured',
-    'bufo',
-    'bugles',
-    'bugner',
-    'bula',
-    'bulking',
-    'bullards',
-    'bulldoze',
-    'bulletproof',
-    'bulli',
-    'bumptious',
-    'buncrana',
-    'bunkum',
     'bunzl',
-    'bureaucratically',
-    'bureaucratized',
-    'burgermeister',
-    'burghfield',
-    'burgle',
-    'burhanuddin',
-    'burmin',
-    'burness',
-    'burnt-offering',
-    'burra',
-    'burrus',
-    'bushed',
-    'busi',
-    'business-class',
-    'businessobjects',
     'busk',
-    'busoni',
-    'bussing',
-    'bustles',
-    'but-',
-    'buteo',
-    'butte',
-    'butzer',
-    'buzan',
-    'byas',
-    'bylaws',
-    'byproducts',
-    'c&sharp',
-    'c+',
-    'c.f.',
-    'c.n.d.',
     'ca\'',
-    'ca1',
-    'caan',
-    'cabals',
-    'cabomba',
-    'cabrio',
-    'cace',
-    'cacodylate',
-    'cadam',
-    'cadburys',
-    'cadenza',
-    'cadherin',
-    'caerulea',
-    'cafeterias',
-    'caftan',
-    'cag',
     'cahiers',
-    'cajec',
-    'calabrian',
-    'calagarri',
-    'calamine',
-    'calcipotriol',
-    'calculative',
-    'calder-marshall',
-    'calderbank',
-    'calender',
-    'calibrating',
-    'calibrations',
-    'caliphate',
-    'calke',
-    'call-outs',
-    'callanetics',
     'calligraphic',
-    'calluses',
-    'calorimetry',
-    'caltech',
-    'calthorpe',
-    'calve',
-    'calver',
-    'calvo',
-    'cambo',
-    'camera-ready',
-    'camm',
-    'camorra',
-    'camp-bed',
-    'campagna',
-    'camshaft',
-    'can-can',
     'canadensis',
-    'candidatures',
-    'candleford',
-    'candlemas',
-    'canne',
-    'cannington',
-    'cannonballs',
-    'canst',
-    'cantril',
-    'cao',
-    'capellans',
-    'capita',
-    'capon',
-    'capulet',
-    'car-free',
-    'caradryel',
     'carbon-fibre',
-    'carbuncle',
-    'cardholder',
-    'careerists',
-    'carella',
-    'carib',
-    'caricaturing',
-    'carlsbro',
-    'carmellina',
-    'carmina',
-    'carmyllie',
-    'carnality',
-    'carnegie-mellon',
-    'carnoustie',
-    'carolinas',
-    'carpal',
     'carpentier',
-    'carrack',
-    'carrel',
-    'carrero',
-    'carry-over',
-    'carse',
-    'cartloads',
-    'cartographers',
-    'cartouche',
-    'cartwheeled',
-    'carwyn',
-    'case-law',
-    'cashes',
-    'cassillis',
-    'cassiopeia',
-    'castiglione',
     'castlemaine',
-    'castlemilk',
-    'castrato',
-    'catarina',
-    'catch-22',
-    'catch-phrase',
-    'catch-phrases',
-    'catechetical',
-    'categoric',
-    'categorisations',
-    'catheterisation',
-    'catholicity',
-    'catsuit',
-    'cattery',
-    'catto',
-    'causalism',
     'causewayside',
-    'causton',
-    'cavalieri',
-    'cavort',
-    'cavour',
-    'cayard',
-    'cbgb',
-    'cbso',
-    'cd44',
-    'cd45',
-    'cdf',
-    'cdl',
-    'ceasefires',
-    'cecils',
-    'ceeac',
-    'cendrars',
     'centcom',
-    'central-bank',
-    'centrifuges',
-    'centrosymmetric',
-    'cep',
-    'cereal-packet',
-    'certifiable',
-    'certificate-holder',
-    'cesarewitch',
-    'cesena',
-    'cession',
-    'ceti',
-    'ceuta',
-    'ch1',
-    'chain-link',
-    'chakufwa',
     'chalices',
-    'chamber-pot',
-    'chancre',
-    'chancroid',
-    'changers',
-    'chapati',
-    'chardonnays',
-    'charest',
-    'charkin',
-    'charlies',
-    'charmaine',
-    'charnos',
-    'charteris',
-    'chat-show',
-    'chatelaine',
-    'chebyshev',
     'cheerleader',
-    'cheese-making',
-    'cheeseburger',
-    'chegwin',
-    'cheka',
-    'chelmer',
-    'chemotherapeutic',
-    'chenin',
-    'chenodeoxycholic',
-    'chenodeyxholic',
-    'cheriton',
-    'chernenko',
-    'chernomyrdin',
-    'chessmen',
-    'chesterhall',
-    'cheung',
     'cheviots',
-    'chevisham',
-    'chevrons',
-    'chi-square',
-    'chia',
-    'chich&oacute;n',
-    'chide',
-    'chides',
-    'chidzero',
-    'chillida',
-    'chimaeras',
-    'chimeras',
-    'chinamen',
-    'chinless',
-    'chinnor',
-    'chinos',
     'chipperfield',
-    'chivvied',
-    'chlodomer',
-    'chlorpromazine',
-    'chocks',
-    'chocolate-brown',
-    'choire',
-    'cholangiocarcinoma',
-    'cholerae',
-    'chorister',
-    'chorlton',
-    'chr',
-    'chr&dollar',
-    'chrissakes',
-    'christianization',
-    'christologies',
     'christophers',
-    'christs',
-    'christus',
-    'chromatograph',
-    'chuli',
-    'churchill-coleman',
-    'churchillian',
-    'chuzzlewit',
-    'cicerone',
-    'ciel',
-    'ciggies',
-    'cinema-goers',
-    'cinematographer',
-    'cinerea',
-    'cinnamond',
-    'circumscribing',
     'ciudad',
-    'civics',
-    'civil-rights',
-    'civilise',
-    'civilities',
-    'civilize',
-    'civizade',
-    'claimable',
-    'clambers',
-    'clarabel',
-    'clarkes',
-    'classier',
-    'classiest',
-    'clavichord',
-    'claw-like',
-    'clayoquot',
     'cleator',
-    'clelland',
-    'cleobury',
-    'clerkess',
-    'cliffside',
-    'clifftops',
-    'clinard',
-    'cloak-and-dagger',
-    'clogau',
-    'cloggy',
-    'cloisonn&eacute',
-    'closed.loop',
-    'closeup',
-    'clouting',
-    'cloverbay',
-    'cls',
     'clubbable',
-    'cluniac',
-    'cm/s',
-    'cmj',
-    'cn',
-    'cnet',
-    'cnu',
-    'co-chair',
-    'co-decision',
-    'co-editor',
-    'co-founded',
-    'co-founders',
-    'co-occur',
-    'co-operates',
-    'co-operators',
-    'co-ownership',
     'co-residence',
-    'co-text',
-    'co-worker',
-    'coach-house',
-    'coachloads',
-    'coagulated',
-    'coaming',
-    'coat-hanger',
-    'coat-hangers',
-    'cobwebbed',
-    'cochin',
-    'cochin-china',
-    'cock-eyed',
-    'cock-ups',
-    'cockbain',
-    'cockfight',
     'cockiness',
-    'cocoons',
-    'codasyl',
-    'codings',
-    'coelacanth',
-    'coenred',
-    'coercing',
-    'coetsee',
-    'coexistent',
-    'cofactor',
-    'coffered',
-    'cogan',
-    'coghlan',
-    'cogito',
-    'cohabitees',
-    'cohan',
     'coif',
-    'colborne',
-    'colby',
-    'coleen',
-    'collaborationist',
-    'collar-bone',
-    'collectables',
-    'collict',
-    'colloquialism',
-    'collyer',
-    'colones',
-    'colonia',
-    'colonisers',
-    'colored',
-    'colorimetric',
-    'colour-sided',
     'colourant',
-    'colton',
-    'commandeering',
-    'commandingly',
-    'comminges',
-    'commis',
-    'commiserations',
-    'committment',
-    'common-places',
-    'common-room',
-    'commonalities',
-    'communards',
-    'communiqu&eacute;s',
-    'communitas',
-    'commutation',
-    'compactly',
     'companionate',
-    'comparatives',
-    'composedly',
-    'composes',
-    'comprehends',
-    'computer-integrated',
-    'computer-literate',
-    'computerising',
-    'comus',
-    'comyns',
-    'conablaiche',
-    'concertgebouw',
-    'conciseness',
-    'concreting',
-    'concurring',
-    'condemnatory',
     'condescendingly',
-    'conditionality',
-    'condominium',
-    'conducator',
-    'condy',
-    'coned',
-    'confederates',
-    'confessionals',
-    'conflating',
-    'conformists',
-    'congaie',
-    'congealing',
-    'conjunctural',
-    'conked',
-    'conklin',
-    'connally',
     'connecticut-based',
-    'conques',
-    'consanguinity',
-    'conscientiousness',
-    'consensys',
-    'conservative-dominated',
-    'consignees',
-    'consistory',
-    'consols',
-    'conspicuousness',
-    'constitutionalists',
-    'construal',
-    'consulates',
-    'consulting-room',
-    'cont.',
-    'containable',
     'container-grown',
-    'contd',
-    'contempts',
-    'content-based',
-    'context-sensitive',
-    'context-table',
-    'continua',
-    'contraindicated',
-    'contraindications',
-    'conveners',
-    'convenors',
-    'conventicle',
-    'convulsing',
-    'coope',
-    'copacabana',
-    'copulations',
     'copydex',
-    'coquettish',
-    'corbin',
-    'corey',
-    'coridon',
-    'corin',
-    'corine',
-    'corruptly',
-    'corti',
-    'cortisone',
-    'corwen',
-    'cosa',
-    'cosimo',
-    'cost-free',
-    'cost-push',
-    'costal',
     'cottesmore',
-    'cottingham',
-    'coughlin',
-    'coul',
-    'coulin',
-    'coulis',
-    'counter-attacking',
-    'counter-cultural',
-    'counter-inflationary',
-    'counter-revolutionaries',
-    'counterbalancing',
-    'counterfactuals',
-    'counterpointed',
-    'counterstained',
-    'countrified',
-    'countships',
     'couplers',
-    'courbet',
-    'covenantee',
-    'covens',
-    'cowans',
-    'cowden',
-    'cowdery',
-    'coxen',
-    'coxes',
-    'cpf',
-    'cpis',
-    'cpni',
-    'crac',
-    'crackerjack',
-    'cradock',
-    'craig-dunlop',
     'craiglockhart',
-    'crake',
-    'crammer',
-    'cranesbill',
-    'crankcase',
-    'crash-landing',
-    'crassness',
-    'cravats',
-    'cravenly',
-    'crawfish',
-    'cray-3',
-    'creativeness',
-    'creb/atf1',
-    'creditworthy',
-    'crees',
-    'crenshaw',
     'crequer',
-    'crerand',
-    'cretinous',
-    'crew-cut',
-    'cricklade',
-    'criminalise',
-    'criminalization',
-    'criminologist',
-    'crimplene',
-    'cripplegate',
-    'crips',
-    'crispbread',
-    'criterion-referencing',
-    'crocheting',
-    'crofty',
-    'croppers',
     'cross-appeal',
-    'cross-community',
-    'cross-fire',
-    'cross-linking',
-    'cross-platform',
-    'cross-tabulation',
-    'cross-veins',
-    'crosslinked',
-    'crossovers',
-    'crossways',
-    'croton',
-    'croutons',
-    'crowfield',
-    'crowne',
-    'crowthorne',
-    'crt',
     'crud',
-    'crudeness',
-    'crudities',
-    'cruncher',
-    'cryptocorynes',
-    'cryptogamic',
-    'csps',
-    'ct2',
-    'cu.',
-    'cuan',
-    'cubisme',
-    'cuffing',
-    'cul_de_sac',
-    'cullis',
-    'culross',
-    'cumberlege',
     'cumbrous',
-    'cummerbund',
-    'cun',
-    'curdling',
-    'curig',
-    'curren',
-    'curvatures',
-    'cusani',
-    'cussons',
-    'custis',
-    'customisable',
-    'cutaways',
-    'cutcherry',
-    'cuthred',
-    'cutwater',
-    'cuxton',
     'cyanamid',
-    'cyanosis',
-    'cyber',
-    'cyborg',
-    'cyrille',
-    'd&eacute;partement',
-    'd\'addario',
-    'd-i-yers',
-    'd.litt.',
-    'd.m.',
-    'dade',
-    'daewoo',
-    'dafoe',
-    'dagon',
-    'dalmatians',
-    'dalriadic',
     'daltrey',
-    'dalwhinnie',
-    'damagingly',
-    'damnably',
-    'dance-halls',
-    'daoism',
-    'dariusz',
-    'dark-red',
-    'dark-suited',
-    'darkish',
-    'darmid',
-    'daro',
-    'daru',
-    'darwinist',
-    'darzin',
-    'datafin',
     'datchery',
-    'daubney',
-    'daugherty',
-    'davidian',
-    'davin',
-    'day-school',
-    'day-trip',
-    'daytona',
-    'db32',
-    'de-ionized',
-    'de-luxe',
-    'deaccessioning',
-    'dead-heading',
-    'deadman',
-    'deaf-blind',
-    'deary',
     'death-feigning',
-    'death-rates',
-    'debentureholder',
-    'debi',
-    'debiting',
-    'debt-for-equity',
-    'debt-reduction',
-    'debt-service',
-    'debunk',
-    'decant',
-    'decanting',
-    'decimating',
-    'decisional',
-    'declaim',
-    'declassified',
-    'declination',
     'decolonisation',
-    'decrying',
-    'dedicates',
-    'deducible',
-    'dee-dee',
-    'deepwater',
-    'defaecation',
-    'defers',
-    'deffenbacher',
-    'deforming',
-    'deglaciation',
-    'degreasers',
-    'deh',
-    'deir',
-    'delict',
-    'delilah',
     'delusive',
-    'demagogic',
-    'demagogues',
-    'demanders',
-    'demant',
-    'demarcating',
-    'demilitarised',
-    'democracia',
-    'democrat-controlled',
-    'democratically-elected',
-    'demoiselle',
-    'demoniac',
-    'demonstratively',
-    'demote',
-    'demystifying',
-    'denali',
     'denarius',
-    'denega',
-    'denon',
-    'denshin',
-    'dentan',
-    'denwa',
-    'departmentation',
-    'dependently',
-    'deponent',
-    'deposit-taking',
-    'depositary',
-    'deprecated',
-    'deputised',
-    'der\'i',
-    'derelicts',
-    'derring-do',
     'desegregation',
-    'desolated',
-    'desperadoes',
-    'despoliation',
-    'desulfovibrio',
-    'detaches',
-    'detchard',
-    'detections',
-    'detox',
-    'detoxify',
-    'deutschemark',
-    'developmentalists',
-    'devilry',
-    'dewy-eyed',
-    'dex',
-    'dexterously',
     'dfds',
-    'dfp',
-    'dgiv',
-    'dgm',
-    'dh&amacr;mis',
-    'diachronous',
-    'diamant',
-    'diamorphine',
-    'diata',
-    'dickenson',
-    'dictaphone',
-    'dictionnaire',
-    'didnae',
-    'didyma',
-    'dieticians',
-    'dietitians',
     'diffusivity',
-    'diluent',
-    'dimensionality',
-    'dimensionless',
-    'dimeric',
-    'dinaric',
-    'dingo',
-    'dinna',
-    'dinner-jacket',
-    'dinner-parties',
-    'dinner-table',
-    'dinwiddie',
-    'diodati',
-    'dionisovich',
-    'dipak',
-    'diplomates',
     'dipoles',
-    'dipterocarps',
-    'direct-dial',
-    'dirigiste',
-    'dirtying',
-    'disabuse',
-    'disagreeably',
-    'disallowance',
-    'disciplinarians',
-    'disclaiming',
-    'discomforting',
-    'discords',
-    'disease-resistant',
-    'disenfranchisement',
-    'disgustin\'',
-    'disgusts',
     'disillusioning',
-    'disinvestment',
-    'disjoint',
-    'disjunct',
-    'dislocating',
-    'dispersions',
-    'dispersive',
-    'disqualifies',
-    'disqualifying',
-    'disquieted',
-    'disquisition',
-    'dissatisfactions',
-    'dissects',
-    'dissociates',
-    'dissociations',
-    'distractor',
     'distributorship',
-    'distrusting',
-    'dithyramb',
-    'div.',
-    'divestments',
-    'divis',
-    'divisiveness',
-    'dlamini',
-    'dm2.50',
-    'dm2.52',
-    'dm2.88',
-    'dm2.95',
-    'dma',
-    'dmitrii',
-    'dmr',
-    'dna/protein',
     'dnasei',
-    'doan',
-    'dobbie',
-    'dobby',
-    'dobell',
-    'dobermans',
-    'dobies',
-    'dobr&eacute;e',
-    'dockworkers',
-    'doctor-patient',
-    'doggedness',
-    'doig',
-    'dolben',
-    'dolmetsch',
-    'dolph',
-    'domark',
     'domini',
-    'domitian',
-    'dommer',
-    'donita',
-    'donn',
-    'doolin',
-    'doonican',
-    'door-bell',
-    'doppelganger',
-    'dorahy',
-    'doria',
-    'dormers',
-    'double-checked',
-    'double-distilled',
-    'double-quick',
-    'doublings',
     'doubter',
-    'doucet',
-    'douglas-smith',
-    'douglases',
-    'dougray',
-    'doull',
-    'dourly',
-    'dovaston',
-    'dowager-duchess',
-    'down-and-out',
-    'down-problem',
-    'down-side',
-    'downgoing',
-    'downgradings',
-    'downie',
-    'downplayed',
     'downslope',
-    'downwardly',
-    'dowser',
-    'dpa',
-    'dr3',
-    'dralon',
-    'drambuie',
-    'draught-proofing',
-    'drawls',
-    'drays',
-    'dreadco',
-    'dreamland',
-    'dreamtime',
-    'drench',
-    'drewry',
-    'dribs',
     'drift-netters',
-    'drinkell',
-    'drippy',
-    'drogo',
-    'drood',
-    'dropouts',
-    'droylsden',
-    'druellae',
-    'druidical',
-    'drumbeat',
-    'dryburgh',
-    'dst',
-    'dta',
-    'dubbingtons',
-    'duckweed',
-    'ductal',
     'dudayev',
-    'duende',
-    'duffle-coat',
-    'duffus',
-    'dufy',
-    'dumpbin',
-    'duna',
-    'dunvant',
-    'durer',
-    'durium',
-    'durness',
-    'dust-up',
-    'dutt',
-    'duty-bound',
-    'dyestuff',
-    'dyffryn',
     'dymer',
-    'dymlight',
-    'dyneema',
-    'dysfunctions',
-    'e.w.',
-    'each-other',
-    'ead',
-    'eadwig',
-    'eagach',
-    'earful',
-    'earholes',
-    'earlston',
-    'earmark',
-    'earphone',
-    'earswick',
-    'earthiness',
     'earthlings',
-    'east-coast',
-    'east/west',
-    'eastcote',
-    'eastington',
-    'eatin\'',
-    'ebensten',
-    'eberhardt',
-    'ec2',
-    'eca',
-    'ecclesiae',
-    'echoey',
-    'eckard',
-    'eco-labelling',
-    'ecologie',
-    'economising',
     'economistic',
-    'ecotopia',
-    'ecs',
-    'edelstein',
-    'edgeware',
-    'edington',
-    'edp',
-    'educations',
-    'edwyn',
-    'eetpu',
-    'eeyore',
-    'eez',
-    'effaced',
-    'effeminacy',
-    'egglescliffe',
-    'eh3',
     'eheim',
-    'ehlers',
-    'ehrenreichs',
-    'ehrlich',
-    'eias',
-    'eig',
-    'eigenproblem',
-    'eighe',
-    'eight-foot',
-    'eight-inch',
-    'eight-man',
-    'eighteen-forties',
-    'eila',
-    'einzig',
-    'eirias',
-    'eit',
     'ekeus',
-    'elastase',
-    'elastically',
-    'elastin',
-    'elastomer',
-    'elbing',
-    'elbrus',
-    'electricals',
-    'electrostatics',
-    'elegans',
-    'eleventh-hour',
-    'ellemann-jensen',
-    'elliptic',
-    'ellmau',
-    'elma',
-    'elmers',
     'elmo',
-    'elphege',
-    'elrond',
-    'els',
-    'elses',
-    'elster',
-    'elstob',
-    'elvish',
-    'elysee',
-    'embodiments',
-    'emboli',
-    'embroiderer',
-    'embroiderers',
-    'embryological',
-    'embryonal',
-    'emirs',
     'emotionalism',
-    'emperorship',
-    'empingham',
-    'emporia',
-    'emptier',
-    'emulations',
-    'emus',
-    'en_passant',
-    'encase',
-    'encha&icirc;nements',
-    'encrypted',
-    'end-january',
-    'end-on',
-    'endgames',
-    'endive',
-    'endmember',
     'endogenously',
-    'endonucleases',
-    'endoperoxides',
-    'enervating',
-    'enfold',
-    'englander',
-    'englishwomen',
-    'engram',
-    'engrave',
-    'eni',
-    'enjoin',
-    'enlivens',
-    'enrichments',
-    'enslaving',
-    'entangle',
-    'entebbe',
     'enterocyte',
-    'entices',
-    'entombment',
-    'entomological',
-    'eog',
-    'eop',
-    'epigenesis',
-    'epiphanies',
-    'epoque',
-    'eppelmann',
-    'eppleton',
-    'epr',
-    'equipotential',
-    'eradicator',
-    'erasable',
-    'eraut',
     'erector',
-    'eretria',
-    'eriksson',
-    'erk',
-    'erlichman',
-    'errorful',
-    'escher',
-    'escutcheons',
-    'eso',
-    'esol',
-    'espa&ntilde;ol',
-    'espied',
-    'estefan',
-    'esto',
-    'estremadura',
-    'eth',
     'ethane',
-    'etherington',
-    'ethno-religious',
-    'ethnological',
-    'ethnomethodologists',
-    'ethogenic',
-    'ethologist',
-    'etoile',
-    'etzioni',
-    'eudes',
-    'eugen',
-    'eugenicists',
-    'eugenii',
-    'eugenio',
-    'eukanuba',
-    'eulogies',
     'euphorbia',
-    'euphorbiaceae',
-    'euro-credit',
-    'european-style',
-    'europeanisation',
-    'europol',
-    'eusebia',
-    'euskadi',
-    'eustatic',
-    'evangelise',
-    'evaporator',
-    'everington',
-    'everitt',
-    'evil-doers',
-    'evode',
-    'ex-colonies',
     'ex-pat',
-    'ex-post',
-    'ex-prisoners',
-    'ex-raf',
-    'ex-student',
-    'exaction',
-    'exclusivist',
-    'excrescence',
-    'excursus',
-    'execrable',
-    'exegetical',
-    'exfoliating',
-    'exfoliation',
-    'existentially',
-    'exod',
-    'exonuclease',
     'exorcising',
-    'exosat',
-    'exothermicity',
-    'exotoxins',
-    'expats',
-    'explain\'',
-    'exportation',
-    'expro',
-    'expropriate',
-    'extel',
-    'exter',
-    'extinguishment',
-    'extols',
-    'extra-special',
-    'extracurricular',
-    'extralinguistic',
     'extreme-right',
-    'extroversion',
-    'eye-contact',
-    'eyecatching',
-    'eyelet',
-    'f&mdash;in\'',
-    'f\'',
-    'f***',
-    'fabric-covered',
-    'fabricator',
-    'facetiously',
-    'facilitative',
-    'factious',
-    'fae',
-    'faery',
-    'fahan',
     'fairings',
-    'faithlessness',
-    'fajr',
-    'falla',
-    'fallows',
-    'falsificationism',
-    'falteringly',
-    'familia',
-    'familiarization',
-    'famille',
-    'farias',
-    'farina',
-    'farington',
-    'farndale',
-    'fast-running',
-    'fastnesses',
     'fastport',
-    'fatales',
-    'father-of-four',
-    'fauntleroy',
-    'fauve',
-    'faves',
-    'fawns',
-    'fb',
-    'fcl',
-    'fearfulness',
-    'feast-day',
-    'february-march',
-    'feckenham',
-    'federconsorzi',
-    'feeble-minded',
-    'feebler',
     'feedstocks',
-    'feeney',
-    'feldon',
-    'feluccas',
-    'fem',
-    'femora',
-    'fenech',
-    'fermat',
-    'fern-like',
-    'fernley',
-    'ferrand',
-    'ferrari-iba&ntilde;ez',
-    'ferreted',
-    'ferriby',
-    'ferrite',
-    'ferruzzi',
     'fertilizes',
-    'fetishes',
-    'fetvas',
-    'fibre-glass',
-    'fictive',
-    'fideicommissum',
-    'fidelma',
-    'fides',
-    'fieldsmen',
-    'fiers',
-    'fifty-pound',
-    'fig.5',
-    'fighter-bombers',
-    'fightin\'',
-    'fii',
-    'filibustering',
     'film-star',
-    'fin_de_si&egrave;cle',
-    'fina',
-    'finales',
-    'finalization',
-    'finbar',
-    'findhorn',
-    'fingerings',
-    'finitely',
-    'finnie',
-    'fintan',
-    'fiords',
-    'fiorentina',
-    'fiorio',
-    'fire-bomb',
-    'fire-bombed',
     'fire-escape',
-    'fire-watching',
-    'firebrands',
-    'firecrackers',
-    'firmlets',
-    'first-leg',
-    'firstfruits',
-    'fish-hook',
-    'fish-like',
-    'fishhouse',
-    'fishing-line',
-    'fishpond',
-    'fishponds',
-    'fisted',
-    'fitzhugh',
-    'five-course',
     'five-foot',
-    'five-inch',
-    'five-page',
-    'five-party',
-    'five-strong',
-    'five-wicket',
-    'fivepence',
-    'fki',
-    'fla',
-    'flagman',
-    'flamer',
-    'flaminia',
-    'flankers',
-    'flatbed',
-    'flatteringly',
-    'flaunts',
     'flavin',
-    'flavonoids',
-    'flavour-aversion',
-    'flawlessly',
-    'flaxen',
-    'flaxman',
-    'fleadh',
-    'fledermaus',
-    'fledgeling',
-    'fleet-footed',
-    'fleetlands',
-    'fleshing',
-    'flexural',
-    'flinn',
-    'flirtations',
-    'flirtatiously',
     'floating-rate',
-    'flocor',
-    'floodplains',
-    'floor-to-ceiling',
-    'flow-chart',
-    'fluviatile',
-    'fluxus',
-    'fmlp',
-    'fnt',
-    'fockin\'',
-    'fohrbeck',
-    'foible',
-    'folie',
-    'folies',
-    'folketing',
-    'fomalhaut',
     'fonthill',
-    'foodservice',
-    'forecasted',
-    'forecourts',
-    'forefingers',
-    'forelimb',
-    'forenames',
-    'foreward',
-    'forex',
-    'forgers',
-    'forkbeard',
-    'forresters',
-    'fors',
-    'forsbrand',
-    'forshaw',
-    'fortean',
     'fossilization',
-    'fouga',
-    'foula',
-    'four\'s',
-    'four-ball',
-    'four-colour',
-    'four-member',
-    'fowle/reporting',
-    'foxboro',
-    'foxhall',
-    'foyers',
-    'fr&egrave;re',
-    'frae',
-    'fragilis',
-    'framer',
-    'framheim',
     'franconia',
-    'francophile',
-    'francovich',
-    'frangipani',
-    'frankel',
-    'frantisek',
-    'frascati',
-    'fratricidal',
-    'frcc',
-    'frcp',
-    'frederik',
-    'free-labour',
-    'freedmen',
-    'freeform',
-    'freelancer',
-    'freelancing',
     'freeports',
-    'freewheel',
-    'freidson',
-    'fremantle',
-    'freon',
-    'fretilin',
-    'fridge-freezer',
-    'frink',
-    'frisian',
-    'frites',
-    'frobel',
-    'froebel',
-    'frogman',
-    'fromebridge',
-    'frontera',
-    'fronti&egrave;res',
     'frugivorous',
-    'fruitiness',
-    'fuerzas',
-    'fulda',
-    'full-face',
-    'full-rate',
-    'fullarton',
-    'fullerene',
-    'fullers',
-    'fumblings',
-    'fumigated',
-    'funbreak',
-    'funcinpec',
-    'funking',
-    'furio',
-    'furtiveness',
     'fusillade',
-    'fusty',
-    'fuzziness',
-    'fv',
-    'fwwg',
-    'fym',
-    'fyne',
-    'fynn',
-    'g&eacute;n&eacute;ration',
-    'g.e.',
-    'g.l.c.',
-    'g.w.r.',
-    'gabbana',
-    'gaillard',
-    'gainsay',
-    'gal.',
     'galilean',
-    'galina',
-    'gallia',
-    'gallifrey',
-    'gallonage',
-    'galoshes',
-    'galtung',
-    'galvanising',
-    'galvanizing',
-    'galvanometer',
-    'galveston',
-    'gambale',
-    'gamey',
-    'gangrenous',
-    'gann',
-    'gaoled',
     'garawand',
-    'garden-master',
-    'garfitt',
-    'garnering',
-    'garnier',
-    'garotter',
-    'garrett/oxford',
-    'garrotte',
-    'garrotted',
-    'garten',
-    'garvine',
-    'gas-fire',
-    'gas-mask',
-    'gas-phase',
-    'gasb',
-    'gaspard',
     'gastrins',
-    'gatecrash',
-    'gatrell',
-    'gaucho',
-    'gaudium',
-    'gavriil',
-    'gaw',
-    'gccs',
-    'geagea',
-    'gearoid',
-    'gebler',
-    'gef',
-    'gelada-like',
-    'gell',
-    'gem&auml;ldegalerie',
-    'generalship',
     'genevi&egrave;ve',
-    'genotoxic',
-    'gentil',
-    'gentled',
-    'geomantic',
-    'german-occupied',
-    'germanisation',
-    'germinating',
-    'gerrards',
-    'gettysburg',
-    'geysers',
-    'ggfhfb1',
-    'ghani',
-    'gholam',
-    'giant-killers',
-    'giant-killing',
     'giantess',
-    'giftware',
-    'gigant',
-    'gigot',
-    'gilmont',
-    'gimlet',
-    'ginsburg',
-    'gir',
-    'girran',
-    'gish',
-    'gisors',
-    'glagolitic',
-    'glenconner',
-    'glengarry',
-    'glenister',
-    'glimcher',
     'glimmerings',
-    'globex',
-    'gloop',
-    'glossaries',
-    'gloucesters',
-    'glow-worms',
-    'glp',
-    'gluckman',
-    'glynns',
-    'gms',
-    'gmt+1',
-    'go-as-you-please',
-    'goal-directed',
-    'goal-posts',
-    'gober',
-    'god-consciousness',
     'godfray',
-    'godric',
-    'godwit',
-    'goebel',
-    'goffmann',
-    'gold-coloured',
-    'goldman-fristoe',
-    'goldreyer',
-    'golliwog',
-    'gombosuren',
-    'gomer',
-    'gonville',
-    'good-luck',
-    'good-neighbourliness',
-    'goody-goody',
-    'gored',
     'gorer',
-    'gorleston',
-    'gormenghast',
-    'goscelin',
-    'gosford',
-    'goslar',
-    'gosney',
-    'gosplan',
-    'gosub',
-    'gothick',
-    'gotoh',
-    'goulden',
-    'gourock',
-    'goverment',
-    'government-to-government',
-    'gr-1',
     'grade/mixed',
-    'gramm-rudman',
-    'grandis',
-    'granuloma',
-    'granulomatous',
-    'grapo',
-    'grapples',
-    'grassroot',
-    'graticule',
-    'grave-clothes',
-    'gravedigger',
-    'gravelle',
-    'grazings',
-    'grb2',
-    'greavsie',
-    'greco-roman',
     'green-painted',
-    'greenford',
-    'greenlands',
-    'greenstead',
-    'greenstein',
-    'greimas',
-    'grewcock',
-    'grey-faced',
-    'grey-white',
-    'gricean',
-    'grigorovich',
-    'grindlewood',
-    'grisaille',
-    'groat',
-    'grog',
-    'grottos',
     'ground-water',
-    'groundcrew',
-    'grovey',
-    'grubbe',
-    'grubber',
-    'gsh',
-    'guadalcanal',
-    'guadalquivir',
-    'guadix',
-    'guaranty',
-    'gubby',
-    'guglielmo',
-    'guichet',
-    'guillem',
-    'guillotin',
-    'guinea-pigs',
     'guiseppe',
-    'gujerat',
-    'gules',
-    'gullane',
-    'gunson',
-    'gusher',
-    'gusset',
-    'guten',
-    'guttered',
-    'gweder',
-    'gybes',
-    'gynt',
-    'h&eacute;buterne',
-    'h.g.',
-    'h.h.',
-    'h.r.h',
     'h8',
-    'ha-ha',
-    'haberdasheri',
-    'habit-forming',
-    'habre',
-    'hackworth',
-    'hadi',
-    'haematoma',
-    'haemolytic',
-    'haf',
-    'hailer',
-    'haimet',
-    'haiphong',
-    'hair-rig',
-    'haitink',
-    'haketa',
     'halal',
-    'half-built',
-    'half-dressed',
-    'half-expecting',
-    'half-grown',
-    'half-length',
-    'half-mortals',
-    'half-page',
-    'halfback',
-    'halfords',
-    'hallgarth',
-    'hallward',
-    'hamadryas',
-    'hamblin',
-    'hamdi',
-    'hammerton',
     'hampel',
-    'hampshire-based',
-    'hamzah',
-    'hand-coloured',
-    'hand-to-mouth',
-    'hand-woven',
-    'hander',
-    'handier',
-    'handily',
-    'handmaidens',
-    'hangdog',
-    'hangmen',
-    'hanka',
-    'hankey',
-    'happen.',
-    'hard-and-fast',
     'hardware/software',
-    'hardyman',
-    'hargazy',
-    'hargeisa',
-    'harleian',
-    'harlots',
-    'harray',
-    'harrelson',
-    'harriett',
-    'harrows',
-    'harsnett',
-    'hartlib',
-    'harvie',
-    'hassler',
-    'hastens',
-    'hastie',
     'haswell',
-    'hatcheries',
-    'hauer',
-    'haugh',
-    'hauntings',
-    'haviland',
-    'haweswater',
-    'hawkish',
-    'hawkridge',
-    'haws',
-    'hay-making',
-    'haya',
-    'hayashi',
-    'hayloft',
-    'haymakers',
-    'hbig',
     'hcf',
-    'headpiece',
-    'headrest',
-    'headstocks',
-    'headtenant',
-    'headwall',
-    'hearken',
-    'hearses',
-    'heart-searching',
-    'heart-to-heart',
-    'heatproof',
-    'heavy-metal',
-    'hebe',
-    'hecht',
-    'hectically',
-    'hedgers',
     'hefner',
-    'heft',
-    'heg',
-    'heidensohn',
-    'heim',
-    'helico-g',
-    'heliotrope',
-    'helium-4',
-    'helleborus',
-    'henfaes',
-    'henkel',
-    'henze',
-    'hepatotoxicity',
-    'herbalism',
-    'herbes',
-    'hern&aacute;n',
     'herrington',
-    'hersey',
-    'herv&eacute',
-    'herve',
-    'hesitatingly',
-    'heterogenous',
-    'heuer',
-    'heuston',
-    'hewers',
-    'hewitson',
-    'heworth',
-    'hexagonale',
-    'hexamethonium',
-    'heyerdahl',
-    'hfc',
-    'hgv',
     'hh:mm',
-    'hib',
-    'hibernia',
-    'hickox',
-    'hide-out',
-    'high-calibre',
-    'high-intensity',
-    'high-latitude',
-    'high-performing',
-    'high-point',
-    'high-sounding',
-    'high-value',
-    'high-velocity',
-    'high-waisted',
-    'higher-paid',
-    'higher-rate',
     'highlighter',
-    'highly-regarded',
-    'hildegard',
-    'hildenbrand',
-    'hill-walkers',
-    'hill-wood',
-    'him-',
-    'himachal',
-    'hindemith',
-    'hindrances',
-    'hindustani',
-    'hingston',
-    'hip-flask',
-    'hirings',
-    'hirsute',
-    'historiae',
     'hitmen',
-    'hla-a2',
-    'hlothhere',
-    'hmg-box',
-    'hnc/hnd',
-    'hoaxes',
-    'hobby-horse',
-    'hobgoblin',
-    'hobsons',
-    'hoff',
-    'hoffnung',
-    'hofland',
-    'hogwood',
-    'hokum',
-    'holbeck',
-    'holdgate',
     'hole-in-the-wall',
-    'holidayed',
-    'hollandaise',
-    'hollings',
-    'hollowing',
-    'hollway',
-    'home-ownership',
-    'homeboys',
-    'homeostatic',
-    'homesite',
-    'homographs',
-    'homonym',
-    'honasan',
-    'honoraria',
-    'hoo-ha',
-    'hoofed',
     'hoopla',
-    'hoovers',
-    'horlicks',
-    'horobin',
-    'hors_d\'oeuvre',
-    'horseflesh',
-    'horsetail',
-    'horsetails',
-    'horsfield',
-    'horticulturist',
-    'horvath',
-    'horwath',
-    'horwood',
-    'hospitably',
-    'hot-pot',
-    'hot-shot',
     'hotplates',
-    'houngan',
-    'hour-glass',
-    'hous',
-    'house-hunting',
-    'house-proud',
-    'houseroom',
-    'hoverspeeder',
-    'howitt',
-    'hoxton',
-    'hp/ux',
-    'hpf',
-    'hrad&ccaron;any',
-    'hrd',
-    'hrp',
-    'hsa',
     'hsdm',
-    'hsien',
-    'hss',
-    'hte',
-    'hulten',
-    'humana',
-    'humbleton',
-    'humiliatingly',
-    'hummock',
-    'hummocky',
-    'humor',
-    'humourous',
-    'humperdinck',
-    'hunan',
-    'hunkered',
-    'hunsbury',
     'huntercombe',
-    'hunterian',
-    'hunwick',
-    'hurdlers',
-    'hurtles',
-    'hushing',
-    'hussite',
-    'hutchence',
-    'hwan',
-    'hy',
-    'hydarnes',
-    'hydrant',
-    'hydrocephalus',
-    'hydrocortisone',
-    'hydrodynamic',
-    'hydrogenation',
     'hygeberht',
-    'hyperdocument',
-    'hyperventilating',
-    'hyphae',
-    'hypnotherapists',
-    'i/view',
-    'i1',
-    'iamcr',
-    'ibex',
-    'ibises',
-    'ibo',
-    'ice-cool',
-    'ice-house',
-    'icebreaker',
-    'icelanders',
-    'iconoclasts',
     'icus',
-    'idealisation',
-    'ids',
-    'idyllically',
-    'ifas',
-    'ignaz',
-    'iic',
-    'ika',
-    'il-6dbp',
-    'il-6dbp/nf-il6',
-    'ilay',
-    'illus.1',
-    'image-building',
-    'imageworks',
-    'immunising',
-    'immunoblot',
     'immunocompetent',
-    'immunocompromised',
-    'immunocytochemical',
-    'impactor',
-    'impala',
-    'impale',
-    'impel',
-    'impels',
-    'impetigo',
-    'impiety',
-    'imploded',
-    'impound',
-    'imprecisely',
-    'imprest',
-    'improvisational',
-    'impugn',
     'impulsion',
-    'imrie',
-    'in-jokes',
-    'in-migrants',
-    'in-rack',
-    'inaugurates',
-    'inauthentic',
-    'incinerate',
-    'income-earning',
-    'incompatibles',
-    'inconceivably',
-    'inconcert',
-    'incrimination',
-    'incubations',
-    'indemnitee',
-    'indenting',
     'indict',
-    'indisposition',
-    'individuate',
-    'individuated',
-    'individuating',
-    'indoctrinate',
-    'inductions',
-    'inefficacy',
-    'ineluctably',
-    'inexpensively',
-    'infact',
-    'infest',
-    'infirmaries',
-    'inflammations',
-    'inflation-unemployment',
-    'inflexibly',
     'inflexions',
-    'informalisation',
-    'information-retrieval',
-    'infoworld',
-    'ingvar',
-    'inhere',
-    'inheres',
-    'inhibitor-1',
-    'inhumations',
-    'inkjets',
-    'innominate',
-    'inrush',
-    'insensitively',
-    'insignificantly',
-    'insincerely',
-    'insofar',
     'institutionalizing',
-    'instrumentality',
-    'insurability',
-    'intellidraw',
-    'inter-birth',
-    'inter-professional',
-    'intercalated',
-    'interconnectedness',
-    'interferences',
-    'interferometers',
-    'interjects',
-    'interlocks',
-    'intermedia',
-    'intermingle',
-    'interministerial',
-    'internalise',
     'internalizing',
-    'internationalised',
-    'internationality',
-    'interpellation',
-    'interposition',
-    'interruptus',
-    'interspray',
-    'intersubjective',
-    'interweave',
-    'intonations',
-    'intra-arterial',
-    'intra-party',
-    'intra-regional',
-    'intra-uterine',
-    'intracolonic',
-    'intradermal',
     'intramolecular',
-    'intrapartum',
-    'intrinsics',
-    'inventoried',
-    'inver',
-    'inverness-shire',
-    'inverurie',
-    'invincibility',
-    'invisibles',
-    'iommi',
-    'iosco',
-    'iou',
-    'ipal',
-    'ipos',
-    'iranian-backed',
-    'irf-1',
     'irish-born',
-    'iron-rich',
-    'ironclaw',
-    'ironing-board',
-    'irrelevancy',
-    'irreproachable',
-    'irresolution',
-    'irwell',
-    'is902-pcr',
-    'iscariot',
-    'ismailis',
-    'isola',
-    'isothiocyanate',
-    'issarapong',
-    'isvik',
-    'it.',
     'italicized',
-    'ited',
-    'itemising',
-    'ivars',
-    'ivaz',
-    'ivies',
-    'ivy-clad',
-    'ixmaritian',
-    'izmir',
-    'jacanas',
-    'jackboots',
-    'jacobins',
-    'jading',
-    'jaggard',
-    'jahanara',
-    'jai',
     'jamaat-i-islami',
-    'jamaican-born',
-    'jarama',
-    'jasim',
-    'javan',
-    'jawed',
-    'jaye',
-    'jean-fran&ccedil;ois',
-    'jeannine',
-    'jed-forest',
-    'jedi',
-    'jenking',
-    'jephson',
-    'jesters',
-    'jeszenszky',
-    'jetstream',
     'jeunesse',
-    'jevons',
-    'jewel-like',
-    'jewell',
-    'jeyes',
-    'jiahua',
-    'jiggered',
-    'jiggery-pokery',
-    'jingled',
-    'jinked',
-    'joaquin',
-    'job-creation',
-    'joblessness',
-    'joc',
-    'jockstrap',
-    'joffe',
     'joh',
-    'johnes',
-    'johnrose',
-    'jolosa',
-    'jools',
-    'jose-based',
-    'josias',
-    'jotter',
-    'joules',
-    'joy-riding',
-    'jtp',
-    'jubert',
-    'jubilees',
-    'juggles',
-    'jugoslav',
-    'july-september',
     'july/august',
-    'juncus',
-    'junius',
-    'junked',
-    'k-series',
-    'kaczynski',
-    'kadanwari',
-    'kadar',
-    'kaffir',
-    'kaftans',
-    'kahler',
-    'kal',
-    'kalkadoon',
-    'kallias',
-    'kamiz',
-    'kampf',
     'kanchenjunga',
-    'kapoor',
-    'karaso',
-    'karia',
-    'karkason',
-    'karlheinz',
-    'karloff',
-    'karno',
-    'karnstein',
-    'karoo',
-    'kashan',
-    'kasper',
-    'kaszubian',
-    'katyn',
-    'kayapo',
-    'kazakhs',
     'kazi',
-    'kbp',
-    'kcal/mol',
-    'keady',
-    'keanu',
-    'keays',
-    'kef',
-    'kegworth',
-    'kelham',
-    'kelloggs',
-    'kenmore',
-    'kennebunkport',
-    'kenyapithecus',
-    'keogh',
-    'kesh',
-    'kesselring',
     'keyser',
-    'khalq',
-    'kiam',
-    'kiawah',
-    'kibbles',
-    'kibbutzim',
-    'kidman',
-    'kilarrow',
-    'kilcharran',
-    'kildaltan',
-    'killen',
-    'killerton',
-    'kilmore',
-    'kilobytes',
-    'kilroy-silk',
-    'kimmins',
     'kingsbridge',
-    'kingsbrook',
-    'kingsbury',
-    'kingshams',
-    'kingston-upon-thames',
-    'kinking',
-    'kintail',
-    'kirkintilloch',
-    'kisangani',
-    'kishinev',
-    'kissimmee',
-    'kith',
-    'kkr',
-    'klaxons',
-    'klugman',
-    'kmart',
     'knackers',
-    'knicker',
-    'knickerbocker',
-    'knightshayes',
-    'knitradar',
-    'knower',
-    'koevoet',
-    'koffi',
-    'kohler',
-    'kolbe',
-    'koloto',
-    'koninklijke',
-    'konstanz',
-    'koogan',
-    'kooky',
-    'kouklia',
     'kounellis',
-    'kovacs',
-    'kox19',
-    'kox31',
-    'kraut',
-    'kravchenko',
-    'kreitman',
-    'kriel',
-    'kripke',
-    'krishchaty',
-    'kronstadt',
-    'krox-20',
-    'kth',
-    'kudu',
-    'kuehler',
-    'kunsthistorisches',
     'kurecolor',
-    'kuron',
-    'kvaerner',
-    'kwanza',
-    'kyr',
-    'l\'escargot',
-    'l\'estaque',
-    'l\'europe',
-    'l-',
-    'l-name',
-    'l.q.r.',
-    'l/min',
-    'l9th',
-    'labour-led',
-    'labour-management',
-    'lace-trimmed',
     'lacerating',
-    'lachaise',
-    'lacock',
-    'lactase',
-    'laczko',
-    'ladakh',
-    'ladas',
-    'ladhar',
-    'laetoli',
-    'laevis',
-    'lafaille',
-    'lafferty/cheltenham',
-    'lafontant',
-    'laggard',
-    'lagoonal',
-    'lagrange',
     'lakewood',
-    'lamaur',
-    'lambada',
-    'lambasting',
-    'lampi',
-    'lanceolate',
-    'land-drainage',
-    'land-owners',
-    'land-rovers',
-    'land-take',
-    'langmuir',
-    'lanoptics',
-    'lansdown',
-    'lansing',
-    'lanskoi',
-    'laoghaire',
     'lapidary',
-    'largest-ever',
-    'larisa',
-    'larmes',
-    'late-glacial',
-    'late-medieval',
-    'latina',
-    'latium',
-    'latterday',
-    'latticework',
-    'laudatory',
-    'laue',
-    'laughin\'',
-    'laughing-stock',
-    'laure',
-    'laurent-perrier',
     'lauriston',
-    'lavishness',
-    'law-makers',
-    'lawgiver',
-    'lawlike',
-    'lawmaking',
-    'lawther',
-    'lay-bys',
-    'lcr',
-    'lead-in',
-    'lead-lined',
-    'leadbitter',
-    'leaderboard',
-    'leading-edge',
-    'leaf-stalks',
-    'leake',
     'leap-frog',
-    'leastways',
-    'leatherette',
-    'lebensraum',
-    'lecky',
-    'leclair',
-    'lecterns',
-    'lectureships',
-    'leda',
-    'ledeen',
-    'leers',
-    'left-armer',
-    'left-inclined',
-    'legoland',
-    'legume',
-    'legwork',
     'lehar',
-    'leibnitz',
-    'leishman',
-    'leitrim',
-    'lejeune',
-    'lely',
-    'lemington',
-    'lemke',
-    'lengai',
-    'lepage',
-    'lermontov',
-    'let-out',
-    'letterheads',
-    'lettin\'',
-    'lettre',
-    'leva',
     'levadas',
-    'levee',
-    'levees',
-    'lexie',
-    'lexus',
-    'lgv',
-    'liane',
-    'liawski',
-    'libation',
-    'libations',
-    'liberal-democracy',
-    'libertarianism',
-    'liberton',
-    'libitum',
-    'libretti',
-    'lidocaine',
     'liebig',
-    'lieut',
-    'lieutenancy',
-    'life-affirming',
-    'life-jacket',
-    'life-like',
-    'life-story',
-    'lifebelt',
-    'lifebelts',
-    'lifespan&mdash;user/',
-    'ligatures',
-    'lightheaded',
-    'lightheartedly',
-    'lightnings',
-    'lightwater',
-    'lilas',
     'liliane',
-    'lilliputian',
-    'lilongwe',
-    'lindane',
-    'linder',
-    'lindford',
-    'lindo',
-    'line-by-line',
-    'linehan',
-    'lip-read',
-    'liposome',
-    'lipsticked',
-    'liquidise',
-    'lisieux',
-    'listowel',
-    'listric',
     'lit.',
-    'litanies',
-    'litchfield',
-    'literalism',
-    'lithely',
-    'littlest',
-    'litton',
-    'liveryman',
-    'living-rooms',
-    'lix',
-    'lkb',
-    'll.m.',
-    'llandinam',
-    'lliwedd',
-    'lloyd-webber',
-    'loamy',
     'loblaws',
-    'lobotomy',
-    'lochain',
-    'lochranza',
-    'lochside',
-    'locker-room',
-    'locksmiths',
-    'loddiges',
-    'loden',
-    'lodwick',
-    'log-jam',
-    'loganair',
-    'logbooks',
-    'logician',
-    'logix',
-    'logogens',
     'logue',
-    'lombardo',
-    'long-drawn',
-    'long-nosed',
-    'long-period',
-    'long-planned',
-    'long-sighted',
-    'longbenton',
-    'longdendale',
-    'longhi',
-    'longinus',
-    'longley',
-    'longstaff',
-    'longville',
-    'lonicera',
-    'loofah',
     'look-alikes',
-    'loquacity',
-    'lotze',
-    'loud-mouthed',
-    'lounge-bar',
-    'louvois',
-    'lovage',
-    'love-child',
-    'love-letters',
-    'loveday',
-    'lovegrove',
-    'low-angle',
-    'low-sugar',
-    'lower-cost',
-    'lower-ranking',
-    'lowest-cost',
     'lowliest',
-    'lowrie',
-    'lpf',
-    'lrc',
-    'lt-gen',
-    'lt.-gen.',
-    'ltq',
-    'lucchese',
-    'lullabies',
-    'lulls',
-    'lumbago',
-    'luminously',
-    'lumpish',
-    'lungful',
-    'lungu',
-    'lus',
     'luscombe',
-    'lusher',
-    'lushness',
-    'lustreless',
-    'lutea',
-    'lutenist',
-    'lutherans',
-    'luxuriate',
-    'lv',
-    'lw60',
-    'lydd',
-    'lye',
-    'lying-in',
-    'lymm',
-    'lynam',
-    'lynette',
     'lynwood',
-    'lysons',
-    'lyttle',
-    'm&aacute;rio',
-    'm-four',
-    'm.phil.',
-    'm/s',
-    'm12',
-    'm13mp18',
-    'm15',
-    'm74',
-    'maanen',
-    'maarten',
-    'maas',
-    'maasai',
-    'mabbott',
     'macarthy',
-    'maccabaeus',
-    'macconachie',
-    'maccormac',
-    'maces',
-    'machado',
-    'machel',
-    'machen',
-    'machine-made',
-    'machine-tool',
-    'mackendrick',
-    'mackinnons',
-    'macleay',
-    'maclure',
-    'macnicol',
-    'macquarie',
     'macrocosm',
-    'macushla',
-    'macweek',
-    'maddicott',
-    'magalluf',
-    'maginot',
-    'magnetization',
-    'magnetizations',
-    'magneto',
-    'mahesh',
-    'maid-of-all-work',
-    'maidenhair',
-    'maidservants',
-    'maier',
-    'maillotins',
-    'main-chain',
     'maingay',
-    'mairead',
-    'maj-gen',
-    'maj.-gen.',
-    'majoris',
-    'malahide',
-    'malarkey',
-    'malesia',
-    'malet',
-    'malfunctioned',
-    'malhotra',
-    'malle',
-    'malleability',
-    'mallee',
-    'mamet',
-    'mamluks',
     'mammary',
-    'mams',
-    'man-to-man',
-    'manaus',
-    'mandal',
-    'mandelbrot',
-    'mander',
-    'manette',
-    'manfro',
-    'mangling',
-    'mangon',
-    'manically',
-    'manichaean',
-    'manichean',
-    'manics',
-    'manicus',
     'manifolds',
-    'manjrekar',
-    'manmohan',
-    'mannar',
-    'manoir',
-    'manon',
-    'manos',
-    'mansbridge',
-    'mansiones',
-    'mantilla',
-    'manucci',
-    'manumission',
-    'manuring',
-    'map-reading',
-    'marble-floored',
-    'march/april',
     'margarines',
-    'margie',
-    'marginalise',
-    'marginalising',
-    'marguerita',
-    'mariage',
-    'marianella',
-    'maries',
-    'marika',
-    'marmosets',
-    'marmot',
-    'marsa',
-    'mart&iacute;n',
-    'martica',
-    'masers',
-    'masire',
     'masquerades',
-    'masseuse',
-    'massiter',
-    'massoud',
-    'masterclasses',
-    'masterfully',
-    'mat&eacute;riel',
-    'matagalpa',
-    'matai',
-    'matata',
-    'matchboard',
-    'matchboxes',
-    'maternalism',
-    'matin&eacute;es',
-    'matthau',
-    'mattock',
     'maturer',
-    'matzo',
-    'maui',
-    'maul&eacute;on',
-    'maunsell',
-    'maupassant',
-    'maurer',
-    'mavinga',
-    'mawgan',
-    'maws',
-    'maymyo',
-    'maysfield',
-    'mazarin',
-    'mazzini',
-    'mbes',
-    'mcafee',
     'mcaggott',
-    'mccallan',
-    'mccarty-cooper',
-    'mcdonagh',
-    'mceniff',
-    'mcfarland',
-    'mcgegan',
-    'mcgillivray',
-    'mcginn',
-    'mcginty',
-    'mcgourty',
-    'mcgrain',
-    'mcgraw-hill',
-    'mcgreevy',
-    'mckiernan',
-    'mckillen',
     'mclure',
-    'mcluskey',
-    'mcmurray',
-    'mcnamee',
-    'mcneilage',
-    'mcowan',
-    'mcps',
-    'mcquade',
-    'mda',
-    'mdd',
-    'mdr',
-    'mea_culpa',
-    'meadowlands',
-    'meadowsweet',
-    'meager',
-    'mean-spirited',
     'meaninglessly',
-    'meanly',
-    'measureless',
-    'meat-eaters',
-    'meatloaf',
-    'medially',
-    'mediastinal',
-    'mediatory',
-    'medico',
-    'medievalist',
-    'medline',
-    'meegan',
-    'meeting-house',
-    'megarian',
-    'megastore',
-    'megatapes',
     'megaton',
-    'megatons',
-    'meik',
-    'meks',
-    'mela',
-    'melancia',
-    'melanocytes',
-    'melchior',
-    'melges',
-    'melland',
-    'mellish',
-    'melodramas',
-    'menage',
-    'menaggio',
-    'mendacious',
-    'mendelson',
     'mender',
-    'mends',
-    'meninga',
-    'ment',
-    'meola',
-    'merchantman',
-    'meribel',
-    'merkut',
-    'merrin',
-    'merrington',
-    'mersenne',
-    'merstham',
-    'meshwork',
-    'mesmer',
-    'mesnil-sur-oger',
-    'messiness',
     'meston',
-    'metalworkers',
-    'metastable',
-    'methil',
-    'mezey',
-    'mhic',
-    'mhoira',
-    'miaows',
-    'michelham',
-    'michelson',
-    'micheu',
-    'micro-electronic',
-    'microcosmic',
-    'microfit',
-    'micrografx',
-    'microgrammes',
     'micrometer',
-    'microworm',
-    'mid-1850s',
-    'mid-1940s',
-    'mid-1987',
-    'mid-evening',
-    'mid-fourth',
-    'mid-hants',
-    'mid-month',
-    'mid-to-late',
-    'mid-twelfth',
-    'middle-classes',
-    'middle-range',
-    'middleclass',
-    'middleditch',
-    'middlesex-based',
     'midlands-based',
-    'midler',
-    'midnight-blue',
-    'mieux',
-    'migrans',
-    'milbank',
-    'milena',
-    'milhaez',
-    'milhaud',
-    'militarized',
-    'miliukov',
-    'milker',
-    'milkmaids',
-    'millerhill',
-    'millesimals',
-    'millings',
     'million-pound',
-    'millivolts',
-    'milt',
-    'mimd',
-    'mind-set',
-    'minesweeper',
-    'mini-boom',
-    'mini-dress',
-    'mini-lp',
-    'miniaturized',
-    'ministership',
-    'minpin',
-    'minty',
-    'miquel',
-    'mironov',
-    'mirthlessly',
     'mis-match',
-    'misadventures',
-    'misalignment',
-    'misanthropy',
-    'misapplication',
-    'mischance',
-    'misconstruction',
-    'misdiagnosed',
-    'misdiagnosis',
-    'miserere',
-    'missi',
-    'misty-eyed',
-    'mitac',
-    'mitchells',
-    'mitogen',
-    'mitt',
     'mitty',
-    'mk1',
-    'mkhedrioni',
-    'mlle',
-    'moaouia',
-    'mobilises',
-    'moccasins',
-    'mock-tudor',
-    'modifiable',
-    'modification-records-are',
-    'mogadon',
-    'moire',
-    'mokosh',
-    'mol-1',
-    'molester',
-    'molesworths',
     'moliere',
-    'momlv',
-    'monad',
-    'monarchic',
-    'money-spinner',
-    'moneymen',
-    'mongrels',
-    'moniker',
-    'moniz',
-    'monkish',
-    'monoamine',
-    'monomeric',
-    'monopolization',
-    'monsanto',
-    'montages',
-    'montedison',
     'monteiro',
-    'mooing',
-    'mooty',
-    'morb',
-    'morisot',
-    'morozov',
-    'morozova',
-    'morrice',
-    'morten',
-    'mortises',
-    'moscow-based',
-    'mosedale',
-    'mosher',
-    'mosimann',
-    'mosstroopers',
-    'motherfucker',
     'motor-cycles',
-    'motorboats',
-    'mottoes',
-    'moue',
-    'mountsorrel',
-    'mouses',
-    'mouth-to-mouth',
-    'mouthy',
-    'moyola',
-    'mp-1',
-    'mp/home',
-    'mp/shadow',
-    'mpe/ix',
-    'mpo',
-    'mpower',
-    'msc/diploma',
     'msd',
-    'msp',
-    'mucker',
-    'mudd',
-    'muffet',
-    'muker',
-    'mulchrone',
-    'mulgrave',
-    'mulhouse',
-    'mulier',
-    'mullingar',
-    'mullings',
-    'multi-billion',
-    'multi-divisional',
-    'multi-form',
-    'multi-million-dollar',
     'multi-modal',
-    'multi-point',
-    'multi-site',
-    'multi-stage',
-    'multi-way',
-    'multidivisional',
-    'multiflow',
-    'multiload',
-    'multipointed',
-    'multivendor',
-    'mum-to-be',
-    'mumbo',
-    'mummers',
-    'mummification',
-    'mums-to-be',
-    'mumsy',
     'mumtaz',
-    'munchen',
-    'munding',
-    'munrow',
-    'munson',
-    'munteanu',
-    'muonic',
-    'murano',
-    'murchie',
-    'murrin',
-    'murry',
-    'musawi',
-    'muscularity',
-    'musos',
-    'mutagens',
-    'mutinied',
     'muy',
-    'mxenge',
-    'myeloid',
-    'mynne',
-    'myoglobin',
-    'n&aacute;m&ecaron;st&iacute',
-    'n-acetyl-5asa',
-    'n.d.',
-    'n.h.',
-    'n/a',
-    'n=12',
-    'n=9',
-    'nabbach',
-    'nach',
-    'nada',
-    'nahaman',
     'nai',
-    'nakedly',
-    'namby-pamby',
-    'nameplates',
-    'napa',
-    'naqvi',
-    'narayan',
-    'narborough',
-    'narked',
-    'narok',
-    'narratology',
-    'narratorial',
-    'narrow-eyed',
-    'narvik',
-    'nas&amp;fu',
-    'natch',
     'nationalgalerie',
-    'natro',
-    'naturals',
-    'naturel',
-    'naturist',
-    'naver',
-    'ncdl',
-    'ncoap',
-    'ncp7:dna',
-    'nd1',
-    'ndah',
-    'neap',
-    'near-fatal',
-    'neasden',
-    'neaten',
-    'nebbins',
     'nebosh',
-    'nebuchadnezzar',
-    'nechaev',
-    'necromancers',
-    'nectarine',
-    'nedc',
-    'neighborhood',
-    'neild',
-    'nematodirus',
-    'neo-fordism',
-    'neo-gaullist',
-    'neo-romantic',
-    'neotropical',
-    'nepmen',
-    'nesselrode',
-    'nestorian',
     'nestorius',
-    'netters',
-    'network-based',
-    'neurogenic',
-    'neurologists',
-    'neuroscientists',
-    'neustria',
-    'nevinson',
-    'newbon',
-    'newland',
-    'newly-acquired',
-    'newly-born',
-    'newly-wed',
-    'nezzar',
-    'nfis',
-    'ng/&micro;l',
     'ng/l',
-    'nhmf',
-    'nicolle',
-    'nicos',
-    'nicotinic',
-    'nida',
-    'nidderdale',
-    'niel',
-    'nif',
-    'nightspot',
-    'niko',
-    'nikonos',
-    'niles',
-    'nim',
-    'nimmo',
-    'nine-point',
     'nip.bsa',
-    'nisbi',
-    'nitrogen-fixing',
-    'nitroglycerine',
-    'nive',
-    'niyogi',
-    'nklp',
-    'nlj',
-    'no-ball',
-    'no-boundary',
-    'no-fault',
-    'no-holds-barred',
-    'noam',
-    'noblenet',
-    'noblesse',
-    'noblesse_oblige',
     'nock',
-    'node-link-node',
-    'nodosa',
-    'noe',
-    'noire',
-    'noli',
-    'noll',
-    'nominalism',
-    'non-addictive',
-    'non-adherent',
-    'non-biological',
-    'non-co-operation',
-    'non-communicable',
-    'non-communists',
-    'non-conforming',
-    'non-contentious',
     'non-convertible',
-    'non-crystallographic',
-    'non-essentials',
-    'non-event',
-    'non-experts',
-    'non-familial',
-    'non-farm',
-    'non-fictional',
-    'non-food',
-    'non-functional',
-    'non-genetic',
-    'non-greasy',
-    'non-instrumental',
-    'non-lawyers',
-    'non-literal',
-    'non-marine',
     'non-national',
-    'non-objective',
-    'non-opec',
-    'non-operational',
-    'non-operative',
-    'non-organic',
-    'non-participant',
-    'non-producers',
-    'non-random',
-    'non-reciprocal',
-    'non-recognition',
-    'non-russians',
-    'non-sailors',
-    'non-science',
-    'non-scientists',
-    'non-soviet',
     'non-structural',
-    'non-taxpayer',
-    'non-unix',
-    'non-verbally',
-    'non-wage',
-    'nonce',
-    'noninverting',
-    'nonjurors',
-    'nonnie',
-    'nonya',
-    'noonan',
-    'noor',
-    'normale',
-    'normoglycaemic',
-    'northend',
-    'norton/oxfordshire',
     'nose-up',
-    'nose-wheel',
-    'nosebleeds',
-    'nosodes',
-    'nostic',
-    'nostradamus',
-    'nostrums',
-    'notice-board',
-    'nougat',
-    'november/december',
-    'noyce',
-    'npka',
-    'npkc',
-    'npvs',
-    'nucleons',
-    'number-crunching',
     'numerics',
-    'numerology',
-    'numinous',
-    'nunneries',
-    'nuno',
-    'nunzia',
-    'nuptials',
-    'nursemaids',
-    'nurtures',
-    'nutley',
-    'nux',
-    'nw6',
-    'nyasaland',
-    'nymphomaniac',
-    'nystagmus',
-    'o\'briens',
     'o\'connor-crowley',
-    'o\'donoghue',
-    'o\'harte',
-    'o\'higgins',
-    'o\'riordan',
-    'o.g.',
-    'oadby',
-    'oaky',
-    'obando',
-    'obbligato',
-    'oberst',
-    'object-relations',
-    'objectify',
-    'objectivity/db',
-    'obstructionism',
-    'occhetto',
     'oche',
-    'ock',
-    'october/november',
-    'oddy',
-    'oesophagogastric',
-    'off-broadway',
-    'off-the-ball',
-    'off-the-wall',
-    'offaly',
-    'offertory',
-    'offhandedly',
-    'office-block',
-    'official-looking',
-    'offpiste',
-    'oft-quoted',
-    'ogaden',
     'oib',
-    'oilers',
-    'ojomoh',
-    'okhotsk',
-    'olave',
-    'olbia',
-    'old-guard',
-    'oligomer',
-    'olins',
-    'olof',
-    'ombo',
-    'omnia',
-    'omnipoint',
-    'omnium',
-    'omo',
-    'on-the-road',
     'onc+',
-    'ondine',
-    'one-mile',
-    'one-nation',
-    'one-roomed',
-    'one-step',
-    'one-stroke',
-    'one-syllable',
-    'onomatopoeia',
-    'ooooh',
-    'op.amp',
-    'opalescent',
-    'ope',
-    'openodb',
-    'openwindows',
-    'operable',
     'operettas',
-    'ophiolebes',
-    'ophiopristis',
-    'opossum',
-    'oracy',
-    'orangerie',
-    'orbis',
-    'orchy',
-    'orde',
-    'ordinary-looking',
-    'orefield',
-    'organometallic',
-    'origo',
-    'orleton',
-    'orvieto',
-    'os/',
     'osbald',
-    'oscli',
-    'oslear',
-    'osteonecrosis',
-    'osteopaths',
-    'ostertagi',
-    'ostrogothic',
-    'otteri',
-    'ousmane',
-    'out-going',
-    'out-manoeuvred',
-    'out-of-favour',
-    'out-perform',
-    'outage',
-    'outcropping',
-    'outflanking',
     'outflung',
-    'outlier',
-    'outmigration',
-    'outplacement',
-    'outrider',
-    'outspokenly',
-    'outweighing',
-    'outwitting',
-    'oven-ready',
-    'over-40s',
-    'over-active',
-    'over-crowded',
-    'over-developed',
-    'over-exposed',
-    'over-mighty',
-    'over-provision',
     'over-ridden',
-    'over-simple',
-    'overbooking',
-    'overborne',
-    'overcharge',
-    'overdraw',
-    'overdriven',
-    'overestimates',
-    'overflying',
-    'overfull',
-    'overfunding',
-    'overhears',
-    'overlooker',
-    'overmantel',
-    'overreaction',
-    'oversights',
     'overstepping',
-    'overstretch',
-    'overthrust',
-    'overused',
-    'ovina',
-    'ovno',
-    'own-brand',
-    'owner-occupancy',
-    'oxbury',
-    'oxidant',
-    'oxygens',
-    'oxytocin',
-    'oye',
-    'ozone-destroying',
-    'p&acirc;t&eacute;s',
-    'p&acirc;tisserie',
     'p&ndash;40s',
-    'p+p',
-    'p-',
-    'p-51',
-    'p.21',
-    'p.9',
-    'p.e.',
-    'p.l.c',
-    'p.o',
-    'p21',
-    'p8',
-    'p=ns',
-    'paasche',
-    'pacheco',
-    'pacifying',
-    'pacis',
     'packford',
-    'packwood',
-    'paclitaxel',
-    'page-boy',
-    'pagination',
-    'pai',
-    'paigc',
-    'paix',
-    'pajot',
-    'pale-green',
-    'palliser',
-    'palls',
-    'palm-fringed',
-    'palmitic',
-    'palomino',
-    'pamphilus',
     'panaceas',
-    'pancho',
-    'pandarus',
-    'panellist',
-    'panhellenic',
-    'pantries',
-    'papas',
-    'papaver',
-    'paperclips',
-    'parafoil',
-    'paraglider',
-    'paramaribo',
-    'paranoiac',
-    'paraquat',
-    'parasitised',
-    'paratenic',
     'parent(s)',
-    'parkwood',
-    'parmedes',
-    'parmigianino',
-    'parretti',
-    'part-way',
-    'partic',
-    'partners.',
-    'party-goer',
-    'passably',
-    'passacaglia',
-    'paste-up',
-    'pasteboard',
-    'pastel-coloured',
-    'pasternak',
-    'pasterns',
     'patchett',
-    'paten',
-    'pathogenicity',
-    'pathworks',
-    'patinkin',
-    'patras',
-    'patties',
-    'pauperism',
-    'pavitt',
-    'pavlovna',
-    'pavord',
-    'paying-in',
-    'payphone',
-    'payroll/personnel',
-    'pbi',
-    'pdm',
     'peak-time',
-    'pearn',
-    'pechman',
-    'pectin',
-    'pediatric',
-    'pedrosa',
-    'peduncle',
-    'pegler',
-    'pell-mell',
-    'pelly',
-    'pelota',
-    'peltae',
-    'pember',
-    'pembury',
-    'pen-pal',
-    'penck',
     'pendentive',
-    'pendulous',
-    'penn\'orth',
-    'penna',
-    'pennywell',
-    'pennyworth',
-    'penpoint',
-    'pensby',
-    'pentagram',
-    'pentathlon',
-    'percolating',
-    'perdu',
-    'perfections',
-    'perfective',
-    'peridotite',
-    'peripherality',
     'permute',
-    'perpendicularly',
-    'perpetration',
-    'perryman',
-    'persinger',
-    'personas',
-    'personifications',
-    'perspicacious',
-    'perspicacity',
-    'perverting',
-    'pescara',
-    'peterloo',
-    'petites',
-    'petro-dollar',
-    'petrovsky',
-    'petunia',
     'pf1/&lt;down',
-    'ph8.0',
-    'phalanges',
-    'phalangists',
-    'pharmacologist',
-    'phasic',
-    'phcns',
-    'philanderer',
-    'philipp',
-    'phillario',
-    'philosophie',
-    'philosophising',
-    'phivcg9.9',
-    'pho',
-    'phone-box',
-    'phos',
     'phosphatidylserine',
-    'phosphorylate',
-    'phosphorylcholine',
-    'photometric',
-    'photomultiplier',
-    'photoreceptors',
-    'phoune',
-    'phrenologists',
-    'piagetian',
-    'pianistic',
-    'pick-axe',
-    'picket-line',
-    'pickin',
-    'pict',
-    'piddle',
-    'pieda',
     'piedmontese',
-    'pietr',
-    'piffetti',
-    'pig-iron',
-    'pigeon-holed',
-    'pigeon-holes',
-    'pigeonhole',
-    'pilfered',
-    'pillar-box',
-    'piltdown',
-    'pin-down',
-    'pincushion',
-    'pindling',
-    'pink-cheeked',
-    'pintsch',
-    'pipetting',
     'pirie',
-    'piston-engined',
-    'pitch-dark',
-    'pitchforks',
-    'pitmen',
-    'pittman',
-    'plainchant',
-    'plaine',
-    'plasm',
-    'plasterers',
-    'plata',
-    'playtex',
-    'plebiscitary',
-    'pleck',
-    'pleonastic',
-    'plexuses',
     'plf',
-    'pliatzky',
-    'plugblock',
-    'pluggers',
-    'plumer',
-    'plummets',
-    'plumper',
-    'pneumocytes',
-    'pnm',
-    'pocketful',
-    'podmore',
-    'poidevin',
-    'poleward',
-    'polewards',
-    'police-officer',
-    'policymaking',
     'politesse',
-    'politest',
-    'politicoeconomic',
-    'polke',
-    'pollarded',
-    'pollok',
-    'polyacetylene',
-    'polyamide',
-    'polycentric',
-    'polycyclic',
-    'polygnotos',
-    'polymorphous',
-    'pomona',
-    'pompadour',
-    'ponchos',
-    'pontus',
     'poorhouse',
-    'poos',
-    'popinjays',
-    'popiolek',
-    'porkkala',
-    'pornographers',
-    'portend',
-    'porth',
-    'posession',
-    'poseur',
-    'post-artisanal',
-    'post-basic',
-    'post-conciliar',
-    'post-fordist',
-    'post-prandial',
-    'post-second',
     'post-soviet',
-    'post-thatcher',
-    'post-translational',
-    'postbus',
-    'poste',
-    'posteriorly',
-    'postpones',
-    'posturings',
-    'potamogeton',
-    'poteidan',
-    'potnia',
-    'potosi',
-    'potsdamer',
-    'pottage',
-    'pouch-seat',
-    'power-hungry',
     'powerserver',
-    'powerstation',
-    'pozzo',
-    'ppe',
-    'ppr',
-    'pr&eacute;cis',
-    'pr&eacute;ludes',
-    'pr&iacute;ncipe',
-    'pratap',
-    'pratley',
-    'prats',
-    'prayerfully',
-    'pre-eclampsia',
-    'pre-empts',
-    'pre-licentiate',
-    'pre-life',
     'pre-operatively',
-    'pre-payment',
-    'pre-qualifying',
-    'pre-registration',
-    'pre-s',
-    'pre-sentence',
-    'pre-specified',
-    'pre-wash',
-    'precipitously',
-    'preconscious',
-    'predynastic',
-    'preindustrial',
-    'premedication',
-    'preparasitic',
-    'prepayments',
-    'presaging',
     'preselected',
-    'pressman',
-    'pressurizing',
-    'priapic',
-    'price-earnings',
-    'priesthill',
-    'prieur',
-    'primiparous',
-    'primus_inter_pares',
-    'printmaker',
-    'prison-like',
-    'prize-winner',
-    'pro-abortion',
-    'pro-israeli',
-    'pro-noriega',
-    'proast',
     'probings',
-    'probs',
-    'procolipase',
-    'prodder',
-    'prodigality',
-    'product-container',
-    'proferens',
-    'proffers',
-    'profitless',
-    'project-based',
-    'project-related',
-    'proksch',
-    'prolifically',
-    'promiscuously',
-    'pronged',
-    'prophetically',
     'propidium',
-    'proprioceptive',
-    'proselytizing',
-    'prospekt',
-    'prostatectomy',
-    'prostatitis',
-    'prosthesis',
-    'protagon',
-    'protectionists',
-    'protein-rich',
-    'proteoglycans',
-    'proterozoic',
-    'proto',
-    'proto-oncogene',
-    'proto-oncogenes',
-    'protoplasm',
     'prouder',
-    'proven&ccedil;ale',
-    'provincialism',
-    'proviral',
-    'prowse',
-    'prurience',
-    'psdi',
-    'pse',
-    'pseudoaneurysm',
-    'pseudocyst',
-    'pseudocysts',
-    'psw',
-    'psycho-analysis',
-    'psychogeriatrician',
-    'ptr',
-    'public-spending',
     'public/private',
-    'publique',
-    'puckers',
-    'pudney',
-    'pudy',
-    'puffers',
-    'pukka',
-    'puller',
-    'pullmans',
-    'pulping',
-    'pulsatances',
-    'pulsate',
-    'pulse-rate',
-    'pump-action',
-    'puna',
-    'punchbag',
     'punctuating',
-    'pur&eacute;ed',
-    'puris',
-    'purkinje',
-    'purposefulness',
-    'purpura',
-    'purveying',
-    'push-bike',
-    'pushovers',
-    'pyatt',
-    'pyroxene',
-    'pyruvate',
-    'qajar',
-    'qcs',
-    'qemm',
-    'qom',
     'qr',
-    'qs',
-    'quad-fx',
-    'quadruped',
-    'qual',
-    'quantifies',
-    'quantitated',
-    'quarrie',
-    'queenside',
-    'queerly',
-    'quercy',
-    'querulously',
-    'quezon',
-    'quick-drying',
-    'quick-fire',
-    'quickfire',
     'quickies',
-    'quieted',
-    'quigleys',
-    'quincy',
-    'quinnell',
-    'quitted',
-    'quoth',
-    'quotidian',
-    'r&eacute;my',
-    'r-2',
-    'r-r',
-    'r.l.',
-    'r3000-based',
-    'racialized',
-    'radio-active',
-    'radio-controlled',
     'radio/cassette',
-    'radiogenic',
-    'radioimmunoassays',
-    'radiologically',
-    'rafelson',
-    'raffled',
-    'ragging',
-    'rags-to-riches',
-    'raiment',
-    'raitt',
-    'rajah',
-    'ralegh',
-    'ralembergs',
-    'ramachandran',
-    'ramesh',
-    'ramsdale',
     'rantings',
-    'raoc',
-    'raoult',
-    'rapperswil',
-    'rapunzel',
-    'rasher',
-    'rashidiyeh',
-    'rask',
-    'rat-1/c-myc-er',
-    'rat-infested',
-    'rat-race',
-    'rathcreedan',
-    'rattigan',
-    'rawhide',
-    'raxco',
-    'raynal',
     'rayo',
-    'raza',
-    'razak',
-    'rbai',
-    'rcs',
-    'rd.',
-    'rdpc',
-    're-analysis',
-    're-appraisal',
-    're-arrange',
-    're-definition',
-    're-directed',
-    're-do',
-    're-employed',
-    're-equip',
-    're-located',
     're-organization',
-    're-presented',
-    're-registered',
-    're-routing',
-    're-runs',
-    're-started',
-    're-take',
-    're-worked',
-    're-wrote',
-    'reabsorption',
-    'reagan-bush',
-    'reaggregate',
-    'reals',
-    'reappoint',
-    'reardon',
-    'reawaken',
     'recalculation',
-    'receipted',
-    'recession-proof',
-    'recheck',
-    'rechecked',
-    'recife',
-    'recirculation',
-    'recitations',
-    'reclusiarch',
-    'recognisers',
-    'recompile',
-    'reconnoitring',
-    'recoupable',
-    'recusant',
-    'red-legged',
-    'red-nosed',
     'redeveloping',
-    'rediscount',
-    'redoing',
-    'redshifts',
-    'reefing',
-    'reelection',
-    'reestablished',
-    'refillable',
-    'refoundation',
-    'refounded',
-    'refractor',
-    'refreshes',
-    'refrigerant',
-    'refutations',
-    'regia',
-    'regio',
     'region.',
-    'regolith',
-    'regrow',
-    'rei',
-    'reimpose',
-    'reimposition',
-    'reintegrated',
-    'rejuvenating',
-    'rekhi',
-    'relais',
-    'relaxant',
-    'relisting',
-    'rella',
-    'relocations',
-    'remington-hart',
-    'remission/mild',
     'remmed',
-    'remonstrance',
-    'remonstrating',
-    'remounted',
-    'remus',
-    'renationalisation',
-    'renaud',
-    'renn',
-    'renner',
-    'renounces',
-    'renters',
-    'repackaged',
-    'repairable',
-    'repertories',
-    'repos',
-    'repressively',
     'reprographic',
-    'requalification',
-    'reredos',
-    'reregulation',
-    'rescinding',
-    'resonated',
-    'respirations',
-    'responder',
-    'restarts',
-    'restructures',
-    'resubmit',
-    'retell',
-    'retested',
-    'retractions',
-    'retrench',
-    'retroactively',
     'retroperitoneal',
-    'retrospection',
-    'retrospectives',
-    'revascularisation',
-    'revile',
-    'revivalism',
-    'reynalde',
-    'reyntiens',
-    'rfsfr',
-    'rhematic',
-    'rheumy',
-    'rhizobium',
-    'rhonda',
-    'rhos-on-sea',
-    'ri1',
-    'richfield',
     'riflemen',
-    'right-sided',
-    'rightmost',
-    'rilke',
-    'rill',
-    'rimsky-korsakov',
-    'rinehart',
-    'ring-fence',
-    'ring-fenced',
-    'rishon',
-    'risk-neutral',
-    'risque',
-    'ristorante',
-    'ritblat',
-    'rivlin',
-    'rivonia',
     'rko',
-    'rme',
-    'rnvr',
-    'roache',
-    'roams',
-    'roberton',
-    'rockface',
-    'rocking-horse',
-    'rockville',
-    'rodie',
-    'roemer',
-    'rofe',
-    'rogachev',
-    'roith',
-    'romanticising',
-    'romanum',
     'romilly',
-    'rongji',
-    'ronnies',
-    'roo',
-    'roof-rack',
-    'rookies',
-    'rooming',
-    'root-and-branch',
-    'roscoff',
-    'rose-red',
-    'rosehaugh',
-    'rosenblum',
-    'rosier',
-    'roskilde',
-    'rossington',
-    'rostropovich',
     'rottenness',
-    'rotundifolia',
-    'roughing',
-    'roughland',
-    'roul&eacute',
-    'round-eyed',
-    'roussillon',
-    'rowbottom/reporting',
-    'rowdiness',
-    'rowthorn',
-    'roxburghe',
-    'roxburghshire',
-    'rozos',
-    'rps',
-    'rsg',
-    'rsvp',
     'rtd',
-    'rtv',
-    'rubber-soled',
-    'rubber-stamp',
-    'rubia',
-    'rubik',
-    'rubislaw',
-    'rudolfo',
-    'rugeley',
-    'rulership',
-    'rumps',
-    'run-ins',
-    'runnel',
-    'running-mate',
-    'runnings',
-    'runs=0:05',
     'rupp',
-    'rus',
-    'rushden',
-    'rushworth',
-    'russon/reporting',
-    'rust-coloured',
-    'rutger',
-    'rutli',
-    'ruxton',
-    'ryr',
-    'ryutaro',
-    's&amp;l',
-    's&amp;n',
-    's&igrave',
-    's\'',
-    's-100',
     's.16',
-    's.9(1)',
-    's.cerevisiae',
-    's14(3)',
-    's3(2)',
-    's31',
-    's4(1)',
-    's663',
-    'sabra',
-    'saccharomyces',
-    'sackville-west',
-    'sacriston',
-    'sadists',
-    'sadleir',
-    'sadnesses',
-    'sadruddin',
     'safflower',
-    'safra',
-    'saggy',
-    'saint-savin',
-    'sainted',
-    'sakti',
-    'salcombe',
-    'salicylates',
-    'saloon-bar',
-    'salopettes',
-    'salsa',
-    'salting',
-    'salvages',
-    'salvesen',
-    'salviati',
-    'saman',
     'samaranch',
-    'san\'aa',
-    'sanatogen',
-    'sanchez-vicario',
-    'sancti',
-    'sand-eels',
-    'sandcastles',
-    'sanderling',
-    'sandhills',
-    'sandoz',
-    'sanitized',
-    'sankara',
-    'saracenic',
-    'saran',
-    'sarandon',
-    'sarcoid',
     'sarcophagi',
-    'saro',
-    'sarongs',
-    'satis',
-    'sattar',
-    'satya',
-    'sauguet',
-    'saunby',
-    'sawbridgeworth',
-    'saxby',
-    'scabrous',
-    'scalars',
-    'scampton',
-    'scandalously',
-    'scannell',
-    'scape',
     'scarab',
-    'scarecrows',
-    'scarface',
-    'scarrott',
-    'scatological',
-    'scb',
-    'sccc',
-    'schadenfreude',
-    'schists',
-    'schlick',
-    'schmaltz',
-    'schmid',
-    'schon',
-    'schonfeld',
-    'schools/industry',
-    'schoolyard',
     'schoon',
-    'schuller',
-    'schutzkorps',
-    'scintigraphic',
-    'scoffs',
-    'scoresheet',
-    'scoria',
-    'scotcat',
-    'scott-scobie',
-    'scottish-based',
-    'scourging',
-    'scowls',
-    'scram',
-    'scrawling',
-    'scrc',
-    'screed',
     'screwtape',
-    'scribblings',
-    'scriptorium',
-    'scriven',
-    'scuff',
-    'sculleries',
-    'sculptress',
-    'scuti',
-    'sea-blue',
-    'seacoast',
-    'sealey',
-    'seamier',
-    'seances',
-    'seaplanes',
-    'seathwaite',
-    'seceding',
     'secessionists',
-    'second-guess',
-    'secretariats',
-    'secretin',
-    'secretively',
-    'secretiveness',
-    'secs.',
-    'sectioning',
-    'secularised',
-    'secularized',
-    'sedimentologists',
-    'seductions',
-    'seedings',
-    'seethe',
-    'segmentations',
-    'seidel',
     'seiters',
-    'selected-issue',
-    'seleucid',
-    'self-actualization',
-    'self-advancement',
-    'self-centredness',
-    'self-deceiving',
-    'self-images',
-    'self-massage',
-    'self-motivation',
-    'self-perception',
-    'self-scrutiny',
-    'self-sealing',
-    'self-will',
-    'self-willed',
-    'sellotaped',
     'semangat',
-    'semenov',
-    'semi-colon',
-    'semi-conductors',
-    'semi-double',
-    'semi-naked',
-    'semi-nomadic',
-    'semi-precious',
-    'semi-tropical',
-    'sena',
-    'sendings',
-    'senghor',
-    'senta',
-    'sentience',
-    'separators',
-    'sephardic',
     'sepharose',
-    'sepp',
-    'septuagint',
-    'sequenase',
-    'sequencers',
-    'sequin',
-    'serbians',
-    'serevi',
-    'serjeant-at-arms',
-    'serrigny',
-    'servette',
-    'service-sector',
-    'seselj',
-    'set-backs',
-    'settle-carlisle',
-    'seven-hour',
     'seven-minute',
-    'seven-strong',
-    'severity=warning',
-    'sex-starved',
-    'sfp',
-    'shad',
-    'shadings',
-    'shakin\'',
-    'shalev',
-    'shame-faced',
-    'shandong',
-    'shankhill',
-    'shapechangers',
-    'she-wolf',
-    'sheathing',
-    'shehu',
     'sheldonian',
-    'sheldrick',
-    'shem',
-    'shenfield',
-    'sheng',
-    'sheppards',
-    'shetlander',
-    'shewn',
-    'shhd',
-    'shiatsu',
-    'shibboleths',
-    'shik',
-    'shindig',
-    'shintaro',
-    'shiplake',
-    'shipquay',
     'shoa',
-    'shoeless',
-    'shoemaking',
-    'shooing',
-    'shoot-\'em-up',
-    'shootout',
-    'shorewards',
-    'short-horned',
-    'short-pitched',
-    'short-tailed',
-    'shorty',
-    'shot-gun',
-    'shottermill',
-    'shoulder-width',
-    'shoves',
-    'show-jumping',
     'showa',
-    'showcasing',
-    'shrewder',
-    'shucksmith',
-    'shukla',
-    'shunner',
-    'shur',
-    'shushed',
-    'shuttlecock',
-    'sickens',
-    'sickling',
-    'sicknesses',
-    'sid-ahmed',
-    'sidcombe',
-    'siddhi',
-    'siddons',
     'side-chain',
-    'side-on',
-    'side-slip',
-    'sidesteps',
-    'sidt',
-    'sieg',
-    'signaller',
-    'sihanoukist',
-    'sikhism',
-    'silcaster',
-    'silencers',
-    'silkin',
-    'sim&oacute;n',
-    'simex',
-    'simnel',
-    'simonides',
     'simonsen',
-    'simper',
-    'sines',
-    'sing-a-long',
-    'singe',
-    'singer/songwriter',
-    'singin\'',
-    'single-',
-    'single-employer',
-    'single-stack',
-    'single-stranded',
-    'sipaseuth',
-    'siphons',
-    'sirnak',
-    'sissinghurst',
-    'situating',
     'situationism',
-    'siwa',
-    'six-storey',
-    'sixpences',
-    'sizzler',
-    'skat',
-    'skeet',
-    'skeptical',
-    'skinningrove',
-    'skippering',
-    'skittled',
-    'skulked',
-    'skywalk',
-    'slandered',
-    'slandering',
-    'slapdash',
     'slash-and-burn',
-    'slave-owners',
-    'slee',
-    'sleekly',
-    'sleep-deprived',
-    'sleetburn',
-    'sleeving',
-    'slewing',
-    'slf',
-    'slfp',
-    'slide-rules',
-    'slimmed-down',
-    'slip-ons',
-    'slip-ups',
-    'sliphouse',
-    'slipstitch',
     'slithery',
-    'slobin',
-    'sloe',
-    'slogged',
-    'slow-witted',
-    'small-animal',
-    'small-arms',
-    'smartened',
-    'smelted',
-    'smiler',
-    'smirks',
-    'smirnov',
-    'smithing',
-    'smoke-blackened',
-    'smudging',
-    'snakebite',
     'snakehead',
-    'sneeringly',
-    'snelders',
-    'snetterton',
-    'sniffle',
-    'snoopers',
-    'soapstone',
-    'socialistic',
-    'sociopolitical',
-    'soes',
-    'softly-softly',
-    'soir&eacute;e',
-    'sok',
-    'solingen',
-    'solitudes',
-    'soll',
     'solomos',
-    'solutes',
-    'somare',
-    'somerton',
-    'sommelier',
-    'sommer',
-    'songbird',
-    'songbook',
-    'sophisticates',
-    'sorrell',
-    'sortes',
-    'sou\'wester',
-    'soubriquet',
-    'souhais',
-    'soulfully',
-    'soulmate',
     'sound-change',
-    'soundboard',
-    'soup&ccedil;on',
-    'soutane',
-    'south-east-facing',
-    'southdown',
-    'sox',
-    'spaarndam',
-    'space-based',
-    'spacebar',
-    'spacial',
-    'spanked',
-    'sparcclassic',
-    'sparcworks',
-    'spare-time',
-    'sparser',
     'spartiates',
-    'spc',
-    'spectatorship',
-    'spectrophotometry',
-    'speechlessly',
-    'spellchecker',
-    'spheris',
-    'sphygmomanometer',
-    'sphynx',
-    'spikey',
-    'spiller',
-    'spinelet',
-    'spinnakers',
-    'spitz',
-    'spiv',
-    'splitters',
     'splodges',
-    'splosh',
-    'spondon',
-    'spooler',
-    'sportcentre',
-    'spotlighted',
-    'spr/ssr',
-    'spracklen',
-    'sproat',
-    'spruced',
-    'spufford',
-    'spy-fly',
-    'spyglass',
-    'spyhole',
-    'sq._ft.',
-    'sqdn',
     'squadriglia',
-    'squally',
-    'squashes',
-    'squelchy',
-    'srv',
-    'ss2',
-    'ssats',
-    'st-jean',
-    'stable-yard',
-    'stade',
-    'staff-student',
-    'stagg',
-    'stairhead',
-    'stallard',
-    'standbys',
-    'stanfield',
     'stanforth',
-    'stanwick',
-    'staphylococcal',
-    'stapler',
-    'stapletons',
-    'star-like',
-    'star-spangled',
-    'starkest',
-    'starless',
-    'start/stop',
-    'starting-points',
-    'starveling',
-    'state-of-the',
-    'statecraft',
-    'statically',
-    'stato',
     'status&mdash;return/',
-    'stds',
-    'stead-carter',
-    'steam-driven',
-    'steeping',
-    'steeplechasing',
-    'stef',
-    'steinlager',
-    'stele',
-    'stellata',
-    'sten',
-    'stennis',
-    'step-daughter',
-    'stephano',
-    'stepladder',
-    'stepped-up',
     'stepsons',
-    'stereophonic',
-    'sterilizer',
-    'stewart\'s-melville',
-    'stichting',
-    'stillman',
-    'stilt',
-    'stimulator',
-    'stinky',
-    'stinson',
-    'stippled',
-    'stocklists',
-    'stolojan',
-    'stomach-churning',
-    'stone-cold',
-    'stone-faced',
     'stopford',
-    'storagetek',
-    'storia',
-    'story-line',
-    'storytime',
-    'stothard',
-    'stradling',
-    'strafe',
-    'straight-sided',
-    'straightness',
-    'strainers',
-    'strait-laced',
-    'stratificational',
-    'streetcar',
-    'streetlamp',
-    'stress-strain',
     'strevens',
-    'strewed',
-    'striate',
-    'strike-breakers',
-    'strikebreakers',
-    'strimmer',
-    'stringfellows',
-    'stroganoff',
-    'stroicim',
-    'strokeplay',
-    'strood',
-    'strop',
-    'strophe',
-    'stuc',
-    'student-led',
-    'stumbling-block',
     'stuns',
-    'stunting',
-    'stupefaction',
-    'stupefying',
-    'sturdier',
-    'su&ntilde;er',
-    'suasion',
-    'sub-arctic',
-    'sub-categories',
-    'sub-class',
-    'sub-communities',
-    'sub-contracts',
-    'sub-fields',
-    'sub-frame',
-    'sub-king',
-    'sub-plot',
     'sub-populations',
-    'sub-regions',
-    'sub-strategic',
-    'subalterns',
-    'subassemblies',
-    'subclones',
-    'subfield',
-    'subfields',
-    'subfractions',
-    'subhuman',
-    'sublimate',
-    'submarine-launched',
-    'submariner',
-    'subpoenaed',
-    'subpopulations',
-    'subrogation',
     'subsp',
-    'substantiation',
-    'substrata',
-    'substructure',
-    'subsumes',
-    'subtenant',
-    'subtilis',
-    'sugar****',
-    'sugar-coated',
-    'suicidally',
-    'sulayman',
-    'sulfate',
-    'sulivan',
-    'sulphonic',
-    'sumburgh',
-    'summond',
     'sun-dappled',
-    'sun-lounger',
-    'sun-warmed',
-    'sunburned',
-    'sundew',
-    'sunpics',
-    'sunwing',
-    'sunworld',
-    'super-human',
-    'super-sensitive',
-    'superantigen',
-    'supercars',
-    'superfluity',
-    'supergroup',
-    'superintendence',
-    'supermac',
     'superset',
-    'superstitiously',
-    'supertanker',
-    'superwoman',
-    'suppliants',
-    'supportable',
-    'suppositories',
-    'suppurating',
-    'sura',
-    'surtax',
-    'sussex-based',
-    'sustainably',
-    'sustainer',
-    'suzuka',
-    'svelte',
-    'svp',
     'svr4.0',
-    'sw11',
-    'sw1h',
-    'sw1v',
-    'sw1x',
-    'sw1y',
-    'swaffham',
-    'swansdown',
-    'swards',
-    'swart',
-    'sweeny',
-    'sweet-scented',
-    'sweetish',
-    'swilly',
-    'swinburn',
-    'swinderby',
     'swindin',
-    'swindler',
-    'swines',
-    'swinford',
-    'switch-mode',
-    'switchblade',
-    'syagrius',
-    'sybaritic',
-    'sybillin',
-    'syllogisms',
-    'sylvain',
-    'sylvanus',
-    'sylvestre',
-    'symbolics',
-    'syme',
-    'sympatex',
     'symptomatology',
-    'syn',
-    'syn-pla2',
-    'synch',
-    'synchronism',
-    'synopses',
-    'synthesizers',
-    'systematics',
-    'systematised',
-    'szasz',
-    't&uuml;bingen',
-    't&yacute;n',
-    't-72',
-    't-bone',
-    't-shaped',
-    't.j.',
     'tachygastria',
-    'tacos',
-    'tactlessly',
-    'tactlessness',
-    'taibach',
-    'taiga',
-    'tailgate',
-    'tailwind',
-    'taiz&eacute',
-    'takoradi',
-    'talabheim',
-    'talleyrand',
-    'tallness',
-    'talvi',
-    'tamayo',
-    'tamiami',
     'tandon',
-    'tanfield',
-    'tanja',
-    'tannenbaum',
-    'tanneries',
-    'tanzanians',
-    'tape-recorders',
-    'tape-recordings',
-    'tappers',
-    'tarantino',
-    'taranto',
-    'tardiness',
-    'targa',
-    'targoutai',
-    'tarragona',
-    'tarring',
     'tartlets',
-    'tarvarian',
-    'tascam',
-    'task-related',
-    'tasters',
-    'tastier',
-    'tattersalls',
-    'tautness',
-    'tawse',
-    'tax-collector',
-    'taxi-ing',
-    'taxicab',
-    'taxiway',
-    'tazarbu',
-    'tbe',
-    'tdf',
     'tdi',
-    'tea-cup',
-    'tea-table',
-    'teacher-in-role',
-    'tee-shot',
-    'teicher',
-    'telecomputing',
-    'telefax',
-    'teleputer',
-    'teletype',
-    'televerket',
-    'telexed',
-    'temporaries',
-    'temulentum',
-    'ten-',
-    'ten-huc',
     'ten-point',
-    'ten-pound',
-    'tenbury',
-    'tensional',
-    'tensioned',
-    'tenured',
-    'terephthalic',
-    'terme',
-    'terminators',
-    'terrapin',
-    'terrie',
-    'test-tubes',
-    'tetanic',
-    'tete',
-    'tethering',
-    'tetsworth',
     'teufel',
-    'tew',
-    'text-based',
-    'textually',
-    'tfc',
-    'tfiiib',
-    'th\'bist',
-    'that\'',
-    'thayer',
-    'theale',
-    'theophrastus',
-    'thes',
-    'thessaloniki',
-    'thieblot',
-    'thien',
-    'thigh-high',
     'thin-film',
-    'thingwall',
-    'third-quarter',
-    'thirty-fifth',
-    'thomason',
-    'thorold',
-    'thorvald',
-    'thought-processes',
-    'thrasher',
-    'three-letter',
-    'three-storeyed',
-    'three-tiered',
-    'throw-back',
-    'thstyme',
-    'thumb-nail',
-    'thumbs-down',
     'thurber',
-    'thurgood',
-    'thurley',
-    'thwack',
-    'thwing',
-    'thy-1',
-    'tianjin',
-    'tibi',
-    'tie-backs',
-    'tientsin',
-    'tighe',
-    'tightly-knit',
-    'tilden',
-    'timbuktu',
-    'time-based',
-    'time-space',
     'timeslip',
-    'timeworks',
-    'tinctures',
-    'tindal',
-    'tinges',
-    'tinkly',
-    'tintawn',
-    'tip-offs',
-    'tiso',
-    'tissington',
-    'tissot',
-    'titchmarsh',
-    'titchy',
-    'titcomb',
-    'titling',
-    'tixier-vignancour',
     'tizzy',
-    'tmd',
-    'to-and-fro',
-    'to/from',
-    'toccata',
-    'toddle',
-    'toddy',
-    'togas',
-    'togged',
-    'toi',
-    'toing',
-    'tokenistic',
-    'toledano',
-    'tolerability',
-    'tolstikov',
-    'tomo',
     'tomorrowman',
-    'ton-up',
-    'tone-up',
-    'toney',
-    'tonsillectomy',
-    'tonson',
-    'tonsured',
-    'tonton',
-    'toon',
-    'tooted',
-    'top-scoring',
-    'top-security',
-    'topeka',
-    'toper',
-    'topic-prominent',
-    'topos',
     'topstock',
-    'torcy',
-    'tordo',
-    'tormey',
-    'torrente',
-    'toss-up',
-    'total-chromatic',
-    'totemism',
-    'totp',
-    'totters',
-    'toucans',
-    'touchstones',
-    'toughie',
-    'toujours',
-    'tourette',
-    'touristy',
     'tous',
-    'towage',
-    'toxicities',
-    'toxoplasma-specific',
-    'tpsa',
-    'trabants',
-    'tracheostomy',
-    'tracie',
-    'traditional-style',
-    'trafficked',
-    'tragedian',
-    'trans-european',
-    'transcaucasia',
-    'transferase',
-    'transferrin',
-    'translucence',
     'transmammary',
-    'transmogrified',
-    'transmute',
-    'traumatized',
-    'travelodge',
-    'travelogues',
-    'traverser',
-    'travertine',
-    'tredworth',
-    'tree-trunk',
-    'trenchantly',
-    'tress',
-    'treurnicht',
-    'trevithick',
-    'tri-star',
-    'trianon',
     'tribeca',
-    'trichogramma',
-    'trickle-down',
-    'tricolor',
-    'tricot',
-    'trifid',
-    'trigeminal',
-    'trigg',
-    'trike',
-    'trinian',
-    'tripling',
-    'trislander',
-    'trixie',
-    'trodd',
-    'troeltsch',
-    'tropicana',
     'trossachs',
-    'trotskyism',
-    'trouble-shooter',
-    'troughton',
-    'trouncing',
-    'tru',
-    'truculence',
-    'trudie',
-    'trumpington',
-    'trumpton',
-    'trundles',
-    'truong',
-    'trussing',
-    'try-scorer',
-    'trypan',
-    'trysts',
     'tsa',
-    'tsao',
-    'tsaritsyn',
-    'tsw',
-    'ttx',
-    'tubercles',
-    'tuberculin',
-    'tucuxi',
-    'tughluk',
-    'tullis',
-    'tulse',
-    'tur',
-    'turn-over',
-    'turn-up',
-    'turnell',
-    'turnouts',
     'turnstones',
-    'turrell',
-    'tushingham',
-    'tussling',
-    'tut-tut',
-    'tutelary',
-    'tutsi',
-    'tvrs',
-    'tweedledum',
-    'twelve-hour',
-    'twelve-note',
-    'twenty-foot',
-    'twiglets',
-    'twitty',
-    'twixt',
-    'two-address',
     'two-dogs',
-    'two-fifty',
-    'two-handled',
-    'two-note',
-    'two-phases-on',
-    'two-shot',
-    'two-three',
-    'two-time',
-    'tx',
-    'tybaot',
-    'type-1',
-    'typhoo',
-    'typo',
-    'tyrian',
-    'tzannetakis',
-    'u-matic',
     'u.n.',
-    'u18',
-    'u21s',
-    'u251',
-    'ubiquitously',
-    'ucs',
-    'udgs',
-    'udp',
-    'udpm',
-    'uffe',
-    'uffz',
-    'ugcc',
-    'uk.',
-    'ula',
-    'ultrasonics',
-    'ulu',
     'ums',
-    'umwa',
-    'umwelt',
-    'un-british',
-    'unaffordable',
-    'unapologetic',
-    'unappreciative',
-    'unarticulated',
-    'unbranded',
-    'uncalled-for',
-    'unceremonious',
-    'uncoloured',
-    'uncomplainingly',
-    'unconvicted',
-    'uncool',
-    'uncreated',
     'uncrowned',
-    'uncurl',
-    'undecorated',
-    'undefinable',
-    'under-11',
-    'under-12',
-    'under-25',
-    'under-25s',
-    'under-investment',
-    'underachieving',
-    'underconsumption',
-    'undercooked',
-    'undercuts',
-    'underdrawing',
-    'underletting',
-    'undermanned',
     'underplays',
-    'undershirt',
-    'underskirt',
-    'underspending',
-    'understates',
-    'understudies',
-    'underthrusting',
-    'underwrites',
-    'undeservedly',
-    'undiscriminating',
-    'unedited',
-    'unfashionably',
-    'unfertilised',
-    'unforthcoming',
-    'unframed',
-    'unfussy',
     'ungermann',
-    'unhealed',
-    'unhealthily',
-    'unheroic',
-    'unhesitating',
-    'unhitched',
-    'unicellular',
-    'unicycle',
-    'unidata',
-    'unidimensional',
-    'unido',
-    'uniformitarianism',
-    'unimation',
-    'uninitialised',
-    'unit-points',
-    'unitised',
     'univac',
-    'university-educated',
-    'unixes',
-    'unkindness',
-    'unlearned',
-    'unlevered',
-    'unlikelihood',
-    'unlooked-for',
-    'unlu',
-    'unluckiest',
-    'unmapped',
-    'unmerchantable',
-    'unparliamentary',
-    'unpeeled',
-    'unpeopled',
-    'unpreparedness',
     'unprovable',
-    'unprovided',
-    'unpublicised',
-    'unquantified',
-    'unready',
-    'unreceptive',
-    'unresolvable',
-    'unrespectable',
-    'unsatisfactorily',
-    'unseasonable',
-    'unsighted',
-    'unsought',
-    'unstimulated',
-    'unstintingly',
-    'untalented',
-    'untangling',
     'untestable',
-    'unthreatened',
-    'unvisited',
-    'unvoiced',
-    'unworked',
-    'unzipping',
-    'up-country',
-    'up-ended',
-    'up-to-time',
-    'upbraided',
-    'upi',
-    'uppercut',
-    'upslope',
-    'uranyl',
-    'urban-based',
-    'urban-industrial',
     'ureteric',
-    'urner',
-    'us&dollar;1,200',
-    'us&dollar;1.00=252.863',
-    'us&dollar;100,000',
-    'us&dollar;150,000,000',
-    'us&dollar;20,000,000',
-    'us&dollar;250',
-    'us&dollar;30',
-    'us&dollar;5,000',
-    'us&dollar;5,000,000',
-    'us&dollar;70,000,000',
-    'us-sponsored',
-    'usdaw',
-    'use-value',
-    'user&mdash;input/',
     'usin\'',
-    'usp',
-    'uspga',
-    'usr',
-    'uthman',
-    'uwc',
-    'uwp',
-    'uzum',
-    'v.-c',
-    'v.a.t.',
-    'v/386',
-    'vaccinate',
-    'vacuole',
-    'vag',
-    'valediction',
-    'valencian',
     'valentina',
-    'valpolicella',
-    'van-d&uacute;nem',
-    'vandalising',
-    'vanquish',
-    'vaporized',
-    'vaporous',
-    'vaquero',
-    'var.',
-    'variable-length',
-    'variationist',
-    'vasculitis',
-    'vauxcelles',
-    'vdf',
-    've-hickle',
-    'vegans',
     'veggies',
-    'velars',
-    'vend&ocirc;me',
-    'vendian',
-    'venereology',
-    'venner',
-    'verandahs',
-    'verb-phrase',
-    'verde&tcedil',
-    'verdelot',
-    'verdure',
-    'verifies',
-    'verkehrsberuhigung',
-    'vernaculars',
-    'vernal',
-    'vernier',
     'vero',
-    'versification',
-    'verstehen',
-    'verte',
-    'vespasian',
-    'vetoing',
-    'vialli',
-    'vianney',
-    'vicarages',
-    'vicario',
-    'viceroyalty',
-    'victimless',
-    'victoire',
-    'victorian-style',
-    'victorie',
-    'vide',
     'video-tapes',
-    'viewable',
-    'villahermosa',
-    'villeins',
-    'vills',
-    'vincristine',
-    'vinegary',
-    'violetta',
-    'virgilian',
-    'virginian',
-    'virial',
-    'virology',
-    'visceral-specific',
-    'vitals',
-    'vitold',
-    'viviparus',
     'vlaams',
-    'vlad',
-    'vlaminck',
-    'vmc',
-    'vmp',
-    'vocalisations',
-    'voicings',
-    'voiders',
-    'voiding',
-    'voie',
-    'volans',
-    'volcanogenic',
-    'volkstag',
-    'volpone',
-    'volsky',
-    'voluntaryism',
     'voluptuously',
-    'voluptuousness',
-    'volute',
-    'voronezh',
-    'votre',
-    'voussoirs',
-    'voyeurs',
-    'voysey',
-    'vpdpr',
-    'vr6',
-    'vrx',
-    'vsg',
-    'vt2x',
-    'vulgate',
-    'vulgrin',
-    'w&lcub;211&rcub',
     'w\'s',
-    'w.a.',
-    'w.c',
-    'w.d.',
-    'w.s.',
-    'w1p',
-    'w3',
-    'w4',
-    'wacc-ar',
-    'wahey',
-    'wailers',
-    'waitangi',
-    'wake-up',
-    'wakeling',
-    'wald',
-    'walkowitz',
     'wallach',
-    'walmer',
-    'wann',
-    'wannabe',
-    'wansbeck',
-    'wantin\'',
-    'war-damaged',
-    'warboys',
-    'wardington',
-    'warpaint',
-    'warpath',
-    'warrant-card',
-    'warred',
-    'wash-hand',
-    'washboard',
-    'washed-over',
     'washerwomen',
-    'wastebin',
-    'watchet',
-    'water-clocks',
-    'water-cooled',
-    'water-meadows',
-    'water-wheel',
-    'wateraid',
-    'waterless',
-    'watermarks',
-    'watermelons',
-    'watermills',
-    'watership',
-    'wave-crest',
-    'wave-like',
-    'wavecut',
     'wavefunctions',
-    'waxwork',
-    'waylands',
-    'wc1x',
-    'weaklings',
-    'weatherfax',
-    'wec',
-    'weddin\'',
-    'weevil',
-    'wegman',
-    'weick',
-    'weight-lifting',
-    'weightman',
-    'weinstock',
-    'weirwold',
-    'weiskopf',
     'weiskrantz',
-    'weissman',
-    'wel',
-    'well-born',
-    'well-crafted',
-    'well-disposed',
-    'well-produced',
-    'well-researched',
-    'well-scrubbed',
-    'well-supported',
-    'well-tailored',
-    'well-taken',
-    'well-tended',
-    'well-thought-out',
-    'well-ventilated',
-    'wellingham',
     'welshness',
-    'wem',
-    'wengen',
-    'wert',
-    'west-facing',
-    'westlake',
-    'westlands',
-    'wet-nurse',
-    'wet-weather',
-    'wetherell',
-    'wetsuits',
-    'whaler',
-    'whangarei',
-    'whatman',
-    'whatsisname',
-    'wheatears',
     'whiggery',
-    'whindust',
-    'whingers',
-    'whinnying',
-    'whipsnade',
-    'whiskered',
-    'whitcombe',
-    'white-dominated',
-    'white-knuckled',
-    'white-out',
-    'white-rumped',
-    'white-water',
-    'whitecross',
-    'whiteman',
-    'whitest',
-    'whitleys',
     'whitstable',
-    'whittlewood',
-    'whodunnit',
-    'whorled',
-    'wicket-taker',
-    'wide-mouthed',
-    'wide-set',
-    'widthways',
-    'wigner',
-    'wigram',
-    'wigwam',
-    'wild-caught',
-    'willetts',
-    'williams-renault',
-    'willsford',
-    'wilmott',
     'wilsher',
-    'wilsonian',
-    'wimbush',
-    'wimple',
-    'wincup',
-    'windbag',
-    'windcheater',
-    'windeyer',
-    'windies',
-    'windley',
-    'window-boxes',
-    'window-frames',
-    'window-panes',
-    'window-shopping',
-    'windowpane',
-    'wine-growing',
     'wine-red',
-    'wineglass',
-    'wing-beats',
-    'wingtips',
-    'winkowski',
-    'winson',
-    'wintach',
-    'wisdoms',
-    'wisecracks',
-    'wissenland',
-    'wistar',
-    'withal',
-    'witwatersrand',
-    'wix',
-    'wnas',
-    'wolfcraft',
     'wolfendale',
-    'wolfhounds',
-    'wolsingham',
-    'wolverines',
-    'womankind',
-    'wondrously',
-    'woodcarving',
-    'woodcutter',
-    'woodgate',
-    'woodlouse',
-    'woodshed',
-    'wookey',
-    'woolston',
-    'word-list',
-    'worksurface',
-    'wormy',
     'worthily',
-    'wpbsa',
-    'wrathfully',
-    'wreckers',
-    'wri',
-    'wrigglesworth',
-    'wrights',
-    'wrightson',
-    'wroclaw',
-    'wtewael',
-    'wth',
-    'wych',
-    'wymott',
-    'wyn-rajathuk',
-    'x-100',
-    'x-clan',
     'x-stations',
-    'xalt',
-    'xf7',
-    'xli',
-    'xstones',
-    'xuan',
-    'y-cells',
-    'y2',
-    'ya136e7',
-    'yacoub',
-    'yahoo',
-    'yakuts',
-    'yamaguchi',
-    'yar',
-    'yardie',
-    'yarwood',
     'yawing',
-    'yazdi',
-    'yeager',
-    'year-by-year',
-    'yeard',
-    'yekaterinburg',
-    'yellow-brown',
-    'yellowfin',
-    'yemenis',
-    'yerkey',
-    'yisrael',
-    'yn',
-    'yogic',
-    'yona',
-    'yorkists',
-    'yorkshire-based',
     'yormie',
-    'you\'',
-    'you\'d',
-    'you-know-who',
-    'youatt',
-    'yoxford',
-    'ytm',
-    'yy',
-    'za&iuml;rean',
-    'zafar',
-    'zagrat',
-    'zain',
-    'zaller',
-    'zanskar',
-    'zarewitsch',
-    'zchn',
     'zechariah',
-    'zenaida',
-    'zepa',
-    'zero-based',
-    'zero-point',
-    'zhen',
-    'ziggurat',
-    'zimbabweans',
-    'zine',
-    'zircons',
-    'zliten',
-    'zo',
-    'zodiacs',
-    'zohra',
-    'zoltan',
-    'zouche',
     'ztt',
-    'zulfiqar',
-    'zulu-based',
-    'zululand',
-    'zwemmer',
-    'zwingli',
+)
+
+blocks_14 = (
+    '$-;-glucosidase&*tocopherol")macr;tman#\'p;times"$ring!*bgr;-actin!\'commat%!&divide"*ollar;0.11+!5+!6+!7*"25(%1,800)#.55',
+    ')"30)%4,000)"75)&80,000*!m(%2,100*#200*#600)"4m(%3,200)#.1m*"7m)*00,000,000)&50,000*!m',
+    '(%4,800)".5*"8m(+500,000,000)%5,000*!m(&64,000)"5m($7.2m*"5m)&00,000+!m(#80m)"50($9.5m',
+    '*!m!7eacute;v&eacute;nements"(gr;-&zgr!*frac12;tsp!-khgr&amp;sup2!)lt;esc&gt$"pb!)micro;g/h)$kg/h!+pound;1,050(#.29)"35*"bn)#5bn("04',
+    ')!8)\'million("16($5.00($8.75("92("m.\')2,000,000(#.40)"55)"60)"85)!9(.0&ndash;30,000(#15m',
+    '(&30,000(&44.5bn($6.95(&70,000(&80,000)!5(%9,000("m.\'%3,250(".2*!0)"6m)!8(.0&ndash;40,000($2.50',
+    '(%3,000("49)!m("69("7m("8m("90)!m\'$4.3m)!9(%3,000(&40,000("5m("70)!m',
+    ')!4(#0bn(%6,000("90)!5)!9\'$6.3m)!7("75\'$7.5m)!6("20("80($9.99("bn',
+    '("40\'$9.00)"4m\'!m!(times;38 #\'69!"70"!1!"82!"94!$ands"#ppy!"do!%fraid!"no',
+    ' \'*delete #+20 #-30!"ap"%tpase!#hco!"ly!!s"(ensitive #.45 "//!!g!"l/!"p/ *0&middot;2',
+    '!!."$0001$!5#"2%"#1mm""23""36#!7#!9""44""55#!p""91#!4#!8',
+    '$!5#"26$!9!#202#!3""23#!5""55!#420""42!#533!$7.00""42!$8.00",39&ndash;666',
+    '!!s \'1&deg;c")frac12;in"/ndash;2&ndash;3)!0!#(a)!+,000-strong"\'400,000!"-5!#.05""1m"#2.2""33"#4.4#!4',
+    '"\'6-litre!$/100!\'0,000ft"!-#!0#"13"#.1%$!2#"75#"8%")0,000,000#\'-strong#"hz#"mb""15',
+    '""36#!9"%5,000#!7""64#!5#!7""94#!8"&am-5pm"&base-t"+p11.2-q11.2!$1(4)"#-15"#.1%',
+    '#"75"#000#!9""15""39"#50s#!3""67""88""96#!7""in""lb""st!$2(3)',
+    '""0%#\'-member#!8#!9""11#!9""22#!8""46""52#!3#&ml/5fl""61#!2""88',
+    '""cm""mb!$3&ft""04""29""42""51#!9""78"#80s#!2""94#!5"!a!$4&ft',
+    '"#-17"#.8%""0p""13#!9""31#!7""57""62""88""95#!6#!7""ft"!m',
+    '!\'5&deg;c"#-18#!9##man$(onth-old"#.3%"#/16""02#!5#!8#!m""11"-58&ndash;1603!)6&ndash;2)!3',
+    '"*-processor"#.7%!*7&ndash;21"%-inch"#.00#"30#"4%#"9%""ft""pc!#8.7#!8""mm!&9-inch"#.4%',
+    '"+20&ndash;21#*8&ndash;29"+35&ndash;36"+40&ndash;41$"\'s"+53&ndash;54#*7&ndash;58"+60&ndash;61$!5#*8&ndash;69#*9&ndash;73"*70&ndash;1$\'s/1980s#)4&ndash;5+"75',
+    '#)5&ndash;6"%80-81#$1-82#)2&ndash;4$#-83#*4&ndash;88#*6&ndash;88#"7.#$9-91"$90/1#,1&ndash;1992$"\'s#*5&ndash;96!$:250#!7',
+    '"!8!"ft!!n!"sa!#tsp ,2&commat;1/2"\'frac12%(";p"(ndash;11(!8!#(5)""b)!!*!$,250"#750',
+    '!!-"$cell!%.15pm"#2.4#!1#!4"#3.3#!3"#4.3"#5.0"#6.1"\'8&aring!"/4!%0&deg#(ndash;23',
+    '"#-25#$page"#.00"%0-300$(year-old#!8#%g/7oz#!p"!k""ml!*1&ndash;22"#-24"!.#!9"!s',
+    '"$,500"+0c/425f/gas!#3pc"!s!*4&ndash;26"$-bit""0p#!v"$7645"!m!%5&deg#(ndash;27""-1#"28#"30',
+    '"".3#!4!*6&ndash;28"".5!$7-30"%0,000!*8&ndash;30!$9(2)"".8!"cv!!g!#nds!#x10 %3&deg"\'ndash;9',
+    '!%.00pm"#3.3"#4.2""5m#!p"#8.0!&0-mile"#00m""50""km!#100!&20,000""kb"!s!)3&ndash;1',
+    '"#0ml!$4(2)""40""50!\'5&deg;c"!a!&6-hole"&450-51!$7041"#239#"67"#311$!2"#602#"41',
+    '#"94$!7"#712#"27#"59#"64#"72#"84"#851#"67"#929#"59#"68$!9!$8022',
+    '$!9#"19#"51#"80#"94$!9"#216$!7"#312#"20#"73"#430"#537"#682"#716',
+    '#"67"!p!#:16!!h"!r!#min!"t3 )4&ndash;4!$,400"\'500,000!$-6-0"$star"(year-old!#.18""29',
+    '""40"#5.2""75""90!"/4!*0&ndash;44"%-hour"#000#!1#"mb"-g/1&frac12;oz""km!#2.2"%0,000!$4141',
+    '"!p!#5ml#!m""pc!#6.5!#70s!$8(2)!!f!"gb $5(4)!$,700!#.0%""23#!8""5p',
+    '%$nute"(0-strong#!g!$25mb!"93"!9!!g!!k"!g *6&ndash;11!$,200!&-month!$.1.2""21#"5%',
+    '"+6&ndash;7.0!"/8!$0000""hz!"2p!$40kb"!6""kb!$5/66!*8-year-old!"94"!9!"dj!#g11 *7&frac12;p',
+    '"#3a)!(,000,000!#-10!$.4.2""5p"#75%""9%!#00m"!1""ft!$1000"!2"!3"$5/33"!8',
+    '!%3,000!%4,000"!9!"59""cm""pc!"63""th!*7-year-old"!3!*8-year-old""79"!s!"97"!p',
+    '!"s."!t!"ty )8&ndash;0("13)!4(!2(!3!#(3)!",9!"-3!#.16""2%""7%""9%',
+    '"$486s""80"#mhz!"13""st!#3rd!#4th!*5-year-old!#7th!%8,000""00"!1!"93"!7!":1',
+    '!"s. )9&ndash;8!#(2)!(,000,000!#-12!#.13""2%""4%""7%!"06!"18!*2-year-old"!0"!7!"33',
+    '"!4!#50i!"73!"85!#9.9"!7!!s"!t #a-1"!f"$road!".1"$s.m."!t!"/c',
+    '"!7!#age#"pc"%lborg!(bbeydale#\'otsford"(delhamid#"ol#%uctor(!s"(el-smith"$ides"\'lewhite"(out-face""pc',
+    '#\'ogating"\'solving"\'utments"!y#\'ssicola!\'c-5-asa"(ademical($ians)"sm$!s#%rbose"(cess/one#(identals#,limatization*!e',
+    '$,untabilities#)retionary#%ucard$(mulative""dp"$e/id#!h"%harya"#omb"(quavella"$t-up#!a#(ualities!%datom")dition_to',
+    '#$uces"#ema"#gey"%ipose#"sa"(junctive"$kins"(ulteress$%yadej"!v#(ersative%#ted&%orial!(ef-1&agr"\'lfflaed',
+    '"!t#\'helburh!&ffaire#$ines#$leck"(rikaners"*ter-effect%&shocks!"gb""e-$%range#$ntes"\'nostics"&ostino"\'ronomic',
+    '"!m"!s"$umic!+ide_memoire"$kido##man"$ndow##ger#!t"$rfix##gun#$life"#tch%"es"-x-en-provence',
+    '"$pata"&rotiri!&l-amin#%karim#%masri$&egrahi"&_dente"&bacete%#ore"$dana#&ebaran#0ridge-brownhills"%eksei#$mbic#$rtly',
+    '##xai$"on"&fresco"&girdas#(orithmic"%ights##ysa"%l-too$*year-round#!e$$dged$#gra#%inson#&ophone$$ying',
+    '"&mahawi#%smead"%pha-1##ort"%shawi")ternators"&varado#$eoli!*mad&eacute##ldi#"nd##ury"*bivalences#%onnay"$edeo',
+    '#*rican-made(*/caribbean($ised#%sbury"&idated#"na$*oglycoside"\'mophila"\'nesties"\'orality##urs"+p&egrave;re#\'hipolis#%oules"$sler',
+    '!&nadolu#$heim#"ya"&caster"\'dalucia##ras$$eeva%%vitch%!y$%oulis"\'eurysms"+geles-based%"ou$$ring#,lo-catholics',
+    '&%scots#+ola-workers&"ns#*ustifolium"\'hydride"#ima%&l-like&#ity#"se$&otropy"!l"&nealed"%omala##xia"!p',
+    '$%phone#&chluss")tagonised#%ennal#&hemius$"us#&i-&agr%!a&+bortionists%%bcl-2&&onding%*capitalist%#dog%%papal&%olish',
+    '%\'realism+!t&#oll\'#man%+vivisection$$guan$%pasto&%thies%%honal$)secretory$&theses#*roduodenal"%ymole!"oi"!r',
+    '"&artado"$good"\'ocrypha#"el#(llinaris#\'nogeton#(strophes"*palachians#)ellations$%rtain$%tiser#\'raisers"\'rotinin"!s"%tness',
+    '$%scape#&ilegia$&tanian!%rabel#!m#%njuez"&balest#(itrating#%uckle""ce#(h-rivals$$aean&*ologically$)eological%&r-shee',
+    '%&traves##sec"%dmore#$oyne"%enson##zzo"#gan#\'entiere\'#nas""if#$osto##sta%$ides"#jan##una',
+    '#$less#$rest"%nside""on"(rhythmic#(ivederci#%owana"(t-school#%esian"\'unachal$$dell"$yans!\'saimara"&cetics##her',
+    '"*ia/pacific"(katasuna#$with"&mussen"!n##ett")phyxiated"&sandun$)ssinating#(emblyman$#nts#&iduity#*ociational)$vely+!s',
+    '"$ters#\'onishes#*rophysical!)therstone#"ol#$wart"\'onality"#ria")testation#"is"%water!#uch$(terarder"$gury$,st/september',
+    '"%stins$$rale\'(ian-born&#sia"\'tarchic##eur#\'higenic#\'ochrome$$exec$)radiogram,"ph$#set"$vers!%vedon#%rland',
+    '"!m"$ocet"#tar!$wacs#"ys"$ford!%xonal!\'yacucho"#din"$mara!$zhar"#nar \'b&amp;w",eacute;nezet)$roff',
+    '",uuml;rgertum!%-form"%sides"%trees!#.b."$m.t.!!8!"=3!&abbitt#"ri"&chofen%!p#(k-handed%$seat$%draft',
+    '$$logs$%packs$$stay#+teriologist"%dcock%!x"$ffin"$gful"$hama"#jan"\'lanitis$"zs#"dy#*l-bearings$%adeer',
+    '$%inger$%rooms$$yhoo%%kelly%&murphy#$oney#&tusrol"&mfield"(nffshire#%ishes#&quette#%ville"!p")r_mitzvah#"an',
+    '#%bizon#\'e-faced$$boat$!s#!m$$aids#&n-like$#ham#&racked$(owclough#$tell#(yshnikov"(s-relief#&eboard#"ie',
+    '##ler#*se-navarre#!t$#ian"%th/wc$"es$%house$&oliths#%tison"#uen"%vduin"#yle##ser"%zooka!#bdo',
+    '!"cl""nf!*eachcomber#$dles##les##mer#&nstalk#%sties#&titude##une$!t%#ify(#ing$$vais""be',
+    '##ton"%devil\'!s##pan&!s#\'sitters#%times"(echgrove#%fcake#%hives#$ping#(tlejuice"\'friends"$gley"-haviouralists',
+    '#$inds#!n"!i"$lbin#\'emnites#$ford#%gacom$!o#&l-push%\'ringing$\'icosity%"ng\'"er%%ssima$#way',
+    '#\'shazzar"%nares$%vides#%ching#&djedid#(efaction$%vento#$tsen#+zodiazepine"&renger#%gsson#&kowitz#%nicia$$wood#%thing',
+    '##wyn"$sets#%iktas#%semer#%t-fit$$rode"%thlem$)une-baker#!o#1ter-than-expected"$urre")witchment!%f110s"!g!\'hagavad',
+    '!&iafran##nca"+bliographer#!s##ury"#cep$0ster/oxfordshire#$kers#%ycled"\'ennials#%rmann"#ffa"\'g-boned$$wave#!g',
+    '#&labong"&naural##chy#%nacle$#ing#$tley"&ofuels#+geochemical&)graphical#*mechanical#\'society#"ta"!p#\'edalism"\'rd-song',
+    '##lik#"on#$tley"%sects##que##set"(tchiness#&mapped"&vouacs"$wott"%zarro!!j"\'ornsson!!k"!a',
+    '&%robed&&tipped%%bushe%$face&#ord%%guard%#leg\'!y%\'mailers##ded$"ud#\'nketing#\'tchford#%xhall##zon',
+    '"\'ighting"$obby#!m#*nde-haired#)od-groups%(curdling%%stain#)w-by-blow%#out$"sy""ub#$efin##rgh!"mx!%oaden',
+    '$$load"#che"&denham##iam#*y-building%)snatchers"%elcke#"rs"&ggling")hemianism"%ilies"%lckow#$kiah"&mbards"\'ndagers',
+    '#%field#$heur#&nerjea"(okstalls$$worm#$rman##sey#$tees$&straps#!z$$e-up%"rs""pd"&rdello%!s',
+    '$!n#$odin"#ssi%$ness$!u#%wells"%tting$&le-fed)%eding\'%nosed&&necked$#ome&#ing#%ulism"&uilhet',
+    '&"on#"le%!s$"le#"rg%$ogne$*r&eacute;e#&sfield"(w-legged##don#$hill#*ler-hatted"&x-like#$tree"$yars',
+    '!.r&eacute;tigny#(uuml;cke($ning"+achiosaurus$%ingly$!y#&dfords#"ga$$gart##in\'#$mham$%shott#$shly$$sica%!o',
+    '#\'ybrooke#$zils"(eakaways%%point%$well$)thability\'%lysed$$vman#\'ntwoods#%tagne##win"&iavels#&ckbats#&dgford%$land',
+    '$%stock#$sket$$sett#(tt-marie"\'oaching$\'d-brush%$view#!d$#ick##kof#%myard##nco$#wen##phy#)wn-haired',
+    '#\'xbourne"!r"(s/search"&ueghel#"in#)nelleschi#!v"#yer#$nteg#\'ophytes$%zoans!"to!&ubiyan#$with"\'cketing',
+    '"$ddle##ged"+ff-coloured#!o"$gles##ner""la#$king#%lards$$doze$\'etproof$!i"\'mptious"&ncrana##kum',
+    '".reaucratically+#zed#*germeister$&hfield$"le#(hanuddin##min#$ness$*t-offering#"ra$"us"$shed#!i$*ness-class(\'objects',
+    '##oni#$sing#$tles""t-#"eo#"te##zer"#zan!#yas"$laws"(products \'c&sharp!!+!#.f."$n.d.',
+    '"!1""an"$bals#$omba##rio""ce#\'odylate"#dam#%burys#$enza#%herin"&erulea"(feterias##tan"!g',
+    '"#jec"\'labrian$%garri$$mine#)cipotriol$\'ulative#,der-marshall&$bank#%ender#(ibrating)#ons$%phate#"ke#&l-outs$\'anetics',
+    '$$uses#(orimetry#$tech$%horpe#"ve%!r$!o"#mbo#)era-ready#!m#$orra#%p-bed$$agna#%shaft"%n-can',
+    '#)didatures$&leford&#mas#"ne$&ington$\'onballs#"st#$tril"!o"\'pellans##ita#"on#$ulet"&r-free#&adryel',
+    '$%uncle#\'dholder#\'eerists$#lla#"ib$(caturing#%lsbro#\'mellina$#ina$%yllie#&nality$+egie-mellon$&oustie#&olinas##pal',
+    '#$rack$"el%"ro$&y-over#"se#&tloads$)ographers%$uche$\'wheeled##wyn"&se-law##hes#&sillis%%opeia#(tiglione',
+    '\'#ilk$$rato"&tarina#%ch-22&&phrase,!s#)echetical$%goric(\'sations#,heterisation$\'olicity#$suit#$tery$!o"\'usalism',
+    '$#ton"\'valieri##ort$"ur"$yard!#bgb""so!#d44#!5"!f"!l!)easefires"$cils"#eac"&ndrars',
+    '$(ral-bank%&ifuges%*osymmetric"!p"+real-packet#(tifiable\'+cate-holder")sarewitch##ena#$sion""ti"#uta!"h1"(ain-link#%kufwa',
+    '#(mber-pot#$ncre&#oid$$gers#$pati#(rdonnays$#est$#kin$$lies$%maine$#nos$%teris#&t-show$&elaine"\'ebyshev',
+    '$)se-making&&burger#$gwin#"ka#$lmer#-motherapeutic##nin$,odeoxycholic\'\'yxholic#%riton$%nenko%\'omyrdin#%ssmen$\'terhall##ung',
+    '%$sham$$rons"(i-square#!a#+ch&oacute;n#"de%!s$$zero#%llida#&maeras$$eras#%namen$$less$#nor$"os',
+    '#%vvied"\'lodomer$*rpromazine"$ocks$+olate-brown##ire#/langiocarcinoma$$erae#&rister$$lton"!r#\'&dollar#\'issakes%+tianization&\'ologies',
+    '&!s&"us#*omatograph"#uli#.rchill-coleman)#ian#\'zzlewit!\'icerone""el"%ggies"*nema-goers&)tographer$#rea#&namond",rcumscribing',
+    '"$vics$(l-rights%#ise&$ties&"ze$$zade!(laimable#%mbers#%rabel$#kes#%ssier\'"st#\'vichord#&w-like#&yoquot',
+    '#%lland#%obury#%rkess"\'iffside%$tops#$nard".oak-and-dagger##gau$"gy#,isonn&eacute#(sed.loop%"up#%uting#&verbay"!s',
+    '#$niac!#m/s"!j!!n""et"!u!\'o-chair#(decision#&editor#\'founded)"rs#%occur$\'perates)#ors$(wnership',
+    '#$text#&worker")ach-house%%loads#\'gulated#$ming#(t-hanger+!s"\'bwebbed"$chin&&-china#&k-eyed%#ups$$bain$%fight',
+    '#$oons"%dasyl#$ings"(elacanth#$nred#%rcing#$tsee#\'xistent"&factor#%fered"#gan#$hlan##ito"(habitees$!n',
+    '"&lborne$!y##een#-laborationist%&r-bone$(ectables$#ict$)oquialism$#yer#$ones%"ia&$sers$#red%\'imetric$(ur-sided',
+    '##ton"+mmandeering\'%ingly$%inges%!s&(erations%&ttment$)on-places\'$room&\'alities$&unards&,iqu&eacute;s\'#tas%&tation#&pactly',
+    '%\'ratives$&osedly\'!s$\'rehends$/uter-integrated)(literate(%ising#"us##yns")nablaiche#*certgebouw$\'iseness$&reting$&urring#)demnatory',
+    '$*itionality$\'ominium$&ucator$!y#"ed#)federates%(ssionals$&lating$\'ormists#$gaie$&ealing#)junctural##ked$#lin#%nally',
+    '#$ques#*sanguinity$-cientiousness$%ensys%1rvative-dominated$&ignees%%story$#ols$+picuousness$.titutionalists%$rual$&ulates&)ting-room#"t.$\'ainable',
+    '$!d$%empts%(nt-based%,xt-sensitive(%table$$inua$+raindicated-$ions#&veners&#ors&%ticle$&ulsing"#ope"(pacabana#(ulations',
+    '"(quettish"$rbin#"ey#$idon$!n%!e#&ruptly#"ti%$sone##wen""sa##imo#&t-free%$push$"al',
+    '$&ingham"&ughlin#!l$"in%!s#.nter-attacking((cultural(,inflationary(/revolutionaries\')balancing\'(factuals\'\'pointed\'\'stained%&rified%%ships',
+    '#$rbet"(venantee%!s"$wans##den%"ry"#xen$!s!"pf""is""ni!#rac$\'kerjack#$dock#)ig-dunlop',
+    '#"ke#$mmer#\'nesbill$%kcase#*sh-landing$%sness#$vats$$enly#%wfish##y-3"*eativeness#&b/atf1#)ditworthy#"es#%nshaw',
+    '#$rand#&tinous#%w-cut"\'icklade#(minalise)&zation&\'ologist$%plene#(pplegate$!s#\'spbread#2terion-referencing"(ocheting##fty#%ppers',
+    '&)community&$fire&\'linking&(platform&*tabulation&%veins%&linked%%overs%$ways##ton#%utons#&wfield$"ne$&thorne"!t',
+    '$%eness$%ities#%ncher"+yptocorynes&%gamic!#sps!"t2!"u.""an"%bisme"%ffing"(l_de_sac##lis#$ross"(mberlege',
+    '#\'merbund"!n"&rdling#"ig##ren#\'vatures"$sani#$sons##tis$(omisable"&taways#&cherry#$hred#%water"$xton',
+    '$$osis"#ber##org"%rille 2d&eacute;partement!(\'addario!\'-i-yers!&.litt.""m.!#ade"$ewoo"#foe"#gon"(lmatians#&riadic',
+    '#\'whinnie"(magingly#%nably")nce-halls"$oism"%riusz#%k-red%&suited$#ish##mid#!o#!u#&winist##zin"%tafin',
+    '"%ubney#&gherty"&vidian$!n"(y-school$$trip#$tona!#b32!)e-ionized#$luxe",accessioning#)d-heading$#man#\'f-blind#"ry',
+    '&%rates"-bentureholder#!i$$ting#,t-for-equity%)reduction%\'service##unk"$cant&#ing#\'imating$&sional#$laim%\'ssified$\'ination',
+    '#%rying"\'dicates#&ucible"%e-dee#&pwater")faecation##ers#)fenbacher#&orming"*glaciation#\'reasers"!h""ir"$lict$#lah',
+    '"\'magogic\'#ues$%nders%!t$\'rcating#*ilitarised#\'ocracia\',t-controlled(.ically-elected$&iselle$$niac%*stratively$"te#)ystifying"$nali',
+    '##ega#"on#$shin##tan#"wa"-partmentation#(endently#%onent$*sit-taking\'#ary#\'recated#&utised"#r\'i#&elicts#\'ring-do',
+    '#&olated#(peradoes$(oliation#*ulfovibrio"&taches#%chard#\'ections#"ox%#ify"*utschemark"/velopmentalists#$ilry"\'wy-eyed"!x#(terously',
+    '"!p!#giv"!m!+h&amacr;mis!*iachronous#$mant$\'orphine#"ta"\'ckenson#\'taphone$(ionnaire"$dnae##yma"(eticians%%tians',
+    '"%luent",mensionality)$less$#ric"%naric#"go#"na$)er-jacket\'\'parties\'%table#&widdie"%odati#(nisovich"#pak#\'lomates',
+    '#)terocarps")rect-dial#&igiste#%tying"&sabuse$(greeably$(llowance#,ciplinarians$\'laiming$)omforting%#rds#.ease-resistant$.nfranchisement#\'gustin\'\'!s',
+    '$)nvestment#%joint$$unct#(locating#(persions("ve#)qualifies)$ying%%ieted&&sition#-satisfactions$$ects$\'ociates)$ions#\'tractor',
+    '%&usting"\'thyramb""v.#(estments#"is%\'iveness!&lamini!%m2.50%!2$"88$"95"!a"%itrii"!r!*na/protein',
+    '!#oan"$bbie$!y##ell$%rmans##ies#*r&eacute;e")ckworkers#+tor-patient"(ggedness""ig"$lben#&metsch#"ph"$mark',
+    '$$tian##mer"$nita#!n"$olin#%nican#&r-bell"*ppelganger"$rahy#"ia#$mers",uble-checked\')distilled\'%quick%$ings',
+    '##cet#*glas-smith\'"es$#ray#"ll##rly"&vaston"-wager-duchess#)n-and-out%\'problem%$side$%going%\'radings$"ie$&played',
+    '$&wardly##ser!"pa!"r3"$alon#%mbuie#-ught-proofing##wls#"ys"%eadco$%mland%$time##nch##wry"#ibs',
+    '#%nkell##ppy"#ogo#"od#%pouts#&ylsden"&uellae#&idical#%mbeat"&yburgh!"st!"ta!*ubbingtons"&ckweed##tal',
+    '"$ende")ffle-coat$"us#!y"%mpbin""na#$vant"#rer##ium#$ness"%st-up""tt#\'y-bound!\'yestuff"%ffryn',
+    '#%light"%neema"*sfunctions $e.w.!)ach-other"!d##wig"$gach"$rful#%holes#%lston#$mark#%phone#%swick#\'thiness',
+    '"(st-coast$%/west$$cote$&ington"$tin\'!\'bensten#&rhardt!"c2"!a"\'clesiae"$hoey"$kard"+o-labelling#%logie#(nomising',
+    '#%topia"!s!(delstein"&geware"&ington"!p"(ucations"#wyn!$etpu"$yore"!z!&ffaced#\'eminacy!+gglescliffe!"h3',
+    '"$lers")renreichs#$lich!#ias"!g#)enproblem#"he$&t-foot&$inch&#man%+een-forties""la"$nzig"$rias"!t',
+    '!\'lastase%&ically&!n%$omer"$bing##rus")ectricals&(ostatics#$gans#*venth-hour"-lemann-jensen#%iptic##mau""ma##ers',
+    '"%phege"$rond"!s#"es##ter$"ob"$vish"$ysee!*mbodiments$"li#(roiderer+!s$)yological&#nal"#irs',
+    '")perorship#&ingham#$oria#$tier"(ulations#!s!)n_passant"$case#0ha&icirc;nements#&rypted")d-january$"on#%games##ive#&member',
+    '$)nucleases$)peroxides"(ervating"$fold"\'glander$(ishwomen##ram%"ve"!i"$join"&livens")richments"\'slaving"&tangle#$ebbe',
+    '#$ices#\'ombment%(ological!"og"!p!)pigenesis#\'phanies"$oque"\'pelmann#%leton"!r!,quipotential!)radicator#%sable#"ut',
+    '#$tria"&iksson"!k"\'lichman"&rorful!%scher#(utcheons"!o#!l",pa&ntilde;ol##ied"%tefan#!o#(remadura!"th',
+    '#(erington#,no-religious%\'logical%.methodologists#&ogenic$&logist"$oile"%zioni!$udes"#gen%&icists&!i&!o"&kanuba"&logies',
+    ')$ceae")ro-credit$*pean-style(\'isation%"ol"%sebia#$kadi#%tatic!)vangelise#\'porator"(erington%"tt"(il-doers"#ode!*x-colonies',
+    '$#ost$(risoners##raf#\'student"&action")clusivist#(rescence#%ursus"\'ecrable#\'getical")foliating)"on"+istentially""od#(nuclease',
+    '##sat#*thermicity$%oxins"$pats#%lain\'#(ortation#"ro%&priate"#tel$!r#+inguishment##ols#*ra-special%*curricular%*linguistic',
+    '$(oversion!*ye-contact#(catching##let +f&mdash;in\'!!\'!#***!-abric-covered&$ator")cetiously#)ilitative#%tious"!e#"ry"#han',
+    '#*thlessness""jr"#lla$#ows#-sificationism#(teringly"%milia\'(rization%"le"$rias$"na%$gton#%ndale"*st-running$&nesses',
+    '"%tales#+her-of-four"(untleroy#"ve"#ves"#wns!!b!"cl!*earfulness#&st-day",bruary-march"\'ckenham"+derconsorzi"+eble-minded&!r',
+    '##ney"$ldon#%uccas"!m##ora"$nech"$rmat#&n-like$#ley#$rand%0ri-iba&ntilde;ez$$eted$#iby%"te$$uzzi',
+    '"&tishes##vas!*ibre-glass"%ctive",deicommissum$#lma$!s"\'eldsmen#"rs")fty-pound"#g.5#,hter-bombers%#in\'"!i"+libustering',
+    '"2n_de_si&egrave;cle#!a$#les%\'ization##bar#%dhorn#\'gerings#%itely##nie##tan"$ords$&entina$"io"\'re-bomb)"ed',
+    '%(watching$&brands$(crackers#%mlets#&st-leg%&fruits"\'sh-hook%$like$%house$(ing-line$$pond(!s##ted"&tzhugh")ve-course',
+    '%$inch%$page\'#rty%&strong%&wicket$%pence!"ki!"la#$gman##mer$$inia#%nkers#$tbed$(teringly#$unts',
+    '$&onoids%+ur-aversion#\'wlessly##xen$#man"$eadh#\'dermaus$&geling#)et-footed%%lands#%shing#%xural"#inn#(rtations)$usly',
+    '##cor#(odplains$,r-to-ceiling#\'w-chart"(uviatile##xus!#mlp!"nt!&ockin\'"&hrbeck"$ible"#lie%!s#&keting"\'malhaut',
+    '")odservice"(recasted%%ourts$\'fingers$$limb$%names$$ward$!x#$gers#&kbeard#\'resters#!s$%brand$#haw#$tean',
+    '"#uga#"la##r\'s$%-ball%&colour%&member"-wle/reporting"%xboro#$hall"$yers!+r&egrave;re""ae#%gilis##mer$$heim',
+    '&%phile&$vich$&gipani$#kel$%tisek#%scati#(tricidal""cc#!p"&ederik#(e-labour$$dmen$$form$&lancer(#ing',
+    '$%wheel#%idson#&mantle#"on#%tilin",idge-freezer#"nk#$sian##tes"$obel#$ebel#$gman#(mebridge#%ntera%,i&egrave;res',
+    '#\'itiness!&uerzas"#lda#&l-face%$rate$%arton$%erene&!s"\'mblings#&igated"&nbreak#&cinpec#$king"#rio#(tiveness',
+    '#"ty"\'zziness!!v!#wwg!"ym""ne#!n 8g&eacute;n&eacute;ration!#.e."$l.c."$w.r.!&abbana"&illard#$nsay""l.',
+    '$"na##lia%$frey$%onage#%oshes#$tung#(vanising\'$zing&&ometer$%eston"%mbale#"ey"(ngrenous#!n"$oled',
+    '#*den-master#$fitt#&nering$#ier#%otter#+rett/oxford$$otte(!d##ten#$vine"&s-fire$$mask$%phase#!b#$pard',
+    '"\'tecrash#$rell"$ucho#$dium"%vriil"!w!#ccs!%eagea#$roid"$bler"!f")lada-like#!l"1m&auml;ldegalerie")neralship',
+    '#&otoxic##til$#led"\'omantic"-rman-occupied&\'isation$\'inating#%rards"(ttysburg"%ysers!&gfhfb1!$hani"$olam!,iant-killers*#ing',
+    '"&ftware"$gant#"ot"%lmont"$mlet"&nsburg"!r##ran""sh##ors!)lagolitic"(enconner$%garry$%ister"&imcher',
+    '"$obex#"op#\'ssaries#(ucesters#\'w-worms"!p"&uckman"$ynns!"ms"#t+1!/o-as-you-please"+al-directed%%posts"#ber"/d-consciousness',
+    '##ric##wit"$ebel"&ffmann"+ld-coloured$+man-fristoe$%reyer#%liwog"(mbosuren#"er"&nville"\'od-luck%/neighbourliness$\'y-goody"#red',
+    '#&leston#(menghast"&scelin#$ford##lar##ney#$plan#"ub"%thick#"oh"%ulden#$rock"\'verment%3nment-to-government!#r-1',
+    '#)mm-rudman#$ndis$%uloma)$tous#"po$$ples#&ssroot#&ticule#*ve-clothes%&digger%#lle#%zings""b2"&eavsie#(co-roman',
+    '%$ford%%lands%%stead("in#$imas#%wcock#\'y-faced%%white"%icean#(gorovich#(ndlewood#&saille"#oat#!g#$ttos',
+    '&$crew##vey"$ubbe&!r!"sh!*uadalcanal&&quivir$"ix#%ranty"#bby"\'glielmo"%ichet#$llem%$otin#(nea-pigs',
+    '"%jerat"#les#$lane"$nson"$sher##set"#ten#%tered!%weder!$ybes""nt 0h&eacute;buterne!#.g.""h."#r.h',
+    '!$a-ha"*berdasheri#*it-forming#"re"\'ckworth""di"\'ematoma$&olytic"!f"$iler##met#%phong#%r-rig#$tink"$keta',
+    '#\'f-built%\'dressed%)expecting%%grown%&length%\'mortals%$page$$back$$ords#&lgarth$$ward"\'madryas#$blin#"di#&merton',
+    '$+shire-based##zah"+nd-coloured%(to-mouth%%woven$"er$#ier%"ly$\'maidens#$gdog$#men#"ka$"ey"%ppen."+rd-and-fast',
+    '$$yman#$gazy$$eisa#%leian$#ots##ray$%elson$$iett$#ows#%snett#$tlib##vie"%ssler#$tens$"ie',
+    '"(tcheries"#uer#"gh#&ntings"&viland"(weswater#$kish$%ridge#!s"(y-making#!a$#shi#$loft#&makers!#big',
+    '!(eadpiece$$rest$&stocks$&tenant$$wall#$rken$#ses$+t-searching&(to-heart#&tproof#(vy-metal""be"#cht#\'tically"%dgers',
+    '#!t"!g"(idensohn#!m"&lico-g$&otrope$$um-4#\'leborus"%nfaes##kel#"ze",patotoxicity"\'rbalism$"es#*n&aacute;n',
+    '##sey#(v&eacute$!e"*sitatingly"*terogenous"#uer#$ston"$wers#%itson#$orth"(xagonale$)methonium"\'yerdahl!"fc!"gv',
+    '!"ib#%ernia"$ckox"&de-out"*gh-calibre%)intensity%(latitude%*performing&$oint%(sounding%%value&\'elocity%\'waisted$\'er-paid\'$rate',
+    '%*y-regarded"\'ldegard%&nbrand#)l-walkers&#ood""m-#%achal"\'ndemith$&rances$&ustani#%gston"\'p-flask"%rings#$sute"\'storiae',
+    '!%la-a2"\'othhere!&mg-box!&nc/hnd!%oaxes")bby-horse#&goblin#$sons""ff$$nung#$land"%gwood"#kum"%lbeck#%dgate',
+    '#&idayed#(landaise$$ings$%owing$#way",me-ownership$$boys$\'ostatic$$site#\'ographs$#nym"%nasan#&oraria"$o-ha##fed',
+    '#$vers"&rlicks#$obin#*s_d\'oeuvre$&eflesh%$tail)!s$%field#+ticulturist#$vath#$wath$#ood"(spitably"%t-pot$$shot',
+    '"%ungan#\'r-glass#!s$)e-hunting&%proud%$room"*verspeeder"$witt"$xton!$p/ux"!f!.rad&ccaron;any"!d"!p!"sa',
+    '"#ien"!s!"te!%ulten"$mana#&bleton#*iliatingly#$mock\'!y#"or$%urous#(perdinck"#nan#%kered#%sbury',
+    '&#ian#$wick"&rdlers#$tles"%shing#$site"\'tchence!#wan!!y"&darnes#$rant$)ocephalus&(ortisone%\'dynamic%(genation',
+    '"+perdocument%+ventilating##hae#,notherapists &i/view!!1!$amcr!#bex"$ises"!o!\'ce-cool$%house#\'breaker#\'landers")onoclasts',
+    '!+dealisation"!s")yllically!#fas!$gnaz!"ic!"ka!&l-6dbp\'\'/nf-il6""ay"%lus.1!-mage-building%%works"(munising%%oblot',
+    '*\'romised\'+ytochemical"&pactor$"la%!e#"el%!s$$tigo#$iety#%loded#$ound#(recisely%"st$+ovisational##ugn',
+    '"#rie!\'n-jokes#(migrants#$rack")augurates$\'thentic"(cinerate#+ome-earning%(patibles$)nceivably\'"rt#*rimination#(ubations"(demnitee$%nting',
+    '$)sposition$\'viduate+!d*#ing#)octrinate#\'uctions"(efficacy#(luctably#*xpensively"$fact##est#(irmaries#*lammations%1tion-unemployment$&exibly',
+    '#,ormalisation\'.tion-retrieval$%world"$gvar"$here&!s#(ibitor-1#(umations"%kjets"(nominate"$rush"+sensitively#,ignificantly$\'ncerely#$ofar',
+    '$+rumentality#)urability")tellidraw$\'r-birth&,professional%\'calated&,onnectedness%(ferences(\'ometers%%jects%%locks%%media&%ingle((isterial%&nalise',
+    '\'*tionalised."ty%)pellation&\'osition%&ruptus%%spray&)ubjective%%weave#(onations#+ra-arterial&%party&(regional&\'uterine%\'colonic%&dermal',
+    '%&partum$&insics")ventoried$!r%*ness-shire%$urie#*incibility$&sibles!$ommi"#sco"!u!#pal""os!-ranian-backed"#f-1',
+    '"\'on-rich$$claw$)ing-board")relevancy$*proachable$(solution"$well!(s902-pcr"&cariot"&mailis"#ola#+thiocyanate"(sarapong"#vik!"t.',
+    '""ed#&mising!$vars#!z"#ies"&y-clad!)xmaritian!$zmir \'jacanas#&kboots#%obins"$ding"%ggard"&hanara"!i',
+    '$)ican-born"$rama"#sim"#van"#wed""ye!3ean-fran&ccedil;ois$$nine"(d-forest#!i"%nking"%phson"%sters#\'zenszky"\'tstream',
+    '"$vons"(wel-like%!l"#yes!%iahua"&ggered&(y-pokery"%ngled##ked!&oaquin"*b-creation#(lessness"!c#&kstrap"#ffe',
+    '##nes$$rose"$losa"#ols"(se-based##ias"$tter"$ules"(y-riding!"tp!%ubert#%ilees"%ggles#%oslav",ly-september',
+    '"$ncus##ius##ked (k-series!(aczynski"\'danwari$!r"$ffir#$tans"$hler"!l#&kadoon#$lias"#miz#"pf',
+    '"$poor"$raso#"ia#%kason#&lheinz$#off#"no$%stein#"oo"$shan##per#&zubian"#tyn"$yapo"%zakhs',
+    '!"bp!\'cal/mol!$eady#"nu#"ys"!f"&gworth"$lham#%loggs"%nmore#*nebunkport#*yapithecus"#ogh""sh#\'selring',
+    '!$halq!#iam##wah"%bbles$%utzim"$dman"&larrow#\'charran#&daltan##len%$rton#$more#&obytes#(roy-silk"%mmins',
+    '\'#ook&#ury%$hams%/ton-upon-thames#$king#$tail"+rkintilloch"\'sangani#%hinev#&simmee""th!"kr!&laxons"%ugman!$mart',
+    '"%icker\'&bocker#)ghtshayes#&tradar"$ower!&oevoet"#ffi"$hler"#lbe##oto")ninklijke#%stanz"$ogan#"ky"%uklia',
+    '"$vacs"#x19#"31!$raut#\'vchenko"&eitman"#iel##pke#\'shchaty"\'onstadt#$x-20!"th!#udu"%ehler"/nsthistorisches',
+    '#"on!\'vaerner!%wanza!"yr *l\'escargot$%taque#%urope!!-"$name!%.q.r.!$/min!#9th!)abour-led\'*management"*ce-trimmed',
+    '#%haise##ock#$tase##zko"$dakh$!s##har"%etoli##vis"&faille#0ferty/cheltenham#&ontant"%ggard#%oonal#%range',
+    '"$maur#$bada%%sting#"pi"(nceolate#*d-drainage%&owners%&rovers%$take#%gmuir#&optics#%sdown$#ing$#koi"\'oghaire',
+    '"*rgest-ever##isa##mes"*te-glacial%(medieval##ina$"um#&terday$\'icework"\'udatory#!e#%ghin\'\'\'g-stock#"re%*nt-perrier',
+    '"(vishness"(w-makers#%giver#$like#&making#$ther"%y-bys!"cr!&ead-in%%lined$&bitter$\'erboard$(ing-edge#(f-stalks#"ke',
+    '#&stways#(therette"(bensraum"#cky#$lair#%terns$(ureships""da##een"#ers"(ft-armer%(inclined"&goland##ume#$work',
+    '"&ibnitz#%shman#$trim"%jeune""ly"\'mington#"ke"$ngai"$page"\'rmontov"%t-out#(terheads$#in\'$"re""va',
+    '#"ee%!s"#xie#"us!"gv!$iane#$wski"&bation(!s#.eral-democracy%)tarianism&"on#$itum#%retti"\'docaine',
+    '#"ut%&enancy",fe-affirming%&jacket%$like%%story$$belt(!s$0span&mdash;user/"\'gatures#(htheaded(&rtedly%%nings%%water"#las',
+    '#(liputian#%ongwe"%ndane$"er$$ford$!o#)e-by-line$#han"&p-read#%osome#\'sticked"\'quidise"%sieux#%towel$#ric',
+    '#%anies#\'chfield#\'eralism#$hely#%tlest$"on"\'veryman#)ing-rooms"!x!"kb!$l.m."\'andinam"%iwedd"*oyd-webber!$oamy',
+    '#%otomy"%chain$%ranza$$side#(ker-room$&smiths"&ddiges#"en#$wick"%g-jam#%anair#%books#%ician$!x#%ogens',
+    '"&mbardo"(ng-drawn%%nosed%&period&&lanned%\'sighted$&benton$\'dendale$"hi$$inus$#ley$%staff$%ville#%icera"$ofah',
+    '"\'quacity"#tze"*ud-mouthed#\'nge-bar#$vois"$vage#\'e-child%\'letters$#day$%grove"\'w-angle$%sugar#\'er-cost&\'ranking$\'st-cost',
+    '##rie!"pf!"rc!%t-gen"&.-gen."!q!\'ucchese"\'llabies$!s"%mbago#\'inously#$pish"%ngful$!u"!s',
+    '##her$$ness#\'treless"#tea$$nist#&herans"\'xuriate!!v!#w60!#ydd"!e"&ing-in""mm"#nam#$ette',
+    '"$sons"$ttle ,m&aacute;rio!%-four!&.phil.!"/s!"12"%3mp18"!5!"74!%aanen#$rten#!s$"ai"%bbott',
+    '#\'cabaeus$\'onachie%$rmac#"es#$hado$"el%!n$(ine-made($tool#(kendrick$&innons#$leay$#ure#%nicol#&quarie',
+    '#%ushla#$week"\'ddicott"&galluf#$inot#*netization-!s&!o"$hesh".id-of-all-work$&enhair$(servants#"er#\'llotins#\'n-chain',
+    '#$read"%j-gen#&.-gen.#$oris"&lahide$$rkey#$esia$!t#*functioned#%hotra#"le%\'ability%!e"#met#$luks',
+    '#!s"(n-to-man##aus##dal$&elbrot%!r#$ette##fro#%gling$"on#&ically%%haean&#ean%!s%"us',
+    '#&jrekar#%mohan##nar##oir$!n$!s#\'sbridge$%iones#%tilla#$ucci$\'mission$$ring")p-reading",rble-floored#(ch/april',
+    '$"ie%&nalise*#ing$&uerita#$iage%%nella$"es$"ka#&mosets%!t#"sa#*t&iacute;n$#ica"$sers##ire',
+    '#%seuse$$iter$#oud#*terclasses&%fully"-t&eacute;riel#&agalpa$!i$"ta#\'chboard\'#xes#(ernalism#,in&eacute;es#$thau$#ock',
+    '#"zo""ui#+l&eacute;on#%nsell#\'passant##rer"%vinga"$wgan#!s"$ymyo#&sfield"%zarin#$zini!#bes!%cafee',
+    '"&callan$*rty-cooper"&donagh"%eniff"\'farland"%gegan#(illivray$"nn%"ty#%ourty#$rain%&w-hill$$eevy"\'kiernan$$llen',
+    '$$skey"&murray"%namee#&eilage"$owan""ps"%quade!"da"!d"!r!(ea_culpa#(dowlands&%sweet##ger#*n-spirited',
+    '$"ly#(sureless#(t-eaters$$loaf"&dially%&stinal%$tory$"co$\'evalist#$line"$egan#*ting-house"&garian$%store$%tapes',
+    '\'!s""ik""ks""la$$ncia%&ocytes#%chior##ges#$land$#ish#\'odramas"$nage%#gio#\'dacious$%elson',
+    '$!s#$inga#!t"#ola")rchantman#$ibel##kut##rin&$gton#%senne$$tham"&shwork##mer#,nil-sur-oger#&siness',
+    '"*talworkers$&stable##hil"#zey!#hic"$oira!%iaows"\'chelham&#son%!u#-ro-electronic%&cosmic%#fit%%grafx($mmes',
+    '%$worm"\'d-1850s%$940s&"87$\'evening$&fourth$%hants$%month$\'to-late%&welfth#+dle-classes\'%range&%class&%ditch&)sex-based',
+    '$"er#*night-blue"#eux"%grans"%lbank##ena#$haez%"ud#(itarized$$ukov##ker$%maids#\'lerhill%&simals$$ings',
+    '%%volts#!t""md"&nd-set#(esweeper#&i-boom%%dress%"lp$(aturized$(stership##pin#"ty"$quel"%ronov#(thlessly',
+    '#*adventures$(lignment$\'nthropy$*pplication#&chance$+onstruction#)diagnosed*"is#%erere#"si#\'ty-eyed"#tac#&chells#$ogen#!t',
+    '!"k1"(hedrioni!#lle!&oaouia"\'bilises"\'ccasins#\'k-tudor"(difiable&2cation-records-are"%gadon"#ire"$kosh"#l-1#%ester%&worths',
+    '"#mlv"#nad$%rchic#*ey-spinner%#men#%grels#$iker$!z#$kish#&oamine$%meric$*polization#%santo#%tages$&edison',
+    '"$oing#"ty""rb#$isot#$ozov\'!a#$rice##ten$$ises"*scow-based#%edale##her#%imann#)stroopers"*therfucker',
+    '%%boats#$toes""ue#(ntsorrel##ses#+th-to-mouth%!y"$yola!#p-1"%/home#&shadow"$e/ix"!o##wer!*sc/diploma',
+    '"!p!%ucker""dd"$ffet"#ker"\'lchrone#%grave#%house##ier#&lingar\'!s#*ti-billion&*divisional&$form&.million-dollar',
+    '&%point&$site\'$tage&#way%*divisional%$flow%$load%\'pointed%&vendor"\'m-to-be#"bo#$mers$)ification#\'s-to-be$!y',
+    '"%nchen#$ding##row##son#%teanu"$onic"$rano#$chie##rin$!y"$sawi#(cularity#"os"&tagens#%inied',
+    '!%xenge!&yeloid"#nne"\'oglobin ;n&aacute;m&ecaron;st&iacute!,-acetyl-5asa!#.d.""h.!"/a!#=12"!9!&abbach""ch""da"%haman',
+    '"%kedly")mby-pamby#\'eplates""pa"#qvi"%rayan#\'borough##ked#"ok#(ratology\'$rial$\'ow-eyed##vik"(s&amp;fu"#tch',
+    '#"ro#%urals%"el%#ist"#ver!#cdl"#oap"&p7:dna!"d1""ah!#eap#\'r-fatal#$sden##ten"%bbins',
+    '#+uchadnezzar"%chaev#)romancers#&tarine""dc"*ighborhood#"ld")matodirus")o-fordism$(gaullist$(romantic#(tropical"$pmen"(sselrode#&torian',
+    '"%tters#*work-based"(urogenic%\'logists%*scientists#%stria"&vinson"$wbon#$land$*y-acquired&$born&#wed"$zzar!#fis!*g/&micro;l',
+    '!#hmf!&icolle$!s$%tinic""da#\'derdale""el"!f"\'ghtspot""ko$#nos"#les"!m#"mo"(ne-point',
+    '"#sbi"-trogen-fixing&(lycerine""ve"$yogi!#klp!"lj!&o-ball$\'oundary#%fault#,holds-barred""am"&blenet%#sse(\'_oblige',
+    '",de-link-node##osa"!e"#ire""li#!l"(minalism"+n-addictive&&herent$*biological$,co-operation&*mmunicable+#sts&(nforming\'(tentious',
+    '%/rystallographic$*essentials%$vent%&xperts$(familial&"rm%(ictional%#ood%)unctional$\'genetic%%reasy$,instrumental$\'lawyers%&iteral$&marine',
+    '$)objective%#pec\'(rational+"ve%&rganic$+participant%(roducers$&random%)eciprocal\'(ognition%\'ussians$\'sailors%&cience)%tists%%oviet',
+    '$(taxpayer$$unix$(verbally$$wage#"ce#)inverting#&jurors##nie#"ya"$onan#!r"%rmale$*oglycaemic#%thend$.on/oxfordshire',
+    '%%wheel$&bleeds#$odes##tic$\'radamus%#ums"*tice-board"$ugat"/vember/december"#yce!#pka#!c""vs!\'ucleons".mber-crunching',
+    '%%ology#%inous"\'nneries#!o##zia"&ptials"(rsemaids#%tures"$tley"!x!"w6!(yasaland"*mphomaniac"\'stagmus (o\'briens',
+    '"(donoghue"%harte#&iggins"\'riordan!#.g.!$adby""ky!%bando"\'bligato"$erst".ject-relations&#ify\'\'vity/db",structionism!\'cchetto',
+    '"!k".tober/november!#ddy!/esophagogastric!+ff-broadway$(the-ball($wall##aly#&ertory#(handedly#)ice-block%+ial-looking#%piste"(t-quoted!%gaden',
+    '"$lers!%jomoh!&khotsk!$lave"#bia"\'d-guard"&igomer#"ns""of!#mbo"#nia$%point$"um"!o!*n-the-road',
+    '"$dine"&e-mile$&nation$&roomed$$step&$roke%\'yllable"*omatopoeia!$oooh!%p.amp"(alescent"!e#$nodb$\'windows#%rable',
+    '"(hiolebes%\'pristis"%ossum!$racy#&ngerie"#bis"#chy""de#-inary-looking"&efield",ganometallic"#igo"%leton"%vieto!"s/',
+    '"#cli"$lear"+teonecrosis%%paths$%rtagi#(rogothic!%tteri!&usmane"\'t-going$*manoeuvred$)of-favour$\'perform##age#(cropping#(flanking',
+    '#$lier#)migration#)placement#%rider#(spokenly#(weighing$&itting!)ven-ready#%r-40s%&active%\'crowded%)developed%\'exposed%&mighty%)provision',
+    '%&simple$\'booking&#rne$&charge$$draw&$iven$)estimates$&flying%#ull&%nding$%hears$&looker$&mantel$(reaction$&sights',
+    '&%retch$&thrust$$used"#ina""no!(wn-brand#,er-occupancy!%xbury"%idant"%ygens#%tocin!"ye!/zone-destroying 2p&acirc;t&eacute;s)\'isserie',
+    '!"+p!!-""51!#.21"!9""e."#l.c"!o!"21!!8!#=ns!&aasche"%checo#&ifying$!s',
+    '$$wood#\'litaxel"&ge-boy#\'ination"!i#"gc#!x"#jot"(le-green#%liser$!s#)m-fringed$$itic#%omino"\'mphilus',
+    '##cho#%darus#&ellist#(hellenic#%tries"#pas$#ver#\'erclips"&rafoil$&glider$&maribo$%noiac$$quat$\'sitised$%tenic',
+    '#%kwood#%medes$(igianino#%retti#%t-way$"ic$%ners.$&y-goer"&ssably%&caglia#%te-up%%board%*l-coloured%$rnak\'!s',
+    '#"en#*hogenicity$%works#%inkin##ras#$ties"\'uperism"$vitt#%lovna##ord"\'ying-in#%phone#.roll/personnel!"bi!"dm',
+    '#"rn"%chman##tin"\'diatric#$rosa#%uncle"$gler"\'ll-mell$!y##ota##tae"$mber$#ury"%n-pal#"ck',
+    '$%ulous#&n\'orth$!a$%ywell&$orth#%point##sby#&tagram%%thlon")rcolating#"du#(fections("ve#\'idotite$)pherality',
+    '#,pendicularly%\'tration#%ryman#&singer$$onas&*ifications$)picacious*"ty#\'verting"%scara"&terloo#$ites#)ro-dollar%$vsky#$unia',
+    '!$h8.0"\'alanges\'$ists#+rmacologist##sic"#cns")ilanderer$#ipp$%lario$\'osophie*$sing#&vcg9.9"!o#&ne-box#!s',
+    '&\'orylate*\'choline#(tometric&)ultiplier%)receptors##une"+renologists!(iagetian#&nistic"&ck-axe$\'et-line$"in#!t"$ddle"#eda',
+    '#"tr"&ffetti"&g-iron#)eon-holed+!s&$hole"&lfered#\'lar-box#%tdown"&n-down#\'cushion#%dling#)k-cheeked#$tsch"\'petting',
+    '",ston-engined"(tch-dark%%forks##men#$tman!)lainchant%!e#"sm$&terers#"ta#$ytex"*ebiscitary#"ck#\'onastic#%xuses',
+    '"&iatzky"\'ugblock$$gers##mer$$mets$#per!*neumocytes"!m!(ocketful"%dmore"&idevin"&leward(!s#+ice-officer%\'ymaking',
+    '\'!t%+icoeconomic#"ke#&larded$"ok#*yacetylene%$mide$\'centric%%yclic$&gnotos$(morphous"$mona#&padour"%nchos##tus',
+    '#!s"\'pinjays$$olek"&rkkala#*nographers#$tend$!h"\'session$"ur#+t-artisanal%%basic%)conciliar%\'fordist%(prandial%&second',
+    '%(thatcher&,ranslational$#bus$!e%&riorly$%pones$&urings")tamogeton#%eidan##nia##osi#&sdamer#$tage"(uch-seat"*wer-hungry',
+    '&&tation"#zzo!"pe"!r!,r&eacute;cis*%ludes#,iacute;ncipe"$atap$#ley$!s#(yerfully"+e-eclampsia%$mpts$*licentiate&"fe',
+    '$\'payment$*qualifying$,registration$!s%\'entence%(pecified$$wash#*cipitously$(onscious#(dynastic#*industrial#*medication#)parasitic%&yments#&saging',
+    '$$sman%\'urizing"%iapic#+ce-earnings#\'esthill$"ur#(miparous$.us_inter_pares#\'ntmaker#(son-like#)ze-winner"*o-abortion$\'israeli$\'noriega##ast',
+    '$!s#(colipase#$dder$\'igality$-uct-container#&ferens$$fers$&itless#*ject-based(\'related#$ksch#)lifically#*miscuously#$nged#*phetically',
+    '$*rioceptive#*selytizing$$pekt$)tatectomy\'$itis%%hesis#%tagon$*ectionists%\'in-rich%(oglycans%&rozoic$!o%)-oncogene.!s%%plasm',
+    '#.ven&ccedil;ale$)incialism%#ral##wse"\'urience!#sdi"!e#+udoaneurysm&$cyst*!s"!w"-ycho-analysis&,geriatrician!"tr!.ublic-spending',
+    '%#que"%ckers"$dney#!y"%ffers"#kka"$ller$$mans#$ping#(satances&!e$&e-rate")mp-action""na#%chbag',
+    '"+r&eacute;ed#"is#%kinje#+posefulness$#ura#&veying"\'sh-bike$%overs!$yatt"&roxene#%uvate %qajar!"cs!#emm!"om',
+    '!!s!&uad-fx$%ruped#!l#\'ntifies&%tated#$rrie"\'eenside$#rly##rcy$\'ulously##zon"*ick-drying&$fire%$fire',
+    '#$eted#%gleys##ncy$$nell#$tted"#oth$%idian +r&eacute;my!"-2"!r!#.l.!*3000-based!)acialized"*dio-active&*controlled',
+    '%%genic%,immunoassays%)logically"&felson#$fled"%gging#+s-to-riches"%iment#"tt"#jah"$legh$&mbergs"*machandran##esh#%sdale',
+    '""oc##ult"(pperswil#%unzel"$sher$&idiyeh#!k",t-1/c-myc-er$(infested$$race#(hcreedan#%tigan"%whide"#xco"$ynal',
+    '""za$!k!#bai!"cs!"d.""pc!*e-analysis$(ppraisal$&rrange#*definition$\'irected$!o#(employed$$quip#\'located',
+    '#)presented#*registered$&outing$#uns#\'started#$take#&worked$$rote"*absorption#(gan-bush$\'gregate#"ls#&ppoint#$rdon#%waken',
+    '#&eipted$+ssion-proof#$heck\'"ed##ife$)rculation$\'tations#(lusiarch#(ognisers$%mpile$)nnoitring$&upable#%usant"(d-legged$%nosed',
+    '#\'iscount#$oing#&shifts"%efing#\'lection#*stablished"(fillable#)oundation\'"ed#&ractor$%eshes$\'igerant#(utations"#gia$!o',
+    '#%olith##row"!i#%mpose\'%ition#)ntegrated"*juvenating"#khi"$lais$$xant#&isting#"la#(ocations",mington-hart$*ssion/mild',
+    '#)onstrance)$ting$%unted#"us"/nationalisation$"ud#!n$"er#&ounces#$ters"(packaged$&irable#(ertories#"os#)ressively',
+    '"-qualification"%redos$(gulation"(scinding#&onated#)pirations$%onder#%tarts$(ructures#%ubmit"$tell$$sted#(ractions$$ench$)oactively',
+    '%(spection+#ves"/vascularisation##ile$&valism"&ynalde$%tiens!$fsfr!\'hematic##umy"\'izobium"$onda#(s-on-sea!"i1"\'chfield',
+    '")ght-sided%$most"#lke#!l"-msky-korsakov"&nehart#\'g-fence*!d"$shon#)k-neutral##que#\'torante"%tblat"$vlin#$onia',
+    '!"me!#nvr!%oache#"ms"&berton"&ckface$)ing-horse$%ville"#die"$emer""fe"&gachev"#ith"+manticising%"um',
+    '"$ngji#$nies"!o#&f-rack#$kies#$ming#,t-and-branch"%scoff#%e-red$%haugh$%nblum##ier#%kilde#\'sington#)tropovich',
+    '#)undifolia"&ughing%$land#(l&eacute#\'nd-eyed#\'ssillon"1wbottom/reporting#&diness#%thorn"\'xburghe(%shire"#zos!"ps!"sg""vp',
+    '"!v!+ubber-soled($tamp#"ia$!k$$slaw"%dolfo"%geley"\'lership"#mps"%n-ins##nel$(ing-mate\'!s#&s=0:05',
+    '"!s#$hden$%worth#-son/reporting#*t-coloured"$tger#"li"$xton!"yr"%utaro \'s&amp;l&!n"&igrave!!\'!$-100',
+    '"$9(1)"*cerevisiae!%14(3)!$3(2)"!1!$4(1)!#663!$abra"+ccharomyces#+kville-west#&riston"%dists#$leir#&nesses#&ruddin',
+    '#"ra"#ggy")int-savin%"ed"#kti"&lcombe#(icylates#\'oon-bar$&pettes#"sa#$ting#%vages$$esen$$iati"#man',
+    '"$n\'aa#&atogen#,chez-vicario$"ti#&d-eels$\'castles$&erling$%hills$"oz#&itized#$kara"\'racenic$!n%#don#$coid',
+    '#!o$#ngs"#tis##tar#"ya"%uguet##nby",wbridgeworth"#xby!\'cabrous#$lars#%mpton#)ndalously$$nell#"pe',
+    '$&ecrows$$face$$rott#)tological"!b""cc"+hadenfreude#$ists#$lick#%maltz$"id#"on%$feld$,ols/industry&$yard',
+    '#%uller$\'tzkorps"+intigraphic"$offs#\'resheet$"ia#$tcat$(t-scobie%)ish-based#&urging##wls"#ram$%wling#!c##eed',
+    '#(ibblings$\'ptorium$#ven"#uff#\'lleries$&ptress#"ti!\'ea-blue#%coast##ley#$mier#$nces#&planes#\'thwaite"&ceding',
+    '#)ond-guess#)retariats&"in\'$vely)$ness#"s.#\'tioning#(ularised(#zed".dimentologists#\'uctions"&edings##the"+gmentations"$idel',
+    '",lected-issue$$ucid#/f-actualization&*dvancement%+centredness%)deceiving%&images%\'massage&)otivation%*perception%(scrutiny&&ealing%$will)"ed#\'lotaped',
+    '#$enov#\'i-colon\'(nductors%&double%%naked&&omadic%(precious%(tropical""na#%dings#$ghor#"ta$%ience"(parators#&hardic',
+    '#!p#\'tuagint"\'quenase&$cers$"in"&rbians##evi#-jeant-at-arms#%rigny#%vette$*ice-sector"$selj"\'t-backs#,tle-carlisle"(ven-hour',
+    '&&strong$,rity=warning")x-starved!"fp!#had$$ings#$kin\'##lev#(me-faced#%ndong$%khill#*pechangers"&e-wolf#&athing#"hu',
+    '%$rick#!m#&nfield$!g#&ppards#\'tlander#"wn""hd"%iatsu#(bboleths#!k#$ndig$$taro#%plake$$quay',
+    '#%eless$&making#$oing$(t-\'em-up%#out#\'rewards$(t-horned&\'pitched&&tailed%!y#%t-gun$\'termill#+ulder-width##ves#)w-jumping',
+    '$&casing"&rewder"(ucksmith##kla#$nner#!r#$shed#(ttlecock!&ickens$$ling$&nesses"\'d-ahmed#%combe##dhi$#ons',
+    '%"on%$slip$%steps#!t""eg"\'gnaller")hanoukist"%khism"\'lcaster#&encers##kin"*m&oacute;n#"ex##nel#&onides',
+    '##per"#nes#(g-a-long$!e%,r/songwriter$#in\'$#le-\'(employer\'%stack)&randed"\'paseuth#$hons"$rnak"*ssinghurst"\'tuating',
+    '""wa"(x-storey#&pences"%zzler!#kat"#eet#&ptical"*inningrove#\'ppering#%ttled"%ulked"%ywalk!(landered\'#ing#%pdash',
+    '#)ve-owners""ee$#kly$*p-deprived$%tburn$$ving#$wing"!f#!p")ide-rules#)mmed-down#%p-ons%#ups$%house$&stitch',
+    '"$obin#!e#$gged#(w-witted!+mall-animal\'#rms#&rtened"%elted"$iler##rks$#nov#%thing"-oke-blackened"&udging!(nakebite',
+    '"(eeringly#%lders#\'tterton"%iffle"&oopers!(oapstone")cialistic$*opolitical""es"+ftly-softly"+ir&eacute;e"!k"&lingen$%tudes#!l',
+    '#$utes"$mare#%erton#&melier%!r"&ngbird%#ook"+phisticates"%rrell##tes"(u\'wester#\'briquet#$hais#&lfully$$mate',
+    '%%board#+p&ccedil;on#$tane$-h-east-facing%$down"!x!(paarndam#(ce-based%#bar$#ial#$nked#)rcclassic%%works$&e-time$#ser',
+    '"!c"+ectatorship%,rophotometry#)echlessly#)llchecker"%heris#-ygmomanometer$"nx"$ikey#$ller#%nelet$&nakers#"tz#!v"\'litters',
+    '$"sh"%ondon#$oler#(rtcentre#(tlighted"%r/ssr#&acklen##oat#$uced"&ufford"%y-fly#%glass#$hole!&q._ft.""dn',
+    '$#lly$$shes#%elchy!"rv!"s2"#ats!&t-jean")able-yard#"de#*ff-student#"gg#&irhead#%llard#%ndbys$%field',
+    '$$wick#+phylococcal$#ler&$tons#&r-like%(spangled$$kest$$less$&t/stop%*ing-points$&veling#)te-of-the%%craft$&ically$!o',
+    '""ds"*ead-carter$(m-driven#%eping%)lechasing#!f#\'inlager#"le$$lata#!n$#nis#*p-daughter$$hano$&ladder$&ped-up',
+    '#)reophonic$&ilizer#/wart\'s-melville"\'ichting#%llman$!t#\'mulator##nky$#son#%ppled"(ocklists#%lojan#-mach-churning#\'ne-cold&%faced',
+    '#\'ragetek$"ia$&y-line%$time#%thard"\'radling$"fe$*ight-sided($ness%$ners%\'t-laced$,tificational#&eetcar&$lamp$)ss-strain',
+    '$#wed#$iate$+ke-breakers&(breakers$$mmer$)ngfellows#\'oganoff$$icim$&keplay$"od$!p%"he""uc#(dent-led#,mbling-block',
+    '$$ting#)pefaction&$ying#%rdier!+u&ntilde;er"%asion"(b-arctic$*categories%$lass%*ommunities&\'ntracts$&fields%$rame$$king$$plot',
+    '$\'regions$)strategic#\'alterns$)ssemblies#&clones#%field(!s$(ractions#%human#&limate#/marine-launched)!r#\'poenaed%)pulations#(rogation',
+    '$*tantiation%$rata&&ucture$$umes#&tenant$$ilis"\'gar****%\'-coated"(icidally"&layman#$fate#$ivan#&phonic"&mburgh#$mond',
+    '$\'lounger$&warmed#&burned##dew#$pics#$wing$$orld")per-human&)sensitive%\'antigen%$cars%&fluity%%group%*intendence%#mac',
+    '&)titiously%&tanker%%woman#\'pliants$\'ortable%(sitories$\'urating""ra##tax"*ssex-based#(tainably\'"er"$zuka!%velte"!p',
+    '!#w11#!h#!v#!x#!y"&affham#&nsdown##rds$!t"$eeny$)t-scented%#ish"$illy#%nburn$%derby',
+    '%#ler$"es$$ford#(tch-mode&%blade!\'yagrius"\'baritic#%illin"(llogisms#$vain%#nus$%estre"\'mbolics#!e#%patex',
+    '"!n#%-pla2#"ch%&ronism#%opses#)thesizers")stematics)#sed!$zasz -t&uuml;bingen"(yacute;n!#-72"$bone"&shaped!#.j.',
+    '#"os#\'tlessly($ness"%ibach#"ga#%lgate$$wind#(z&eacute"&koradi"\'labheim#\'leyrand$$ness#"vi"$mayo#$iami',
+    '#%field#"ja#\'nenbaum%$ries#\'zanians",pe-recorders+$ings#$pers"\'rantino&!o#&diness#"ga$%outai#&ragona$#ing',
+    '#&varian"$scam#)k-related#$ters$#ier")ttersalls"&utness"#wse"+x-collector#%i-ing$#cab$#way"%zarbu!"be!"df',
+    '!&ea-cup$%table#,cher-in-role"&e-shot"%icher"+lecomputing$#fax$%puter$$type$&verket$#xed")mporaries#\'ulentum""n-$#huc',
+    '&#und#$bury#&sional\'"ed#$ured"*rephthalic#"me$\'inators#%rapin$"ie"(st-tubes"%tanic#!e#&hering#&sworth',
+    '"!w"(xt-based$%ually!"fc"$iiib!&h\'bist"#at\'##yer"$eale#)ophrastus#!s$(saloniki"&ieblot$!n#\'gh-high',
+    '$%gwall#*rd-quarter$(ty-fifth"&omason#$rold$$vald#.ught-processes"&rasher#)ee-letter&(storeyed&&tiered#\'ow-back"%styme"(umb-nail%&s-down',
+    '$$good$#ley"$wack##ing"#y-1!&ianjin""bi"\'e-backs#%ntsin"#ghe$(tly-knit"$lden"&mbuktu#\'e-based%%space',
+    '$%works"\'nctures##dal##ges##kly#$tawn"&p-offs""so#\'sington$"ot"(tchmarsh%!y$#omb#$ling"/xier-vignancour',
+    '!"md!)o-and-fro"%/from"%ccata"$ddle$!y"#gas##ged"!i#"ng"(kenistic"&ledano$(rability#&stikov""mo',
+    '"$n-up#$e-up$!y#*sillectomy$"on$$ured##ton""on##ted")p-scoring%\'ecurity##eka$!r#,ic-prominent#"os',
+    '"#rcy#"do##mey#%rente"%ss-up"-tal-chromatic#%emism#!p#$ters"%ucans$\'hstones#$ghie#%jours#%rette$$isty',
+    '"$wage"(xicities#0oplasma-specific!#psa!\'rabants#)cheostomy$"ie#.ditional-style#\'fficked#&gedian#+ns-european%(caucasia%&ferase(#rin%\'lucence',
+    '&(ogrified&#ute#(umatized#\'velodge\'$gues%$rser&$tine"\'edworth#\'e-trunk#(nchantly#"ss#\'urnicht#\'vithick"&i-star#$anon',
+    '#)chogramma$(kle-down$$olor%!t##fid#\'geminal$!g#"ke#$nian#%pling#\'slander##xie"#odd#&eltsch#&picana',
+    '#\'tskyism#,uble-shooter$%ghton$%ncing"!u#\'culence##die#(mpington%#ton#%ndles##ong#%ssing"(y-scorer##pan##sts',
+    '#!o#&ritsyn"!w!"tx!(ubercles&$ulin"$cuxi"%ghluk"$llis#"se"!r#&n-over%"up$#ell$$outs',
+    '#$rell"(shingham#%sling"%t-tut#%elary#"si!#vrs!)weedledum#(lve-hour\'$note#(nty-foot"&iglets##tty#"xt")o-address',
+    '$%fifty$\'handled$$note$)phases-on$$shot$%three%#ime!!x!%ybaot"$pe-1##hoo#!o"$rian!*zannetakis \'u-matic',
+    '!"18!#21s""51!+biquitously!"cs!#dgs"!p#!m!#ffe#!z!#gcc!"k.!"la")trasonics"!u',
+    '""wa##elt!)n-british"*affordable#)pologetic$*preciative#*rticulated"\'branded"*called-for#*eremonious#\'oloured$+mplainingly$\'nvicted$"ol#&reated',
+    '##url")decorated$\'finable$$r-11\'!2&"25(!s&*investment%)achieving%+consumption\'$oked&#uts%\'drawing%\'letting%&manned',
+    '%%shirt&$kirt&\'pending&%tates\'%udies%)thrusting%&writes$(servedly#-iscriminating"&edited"+fashionably#)ertilised#*orthcoming#%ramed#$ussy',
+    '"&healed&%thily$$roic$(sitating#&itched")icellular$$ycle#$data$*imensional$!o#.formitarianism#&mation#*nitialised#(t-points$$ised',
+    '$/ersity-educated##xes"(kindness"\'learned$%vered#)ikelihood#)ooked-for#!u$&ckiest"&mapped#+erchantable"-parliamentary#%eeled$%opled#+reparedness',
+    '&$ided#)ublicised"*quantified"%ready$\'ceptive$(solvable%(pectable".satisfactorily#)easonable#&ighted#%ought#)timulated%\'ntingly"(talented$&ngling',
+    '#)hreatened"\'visited#%oiced"&worked"\'zipping!)p-country#%ended#\'to-time"\'braided"!i"&percut"%slope!%ranyl")ban-based&*industrial',
+    '"#ner!.s&dollar;1,200++.00=252.863+&00,000+*50,000,000**20,000,000+"50*"30*%5,000/$,000**70,000,000"*-sponsored"#daw"\'e-value#.r&mdash;input/',
+    '"!p#"ga"!r!%thman!"wc"!p!#zum $v.-c"$a.t.!$/386!(accinate#$uole"!g")lediction$%ncian',
+    '#)policella".n-d&uacute;nem#(dalising#%quish"\'porized%#ous"%quero""r.#,iable-length%\'tionist"(sculitis"(uxcelles!"df!(e-hickle"$gans',
+    '"$lars"+nd&ocirc;me$#ian#(ereology##ner"\'randahs#(b-phrase#)de&tcedil%#lot$#ure#%ifies#/kehrsberuhigung#(naculars%!l$#ier',
+    '#*sification$%tehen#"te"\'spasian"%toing!%ialli#$nney"\'carages%"io#(eroyalty#\'timless$$oire%*rian-style\'!e""de',
+    '"&ewable"*llahermosa$$eins$!s")ncristine#%egary"&oletta"\'rgilian%$nian##ial#%ology"/sceral-specific"$tals##old"\'viparus',
+    '#!d#%minck!"mc"!p!,ocalisations"&icings#$ders$#ing#!e"$lans#)canogenic#%kstag#$pone##sky#)untaryism',
+    '*$ness$"te"&ronezh"#tre"\'ussoirs"%yeurs##sey!$pdpr!"r6"!x!"sg!#t2x!&ulgate$#rin /w&lcub;211&rcub',
+    '!#.a."!c""d.""s.!"1p!!3!!4!&acc-ar"#hey"%ilers#%tangi"%ke-up$$ling""ld#&kowitz',
+    '##mer""nn$#abe#%sbeck#$tin\'")r-damaged#$boys#\'dington#%paint%"th#)rant-card$"ed"\'sh-hand$%board$\'ed-over',
+    '#%tebin"%tchet#)er-clocks\'%ooled&\'meadows&%wheel%#aid%$less%%marks&%elons&$ills%$ship"(ve-crest%$like$#cut',
+    '"%xwork"&ylands!#c1x!(eaklings#\'therfax"!c"%ddin\'"$evil"$gman"#ick#+ght-lifting&#man#&nstock#%rwold#%skopf',
+    '$$sman"!l#&l-born%\'crafted%(disposed%(produced%*researched%(scrubbed&(upported%(tailored\'#ken&%ended&*hought-out%*ventilated$&ingham',
+    '"!m"$ngen""rt")st-facing$$lake&#nds"\'t-nurse$\'weather#&herell#%suits!%haler#&ngarei#$tman$\'sisname"\'eatears',
+    '#%ndust$$gers$%nying#&psnade#&skered#&tcombe$+e-dominated&(knuckled&#out&&rumped&%water%%cross%#man%"st$$leys',
+    '$\'tlewood"\'odunnit#$rled!+icket-taker"*de-mouthed%#set#&thways"$gner##ram##wam")ld-caught#%letts$,iams-renault$%sford#$mott',
+    '$%onian"%mbush##ple"$ncup#$dbag$\'cheater$$eyer$#ies$#ley$(ow-boxes\'&frames\'%panes\'(shopping&$pane#)e-growing',
+    '$%glass#\'g-beats$$tips#&kowski##son#$tach"%sdoms#\'ecracks#\'senland##tar"$thal#*watersrand"!x!#nas!(olfcraft',
+    '$&hounds#\'singham#\'verines"\'mankind"(ndrously")odcarving%%utter$$gate$%louse$$shed##key#%lston"\'rd-list#(ksurface#"my',
+    '!$pbsa!)rathfully"&eckers"!i#*gglesworth$#hts\'"on"%oclaw!&tewael"!h!#ych"$mott"*n-rajathuk %x-100"$clan',
+    '!#alt!"f7!"li!&stones!#uan \'y-cells!!2!&a136e7"$coub"#hoo"$kuts"\'maguchi"!r##die#$wood',
+    '"#zdi!%eager#)r-by-year$!d"+katerinburg"*llow-brown&#fin"%menis"$rkey!&israel!!n!$ogic""na"&rkists$+shire-based',
+    '""u\'$!d#)-know-who##att"%xford!"tm!!y ,za&iuml;rean"#far"$grat""in"$ller"%nskar"(rewitsch!#chn',
+    '"%naida""pa"(ro-based%%point!#hen!\'iggurat")mbabweans""ne"%rcons!%liten!!o"%diacs"#hra"$ltan"$uche',
+    '!\'ulfiqar#\'u-based$$land!&wemmer"%ingli',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_15 = (
+count_15 = 6694
+
+heads_15 = (
     '&bgr;-galactosidase',
-    '&dollar;0.18',
-    '&dollar;0.80',
-    '&dollar;1&ndash;1.5',
-    '&dollar;1.45',
-    '&dollar;1.71',
-    '&dollar;1.91',
-    '&dollar;1.93',
-    '&dollar;11.6m',
-    '&dollar;140,000',
-    '&dollar;14m',
-    '&dollar;170',
-    '&dollar;19.95',
-    '&dollar;21',
-    '&dollar;27m',
-    '&dollar;28m',
     '&dollar;3,000m',
-    '&dollar;3000',
-    '&dollar;33',
-    '&dollar;4.4m',
-    '&dollar;4.6m',
-    '&dollar;4.7m',
-    '&dollar;5.2m',
-    '&dollar;6.7m',
-    '&dollar;650,000',
-    '&frac12;oz',
-    '&frac12;p',
-    '&frac12;pt',
-    '&lsqb;t&rsqb;he',
-    '&lt;config',
-    '&lt;del&gt',
-    '&mdash;that',
     '&mdash;which',
-    '&ndash&pound',
-    '&pound;1,720',
-    '&pound;1.',
-    '&pound;1.85',
-    '&pound;1.98',
-    '&pound;10.25',
-    '&pound;106',
-    '&pound;114',
-    '&pound;126',
-    '&pound;13,500',
-    '&pound;132',
-    '&pound;137',
-    '&pound;140m',
-    '&pound;147',
-    '&pound;156',
     '&pound;190,000',
-    '&pound;230m',
-    '&pound;25.50',
-    '&pound;259',
-    '&pound;278',
-    '&pound;3,300',
-    '&pound;325,000',
-    '&pound;37,000',
-    '&pound;4,700',
-    '&pound;4.2m',
-    '&pound;4.4m',
-    '&pound;44m',
-    '&pound;5,800',
-    '&pound;5.20',
-    '&pound;560',
-    '&pound;6.8',
     '&pound;62,000',
-    '&pound;65m',
-    '&pound;71',
-    '&pound;72',
-    '&pound;76',
-    '&pound;88,000',
-    '&pound;8bn',
-    '&scaron;kr&eacute;ta',
-    '\'64',
-    '\'76',
-    '\'appens',
-    '\'avin\'',
-    '\'twas',
-    '**new',
-    '*a',
-    '*john',
     '+&frac12',
-    '+/+',
-    '-c',
-    '-calmodulin',
-    '-dropping',
-    '-hairpin',
-    '-ii',
-    '-in',
-    '-microglobulin',
-    '-rays',
-    '-sam',
-    '-strand',
-    '.7',
-    '/&agr/',
-    '0.11',
-    '0.24',
     '0.49',
-    '0.65',
-    '0.77',
-    '0.84',
-    '0.93',
-    '0.96',
-    '0001',
-    '0244',
-    '0265',
-    '0295',
-    '0628',
-    '0702',
-    '0830',
-    '1&bgr',
-    '1&deg',
-    '1&frac12;oz',
     '1,650',
-    '1,700,000',
-    '1-k',
-    '1.26',
-    '1.28',
-    '1.4-litre',
-    '1.4.5',
-    '1.67',
-    '1/6',
-    '10&ndash;8',
-    '10&shilling',
-    '10-6',
-    '10-hour',
-    '10-man',
-    '10-month',
-    '10-strong',
     '10.14',
-    '10.50',
-    '1008',
-    '100cm',
-    '100ngml',
-    '102,000',
-    '1090',
-    '10d',
-    '11.14',
-    '11.6%',
-    '1118',
-    '1148',
-    '1169',
-    '11th-century',
-    '11th-hour',
-    '12.30am',
     '12.6%',
-    '12000',
-    '1224',
-    '1239',
-    '125ml',
-    '125p',
-    '1271',
-    '12ins',
-    '12pc',
-    '13(2)',
-    '13(3)',
-    '13.10',
-    '13.3%',
-    '13.6%',
-    '13.7%',
-    '1302',
     '130mph',
-    '14-member',
-    '14.',
-    '14.00',
-    '14.4%',
-    '1408',
-    '1421',
-    '1442',
-    '15&ndash;2',
-    '15&ndash;44',
-    '15&ndash;9',
-    '15(2)',
-    '15-11',
-    '15-6',
-    '15-7',
-    '15-hour',
     '15.2%',
-    '150-member',
-    '1503',
-    '15km',
-    '15v',
-    '16-cell',
-    '17m',
-    '18&ndash;1',
-    '185,000',
-    '19-22',
-    '19-member',
-    '1904&ndash;5',
-    '1908&ndash;9',
-    '1929&ndash;31',
-    '19305',
-    '1932&ndash;33',
     '1939&ndash;1945',
-    '195,000',
-    '1962&ndash;63',
-    '1963&ndash;64',
-    '1967b',
-    '1970b',
-    '1971&ndash;81',
-    '1974a',
-    '1974b',
-    '1978&ndash;81',
-    '1978/79',
-    '1979&ndash;82',
-    '1983/84',
-    '1987-89',
-    '1993.',
-    '1:10000',
     '1:3',
-    '1u',
-    '2&ndash;12',
-    '2&ndash;9',
-    '2(a)',
-    '2-6-0',
-    '2.22',
-    '2.26',
-    '2.2m',
-    '2.3.2',
-    '2.32',
-    '2.4.1',
-    '2/2',
-    '2/6',
-    '20&ndash;30%',
-    '20-member',
     '20-odd',
-    '20.2%',
-    '20.6',
-    '200000',
-    '20ins',
-    '21&ndash;24',
-    '21-member',
-    '22&deg;c',
-    '22-year',
-    '22.4%',
-    '23-year',
-    '23.4%',
-    '23.6',
-    '24-year',
-    '25-minute',
-    '25.',
     '25.1',
-    '25000',
-    '250ml/8fl',
-    '250mm',
-    '27&ndash;28',
-    '275,000',
-    '27pc',
-    '28.6%',
-    '28s',
-    '2l',
-    '2o',
-    '3&shilling',
-    '3(7)',
-    '3*',
-    '3-9',
-    '3-iron',
     '3.32',
-    '3.34',
-    '30&ndash;45',
-    '30&ndash;50%',
-    '30-foot',
-    '30-member',
-    '300-year',
-    '3000s',
-    '300ft',
-    '32.1',
-    '320sli',
-    '32mm',
-    '35-yard',
-    '3550',
-    '36&ndash;45',
-    '36844',
     '36a',
-    '36in',
-    '3700',
-    '37132',
-    '37243',
-    '37302',
-    '37332',
-    '37381',
-    '37445',
-    '375&deg;f',
-    '37656',
-    '37695',
-    '37707',
-    '37732',
-    '37796',
-    '37828',
     '37838-39',
-    '37849',
-    '37854',
-    '37872',
-    '37920',
-    '3800',
-    '38001',
-    '38027',
-    '38212',
-    '38372',
-    '38451',
-    '38513',
-    '386bsd',
-    '38759-60',
-    '38785',
-    '4&ndash;10',
     '4,5',
-    '4-iron',
-    '4-year',
-    '4.19',
-    '4.22',
-    '4.45pm',
-    '40-akce',
-    '40.5',
-    '400ft',
-    '45.5',
-    '45ft',
-    '46.6',
-    '47401',
-    '49,000',
-    '4:4',
-    '4asa',
     '5&ndash;17',
-    '5&shilling',
-    '5,000m',
-    '5,300',
-    '5-fluorocytosine',
-    '5.18',
-    '50,000,000',
-    '50-member',
-    '50-yard',
-    '500ft',
-    '500k',
-    '500lb',
-    '50km',
-    '520mb',
-    '566',
-    '56p',
     '58(1)',
-    '6,700',
-    '6-10',
-    '6-month-old',
-    '6.27',
-    '6.5.1',
-    '60&ndash;90',
-    '6024',
-    '61,000',
-    '618',
-    '648',
-    '659',
-    '68060',
-    '6mb',
-    '7.18',
-    '7.3.3',
     '7.7.1',
-    '746',
-    '751',
-    '75ml',
-    '75s',
-    '77,000',
-    '7d',
-    '7f',
-    '8-0',
-    '8.17',
-    '8.2.1',
-    '8.3.1',
-    '802',
-    '844',
-    '848',
-    '852',
     '874',
-    '879',
-    '88000-based',
-    '88100',
-    '884',
-    '891',
-    '9-7',
-    '9-pin',
-    '9.0%',
-    '9.00pm',
-    '9.1.1',
-    '9.1.2',
-    '9.11',
-    '9.12',
-    '9.17',
-    '9.4.0',
     '9.55',
-    '926',
-    '938',
-    '941',
-    '949',
-    '958',
-    '967',
-    '974',
-    '97th',
-    '986',
-    '99.9%',
-    '99.99',
-    '9oz',
-    'a&eacute;rospatiale',
-    'a&euml;tius',
-    'a-plenty',
     'a.87',
-    'a.i.',
-    'a.s.',
-    'a/a',
-    'a13',
-    'a168',
-    'a82',
-    'aaaah',
-    'aaib',
-    'aarhus',
-    'abacos',
-    'abadan',
-    'abbotsinch',
-    'abc1',
-    'abcd',
-    'abdel-halim',
     'aberlour',
-    'abernathy',
-    'abided',
-    'abjured',
-    'abnegation',
-    'abomasal',
-    'abracadabra',
-    'abruzzi',
-    'absa',
-    'abscissa',
-    'absent-mindedness',
-    'abstainers',
-    'abuna',
-    'abwor',
-    'academic-related',
-    'accelerationist',
     'accell/tp',
-    'accomodate',
-    'accordingly.',
-    'accosting',
-    'achaemenid',
-    'achalasia',
-    'achernar',
-    'achy',
-    'acib',
-    'ack-ack',
-    'acorus',
-    'acousticube',
-    'acps',
-    'acri',
-    'acrylamide',
-    'actionaid',
     'actor-manager',
-    'actu',
-    'acuteness',
-    'acyclic',
-    'ad-lib',
-    'adaa',
-    'adamski',
-    'added-value',
-    'addressable',
-    'adducing',
-    'adel',
-    'ader',
-    'adil',
-    'adios',
-    'adjudicatory',
-    'adjured',
     'adl',
-    'adnams',
-    'adoc',
-    'adsorbent',
-    'adsorbents',
-    'adulatory',
-    'aegidius',
-    'aerosmith',
-    'aethelfrith',
-    'afghanis',
-    'afl',
-    'afm',
-    'afon',
-    'afonso',
-    'afrancesados',
-    'afro-asian',
     'after-images',
-    'afterdeck',
-    'agana',
-    'agenda-setting',
-    'agnetha',
-    'agnus_dei',
-    'agouti',
-    'agrimony',
-    'agrs',
-    'agudat',
-    'ahgs',
-    'aichi',
-    'aie',
-    'aiguille',
-    'air-breathing',
-    'air-force',
     'air-time',
-    'air-to-surface',
-    'air-vent',
-    'aircraftsman',
-    'airpump',
-    'ake',
-    'aki',
-    'akio',
-    'akita',
-    'aksum',
-    'al-khatib',
-    'al-majid',
-    'al-maktoum',
-    'alain-fournier',
-    'alana',
-    'alanson',
     'albin',
-    'albinus',
-    'alcazar',
-    'aldabra',
-    'aldi',
-    'alegre',
-    'alerce',
-    'alfriston',
-    'alister',
-    'allahabad',
-    'allerthorpe',
-    'allez',
-    'allgemeine',
-    'allhusen',
-    'allier',
-    'alloyed',
     'allspice',
-    'almanack',
-    'almodovar',
-    'almoner',
-    'alner',
-    'alsop',
-    'aly',
-    'am&eacute;rica',
-    'amar',
-    'amaral',
-    'amb',
-    'ambache',
-    'amber-coloured',
-    'ambiance',
-    'ambles',
-    'amercements',
     'ameritech',
-    'ameslan',
-    'amino-terminal',
-    'aminu',
-    'amitri',
-    'amore',
-    'ampes',
-    'amphiura',
-    'ampulla',
-    'ampullaria',
-    'amway',
-    'an&iacute;bal',
-    'anaesthetists',
-    'analyte',
-    'anatole',
-    'anc-government',
     'anca',
-    'anchises',
-    'andalucian',
-    'andermatt',
-    'andesitic',
-    'andi',
-    'andress',
-    'andronicus',
-    'ands',
-    'ane',
-    'anglo-catholicism',
-    'anglo-iranian',
-    'anglos',
-    'angst-ridden',
-    'anguita',
-    'ani',
     'animateur',
-    'anistreplase',
-    'anmer',
-    'annalist',
-    'annapurna',
-    'annibale',
-    'annigoni',
-    'anonymised',
-    'antagonizing',
-    'antananarivo',
-    'anti-aids',
-    'anti-b',
-    'anti-ballistic',
-    'anti-black',
-    'anti-cellulite',
-    'anti-hev',
     'anti-personnel',
-    'anti-republican',
-    'anti-tito',
-    'anticline',
-    'anticoagulant',
-    'antient',
-    'antinomian',
-    'antinomianism',
-    'antiplatelet',
-    'antiqua',
-    'antiquaires',
-    'antiquarians',
-    'antireflux',
-    'antonello',
-    'anxiety-provoking',
-    'anyroad',
     'aoki',
-    'aonb',
-    'aos',
-    'apartness',
-    'apodemes',
-    'apollonius',
-    'apothacarion',
-    'appals',
-    'apple-tree',
-    'appliqu&eacute;d',
-    'appointor',
-    'apr&egrave;s',
-    'apres',
-    'april-may',
-    'apter',
-    'aptly-named',
     'apx',
-    'araldite',
-    'arbuthnots',
-    'arcadelt',
-    'archetypical',
-    'ard',
-    'ardglass',
-    'area-based',
-    'arequipa',
-    'aretha',
-    'arg17',
-    'arghuri',
-    'argive',
-    'argonaut',
-    'arioso',
-    'arjun',
     'armd',
-    'armeria',
-    'armour-piercing',
-    'army-backed',
-    'arrol',
-    'arteriography',
-    'arteriosclerosis',
-    'artist-in-residence',
-    'asacol',
-    'asbestos-related',
-    'ascendants',
-    'ascendency',
-    'ascitic',
-    'ash-blonde',
-    'ashiq',
-    'ashman',
     'ashram',
-    'askar',
-    'assimilates',
-    'assuaging',
-    'asu',
-    'asv',
-    'at-risk',
-    'atget',
-    'athanasius',
-    'athman',
-    'atletico',
-    'atomised',
-    'atomized',
-    'atoning',
-    'atra',
-    'atta',
     'attaingnant',
-    'attenuators',
-    'attercliffe',
-    'auctioneering',
-    'austro-german',
-    'austro-marxists',
-    'authenticating',
-    'autocrats',
-    'autofocus',
-    'autoglass',
-    'automates',
-    'automatons',
-    'autoradiographed',
-    'autre',
-    'autumn/winter',
-    'autumnalis',
     'avers',
-    'aversions',
-    'averts',
-    'avi',
-    'avice',
-    'avondale',
-    'awdry',
-    'aws',
-    'azar',
-    'azawad',
-    'b&amp;bs',
-    'b&eacute;dier',
-    'b&uuml;low',
-    'b-',
-    'b-1r',
-    'b-type',
     'b.t.',
-    'baalbek',
-    'baber',
-    'babirusa',
-    'baby-faced',
-    'back-pack',
-    'back-to-backs',
-    'back-to-front',
-    'back-translated',
-    'backcombed',
-    'backhouse',
-    'backwashing',
-    'bacton',
-    'bad-boy',
-    'bad-debt',
-    'bad-looking',
     'badajoz',
-    'badawi',
-    'badby',
-    'baddow',
-    'badlesmere',
-    'badoglio',
-    'bagi',
-    'baglady',
-    'bahr',
-    'bail-out',
-    'balance-sheet',
-    'balancer',
-    'balderton',
-    'ballinasloe',
-    'ballingall',
-    'ballsbridge',
     'balmer',
-    'balston',
-    'baltoro',
-    'balts',
-    'bamba',
-    'bambino',
-    'bamboozle',
-    'banat',
-    'bancorp',
-    'band-stop',
-    'bandleader',
-    'bankes',
-    'bankroll',
-    'bannock',
-    'bantry',
-    'banzai',
     'baptising',
-    'baptistry',
-    'bar-code',
-    'baratz',
-    'barbeque',
-    'barbershop',
-    'barbies',
-    'barchan',
-    'barcode',
-    'bardsey',
-    'bare-breasted',
-    'bare-footed',
-    'barefaced',
-    'barend',
-    'bargain-basement',
-    'bargainers',
     'baricol',
-    'barings',
-    'barkin',
-    'barnahely',
-    'barometers',
-    'bartholemew',
-    'baruch',
-    'basher',
-    'bashfully',
-    'basilicata',
-    'basslines',
-    'bat-like',
-    'bataan',
-    'batchelors',
-    'bathetic',
-    'batiste',
     'battenberg',
-    'battering-ram',
-    'battle-cry',
-    'battlemented',
-    'baudo',
-    'baur',
-    'bautista',
-    'bavent',
-    'bayard',
-    'bazadais',
-    'bazargan',
-    'bbbc',
-    'bbc-1',
-    'bcd',
-    'bcf',
-    'bclc',
     'bcma',
-    'bealach',
-    'beardless',
-    'beastmen',
-    'beat-up',
-    'beatification',
-    'becau',
-    'beckton',
-    'bed-linen',
-    'beddy',
-    'bedreddin',
-    'bedwin',
-    'beecroft',
-    'beefsteak',
-    'begetting',
-    'beggared',
     'begrudged',
-    'behavioral',
-    'behaviouralism',
-    'beit',
-    'belaying',
-    'belches',
-    'bell-tower',
-    'beller',
-    'bellum',
-    'below-par',
-    'belt-tightening',
-    'belter',
-    'benali',
-    'benaud',
-    'benders',
-    'bendinat',
     'bendix',
-    'benguiat',
-    'bening',
-    'bennett/gloucestershire',
-    'bennington',
-    'benno',
-    'berisford',
-    'berner',
-    'berty',
-    'bessel',
-    'best-performing',
-    'best-preserved',
-    'beta-tubulin',
-    'bettencourt',
-    'better-educated',
-    'betterhouse',
     'betterware',
-    'bettie',
-    'betws-y-coed',
-    'bevis',
-    'bewailing',
-    'bewilder',
-    'bi-weekly',
-    'bibit',
-    'bickersteth',
-    'bided',
-    'bidets',
-    'bield',
-    'bifu',
-    'big\'un',
-    'bigamous',
-    'biko',
     'bilateralism',
-    'bild',
-    'bilen',
-    'bilges',
-    'billionaires',
-    'bilston',
-    'bilton',
-    'bio-chemistry',
-    'bio-technology',
-    'biodegradation',
-    'biolab',
-    'biopsied',
-    'biorhythms',
-    'birching',
-    'birdtable',
-    'birnam',
     'biscoe',
-    'bisecting',
-    'bisho',
-    'bishopthorpe',
-    'bistability',
-    'bitterling',
-    'bitterns',
-    'bitwise',
-    'bixman',
-    'bj&ouml;rn',
-    'bjornebye',
-    'black-earth',
-    'black-edged',
-    'black-white',
-    'blackcaps',
-    'blackmun',
     'bladon',
-    'blaenavon',
-    'blander',
-    'blank-faced',
-    'blanking',
-    'blas',
-    'blaspheme',
-    'blasphemies',
-    'blastula',
-    'blaxter',
-    'bldc',
-    'bleachers',
-    'blesford',
-    'blida',
-    'blights',
-    'blimmin\'',
     'blind-side',
-    'blindcraft',
-    'blm',
-    'blo',
-    'blofeld',
-    'blomfield',
-    'bloodworms',
-    'blowin\'',
-    'blown-up',
-    'blubbery',
-    'blueberry',
-    'bluegrass',
-    'bluest',
-    'bluish-white',
-    'bluot',
-    'bmdp',
     'bml',
-    'bmus',
-    'bochum',
-    'bocking',
-    'bodyshells',
-    'boerhaave',
-    'bogyoke',
-    'boht',
-    'bokassa',
-    'boke',
-    'bol',
-    'bolas',
-    'boler',
-    'bolfracks',
-    'bolt-holes',
-    'bon_mot',
     'boning',
-    'bonnyrigg',
-    'bonsal',
-    'book-collector',
-    'book-length',
-    'boor',
-    'bootie',
-    'bopping',
-    'borax',
-    'bore-hole',
-    'borgia',
-    'borisav',
-    'bork',
-    'boross',
-    'borth-y-gest',
-    'boserup',
     'bosh',
-    'boson',
-    'bossano',
-    'botfly',
-    'bottom-dwelling',
-    'bouch&egrave;re',
-    'boulder-strewn',
-    'bouldering',
-    'boulter',
-    'bounden',
-    'bourequat',
-    'bourgchier',
-    'bourgeoisies',
-    'bourget',
-    'bourjois',
-    'boussena',
     'bowser',
-    'boxall',
-    'boynton',
-    'bput&num',
-    'bradburn',
-    'brafferton',
-    'brahmaputra',
-    'brain-2',
-    'brain-stem',
-    'brainwaves',
-    'braising',
-    'bramah',
-    'brambling',
-    'branche',
-    'brankovi&cacute',
-    'brannan',
     'branscombe',
-    'bras&iacute;lia',
-    'brazenose',
-    'brb',
-    'brdc',
-    'brea',
-    'bread-soda',
-    'bready',
-    'break-ups',
-    'breaking-up',
-    'brealey',
-    'breastshot',
-    'breathing-space',
-    'breccia',
-    'breda',
-    'brer',
     'brevis',
-    'brickie',
-    'bridgman',
-    'bridling',
-    'brier',
-    'brigantum',
-    'brigflatts',
-    'brighton-based',
-    'brines',
-    'brineshrimp',
-    'britisher',
-    'brito',
-    'broad-spectrum',
-    'broadloom',
-    'brocades',
-    'brockbank',
     'brockweir',
-    'brodrick',
-    'brollies',
-    'bronchoscopy',
-    'brontes',
-    'broomhill',
-    'broussac',
-    'brower',
-    'brown-paper',
-    'brownbill',
-    'brownsea',
-    'bru',
-    'brumaire',
-    'brumfit',
-    'brummell',
-    'bruni',
     'brussel',
-    'brutalized',
-    'bsac',
-    'bsri',
-    'buav',
-    'buber',
-    'bucephalus',
-    'buchenwald',
-    'buckby',
-    'buckie',
-    'buckleys',
-    'buckwheat',
-    'buddicom',
-    'budget-holding',
-    'budimir',
-    'bujumbura',
     'bukovina',
-    'bulbfields',
-    'bulgars',
-    'bullfight',
-    'bullfinch',
-    'bullivant',
-    'bullring',
-    'bulwer',
-    'bumiputra',
-    'bunked',
-    'bureaucratism',
-    'burges',
-    'burgher',
-    'burgi',
-    'burnhope',
-    'burnish',
     'burnout',
-    'butterwick',
-    'buttonholed',
-    'buy-ins',
-    'bwb',
-    'byway',
-    'c-bus',
-    'c.d.c.',
-    'c.p.',
-    'c60',
-    'c9',
-    'c90',
-    'caboodle',
-    'cadd',
-    'cadle',
-    'caersws',
     'cakey',
-    'calandrini',
-    'calcitonin',
-    'call-in',
-    'call-sign',
-    'callan',
-    'callinan',
-    'callings',
-    'callipers',
-    'caloris',
-    'calpers',
-    'camacha',
-    'camas',
-    'camberabero',
-    'cambyses',
-    'camerawork',
     'camouflaging',
-    'camp-fires',
-    'camp-stimulated',
-    'campanula',
-    'camperdown',
-    'canaanites',
-    'candiano',
-    'candlewick',
-    'canonized',
-    'cantiones',
-    'canzone',
-    'captain-general',
-    'caputs',
-    'car-parks',
-    'car-wash',
-    'card-carrying',
     'card-index',
-    'caregivers',
-    'careline',
-    'carlsbad',
-    'carnlough',
-    'caroli',
-    'carousels',
-    'carpe',
-    'carpetright',
-    'carracci',
-    'carrowdore',
-    'cart-track',
-    'carteret',
-    'carvalho',
-    'carvel',
-    'caryatids',
     'case-mix',
-    'casebook',
-    'cash-and-carry',
-    'cashcard',
-    'cassons',
-    'castaways',
-    'castlemartin',
-    'castries',
-    'catalogus',
-    'catarrhs',
-    'catechisms',
-    'catecholamines',
-    'cathars',
-    'cathery',
-    'catmint',
-    'catt',
     'cattolica',
-    'caulerpa',
-    'cavalcades',
-    'cavanagh',
-    'cave-in',
-    'cavil',
-    'cba',
-    'cbf',
-    'cbhps',
-    'cboe',
-    'ccab',
-    'cco',
-    'cde',
-    'cea',
-    'cefic',
-    'celso',
     'cenozoic',
-    'censer',
-    'centaurus',
-    'centrepieces',
-    'centroid',
-    'centrum',
-    'cenzo',
-    'ceptors',
-    'cerebellar',
-    'cerevisiae',
-    'cetia',
-    'cetinje',
-    'cfel',
-    'ch&aacute;vez',
-    'ch&acirc;lons',
-    'ch&acirc;teauroux',
     'ch&eacute;ron',
-    'chagny',
-    'chainmail',
-    'chairpersons',
-    'challoner',
-    'chambray',
-    'champenois',
-    'changeability',
-    'chantel',
-    'chanteuse',
-    'chapare',
-    'chapuisat',
-    'charadrius',
-    'chargepayers',
-    'charial',
-    'charioteers',
     'charismatics',
-    'charlery',
-    'charnock',
-    'charon',
-    'chart-topping',
-    'charwoman',
-    'chastising',
-    'chat-up',
-    'chatters',
-    'chaura',
-    'cheapened',
-    'cheddleton',
-    'cheesecakes',
-    'cheesemaker',
-    'chemics',
-    'cheminage',
     'chemotactic',
-    'cheops',
-    'chequerboard',
-    'cheroots',
-    'cherubim',
-    'ches',
-    'cheshire-based',
-    'chesterfields',
-    'cheta',
-    'chevauch&eacute;e',
-    'chevette',
-    'chewing-gum',
-    'cheyney',
-    'chicanes',
-    'chichester-clark',
-    'chiguana',
     'chilston',
-    'chimaeric',
-    'chimney-piece',
-    'chinchilla',
-    'chinoiserie',
-    'chip-based',
-    'chipper',
-    'chits',
-    'chive',
-    'chloramphenicol',
-    'chlorate',
-    'chlorides',
-    'chlorite',
-    'chlorosis',
-    'chock',
-    'choe',
     'chokey',
-    'chollerton',
-    'chorleywood',
-    'chouf',
-    'chowdhury',
-    'chramn',
-    'christer',
-    'christleton',
-    'christmas-time',
-    'christopherson',
-    'christos',
-    'chromate',
-    'chromatically',
-    'chromite',
-    'chronos',
-    'chukchis',
     'ci/mmol',
-    'cicippio',
-    'cime',
-    'cinderellas',
-    'cineworld',
-    'cinnabar',
-    'circularly',
-    'cirencester/gloucestershire',
-    'cirrhilabrus',
-    'cis-',
-    'cisc',
-    'cist',
-    'cityscapes',
-    'civc',
-    'clach',
-    'clannad',
     'clar',
-    'class-ridden',
-    'classifier',
-    'classifiers',
-    'classing',
-    'clatterbridge',
-    'clatters',
-    'clausewitz',
-    'clavicle',
-    'clearers',
-    'clearing-up',
-    'clefs',
-    'clemenceau',
-    'clementi',
-    'clemenza',
-    'clerke',
     'clerkly',
-    'clic',
-    'client&egrave;le',
-    'cliff-face',
-    'climb-down',
-    'clios',
-    'clip-clop',
-    'clit',
-    'clockmakers',
-    'clore',
-    'clorinda',
-    'close-in',
-    'close-season',
-    'closedown',
-    'clower',
-    'clrc',
     'club-house',
-    'clunbury',
-    'cmh',
-    'cmw',
-    'cnv',
-    'co-marketing',
-    'co-sponsors',
-    'coast-to-coast',
-    'cock-a-hoop',
-    'cockade',
-    'cockatoos',
-    'coddled',
-    'codemasters',
-    'coextensive',
-    'cogelow',
-    'cogens',
     'colban',
-    'cold-pressed',
-    'colemans',
-    'colgan',
-    'colitic',
-    'collectair',
-    'college-based',
-    'collembola',
-    'collocate',
-    'colloquy',
-    'coln',
-    'colophon',
-    'colour-pointed',
-    'coltart',
-    'colter',
-    'columbo',
     'com&eacute;die',
-    'combated',
-    'combi-steamer',
-    'cometary',
-    'coming-of-age',
-    'command-and-control',
-    'common-or-garden',
-    'commonhold',
-    'commonly-used',
-    'communitel',
-    'compaor&eacute',
-    'compartmentalisation',
-    'complexly',
-    'componential',
-    'compostella',
-    'compote',
     'compresence',
-    'compuserve',
-    'computer-related',
-    'computergram',
-    'computex',
-    'compuware',
-    'comtesse',
-    'comunicaci&oacute;n',
-    'con.',
-    'concelebrated',
-    'concentrators',
-    'conflates',
-    'conforama',
-    'conformism',
-    'confraternity',
-    'congregationalism',
     'congruences',
-    'conjunctive',
-    'conjunctivitis',
-    'conley',
-    'consilium',
-    'consonantal',
-    'constitution-making',
-    'constrictor',
-    'contains-source-of',
-    'contentiously',
-    'context-specific',
-    'continental-style',
-    'contingently',
-    'contortion',
-    'contretemps',
-    'control-room',
     'convertor',
-    'convex-91',
-    'cook-chill',
-    'cookin\'',
-    'coons',
-    'coopted',
-    'copleston',
-    'copper-based',
-    'coppull',
-    'cordura',
-    'corinna',
-    'corkhill',
-    'corkscrews',
-    'corn-growing',
-    'cornflake',
-    'cornmeal',
     'cornus',
-    'coron&aelig',
-    'correctionalist',
-    'corrodes',
-    'corroon',
-    'corrour',
-    'cortez',
-    'corvettes',
-    'corvo',
-    'cosenza',
-    'cosmopolitans',
-    'cosseting',
-    'cost-of-living',
-    'costermongers',
-    'cothique',
-    'cougar',
     'coulomb',
-    'coum',
-    'counter-demonstrations',
-    'counter-espionage',
-    'counter-intuitive',
-    'counter-proposals',
-    'counteracts',
-    'counterfoils',
-    'counterintuitive',
-    'counterpoise',
-    'counterposed',
-    'country-style',
-    'couperin',
-    'courmayeur',
-    'courtrooms',
-    'covariances',
     'covia',
-    'cowbells',
-    'cowey',
-    'cowgill',
-    'coxed',
-    'coyle/oxford',
-    'coyte',
-    'cpg',
-    'crabby',
-    'crabwise',
-    'cranach',
-    'crappee',
-    'crataegus',
-    'crawshay',
-    'crazes',
-    'creamer',
     'cregagh',
-    'crepi',
-    'crescendos',
-    'cressy',
-    'crickley',
-    'crimble',
-    'crime-fighting',
-    'crimestoppers',
-    'criminalize',
-    'crimping',
-    'crinoid',
-    'crippen',
-    'criss',
-    'crl',
-    'cro',
-    'crocked',
     'crofton',
-    'croich',
-    'croker',
-    'croom',
-    'croon',
-    'cross-stitch',
-    'cross-subsidy',
-    'cross-wind',
-    'crosslink',
-    'crossroad',
-    'crosswinds',
-    'cruachan',
-    'crueller',
-    'crum',
-    'crusties',
-    'cryin\'',
     'crystallizes',
-    'csa/cyp',
-    'csc',
-    'cssu',
-    'csw',
-    'ctk',
-    'ctos',
-    'ctsp',
-    'cu.m',
-    'cubing',
-    'cui',
-    'cullingworth',
-    'culture-specific',
-    'culverts',
-    'cumberbatch',
-    'cumings',
     'cup.',
-    'curbash',
-    'curler',
-    'curnow',
-    'currier',
-    'currying',
-    'cust',
-    'custards',
-    'cutlet',
-    'cutting-edge',
-    'cx/cx',
-    'cyanobacteria',
-    'cyberpunk',
-    'cycads',
-    'cyclopean',
-    'cygnet',
     'cystoscopies',
-    'cytr-dna',
-    'd&eacute;coratifs',
-    'd&ouml;nitz',
-    'd\'&eacute;tat',
-    'd\'albret',
-    'd\'arte',
-    'd\'ohsson',
-    'd-32',
-    'd-do',
-    'd-stem',
-    'd.i.l.',
-    'dachshunds',
-    'dakyn',
-    'dal&iacute',
-    'dalepak',
     'dalesfolk',
-    'dalhousie',
-    'dallapiccola',
-    'dalriada',
-    'daltons',
-    'damaris',
-    'damp-proofing',
-    'dampens',
-    'damsons',
-    'danas',
-    'dancin\'',
-    'darfur',
-    'dargan',
-    'darvel',
-    'darwinists',
-    'dashiyn',
     'dashpot',
-    'dasses',
-    'davidians',
-    'davidsons',
-    'daws',
-    'dayan',
-    'dayroom',
-    'ddd',
-    'de-',
-    'de-differentiated',
-    'de-icing',
-    'de-skilled',
-    'deafen',
-    'death-beds',
-    'death-dealing',
-    'death-house',
     'death-knell',
-    'debrett',
-    'debriefed',
-    'debt-servicing',
-    'debtor-creditor-supplier',
-    'decarboxylase',
-    'deccan',
-    'decimax',
-    'deckers',
-    'decorates',
-    'decoupled',
-    'deenethorpe',
-    'deep-lying',
-    'deerstalker',
-    'defamiliarizing',
-    'defaulter',
     'defenestration',
-    'defiling',
-    'degree-level',
-    'dehumanizing',
-    'dekko',
-    'dele',
-    'delinquencies',
-    'dellar',
-    'delphoi',
-    'delusional',
-    'demeke',
-    'deminex',
-    'democratise',
-    'democratising',
-    'demoting',
-    'denationalisation',
     'denes',
-    'denethor',
-    'dentate',
-    'depailler',
-    'depersonalized',
-    'deprave-and-corrupt',
-    'depreciable',
-    'derivational',
-    'derngate',
-    'desaturation',
-    'descant',
-    'descendent',
-    'dese',
-    'desecrate',
-    'dessin',
-    'desuetude',
     'desulphurization',
-    'deth',
-    'detoxifying',
-    'detrimentally',
-    'devilled',
-    'devilment',
-    'devos',
-    'dewdrops',
-    'dews',
-    'dextran',
-    'dg/ux',
-    'dgms',
-    'diaconate',
-    'dialysed',
-    'diamine',
-    'dian',
     'diathermy',
-    'dib',
-    'dibdin',
-    'dickins',
-    'diconal',
-    'die-back',
-    'dielectrics',
-    'diesel-powered',
-    'dietetic',
-    'diggins',
-    'digitizer',
-    'dignan',
-    'dignitary',
-    'dignities',
-    'digressed',
-    'dillie',
     'dillwyn',
-    'dimmest',
-    'dio',
-    'diop',
-    'diorite',
-    'dipentum',
-    'diplodocus',
-    'dipsw',
-    'dirham',
-    'dis-ease',
-    'disapplied',
-    'disapply',
-    'disassociation',
-    'discolouring',
-    'discomfiting',
-    'discomposed',
     'discriminability',
-    'disease-free',
-    'disestablished',
-    'disgorgement',
-    'dislocate',
-    'disposer',
-    'dispossess',
-    'disputable',
-    'disrobing',
-    'dissections',
-    'dissentient',
-    'dissents',
-    'dissuading',
-    'distempered',
-    'distensions',
-    'distinguished-looking',
     'distraint',
-    'dithiadiazoles',
-    'dive-bombed',
-    'divisibility',
-    'divvy',
-    'djing',
-    'dlo',
-    'dm1',
-    'dm2.43',
-    'dm2.45',
-    'dm2.55',
-    'do-nothing',
-    'do-or-die',
-    'dobash',
-    'dobrica',
-    'doctrinally',
     'doddering',
-    'doddridge',
-    'dodwell',
-    'doel',
-    'dohn&aacute;nyi',
-    'doinyo',
-    'dollard',
-    'dolmus',
-    'dome-shaped',
-    'domp',
-    'donadoni',
-    'donates',
-    'donegan',
-    'donlevy',
-    'dor&eacute',
-    'dorchester-on-thames',
     'dorinda',
-    'dorje',
-    'dornan',
-    'dorney',
-    'dornhausen',
-    'dornie',
-    'dort',
-    'douala',
-    'double-act',
-    'double-cross',
-    'double-ended',
-    'double-entry',
-    'dougan',
-    'doughy',
-    'doux',
-    'dovetails',
     'dowman',
-    'down-river',
-    'downers',
-    'dpt',
-    'drain\'',
-    'dramatizing',
-    'dredges',
-    'driberg',
-    'driftnets',
-    'driller',
-    'drink-related',
-    'drip-dry',
-    'drm',
-    'droid',
-    'droops',
-    'drop-goal',
     'drop-leaf',
-    'dropsy',
-    'drug-using',
-    'drumchapel',
-    'drunker',
-    'dry-dock',
-    'duchies',
-    'duck-billed',
-    'dugan',
-    'dugouts',
-    'dummett',
-    'dunces',
-    'dunsinane',
-    'dur',
-    'duracell',
-    'durand-dessert',
     'durante',
-    'durch',
-    'dusan',
-    'dutoit',
-    'dutta',
-    'dyin\'',
-    'dyslexics',
-    'dysons',
-    'e&auml;rendil',
-    'e.a.',
-    'e.h',
-    'eads',
-    'eady',
-    'eagerly-awaited',
-    'eap',
-    'earldoms',
     'earlobes',
-    'early-warning',
-    'earp',
-    'earth-based',
-    'eastfield',
-    'eastside',
-    'eatable',
-    'eataine',
-    'eavan',
-    'eavesdroppers',
-    'ebdon',
-    'ebley',
-    'ebro',
-    'echographic',
-    'echos',
-    'eckstein',
     'econometricians',
-    'ectoderm',
-    'ecumenically',
-    'eda',
-    'edm',
-    'eee',
-    'eejit',
-    'efamol',
-    'eff',
-    'efface',
-    'effectually',
-    'effluxion',
-    'eglise',
-    'eh2',
-    'eho',
-    'ehs',
     'eichenbaum',
-    'eichmann',
-    'eidesis',
-    'eight-member',
-    'eight-page',
-    'eightpence',
-    'eighty-year-old',
-    'eil',
-    'eithne',
-    'ejectment',
-    'el-gharbi',
-    'ela',
-    'elderfield',
-    'electively',
-    'electret',
-    'electric-blue',
     'electroencephalography',
-    'electroplating',
-    'electroweak',
-    'elim',
-    'elis',
-    'elke',
-    'elles',
-    'elling',
-    'elp',
-    'elphberg',
-    'elston',
-    'elusively',
-    'elysees',
-    'emasculate',
-    'embanked',
-    'embroil',
     'emes',
-    'emminster',
-    'en-route',
-    'end-grain',
-    'end-march',
-    'end-use',
-    'endpiece',
-    'endsleigh',
-    'engrained',
-    'engulfs',
-    'enjoining',
-    'enjoyments',
-    'ensor',
-    'entrainment',
-    'entreat',
-    'entreating',
     'entree',
-    'entropies',
-    'enuff',
-    'enzymic',
-    'eons',
-    'eoraptor',
-    'eorcenwald',
-    'eosinophilic',
-    'eowa',
-    'ep2',
-    'ephorus',
-    'episcopalians',
-    'epitaphs',
-    'epu',
-    'epz',
-    'epzs',
     'equal-area',
-    'equitability',
-    'equivocations',
-    'erdmann',
-    'erecta',
-    'erewiggo',
-    'erga',
-    'erick',
-    'erie',
-    'eriskay',
-    'erman',
-    'ermolov',
-    'eroica',
-    'erps',
-    'erratum',
-    'error&mdash;return&mdash;detail',
     'erysipelas',
-    'erythromycin',
-    'escada',
-    'esko',
-    'esmail',
-    'esmond',
-    'espalier',
-    'estancia',
-    'estate-car',
-    'estlin',
-    'ethnomethodological',
-    'eubacteria',
-    'eulenspiegel',
-    'euphonium',
-    'euro-mps',
-    'eurocentrism',
     'europ',
-    'evelina',
-    'even-handedness',
-    'even-tempered',
-    'eventer',
-    'eventide',
-    'ever-decreasing',
-    'ever-greater',
-    'ever-improving',
-    'everly',
-    'everson',
-    'evesham/worcestershire',
-    'evo',
-    'eworth',
-    'ex-cabinet',
-    'ex-chairman',
     'ex-chief',
-    'ex-director',
-    'ex-offenders',
-    'ex-pats',
-    'ex-policeman',
-    'examinable',
-    'exasperate',
-    'excising',
-    'excludable',
-    'exco',
-    'excoriated',
-    'excretory',
-    'executant',
-    'exekias',
-    'exhibitioner',
-    'exhumation',
     'exiguous',
-    'exod.',
-    'exogamous',
-    'exonerates',
-    'exonerating',
-    'exorcize',
-    'exorcized',
-    'expectations-augmented',
-    'expels',
-    'expends',
-    'expensed',
-    'explainable',
-    'exploitive',
-    'expropriations',
-    'extendible',
-    'exterminating',
     'externalist',
-    'extra-contractual',
-    'extrajudicially',
-    'eye-screen',
-    'eye-sockets',
-    'eye-spot',
-    'eyeballing',
-    'eyeblink',
-    'eyestripe',
-    'f&ndash;g',
-    'f&oacute;stri',
-    'f&uuml;chtbauer',
-    'f**k',
-    'f.j.',
-    'f10',
-    'f7c',
     'fabrice',
-    'factored',
-    'fahfakhs',
-    'fain',
-    'fair-skinned',
-    'fair-weather',
-    'fairbrass',
-    'fairish',
-    'faker',
-    'fakers',
-    'fakih',
-    'falconet',
-    'falkman',
-    'falmer',
-    'falsificationists',
-    'familiarised',
     'familiarized',
-    'fandango',
-    'fane',
-    'fangorn',
-    'fannies',
-    'fantasist',
-    'fanu',
-    'fapla',
-    'far-distant',
-    'far-left',
-    'far-seeing',
-    'far_as',
-    'fara',
-    'farges',
-    'farmer-patrick',
-    'farmyards',
     'farningham',
-    'farnsfield',
-    'faruq',
-    'farvver',
-    'fas',
-    'fascias',
-    'fascisti',
-    'fascistic',
-    'fast-forward',
-    'fasta',
-    'fastback',
-    'fastlynx',
-    'father-of-six',
-    'fatos',
-    'fayette',
-    'fazal',
     'fbr',
-    'fbs',
-    'feasibly',
-    'featherbed',
-    'february/march',
-    'fecklessness',
-    'federative',
-    'feely',
-    'feints',
-    'felgate',
-    'felicities',
-    'fellini',
-    'fellow-student',
-    'felonies',
-    'felsted',
-    'femidom',
     'fenestration',
-    'fentanyl',
-    'fernox',
-    'ferritin',
-    'ferrules',
-    'ferrymaster',
-    'ferryside',
-    'festus',
-    'fetishistic',
-    'fetlocks',
-    'feverfew',
-    'feyenoord',
-    'fgm',
-    'fibrinolysis',
-    'fiche',
-    'fidchell',
     'fidelis',
-    'fidesz',
-    'fiefdoms',
-    'fierce-looking',
-    'fifield',
-    'fifteen-year',
-    'figueroa',
-    'figureheads',
-    'filename&gt',
-    'filer',
-    'filling-in',
-    'filmstars',
-    'filter-feeding',
-    'findus',
-    'fine-looking',
-    'fingerprinted',
     'finkelstein',
-    'finley',
-    'finmere',
-    'finni',
-    'fintown',
-    'finucane',
-    'fiore',
-    'fiorello',
-    'fire-engines',
-    'fire-proof',
-    'firelighters',
-    'firhill',
-    'firings',
-    'first-day',
-    'first-quarter',
-    'first-stage',
     'fisherfolk',
-    'fishermead',
-    'fishin\'',
-    'fishlock',
-    'fishwife',
-    'fiske',
-    'fitaurari',
-    'fitzgibbon',
-    'fitzmaurice',
-    'five\'s',
-    'five-and-a-half',
-    'five-bar',
-    'five-bedroom',
-    'five-sixths',
-    'fixed-sum',
-    'flagellant',
     'flageolet',
-    'flagstaff',
-    'flatford',
-    'flatterer',
-    'flatterers',
-    'flatts',
-    'flavius',
-    'fleeced',
-    'flesch',
-    'fletchers',
-    'fleur-de-lis',
-    'flight-path',
-    'flighted',
-    'flimsiest',
-    'flinches',
-    'flipchart',
     'flirty',
-    'flittern',
-    'flokati',
-    'florent',
-    'flowcharts',
-    'fludyer',
-    'fluelen',
-    'fluellen',
-    'flunked',
-    'fluoroscopic',
-    'fluoroscopy',
-    'fly-by',
-    'flying-boats',
-    'flysch',
-    'fnac',
-    'foden',
     'fogging',
-    'folasade',
-    'fole',
-    'foliar',
-    'folk-tale',
-    'folklinguistics',
-    'follicular',
-    'fonds',
-    'food-processing',
-    'fookes',
-    'foot-soldiers',
-    'footers',
-    'footsore',
-    'foraminifera',
-    'force-feeding',
-    'fording',
     'forename',
-    'foreskins',
-    'forestay',
-    'forfeitures',
-    'forgings',
-    'fori',
-    'form-filling',
-    'formic',
-    'formlessness',
-    'formularies',
-    'forne',
-    'forsworn',
-    'forteana',
-    'fortex',
-    'forthrightness',
-    'fortinbras',
     'fortingall',
-    'forty-foot',
-    'forwell',
-    'fossil-fuel',
-    'foster-mother',
-    'fotherby',
-    'foundational',
-    'founder-members',
-    'four-bedded',
-    'four-figure',
-    'four-momentum',
-    'four-stage',
-    'four-stroke',
-    'four-strong',
-    'four-timer',
-    'four-vector',
     'fourball',
-    'foursquare',
-    'fourth-generation',
-    'fourth-largest',
-    'fourth-placed',
-    'fourth-quarter',
-    'foutre',
-    'foxpro',
-    'fpp',
-    'fps',
-    'fr&eacute;d&eacute;ric',
-    'fra&icirc;che',
-    'frail-looking',
-    'frailer',
-    'frame-up',
-    'framwellgate',
     'fran&ccedil;oise',
-    'frank&euml',
-    'franti&scaron;ek',
-    'frasnes',
-    'free-enterprise',
-    'free-scoring',
-    'freedberg',
-    'freest',
-    'freestone',
-    'freighted',
-    'frenais',
-    'french-canadian',
-    'frequency-dependent',
-    'freudianism',
-    'freudians',
-    'frew',
     'fribbens',
-    'frickley',
-    'fripperies',
-    'frisking',
-    'frits',
-    'fritzi',
-    'frizzed',
-    'frodingham',
-    'fromage',
-    'fron',
-    'front-ended',
-    'fronto-parallel',
-    'frost-bitten',
-    'frump',
-    'frusemide',
-    'fsc',
     'fse/sam',
-    'ftes',
-    'fuck-all',
-    'fudenberg',
-    'fugal',
-    'fulbright',
-    'full-board',
-    'full-motion',
-    'full-skirted',
-    'fullbacks',
-    'fullcircle',
-    'fully-grown',
-    'functionless',
-    'fund-holders',
-    'fundaci&oacute;n',
-    'fungicidal',
     'furby/milton',
-    'furby/oxford',
-    'furth',
-    'furuno',
-    'furuseth',
-    'fuseli',
-    'futch',
-    'futurologists',
-    'fvc',
-    'fwag',
-    'g&eacute;n&eacute;ral',
-    'g&sharp',
-    'g&uuml;nther',
-    'g-8',
-    'g.d.',
-    'g.d.r.',
     'g.h.',
-    'g.q.g.',
-    'g/day',
-    'g37',
-    'gabelhorn',
-    'gabes',
-    'gabriel-ernest',
-    'gaetano',
-    'gaga',
-    'galeazzo',
-    'gallbladder',
-    'galli',
-    'galloways',
-    'gallowgate',
-    'gallstone',
-    'gamay',
     'gambolling',
-    'gamelan',
-    'gameplan',
-    'gamete',
-    'gamgee',
-    'ganton',
-    'garam',
-    'gard',
-    'gardena',
-    'gardners',
-    'garfinkel',
-    'gargled',
-    'garotters',
-    'gas-masks',
-    'gasholder',
-    'gasometer',
     'gasperi',
-    'gasses',
-    'gastro-enteritis',
-    'gastro-intestinal',
-    'gatecrashed',
-    'gaugin',
-    'gauleiter',
-    'gaunt-face',
-    'gavotte',
-    'gawley',
-    'gawor',
-    'gawp',
-    'gazankulu',
-    'gazettes',
-    'gbs',
-    'gd-sft',
     'geach',
-    'gearchange',
-    'geb',
-    'geckos',
-    'geiger-muller',
-    'geisler',
-    'geisway',
-    'geladas',
-    'geldings',
-    'gelli',
-    'gelling',
-    'gemeentemuseum',
-    'gencor',
-    'gender-neutral',
-    'generalises',
-    'generate&mdash;root&mdash;package',
     'generics',
-    'genestealer',
-    'genii',
-    'gennifer',
-    'gentamicin',
-    'gentians',
-    'genuflections',
-    'gerardo',
-    'germ&aacute;n',
-    'geroch',
-    'geronimo',
-    'gerontius',
-    'gerontologists',
-    'geroski',
-    'gerrymandering',
-    'gervaise',
     'ges&ugrave',
-    'geschwind',
-    'gestetner',
-    'get-well',
-    'geyer',
-    'gezira',
-    'gfcc\'c',
-    'gh-k',
-    'ghazi',
-    'gherkin',
-    'ghetto-blaster',
-    'ghillie',
-    'giannini',
-    'gidaspov',
-    'gila',
-    'gilder',
     'gilds',
-    'gimli',
-    'gingrich',
-    'gionesca',
-    'gipps',
-    'girded',
-    'girlies',
-    'girlishly',
-    'give-and-take',
-    'giveth',
-    'gks',
-    'gladdened',
-    'glanders',
-    'glass-panelled',
-    'glassed',
-    'glassford',
     'glassful',
-    'glassy-eyed',
-    'glazunov',
-    'glennis',
-    'glitches',
-    'gloomiest',
-    'glossopteris',
-    'gluon',
-    'glutamic',
-    'glutted',
-    'gluttons',
-    'gmag',
-    'gnu',
-    'go-getting',
-    'goal-setting',
-    'goatskin',
     'goch',
-    'godesberg',
-    'godmanis',
-    'godmothers',
-    'godot',
-    'godunov',
-    'gofers',
-    'goggle-eyed',
-    'goi',
-    'gol-oya',
-    'goldblum',
-    'golden-haired',
-    'goldner',
-    'golfs',
-    'golitsin',
-    'goltzius',
     'gondolier',
-    'good-day',
-    'goodhaven',
-    'goodney',
-    'goodridge',
-    'goold',
-    'goolies',
-    'goosed',
-    'gorbunovs',
-    'gore-booth',
-    'gornji',
-    'gorrie',
-    'gosteleradio',
-    'gotham',
-    'goughdale',
-    'gounod',
     'gournia',
-    'government-held',
-    'government-imposed',
-    'gowing',
-    'gp120',
-    'gpra',
-    'grabber',
-    'gracilis',
-    'grammophon',
-    'grandads',
-    'grande_dame',
-    'grandpat',
-    'grantors',
-    'grappa',
-    'grappelli',
-    'gratian',
     'gravesham',
-    'grease-free',
-    'great-grandchildren',
-    'great-granddaughter',
-    'greatcoats',
-    'greatswords',
-    'green-field',
-    'greenbow',
-    'greencastle',
-    'greencroft',
-    'greensleeves',
-    'greyed',
-    'greymass',
-    'greyscale',
-    'gribble',
-    'griffins',
     'grima',
-    'grimbergen',
-    'grizedale',
-    'groins',
-    'grolsch',
-    'gropes',
-    'grotesques',
-    'ground-up',
-    'groundsel',
-    'grovelled',
-    'growmore',
-    'grownups',
-    'grungy',
-    'grus',
-    'gsr',
-    'gst-protein',
     'gtx',
-    'guacamole',
-    'guanines',
-    'guardhouse',
-    'guardi',
-    'guayaquil',
-    'guestroom',
-    'guid',
-    'guilcher',
-    'guildsmen',
-    'guimaraes',
-    'guiting',
-    'gulled',
-    'gullfoss',
-    'gun-running',
-    'gunmetal',
     'gunsmith',
-    'gunsmoke',
-    'gurr',
-    'gustafson',
-    'guthlac',
-    'gutta',
-    'gyda',
-    'gymkhana',
-    'gypsophila',
-    'gyration',
-    'h&ouml;rst',
-    'h*',
-    'h-h',
-    'h.b.',
-    'h.k.l.r.',
-    'h2s',
     'ha\'',
-    'haber',
-    'habta',
-    'hadith',
-    'hadow',
-    'hadrianic',
-    'haem',
-    'haematemesis',
-    'haemodialysis',
-    'haemonchus',
-    'haemophilus',
-    'haemopoietic',
-    'hafner',
-    'hagarth',
-    'hague-visby',
-    'haguellar',
     'haig-thomas',
-    'hair-style',
-    'halcrow',
-    'half-a-crown',
-    'half-blinded',
-    'half-cock',
-    'half-drunk',
-    'half-frozen',
-    'half-hardy',
-    'half-hourly',
-    'half-measures',
-    'half-minute',
-    'half-pass',
-    'half-tone',
-    'half-wit',
-    'half-word',
     'halfs',
-    'halftone',
-    'halicarnassus',
-    'halifaxes',
-    'halima',
-    'hallas',
-    'hamamelis',
-    'hamberg',
-    'hambling',
-    'hame',
-    'hammersley',
-    'hammerson',
-    'hamstone',
-    'hand-brake',
-    'hand-delivered',
-    'hand-holding',
     'handholds',
-    'handjob',
-    'handkerchieves',
-    'handmaiden',
-    'handpicked',
-    'handwork',
-    'hankses',
-    'hanky-panky',
-    'hanmer',
-    'hanning',
-    'hans-jochen',
-    'hansa',
-    'hansford',
-    'haran',
-    'hard-copy',
-    'hard-eyed',
     'hardware-independent',
-    'harebells',
-    'harehills',
-    'hargrave',
-    'hargraves',
-    'harleston',
-    'harlington',
-    'harmonie',
-    'haroun',
-    'harpooned',
-    'harpoons',
-    'harrell',
-    'harridans',
-    'harrold',
-    'hasp',
-    'hasselblad',
     'hatstand',
-    'hatted',
-    'haustoria',
-    'hauwe',
-    'haveli',
-    'haversham',
-    'hawklike',
-    'haxby',
-    'hay-on-wye',
-    'hayat',
-    'haydar',
-    'hazed',
-    'hazes',
-    'hbr',
-    'head-butt',
-    'head-hunting',
     'head-office',
-    'headboards',
-    'health-food',
-    'heaner',
-    'heart-broken',
-    'heart-rate',
-    'heartbreakers',
-    'hearties',
-    'heat-seeking',
-    'heavy-atom',
-    'hecate',
-    'heeling',
-    'hefce',
-    'heimdall',
-    'helensburgh',
-    'heliport',
     'hell-hole',
-    'hellenization',
-    'hellibore',
-    'helminth',
-    'helmont',
-    'helmsdale',
-    'help-line',
-    'hempen',
-    'hendley',
-    'hendricks',
-    'henhouse',
-    'henn',
-    'henreid',
-    'hensman',
-    'henty',
-    'hepatoma',
     'hepatomegaly',
-    'heptonstall',
-    'heraklion',
-    'herberts',
-    'here-and-now',
-    'hermaphroditic',
-    'herschell',
-    'hersi',
-    'herstory',
-    'hesperides',
-    'hessen',
-    'hestia',
-    'heterosexist',
-    'heterozygotes',
-    'hewing',
-    'hey-day',
     'hg/min',
-    'hhr',
-    'hi-fis',
-    'hi-jacking',
-    'hibberd',
-    'hica',
-    'hickstead',
-    'hidalgo',
-    'hideaways',
-    'hiding-places',
-    'higginbotham',
-    'high-',
-    'high-fashion',
-    'high-interest',
-    'high-sided',
-    'high-stepping',
     'highchair',
-    'highclere',
-    'highest-level',
-    'highly-strung',
-    'highnesses',
-    'highrise',
-    'hildesheim',
-    'hillbillies',
-    'hillington',
-    'himself/herself',
-    'hindu-muslim',
-    'hindustan',
-    'hinnies',
-    'hiphoprisy',
-    'hippi',
-    'hirschfeldt',
     'hiss&egrave;ne',
-    'hisself',
-    'histochemical',
-    'histon',
-    'historicists',
-    'history-making',
-    'hitchhiking',
-    'hitchings',
-    'hittite',
-    'hive-down',
-    'hiving',
-    'hizbollah',
-    'hnf-l',
-    'hoa',
-    'hobgoblins',
-    'hoca',
     'hocine',
-    'hod',
-    'hodgkiss',
-    'hoed',
-    'hoffa',
-    'hoffman-la',
-    'hofner',
-    'hold-over',
-    'holness',
-    'home-bred',
-    'home-brew',
-    'home-owner',
-    'home-spun',
-    'homebrew',
-    'homeothermy',
-    'homey',
     'homines',
-    'hominine',
-    'homogenized',
-    'hondas',
-    'honeybee',
-    'honeybees',
-    'honked',
-    'honshu',
-    'hoodlum',
-    'hoodoo',
-    'hoose',
-    'hopefulness',
-    'hopetoun',
-    'horkstow',
-    'hornbill',
-    'horndean',
     'horror-struck',
-    'horsedrawn',
-    'horseless',
-    'horsforth',
-    'horsted',
-    'hortatory',
-    'horticulturists',
-    'hortus',
-    'hosiers',
-    'hostellerie',
-    'hotbeds',
-    'hotheads',
-    'hothouses',
-    'hotlines',
-    'hotpot',
-    'hotshot',
     'hotspot',
-    'houghton-le-spring',
-    'houlton',
-    'hourglass',
-    'house-builders',
-    'house-keeping',
-    'housegroups',
-    'houseparties',
-    'houys',
-    'hoverflies',
-    'hoverspeed',
-    'howgill',
-    'howgills',
-    'howland',
-    'howse',
-    'hpi',
     'hpv-16',
-    'hs&amp;e',
-    'huambo',
-    'hugeness',
-    'hulse',
-    'humanize',
-    'humeri',
-    'hunger-strike',
-    'hunsley',
-    'hunstanton',
-    'huntingtower',
-    'hunton',
-    'hurren',
-    'husain',
-    'husband/wife',
-    'hustledown',
     'huxtable',
-    'huyghe',
-    'hybridizations',
-    'hybridize',
-    'hydrofoil',
-    'hydroxylase',
-    'hyeres',
-    'hyndman',
-    'hyon',
-    'hypericum',
-    'hyperventilate',
-    'hyphenation',
-    'hypnotise',
-    'hypo-allergenic',
-    'hypobiotic',
-    'hypostomus',
     'hypothalamic',
-    'hypothesising',
-    'hysteric',
-    'i-ifn',
-    'i.a.',
-    'i975',
-    'ibero-american',
-    'ibm/apple',
-    'ice-caps',
-    'icebox',
-    'icefall',
-    'iceni',
-    'icf',
-    'icosahedron',
-    'ictu',
-    'ideal-typical',
     'iden',
-    'ideologist',
-    'iec',
-    'iestyn',
-    'ignimbrites',
-    'ignorantly',
-    'ihm',
-    'iias',
-    'iiis',
-    'ijc',
-    'il-6res',
-    'ileocaecal',
-    'ill-fortune',
-    'ill-organised',
-    'ill-paid',
-    'ill-used',
     'illegitimately',
-    'illusionist',
-    'ilmenite',
-    'iln',
-    'ilps',
-    'imager',
-    'imagist',
-    'imbroglio',
-    'imigran',
-    'imino',
-    'immac',
-    'immingham',
-    'immobilisation',
-    'immunisations',
-    'immunogenicity',
-    'immunoglobulin-like',
     'impeaching',
-    'imperator',
-    'imperialistic',
-    'implode',
-    'impossibilities',
-    'imposters',
-    'imposture',
-    'impounding',
-    'improbabilities',
-    'improprieties',
-    'imputations',
-    'inauthenticity',
-    'incarnated',
-    'inchinn',
-    'incidently',
-    'incinerating',
     'incirlik',
-    'incites',
-    'income-generating',
-    'inconstant',
-    'indefeasible',
-    'indefinably',
-    'independant',
-    'index-linking',
-    'indexers',
-    'indiamen',
-    'indian-pacific',
-    'indiction',
-    'indirectness',
-    'individualisation',
-    'individualising',
-    'inductances',
     'industry-specific',
-    'inegalitarian',
-    'infecundity',
-    'inferentially',
-    'infesting',
-    'infinitesimally',
-    'inflatables',
-    'inflect',
-    'influencers',
-    'infocheck',
-    'infocorp',
-    'information-handling',
-    'information-technology',
-    'informatively',
-    'ingeborg',
-    'ingeld',
     'ingles',
-    'ingot',
-    'ingraham',
-    'ingratiatingly',
-    'ingrowing',
-    'ingushetia',
-    'inhalations',
-    'initialling',
-    'inkwell',
-    'inquisitions',
-    'inquisitors',
-    'inscribing',
-    'insecurely',
-    'inseminated',
-    'insets',
-    'insetting',
     'inspirer',
-    'instantiated',
-    'insubordinate',
-    'insurance-based',
-    'integrand',
-    'intemperance',
-    'intendant',
-    'inter-church',
-    'inter-connected',
-    'inter-dependent',
-    'inter-industry',
-    'inter-school',
-    'inter-service',
-    'inter-services',
-    'intercalary',
-    'interceded',
     'interceptors',
-    'intercommodity',
-    'intercommunication',
-    'intercooler',
-    'intercropping',
-    'interdiction',
-    'interdisciplinarity',
-    'interiority',
-    'interlaken',
-    'internalist',
-    'internals',
-    'interpolate',
-    'interpolations',
-    'interrelatedness',
-    'interrogatively',
-    'interrogatory',
     'interview-room',
-    'inti',
-    'intimidates',
-    'intoxicants',
-    'intraoperative',
-    'intraperitoneally',
-    'intravascular',
-    'introjection',
-    'intuit',
-    'invaginations',
-    'inveighed',
-    'inverary',
-    'involution',
-    'inzamam',
-    'inzamam-ul-haq',
-    'ioannis',
     'ior',
-    'ios',
-    'ious',
-    'ipsilateral',
-    'iqlim',
-    'irgun',
-    'irn',
-    'iron-ore',
-    'irpc',
-    'irrepressibly',
-    'is1151',
-    'is900',
-    'is900-pcr',
-    'is902',
-    'island-hopping',
-    'ismael',
     'ismay',
-    'isn',
-    'iso-vote',
-    'isochronous',
-    'isoenzyme',
-    'isomorphous',
-    'isoniazid',
-    'isopach',
-    'isoptera',
-    'isostasy',
-    'issuable',
-    'itamar',
-    'itchen',
-    'ite',
-    'itma',
-    'itoman',
     'itva',
-    'iuds',
-    'iveagh',
-    'iver',
-    'ivoirien',
-    'ivon',
-    'iwm',
-    'ix\'s',
-    'ixmar',
-    'izaak',
-    'j.g.',
-    'j.l.',
-    'j.l.r.',
-    'j.r',
-    'jabbered',
-    'jabbok',
     'jacana',
-    'jacaranda',
-    'jacinto',
-    'jack-knifed',
-    'jackley',
-    'jacksonville',
-    'jahn',
-    'jailbird',
-    'jain',
-    'jambs',
-    'jan&aacute&ccaron;ek',
-    'janab',
-    'janez',
-    'january-february',
-    'jarryd',
-    'javelot',
     'jawbones',
-    'jayaweera',
-    'jcc',
-    'jcm900',
-    'jean-philippe',
-    'jef',
-    'jerry-built',
-    'jessup',
-    'jesting',
-    'jewelry',
-    'jewess',
-    'jharo',
-    'jig-saw',
-    'jingo',
-    'jinks',
-    'jitter',
     'jizz',
-    'jklf',
-    'jlulat',
-    'jncc',
-    'job-hunting',
-    'job-seeking',
-    'jobling',
-    'jodel',
-    'jodhpur',
-    'johanne',
-    'johnsons',
-    'johnstown',
-    'joinder',
-    'jojo',
-    'jorasses',
-    'josephite',
     'judgeship',
-    'judson',
-    'jukes',
-    'juliane',
-    'julienne',
-    'jumada',
-    'jumbles',
-    'junkets',
-    'junks',
-    'junkyard',
-    'juntao',
-    'jussieu',
-    'juv.',
-    'juvenilia',
-    'k&aacute;d&aacute;r',
-    'k.p.h.',
     'kadet',
-    'kafy',
-    'kahan',
-    'kahl',
-    'kaidu',
-    'kala',
-    'kalim',
-    'kalin',
-    'kalkara',
-    'kalpokas',
-    'kames',
-    'kampot',
-    'kanawa',
-    'kannel',
-    'kapital',
-    'kapok',
     'karamanlis',
-    'karamoja',
-    'karaz',
-    'karena',
-    'karenin',
-    'karina',
-    'karmal',
-    'karoly',
-    'karrubi',
-    'karting',
-    'kaspar',
-    'kates',
-    'kawawa',
-    'kays',
-    'kazuo',
-    'kds',
     'kearsley',
-    'kearton',
-    'keay',
-    'keech',
-    'keef',
-    'kemalpasazade',
-    'kempson',
-    'kempston',
-    'kenelm',
-    'kennard',
-    'kennedy/scotland',
-    'kent-based',
-    'keoi',
-    'kerfoot',
-    'kerin',
-    'kerrang',
     'kerswill',
-    'ket',
-    'kets',
-    'kettledrums',
-    'kettner',
-    'keyboardist',
-    'keyence',
-    'keynotes',
-    'keystones',
-    'khalistan',
-    'khotan',
-    'khthon',
-    'kick-offs',
-    'kick-started',
-    'kidnaps',
-    'kidney-shaped',
     'kidsgrove',
-    'kif',
-    'kilfinnan',
-    'killala',
-    'killarow',
-    'killin',
-    'kilwardby',
-    'kimberlite',
-    'kimberlites',
-    'kimble',
-    'kindertransport',
-    'kingpins',
-    'kingside',
-    'kingston-upon-hull',
-    'kinsley',
-    'kipping',
     'kirkbride',
-    'kirkhill',
-    'kiselev',
-    'kismayo',
-    'kitchin',
-    'kitsons',
-    'kitsuregawa',
-    'kitt',
-    'kitwe',
-    'kjell',
-    'kke',
-    'kld',
-    'klondike',
-    'klug',
-    'knife-point',
-    'knife-wielding',
     'knill',
-    'knock-kneed',
-    'knuckling',
-    'knyvet',
-    'kober',
-    'kochan',
-    'kodiak',
-    'koepang',
-    'kohonen',
-    'kommandant',
-    'komodo',
-    'konare',
-    'kondratiev',
-    'koontz',
-    'koops',
-    'koquillion',
     'korchnoi',
-    'kore',
-    'korolev',
-    'korps',
-    'korth',
-    'korup',
-    'koshino',
-    'kosygin',
-    'kourou',
-    'kovac',
-    'kox21',
-    'krauts',
-    'krems',
-    'krimml',
-    'kroton',
-    'krueger',
     'krytron',
-    'krzystof',
-    'kuenheim',
-    'kula',
-    'kulak',
-    'kulturkampf',
-    'kumble',
-    'kummer',
-    'kundalini',
-    'kurchatov',
-    'kurlovich',
-    'kuti',
-    'kwp',
-    'kyles',
-    'kyu',
-    'l&eacute;gion',
     'l&eacute;rins',
-    'l&uuml;beck',
-    'l\'herbe',
-    'l-series',
-    'l.d.p.',
-    'l.m.',
-    'labudde',
-    'lace-edged',
-    'lace-like',
-    'lacewing',
-    'lacon',
-    'lacquers',
-    'lacs',
-    'ladgate',
-    'ladymont',
-    'laender',
     'laforgue',
-    'laganside',
-    'laidler',
-    'laine',
-    'lairs',
-    'lamarckians',
-    'lamed',
-    'lamellipodia',
-    'lammas',
-    'lancer',
-    'lancs.',
-    'land-holding',
-    'landers',
-    'landi',
-    'landy',
-    'langerhans',
     'langkawi',
-    'langlauf',
-    'langres',
-    'language-learning',
-    'lankester',
-    'lantau',
-    'lanyard',
-    'laocoon',
-    'laotian',
-    'lapidaries',
-    'lapsang',
-    'larbert',
-    'largue',
-    'larkhill',
-    'larne-2',
-    'lasagna',
     'laser-guided',
-    'lasswell',
-    'last-mentioned',
-    'late-nineteenth-century',
-    'latecomer',
-    'lauding',
-    'laughlin',
-    'laurentian',
-    'lavatorial',
-    'lavishing',
-    'lavoro',
-    'lawcourts',
-    'lawren',
-    'laxey',
-    'laxford',
-    'layforce',
     'layla',
-    'laziest',
-    'lba',
-    'lbs.',
-    'lca',
-    'leaches',
-    'leal',
-    'leannda',
-    'learnable',
-    'leaseholder',
-    'leashed',
-    'leather-covered',
-    'leave-in',
-    'leave-taking',
-    'lechner',
-    'leckie',
     'lectionary',
-    'lects',
-    'leel',
-    'left-field',
-    'left-luggage',
-    'leg-irons',
-    'legatine',
-    'leggett',
-    'legging',
-    'legionellae',
-    'legitimizes',
-    'lehrer',
-    'lemar',
-    'lemberg',
-    'lemming',
-    'lemnos',
     'lenham',
-    'leninism',
-    'lennard',
-    'leonel',
-    'leontief',
-    'leopoldo',
-    'leota',
-    'leptons',
-    'lesk',
-    'lett',
-    'letterewe',
-    'leucovorin',
-    'leuven',
-    'levens',
-    'leveraging',
-    'levitate',
     'lewyn',
-    'lexemes',
-    'lgcm',
-    'lgm',
-    'lhb',
-    'libab',
-    'libdem',
-    'liberace',
-    'liberal-historians',
-    'liberal-labour',
-    'liberal-sdp',
-    'libri',
-    'lichtenberg',
-    'lichtheim',
-    'liebknecht',
-    'lienhardt',
     'liens',
-    'lierne',
-    'lievesley',
-    'life-enhancing',
-    'life-histories',
-    'life-jackets',
-    'lifecycles',
-    'lifelessness',
-    'lifespanconfiguration',
-    'lifetable',
-    'lifford',
-    'light-brown',
-    'light-bulb',
-    'light-fingered',
-    'light-headedness',
-    'light-year',
     'lightbulbs',
-    'lignites',
-    'ligurian',
-    'likierman',
-    'likud-led',
-    'lily-white',
-    'lilya',
-    'limbless',
-    'limescale',
-    'limewood',
-    'limited-edition',
-    'limiter',
-    'limos',
-    'linares',
-    'linc',
-    'linebacker',
     'linefeed',
-    'lineouts',
-    'lingens',
-    'lingual',
-    'lingus',
-    'link-leger',
-    'linnett',
-    'linotronic',
-    'linwood',
-    'lipset',
-    'liquefaction',
-    'lismore',
-    'lisping',
-    'lissom',
-    'listlessness',
-    'lithocholic',
     'lithographer',
-    'liti',
-    'litigate',
-    'litigated',
-    'little-girl',
-    'littlemore',
-    'liveable',
-    'livia',
-    'livret',
-    'livrets',
-    'lizzies',
-    'ljungman',
-    'lleyn',
-    'llnl',
-    'lloyd-george',
-    'lloyd-jones',
     'llywelyn',
-    'lm3',
-    'loaders',
-    'lobbers',
-    'localist',
-    'localize',
-    'lochcarron',
-    'locked-in',
-    'lockjaw',
-    'locomotive-hauled',
-    'locomotor',
-    'locums',
-    'locution',
-    'logistically',
-    'logjam',
-    'logocentric',
     'lonelier',
-    'long-dated',
-    'long-nets',
-    'long-stemmed',
-    'long-vanished',
-    'longcase',
-    'longdon',
-    'longhurst',
-    'longreen',
-    'longworth',
-    'loons',
-    'looseleaf',
-    'lopsidedly',
-    'loram',
-    'loredana',
-    'lorelei',
     'loris',
-    'lorry-load',
-    'lorsch',
-    'lossit',
-    'lossless',
-    'lotka',
-    'loudhailer',
-    'loungers',
-    'lovibond',
-    'low-productivity',
-    'low-skilled',
-    'lowenthal',
-    'lower-priced',
-    'lowery',
-    'lowlife',
-    'lublin',
     'lucie-smith',
-    'lucona',
-    'ludgrove',
-    'ludmilla',
-    'luffenham',
-    'lukas',
-    'lul',
-    'luminol',
-    'lumsdens',
-    'lunda',
-    'lupin',
-    'luria',
-    'lustgarten',
-    'lustreware',
-    'luxuriance',
-    'lycopodium',
     'lynmouth',
-    'lysosome',
-    'm&amp;g',
-    'm&amp;m',
-    'm&eacute;decin',
-    'm-form',
-    'm.s.',
-    'm10',
-    'm56',
-    'ma&icirc;tre_d\'h&ocirc;tel',
-    'macartney',
-    'maccabi',
-    'maccarthy',
-    'macci',
-    'maccormick',
-    'macdonagh',
     'macdowell',
-    'machine-gunned',
-    'machine-gunner',
-    'machinegun',
-    'machinemen',
-    'macijauskas',
-    'maclauchlan',
-    'macnaughton',
-    'maconochie',
-    'macroberts',
-    'macrocyclic',
-    'macrotext',
-    'maddy',
-    'madhavsinh',
-    'madstock',
-    'madwoman',
     'maeght',
-    'maes',
-    'maestros',
-    'mafe',
-    'magellanic',
-    'magisterium',
-    'magnanimously',
-    'magnum_opus',
-    'maharaja',
-    'mahonia',
-    'maia',
-    'maidenly',
-    'mainmast',
-    'mainplanes',
-    'maisons-laffitte',
-    'maister',
     'majordomo',
-    'majorian',
-    'makalu',
-    'making-up',
-    'makonnen',
-    'makwetu',
-    'malachy',
-    'malakit',
-    'malaysians',
-    'malcolms',
-    'malcontent',
-    'maldistribution',
-    'maldom',
-    'malenkov',
-    'malfa',
-    'malia',
     'malingerers',
-    'malloy',
-    'mamedov',
-    'man-eater',
-    'man-eaters',
-    'man-of-war',
-    'manawatu',
-    'mancetter',
-    'manche',
-    'manciple',
-    'mancunians',
-    'mandating',
-    'mandi',
-    'mandolins',
-    'manezh',
-    'manglapus',
     'manhours',
-    'maniacally',
-    'manic-depression',
-    'manman/x',
-    'manoj',
-    'manometer',
-    'manoon',
-    'mansard',
-    'mansha',
-    'mantell',
-    'mantissa',
-    'mantled',
-    'mantuan',
-    'many-faceted',
-    'manz',
-    'map-making',
     'mapplewell',
-    'maquettes',
-    'maquilas',
-    'marama',
-    'maranyl',
-    'marat',
-    'march-past',
-    'marchwiel',
-    'marci',
-    'mardle',
-    'marduk',
-    'margam',
-    'margarete',
-    'margined',
-    'margrave',
-    'marguerites',
     'mari&aacute;tegui',
-    'marielle',
-    'maritain',
-    'marjie',
-    'market-research',
-    'marmots',
-    'marring',
-    'marsalis',
-    'marsan',
-    'marsland',
-    'martinmas',
-    'marubeni',
-    'masculinist',
-    'mashad',
-    'maslyukov',
-    'massless',
     'masterchef',
-    'mastiffs',
-    'matchings',
-    'matchmakers',
-    'matchwinning',
-    'materialising',
-    'mathewson',
-    'mathey',
-    'mathis',
-    'matignon',
-    'matriarchy',
-    'matsuda',
-    'matsumoto',
-    'maturational',
-    'maunder',
-    'mauritanians',
     'mausoleums',
-    'max1',
-    'max2',
-    'maxey',
-    'maximin',
-    'maybury-lewis',
-    'mayen',
-    'maynooth',
-    'mayor-making',
-    'mayotte',
-    'mayr',
-    'mazia',
-    'mbos',
-    'mbytes',
-    'mccaffery',
-    'mccague',
     'mccarroll',
-    'mccarron',
-    'mcclennan',
-    'mccleod',
-    'mccloud',
-    'mcclung',
-    'mccollum',
-    'mcconkey',
-    'mcconnochie',
-    'mccoys',
-    'mccrum',
-    'mccubbin',
-    'mccunn',
-    'mccusker',
-    'mce',
-    'mcgaughey',
     'mcgoohan',
-    'mcgrory',
-    'mcguckian',
-    'mcguinn',
-    'mckerrow',
-    'mckibbin',
-    'mckinney',
-    'mcmartin',
-    'mcminn',
-    'mcnair-wilson',
-    'mcneile',
-    'mcpartland',
-    'mcsmith',
-    'mcwhinney',
-    'mdhc',
-    'me\'',
     'meale',
-    'meany',
-    'mears',
-    'meatier',
-    'meaux',
-    'mechelen',
-    'mecklenburg',
-    'meddlers',
-    'meddlesome',
-    'medical-legal',
-    'medico-legal',
-    'mediterraneo',
-    'meeke',
-    'meera',
-    'meerkats',
-    'meers',
     'meeting-houses',
-    'mega-rich',
-    'megahertz',
-    'megatek',
-    'megill',
-    'mei-ling',
-    'meinertzhagen',
-    'mel&eacute;e',
-    'melaena',
-    'melanogaster',
-    'melchizedek',
-    'melded',
-    'meldola',
-    'melilla',
-    'mellower',
-    'melodramatically',
     'melting-pot',
-    'memorability',
-    'men-only',
-    'mendacity',
-    'mendiluce',
-    'meniscus',
-    'menon',
-    'menorca',
-    'menses',
-    'menshikov',
-    'mentalist',
-    'mentalistic',
-    'meols',
-    'mera',
-    'mercanti',
-    'mercantilist',
     'meri',
-    'merida',
-    'merkel',
-    'merman',
-    'merrie',
-    'merrybent',
-    'mess-tin',
-    'messiahship',
-    'mesut',
-    'metabolically',
-    'metafictional',
-    'metasedimentary',
-    'metasomatism',
-    'metathorax',
-    'metford',
-    'methven',
     'meticais',
-    'metoclopramide',
-    'metonymic',
-    'metuji',
-    'meu',
-    'meulen',
-    'mexborough',
-    'meyerson',
-    'meza',
-    'mezzo',
-    'mfa',
-    'mfgb',
-    'mhw',
-    'miaowing',
-    'mich&egrave;le',
-    'michaelangelo',
     'michna',
-    'micro-level',
-    'microdata',
-    'microdiorite',
-    'microlepis',
-    'micromodule',
-    'microporous',
-    'microprogramming',
-    'microsomal',
-    'microtubules',
-    'microwriter',
-    'mid-1970',
-    'mid-20s',
-    'mid-30s',
-    'mid-60s',
-    'mid-fifteenth',
     'mid-fifth',
-    'mid-staffordshire',
-    'mid-thigh',
-    'middle-distance',
-    'middle-level',
-    'middle-order',
-    'middlemas',
-    'middlesbrough-based',
-    'midrips',
-    'might-have-beens',
-    'miglitol',
-    'mignon',
-    'migs',
-    'miklin',
-    'mile/h',
-    'miler',
     'milkers',
-    'millais',
-    'millipede',
-    'millipore',
-    'millman',
-    'milner-white',
-    'milord',
-    'miltonic',
-    'milvia',
-    'minamata',
-    'mindset',
-    'mineshaft',
-    'mingus',
-    'mini-league',
-    'mini-step',
-    'miniscribe',
     'minories',
-    'minuchin',
-    'mips-based',
-    'mirfield',
-    'misaligned',
-    'misanthropic',
-    'misbegotten',
-    'miscast',
-    'mischief-making',
-    'miscues',
-    'misdelivery',
-    'mise',
-    'misfires',
-    'misgovernment',
-    'mishima',
-    'mishit',
     'mishnah',
-    'misinterpretations',
-    'misjudgements',
-    'mismatching',
-    'misprints',
-    'misrepresents',
-    'mistily',
-    'mitchel',
-    'mithraism',
-    'mitsukoshi',
-    'mitsuzuka',
-    'mittler',
-    'mixed-race',
-    'mixolydian',
-    'mixu',
-    'miyake',
     'miyazaki',
-    'ml/minute',
-    'mladic',
-    'mmhg',
-    'mmsc',
-    'mncs',
-    'moabit',
-    'mob-cap',
-    'mobilizes',
-    'mocha',
-    'moeller',
-    'mohamad',
-    'moieties',
-    'moignan',
-    'moines',
-    'moiseyev',
     'moistness',
-    'molality',
-    'molesters',
-    'moller',
-    'molto',
-    'moment-to-moment',
-    'momento',
-    'mondello',
-    'mondo',
-    'money-market',
-    'money-raising',
-    'moneybags',
-    'mongooses',
-    'monistic',
-    'monodactylus',
-    'monotypes',
     'monstrance',
-    'montfaucon',
-    'month-by-month',
-    'monthlies',
-    'montupet',
-    'monumentality',
-    'mooched',
-    'mooching',
-    'moonie',
-    'moorea',
-    'moortown',
-    'mope',
-    'moralism',
-    'morandi',
-    'more\'n',
-    'morello',
     'morgause',
-    'moria',
-    'moriston',
-    'morning-room',
-    'morphemic',
-    'morphologies',
-    'morpork',
-    'morraine',
-    'mortain',
-    'mortems',
-    'mortifying',
-    'morvael',
-    'morvich',
-    'morvyl',
-    'moscone',
-    'mother-daughter',
     'mother-goddess',
-    'mother-to-be',
-    'motherese',
-    'motion-picture',
-    'motor-cyclist',
-    'motor/load',
-    'mountain\'',
-    'mouth-organ',
-    'movie-making',
-    'mozartian',
-    'mr2',
-    'msdos',
-    'msi',
-    'msn',
-    'muammar',
-    'much-discussed',
     'much-reduced',
-    'mucoid',
-    'mud-brick',
-    'mud-flats',
-    'muddying',
-    'mudford',
-    'muftiliks',
-    'mughals',
-    'muirwood',
-    'muka&rcaron;ovsk&yacute',
-    'mulder',
-    'mulgrove',
-    'mulhern',
-    'mullova',
-    'multi-channel',
-    'multi-product',
     'multi-skilling',
-    'multi-track',
-    'multi-volume',
-    'multichannel',
-    'multimode',
-    'multipolar',
-    'multivite',
-    'mundeville',
-    'mundo',
-    'munificent',
-    'munnetra',
-    'munnings',
-    'murillo',
-    'murimuth',
-    'murten',
-    'muscatel',
     'musculo-skeletal',
-    'museological',
-    'musiche',
-    'musick',
-    'musicologist',
-    'musik',
-    'mustachioed',
-    'musto',
-    'musts',
-    'mutates',
-    'muti',
-    'muting',
-    'mx-5',
-    'mycelium',
-    'mycenean',
-    'mylne',
     'myotonic',
-    'myrddin',
-    'mystifies',
-    'myth-making',
-    'mythagos',
-    'mz',
-    'n\'djamena',
-    'n\'s',
-    'n-no',
-    'n.l.j.',
-    'n.z.l.r.',
-    'n111',
-    'nacc',
-    'nadi',
-    'nadroga',
-    'naik',
     'naim',
-    'nairne',
-    'najaf',
-    'nakane',
-    'nambudiri',
-    'namesakes',
-    'namur',
-    'nanas',
-    'nanjiani',
-    'nanoseconds',
-    'nans',
-    'nanterre',
-    'napes',
-    'napf',
-    'napoleone',
-    'napss',
     'nardus',
-    'narf',
-    'narrow-mindedness',
-    'nashua',
-    'nationalising',
-    'native-born',
-    'natterjack',
-    'nattrass',
-    'natura',
-    'naturae',
-    'naturalise',
-    'naturally-occurring',
-    'nautique',
-    'nautor',
-    'nazir',
-    'ncck',
     'ncle',
-    'ncu',
-    'nd4',
-    'nd5',
-    'ndrp',
-    'ne\'er-do-wells',
-    'near-miss',
-    'near-total',
-    'near-vertical',
-    'neary',
-    'neas',
-    'nebulised',
-    'nechtanesmere',
-    'necrotising',
-    'needlecraft',
-    'needlepoint',
     'needlestick',
-    'nefertiti',
-    'negotiability',
-    'neisser',
-    'neo-colonial',
-    'neo-fascists',
-    'neo-georgian',
-    'neo-liberal',
-    'neo-natal',
-    'neo-realism',
-    'neodymium',
-    'neogene',
-    'neolamprologus',
-    'neoplasm',
-    'nephrogenous',
-    'nephrotoxic',
     'neratius',
-    'nest-building',
-    'net-of-tax',
-    'netbuilder',
-    'netframe',
-    'netherstoke',
-    'netmanage',
-    'neuf',
-    'neurobiology',
-    'neutrophilic',
-    'neuve',
-    'neve',
-    'never-married',
-    'newfangled',
-    'newly-developed',
-    'newly-launched',
     'newmarch',
-    'newmark',
-    'news-stands',
-    'newsboy',
-    'newscasters',
-    'newsheet',
-    'newsroom/london',
-    'newstat',
-    'newsy',
-    'newydd',
-    'nextdoor',
-    'nezavisimaya',
-    'nf1',
-    'nffo',
-    'ngc4258',
-    'ngorongoro',
     'ni&ccedil;oise',
-    'niamh',
-    'nickle',
-    'nicksan',
-    'nicotine-stained',
-    'nieve',
-    'nigg',
-    'night-gown',
-    'night-watchman',
-    'nihilo',
-    'niht',
-    'nikolaevich',
-    'nimba',
-    'nine-wicket',
-    'ninety-',
-    'nippers',
     'nissim',
-    'nisw',
-    'nite',
-    'nivver',
-    'nk',
-    'nma',
-    'nmfs',
-    'nmol/g',
-    'no-alcohol',
-    'no-claims',
-    'no-good',
-    'no-strike',
-    'no.11',
-    'no.14',
-    'no.5',
-    'no.7',
     'no.9',
-    'no3',
-    'nobble',
-    'nobbut',
-    'noblewoman',
-    'nocenzi',
-    'noell',
-    'nom',
-    'nom_de_plume',
-    'nomine',
-    'non-absorbable',
-    'non-aerosol',
-    'non-arrival',
-    'non-banks',
-    'non-bleeding',
-    'non-bureaucratic',
     'non-catholics',
-    'non-computer',
-    'non-conformists',
-    'non-constipated',
-    'non-contact',
-    'non-critical',
-    'non-customers',
-    'non-dominant',
-    'non-drinkers',
-    'non-educational',
-    'non-french',
-    'non-inferentially',
-    'non-involvement',
-    'non-issue',
-    'non-lethal',
-    'non-mandatory',
     'non-modular',
-    'non-nationals',
-    'non-obese',
-    'non-overlapping',
-    'non-radioactive',
-    'non-refundable',
-    'non-registration',
-    'non-related',
-    'non-right',
-    'non-rivalrous',
-    'non-scalar',
-    'non-serious',
-    'non-standardised',
-    'non-sterling',
-    'non-strategic',
-    'non-turbo',
     'non-vintage',
-    'noncommittally',
-    'noncompliance',
-    'nonconforming',
-    'nonentities',
-    'nonpayment',
-    'nonpublic',
-    'nonsinusoidal',
-    'nonstick',
-    'noonpakdi',
-    'nopces',
-    'nord-pas-de-calais',
-    'norden',
-    'normandin',
-    'north-central',
-    'north-eastwards',
     'north-westwards',
-    'norther',
-    'northerns',
-    'northlands',
-    'northover',
-    'northtown',
-    'norton-taylor',
-    'norways',
-    'norweigan',
-    'nose-dived',
-    'nosebag',
-    'nosocomial',
-    'note-against-note',
-    'notional/functional',
-    'notley',
-    'novena',
     'novosti',
-    'now-familiar',
-    'nowicka',
-    'npas',
-    'nuaaw',
-    'nubia',
-    'nucleocapsid',
-    'nucleosomal',
-    'nuevo',
-    'nuff',
-    'numbs',
-    'numismatic',
-    'nunney',
-    'nuria',
-    'nuthatch',
-    'nuvolari',
     'nwachukwu',
-    'nwico',
-    'nyers',
-    'nympho',
-    'o%',
-    'o\'boyle',
-    'o\'lone',
-    'o.p.',
-    'o.s.',
-    'oakbrook',
-    'oakeley',
-    'oakey',
-    'oakum',
-    'oatlands',
-    'oberammergau',
-    'oberhausen',
     'obiang',
-    'obit',
-    'objets',
-    'obloquy',
-    'obsequiously',
-    'obsessives',
-    'obtuseness',
-    'occiput',
-    'occlusal',
-    'occultism',
-    'occultist',
-    'occultists',
-    'oceanographers',
-    'ocelot',
-    'ochres',
-    'ocic',
     'octogenarians',
-    'odbc',
-    'odp',
-    'oeuvres',
-    'off-course',
-    'off-day',
-    'off-diagonal',
-    'off-field',
-    'off-shoot',
-    'off-spin',
-    'offical',
-    'offwood',
-    'ognall',
-    'ogrizovic',
-    'ohio-based',
-    'oiliness',
     'oilman',
-    'okawi',
-    'okn',
-    'old-timer',
-    'oldish',
-    'oldpark',
-    'oleanders',
-    'olympos',
-    'ome',
-    'omnidirectional',
-    'on-',
-    'on-call',
-    'once-great',
-    'once-off',
-    'ond',
-    'one-by-one',
     'one-dayers',
-    'one-line',
-    'one-many',
-    'one-storey',
-    'one-ton',
-    'one-track',
-    'one-twentieth',
-    'onedin',
-    'onegin',
-    'ong',
-    'onny',
-    'ontap',
-    'oocyte',
-    'open-circuit',
-    'open-heart',
-    'open-mindedness',
     'open.loop',
-    'opening-up',
-    'openup',
-    'ophiomitrella',
-    'ophiotoma',
-    'ophiotominae',
-    'ophiura',
-    'opines',
-    'oppo',
-    'oprah',
-    'optimises',
-    'ora',
-    'oran',
-    'orations',
-    'orchestrator',
-    'order-winning',
     'orefields',
-    'organic-rich',
-    'orientalising',
-    'orientational',
-    'orloff',
-    'ornamenting',
-    'ornithischians',
-    'ornstein',
-    'orogenies',
-    'orrery',
-    'osmium',
-    'osmolarity',
-    'ossa',
-    'ostensive',
-    'ostermark',
-    'othman',
     'otoscopic',
-    'ots',
-    'ottar',
-    'ottonian',
-    'ouedraogo',
-    'oufkir',
-    'out-of-touch',
-    'outbreeding',
-    'outgunned',
-    'outpacing',
-    'outr&eacute',
-    'outran',
-    'outrigger',
-    'outscored',
-    'outsell',
-    'outside-left',
     'over-concerned',
-    'over-emphasise',
-    'over-grazing',
-    'over-heating',
-    'over-inflated',
-    'over-night',
-    'over-populated',
-    'over-protected',
-    'over-ruled',
-    'over-tired',
-    'over-valuation',
-    'over-worked',
-    'overbalance',
-    'overbalancing',
-    'overdetermination',
-    'overend',
     'overestimation',
-    'overexcited',
-    'overfilled',
-    'overheats',
-    'overpainted',
-    'overpopulated',
-    'overpoweringly',
-    'oversea',
-    'overshooting',
-    'overstaffed',
-    'overstayed',
-    'oversteer',
-    'overstress',
-    'overturns',
-    'overworking',
-    'owenites',
     'owlishly',
-    'own-goal',
-    'owner-managed',
-    'owre',
-    'ox2',
-    'oxfords',
-    'oxfordshire-based',
-    'oxyhaemoglobin',
-    'oz/&frac23',
-    'ozzie',
-    'p&aacute;tzcuaro',
-    'p&eacute;cuchet',
-    'p.18',
-    'p.22',
-    'p.31',
-    'p.61',
     'p.65',
-    'p.8',
-    'p.c.b.',
-    'p.n.m.',
-    'p1/t1',
-    'p16',
-    'p24t',
-    'p585t7a',
-    'p61',
-    'p90',
-    'p=0.005',
-    'p=0.06',
-    'pabham',
-    'pacers',
-    'packings',
-    'padfield',
     'padilla',
-    'pagasai',
-    'pageplus',
-    'paias',
-    'painewebber',
-    'pakefield',
-    'pakistan-based',
-    'palang',
-    'paleokrassas',
-    'paleontologist',
-    'pali',
-    'palling',
-    'pallot',
-    'palm-trees',
-    'palmyra',
-    'palottino',
     'paly',
-    'panaetius',
-    'pandered',
-    'panetta',
-    'panguna',
-    'pankhursts',
-    'pannage',
-    'pannonia',
-    'pantile',
-    'pantographs',
-    'paperclip',
-    'papillon',
-    'papuan',
-    'paraconductivity',
-    'paradisal',
-    'paradises',
     'paragraphing',
-    'paralyses',
-    'parapsychology',
-    'parasitaemia',
-    'parasympathetic',
-    'parenthetically',
-    'parix',
-    'parkas',
-    'parkfield',
-    'parking-lot',
-    'parlophone',
-    'parmiggiani',
-    'parodying',
-    'parol',
-    'parolles',
-    'parrot-fashion',
     'parrying',
-    'part-owned',
-    'parte',
-    'partible',
-    'participator',
-    'particularism',
-    'parvenu',
-    'pas-score',
-    'pascale',
-    'pasco',
-    'passfield',
-    'pasturage',
-    'pastured',
-    'pat&eacute',
-    'patagonian',
-    'patched-up',
     'patella',
-    'patentee',
-    'patey',
-    'path&eacute',
-    'path&eacute;tique',
-    'pathologies',
-    'patient-centred',
-    'patineurs',
-    'patmore',
-    'patricof',
-    'patrolman',
-    'paulina',
-    'paving-stones',
-    'pavings',
-    'pawnshops',
-    'pawson',
     'pay-back',
-    'pay-day',
-    'pay-packet',
-    'pay-tv',
-    'payloads',
-    'paynes',
-    'payrolls',
-    'payslip',
-    'pc-dos',
-    'pcn',
-    'pdp-8',
-    'pdq',
-    'pdvsa',
-    'pe2',
-    'peak-hour',
-    'pearce-hall',
     'pearlman',
-    'peart',
-    'peat-cutting',
-    'pecorino',
-    'pedagogically',
-    'pedimented',
-    'pegasi',
-    'pegwell',
-    'pei-tsun',
-    'pein',
-    'pejoratively',
-    'pelion',
-    'pelops',
-    'penalizes',
-    'pendulums',
-    'pene',
     'penfield',
-    'penhaligon',
-    'peninsulas',
-    'penitents',
-    'penne',
-    'pennsylvania-based',
-    'pennyroyal',
-    'penryn',
-    'penshurst',
-    'pentameter',
-    'penton',
-    'pentreath',
-    'pepsinogen-ii',
-    'per-cent',
-    'perceptiveness',
-    'perceptually',
     'perceval',
-    'percies',
-    'percussionist',
-    'percutaneously',
-    'peregrinations',
-    'perelman',
-    'perennis',
-    'perfectionists',
-    'performa',
-    'perineum',
-    'periportal',
-    'permuted',
-    'pernickety',
-    'perpetuities',
-    'perrault',
-    'persecutor',
     'personifies',
-    'persuaders',
-    'petering',
-    'peterle',
-    'petition-drawers',
-    'petronella',
-    'petronius',
-    'petrus',
-    'pettit',
-    'petts',
-    'petur',
-    'pfge',
-    'phalange',
-    'pharos',
-    'phazer',
-    'phenomenalism',
     'phil.',
-    'philander',
-    'philemon',
-    'philidor',
-    'phillipe',
-    'phillipps',
-    'philliskirk',
-    'philps',
-    'phlegmonous',
-    'phloem',
-    'phokis',
-    'phonecall',
-    'phorbol',
-    'phosphodiester',
-    'phosphoric',
-    'photo-call',
     'photo-opportunity',
-    'photocoagulation',
-    'photophobia',
-    'photosensitive',
-    'phylis',
-    'phyllida',
-    'phylogenetically',
-    'physicalist',
-    'physick',
-    'piatnitski',
-    'piazzetta',
-    'pick-pocket',
-    'pickerings',
-    'picoseconds',
-    'picrite',
-    'pictograms',
     'picture-book',
-    'piece_de_resistance',
-    'piet&agrave',
-    'pieties',
-    'piffling',
-    'piggery',
-    'piggy-back',
-    'pignatelli',
-    'pilatus',
-    'piled-up',
-    'pillowed',
-    'pilmay',
-    'pilsley',
-    'pilsner',
-    'pimentos',
-    'pin-prick',
     'pinchbeck',
-    'pinged',
-    'pinhead',
-    'pink-footed',
-    'pinney',
-    'pipe-dream',
-    'pires',
-    'pirouetting',
-    'pis',
-    'piss-poor',
-    'pix',
-    'piz',
-    'pka',
-    'pko',
-    'placebo-controlled',
-    'placidity',
     'plaints',
-    'planaria',
-    'plantlets',
-    'plaskett',
-    'plasmin',
-    'platelet-derived',
-    'platonist',
-    'platts',
-    'plavinsky',
-    'playboys',
-    'playoffs',
-    'ple&ccaron;nik',
-    'pleanala',
-    'pleasant-looking',
-    'pleasantry',
-    'pleasured',
     'pleuron',
-    'plfa',
-    'plonkers',
-    'plosives',
-    'ploughland',
-    'plumtree',
-    'pmc',
-    'pmma',
-    'pmoles',
-    'pmt2-plc-',
-    'pnipenv',
-    'pob',
-    'point-and-click',
-    'poisoners',
-    'poitier',
-    'polartek',
     'polemicist',
-    'polemicists',
-    'policy-related',
-    'polish-german',
-    'politicise',
-    'polonium-210',
-    'polston',
-    'poltergeists',
-    'polygenic',
-    'polylinker',
-    'polypectomy',
-    'polyphosphate',
-    'polys',
-    'polysemous',
-    'pon',
-    'ponderal',
     'pondkeeper',
-    'ponti',
-    'poor-law',
-    'popfiction',
-    'poplin',
-    'popperfoto',
-    'poppycock',
-    'populaires',
-    'populars',
-    'populus',
-    'porras',
-    'port-of-spain',
-    'portastudio',
-    'portfolio-grid',
-    'porticoed',
-    'porticoes',
     'portrack',
-    'portraitists',
-    'portuguese-speaking',
-    'positano',
-    'post-1992',
-    'post-christian',
-    'post-doctoral',
-    'post-fordism',
-    'post-graduates',
-    'post-holes',
-    'post-merger',
-    'post-race',
-    'postelnicu',
-    'postholes',
-    'postmodernity',
-    'postmultiplying',
     'postverbal',
-    'potts/anna',
-    'pouched',
-    'poulett',
-    'pounces',
-    'pounders',
-    'power-brokers',
-    'power-station',
-    'power-ups',
-    'powerboats',
-    'powersoft',
-    'ppbs',
-    'practicals',
-    'praesidium',
-    'prais',
-    'prankster',
     'prato',
-    'pratten',
-    'pravo',
-    'prb',
-    'pre-&bgr',
-    'pre-adolescent',
-    'pre-baiting',
-    'pre-existent',
-    'pre-first',
-    'pre-flash',
-    'pre-human',
-    'pre-nationalisation',
-    'pre-processing',
-    'pre-pubescent',
-    'pre-romanesque',
-    'pre-scientific',
     'pre-test',
-    'pre-victorian',
-    'pre-wedding',
-    'pre-world',
-    'precast',
-    'preceptors',
-    'preceptory',
-    'precocity',
-    'preconceptual',
-    'predicating',
-    'preeminence',
-    'preemptive',
-    'preexisting',
-    'prefectural',
-    'prefigure',
-    'prefigures',
     'prementum',
-    'premmia',
-    'premonitory',
-    'preoperatively',
-    'prep8',
-    'prepacked',
-    'press-gang',
-    'press-ganged',
-    'pressie',
-    'pressure-cooker',
-    'pressurisation',
-    'prestage',
-    'pretentiously',
-    'preveza',
-    'price-tag',
-    'pried',
     'prieta',
-    'primaeval',
-    'primitiveness',
-    'princelings',
-    'pring',
-    'pris',
-    'priscillian',
-    'privately-run',
-    'privily',
-    'prizegiving',
-    'pro-british',
-    'pro-business',
-    'pro-english',
-    'pro-natalist',
-    'pro-us',
-    'prob\'ly',
     'probative',
-    'proceedings.',
-    'processor-independent',
-    'producer/editorial',
-    'profit-orientated',
-    'profit-related',
-    'profounder',
-    'progestogen',
-    'proinflammatory',
-    'proliferates',
-    'prolinea',
-    'prolix',
-    'prop-room',
-    'property-related',
-    'propitiation',
-    'prosecutor-general',
     'proserpine',
-    'proteases',
-    'protestor',
-    'prototheca',
-    'provenances',
-    'providentially',
-    'prowls',
-    'pryde',
-    'ps/2s',
-    'psn',
-    'pssru',
-    'psychoactive',
-    'psychologistic',
-    'psychometry',
-    'psychopomps',
-    'ptdins(4,5)p',
     'pterygota',
-    'pts.',
-    'pubes',
-    'public-',
-    'publick',
-    'puddled',
-    'puffinus',
-    'pugachev',
-    'puget',
-    'pugilistic',
-    'puissant',
-    'pulcher',
-    'pullach',
-    'pullan',
-    'pullers',
-    'pullinger',
     'pulvidon',
-    'punchcards',
-    'punitively',
-    'punjabis',
-    'punnet',
-    'pupate',
-    'puppis',
-    'purestrain',
-    'purposively',
-    'pusan',
-    'push-ups',
-    'pushbutton',
-    'pustules',
-    'put-up',
-    'puzzler',
-    'pv-wave',
     'pyloriset',
-    'pyres',
-    'pyrites',
-    'pythian',
-    'qaddumi',
-    'qaumi',
-    'qnh',
-    'quacked',
-    'quadraphonic',
-    'quaffed',
-    'quaked',
-    'qualcast',
-    'quality-control',
-    'quantisation',
-    'quantised',
-    'quantized',
     'quarryman',
-    'quartzites',
-    'quasi-autonomous',
-    'quasi-periodic',
-    'quebecois',
-    'quercia',
-    'quia',
-    'quick-wash',
-    'quickdraw',
-    'quimby',
-    'quinolones',
-    'quiroga',
-    'quite_a',
-    'quiteron',
-    'r&eacute;chin',
-    'r*',
     'r.a.e.',
-    'r3000a',
-    'r5000',
-    'r7',
-    'race-course',
-    'racialization',
-    'radiation-induced',
-    'radicalisation',
-    'radio-frequency',
-    'radio-room',
-    'radioopaque',
-    'radzinowicz',
-    'ragamuffins',
-    'rahal',
-    'rahim',
-    'railcard',
     'railtour',
-    'raimondo',
-    'rainswept',
-    'rambert',
-    'ramping',
-    'randle',
-    'random-access',
-    'ransacking',
-    'rapid-fire',
-    'rapide',
-    'rapidly-growing',
-    'rasharkin',
-    'rashtriya',
-    'rasps',
-    'rastafarians',
-    'ratchette',
     'ratifications',
-    'ratifies',
-    'rattus',
-    'rau',
-    'raunds',
-    'raven-haired',
-    'ravenscroft',
-    'ravenstonedale',
-    'rayleen',
-    'razorbills',
-    'razzle',
-    'rbmk',
-    'rcbf',
-    'rct',
-    'rda',
-    're-admitted',
     're-appeared',
-    're-arranging',
-    're-assess',
-    're-birth',
-    're-build',
-    're-built',
-    're-contras',
-    're-covered',
-    're-define',
-    're-distribution',
-    're-entrant',
-    're-exported',
-    're-fitted',
-    're-fuelling',
-    're-identification',
-    're-organised',
     're-programming',
-    're-release',
-    're-route',
-    're-scheduled',
-    're-signed',
-    're-stated',
-    're-wiring',
-    'reacher',
-    'reactances',
-    'reade',
-    'readerly',
-    'readin\'',
-    'real-terms',
-    'reappraising',
-    'rearm',
-    'reassembly',
     'reasserts',
-    'reaumur',
-    'rebbe',
-    'rebelliously',
-    'reburial',
-    'rebuttable',
-    'rebuttals',
-    'reclaimable',
-    'recommendable',
-    'reconditioning',
-    'reconfiguration',
-    'reconfirmed',
-    'reconvening',
-    'reconviction',
-    'recordist',
-    'red-bearded',
     'redbreast',
-    'redbrook',
-    'redesdale',
-    'redneck',
-    'redoubts',
-    'redpolls',
-    'reducer',
-    'reeboks',
-    'reed-beds',
-    'reexamine',
-    'refashioned',
-    'refinished',
-    'refocused',
-    'refolded',
-    'refs.',
-    'regalian',
     'reggiana',
-    'regionalisation',
-    'regranted',
-    'regresses',
-    'regt',
-    'regularise',
-    'regulus',
-    'regum',
-    'rehash',
-    'rehnquist',
-    'reichsminister',
-    'reify',
-    'reincorporation',
-    'reinstallation',
-    'reintegrate',
-    'reis',
     'reisberg',
-    'rekindling',
-    'relationism',
-    'relet',
-    'relight',
-    'relit',
-    'remastering',
-    'remembrances',
-    'remembrement',
-    'remi',
-    'remitting',
-    'remortgaging',
-    'rendlesham',
-    'rentier',
-    'repackage',
-    'repacked',
     'repents',
-    'repercussion',
-    'replicative',
-    'repolarisation',
-    'repressor-operator',
-    'reproductively',
-    'repubblica',
-    'repurchased',
-    'repurchases',
-    'res.',
-    'resealed',
-    'reshevsky',
-    'resounds',
-    'restiveness',
-    'restrains',
-    'restructurings',
     'resurvey',
-    'retakes',
-    'reticulated',
-    'reticule',
-    'reticulin',
-    'reticulocyte',
-    'retirals',
-    'retouched',
-    'retractile',
-    'retrovir',
-    'retry',
-    'return&mdash;detail/',
-    'reunified',
-    'reverentially',
-    'reverse-flow',
-    'reversibly',
     'revokes',
-    'reynaldo',
-    'rflps',
-    'rgu',
-    'rhayader',
-    'rheged',
-    'rhetoricians',
-    'rhinoceroses',
-    'rhinu',
-    'rhomboids',
-    'rht',
-    'rhyolites',
-    'rhyton',
-    'ribaldry',
-    'ribbon-like',
-    'ribboned',
     'ribchester',
-    'ribose',
-    'ribosomes',
-    'riccione',
-    'rice-davies',
-    'richardson/gloucester',
-    'richet',
-    'riddler',
-    'riel',
-    'rien',
-    'riggers',
-    'right-angle',
-    'rightio',
-    'rigor',
-    'rillettes',
-    'rimswell',
     'riposted',
-    'risorgimento',
-    'rissoles',
-    'ritson',
-    'rivermen',
-    'rivette',
-    'rixi',
-    'rjo',
-    'rk',
-    'rll',
-    'rnc',
-    'road-blocks',
-    'roadholding',
-    'roadhouse',
-    'roadrunner',
-    'roadsweeper',
     'robison',
-    'roby',
-    'roca',
-    'rochard',
-    'rock-like',
-    'rockhill',
-    'rockier',
-    'rockwool',
-    'rod-tip',
-    'roddan',
-    'rodding',
-    'rogallo',
-    'roger-bernard',
-    'rogering',
-    'rohwedder',
-    'role-model',
     'roleplay',
-    'roll-neck',
-    'rolled-out',
-    'roller-skating',
-    'rollerskate',
-    'rolling-stock',
-    'romancing',
-    'romario',
-    'romtec',
-    'ronchey',
-    'ropework',
-    'rosaline',
-    'rose-marie',
-    'roseau',
-    'roseburn',
-    'roshan',
     'rossellini',
-    'rosslare',
-    'rossman',
-    'rost',
-    'rosy-cheeked',
-    'rotgut',
-    'rothwells',
-    'rotonda',
-    'rotring',
-    'rottingdean',
-    'rough-and-tumble',
-    'roukoub&eacute',
-    'roundhill',
-    'routinized',
-    'rovaniemi',
-    'rowena',
     'royan',
-    'rozenburg',
-    'rozhdestvensky',
-    'rpd',
-    'rpo',
-    'rscg',
-    'rscm',
-    'rubbishy',
-    'ruby-red',
-    'rucked',
-    'ruckus',
-    'ruddles',
-    'ruger',
-    'ruggedly',
-    'rui',
-    'rule-book',
     'rulor',
-    'rumba',
-    'rumford',
-    'rummages',
-    'run-outs',
-    'runaround',
-    'rundgren',
-    'runic',
-    'rusch',
-    'rushlight',
-    'russan',
-    'rustics',
-    'rutskoy',
-    'rv',
-    'rvi',
-    'ryvitas',
     's&amp;s',
-    's-s',
-    's-transferases',
-    's.1(2)',
-    's.12',
-    's.16(2)',
-    's.4(2)',
-    's.6(1)',
-    's.61',
-    's0',
-    's1(2)',
-    's17',
-    's20',
-    's25',
-    's27',
-    's429',
     's459',
-    's57',
-    's681(1)',
-    's7',
-    's9',
-    'sabbatarianism',
-    'sabri',
-    'sackfuls',
-    'saddlebags',
-    'sadducee',
-    'sadek',
-    'safa',
-    'safety-first',
-    'safety-pin',
-    'sagar',
-    'sailboard',
     'sailboards',
-    'sairellen',
-    'salaman',
-    'saleb',
-    'salgado',
-    'salivating',
-    'salli',
-    'salsburg',
-    'salsify',
-    'salt-laden',
-    'saltaire',
-    'saltiness',
-    'salvationist',
-    'salvia',
-    'salvinia',
-    'sam.',
     'sambataro',
-    'sambre',
-    'same-sized',
-    'samia',
-    'sanborn',
-    'sancroft',
-    'sanctify',
-    'sancton',
-    'sandalled',
-    'sandbagged',
-    'sandcastle',
-    'sandweg',
-    'sangenic',
-    'sangston',
-    'sanjurjo',
-    'sante',
     'santini',
-    'santuario',
-    'sapperton',
-    'sapphic',
-    'sappy',
-    'saqqara',
-    'sarah-jane',
-    'sardinians',
-    'sare',
-    'sargant',
-    'sarky',
-    'sarrasine',
-    'sarson',
-    'sartzetakis',
-    'sasbach',
-    'saskatoon',
     'sate',
-    'satiation',
-    'sauerkraut',
-    'sausalito',
-    'saut&eacute;ed',
-    'sauvage',
-    'savalas',
-    'savannahs',
-    'savlon',
-    'savognia',
-    'savoyard',
-    'saxe',
-    'saxophones',
-    'sayyid',
-    'sbats',
-    'sbcd',
     'sc&egrave;nes',
-    'scabbards',
-    'scalby',
-    'scalloway',
-    'scalped',
-    'scandlain',
-    'scania',
-    'scapegoating',
-    'scarag',
-    'scarper',
-    'scatcherd',
-    'sch&ouml;nhuber',
-    'schafer',
-    'schanberg',
-    'scheldt',
-    'schelling',
     'schenk',
-    'schickert',
-    'schikaneder',
-    'schilling',
-    'schipper',
-    'schluderpacheru',
-    'schmitter',
-    'schnur',
-    'scholastics',
-    'schonfield',
-    'school-aged',
-    'school-focused',
-    'school-friend',
-    'school-room',
-    'schorske',
-    'schuback',
     'schuler',
-    'schutzhund',
-    'scientifique',
-    'scilla',
-    'scissormen',
-    'sclater',
-    'scopes',
-    'scorpius',
-    'scrap-heap',
-    'screen-based',
-    'screenshot',
-    'screenwriters',
-    'scribed',
-    'scrounger',
-    'scrunching',
-    'scudder',
     'scullers',
-    'sds-polyacrylamide',
-    'sea-bird',
-    'sealed-off',
-    'sealskin',
-    'sealstones',
-    'sealy',
-    'searles',
-    'seashell',
-    'seat-belts',
-    'seatbelts',
-    'seaters',
-    'second-string',
-    'second-time',
-    'secte',
-    'sed-pds',
     'sede',
-    'sedulously',
-    'seeger',
-    'seersucker',
-    'seh',
-    'seia',
-    'seif',
-    'seikosha',
-    'seimas',
-    'seipei',
-    'sek',
-    'self-citations',
-    'self-contradiction',
-    'self-cutting',
-    'self-description',
-    'self-disciplined',
     'self-funding',
-    'self-generated',
-    'self-gratification',
-    'self-immolation',
-    'self-justifying',
-    'self-organization',
-    'self-reinforcing',
-    'self-selecting',
-    'self-tapping',
-    'selkirkshire',
-    'sellier',
-    'selsdon',
-    'semi-autobiographical',
-    'semi-retired',
-    'semi-retirement',
-    'semiconducting',
     'semiquaver',
-    'semiskilled',
-    'senescent',
-    'sensitize',
-    'sensorimotor',
-    'sentence-meaning',
-    'sepa',
-    'sephardi',
-    'septal',
-    'sequined',
-    'serail',
-    'seraphim',
-    'serf-owners',
-    'serialized',
-    'serifs',
-    'service-based',
     'servitor',
-    'set-to',
-    'seven-week',
-    'severnside',
-    'severum',
-    'severums',
-    'sevso',
-    'sextuplets',
-    'sfry',
-    'sgeir',
-    'sgraffiato',
-    'shaaban',
-    'shaar',
-    'shabbier',
-    'shaef',
-    'shaheen',
     'shahid',
-    'shahiduddin',
-    'shamble',
-    'shandon',
-    'shantih',
-    'shanty-town',
-    'shapers',
-    'share-out',
-    'sharedealing',
-    'shariff',
-    'sharwood',
-    'shasta',
-    'shatteringly',
-    'shavers',
-    'shawcraft',
-    'shawell',
     'shay',
-    'sheepmeat',
-    'shell-like',
-    'shengo',
-    'shenstone',
-    'sheviock',
-    'shielings',
-    'shies',
-    'shifty-eyes',
-    'shimano',
-    'shimbun',
-    'shimmy',
-    'shined',
-    'shinko',
-    'shinned',
-    'shirnette',
     'shoan',
-    'shock-waves',
-    'shoeburyness',
-    'shoppin\'',
-    'shore-based',
-    'shorea',
-    'short-comings',
-    'short-dated',
-    'short-fall',
-    'short-period',
-    'short-staffed',
-    'shorted',
-    'shorting',
-    'shortlands',
-    'shovelful',
-    'showplace',
     'shrewdest',
-    'shriller',
-    'shriven',
-    'sibbald',
-    'sibyl',
-    'siddall',
-    'side-door',
-    'side-road',
-    'side-walls',
-    'sidelights',
-    'sidlesham',
-    'sifu',
-    'signage',
-    'signboard',
-    'signoria',
-    'sigurd',
     'sik',
-    'sil',
-    'siliconed',
-    'silkiness',
-    'silksworth',
-    'silla',
-    'siltation',
-    'siltstones',
-    'silver-framed',
-    'silver-gilt',
-    'silver-topped',
-    'silversmithing',
-    'silvertone',
-    'silviculture',
-    'simcox',
-    'simensen',
     'simony',
-    'simranjit',
-    'sin-offering',
-    'sincerest',
-    'single-lead',
-    'single-seater',
-    'sinkport',
-    'sino-vietnamese',
-    'sinowatz',
-    'sinusitis',
-    'siouxsie',
-    'siphandon',
-    'sipko',
-    'sithole',
-    'sittingbourne',
-    'situationally',
     'six-pounder',
-    'sixteen-petalled',
-    'sixty-odd',
-    'skerry',
-    'sketchily',
-    'ski-slopes',
-    'skiddaw',
-    'skiffle',
-    'skillet',
-    'skin-deep',
-    'skintight',
-    'skipping-rope',
-    'skirlaugh',
-    'skivvying',
-    'sklair',
-    'sknsh',
     'skylab',
-    'skyros',
-    'sl2',
-    'slaked',
-    'slaney',
-    'slants',
-    'slapper',
-    'slat',
-    'slating',
-    'slaveholders',
-    'slavers',
-    'sledmere',
-    'sleep-walking',
-    'sleepy-eyed',
-    'slessor',
-    'sleuths',
     'slezer',
-    'sliders',
-    'slimmest',
-    'sloa',
-    'slobs',
-    'sloppily',
-    'sloughing',
-    'slovakian',
-    'slovensk&yacute',
-    'sludds',
-    'slumptown',
-    'slurries',
-    'smail',
-    'small-group',
-    'smalltown',
-    'smartdrive',
     'smartening',
-    'smarty',
-    'smash-hit',
-    'smellies',
-    'smeralda',
-    'smidgen',
-    'smith/scotland',
-    'smott',
-    'smychka',
-    'snacking',
-    'snakeskin',
-    'snatcher',
-    'sneakily',
-    'sneddon',
-    'sneezy',
-    'snipes',
     'snoddy',
-    'snorers',
-    'snowdrift',
-    'snowmen',
-    'snowstorms',
-    'sns',
-    'snuck',
-    'snuffle',
-    'snuffles',
-    'so-far',
-    'soakaways',
-    'soap-opera',
-    'social-class',
-    'societas',
-    'sociobiological',
-    'sociolinguist',
     'sodwana',
-    'softball',
-    'softeners',
-    'softner',
-    'sogat',
-    'sogeti',
-    'soisson',
-    'solebars',
-    'solecism',
-    'soled',
-    'soli',
-    'solicitations',
-    'solidarities',
-    'solidification',
-    'soling',
-    'solitaries',
     'soloed',
-    'soloman',
-    'soltau',
-    'solus',
-    'solvent-based',
-    'solvent-weld',
-    'solvers',
-    'som.',
-    'somatosensory',
-    'somerfield',
-    'sommat',
-    'son-of-sam',
-    'son/daughter',
-    'song-and-dance',
-    'soon-to-be',
-    'sophistry',
     'sorter',
-    'sough',
-    'soughing',
-    'soulboy',
-    'soupy',
-    'soused',
-    'soutter',
-    'soyabeans',
-    'soybean',
-    'spadework',
-    'spalvins',
-    'sparc-compatible',
-    'sparke',
-    'spea',
-    'specially-designed',
-    'specifier',
     'specular',
-    'speeded-up',
-    'spell-binding',
-    'speranskii',
-    'spermatocytes',
-    'spermicides',
-    'sperrin',
-    'spezia',
-    'spherulites',
-    'spiegelman',
-    'spiffing',
-    'spinea',
-    'spirally',
-    'spirometry',
-    'splashy',
-    'splenomegaly',
     'spode',
-    'spoilers',
-    'spora',
-    'sporran',
-    'sporthotel',
-    'sprawls',
-    'spreadbase',
-    'springtown',
-    'sprucing',
-    'spurge',
-    'sputtered',
-    'spy-hole',
-    'sql-based',
-    'sql/ds',
-    'squalling',
-    'square-cut',
     'squirms',
-    'sridevi',
-    'sspca',
-    'stabat',
-    'stabilizes',
-    'staffrooms',
-    'stair-rail',
-    'stalag',
-    'standoffish',
-    'stane',
-    'stanwyck',
-    'stapley',
-    'starburst',
-    'starfighter',
-    'starkisser',
-    'starpod',
     'state-financed',
-    'state-sector',
-    'statelessness',
-    'states-general',
-    'statism',
-    'status-conscious',
-    'stayers',
-    'stayin\'',
-    'steading',
-    'steadings',
-    'steam-engines',
-    'steam-power',
-    'steamings',
-    'steamrollered',
-    'steedman',
-    'steelworker',
     'steepled',
-    'steeples',
-    'stegosaurus',
-    'steins',
-    'step-family',
-    'stephanian',
-    'stepps',
-    'steria',
-    'sterilizing',
-    'sterns',
-    'stick-like',
-    'stigmatisation',
-    'still-lifes',
-    'stillingfleet',
-    'stillwater',
-    'stimpson',
     'stitchworld',
-    'stock-rearing',
-    'stocker/st',
-    'stocksfield',
-    'stoer',
-    'stokoe',
-    'stolidity',
-    'stolonifera',
-    'stomps',
-    'stonebench',
-    'stonewall',
-    'stool/24',
-    'storekeepers',
-    'stort',
-    'stoutest',
-    'stowerton',
     'stoyan',
-    'stoyanov',
-    'stradbroke',
-    'strahan',
-    'straight-edge',
-    'strasberg',
-    'strasburg',
-    'strat-type',
-    'strathallan',
-    'strathnaver',
-    'strauss-kahn',
-    'straw-coloured',
-    'street-lamp',
-    'streettalk',
-    'streibl',
-    'stress-relaxation',
     'strobes',
-    'stroganov',
-    'stromatolites',
-    'strongroom',
-    'strudel',
-    'strugnell',
-    'stuart-moore',
-    'stube',
-    'studding',
-    'stukas',
-    'stumpe',
-    'stunk',
-    'stupa',
-    'stupefyingly',
-    'sturrock',
-    'stussy',
     'styler',
-    'su\'a',
-    'sub-branch',
-    'sub-conscious',
-    'sub-directories',
-    'sub-plots',
-    'sub-surface',
-    'sub-titles',
-    'subbing',
-    'subbuteo',
-    'subgame',
-    'subgenres',
-    'subjugating',
-    'submassive',
-    'submaximal',
-    'submersion',
     'submitter',
-    'subregional',
-    'subsonic',
-    'substitutable',
-    'subsuming',
-    'subtest',
-    'subventions',
-    'succussed',
-    'such-like',
-    'suff.',
-    'suffragans',
-    'suffuse',
-    'sufis',
-    'sujet',
-    'sulphonylurea',
-    'sulphonylureas',
     'summerville',
-    'summoner',
-    'sun-glasses',
-    'sun-soaked',
-    'sun-tan',
-    'sunderland-based',
-    'sunnyside',
-    'sunpc',
-    'sunshade',
-    'sunsolutions',
-    'suor',
-    'super-fit',
-    'super-gun',
-    'superabundance',
-    'supercooling',
-    'supersaturation',
     'supersession',
-    'supp',
-    'surcharged',
-    'surcoat',
-    'surefire',
-    'surface-to-surface',
-    'suriname',
-    'survage',
-    'survivable',
-    'suso',
-    'susweca',
-    'svein',
-    'svensson',
-    'svr4.1',
-    'sw10',
-    'swains',
     'swallowtail',
-    'swartz',
-    'swazi',
-    'sweetmary',
-    'sweetshop',
-    'swiftpacks',
-    'swimathon',
-    'swimming-pools',
-    'swimming-trunks',
-    'swimmingly',
-    'swithinbank',
-    'sybaris',
-    'sylhet',
-    'symbionts',
-    'symptom-free',
-    'synapsids',
     'synchronising',
-    'synchronously',
-    'syncopations',
-    'synonymously',
-    'synspilum',
-    'syntactic/semantic',
-    'synthonia',
-    'synths',
-    'systematize',
-    'systemised',
-    'systempro',
-    't&amacr;r',
-    't&amp;c',
-    't&dgr;s',
-    't-',
-    't-cells',
     't-rex',
-    't.c.',
-    't.e.',
-    't.h.',
-    't.r.',
-    't=',
-    'tabernacles',
-    'table-topping',
-    'tablecurve',
-    'tachypnoea',
-    'tacklers',
-    'tagalog',
-    'tagger',
-    'tagus',
-    'tahoe',
-    'taig',
     'tail-lights',
-    'tailback',
-    'tailspin',
-    'takako',
-    'taketh',
-    'talismans',
-    'tallish',
-    'tallymen',
-    'talmudic',
-    'tamarind',
-    'tamarisk',
-    'tambopata',
-    'tameness',
-    'tamino',
-    'tamla',
-    'tanganyikan',
     'tangiers',
-    'tangs',
-    'tani',
-    'tanith',
-    'tannenberg',
-    'tantalised',
-    'tantalus',
-    'taoist',
-    'tapeworm',
-    'taphonomic',
-    'tapioca',
-    'tapir',
-    'tardily',
-    'tarlenheim',
-    'tarleton',
-    'tarmacked',
     'tars',
-    'tarte',
-    'taste-buds',
-    'tastiest',
-    'tattersall',
-    'tattle',
-    'tauber',
-    'taubmans',
-    'taurine',
-    'taxiing',
-    'taxon',
-    'tbl',
-    'tcg',
-    'tct',
-    'tda',
-    'te566',
     'tea-chest',
-    'tea-house',
-    'tea-pot',
-    'tea-rooms',
-    'teacake',
-    'teacher-research',
-    'teaching/learning',
-    'teamsters',
-    'teasers',
-    'teaspoonfuls',
-    'tectonically',
-    'tee-shirts',
-    'teece',
-    'teem',
-    'teems',
-    'teetotalism',
     'tekere',
-    'tela',
-    'tele-communications',
-    'telecine',
-    'teleconferencing',
-    'telegraphist',
-    'telemachus',
-    'telepathically',
-    'telescoping',
-    'telstar',
-    'temazepam',
-    'tembo',
-    'teme',
-    'ten-hour',
-    'ten-ton',
-    'tenants-in-chief',
     'tennstedt',
-    'tenore',
-    'tenzin',
-    'tergum',
-    'teri',
-    'teriyaki',
-    'termagant',
-    'tero',
-    'terran',
-    'terrines',
-    'tessie',
-    'test-case',
-    'testa',
-    'testarossa',
-    'tetchily',
-    'tetrodotoxin',
     'tetroxide',
-    'teviotdale',
-    'text-to-speech',
-    'tezla',
-    'th\'can',
-    'th\'self',
-    'thaler',
-    'thalictrum',
-    'thaws',
-    'theobalds',
-    'theodolite',
-    'theodoros',
-    'thermoregulation',
-    'thermoregulatory',
-    'theropods',
-    'thiazide',
     'thickish',
-    'thin\'',
-    'thin-faced',
-    'thin-lipped',
-    'thinnish',
-    'third-biggest',
-    'third-floor',
-    'third-hand',
-    'third-order',
-    'thirsts',
-    'thirty-foot',
-    'thirty-second',
-    'thomasin',
-    'thomasina',
-    'thorndon',
-    'thornham',
     'thorogood',
-    'thorsen',
-    'thousandfold',
-    'thracian',
-    'thracians',
-    'three-monthly',
-    'three-one',
-    'three-strand',
-    'thrips',
-    'thrum',
-    'thrummed',
-    'thruster',
-    'thumbprint',
-    'thumbscrews',
-    'thunderously',
-    'thuringians',
     'thurlow',
-    'thurmaston',
-    'thwarts',
-    'thymine',
-    'thymuses',
-    'tickly',
-    'tideline',
-    'tideway',
-    'tie-breaker',
-    'tif',
-    'tigger',
-    'tiguary',
-    'tih',
-    'tikhonov',
-    'tillingham',
-    'timberland',
     'time-expired',
-    'time-line',
-    'time-related',
-    'time-share',
-    'time-worn',
-    'time/distance',
-    'timekeepers',
-    'timeously',
-    'timperley',
-    'timur',
-    'tingly',
-    'tinier',
-    'tinies',
-    'tioxide',
-    'tip-toed',
-    'tipo',
     'tipsters',
-    'tir',
-    'tiresomely',
-    'tissue-paper',
-    'tit-bits',
-    'title-chasing',
-    'tiv',
-    'tjolle',
-    'tmtsf',
-    'tn',
-    'toady',
-    'toastracks',
-    'tobogganing',
-    'toccatas',
-    'today/29.10.93',
-    'today/newsroom',
     'toile',
-    'toks',
-    'tom-cats',
-    'tomalin',
-    'tomfoolery',
-    'tommies',
-    'tommy-gun',
-    'tonypandy',
-    'toolmaker',
-    'toomey',
-    'top-knot',
-    'top-ten',
-    'toplog',
-    'topocide',
-    'topspin',
-    'torgyan',
     'toronto-based',
-    'torras',
-    'torrey',
-    'torstar',
-    'tortuously',
-    'totalizations',
-    'totalizer',
-    'totton',
-    'toucan',
-    'touch-and-close',
-    'toughs',
-    'tourville',
-    'tousle-haired',
-    'tout_court',
-    'tove',
-    'town-dwellers',
     'towy',
-    'toxocariasis',
-    'toxoplasmic',
-    'tp298',
-    'traber',
-    'tractatus',
-    'trade-unionists',
-    'tradescant',
-    'trampolining',
-    'trangia',
-    'trans-shipment',
-    'transcriptionally',
-    'transferees',
-    'transgenes',
-    'translatable',
-    'translocated',
     'translucency',
-    'transpersonal',
-    'transponders',
-    'transposes',
-    'transracially',
-    'transsexualism',
-    'trantec',
-    'trapnel',
-    'trappist',
-    'travel-stained',
-    'traveling',
-    'travellers-fare',
-    'treacher',
-    'treatment.',
-    'tredinnick',
-    'tree-trunks',
     'treleaven',
-    'trelorne',
-    'trenching',
-    'trendies',
-    'trendiest',
-    'treshnish',
-    'trevor-roper',
-    'trews',
-    'trialists',
-    'tribble',
-    'tribunes',
-    'tricameral',
-    'trichologist',
-    'trichomonal',
-    'trichomonas',
-    'tricon',
     'trifled',
-    'trine',
-    'trinh',
-    'triplex',
-    'triteness',
-    'tritone',
-    'trivialising',
-    'trivialization',
-    'troff',
-    'troie',
-    'troodos',
-    'trool',
-    'trotskyite',
-    'trouble-making',
-    'trouser-leg',
-    'trr-trr',
     'trudi',
-    'true-blue',
-    'truelove',
-    'truk',
-    'trumpeters',
-    'trung',
-    'trwyn',
-    'trypanosome',
-    'tucayana',
-    'tuffs',
-    'tuir',
-    'tummies',
-    'tumuli',
-    'tunnellers',
-    'turbidite',
-    'turbidites',
     'turbo-diesel',
-    'turbocharging',
-    'turgor',
-    'turlington',
-    'turncoat',
-    'turndal',
-    'turned-out',
-    'turned-up',
-    'turnour',
-    'turtleneck',
-    'tusi',
-    'tutankhamen',
-    'tutwiler',
-    'tux',
-    'tuxedos',
-    'tweaks',
     'tweeter',
-    'twenty-four-year-old',
-    'twenty-six-year-old',
-    'twice-daily',
-    'twiddly',
-    'twiggs',
-    'twin-t',
-    'twingo',
-    'twitchings',
-    'two-centre',
-    'two-door',
-    'two-down',
-    'two-line',
-    'two-point',
-    'two-seaters',
-    'two-tiered',
     'two-track',
-    'two-try',
-    'twyver',
-    'tyacke',
-    'tydeman',
-    'tylissos',
-    'tympanometry',
-    'type-face',
-    'typecasting',
-    'typhoons',
-    'u-2',
-    'u-form',
-    'u.s.s.r',
-    'u16',
-    'u6000',
-    'ua1',
     'ubi',
-    'ubu',
-    'ucb',
-    'ucd',
-    'udinese',
-    'ufford',
-    'uhuh',
-    'ujamaa',
-    'ukulele',
-    'ul',
-    'ul-haq',
-    'ultra-nationalist',
-    'ultrasparc',
-    'umbarak',
-    'umbilicals',
-    'un-backed',
     'unabsorbed',
-    'unaddressed',
-    'unadopted',
-    'unallocated',
-    'unamerican',
-    'unattractiveness',
-    'unattributed',
-    'unbaptised',
-    'unbarred',
-    'unbeknownst',
-    'unbelievingly',
-    'unbent',
-    'unbundled',
-    'unburdening',
-    'unc',
-    'uncared',
     'unchaperoned',
-    'unchristian',
-    'uncited',
-    'uncitral',
-    'unclassifiable',
-    'uncleanness',
-    'uncoiling',
-    'unconfident',
-    'unconquerable',
-    'uncorrupted',
-    'unctuously',
-    'uncustomary',
-    'undefiled',
-    'undelivered',
-    'under-18s',
-    'under-reported',
     'underbid',
-    'underblanket',
-    'underfinanced',
-    'undergravels',
-    'undergrounding',
-    'underlet',
-    'underpasses',
-    'underscoring',
-    'undersecretary',
-    'understairs',
-    'undersubscribed',
-    'undertrials',
-    'undervaluing',
-    'underwood/buckinghamshire',
-    'undrawn',
-    'undreamed-of',
     'uneatable',
-    'unem',
-    'unemployment-income',
-    'unescorted',
-    'unexposed',
-    'unfaltering',
-    'unfancied',
-    'unfazed',
-    'unfeasible',
-    'unhappier',
-    'uni-processor',
-    'uninterruptedly',
-    'unit-based',
-    'unived',
-    'universalised',
-    'unix-on-intel',
     'unlet',
-    'unneeded',
-    'unorthodoxy',
-    'unpredicted',
-    'unproblematically',
-    'unproductively',
-    'unpruned',
-    'unreactive',
-    'unredeemed',
-    'unregarded',
-    'unremembered',
-    'unrepeated',
-    'unresearched',
-    'unrevealing',
-    'unsanitary',
-    'unscrambling',
     'unslung',
-    'unsmilingly',
-    'unsparing',
-    'unspeaking',
-    'unspotted',
-    'unst',
-    'untruthful',
-    'untruthfully',
-    'unwarrantable',
-    'unwontedly',
-    'unwounded',
-    'unzip',
-    'up-beat',
-    'up6',
-    'uplights',
-    'upper-crust',
     'uprightness',
-    'upshall',
-    'upstaging',
-    'upward-sloping',
-    'urbanites',
-    'urinated',
-    'urological',
-    'us&dollar;1',
-    'us&dollar;1,000,000',
-    'us&dollar;1,100',
-    'us&dollar;15,000',
-    'us&dollar;2,000,000',
-    'us&dollar;300',
-    'us&dollar;4,500',
-    'us&dollar;40,000,000',
-    'us&dollar;500',
     'us&dollar;6,000',
-    'us&dollar;600',
-    'us&dollar;7,000',
-    'us&dollar;8,000',
-    'use-values',
-    'usenix',
-    'usrc',
-    'ust',
-    'uuac',
-    'uvarov',
-    'v&iacute;ctor',
-    'v.c',
-    'v.c.',
-    'v10',
-    'v16',
-    'v2s',
     'v40',
-    'vaccinium',
-    'vacuoles',
-    'vaginitis',
-    'valderrama',
-    'valens',
-    'valerio',
-    'valfinet',
-    'value-adding',
-    'vandalise',
-    'vandenberg',
-    'vanellus',
-    'vaporization',
-    'varden',
-    'vasculature',
-    'vasil',
     'vasodilation',
-    'vassalage',
-    'vaul',
-    'vec',
-    'vegeburger/singletons',
-    'veggie',
-    'veining',
-    'velasco',
-    'veld',
-    'veneering',
-    'venetz',
-    'vengsarkar',
-    'venneman',
-    'ventricles',
-    'veracruz',
-    'verbalise',
     'vergers',
-    'verlaine',
-    'verlander',
-    'vernson',
-    'verre',
-    'verrico',
-    'versa',
-    'verst',
-    'verum',
-    'vex',
-    'vgc',
-    'vh/g',
-    'vice-consul',
-    'vicenza',
-    'vickerman',
-    'victimizing',
     'victualler',
-    'video-on-demand',
-    'videocart',
-    'viewport',
-    'viggers',
-    'vilely',
-    'vilest',
-    'vilify',
-    'virement',
-    'virginsky',
-    'vis-&aacute;-vis',
-    'visa-free',
-    'viterbi',
-    'vitiating',
-    'vitis',
-    'vivace',
     'vivos',
-    'vizor',
-    'vlado',
-    'vlitos',
-    'vliw',
-    'vogelsang',
-    'volatile-rich',
-    'volksunie',
-    'vollard',
-    'volubly',
-    'voluntariness',
-    'voluntarist',
-    'voluntaristic',
-    'vom',
-    'vomica',
-    'vomits',
     'vonk',
-    'vopo',
-    'vorontsov',
-    'vortigern',
-    'vote-catching',
-    'vouill&eacute',
-    'vp16',
-    'vr2',
-    'vth',
-    'vugs',
-    'vulgare',
-    'vulval',
-    'vv',
-    'vyner',
-    'w&ouml;lflinn',
-    'w/o',
     'wadeville',
-    'wagamama',
-    'wage-labour',
-    'wage-price',
-    'wainscot',
-    'waist-length',
-    'waiting-list',
-    'waksman',
-    'waldon',
-    'waldsterben',
-    'walkerdine',
-    'wall-painting',
-    'walley',
-    'wallich',
-    'walruses',
-    'wam',
     'wanborough',
-    'wangled',
-    'wannabes',
-    'wannsee',
-    'wans',
-    'wantonness',
-    'waqfs',
-    'warbands',
-    'warbutt',
-    'warming-up',
-    'warmongering',
-    'warplane',
-    'washerwoman',
-    'washrooms',
-    'wasnt',
-    'wass',
     'wastefulness',
-    'watan',
-    'watchmakers',
-    'watchtowers',
-    'water-courses',
-    'water-lilies',
-    'water-mill',
-    'water-mills',
-    'water-supply',
-    'waterproofed',
-    'waterproofness',
-    'waterski',
-    'wattles',
-    'wavebands',
-    'wavepacket',
-    'wayfaring',
     'wc1h',
-    'wc1n',
-    'wc2r',
-    'wcy',
-    'we-ell',
-    'wealth-creating',
-    'wearsiders',
-    'week-old',
-    'weinstein',
-    'weizsacker',
-    'welham',
-    'welkom',
-    'well-drilled',
-    'well-executed',
-    'well-grown',
-    'well-guarded',
     'well-insulated',
-    'well-judged',
-    'well-polished',
-    'wellfleet',
-    'wellness',
-    'wellport',
-    'wellspring',
-    'wellwishers',
-    'welsted',
-    'welty',
-    'wendlebury',
-    'wendling',
-    'wends',
-    'wennington',
-    'werewolves',
-    'westcountry',
     'westendorf',
-    'westernization',
-    'westernmost',
-    'westmore',
-    'westons',
-    'wet-look',
-    'wetuc',
-    'wftu',
-    'wgpt',
-    'whampoa',
-    'wheelwrights',
-    'wheldon',
-    'whereat',
-    'whiles',
-    'whip-like',
-    'whippy',
     'whisperings',
-    'white-capped',
-    'white-clad',
-    'white-gloved',
-    'white-headed',
-    'white-tiled',
-    'whiterock',
-    'whitewashing',
-    'whitewater',
-    'whitham',
-    'whodunit',
-    'whymant',
-    'wide-scale',
-    'widescale',
-    'widmark',
-    'wiechert',
     'wife-beating',
-    'wilander',
-    'wildscape',
-    'wildski',
-    'williton',
-    'willman',
-    'winant',
-    'winchilsea',
-    'wind-tunnel',
-    'winders',
-    'windfarms',
-    'windorah',
-    'window-ledge',
-    'window-pane',
-    'window-sills',
-    'windows/nt',
     'windsors',
-    'winemaking',
-    'winemark',
-    'wingrove',
-    'wingz',
-    'winkled',
-    'winona',
-    'winship',
-    'winter-flowering',
-    'winter-lets',
-    'wintle',
-    'wishaw',
-    'witan',
-    'witherington',
-    'withey',
-    'withholds',
     'witley',
-    'wittenberg',
-    'wlm',
-    'wnt-1',
-    'wobbler',
-    'woddis',
-    'wofford',
-    'wolf-whistle',
-    'wolfskin',
-    'wollen',
-    'wollongong',
-    'wolters',
-    'wolverine',
-    'wombs',
-    'wonderbra',
-    'woodmen',
     'woodroffe',
-    'woodturners',
-    'woodwards',
-    'woolcock',
-    'woolgar',
-    'word-for-word',
-    'word-initial',
-    'word-lists',
-    'word-perfect',
-    'word-processed',
-    'wordwise',
-    'work-experience',
-    'workday',
-    'working-men',
-    'workingmen',
-    'world-picture',
     'worldsource',
-    'worldwatch',
-    'worrisome',
-    'worser',
-    'worthier',
-    'wotcha',
-    'wouters',
-    'wpa',
-    'wrede',
-    'write-ups',
-    'wro',
-    'wto',
-    'wull',
-    'wundt',
-    'wus',
-    'wybran',
     'wyclif',
-    'x-cells',
-    'x-inefficiency',
-    'x-server',
-    'x.400',
-    'x3',
-    'xb-70',
-    'xd6',
-    'xenia',
-    'xf3',
-    'xgl',
-    'xhosa',
-    'xii.',
-    'xiv\'s',
-    'xj6',
-    'xliv',
     'xlr',
-    'xlv',
-    'xpg3',
-    'xr',
-    'xxv',
-    'xxxii',
-    'xxxiv',
-    'y\'all',
-    'y\'are',
-    'y\'see',
-    'y320',
-    'yaeger',
-    'yali',
-    'yasuhiro',
-    'yay',
-    'ydrys',
     'ye/06/25/0000',
-    'yearbooks',
-    'yel\'tsin',
-    'yello',
-    'yeuk',
-    'yeutter',
-    'yip',
-    'yonhap',
-    'yoon',
-    'you-',
-    'ytfiia',
-    'yuh',
-    'yuill',
-    'z&uuml;rcher',
-    'zadkine',
-    'zairean',
     'zakho',
-    'zanardi',
-    'zang',
-    'zangwill',
-    'zapotec',
-    'zaza',
-    'zborowska',
-    'zebu',
-    'zheng',
-    'ziff',
-    'zim',
-    'zina',
-    'znf11',
-    'zodiacal',
-    'zoey',
-    'zoggian',
     'zooxanthellae',
-    'zukov',
-    'zuleika',
-    'zwirner',
-    'zymogen',
-    'zz',
+)
+
+blocks_15 = (
+    '!+dollar;0.18*"80(+1&ndash;1.5)#.45*"71*"91+!3)$1.6m)&40,000*!m)"70)$9.95("21)"7m)"8m',
+    ')#000)!3($4.4m*"6m*"7m($5.2m($6.7m)&50,000!)frac12;oz(!p)!t!.lsqb;t&rsqb;he"(t;config$&del&gt!*mdash;that',
+    '!+ndash&pound!+pound;1,720(!.)"85)"98($0.25)!6("14("26(%3,500)!2)!7(#40m)!7("56',
+    '\'$230m($5.50)!9("78\'%3,300(&25,000(%7,000\'%4,700(#.2m)"4m("4m\'%5,800(#.20("60\'#6.8',
+    '("5m\'"71(!2(!6\'&88,000("bn!3scaron;kr&eacute;ta #\'64!"76!&appens"$vin\'!$twas %**new!!a!$john',
+    '!"/+ "-c")almodulin!(dropping!\'hairpin!"ii"!n!-microglobulin!$rays!#sam"%trand ".7 &/&agr/ $0.11""24',
+    '""65""77""84""93#!6!#001!#244""65""95!#628!#702!#830 %1&bgr"#deg")frac12;oz',
+    '"\'700,000!"-k!#.26#!8"\'4-litre#".5""67!"/6!)0&ndash;8#(shilling""-6#$hour##man$$onth#&strong',
+    '#"50""08#"cm#$ngml"%2,000""90"!d!$1.14#"6%""18""48""69"*th-century%$hour!&2.30am',
+    '"#000""24""39"#5ml#!p""71"#ins""pc!$3(2)#"3)"#.10#"3%#"6%#"7%""02',
+    '!(4-member"!.#"00#"4%""08""21""42!)5&ndash;2)"44)!9"#(2)"#-11#!6#!7#$hour',
+    '"(0-member#!3""km"!v!&6-cell!"7m!)8&ndash;1"%5,000!$9-22#&member"*04&ndash;5#)8&ndash;9"+29&ndash;31"#305#*2&ndash;33',
+    '"%5,000"+62&ndash;63#*3&ndash;64#"7b"#70b#*1&ndash;81#"4a$!b#*8&ndash;81$#/79#*9&ndash;82"%83/84#$7-89"#93.!&:10000',
+    '!!u *2&ndash;12(!9!#(a)!$-6-0!#.22#!6#!m"#3.2#!2"#4.1!"/2"!6!+0&ndash;30%"\'-member',
+    '"#.2%#!6"$0000"#ins!*1&ndash;24"\'-member!\'2&deg;c"%-year"#.4%!&3-year"#.4%#!6!&4-year!(5-minute"!.',
+    '"#000#&ml/8fl$!m!*7&ndash;28"%5,000""pc!$8.6%"!s!!l!!o *3&shilling!#(7)!!*!"-9"$iron',
+    '#!4!*0&ndash;45)#50%"%-foot#&member"&0-year#"0s#"ft!#2.1"$0sli""mm!&5-yard""50!*6&ndash;45"#844',
+    '""in!#700"#132"#243"#302#"32#"81"#445"\'5&deg;f"#656#"95"#707#"32#"96"#828',
+    '#"49#"54#"72"#920!#800$!1#"27"#212"#372"#451"#513"$6bsd"&759-60#"85 *4&ndash;10',
+    '!%-iron"$year!#.19""22"$45pm!&0-akce"".5"#0ft!#5.5""ft!#6.6!$7401!%9,000!":4!#asa',
+    '"(shilling!%,000m"#300!/-fluorocytosine!#.18!)0,000,000"\'-member#$yard"#0ft#!k#"lb""km!$20mb!"66"!p',
+    ' %6,700!#-10")month-old!#.27"#5.1!*0&ndash;90""24!%1,000"!8!"48!"59!$8060!"mb $7.18"#3.3',
+    '!"46!"51""ml"!s!%7,000!!d!!f #8-0!#.17"#2.1"#3.1!"02!"44"!8!"52',
+    '"!9!*8000-based"#100"!4!"91 #9-7"#pin!#.0%##0pm"#1.1$!2#!1#!2#!7"#4.0',
+    '!"26!"38!"41"!9!"58!"67!"74""th!"86!$9.9%$!9!"oz 3a&eacute;rospatiale#(uml;tius!\'-plenty',
+    '""i.""s.!"/a!"13""68!"82!$aaah""ib"$rhus!%bacos##dan"(botsinch""c1#!d")del-halim',
+    '$%nathy"$ided"%jured"(negation"&omasal")racadabra#$uzzi""sa#%cissa#.ent-mindedness#\'tainers"#una"#wor!/cademic-related"-celerationist',
+    '#\'omodate$(rdingly.$%sting"(haemenid$%lasia#%ernar#!y""ib"%k-ack"$orus#(usticube""ps""ri#\'ylamide"\'tionaid',
+    '#!u"\'uteness"%yclic!%d-lib""aa#$mski")ded-value#(ressable#%ucing""el#!r""il#"os"*judicatory$#red',
+    '"$nams""oc"\'sorbent)!s"\'ulatory!\'egidius"\'rosmith")thelfrith!\'fghanis"!l"!m""on$"so"*rancesados#\'o-asian',
+    '%$deck!$gana",enda-setting"%netha#&us_dei"$outi"&rimony#!s"$udat!#hgs!$ichi"!e"&guille"+r-breathing$%force',
+    '%)o-surface$$vent#)craftsman#$pump!"ke"!i#!o#"ta"#sum!(l-khatib#%majid%%ktoum",ain-fournier#"na$#son',
+    '%"us"%cazar"%dabra#!i"$egre##rce"\'friston"%ister"\'lahabad#(erthorpe$!z#\'gemeine#%husen##ier#$oyed',
+    '"&manack#&odovar$#ner"#ner"#sop"!y!-m&eacute;rica""ar$"al"!b#$ache#+er-coloured#%iance##les")ercements',
+    '#$slan",ino-terminal$!u##tri"#ore"#pes#%hiura#$ulla\'#ria"#way!,n&iacute;bal"+aesthetists#$lyte#$tole",c-government',
+    '#%hises"(dalucian#&ermatt$%sitic#!i#$ress$&onicus#!s"!e"/glo-catholicism&\'iranian%!s#)st-ridden#$uita"!i',
+    '#)streplase"#mer"&nalist$%purna#%ibale$$goni"(onymised"*tagonizing$(nanarivo#&i-aids%!b&(allistic&$lack%)cellulite%#hev',
+    '%*republican%$tito$%cline%(oagulant$#ent$&nomian*#ism$(platelet$#qua\'$ires\'%rians$&reflux#&onello"/xiety-provoking"%yroad',
+    '""nb"!s!(partness"&odemes#\'llonius#)thacarion"$pals#\'le-tree$,iqu&eacute;d#&ointor"*r&egrave;s#"es#&il-may"#ter#(ly-named',
+    '!\'raldite"(buthnots"&cadelt#)hetypical"!d#%glass"(ea-based#%quipa##tha"#g17#$huri##ive#%onaut"$ioso"#jun',
+    '#$eria#,our-piercing#(y-backed"#rol"+teriography\')sclerosis#0ist-in-residence!%sacol".bestos-related"(cendants&$ency#$itic"(h-blonde#"iq##man',
+    '"#kar")similates#&uaging"!u"!v!&t-risk"#get"(hanasius##man"&letico"&omised%#zed#$ning""ra""ta',
+    '#(enuators$\'rcliffe!,uctioneering"+stro-german\'(marxists",thenticating#&ocrats$%focus$%glass$%mates\'#ons$,radiographed#"re#*umn/winter&$alis',
+    '%$ions$"ts"!i#"ce"&ondale!$wdry"!s!#zar##wad (b&amp;bs"+eacute;dier"(uuml;low!!-""1r"$type',
+    '!&aalbek"#ber#%irusa#\'y-faced"\'ck-pack%(to-backs(%front&)ranslated$&combed$%house$\'washing##ton"%d-boy$$debt$\'looking',
+    '$"wi#"by##dow#\'lesmere#%oglio""gi#$lady""hr"&il-out"+lance-sheet\'!r#&derton#(linasloe&$gall$\'sbridge',
+    '#$ston#$toro$!s"#mba$#ino$%oozle"#nat#$corp#&d-stop$&leader##kes$$roll#$nock##try##zai',
+    '&#try"&r-code##atz#%beque%%rshop$#ies#$chan$#ode#$dsey#*e-breasted%&footed$%faced$"nd#-gain-basement\'#ers',
+    '$#ngs##kin#&nahely#\'ometers#(tholemew##uch"$sher$%fully#\'ilicata#&slines"&t-like##aan#\'chelors#%hetic#$iste',
+    '%(ring-ram$&le-cry&&mented"#udo#!r#%tista"$vent"$yard"&zadais$$rgan!#bbc"#c-1!"cd"!f""lc',
+    '!&ealach#&rdless#%stmen#$t-up$)ification"#cau#$kton"\'d-linen#"dy#&reddin##win"&ecroft#&fsteak"\'getting#%gared',
+    '"(havioral\'\'uralism""it"&laying#$ches#\'l-tower$"er$"um#&ow-par#,t-tightening$"er"$nali$"ud#$ders$$inat',
+    '#%guiat##ing#4nett/gloucestershire$&ington$!o"\'risford##ner#"ty"$ssel#,t-performing&(reserved"*ta-tubulin#(tencourt%*r-educated&%house',
+    '$"ie#)ws-y-coed"#vis"\'wailing#%ilder!(i-weekly"#bit")ckersteth"#ded$"ts"#eld""fu"$g\'un#%amous""ko',
+    '#!d#"en##ges#)lionaires#$ston##ton"+o-chemistry$*technology#+degradation##lab#%psied#\'rhythms"&rching#&dtable##nam',
+    '#&ecting#"ho%\'pthorpe#(tability"(tterling&"ns#$wise"$xman!)j&ouml;rn"\'ornebye!*lack-earth\'$dged&%white%$caps%#mun',
+    '#&enavon#$nder$\'k-faced%#ing#!s$%pheme(#ies$$tula#$xter""dc"\'eachers#%sford"#ida#$ghts#%mmin\'',
+    '%%craft"!m"!o#$feld#&mfield#\'odworms#$win\'$$n-up"&ubbery#&eberry$%grass$"st#)ish-white#"ot!#mdp',
+    '""us!%ochum#$king"(dyshells"\'erhaave"%gyoke""ht"%kassa#!e"!l#"as#"er#&fracks#\'t-holes"%n_mot',
+    '#&nyrigg##sal",ok-collector%&length#!r##tie"%pping"#rax#&e-hole##gia#$isav#!k##oss#)th-y-gest"%serup',
+    '#"on#$sano"$tfly#,tom-dwelling"-uch&egrave;re#+lder-strewn\'#ing$#ter#$nden#&requat$&gchier%\'eoisies&!t$$jois#%ssena',
+    '"$xall"%ynton!\'put&num!\'radburn#\'fferton#(hmaputra#$in-2&$stem%%waves$$sing##mah$%bling#$nche$+kovi&cacute$#nan',
+    '#,s&iacute;lia#&zenose"!b""dc""ea$&d-soda%!y$%k-ups%&ing-up$#ley$&stshot$+thing-space#$ccia#"da#!r',
+    '"%ickie#%dgman$$ling#"er#&gantum$&flatts$*hton-based##nes&%hrimp#&tisher$!o",oad-spectrum%$loom#%cades$%kbank',
+    '#%drick#%llies#)nchoscopy$#tes#&omhill#%ussac##wer$\'n-paper%$bill%#sea"!u#%maire$#fit$$mell#"ni',
+    '#\'talized!#sac""ri!#uav"#ber"(cephalus#\'henwald##kby$"ie$$leys$%wheat"&ddicom#+get-holding#$imir"\'jumbura',
+    '"(lbfields#$gars#&lfight&#nch$%ivant$$ring##wer"\'miputra"$nked"+reaucratism##ges$#her$!i#%nhope$#ish',
+    '"(tterwick$\'onholed"%y-ins!"wb!$yway %c-bus!%.d.c.""p.!"60!!9"!0!\'aboodle""dd#"le"%ersws',
+    '"(landrini#\'citonin#$l-in%$sign$"an$$inan&"gs%$pers#$oris#$pers"%macha$!s#(berabero$$yses#\'erawork',
+    '#\'p-fires%*stimulated$%anula$&erdown"(naanites#%diano$&lewick#&onized#&tiones#$zone"-ptain-general##uts"\'r-parks$$wash#*d-carrying',
+    '#\'egivers$$line#%lsbad#&nlough##oli$%usels#"pe%&tright#%racci$&owdore#\'t-track$$eret#%valho$"el#&yatids',
+    '$$book#+h-and-carry$$card#$sons#&taways$(lemartin$$ries"\'talogus$$rrhs#\'echisms&(olamines#$hars$#ery#$mint#!t',
+    '"&ulerpa"(valcades$$nagh#$e-in#"il!"ba"!f"#hps""oe!#cab"!o!"de!"ea"#fic"#lso',
+    '##ser#&taurus$(repieces%#oid%"um#"zo"%ptors"(rebellar$&visiae"#tia$#nje!#fel!,h&aacute;vez$)circ;lons)(teauroux',
+    '"$agny#&inmail$(rpersons#&lloner#%mbray$&penois#*ngeability$#tel&#use#$pare$%uisat#\'radrius$(gepayers$#ial%&oteers',
+    '$$lery$$nock$"on$)t-topping$%woman#\'stising#$t-up$$ters##ura"\'eapened#\'ddleton#(esecakes&%maker#$mics%$nage',
+    '##ops#)querboard#%roots$$ubim#!s$*hire-based$)terfields#"ta#.vauch&eacute;e$$ette#(wing-gum#$yney"&icanes$,hester-clark#%guana',
+    '#&maeric$)ney-piece#\'nchilla$\'oiserie#\'p-based$#per#"ts#"ve"-loramphenicol&"te%$ides&"te%$osis"#ock#!e',
+    '#\'llerton#(rleywood#"uf#&wdhury"$ramn#%ister&%leton&(mas-time&(opherson\'!s#%omate\'&ically%#ite$#nos"&ukchis',
+    '"&cippio""me")nderellas#&eworld#%nabar"(rcularly#8encester/gloucestershire#)rhilabrus""s-#!c#!t"(tyscapes""vc!$lach#$nnad',
+    '#)ss-ridden%%ifier*!s&"ng#*tterbridge\'!s#\'usewitz#%vicle"&earers%&ing-up#"fs#\'menceau&"ti&"za##rke',
+    '""ic#-ent&egrave;le#\'ff-face#\'mb-down#"os#&p-clop#!t")ockmakers#"re$$inda#%se-in&&season%$down##wer""rc',
+    '#%nbury!"mh"!w!"nv!+o-marketing#(sponsors",ast-to-coast")ck-a-hoop$#ade%$toos"%ddled#(emasters")extensive"%gelow$"ns',
+    '#)d-pressed#%emans##gan#$itic#\'lectair%(ge-based%%mbola$%ocate%#quy#!n#%ophon$*ur-pointed#$tart$"er#$umbo',
+    '#%bated$)i-steamer#%etary#*ing-of-age#0mand-and-control$,on-or-garden&$hold&\'ly-used$&unitel#+paor&eacute%/rtmentalisation$%lexly$(onential%&stella%"te',
+    '$&userve%+ter-related($gram\'!x%$ware#%tesse#0unicaci&oacute;n""n.#*celebrated%(ntrators#&flates$%orama&$mism$)raternity#.gregationalism',
+    '#(junctive*$itis##ley#&silium$\'onantal$/titution-making%&rictor#/tains-source-of$)entiously%+xt-specific$-inental-style&&gently$&ortion$\'retemps%\'ol-room',
+    '%$x-91"(ok-chill$#in\'#"ns#$pted"\'pleston#)per-based$#ull"%rdura#$inna#%khill$&screws#)n-growing$%flake$$meal',
+    '#(on&aelig#,rectionalist$$odes%"on%"ur##tez#&vettes$!o"%senza#*mopolitans#&seting#+t-of-living$)ermongers"&thique"$ugar',
+    '#!m#3nter-demonstrations()espionage()intuitive()proposals\'$acts\'%foils\')intuitive\'%poise)#sed%(ry-style#%perin#\'rmayeur$&trooms")variances',
+    '"&wbells#"ey#$gill"#xed"*yle/oxford#"te!"pg!%rabby$$wise#$nach#$ppee#&taegus#%wshay##zes"%eamer',
+    '#"pi#\'scendos$"sy"&ickley#$mble$*e-fighting%(stoppers$\'inalize$$ping#$noid#$ppen#"ss"!l"!o#$cked',
+    '##ich##ker#"om$!n#)ss-stitch\'&ubsidy&$wind%$link%$road%%winds"&uachan#%eller#!m#%sties"$yin\'',
+    '!&sa/cyp"!c""su"!w!"tk""os""sp!#u.m"$bing"!i"*llingworth#-ture-specific#%verts")mberbatch#$ings',
+    '"%rbash##ler##now#$rier$$ying""st$$ards"$tlet#)ting-edge!$x/cx!,yanobacteria"\'berpunk"$cads#&lopean"$gnet',
+    '"&tr-dna 1d&eacute;coratifs")ouml;nitz!,\'&eacute;tat"&albret##rte"&ohsson!#-32""do"$stem!%.i.l.!)achshunds"#kyn"(l&iacute#$epak',
+    '#&housie#)lapiccola#%riada#$tons"%maris#*p-proofing$#ens#$sons"#nas#$cin\'"$rfur##gan##vel#\'winists"%shiyn',
+    '##ses"\'vidians%$sons""ws"#yan#$room!"dd!"e-#.differentiated#%icing#\'skilled"$afen#\'th-beds&\'dealing&%house',
+    '"%brett$%iefed#+t-servicing$4or-creditor-supplier"+carboxylase##can#$imax#$kers#&orates$%upled")enethorpe#\'p-lying#(rstalker"-familiarizing$%ulter',
+    '#%iling"*gree-level"*humanizing"#kko""le#*inquencies##lar#$phoi#\'usional"$meke#$inex#(ocratise*#ing$$ting"/nationalisation',
+    '$$thor#$tate"\'pailler#+ersonalized#0rave-and-corrupt$\'eciable"*rivational#%ngate"*saturation#$cant$&endent#!e$%crate##sin#&uetude',
+    '""th#(oxifying#*rimentally"&villed%$ment#"os"&wdrops#!s"%xtran!$g/ux""ms!(iaconate#%lysed#$mine#!n',
+    '"!b##din"%ckins#$onal"&e-back#(lectrics#+sel-powered#%tetic"%ggins#&itizer##nan$%itary&#ies#&ressed"$llie',
+    '"%mmest"!o#!p#$rite"&pentum#\'lodocus#"sw"$rham"&s-ease#\'applied\'!y$*ssociation#)colouring%\'mfiting&%posed',
+    '#)ease-free$*stablished#)gorgement#&locate#%poser&$sess$&utable#&robing#(sections%&ntient\'!s$&uading#(tempered%&nsions$1inguished-looking',
+    '",thiadiazoles")ve-bombed#)isibility#"vy!$jing!"lo!"m1"$2.43%!5$"55!)o-nothing#&or-die"$bash#$rica")ctrinally',
+    '$%ridge#$well""el"-hn&aacute;nyi"$inyo"%llard##mus")me-shaped#!p"&nadoni$#tes#$egan#$levy"(r&eacute#1chester-on-thames',
+    '#"je##nan$"ey$&hausen$"ie#!t"$uala#\'ble-act\'%cross\'%ended)#try##gan$"hy#!x"\'vetails',
+    '#\'n-river$#ers!"pt!%rain\'#(matizing"%edges"%iberg#&ftnets#$ller#*nk-related#%p-dry"!m"#oid##ops#&p-goal',
+    '$"sy"(ug-using#\'mchapel#$nker"&y-dock!&uchies#(k-billed"#gan#$outs"%mmett"$nces#&sinane"!r#%acell$*nd-dessert',
+    '#"ch"#san"$toit#"ta!$yin\'"\'slexics##ons -e&auml;rendil!#.a."!h!#ads#!y"-gerly-awaited"!p"&rldoms',
+    '$)y-warning#!p#(th-based"\'stfield$$side"%table$#ine"#van#*esdroppers!$bdon"#ley""ro!*chographic$!s"&kstein',
+    '"&toderm"*umenically!"da"!m!"ee"#jit!%famol"!f##ace#(ectually#&luxion!%glise!"h2"!o"!s',
+    '$$mann"%desis"*ght-member&$page%%pence%*y-year-old"!l"$thne!(jectment!(l-gharbi"!a"(derfield"(ectively%#ret&\'ic-blue',
+    '\'\'plating\'$weak""im#!s""ke"#les##ing"!p#%hberg"$ston"\'usively"%ysees!)masculate"&banked#$roil',
+    '"\'minster!\'n-route"\'d-grain$%march$#use#%piece#&sleigh"\'grained#$ulfs"\'joining$&yments"#sor")trainment$#eat\'#ing',
+    '$%opies"#uff"%zymic!#ons"&raptor#\'cenwald"*sinophilic""wa!"p2"%horus"+iscopalians#%taphs"!u"!z#!s',
+    '#)itability$)vocations!&rdmann"$ecta#%wiggo""ga"#ick#!e#$skay"#man#$olov"$oica""ps"%ratum#<or&mdash;return&mdash;detail',
+    '#)thromycin!%scada""ko"$mail##ond"&palier"&tancia$&te-car##lin!2thnomethodological!)ubacteria"*lenspiegel"\'phonium"&ro-mps$(centrism',
+    '!&velina#,n-handedness%(tempered$#ter%#ide#,r-decreasing%\'greater%)improving$"ly$#son#3sham/worcestershire"!o!%worth!)x-cabinet$\'hairman',
+    '#(director#)offenders#$pats$(oliceman"(aminable#\'sperate"&cising#\'ludable#!o$&riated#&retory"\'ecutant#$kias"*hibitioner#\'umation',
+    '"#od.#&gamous#\'nerates(#ing#%rcize(!d"4pectations-augmented$"ls$#nds%#sed#(lainable$&oitive#+ropriations"(tendible$)rminating',
+    '#.ra-contractual%*judicially!)ye-screen%&ockets%#pot#\'balling$$link#&stripe )f&ndash;g"+oacute;stri"-uuml;chtbauer!#**k!#.j.!"10!"7c',
+    '"&ctored"&hfakhs""in#)r-skinned%\'weather$%brass$#ish"#ker%!s#"ih"&lconet#$kman##mer#.sificationists"*miliarised',
+    '"&ndango#!e#$gorn#$nies#&tasist#!u"#pla")r-distant$$left$&seeing##_as#!a##ges#+mer-patrick$%yards',
+    '$&sfield#"uq#$vver"!s#$cias%#sti(!c#)t-forward$!a$$back$$lynx"+ther-of-six#"os"%yette"#zal',
+    '"!s!\'easibly#\'therbed",bruary/march"*cklessness"(derative"#ely"$ints"%lgate#\'icities#$lini$*ow-student#%onies#$sted"%midom',
+    '#%tanyl"$rnox#%ritin$$ules$\'ymaster%$side"$stus")tishistic#%locks"&verfew"\'yenoord!"gm!+ibrinolysis"#che"&dchell',
+    '$"sz"&efdoms#+rce-looking"%field#)teen-year"&gueroa$\'reheads")lename&gt$!r#\'ling-in#&mstars#+ter-feeding"$ndus#)e-looking#*gerprinted',
+    '##ley#$mere#"ni#$town#%ucane"#ore%#llo"*re-engines%%proof$(lighters#$hill#$ings#&st-day&\'quarter&%stage',
+    '&$mead$#in\'$$lock$$wife#"ke"\'taurari#\'zgibbon$\'maurice"$ve\'s$+-and-a-half%#bar&&edroom%&sixths"\'xed-sum!)lagellant',
+    '$%staff#%tford$%terer)!s%!s#$vius"%eeced##sch#&tchers#)ur-de-lis")ight-path&"ed#&msiest#%nches#&pchart',
+    '#%ttern"%okati#$rent#\'wcharts"%udyer#$elen%#len#$nked#)oroscopic*!y"$y-by#)ing-boats##sch!#nac!$oden',
+    '"&lasade#!e##iar#&k-tale$+linguistics#\'licular"#nds"-od-processing##kes#*t-soldiers$#ers$$sore"*raminifera#*ce-feeding#$ding',
+    '$%skins%#tay#(feitures#%gings#!i#)m-filling$"ic$(lessness$\'ularies#"ne#%sworn#%teana%!x$*hrightness$&inbras',
+    '$&y-foot#$well")ssil-fuel#*ter-mother"&therby"*undational%*er-members#(r-bedded%&figure%(momentum%%stage\'$roke)"ng%%timer%&vector',
+    '$&square$-th-generation\'\'largest\'&placed\'\'quarter##tre"$xpro!"pp"!s!5r&eacute;d&eacute;ric"+a&icirc;che#*il-looking%"er#%me-up$(wellgate',
+    '$&k&euml$,ti&scaron;ek#$snes"-ee-enterprise%\'scoring$%dberg$"st&#one#&ighted#$nais$+ch-canadian#0quency-dependent#(udianism(!s#!w',
+    '#%ckley#\'pperies#%sking#"ts$"zi#$zzed"(odingham#$mage#!n$\'t-ended%*o-parallel#)st-bitten"#ump#&semide!"sc',
+    '!#tes!\'uck-all"\'denberg"#gal"\'lbright#\'l-board%&motion%\'skirted$%backs$&circle$\'y-grown"*nctionless#)d-holders$,aci&oacute;n#\'gicidal',
+    '&&oxford#"th##uno$$seth"$seli"#tch#*urologists!"vc!#wag 5g&eacute;n&eacute;ral"%sharp"*uuml;nther!"-8!#.d.$"r.',
+    '"$q.g.!$/day!"37!(abelhorn$!s#+riel-ernest"%etano""ga"&leazzo#(lbladder$!i$%oways&$gate$%stone"#may',
+    '#$elan$$plan$"te##gee"$nton"#ram#!d$#ena$$ners#&finkel#$gled#&otters"\'s-masks#&holder#&ometer',
+    '##ses#-tro-enteritis\'*intestinal")tecrashed"$ugin#&leiter#\'nt-face"%votte"$wley#"or#!p"\'zankulu#%ettes!"bs!%d-sft',
+    '#\'rchange"!b"$ckos"+iger-muller#$sler$#way"%ladas#%dings#"li%"ng",meentemuseum"$ncor#+der-neutral#(eralises&;te&mdash;root&mdash;package',
+    '$\'stealer#"ii#%nifer#\'tamicin$$ians#*uflections"%rardo#*m&aacute;n##och$$nimo%$tius&(ologists$#ski#+rymandering#%vaise',
+    '#&chwind#&tetner"&t-well"#yer"$zira!%fcc\'c!#h-k"#azi"%erkin#+tto-blaster"%illie!\'iannini"&daspov""la##der',
+    '"#mli"&ngrich"&onesca"#pps"$rded#$lies%$shly"+ve-and-take$"th!"ks!(laddened#%nders#+ss-panelled%"ed%$ford',
+    '%&y-eyed#%zunov"%ennis"&itches"\'oomiest#)ssopteris"#uon#%tamic$#ted%#ons!#mag!"nu!)o-getting"*al-setting#%tskin',
+    '"\'desberg#%manis$&others#"ot#$unov"$fers")ggle-eyed"!i"%l-oya#%dblum$)en-haired$#ner#"fs#%itsin#%tzius',
+    '"&od-day$%haven$#ney$%ridge#"ld$#ies##sed"\'rbunovs#\'e-booth##nji##rie"*steleradio"$tham"\'ughdale##nod',
+    '"-vernment-held+\'imposed"$wing!$p120""ra!&rabber#%cilis#\'mmophon#%ndads%&e_dame%#pat$$tors##ppa%$elli#$tian',
+    '")ease-free$/t-grandchildren+(daughter%%coats%&swords#(en-field%#bow%&castle&$roft%\'sleeves##yed$$mass$%scale"%ibble#%ffins',
+    '$&bergen#&zedale"$oins#$lsch##pes#\'tesques#&und-up&#sel#&velled#%wmore$$nups"$ungy#!s!"sr")t-protein',
+    '!(uacamole#%nines#\'rdhouse%!i#&yaquil"\'estroom""id#%lcher$%dsmen#&maraes#$ting"$lled$$foss")n-running#%metal',
+    '%#oke""rr"\'stafson"%thlac#"ta!#yda"&mkhana"(psophila"&ration *h&ouml;rst!!*!"-h!#.b."&k.l.r.!"2s',
+    '"#ber#"ta"$dith#"ow#&rianic""em$(atemesis$)odialysis%%nchus%&philus&&oietic"$fner"%garth#(ue-visby%$llar',
+    '#\'r-style"%lcrow#)f-a-crown%\'blinded%$cock%%drunk%&frozen%%hardy&%ourly%(measures&%inute%$pass%$tone%#wit&#ord',
+    '$$tone#*icarnassus$%faxes$"ma##las"\'mamelis#$berg$$ling#!e#\'mersley\'"on#%stone"(nd-brake%)delivered%\'holding',
+    '$#job$*kerchieves$&maiden$&picked$$work#$kses$\'y-panky##mer#$ning#(s-jochen$!a$$ford"#ran#&d-copy%$eyed',
+    '#&ebells$%hills#%grave(!s#&leston$&ington#%monie##oun#&pooned\'!s#$rell$%idans$#old""sp#\'selblad',
+    '##ted"\'ustoria#"we"$veli$%rsham"&wklike"#xby"(y-on-wye#"at##dar"#zed$!s!"br!(ead-butt%\'hunting',
+    '$&boards#(lth-food##ner#)rt-broken&$rate%(breakers%#ies#)t-seeking#\'vy-atom"$cate"%eling"#fce"&imdall")lensburgh#%iport',
+    '$)enization$%ibore#%minth$#ont$%sdale#&p-line"$mpen"%ndley$%ricks#%house#!n#$reid#$sman#"ty"&patoma',
+    '#(tonstall"\'raklion#%berts#)e-and-now#+maphroditic#&schell$!i$$tory"(sperides##sen##tia"*terosexist&\'zygotes"$wing"%y-day',
+    '!"hr!%i-fis#\'jacking"%bberd""ca#&kstead"%dalgo#&eaways#*ing-places"*gginbotham#"h-%\'fashion%(interest%%sided&\'tepping',
+    '%$lere$)est-level$)ly-strung$&nesses$$rise"(ldesheim#(lbillies$&ington"-mself/herself"*ndu-muslim%$stan#$nies"(phoprisy#"pi")rschfeldt',
+    '$#elf#*tochemical%!n%\'ricists&(y-making")tchhiking%$ings#$tite"\'ve-down##ing"\'zbollah!$nf-l!"oa"(bgoblins""ca',
+    '"!d#%gkiss""ed"#ffa$&man-la##ner"\'ld-over#$ness"\'me-bred(!w%%owner%$spun$$brew$\'othermy$!y',
+    '%#ine#(ogenized"$ndas#%eybee(!s##ked##shu"%odlum$"oo#"se")pefulness$$toun"&rkstow#%nbill$$dean',
+    '#\'sedrawn%$less$%forth$#ted#&tatory$+iculturists$"us"%siers#(tellerie"%tbeds#%heads$%ouses#%lines##pot#$shot',
+    '"0ughton-le-spring#$lton#&rglass#+se-builders&\'keeping%&groups%\'parties#"ys"(verflies%%speed"%wgill\'!s#$land#"se!"pi',
+    '!\'s&amp;e!%uambo"&geness"#lse"&manize##eri"+nger-strike#$sley$&tanton#)tingtower$"on"$rren"$sain#)band/wife#\'tledown',
+    '"$yghe!-ybridizations(!e"\'drofoil%&xylase"$eres"%ndman""on"\'pericum%)ventilate#(henation#&notise#,o-allergenic$&biotic$&stomus',
+    '&\'esising"&steric %i-ifn!#.a.!#975!-bero-american"\'m/apple!\'ce-caps##box#$fall#"ni"!f")osahedron""tu!,deal-typical',
+    '#\'ologist!"ec"$styn!*gnimbrites#\'orantly!"hm!#ias""is!"jc!&l-6res"(eocaecal")l-fortune$)organised$$paid$$used',
+    '#(usionist"&menite"!n""ps!%mager$#ist"\'broglio"%igran#"no"#mac#&ingham#+obilisation#*unisations%)ogenicity\',lobulin-like',
+    '$%rator%(ialistic#$lode#,ossibilities%$ters&#ure$&unding#,robabilities%(prieties#(utations!-nauthenticity"(carnated#$hinn#\'idently$(nerating',
+    '$#tes#.ome-generating$&nstant"*defeasible%&inably$\'pendant$)x-linking%#ers#%iamen%)n-pacific$%ction$(rectness$-vidualisation,#ing#(uctances',
+    '"+egalitarian")fecundity$)rentially$%sting#,initesimally#(latables$#ect$\'uencers#&ocheck%#orp$0rmation-handling,*technology)$vely"&geborg$"ld',
+    '#"ot#%raham%)tiatingly$%owing#\'ushetia")halations")itialling"%kwell"*quisitions(#ors"(scribing#\'ecurely$\'minated$"ts%$ting',
+    '#)tantiated#*ubordinate$+rance-based"\'tegrand$(mperance$%ndant$(r-church\'(onnected&)dependent&(industry&&school\'&ervice-!s%&calary&$eded',
+    '&(ommodity))unication\'$oler&\'ropping%\'diction\',sciplinarity%&iority%%laken%&nalist(!s%&polate*$ions%+relatedness&)ogatively*#ory',
+    '#!i$\'midates#(oxicants#+raoperative%,peritoneally%(vascular$(ojection##uit"+vaginations#&eighed$$rary#\'olution"%zamam\'\'-ul-haq!&oannis',
+    '"!s""us!*psilateral!$qlim!$rgun"!n"&on-ore""pc"+repressibly!%s1151"#900%$-pcr$!2",land-hopping"$mael',
+    '"!n"&o-vote#(chronous#&enzyme#(morphous#&niazid#$pach$$tera#%stasy"&suable!%tamar"$chen"!e""ma"$oman',
+    '!#uds!%veagh#!r"&oirien#!n!"wm!#x\'s"#mar!$zaak $j.g.""l.$"r."!r!\'abbered$"ok',
+    '$%randa#$into#(k-knifed$#ley$(sonville""hn"&ilbird#!n"#mbs"2n&aacute&ccaron;ek#"ab#"ez#-uary-february"$rryd"%velot',
+    '"\'yaweera!"cc"$m900!,ean-philippe"!f")rry-built"$ssup#$ting"%welry$"ss!$haro!&ig-saw"#ngo#"ks"$tter',
+    '!#klf!%lulat!#ncc!*ob-hunting$\'seeking#$ling"#del#$hpur"%hanne#%nsons%$town"%inder""jo"&rasses"\'sephite',
+    '##son"#kes"%liane$$enne"$mada#$bles"%nkets$!s$$yard##tao"%ssieu""v.#&enilia 3k&aacute;d&aacute;r!%.p.h.',
+    '""fy"#han#!l"#idu""la#"im$!n#$kara#%pokas"#mes##pot"$nawa##nel"%pital#"ok',
+    '%#oja$!z##ena%"in##ina##mal##oly#$rubi#$ting"$spar"#tes"$wawa""ys"#zuo!"ds',
+    '$#ton#!y"#ech#!f"+malpasazade#$pson%#ton"$nelm#$nard$,edy/scotland#\'t-based""oi"%rfoot#"in#$rang',
+    '"!t#!s#(tledrums$#ner")yboardist#$ence#%notes#&stones!(halistan"$otan"$thon!(ick-offs%\'started"%dnaps$)ey-shaped',
+    '"!f"\'lfinnan#$lala%#row$"in#&wardby"(mberlite*!s$"le"-ndertransport#%gpins$$side%-ton-upon-hull#$sley"%pping',
+    '$$hill"%selev#$mayo"%tchin#$sons$\'uregawa#!t#"we!$jell!"ke!"ld"&ondike""ug!*nife-point&(wielding',
+    '")ock-kneed"\'uckling"$yvet!$ober"$chan"$diak"%epang"%honen"(mmandant##odo"$nare#\'dratiev"$ontz#"ps"(quillion',
+    '#!e#$olev#"ps#"th#"up"%shino#$ygin"$urou"#vac"#x21!%rauts"#ems"$imml"$oton"%ueger',
+    '"&zystof!\'uenheim""la$!k#(turkampf"$mble##mer"\'ndalini"\'rchatov#&lovich""ti!"wp!$yles"!u -l&eacute;gion',
+    '")uuml;beck!&\'herbe!\'-series!%.d.p.""m.!&abudde"(ce-edged%$like$$wing#"on#%quers#!s"%dgate#%ymont"%ender',
+    '"\'ganside"%idler#"ne#"rs")marckians#"ed$(llipodia##mas"$ncer$"s.#)d-holding$#ers$!i$!y#\'gerhans',
+    '$$lauf$#res$-uage-learning#&kester##tau#$yard"%ocoon#$tian"(pidaries#$sang"%rbert##gue#%khill#$ne-2"%sagna',
+    '#%swell#+t-mentioned"5te-nineteenth-century$%comer"%uding#%ghlin#\'rentian"(vatorial#&ishing##oro"\'wcourts##ren"#xey#$ford"&yforce',
+    '"%ziest!"ba""s.!"ca!&eaches#!l#$nnda#&rnable#(seholder$#hed#,ther-covered#%ve-in&&taking"%chner##kie',
+    '$!s""el"(ft-field%\'luggage"\'g-irons#%atine#$gett$#ing#(ionellae$\'timizes"$hrer"#mar#$berg#$ming##nos',
+    '#%inism#$nard"$onel$$tief#%poldo#"ta"%ptons""sk""tt$%erewe"(ucovorin##ven"$vens$&raging#%itate',
+    '"%xemes!#gcm"!m!"hb!$ibab##dem#%erace&,l-historians(&labour(#sdp#"ri")chtenberg%$heim"(ebknecht#&nhardt',
+    '##rne#&vesley",fe-enhancing%)histories%\'jackets$&cycles$(lessness$1spanconfiguration$%table#$ford")ght-brown\'#ulb&(fingered&*headedness&$year',
+    '#%nites#%urian"\'kierman#&ud-led"(ly-white$!a"&mbless#&escale$$wood#,ited-edition&!r#"os"%nares#!c#\'ebacker',
+    '$$outs#$gens$#ual%!s#\'k-leger#$nett#\'otronic#$wood"$pset"*quefaction"%smore#$ping##som#)tlessness")thocholic',
+    '#!i$$gate(!d#(tle-girl&$more"&veable#"ia##ret&!s"%zzies!\'jungman!$leyn""nl"*oyd-george&%jones',
+    '!"m3!&oaders"%bbers"&calist&"ze#\'hcarron#&ked-in$#jaw#.omotive-hauled\'"or##ums$$tion"*gistically##jam#(ocentric',
+    '#\'g-dated%$nets%\'stemmed%(vanished$$case$#don$%hurst$$reen$%worth"#ons#&seleaf"(psidedly"#ram#%edana$#lei',
+    '#\'ry-load##sch"$ssit$$less"#tka"(udhailer#%ngers"&vibond".w-productivity$\'skilled#&enthal$(r-priced%!y#$life!%ublin',
+    '##ona"&dgrove#%milla"\'ffenham"#kas"!l"%minol#%sdens"#nda"#pin"#ria"(stgarten$&reware"(xuriance!)ycopodium',
+    '"&sosome \'m&amp;g&!m",eacute;decin!%-form!#.s.!"10!"56!9a&icirc;tre_d\'h&ocirc;tel"\'cartney#$cabi%$rthy$!i$&ormick#&donagh',
+    '#+hine-gunned-!r\'#gun\'#men#(ijauskas#(lauchlan#(naughton#\'onochie#\'roberts%&cyclic%$text"#ddy#\'havsinh#%stock#%woman',
+    '#!s$$tros""fe"(gellanic#(isterium#*nanimously$\'um_opus"&haraja#$onia""ia#%denly#%nmast$&planes#-sons-laffitte$#ter',
+    '%#ian"$kalu#&ing-up#%onnen#$wetu"%lachy$#kit$&ysians#%colms%%ntent#,distribution$"om#%enkov#"fa#"ia',
+    '##loy"%medov"\'n-eater)!s$&of-war#%awatu#&cetter$"he$$iple$&unians#&dating$!i$%olins##ezh#&glapus',
+    '#\'iacally$,c-depression#%man/x#"oj$%meter$"on#$sard$"ha#$tell$$issa$#led$#uan#)y-faceted#!z"(p-making',
+    '"\'quettes$$ilas"$rama$#nyl$!t#\'ch-past%$wiel$!i##dle$"uk##gam%$rete$$ined$$rave$\'uerites',
+    '$$elle$$tain##jie#,ket-research#$mots#$ring#%salis%!n$$land#&tinmas#%ubeni")sculinist##had#&lyukov#%sless',
+    '$$iffs"\'tchings%&makers%\'winning#*erialising#&hewson%!y$"is#%ignon#\'riarchy#$suda%$moto#)urational"%under#)ritanians',
+    '""x1#!2#"ey#$imin"+ybury-lewis#"en#%nooth#)or-making$#tte#!r"#zia!#bos"$ytes!(ccaffery$#gue',
+    '\'!n#&lennan%"od$#oud$#ung#%ollum$$nkey%&nochie$"ys##rum#%ubbin$"nn$$sker"!e"\'gaughey',
+    '#$rory#&uckian$#inn"&kerrow#%ibbin$$nney"&martin##inn"+nair-wilson#$eile"(partland"%smith"\'whinney!#dhc!"e\'',
+    '#"ny#"rs#$tier#"ux"&chelen#(klenburg"&ddlers&$some#*ical-legal%\'o-legal$(terraneo"#eke#"ra$$kats$!s',
+    '"\'ga-rich$%hertz$#tek##ill"&i-ling#*nertzhagen"*l&eacute;e#$aena$(nogaster#(chizedek##ded$#ola#$illa#%lower#-odramatically',
+    '"*morability"&n-only#&dacity$%iluce#%iscus#"on$#rca##ses$%hikov#&talist)"ic"#ols""ra#%canti($list',
+    '$"da##kel##man##rie$%ybent"&ss-tin$\'iahship#"ut"+tabolically$)fictional$+sedimentary%\'omatism$&thorax#$ford#$hven',
+    '#+oclopramide$%nymic##uji"!u##len"(xborough"&yerson""za#"zo!"fa""gb!"hw!\'iaowing",ch&egrave;le$)aelangelo',
+    '#(ro-level%$data&&iorite%%lepis%&module%&porous&*rogramming%%somal%\'tubules%&writer"&d-1970$#20s$#30s$#60s$)fifteenth',
+    '$-staffordshire$%thigh#,dle-distance\'%level\'%order&#mas&-sbrough-based#$rips".ght-have-beens#%litol##non#!s"$klin"$le/h$!r',
+    '#$lais$%ipede&#ore$#man#)ner-white##ord#%tonic##via"&namata#$dset#&eshaft##gus#(i-league%$step$&scribe',
+    '#%uchin"(ps-based"&rfield"(saligned$(nthropic#(begotten#$cast$+hief-making$#ues#(delivery#!e#%fires#*government#$hima%!t',
+    '#/interpretations#*judgements#(matching#&prints#*represents#$tily"%tchel#&hraism#\'sukoshi%$zuka#$tler"(xed-race#\'olydian#!u"$yake',
+    '!(l/minute"$adic!#mhg""sc!#ncs!%oabit"%b-cap#&ilizes"#cha"%eller"%hamad"&ieties#$gnan##nes#%seyev',
+    '"&lality#&esters##ler#"to".ment-to-moment&!o"&ndello$!o#)ey-market&\'raising%$bags#&gooses#%istic#)odactylus$%types',
+    '#\'tfaucon$*h-by-month%$lies$$upet#*umentality"%oched%#ing##nie##rea$$town""pe"&ralism$#ndi##e\'n$#llo',
+    '#"ia$$ston#)ning-room#&phemic%\'ologies$#ork#%raine#$tain$#ems$&ifying#$vael$#ich$"yl"%scone"-ther-daughter',
+    '\'%to-be&#ese#+ion-picture#*or-cyclist%%/load"\'untain\'#(th-organ"*vie-making"\'zartian!"r2!$sdos"!i"!n!&uammar",ch-discussed',
+    '##oid"\'d-brick$%flats#%dying#$ford"\'ftiliks"%ghals"&irwood"5ka&rcaron;ovsk&yacute"$lder#%grove#$hern#$lova#*ti-channel&\'product',
+    '&%track&&volume%\'channel%$mode%%polar%$vite"(ndeville$!o#\'ificent#%netra$$ings"%rillo$$muth##ten"&scatel',
+    '#)eological#$iche%!k%\'ologist$!k#(tachioed$!o$!s"%tates#!i$"ng!#x-5!\'ycelium$$nean"#lne',
+    '"%rddin"\'stifies")th-making$$agos!!z )n\'djamena"!s!#-no!%.l.j."&z.l.r.!#111!#acc""di#$roga""ik',
+    '##rne"#jaf"$kane"\'mbudiri#&esakes#"ur"#nas#%jiani#(oseconds#!s#%terre"#pes#!f#&oleone#"ss',
+    '#!f#.row-mindedness"$shua"+tionalising$\'ve-born#\'terjack$$rass##ura&!e&$lise\',ly-occurring"&utique$"or"#zir!#cck',
+    '"!u!"d4"!5""rp!-e\'er-do-wells"\'ar-miss%%total%(vertical$!y#!s"\'bulised"+chtanesmere#(rotising")edlecraft&%point',
+    '"\'fertiti"+gotiability"%isser"*o-colonial$(fascists$(georgian$\'liberal$%natal$\'realism#&dymium#$gene#+lamprologus#%plasm"*phrogenous&%toxic',
+    '"+st-building"(t-of-tax#\'builder#%frame#(herstoke#&manage""uf#)robiology#)trophilic#"ve""ve$)r-married"(wfangled#,ly-developed&(launched',
+    '&!k#(s-stands$#boy$\'casters$$heet$+room/london$#tat$!y##ydd"&xtdoor"*zavisimaya!"f1""fo!&gc4258"(orongoro',
+    '"#amh"$ckle$#san#-otine-stained"#eve""gg#\'ht-gown&(watchman"$hilo#!t")kolaevich"#mba")ne-wicket$#ty-"%ppers',
+    '#!w""te"$vver!!k!"ma""fs"$ol/g!)o-alcohol#&claims#$good#&strike"#.11$!4#!5#!7',
+    '"!3"$bble$"ut#\'lewoman"%cenzi"#ell"!m#)_de_plume##ine",n-absorbable%&erosol%&rrival$%banks%\'leeding%+ureaucratic',
+    '%\'omputer&)nformists\'(stipated\'$tact%\'ritical%(ustomers$(dominant%\'rinkers$+educational$&french$-inferentially&)volvement%$ssue$&lethal$)mandatory',
+    '$)nationals$%obese%*verlapping$+radioactive%)efundable&*gistration&%lated%$ight&\'valrous$&scalar%&erious%+tandardised&&erling&\'rategic$%turbo',
+    '#+committally&\'pliance%(nforming#(entities#\'payment$%ublic#*sinusoidal$$tick"\'onpakdi"$pces"0rd-pas-de-calais$"en#&mandin#*th-central&)eastwards',
+    '%"er\'"ns%%lands%$over%$town$)on-taylor#$ways$%eigan"(se-dived$#bag#\'ocomial"/te-against-note#0ional/functional##ley"$vena',
+    '"*w-familiar#$icka!#pas!$uaaw"#bia"*cleocapsid&%somal"#evo""ff"#mbs#\'ismatic"$nney"#ria"&thatch"&volari',
+    '"#ico!$yers"$mpho "o%!&\'boyle"$lone!#.p.""s.!\'akbrook#$eley$!y#"um"&tlands!+berammergau$&hausen',
+    '#!t"$jets"%loquy"*sequiously$&ssives"(tuseness!&cciput#%lusal#&ultism(!t)!s",eanographers##lot"$hres""ic',
+    '!#dbc"!p!&euvres!)ff-course$#day%\'iagonal$%field$%shoot%#pin#$ical#$wood!%gnall"\'rizovic!)hio-based!\'iliness',
+    '!$kawi"!n!(ld-timer##ish#$park"\'eanders"%ympos!"me"-nidirectional!"n-#$call"(ce-great%#off"!d"(e-by-one',
+    '$$line$$many$&storey$#ton%$rack%(wentieth##din##gin"!g""ny"#tap!%ocyte!+pen-circuit%%heart%*mindedness',
+    '$&ing-up$"up"+hiomitrella%$toma($inae$#ura"$ines""po"#rah"\'timises!"ra#!n#%tions"*chestrator"+der-winning',
+    '"*ganic-rich"+ientalising\'&tional"$loff")namenting#+ithischians#%stein"\'ogenies"$rery!%smium#\'olarity""sa"\'tensive$%rmark!%thman',
+    '"!s"#tar#%onian!(uedraogo"$fkir"*t-of-touch#(breeding#&gunned#&pacing#(r&eacute$"an$%igger#&scored$#ell$(ide-left',
+    '%)emphasise%\'grazing%\'heating%(inflated%%night%)populated&(rotected%%ruled%%tired%)valuation%&worked$\'balance*#ing$-determination$#end',
+    '%&xcited$&filled$%heats$\'painted%(opulated&(weringly$#sea%\'hooting%&taffed\'#yed&#eer&$ress$%turns$\'working!\'wenites',
+    '"&n-goal#*er-managed""re!"x2"%fords\'*hire-based",yhaemoglobin!)z/&frac23"#zie 0p&aacute;tzcuaro"-eacute;cuchet!#.18""22""31""61',
+    '"!8"$c.b."$n.m.!$1/t1"!6!#24t!&585t7a!"61!"90!&=0.005%!6!%abham"$cers#%kings"&dfield',
+    '"%gasai#%eplus"#ias#(newebber"\'kefield#+istan-based"$lang#)eokrassas%)ntologist#!i#$ling$"ot#\'m-trees$#yra#&ottino',
+    '"\'naetius#%dered#$etta#$guna#\'khursts#$nage$$onia#$tile$\'ographs"\'perclip#%illon##uan".raconductivity$%disal\'"es',
+    '$%lyses$*psychology$(sitaemia%*ympathetic#,enthetically#"ix##kas$%field$\'ing-lot#\'lophone#(miggiani#&odying$!l%#les#+rot-fashion',
+    '#\'t-owned$!e$$ible%\'cipator&\'ularism#$venu"\'s-score#$cale$!o#&sfield#&turage&"ed"(t&eacute#\'agonian#\'ched-up',
+    '$$ntee$!y#(h&eacute+&;tique$\'ologies#,ient-centred$%neurs#$more#%ricof$%olman"%ulina"+ving-stones&!s"\'wnshops##son',
+    '$#day$&packet$"tv#%loads##nes#%rolls#$slip!%c-dos"!n!$dp-8"!q"#vsa!"e2"\'ak-hour#(rce-hall',
+    '$!t#)t-cutting"&corino"+dagogically#\'imented"$gasi#$well"&i-tsun#!n"*joratively"$lion##ops"\'nalizes#&dulums#!e',
+    '#\'haligon#\'insulas$%tents#"ne$.sylvania-based$&yroyal##ryn#&shurst#\'tameter$"on$%reath"+psinogen-ii"&r-cent#+ceptiveness\'%ually',
+    '$#ies$)ussionist%)taneously#+egrinations$$lman$$nnis#+fectionists$$orma#%ineum$&portal#%muted#\'nickety#)petuities#%rault#\'secutor',
+    '$&uaders"&tering%"le#-ition-drawers#\'ronella&#ius$"us##tit$!s#"ur!#fge!\'halange##ros##zer"+enomenalism',
+    '$%ander$$emon$$idor$$lipe\'"ps&%skirk$"ps")legmonous##oem"$okis#&necall#$rbol#+sphodiester\'#ric#\'to-call',
+    '%+coagulation%&phobia%)sensitive"$ylis$$lida$,ogenetically#(sicalist&!k!)iatnitski#&zzetta")ck-pocket$&erings#(oseconds#$rite#\'tograms',
+    '"1ece_de_resistance#(t&agrave$#ies"&ffling"%ggery$&y-back#\'natelli"%latus#%ed-up#%lowed##may#$sley$#ner"&mentos"\'n-prick',
+    '##ged#$head#(k-footed##ney"(pe-dream"#res#(ouetting"!s#&s-poor"!x"!z!"ka"!o!1lacebo-controlled$%idity',
+    '#%naria$%tlets#%skett$#min#-telet-derived$%onist$"ts#&vinsky#%yboys$$offs",e&ccaron;nik#%anala$,sant-looking("ry%$ured',
+    '""fa"&onkers#%sives#\'ughland"&umtree!"mc""ma"$oles"\'t2-plc-!&nipenv!"ob"-int-and-click#&soners#$tier"&lartek',
+    '*!s#+icy-related$)sh-german$&ticise#)onium-210#$ston#)tergeists#&ygenic$&linker$\'pectomy%(hosphate$!s%%emous"!n#%deral',
+    '#"ti"&or-law"(pfiction##lin#\'perfoto$%ycock#\'ulaires&"rs%"us"$rras#*t-of-spain$\'astudio$*folio-grid$%icoed(!s',
+    '&&itists$/uguese-speaking"&sitano#&t-1992%)christian%(doctoral%\'fordism%)graduates%%holes%&merger%$race$&elnicu$%holes$)modernity%*ultiplying',
+    '"(tts/anna"%uched#$lett#$nces$$ders"+wer-brokers&\'station&#ups%%boats%$soft!#pbs!)racticals#\'esidium#"is#&nkster',
+    '$#ten#"vo"!b"&e-&bgr$*adolescent$\'baiting$(existent$%first%$lash$%human$/nationalisation$*processing%(ubescent$*romanesque$*scientific',
+    '$)victorian$\'wedding%$orld#$cast$&eptors)!y$%ocity%(nceptual#(dicating#(eminence%%ptive$\'xisting#(fectural$%igure)!s',
+    '$#mia$\'onitory#+operatively#"p8$%acked#\'ss-gang*"ed%"ie%*ure-cooker\'\'isation$$tage#*tentiously#$veza"\'ice-tag#"ed',
+    '#&maeval$)itiveness#(ncelings$!g#!s$\'cillian#*vately-run$#ily#(zegiving")o-british%\'usiness$\'english$(natalist$"us#$b\'ly',
+    '#)ceedings.%0ssor-independent#/ducer/editorial#.fit-orientated\'\'related$&ounder#(gestogen#,inflammatory#)liferates%#nea%!x#&p-room$,erty-related$(itiation#/secutor-general',
+    '#&teases%$stor$&otheca#(venances$*identially##wls"#yde!$s/2s"!n"#sru"*ychoactive&(logistic&%metry&%pomps!+tdins(4,5)p',
+    '""s.!$ubes#$lic-&!k"%ddled"&ffinus"&gachev#"et#\'ilistic"&issant"%lcher#$lach%!n$#ers$%inger',
+    '"(nchcards#\'itively#%jabis##net"$pate##pis"(restrain#(posively"#san#%h-ups$&button#%tules"$t-up"%zzler!&v-wave',
+    '"#res#$ites"%thian \'qaddumi"#umi!"nh!&uacked#)draphonic#$ffed##ked#%lcast$+ity-control#)ntisation\'"ed&#zed',
+    '$&tzites#-si-autonomous&(periodic"\'ebecois#$rcia""ia#\'ck-wash%$draw##mby#\'nolones#$roga#$te_a%#ron -r&eacute;chin!!*',
+    '!%3000a!$5000!!7!*ace-course#*ialization"/diation-induced$*calisation$+o-frequency&$room%&opaque#(zinowicz")gamuffins"#hal#"im"&ilcard',
+    '#%mondo#&nswept"%mbert#$ping"$ndle$)om-access#\'sacking"(pid-fire%!e%*ly-growing"\'sharkin$%triya#"ps#)tafarians"\'tchette',
+    '&"es##tus"!u##nds"*ven-haired%&scroft&(tonedale"%yleen"(zorbills##zle!#bmk!#cbf"!t!"da!*e-admitted',
+    '$(rranging$%ssess#%birth$$uild\'!t#\'contras%%vered#&define$+istribution#\'entrant$\'xported#&fitted$\'uelling#.identification#)organised',
+    '#\'release$$oute#)scheduled$%igned$%tated#&wiring"%acher$&tances#"de%#rly$#in\'#\'l-terms#)ppraising#"rm#\'ssembly',
+    '#$umur"#bbe#)elliously#%urial$&ttable\'"ls")claimable#*ommendable$*nditioning%*figuration\'$rmed%&vening&&iction$%rdist")d-bearded',
+    '%#ook#&esdale#$neck#%oubts#%polls#$ucer"%eboks#&d-beds#&xamine")fashioned#\'inished#&ocused$$lded#"s."&galian',
+    '#,ionalisation#&ranted$%esses#!t#\'ularise%"us$!m"$hash#&nquist",ichsminister#"fy#,ncorporation$*stallation$\'tegrate#!s',
+    '"(kindling")lationism#"et#$ight$!t")mastering#)embrances\'%ement#!i$%tting#)ortgaging"(ndlesham#$tier"\'package&"ed',
+    '$(rcussion#(licative#+olarisation#/ressor-operator$*oductively#\'ubblica$\'rchased*!s""s.#%ealed#&hevsky#%ounds#(tiveness$%rains%)ucturings',
+    '"%takes#(iculated\'!e\'"in\'%ocyte$$rals#&ouched#\'ractile$$ovir$!y#1urn&mdash;detail/"\'unified"+verentially%\'se-flow&$ibly',
+    '"&ynaldo!$flps!"gu!\'hayader"$eged#)toricians"*inoceroses$!u"\'omboids"!t"\'yolites##ton!\'ibaldry#(bon-like&"ed',
+    '##ose%$omes"&ccione#(e-davies#2hardson/gloucester$"et"%ddler""el#!n"%ggers#(ht-angle%"io#"or"\'llettes"&mswell',
+    '"*sorgimento#%soles"$tson"&vermen$#tte""xi!"jo!!k!"ll!"nc!*oad-blocks$\'holding&#use$&runner$\'sweeper',
+    '#!y""ca#$hard#&k-like$$hill$#ier$$wool"%d-tip##dan$#ing"%gallo#*er-bernard%#ing"\'hwedder"(le-model',
+    '#&l-neck$&ed-out%)r-skating&%skate$)ing-stock"\'mancing$#rio##tec"%nchey"&pework"&saline#\'e-marie$"au$$burn##han',
+    '$$lare$#man#!t#)y-cheeked"$tgut#&hwells#$onda#$ring#(tingdean".ugh-and-tumble#+koub&eacute#&ndhill#\'tinized"\'vaniemi"$wena',
+    '"\'zenburg#+hdestvensky!"pd"!o!#scg#!m!\'ubbishy#%y-red"$cked$"us"%ddles"#ger#%gedly"!i"\'le-book',
+    '"#mba#$ford#%mages"&n-outs#&around#%dgren#"ic"#sch#&hlight##san#$tics"%tskoy!!v"!i!&yvitas',
+    '!"-s",transferases!%.1(2)#!2#$6(2)"$4(2)"$6(1)#!1!!0!$1(2)"!7!"20"!5"!7!#429',
+    '!"57!&681(1)!!7!!9!-abbatarianism#"ri"&ckfuls"(ddlebags$$ucee#"ek""fa#)ety-first\'#pin"#gar"\'ilboard',
+    '#&rellen"%laman#"eb#$gado#\'ivating#"li#%sburg$#ify#\'t-laden$$aire$%iness#)vationist$"ia%#nia""m.',
+    '$"re#\'e-sized#"ia"%nborn#%croft$$tify%"on#&dalled$&bagged$&castle$#weg#%genic$$ston#%jurjo#"te',
+    '$%uario"\'pperton$#hic$!y"%qqara"(rah-jane#\'dinians#!e#$gant#"ky#&rasine##son#(tzetakis"%sbach#&katoon',
+    '#&iation"(uerkraut#&salito#+t&eacute;ed#$vage"%valas$%nnahs##lon#%ognia$$yard""xe#\'ophones"$yyid!$bats""cd',
+    '"\'abbards##lby$%loway$#ped#&ndlain$"ia#)pegoating##rag$#per#&tcherd"-h&ouml;nhuber#$afer$%nberg#$eldt%$ling',
+    '#&ickert$\'kaneder$%lling$$pper#,luderpacheru#&mitter##nur#(olastics$&nfield$\'ol-aged\'\'focused(%riend\'$room$$rske#%uback',
+    '$&tzhund"*ientifique##lla#\'ssormen"%later"$opes#%rpius"(rap-heap#)een-based&$shot&\'writers#$ibed#&ounger#\'unching"%udder',
+    '!1ds-polyacrylamide!\'ea-bird#\'led-off$$skin%%tones$!y#$rles#%shell#\'t-belts$%belts$#ers"+cond-string\'$time#"te"%d-pds',
+    '#\'ulously"$eger#\'rsucker"!h""ia#!f#%kosha##mas##pei"!k",lf-citations&,ontradiction&&utting%+description&*isciplined',
+    '%)generated&,ratification%*immolation%*justifying%,organization%+reinforcing%)selecting%\'tapping#)kirkshire#$lier#$sdon"3mi-autobiographical%\'retired+$ment$*conducting',
+    '$\'skilled"\'nescent#&sitize$(orimotor#-tence-meaning""pa#%hardi##tal"&quined"$rail$$phim#(f-owners#\'ialized$"fs#*vice-based',
+    '"$t-to"(ven-week$&rnside%"um\'!s#"so"(xtuplets!#fry!$geir"(raffiato!&haaban$!r#%bbier#"ef#$heen',
+    '&%uddin#$mble#$ndon$#tih%&y-town#$pers#&re-out%\'dealing$#iff$$wood##sta#)tteringly#$vers#&wcraft$#ell',
+    '"\'eepmeat#\'ll-like##ngo$%stone#%viock"\'ielings$!s#(fty-eyes#$mano$#bun$"my##ned$"ko$#ned#&rnette',
+    '#(ck-waves#)eburyness#%ppin\'#(re-based%!a$)t-comings&%dated&$fall&&period&\'staffed%"ed%#ing%%lands#&velful#&wplace',
+    '#%iller$#ven!&ibbald#"yl"%ddall#&e-door%$road%%walls$&lights#&lesham""fu"%gnage$%board$$oria##urd',
+    '"!l#&iconed#&kiness$&sworth#"la#&tation$&stones#*ver-framed\'$gilt\'&topped&(smithing&$tone$(iculture"$mcox#%ensen',
+    '#&ranjit"*n-offering#&cerest#(gle-lead\'&seater#%kport#,o-vietnamese$$watz#&usitis"&ouxsie"\'phandon#"ko"%thole#*tingbourne#*uationally',
+    '#-teen-petalled$%y-odd!%kerry#&tchily"(i-slopes#$ddaw#$ffle#$llet#&n-deep$%tight#*pping-rope#&rlaugh#&vvying"$lair"#nsh',
+    '##ros!"l2"$aked##ney$"ts#$pper#!t$#ing#)veholders%"rs"&edmere#*ep-walking%&y-eyed#$ssor#$uths',
+    '"%iders#%mmest""oa#"bs#%ppily#&ughing#&vakian$+ensk&yacute"$udds#&mptown#%rries!$mail#(ll-group%$town#\'rtdrive',
+    '%!y#&sh-hit"&ellies#%ralda"%idgen#+th/scotland"#ott"%ychka!\'nacking#&keskin#%tcher"&eakily#$ddon##ezy"$ipes',
+    '#$rers#&wdrift$#men$&storms"!s"#uck#$ffle\'!s!%o-far"\'akaways#\'p-opera"*cial-class$$etas$+obiological%(linguist',
+    '"&ftball$%eners$#ner"#gat##eti"%isson"&lebars$$cism$!d#!i$)citations$(darities%)ification$"ng$&taries',
+    '$#man##tau#"us#*vent-based($weld%"rs""m.#*atosensory#\'erfield##mat"(n-of-sam#)/daughter#+g-and-dance"(on-to-be"\'phistry',
+    '"#ugh%#ing#$lboy#"py##sed#$tter"\'yabeans#$bean!(padework#%lvins#-rc-compatible$"ke""ea#/cially-designed%$fier',
+    '#\'eded-up#*ll-binding#\'ranskii$)matocytes%&icides$#rin##zia")herulites"(iegelman#%ffing##nea#%rally$&ometry"%lashy#)enomegaly',
+    '#%ilers#"ra$#ran$&thotel"%rawls#\'eadbase#\'ingtown#%ucing"$urge#&ttered"&y-hole!(ql-based##/ds"\'ualling$&re-cut',
+    '!&ridevi!$spca!%tabat$&ilizes#\'ffrooms#\'ir-rail##lag#(ndoffish$!e$$wyck#$pley#&rburst$\'fighter$&kisser$#pod',
+    '&&sector%(lessness%)s-general$#ism$,us-conscious#$yers$#in\'"&eading(!s$)m-engines&%power%$ings%(rollered#%edman$\'lworker',
+    '\'!s#(gosaurus##ins#(p-family$&hanian$"ps##ria%&lizing$"ns"(ick-like#+gmatisation#(ll-lifes%(ingfleet%%water#%mpson',
+    '"+ock-rearing%%er/st%&sfield#"er##koe#&lidity$\'onifera##mps#\'nebench%$wall#%ol/24#)rekeepers$!t#%utest#&werton',
+    '&"ov"(radbroke$#han$)ight-edge$%sberg&#urg$&t-type%&hallan&%naver$(uss-kahn$*w-coloured#(eet-lamp&$talk$#ibl$-ss-relaxation',
+    '$%ganov$)matolites$&ngroom#$udel$%gnell"*uart-moore#"be#%dding##kas##mpe#"nk#"pa$(efyingly#%rrock##ssy',
+    '!#u\'a"(b-branch$)conscious$+directories$%plots$\'surface$&titles#$bing$$uteo#$game$%enres#(jugating#\'massive%%ximal$&ersion',
+    '#(regional#%sonic$)titutable$%uming#$test#(ventions"\'ccussed#&h-like"#ff.$&ragans$#use#"is"#jet"+lphonylurea-!s',
+    '$$oner")n-glasses$&soaked$#tan#-derland-based#&nyside#"pc#%shade$(olutions""or"\'per-fit&#gun%)abundance%\'cooling%*saturation',
+    '#!p"(rcharged$#oat#%efire#/face-to-surface#%iname#$vage$&ivable""so#$weca!$vein#%nsson"$r4.1!#w10"$ains',
+    '##rtz#"zi"\'eetmary%$shop"(iftpacks#&mathon$*ming-pools)&trunks("ly#(thinbank!&ybaris"$lhet"\'mbionts#)ptom-free"\'napsids',
+    '(%ously$(opations#)onymously#&spilum#/tactic/semantic$%honia%!s")stematize&$ised&#pro )t&amacr;r$#p;c"%dgr;s!!-"%cells',
+    '!#.c.""e.""h.""r.!!=!*abernacles#*le-topping%%curve"(chypnoea#%klers"%galog##ger#"us"#hoe""ig',
+    '$$back$$spin"$kako##eth"\'lismans#$lish$$ymen#%mudic"&marind&"sk#&bopata#%eness##ino#"la")nganyikan',
+    '$!s#!i$"th#\'nenberg#\'talised&"us"$oist"&peworm#\'honomic#$ioca$!r"%rdily#\'lenheim%#ton#&macked',
+    '#"te"(ste-buds$$iest"(ttersall$"le"$uber$$mans#$rine"%xiing#"on!"bl!"cg"!t!"da!$e566',
+    '$%house$#pot$%rooms#$cake$,her-research%,ing/learning#&msters#$sers$(poonfuls"*ctonically"(e-shirts#"ce#!m$!s#(totalism',
+    '""la#0e-communications$$cine%+onferencing$(graphist$&machus$*pathically$\'scoping#$star"\'mazepam#"bo#!e"&n-hour$#ton#-ants-in-chief',
+    '##ore##zin"$rgum#!i$$yaki#&magant#!o##ran$$ines"$ssie#&t-case$!a%%rossa"&tchily#)rodotoxin',
+    '"(viotdale",xt-to-speech"#zla!%h\'can#$self"$aler$&ictrum#"ws"\'eobalds$&dolite&#ros#-rmoregulation-#ory$%opods"&iazide',
+    '#"n\'$&-faced%&lipped$$nish#*rd-biggest&%floor&$hand&%order$#sts$\'ty-foot\'&second"&omasin(!a#%rndon%#ham',
+    '$#sen#)usandfold"&racian(!s#*ee-monthly&#one&&strand##ips#"um%#med$$ster"(umbprint%&screws#)nderously#(ringians',
+    '$&maston"%warts"%ymine$$uses!%ickly"&deline$#way")e-breaker"!f"$gger#$uary"!h"&khonov"(llingham"(mberland',
+    '%$line%\'related%%share%$worn$)/distance$\'keepers$%ously#&perley#"ur"$ngly##ier%!s"%oxide"&p-toed#!o',
+    '"!r#\'esomely"*ssue-paper"&t-bits#*le-chasing"!v!%jolle!$mtsf!!n!$oady#\'stracks")bogganing"&ccatas",day/29.10.93&(newsroom',
+    '""ks"&m-cats#$alin#\'foolery#$mies$%y-gun"\'nypandy"\'olmaker##mey"&p-knot$#ten##log#%ocide#$spin"%rgyan',
+    '##ras$"ey#$star#\'tuously"+talizations\'"er##ton"$ucan$+h-and-close##ghs#&rville#*sle-haired#\'t_court""ve"+wn-dwellers',
+    '"*xocariasis$\'plasmic!$p298!%raber#&ctatus#,de-unionists%%scant#)mpolining#$ngia$*s-shipment%,criptionally%&ferees%%genes%\'latable&&ocated',
+    '%(personal&&onders\'#ses%(racially%)sexualism$#tec#$pnel$$pist#+vel-stained&#ing&)lers-fare"&eacher$&tment.#\'dinnick#(e-trunks',
+    '$$orne#&nching$$dies(!t#&shnish#)vor-roper#"ws"\'ialists#$bble$$unes#\'cameral$(hologist&%monal*!s$"on',
+    '#"ne$!h#$plex#&teness$#one#)vialising(&zation"#off#"ie#$odos$!l#\'tskyite#+uble-making$\'ser-leg"%r-trr',
+    '#&e-blue$$love#!k#\'mpeters#"ng"#wyn")ypanosome!\'ucayana"#ffs""ir"%mmies##uli"(nnellers"\'rbidite)!s',
+    '%(charging##gor#\'lington#%ncoat$#dal$&ed-out\'"up$#our#\'tleneck""si")tankhamen#%wiler"!x#$edos!%weaks',
+    '#1nty-four-year-old\',six-year-old")ice-daily#$ddly##ggs##n-t$"go#\'tchings"(o-centre$$door&"wn$$line$%point$\'seaters$&tiered',
+    '&!y"$yver!%yacke"%deman"&lissos"*mpanometry"\'pe-face$\'casting#%hoons #u-2"$form!&.s.s.r!"16!$6000!"a1',
+    '"!u!"cb"!d!&dinese!%fford!#huh!%jamaa!&kulele!!l"$-haq"/tra-nationalist%%sparc!&mbarak#\'ilicals!(n-backed',
+    '#(ddressed$%opted#(llocated#\'merican#-ttractiveness&&ibuted"(baptised$$rred#(eknownst$)lievingly$"nt#&undled$\'rdening"!c#$ared',
+    '$\'ristian#$ited%#ral#+lassifiable$\'eanness#&oiling$\'nfident%(querable$\'rrupted#\'tuously#(ustomary"\'defiled$\'livered$%r-18s&(reported',
+    '&&lanket%(financed%\'gravels\'\'ounding%#let%&passes%\'scoring&(ecretary&%tairs&)ubscribed%&trials%\'valuing%4wood/buckinghamshire#$rawn$(eamed-of',
+    '#!m$/ployment-income#\'scorted#&xposed")faltering$%ncied$#zed#\'easible"\'happier"+i-processor#,nterruptedly#\'t-based##ved%(rsalised#*x-on-intel',
+    '"&needed")orthodoxy")predicted$-oblematically%)ductively$$uned"(reactive$&deemed$&garded$(membered$&peated$(searched$\'vealing"(sanitary#)crambling',
+    '#(milingly#&paring$&eaking$%otted#!t"(truthful*"ly"+warrantable#\'ontedly$%unded"#zip!&p-beat"!6"&lights")per-crust',
+    '"%shall#&taging",ward-sloping!(rbanites"&inated"(ological!*s&dollar;1+(,000,000,#100+%5,000*)2,000,000*#300*%4,500+)0,000,000*#500',
+    '+"00*%7,000*%8,000"(e-values##nix""rc"!t!#uac!%varov -v&iacute;ctor!".c#!.!"10"!6!"2s',
+    '!(accinium#%uoles"\'ginitis"(lderrama##ens$#rio#%finet#)ue-adding"\'ndalise$&enberg#%ellus"*porization"$rden")sculature#"il',
+    '#&salage""ul!"ec"3geburger/singletons##gie"%ining"%lasco#!d"\'neering$"tz#\'gsarkar#%neman#\'tricles"&racruz#&balise',
+    '#%laine%$nder#$nson#"re$#ico#"sa$!t#"um"!x!"gc!#h/g!*ice-consul$#nza#&kerman#(timizing',
+    '"-deo-on-demand%$cart"&ewport"%ggers"$lely$"st##ify"&rement#&ginsky".s-&aacute;-vis#&a-free"%terbi#&iating$!s"$vace',
+    '"#zor!$lado"$itos#!w!(ogelsang"+latile-rich#&ksunie#$lard#$ubly$)ntariness)"st+"ic"!m##ica$"ts',
+    '""po"\'rontsov#&tigern"+te-catching"+uill&eacute!#p16!"r2!"th!#ugs"%lgare##val!!v!$yner -w&ouml;lflinn!"/o',
+    '"&gamama#(e-labour%%price"&inscot#)st-length#)ting-list"%ksman"$ldon$\'sterben#\'kerdine#*l-painting$"ey$#ich#%ruses"!m',
+    '#$gled#%nabes$#see#!s#\'tonness"#qfs"&rbands$#utt#\'ming-up$(ongering#%plane")sherwoman$%rooms#"nt#!s',
+    '"#tan#(chmakers%&towers#*er-courses&&lilies&$mill*!s&&supply%\'proofed*$ness%#ski#$tles"\'vebands$&packet"\'yfaring',
+    '#!n""2r"!y!%e-ell"-alth-creating#\'rsiders"&ek-old"\'instein#\'zsacker"$lham##kom#)l-drilled%(executed%%grown&&uarded',
+    '%&judged%(polished$%fleet$$ness$$port$&spring$\'wishers#$sted#"ty"(ndlebury%#ing$!s#\'nington"(rewolves")stcountry',
+    '%)rnization\'$most$$more$#ons"&t-look#"uc!#ftu!#gpt!&hampoa"*eelwrights#$ldon#$reat"$iles#&p-like$"py',
+    '#)te-capped\'#lad&&gloved&&headed&%tiled%$rock%\'washing\'#ter$#ham"&odunit"%ymant!)ide-scale$%scale#$mark"&echert',
+    '"&lander#&dscape%"ki#%liton$#man"$nant#\'chilsea#(d-tunnel$#ers$%farms$$orah%\'w-ledge\'$pane\'%sills&$s/nt',
+    '#\'emaking&"rk#%grove$!z#$kled##ona#$ship#-ter-flowering\'$lets$"le"$shaw"#tan#)herington%!y$%holds',
+    '#\'tenberg!"lm!$nt-1!&obbler"$ddis"%fford"*lf-whistle$$skin##len$&ongong#$ters#&verine"#mbs"\'nderbra"%odmen',
+    '$\'turners$%wards#%lcock$#gar"+rd-for-word%\'initial%%lists%\'perfect&(rocessed$$wise#,k-experience$#day$\'ing-men\'#men#*ld-picture',
+    '%%watch#&risome##ser#%thier"$tcha"%uters!"pa!$rede"\'ite-ups"!o!"to!#ull"#ndt"!s!%ybran',
+    ' \'x-cells",inefficiency"&server!$.400!!3!$b-70!"d6!$enia!"f3!"gl!$hosa!#ii."#v\'s!"j6!#liv',
+    '"!v!#pg3!!r!"xv"#xii$!v %y\'all#"re"#see!#320!%aeger""li"&suhiro"!y!$drys',
+    '"\'arbooks"&l\'tsin#"lo""uk#$tter!"ip!%onhap""on""u-!%tfiia!"uh"#ill ,z&uuml;rcher!&adkine"%irean',
+    '"%nardi#!g$$will"%potec""za!(borowska!#ebu!$heng!#iff"!m""na!$nf11!\'odiacal""ey"%ggian',
+    '!$ukov"%leika!&wirner!&ymogen!!z',
 )
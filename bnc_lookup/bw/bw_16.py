@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_16 = (
+count_16 = 6694
+
+heads_16 = (
     '&aacute_la',
-    '&agr;-granules',
-    '&agrave_la_mode',
-    '&amp;frac12',
-    '&ast&ast&ast&ast&ast;l',
-    '&bgr;-mercaptoethanol',
-    '&commat;now',
-    '&deg;f',
-    '&dollar;0.09',
-    '&dollar;0.12',
-    '&dollar;0.13',
-    '&dollar;0.14',
-    '&dollar;0.19',
-    '&dollar;0.23',
-    '&dollar;0.35',
-    '&dollar;0.37',
     '&dollar;0.60',
-    '&dollar;1,250',
-    '&dollar;1.43',
-    '&dollar;1.72',
-    '&dollar;1.76',
-    '&dollar;10.2m',
-    '&dollar;11,000',
-    '&dollar;11.1m',
-    '&dollar;110',
-    '&dollar;110,000',
-    '&dollar;110m',
-    '&dollar;12.3m',
-    '&dollar;12.5m',
-    '&dollar;120m',
-    '&dollar;125,000',
-    '&dollar;160m',
     '&dollar;2,300',
-    '&dollar;2,400',
-    '&dollar;2.2',
-    '&dollar;2.4',
-    '&dollar;2.7',
-    '&dollar;2.8',
-    '&dollar;200,000,000',
-    '&dollar;225,000',
-    '&dollar;240',
-    '&dollar;25,000,000',
-    '&dollar;27',
-    '&dollar;28,000',
-    '&dollar;285m',
-    '&dollar;3.6m',
-    '&dollar;3.8m',
-    '&dollar;30,000,000',
     '&dollar;31',
-    '&dollar;350m',
-    '&dollar;4,700',
-    '&dollar;40,000,000',
-    '&dollar;41m',
-    '&dollar;45m',
-    '&dollar;5.5',
-    '&dollar;550',
-    '&dollar;6.3m',
-    '&dollar;60,000,000',
-    '&dollar;7.5',
-    '&dollar;7.6m',
-    '&dollar;7.8m',
-    '&dollar;70m',
-    '&dollar;750m',
-    '&dollar;8.5m',
     '&dollar;80&ndash;120,000',
-    '&ecirc;tre',
-    '&formula;2',
-    '&formula;th',
-    '&frac14;inch',
-    '&frac14;pt',
-    '&frac58;in',
-    '&ggr;-',
-    '&gt;3',
-    '&gt;5',
-    '&half',
-    '&infin',
-    '&lt;1',
-    '&lt;10',
-    '&lt;3',
-    '&mdash;as',
     '&mdash;for',
-    '&mdash;i',
-    '&mdash;one',
-    '&mdash;to',
-    '&mgr;g/ml',
-    '&micro;mol/hour/10',
-    '&ndash;10',
-    '&pound&frac12',
-    '&pound&pound&pound',
-    '&pound;0.5',
-    '&pound;0.5m',
-    '&pound;1,900',
-    '&pound;1.15',
-    '&pound;1.3million',
-    '&pound;1.59',
-    '&pound;1.5million',
     '&pound;10.5m',
-    '&pound;103',
-    '&pound;110m',
-    '&pound;12.5m',
-    '&pound;1200',
-    '&pound;125m',
-    '&pound;127',
-    '&pound;13.5m',
-    '&pound;131',
-    '&pound;14,500',
-    '&pound;141',
-    '&pound;162',
-    '&pound;168',
-    '&pound;171',
-    '&pound;180m',
-    '&pound;185m',
     '&pound;19m',
-    '&pound;1billion',
-    '&pound;2.20',
-    '&pound;2.35',
-    '&pound;2.5bn',
-    '&pound;2.5million',
-    '&pound;2.65',
-    '&pound;2.70',
-    '&pound;2.9m',
-    '&pound;200&ndash;300,000',
-    '&pound;208',
-    '&pound;20bn',
-    '&pound;21.50',
-    '&pound;210,000',
-    '&pound;216',
-    '&pound;22.95',
     '&pound;24*',
-    '&pound;24,500',
-    '&pound;24.50',
-    '&pound;240m',
-    '&pound;25&ndash;35,000',
-    '&pound;25.95',
-    '&pound;260,000',
-    '&pound;3.1m',
-    '&pound;3.45',
-    '&pound;3.79',
-    '&pound;3.9',
-    '&pound;30&ndash;50,000',
-    '&pound;30.00',
-    '&pound;305',
-    '&pound;31,000',
-    '&pound;312',
     '&pound;330,000',
-    '&pound;345',
-    '&pound;37.50',
-    '&pound;4,400',
-    '&pound;4,600',
-    '&pound;4.1m',
-    '&pound;4.2',
-    '&pound;4.3',
-    '&pound;4.45',
-    '&pound;4.6',
-    '&pound;40&ndash;60,000',
-    '&pound;40,000&ndash;60,000',
-    '&pound;410',
-    '&pound;42.50',
-    '&pound;425,000',
-    '&pound;43.50',
     '&pound;430',
-    '&pound;44.95',
-    '&pound;46,000',
-    '&pound;4820.27',
-    '&pound;5,200',
-    '&pound;5.4m',
-    '&pound;5.6',
-    '&pound;5.6m',
-    '&pound;510',
-    '&pound;530',
-    '&pound;54.80',
-    '&pound;540',
-    '&pound;56m',
-    '&pound;570',
-    '&pound;6.2',
-    '&pound;6.8m',
     '&pound;625',
-    '&pound;699',
-    '&pound;7.2',
-    '&pound;7.49',
-    '&pound;7000',
-    '&pound;78m',
-    '&pound;80&ndash;120,000',
-    '&pound;83',
-    '&pound;85m',
-    '&pound;86,000',
-    '&pound;9.5m',
-    '&pound;9000',
-    '&pound;900m',
-    '&pound;920',
-    '&pound;94',
-    '&pound;95m',
     '&pound;98,000',
-    '&pound;995',
-    '&pound;999',
-    '&scaron;ibenik',
-    '\'81',
-    '\'all',
-    '\'andsome',
-    '\'ardly',
-    '\'at',
-    '\'coz',
-    '\'d\'',
-    '\'if',
-    '\'my',
-    '\'oo',
-    '\'this',
-    '\'usband',
     '\'why',
-    '*177',
-    '*for',
-    '*held',
-    '*member',
-    '+30',
-    '+m',
-    '-12',
-    '-14',
-    '-300',
-    '-35',
-    '-7',
-    '-71',
-    '-8',
-    '-80',
-    '-carotene',
     '-er',
-    '-fos',
-    '-i',
-    '-is',
-    '-just',
-    '-oestradiol',
-    '-shaped',
-    '-sheet',
-    '-test',
-    '/f/',
-    '/i',
-    '/k',
-    '/mmol',
-    '0,1',
-    '0.1&ins',
-    '0.13',
     '0.17',
-    '0.19',
-    '0.1m',
-    '0.20',
-    '0.27',
-    '0.41',
-    '0.48',
-    '0.52',
-    '0.54',
-    '0.57',
-    '0.5m',
-    '0.67',
-    '0.68',
-    '0.72',
-    '0.78',
-    '0.79',
     '0.80',
-    '0.92',
-    '0.97',
-    '00.00z',
-    '00:28',
-    '00:30',
-    '0279',
-    '0304',
-    '0340',
-    '0344',
-    '0392',
-    '0534',
-    '0705',
-    '081&ndash;661',
-    '0892',
-    '0920',
     '0930',
-    '0952',
-    '0:02',
-    '1&frac12;lb',
-    '1&ndash;30',
-    '1&ndash;9',
-    '1&shilling;6d',
-    '1\'',
-    '1(b)',
-    '1+',
-    '1,0',
-    '1,1,1',
-    '1,100,000',
-    '1,3',
-    '1,450',
-    '1,500ft',
     '1-6',
-    '1-year',
-    '1.01',
-    '1.03',
-    '1.04',
-    '1.07',
-    '1.1.4',
-    '1.24',
-    '1.29',
-    '1.2gb',
-    '1.3.9',
-    '1.49',
-    '1.53',
-    '1.6.1',
-    '1.6.2',
-    '1.66',
     '1.7.0',
-    '1.83',
-    '1/27',
-    '1/n',
-    '10&ndash;100',
-    '10&ndash;16',
-    '10&ndash;2',
-    '10&ndash;3',
-    '10&ndash;9',
-    '10(4)',
-    '10-20',
-    '10.03',
-    '10.19',
-    '10.20am',
-    '10.22',
-    '10.26',
     '10.3%',
-    '10.7%',
-    '10/30',
-    '100&ndash;150',
-    '1002',
-    '1007',
-    '100lb',
-    '100mbps',
-    '1011',
-    '1021',
-    '1029',
-    '102nd',
-    '103,000',
-    '1052',
-    '1054',
-    '1058',
     '1060',
-    '1061',
-    '1062',
-    '1076',
-    '1087',
-    '1088',
-    '10am-4pm',
-    '10c',
-    '10kg',
-    '10mb',
-    '10mbps',
-    '10mhz',
-    '11&ndash;17',
-    '11+',
-    '11-16',
-    '11.18',
     '11.5p',
-    '11.9%',
-    '1107',
-    '110m',
-    '1121',
-    '1123',
-    '1128',
-    '1141',
-    '1143',
-    '1145',
-    '1151',
-    '1158',
-    '1161',
-    '1162',
-    '1164',
-    '1168',
     '1175',
-    '1180s',
-    '1182',
-    '11d',
-    '11oz',
-    '12-man',
-    '12.25',
-    '12.4%',
-    '12.50',
-    '12.7%',
-    '12.95',
-    '120cm',
-    '120mm',
-    '120mph',
-    '1233',
-    '1242',
     '1267',
-    '1269',
-    '13&ins',
-    '13.0',
-    '13.2%',
-    '13.4%',
-    '130p',
-    '1344',
-    '1352',
-    '1357',
-    '1360s',
-    '1366',
-    '1374',
-    '1389',
-    '1392',
-    '13mm',
     '13th.',
-    '14&frac12',
-    '14(4)',
-    '14.2%',
-    '14.6%',
-    '14.7%',
-    '14.9%',
-    '1405',
-    '1406',
-    '1424',
-    '1425',
-    '1428',
-    '1439',
-    '1445',
-    '1451',
-    '1470/1',
     '1491',
-    '1499',
-    '14e-3',
-    '14lb',
-    '14mm',
-    '15&ft',
-    '15&ndash;20%',
-    '15&ndash;6',
-    '15&ndash;7',
-    '15,000-word',
-    '15-4',
-    '15-a-side',
-    '15-mile',
-    '15.0',
-    '15.00',
-    '15.5%',
     '15.8%',
-    '150&ndash;200',
-    '150cm',
-    '15b',
-    '15in',
-    '15lb',
-    '16\'s',
-    '16-20',
-    '16.6%',
-    '16.9%',
-    '1688&mdash;9',
-    '16b',
-    '16h',
-    '16st',
-    '17&ndash;1',
-    '17&ndash;2',
     '17-strong',
-    '17.0',
-    '17.2%',
-    '17.3%',
-    '17.5pc',
-    '170&sol;83',
-    '18&ndash;22',
-    '18&ndash;25',
-    '18,500',
-    '18-inch',
-    '18.2%',
-    '18.6%',
-    '18.7%',
-    '18/10/93',
-    '1870&ndash;1',
-    '1872&ndash;3',
     '18pc',
-    '19.00',
-    '1906&ndash;24',
-    '1910s',
-    '1914&ndash;15',
-    '1920&ndash;1',
-    '1922&ndash;3',
-    '1925&ndash;6',
-    '1928&ndash;9',
-    '1930&ndash;31',
-    '1931&ndash;3',
-    '1931&ndash;32',
-    '1932&ndash;3',
-    '1934&ndash;5',
-    '1943&ndash;4',
-    '1946&ndash;47',
     '1947&ndash;48',
-    '1948&ndash;49',
-    '1948&ndash;9',
-    '1954&ndash;55',
-    '1956&ndash;7',
-    '1960&ndash;73',
-    '1961&ndash;2',
-    '1962&ndash;3',
-    '1964/65',
-    '1967&ndash;8',
-    '1969&ndash;74',
-    '1975/6',
-    '1975/76',
-    '1976&ndash;7',
-    '1979-81',
-    '1980&ndash;9',
     '1980-88',
-    '1983&ndash;7',
-    '1983-84',
-    '1985&ndash;9',
-    '1985-86',
-    '1985c',
-    '1989e',
-    '1990/1991',
-    '1991-2000',
-    '1992\'s',
-    '1995/6',
-    '19s.',
-    '1:12',
-    '1cm/&frac12;in',
-    '1er',
-    '1o',
     '1oo',
-    '1pt',
-    '1x1',
-    '2&deg',
-    '2&ndash;3%',
-    '2&ndash;7',
-    '2&ndash;8&ndash;0',
-    '2&shilling',
-    '2,000-strong',
-    '2,000m',
-    '2.0-on-intel',
-    '2.05',
-    '2.0i',
-    '2.3m',
-    '2.41',
-    '2.47',
     '2.5&ins',
-    '2.5mm',
-    '2.6.2',
-    '2.6.4',
-    '2.7.0',
-    '2.7.1',
-    '2.74',
-    '2.7m',
-    '2.8.3',
-    '2.x',
-    '20&ft',
-    '20&mgr;m',
-    '20(2)',
-    '20-23',
-    '20-month-old',
-    '20.',
     '20.0',
-    '200-strong',
-    '200km',
-    '2012',
-    '2013',
-    '20c',
-    '20kg',
-    '21&deg;c',
-    '21&ins',
-    '21&ndash;10',
-    '21&ndash;16',
-    '21(2)',
-    '21-day',
-    '21.10.93',
-    '21.3%',
-    '21.4%',
     '21.7%',
-    '220&deg;c',
-    '220p',
-    '222(1)',
-    '22pc',
-    '23&ndash;24',
-    '23&ndash;25',
-    '23&ndash;4',
-    '23-member',
-    '23.',
-    '23.1%',
-    '239p',
-    '24&ndash;25',
-    '24-hour-a-day',
-    '24-hours',
-    '24.',
     '24.2%',
-    '24.6%',
-    '25&ndash;31',
-    '25.2',
-    '25.6',
-    '25.9%',
-    '250ml/10fl',
-    '26&ndash;3',
-    '26&ndash;30',
-    '26.4%',
-    '260p',
-    '27.1',
-    '27.3',
-    '27.3%',
-    '27.4',
-    '27.6',
     '28&ndash;29',
-    '28-day',
-    '28.1',
-    '28.1%',
-    '28.4',
-    '28.9',
-    '285,000',
-    '28g',
-    '29-31',
-    '29.7',
-    '29pc',
-    '2:15',
-    '2:2',
-    '2:20',
-    '2ab',
-    '2f10',
     '2kg',
-    '2secs',
-    '2u',
-    '2x2',
-    '3&deg;c',
-    '3&frac12&ins',
-    '3&frac14',
-    '3&ndash;10',
-    '3&ndash;11',
-    '3&ndash;30',
-    '3&ndash;4%',
-    '3,4',
-    '3,813',
-    '3-hour',
-    '3-inch',
-    '3-star',
     '3.2.4',
-    '3.2.5',
-    '3.26',
-    '3.29',
-    '3.33',
-    '3.3p',
-    '3.6m',
-    '3/3',
-    '30&ndash;70mph',
-    '30-month',
-    '30-odd',
-    '30.1',
-    '300%',
-    '30kg',
-    '30lb',
-    '30s.',
     '310p',
-    '3174',
-    '31p',
-    '32&ndash;3',
-    '32.2',
-    '32.5',
-    '32.9%',
-    '326326',
-    '32k',
-    '34&ndash;38',
-    '34(1)',
-    '34.5',
-    '35&ndash;44',
-    '35.8',
-    '35/36',
-    '350th',
     '35ft',
-    '35m',
-    '36-hour',
-    '36.4',
-    '36.8',
-    '36598',
-    '36815',
-    '36822',
-    '36905',
-    '36s.',
-    '37.8',
-    '37.8%',
-    '37025',
-    '37033',
-    '37053',
-    '37108',
     '37114',
-    '37123',
-    '37126',
-    '37181',
-    '37194',
-    '37201',
-    '37202',
-    '37212',
-    '37244',
-    '37258',
-    '37266',
-    '37274',
-    '37304',
-    '37307',
-    '37316',
-    '37380',
     '37388',
-    '37390-91',
-    '37449',
-    '37467',
-    '37475',
-    '37536',
-    '37549-50',
-    '37552',
-    '37613',
-    '37624',
-    '37625',
-    '37653',
-    '37654',
-    '37710',
-    '37714',
-    '37728',
     '37729',
-    '37762',
-    '37767',
-    '37770',
-    '37782',
-    '37795',
-    '37800',
-    '37841',
-    '37869',
-    '37873',
-    '37888',
-    '37913',
-    '37917',
-    '37922',
-    '37924',
-    '37925',
     '37944-45',
-    '37949',
-    '37mm',
-    '38.1%',
-    '38.8',
-    '38002',
-    '38101',
-    '38103',
-    '38107',
-    '38111',
-    '38115',
-    '38116-17',
-    '38122',
-    '38143',
-    '38152',
-    '38153',
     '38156',
-    '38160',
-    '38161',
-    '38200',
-    '38201',
-    '38209',
-    '3822',
-    '38287',
-    '38294',
-    '38297',
-    '38354',
-    '38357',
-    '38379',
-    '38406',
-    '38407',
-    '38518',
     '38553',
-    '38598',
-    '38726',
-    '38740',
-    '38777',
-    '38782',
-    '38822',
-    '38825',
-    '38838',
-    '38855',
-    '38913',
-    '38925',
-    '38931',
-    '38942',
-    '38pc',
-    '39170',
     '3:6',
-    '3do',
-    '3e',
-    '3l',
-    '3v',
-    '3x',
-    '4&ndash;11',
-    '4&ndash;4&ndash;2',
-    '4&ndash;6&ndash;0',
-    '4+5',
-    '4-bit',
-    '4-fold',
-    '4.2.4',
-    '4.23',
-    '4.32',
-    '4.4.3',
     '4.50',
-    '40\'s',
-    '40-7592',
-    '40-member',
-    '400%',
-    '40c',
-    '40k',
-    '41p',
-    '42.5%',
-    '4200',
-    '433/l',
-    '43p',
-    '44.2',
-    '44.6',
-    '440m',
-    '450s',
     '460s',
-    '47.2',
-    '47.5',
-    '470,000',
-    '4700',
-    '474864',
-    '49.3',
-    '49.5',
-    '4tbsp',
-    '4ths',
-    '5&frac34',
-    '5&ndash;15',
-    '5&times;10',
-    '5+',
-    '5,400',
-    '5-9',
     '5-iron',
-    '5.139(1)',
-    '5.22',
-    '5.27',
-    '5.3.5',
-    '5.31',
-    '5.33',
-    '5.35',
-    '5.37',
-    '5.75',
-    '50&ndash;60%',
-    '50-1',
-    '50-strong',
-    '50.5',
-    '500-akce',
-    '500e',
     '500mb',
-    '500sl',
-    '50cm',
-    '51(1)',
-    '51.5',
-    '51.7',
-    '5100',
-    '53/54',
-    '54p',
-    '54pc',
-    '55&ndash;59',
-    '56.7',
-    '56mph',
-    '5900',
-    '595',
-    '59p',
     '5cms',
-    '5ins',
-    '5qy',
-    '6&ndash;18',
-    '6-9',
-    '6-iron',
-    '6-year-old',
-    '6.15pm',
-    '6.2.4',
-    '6.26',
-    '6.28',
-    '6.3.3',
-    '6.3.4',
-    '6.31',
-    '6.33',
-    '6.34',
     '6.35',
-    '6.45pm',
-    '6.5&ndash;6.8',
-    '6.50',
-    '60+',
-    '60-cm-wide',
-    '600f',
-    '600mp',
-    '607',
-    '60cms',
-    '62.5',
-    '63(2)',
-    '650222',
-    '657',
-    '65ft',
-    '66,000',
     '66.7%',
-    '67,000',
-    '68030',
-    '698',
-    '6df',
-    '6pc',
-    '7&ft',
-    '7(6)',
-    '7,400',
-    '7,600',
-    '7-iron',
-    '7.2.4',
-    '7.2.5',
-    '7.40',
-    '7.5.1',
-    '7.5.2',
     '70.',
-    '707s',
-    '72&deg&ndash;76&deg;f',
-    '72-hour',
-    '7200',
-    '728',
-    '74&deg;f',
-    '742',
-    '744',
-    '747s',
-    '75&ndash;80',
-    '750g/1&frac12;lb',
-    '756',
-    '79-year-old',
-    '7c11',
-    '7km',
     '8,400',
-    '8,700',
-    '8-2',
-    '8-4',
-    '8.00pm',
-    '8.14',
-    '8.18',
-    '8.3.2',
-    '8.35',
-    '8.45am',
-    '8.50',
-    '8.55',
-    '80&ndash;1',
-    '80(a)',
-    '800th',
-    '80486dx',
     '80960',
-    '80a',
-    '816',
-    '818',
-    '82,000',
-    '824',
-    '826',
-    '83-year-old',
-    '830s',
-    '84,000',
-    '84-year-old',
-    '8500',
-    '853',
-    '856',
-    '86-year-old',
-    '861',
     '868',
-    '87-year-old',
-    '872',
-    '878',
-    '87p',
-    '887',
-    '89(1)',
-    '893/1488',
-    '89th',
-    '8gb',
-    '8inch',
-    '8mhz',
-    '8ozs',
-    '8st',
-    '9&ndash;14',
-    '9,600bps',
     '9.16',
-    '9.21',
-    '9.99',
-    '9/10',
-    '9002',
-    '91,000',
-    '914',
-    '919',
-    '92,000',
-    '92p',
-    '931',
-    '934',
-    '93p',
-    '94,000',
-    '948',
-    '94a',
     '951',
-    '952',
-    '953',
-    '954',
-    '956',
-    '95pc',
-    '9800',
-    '983',
-    '984',
-    '989',
-    '98p',
-    '993',
-    '999999',
-    '99mhz',
-    '9ea',
-    '9ju',
     '9jx',
-    'a-12',
-    'a-2',
-    'a-e',
-    'a-tracts',
-    'a-type',
-    'a-x',
-    'a.2d',
-    'a.agassizii',
-    'a.d.c.',
-    'a.k.',
-    'a.p.f.',
-    'a.r.r.',
-    'a/g',
-    'a10',
-    'a420',
     'a43',
-    'a689',
-    'a=1',
-    'aa/tt',
-    'abasement',
-    'abberton',
-    'abbeylink',
-    'abbie',
-    'abdel-karim',
-    'abdi',
-    'abdominals',
-    'abedi',
-    'abell',
-    'abendana',
-    'aberdovey',
-    'aberfan',
     'abergynolwyn',
-    'abhorring',
-    'abkhazian',
-    'abodes',
-    'above-board',
-    'abramson',
-    'abrasively',
-    'abrasiveness',
-    'absinthe',
-    'abstractly',
-    'absurdist',
-    'abusively',
-    'ac2',
-    'academie',
-    'acce',
-    'access/visa',
     'acclamations',
-    'accordions',
-    'acerbity',
-    'acers',
-    'acetylcysteine',
-    'achiltibuie',
-    'achondrites',
-    'ackers',
-    'acknowledgments',
-    'acquitting',
-    'actualizing',
-    'acupuncturists',
-    'adabas',
-    'add-ins',
-    'addenbrookes',
-    'adenotonsillectomy',
     'adits',
-    'adjudications',
-    'adlai',
-    'admin.',
-    'adolphe',
-    'adoptee',
-    'adoptees',
-    'adroitness',
-    'adults-only',
-    'adventurously',
-    'aef',
-    'aerating',
-    'aetheling',
-    'aethelric',
-    'afarensis',
-    'aforethought',
     'african-backed',
-    'african-born',
-    'afrikaaner',
-    'afros',
-    'after-thought',
-    'aftermarket',
-    'afterthoughts',
-    'afton',
-    'age/sex',
-    'agegate',
-    'aggressions',
-    'agistment',
-    'agit',
-    'agitational',
-    'agms',
-    'agno',
     'agong',
-    'agricola',
-    'agro-chemicals',
-    'agro-industrial',
-    'agronomist',
-    'ahlbergs',
-    'ahmadi',
-    'ahmedabad',
-    'ahuramazda',
-    'aiden',
-    'aiders',
-    'aip',
-    'air-tight',
-    'airfreight',
-    'airstone',
-    'airwell',
     'aizlewood',
-    'akai',
-    'akawaio',
-    'akira',
-    'al&egrave;s',
-    'al-anbari',
-    'al-liwa',
-    'al-murr',
-    'al-ra\'uf',
-    'al-razzaq',
-    'alawi',
-    'alcine',
-    'alclad',
-    'alconbury',
-    'aldates',
-    'aldersgate',
     'aldrin',
-    'alehouses',
-    'alessi',
-    'algonquin',
-    'alienistic',
-    'alkane',
-    'all-british',
-    'all-european',
-    'all-girls',
-    'all-seat',
-    'allbase/sql',
-    'aller',
-    'allergenic',
-    'alleviates',
-    'alleyn',
-    'allington',
     'alliprandi',
-    'allocatively',
-    'allodial',
-    'allografts',
-    'allopurinol',
-    'allport',
-    'alma-ata',
-    'alnico',
-    'alonso',
-    'alpines',
-    'alr',
-    'alsopahok',
-    'altarpieces',
-    'altnaharra',
-    'alvingham',
-    'amah',
     'amal-hezbollah',
-    'amaretto',
-    'amateurishness',
-    'amazonas',
-    'ambidextrous',
-    'american-based',
-    'americanisation',
-    'amethi',
-    'amiri',
-    'aml',
-    'amma',
-    'ammanford',
-    'amnisos',
-    'amplifications',
-    'amt',
-    'amygdalin',
     'anabaptists',
-    'anaconda',
-    'anadin',
-    'analysable',
-    'anarchistic',
-    'ancien_regime',
-    'ancram',
-    'andokides',
-    'anduze',
-    'anecdotally',
-    'angelico',
-    'anglic',
-    'anglo-jewish',
-    'anglo-soviet',
-    'anhydrase',
-    'anklets',
     'anlec',
-    'annamite',
-    'annenberg',
-    'annexations',
-    'annoyances',
-    'anns',
-    'anoch',
-    'anomic',
-    'anon.',
-    'antero-posterior',
-    'anth',
-    'anthropologically',
-    'anthropometric',
-    'anti-abortionist',
-    'anti-ageing',
-    'anti-bacterial',
     'anti-bourgeois',
-    'anti-cd8',
-    'anti-christ',
-    'anti-constitutional',
-    'anti-darwinian',
-    'anti-freeze',
-    'anti-fur',
-    'anti-lesbianism',
-    'anti-monde',
-    'anti-narcotics',
-    'anti-pope',
-    'anti-pornography',
-    'anti-racists',
-    'anti-royalist',
-    'anti-semite',
-    'anti-vietnam',
     'anti-whaling',
-    'antifreeze',
-    'antiope',
-    'antiphon',
-    'antiprotons',
-    'antiquarianism',
-    'antonius',
-    'anurans',
-    'anuvver',
-    'anzus',
-    'ap1',
-    'apatite',
-    'aphasics',
-    'aphra',
-    'appendicectomy',
-    'appending',
     'apple-cheeked',
-    'applecart',
-    'appleford',
-    'applewick',
-    'application-specific',
-    'applicator',
-    'appro',
-    'approach.',
-    'approachability',
-    'appropriability',
-    'apton',
-    'apus',
-    'arab-americans',
-    'arcadius',
-    'archaeologia',
-    'archelaos',
     'archipel',
-    'architecture-neutral',
-    'archonship',
-    'arcivescovile',
-    'arctica',
-    'arcuate',
-    'ardeshir',
-    'ardkinglas',
-    'ardnave',
-    'ardrey',
-    'area-wide',
-    'arendt',
-    'argillaceous',
-    'arginine',
-    'argosy',
-    'arivegaig',
     'arkesilas',
-    'arkhanes',
-    'armenia-azerbaijan',
-    'armholes',
-    'arnoldian',
-    'aros',
-    'arriviste',
-    'arterioles',
-    'arthurs',
-    'artifices',
-    'artistici',
-    'artlessly',
-    'aruban',
-    'as-yet',
-    'ascertains',
-    'asdic',
     'asexually',
-    'asinine',
-    'askey',
-    'aslant',
-    'asopos',
-    'aspirational',
-    'assarts',
-    'assaying',
-    'assheton',
-    'assimilable',
-    'assimilations',
-    'assiter',
-    'assonances',
-    'assurers',
-    'astell',
-    'at3',
     'atcc',
-    'atns',
-    'atopic',
-    'atrazine',
-    'attalli',
-    'attention-grabbing',
-    'attenuating',
-    'atteveld',
-    'attune',
-    'atypically',
-    'auburn-haired',
-    'aubyn',
-    'aucuparia',
-    'audaciously',
-    'audio-lingual',
-    'audiometric',
     'aug&ndash;11',
-    'auklets',
-    'aultbea',
-    'aumery',
-    'auque',
-    'aurally',
-    'auriga',
-    'aurora_borealis',
-    'auscultation',
-    'auto-focus',
-    'autoantibody',
-    'autocratically',
-    'autologous',
-    'autoradiographic',
-    'autos',
-    'autostrada',
     'aviions',
-    'awe-struck',
-    'axeheads',
-    'ayatollahs',
-    'ayles',
-    'ayob',
-    'azam',
-    'azeglio',
-    'azimuthal',
-    'azra',
-    'b&amp;c',
-    'b&amp;g',
-    'b&ndash;25',
-    'b&ouml;hme',
-    'b&uuml;rger',
-    'b.2s',
     'b.a.t',
-    'b.l.',
-    'b10',
-    'b6700',
-    'babbington',
-    'babycare',
-    'bachelorhood',
-    'back-dated',
-    'back-streets',
-    'backbeat',
-    'backhanders',
-    'backings',
-    'backnong',
-    'backrest',
-    'bacterially',
-    'bactericidal',
     'baculoviruses',
-    'bacup',
-    'baddiel',
-    'baden-baden',
-    'badged',
-    'badstoneleigh',
-    'bagram',
-    'baguettes',
-    'bagwell',
-    'bahasa',
-    'bahnhofstrasse',
-    'baia',
-    'baigneuse',
-    'baja',
-    'bakst',
-    'balak',
     'balanoides',
-    'balaton',
-    'balchin',
-    'balderdash',
-    'balearics',
-    'ballantrae',
-    'ballechin',
-    'ballinluig',
-    'ballpark',
-    'ballybeen',
-    'balsamic',
-    'bampfylde',
-    'bandana',
-    'bandaranaike',
-    'bandings',
-    'baneful',
     'bangui',
-    'bani',
-    'banja',
-    'bankhead',
-    'bannside',
-    'barabbas',
-    'barama',
-    'barbarously',
-    'barbosa',
-    'barchans',
-    'bardolino',
-    'bardwell',
-    'bareness',
-    'bargee',
-    'baringo',
-    'barnala',
     'barne',
-    'barnoldswick',
-    'barnswick',
-    'barnyard',
-    'barrack-room',
-    'barretts',
-    'barsamian',
-    'barstow',
-    'bartenstein',
-    'bartestree',
-    'barycz',
-    'bas-reliefs',
-    'basally',
-    'bashes',
-    'basi',
-    'basinal',
     'basinwards',
-    'basis.',
-    'basketful',
-    'basnett',
-    'bassetja',
-    'bassingbourn',
-    'basswood',
-    'bastardised',
-    'batchworth',
-    'bathmat',
-    'battarbee',
-    'battle-hardened',
-    'battle-weary',
-    'battlegroup',
-    'battlement',
-    'battlers',
     'baudouin',
-    'baverstock',
-    'baylis',
-    'baynes',
-    'bazarov',
-    'bbc-2',
-    'bbc-b',
-    'bbd',
-    'bbl',
-    'bcm',
-    'bcom',
-    'beachfront',
-    'beaching',
-    'beadwork',
-    'beaten-up',
-    'beatson',
     'beauly',
-    'beaver/jane',
-    'bebeto',
-    'beco',
-    'becquerels',
-    'becuase',
-    'bedbugs',
-    'beddgelert',
-    'bedeviled',
-    'beechenhill',
-    'beefeaters',
-    'beefing',
-    'beejay',
-    'beerbaum',
-    'begot',
-    'behead',
     'beholding',
-    'belfries',
-    'belgique',
-    'bellahouston',
-    'bellerophon',
-    'bellotto',
-    'bellshill',
-    'bellugi',
-    'belorussians',
-    'bempton',
-    'benedictus',
-    'benham',
-    'bennis',
-    'bensons',
-    'benstead',
-    'bentleys',
     'benzhydryl',
-    'beorhtwald',
-    'berazi',
-    'berbers',
-    'bereavements',
-    'berggruen',
-    'bergin',
-    'bergschrund',
-    'berkeleys',
-    'berkhamstead',
-    'bermingham',
-    'bernheim',
-    'beron',
-    'berrill',
-    'bertone',
-    'berwick-on-tweed',
     'berzerker',
-    'bessbrook',
-    'best-laid',
-    'beta-blockers',
-    'betnovate',
-    'beuningen',
-    'bevels',
-    'bewdsley',
-    'bewman',
-    'bexhill-on-sea',
-    'bf109',
-    'bfss',
-    'bha',
-    'bhabha',
-    'bheki',
-    'bhimji',
     'bhundu',
-    'bi-lingual',
-    'bibi',
-    'biblically',
-    'bickford',
-    'bid-ask',
-    'biddies',
-    'bidentata',
-    'bierley',
-    'bifilar',
-    'bifocal',
-    'big-budget',
-    'biggest-selling',
-    'bigsby',
-    'bijlmermeer',
-    'bilharzia',
     'billerica',
-    'billiton',
-    'billykins',
-    'bimonthly',
-    'binfield',
-    'binge-eating',
-    'binney',
-    'bio-medical',
-    'bioavailability',
-    'biographia',
-    'biolife',
-    'biophysics',
-    'biorad',
-    'biosynthetic',
-    'biotransformation',
-    'birdlike',
     'birgit',
-    'birss',
-    'birth-place',
-    'bishopsgarth',
-    'bistables',
-    'bitrex',
-    'bitte',
-    'bittner',
-    'bj&ouml;rling',
-    'bjornbye',
-    'bl-29',
-    'black-necked',
-    'black/white',
-    'blackballed',
-    'blackfly',
-    'blackhurst',
     'blakenham',
-    'blankley',
-    'blaspheming',
-    'bleakley',
-    'bleeders',
-    'bleeped',
-    'blenched',
-    'blessedness',
-    'bleuler',
-    'blickling',
-    'blinky',
-    'blisteringly',
-    'blonder',
-    'bloodhounds',
-    'bloodsports',
-    'bloodwealth',
     'bloomingdale',
-    'blow-drying',
-    'blow-ups',
-    'bloxam',
-    'blubbering',
-    'bluetooth',
-    'blume',
-    'blunts',
-    'bly',
-    'boarding-schools',
-    'boat-building',
-    'boatswain',
-    'bobsleigh',
-    'boccia',
-    'bockhampton',
-    'bodden',
     'body-builder',
-    'body-weight',
-    'body.',
-    'bogeymen',
-    'boggs',
-    'bogomils',
-    'boguraev',
-    'bohinen',
-    'boiotians',
-    'boise',
-    'boisterously',
-    'bokharas',
-    'boles',
-    'bolo',
-    'bombed-out',
-    'bon_appetit',
     'bon_voyage',
-    'bonce',
-    'bond-holders',
-    'bondholder',
-    'bongos',
-    'bonneville',
-    'bonorum',
-    'bontang',
-    'boo-boys',
-    'boocock',
-    'book-buying',
-    'book-keeper',
-    'bookfunds',
-    'booklists',
-    'booleans',
-    'bootlace',
     'bopper',
-    'bordighera',
-    'borings',
-    'born-deaf',
-    'borneman',
-    'bornholm',
-    'borstals',
-    'borth',
-    'botterill',
-    'bottingley',
-    'bottom-of-the-table',
-    'bottomore',
-    'botty',
-    'bouch',
-    'boudariah',
-    'boudicca',
     'bougainvillea',
-    'bouguer',
-    'bouldery',
-    'boulding',
-    'bourj',
-    'boutsen',
-    'boveri',
-    'bovey',
-    'bovingdon',
-    'bow-wave',
-    'bowd',
-    'bowd/swindon',
-    'bowerman',
-    'bowfell',
-    'bowsher',
-    'boxin\'',
     'boxing-match',
-    'boyds',
-    'br&uuml;ggen',
-    'br2',
-    'braban&ccedil;ons',
-    'bradford-based',
-    'bradnam',
-    'bragan&ccedil;a',
-    'brailey',
-    'brain-child',
-    'brain-storming',
-    'bramsche',
-    'brancepeth',
-    'brandish',
-    'branford',
-    'branta',
     'brassieres',
-    'brawley',
-    'breadfruit',
-    'breakfast-room',
-    'brecchias',
-    'brechtian',
-    'bredda',
-    'bref',
-    'bremann',
-    'brenchley',
-    'breslauer',
-    'breviary',
-    'bricknell',
-    'bridgit',
-    'brigand',
-    'brigandage',
     'brigantes',
-    'brilliants',
-    'brillo',
-    'brimscombe',
-    'brink\'s-mat',
-    'bristleworms',
-    'bristo',
-    'britag',
-    'broadcloth',
-    'broadmarsh',
-    'broadness',
-    'brochs',
-    'brockley',
-    'brockville',
-    'broiler',
-    'broken-backed',
     'broken-up',
-    'bronchioles',
-    'bronchus',
-    'bront&euml;s',
-    'broodiness',
-    'brookings',
-    'broqui&egrave;re',
-    'brownlee',
-    'brummel',
-    'bs2000',
-    'bss',
-    'bt1',
-    'bubka',
-    'buckinghamshire-based',
-    'budget-priced',
-    'bueno',
     'buerk',
-    'building-up',
-    'bulford',
-    'bulkeley',
-    'bull-leaping',
-    'bullard',
-    'bullfrog',
-    'bullhorn',
-    'bully-boy',
-    'bulwell',
-    'bunhill',
-    'bunking',
-    'buoux',
-    'burbridge',
-    'burckhardt',
-    'buren',
     'burgeon',
-    'burgin',
-    'burkill',
-    'burkinabe',
-    'burmatex',
-    'burnhill',
-    'burntwood',
-    'bus-load',
-    'bushe-fox',
-    'business-oriented',
-    'busloads',
-    'busman',
-    'butland',
-    'butor',
-    'butterfill',
-    'butterscotch',
     'buttle',
-    'butyric',
-    'buyin\'',
-    'buying-in',
-    'bvc',
-    'by-ways',
-    'byfield',
-    'byronic',
-    'byte-oriented',
-    'bywaters',
-    'c&aacute;ceres',
-    'c&amp;l',
-    'c&eacute;dras',
-    'c-cube',
-    'c-myc-induced',
-    'c-type',
     'c.l.',
-    'c/',
-    'c/c++',
-    'c86',
-    'cab-driver',
-    'cabestainh',
-    'cabinet-committee',
-    'cabinet-level',
-    'cabinet-makers',
-    'cabinet-making',
-    'cabinetmaker',
-    'cabotage',
-    'cack',
-    'cadaqu&egrave;s',
-    'cadenzas',
-    'cader',
     'cadging',
-    'cadwallader',
-    'cady',
-    'caelia',
-    'caesura',
-    'cahervillahow',
-    'calange',
-    'calc',
-    'calcineurin',
-    'caldarium',
-    'caldicot',
-    'caledon',
-    'callard',
-    'calomel',
-    'camp-fire',
-    'campomanes',
     'camrose',
-    'canary-yellow',
-    'canaveral',
-    'canberras',
-    'cancellable',
-    'candelabrum',
-    'candidal',
-    'candle-flame',
-    'candy-floss',
-    'candy-striped',
-    'cani&ccedil;al',
-    'cannelloni',
-    'cannily',
-    'cannoning',
-    'cannulae',
-    'canted',
     'cantrell',
-    'canvasser',
-    'canz',
-    'caorle',
-    'capet',
-    'captopril',
-    'caramels',
-    'caratacus',
-    'carbuncles',
-    'cardew',
-    'cardin',
-    'cardio-vascular',
-    'care-givers',
-    'caretaker-manager',
-    'careworn',
-    'carisbrooke',
     'carita',
-    'carlssen',
-    'carluke',
-    'carnap',
-    'carnmoney',
-    'carpathian',
-    'carpentras',
-    'carrbridge',
-    'carriage-return',
-    'carrickblacker',
-    'carsons',
-    'cartier-bresson',
-    'cartilaginous',
-    'cartmel',
-    'cashel',
-    'cashews',
     'cashiered',
-    'cashmore',
-    'casilla',
-    'cassan',
-    'cassatt',
-    'cassirer',
-    'castigates',
-    'castner',
-    'cat-calls',
-    'catacomb',
-    'cataloguers',
-    'catapulting',
-    'catecholamine',
-    'cates',
-    'cathode-ray',
-    'catlike',
     'catlin',
-    'catterall',
-    'caughey',
-    'caulking',
-    'causee',
-    'causeways',
-    'cautinus',
-    'cautioner',
-    'cav',
-    'cavalierly',
-    'cawston',
-    'cb4',
-    'cbo',
-    'cd25',
-    'cdhes',
-    'cee',
     'celeb',
-    'celestino',
-    'cell-like',
-    'cellphones',
-    'centage',
-    'centenarians',
-    'centesimals',
-    'centifolia',
-    'central/local',
-    'centram',
-    'centre-forwards',
-    'centronics',
-    'century-old',
-    'cenwealh',
-    'cepac',
-    'cepra',
     'cereans',
-    'ceridian',
-    'cerro',
-    'certes',
-    'certificating',
-    'certifier',
-    'cesta',
-    'cetin',
-    'cevallos',
-    'cgil',
-    'ch&acirc;taigniers',
-    'ch&eacute;ri',
-    'ch.app.',
-    'chaffed',
-    'chagrined',
-    'chain\'',
     'chainsaws',
-    'chairman-designate',
-    'chalcopyrite',
-    'chalcraft',
-    'chalk-white',
-    'chalkboard',
-    'chalkis',
-    'challinor',
-    'champs-elys&eacute;es',
-    'chaney',
-    'changelings',
-    'changi',
-    'chappies',
-    'chaprassi',
-    'charlestown',
-    'charly',
     'charmers',
-    'chars',
-    'chastely',
-    'chastlecombe',
-    'chateaubriand',
-    'chatline',
-    'chattily',
-    'chattin\'',
-    'chaudes',
-    'chawton',
-    'chaytor',
-    'chechen-ingushetia',
-    'cheerier',
-    'cheesemakers',
-    'cheikh',
-    'chelyabinsk',
     'chemin',
-    'cherith',
-    'chernov',
-    'chesher',
-    'chest-high',
-    'chevallier',
-    'cheveley',
-    'chiara',
-    'chichele',
-    'chiens',
-    'child-proof',
-    'chillingham',
-    'chimney-pots',
-    'chinh',
-    'chinwag',
-    'chiodini',
     'chiropractors',
-    'chital',
-    'chitinous',
-    'chivvy',
-    'chlidema',
-    'choirbook',
-    'chol',
-    'choledocholithiasis',
-    'cholon',
-    'chop_suey',
-    'christiane',
-    'christianised',
-    'christie-miller',
-    'christlieb',
-    'christological',
-    'christophersen',
     'chromed',
-    'chromides',
-    'chromium-plated',
-    'chronotope',
-    'chrysanths',
-    'chrystal',
-    'cht',
-    'chudleigh',
-    'churcher',
-    'cibachrome',
-    'cil',
-    'cine-variety',
-    'cineraria',
-    'circumferences',
-    'ciscs',
-    'civils',
     'cl&eacute;ment',
-    'claiborne',
-    'clapperton',
-    'clarisworks',
-    'class-divided',
-    'class-specific',
-    'classicals',
-    'classifieds',
-    'claudian',
-    'claughton',
-    'clavier',
-    'claxton',
-    'clayson',
-    'clean-air',
-    'clear-minded',
-    'clearcase',
     'clerc',
-    'clermont-ferrand',
-    'cleves',
-    'clew',
-    'clifton-brown',
-    'climbable',
-    'cling-film',
-    'clip-board',
-    'clipstone',
-    'clock-maker',
-    'clockmaker',
-    'clonk',
-    'closely-knit',
-    'closely-related',
-    'closing-time',
-    'clps',
     'club-like',
-    'clubroom',
-    'clucks',
-    'cm2',
-    'cnaps',
-    'cnaps-c',
-    'cng',
-    'cnr',
-    'co&amp;sub2',
-    'co-authorship',
-    'co-chaired',
-    'co-directors',
-    'co-education',
-    'co-efficient',
-    'co-exists',
-    'co-heiresses',
     'co-managers',
-    'co-optation',
-    'co-presenter',
-    'co-productions',
-    'co-promoter',
-    'co-referential',
-    'co-rotation',
-    'co-ruler',
-    'co-writer',
-    'coady',
-    'coal-burning',
-    'coal-mines',
-    'coalitionists',
-    'coalminers',
-    'coalmines',
-    'coalville',
     'coaly',
-    'coarse-grained',
-    'coat-of-arms',
-    'cobbold',
-    'cochineal',
-    'cocklers',
-    'cocksure',
-    'codec',
-    'codecenter',
-    'codpiece',
-    'codrington',
-    'codswallop',
-    'coelomic',
-    'coevolution',
-    'coexists',
-    'coffee-bar',
     'coffee-house',
-    'cognitions',
-    'coi',
-    'coia',
-    'cold-bloodedly',
-    'cold-eyed',
-    'colenutt',
-    'collaborates',
-    'collectability',
-    'collen',
-    'colluvial',
-    'colnbrook',
-    'colonoscope',
-    'colonsay',
-    'colourway',
-    'combinatory',
     'comfortable-looking',
-    'comiso',
-    'comm.',
-    'commerciale',
-    'commiserating',
-    'commodores',
-    'common-emitter',
-    'commonweal',
-    'communions',
-    'commutative',
-    'commutator',
-    'companies.',
-    'compl&egrave;tes',
-    'comport',
-    'compressional',
-    'compressions',
     'compugraphic',
-    'computer-oriented',
-    'comsat',
-    'conakry',
-    'concealer',
-    'concertino',
-    'conchita',
-    'conciliators',
-    'concurrency',
-    'condors',
-    'conductress',
-    'conference/course',
-    'config',
-    'confinements',
-    'conflate',
-    'confluency',
     'congar',
-    'congeal',
-    'congestions',
-    'conic',
-    'conlin',
-    'conodont',
-    'conolly',
-    'conquistador',
-    'conquistadores',
-    'conscience-stricken',
-    'conservation/agriculture',
-    'consignors',
-    'consigns',
-    'consolidations',
-    'constabularies',
-    'consultees',
     'consumer-oriented',
-    'consummately',
-    'contactable',
-    'contadora',
-    'contaminates',
-    'contes',
-    'context-tables',
-    'contextualise',
-    'contextualizing',
-    'contort',
-    'contra-flow',
-    'contrariness',
-    'contre',
-    'contusion',
-    'convair',
-    'conveyer',
     'cooee',
-    'coogan',
-    'cookbooks',
-    'coops',
-    'copal',
-    'copas',
-    'copper-plate',
-    'copperbelt',
-    'coquette',
-    'corbeil',
-    'corbel',
-    'corbie',
-    'cordifera',
-    'cordifolia',
-    'cordon_sanitaire',
-    'cordova',
     'corfield',
-    'corking',
-    'corleone',
-    'cornbury',
-    'cornthwaite',
-    'corpore',
-    'corran',
-    'correggio',
-    'correlational',
-    'corrosion-resistant',
-    'cos-b',
-    'cose-compliant',
-    'cosslett',
-    'cost-of-carry',
-    'costliness',
-    'cotonou',
     'cotta',
-    'cottagey',
-    'cotterill',
-    'coty',
-    'coulsfield',
-    'counsell',
-    'countenances',
-    'counter-demonstration',
-    'counter-demonstrators',
-    'counter-inflation',
-    'counter-tenor',
-    'counterclaimed',
-    'counterfeiters',
-    'counterlife',
-    'counteroffensive',
-    'countertenor',
     'counterweights',
-    'countrywoman',
-    'courseware',
-    'court-appointed',
-    'court-room',
-    'coveney',
-    'covington-pym',
-    'cowers',
-    'cowley/oxford',
-    'cowpox',
-    'cr&eacute;mant',
-    'cr&ecirc;che',
-    'cr&egrave;me_de_la_cr&egrave;me',
-    'crab-like',
-    'craft-based',
-    'crail',
     'crapping',
-    'crassly',
-    'crawler',
-    'crayshaw',
-    'creasey',
-    'creationism',
-    'creationists',
-    'credal',
-    'creech',
-    'creels',
-    'creepy-crawly',
-    'crellin',
-    'creme_de_la_creme',
-    'crendon',
-    'crepes',
-    'crescentic',
     'crespi',
-    'creston',
-    'cricket-lovers',
-    'criers',
-    'crime-ridden',
-    'criminalized',
-    'cristall',
-    'cristiana',
-    'criterial',
-    'cro&ucirc;tons',
-    'cro-magnons',
-    'crocombe',
-    'croix_de_guerre',
-    'croom-johnson',
-    'cropredy',
-    'cross-beam',
     'cross-bred',
-    'cross-frontier',
-    'cross-purposes',
-    'cross-question',
-    'crotal',
-    'crowborough',
-    'crowell',
-    'crowson',
-    'croxdale',
-    'crubach',
-    'cruden',
-    'crudit&eacute;s',
-    'cruella',
-    'cruet',
-    'crunchies',
-    'crusaid',
     'cruttenden',
-    'cryptogams',
-    'cubical',
-    'cubit',
-    'cucga',
-    'cuirass',
-    'culcheth',
-    'culf',
-    'cullercoats',
-    'culpepper',
-    'cultish',
-    'cultivable',
-    'culverhouse',
-    'cums',
-    'cup-holders',
-    'cupidity',
     'curio',
-    'current-carrying',
-    'curriculum-related',
-    'curriculums',
-    'curriehill',
-    'cursus',
-    'curtness',
-    'cusiana',
-    'cussed',
-    'cut-offs',
-    'cutesy',
-    'cutufa',
-    'cws',
-    'cyberspace',
-    'cycloheximide',
-    'cyl',
     'cyprian',
-    'cyrenaica',
-    'cys',
-    'cytoskeletal',
-    'cytoskeleton',
-    'czarist',
-    'd&eacute;sir&eacute',
-    'd\'alsace',
-    'd\'angelo',
-    'd\'arthur',
-    'd\'artiste',
-    'd\'avignon',
-    'd\'etat',
-    'd\'silva',
-    'd-marks',
-    'd.d.',
     'd.j.b.',
-    'd.j.f.',
-    'd.phil.',
-    'd.r.',
-    'dacca',
-    'dachau',
-    'dafter',
-    'dahomey',
-    'daio',
-    'dairymaid',
-    'dairymaids',
-    'dakopatts',
-    'dalaman',
-    'dalison',
-    'dallying',
-    'dalry',
     'damningly',
-    'damour',
-    'danbury',
-    'dance-like',
-    'dandified',
-    'dandyish',
-    'danford',
-    'dangerman',
-    'daniken',
-    'darien',
-    'darke',
-    'darnel',
-    'darpa',
-    'darwell',
-    'data-bases',
-    'dataman',
     'datapro',
-    'datchett',
-    'dathan',
-    'daubing',
-    'day-old',
-    'daya',
-    'dayak',
-    'daycare',
-    'dayflower',
-    'daynes',
-    'dbv',
-    'dcr',
-    'dcs200',
-    'dct',
-    'dddd',
-    'de-activated',
     'de-skill',
-    'de_profundis',
-    'deactivated',
-    'dead-ends',
-    'deadlocks',
-    'dearborn',
-    'death-defying',
-    'deayton',
-    'debaters',
-    'debora',
-    'debt-equity',
-    'debt-for-nature',
-    'decameric',
-    'decamp',
-    'decapitate',
-    'decease',
     'decision.',
-    'decompilation',
-    'decompressed',
-    'deconstructing',
-    'deconstructionists',
-    'decontextualised',
-    'decoupling',
-    'decrements',
-    'decstations',
-    'dedekind',
-    'dedjazmatch',
-    'deduces',
-    'deducts',
-    'deep-mined',
-    'deep-throated',
-    'deeply-rooted',
     'deerskin',
-    'defavorisee',
-    'defeasibility',
-    'defensor',
-    'deflator',
-    'defoliants',
-    'dehumanised',
-    'dehydrate',
-    'dein',
-    'deism',
-    'dekalb',
-    'delapre',
-    'delicate-looking',
-    'dells',
-    'delocalised',
-    'delph',
     'delphinium',
-    'delvin',
-    'demand-deficient',
-    'demarco',
-    'democratico',
-    'demolishes',
-    'demountable',
-    'denard',
-    'dendrite',
-    'deneb',
-    'denhardt',
-    'denier',
-    'densitometer',
-    'dep.',
-    'department-store',
-    'departmentally',
     'depo',
-    'deposing',
-    'depositories',
-    'deprecate',
-    'depressives',
-    'derecognition',
-    'dermis',
-    'descendents',
-    'deschampsia',
-    'description-lines-are',
-    'deselected',
-    'desensitisation',
-    'desorption',
-    'despairs',
-    'destabilised',
-    'desulfobacter',
     'desulfuricans',
-    'detergency',
-    'determinacy',
-    'determinately',
-    'determinists',
-    'detests',
-    'devant',
-    'devil-man',
-    'devito',
-    'devolves',
-    'devons',
-    'dewan',
-    'dextrals',
-    'dextrous',
-    'dezotti',
-    'df9',
     'dfd',
-    'dfg',
-    'dfl.',
-    'dgt',
-    'dhahran',
-    'dhl',
-    'dhow',
-    'diabolically',
-    'diacylglycerol',
-    'dialysates',
-    'diano',
-    'diarists',
-    'diarmaid',
-    'dicillo',
-    'dicker',
-    'dickman',
     'didcot-based',
-    'didn\'t',
-    'didymus',
-    'diestel',
-    'different-sized',
-    'differentiator',
-    'diffusionist',
-    'digestions',
-    'digitisers',
-    'diglossia',
-    'digraph',
-    'dildos',
-    'dilettanti',
-    'dilutes',
-    'dinnae',
-    'dinned',
     'dioica',
-    'dionysian',
-    'dip.ad',
-    'disables',
-    'disarmers',
-    'disasterous',
-    'disavowing',
-    'disbarment',
-    'discredits',
-    'discreteness',
-    'discriminator',
-    'discursively',
-    'disenfranchise',
-    'disfigures',
-    'dishabituation',
-    'dishwater',
     'disinheritance',
-    'disorienting',
-    'disowning',
-    'dispiritedly',
-    'disporting',
-    'disputatious',
-    'dissensions',
-    'distending',
-    'distils',
-    'distone',
-    'distractingly',
-    'distributaries',
-    'distrusts',
-    'dive-bombers',
-    'divertissement',
-    'divertissements',
     'divina',
-    'divisors',
-    'divorty',
-    'dixton',
-    'djaimin',
-    'djilas',
-    'dlt',
-    'dm2.41',
-    'dm2.44',
-    'dm2.53',
-    'dm2.54',
-    'dm2.89',
-    'dm98',
-    'dmt',
-    'dnb',
-    'dnieper',
     'dnsf',
-    'do-gooder',
-    'doagh',
-    'doane',
-    'doble',
-    'docharty',
-    'documents-only',
-    'dodecahedron',
-    'dodgem',
-    'dodsworth',
-    'doggies',
-    'dogleg',
-    'dogwhelks',
-    'doily',
-    'doke',
-    'dokes',
     'dokey',
-    'dollimore',
-    'dolphinarium',
-    'domal',
-    'dominants',
-    'domingos',
-    'domnall',
-    'donjon',
-    'donnas',
-    'donnish',
-    'dorain',
-    'dorning',
-    'double-axes',
-    'double-bass',
-    'double-century',
-    'double-counting',
     'double-crossing',
-    'double-doors',
-    'double-pole',
-    'double-spaced',
-    'double-up',
-    'doublets',
-    'doubtlessly',
-    'douche',
-    'dougherty',
-    'doukas',
-    'dovedale',
-    'dowlais',
-    'down-graded',
-    'down-grading',
-    'downe',
-    'downlighters',
     'downloading',
-    'downregulation',
-    'dowsers',
-    'doyenne',
-    'doz',
-    'dptac',
-    'dr-dos',
-    'drachma',
-    'drafty',
-    'drag-and-drop',
-    'dragoman',
-    'dramatization',
-    'dramaturgical',
-    'dravida',
-    'drawdown',
-    'dreamwork',
     'drear',
-    'dreikaiserbund',
-    'dresdner',
-    'drewitt',
-    'drillers',
-    'drink-drivers',
-    'drinking-water',
-    'driss',
-    'drive-through',
-    'driveage',
-    'driveline',
-    'drogue',
-    'dromey',
-    'drop-off',
-    'drug-crazed',
-    'drug-takers',
     'druggy',
-    'drugs-related',
-    'drumaness',
-    'druse',
-    'duac',
-    'duchesses',
-    'duffers',
-    'duggie',
-    'dull-witted',
-    'dullard',
-    'dulls',
-    'dumbness',
-    'dumitru',
-    'dumont',
-    'dumpers',
-    'duncans',
     'dung-collector',
-    'dunkerley',
-    'dunlops',
-    'dunsfold',
-    'duos',
-    'duras',
-    'duregar',
-    'durnford',
-    'durning',
-    'dursley/gloucestershire',
-    'dusk-to-dawn',
-    'dutch/shell',
-    'duxbody',
-    'dvla',
-    'dwarfish',
-    'dwarfism',
     'dyble',
-    'dycarbas',
-    'dynacord',
-    'e2a',
-    'eadbald',
-    'eadwulf',
-    'eagled',
-    'ealdwulf',
-    'ealhmund',
-    'ear-piece',
-    'ear-ring',
-    'eared',
-    'earlswood',
-    'early-music',
-    'earplugs',
-    'earth-moon',
     'earthtrust',
-    'ease-of-use',
-    'easiness',
-    'eastcheap',
-    'easternmost',
-    'eastlake',
-    'ebbert',
-    'ebrahim',
-    'ec1p',
-    'ec1y',
-    'echocardiography',
-    'eckholm',
-    'ecofin',
-    'ecolabelling',
-    'economy.',
-    'ecotropic',
     'ectotherms',
-    'eda/sql',
-    'edebali',
-    'edina',
-    'edinburgh/carstairs',
-    'edlinger',
-    'edmund-davies',
-    'edmundsbury',
-    'edom',
-    'edsp',
-    'edulis',
-    'eei',
-    'efas',
-    'effectivity',
-    'effluence',
-    'effluvium',
     'effortful',
-    'egilsay',
-    'ehrenreich',
-    'eigh',
-    'eikhenbaum',
-    'eintracht',
-    'eisenberg',
-    'ekaterina',
-    'ekaterinburg',
-    'ekstrom',
-    'elam',
-    'eland',
-    'elchibey',
-    'elcock',
-    'eldar',
-    'elderberries',
     'eldo',
-    'electable',
-    'electro-acupuncture',
-    'electron-positron',
-    'electrum',
-    'eleni',
-    'elephantiasis',
-    'elgon',
-    'eliasson',
-    'elibank',
-    'elio',
-    'elisions',
-    'eliya',
-    'ellerton',
-    'ellipsoid',
-    'elopement',
     'elusiveness',
-    'elveden',
-    'embourgeoisement',
-    'emelda',
-    'eminences',
-    'emmenthal',
-    'empath',
-    'empey',
-    'employer/employee',
-    'emsworth',
-    'enantiomer',
-    'encrustation',
-    'endears',
-    'endocarditis',
-    'endoscopists',
-    'endoskeleton',
     'endothelins',
-    'endotracheal',
-    'endpoints',
-    'energizing',
-    'enfolds',
-    'englefield',
-    'english-speakers',
-    'english-style',
-    'engrossment',
-    'enham',
-    'enjoins',
-    'enkidu',
-    'ennex',
-    'entangling',
-    'entente_cordiale',
-    'enterectomy',
     'enterotoxin',
-    'entrain',
-    'entrusts',
-    'entwine',
-    'epcot',
-    'epidaurus',
-    'epithermal',
-    'epochal',
-    'epps',
-    'eqns.',
-    'equalities',
-    'equimolar',
-    'equinoctial',
-    'erades',
-    'erases',
-    'erdington',
     'eri',
-    'ermold',
-    'errs',
-    'ertha',
-    'eryri',
-    'erzerum',
-    'escort/orion',
-    'esg',
-    'espaliers',
-    'espy',
-    'esquipulas',
-    'esrc-funded',
-    'esterly',
-    'eszterhas',
-    'etches',
-    'ethan',
     'ethicon',
-    'eti',
-    'etp',
-    'etten',
-    'euro-american',
-    'euromarket',
-    'euromonitor',
-    'europes',
-    'euroqualifications',
-    'euturpia',
-    'evangeline',
-    'evaporite',
-    'event-producing',
-    'everitt/thames',
-    'evers',
-    'evidentiary',
     'eviscerated',
-    'ewc',
-    'ewm',
-    'ex-beatle',
-    'ex-care',
-    'ex-gwr',
-    'ex-l.c.c.',
-    'ex-lovers',
-    'ex-manager',
-    'ex-model',
-    'ex-public',
-    'ex-pupils',
-    'ex-royal',
-    'ex-yugoslav',
-    'exceptionals',
-    'excercise',
     'excitations',
-    'exclusives',
-    'excremental',
-    'executory',
-    'exeunt',
-    'exoneration',
-    'exorbitantly',
-    'expandability',
-    'expander',
-    'expansiveness',
-    'expectoration',
-    'experientially',
-    'experimentalism',
-    'expiate',
-    'expurgated',
-    'exsanguination',
     'exterminator',
-    'extraditing',
-    'extroverted',
-    'extrudes',
-    'extrusions',
-    'eyepatch',
-    'eyeshadows',
-    'ez-rpc',
-    'f&amp;c',
-    'f&eacute;d&eacute;ration',
-    'f(u)',
-    'f-',
-    'f-16s',
-    'f-word',
-    'f.g.y.',
-    'f3000',
     'face-value',
-    'facials',
-    'fact-presupposing',
-    'facticity',
-    'fahid',
-    'faints',
-    'fairyhouse',
-    'fairytales',
-    'falaises',
-    'falkender',
-    'fallin\'',
-    'famine-stricken',
-    'fanged',
-    'farcically',
-    'farmway',
-    'faslane',
     'fastolf',
-    'fatalist',
-    'faun',
-    'faunus',
-    'favorable',
-    'favored',
-    'fawaz',
-    'fawned',
-    'fazackerley',
-    'fearn',
-    'feccas',
-    'fedele',
-    'fee-payers',
-    'felicia',
-    'fellow-citizens',
-    'fellow-students',
     'felting',
-    'femtosecond',
-    'fenbendazole',
-    'feradach',
-    'fermacell',
-    'ferments',
-    'fernanda',
-    'ferox',
-    'ferrasse',
-    'ferromagnetic',
-    'ferrybridge',
-    'fertilises',
-    'fertilising',
-    'fescue',
-    'fetoprotein',
-    'fetting',
     'fetva',
-    'feydeau',
-    'ffyp',
-    'fiac',
-    'fibreoptic',
-    'fifty-year',
-    'filariasis',
-    'fill-in',
-    'findlater',
-    'fingal',
-    'finger-tip',
-    'fingerpicking',
-    'finial',
-    'finklestein',
-    'finsiel',
-    'fira',
     'fire-breathing',
-    'fire-damaged',
-    'fire-eater',
-    'fireballs',
-    'fireships',
-    'firle',
-    'first-aider',
-    'first-timers',
-    'first-years',
-    'fischler',
-    'fishing-boat',
-    'fison',
-    'fitzcount',
-    'fitzthomas',
-    'five-under-par',
-    'fizzes',
     'fk',
-    'flameproof',
-    'flamin\'',
-    'flammes',
-    'flanger',
-    'flans',
-    'flashers',
-    'flat-file',
-    'flatboat',
-    'flatlands',
-    'flatliners',
-    'flavell',
-    'flemming',
-    'fleshpots',
-    'flightpath',
-    'floating.point',
     'flor',
-    'flouncing',
-    'flowerheads',
-    'flt.',
-    'flume',
-    'flunkeys',
-    'fluster',
-    'fly-trap',
-    'flydaway',
-    'flyingboat',
-    'fogey',
-    'foiling',
-    'fold-away',
-    'fold-back',
-    'foliation',
-    'fontanelle',
     'fookin\'',
-    'foot-and-mouth',
-    'for\'ard',
-    'forager',
-    'forbad',
-    'forbearing',
-    'forbiddance',
-    'forbiddingly',
-    'force-carrying',
-    'foreign-controlled',
-    'foreign-set-is',
-    'forepaws',
-    'foreshortening',
-    'forewoman',
-    'forgan',
-    'forlani',
     'forma',
-    'formula-based',
-    'fornasetti',
-    'forsey',
-    'fortis',
-    'fortwilliam',
-    'forty-year',
-    'fossiliferous',
-    'foster-child',
-    'fothergills',
-    'foujita',
-    'foulest',
-    'four-foot',
-    'four-seat',
-    'fourposter',
-    'fourth-class',
     'fowler-thrown',
-    'foxhunters',
-    'fpa',
-    'fpmr',
-    'fraid',
-    'frankfurters',
-    'frasers',
-    'frater',
-    'frazerian',
-    'frederico',
-    'free-spending',
-    'freeline',
-    'freeport',
-    'freights',
-    'french-owned',
-    'frenetically',
     'freund',
-    'friesland',
-    'friggin\'',
-    'frighteners',
-    'friuli',
-    'front-raised',
-    'front-wheel',
-    'frontiersmen',
-    'frottola',
-    'frude',
-    'fte',
-    'fuchida',
-    'fuel-efficient',
-    'full-frontal',
-    'full-term',
-    'fullan',
     'fulmer',
-    'fulminated',
-    'fumaroles',
-    'fume-filled',
-    'fundal',
-    'fundament',
-    'fungoid',
-    'fur-trimmed',
-    'fusco',
-    'fut',
-    'futba',
-    'fylingdales',
-    'g&amp;l',
-    'g\'',
-    'g-',
-    'g-5',
     'g-forces',
-    'g.c.s.e.',
-    'g.f.',
-    'g/c',
-    'g10',
-    'gable-lidded',
-    'gabler',
-    'gadre',
-    'gaffney',
-    'gagnon',
-    'gain\'',
-    'galeaspids',
-    'galland',
-    'gallants',
-    'gallerist',
-    'galois',
     'galvano',
-    'gamesmanship',
-    'gamma-rays',
-    'gane',
-    'ganev',
-    'gangcult',
-    'ganilau',
-    'ganymede',
-    'garaging',
-    'garforth',
-    'garin',
-    'garn',
-    'garraway',
-    'garraway/oxford',
-    'garraway/reporting',
-    'garrow',
     'garway',
-    'gas-ring',
-    'gastroenterologist',
-    'gastronomy',
-    'gater',
-    'gatward',
-    'gauld',
-    'gawthrop',
-    'gazdar',
-    'gbc',
-    'gbp',
-    'gear-lever',
-    'gedye',
-    'geer',
-    'geigy',
-    'gemioncourt',
     'gender-related',
-    'gendering',
-    'gentilhomme',
-    'gentlefolk',
-    'gentling',
-    'geoarchive',
-    'geomorphologist',
-    'geraldo',
-    'gergen',
-    'geriatricians',
-    'german-owned',
-    'germany-based',
-    'gerona',
-    'geysir',
-    'gft',
-    'ghabin',
     'ghanaians',
-    'ghannouchi',
-    'gholamreza',
-    'gia',
-    'giambologna',
-    'gianadda',
-    'gigabytes',
-    'gigia',
-    'gilberthorpe',
-    'gilbride',
-    'gilgen',
-    'gilkison',
-    'gilmartin',
-    'gimpel',
-    'giornale',
-    'giorno',
     'girgis',
-    'girija',
-    'girven',
-    'gizmo',
-    'gladden',
-    'glamourous',
-    'glasnevin',
-    'glass-making',
-    'glemby',
-    'glenmuir',
-    'glenny',
-    'glinwood',
-    'gliss',
-    'glob',
-    'globetrotter',
-    'globifera',
     'globulars',
-    'globulin',
-    'glooms',
-    'glyndwr',
-    'gn',
-    'gneisenau',
-    'gnome-like',
-    'gnosis',
-    'goathland',
-    'gobbet',
-    'gobs',
-    'god-daughter',
-    'god-kings',
-    'goddy',
-    'godwinsson',
-    'goggling',
     'golby',
-    'golden-yellow',
-    'goldenrod',
-    'golder',
-    'goldfinches',
-    'golf-bag',
-    'golightly',
-    'golub',
-    'gonadotrophin',
-    'gondor',
-    'good-will',
-    'gooda',
-    'goodbody',
-    'goodricke',
-    'goodwin/reporting',
-    'goonhilly',
     'goose-bumps',
-    'goose-pimples',
-    'gord',
-    'gordy',
-    'gorgio',
-    'gorgonzola',
-    'goria',
-    'gothard',
-    'gouriet',
-    'government-industry',
-    'gpsg',
-    'gq',
-    'gr&uuml;nen',
-    'grabham',
-    'graceland',
-    'grad',
     'grandiosity',
-    'grandmont',
-    'granters',
-    'grantly',
-    'granulites',
-    'granulomata',
-    'grata',
-    'gratz',
-    'grauber',
-    'gravadlax',
-    'gravitating',
-    'gravities',
-    'grazia',
-    'great-grandparents',
-    'great-nephew',
-    'greenbelts',
     'greengrocery',
-    'greenheart',
-    'greenstuff',
-    'greensward',
-    'gregariousness',
-    'greycoat',
-    'greyish-green',
-    'grier',
-    'griffithii',
-    'grimmest',
-    'grimston',
-    'grimwig',
-    'grisbrook',
-    'grisons',
-    'groovers',
-    'grot',
     'ground-launched',
-    'ground-rules',
-    'ground-sharing',
-    'groundwaters',
-    'group-wide',
-    'groynes',
-    'grubbed',
-    'gruffydd',
-    'gst-pou&lsqb;c&rsqb',
-    'guadalupe',
-    'guandong',
-    'guatemalans',
-    'guelph',
-    'guilts',
-    'guiness',
-    'guinle',
     'gumbet',
-    'gunhilda',
-    'gunnersbury',
-    'gunsight',
-    'gusmao',
-    'gustafsson',
-    'gut-wrenching',
-    'gwynant',
-    'gyatso',
-    'gymnosperms',
-    'gyorgy',
-    'gyp',
-    'gyre',
-    'gyroflo',
-    'h&amacr;rkini',
-    'h-parameters',
     'h.a',
-    'h.c.f.',
-    'h.j.',
-    'h2o',
-    'haddo',
-    'haff',
-    'hafnia',
-    'haggled',
-    'hagia',
-    'hahn-warburg',
-    'hailu',
-    'haim',
-    'hains',
-    'hairsprays',
-    'halam',
-    'half-breed',
     'half-cocked',
-    'half-conscious',
-    'half-french',
-    'half-penny',
-    'half-section',
-    'half-speed',
-    'halfheartedly',
-    'halfpennies',
-    'hall&eacute',
-    'hallman',
-    'hallucigenia',
-    'hallucinogens',
-    'halziel',
-    'hama',
-    'hamleys',
-    'hamsterley',
     'hamula',
-    'handclasp',
-    'handloom',
-    'handsaw',
-    'handstand',
-    'handwashing',
-    'hang-glider',
-    'hankins',
-    'hansie',
-    'hanwell',
-    'haplochromis',
-    'haplotypes',
-    'hara-kiri',
-    'harbin',
-    'hard-luck',
-    'hardenberger',
     'hards',
-    'harebell',
-    'harkes',
-    'harnham',
-    'harq',
-    'harrassment',
-    'harrisburg',
-    'harrowby',
-    'hartcliffe',
-    'hartshorne',
-    'hartung',
-    'hashemites',
-    'haston',
-    'hatchlings',
-    'hatim',
-    'hatoof',
     'hauptdolomit',
-    'haushofer',
-    'haut',
-    'havell',
-    'hawser',
-    'hayfields',
-    'hazeldene',
-    'hdag',
-    'hdi',
-    'hdm',
-    'head-hunted',
-    'headbanging',
-    'headmastership',
-    'heart-wrenching',
-    'heartaches',
-    'heartfield',
     'heartstrings',
-    'heave-ho',
-    'heavily-built',
-    'hebblethwaite',
-    'hectarage',
-    'hedonists',
-    'hedy',
-    'hefting',
-    'hegelians',
-    'height/crypt',
-    'heini',
-    'heisei',
-    'helipad',
-    'hell-hound',
-    'hellenized',
-    'helliwells',
     'hellos',
-    'helminths',
-    'heloise',
-    'helpmate',
-    'hemerdon',
-    'hemiplegia',
-    'hempel',
-    'henfield',
-    'henshall',
-    'henshaw',
-    'henstock',
-    'henwood',
-    'heparan',
-    'herati',
-    'herstmonceux',
-    'heterodimer',
     'heterozygote',
-    'hettie',
-    'hexafluoride',
-    'heyes',
-    'heyrick',
-    'heythrop',
-    'hezekiah',
-    'hfcs',
-    'hgw',
-    'hi-de-hi',
-    'hiawatha',
-    'hidey-hole',
-    'hieronymo',
-    'higginbottom',
-    'high-brow',
-    'high-calorie',
     'high-handedness',
-    'high-kelvinside',
-    'high-mindedness',
-    'high-walled',
-    'highline',
-    'higson',
-    'hilarion',
-    'hildebrand',
-    'hilder',
-    'hiles',
-    'him\'',
-    'hinging',
-    'hiorne',
-    'hipparchos',
-    'hirers',
-    'hirself',
     'histadrut',
-    'histones',
-    'hit-and-miss',
-    'hit-or-miss',
-    'hitlerian',
-    'hiv-1-infected',
-    'hla-a',
-    'hlh',
-    'hmpao',
-    'hoang',
-    'hoarder',
-    'hobbins',
-    'hobcraft',
-    'hochland',
-    'hofmeyr',
-    'hogans',
     'hollick',
-    'hollinshead',
-    'holograph',
-    'holts',
-    'home-buyers',
-    'homininae',
-    'homophilic',
-    'homozygotes',
-    'homunculi',
-    'homunculus',
-    'hon-yong',
-    'honeycombs',
-    'honeymoons',
-    'honorat',
-    'honoria',
-    'hoodwink',
     'hook-up',
-    'hookbait',
-    'hoom',
-    'hoopoes',
-    'hoorays',
-    'hoplites',
-    'hoptons',
-    'horacio',
-    'horlock',
-    'hornblende',
-    'hornung',
-    'horrifically',
-    'horsa',
-    'horse-box',
-    'horse-riders',
-    'horseguards',
     'horsemarket',
-    'horseshoe-shaped',
-    'hostilely',
-    'hotech',
-    'hotted',
-    'hotteterres',
-    'hourn',
-    'house-party',
-    'house-price',
-    'house-warming',
-    'houseboats',
-    'housebreaker',
-    'housemistress',
-    'housewares',
-    'howlin\'',
-    'hp9000',
     'hrpp',
-    'hsv',
-    'hudspith',
-    'huhne',
-    'humanise',
-    'humanizing',
-    'humbugs',
-    'humdinger',
-    'humean',
-    'humeral',
-    'humidified',
-    'hungers',
-    'hunky-dory',
-    'hunsdon',
-    'hunyadi',
-    'hurlingham',
     'husband-to-be',
-    'huv',
-    'hwang',
-    'hyades',
-    'hydrochlorofluorocarbons',
-    'hydroelectricity',
-    'hydroplane',
-    'hygienists',
-    'hylas',
-    'hyndburn',
-    'hyped-up',
-    'hyperbaric',
-    'hyperprolactinaemia',
-    'hypnotically',
-    'hypnotics',
-    'hypochlorites',
     'hypocrisies',
-    'hypocritically',
-    'hypopharynx',
-    'hypothec',
-    'i-mibg',
-    'i.t',
-    'iacs',
-    'iap',
-    'ibama',
-    'ic7',
-    'icarda',
-    'ice-sheets',
-    'ickx',
-    'iconauthor',
-    'iconographical',
-    'idealizations',
     'idec',
-    'idiocies',
-    'idiolect',
-    'idp',
-    'idylls',
-    'iee',
-    'ies',
-    'ifk',
-    'igbp',
-    'igc',
-    'ige',
-    'ightham',
-    'ik',
-    'ileus',
-    'ill-afford',
-    'ill-bred',
     'ill-chosen',
-    'ill-disposed',
-    'ill-temper',
-    'illuminators',
-    'ilminster',
-    'imajica',
-    'imbecility',
-    'imber',
-    'imbibe',
-    'imitator',
-    'immobiliser',
-    'immunized',
-    'immunoperoxidase',
-    'impassivity',
-    'impelling',
-    'imperatively',
     'implantable',
-    'importuned',
-    'impotency',
-    'improviser',
-    'imprudence',
-    'in-can',
-    'in-phase',
-    'in_in_terms_of',
-    'inappetence',
-    'incarnational',
-    'inchcolm',
-    'incisively',
-    'inclosure',
-    'incumbrances',
-    'incuriam',
-    'incurious',
     'indefatigably',
-    'indeterminist',
-    'indiscernibles',
-    'indochinese',
-    'industrial/commercial',
-    'inexcusably',
-    'infamously',
-    'inferencing',
-    'infiltrator',
-    'inflaming',
-    'influencer',
-    'information-giving',
-    'information-sharing',
-    'ingliston',
-    'ingrown',
-    'inhering',
     'inhumanely',
-    'injury.',
-    'inntrepreneur',
-    'inpfl',
-    'input&num',
-    'inputted',
-    'inquisitively',
-    'inscrutability',
-    'inscrutably',
-    'insectivore',
-    'inside-right',
-    'insolation',
-    'insomniacs',
-    'instils',
-    'institutionalising',
-    'insulae',
     'integer-valued',
-    'integrale',
-    'inter-association',
-    'inter-dealer',
-    'inter-faith',
-    'inter-linked',
-    'inter-union',
-    'interdenominational',
-    'interdigitating',
-    'interest-inelastic',
-    'interfoto',
-    'interlace',
-    'intermagnetics',
-    'intermarried',
-    'internacional',
-    'interracial',
     'intersolv',
-    'interspecies',
-    'interstrand',
-    'intimal',
-    'into-wind',
-    'intone',
-    'intourist',
-    'intra-community',
-    'intra-union',
-    'intraduodenal',
-    'intramucosal',
-    'intrastrand',
-    'introitus',
-    'intrusiveness',
-    'invalides',
-    'inverter',
     'investigational',
-    'iomega',
-    'ionomers',
-    'iosseliani',
-    'ipanema',
-    'ipsa',
-    'irascibility',
-    'iron-hard',
-    'irrationalism',
-    'irrationalities',
-    'irresolvable',
-    'irrigating',
-    'ischia',
-    'isd',
-    'iskra',
-    'islandia',
     'isoelectric',
-    'istel',
-    'istrian',
-    'it-',
-    'italtel',
-    'iteratively',
-    'itochu',
-    'iue',
-    'ivinghoe',
-    'iz',
-    'j&aacute;nos',
-    'j.m.b.',
-    'jack-in-the-box',
-    'jackboot',
-    'jacobinism',
-    'jade-green',
     'jagmohan',
-    'jah',
-    'jalisco',
-    'jam-jars',
-    'jamison',
-    'jangly',
-    'janina',
-    'janson',
-    'jardana',
-    'jaroslav',
-    'jarvefelt',
-    'jarvie',
-    'jayhawks',
-    'jazz-funk',
-    'jean-francois',
-    'jemps',
     'jennies',
-    'jepson',
-    'jesner',
-    'jet-setting',
-    'jetdirect',
-    'jeux',
-    'jiangsu',
-    'jibuti',
-    'jigger',
-    'jiggle',
-    'jimale',
-    'jinky',
-    'jiwei',
-    'jlg',
-    'jnr.',
-    'joad',
     'jobber',
-    'joes',
-    'johne',
-    'johnston-mcclelland',
-    'jonker',
-    'josep',
-    'jossom',
-    'jostein',
-    'joynson-hicks',
-    'juana',
-    'jud.',
-    'judde',
-    'judder',
-    'juddmonte',
-    'juha',
-    'jumbos',
     'juristic',
-    'k-reg',
-    'k3',
-    'ka&ncaron;ka',
-    'kacprzak',
-    'kaffe',
-    'kahlenbergerdorf',
-    'kakar',
-    'kalafrana',
-    'kambona',
-    'kamen',
-    'kanban',
-    'kapiti',
-    'kaplan-meier',
-    'karacs',
-    'kari',
     'katell',
-    'katja',
-    'katowice',
-    'kats',
-    'kavelin',
-    'kaz',
-    'kbytes',
-    'kedah',
-    'keflavik',
-    'keil',
-    'kelantan',
-    'kelling',
-    'kendall-humes',
-    'kenealy',
-    'kenjayev',
-    'kennerley',
     'kentford',
-    'kentmere',
-    'kerguelen',
-    'kerner',
-    'kexby',
-    'keyholes',
-    'keyman',
-    'khaddam',
-    'khayyam',
-    'khmelnitski',
-    'khuzestan',
-    'kiai',
-    'kibaki',
-    'kickstart',
-    'kiechle',
-    'kilbarchan',
     'kilgore',
-    'killearn',
-    'kimbolton',
-    'kingpin',
-    'kingsford',
-    'kinlochbervie',
-    'kinnocks',
-    'kinrimund',
-    'kinsale',
-    'kinver',
-    'kirkliston',
-    'kirks',
-    'kirkstall',
-    'kirkstone',
-    'kislevites',
-    'kissogram',
     'kitchen-garden',
-    'kitchenettes',
-    'kitting',
-    'kleiman',
-    'klingons',
-    'klinsmann',
-    'kluwer',
-    'kmag',
-    'knick',
-    'knickerbockers',
-    'knolles',
-    'knottingley',
-    'knowle',
-    'knox-johnston',
-    'knurled',
-    'koalas',
     'kolb',
-    'koleston',
-    'koller',
-    'kolve',
-    'komsomolskaya',
-    'konya',
-    'koppelaar',
-    'korale',
-    'korpi',
-    'kosmos',
-    'kostic',
-    'kpc',
-    'kpd',
-    'krasnoyarsk',
-    'krenek',
-    'krimsky',
     'kroon',
-    'kubitsky',
-    'kumana',
-    'kumdan',
-    'kung-fu',
-    'kupres',
-    'kurtosis',
-    'kuznetsk',
-    'kwacha',
-    'kyong',
-    'l\'oreal',
-    'l\'univers',
-    'l.a.h.',
-    'l.r.ir.',
-    'l289',
-    'l9x1',
     'la_dolce_vita',
-    'labourd',
-    'labrum',
-    'lacework',
-    'laclau',
-    'lactoglobulin',
-    'lacustrine',
-    'ladysmith',
-    'lagasek',
-    'lagopus',
-    'laigh',
-    'laindon',
-    'lalith',
-    'lamas',
-    'lamellar',
-    'lamination',
     'landesmuseum',
-    'langhorn',
-    'langs',
-    'lanny',
-    'lanthorn',
-    'lantra',
-    'lap/diagonal',
-    'lappland',
-    'larbi',
-    'large-flowered',
-    'large-format',
-    'large-screen',
-    'largen',
-    'largeness',
-    'laroche',
-    'latch-key',
     'lates',
-    'laudian',
-    'laudrup',
-    'launderettes',
-    'laundress',
-    'lauterbrunnen',
-    'lautrec',
-    'law-governed',
-    'lawmen',
-    'lawn-mower',
-    'lawyer(s)',
-    'laye',
-    'layette',
-    'layperson',
-    'lcst',
-    'leaburn',
     'leanness',
-    'leapfrogged',
-    'lears',
-    'leatherface',
-    'leavings',
-    'leavisite',
-    'leben',
-    'lectin',
-    'lectio',
-    'ledingham-smiths',
-    'leee',
-    'lefts',
-    'leftwich',
-    'legalising',
-    'leidseplein',
-    'lemass',
     'lemert',
-    'lemmas',
-    'lemos',
-    'leoluca',
-    'leona',
-    'leonis',
-    'leptokurtic',
-    'lesbos',
-    'lescar',
-    'lesmahagow',
-    'letcombe',
-    'lethargically',
-    'lethieullier',
-    'letter-writer',
-    'letter-writers',
-    'leudast',
     'levick',
-    'lewandowski',
-    'lewine',
-    'lexicographical',
-    'lf363',
-    'lfa-3',
-    'lhc',
-    'liaodong',
-    'libid',
-    'librium',
-    'liddel',
-    'liddie',
-    'life-raft',
-    'lifeboatmen',
-    'lifer',
-    'light-skinned',
     'light-switch',
-    'lightermen',
-    'lijn',
-    'limiters',
-    'limpopo',
-    'limps',
-    'linacre',
-    'linby',
-    'lincs.',
-    'linctus',
-    'lindgren',
-    'lindon',
-    'line-item',
-    'linearised',
-    'linewidth',
-    'lintons',
     'lipidic',
-    'liquefy',
-    'liquifry',
-    'lissouba',
-    'literal-minded',
-    'lithified',
-    'lithographed',
-    'litster',
-    'littleness',
-    'lobo',
-    'loca',
-    'locarno',
-    'lochhead',
-    'lock-keeper',
-    'lockean',
-    'lockets',
     'lockington',
-    'lockley',
-    'lodgement',
-    'lofting',
-    'log-normal',
-    'logico-linguistic',
-    'logocentrism',
-    'long-acting',
-    'long-lashed',
-    'long-limbed',
-    'long_as',
-    'longer-lived',
-    'looney',
-    'lorenzi',
-    'loretto',
-    'losey',
     'losh',
-    'lostwithiel',
-    'loup',
-    'love-struck',
-    'lovebird',
-    'lovelies',
-    'low-ranking',
-    'low-resolution',
-    'low-tax',
-    'low-temperature',
-    'lower-school',
-    'lowlights',
-    'lowson',
-    'loz',
-    'lozenge-shaped',
-    'lpdr',
     'lpi*',
-    'lt-col',
-    'lu&iacute;s',
-    'lubeck',
-    'lucey',
-    'ludd',
-    'ludford',
-    'ludmila',
-    'ludwitt',
-    'lufe',
-    'lugger',
-    'lugubriously',
-    'luminary',
-    'lumpenproletariat',
-    'lunch-break',
-    'lungworms',
     'lwp',
-    'lxx',
-    'lychgate',
-    'lynnette',
-    'lysol',
-    'm&eacute;ndez',
-    'm&eacute;thode',
-    'm&ecirc;me',
-    'm&uuml;nster',
-    'm-',
-    'm-16',
-    'm-tense',
-    'm.c.r.',
-    'm.d',
-    'm27',
-    'maat',
     'mac-on-unix',
-    'macaroons',
-    'macbryde',
-    'macdermott',
-    'macdonell',
-    'macewen',
-    'macheath',
-    'machungo',
-    'macrobiotic',
-    'macroeconomy',
-    'maculata',
-    'maghery',
-    'maghrun',
-    'magick',
-    'magico-religious',
-    'magmatism',
     'magnetosheath',
-    'magnifiers',
-    'maharaj',
-    'maji',
-    'majles',
-    'majolica',
-    'major-domo',
-    'majorettes',
-    'makeover',
-    'malaka',
-    'maldonado',
-    'malefactor',
-    'malestream',
-    'malivai',
-    'malmaison',
-    'malmsteen',
     'malorum',
-    'malvolio',
-    'mammography',
-    'man\'',
-    'man/woman',
-    'manageability',
-    'management-union',
-    'mancs',
-    'mandroids',
-    'maneka',
-    'mangan',
-    'mangetout',
-    'mangonels',
-    'manhatten',
-    'maniax',
-    'manipulable',
     'manitou',
-    'manky',
-    'manqu&eacute',
-    'manured',
-    'many-celled',
-    'many-coloured',
-    'maoists',
-    'maol',
-    'map-maker',
-    'mappa',
-    'maquila',
-    'mar.',
-    'marauder',
-    'marcellinus',
-    'march&eacute',
-    'marchandise',
     'marchwood',
-    'marcopolo',
-    'marevna',
-    'margaretha',
-    'margidunum',
-    'margolis',
-    'marianas',
-    'marie-rose',
-    'mariella',
-    'marimba',
-    'marinatos',
-    'marinetti',
-    'marit',
-    'markey',
-    'marls',
-    'marney',
     'marnya',
-    'marrons',
-    'mars-u',
-    'marxist-based',
-    'marzi',
-    'masaccio',
-    'maschera',
-    'mascis',
-    'masculinities',
-    'maseru',
-    'masochistically',
-    'masri',
-    'massaliote',
-    'massifs',
-    'massmoca',
-    'master-minded',
     'mastfoot',
-    'materiel',
-    'matfrid',
-    'mathsoft',
-    'matravers',
-    'matthewson',
-    'mattocks',
-    'matzos',
-    'mauger',
-    'mauno',
-    'mavhinje',
-    'mawddwy',
-    'may&ndash;10',
-    'mayers',
-    'mazy',
-    'mbus-based',
     'mccreadie',
-    'mccurdy',
-    'mcerlean',
-    'mcgahan',
-    'mcgeevor',
-    'mcgilvray',
-    'mcgraw',
-    'mcguiness',
-    'mcilwaine',
-    'mckern',
-    'mclevy',
-    'mcmonagle',
-    'mcsweeney',
-    'mcvicar',
-    'meacock',
-    'meakin',
     'meal-time',
-    'mechonoids',
-    'mecir',
-    'mecklenburg-western',
-    'meco',
-    'medal-winning',
-    'medalist',
-    'meddled',
-    'medicinally',
-    'medio',
-    'meditates',
-    'meester',
-    'mefloquine',
-    'megaliths',
-    'meggetland',
-    'mehra',
     'mehri',
-    'melangell',
-    'melbury',
-    'melina',
-    'memnon',
-    'memorisation',
-    'men-of-war',
-    'mentalities',
-    'mentally-ill',
-    'mentha',
-    'meopham',
-    'mephisto',
-    'meres',
-    'mergansers',
-    'merion',
-    'merkur',
     'merlot',
-    'merrymaking',
-    'mesothelioma',
-    'messuage',
-    'metamorphosing',
-    'metempsychosis',
-    'methoxy',
-    'metronomic',
-    'mewed',
-    'mezzo-soprano',
-    'mfdc',
-    'mhaim',
-    'miall',
-    'mich',
-    'michener',
-    'microcontrollers',
     'microform',
-    'microinjected',
-    'micropipette',
-    'microscopist',
-    'microvax',
-    'mics',
-    'mid-brown',
-    'mid-devon',
-    'mid-line',
-    'mid-size',
-    'middle-management',
-    'midford',
-    'midships',
-    'midsoles',
-    'mika',
-    'milesian',
     'milewater',
-    'militaria',
-    'militarisation',
-    'militiaman',
-    'milkshake',
-    'mill-owner',
-    'mill-workers',
-    'milla',
-    'millend',
-    'millenia',
-    'millets',
-    'millford',
-    'milliken',
-    'millwrights',
-    'mils',
-    'mincer',
     'minchinhampton',
-    'minelli',
-    'minist&egrave;re',
-    'minneapolis-based',
-    'mino',
-    'minute-by-minute',
-    'miramare',
-    'mireille',
-    'miscellanies',
-    'misdescription',
-    'misdescriptions',
-    'miso',
-    'misquote',
-    'mistreat',
-    'mithras',
-    'mitigates',
     'mitr',
-    'mitte',
-    'mittwoch',
-    'mitzer',
-    'miyagi',
-    'mizar',
-    'mizrahi',
-    'mizz',
-    'ml/day',
-    'mmboe',
-    'mochlos',
-    'modernistic',
-    'modo',
-    'modularised',
-    'moel',
-    'moffett',
     'mohammedan',
-    'mohtashemi',
-    'mok',
-    'moldavians',
-    'molehills',
-    'molnar',
-    'mon&ndash;sat',
-    'monetisation',
-    'money-wage',
-    'monkey-puzzle',
-    'monkstown',
-    'monocoque',
-    'monod',
-    'monophonic',
-    'monophyletic',
-    'monospar',
     'montebello',
-    'montessori',
-    'montezuma',
-    'montignac',
-    'monzer',
-    'moodiness',
-    'mook',
-    'moolit',
-    'moondream',
-    'moorside',
-    'moots',
-    'mopping-up',
-    'morale-booster',
-    'morena',
-    'mornay',
-    'moroni',
     'morphogen',
-    'morphs',
-    'motamid',
-    'mother-of-four',
-    'motorspeeder',
-    'motson',
-    'mould-breaking',
-    'mouloud',
-    'mousey',
-    'moustachial',
-    'mouthbrooder',
-    'mouthbrooders',
-    'moyne',
-    'mp-2',
-    'msec.',
-    'msecs',
     'much-criticised',
-    'much-heralded',
-    'much-praised',
-    'much-publicized',
-    'much-used',
-    'mucha',
-    'muddletonians',
-    'mudros',
-    'mufc',
-    'muggins',
-    'mugler',
-    'muhajir',
-    'mujahidin',
-    'mukden',
-    'mukhametshin',
-    'mullein',
     'mulrine',
-    'multi-centre',
-    'multi-chip',
-    'multi-infarct',
-    'multi-male',
-    'multi-million-pound',
-    'multi-tiered',
-    'multi-vitamin',
-    'multifocal',
-    'multilingualism',
-    'multimillionaire',
-    'multithreaded',
-    'multithreading',
-    'multiverb',
-    'mummer',
-    'mungham',
     'munsters',
-    'murrays',
-    'muscadet',
-    'muschamp',
-    'musculoskeletal',
-    'musee',
-    'musette',
-    'musketeer',
-    'muslins',
-    'mustelids',
-    'mutating',
-    'mycologist',
-    'myddelton',
-    'myfanwy',
-    'mymouse',
-    'myopically',
     'myreside',
-    'mystif',
-    'n-acetyl-4asa',
-    'n-bit',
-    'n.d.o.',
-    'n.r.m.',
-    'n=15',
-    'n=16',
-    'n=18',
-    'n=20',
-    'naa',
-    'naaqss',
-    'nafd',
-    'nafferton',
-    'nagdi',
-    'nanci',
     'nandie',
-    'nantucket',
-    'naoroji',
-    'narain',
-    'narin',
-    'narwhals',
-    'nasdaq',
-    'nasional',
-    'nasuwt',
-    'nationalizations',
-    'natrum',
-    'natsemi',
-    'naturalize',
-    'naughtily',
-    'naumann',
-    'nclc',
     'ncp7a',
-    'ncp7d',
-    'ncta',
-    'ndi',
-    'near-contemporary',
-    'near-naked',
-    'near-shore',
-    'near-term',
-    'necessitation',
-    'nedd',
-    'negr&iacute;n',
-    'negra',
-    'negri',
-    'neighbor',
-    'neighbors',
-    'neighed',
     'nellis',
-    'nemean',
-    'neo-fascism',
-    'neologism',
-    'neologisms',
-    'neophytes',
-    'neotropics',
-    'neots',
-    'neroni',
-    'nerys',
-    'nesri',
-    'netbios',
-    'netherfield',
-    'netter',
-    'nettlebed',
-    'nettlefold',
     'neubauer',
-    'neuchatel',
-    'neuroblastoma',
-    'neurophysiologists',
-    'neutraliser',
-    'neutralises',
-    'never-say-die',
-    'new-build',
-    'new-generation',
-    'new-looking',
-    'new-wave',
-    'new-york',
-    'newcomb',
-    'newe',
-    'newing',
-    'newly-restored',
     'newsam',
-    'newsham',
-    'newshounds',
-    'newsstands',
-    'nezameddin',
-    'nft1',
-    'nft2',
-    'nhsme',
-    'nicholle',
-    'nicobar',
-    'niggly',
-    'nightgowns',
-    'nightjars',
-    'nightshirts',
-    'nikandre',
-    'nikau',
     'nikolay',
-    'nikolayeva',
-    'nilts',
-    'nimbleness',
-    'nimby',
-    'nine-week-old',
-    'ninet',
-    'ninths',
-    'nitro',
-    'nitschke',
-    'niver',
-    'nizari',
-    'nk-1r',
-    'nmgc',
-    'no-cost',
-    'no-no',
     'no.10',
-    'no6',
-    'nobis',
-    'nociceptors',
-    'nogueira',
-    'noisettes',
-    'non-active',
-    'non-anaphoric',
-    'non-arab',
-    'non-arbitrary',
-    'non-church',
-    'non-classical',
-    'non-conformances',
-    'non-conservative',
-    'non-contractual',
-    'non-demented',
     'non-elderly',
-    'non-elt',
-    'non-excludable',
-    'non-family',
-    'non-farming',
-    'non-functioning',
-    'non-graduate',
-    'non-homosexual',
-    'non-intrusive',
-    'non-judgemental',
-    'non-judicial',
-    'non-jurors',
-    'non-justiciable',
-    'non-marital',
-    'non-metal',
-    'non-methanogenic',
     'non-migratory',
-    'non-observance',
-    'non-occurrence',
-    'non-official',
-    'non-paying',
-    'non-professionals',
-    'non-progressive',
-    'non-propagated',
-    'non-public',
-    'non-renewal',
-    'non-risky',
-    'non-roman',
-    'non-sequential',
-    'non-social',
-    'non-traded',
-    'nonhuman',
     'nonrandom',
-    'nordland',
-    'nordlinger',
-    'nordstrom',
-    'noricum',
-    'norming',
-    'norp',
-    'north-bound',
-    'northbrook',
-    'northland',
-    'nossa',
-    'nostrum',
-    'nou',
-    'nov&aelig',
-    'nove',
-    'noverre',
     'nses',
-    'nt-on-alpha',
-    'ntb',
-    'nuclide',
-    'nuneham',
-    'nursing-home',
-    'nut-brown',
-    'nyein',
-    'o\'dare',
-    'o\'gill',
-    'o\'mahoney',
-    'o.r',
-    'oafish',
-    'oakenfold',
-    'oakington',
-    'oakridge',
     'oatridge',
-    'objectifying',
-    'oboist',
-    'obtrude',
-    'ocampo',
-    'oceanport',
-    'oct-6',
-    'octahedral',
-    'octahedron',
-    'octopi',
-    'odd-job',
-    'off-cuts',
-    'off-the-record',
-    'off-worlders',
-    'officinale',
-    'offlining',
     'ogbourne',
-    'ogled',
-    'ohhhh',
-    'okehampton',
-    'okness',
-    'olahi',
-    'oldroyd',
-    'oligodendrocytes',
-    'oligopolies',
-    'olley',
-    'olugboja',
-    'omarska',
-    'omran',
-    'on-coming',
-    'on-field',
-    'on-stream',
     'once-only',
-    'one-2-one',
-    'one-act',
-    'one-address',
-    'one-fifteenth',
-    'one-pass',
-    'one-period',
-    'onrushing',
-    'ontogenetic',
-    'onusal',
-    'oolite',
-    'open-fronted',
-    'opencasting',
-    'openwork',
-    'operationalize',
-    'ophiotrema',
     'ophiuroids',
-    'oppositely',
-    'oral/aural',
-    'oralist',
-    'oranda',
-    'ordinaire',
-    'ordinations',
-    'ordover',
-    'oregon-based',
-    'orem',
-    'organicist',
-    'organochlorine',
-    'orgel',
-    'orgone',
-    'ori',
-    'originary',
     'orioles',
-    'orlan',
-    'ornatus',
-    'orsay',
-    'orthogenesis',
-    'orthographically',
-    'orthotopic',
-    'oscar-winner',
-    'osnafeld',
-    'ossete',
-    'ostertag',
-    'ostkreuz',
-    'oti',
-    'ouagadougou',
-    'out-buildings',
-    'out-of-the-money',
     'out-performed',
-    'outpointing',
-    'outputting',
-    'outrank',
-    'outriggers',
-    'outsized',
-    'outstayed',
-    'over-bright',
-    'over-concentration',
-    'over-dependence',
-    'over-development',
-    'over-expression',
-    'over-hasty',
-    'over-heated',
-    'over-rule',
-    'over-runs',
     'over-spending',
-    'over-stressed',
-    'over-winter',
-    'over-wintering',
-    'overconfident',
-    'overdevelopment',
-    'overdosing',
-    'overemphasis',
-    'overemphasized',
-    'overexertion',
-    'overextended',
-    'overinclusive',
-    'overindebtedness',
-    'overprinted',
-    'overreached',
-    'overrepresented',
     'oversold',
-    'overthrows',
-    'overtrousers',
-    'overwound',
-    'ovett',
-    'owr',
-    'owton',
-    'oyanguren',
-    'ozberk',
-    'ozs.',
-    'p.17',
-    'p.27',
-    'p.42',
-    'p.47',
-    'p.56',
-    'p.69',
     'p.79',
-    'p.a.f.',
-    'p/kwh',
-    'p19',
-    'p38',
-    'p=0.08',
-    'paan',
-    'pabbay',
-    'pacemen',
-    'pachinko',
-    'packham',
-    'padsaw',
-    'pahinui',
-    'palaeoecological',
-    'palaikastro',
-    'pale-skinned',
     'paleolithic',
-    'paleozoic',
-    'palfry',
-    'palindrome',
-    'pallida',
-    'pampero',
-    'pan-german',
-    'pan-pla2',
-    'pandolfi',
-    'pangolin',
-    'panos',
-    'pantheistic',
-    'panty',
-    'paola',
-    'paolini',
-    'papermaking',
     'paracelsian',
-    'parade-ground',
-    'paradouze',
-    'parallan',
-    'paramagnetic',
-    'parana',
-    'parasitises',
-    'parathyroid',
-    'parenchymal',
-    'parfum',
-    'pari-mutuel',
-    'pariahs',
-    'parissien',
-    'parkins',
-    'parkonians',
-    'parmenter',
     'parratt',
-    'part-',
-    'parterre',
-    'partisi',
-    'parvin',
-    'pasqua',
-    'passerine',
-    'passy',
-    'pasteurisation',
-    'pastilles',
-    'pateley',
-    'pathfoot',
-    'pati',
-    'patients.',
-    'patinas',
-    'patricians',
     'patros',
-    'paul-henri',
-    'paull',
-    'pawlak',
-    'pay-per-view',
-    'payson',
-    'pblcat2',
-    'pcfc',
-    'pdag',
-    'peace-keepers',
-    'peachey',
-    'pearwood',
-    'pechstein',
-    'pecker',
-    'peckett',
-    'pedder',
     'peeble',
-    'peerlogic',
-    'pekin',
-    'pelargonium',
-    'pelisse',
-    'pellegrini',
-    'pelletier',
-    'pelta-urns',
-    'pen-name',
-    'penan',
-    'pendula',
-    'penetratingly',
-    'penmaenmawr',
-    'pennie',
-    'penological',
-    'pens&eacute;es',
     'pentagonale',
-    'pentamidine',
-    'peppering',
-    'perehera',
-    'perfectibility',
-    'peri-operative',
-    'perigord',
-    'periodization',
-    'perioperative',
-    'periti',
-    'peritoneum',
-    'permutes',
-    'pero',
-    'personalize',
-    'personalizing',
-    'pertaining',
     'pertinacity',
-    'pesky',
-    'petch',
-    'peterhouse',
-    'petkov',
-    'petrashevskii',
-    'petro-chemical',
-    'petrolia',
-    'pewsey',
-    'pexton',
-    'pfaff',
-    'pfeffer',
-    'phalaropes',
-    'phantasmagorical',
-    'phasors',
-    'phenols',
     'philbin',
-    'phileas',
-    'philharmonie',
-    'philippou',
-    'philipps',
-    'phinehas',
-    'phoenix-like',
-    'phonographic',
-    'phosphate-buffered',
-    'phosphatidylinositol',
-    'phosphors',
-    'photo-opportunities',
-    'photofinish',
-    'photovoltaics',
-    'phrygia',
-    'physicochemical',
     'physiographic',
-    'physios',
-    'pi&lstrok;sudski',
-    'pianism',
-    'piat',
-    'piazzas',
-    'picture-postcard',
-    'pieris',
-    'piezoelectric',
-    'pimpled',
-    'pin-stripe',
-    'pine-clad',
-    'pinions',
-    'pio',
-    'pira',
-    'pirbright',
     'pisistratus',
-    'pit-stop',
-    'pithart',
-    'pities',
-    'pkt',
-    'plac',
-    'placido',
-    'plange',
-    'plant-based',
-    'plant-level',
-    'plasmas',
-    'platelet-aggregate',
-    'plautus',
-    'play-pause',
-    'playbus',
-    'playing-field',
     'plazas',
-    'pleasant-faced',
-    'pleasuring',
-    'ploughshare',
-    'plumages',
-    'plumbs',
-    'pm/hour',
-    'podsnap',
-    'podvig',
-    'poele',
-    'poinsettia',
-    'point-to-points',
-    'pokers',
-    'pole-axed',
-    'politti',
-    'pollyanna',
     'polycarp',
-    'polyfilla',
-    'polygonum',
-    'polyhedrin',
-    'polyptychs',
-    'polysaccharide',
-    'polysemy',
-    'pomme',
-    'pomps',
-    'ponomarev',
-    'ponsford',
-    'ponto',
-    'pooey',
-    'popcon',
-    'popperian',
-    'popularisation',
     'portering',
-    'porthcawl',
-    'portslade',
-    'porzana',
-    'poseurs',
-    'post-freudian',
-    'post-maastricht',
-    'post-menopausal',
-    'post-reformation',
-    'post-registration',
-    'post-stalinist',
-    'post/modern',
-    'postroom',
-    'pot-holed',
-    'potentes',
-    'potentiometric',
     'potherbs',
-    'potiphar',
-    'poulson',
-    'pow-wow',
-    'power-packed',
-    'powerboating',
-    'powerbreaker',
-    'poynor',
-    'poynter',
-    'pq',
-    'prana',
-    'pratesi',
-    'prawiro',
-    'pre-1967',
-    'pre-1973',
-    'pre-agreed',
     'pre-completion',
-    'pre-conceived',
-    'pre-cooked',
-    'pre-cut',
-    'pre-darwinian',
-    'pre-established',
-    'pre-maritally',
-    'pre-oedipal',
-    'pre-permian',
-    'pre-strike',
-    'prebends',
-    'prebiotic',
-    'preciously',
-    'predetermine',
-    'preempted',
-    'preimmune',
     'prejudged',
-    'premack',
-    'premolars',
-    'premultiplied',
-    'prensa',
-    'preparer',
-    'preponderantly',
-    'prequel',
-    'presentiment',
-    'preservationists',
-    'presidencies',
-    'press-box',
-    'prester',
-    'preternaturally',
-    'prezzies',
-    'priapus',
     'pricier',
-    'priddy',
-    'priene',
-    'priest-king',
-    'primeur',
-    'primitively',
-    'printemps',
-    'prioritization',
-    'prioritized',
-    'prises',
-    'prl',
-    'pro-anc',
-    'pro-europeans',
-    'pro-israel',
-    'pro-vice-chancellor',
-    'pro_tem',
     'problematization',
-    'procordia',
-    'procrastinated',
-    'procures',
-    'productise',
-    'professional-looking',
-    'profit-taking',
-    'profiteroles',
-    'prolamins',
-    'prolapsed',
-    'promos',
-    'proneness',
-    'pronounceable',
-    'propagators',
-    'propionibacteria',
-    'propliners',
     'prorenin',
-    'prostheses',
-    'prostituted',
-    'proteges',
-    'proteinaceous',
-    'prothorax',
-    'protocerebrum',
-    'protostomes',
-    'protuberant',
-    'provosts',
-    'prows',
-    'prufrock',
-    'psephology',
-    'pseudanthias',
-    'pseudo-science',
-    'psycho-history',
     'psychoanalytically',
-    'psychobiological',
-    'psychomotor',
-    'psychophysiological',
-    'ptc',
-    'pterodactyl',
-    'ptts',
-    'pubertal',
-    'public-interest',
-    'publically',
-    'publickly',
-    'publicly-owned',
-    'puc19',
-    'pucci',
-    'pugnaciously',
-    'pull-offs',
     'pulsations',
-    'punch-ups',
-    'punshon',
-    'pure-bred',
-    'purefoy',
-    'puro',
-    'purple-red',
-    'purply',
-    'pusillanimous',
-    'puskas',
-    'put-upon',
-    'pyotr',
-    'pyrimethamine',
-    'q1692',
-    'qasim',
-    'qdm.',
     'qtc',
-    'quackery',
-    'quae',
-    'quaffing',
-    'quaid',
-    'quaintness',
-    'quakerism',
-    'qualcomm',
-    'quality.',
-    'quando',
-    'quantitation',
-    'quantitive',
-    'quare',
-    'quarter-finalists',
-    'quarter-hour',
-    'quasi-legal',
     'quasi-statutory',
-    'quelle',
-    'queux',
-    'quick-fix',
-    'quietwaters',
-    'quilling',
-    'quilp',
-    'quincentenary',
-    'quintana',
-    'quitter',
-    'quoit',
-    'qw',
-    'r&middot',
-    'r.f.',
-    'r151',
-    'r4000-based',
     'r450',
-    'r98',
-    'raban',
-    'rabidly',
-    'rabier',
-    'rachid',
-    'rack-mount',
-    'racketeers',
-    'raddle',
-    'radiocommunications',
-    'radiogram',
-    'radioisotope',
-    'radiolucent',
-    'radleys',
-    'radula',
-    'raedwald',
     'raffald',
-    'rag-and-bone',
-    'ragstone',
-    'railcars',
-    'rain-lashed',
-    'rain-water',
-    'raindrop',
-    'rainier',
-    'rainsford',
-    'rallye',
-    'ralphs',
-    'ramekins',
-    'ranatunga',
-    'rangelands',
-    'rappard',
-    'rasa',
     'rasari',
-    'rascally',
-    'rasselas',
-    'rate-capped',
-    'rattansi',
-    'ratted',
-    'rauching',
-    'raver',
-    'ravish',
-    'rawsthorne',
-    'rawthey',
-    'rayburn',
-    'raz',
-    'razaleigh',
-    'razing',
-    'razorblade',
     'rbi',
-    're-activate',
-    're-aligned',
-    're-allocated',
-    're-appearance',
-    're-applied',
-    're-arrested',
-    're-assemble',
-    're-assert',
-    're-charge',
-    're-draw',
-    're-educating',
-    're-engage',
-    're-engineer',
-    're-engineered',
-    're-experience',
     're-expressed',
-    're-housed',
-    're-interpretation',
-    're-inventing',
-    're-investment',
-    're-made',
-    're-negotiate',
-    're-negotiated',
-    're-organise',
-    're-set',
-    're-sit',
-    're-tell',
-    'reabsorbed',
-    'read&mdash;complete&mdash;root&mdash;package',
-    'ready-prepared',
-    'ream',
     'reapers',
-    'rear-adml',
-    'reaver',
-    'reburied',
-    'recapping',
-    'receptor-dependent',
-    'recidivist',
-    'reclassify',
-    'recombined',
-    'recompensed',
-    'recompilation',
-    'reconstructs',
-    'reconvicted',
-    'recrossed',
-    'recurrently',
-    'red-bellied',
     'red-head',
-    'red-letter',
-    'redaction',
-    'rededication',
-    'redefines',
-    'redesignated',
-    'reductase',
-    'reedbeds',
-    'reel-to-reel',
-    'referentially',
-    'reflectiveness',
-    'reformulating',
-    'refurnished',
-    'refuseniks',
-    'refutable',
-    'regionalization',
     'regs',
-    'regurgitating',
-    'rehydrated',
-    'reichenau',
-    'reimburses',
-    'reinhart',
-    'reinvestigation',
-    'reisz',
-    'relegates',
-    'relegation-threatened',
-    'relinquishes',
-    'remarriages',
-    'remastered',
-    'remote-controlled',
-    'remounts',
-    'remploy',
     'remuage',
-    'renishaw',
-    'renumber',
-    'renzi',
-    'reoffending',
-    'repairman',
-    'repetitiveness',
-    'rephrasing',
-    'replicase',
-    'repointing',
-    'repopulate',
-    'reportable',
-    'represses',
-    'reproaching',
-    'reprogrammed',
-    'reprove',
     'reptation',
-    'repudiatory',
-    'reruns',
-    'resistible',
-    'resiting',
-    'respire',
-    'responsorial',
-    'respray',
-    'resuit',
-    'resuspend',
-    'retards',
-    'retentions',
-    'retributivist',
-    'retrievals',
-    'reveley',
-    'revenged',
     'revertant',
-    'revisits',
-    'reworkings',
-    'reynold',
-    'rgb',
-    'rhapsodies',
-    'rheinberger',
-    'rhinestone',
-    'rhydding',
-    'ri2',
-    'rial',
-    'ribbers',
-    'rickardsson',
-    'ridging',
-    'ridler',
-    'riffle',
     'righter',
-    'rigorist',
-    'rimsky',
-    'ringmaster',
-    'ringmer',
-    'ripcord',
-    'rise-fall',
-    'risk-related',
-    'riskiest',
-    'rivero',
-    'rizzio',
-    'rla',
-    'rls',
-    'robens',
-    'robing',
-    'rockford',
     'rocque',
-    'rodham',
-    'rogerson',
-    'roistering',
-    'roksanda',
-    'rolland',
-    'roman-dutch',
-    'romanised',
-    'romanized',
-    'romberg',
-    'roof-slope',
-    'roomed',
-    'roque',
-    'rosalyn',
-    'rosebush',
-    'rosemerry',
     'rosing',
-    'rosita',
-    'rosset',
-    'rostenkowski',
-    'rostering',
-    'rotarian',
-    'rougier',
-    'round-shouldered',
-    'roundhead',
-    'rovigo',
-    'rowicki',
-    'rowlandson',
-    'royden',
-    'roziac',
-    'rozzers',
-    'rrnb',
     'rsk',
-    'rsm',
-    'rub-down',
-    'rubicund',
-    'rubino',
-    'rubus',
-    'rucsac',
-    'ruddington',
-    'ruddy-faced',
-    'ruggero',
-    'ruislip-northwood',
-    'rumex',
-    'ruminate',
-    'ruminations',
-    'ruminative',
-    'rumsey',
     'runtu',
-    'rusholme',
-    'rustin',
-    'rusts',
-    'rutnagur',
-    'ruwatu',
-    'rve',
-    'ryanodine',
-    'ryhope',
-    'ryland',
-    's.m.o.',
-    's.t.p.',
-    's14(2)',
-    's39',
-    's41',
-    's673',
     'sabbaticals',
-    'sacerdotal',
-    'sacrum',
-    'sadlers',
-    'sadomasochism',
-    'safety-pins',
-    'saffi',
-    'sagittarians',
-    'sailmaker',
-    'saint-sa&euml;ns',
-    'saint-sauveur',
-    'sais',
-    'saison',
-    'saithe',
-    'salazopyrin',
-    'saleability',
     'salha',
-    'salica',
-    'salicylic',
-    'salinities',
-    'sallis',
-    'saltersgill',
-    'saltings',
-    'saltoun',
-    'salutations',
-    'salved',
-    'salvidge',
-    'salvin',
-    'salvos',
-    'samain',
-    'samakkhi',
-    'same-day',
     'samedi',
-    'samoeds',
-    'samora',
-    'samui',
-    'samwell',
-    'sanctifying',
-    'sand-coloured',
-    'sandiman',
-    'sandstorm',
-    'sandyford',
-    'sang-froid',
-    'sanitaryware',
-    'sanitisers',
-    'sanpro',
-    'santer',
-    'saparmurad',
     'sarcoplasmic',
-    'sarsaparilla',
-    'sartrean',
-    'sarup',
-    'satanist',
-    'satanists',
-    'satiro',
-    'sativa',
-    'satnav',
-    'satyagraha',
-    'saurischians',
-    'savants',
-    'savetsila',
-    'savills',
-    'savin',
-    'sawar',
     'sawfly',
-    'sawkins',
-    'sawney',
-    'sawyers',
-    'saxmundham',
-    'scarabs',
-    'scaraby',
-    'scarfe',
-    'scarier',
-    'scaup',
-    'scene-of-crime',
-    'scentless',
-    'scfas',
-    'schallers',
-    'schank',
-    'scheler',
     'schell',
-    'schh',
-    'schirn',
-    'schismatic',
-    'scholey',
-    'school-house',
-    'school-teacher',
-    'school/college',
-    'schoolboyish',
-    'schoolrooms',
-    'schwa',
-    'schwab',
-    'schwanitz',
-    'schweppe',
-    'scooted',
-    'scorelord',
     'scorpios',
-    'scotswood',
-    'scourged',
-    'scraton',
-    'screamers',
-    'screenshots',
-    'scribbler',
-    'scrivens',
-    'scrutinises',
-    'scumbag',
-    'scuola',
-    'scutum',
-    'sd1',
-    'sea-faring',
-    'sea-launched',
-    'sea-lion',
     'sea-lions',
-    'sea-shore',
-    'sea-side',
-    'sea-wall',
-    'sead',
-    'seagrave',
-    'seahawks',
-    'sealand',
-    'seasonable',
-    'sebum',
-    'second-innings',
-    'second-row',
-    'secretaire',
-    'sectionalization',
-    'sedgebrook',
-    'seducers',
     'seeders',
-    'seeley',
-    'segesta',
-    'seghbatullah',
-    'seised',
-    'sekou',
-    'sele',
-    'self-authenticating',
-    'self-chosen',
-    'self-dealing',
-    'self-giving',
-    'self-guided',
-    'self-importantly',
-    'self-obsessed',
-    'self-organizing',
-    'self-penned',
     'self-preserving',
-    'self-protective',
-    'self-questioning',
-    'self-replication',
-    'selmer',
-    'selvedges',
-    'semaphoring',
-    'semi-major',
-    'semi-open',
-    'semi-pro',
-    'semiquavers',
-    'send/receive',
-    'sendings-off',
-    'senfl',
-    'sennett',
-    'sense-perception',
     'senss',
-    'sent-off',
-    'sentimentalists',
-    'septa',
-    'september-october',
-    'september/october',
-    'septum',
-    'serb-dominated',
-    'serc-funded',
-    'seren',
-    'serendipitous',
-    'serenissima',
-    'sergius',
-    'serialization',
-    'seroprevalences',
-    'serov',
     'serp',
-    'serums',
-    'serv',
-    'serviettes',
-    'sesotho',
-    'sestriere',
-    'setaside',
-    'settlors',
-    'seung',
-    'sevan',
-    'seven-a-side',
-    'seven-fold',
-    'seven-foot',
-    'seven-iron',
-    'sex-life',
-    'sex-mad',
     'sexology',
-    'seymour-ure',
-    'seyyid',
-    'shaba',
-    'shak',
-    'shakedown',
-    'shako',
-    'shallowest',
-    'shana',
-    'shandruk',
-    'shandwick',
-    'shannen',
-    'sharan',
-    'sharpton',
-    'shawlands',
-    'shawwal',
     'shearling',
-    'shebang',
-    'sheepfold',
-    'shelfolds',
-    'shepherdesses',
-    'shepshed',
-    'sherer',
-    'shermans',
-    'sheryl',
-    'shewing',
-    'shi\'a',
-    'shifter',
-    'shiftless',
-    'shingled',
-    'shintiyan',
-    'shirtfront',
     'shiseido',
-    'shit-scared',
-    'shoeshine',
-    'shokhin',
-    'shootin\'',
-    'shop-soiled',
-    'short-circuiting',
-    'short-story',
-    'short-toed',
-    'shortwood',
-    'shotokan',
-    'shoulderblades',
-    'shoveler',
-    'showcased',
-    'showell',
-    'showgirls',
     'showgrounds',
-    'showme',
-    'showpieces',
-    'shrestha',
-    'shrike',
-    'shubik',
-    'shuns',
-    'shyer',
-    'shyster',
-    'siang',
-    'sibomana',
-    'sicker',
-    'side-drum',
-    'siferwas',
-    'siglo',
-    'signy',
     'sihanoukists',
-    'siliciclastic',
-    'silkwood',
-    'silmarils',
-    'silvermines',
-    'silverpoint',
-    'silvestri',
-    'similar-sized',
-    'simmers',
-    'simplon',
-    'sinan',
-    'sindhi',
-    'sinecures',
-    'sinefungin',
-    'sinewave',
-    'sing-along',
     'singaporean',
-    'singeing',
-    'single-bed',
-    'single-board',
-    'single-chamber',
-    'single-family',
-    'single-product',
-    'single-purpose',
-    'single-span',
-    'single-word',
-    'sinless',
-    'sinnott',
-    'sirri',
-    'site-directed',
-    'sith',
-    'six-a-side',
     'six-months',
-    'six-times',
-    'six-wicket',
-    'sixth-former',
-    'sixty-year-old',
-    'sk210',
-    'skadar',
-    'skaller',
-    'skara',
-    'skew-symmetric',
-    'ski-lift',
-    'skiathos',
-    'skinless',
-    'skinnier',
-    'skip-sequential',
-    'skischool',
     'skit',
-    'skitter',
-    'skittishly',
-    'skogen',
-    'skokov',
-    'skullcap',
-    'skyways',
-    'sl4',
-    'slammer',
-    'slaters',
-    'slaty',
-    'slaughterer',
-    'slavicek',
-    'slavonian',
-    'sleat',
-    'sleeker',
     'sleevenotes',
-    'sleights',
-    'slenderest',
-    'slingshot',
-    'sloanes',
-    'slobbered',
-    'sloothaak',
-    'sloss',
-    'slow-burning',
-    'sludges',
-    'slumbered',
-    'smartie',
-    'smartstar',
-    'smelley',
-    'smit',
-    'smiting',
     'sml',
-    'smmb',
-    'smoke-screen',
-    'smokin\'',
-    'smoochy',
-    'snail-like',
-    'snap-shot',
-    'snappily',
-    'snaring',
-    'sniffles',
-    'sniffling',
-    'snifter',
-    'sniped',
-    'snl',
-    'snowdrifts',
-    'sobibor',
     'social-psychological',
-    'socio-historical',
-    'sociodemographic',
-    'sodas',
-    'sofa-bed',
-    'soft-focus',
-    'soft-porn',
-    'softwright',
-    'sogo',
-    'sojourns',
-    'sokoto',
-    'solana',
-    'solecisms',
-    'solemn-faced',
-    'soler',
-    'solicitor(s)',
     'solis',
-    'solow',
-    'somaria',
-    'somefink',
-    'somersby',
-    'somervillian',
-    'somnolence',
-    'sonauto',
-    'sondra',
-    'songbirds',
-    'songwright',
-    'sonorant',
-    'sonorously',
-    'sope',
-    'sops',
-    'sorps',
     'souljah',
-    'soundgarden',
-    'soundproof',
-    'soundproofing',
-    'sours',
-    'south-eastwards',
-    'southpaw',
-    'soviet-backed',
-    'sozialdemokratische',
-    'spanswick',
-    'spasmed',
-    'spawners',
-    'spawnings',
-    'special-needs',
-    'spee',
-    'speech-making',
     'speed-up',
-    'spen',
-    'spermatozoon',
-    'spielberger',
-    'spin-doctors',
-    'spine-chilling',
-    'spinneys',
-    'spiritu',
-    'spittler',
-    'splenetic',
-    'split-screen',
-    'spoilage',
-    'spoon-fed',
-    'sporozoites',
-    'sportier',
-    'spranger',
     'spratly',
-    'sprats',
-    'spray-painted',
-    'spring-like',
-    'springett',
-    'springhall',
-    'springiness',
-    'spritzer',
-    'sprott',
-    'sproull',
-    'spuriously',
-    'spy-flies',
-    'sq._km.',
-    'sq._m',
-    'sq.ft.',
-    'squeezer',
     'squeezy',
-    'squiggly',
-    'squishy',
-    'srb',
-    'sredni',
-    'srikkanth',
-    'srnicek',
-    'ss-20s',
-    'ss739',
-    'ssap9',
-    'staatssecretaris',
-    'stachys',
-    'stacy',
-    'stadt',
-    'staffa',
-    'stagey',
     'stairwells',
-    'stall-holders',
-    'stanced',
-    'stand-pipe',
-    'standards-based',
-    'stanfords',
-    'stansill',
-    'stanstead',
-    'stanwell',
-    'stapledon',
-    'star-crossed',
-    'starbuck',
-    'starkers',
-    'startin\'',
-    'startop',
-    'state-centred',
     'state-provided',
-    'station-masters',
-    'staunching',
-    'staving',
-    'stavros',
-    'steam-hauled',
-    'steamboats',
-    'steaua',
-    'steel-framed',
-    'steepens',
-    'steilmann',
-    'stellato',
-    'stem-loop',
-    'stepper',
-    'stereolab',
-    'stereotactic',
     'stevan',
-    'stevas',
-    'stewpot',
-    'sties',
-    'stiflingly',
-    'stigmatic',
-    'stigmatise',
-    'stijl',
-    'stili',
-    'still-warm',
-    'stim',
-    'stir-fried',
-    'stir-fry',
-    'stirlings',
-    'stjepan',
-    'stockier',
     'stollen',
-    'stoller',
-    'stoneham',
-    'stoneley',
-    'stonewalling',
-    'stop/go',
-    'stoph',
-    'storin',
-    'stormin\'',
-    'storrie',
-    'storyboard',
-    'stotler',
-    'stra',
-    'straggler',
-    'strathearn',
-    'stratiform',
     'streetfighter',
-    'stress-timed',
-    'strindberg',
-    'stringencies',
-    'stripboard',
-    'strived',
-    'strivings',
-    'strongly-worded',
-    'strongpoints',
-    'struan',
-    'stuart-smith',
-    'stuntmen',
-    'stup',
-    'stupendously',
-    'stupidities',
-    'sturgis',
     'sturm',
-    'sturmabteilungen',
-    'stutchbury',
-    'stylers',
-    'stylishness',
-    'stylization',
-    'stylometric',
-    'suarez',
-    'sub-category',
-    'sub-cultural',
-    'sub-divisional',
-    'sub-field',
-    'sub-file',
-    'sub-files',
-    'sub-layer',
-    'sub-lease',
     'sub-licence',
-    'sub-machine-gun',
-    'sub-region',
-    'sub-sale',
-    'sub-tenants',
-    'sub-titled',
-    'sub-topics',
-    'sub-types',
-    'subarachnoid',
-    'subclause',
-    'subfamilies',
-    'suboesophageal',
-    'subpentagonal',
-    'subregions',
-    'subsample',
-    'subtended',
     'subterania',
-    'subtractive',
-    'succulents',
-    'suffragists',
-    'suffusing',
-    'sulci',
-    'sulfasalazine',
-    'sulphated',
-    'sulzberger',
-    'sumer',
-    'summerhall',
-    'sunbelt',
-    'sundae',
-    'sundials',
-    'sundridge',
-    'sunfish',
     'sunhat',
-    'sunscreem',
-    'super-efficient',
-    'supercooled',
-    'superfields',
-    'supergravity',
-    'superplan',
-    'supersoft',
-    'superswim',
-    'supertankers',
-    'supervening',
-    'supplicants',
-    'suppo',
-    'suppressant',
-    'supremacist',
-    'suprise',
     'surface-charge',
-    'surinamese',
-    'susman',
-    'suspensory',
-    'sussman',
-    'susu',
-    'sutherlands',
-    'suttles',
-    'suzanna',
-    'sveshnikov',
-    'svr4-based',
-    'sw1e',
-    'swampland',
-    'swan-song',
-    'swanley',
-    'swd',
     'sweat-soaked',
-    'sweet-faced',
-    'sweetmeat',
-    'swim-bladder',
-    'swindlers',
-    'swisher',
-    'swotting',
-    'swshas',
-    'syll.',
-    'syllabi',
-    'symbolization',
-    'syncopation',
-    'syncretic',
-    'syndicats',
-    'syndics',
-    'syndiotactic',
     'synergistically',
-    'syston',
-    'sz',
-    'sz&eacute;chenyi',
-    'szulc',
-    't.b.g.a.s.',
-    't6',
-    'tabai',
-    'table-toppers',
-    'tableland',
-    'tabner',
-    'tacis',
-    'tacul',
-    'tahir',
-    'tahitian',
-    'taigh',
     'tail-wagging',
-    'taildragger',
-    'taillebourg',
-    'taiyo',
-    'takahashi',
-    'take-out',
-    'talked-about',
-    'tallichet',
-    'tallon',
-    'talman',
-    'talus',
-    'talvace',
-    'tamanrasset',
-    'tamarin',
-    'tambay',
-    'tambours',
     'tamp',
-    'tanagra',
-    'tandberg',
-    'tandems',
-    'tangency',
-    'tankbusters',
-    'tankerville',
-    'tant',
-    'tapeworms',
-    'tapirs',
-    'taravad',
-    'tarbet',
-    'tarentaise',
-    'tarentum',
-    'tariff-free',
-    'tarnishing',
     'tarrow',
-    'tartare',
-    'tarted',
-    'tattenham',
-    'tatties',
-    'taupe',
-    'tavar&eacute',
-    'tax-cutting',
-    'tax-paying',
-    'taxidermy',
-    'tazmamert',
-    'tch',
-    'tdca',
-    'teachable',
-    'teacher-librarians',
-    'team-work',
     'teannaki',
-    'techdoc',
-    'tedrow',
-    'teebane',
-    'teensy',
-    'teenybop',
-    'tefl',
-    'telecottage',
-    'telefonos',
-    'telephone-box',
-    'teleport',
-    'teleprompter',
-    'tella',
-    'tempa',
-    'temporariness',
-    'ten-acre',
     'ten-gallon',
-    'ten-shilling',
-    'tenantry',
-    'tenners',
-    'tenniel',
-    'tenzing',
-    'teodoro',
-    'tern-like',
-    'terracottas',
-    'terrazzo',
-    'terrena',
-    'tetrathlon',
-    'teulon',
-    'thadeus',
-    'thames-side',
-    'thameside',
     'thank-offering',
-    'thans',
-    'thapar',
-    'theatre-goer',
-    'theophile',
-    'theopholis',
-    'theoretic',
-    'theos',
-    'theravada',
-    'theremin',
-    'theres',
-    'therma',
-    'thermo-nuclear',
-    'thesis-derived',
-    'thessalonians',
-    'thetis',
     'thimbles',
-    'thingybob',
-    'third-',
-    'thompson/reporting',
-    'thorning',
-    'thornley',
-    'thorsons',
-    'thought-starters',
-    'three-layer',
-    'three-litre',
-    'three-masted',
-    'three-ply',
-    'three-to-one',
-    'thrombocytopenia',
-    'thruxton',
-    'thubron',
     'thuggish',
-    'thuilm',
-    'thule',
-    'thymectomy',
-    'thyroiditis',
-    'thyroxine',
-    'tichka',
-    'tickler',
-    'tickner',
-    'tickover',
-    'tie-dyed',
-    'tijuana',
-    'tilapia',
-    'tillson',
-    'tillyer',
-    'tilston',
     'time-cue',
-    'time-life',
-    'time-limits',
-    'time-of-day',
-    'time-servers',
-    'time-warp',
-    'timekeeper',
-    'timo',
-    'timon',
-    'timpson',
-    'timu',
-    'tin-mining',
-    'tin-opener',
-    'tindall',
-    'tinguely',
-    'tinpot',
     'tippling',
-    'titley',
-    'titties',
-    'tjerssen',
-    'tlc',
-    'tmc',
-    'tmos',
-    'tnp',
-    'toadflax',
-    'tobermore',
-    'todmorden',
-    'tof',
-    'toffee-nosed',
-    'toma',
-    'tomates',
-    'tommie',
     'tonchan',
-    'tone-colour',
-    'tongjiang',
-    'tonguing',
-    'tonsillectomies',
-    'toogood',
-    'toons',
-    'toothcomb',
-    'toothsome',
-    'top-grade',
-    'top-line',
-    'top-ranking',
-    'top-to-toe',
-    'topolski',
-    'topsides',
-    'torbole',
     'torchlit',
-    'tormore',
-    'torquil',
-    'torridonian',
-    'tortoise-shell',
-    'torturous',
-    'totes',
-    'touchpaper',
-    'toumani',
-    'toure',
-    'tourelle',
-    'tournier',
-    'towa',
-    'towerbell',
-    'townland',
-    'townlands',
     'toxicodendron',
-    'toy-boy',
-    'tp280',
-    'tr6',
-    'tracheoles',
-    'tractions',
-    'tractrix',
-    'tragi-comedy',
-    'trances',
-    'tranent',
-    'tranny',
-    'trans-pacific',
-    'transactors',
-    'transcaucasus',
-    'transepithelial',
-    'transexual',
     'transfectants',
-    'transfered',
-    'transgresses',
-    'trapezes',
-    'treblinka',
-    'tremadog',
-    'trembly',
-    'tremezzo',
-    'tremlett',
-    'trencher',
-    'trendiness',
-    'trevarthen',
-    'treves',
-    'tri-club',
-    'trialist',
-    'tribout',
     'triceratops',
-    'trichostrongyloids',
-    'trico',
-    'trilbies',
-    'trinians',
-    'trinidade',
-    'trinitro',
-    'trioxide',
-    'triply',
-    'tripper',
-    'trisodium',
-    'trivialises',
-    'trivialize',
-    'trivulzio',
-    'troglodytes',
-    'troubleshooting',
     'trovatore',
-    'trowark',
-    'trps',
-    'truckload',
-    'trumbull',
-    'trunking',
-    'tryggvason',
-    'tsedenbal',
-    'tseng',
-    'tserenpilyn',
-    'tsm',
-    'tss',
-    'tsug',
-    'tsunami-based',
-    'tsutomu',
-    'ttd',
     'ttp',
-    'tuberculous',
-    'tuberous',
-    'tudeh',
-    'tuffin',
-    'tukalo',
-    'tullock',
-    'tuma',
-    'tune-up',
-    'tuppeny',
-    'turberville',
-    'turbos',
-    'turfs',
-    'turkington',
-    'turman',
-    'turnhouse',
     'tuva',
-    'tver',
-    'twas',
-    'twelve-year-olds',
-    'twh',
-    'twinhead',
-    'twitter',
-    'twizzle',
-    'two-acre',
-    'two-bit',
-    'two-fingered',
-    'two-in-one',
-    'two-ply',
-    'two-processor',
-    'two-room',
-    'two-roomed',
     'two-user',
-    'two-word',
-    'two-yearly',
-    'tyner',
-    'tynesider',
-    'tynesiders',
-    'typographer',
-    'tyrannous',
-    'tyre-tracks',
-    'tzannis',
-    'tzarina',
-    'u-series',
-    'u.k',
-    'u.s.c.',
-    'u1',
-    'ual',
     'uaps',
-    'uapt',
-    'uda/uff',
-    'udal',
-    'uderzo',
-    'udine',
-    'ueda',
-    'ugolini',
-    'uh-uh',
-    'uhtred',
-    'ulimwengu',
-    'ulloa',
-    'ulsterbus',
-    'ultra-left',
-    'ultra-thin',
-    'umtata',
     'unabridged',
-    'unani',
-    'unbuilt',
-    'unchallenging',
-    'unchartered',
-    'unchaste',
-    'unchurched',
-    'unclip',
-    'unconquered',
-    'uncountable',
-    'unctc',
-    'under-23',
-    'under-educated',
-    'underdown',
-    'underperformance',
-    'underperformed',
     'undersize',
-    'undersold',
-    'underspend',
-    'understating',
-    'undervaluation',
-    'underwired',
-    'undistributed',
-    'undrained',
-    'undreamt',
-    'undyed',
-    'unembarrassed',
-    'unexcavated',
-    'unexecuted',
-    'unexplainable',
-    'unfed',
-    'unflustered',
     'ungloved',
-    'ungovernability',
-    'unhorsed',
-    'uninsurable',
-    'unintelligibility',
-    'unipalm',
-    'unius',
-    'univers',
-    'univocal',
-    'unix-like',
-    'unlawfulness',
-    'unlettered',
-    'unlighted',
-    'unmeasurable',
-    'unmerited',
-    'unmistakeably',
     'unoperated',
-    'unpractical',
-    'unpractised',
-    'unproblematical',
-    'unremunerative',
-    'unrepaired',
-    'unrighteous',
-    'unrounded',
-    'unruh',
-    'unsaddling',
-    'unseating',
-    'unshaken',
-    'unshockable',
-    'unsorted',
-    'unstaffed',
-    'unstall',
     'untag',
-    'untaught',
-    'untraced',
-    'untransfected',
-    'untranslatable',
-    'unwinnable',
-    'up-and-over',
-    'up-dating',
-    'up-graded',
-    'up-tempo',
-    'upf',
-    'uprate',
-    'upsides',
-    'upsilon',
-    'urie',
-    'urologists',
     'urraca',
-    'ursell',
-    'urwin',
-    'us&dollar;40,000',
-    'us&dollar;50,000',
-    'us&dollar;700',
-    'us-japan',
-    'us-plo',
-    'us-russian',
-    'usgs',
-    'ushant',
-    'uspca',
-    'ussher',
-    'usurpers',
-    'utley',
-    'uvedale',
     'uz&egrave;s',
-    'uzuncarsili',
-    'v.c.h.',
-    'v.p.',
-    'vacillated',
-    'vaill',
-    'valar',
-    'valda',
-    'valencies',
-    'valente',
-    'valerian',
-    'valeting',
-    'validations',
-    'vallee',
-    'vallisneria',
-    'vallon',
     'valmorel',
-    'value-judgements',
-    'value-system',
-    'vanier',
-    'vaquita',
-    'varese',
-    'varvara',
-    'vassall',
-    'vat-registered',
-    'vater',
-    'vaude',
-    'vaulter',
-    'vaw',
-    'veljko',
-    'velodrome',
-    'vember',
     'venantius',
-    'venera',
-    'ventadour',
-    'venusian',
-    'verbals',
-    'verificationism',
-    'verres',
-    'verruca',
-    'vevay',
-    'veysey',
-    'vhws',
-    'viale',
-    'vice-convener',
-    'viceroys',
-    'vicomt&eacute',
-    'vier',
     'viewings',
-    'vigno',
-    'vikram',
-    'villepoix',
-    'vinall',
-    'vincey',
-    'vincula',
-    'vinicio',
-    'vining',
-    'vintner',
-    'viollet-le-duc',
-    'violon',
-    'violons',
-    'vishwa',
-    'vishwanath',
-    'visitorial',
     'visored',
-    'vj',
-    'vliet',
-    'vneshekonombank',
-    'vocationalism',
-    'voice-activated',
-    'voir',
-    'volcans',
-    'volkova',
-    'volks',
-    'voord',
-    'vorster',
-    'vortai',
-    'vorticity',
-    'vouching',
-    'vrai',
     'vredeman',
-    'vsa',
-    'vsi',
-    'w.e',
-    'w11',
-    'w1a',
-    'w1m',
-    'w1x',
-    'w9',
-    'wadland',
-    'waffen',
-    'wagg',
-    'waisted',
-    'waitressing',
-    'wajed',
-    'wakeford',
     'wakenings',
-    'walcot',
-    'waleses',
-    'wall-hangings',
-    'wanta',
-    'war-like',
-    'warburgs',
-    'warc',
-    'warm-weather',
-    'warnke',
-    'warrener',
-    'washin\'',
-    'washy',
-    'wasserman',
-    'waste-to-energy',
-    'wasteground',
     'watch-chain',
-    'waterbed',
-    'waterers',
-    'waterholes',
-    'watermans',
-    'watter',
-    'watters',
-    'waxman',
-    'way-out',
-    'waymarks',
-    'waypoint',
-    'wc2a',
-    'wc2h',
-    'wda',
-    'wdcs',
-    'weak-willed',
     'weatherboarded',
-    'weathershield',
-    'weathervane',
-    'weeble',
-    'weekender',
-    'weelkes',
-    'weintraub',
-    'weka',
-    'welfarism',
-    'welfarist',
-    'well-articulated',
-    'well-diversified',
-    'well-funded',
-    'well-manicured',
-    'well-matched',
-    'well-muscled',
     'well-recognised',
-    'well-remembered',
-    'well-schooled',
-    'well-travelled',
-    'well-turned',
-    'well-wisher',
-    'wellfield',
-    'wellings',
-    'wellman',
-    'welsby',
-    'wenham',
-    'werth',
-    'westburn',
-    'westerham',
-    'westmount',
-    'westside',
     'wfl',
-    'wfrp',
-    'wgol',
-    'whads',
-    'whalby',
-    'whale-watching',
-    'wharfs',
-    'whatham',
-    'wheaten',
-    'wheelies',
-    'wheelspin',
-    'wheresoever',
-    'whiny',
-    'whipps',
-    'whitecaps',
-    'whited',
     'whitethroat',
-    'who-ors',
-    'whorl',
-    'whr',
-    'wicked-looking',
-    'wickerhamii',
-    'wickford',
-    'widely-read',
-    'wider-ranging',
-    'wife-to-be',
-    'wiggen',
-    'wiggs',
-    'wild-goose',
-    'wildcard',
-    'wilderspool',
-    'williamsburgh',
     'willow-pattern',
-    'win-win',
-    'winans',
-    'winchell',
-    'windham',
-    'window-cleaner',
-    'windowpanes',
-    'wine-producing',
-    'wine-tasting',
-    'winfrey',
-    'winterson',
-    'winyard',
-    'wip',
-    'wirth-miller',
-    'wish-list',
-    'witch-hunts',
     'witchdoctor',
-    'with_relation_to',
-    'withernsea',
-    'witherspoon',
-    'witton-le-wear',
-    'wizdom',
-    'wledig',
-    'wodge',
-    'wolfensberger',
-    'wolfishly',
-    'wolfline',
-    'wolfqueen',
-    'wolpe',
-    'womble',
-    'wonderin\'',
-    'wonted',
     'woodblock',
-    'woodsman',
-    'wooton',
-    'worcs.',
-    'word(s)',
-    'word-book',
-    'word-by-word',
-    'word-order',
-    'word-superiority',
-    'wordsearch',
-    'work-rate',
-    'workaholism',
-    'worke',
-    'workless',
-    'world-beater',
-    'wormery',
     'worried-looking',
-    'woul',
-    'wowing',
-    'wozzeck',
-    'wracking',
-    'wranglers',
-    'wrc',
-    'wrestles',
-    'wrestplank',
-    'wringer',
-    'wrinklies',
-    'write-in',
-    'writhes',
-    'wsp',
-    'wuhan',
-    'wunderkind',
     'wurzburg',
-    'wvs',
-    'wylye',
-    'x-25',
-    'x11',
-    'xa/r',
-    'xb5',
-    'xe',
-    'xen',
-    'xtradrive',
-    'xxxi',
-    'xxxvii',
-    'yahaya',
-    'yahya',
-    'yancey',
-    'yavan',
     'yawl',
-    'yaws',
-    'yds.',
-    'yeasty',
-    'yeates',
-    'yee',
-    'yellow-haired',
-    'yes-man',
-    'yobbo',
-    'yogis',
-    'yongbyon',
-    'yoo-hoo',
-    'yoof',
-    'yop',
-    'yorkshire-born',
-    'young-old',
     'yourn',
-    'yowling',
-    'ysbyty',
-    'yuccas',
-    'yuen',
-    'yz',
-    'yzordderrex',
-    'z\'s',
-    'z+',
-    'zafferana',
-    'zaitsev',
-    'zane',
-    'zanetta',
-    'zapata',
-    'zarina',
-    'zauberfl&ouml;te',
     'zea',
-    'zeeland',
-    'zeeman',
-    'zeffirelli',
-    'zeigler',
-    'zelan',
-    'zennor',
-    'zephro',
-    'zetor',
-    'zhongguo',
-    'zinzan',
-    'ziolo',
-    'zirconium',
-    'zirnheld',
-    'znf33b',
-    'zombis',
     'zoot',
-    'zorro',
-    'zovirax',
-    'zsl',
-    'zugdidi',
-    'zwehl',
+)
+
+blocks_16 = (
+    '",gr;-granules$+ave_la_mode")mp;frac12"4st&ast&ast&ast&ast;l!4bgr;-mercaptoethanol!*commat;now!%deg;f"*ollar;0.09*"12+!3+!4+!9*"23*"35+!7',
+    '(%1,250)#.43*"72+!6)$0.2m)%1,000*#.1m*!0+$,000+!m)$2.3m+"5m*"0m*%5,000)#60m',
+    '*#400)".2*!4*!7*!8)*00,000,000)&25,000)"40))5,000,000)!7)%8,000*"5m($3.6m*"8m))0,000,000',
+    ')#50m(%4,700))0,000,000)"1m)"5m(#5.5)"50($6.3m))0,000,000(#7.5*"6m*"8m)"0m)#50m($8.5m',
+    '!)ecirc;tre!)formula;2)"th"*rac14;inch("pt%%58;in!%ggr;-"#t;3$!5!$half!%infin!$lt;1%!0$!3!(mdash;as',
+    '\'!i\'#one\'"to"\'gr;g/ml"0icro;mol/hour/10!(ndash;10!,pound&frac12\'+pound&pound&$;0.5*!m\'%1,900(#.15)(3million)"59*\'million',
+    ')!3(#10m($2.5m)"00)"5m)!7($3.5m)!1(%4,500)!1("62)!8("71(#80m)"5m',
+    '(\'billion\'$2.20)"35)#5bn*\'million)"65)"70)"9m(000&ndash;300,000)!8)"bn($1.50)%0,000)!6($2.95',
+    ')$,500)#.50)"0m(.5&ndash;35,000)#.95(&60,000\'$3.1m)"45)"79)!9(.0&ndash;50,000)#.00)!5(%1,000)!2',
+    '("45($7.50\'%4,400)#600(#.1m)!2)!3)"45)!6(.0&ndash;60,000)1,000&ndash;60,000("10($2.50)%5,000($3.50',
+    '($4.95(%6,000(&820.27\'%5,200(#.4m)!6*!m("10("30($4.80)!0("6m("70\'#6.2)"8m',
+    '("99\'#7.2)"49(#000("8m\'080&ndash;120,000(!3("5m(%6,000\'$9.5m(#000*!m("20(!4("5m',
+    '("95)!9!-scaron;ibenik #\'81!#all"&ndsome"$rdly"!t!#coz!"d\'!"if!"my!"oo!$this!&usband',
+    ' $*177!#for!$held!&member #+30!!m #-12"!4!#300"!5!!7"!1!!8"!0!(carotene',
+    '!#fos!!i"!s!$just!*oestradiol!&shaped##eet!$test #/f/!!i!!k!$mmol #0,1!&.1&ins#!3',
+    '#!9#!m""20#!7""41#!8""52#!4#!7#!m""67#!8""72#!8#!9',
+    '""92#!7!%0.00z"#:28#"30!#279!#304""40#!4""92!#534!#705!,81&ndash;661""92!#920',
+    '""52!#:02 +1&frac12;lb"(ndash;30(!9"+shilling;6d!!\'!#(b)!!+!",0"#1,1#&00,000"!3"#450"%500ft',
+    '"$year!#.01#!3#!4#!7"#1.4""24#!9#"gb"#3.9""49""53"#6.1$!2#!6',
+    '""83!#/27"!n!+0&ndash;100*!6)!2)!3)!9"#(4)"#-20"#.03#"19#$20am$!2$!6',
+    '#"7%"#/30"+0&ndash;150#!2#!7#"lb#$mbps""11""21#!9#"nd"%3,000""52#!4#!8',
+    '#!1#!2""76""87#!8"&am-4pm"!c""kg""mb$"ps#"hz!*1&ndash;17"!+"#-16"#.18',
+    '#"9%""07#!m""21#!3#!8""41#!3#!5""51#!8""61#!2#!4#!8',
+    '"#80s#!2"!d""oz!%2-man"#.25#"4%#"50#"7%#"95"#0cm#"mm$"ph""33""42',
+    '#!9!%3&ins"".0#"2%#"4%""0p""44""52#!7"#60s#!6""74""89""92""mm',
+    '!(4&frac12"#(4)"#.2%#"6%#"7%#"9%""05#!6""24#!5#!8""39""45""51"$70/1',
+    '#!9"#e-3""lb""mm!$5&ft#)ndash;20%)!6)!7"),000-word""-4#&a-side#$mile"".0$!0#"5%',
+    '"+0&ndash;200#"cm"!b""in""lb!#6\'s"#-20"#.6%#"9%"*88&mdash;9"!b"!h""st!)7&ndash;1)!2',
+    '"".0#"2%#"3%##5pc"(0&sol;83!*8&ndash;22*!5"$,500"%-inch"#.2%#"6%#"7%"&/10/93"*70&ndash;1#)2&ndash;3',
+    '!$9.00"+06&ndash;24"#10s#*4&ndash;15"*20&ndash;1#)2&ndash;3#)5&ndash;6#)8&ndash;9"+30&ndash;31#)1&ndash;3,!2#)2&ndash;3#)4&ndash;5"*43&ndash;4#*6&ndash;47',
+    '#*8&ndash;49+!9"+54&ndash;55#)6&ndash;7"+60&ndash;73#)1&ndash;2#)2&ndash;3#$4/65#)7&ndash;8#*9&ndash;74"$75/6%"76#)6&ndash;7#$9-81"*80&ndash;9',
+    '#)3&ndash;7$#-84#)5&ndash;9$#-86$!c#"9e"\'90/1991#&1-2000##2\'s##5/6""s.!#:12!-cm/&frac12;in!"er!!o',
+    '!"pt!"x1 %2&deg"(ndash;3%(!7()8&ndash;0"(shilling!+,000-strong%!m!+.0-on-intel#!5#!i""3m""41#!7',
+    '#"mm"#6.2$!4"#7.0$!1#!4#!m"#8.3"!x!$0&ft#%mgr;m"#(2)"#-23#)month-old"!.',
+    '"(0-strong#"km""12#!3"!c""kg!\'1&deg;c##ins#(ndash;10*!6"#(2)"$-day"&.10.93#"3%#"4%',
+    '!(20&deg;c#!p"$2(1)""pc!*3&ndash;24*!5)!4"\'-member"!.#"1%""9p!*4&ndash;25"+-hour-a-day\'!s"!.',
+    '#"6%!*5&ndash;31"".2#!6#"9%"(0ml/10fl!)6&ndash;3*!0"#.4%""0p!#7.1#!3$!%#!4#!6',
+    '"$-day"".1$!%#!4#!9"%5,000"!g!$9-31"".7""pc!#:15"!2#!0!"ab!#f10',
+    '!$secs!!u!"x2 \'3&deg;c"*frac12&ins\'!4"(ndash;10)!1("30("4%!",4"#813!%-hour"$inch"$star',
+    '$!5#!6#!9""33#!p""6m!"/3!-0&ndash;70mph"&-month##odd"".1""0%""kg""lb""s.',
+    '""74"!p!)2&ndash;3"".2#!5#"9%"$6326"!k!*4&ndash;38"#(1)"".5!*5&ndash;44"".8"#/36"#0th',
+    '"!m!&6-hour"".4#!8"#598"#815#"22"#905""s.!#7.8$!%"#025#"33#"53"#108',
+    '#"23$!6#"81#"94"#201$!2#"12#"44#"58#"66#"74"#304$!7#"16#"80',
+    '#%90-91"#449#"67#"75"#536#%49-50#"52"#613#"24$!5#"53$!4"#710$!4#"28',
+    '#"62$!7#"70#"82#"95"#800#"41#"69#"73#"88"#913$!7#"22$!4$!5',
+    '$!9""mm!$8.1%#!8"#002"#101$!3$!7#"11$!5$$6-17#"22#"43#"52$!3',
+    '#"60$!1"#200$!1$!9#!2#"87#"94$!7"#354$!7#"79"#406$!7"#518',
+    '#"98"#726#"40#"77#"82"#822$!5#"38#"55"#913#"25#"31#"42""pc!$9170',
+    '!"do!!e!!l!!v!!x *4&ndash;11()4&ndash;2()6&ndash;0!"+5!$-bit"$fold!$.2.4#!3""32"#4.3',
+    '!#0\'s"%-7592#&member""0%"!c"!k!"1p!$2.5%""00!$33/l"!p!#4.2#!6""0m!#50s',
+    '!#7.2#!5"%0,000#!0"$4864!#9.3#!5!$tbsp""hs (5&frac34"(ndash;15"(times;10!!+!$,400!"-9',
+    '!\'.139(1)""22#!7"#3.5#!1#!3#!5#!7""75!+0&ndash;60%""-1#&strong"".5"&0-akce#!e',
+    '#"sl""cm!$1(1)"".5#!7""00!$3/54!"4p#!c!*5&ndash;59!#6.7"#mph!#900"!5"!p',
+    '!#ins!"qy *6&ndash;18!"-9"$iron"(year-old!%.15pm"#2.4#!6#!8"#3.3$!4#!1#!3#!4',
+    '"$45pm"+5&ndash;6.8#!0!"0+"(-cm-wide""0f#"mp"!7"#cms!#2.5!$3(2)!%50222"!7""ft!%6,000',
+    '!%7,000!$8030!"98!"df!"pc $7&ft!#(6)!$,400"#600!%-iron!$.2.4$!5""40"#5.1$!2',
+    '""7s!42&deg&ndash;76&deg;f"%-hour""00"!8!\'4&deg;f"!2"!4""7s!*5&ndash;80".0g/1&frac12;lb"!6!*9-year-old!#c11!"km',
+    '"#700!"-2"!4!%.00pm""14#!8"#3.2#!5"$45am""50#!5!)0&ndash;1"#(a)"#0th"%486dx',
+    '"!a!"16"!8!%2,000"!4"!6!*3-year-old""0s!%4,000")-year-old!#500"!3"!6!*6-year-old"!1',
+    '!*7-year-old"!2"!8"!p!"87!$9(1)"&3/1488""th!"gb!$inch!#mhz!#ozs!"st *9&ndash;14!\',600bps',
+    '""21""99!#/10!#002!%1,000"!4"!9!%2,000"!p!"31"!4"!p!%4,000"!8"!a',
+    '"!2"!3"!4"!6""pc!#800"!3"!4"!9"!p!"93"$9999"#mhz!"ea!"ju',
+    ' $a-12"!2"!e"&tracts##ype"!x!#.2d")agassizii"$d.c.""k."$p.f."$r.r.!"/g!"10!#420',
+    '!#689!"=1!$a/tt!(basement"&berton$%ylink#"ie")del-karim#!i#\'ominals"#edi#"ll#%ndana#&rdovey$#fan',
+    '"\'horring"\'khazian"$odes#(ve-board"&ramson$&sively($ness"&sinthe#\'tractly#&urdist"\'usively!"c2"&ademie""ce$\'ss/visa',
+    '#\'ordions"&erbity$!s#+tylcysteine")hiltibuie#(ondrites"$kers#,nowledgments"(quitting")tualizing",upuncturists!%dabas"%d-ins#)enbrookes"0enotonsillectomy',
+    '"+judications"#lai"$min."%olphe#$ptee\'!s"(roitness")ults-only"+venturously!"ef"&rating"\'theling&#ric!(farensis"*orethought',
+    ')#orn$&kaaner#"os"+ter-thought%&market%(thoughts#"on!&ge/sex#$gate")gressions"\'istment#!t$\'ational""ms""no',
+    '"&ricola#+o-chemicals%*industrial$&nomist!\'hlbergs"$madi#&edabad"(uramazda!$iden$"rs"!p"\'r-tight#\'freight#%stone#$well',
+    '!#kai#$waio"#ira!*l&egrave;s"\'-anbari#$liwa#$murr#%ra\'uf%$zzaq"#awi"$cine##lad#&onbury"%dates#\'ersgate',
+    '"\'ehouses##ssi"\'gonquin"(ienistic"$kane")l-british$(european$%girls$$seat#(base/sql#"er%%genic$&viates$"yn#&ington',
+    '#)ocatively$$dial$&grafts$\'purinol#$port"&ma-ata"$nico"$onso"%pines"!r"\'sopahok")tarpieces#\'naharra"\'vingham!#mah',
+    '#%retto#+teurishness#%zonas"*bidextrous",erican-based(\'isation##thi"#iri"!l""ma$%nford"%nisos",plifications"!t"\'ygdalin',
+    '#%conda##din#\'lysable#(rchistic"+cien_regime##ram"\'dokides##uze")ecdotally"&gelico##lic$(o-jewish&&soviet"\'hydrase"%klets',
+    '"&namite#&enberg$\'xations#\'oyances#!s"#och##mic#"n.".tero-posterior#!h$-ropologically(&metric#-i-abortionist&%geing%)bacterial',
+    '%#cd8&%hrist&-onstitutional%)darwinian%&freeze&"ur%*lesbianism%%monde%)narcotics%$pope\')rnography%\'racists&\'oyalist%&semite%\'vietnam',
+    '$&freeze$#ope$$phon%&rotons$*quarianism#%onius"%urans#$vver"#zus!"p1"%atite"&hasics#"ra",pendicectomy\'"ng',
+    '%$cart%$ford%$wick$0ication-specific("or#"ro%$ach.(\'ability%*priability"#ton""us!-rab-americans"&cadius#)haeologia$%elaos',
+    '%/tecture-neutral$&onship#*ivescovile#$tica#$uate"&deshir#\'kinglas#$nave##rey"\'ea-wide##ndt"*gillaceous$$nine##osy"\'ivegaig',
+    '#%hanes"0menia-azerbaijan#%holes"\'noldian""os"\'riviste"(terioles#$hurs#&ifices$%stici#&lessly"$uban!%s-yet"(certains"#dic',
+    '"%inine"#key"$lant"$opos"*pirational"%sarts$$ying#%heton#(imilable(%tions$#ter#\'onances#%urers"$tell!"t3',
+    '""ns"$opic"&razine"%talli#/ention-grabbing%&uating$$veld##une"(ypically!,uburn-haired#"yn"\'cuparia")daciously#*io-lingual%&metric',
+    '"%klets"%ltbea"$mery"#que"%rally##iga#,ora_borealis"*scultation"(to-focus$(antibody$*cratically$&logous$,radiographic$!s%%trada',
+    '!)we-struck!\'xeheads!)yatollahs"#les""ob!#zam"%eglio"\'imuthal""ra \'b&amp;c&!g"(ndash;25"(ouml;hme")uuml;rger!#.2s',
+    '""l.!"10!$6700!)abbington#%ycare"*chelorhood#\'k-dated%\'streets$$beat$\'handers$$ings$$nong$$rest#(terially\'%cidal',
+    '$!p"%ddiel#(en-baden##ged#*stoneleigh"$gram#&uettes#$well"$hasa#+nhofstrasse""ia#&gneuse""ja"#kst"#lak',
+    '$#ton#$chin#\'derdash#&earics#\'lantrae$%echin$&inluig$$park$%ybeen#%samic"\'mpfylde"%ndana%\'ranaike$$ings#$eful',
+    '#!i#"ja#%khead#%nside"&rabbas$"ma#(barously$#osa#%chans#&dolino$$well#%eness##gee#$ingo#$nala',
+    '$(oldswick$%swick$$yard#)rack-room$$etts#&samian$#tow#(tenstein%%stree##ycz")s-reliefs#$ally##hes#!i$#nal',
+    '$"s.#&ketful#$nett#%setja$(ingbourn$$wood#(tardised"(tchworth#$hmat#&tarbee$+le-hardened\'%weary&%group&$ment&"rs',
+    '"(verstock"$ylis##nes"%zarov!$bc-2$!b"!d"!l!"cm""om!)eachfront%#ing#%dwork#&ten-up$#son',
+    '#(ver/jane"$beto""co#\'querels#$uase"%dbugs#\'dgelert#&eviled")echenhill#\'featers$#ing##jay#%rbaum"#got"$head',
+    '"&lfries#%gique#)lahouston$\'erophon$$otto$%shill$#ugi#)orussians"%mpton"(nedictus##ham##nis#$sons$$tead#%tleys',
+    '"(orhtwald"$razi#$bers#)eavements#&ggruen$"in$\'schrund#&keleys$(hamstead#\'mingham#%nheim#"on#$rill#$tone#-wick-on-tweed',
+    '"\'ssbrook#&t-laid"+ta-blockers#&novate"\'uningen"$vels"&wdsley##man",xhill-on-sea!$f109""ss!"ha##bha"#eki"$imji',
+    '!)i-lingual""bi#\'lically"&ckford"%d-ask#$dies#&entata"%erley"%filar#$ocal"(g-budget#,gest-selling##sby")jlmermeer"\'lharzia',
+    '$$iton$%ykins"\'monthly"&nfield#)ge-eating##ney")o-medical#,availability#\'graphia#$life#\'physics##rad#)synthetic#.transformation"&rdlike',
+    '#"ss#(th-place"*shopsgarth#&tables"$trex#"te$#ner!,j&ouml;rling"&ornbye!$l-29"*ack-necked%&/white%&balled%#fly%%hurst',
+    '#%nkley#(spheming"&eakley#%eders$#ped#%nched#(ssedness#$uler"\'ickling##nky#)steringly"%onder#(odhounds%&sports%&wealth',
+    '#(w-drying%#ups##xam"(ubbering#&etooth#"me##nts"!y!/oarding-schools#*t-building$%swain"\'bsleigh"$ccia#(khampton"$dden',
+    '%&weight$!."&geymen#"gs#%omils#%uraev"%hinen"\'iotians#"se$(terously"&kharas"#les#!o"(mbed-out")n_appetit',
+    '#"ce#)d-holders$&holder##gos#\'neville#$orum#$tang"&o-boys#$cock#(k-buying%&keeper$%funds$%lists#%leans#%tlace',
+    '"(rdighera#$ings#&n-deaf$$eman$$holm#%stals#"th"\'tterill$&ingley$/om-of-the-table&#ore$!y"#uch#&dariah$$icca',
+    '$#uer#%ldery%#ing#"rj#$tsen"$veri$!y#&ingdon"&w-wave#!d$(/swindon#%erman#$fell#$sher"$xin\'',
+    '"#yds!+r&uuml;ggen"!2"/aban&ccedil;ons#+dford-based$#nam#,gan&ccedil;a#$iley$\'n-child&(storming#%msche#\'ncepeth$$dish$$ford$"ta',
+    '#$wley"(eadfruit$*kfast-room#&cchias$%htian##dda#!f#$mann#&nchley#&slauer#%viary"\'icknell#$dgit#$gand\'#age',
+    '#\'lliants%!o#\'mscombe#(nk\'s-mat#)stleworms%!o##tag"(oadcloth%%marsh%$ness##chs$$kley%%ville#$iler#*ken-backed',
+    '#(nchioles&"us$(t&euml;s#\'odiness$%kings#-qui&egrave;re#%wnlee"%ummel!%s2000"!s!"t1!$ubka"3ckinghamshire-based"+dget-priced"#eno',
+    '")ilding-up"%lford#%keley#)l-leaping$#ard$$frog$$horn$%y-boy#$well"%nhill#$king"#oux"\'rbridge#\'ckhardt#"en',
+    '$"in#$kill%$nabe#%matex#%nhill$%twood"&s-load#&he-fox#.iness-oriented#%loads##man"%tland#"or#\'terfill&&scotch',
+    '#$yric"$yin\'%$g-in!"vc!&y-ways"%field"%ronic"+te-oriented"&waters .c&aacute;ceres#$mp;l"+eacute;dras!%-cube"+myc-induced"$type',
+    '!!/"#c++!"86!)ab-driver#\'estainh#.inet-committee(%level(&makers+#ing\'%maker#%otage""ck"-daqu&egrave;s#%enzas$!r',
+    '#(wallader#!y"$elia#$sura"+hervillahow"%lange#!c$\'ineurin#&darium$$icot#$edon#$lard#$omel"\'mp-fire$&omanes',
+    '"+nary-yellow$%veral#&berras#(cellable#(delabrum$$idal$(le-flame$\'y-floss&\'striped#+i&ccedil;al#\'nelloni$#ily$%oning$$ulae##ted',
+    '#&vasser#!z"$orle"#pet#&topril"&ramels$%tacus#\'buncles##dew$"in%*o-vascular#(e-givers$-taker-manager$$worn#(isbrooke',
+    '#%lssen$#uke##nap$%money#\'pathian$&entras#\'rbridge$+iage-return%)ckblacker#$sons#,tier-bresson%(laginous$#mel"$shel%"ws',
+    '$$more#$illa##san%"tt$$irer#\'tigates$#ner"\'t-calls#%acomb$\'loguers$\'pulting#*echolamine$!s#(hode-ray#$like',
+    '#&terall"%ughey#%lking##see%$ways#%tinus%$oner"!v#\'alierly"%wston!"b4"!o!#d25"#hes!"ee',
+    '$%stino#&l-like$&phones"%ntage$(enarians%&simals$&ifolia$)ral/local&!m%*e-forwards%%onics$\'ury-old#%wealh"#pac#"ra',
+    '#%idian#"ro##tes$)ificating\'"er"#sta"#tin"&vallos!#gil!1h&acirc;taigniers#)eacute;ri"%.app."%affed#&grined##in\'',
+    '$.rman-designate#)lcopyrite%$raft$\'k-white%%board%"is$%linor#2mps-elys&eacute;es##ney$\'gelings%!i#%ppies$%rassi#(rlestown%!y',
+    '$!s#%stely%\'lecombe#*teaubriand$$line$$tily&"n\'#$udes#$wton#$ytor"0echen-ingushetia#%erier$(semakers##ikh#(lyabinsk',
+    '#$rith$#nov#$sher$&t-high#\'vallier$$eley"$iara#%chele##ens#(ld-proof$\'lingham#)mney-pots#"nh$#wag#%odini',
+    '##tal$%inous##vvy"&lidema"\'oirbook#!l$/edocholithiasis$"on#&p_suey"(ristiane)$ised\'(e-miller&$lieb&(ological\'\'phersen',
+    '%$ides&)um-plated$&notope#\'ysanths%#tal"!t"\'udleigh#%rcher!)ibachrome"!l"*ne-variety$%raria",rcumferences"#scs"$vils',
+    '"\'aiborne#\'pperton#(risworks#*ss-divided&(specific%%icals&%fieds#%udian$%ghton#$vier#$xton#$yson"\'ean-air$(r-minded%$case',
+    '$,mont-ferrand##ves#!w"+ifton-brown#&mbable#\'ng-film#\'p-board$%stone")ock-maker%%maker#"nk#)sely-knit(\'related$(ing-time""ps',
+    '$$room##cks!"m2!$naps%"-c"!g"!r!*o&amp;sub2"+-authorship#\'chaired#)directors#)education$(fficient$%xists#)heiresses',
+    '#(optation#)presenter%)oductions&%moter#+referential$\'otation$$uler#&writer"#ady#)l-burning%%mines$)itionists$&miners(!s$%ville',
+    '#+rse-grained#)t-of-arms"%bbold"\'chineal#%klers$$sure"#dec%%enter#%piece#\'rington#\'swallop"&elomic#(volution#%xists"(ffee-bar',
+    '"(gnitions"!i#!a",ld-bloodedly%$eyed#%enutt#)laborates$*ectability%!n$%uvial#&nbrook#(onoscope%#say$%urway")mbinatory',
+    '##iso#"m.$\'erciale$)iserating$&odores%)n-emitter&$weal$&unions%&tative("or#\'panies.$,l&egrave;tes$#ort$)ressional+!s',
+    '%,ter-oriented##sat"%nakry#&cealer%%rtino$$hita$(iliators$\'urrency#$dors$\'uctress#.ference/course$"ig%\'nements$$late%%uency',
+    '$#eal%&stions#"ic##lin#%odont$#lly#)quistador,"es#0science-stricken$4ervation/agriculture$&ignors\'!s$*olidations$*tabularies$&ultees',
+    '&&mately#(tactable%$dora%\'minates$"es%)xt-tables\'&ualise+$zing$#ort$\'ra-flow&&riness%!e$%usion#$vair$$eyer',
+    '##gan#&kbooks#"ps"#pal$!s#)per-plate&$belt"&quette"%rbeil%!l$"ie#&difera&$olia$,on_sanitaire%"va',
+    '#$king#%leone#%nbury$\'thwaite#$pore##ran$%eggio%(lational$/osion-resistant"#s-b#+e-compliant#%slett#*t-of-carry$&liness"%tonou',
+    '%#gey$%erill#!y"(ulsfield#%nsell$(tenances&/r-demonstration2#ors()inflation(%tenor\'\'claimed\'\'feiters\'$life\')offensive\'%tenor',
+    '%\'rywoman#\'rseware$+t-appointed&$room"%veney#*ington-pym"$wers#*ley/oxford##pox!-r&eacute;mant$(circ;che$;grave;me_de_la_cr&egrave;me"\'ab-like#(ft-based#"il',
+    '#$ssly#$wler#%yshaw"%easey$\'tionism*"ts##dal##ech$"ls$)py-crawly#$llin#.me_de_la_creme#$ndon##pes#\'scentic',
+    '$#ton",icket-lovers##ers#)me-ridden$(inalized#%stall%$iana#&terial",o&ucirc;tons#(-magnons#%combe#,ix_de_guerre#*om-johnson#%predy#\'ss-beam',
+    '&(frontier&(purposes&(question##tal#(wborough$#ell$#son#%xdale"%ubach##den$+it&eacute;s#$ella$!t#&nchies#$said',
+    '"(yptogams!&ubical$!t"#cga"%irass"&lcheth#!f#(lercoats#&pepper#$tish%%vable#(verhouse""ms")p-holders#%idity',
+    '#-rent-carrying$.iculum-related*!s%%ehill##sus#%tness"%siana##sed"&t-offs##esy##ufa!"ws!)yberspace"+cloheximide"!l',
+    '"\'renaica"!s"*toskeletal*"on!&zarist 3d&eacute;sir&eacute!\'\'alsace#%ngelo#%rthur%$iste#&vignon"$etat"%silva!&-marks!#.d.',
+    '$"f."%phil.""r.!$acca##hau"$fter"%homey""io#&rymaid)!s"\'kopatts"%laman#$ison#%lying#"ry',
+    '##our"%nbury#\'ce-like#&dified$$yish#$ford#&german#$iken"$rien#"ke##nel#"pa#$well"(ta-bases$#man',
+    '#%chett##han"%ubing"%y-old#!a$!k#$care#&flower##nes!"bv!"cr"$s200"!t!#ddd!+e-activated',
+    '"*_profundis")activated#&d-ends$%locks#%rborn#*th-defying#$yton"&baters##ora#(t-equity%*for-nature"\'cameric%!p$&pitate#$ease',
+    '#*ompilation&&ressed$*nstructing,&onists%+textualised$&upling#\'rements#(stations"&dekind#(jazmatch#$uces%"ts"(ep-mined%(throated$)ly-rooted',
+    '")favorisee#*easibility$$nsor#%lator#\'oliants")humanised#&ydrate""in#"sm"$kalb"%lapre#-icate-looking#"ls#(ocalised#"ph',
+    '##vin".mand-deficient$#rco#(ocratico$&lishes$\'untable"$nard#%drite#"eb#%hardt##ier#)sitometer""p.#-artment-store*$ally',
+    '$$sing&&tories#&recate%&ssives"+recognition##mis")scendents$\'hampsia$1ription-lines-are#\'elected$+nsitisation#\'orption#%pairs#)tabilised#*ulfobacter',
+    '"(tergency%&minacy)$tely($ists$#sts"$vant#&il-man$"to#%olves$"ns"#wan"&xtrals%#ous"%zotti!"f9',
+    '"!g""l.!"gt!&hahran"!l""ow!+iabolically#+cylglycerol#\'lysates#"no#%rists$$maid"%cillo##ker$#man',
+    '##n\'t#$ymus"%estel"-fferent-sized)%iator$(usionist"(gestions#\'itisers#&lossia#$raph"$ldos#\'ettanti#$utes"$nnae$"ed',
+    '#&nysian"$p.ad"&sables$%rmers$\'sterous$&vowing#\'barment#\'credits&&teness%(iminator$(ursively#+enfranchise#\'figures#+habituation$%water',
+    '#)orienting$%wning#)piritedly$&orting$(utatious#(sensions#\'tending$#ils$#one$)ractingly%)ibutaries%$usts"*ve-bombers$*rtissement.!s',
+    '$$sors#$orty"$xton!&jaimin"$ilas!"lt!%m2.41%!4$"53%!4$"89""98"!t!"nb"%ieper',
+    '!(o-gooder"#agh#"ne"#ble"&charty#+uments-only"*decahedron##gem#&sworth"%ggies##leg#&whelks"#ily""ke$!s',
+    '"\'llimore#)phinarium"#mal#&inants%#gos#$nall"$njon##nas$#ish"$rain#$ning")uble-axes\'$bass\'\'century(\'ounting',
+    '\'%doors\'$pole\'&spaced\'"up&"ts$\'tlessly##che#&gherty##kas"&vedale"%wlais#(n-graded)#ing$!e$(lighters',
+    '$*regulation#$sers"%yenne"!z!$ptac!%r-dos"%achma##fty#*g-and-drop$$oman#*matization&\'urgical#$vida#%wdown"\'eamwork',
+    '#+ikaiserbund#%sdner#$witt"&illers#*nk-drivers%)ing-water#"ss#*ve-through%#age%$line"$ogue##mey#%p-off")ug-crazed%&takers',
+    '$)s-related#&maness#"se!#uac"\'chesses"%ffers"$ggie")ll-witted$#ard$!s"&mbness#$itru##ont#$pers"%ncans',
+    '#&kerley#$lops#%sfold""os"#ras#$egar#%nford$#ing#4sley/gloucestershire"*sk-to-dawn")tch/shell"%xbody!#vla!\'warfish\'!m',
+    '"&carbas"&nacord #e2a!&adbald#$wulf"$gled"&ldwulf#%hmund"\'r-piece$$ring#"ed#&lswood$\'y-music#%plugs#\'th-moon',
+    '")se-of-use#%iness#&tcheap$\'ernmost$$lake!%bbert"%rahim!#c1p#!y".hocardiography"%kholm"$ofin#)labelling#%nomy.#&tropic',
+    '!&da/sql"%ebali"#ina$/burgh/carstairs"&linger"+mund-davies&%sbury""om""sp"$ulis!"ei!#fas")fectivity#&luence%$vium',
+    '!&gilsay!)hrenreich!#igh"(khenbaum"\'ntracht"\'senberg!(katerina($burg"%strom!#lam#"nd"&chibey##ock"#dar#)erberries',
+    '"\'ectable%.ro-acupuncture\'*n-positron&"um#"ni#*phantiasis"#gon"&iasson#$bank#!o#%sions#"ya"&lerton#&ipsoid"\'opement',
+    '"%veden!/mbourgeoisement"$elda"\'inences"\'menthal"$path#"ey#.loyer/employee"&sworth!)nantiomer"*crustation"%dears#)ocarditis$(scopists%\'keleton',
+    '%\'racheal#&points"(ergizing"%folds"(glefield$,ish-speakers)$tyle#(rossment"#ham"%joins"$kidu"#nex"(tangling#-ente_cordiale$\'rectomy',
+    '#$rain$$usts#$wine!$pcot"\'idaurus#\'thermal"%ochal""ps!$qns."(ualities#&imolar$\'noctial!%rades##ses"\'dington',
+    '"$mold""rs"#tha"#yri"%zerum!+scort/orion"!g"\'paliers#!y"(quipulas")rc-funded"%terly"\'zterhas!%tches"#han',
+    '"!i"!p"#ten!,uro-american$&market%&onitor$#pes$.qualifications"&turpia!)vangeline#&porite"-ent-producing#+ritt/thames$!s")identiary',
+    '!"wc"!m!(x-beatle#$care##gwr#&l.c.c.$%overs#\'manager$$odel#&public%$pils#%royal#(yugoslav"*ceptionals$%rcise',
+    '#\'lusives#(remental"\'ecutory##unt")oneration#)rbitantly"+pandability&"er%(siveness#*ectoration$*rientially&)mentalism#$iate#\'urgated",sanguination',
+    '#(raditing$\'overted$$udes%%sions!\'yepatch#\'shadows!%z-rpc \'f&amp;c"6eacute;d&eacute;ration!#(u)!!-"#16s"$word!%.g.y.!$3000',
+    '#$ials#.t-presupposing$%icity"#hid"$ints#\'ryhouse%%tales"&laises#&kender#$lin\'"-mine-stricken"$nged"(rcically#$mway"%slane',
+    '"&talist""un$"us"\'vorable%"ed"#waz##ned")zackerley!$earn"$ccas"$dele"(e-payers"%licia#,low-citizens\'(students',
+    '")mtosecond"*nbendazole"&radach#&macell$$ents#%nanda#"ox#%rasse$)omagnetic$\'ybridge#\'tilises(#ing"$scue")toprotein#$ting',
+    '"%ydeau!#fyp!#iac"(breoptic"(fty-year"(lariasis#$l-in"\'ndlater##gal$&er-tip&\'picking##ial#(klestein#$siel""ra',
+    '%\'damaged%%eater$%balls$%ships#"le#(st-aider&&timers&%years"&schler#)hing-boat#"on"\'tzcount$&thomas",ve-under-par"$zzes',
+    '!)lameproof$#in\'$#mes#$nger$!s#%shers#&t-file$$boat$%lands%%iners#$vell"&emming#&shpots"(ightpath",oating.point',
+    '#&uncing#(werheads""t."#ume#%nkeys#$ster"&y-trap#%daway#\'ingboat!$ogey"%iling"\'ld-away%$back#&iation"(ntanelle',
+    '#+t-and-mouth"%r\'ard#$ager##bad$&earing$\'iddance\'%ingly#+ce-carrying#/eign-controlled(&set-is$$paws$*shortening$%woman##gan#$lani',
+    '$)ula-based#\'nasetti##sey##tis$\'william$&y-year"+ssiliferous#)ter-child")thergills"%ujita#$lest#&r-foot%$seat$&poster$(th-class',
+    '"(xhunters!"pa""mr!$raid#)nkfurters#$sers##ter#&zerian"\'ederico#*e-spending$$line$$port#%ights#)nch-owned$(etically',
+    '"\'iesland#%ggin\'$\'hteners##uli"*ont-raised&%wheel%\'iersmen#%ttola"#ude!"te!&uchida",el-efficient"*ll-frontal%$term$"an',
+    '$&inated"\'maroles#(e-filled"$ndal%$ment#$goid")r-trimmed"#sco"!t#"ba!*ylingdales \'g&amp;l!!\'!!-"!5',
+    '!\'.c.s.e.""f.!"/c!"10!+able-lidded%!r"#dre"%ffney"$gnon"#in\'"(leaspids#$land&"ts$%erist##ois',
+    '"*mesmanship#\'ma-rays""ne$!v#%gcult#$ilau#%ymede"&raging#%forth#"in#!n#%raway(\'/oxford))reporting$"ow',
+    '"&s-ring#/troenterologist&$nomy"#ter#$ward"#uld"&wthrop"$zdar!"bc"!p!)ear-lever"#dye""er"#igy")mioncourt',
+    '&#ing#(tilhomme$&lefolk%#ing"(oarchive#,morphologist"%raldo##gen#*iatricians#)man-owned&\'y-based##ona"$ysir!"ft!%habin',
+    '$&nouchi"(olamreza!"ia#(mbologna#%nadda"\'gabytes#"ia"*lberthorpe$$ride##gen#%kison#&martin"$mpel"&ornale%!o',
+    '##ija##ven"#zmo!&ladden#\'mourous#&snevin$(s-making"$emby#%nmuir$"ny"&inwood#"ss""ob$(etrotter$%ifera',
+    '&"in##oms"%yndwr!!n"\'eisenau"(ome-like##sis!(oathland"$bbet#!s"*d-daughter$%kings#"dy#\'winsson"&ggling',
+    '#*den-yellow&#rod%!r$\'finches#%f-bag#&ightly#"ub"+nadotrophin##dor"\'od-will$!a$$body$%ricke$-win/reporting#&nhilly',
+    '&\'pimples""rd$!y##gio$&onzola#"ia"%thard"%uriet"1vernment-industry!#psg!!q!*r&uuml;nen"%abham#&celand#!d',
+    '%$mont$$ters%"ly$&ulites&%omata#"ta$!z#$uber#&vadlax$\'itating&#ies##zia"0eat-grandparents&&nephew#\'enbelts',
+    '%%heart%%stuff&$ward#+gariousness#%ycoat$)ish-green"#ier#\'ffithii#%mmest$$ston$#wig#&sbrook$#ons"&oovers#!t',
+    '\'%rules\'\'sharing&&waters$&p-wide#$ynes"%ubbed#%ffydd!2st-pou&lsqb;c&rsqb!(uadalupe#%ndong#(temalans"$elph"$ilts#$ness$"le',
+    '"&nhilda#(nersbury#%sight"$smao#\'tafsson"+t-wrenching!&wynant!%yatso")mnosperms"$orgy"!p""re#$oflo -h&amacr;rkini!+-parameters',
+    '"$c.f.""j.!"2o!$addo""ff##nia"%ggled#"ia"*hn-warburg"#ilu#!m#"ns#\'rsprays"#lam#\'f-breed',
+    '\'\'nscious%&french%%penny%\'section&$peed$)heartedly$\'pennies#(l&eacute$#man$(ucigenia\'&nogens#$ziel""ma#$leys#\'sterley',
+    '"\'ndclasp$$loom$#saw%$tand$\'washing#(g-glider#$kins##sie#$well"*plochromis%%types"\'ra-kiri##bin#&d-luck$(enberger',
+    '#%ebell##kes#$nham#!q#(rassment$&isburg$$owby#\'tcliffe$&shorne$#ung"(shemites##ton"(tchlings#"im##oof',
+    '#&shofer#!t"$vell"$wser"\'yfields"\'zeldene!#dag"!i"!m!*ead-hunted$\'banging$*mastership#,rt-wrenching%%aches%%field',
+    '#%ve-ho$)ily-built"+bblethwaite"\'ctarage"\'donists#!y"%fting"\'gelians"*ight/crypt#"ni##sei"%lipad#\'l-hound$&enized$&iwells',
+    '#&minths#$oise#%pmate"&merdon#\'iplegia##pel"&nfield#%shall&!w$$tock#$wood"%paran"$rati#)stmonceux")terodimer',
+    '##tie"*xafluoride"#yes#$rick#%throp"&zekiah!#fcs!"gw!\'i-de-hi"&awatha"(dey-hole"\'eronymo"*gginbottom#&h-brow%\'calorie',
+    '%*kelvinside%*mindedness%&walled$$line##son"&larion#\'debrand%!r#"es""m\'"%nging"$orne"(pparchos"$rers#$self',
+    '$$ones"*t-and-miss$\'or-miss#&lerian",v-1-infected!$la-a"!h!$mpao!$oang#$rder"%bbins#%craft"&chland"%fmeyr"$gans',
+    '%&nshead#&ograph#"ts")me-buyers#&ininae#\'ophilic$\'zygotes#&unculi("us"&n-yong#\'eycombs%%moons#$orat%"ia"&odwink',
+    '$$bait#!m#$poes#$rays"&plites#$tons"%racio#$lock#\'nblende$#ung#)rifically#"sa$%e-box&&riders%&guards',
+    '%+shoe-shaped"\'stilely"$tech##ted%&terres"#urn#(se-party\'$rice&\'warming%%boats&&reaker%(mistress%%wares"%wlin\'!%p9000',
+    '!"sv!\'udspith"#hne"&manise&$zing#$bugs#&dinger##ean$#ral#\'idified"%ngers#\'ky-dory#$sdon#$yadi"(rlingham',
+    '"!v!$wang!%yades"6drochlorofluorocarbons%+electricity%%plane"(gienists"#las"&ndburn"&ped-up$&rbaric%.prolactinaemia#)notically(!s#*ochlorites',
+    '\'\'tically$\'pharynx$$thec &i-mibg!".t!#acs"!p!$bama!"c7"$arda"(e-sheets""kx"(onauthor$*ographical!,dealizations',
+    '"&iocies$$lect"!p"$ylls!"ee"!s!"fk!#gbp"!c"!e"%htham!!k!$leus"(l-afford$$bred',
+    '$(disposed$&temper#)uminators"\'minster!&majica"(becility$!r##ibe"&itator")mobiliser#&unized%+operoxidase")passivity#&elling$(ratively',
+    '#\'ortuned$%tency#\'roviser$&udence!%n-can#%phase",_in_terms_of")appetence"+carnational#%hcolm#\'isively#&losure#)umbrances$$riam&#ous',
+    '$)terminist#+iscernibles#(ochinese#2ustrial/commercial")excusably"(famously#(erencing#(iltrator#&laming$&uencer#/ormation-giving,\'sharing"\'gliston#$rown"&hering',
+    '"%jury."+ntrepreneur"#pfl#&ut&num%#ted"+quisitively",scrutability)"ly#(ectivore#)ide-right#\'olation$&mniacs#$tils%-tutionalising#$ulae',
+    '%$rale$-r-association&&dealer&%faith&&linked&%union%.denominational&)igitating%-est-inelastic%$foto%$lace%)magnetics\'%rried%(nacional%&racial',
+    '&&pecies&%trand#$imal#&o-wind$"ne$%urist#,ra-community&%union%(duodenal%\'mucosal%&strand$%oitus$)usiveness"\'valides#%erter',
+    '!%omega"&nomers"(sseliani!&panema""sa!+rascibility"\'on-hard"+rationalism+$ties#)esolvable#\'igating!%schia"!d"#kra"&landia',
+    '"#tel#$rian!"t-"%altel")eratively"$ochu!"ue!\'vinghoe!!z ,j&aacute;nos!%.m.b.!.ack-in-the-box$$boot#\'obinism"(de-green',
+    '"!h"%lisco"&m-jars#$ison"$ngly##ina##son"%rdana#%oslav#&vefelt$"ie"&yhawks"\'zz-funk!,ean-francois"#mps',
+    '"$pson"$sner")t-setting#&direct""ux!&iangsu"$buti"$gger$"le"$male"#nky"#wei!"lg!#nr.!#oad',
+    '""es"#hne$/ston-mcclelland"$nker"#sep##som#$tein"+ynson-hicks!$uana""d.#"de%!r$%monte""ha"$mbos',
+    ' %k-reg!!3!+a&ncaron;ka"&cprzak"#ffe".hlenbergerdorf"#kar"\'lafrana"%mbona#"en"$nban"$piti#)lan-meier"$racs#!i',
+    '#"ja#%owice#!s"%velin"!z!%bytes!$edah"&flavik""il"&lantan#$ling"+ndall-humes#$ealy#%jayev#&nerley',
+    '$$mere"\'rguelen##ner"#xby"&yholes##man!&haddam#$yyam")melnitski"\'uzestan!#iai"$baki"\'ckstart"%echle"(lbarchan',
+    '#%learn"\'mbolton"%ngpin$%sford#*lochbervie#%nocks#&rimund#$sale##ver"(rkliston$!s%$tall&#one"(slevites#&sogram',
+    '\'%ettes#$ting!&leiman"&ingons$%smann"$uwer!#mag!$nick%)erbockers"%olles#(ttingley##wle#*x-johnston"%urled!%oalas',
+    '#%eston##ler#"ve"+msomolskaya"#nya"\'ppelaar"$rale#"pi"$smos##tic!"pc"!d!*rasnoyarsk"$enek"%imsky',
+    '!\'ubitsky"$mana##dan"%ng-fu"$pres"&rtosis"&znetsk!%wacha!$yong \'l\'oreal"\'univers!%.a.h."%r.ir.!#289!#9x1',
+    '"%bourd##rum"&cework##lau#*toglobulin#\'ustrine"\'dysmith"%gasek#$opus"#igh#$ndon"$lith"#mas#%ellar#\'ination',
+    '#%ghorn$!s#"ny#%thorn$"ra"*p/diagonal#%pland"#rbi#+ge-flowered\'%ormat&&screen%!n&#ess#$oche"\'tch-key',
+    '"%udian$#rup#)nderettes%$ress#*terbrunnen$#rec"*w-governed##men#\'n-mower#&yer(s)""ye$#tte#&person!#cst!&eaburn',
+    '#(pfrogged#"rs#(therface#%vings%$site"#ben"$ctin%!o".dingham-smiths""ee"#fts$$wich"(galising")idseplein"$mass',
+    '##mas#"os"%oluca#"na$"is")ptokurtic"$sbos##car#\'mahagow"&tcombe#*hargically$(ieullier#*ter-writer-!s"%udast',
+    '")wandowski##ine"-xicographical!$f363"#a-3!"hc!\'iaodong"#bid#$rium"$ddel$"ie"\'fe-raft$\'boatmen$!r"+ght-skinned',
+    '%%ermen""jn"&miters#$popo$!s"%nacre#"by##cs.$#tus#%dgren$"on#&e-item$&arised$%width#$tons',
+    '"%quefy$$ifry"&ssouba",teral-minded#&hified$(ographed#$ster#\'tleness!#obo""ca$#rno#%hhead#(k-keeper$#ean%"ts',
+    '$#ley"\'dgement"%fting"(g-normal#.ico-linguistic#)ocentrism")ng-acting%&lashed&%imbed$#_as$(er-lived"$oney"%renzi$#tto"#sey',
+    '#(twithiel""up")ve-struck$$bird$$lies")w-ranking%)esolution$#tax%*emperature#)er-school#&lights##son"!z#+enge-shaped!#pdr',
+    '!%t-col!*u&iacute;s"$beck"#cey""dd#$ford#$mila#$witt""fe"$gger#)ubriously"&minary#.penproletariat")nch-break#&gworms',
+    '!"xx!\'ychgate"&nnette"#sol -m&eacute;ndez)%thode#\'circ;me"*uuml;nster!!-""16"%tense!%.c.r."!d!"27!#aat',
+    '#&aroons#%bryde#\'dermott$%onell#$ewen#%heath$$ungo#(robiotic%\'economy#%ulata"%ghery$#run##ick%+o-religious#&matism',
+    '$&ifiers"%haraj""ji##les#%olica$&r-domo%%ettes"&keover"$laka#&donado#\'efactor$&stream#$ivai#&maison$%steen',
+    '#%volio")mmography""n\'#&/woman#*ageability&*ment-union#"cs#&droids##eka##gan$%etout$%onels#&hatten##iax$\'pulable',
+    '#"ky#)qu&eacute#$ured#(y-celled&\'oloured"%oists#!l"\'p-maker#"pa"%quila""r.#%auder#(cellinus$(h&eacute%&andise',
+    '$%opolo#$evna#\'garetha$&idunum$$olis#%ianas$&e-rose%#lla$#mba$%natos%$etti$!t##key#"ls##ney',
+    '#$rons##s-u#*xist-based#"zi"&saccio#%chera$"is$)ulinities##eru#,ochistically#"ri#\'saliote$#ifs$$moca#*ter-minded',
+    '"&teriel#$frid#%hsoft#&ravers#\'thewson$$ocks##zos"$uger#"no"&vhinje"%wddwy"*y&ndash;10##ers""zy!)bus-based',
+    '#$urdy"&erlean"%gahan#%eevor#&ilvray##raw#&uiness"\'ilwaine"$kern"$levy"\'monagle"\'sweeney"%vicar!&eacock##kin',
+    '"(chonoids#"ir#0klenburg-western#!o"+dal-winning%#ist#$dled#(icinally$!o$%tates"%ester"(floquine"\'galiths#\'getland"#hra',
+    '"\'langell#$bury##ina"$mnon#)orisation"(n-of-war#(talities&&ly-ill$"ha"%opham"&phisto"#res#\'gansers##ion##kur',
+    '#(rymaking"*sothelioma#%suage",tamorphosing#+empsychosis#$hoxy#\'ronomic"#wed"+zzo-soprano!#fdc!$haim!$iall""ch$$ener#-rocontrollers',
+    '%(injected%\'pipette%\'scopist%#vax#!s"\'d-brown$%devon$$line$$size#.dle-management#$ford#%ships$$oles""ka"&lesian',
+    '#&itaria(&sation%%iaman#&kshake#\'l-owner%\'workers$!a$#end&"ia%"ts$$ford$$iken$\'wrights#!s"$ncer',
+    '#$elli#-ist&egrave;re#.neapolis-based#!o#-ute-by-minute"&ramare#%eille"*scellanies#+description.!s#!o#%quote#%treat"%thras#&igates',
+    '#"te$$woch##zer"$yagi"#zar#$rahi#!z!%l/day!$mboe!&ochlos")dernistic#!o#(ularised""el"%ffett',
+    '#\'tashemi"!k"(ldavians#&ehills##nar"+n&ndash;sat#)etisation$&y-wage#*key-puzzle$%stown#&ocoque$!d$&phonic&&yletic$$spar',
+    '%%ssori%$zuma$%ignac##zer"\'odiness#!k##lit#&ndream#%rside#"ts"(pping-up",rale-booster##ena##nay##oni',
+    '%!s"%tamid#+her-of-four#)orspeeder##son",uld-breaking$#oud##sey$\'tachial#)thbrooder,!s"#yne!#p-2!$sec.$!s',
+    '%(heralded%\'praised&)ublicized%$used$!a"+ddletonians##ros""fc"%ggins##ler"%hajir"\'jahidin"$kden#)hametshin"%llein',
+    '#)ti-centre\'#hip&\'infarct&$male\',illion-pound&&tiered&\'vitamin%%focal%*lingualism%+millionaire%(threaded+#ing%$verb"$mmer"%ngham',
+    '"%rrays"&scadet$$hamp$+uloskeletal#"ee$#tte#&keteer#$lins#&telids"&tating!)ycologist"\'ddelton"%fanwy"%mouse"(opically',
+    '"$stif -n-acetyl-4asa"#bit!%.d.o."$r.m.!#=15#!6#!8""20!"aa##qss""fd#&ferton"#gdi"#nci',
+    '#&tucket"%oroji"$rain#"in#%whals"$sdaq#%ional##uwt".tionalizations##rum#$semi#\'uralize"\'ughtily#$mann!#clc',
+    '$!d""ta!"di!0ear-contemporary%%naked%%shore%$term"+cessitation""dd"+gr&iacute;n$!a$!i"&ighbor(!s%"ed',
+    '"$mean")o-fascism#&logism)!s#&phytes#\'tropics$!s"$roni#"ys"#sri"%tbios#(herfield##ter$%lebed&$fold',
+    '#&chatel#*roblastoma%-physiologists#(traliser*!s"+ver-say-die"\'w-build$*generation$\'looking$$wave$$york#$comb#!e##ing#+ly-restored',
+    '$#ham%%ounds$&stands"(zameddin!#ft1#!2!$hsme!\'icholle#$obar"$ggly#\'htgowns%$jars%&shirts"&kandre$!u',
+    '\'#eva"#lts"(mbleness$!y"+ne-week-old$!t##ths"#tro#%schke"#ver"$zari!$k-1r!#mgc!&o-cost#"no',
+    '"!6"#bis")ciceptors"&gueira"\'isettes"(n-active%(naphoric%#rab&\'bitrary$&church%(lassical%+onformances\')servative\'(tractual$(demented',
+    '&!t%)xcludable$&family&%rming%*unctioning$(graduate$*homosexual$)intrusive$+judgemental\'%icial&$rors&)sticiable$\'marital%$etal\')hanogenic',
+    '$*observance%)ccurrence%\'fficial$&paying%,rofessionals\'(gressive\'\'pagated%%ublic$\'renewal%$isky%$oman$*sequential%%ocial$&traded#%human',
+    '"&rdland%%inger$%strom#$icum#$ming#!p#(th-bound%%brook%$land"#ssa#$trum"!u"\'v&aelig#!e$#rre',
+    '!*t-on-alpha"!b!&uclide"%neham"*rsing-home"\'t-brown!$yein &o\'dare"$gill"\'mahoney!".r!%afish"\'kenfold#&ington#%ridge',
+    '!+bjectifying"$oist"%trude!%campo"\'eanport"#t-6#\'ahedral("on##opi!&dd-job!\'ff-cuts$*the-record$(worlders#\'icinale#&lining',
+    '"#led!$hhhh!)kehampton"$ness!$lahi"%droyd".igodendrocytes%&polies"#ley"&ugboja!&marska"#ran!(n-coming#%field#&stream',
+    '"\'e-2-one$#act%&ddress$)fifteenth$$pass%%eriod"\'rushing")togenetic"$usal!%olite!+pen-fronted$\'casting$$work#+rationalize"(hiotrema',
+    '"(positely!)ral/aural$#ist##nda"\'dinaire&%tions#$over"*egon-based#!m"(ganicist%)ochlorine#"el##one"!i#&ginary',
+    '"#lan"%natus"#say"*thogenesis&*raphically%%topic!+scar-winner"&nafeld"$sete"&tertag#%kreuz!"ti!*uagadougou"+t-buildings$,of-the-money',
+    '#(pointing$&utting#$rank$&iggers#%sized$%tayed!*ver-bright%-concentration%*dependence\')velopment%*expression%%hasty&%eated%$rule\'"ns',
+    '&\'tressed%&winter+#ing$)confident$+development%%osing$(emphasis+#zed%\'xertion&&tended$)inclusive&*debtedness$\'printed$\'reached&)presented',
+    '$&throws%\'rousers$%wound#"tt!"wr"#ton!(yanguren!%zberk""s. $p.17""27""42#!7""56""69',
+    '"$a.f.!$/kwh!"19!"38!%=0.08!#aan"$bbay"%cemen#%hinko#$kham"$dsaw"%hinui".laeoecological$\'ikastro#)e-skinned',
+    '%$zoic##fry#\'indrome#$lida"%mpero"(n-german$$pla2#%dolfi#%golin#"os#(theistic$!y"#ola$#ini")permaking',
+    '$)de-ground%$ouze$$llan$(magnetic$"na$\'sitises$\'thyroid#(enchymal##fum#(i-mutuel$#ahs$%ssien#$kins$&onians#&menter',
+    '#"t-$$erre$#isi##vin"$squa#&serine$!y#+teurisation$%illes"%teley#%hfoot#!i$%ents.$#nas#\'ricians',
+    '"(ul-henri$!l"$wlak"*y-per-view##son!&blcat2!#cfc!#dag!,eace-keepers$#hey#%rwood"\'chstein##ker%"tt"$dder',
+    '#&rlogic"#kin")largonium#$isse#\'legrini%$tier#\'ta-urns"&n-name#"an#$dula#*etratingly#(maenmawr##nie#(ological#+s&eacute;es',
+    '%&midine"\'ppering"&rehera#+fectibility#+i-operative$$gord$)odization%(perative$"ti%%oneum#%mutes#!o#(sonalize*#ing#\'taining',
+    '"#sky"#tch#\'erhouse##kov#*rashevskii$*o-chemical%#lia"$wsey"$xton!$faff"%effer!)halaropes#-ntasmagorical#$sors"%enols',
+    '$#eas$(harmonie$%ippou\'!s#%nehas"*oenix-like#)nographic#/sphate-buffered(,idylinositol&#ors#0to-opportunities%&finish%(voltaics"%rygia"-ysicochemical',
+    '&!s!/i&lstrok;sudski"%anism#!t#$zzas".cture-postcard"$eris#*zoelectric"%mpled"(n-stripe#&e-clad#$ions"!o""ra#&bright',
+    '"&t-stop#$hart##ies!"kt!#lac$#ido##nge$\'t-based&%level#$smas#/telet-aggregate#$utus#\'y-pause$#bus$)ing-field',
+    '",easant-faced%%uring")oughshare"&umages$"bs!&m/hour!&odsnap##vig"#ele"(insettia$+t-to-points"$kers"\'le-axed#$itti#&lyanna',
+    '$%filla$%gonum$&hedrin$&ptychs$*saccharide%#emy"#mme#"ps"\'nomarev#%sford#"to"#oey"$pcon#&perian#+ularisation',
+    '$%hcawl$%slade#$zana"%seurs#*t-freudian%*maastricht&)enopausal%+reformation\'*gistration%)stalinist$\'/modern$$room"\'t-holed#%entes&(iometric',
+    '#%iphar"%ulson"%w-wow#)er-packed%\'boating&&reaker"$ynor$#ter!!q!$rana#$tesi#$wiro"&e-1967&"73$&agreed',
+    '&\'nceived&$oked%"ut$)darwinian$+established$)maritally$\'oedipal$\'permian$&strike#%bends$%iotic#\'ciously#)determine#&empted#&immune',
+    '#$mack$%olars$)ultiplied##nsa#%parer$*onderantly#$quel#)sentiment%+rvationists$(idencies$%s-box$#ter#,ternaturally#%zzies"%iapus',
+    '##ddy##ene$\'st-king#$meur$\'itively#&ntemps#+oritization)"ed##ses"!l"%o-anc$)europeans$&israel$/vice-chancellor#$_tem',
+    '#&cordia$*rastinated$$ures#\'ductise#1fessional-looking$)it-taking&&eroles#&lamins%$psed##mos#&neness$)ounceable#(pagators$,ionibacteria$&liners',
+    '#\'stheses%&ituted#%teges%(inaceous$%horax$)ocerebrum%&stomes$\'uberant#%vosts#"ws"&ufrock!)sephology#)udanthias%)o-science",ycho-history',
+    '&*biological&%motor&-physiological!"tc")erodactyl""ts!\'ubertal#,lic-interest&$ally&#kly&(ly-owned"#c19#"ci"*gnaciously"\'ll-offs',
+    '"\'nch-ups#$shon"\'re-bred$#foy#!o#\'ple-red%!y"+sillanimous##kas"&t-upon!$yotr"+rimethamine %q1692!$asim!#dm.',
+    '!\'uackery#!e#%ffing#"id$&ntness#&kerism#%lcomm$$ity.##ndo$(titation\'#ive#"re$-ter-finalists($hour#(si-legal',
+    '"$elle#"ux"\'ick-fix#(etwaters#%lling$!p#*ncentenary$$tana#$tter"#oit!!w (r&middot!#.f.!#151!*4000-based',
+    '!"98!$aban#$idly$"er"$chid#\'k-mount$&eteers"$ddle#0iocommunications%$gram%\'isotope%&lucent#$leys##ula"&edwald',
+    '"*g-and-bone#%stone"&ilcars#(n-lashed%%water$$drop$#ier$%sford"$llye##phs"&mekins"\'natunga#\'gelands"%ppard""sa',
+    '#%cally#%selas")te-capped#%tansi$"ed"&uching"#ver##ish"(wsthorne#$they"%yburn"!z#&aleigh##ing#\'orblade',
+    '!*e-activate$&ligned%\'located$)ppearance&$lied$\'rrested$\'ssemble\'"rt#&charge#$draw#)educating$%ngage&%ineer+"ed$)xperience',
+    '#&housed#.interpretation%\'venting\'&stment#$made#)negotiate,!d#(organise##set$"it#$tell"(absorbed#Id&mdash;complete&mdash;root&mdash;package$*y-prepared#!m',
+    '#&r-adml##ver"&buried"\'capping#/eptor-dependent#\'idivist#\'lassify#\'ombined%&pensed&\'ilation$(nstructs%&victed#&rossed#(urrently")d-bellied',
+    '$&letter#&action#)edication$%fines$(signated#&uctase"&edbeds#)l-to-reel"+ferentially#+lectiveness#*ormulating#(urnished$&seniks$%table"-gionalization',
+    '#*urgitating"(hydrated"\'ichenau#\'mburses#%nhart$+vestigation#"sz"\'legates\'.ion-threatened#)inquishes")marriages$&stered#.ote-controlled$$unts#$ploy',
+    '"&nishaw#%umber#"zi")offending"\'pairman#+etitiveness#\'hrasing#&licase#\'ointing$&pulate$&rtable#&resses$\'oaching%\'grammed%"ve',
+    '#(udiatory"$runs"(sistible$$ting#$pire$(onsorial$#ray##uit$%spend"%tards#\'entions#*ributivist%%evals"%veley$$nged',
+    '#%isits"(workings"%ynold!"gb!)hapsodies")einberger"(inestone"&ydding!"i2""al"%bbers")ckardsson"%dging##ler"$ffle',
+    '#%orist"$msky"(ngmaster%"er"%pcord"\'se-fall#)k-related$$iest"$vero"$zzio!"la"!s!%obens##ing"&ckford',
+    '"$dham"&gerson"(istering"&ksanda"%lland")man-dutch%$ised&#zed#$berg"(of-slope##med"#que"%salyn#%ebush$%merry',
+    '$"ta##set#)tenkowski%$ring"&tarian"%ugier#-nd-shouldered%$head"$vigo"%wicki#\'landson"$yden"$ziac#$zers!#rnb',
+    '"!m!\'ub-down#%icund$"no#"us"$csac"(ddington$\'y-faced"%ggero"/islip-northwood"#mex#%inate\'$ions("ve##sey',
+    '"&sholme##tin$!s"&tnagur"$watu!"ve!(yanodine"$hope"$land &s.m.o."$t.p.!%14(2)!"39!"41!#673',
+    '"(cerdotal##rum"%dlers#*omasochism")fety-pins#"fi"*gittarians"\'ilmaker#-nt-sa&euml;ns(%uveur#!s$"on##the")lazopyrin#(eability',
+    '##ica%$ylic$&nities##lis#(tersgill$$ings$#oun#(utations##ved$$idge%!n$"os"$main$$kkhi#%e-day',
+    '#$oeds$"ra#"ui#$well")nctifying#*d-coloured$$iman$%storm$%yford#\'g-froid#)itaryware%%isers##pro##ter"(parmurad',
+    '#)saparilla#%trean#"up"&tanist(!s##iro$"va##nav#\'yagraha"*urischians"%vants#&etsila#$ills$!n"#war',
+    '#$kins##ney#$yers"(xmundham!&carabs&!y$"fe$#ier#"up",ene-of-crime$%tless"#fas"\'hallers$"nk#$eler',
+    '#!h##irn$&smatic#$oley$(ol-house\'\'teacher&(/college&&boyish&%rooms#"wa%!b%$nitz$$eppe"%ooted#&relord',
+    '#&tswood#%urged"%raton#&eamers$\'enshots#&ibbler$$vens#(utinises"%umbag##ola##tum!"d1!)ea-faring$(launched%#ion',
+    '$%shore%#ide$$wall#!d#%grave#%hawks#$land#\'sonable"#bum",cond-innings\'#row#\'retaire#-tionalization"(dgebrook#%ucers',
+    '##ley"%gesta#)hbatullah"$ised"#kou""le#0f-authenticating%&chosen%\'dealing%&giving&%uided%+importantly%(obsessed&)rganizing%&penned',
+    '\'(otective%+questioning%+replication##mer#&vedges")maphoring#\'i-major%$open%#pro$\'quavers"*nd/receive$(ings-off#"fl#$nett#-se-perception',
+    '#%t-off$+imentalists"#pta$-ember-october)(/october$"um",rb-dominated#(c-funded#"en%(dipitous%&issima#$gius#*ialization#,oprevalences$!v',
+    '##ums#!v$&iettes"%sotho#&triere"&taside#%tlors"#ung"#van#)en-a-side&$fold("ot&$iron"&x-life$#mad',
+    '")ymour-ure##yid!$haba#!k$%edown$!o#\'llowest#"na$$druk%$wick$#nen##ran$$pton#&wlands$#wal',
+    '#$bang#&epfold#&lfolds#*pherdesses$$shed##rer$$mans$"yl#$wing"#i\'a#$fter%$less#%ngled$%tiyan#\'rtfront',
+    '#(t-scared"\'oeshine#$khin#%otin\'#(p-soiled#-rt-circuiting&%story&$toed%$wood#%tokan#+ulderblades#%veler#&wcased$#ell$%girls',
+    '$"me$&pieces"&restha##ike"$ubik#"ns"#yer#$ster!$iang"&bomana"$cker"\'de-drum"&ferwas"#glo#"ny',
+    '"+liciclastic#%kwood#&marils#(vermines&%point%$stri"+milar-sized#$mers#$plon"#nan##dhi#&ecures$&fungin$$wave#\'g-along',
+    '$$eing$&le-bed($oard\'\'chamber\'&family\'\'product(&urpose\'$span\'$word#$less#$nott"#rri"+te-directed#!h"(x-a-side',
+    '$%times$&wicket#)th-former$*y-year-old!$k210"$adar#$ller#"ra",ew-symmetric"&i-lift#%athos#%nless$$nier#,p-sequential#&school',
+    '$#ter%%ishly"$ogen##kov"&ullcap"%yways!"l4"%ammer#$ters$!y#(ughterer#%vicek$%onian"#eat#$eker',
+    '#%ights#\'nderest"\'ingshot"%oanes#&bbered#&othaak#"ss#)w-burning"%udges#&mbered!&martie%$star"%elley""it$#ing',
+    '""mb"*oke-screen$#in\'#$ochy!)nail-like#&p-shot$$pily#$ring"&iffles&#ing$#ter##ped"!l"(owdrifts!&obibor',
+    '$,o-historical%+demographic"#das"&fa-bed#\'t-focus%$porn$&wright""go"&journs"$koto"$lana#&ecisms$(mn-faced$!r#)icitor(s)',
+    '#"ow"%maria#%efink$$rsby%\'villian#\'nolence"%nauto##dra#&gbirds$&wright#%orant%%ously""pe#!s"#rps',
+    '#(ndgarden%%proof*#ing#"rs#,th-eastwards%#paw"+viet-backed"1zialdemokratische!(panswick#$smed#%wners%$ings"+ecial-needs#!e$)ch-making',
+    '#!n#)rmatozoon")ielberger#)n-doctors$*e-chilling$$neys#$ritu#%ttler"\'lenetic#)it-screen"&oilage#&on-fed#(rozoites$$tier"&ranger',
+    '%!s$)y-painted#(ing-like&#ett&$hall&%iness$$tzer##ott$#ull"(uriously"\'y-flies!&q._km.$!m##ft."&ueezer',
+    '#%iggly$#shy!"rb"$edni"\'ikkanth"%nicek!%s-20s"#739"#ap9!/taatssecretaris#$chys$!y#"dt##ffa##gey',
+    '#*ll-holders#$nced$&d-pipe%*ards-based$%fords$$sill%$tead$$well#&pledon#)r-crossed$$buck$$kers$$tin\'%"op#*te-centred',
+    '$+ion-masters#\'unching#$ving$#ros"*eam-hauled%%boats$"ua#)el-framed$$pens#&ilmann#%llato#&m-loop#$pper#&reolab&&tactic',
+    '%!s#$wpot"#ies#\'flingly#&gmatic("se#"jl#"li$&l-warm#!m#\'r-fried\'!y$%lings"%jepan"&ockier',
+    '&!r#%neham%#ley%\'walling#$p/go$!h##rin$$min\'$#rie$&yboard#$tler""ra$%ggler$&thearn%%iform',
+    '$(ss-timed#\'indberg%\'gencies$&pboard$#ved%$ings#,ongly-worded&&points##uan"*uart-smith#%ntmen#!p$(endously$\'idities#$rgis',
+    '%+abteilungen#\'tchbury"%ylers$\'ishness%&zation$\'ometric!%uarez"*b-category%\'ultural$*divisional$%field&"le(!s$%layer%$ease',
+    '$+machine-gun$&region$$sale$\'tenants%%itled%%opics%$ypes#)arachnoid#&clause#(families#+oesophageal#*pentagonal#\'regions#&sample#&tended',
+    '$\'ractive"(cculents")ffragists$%using"#lci#*fasalazine#&phated#\'zberger"#mer#\'merhall"%nbelt##dae$$ials$%ridge#$fish',
+    '#&screem"-per-efficient%&cooled%&fields%\'gravity%$plan%$soft&#wim%\'tankers%&vening#(plicants$!o$\'ressant#(remacist$#ise',
+    '#\'inamese"$sman#\'pensory#$sman#!u")therlands#$tles"%zanna!)veshnikov"(r4-based!#w1e"\'ampland#&n-song$#ley"!d',
+    '#(et-faced%$meat"*im-bladder#&ndlers#$sher"&otting"$shas!$yll.$#abi"+mbolization")ncopation$%retic#&dicats&!s%\'otactic',
+    '"$ston!!z".&eacute;chenyi"#ulc *t.b.g.a.s.!!6!$abai#*le-toppers%$land##ner"#cis#"ul"#hir$$tian"#igh',
+    '$\'dragger$\'lebourg#"yo"\'kahashi#%e-out"*lked-about#&lichet$"on##man#"us#$vace")manrasset$#rin##bay$$ours',
+    '"%nagra#%dberg$#ems#%gency#(kbusters$\'erville#!t"\'peworms##irs"%ravad##bet#\'entaise&"um#(iff-free#\'nishing',
+    '#$tare$"ed"\'ttenham$#ies"#upe"*var&eacute")x-cutting$&paying#&idermy"\'zmamert!"ch!#dca!(eachable%-er-librarians#&m-work',
+    '"%chdoc"$drow"%ebane##nsy$$ybop""fl")lecottage$%fonos$)phone-box%#ort%\'rompter#"la"#mpa$)orariness"&n-acre',
+    '$(shilling#%antry#$ners$#iel#$zing"%odoro"\'rn-like#(racottas%#zzo$#ena"(trathlon"$ulon!&hadeus#(mes-side&#ide',
+    '$!s##par"*eatre-goer#&ophile&$olis$%retic$!s#&ravada$$emin%!s$"ma%)o-nuclear#+sis-derived$)salonians##tis',
+    '#&ngybob##rd-"0ompson/reporting#%rning%#ley$$sons#-ught-starters")ree-layer\'$itre&&masted&#ply&&to-one#-ombocytopenia#%uxton"%ubron',
+    '##ilm#"le"(ymectomy#(roiditis%$xine!%ichka#$kler$#ner$$over"&e-dyed"%juana"%lapia#$lson$#yer#$ston',
+    '%$life\'$mits%&of-day%\'servers%$warp$&keeper#!o$!n#$pson#!u"(n-mining$&opener#$dall#%guely##pot',
+    '"$tley#$ties!\'jerssen!"lc!"mc""os!"np!\'oadflax"\'bermore"\'dmorden"!f#)fee-nosed""ma$#tes##mie',
+    '#(e-colour#&gjiang$$uing#,sillectomies"%ogood#"ns#&thcomb%$some"\'p-grade$$line$\'ranking$&to-toe#%olski#%sides"%rbole',
+    '#$more#$quil#(ridonian#+toise-shell$%urous"#tes"(uchpaper#$mani#"re%#lle$$nier""wa#&erbell#%nland(!s',
+    '"%y-boy!$p280!"r6"(acheoles$%tions%#rix#)gi-comedy#$nces$#ent$"ny$)s-pacific%&actors%(caucasus%*epithelial&$xual',
+    '\'#red%\'gresses#%pezes"\'eblinka#%madog$#bly$$ezzo$$lett#%ncher$&diness#\'varthen$"es"&i-club#%alist#$bout',
+    '$.hostrongyloids$!o#%lbies#%nians%$dade%#tro#%oxide##ply$#per#&sodium#(vialises("ze$%ulzio")oglodytes#,ubleshooting',
+    '#$wark""ps"\'uckload#%mbull#%nking"(yggvason!(sedenbal#"ng#(renpilyn"!m"!s""ug#*nami-based#$tomu!"td',
+    '!*uberculous%#ous"#deh"$ffin"$kalo"%llock""ma"%ne-up"%ppeny")rberville$"os#"fs#\'kington##man#&nhouse',
+    '!#ver!#was".elve-year-olds"!h"&inhead#$tter#$zzle"&o-acre$#bit$(fingered$&in-one$#ply%(rocessor$$room("ed',
+    '$$word$&yearly!$yner$%sider)!s")pographer"\'rannous#(e-tracks!&zannis#$rina (u-series!".k"$s.c.!!1!"al',
+    '#!t!&da/uff#!l"$erzo"#ine!#eda!&golini!$h-uh"$tred!(limwengu"#loa"\'sterbus"(tra-left&$thin!%mtata',
+    '#"ni"%built"+challenging%&rtered%#ste$&urched##lip#(onquered$\'untable#"tc"&der-23&(educated%$down%+performance,"ed',
+    '&#old&$pend&&tating%)valuation%%wired#*istributed#&rained$$eamt##yed"+embarrassed#(xcavated$&ecuted$)plainable"#fed#(lustered',
+    '#,overnability"&horsed")insurable$-telligibility#$palm#"us#$vers$$ocal#&x-like"*lawfulness#\'ettered#&ighted"*measurable$%rited#*istakeably',
+    '")practical(#sed$+oblematical",remunerative$&paired#(ighteous#&ounded#"uh"(saddling#&eating#%haken$\'ockable#%orted#&taffed%"ll',
+    '$$ught#%raced%(nsfected\'\'latable"(winnable!*p-and-over#&dating#&graded#%tempo"!f"$rate"%sides$#lon!#rie"(ologists',
+    '"$sell"#win!/s&dollar;40,000*&50,000*#700"&-japan##plo#\'russian""gs"$hant"#pca"$sher"&urpers!$tley!&vedale',
+    '")uncarsili &v.c.h.""p.!)acillated"#ill"#lar#"da#&encies%"te$$rian$$ting#(idations##lee$\'isneria$"on',
+    '#-ue-judgements&&system"$nier"%quita"$rese#$vara"%ssall",t-registered#"er"#ude#$lter"!w!%eljko#&odrome"$mber',
+    '##era#&tadour#%usian"%rbals#,ificationism##res$#uca"#vay"$ysey!#hws!$iale"+ce-convener$$roys#*omt&eacute""er',
+    '"#gno"$kram"\'llepoix"$nall##cey$#ula#$icio$"ng#$tner",ollet-le-duc$"on&!s"$shwa&$nath#\'itorial',
+    '!!j!$liet!.neshekonombank!,ocationalism"-ice-activated#!r"%lcans#$kova$!s"#ord"%rster##tai$%icity"&uching!#rai',
+    '!"sa"!i #w.e!"11"!a"!m"!x!!9!&adland"$ffen""gg"%isted#(tressing"#jed"&keford',
+    '"$lcot#$eses#*l-hangings"#nta"&r-like#%burgs#!c#)m-weather##nke#%rener"%shin\'$!y#&serman#,te-to-energy%&ground',
+    '#%erbed%#ers%%holes%$mans##ter&!s"$xman"%y-out#%marks#%point!#c2a#!h!"da""cs!*eak-willed',
+    '\'&shield\'$vane"$eble#&kender#$lkes"\'intraub""ka"\'lfarism(!t#-l-articulated%+diversified%&funded%)manicured\'%tched&&uscled',
+    '\'(membered%(schooled%)travelled&%urned%&wisher$%field$$ings$#man##sby"$nham"#rth"&stburn$%erham$%mount$$side',
+    '""rp!#gol!$hads##lby$*e-watching##rfs#$tham"%eaten#%elies%$spin#(resoever"#iny##pps#&tecaps%!d',
+    '"%o-ors#"rl"!r!-icked-looking%&rhamii$$ford")dely-read$)r-ranging"(fe-to-be"$ggen$!s"(ld-goose$$card$\'erspool#*liamsburgh',
+    '"%n-win##ans#%chell#$dham$*ow-cleaner&%panes#+e-producing%\'tasting#$frey#&terson#$yard"!p"*rth-miller"\'sh-list")tch-hunts',
+    '#-h_relation_to$&ernsea&%spoon#+ton-le-wear"$zdom!%ledig!$odge"+lfensberger$%ishly$$line$%queen#"pe"$mble"\'nderin\'##ted',
+    '$$sman##ton"$rcs.#$d(s)$%-book&&y-word%%order%+superiority$&search#&k-rate$\'aholism$!e$$less#)ld-beater#$mery',
+    '""ul"$wing"%zzeck!\'racking#&nglers"!c"&estles%%plank"%inger$%klies#%te-in$#hes!"sp!$uhan"(nderkind',
+    '!"vs!$ylye $x-25!"11!#a/r!"b5!!e"!n!(tradrive!#xxi##vii &yahaya#"ya"$ncey"#van',
+    '#!s!#ds.!%easty##tes"!e"+llow-haired"%s-man!$obbo"#gis"&ngbyon"%o-hoo#!f"!p",rkshire-born"\'ung-old',
+    '"%wling!%sbyty!%uccas""en!!z")ordderrex #z\'s!!+!(afferana"%itsev""ne$#tta"$pata"$rina".uberfl&ouml;te',
+    '"%eland##man"(ffirelli"%igler"#lan"$nnor"$phro"#tor!\'hongguo!%inzan"#olo"\'rconium#%nheld!%nf33b!%ombis',
+    '"#rro"%virax!"sl!&ugdidi!$wehl',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_17 = (
+count_17 = 6694
+
+heads_17 = (
     '&agr;-methyl',
-    '&amp;co.',
-    '&ccaron;ern&iacute;n',
-    '&dgr&egr',
-    '&dgr;r',
-    '&dollar;0.22',
-    '&dollar;0.30',
-    '&dollar;1.00',
-    '&dollar;1.40',
-    '&dollar;1.57',
-    '&dollar;10,000,000',
-    '&dollar;10.7m',
-    '&dollar;115',
-    '&dollar;12,500',
-    '&dollar;12.6m',
-    '&dollar;13.3m',
     '&dollar;140',
-    '&dollar;2,000,000',
-    '&dollar;2,700',
-    '&dollar;2.00',
-    '&dollar;2.1',
-    '&dollar;2.3',
-    '&dollar;2.50',
-    '&dollar;20,000,000',
-    '&dollar;20,000m',
-    '&dollar;26',
-    '&dollar;26m',
-    '&dollar;3,600',
-    '&dollar;3.4',
-    '&dollar;3bn',
-    '&dollar;4.1m',
-    '&dollar;4000',
     '&dollar;450m',
-    '&dollar;48m',
-    '&dollar;5,000m',
-    '&dollar;5,700',
-    '&dollar;5.1m',
-    '&dollar;5.5m',
-    '&dollar;5.7m',
-    '&dollar;5.8m',
-    '&dollar;6.2m',
-    '&dollar;6.5',
-    '&dollar;6.5m',
-    '&dollar;6.8m',
-    '&dollar;600,000,000',
-    '&dollar;7.4m',
-    '&dollar;8.1m',
-    '&dollar;85',
     '&dollar;85,000',
-    '&dollar;9.3m',
-    '&dollar;95',
-    '&dollar;995',
-    '&eacute;coles',
-    '&eacute;omer',
-    '&flat;3',
-    '&flat;7',
-    '&formula;3',
-    '&frac14;in.',
-    '&frac38',
-    '&gt;2',
-    '&lt;process',
-    '&lt;shift&gt',
-    '&mdash;he',
-    '&mdash;including',
     '&mdash;it',
-    '&mdash;were',
-    '&micro;g/hr',
-    '&micro;mol/ml',
-    '&pound;0.3m',
-    '&pound;1,000m',
-    '&pound;1,650',
-    '&pound;1.09',
-    '&pound;1.45',
-    '&pound;1.6bn',
-    '&pound;10,300',
-    '&pound;102',
-    '&pound;11.25',
-    '&pound;12.25',
-    '&pound;122',
-    '&pound;124',
     '&pound;1300',
-    '&pound;14.00',
-    '&pound;14.5m',
-    '&pound;1400',
-    '&pound;15&ndash;20,000',
-    '&pound;150,000&ndash;200,000',
-    '&pound;16.6',
-    '&pound;18.00',
-    '&pound;18.5',
-    '&pound;183',
-    '&pound;187',
-    '&pound;2,900',
-    '&pound;2.45',
-    '&pound;20-&pound;30',
-    '&pound;20.95',
-    '&pound;22,500',
     '&pound;248',
-    '&pound;27.95',
-    '&pound;3,800',
-    '&pound;3.10',
-    '&pound;3.55',
-    '&pound;3.65',
-    '&pound;3.90',
-    '&pound;32.55',
-    '&pound;340,000',
-    '&pound;3500',
-    '&pound;39,000',
-    '&pound;39.50',
-    '&pound;3m.',
-    '&pound;4.8m',
-    '&pound;4/&pound;3/&pound;2',
-    '&pound;40.00',
     '&pound;405',
-    '&pound;41,000',
-    '&pound;42m',
-    '&pound;44.99',
-    '&pound;489',
-    '&pound;490',
-    '&pound;5,000,000',
-    '&pound;5.49',
-    '&pound;5.7m',
-    '&pound;50.00',
-    '&pound;51,000',
-    '&pound;51m',
-    '&pound;565',
-    '&pound;57,000',
-    '&pound;580',
-    '&pound;6.4',
     '&pound;637,000',
-    '&pound;67,000',
-    '&pound;670',
-    '&pound;69,000',
-    '&pound;69m',
-    '&pound;7.7m',
-    '&pound;725',
-    '&pound;73',
-    '&pound;78,000',
-    '&pound;830',
-    '&pound;860',
-    '&pound;870',
-    '&pound;875',
-    '&pound;880',
-    '&pound;8million',
-    '&pound;9.75',
     '&pound;930',
-    '&pound;94m',
-    '&pound;96,000',
-    '&pound;960',
-    '&sect;246',
-    '&sup3',
-    '&thorn;ingvellir',
-    '&times;8',
-    '\'22',
-    '\'68',
-    '\'85',
-    '\'but',
-    '\'eart',
-    '\'mere',
-    '\'ot',
-    '\'ouses',
     '\'plane',
-    '\'urt',
-    '*altered',
-    '*mohammad',
-    '+27',
-    '+5',
-    '+6',
-    '-18',
-    '-65',
-    '-as',
-    '-based',
-    '-dependent',
-    '-ish',
-    '-lt',
-    '-one',
-    '-that',
     '-ve',
-    '.32',
-    '.8',
-    '/and',
-    '/i/',
-    '/k/',
-    '/ml',
-    '0&ndash;10',
-    '0&ndash;6',
-    '0.002',
-    '0.025',
-    '0.125',
-    '0.18',
-    '0.29',
-    '0.5&deg;c',
-    '0.51',
     '0.61',
-    '0.62',
-    '0.6m',
-    '0.70',
-    '0.82',
-    '0.86',
-    '0.89',
-    '00:07',
-    '00:09',
-    '00:11',
-    '00:13',
-    '00:27',
-    '01&ndash',
-    '0222',
-    '0233',
-    '028',
     '0300',
-    '0400',
-    '070',
-    '0707',
-    '08.30',
-    '1&frac12&ndash;2&frac12',
-    '1&mgr;m',
-    '1&ndash;1&frac12',
-    '1&ndash;14',
-    '1&ndash;19',
-    '1&ndash;2%',
-    '1&ndash;40',
-    '1\'11',
-    '1(6)',
-    '1-193',
-    '1-point',
     '1.02',
-    '1.23',
-    '1.27',
-    '1.38',
-    '1.4.1',
-    '1.5.5',
-    '1.57',
-    '1.68',
-    '1.9-litre',
-    '1.90',
-    '1.9m',
-    '10&ndash;10',
-    '10&ndash;18',
-    '10&ndash;30',
-    '10&ndash;4',
-    '10&ndash;6',
     '10&ndash;7',
-    '10-9',
-    '10-inch',
-    '10.00pm',
-    '10.2%',
-    '10.20pm',
-    '10.23',
-    '100&deg',
-    '100&ndash;300',
-    '100-year',
-    '1003.1',
-    '100ng',
-    '100w',
-    '101&sol;76',
-    '1032',
-    '103rd',
     '1077',
-    '1078',
-    '1085',
-    '1091',
-    '109g',
-    '10:1',
-    '10a.m.',
-    '10ngml',
-    '10v',
-    '11&ndash;4',
-    '11&ndash;9',
-    '11,000,000',
-    '11-1',
-    '11-hour',
-    '11-member',
-    '11-month-old',
     '11.16',
-    '11.25',
-    '11.32',
-    '11.36',
-    '110g',
-    '1110',
-    '1112',
-    '1116',
-    '1131',
-    '1133',
-    '114,000',
-    '1144',
-    '1146',
-    '1194',
-    '11b',
-    '11s.',
     '12&frac12;p',
-    '12&ndash;10',
-    '12&ndash;12',
-    '12&ndash;20',
-    '12&ndash;6',
-    '12,600',
-    '12-minute',
-    '12-point',
-    '12-strong',
-    '12.1%',
-    '12.13',
-    '12.2%',
-    '12.34',
-    '12.35',
-    '12.36',
-    '1218',
     '122,000',
-    '1221',
-    '1226',
-    '1231',
-    '1237',
-    '1249',
-    '1251',
-    '12noon',
-    '13&ndash;12',
-    '13-0',
-    '13-year-olds',
-    '131,000',
-    '1320s',
-    '1353',
-    '1363',
-    '1388',
     '1396',
-    '14-18',
-    '14-hour',
-    '14-strong',
-    '1407',
-    '140cm',
-    '140lb',
-    '1414',
-    '1430s',
-    '1441',
-    '1454',
-    '145p',
-    '1464',
-    '1467',
-    '1481',
-    '14s.',
     '15&ndash;1',
-    '15-',
-    '15-5',
-    '15-8',
-    '15.9',
-    '1504',
-    '1509&ndash;1558',
-    '150p',
-    '16&ndash;12',
-    '16&ndash;4',
-    '16-21',
-    '16-hour',
-    '16-inch',
-    '16-member',
-    '16-strong',
-    '16.8%',
     '16s.',
-    '17&frac12',
-    '17&ndash;3',
-    '17(3)',
-    '17-stone',
-    '175th',
-    '1798&ndash;9',
-    '17a',
-    '18&ft',
-    '18.4%',
-    '1800&mdash;1',
-    '1808&ndash;14',
-    '18cm',
-    '18m',
-    '19-23',
-    '19.',
     '19.7%',
-    '1905&ndash;7',
-    '1914&ndash;1918',
-    '1919&ndash;20',
-    '1924&ndash;5',
-    '1927&ndash;8',
-    '1931&ndash;2',
-    '1936&ndash;37',
-    '1941&ndash;2',
-    '1947&ndash;8',
-    '1951&ndash;64',
-    '1952&ndash;70',
-    '1964&ndash;65',
-    '1966&ndash;7',
-    '1968&ndash;70',
-    '1969/70',
     '19705',
-    '1973/74',
-    '1976&ndash;77',
-    '1976.',
-    '1985&ndash;89',
-    '1991/1992',
-    '1992-h',
-    '1992/1993',
-    '1994/5',
-    '19mm',
-    '1:4',
-    '1bg',
-    '1d.',
-    '1dq',
-    '1f',
-    '1kg/2lb',
     '1x15',
-    '2&mgr;m',
-    '2&ndash;3min',
-    '2&ndash;4pm',
-    '2&times;10',
-    '2,166',
-    '2,300,000',
-    '2,500ft',
-    '2,600,000',
-    '2-ply',
-    '2.03',
-    '2.34',
-    '2.36',
-    '2.39',
-    '2.44',
-    '2.5.1',
     '2.5ml',
-    '2.5pc',
-    '2.7.2',
-    '20&ndash;25%',
-    '20-',
-    '20.3%',
-    '20.8',
-    '20.8%',
-    '200mph',
-    '2089',
-    '20a',
-    '20ms',
-    '21&ndash;may',
-    '21.10',
-    '21064',
-    '216&sol;87',
     '22&ndash;3',
-    '22&ndash;6',
-    '22.6%',
-    '223&sol;86',
-    '225p',
-    '23.8',
-    '230mm',
-    '24&ndash;36',
-    '24&ndash;48',
-    '24.8',
-    '25&ndash;50',
-    '25.8',
-    '250-member',
-    '250000',
-    '250g/9oz',
-    '250hp',
     '26.4',
-    '26.9',
-    '27&ndash;29',
-    '27(2)',
-    '27.8%',
-    '27a',
-    '28&ndash;31',
-    '28.3',
-    '2857',
-    '287(1)',
-    '29-july',
-    '29-march',
-    '29.6',
-    '2d6',
-    '2lx',
-    '2mbps',
     '2v',
-    '3(a)',
-    '3-7',
-    '3-year-olds',
-    '3.2.3',
-    '3.30am',
-    '3.31',
-    '3.4.0',
-    '3.4p',
-    '3.5.2',
-    '30&ft',
-    '30\'s',
-    '30.2',
-    '30.3%',
-    '300&deg;c',
-    '300mhz',
     '300ml/',
-    '300p',
-    '300sl-24',
-    '3090',
-    '30cms',
-    '30mw',
-    '31.4',
-    '31.5',
-    '31.7',
-    '32.7',
-    '33.3',
-    '33.7',
-    '3350',
-    '34.4',
-    '3400',
-    '35.4',
     '36.3',
-    '3630',
-    '36657',
-    '36836',
-    '36881-82',
-    '36ft',
-    '37&frac12;p',
-    '37.1',
-    '37.3',
-    '37124',
-    '37125',
-    '37130',
-    '37133',
-    '37158',
-    '37195',
-    '37246',
     '37268',
-    '37366',
-    '37367',
-    '37379',
-    '37393',
-    '37394',
-    '37451',
-    '37452',
-    '37472',
-    '37529',
-    '37550',
-    '37626',
-    '37630',
-    '37731',
-    '37758',
-    '37761',
     '37783',
-    '37903',
-    '37907',
-    '37908',
-    '37909',
-    '37947',
-    '37966',
-    '38.3',
-    '38003-04',
-    '38093',
-    '38175',
-    '38190',
-    '38202',
-    '38207',
-    '38213',
-    '38283',
     '38300',
-    '38350',
-    '38439',
-    '38685',
-    '38703',
-    '38742',
-    '38787',
-    '38788',
-    '38789',
-    '38846-47',
-    '38886',
-    '38914',
-    '38937',
-    '38968',
-    '39.5%',
-    '390s',
     '39108',
-    '39116',
-    '39122',
-    '3lbs',
-    '3w',
-    '4&ndash;29',
-    '4(4)',
-    '4(5)',
-    '4-8',
-    '4.1.3',
-    '4.15pm',
-    '4.55',
-    '4.5m',
-    '40&ndash;45',
-    '400&deg;c',
-    '400-strong',
     '4000rpm',
-    '400cc',
-    '400mh',
-    '41pc',
-    '430,000',
-    '440,000',
-    '4444',
-    '45m',
-    '46521',
-    '47p',
-    '48.9%',
-    '48pc',
-    '49.9',
-    '4:18',
-    '4e',
-    '4pt',
     '5(b)',
-    '5-',
-    '5-a-side',
-    '5.2.4',
-    '5.25%',
-    '5.26',
-    '5.3(a)',
-    '5.34',
-    '5.4.4',
-    '50.2',
-    '50.7',
-    '50.8',
-    '500,000,000',
-    '500s',
-    '5250',
-    '540,000',
     '550p',
-    '56mbar',
-    '59,000',
-    '6,300',
-    '6,400',
-    '6-mp',
-    '6.38',
-    '6.5.3',
-    '6.5m',
-    '6.6&ndash;6.8',
-    '60&deg;f',
-    '60&ins',
-    '60,000,000',
-    '60-minute',
-    '60-strong',
-    '60/40',
     '600ft',
-    '60km',
-    '60w',
-    '617949',
-    '635898',
-    '64kbps',
-    '6502',
-    '6536',
-    '6v',
-    '7&deg',
-    '7,800',
-    '7-eleven',
-    '7.16',
-    '70&ndash;75',
-    '71p',
-    '72&ins',
     '75&deg;f',
-    '75+',
-    '76-year-old',
-    '77093',
-    '780s',
-    '783',
-    '790s',
-    '7:84',
-    '7ins',
-    '8&ndash;15',
-    '8&ndash;4',
-    '8(a)',
-    '8-12',
-    '8-hour',
-    '8.15am',
-    '8.22',
     '8.4.1',
-    '8.4.3',
-    '80-strong',
-    '80386sx',
-    '8088',
-    '80:20',
-    '81,000',
-    '8100',
-    '820s',
-    '85mb',
-    '86&ndash;7',
-    '863',
-    '867',
-    '86p',
-    '882',
-    '88p',
     '89,000',
-    '8lbs',
-    '9&ndash;9',
-    '9(5)',
-    '9,9',
-    '9-hole',
-    '9.19',
-    '9.35',
-    '9.50',
-    '9.6.0',
-    '9.68',
-    '90/110',
-    '900mm',
-    '903',
-    '905',
-    '915',
     '930315',
-    '932',
-    '96,000',
-    '979',
-    '98,000',
-    '99,000',
-    '9c',
-    '9cm',
-    '9km',
-    '9ls',
-    '9s.',
-    'a%',
-    'a&dollar',
-    'a&iuml;oli',
-    'a.2',
-    'a.b',
     'a.f.',
-    'a.h.q.',
-    'a.l',
-    'a.n',
-    'a174',
-    'a22',
-    'a30',
-    'a320',
-    'a35',
-    'a417',
-    'a423',
-    'a65',
-    'a_heck_of_a_lot',
-    'aaaaa',
-    'aaas',
-    'aare',
     'abadia',
-    'abaht',
-    'abalone',
-    'abassi',
-    'abbacy',
-    'abbasid',
-    'abbotts',
-    'abdel-rahman',
-    'abdel-shafi',
-    'abdela',
-    'aberfoyle',
-    'abertillery',
-    'abimael',
-    'above-named',
-    'abreu',
-    'abscopal',
     'absenting',
-    'absolves',
-    'abstinent',
-    'abtrust',
-    'abuts',
-    'abyssorum',
-    'acarnley',
-    'accuracies',
-    'acheloos',
-    'acid-loving',
-    'acidify',
-    'acost',
-    'acquirors',
-    'acquis',
-    'actinic',
-    'action-research',
     'active-site',
-    'actomite',
-    'adamantine',
-    'adami',
-    'adaptiveness',
-    'ademar',
-    'adenoidal',
-    'adenoma-carcinoma',
-    'adesang&eacute',
-    'adhesiveness',
-    'adjugate',
-    'admonishment',
-    'adoimara',
-    'adriatica',
-    'aek',
-    'aemilianus',
     'aemilius',
-    'aeroengines',
-    'aerol&iacute;neas',
-    'aethis',
-    'afars',
-    'affectations',
-    'affianced',
-    'affiliating',
-    'affiliative',
-    'affreightment',
-    'afore-mentioned',
-    'after-match',
-    'ager',
-    'agger',
-    'aggi',
-    'agglutinated',
     'agha',
-    'agi',
-    'agit-pop',
-    'aglen',
-    'aglietta',
-    'agnathan',
-    'agonize',
-    'agri-environment',
-    'agriculture/nature',
-    'agung',
-    'agutter',
-    'ah-ha',
-    'ah4',
-    'ahhhh',
-    'ahriman',
-    'aic',
     'aide-memoire',
-    'aim&eacute',
-    'aimetti',
-    'aimtech',
-    'air-drying',
-    'air-gap',
-    'airacomet',
-    'airburst',
-    'airthrey',
-    'aithough',
-    'aix-la-chapelle',
-    'ajdabiyans',
-    'ajrs',
-    'akeman',
-    'aksed',
-    'akt',
     'al-haroun',
-    'aladin',
-    'alamena',
-    'alb&eacute',
-    'alberoni',
-    'albite',
-    'alcala',
-    'alcide',
-    'alcorn',
-    'aldehydes',
-    'alden',
-    'aldercine',
-    'aldred',
-    'aldwark',
-    'aleks',
-    'alemannia',
     'alemao',
-    'alen',
-    'alesana',
-    'aleuadai',
-    'alexiou',
-    'alfonsin',
-    'algebras',
-    'alienable',
-    'alienations',
-    'alistare',
-    'alka-seltzer',
-    'alkenes',
-    'all-nighter',
-    'allchin',
-    'allee',
-    'alloprene',
     'allosteric',
-    'alm',
-    'alma-tadema',
-    'almroth',
-    'alnasr',
-    'alnmouth',
-    'alpheus',
-    'alphonso',
-    'altiplano',
-    'amann',
-    'amaya',
-    'ambler',
-    'ambrosius',
-    'amenophis',
-    'amercement',
-    'americanisms',
     'amey',
-    'amhara',
-    'amici',
-    'amiel',
-    'amnesiac',
-    'amoeba-like',
-    'amoxycillin',
-    'amphipathic',
-    'amphisbaenians',
-    'amstrads',
-    'amwell',
-    'amyl',
-    'an-2',
-    'analysand',
-    'ancoats',
-    'and_of',
     'androcentric',
-    'andronikos',
-    'angelique',
-    'angella',
-    'angiographic',
-    'anglo-russian',
-    'angostura',
-    'angoumois',
-    'anharmonicity',
-    'anhydrous',
-    'anibal',
-    'animatronics',
-    'anke',
-    'annapolis',
-    'annemarie',
-    'anni',
     'anniesland',
-    'annwyl',
-    'anodised',
-    'anonimalle',
-    'anthemic',
-    'anti-bolshevik',
-    'anti-capitalism',
-    'anti-europe',
-    'anti-gay',
-    'anti-icam-1',
-    'anti-intellectualism',
-    'anti-military',
-    'anti-revolutionary',
-    'anti-russian',
-    'anti-tetanus',
-    'anti-zionist',
     'antifungal',
-    'antihistamine',
-    'antimacassars',
-    'antipas',
-    'antiphons',
-    'antiquark',
-    'antithrombotic',
-    'antituberculous',
-    'antonini',
-    'antonioni',
-    'antrectomy',
-    'anzio',
-    'aosta',
-    'ap1000',
-    'ap5',
-    'aperiodic',
     'apgar',
-    'apistogramma',
-    'apollinare',
-    'app.',
-    'app.cas.',
-    'appc',
-    'appen',
-    'applebaum',
-    'applegath',
-    'applesearch',
-    'apposed',
-    'appreciations',
-    'april-june',
-    'aproned',
-    'apscore',
-    'apted',
     'aquae',
-    'aquatica',
-    'aquifolium',
-    'ar&ecirc;tes',
-    'ar-wacc',
-    'arabica',
-    'arara',
-    'arcado',
-    'arch-conservative',
-    'archaism',
-    'archaos',
-    'arche',
-    'archipenko',
-    'archosaur',
-    'ardbeg',
-    'arddu',
     'areopagite',
-    'argand',
-    'argenteus',
-    'argies',
-    'argonauts',
-    'ariana',
-    'aristo',
-    'arjo',
-    'arlidge',
-    'arm-wrestling',
-    'armagnacs',
-    'arman',
-    'arms-race',
-    'armscott',
-    'arncliffe',
-    'arndorfer',
     'arnett',
-    'arnoux',
-    'arraignment',
-    'arriaga',
-    'arrogate',
-    'arsena',
-    'arteh',
-    'articulacy',
-    'artrageous',
-    'arune',
-    'arvensis',
-    'asah',
-    'ascensionists',
-    'ascriptions',
-    'ashburn',
-    'ashton-tate',
     'ashwood',
-    'asmoyah',
-    'aso',
-    'aspinwall',
-    'assembl&eacute;e',
-    'assemblymen',
-    'asser',
-    'asset-backed',
-    'asset-stripping',
-    'astrocytes',
-    'astronomic',
-    'astrophysicists',
-    'atavism',
-    'atcham',
-    'atea',
-    'atheistical',
     'ati',
-    'atiyah',
-    'atlantique',
-    'atoned',
-    'atrakhasis',
-    'attainder',
-    'attax',
-    'atte',
-    'atticus',
-    'attigny',
-    'attitude-change',
-    'audibility',
-    'audio-cassette',
-    'audio-tapes',
-    'audiometry',
-    'audiovisuals',
     'audra',
-    'aui',
-    'auklet',
-    'aula',
-    'auriega',
-    'aussi',
-    'austerlitz',
-    'austrasiacae',
-    'austrasian',
-    'auteuil',
-    'auto-exposure',
-    'autobahns',
-    'autocephalous',
-    'automatized',
-    'autosomal',
-    'avanti',
     'avenches',
-    'averay',
-    'averment',
-    'avia',
-    'awa\'',
-    'awd',
-    'awkwardnesses',
-    'axford',
-    'axholme',
-    'axillaries',
-    'ayasofya',
-    'aylmerton',
-    'aythya',
-    'ayub',
-    'azo-bound',
-    'azzopardi',
     'b&eacute;arnais',
-    'b&eacute;b&eacute',
-    'b&ouml;hm',
-    'b\'',
-    'b.1',
-    'b.sc.',
-    'b13',
-    'b1348',
-    'b14',
-    'b18',
-    'b=2',
-    'baaf',
-    'baathist',
-    'babrak',
-    'baby-boom',
-    'baby-boomers',
     'baccalaureate',
-    'bacharach',
-    'bachmann',
-    'back-burner',
-    'back-office',
-    'back-slash',
-    'back-stabbing',
-    'backfilling',
-    'backpass',
-    'bacteriologists',
-    'bacteriophages',
-    'baena',
-    'baggs',
-    'baglietto',
-    'baglin',
-    'bail&eacute;n',
     'baiter',
-    'baldessari',
-    'baldi',
-    'baldwins',
-    'balers',
-    'ballcock',
-    'ballgowns',
-    'ballingolin',
-    'balloonists',
-    'ballyskeagh',
-    'baltics',
-    'baly',
-    'bamberger',
-    'bamert',
-    'bandmaster',
-    'bani-sadr',
     'banton',
-    'bar-hillel',
-    'bar-like',
-    'barbarities',
-    'barbera',
-    'bardell',
-    'bare-chested',
-    'bare-knuckle',
-    'baronnies',
-    'barrel-bag',
-    'barrel-chested',
-    'barroso',
-    'bartolommeo',
-    'barvas',
-    'barytes',
-    'basford',
     'bashers',
-    'bassoonist',
-    'basted',
-    'batson',
-    'battening',
-    'batterie',
-    'baxters',
-    'bayed',
-    'baysford',
-    'bazalgette',
-    'bazeley',
-    'bazookas',
-    'bbcbasic',
-    'beacham',
-    'beachcombers',
-    'beachcombing',
     'beardshaw',
-    'beareth',
-    'beaucoup',
-    'beaumarchais',
-    'bechuanaland',
-    'beckerman',
-    'bed-time',
-    'bedwetter',
-    'bee-eater',
-    'beechams',
-    'beekeeper',
-    'beggarly',
-    'begrudgingly',
-    'behrend',
-    'bel-hathor',
-    'bel-korhadris',
     'belegar',
-    'belfield',
-    'bell-rope',
-    'bellany',
-    'bellavista',
-    'bellay',
-    'bellend',
-    'belleville',
-    'bellford',
-    'belli',
-    'bellyful',
-    'belstead',
-    'benda',
-    'bendall',
-    'benevolences',
-    'bengt',
     'benison',
-    'benning',
-    'benoxaprofen',
-    'bentwich',
-    'beranek',
-    'berengaria',
-    'beri',
-    'berinsfield',
-    'berio',
-    'berka',
-    'berm&uacute;dez',
-    'berneray',
-    'berrow',
-    'bertelsmann',
-    'berthoud',
-    'bertolt',
     'besom',
-    'bespattered',
-    'best-paid',
-    'best-remembered',
-    'betws',
-    'bever',
-    'bewail',
-    'bewilderedly',
-    'bewitch',
-    'bexleyheath',
-    'beyeler',
-    'bfa',
-    'bfrc',
-    'bgl',
-    'bibliometrics',
-    'biblioteca',
     'bibliotheca',
-    'bibliotheque',
-    'bicarbonates',
-    'bicktons',
-    'bidgood',
-    'biennially',
-    'bifocals',
-    'big-match',
-    'big-screen',
-    'biggart',
-    'bigness',
-    'bignor',
-    'bigrams',
-    'bihac',
-    'biiba',
-    'bilabial',
     'bilardo',
-    'bilk',
-    'bilko',
-    'billfold',
-    'billion-dollar',
-    'bimal',
-    'bindoff',
-    'binet',
-    'binh',
-    'binson',
-    'bioenergy',
-    'biogenic',
-    'biogeographers',
-    'biomes',
-    'bioscope',
-    'biostratigraphy',
     'biotite',
-    'bioturbation',
-    'birch-bark',
-    'bircham',
-    'birger',
-    'birkhall',
-    'birling',
-    'birnbaum',
-    'birr',
-    'birthdate',
-    'birtles',
-    'biscuity',
-    'bismarckian',
-    'bit-mapped',
-    'bit-pattern',
-    'bivalent',
     'biven',
-    'bizango',
-    'bj-200',
-    'blab',
-    'black-hole',
-    'black-throated',
-    'blackbury',
-    'blackham',
-    'blackshard',
-    'blackton',
-    'blackwellgate',
-    'blagrave',
-    'blairgowrie',
-    'blameworthiness',
-    'blasendorf',
-    'blasphemer',
     'blathering',
-    'blavatsky',
-    'blecha',
-    'blick',
-    'blidworth',
-    'blimming',
-    'blind-alley',
-    'blood-filled',
-    'blood-group',
-    'blood-thirsty',
-    'bloodlines',
-    'blore',
-    'blotters',
-    'blowhole',
-    'blowpipes',
-    'blox',
     'blu',
-    'blue-greens',
-    'blueboy',
-    'bluejohn',
-    'bluescript',
-    'bluestone',
-    'bluett',
-    'blunsdon',
-    'blunting',
-    'boatyards',
-    'bocca',
-    'bodega',
-    'bodge',
-    'bodhran',
-    'bodine',
-    'bodnant',
     'body-language',
-    'bodybuilder',
-    'bog-standard',
-    'bogdanovic',
-    'boh&egrave;me',
-    'boivin',
-    'bolides',
-    'bolivar',
-    'bollworm',
-    'bolovian',
-    'boltby',
-    'bolters',
-    'bomb-proof',
-    'bon_viveur',
-    'boni',
-    'bonio',
     'bonis',
-    'boo-boo',
-    'boobies',
-    'boobytraps',
-    'boogification',
-    'bookplate',
-    'bookplates',
-    'boomers',
-    'boomtown',
-    'bootleggers',
-    'bootstrap',
-    'bootsy',
-    'boppard',
-    'bopped',
-    'bora',
-    'boreas',
     'borlotti',
-    'borromean',
-    'borselen',
-    'bosley',
-    'bosporus',
-    'bothe',
-    'bottom-living',
-    'boulanger',
-    'bourchier',
-    'bourgelat',
-    'bourgeois-democratic',
-    'bourgoin',
-    'bousquet',
-    'bouyer',
-    'bovet',
-    'bowcott',
     'bowdler',
-    'bowl-shaped',
-    'bowthorpe',
-    'box-shaped',
-    'boxplots',
-    'boy-friends',
-    'boyd-carpenter',
-    'boyos',
-    'bozinoski',
-    'bpm',
-    'bpr',
-    'brabourne',
-    'bracco',
-    'brackett',
-    'bradenham',
-    'bradford-on-avon',
     'braes',
-    'brah&eacute',
-    'brained',
-    'brainpower',
-    'braithwaites',
-    'bramante',
-    'bramber',
-    'branchings',
-    'brandishes',
-    'brandl',
-    'branksome',
-    'brantingham',
-    'brasiliensis',
-    'bravoes',
-    'brawdy',
-    'breadcrumb',
     'breast-stroke',
-    'breath.',
-    'breedt',
-    'bremerhaven',
-    'briand',
-    'briault',
-    'brick-lined',
-    'brickley',
-    'bridged-t',
-    'briggflatts',
-    'brilliancy',
-    'brinsley',
-    'bristol-myers',
-    'british-irish',
-    'brixworth',
-    'broad-money',
     'broad-ranging',
-    'broadmeyer',
-    'broadsword',
-    'broady',
-    'brodkey',
-    'broederbond',
-    'broletto',
-    'bromophenol',
-    'bronica',
-    'bronski',
-    'brookwood',
-    'brownes',
-    'brownish-green',
-    'brownlie',
-    'brung',
-    'bruntsfield',
     'brusberg',
-    'brushstrokes',
-    'brusqueness',
-    'brutalism',
-    'brutishness',
-    'bryanston',
-    'brydon',
-    'bsn',
-    'btoe',
-    'bubblejet',
-    'bucar',
-    'buch',
-    'buchholz',
-    'buchman',
-    'buckey',
-    'buddy-buddy',
     'budging',
-    'buen',
-    'buildin\'',
-    'building-blocks',
-    'bull-dog',
-    'bullins',
-    'bullough',
-    'bullpot',
-    'bullrushes',
-    'bulstrode',
-    'bumford',
-    'bumstead',
-    'bunge',
-    'burch',
-    'burchell',
-    'bureaucratic-technical',
     'burgomeisters',
-    'burhaneddin',
-    'burk',
-    'burkard',
-    'burlesdon',
-    'burlesques',
-    'burnden',
-    'burnham-on-sea',
-    'burray',
-    'burry',
-    'burstall',
-    'burton-roberts',
-    'burwell',
-    'buryat',
-    'buryats',
-    'buscot',
     'bused',
-    'busies',
-    'business-led',
-    'business-related',
-    'business-unit',
-    'businessloan',
-    'buskett',
-    'busses',
-    'bustos',
-    'button-hole',
-    'buttoned-up',
-    'buttressing',
-    'buzzwords',
-    'by-roads',
-    'by-your-leave',
-    'byam',
     'byars',
-    'byles',
-    'byres',
-    'byroad',
-    'bywater',
-    'c&mdash',
-    'c-based',
-    'c-fos',
-    'c-urea',
-    'c.m.l.r.',
-    'c.reinhardtii',
-    'c100',
-    'c57bl/6j',
-    'c65',
-    'c6pg7',
-    'c9pa10',
     'cabbalistic',
-    'cabg',
-    'cabman',
-    'cackles',
-    'caco-2',
-    'cads',
-    'caduceus',
-    'cadzow',
-    'caines',
-    'caking',
-    'calabar',
-    'calatrava',
-    'calders',
-    'calfskin',
-    'call-slips',
-    'calverley',
     'camacho',
-    'cambered',
-    'cameroons',
-    'camfield',
-    'camiknickers',
-    'camming',
-    'campa',
-    'campania',
-    'campeau',
-    'campsfield',
-    'can\'t',
-    'canadian-born',
-    'canalization',
-    'candelabras',
-    'candolle',
-    'canina',
     'canisp',
-    'cannibalised',
-    'cannonade',
-    'cantab',
-    'canting',
-    'capitain',
-    'capital-goods',
-    'capitalises',
-    'capodimonte',
-    'captive-breeding',
-    'capuchins',
-    'car-hire',
-    'carbenoxolone',
-    'carbines',
-    'carbonara',
-    'carbonised',
     'carboxy-terminal',
-    'carcani',
-    'carco',
-    'cardiorespiratory',
-    'cardmaker',
-    'cargolux',
-    'carissima',
-    'carlingford',
-    'carmon',
-    'carneddau',
-    'carniola',
-    'carnon',
-    'carnwath',
-    'carob',
-    'carphone',
-    'carr&agrave',
     'carruth',
-    'carteron',
-    'carve-up',
-    'carville',
-    'cassation',
-    'cassia',
-    'cassiterite',
-    'castelnaudary',
-    'castelnovo',
-    'castelsandra',
-    'castlegate',
-    'casuarina',
-    'catabolism',
-    'catalysing',
-    'catalytically',
-    'catena',
     'caterdata',
-    'caterwauling',
-    'cathays',
-    'catullus',
-    'catwoe',
-    'causer',
-    'causey',
-    'cavalcanti',
-    'cawed',
-    'ccb',
-    'cccs',
-    'cci',
-    'cclgf',
-    'ccoac',
-    'ccpm',
-    'cd\'s',
     'ceau&scirc;escu',
-    'cecos',
-    'cedras',
-    'ceilidhs',
-    'celati',
-    'cell-surface',
-    'central-heating',
-    'centrally-planned',
-    'centroids',
-    'ceptor',
-    'cera',
-    'certitudes',
-    'cervi',
-    'chain-smoked',
-    'chalcedon',
-    'chalton',
     'chambliss',
-    'chameleon-like',
-    'chamerovzow',
-    'chamfered',
-    'chapeltown',
-    'chapuis',
-    'characin',
-    'charge-capped',
-    'charge-capping',
-    'charlecote',
-    'charlottetown',
-    'charme',
-    'charmouth',
-    'charwelton',
-    'chauncy',
-    'checkup',
     'cheeked',
-    'cheiffou',
-    'chek',
-    'chell',
-    'chemie',
-    'chemmod',
-    'chemoprophylaxis',
-    'cheque/po',
-    'cherchesov',
-    'cherrill',
-    'cherry-red',
-    'cherts',
-    'cherubini',
-    'chestnut-coloured',
-    'chetwyn',
-    'chiasmus',
     'chiefest',
-    'chiggers',
-    'chikane',
-    'chimneypiece',
-    'chirbury',
-    'chirruping',
-    'chiswell',
-    'chiu',
-    'chlamydomonas',
-    'chlo&euml',
-    'chlor-alkali',
-    'choate',
-    'choc-a-bloc',
-    'chocked',
-    'cholangiogram',
-    'chomskian',
     'chooser',
-    'chorus/mix',
-    'choudhry',
-    'chowk',
-    'christou',
-    'chrome-plated',
-    'chubais',
-    'chur',
-    'church-state',
-    'chx',
-    'cider-making',
-    'cigognes',
-    'cii',
-    'ciliated',
-    'cinematographic',
-    'cinzano',
     'circassian',
-    'circlets',
-    'circulator',
-    'circumlocutions',
-    'cire',
-    'ciriaco',
-    'citub',
-    'civico',
-    'clacton-on-sea',
-    'clairvoyants',
-    'clannish',
-    'clanricarde',
-    'claremount',
-    'claudettina',
-    'clayey',
-    'claypole',
     'cleats',
-    'clenches',
-    'clepsydra',
-    'cleveley',
-    'clever-clever',
-    'climatically',
-    'cll',
-    'cloner',
-    'clonmel',
-    'closed-in',
-    'closely-guarded',
-    'clothes-line',
-    'clouthier',
-    'clp',
-    'club-armed',
-    'clynes',
     'clypeus',
-    'cm3',
-    'cmac',
-    'co-authors',
-    'co-counselling',
-    'co-developing',
-    'co-incidentally',
-    'co-organiser',
-    'co-president',
-    'co-sponsor',
-    'co-starred',
-    'coachwork',
-    'coal-mine',
-    'coaxes',
-    'cobdenite',
-    'codelco',
     'coders',
-    'coercively',
-    'coffin-makers',
-    'cognitive-behavioural',
-    'coheir',
-    'coiffured',
-    'coin-operated',
-    'cold-calling',
-    'cold-shouldered',
-    'cold-weather',
-    'coleworthy',
-    'colicky',
-    'colindale',
-    'colipase',
-    'collagens',
-    'collates',
     'colledge',
-    'collops',
-    'colloquialisms',
-    'collum',
-    'colmore',
-    'colombi',
-    'colonscopy',
-    'colorants',
-    'colposcopy',
-    'cols.',
-    'combativeness',
-    'combi',
-    'comdex/fall',
-    'comedown',
-    'comerford',
-    'comlon',
     'commensal',
-    'commerical',
-    'commissure',
-    'communicado',
-    'comp&egrave;re',
-    'companys',
-    'compartmentalization',
-    'compendia',
-    'complainers',
-    'complementation',
-    'compliances',
-    'comstock',
-    'con-trick',
-    'concatenated',
-    'concensus',
-    'concert-goers',
     'concessionaires',
-    'concierges',
-    'concs',
-    'condam',
-    'conductances',
-    'confidantes',
-    'configurator',
-    'conflans',
-    'confounders',
-    'coningham',
-    'conjoining',
-    'conjugates',
-    'connoting',
-    'consecrating',
-    'conservative-liberal',
-    'consistencies',
     'consomm&eacute',
-    'conspectus',
-    'constantinescu',
-    'construes',
-    'consumer-led',
-    'continuous-process',
-    'contorting',
-    'contra-indicated',
-    'contradictorily',
-    'contradictoriness',
-    'contrarily',
-    'contrastingly',
-    'convenes',
-    'convergences',
-    'convoked',
-    'convulse',
     'cooksley',
-    'cool-headed',
-    'cooperates',
-    'copleys',
-    'copper-coloured',
-    'copulated',
-    'coquettishly',
-    'cora',
-    'corbelled',
-    'corcyra',
-    'cordata',
-    'corn-coloured',
-    'cornetto',
-    'cornwallis',
-    'coronaries',
-    'corporate-strategy',
     'corpuses',
-    'corraface',
-    'correll',
-    'corse',
-    'corseted',
-    'coru&ntilde;a',
-    'corvedale',
-    'cosham',
-    'cosines',
-    'cost-efficient',
-    'coteries',
-    'cotinine',
-    'cottesloe',
-    'coughton',
-    'counter-accusations',
-    'counter-balanced',
     'countermand',
-    'countersign',
-    'country-by-country',
-    'countrywatch',
-    'courcy',
-    'courtes',
-    'couzens',
-    'covets',
-    'covey',
-    'cowe',
-    'cowlairs',
-    'cowsheds',
-    'coxydene',
-    'cp28',
-    'cpi-c',
-    'cpsa',
     'cr&ecirc;pe-de-chine',
-    'craftmanship',
-    'craine',
-    'cranbourne',
-    'crania',
-    'creepy-crawlies',
-    'crefdl',
-    'creffield',
-    'creosoted',
-    'cretinism',
-    'cretins',
-    'creuset',
-    'cri',
-    'cribbing',
-    'cribs',
-    'criccieth',
     'crickmay',
-    'criminalisation',
-    'criminalising',
-    'crisped',
-    'crispus',
-    'cristobal',
-    'crit',
-    'cro&ucirc;te',
-    'crooners',
-    'crop-growing',
-    'cropland',
-    'cross-bar',
-    'cross-checked',
-    'cross-links',
-    'crossan',
-    'crosser',
     'crosswise',
-    'crotches',
-    'crotchety',
-    'crucibles',
-    'crucifying',
-    'crushers',
-    'cruzeiro',
-    'cryogenic',
-    'cryptographer',
-    'cs11',
-    'cstr',
-    'cubiform',
-    'cumulations',
-    'cup-like',
-    'cura&ccedil;ao',
-    'curatory',
     'curriculum-based',
-    'curtails',
-    'cutlass',
-    'cutouts',
-    'cutpurse',
-    'cv8',
-    'cyberscience',
-    'cycloid',
-    'cymen',
-    'cynddylan',
-    'cypress/ross',
-    'cyr',
-    'cyres',
-    'cys177ser',
-    'cytochromes',
-    'cytometer',
     'd&aacute;l',
-    'd&eacute;mocrates',
-    'd\'aquitaine',
-    'd\'armande',
-    'd\'aubuisson',
-    'd\'auvergne',
-    'd\'oc',
-    'd.a',
-    'd.i.y',
-    'd.phil',
-    'd/',
-    'd15s12h',
-    'daba',
-    'dabblers',
-    'daemonettes',
-    'dafne',
     'daftness',
-    'daguerreotypes',
-    'dahmer',
-    'dahn',
-    'daim',
-    'dainton',
-    'dairymen',
-    'dalbeattie',
-    'dallhold',
-    'dalling',
-    'dalmellington',
-    'dalwolsey',
-    'damascena',
-    'damns',
-    'danceable',
-    'danckwerts',
     'dander',
-    'dankworth',
-    'danov',
-    'danske',
-    'dapi',
-    'dark-panelled',
-    'darkie',
-    'darks',
-    'darnall',
-    'darth',
-    'databanks',
-    'datacom',
-    'dataflex',
-    'datagate',
-    'datp',
-    'datura',
     'dawda',
-    'day/night',
-    'dazzler',
-    'dazzles',
-    'dc-6',
-    'dc/dcs',
-    'dc9',
-    'dca',
-    'de-limited',
-    'deactivate',
-    'deansgate',
-    'debasing',
-    'debauch',
-    'decamer',
-    'decent-sized',
-    'decision-',
     'decision-takers',
-    'decisionmaking',
-    'decoction',
-    'decompress',
-    'decretal',
-    'decretum',
-    'decries',
-    'decriminalisation',
-    'deddington',
-    'dedicatee',
-    'deep-fat',
-    'deepcar',
-    'defame',
-    'defeatedly',
-    'definer',
-    'deflector',
     'deforms',
-    'deglutitive',
-    'dehumanized',
-    'dehydrating',
-    'deictically',
-    'delahunty',
-    'delicensed',
-    'delingpole',
-    'deliverances',
-    'delmar',
-    'delphine',
-    'demain',
-    'dematerialisation',
-    'demelza',
-    'demigods',
-    'demobilize',
     'democratize',
-    'demontis',
-    'dendera',
-    'densa',
-    'densely-populated',
-    'denwood',
-    'dependences',
-    'depersonalization',
-    'depletions',
-    'deprecatingly',
-    'deric',
-    'deriding',
-    'derogated',
-    'descenders',
-    'description-is',
-    'desecrating',
     'desideratum',
-    'despond',
-    'destivelle',
-    'destocking',
-    'determiners',
-    'deut',
-    'deuteron',
-    'deutsches',
-    'deutschlands',
-    'deuxi&egrave;me',
-    'devaty',
-    'devaux',
-    'device=c',
-    'deviously',
-    'dgps',
-    'di-gram',
     'di-pertuan',
-    'diablo',
-    'diagnostically',
-    'dial-a-ride',
-    'dialplus',
-    'dialysate',
-    'diaminobenzidine',
-    'diapause',
-    'diario',
-    'diatryma',
-    'dichroism',
-    'dicketts',
-    'dictyocaulus',
-    'didna',
-    'dieted',
-    'diffley',
     'diffuseness',
-    'digestibility',
-    'diggings',
-    'digitization',
-    'dilapidations',
-    'dillingham',
-    'dilnot',
-    'dilthey',
-    'dimond',
-    'dink',
-    'dinucleotides',
-    'diptych',
-    'disadvantaging',
-    'disambiguated',
-    'disambiguating',
-    'disassembly',
     'disavowals',
-    'disc-shaped',
-    'disclaims',
-    'discomforted',
-    'discordance',
-    'discoursing',
-    'discriminable',
-    'disease-ridden',
-    'disentitled',
-    'dishcloths',
-    'disingenuously',
-    'disinterestedly',
-    'disobeys',
-    'dispassion',
-    'disproof',
-    'disputants',
     'disraelian',
-    'distantiation',
-    'distillate',
-    'distortionary',
-    'dithiadiazole',
-    'diversifications',
-    'diverticulitis',
-    'divestiture',
-    'divide-and-rule',
-    'divison',
-    'dizygotic',
-    'dizzyingly',
-    'djuradj',
-    'dlouhy',
-    'dm2.91',
-    'dm2.92',
     'dmta',
-    'dmz',
-    'dnh',
-    'dntps',
-    'do\'s',
-    'dobermanns',
-    'docosahexaenoic',
-    'doctus',
-    'doddery',
-    'dodecapeptide',
-    'dodsley',
-    'dog-collar',
-    'dog-eat-dog',
-    'dog-like',
-    'doges',
-    'dogfights',
     'doll-like',
-    'domf',
-    'dominguez',
-    'donald/reporting',
-    'donan',
-    'donatio',
-    'donato',
-    'dongle',
-    'donkin',
-    'donner',
-    'donoughmore',
-    'dooby',
-    'doorbells',
-    'doormats',
-    'dordrecht',
-    'dorf',
     'dorland',
-    'dormio',
-    'dotrice',
-    'double-checking',
-    'double-header',
-    'double-knit',
-    'double-locked',
-    'dover-calais',
-    'down-home',
-    'down-wind',
-    'downgrades',
-    'downplay',
-    'downward-sloping',
-    'dowse',
-    'doxa',
-    'dragonlord',
     'dragonrider',
-    'dragonswitch',
-    'dramatisations',
-    'drang',
-    'dratslinger',
-    'dreamworld',
-    'dressing-gowns',
-    'dreux',
-    'drewer',
-    'drgs',
-    'drnovsek',
-    'dromgoole',
-    'drop-dead',
-    'drowsing',
-    'drubb',
-    'drug-dealing',
     'drumlanrig',
-    'dtd',
-    'dua0',
-    'dualities',
-    'dualling',
-    'dublin-born',
-    'dufferin',
-    'duffin',
-    'dufour',
-    'dulac',
-    'dunbarton',
-    'dundrum',
-    'dunnett',
-    'dunsheath',
-    'dunxin',
-    'duofold',
     'dupatta',
-    'dura',
-    'durian',
-    'duriez',
-    'durnford-slater',
-    'durobrivae',
-    'duryea',
-    'dust-jacket',
-    'dvlc',
-    'dwa',
-    'dxf',
-    'dxs178',
-    'dympna',
-    'dynal',
-    'dynamius',
-    'dynasts',
     'e.m.i.',
-    'e/1',
-    'e/1s',
-    'e/a',
-    'e11',
-    'e22',
-    'eaa',
-    'ealdormen',
-    'eanfrith',
-    'earendel',
-    'earn-out',
-    'easiplan',
-    'eason',
-    'easons',
-    'easterlin',
-    'eastry',
     'easy-to-clean',
-    'eata',
-    'eavesdropper',
-    'ebbo',
-    'eccleshare',
-    'ecclesiological',
-    'ecgs',
-    'eckley',
-    'eclair',
-    'ecms',
-    'eco-label',
-    'ecologies',
-    'econ',
-    'ecosphere',
-    'ectoplasm',
-    'edema',
     'eder',
-    'educable',
-    'education/training',
-    'edzard',
-    'eekelen',
-    'efe',
-    'effacement',
-    'effingham',
-    'efi',
-    'eg-1',
-    'eglaf',
-    'egocentricity',
-    'egocentrism',
-    'egrets',
-    'ehrlichman',
-    'eight-and-a-half',
     'eikmeyer',
-    'einhard',
-    'eisenhammer',
-    'ejaculations',
-    'ejb',
-    'ekkaparb',
-    'ekoku',
-    'elcho',
-    'eldred',
-    'eldredge',
-    'electress',
-    'electrically-powered',
-    'electroacupuncture',
-    'electrocardiograph',
-    'electrocute',
-    'electrodynamics',
     'eleusinian',
-    'eliott',
-    'elks',
-    'ellin',
-    'elliots',
-    'ellipsoidal',
-    'elliptically',
-    'elliston',
-    'ellman',
-    'elope',
-    'elsegood',
-    'elstir',
-    'elsynge',
-    'eluate',
-    'eluates',
-    'elver',
     'elysium',
-    'emancipationist',
-    'embalm',
-    'embryologist',
-    'emendatio',
-    'emended',
-    'emerald-green',
-    'emm386',
-    'emmit',
-    'empire-builders',
-    'emsley',
-    'en_famille',
-    'enc',
-    'encephalopathies',
-    'encyclopedie',
-    'endemism',
     'endian',
-    'endobiliary',
-    'endocrinology',
-    'endpaper',
-    'energiser',
-    'enfranchise',
-    'engang',
-    'english-born',
-    'enlists',
-    'ensoll',
-    'enteriditis',
-    'enterocolitis',
-    'enteropathogenic',
-    'entranceway',
-    'entremets',
-    'entwining',
     'enumerates',
-    'environmentally-sensitive',
-    'envoi',
-    'eosinophil',
-    'ephoros',
-    'epicuticle',
-    'epigones',
-    'epiphenomena',
-    'epiphyses',
-    'episteme',
-    'epistemologically',
-    'epistulae',
-    'epo',
-    'epounds',
-    'epris',
-    'eprlf',
     'equilibrate',
-    'equus',
-    'erasers',
-    'eratosthenes',
-    'erddig',
-    'erebus',
-    'erewash',
-    'ergh',
-    'ergot',
-    'erlangen',
-    'escon',
-    'esna',
-    'esop',
-    'esophageal',
-    'espin',
-    'esro',
     'estwick',
-    'et._al',
-    'etam',
-    'ethicists',
-    'etiology',
-    'etymologies',
-    'eulogistic',
-    'euravia',
-    'eurofed',
-    'europeanism',
-    'eutelsat',
-    'eutrophic',
-    'evandrou',
-    'evangelization',
-    'even-numbered',
-    'eventers',
     'ever-rising',
-    'ever-vigilant',
-    'ever-watchful',
-    'everybo',
-    'evett',
-    'evinces',
-    'ex-company',
-    'ex-labour',
-    'ex-players',
-    'ex-police',
-    'ex-smokers',
-    'ex-students',
-    'exacerbations',
-    'exacts',
-    'exafs',
-    'exc',
     'excluder',
-    'exculpate',
-    'exd4',
-    'executables',
-    'exon-enriched',
-    'expences',
-    'experience-curve',
-    'experimentalist',
-    'expressionistic',
-    'externalism',
-    'extirpate',
-    'extra-european',
-    'extra-territorial',
-    'extragalactic',
-    'extraterritorial',
-    'eyck',
     'eye-holes',
-    'eyewash',
-    'eyskens',
-    'f&amp;sharp',
-    'f-111',
-    'f-14',
-    'fa&ntilde;ez',
-    'fablan',
-    'fabricators',
-    'fabrizio',
-    'fabro',
-    'face-framing',
-    'face-threatening',
-    'facetiousness',
-    'facially',
-    'facscan',
     'factitious',
-    'factly',
-    'factor(s)',
-    'fade-out',
-    'faeroe',
-    'faffing',
-    'fair-trade',
-    'faired',
-    'fairfax-vane',
-    'fallback',
-    'fangled',
-    'fantastique',
-    'farloe',
-    'farmworker',
-    'farne',
-    'farouq',
     'farwell',
-    'fast-acting',
-    'fast-rising',
-    'fata',
-    'fatalistically',
-    'fatso',
-    'fatuously',
-    'faucet',
-    'fausto',
-    'fautrier',
-    'favore',
-    'favorita',
-    'fazackerly',
-    'fba',
-    'fcr',
-    'fear-filled',
     'feaver',
-    'fedayeen',
-    'feeding-ground',
-    'feget',
-    'feininger',
-    'feinted',
-    'felbrigg',
-    'felin',
-    'fell-walking',
-    'fellahin',
-    'felts',
-    'fenech-adami',
-    'fenimore',
-    'fera',
-    'ferlinghetti',
-    'ferragamo',
     'ferricyanide',
-    'ferro',
-    'fervid',
-    'feste',
-    'fetishist',
-    'fettiplace',
-    'feudatories',
-    'feyerabend',
-    'fi.',
-    'fibers',
-    'fibonacci',
-    'fibrillar',
-    'fibroid',
-    'fibula',
-    'fichte',
-    'fiddlesticks',
     'fidei',
-    'fidor',
-    'field-day',
-    'field-glasses',
-    'fignon',
-    'figueres',
-    'figurations',
-    'fila',
-    'file-servers',
-    'filetab',
-    'filho',
-    'fill-up',
-    'filmhouse',
-    'filmstrip',
-    'filthiest',
-    'finchale',
     'finely-tuned',
-    'finis',
-    'finitude',
-    'finkelhor',
-    'finningley',
-    'finocchiaro',
-    'fire-place',
-    'fire-resistant',
-    'fired-up',
-    'firefight',
-    'firths',
-    'fiserv',
-    'fissiparous',
-    'fist-sized',
-    'fitchew',
-    'fitzsimons',
     'five-country',
-    'five-metre',
-    'five-o',
-    'five-set',
-    'fixed-length',
-    'flach',
-    'flagella',
-    'flagellum',
-    'flagrante',
-    'flashcards',
-    'flat-top',
-    'flatlets',
-    'flatworm',
-    'flavor',
-    'flavourful',
-    'flaxthorpe',
     'flec',
-    'fletch',
-    'fleur-de-lys',
-    'flight.',
-    'flippin\'',
-    'floatplanes',
-    'floirat',
-    'floor-standing',
-    'florencio',
-    'floridablanca',
-    'flory-huggins',
-    'flosse',
-    'flotel',
-    'flower-patterned',
-    'flowerless',
-    'flowmeter',
     'fluey',
-    'foggo',
-    'fogies',
-    'foisting',
-    'foliot',
-    'folland',
-    'fonseca',
-    'fontwell',
-    'foodies',
-    'foot-high',
-    'foot-long',
-    'footboard',
-    'footmarks',
-    'fops',
-    'fordingbridge',
-    'foreign-affairs',
     'foreign-currency',
-    'forequarters',
-    'forest-dwelling',
-    'foretelling',
-    'forewarn',
-    'forfend',
-    'form-mistress',
-    'formalises',
-    'formalizes',
-    'formgen',
-    'formulator',
-    'forston',
-    'forthrightly',
-    'fortunei',
-    'forty-second',
-    'fossey',
     'foul-tasting',
-    'foundlings',
-    'four-footed',
-    'four-power',
-    'four-times',
-    'four-volume',
-    'fourteen-year-olds',
-    'fourteens',
-    'fowke',
-    'foyster',
-    'fragranced',
-    'fraiche',
-    'framilode',
-    'franchiser',
-    'franco-spanish',
-    'frankensteins',
     'frankenthaler',
-    'franking',
-    'frasnian',
-    'freames',
-    'fredrik',
-    'free-falling',
-    'free-marketeers',
-    'free-trading',
-    'freeboard',
-    'french-born',
-    'french-trained',
-    'frescoed',
-    'fresheners',
-    'fresnaye',
-    'fresno',
-    'fridge/freezer',
     'friers',
-    'frilford',
-    'frisell',
-    'frisia',
-    'frittering',
-    'frog-marched',
-    'front-benchers',
-    'front-of-house',
-    'front-raising',
-    'front-running',
-    'frontbench',
-    'frowsty',
-    'fruiterer',
-    'fruitwood',
-    'fsx',
-    'ft-actuaries',
     'ftir',
-    'ftsp',
-    'fucose',
-    'fujian',
-    'fukuoka',
-    'full-dose',
-    'full-hearted',
-    'full-height',
-    'full-wave',
-    'fully-fashioned',
-    'fun-packed',
-    'functional-level',
-    'fundholder',
-    'fung',
-    'funked',
-    'furber',
     'furley',
-    'furnell',
-    'furriers',
-    'futilely',
-    'fuze',
-    'fwinky',
-    'fx760',
-    'fyffe',
-    'g&amp;g',
-    'g(s)',
-    'g.l.',
-    'g.m.',
-    'g.m.b.h.',
-    'g/s',
-    'g201',
-    'gabonais',
     'gaf',
-    'gaffs',
-    'gaimar',
-    'gaines',
-    'gairy',
-    'gal4',
-    'galeano',
-    'galecron',
-    'gallibaya',
-    'gambolled',
-    'gambrill',
-    'game-playing',
-    'gamebirds',
-    'gamine',
-    'gamow',
-    'gamta',
     'ganbold',
-    'gandini',
-    'gangue',
-    'ganja',
-    'ganz',
-    'gappy',
-    'garaged',
-    'garc&iacute;a-d&iacute;az',
-    'garmisch',
-    'garrimpos',
-    'garuda',
-    'garvagh',
-    'gastro',
-    'gastrocolonic',
-    'gastroscopic',
-    'gatehouses',
     'gateman',
-    'gaucheness',
-    'gaulish',
-    'gaullism',
-    'gautama',
-    'gavyn',
-    'gawking',
-    'gayford',
-    'gazans',
-    'gcg',
-    'gcn4',
-    'gec-ferranti',
-    'gecko',
-    'gediminas',
-    'geevor',
-    'geist',
     'genentech',
-    'generalizable',
-    'genestealers',
-    'genets',
-    'gennep',
-    'geno',
-    'genova',
-    'genteelly',
-    'gentileschi',
-    'gentlewomen',
-    'gentrified',
-    'geomancy',
-    'geometrics',
-    'georgiadis',
-    'geoscientists',
-    'gephardt',
     'geraghty',
-    'german-polish',
-    'germanise',
-    'germi',
-    'gerrish',
-    'gerwyn',
-    'geurrero',
-    'gew&uuml;rztraminer',
-    'ggc',
-    'ghafar',
-    'ghalib',
-    'gharial',
-    'ghee',
-    'ghote',
-    'gianluca',
-    'giant-sized',
     'gibes',
-    'giddily',
-    'gieves',
-    'giffard',
-    'giffens',
-    'gifting',
-    'gigh',
-    'gikuyu',
-    'gilleard',
-    'gilleis',
-    'gillespie/racecourse',
-    'gillington',
-    'gillispie',
-    'gillow',
-    'gimme',
-    'ginn',
     'giraldo',
-    'girl-friendly',
-    'girlschool',
-    'giroldi',
-    'gisborne',
-    'glacially',
-    'gladiolus',
-    'glamorise',
-    'glashow',
-    'glass-walled',
-    'glauconitic',
-    'glemp',
-    'glendale',
-    'glenfinnan',
-    'glengall',
-    'gligorov',
     'glowingly',
-    'gloxinia',
-    'gluey',
-    'gluttonous',
-    'glycolysis',
-    'gmos',
-    'gmsa',
-    'gnaws',
-    'gnocchi',
-    'goal-kicker',
-    'goalies',
-    'goals.',
-    'goans',
-    'gobbing',
-    'gobbles',
-    'goc',
     'god-emperor',
-    'godber',
-    'goddammit',
-    'goddaughter',
-    'gode',
-    'godlessness',
-    'godstone',
-    'gofer',
-    'gohar',
-    'gojjam',
-    'gold-bearing',
-    'gold-edged',
-    'goldblatt',
-    'goldcrest',
-    'goldener',
-    'golgotha',
     'golyadkin',
-    'gomulka',
-    'gon&ccedil;alves',
-    'gonorrhoeae',
-    'goodglass',
-    'goodlooking',
-    'goodmayes',
-    'gookey',
-    'goosander',
-    'gorchakov',
-    'gorgons',
-    'goulds',
-    'governorate',
-    'gr-50',
-    'graaff',
-    'grabb',
     'grable',
-    'gracefulness',
-    'gracia',
-    'grader',
-    'gradgrind',
-    'grahams',
-    'grahamstown',
-    'grammaticalized',
-    'grammatology',
-    'grandmama',
-    'granovsky',
-    'grant-in-aid',
-    'granularity',
-    'graphemes',
-    'graptoloids',
-    'grass-covered',
     'grassing',
-    'grave-diggers',
-    'graziers',
-    'greasby',
-    'greasers',
-    'great-niece',
-    'greathead',
-    'greenacre',
-    'greendale',
-    'greenfields',
-    'greenshank',
-    'greenwald',
-    'grenier',
-    'greuze',
-    'grev',
-    'grey-black',
     'grey-eyed',
-    'greyish-white',
-    'greystone',
-    'grimpen',
-    'grip-plates',
-    'gritt',
-    'grizzling',
-    'grolux',
-    'gronberg',
-    'groot',
-    'gropius',
-    'grosbard',
-    'grossest',
-    'grosseteste',
-    'groundbreaking',
-    'groundedness',
     'groundstaff',
-    'group-based',
-    'grouted',
-    'growing-up',
-    'grunberg',
-    'gryschenko',
-    'gs3',
-    'guant&aacute;namo',
-    'guavas',
-    'guazapa',
-    'gubenko',
-    'gudok',
-    'guerrero',
-    'guibert',
-    'gumshoe',
-    'gunk',
     'gurion',
-    'guth',
-    'guv\'',
-    'gwalchmai',
-    'gwalior',
-    'gwithian',
-    'gwm',
-    'gyaw',
-    'gymnasiums',
-    'gymslip',
-    'gyonval',
-    'gyroscope',
-    'gyroscopes',
-    'h&ouml;yre',
-    'h-bombs',
-    'h-m',
     'h.s.',
-    'h20',
-    'habet',
-    'habitu&eacute;s',
-    'hackballs',
-    'hadar',
-    'haeggman',
-    'haffner',
-    'hafpor',
-    'hage',
-    'hagger',
-    'hahnenkamm',
-    'hahnwald',
-    'hairbrushes',
-    'hairdos',
-    'hairier',
     'half-acre',
-    'half-brick',
-    'half-chewed',
-    'half-darkness',
-    'half-days',
-    'half-door',
-    'half-drowned',
-    'half-glimpsed',
-    'half-jokingly',
-    'half-million',
-    'half-opened',
-    'halfhearted',
-    'halftones',
-    'halfwit',
-    'halides',
-    'hall-mark',
     'hallucinogen',
-    'halogens',
-    'hamadi',
-    'hambone',
-    'haminh',
-    'hammicks',
-    'hampdens',
-    'hamwic',
-    'hand-carved',
-    'hand-eye',
-    'hand-knotted',
-    'hand-tooled',
-    'hand-writing',
-    'handhelds',
-    'handing-in',
-    'handprints',
     'hankers',
-    'hanwag',
-    'haplochromines',
-    'harbinson',
-    'harborne',
-    'harbourside',
-    'hard-packed',
-    'hard-sell',
-    'hard/soft',
-    'hardacre',
-    'hardstand',
-    'harebrained',
-    'hared',
-    'harees',
-    'hareston',
-    'harish',
     'harmoniser',
-    'harnack',
-    'harringay',
-    'harriot',
-    'harrowed',
-    'harrower',
-    'hartheim',
-    'hartigan',
-    'hartmut',
-    'hartog',
-    'harvards',
-    'harvill',
-    'haser',
-    'hashim',
-    'hassans',
-    'hatchetfish',
     'hattingh',
-    'haue',
-    'haug',
-    'have-a-go',
-    'hawkwood',
-    'haziest',
-    'hbo',
-    'hea',
-    'head-modifier',
-    'head-start',
-    'headliners',
-    'headmistresses',
-    'headnote',
-    'headquarter',
-    'headster',
-    'healthiness',
     'hearing-impaired',
-    'hearns',
-    'heart-felt',
-    'heart-strings',
-    'heartedly',
-    'heatherglen',
-    'heathite',
-    'heavily-armed',
-    'hebb',
-    'hebdige',
-    'hedera',
-    'heedlessly',
-    'heeds',
-    'heelas',
-    'hegelianism',
-    'hegley',
     'hei',
-    'heinzer',
-    'heis',
-    'heldenleben',
-    'heligoland',
-    'hellebore',
-    'helpston',
-    'helvellyn',
-    'henk',
-    'hennessey',
-    'hennie',
-    'henpecked',
-    'henriette',
-    'henryk',
-    'her/himself',
-    'herakleophorbia',
     'herbarium/library',
-    'heres',
-    'herevi',
-    'herkimer',
-    'hernus',
-    'herpetic',
-    'herpetiformis',
-    'herrigel',
-    'hertfordshire-based',
-    'heterozygosity',
-    'heward',
-    'hewish',
-    'hexamita',
-    'heybridge',
-    'heydon',
-    'heyford/oxfordshire',
     'heyward',
-    'hi-ho',
-    'hiccoughs',
-    'hiccuping',
-    'hickes',
-    'high-lighted',
-    'high-precision',
-    'high-wire',
-    'highest-ever',
-    'highly-acclaimed',
-    'highly-charged',
-    'highmore',
-    'highsmith',
-    'highwire',
-    'hijaz',
-    'hila',
     'hildebrandine',
-    'hildreth',
-    'hill-walk',
-    'hillcoat',
-    'hillel',
-    'hillend',
-    'hillfort',
-    'hilversum',
-    'hindlegs',
-    'hindlimbs',
-    'hindmarsh',
-    'hinduja',
-    'hipbelt',
-    'hirschman',
-    'hirshhorn',
-    'hirtle',
     'hisd',
-    'hisham',
-    'historiarum',
-    'hitchhiker',
-    'hla-a2.1',
-    'hla-b5',
-    'hla-b53-restricted',
-    'hmn',
-    'hmo',
-    'hobden',
-    'hobnobbing',
-    'hocher',
-    'hoddesdon',
-    'hofmannsthal',
-    'hofstede',
-    'hogged',
     'hogshead',
-    'hogwash',
-    'hogweed',
-    'holberg',
-    'holcus',
-    'holligan',
-    'hollowed-out',
-    'holoenzymes',
-    'holos',
-    'holotype',
-    'holzner',
-    'home-cooking',
-    'homemakers',
-    'homeowner',
-    'homeshield',
-    'homodimers',
     'hopetown',
-    'hopman',
-    'hopp&eacute',
-    'horizontals',
-    'horler',
-    'hormonally',
-    'horrify',
-    'horse-power',
-    'horsed',
-    'horserace',
-    'horsing',
-    'horsmonden',
-    'hose-pipe',
-    'hosepipes',
-    'hossain',
-    'host-based',
     'hostelling',
-    'hot-rod',
-    'houde',
-    'houlston',
-    'houndsditch',
-    'houndsworth',
-    'house-builder',
-    'house-style',
-    'house-trained',
-    'housebreaking',
-    'howdah',
-    'hr.',
-    'hsdu',
-    'hsieh',
-    'hta',
-    'htfiiib',
     'huallaga',
-    'hubback',
-    'hubner',
-    'hue-williams',
-    'huish',
-    'human-made',
-    'humani',
-    'humidifier',
-    'humming-bird',
-    'hummus',
-    'humorists',
-    'humpbacks',
-    'hundred-year-old',
-    'hung-over',
-    'hungered',
-    'hunkers',
     'hunnard',
-    'hunstead',
-    'hunting-ground',
-    'hurcombe',
-    'hurn',
-    'hurter',
-    'husbanding',
-    'huskisson',
-    'huvec',
-    'hybridizes',
-    'hydrogeologist',
-    'hydrolyse',
-    'hydrotechnica',
-    'hygrophila',
-    'hynd',
-    'hyperphenylalaninaemia',
     'hypnotize',
-    'hypoallergenic',
-    'hypotonia',
-    'hysen',
-    'hyson',
-    'i-ii',
-    'i2',
-    'iapetus',
-    'ibbs',
-    'ibca',
-    'ibj',
-    'ibos',
-    'ibrahima',
-    'ibrd',
-    'ice-pick',
-    'icefield',
     'icknield',
-    'icrf',
-    'idbs',
-    'idealistically',
-    'ideality',
-    'ieng',
-    'igadd',
-    'iiia',
-    'ikhwan',
-    'ikons',
-    'il-1&bgr',
-    'il-2',
-    'ile-de-france',
-    'ileocolic',
-    'ilg',
-    'ill-advisedly',
     'ill-assorted',
-    'ill-disciplined',
-    'ill-favoured',
-    'ill-trained',
-    'illona',
-    'illumine',
-    'illus.4',
-    'illyria',
-    'image-processing',
-    'imbuing',
-    'imf-approved',
-    'immobilization',
-    'immunochemical',
-    'immunohistochemically',
-    'immunotherapy',
-    'imperiale',
     'imperilling',
-    'impersonators',
-    'impertinently',
-    'implores',
-    'impolitic',
-    'impregnate',
-    'imprisons',
-    'improvization',
-    'imprudently',
-    'imputes',
-    'imshi',
-    'in-breeding',
-    'in-coming',
-    'in-fill',
-    'in-the-money',
-    'in-vivo',
     'in_back_of',
-    'inanities',
-    'inchbrook',
-    'inclusiveness',
-    'incommensurate',
-    'incomprehensibility',
-    'incongruence',
-    'inconsolably',
-    'incontinently',
-    'incorrigibly',
-    'indefiniteness',
-    'indestructibility',
-    'indian-born',
-    'indicia',
-    'indisciplined',
-    'indistinguishably',
     'induct',
-    'industriousness',
-    'inelasticity',
-    'ineligibility',
-    'ines',
-    'infantilism',
-    'infecund',
-    'infills',
-    'influenzae',
-    'infonet',
-    'infradiagonal',
-    'infuses',
-    'ing&eacute;nue',
-    'ingledew',
-    'ingli',
-    'ingrate',
     'ingush',
-    'inhalants',
-    'inhales',
-    'inheritable',
-    'inhomogeneities',
-    'initialisation',
-    'injection-moulded',
-    'ink-jet',
-    'inmarsat',
-    'innateness',
-    'inner-cities',
-    'innovated',
-    'inro',
-    'insecticidal',
-    'insensibly',
-    'inspectorial',
     'instrument-makers',
-    'insurable',
-    'intelloid',
-    'intensifier',
-    'inter-action',
-    'inter-county',
-    'inter-dependence',
-    'inter-firm',
-    'inter-hemispheric',
-    'inter-pro',
-    'inter-relations',
-    'inter-tribal',
-    'intercalator',
-    'intercompany',
-    'interconnector',
-    'intercrater',
     'intercultural',
-    'interdigital',
-    'interest-earning',
-    'interest-only',
-    'interlagos',
-    'internationalized',
-    'internazionale',
-    'interox',
-    'interpolating',
-    'interpretational',
-    'interprofessional',
-    'interregional',
-    'interspersing',
-    'intervallic',
-    'interventional',
-    'interwiring',
     'inthe',
-    'intichiuma',
-    'intolerances',
-    'intoximeter',
-    'intra-aortic',
-    'intra-mural',
-    'intrepidity',
-    'introducer',
-    'intuited',
-    'intuitionists',
-    'inveigh',
-    'involuted',
-    'ipsarion',
-    'ipsos',
-    'iran/iraq',
-    'iraq-kuwait',
     'iraquis',
-    'irens',
-    'ireton',
-    'irks',
-    'iron-containing',
-    'irradiating',
-    'isadora',
-    'isagoras',
-    'isca',
-    'isham',
-    'ishiguro',
-    'islamists',
-    'isolationists',
-    'isolations',
-    'issi',
-    'italian-style',
     'iterate',
-    'ithome',
-    'ius',
-    'ivatt',
-    'ivy-covered',
-    'ixmarity',
-    'jabberwocky',
-    'jabelman',
-    'jabot',
-    'jabril',
-    'jackass',
-    'jacobsson',
-    'jacobus',
-    'jacque',
-    'jaenberht',
-    'jafaars',
     'jakobsen',
-    'jamais',
-    'jamba',
-    'james-type',
-    'jammer',
-    'jammie',
-    'jampa',
-    'janitorial',
-    'jansons',
-    'january-march',
-    'japanese-americans',
-    'japanese-language',
-    'jaqueline',
-    'jaroslaw',
-    'jat',
-    'jaynes',
     'jaysus',
-    'jazali',
-    'jds',
-    'jeffers',
-    'jefford',
-    'jemma',
-    'jeopardises',
-    'jerram',
-    'jervaulx',
-    'jesolo',
-    'jessi',
-    'jessy',
-    'jesty',
-    'jibbed',
-    'jif',
-    'jillian',
     'jim&eacute;nez',
-    'jirga',
-    'jmp',
-    'jobby',
-    'jobseekers',
-    'jocularity',
-    'jointly-owned',
-    'jolie',
-    'jollies',
-    'jolson',
-    'joly',
-    'jomo',
-    'jonghe',
-    'jorn',
-    'joscelyn',
-    'joshing',
     'jourdan',
-    'jowle',
-    'joysticks',
-    'jpac',
-    'jstars',
-    'juanito',
-    'judit',
-    'juiciest',
-    'jumping-off',
-    'junking',
-    'jwp',
-    'k&amacr;nchho',
-    'k&eacute;r&eacute;kou',
-    'k.k.k.',
-    'kamer',
-    'kaminski',
     'kapwepwe',
-    'karantina',
-    'karelia',
-    'karla',
-    'karlovci',
-    'kars',
-    'karts',
-    'kasbah',
-    'kaset',
-    'kashgar',
-    'kassalow',
-    'kassebaum',
-    'katana',
-    'kathe',
-    'katyusha',
-    'kawara',
     'kayaking',
-    'kayley',
-    'kazaskerlik',
-    'kazaskers',
-    'kazhagam',
-    'kc-1100',
-    'kea',
-    'keast',
-    'keatley',
-    'keefe',
-    'keen-eyed',
-    'keepsakes',
-    'kekul&eacute',
-    'keltney',
-    'kember',
-    'kenitra',
     'kenna',
-    'kenway',
-    'kenwright',
-    'kepepwe',
-    'kerridge',
-    'kesgrave',
-    'kevorkian',
-    'key-hole',
-    'key-words',
-    'keyring',
-    'keytops',
-    'kfw',
-    'kh864',
-    'khalaf',
-    'khalifah',
-    'khost',
     'khovanshchina',
-    'khozraschet',
-    'khumalo',
-    'kidded',
-    'kiddo',
-    'kieft',
-    'kienholz',
-    'kilmainham',
-    'kilodalton',
-    'kilve',
-    'kimblesworth',
-    'kimmeridgian',
-    'kindergartens',
-    'kinfolk',
-    'kingdom-based',
-    'kingsburgh',
     'kinlochleven',
-    'kinmel',
-    'kintbury',
-    'kirkwoods',
-    'kishorn',
-    'kislevite',
-    'kismet',
-    'kissane',
-    'kissy',
-    'kitaj',
-    'kitangan',
-    'kitec',
-    'kittenish',
-    'kitzb&uuml;hel',
-    'kkk',
-    'kleisthenic',
     'kleophrades',
-    'klevan',
-    'klinger',
-    'klingon',
-    'kme',
-    'knap',
-    'knapton',
-    'knee-cap',
-    'knockouts',
-    'knoetze',
-    'knole',
-    'knuckle-duster',
-    'knud',
-    'kobie',
-    'kochen',
-    'kock',
     'kokou',
-    'kollek',
-    'kolmogorov',
-    'koln',
-    'komar',
-    'komatsu',
-    'kominsky',
-    'komma',
-    'koonkies',
-    'korah',
-    'korner',
-    'korngold',
-    'kornilov',
-    'kostikov',
-    'kota',
-    'kouchner',
     'kowalik',
-    'kowalski',
-    'kozlowski',
-    'kramar',
-    'krasnodar',
-    'kravitz',
-    'krebs-henseleit',
-    'kreditor',
-    'kreig',
-    'krf',
-    'krieg',
-    'krier',
-    'kristen',
-    'krohn',
-    'kroll',
-    'kronberger',
     'kronenbourg',
-    'krooms',
-    'kruif',
-    'kruisinga',
-    'kumasi',
-    'kungsleden',
-    'kunio',
-    'kuril',
-    'kuypers',
-    'kwon',
-    'kyffin',
-    'kyme',
-    'kyocera',
-    'l&amacr;mri',
-    'l&eacute;g&egrave;rement',
-    'l&eacute;vy',
     'l&oacute;rien',
-    'l\'amours',
-    'l\'equipe',
-    'l\'ouest',
-    'l*',
-    'l-cpl',
-    'l.m.s.',
-    'l6',
-    'laberge',
-    'labiatum',
-    'labour-run',
-    'laci',
-    'lacinia',
-    'lacz',
-    'laddish',
-    'ladling',
     'ladner',
-    'lahud',
-    'laicisation',
-    'lakenheath',
-    'lala',
-    'lamar',
-    'lamberhurst',
-    'lamblia',
-    'lambourne',
-    'lambretta',
-    'lambrusco',
-    'lamellosa',
-    'lanc',
-    'lancelet',
-    'lanceolata',
-    'land-owner',
     'landreth',
-    'landsdowne',
-    'langenscheidt',
-    'langtoft',
-    'language-based',
-    'language-specific',
-    'lanham',
-    'lanner',
-    'lannon',
-    'lanqing',
-    'lansky',
-    'lanson',
-    'lanzhou',
-    'lapse-rate',
-    'large-animal',
-    'larionov',
     'larkman',
-    'larousse',
-    'laryngitis',
-    'lascar',
-    'lascars',
-    'lasciviousness',
-    'last-resort',
-    'latinate',
-    'lattice-work',
-    'latton',
-    'latymer',
-    'lauretis',
-    'lauro',
-    'lavin',
-    'lawned',
-    'laying-out',
     'lazarsfeldian',
-    'lazer',
-    'ld50',
-    'ldpd',
-    'lds',
-    'leaf-cutting',
-    'leafage',
-    'lean-burn',
-    'leap-frogging',
-    'learmouth',
-    'learner-reader',
-    'leashes',
-    'leasowe',
-    'leathercraft',
-    'leatherslade',
-    'leavin\'',
     'lebowa',
-    'lecfile',
-    'lectins',
-    'lecturer-module',
-    'lederhosen',
-    'ledingham',
-    'leeds-liverpool',
-    'leet',
-    'leewards',
-    'lega',
-    'legh',
-    'legio',
-    'legislations',
-    'legitimises',
-    'legitimism',
-    'lemmatised',
     'lengthily',
-    'lenlee',
-    'lensman',
-    'leopard-skin',
-    'leros',
-    'lescun',
-    'lethbridge',
-    'letsie',
-    'letson',
-    'letterboxes',
-    'levack',
-    'lewdly',
-    'leyte',
-    'lezcano',
-    'li\'l',
-    'li\'s',
     'liaoning',
-    'liason',
-    'lib-dems',
-    'liberal/sdp',
-    'library-college',
-    'licenser',
-    'licentiateship',
-    'liddiard',
-    'liem',
-    'lienz',
-    'life-and-death',
-    'lifeforms',
-    'lifejackets',
-    'lifelessly',
-    'lifespan&mdash;shutdown',
-    'liggett',
     'light-heavy',
-    'lightship',
-    'lik',
-    'likely-looking',
-    'liliana',
-    'lilo',
-    'lily-of-the-valley',
-    'limbers',
-    'limekilns',
-    'limnititzker',
-    'limone',
-    'limpet-like',
-    'lindemann',
-    'line-of-sight',
-    'linearized',
-    'linguaphone',
     'lintot',
-    'linx',
-    'lip-gloss',
-    'lipless',
-    'lippy',
-    'lipscombe',
-    'lirt',
-    'listers',
-    'litigating',
-    'litt',
-    'littles',
-    'liturgically',
-    'liverwort',
-    'liverymen',
-    'lizard-like',
-    'll.',
     'llanos',
-    'lloret',
-    'llp',
-    'llwyd',
-    'loadsa',
-    'lobb',
-    'locoscript',
-    'lodestone',
-    'loewe',
-    'loftiest',
-    'log-book',
-    'logitek',
-    'loir',
-    'londesborough',
-    'london-bound',
-    'long-gilt',
     'long-neglected',
-    'long-promised',
-    'long-sightedness',
-    'longacre',
-    'longest-lasting',
-    'longland',
-    'longmuir',
-    'longships',
-    'longshot',
-    'longwall',
-    'look-and-feel',
-    'lookup',
-    'loomes',
-    'loong',
-    'loquitur',
-    'lor\'',
     'lording',
-    'lorient',
-    'loss-makers',
-    'louden',
-    'lougheed',
-    'loughs',
-    'louver',
-    'lover-boy',
-    'lovesexy',
-    'low-caste',
-    'low-viscosity',
-    'low-water',
-    'lower-status',
-    'lower-tier',
-    'lowest-level',
-    'lsug',
     'lubowski',
-    'lucente',
-    'luchinsky',
-    'lucidas',
-    'ludorum',
-    'ludus',
-    'luggnagg',
-    'lugworm',
-    'lugworms',
-    'luiz',
-    'lunchbox',
-    'lunchbreak',
-    'lundqvist',
-    'lunette',
-    'lusignans',
-    'lutheranism',
     'lutzenberger',
-    'lxxxix',
-    'lymphokine',
-    'lynes',
-    'lyngby',
-    'lynxos',
-    'lysenko',
-    'm&acirc;con',
-    'm&amacr;ilo',
-    'm&amp;t',
-    'm&eacute;li',
-    'm&eacute;rida',
-    'm.b.',
-    'm.e.',
-    'm.ed.',
-    'm.g.',
     'm.o.',
-    'mabey',
-    'mablethorpe',
-    'macalister',
-    'macandrews',
-    'macdraw',
-    'machine-like',
-    'mackrell',
-    'maclagan',
-    'macqueen',
-    'macro-',
-    'macrocell',
-    'macromolecule',
-    'mactavish',
-    'madalena',
-    'madhuri',
     'madoc',
-    'madrid-based',
-    'madrigalists',
-    'maee',
-    'maelmuire',
-    'maersk',
-    'maestrangelo',
-    'mafioso',
-    'maggovertski',
-    'magnetos',
-    'magnifier',
-    'mahanama',
-    'maharajahs',
-    'mahaweli',
-    'mahayana',
-    'mahfouz',
     'mahony',
-    'maillol',
-    'mainbocher',
-    'mainstreaming',
-    'maior',
-    'mairet',
-    'mairowitz',
-    'maisons',
-    'majored',
-    'majoritarian',
-    'makanjuola',
-    'make-do',
-    'make-it',
-    'makhoul',
-    'makins',
-    'maktoums',
     'malakal',
-    'malborough',
-    'malek',
-    'malherbe',
-    'malian',
-    'malinvaud',
-    'mallen',
-    'maltesers',
-    'mamey',
-    'man-at-arms',
-    'man-o\'-war',
-    'manacle',
-    'manama',
-    'manastir',
-    'mancha',
-    'manda',
     'mandler',
-    'manerplaw',
-    'manfield',
-    'manicurist',
-    'manikin',
-    'manipulability',
-    'mankiewicz',
-    'mannitol',
-    'manser',
-    'mantack',
-    'mantelpieces',
-    'mapp',
-    'mappleton',
-    'maranello',
-    'marciano',
-    'marcion',
     'marcoses',
-    'mardell',
-    'margareta',
-    'marginalia',
-    'marginalizing',
-    'marglin',
-    'marigot',
-    'marini&egrave;res',
-    'market-determined',
-    'market-leading',
-    'market-making',
-    'marketeer',
-    'markstones',
-    'markt',
-    'marlboros',
-    'marlies',
     'marmion',
-    'marnie',
-    'maroons',
-    'marquesses',
-    'marrack',
-    'marre',
-    'mars-jones',
-    'marson',
-    'marsworth',
-    'martigues',
-    'martyrhood',
-    'marumba',
-    'maryinsky',
-    'marzio',
-    'mascolo',
-    'mascots',
     'masius',
-    'massaliotes',
-    'masselin',
-    'master-servant',
-    'master-slave',
-    'masterkova',
-    'matabeleland',
-    'mathie',
-    'matic',
-    'matsu',
-    'mattel',
-    'matz',
-    'mauberley',
-    'maurras',
-    'mauser',
-    'mawddach',
     'maximizers',
-    'maxtor',
-    'mayberry',
-    'maybole',
-    'maybrick',
-    'maycock',
-    'mayhap',
-    'mazurkas',
-    'mb-caradon',
-    'mbe.',
-    'mcaleer',
-    'mcalinden',
-    'mcbain',
-    'mccart',
-    'mccarten',
-    'mcclintock',
     'mcconnells',
-    'mccullagh',
-    'mcd',
-    'mcdougal',
-    'mcfadyen',
-    'mcg',
-    'mcgahon',
-    'mcgarrigle',
-    'mcgeorge',
-    'mcian',
-    'mcilkenny',
-    'mcl',
-    'mclaggans',
-    'mclaren-honda',
-    'mcquail',
-    'md110',
     'mdma',
-    'meades',
-    'meanie',
-    'meckler',
-    'meconium',
-    'mediant',
-    'mediations',
-    'medico-moral',
-    'medium-high',
-    'medlycott',
-    'medmenham',
-    'medullary',
-    'meechai',
-    'meed',
-    'meena',
-    'meeting-places',
     'megaphones',
-    'meije',
-    'meissner',
-    'meksi',
-    'melibee',
-    'mellifera',
-    'melo',
-    'melos',
-    'melossi',
-    'mende',
-    'mendelsohn',
-    'mendis',
-    'mendonca',
-    'mendy',
-    'menials',
-    'menorrhagia',
     'mensch',
-    'mensural',
-    'mentally-handicapped',
-    'mentat',
-    'menter',
-    'menthol',
-    'mentoring',
-    'mephistopheles',
-    'merbah',
-    'merceron',
-    'mercure',
-    'meribeth',
-    'merioneth',
-    'merlins',
-    'mermaz',
-    'merrow',
     'mersa',
-    'mesara',
-    'mescal',
-    'messin\'',
-    'metallurgists',
-    'metaphysic',
-    'metastasio',
-    'mete',
-    'metformin',
-    'methuselah',
-    'metier',
-    'metj',
-    'metohija',
-    'metope',
-    'metrically',
-    'metropolises',
     'mets',
-    'meuse-rhine-yssel',
-    'mewling',
-    'mexeflote',
-    'mezzogiorno',
-    'mg/30',
-    'mg/dl',
-    'mgm-pathe',
-    'mhc-encoded',
-    'mibbe',
-    'micas',
-    'micellar',
-    'michelmore',
-    'michigan-based',
-    'micks',
-    'micro-chip',
     'microclimate',
-    'microfibres',
-    'microkernel-based',
-    'micromail',
-    'microseconds',
-    'microstation',
-    'microsurgery',
-    'microvilli',
-    'mid-1870s',
-    'mid-counties',
-    'mid-essex',
-    'mid-european',
-    'mid-flight',
-    'mid-flow',
-    'mid-kent',
-    'mid-length',
     'middle-out',
-    'middlegame',
-    'mids',
-    'midtown',
-    'mien-lo',
-    'miers',
-    'mig-29',
-    'mignonette',
-    'mihir',
-    'miked',
-    'milady',
-    'miliary',
-    'militaire',
-    'militarist',
-    'militating',
-    'milkweed',
     'milky-white',
-    'mill-owners',
-    'milligram',
-    'million-strong',
-    'million-to-one',
-    'millstreet',
-    'mind-reader',
-    'mindscape',
-    'mindwarp',
-    'mineshafts',
-    'minestrone',
-    'mingy',
-    'mini-skirted',
-    'miniaturised',
-    'miniclinics',
-    'minister-presidents',
     'ministerial-level',
-    'minky',
-    'minnis',
-    'minoa',
-    'minutemen',
-    'mirabeau',
-    'mircha',
-    'miroir',
-    'mis&eacute;rables',
-    'mis-hit',
-    'miscibility',
-    'misdirect',
-    'misers',
-    'miserver',
-    'misjudgments',
-    'misreporting',
     'missals',
-    'missenden',
-    'missie',
-    'mistreating',
-    'mistrusting',
-    'mitten',
-    'miz',
-    'mlf',
-    'mlstp',
-    'mltb',
-    'mnes',
-    'mni',
-    'moberly',
-    'mobilfunk',
-    'mocker',
-    'mockers',
     'modeling',
-    'modernisms',
-    'modifiability',
-    'modularisation',
-    'module-name-is',
-    'module-type-is',
-    'moffitt',
-    'moggy',
-    'mohun',
-    'moises',
-    'molas',
-    'molinia',
-    'mollington',
-    'molseed',
-    'monadic',
-    'mondadori',
     'money\'',
-    'money-centre',
-    'money-lending',
-    'money-off',
-    'mong',
-    'monkwearmouth',
-    'mono-unsaturated',
-    'monodic',
-    'monolinguals',
-    'monologic',
-    'monopole',
-    'mons.',
-    'monsal',
-    'monsengwo',
-    'montagues',
-    'montand',
     'montblanc',
-    'monti',
-    'montoya',
-    'montreuil',
-    'monumentalism',
-    'moonscape',
-    'moraes',
-    'morayshire',
-    'moredun',
-    'morice',
-    'morina',
-    'mortgagors',
-    'morval',
-    'morvan',
-    'mosbacher',
-    'moshpit',
     'most-significant',
-    'mot_juste',
-    'mothecombe',
-    'mothercraft',
-    'motivators',
-    'motor-bikes',
-    'motorhome',
-    'mottingham',
-    'mottling',
-    'mottos',
-    'moulid',
-    'mouse-like',
-    'moussavi',
-    'moustachioed',
-    'mouzelis',
-    'movables',
     'moynihans',
-    'mpa',
-    'mpm',
-    'mrcp',
-    'msa',
-    'mswati',
-    'mtbe',
-    'mu&ntilde;oz',
-    'much-anticipated',
-    'much-improved',
-    'mucks',
-    'mucosectomy',
-    'mudaliyar',
-    'mudar',
-    'mudder',
-    'mudie',
     'muellbauer',
-    'muffed',
-    'muir/scotland',
-    'muirhouse',
-    'mukhabarat',
-    'mukhamedov',
-    'mulindry',
-    'mullally',
-    'mulliner',
-    'mulliver',
-    'multi-currency',
-    'multi-discipline',
-    'multi-hued',
-    'multi-line',
-    'multi-stack',
-    'multi-valve',
     'multilayer',
-    'multimeter',
-    'multivibrator',
-    'mummolus',
-    'muncie',
-    'munich-based',
-    'muniments',
-    'munns',
-    'music-halls',
-    'musicological',
-    'muskrat',
-    'musson',
-    'mustafizur',
-    'mustique',
-    'muthesius',
-    'mutus',
     'mvd',
-    'mya',
-    'mycetes',
-    'myer',
-    'mynott',
-    'myo',
-    'myrna',
-    'myron',
-    'mysore',
-    'myst&egrave;re',
-    'mytchett',
-    'n&eacute;glig&eacute',
-    'n&eacute;ill',
-    'n&eacute;meth',
-    'n&uacute&ntilde;ez',
-    'n.c.o.',
     'n.d.d.s.',
-    'n.l.',
-    'n4',
-    'n5',
-    'nabakov',
-    'nabarro',
-    'nachos',
-    'nachr',
-    'nachtmusik',
-    'nadobenko',
-    'nagano',
-    'nagata',
-    'naha',
-    'naiads',
-    'nailers',
-    'nailsea',
     'nain',
-    'naivet&eacute',
-    'najib',
-    'naloxone',
-    'namier',
-    'nan-nan',
-    'nancarrow',
-    'napol&eacute;on',
-    'narong',
-    'narrowings',
-    'nary',
-    'nasica',
-    'nasmyth',
-    'nast',
-    'nat.',
-    'nationales',
     'nationalmuseum',
-    'natron',
-    'natural-entity',
-    'naturopathy',
-    'navarra',
-    'nayef',
-    'nayim',
-    'nazaro',
-    'nci',
-    'ncp7c',
-    'ndolo',
-    'ne\'eman',
-    'near-empty',
-    'neate',
-    'nebiolo',
-    'neck-and-neck',
     'necker',
-    'needham-burrell',
-    'needlewoman',
-    'neep',
-    'negativism',
-    'neophobia',
-    'nephila',
-    'nerving',
-    'nesfield',
-    'netherdale',
-    'netlabs',
-    'netley',
-    'neto',
-    'netrha',
-    'nettle-rash',
-    'netview/6000',
     'neuhaus',
-    'neuilly',
-    'neuro',
-    'neurobiologists',
-    'neuss',
-    'nevermore',
-    'new-ball',
-    'newhnam',
-    'newly-founded',
-    'newly-installed',
-    'newoed',
-    'news-stand',
-    'newsboys',
-    'newsholme',
-    'newspeak',
-    'newssheet',
     'newsstand',
-    'nfp',
-    'ngc5548',
-    'ngf',
-    'ngodrup',
-    'ngv',
-    'nhk',
-    'nhl',
-    'nicaean',
-    'nickel-plated',
-    'nickerson',
-    'nicol&aacute;s',
-    'nicotiana',
-    'niebuhr',
-    'nieuport',
-    'nightlight',
     'nightstick',
-    'nihil',
-    'niklaus',
-    'nikolaev',
-    'nilly',
-    'nist',
-    'nnp',
-    'no-balls',
-    'no-o',
-    'no.12',
-    'nobilo',
-    'noddle',
-    'noel-baker',
-    'nomai',
-    'nominalization',
-    'non-agouti',
     'non-citizens',
-    'non-competing',
-    'non-dilated',
-    'non-epileptogenic',
-    'non-equivalence',
-    'non-flowering',
-    'non-hazardous',
-    'non-identical',
-    'non-indigenous',
-    'non-inverting',
-    'non-kin',
-    'non-maintained',
-    'non-marketed',
-    'non-mental',
-    'non-militant',
-    'non-moslem',
     'non-muscle',
-    'non-normal',
-    'non-numeric',
-    'non-observational',
-    'non-perishable',
-    'non-polluting',
-    'non-practising',
-    'non-profitable',
-    'non-projected',
-    'non-publication',
-    'non-reflective',
-    'non-reproductive',
-    'non-school',
-    'non-service',
-    'non-text',
-    'non-tidal',
     'non-tory',
-    'non-vanishing',
-    'non-visitor',
-    'non_sequitur',
-    'nonauratic',
-    'none-the-less',
-    'nones',
-    'nonliving',
-    'nookie',
-    'norf',
-    'norske',
-    'north-country',
-    'northcote-trevelyan',
-    'northcott',
-    'norwest',
-    'nosferatu',
     'noster',
-    'note-groups',
-    'notepads',
-    'notte',
-    'notts.',
-    'novae',
-    'novel-writing',
-    'novotn&yacute',
-    'novy',
-    'nowicki',
-    'nozze',
-    'npn',
-    'nrs',
-    'nst',
-    'nuclear-weapons',
-    'nucleoside',
     'nueva',
-    'nul',
-    'nullarbor',
-    'numeraire',
-    'nutrient-rich',
-    'nutriment',
-    'nyala',
-    'nysd',
-    'nyssa',
-    'o\'malleys',
-    'o\'neillism',
-    'o\'neills',
-    'o\'neils',
-    'oakfield',
-    'oakwell',
-    'obergurgl',
     'obins',
-    'obliquity',
-    'oblongs',
-    'occ',
-    'occluding',
-    'occuring',
-    'ocea',
-    'ockham',
-    'octavio',
-    'odets',
-    'odling',
-    'oestrous',
-    'off-planet',
-    'offense',
-    'offensiveness',
-    'office-bearers',
     'officier',
-    'oger',
-    'ogi',
-    'oic',
-    'oil-rig',
-    'oil-stained',
-    'oilbar',
-    'okanagan',
-    'okely',
-    'okoye',
-    'okp',
-    'okri',
-    'olau',
-    'olbrei',
-    'old-school',
-    'oleander',
     'olechowski',
-    'oligotrophic',
-    'oliguria',
-    'ollivier',
-    'ology',
-    'olympique',
-    'omara',
-    'omega-3',
-    'ommitted',
-    'omnisql',
-    'omnivores',
-    'on-course',
-    'on-demand',
-    'on-set',
-    'oncologists',
-    'one-bit',
     'one-hundredth',
-    'onetti',
-    'oomalama',
-    'oompah',
-    'ooops',
-    'opas',
-    'open-backed',
-    'open-country',
-    'open-side',
-    'openout',
-    'openserver',
-    'openwarehouse',
-    'opercular',
-    'ophiacanthidae',
-    'ophiolimna',
-    'ophthalmologists',
     'opificio',
-    'opinion-makers',
-    'opposable',
-    'oppresses',
-    'optiebeurs',
-    'optioned',
-    'optivity',
-    'opzz',
-    'oradea',
-    'oral-b',
-    'orality',
-    'orangefield',
-    'orbos',
-    'orderic',
-    'ordinand',
-    'oresme',
     'oriana',
-    'orientalis',
-    'orientating',
-    'origin\'',
-    'orin',
-    'ormsby',
-    'orrible',
-    'osiers',
-    'ospedale',
-    'ossory',
-    'other\'',
-    'oto',
-    'otterburn',
-    'ottey',
-    'oughta',
-    'oupa',
     'out-building',
-    'out-half',
-    'out-migrants',
-    'out-of-area',
-    'out-of-phase',
-    'out-workers',
-    'outer-arc',
-    'outfitter',
-    'outfitting',
-    'outgassed',
-    'outlawry',
-    'outshines',
-    'outshining',
-    'outsmart',
-    'outsold',
-    'outsource',
     'outstay',
-    'outwits',
-    'outwork',
-    'over-abundance',
-    'over-age',
-    'over-crowding',
-    'over-enthusiasm',
-    'over-familiar',
-    'over-indulgent',
-    'over-involvement',
-    'over-reached',
-    'overambitious',
-    'overarm',
-    'overbeck',
-    'overconstrained',
-    'overdene',
     'overdosage',
-    'overexpressed',
-    'overgrazed',
-    'overhead-view',
-    'overindulgence',
-    'overlarge',
-    'overlies',
-    'overpayments',
-    'overtaxed',
-    'ovules',
-    'oxted',
-    'oxy',
-    'oz/1&frac14',
-    'ozone-damaging',
-    'ozs',
-    'p&eacute;bereau',
     'p&gt;0.1',
-    'p&ndash;59',
-    'p-d',
-    'p-funk',
-    'p-labeled',
-    'p-p',
-    'p.12',
-    'p.15',
-    'p.29',
-    'p.l.',
-    'p/60',
-    'p1/t2',
-    'p107',
-    'p15',
-    'p2/t1',
-    'p34',
     'p54',
-    'p57',
-    'p60',
-    'p=0.006',
-    'p=0.007',
-    'pa05c',
-    'pa474',
-    'pac-man',
-    'paccy',
-    'pachatata',
-    'pack-horse',
-    'packagers',
-    'packington',
-    'paddle-steamer',
-    'paeans',
-    'page-alucard',
     'pagus',
-    'pahs',
-    'painshill',
-    'paintbrushes',
-    'palatability',
-    'palisades',
-    'palliasse',
-    'palliate',
-    'palmist',
-    'palynology',
-    'panadol',
-    'pandanus',
-    'panin',
-    'panjandrum',
-    'panjim',
-    'panspermia',
     'pantechnicon',
-    'panthenol',
-    'panthera',
-    'pantisocratic',
-    'panza',
-    'papageno',
-    'papeete',
-    'papen',
-    'paperboy',
-    'paperknife',
-    'papez',
-    'paphos',
-    'pappa',
-    'par-4s',
-    'par-five',
-    'paradigmatically',
     'paragraph(s)',
-    'parallel-stranded',
-    'parallelising',
-    'paralympics',
-    'paramountcy',
-    'parasitise',
-    'parchmeiner',
-    'pardew',
-    'pardo',
-    'pardoner',
-    'paredes',
-    'parent/child',
-    'parentcraft',
-    'parian',
-    'parnassus',
-    'parnes',
     'parore',
-    'parramatta',
-    'parrella',
-    'parries',
-    'parsee',
-    'parslow',
-    'parsonian',
-    'part-number',
-    'partied',
-    'pash',
-    'pashalik',
-    'pasolini',
-    'pasquale',
-    'passap/pfaff',
-    'passarinho',
-    'passera',
     'passerby',
-    'passersby',
-    'passiflora',
-    'passing-out',
-    'paste-down',
-    'pastoralist',
-    'pastorally',
-    'pasturing',
-    'patels',
-    'patentability',
-    'paternally',
-    'pathan',
-    'patients/clients',
-    'patmos',
-    'patrik',
-    'patron-client',
     'pauvre',
-    'pavey',
-    'paviours',
-    'pay-roll',
-    'pb-zn',
-    'pbruc1',
-    'pbx',
-    'pc-to-unix',
-    'pc-xware',
-    'pdcg',
-    'pdp-10',
-    'pe1',
-    'peada',
-    'pealing',
-    'pearsall',
-    'peasgood',
     'peat-free',
-    'peating',
-    'pebble-dash',
-    'peccadilloes',
-    'pedagogue',
-    'pedantically',
-    'peddlers',
-    'pederson-krag',
-    'pedestrian-only',
-    'pedometer',
-    'peeper',
-    'peffermill',
-    'pehr',
-    'peirithous',
-    'pejic',
-    'pelat',
     'pellegrino',
-    'pelynt',
-    'pemuda',
-    'pen-y-ghent',
-    'penalizing',
-    'penances',
-    'penaud',
-    'pendine',
-    'pendreigh',
-    'pendry',
-    'penmanship',
-    'pennell',
-    'pennorth',
-    'penns',
-    'penpals',
-    'pentamer',
     'pentasa',
-    'pentre',
-    'penver',
-    'peploe',
-    'peplos',
-    'per-ulrik',
-    'percept',
-    'perceptibility',
-    'percivall',
-    'perforant',
-    'perforating',
-    'perfumer',
-    'periantarctic',
-    'pericentric',
-    'perin',
-    'periparturient',
     'perishes',
-    'perle',
-    'pernambuco',
-    'perrers',
-    'perry/thames',
-    'persimmon',
-    'person-years',
-    'personal-computer',
-    'perspire',
-    'persuader',
-    'perth-based',
-    'pertti',
-    'perturbing',
-    'pesce',
-    'peshmerga',
-    'pessary',
     'pessima',
-    'pestilential',
-    'petersham',
-    'petiver',
-    'petro',
-    'petwood',
-    'peut',
-    'peyrefitte',
-    'pfkg',
-    'pflimlin',
-    'pgp',
-    'pgss',
-    'phagocytosis',
-    'phantasmagoria',
-    'pharmacologically',
-    'pharsalos',
     'phd.',
-    'phigs',
-    'phileo',
-    'philippos',
-    'phill',
-    'phillippa',
-    'philosophes',
-    'phonologists',
-    'photocell',
-    'photofit',
-    'photogravure',
-    'photomicrography',
-    'photoperiod',
-    'photophobic',
-    'pi&egrave;ces',
-    'picas',
     'picco',
-    'pierrepoint',
-    'pierry',
-    'pietrasanta',
-    'piffle',
-    'pigalle',
-    'pigeonholes',
-    'piggy-wig',
-    'pilaf',
-    'pileup',
-    'pilipino',
-    'pimentel',
-    'pincus',
-    'pinfold',
-    'pinheiro',
-    'pinkness',
     'pinnacled',
-    'pintails',
-    'piontek',
-    'piquantly',
-    'pirrie',
-    'pitchford',
-    'pitlake',
-    'pitney',
-    'pitsea',
-    'pittendrigh',
-    'pittville',
-    'plaatjes',
-    'plagiarist',
-    'planings',
-    'platelet-release',
-    'platini',
     'platonists',
-    'playbills',
-    'playscheme',
-    'ple',
-    'pleasure-dome',
-    'pleasurecraft',
-    'plehve',
-    'pleiotropic',
-    'plenteous',
-    'pleonasm',
-    'plodder',
-    'plods',
-    'plopping',
-    'plumfield',
-    'plumstead',
-    'plutocracy',
     'pni',
-    'pocket-book',
-    'poema',
-    'point-of-view',
-    'pointy-beard',
-    'poiret',
-    'polariser',
-    'polaroids',
-    'poleaxed',
-    'policy-holders',
-    'polidocanol',
-    'polish-born',
-    'pollak',
-    'polonia',
-    'polson',
-    'poltoranin',
     'poly-l-ornithine',
-    'polyatomic',
-    'polypary',
-    'polytechniciens',
-    'pom-poms',
-    'pomade',
-    'pomerene',
-    'pongine',
-    'pontardulais',
-    'pope-hennessy',
-    'popescu',
-    'poppleton',
-    'porcelains',
-    'porkies',
-    'poros',
-    'portmarnock',
     'portmeirion',
-    'portofino',
-    'portography',
-    'posset',
-    'possums',
-    'post-1980',
-    'post-audit',
-    'post-box',
-    'post-cold-war',
-    'post-emancipation',
-    'post-excavation',
-    'post-holders',
-    'post-lunch',
-    'post-qualifying',
-    'post-renaissance',
-    'post-traumatic',
     'postan',
-    'postbank',
-    'postbasic',
-    'postie',
-    'postmodernization',
-    'postnominally',
-    'pot-grown',
-    'potentiate',
-    'potholing',
-    'potidaia',
-    'potman',
-    'pottinger',
-    'pottle',
-    'pouts',
-    'power-up',
-    'powerbase',
     'powerhouses',
-    'powerplants',
-    'pp3s',
-    'ppgs',
-    'pr&eacute;fleur',
-    'praagh',
-    'prachakorn',
-    'practolol',
-    'praetor',
-    'praetorius',
-    'pranksters',
-    'prcs',
-    'prds',
-    'pre-1939',
-    'pre-1979',
-    'pre-adapted',
     'pre-cast',
-    'pre-civil',
-    'pre-conference',
-    'pre-congress',
-    'pre-construction',
-    'pre-given',
-    'pre-inquiry',
-    'pre-launch',
-    'pre-written',
-    'preamps',
-    'predating',
-    'preez',
-    'prefabrication',
-    'prefabs',
-    'prefered',
-    'preferred-issue',
     'prejudging',
-    'prelims',
-    'prepcom',
-    'prescriber',
-    'pressler',
-    'prestriate',
-    'pretentions',
-    'preternatural',
-    'price/earnings',
-    'primary/secondary',
-    'prime-ministerial',
-    'primeness',
-    'primness',
-    'prins',
-    'printings',
-    'prison-house',
     'pritchetts',
-    'private-rented',
-    'prizemoney',
-    'pro-chinese',
-    'pro-hunting',
-    'pro-military',
-    'pro-whaling',
-    'problem-free',
-    'problematics',
-    'procaine',
-    'procrastinate',
-    'procyon',
-    'prodescon',
-    'production.',
-    'productised',
-    'proferentem',
     'professionalised',
-    'profiteer',
-    'prognoses',
-    'projets',
-    'prole',
-    'proletarianized',
-    'promenading',
-    'prompter',
-    'propathene',
-    'prophetess',
-    'propre',
-    'proscribe',
-    'proteg&eacute',
-    'protein-linked',
-    'provender',
-    'provirus',
     'pryce-jones',
-    'psalmody',
-    'psalters',
-    'pseudo-devices',
-    'psychiatrically',
-    'psychodrama',
-    'ptb',
-    'pti',
-    'ptp',
-    'puang',
-    'pubis',
-    'public-house',
-    'publius',
-    'puchberg',
-    'puffed-up',
-    'puffiness',
     'puisne',
-    'pull-back',
-    'pullet',
-    'pullout',
-    'pulser',
-    'pumpido',
-    'punch-line',
-    'punnett',
-    'puppeteers',
-    'purchaser/provider',
-    'purdue',
-    'purposelessness',
-    'purse-seine',
-    'purvey',
-    'pussycats',
-    'pylos',
     'pyrethrum',
-    'pyrolysis',
-    'q6',
-    'qadir',
-    'qalib',
-    'qayyum',
-    'qe',
-    'qram',
-    'quadriceps',
-    'quadrophonic',
-    'quaff',
-    'quantile',
-    'quarantining',
-    'quarterings',
-    'quashes',
-    'quasi-official',
     'quaternions',
-    'quedgeley',
-    'quement',
-    'quentovic',
-    'querns',
-    'question-begging',
-    'quetzal',
-    'quicks',
-    'quicksands',
-    'quigg',
-    'quinan/scotland',
-    'quinones',
-    'quintile',
-    'quirkiness',
-    'quirking',
-    'qume',
     'quoins',
-    'quotients',
-    'r&eacute;cit',
-    'r-',
-    'r.d.',
-    'r.i.a.a.',
-    'r.k.',
-    'r.m.s.d.',
-    'r.n.',
-    'r.p.m.',
-    'r10000',
-    'r12',
-    'r2+',
-    'r21',
-    'r4/5',
-    'rabelaisian',
     'rabindranath',
-    'raccoon',
-    'rachman',
-    'rackety',
-    'rackmount',
-    'radiographer',
-    'radl',
-    'radlett',
-    'rafah',
-    'ragusans',
-    'railroaded',
-    'rain-washed',
-    'rainbird',
-    'rainwear',
-    'rajan',
-    'rajesh',
     'rajput',
-    'rambaldi',
-    'rambush',
-    'ramc',
-    'ramifying',
-    'ramm',
-    'ramsbury',
-    'ramshaw',
-    'rancon',
-    'randhawa',
-    'randwick',
-    'rankle',
-    'rapoports',
-    'rashleigh',
-    'rat-1/c-myc-er/bcl-2',
-    'rathore',
     'ratio-arm',
-    'ratko',
-    'rattans',
-    'ratting',
-    'rattletrap',
-    'ratzinger',
-    'raup',
-    'ravilious',
-    'rawtenstall',
-    'raybans',
-    'raynham',
-    'razanamasy',
-    'rcb',
-    're-activated',
-    're-assembly',
-    're-assessed',
     're-awaken',
-    're-awakening',
-    're-buy',
-    're-cover',
-    're-cut',
-    're-done',
-    're-educated',
-    're-forming',
-    're-introducing',
-    're-issues',
-    're-learn',
-    're-married',
-    're-occupied',
-    're-ordered',
-    're-phrase',
-    're-shuffle',
     're-siting',
-    're-stocking',
-    're-visit',
-    'read-through',
-    'read/enter',
-    'readily-available',
-    'readjusting',
-    'ready-cut',
-    'reanimated',
-    'reapplying',
-    'rear-facing',
-    'rearfoot',
-    'rearmed',
-    'rearmost',
-    'rearranges',
-    'rearward',
     'reasonably-priced',
-    'rebarbative',
-    'rebirthing',
-    'recanted',
-    'recapitulated',
-    'recently-opened',
-    'recirculated',
-    'reclaims',
-    'reclines',
-    'recluses',
-    'recoinage',
-    'recollapse',
-    'reconnaissances',
-    'reconsecrated',
-    'record-breaker',
-    'record-equalling',
     'record-pause',
-    'recrossing',
-    'recto',
-    'rectories',
-    'red-backed',
-    'red-cheeked',
-    'red-lit',
-    'red-painted',
-    'redd',
-    'reddan',
-    'reddest',
-    'redial',
-    'rediscovers',
-    'redlich',
-    'redoubling',
-    'redskin',
     'redstart',
-    'reduced-oil',
-    'reducers',
-    'redvers',
-    'reelected',
-    'refectories',
-    'refiners',
-    'reforest',
-    'reformatory',
-    'refracting',
-    'refried',
-    'refrigerants',
-    'regalism',
-    'regicides',
-    'regine',
-    'regularisation',
     'regularize',
-    'rehomed',
-    'rehydrate',
-    'reichardt',
-    'reichenbach',
-    'reiffel',
-    'reinterprets',
-    'reinvigorate',
-    'reissuing',
-    'reiving',
-    'relocked',
-    'rema',
-    'rembrandts',
-    'remould',
-    'rems',
-    'rendez-vous',
     'renegotiations',
-    'rennison',
-    'rentcharge',
-    'reoccupation',
-    'reoffend',
-    'repartition',
-    'repeatability',
-    'repot',
-    'repouss&eacute',
-    'reproducers',
-    'repubblichini',
-    'republication',
-    'req',
-    'rerpf',
-    'reselected',
-    'restocked',
     'restricted-use',
-    'resuscitating',
-    'retied',
-    'retief',
-    'retraces',
-    'retreate',
-    'return&mdash;detail',
-    'retyped',
-    'reusing',
-    'revaluing',
-    'revamps',
-    'revelle',
-    'reveller',
-    'revivify',
-    'rf325',
-    'rhetorician',
     'rhone-alpes',
-    'rhun',
-    'rhythmicity',
-    'riata',
-    'rich-country',
-    'richthofen',
-    'ricimer',
-    'rickey',
-    'riddiford',
-    'riddoch',
-    'ride-on',
-    'riderless',
-    'ridgefield',
-    'ridicules',
-    'ridiculousness',
-    'ridolfi',
     'ridout',
-    'riedle',
-    'ries',
-    'rif',
-    'right-foot',
-    'right-of-centre',
-    'right-oh',
-    'rights-based',
-    'rightwingers',
-    'rijswijk',
-    'rillington',
-    'rills',
-    'rimmit',
-    'ringless',
-    'ringlet',
-    'ringroad',
     'ringwraith',
-    'rintoul',
-    'risc/os',
-    'risk-taker',
-    'ritualization',
-    'rivalrous',
-    'river-bank',
-    'riverboat',
-    'rivermead',
-    'riviere',
-    'ro&circ;le',
-    'road-side',
-    'roadstone',
-    'roadwork',
-    'roag',
-    'robodoc',
     'robsart',
-    'rochlin',
-    'rock-forming',
-    'rocket-propelled',
-    'rockwood',
-    'rodmell',
-    'rodolpho',
-    'roff',
-    'roguishly',
-    'roiling',
-    'rois',
-    'roisin',
-    'rolleston',
-    'rolls-royces',
-    'romagna',
-    'romaldkirk',
     'romantica',
-    'roofer',
-    'rookeries',
-    'room-mates',
-    'ropery',
-    'rosenquist',
-    'rosses',
-    'rossett',
-    'rostand',
-    'rostered',
-    'rostov-on-don',
-    'roszak',
-    'rote-learning',
-    'rothenbuhler',
-    'rotorway',
-    'rottie',
     'rotties',
-    'rouault',
-    'roughening',
-    'roumat',
-    'round-arched',
-    'round-trip',
-    'round-ups',
-    'roussos',
-    'routeways',
-    'routinization',
-    'roylott',
-    'roznov',
-    'rp-ors',
-    'rs-232',
-    'rsmw',
-    'rubber-stamping',
     'rubbia',
-    'rubbings',
-    'rubenstein',
-    'rubiaceae',
-    'rubicam',
-    'ruchill',
-    'rucsacs',
-    'rudhall',
-    'ruel',
-    'rugby-playing',
-    'ruggles',
-    'rumens',
-    'ruminatively',
-    'rummy',
-    'runswick',
-    'rupprecht',
     'ruscha',
-    'ruses',
-    'rushmore',
-    'russes',
-    'russias',
-    'rusticity',
-    'rustique',
-    'ruthenian',
-    'rutherford-appleton',
-    'rutherfords',
-    'rv8',
-    'rxe',
-    'ryabov',
-    'ryszard',
-    'ryvita',
-    's&eacute;guin',
     's&oslash;ren',
-    's.1(3)',
-    's.36',
-    's.79s',
-    's.acidocaldarius',
-    's.e.m.',
-    's.m.t.',
-    's.r.',
-    's.solfataricus',
-    's138',
-    's16',
-    's2(1)',
-    's34(1)',
-    's35',
-    's89',
-    'sa\'adah',
     'saale',
-    'sabbatarian',
-    'sabhavasu',
-    'sabre-toothed',
-    'sacchi',
-    'sack-like',
-    'sacrality',
-    'safe-buy',
-    'safer-sex',
-    'sahelian',
-    'saic',
-    'saint-cloud',
-    'saint-simon',
-    'sainty',
-    'saitama',
-    'saito',
     'saitoti',
-    'salination',
-    'salivated',
-    'sally-ann',
-    'salonen',
-    'salonga',
-    'saltations',
-    'saltmarshes',
-    'saltney',
-    'sama',
-    'samey',
-    'samizdat',
-    'samling',
-    'samna',
-    'samovar',
-    'samphire',
     'samra',
-    'sana\'a',
-    'sandstorms',
-    'sandtex',
-    'sandwiching',
-    'sandzak',
-    'sanga-sanga',
-    'sans_serif',
-    'sansepolcro',
-    'santas',
-    'santillana',
-    'sapphire-blue',
-    'sapwood',
-    'sarasin',
-    'sarnies',
-    'sarre',
     'sartaj',
-    'sasp',
-    'saspac',
-    'satay',
-    'satirized',
-    'satish',
-    'saucer-shaped',
-    'saucily',
-    'sauer',
-    'savoir-faire',
-    'saxatile',
-    'saxifraga',
-    'sc.',
-    'scaffolds',
-    'scalic',
-    'scalping',
     'scandale',
-    'scarfed',
-    'scariest',
-    'scarinish',
-    'sch&uuml;rer',
-    'schachtman',
-    'schemaid',
-    'schismatics',
-    'schleicher',
-    'schleyer',
-    'schmeling',
-    'schmidt-richberg',
-    'scho',
-    'school-boy',
-    'school-led',
-    'schoolmarm',
     'schoolmen',
-    'schorne',
-    'schrager',
-    'schregle',
-    'schreuder',
-    'schrijver',
-    'scip',
-    'scissortail',
-    'scm',
-    'scops',
-    'scrapyards',
-    'screeds',
-    'screw-top',
-    'scrimped',
-    'scriptible',
-    'scrofula',
     'sculler',
-    'scums',
-    'scurryings',
-    'scuse',
-    'scut',
-    'scuttlers',
-    'se5a',
-    'sea-captain',
-    'sea-horses',
-    'sea-shells',
-    'seacroft',
-    'seashores',
-    'secc',
-    'second-degree',
-    'second-highest',
-    'second-phase',
     'second-wave',
-    'sedimentologist',
-    'see-sawing',
-    'seeboard',
-    'seedheads',
-    'seediness',
-    'seidman',
-    'seifert',
-    'seismograph',
-    'seismological',
-    'selangor',
-    'selenomethionine',
-    'seleucids',
-    'self-adjusting',
-    'self-aggrandisement',
-    'self-concepts',
     'self-containment',
-    'self-contempt',
-    'self-created',
-    'self-deluding',
-    'self-determined',
-    'self-harm',
-    'self-initiated',
-    'self-interests',
-    'self-limiting',
-    'self-renewing',
-    'self-righteously',
-    'self-validation',
-    'sellable',
-    'sellout',
-    'selside',
-    'seltzer',
     'semi-crystalline',
-    'semi-permeable',
-    'semi-rigid',
-    'semisolid',
-    'semp',
-    'sense-qualifiers',
-    'sensitising',
-    'sensory-motor',
-    'sententiae',
-    'sententiously',
-    'sentier',
-    'sepals',
-    'sepia-tinted',
-    'septet',
-    'septimania',
-    'septimius',
     'sequence-dependent',
-    'ser-gln',
-    'serapis',
-    'serenading',
-    'servi',
-    'sesa',
-    'sesh',
-    'seti',
-    'setups',
-    'sev',
-    'seven-part',
-    'seven-storey',
-    'severini',
-    'severn-trent',
-    'sevres',
-    'sex-linked',
     'seynes',
-    'sgts',
-    'shacklady',
-    'shafi',
-    'shakey',
-    'shallice',
-    'shamley',
-    'shamrocks',
-    'shanaar',
-    'shantung',
-    'shaolin',
-    'shapings',
-    'shar',
-    'shardlow',
-    'share-dealing',
-    'share-holders',
     'sharpeners',
-    'sharpeville',
-    'sharpshooter',
-    'sheard',
-    'shedlock',
-    'sheep-farming',
-    'sheeps',
-    'shelleys',
-    'shennan',
-    'sherries',
-    'sheth',
-    'shiela',
-    'shift-work',
-    'shiftworkers',
-    'shigella',
-    'shigeru',
     'shillingford',
-    'shimmying',
-    'shinty',
-    'shipload',
-    'shipmate',
-    'shipwright',
-    'shiratori',
-    'shirehall',
-    'shirer',
-    'shirkers',
-    'shirt-front',
-    'shirt-sleeved',
-    'shirtless',
-    'shklar',
-    'shmuel',
-    'shock-horror',
     'shockcorded',
-    'shoddiness',
-    'shoe-box',
-    'shoehorn',
-    'shoguns',
-    'shoot-em-up',
-    'shop-lifting',
-    'shopgirl',
-    'shopping-list',
-    'short-distance',
-    'shortsightedness',
-    'shotley',
-    'show-biz',
-    'show-piece',
-    'showaddywaddy',
-    'shower-room',
     'showjumper',
-    'showjumpers',
-    'shreddies',
-    'shrigley',
-    'shrillness',
-    'shrivels',
-    'shufti',
-    'shukoh',
-    'shut-out',
-    'si&egrave;cle',
-    'sialic',
-    'side-kick',
-    'sidebottom',
-    'sidelight',
-    'sideslip',
-    'sidewards',
     'sidey',
-    'sight-lines',
-    'signwriter',
-    'sikulu',
-    'silberbauer',
-    'silbury',
-    'silcott',
-    'silicon-based',
-    'silicones',
-    'sillett',
-    'silver-coloured',
-    'silverhill',
-    'silvicultural',
-    'simi',
-    'simo',
-    'simonica',
     'simonis',
-    'simples',
-    'sinensis',
-    'single-break',
-    'single-crystal',
-    'single-engine',
-    'single-point',
-    'single-slot',
-    'single-subject',
-    'sinnamon',
-    'siraj-ud-daula',
-    'sirmione',
-    'siskins',
-    'sitiveni',
-    'sivanandan',
-    'six-and-a-half',
     'six-lane',
-    'six-strong',
-    'six-wheeled',
-    'sixt',
-    'sixteen-hour',
-    'sixteen-year-olds',
-    'sixty-first',
-    'sjp',
-    'skah',
-    'skanderbeg',
-    'skatepark',
-    'skellbank',
-    'skew-whiff',
-    'skiffs',
-    'skilbeck',
-    'skimmia',
     'skipjack',
-    'skits',
-    'skiwear',
-    'skorpion',
-    'skull-like',
-    'slann',
-    'slava',
-    'slave-trade',
-    'slaver',
-    'slavia',
-    'slayers',
-    'sleekness',
-    'sleightholme',
-    'sleightholmedale',
-    'sleipner',
-    'slemen',
     'sleuthing',
-    'slicked-back',
-    'slide-rule',
-    'slim-line',
-    'slioch',
-    'slobber',
-    'slowcoach',
-    'sluman',
-    'sluys',
-    'sm/nd',
-    'smacker',
-    'small-boned',
-    'small-holders',
-    'small-sized',
-    'smartish',
-    'smash-and-grab',
     'smeed',
-    'smick',
-    'smidgeon',
-    'smokebusters',
-    'sn9000',
-    'snaffled',
-    'snaky',
-    'snap-on',
-    'snickered',
-    'snicket',
-    'snoozed',
-    'snorri',
-    'snuff-box',
-    'so_er_that',
-    'soakerhose',
-    'sobor',
     'social-purity',
-    'socialist-feminist',
-    'socio',
-    'socio-emotional',
-    'sociopathic',
-    'socratism',
-    'soeur',
-    'soft-ground',
-    'soham',
-    'sohl',
-    'soilless',
-    'soirees',
-    'sol&oacute;rzano',
-    'solemnis',
-    'solidness',
-    'solitariness',
     'solvd',
-    'somerwest',
-    'son-of-a-bitch',
-    'song-writing',
-    'sonically',
-    'sonication',
-    'sonogram',
-    'sont',
-    'sophisticate',
-    'sopra',
-    'sopworth',
-    'sorbets',
-    'sorensen',
-    'sorloth',
-    'sorn',
-    'sos1',
     'sottomarina',
-    'sotw',
-    'souflias',
-    'south-central',
-    'south-westwards',
-    'soviet-built',
-    'soviet-us',
-    'spain\'',
-    'sparrowgrass',
-    'sparrowhawks',
-    'speakin\'',
-    'specially-commissioned',
-    'speckles',
-    'spectabilis',
-    'spectating',
-    'spectroscope',
     'speechwriter',
-    'speedball',
-    'spegelj',
-    'spelthorne',
-    'spendin\'',
-    'spheroid',
-    'spheroplasts',
-    'spi',
-    'spill-over',
-    'spin-orbit',
-    'spinelli',
-    'spinola',
-    'spinosa',
-    'spiralists',
-    'spirito',
-    'spirituall',
     'spirituel',
-    'spivak',
-    'splashback',
-    'spoerri',
-    'spofforth',
-    'spoil-sport',
-    'spokeshave',
-    'sponginess',
-    'spoon-shaped',
-    'spread-out',
-    'spring-flowering',
-    'springbank',
-    'springhead',
-    'spur-of-the-moment',
-    'spurr',
-    'sq.km',
     'sq.m',
-    'sq_yd',
-    'sqlbase',
-    'sqr',
-    'squab',
-    'squared-off',
-    'squeers',
-    'squibs',
-    'squiffy',
-    'srd',
-    'st*r',
-    'st.john',
-    'staatliche',
-    'stadtholder',
-    'stage-by-stage',
-    'staincross',
     'stalnaker',
-    'stalybridge',
-    'stampeding',
-    'stamper',
-    'stanbury',
-    'standoff',
-    'stanford-le-hope',
-    'staphylococci',
-    'stardent',
-    'starships',
-    'state-level',
-    'steamed-up',
-    'steiger',
-    'steine',
-    'stemberger',
-    'stepfamily',
     'sterilin',
-    'stettin',
-    'stickiest',
-    'stiftung',
-    'stigmas',
-    'still-room',
-    'stillwaters',
-    'stingless',
-    'stippling',
-    'stivoro',
-    'stobbs',
-    'stockbery',
-    'stockholder',
-    'stocktake',
-    'stoel',
-    'stolpe',
     'stone-age',
-    'stoneground',
-    'stop-off',
-    'stormily',
-    'story-book',
-    'stowaways',
-    'str&dollar',
-    'straightway',
-    'stranton',
-    'strappy',
-    'strathkelvin',
-    'streatlam',
-    'streetlight',
-    'strengtheners',
-    'strip-tease',
-    'strongbow',
     'strontian',
-    'strontium-90',
-    'stroudley',
-    'strymon',
-    'stuey',
-    'stuka',
-    'stultified',
-    'stunter',
-    'sturgess',
-    'stuyvesant',
-    'sub-basin',
-    'sub-groupings',
-    'sub-licensee',
-    'sub-normal',
-    'sub-order',
-    'sub-space',
     'subbed',
-    'subcellular',
-    'subdomains',
-    'subhepatic',
-    'subhirtella',
-    'subject-object',
-    'submariners',
-    'subpopulation',
-    'subscales',
-    'substantives',
-    'substructures',
-    'successional',
-    'suenens',
-    'sulfolobus',
-    'sulu',
-    'sumps',
     'sumptuousness',
-    'sun-beds',
-    'sun-filled',
-    'sun-sat',
-    'sun-trap',
-    'sun.',
-    'sunbathers',
-    'sunbird',
-    'sunbirds',
-    'sunt',
-    'suntrap',
-    'suomen',
-    'super-organism',
-    'supercharger',
-    'superchunk',
-    'superego-formation',
     'superette',
-    'superhighway',
-    'superieure',
-    'superintendent-nurse',
-    'superiorities',
-    'superlatively',
-    'superovulation',
-    'supra-local',
-    'suprematist',
-    'surfboards',
-    'surtseyan',
-    'susana',
-    'suzerain',
-    'sw8',
-    'swabbing',
-    'swalwell',
     'swanimotes',
-    'swanned',
-    'swartkop',
-    'sweelinck',
-    'sweet-talk',
-    'sweetbreads',
-    'sweetpeas',
-    'sweety',
-    'sweezy',
-    'swindles',
-    'swinnerton-dyer',
-    'swinson',
-    'swiping',
-    'swirly',
-    'switch-off',
-    'swordsmanship',
     'swwa',
-    'syconium',
-    'sydel',
-    'sylvatica',
-    'sylvian',
-    'symbiotically',
-    'symbolists',
-    'symi',
-    'symphytum',
-    'syn-skin',
-    'synchro',
-    'synthesises',
-    'synthetically',
-    'syrups',
-    'sywell',
-    't-bond',
     't-helper',
-    't-lymphocytes',
-    't-pa',
-    't9',
-    't9000-based',
-    'tabley',
-    'tabulations',
-    'tackiness',
-    'tafahi',
-    'taffrail',
-    'taglioni',
-    'tagro',
-    'taill&eacute',
-    'taints',
-    'taisce',
-    'takashimiya',
     'talabec',
-    'talens',
-    'talking-point',
-    'tallahassee',
-    'tallbacka',
-    'tames',
-    'tamplin',
-    'tamponade',
-    'tamzin',
-    'tangere',
-    'tankersley',
-    'tantalise',
-    'tantalum',
-    'tap-in',
-    'tappajoss',
-    'tapsell',
     'taranaki',
-    'tarantella',
-    'tarantulas',
-    'tarby',
-    'task-based',
-    'task-force',
-    'tassi',
-    'tatchell',
-    'tates',
-    'tauten',
-    'tautened',
-    'tax-payer',
-    'taylor-agathangelou',
-    'tblisi',
-    'tcpa',
-    'tea-tree',
     'teach-ins',
-    'teacher-trainers',
-    'teacher/pupil',
-    'teasels',
-    'technology.',
-    'tehuana',
-    'tel-me',
-    'telekinetic',
-    'teles',
-    'teletel',
-    'tellee',
-    'tenderers',
-    'teo',
-    'teotihuacan',
-    'terminally-ill',
-    'terpenes',
     'tersteeg',
-    'tertian',
-    'tertius',
-    'tessy',
-    'tetraplegia',
-    'teutsche',
-    'tfap',
-    'tfiid',
-    'tfr',
-    'thamesmead',
-    'tharsis',
-    'thatcham',
-    'theatre-going',
-    'thegn',
-    'them\'',
-    'theocritus',
     'theosophical',
-    'thermo',
-    'thermodynamically',
-    'thessalians',
-    'thibaud',
-    'thick-headed',
-    'thick-lensed',
-    'thier',
-    'thieve',
-    'thigh-length',
-    'thimbleful',
-    'thin-walled',
-    'thinkable',
-    'third-degree',
-    'thirlestane',
-    'thirstless',
     'thirteen-year',
-    'thirty-five-year-old',
-    'thrapston',
-    'three-aisled',
-    'three-bedded',
-    'three-element',
-    'three-for-two',
-    'three-generational',
-    'three-headed',
-    'three-level',
-    'three-line',
-    'three-track',
-    'three-word',
-    'thromboembolic',
-    'throwbacks',
-    'thrupp',
     'thurii',
-    'thurland',
-    'ticking-off',
-    'tiempo',
-    'tigercat',
-    'tillie',
-    'time-',
-    'time-spans',
-    'time-words',
-    'timotei',
-    'tinderbox',
-    'tings',
-    'tinoco',
-    'tion',
-    'tip-toes',
-    'tipp-ex',
     'tippers',
-    'tisane',
-    'tishkov',
-    'tithonian',
-    'title-pages',
-    'toasties',
-    'today/live',
-    'toecap',
-    'toecaps',
-    'togolais',
-    'toilers',
-    'toilet-training',
-    'toiletry',
-    'toit',
-    'toivo',
-    'tok',
     'toll-house',
-    'tollerton',
-    'tomographic',
-    'tongue-and-groove',
-    'tonights',
-    'tonto',
-    'toolbus',
-    'top-of-the-table',
-    'top-ranked',
-    'top-rate',
-    'topographies',
-    'topsham',
-    'torremolinos',
-    'torsion-angle',
-    'tory-controlled',
-    'tosti',
     'totalized',
-    'tough-looking',
-    'tourmaline',
-    'tourney',
-    'tours-sur-marne',
-    'town-centre',
-    'townesend',
-    'toxics',
-    'tpm',
-    'trackball',
-    'trackwork',
-    'tractarian',
-    'tractarians',
-    'tradeco',
-    'traffic-lights',
-    'trainspotters',
     'trans-acting',
-    'transcaucasian',
-    'transferral',
-    'transhumance',
-    'transmissivity',
-    'transperitoneal',
-    'transpower',
-    'transtools',
-    'trapezoidal',
-    'trebly',
-    'tree-climbing',
-    'tree-ring',
-    'tree-roots',
-    'tree-stumps',
-    'trefoils',
-    'treherne',
     'trellised',
-    'trend-setting',
-    'trenton',
-    'treponema',
-    'tribology',
-    'tribschen',
-    'tricksy',
-    'tricuspid',
-    'trigonometrical',
-    'trinovantes',
-    'trionic',
-    'trip-wire',
-    'triple-purpose',
-    'tripura',
-    'triste',
-    'trivialised',
     'trivializing',
-    'trob',
-    'trollies',
-    'trombonist',
-    'trompe-l\'oeil',
-    'troost',
-    'trouble-torn',
-    'trrl',
-    'trt',
-    'trucked',
-    'truckloads',
-    'truffaut',
-    'trumbo',
-    'truncating',
-    'trussell',
-    'tryptophan',
     'tsang',
-    'tsarevich',
-    'tsps',
-    'tsurumaki',
-    'tubulovillous',
-    'tuffers',
-    'tufty',
-    'tukaram',
-    'tumblejack',
-    'tumorigenic',
-    'tums',
-    'tunc',
-    'tuobin',
-    'tupou',
-    'turley',
-    'turney',
     'turnin\'',
-    'turntables',
-    'turpitude',
-    'turske-hue-williams',
-    'tursun',
-    'tuwaithah',
-    'tvnz',
-    'twelve-foot',
-    'twin-cam',
-    'twitcher',
-    'twitchit',
-    'two-layer',
-    'two-month-old',
-    'two-terminal',
-    'two-times',
-    'twr',
     'twycross',
-    'tyche',
-    'tyne-tees',
-    'typicality',
-    'tyseley',
-    'tysons',
-    'tzeentch',
-    'u&iacute',
-    'u.s',
-    'u.s.a',
-    'u2\'s',
-    'u6',
-    'uao',
-    'uccello',
-    'uden',
-    'uec',
     'ufd',
-    'ugandans',
-    'ugo',
-    'uitsmijter',
-    'uitua',
-    'ulama',
-    'ulph',
-    'ultra-conservative',
-    'ultra-sensitive',
-    'ultrasonographic',
-    'ulvik',
-    'ulysse',
-    'umbilicus',
-    'umma',
-    'unachieved',
-    'unary',
     'unassertive',
-    'unassigned',
-    'unavailingly',
-    'unbeheld',
-    'unbuckling',
-    'unburned',
-    'uncivil',
-    'uncoated',
-    'uncoil',
-    'uncompetitiveness',
-    'uncomplexed',
-    'unconscionably',
-    'uncontainable',
-    'uncouple',
-    'uncp',
-    'under-manager',
     'under-researched',
-    'under-subscribed',
-    'under-the-counter',
-    'under-use',
-    'undernutrition',
-    'undershoot',
-    'undersurface',
-    'undiplomatic',
-    'undulation',
-    'unenclosed',
-    'unendingly',
-    'unfeigned',
-    'unfixed',
-    'unforseen',
-    'ungers',
-    'ungoverned',
     'unhedged',
-    'unhinge',
-    'unhooking',
-    'uni-directional',
-    'unibol',
-    'unidad',
-    'unifem',
-    'uninterpretable',
-    'uniprocessors',
-    'universiade',
-    'universite',
-    'university-wide',
-    'unkindest',
-    'unlamented',
-    'unlikeable',
-    'unmated',
     'unperfumed',
-    'unpinned',
-    'unrehearsed',
-    'unresponsiveness',
-    'unruliness',
-    'unsaddled',
-    'unscreened',
-    'unstinted',
-    'unstoppably',
-    'untasted',
-    'unwinking',
-    'unwrinkled',
-    'up-grading',
-    'up-problem',
-    'updraught',
-    'upss',
     'upsurges',
-    'upwarps',
-    'ura5',
-    'urd',
-    'urdd',
-    'urgonian',
-    'urinalysis',
-    'urmston',
-    'ursprung',
-    'us&dollar;1,300',
-    'us&dollar;11,000',
-    'us&dollar;12,000',
-    'us&dollar;15,000,000',
-    'us&dollar;150',
-    'us&dollar;20',
-    'us&dollar;3,000,000',
     'us&dollar;300,000,000',
-    'us&dollar;6,000,000',
-    'us&dollar;60,000,000',
-    'us-ec',
-    'used-car',
-    'used-up',
-    'usi',
-    'usu',
-    'usurer',
-    'utopians',
-    'uttlesford',
-    'uu',
-    'v&aacute;squez',
-    'v&eacute;rit&eacute',
-    'v.e.',
-    'v35',
     'vaags&ouml',
-    'vader',
-    'vaginalis',
-    'vaillant',
-    'valadon',
-    'valances',
-    'valen',
-    'valenti',
-    'valeri',
-    'valine',
-    'valkyries',
-    'valparaiso',
-    'vandross',
-    'vansitart',
-    'vanunu',
-    'vaporise',
     'varah',
-    'varityper',
-    'varmus',
-    'varu',
-    'varves',
-    'vasarely',
-    'vashtar',
-    'vatman',
-    'vauzelle',
-    'vc10',
-    'vectored',
-    'vedas',
-    'vegetius',
-    'veiga',
-    'veitchi',
-    'velikovsky',
     'velorum',
-    'ventolin',
-    'ventriloquy',
-    'venturer',
-    'venturesome',
-    'veres',
-    'verrilli',
-    'vestel',
-    'vestries',
-    'vicariate',
-    'vice-chairs',
-    'vicom',
-    'victoriously',
-    'video-based',
-    'videologic',
-    'videophones',
     'videotelephony',
-    'viewlogic',
-    'vii.',
-    'vilifying',
-    'villa-lobos',
-    'villainess',
-    'villanueva',
-    'vimla',
-    'vimto',
-    'vindictively',
-    'viole',
-    'violet-blue',
-    'virion',
-    'virions',
-    'virological',
-    'viscaal',
     'viseu',
-    'visualiser',
-    'visystems',
-    'vitara',
-    'vivas',
-    'vlci',
-    'vo5',
-    'vocalise',
-    'vodapage',
-    'voeux',
-    'vokins',
-    'vol.1',
-    'volcanicity',
-    'volitis',
-    'volleying',
-    'vonnegut',
     'voronin',
-    'vose',
-    'vote-rigging',
-    'voukashan',
-    'voyces',
-    'vpp500',
-    'vsr',
-    'vulcanite',
-    'vulgarities',
-    'w&uuml;rttemberg',
-    'w/e',
-    'w5',
-    'w7',
-    'wadded',
-    'waddicar',
-    'wadebridge',
     'wades',
-    'waechter',
-    'wahab',
-    'wailings',
-    'wako',
-    'waldock',
-    'wallahs',
-    'wallin',
-    'wallplugs',
-    'walrasian',
-    'walton-on-thames',
-    'waltons',
-    'walvin',
-    'wangchuk',
-    'wanner',
-    'warks',
     'warmongers',
-    'warnham',
-    'warrington-based',
-    'warriston',
-    'was/is',
-    'wash-basins',
-    'waste-management',
-    'wastebasket',
-    'watch-tower',
-    'watchfully',
-    'water-clock',
-    'water-colourist',
-    'watneys',
-    'wauchope',
-    'wav',
-    'wave-length',
     'wavelets',
-    'waverly',
-    'waymarking',
-    'wc2n',
-    'wdowczyk',
-    'weare',
-    'wechsler',
-    'wedale',
-    'weed-free',
-    'weekenders',
-    'weibel',
-    'weigher',
-    'weightily',
-    'weitek',
-    'well-advised',
-    'well-backed',
     'well-briefed',
-    'well-conceived',
-    'well-considered',
-    'well-cooked',
-    'well-grounded',
-    'well-laid',
-    'well-modulated',
-    'well-positioned',
-    'well-rooted',
-    'well-tempered',
-    'wentworths',
-    'wenzel',
-    'westall',
-    'westone',
-    'whaddya',
-    'whately',
     'wheatfield',
-    'wheel-chair',
-    'whereon',
-    'whiffs',
-    'whiling',
-    'whip-round',
-    'whipcord',
-    'whirligigs',
-    'whirlwinds',
-    'whispery',
-    'white-backed',
-    'white-flowered',
-    'white-knuckle',
-    'white-owned',
-    'white-robed',
-    'whitechurch',
     'whitelock',
-    'whiteread',
-    'whitford',
-    'whitrow',
-    'whitson',
-    'whitsunday',
-    'whodunnits',
-    'whole-trunk',
-    'whorlton',
-    'whymper',
-    'wickedest',
-    'wicksteed',
-    'widcombe',
-    'wide-bodied',
-    'wide-spread',
-    'widebody',
     'wielder',
-    'wij',
-    'wilbye',
-    'wildblood',
-    'wildboar',
-    'wilden',
-    'willcocks',
-    'wille',
-    'willig',
-    'wilpattu',
-    'win-lose',
-    'win/u',
-    'wind-chill',
-    'wind-dispersed',
-    'winding-sheets',
-    'windm&uuml;ller',
     'windowboxes',
-    'wine-dark',
-    'wine-makers',
-    'wing-drop',
-    'winmill',
-    'winstone',
-    'winterbourne',
-    'winwood',
-    'wipeout',
-    'wirtz',
-    'wisharts',
-    'witch-doctor',
-    'witch-like',
-    'wittgensteinian',
-    'wn',
-    'wolf-like',
     'womanizing',
-    'womanliness',
-    'wontner',
-    'woodacon',
-    'woodchip',
-    'woodfield',
-    'woodpulp',
-    'woodwinds',
-    'woozy',
-    'workaholics',
-    'workshy',
-    'worksurfaces',
-    'wormald',
-    'worsborough',
-    'worst-ever',
-    'worst-off',
     'wouldnt',
-    'wouldst',
-    'wowee',
-    'wranglings',
-    'wreaks',
-    'wriglesworth',
-    'writer-self',
-    'writin\'',
-    'wrong-doers',
-    'wrotham',
-    'wyborcza',
-    'wynford',
-    'wynne-thomas',
-    'wynyard',
-    'wytham',
-    'x-normal',
     'x-plor',
-    'xan',
-    'xanthippos',
-    'xdb',
-    'xfi',
-    'xga',
-    'xie',
-    'xlib',
-    'xlii',
-    'xlix',
-    'xlvii',
-    'xr3',
-    'xueqian',
-    'xz',
-    'y-yes',
-    'y178&ndash;3',
     'y6n17',
-    'y_',
-    'ya\'acov',
-    'yacoubou',
-    'yafforth',
-    'yakutsk',
-    'yamamah',
-    'yarranton',
-    'yarwell',
-    'ybg',
-    'years-old',
-    'yelena',
-    'yelverton',
-    'yere',
-    'yesses',
-    'yessir',
     'yildirim',
-    'yinka',
-    'yohkoh',
-    'yokels',
-    'yokogawa',
-    'yonex',
-    'yorkhill',
-    'yosef',
-    'youngest-ever',
-    'youssouf',
-    'ypll',
-    'yuasa',
-    'yukawa',
-    'yur',
-    'z-axis',
-    'z80',
     'zambezia',
-    'zapu',
-    'zarb',
-    'zardari',
-    'zat',
-    'zdenek',
-    'ze\'evi',
-    'zelaya',
-    'zelenin',
-    'zenawi',
-    'zeos',
-    'zep',
-    'zeri',
-    'zeugma',
-    'zillah',
-    'znaniecki',
     'zolotas',
-    'zorzi',
-    'zotos',
-    'zue',
-    'zurif',
-    'zx81',
+)
+
+blocks_17 = (
+    '"&mp;co.!3ccaron;ern&iacute;n!\'dgr&egr$";r"*ollar;0.22*"30($1.00*"40*"57))0,000,000*#.7m)"15)%2,500*#.6m)$3.3m',
+    '()2,000,000*#700)#.00*!1*!3*"50))0,000,000.!m)!6*!m(%3,600)".4)"bn($4.1m)#000',
+    ')"8m(&5,000m*#700)#.1m*"5m*"7m*"8m($6.2m*!5+!m*"8m)*00,000,000($7.4m($8.1m)!5',
+    '($9.3m)!5)"95!,eacute;coles($omer!&flat;3&!7"(ormula;3")rac14;in.%"38!$gt;2!*lt;process$(shift&gt!(mdash;he\')including',
+    '\'$were")icro;g/hr\'&mol/ml!*pound;0.3m\'&1,000m)#650(#.09)"45)#6bn(%0,300)!2($1.25($2.25)!2)!4',
+    '($4.00*"5m)"00(.5&ndash;20,000)30,000&ndash;200,000(#6.6($8.00*!5)!3)!7\'%2,900(#.45(+0-&pound;30)#.95(%2,500',
+    '($7.95\'%3,800(#.10)"55)"65)"90($2.55(&40,000(#500(%9,000)#.50("m.\'$4.8m(2/&pound;3/&pound;2($0.00',
+    '(%1,000("2m($4.99("89("90\')5,000,000(#.49)"7m($0.00(%1,000)!m("65(%7,000("80\'#6.4',
+    '(%7,000)!0(%9,000)!m\'$7.7m("25(!3(%8,000\'#830("60("70)!5("80(\'million\'$9.75',
+    '("4m(%6,000)!0!(sect;246"#up3!/thorn;ingvellir"&imes;8 #\'22!"68!"85!#but!$eart!$mere!"ot"$uses',
+    '!#urt (*altered!(mohammad #+27!!5!!6 #-18!"65!"as!%based!)dependent!#ish!"lt!#one!$that',
+    ' #.32!!8 $/and!"i/!"k/!"ml *0&ndash;10(!6!$.002#"25"#125#!8""29"\'5&deg;c#!1',
+    '#!2#!m""70""82#!6#!9!$0:07$!9#"11$!3#"27!\'1&ndash!#222""33"!8',
+    '!#400!"70#!7!$8.30 71&frac12&ndash;2&frac12"%mgr;m".ndash;1&frac12)!4)!9("2%("40!#\'11!#(6)!$-193"%point',
+    '""23#!7""38"#4.1"#5.5#!7""68"\'9-litre#!0#!m!*0&ndash;10*!8)"30)!4)!6',
+    '""-9#$inch"%.00pm#"2%$#0pm$!3"%0&deg$)ndash;300#%-year##3.1#"ng#!w"(1&sol;76""32#"rd',
+    '#!8""85""91#!g"":1"$a.m."$ngml"!v!)1&ndash;4)!9"(,000,000""-1#$hour#&member$(onth-old',
+    '#"25#"32$!6""0g""10#!2#!6""31#!3"%4,000#!4#!6""94"!b""s.',
+    '#(ndash;10*!2)"20)!6"$,600"\'-minute#%point#&strong"#.1%$!3#"2%#"34$!5$!6""18',
+    '#!1#!6""31#!7""49""51"$noon!*3&ndash;12""-0#)year-olds"%1,000"#20s""53""63""88',
+    '!$4-18#$hour#&strong""07#"cm#"lb""14"#30s""41""54#!p""64#!7""81""s.',
+    '"!-#!5#!8"".9""04#,9&ndash;1558#!p!*6&ndash;12)!4"#-21#$hour#$inch#&member#&strong"#.8%',
+    '!(7&frac12#\'ndash;3"#(3)"&-stone"#5th"*98&ndash;9"!a!$8&ft"#.4%"*00&mdash;1#*8&ndash;14""cm"!m!$9-23"!.',
+    '"*05&ndash;7"-14&ndash;1918#*9&ndash;20"*24&ndash;5#)7&ndash;8"*31&ndash;2#*6&ndash;37"*41&ndash;2#)7&ndash;8"+51&ndash;64#*2&ndash;70"+64&ndash;65#)6&ndash;7#*8&ndash;70#$9/70',
+    '#$3/74#*6&ndash;77$!."+85&ndash;89"\'91/1992##2-h$%/1993##4/5""mm!":4!"bg!"d."!q!!f!&kg/2lb',
+    ' \'2&mgr;m"*ndash;3min(#4pm"(times;10!$,166"\'300,000"%500ft"\'600,000!$-ply!#.03""34#!6#!9""44"#5.1',
+    '#"pc"#7.2!+0&ndash;25%"!-"#.3%#!8$!%"$0mph""89"!a""ms!+1&ndash;may"#.10"#064"(6&sol;87',
+    ')!6"#.6%"(3&sol;86""5p!#3.8"#0mm!*4&ndash;36)"48"".8!*5&ndash;50"".8"(0-member##000#%g/9oz#"hp',
+    '#!9!*7&ndash;29"#(2)"#.8%"!a!*8&ndash;31"".3""57"$7(1)!&9-july#%march"".6!"d6!"lx!$mbps',
+    ' $3(a)!"-7")year-olds!$.2.3"$30am#!1"#4.0#!p"#5.2!$0&ft""\'s"".2#"3%"\'0&deg;c##mhz',
+    '#!p#%sl-24""90"#cms""mw!#1.4#!5#!7!#2.7!#3.3#!7""50!#4.4""00!#5.4',
+    '""30"#657"#836#%81-82""ft!*7&frac12;p"".1#!3"#124$!5#"30$!3#"58#"95"#246',
+    '"#366$!7#"79#"93$!4"#451$!2#"72"#529#"50"#626#"30"#731#"58#"61',
+    '"#903$!7$!8$!9#"47#"66!#8.3"&003-04#"93"#175#"90"#202$!7#"13#"83',
+    '#"50"#439"#685"#703#"42#"87$!8$!9"&846-47#"86"#914#"37#"68!$9.5%""0s',
+    '#"16#"22!#lbs!!w *4&ndash;29!#(4)""5)!"-8!$.1.3##5pm""55#!m!*0&ndash;45"\'0&deg;c#\'-strong',
+    '#"cc#"mh!#1pc!&30,000!&40,000""44!"5m!$6521!"7p!$8.9%""pc!#9.9!#:18!!e!"pt',
+    '!!-"&a-side!$.2.4#"5%#!6"$3(a)#!4"#4.4!#0.2#!7#!8")0,000,000#!s!#250!&40,000',
+    '!%6mbar!%9,000 %6,300"#400!#-mp!#.38"#5.3#!m"+6&ndash;6.8!\'0&deg;f##ins"(,000,000"\'-minute#&strong"#/40',
+    '""km"!w!%17949!%35898!%4kbps!#502""36!!v %7&deg!$,800!\'-eleven!#.16!*0&ndash;75!"1p!%2&ins',
+    '"!+!*6-year-old!$7093!#80s"!3!#90s!#:84!#ins *8&ndash;15(!4!#(a)!#-12"$hour!%.15am""22',
+    '$!3!(0-strong"%386sx""88"#:20!%1,000""00!#20s!#5mb!)6&ndash;7"!3"!7"!p!"82"!p',
+    '!#lbs )9&ndash;9!#(5)!",9!%-hole!#.19""35""50"#6.0#!8!%0/110"#0mm"!3"!5!"15',
+    '"!2!%6,000!"79!%8,000!%9,000!!c"!m!"km!"ls!"s. "a%!\'&dollar"(iuml;oli!".2"!b',
+    '"$h.q."!l"!n!#174!"22!"30""20"!5!#417""23!"65!._heck_of_a_lot!$aaaa#!s""re',
+    '#"ht#$lone##ssi"$bacy$#sid#$otts"*del-rahman&%shafi%!a"\'erfoyle$\'tillery"%imael")ove-named"#reu"&scopal',
+    '#%olves#&tinent"%trust"#uts"\'yssorum!\'carnley"(curacies"&heloos")id-loving$#ify"#ost"\'quirors%!s"%tinic$+on-research',
+    '#%omite!)damantine$!i#)ptiveness"$emar#&noidal%,ma-carcinoma#+sang&eacute"*hesiveness"&jugate"*monishment"&oimara"\'riatica!"ek"(milianus',
+    '")roengines$-l&iacute;neas"$this!$fars"*fectations#&ianced$\'liating)"ve#*reightment"-ore-mentioned")ter-match!#ger"#ger#!i#)lutinated',
+    '"!i#%t-pop"#len#%ietta"&nathan"%onize".ri-environment$.culture/nature"#ung#$tter!$h-ha"!4"#hhh"%riman!"ic',
+    '"(m&eacute#$etti#$tech"(r-drying$#gap#&acomet#%burst#%threy"&though"-x-la-chapelle!)jdabiyans""rs!%keman"#sed"!t',
+    '"$adin#$mena"(b&eacute#%eroni##ite"$cala##ide##orn"\'dehydes$!n$%rcine##red#$wark"#eks#&mannia',
+    '#!n#$sana#%uadai#$xiou"&fonsin"&gebras"\'ienable&%tions#%stare"*ka-seltzer#$enes")l-nighter#$chin#"ee#&oprene',
+    '"!m#(a-tadema#$roth"$nasr#%mouth"%pheus$$onso"\'tiplano!$mann#"ya"$bler#&rosius"\'enophis#\'rcement$(icanisms',
+    '"$hara"#ici#"el"&nesiac")oeba-like#(xycillin")phipathic%)sbaenians"&strads"$well""yl!#n-2"\'alysand"%coats"$d_of',
+    '%%nikos"\'gelique%"la#)iographic#*lo-russian#&ostura$%umois"+harmonicity#&ydrous"$ibal#)matronics""ke"\'napolis#&emarie#!i',
+    '##wyl"&odised#\'nimalle"&themic#+i-bolshevik%*capitalism%&europe%#gay%&icam-1&.ntellectualism%(military%-revolutionary&&ussian%\'tetanus%\'zionist',
+    '$)histamine$)macassars$#pas%$hons$%quark$*thrombotic%*uberculous#%onini&#oni#\'rectomy"#zio!$osta!%p1000"!5"\'eriodic',
+    '"*istogramma"(ollinare""p.$$cas.#!c#"en#&lebaum%$gath%&search#$osed#*reciations"(ril-june#$oned"%score"#ted',
+    '$$tica#\'ifolium!+r&ecirc;tes"%-wacc"%abica#"ra"$cado#.h-conservative$$aism%"os$!e$&ipenko$%osaur"$dbeg#"du',
+    '"$gand#&enteus##ies#&onauts"$iana##sto""jo"%lidge"+m-wrestling#&agnacs$!n#&s-race$$cott"\'ncliffe#&dorfer',
+    '##oux")raignment#$iaga#%ogate"$sena"#teh#\'iculacy#\'rageous"#une"&vensis!#sah"+censionists#(riptions"%hburn#(ton-tate',
+    '"%moyah"!o"\'pinwall".sembl&eacute;e\'$ymen$!r$(t-backed&)stripping"(trocytes%%nomic%*physicists!&tavism"$cham""ea")heistical',
+    '##yah"(lantique"$oned"(rakhasis"\'tainder$!x#!e#$icus$#gny$+tude-change!)udibility$*o-cassette&%tapes%%metry%\'visuals',
+    '"!i"$klet""la"%riega"#ssi#\'terlitz$(rasiacae)!n"%teuil#*o-exposure$%bahns$)cephalous$\'matized$%somal!%vanti',
+    '##ray$$ment""ia!#wa\'"!d"+kwardnesses!%xford"%holme"(illaries!\'yasofya"\'lmerton"$thya""ub!(zo-bound"\'zopardi',
+    ')(b&eacute"\'ouml;hm!!\'!".1"#sc.!"13#"48"!4"!8!"=2!#aaf#%thist"$brak#&y-boom)#ers',
+    '#&harach$$mann#(k-burner%&office%%slash&\'tabbing$\'filling$$pass#,teriologists(&phages"#ena"#ggs#&lietto%!n"+il&eacute;n',
+    '"(ldessari$!i$$wins##ers#%lcock$%gowns$\'ingolin$\'oonists$\'yskeagh#$tics#!y"\'mberger##ert"(ndmaster#&i-sadr',
+    '"(r-hillel$$like#(barities$#era#$dell#)e-chested%\'knuckle#&onnies#\'rel-bag\'\'chested$#oso#(tolommeo##vas#$ytes"%sford',
+    '#\'soonist##ted"$tson#&tening%#rie"%xters"#yed#%sford"(zalgette#$eley#%ookas!\'bcbasic!&eacham%\'combers)#ing',
+    '$#eth#%ucoup$(marchais"*chuanaland#&kerman"&d-time#&wetter"\'e-eater#%chams#&keeper"&ggarly#)rudgingly"%hrend"(l-hathor$)korhadris',
+    '#%field#&l-rope$#any%%vista%!y$#end%%ville$$ford$!i$$yful#%stead"#nda%"ll#)evolences#"gt',
+    '#$ning#)oxaprofen#%twich"%ranek#\'engaria#!i$\'nsfield$!o#"ka#,m&uacute;dez#%neray##row#(telsmann$$houd$#olt',
+    '#(pattered#&t-paid%*remembered"#tws"#ver"$wail#)ilderedly$#tch")xleyheath"%yeler!"fa""rc!"gl!,ibliometrics&$teca',
+    ')#que"*carbonates#%ktons"%dgood"(ennially"&focals"\'g-match$&screen#$gart#$ness$"or#$rams"#hac"#iba"&labial',
+    '#!k$!o#%lfold$*ion-dollar"#mal"%ndoff#"et#!h##son"\'oenergy#%genic%)ographers##mes#%scope$+tratigraphy',
+    '$(urbation"(rch-bark%"am##ger#%khall#$ling#%nbaum#!r#&thdate$#les"&scuity#(marckian"(t-mapped$\'pattern"&valent',
+    '"%zango!%j-200!#lab#\'ck-hole&(throated%$bury%#ham%%shard%#ton%(wellgate#%grave#(irgowrie#,meworthiness#\'sendorf$&phemer',
+    '#&vatsky"$echa"#ick#&dworth#%mming#(nd-alley"*ood-filled&%group&\'thirsty%%lines#"re#%tters#%whole$%pipes#!x',
+    '#(e-greens$#boy$$john$&script%$tone$"tt#%nsdon$$ting!(oatyards"#cca"$dega#"ge#$hran##ine#$nant',
+    '$\'builder"*g-standard#\'danovic"+h&egrave;me"$ivin"%lides$#var#%lworm#%ovian##tby$#ers"(mb-proof"(n_viveur#!i$!o',
+    '"%o-boo#$bies$&ytraps#*gification#&kplate)!s#$mers$$town#(tleggers$%strap%!y"%ppard$"ed""ra##eas',
+    '#&romean#%selen"$sley#%porus"#the#*tom-living"\'ulanger#&rchier$%gelat&.ois-democratic%#oin#%squet##yer"#vet"%wcott',
+    '#(l-shaped#&thorpe"(x-shaped#%plots")y-friends#+d-carpenter#"os"\'zinoski!"pm"!r!(rabourne##cco$$kett#&denham$,ford-on-avon',
+    '#(h&eacute#$ined%%power$(thwaites#%mante$#ber#\'nchings$&dishes%!l$%ksome$\'tingham#)siliensis#$voes##wdy"(eadcrumb',
+    '$#th.##edt#(merhaven"$iand$#ult#(ck-lined%#ley#&dged-t#(ggflatts#\'lliancy#%nsley#*stol-myers#*tish-irish#&xworth")oad-money',
+    '%%meyer%%sword%!y#$dkey#(ederbond#%letto#(mophenol#$nica$#ski#&okwood#$wnes%)ish-green%#lie"#ung$\'tsfield',
+    '$(hstrokes$\'queness#&talism$\'ishness"\'yanston##don!"sn!#toe!(ubblejet"#car#!h$$holz$#man##key")ddy-buddy',
+    '""en"&ildin\'\'(g-blocks"&ll-dog$#ins$$ough$#pot$&rushes#&strode"%mford#%stead"#nge"#rch%#ell#3eaucratic-technical',
+    '#(haneddin#!k$#ard#&lesdon&$ques#$nden$*ham-on-sea##ray$!y#%stall#+ton-roberts#$well##yat&!s"$scot',
+    '##ies$(ness-led)\'related)$unit($loan#$kett##ses##tos")tton-hole&%ed-up$\'ressing"\'zzwords!\'y-roads#*your-leave""am',
+    '"#les"#res##oad"%water \'c&mdash!&-based"#fos"$urea!\'.m.l.r."+reinhardtii!#100!\'57bl/6j!"65"#pg7!%9pa10',
+    '#!g##man"%ckles##o-2""ds#%uceus##zow"$ines"$king"%labar$%trava#$ders#%fskin#\'l-slips#&verley',
+    '#%bered#&eroons#%field#)iknickers#$ming#"pa%#nia$#eau$&sfield"#n\'t#*adian-born$(lization#(delabras$$olle##ina',
+    '#)nibalised$%onade##tab$#ing"&pitain&\'l-goods\'$ises#(odimonte#-tive-breeding#&uchins"&r-hire#*benoxolone$$ines$%onara&$ised',
+    '#$cani$!o#.diorespiratory$%maker#%golux#&issima#(lingford##mon#&neddau$$iola$"on$$wath#"ob#%phone#(r&agrave',
+    '#%teron#%ve-up$$ille"\'ssation$"ia%&terite#*telnaudary\'#ovo&&sandra$&legate#&uarina"(tabolism$&lysing&\'tically##ena',
+    '%\'wauling#$hays#%ullus##woe"$user%!y"(valcanti"#wed!"cb""cs"!i"#lgf"#oac""pm!#d\'s',
+    '"#cos"$dras"&ilidhs"$lati#)l-surface"-ntral-heating\'*ly-planned%$oids"$ptor""ra#\'titudes#"vi!+hain-smoked#&lcedon$#ton',
+    '$*eleon-like%&rovzow$%fered#\'peltown$#uis#%racin$)ge-capped+#ing$&lecote%(ottetown$"me%$outh$&welton#$uncy"%eckup',
+    '#%iffou#!k#"ll##mie$#mod$,oprophylaxis#&que/po#\'rchesov$$rill%%y-red$"ts$%ubini#.stnut-coloured#$twyn"&iasmus',
+    '#%ggers#$kane#)mneypiece#%rbury$&ruping#%swell#!u"+lamydomonas#&o&euml$(r-alkali"$oate#(c-a-bloc$#ked#*langiogram#&mskian',
+    '#\'rus/mix#%udhry#"wk"&ristou#*ome-plated"%ubais#!r$(ch-state"!x!+ider-making"&gognes"!i"&liated"-nematographic#$zano',
+    '$$lets$&ulator%*mlocutions#!e#$iaco"#tub"$vico!-lacton-on-sea#)irvoyants#%nnish$\'ricarde#\'remount#(udettina##yey$$pole',
+    '#%nches#&psydra#%veley%(r-clever"*imatically"!l"$oner$#mel#&sed-in%*ly-guarded#)thes-line#&uthier"!p"(ub-armed"$ynes',
+    '!"m3""ac!)o-authors#+counselling#*developing#,incidentally#)organiser#)president#\'sponsor$&tarred"\'achwork#&l-mine##xes"\'bdenite"%delco',
+    '"(ercively"+ffin-makers"3gnitive-behavioural"$heir"\'iffured#*n-operated"*ld-calling%*shouldered%\'weather#\'eworthy#$icky$%ndale$$pase#&lagens%#tes',
+    '$#ops%)quialisms$"um#$more#$ombi$&nscopy$%rants#\'poscopy#"s."+mbativeness$!i#(dex/fall#%edown$%rford##lon',
+    '%%rical$&issure$\'unicado#+p&egrave;re$$anys%/rtmentalization$%endia$\'lainers%*ementation%&iances#%stock"\'n-trick#)catenated$%ensus%(rt-goers',
+    '$&ierges$!s##dam$(uctances#(fidantes%\'gurator$$lans$\'ounders#&ingham#\'joining$&ugates#&noting#)secrating%/rvative-liberal$)istencies',
+    '$&pectus$*tantinescu%$rues$(umer-led#/tinuous-process$&orting$,ra-indicated&)dictorily-$ness&$rily&\'stingly#%venes%\'rgences$$oked$$ulse',
+    '#(l-headed#\'perates"%pleys#,per-coloured#&ulated"*quettishly""ra#&belled#$cyra#$data#*n-coloured$$etto$&wallis#\'onaries#/porate-strategy',
+    '#&raface$#ell#"se%#ted#*u&ntilde;a#&vedale"$sham#$ines#+t-efficient"&teries#%inine#&tesloe"&ughton#0nter-accusations((balanced',
+    '\'$sign%-ry-by-country\'%watch##rcy$#tes#$zens"$vets$!y""we#%lairs#%sheds"&xydene!#p28"#i-c""sa',
+    '"*aftmanship##ine#\'nbourne$"ia"-eepy-crawlies##fdl$%field#&osoted#&tinism&!s#$uset"!i#%bbing$!s#&ccieth',
+    '#,minalisation*#ing#$sped%"us$%tobal#!t"*o&ucirc;te#%oners#)p-growing$$land#&ss-bar&\'checked&%links%"an%"er',
+    '#%tches\'"ty"\'ucibles%%fying#%shers#%zeiro"\'yogenic#*ptographer!#s11""tr!\'ubiform")mulations"&p-like",ra&ccedil;ao$$tory',
+    '#%tails"%tlass#$outs#%purse!"v8!+yberscience"%cloid"#men"\'nddylan"*press/ross"!r#"es"\'s177ser")tochromes$%meter',
+    '"/eacute;mocrates!*\'aquitaine#&rmande#(ubuisson$&vergne""oc!".a"#i.y"$phil!!/!&15s12h!#aba#%blers")emonettes"#fne',
+    '",guerreotypes"$hmer#!n""im#$nton#%rymen"(lbeattie#%lhold$#ing#*mellington#&wolsey"\'mascena#"ns"\'nceable$&kwerts',
+    '#&kworth#"ov##ske""pi"+rk-panelled$"ie$!s#$nall#"th"\'tabanks$#com$$flex$$gate#!p##ura',
+    '"\'y/night"%zzler&!s!#c-6"$/dcs"!9"!a!)e-limited"(activate#&nsgate"&basing$#uch"%camer#)ent-sized#&ision-',
+    '(&making#&oction$&mpress#%retal&"um$#ies%,minalisation"(ddington#&icatee"&ep-fat$#car"$fame#\'eatedly#$iner#&lector',
+    '")glutitive")humanized#(ydrating")ictically"\'lahunty#\'icensed$&ngpole$(verances##mar#%phine"$main$-terialisation#$elza#%igods#\'obilize',
+    '$$ntis"%ndera#"sa$-ely-populated#$wood")pendences$-rsonalization#\'letions#*recatingly"#ric$$ding#&ogated"(scenders$*ription-is#(ecrating',
+    '#$pond#\'tivelle$&ocking")terminers""ut$$eron$%sches\'%lands#,xi&egrave;me"$vaty$"ux#%ice=c$%ously!#gps!&i-gram',
+    '"$ablo#+gnostically#(l-a-ride$$plus$%ysate#-minobenzidine#%pause##rio#%tryma"\'chroism#%ketts#)tyocaulus"#dna"$eted"%ffley',
+    '"+gestibility#%gings#)itization"+lapidations#\'lingham##not#$they"$mond""nk#*ucleotides"%ptych",sadvantaging$)mbiguated+#ing$\'ssembly',
+    '#(c-shaped$%laims$(omforted%&rdance%&ursing$)riminable#+ease-ridden$\'ntitled#\'hcloths#+ingenuously%*terestedly#%obeys#\'passion$$roof$&utants',
+    '#*tantiation$&illate$)ortionary"+thiadiazole".versifications%)ticulitis$\'stiture#,ide-and-rule$#son"\'zygotic#\'zyingly!&juradj!%louhy!%m2.91%!2',
+    '"!z!"nh"#tps!#o\'s"(bermanns"-cosahexaenoic##tus"%ddery#*ecapeptide#$sley"(g-collar$\'eat-dog$$like#"es#&fights',
+    '""mf#&inguez".nald/reporting$!n$#tio%!o##gle##kin##ner#(oughmore"#oby#&rbells$$mats"\'rdrecht#!f',
+    '##mio"%trice"-uble-checking\'&header\'$knit\'&locked"*ver-calais"\'wn-home%$wind$&grades$$play$,ward-sloping#"se""xa!)ragonlord',
+    '&&switch#+matisations#"ng#(tslinger"(eamworld#+ssing-gowns#"ux##wer""gs"&novsek"\'omgoole#&p-dead#%wsing"#ubb#)g-dealing',
+    '!"td!#ua0#&lities$$ling")blin-born"&fferin$"in##our"#lac"\'nbarton#$drum#$nett#&sheath##xin"%ofold',
+    '""ra##ian$"ez#,nford-slater#\'obrivae##yea")st-jacket!#vlc!"wa!"xf"$s178!%ympna"#nal$$mius$#sts',
+    '!"/1#!s"!a!"11!"22!"aa"\'ldormen"&nfrith"&rendel#%n-out"&siplan#"on%!s#&terlin$"ry',
+    '""ta"*vesdropper!#bbo!)ccleshare&)iological""gs"$kley"$lair""ms"\'o-label#&logies#!n#&sphere"\'toplasm!$dema',
+    '"&ucable%-tion/training"$zard!&ekelen!"fe"(facement#&ingham"!i!#g-1"#laf"+ocentricity)"sm"$rets!)hrlichman!/ight-and-a-half',
+    '"%nhard")senhammer!+jaculations"!b!\'kkaparb"#oku!$lcho"$dred&"ge"\'ectress&.ically-powered&,oacupuncture\'+cardiograph(#ute\'(dynamics',
+    '"$iott""ks"#lin$#ots$\'psoidal%\'tically$$ston##man"#ope"&segood##tir#$ynge"$uate&!s"#ver',
+    '!.mancipationist"$balm#)ryologist"\'endatio%"ed#*rald-green"$m386#"it"-pire-builders"$sley!)n_famille"!c#-ephalopathies#)yclopedie"&demism',
+    '#(obiliary$)crinology#%paper"\'ergiser")franchise"$gang#)lish-born"%lists"$soll")teriditis%(ocolitis&*pathogenic#(ranceway$%emets#&wining',
+    '"7vironmentally-sensitive#"oi!)osinophil!&phoros"(icuticle#%gones#)phenomena%$yses#%steme\'*ologically%$ulae"!o#$unds"#ris#"lf',
+    '#"us!&rasers#)tosthenes"$ddig"$ebus#$wash""gh#"ot"&langen!$scon""na""op$&hageal"#pin""ro',
+    '!%t._al""am"\'hicists"&iology")ymologies!)ulogistic"%ravia#$ofed$\'peanism"&telsat#&rophic!\'vandrou$*gelization"+en-numbered$$ters',
+    '%(vigilant%(watchful$#ybo#"tt"%inces!)x-company#&labour#\'players$%olice#\'smokers$\'tudents"+acerbations$"ts#"fs"!c',
+    '#&ulpate""d4")ecutables"+on-enriched"&pences$,rience-curve&)mentalist#,ressionistic")ternalism#&irpate#+ra-european&+territorial%(galactic%+territorial!#yck',
+    '#$wash"%skens +f&amp;sharp!$-111#!4!+a&ntilde;ez"$blan#(ricators%#zio$!o"*ce-framing%+threatening$)tiousness#%ially#$scan',
+    '$"ly$%or(s)"&de-out"$eroe"%ffing"(ir-trade$"ed$(fax-vane"&llback"%ngled#(tastique"$rloe#\'mworker#"ne##ouq',
+    '")st-acting%&rising""ta$*listically#"so#&uously"$ucet##sto#%trier"$vore%#ita"(zackerly!"ba!"cr!*ear-filled',
+    '"&dayeen",eding-ground"#get"\'ininger$#ted"&lbrigg#"in#)l-walking$$ahin#"ts"*nech-adami#%imore""ra#)linghetti#&ragamo',
+    '$!o##vid"#ste"\'tishist#\'tiplace")udatories"(yerabend!"i."$bers#&onacci#&rillar$#oid##ula"$chte"*ddlesticks',
+    '#"or"\'eld-day&\'glasses"$gnon#%ueres$\'rations""la#)e-servers$#tab#"ho#$l-up#&mhouse$%strip#&thiest"&nchale',
+    '#"is$$tude#&kelhor#\'ningley#(occhiaro"(re-place%)resistant$$d-up$%fight##ths"$serv#(siparous#\'t-sized"%tchew#\'zsimons',
+    '%%metre%!o%#set"*xed-length!$lach#%gella\'"um$%rante#\'shcards#%t-top$$lets$$worm##vor%%urful#\'xthorpe',
+    '##tch#)ur-de-lys"%ight.#%ppin\'")oatplanes#$irat#+or-standing#&rencio$)idablanca$)y-huggins##sse##tel#-wer-patterned&$less$%meter',
+    '!$oggo##ies"&isting"$liot#$land"%nseca#%twell"%odies#&t-high%$long$%board$%marks""ps"+rdingbridge#,eign-affairs',
+    '$(quarters$+st-dwelling$\'telling$$warn#$fend#*m-mistress$&alises\'#zes$#gen$&ulator#$ston#)thrightly$$unei$(y-second"$ssey',
+    '#\'ndlings#(r-footed%%power%%times%&volume$.teen-year-olds(!s"#wke"%yster!)ragranced#$iche#&milode#\'nchiser%)o-spanish$)kensteins',
+    '%#ing#%snian"%eames#$drik#)e-falling%*marketeers%\'trading$%board#(nch-born\'\'trained#%scoed$&heners$$naye%!o",idge/freezer',
+    '#%lford#$sell$"ia#\'ttering"*og-marched#+nt-benchers&(of-house&\'raising\'&unning%%bench#$wsty"\'uiterer%$wood!"sx!+t-actuaries',
+    '""sp!%ucose"$jian"%kuoka"\'ll-dose%\'hearted\'$ight%$wave$+y-fashioned"(n-packed#-ctional-level#\'dholder#!g##ked"$rber',
+    '#$nell#%riers"&tilely""ze!%winky!$x760!$yffe \'g&amp;g!#(s)!#.l.""m.$$b.h.!"/s!#201!\'abonais',
+    '#"fs"$imar##nes#"ry""l4#$eano$$cron#&libaya"\'mbolled$$rill#)e-playing$%birds##ine#"ow#"ta',
+    '#$dini##gue#"ja#!z"#ppy"%raged#6c&iacute;a-d&iacute;az#%misch#&rimpos##uda#$vagh"$stro&\'colonic&&scopic"(tehouses',
+    '"(ucheness#$lish$$lism#$tama"#vyn"%wking"%yford"$zans!"cg""n4!+ec-ferranti#"ko"\'diminas"$evor"#ist',
+    '$)ralizable$(stealers$"ts##nep#!o$"va#&teelly$\'ileschi$\'lewomen$&rified"&omancy$&etrics#\'rgiadis#*scientists"&phardt',
+    '#*man-polish&#ise$!i#$rish##wyn"&urrero"1w&uuml;rztraminer!"gc!%hafar##lib#$rial""ee"#ote!\'ianluca$\'t-sized',
+    '"%ddily"$eves"%ffard$#ens#$ting""gh"$kuyu"&lleard%"is%/spie/racecourse$&ington%$spie$"ow"#mme""nn',
+    '#*l-friendly$&school#$oldi"&sborne!(lacially#&diolus#&morise#$show$(s-walled#(uconitic"#emp#%ndale$&finnan$$gall"&igorov',
+    '#%xinia"#uey#\'ttonous"(ycolysis!#mos""sa!$naws"%occhi!*oal-kicker$#ies$"s.#"ns"%bbing$#les"!c',
+    '##ber#&dammit%&ughter#!e#(lessness#%stone"#fer"#har"$jjam"*ld-bearing%%edged$%blatt$%crest$$ener#%gotha',
+    '"%mulka".n&ccedil;alves#(orrhoeae"\'odglass$\'looking$%mayes##key#&sander"\'rchakov#$gons"$ulds")vernorate!$r-50"$aaff#"bb',
+    '#)cefulness$"ia##der$%grind#$hams\'$town#,mmaticalized\'%ology#&ndmama$%ovsky$(t-in-aid$\'ularity#&phemes$\'toloids#*ss-covered',
+    '#*ve-diggers#%ziers"%easby%#ers$\'t-niece%$head#&enacre%$dale%&fields%%shank%$wald#$nier##uze#!v#\'y-black',
+    '$)ish-white$%stone"%impen#(p-plates#"tt#&zzling"$olux#%nberg#"ot#$pius#%sbard$$sest&%teste#+undbreaking&&edness',
+    '$\'p-based$#ted#\'wing-up"&unberg"(yschenko!"s3!0uant&aacute;namo##vas#$zapa"%benko"#dok"&errero"%ibert"%mshoe""nk',
+    '""th""v\'!(walchmai$#ior"&ithian"!m!#yaw"(mnasiums#$slip"%onval"\'roscope)!s *h&ouml;yre!&-bombs"!m',
+    '!"20!$abet#,itu&eacute;s"\'ckballs"#dar"&eggman"%ffner##por""ge##ger"(hnenkamm$$wald")irbrushes$#dos$#ier',
+    '%%brick%&chewed%(darkness\'"ys&#oor&&rowned%(glimpsed%(jokingly%\'million%&opened$\'hearted$%tones$#wit#$ides#&l-mark',
+    '#%ogens"$madi#$bone##inh#%micks#%pdens##wic")nd-carved%#eye%\'knotted%&tooled%\'writing$%helds$&ing-in$&prints',
+    '##wag",plochromines"\'rbinson$$orne%&urside#(d-packed%$sell$%/soft$$acre$%stand#(ebrained$!d$"es$$ston##ish',
+    '#$nack#&ringay%"ot$$owed\'!r#%theim$$igan$#mut$"og#%vards$#ill"#ser##him#$sans")tchetfish',
+    '""ue#!g"\'ve-a-go"&wkwood"%ziest!"bo!"ea#*d-modifier%%start$&liners$*mistresses$$note$\'quarter$$ster#(lthiness',
+    '$"ns$&t-felt&\'strings%$edly#(therglen%#ite#*vily-armed""bb#$dige"$dera"(edlessly$!s##las")gelianism##ley',
+    '#$nzer#!s")ldenleben#\'igoland#&lebore#%pston#&vellyn""nk#&nessey$"ie#&pecked#&riette$"yk")r/himself#,akleophorbia',
+    '#"es$"vi#%kimer##nus#%petic\'&formis#%rigel#0tfordshire-based",terozygosity"$ward##ish"&xamita"\'ybridge##don#0ford/oxfordshire',
+    '!$i-ho"\'ccoughs$%uping##kes"*gh-lighted%)precision%$wire$(est-ever$,ly-acclaimed\'\'charged$$more$%smith$$wire"#jaz""la',
+    '$$reth#&l-walk$$coat$"el%"nd$$fort#&versum"&ndlegs%$imbs$%marsh$#uja"%pbelt"\'rschman$%hhorn##tle',
+    '##ham#(toriarum"(tchhiker!\'la-a2.1$"b5&,3-restricted!"mn"!o!%obden#\'nobbing"$cher"\'ddesdon"*fmannsthal#%stede"$gged',
+    '#$wash$#eed"%lberg##cus#%ligan$(owed-out#(oenzymes$!s$$type#$zner"*me-cooking$&makers$%owner$&shield#\'odimers',
+    '##man#(p&eacute")rizontals##ler#\'monally#$rify#(se-power%!d%$race$#ing$&monden"\'se-pipe$%pipes#$sain#\'t-based',
+    '"%t-rod"#ude#%lston#(ndsditch&%worth#*se-builder&%style&\'trained%(breaking"$wdah!"r.!#sdu"#ieh!"ta"%fiiib',
+    '"%bback##ner"*e-williams"#ish"(man-made%!i#\'idifier#)ming-bird$"us#&orists#&pbacks".ndred-year-old#&g-over$$ered#$kers',
+    '#%stead#+ting-ground"&rcombe#!n##ter"(sbanding#&kisson"#vec!)ybridizes",drogeologist%$lyse%(technica"(grophila""nd"4perphenylalaninaemia',
+    '#+oallergenic$%tonia"#sen#"on $i-ii!!2!&apetus!#bbs""ca"!j""os"&rahima#!d!\'ce-pick#%field',
+    '""rf!#dbs",ealistically&"ty!#eng!$gadd!#iia!%khwan"#ons!\'l-1&bgr#!2"+e-de-france#&ocolic"!g"+l-advisedly',
+    '$+disciplined$(favoured$\'trained##ona#%umine$#s.4#$yria!/mage-processing"%buing"*f-approved",mobilization#+unochemical&/histochemically&\'therapy"\'periale',
+    '%(sonators%(tinently#%lores#&olitic#\'regnate$%isons$)ovization$\'udently#$utes"#shi!*n-breeding#&coming#$fill#)the-money#$vivo',
+    '"\'anities"\'chbrook#*lusiveness#+ommensurate%.prehensibility$(ngruence%\'solably%(tinently$(rrigibly",definiteness$-structibility#(ian-born$#cia$)sciplined%,tinguishably',
+    '$+striousness"*elasticity$)igibility#!s")fantilism#%ecund#$ills#\'luenzae#$onet#*radiagonal#$uses",g&eacute;nue#%ledew$!i#$rate',
+    '"\'halants%"es#(eritable#,omogeneities",itialisation"/jection-moulded"%k-jet"&marsat"(nateness#)er-cities#&ovated""ro"*secticidal$&nsibly#)pectorial',
+    '#&urable"\'telloid$\'nsifier$(r-action&&county&*dependence&$firm&+hemispheric&#pro&)relations&&tribal%\'calator&&ompany\'\'nnector&%rater',
+    '%\'digital%+est-earning)$only%%lagos%,nationalized\'\'zionale%"ox%(polating&*retational\'*ofessional%(regional%(spersing%&vallic&(entional%&wiring',
+    '#\'ichiuma#)olerances$\'ximeter#)ra-aortic&%mural$\'epidity$&oducer#%uited&\'ionists"%veigh#&oluted!\'psarion#"os!(ran/iraq#(q-kuwait',
+    '"#ens##ton""ks"-on-containing")radiating!&sadora#%goras""ca"#ham#%iguro"\'lamists"+olationists)!s""si!,talian-style',
+    '"$home!"us!$vatt")y-covered!\'xmarity +jabberwocky#%elman#"ot##ril"%ckass#&obsson%"us##que"\'enberht"%faars',
+    '"$mais#"ba#\'es-type##mer$"ie#"pa"(nitorial#$sons#*uary-march"0panese-americans)(language"\'queline"&roslaw"!t"$ynes',
+    '"$zali!"ds!&effers$#ord"#mma")opardises"$rram#%vaulx"$solo#"si$!y#"ty!%ibbed"!f"%llian',
+    '"#rga!"mp!$obby#\'seekers"(cularity"+intly-owned"#lie#$lies##son#!y""mo"$nghe""rn"&scelyn#$hing',
+    '"#wle"\'ysticks!#pac!%stars!&uanito"#dit"&iciest")mping-off"%nking!"wp -k&amacr;nchho"3eacute;r&eacute;kou!%.k.k.!$amer#%inski',
+    '"\'rantina#$elia#"la$$ovci#!s#"ts"$sbah#"et#$hgar#%salow$%ebaum"$tana#"he#%yusha"$wara',
+    '##ley")zaskerlik(!s#%hagam!&c-1100!"ea#"st#$tley"#efe#&n-eyed#&psakes"*kul&eacute"%ltney"$mber"%nitra',
+    '##way$%right"%pepwe"&rridge"&sgrave"\'vorkian"&y-hole$%words#$ring#$tops!"fw!$h864"$alaf$$ifah"#ost',
+    '#(zraschet"%umalo!%idded$!o"#eft#%nholz"(lmainham#\'odalton#"ve"*mblesworth#)meridgian"+ndergartens#$folk#*gdom-based$&sburgh',
+    '##mel#%tbury"\'rkwoods"%shorn#&levite##met#$sane$!y"#taj$$ngan#"ec#&tenish#+zb&uuml;hel!"kk!*leisthenic',
+    '##van"%inger%"on!"me!#nap$#ton"&ee-cap"\'ockouts#$etze#"le",uckle-duster#!d!$obie"$chen#!k',
+    '"$llek#\'mogorov#!n"#mar$#tsu#%insky#"ma"&onkies"#rah##ner$$gold$$ilov"&stikov""ta"&uchner',
+    '%#ski"\'zlowski!%ramar#&snodar#$vitz"-ebs-henseleit#%ditor#"ig"!f"#ieg$!r#$sten"#ohn#"ll#\'nberger',
+    '##oms"#uif$%singa!%umasi"(ngsleden#"io"#ril"%ypers!#won!%yffin""me"%ocera +l&amacr;mri"6eacute;g&egrave;rement)"vy',
+    '!\'\'amours"&equipe"%ouest!!*!$-cpl!%.m.s.!!6!&aberge#%iatum#\'our-run""ci$#nia#!z"%ddish#$ling',
+    '"#hud")icisation"(kenheath""la"#mar#(berhurst$#lia$%ourne$%retta%$usco#&ellosa""nc$$elet%%olata#\'d-owner',
+    '$&sdowne#*genscheidt$$toft$*uage-based)(specific##ham##ner$"on#$qing##sky$"on#$zhou"(pse-rate"*rge-animal#%ionov',
+    '#%ousse#\'yngitis"$scar&!s$*iviousness#(t-resort"&tinate#)tice-work$"on#$ymer"&uretis$!o"#vin"$wned"(ying-out',
+    '#"er!#d50""pd"!s!+eaf-cutting$#age#&n-burn#*p-frogging#&rmouth$*ner-reader#$shes$#owe#)thercraft\'%slade#$vin\'',
+    '"%cfile#$tins$+urer-module"(derhosen#&ingham"-eds-liverpool#!t#%wards""ga#!h#"io$(slations$\'timises)!m"(mmatised',
+    '##lee#$sman"*opard-skin"#ros"$scun"(thbridge##sie$"on#(terboxes"$vack"$wdly"#yte"%zcano!#i\'l#!s',
+    '##son"&b-dems#(eral/sdp#,rary-college"&censer%)tiateship"&ddiard""em#"nz",fe-and-death$%forms$\'jackets$&lessly$3span&mdash;shutdown"%ggett',
+    '%$ship"!k#+ely-looking"%liana#!o#/y-of-the-valley"%mbers#&ekilns#)nititzker##one#(pet-like"\'ndemann#*e-of-sight$&arized#(guaphone',
+    '#!x"\'p-gloss#$less#"py#&scombe""rt"%sters"(tigating#!t$#les#)urgically"\'verwort%$ymen")zard-like!"l.',
+    '"$oret"!p"#wyd!%oadsa""bb"(coscript"\'destone"#ewe"&ftiest"&g-book#$itek""ir"+ndesborough$(on-bound#&g-gilt',
+    '%(promised%+sightedness$$acre$+est-lasting$$land$$muir$%ships&"ot$$wall"+ok-and-feel$"up##mes#"ng"&quitur""r\'',
+    '#$ient")ss-makers"$uden#%gheed%!s##ver"\'ver-boy$$sexy"\'w-caste$)viscosity$%water#)er-status&$tier$(st-level!#sug',
+    '"%cente#&hinsky#$idas"%dorum#"us"&ggnagg#$worm\'!s""iz"&nchbox&$reak#&dqvist#$ette"\'signans")theranism',
+    '!%xxxix!)ymphokine"#nes##gby##xos"%senko +m&acirc;con#(macr;ilo$#p;t")eacute;li)$rida!#.b.""e.#"d.""g.',
+    '!$abey#(lethorpe"(calister$&ndrews#$draw#)hine-like#%krell#%lagan#%queen##ro-%$cell%(molecule#&tavish"&dalena#$huri',
+    '#)rid-based%\'galists""ee#&lmuire##rsk#)strangelo"%fioso"*ggovertski#%netos$%ifier"&hanama$&rajahs$$weli$$yana#$fouz',
+    '"%illol#\'nbocher$)streaming#"or##ret$%owitz#$sons"%jored%\'itarian"(kanjuola#$e-do%"it#$houl##ins#%toums',
+    '#\'borough#"ek#%herbe##ian$%nvaud##len#&tesers"#mey")n-at-arms$&o\'-war#$acle$"ma$$stir##cha#"da',
+    '#&erplaw#%field#\'icurist$#kin$*pulability#\'kiewicz#%nitol##ser#$tack$(elpieces""pp$%leton"\'ranello#%ciano%"on',
+    '#$dell#&gareta$&inalia)$zing$#lin#$igot$-ni&egrave;res#.ket-determined\'\'leading\'&making&#eer$&stones$!t#&lboros$#ies',
+    '##nie#$oons#\'quesses#$rack$!e#\'s-jones$"on$%worth#&tigues$&yrhood#$umba#&yinsky##zio"%scolo%"ts',
+    '#(saliotes$$elin#+ter-servant($lave&$kova"*tabeleland##hie#"ic#"su##tel#!z"\'uberley#$rras##ser"&wddach',
+    '##tor"&yberry$#ole$$rick#$cock##hap"&zurkas!)b-caradon""e.!&caleer$%inden"$bain"$cart&"en#\'lintock',
+    '#&ullagh"!d#%ougal"&fadyen"!g#$ahon$&rrigle#%eorge"#ian#&lkenny"!l#&aggans$)ren-honda"%quail!$d110',
+    '!%eades##nie"%ckler#%onium"%diant%%tions$(co-moral$\'um-high#&lycott#&menham#&ullary"%echai#!d#"na#+ting-places',
+    '"#ije#%ssner"#ksi"%libee#&lifera#!o$!s%"si"#nde%%lsohn$"is$$onca$!y#$ials#(orrhagia',
+    '$$ural#1tally-handicapped%!t$"er$#hol$%oring",phistopheles"$rbah#%ceron$#ure#%ibeth$%oneth#$lins##maz##row',
+    '"$sara##cal#$sin\'"+tallurgists$&physic$&stasio#!e#&formin#\'huselah##ier#!j#%ohija$"pe#\'rically$(opolises',
+    '"/use-rhine-yssel"%wling"\'xeflote")zzogiorno!$g/30#"dl"\'m-pathe!*hc-encoded!$ibbe"#cas#%ellar#\'helmore$*igan-based#"ks#\'ro-chip',
+    '%&fibres%,kernel-based%$mail%\'seconds&&tation&&urgery%%villi"\'d-1870s$(counties$%essex%\'uropean$&flight&"ow$$kent$&length',
+    '&$game#!s#$town"%en-lo#"rs"$g-29#\'nonette"#hir"#ked"$lady#$iary$%taire&$rist&$ting#%kweed',
+    '#(l-owners$%igram%)on-strong(&to-one$&street")nd-reader$%scape$$warp#\'eshafts%%trone#"gy#)i-skirted$(aturised$\'clinics$/ster-presidents',
+    '#"ky##nis#"oa#&utemen"&rabeau##cha##oir"/s&eacute;rables#$-hit#(cibility#&direct##ers%#ver#)judgments#)reporting',
+    '$%enden$"ie#(treating%&usting"$tten"!z!"lf"#stp""tb!#nes"!i!&oberly#&ilfunk"$cker&!s',
+    '$&rnisms#*ifiability#+ularisation%)e-name-is\'\'type-is"%ffitt"#ggy"#hun"$ises"#las#$inia#\'lington#$seed"%nadic#&dadori',
+    '%\'-centre&\'lending&#off#!g#*kwearmouth#-o-unsaturated$#dic$(linguals%$ogic$$pole#"s.$"al$%engwo#&tagues%"nd',
+    '$!i$#oya$%reuil#*umentalism"\'onscape"$raes$&yshire#$edun##ice$"na#\'tgagors##val%!n"\'sbacher#$hpit',
+    '"\'t_juste#\'hecombe%&rcraft#\'ivators#(or-bikes%$home#\'tingham$$ling$"os"$ulid#\'se-like$$savi$(tachioed#%zelis"&vables',
+    '!"pa"!m!#rcp!"sa"$wati!#tbe!+u&ntilde;oz".ch-anticipated%(improved#"ks#(osectomy"\'daliyar$!r##der#"ie',
+    '"$ffed"+ir/scotland$%house"(khabarat%%medov"&lindry#%lally$$iner%#ver#+ti-currency&*discipline&$hued&$line&%stack&%valve',
+    '%%meter%(vibrator"&mmolus"$ncie#)ich-based$%ments#"ns")sic-halls%(ological#$krat##son#\'tafizur$$ique"\'thesius#"us',
+    '!"ya"%cetes""er"$nott"!o"#rna#"on"$sore#+t&egrave;re"&tchett 4n&eacute;glig&eacute)#ill)$meth"0uacute&ntilde;ez!%.c.o.',
+    '""l.!!4!!5!&abakov$#rro"$chos$!r$&tmusik"\'dobenko"$gano$"ta""ha"$iads#$lers$#sea',
+    '#*vet&eacute"#jib"&loxone"$mier"%n-nan#&carrow"-pol&eacute;on"$rong#\'rowings#!y"$sica#$myth#!t""t.#\'ionales',
+    '##ron#+ural-entity%&opathy"%varra"#yef#"im"$zaro!"ci"#p7c!$dolo!&e\'eman"(ar-empty#"te"%biolo"+ck-and-neck',
+    '"-edham-burrell$\'lewoman#!p"(gativism"\'ophobia"%phila"%rving"&sfield"(therdale#$labs$"ey#!o##rha#(tle-rash#)view/6000',
+    '#$illy#"ro%*biologists#"ss"\'vermore"&w-ball#$hnam#*ly-founded&)installed##oed#\'s-stand$$boys$%holme$$peak$%sheet',
+    '!"fp!&gc5548"!f"%odrup"!v!"hk"!l!&icaean#*kel-plated%$rson#+ol&aacute;s$%tiana"%ebuhr#%uport"(ghtlight',
+    '"#hil"%klaus#%olaev"#lly""st!"np!\'o-balls#!o"#.12"$bilo"$ddle"(el-baker"#mai#+inalization"(n-agouti',
+    '%(ompeting$\'dilated$-epileptogenic%*quivalence$)flowering$)hazardous$)identical%)ndigenous&\'verting$#kin$*maintained&&rketed%%ental%\'ilitant%%oslem',
+    '$&normal%&umeric$-observational$*perishable%(olluting%)ractising&(ofitable\'&jected%*ublication$*reflective&*productive$&school%&ervice$$text%$idal',
+    '$)vanishing%&isitor#)_sequitur#\'auratic#*e-the-less$!s#&living"$okie""rf##ske#*th-country%.cote-trevelyan(!t#$west"\'sferatu',
+    '")te-groups$$pads#"te$"s."#vae#*el-writing#*otn&yacute#!y"%wicki"#zze!"pn!"rs!"st!.uclear-weapons%%oside',
+    '"!l#&larbor"\'meraire"+trient-rich%$ment!$yala""sd#"sa )o\'malleys"(neillism\'!s&!s!\'akfield#$well!(bergurgl',
+    '"\'liquity#$ongs!"cc#&luding#%uring""ea"$kham"%tavio!$dets"$ling!\'estrous!)ff-planet#$ense&\'iveness#+ice-bearers',
+    '!#ger"!i!"ic"%l-rig$\'stained##bar!\'kanagan"#ely"#oye"!p""ri!#lau"$brei"(d-school"&eander',
+    '"*igotrophic$$uria"&livier"#ogy"\'ympique!$mara"%ega-3"&mitted"%nisql$%vores!(n-course#&demand##set")cologists"%e-bit',
+    '##tti!\'omalama##pah"#ops!#pas")en-backed%\'country%$side$#out$&server$)warehouse#&rcular",hiacanthidae$&olimna#-thalmologists',
+    '#+nion-makers"\'posable#&resses"(tiebeurs$$oned$$vity""zz!%radea##l-b$#ity#(ngefield"#bos"%deric#%inand"$esme',
+    '#\'entalis\'$ting#$gin\'#!n"$msby"%rible!%siers"&pedale"$sory!%ther\'"!o"\'terburn$!y!%ughta""pa',
+    '$$half$(migrants$\'of-area\'%phase$\'workers#&er-arc#&fitter\'#ing#&gassed#%lawry#&shines\'#ing$$mart$#old%$urce',
+    '#$wits$#ork!-ver-abundance&"ge%(crowding%*enthusiasm%(familiar%)indulgent\')volvement%\'reached$)ambitious%"rm$$beck$+constrained$$dene',
+    '$)expressed$&grazed$)head-view$*indulgence$%large%#ies$(payments$%taxed"$ules!$xted"!y!*z/1&frac14",one-damaging"!s /p&eacute;bereau',
+    '"(ndash;59!"-d"$funk"\'labeled"!p!#.12#!5""29""l.!#/60!$1/t2""07"!5!$2/t1!"34',
+    '"!7!"60!&=0.006&!7!$a05c"#474"%c-man#"cy#&hatata#\'k-horse$%agers$&ington",ddle-steamer"$eans"*ge-alucard',
+    '""hs"\'inshill$(tbrushes"*latability#&isades#&liasse&"te#$mist#\'ynology"%nadol#%danus#"in#\'jandrum$"im#\'spermia',
+    '$%henol&"ra$)isocratic#"za"&pageno#$eete$!n$$rboy%%knife$!z##hos#"pa"$r-4s$$five#-adigmatically',
+    '$-llel-stranded(%ising%&ympics$\'mountcy$&sitise#(chmeiner##dew$!o%#ner#$edes$(nt/child&%craft##ian#&nassus$"es',
+    '#\'ramatta$$ella$#ies##see$#low$%onian#(t-number$#ied""sh$$alik#%olini#%quale#)sap/pfaff%%rinho$#era',
+    '&#sby$&iflora%&ng-out#\'te-down$\'oralist("ly$%uring"$tels$)ntability$&rnally##han#-ients/clients##mos##rik$)on-client',
+    '"#vey#%iours"&y-roll!$b-zn"$ruc1"!x!)c-to-unix#%xware!#dcg"$p-10!"e1"#ada#$ling#%rsall#%sgood',
+    '$#ing")bble-dash"*ccadilloes"\'dagogue$(ntically#%dlers#*erson-krag$+strian-only#&ometer"$eper"(ffermill""hr"(irithous"#jic"#lat',
+    '##ynt"$muda")n-y-ghent#\'alizing$$nces$"ud#$dine$%reigh%!y#\'manship#$nell$$orth$!s#$pals#%tamer',
+    '$"re##ver"$ploe%!s"\'r-ulrik#$cept\'\'ibility$%ivall#&forant\'$ting$$umer#*iantarctic$\'centric$!n$*parturient',
+    '#"le#\'nambuco#$rers$(y/thames#&simmon$(on-years&+al-computer$$pire$%uader#(th-based$"ti$&urbing"#sce#&hmerga#$sary',
+    '#)tilential"\'tersham#$iver#"ro#$wood""ut"(yrefitte!#fkg"&limlin!"gp""ss!+hagocytosis#+ntasmagoria#.rmacologically$%salos',
+    '"#igs##leo$%ippos$!l%$ippa$\'osophes"*onologists#&tocell%#fit%\'gravure%+micrography%&period&%hobic!,i&egrave;ces"#cas',
+    '")errepoint%!y#(trasanta"$ffle"%galle#(eonholes#&gy-wig"#laf##eup#%ipino"&mentel"$ncus#$fold#%heiro#%kness',
+    '#%tails"%ontek"\'quantly"$rrie"\'tchford#$lake##ney##sea#(tendrigh$%ville!\'laatjes#\'giarist#%nings#-telet-release$#ini',
+    '#&ybills$&scheme"!e#*asure-dome(%craft##hve#(iotropic#&nteous#%onasm"%odder$!s#%pping"\'umfield$%stead#\'tocracy',
+    '!*ocket-book"#ema"+int-of-view%\'y-beard##ret"\'lariser%$oids#%eaxed#+icy-holders$\'docanol$\'sh-born##lak#$onia##son#\'toranin',
+    '$&atomic$$pary$+techniciens"&m-poms##ade#%erene"%ngine#)tardulais"+pe-hennessy$#scu#&pleton"(rcelains#$kies#"os#(tmarnock',
+    '$%ofino%&graphy"$sset$#ums#&t-1980%%audit%#box%(cold-war%,emancipation&)xcavation%\'holders%%lunch%*qualifying%+renaissance%)traumatic',
+    '$$bank&#sic$"ie$-modernization$)nominally"\'t-grown#\'entiate#&holing#%idaia##man#&tinger$"le"#uts"&wer-up%$base',
+    '%&plants!#p3s""gs!.r&eacute;fleur"$aagh#\'chakorn$%tolol#$etor\'#ius#\'nksters""cs""ds"&e-1939&"79$\'adapted',
+    '%$ivil%)onference\'%gress\')struction$%given$\'inquiry$&launch$\'written#$amps#&dating#"ez#+fabrication&!s$$ered&)red-issue',
+    '#$lims#$pcom#\'scriber$$sler$&triate#(tentions%(rnatural",ice/earnings#.mary/secondary$-e-ministerial%$ness$$ness#"ns$%tings#)son-house',
+    '#+vate-rented#\'zemoney")o-chinese$\'hunting$(military$\'whaling#)blem-free\'%atics#%caine$)rastinate$#yon#&descon$\'uction.(#sed#(ferentem',
+    '$%iteer#&gnoses#$jets#"le%*tarianized#(menading$$pter#\'pathene$&hetess$"re#&scribe#*teg&eacute%)in-linked#&vender$$irus',
+    '!\'salmody$$ters",eudo-devices"-ychiatrically%&odrama!"tb"!i"!p!$uang"#bis#)lic-house%"us"&chberg"\'ffed-up$%iness',
+    '"\'ll-back$"et$#out##ser"%mpido"(nch-line#$nett"(ppeteers"0rchaser/provider##due#,poselessness#(se-seine##vey"\'ssycats!$ylos',
+    '#&olysis "q6!$adir"#lib"$yyum!!e!#ram!)uadriceps%\'ophonic#"ff#%ntile#)rantining$\'terings#$shes$*i-official',
+    '"\'edgeley#$ment#&ntovic##rns#-stion-begging#$tzal"$icks&$ands#"gg#,nan/scotland$$ones$$tile#\'rkiness\'!g""me',
+    '#&tients ,r&eacute;cit!!-!#.d."&i.a.a.""k."&m.s.d.""n."$p.m.!%10000"!2!"2+"!1!#4/5!*abelaisian',
+    '"%ccoon#$hman#$kety$%mount"*diographer#!l$#ett"#fah"&gusans"(ilroaded#(n-washed$$bird$$wear"#jan##esh',
+    '"&mbaldi$#ush#!c#&ifying#!m#%sbury$#haw"$ncon#%dhawa$$wick##kle"\'poports"\'shleigh"2t-1/c-myc-er/bcl-2#$hore',
+    '#"ko#$tans$#ing$&letrap#&zinger""up"\'vilious")wtenstall"%ybans#$nham"(zanamasy!"cb!+e-activated$\'ssembly\'$ssed',
+    ')#ing##buy#%cover$"ut#$done#(educated#\'forming#+introducing$%ssues#%learn#\'married#(occupied$&rdered#&phrase#\'shuffle',
+    '$\'tocking#%visit"*ad-through$&/enter$-ily-available$\'justing$%y-cut#\'nimated#\'pplying#(r-facing$$foot$#med%#ost$&ranges$$ward',
+    '")barbative#\'irthing"&canted$)pitulated#,ently-opened#)irculated#%laims$$ines$$uses#&oinage$&llapse$+nnaissances%(secrated$*rd-breaker\')equalling',
+    '#\'rossing#"to%$ries"(d-backed$\'cheeked$#lit$\'painted#!d$"an$#est##ial$\'scovers#$lich#\'oubling#$skin',
+    '#(uced-oil&"rs#$vers"\'elected")fectories#%iners#%orest%&matory#\'racting$#ied%\'gerants"&galism#&icides$"ne#+ularisation',
+    '"%homed#&ydrate"\'ichardt%&enbach#$ffel#)nterprets$(vigorate#&ssuing#$ving"&locked""ma#\'brandts#$ould#!s")ndez-vous',
+    '#%nison#\'tcharge"*occupation#%ffend")partition#*eatability#"ot$*uss&eacute#(roducers#*ubblichini%(lication"!q"#rpf"(selected#&tocked',
+    '#*uscitating"$tied%!f#%races$$eate#0urn&mdash;detail#$yped"%using"\'valuing$#mps#$elle\'!r#%ivify!$f325!*hetorician',
+    '""un")ythmicity!$iata"*ch-country$&thofen#$imer##key"\'ddiford$#och#$e-on$%rless#\'gefield#&icules\'\'ousness#$olfi',
+    '"$edle#!s"!f"(ght-foot&)of-centre\'!h%\'s-based%\'wingers"&jswijk"(llington$!s"$mmit"&ngless&!t$$road',
+    '#$toul"%sc/os#\'k-taker"+tualization"\'valrous#\'er-bank%$boat%$mead#$iere!)o&circ;le"\'ad-side$%stone$$work#!g"%bodoc',
+    '"%chlin#)k-forming$,et-propelled$$wood"%dmell#%olpho""ff"\'guishly"%iling#!s$"in"\'lleston$(s-royces"%magna$&ldkirk',
+    '"$ofer#&keries#\'m-mates"$pery"(senquist##ses%"tt#$tand$$ered$)ov-on-don##zak"+te-learning#)henbuhler#%orway##tie',
+    '"%uault#\'ghening##mat#)nd-arched&$trip&#ups#$ssos#&teways$)inization"%ylott"$znov!%p-ors!%s-232""mw!.ubber-stamping',
+    '%#ngs#\'enstein#&iaceae$#cam"%chill#$sacs"%dhall""el"+gby-playing#$gles"$mens#)inatively#"my"&nswick"\'pprecht',
+    '#"es#%hmore##ses$#ias#&ticity%#que"\'thenian%.rford-appleton*!s!"v8!"xe!%yabov"%szard"$vita -s&eacute;guin',
+    '!%.1(3)""36"#79s".acidocaldarius"$e.m."$m.t.""r.",solfataricus!#138"!6!$2(1)!%34(1)"!5!"89!&a\'adah',
+    '")bbatarian#&havasu#*re-toothed"$cchi#&k-like#&rality"&fe-buy$%r-sex"&helian""ic#(nt-cloud&%simon%!y#$tama$!o',
+    '"(lination$%vated#&ly-ann#$onen%"ga#\'tations$\'marshes$#ney""ma#"ey#%izdat#$ling#"na#$ovar#%phire',
+    '"$na\'a#\'dstorms$#tex$\'wiching$#zak#(ga-sanga#\'s_serif$\'epolcro##tas$&illana"+pphire-blue#$wood"%rasin#$nies#"re',
+    '""sp$"ac"#tay#&irized$"sh"+ucer-shaped$#ily#"er"*voir-faire"&xatile#&ifraga!"c."\'affolds##lic$$ping',
+    '#$rfed$$iest%$nish"*h&uuml;rer#\'achtman#%emaid#(ismatics#\'leicher%#yer#&meling$,idt-richberg#!o$&ol-boy\'#led&$marm',
+    '$#rne#%rager$$egle%$uder$%ijver""ip#(ssortail"!m"#ops"(rapyards#$eeds$%w-top#%imped$&ptible#%ofula',
+    '#"ms#\'rryings#"se#!t$%tlers!#e5a")a-captain$&horses$&shells#%croft#&shores""cc#*ond-degree\'\'highest\'%phase',
+    '"-dimentologist"(e-sawing#%board#&dheads$%iness"%idman#$fert#(smograph&\'logical"&langor#-enomethionine$%ucids#+f-adjusting&-ggrandisement%(concepts',
+    ')$empt&&reated%(deluding\'(termined%$harm%)initiated\'\'terests%(limiting%(renewing&*ighteously%*validation#%lable$#out#$side#$tzer',
+    '%)permeable%%rigid$%solid#!p".nse-qualifiers$\'itising$)ory-motor#\'tentiae(%ously$#ier"$pals#)ia-tinted##tet$&imania&#ius',
+    '"%r-gln#$apis#\'enading#"vi""sa#!h""ti##ups"!v#\'en-part&&storey$$rini%\'n-trent##res"(x-linked',
+    '!#gts!(hacklady#"fi##key#%llice#$mley$%rocks#$naar$$tung#$olin#%pings#!r$$dlow$)e-dealing&\'holders',
+    '&%ville%\'shooter"$eard#%dlock#*ep-farming%!s#%lleys#$nnan#%rries#"th"$iela#\'ft-work%\'workers#%gella%"ru',
+    '#&mmying##nty#%pload$$mate$&wright#&ratori$%ehall%!r$$kers$\'t-front&\'sleeved%$less"$klar"$muel"*ock-horror',
+    '#\'ddiness#%e-box$$horn#$guns#(ot-em-up#)p-lifting$$girl$)ping-list#+rt-distance%+sightedness#$tley#%w-biz%%piece$)addywaddy$\'er-room',
+    '*!s"\'reddies#%igley$&llness$$vels"$ufti##koh#%t-out!,i&egrave;cle"$alic"\'de-kick$&bottom$%light$$slip$%wards',
+    '")ght-lines#\'nwriter"$kulu")lberbauer$#ury#$cott#*icon-based\'"es#$lett#,ver-coloured&$hill$)icultural""mi#!o$$nica',
+    '#$ples"&nensis#)gle-break\'\'crystal\'&engine\'%point\'$slot(&ubject#%namon",raj-ud-daula#%mione"%skins"&tiveni"(vanandan",x-and-a-half',
+    '$&strong$\'wheeled#!t$(een-hour()year-olds$\'y-first!"jp!#kah#\'nderbeg#&tepark"\'ellbank#\'w-whiff"$iffs#%lbeck#$mmia',
+    '#"ts#$wear"&orpion"(ull-like!$lann#"va$\'e-trade%!r$"ia#$yers"\'eekness#)ightholme,$dale$$pner##men',
+    '"*icked-back#\'de-rule#&m-line##och"%obber#&wcoach"$uman#"ys!$m/nd"%acker#(ll-boned&\'holders&%sized#%rtish#+sh-and-grab',
+    '"#ick#%dgeon"*okebusters!%n9000"&affled#"ky#$p-on"\'ickered&!t"%oozed##rri"\'uff-box!)o_er_that"(akerhose"#bor',
+    '&,ist-feminist$!o%*-emotional%&pathic#&ratism"#eur")ft-ground"#ham#!l"&illess#$rees".l&oacute;rzano#%emnis#&idness$(tariness',
+    '"\'merwest",n-of-a-bitch#)g-writing#&ically&$tion#%ogram#!t"*phisticate#"ra#%worth"%rbets#%ensen#$loth#!n""s1',
+    '#!w"&uflias#*th-central&)westwards"*viet-built\'"us!%pain\'#)rrowgrass\'%hawks"&eakin\'#3cially-commissioned$$kles$\'tabilis&$ting%\'roscope',
+    '$%dball#$gelj#\'lthorne#%ndin\'"&heroid&&plasts"!i#\'ll-over#\'n-orbit$$elli$#ola%"sa#\'ralists$#ito&$uall',
+    '##vak"(lashback"%oerri#&fforth#(il-sport#\'keshave#\'nginess#)on-shaped"(read-out#-ing-flowering&$bank&$head"0ur-of-the-moment$!r!$q.km',
+    '"#_yd"%lbase"!r"#uab$\'red-off#$eers##ibs$#ffy!"rd!#t*r"%.john"(aatliche#(dtholder#+ge-by-stage#\'incross',
+    '$\'ybridge#\'mpeding&!r#%nbury$$doff$,ford-le-hope#*phylococci#%rdent$%ships#(te-level"(eamed-up#$iger$"ne#\'mberger#\'pfamily',
+    '#$ttin"\'ickiest#%ftung#$gmas#\'ll-room%&waters#&ngless#&ppling#$voro"$obbs#&ckbery%&holder%$take#"el##lpe',
+    '%&ground#%p-off#%rmily$&y-book#&waways"(r&dollar#(aightway$$nton$#ppy$(thkelvin#&eatlam$\'etlight$)ngtheners#(ip-tease#&ongbow',
+    '\'%um-90$%udley#$ymon"#uey#"ka#\'ltified#$nter#%rgess#\'yvesant!(ub-basin$)groupings$(licensee$&normal$%order$%space',
+    '#(cellular#\'domains#\'hepatic$\'irtella#+ject-object#(mariners#*population#&scales$(tantives%(ructures"*ccessional"%enens"(lfolobus#!u"#mps',
+    '"&n-beds$&filled$#sat$$trap#!.#\'bathers$#ird\'!s#!t$#rap"$omen",per-organism%\'charger\'#unk%-ego-formation',
+    '%\'highway%%ieure&.ntendent-nurse&\'orities%(latively%)ovulation#(ra-local$\'ematist"(rfboards#&tseyan"$sana"&zerain!"w8"&abbing#%lwell',
+    '$#ned#%rtkop"\'eelinck$&t-talk%&breads%$peas%!y$"zy"&indles$+nerton-dyer$#son#$ping##rly#\'tch-off"+ordsmanship',
+    '!\'yconium"#del"\'lvatica$#ian"+mbiotically$&olists#!i#&phytum"&n-skin#$chro#(thesises&\'tically"$rups"$well &t-bond',
+    '"+lymphocytes""pa!!9")000-based!%abley#(ulations"\'ckiness"$fahi#%frail"&glioni#"ro"*ill&eacute##nts##sce")kashimiya',
+    '##ens#*king-point#(lahassee$%backa"#mes#$plin$%onade##zin"%ngere#\'kersley#&talise&"um"$p-in#&pajoss#$sell',
+    '%%tella&$ulas#"by"(sk-based%%force#"si"&tchell#"es"$uten&"ed"\'x-payer"1ylor-agathangelou!%blisi!#cpa!\'ea-tree',
+    '%+er-trainers\'&/pupil#$sels")chnology."%huana"$l-me#(ekinetic$!s$#tel##lee"\'nderers"!o#(tihuacan",rminally-ill#%penes',
+    '#$tian%"us"#ssy")traplegia"&utsche!#fap"#iid"!r!)hamesmead#$rsis#%tcham"+eatre-going#"gn#"m\'#\'ocritus',
+    '##rmo&+dynamically#(ssalians"%ibaud#)ck-headed&&lensed#"er$"ve#)gh-length#\'mbleful#(n-walled$%kable#)rd-degree$\'lestane$&stless',
+    '%/y-five-year-old"\'rapston#)ee-aisled&&bedded&\'element&\'for-two&,generational&&headed&%level\'#ine&%track&$word#+omboembolic$&wbacks##upp',
+    '$$land!*icking-off"$empo"&gercat"$llie"#me-%%spans%%words#$otei"\'nderbox#"gs##oco""on"&p-toes#$p-ex',
+    '"$sane#$hkov"\'thonian#(le-pages!\'oasties"(day/live"$ecap&!s"&golais"%ilers%*t-training&"ry#!t#"vo"!k',
+    '$%erton")mographic"/ngue-and-groove#%ights#"to"%olbus".p-of-the-table$&ranked&"te#)ographies#$sham"*rremolinos#*sion-angle#,y-controlled"#sti',
+    '"+ugh-looking#\'rmaline$#ney$+s-sur-marne")wn-centre$%esend"$xics!"pm!(rackball%$work$&tarian*!s#$deco#+ffic-lights#*inspotters',
+    '%)caucasian%&ferral%\'humance%)missivity%*peritoneal&$ower%%tools#(pezoidal"$ebly#*e-climbing%$ring&$oots%&stumps#%foils#%herne',
+    '#*nd-setting$#ton#&ponema"\'ibology$%schen#$cksy$%uspid#,gonometrical#(novantes#$onic#&p-wire$*le-purpose$#ura##ste#(vialised',
+    '""ob#%llies#\'mbonist$)pe-l\'oeil##ost#)uble-torn""rl"!t"%ucked%%loads#%ffaut##mbo#\'ncating#%ssell"(yptophan',
+    '#&revich""ps"\'urumaki!,ubulovillous"%ffers#"ty"%karam"(mblejack#(origenic#!s""nc"$obin"#pou"$rley##ney',
+    '$&tables#&pitude#0ske-hue-williams$"un"\'waithah!#vnz!*welve-foot"&in-cam#%tcher&"it"\'o-layer$)month-old$(terminal%$imes"!r',
+    '!$yche"\'ne-tees"(picality"%seley##ons!\'zeentch (u&iacute!".s#".a!#2\'s!!6!"ao!&ccello!#den!"ec',
+    '!\'gandans"!o!)itsmijter#"ua!$lama""ph"0tra-conservative&)sensitive%+sonographic"#vik"$ysse!(mbilicus""ma!)nachieved#"ry',
+    '%%igned#)vailingly"&beheld#\'uckling$$rned"%civil#%oated$"il$-mpetitiveness&%lexed$*nscionably%(tainable$$uple#!p"+der-manager',
+    '&*subscribed&+the-counter&#use%)nutrition%%shoot&&urface#)iplomatic#\'ulation"(enclosed$&dingly"\'feigned#$ixed#&orseen"$gers#\'overned',
+    '#$inge#&ooking"-i-directional##bol##dad##fem#,nterpretable#*processors#(versiade("te)&y-wide"\'kindest"(lamented#\'ikeable"%mated',
+    '#%inned")rehearsed$,sponsiveness#\'uliness"\'saddled#\'creened#&tinted$\'oppably"&tasted"\'winking#\'rinkled!)p-grading#\'problem"\'draught""ss',
+    '"%warps!#ra5"!d#!d"&gonian"(inalysis"%mston"&sprung!.s&dollar;1,300+%1,000+%2,000+)5,000,000,!0*"20*)3,000,000',
+    '*)6,000,000+)0,000,000"#-ec"&ed-car%"up"!i"!u##rer!\'topians"(tlesford!!u .v&aacute;squez"1eacute;rit&eacute!#.e.!"35',
+    '"#der"\'ginalis"&illant"%ladon$$nces#"en%"ti$"ri##ine#&kyries#\'paraiso"&ndross#&sitart##unu"&porise',
+    '#&ityper##mus#!u##ves"&sarely#$htar"$tman"&uzelle!#c10!\'ectored"#das"&getius"#iga#$tchi"(likovsky',
+    '"&ntolin$\'riloquy$$urer\'$some"#res#%rilli"$stel$$ries!(icariate#(e-chairs#"om#)toriously")deo-based%%logic%&phones',
+    '"\'ewlogic""i."\'lifying#(la-lobos%%iness%%nueva"#mla#"to"*ndictively"#ole%&t-blue"$rion&!s#(ological"%scaal',
+    '#\'ualiser#&ystems"$tara"#vas!#lci!"o5"&calise"&dapage"#eux"$kins"#l.1#(canicity#$itis#&leying"&nnegut',
+    '""se"*te-rigging"\'ukashan"$yces!%pp500!"sr!(ulcanite#(garities 0w&uuml;rttemberg!"/e!!5!!7!%added$$icar#\'ebridge',
+    '"&echter"#hab"&ilings""ko"%ldock#$lahs$"in$%plugs#&rasian#-ton-on-thames&!s##vin"&ngchuk##ner"#rks',
+    '#$nham#-rington-based%$ston"$s/is#(h-basins#-te-management%&basket")tch-tower%%fully#(er-clock\'(olourist#$neys"&uchope"!v#(e-length',
+    '$#rly"(ymarking!#c2n!\'dowczyk!$eare"&chsler"$dale"\'ed-free#\'kenders"$ibel#$gher%$tily##tek"*ll-advised%&backed',
+    '%)conceived(\'sidered\'$oked%(grounded%$laid%)modulated%*positioned%&rooted%(tempered"(ntworths##zel"%stall$#one!&haddya#$tely',
+    '#(el-chair#$reon"$iffs#$ling#\'p-round$$cord#\'rligigs%%winds#%spery#)te-backed&(flowered&\'knuckle&%owned&%robed%&church',
+    '%$read$$ford$#row$#son%%unday"(odunnits#(le-trunk#%rlton"%ymper!(ickedest$%steed"&dcombe#(e-bodied%&spread$$body',
+    '"!j"$lbye#&dblood%#oar$"en#&lcocks$!e$"ig#%pattu"&n-lose#"/u#\'d-chill%)dispersed$*ing-sheets$+m&uuml;ller',
+    '#&e-dark%&makers#&g-drop#$mill#%stone#)terbourne#$wood"%peout"#rtz"&sharts"*tch-doctor&$like#,tgensteinian!!n!(olf-like',
+    '%&liness"%ntner"&odacon$$chip$%field$$pulp$%winds#"zy")rkaholics$#shy%\'urfaces#$mald#(sborough$&t-ever&#off',
+    '%"st"#wee!)ranglings"$eaks"*iglesworth#(ter-self$#in\'")ong-doers#$tham!\'yborcza"%nford#)ne-thomas#$yard"$tham (x-normal',
+    '!"an#\'thippos!"db!"fi!"ga!"ie!#lib#!i#!x"#vii!"r3!&ueqian!!z %y-yes!+178&ndash;3',
+    '!!_!&a\'acov"&coubou"&fforth"%kutsk"%mamah"\'rranton#$well!"bg!(ears-old"$lena#&verton""re"$sses$"ir',
+    '"#nka!%ohkoh"$kels#%ogawa"#nex"&rkhill"#sef"+ungest-ever#%ssouf!#pll!$uasa"$kawa"!r &z-axis!"80',
+    '""pu""rb#$dari"!t!%denek!%e\'evi"$laya#$enin"$nawi""os"!p""ri"$ugma!%illah!(naniecki',
+    '"#rzi"#tos!"ue"#rif!#x81',
 )
@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_18 = (
+count_18 = 6694
+
+heads_18 = (
     '&aelig;thelric',
-    '&agr;x&bgr',
-    '&amp;1/4',
-    '&amp;nad',
-    '&bgr;-blocking',
-    '&dollar;0.21',
-    '&dollar;0.24',
-    '&dollar;0.28',
-    '&dollar;1,900m',
-    '&dollar;1.35',
-    '&dollar;1.44',
-    '&dollar;1.56',
-    '&dollar;1.70',
-    '&dollar;1.73',
-    '&dollar;1.82',
-    '&dollar;1.85',
     '&dollar;1.90',
-    '&dollar;100,000&ndash;150,000',
-    '&dollar;11,500',
-    '&dollar;15.5m',
-    '&dollar;165',
-    '&dollar;190,000',
-    '&dollar;20&ndash;30,000',
-    '&dollar;2000',
-    '&dollar;21,000',
-    '&dollar;380',
-    '&dollar;39',
-    '&dollar;4.95',
-    '&dollar;4.9m',
-    '&dollar;44',
-    '&dollar;5,000,000',
-    '&dollar;5,200',
     '&dollar;5.4m',
-    '&dollar;5.6m',
-    '&dollar;6,700',
-    '&dollar;60&ndash;80,000',
-    '&dollar;7.7m',
-    '&dollar;700,000,000',
-    '&dollar;75m',
-    '&dollar;795',
-    '&dollar;8.9m',
-    '&dollar;9.8m',
-    '&eacute;aulement',
-    '&eacute;ireann',
-    '&frac18;in',
-    '&frac18;pt',
-    '&frac25',
-    '&lt;2',
     '&lt;5',
-    '&lt;enter&gt',
-    '&lt;or=',
-    '&mdash&mdash',
-    '&mdash;.',
-    '&mdash;all',
-    '&mdash;csl',
-    '&mdash;of',
-    '&mdash;oh',
-    '&mdash;with',
-    '&micro;g/kg/day',
-    '&ndash;he',
-    '&pgr;-section',
-    '&pgr;-sections',
-    '&pgr;-type',
-    '&pound;1.10',
     '&pound;1.4bn',
-    '&pound;1.75m',
-    '&pound;10&ndash;15,000',
-    '&pound;100million',
-    '&pound;102,000',
-    '&pound;107',
-    '&pound;11.2m',
-    '&pound;11.3m',
-    '&pound;11.7m',
-    '&pound;111',
-    '&pound;112',
-    '&pound;113',
-    '&pound;128,000',
-    '&pound;12million',
-    '&pound;13.3',
-    '&pound;133',
     '&pound;138',
-    '&pound;138,000',
-    '&pound;14,700',
-    '&pound;14.5',
-    '&pound;142',
-    '&pound;15.49',
-    '&pound;15.4m',
-    '&pound;15million',
-    '&pound;172',
-    '&pound;184',
-    '&pound;188',
-    '&pound;2,090',
-    '&pound;2,250',
-    '&pound;2.10',
-    '&pound;2.19',
-    '&pound;2.69',
     '&pound;20.50',
-    '&pound;21.75',
-    '&pound;21.95',
-    '&pound;2200',
-    '&pound;244.5',
-    '&pound;269',
-    '&pound;27.5m',
-    '&pound;28.99',
-    '&pound;3,400',
-    '&pound;3,600',
-    '&pound;3,700',
-    '&pound;3.4m',
-    '&pound;3.80',
-    '&pound;3.8m',
-    '&pound;30,000&ndash;40,000',
-    '&pound;300&ndash;500,000',
     '&pound;301',
-    '&pound;319',
-    '&pound;335',
-    '&pound;33m',
-    '&pound;353',
-    '&pound;360,000',
-    '&pound;365',
-    '&pound;36m',
-    '&pound;37.5m',
-    '&pound;380,000',
-    '&pound;4.',
-    '&pound;4.60',
-    '&pound;412',
-    '&pound;420,000',
-    '&pound;445',
-    '&pound;46m',
     '&pound;47,000',
-    '&pound;4million',
-    '&pound;5.10',
-    '&pound;5.3',
-    '&pound;5.8',
-    '&pound;5.8m',
-    '&pound;52.50',
-    '&pound;54,000',
-    '&pound;58m',
-    '&pound;5million',
-    '&pound;6.',
-    '&pound;6.7m',
-    '&pound;610,000',
-    '&pound;62,500',
-    '&pound;660',
-    '&pound;7.20',
     '&pound;7.2m',
-    '&pound;7.3',
-    '&pound;7.8',
-    '&pound;710',
-    '&pound;729',
-    '&pound;730',
-    '&pound;79.95',
-    '&pound;8.1',
-    '&pound;8.5m',
-    '&pound;8.75',
-    '&pound;87',
-    '&pound;89.95',
-    '&pound;895',
-    '&times;112',
-    '&xgr',
-    '\'ang',
     '\'ospital',
-    '\'s_up',
-    '\'so',
-    '\'that',
-    '\'there',
-    '\'twill',
-    '\'well',
-    '*ali',
-    '*appointed',
-    '*no',
-    '+7',
-    '-190bp',
-    '-55bp',
-    '-70',
-    '-factor',
-    '-poet',
     '-terminal',
-    '0&ndash;255',
-    '0,0',
-    '0.03%',
-    '0.30',
-    '0.31',
-    '0.34',
-    '0.47',
-    '0.58',
-    '0.59',
-    '0.71',
-    '0.81',
-    '0.90',
-    '000m',
-    '003',
-    '00:00',
     '00:08',
-    '014',
-    '0243',
-    '0274',
-    '0423',
-    '0428',
-    '0444',
-    '0452',
-    '050',
-    '0502',
-    '0588',
-    '05:31',
-    '0610',
-    '06:31',
-    '0793',
-    '0803',
     '0932',
-    '0ab',
-    '1&frac14;in',
-    '1&ndash;35',
-    '1&times;10',
-    '1,000-acre',
-    '1,000-plan',
-    '1,000ft',
-    '1,001',
-    '1,033',
-    '1,1',
-    '1,340',
-    '1,550',
-    '1,600,000',
-    '1,750,000',
-    '1,800,000',
     '1-7',
-    '1.0.2',
-    '1.00pm',
-    '1.08',
-    '1.3.5',
-    '1.32',
-    '1.46',
-    '1.47',
-    '1.48',
-    '1.52',
-    '1.70',
-    '1.72',
-    '1.8.0',
-    '1.85',
-    '1.96',
-    '1/2in',
     '10&ndash;40',
-    '10,200',
-    '10-8',
-    '10.05',
-    '10.11',
-    '10.18',
-    '10.24',
-    '10.31',
-    '10.55',
-    '10.62',
-    '10/11',
-    '100-yard',
-    '1040s',
-    '1045',
-    '106,000',
-    '1069',
     '108,000',
-    '10d.',
-    '10mph',
-    '11&ndash;20',
-    '11(2)',
-    '11(3)',
-    '11.15am',
-    '11.40',
-    '11/12',
-    '110%',
-    '110mm',
-    '110p',
-    '110s',
-    '1119',
-    '1122',
-    '1142',
     '1149',
-    '1172',
-    '1192',
-    '12&ndash;15%',
-    '12&ndash;17',
-    '12&ndash;3',
-    '12-bar',
-    '12-year-olds',
-    '12.19',
-    '12.23',
-    '12.40',
-    '12.45pm',
-    '1232',
-    '1243',
-    '1276',
-    '127p',
     '1280s',
-    '129p',
-    '12h',
-    '13&ndash;18',
-    '13&ndash;7',
-    '13,14',
-    '13-2',
-    '13-8',
-    '13-part',
-    '13.11',
-    '13.15',
-    '13.8%',
-    '13.9%',
-    '130&ndash;1',
-    '1310&ndash;11',
-    '132p',
     '133,000',
-    '135p',
-    '1365',
-    '13cm',
-    '13m',
-    '13oz',
-    '14&ndash;19',
-    '14-month-old',
-    '14.11',
-    '14.3%',
-    '1403',
-    '1404',
-    '1411',
-    '1417',
-    '1418',
-    '1423',
     '1426',
-    '1443',
-    '1458',
-    '148p',
-    '1498',
-    '14h',
-    '15&ndash;25',
-    '15&ndash;5',
-    '15.6%',
-    '15.9%',
-    '150-year-old',
-    '150000',
-    '1530&ndash;1830',
-    '15g/&frac12;oz',
-    '16&ndash;25',
-    '16&ndash;5',
     '16,17',
-    '16.0',
-    '16.20',
-    '16.3%',
-    '160p',
-    '17&ndash;22',
-    '17&ndash;26',
-    '17/18',
-    '170&deg;c',
-    '17000',
-    '170g',
-    '170p',
-    '17lb',
-    '17myr',
-    '17s.',
-    '18&deg;c',
     '18&ndash;17',
-    '18(1)',
-    '18,800',
-    '18-carat',
-    '18-day',
-    '18-member',
-    '18.00',
-    '18.3%',
-    '18/19',
-    '1830\'s',
-    '1848&ndash;9',
-    '185p',
-    '1864&ndash;1920',
-    '1899a',
-    '18b',
-    '18s.',
     '19&ndash;22',
-    '19&ndash;24',
-    '19&ndash;26',
-    '19.2%',
-    '1905&ndash;6',
-    '1909&ndash;10',
-    '1910&ndash;11',
-    '1912&ndash;14',
-    '1913+16',
-    '1937&ndash;38',
-    '1938a',
-    '1954&ndash;5',
-    '1955&ndash;6',
-    '1955&ndash;61',
-    '1956&ndash;57',
-    '1956b',
     '1961&ndash;71',
-    '1963&ndash;90',
-    '1965&ndash;66',
-    '1965b',
-    '1967&ndash;68',
-    '1969a',
-    '1973&ndash;5',
-    '1974&ndash;79',
-    '1975-76',
-    '1978&ndash;87',
-    '1980-85',
-    '1981&ndash;84',
-    '1982&ndash;87',
-    '1982/3',
-    '1983&ndash;5',
-    '1983.',
     '1984&ndash;8',
-    '1984-86',
-    '1984.',
-    '1986-89',
-    '1986-90',
-    '1987&ndash;9',
-    '1987c',
-    '1988c',
-    '1991&ndash;93',
-    '1991-93',
-    '1992-94',
-    '1993a',
-    '19a2',
-    '1:1000',
-    '1:11',
-    '1:16',
     '1:25,000',
-    '1:40',
-    '1:6',
-    '1:9',
-    '1ml',
-    '2&frac12;d',
-    '2&middot;5cm',
-    '2&shilling;6d',
-    '2,000ft',
-    '2,124',
-    '2-7',
-    '2-iron',
-    '2.27',
-    '2.28',
-    '2.3.4',
-    '2.6m',
     '2.8.2',
-    '2.8.5',
-    '2/30s',
-    '20&ndash;39',
-    '20&ndash;50',
-    '20-year-olds',
-    '20.6%',
-    '20/10/93',
-    '200&mgr;m',
-    '2000s',
-    '200c/400f',
-    '200lb',
-    '2014',
-    '2023',
-    '2033',
-    '205xs',
     '207mb',
-    '20khz',
-    '21&ndash;14',
-    '21&ndash;15',
-    '21&ndash;17',
-    '21&ndash;25',
-    '21.18',
-    '21a',
-    '22&ins',
-    '22&ndash;12',
-    '22&ndash;28',
-    '22-26',
-    '22.7%',
-    '22.8%',
-    '226868',
-    '23&deg',
     '23&ndash;26',
-    '23&ndash;30',
-    '23.30',
-    '23.8%',
-    '23.9',
-    '233p',
-    '23a',
-    '23c',
-    '23m',
-    '24-year-olds',
-    '24.1%',
-    '24.4%',
-    '24.9',
-    '248p',
-    '25&ndash;26',
-    '25(1)',
     '25.6%',
-    '255p',
-    '25a',
-    '25kg',
-    '25se',
-    '26-29',
-    '26-strong',
-    '26/27',
-    '263&ndash;265',
-    '265(1)',
-    '27(1)',
-    '27.',
-    '27/28',
-    '28-member',
-    '28.5%',
-    '28.6',
     '29.2%',
-    '29.3',
-    '29.4',
-    '2:17',
-    '2:18',
-    '2:23',
-    '2:7',
-    '2cms',
-    '2lbs',
-    '3&commat;1/2',
-    '3&ndash',
-    '3,000-strong',
-    '3,280ft',
-    '3,750',
-    '3-',
-    '3-fold',
     '3.00am',
-    '3.1.5',
-    '3.1m',
-    '3.2m',
-    '3.3.0',
-    '3.38',
-    '3.4.3',
-    '3.42',
-    '3.55',
-    '3.5inch',
-    '3.6.0',
-    '3.71',
-    '30&mgr;m',
-    '30&ndash;31',
-    '30&ndash;34',
-    '30&ndash;39',
     '30-35',
-    '30-bed',
-    '30.3',
-    '300-year-old',
-    '3000ft',
-    '300g',
-    '300pc',
-    '30in',
-    '30pm',
-    '31-sept.',
-    '32.3',
-    '32.5%',
-    '325,000',
-    '32ft',
-    '33.8',
-    '33ft',
     '33s',
-    '34.8',
-    '34.8%',
-    '3414',
-    '3430',
-    '34pc',
-    '35-hour',
-    '35-year',
-    '35.5',
-    '350g',
-    '35km',
-    '36.4%',
-    '36.7',
-    '360-degree',
-    '36409-10',
-    '36438',
     '36459',
-    '36474',
-    '36541',
-    '36599',
-    '36652',
-    '36972',
-    '37016-17',
-    '37042',
-    '37048',
-    '37115',
-    '37117',
-    '37122',
-    '37129',
-    '37174',
-    '37176',
-    '37184',
     '37185',
-    '37256',
-    '37299-300',
-    '37303-04',
-    '37308',
-    '37317',
-    '37319',
-    '37334',
-    '37391',
-    '37434',
-    '37457-58',
-    '37519-20',
-    '37532',
-    '37533',
-    '37603',
-    '37606-07',
     '37618',
-    '37635',
-    '37642',
-    '37643',
-    '37664',
-    '37688',
-    '37702',
-    '37706',
-    '37717-18',
-    '37730',
-    '37759-60',
-    '37859',
-    '37905-06',
-    '37928',
-    '37941',
-    '37945',
     '37974',
-    '37978',
-    '38&ndash;40',
-    '38.9',
-    '38018',
-    '38019',
-    '38021',
-    '38097',
-    '38106',
-    '38113',
-    '38118',
-    '38145',
-    '38148',
-    '38170',
-    '38171',
-    '38193',
     '38255',
-    '38279',
-    '38299',
-    '38306',
-    '38322',
-    '38332',
-    '38338',
-    '38356',
-    '38422',
-    '38447',
-    '38522-23',
-    '38533',
-    '38538',
-    '38544',
-    '38558',
-    '38563',
     '38569',
-    '38581',
-    '38657',
-    '38677',
-    '38684',
-    '38732',
-    '38743',
-    '38832',
-    '38839',
-    '38841',
-    '38848',
-    '38880',
-    '38883',
-    '38905',
-    '38948',
-    '38957',
     '38987',
-    '390,000',
-    '39026',
-    '39053',
-    '3km',
-    '3r',
-    '3rs',
-    '3x10',
-    '4(3)',
-    '4-',
-    '4-megabit',
-    '4-track',
-    '4.21',
-    '4.2a',
-    '4.3.0',
-    '4.4.0',
     '40,000,000',
-    '40-50',
-    '40-odd',
-    '40.6%',
-    '40.9',
-    '400&ndash;500',
-    '400p',
-    '40kg',
-    '40w',
-    '41.2%',
-    '41.7',
-    '41/42',
-    '41s',
-    '42.9',
-    '4250',
-    '42p',
     '4321',
-    '43pc',
-    '44.1%',
-    '44.3',
-    '44.5',
-    '44.8%',
-    '4422',
-    '44pc',
-    '45&ndash;75',
-    '46.7',
-    '460,000',
-    '47.7',
-    '48.5',
-    '48.9',
-    '486dx2',
-    '4:3',
     '4aa',
-    '4cms',
-    '4gls',
-    '5,6',
-    '5-5',
-    '5-lipoxygenase',
-    '5.1.',
-    '5.4.7',
-    '5.46',
-    '5.75%',
-    '5/190&deg;c/375&deg;f',
-    '50-60',
-    '50-akce',
-    '50-plus',
-    '50.3',
-    '500%',
     '500000',
-    '5002',
-    '500kg',
-    '5029',
-    '50k',
-    '52p',
-    '53.4',
-    '53.8',
-    '55.5',
-    '550&deg;c',
-    '56&ndash;60',
-    '57p',
-    '58.3',
-    '5800',
-    '59-60',
-    '5f',
     '5lbs',
-    '6&deg',
-    '6&ndash;16',
-    '6&ndash;30',
-    '6(6)',
-    '6-6',
-    '6-oxo-prostaglandin',
-    '6.1a',
-    '6.3.5',
-    '6.8.4',
-    '60&ndash;100',
-    '60&ndash;80',
-    '60&percnt',
-    '60-odd',
-    '6000s',
-    '600m',
     '600ml',
-    '60:40',
-    '60mm',
-    '61.5',
-    '638446',
-    '64.7',
-    '6400',
-    '65&deg;f',
-    '65&ndash;69',
-    '65&ndash;70',
-    '6506',
-    '656476',
-    '660,000',
-    '670s',
-    '68(1)',
-    '6888',
     '69&ndash;70',
-    '6k',
-    '6lbs',
-    '7\'s',
-    '7,100',
-    '7,300',
-    '7,700',
-    '7,8',
-    '7,850',
-    '7-12',
-    '7-up',
-    '7.17',
-    '7.55',
-    '7.62',
-    '7/88',
-    '70&ndash;80%',
     '700/rx',
-    '71(1)',
-    '717',
-    '72-hole',
-    '750m',
-    '760,000',
-    '7600',
-    '7:1&ndash;10',
-    '7d.',
-    '7l',
-    '8&ndash;5',
-    '8,200',
-    '8-',
-    '8-11',
-    '8-13',
-    '8-track',
     '8.1(a)',
-    '8.2.3',
-    '8.21',
-    '8.75%',
-    '8/3',
-    '80,000,000',
-    '80/',
-    '800x',
-    '83(1)',
-    '845',
-    '84p',
-    '850407',
-    '859',
-    '85pc',
-    '86.5',
-    '8600',
     '87,000',
-    '878/1473&ndash;4',
-    '88110-based',
-    '883',
-    '885',
-    '894',
-    '898',
-    '8km',
-    '9&ndash;15',
-    '9,400',
-    '9-15',
-    '9-month-old',
-    '9.05',
-    '9.15pm',
-    '9.25%',
-    '9.75',
     '90-degree',
-    '90.50',
-    '9001',
-    '90ft',
-    '90m',
-    '91-day',
-    '913',
-    '9139',
-    '92(2)',
-    '92nd',
-    '930312',
-    '930316',
-    '930317',
-    '93rd',
-    '945',
-    '947',
     '957',
-    '96.5',
-    '980s',
-    '99-year',
-    '9bs',
-    '9hr',
-    'a&bsol;b',
-    'a&ndash;z',
-    'a\'tuin',
-    'a-bomb',
-    'a-frame',
-    'a-ha',
-    'a-iadmk',
-    'a.7',
-    'a.838',
-    'a.j.p.',
     'a.r',
-    'a.s.a.p',
-    'a2\'s',
-    'a207',
-    'a23',
-    'a303',
-    'a325',
-    'a361',
-    'a3x',
-    'a4-sized',
-    'a470',
-    'a48',
-    'a610',
-    'a683',
-    'a=2',
-    'a_posteriori',
     'aaargh',
-    'aas',
-    'abates',
-    'abbeyfield',
-    'abdomens',
-    'aberdonian',
-    'abiram',
-    'abrade',
-    'abrook',
-    'abseilers',
-    'absoluteness',
-    'absolutists',
-    'absorptions',
-    'abstractness',
-    'abv',
-    'abyssalis',
     'ac/189',
-    'ac30s',
-    'acb',
-    'acceptors',
-    'accessibly',
-    'accies',
-    'acclimatising',
-    'accordin\'',
-    'accustoming',
-    'acms',
-    'acnpv',
-    'aconites',
-    'acoustical',
-    'acpc',
-    'acquainting',
-    'acreages',
     'acrimoniously',
-    'acrolect',
-    'actes',
-    'actional',
-    'activa',
-    'actualisation',
-    'actualize',
-    'actuators',
-    'ad-libbed',
-    'adams/prison',
-    'adaptedness',
-    'adela',
-    'adige',
-    'adjei',
-    'adjutant-general',
-    'administratif',
     'adriano',
-    'adsorb',
-    'adventists',
-    'adventurist',
-    'adversities',
-    'advertorials',
-    'advocaat',
-    'aelis',
-    'aero-engine',
-    'affronts',
-    'after-lunch',
-    'agc',
-    'agent_provocateur',
-    'agglomerate',
-    'agoos',
-    'agreement.',
     'agribusinessmen',
-    'agriculturists',
-    'agrippina',
-    'ahmeti',
-    'ahtisaari',
-    'ahura',
-    'aidans',
-    'aide-m&eacute;moire',
-    'aikin',
-    'aion',
-    'airconditioning',
-    'airdrop',
-    'airguns',
-    'aislabie',
-    'ajaccio',
-    'ajibola',
     'al-bid',
-    'al-gadira',
-    'alagoas',
-    'alaia',
-    'alayn',
-    'albano',
-    'albyn',
-    'aldenham',
-    'alekseevich',
-    'alexandrov',
-    'aley',
-    'alfaro',
-    'all-knowing',
-    'all-wise',
-    'all-year',
-    'allen-mills',
     'allenton',
-    'allstar',
-    'alluringly',
-    'almod&oacute;var',
-    'alphand&eacute;ry',
-    'alpinum',
-    'alri',
-    'altamira',
-    'alterius',
-    'alternant',
-    'althosian',
-    'altmann',
-    'aluminum',
-    'alwasheek',
-    'am386',
-    'am7',
     'amateurishly',
-    'amharic',
-    'amnesic',
-    'amoung',
-    'amperif',
-    'amphibole',
-    'amphibolite',
-    'amstel',
-    'anani',
-    'anarap',
-    'anaspids',
-    'anastomotic',
-    'anaximandros',
-    'ancestress',
-    'ancre',
-    'ancylostoma',
     'and-',
-    'andersons',
-    'andie',
-    'androgens',
-    'aneerood',
-    'anencephalus',
-    'anergy',
-    'angiogram',
-    'anglo-australian',
-    'anglo-papal',
-    'anglo-spanish',
-    'anglorum',
-    'angulation',
-    'anharmonic',
-    'animalistic',
-    'animist',
     'anish',
-    'ankhu',
-    'annaba',
-    'annotating',
-    'annus',
-    'anstalt',
-    'answering-machine',
-    'anthropocentric',
-    'anti-catholicism',
-    'anti-coagulant',
-    'anti-communists',
-    'anti-corrosion',
-    'anti-fungal',
-    'anti-glare',
-    'anti-guerrilla',
-    'anti-homosexual',
     'anti-infective',
-    'anti-irish',
-    'anti-israeli',
-    'anti-modernism',
-    'anti-myeloperoxidase',
-    'anti-oxidants',
-    'anti-regime',
-    'anti-saddam',
-    'anti-tax',
-    'anti-tobacco',
-    'anti-ulcer',
-    'anti-women',
-    'antica',
-    'anticoagulants',
-    'antielectrons',
-    'antifouling',
     'antigen(s)',
-    'antihuman',
-    'antineutrons',
-    'antinou',
-    'antoniades',
-    'antonyms',
-    'anushkia',
-    'ap-ono-get-on',
-    'apaap',
-    'apathetically',
-    'aphoristic',
-    'apically',
-    'apistogrammas',
-    'apm',
-    'appia',
-    'appraises',
     'apprise',
-    'aprilia',
-    'apsp',
-    'aquarians',
-    'aquascutum',
-    'arabi',
-    'arabians',
-    'arabic-speaking',
-    'arabist',
-    'araceae',
-    'arago',
-    'aragonese',
-    'aramco',
-    'arb',
-    'arbuthnott',
-    'arcana',
     'archaeopteryx',
-    'archangels',
-    'archelaus',
-    'architect-designed',
-    'architectonic',
-    'architecture-compliant',
-    'archons',
-    'archtop',
-    'arcticus',
-    'arcuk',
-    'ardgour',
-    'ardilles',
-    'argles',
-    'arianism',
-    'arisings',
-    'aristeas',
     'aristobulus',
-    'aristophanic',
-    'arkin',
-    'armonk',
-    'arms-length',
-    'arnason',
-    'arnisdale',
-    'arrigo',
-    'art-b',
-    'art-deco',
-    'art-nouveau',
-    'art-objects',
-    'artaxerxes',
-    'articulately',
-    'artifical',
-    'artschwager',
     'as-if',
-    'asante',
-    'asha',
-    'ashby-de-la-zouch',
-    'ashdale',
-    'ashkelon',
-    'asm',
-    'astec',
-    'astors',
-    'asuncion',
-    'asymptotes',
-    'aszal',
-    'atactic',
-    'atanasov',
-    'atapuerca',
-    'ateliers',
     'ateneo',
-    'attfield',
-    'attwell',
-    'atum',
-    'aubin',
-    'augustinians',
-    'aulef',
-    'auriculas',
-    'auriferous',
-    'aurillac',
-    'austro-hungary',
-    'auth',
-    'authoritarians',
-    'authorizations',
-    'autobacs',
-    'autocheque',
     'autochromes',
-    'autocrine',
-    'automatised',
-    'availing',
-    'avent',
-    'averell',
-    'avidin-biotin',
-    'avocets',
-    'avrami',
-    'award-bearing',
-    'awi',
-    'awn',
-    'awright',
-    'awsd',
-    'axb5',
-    'axei',
     'axially',
-    'axp/150',
-    'ayrshires',
-    'azici',
-    'azumah',
-    'b-but',
-    'b-line',
-    'b-sky-b',
-    'b-test',
-    'b.d.d.a.',
-    'b11',
-    'babinger',
-    'bachert',
-    'backbreaking',
-    'backdate',
-    'backed-up',
     'backwoodsmen',
-    'baconian',
-    'baddest',
-    'baden-wurttemberg',
-    'bafflingly',
-    'bah-reah',
-    'bahl',
-    'bahrein',
-    'baigneuses',
-    'bak',
-    'balderstone',
-    'balibar',
-    'ball-bearing',
-    'ball-game',
-    'balloonist',
-    'ballyshannon',
     'baltz',
-    'bana',
-    'band-aid',
-    'bandwagons',
-    'bandy-legged',
-    'banerjee',
-    'bankrolled',
-    'bannatyne',
-    'banneret',
-    'bannerman',
-    'bantered',
-    'baobab',
-    'baor',
-    'barassie',
-    'barbet',
-    'bardi',
     'bardney',
-    'barf',
-    'barfly',
-    'bargainer',
-    'barleycorn',
-    'barleys',
-    'barnwood',
-    'barone',
-    'baronessa',
-    'barr&eacute',
-    'barrel-organ',
-    'barset',
-    'bartimaeus',
-    'bartolo',
-    'bashkiria',
-    'basilectal',
     'bass-player',
-    'basson',
-    'bastia',
-    'basu',
-    'bathrobes',
-    'bathyal',
-    'battle-axe',
-    'battle-ground',
-    'battye',
-    'baud',
-    'baugh',
-    'baumgarten',
-    'bayou',
-    'bbont',
-    'bbq',
-    'bd8',
     'bde',
-    'be-bop',
-    'beady-eyed',
-    'beaney',
-    'bear-leader',
-    'beatified',
-    'beatniks',
-    'beavered',
-    'beckers',
-    'bedouins',
-    'bedroll',
-    'bedsprings',
-    'bee-keeper',
-    'beer-drinking',
-    'behringer',
-    'beleive',
     'belgion',
-    'belief-system',
-    'belkheir',
-    'bell-bottomed',
-    'bell-bottoms',
-    'bellburn',
-    'bendery',
-    'beneficed',
-    'benge',
-    'benguela',
-    'benignity',
-    'bentwaters',
-    'bentworth',
-    'benumbed',
-    'benveniste',
-    'berana',
     'berceuse',
-    'bergh',
-    'bergkamp',
-    'beringed',
-    'bernabeu',
-    'bernicians',
-    'bernsteins',
-    'bersani',
-    'bertero',
-    'berthelet',
-    'bertolucci',
-    'bescot',
-    'beseiged',
-    'besmirched',
-    'beso',
-    'besought',
     'bespeak',
-    'bestest',
-    'bestir',
-    'betokens',
-    'betterton',
-    'betting-shop',
-    'beven',
-    'bewhiskered',
-    'bexton',
-    'beyme',
-    'bget&num',
-    'bgli-naei',
-    'bhan',
-    'bi-partisan',
-    'bia',
-    'biafrans',
     'bibendum',
-    'bicesse',
-    'bicheiros',
-    'bichirs',
-    'bickerings',
-    'biddick',
-    'bielefeld',
-    'biennium',
-    'bighorn',
-    'billingshurst',
-    'bindman',
-    'bingqian',
-    'binky',
-    'bioluminescence',
-    'biome',
-    'biomorphic',
     'biostratigraphical',
-    'biosym',
-    'biotechnologists',
-    'biped',
-    'bird-watchers',
-    'birdy',
-    'biretta',
-    'bisect',
-    'bissau',
-    'bite-size',
-    'bizzerk',
-    'bl&uuml;cher',
-    'black-back',
-    'black-stockinged',
-    'black-winged',
-    'blackdown',
     'blacked-out',
-    'blagdon',
-    'blakely',
-    'blatancy',
-    'blather',
-    'blau',
-    'bleats',
-    'blemish-free',
-    'bletchley/buckinghamshire',
-    'blicher',
-    'blimpish',
-    'blindsight',
-    'blond-haired',
-    'blood-tests',
-    'blood-vessels',
-    'bloomberg',
     'blotto',
-    'blr',
-    'blue-print',
-    'blue-winged',
-    'bluebottles',
-    'bluetits',
-    'bn1',
-    'bn25',
-    'boatbuilders',
-    'bobbly',
-    'bobsworth',
-    'bobtail',
-    'bodged',
-    'bodging',
-    'bodiless',
-    'bodyshaper',
     'boe',
-    'boece',
-    'bogdanor',
-    'bogeyed',
-    'boggers',
-    'bogomil',
-    'bohannon',
-    'bohlen',
-    'bohorok',
-    'boiling-point',
-    'boli',
-    'bollettieri',
-    'bolt-rig',
-    'boltanski',
-    'bolthole',
-    'bomp',
     'bona-fide',
-    'bonallack',
-    'bonamy',
-    'bondsmen',
-    'bonsoir',
-    'boodle',
-    'boohoo',
-    'book-building',
-    'book-collecting',
-    'boost/cut',
-    'bootiful',
-    'bootmaker',
-    'bootsie',
-    'borsellino',
-    'bortoni-ricardo',
-    'boscobel',
     'bosky',
-    'bosomy',
-    'botanicals',
-    'botanising',
-    'botching',
-    'boteler',
-    'botes',
-    'boucheron',
-    'bounteous',
-    'bourdillon',
-    'boursin',
-    'bourton-on-the-water',
-    'bouteille',
-    'bowbazaar',
-    'bowes-lyon',
-    'bowesfield',
     'bowker',
-    'bowlful',
-    'bowstead',
-    'bozer',
-    'bpcc',
-    'bpvt',
-    'br&ucirc;l&eacute;e',
-    'br&uuml;nnich',
-    'bracteates',
-    'bracton',
-    'bradstock',
-    'bradstone',
-    'bradykinin',
-    'brailes',
-    'brain-power',
-    'brainwash',
     'bratfisch',
-    'brazenness',
-    'breadboard',
-    'breast-feed',
-    'breasting',
-    'breastmilk',
-    'breastplates',
-    'breconshire',
-    'breezing',
-    'bremsstrahlung',
-    'breslin',
-    'brest-litovsk',
-    'brick-making',
-    'bridegrooms',
-    'bridge-routers',
-    'brinkburn',
     'briny',
-    'britannicus',
-    'britomart',
-    'brittlebank',
-    'broadhead',
-    'broadland',
-    'broadswords',
-    'broadwood',
-    'brobdingnagian',
-    'bromeliads',
-    'brompton-smiley',
-    'bronzing',
-    'brookhaven',
-    'brooksby',
-    'broompark',
-    'brring',
     'brucellosis',
-    'brugg',
-    'bruisers',
-    'brush-up',
-    'brutalising',
-    'brydges',
-    'brynllys',
-    'bs2',
-    'bs7750',
-    'bti',
-    'btn',
-    'bubb',
-    'buchanan-smith',
-    'buckeye',
-    'buczacki',
-    'buddhas',
     'buena',
-    'buffoons',
-    'buitoni',
-    'bujan',
-    'bulgar',
-    'bulimics',
-    'bullfighting',
-    'bulrush',
-    'bumblebees',
-    'bumboy',
-    'bundesversammlung',
-    'bundoran',
-    'bunkering',
-    'burghersh',
-    'burnham-on-crouch',
-    'bursars',
     'bushman',
-    'busia',
-    'business-wise',
-    'buti',
-    'buttigieg',
-    'buus',
-    'buzzard-like',
-    'bye&ndash;laws',
-    'bynames',
-    'c&agr',
-    'c&amp;r',
-    'c&amp;sharp',
-    'c&ocirc;tes',
-    'c\'zak',
-    'c-banding',
-    'c-c',
     'c.aid',
-    'c.d.',
-    'c.p.r.',
-    'c/ebp',
-    'c49',
-    'cabannes',
-    'cadcam',
-    'cadetship',
-    'cadillacs',
-    'caesarius',
-    'caf&eacute_au_lait',
-    'cagayan',
-    'caique',
-    'calamy',
-    'calcia',
-    'calcites',
     'calculatedly',
-    'calday',
-    'call-note',
-    'call-offs',
-    'calne',
-    'calumnies',
-    'calzaghe',
-    'camarena',
-    'cambio',
-    'camerata',
-    'cameron-webb',
-    'camerton',
-    'camino',
-    'camouflages',
-    'campbell-black',
-    'canalized',
     'cancerian',
-    'candarli',
-    'canmore',
-    'cannistraro',
-    'cano',
-    'capital-adequacy',
-    'capriciousness',
-    'capsid',
-    'capuchin',
-    'caputmedusae',
-    'car-based',
-    'car-boot',
-    'car-making',
-    'car-owners',
-    'carapaces',
-    'carausius',
     'caravanserai',
-    'carbomer',
-    'carbonflo',
-    'carbonized',
-    'cardenal',
-    'cardiff-based',
-    'carews',
-    'carezza',
-    'carhartt',
-    'caribe',
-    'caribs',
-    'carli',
-    'carmelo',
-    'carnaud',
-    'carnea',
-    'carniki',
     'carpio',
-    'carreg',
-    'carribean',
-    'carriker',
-    'carrillo',
-    'carrithers',
-    'carry-cot',
-    'carter-ruck',
-    'carthorses',
-    'carthusians',
-    'cartload',
-    'carway',
-    'case-history',
-    'cash-rich',
-    'cassoni',
-    'cassowaries',
     'castelfonte',
-    'castleblayney',
-    'castlecourt',
-    'catalonian',
-    'catatonia',
-    'catchem',
-    'catgut',
-    'cathexis',
-    'catley',
-    'caufield',
-    'caul',
-    'causeley',
-    'caver',
-    'cavortings',
-    'cbdc',
-    'cc-m2t',
     'ccn',
-    'ccp4',
-    'cd-x',
-    'cd4(d1d2)',
-    'cd4/cd8',
-    'cddp',
-    'cdex',
-    'cebu',
-    'cecile',
-    'cedex',
-    'celant',
-    'celesta',
-    'cell-y-bedd',
-    'celle',
-    'cellists',
-    'celltech',
     'cenerentola',
-    'centiles',
-    'centre-backs',
-    'centre-halves',
-    'centredness',
-    'centromeres',
-    'cephalonia',
-    'cepr',
-    'cerney',
-    'cesspits',
-    'cfdt',
-    'cgs',
-    'ch\'ing',
-    'ch.5',
-    'chadlington',
-    'chadwell',
     'chailly',
-    'chairlifts',
-    'chakra',
-    'champness',
-    'chanceries',
-    'chapelry',
-    'chapping',
-    'chapterhouse',
-    'charfield',
-    'charig',
-    'charmley',
-    'charron',
-    'chasse',
-    'chatchai',
-    'chatlines',
-    'chatterer',
     'chauntecleer',
-    'cheatle',
-    'checksum',
-    'cheddington',
-    'chelsi',
-    'chemoattractants',
-    'chernyshevskii',
-    'chernyshevsky',
-    'chesky',
-    'chestergate',
-    'chestvale',
-    'chiantishire',
-    'chickening',
-    'chigwellians',
-    'chiles',
-    'chillers',
     'chilver',
-    'chilvers',
-    'chilwell',
-    'chimanbhai',
-    'chimney-pieces',
-    'chinas',
-    'chinking',
-    'chinky',
-    'chinn',
-    'chintz-covered',
-    'chirwas',
-    'chitarrone',
-    'chiton',
-    'chlodio',
-    'chlorination',
-    'chlorofluorocarbon',
     'chockstone',
-    'chocolate-coated',
-    'cholecystolithiasis',
-    'chorales',
-    'chortles',
-    'chowder',
-    'christodoulou',
-    'chronicity',
-    'chronicon',
-    'chubin',
-    'chukkas',
-    'chunking',
-    'churchdown/gloucestershire',
-    'churchmanship',
-    'churchtown',
-    'chuter',
     'cidade',
-    'ciggie',
-    'cill',
-    'cinema-going',
-    'cio',
-    'circumcisions',
-    'circumnuclear',
-    'circumspecte',
-    'ciro',
-    'cists',
-    'citt&agrave',
-    'civil-service',
-    'clares',
-    'clarges',
-    'class-biased',
-    'classifiable',
     'clast',
-    'cle-1',
-    'clean-out',
-    'cleaned-up',
-    'cleaning-up',
-    'clearprint',
-    'cleeve/gloucestershire',
-    'clennam',
-    'cliched',
-    'clindamycin',
-    'clogher',
-    'clothes-peg',
-    'cloughs',
-    'clubrep',
-    'clumsier',
-    'clunked',
     'clunking',
-    'cm-5',
-    'cma',
-    'cmhcs',
-    'cmip',
-    'cmrn',
-    'cni',
-    'co-debtor',
-    'co-development',
-    'co-host',
-    'coal-face',
-    'coalitionism',
-    'coalmine',
-    'coard',
-    'coberley',
-    'coble',
     'coccinea',
-    'coceres',
-    'coch&egrave;re',
-    'cochlear',
-    'coddling',
-    'codices',
-    'codsall',
-    'coeliacs',
-    'coelocentesis',
-    'coffee-break',
-    'coffin-like',
-    'cognacs',
-    'cohabited',
-    'coiffed',
-    'coigach',
-    'coil-tapped',
     'coilsfield',
-    'coleus',
-    'collison',
-    'colossae',
-    'columb',
-    'com.0',
-    'combatted',
-    'combustibles',
-    'comfits',
-    'coming-together',
-    'comite',
-    'commerciality',
-    'commissionaires',
-    'common-place',
-    'communalism',
-    'communed',
     'communicatively',
-    'communist-inspired',
-    'communistic',
-    'commutators',
-    'comores',
-    'compac',
-    'compadrazgo',
-    'comparators',
-    'compartmental',
-    'compartmentation',
-    'compated',
-    'compered',
-    'completer',
-    'compressibility',
-    'computer-using',
-    'computercraft',
     'comrade-in-arms',
-    'comshare',
-    'conacher',
-    'conca',
-    'conceptualisations',
-    'conciliated',
-    'concordes',
-    'concourses',
-    'condorcet',
-    'coneysthorpe',
-    'conflict-ridden',
-    'confusable',
-    'conk',
-    'conlan',
-    'consequentially',
-    'conservative-',
     'conservative-historians',
-    'conserves',
-    'consolatory',
-    'consonances',
-    'conspiration',
-    'consumer-goods',
-    'continuator',
-    'contraries',
-    'contrat',
-    'contusions',
-    'conv',
-    'conventicles',
-    'conventionalists',
-    'convery',
-    'cooking-holes',
-    'coos',
     'copernicans',
-    'coproduction',
-    'copy-protection',
-    'coquetry',
-    'cordell',
-    'corncrakes',
-    'corneas',
-    'cornerways',
-    'cornflower-blue',
-    'corniced',
-    'coronae',
-    'corporate-wide',
-    'corpus-based',
-    'correctives',
-    'corston',
-    'coruisk',
     'coses',
-    'cosin',
-    'cosmetically',
-    'costas',
-    'coster',
-    'coteaux',
-    'cotentin',
-    'cotoneaster',
-    'couching',
-    'couette',
-    'counter-proposal',
-    'counter-themes',
-    'counter-top',
-    'counterclaims',
-    'counterfeiter',
-    'counterfeits',
     'counterpulsation',
-    'counting-house',
-    'courtfield',
-    'cover-ups',
-    'coverall',
-    'coving',
-    'cowgate',
-    'coxal',
-    'coxcomb',
-    'cozydry',
-    'cp26',
-    'cp29',
-    'cp6',
-    'cr-edta',
-    'crabbing',
-    'crace',
     'crackington',
-    'crandall',
-    'cranford',
-    'crann',
-    'crannog',
-    'crapped',
-    'craps',
-    'crawlers',
-    'craythorn',
-    'crazy-paving',
-    'creasy',
-    'crecy',
-    'credit-rating',
-    'creeting',
-    'creon',
-    'crew-neck',
     'crianlarich',
-    'cribbins',
-    'criminalizing',
-    'crinkles',
-    'cris',
-    'crisis-ridden',
-    'crispbreads',
-    'crisscrossed',
-    'cromlech',
-    'cronus',
-    'crooking',
-    'croome',
-    'croons',
-    'cross-addiction',
-    'cross-cousin',
-    'cross-hatching',
     'cross-pollination',
-    'cross-species',
-    'cross-talk',
-    'cross-under',
-    'crowd-control',
-    'crowstep',
-    'crustose',
-    'cryonic',
-    'cscm',
-    'css',
-    'cuchulain',
-    'cuillins',
-    'cul-de-sacs',
-    'culex',
-    'cultists',
-    'cultivar',
     'culture-free',
-    'culverted',
-    'culworth',
-    'cumbrians',
-    'cumulation',
-    'cupitt',
-    'curlies',
-    'curmudgeon',
-    'curriculum-specific',
-    'curteys',
-    'cuskin',
-    'cussedness',
-    'customers.',
-    'customize',
-    'cut-and-dried',
-    'cutely',
     'cuttle',
-    'cuyp',
-    'cvt',
-    'cwa',
-    'cxd5',
-    'cyanogenic',
-    'cyclonic',
-    'cynan',
-    'czarnogursky',
-    'czechoslavakia',
-    'cziffra',
-    'd&amp;s',
-    'd&eacute;nouement',
-    'd\'agostino',
-    'd\'arcais',
-    'd\'entreprises',
     'd\'orl&eacute;ans',
-    'd-18',
-    'd-arginine',
-    'd.melanogaster',
-    'd.v.',
-    'd10+10',
-    'd11',
-    'd12',
-    'dafs',
-    'daftest',
-    'daguerre',
-    'dahlum',
-    'dahuk',
-    'dalat',
-    'dalkammoni',
-    'dallas-based',
     'damascus-based',
-    'damasks',
-    'dampish',
-    'dandavate',
-    'dangerous-looking',
-    'danica',
-    'danse_macabre',
-    'dansey',
-    'dansk',
-    'darbishire',
-    'dark-field',
-    'dark-grey',
-    'dark-rimmed',
-    'dark-room',
-    'darkling',
-    'darter',
     'dassett',
-    'dastmalchi',
-    'datafocus',
-    'datnoides',
-    'dato',
-    'daubs',
-    'dauphin&eacute',
-    'davidge',
-    'davyd',
-    'day-centre',
-    'day-dreams',
-    'dayniter',
-    'dazel',
-    'de-facto',
-    'de-recognition',
-    'dead-head',
     'deadlier',
-    'deaf-mutes',
-    'deaneries',
-    'death-warrant',
-    'deathtrap',
-    'debt-laden',
-    'debutants',
-    'decarbonisers',
-    'deceitfulness',
-    'decipherable',
-    'decison',
-    'decsystem',
-    'deductibility',
-    'deep-frozen',
-    'deeply-felt',
-    'defecated',
     'defecating',
-    'defiles',
-    'definate',
-    'definitives',
-    'deflowered',
-    'deflowering',
-    'degenhart',
-    'deidre',
-    'deion',
-    'deionised',
-    'deirans',
-    'deitch',
-    'delamotte',
-    'delian',
-    'delis',
-    'deloche',
     'delphinia',
-    'demand-management',
-    'demeaned',
-    'dementedly',
-    'demetrios',
-    'demises',
-    'demjanjuk',
-    'demme',
-    'democratizing',
-    'demokratische',
-    'demurs',
-    'demy',
-    'denarii',
-    'denervation',
-    'denness',
-    'denplan',
     'departement',
-    'deprecatory',
-    'depressant',
-    'deputizing',
-    'derivable',
-    'descaling',
-    'describers',
-    'deselect',
-    'design-and-society',
-    'despoil',
-    'deta',
-    'detective-constable',
-    'detlev',
-    'detonations',
-    'deusdedit',
-    'deutz',
     'dev&scedil;irme',
-    'devaney',
-    'deventer',
-    'device-independent',
-    'devourer',
-    'dewdrop',
-    'dewer',
-    'dexy',
-    'df=3',
-    'dgx',
-    'dharsono',
-    'diachronism',
-    'diagnostician',
-    'diamond-hard',
-    'diaphragms',
-    'diathesis',
     'dicentric',
-    'diconix',
-    'didactically',
-    'diehl',
-    'dierdrie',
-    'diesel-electric',
-    'differencing',
-    'digesta',
-    'diglossic',
-    'digraphs',
-    'dihydrocodeine',
-    'dilatational',
-    'dim-witted',
-    'dimanche',
-    'dimes',
-    'dimitris',
     'dimmers',
-    'dimpling',
-    'dinny',
-    'dins',
-    'diodoros',
-    'diomedes',
-    'dioscorides',
-    'dirty-tricks',
-    'disaffiliated',
-    'disbenefits',
-    'disbursing',
-    'discernibly',
-    'discounter',
-    'disinterestedness',
-    'disjunctions',
-    'dislikeable',
     'disseminators',
-    'dissimilatory',
-    'dissociative',
-    'district-wide',
-    'ditchley',
-    'ditferent',
-    'dith',
-    'diverticulosis',
-    'divot',
-    'dizzied',
-    'django',
-    'djibril',
-    'dli',
-    'dm1,000',
-    'dm2.38',
-    'dm2.80',
     'dmc',
-    'dmk',
-    'dniester',
-    'do-gooding',
-    'do-it',
-    'do-it-all',
-    'do215',
-    'dob',
-    'dockwray',
-    'doddy',
-    'doff',
-    'dohme',
-    'doin',
-    'dolcelatte',
-    'dolerite',
-    'dollar-denominated',
     'dolle',
-    'dollis',
-    'dolomitised',
-    'dolorous',
-    'domenica',
-    'domitila',
-    'dommie',
-    'don\'t.',
-    'donatello',
-    'donbass',
-    'donetsk',
-    'donuts',
-    'door-knob',
-    'door-knocker',
-    'dormand',
-    'dorsally',
     'doshi',
-    'dosith&eacute;e',
-    'double-',
-    'double-standard',
-    'doubleness',
-    'douglas-glyne',
-    'dow-stoker',
-    'dowdeswell',
-    'down-slope',
-    'downplaying',
-    'downturned',
-    'dowsed',
-    'dptc',
-    'drably',
-    'draftees',
-    'draftsmanship',
     'drawee',
-    'drd',
-    'dreadlocked',
-    'dreaminess',
-    'dreariest',
-    'dredgers',
-    'drescher',
-    'dressed-up',
-    'drest',
-    'drip-feed',
-    'drippin\'',
-    'driverless',
-    'dromedary',
-    'drosera',
-    'drownings',
-    'drug-dealers',
     'drug-running',
-    'drug-users',
-    'druidic',
-    'drum-kit',
-    'drumstick',
-    'dual-density',
-    'duales',
-    'dually',
-    'duckmanton',
-    'ducted',
-    'ductular',
-    'dulce',
-    'dundrod',
-    'dunghill',
-    'dunsdale',
-    'duplicata',
     'duplo',
-    'durbar',
-    'durbridge',
-    'durkacz',
-    'duro',
-    'durr&euml;s',
-    'durum',
-    'dust-covered',
-    'dusun',
-    'dutch-belgian',
-    'dwec',
-    'dyas',
-    'dymchurch',
-    'dyos',
-    'e&amp;s',
-    'e&ndash;f',
     'e-',
-    'e.f.',
-    'eanbald',
-    'ear-tufts',
-    'early-modern',
-    'earlys',
-    'earth-like',
-    'earthling',
-    'easen',
-    'easy-to-read',
-    'eatcl',
-    'eaterie',
-    'ebeling',
-    'ebf',
-    'ec-sponsored',
-    'ec3a',
     'ecclesfield',
-    'eckford',
-    'eco-system',
-    'ectoparasites',
-    'ector',
-    'edda',
-    'edgebone',
-    'edgington',
-    'edgsons',
-    'edita',
-    'editable',
-    'edmundo',
-    'edsel',
-    'eesa',
-    'effer',
-    'efficient-looking',
     'eg-2',
-    'egalitarians',
-    'egbt',
-    'eggy',
-    'ego-state',
-    'ego-states',
-    'eid',
-    'eight-bit',
-    'einon',
-    'eirena',
-    'eisa-based',
-    'ejc',
-    'ejector',
-    'eksund',
-    'elastomeric',
-    'elderflowers',
     'election.',
-    'electro-acoustics',
-    'electrocardiograms',
-    'electrocoagulation',
-    'electroneutral',
-    'electroporation',
-    'elefriends',
-    'elegies',
-    'elimelech',
-    'elixirs',
-    'ellenborough',
-    'elphick',
-    'elvis+',
-    'elwick',
-    'embarrassedly',
-    'embleton',
     'embolic',
-    'embossing',
-    'embrocation',
-    'emendations',
-    'emersed',
-    'emetics',
-    'emilion',
-    'emmel',
-    'emorian',
-    'emosi',
-    'employer-led',
-    'enchantingly',
-    'encumeada',
-    'encyclicals',
-    'end-december',
-    'end-june',
     'endorsee',
-    'endoscopes',
-    'energy-conscious',
-    'energy-efficiency',
-    'energy-producing',
-    'enescu',
-    'enge',
-    'engelberger',
-    'englands',
-    'english-educated',
-    'ennard',
-    'ennoblement',
-    'ennobling',
-    'enserfment',
-    'enshrouded',
-    'entlebuch',
     'entr&eacute;es',
-    'entrapping',
-    'enviroment',
-    'eof&num',
-    'epaulette',
-    'ephedrine',
-    'ephemeris',
-    'epicontinental',
-    'epigrammatic',
-    'epiphytic',
-    'episkopi',
-    'epithelioid',
-    'epoflex',
-    'epogam',
-    'epp',
-    'epsi',
     'eqs',
-    'equis',
-    'equorum',
-    'eradicates',
-    'erco',
-    'erdogan',
-    'ergoclient',
-    'ergopro',
-    'ericaceous',
-    'erm&aacute;n',
-    'errand-boy',
-    'erving',
-    'erythropoietin',
-    'es/9000s',
-    'esarn',
-    'escapologist',
     'escott',
-    'esmonde',
-    'et4000',
-    'ethanolic',
-    'etheldreda',
-    'ethelred',
-    'ethnic-minority',
-    'ethnographical',
-    'ethrington',
-    'eubacterial',
-    'euboian',
-    'euphemia',
-    'eur',
-    'eurasians',
-    'euridice',
-    'euroform',
     'eurolink',
-    'europartenariat',
-    'europen',
-    'eurostep',
-    'euthymides',
-    'eval',
-    'ever-larger',
-    'ever-more',
-    'ever-smiling',
-    'ever-tightening',
-    'everchanging',
-    'everhope',
-    'everythin\'',
-    'evidencing',
-    'evil-tempered',
-    'evincing',
     'evolvement',
-    'ewloe',
-    'ewos',
-    'ex-br',
-    'ex-ceb',
-    'ex-con',
-    'ex-convict',
-    'ex-employer',
-    'ex-governor',
-    'ex-great',
-    'ex-leaders',
-    'ex-liverpool',
-    'ex-miner',
-    'ex-ministers',
-    'ex-services',
-    'exasperatingly',
     'exceed/w',
-    'excellencies',
-    'exceptionalism',
-    'exch.',
-    'excisions',
-    'exclusio',
-    'exfoliate',
-    'exhibitionists',
-    'exogamy',
-    'expence',
-    'expenditure-reducing',
-    'expense-account',
-    'explicating',
-    'expositor',
-    'expostulate',
-    'extirpation',
     'extra-verbal',
-    'extravasation',
-    'eye-strain',
-    'eyestrain',
-    'ez',
-    'f&uuml;rstenberg',
-    'f(t)',
-    'f-type',
-    'f.i',
-    'f.i.',
-    'f.r.s',
-    'f508',
-    'f7b',
-    'fa.',
-    'fabb',
-    'fabers',
     'fabricates',
-    'face-masks',
-    'facelifts',
-    'facilitatory',
-    'facilites',
-    'factory-farming',
-    'fadele',
-    'faff',
-    'fagged',
-    'faglioni',
-    'fairhall',
-    'fairhurst',
-    'faisalabad',
-    'falaise',
-    'falcon-headed',
-    'falconers',
     'falsifies',
-    'family-oriented',
-    'family-planning',
-    'fan-assisted',
-    'fantasma',
-    'fare-paying',
-    'farenheit',
-    'farhi',
-    'farnaby',
-    'farsi',
-    'fassett',
-    'fast-approaching',
-    'fast-bowling',
-    'fast-medium',
-    'father-son',
-    'fauconberg',
     'faverdale',
-    'faximum',
-    'fearsome-looking',
-    'febres',
-    'feher',
-    'fein',
-    'feinberg',
-    'feisal',
-    'felder',
-    'felham',
-    'fellow-countryman',
-    'fellow-men',
-    'fellow-officers',
-    'fellwalking',
-    'felonious',
-    'fenby',
     'fends',
-    'ferman',
-    'fermenters',
-    'ferrando',
-    'ferroan',
-    'ferruzzi-montedison',
-    'ffr40',
-    'fhada',
-    'fibre-depleted',
-    'fibronics',
-    'fibrosing',
-    'fiction/concession',
-    'fidgets',
-    'fiefdom',
-    'field-marshal',
-    'field-workers',
     'fieldfares',
-    'fieldsman',
-    'fifty-foot',
-    'fifty-odd',
-    'figes',
-    'fight-back',
-    'filanta',
-    'filiformis',
-    'filles',
-    'filofaxes',
-    'filopodia',
-    'filtrate',
-    'fin-de-si&egrave;cle',
-    'finchback',
-    'finger-ends',
-    'fingerless',
     'finiteness',
-    'finnerty',
-    'fire-power',
-    'fireguards',
-    'firmlet',
-    'first-best',
-    'first-mover',
-    'firstperson',
-    'fish-and-chip',
-    'fishmeal',
-    'fistfuls',
-    'fitly',
-    'fitts',
-    'five-lever',
-    'five-stage',
-    'fiveish',
     'fkb',
-    'flame-haired',
-    'flame-thrower',
-    'flamininus',
-    'flappers',
-    'flashbulbs',
-    'flathead',
-    'flatulent',
-    'flaxley',
-    'fleapit',
-    'fledging',
-    'fleuve',
-    'flexi-time',
-    'flexibilities',
-    'flexible-price',
-    'flight-plan',
     'flnc',
-    'floor-level',
-    'floridly',
-    'flower-heads',
-    'fluid-filled',
-    'fluoridated',
-    'fluty',
-    'fluxgate',
-    'fly-halves',
-    'flyleaf',
-    'fo\'c\'sle',
-    'foale',
-    'fobs',
-    'fock',
-    'fog-bound',
-    'fogle',
     'fol',
-    'folger',
-    'folies-berg&egrave;re',
-    'folk-lore',
-    'folk-tales',
-    'fontevrault',
-    'foolhardiness',
-    'footcare',
-    'footsoldiers',
-    'footsteering',
-    'foral',
-    'force-field',
-    'forcefield',
-    'forearc',
-    'forefeet',
-    'foreknowledge',
     'forkfuls',
-    'forkhill',
-    'fornicate',
-    'fornicating',
-    'forsakes',
-    'forsyte',
-    'fortnights',
-    'fortran77',
-    'fortune-telling',
-    'forwardness',
-    'fos-core',
-    'fosten',
-    'fougeron',
-    'fountain-pen',
-    'founts',
-    'four-car',
     'four-engined',
-    'four-lane',
-    'four-note',
-    'four-pronged',
-    'four-sided',
-    'four-vectors',
-    'foyt',
-    'fr&oacute;thi',
-    'fraga',
-    'fraggle',
-    'frailest',
-    'franchi',
-    'franglais',
-    'franti&scaron;kovy',
-    'fratelli',
-    'frawley',
     'freckle',
-    'freebody',
-    'freighting',
-    'frenchness',
-    'frenzies',
-    'freres',
-    'fres',
-    'friedel',
-    'friedler',
-    'frights',
-    'frivolities',
-    'frock-coat',
-    'froment',
-    'front-room',
-    'front-seat',
-    'froyle',
     'fruited',
-    'fruitfly',
-    'ftse100',
-    'ftx',
-    'full-cost',
-    'full-employment',
-    'full-stop',
-    'full-text',
-    'fully-integrated',
-    'fumigate',
-    'fumio',
-    'funar',
-    'funder',
-    'funhouse',
-    'furbank',
-    'furie',
     'furring',
-    'furthermost',
-    'fus',
-    'fuschl',
-    'fusspot',
-    'futurebus+',
-    'fy',
-    'fyn',
-    'fyodor',
-    'g&ouml;teborg',
-    'g(&ogr)',
-    'g+c',
-    'g-15',
-    'g.p.o.',
-    'g/24',
-    'gabi',
     'gadebridge',
-    'gaily-coloured',
-    'gajewski',
-    'galactose',
-    'galant',
-    'galanter',
-    'galassi',
-    'galks',
-    'gallan',
-    'gallica',
-    'gallois',
-    'galpin',
-    'gamages',
-    'game-show',
-    'gamp',
-    'gandy',
     'ganga',
-    'ganger',
-    'ganguly',
-    'gansu',
-    'garau',
-    'garbh',
-    'gari',
-    'garimpeiros',
-    'garlick',
-    'garling',
-    'garrad',
-    'gartside',
-    'gasanov',
-    'gasfield',
-    'gaskill',
-    'gaskins',
     'gasson',
-    'gastrostomy',
-    'gatevalve',
-    'gatevalves',
-    'gator',
-    'gaucherie',
-    'gayer',
-    'gayness',
-    'gazala',
-    'gazetted',
-    'gazi',
-    'gbadolite',
-    'gcvo',
-    'gd-fm',
-    'geddis',
-    'geelong',
     'gehry',
-    'geistliche',
-    'gekko',
-    'gelsemium',
-    'gena',
-    'genitor',
-    'genovese',
-    'gentles',
-    'genuflect',
-    'geo-political',
-    'geodemographics',
-    'geoffroi',
-    'georgia-based',
-    'geosciences',
-    'geosynclinal',
-    'gerdy',
     'germ-line',
-    'germain-en-laye',
-    'germiston',
-    'gerrie',
-    'gerring',
-    'gers',
-    'gertler',
-    'gesticulate',
-    'get-away',
-    'get_a',
-    'ghislaine',
-    'ghz',
-    'giallombardo',
-    'gibber',
-    'gibbets',
-    'gibraltarian',
     'gibraltarians',
-    'gierek',
-    'gifs',
-    'giga',
-    'gigantism',
-    'giggleswick',
-    'gilfach',
-    'gillham',
-    'gillner',
-    'giltwood',
-    'gilvan',
-    'gini',
-    'giorgis',
-    'gissi-2',
-    'gittin\'',
-    'giulini',
     'giv',
-    'gk',
-    'gladhouse',
-    'glaisdale',
-    'glamorisation',
-    'glanton',
-    'glanvill',
-    'glasgow-born',
-    'glass-roofed',
-    'glasse',
-    'glauber',
-    'gleave',
-    'gleitman',
-    'glenand',
-    'gless',
-    'glibenclamide',
     'glim',
-    'gln',
-    'glorifies',
-    'glovebox',
-    'gls',
-    'glucocorticoids',
-    'gly-extended',
-    'glycosidic',
-    'gma',
-    'gmurzynska',
-    'gnashed',
-    'gnathostome',
-    'go-faster',
-    'goacher',
-    'goal-bound',
-    'goal-oriented',
     'godawful',
-    'godchild',
-    'godfrey-isaacs',
-    'godwins',
-    'godwits',
-    'goffs',
-    'golani',
-    'goldfields',
-    'goldwork',
-    'goleniewski',
-    'golist',
-    'gombojavyn',
-    'gomme',
-    'goncourt',
-    'gondal',
-    'gonny',
     'gonococci',
-    'gonzaga',
-    'goo-goo',
-    'good-morning',
-    'goodish',
-    'goodson-wickes',
-    'goodwin/cheltenham',
-    'goof',
-    'googie',
-    'goosepimples',
-    'goosey',
-    'gordievsky',
-    'gordillo',
-    'gore-text',
-    'gorengs',
-    'goretex',
     'gorevan',
-    'gorgonians',
-    'gorki',
-    'gorst',
-    'gorz',
-    'gosip',
-    'gossels',
-    'gotrek',
-    'goukouni',
-    'gourley',
-    'governors-general',
-    'goyigamas',
-    'gozzard',
-    'gp14',
-    'graal',
-    'gracelessly',
     'graduations',
-    'graham-scott',
-    'grain\'',
-    'gramoz',
-    'grand-daughters',
-    'granda',
-    'grandparenthood',
-    'grandsire',
-    'grannell',
-    'grant-awarding',
-    'grantchester',
-    'granulifera',
-    'grapeshot',
-    'grass-like',
-    'grasscloth',
-    'grasse',
     'greases',
-    'great-grandad',
-    'great-russian',
-    'greatest-ever',
-    'greathaven',
-    'greentree',
-    'greenyards',
-    'gregori',
-    'greguric',
-    'grendel',
-    'grenfells',
-    'gresty',
-    'greybeard',
-    'greywackes',
-    'griegi',
-    'griess',
     'grigsby',
-    'grinling',
-    'grisebach',
-    'groomsman',
-    'grose',
-    'grote',
-    'ground-nuts',
-    'ground-plan',
-    'ground-to-air',
-    'groundsmen',
-    'group-living',
-    'groupers',
-    'grozny',
-    'grundrisse',
-    'gslp',
-    'gss',
     'gt40',
-    'gta',
-    'guard-room',
-    'guedron',
-    'guffawing',
-    'guide-posts',
-    'guineans',
-    'guitar-based',
-    'gull-like',
-    'gumbs',
-    'gunmint',
-    'gunslingers',
-    'gunsmiths',
-    'gunton',
-    'guntrip',
-    'gunung',
     'gurle',
-    'guzman',
-    'gvhd',
-    'gwad',
-    'gx-7',
-    'h-2',
-    'h8+',
-    'haacke',
-    'haag',
-    'habited',
-    'hackfall',
-    'hackness',
-    'hackwood',
-    'hadfields',
-    'hadhramaut',
-    'haematocrit',
     'haggadah',
-    'hagman',
-    'haining',
-    'hair-roughened',
-    'hairiness',
-    'hairlines',
-    'haitch',
-    'hakkari',
-    'haldon',
-    'half-',
-    'half-amused',
-    'half-bottles',
-    'half-laughing',
-    'half-listening',
-    'half-mad',
-    'half-nine',
     'half-pound',
-    'half-raised',
-    'half-round',
-    'half-serious',
-    'half-sleep',
-    'half-smiled',
-    'half-tester',
-    'halkett',
-    'hallery',
-    'hallucinate',
-    'halteres',
-    'halyards',
-    'hamley',
-    'hammerhead',
-    'hamo',
-    'hampshires',
     'hamud',
-    'hand-drawn',
-    'hand-grip',
-    'hand-me-downs',
-    'hand-shaking',
-    'hand-washing',
-    'handbuilt',
-    'handymen',
-    'hanse',
-    'happ',
-    'haram',
-    'hard-top',
-    'hardaker',
-    'hardboiled',
-    'hardwired',
-    'haris',
     'haritos-fatouros',
-    'harken',
-    'harlay',
-    'harley-davidson',
-    'harmlessness',
-    'harmonizes',
-    'harpsichordist',
-    'hartfield',
-    'hartnett',
-    'hartshill',
-    'hartz',
-    'hasbro',
-    'haseley',
-    'hassanal',
-    'hatchments',
-    'hate-filled',
     'haters',
-    'hauge',
-    'haverstock',
-    'hawed',
-    'hawk-faced',
-    'hawkings',
-    'hawksbill',
-    'hawthornden',
-    'haycraft',
-    'hayes-drummond',
-    'haytime',
-    'hazar',
-    'hazelbury',
-    'hazlehead',
-    'hcrc',
-    'hcv',
     'hde',
-    'head-butted',
-    'head-butting',
-    'head-complement',
-    'head-down',
-    'head-high',
-    'head-injured',
-    'headbutting',
-    'headrail',
-    'heaith',
-    'heart-attack',
-    'heartrending',
-    'heat-sensitive',
-    'hebraic',
-    'hedger',
-    'hedingham',
     'hedonic',
-    'heep',
-    'hegedus',
-    'heigh',
-    'heike',
-    'heiligenschwendi',
-    'heimendorf',
-    'heintz',
-    'helby',
-    'helianthemum',
-    'hellawell',
-    'hellbent',
-    'helpdesk',
-    'helpmann',
-    'hely',
-    'hematite',
     'hemicolon',
-    'hendrickson',
-    'hendriks',
-    'heneson',
-    'henley-nederland',
-    'henrys',
-    'hepar',
-    'heparinised',
-    'hepaticojejunostomy',
-    'hephaestus',
-    'herbals',
-    'hereditaments',
-    'heregulins',
-    'heritors',
-    'herland',
-    'hermon',
     'herold',
-    'herringbroom',
-    'herts.',
-    'hesione',
-    'heston-francois',
-    'heterocyclic',
-    'hetton-le-hole',
-    'heviz',
-    'hexam',
-    'hexes',
-    'heyer',
-    'heys',
-    'hicklin',
-    'high-affinity',
-    'high-efficiency',
-    'high-hab',
     'higher-quality',
-    'higher-than-average',
-    'highly-qualified',
-    'hight',
-    'highton',
-    'hikmatyar',
-    'hikmet',
-    'hilde',
-    'hilgard',
-    'hillocky',
-    'hinterglemm',
-    'hipparchus',
-    'hippest',
-    'hirschl',
-    'hist',
-    'historiated',
     'historiques',
-    'hiving-off',
-    'hlh-z',
-    'hnv',
-    'hobbles',
-    'hobley',
-    'hodgkins',
-    'hogue',
-    'holger',
-    'holi',
-    'hollers',
-    'holmsly',
-    'holsteins',
-    'hombre',
-    'homeo',
-    'homeworks',
     'hominoidea',
-    'homoeopaths',
-    'homogenization',
-    'homophonous',
-    'homosocial',
-    'honcho',
-    'honister',
-    'hoofbeats',
-    'hookah',
-    'hookean',
-    'hookworms',
-    'hoole',
-    'hoopoe',
-    'hopa',
-    'hora',
-    'horizontality',
     'horn-rims',
-    'horrifyingly',
-    'hors-d\'oeuvre',
-    'horse-shoe',
-    'horticulturalists',
-    'horton/oxford',
-    'hossack',
-    'hostal',
-    'hot-bed',
-    'hotshots',
-    'hounam',
-    'hourly-paid',
-    'house-buying',
-    'house-husband',
-    'house-martins',
-    'housebote',
     'houseparty',
-    'housewifely',
-    'howff',
-    'hs5a',
-    'hsfp',
-    'huarache',
-    'hubristic',
-    'hulled',
-    'humanisation',
-    'humanised',
-    'humbucking',
-    'humo',
-    'humourlessly',
-    'humpage',
-    'hundred-odd',
-    'hunting-lodge',
     'hurricane-force',
-    'hurstdown',
-    'hurston',
-    'husbanded',
-    'huskier',
-    'huskiness',
-    'hussites',
-    'hutted',
-    'hybridises',
-    'hybridoma',
-    'hydrofoils',
-    'hydrogen-bond',
-    'hydrogens',
-    'hydrolysate',
-    'hydronephrosis',
-    'hydroponics',
     'hydroquinone',
-    'hyemalis',
-    'hymnals',
-    'hypercholecystokininaemia',
-    'hyperhelp',
-    'hyperlipidaemic',
-    'hypocalcaemia',
-    'hypochlorous',
-    'hypochondriacal',
-    'hypochondriacs',
-    'hypothesizing',
-    'hystery',
-    'hytner',
-    'i-i',
-    'i-iv',
-    'iac',
     'ibu',
-    'ic4',
-    'ic5',
-    'ic6',
-    'icams',
-    'ice-breaker',
-    'ice-white',
-    'ichkeul',
-    'ichor',
-    'ickle',
-    'icrdg',
-    'idolise',
-    'ieep',
-    'ifac',
-    'ifad',
-    'igbo',
     'igfet',
-    'igg3',
-    'ign&aacute;c',
-    'ignalina',
-    'ignimbrite',
-    'igsf',
-    'ii*',
-    'iie',
-    'ilana',
-    'ilaria',
-    'ill-disguised',
-    'ill-fed',
-    'ill-fitted',
-    'ill-humour',
-    'ill-looking',
-    'illman',
     'illocution',
-    'ima',
-    'image-makers',
-    'image/sql',
-    'imagesetter',
-    'imagists',
-    'imbrium',
-    'imbues',
-    'imdec',
-    'imf-backed',
-    'immolation',
-    'immunostained',
-    'impenetrability',
-    'impersonated',
-    'impingement',
-    'implementable',
     'importations',
-    'imprecation',
-    'impregnating',
-    'impresarios',
-    'impressiveness',
-    'imprisonable',
-    'impugning',
-    'in\'',
-    'in-camera',
-    'inactivating',
-    'inamorata',
-    'inanimates',
-    'inbetween',
-    'inbucon',
-    'incantatory',
-    'incapability',
     'incarnates',
-    'income-expenditure',
-    'incorrigibility',
-    'incuriously',
-    'ind.',
-    'inday',
-    'indecorous',
-    'indicum',
-    'indie-dance',
-    'indissolubility',
-    'individuates',
-    'indo-pacific',
-    'indoctrinating',
-    'indolently',
-    'inducer',
-    'inebriate',
     'infanta',
-    'infarctions',
-    'infectiously',
-    'infiltrative',
-    'infra-structure',
-    'infrasonic',
-    'ingarden',
-    'iniki',
-    'inkwells',
-    'innervates',
-    'inniskeen',
-    'innovatively',
-    'inoculator',
-    'insider-outsider',
-    'instar',
-    'instem',
     'instruction-multiple',
-    'intactness',
-    'intae',
-    'integris',
-    'intelloids',
-    'inter-communal',
-    'inter-male',
-    'inter-ministerial',
-    'interannual',
-    'interethnic',
-    'interfaith',
-    'interferon-&ggr',
-    'interlined',
-    'intermarry',
-    'intermedii',
-    'interments',
     'intermodal',
-    'intermontane',
-    'internetwork',
-    'interparliamentary',
-    'interrelating',
-    'interrogates',
-    'interrogatives',
-    'interrupters',
-    'intersperse',
-    'intesoft',
-    'intima',
-    'intor',
-    'intra-market',
-    'intra-organizational',
-    'intra-trade',
-    'intracellularly',
     'intracerebral',
-    'intragastrically',
-    'intraocular',
-    'intriguer',
-    'intros',
-    'inverters',
-    'irans',
-    'ireby',
-    'iron-bleomycin',
-    'iron-on',
-    'iron-studded',
-    'iron-working',
-    'irremovable',
-    'irrespective',
-    'irtysh',
-    'irvinestown',
     'isa.',
-    'isadore',
-    'iseult',
-    'isha',
-    'isidoro',
-    'isis-3',
-    'ismet',
-    'isocaloric',
-    'isoenzymes',
-    'isomerisation',
-    'isotactic',
-    'isotropy',
-    'israeli-backed',
-    'issam',
-    'issey',
-    'issueless',
     'itsa',
-    'itsfea',
-    'itxassou',
-    'ivas',
-    'ivth',
-    'ivybridge',
-    'izza',
-    'j&eacute;sus',
-    'j(t)',
-    'j.b.s.',
-    'j.k.',
-    'j.r.',
-    'jackson-vanik',
-    'jacs',
-    'jacuzzis',
-    'jags',
     'jairus',
-    'jaleel',
-    'jamaat',
-    'jamesons',
-    'jandel',
-    'janna',
-    'jardim',
-    'jardy',
-    'jarlath',
-    'jarlshof',
-    'jarrod',
-    'javelins',
-    'jawaharlal',
-    'jawlensky',
-    'jazz-rock',
-    'jejune',
     'jelling',
-    'jes&uacute;s',
-    'jet-set',
-    'jetfoil',
-    'jetlag',
-    'jetliner',
-    'jihan',
-    'jingsheng',
-    'jinking',
-    'jma',
-    'jo\'burg',
-    'jobseeker',
-    'joely',
-    'jojoba',
-    'jolitz',
-    'josip',
     'journalese',
-    'journeyings',
-    'jousts',
-    'joynt',
-    'jp233',
-    'jpr',
-    'jtc',
-    'judean',
-    'judeo-christian',
-    'judgeships',
-    'jungly',
-    'juniperus',
-    'junk-shop',
-    'justifiability',
-    'k&auml;hler',
-    'k&eacute;pi',
     'k.g.',
-    'k/u',
-    'kabuki',
-    'kachcheri',
-    'kaere',
-    'kafala',
-    'kageneck',
-    'kalinin',
-    'kallisher',
-    'kallman',
-    'kalv',
-    'kamalian',
-    'kamco',
-    'kamel',
-    'kamm',
-    'kanamycin',
     'kanun',
-    'karamazov',
-    'karoui',
-    'karrass',
-    'karyotype',
-    'karystos',
-    'kas',
-    'kasdan',
-    'kassa',
-    'kauffmann',
-    'kaurismaki',
-    'kazimiera',
-    'kdf9',
-    'kdu',
-    'keebler',
-    'keepnet',
     'kees',
-    'keira',
-    'kelfazin',
-    'kelims',
-    'kerb-crawling',
-    'kernal',
-    'kerning',
-    'kertesz',
-    'kessel',
-    'ketoacidosis',
-    'ketone',
-    'ketura',
-    'keukenhof',
-    'khabarovsk',
-    'khanates',
-    'khedda',
     'khiva',
-    'kickback',
-    'kickin\'',
-    'kiff/reporting',
-    'kilbowie',
-    'killamarsh',
-    'killas',
-    'killingholme',
-    'killip',
-    'kilocalories',
-    'kilometer',
-    'kilsby',
-    'kingmambo',
-    'kinmond',
-    'kirlian',
-    'kisumu',
     'kiszko',
-    'kit-kats',
-    'kitchen-sink',
-    'kitchen/breakfast',
-    'kitchenmaid',
-    'kite-flying',
-    'kiting',
-    'kitovani',
-    'kittel',
-    'kixx',
-    'kjhg',
-    'klammer',
-    'kleeli',
-    'klick',
-    'klinitsky-klein',
-    'kmfdm',
     'kn&uacute;tsdr&aacute;pa',
-    'knamber',
-    'knavish',
-    'kneelers',
-    'knighting',
-    'knipe',
-    'know-it-all',
-    'knowland',
-    'known-item',
-    'knowynge',
-    'knuckleduster',
-    'knuckledusters',
-    'kodachrome',
-    'koi-keepers',
-    'koichi',
-    'kool',
     'korai',
-    'koussevitzky',
-    'kozma',
-    'kpp',
-    'krazy',
-    'krebs-ringer',
-    'kribs',
-    'kristy',
-    'kronecker',
-    'kropivnitsky',
-    'krugerrands',
-    'krugier',
-    'krumbein',
-    'krushchev',
-    'krystyna',
-    'kss',
     'kuantan',
-    'kulik',
-    'kulturstiftung',
-    'kununurra',
-    'kupa',
-    'kupka',
-    'kurf&uuml;rstendamm',
-    'kurosawa',
-    'kush',
-    'kushner',
-    'kwan',
-    'kwvr',
-    'kydonia',
-    'kynoch',
-    'kythera',
-    'kyung',
     'l&aacute;szl&oacute',
-    'l&amacr;l',
-    'l&amacr;la',
-    'l\'',
-    'l\'abbaye',
-    'l\'enfant',
-    'l\'esprit',
-    'l-15',
-    'l-plates',
-    'l.c.m.',
-    'l.l.',
-    'l.p.',
-    'l.p.g.a.',
-    'l.s.',
-    'l.t.e.',
-    'l8',
     'l9',
-    'laager',
-    'laba',
-    'lability',
-    'labium',
-    'lachin',
-    'lachrymose',
-    'laconia',
-    'ladjang',
-    'lado',
-    'ladyfriend',
-    'laertes',
-    'laetrile',
-    'laff',
-    'lafond',
-    'lakshmi',
     'lamartine',
-    'lambast',
-    'lambsdorff',
-    'lamda',
-    'lamella',
-    'lammermoor',
-    'lampsilis',
-    'lamy',
-    'lana',
-    'lanatus',
-    'lancets',
-    'land-dwelling',
-    'landesbank',
-    'landmines',
-    'langoustines',
-    'language-systems',
     'lanisticola',
-    'larchfield',
-    'larded',
-    'large-eyed',
-    'largescale',
-    'larkcom',
-    'lasciviously',
-    'laserwave',
-    'lassa',
-    'lata',
-    'late-age',
-    'late-flowering',
-    'late-nineteenth',
-    'laubscher',
-    'lauchhammer',
-    'lavatera',
     'laventhol',
-    'lavvu',
-    'law-codes',
-    'lawn-mowers',
-    'laxer',
-    'laybys',
-    'layne',
-    'lazards',
-    'lazaroni',
-    'lazier',
-    'leachate',
-    'lead-time',
-    'leaf-people',
-    'learie',
-    'learning/teaching',
-    'least-significant',
     'leathern',
-    'lecture-room',
-    'ledgered',
-    'leduc',
-    'leece',
-    'leeder',
-    'lefortovo',
-    'left-footed',
-    'left-half',
-    'left-liberal',
-    'leg-pulling',
-    'legasov',
-    'legspin',
-    'leigh-on-sea',
-    'leinen',
-    'leintwardine',
     'lemme',
-    'lemming-like',
-    'lendrem',
-    'lendri',
-    'leonards-on-sea',
-    'lepkin',
-    'less-skilled',
-    'let-off',
-    'lettable',
-    'letter-boxes',
-    'levator',
-    'leverkusen',
-    'leveson',
-    'levitical',
-    'lewdness',
-    'lexmark',
     'lh-s',
-    'lhs',
-    'libber',
-    'liberationist',
-    'liberians',
-    'libertad',
-    'licencee',
-    'licit',
-    'lidless',
-    'lifeform',
-    'lifespan&mdash;pi.log',
-    'lifeworld',
-    'lig',
-    'light-emitting',
-    'lightheartedness',
-    'lights-out',
     'lightweights',
-    'lily-livered',
-    'limbrick',
-    'lime-washed',
-    'limited-over',
-    'limned',
-    'limosa',
-    'limp-wristed',
-    'lims',
-    'lincrusta',
-    'lindley/thames',
-    'linen-draper',
-    'lint-free',
-    'lipaemia',
-    'lipkin',
-    'lipocytes',
     'liquefying',
-    'liquid-cooled',
-    'lisped',
-    'list&mdash;complete&mdash;root&mdash;package',
-    'listenership',
-    'lit-up',
-    'literaria',
-    'literary-critical',
-    'literates',
-    'little-uns',
-    'living_room',
-    'livorno',
-    'llanfairfechan',
-    'llangynog',
-    'llansteffan',
-    'llmas',
     'lobber',
-    'lobsang',
-    'lobworm',
-    'localizing',
-    'lochmaben',
-    'lock-outs',
-    'lockage',
-    'loco-hauled',
-    'lodestar',
-    'lodi',
-    'log&mdash;file',
-    'logarithmically',
-    'loggias',
-    'logwood',
-    'loin-cloth',
-    'loincloths',
     'loke',
-    'lombardic',
-    'long-barrelled',
-    'long-bladed',
-    'long-house',
-    'long-netting',
-    'long-on',
-    'long-past',
-    'long-stop',
-    'long-wheelbase',
-    'long-winged',
-    'longbows',
-    'longbright',
-    'longer-distance',
-    'longest-lived',
-    'longifolia',
     'longridge',
-    'longstone',
-    'longton',
-    'longueurs',
-    'look-see',
-    'loomis',
-    'loop-in',
-    'loosehead',
-    'loosestrife',
-    'loperamide-n-oxide',
-    'loriston-clarke',
-    'lorrain',
-    'lorry-loads',
-    'lost-wax',
-    'loverin',
-    'lovey-dovey',
     'lovo',
-    'low-dose',
-    'low-mass',
-    'low-rent',
-    'low-roofed',
-    'low-sodium',
-    'lower-working-class',
-    'lowest-paid',
-    'loya',
-    'luath',
-    'lubomir',
-    'luci',
-    'luddesdown',
-    'ludger',
-    'lugt',
-    'luke-warm',
     'lulworth',
-    'lumens',
-    'lundman',
-    'lunedale',
-    'lur',
-    'lushly',
-    'luthier',
-    'luxmoore',
-    'lyallie',
-    'lychees',
-    'lycian',
-    'lydie',
-    'lys23',
-    'lythe',
-    'm&aacute;laga',
-    'm&amp;sup-3',
     'm&eacute;nage_&agrave_trois',
-    'm&ouml;lln',
-    'm.spretus',
-    'm.y',
-    'm23',
-    'maaloy',
-    'mac-like',
-    'macchio',
-    'machine-independent',
-    'machten',
-    'macier',
-    'mackarness',
-    'mackeith',
-    'mackin',
-    'maclaren/reporting',
-    'maclaurin',
     'macoutes',
-    'macpaint',
-    'macrocells',
-    'madams',
-    'madan',
-    'madariaga',
-    'madchester',
-    'madgwick',
-    'madley',
-    'maevius',
-    'magdala',
-    'magics',
-    'magnums',
-    'mahout',
-    'mailboxes',
-    'maillot',
     'mairhi',
-    'maistre',
-    'majorette',
-    'makarios',
-    'makarov',
-    'makarova',
-    'makhkamov',
-    'makoto',
-    'maladroit',
-    'malawis',
-    'maldive',
-    'male-specific',
-    'mallins',
-    'malti',
-    'malty',
-    'mam\'selle',
     'man-about-town',
-    'man-based',
-    'man-rider',
-    'man-sin',
-    'manby',
-    'mandle',
-    'manifestoes',
-    'manipulatory',
-    'mannose',
-    'manohar',
-    'mantling',
-    'manupur',
-    'manus',
-    'marbury',
-    'mardakert',
-    'margarets',
     'market-places',
-    'markets.',
-    'markovitch',
-    'marla',
-    'marmoset',
-    'marpole',
-    'marsala',
-    'marshes.',
-    'marsilid',
-    'marstons',
-    'martinelli',
-    'martov',
-    'maryann',
-    'mascall',
-    'mascarade',
-    'masie',
     'mass-circulation',
-    'masseur',
-    'masseurs',
-    'massey-ferguson',
-    'massi',
-    'massiveness',
-    'massu',
-    'master/slave',
-    'mastication',
-    'matchman',
-    'matchwood',
-    'materialization',
-    'mathcad',
-    'matos',
-    'matric',
-    'mattison',
     'matyre',
-    'mauban',
-    'mauretania',
-    'mausolus',
-    'maynard-smith',
-    'mayorships',
-    'mazankowski',
-    'mazzaro',
-    'mbas',
-    'mbi',
-    'mboya',
-    'mc200s',
-    'mcauslan',
-    'mcburney',
-    'mccarty',
-    'mcclatchey',
     'mccrae',
-    'mccue',
-    'mcdade',
-    'mced',
-    'mcewans',
-    'mcgavin',
-    'mcgettigan',
-    'mcglynn',
-    'mcgreal',
-    'mckernan',
-    'mckoi',
-    'mclarens',
-    'mcnall',
-    'mcphail',
-    'mcquillan',
-    'mcvities',
     'mcvurich',
-    'mcwalter',
-    'mdm',
-    'meagrely',
-    'mean-variance',
-    'meane',
-    'meaning-nn',
-    'meat/mate',
-    'mechatronics',
-    'mediastinum',
-    'medicaments',
-    'medicolegal',
-    'medicus',
-    'mediolanum',
-    'medium-pace',
-    'medium-scale',
     'medlab',
-    'megacad',
-    'megatrends',
-    'meham',
-    'mehran',
-    'meinhof',
-    'melaugh',
-    'melker',
-    'mell',
-    'melodically',
-    'melun',
-    'memorandums',
-    'men.',
-    'meneses',
-    'menninger',
-    'menservants',
     'menwith',
-    'mephitic',
-    'mercereau',
-    'mercouri',
-    'mergus',
-    'merionethshire',
-    'merkin',
-    'merriam',
-    'merseysider',
-    'meskhetians',
-    'meslier',
-    'mesmerism',
-    'mesnel',
-    'meso-',
-    'messenia',
-    'mestizos',
     'metal-framed',
-    'metal-workers',
-    'metamorphosen',
-    'metaphysician',
-    'meteosat',
-    'methode',
-    'methylanthranilate',
-    'meting',
-    'metres.',
-    'metroland',
-    'metsing',
-    'mett',
-    'mevlana',
-    'mexicana',
-    'mg/m',
-    'mgp',
     'mgs',
-    'mhairi',
-    'mhs',
-    'michal',
-    'mickiewicz',
-    'micro-organism',
-    'micro-processor',
-    'micro-second',
-    'micro-surgery',
-    'microkernels',
-    'microparticles',
-    'mid-1880s',
-    'mid-1986',
-    'mid-1995',
-    'mid-cretaceous',
-    'mid-priced',
     'mid-second',
-    'mid-spring',
-    'mid-stride',
-    'mid-third',
-    'midair',
-    'midbrain-hindbrain',
-    'middle-east',
-    'middlesboro',
-    'middlesbrough-born',
-    'midlander',
-    'midmorning',
-    'midori',
-    'midradially',
-    'might-have-been',
-    'miklos',
-    'milch',
     'milesians',
-    'milic',
-    'military-backed',
-    'millbottom',
-    'millenarianism',
-    'millgate',
-    'millibars',
-    'million-a-year',
-    'mind-expanding',
-    'mineral-rich',
-    'mini-album',
-    'mini-conglomerate',
-    'mini-rugby',
-    'miniskirt',
-    'minshuku',
-    'minuteman',
     'mip-tv',
-    'mipcom',
-    'miroslaw',
-    'mirror-like',
-    'mirror/sporting',
-    'mischievousness',
-    'misclassification',
-    'miscued',
-    'misfeasance',
-    'misfiring',
-    'misidentification',
-    'misperception',
-    'mispronounced',
-    'mistley',
-    'mistrial',
-    'mitchison',
     'mither',
-    'mithraic',
-    'mitring',
-    'mixed-sex',
-    'mixture-of-distributions',
-    'mizoram',
-    'mj',
-    'mk9',
-    'ml/h',
-    'mlt',
-    'mmc\'s',
-    'mnc',
-    'mobius',
-    'moderner',
-    'module-sub-type-is',
-    'mogae',
     'mogridge',
-    'mohajir',
-    'moiled',
-    'moisture-retentive',
-    'molehill',
-    'moleyears',
-    'molins',
-    'mollycoddled',
-    'moltmann',
-    'mome',
-    'momently',
-    'momper',
-    'monahan',
-    'mondragon',
-    'moneylending',
-    'monicker',
     'monochemotherapy',
-    'monochromes',
-    'monoline',
-    'monozygous',
-    'montacute',
-    'montaner',
-    'montenay',
-    'montes',
-    'montjuic',
-    'montmirail',
-    'moonrise',
-    'moore/gloucestershire',
-    'moraceae',
-    'morainic',
-    'morais',
-    'morceli',
     'mordovia',
-    'mormaers',
-    'morna',
-    'morphologist',
-    'morrie',
-    'mortaria',
-    'mortician',
-    'mortlock',
-    'morus',
-    'morwenstow',
-    'mosambiki',
-    'moshinsky',
-    'mosm/kg',
-    'mossycop',
-    'mothered',
-    'mothers-to-be',
     'motormouth',
-    'mould-made',
-    'moulinex',
-    'mounties',
-    'mountney',
-    'mountpelier',
-    'movie-makers',
-    'mozambicans',
-    'mozzer',
-    'mp/health',
-    'mpgs',
-    'mrcvs',
-    'msyn',
-    'mtcr',
-    'mtd',
-    'mua',
     'muck-raking',
-    'mud-slinging',
-    'muddies',
-    'mudslide',
-    'mufaro',
-    'muffs',
-    'muhsin',
-    'mui',
-    'muite',
-    'mul',
-    'mulatto',
-    'mulish',
-    'mullett',
-    'mullion',
-    'mulls',
-    'multi-country',
     'multi-gym',
-    'multi-headed',
-    'multi-locational',
-    'multi-protocol',
-    'multicolour',
-    'multiform',
-    'multilanguage',
-    'multiparous',
-    'multipartyism',
-    'multipotential',
-    'mumblings',
-    'munchies',
-    'mundy',
-    'munstead',
-    'murav\'ev',
-    'murdani',
     'murdoch/gloucestershire',
-    'murkiness',
-    'muscovado',
-    'musettes',
-    'music-lovers',
-    'musicologists',
-    'muslim-led',
-    'mussed',
-    'musso',
-    'mustache',
-    'mustiness',
-    'mutawas',
-    'mutti',
-    'mutualistic',
-    'myalgia',
-    'myalgic',
     'myelodysplasia',
-    'myerscough',
-    'myint',
-    'mynd',
-    'myrtillus',
-    'myself.',
-    'mystere',
-    'mythopoeic',
-    'n\'zau',
-    'n.d',
-    'n.e.2d',
-    'n.m.r.',
-    'n=23',
-    'naah',
-    'naan',
-    'nabb',
     'nadim',
-    'nadph',
-    'nagorny-karabakh',
-    'nahco',
-    'naidu',
-    'nailbiting',
-    'nallet',
-    'name-calling',
-    'name-dropping',
-    'nanaimo',
-    'nandi',
-    'nanomolar',
-    'naperville',
-    'narrowboat',
-    'narrowboats',
-    'nasohypophysial',
     'natural-history',
-    'naturalising',
-    'naturism',
-    'nauruan',
-    'navels',
-    'nazeing',
-    'nazer',
-    'nbi',
-    'nbt',
-    'ncmd',
-    'nda',
-    'ne\'er-do-well',
-    'ne1',
-    'neapolitans',
-    'near-certain',
-    'near-hysterical',
     'nebe',
-    'nebuliser',
-    'necessitous',
-    'neckbands',
-    'necromundans',
-    'neel',
-    'nefertari',
-    'neferukhebit',
-    'nehushtah',
-    'nejm',
-    'nematic',
-    'neo-confucian',
-    'neo-populist',
-    'neoterminal',
-    'nepeta',
-    'nepos',
     'nepotistic',
-    'neroche',
-    'nerve-ending',
-    'nerve-glove',
-    'nessun',
-    'nesters',
-    'netherworld',
-    'netls',
-    'netpower',
-    'networx',
-    'neuroendocrine',
-    'neuronal-specific',
-    'neurotically',
-    'neustadt',
-    'never-to-be-forgotten',
-    'nevsky',
     'new-town',
-    'newcastle-on-tyne',
-    'newent/gloucestershire',
-    'newitt',
-    'newly-painted',
-    'newly-promoted',
-    'news-on-sunday',
-    'news-reader',
-    'newspapermen',
-    'newswatch',
-    'newtonmore',
-    'nfoapa',
-    'nfol',
-    'ngai',
-    'ngoc',
-    'ngvs',
     'ni-frith',
-    'nic&eacute;phore',
-    'niccolo',
-    'nicklin',
-    'night-shirt',
-    'nightclubbing',
-    'nikkila',
-    'nikolaos',
-    'nine-inch',
-    'nine-strong',
-    'nine-week',
-    'ninefold',
-    'ninette',
-    'ninham',
-    'nira',
-    'nkr',
     'nlsc',
-    'nndr',
-    'no-shows',
-    'no-where',
-    'no.17',
-    'noght',
-    'noh',
-    'noilly',
-    'noiseuse',
-    'nola',
-    'nolle',
-    'nomadism',
-    'nominalist',
-    'nomish',
-    'nomos',
-    'non-abusing',
     'non-adaptive',
-    'non-adrenergic',
-    'non-branching',
-    'non-causal',
-    'non-chemical',
-    'non-cholinergic',
-    'non-class',
-    'non-collegiate',
-    'non-compulsory',
-    'non-conformance',
-    'non-cooperative',
-    'non-criminals',
-    'non-degree',
-    'non-democratic',
-    'non-detectable',
-    'non-dimensional',
     'non-employed',
-    'non-equilibrium',
-    'non-europeans',
-    'non-evaluative',
-    'non-flying',
-    'non-gastrointestinal',
-    'non-handicapped',
-    'non-implementation',
-    'non-inferential',
-    'non-institutional',
-    'non-jews',
-    'non-judgmental',
-    'non-magnetic',
-    'non-mainstream',
-    'non-neutral',
-    'non-poor',
     'non-porous',
-    'non-programmers',
-    'non-relatives',
-    'non-rigid',
-    'non-rotational',
-    'non-setting',
-    'non-spatial',
-    'non-sufferers',
-    'non-target',
-    'non-template',
-    'non-u',
-    'non-unionised',
-    'non-user',
-    'nonessential',
-    'nonsenses',
-    'nonviolent',
     'nooses',
-    'nordhaus',
-    'normal-sized',
-    'norrington',
-    'nortons',
-    'nose-in',
-    'nostell',
-    'nota',
-    'notarial',
-    'notelets',
-    'notice-boards',
-    'notre-dame',
-    'nouhak',
-    'novaceta',
-    'novas',
-    'novelette',
     'novoselic',
-    'now-famous',
-    'nrp',
-    'nsas',
-    'nsclc',
-    'nucleosides',
-    'nudists',
-    'nulliparous',
-    'number-crunchers',
-    'numbingly',
-    'nunciature',
-    'nuptiality',
-    'nurse/doctor',
-    'nurturant',
-    'nurturer',
-    'nusec',
     'nutku-halil',
-    'nutts',
-    'nuww',
-    'nuzzles',
-    'nyc',
-    'nypd',
-    'o\'mahony',
-    'o.t.',
-    'oafs',
-    'oaklands',
-    'oare',
-    'oatley',
-    'oberhuber',
-    'objectime',
-    'objet_d\'art',
-    'oblique-slip',
     'obliterans',
-    'obsess',
-    'occludes',
-    'oceanographer',
-    'ockenden',
-    'octagons',
-    'octantis',
-    'octavius',
-    'octiron',
-    'october-december',
-    'od1',
-    'odense',
-    'odges',
-    'odilon',
-    'odone',
-    'odontoid',
     'odorants',
-    'odsal',
-    'oeddba',
-    'oethelwald',
-    'off-',
-    'offchance',
-    'officiously',
-    'ogley',
-    'ohne',
-    'ohrmazd',
-    'oik',
-    'oil-drilling',
-    'oil-lamps',
-    'oka',
-    'okb',
-    'okner',
     'olding',
-    'oliffe',
-    'oligos',
-    'olivera',
-    'olmec',
-    'olton',
-    'olybrius',
-    'ombudsmans',
-    'omero',
-    'ommatidia',
-    'on-air',
-    'on-costs',
-    'on-sight',
-    'on-street',
-    'on-train',
-    'once-mighty',
     'one-arm',
-    'one-flesh',
-    'one-horse',
-    'one-phoneme',
-    'one-seat',
-    'one-to-four',
-    'oneish',
-    'ont',
-    'onyett',
-    'oofy',
-    'oozy',
-    'open-hearted',
-    'open/oltp',
-    'operationalise',
-    'ophiolites',
-    'ophiomyces',
     'opine',
-    'opportunely',
-    'opportunistically',
-    'opposed_to',
-    'oppositeness',
-    'optimiser',
-    'optoelectronics',
-    'opulently',
-    'orange-juice',
-    'oratio',
-    'oratorios',
-    'orchomenos',
-    'ordzhonikidze',
-    'organogenesis',
-    'orhan',
-    'oritur',
     'orla',
-    'orocaecal',
-    'oscar-nominated',
-    'oslerus',
-    'oslobodjenje',
-    'osmena',
-    'osmometer',
-    'osmotherley',
-    'ossis',
-    'ostinatos',
-    'ote',
-    'other-worldliness',
-    'otherworldly',
-    'ottokar',
-    'otu',
-    'oughtred',
     'ouston',
-    'out-of-contract',
-    'out-of-focus',
-    'out-relief',
-    'outface',
-    'outsells',
-    'over-awed',
-    'over-dramatic',
-    'over-emotional',
-    'over-expansion',
-    'over-familiarity',
-    'over-hanging',
-    'over-indulge',
-    'over-involved',
-    'over-regulation',
-    'over-view',
     'overburdening',
-    'overdale',
-    'overeat',
-    'overexploitation',
-    'overexposure',
-    'overgrowths',
-    'overplay',
-    'ovulating',
-    'owada',
-    'owne',
-    'owner/occupier',
-    'ownerships',
-    'p&ndash;40',
-    'p-bass',
-    'p.24',
-    'p.33',
     'p.49',
-    'p.60',
-    'p.66',
-    'p.87',
-    'p.s',
-    'p/36/',
-    'p1/t3',
-    'p2/t3',
-    'p2/t6',
-    'p26',
-    'p31',
-    'p40',
-    'p51',
-    'p=0.09',
-    'pacifico',
-    'pack-horses',
     'pageboy',
-    'paint-stained',
-    'paisleyism',
-    'palazzi',
-    'palazzoli',
-    'pale-pink',
-    'palenickova',
-    'palestine-general',
-    'palfreys',
-    'palmatum',
-    'palpated',
-    'palpitating',
-    'pamirs',
-    'pamphleteering',
-    'pandit',
-    'panjabi',
     'pannonian',
-    'panshanger',
-    'pantone',
-    'panuke',
-    'panup',
-    'papariga',
-    'paperchase',
-    'paperhouse',
-    'papillary',
-    'par-three',
-    'parabolas',
-    'parallelisation',
-    'parang',
-    'paranoic',
-    'parascending',
-    'parasitized',
     'parcell',
-    'parcelling',
-    'parekh',
-    'parenterally',
-    'parenthetic',
-    'pares',
-    'parfums',
-    'paris-dakar',
-    'park-and-ride',
-    'parkhotel',
-    'parky',
-    'parle',
-    'parlements',
-    'parliamentarianism',
-    'parra',
-    'parricidal',
     'parrock',
-    'parthian',
-    'parvovirus',
-    'pasalar',
-    'passeggiata',
-    'passenger-carrying',
-    'paszti-bott',
-    'pathfinding',
-    'patriliny',
-    'patrimoine',
-    'patrizia',
-    'pattenden',
-    'pattern-maker',
-    'pattern-matching',
-    'paulson',
-    'paver',
     'pay-packets',
-    'pay-to-throw',
-    'payin\'',
-    'pbds',
-    'pbluescript',
-    'pc-compatible',
-    'pc-write',
-    'pcch',
-    'pcsmy1.4',
-    'pdt',
-    'peace-tax',
-    'peacehaven',
-    'peaces',
-    'peacock-blue',
-    'peaford',
-    'pealed',
     'pearsons',
-    'peases',
-    'pechiney',
-    'pedalo',
-    'pedants',
-    'pedological',
-    'peebleshire',
-    'peep-hole',
-    'pelikan',
-    'pella',
-    'pelletoidal',
-    'penans',
-    'pences',
-    'pencil-box',
-    'pencil-thin',
-    'pendragon',
     'penetrable',
-    'penhall',
-    'penicillins',
-    'peniket',
-    'penkovsky',
-    'pennal',
-    'pennan',
-    'pennington/gloucestershire',
-    'pennzoil',
-    'pentelic',
-    'penurious',
-    'peons',
-    'pepsi-cola',
-    'perces',
-    'perego',
-    'peridotites',
     'periodogram',
-    'perirenal',
-    'peritoneovenous',
-    'perjured',
-    'perlocutionary',
-    'permanent-magnet',
-    'permittivity',
-    'perplexedly',
-    'persaud',
-    'persecutory',
-    'persistant',
-    'persson',
-    'pertamina',
-    'pertini',
-    'pet&ouml',
-    'pet.',
     'petechiae',
-    'petherton',
-    'petrakov',
-    'petras',
-    'petrol-powered',
-    'petrols',
-    'petrovich',
-    'peugeots',
-    'peux',
-    'peyroulet',
-    'pf2',
-    'pfalz',
-    'pg.',
-    'pga/pgc',
-    'phagocytic',
-    'phalluses',
     'phar-mor',
-    'pharmacologists',
-    'phasing-out',
-    'phatic',
-    'phe',
-    'phelim',
-    'pheloung',
-    'phenothiazines',
-    'phenyl',
-    'philosophize',
-    'phimosis',
-    'phleomycin',
-    'phonetician',
-    'phono',
-    'phosgene',
-    'phosphate-free',
     'phosphocellulose',
-    'photic',
-    'photo-copies',
-    'photo-pass',
-    'photodiode',
-    'photodissociation',
-    'photoionization',
-    'photojournalism',
-    'photometry',
-    'photoplay',
-    'photosynthesise',
-    'phototransistor',
-    'phototypesetting',
-    'pialat',
-    'piastres',
-    'pickie',
     'pictogram',
-    'pictor',
-    'piece-rate',
-    'piercey',
-    'piermarini',
-    'pietas',
-    'pietra',
-    'piggot',
-    'pightle',
-    'pikestaff',
-    'pimelodus',
-    'pimping',
-    'pin-points',
-    'pin-pricks',
-    'pinacoteca',
-    'pineau',
     'pinero',
-    'pinging',
-    'pings',
-    'pink-faced',
-    'pinkhammer',
-    'pinmore',
-    'pinnel',
-    'pinouts',
-    'piombo',
-    'piqu&eacute',
-    'pisano',
-    'pisco',
-    'piss-take',
-    'pisser',
-    'pistoletto',
-    'pistoliers',
     'pith-helmet',
-    'pitilessly',
-    'pixons',
-    'pizzaland',
-    'pizzi',
-    'pkzip',
-    'plagne',
-    'plaids',
-    'plain\'',
-    'plain-clothed',
-    'plain-speaking',
-    'plan-led',
-    'planers',
-    'plant-eaters',
-    'plantlife',
-    'plantsman',
     'plas-y-brenin',
-    'plasticiser',
-    'platefuls',
-    'platelayer',
-    'platnauer',
-    'platy',
-    'playland',
-    'playscript',
-    'playwriting',
-    'pld',
-    'plea-bargaining',
-    'plectra',
-    'pledgee',
-    'pleshey',
-    'plews',
-    'plm',
     'plug-hole',
-    'plughead',
-    'plumpish',
-    'plumply',
-    'plutocrats',
-    'plv',
-    'pmol/kg',
-    'pmol/kg/h',
-    'pmsg',
-    'pneumoconiosis',
-    'pneumocyte',
-    'pneumoniae',
-    'pneumonic',
-    'pnms',
-    'poiana',
-    'point-scoring',
     'polarisers',
-    'poldi-pezzoli',
-    'poleglass',
-    'polidori',
-    'political-military',
-    'politico-economic',
-    'politico-military',
-    'politzer',
-    'polo-necked',
-    'poloidal',
-    'polonaises',
-    'polsby',
-    'polsky',
-    'polveir',
-    'polybrene',
-    'polymorphine',
     'polypoid',
-    'pontblyddyn',
-    'pontifex',
-    'pontoise',
-    'ponty',
-    'pony-tailed',
-    'poofs',
-    'pooped',
-    'poorish',
-    'pop-eyed',
-    'poppadom',
-    'poppea',
-    'popularisers',
-    'popularization',
-    'populating',
-    'porkers',
     'portasystemic',
-    'portlandian',
-    'portwine',
-    'possee',
-    'post-compulsory',
-    'post-creole',
-    'post-exilic',
-    'post-gulf',
-    'post-holocaust',
-    'post-industrialism',
-    'post-it',
-    'postlethwait',
-    'postmodernists',
-    'postpartum',
-    'postulation',
-    'postwoman',
     'pot-au-feu',
-    'pot-holing',
-    'potholed',
-    'potterton',
-    'potties',
-    'pouf',
-    'poum',
-    'poussins',
-    'pouvoir',
-    'powerdisplay',
-    'powerplay',
-    'ppg7',
-    'pr&ecirc;tre',
-    'pr3',
-    'pradip',
-    'praeger',
     'pramarn',
-    'prayer-book',
-    'pre-1945',
-    'pre-agricultural',
-    'pre-budget',
-    'pre-censorship',
-    'pre-clinical',
-    'pre-drilled',
-    'pre-erythrocytic',
-    'pre-formed',
-    'pre-lunch',
-    'pre-pubertal',
-    'pre-reading',
-    'pre-ski',
-    'pre-summit',
-    'pre-tournament',
     'pre-treatment',
-    'prebble',
-    'preciousness',
-    'prefilter',
-    'pregenerated',
-    'preglacial',
-    'prehistorians',
-    'prenzlauer',
-    'prep.',
-    'preposterously',
-    'preputial',
-    'preseason',
-    'present-value',
-    'presentiments',
-    'preservers',
-    'prespecified',
     'pressburger',
-    'pressley',
-    'prestes',
-    'presumptively',
-    'pretense',
-    'prettified',
-    'prettify',
-    'pricker',
-    'priestman',
-    'prikaz',
-    'primarolo',
-    'prindep',
-    'print-based',
-    'printmakers',
-    'priori',
-    'prison-ship',
     'prithee',
-    'pro-german',
-    'pro-moscow',
-    'pro-zionist',
-    'proactively',
-    'proarrhythmia',
-    'problem-based',
-    'problem-solver',
-    'problematized',
-    'procainamide',
-    'procedurals',
-    'procoagulant',
-    'procuracy',
-    'procurements',
-    'procuticle',
-    'proembryo',
     'profession.',
-    'profit-maximization',
-    'programmability',
-    'programme-making',
-    'progressivity',
-    'prokinetic',
-    'prolixity',
-    'promotors',
-    'prope',
-    'propitiatory',
-    'proprietorially',
-    'prosequi',
-    'prosignia',
-    'prospected',
-    'protech',
-    'proton-antiproton',
     'protozoon',
-    'prov',
-    'provan',
-    'provocateur',
-    'proxied',
-    'prsc',
-    'prussic',
-    'przemysl',
-    'psepha',
-    'pseudacorus',
-    'pseudo-cleft',
-    'pseudo-variable',
-    'psittacidae',
-    'pterosaurs',
-    'public-private',
-    'pubmaster',
     'puc13',
-    'pucelle',
-    'puffballs',
-    'pugilist',
-    'pugnacity',
-    'puissance',
-    'pulatov',
-    'pulborough',
-    'pull-ups',
-    'pulmonaria',
-    'pump-house',
-    'punchlines',
-    'punctiliously',
-    'punctuates',
-    'purifies',
-    'purkayastha',
     'purloin',
-    'purloining',
-    'purple-leaved',
-    'purpureus',
-    'pussies',
-    'putten',
-    'puzzlingly',
-    'pvm39',
-    'py',
-    'pyelonephritis',
-    'pyroclasts',
-    'pyrophosphate',
-    'pyroxenes',
-    'qd',
-    'qdot',
-    'qiao',
     'qlf',
-    'qsp',
-    'quadrature',
-    'quadrifasciatus',
-    'quadrilaterals',
-    'quam',
-    'quan',
-    'quantum-mechanical',
-    'quarmby',
-    'quarter-finalist',
-    'quasi-arbitrators',
-    'quasi-delict',
-    'quasi-market',
-    'quasi-military',
-    'quasi-public',
-    'quasi-sexual',
     'quercus',
-    'questa',
-    'quetta',
-    'quietly-spoken',
-    'quirinale',
-    'quis',
-    'r&aacute;kosi',
-    'r&uuml;he',
-    'r\'n\'b',
-    'r-m',
-    'r.i.p.',
-    'r.r.',
-    'r10',
-    'r13',
-    'r19',
-    'r526',
     'r54',
-    'r74(1&ndash;517)',
-    'r:base',
-    'r=',
-    'raad',
-    'racer/trainer',
-    'racetracks',
-    'rackam',
-    'radian',
-    'radiatum',
-    'radicality',
-    'radio-opaque',
-    'radiophonic',
-    'rafi',
-    'rag-tag',
-    'raggedy',
     'ragger',
-    'raggy',
-    'ragout',
-    'ragworm',
-    'rahab',
-    'raillery',
-    'railworkers',
-    'raimund',
-    'rain-affected',
-    'rain-clouds',
-    'rain-drenched',
-    'rain-fed',
-    'rainbow-coloured',
-    'raincoated',
-    'raines',
-    'raisa',
     'raisonne',
-    'ramadhan',
-    'ramanujan',
-    'ramapithecus',
-    'ramified',
-    'ramiro',
-    'ramphal',
-    'rampur',
-    'ramrath',
-    'ramseys',
-    'ranaridh',
-    'randomize',
-    'ransomes',
-    'raphaelo',
-    'rarotonga',
-    'rasch',
     'rastafarianism',
-    'rastas',
-    'rat-1',
-    'ratbag',
-    'ratbird',
-    'rate-payers',
-    'rational-legal',
-    'ratliff',
-    'rattler',
-    'rawest',
-    'raya',
-    'rayson',
-    'razor-edged',
-    'rbic',
-    're-arrangement',
-    're-arrest',
     're-awakened',
-    're-check',
-    're-considered',
-    're-deposited',
-    're-discovered',
-    're-echoed',
-    're-enactments',
-    're-epithelialisation',
-    're-exports',
-    're-instatement',
-    're-integration',
-    're-join',
-    're-launched',
-    're-marriage',
-    're-offend',
-    're-organising',
     're-presentation',
-    're-roofing',
-    're-sells',
-    're-sign',
-    're-solv',
-    're-thought',
-    'reaccreditation',
-    'read-write',
-    'ready-to-eat',
-    'ready-to-use',
-    'real/ix',
-    'rear-engined',
-    'reas',
-    'reassembles',
-    'reassign',
-    'rebalancing',
     'rec.sport.soccer',
-    'recalculate',
-    'recapitalisation',
-    'receiver-general',
-    'receiverships',
-    'rechallenge',
-    'recherch&eacute',
-    'recherches',
-    'recoding',
-    'recolonisation',
-    'recomposition',
-    'reconverted',
-    'recor',
-    'record-players',
-    'recreative',
-    'rectoanal',
     'recurved',
-    'red-bricked',
-    'redistributions',
-    'redline',
-    'reeky',
-    'reentered',
-    'reet',
-    'reeve/thames',
-    'refinish',
-    'reflexion',
-    'refluxate',
-    'refolding',
-    'reformatted',
-    'refound',
-    'regales',
-    'regenerates',
     'regno',
-    'rehab',
-    'rehang',
-    'reichsbahn',
-    'reinserted',
-    'reinsurers',
-    'reitzle',
-    'rejig',
-    'rela',
-    'relatable',
-    'relents',
-    'relicensing',
-    'remanoid',
-    'remigius',
-    'reminisces',
-    'remoulded',
     'remunerate',
-    'renan',
-    'renegotiating',
-    'renin-angiotensin',
-    'renormalization',
-    'rents-to-mortgages',
-    'renzo',
-    'reorientated',
-    'replanned',
-    'replicants',
-    'replications',
-    'replix',
-    'repressiveness',
-    'reprogramming',
-    'reprovision',
-    'repub.',
     'repulsing',
-    'rerouted',
-    'resales',
-    'reseal',
-    'resections',
-    'reservist',
-    'resolver',
-    'resonantly',
-    'responsibilities.',
-    'responsiblity',
-    'responsions',
-    'reston',
-    'restorff',
-    'retecta',
-    'reticuloendothelial',
-    'retin-a',
     'retinae',
-    'retiree',
-    'retooling',
-    'retour',
-    'retracts',
-    'retrogression',
-    'retty',
-    'reunify',
-    'reverser',
-    'reviling',
-    'revitaliser',
-    'revivified',
-    'revusky',
-    'reworks',
-    'rgn',
-    'rhein',
     'rhenania',
-    'rheumatological',
-    'ri-',
-    'riccardi',
-    'ricochets',
-    'rids',
-    'ridsdale',
-    'ried',
-    'right-side',
-    'rijeka',
-    'rikky',
-    'rimir',
-    'rimming',
-    'ring-like',
-    'riper',
-    'ripostes',
     'risdon',
-    'rise-and-fall',
-    'risk-adjusted',
-    'risk-return',
-    'ritornelli',
-    'ritualistically',
-    'riz',
-    'rizzoli',
-    'rld',
-    'rmg',
-    'road-block',
-    'roadworthiness',
-    'roberson',
-    'robertsbridge',
-    'robillard',
-    'rock-and-roll',
     'rockcliffe',
-    'rodd',
-    'roderic',
-    'rodi',
-    'roentgen',
-    'roermond',
-    'rohe',
-    'role-models',
-    'rollestone',
-    'rolm',
-    'romanby',
-    'romanes',
-    'romax',
-    'romuald',
-    'rookes',
-    'rorstad',
     'rosaldo',
-    'rosales',
-    'rosalia',
-    'rosanne',
-    'rosdolsky',
-    'rose-garden',
-    'roseate',
-    'roselyne',
-    'rosi',
-    'rossitter',
-    'rotherfield',
-    'rotters',
-    'rough-edged',
-    'rouncewell',
-    'rouses',
-    'rousset',
     'rovings',
-    'rowledge',
-    'rowney',
-    'royal-blue',
-    'rozier',
-    'rti',
-    'rubha',
-    'rubrics',
-    'ruck/maul',
-    'rudbeckia',
-    'rudkin',
-    'rudner',
-    'rueschemeyer',
-    'ruffed',
-    'rugova',
-    'ruhleben',
     'ruinously',
-    'rumback',
-    'rumer',
-    'ruscoe',
-    'rusland',
-    'rust-proof',
-    'rustiness',
-    'ruthenium',
-    'ruttan',
-    'rx-80',
-    'rye-grass',
-    'ryecroft',
-    'ryedale-york',
-    's&eacute;gol&egrave;ne',
-    's&eacute;zanne',
-    's&oslash;de',
     's&uuml;ssmayr',
-    's-labelled',
-    's-mp',
-    's.15(1)',
-    's.2(3)',
-    's.52',
-    's.9',
-    's.p.',
-    's.t.c.',
-    's.w.1',
-    's120',
-    's123',
-    's135',
-    's15',
-    's15(2)',
-    's178',
     's2(2)',
-    's24',
-    's26',
-    's33',
-    's343',
-    's416',
-    's42',
-    's4c',
-    'saadeh',
-    'sabata',
-    'sabatier',
-    'saburov',
-    'sacr&eacute;e',
-    'sacu',
-    'sadeq',
-    'sads-l',
     'safar',
-    'safety-deposit',
-    'safety-net',
-    'sagdeev',
-    'saggers',
-    'sailcloth',
-    'saint-jean-de-luz',
-    'saint-jean-pied-de-port',
-    'sainte-engr&acirc;ce',
-    'sakamoto',
-    'saki',
-    'salahuddin',
-    'salen',
-    'salesgirl',
-    'salic',
-    'salomons',
     'salvoes',
-    'samajwadi',
-    'sambar',
-    'sambrook',
-    'same-lamborghini',
-    'samhailt',
-    'sammon',
-    'sampo',
-    'samuilo',
-    'sand-dunes',
-    'sand-filled',
-    'sandby',
-    'sandino',
-    'sandpapered',
-    'sandpits',
-    'sandrock',
     'sanely',
-    'sanglier',
-    'sangliers',
-    'sanguinary',
-    'sani',
-    'sanipet',
-    'sanjo',
-    'sanserif',
-    'sant&eacute',
-    'saponification',
-    'sarabia',
-    'sarapu',
-    'sarastro',
-    'sarbutts',
-    'sarcophyton',
-    'sarfati',
     'sarnie',
-    'sarovar',
-    'sarris',
-    'sas/lbs',
-    'sasines',
-    'sassenach',
-    'sasser',
-    'satchels',
-    'sateen',
-    'satiate',
-    'sauced',
-    'saulnier',
-    'sauniere',
-    'sausage-shaped',
-    'sauternes',
-    'save-a-can',
     'savonnerie',
-    'saw-tooth',
-    'sawtooth',
-    'sc53116',
-    'scantronic',
-    'scap',
-    'scarlet-faced',
-    'scdc',
-    'sch&uuml;tz',
-    'schaaf',
-    'schatzie',
-    'schegloff',
-    'scheibler',
-    'schelting',
-    'schemers',
-    'schistosome',
     'schlesser',
-    'schmit',
-    'schmuck',
-    'school-days',
-    'schrader',
-    'schreiber',
-    'schreier',
-    'schwarzenberg',
-    'schwer',
-    'schwerin',
-    'scienter',
-    'scillas',
-    'scio',
-    'scirpus',
-    'scissored',
-    'scrag',
     'scrapper',
-    'screamingly',
-    'screen-printed',
-    'screw-eyes',
-    'scribemole',
-    'scrimping',
-    'script-writer',
-    'scriptx',
-    'scruffier',
-    'scrutineer',
-    'scuba-diving',
-    'scumbling',
-    'scuppering',
-    'scurries',
-    'scutari',
-    'scythians',
     'sdm',
-    'sdo',
-    'se&aacute;n',
-    'sea-monster',
-    'sea-stories',
-    'sea-surface',
-    'sea-watching',
-    'seachange',
-    'sealed-unit',
-    'searby',
-    'searchable',
-    'seatoller',
-    'seaway',
-    'seawolf',
-    'secundo',
-    'seethes',
     'segmentary',
-    'segregationist',
-    'seignorial',
-    'seiji',
-    'seisha',
-    'seismically',
-    'selahattin',
-    'selectiveness',
-    'self-administration',
-    'self-blame',
-    'self-certified',
-    'self-cleaning',
-    'self-correcting',
-    'self-determining',
-    'self-disclosure',
-    'self-review',
     'self-subsistent',
-    'selle',
-    'sellswords',
-    'semaphores',
-    'semenyaka',
-    'semi-circles',
-    'semi-empirical',
-    'semi-finished',
-    'semi-hard',
-    'semi-hardwood',
-    'semi-nude',
-    'semi-strong',
-    'semi-urban',
-    'semra',
-    'sen.',
-    'senad',
     'sennelier',
-    'sensitise',
-    'sensitiveness',
-    'sensualist',
-    'sensuousness',
-    'sepias',
-    'septembre',
-    'septuagenarian',
-    'sequeira',
-    'sequelink',
-    'serb-populated',
-    'serenaded',
-    'seria',
-    'seropositivity',
-    'serpentines',
-    'serpentinite',
     'serva',
-    'serveert',
-    'server-based',
-    'servery',
-    'servicewomen',
-    'set-net',
-    'seton-watson',
-    'setpoint',
-    'seven-under-par',
-    'seven-week-old',
-    'sevenpence',
-    'severan',
-    'severes',
-    'sewingbury',
-    'sex-matched',
-    'seybold',
     'seyfarth',
-    'seyfert',
-    'sfc',
-    'sfv',
-    'sha\'ban',
-    'shake-ups',
-    'shakingly',
-    'shallow-water',
-    'shamelessness',
-    'shamming',
-    'shao',
-    'shark-infested',
-    'shbeilat',
-    'shcherbakov',
-    'shell-holes',
-    'shell-shaped',
     'sherilyn',
-    'sherriff',
-    'shewed',
-    'shieling',
-    'shifters',
-    'shindler',
-    'shingly',
-    'ship-repair',
-    'shiploads',
-    'shirvan',
-    'shoom',
-    'shop-front',
-    'shop-stewards',
-    'shopfitting',
-    'shopman',
-    'shopworn',
     'shortie',
-    'shotter',
-    'shoulder-in',
-    'shoulds',
-    'showgirl',
-    'showhouse',
-    'shubunkins',
-    'shuck',
-    'shura',
-    'shusha',
-    'shv',
-    'sichel',
-    'sicilia',
-    'sick-making',
-    'sickbed',
-    'sicko',
     'side-shoots',
-    'side-slipping',
-    'side-whiskers',
-    'sideslipping',
-    'sideswipe',
-    'sidetrack',
-    'sidorov',
-    'sidur',
-    'sightseer',
-    'sighvat',
-    'sigue',
-    'silberston',
-    'silhouetting',
-    'silloth',
-    'silopi',
-    'silver-backed',
     'silver-tongued',
-    'silvi',
-    'silviu',
-    'simcock',
-    'simp',
-    'simulans',
-    'sine_die',
-    'singer-songwriters',
-    'single-copy',
-    'single-deck',
-    'single-deckers',
-    'single-function',
-    'single-record',
-    'single-spaced',
-    'singletons',
-    'singye',
     'sinister-looking',
-    'sinisterly',
-    'sino-indian',
-    'siraj',
-    'sisophon',
-    'sit-coms',
-    'sitpro',
-    'situ',
-    'six-sided',
-    'six-speed',
-    'six-week-old',
-    'sixties-style',
-    'sixty-fifth',
-    'sixty-foot',
-    'sk1',
-    'skelhorn',
     'skelter',
-    'sketch-pad',
-    'skibbereen',
-    'skills-based',
-    'skinks',
-    'skinny-dipping',
-    'skinnys',
-    'skipp',
-    'skipsea',
-    'skirl',
-    'skivvies',
-    'sklar',
-    'skocpol',
-    'skokholm',
-    'skool',
-    'skull-cap',
     'skyhook',
-    'skytrain',
-    'slaking',
-    'slaloms',
-    'slammers',
-    'slant-eyed',
-    'slaughterings',
-    'slaughters',
-    'sleeman',
-    'sleety',
-    'slevin',
-    'slickness',
-    'sliwa',
-    'slo-cooker',
-    'sloper',
-    'slouches',
     'slow-flowing',
-    'slozil',
-    'sluggard',
-    'slumberland',
-    'slxi',
-    'sm3',
-    'small-spotted',
-    'smeary',
-    'smectite',
-    'smike',
-    'smo',
-    'smooch',
-    'smorgasbord',
-    'smyslov',
-    'snack-bar',
-    'snainton',
     'snap-shots',
-    'sndp',
-    'snooper',
-    'snorkels',
-    'snow-melt',
-    'snuggles',
-    'so_on',
-    'sobell',
-    'socalled',
-    'soden',
-    'sodnom',
-    'soft-centred',
-    'solaic',
-    'solicitor/registered',
-    'sombreness',
-    'somerford',
     'sone',
-    'song-writer',
-    'sonoran',
-    'soon_as',
-    'sooth',
-    'sophias',
-    'soprintendenze',
-    'sosa',
-    'soskice',
-    'sotelo',
-    'soupe',
-    'source-level',
-    'south-southeast',
-    'southernwood',
-    'southfields',
-    'southmoor',
     'souto',
-    'sowings',
-    'spader',
-    'spanish-style',
-    'sparcsystem',
-    'sparred',
-    'spatiotemporal',
-    'spearmint',
-    'spearpoint',
-    'specht',
-    'special-interest',
-    'specially-adapted',
-    'specialness',
-    'species-specific',
-    'specmark89',
-    'spectrophotometrically',
     'spedding',
-    'speed-reducing',
-    'speedbird',
-    'speeders',
-    'spermicidal',
-    'spero',
-    'spieler',
-    'spillers',
-    'spinets',
-    'spinnerettes',
-    'spiritless',
-    'spitefulness',
-    'spk',
-    'splanchnic',
-    'spondylitis',
-    'sporozoite',
     'sportsnight',
-    'sportswoman',
-    'sportswomen',
-    'spose',
-    'spotswood',
-    'sppf',
-    'spray-painting',
-    'springvale',
-    'springwell',
-    'sproatley',
-    'spumante',
-    'sputter',
-    'spymaster',
-    'spyros',
-    'squanders',
-    'squiggle',
     'squit',
-    'srbh',
-    'srsp',
-    'ss6',
-    'ssc/0.1%',
-    'st&uuml;nke',
-    'stacker-cranes',
-    'staffware',
-    'stagecraft',
-    'stagings',
-    'stainer',
-    'stalagmite',
-    'stammers',
-    'standard-bearers',
-    'standard-setters',
-    'standpipe',
     'starmer',
-    'starsky',
-    'startups',
-    'starves',
-    'state-centrist',
-    'state-wide',
-    'statics',
-    'staton',
-    'stavenhagen',
-    'stayte',
-    'steel-tipped',
-    'steeplechasers',
-    'stefania',
-    'steffen',
-    'steichen',
-    'step-brother',
     'stereographic',
-    'sterilize',
-    'steventon-rogers',
-    'stewart/scotland',
-    'stickability',
-    'stickily',
-    'stieber',
-    'stiff-upper-lip',
-    'stiggins',
-    'stigmatizing',
-    'stilettoes',
-    'still-born',
-    'stimulations',
-    'stinger',
-    'stingrays',
-    'stinkdolomit',
     'stinted',
-    'stoa',
-    'stobart',
-    'stock-holding',
-    'stocklist',
-    'stockwood',
-    'stogursey',
-    'stomach-ache',
-    'stomach-turning',
-    'stonyhurst',
-    'stook',
-    'storageworks',
-    'storeyed',
-    'storici',
-    'storm-clouds',
-    'stormer',
     'stourton',
-    'straight-ahead',
-    'straight-through',
-    'strasser',
-    'strat-style',
-    'strathern',
-    'streat',
-    'streptozotocin',
-    'stressor',
-    'stricker',
-    'stricturing',
-    'strike-bound',
-    'strike-force',
-    'stroboscopic',
-    'stromboli',
-    'strong-smelling',
     'strongpoint',
-    'struthers',
-    'studebaker',
-    'sub-branches',
-    'sub-district',
-    'sub-goals',
-    'sub-licensing',
-    'sub-periods',
-    'sub-tenant',
-    'sub-warden',
-    'subadult',
-    'subantarctic',
-    'subcategories',
-    'subdeacon',
-    'subfertility',
-    'subnormality',
     'subroto',
-    'subsequence',
-    'subserve',
-    'subsid',
-    'subsidisation',
-    'substate',
-    'subterfuges',
-    'subtotals',
-    'subversions',
-    'subvocal',
-    'subzero',
-    'succesful',
-    'suchet/itn',
-    'suffixed',
-    'suffocates',
-    'suffuses',
     'sugar*',
-    'sugar-beet',
-    'suleymaniye',
-    'sulla',
-    'sullivans',
-    'sulphoxide',
-    'sulpicius',
-    'summations',
-    'summer-time',
-    'sumpter',
-    'sun&ndash;sat',
-    'sunaccount',
-    'sunart',
-    'sunder',
-    'sundering',
-    'sunderlands',
     'sunninghill',
-    'superadded',
-    'supercontinent',
-    'superfast',
-    'superfit',
-    'supergrass',
-    'superstor',
-    'suppressants',
-    'suppressors',
-    'surcoats',
-    'surliness',
-    'surmises',
-    'surmounts',
-    'survivability',
-    'sussing',
-    'sutrisno',
     'suum',
-    'suyo',
-    'svt',
-    'sw16',
-    'sw19',
-    'sw213',
-    'swade',
-    'swaefheard',
-    'swamplands',
-    'swartzentruber',
-    'sweat-shirt',
-    'sweat-shop',
-    'swedenborg',
-    'sweet-natured',
-    'sweetpea',
-    'sweetspot',
     'swim-two-birds',
-    'swingometer',
-    'swishes',
-    'switzer',
-    'swooshing',
-    'sybyl',
-    'syllogistic',
-    'sympatric',
-    'synaptogenesis',
-    'synchronically',
-    'syncro',
-    'synfuels',
-    'synthesizes',
-    'syracusan',
-    'syrah',
-    'syse',
     'systematicity',
-    'szeged',
-    't\'mill',
-    't-a',
-    't-bonds',
-    't-i',
-    't-type',
-    't-year',
-    't.q.m.',
-    't160',
-    't2/tap1+2',
-    'taa',
-    'tablatures',
-    'tabucchi',
-    'tacho',
-    'tachyarrhythmias',
     'tackers',
-    'tackley',
-    'tactel',
-    'tail-enders',
-    'tail-skid',
-    'tailplanes',
-    'tainting',
-    'tajiks',
-    'takashi',
-    'talbothays',
-    'tall-herb',
-    'tallack',
-    'taloned',
-    'tamarins',
-    'tamati',
-    'tancredi',
     'tangibility',
-    'tantalize',
-    'tapestried',
-    'tarawa',
-    'tareq',
-    'tarlo',
-    'tarporley',
-    'tarsier',
-    'tarting',
-    'tartness',
-    'tatlin',
-    'tatlock',
-    'tatti',
-    'tattvic',
-    'taupin',
-    'tauri',
     'tautologies',
-    'tavey',
-    'tax-dodging',
-    'taxi-cab',
-    'taxonomically',
-    'taylorist',
-    'tcherkassoff',
-    'tcms',
-    'te671',
-    'tea-chests',
-    'tea-parties',
-    'tea-things',
-    'teacher-researchers',
-    'teaching-learning',
-    'team-teaching',
-    'tear-streaked',
     'teaspoonsful',
-    'technic',
-    'technology-based',
-    'teddy-bear',
-    'teguise',
-    'telemine',
-    'telesoft',
-    'telscombe',
-    'telugu',
-    'temminck',
-    'temperature-controlled',
-    'templer',
-    'temporall',
-    'temporeros',
-    'tempter',
-    'tender-hearted',
     'tengah',
-    'tentativeness',
-    'tenter',
-    'tenuis',
-    'tepidarium',
-    'terah',
-    'terman',
-    'termism',
-    'terra_incognita',
-    'terreblanche',
-    'terrell',
-    'terrington',
-    'teruel',
-    'teske',
-    'tessitura',
-    'test-playing',
     'tethys',
-    'tetrapeptide',
-    'tetraploid',
-    'tfi',
-    'tfm',
-    'thaddeus',
-    'thalia',
-    'thals',
-    'thame/oxfordshire',
-    'thani',
-    'thearle',
-    'theatre-in-education',
-    'theocratic',
-    'theodhori',
-    'therapsids',
-    'thermae',
     'thess.',
-    'theydon',
-    'thieme',
-    'thingamajig',
-    'thingummy',
-    'thinline',
-    'thinnings',
-    'thiocyanate',
-    'thirty-',
-    'thirtyish',
-    'this-worldly',
-    'thkarni',
-    'tholl',
-    'tholos',
-    'thomases',
-    'thomsons',
     'thorikos',
-    'thorn-emi',
-    'thought-bubble',
-    'thr25',
-    'three-bladed',
-    'three-generation',
-    'three-hundred',
-    'three-quarter-length',
-    'three-speed',
-    'throughflow',
-    'thun-hohenstein',
-    'thunderer',
-    'thurstan',
-    'tiaras',
-    'tib',
-    'tibbett',
     'tibesti',
-    'tibshelf',
-    'ticket-holders',
-    'tickhill',
-    'tidesman',
-    'tiebacks',
-    'tiggywinkle',
-    'tilburg',
-    'tillman',
-    'timbering',
-    'timberlake',
-    'time-delay',
-    'time-free',
-    'time-limited',
-    'time-lines',
-    'time-serving',
     'time-temperature',
-    'tin-roofed',
-    'tipasa',
-    'tiraspol',
-    'tired-looking',
-    'tiresias',
-    'tiriac',
-    'tisch',
-    'tish',
-    'title-deeds',
-    'title-is',
-    'titleholder',
-    'tlatelolco',
-    'tlv',
-    'tn3.1',
-    'toadying',
     'tobacco-stained',
-    'tobaccos',
-    'todney',
-    'toeing',
-    'toinette',
-    'tolboys',
-    'tolley',
-    'tollgate',
-    'tolman',
-    'tolstaya',
-    'tomboyish',
-    'tongue-lashing',
-    'tonka',
-    'tontons',
-    'tool-kit',
-    'toolbars',
     'toots',
-    'top-10',
-    'topee',
-    'topley',
-    'topo',
-    'topoisomerase',
-    'topologies',
-    'topsail',
-    'toray',
-    'tormes',
-    'tortelier',
-    'tosspot',
-    'totalisation',
-    'toubkal',
-    'touchmaster',
-    'tough-talking',
     'touristic',
-    'tournebise',
-    'towle',
-    'towline',
-    'toxoid',
-    'toyne',
-    'toyotas',
-    'toyshop',
-    'tpc-b',
-    'tr3',
-    'trade-related',
-    'traduced',
-    'trail-blazing',
-    'trainloads',
-    'traipsed',
-    'trammelled',
     'tramontano',
-    'trancelike',
-    'trancey',
-    'tranquilo',
-    'trans-national',
-    'transavanguardia',
-    'transducing',
-    'transitoriness',
-    'transnationalism',
-    'transport-independent',
-    'transrectal',
-    'trapdoors',
-    'trasimeno',
-    'trask',
-    'trastevere',
-    'travesties',
     'trawls',
-    'treanor',
-    'treatment-room',
-    'treib',
-    'trekkies',
-    'trendier',
-    'treponeme',
-    'treponemes',
-    'tresco',
-    'treu',
-    'tri-apsidal',
-    'tri-plate',
-    'tri-plates',
-    'tri-service',
-    'trialling',
-    'triathletes',
     'trichological',
-    'tricorne',
-    'tried-and-tested',
-    'trimethoprim',
-    'trimly',
-    'trinder',
-    'trireme',
-    'tris-cl',
-    'trismegistus',
-    'tritton',
-    'trivet',
-    'trivialisation',
-    'trockel',
-    'tromso',
-    'tropism',
-    'trou',
     'troupers',
-    'trowell',
-    'true/false',
-    'trustbusters',
-    'tschudi',
-    'tsogdu',
-    'tsomet',
-    'tub-thumping',
-    'tugrik',
-    'tulu',
-    'tumilty',
-    'tumults',
-    'tunisians',
-    'turbaned',
-    'turbochannel',
-    'turmoils',
     'turning-points',
-    'turpie',
-    'turriff',
-    'tutwork',
-    'tvb',
-    'twenty-mile',
-    'twenty-three-year-old',
-    'twigg',
-    'twinbrook',
-    'twix',
-    'two-second',
-    'two-week-old',
-    'tylee',
-    'tympanometric',
-    'typographers',
-    'typographically',
     'tyrer',
-    'tyrie',
-    'tyrode',
-    'tyros',
-    'tyrrhenian',
-    'tyrwhitt',
-    'tysoe',
-    'tzar',
-    'u-bend',
-    'u.s.p.g.a.',
-    'ua2',
-    'ucn',
-    'udaltsova',
-    'udhk',
-    'udm',
-    'udt',
     'ue',
-    'uhde',
-    'uis',
-    'uk-owned',
-    'uk-wide',
-    'uk8',
-    'ulcerogen',
-    'ullmann',
-    'uls/me',
-    'ultra-high',
-    'ultra-sound',
-    'ultramontanism',
-    'ultratone',
-    'un-iaea',
-    'unalike',
-    'unamplified',
     'unaspirated',
-    'unassimilable',
-    'unbalancing',
-    'unbanned',
-    'unbothered',
-    'unbranched',
-    'unbusinesslike',
-    'uncanonical',
-    'uncompensated',
-    'uncultured',
-    'uncurling',
-    'unda',
-    'under-15s',
-    'under-achiever',
-    'under-cook',
-    'under-fire',
     'under-performing',
-    'underarms',
-    'underbody',
-    'underclothing',
-    'underly',
-    'undernourishment',
-    'underpayment',
-    'underpricings',
-    'undiscussable',
-    'unemphatic',
-    'unexcited',
-    'unexercised',
-    'unfalsifiable',
-    'unfitting',
-    'unfocussed',
-    'unformulated',
     'ungrounded',
-    'unguents',
-    'unguided',
-    'unicenter',
-    'uniformitarian',
-    'unilateralists',
-    'unindexed',
-    'union-management',
-    'unipress',
-    'unisql',
-    'universalise',
-    'universalized',
-    'unknotted',
-    'unlaced',
-    'unlooked',
-    'unmannerly',
     'unmounted',
-    'unpressed',
-    'unprotesting',
-    'unreached',
-    'unrealizable',
-    'unreclaimed',
-    'unreflecting',
-    'unrevealed',
-    'unrooted',
-    'unroped',
-    'unsensational',
-    'unskilful',
-    'unstirred',
-    'unstrapped',
-    'unsurfaced',
-    'unsurpassable',
     'untenanted',
-    'unthriftiness',
-    'untouchability',
-    'unvalidated',
-    'up/down',
-    'upazila',
-    'upflow',
-    'uplighters',
-    'ura5-6',
-    'ureter',
-    'ureters',
-    'urfe',
-    'urian',
-    'uridine',
-    'urizio',
-    'urs&aelig',
     'us&dollar;1,700',
-    'us&dollar;1.00=ec&dollar;2.6976',
-    'us&dollar;1.00=ec&dollar;2.7069',
-    'us&dollar;160',
-    'us&dollar;2,100',
-    'us&dollar;21',
-    'us&dollar;230',
-    'us&dollar;25,000',
-    'us&dollar;3,500',
-    'us&dollar;400',
-    'us&dollar;800',
-    'us-vietnamese',
-    'usa.',
-    'usefulness-ratings',
-    'usherettes',
-    'usherwood',
     'uskair',
-    'usurious',
-    'usyn',
-    'ute',
-    'utting',
-    'uunet',
-    'v-2',
-    'v.i.',
-    'v.i.p.',
-    'v22bis',
-    'v3',
-    'v9',
-    'va\'ezi',
-    'vacek',
-    'vache',
-    'vacillations',
     'vacuolation',
-    'vacuolisation',
-    'vacuum-cleaner',
-    'vafa',
-    'vainglory',
-    'val&eacute;rie',
-    'vald&eacute;s',
-    'valdemar',
-    'valerius',
-    'valse',
-    'valuepoint',
-    'vari',
-    'vase-painters',
-    'vasectomies',
-    'vasiliki',
-    'vasodilator',
     'vasopressin',
-    'vatanen',
-    'vb',
-    'vbk',
-    'vcid',
-    'vco',
-    'velveteen',
-    'vengefully',
-    'ventris',
-    'vergennes',
-    'verrall',
-    'verri',
-    'verwoerd',
-    'vesica',
-    'vexations',
-    'vez',
     'vibrationally',
-    'vicar-general',
-    'vice-foreign',
-    'vicomtesse',
-    'victorias',
-    'video-recording',
-    'videocassettes',
-    'vidlin',
-    'villon',
-    'vipiteno',
-    'viscosities',
-    'vitelli',
-    'vitrified',
-    'vmx',
-    'voeller',
-    'volgograd',
     'volksfront',
-    'volkspartei',
-    'volkspartij',
-    'volleyer',
-    'volosti',
-    'volpe',
-    'voluntas',
-    'vopos',
-    'voracity',
-    'vortexing',
-    'votadini',
-    'vote.',
-    'vouchsafe',
-    'vp5',
-    'vpa',
-    'vpk',
     'vr4400',
-    'vrtx',
-    'vso',
-    'vulcanologist',
-    'vxm',
-    'w-cells',
-    'w-what',
-    'w.j.',
-    'w.m.',
-    'w/p',
-    'w6/32',
-    'wage-labourers',
-    'waggoners',
-    'waghorn',
-    'wainscoting',
-    'wakeley',
     'wakelin',
-    'walk-over',
-    'walkington',
-    'wall-clock',
-    'wallaces',
-    'walloping',
-    'walpit',
-    'walwyn',
-    'wangdu',
-    'wapnick',
-    'war-weariness',
-    'warbeck',
-    'wardian',
-    'warin',
-    'warkworth',
-    'warlocks',
     'warlow',
-    'warltire',
-    'warre',
-    'warriner',
-    'wastrel',
-    'watch-towers',
-    'watchfield',
-    'water-level',
-    'water-living',
-    'water-pistols',
-    'water-use',
-    'water/alcohol',
-    'watermarked',
-    'waterton',
-    'waterweed',
-    'wates',
     'wattie',
-    'waymarkers',
-    'wc1b',
-    'wc2e',
-    'wcg',
-    'weale',
-    'wealth-producing',
-    'weapon-grade',
-    'weather-worn',
-    'weatheritt',
-    'web-building',
-    'week-to-week',
-    'weekley',
-    'weepers',
-    'weepie',
-    'wees',
     'weeton',
-    'weg',
-    'wegg',
-    'weight-watchers',
-    'weightiest',
-    'weightwatchers',
-    'weisberg',
-    'weitzer',
-    'welensky',
-    'well-advertised',
-    'well-attested',
-    'well-beloved',
-    'well-filled',
-    'well-financed',
-    'well-fleshed',
-    'well-formedness',
     'well-oxygenated',
-    'well-spaced',
-    'well-upholstered',
-    'well-worked',
-    'wellenkuppe',
-    'wentwood',
-    'weobley',
-    'werburgh',
-    'werent',
-    'wertheimer',
-    'west-coast',
-    'westchester',
-    'westerberg',
-    'westerlies',
-    'westernisation',
-    'wg.cdr',
     'whaddaya',
-    'whalbys',
-    'wheeler-dealing',
-    'wheely',
-    'whelans',
-    'whetting',
-    'whetton',
-    'whiffling',
-    'whinging',
-    'whinnett',
-    'whirly',
-    'white-walled',
-    'whitebait',
-    'whitecliffe',
-    'whitegate',
-    'whitemoor',
     'whithorn',
-    'whittam',
-    'whitwell',
-    'whizzo',
-    'whole-time',
-    'whoopie',
-    'whop',
-    'whos',
-    'wicke',
-    'wickstead',
-    'widely-known',
-    'wideness',
-    'wifey',
-    'wiic',
-    'wilbert',
-    'wilco',
     'wild-life',
-    'wilgro',
-    'willan',
-    'williams-ellis',
-    'willms',
-    'willow-herb',
-    'willson',
-    'wilson/radcliffe',
-    'wilsonville',
-    'wind-whipped',
-    'windbreaks',
-    'windfarm',
-    'windows-under-unix',
-    'wineries',
-    'wingbeats',
-    'winged-corridor',
     'winkie',
-    'winograd',
-    'wint',
-    'winter-time',
-    'winterhalter',
-    'wipe-out',
-    'wire-haired',
-    'witch-hunting',
-    'witchhunt',
-    'within-group',
-    'witness-box',
-    'wittenham',
-    'wladyslaw',
-    'wml',
-    'wolde',
-    'wolf-whistles',
     'wolfing',
-    'wollaston',
-    'wollheim',
-    'womb-like',
-    'wombwell',
-    'wongy',
-    'wood-pigeons',
-    'woodger',
-    'woodgrain',
-    'woodlanders',
-    'woolfall',
-    'woolsey',
-    'wops',
-    'word-class',
-    'wordingham',
-    'wordprocessors',
     'work-wise',
-    'working-age',
-    'world\'',
-    'world-ranking',
-    'world-record',
-    'wothorpe',
-    'wotton-under-edge',
-    'wowed',
-    'wrapt',
-    'write-once',
-    'wrongdoings',
-    'wynfrith',
-    'wyrd',
-    'wyss',
-    'wyverns',
-    'x.500',
     'x15',
-    'xc',
-    'xc3',
-    'xc4',
-    'xc6',
-    'xd',
-    'xe2',
-    'xenograft',
-    'xf5',
-    'xf6+',
-    'xg4',
-    'xuechao',
-    'xury',
-    'xylem',
-    'xylogics',
-    'y-shaped',
     'y-you',
-    'yablokov',
-    'yafano',
-    'yakutia',
-    'yameogo',
-    'yanbu',
-    'yankie',
-    'yardarm',
-    'yardbirds',
-    'yashmak',
-    'yateley',
-    'yeap',
-    'yellowhammer',
-    'yellowness',
-    'yemf',
-    'yeses',
     'yf-22',
-    'yids',
-    'ylli',
-    'yogurts',
-    'yoma',
-    'yonkers',
-    'yordas',
-    'yoshi',
-    'young-looking',
-    'yoursen',
-    'youthfully',
-    'ythan',
-    'yubamrung',
-    'yukky',
-    'yunus',
-    'yvor',
     'ywca',
-    'z2033',
-    'zakuski',
-    'zapper',
-    'zauditu',
-    'zds',
-    'zekes',
-    'zem',
-    'zemsky',
-    'zenouska',
-    'zephania',
-    'zero-rating',
-    'zero-risk',
-    'zeroing',
-    'zico',
-    'ziller',
     'zippered',
-    'zippers',
-    'znf37a',
-    'zowie',
-    'zsuzsa',
-    'zurbriggen',
-    'zuweyla',
+)
+
+blocks_18 = (
+    '"(gr;x&bgr"&mp;1/4%#nad!-bgr;-blocking!+dollar;0.21+!4+!8(&1,900m)#.35*"44*"56*"70+!3*"82+!5',
+    ')400,000&ndash;150,000)%1,500)$5.5m)"65)&90,000(/20&ndash;30,000*"00)%1,000(#380)!9($4.95+!m)!4()5,000,000*#200',
+    '*"6m(%6,700).0&ndash;80,000($7.7m)*00,000,000)"5m)"95($8.9m($9.8m!/eacute;aulement(&ireann!)frac18;in("pt%"25!$lt;2',
+    '$(enter&gt$#or=!+mdash&mdash&";.\'#all\'#csl\'"of(!h\'$with"-icro;g/kg/day!(ndash;he!,pgr;-section-!s&$type")ound;1.10',
+    ')#75m(.0&ndash;15,000)(0million)%2,000)!7($1.2m*"3m*"7m)!1)!2)!3(&28,000)\'million(#3.3)!3',
+    '*$,000(%4,700)".5)!2($5.49+!m)\'million("72("84)!8\'%2,090)#250(#.10*!9)"69',
+    '($1.75*"95(#200($44.5("69($7.5m($8.99\'%3,400)#600)#700(#.4m)"80*!m(20,000&ndash;40,000)/0&ndash;500,000',
+    '("19("35)!m("53(&60,000)!5)!m($7.5m(&80,000\'"4.)"60("12(&20,000("45("6m',
+    '(\'million\'$5.10)!3)!8*!m($2.50(%4,000("8m(\'million\'"6.)"7m(&10,000(%2,500("60\'$7.20',
+    ')!3)!8("10("29("30($9.95\'#8.1)"5m)"75(!7($9.95)!5!)times;112!#xgr $\'ang',
+    '!$s_up"!o!$that##ere"$will!$well $*ali"(ppointed!"no "+7 &-190bp!$55bp!"70!&factor!$poet',
+    ' +0&ndash;255!",0!$.03%""30#!1#!4""47""58#!9""71""81""90!#00m"!3"#:00',
+    '!"14!#243""74!#423#!8""44""52!"50#!2""88"#:31!#610"#:31!#793!#803',
+    '!"ab +1&frac14;in"(ndash;35"(times;10!),000-acre&$plan%"ft$!1#"33"!1"#340"#550"\'600,000"\'750,000"\'800,000',
+    '!$.0.2##0pm#!8"#3.5#!2""46#!7#!8""52""70#!2"#8.0#!5""96!$/2in',
+    '"$,200""-8"#.05#"11$!8#"24#"31#"55#"62"#/11"&0-yard"#40s#!5"%6,000#!9',
+    '""d."#mph!*1&ndash;20"#(2)#"3)"%.15am#"40"#/12""0%#"mm#!p#!s""19""22""42',
+    '""72""92!+2&ndash;15%*!7)!3"$-bar#)year-olds"#.19#"23#"40$#5pm""32""43""76#!p',
+    '""9p"!h!*3&ndash;18)!7"#,14""-2#!8#$part"#.11$!5#"8%#"9%")0&ndash;1"+10&ndash;11""2p',
+    '""5p""65""cm"!m""oz!*4&ndash;19"*-month-old"#.11#"3%""03#!4""11#!7#!8""23',
+    '""43""58""8p""98"!h!*5&ndash;25)!5"#.6%#"9%"*0-year-old##000"-30&ndash;1830",g/&frac12;oz!*6&ndash;25)!5',
+    '"".0#"20#"3%""0p!*7&ndash;22*!6"#/18"\'0&deg;c#"00#!g#!p""lb"#myr""s.!\'8&deg;c',
+    '"#(1)"$,800"&-carat##day#&member"#.00#"3%"#/19"$30\'s"*48&ndash;9""5p"-64&ndash;1920"#99a"!b""s.',
+    '*!4*!6"#.2%"*05&ndash;6#*9&ndash;10"+10&ndash;11#*2&ndash;14#$3+16"+37&ndash;38#"8a"*54&ndash;5#)5&ndash;6,!1#*6&ndash;57$!b',
+    '#*3&ndash;90#*5&ndash;66$!b#*7&ndash;68#"9a"*73&ndash;5#*4&ndash;79#$5-76#*8&ndash;87"%80-85#*1&ndash;84#*2&ndash;87$"/3#)3&ndash;5$!.',
+    '$#-86$!.#$6-89%"90#)7&ndash;9$!c#"8c"+91&ndash;93$#-93#$2-94#"3a""a2!%:1000#!1#!6',
+    '""40"!6"!9!"ml *2&frac12;d"*middot;5cm"+shilling;6d!&,000ft"#124!"-7"$iron!#.27#!8"#3.4""6m',
+    '$!5!$/30s!*0&ndash;39)"50"*-year-olds"#.6%"&/10/93"\'0&mgr;m#"0s#&c/400f#"lb""14""23""33"#5xs',
+    '"#khz!*1&ndash;14*!5*!7)"25"#.18"!a!%2&ins#(ndash;12)"28"#-26"#.7%#"8%"$6868!%3&deg',
+    ')"30"#.30#"8%#!9""3p"!a"!c"!m!+4-year-olds"#.1%#"4%#!9""8p!*5&ndash;26"#(1)',
+    '""5p"!a""kg""se!$6-29#&strong"#/27"+3&ndash;265"$5(1)!$7(1)"!."#/28!(8-member"#.5%#!6',
+    '#!3#!4!#:17#!8""23"!7!#cms!#lbs ,3&commat;1/2"%ndash!+,000-strong"%280ft"#750!!-"$fold',
+    '"#1.5#!m""2m"#3.0#!8"#4.3#!2""55#$inch"#6.0""71!\'0&mgr;m#(ndash;31*!4*!9',
+    '##bed"".3"*0-year-old##0ft#!g#"pc""in""pm!\'1-sept.!#2.3#"5%"%5,000""ft!#3.8""ft',
+    '!#4.8$!%""14""30""pc!&5-hour#$year"".5""0g""km!$6.4%#!7"(0-degree"&409-10#"38',
+    '#"74"#541#"99"#652"#972!\'7016-17#"42$!8"#115$!7#"22$!9#"74$!6#"84',
+    '"#256#&99-300"&303-04$!8#"17$!9#"34#"91"#434#%57-58"&519-20#"32$!3"#603$$6-07',
+    '#"35#"42$!3#"64#"88"#702$!6#%17-18#"30#%59-60"#859"&905-06#"28#"41$!5',
+    '$!8!*8&ndash;40"".9"#018$!9#"21#"97"#106#"13$!8#"45$!8#"70$!1#"93',
+    '#"79#"99"#306#"22#"32$!8#"56"#422#"47"&522-23#"33$!8#"44#"58#"63',
+    '#"81"#657#"77#"84"#732#"43"#832$!9#"41$!8#"80$!3"#905#"48#"57',
+    '!&90,000#"26#"53!"km!!r"!s!#x10 $4(3)!!-"\'megabit"%track!#.21#!a"#3.0"#4.0',
+    '"#-50##odd"#.6%#!9"+0&ndash;500#!p""kg"!w!$1.2%#!7"#/42"!s!#2.9""50"!p',
+    '""pc!$4.1%#!3#!5#"8%""22""pc!*5&ndash;75!#6.7"%0,000!#7.7!#8.5#!9"$6dx2!":3',
+    '!#cms!#gls #5,6!"-5",lipoxygenase!#.1."#4.7#!6"#75%!4/190&deg;c/375&deg;f!$0-60#$akce#$plus"".3""0%',
+    '#!2#"kg""29"!k!"2p!#3.4#!8!#5.5"\'0&deg;c!*6&ndash;60!"7p!#8.3""00!$9-60!!f',
+    ' %6&deg"(ndash;16("30!#(6)!"-6"1oxo-prostaglandin!#.1a"#3.5"#8.4!+0&ndash;100)"80#&percnt"$-odd"#00s#!m',
+    '"#:40""mm!#1.5!%38446!#4.7""00!\'5&deg;f#(ndash;69)"70""06"$6476!&60,000!#70s!$8(1)""88',
+    '!!k!#lbs #7\'s!$,100"#300"#700"!8#"50!#-12""up!#.17""55""62!#/88!+0&ndash;80%',
+    '!$1(1)"!7!&2-hole!#50m!&60,000#!0!+:1&ndash;10!"d.!!l )8&ndash;5!$,200!!-""11#!3"%track',
+    '"#2.3#!1"#75%!"/3!)0,000,000"!/""0x!$3(1)!"45"!p!%50407"!9""pc!#6.5""00',
+    '".8/1473&ndash;4!*8110-based"!3"!5!"94"!8!"km *9&ndash;15!$,400!#-15")month-old!#.05"$15pm"#25%""75',
+    '"#.50""01""ft"!m!%1-day"!3#!9!$2(2)""nd!%30312%!6%!7""rd!"45"!7',
+    '!#6.5!#80s!&9-year!"bs!"hr (a&bsol;b"\'ndash;z!%\'tuin!%-bomb"%frame""ha"%iadmk!".7"#838"$j.p.',
+    '"%s.a.p!#2\'s""07"!3!#303""25""61"!x!\'4-sized""70"!8!#610""83!"=2!+_posteriori',
+    '"!s!%bates"(beyfield"&domens"(erdonian"$iram"$rade##ook"\'seilers#)oluteness\'$ists$\'rptions#)tractness"!v"\'yssalis',
+    '"#30s"!b"\'ceptors$&ssibly##ies#*limatising#&ordin\'#(ustoming""ms"#npv"&onites#\'ustical""pc")quainting"&reages',
+    '#%olect"#tes#%ional$"va#*ualisation\'"ze%$tors!(d-libbed"*ams/prison#(ptedness"#ela"#ige"#jei#-utant-general"+ministratif',
+    '"$sorb"(ventists&%urist$\'rsities%\'torials#%ocaat!$elis")ro-engine!\'ffronts")ter-lunch!"gc"/ent_provocateur")glomerate"#oos"(reement.',
+    '$*culturists$%ppina!%hmeti"\'tisaari"#ura!%idans#0e-m&eacute;moire"#kin""on"-rconditioning#$drop#$guns"&slabie!&jaccio"%ibola',
+    '#&gadira"%agoas#"ia#"yn"$bano#"yn"&denham")ekseevich#\'xandrov#!y"$faro")l-knowing$$wise$$year#(en-mills',
+    '#$star#\'uringly".mod&oacute;var"/phand&eacute;ry#$inum""ri"&tamira#%erius%$nant#&hosian#$mann"&uminum"\'washeek!$m386"!7',
+    '"%haric"%nesic"$oung"%perif#&hibole(#ite"$stel!$nani##rap#%spids$\'tomotic#)ximandros"(cestress#"re#(ylostoma',
+    '#&ersons#"ie#&rogens"&eerood#)ncephalus##rgy"\'giogram#-lo-australian&%papal&\'spanish%#rum#\'ulation"(harmonic")imalistic$#ist',
+    '"#khu"$naba#\'otating#"us"%stalt#.wering-machine"-thropocentric#-i-catholicism&(oagulant\'(mmunists\'\'rrosion%&fungal%%glare&(uerrilla%*homosexual',
+    '&$rish&&sraeli%)modernism&.yeloperoxidase%(oxidants%&regime%&saddam%#tax&&obacco%%ulcer%%women$"ca%)oagulants$)electrons$\'fouling',
+    '$%human$(neutrons%"ou#\'oniades%#yms"&ushkia!,p-ono-get-on"#aap#*thetically"(horistic"&ically#*stogrammas"!m"#pia#&raises',
+    '"%rilia""sp!(quarians$&scutum!$rabi%#ans%*c-speaking%"st#$ceae#"go%$nese##mco"!b#\'uthnott"$cana',
+    '%%ngels$%elaus$.itect-designed)$onic)-ure-compliant$#ons$#top#%ticus#"uk"%dgour#%illes"$gles"&ianism#%sings$$teas',
+    '&&phanic"#kin"$monk#(s-length"%nason#&isdale"$rigo"#t-b$$deco$\'nouveau$\'objects#\'axerxes#)iculately$%fical#(schwager',
+    '"$ante""ha#.by-de-la-zouch#$dale#%kelon"!m"#tec##ors"&uncion"(ymptotes"#zal!&tactic#%nasov#&puerca"&eliers',
+    '"&tfield#$well""um!$ubin"*gustinians"#lef"\'riculas$&ferous$$llac",stro-hungary""th$*oritarians\'\'zations#%obacs$&cheque',
+    '%$rine$\'matised!\'vailing"#ent#$rell"+idin-biotin"%ocets"$rami!,ward-bearing"!i"!n"%right""sd!#xb5""ei',
+    '"%p/150!(yrshires!$zici"$umah %b-but"$line"%sky-b"$test!\'.d.d.a.!"11!\'abinger"%chert#)kbreaking$$date$%ed-up',
+    '#%onian"%ddest#.en-wurttemberg"(fflingly"&h-reah#!l#$rein"(igneuses"!k")lderstone#$ibar#)l-bearing%$game$&oonist$(yshannon',
+    '""na#%d-aid$&wagons$(y-legged#%erjee#\'krolled#&natyne$$eret&#man#%tered"$obab#!r"&rassie##bet#"di',
+    '#!f$"ly#&gainer#\'leycorn&!s#%nwood##one&#ssa#(r&eacute$(el-organ##set#\'timaeus$#olo"\'shkiria#\'ilectal',
+    '$"on##tia#!u"\'throbes$#yal#\'tle-axe\'&ground$"ye""ud#"gh#\'mgarten"#you!$bont"!q!"d8',
+    '!%e-bop"(ady-eyed##ney#(r-leader#&tified$$niks#%vered"%ckers"&douins#$roll#\'springs"(e-keeper#*r-drinking"\'hringer"%leive',
+    '#*ief-system#%kheir#*l-bottomed+!s$$burn"%ndery#&eficed#"ge$$uela#&ignity#\'twaters%$orth#%umbed#\'veniste"$rana',
+    '#"gh$$kamp#%inged#%nabeu$&icians$&steins#$sani#$tero$%helet$&olucci"$scot#%eiged#\'mirched#!o$$ught',
+    '#$test$"ir"&tokens#&terton$(ing-shop"#ven")whiskered"$xton"#yme!\'get&num"\'li-naei!#han!*i-partisan"!a#%frans',
+    '"%cesse#&heiros$#irs#\'kerings"%ddick"\'elefeld#%nnium"%ghorn"+llingshurst"%ndman#%gqian#"ky"-oluminescence#"me$&orphic',
+    '$"ym#-technologists"#ped"+rd-watchers$!y#$etta"$sect##sau"\'te-size"%zzerk!+l&uuml;cher"(ack-back&*stockinged&&winged%$down',
+    '#$gdon#$kely#%tancy$#her#!u"$eats#)mish-free#6tchley/buckinghamshire"%icher#%mpish#\'ndsight"*ond-haired#(od-tests&\'vessels$%mberg',
+    '"!r"(ue-print%&winged$\'bottles$$tits!"n1""25!+oatbuilders"$bbly#&sworth#$tail"$dged$#ing#%iless#\'yshaper',
+    '#"ce"&gdanor#$eyed#$gers#$omil"&hannon##len#$orok"+iling-point""li#(lettieri#%t-rig$%anski$$hole""mp',
+    '$%llack$"my#%dsmen#$soir"$odle##hoo#*k-building%*collecting#&st/cut#%tiful$%maker$#sie"(rsellino#,toni-ricardo"&scobel',
+    '##omy"(tanicals&$sing#%ching#$eler$!s"\'ucheron#&nteous#\'rdillon$#sin$0ton-on-the-water#&teille"\'wbazaar#\'es-lyon%%field',
+    '#$lful#%stead"#zer!#pcc""vt!2r&ucirc;l&eacute;e$)uml;nnich"(acteates%"on#&dstock\'"ne$&ykinin#$iles$\'n-power%$wash',
+    '#\'zenness"(eadboard$\'st-feed&#ing&$milk&&plates#(conshire#%ezing#+msstrahlung#$slin$)t-litovsk"*ick-making#(degrooms$*ge-routers#&nkburn',
+    '#(tannicus$%omart$\'tlebank"\'oadhead%$land%&swords%$wood#+bdingnagian#\'meliads$+pton-smiley#%nzing#\'okhaven%#sby$%mpark"$ring',
+    '#"gg#%isers#%sh-up#(talising"%ydges#%nllys!"s2"$7750!"ti"!n!#ubb",chanan-smith#$keye#%zacki"%ddhas',
+    '"&ffoons"%itoni"#jan"$lgar#%imics#)lfighting#$rush"(mblebees$"oy"/ndesversammlung$$oran#&kering"\'rghersh#.nham-on-crouch#$sars',
+    '#"ia$)ness-wise""ti#&tigieg""us"*zzard-like!-ye&ndash;laws"%names %c&agr#$mp;r&%sharp")ocirc;tes!$\'zak!(-banding"!c',
+    '""d."$p.r.!$/ebp!"49!\'abannes"$dcam#&etship#&illacs"\'esarius"0f&eacute_au_lait"%gayan"$ique"$lamy##cia%#tes',
+    '##day#&l-note%$offs#"ne#&umnies#%zaghe"&marena##bio#%erata%\'on-webb%#ton##ino#(ouflages#+pbell-black"\'nalized',
+    '#%darli#$more#(nistraro#!o".pital-adequacy#+riciousness##sid#%uchin$(tmedusae"\'r-based%#oot$&making$&owners#&apaces$%usius',
+    '#%bomer%$nflo&$ized#%denal$)iff-based##ews$#zza#%hartt##ibe%!s#"li#$melo#$naud$"ea$#iki',
+    '##reg$%ibean%#ker%#llo%%thers$%y-cot#(ter-ruck$&horses%&usians$$load##way"*se-history#&h-rich#$soni%&waries',
+    '$)leblayney&%court"(talonian$%tonia#$chem##gut#%hexis##ley"&ufield#!l#%seley"#ver#\'ortings!#bdc!%c-m2t',
+    '""p4!#d-x"\'4(d1d2)#$/cd8""dp""ex!#ebu"$cile"#dex"$lant#$esta#(l-y-bedd$!e$$ists$$tech',
+    '#%tiles$(re-backs\'&halves&%dness%&omeres"(phalonia#!r"$rney"&sspits!#fdt!"gs!%h\'ing"".5")adlington$$well',
+    '$&rlifts##kra#&mpness#\'nceries#%pelry$$ping$(terhouse#&rfield$"ig$$mley$#ron##sse#%tchai$%lines$%terer',
+    '"%eatle#%cksum#(ddington##lsi#-moattractants#+rnyshevskii,!y##sky$\'tergate%$vale"*iantishire#\'ckening#)gwellians##les$$lers',
+    '\'!s$$well#\'manbhai$*ney-pieces##nas$$king%!y$!n$*tz-covered#$rwas#\'tarrone$"on"%lodio$(rination%-ofluorocarbon',
+    '$,olate-coated#0lecystolithiasis#%rales$$tles#$wder"+ristodoulou#\'onicity\'"on"$ubin#$kkas#%nking#7rchdown/gloucestershire&\'manship&$town##ter',
+    '"$ggie""ll"*nema-going"!o"+rcumcisions&\'nuclear&&specte#!o"#sts")tt&agrave"+vil-service!%lares$#ges#)ss-biased%\'ifiable',
+    '"#e-1#&an-out%%ed-up%&ing-up$&rprint#3eve/gloucestershire#$nnam"%iched#(ndamycin"%ogher#(thes-peg#$ughs"%ubrep#%msier#$nked',
+    '!#m-5"!a"#hcs""ip""rn!"ni!(o-debtor%)velopment#$host"\'al-face$(itionism$$mine#"rd"&berley#"le',
+    '#$eres#+h&egrave;re$$lear"&ddling#$ices#$sall"&eliacs$)ocentesis"*ffee-break$\'in-like"%gnacs"\'habited"%iffed#$gach#(l-tapped',
+    '"$leus#%lison#%ossae##umb"#m.0#&batted$(ustibles#$fits#,ing-together$"te#*merciality$+issionaires$(on-place$\'unalism&"ed',
+    '\'+st-inspired)"ic%&tators#$ores##pac%&drazgo%&rators&\'tmental,$tion%#ted$$ered$%leter$+ressibility$*uter-using(%craft',
+    '#%share"&nacher#"ca$.eptualisations$\'iliated$%ordes%%urses#&dorcet#)eysthorpe#,flict-ridden$&usable#!k##lan#,sequentially%(rvative-',
+    '\'"es$\'olatory%&nances$(piration$*umer-goods#(tinuator$&raries&!t$&usions#!v$(enticles((onalists%"ry"+oking-holes#!s',
+    '#)roduction#,y-protection"&quetry"%rdell#\'ncrakes$#eas%%rways$+flower-blue$$iced#$onae#+porate-wide$(us-based#(rectives#$ston#$uisk',
+    '#"in#)metically##tas$"er"%teaux$$ntin#(oneaster"&uching#$ette#-nter-proposal(&themes)"op\'&claims\'&feiter+!s',
+    '%)ing-house#\'rtfield"\'ver-ups%#all##ing"%wgate"#xal#$comb"%zydry!#p26#!9"!6!&r-edta"&abbing#"ce',
+    '#%ndall$$ford$!n%"og#$pped$!s#%wlers#&ythorn#)zy-paving"$easy#"cy#*dit-rating#%eting#"on#&w-neck',
+    '#%bbins#*minalizing#%nkles#!s$)is-ridden$\'pbreads$(scrossed"&omlech##nus#%oking$"me$"ns#,ss-addiction&&cousin&(hatching',
+    '&\'species&$talk&%under#*wd-control$$step"&ustose"%yonic!#scm"!s!(uchulain"&illins")l-de-sacs#"ex#%tists%#var',
+    '#&verted#%worth"\'mbrians#\'ulation"$pitt"%rlies#\'mudgeon#0riculum-specific#$teys"$skin#\'sedness#\'tomers.&#ize"+t-and-dried##ely',
+    '""yp!"vt!"wa!#xd5!)yanogenic"&clonic"#nan!+zarnogursky",echoslavakia"%iffra \'d&amp;s"/eacute;nouement!)\'agostino#%rcais"+entreprises',
+    '!#-18"(arginine!-.melanogaster""v.!%10+10"!1"!2!#afs#$test"&guerre"$hlum#"uk"#lat#\'kammoni#)las-based',
+    '%"ks#$pish"\'ndavate#.gerous-looking##ica#*se_macabre%!y$!k"(rbishire#\'k-field%$grey%&rimmed&#oom$$ling##ter',
+    '#\'tmalchi"\'tafocus#&noides#!o"#ubs#+phin&eacute"%vidge#"yd"(y-centre$&dreams#%niter"#zel!\'e-facto#+recognition"\'ad-head',
+    '#\'f-mutes#&neries#*th-warrant%$trap"(bt-laden#&utants"+carbonisers#*eitfulness#)ipherable$#son#&system"+ductibility")ep-frozen$\'ly-felt"\'fecated',
+    '#$iles$$nate%&itives#\'lowered(#ing"\'genhart"$idre#"on%$ised#$rans##tch"\'lamotte##ian$!s#$oche',
+    '"/mand-management#%eaned$&ntedly$%trios#$ises#&janjuk#"me#*ocratizing$)kratische##urs#!y"%narii#(ervation#$ness#$plan',
+    '#(recatory%%ssant#\'utizing"\'rivable"\'scaling$&ribers#%elect#/ign-and-society#$poil""ta#0ective-constable##lev#(onations"\'usdedit#"tz',
+    '#$aney#%enter#/ice-independent#%ourer"%wdrop#"er""xy!#f=3!"gx!\'harsono!*iachronism#*gnostician#)mond-hard#\'phragms#&thesis',
+    '#$onix"*dactically"#ehl#%rdrie#,sel-electric"*fferencing"%gesta#&lossic#%raphs",hydrocodeine"*latational"(m-witted#%anche#"es#%itris',
+    '#%pling"#nny#!s"&odoros#%medes#(scorides"*rty-tricks"+saffiliated#(benefits$&ursing#(cernibly$&ounter#.interestedness#)junctions#(likeable',
+    '$)imilatory$(ociative#*trict-wide"&tchley#&ferent#!h",verticulosis#"ot"%zzied!%jango"%ibril!"li!&m1,000"$2.38$"80',
+    '"!k!\'niester!)o-gooding#"it%$-all"#215"!b"&ckwray"#ddy""ff"#hme""in"(lcelatte#%erite#/lar-denominated',
+    '$"is#(omitised$$rous"&menica#%itila##mie"$n\'t.#&atello#$bass#$etsk##uts"\'or-knob($cker"%rmand#%sally',
+    '#,ith&eacute;e"%uble-\'(standard&$ness#*glas-glyne"(w-stoker#\'deswell#\'n-slope$\'playing$&turned##sed!#ptc!%rably#%ftees%(smanship',
+    '"!d")eadlocked$&miness$%riest#%dgers#%scher$&sed-up$!t"\'ip-feed$$pin\'#\'verless"\'omedary#$sera#&wnings"*ug-dealers',
+    '%%users#$idic#%m-kit$%stick!+ual-density$"es$"ly"(ckmanton##ted$$ular"#lce"%ndrod#%ghill#%sdale"\'plicata',
+    '"$rbar$%ridge#$kacz#!o#(r&euml;s#"um"*st-covered#"un"+tch-belgian!#wec!#yas"\'mchurch""os \'e&amp;s"\'ndash;f',
+    '!#.f.!&anbald"\'r-tufts#)ly-modern%!s#\'th-like%$ling"#sen#)y-to-read"#tcl#$erie!&beling"!f!+c-sponsored""3a',
+    '"%kford"(o-system"+toparasites$!r!#dda"&gebone#&ington#$sons"#ita%#ble"%mundo"#sel!#esa!$ffer#.icient-looking',
+    '"*alitarians""bt""gy"\'o-state)!s!"id"\'ght-bit"#non"$rena"(sa-based!"jc"%ector!%ksund!*lastomeric"*derflowers',
+    '%,ro-acoustics\'+cardiograms(*oagulation\'\'neutral\'(poration#\'friends#$gies"\'imelech#$xirs"*lenborough"%phick"$vis+"$wick!,mbarrassedly#%leton',
+    '$%ssing#(rocation")endations#$rsed#$tics"%ilion"#mel"%orian#"si"*ployer-led!+nchantingly#&umeada#(yclicals"*d-december$$june',
+    '$&scopes".ergy-conscious\'*efficiency\')producing##scu""ge$\'lberger#%lands$,ish-educated"$nard#(oblement&#ing"(serfment#\'hrouded"\'tlebuch',
+    '$&apping"(viroment!&of&num!(paulette"\'hedrine$%meris",icontinental#)grammatic#&phytic#%skopi#(thelioid"%oflex##gam"!p""si',
+    '"#uis#$orum!)radicates""co"%dogan"(goclient$#pro"(icaceous"*m&aacute;n"(rand-boy"$ving",ythropoietin!\'s/9000s"#arn"*capologist',
+    '"%monde!%t4000"\'hanolic#\'eldreda%#red#,nic-minority$*ographical#\'rington!*ubacterial#$oian"&phemia"!r#&asians#%idice#%oform',
+    '$+partenariat%"en$$step"(thymides!#val")er-larger%$more%\'smiling%*tightening$(changing$$hope$&ythin\'"(idencing#*l-tempered#%ncing',
+    '!$wloe""os!$x-br##ceb$"on&$vict#(employer#(governor$$reat#\'leaders$(iverpool#%miner&&isters#(services",asperatingly',
+    '$(llencies$*ptionalism#"h.#&isions#%lusio"\'foliate",hibitionists"%ogamy"%pence%/diture-reducing%*se-account#(licating#&ositor%&tulate")tirpation',
+    '%(vasation!)ye-strain#&strain!!z 0f&uuml;rstenberg!#(t)!%-type!".i#!."#r.s!#508!"7b!"a.""bb##ers',
+    '"(ce-masks$%lifts#)ilitatory\'"es#,tory-farming"$dele""ff"$gged#%lioni"&irhall%$urst#\'salabad"%laise#*con-headed&#ers',
+    '"-mily-oriented\'(planning"*n-assisted#%tasma")re-paying$%nheit#"hi#$naby#"si"%ssett#-t-approaching%\'bowling%&medium"(ther-son"(uconberg',
+    '"%ximum!/earsome-looking"$bres"#her""in$$berg##sal"$lder##ham#.low-countryman\'#men\'(officers$\'walking#&onious"#nby',
+    '"$rman$&enters#%rando$#oan$/uzzi-montedison!$fr40!$hada!-ibre-depleted$%onics%$sing"0ction/concession"%dgets"%efdom#*ld-marshal&\'workers',
+    '%$sman"(fty-foot&#odd"#ges#\'ht-back"%lanta#\'iformis##les#&ofaxes$%podia#%trate"2n-de-si&egrave;cle#&chback#(ger-ends&$less',
+    '#%nerty"(re-power$&guards#$mlet#\'st-best&%mover%&person"+sh-and-chip$$meal#%tfuls"#tly#"ts"(ve-lever%%stage$#ish',
+    '!+lame-haired&\'thrower$&ininus#%ppers#\'shbulbs#%thead$%ulent#$xley"%eapit#%dging##uve#\'xi-time%(bilities&(le-price")ight-plan',
+    '")oor-level#%ridly#)wer-heads"*uid-filled#(oridated#"ty#%xgate"(y-halves#$leaf!\'o\'c\'sle"#ale""bs""ck"\'g-bound#"le',
+    '##ger#2ies-berg&egrave;re#&k-lore%%tales")ntevrault"+olhardiness#%tcare$(soldiers%\'teering"#ral#(ce-field%%field#$earc$$feet$)knowledge',
+    '$$hill#&nicate(#ing#%sakes$#yte#\'tnights$%ran77$+une-telling#(wardness"&s-core##ten"&ugeron#)ntain-pen%!s#%r-car',
+    '%$lane%$note%\'pronged%%sided%\'vectors""yt!,r&oacute;thi"#aga$#gle#%ilest#$nchi$%glais$.ti&scaron;kovy#%telli#$wley',
+    '#%ebody#\'ighting#\'nchness$$zies##res#!s"%iedel%#ler#$ghts#(volities"(ock-coat#$ment#\'nt-room&$seat##yle',
+    '%#fly!&tse100"!x!(ull-cost%*employment%$stop%$text$,y-integrated"&migate$!o"#nar##der#%house"%rbank#"ie',
+    '#(thermost"!s##chl#$spot"(turebus+!!y"!n"$odor -g&ouml;teborg!&(&ogr)!"+c!#-15!%.p.o.!#/24!#abi',
+    '",ily-coloured"&jewski"\'lactose$"nt&"er$#ssi#"ks##lan$#ica$#ois##pin"%mages#&e-show#!p"#ndy',
+    '$"er$#uly#"su"#rau#"bh#!i$\'mpeiros#$lick%"ng##rad#%tside"%sanov#%field#$kill%"ns',
+    '#(trostomy"\'tevalve)!s#"or"\'ucherie"#yer#$ness"$zala#%etted#!i!(badolite!#cvo!$d-fm!%eddis"%elong',
+    '"(istliche"#kko"\'lsemium""na#$itor#%ovese#$tles#&uflect"+o-political#,demographics#%ffroi#*rgia-based#(sciences$(ynclinal"#rdy',
+    '$+ain-en-laye$%iston##rie%"ng#!s#$tler")sticulate"&t-away#"_a!(hislaine"!z!+iallombardo"$bber%"ts#)raltarian',
+    '"$erek""fs""ga$%ntism#(gleswick"%lfach#$lham$#ner#%twood##van""ni"%orgis"%ssi-2"%ttin\'"%ulini',
+    '!!k!(ladhouse#&isdale#*morisation#$nton$$vill#)sgow-born$(s-roofed%!e#$uber"$eave#%itman#$nand#"ss"+ibenclamide',
+    '"!n"\'orifies#%vebox"!s"-ucocorticoids"*y-extended#\'cosidic!"ma"(urzynska!&nashed#(thostome!(o-faster"%acher#\'l-bound%(oriented',
+    '#%child#+frey-isaacs#$wins%"ts"#ffs"$lani#\'dfields$$work#(eniewski##ist"(mbojavyn#"me"&ncourt##dal#"ny',
+    '#$zaga"%o-goo#)d-morning$#ish$*son-wickes$.win/cheltenham#!f##gie#)sepimples%!y"(rdievsky%#llo#&e-text$#ngs$#tex',
+    '#\'gonians#"ki#"st#!z"#sip#$sels"$trek"&ukouni#$rley"/vernors-general"\'yigamas"%zzard!#p14!$raal#(celessly',
+    '#)ham-scott##in\'##moz#,nd-daughters%!a%*parenthood%$sire$$nell$*t-awarding%\'chester$\'ulifera#&peshot#\'ss-like%%cloth%!e',
+    '$)t-grandad&\'russian%(est-ever%%haven#&entree%%yards#$gori$$uric#$ndel$%fells##sty#&ybeard$&wackes"$iegi$"ss',
+    '#%nling#&sebach"\'oomsman#"se#"te#(und-nuts\'$plan\'&to-air&$smen$(p-living%#ers##zny"(undrisse!#slp"!s',
+    '"!a!)uard-room"%edron"\'ffawing")ide-posts#%neans#)tar-based"\'ll-like"#mbs"%nmint#(slingers$%miths##ton$#rip##ung',
+    '"$zman!#vhd!#wad!#x-7 #h-2!"8+!%aacke#!g"%bited"&ckfall$$ness$$wood"\'dfields#\'hramaut")ematocrit',
+    '##man"%ining#+r-roughened$%iness$%lines##tch"%kkari"$ldon#"f-%&amused%\'bottles%(laughing&(istening%#mad%$nine',
+    '%&raised&$ound%\'serious&$leep&%miled%&tester#$kett#$lery$\'ucinate#%teres#%yards"$mley#\'merhead#!o#\'pshires',
+    '"(nd-drawn%$grip%(me-downs%\'shaking%\'washing$%built$$ymen#"se""pp"#ram#%d-top$$aker$&boiled$%wired#"is',
+    '##ken##lay$+ey-davidson#)mlessness$&onizes#+psichordist#&tfield$$nett$%shill$!z"$sbro#$eley#%sanal"(tchments#(e-filled',
+    '"#uge"(verstock"#wed#\'k-faced$$ings$%sbill#(thornden"&ycraft#+es-drummond#$time"#zar#&elbury#&lehead!#crc"!v',
+    '!*ead-butted)#ing%*complement%$down%$high%\'injured$\'butting$$rail##ith#)rt-attack%\'rending#+t-sensitive"%braic"$dger#&ingham',
+    '""ep"%gedus"#igh#"ke#-ligenschwendi#\'mendorf##ntz"#lby#)ianthemum#&lawell$$bent#%pdesk$$mann#!y"&matite',
+    '")ndrickson&"ks#$eson#-ley-nederland##rys"#par%&inised$/ticojejunostomy#\'haestus"%rbals#*editaments$&gulins#%itors#$land##mon',
+    '#)ringbroom##ts."%sione#,ton-francois"*terocyclic#+ton-le-hole"#viz"#xam#"es"#yer#!s!&icklin"+gh-affinity%*efficiency%#hab',
+    '\',than-average$,ly-qualified$!t%"on"\'kmatyar$"et"#lde#$gard#%locky")nterglemm"(pparchus$#est"%rschl""st$\'oriated',
+    '"(ving-off!$lh-z!"nv!&obbles##ley"&dgkins"#gue"$lger#!i#$lers#$msly#&steins"$mbre#"eo$%works',
+    '#(oeopaths$*genization$\'phonous$&social"$ncho#%ister"\'ofbeats##kah$#ean$%worms#"le##poe""pa""ra#*izontality',
+    '#)rifyingly#*s-d\'oeuvre$&e-shoe#.ticulturalists$)on/oxford"%ssack##tal"%t-bed#%shots"$unam#(rly-paid#)se-buying&\'husband&\'martins%$bote',
+    '%&wifely"#wff!#s5a""fp!\'uarache"\'bristic"$lled"*manisation\'"ed#\'bucking#!o$(urlessly#$page")ndred-odd#*ting-lodge',
+    '#&stdown%"on"\'sbanded#$kier%$ness#%sites"$tted!)ybridises&#oma"(drofoils%(gen-bond(!s%&lysate%)nephrosis%&ponics',
+    '"&emalis"%mnals"7percholecystokininaemia%$help%*lipidaemic#*ocalcaemia%\'hlorous&)ondriacal-!s$)thesizing"%stery"$tner #i-i#!v!"ac',
+    '!"c4"!5"!6"#ams")e-breaker$%white"%hkeul#"or"#kle"#rdg!&dolise!#eep!#fac#!d!#gbo',
+    '""g3"*n&aacute;c#%alina#\'imbrite""sf!"i*"!e!$lana##ria"+l-disguised$#fed%%itted$&humour$\'looking##man',
+    '!"ma#)ge-makers%$/sql%&setter$$ists"%brium##ues"#dec"(f-backed"(molation#*unostained"-penetrability$(rsonated#(ingement#*lementable',
+    '#(recation%\'gnating%&sarios&(siveness$(isonable#&ugning!"n\'"\'-camera"*activating#&morata#\'nimates"\'between#$ucon")cantatory$(pability',
+    '#/ome-expenditure$+rrigibility#(uriously""d.#"ay#\'ecorous#$icum$\'e-dance$+ssolubility$(viduates#)o-pacific$*ctrinating$&lently#$ucer"\'ebriate',
+    '$\'rctions#)ectiously#)iltrative#,ra-structure%%sonic"&garden"#iki"&kwells"(nervates#&iskeen#)ovatively"(oculator".sider-outsider##tar$"em',
+    '"(tactness$!e#%egris$&lloids$*r-communal&$male\'*inisterial%&annual%&ethnic%%faith&)eron-&ggr%%lined%%marry&$edii\'#nts',
+    '\'%ntane%\'network%-parliamentary%(relating&&ogates*$ives&&upters%&sperse$$soft##ima#"or#)ra-market&.organizational&%trade%*cellularly',
+    '%+gastrically%&ocular$%iguer$"os"\'verters!$rans"#eby",on-bleomycin%"on%\'studded%\'working")removable$(spective"$tysh")vinestown',
+    '#$dore"$eult""ha"%idoro##s-3"#met"(ocaloric#\'enzymes#*merisation#&tactic$$ropy",raeli-backed"#sam#"ey#&ueless',
+    '##fea"&xassou!#vas""th"\'ybridge!#zza ,j&eacute;sus!#(t)!%.b.s.""k.""r.!,ackson-vanik#!s#%uzzis""gs',
+    '"$leel"$maat#%esons"$ndel#"na"$rdim$!y#$lath$$shof##rod"&velins"(waharlal#&lensky"\'zz-rock!%ejune',
+    '"*s&uacute;s"%t-set#$foil##lag$$iner!$ihan"\'ngsheng#$king!"ma!&o\'burg"\'bseeker"#ely"$joba"$litz"#sip',
+    '%&eyings##sts"#ynt!$p233"!r!"tc!%udean$+o-christian#\'geships"$ngly#&iperus#&k-shop",stifiability +k&auml;hler")eacute;pi',
+    '!"/u!%abuki"\'chcheri"#ere"$fala"&geneck"%linin#&lisher$#man#!v"&malian#"co#"el#!m"\'namycin',
+    '"\'ramazov##oui#$rass#&yotype$$stos"!s##dan#"sa"\'uffmann#\'rismaki"\'zimiera!#df9"!u!&eebler#$pnet',
+    '"#ira"&lfazin##ims"+rb-crawling##nal$#ing#$tesz"$ssel"*toacidosis$"ne##ura"\'ukenhof!)habarovsk#%nates"$edda',
+    '!\'ickback$#in\'",ff/reporting"&lbowie#\'lamarsh%!s$(ingholme%!p#)ocalories$%meter##sby"\'ngmambo#$mond"%rlian"$sumu',
+    '"&t-kats#)chen-sink\'*/breakfast\'$maid#(e-flying##ing#%ovani##tel""xx!#jhg!&lammer"$eeli"#ick#,nitsky-klein!$mfdm',
+    '"%amber#$vish"&eelers"\'ighting#"pe")ow-it-all$$land$&n-item$$ynge"+uckleduster-!s!)odachrome")i-keepers##chi""ol',
+    '"*ussevitzky"#zma!"pp!$razy"*ebs-ringer"#ibs##sty"\'onecker#)pivnitsky")ugerrands$#ier#%mbein#&shchev"&ystyna!"ss',
+    '"#lik#+turstiftung"\'nunurra""pa#"ka"1rf&uuml;rstendamm#%osawa""sh$#ner!#wan""vr!&ydonia"$noch"%thera"#ung',
+    '#&macr;l)!a!!\'"&abbaye"&enfant#%sprit!#-15"&plates!%.c.m.""l.""p.$$g.a.""s."$t.e.!!8',
+    '!%aager""ba#%ility$"um"$chin$&rymose#$onia"%djang#!o#\'yfriend"%ertes#%trile""ff##ond"%kshmi',
+    '#$bast$&sdorff#"da#$ella#\'mermoor#&psilis#!y""na$#tus#$cets#*d-dwelling$&esbank$%mines#)goustines$,uage-systems',
+    '"(rchfield##ded#\'ge-eyed%%scale#$kcom"*sciviously#&erwave#"sa""ta#%e-age%)flowering%*nineteenth"\'ubscher#(chhammer"&vatera',
+    '#"vu"\'w-codes#(n-mowers"#xer"$ybys#"ne"%zards%#oni##ier!\'eachate#&d-time#(f-people##rie$-ning/teaching#.st-significant',
+    '"*cture-room"&dgered#"uc"#ece##der"\'fortovo#(t-footed%$half%\'liberal")g-pulling#$asov#$spin"*igh-on-sea##nen$(twardine',
+    '$(ing-like"%ndrem%!i"-onards-on-sea"$pkin"*ss-skilled"%t-off#%table$(er-boxes"%vator#\'erkusen$#son#&itical"&wdness"%xmark',
+    '"!s!%ibber#*erationist%$ians%#tad"&cencee#"it"%dless"&feform$1span&mdash;pi.log$%world"!g#+ht-emitting%+heartedness%%s-out',
+    '"*ly-livered"&mbrick#(e-washed#)ited-over##ned##osa#)p-wristed#!s"\'ncrusta#+dley/thames#)en-draper#&t-free"&paemia##kin#&ocytes',
+    '$)id-cooled"$sped#It&mdash;complete&mdash;root&mdash;package$(enership"$t-up#&eraria\'*y-critical&#tes#\'tle-uns")ving_room#$orno!-lanfairfechan$%gynog$\'steffan"#mas',
+    '#$sang#$worm"(calizing#&hmaben#&k-outs$#age#(o-hauled"&destar#!i",g&mdash;file#,arithmically#$gias#$wood"(in-cloth$&cloths',
+    '"\'mbardic",ng-barrelled&%laded%%house%\'netting%"on%$past%$stop%)wheelbase&%inged$$bows%%right$+er-distance%(st-lived$&ifolia',
+    '$%stone$#ton$%ueurs"&ok-see##mis#$p-in#&sehead%&strife"0peramide-n-oxide"-riston-clarke#$rain$\'y-loads"&st-wax"%verin$\'y-dovey',
+    '"&w-dose$$mass$$rent%%oofed$&sodium#0er-working-class$\'st-paid""ya!$uath"%bomir""ci"(ddesdown##ger""gt"\'ke-warm',
+    '"$mens"%ndman#%edale"!r"$shly"%thier"&xmoore!&yallie"%chees##ian"#die"#s23"#the -m&aacute;laga#(mp;sup-3',
+    '"(ouml;lln!(.spretus"!y!"23!%aaloy"&c-like#$chio#0hine-independent$#ten##ier#\'karness$$eith$"in#/laren/reporting%$urin',
+    '#%paint#\'rocells"$dams$!n$%riaga#\'chester#%gwick##ley"%evius"%gdala##ics#$nums"$hout"\'ilboxes$#lot',
+    '#$stre"\'jorette"&karios%"ov\'!a#&hkamov##oto"\'ladroit$#wis#$dive#*e-specific#$lins#"ti$!y"\'m\'selle',
+    '$%based$%rider$#sin#"by##dle#(ifestoes$(pulatory#$nose#$ohar#%tling#$upur$!s"%rbury#&dakert#&garets',
+    '&"s.$&ovitch#"la#%moset#$pole#$sala$$hes.$$ilid$$tons#\'tinelli$"ov#$yann"%scall%$rade#"ie',
+    '$#eur\'!s%*y-ferguson$!i%&veness$!u#)ter/slave$\'ication"&tchman%$wood#,erialization#$hcad#"os##ric#%tison',
+    '"$uban#\'retania#%solus"+ynard-smith#\'orships")zankowski#$zaro!#bas"!i"#oya!%c200s"&auslan"&burney"%carty#\'latchey',
+    '#"ue"$dade""ed#$wans"%gavin#\'ettigan#$lynn#$real"&kernan#"oi"&larens"$nall"%phail"\'quillan"&vities',
+    '"&walter!"dm!\'eagrely#*n-variance$!e$&ing-nn#&t/mate"*chatronics")diastinum$\'caments%&olegal%"us$&olanum$\'um-pace\'%scale',
+    '"%gacad$&trends"#ham##ran"%inhof"%laugh##ker#!l#(odically#"un")morandums""n.#$eses#&ninger#(servants',
+    '"&phitic"\'rcereau$$ouri##gus#+ionethshire##kin#$riam#(seysider")skhetians#$lier#&merism##nel#"o-#%senia#%tizos',
+    '&\'workers$)morphosen$)physician#%eosat#$hode$.ylanthranilate##ing#$res.$%oland#$sing#!t"%vlana"&xicana!#g/m"!p',
+    '!%hairi"!s!%ichal#\'kiewicz#+ro-organism&)processor&&second\'&urgery%\'kernels%)particles"\'d-1880s%#986&"95$*cretaceous$&priced',
+    '%%pring%%tride$%third##air#/brain-hindbrain#(dle-east&%sboro(*rough-born#&lander#\'morning##ori#(radially"-ght-have-been"$klos"#lch',
+    '#"ic$+tary-backed#\'lbottom$*enarianism$$gate$%ibars%)on-a-year",nd-expanding#)eral-rich#\'i-album%,conglomerate%%rugby$%skirt#%shuku#&uteman',
+    '##com"&roslaw#(ror-like&)/sporting"-schievousness$-lassification$#ued#(feasance$%iring#.identification#*perception$)ronounced#$tley$$rial"\'tchison',
+    '$$raic#$ring"\'xed-sex#5ture-of-distributions"%zoram!!j!"k9!#l/h"!t!$mc\'s!"nc!%obius"&derner#/ule-sub-type-is"#gae',
+    '"%hajir"$iled#/sture-retentive"&lehill$%years##ins#)lycoddled#%tmann""me$$ntly##per"%nahan#&dragon#)eylending#%icker',
+    '&%romes$$line$&zygous#&tacute%#ner$$enay%!s$$juic$&mirail"&onrise#2re/gloucestershire"&raceae$$inic%!s#$celi',
+    '#%maers#"na#)phologist##rie#%taria$%ician$$lock#"us#\'wenstow"\'sambiki#&hinsky#$m/kg#%sycop"&thered&\'s-to-be',
+    '"(uld-made$$inex#%nties%#ney%&pelier"*vie-makers")zambicans##zer!(p/health""gs!$rcvs!#syn!#tcr"!d!"ua',
+    '"*d-slinging#$dies#%slide"$faro#"fs"$hsin"!i#"te"!l#$atto##ish#$lett$#ion$!s#*ti-country',
+    '&&headed&*locational&(protocol%&colour%$form%(language%&parous(%tyism&(otential"\'mblings"&nchies#"dy#%stead"&rav\'ev#$dani',
+    '#&kiness"\'scovado#%ettes#)ic-lovers%(ologists#\'lim-led##sed$!o#%tache$%iness"%tawas#"ti#(ualistic!&yalgia&!c',
+    '#\'rscough"#int""nd"\'rtillus"%self.#$tere"(thopoeic %n\'zau!".d"$e.2d"$m.r.!#=23!#aah#!n""bb',
+    '#"ph".gorny-karabakh"#hco"#idu#\'lbiting"$llet"*me-calling%(dropping"%naimo#"di#&omolar"(perville"(rrowboat*!s"-sohypophysial',
+    '\'%ising%#ism"%uruan"$vels"%zeing$!r!"bi"!t!#cmd!"da!,e\'er-do-well"!1")apolitans#)r-certain%*hysterical',
+    '#&uliser")cessitous#&kbands#)romundans""el"\'fertari%\'ukhebit"\'hushtah""jm"%matic"+o-confucian$(populist#(terminal"$peta#"os',
+    '"%roche#)ve-ending&%glove"$ssun#$ters")therworld#"ls#%power#$worx",uroendocrine%,nal-specific%\'tically#%stadt"3ver-to-be-forgotten##sky',
+    '#.castle-on-tyne#3ent/gloucestershire##itt#*ly-painted\'\'romoted#+s-on-sunday%&reader$(papermen$%watch#\'tonmore!%foapa#!l!#gai""oc""vs',
+    '".c&eacute;phore#$colo#$klin")ght-shirt%(clubbing"%kkila#%olaos"\'ne-inch%&strong%$week$$fold$#tte##ham""ra!"kr',
+    '!#ndr!\'o-shows#%where"#.17"#ght"!h"$illy#%seuse""la#"le"&madism#\'inalist$"sh#"os")n-abusing',
+    '&(renergic$)branching$&causal%\'hemical&)olinergic%$lass%)ollegiate&(mpulsory&)nformance&)operative%(riminals$&degree&(mocratic&(tectable%*imensional',
+    '%*quilibrium%(uropeans%)valuative$&flying$0gastrointestinal$+handicapped$.implementation%*nferential&+stitutional$$jews%)udgmental$(magnetic&(instream$\'neutral$$poor',
+    '%*rogrammers$)relatives%$igid%)otational$\'setting%&patial%(ufferers$&target%\'emplate$!u%(nionised%#ser#)essential#&senses#\'violent',
+    '"&rdhaus#)mal-sized#\'rington#$tons"%se-in#$tell""ta$$rial#%elets#*ice-boards#\'re-dame"$uhak"&vaceta$!s#&elette',
+    '"(w-famous!"rp!#sas"#clc!*ucleosides"%dists")lliparous".mber-crunchers$%ingly"(nciature"(ptiality"*rse/doctor#&turant&"er"#sec',
+    '#"ts""ww"%zzles!"yc""pd (o\'mahony!#.t.!#afs"&klands""re"$tley!(berhuber"\'jectime$\'t_d\'art"*lique-slip',
+    '"$sess!\'ccludes"+eanographer"&kenden"&tagons$$ntis$$vius#$iron#-ober-december!"d1"$ense"#ges"$ilon"#one$$toid',
+    '"#sal!%eddba"(thelwald!#ff-#&chance#(iciously!$gley!#hne"%rmazd!"ik"*l-drilling$%lamps!"ka"!b"#ner',
+    '"$iffe##gos#$vera"#mec"#ton"&ybrius!)mbudsmans"#ero"\'matidia!%n-air#%costs#%sight$%treet#%train")ce-mighty',
+    '$%flesh$%horse$\'phoneme$$seat$\'to-four##ish"!t"$yett!#ofy""zy!+pen-hearted$%/oltp#+rationalise"(hiolites%%myces',
+    '")portunely()istically$&sed_to%\'iteness"\'timiser#,oelectronics"\'ulently!+range-juice##tio$%orios"(chomenos"+dzhonikidze"+ganogenesis"#han"$itur',
+    '"\'ocaecal!.scar-nominated"%lerus#)obodjenje"$mena#&ometer$\'therley"#sis"\'tinatos!"te"/her-worldliness%\'worldly"%tokar"!u!\'ughtred',
+    '"-t-of-contract\'%focus$&relief#$face#%sells!(ver-awed%(dramatic%)emotional&(xpansion%+familiarity%\'hanging%\'indulge\'&volved%*regulation%$view',
+    '$$dale$#eat%+xploitation\'%osure$\'growths$$play"\'ulating!$wada""ne$*r/occupier%%ships *p&ndash;40!%-bass!#.24""33',
+    '""60#!6""87"!s!$/36/!$1/t3!$2/t3$!6"!6!"31!"40!"51!%=0.09!\'acifico#(k-horses',
+    '"+int-stained#\'sleyism"%lazzi&#oli#&e-pink$\'nickova$-stine-general#%freys#%matum#%pated$\'itating"$mirs#+phleteering"$ndit#$jabi',
+    '#\'shanger#$tone##uke$!p"&pariga#\'erchase%%house#&illary"\'r-three#&abolas$+llelisation$"ng%#oic$(scending%&itized',
+    '\'#ing##ekh$(nterally&%hetic$!s#$fums#(is-dakar#*k-and-ride$%hotel$!y#"le%%ments$.iamentarianism#"ra$&icidal',
+    '#%thian#\'vovirus"%salar#(seggiata%-nger-carrying#(zti-bott")thfinding#&riliny%%moine%#zia#&tenden%(rn-maker*&tching"%ulson"#ver',
+    '$(to-throw##in\'!#bds")luescript!,c-compatible#%write""ch"&smy1.4!"dt!(eace-tax%%haven%!s$(ock-blue#$ford##led',
+    '##ses"&chiney"$dalo$#nts#(ological")ebleshire#&p-hole"%likan#"la$\'etoidal"$nans##ces$&il-box\'$thin#&dragon',
+    '#$hall#(icillins$#ket#&kovsky##nal%!n$6ington/gloucestershire$$zoil#%telic#&urious"#ons"(psi-cola"$rces##ego#(idotites',
+    '$%renal$+toneovenous#%jured#+locutionary#-manent-magnet$(ittivity#(plexedly#$saud$\'ecutory$&istant$#son#&tamina$#ini"&t&ouml#!.',
+    '#&herton#%rakov%!s$*ol-powered&!s%$vich"&ugeots#!x"\'yroulet!"f2"#alz!"g."%a/pgc!)hagocytic#&lluses',
+    '$+macologists#(sing-out##tic"!e##lim$$oung#+nothiazines$"yl"*ilosophize#%mosis"(leomycin")onetician$!o#%sgene$*phate-free',
+    '##tic$(o-copies&$pass%%diode\'*ssociation%*ionization%*journalism%%metry%$play%*synthesise%*transistor&*ypesetting!%ialat#%stres"$ckie',
+    '%!r"(ece-rate#$rcey$&marini##tas$"ra"$ggot#$htle"\'kestaff"\'melodus#$ping"(n-points%%ricks#\'acoteca##eau',
+    '#$ging$!s#\'k-faced$&hammer#$more##nel#$outs"$ombo")qu&eacute"$sano#"co#&s-take$"er#\'toletto&$iers',
+    '#\'ilessly"$xons"\'zzaland$!i!$kzip!%lagne##ids$"n\'%(-clothed&(speaking#%n-led$#ers$(t-eaters%$life%$sman',
+    '$\'ticiser#&tefuls%%layer$%nauer$!y#%yland$&script$\'writing"!d"-ea-bargaining#$ctra#$dgee#$shey#"ws"!m',
+    '$$head#%mpish%"ly#\'tocrats"!v!&mol/kg\'"/h""sg!-neumoconiosis\'#yte&$niae(!c""ms!%oiana#*nt-scoring',
+    '#*di-pezzoli#&eglass#%idori$.tical-military\'*o-economic)(military%#zer#(o-necked$$idal$&naises##sby$"ky#$veir#&ybrene$(morphine',
+    '")ntblyddyn$$ifex$$oise$!y#(y-tailed"#ofs##ped#$rish"&p-eyed#%padom$"ea#)ularisers(&zation&$ting"%rkers',
+    '$\'landian$$wine"$ssee#,t-compulsory&%reole%&exilic%$gulf%)holocaust%-industrialism&!t$(lethwait$*modernists$&partum$\'ulation$%woman',
+    '$&holing#%holed#&terton$#ies""uf#!m#%ssins#$voir"*werdisplay%$play!#pg7!+r&ecirc;tre"!3"$adip#$eger',
+    '#(yer-book"&e-1945$,agricultural$&budget$*censorship%\'linical$\'drilled$,erythrocytic$&formed$%lunch$(pubertal$\'reading$#ski%%ummit$*tournament',
+    '#$bble#)ciousness#&filter#)generated$&lacial#*historians#\'nzlauer#"p.$*osterously$%utial#&season%(nt-value\'&iments%%rvers$(pecified',
+    '%#ley$#tes$)umptively#%tense$&tified\'!y"%icker#&estman##kaz#&marolo#$ndep$\'t-based%&makers##ori#(son-ship',
+    '"(o-german$&moscow$\'zionist#(actively$)rrhythmia#*blem-based(&solver\'&atized#)cainamide$\'edurals$(oagulant$%uracy&&ements%%ticle#&embryo',
+    '$/it-maximization#,grammability((e-making%(essivity#\'kinetic#&lixity#&motors#"pe$(itiatory$+rietorially#%sequi$%ignia$&pected#$tech$-on-antiproton',
+    '#!v$"an$\'ocateur#$xied""sc"%ussic"&zemysl!%sepha#(udacorus%\'o-cleft\'(variable")ittacidae!)terosaurs!-ublic-private#&master',
+    '#$elle"\'ffballs"&gilist#&nacity"\'issance"%latov#\'borough#%l-ups#\'monaria"(mp-house"(nchlines$)tiliously%%uates"&rifies#(kayastha',
+    '\'#ing#*ple-leaved$%ureus"%ssies"$tten"(zzlingly!$vm39!!y",elonephritis"(roclasts$)phosphate$%xenes "qd""ot!#iao',
+    '!"sp!)uadrature%*ifasciatus&(laterals#!m#!n$.tum-mechanical#$rmby$,ter-finalist#.si-arbitrators&&delict&&market\'\'ilitary&&public&&sexual',
+    '##sta##tta",ietly-spoken#&rinale#!s -r&aacute;kosi"\'uuml;he!$\'n\'b!"-m!%.i.p.""r.!"10"!3"!9!#526',
+    '!/74(1&ndash;517)!%:base!!=!#aad"+cer/trainer$&tracks##kam"$dian%#tum$&cality$(o-opaque%&phonic""fi"%g-tag#$gedy',
+    '$!y##out#$worm"#hab"&illery$\'workers#$mund#*n-affected%&clouds%(drenched%#fed$,bow-coloured$&coated$"es#"sa',
+    '"&madhan$%nujan$(pithecus#%ified$"ro#$phal$"ur#$rath#$seys"&naridh#&domize#%somes"&phaelo"\'rotonga"#sch',
+    '%!s"#t-1##bag$#ird#(e-payers#+ional-legal#$liff#$tler"$west""ya##son")zor-edged!#bic!-e-arrangement&#est',
+    '#%check$)onsidered#)deposited$)iscovered#&echoed$)nactments$0pithelialisation$&xports#+instatement%)tegration#$join#(launched#(marriage#&offend$)rganising',
+    '#\'roofing#%sells$#ign$#olv#\'thought"-accreditation#\'d-write$(y-to-eat)#use#$l/ix#)r-engined#!s$\'sembles%#ign")balancing',
+    '#(alculate$,pitalisation#-eiver-general(%ships#(hallenge$+erch&eacute("es#%oding$*lonisation$)mposition$\'nverted$!r%)d-players#\'reative#&toanal',
+    '")d-bricked#,istributions#$line"#eky#&ntered#!t#)ve/thames"&finish#&lexion$%uxate#&olding$\'rmatted$#und"%gales#(enerates',
+    '"#hab$"ng"(ichsbahn#\'nserted%%urers#$tzle"#jig""la$%table#$ents#(icensing"&manoid#%igius$&nisces#&oulded',
+    '"#nan#*egotiating#.in-angiotensin#,ormalization#/ts-to-mortgages#"zo"*orientated"\'planned$&icants\'%tions%!x#+ressiveness$)ogramming%&vision##ub.',
+    '"&routed"%sales##eal$&ctions$%rvist#%olver$&nantly#.ponsibilities.)$lity(#ons##ton%#rff"%tecta#0iculoendothelial$#n-a',
+    '$#ree#&ooling$"ur#%racts$)ogression#"ty"%unify"&verser#%iling$\'taliser$&vified#$usky"%works!"gn!$hein',
+    '#,umatological!"i-"&ccardi#&ochets""ds$$dale""ed"(ght-side"$jeka"#kky"#mir#$ming"\'ng-like"#per#%ostes',
+    '#*e-and-fall#*k-adjusted%&return"(tornelli#,ualistically"!z#$zoli!"ld!"mg!)oad-block$*worthiness"&berson%(tsbridge#&illard"+ck-and-roll',
+    '""dd#$eric#!i"&entgen#%rmond""he")le-models#\'lestone#!m"%manby%"es$!x#$uald"$okes"%rstad',
+    '%"es%"ia$#nne#&dolsky#(e-garden$#ate$$lyne#!i#&sitter")therfield#$ters")ugh-edged#\'ncewell##ses$#set',
+    '"&wledge##ney"(yal-blue"$zier!"ti!$ubha#$rics"\'ck/maul"\'dbeckia##kin##ner"*eschemeyer"$ffed"$gova"&hleben',
+    '"%mback#"er"$scoe#$land#\'t-proof$%iness"\'thenium##tan!$x-80!(ye-grass#%croft#)dale-york 6s&eacute;gol&egrave;ne)%zanne")oslash;de',
+    '!)-labelled""mp!&.15(1)"$2(3)""52"!9""p."$t.c."#w.1!#120#!3""35"!5##(2)""78',
+    '"!4"!6!"33""43!#416"!2"!c!%aadeh"$bata%#ier#$urov"+cr&eacute;e#!u"#deq##s-l',
+    '#+ety-deposit\'#net"%gdeev#$gers"\'ilcloth#.nt-jean-de-luz+,pied-de-port%/e-engr&acirc;ce"&kamoto#!i"(lahuddin#"en$%sgirl#"ic#%omons',
+    '"\'majwadi##bar$$rook#-e-lamborghini#%hailt##mon#"po#$uilo"(nd-dunes%&filled$"by$#ino$\'papered%#its$$rock',
+    '#%glier(!s$&uinary#!i$#pet#"jo#%serif#(t&eacute",ponification"%rabia$"pu$$stro#%butts#(cophyton#$fati',
+    '#$ovar##ris"%s/lbs#$ines#&senach%!r"&tchels##een#$iate"$uced#%lnier#%niere#+sage-shaped#&ternes"(ve-a-can',
+    '"\'w-tooth#%tooth!&c53116"(antronic#!p#*rlet-faced""dc")h&uuml;tz##aaf$$tzie#&egloff$%ibler$%lting$$mers#(istosome',
+    '##mit$#uck#(ool-days#%rader$%eiber&"er#*warzenberg$"er&"in"&ienter#$llas#!o#$rpus#&ssored"#rag',
+    '#(eamingly$*en-printed$&w-eyes#\'ibemole$%mping$)pt-writer&!x#&uffier$&tineer"*uba-diving#&mbling#\'ppering#%rries#$tari"\'ythians',
+    '"!o!*e&aacute;n")a-monster$\'stories%&urface$(watching#&change#(led-unit##rby$&chable#&toller##way$#olf"%cundo"%ethes',
+    '#+regationist"(ignorial#"ji##sha$\'mically"(lahattin#*ectiveness#0f-administration%%blame%)certified&\'leaning&)orrecting%+determining&)isclosure%&review',
+    '#"le$&swords"(maphores#&enyaka#)i-circles%)empirical%(finished%$hard)$wood%$nude%&strong%%urban#"ra""n.#"ad',
+    '#&sitise\'&veness$&ualist%\'ousness"$pias#&tembre$*uagenarian"&queira%$link",rb-populated#&enaded#"ia#+opositivity#(pentines)#ite',
+    '$$eert%\'r-based&!y$(icewomen"%t-net#)on-watson#%point"-ven-under-par&(week-old%%pence$#ran%"es"(wingbury")x-matched"%ybold',
+    '$#ert!"fc"!v!&ha\'ban#&ke-ups$%ingly#*llow-water#*melessness$$ming#!o#+rk-infested"&beilat")cherbakov")ell-holes&&shaped',
+    '$$riff##wed"&ieling#%fters#%ndler$#gly#(p-repair$%loads#$rvan"#oom#\'p-front%(stewards$\'fitting$#man$$worn',
+    '#$tter#(ulder-in&!s#%wgirl$%house"(ubunkins#"ck#"ra##sha"!v!%ichel#$ilia#(k-making$#bed$!o',
+    '&\'lipping%(whiskers$(slipping%$wipe$%track#$orov#"ur"\'ghtseer$#vat#"ue"(lberston#)houetting#$loth##opi#*ver-backed',
+    '$!i%!u"%mcock#!p#%ulans"&ne_die#/ger-songwriters$\'le-copy\'$deck+#ers\'(function\'&record\'&spaced&$tons$"ye',
+    '("ly#(o-indian"#raj"&sophon"&t-coms##pro#!u"\'x-sided%$peed$(week-old#*ties-style$\'y-fifth\'#oot!"k1"&elhorn',
+    '#\'tch-pad"(ibbereen#)lls-based##nks$*ny-dipping&!s#"pp$#sea#"rl#%vvies"#lar"%ocpol#%kholm#"ol"\'ull-cap',
+    '#%train!&laking#$loms#%mmers#\'nt-eyed#*ughterings)!s"%eeman$"ty##vin"\'ickness#"wa"(o-cooker##per#%uches',
+    '##zil"&uggard#(mberland""xi!"m3"+all-spotted"$eary#%ctite"#ike"!o##och#(rgasbord"%yslov!(nack-bar#%inton',
+    '""dp"%ooper#%rkels#&w-melt"&uggles!$o_on"$bell"&called"#den##nom"*ft-centred"$laic#1icitor/registered"(mbreness#&erford',
+    '#(g-writer#$oran"%on_as#"th"%phias#+rintendenze""sa#$kice"$telo"#upe#)rce-level#,th-southeast%\'ernwood%&fields%$moor',
+    '"%wings!%pader#*nish-style#(rcsystem$#red#+tiotemporal"\'earmint%%point##cht$,ial-interest\'*ly-adapted\'$ness%+es-specific$&mark89$2trophotometrically',
+    '#+ed-reducing%$bird%#ers#(rmicidal$!o"%ieler#%llers#$nets$(nerettes#\'ritless#)tefulness"!k"(lanchnic")ondylitis#\'rozoite',
+    '&%woman)"en#"se#&tswood""pf",ray-painting#\'ingvale&$well#&oatley"&umante#$tter"\'ymaster##ros!(quanders#%iggle',
+    '!#rbh""sp!"s6"&c/0.1%!*t&uuml;nke",acker-cranes#&ffware#\'gecraft$$ings#$iner#\'lagmite#%mmers#-ndard-bearers)\'setters%$pipe',
+    '$#sky$$tups$#ves#+te-centrist&$wide$#ics$"on#(venhagen##yte"*eel-tipped$*plechasers#%fania$#fen#%ichen#)p-brother',
+    '$%ilize#-venton-rogers#-wart/scotland"*ickability%#ily#$eber#,ff-upper-lip#%ggins$(matizing#\'lettoes$&l-born#)mulations#$nger%$rays$(kdolomit',
+    '""oa#$bart#*ck-holding%$list%$wood#&gursey#)mach-ache(\'turning#\'nyhurst#"ok#)rageworks$$eyed$#ici$(m-clouds%"er',
+    '",raight-ahead)\'through$$sser$\'t-style%$hern##eat$*ptozotocin$$ssor#%icker%&turing$(ke-bound\'%force#)oboscopic$%mboli$+ng-smelling',
+    '#&uthers"(udebaker!+ub-branches$(district$%goals$)licensing$\'periods$&tenant$&warden#%adult$(ntarctic#*categories#&deacon#)fertility#)normality',
+    '#(sequence%#rve$"id&\'isation$$tate#(terfuges$%otals#(versions$$ocal#$zero"\'ccesful#\'het/itn"&ffixed$&ocates$$uses',
+    '%%-beet")leymaniye#"la$%ivans#\'phoxide$%icius"(mmations$\'er-time#$pter"+n&ndash;sat#\'account$"rt##der&#ing&%lands',
+    '"(peradded%)continent%$fast&"it%%grass%$stor#)pressants(#ors"&rcoats#&liness#%mises$%ounts#*vivability"%ssing"&trisno',
+    '""yo!"vt!#w16#!9"#213"#ade#\'efheard#\'mplands#+rtzentruber")eat-shirt("op#\'denborg#*et-natured%#pea%$spot',
+    '#(ngometer#$shes#$tzer"\'ooshing!$ybyl")llogistic"\'mpatric",naptogenesis#+chronically$"ro#%fuels#(thesizes"\'racusan$!h""se',
+    '!%zeged &t\'mill!"-a"%bonds"!i"$type"$year!%.q.m.!#160!(2/tap1+2!"aa"(blatures#%ucchi"#cho$,yarrhythmias',
+    '$#ley##tel")il-enders%$skid$&planes#%nting"$jiks"%kashi"(lbothays#&l-herb$#ack#$oned"&marins$"ti"&ncredi',
+    '#&talize"(pestried"$rawa#"eq#"lo#&porley#$sier#$ting$$ness"$tlin$#ock#"ti$#vic"$upin#"ri',
+    '"#vey")x-dodging#%i-cab#*onomically"\'ylorist!+cherkassoff""ms!$e671"(a-chests$\'parties$&things#0cher-researchers%,ing-learning#*m-teaching#*r-streaked',
+    '"%chnic%+ology-based"(ddy-bear"%guise"&lemine$$soft#&scombe##ugu"&mminck#3perature-controlled$#ler$%orall&$eros$#ter",nder-hearted',
+    '#*tativeness$"er##uis"(pidarium"#rah##man$#ism#,ra_incognita$(eblanche%"ll$&ington##uel"#ske#&situra#)t-playing',
+    '#)rapeptide&$loid!"fi"!m!\'haddeus##lia$!s#.me/oxfordshire#"ni"%earle$0tre-in-education#\'ocratic$%dhori#\'rapsids$#mae',
+    '#$ydon"$ieme#(ngamajig%$ummy$$line$%nings#(ocyanate#$rty-&#ish#)s-worldly"%karni"#oll$"os#%mases$$sons',
+    '$%n-emi#+ught-bubble"#r25#)ee-bladed&*generation&\'hundred&.quarter-length&%speed#(oughflow"-un-hohenstein$%derer#%rstan!%iaras"!b#$bett',
+    '#%shelf",cket-holders$$hill"&desman"&ebacks")ggywinkle"%lburg#$lman"\'mbering&$lake#\'e-delay%$free%\'limited\'#nes%\'serving',
+    '"(n-roofed"$pasa"&raspol#*ed-looking$$sias##iac"#sch#!h")tle-deeds&"is%&holder!)latelolco"!v!$n3.1!\'oadying',
+    '\'!s"$dney"$eing"&inette"%lboys##ley$$gate##man#%staya"\'mboyish",ngue-lashing#"ka#$tons"&ol-kit$$bars',
+    '"$p-10#"ee##ley#!o$)isomerase$&logies#$sail"#ray##mes#&telier"%sspot"*talisation"%ubkal#(chmaster#*gh-talking',
+    '$&nebise"#wle$#ine"$xoid"#yne#$otas#$shop!$pc-b!"r3"+ade-related$$uced#*il-blazing$&nloads$$psed#\'mmelled',
+    '#\'ncelike&!y$%quilo$*s-national%+avanguardia%&ducing%)itoriness%+nationalism%0port-independent%&rectal#&pdoors#&simeno$!k$&tevere#\'vesties',
+    '"%eanor$*tment-room#"ib#%kkies#%ndier#&poneme)!s##sco#!u")i-apsidal$%plate)!s$\'service#&alling$\'thletes',
+    '$$orne#-ed-and-tested#)methoprim$"ly#$nder#$reme#$s-cl$(megistus#$tton##vet$*ialisation"%ockel##mso#$pism#!u',
+    '#$well"(ue/false#)stbusters!&schudi"$ogdu##met!+ub-thumping"$grik""lu"%milty#$ults"\'nisians"&rbaned$(ochannel#%moils',
+    '##pie#$riff"%twork!"vb!*wenty-mile\'.three-year-old"#igg#&nbrook#!x"(o-second$(week-old!$ylee"+mpanometric"*pographers)&ically',
+    '#"ie##ode$!s#\'rhenian#%whitt"#soe!#zar &u-bend!).s.p.g.a.!"a2!"cn!(daltsova""hk"!m"!t',
+    '!#hde!"is!\'k-owned#$wide"!8!(lcerogen"%lmann"$s/me"(tra-high&%sound%)montanism%$tone!&n-iaea"%alike#(mplified',
+    '$)similable")balancing$$nned#\'othered#\'ranched#+usinesslike")canonical#*ompensated#\'ultured$%rling""da#&er-15s&(achiever&$cook&$fire',
+    '%$arms%$body%(clothing%"ly%+nourishment%\'payment&\'ricings#*iscussable"(emphatic#&xcited$\'ercised"+falsifiable#&itting#\'ocussed$(rmulated',
+    '#%uents$$ided"\'icenter#+formitarian#+lateralists#&ndexed#-on-management#%press##sql#)versalise*#zed"\'knotted"%laced#%ooked"(mannerly',
+    '"\'pressed$(otesting"\'reached%\'lizable$\'claimed$(flecting$&vealed#%ooted$#ped"+sensational#&kilful#&tirred$&rapped#\'urfaced%(passable',
+    '#*hriftiness#+ouchability")validated!&p/down"%azila"$flow"(lighters!%ra5-6"$eter&!s""fe"#ian#$dine##zio"\'s&aelig',
+    '+4.00=ec&dollar;2.6976;$7069+"60*%2,100+!1+"30+%5,000*%3,500*#400*#800"+-vietnamese""a."0efulness-ratings"(herettes%$wood',
+    '"&urious""yn!"te"$ting!$unet #v-2!#.i.$"p.!%22bis!!3!!9!%a\'ezi"#cek#"he#)illations',
+    '&\'isation$*um-cleaner""fa"\'inglory",l&eacute;rie#*d&eacute;s$$emar#%erius#"se#\'uepoint""ri"+se-painters$\'ctomies#%iliki#(odilator',
+    '"%tanen!!b"!k!#cid"!o!(elveteen"(ngefully#$tris"\'rgennes#$rall$!i#%woerd"$sica"\'xations"!z',
+    '"+car-general#)e-foreign#\'omtesse#&torias"-deo-recording%)cassettes##lin"$llon"&piteno")scosities"%telli#&rified!"mx!&oeller"\'lgograd',
+    '%&partei)"ij#%leyer#$osti#"pe#%untas"#pos"&racity#&texing"&tadini#"e."\'uchsafe!"p5"!a"!k',
+    '""tx!"so!,ulcanologist!"xm \'w-cells"$what!#.j.""m.!"/p!$6/32!-age-labourers#&goners#$horn")inscoting"%keley',
+    '"\'lk-over$&ington#\'l-clock$$aces$%oping##pit##wyn"$ngdu"%pnick"+r-weariness#$beck#$dian#"in#&kworth#%locks',
+    '$$tire#"re$$iner"%strel"*tch-towers%%field#(er-level\'%iving&\'pistols&#use%(/alcohol%&marked%#ton%$weed$!s',
+    '"(ymarkers!#c1b""2e"!g!$eale$,th-producing#)pon-grade#)ther-worn\'#itt"*b-building"*ek-to-week$#ley#$pers$"ie#!s',
+    '"!g#!g"-ight-watchers&$iest&(watchers#%sberg#$tzer"&lensky#,l-advertised&\'ttested%\'beloved%&filled\'&nanced&&leshed&)ormedness',
+    '%&spaced%+upholstered%&worked$\'enkuppe"&ntwood"%obley"&rburgh##ent#\'theimer"(st-coast$\'chester$&erberg&$lies&(nisation!%g.cdr',
+    '#$lbys"-eeler-dealing%!y#$lans#%tting%"on"\'iffling#%nging$$nett##rly#)te-walled%$bait%&cliffe%$gate%$moor',
+    '$#tam$$well##zzo"(ole-time#$opie#!p#!s!$icke$%stead"*dely-known$$ness"#fey""ic"%lbert#"co',
+    '##gro##lan$*iams-ellis$"ms$\'ow-herb$#son#-son/radcliffe&%ville"*nd-whipped$&breaks$$farm$.ows-under-unix#%eries#&gbeats$+ed-corridor',
+    '#%ograd#!t$\'er-time&&halter"&pe-out")re-haired"+tch-hunting%$hunt#)hin-group#(ness-box#&tenham!(ladyslaw!"ml!$olde#*f-whistles',
+    '#&laston$$heim"\'mb-like$$well"#ngy"*od-pigeons$#ger%$rain$\'landers#%lfall$#sey""ps"(rd-class$&ingham$*processors',
+    '$\'ing-age##ld\'%(-ranking\'%ecord"&thorpe#.ton-under-edge"#wed!$rapt"(ite-once")ongdoings!\'ynfrith""rd""ss"%verns %x.500',
+    '!!c"!3"!4"!6!!d!"e2"\'nograft!"f5""6+!"g4!&uechao""ry!$ylem#%ogics (y-shaped',
+    '!\'ablokov"$fano"%kutia"%meogo"#nbu##kie"%rdarm$%birds"%shmak"%teley!#eap"*llowhammer&$ness""mf"#ses',
+    '!#ids!#lli!&ogurts""ma"%nkers"$rdas"#shi"+ung-looking#$rsen#\'thfully!$than!(ubamrung"#kky"#nus!#vor',
+    ' %z2033!&akuski"$pper"%uditu!"ds!$ekes"!m##sky"&nouska"&phania")ro-rating&#isk$#ing!#ico"$ller',
+    '&!s!%nf37a!$owie!%suzsa!)urbriggen',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_19 = (
+count_19 = 6695
+
+heads_19 = (
     '&aelig;lfhelm',
-    '&aelig;theling',
-    '&mdash;an',
-    '&mdash;at',
-    '&zcaron;upan',
-    '\'83',
-    '\'a\'',
-    '\'ee',
-    '\'l',
-    '\'not',
-    '\'orse',
-    '-to',
-    '0-4-0st',
-    '0.2mm',
-    '0.8-micron',
-    '1.5-litre',
     '10-metre',
-    '100mw',
-    '100s',
-    '10am&ndash;5pm',
-    '1140s',
-    '1160s',
-    '12-bore',
-    '128-bit',
-    '13-day',
-    '13-point',
-    '1300s',
-    '13amp',
-    '15-cm',
-    '1500s',
-    '16-track',
-    '16-valver',
     '16-week',
-    '18-hour',
-    '180-degree',
-    '1918&ndash;19',
-    '19s',
-    '2&ndash;6pm',
-    '2-dg',
-    '2-hour',
-    '2-tone',
-    '2.9p',
-    '20-day',
-    '200&ndash;1',
-    '200-member',
-    '20in',
-    '21-month',
-    '22-member',
     '23&ndash;dec',
-    '24&ndash;28',
-    '24&ndash;5',
-    '24-pin',
-    '25&ndash;6',
-    '25-acre',
-    '256-colour',
-    '25km',
-    '28-year',
-    '29&ndash;31',
-    '3&ndash;12',
-    '3.2p',
-    '3.4-kb',
-    '3.5-litre',
-    '32-year',
-    '3kg',
     '4000m',
-    '48in',
-    '5\'-gc',
-    '5\'j',
-    '5-hydroxytryptamine',
-    '51p',
-    '6.5p',
-    '60-mile',
-    '7-bit',
-    '7-day',
-    '70-plus',
-    '70mm',
-    '8-cell',
-    '9-volt',
-    '900-mwe',
-    'a&ndash;c',
     'a259',
-    'a46',
-    'a_a_little',
-    'aaagh',
-    'aachen-based',
-    'abaft',
-    'abbaye',
-    'abercromby',
-    'abies',
-    'abinger',
-    'abiotic',
-    'ablated',
-    'abner',
-    'abortifacients',
-    'abridging',
-    'abuzz',
     'accell',
-    'accenting',
-    'accident-free',
-    'accipiter',
-    'accordionist',
-    'accoutred',
-    'accrete',
-    'accross',
-    'acetates',
-    'achillea',
-    'acls',
-    'acset',
-    'actif',
-    'acu',
-    'ad-libs',
-    'adamou',
     'adeva',
-    'adh',
-    'adhikari',
-    'adlam',
-    'adlon',
-    'adornian',
-    'adrianople',
-    'adshead',
-    'adventure-story',
-    'advice-giving',
-    'ady',
-    'aebbe',
-    'aengus',
-    'aerotowing',
-    'aeschylean',
-    'afe',
     'affaires',
-    'affine',
-    'affixing',
-    'affrays',
-    'aford',
-    'african-americans',
-    'afropithecus',
-    'afshan',
-    'afta',
-    'after-sun',
-    'agbenugba',
-    'age-set',
-    'agii',
-    'agip',
-    'agonise',
-    'agreement&mdash;appendix',
     'agro-chemical',
-    'aguisel',
-    'ahmadu',
-    'ahwaz',
-    'ainu',
-    'air-defence',
-    'aircraft-carrier',
-    'airgetlam',
-    'airknocker',
-    'airlifting',
-    'aisa',
-    'ajit',
-    'ajk',
-    'akasha',
-    'akashic',
-    'akhmatova',
     'akinwande',
-    'akitas',
-    'akroyd',
-    'al-rahman',
-    'al-sabah',
-    'al-tuffah',
-    'alavi',
-    'albee',
-    'albertusstrasse',
-    'albery',
-    'albon',
-    'albrink',
-    'alcal&aacute',
-    'alcoa',
-    'alcor',
-    'aleksandar',
     'aleksandrova',
-    'alessio',
-    'alexa',
-    'algox',
-    'alkalosis',
-    'alkmeonid',
-    'all-glass',
-    'all-stars',
-    'allday',
-    'allegri',
-    'allosaurus',
-    'allrounders',
-    'allum',
-    'almeria',
-    'almoravid',
-    'almoravids',
     'alon',
-    'alphanumerics',
-    'alter-ego',
-    'alteram',
-    'altern',
-    'alternanthera',
-    'alumasc',
-    'aman',
-    'amaretti',
-    'amativeness',
-    'amax',
-    'ambers',
-    'ambridge',
-    'ambushers',
-    'amdega',
-    'amerced',
     'amide',
-    'amieux',
-    'amigos',
-    'amortized',
-    'amphitheater',
-    'amroth',
-    'anabaptist',
-    'anastasius',
-    'anatoliy',
-    'anesthetised',
-    'angkatan',
-    'anglam',
-    'anglo-',
-    'anglo-persian',
-    'anheuser-busch',
-    'annabella',
     'annelid',
-    'annihilates',
-    'annika',
-    'anschuetz',
-    'ansel',
-    'ansett',
-    'antedated',
-    'anter',
-    'anti-chinese',
-    'anti-federalist',
-    'anti-humanism',
-    'anti-imperialism',
-    'anti-liberal',
-    'anti-male',
-    'anti-marxist',
-    'anti-modernist',
     'anti-party',
-    'anti-riot',
-    'anti-structure',
-    'anti-terrorism',
-    'anti-tumour',
-    'anti-wrinkle',
-    'antico',
-    'antismoking',
-    'antlered',
-    'anyday',
-    'anzacs',
-    'apap',
-    'appaling',
-    'appletise',
-    'appurtenant',
-    'aquaclear',
     'aquilegias',
-    'arbanne',
-    'arbon',
-    'arbortech',
-    'archduchess',
-    'ardair',
-    'ardrishaig',
-    'aref',
-    'arguedas',
-    'argulus',
-    'argy',
-    'argyris',
-    'arkells',
-    'arkie',
-    'arkley',
-    'arm&eacute;e',
     'arm-chair',
-    'arm-rest',
-    'armadas',
-    'armalite',
-    'armel',
-    'arms-control',
-    'arnim',
-    'arrestant',
-    'arrian',
-    'arrow-head',
-    'arrowing',
-    'arsa',
-    'arshile',
-    'artilleryman',
-    'artweek',
-    'arz&uacute',
     'asaad',
-    'ascaris',
-    'ashbee',
-    'ashchurch',
-    'ashridge',
-    'asian-american',
-    'asociados',
-    'aspden',
-    'aspdin',
-    'aspergillus',
-    'assenting',
-    'asti',
-    'astle',
-    'astroturf',
-    'asymptote',
-    'atchison',
     'atex',
-    'athaulf',
-    'ato',
-    'atomique',
-    'atrebates',
-    'atreus',
-    'attalus',
-    'attunement',
-    'attwoods',
-    'au-pair',
-    'audiology',
-    'auditor-general',
-    'auew',
-    'ault',
-    'aurelian',
-    'aureum',
     'aurobindo',
-    'auroral',
-    'auslese',
-    'autobiographer',
-    'autom-ix',
-    'automart',
-    'auxetophone',
-    'auxilliary',
-    'avaii',
-    'aviva',
-    'avraham',
-    'avranches',
-    'awp',
-    'aykroyd',
-    'ayscough',
-    'azeris',
     'b.m.',
-    'b9',
-    'baan',
-    'babenco',
-    'babi',
-    'bacchanalian',
-    'back-combed',
-    'back-combing',
-    'back-drop',
-    'back-log',
-    'backfires',
-    'backster',
-    'badal',
-    'badham',
-    'baftagate',
-    'bagel',
     'bah&amacr;dur',
-    'bahnhof',
-    'bainbrigge',
-    'balance-of-power',
-    'baldoni',
-    'ball-doctoring',
-    'ballades',
-    'ballina',
-    'ballymore',
-    'balthus',
-    'bamenda',
-    'band-wagon',
-    'bande',
-    'bandying',
-    'bankrupting',
-    'banting',
     'barbauld',
-    'barded',
-    'barding',
-    'bare-headed',
-    'bareheaded',
-    'bargain\'',
-    'bargate',
-    'barky',
-    'barnicoats',
-    'barrel-vaulted',
-    'barrelage',
-    'barrelling',
-    'barrer',
-    'barres',
-    'barrhead',
-    'barrichello',
     'bartenders',
-    'bartsch',
-    'barzach',
-    'basecamp',
-    'basket-weave',
-    'basophils',
-    'bastides',
-    'basutoland',
-    'batching',
-    'bath-tub',
-    'batm&ouml;nh',
-    'battre',
-    'bavarois',
-    'bawd',
-    'baxi',
-    'bayerische',
     'bcvb',
-    'beachwear',
-    'beate',
-    'beatha',
-    'beaumanoir',
-    'beautified',
-    'bechamel',
-    'becontree',
-    'bedtimers',
-    'beeley',
-    'beer-swilling',
-    'beersheba',
-    'beetch',
-    'beetham',
-    'beetling',
-    'behoved',
     'beighton',
-    'beishon',
-    'bekenstein',
-    'bellboy',
-    'bellyaches',
-    'bellyaching',
-    'belshaw',
-    'benbulbin',
-    'bench-mark',
-    'benched',
-    'bendixson',
-    'benedick',
-    'benedikt',
-    'benenson',
-    'benfleet',
-    'benioff',
     'bennion',
-    'beqb',
-    'berates',
-    'berend',
-    'bergstrand',
-    'bermant',
-    'bernoulli',
-    'berryman',
-    'bertrams',
-    'beruna',
-    'bessy',
-    'best-placed',
-    'besterman',
-    'bestwood',
-    'bethought',
-    'better-informed',
     'better-looking',
-    'betwen',
-    'bevir',
-    'bevvy',
-    'bewise',
-    'bexfield',
-    'bga',
-    'bglii',
-    'bharata',
-    'biagio',
-    'biden',
-    'biffo',
-    'big-band',
-    'bilborough',
-    'bilevel',
-    'billinghurst',
     'binged',
-    'bio-day',
-    'biot',
-    'biraderi',
-    'birkenshaw',
-    'birkwith',
-    'birtwhistle',
-    'bishko',
-    'black-clawson',
-    'black-letter',
-    'black-painted',
-    'blackberrying',
-    'blackler',
-    'blackrag',
-    'blag',
-    'blanquette',
     'blasphemed',
-    'blatter',
-    'blaue',
-    'blaug',
-    'blaven',
-    'blay',
-    'bleath',
-    'blennies',
-    'bli',
-    'blohm',
-    'bloodaxe',
-    'bluck',
-    'blurbs',
-    'board-room',
-    'body-heat',
-    'body-servant',
     'body-wall',
-    'bodybuilders',
-    'bodystocking',
-    'bogue',
-    'boheme',
-    'boileau',
-    'bolo&ntilde;a',
-    'bolshy',
-    'bombykol',
-    'bommai',
-    'bonbons',
-    'bone-china',
-    'bonelli',
-    'bonitus',
-    'boobed',
-    'bookbinders',
     'bootlegs',
-    'bootmakers',
-    'borate',
-    'borker',
-    'borscht',
-    'bosman',
-    'bostan',
-    'bottle-neck',
-    'bottom-placed',
-    'boucherie',
-    'bouchier',
-    'boucicault',
-    'bouerat',
-    'boues',
-    'bouin',
-    'bourbollon',
     'bourequats',
-    'bourgeoise',
-    'bourguignon',
-    'bowdlerised',
-    'boymans',
-    'bpc',
-    'brabin',
-    'braemore',
-    'brammer',
-    'branagan',
-    'brathay',
-    'braydon',
-    'breacker',
-    'breadalbane',
-    'break-neck',
-    'breast-beating',
     'breast-pocket',
-    'breche',
-    'breck',
-    'bree',
-    'breeding-ground',
-    'brennand',
-    'brenzone',
-    'breslau',
-    'bridgeton',
-    'briggate',
-    'brimsdown',
-    'brindles',
-    'brintons',
-    'bristolian',
-    'brite',
-    'british-style',
     'brittania',
-    'brittrak',
-    'brizan',
-    'brnesc',
-    'broadleaf',
-    'broiling',
-    'bron',
-    'bronstein',
-    'broodthaers',
-    'brookeborough',
-    'broom\'ead',
-    'brother-sister',
-    'broun',
-    'brown-eyed',
-    'brownrigg',
-    'brrrr',
     'brubaker',
-    'brudermann',
-    'brummies',
-    'brunnson',
-    'brus',
-    'brutalizing',
-    'bruvver',
-    'bso',
-    'bsu',
-    'buchwald',
-    'buck-passing',
-    'bucketed',
-    'budgerigars',
-    'budyko',
-    'buenas',
-    'buganda',
     'bugbears',
-    'buildnet',
-    'bujok',
-    'bulent',
-    'bulks',
-    'bulman',
-    'bultfontein',
-    'bumming',
-    'bundu',
-    'bunfight',
-    'bungs',
-    'bunte',
-    'buona',
-    'buquet',
-    'burakumin',
-    'burbidge',
     'burgundies',
-    'burpham',
-    'burps',
-    'burtenshaw',
-    'burtonwood',
-    'business-card',
-    'businessweek',
-    'butare',
-    'butenko',
-    'butman',
-    'buttermarket',
-    'buzz-word',
-    'bwca',
-    'byland',
-    'bytches',
-    'c&eacute;cile',
     'c&eacute;vennes',
-    'c-band',
-    'c-isam',
-    'c13',
-    'cabinetmaking',
-    'cable-laying',
-    'cablevision',
-    'cadman',
-    'caging',
-    'cakici',
-    'calabrese',
-    'calandra',
-    'calderon',
-    'caldon',
-    'calixtus',
-    'calorie-counting',
     'cammo',
-    'camo',
-    'campeador',
-    'campinas',
-    'campling',
-    'can-am',
-    'candleholders',
-    'candler',
-    'candover',
-    'cannan',
-    'cannon-fodder',
-    'cantabile',
-    'cantabrian',
-    'cantley',
-    'capa',
-    'capelli',
     'capobianco',
-    'capstick',
-    'captain\'',
-    'capybara',
-    'carbon-dioxide',
-    'cardi',
-    'cardow',
-    'carello',
-    'caren',
-    'caritas',
-    'carjacking',
-    'carltona',
-    'carlucci',
-    'carnach',
-    'carney',
-    'carnot',
     'carolinum',
-    'carozza',
-    'carpi',
-    'carry-out',
-    'cart-shed',
-    'cartimandua',
-    'caryatid',
-    'casbah',
-    'cascais',
-    'casella',
-    'casenotes',
-    'cash-based',
-    'cash-crop',
-    'cat-pla2',
-    'catafalque',
-    'catastrophism',
     'catch-up',
-    'catuvellauni',
-    'caulfeild',
-    'cavaill&egrave;s',
-    'cawarden',
-    'cawkell',
-    'cayuse',
-    'ccbe',
-    'cclo',
-    'cdd',
-    'cdu-fdp',
-    'cecropia',
-    'ceiling-mounted',
-    'celadon',
-    'cell-matrix',
-    'cell-wall',
     'cellmate',
-    'cellutherapie',
-    'cennen',
-    'cenomanian',
-    'centaurea',
-    'centrally-heated',
-    'centris',
-    'cepalc',
-    'ceps',
-    'ceramide',
-    'certs',
-    'cfvs',
-    'chaconne',
-    'chadwin',
-    'chafer',
-    'chain-mail',
     'chalke',
-    'chama',
-    'chambord',
-    'chamomilla',
-    'chana',
-    'chandlery',
-    'chandni',
-    'chantelle',
-    'charge-transfer',
-    'charleton',
-    'charnley',
-    'chasseurs',
-    'chatila',
-    'chcs',
-    'cheapskate',
-    'cheapy',
     'cheater',
-    'checkley',
-    'checkups',
-    'cheek-bone',
-    'cheeseman',
-    'chelating',
-    'chemises',
-    'chemnitz',
-    'chequer',
-    'chesney-lind',
-    'chess-playing',
-    'chessie',
-    'chesterman',
-    'chiddingstone',
-    'chief-corporal',
-    'chik',
     'child-minder',
-    'chimney-breast',
-    'chinchero',
-    'chinnery',
-    'chioggia',
-    'chiros',
-    'chirrup',
-    'chitchat',
-    'chloral',
-    'chloramine',
-    'choco',
-    'cholelithiasis',
-    'chri',
-    'christianising',
-    'christien',
-    'chromis',
     'chronique',
-    'chrysalids',
-    'chrysom',
-    'chrysostom',
-    'chs.',
-    'chugs',
-    'chungking',
-    'churchy',
-    'churls',
-    'chuse',
-    'cicognara',
-    'ciders',
-    'cimage',
-    'cimino',
-    'cinched',
-    'cincinatti',
     'cinemascope',
-    'cinquecento',
-    'circuiting',
-    'circumnavigated',
-    'circumnavigating',
-    'circumvents',
-    'cirsium',
-    'cita',
-    'citic',
-    'civet',
-    'ciwf',
-    'claddagh',
-    'cladonia',
-    'clail',
-    'clamp-down',
-    'clanchy',
     'clangs',
-    'clansman',
-    'clanvow',
-    'clarricoates',
-    'clary-sage',
-    'class-consciousness',
-    'class-related',
-    'classement',
-    'classroom-based',
-    'claverton',
-    'claxby',
-    'claythorpe',
-    'cleare',
-    'cleer',
-    'clery',
-    'cleveland-based',
     'clibber',
-    'clich&eacute;-ridden',
-    'clickity',
-    'cliff-hanger',
-    'climbline',
-    'clints',
-    'clipart',
-    'clockface',
-    'closed-shop',
-    'closerie',
-    'cloward',
-    'clusterer',
-    'cmlr',
-    'co-designed',
-    'co-funded',
-    'co-housing',
     'co-immobilized',
-    'co-resident',
-    'co-transfected',
-    'coal-tar',
-    'coathangers',
-    'coccyx',
-    'cock-fighting',
-    'cockcrow',
-    'cocoliche',
-    'cod-liver',
-    'coder',
-    'coerces',
-    'coff',
-    'coffee-shop',
-    'cogsa',
-    'cohasset',
     'cohq',
-    'colegate',
-    'colina',
-    'colinetta',
-    'colitics',
-    'collectibles',
-    'collomb',
-    'colluvium',
-    'colo',
-    'colombe',
-    'colonial-style',
-    'coloroll',
-    'colour-coding',
-    'colour-sergeant',
-    'colour-word',
-    'columbanus',
     'com&aelig',
-    'comanche',
-    'commentate',
-    'commision',
-    'commun',
-    'communiste',
-    'compact-disc',
-    'companhia',
-    'company-owned',
-    'complicite',
-    'compositing',
-    'compressed-air',
-    'compression-decompression',
-    'comptroller-general',
-    'comtean',
-    'comunicaciones',
     'con-',
-    'condry',
-    'conformant',
-    'conix',
-    'connick',
-    'conservative-held',
-    'consgold',
-    'consorted',
-    'consorzio',
-    'conspires',
-    'const',
-    'constitutionalist',
-    'consultatif',
-    'content-free',
-    'contura',
-    'conveyor-belt',
     'coonts',
-    'copeman',
-    'copp',
-    'copps',
-    'copula',
-    'coral-stone',
-    'corba-compliant',
-    'cordwainer',
-    'corn-fed',
-    'corncob',
-    'corneille',
-    'corneliu',
-    'corner-stone',
-    'corollas',
-    'corrals',
-    'corriere',
     'corsairs',
-    'corylus',
-    'coshed',
-    'cosmic-ray',
-    'cost-based',
-    'cost-plus',
-    'costco',
-    'costmary',
-    'costumier',
-    'count-down',
-    'countach',
-    'counter-current',
-    'counter-urbanization',
-    'counterbalances',
-    'courson',
-    'court&mdash;country',
     'coved',
-    'coventry-based',
-    'cowgirl',
-    'coxa',
-    'cpav',
-    'craftsperson',
-    'craighall',
-    'craton',
-    'crean',
-    'credenhill',
-    'cregeen',
-    'cremer',
-    'cresting',
-    'cribbage',
-    'cribbed',
-    'crimps',
     'crinolines',
-    'crisping',
-    'crisscross',
-    'cristal',
-    'crocodilian',
-    'croisette',
-    'crondall',
-    'crosfields',
-    'cross-appeals',
-    'cross-contamination',
-    'cross-court',
-    'cross-modal',
-    'cross-questioned',
-    'cross-questioning',
-    'cross-system',
-    'cross-undertaking',
     'crossbreed',
-    'crosspatch',
-    'crosstown',
-    'crowner',
-    'crowt',
-    'croxford',
-    'crumley',
-    'crumwallises',
-    'cruzado',
-    'cruzan',
-    'crx',
-    'cryptography',
-    'csj',
-    'cuckfield',
-    'cuesta',
-    'culmore',
     'cumber',
-    'cumulated',
-    'curacao',
-    'curiel',
-    'curral',
-    'cusped',
-    'customer-oriented',
-    'cut-up',
-    'cutlasses',
-    'cycletrack',
-    'cysteines',
-    'czarina',
-    'czartoryski',
-    'd&eacute;partements',
-    'd\'etudes',
-    'd\'histoire',
     'd-',
-    'd-g',
-    'd.w.',
-    'd18',
-    'dadaist',
-    'dadd',
-    'daemonette',
-    'dagomys',
-    'dai-ichi',
-    'daimlers',
-    'dallul',
-    'dalmahoy',
-    'daman',
-    'damnatio',
-    'danae',
-    'danbys',
     'danses',
-    'danseurs',
-    'darent',
-    'darenth',
-    'darin',
-    'dark-faced',
-    'darkman',
-    'darlan',
-    'dartmeet',
-    'daryll',
-    'dassia',
-    'data-driven',
-    'dataprism',
-    'davidow',
-    'davro',
-    'day-length',
     'dazza',
-    'dc-8',
-    'ddb',
-    'de-horning',
-    'de-seeded',
-    'dead-ball',
-    'deadbeat',
-    'deae',
-    'deal-making',
-    'death-watch',
-    'death-wish',
-    'debay',
-    'debbi',
-    'debray',
-    'debre',
-    'debtor-creditor',
     'decamping',
-    'decapitating',
-    'decatur',
-    'decentralist',
-    'dedo',
-    'defendent',
-    'dega',
-    'dehaene',
-    'deictics',
-    'deinstall',
-    'delaforce',
-    'delamothe',
-    'delany',
-    'delebarre',
-    'delegacy',
-    'delimiter',
     'delion',
-    'delisting',
-    'dell\'',
-    'deloittes',
-    'democratie',
-    'democratique',
-    'demotivating',
-    'denture',
-    'deoxyribose',
-    'depersonalising',
-    'depilatory',
-    'depolarize',
-    'depolarizing',
-    'depoliticised',
-    'depp',
-    'depraving',
     'deputises',
-    'deri',
-    'derick',
-    'derides',
-    'deroburt',
-    'dershowitz',
-    'desam',
-    'desmosomes',
-    'desolately',
-    'despina',
-    'destefani',
-    'desy',
-    'deuchar',
-    'deut.',
-    'developmentalist',
-    'devitt',
     'dexedrine',
-    'dharram',
-    'dhobi',
-    'dhs',
-    'diabaig',
-    'diachrony',
-    'diagnosticians',
-    'diaka',
-    'diakon',
-    'dialtext',
-    'dichloromethane',
-    'dickey',
-    'diddy',
-    'didgeridoo',
-    'dids',
-    'die-cast',
     'diebold',
-    'diedre',
-    'diego-based',
-    'diesel-engined',
-    'dietetics',
-    'dietz',
-    'diffracted',
-    'diffusionism',
-    'diggle',
-    'digitise',
-    'digivision',
-    'dignifying',
-    'dignum',
-    'digue',
-    'dii',
-    'dik',
     'diktynna',
-    'dilkes',
-    'dillied',
-    'dimac',
-    'diminutives',
-    'dims',
-    'din-dins',
-    'dinosaurian',
-    'dioecious',
-    'dionisio',
-    'dioptre',
-    'diphosphate',
-    'diphtheriae',
-    'diphthongization',
-    'diplexcito',
-    'diplomatists',
     'dipolar',
-    'diria',
-    'dirigisme',
-    'dirt-track',
-    'dis-',
-    'disaccharide',
-    'disafforestation',
-    'disallows',
-    'disappointedly',
-    'disarranged',
-    'disassemble',
-    'disconfirmed',
-    'discoth&egrave;que',
-    'discoth&egrave;ques',
-    'discouragingly',
-    'disembowelling',
     'disfigurements',
-    'dishforth',
-    'dislodgement',
-    'dismantles',
-    'disordering',
-    'dispersant',
-    'displayable',
-    'disposers',
-    'dispossessing',
-    'disquisitions',
-    'disseminates',
-    'dissuades',
-    'distastefulness',
-    'disyllables',
-    'dithers',
-    'ditka',
     'divergencies',
-    'diverticulum',
-    'dividal',
-    'dividing-line',
-    'divorce-rate',
-    'djibo',
-    'dla',
-    'dm2.56',
-    'dm2.57',
-    'dm2.78',
-    'dm2.93',
-    'dm300',
-    'dmae',
-    'dnepr',
-    'dobinson',
-    'docilely',
     'dockets',
-    'docomomo',
-    'documents.',
-    'doffing',
-    'dogfood',
-    'doggo',
-    'dogon',
-    'doilies',
-    'doina',
-    'doktor',
-    'dollery',
-    'dolman',
-    'dolmens',
-    'dolphinholme',
-    'dolt',
-    'dolwyddelan',
     'domestica',
-    'domesticate',
-    'domestiques',
-    'donata',
-    'doniert',
-    'doniol-valcroze',
-    'donnybrook',
-    'donohue',
-    'doodlings',
-    'doolan',
-    'doorhandle',
-    'doorjamb',
-    'dopaminergic',
-    'dorend',
-    'dorestad',
-    'dork',
     'dormanstown',
-    'dorms',
-    'dornbusch',
-    'dose-dependent',
-    'doshan',
-    'dosimetry',
-    'dositej',
-    'dossing',
-    'dotheboys',
-    'dottridge',
-    'douanier',
-    'double-bogey',
-    'double-faced',
-    'double-jointed',
-    'double-positive',
-    'double-speak',
     'double.length',
-    'doubler',
-    'dougalston',
-    'dounreay-thurso',
-    'douro',
-    'doushan',
-    'dover&ndash;calais',
-    'dowds',
-    'down-trodden',
-    'down-turned',
-    'downhills',
-    'downloadable',
-    'downshurst',
-    'doyens',
-    'doyler',
-    'dr4',
     'dracon',
-    'dragan',
-    'dramatis_personae',
-    'dramatizes',
-    'drawbridges',
-    'drawingroom',
-    'drawn-up',
-    'drawstitch',
-    'drc',
-    'dreaper',
-    'dressing-case',
-    'drife',
-    'drinkin\'',
-    'drivelling',
-    'droege',
-    'drogoul',
     'dromara',
-    'drouhin',
-    'droveway',
-    'droveways',
-    'drug-testing',
-    'druggies',
-    'druggists',
-    'drumgoole',
-    'drumlins',
-    'drw',
-    'dsom',
-    'dtpa',
-    'du\'r',
-    'dualists',
-    'dualled',
-    'duan',
     'dubhe',
-    'dubos',
-    'ducale',
-    'duckham',
-    'duckpond',
-    'dudfield',
-    'duesenberry',
-    'duffryn',
-    'dukas',
-    'dulcet',
-    'dullards',
-    'dume',
-    'dummah',
-    'dunkery',
-    'dunking',
-    'dunlap',
     'dunnes',
-    'dunstaffnage',
-    'dunums',
-    'dunure',
-    'dupin',
-    'duping',
-    'duplicator',
-    'dupplin',
-    'duque',
-    'durao',
-    'duroselle',
-    'dusak',
-    'dustbowl',
-    'dustbuster',
-    'dusterandus',
-    'dustier',
     'duvalierist',
-    'duy',
-    'dvt',
-    'dwellinghouse',
-    'dyfi',
-    'dylans',
-    'dymo',
-    'dymond',
-    'dyncm',
-    'dynes',
-    'e-marker',
-    'e.b.',
-    'e.r.m.',
-    'e.s.',
-    'e.s.b.',
-    'e.v.',
     'e1b',
-    'eachother',
-    'eadbangerz',
-    'eaeg',
-    'eagan',
-    'eaggf',
-    'eakins',
-    'ealham',
-    'eard',
-    'early-eighties',
-    'early-evening',
-    'earmarks',
-    'earnt',
-    'earth-mother',
-    'easeful',
-    'easterby',
     'eastertide',
-    'eastleech',
-    'eastons',
-    'eaux',
-    'eaux-bonnes',
-    'ebberston',
-    'ebbie',
-    'ebenat',
-    'ebs',
-    'ebussu\'ud',
-    'ec-us',
-    'ec1r',
-    'ec1v',
-    'ec88',
-    'eccd-2',
-    'ecclesiology',
     'ecco',
-    'ecctis',
-    'ecdysial',
-    'eco-audit',
-    'ecor1',
-    'ecru',
-    'eddis',
-    'eddoes',
-    'eddr',
-    'edelweiss',
-    'edenbridge',
-    'edgeley',
-    'edgerton',
-    'edwinstowe',
-    'eee-eee',
-    'eel-like',
     'efc',
-    'efflorescence',
-    'effusiveness',
-    'eg2',
-    'eger',
-    'egor',
-    'egotist',
-    'ehiogu',
-    'ehud',
-    'eichelberger',
-    'eigenstate',
-    'eight-fold',
-    'eight-sided',
-    'eightieths',
-    'eilat',
-    'einsteinian',
     'eisler',
-    'ejects',
-    'ekino-door-oos',
-    'eko',
-    'ektachrome',
-    'el-abidine',
-    'elastomers',
-    'eldercombe',
-    'elderton',
-    'elea',
-    'electrical/electronic',
-    'electricit&eacute',
-    'electricite',
-    'electro-hydraulic',
-    'electroconvulsive',
-    'electroluminescent',
     'electrostatically',
-    'electrotechnical',
-    'elek',
-    'eleonora',
-    'eleven-fifteen',
-    'elham',
-    'elisabetta',
-    'ellesse',
-    'elliel',
-    'ellipted',
-    'ellrich',
-    'elmet',
-    'elmham',
-    'elmstone',
-    'elphin',
-    'elserver',
     'elucidates',
-    'elvet',
-    'elwes',
-    'ema',
-    'emancipating',
-    'emancipators',
-    'emasculation',
-    'embeddedness',
-    'embeds',
-    'embolus',
-    'embrasures',
-    'embryologists',
-    'emcf',
-    'eminence_grise',
-    'emms',
-    'emotivism',
     'employer-employee',
-    'employment.',
-    'emptiest',
-    'empyema',
-    'emslie',
-    'enamelling',
-    'encases',
-    'encephalomyelitis',
-    'encrust',
-    'end-results',
-    'end-uses',
-    'end-weight',
-    'endicott',
-    'endorphin',
-    'endproc',
-    'endymion',
     'enel',
-    'energy-rich',
-    'enfant',
-    'engin',
-    'englanders',
-    'englund',
-    'enlai',
-    'ennius',
-    'enormities',
-    'enraging',
-    'enrollment',
-    'enterobacteria',
-    'enterohepatic',
-    'enthalpy/entropy',
-    'enthral',
-    'entourages',
     'entrepot',
-    'enumerable',
-    'enumerator',
-    'enunciates',
-    'enure',
-    'enviably',
-    'envision',
-    'eormenred',
-    'epernay',
-    'ephesian',
-    'ephs',
-    'epicene',
-    'epidermoid',
-    'epidiascope',
-    'epigraphy',
-    'epilady',
     'episcope',
-    'episodically',
-    'episternum',
-    'epoetin',
-    'epstein-barr',
-    'epworth',
-    'equilibrating',
-    'equinoxes',
-    'ercoupe',
-    'erectors',
-    'eriophorum',
-    'erl-king',
-    'ermenegildo',
-    'ermin',
-    'ern',
-    'eroticised',
     'errata',
-    'error-prone',
-    'eryngium',
-    'erythematous',
-    'esal',
-    'escalante',
-    'escheat',
-    'escheator',
-    'escorial',
-    'eskdalemuir',
-    'esm',
-    'esn',
-    'esn(m)',
-    'espagnol',
-    'espanol',
-    'espinoza',
     'esquivel',
-    'esteban',
-    'etak',
-    'etang',
-    'ethanoic',
-    'ethelburga',
-    'ethereally',
-    'ethridge',
-    'etnias',
-    'etorofu',
-    'etpison',
-    'etroplus',
-    'etude',
-    'euainetos',
-    'eufemia',
-    'euonymus',
     'europea',
-    'eurotech',
-    'eurotrack',
-    'eurymedon',
-    'eustache',
-    'evangelizing',
-    'evaristo',
-    'even-handedly',
-    'even-money',
-    'evenden',
-    'event-driven',
-    'ever-deepening',
-    'ever-diminishing',
-    'ever-ready',
-    'everdon',
-    'evidentially',
     'evo-stik',
-    'evren',
-    'evs',
-    'ewyas',
-    'ex-chancellor',
-    'ex-councillor',
-    'ex-harvard',
-    'ex-leeds',
-    'ex-london',
-    'ex-miners',
-    'ex-mistress',
-    'ex-mp',
-    'ex-officers',
-    'ex-patient',
-    'ex-prisoner',
-    'ex-pupil',
     'exac',
-    'examinees',
-    'excisable',
-    'exclamatory',
-    'excommunicating',
-    'excusably',
-    'executants',
-    'executive-assembly',
-    'executrix',
-    'exedra',
-    'exegetes',
-    'exemplum',
-    'exes',
-    'exhales',
-    'exhaustedly',
-    'exhume',
     'exigency',
-    'exigent',
-    'existance',
-    'expat',
-    'expatiated',
-    'expectational',
-    'experiencer',
-    'explants',
-    'explications',
-    'explorative',
-    'expos',
-    'expressways',
-    'extensor',
-    'exton',
-    'extra-long',
-    'extractors',
     'extrapolates',
-    'extraterritoriality',
-    'extree',
-    'extremadura',
-    'extremest',
-    'extrude',
-    'extrusive',
-    'exults',
-    'eye-liner',
-    'eye-movements',
-    'eye-patch',
-    'eyepieces',
-    'eyton-jones',
-    'eyuphuro',
-    'f(n)',
-    'f*****g',
     'f*cking',
-    'f-15s',
-    'f-pn',
-    'f.g.',
-    'f.l.',
-    'f/sgt',
-    'f2,000',
-    'f8a+',
-    'faade',
-    'fabs',
-    'face-centred',
-    'face-on',
-    'factuality',
-    'faenza',
-    'fainthearted',
-    'fair-mindedness',
     'fairlight',
-    'fairplay',
-    'fairy-story',
-    'falkowski',
-    'fall-guy',
-    'falling-out',
-    'false-colour',
-    'faludi',
-    'fancher',
-    'fancourt',
-    'fannichs',
-    'farafra',
-    'faraj',
-    'fareed',
-    'farid',
-    'farjeon',
     'farleigh',
-    'farm-worker',
-    'farmhands',
-    'farmwork',
-    'farncombe',
-    'farndon',
-    'farrant',
-    'farson',
-    'farwaggi',
-    'fashionableness',
-    'faskally',
-    'fathomed',
-    'fatties',
-    'fauchon',
-    'faulhaber',
-    'faulknor',
     'favela',
-    'faverolles',
-    'favre',
-    'fawbush',
-    'faz',
-    'faze',
-    'fc(n)',
-    'fcj',
-    'fcsi',
-    'fdrs',
-    'fearfrost',
-    'feather-like',
-    'featherston',
-    'fedback',
-    'feds',
-    'fee-based',
     'feedings',
-    'feeler',
-    'feer',
-    'fees-only',
-    'feilden',
-    'feilding',
-    'felcey',
-    'felici',
-    'fellow-travelling',
-    'feminized',
-    'fenari-oglu',
-    'fencer',
-    'fenians',
-    'fenoderee',
-    'fenugreek',
-    'feoffee',
     'fermentable',
-    'fermor',
-    'ferndale',
-    'fernhart',
-    'ferran',
-    'ferrer',
-    'ferretti',
-    'ferroelectric',
-    'fetishised',
-    'fetishists',
-    'fetlar',
-    'fettucine',
-    'feuchtwanger',
-    'ffa',
-    'ffor',
-    'ffr10',
     'fianc&eacute;es',
-    'fiber',
-    'fid',
-    'fiduciaries',
-    'fifeshire',
-    'fifteen-mile',
-    'fifteens',
-    'fifth-',
-    'fifty-first',
-    'fig-leaf',
-    'fighter-bomber',
-    'fiki',
-    'file-server',
-    'file.extension',
-    'filleting',
-    'fillis',
     'filthier',
-    'filthiness',
-    'financial-management',
-    'financiere',
-    'finanze',
-    'findin\'',
-    'fine-tooth',
-    'fine-toothed',
-    'fineview',
-    'finger-like',
-    'finings',
-    'finlandisation',
-    'finsinger',
-    'firebombing',
-    'firebreak',
-    'firedamp',
     'firemouths',
-    'firestep',
-    'firm-name',
-    'firman',
-    'firstlight',
-    'fisc',
-    'fish-hooks',
-    'fishbase',
-    'fishergate',
-    'fisherton',
-    'fishnets',
-    'fishtail',
-    'fit-looking',
-    'fitting-out',
-    'fitzhughs',
-    'five-barred',
     'five-eighths',
-    'five-second',
-    'five-timer',
-    'five-times',
-    'fixed-head',
-    'flagpoles',
-    'flagships',
-    'flakey',
-    'flakiness',
-    'flap-like',
-    'flare-ups',
-    'flat-heeled',
-    'flat-lidded',
-    'flatley',
-    'flattest',
-    'flavourless',
     'flaxen-haired',
-    'flaying',
-    'flemyngs',
-    'fleshes',
-    'flete',
-    'flie',
-    'flip-side',
-    'flirtatiousness',
-    'flockhart',
-    'flood-banks',
-    'floodgate',
-    'floodwaters',
-    'flopsy',
-    'florakis',
-    'floris',
-    'florizel',
     'flour-mill',
-    'flow-of-funds',
-    'flower-bed',
-    'flower-bedecked',
-    'flower-like',
-    'flower-power',
-    'flowmetry',
-    'flp',
-    'fluffs',
-    'flumes',
-    'fluon',
-    'fluoresce',
-    'fluorosis',
-    'fluorspar',
-    'fluvioglacial',
-    'fly-away',
     'fly-buttons',
-    'fly-by-wire',
-    'fly-fishing',
-    'fly-ins',
-    'fly/past',
-    'flymo',
-    'flypost',
-    'flywheels',
-    'fmes',
-    'fmffv',
-    'fncd',
-    'fnum',
-    'foam-filled',
-    'fobbing',
-    'focke',
-    'fogden',
     'foil-wrapped',
-    'fol.',
-    'foliate',
-    'folk-songs',
-    'folkes',
-    'folksong',
-    'folky',
-    'fondiaria',
-    'fontanellatesi',
-    'food-producing',
-    'foodie',
-    'foot-rest',
-    'footbeds',
-    'footrests',
-    'footswitches',
-    'footwells',
     'for_a',
-    'forages',
-    'foras',
-    'forbus',
-    'forder',
-    'fordy',
-    'forecabin',
-    'foreclosing',
-    'forgen',
-    'forms.',
-    'formulators',
-    'forno',
-    'forrard',
-    'forswear',
-    'fort-de-france',
-    'forth-clyde',
     'fortress-like',
-    'fortunato',
-    'foskett',
-    'fossitt',
-    'foster-parent',
-    'fostex',
-    'foule',
-    'fountainbridge',
-    'fountainhead',
-    'four-eyed',
-    'four-round',
-    'four-strand',
-    'four-weekly',
-    'four-yearly',
-    'fourish',
-    'fourpenny',
     'fourth-floor',
-    'fowling',
-    'foxfield',
-    'foxhill',
-    'fr&oacute;da',
-    'fractional-order',
-    'frain',
-    'framatome',
-    'frame-work',
-    'france-albert',
-    'france-lynch',
-    'francistown',
-    'franco-russian',
-    'franco-scottish',
-    'franco-soviet',
-    'franka',
     'frankenberg',
-    'franker',
-    'frankest',
-    'franklins',
-    'fransisco',
-    'franz-joseph',
-    'fraternising',
-    'frayling',
-    'fred6',
-    'free-and-easy',
-    'free-electron',
-    'free-ride',
-    'free-riders',
-    'free-spirited',
-    'freeloading',
-    'freethinkers',
     'fregate',
-    'freim&uuml;ller',
-    'freiras',
-    'french-based',
-    'french-made',
-    'frers',
-    'fresden',
-    'friaries',
-    'fricke',
-    'friedersdorf',
-    'frier',
-    'frindall',
-    'frisians',
-    'frithuwald',
-    'frog-magician',
-    'frogmarsh',
     'frogspawn',
-    'front-drive',
-    'frontally',
-    'frost-hardy',
-    'frottole',
-    'fruin',
-    'fruit-eating',
-    'fruit-growing',
-    'fruitmarket',
-    'frutti',
-    'fssl',
-    'fuar',
-    'fuka',
-    'fulcher',
-    'full-moon',
-    'full-step',
     'fulls',
-    'fully-formed',
-    'fulwell',
-    'funboards',
-    'fundacio',
-    'fundectomised',
-    'fundi',
-    'fundy',
-    'funghi',
-    'funkadelic',
-    'funnel-shaped',
-    'furman',
-    'furnival',
-    'furrier',
-    'furus',
-    'fusebox',
     'fuselages',
-    'futher',
-    'fyvie',
-    'g&amp;s',
-    'g&eacute;ricault',
-    'g&imacr;t&amacr',
-    'g-1',
-    'g-bebp',
-    'g-h',
-    'g-protein-coupled',
-    'g.j.',
-    'g.o',
-    'g/',
-    'g14',
-    'gabardine',
-    'gabicce',
     'gabo',
-    'gabrielli',
-    'gacha',
-    'gaddis',
-    'gagn&eacute',
-    'gaim',
-    'gain/no',
-    'gainsaying',
-    'gaiter',
-    'galactosides',
-    'galatea',
-    'galeria',
-    'galimany',
-    'gallian',
-    'gallibayas',
-    'gallimaufry',
     'gallinarum',
-    'gallo-romans',
-    'gallwitz',
-    'gambino',
-    'game-keeper',
-    'game-plan',
-    'gamebird',
-    'gamlin',
-    'gammy',
-    'gamston',
-    'gana',
-    'ganglionic',
-    'gar&ccedil;ons',
-    'gardini',
-    'gargrave',
-    'garotte',
     'garron',
-    'garrons',
-    'garwood',
-    'gas-liquid',
-    'gas-lit',
-    'gas-powered',
-    'gas-stove',
-    'gasgcoine',
-    'gaspar',
-    'gastroparesis',
-    'gate-keepers',
-    'gate-towers',
-    'gatekeeping',
-    'gatien',
-    'gatow',
-    'gaube',
     'gaudin',
-    'gauntleted',
-    'gawld',
-    'gayton',
-    'gazpacho',
-    'gazzetta',
-    'gcmg',
-    'gds',
-    'gedda',
-    'geeson',
-    'gehan',
-    'geingob',
-    'gel-purified',
-    'gela',
-    'geld',
-    'gelsthorpe',
     'gemeinschaft',
-    'gemm',
-    'gender-based',
-    'genicom',
-    'genitalis',
-    'gennes',
-    'geocentric',
-    'geodemographic',
-    'geologic',
-    'geophagus',
-    'gera',
-    'gerais',
-    'gericault',
-    'german-jewish',
-    'germanised',
-    'gerontological',
     'gesu',
-    'gewandhaus',
-    'gewgaws',
-    'gf',
-    'ggfbpp1',
-    'giandomenico',
-    'giantesses',
-    'giardiniera',
-    'giardino',
-    'gibbens',
-    'gichin',
-    'gidon',
-    'gigas',
-    'gigbag',
-    'gilhooly',
-    'giller',
     'gillery',
-    'gilliat',
-    'gilt-bronze',
-    'ginza',
-    'gioia',
-    'gira',
-    'girl-next-door',
-    'gironde',
-    'girondins',
-    'girtin',
-    'giss',
-    'gissa',
-    'givi',
-    'gizmos',
-    'gladder',
-    'glamorized',
     'glamorously',
-    'glass-like',
-    'glass-reinforced',
-    'glassdrumman',
-    'glassily',
-    'glauca',
-    'gleaners',
-    'glebov',
-    'glenalmond',
-    'glenmorangie',
-    'glenshane',
-    'glenure',
-    'glenwood',
-    'gliniecki',
-    'glissandos',
-    'globetrotters',
     'globetrotting',
-    'glossier',
-    'glycines',
-    'goal-seeking',
-    'goalbound',
-    'goalwards',
-    'god-damned',
-    'godparent',
-    'godschalk',
-    'godwinians',
-    'goghs',
-    'goiko',
-    'going-up',
-    'gol',
-    'gold-fish',
-    'goldbach',
     'goldington',
-    'goldmining',
-    'golf-clubs',
-    'golfball',
-    'golspie',
-    'gomba',
-    'gonadotropin',
-    'goodacre',
-    'goodhead',
-    'goodnights',
-    'gook',
-    'goose-like',
-    'gordimer',
-    'gorell',
-    'gorn',
-    'goschenen',
     'gottschalk',
-    'gov',
-    'government-commissioned',
-    'government-inspired',
-    'govier',
-    'goy',
-    'goyen',
-    'goyigama',
-    'goyt',
-    'gozzi',
-    'gracieuse',
-    'gradi',
-    'graffham',
-    'grafpad',
-    'grainstone',
-    'grand\'place',
     'grandcourt',
-    'granddaddy',
-    'grandiosely',
-    'grandmotherly',
-    'grans',
-    'granter',
-    'graphitic',
-    'grass-grown',
-    'grassholm',
-    'gravelines',
-    'gravimetric',
-    'graving',
-    'gravitationally',
-    'graziani',
-    'greasiness',
-    'great-aunts',
     'great-grandmothers',
-    'great-granny',
-    'great-great-grandson',
-    'great-sinner',
-    'greediness',
-    'greened',
-    'greengate',
-    'greenhow',
-    'greenish-yellow',
-    'greenkeepers',
-    'greenkeeping',
-    'gregoire',
-    'gregynog',
-    'greisser',
-    'greyly',
-    'greysteel',
     'grieveson',
-    'grimble',
-    'grizzlies',
-    'grohl',
-    'groover',
-    'grotte',
-    'ground-living',
-    'ground-nesting',
-    'grouse-shooting',
-    'grovelands',
-    'growler',
-    'groyne',
-    'grubbier',
-    'gruinard',
-    'grumbold',
-    'gruneberg',
     'gruner',
-    'grzegorz',
-    'gsa',
-    'gto',
-    'guage',
-    'guanosine',
-    'guantanamo',
-    'gud',
-    'guesstimate',
-    'gullets',
-    'gulu',
-    'gunboat',
-    'gung_ho',
-    'gurirab',
-    'gurning',
-    'gushiest',
     'gustily',
-    'gutierrez',
-    'gwalia',
-    'gwarthegydd',
-    'gwennap',
-    'gwion',
-    'gyngell',
-    'gyrate',
-    'gyrated',
-    'gyri',
-    'h&auml;agen-dazs',
-    'h&eacute',
-    'h(n)',
-    'h.d.',
-    'h.f.',
-    'h.p.i.',
     'habane',
-    'habitability',
-    'hacihasanzade',
-    'hadron',
-    'hadst',
-    'haemodynamically',
-    'haemorrhagical',
-    'haft',
-    'hagge',
-    'haggerty',
-    'hagi',
-    'haha',
-    'haight-ashbury',
-    'hailwood',
-    'haine',
-    'hairband',
     'hairnets',
-    'hairstreak',
-    'hajduks',
-    'haldanes',
-    'halesworth',
-    'half-burnt',
-    'half-covered',
-    'half-crowns',
-    'half-english',
-    'half-laugh',
-    'half-second',
-    'half-sisters',
-    'half-sob',
-    'half-step',
-    'half-waking',
-    'halide',
     'haling',
-    'halkyn',
-    'hallborough',
-    'hallmarked',
-    'hallstand',
-    'halom',
-    'halos',
-    'halse',
-    'halvergate',
-    'hamadei',
-    'hamelink',
-    'hames',
-    'hamnet',
-    'hanafin',
-    'hanborough',
-    'hand-grenade',
     'hand-tools',
-    'handa',
-    'handbasin',
-    'handgrip',
-    'handpumps',
-    'handsomer',
-    'handy/gloucestershire',
-    'hangin\'',
-    'hanko',
-    'happisburgh',
-    'hard-driven',
-    'hard-to-find',
-    'hardest-hit',
-    'hardihood',
-    'hardin',
-    'hardnut',
     'harped',
-    'harrisson',
-    'harting',
-    'hartshorn',
-    'hartzell',
-    'harwell/oxfordshire',
-    'hass',
-    'hassam',
-    'hassell',
-    'hasso',
-    'hatboxes',
-    'hatchets',
-    'hatchings',
-    'hatefully',
-    'hatpin',
-    'hauberk',
     'haughtiness',
-    'have_nots',
-    'hawatmeh',
-    'hawk-that-settles',
-    'hawken',
-    'hay-fever',
-    'haythornthwaite',
-    'haz',
-    'hazlehurst',
-    'hazleton',
-    'hazlewood',
-    'hbmc',
-    'hcg62',
-    'hctc',
-    'hdd',
-    'he111',
     'head-hunters',
-    'head-rest',
-    'headbutt',
-    'headsman',
-    'headtorch',
-    'heareth',
-    'heatfest',
-    'heatsink',
-    'heatsinks',
-    'heaviley',
-    'heavy-gauge',
-    'hebbes',
-    'heckel',
-    'heckle',
-    'heeley',
-    'heem',
     'hegan',
-    'hegemonies',
-    'heitmann',
-    'heliacal',
-    'helichrysum',
-    'hellenizing',
-    'helman',
-    'helmsmen',
-    'hemiparesis',
-    'hemiptera',
-    'henge',
-    'hennion',
-    'henny',
-    'henslow',
-    'heracles',
-    'herb-rich',
     'herb-scented',
-    'hereditament',
-    'hereke',
-    'hermannsson',
-    'hermens',
-    'hermopolis',
-    'herston',
-    'herzl',
-    'heteromorphs',
-    'heteronomous',
-    'heures',
-    'hexameter',
-    'hiatts',
-    'hideki',
-    'hideouts',
-    'high-al',
     'high-availability',
-    'high-church',
-    'high-collared',
-    'high-cut',
-    'high-kicking',
-    'high-price',
-    'high-roofed',
-    'high-strength',
-    'highest-rated',
-    'highly-educated',
-    'highworth',
-    'hijacks',
-    'hildon',
-    'hill-forts',
-    'hillforts',
-    'hillmen',
     'hillsboro',
-    'himes',
-    'hindelang',
-    'hindess',
-    'hindiii',
-    'hindlimb',
-    'hindmarch',
-    'hindu-moslem',
-    'hinny',
-    'hinshelwood',
-    'hinson',
-    'hipparcos',
-    'hippopotamuses',
-    'hirohato',
-    'hiroyasu',
-    'hirudin',
     'his/',
-    'hispano',
-    'hispos',
-    'hit-squad',
-    'hittin\'',
-    'hlao-roo',
-    'hns',
-    'hoan',
-    'hoathly',
-    'hobbs/rspca',
-    'hobbyhorse',
-    'hockin',
-    'hocus',
-    'hoet',
-    'hoggar',
-    'hoghton',
     'hoity-toity',
-    'hojatoleslam',
-    'hokule\'a',
-    'holderness-manolo',
-    'holdover',
-    'holkeri',
-    'holmer',
-    'holography',
-    'hom&oelig;opathy',
-    'homan',
-    'home-loving',
-    'home/',
-    'homeworld',
-    'hommage',
-    'hones',
-    'honest-to-god',
     'honey-gold',
-    'hongu',
-    'honour-bound',
-    'honte',
-    'hoof-marks',
-    'hookum',
-    'hoopers',
-    'hopcraft',
-    'hornbaker',
-    'hornless',
-    'horological',
-    'horsman',
-    'horthy',
-    'horton/united',
-    'horv&aacute;th',
-    'hos',
     'hossein',
-    'hot-dogs',
-    'hot-house',
-    'hot-spots',
-    'houndgate',
-    'housewarming',
-    'hout',
-    'hoverfly',
-    'howett',
-    'howrah',
-    'howzat',
-    'hox-b2',
-    'hoxne',
-    'hoyden',
-    'hp2',
-    'hrc',
     'hrm',
-    'hsd',
-    'hsr',
-    'htfiiic',
-    'hubei',
-    'hucks',
-    'hued',
-    'humanized',
-    'humanoids',
-    'humiliates',
-    'hunchbacked',
-    'hunched-up',
-    'hundredal',
-    'hung-up',
-    'huntworth',
-    'hurr',
     'hurst/bristol',
-    'hurtfully',
-    'hwiccian',
-    'hwyl',
-    'hyaena',
-    'hyaenas',
-    'hydro-electricity',
-    'hydrogen-bonding',
-    'hydrolases',
-    'hydrologic',
-    'hydrophone',
-    'hydrosphere',
-    'hydroxyl-radical',
-    'hydroxyls',
-    'hylands',
-    'hym',
     'hyndland',
-    'hyper-sensitive',
-    'hyperinsulinaemia',
-    'hyperparathyroidism',
-    'hypersoft',
-    'hyperthermia',
-    'hypnotists',
-    'hyponyms',
-    'hypothetico-deductive',
-    'hypoxic',
-    'hytrel',
-    'hyun',
-    'i&formula',
-    'i&ntilde;es',
-    'i-measure',
-    'i.k.',
     'i.o.u',
-    'i/',
-    'i/ii',
-    'i3',
-    'iakov',
-    'ials',
-    'iattc',
-    'ibi',
-    'ibuprofen',
-    'ic1b',
-    'icaa',
-    'ice-bucket',
-    'ice-climbing',
-    'ice-cubes',
-    'ice-water',
-    'icefalls',
     'ichthyosaurs',
-    'id&eacute;e_fixe',
-    'idea-having',
-    'idea-management',
-    'idealise',
-    'idl',
-    'idler',
-    'idolising',
-    'igcp',
-    'iggi',
-    'ignace',
-    'iguacu',
-    'ii/iii',
-    'iif',
-    'iiib',
-    'ikramov',
     'ill-omen',
-    'illuminatingly',
-    'illus.3',
-    'illusionists',
-    'ilm',
-    'ilyich',
-    'imbrie',
-    'imhausen-chemie',
-    'immelmann',
-    'immoderately',
-    'immoralities',
-    'immortalise',
-    'immortalize',
-    'immunocytes',
-    'immunosuppressant',
-    'impairment/loss',
     'impenetrably',
-    'impersonates',
-    'implementors',
-    'implicational',
-    'import-substitution',
-    'impoundment',
-    'improvisers',
-    'imrich',
-    'in-calf',
-    'inadequates',
-    'inartistic',
-    'inauspiciously',
-    'incarcerate',
-    'incommensurability',
-    'inconsequence',
-    'incorporative',
     'incorruptibility',
-    'incubates',
-    'incunabula',
-    'indepth',
-    'indeterminism',
-    'india-rubber',
-    'indipau',
-    'indispensability',
-    'individualization',
-    'individually-designed',
-    'indream',
-    'inessentials',
-    'inexplicit',
-    'infectivity',
-    'infelicities',
-    'infests',
     'inflations',
-    'infmort',
-    'info-mous',
-    'informix-gateway',
-    'ingenue',
-    'ingolfiana',
-    'inhalant',
-    'inharmonious',
-    'initial-value',
-    'initialize',
-    'initiations',
-    'inj',
-    'injury-plagued',
-    'injury-prone',
-    'inkpen',
-    'inkster',
     'inn-keeper',
-    'inner-directed',
-    'inner-london',
-    'inoculate',
-    'inoculating',
-    'inoue',
-    'inra',
-    'ins.',
-    'insalubrious',
-    'insead',
-    'instructress',
-    'instrumented',
-    'intecalc',
-    'intellectualisation',
-    'intellectuality',
-    'inter-cropping',
     'inter-institutional',
-    'inter-organizational',
-    'inter-relation',
-    'inter-site',
-    'intercessor',
-    'interesting-looking',
-    'interferometry',
-    'interflug',
-    'interindividual',
-    'interlayer',
-    'internal/external',
-    'internality',
-    'internationalise',
-    'internationalising',
-    'internetworks',
-    'internuclear',
     'interobserver',
-    'interpenetrate',
-    'interreligious',
-    'intragenic',
-    'intraregional',
-    'intrasexual',
-    'introjected',
-    'invigoration',
-    'iolanthe',
-    'ioniser',
-    'iosif',
-    'ip22',
-    'ipecacuanha',
-    'iptg',
-    'irae',
-    'irish-based',
     'irish-trained',
-    'irk',
-    'iron-clad',
-    'irrebuttable',
-    'irredentist',
-    'irrefutably',
-    'irreligion',
-    'irresolutely',
-    'irritatedly',
-    'irrotational',
-    'is-tested-by',
-    'is4',
-    'isedet',
-    'ishii',
-    'isidora',
-    'isidro',
     'islandica',
-    'isma',
-    'isnt',
-    'isolonche',
-    'isosbestic',
-    'isotopically',
-    'isotype',
-    'issaq',
-    'issas',
-    'issue-information',
-    'istiqlal',
-    'isturits',
-    'it-based',
-    'itelmens',
-    'itemize',
-    'itpa',
     'itv1',
-    'ivar',
-    'ivey',
-    'ivig',
-    'ivorian',
-    'ivory-coloured',
-    'iwo',
-    'izvestiia',
-    'j&amp;f',
-    'j&amp;h',
-    'j&auml;ckel',
-    'j\'ai',
-    'j.e.',
-    'j.p.s',
-    'j/m',
-    'j0437&ndash;4715',
     'jackanory',
-    'jacobo',
-    'jakimik',
-    'jalopy',
-    'jammers',
-    'janesville',
-    'jani',
-    'janitors',
-    'janjua',
-    'january-june',
-    'january/february',
-    'jarbas',
-    'jardea',
-    'jasminder',
-    'jasminum',
-    'jaune',
     'javits',
-    'jax',
-    'jayasuriya',
-    'jazzed',
-    'jcbs',
-    'jeetinder',
-    'jelfs',
-    'jelley',
-    'jennett',
-    'jer',
-    'jerboa',
-    'jeremias',
-    'jerries',
-    'jerrold',
-    'jerrome',
-    'jerry-can',
     'jhesu',
-    'jia',
-    'jib&eacute',
-    'jigged',
-    'jima',
-    'jitsu',
-    'jiyun',
-    'jl',
-    'jmsa',
-    'jobbernole',
-    'jobbery',
-    'jobclubs',
-    'john-stevas',
-    'joie',
-    'joint-funded',
-    'jokaero',
     'jollier',
-    'jones-evans',
-    'jongh',
-    'joolz',
-    'josefov',
-    'josepha',
-    'jounced',
-    'jours',
-    'jovanovic',
-    'jowers',
-    'joynes',
-    'juergen',
-    'juke-boxes',
-    'julee',
-    'juli&aacute;n',
-    'julidochromis',
     'juliot',
-    'jumpin\'',
-    'june-july',
-    'juneau',
-    'juraj',
-    'jure',
-    'juridically',
-    'jurymen',
-    'jussy',
-    'just_in',
-    'juster',
-    'jutes',
-    'juul',
-    'jv',
-    'jym',
-    'k&eacute;pis',
     'k&uuml;hdorf',
-    'k\'miss',
-    'k.j.l.',
-    'k13',
-    'k562',
-    'kabakov',
-    'kabardino-balkaria',
-    'kabinett',
-    'kabua',
-    'kakhar',
-    'kalamata',
-    'kaledin',
-    'kallal',
-    'kallikrates',
-    'kalugin',
-    'kalutara',
     'kaman',
-    'kamenev',
-    'kamikamica',
-    'kamisese',
-    'kamlesh',
-    'kampa',
-    'kampen',
-    'kana',
-    'kanda',
-    'kandohla',
-    'kantner',
-    'karamanoglu',
-    'kariba',
-    'karisma',
-    'karjalainen',
-    'karmic',
     'karyotyping',
-    'kasonde',
-    'kassimi',
-    'katas',
-    'katsina',
-    'kawulok',
-    'kayseri',
-    'kdpi',
-    'keesing',
-    'keiran',
-    'keizo',
-    'kellock',
-    'kembel',
-    'kempt',
-    'kendra',
-    'keno',
     'kenrick',
-    'kenworthy',
-    'kenzo',
-    'kerbstone',
-    'kerrier',
-    'kerry-jane',
-    'kersal',
-    'kerschensteiner',
-    'kes',
-    'kewenig',
-    'kewley',
-    'key-note',
-    'key-ring',
-    'keyingham',
-    'keynes-based',
-    'keyrings',
     'kfa',
-    'khalkhali',
-    'khorasan',
-    'khue',
-    'kickable',
-    'kidscape',
-    'kidsons',
-    'kie',
-    'kiesinger',
-    'killer-bardi',
-    'killinchy',
-    'killington',
-    'kilmelford',
-    'kilner',
-    'kimmeridge',
-    'kinase-linked',
     'king-dukes',
-    'kingsmead',
-    'kingstown',
-    'kinkead',
-    'kiranjit',
-    'kirchheimer',
-    'kirkaig',
-    'kirkandrews',
-    'kirkcudbrightshire',
-    'kirke',
-    'kirkstead',
-    'kiro',
-    'kirst',
-    'kissers',
-    'kitchen/dining',
-    'kitchenmaids',
     'kix',
-    'kiyonga',
-    'kizza',
-    'klansman',
-    'klatt',
-    'kleinman',
-    'klesch',
-    'knavesmire',
-    'knayton',
-    'knee-elbow',
-    'knitweave',
-    'knockshinnoch',
-    'knuckle-dusters',
-    'kohelet',
-    'kollerstrom',
-    'komarovsky',
     'komlanvi',
-    'kondratieff',
-    'koos',
-    'kops',
-    'kornhauser',
-    'kotor',
-    'koulo',
-    'kra',
-    'krajewski',
-    'krankoor',
-    'kreutzer',
-    'kristine',
-    'kron',
-    'krupskaia',
-    'ks128',
-    'kt22',
     'kta',
-    'kufrans',
-    'kuijken',
-    'kultur',
-    'kupferschiefer',
-    'kurdzhali',
-    'kwesi',
-    'kwirs',
-    'kx',
-    'kyomi',
-    'l&agrave',
-    'l&amp;se',
-    'l&eacute;vesque',
-    'l\'air',
-    'l\'estrange',
-    'l\'incoronazione',
     'l-arginine-no',
-    'l-forms',
-    'l-tenses',
-    'l12',
-    'l988',
-    'labarbe',
-    'labidochromis',
-    'laboratory-based',
-    'labral',
-    'labtam',
-    'labuan',
-    'lacquerware',
-    'lactobacillus',
-    'ladislas',
-    'lady-like',
-    'laertius',
     'lafferty/hereford',
-    'laffin',
-    'lage',
-    'lahaina',
-    'laid-down',
-    'lait',
-    'lak',
-    'lakers',
-    'lalique',
-    'lambda-matrix',
-    'lame-duck',
-    'laminating',
-    'lammertyn',
-    'lamprologus',
-    'lancret',
-    'land-holders',
     'land-holdings',
-    'land-hungry',
-    'land-living',
-    'land-mass',
-    'land-uses',
-    'langoustes',
-    'language(s)',
-    'language-is',
-    'language-processing',
-    'lanrezac',
-    'lansana',
-    'lansink',
-    'laputa',
-    'laraki',
-    'lardner',
-    'large-sized',
     'large-volume',
-    'larky',
-    'larsp',
-    'lasham',
-    'lastingly',
-    'latchford',
-    'late-eighties',
-    'late-third',
-    'latey',
-    'latics',
-    'latitudinarian',
-    'latour',
-    'laurentius',
-    'laurion',
-    'lave',
-    'law-like',
     'lawmaker',
-    'layoff',
-    'layzell',
-    'lazare',
-    'ldo',
-    'lead(ii)',
-    'leadbeater',
-    'leaf-blade',
-    'leaf-shaped',
-    'leam',
-    'leaper',
-    'leaseback',
-    'leather-look',
-    'lebna',
-    'lebrun',
-    'lechers',
     'lector',
-    'leekpai',
-    'left-brain',
-    'left-handedness',
-    'left-ventricular',
-    'leftmost',
-    'leg-weary',
-    'leggate',
-    'legislatively',
-    'legitimisation',
-    'legside',
-    'lehmbruck',
-    'lekking',
-    'lemn',
-    'lemon-yellow',
-    'lench',
     'lenis',
-    'lensing',
-    'lentini',
-    'leonhard',
-    'leonov',
-    'leopardskin',
-    'leptokurtosis',
-    'letham',
-    'letheringsett',
-    'letter(s)',
-    'lettres',
-    'leudes',
-    'lev.',
-    'levada',
-    'level-2',
-    'leventhorpe',
     'levodopa',
-    'levy-lang',
-    'lewington',
-    'leys/oxford',
-    'liath',
-    'libdems',
-    'liberte',
-    'lichen-covered',
-    'liddington',
-    'lidgett',
-    'liebe',
-    'liebestod',
-    'lieth',
-    'life-changing',
-    'life-spans',
-    'lifejacket',
     'lifespan&mdash;startup.com',
-    'liggers',
-    'light-blue',
-    'lii',
-    'lijphart',
-    'lilla',
-    'lillico',
-    'limburg',
-    'limpness',
-    'lindow',
-    'lingula',
-    'linnaean',
-    'linta',
-    'linthal',
-    'linzey',
-    'lionheart',
     'lippmann',
-    'lirriper',
-    'listserv',
-    'lithostratigraphy',
-    'liubov',
-    'live-and-let-live',
-    'llanfyllin',
-    'llangoed',
-    'llanio',
-    'llanover',
-    'llantrisant',
-    'llwyn-y-groes',
-    'lni',
-    'loadleveler',
-    'loanable',
-    'lobed',
     'lobular',
-    'localising',
-    'lochboisdale',
-    'lochgilphead',
-    'lochiel',
-    'lock-on',
-    'lockey',
-    'locksley',
-    'locutions',
-    'loder',
-    'loew',
-    'logicians',
-    'lollards',
-    'long-anticipated',
-    'long-billed',
-    'long-expected',
     'long-form',
-    'long-horned',
-    'long-shot',
-    'long-spade',
-    'longannet',
-    'longfords',
-    'longlasting',
-    'longowal',
-    'longrock',
-    'look-outs',
-    'look.up',
-    'loom-weights',
-    'loomlade',
-    'loose-box',
-    'lopl',
-    'lora',
     'lorenzini',
-    'lorestan',
-    'lory',
-    'lostness',
-    'loudmer',
-    'loudmouth',
-    'loue',
-    'louw',
-    'love-story',
-    'lovebites',
-    'low-class',
-    'low-enough',
-    'low-intensity',
-    'low-salt',
-    'low-technology',
-    'low-volume',
     'lower-order',
-    'lowfields',
-    'lozoraitis',
-    'lpa',
-    'lpii*',
-    'lrppp',
-    'ls23',
-    'lsis',
-    'lub',
-    'lubricates',
-    'luckey',
-    'lucrece',
-    'ludek',
-    'ludwigia',
-    'ludzhev',
-    'luena',
     'luf',
-    'lugar',
-    'luggers',
-    'luigia',
-    'lukals',
-    'lumi&egrave;re',
-    'lumpers',
-    'lungeing',
-    'lustria',
-    'luton-based',
-    'luvvie',
-    'luxe',
-    'luxury-goods',
-    'luzula',
-    'lx-850',
-    'lyapunov',
     'lycee',
-    'lycett',
-    'lydersen',
-    'lydgate',
-    'lygon',
-    'lyly',
-    'lymphad',
-    'lynch-pin',
-    'lynd',
-    'lynden',
-    'lyneham/wiltshire',
-    'lynk',
-    'lyonpo',
-    'lyonshall',
-    'lyr&aelig',
-    'lythgoe',
     'm&auml;dchen',
-    'm&uuml;nsterland',
-    'm\'diq',
-    'm-five',
-    'm-one',
-    'm-p',
-    'm.i.5',
-    'm.j.',
-    'ma&icirc;tres',
-    'macallan',
-    'macalpine',
-    'macandon',
-    'macari/manager',
-    'maccoll',
-    'maccormack',
-    'macewan',
     'macey',
-    'machar',
-    'machine-building',
-    'machover',
-    'macierewicz',
-    'macke',
-    'maclaren/oxford',
-    'macmurray',
-    'macos',
-    'macro-level',
-    'macrone',
-    'macula',
-    'madagascan',
-    'madeiras',
-    'madhouses',
-    'madura',
     'maeda',
-    'mafia-style',
-    'mafias',
-    'mafiosi',
-    'maggio',
-    'magheralin',
-    'magnetotail',
-    'magnifica',
-    'magoo',
-    'mahaud',
-    'mahaz',
-    'mahomet',
-    'mailbag',
-    'mains-powered',
-    'majella',
-    'majorie',
     'malabar',
-    'malabedeely',
-    'maldonaldo',
-    'male-defined',
-    'maley',
-    'malfi',
-    'malians',
-    'maligning',
-    'malin',
-    'mallaby',
-    'mallinger',
-    'malm',
-    'malmierca',
-    'malmsey',
-    'malnourishment',
-    'malondialdehyde',
     'malthouse',
-    'mambas',
-    'mameluke',
-    'mamie',
-    'mamluk',
-    'mammogram',
-    'mamore',
-    'mamounia',
-    'man-days',
-    'man-like',
-    'man-rems',
-    'mandala',
-    'manders',
-    'manderson',
-    'mandeville/buckinghamshire',
-    'mangold',
     'mangope',
-    'manikins',
-    'manioc',
-    'mannering',
-    'mannock',
-    'manor-house',
-    'manresa',
-    'mansi',
-    'manstead',
-    'many-headed',
-    'manzanilla',
-    'manzano',
-    'mapinduzi',
-    'maracas',
-    'maravilla',
-    'marcelo',
     'march-30',
-    'marcy',
-    'mariah',
-    'maribor',
-    'marinades',
-    'marinading',
-    'marinating',
-    'mark-ups',
-    'market-related',
-    'markios',
-    'markyate',
-    'marmoutier',
-    'marnaux',
-    'marowitz',
-    'marquardt',
-    'marquise',
     'marris',
-    'marsco',
-    'martek',
-    'martialled',
-    'martigny',
-    'martinson',
-    'martinus',
-    'martz',
-    'marvelon',
-    'marvelous',
-    'marylands',
-    'maskill',
-    'masochists',
-    'mass-observation',
-    'massenga',
-    'master-manufacturers',
     'masterless',
-    'mastersingers',
-    'mastheads',
-    'mastrantonio',
-    'masurian',
-    'matara',
-    'match-day',
-    'matchett',
-    'matchroom',
-    'matisses',
-    'mattering',
-    'matthei',
-    'matthews/scotland',
-    'mawlawi',
-    'max85',
-    'maxam-gilbert',
     'maxi-read',
-    'maximum-likelihood',
-    'maxol',
-    'may&ndash;31',
-    'mayakovsky',
-    'mazar-i-sharif',
-    'mazur',
-    'mazurka',
-    'mbc',
-    'mbest',
-    'mbv',
-    'mc1',
-    'mcb',
-    'mccashin',
-    'mcchrystal',
-    'mcclenaghan',
     'mccord',
-    'mccreath',
-    'mccrickard',
-    'mcdonnell-douglas',
-    'mceldowney',
-    'mcfaul',
-    'mcgarrity',
-    'mcgladdery',
-    'mcgrindle',
-    'mchaffie',
-    'mchoan',
-    'mckibben',
-    'mckim',
-    'mckimmie',
-    'mckinty',
-    'mckirdy',
     'mcleary',
-    'mcmurtrie',
-    'mcnicol',
-    'mcswegan',
-    'mctasney',
-    'mcvean',
-    'mcvicker',
-    'md.',
-    'mdps',
-    'meadowhall',
-    'meaningly',
-    'meb',
-    'meccas',
-    'mechanistically',
-    'mecklenburg-west',
-    'medenica',
     'medhurst',
-    'medicalisation',
-    'medievalists',
-    'mediocrities',
-    'medirace',
-    'medium-priced',
-    'medlar',
-    'medusae',
-    'meetin\'',
-    'meeting(s)',
-    'mefenamic',
-    'megabyxos',
-    'megacrysts',
-    'megger',
-    'megson',
-    'meichenbaum',
     'meikleour',
-    'mej&iacute;a',
-    'mekons',
-    'melby',
-    'meld',
-    'meles',
-    'melior',
-    'melman',
-    'melt-water',
-    'member(s)',
-    'memling',
-    'memoire',
-    'memory-bank',
-    'menary',
-    'menendez',
-    'menin',
     'menina',
-    'menstruate',
-    'mental-sentence',
-    'mentheus',
-    'mep/con',
-    'mepacrine',
-    'meq/h',
-    'merano',
-    'merchanting',
-    'meridional',
-    'meridon',
-    'merricks',
-    'merseyrail',
-    'mervin',
-    'mescaline',
-    'mesen',
     'meshkinpour',
-    'mesmerise',
-    'mesp',
-    'mestre',
-    'metaphases',
-    'metapodials',
-    'metaware',
-    'meteoritic',
-    'methane-rich',
-    'methotrexate',
-    'methyltransferases',
-    'meticulousness',
-    'meude-monpas',
-    'meurig',
-    'meyerbeer',
-    'mfs',
     'mgfv',
-    'mgkg',
-    'mglurs',
-    'michaelis',
-    'mickleton',
-    'micro-vector',
-    'microcephaly',
-    'microchallenge',
-    'microcirculatory',
-    'microcomputing',
-    'microelectrodes',
-    'microfauna',
-    'microlitre',
-    'microphonic',
-    'microprogram',
-    'microprogrammed',
     'microsecond',
-    'microtine',
-    'mid-decade',
-    'mid-eighth',
-    'mid-height',
-    'mid-market',
-    'mid-ninth',
-    'mid-seventh',
-    'mid-stratosphere',
-    'mid-to',
-    'mid-turn',
-    'mid-upper',
-    'middens',
-    'middle-brow',
-    'middle-eastern',
-    'middle-wave',
     'middlebrow',
-    'middlestone',
-    'midwater',
-    'mie',
-    'mieno',
-    'mietusch',
-    'mifflin',
-    'milcom',
-    'mile-wide',
-    'milk-fed',
-    'milliamps',
-    'milligrammes',
-    'millilitre',
-    'million-rated',
-    'millns',
-    'mima',
     'minardi',
-    'minatory',
-    'minden',
-    'mineralising',
-    'mineralogies',
-    'mini-breaks',
-    'mini-buses',
-    'mini-computers',
-    'mini-constitution',
-    'mini-steps',
-    'minicom',
-    'miniskirts',
-    'ministeriales',
-    'ministerially',
-    'minks',
-    'minolta',
     'minurso',
-    'miracoli',
-    'miraflores',
-    'miri',
-    'mirman',
-    'mirrlees',
-    'mirror/care',
-    'misappropriating',
-    'misclassified',
-    'misdescribed',
-    'mishan',
-    'misogynists',
-    'mispronunciation',
-    'misrati',
-    'misreadings',
-    'missen',
     'mistrustfully',
-    'misuses',
-    'mitogens',
-    'ml/kg',
-    'mmcfd',
-    'mmmmm',
-    'mmpa',
-    'mnf-h',
-    'moabite',
-    'moaner',
-    'moares',
-    'moate',
-    'mod.rep.',
-    'model-building',
-    'modest-sized',
-    'modularization',
     'moh&aacute;cs',
-    'mohammadreza',
-    'mohorita',
-    'moir&eacute',
-    'mojahedin',
-    'moke',
-    'moldavan',
-    'molesey',
-    'mollycoddling',
-    'moly',
-    'mon-sat',
-    'monach',
-    'monelle',
-    'money-changers',
-    'mongers',
-    'mongolians',
     'monodisperse',
-    'monomode',
-    'monoplanes',
-    'monospecific',
-    'monotechnic',
-    'monotonically',
-    'monseigneur',
-    'montagu-chelmsford',
-    'montalva',
-    'montanas',
-    'montazeri',
-    'monterosso',
-    'montt',
-    'moon-like',
-    'moonstone',
-    'moony',
     'moosehead',
-    'moravians',
-    'morcha',
-    'mordantly',
-    'morgenstern',
-    'mork',
-    'morny',
-    'morphologic',
-    'morphometry',
-    'morritt',
-    'morulae',
-    'morvern',
-    'moscucci',
-    'mosel',
-    'moskovskiye',
-    'mossie',
     'mossman',
-    'mosteller',
-    'mother-and-toddler',
-    'mother-infant',
-    'mother-love',
-    'mothopeng',
-    'motian',
-    'moto-cross',
-    'motu',
-    'mourneview',
-    'mousehole',
-    'moutarde',
-    'moutis',
-    'moye',
-    'moyet',
-    'mp/conservative',
     'mp/education',
-    'mpv',
-    'mr.peavey',
-    'mrpii',
-    'mry',
-    'ms-windows',
-    'msi-dn',
-    'mtu',
-    'much-delayed',
-    'muckamore',
-    'mucklets',
-    'mudbank',
-    'mudbrick',
-    'muddily',
-    'muddly',
-    'muderris/muftiliks',
     'mudge',
-    'mukddaam',
-    'mulched',
-    'mulheim',
-    'mullard',
-    'multi-cellular',
-    'multi-lateral',
-    'multi-platform',
-    'multi-professional',
-    'multi-word',
-    'multiauthor',
-    'multiple-key',
-    'multiplexers',
-    'multiplexing',
-    'multiplexity',
-    'multisoft',
     'mumma',
-    'mundic',
-    'munnford',
-    'munnion',
-    'munny',
-    'munoz',
-    'muota',
-    'muralitharan',
-    'murex',
-    'murli',
-    'muscatine',
-    'musher',
-    'musks',
-    'mussini',
-    'mussy',
-    'mutasa',
     'mutigny',
-    'mutineer',
-    'mwangaza',
-    'mycological',
-    'mykines',
-    'mynde',
-    'mynewpos',
-    'myoelectrical',
-    'myofibroblast',
-    'myrdal',
-    'myrica',
-    'mysterium',
-    'mytilus',
-    'n&ocirc;tre',
-    'n&sim',
-    'n\'diaye',
     'n+',
-    'n-monomethyl-l-arginine',
-    'n.h.s.',
-    'n=11',
-    'nabs-wacc',
-    'nachson',
-    'nalidixic',
-    'name(s)',
-    'name/password',
-    'nanak',
-    'nanayakkara',
-    'nanjiani/scotland',
-    'nannofossil',
-    'nansen',
-    'narodny',
-    'nascimento',
     'nasm',
-    'nastasya',
-    'natans',
-    'nathanson',
-    'nationally-developed',
-    'naunton',
-    'nauseatingly',
-    'navarrese',
-    'navstar',
-    'naxalites',
-    'nazmu',
-    'ndbs',
-    'ndos',
-    'near-darkness',
-    'near-impossible',
-    'near-misses',
     'near-universal',
-    'nebot',
-    'neck-through-body',
-    'nedo',
-    'neediest',
-    'needle-thin',
-    'needleman',
-    'neely',
-    'neeson',
-    'nefi',
-    'nefta',
-    'negligibly',
-    'negroponte',
-    'neighboring',
-    'nem',
-    'nenets',
     'neo-baroque',
-    'neo-darwinism',
-    'neo-nazism',
-    'neo-renaissance',
-    'neo-romanesque',
-    'neo-weberian',
-    'neodata',
-    'neoteny',
-    'nepi',
-    'nerve-jangling',
-    'netherfields',
-    'netherhampton',
-    'netsecure',
-    'netteswell',
-    'netto',
-    'network-attached',
     'networld',
-    'neuberger',
-    'neuralgic',
-    'neuro-physiological',
-    'neuroleptics',
-    'neuropile',
-    'neurosurgeons',
-    'neurotoxic',
-    'neuschwanstein',
-    'neutralizes',
-    'never-ceasing',
-    'newbould',
-    'newcraighall',
-    'newforge',
-    'newly-released',
-    'newman-haas',
     'newoed2',
-    'news-gathering',
-    'newton-john',
-    'newtownstewart',
-    'nex',
-    'ng/',
-    'ng/mg',
-    'ngs',
-    'ngurumo',
-    'nick-name',
-    'nickie',
-    'nidl',
-    'nieto',
-    'night-clubs',
-    'night-long',
-    'night-night',
     'nigricans',
-    'nildro-hain',
-    'nimley',
-    'nine-dimensional',
-    'nine-fifteen',
-    'nineteen-ninety',
-    'ninteen',
-    'nisky',
-    'nitpicking',
-    'nitragon',
-    'nlf',
-    'nmea',
-    'nmol',
-    'nmp',
-    'nmw',
-    'no&amp;sub2',
     'no-balled',
-    'no-o-o',
-    'no-show',
-    'no-stop',
-    'no.13',
-    'no.16',
-    'nobili',
-    'nocturnes',
-    'noise/horror',
-    'nominative',
-    'non-assisted',
-    'non-attenders',
-    'non-autonomous',
-    'non-believer',
-    'non-bonding',
-    'non-cabinet',
     'non-certified',
-    'non-chronological',
-    'non-clients',
-    'non-clinical',
-    'non-collection',
-    'non-combat',
-    'non-comedogenic',
-    'non-community',
-    'non-confrontational',
-    'non-contingent',
-    'non-contradictory',
-    'non-current',
-    'non-dedicated',
-    'non-directional',
-    'non-dogmatic',
-    'non-election',
     'non-figurative',
-    'non-fuel',
-    'non-graduates',
-    'non-green',
-    'non-inverters',
-    'non-mathematical',
-    'non-meat',
-    'non-medicated',
-    'non-muslims',
-    'non-owners',
-    'non-parliamentary',
-    'non-participants',
-    'non-pathogenic',
-    'non-persons',
-    'non-practitioners',
-    'non-pregnant',
     'non-profits',
-    'non-provocative',
-    'non-psychological',
-    'non-quantitative',
-    'non-resectable',
-    'non-residence',
-    'non-revolutionary',
-    'non-royal',
-    'non-selection',
-    'non-semantic',
-    'non-statistical',
-    'non-stoichiometric',
-    'non-taxpaying',
-    'non-trade',
-    'non-urban',
-    'nonsmoker',
     'nonsuch',
-    'nonthermal',
-    'nonverbal',
-    'nooijer',
-    'norbreck',
-    'norcombe',
-    'nordberg',
-    'norland',
-    'normal-state',
-    'north-',
-    'northern-based',
-    'nose-art',
-    'nosebleed',
-    'nosiness',
-    'nosode',
-    'notaire',
     'notecards',
-    'noumenal',
-    'nouri',
-    'november-december',
-    'now-extinct',
-    'nowers',
-    'np40',
-    'npd',
-    'npg',
-    'nps',
-    'nrha',
-    'nswru',
-    'nuaw',
-    'nuclear-energy',
-    'nuclear-generated',
-    'nucleating',
     'nudiflorum',
-    'nukes',
-    'nuku\'alofa',
-    'number-plate',
-    'numismatics',
-    'nummulites',
-    'nuove',
-    'nurgle',
-    'nusa',
-    'nusseibeh',
-    'nutcrackers',
-    'nutek',
-    'nw8',
-    'nwfp',
-    'nww',
-    'nymphaeum',
     'o\'dalaigh',
-    'o\'driscoll',
-    'o\'halloran',
-    'o\'kennedy',
-    'o\'rea',
-    'o\'rourkes',
-    'o\'war',
-    'o.b.e.',
-    'o.e.d.',
-    'oakhanger',
-    'oakworth',
-    'oastler',
-    'obes',
-    'obfuscate',
-    'objectifications',
-    'obolensky',
     'obsesses',
-    'obsessionally',
-    'obstructionist',
-    'ocalan',
-    'occupancies',
-    'ocelli',
-    'ocl',
-    'octoplus',
-    'od2',
-    'odborough',
-    'odd-shaped',
-    'oddfellows',
-    'oddjob',
-    'odey',
-    'odness',
-    'oesophagostomum',
     'oestradiol',
-    'off-roader',
-    'off-sales',
-    'off-shoots',
-    'off-track',
-    'offputting',
-    'offred',
-    'often-repeated',
-    'oftener',
-    'ofttimes',
-    'ogen',
-    'ogg',
-    'oho',
-    'oil-cloth',
-    'oil-painting',
-    'oil-paintings',
     'oil-shale',
-    'oiticica',
-    'oke',
-    'okimono',
-    'oklo',
-    'olavide',
-    'olivers',
-    'olten',
-    'olympio',
-    'omerta',
-    'on-centre',
-    'on-road',
-    'on/roll',
-    'once-a-year',
-    'once-proud',
-    'oncologist',
     'ondarts',
-    'one\'',
-    'one-for-one',
-    'one-sidedness',
-    'onely',
-    'onetime',
-    'online/offline',
-    'onoue',
-    'ontogenesis',
-    'ony',
-    'op-104',
-    'op_cit',
-    'opacification',
-    'opb',
-    'open-handed',
-    'open-textured',
     'open-toed',
-    'openforum',
-    'operability',
-    'operations.',
-    'opere',
-    'ophiophthalmus',
-    'ophioplinthacinae',
-    'ophir',
-    'ophiuchi',
-    'opinion-formers',
-    'opinion-forming',
-    'opm',
-    'optometrist',
-    'oq',
-    'orandas',
-    'orchardson',
     'orchestrates',
-    'order-preserving',
-    'ordo&ntilde;ez',
-    'oreopithecus',
-    'orff',
-    'orfordness',
-    'organdie',
-    'orogenesis',
-    'orpen',
-    'orris',
-    'orsi',
-    'orsini',
-    'ortakent',
-    'os/2-based',
-    'oscillograms',
-    'oshima',
     'osirak',
-    'osteoporotic',
-    'ostrava',
-    'oswick',
-    'oswulf',
-    'otho',
-    'oubliette',
-    'ough',
-    'oumarou',
-    'oure',
-    'out-',
-    'out-manoeuvre',
-    'out-moded',
-    'out-station',
-    'out-tray',
-    'out-turn',
     'outbred',
-    'outdid',
-    'outdoing',
-    'outgassing',
-    'outhalf',
-    'outlasts',
-    'outposted',
-    'outranks',
-    'outrunning',
-    'outwrite',
-    'ouv&eacute;a',
-    'over-borrowed',
-    'over-burdened',
-    'over-committed',
-    'over-complicated',
-    'over-critical',
     'over-optimism',
-    'over-powering',
-    'over-privileged',
-    'over-rode',
-    'over-sixties',
-    'over-stimulation',
-    'over-time',
-    'overconfidence',
-    'overeaters',
-    'overmanned',
-    'overprinting',
-    'overreaching',
-    'oversexed',
-    'overshoes',
-    'overshoots',
-    'oversimplifying',
     'overstimulation',
-    'overstretching',
-    'overtax',
-    'overtreatment',
-    'overwatering',
-    'overwrites',
-    'overwriting',
-    'ovindoli',
-    'ovine',
-    'ovo-viviparous',
-    'ovulated',
-    'owl-like',
-    'ox1',
-    'ox14',
-    'ox15',
-    'oxbow',
     'oxidizing',
-    'oxon.',
-    'oxygen-free',
-    'ozaran',
-    'ozone-benign',
-    'p&lt;0.10',
-    'p\'tar',
-    'p-51d',
-    'p.13',
-    'p.14',
-    'p.201',
-    'p.23',
-    'p.28',
-    'p.34',
-    'p.51',
-    'p.53',
     'p.54',
-    'p.73',
-    'p.c.b.s',
-    'p.o.box',
-    'p/p',
-    'p14/',
-    'p300',
-    'p36',
-    'p48',
-    'p50',
-    'p585t7avt2',
-    'p67',
-    'p79',
-    'p=0.013',
-    'p=0.07',
-    'p=0.1',
     'p=0.3',
-    'pa&uacute;l',
-    'paasi',
-    'pacassi',
-    'pacelli',
-    'pacesetters',
-    'pachamama',
-    'pacifier',
-    'package/product',
-    'packing-cases',
-    'pacter',
-    'paderewski',
-    'padgett',
-    'padoa-schioppa',
-    'paedophiles',
-    'pagano',
     'pagetic',
-    'pagnell/buckinghamshire',
-    'pahoehoe',
-    'pai1',
-    'pain-free',
-    'pain-killer',
-    'pain-relieving',
-    'paines',
-    'painfulness',
-    'paining',
-    'painkilling',
-    'pair-wise',
-    'pairin',
-    'paiva',
-    'paladino',
-    'palaeolatitudes',
     'palatal',
-    'pale-coloured',
-    'paletz',
-    'palko',
-    'palliardi',
-    'pallidum',
-    'palm-tree',
-    'palming',
-    'palmitate',
-    'pan-fried',
-    'pan-hellenic',
-    'panegyrics',
-    'pangolins',
-    'panhandle',
-    'paniculata',
-    'panini',
     'panoramica',
-    'panslavism',
-    'pantelleria',
-    'pantheism',
-    'panton-lewis',
-    'paolucci',
-    'paper-mill',
-    'papier',
-    'par-four',
-    'parador',
-    'paraiso',
-    'paralympic',
-    'parapsychologists',
-    'parasitically',
-    'pared-down',
-    'parent-friendly',
     'parents-to-be',
-    'parlor',
-    'parminter',
-    'parousia',
-    'parrinder',
-    'parsec',
-    'parta',
-    'partai',
-    'partaken',
-    'partem',
-    'parthenissa',
-    'parti-coloured',
-    'particle/antiparticle',
-    'particularization',
-    'partizan',
-    'party-state',
     'pas-de-calais',
-    'pashko',
-    'pashtun',
-    'passage-way',
-    'pathans',
-    'pathitem',
-    'patiala',
-    'patnick',
-    'patou',
-    'patrials',
-    'patrie',
-    'patrimonial',
-    'pattens',
-    'patters',
-    'pauley',
-    'pawpaw',
     'pax_britannica',
-    'pay-in',
-    'pbend2',
-    'pc-xview',
-    'pcd-1',
-    'pcm',
-    'pcr-fragments',
-    'pdb',
-    'pdp-',
-    'peace-offering',
-    'peacekeeper',
-    'peachcake',
-    'pearlescent',
-    'pearloid',
-    'peasant-based',
-    'peatbogs',
     'pec',
-    'pecksniff',
-    'pectoralis',
-    'pedalos',
-    'pedicure',
-    'pediplanation',
-    'pedley',
-    'peek-a-boo',
-    'peeke',
-    'peggie',
-    'peisistratos',
-    'pelhams',
-    'pelivan',
-    'pellerin',
-    'pellini',
-    'peltier',
     'pem',
-    'penaia',
-    'penetrations',
-    'pennick',
-    'pennons',
-    'penny-farthing',
-    'pennycott',
-    'penthouses',
-    'penyghent',
-    'people\'',
-    'pepsico',
-    'perambulated',
-    'perceived-as',
-    'percentiles',
-    'percolates',
-    'perdigao',
     'pereire',
-    'perenne',
-    'perfick',
-    'perfringens',
-    'pergamum',
-    'pergolesi',
-    'perha',
-    'pericarp',
-    'pericentromeric',
-    'periplaneta',
-    'perjure',
-    'perjurer',
-    'perse',
-    'perseveres',
-    'personalization',
-    'pertinacious',
     'pesach',
-    'pesh',
-    'pestalozzi',
-    'pet&rcaron&iacute;n',
-    'peter-michael',
-    'petfood',
-    'petfoods',
-    'petrification',
-    'petro-dollars',
-    'petrographical',
-    'petronio',
-    'pettifogging',
-    'pettishly',
-    'peyote',
-    'pfizer',
-    'pfu',
     'pg/',
-    'ph.ds',
-    'ph7',
-    'phallocentric',
-    'phanerozoic',
-    'phantasies',
-    'pharmacovigilance',
-    'pharoah',
-    'phcn',
-    'phenocrysts',
-    'phenomenologically',
-    'pheromonal',
-    'philolaus',
-    'philp',
-    'philtres',
-    'phoenicia',
     'phokian',
-    'phone-booth',
-    'phone-tapping',
-    'phonecard',
-    'phonics',
-    'phosphorimager',
-    'photo-copied',
-    'photo-electric',
-    'photo-finish',
-    'photocomposition',
-    'photomicrograph',
-    'photopoint',
-    'photoshop',
-    'phototherapy',
-    'phoumi',
-    'phoumsavan',
     'phraxos',
-    'phthalocyanine',
-    'phylogenies',
-    'pi&ugrave',
-    'piana',
-    'piaroaland',
-    'piasters',
-    'picardie',
-    'picture-books',
-    'picturesqueness',
-    'picturetel',
-    'pidal',
-    'piddington',
-    'piece-parts',
-    'piece-workers',
-    'pietism',
     'pietre',
-    'piezonuclear',
-    'pigheaded',
-    'pigsties',
-    'pijnenborg',
-    'pile-ups',
-    'pill-boxes',
-    'pimientos',
-    'pin-cushion',
-    'pineta',
-    'pink-and-white',
-    'pink-rimmed',
-    'pinmill',
-    'pinnae',
-    'piol',
-    'pipsqueak',
     'pirating',
-    'pirmin',
-    'pisarev',
-    'pissy',
-    'pitt-kethley',
-    'pizan',
-    'pl&eacute;nitude',
-    'pla2s',
-    'plagiarised',
-    'planchette',
-    'planimetry',
-    'planked',
-    'planus',
-    'plasterboards',
-    'plate-like',
-    'platination',
     'play-back',
-    'plebiscites',
-    'pleiotropy',
-    'pleura',
-    'pln',
-    'plow',
-    'plug-compatible',
-    'plumbago',
-    'plumrose',
-    'plungers',
-    'pluralistically',
-    'pmol/g',
-    'pmol/l/min',
-    'pneumothorax',
-    'pnsf',
-    'pocket-sprung',
     'podge',
-    'poer',
-    'poesy',
-    'pogodin',
-    'pogoing',
-    'poitevins',
-    'poivre',
-    'poizner',
-    'polemis',
-    'polen',
-    'polenpolitik',
-    'polenta',
-    'politer',
-    'politically-motivated',
-    'politicans',
-    'politicizing',
     'politico-legal',
-    'polka-dot',
-    'pollard/chief',
-    'pollens',
-    'pollsmoor',
-    'polyadic',
-    'polyainos',
-    'polyamides',
-    'polydore',
-    'polyfocal',
-    'polymict',
-    'polyphosphates',
-    'polyptych',
-    'polysemic',
-    'polytechnic/college',
-    'polyvalent',
     'ponces',
-    'ponch',
-    'ponman',
-    'ponsonby/scotland',
-    'pooh-poohs',
-    'pool-liners',
-    'pooper',
-    'poorgrass',
-    'poorly-paid',
-    'popinjay',
-    'popstar',
-    'porphyrin',
-    'port-salut',
-    'portended',
-    'porticos',
-    'portugese',
     'porz',
-    'poslogic',
-    'possible-worlds',
-    'post-1918',
-    'post-depositional',
-    'post-entry',
-    'post-feminist',
-    'post-first',
-    'post-impressionism',
-    'post-neonatal',
-    'post-primary',
-    'post-vocalic',
-    'postmentum',
-    'postnotum',
-    'potens',
-    'potentia',
     'potentization',
-    'potos&iacute',
-    'potsherds',
-    'pou-specific',
-    'poulter',
-    'poundstretcher',
-    'pourquoi',
-    'power-driven',
-    'powerful-looking',
-    'powertools',
-    'pozzi',
-    'ppg12',
-    'pr&eacute;val',
-    'prac',
-    'practicably',
-    'praecox',
     'praevia',
-    'praline',
-    'pran',
-    'prandini',
-    'pre-1974',
-    'pre-1989',
-    'pre-acquisition',
-    'pre-course',
-    'pre-cultural',
-    'pre-employment',
-    'pre-fabricated',
-    'pre-fight',
-    'pre-hispanic',
-    'pre-litigation',
-    'pre-norman',
-    'pre-occupations',
     'pre-packs',
-    'pre-press',
-    'pre-requisites',
-    'pre-selection',
-    'pre-shape',
-    'pre-term',
-    'pre-theoretical',
-    'preacherman',
-    'preachings',
-    'preamplifier',
-    'preces',
-    'precipitants',
-    'predator/prey',
-    'predicate/argument',
-    'prefiguring',
-    'prefrontal',
     'preoccupies',
-    'prep-school',
-    'prepackaged',
-    'prepattern',
-    'prepuce',
-    'presbyter',
-    'presbyters',
-    'prescription-only',
-    'presely',
-    'presser',
-    'pretectum',
-    'pretzels',
-    'previa',
-    'prezzie',
-    'pribram',
-    'prie-dieu',
     'priestfields',
-    'priggishness',
-    'primestock',
-    'primping',
-    'primum',
-    'princip',
-    'private/public',
-    'pro-axis',
-    'pro-gamsakhurdia',
-    'pro-palestinian',
-    'problem(s)',
-    'problem-oriented',
-    'probus',
-    'processual',
-    'proctectomy',
-    'procurators',
     'producible',
-    'product-costing',
-    'profanities',
-    'profit-and-loss',
-    'profit-hungry',
-    'programmes.',
-    'proinsulin',
-    'prolamin',
-    'prolongational',
-    'promptitude',
-    'pronuclear',
-    'proof-read',
-    'proof-readers',
-    'propeller-driven',
-    'propeptide',
-    'propopamide',
     'proscriptions',
-    'proserpina',
-    'prosthetics',
-    'protagoras',
-    'proteam',
-    'protein:dna',
-    'proto-fish',
-    'protonated',
-    'protonation',
-    'protoplasts',
-    'prototypically',
-    'protozoal',
-    'provinciality',
-    'provings',
-    'provins',
-    'provocation-neutralisation',
     'prudishness',
-    'prunings',
-    'prv',
-    'ps/1',
-    'psalmes',
-    'psb',
-    'psdb',
-    'psephologists',
-    'pseud',
-    'pseudo-costs',
-    'pseudo-device',
-    'pskov',
-    'psr1718&ndash;19',
-    'psychobiologists',
-    'psychogeriatricians',
-    'psygnosis',
     'ptencl',
-    'pteridium',
-    'pterocles',
-    'ptolemies',
-    'ptpropcl',
-    'ptr.',
-    'ptr1',
-    'pubescens',
-    'puckeridge',
-    'pudenda',
-    'puffball',
-    'puig',
-    'puisieulx',
-    'pull.out',
-    'pulteney',
-    'pumphouse',
     'punchbowl',
-    'punted',
-    'puppyish',
-    'pura',
-    'purchaser-provider',
-    'purchasing-power',
-    'purdie',
-    'purism',
-    'purkiss',
-    'purney',
-    'purveyances',
-    'push-chair',
-    'pussyfoot',
-    'put-off',
-    'pvu',
-    'px64',
     'pyestock',
-    'pyloroplasty',
-    'pyritic',
-    'pyromaniac',
-    'pythia',
-    'q9',
-    'qasr',
-    'qasr-e-shirin',
-    'qau',
-    'qeqe',
-    'qfe',
-    'qol',
-    'qpos',
-    'quadras',
-    'quadraverb',
-    'quadrille',
     'qualiparc',
-    'quartal',
-    'quarter-facet',
-    'quartos',
-    'quasi-independent',
-    'quasi-mystical',
-    'quasi-scientific',
-    'qub',
-    'quebeckers',
-    'quedlinburg',
-    'quett',
-    'quick-growing',
-    'quick-release',
-    'quieres',
-    'quietist',
-    'quietude',
     'quiles',
-    'quinag',
-    'quinte',
-    'quireboys',
-    'quispe',
-    'quitainer',
-    'quoick',
-    'r&eacute;gine',
-    'r&lsqb;x&rsqb',
-    'r&uuml&uuml;tel',
-    'r-values',
-    'r.i.',
-    'r.p.',
-    'r.s.s.',
-    'r.t.',
-    'r0',
     'r11',
-    'r15',
-    'r2/3',
-    'r22',
-    'r4000a',
-    'r6000',
-    'r9',
-    'rabanne',
-    'racecards',
-    'raceway',
-    'rachmanism',
-    'racisms',
-    'racketeer',
-    'rackhams',
-    'racomitrium',
-    'radicalized',
     'radicalizing',
-    'radigund',
-    'radioisotopes',
-    'rafm',
-    'raggamuffin',
-    'ragione',
-    'ragstore',
-    'rahner',
-    'railcards',
-    'raima',
-    'rain-sodden',
-    'rain-swept',
-    'rainless',
-    'raintree',
-    'rajathuks',
-    'rajputana',
     'rakings',
-    'rakishly',
-    'ral',
-    'ram-raiders',
-    'ramaiah',
-    'ramakrishna',
-    'ramana',
-    'rambouillet',
-    'ramekin',
-    'ramesses',
-    'ramillies',
-    'ramla',
-    'rampantly',
-    'ramsewak',
-    'ranch-style',
-    'ranelagh',
     'raneleigh',
-    'rangel',
-    'ranji',
-    'rank-sum',
-    'rann',
-    'ransack',
-    'rapeman',
-    'raphoe',
-    'rapoport',
-    'rapsley',
-    'rasakumbha',
-    'rassadorn',
-    'rater',
-    'ratter',
-    'rattrie',
-    'rattries',
     'raus',
-    'ravelled',
-    'ravishingly',
-    'ravishment',
-    'rawle',
-    'rawley',
-    'rawly',
-    'raynaud',
-    'raysse',
-    'raze',
-    'razor-blade',
-    'razzamatazz',
-    'rbis',
-    'rbs100',
-    'rbs50',
-    'rdls',
     're-admit',
-    're-alignment',
-    're-armed',
-    're-checked',
-    're-drafted',
-    're-edited',
-    're-electing',
-    're-emphasized',
-    're-engaged',
-    're-engagement',
-    're-erection',
-    're-evaluating',
-    're-filled',
-    're-financing',
-    're-focus',
-    're-grouped',
     're-interviewed',
-    're-issuing',
-    're-letting',
-    're-load',
-    're-locate',
-    're-make',
-    're-marry',
-    're-negotiation',
-    're-position',
-    're-present',
-    're-registration',
-    're-regulation',
-    're-running',
-    're-seeded',
-    're-selling',
-    're-statement',
     're-submit',
-    're-submitted',
-    're-surfacing',
-    'readiest',
-    'readmit',
-    'readouts',
-    'reaganite',
-    'realme',
-    'rear-end',
-    'reasonings',
-    'reb&ecirc;che',
-    'rebec',
-    'recapitulates',
-    'recaptures',
-    'recces',
-    'recently-published',
     'recession.',
-    'recessional',
-    'rechecking',
-    'reciprocals',
-    'reciter',
-    'recoded',
-    'recombinant-dna',
-    'recombining',
-    'recompiling',
-    'reconciler',
-    'reconfirm',
-    'reconsecration',
-    'reconstructive',
-    'record-buying',
-    'reculver',
-    'recut',
     'red-carpeted',
-    'red-eared',
-    'red-raw',
-    'red-tail',
-    'redcoat',
-    'reddaway',
-    'reddin',
-    'redecorations',
-    'redeposited',
-    'redistributional',
-    'redly',
-    'redshaw',
-    'redshifted',
-    'redwoods',
-    'ref-o',
-    'refashion',
     'referentiality',
-    'reflate',
-    'refract',
-    'refractoriness',
-    'refracts',
-    'refusenik',
-    'regalists',
-    'regionalised',
-    'registrum',
-    'regni',
-    'regosols',
-    'regt.',
-    'regularization',
-    'rehung',
-    'reichsmarschall',
-    'reifer',
     'reimann',
-    'reimarus',
-    'reimbursable',
-    'reincarnate',
-    'reinvestigated',
-    'rejsek',
-    'rekdal',
-    'rekord',
-    'relaunches',
-    'religion.',
-    'relinquishment',
-    'relkirk',
-    'relum',
-    'remedials',
-    'remixing',
-    'renberg',
     'renovator',
-    'rentakil',
-    'reponsible',
-    'repossessing',
-    'reproducibly',
-    'reprogram',
-    'reprogramme',
-    'repsol',
-    'republish',
-    'requires-source-of',
-    'resealable',
-    'resells',
-    'residentially',
-    'resiliency',
-    'resolutio-compositive',
-    'responsa',
     'responsibility.',
-    'respublica',
-    'restauro',
-    'restoratives',
-    'restring',
-    'resubmission',
-    'retiro',
-    'retread',
-    'retributivists',
-    'retune',
-    'retuned',
-    'return&mdash;detail.errors',
-    'retype',
-    'reunites',
-    'revalidation',
-    'revenges',
     'reveres',
-    'rewa',
-    'rewritable',
-    'rfm',
-    'rhapsodic',
-    'rheological',
-    'rhodopsin',
-    'rhss',
-    'rhymney',
-    'rhynchosaur',
-    'rhynie',
-    'ribston',
-    'ricans',
-    'riccall',
-    'rice-based',
-    'rice-fields',
     'rice-paddies',
-    'rich/poor',
-    'richardson/coach',
-    'richini',
-    'richmal',
-    'riddim',
-    'riddling',
-    'ridge-walk',
-    'riedel',
-    'riemannian',
-    'rietveld',
-    'rifaat',
-    'rifted',
-    'right-of-way',
-    'rigi',
-    'rigold',
     'rigorism',
-    'rikki',
-    'rildia',
-    'rimell',
-    'rina',
-    'ringa',
-    'ringingly',
-    'riordan',
-    'ripest',
-    'risk-sharing',
-    'risk-takers',
-    'risparmio',
-    'riston',
-    'ritwik',
-    'rivas',
-    'riveire',
     'river-bed',
-    'rivi&egrave;re',
-    'rizzolatti',
-    'rlfc',
-    'rnd',
-    'rnid',
-    'road-signs',
-    'road-users',
-    'roade',
-    'robshaw',
-    'rochas',
-    'rock-climber',
-    'rockeries',
-    'roddenberry',
-    'rodders',
-    'rodley',
     'rogation',
-    'rokermen',
-    'rollox',
-    'rolo',
-    'rolypoly',
-    'rom&aacute;n',
-    'romani',
-    'romanticize',
-    'romeos',
-    'roncagliolo',
-    'rondonia',
-    'rong',
-    'ronstadt',
-    'roofleaf',
-    'room-by-room',
-    'roon',
     'roose-evans',
-    'rootpack1',
-    'rope-lights',
-    'rorquals',
-    'rosas',
-    'rosebowl',
-    'rosenstein',
-    'rosetti',
-    'ross-on-wye/herefordshire',
-    'rossythe',
-    'rostral',
-    'rotorua',
-    'rottweil',
-    'rotuma',
-    'roughneck',
-    'roulet',
     'roundish',
-    'roundtrip',
-    'rounton',
-    'rousettus',
-    'route-finder',
-    'routeing',
-    'rowbottom/milton',
-    'rowden',
-    'rowett',
-    'rowlinson',
-    'royton',
-    'rp3',
-    'rrr',
-    'rrrm',
-    'rs-ors',
-    'rsamd',
     'rsjc',
-    'rtp',
-    'rtpi',
-    'ru486',
-    'ruadh',
-    'rubbly',
-    'rubidium',
-    'rublev',
-    'rue-des-bois',
-    'rufa',
-    'ruffianism',
-    'rufina',
-    'ruisdael',
-    'rule-bound',
-    'rumbelow',
-    'run-offs',
     'run-ups',
-    'running-down',
-    'rupiah',
-    'rurban',
-    'rusche',
-    'russets',
-    'rutan',
-    'rychetsky',
-    'ryknild',
-    'ryneveld',
-    'rytasha',
-    's&amp;ls',
-    's&egrave;cheron',
-    's-sugar',
-    's.10',
-    's.100',
     's.13',
-    's.16(1)',
-    's.38',
-    's.56',
-    's.o',
-    's.v.r.',
-    's/nvqs',
-    's1(5)',
-    's10',
-    's1000',
-    's19',
-    's23',
-    's320',
-    's47',
-    's61(1)',
-    's62(4)',
     's742(2)',
-    'sa\'id',
-    'sabadell',
-    'sabiha',
-    'sabkha',
-    'sables',
-    'saccades',
-    'sachlichkeit',
-    'sadden',
-    'saddle-sore',
-    'sadistically',
-    'safestore',
-    'safety-conscious',
-    'sager',
-    'sagitt&aelig',
-    'sagitta',
     'sagna',
-    'sahibzada',
-    'saidi',
-    'sailmakers',
-    'saint-denis',
-    'saint-etienne',
-    'saint-germain',
-    'saint-pierre',
-    'saintbury',
-    'sainte-croix',
-    'saintsbury',
-    'saisons',
-    'sakai',
-    'sale.',
-    'salers',
-    'salesroom',
     'saleswomen',
-    'salines',
-    'sall',
-    'salthouse',
-    'salwar',
-    'sambandham',
-    'sambora',
-    'sandbar',
-    'sandone',
-    'sandrin',
-    'sandtoft',
-    'sanest',
-    'sangha',
-    'sango',
-    'sanmarco',
-    'sanquhar',
     'santi',
-    'santolina',
-    'sanz',
-    'sapan',
-    'sapaudia',
-    'sapin',
-    'sapporo',
-    'saraceno',
-    'sarai',
-    'sardos',
-    'sarna',
-    'sarnafil',
-    'saronic',
-    'sarouac',
-    'sartorius',
-    'sass',
     'sassanian',
-    'satrapy',
-    'sattareh',
-    'satterthwaite',
-    'saturnino',
-    'sauce-boat',
-    'sauropod',
-    'saussies',
-    'sava-danube',
-    'save-a-cup',
-    'savings-and-loan',
-    'savoie',
-    'savoir_faire',
-    'savories',
-    'sawbench',
-    'sawdoctors',
     'saxburgh',
-    'saxifrages',
-    'saxl',
-    'saxone',
-    'saxtet',
-    'scads',
-    'scaffolder',
-    'scagliola',
-    'scaleability',
-    'scalextric',
-    'scally',
-    'scanlan',
-    'scarer',
-    'scarifying',
-    'scarpa',
-    'scav',
     'scawen',
-    'scenes-of-crime',
-    'scented-leaved',
-    'scfv',
-    'scfw',
-    'sch&auml;fer',
-    'schaffner',
-    'scheiner',
-    'schiemann',
-    'schimberni',
-    'schlatter',
-    'schluchsee',
-    'schmidt-rottluff',
-    'schnadhorst',
-    'schnell',
-    'schnellman',
     'scholfield',
-    'schoolmastering',
-    'schumm',
-    'schweiz/parti',
-    'schweizer',
-    'scleroderma',
-    'sclerosant',
-    'scoliosis',
-    'scolt',
-    'scooper',
-    'scotcert',
-    'scots-born',
-    'scottsdale',
-    'scratchplates',
-    'screw-on',
-    'screwball',
     'scribemoles',
-    'scrim',
-    'scriptory',
-    'scriptwriting',
-    'scriveners',
-    'scruffiness',
-    'scruffs',
-    'scrum-halves',
-    'scrummages',
-    'scrupulosity',
-    'scrupulousness',
-    'scumnik',
-    'scuzzy',
-    'sdk',
-    'sdlc',
-    'sdp/liberal',
     'se.5a',
-    'se16',
-    'sea-fishing',
-    'sea-food',
-    'sea-levels',
-    'sea-watches',
-    'seaby',
-    'seahorse',
-    'seam-loc',
-    'seamount',
-    'searingly',
-    'seashells',
-    'seawatch',
-    'sebag-montefiore',
-    'sebastopol',
-    'sebe',
     'second-quarter',
-    'second-stage',
-    'secretagogues',
-    'secretary/treasurer',
-    'section-making',
-    'secularists',
-    'security-conscious',
-    'sedgeley',
-    'seductiveness',
-    'seed-beds',
-    'seedier',
-    'seedsmen',
-    'seel',
-    'seemeth',
-    'seg',
-    'seged',
     'segrave',
-    'seguso',
-    'seiners',
-    'seir',
-    'seizinger',
-    'sekhmet',
-    'selectee',
-    'selectmail',
-    'self-abasement',
-    'self-abnegation',
-    'self-defined',
-    'self-defining',
-    'self-destructing',
-    'self-doubts',
-    'self-dramatisation',
-    'self-identification',
     'self-loading',
-    'self-locking',
-    'self-poisoners',
-    'self-professed',
-    'self-promoting',
-    'self-publicist',
-    'self-punishment',
-    'self-reflexivity',
-    'self-revealing',
-    'self-sown',
-    'self-titled',
-    'seljuks',
-    'selvini',
-    'selworthy',
-    'semanticist',
-    'semerdzhiev',
     'semi-abstract',
-    'semi-continuous',
-    'semi-divine',
-    'semi-fixed',
-    'semi-invalid',
-    'semi-quantitative',
-    'semi-ripe',
-    'semi-state',
-    'sennen',
-    'senora',
-    'sensationalised',
-    'sensitives',
-    'sentimentale',
-    'sentimentalist',
-    'sephadex',
-    'sepilok',
     'sepulchres',
-    'serologically',
-    'servatius',
-    'servio',
-    'sessford',
-    'setch',
-    'settling-in',
-    'seven-and-a-half',
-    'seven-goal',
-    'seven-man',
-    'seventy-year-old',
-    'severer',
-    'sewerby',
-    'sews',
-    'sexennial',
-    'sexily',
     'sexologists',
-    'sezgin',
-    'sfe',
-    'sh6',
-    'shackling',
-    'shadow-boxing',
-    'shahn',
-    'shahrastani',
-    'shakier',
-    'shakira',
-    'shakos',
-    'shaliapin',
-    'shalimar',
-    'shallis',
-    'shalott',
-    'shamuyarira',
     'shanaz',
-    'shantallow',
-    'shanty-towns',
-    'shapour',
-    'sharam',
-    'shardari',
-    'shareable',
-    'shark-like',
-    'sharlston',
-    'sharp-featured',
-    'sharyn',
-    'shayle/gloucestershire',
-    'sheaffer',
-    'sheasby',
-    'sheened',
-    'shelf-grip',
     'shelgate',
-    'shell-fire',
-    'shepheard',
-    'sherwell',
-    'shifnal',
-    'shimmery',
-    'shimmied',
-    'shiner',
-    'shipbrokers',
-    'shipsey',
-    'shipston',
-    'shirli-ann',
-    'shirtliff',
-    'shock-absorber',
-    'shock-wave',
-    'shoe-making',
     'shootouts',
-    'short-hand',
-    'short-life',
-    'short-sightedly',
-    'shortt',
-    'shoulder-to-shoulder',
-    'shouldnt',
-    'shtikov',
-    'shurely',
-    'shushkevich',
-    'shut-off',
-    'sicilians',
-    'sick-bed',
-    'sickest',
-    'side-line',
-    'side-lined',
     'side-show',
-    'sidestream',
-    'sidles',
-    'sieff',
-    'siem',
-    'siestas',
-    'sif',
-    'sigeric',
-    'sigmoids',
-    'sign-and-magnitude',
-    'sign-posted',
-    'sign-systems',
-    'signori',
-    'sikora',
-    'sikyon',
-    'silkworms',
     'sillito',
-    'silmour',
-    'silverwork',
-    'silves',
-    'silwan',
-    'simbirsk',
-    'similitude',
-    'simkins',
-    'simpson/scotland',
-    'simson',
-    'sinfully',
-    'singer/guitarist',
-    'single-decker',
-    'single-pilot',
-    'single-ply',
-    'single-strand',
     'single.step',
-    'singphos',
-    'sinistra',
-    'sinkers',
-    'sinter',
-    'sinterklaas',
-    'sinusoid',
-    'sirhowy',
-    'sirocco',
-    'sirrah',
-    'sirrell',
-    'sitnikov',
-    'six-bedroom',
-    'six-page',
-    'six-party',
-    'six-piece',
     'six-seater',
-    'sixteenths',
-    'sj-20',
-    'sjg',
-    'sk&aring;ne',
-    'sk280',
-    'skaardal',
-    'skail',
-    'skeffington',
-    'skepticism',
-    'sketchiest',
-    'sketchpad',
-    'skett',
-    'skidmore',
-    'skilasticity',
-    'skill-based',
     'skillbase',
-    'skilling',
-    'skimpole',
-    'skink',
-    'sklp',
-    'skolnick',
-    'skuse',
-    'skydiver',
-    'skydiving',
-    'slackens',
-    'slatternly',
-    'slave-trading',
-    'slavophiles',
-    'slcms',
-    'sleds',
-    'slighting',
     'slimbridge/gloucestershire',
-    'slimeball',
-    'slimes',
-    'slip-on',
-    'sliproad',
-    'slit-eyed',
-    'slm',
-    'slo-mo',
-    'sloes',
-    'slooten',
-    'slote',
-    'slothful',
-    'slump-hit',
-    'smaje',
-    'smallbone',
-    'smashed-up',
     'smellie',
-    'smew',
-    'smgl',
-    'smokestacks',
-    'smooching',
-    'snagov',
-    'snapdragons',
-    'snells',
-    'sneyd',
-    'snickering',
-    'sniffily',
-    'sniffled',
-    'sno',
-    'snobberies',
-    'snobbism',
-    'snogged',
     'snotty-nosed',
-    'snowe',
-    'snowmaking',
-    'snowmelt',
-    'snyman',
-    'soay',
-    'social-scientific',
-    'sociales',
-    'society\'',
-    'socio-psychological',
-    'sockless',
-    'soest',
-    'soft-drinks',
-    'softboard',
-    'software602',
-    'soh',
     'sokol',
-    'solanum',
-    'solomonic',
-    'solov\'ev',
-    'somite',
-    'sommes',
-    'somport',
-    'sonique',
-    'sonofabitch',
-    'sontochin',
-    'sophist',
-    'sophistications',
-    'sorbothane',
-    'sorcerous',
-    'soria',
-    'sota',
     'souchong',
-    'soufri&egrave;re',
-    'soul-mate',
-    'souleymane',
-    'soult',
-    'sound-proofing',
-    'sounding-board',
-    'soutar',
-    'south-bound',
-    'south-north',
-    'soutron',
-    'souville',
-    'sovbloc',
-    'soviet-designed',
-    'soybeans',
-    'spacesuits',
     'spangle',
-    'sparcservers',
-    'sparklingly',
-    'spatulas',
-    'speake',
-    'speakership',
-    'spec.',
-    'species-poor',
-    'spectrally',
-    'speechlessness',
-    'speechreaders',
-    'speleologist',
-    'spelman',
-    'spencerbeck',
-    'speu',
-    'spherulite',
     'sphinxes',
-    'spin-down',
-    'spinet',
-    'spivvy',
-    'splines',
-    'splintery',
-    'splittings',
-    'spn',
-    'spoked',
-    'spokeman',
-    'spoliation',
-    'sponger',
-    'spongers',
-    'spongia',
-    'sportif',
-    'sportive',
     'spot-kick',
-    'spreadsheeting',
-    'sprog',
-    'sq_kms',
-    'sqlwset',
-    'square-jawed',
-    'square-leg',
-    'square-wave',
-    'squareness',
-    'squeez-ee',
-    'srf',
-    'ssis',
-    'ssp1',
-    'ssrp',
-    'ssshh',
-    'staatsoper',
     'stabilimenta',
-    'stable-mate',
-    'stablemates',
-    'stackallan',
-    'stael',
-    'stage-coach',
-    'stagediving',
-    'stagehands',
-    'staller',
-    'stampa',
-    'stand-ins',
-    'stand-out',
-    'standardly',
-    'stant',
-    'stanyer',
-    'starforth',
     'stargazing',
-    'starvin\'',
-    'state-aided',
-    'statewide',
-    'stative',
-    'status-quo',
-    'statute-barred',
-    'staverton/gloucestershire',
-    'steadies',
-    'stebbing',
-    'steep-pitched',
-    'steffine',
-    'stein-am-rhein',
-    'steingr&iacute;mur',
-    'stephanotis',
-    'stereochemistry',
     'stereotypically',
-    'sterilisers',
-    'stetsons',
-    'stevedoring',
-    'steyr',
-    'stigler',
-    'stilgoe',
-    'stiller',
-    'stiltedly',
-    'stimulators',
-    'stinchcombe',
-    'stinkers',
-    'stipple',
-    'stocksbridge',
-    'stokers',
-    'stomatal',
     'stone-dead',
-    'stone-floored',
-    'stone-vaulted',
-    'stonors',
-    'stoplist',
-    'stopovers',
-    'storages',
-    'storer',
-    'stormo',
-    'stormseal',
-    'storrs',
-    'storting',
-    'story-boards',
-    'stothert',
-    'stotland',
-    'stout-hearted',
     'stow-on-the-wold',
-    'straight-jacket',
-    'straight-laced',
-    'strathcarron',
-    'strato-volcanoes',
-    'strattons',
-    'straus',
-    'strausfeld',
-    'straw-covered',
-    'streaker',
-    'street-fighting',
-    'streltsy',
-    'stren',
-    'streona',
-    'strick',
-    'stripling',
     'stromhall',
-    'stronge',
-    'strongyloides',
-    'stroyan',
-    'stuberl',
-    'studdert-kennedy',
-    'studi',
-    'studiedly',
-    'stumpings',
-    'sturges',
-    'sturmbannf&uuml;hrer',
-    'stutters',
-    'stylesheet',
-    'styli',
-    'stylometry',
-    'stymie',
     'suavity',
-    'sub-components',
-    'sub-lets',
-    'sub-menu',
-    'sub-millimetre',
-    'sub-orders',
-    'sub-patterns',
-    'sub-prioresses',
-    'sub-programs',
-    'sub-routines',
-    'sub-seneschals',
-    'sub-soil',
-    'sub-themes',
-    'sub-type',
-    'sub-word',
-    'subaqueous',
     'subcomponents',
-    'subfacets',
-    'subject-centred',
-    'sublanguage',
-    'subleases',
-    'submicroscopic',
-    'suborned',
-    'substitutional',
-    'subtracts',
-    'succoured',
-    'succulence',
-    'suckered',
-    'suckermouth',
-    'sudbrook',
-    'sudjic',
-    'sudocrem',
     'sudsy',
-    'suermondt-ludwig-museum',
-    'suffield',
-    'sufism',
-    'suhl',
-    'sukhoi',
-    'sulaimaniya',
-    'sulfhydryl',
-    'sulfur',
-    'sulis',
-    'sulphonamide',
-    'sulter',
-    'sumberg',
-    'sumisho',
-    'summa',
-    'summersgill',
     'summum',
-    'sumption',
-    'sun-bathing',
-    'sun-bleached',
-    'sun-bronzed',
-    'sunbox',
-    'sunshades',
-    'sup&eacute;rieur',
-    'sup&eacute;rieure',
-    'super-charged',
-    'super-duper',
-    'super-heavy',
-    'super-heavyweight',
-    'super-league',
-    'superba',
-    'superegos',
     'supergrasses',
-    'supergrid',
-    'superkey',
-    'supermassive',
-    'superordinates',
-    'supersense',
-    'superservers',
-    'superstyle',
-    'supervene',
-    'supervenes',
-    'supplementaries',
-    'supplications',
-    'supportiveness',
-    'suretyship',
-    'survivalist',
-    'suspenseful',
     'suspicious-looking',
-    'susquehanna',
-    'suzette',
-    'svats',
-    'svetlanov',
-    'sw4',
-    'sw5',
-    'swannery',
-    'swansborough',
-    'swarte',
-    'swashbuckler',
-    'sweet-sour',
-    'swiftlet',
-    'swiney',
-    'swinish',
-    'switched-off',
     'syconia',
-    'sydow',
-    'sylph-like',
-    'sylvestra',
-    'symkyn',
-    'sympathizes',
-    'sympathizing',
-    'symptomatically',
-    'synchronizing',
-    'synge',
-    'synne',
-    'sys&dollar;sysdevice',
-    'sysprv',
-    'system/88',
-    'systematizing',
-    'systempro/xl',
     'szechuan',
-    'szlachta',
-    't.4s',
-    't.brucei',
-    't.i.c',
-    't3pg4',
-    'ta-ra',
-    'tabbed',
-    'tabel',
-    'tabiano',
-    'table-lamp',
-    'tacp',
-    'tacticity',
-    'tactual',
-    'tadley',
-    'taek',
     'taf',
-    'taffe',
-    'tafs',
-    'taib',
-    'taifa',
-    'tail-wheel',
-    'taillefer',
-    'tailler',
-    'taitu',
-    'taka',
-    'takeo',
-    'taleb',
-    'talismanic',
-    'tallyman',
-    'tama',
-    'tamped',
     'tanenbaum',
-    'tangos',
-    'tanit',
-    'tanjung',
-    'tankmates',
-    'tanko',
-    'tansey',
-    'tanto',
-    'tantric',
-    'tape-measure',
-    'tapies',
-    'tardets',
-    'tari',
-    'tarkovsky',
-    'tarried',
-    'tarrytown',
     'tartars',
-    'tartrazine',
-    'tartt',
-    'tarvarians',
-    'tasking',
-    'tau-tau',
-    'tax-and-spend',
-    'taxmen',
-    'tba-reactive',
-    'tc-cultured',
-    'tdr',
-    'tea-cups',
-    'tea-ladies',
-    'tea-lady',
-    'tea-leaves',
-    'tea-towels',
     'tea/supper',
-    'teahouse',
-    'team-based',
-    'teambuilding',
-    'teape',
-    'tear-filled',
-    'techies',
-    'technik',
-    'technopolis',
-    'teesmouth',
-    'teesport',
-    'teessider',
-    'teh',
-    'telecasters',
-    'teledyne',
-    'tellurium',
     'telnet/oltp',
-    'telnitz',
-    'telogen',
-    'tempestuously',
-    'templemans',
-    'templetons',
-    'temporised',
-    'tempra',
-    'temptresses',
-    'ten-fifteen',
-    'ten-pin',
-    'ten-strong',
-    'tenpin',
-    'tense/aspect',
-    'tentorial',
-    'teredo',
     'terminable',
-    'ternan',
-    'terror-stricken',
-    'terrorizing',
-    'tertii',
-    'test-retest',
-    'testation',
-    'testpiece',
-    'testware',
-    'tetracyclines',
-    'tetrad',
-    'tetranucleotide',
-    'teuton',
-    'tex-mex',
-    'texturing',
-    'th&eacute&acirc;tre',
     'th&eacute;ovard',
-    'th\'do',
-    'thabo',
-    'thain',
-    'thallus',
-    'thatchergate',
-    'thay',
-    'thematizing',
-    'theme/rheme',
-    'theophilus',
-    'theraps',
-    'there\'',
-    'thermidor',
-    'thermocoagulation',
-    'thermoplastics',
-    'thermosetting',
     'thermosphere',
-    'thermostable',
-    'theropod',
-    'therr',
-    'thet',
-    'theyr',
-    'thiam',
-    'thibaut',
-    'thiol',
-    'thirt',
-    'thirty-third',
-    'thomsen',
-    'thorens',
-    'thornback',
-    'thorne-wallis',
-    'thornholme',
     'thrashes',
-    'thrashings',
-    'three-car',
-    'three-cd',
-    'three-fifty',
-    'three-lane',
-    'three-seater',
-    'three-stroke',
-    'three-under',
-    'three.phase',
-    'threequarter',
-    'threlkeld',
-    'thrice-weekly',
-    'thripp',
-    'thrombi',
-    'throughly',
     'throve',
-    'thru-neck',
-    'thrums',
-    'thruppenny',
-    'thunderclouds',
-    'thurman',
-    'thylacine',
-    'tibberton',
-    'ticker-tape',
-    'tiddington',
-    'tidemark',
-    'tied-up',
-    'tiepin',
-    'tiffin',
-    'tightly-packed',
-    'tiki',
     'time\'',
-    'time-cost',
-    'time-depth',
-    'time-frames',
-    'time-gap',
-    'time-period',
-    'time-tabling',
-    'time-to-market',
-    'time-travelling',
-    'timelessly',
-    'timesheet',
-    'timesheets',
-    'tims',
-    'tin-glazed',
-    'tin-plate',
-    'tin-pot',
     'tiner',
-    'tinley',
-    'tintin',
-    'tioman',
-    'tippees',
-    'titians',
-    'titograd',
-    'tk2',
-    'tlm',
-    'tn38',
-    'tnm',
-    'to-',
-    'tobacco-related',
-    'toddington/gloucestershire',
-    'toe-cap',
-    'togc',
     'tohmatsu',
-    'toiler',
-    'toke',
-    'tokelau',
-    'tomasz',
-    'tominah',
-    'too-small',
-    'tooker',
-    'toolkit/unix',
-    'toomebridge',
-    'toop',
-    'toothlessly',
-    'tootling',
-    'tootsie',
-    'top-hatted',
-    'top-rope',
     'top-roped',
-    'tope',
-    'topline',
-    'topographer',
-    'topol',
-    'toque',
-    'tori',
-    'torpedo-shaped',
-    'torpey',
-    'torte',
-    'tory-anglican',
-    'toshibas',
-    'toshio',
-    'tostig',
-    'tottie',
-    'tottle',
     'touch-and-go',
-    'touchings',
-    'toughens',
-    'tourmalet',
-    'toute',
-    'towcestrians',
-    'townie',
-    'townsends',
-    'townswoman',
-    'toxascaris',
-    'toyshops',
-    'trabzon',
-    'trachomatis',
-    'track-bed',
-    'tractor-mounted',
-    'trame',
     'tranced',
-    'tranquilisers',
-    'tranquilizers',
-    'trans-caspian',
-    'transborder',
-    'transcortical',
-    'transhipped',
-    'transhistorical',
-    'transmittance',
-    'transmutations',
-    'trapezium',
-    'trapezoid',
-    'trauffer',
-    'travaux',
-    'travel-weary',
-    'trecento',
     'tree-stump',
-    'trefnant',
-    'trench-coat',
-    'trenchev',
-    'trentino',
-    'treponemal',
-    'trestle-table',
-    'trevett',
-    'treweek',
-    'tri-r',
-    'tribals',
-    'tribeswoman',
-    'tricentennial',
-    'trichostrongyles',
-    'trichostrongylus',
-    'triers',
     'triffids',
-    'triflex',
-    'trigem',
-    'triggerfish',
-    'triglyphs',
-    'trigo',
-    'trigonometric',
-    'triiodothyronine',
-    'trimaran',
-    'trina',
-    'tripwires',
-    'trislanders',
-    'trisphosphate',
-    'triticum',
-    'tritonis',
-    'trituration',
     'triune',
-    'trnopolje',
-    'troopships',
-    'tropopause',
-    'troublous',
-    'trouser-press',
-    'trover',
-    'trovoada',
-    'trubin',
-    'truby',
-    'trucial',
-    'truely',
-    'truka',
-    'trulli',
-    'trumpetings',
-    'trustie',
     'truth-telling',
-    'tsarskoe',
-    'tselkov',
-    'tsering',
-    'tsf',
-    'tsrs',
-    'tuami',
-    'tube-like',
-    'tudge',
-    'tuf',
-    'tughlukabad',
-    'tullie',
-    'tullybelton',
-    'tullycarnet',
-    'tumour-suppressor',
-    'tumourigenesis',
     'tune-o-matic',
-    'tunica',
-    'tunnell',
-    'tunnicliffe',
-    'tuppenny',
-    'tupping',
-    'turbanned',
-    'turbary',
-    'turco',
-    'turkish-cypriot',
-    'turkman',
-    'turkomans',
-    'turn-about',
-    'turn-outs',
-    'turnstone',
-    'turves',
     'tusked',
-    'tussled',
-    'tutees',
-    'tva',
-    'tw8',
-    'twelvemonth',
-    'twent',
-    'twiddles',
-    'twin-engine',
-    'twink',
-    'twinkly',
-    'twisted-pair',
-    'two-by-two',
-    'two-cylinder',
-    'two-fisted',
-    'two-pipe',
     'two-pound',
-    'two-years',
-    'twombly',
-    'twort',
-    'twyfords',
-    'tyerman',
-    'tygavac',
-    'tynyanov',
-    'type-specific',
-    'typifying',
-    'tyvek',
-    'u/13',
-    'u/g',
-    'u937',
-    'uau',
-    'ubaldini',
     'ucan',
-    'ucf',
-    'uchida',
-    'udolpho',
-    'udps',
-    'uea',
-    'uemcc',
-    'ufaf',
-    'ufton',
-    'ug',
-    'uhl',
-    'uics',
-    'uk/i',
-    'ulcc',
-    'ullesthorpe',
-    'ultrasparc-i',
     'umol/l',
-    'un-imposed',
-    'un-uncle',
-    'unaccented',
-    'unadmitted',
-    'unaffectedly',
-    'unanalysable',
-    'unattributable',
-    'unbundle',
-    'uncached',
-    'uncaused',
-    'uncemented',
-    'uncertificated',
-    'unclasping',
-    'unclimbable',
-    'uncok',
     'unconformably',
-    'unconsummated',
-    'uncontrived',
-    'uncosted',
-    'undamped',
-    'undecidability',
-    'under-13',
-    'under-achievers',
-    'under-achieving',
-    'under-capitalised',
-    'under-consumption',
-    'under-employment',
-    'under-exploited',
-    'under-recording',
-    'under-represent',
-    'under-strength',
     'undercapitalised',
-    'underhanded',
-    'underlife',
-    'underperforming',
-    'underplaying',
-    'understudying',
-    'underwhelmed',
-    'undesignated',
-    'undeviating',
-    'undistracted',
-    'undreamt-of',
-    'undresses',
-    'undrinkable',
-    'undulates',
-    'unearths',
-    'unequipped',
     'unestablished',
-    'unethically',
-    'unexampled',
-    'unexpurgated',
-    'unficyp',
-    'unforgiveable',
-    'unfractionated',
-    'unfriendliness',
-    'unfulfilling',
-    'unfulfilment',
-    'unfurls',
-    'ungallant',
-    'ungaro',
-    'ungrammaticality',
-    'ungratefully',
-    'unimodal',
     'uninsulated',
-    'unintegrated',
-    'unintelligibly',
-    'uninterest',
-    'uniraptor',
-    'unironed',
-    'unit/module',
-    'universitas',
-    'unlinked',
-    'unmatchable',
-    'unmentionables',
-    'unpadded',
-    'unpriced',
-    'unprivileged',
-    'unprogressive',
-    'unrealisable',
     'unrealism',
-    'unreasoned',
-    'unrelievedly',
-    'unresectable',
-    'unrestricted-use',
-    'unrevised',
-    'unripened',
-    'unroadworthy',
-    'unsaddle',
-    'unsanctioned',
-    'unscarred',
-    'unserved',
-    'unsettles',
-    'unsimplified',
-    'unsparingly',
-    'unswervingly',
     'unteachable',
-    'untrimmed',
-    'unverifiable',
-    'unweathered',
-    'upbraiding',
-    'upc',
-    'upend',
-    'upgoing',
-    'upham',
-    'uphaul',
-    'upleatham',
-    'upper-case',
-    'upper-level',
-    'uptempo',
-    'uptime',
-    'upwardly-mobile',
     'urenco',
-    'urim',
-    'urography',
-    'us&dollar;1,400',
-    'us&dollar;1.00=253.8418',
-    'us&dollar;10',
-    'us&dollar;110',
-    'us&dollar;12,000,000',
-    'us&dollar;14,000,000',
-    'us&dollar;140,000,000',
-    'us&dollar;15',
-    'us&dollar;180,000,000',
-    'us&dollar;24,000',
-    'us&dollar;3',
-    'us&dollar;35,000,000',
-    'us&dollar;4,200',
     'us&dollar;60,000',
-    'us&dollar;9,000',
-    'us-trained',
-    'us-wide',
-    'us/uk',
-    'usb',
-    'usda',
-    'user-oriented',
-    'usfp',
-    'usurers',
-    'utica',
-    'uv-vis',
-    'uxorious',
-    'v-shape',
-    'v.i',
-    'v/cm',
     'v11',
-    'vadgama',
-    'vadinamians',
-    'vaginas',
-    'value-add',
-    'value-based',
-    'valverde',
-    'vambac',
-    'vampire-like',
-    'vampiric',
-    'vandalizing',
-    'vandyke',
-    'vant',
-    'varga',
-    'variable-rate',
-    'variate',
     'varsov',
-    'vascularity',
-    'vasoconstrictive',
-    'vat-inclusive',
-    'vc7000',
-    'veale',
-    'vectorial',
-    'veen',
-    'vel',
-    'velvet-covered',
-    'venereum',
-    'venetiaan',
-    'vengeance-magic',
-    'vengerov',
-    'venizelos',
-    'venstre',
     'ventrally',
-    'verbalisation',
-    'verboten',
-    'verdian',
-    'verebalavu',
-    'vermeille',
-    'vernes',
-    'versioned',
-    'versts',
-    'vertu',
-    'vester',
-    'vh',
-    'vi&scaron;egrad',
-    'vibraphone',
-    'vibratory',
-    'vice-',
     'vice-chief',
-    'vicinities',
-    'vicious-looking',
-    'vicomtes',
-    'vics',
-    'vida',
-    'videotex',
-    'videotext',
-    'vierck',
-    'vigeois',
-    'vigourous',
-    'viii-related',
-    'villars',
-    'villein',
-    'villepreux',
-    'villereal',
     'vinca',
-    'vincenti',
-    'vindaloo',
-    'vindicationem',
-    'viner',
-    'vinkovci',
-    'vinoba',
-    'vinod',
-    'vinton',
-    'virendra',
-    'virgates',
-    'virgin\'',
-    'virus-like',
-    'vitalism',
-    'vitebsk',
-    'vitoria',
     'vivarium',
-    'viverrids',
-    'vivonex',
-    'vivre',
-    'vizetelly',
-    'vocalising',
-    'vocalizations',
-    'voci',
-    'vodaphone',
-    'vogler',
-    'voicetype',
-    'vol-au-vent',
-    'vol/vol',
-    'volendam',
-    'volksoper',
-    'volney',
     'volodymyr',
-    'vongkhamsao',
-    'vowles',
-    'voz',
-    'voznesensky',
-    'vp6',
-    'vr4200',
-    'vredeling',
-    'vreeland',
-    'vt220',
-    'vuggy',
-    'vver',
-    'w&divide;d',
-    'w&uuml;rstchen',
-    'w.l.',
-    'w/t',
     'w1048',
-    'w14',
-    'w1r',
-    'w_',
-    'wachagga',
-    'wadkin',
-    'waffen-ss',
-    'wahhab',
-    'wahler',
-    'wakehurst',
-    'wakens',
-    'walbrook',
-    'waldner',
-    'walk-up',
-    'walkerburn',
-    'walkie-talkies',
     'wall-sized',
-    'wallcharts',
-    'walldorf',
-    'wallingford/oxfordshire',
-    'wallmounted',
-    'wallraf-richartz',
-    'war-making',
-    'wardening',
-    'warehoused',
-    'waris',
-    'warman',
-    'warmed-up',
-    'warranto',
-    'wash-stand',
-    'washhouse',
-    'washwood',
     'wassailing',
-    'waste-bin',
-    'wastwater',
-    'watanjar',
-    'water-course',
-    'water-repellent',
-    'water-treatment',
-    'watercare',
-    'watercolourist',
-    'waterville',
-    'wathen',
-    'watson-crick',
-    'watten',
-    'waveguide',
-    'wavenumbers',
-    'wavetracer',
     'waynflete',
-    'wdg',
-    'weak-form',
-    'wealdstone',
-    'weaverham',
-    'webby',
-    'weber-fechner',
-    'wedding-cake',
-    'weediness',
-    'weekblad',
-    'weeley',
-    'wehner',
-    'weighings',
-    'weis-fogh',
-    'weisstein',
-    'weisweiler',
     'weizsaecker',
-    'welf',
-    'welfarists',
-    'well-adapted',
-    'well-beaten',
-    'well-brought-up',
-    'well-defended',
-    'well-directed',
-    'well-hidden',
-    'well-nourished',
-    'well-padded',
-    'well-pleased',
-    'well-pressed',
-    'well-reasoned',
-    'well-served',
-    'well-struck',
     'well-wooded',
-    'wellknown',
-    'wenford',
-    'wensum',
-    'weser',
-    'west-east',
-    'west-meads',
-    'westdeutsche',
-    'westerby',
-    'westermarck',
-    'westin',
-    'westleton',
-    'westmead',
-    'westpac',
-    'westwater',
-    'wetherden',
     'wetton',
-    'wh-what',
-    'whalen',
-    'whan',
-    'wharton-tigar',
-    'wheare',
-    'wheatland',
-    'wheels-and-brakes',
-    'whelping',
-    'wheth',
-    'whibley',
-    'whidden',
-    'whiners',
-    'whinger',
-    'whiskeys',
-    'white-jacketed',
     'white-sided',
-    'whitelegge',
-    'whitsey',
-    'whittingstall',
-    'whittlesey',
-    'whoof',
-    'whooo',
-    'whoredom',
-    'whornes',
-    'wic',
-    'widdrington',
-    'wiegand',
-    'wigtownshire',
-    'wijetunge',
-    'wijsm&uuml;ller',
-    'wild-card',
     'wild-looking',
-    'will-o\'-the-wisp',
-    'williams-jones',
-    'willies-williams',
-    'willink',
-    'wilson-barnett',
-    'wiltshire-based',
-    'windowbox',
-    'windowworks',
-    'wine-maker',
-    'winkfield',
-    'winkworth',
-    'winnie-the-pooh',
-    'winservers',
-    'winsomely',
-    'winster',
     'winterslow',
-    'wipe-clean',
-    'wire-cutters',
-    'wise-cracking',
-    'wish-fulfilments',
-    'wishers',
-    'wisht',
-    'wisk',
-    'wistow',
-    'witchery',
-    'with-profit',
-    'within-subjects',
-    'wmo',
-    'wno',
-    'wohl',
-    'wolf-man',
     'wolk',
-    'womenswear',
-    'womon',
-    'wonderfulness',
-    'wonka',
-    'wood-pasture',
-    'woodchuck',
-    'woodhayne',
-    'woolmark',
-    'woolmington',
-    'woolsack',
-    'woops',
-    'word-pairs',
-    'wordlists',
-    'work\'',
-    'work-stations',
     'workability',
-    'workes',
-    'workplace-assessed',
-    'world-views',
-    'world-weariness',
-    'worm-eaten',
-    'worth-while',
-    'worty',
-    'wouldnae',
-    'wpget',
-    'wraith-like',
-    'wrapped-up',
-    'wreath-laying',
-    'wricklemarsh',
-    'wringe',
-    'wrings',
     'wristwatches',
-    'writer-director',
-    'wroe',
-    'wyakin',
-    'wylfa',
-    'wyspianski',
-    'x%',
-    'x-windows-based',
-    'x11.5',
-    'xa5',
-    'xc1',
-    'xe3',
-    'xe7',
-    'xenly',
-    'xerotica',
-    'xh6',
     'xiphophorus',
-    'xis',
-    'xp',
-    'xprinter',
-    'xview',
-    'xvision',
-    'xxxiii',
-    'xxxv',
-    'xxxvi',
-    'y\'pripio',
-    'y\'self',
-    'y-',
-    'yakov',
-    'yanagitani',
-    'yapped',
-    'yardies',
     'yasuda',
-    'yau',
-    'yc6',
-    'year-and-a-half',
-    'yellow-red',
-    'yellow-white',
-    'yellower',
-    'yeomans',
-    'yerkes',
-    'yerkes-dodson',
-    'yerselves',
-    'yeshiva',
-    'yester',
-    'yesterday.',
-    'yevdoxia',
-    'yevele',
     'yevgeni',
-    'yevtushenko',
-    'yilin',
-    'yiu',
-    'ylva',
-    'yoakam',
-    'yodel',
-    'yoghourt',
-    'yogyakarta',
-    'yolland',
-    'yops',
-    'you&mdash',
-    'you\'se',
-    'you-know-what',
-    'youthful-looking',
-    'yowl',
     'yoxall',
-    'yp',
-    'yuga',
-    'yuko',
-    'z&eacute;lia',
-    'z-mail',
-    'zabaglione',
-    'zachariah',
-    'zainuddin',
-    'zambesi',
-    'zana',
-    'zegna',
-    'zeisl',
-    'zeki',
-    'zelma',
-    'zemstva',
     'zenga',
-    'zenon',
-    'zero-base',
-    'zeroes',
-    'zestful',
-    'zeugmatic',
-    'zeyneddin',
-    'zeyrek',
-    'zgqn',
-    'zhe',
-    'zlatko',
-    'zomax',
-    'zombi',
-    'zonally',
-    'zoogeographical',
-    'zoonoses',
     'zoophilus',
-    'zorba',
-    'zorkin',
-    'zorn',
-    'zozimus',
-    'zxs',
+)
+
+blocks_19 = (
+    '\'\'theling!(mdash;an(!t!+zcaron;upan #\'83!"a\'!"ee!!l!#not!$orse #-to \'0-4-0st!$.2mm"(8-micron )1.5-litre',
+    '"#0mw#!s",am&ndash;5pm!$140s"#60s!&2-bore"%8-bit!%3-day#%point"#00s"#amp!$5-cm"#00s!\'6-track#&valver',
+    '!&8-hour"(0-degree!,918&ndash;19"!s +2&ndash;6pm!#-dg"$hour"$tone!#.9p!%0-day")0&ndash;1#\'-member""in!\'1-month!(2-member',
+    '!*4&ndash;28)!5"$-pin!)5&ndash;6"%-acre"(6-colour""km!&8-year!*9&ndash;31 *3&ndash;12!#.2p"$4-kb"\'5-litre!&2-year!"kg',
+    '!#8in %5\'-gc"!j!2-hydroxytryptamine!"1p $6.5p!&0-mile %7-bit"#day!&0-plus""mm &8-cell &9-volt!&00-mwe )a&ndash;c',
+    '!"46!)_a_little!$aagh"*chen-based!$baft"$baye"(ercromby"#ies#$nger#$otic"%lated"#ner",ortifacients"\'ridging"#uzz',
+    '$%nting#*ident-free$%piter#)ordionist$%utred#$rete$#oss"&etates"&hillea""ls"#set"#tif"!u!&d-libs"$amou',
+    '"!h#%ikari"#lam#"on"&ornian"(rianople"%shead"-venture-story#*ice-giving"!y!$ebbe"$ngus"(rotowing"(schylean!"fe',
+    '##ine$$xing#$rays"#ord"/rican-americans#)opithecus"$shan""ta#&er-sun!(gbenugba"%e-set""ii#!p"%onise"6reement&mdash;appendix',
+    '"%uisel!%hmadu"#waz!#inu")r-defence#-craft-carrier#&getlam#\'knocker#\'lifting""sa!#jit"!k!%kasha%"ic"\'hmatova',
+    '##tas"$royd!(l-rahman#%sabah#&tuffah"#avi"#bee$+rtusstrasse%!y#"on#$rink"*cal&aacute#"oa$!r"(eksandar',
+    '#$ssio#"xa"#gox"\'kalosis#&meonid"\'l-glass$%stars##day#$egri#\'osaurus#(rounders#"um"%meria#&oravid)!s',
+    '"+phanumerics"\'ter-ego%"am%!n&\'anthera"%umasc!#man#%retti#(tiveness#!x"$bers#%ridge#&ushers"$dega"%erced',
+    '##eux##gos"\'ortized"*phitheater"$roth!)nabaptist#\'stasius#%toliy"*esthetised"&gkatan##lam$"o-&\'persian",heuser-busch"\'nabella',
+    '#(ihilates$"ka"\'schuetz#"el$"tt"\'tedated$!r#)i-chinese%*federalist%(humanism%+imperialism%\'liberal%$male\'%rxist&(odernist',
+    '%$riot%)structure%)terrorism&%umour%\'wrinkle$"co$\'smoking#%lered"$yday"$zacs!#pap"&paling#&letise#(urtenant!(quaclear',
+    '!&rbanne#"on$%rtech")chduchess"$dair#\'rishaig""ef"&guedas$#lus#!y$#ris"%kells#"ie##ley"*m&eacute;e',
+    '$$rest#$adas$$lite#"el#)s-control"#nim"\'restant##ian#\'ow-head%#ing""sa#$hile"*tilleryman#$week"(z&uacute',
+    '"%caris"$hbee#&church#%ridge",ian-american"\'ociados"$pden$"in#(ergillus"\'senting""ti#"le#&roturf"\'ymptote!\'tchison',
+    '"%haulf"!o#%mique"\'rebates$"us"%talus#\'unement#%woods!&u-pair"\'diology$+tor-general""ew""lt"&relian$"um',
+    '$#ral"%slese",tobiographer$$m-ix%#art")xetophone#\'illiary!$vaii"#iva"%raham$%nches!"wp!&ykroyd"&scough!%zeris',
+    '!!9!#aan"%benco#!i"*cchanalian#(k-combed)#ing%$drop%#log$%fires$$ster"#dal##ham"\'ftagate"#gel',
+    '#$nhof"(inbrigge".lance-of-power#$doni#+l-doctoring$$ades$#ina$%ymore#$thus"%menda"(nd-wagon$!e$$ying#(krupting#$ting',
+    '##ded$#ing#(e-headed$&headed#%gain\'%"te#"ky#\'nicoats#+rel-vaulted&#age&$ling%!r%!s$$head$\'ichello',
+    '$#sch#$zach"&secamp#)ket-weave#&ophils#%tides#\'utoland"&tching#%h-tub#)m&ouml;nh##tre"&varois""wd""xi"(yerische',
+    '!(eachwear#"te$"ha#\'umanoir$&tified"&chamel#&ontree"\'dtimers"$eley#*r-swilling$%sheba##tch$#ham$$ling"%hoved',
+    '#$shon"(kenstein"%llboy$&yaches(#ing#$shaw"\'nbulbin#\'ch-mark%"ed#&dixson#%edick&"kt$$nson#%fleet#$ioff',
+    '""qb"%rates##end#\'gstrand#$mant#&noulli#%ryman#%trams##una"#ssy#(t-placed$%erman$$wood"\'thought#,ter-informed',
+    '##wen"#vir#"vy"$wise"&xfield!"ga"#lii!&harata!%iagio"#den"#ffo"&g-band"(lborough#$evel#)linghurst',
+    '"%o-day#!t"&raderi#\'kenshaw$$with#(twhistle"$shko!,lack-clawson&&letter&\'painted%(berrying%#ler%#rag#!g#\'nquette',
+    '#$tter#"ue$!g##ven#!y"$eath#%nnies"!i"#ohm#%odaxe"#uck##rbs!)oard-room"\'dy-heat%\'servant',
+    '$(builders$(stocking"#gue"$heme"%ileau"+lo&ntilde;a##shy"&mbykol##mai"%nbons#\'e-china$#lli#$itus"$obed#(kbinders',
+    '$&makers"$rate##ker#$scht"$sman##tan")ttle-neck$)om-placed"\'ucherie%#ier$&icault#$erat$!s#"in#\'rbollon',
+    '$&geoise%&uignon")wdlerised"%ymans!"pc!%rabin#%emore#$mmer#%nagan#$thay#$ydon"&eacker$\'dalbane$&k-neck$*st-beating',
+    '##che$!k#!e$+ding-ground#%nnand$$zone#$slau"\'idgeton#%ggate#&msdown#%ndles$$tons#\'stolian#"te$)ish-style',
+    '%#rak##zan"$nesc"\'oadleaf#%iling#!n$%stein#(odthaers$)keborough$%m\'ead#+ther-sister#"un#\'wn-eyed%$rigg"#rrr',
+    '#\'dermann#%mmies#%nnson#!s#(talizing#$vver!"so"!u!\'uchwald#)k-passing$$eted")dgerigars##yko"$enas"%ganda',
+    '"&ildnet"#jok"$lent#"ks##man#(tfontein"%mming"#ndu#%fight#"gs#"te"#ona"$quet"\'rakumin#%bidge',
+    '#$pham$!s#\'tenshaw$&onwood"+siness-card($week"$tare#$enko##man#)termarket"\'zz-word!#wca!%yland"%tches -c&eacute;cile',
+    '!%-band"$isam!"13!,abinetmaking#)le-laying%&vision"$dman"$ging"$kici"\'labrese$$ndra#%deron$"on#%ixtus#-orie-counting',
+    '#!o#&peador$$inas$$ling"$n-am#*dleholders&!r$$over##nan$)on-fodder#&tabile&$rian$#ley""pa#$elli',
+    '#%stick#%tain\'#%ybara",rbon-dioxide#"di$"ow#$ello$!n#$itas#\'jacking#%ltona$$ucci#$nach$"ey$"ot',
+    '$#zza#"pi#&ry-out#&t-shed$\'imandua#%yatid"$sbah#$cais#$ella$%notes#\'h-based%$crop"&t-pla2#\'afalque$)strophism',
+    '#)uvellauni"\'ulfeild".vaill&egrave;s"&warden#$kell"$yuse!#cbe""lo!"dd"%u-fdp!\'ecropia"-iling-mounted"%ladon#(l-matrix%$wall',
+    '$)utherapie"$nnen#\'omanian#&taurea$,rally-heated%"is"$palc#!s"&ramide#"ts!#fvs!\'haconne#$dwin##fer#\'in-mail',
+    '#"ma$$bord$&omilla#"na$%dlery%"ni$%telle#,rge-transfer$%leton$$nley#&sseurs#$tila""cs"(eapskate%!y',
+    '#%ckley%#ups#\'ek-bone$%seman#&lating#%mises$$nitz#$quer#)sney-lind$)s-playing%"ie$&terman"+iddingstone#+ef-corporal#!k',
+    '#+mney-breast#&nchero$$nery#%oggia##ros$#rup#%tchat"%loral&$mine"#oco#+lelithiasis""ri$*stianising\'"en#$omis',
+    '#\'ysalids%"om&$stom""s."#ugs#&ngking#$rchy$"ls#"se!(icognara"$ders"$mage##ino"%nched$&inatti',
+    '#(quecento"(rcuiting%*mnavigated-#ing&%vents#$sium""ta#"ic"#vet""wf!\'laddagh$$onia#"il#\'mp-down#$nchy',
+    '$$sman$#vow#)rricoates$&y-sage#0ss-consciousness&\'related%%ement%*room-based#&verton##xby#\'ythorpe"$eare#"er#"ry#,veland-based',
+    '#1ch&eacute;-ridden$$kity#)ff-hanger#&mbline##nts#$part"\'ockface#(sed-shop%#rie#$ward"\'usterer!#mlr!*o-designed#&funded#\'housing',
+    '#(resident#+transfected"&al-tar#(thangers"$ccyx#*k-fighting$$crow#&oliche"\'d-liver#"er"%erces""ff$\'ee-shop"#gsa"&hasset',
+    '"&legate##ina%$etta$$tics#)lectibles$#omb$%uvium#!o$#mbe$*nial-style$$roll$)ur-coding\'(sergeant\'$word#\'umbanus',
+    '#%anche#\'mentate$%ision$"un&$iste#)pact-disc%$nhia&\'y-owned$&licite$\'ositing$*ressed-air(1ion-decompression$/troller-general#$tean#+unicaciones',
+    '##dry#\'formant#"ix#$nick#.servative-held$$gold$%orted&#zio$%pires$!t%,itutionalist$\'ultatif#)tent-free$#ura#*veyor-belt',
+    '"%peman#!p$!s##ula")ral-stone#,ba-compliant#\'dwainer#%n-fed$#cob$%eille%#liu%\'r-stone#%ollas#$rals$$iere',
+    '#$ylus"$shed#\'mic-ray#\'t-based%$plus$"co$$mary$%umier"(unt-down%#ach%*er-current(,urbanization\'(balances#$rson$/t&mdash;country',
+    '$*ntry-based"%wgirl""xa!#pav!+raftsperson#&ighall##ton"#ean#\'denhill#$geen##mer#%sting"&ibbage%"ed##mps',
+    '#%sping$&scross$#tal")ocodilian#&isette#%ndall#\'sfields$)s-appeals&-contamination(#urt&%modal&*questioned.#ing&&system&+undertaking',
+    '%%patch%$town#$wner$!t#%xford"%umley$(wallises#$zado%!n"!x"*yptography!"sj!(uckfield"$esta"%lmore',
+    '#&ulated"%racao##iel##ral"$sped#.tomer-oriented"$t-up#&lasses!)ycletrack"\'steines!&zarina$\'toryski 3d&eacute;partements!\'\'etudes"(histoire',
+    '"!g!#.w.!"18!&adaist#!d"(emonette"%gomys"&i-ichi#%mlers"$llul#%mahoy"#man#%natio"#nae##bys',
+    '%#urs"$rent&!h#"in#\'k-faced$#man##lan#%tmeet##yll"$ssia")ta-driven$%prism"%vidow#"ro"(y-length',
+    '!#c-8!"db!)e-horning#&seeded"\'ad-ball$$beat#!e#(l-making#(th-watch\'#ish"#bay#"bi##ray$!e#,tor-creditor',
+    '$(pitating$#tur#)entralist""do"\'fendent""ga"%haene"&ictics#&nstall"\'laforce$%mothe$"ny#&ebarre$$gacy#&imiter',
+    '$%sting#"l\'#&oittes"(mocratie)#que$(tivating"%nture")oxyribose"-personalising#\'ilatory#\'olarize)#ing%(iticised#!p#&raving',
+    '""ri$"ck$#des#%oburt#\'showitz"#sam#\'mosomes#\'olately#$pina#&tefani#!y"%uchar#"t.".velopmentalist##itt',
+    '!&harram"#obi"!s!&iabaig#&chrony#+gnosticians#"ka$"on#%ltext"-chloromethane##key"#ddy#\'geridoo#!s"&e-cast',
+    '##dre#(go-based#+sel-engined#&tetics$!z"(ffracted$(usionism"$ggle#%itise$&vision#\'nifying$"um#"ue"!i"!k',
+    '"$lkes#$lied"#mac#(inutives#!s"&n-dins#(osaurian"\'oecious#%nisio#$ptre")phosphate$\'theriae&*ongization#\'lexcito$(omatists',
+    '"#ria$%gisme#\'t-track""s-#)accharide$,fforestation$%llows$*ppointedly$\'rranged$\'ssemble#)confirmed%-th&egrave;que2!s%)uragingly#+embowelling',
+    '#&hforth#)lodgement#\'mantles#(ordering#\'persant$\'layable$%osers&\'sessing#*quisitions#)seminates$%uades#,tastefulness#(yllables"%thers#"ka',
+    '%\'ticulum#$idal%(ing-line#)orce-rate!$jibo!"la!%m2.56%!7$"78$"93"#300""ae!$nepr!\'obinson"&cilely',
+    '#%omomo#\'uments."%ffing"%gfood#"go#"on"%ilies#"na"$ktor"%llery##man$#ens#)phinholme#!t#(wyddelan',
+    ')"te\'$ques"$nata#$iert$+ol-valcroze#\'nybrook#$ohue"\'odlings##lan#\'rhandle$$jamb"*paminergic"$rend$$stad#!k',
+    '$!s#&nbusch",se-dependent##han#&imetry$#tej#$sing"\'theboys#&tridge"&uanier#)ble-bogey\'%faced\'\'jointed\'(positive\'%speak',
+    '&!r#\'galston#,nreay-thurso#"ro#$shan"0ver&ndash;calais"#wds#)n-trodden&%urned$%hills$(loadable$&shurst"$yens##ler!"r4',
+    '##gan#.matis_personae\'#zes#(wbridges$\'ingroom$$n-up$&stitch"!c"%eaper#*ssing-case"#ife#%nkin\'#\'velling"$oege#$goul',
+    '#$uhin#%veway(!s"*ug-testing$$gies&#sts#&mgoole$$lins"!w!#som!#tpa!#u\'r"&alists$#led#!n',
+    '#"os"$cale#$kham$$pond"&dfield")esenberry"%ffryn"#kas"$lcet#%lards""me##mah"%nkery$#ing##lap',
+    '#)staffnage##ums$"re"#pin%!g#\'licator#$plin"#que"#rao#&oselle"#sak#%tbowl%%uster$\'erandus$#ier',
+    '"!y!"vt!,wellinghouse!#yfi"$lans""mo$"nd"#ncm#"es (e-marker!#.b."$r.m.""s.$"b.""v.',
+    '!(achother"(dbangerz""eg"#gan#"gf"$kins"$lham""rd#+ly-eighties\'&vening#%marks#"nt#)th-mother"%seful#%terby',
+    '$%leech$#ons""ux$\'-bonnes!(bberston#"ie"$enat"!s"\'ussu\'ud!$c-us""1r#!v""88"$cd-2#)lesiology',
+    '##tis"&dysial"\'o-audit#"r1""ru!$ddis##oes#!r"\'elweiss#\'nbridge"%geley$$rton"(winstowe!&ee-eee"&l-like',
+    '"+florescence#)usiveness!"g2""er""or#$tist!%hiogu""ud!+ichelberger"(genstate#\'ht-fold&%sided%%ieths"#lat")nsteinian',
+    '!%jects!-kino-door-oos"!o"(tachrome!)l-abidine"(astomers"(dercombe%#ton""ea#2ctrical/electronic()it&eacute*!e&+o-hydraulic\'*convulsive\'+luminescent',
+    '\')technical#!k#%onora#+ven-fifteen"#ham"(isabetta"%lesse##iel$$pted#$rich"#met##ham#%stone"$phin"&server',
+    '"#vet"#wes!"ma#)ncipating)#ors#)sculation"*beddedness%!s#$olus#\'rasures$)yologists""cf",inence_grise""ms"\'otivism',
+    '&%ment.#%tiest#$yema"$slie!)namelling"%cases#.ephalomyelitis#$rust")d-results$$uses$&weight#%icott#&orphin#$proc#%ymion',
+    '#(rgy-rich"$fant"#gin#\'landers$#und"#lai"$nius"(ormities"&raging#\'ollment",terobacteria&\'hepatic#-halpy/entropy$#ral#\'ourages',
+    '"(umerable\'#tor#\'nciates#"re"&viably$$sion!(ormenred!&pernay"&hesian#!s"%icene#\'dermoid$\'iascope#&graphy#$lady',
+    '$(odically$&ternum"%oetin"*stein-barr"%worth!,quilibrating$%noxes!&rcoupe"&ectors"(iophorum"&l-king")menegildo#"in"!n"(oticised',
+    '#(or-prone"&yngium#)thematous!#sal"\'calante#$heat\'"or#%orial")kdalemuir"!m"!n##(m)"&pagnol$#nol#%inoza',
+    '"%teban!#tak#"ng"&hanoic#\'elburga$&really#%ridge"$nias"%orofu"%pison"&roplus"#ude!(uainetos"%femia"&onymus',
+    '$$tech%$rack#&ymedon"&stache!+vangelizing#%risto"+en-handedly%%money$#den$(t-driven#+r-deepening&*iminishing%%ready$#don"*identially',
+    '"#ren"!s!$wyas!,x-chancellor$)ouncillor#\'harvard#%leeds$%ondon#&miners%&stress$!p#(officers#\'patient$\'risoner$$upil',
+    '#&minees"\'cisable#(lamatory#,ommunicating#&usably"(ecutants&,ive-assembly&#rix##dra#%getes#%mplum#!s"%hales$\'ustedly##ume',
+    '&!t#&stance"#pat%%iated#*ectational$\'riencer#%lants$(ications$\'orative#"os#(ressways"&tensor#"on#\'ra-long%%ctors',
+    '%.territoriality$"ee%&madura&#est$#ude%$sive"$ults!(ye-liner$)movements$%patch#&pieces")ton-jones"&uphuro $f(n)!&*****g',
+    '!$-15s""pn!#.g.""l.!$/sgt!%2,000!#8a+!$aade""bs"*ce-centred%"on#\'tuality"$enza"*inthearted#,r-mindedness',
+    '$$play$\'y-story"\'lkowski#%l-guy$\'ing-out#)se-colour##udi"%ncher$$ourt#%nichs"%rafra$!j##eed#"id#$jeon',
+    '#(m-worker$%hands$$work#&ncombe$#don#$rant##son#%waggi"-shionableness#%kally"&thomed#$ties"%uchon#&lhaber$$knor',
+    '$&rolles#"re"%wbush"!z#!e!$c(n)"!j""si!#drs!(earfrost#)ther-like\'$ston"%dback#!s"\'e-based',
+    '##ler#!r#&s-only"%ilden%#ing"$lcey##ici#.low-travelling"\'minized")nari-oglu##cer#$ians#&oderee#&ugreek"%offee',
+    '$"or#%ndale$$hart##ran$"er%#tti$)oelectric"(tishised("ts##lar#&tucine"*uchtwanger!"fa""or"#r10',
+    '"#ber"!d#(uciaries"\'feshire#)teen-mile\'!s$"h-$\'y-first"&g-leaf#+hter-bomber""ki")le-server$*.extension#&leting$"is',
+    '&$ness"2nancial-management\'#ere%"ze#$din\'#\'e-tooth*"ed$$view#(ger-like#$ings#+landisation#&singer")rebombing%$reak$$damp',
+    '$$step#&m-name$"an#\'stlight""sc#\'h-hooks$$base$&ergate&#ton$$nets$$tail")t-looking#(ting-out#&zhughs")ve-barred',
+    '%&second%%timer)!s"(xed-head!(lagpoles$%ships##key$%iness#&p-like#&re-ups#(t-heeled%&lidded$#ley$$test#(vourless',
+    '#$ying"&emyngs#$shes#"te""ie#&p-side#,rtatiousness"\'ockhart#(od-banks%$gate%&waters##psy#%rakis$"is%#zel',
+    '#*w-of-funds$&er-bed*%ecked\'$like\'%power$%metry"!p"$uffs##mes#"on$%resce%$osis%$spar#*vioglacial"&y-away',
+    '%&y-wire$\'fishing$#ins#%/past#"mo#$post#&wheels!#mes"#ffv!#ncd""um!*oam-filled"%bbing"#cke"$gden',
+    '""l.#$iate#\'k-songs$"es$$song$!y"\'ndiaria#+tanellatesi",od-producing$"ie#&t-rest$$beds$%rests$(switches$%wells',
+    '#$ages$!s##bus##der$!y#&ecabin%&losing##gen##ms.$\'ulators#"no#$rard#%swear#+t-de-france$\'h-clyde',
+    '$%unato"%skett#$sitt#*ter-parent%!x"#ule#+ntainbridge($head#&r-eyed%%round%&strand%&weekly%&yearly$#ish$%penny',
+    '"%wling"&xfield#$hill!+r&oacute;da".actional-order#"in#&matome$&e-work#*nce-albert\'%lynch%&istown%)o-russian\'(scottish(%oviet$"ka',
+    '&!r&"st%$lins$%sisco$(z-joseph#)ternising#%yling"#ed6#*e-and-easy%(electron%$ride)"rs%(spirited$\'loading$(thinkers',
+    '#,im&uuml;ller$#ras#)nch-based\'$made#"rs#$sden"&iaries##cke#)edersdorf$!r#%ndall#%sians#\'thuwald"+og-magician$%marsh',
+    '#(nt-drive%$ally#(st-hardy#%ttole"#uin$(t-eating&\'growing%&market##tti!#ssl!#uar""ka"%lcher#&l-moon%$step',
+    '$(y-formed#$well"\'nboards#%dacio$)ectomised$!i$!y##ghi#\'kadelic#*nel-shaped"$rman#%nival#$rier#"us"%sebox',
+    '"$ther!$yvie \'g&amp;s".eacute;ricault"-imacr;t&amacr!"-1"$bebp"!h"/protein-coupled!#.j."!o!!/!"14!(abardine#$icce',
+    '#&rielli"#cha"$ddis")gn&eacute""im#$n/no$&saying##ter"*lactosides$#tea#$eria#%imany#$lian%%bayas%&maufry',
+    '$(o-romans$$witz"%mbino#(e-keeper%$plan$$bird##lin#"my#$ston""na#\'glionic",r&ccedil;ons#$dini#%grave#$otte',
+    '&!s#$wood"(s-liquid&!t$\'powered$%stove#&gcoine##par#*troparesis"*te-keepers%&towers$\'keeping##ien#"ow"#ube',
+    '#\'ntleted"#wld"$yton"&zpacho#%zetta!#cmg!"ds!$edda"$eson"#han"%ingob"*l-purified#!a#!d#\'sthorpe',
+    '#!m"*nder-based#$icom$%talis##nes"(ocentric#+demographic#%logic#&phagus""ra$"is#&icault#*man-jewish&$ised#+ontological',
+    '"(wandhaus#$gaws!!f!&gfbpp1!+iandomenico$&tesses#(rdiniera\'!o"%bbens"$chin"#don"#gas##bag"&lhooly##ler',
+    '$#iat#(t-bronze"#nza"#oia""ra#+l-next-door#$onde&#ins##tin""ss$!a""vi"$zmos!&ladder#\'morized',
+    '#\'ss-like&*reinforced%\'drumman%#ily##uca"&eaners##bov#\'nalmond$(morangie$%shane$#ure$$wood"\'iniecki#\'ssandos"+obetrotters',
+    '#%ssier"&ycines!+oal-seeking$%bound$%wards"(d-damned#&parent#&schalk#\'winians"#ghs"#iko#%ng-up"!l#&d-fish$$bach',
+    '$&mining#\'f-clubs$$ball#$spie"#mba"*nadotropin"&odacre$$head$&nights#!k#\'se-like"&rdimer##ell#!n"\'schenen',
+    '"!v#4ernment-commissioned+(inspired##ier"!y#"en#%igama#!t"#zzi!(racieuse#"di#%ffham$#pad#\'instone#(nd\'place',
+    '%%daddy%&iosely%(motherly$!s$#ter#&phitic#(ss-grown%$holm#\'velines$\'imetric%"ng%*tationally#%ziani"(easiness$\'t-aunts',
+    '*"ny(,eat-grandson&&sinner#\'ediness$#ned%$gate%#how%*ish-yellow%\'keepers)#ing#%goire$$ynog#%isser##yly$%steel',
+    '#$mble#&zzlies"#ohl#$over##tte#*und-living\'\'nesting$+se-shooting#\'velands#$wler##yne"&ubbier#%inard#%mbold#&neberg',
+    '"&zegorz!"sa!"to!$uage#&nosine$&tanamo"!d")esstimate"%llets#!u"%nboat#$g_ho"%rirab#$ning"&shiest',
+    '"\'tierrez!%walia#(rthegydd"%ennap"#ion!&yngell"$rate&!d#!i 0h&auml;agen-dazs"&eacute!#(n)!#.d.""f."$p.i.',
+    '#)itability"+cihasanzade"$dron#"st".emodynamically%)rrhagical""ft"#gge%#rty#!i""ha",ight-ashbury#%lwood#"ne#%rband',
+    '$&streak"%jduks"&ldanes#\'esworth#\'f-burnt%\'covered&%rowns%\'english%%laugh%&second&&isters&"ob&#tep%&waking##ide',
+    '##kyn#(lborough$&marked$%stand#"om$!s#"se#\'vergate"%madei#%elink$!s##net"%nafin#\'borough#)d-grenade',
+    '$!a$%basin$$grip$%pumps$%somer$1y/gloucestershire#$gin\'#"ko")ppisburgh")rd-driven%\'to-find$\'est-hit$%ihood%!n$#nut',
+    '#&risson#$ting$%shorn$$zell#0well/oxfordshire""ss$"am$#ell$!o"&tboxes#%chets%$ings#&efully##pin"%uberk',
+    '"\'ve_nots"&watmeh#.k-that-settles$"en"\'y-fever#,thornthwaite"!z#\'lehurst%#ton%$wood!#bmc!$cg62""tc!"dd!$e111',
+    '%$rest$$butt$$sman$%torch#$reth#%tfest$$sink(!s#%viley$\'y-gauge"$bbes"$ckel$"le"$eley#!m',
+    '#\'emonies"&itmann"&liacal$\'chrysum#(lenizing##man$$smen")miparesis%$tera"#nge#$nion$!y#$slow"&racles#&b-rich',
+    '#)editament$"ke#(mannsson$#ens$&opolis#$ston#"zl"*teromorphs&&nomous"$ures"\'xameter!%iatts"$deki$$outs"%gh-al',
+    '%&church&\'ollared&"ut%\'kicking%%price%&roofed%(strength$)est-rated$+ly-educated$%worth"%jacks"$ldon#\'l-forts$%forts$#men',
+    '"#mes"\'ndelang%"ss$#iii$$limb$%march$(u-moslem#"ny#(shelwood$"on"\'pparcos$*opotamuses"&rohato$$yasu#$udin',
+    '#$pano$"os"\'t-squad#$tin\'!\'lao-roo!"ns!#oan#$thly")bbs/rspca$&yhorse"$ckin#"us""et"$ggar#$hton',
+    '"*jatoleslam"&kule\'a"/lderness-manolo$$over#$keri##mer#\'ography".m&oelig;opathy#"an#(e-loving$!/$%world#$mage"#nes%(t-to-god',
+    '#"gu#)our-bound#"te"(of-marks##kum#$pers"&pcraft"\'rnbaker$$less#(ological#$sman##thy$)on/united#+v&aacute;th"!s',
+    '"&t-dogs$%house$%spots"\'undgate#)sewarming#!t"&verfly"$wett##rah##zat"$x-b2#"ne"$yden!"p2!"rc',
+    '!"sd"!r!&tfiiic!$ubei"#cks""ed"\'manized%$oids#\'iliates")nchbacked%%ed-up#&dredal#$g-up#&tworth""rr',
+    '#&tfully!\'wiccian""yl!%yaena&!s"/dro-electricity%+gen-bonding%%lases&$ogic%%phone%&sphere%+xyl-radical(!s"%lands"!m',
+    '"-per-sensitive%,insulinaemia%.parathyroidism%$soft%\'thermia#\'notists#%onyms$1thetico-deductive$#xic"$trel""un )i&formula")ntilde;es!(-measure!#.k.',
+    '!!/""ii!!3!$akov""ls"#ttc!"bi"\'uprofen!#c1b""aa"(e-bucket$(climbing%$ubes$%water#%falls',
+    '!/d&eacute;e_fixe")ea-having%*management$$lise"!l#"er"\'olising!#gcp""gi"$nace"$uacu!%i/iii"!f""ib!&kramov',
+    '#+uminatingly$#s.3%\'ionists"!m"$yich!%mbrie"-hausen-chemie"\'melmann#)oderately$(ralities%&talise)"ze#(unocytes&+suppressant"-pairment/loss',
+    '$(rsonates#)lementors$)icational#0ort-substitution$\'undment#(rovisers"$rich!&n-calf")adequates#\'rtistic#+uspiciously")carcerate#/ommensurability$)nsequence$)rporative',
+    '#&ubates$&nabula"%depth$)terminism#)ia-rubber$#pau$,spensability$-vidualization*+ly-designed#$ream"*essentials#\'xplicit")fectivity$(licities$#sts',
+    '#$mort#&o-mous$,rmix-gateway"%genue#\'olfiana"&halant$(rmonious"+itial-value\'#ize&%tions"!j#+ury-plagued($rone"$kpen#$ster',
+    '#+er-directed&&london"\'oculate(#ing#"ue""ra""s.#)alubrious##ead#)tructress&&mented"&tecalc$/llectualisation-"ty$*r-cropping',
+    '&.organizational&(relation&$site%&cessor%.esting-looking%)ferometry&#lug%*individual%%layer%,nal/external(#ity\')tionalise/#ing&\'etworks&&uclear',
+    '%)penetrate%)religious#\'ragenic%(regional%&sexual$\'ojected"*vigoration!\'olanthe"%niser"#sif!#p22")ecacuanha""tg!#rae")ish-based',
+    '"!k"\'on-clad"*rebuttable$\'dentist$\'futably$&ligion$(solutely#(itatedly#)otational!+s-tested-by"!4"$edet"#hii"%idora$"ro',
+    '""ma""nt"\'olonche#\'sbestic#)topically$#ype"#saq$!s#.ue-information"&tiqlal#%urits!\'t-based"&elmens#$mize""pa',
+    '!#var""ey""ig"%orian$*y-coloured!"wo!(zvestiia \'j&amp;f&!h#(uml;ckel!#\'ai!#.e."#p.s!"/m!/0437&ndash;4715',
+    '##obo"%kimik"$lopy"%mmers"(nesville#!i$$tors##jua#)uary-june\')/february"$rbas##dea"\'sminder&"um"#une',
+    '"!x"(yasuriya"$zzed!#cbs!(eetinder"#lfs##ley"%nnett"!r##boa#%emias#$ries$#old%"me$%y-can',
+    '!"ia"(b&eacute"$gged""ma"#tsu"#yun!!l!#msa!)obbernole&!y#%clubs")hn-stevas""ie#)nt-funded"%kaero',
+    '")nes-evans#"gh"#olz"%sefov$#pha"%unced#"rs"\'vanovic"$wers"$ynes!&uergen"(ke-boxes"#lee#*i&aacute;n$)dochromis',
+    '"%mpin\'"\'ne-july$"au"#raj#!e#(idically#$ymen"#ssy#$t_in$"er"#tes""ul!!v!"ym ,k&eacute;pis',
+    '!%\'miss!%.j.l.!"13!#562!&abakov$.rdino-balkaria#%inett#"ua"$khar"&lamata#$edin##lal$\'ikrates#$ugin$$tara',
+    '#$enev#\'ikamica$$sese#$lesh#"pa$"en""na#"da$$ohla#$tner")ramanoglu##iba$#sma#(jalainen##mic',
+    '"%sonde#$simi"#tas#$sina"%wulok"%yseri!#dpi!&eesing"$iran#"zo"%llock"$mbel#"pt"$ndra#!o',
+    '#&worthy#"zo"\'rbstone#$rier$&y-jane##sal$+chensteiner"!s"%wenig##ley"&y-note$$ring#&ingham#)nes-based#%rings',
+    '!(halkhali"&orasan""ue!\'ickable"&dscape$#ons"!e#&singer"*ller-bardi$%inchy&$gton#\'melford##ner"(mmeridge"+nase-linked',
+    '$%smead%$town#$kead"&ranjit#(chheimer#$kaig%&ndrews$.cudbrightshire$!e$%stead#!o#"st"%ssers",tchen/dining\'%maids',
+    '"%yonga"#zza!\'lansman#"tt"&einman##sch!)navesmire#$yton"(ee-elbow"\'itweave"+ockshinnoch"-uckle-dusters!&ohelet")llerstrom"(marovsky',
+    '")ndratieff""os""ps"(rnhauser"#tor"#ulo!"ra#&jewski#%nkoor"&eutzer"&istine""on"\'upskaia!$s128!#t22',
+    '!&ufrans"%ijken"$ltur",pferschiefer"\'rdzhali!$wesi"#irs!!x!$yomi (l&agrave#%mp;se"-eacute;vesque!$\'air"(estrange"-incoronazione',
+    '"%forms"&tenses!"12!#988!&abarbe#*idochromis#-oratory-based##ral##tam##uan")cquerware#*tobacillus"&dislas#&y-like"&ertius',
+    '$"in""ge"%haina"\'id-down#!t"!k##ers"%lique"+mbda-matrix#&e-duck#\'inating#&mertyn#(prologus"%ncret#)d-holders',
+    '&%ungry%&living%$mass%$uses#\'goustes$\'uage(s)(#-is)*processing#%rezac#$sana$#ink"$puta"$raki#$dner#(ge-sized',
+    '#"ky#"sp"$sham#&tingly"\'tchford#*e-eighties%%third$!y##ics$*tudinarian##our"(urentius$#ion""ve"&w-like',
+    '"$yoff#$zell"$zare!"do!\'ead(ii)$&beater#\'f-blade%&shaped#!m##per#&seback#)ther-look"#bna##run"%chers',
+    '"%ekpai"(ft-brain%*handedness%+ventricular$$most"\'g-weary#$gate#*islatively$*timisation#$side"\'hmbruck"%kking""mn#)on-yellow"#nch',
+    '#$sing#$tini"&onhard$"ov#(pardskin"+ptokurtosis"$tham$)eringsett#&ter(s)$#res"$udes""v.##ada#$el-2$\'nthorpe',
+    '#&y-lang"\'wington")ys/oxford!$iath"%bdems#$erte",chen-covered"(ddington#$gett"#ebe%$stod#"th"+fe-changing%%spans$&jacket',
+    '"%ggers#\'ht-blue"!i"&jphart"#lla$#ico"%mburg#%pness"$ndow#$gula#%naean#"ta$#hal##zey"\'onheart',
+    '"&rriper"&stserv"/thostratigraphy"$ubov"/ve-and-let-live!)lanfyllin$$goed$"io$$over$\'trisant"+wyn-y-groes!"ni!*oadleveler#%nable"#bed',
+    '"(calising#)hboisdale$(gilphead$#iel#$k-on$"ey$$sley#&utions"#der""ew"\'gicians"&llards".ng-anticipated%&billed%(expected',
+    '%&horned%$shot&$pade$%annet$%fords$\'lasting$$owal$$rock"\'ok-outs$#.up#)m-weights$$lade#&se-box""pl""ra',
+    '$$stan#!y"&stness"%udmer%$outh#!e#!w"(ve-story$%bites"\'w-class$&enough$)intensity$$salt$*technology$&volume',
+    '#&fields"(zoraitis!"pa"#ii*!$rppp!#s23""is!"ub#\'ricates"$ckey#$rece"#dek#%wigia#$zhev"#ena',
+    '"#gar#$gers"$igia"$kals",mi&egrave;re#$pers"&ngeing"%stria")ton-based"$vvie""xe#)ury-goods"$zula!%x-850!\'yapunov',
+    '$"tt"&dersen#$gate"#gon""ly"%mphad"\'nch-pin#!d$"en#.eham/wiltshire#!k"$onpo$%shall"\'r&aelig"%thgoe',
+    '".uuml;nsterland!$\'diq!%-five"#one"!p!$.i.5""j.!,a&icirc;tres"&callan%$pine$$ndon$*ri/manager#$coll%%rmack#$ewan',
+    '##har$,ine-building$$over#(ierewicz#"ke#,laren/oxford#&murray#"os#(ro-level%"ne##ula"(dagascan#%eiras#&houses##ura',
+    '")fia-style%!s$#osi"$ggio#\'heralin#(netotail$%ifica#"oo"$haud$!z#$omet"%ilbag#*ns-powered"%jella#$orie',
+    '%&edeely#\'donaldo#)e-defined$!y#"fi#$ians$%gning$!n#$laby$%inger#!m$%ierca$#sey#+nourishment#,ondialdehyde',
+    '"$mbas#%eluke#"ie##luk#&mogram##ore$$unia"&n-days$$like$$rems#$dala$#ers\'"on%5ville/buckinghamshire#$gold',
+    '#%ikins$"oc#&nering$#ock#(or-house#$resa#"si$$tead#(y-headed#\'zanilla&!o"\'pinduzi"%racas$%villa#$celo',
+    '$!y##iah$#bor$%nades\'#ing&$ting#%k-ups$*et-related$#ios$$yate#\'moutier#$naux#%owitz#&quardt%#ise',
+    '##sco##tek$&ialled%#gny%$nson&"us$!z#%velon\'"us#&ylands"%skill#\'ochists#-s-observation$$enga#1ter-manufacturers',
+    '&\'singers$%heads$(rantonio#%urian"$tara#&ch-day%#ett%$room#%isses#&tering$#hei&+ws/scotland"%wlawi"#x85#*am-gilbert',
+    '$.mum-likelihood#"ol"*y&ndash;31#\'akovsky",zar-i-sharif#"ur%"ka!"bc"#est"!v!"c1"!b"&cashin#\'hrystal#(lenaghan',
+    '#%reath$&ickard"/donnell-douglas"(eldowney"$faul"\'garrity#\'laddery#&rindle"&haffie##oan"&kibben$!m%#mie$#nty$#rdy',
+    '"\'murtrie"%nicol"&swegan"&tasney"$vean#%icker!"d.""ps!)eadowhall#&ningly"!b"$ccas#,hanistically#-klenburg-west"&denica',
+    '#+icalisation$(evalists$(ocrities$$race$)um-priced##lar#$usae"%etin\'&$g(s)"\'fenamic"\'gabyxos$&crysts##ger##son")ichenbaum',
+    '"*j&iacute;a"$kons"#lby#!d#"es##ior##man#\'t-water"\'mber(s)#$ling#$oire$\'ry-bank"$nary#%endez#"in',
+    '#\'struate#,tal-sentence$$heus"%p/con#&acrine"#q/h"$rano#(chanting#\'idional%"on#%ricks#\'seyrail##vin"\'scaline#"en',
+    '#&merise#!p##tre"(taphases%&odials$$ware#\'eoritic#)hane-rich$(otrexate$.yltransferases#+iculousness"*ude-monpas##rig"\'yerbeer!"fs',
+    '""kg"$lurs!(ichaelis#&kleton#)ro-vector%\'cephaly&(hallenge&*irculatory&(omputing%*electrodes%%fauna%%litre%&phonic&&rogram,#med',
+    '%$tine"(d-decade$&eighth$&height$&market$%ninth$\'seventh%+tratosphere$"to%#urn$%upper#$dens$\'le-brow\'\'eastern\'$wave',
+    '&%stone#%water"!e#"no#%tusch"%fflin"$lcom#&e-wide#%k-fed#&liamps%\'grammes%%litre%(on-rated$"ns""ma',
+    '$$tory##den#)eralising\'%ogies#(i-breaks&$uses%)computers\'*nstitution%%steps$#com$&skirts%(teriales+"ly#"ks#$olta',
+    '"&racoli$&flores#!i##man#%rlees$\'or/care".sappropriating#*classified#)described##han#(ogynists#-pronunciation#$rati$\'eadings##sen',
+    '#$uses"&togens!$l/kg!$mcfd"#mmm""pa!$nf-h!&oabite##ner##res#"te"&d.rep.#+el-building$(st-sized#+ularization',
+    '#)ammadreza#%orita")ir&eacute"\'jahedin""ke"&ldavan#$esey#*lycoddling#!y"%n-sat##ach#$elle$*y-changers#$gers$&olians',
+    '$$mode$&planes$(specific$\'technic%(onically#(seigneur#/tagu-chelmsford%#lva%#nas%$zeri$&erosso$!t"\'on-like$%stone$!y',
+    '"\'ravians##cha#&dantly#(genstern#!k#"ny#(phologic&%metry#$ritt#$ulae#$vern"&scucci#"el#(kovskiye##sie',
+    '#&teller"0ther-and-toddler\'&infant\'$love$%openg##ian#\'o-cross#!u"(urneview#&sehole#%tarde$"is""ye$!t!.p/conservative',
+    '"!v!(r.peavey"#pii"!y!)s-windows"$i-dn!"tu!+uch-delayed#&kamore$$lets"%dbank$$rick#$dily$"ly#/erris/muftiliks',
+    '"&kddaam"%lched#$heim#$lard#+ti-cellular&\'lateral&(platform\'+rofessional&$word%&author%\'ple-key($xers)#ing*"ty%$soft',
+    '"$ndic#%nford$#ion$!y#"oz"#ota"*ralitharan#"ex#"li"\'scatine##her#"ks#$sini$!y"$tasa',
+    '$$neer!\'wangaza!*ycological"%kines"#nde#%ewpos"+oelectrical#*fibroblast"$rdal##ica"\'sterium"%tilus +n&ocirc;tre"#sim!&\'diaye',
+    '!6-monomethyl-l-arginine!%.h.s.!#=11!(abs-wacc"%chson"\'lidixic"%me(s)$)/password"#nak$\'yakkara#.jiani/scotland#(nofossil##sen"%rodny"(scimento',
+    '#%tasya"$tans#&hanson#1ionally-developed"%unton#)seatingly"\'varrese#$star"\'xalites"#zmu!#dbs""os!,ear-darkness%*impossible%&misses',
+    '"#bot"/ck-through-body""do"&ediest$\'le-thin&#man#"ly##son""fi#"ta"(gligibly#\'roponte")ighboring"!m"$nets',
+    '$)darwinism$&nazism$+renaissance%)omanesque$(weberian#$data#$teny""pi",rve-jangling"*therfields&\'hampton#&secure#\'teswell$!o#-work-attached',
+    '"\'uberger#&ralgic$/o-physiological%\'leptics%$pile%(surgeons%%toxic#+schwanstein#(tralizes"+ver-ceasing"&wbould#)craighall#%forge#+ly-released#(man-haas',
+    '#+s-gathering#(ton-john%)wnstewart"!x!"g/#"mg"!s"%urumo!(ick-name$"ie""dl"#eto")ght-clubs&$long&%night',
+    '")ldro-hain"$mley".ne-dimensional%\'fifteen$+teen-ninety#$teen"#sky"(tpicking#%ragon!"lf!#mea""ol"!p"!w!*o&amp;sub2',
+    '##o-o#$show$#top"#.13$!6"$bili"\'cturnes"*ise/horror"(minative"*n-assisted%(ttenders%)utonomous$(believer%&onding$\'cabinet',
+    '%,hronological%&lients\'%nical%)ollection&$mbat\'(edogenic\'&munity&-nfrontational\'\'tingent()radictory%&urrent$)dedicated%*irectional%\'ogmatic$(election',
+    '%#uel$)graduates&#een$)inverters$,mathematical%#eat&\'dicated%&uslims$&owners$-parliamentary\')ticipants&(thogenic%&ersons%,ractitioners&&egnant',
+    '\'(vocative%,sychological$,quantitative$*resectable\'&idence&+volutionary%$oyal$)selection&&mantic%*tatistical&,oichiometric$)taxpaying%$rade$%urban#&smoker',
+    '#\'thermal#&verbal"%oijer"&rbreck#%combe#%dberg#$land#)mal-state##th-%)ern-based"&se-art$%bleed#%iness##ode"%taire',
+    '"&umenal#"ri"/vember-december")w-extinct##ers!#p40"!d"!g"!s!#rha!$swru!#uaw",clear-energy()generated&$ting',
+    '"#kes#\'u\'alofa"*mber-plate#(ismatics#\'mulites"#ove"$rgle""sa#&seibeh")tcrackers#"ek!"w8""fp"!w!(ymphaeum',
+    '#\'riscoll"(halloran"\'kennedy"#rea#&ourkes"#war!%.b.e."$e.d.!(akhanger#%worth"%stler!#bes"\'fuscate".jectifications"\'olensky',
+    '&\'ionally#+tructionist!%calan")cupancies"$elli"!l"&toplus!"d2"\'borough"(d-shaped#\'fellows##job""ey"$ness!.esophagostomum',
+    '!)ff-roader$%sales%%hoots$%track#\'putting##red",ten-repeated%"er#%times!#gen"!g!"ho!(il-cloth$(painting,!s',
+    '"&ticica!"ke"%imono""lo!&lavide"%ivers"#ten"%ympio!%merta!(n-centre#$road"%/roll")ce-a-year%%proud#\'ologist',
+    '""e\'#(-for-one$)sidedness#"ly#$time",line/offline"#oue")togenesis"!y!%p-104"$_cit"+acification"!b")en-handed%(textured',
+    '$%forum#(rability%&tions.$!e",hiophthalmus&+linthacinae$!r$$uchi"-inion-formers,#ing"!m")tometrist!!q!&randas"(chardson',
+    '".der-preserving#+o&ntilde;ez"*eopithecus""ff#\'ordness"&gandie"(ogenesis"#pen"#ris""si$"ni"&takent!)s/2-based"*cillograms"$hima',
+    '"*teoporotic#$rava"$wick##ulf!#tho!(ubliette""gh"%marou""re""t-$)manoeuvre%$oded$\'station$$tray%#urn',
+    '##did$$oing#\'gassing#$half#%lasts#&posted#%ranks$&unning#%write"*v&eacute;a!,ver-borrowed&\'urdened%)committed((plicated&\'ritical',
+    '%(powering&)rivileged%$rode%\'sixties&*timulation%$time$*confidence$&eaters$&manned$(printing$(reaching$%sexed%$hoes\'#ots%*implifying',
+    '&(retching$#tax%(reatment$(watering%%rites(#ing"&indoli$!e",o-viviparous"&ulated!\'wl-like!"x1#!4#!5"#bow',
+    '"#on.")ygen-free!%zaran"*one-benign )p&lt;0.10!$\'tar!$-51d!#.13#!4"#201#!3#!8""34""51#!3',
+    '""73"%c.b.s"%o.box!"/p!#14/!#300"!6!"48!"50"(85t7avt2!"67!"79!&=0.013%!7$!1',
+    '!*a&uacute;l"#asi"%cassi#$elli$\'setters#&hamama#%ifier#,kage/product$)ing-cases##ter"(derewski#$gett#+oa-schioppa")edophiles"$gano',
+    '#4nell/buckinghamshire"&hoehoe""i1#&n-free%&killer%)relieving$"es$\'fulness$#ing$\'killing#&r-wise$"in#"va"&ladino$+eolatitudes',
+    '#*e-coloured$"tz#"ko#&liardi%#dum#&m-tree$#ing%$tate"\'n-fried$(hellenic#\'egyrics#&golins#&handle#\'iculata$"ni',
+    '#\'slavism#(telleria$%heism$(on-lewis"&olucci"(per-mill##ier"&r-four#$ador$#iso$&lympic$-psychologists$)sitically#\'ed-down$+nt-friendly',
+    '##lor#&minter#%ousia#&rinder##sec#"ta%!i%#ken$"em$\'henissa$*i-coloured%0cle/antiparticle&+ularization%#zan$\'y-state',
+    '##hko$#tun#(sage-way"%thans$$item#$iala#$nick#"ou#%rials%!e%&monial#$tens%"rs"$uley"$wpaw',
+    '"$y-in!%bend2!\'c-xview"#d-1"!m"+r-fragments!"db""p-!-eace-offering%&keeper$%hcake#(rlescent%#oid#*sant-based#%tbogs',
+    '#&ksniff#\'toralis"%dalos#%icure$)planation##ley"(ek-a-boo$!e"$ggie"*isistratos"%lhams#$ivan#%lerin$#ini#$tier',
+    '"$naia#)etrations#$nick$#ons$*y-farthing%$cott#\'thouses#&yghent"%ople\'"%psico"*rambulated#)ceived-as%&ntiles$&olates#%digao',
+    '$#nne#$fick$\'ringens#%gamum$%olesi#"ha#%icarp%*entromeric$\'planeta#$jure\'!r#"se%%veres$+onalization#)tinacious',
+    '#!h#\'talozzi"1t&rcaron&iacute;n#*er-michael#$food\'!s#*rification$)o-dollars%)graphical%#nio#)tifogging%$shly"$yote!%fizer"!u',
+    '!$h.ds"!7"+allocentric#(nerozoic$&tasies#.rmacovigilance$#oah""cn")enocrysts%-menologically#\'romonal"\'ilolaus$!p$$tres"\'oenicia',
+    '#(ne-booth&\'tapping%$card$#ics#+sphorimager#)to-copied&(electric&&finish%+composition%*micrograph%%point%$shop%\'therapy##umi%%savan',
+    '",thalocyanine")ylogenies!(i&ugrave"#ana#\'roaland#%sters"&cardie#*ture-books\'(squeness\'#tel"#dal#\'dington")ece-parts&\'workers#$tism',
+    '#)zonuclear"\'gheaded#%sties"(jnenborg"&le-ups#\'l-boxes"\'mientos")n-cushion##eta#+k-and-white%&rimmed#$mill##nae""ol"\'psqueak',
+    '##min"%sarev#"sy"*tt-kethley"#zan!/l&eacute;nitude"#a2s#(giarised#\'nchette$&imetry$#ked$"us#*sterboards#\'te-like$\'ination',
+    '")ebiscites#\'iotropy##ura"!n""ow"-ug-compatible#%mbago$$rose#%ngers#,ralistically!%mol/g%%l/min!+neumothorax""sf!,ocket-sprung',
+    '""er#"sy"%godin$#ing"\'itevins##vre#$zner"%lemis$!n%\'politik%"ta#$iter%0ically-motivated("ns\'%izing',
+    '#&ka-dot#*lard/chief$#ens$%smoor#%yadic%$inos%%mides$$dore$%focal$$mict$*phosphates%$tych$%semic$/technic/college$&valent',
+    '$!h##man#.sonby/scotland"(oh-poohs#(l-liners##per#&rgrass$\'ly-paid"&pinjay#$star"\'rphyrin#\'t-salut$%ended$$icos$%ugese',
+    '"&slogic#,sible-worlds#&t-1918%,depositional%%entry%(feminist&$irst%-impressionism%(neonatal%\'primary%\'vocalic$&mentum$%notum"$tens%#tia',
+    '#)os&iacute#&sherds"*u-specific#$lter#+ndstretcher#%rquoi"*wer-driven%+ful-looking%%tools"#zzi!$pg12!,r&eacute;val""ac$\'ticably#$ecox',
+    '#$line#!n$$dini"&e-1974&"89$+acquisition$&course%\'ultural$*employment$*fabricated%$ight$(hispanic$*litigation$&norman$+occupations',
+    '%$ress$*requisites$)selection%$hape$$term%*heoretical#(acherman&$ings$(mplifier##ces$(ipitants#*dator/prey$.icate/argument#(figuring$&rontal',
+    '#(p-school$\'ackaged%%ttern$#uce#&sbyter)!s$-cription-only$#ely$#ser#&tectum$$zels##via#$zzie"%ibram#&e-dieu',
+    '#)ggishness#\'mestock$$ping$"um#$ncip#+vate/public"&o-axis$,gamsakhurdia$+palestinian#\'blem(s)\')-oriented$"us#\'cessual$\'tectomy$\'urators',
+    '&)t-costing#(fanities$+it-and-loss\'&hungry#(grammes.#\'insulin#%lamin$*ongational#(mptitude#\'nuclear#\'of-read*#ers#-peller-driven%%ptide$\'opamide',
+    '$&erpina$\'thetics#\'tagoras$#eam%&in:dna$&o-fish%%nated(#ion%&plasts%)typically%$zoal#*vinciality&"gs&!s$6ocation-neutralisation',
+    '#%nings"!v!#s/1"%almes"!b""db"+ephologists#"ud%\'o-costs\'&device"#kov".r1718&ndash;19".ychobiologists&-geriatricians#&gnosis',
+    '#&ridium$%ocles"\'olemies"&propcl""r.#!1!(ubescens"(ckeridge"%denda"&ffball""ig#&sieulx"&ll.out#%teney"\'mphouse',
+    '##ted"&ppyish""ra#/chaser-provider\')ing-power##die##ism#$kiss##ney#(veyances"(sh-chair#&syfoot"%t-off!"vu!#x64',
+    '"*loroplasty"%ritic#\'omaniac"$thia "q9!#asr$)-e-shirin"!u!#eqe!"fe!"ol!#pos!&uadras&$verb%$ille',
+    '#$rtal%(er-facet%"os#.si-independent&(mystical&*scientific"!b"(ebeckers#(dlinburg#"tt"+ick-growing&\'release#$eres$$tist%#ude',
+    '##nag$"te#&reboys##spe#&tainer"$oick -r&eacute;gine"+lsqb;x&rsqb"-uuml&uuml;tel!\'-values!#.i.""p."$s.s.""t.!!0',
+    '"!5!#2/3"!2!%4000a!$6000!!9!&abanne"\'cecards$#way#\'hmanism#$isms#&keteer$$hams#(omitrium")dicalized',
+    '$$gund$)oisotopes""fm")ggamuffin#$ione#%store"$hner"\'ilcards#"ma#(n-sodden&$wept$$less$$tree"\'jathuks#&putana',
+    '$$shly"!l")m-raiders#$aiah$\'krishna$"na#(bouillet#$ekin$$sses#&illies#"la#&pantly#%sewak")nch-style#%elagh',
+    '##gel#"ji#%k-sum#!n#$sack"%peman##hoe#%oport#$sley"(sakumbha#&sadorn"#ter##ter$#rie\'!s',
+    '"&velled#(ishingly&$ment"#wle%!y$!y"%ynaud##sse""ze#(or-blade#(zamatazz!#bis"$s100#"50!#dls',
+    '$(lignment$$rmed#\'checked#\'drafted#&edited$\'lecting$)mphasized$&ngaged)$ment$\'rection$)valuating#&filled%\'nancing$$ocus#\'grouped',
+    '$&ssuing#\'letting$#oad%$cate#$make%#rry#+negotiation#(position$&resent#,registration&\'ulation$&unning#&seeded%%lling$(tatement',
+    ')#ted%\'rfacing"&adiest$#mit$$outs#&ganite##lme#%r-end#\'sonings"+b&ecirc;che#"ec"+capitulates%%tures##ces#/ently-published',
+    ')"al#\'hecking#(iprocals$#ter#$oded$+mbinant-dna(#ing%&piling$&nciler%$firm%)secration&(tructive$)rd-buying#%ulver$!t',
+    '$%eared$#raw$$tail#$coat#%daway$"in#*ecorations$\'posited#-istributional#"ly#$shaw%%ifted#%woods"#f-o#&ashion',
+    '#$late#$ract\'\'oriness\'!s#&usenik"\'galists#)ionalised$%strum#"ni#%osols#"t.#+ularization"$hung"-ichsmarschall##fer',
+    '%#rus$(bursable#(ncarnate$*vestigated"$jsek"$kdal##ord"(launches#&igion.$*nquishment#$kirk#"um"\'medials#%ixing"%nberg',
+    '#%takil"(ponsible$(ssessing#)roducibly%$gram)"me##sol#&ublish"0quires-source-of"(sealable$#lls#*identially$&liency#2olutio-compositive#%ponsa',
+    '$&ublica#%tauro$(oratives$$ring#)ubmission"$tiro#$read$*ibutivists##une&!d$6rn&mdash;detail.errors##ype"&unites"*validation#%enges',
+    '""wa#\'ritable!"fm!(hapsodic")eological"\'odopsin""ss"%ymney#(nchosaur$"ie!&ibston"$cans#$call#\'e-based%&fields',
+    '#&h/poor$,ardson/coach$#ini$#mal"$ddim$$ling#\'ge-walk"$edel#\'mannian#%tveld"$faat##ted"*ght-of-way#!i##old',
+    '"#kki"$ldia"$mell""na#"ga$%ingly"%ordan"$pest"*sk-sharing%&takers#&parmio##ton"$twik"#vas#$eire',
+    '#+i&egrave;re"(zzolatti!#lfc!"nd""id!)oad-signs%%users$!e"%bshaw"$chas#)k-climber$%eries")ddenberry%"rs##ley',
+    '"&kermen"$llox#!o#%ypoly"*m&aacute;n##ani%&ticize##eos")ncagliolo#%donia#!g#%stadt"&ofleaf#)m-by-room#!n',
+    '#&tpack1")pe-lights"&rquals"#sas#%ebowl$&nstein$#tti#6s-on-wye/herefordshire$$ythe#$tral"%torua#%tweil##uma"\'ughneck##let',
+    '%$trip$#ton#&settus#)te-finder%#ing".wbottom/milton##den##ett#&linson"$yton!"p3!"rr#!m!%s-ors"#amd',
+    '!"tp#!i!$u486"#adh"$bbly#%idium##lev"*e-des-bois""fa#\'fianism##ina"&isdael"(le-bound"&mbelow"&n-offs',
+    '#)ning-down"$piah"$rban"$sche#$sets"#tan!(ychetsky"%knild"&neveld"%tasha (s&amp;ls"-egrave;cheron!&-sugar!#.10$!0',
+    '#$6(1)""38""56"!o"$v.r.!%/nvqs!$1(5)"!0#"00"!9!"23!#320!"47!%61(1)"$2(4)',
+    '!$a\'id"&badell##iha##kha##les"&ccades#)hlichkeit"$dden$\'le-sore#)istically"\'festore$,ty-conscious"#ger#)itt&aelig&!a',
+    '"\'hibzada"#idi#\'lmakers#(nt-denis&\'etienne&\'germain&&pierre%$bury%\'e-croix%%sbury#$sons"#kai"#le.$"rs$%sroom',
+    '#$ines#!l#&thouse##war"(mbandham$#ora"%ndbar$#one$#rin$$toft##est##gha$!o#%marco#%quhar',
+    '$%olina#!z"#pan$$udia#"in#$poro"&raceno$!i##dos#"na%#fil#$onic$#uac#&torius""ss',
+    '"%trapy#%tareh$)erthwaite#&urnino"(uce-boat#%ropod#%ssies")va-danube#\'e-a-cup#-ings-and-loan##oie%\'r_faire$$ries"&wbench#\'doctors',
+    '#\'ifrages#!l##one##tet!$cads#\'ffolder#&gliola#)leability%%xtric$"ly#$nlan##rer$&ifying$"pa#!v',
+    '"-enes-of-crime$*ted-leaved""fv#!w"*h&auml;fer#&affner#%einer#&iemann$&mberni#&latter$&uchsee#-midt-rottluff#(nadhorst$#ell\'#man',
+    '$+olmastering##umm#*weiz/parti\'"er")leroderma&$sant"\'oliosis$!t#$oper#%tcert$&s-born$&tsdale"+ratchplates#%ew-on%$ball',
+    '$!m$%ptory&\'writing$&veners#(uffiness&!s$(m-halves%%mages$(pulosity(&usness"%umnik##zzy!"dk""lc")p/liberal',
+    '""16")a-fishing%#ood$&levels$\'watches#"by#%horse#%m-loc$$ount#&ringly#&shells#%watch".bag-montefiore$&stopol#!e',
+    '\'%stage#*retagogues\',ry/treasurer#+tion-making#(ularists$.rity-conscious"&dgeley#*uctiveness"\'ed-beds$#ier$$smen#!l#$meth"!g#"ed',
+    '##uso"%iners#!r#&zinger"%khmet"&lectee&$mail#+f-abasement\'(negation%\'defined*#ing\')structing&%oubts&,ramatisation%.identification',
+    '\'%cking%)poisoners&(rofessed(&moting&(ublicist\'(nishment%+reflexivity\'\'vealing%$sown%&titled#$juks#$vini#&worthy")manticist#(erdzhiev',
+    '%*continuous%&divine%%fixed%\'invalid%,quantitative%$ripe%%state"$nnen##ora#,sationalised$&itives#)timentale+#ist"&phadex#$ilok',
+    '"+rologically#&vatius$"io"&ssford"#tch#(tling-in".ven-and-a-half&$goal&#man%+ty-year-old$#rer"%werby#!s"\'xennial##ily',
+    '"$zgin!"fe!"h6"\'ackling#*dow-boxing#"hn$\'rastani#$kier%"ra$"os#&liapin%#mar$#lis$#ott#(muyarira',
+    '$&tallow%\'y-towns#$pour##ram$$dari$%eable$&k-like$%lston$*p-featured$"yn#3yle/gloucestershire"&eaffer$#sby#$ened#\'lf-grip',
+    '$&l-fire#&pheard#%rwell"%ifnal#%mmery%#ied##ner#(pbrokers$#sey%#ton#\'rli-ann$%tliff",ock-absorber&$wave#(e-making',
+    '#\'rt-hand&$life&)sightedly%!t#1ulder-to-shoulder&"nt"%tikov"%urely#(shkevich#%t-off!(icilians#%k-bed$#est"\'de-line)!d',
+    '$&stream##les"#eff#!m#$stas"!f"%geric#%moids#/n-and-magnitude%&posted%\'systems$#ori"$kora##yon"\'lkworms',
+    '#$mour#\'verwork%!s##wan"&mbirsk#\'ilitude#$kins#-pson/scotland##son"&nfully#-ger/guitarist$)le-decker\'%pilot("ly\'&strand',
+    '$$phos#%istra#$kers##ter&%klaas#%usoid"%rhowy#$occo##rah$#ell"&tnikov")x-bedroom$$page&#rty%$iece',
+    '#\'teenths!$j-20"!g!*k&aring;ne"#280"&aardal#"il")effington#\'pticism#\'tchiest&#pad$!t"&idmore#)lasticity$\'l-based',
+    '%#ing#%mpole#"nk""lp"&olnick"#use"&ydiver&#ing!\'lackens#\'tternly#*ve-trading$\'ophiles"#cms"#eds"\'ighting',
+    '$%eball%!s#$p-on$$road#&t-eyed"!m"$o-mo#"es#$oten#"te$$hful"\'ump-hit!$maje#&llbone#\'shed-up',
+    '#!w""gl")okestacks#&oching!%nagov#(pdragons"$ells#"yd"(ickering#%ffily%#led"!o#\'bberies%#ism#$gged',
+    '#"we$&making%#elt"$yman!#oay"/cial-scientific&"es$$ety\'$/o-psychological#%kless"#est")ft-drinks$%board$\'ware602"!h',
+    '"%lanum#&omonic$$v\'ev"$mite##mes#$port"%nique#(ofabitch#&tochin"%phist\'(ications"(rbothane#&cerous#"ia""ta',
+    '#-fri&egrave;re#&l-mate$&eymane$!t#+nd-proofing%)ing-board##tar$\'h-bound&%north$#ron#%ville"%vbloc#,iet-designed"&ybeans!)pacesuits',
+    '#)rcservers$\'klingly#%tulas"$eake&%rship#"c.$(ies-poor$&trally#+echlessness&\'readers#)leologist$#man#(ncerbeck#!u"(herulite',
+    '"\'in-down$"et##vvy"%lines%$tery$&ttings"!n"$oked%#man#\'liation#$nger\'!s%"ia#$rtif&"ve',
+    '",readsheeting#"og!%q_kms"%lwset"*uare-jawed\'#leg\'$wave&$ness#&eez-ee!"rf!#sis""p1""rp"#shh!)taatsoper',
+    '$\'le-mate&%mates#\'ckallan#"el#(ge-coach%&diving%%hands#$ller##mpa#&nd-ins&#out%%ardly$!t$#yer#&rforth',
+    '$$vin\'#(te-aided%$wide$#ive$&us-quo%)te-barred#6verton/gloucestershire"&eadies#%bbing#*ep-pitched#%ffine#+in-am-rhein%-gr&iacute;mur#(phanotis#,reochemistry',
+    '$\'ilisers#%tsons#(vedoring#"yr"%igler#$lgoe$#ler$%tedly#(mulators#(nchcombe$$kers#$pple"*ocksbridge#$kers#%matal',
+    '&\'floored&\'vaulted$#ors#%plist$%overs#%rages$"er$"mo%$seal$"rs$$ting$(y-boards#%thert$$land#*ut-hearted',
+    '"-raight-jacket)%laced$(thcarron%+o-volcanoes%$tons$"us&$feld$)w-covered#%eaker$+et-fighting$$ltsy$!n$#ona##ick$%pling',
+    '$#nge&\'yloides$#yan"%uberl#-ddert-kennedy$!i%$edly#&mpings#$rges$0mbannf&uuml;hrer#%tters"(ylesheet$!i$&ometry##mie',
+    '",b-components$$lets$$menu%)illimetre$&orders$(patterns%)rioresses&&ograms$(routines$*seneschals%#oil$&themes%#ype$$word#\'aqueous',
+    '#&facets#,ject-centred#(language$%eases#+microscopic#%orned#+stitutional#&tracts"\'ccoured$&ulence#%kered&%mouth"&dbrook##jic#%ocrem',
+    '"5ermondt-ludwig-museum"&ffield##ism""hl"$khoi")laimaniya#\'fhydryl$"ur#"is#)phonamide##ter"%mberg#$isho#"ma$\'ersgill',
+    '#%ption")n-bathing%\'leached%&ronzed##box#&shades".p&eacute;rieur0!e#*er-charged&%duper&%heavy+&weight&&league%"ba%$egos',
+    '\'"id%#key%\'massive%)ordinates%%sense\'%rvers&$tyle%$vene)!s#,plementaries%(ications$*ortiveness"(retyship#(vivalist")spenseful',
+    '#(quehanna"%zette!$vats"\'etlanov!"w4"!5"&annery$(sborough##rte#)shbuckler"(eet-sour"&iftlet##ney$#ish#)tched-off',
+    '"#dow"(lph-like#&vestra"$mkyn#(pathizes)#ing$+tomatically"+nchronizing#"ge#"ne"2s&dollar;sysdevice##prv#&tem/88&\'atizing&&pro/xl',
+    '"&lachta $t.4s"&brucei"#i.c!$3pg4!$a-ra"$bbed#"el#$iano#\'le-lamp""cp#&ticity$#ual"$dley""ek',
+    '#"fe#!s""ib#"fa#\'l-wheel$%lefer&!r#"tu""ka#"eo"#leb#\'ismanic#%lyman""ma##ped',
+    '##gos#"it#$jung#&kmates$!o##sey#"to$#ric"*pe-measure##ies"%rdets#!i#&kovsky#$ried$%ytown',
+    '$&razine$!t#\'varians"%sking"%u-tau"+x-and-spend##men!+ba-reactive!*c-cultured!"dr!\'ea-cups$&ladies\'!y%%eaves$&towels',
+    '#%house#\'m-based$(building#"pe#(r-filled"%chies$#nik%&opolis"\'esmouth$$port$%sider"!h")lecasters$$dyne#&lurium',
+    '$#itz#$ogen"+mpestuously$&lemans&$tons$&orised$"ra$\'tresses")n-fifteen$#pin$&strong##pin#)se/aspect#&torial"$redo',
+    '##nan#,ror-stricken&%izing##tii")st-retest$%ation$%piece$$ware"+tracyclines%!d%*nucleotide"$uton"%x-mex#&turing!2h&eacute&acirc;tre',
+    '"#\'do"#abo#"in#$llus#)tchergate#!y")ematizing$\'e/rheme#\'ophilus#$raps$"e\'$%midor%,ocoagulation&(plastics&\'setting',
+    '\'%table$$opod$!r#!t#"yr"#iam#$baut#"ol#"rt%\'y-third"%omsen#$rens$%nback%(e-wallis%%holme',
+    '&$ings#&ee-car\'!d&%fifty&$lane&&seater\'%troke&%under%&.phase%\'quarter$%lkeld#*ice-weekly$"pp#$ombi$%ughly',
+    '#&u-neck$"ms$&ppenny"+underclouds#$rman"\'ylacine!(ibberton")cker-tape"(ddington#%emark"%ed-up##pin"$ffin",ghtly-packed""ki',
+    '$%-cost%%depth%&frames%#gap%&period%\'tabling&(o-market&)ravelling$&lessly$%sheet)!s#!s"(n-glazed$%plate%"ot',
+    '##ley##tin"$oman"%ppees"%tians#%ograd!"k2!"lm!#n38"!m!"o-"-bacco-related"8ddington/gloucestershire"%e-cap""gc',
+    '"$iler""ke$#lau"$masz#$inah"\'o-small##ker#)lkit/unix#(mebridge#!p#(thlessly$$ling$#sie"(p-hatted$$rope',
+    '#!e#$line#(ographer$!l"#que""ri#+pedo-shaped%!y#"te#*y-anglican"&shibas%!o##tig"$ttie$"le',
+    '%$ings#%ghens#&rmalet#"te"*wcestrians##nie$%sends%%woman"(xascaris"&yshops!&rabzon#(chomatis$%k-bed$+tor-mounted#"me',
+    '$)quilisers)$zers$)s-caspian%&border%(cortical%&hipped\'(storical%(mittance&(utations#&pezium&#oid#%uffer#$vaux$(el-weary"&ecento',
+    '#%fnant#(nch-coat&"ev$$tino#\'ponemal#*stle-table#$vett#$week"#i-r#$bals$\'eswoman#*centennial$,hostrongyles."us##ers',
+    '$#lex##gem$\'gerfish$%lyphs$!o%(nometric#-iodothyronine#%maran#"na#&pwires#(slanders$)phosphate#%ticum$$onis$\'uration',
+    '"\'nopolje"(oopships#\'popause#&ublous$)ser-press##ver$$oada"$ubin$!y#$cial##ely#"ka##lli#(mpetings#$stie',
+    '!\'sarskoe"%elkov#$ring"!f""rs!$uami"\'be-like"#dge"!f")ghlukabad"$llie$\'ybelton%&carnet"/mour-suppressor&(igenesis',
+    '##ica#$nell$\'icliffe"&ppenny$#ing"\'rbanned%"ry#"co#,kish-cypriot$#man$%omans#\'n-about%$outs$%stone##ves',
+    '#$sled"$tees!"va!"w8")elvemonth#"nt"&iddles#(n-engine$!k%"ly#)sted-pair"(o-by-two$(cylinder$&fisted$$pipe',
+    '$%years#$mbly#"rt"&yfords!&yerman"%gavac"&nyanov"+pe-specific#&ifying"#vek $u/13"!g!#937!"au!\'baldini',
+    '"!f"$hida!&dolpho""ps!"ea"#mcc!#faf"#ton!!g!"hl!#ics!#k/i!#lcc")lesthorpe"*trasparc-i',
+    '!)n-imposed#%uncle"(accented#\'dmitted#)ffectedly#)nalysable#+ttributable"&bundle"&cached$$used#\'emented$*rtificated#\'lasping$\'imbable#"ok',
+    '%(summated%&trived$$sted"&damped#+ecidability$$r-13&)achievers,#ing&+capitalised\'*onsumption&*employment\'(xploited&)recording(\'present&(strength',
+    '%&handed%$life%*performing&&laying%(studying%\'whelmed$(signated$\'viating#)istracted#(reamt-of%$sses$\'inkable#&ulates"&earths#\'quipped',
+    '#(thically#\'xampled$(purgated"%ficyp#*orgiveable#+ractionated$*iendliness#)ulfilling($ment$#rls"\'gallant$"ro#-rammaticality%\'tefully"&imodal',
+    '$(tegrated&(lligibly&$rest#&raptor$$oned#(t/module#(versitas"&linked")matchable#+entionables"&padded#%riced%\'vileged$)ogressive"*realisable',
+    '%%soned$(lievedly$(sectable%+tricted-use$%vised#&ipened#)oadworthy"&saddle$(nctioned#&carred#%erved$%ttles#)implified#(paringly#)wervingly',
+    '#&rimmed"*verifiable")weathered!)pbraiding"!c"#end"%going"#ham$"ul"\'leatham"(per-case&%level"%tempo##ime"-wardly-mobile',
+    '""im"\'ography!.s&dollar;1,400+,.00=253.8418+!0+"10+)2,000,000+)4,000,000,)0,000,000+!5+*80,000,000*&24,000*!3+)5,000,000*%4,200',
+    '*%9,000"(-trained#$wide"#/uk"!b""da"+er-oriented""fp"%urers!$tica!%v-vis!\'xorious \'v-shape!".i!#/cm',
+    '!&adgama#(inamians"%ginas"\'lue-add&%based#%verde"$mbac#)pire-like&"ic")ndalizing$#yke#!t"#rga#*iable-rate%"te',
+    '")scularity#-oconstrictive"+t-inclusive!%c7000!$eale"\'ctorial""en"!l#+vet-covered"&nereum$%tiaan#,geance-magic%#rov#&izelos#$stre',
+    '"+rbalisation$$oten#$dian#\'ebalavu#&meille##nes#&sioned$"ts#"tu"$ster!!h!.i&scaron;egrad"(braphone%$tory"#ce-',
+    '#\'inities$+ous-looking#%omtes#!s""da#%eotex(!t"$erck"%geois#&ourous"*ii-related"%llars$#ein%%preux%$real',
+    '$$enti#%daloo$)icationem#"er#%kovci##oba$!d##ton"&rendra#%gates$#in\'#\'us-like"&talism#$ebsk#$oria',
+    '#&errids#$onex#"re"\'zetelly!)ocalising&\'zations#!i"\'daphone"$gler"\'icetype")l-au-vent#$/vol#%endam#&ksoper##ney',
+    '")ngkhamsao"$wles"!z#(nesensky!"p6!%r4200"\'edeling#%eland!$t220!$uggy!#ver *w&divide;d",uuml;rstchen!#.l.!"/t',
+    '"!4"!r!!_!\'achagga"$dkin"\'ffen-ss"$hhab##ler"\'kehurst$"ns"&lbrook#$dner#$k-up$&erburn$*ie-talkies',
+    '$&charts$$dorf$3ingford/oxfordshire$\'mounted$,raf-richartz"(r-making#&dening#\'ehoused#"is##man$%ed-up#%ranto"(sh-stand$%house$$wood',
+    '#&te-bin$%water"&tanjar#)er-course&)repellent&)treatment%$care&(olourist%%ville##hen#)son-crick##ten"\'veguide$\'numbers$&tracer',
+    '!"dg!(eak-form#\'ldstone#&verham"#bby#*er-fechner"*dding-cake"\'ediness#%kblad##ley"$hner"\'ighings#&s-fogh$%stein$&weiler',
+    '""lf$&arists#)l-adapted%&beaten&)rought-up%(defended&\'irected%&hidden%)nourished%&padded&&leased&&ressed%(reasoned%&served&%truck',
+    '$%known"%nford##sum"#ser#&t-east%%meads$(deutsche$$erby&%marck$"in$%leton$$mead$#pac$%water"\'therden',
+    '!&h-what"$alen#!n#*rton-tigar"$eare$%tland#.els-and-brakes#%lping#"th"%ibley#$dden#$ners$#ger#%skeys#+te-jacketed',
+    '%%legge$#sey$)tingstall%%lesey"#oof$!o#%redom$#nes!"ic")ddrington"%egand"*gtownshire"\'jetunge#,sm&uuml;ller"\'ld-card',
+    '#-l-o\'-the-wisp$*iams-jones%+es-williams%"nk#+son-barnett#,tshire-based"\'ndowbox&%works#\'e-maker#&kfield$%worth#,nie-the-pooh#\'servers$%omely$#ter',
+    '"(pe-clean"*re-cutters"+se-cracking#-h-fulfilments$#ers$!t#!k##tow"&tchery#(h-profit$+in-subjects!"mo!"no!#ohl"&lf-man',
+    '"(menswear#"on"+nderfulness#"ka"*od-pasture$%chuck$%hayne#%lmark%&ington$$sack#"ps"(rd-pairs$%lists#"k\'$)-stations',
+    '$"es$.place-assessed#(ld-views&)weariness#\'m-eaten#(th-while$!y"&uldnae!$pget!*raith-like#\'pped-up"+eath-laying"*icklemarsh##nge%!s',
+    '#,ter-director""oe!%yakin"#lfa"(spianski "x%!.-windows-based!$11.5!"a5!"c1!"e3"!7"#nly"&rotica!"h6',
+    '"!s!!p"&rinter!$view#$sion!%xxiii#!v$!i (y\'pripio"$self!!-!$akov"(nagitani"$pped"%rdies',
+    '"!u!"c6!.ear-and-a-half"(llow-red\'%white&"er"%omans"$rkes&\'-dodson#&selves"%shiva##ter&$day."&vdoxia##ele',
+    '#(tushenko!$ilin"!u!#lva!%oakam"#del"&ghourt#\'yakarta"%lland""ps"\'u&mdash##\'se#*-know-what#-thful-looking""wl',
+    '!!p!#uga""ko ,z&eacute;lia!%-mail!)abaglione"\'chariah"\'inuddin"%mbesi""na!$egna"#isl""ki"#lma"%mstva',
+    '#"on"\'ro-base$"es"%stful"\'ugmatic"\'yneddin##rek!#gqn!"he!%latko!$omax#"bi"%nally"-ogeographical#%noses',
+    '"#rba##kin#!n"%zimus!&uweyla!"xs',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_21 = (
+count_21 = 6694
+
+heads_21 = (
     '&eacute;poque',
-    '&mdash;not',
-    '&ndash;n',
-    '&pound;1,550',
-    '&pound;1,560',
-    '&pound;1,950',
-    '&pound;1.53',
-    '&pound;1.55',
-    '&pound;10.1m',
-    '&pound;10.3',
-    '&pound;10.4',
-    '&pound;10.4m',
-    '&pound;10.75',
-    '&pound;100&ndash;150,000',
-    '&pound;100,000-a-year',
-    '&pound;101',
     '&pound;104m',
-    '&pound;105m',
-    '&pound;107,000',
-    '&pound;12.90',
-    '&pound;121',
-    '&pound;123',
-    '&pound;1250',
-    '&pound;129.95',
-    '&pound;13.25',
-    '&pound;13.7',
-    '&pound;14.14',
-    '&pound;14.3',
-    '&pound;14.3m',
-    '&pound;144',
-    '&pound;148',
-    '&pound;149.95p',
     '&pound;15.7',
-    '&pound;150million',
-    '&pound;16.6m',
-    '&pound;16.80',
-    '&pound;16.9',
-    '&pound;17.5m',
-    '&pound;174',
-    '&pound;179',
-    '&pound;18.45',
-    '&pound;18.5m',
-    '&pound;19.5m',
-    '&pound;2,087',
-    '&pound;2.2bn',
-    '&pound;2.89',
-    '&pound;20.5',
-    '&pound;200.00',
     '&pound;209',
-    '&pound;21.3',
-    '&pound;21.99',
-    '&pound;212,000',
-    '&pound;22.5m',
-    '&pound;220m',
-    '&pound;227,000',
-    '&pound;228',
-    '&pound;239',
-    '&pound;242',
-    '&pound;25,000&ndash;35,000',
-    '&pound;25.99',
-    '&pound;255',
-    '&pound;268',
-    '&pound;279',
-    '&pound;28*',
     '&pound;284',
-    '&pound;289',
-    '&pound;29m',
-    '&pound;3,750',
-    '&pound;3.15',
-    '&pound;3.30',
-    '&pound;3.35',
-    '&pound;300million',
-    '&pound;31.50',
-    '&pound;310,000',
-    '&pound;315',
-    '&pound;32,500',
-    '&pound;32.5',
-    '&pound;32.95',
-    '&pound;327',
-    '&pound;33.60',
     '&pound;336',
-    '&pound;349.99',
-    '&pound;35.95',
-    '&pound;36,600',
-    '&pound;36.95',
-    '&pound;36.99',
-    '&pound;363',
-    '&pound;370,000',
-    '&pound;38.43',
-    '&pound;389',
-    '&pound;393',
-    '&pound;4,300',
-    '&pound;4.20',
-    '&pound;4.29',
-    '&pound;4.7m',
-    '&pound;4.80',
     '&pound;41m',
-    '&pound;43,500',
-    '&pound;430,000',
-    '&pound;449',
-    '&pound;45.26',
-    '&pound;468',
-    '&pound;47.9m',
-    '&pound;478',
-    '&pound;48,750',
-    '&pound;48m',
-    '&pound;5,100',
-    '&pound;5,400',
-    '&pound;5.3m',
-    '&pound;50,000&ndash;70,000',
-    '&pound;515',
-    '&pound;525m',
     '&pound;550m',
-    '&pound;580,000',
-    '&pound;6&ndash;8,000',
-    '&pound;6,300',
-    '&pound;6.2m',
-    '&pound;60&ndash;80,000',
-    '&pound;60.00',
-    '&pound;600,000&ndash;800,000',
-    '&pound;61m',
-    '&pound;620m',
-    '&pound;64,000',
-    '&pound;680,000',
-    '&pound;69.95',
-    '&pound;7,171.50',
-    '&pound;7.3m',
-    '&pound;7.5bn',
     '&pound;7.8m',
-    '&pound;7.9',
-    '&pound;71,000',
-    '&pound;740',
-    '&pound;76m',
-    '&pound;77m',
-    '&pound;79,000',
-    '&pound;799',
-    '&pound;8.3m',
-    '&pound;8.49',
-    '&pound;8.6m',
-    '&pound;82,000',
-    '&pound;82,500',
-    '&pound;820',
-    '&pound;83,000',
-    '&pound;83.25',
     '&pound;87,000',
-    '&pound;89,000',
-    '&pound;9.1',
-    '&pound;9.2',
-    '&pound;9.2m',
-    '&pound;9.8',
-    '&pound;99.00',
-    '&pound;nil',
-    '&pound;xx',
-    '&prime',
-    '&psgr;40',
-    '&sim;100',
-    '&times;188',
-    '&times;19',
-    '&times;400',
-    '&uacute;voz',
     '\'fore',
-    '\'ight',
-    '\'orses',
-    '\'they',
-    '\'urry',
-    '**changed',
-    '**david',
-    '*lee',
-    '*michael',
-    '*nguyen',
-    '*peter',
-    '+++',
-    '+56',
-    '+ve',
-    '-0.5',
-    '-45',
     '-oh',
-    '-specific',
-    '-stimulated',
-    '-this',
-    '-up',
-    '.303',
-    '.357',
-    '.9',
-    '/d',
-    '/l',
-    '/msc',
-    '/range',
-    '0&middot;1',
-    '0&ndash;25%',
-    '0&ndash;62mph',
-    '0-levels',
     '0.004',
-    '0.015',
-    '0.017',
-    '0.046',
-    '0.237',
-    '0.35%',
-    '0.3c',
-    '0.3m',
-    '0.40',
-    '0.42',
-    '0.4p',
-    '0.53',
-    '0.5pc',
-    '0.63',
-    '0.73',
-    '0.87',
     '0.99',
-    '0.9mm',
-    '0015',
-    '004',
-    '006',
-    '007\'s',
-    '00:10',
-    '011',
-    '0235',
-    '0242',
-    '0256',
-    '026',
-    '0282',
-    '030',
-    '0303',
-    '031&ndash;469',
     '03:07',
-    '03:08',
-    '0424',
-    '0473',
-    '0480',
-    '0536',
-    '0582',
-    '05:41',
-    '0601',
-    '0622',
-    '06:47',
-    '071&ndash;387',
-    '071&ndash;637',
-    '071&ndash;734',
-    '071&ndash;839',
-    '0733',
     '07:06',
-    '0869',
-    '09.00',
-    '09.30',
-    '0925',
-    '0962',
-    '1&frac14&ins',
-    '1&ft',
-    '1&ndash;24',
-    '1\'17',
-    '1,068',
-    '1,1,1-trichloroethane',
-    '1,2,4',
-    '1,200m',
-    '1,370',
-    '1,476',
     '1,500-2,000',
-    '1,900,000',
-    '1,950',
-    '1-2-3-4',
-    '1.1.',
-    '1.1.86',
-    '1.15am',
-    '1.2.4',
-    '1.2mb',
-    '1.3.',
-    '1.30&ndash;4pm',
-    '1.36',
-    '1.39',
-    '1.4.2',
-    '1.4.3',
-    '1.56',
     '1.59',
-    '1.5pc',
-    '1.6.3',
-    '1.62',
-    '1.7.1',
-    '1.75m',
-    '1.92',
-    '1/4in',
-    '10&mgr;gml',
-    '10&ndash;25',
-    '10(a)',
-    '10,000-15,000',
-    '10,000-strong',
-    '10,000-up',
-    '10-18',
-    '10-2',
     '10-4',
-    '10-wicket',
-    '10.10pm',
-    '10.27',
-    '10.28',
-    '10.3.3',
-    '10.41',
-    '10.48',
-    '10/4/93',
-    '100-word',
-    '1000&deg;c',
-    '1000th',
-    '100c',
-    '1019&mdash;20',
-    '1030l',
-    '1053',
     '1055',
-    '1059',
-    '1068',
-    '107,000',
-    '1071',
-    '1074',
-    '1083',
-    '10:10',
-    '10cc',
-    '10cm/4in',
-    '10fl',
-    '10g',
-    '10mg',
-    '10o',
-    '10th.',
-    '11&ndash;6',
     '11,600',
-    '11.0%',
-    '11.05',
-    '11.20pm',
-    '11.21',
-    '11.29',
-    '11.7%',
-    '11/77',
-    '1101.2',
-    '113,000',
-    '1132',
-    '1136',
-    '1157',
-    '116,000',
-    '1163',
-    '117,000',
     '117p',
-    '118,000',
-    '118a',
-    '11:1',
-    '11ins',
-    '12&deg',
-    '12&ndash;19',
-    '12&ndash;8',
-    '12-16',
-    '12-18',
-    '12-month-old',
-    '12.15pm',
-    '12.32',
-    '12.42',
-    '12.43',
-    '12.58',
     '12.5g',
-    '12.5pc',
-    '1200mm',
-    '120ml',
-    '121&ndash;2',
-    '121(1)',
-    '123rd',
-    '1250s',
-    '126,000',
-    '1260s',
-    '126p',
-    '1270s',
-    '12:15',
-    '12:3',
-    '12:30',
-    '12g',
     '12mth',
-    '13&ndash;11',
-    '13(4)',
-    '13,000,000',
-    '13-16',
-    '13.16',
-    '13.2.3',
-    '13.3.2',
-    '13.7.7',
-    '13/0',
-    '130cm',
-    '130myr',
-    '1330s',
-    '135th',
-    '137cm',
-    '1383',
     '1384',
-    '1390s',
-    '1397',
-    '13b',
-    '13kb',
-    '13km',
-    '13lb',
-    '13st',
-    '14&deg;c',
-    '14&ndash;21',
-    '14&ndash;25',
-    '14\'s',
-    '14(b)',
-    '14-0',
-    '14-19',
-    '14.0',
     '14.0%',
-    '14.7.3',
-    '14000',
-    '140mm',
-    '1414/1984',
-    '142p',
-    '1432',
-    '1440s',
-    '1450s',
-    '1452',
-    '1463',
-    '1466',
-    '1474&ndash;75',
-    '14g',
-    '14ins',
-    '15&ndash;13',
     '15&shilling',
-    '15(3)',
-    '15+',
-    '15-3',
-    '15.0%',
-    '15.1%',
-    '15.11',
-    '15.20',
-    '15.21',
-    '150&deg;c',
-    '1500&ndash;1800',
-    '150bhp',
-    '150c/300f/gas',
-    '150yds',
-    '152cm',
-    '155bhp',
     '156&ndash;7',
-    '158p',
-    '16&ft',
-    '16&ndash;24',
-    '16.11',
-    '16.15',
-    '16.30',
-    '16.45',
-    '160c/325f/gas',
-    '160m',
-    '1660&ndash;1800',
-    '16:1',
-    '16cm',
-    '16gb',
-    '16k',
-    '16kb',
     '16lb',
-    '16ths',
-    '17&ndash;15',
-    '17&ndash;24',
-    '17(2)',
-    '17+',
-    '17,000,000',
-    '17-minute',
-    '17.1%',
-    '17.15',
-    '17.45',
-    '17.4p',
-    '17.8%',
-    '17/12/87',
-    '170bhp',
-    '170mb',
     '171&ndash;2',
-    '1756&ndash;63',
-    '17:11',
-    '18&ndash;12',
-    '18&ndash;16',
-    '18&ndash;2',
-    '18(3)',
-    '18.1%',
-    '18.10.93',
-    '18.8%',
-    '180&deg;c/350&deg;f/gas',
-    '1800\'s',
-    '18000',
-    '180000',
-    '180p',
-    '1823&ndash;4',
     '1831&ndash;2',
-    '1839&ndash;40',
-    '184,000',
-    '1840&ndash;1',
-    '1850\'s',
-    '1852&ndash;88',
-    '1871&ndash;2',
-    '1885&ndash;6',
-    '1887&ndash;8',
-    '1895&ndash;6',
-    '18:1',
-    '18th.',
-    '18th/25th',
-    '19(4)',
-    '19(jp)',
-    '19,500',
     '190c/375f',
-    '1924&ndash;25',
-    '1926&ndash;27',
-    '1927&ndash;33',
-    '1935&ndash;6',
-    '1937&ndash;8',
-    '1939&ndash;41',
-    '1941a',
-    '1942&ndash;1945',
-    '1944&mdash;46',
-    '1945&ndash;7',
-    '1946&ndash;7',
-    '1946&ndash;8',
-    '1950-53',
-    '1955&ndash;56',
-    '1960&ndash;70',
     '1964&ndash;5',
-    '1968&ndash;74',
-    '1969&ndash;72',
-    '1971&ndash;2',
-    '1972&ndash;73',
-    '1975&ndash;85',
-    '1975&ndash;9',
-    '1976&ndash;79',
-    '1976&ndash;81',
-    '1976/7',
-    '1976/77',
-    '1977&ndash;89',
-    '1978&ndash;88',
-    '1980&ndash;2',
-    '1980&ndash;85',
-    '1981/2',
     '1982-84',
-    '1982c',
-    '1983-87',
-    '1984&ndash;86',
-    '1984&ndash;87',
-    '1985&ndash;7',
-    '1985&ndash;87',
-    '1985-88',
-    '1985=100',
-    '1986&ndash;9',
-    '1988-90',
-    '1989\'s',
-    '1990&mdash;see',
-    '1990-95',
-    '1990f',
-    '1991&mdash;see',
     '1992&mdash;93',
-    '1996-97',
-    '1997/98',
-    '19pc',
-    '1:14',
-    '1:15',
-    '1:26',
-    '1:500',
-    '1an',
-    '1bn',
-    '1da',
-    '1mw',
-    '1wk',
-    '2&frac12/2&frac12',
-    '2&micro;g/ml',
-    '2&ndash;14',
     '2&ndash;15',
-    '2&ndash;20',
-    '2\'20',
-    '2(6)',
-    '2,000lb',
-    '2,048',
-    '2,100,000',
-    '2,118',
-    '2,140',
-    '2,150',
-    '2,158',
-    '2,25',
-    '2,281.6',
-    '2,4,5-t',
-    '2,650',
-    '2,700,000',
     '2-6-2',
-    '2.000.000.000,00',
-    '2.06',
-    '2.09',
-    '2.1m',
-    '2.2.5',
-    '2.3kb',
-    '2.48',
-    '2.5.4',
-    '2.5gb',
-    '2.6.7',
-    '2.75m',
-    '2.79',
-    '2.8.1',
-    '2.88',
-    '2.8m',
     '2.94',
-    '2.99',
-    '2/',
-    '20&ndash;20',
-    '20&ndash;27',
-    '20&percnt',
-    '20,500',
-    '20-fold',
-    '20.1%',
-    '20.9',
-    '200&deg;c/400&deg;f/gas',
-    '2000\'s',
-    '200bhp',
-    '200c',
-    '200kg',
-    '200pc',
     '200yds',
-    '2017',
-    '202p',
-    '2031',
-    '2055',
-    '206&ndash;217',
-    '2070',
-    '20:1',
-    '21&ndash;19',
-    '21&ndash;20',
-    '21&ndash;28',
-    '21&ndash;7',
-    '21&ndash;8',
-    '21.1%',
-    '21.16',
-    '21.17',
     '21.21',
-    '21.5%',
-    '21.6%',
-    '21/6',
-    '216,000',
-    '21ft',
-    '22.1%',
-    '22.10.93',
-    '22.11',
-    '221151',
-    '2215',
-    '2250',
-    '2253',
-    '22:21',
-    '22a',
-    '22s',
     '23,000,000',
-    '23,400',
-    '23.00',
-    '23.10',
-    '23.20',
-    '23.3%',
-    '23.5%',
-    '2387',
-    '238s',
-    '24&ndash;30',
-    '24.06',
-    '24000',
-    '248,000',
-    '25&mgr;m',
-    '25&ndash;60',
-    '25-year-olds',
     '25.7',
-    '250bhp',
-    '250lb',
-    '258p',
-    '25lb',
-    '25ml',
-    '26.1%',
-    '26.3',
-    '26.7',
-    '26.8%',
-    '26/5/87',
-    '265,000',
-    '26b',
-    '27&ins',
-    '27&ndash;30',
-    '27/09/93',
     '28,500',
-    '28.7%',
-    '280p',
-    '28273-74',
-    '284ml',
-    '2855',
-    '28in.',
-    '29(3)',
-    '29.2',
-    '29.4%',
-    '29.6%',
-    '29.8%',
-    '29a',
-    '2:14',
-    '2:4',
-    '2d6&ins',
     '2g26',
-    '2inch',
-    '2ma',
-    '2oz/50g',
-    '2tr',
-    '3&sol;87',
-    '3(b)',
-    '3,200,000',
-    '3,900',
-    '3-in-1',
-    '3.0%',
-    '3.1.0',
-    '3.15pm',
-    '3.37',
-    '3.39',
-    '3.45pm',
     '3.49',
-    '3.5.0',
-    '3.5.1',
-    '3.6/3.5',
-    '3.66',
-    '3/4in',
-    '30+',
-    '30,000-strong',
-    '30-june',
-    '30-may',
-    '30.6%',
-    '30/11/87',
-    '300-strong',
-    '3010',
-    '305,000',
-    '305th',
     '30k',
-    '31-april',
-    '31-feb.',
-    '31.2%',
-    '31.8',
-    '3131',
-    '31pc',
-    '32.1%',
-    '32.6',
-    '3254',
-    '325p',
-    '329p',
-    '33.1',
-    '33.6',
-    '335,000',
-    '3360',
     '34&ndash;36',
-    '34&ndash;5',
-    '34.3',
-    '348,000',
-    '35&ndash;36',
-    '35&ndash;50',
-    '35&ndash;55',
-    '35.6',
-    '35030',
-    '350b',
-    '350mm',
-    '3555',
-    '35g',
-    '36.1',
-    '36000',
-    '36028',
     '36097',
-    '36169-70',
-    '362p',
-    '36381',
-    '36520',
-    '36531',
-    '36587',
-    '36589',
-    '36602',
-    '36671',
-    '36678',
-    '36722-24',
-    '367337',
-    '36794',
-    '36810',
-    '36843',
     '36885',
-    '36898',
-    '36976',
-    '36983',
-    '36987',
-    '36b',
-    '36s',
-    '37&deg;c/80',
-    '37(1)',
-    '37.6',
-    '37.7',
-    '37019',
-    '37030',
-    '37031-32',
-    '37039',
-    '37044',
     '37050',
-    '37112',
-    '37116',
-    '37119',
-    '37121-22',
-    '37128',
-    '37134',
-    '37187-88',
-    '37198',
-    '37234-35',
-    '37262',
-    '37305',
-    '37310',
-    '37312-13',
-    '37318',
-    '37374',
     '37375',
-    '37382',
-    '37385',
-    '37389',
-    '37392',
-    '37443-44',
-    '37444',
-    '37453',
-    '37458',
-    '37466-67',
-    '37468',
-    '37474',
-    '37482',
-    '37501',
-    '37518',
-    '37521',
     '37529-30',
-    '37544-45',
-    '37546',
-    '375p',
-    '37605',
-    '37610',
-    '37612',
-    '37629',
-    '37644',
-    '37645',
-    '37649',
-    '37669',
-    '37696',
-    '377,000',
-    '37708',
-    '37721',
     '37724',
-    '37763',
-    '37765-66',
-    '37775',
-    '37779',
-    '37781',
-    '37785',
-    '37786',
-    '37790',
-    '37824',
-    '37844',
-    '37904',
-    '37904-05',
-    '37906',
-    '37911',
-    '37916',
     '37921',
-    '37934',
-    '37955',
-    '37965',
-    '37977-78',
-    '37989',
-    '37995',
-    '37p',
-    '37pc',
-    '38&ndash;3',
-    '38&ndash;41',
-    '38&ndash;9',
-    '38.7',
-    '38.7%',
-    '38024',
-    '38081-82',
     '38083',
-    '38092',
-    '38095',
-    '38098',
-    '38127-28',
-    '38144',
-    '38191',
-    '38192',
-    '38198',
-    '38215',
-    '38272',
-    '38273',
-    '38290',
-    '38301',
-    '38321-22',
-    '38323',
     '38339',
-    '38345',
-    '38351',
-    '38385',
-    '38391',
-    '38394',
-    '38409',
-    '38414',
-    '38419',
-    '38420',
-    '38436',
-    '38437',
-    '38444',
-    '38446',
-    '38455',
-    '38517',
     '38550',
-    '38577',
-    '38579-80',
-    '38583',
-    '38587',
-    '38588',
-    '38656',
-    '38657-59',
-    '38658',
-    '38662',
-    '38666',
-    '38669',
-    '38680',
-    '38681',
-    '38683',
-    '38710',
     '38725',
-    '38731',
-    '38739',
-    '38741',
-    '38744',
-    '38758',
-    '38761',
-    '38779',
-    '38800',
-    '38802',
-    '38809',
-    '38821',
-    '38849',
-    '38865',
-    '38866',
-    '38873',
     '38874',
-    '38881',
-    '38894-95',
-    '38896',
-    '38915',
-    '38916',
-    '38930',
-    '38971',
-    '38976',
-    '38980',
-    '38982',
-    '38991',
-    '38ft',
-    '39.',
-    '39.2',
-    '39.6%',
     '39.7',
-    '39019',
-    '39025',
-    '39041',
-    '39066',
-    '39072',
-    '39099',
-    '39103',
-    '39118',
-    '39120',
-    '39133',
-    '39158',
-    '39168',
-    '39kg',
-    '3:5',
-    '3a5',
     '3jz',
-    '3kpc',
-    '3kw',
-    '3ml',
-    '3o',
-    '4&aring',
-    '4&frac12&ins',
-    '4,000-strong',
-    '4,750',
-    '4-4-0',
-    '4-4-2',
-    '4-9',
-    '4.0%',
-    '4.02',
-    '4.05',
-    '4.1.5',
     '4.1pc',
-    '4.33',
-    '4.5(a)',
-    '4.5pc',
-    '4.6.0',
-    '4.6m',
-    '4.7.2',
-    '4.7m',
-    '40&percnt',
-    '40.2',
-    '40.3',
-    '40.5%',
-    '40.8%',
-    '400-500',
-    '400000',
-    '4004',
     '400yds',
-    '408mhz',
-    '40g/1&amp;oz',
-    '40mbps',
-    '40pp',
-    '41(1)',
-    '41.4',
-    '41.5',
-    '41.6',
-    '41.8',
-    '42&ndash;3',
-    '420p',
-    '4247',
-    '42b',
-    '42pc',
-    '43&ndash;4',
     '43.3',
-    '43.4%',
-    '43.6',
-    '43.8',
-    '44(2)',
-    '45.5%',
-    '45.6%',
-    '450&deg;f',
-    '450kg',
-    '45mph',
-    '46&ndash;7',
-    '46.2',
-    '46pc',
-    '47a',
-    '47pc',
-    '48.2%',
     '4820.27',
-    '486-based',
-    '486slc',
-    '486sx/33',
-    '48k',
-    '4913',
-    '49th-minute',
-    '4:14',
-    '4:6',
-    '4afc',
-    '4cm/1&frac12;in',
-    '4g',
-    '4l',
-    '4mt',
-    '4ozs',
-    '4si',
     '4wf',
-    '5&frac14',
-    '5&ndash;18',
-    '5\'-side',
-    '5(5)',
-    '5(a)',
-    '5,000ft',
-    '5-year-olds',
-    '5.24',
-    '5.32',
-    '5.4.5',
-    '5.4p',
-    '5.51',
-    '5.5mm',
-    '5.6.2',
-    '5.7.2',
     '5.7.3',
-    '5.8p',
-    '5.9.1',
-    '5.9.7',
-    '5.9.8',
-    '5.9.9',
-    '5/4',
-    '50&deg;f',
-    '50&ndash;75',
-    '50&ndash;80',
-    '50&percnt',
-    '500&ndash;600',
-    '5000m',
-    '5000rpm',
-    '500mhz',
-    '500x',
     '50405',
-    '5050',
-    '5086',
-    '50cc',
-    '50f',
-    '50kg',
-    '50lb',
-    '50mb',
-    '50mg',
-    '50ml/2fl',
-    '50ngml',
-    '51.1',
-    '51.4',
-    '51.6',
-    '52.2',
-    '520,000',
     '5200',
-    '52ft',
-    '52pc',
-    '53&ndash;4',
-    '53.5',
-    '53p',
-    '54.6',
-    '55&ndash;6',
-    '55+',
-    '55.0',
-    '55.8',
-    '55015',
-    '550m',
-    '5565',
-    '55pc',
-    '56&ndash;7',
     '56.2',
-    '56.9',
-    '560,000',
-    '57&ndash;9',
-    '57.2',
-    '5700',
-    '573p',
-    '57a',
-    '58&ndash;9',
-    '585p',
-    '58b',
-    '59.4',
-    '5:17',
-    '5cm/2in',
-    '5dt',
-    '5e',
     '5mm/&frac14;in',
-    '5o',
-    '5tf',
-    '5x10',
-    '6&ndash;6',
-    '6(8)',
-    '6,100',
-    '6,7',
-    '6.08',
-    '6.1.3',
-    '6.32',
-    '6.40',
-    '6.46',
-    '6.50pm',
-    '6.52',
-    '6.8.3',
     '6.8.5',
-    '60&ndash;63',
-    '601s',
-    '61&ndash;83',
-    '61.4',
-    '61p',
-    '62&ndash;171',
-    '62.1',
-    '62.5mhz',
-    '6200',
-    '6250',
-    '62mhz',
-    '62mph',
-    '63(1)',
-    '63.3%',
-    '63.5',
     '630,000',
-    '635100',
-    '63k',
-    '64(4)',
-    '64c',
-    '64p',
-    '64pc',
-    '65.5',
-    '650mb',
-    '65pc',
-    '66.5',
-    '67p',
-    '68.3',
-    '68360',
-    '6900',
-    '6:12',
     '6:15',
-    '6a/b',
-    '6ba',
-    '6ft.',
-    '6l',
-    '6r4',
-    '6rds',
-    '6ths',
-    '7&ndash;19',
-    '7&ndash;21',
-    '7&ndash;7',
-    '7(a)',
-    '7,000-strong',
-    '7-',
-    '7.0%',
-    '7.1.1',
     '7.28',
-    '7.3(11)',
-    '7.3(12)',
-    '7.43',
-    '7.6.2',
-    '7.6m',
-    '70&deg&ndash;76&deg;f',
-    '70-odd',
-    '700th',
-    '70cl',
-    '70kg',
-    '7100lc',
-    '73,500',
-    '735(1)',
-    '73p',
-    '74.',
     '74.3',
-    '742i',
-    '75&ndash;84',
-    '75ft',
-    '75ma',
-    '76(2)',
-    '76/207',
-    '76/207/eec',
-    '77&ndash;8',
-    '7700',
-    '7760',
-    '78.9%',
-    '78pc',
-    '79pc',
-    '7:7',
-    '7et',
     '8&deg;c',
-    '8&frac12%',
-    '8&frac12&ins',
-    '8&ndash;10pm',
-    '8&ndash;16',
-    '8&ndash;7',
-    '8(c)',
-    '8-6',
-    '8-way',
-    '8.05',
-    '8.2.4',
-    '8.25%',
-    '8.27',
-    '8.4.2',
-    '8.40',
-    '8.5pc',
     '8.7(a)',
-    '8.8(b)',
-    '8.8(c)',
-    '8/10',
-    '80&ndash;100',
-    '80-odd',
-    '800mm',
-    '802.3',
-    '8070',
-    '80km',
-    '81.3',
-    '819',
-    '81p',
-    '82.5',
-    '826-a',
-    '84-204',
     '85+',
-    '85ml/3fl',
-    '86/87',
-    '8611',
-    '88-year-old',
-    '8870',
-    '8891',
-    '8lbs.',
-    '8min',
-    '9&ndash;16',
-    '9&ndash;26',
-    '9,200',
-    '9,700',
-    '9.1.3',
-    '9.2.2',
-    '9.24',
     '9.26',
-    '9.27',
-    '9.48',
-    '9.53',
-    '9.78',
-    '9/30',
-    '90&ft',
-    '90&ndash;91',
-    '90/10',
-    '91-year-old',
-    '916',
-    '91st',
-    '92.9%',
-    '922',
-    '92s',
-    '93.3%',
     '9300',
-    '930304',
-    '9370',
-    '9406',
-    '94b',
-    '94th',
-    '95.3',
-    '95.4',
-    '95lx',
-    '9600',
-    '966',
-    '96mb',
-    '96p',
-    '97.5',
-    '98.5',
-    '99-year-old',
     '99.7%',
-    '998',
-    '9989',
-    '9999',
-    '9ln',
-    '9nb',
-    '9pt',
-    '9yl',
-    '=0.3',
-    '=1',
-    'a&bsol;c',
-    'a&dollar;1,000',
-    'a&flat',
-    'a&iuml;t',
-    'a&sharp',
-    'a+',
     'a-to-z',
-    'a.3',
-    'a.4',
-    'a.82',
-    'a.d.j.g.',
-    'a.d.x.',
-    'a.o.c.',
-    'a.p.e.x.',
-    'a.r.p.',
-    'a/.',
-    'a14',
-    'a173',
-    'a209',
-    'a210',
-    'a215',
-    'a321',
     'a832',
-    'aao',
-    'aaronson',
-    'aarru',
-    'aataaa',
-    'abbacies',
-    'abbes',
-    'abdoujaparov',
-    'abdoul',
-    'aberdonians',
-    'abersoch',
-    'abes',
-    'abhainn',
-    'abisko',
-    'abl',
-    'ablution',
     'abolitionism',
-    'abortifacient',
-    'abovementioned',
-    'abslom',
-    'absolut',
-    'abstractionism',
-    'abu-baker',
-    'abuelito',
-    'accedes',
-    'account-holders',
-    'accoutrement',
-    'accruer',
-    'accusatorial',
-    'acerbically',
-    'acfa',
-    'acharnai',
     'acidulous',
-    'acquaviva',
-    'acro',
-    'active/passive',
-    'aculeata',
-    'ad13/ad15',
-    'ada9x',
-    'adaptions',
-    'addiscombe',
-    'adduction',
-    'adductor',
-    'adhem',
-    'adm',
-    'adml.',
-    'admonishes',
-    'adulteries',
     'advertisment',
-    'advices',
-    'advowsons',
-    'adzic',
-    'aetiologies',
-    'aew',
-    'afer',
-    'affectedly',
-    'affinitive',
-    'afflante',
-    'afo',
-    'africano',
-    'afropithecins',
-    'after_all',
-    'afterguard',
-    'aftersun',
     'agammaglobulinaemia',
-    'agapanthus',
-    'age-long',
-    'aggiornamento',
-    'agh',
-    'aghadowey',
-    'agleam',
-    'agressive',
-    'ah2',
-    'ahab',
-    'ahl',
-    'ahmat',
-    'ai1',
-    'ai3',
-    'ai4',
-    'aids/hiv',
     'air-base',
-    'air-rifle',
-    'airbrushes',
-    'aircraft-carriers',
-    'airside',
-    'aix-les-bains',
-    'ajay',
-    'akagi',
-    'akcyjna',
-    'al-ahmadi',
-    'al-faisal',
-    'al-hithi',
-    'al-hussaini',
-    'al-kadhafi',
-    'al-shara',
-    'al-sharif',
     'alberic',
-    'albigensian',
-    'albinos',
-    'albireo',
-    'albuminuria',
-    'alchester',
-    'alcott',
-    'alderslade',
-    'ale-houses',
-    'aleksandras',
-    'alencon',
-    'alexanderplatz',
-    'alexandro',
-    'alfio',
-    'algardi',
-    'aliphatic',
     'alison-jayne',
-    'alkan',
-    'all-around',
-    'all-cause',
-    'all-nighters',
-    'all-people',
-    'all-seaters',
-    'all-up',
-    'allemandi',
-    'allendale',
-    'allens',
-    'alley-ways',
-    'alliant',
-    'allochthonous',
-    'allround',
-    'alltime',
     'allurement',
-    'allurements',
-    'alpamayo',
-    'alphanumerical',
-    'alphatronix',
-    'alre',
-    'alsh',
-    'altenberg',
-    'altho',
-    'altruistically',
-    'alw',
-    'am/fm',
-    'am586',
-    'ambivalently',
-    'ame',
-    'amerindians',
     'amfortas',
-    'amg',
-    'amini',
-    'amino-aromatic',
-    'aminosalicylates',
-    'amministrazione',
-    'amnestied',
-    'amorously',
-    'amotape',
-    'amphlett',
-    'amphorae',
-    'ampofo',
-    'amro',
-    'amun-re',
-    'amusedly',
-    'anak',
     'anaphylactic',
-    'anaphylaxis',
-    'anastamosis',
-    'anastas',
-    'anastasio',
-    'anatom',
-    'anchoveta',
-    'andalusite',
-    'andrew\'',
-    'androgen',
-    'andromed&aelig',
-    'anglo-japanese',
-    'anglo-scot',
-    'anklet',
-    'anna-marie',
-    'anno_domini',
     'annua',
-    'answerability',
-    'ant-like',
-    'antagonistically',
-    'antecubital',
-    'anther',
-    'anthropomorphically',
-    'anti-biotics',
-    'anti-castro',
-    'anti-climactic',
-    'anti-common',
-    'anti-english',
-    'anti-hbs',
-    'anti-hunting',
-    'anti-malarial',
-    'anti-mining',
     'anti-rb',
-    'anti-slip',
-    'anti-treaty',
-    'antic',
-    'anticholinergic',
-    'anticoagulation',
-    'antiendotoxin',
-    'antimalarials',
-    'antineutrino',
-    'antiphonally',
-    'antiproton',
-    'antisepsis',
-    'antitoxin',
-    'antonymy',
-    'anura',
-    'anyfing',
     'apodeme',
-    'apoprotein',
-    'appearence',
-    'appeaser',
-    'appendectomy',
-    'appends',
-    'applicant(s)',
-    'apportionments',
-    'appy',
-    'apricot-coloured',
-    'aq',
-    'aqua-pak',
-    'aquarists',
-    'aquilinum',
-    'aquitanians',
-    'ar&iacute;stides',
     'arabinoside',
-    'arachnid',
-    'arachnids',
-    'arana',
-    'arandora',
-    'aravinda',
-    'arborough',
-    'arc100',
-    'arc150',
-    'ardente',
-    'ardwick',
-    'arensky',
-    'argolis',
-    'argyrophilic',
-    'ari070a',
-    'arm-chairs',
     'armamentarium',
-    'arminius',
-    'armlock',
-    'arms-for-iraq',
-    'armstrong-jones',
-    'arnheim',
-    'arnoldo',
-    'arns',
-    'arrangements.',
-    'arreau',
-    'arrgh',
-    'arrhythmogenic',
-    'arrogated',
-    'arrow-shaped',
-    'arshad',
-    'art-styles',
     'artemether',
-    'arteriolar',
-    'artform',
-    'arti',
-    'articulative',
-    'articulator',
-    'artillerymen',
-    'artlessness',
-    'as_,_as_far_as',
-    'ascenders',
-    'ascribable',
-    'ashamedly',
-    'ashbery',
-    'ashford-in-the-water',
-    'asiaticus',
-    'asoyan',
     'aspasia',
-    'aspendos',
-    'asphyxiating',
-    'asr',
-    'assen',
-    'assessingly',
-    'assn',
-    'associationist',
-    'assuredness',
-    'asthenospheric',
-    'asynchrony',
-    'at.',
-    'ataie',
-    'athanassios',
-    'atherogenic',
-    'attenuates',
     'attridge',
-    'attwooll',
-    'audebert',
-    'auffenberg',
-    'aug/sept',
-    'auras',
-    'ausfahrt',
-    'auspiciously',
-    'autarkic',
-    'auteurs',
-    'auto-suggestion',
-    'autoregulation',
-    'autoregulatory',
-    'avai-bamhi',
-    'avellana',
-    'avez',
     'avich',
-    'aww',
-    'axcell',
-    'axiomatically',
-    'ayot',
-    'az-1',
-    'azana',
-    'azariah',
-    'b&eacute;ziers',
-    'b&ucirc;cherons',
-    'b+',
-    'b-70',
-    'b.a.a.',
-    'b.c.c.',
-    'b.c.r.s.',
-    'b.eds',
     'b.t-h',
-    'b/2',
-    'b/hlh/z',
-    'b/s/wc',
-    'b25',
-    'b52',
-    'baby-sitters',
-    'backfist',
-    'backgrounder',
-    'backspin',
-    'badging',
-    'badhan',
-    'baggot',
-    'bagladies',
-    'baglioni',
-    'bagshaws',
     'baguio',
-    'baha\'i',
-    'bahdon',
-    'bailees',
-    'baily',
-    'baklanov',
-    'bakut',
-    'balakirev',
-    'baldacchino',
-    'baldo',
-    'baldvin',
-    'ball-to-target',
-    'baller',
-    'ballon',
-    'baltasar',
-    'bambina',
     'bandera',
-    'bandolier',
-    'bandwaggon',
-    'banharn',
-    'bank-notes',
-    'bank-sponsored',
-    'bankability',
-    'banzer',
-    'bapc',
-    'bar/restaurant',
-    'barathea',
-    'barbecuing',
-    'barbless',
-    'barbules',
-    'bare-arsed',
-    'barer',
     'barkham',
-    'barkingside',
-    'barnacled',
-    'barrier-free',
-    'barwise-munro',
-    'baryons',
-    'baseplate',
-    'basest',
-    'bashari',
-    'basia',
-    'bassets',
-    'baston',
-    'bath/basin',
-    'bathwick',
-    'batsmanship',
-    'battered-looking',
     'battys',
-    'bauchi',
-    'baydale',
-    'bayesian',
-    'bbc/pictures',
-    'bcecf',
-    'bdcs',
-    'bde.',
-    'bdxprogression/4',
-    'beatillo',
-    'beaumont-sur-vesle',
-    'becke',
-    'becki',
-    'beckinsale',
-    'bed-clothes',
-    'bed-making',
     'bedes',
-    'bedrijfsvereniging',
-    'bedsides',
-    'bedyngham',
-    'bee-eaters',
-    'beel',
-    'beeped',
-    'begbie',
-    'beguilingly',
-    'behaviors',
-    'behring',
-    'belayed',
-    'beleives',
-    'belgioioso',
-    'belled',
-    'belligerency',
     'bellringers',
-    'belly-button',
-    'bellyache',
-    'belo',
-    'below-stairs',
-    'bendable',
-    'beneficently',
-    'benegas',
-    'benewick',
-    'benskins',
-    'benthamites',
-    'bentine',
-    'beornhaeth',
-    'berecz',
-    'berg&egrave;res-les-vertus',
-    'berghe',
     'berghs',
-    'berghuis',
-    'beribboned',
-    'bermudez',
-    'bertelson',
-    'berthon',
-    'beshir',
-    'bestuur',
-    'bete',
-    'betimes',
-    'better-class',
-    'better-funded',
-    'bevercotes',
-    'beyers',
-    'bezier',
-    'bezpecnost',
     'bf109e',
-    'bgb',
-    'bi-centenary',
-    'bi-law',
-    'bi-laws',
-    'bibulous',
-    'bides',
-    'biflorus',
-    'big-hitting',
-    'big-wigs',
-    'billancourt',
-    'billetors',
-    'billhook',
-    'billinge',
-    'billionth',
-    'binkworthy',
     'bioceramic',
-    'bioclasts',
-    'biopolymers',
-    'biotin',
-    'bird-table',
-    'birefringence',
-    'birthtales',
-    'bisus',
-    'bit-perfect',
-    'bit-planes',
-    'biters',
-    'bivouacked',
-    'bizonal',
-    'bl21',
-    'black-clothed',
-    'black-coated',
     'black-scholes',
-    'blackball',
-    'blacklands',
-    'blacklisting',
-    'bladerunner',
-    'blagoje',
-    'blakeys',
-    'blamelessly',
-    'blankety',
-    'blast-furnaces',
-    'blaxploitation',
-    'blazingly',
-    'bleepers',
-    'blench',
-    'blitzer',
-    'blixa',
     'blockhouse',
-    'blooding',
-    'bloodthirstiness',
-    'bloos',
-    'blown-out',
-    'bluelight',
-    'bluestocking',
-    'bluish-grey',
-    'blumstein',
-    'bmrc',
-    'bn3',
-    'bnh',
-    'boaventura',
-    'bodach',
-    'bodmer',
-    'bodysuit',
     'boegner',
-    'boggled',
-    'bogland',
-    'boleslav',
-    'bolly',
-    'bomb-damaged',
-    'bomont',
-    'bonapartes',
-    'bondager',
-    'bone-handled',
-    'boneyard',
-    'bonniest',
-    'booby-traps',
-    'boogard',
-    'boogieing',
-    'book-keepers',
     'bookroom',
-    'boolell',
-    'boomgate',
-    'boozed',
-    'borraichill',
-    'bos/tp',
-    'bosnasarayi',
-    'bottom-line',
-    'bouge',
-    'bourdelle',
-    'bourg-en-bresse',
-    'bourrus',
-    'bowerbird',
-    'bowerbirds',
-    'bowl-like',
-    'boxcars',
     'boy/girl',
-    'boyling',
-    'boynes',
-    'bozinovic',
-    'bpb',
-    'bpxpress',
-    'bra&scedil;ov',
-    'brainiest',
-    'brangwyn',
-    'braques',
-    'brassed',
-    'brasswork',
-    'brays',
-    'breathily',
-    'breaux',
-    'brecciated',
     'bredbury',
-    'brenig',
-    'briarty',
-    'bridewealth',
-    'bridlepaths',
-    'brigadiers',
-    'brihtnoth',
-    'brik',
-    'brillat-savarin',
-    'bringers',
-    'brioches',
-    'british-run',
-    'brockhampton',
-    'brocklesby',
-    'brockton',
-    'broiled',
     'broilers',
-    'bromeliad',
-    'bromfield',
-    'bronchoscope',
-    'bronchospasm',
-    'broodmare',
-    'brookie',
-    'brooks-baker',
-    'broomham',
-    'broths',
-    'brown/scotland',
-    'brownish-grey',
-    'brownsville',
-    'broxtowe',
-    'broz',
-    'brtt',
     'bruford',
-    'bruneau',
-    'bruvvers',
-    'bts',
-    'bubbies',
-    'buchner',
-    'bucketfuls',
-    'bucknell',
-    'bucko',
-    'buckyball',
-    'buckyballs',
-    'budget-holders',
-    'building-society',
-    'bulgakov',
-    'bulkiness',
-    'bull-headed',
     'bull-necked',
-    'bullbaiting',
-    'bullfrogs',
-    'bully-boys',
-    'bunds',
-    'bungles',
-    'bunney',
-    'bupivacaine',
-    'burdock',
-    'bureaucratised',
-    'burgage',
-    'burgeons',
-    'burgreen',
-    'burhs',
-    'burmeister',
-    'burrill',
     'burrowes',
-    'burrows/thames',
-    'burstwick',
-    'burtness',
-    'bus-stops',
-    'business-orientated',
-    'butadiene',
-    'butanol',
-    'butterface',
-    'button-through',
-    'buxted',
-    'buyer.',
-    'buzzsaw',
-    'buzzy',
-    'byelarussian',
-    'bypassable',
     'c&eacute;ret',
-    'c(1)',
-    'c(2)',
-    'c-4',
-    'c-47tp',
-    'c-banded',
-    'c-ki-ras',
-    'c.2',
-    'c.5',
-    'c.c.d.',
-    'c.c.p.r.',
-    'c.p.s.',
-    'c/d',
-    'c/w',
-    'c16',
-    'c170',
     'c18:0',
-    'c3-6',
-    'c33c',
-    'c57bl/6',
-    'c=3',
-    'ca125',
-    'ca1985',
-    'cack-handed',
-    'cacoethes',
-    'caecilians',
-    'caernarvonshire',
-    'caerwent',
-    'caesareans',
-    'caffe',
-    'cainer',
-    'caiques',
     'cairene',
-    'cakewalk',
-    'calcium-mobilizing',
-    'calcium-rich',
-    'calculatingly',
-    'calladine',
-    'callenbach',
-    'calligraphers',
-    'calorimetric',
-    'calouste',
-    'calzolari',
-    'cambex',
-    'cambium',
-    'cambs.',
-    'cami-knickers',
-    'camisards',
     'campbell-bannerman',
-    'canale',
-    'candia',
-    'candidacies',
-    'caneel',
-    'cannellini',
-    'cannon-ball',
-    'cannon-balls',
-    'cannulas',
-    'cantiana',
-    'capetown',
-    'capons',
-    'capstans',
-    'car-parts',
-    'caravanners',
-    'carboxylic',
     'cardale',
-    'carisbrook',
-    'carl-uwe',
-    'carnally',
-    'carntyne',
-    'carouse',
-    'carpinte',
-    'carpoids',
-    'carradale',
-    'carrants',
-    'carried-out',
-    'carrs',
-    'carry-forward',
-    'cart-horses',
-    'cartwheeling',
-    'case-histories',
     'cassiobury',
-    'castelfranco',
-    'castle-like',
-    'casuarinas',
-    'casus',
-    'cataphoric',
-    'catched',
-    'cathedral-like',
-    'cattabianchi',
-    'cattlemen',
-    'caurroy',
-    'causatives',
-    'cause(s)',
-    'cavales',
-    'cavalleria',
-    'cawthra',
     'cazade',
-    'cbe.',
-    'cc2',
-    'ccta',
-    'cd-quality',
-    'cdm7',
-    'cehave',
-    'cela',
-    'celled',
-    'cells/crypt/hour',
-    'cells/ml',
-    'cemaes',
-    'cementitious',
-    'cemmaes',
-    'censoriously',
-    'centenarian',
     'centimes',
-    'centreboard',
-    'centric',
-    'cereal-growing',
-    'cerebrum',
-    'cert.',
-    'cesen',
-    'cespitosa',
-    'cessford',
-    'cg(at)',
-    'cg(tg)',
-    'cgo',
-    'cgta',
-    'ch&acirc;tellerault',
-    'ch\'ship',
-    'ch.1',
     'ch.7',
-    'ch2',
-    'challengeable',
-    'chamberlayne',
-    'chantrell',
-    'chapanis',
-    'chapel-en-le-frith',
-    'chaperons',
-    'chapmen',
-    'charlottesville',
-    'charnov',
-    'charsley',
-    'charta',
-    'chartbusters',
-    'chasy',
-    'chauffeuring',
     'cheaters',
-    'chebrikov',
-    'check-ins',
-    'checketts',
-    'chedburgh',
-    'chedli',
-    'cheedale',
-    'cheekiest',
-    'cheeping',
-    'cheeriest',
-    'cheever',
-    'chemins',
-    'chena',
-    'cherchez',
-    'chesmore',
-    'chessell',
     'chest-deep',
-    'chest-of-drawers',
-    'cheuk',
-    'chevaline',
-    'chevannes',
-    'chi-squared',
-    'chiasma',
-    'chignons',
-    'chila',
-    'child-pugh',
-    'child-sized',
-    'child-woman',
-    'child-years',
-    'childbed',
-    'childer',
-    'childerley',
     'childproof',
-    'chilworth',
-    'chimica',
-    'chinchillas',
-    'chinensis',
-    'chipmakers',
-    'chiropodists',
-    'chivalrously',
-    'chloroform:methanol',
-    'chocolate-box',
-    'chokers',
-    'chokingly',
-    'cholecystography',
-    'cholecystoscope',
-    'choler',
-    'cholic',
     'chook',
-    'chorleton',
-    'choudhari',
-    'choummali',
-    'choupette',
-    'christ-like',
-    'christocentric',
-    'chromium-51',
-    'chrysalises',
-    'chul',
-    'chummily',
-    'churlishly',
-    'cicb',
-    'cics/2',
-    'cii-honeywell',
-    'cimah',
     'cinemagoers',
-    'cinemicroscopy',
-    'circuitously',
-    'circumvention',
-    'cit.',
-    'citrinellum',
-    'civilian-military',
-    'civitavecchia',
-    'clamours',
-    'clangour',
-    'clanranald',
-    'clar.',
-    'claretian',
-    'class-differentiated',
-    'classifications-are',
-    'clay-rich',
     'claybrook',
-    'cld',
-    'clean-ups',
-    'clearway',
-    'cleated',
-    'cleckheaton',
-    'clerecia',
-    'client-centred',
-    'cliff-hangers',
-    'cliff-like',
-    'clinical-epidemiological',
-    'clinton-gore',
-    'clissold',
-    'clock-rate',
-    'cloth-capped',
-    'clunky',
     'clv',
-    'cnaps/64',
-    'cnidarians',
-    'co&ndash;operation',
-    'co-conspirator',
-    'co-evolution',
-    'co-habitation',
-    'co-heir',
-    'co-manage',
-    'co-manager',
-    'co-partner',
-    'co-principality',
-    'co-secretary',
-    'co-trimoxazole',
-    'co-trustees',
-    'coachmakers',
     'coal-based',
-    'coalhouse',
-    'coarsening',
-    'coate',
-    'coauthor',
-    'cobalt-bleomycin',
-    'cobb-douglas',
-    'cockburnspath',
-    'cockeyed',
-    'cockrill',
-    'code-characteristic',
-    'codebreakers',
-    'codpieces',
-    'coello',
-    'coeval',
-    'coffee/tea',
     'coffin-making',
-    'coffined',
-    'coggins',
-    'cognates',
-    'cognitivism',
-    'cognito',
-    'cogwy',
-    'cohabitants',
-    'coheres',
-    'cohesively',
-    'coil-helix',
-    'coldweld',
-    'cole-hamilton',
-    'cole-king',
-    'coleford/gloucestershire',
-    'collacott',
     'collaged',
-    'collators',
-    'collimator',
-    'collisional',
-    'colls',
-    'colmcille',
-    'colodense',
-    'colonially',
-    'colonist',
-    'colonocytes',
-    'colorectum',
-    'colossally',
-    'colours.',
-    'coltsfoot',
-    'comberton',
-    'combwich',
     'comerbourne',
-    'comex',
-    'commanders-in-chief',
-    'commensals',
-    'commentated',
-    'commoditisation',
-    'commodus',
-    'commonable',
-    'communicational',
-    'communist-controlled',
-    'communist-ruled',
-    'comp.',
-    'compactors',
-    'compendiously',
-    'complet',
-    'complexation',
     'complexing',
-    'complexioned',
-    'comprehensivisation',
-    'compressible',
-    'compromisers',
-    'compsoft',
-    'computor',
-    'comstive',
-    'con-men',
-    'conative',
-    'conceptualism',
-    'conceptus',
-    'concern.',
-    'conclusiveness',
-    'concupiscence',
-    'condictio',
     'condonation',
-    'condoriri',
-    'conferees',
-    'confirmable',
-    'conglomerations',
-    'congrats',
-    'conjuration',
-    'connahs',
-    'connectionism',
-    'connollys',
-    'connor-g&oacute;mez',
-    'connotative',
-    'conrod',
-    'cons-boutboul',
-    'consensually',
-    'conservative-minded',
     'consolidator',
-    'conspicuity',
-    'containerization',
-    'context-bound',
-    'controll',
-    'conveniens',
-    'copp&eacute;lia',
-    'coprocessors',
-    'copyable',
-    'copyrighted',
-    'corallites',
-    'cording',
-    'cordingley',
-    'core-periphery',
-    'coriacea',
-    'coring',
     'cornershop',
-    'cornetti',
-    'corporatists',
-    'corporators',
-    'corpulence',
-    'correr',
-    'cortices',
-    'coruh',
-    'cosies',
-    'cosroe',
-    'cossey',
-    'cost-efficiency',
-    'costive',
-    'costumiers',
-    'cosworths',
-    'cott',
     'cottbus',
-    'cotterdale',
-    'cotton/lycra',
-    'cotyledonary',
-    'counter-',
-    'counter-indemnity',
-    'counter-melody',
-    'counter-movement',
-    'counter-notice',
-    'counter-offers',
-    'counterposition',
-    'countervision',
-    'country-specific',
-    'countywide',
-    'covenantal',
-    'covenantors',
     'coverage.',
-    'covill',
-    'cow-parsley',
-    'cowabunga',
-    'cowhide',
-    'cowies',
-    'cowman',
-    'cowpea',
-    'coxites',
-    'cpki',
-    'cr&ecirc;chendo',
-    'cr&egrave;me_de_menthe',
-    'craigy',
-    'cranage',
-    'crankiness',
-    'cratchley',
     'creamier',
-    'created-by',
-    'credit-worthy',
-    'credito',
-    'creese',
-    'crenata',
-    'cresset',
-    'crex',
-    'criminogenic',
-    'cripplingly',
-    'cristatus',
-    'cristofori-silbermann',
-    'critically-ill',
-    'crmf',
-    'croaky',
-    'croall',
     'croatia-slavonia',
-    'cronyism',
-    'croplands',
-    'cropley',
-    'cross-beams',
-    'cross-breed',
-    'cross-grained',
-    'cross-shot',
-    'cross-street',
-    'cross-tabulated',
-    'cross-vein',
-    'crosshouse',
-    'crow-like',
-    'croxton',
-    'crp-1',
-    'crp-camp',
     'crts',
-    'cruddas',
-    'cruikshanks',
-    'crummackdale',
-    'crumps',
-    'crumpton',
-    'crushable',
-    'cryptosporidia',
-    'cs+',
-    'ct.',
-    'cti',
-    'ctrl/j',
-    'ctvm',
-    'cu-ni',
-    'cubitus',
-    'cuboids',
     'cudworth',
-    'cuis',
-    'culdub',
-    'culls',
-    'cullybackey',
-    'culpitt',
-    'cultins',
-    'cuppas',
-    'curatorship',
-    'curbside',
-    'curtainless',
-    'curtice',
-    'curtseys',
-    'cusa',
-    'cutest',
-    'cutex',
     'cv1',
-    'cvrs',
-    'cyanotic',
-    'cyanotype',
-    'cycleways',
-    'cynosure',
-    'cytoprotective',
-    'd&eacute;marche',
-    'd&eacute;mocratiques',
-    'd\'alembert',
-    'd\'amato',
-    'd\'argy',
-    'd\'artagnan',
-    'd\'aubert',
-    'd\'ewes',
-    'd\'harnoncourt',
     'd\'india',
-    'd\'orchestre',
-    'd\'outre-mer',
-    'd\'souza',
-    'd*note',
-    'd-to-a',
-    'd.sc.',
-    'd=4',
-    'dachas',
-    'dagbladet',
-    'dagens',
-    'dagobert',
-    'dahlerus',
-    'daill',
-    'dailly',
-    'daleswoman',
     'dalya',
-    'damages.',
-    'damascened',
-    'damems',
-    'damh',
-    'dance-hall',
-    'dangly',
-    'danilo',
-    'dar-es-salaam',
-    'darc',
-    'darcey',
-    'darli',
-    'dashiell',
-    'daube',
-    'daumas',
-    'dav&iacute;d',
     'davidic',
-    'day-out',
-    'day-trips',
-    'dayrut',
-    'daytimes',
-    'db/expo',
-    'dbtg',
-    'de-stalinization',
-    'de_trop',
-    'deadhead',
-    'deaminase',
-    'debacles',
-    'decelerations',
-    'decisis',
-    'declassification',
-    'declivities',
     'declivity',
-    'decompensated',
-    'deconjugation',
-    'decreasingly',
-    'deduru-oya',
-    'deeson',
-    'defamations',
-    'defecations',
-    'defectives',
-    'defibrillators',
-    'defoliated',
-    'defrayed',
-    'degel',
-    'degreasing',
-    'deigning',
-    'deinstalled',
     'deisenhofen',
-    'deists',
-    'delaval',
-    'deliciousness',
-    'delitti',
-    'demerged',
-    'demetriades',
-    'demi-gods',
-    'demonization',
-    'demuth',
-    'demyelination',
-    'demyonov',
-    'densign',
-    'densitometric',
-    'denuclearisation',
-    'denunciatory',
     'depersonalised',
-    'depopulate',
-    'depressor',
-    'depts',
-    'deput&eacute',
-    'derivatively',
-    'dernley',
-    'derridean',
-    'dertliev',
-    'dervaird',
-    'descaler',
-    'deschner',
-    'describer',
-    'descried',
-    'deseret',
-    'designator',
     'desirably',
-    'deskpro',
-    'deskpro/m',
-    'desloughing',
-    'destabilizes',
-    'destrier',
-    'detachedly',
-    'detectability',
-    'dethrone',
-    'detoxified',
-    'deuterostomes',
-    'developments.',
-    'devis',
-    'dewaxed',
-    'dewed',
-    'dewhirst',
     'dexel',
-    'dexter/author',
-    'dfdr',
-    'dgxi',
-    'dhss/sbc',
-    'di-grams',
-    'di5',
-    'dibben',
-    'dibrugarh',
-    'didcot/oxfordshire',
-    'diddly',
-    'didn\'t.',
-    'diez',
-    'diff-locks',
-    'differentness',
-    'diffusely',
     'diffusers',
-    'digesters',
-    'diggorys',
-    'dighton',
-    'dijkstra',
-    'dilatometer',
-    'dillard',
-    'dimarzios',
-    'dimensioning',
-    'dimerisation',
-    'dimethylsulphate-piperidine',
-    'dimitrios',
-    'dimittis',
-    'dinan',
-    'dinner-jacketed',
-    'dis-benefits',
     'disadvantageously',
-    'disaffiliate',
-    'disafforestments',
-    'disarms',
-    'disbenefit',
-    'discontentment',
-    'discourse-deictic',
-    'diseases.',
-    'disembowel',
-    'disendowment',
-    'disfavoured',
-    'disfiguration',
-    'dishonourably',
-    'disintegrative',
-    'disp',
-    'disproportionally',
     'disproves',
-    'disputations',
-    'disrespectfully',
-    'disrupter',
-    'disruptiveness',
-    'distel',
-    'distensibility',
-    'distorter',
-    'distrained',
-    'diuresis',
-    'div1',
-    'diversely',
-    'divertimenti',
-    'dlc',
-    'dm100',
-    'dm100,000',
     'dm2.37',
-    'dm2.40',
-    'dm2.79',
-    'dm2.83',
-    'dm2.94',
-    'dmb&amp;b',
-    'dna-pk-mediated',
-    'doable',
-    'dockbuild',
-    'doctor/patient',
-    'documentarist',
-    'doddington',
-    'dodos',
-    'dog-fights',
-    'dog-handlers',
-    'dogger',
     'doguzhiyev',
-    'dollington',
-    'dollond',
-    'dolmetta',
-    'dolphin-friendly',
-    'dolwyn',
-    'dominical',
-    'donelly',
-    'donlan',
-    'dooney',
-    'door-knockers',
-    'doorkeepers',
-    'doornail',
-    'dori',
-    'dos/windows',
-    'dosfax',
     'dosser',
-    'double-flowered',
-    'doubled-up',
-    'dougall',
-    'doughty-wylie',
-    'dowagers',
-    'downregulated',
-    'downs/hereford',
-    'downsized',
-    'dowsett',
-    'doxographic',
-    'doxy',
-    'dpx',
-    'dragonby',
-    'draize',
-    'dramatises',
     'draperstown',
-    'dravograd',
-    'draw-strings',
-    'drawbar',
-    'drawcords',
-    'drawing/painting',
-    'drawstrings',
-    'drewsteignton',
-    'dribbler',
-    'drift-netted',
-    'drink/driving',
-    'drivetrain',
-    'dronne',
-    'droxford',
-    'drtf1',
-    'drug-like',
     'dsps',
-    'dsr',
-    'dtk',
-    'dual-simplex',
-    'ducas',
-    'ducklington',
-    'ductwork',
-    'duetting',
-    'duisberg',
-    'dulcibene',
-    'dunes.',
-    'dungaree',
-    'dungheap',
-    'dunnerdale',
-    'dunno.',
-    'dunsire',
     'duple',
-    'durand-ruel',
-    'dust-laden',
-    'dustcarts',
-    'dustjackets',
-    'dutiable',
-    'duvalierists',
-    'dvu',
-    'dw.',
-    'dw1.2',
-    'dwelling-places',
-    'dyet',
-    'dymock',
-    'dynamization',
-    'dynastically',
-    'dyspraxia',
     'dzhungars',
-    'e\'en',
-    'e-r',
-    'e.m.f',
-    'e.p.s.p',
-    'e40',
-    'eanflaed',
-    'ear-plugs',
-    'earby',
-    'eastender',
-    'eastern-bloc',
-    'eastwick',
-    'easy-to-enter',
-    'easy-to-understand',
-    'eay',
-    'eberle',
     'ec-funded',
-    'ec-listed',
-    'ec1m',
-    'ec4a',
-    'ecgric',
-    'echidna',
-    'echinoids',
-    'eco-tourism',
-    'economique',
-    'ectothermic',
-    'ecwp',
-    'eddi',
-    'edenvale',
-    'edgecombe',
-    'edgell',
-    'edginton',
     'edinburgh-resident',
-    'edinburgh/glasgow',
-    'edns.',
-    'edomites',
-    'eds.',
-    'edutainment',
-    'ee.cli',
-    'eef',
-    'eeg/eog',
-    'eet',
-    'eevin',
-    'ef1&bgr',
-    'effleurage',
-    'effulgent',
-    'efr',
-    'egelstedt',
     'ego-functions',
-    'egoists',
-    'egotists',
-    'egp',
-    'eidetiking',
-    'eigh-teenth',
-    'eight-fifteen',
-    'eight-petalled',
-    'eight-seater',
-    'eighteen-month',
-    'eith',
-    'ejections',
-    'el4',
-    'el98',
-    'elca',
-    'election-related',
     'electro-convulsive',
-    'electro-weak',
-    'electroencephalograms',
-    'electrogenic',
-    'electrolyte-saturated',
-    'electronegativity',
-    'elice',
-    'eliel',
-    'elkin',
-    'ellicott',
-    'elmley',
-    'elo',
-    'elsdon',
-    'elsey',
-    'elskede',
-    'elsker',
     'elucidatory',
-    'elvington',
-    'elxsi',
-    'elytra',
-    'embarassment',
-    'embassage',
-    'embroidery/stitch',
-    'emeka',
-    'emersion',
-    'emmae',
-    'emmitt',
-    'empathizing',
-    'employee-owned',
-    'employer.',
-    'en2',
-    'enangar',
     'encamp',
-    'encodings',
-    'encrustations',
-    'endodermal',
-    'endogamous',
-    'endomembranes',
-    'endoprostheses',
-    'endued',
-    'enduringly',
-    'energy-loss',
-    'enervated',
-    'engine-drivers',
-    'enkalon',
-    'enkephalin',
-    'enkephalins',
-    'enlightens',
     'enroll',
-    'enter&mdash;complete&mdash;root&mdash;package',
-    'enterprisingly',
-    'entropically',
-    'enzymatically',
-    'enzyme-linked',
-    'eostation',
-    'epas',
-    'ephemerality',
-    'epi',
-    'epical',
-    'epididymis',
-    'epidurals',
-    'epileptics',
-    'epiphenomenon',
-    'equipotentials',
     'ercol',
-    'erens',
-    'ergonomists',
-    'erh',
-    'erlach',
-    'erma',
-    'errors/',
-    'esiplan',
-    'eskenazi',
-    'esophagus',
-    'espina',
-    'esselte',
-    'estaminet',
-    'estrelita',
-    'etherington-smith',
-    'ethnic-linguistic',
     'ethnicities',
-    'ethnographies',
-    'ethnologists',
-    'etiolated',
-    'ettle',
-    'etyang',
-    'eugenist',
-    'eulalia',
-    'euphausiids',
-    'euphonious',
-    'euro-disney',
-    'europeanwide',
-    'europewide',
-    'europress',
-    'euros',
-    'eustorgio',
     'euzkadi',
-    'evaluable',
-    'evapotranspiration',
-    'even-sized',
-    'ever-moving',
-    'ewers',
-    'ex-husbands',
-    'ex-lord',
-    'ex-marine',
-    'ex-naval',
-    'ex-nurse',
-    'ex-policemen',
-    'ex-tory',
-    'ex.1',
-    'exarchate',
-    'exceed/nt',
     'excepcionales',
-    'excerpted',
-    'exciseman',
-    'exercise-induced',
-    'exfoliator',
-    'exhausted-looking',
-    'exhaustingly',
-    'existed.',
-    'exosphere',
-    'expansionists',
-    'expatiate',
-    'expedience',
-    'expiated',
-    'exploitations',
-    'expos&eacute;s',
-    'extortions',
     'extra-discursive',
-    'extra-trade',
-    'extracode',
-    'extragastric',
-    'extralegal',
-    'extrasensory',
-    'extremum',
-    'eyad&eacute;ma',
-    'eying',
-    'eynon/gloucestershire',
-    'eyries',
-    'f&eacute',
-    'f&uuml;rst',
-    'f.c.c.',
-    'f.i.a.',
-    'f/2.8',
     'f1a',
-    'f7a',
-    'f7a+',
-    'f8a',
-    'fabbo',
-    'fabii',
-    'factory-fitted',
-    'fadlallah',
-    'faeroes',
-    'faille',
-    'fairing',
-    'fakir',
-    'faller',
-    'falsifiers',
-    'familes',
-    'familism',
     'family-centred',
-    'fanciulla',
-    'fank',
-    'faqih',
-    'far-out',
-    'far-ranging',
-    'faragher',
-    'farmhand',
-    'fascista',
-    'faserver',
-    'fat**',
-    'fat***',
-    'father-to-be',
-    'faussone',
-    'favourableness',
-    'fawn-coloured',
     'fax/modem',
-    'fayres',
-    'fc/open',
-    'fco',
-    'fdgb',
-    'february-april',
-    'fed.',
-    'fedv',
-    'felicitations',
-    'felids',
-    'felloes',
-    'fellow-workers',
-    'fenestratum',
-    'fenney',
-    'fernandez-kelly',
-    'ferocious-looking',
     'ferruginous',
-    'festal',
-    'festival-goers',
-    'fetchingly',
-    'fetlock',
-    'fettling',
-    'feuer',
-    'ffb',
-    'ffr1',
-    'ffr300',
-    'ffrr',
-    'fgra',
-    'fhearchair',
-    'fibreboards',
-    'fibrepile',
-    'fibrosa',
     'fictionalized',
-    'fictionally',
-    'field-upgradable',
-    'fieldworking',
-    'fifoot',
-    'fifty-',
-    'fifty-fifth',
-    'fifty-sixth',
-    'fig.1.5',
-    'filaroides',
-    'film-set',
-    'filmstar',
-    'fin_de_siecle',
-    'final-round',
-    'finalisation',
-    'finan',
     'finer-grained',
-    'finger-printed',
-    'finned',
-    'fire-eaters',
-    'fire-extinguishers',
-    'firme',
-    'first-aiders',
-    'first-world',
-    'fish-scale',
-    'fishbird',
-    'fishkill',
-    'fitzlewis',
-    'fitzwalter',
-    'five-game',
-    'five-iron',
-    'fivemiletown',
     'fivesome',
-    'fix-it',
-    'fk506',
-    'flagellae',
-    'flame-coloured',
-    'flame-polished',
-    'flame-red',
-    'flamethrower',
-    'flashier',
-    'fletcher-campbell',
-    'flintcomb-ash',
-    'floatation',
-    'flood-waters',
-    'floor-boards',
-    'floozy',
-    'flophouse',
     'floud',
-    'floutings',
-    'flow-through',
-    'flower-decked',
-    'flower-sellers',
-    'fluidics',
-    'fluidly',
-    'fluky',
-    'flummery',
-    'flyable',
-    'flyblown',
-    'fm21',
-    'focusview',
-    'foecke',
-    'fogeys',
-    'fois',
     'folan',
-    'folk-dance',
-    'folkeparti',
-    'folklorists',
-    'folksongs',
-    'fontenay',
-    'fontenot',
-    'food-stuffs',
-    'foot-loose',
-    'foot-tapping',
-    'footbed',
-    'forbartha',
-    'ford-kenya',
-    'foreseeably',
-    'fortensky',
-    'fortran8x',
     'fortysomething',
-    'fossilisation',
-    'fotheringhay',
-    'fouad',
-    'foulard',
-    'foundationalists',
-    'four-game',
-    'four-petalled',
-    'four-to',
-    'fourviere',
-    'foxing',
-    'fpl',
-    'fractionations',
-    'fragmental',
-    'fragrans',
-    'franchisors',
     'francis-francis',
-    'franco-african',
-    'franco-italian',
-    'fraunhofer',
-    'freckly',
-    'free-fighting',
-    'free-kicks',
-    'freehouse',
-    'freeport-mcmoran',
-    'freeze/thaw',
-    'freising',
-    'french-speakers',
-    'frend',
-    'frequenter',
-    'frescobaldi',
-    'fresh-cooked',
     'freshfields',
-    'fressingfield',
-    'fretbuzz',
-    'fretwire',
-    'friability',
-    'frideswide',
-    'frigeridus',
-    'frissons',
-    'frit',
-    'fritillaries',
-    'froggies',
-    'fronded',
-    'frons',
-    'frontality',
-    'frontbencher',
-    'frontdoor',
     'frontists',
-    'frontrunners',
-    'froom',
-    'frossard',
-    'frost-resistant',
-    'frowningly',
-    'frs.',
-    'fru&scaron;ka',
-    'frypan',
-    'frys',
-    'fudah',
-    'fueros',
-    'fugato',
-    'fuji-xerox',
-    'fukui',
-    'full-body',
     'full-breasted',
-    'fulminate',
-    'fulminations',
-    'fulro',
-    'fulwood',
-    'fundings',
-    'funny-looking',
-    'furmston',
-    'furniture-maker',
-    'fuseway',
-    'fusi',
-    'futuroscope',
-    'fv37h',
-    'fx-1050',
-    'g(n)',
-    'g-banded',
     'g-loc',
-    'g-men',
-    'g-proteins',
-    'g-t',
-    'gabiadini',
-    'gachot',
-    'gadding',
-    'gadroons',
-    'gadwall',
-    'gainsboroughs',
-    'gainsbourg',
-    'gairlochy',
-    'galenic',
-    'gallerists',
-    'gallotta',
-    'gamage',
     'gammacamera',
-    'gandhian',
-    'ganem',
-    'gar&ccedil;ia',
-    'gardened',
-    'gardens.',
-    'garfunkels',
-    'garnishes',
-    'garrett/swindon',
-    'garrucho',
-    'garsinde',
-    'gas-lamps',
-    'gastronomically',
-    'gastroscopies',
-    'gateacre',
-    'gatecrashers',
     'gatley',
-    'gavia',
-    'gavrilo',
-    'gawpers',
-    'gbe',
-    'gebre',
-    'geco-prakla',
-    'gellatly',
-    'gemberling',
-    'gemmules',
-    'gender-differentiated',
-    'gene-culture',
-    'genericism',
-    'genillard',
-    'genotypic',
-    'geoclock',
     'geoghegan-quinn',
-    'germicidal',
-    'gerontocracy',
-    'gerund',
-    'gesticulation',
-    'ggfbpp5',
-    'ghitac',
-    'ghostwatch',
-    'gibbeted',
-    'gibbins',
-    'gibble',
-    'gieve',
-    'giffnock',
-    'giftwrap',
-    'gigantea',
-    'gilbertson',
     'gilead',
-    'giles-the-murderer',
-    'gillance',
-    'gillis-tweed',
-    'gillmore',
-    'ginge',
-    'gingers',
-    'gippy',
-    'girls-only',
-    'girolami',
-    'gisby',
-    'giss-giss',
-    'give-aways',
-    'given/new',
-    'glaciologist',
-    'gladdens',
     'glaslyn',
-    'glass-enclosed',
-    'glass-sided',
-    'glass-steagall',
-    'gledhow',
-    'glenville',
-    'glews',
-    'glia',
-    'globs',
-    'gloppo',
-    'glossily',
-    'glottalisation',
-    'gloveman',
-    'gluckstein',
-    'glucocorticoid',
-    'glucosidase',
     'glutamine-rich',
-    'glycaemia',
-    'glycosides',
-    'glycosuria',
-    'glyphosate',
-    'gnarly',
-    'go-it-alone',
-    'goat-antelopes',
-    'gobber',
-    'godelier',
-    'goeth',
-    'gold-flecked',
-    'gold-leaf',
-    'goldemberg',
-    'gonadal',
-    'gonadotropins',
     'goncharova',
-    'gonfreville',
-    'gonzalez-palacios',
-    'good-byes',
-    'goodge',
-    'goods-specific',
-    'goodwin/cirencester',
-    'goodwins',
-    'goofed',
-    'gooli',
-    'goose-stepping',
-    'goosie',
-    'gorchakova',
-    'gorebridge',
-    'gorney',
-    'goronwy',
     'gossett',
-    'gothenberg',
-    'goupil',
-    'governability',
-    'government\'',
-    'gowan',
-    'gph',
-    'gra&ccedil;a',
-    'grain-size',
-    'gram-positive',
-    'gran\'fer',
-    'grand-children',
-    'grand-ducal',
-    'grandinetti',
-    'grandmas',
-    'grandness',
     'grandparental',
-    'grangefield',
-    'granny-liz',
-    'grapey',
-    'graphemic',
-    'grapho-phonemic',
-    'grasstrack',
-    'gravamen',
-    'graviton',
-    'gravitons',
-    'grayscale',
-    'great-looking',
-    'green-coated',
-    'green-skinned',
-    'greenback',
-    'greenfinch',
     'greenlees',
-    'greenley',
-    'greenodd',
-    'greenville',
-    'greeny-yellow',
-    'greetham',
-    'greicha',
-    'grevious',
-    'grey-suited',
-    'greybeards',
-    'grimed',
-    'grindingly',
-    'gripings',
-    'grisham',
-    'grittily',
-    'grizzle',
     'groce',
-    'gromov',
-    'grouchy',
-    'group(s)',
-    'group-compliant',
-    'growth.',
-    'grubbiness',
-    'gruenen',
-    'grumpiness',
-    'grungers',
-    'gt1x',
-    'gtc380',
-    'gu&eacute;rard',
-    'gu2',
-    'gu7',
-    'guanajuato',
     'guanidinium',
-    'guebuza',
-    'guesthall',
-    'guitarist/vocalist',
-    'gulch',
-    'gullshaven',
-    'guls',
-    'gun-runners',
-    'gunda',
-    'gung',
-    'gungaadorj',
-    'gushingly',
-    'guyline',
-    'guyot',
-    'guzzled',
-    'gyr',
     'gyros',
-    'gywir',
-    'h.l.r.',
-    'h197a',
-    'ha\'porth',
-    'ha-san',
-    'ha7',
-    'habakkuk',
-    'haciendas',
-    'hadrons',
-    'haec',
-    'haematopoietic',
-    'haemophilic',
-    'haemorrhoidectomy',
-    'hafiz',
-    'hafta',
     'hagiographers',
-    'hagiographical',
-    'haibara',
-    'hainan',
-    'hair-thin',
-    'hairpieces',
-    'hairsbreadth',
-    'hajji',
-    'hakami',
-    'half-awake',
-    'half-blind',
-    'half-centuries',
-    'half-consciously',
-    'half-cycles',
-    'half-familiar',
-    'half-shut',
     'half-silvered',
-    'half-size',
-    'halfpence',
-    'halzman',
-    'hamcom',
-    'hamilton-jones',
-    'hammad',
-    'hand-',
-    'hand-guns',
-    'hand-helds',
-    'hand-rolled',
-    'hand-stitched',
-    'handmaids',
-    'hang-gliders',
-    'hang-out',
-    'hang-over',
     'hannibalsson',
-    'hans-ulrich',
-    'hants.',
-    'hap\'orth',
-    'haply',
-    'happenin\'',
-    'harassments',
-    'hard-done-by',
-    'hard-muscled',
-    'harer',
-    'harewoman',
-    'harloe',
-    'harmonically',
-    'harmonises',
-    'harpur',
-    'harrassed',
     'haskett',
-    'hassle-free',
-    'hatchways',
-    'hatje',
-    'havas',
-    'havstock',
-    'haward',
-    'hawkinge',
-    'haytiming',
-    'hazelbank',
-    'hba',
-    'hbba',
-    'hck',
-    'hcws',
-    'he\'enalu',
-    'head-capsule',
     'head-count',
-    'head-over-heels',
-    'head-quarters',
-    'headcase',
-    'headcollar',
-    'headships',
-    'healthy-looking',
-    'hearten',
-    'heartiest',
-    'heathenism',
-    'heatherington-scott',
-    'hedi',
-    'heedlessness',
-    'heftier',
-    'hegemonal',
-    'heighton',
     'heilen',
-    'heinousness',
-    'helically',
-    'helicopter-borne',
-    'hellhounds',
-    'helmingham',
-    'helpmeet',
-    'helter',
-    'hemmed-in',
-    'hemphill',
-    'henbury',
-    'hendersons',
-    'henges',
-    'hengistbury',
-    'henhouses',
-    'henney',
     'herak',
-    'herceg-bosna',
-    'here\'',
-    'herefs',
-    'hermaphrodites',
-    'hermestone',
-    'heronry',
-    'herpetologist',
-    'heryng',
-    'hesletine',
-    'heslington',
-    'heteroclinic',
-    'heterodimeric',
-    'heterophylla',
-    'heveningham',
-    'hewitt-jones',
     'hexametaphosphate',
-    'heydays',
-    'hezb-i-wahdat',
-    'hi-',
-    'hi-osf/1-m',
-    'hi-watt',
-    'hide-bound',
-    'hideousness',
-    'hieroglyph',
-    'high-arched',
-    'high-contrast',
-    'high-finesse',
-    'high-up',
-    'highest-ranked',
-    'highly-priced',
-    'highly-ranked',
     'highly-respected',
-    'highspeed',
-    'highspot',
-    'hiley',
-    'hilla',
-    'him.',
-    'himsworth',
-    'hinchinbrook',
-    'hindleg',
-    'hindquarter',
-    'hippiedom',
-    'hippocampi',
-    'hiranu',
-    'hireling',
-    'hirelings',
-    'hirsuta',
     'hirta',
-    'historie',
-    'hittites',
-    'hixon',
-    'hmmmm',
-    'hnc/d',
-    'hoakley',
-    'hobby-horses',
-    'hobday',
-    'hoel',
-    'hogsheads',
-    'hojjatoleslam',
-    'holder-on',
-    'holla',
-    'hollington',
-    'hollowfibre',
     'holmsen',
-    'holorepressor',
-    'home-from-home',
-    'homebuilding',
-    'homeliness',
-    'homeloan',
-    'homewood/rushfields',
-    'homildon',
-    'homogenising',
-    'homonymous',
-    'honey-blonde',
-    'hoo-hah',
-    'hoople',
-    'hopcroft',
-    'horeb',
-    'hormila',
     'horrorstruck',
-    'hors-d\'oeuvres',
-    'horse-boxes',
-    'horsefly',
-    'horspath',
-    'hotkey',
-    'house-bound',
-    'house-guests',
-    'house-owners',
-    'housesteads',
-    'houten',
-    'hovingham',
-    'howick',
-    'hox-b1/lacz',
-    'hpd',
-    'hpfs',
     'hpo',
-    'hs1',
-    'hs2',
-    'hs554',
-    'hs5b',
-    'hu-yan',
-    'huaqing',
-    'hubcaps',
-    'hucksters',
-    'huis',
-    'hulbert',
-    'huling',
-    'hulke',
-    'hullavington/wiltshire',
-    'human-like',
-    'humbrian',
     'humfrey',
-    'humilis',
-    'hummadi',
-    'humpy',
-    'hunkydory',
-    'hurkett',
-    'hurstmonceux',
-    'hutus',
-    'hx8plane',
-    'hybridomas',
-    'hydrologists',
-    'hyper-inflationary',
-    'hypercapnic',
-    'hyperdocuments',
-    'hyperfine',
-    'hyperosmolar',
     'hyperstream',
-    'hypobranchial',
-    'hypochlorhydria',
-    'hypocholesterolaemia',
-    'hypothermic',
-    'hysterectomies',
-    'i-ay',
-    'i.1',
-    'i.c.r.',
-    'i.d',
-    'i.v.',
-    'i/0',
-    'i/c',
-    'iaf',
-    'iban',
-    'ibarra',
     'ibms',
-    'ic1c',
-    'icai',
-    'icch',
-    'ice-age',
-    'ice-breaking',
-    'ice-cube',
-    'iceaxe',
-    'ickworth',
-    'ideal-types',
-    'ideograms',
-    'idiosyncratically',
-    'idms',
-    'ieho',
-    'ifscc',
-    'igfets',
     'ii/us',
-    'iii/jg',
-    'iit',
-    'ikebana',
-    'il-1',
-    'il-6re',
-    'ild',
-    'ill-conditioned',
-    'ill-coordinated',
-    'ill-digested',
-    'ill-intentioned',
-    'illegall',
-    'illiquidity',
-    'illus.2',
-    'illusionistic',
-    'ilocos',
     'imageable',
-    'imagistic',
-    'imagos',
-    'imb',
-    'imipramine',
-    'immodestly',
-    'immovably',
-    'imperviousness',
-    'implementational',
-    'importances',
-    'impossibles',
-    'imprisonments',
-    'impromptus',
-    'imtiaz',
-    'in-feed',
-    'in-filling',
     'in-game',
-    'in-hand',
-    'in-the',
-    'in-trays',
-    'in/out',
-    'in_,_in_relation_to',
-    'in_medias_res',
-    'inadmissibility',
-    'inadvisability',
-    'inapposite',
-    'inarticulacy',
-    'inasmuch',
-    'inayat',
-    'inc/unix',
-    'inch-thick',
-    'inchicore',
     'incipiently',
-    'incitements',
-    'inclusively',
-    'indemnifies',
-    'independance',
-    'indispensible',
-    'indivisibly',
-    'indriyas',
-    'ineducable',
-    'inerrancy',
-    'inertness',
-    'inexpressive',
-    'informationally',
-    'informix-online',
-    'ingoing',
-    'injury-free',
     'innovativeness',
-    'innsworth',
-    'inquorate',
-    'inscape',
-    'insch',
-    'insect-like',
-    'inseminations',
-    'inseparability',
-    'inside/outside',
-    'inst.',
-    'installments',
-    'instore',
-    'instrumentals',
-    'int.',
-    'intemate',
-    'intendants',
     'intentness',
-    'inter-allied',
-    'inter-denominational',
-    'inter-galactic',
-    'inter-religious',
-    'inter-subjective',
-    'inter-tidal',
-    'interest-elastic',
-    'interglacials',
-    'interiorization',
-    'interloans',
-    'interpretability',
-    'interruptable',
-    'intersystems',
-    'interventive',
-    'intime',
     'intimidatingly',
-    'intra-urban',
-    'intrafamilial',
-    'intrasentential',
-    'intron/exon',
-    'introspectible',
-    'introspectively',
-    'intrusively',
-    'intuitionist',
-    'intuitivity',
-    'intumescent',
-    'inveighing',
-    'inverloss',
-    'investible',
-    'ioan',
-    'ion-selective',
     'ionospheric',
-    'ip1',
-    'ipe',
-    'ipo',
-    'ipsley',
-    'iraq-iran',
-    'iron-bound',
-    'irreconcilability',
-    'irrecoverably',
-    'irremediably',
-    'irruptions',
-    'is_a',
-    'isabey',
-    'isafj&ouml;rdur',
-    'isdn2',
-    'iser',
     'isinglass',
-    'islamey',
-    'isobars',
-    'isomura',
-    'istv&aacute;n',
-    'item(s)',
-    'ittehad-i-islami',
-    'iturralde',
-    'iure',
-    'ivie',
-    'iwate',
-    'ixth',
-    'ixyphalians',
-    'j.c.l.',
-    'j.n.',
-    'j.o.c.',
     'ja&eacute;n',
-    'jackson-stops',
-    'jaguthin',
-    'jahanbini',
-    'jahoda',
-    'jailbirds',
-    'jairo',
-    'jambyn',
-    'jamil',
-    'jankel',
-    'janotte',
-    'jansson',
-    'jaramogi',
-    'jauntiness',
-    'jay-walking',
-    'je_ne_sais_quoi',
     'jean-bedel',
-    'jean-christophe',
-    'jeanetta',
-    'jefferys',
-    'jenco',
-    'jermey',
-    'jet-propelled',
-    'jetset',
-    'jeyaretnam',
-    'jezrael-ayesha',
-    'jg',
-    'jha',
-    'jinan',
-    'jindrich',
-    'jitney',
-    'joachimedes',
     'job/personnel',
-    'jobbie',
-    'jocelin',
-    'jocelyne',
-    'jocose',
-    'johnstones',
-    'joke-telling',
-    'jokily',
-    'jolliffe',
-    'jollities',
-    'joris',
-    'jouissance',
-    'jovito',
-    'jowled',
-    'jowles',
-    'joy-riders',
     'joyfulness',
-    'joyousness',
-    'ju-jitsu',
-    'judex',
-    'judicata',
-    'judiciaries',
-    'juicier',
-    'jul&ndash;28',
-    'julyen',
-    'junipers',
-    'junky',
-    'jur',
-    'jurado',
-    'justice-clerk',
-    'justicialista',
-    'jwt',
     'jxc',
-    'jy',
-    'jyoti',
-    'k&amacr;l&amacr;dika',
-    'k&auml;th&egrave',
-    'k3560',
-    'k858',
-    'kaa',
-    'kabbalists',
-    'kabylia',
-    'kafkaesque',
-    'kagalla',
-    'kagel',
-    'kaja',
-    'kakadu',
-    'kalevala',
     'kambiz',
-    'kamenka',
-    'kangshung',
-    'kapllani',
-    'karad&zcaron;i&cacute',
-    'karaz-a-karak',
-    'karbacher',
-    'karl-i-bond',
-    'karplus',
-    'kasatonov',
-    'kasdi',
-    'kat-zet',
-    'katlehong',
-    'kawamura',
-    'kebir',
-    'kecks',
     'keiths',
-    'kelbie',
-    'kelim',
-    'kellys',
-    'kelsenian',
-    'kemper',
-    'kenaan',
-    'keratinocytes',
-    'kerb-crawlers',
-    'kerchiefs',
-    'kerr-muir',
-    'key-board',
-    'kg/ha',
-    'kg42',
-    'khaki-coloured',
-    'khalifas',
     'khamphoui',
-    'kharitonov',
-    'khun',
-    'khurshid',
-    'kijevo',
-    'killjoys',
-    'kilmartin',
-    'kilray',
-    'kimberly-clark',
-    'kimonos',
-    'kina',
-    'kinaesthetic',
-    'kindlier',
-    'kingsgate',
-    'kingsmere',
-    'kingswear',
     'kingswinford',
-    'kingsworth',
-    'kinked',
-    'kinmont',
-    'kinswomen',
-    'kitchen/diner',
-    'kitts-nevis',
-    'kiu',
-    'klasies',
-    'klibi',
-    'klis',
-    'knee-pads',
-    'kneeing',
-    'knobser',
-    'know-alls',
-    'knoxville',
     'knussen',
-    'knyvett',
-    'koenigs',
-    'koivisto',
-    'kompass',
-    'kontron',
-    'kookai',
-    'koti',
-    'kotz',
-    'kovar',
-    'kp1',
-    'kr11',
-    'kras',
-    'krater',
-    'krau',
-    'kreisky',
     'krishnamurti',
-    'kristofferson',
-    'kritian',
-    'krk',
-    'kronberg',
-    'kronquist',
-    'kruggerrand',
-    'kuei',
-    'kufran',
-    'kuhnian',
-    'kunsthaus',
-    'kunstsammlung',
-    'kurgan-tyube',
-    'kut',
-    'kuznetsov',
-    'kyburg',
     'kyd',
-    'kynar',
-    'kynde',
-    'kyrgyzstan',
-    'kyrle',
-    'kyung-won',
-    'l&eacute;onard',
-    'l\'agriculture',
-    'l\'aquila',
-    'l\'education',
-    'l\'humanit&eacute',
-    'l\'op&eacute;ra',
-    'l-glu',
-    'l.0.2',
-    'l.g.u.',
-    'l703766',
     'l984',
-    'l987',
-    'l99',
-    'laage-salomon',
-    'labno',
-    'labour-dominated',
-    'labour-force',
-    'lacquering',
-    'laddow',
-    'lagavullin',
-    'laggardly',
-    'lagomorphs',
-    'laid-up',
-    'laidback',
-    'laki',
-    'lamento',
     'lames',
-    'lamiel',
-    'lamlash',
-    'lamphey',
-    'landis',
-    'languages.',
-    'lannah',
-    'lanx',
-    'larkhall',
-    'lartin/worcestershire',
-    'laspi',
-    'late-twentieth',
-    'laude',
-    'laurencekirk',
-    'lavan',
-    'lavender-coloured',
     'lavoir',
-    'lawrentian',
-    'lawson-finch',
-    'lawter',
-    'lawyer/client',
-    'lay-dominated',
-    'lay-outs',
-    'layline',
-    'lcdt',
-    'leader-post',
-    'leadhills',
-    'leadscrew',
-    'leafier',
-    'leafmould',
-    'lean-tos',
-    'leatherwork',
     'lebanese-syrian',
-    'lebedev',
-    'lecithins',
-    'leckhampton',
-    'ledsam',
-    'lee-on-solent',
-    'leekie',
-    'legal/rational',
-    'lelc',
-    'lemmata',
-    'lemon-scented',
-    'lenarduzzi',
-    'lensless',
-    'lenthall',
-    'leogang',
-    'lequerica',
     'letdown',
-    'level-related',
-    'leviathans',
-    'lewis-ann',
-    'lewy',
-    'lexicon-based',
-    'ley-lines',
-    'lgg',
-    'libandla',
-    'librettists',
-    'licensors',
-    'lidington',
-    'liebow',
-    'liena',
-    'lieut.',
-    'life-',
     'life-savings',
-    'lifeboatman',
-    'lifesense',
-    'lifetex',
-    'lighterman',
-    'lihou',
-    'liliam',
-    'lillywhites',
-    'lime-rich',
-    'limnititzkers',
-    'limpidity',
-    'lindau',
-    'lindberg',
-    'lingary',
-    'linitis',
-    'liong',
     'lipps',
-    'liquify',
-    'listenable',
-    'literary-historical',
-    'lithic',
-    'lithostratigraphical',
-    'litigiousness',
-    'litvinov',
-    'liverpudlians',
-    'llanfairpwll',
-    'llanharan',
-    'llano',
-    'llantwit',
-    'llanwern',
-    'llewellyn-smith',
-    'llidi',
     'lm100',
-    'lm2',
-    'lm3914n',
-    'loc._cit',
-    'loc._cit.',
-    'local-central',
-    'locally-elected',
-    'lochassynt',
-    'lochwood',
-    'lock-ups',
-    'loftiness',
-    'lollocks',
-    'lomagne',
-    'london-wide',
-    'long-breathed',
-    'long-buried',
     'long-focus',
-    'long-ranging',
-    'long-toed',
-    'longboat',
-    'longer-necked',
-    'longissima',
-    'longniddry',
-    'loose-boxes',
-    'looseknit',
-    'loosest',
-    'lophophore',
-    'loppers',
-    'loris-melikov',
-    'lorn',
-    'lorryload',
-    'lothl&oacute;rien',
     'loud-speakers',
-    'lounge/bar',
-    'lounge/diner',
-    'louth-bardney',
-    'love-affairs',
-    'love-birds',
-    'lovebite',
-    'loveluck-edwards',
-    'low-loss',
-    'low-spirited',
-    'low-waisted',
-    'lower-storey',
-    'lowermost',
-    'lowlier',
-    'lowness',
-    'lowton',
     'lq-550',
-    'ls2',
-    'ls8',
-    'lshtm',
-    'lsr',
-    'lsstrt',
-    'lubumbashi',
-    'luder',
-    'ludhiana',
-    'ludicrousness',
-    'lungworm',
-    'lupold',
-    'lusardi',
-    'luta',
-    'luttrell',
-    'luxton',
     'luzhkov',
-    'lxiv',
-    'lxxviii',
-    'lych',
-    'lydda',
-    'lydians',
-    'lykophron',
-    'lynher',
-    'lyophilised',
-    'lyphard',
-    'lyre-shaped',
-    'lyricists',
-    'm&eacute;diterran&eacute;e',
-    'm&ouml;bius',
-    'm-fifty',
-    'm.ed',
     'm.o.t',
-    'm45',
-    'm53',
-    'm58&ndash;66',
-    'm68000',
-    'maak',
-    'macdhui',
-    'macgill/scotland',
-    'mach-based',
-    'machaut',
-    'machyn',
-    'macilwain',
-    'mackensen',
-    'macklen',
-    'maclink',
-    'macmillans',
     'macmullen',
-    'macpublisher',
-    'macrovision',
-    'macshane',
-    'macwrite',
-    'maddest',
-    'madel',
-    'madi',
-    'madryn',
-    'maeterlinck',
-    'magharians',
-    'magicked',
-    'magneto-optical',
-    'magnetrons',
-    'mahanta',
-    'mail-shots',
     'mailbags',
-    'mailers',
-    'maintainers',
-    'mainwin',
-    'major-minor',
-    'makaton',
-    'make-ups',
-    'makerfield',
-    'maleffects',
-    'maleos',
-    'malhamdale',
-    'malhandir',
-    'maloti',
-    'maltman',
-    'malverns',
-    'mamprusi',
     'man-god',
-    'man-mountain',
-    'man-shaped',
-    'manager(s)',
-    'manatees',
-    'mandelbaum',
-    'manlike',
-    'manly-warringah',
-    'mannheimian',
-    'mannings',
-    'mano',
-    'manoevre',
-    'mantids',
-    'manukyan',
-    'manyatta',
-    'mapperley',
     'maquiladoras',
-    'mar&eacute;chal',
-    'marathoners',
-    'marceau',
-    'march-9',
-    'marchbanks',
-    'marder',
-    'mareuil-sur-a&yuml',
-    'margins.',
-    'marie-anne',
-    'marie-louise',
-    'marie-luce',
-    'marioff',
-    'mariscal',
-    'maritimes',
-    'marivate',
     'market-town',
-    'markevitch',
-    'marleasing',
-    'martti',
-    'mary-jane',
-    'masaya',
-    'masduki',
-    'maskey',
-    'masol',
-    'mass/energy',
-    'masticated',
-    'maternally',
-    'mateyness',
-    'mathura',
-    'mattheys',
-    'mattingly',
     'mavin',
-    'mawdesley',
-    'max+max',
-    'max-am',
-    'max.flash',
-    'maximums',
-    'maxteds',
-    'maxwell-bloch',
-    'maxwell-hyslop',
-    'maystadt',
-    'mcalister',
-    'mccaig',
-    'mccalman',
-    'mccance',
-    'mccann-erickson',
-    'mccarrick',
     'mccarter',
-    'mccaslin',
-    'mccaul',
-    'mccluskie',
-    'mccorkadale',
-    'mccorry',
-    'mccowen',
-    'mccrindle',
-    'mccrystal',
-    'mccuaig',
-    'mccune',
-    'mcdeere',
-    'mcduck',
-    'mcerlain',
-    'mcgaw',
-    'mcgeary',
     'mcgeough',
-    'mcgivern',
-    'mcgonigal',
-    'mcgown',
-    'mcgrew',
-    'mchangama',
-    'mchardy',
-    'mci\'s',
-    'mcindoe',
-    'mckitten',
-    'mckusick',
-    'mclaughlan',
-    'mcmeekin',
-    'mcmillen',
-    'mcnabb',
-    'mcnish',
     'mcveir',
-    'mcvickers',
-    'md-dos',
-    'mdh',
-    'me109s',
-    'me_a',
-    'meagreness',
-    'meanchey',
-    'mech',
-    'medium-low',
-    'mednick',
-    'meetin',
-    'megafauna',
-    'megamix',
-    'megarians',
-    'megastars',
     'mehfils',
-    'mekgwe',
-    'melanocyte',
-    'melanurum',
-    'melastomataceae',
-    'melchester',
-    'melhuish',
-    'mellons',
-    'melodeon',
-    'melric',
-    'meltemi',
-    'meltingly',
-    'membrane/intercellular',
-    'mencken',
-    'mendaciously',
-    'mendlesham',
     'mennonites',
-    'mentalism',
-    'menton',
-    'mercadier',
-    'meridien',
-    'meritocrats',
-    'merrifield',
-    'mesmerizing',
-    'meso',
-    'meso-scale',
-    'mesothorax',
-    'mesotrophic',
-    'mess-tins',
-    'mesta',
-    'meta-analyses',
-    'metabolized',
     'metacarpal',
-    'metacentric',
-    'metal-ligand',
-    'metal-rimmed',
-    'metalingual',
-    'metallogenic',
-    'metalloproteinases',
-    'metatheory',
-    'methanogens',
-    'methought',
-    'metro-cammell',
-    'mfj',
-    'mg-atpase',
-    'mg/m/day',
-    'mg3',
-    'mgt',
     'miasmic',
-    'miasms',
-    'micahel',
-    'michaeljohn',
-    'micro-climate',
-    'micro-economic',
-    'micro-politics',
-    'microadenoma',
-    'microanalysis',
-    'microcosms',
-    'micromolar',
-    'micropipettes',
-    'microsatellite',
-    'mid-1820s',
-    'mid-1830s',
-    'mid-1860s',
     'mid-50s',
-    'mid-680s',
-    'mid-antrim',
-    'mid-boost',
-    'mid-calf',
-    'mid-eleventh',
-    'mid-fourteenth',
-    'mid-front',
-    'mid-late',
-    'mid-silurian',
-    'mid-speech',
-    'mid-wife',
-    'middle-man',
-    'middlebrook',
-    'midle',
-    'mig-21',
     'migration.',
-    'milcolm',
-    'milds',
-    'milenecka',
-    'milers',
-    'military-appointed',
-    'militum',
-    'milk-free',
-    'milkless',
-    'mill-hands',
-    'milland',
-    'millenniums',
-    'millport',
-    'millwood',
-    'milvain',
-    'minchampstead',
     'mind-bogglingly',
-    'mind-numbingly',
-    'mindoro',
-    'mineralization',
-    'mingay',
-    'minghella',
-    'ministers-delegate',
-    'minster-in-thanet',
-    'minu',
-    'minute-to-minute',
-    'mipmip.',
-    'mirrorshades',
-    'mis-shapen',
-    'mis-use',
-    'misalignments',
-    'mischiefs',
     'misericorde',
-    'misericordia',
-    'misericords',
-    'miskicked',
-    'mislabelled',
-    'mislay',
-    'misra',
-    'misrecognition',
-    'missionizing',
-    'misstatements',
-    'mistranslation',
-    'ml/g',
-    'ml/hour',
-    'ml1:ml2',
-    'mlso',
-    'mm-hm',
     'mmf',
-    'mmn',
-    'mmol/d',
-    'mmol/h/kg',
-    'mmp',
-    'mmusi',
-    'mne',
-    'mobberley',
-    'mobey',
-    'moccasin',
-    'mocumbi',
-    'modernisations',
-    'moderniser',
-    'modesto',
-    'mois',
-    'moister',
     'mokai',
-    'mollusca',
-    'monarchism',
-    'monday&ndash;thursday',
-    'mondi',
-    'moneyspinner',
-    'monfalcone',
-    'monkey-like',
-    'monkeying',
-    'monocausal',
-    'monocled',
-    'monocotyledons',
-    'monody',
-    'monograms',
-    'monomolecular',
-    'monopolizes',
     'montezemolo',
-    'monthly/weekly',
-    'montlouis',
-    'monzon',
-    'moon-shaped',
-    'moorhead',
-    'moralise',
-    'moralized',
-    'moratoriums',
-    'moreton-in-marsh',
-    'morgana',
-    'morganatic',
-    'moriah',
-    'moriyama',
-    'morlands',
-    'morphic',
     'morphy',
-    'morrells',
-    'mortadella',
-    'moskvich',
-    'moss-green',
-    'most-capped',
-    'motcomb',
-    'mothball',
-    'motile',
-    'motivic',
-    'motm',
-    'motor-boat',
-    'motterstone',
-    'mouse.com',
-    'mouseman',
-    'mouthings',
     'movie-goers',
-    'mozartians',
-    'mp1',
-    'mp24',
-    'mrm',
-    'ms-dos-based',
-    'msh',
-    'msw',
-    'mtezuka',
-    'much-admired',
-    'much-advertised',
-    'mud-stained',
-    'muderris/mufti',
-    'mudflow',
-    'mudra',
-    'muftah',
     'muhibbuddin',
-    'muirkirk',
-    'mujer',
-    'mukarji',
-    'mullican',
-    'multi-causal',
-    'multi-directional',
-    'multi-page',
-    'multi-vitamins',
-    'multicomponent',
-    'multielement',
-    'multigrade',
-    'multilist',
-    'multimodal',
-    'multiplicities',
-    'mumming',
     'munches',
-    'mundesley',
-    'murlough',
-    'mushroom-shaped',
-    'musicali',
-    'muskie',
-    'mustard-coloured',
-    'mutambara',
-    'muzenda',
-    'muzzily',
-    'mwrog',
-    'mycology',
-    'mycorrhizae',
-    'myelography',
-    'mynors',
-    'myoclonus',
     'myxoedema',
-    'n&amp;p',
-    'n-dimensional',
-    'n-e',
-    'n.c.o.s',
-    'n.e.c.',
-    'n.f.p.a.',
-    'n.j.',
-    'n.y.s.2d',
-    'n185',
-    'n=13',
-    'n=17',
-    'n=22',
-    'n=24',
-    'n=48',
-    'naaah',
     'naarden',
-    'nabs',
-    'naggarothi',
-    'naic',
-    'nair',
-    'nampula',
-    'nanc',
-    'nannying',
-    'nappe',
-    'nappes',
-    'narberth',
-    'narey',
-    'nasty-looking',
-    'natively',
-    'nativist',
-    'navier-stokes',
     'nayab',
-    'nayland',
-    'nazified',
-    'ncds',
-    'nd/',
-    'ndabaningi',
-    'ndonga',
-    'nead',
-    'near-unanimous',
-    'nearly-equal',
-    'neatened',
-    'nebulosity',
-    'nechayev',
-    'neck/body',
-    'need-to-know',
-    'neg',
     'negre',
-    'neige',
-    'nelson-atkins',
-    'nen',
-    'neopaint',
-    'nerudova',
-    'nerve-centres',
-    'neugebauer',
-    'neuraminidase',
-    'neurobiological',
-    'neuroglycopenic',
-    'neurophysiologically',
-    'neurophysiologist',
-    'neuroticism',
-    'neutropenia',
-    'never-the-less',
     'new-built',
-    'new-line',
-    'newberry',
-    'newborough',
-    'newens',
-    'newhall',
-    'newi',
-    'newly-invented',
-    'newly-planted',
-    'newly-privatised',
-    'newly-purchased',
-    'newly-recruited',
-    'newly-rich',
-    'newmills',
-    'newsagency',
-    'newscuttings',
     'ney',
-    'nfd',
-    'ng/g',
-    'ngawang',
-    'ngollo',
-    'nh3',
-    'ni-cads',
-    'nichollsi',
-    'nick-named',
-    'nicorette',
-    'night-cap',
-    'night-workers',
-    'nine-and-a-half',
-    'nine-minute',
-    'nineteen-fifties',
-    'nip.bsa-coated',
     'nippostrongylus',
-    'nis+',
-    'nishi',
-    'nitch-smith',
-    'nitriles',
-    'nitrogen-rich',
-    'nitrogens',
-    'nkp',
-    'nkumbula',
-    'no.15',
-    'no.24',
-    'noddies',
-    'nogales',
-    'noland',
-    'non-arts',
-    'non-base',
     'non-biblical',
-    'non-combustible',
-    'non-comparative',
-    'non-dependent',
-    'non-deviant',
-    'non-differential',
-    'non-discursive',
-    'non-domiciled',
-    'non-economically',
-    'non-elective',
-    'non-ethanolic',
-    'non-europe',
-    'non-historical',
-    'non-ideological',
-    'non-intentional',
-    'non-locking',
     'non-logical',
-    'non-malignant',
-    'non-means-tested',
-    'non-mechanical',
-    'non-musical',
-    'non-neuronal',
-    'non-offenders',
-    'non-optional',
-    'non-penetrative',
-    'non-peristaltic',
-    'non-poisonous',
-    'non-possessory',
-    'non-problematic',
-    'non-psychiatric',
-    'non-relevant',
-    'non-skilled',
     'non-specifically',
-    'non-sustainable',
-    'non-syllabic',
-    'non-symmetrical',
-    'non-tonal',
-    'non-traders',
-    'non-traditionally',
-    'nonamer',
-    'noncallable',
-    'noooo',
-    'noorduyn',
-    'norchard',
-    'nore',
-    'norepinephrine',
-    'normal-looking',
-    'normoalbuminuria',
     'north-rhine',
-    'northfleet',
-    'northiam',
-    'northmore',
-    'nosegay',
-    'not-so-distant',
-    'notched-pole',
-    'note-pad',
-    'novakova',
-    'novelettes',
-    'now_er_that',
-    'np-complete',
-    'npk',
-    'nrem',
-    'ns1',
-    'ntr',
     'nuclear-tipped',
-    'nucleon',
-    'nudibranchs',
-    'nuflvn',
-    'nullifies',
-    'number-plates',
-    'number-two',
-    'numerological',
-    'nunnington',
-    'nuphar',
-    'nurse/patient',
-    'nw10',
-    'nw5',
-    'o&amp',
-    'o\'-ring',
-    'o\'duffy',
     'o.a.p.',
-    'o.k',
-    'o.k.w.',
-    'o/50',
-    'oab',
-    'obadiah',
-    'obdurately',
-    'objectifies',
-    'obsessive-compulsive',
-    'obstetrical',
-    'occidentalis',
-    'occlusive',
-    'ochil',
-    'octamer-taatgar',
-    'octobrists',
-    'oculocutaneous',
     'odi',
-    'odile',
-    'odoriferous',
-    'odp-mt',
-    'odr',
-    'oeo',
-    'oesophagectomy',
-    'offcut',
-    'officership',
-    'officiants',
-    'officium',
-    'oft-cited',
-    'oftentimes',
-    'ogdon',
-    'oh-oh',
-    'ohmae',
     'oilier',
-    'oilies',
-    'okadaic',
-    'oligopolists',
-    'olufsen',
-    'olympia&amp;york',
-    'omos',
-    'onanism',
-    'once-powerful',
-    'once-weekly',
-    'oncoprotein',
-    'one-five-one',
-    'one-for-four',
-    'one-in-ten',
-    'one-in-three',
-    'one-length',
     'one-ninth',
-    'one-one-five',
-    'one-two-three',
-    'oo-er',
-    'opaquely',
-    'open/closed',
-    'opera-houses',
-    'operationalised',
-    'ophiochondrus',
-    'opp2',
-    'oppositionist',
-    'oppressiveness',
-    'opticrom',
-    'oralists',
-    'oratorian',
-    'oratories',
     'orbix',
-    'orf3',
-    'organelle',
-    'organisation-wide',
-    'organismic',
-    'organo-chlorides',
-    'orginal',
-    'orginally',
-    'orientates',
-    'oriflamme',
-    'ornella',
-    'ornithologically',
-    'orphanges',
-    'orphir',
-    'orsborn',
-    'orthofunction',
     'osbaldwick',
-    'osf/1-based',
-    'osf/1.1',
-    'osnabr&uuml;ck',
-    'osteomata',
-    'ostraka',
-    'oswaldkirk',
-    'oswy',
-    'otsason',
-    'ottoline',
-    'oudart',
-    'out-sourcing',
-    'outgrows',
-    'outlasting',
-    'outperformance',
-    'outsoles',
     'outstation',
-    'ovedale',
-    'over-16s',
-    'over-abstraction',
-    'over-ambition',
-    'over-bureaucratic',
-    'over-eagerness',
-    'over-emphatic',
-    'over-exuberant',
-    'over-imaginative',
-    'over-protection',
-    'over-ran',
-    'over-rigid',
-    'over-sophisticated',
-    'over-stated',
-    'over-statement',
     'overbright',
-    'overbury',
-    'overenthusiastic',
-    'overflight',
-    'overflights',
-    'overinvolvement',
-    'overkingship',
-    'overspends',
-    'overstrained',
-    'overtighten',
-    'overzealous',
-    'own-labels',
-    'ownerless',
-    'ox8',
-    'oxburgh',
-    'oxygen-rich',
     'oxygenators',
-    'oyster-catchers',
-    'oz/2',
-    'oz/200ml',
-    'p&aacute;lsson',
-    'p(0)',
-    'p-please',
-    'p.11',
-    'p.111',
-    'p.26',
-    'p.37',
-    'p.40',
-    'p.46',
-    'p.52',
-    'p.58',
-    'p.59',
     'p.71',
-    'p.81',
-    'p.88',
-    'p.g.c.e.',
-    'p.p.m',
-    'p.t.',
-    'p1*/lp0',
-    'p1.i',
-    'p1.ii',
-    'p1.iii',
-    'p11d',
-    'p13',
-    'p20',
-    'p3/t1',
-    'p3/t4',
-    'p4/t1',
     'p58',
-    'p82',
-    'p96',
-    'p=0.003',
-    'p=0.004',
-    'p=0.012',
-    'p=0.11',
-    'p=0.2',
-    'pace-setters',
-    'paceley',
-    'padova',
-    'paisleyite',
-    'paladins',
-    'palaeoenvironmental',
-    'palaeoenvironments',
-    'palaeogeography',
     'pale-grey',
-    'palmae',
-    'palmeras',
-    'palmitoyl',
-    'palp',
-    'palps',
-    'panathenaic',
-    'pancev',
-    'pancevski',
-    'panicea',
-    'pannella',
-    'pannwitz',
-    'panov',
-    'papierwerke',
-    'papillotomy',
-    'pappenheim',
     'parcita',
-    'parfrey',
-    'parquetry',
-    'parroted',
-    'parslows',
-    'participant-roles',
-    'particulier',
-    'partner(s)',
-    'partway',
-    'party-size',
-    'parvenus',
-    'pascoal',
-    'pashley',
-    'pass-back',
-    'passagework',
-    'passbook',
     'pastons',
-    'patchway',
-    'pate_de_foie_gras',
-    'patentees',
-    'patisseries',
-    'patrolmen',
-    'patternings',
-    'paulos',
-    'pauperization',
-    'paviors',
-    'pbmcs',
-    'pc/at',
-    'pcbcr',
-    'pcsps',
-    'pcv',
-    'pdms',
     'pea-sized',
-    'peahens',
-    'pecos',
-    'peddars',
-    'peddler',
-    'pedestrian-friendly',
-    'pedretti',
-    'peel-off',
-    'pegmatites',
-    'peignoir',
-    'peke-faced',
-    'pellington',
-    'pellucida',
-    'pelycosaurs',
-    'pen-portraits',
-    'penning-rowsell',
     'pensec',
-    'pentwyn',
-    'peptone',
-    'perambulators',
-    'percha',
-    'percipience',
-    'percussionists',
-    'perfects',
-    'performance-wise',
-    'perfumers',
-    'perivascular',
-    'permissable',
-    'peronism',
-    'perricos',
-    'perring',
-    'personalisation',
     'persymmetric',
-    'perugini',
-    'perversities',
-    'pesme',
-    'pestiferous',
-    'pet-owners',
-    'petkel',
-    'petrifying',
-    'petrikova',
-    'petrodollars',
-    'petrotechnical',
-    'pexlib',
-    'pf1/1',
-    'pgex-2t',
-    'pharisaic',
-    'pharyngitis',
     'phenolics',
-    'phenotypically',
-    'philae',
-    'philately',
-    'philhellenes',
-    'philonym',
-    'philpotts',
-    'phipson',
-    'phobos',
-    'phonebox',
-    'phoneticians',
-    'photo-sensitive',
-    'photofits',
-    'photoreception',
-    'phragmites',
-    'physiques',
     'phytogenetic',
-    'piatkus',
-    'pick-your-own',
-    'pickvance',
-    'pie-charts',
-    'pierluigi',
-    'pierre-saint-martin',
-    'pierrefitte',
-    'pietistic',
-    'piezo-electric',
-    'pigeonholed',
-    'pilier',
-    'pilkinsulation',
-    'pimiento',
-    'pimlott',
-    'pin-stripes',
     'pine-needle',
-    'pinger',
-    'pinjarra',
-    'pinkly',
-    'pinnies',
-    'pint/2&frac12',
-    'pipe-trained',
-    'pipper',
-    'pippins',
-    'piran',
-    'pirsig',
-    'pitbull',
-    'pla&icirc;t',
-    'place-based',
-    'placidia',
-    'planeloads',
     'planetaries',
-    'planform',
-    'plastica',
-    'platelayers',
-    'platydoras',
-    'playtimes',
-    'pleasence',
-    'pleaser',
-    'pleaseth',
-    'pleming',
-    'plesiosaur',
-    'plexiglas',
-    'plin',
-    'plumbline',
-    'pluriactivity',
-    'plutonic',
     'pluvial',
-    'pml',
-    'pmp',
-    'pocket-size',
-    'pocketbook',
-    'point-by-point',
-    'polarizability',
-    'polepieces',
-    'poleward-moving',
-    'politically-sensitive',
-    'polja',
-    'polyandrous',
-    'polychromatic',
-    'polyisobutylene',
-    'polymetallic',
-    'polynyas',
     'polytechnics/colleges',
-    'pomaks',
-    'ponderousness',
-    'pondkeepers',
-    'ponsa',
-    'ponting/league',
-    'pookas',
-    'pool-jones',
-    'poorhouses',
-    'portchester',
-    'portiera',
-    'portopulmonary',
-    'posey',
-    'possesion',
-    'post-april',
-    'post-siberian',
     'post-synaptic',
-    'postcoital',
-    'posteriors',
-    'potboilers',
-    'potshots',
-    'poughkeepsie',
-    'poulteney-crosse',
-    'poulterer',
-    'power/4',
-    'pp.98&ndash;9',
-    'ppatrc5',
-    'ppls',
-    'pr&eacute;lude',
-    'prachner',
-    'pre-associateship',
-    'pre-b',
     'pre-cbs',
-    'pre-competitive',
-    'pre-contractual',
-    'pre-game',
-    'pre-head',
-    'pre-hellenic',
-    'pre-inca',
-    'pre-legal',
-    'pre-political',
-    'pre-prandial',
-    'pre-select',
-    'pre-senile',
-    'pre-structured',
-    'preachy',
-    'predella',
-    'preformation',
     'pregenital',
-    'prehistorian',
-    'prelinger',
-    'prelingually',
-    'premises.',
-    'preneste',
-    'preppy',
-    'prescribable',
-    'presocial',
-    'pressure-sensitive',
-    'preston-mafham',
-    'presymptomatic',
-    'pretarsus',
-    'price-conscious',
-    'print/retain/delete',
-    'printhead',
     'prison-camp',
-    'privative',
-    'prizefighter',
-    'pro-celebrity',
-    'pro-plo',
-    'pro-tory',
-    'pro-yeltsin',
-    'proba',
-    'problem-solvers',
-    'problem.solving',
-    'procreative',
-    'procyclin/parp',
-    'product/service',
-    'productivities',
-    'profitbosses',
-    'prognostication',
     'progressionism',
-    'prokaryotic',
-    'proles',
-    'proliferators',
-    'pronunciamiento',
-    'propliner',
-    'propter',
-    'prorogation',
-    'prosperous-looking',
-    'protestingly',
-    'protractors',
-    'protz',
-    'provisionality',
-    'prowlers',
-    'proximo-distal',
-    'prpb',
     'prt.0',
-    'psalm-settings',
-    'psephological',
-    'pseudo-religious',
-    'pseudonymous',
-    'pseudoscience',
-    'psi/ft',
-    'psi2',
-    'psyching',
-    'psychocentric',
-    'publicity-shy',
-    'pumpy',
-    'punchball',
-    'punctata',
-    'punishingly',
-    'punitiveness',
     'pur&eacute;es',
-    'purgatorial',
-    'purifier',
-    'purnell/thames',
-    'puromycin',
-    'purposed',
-    'purry',
-    'pursuant',
-    'purveys',
-    'push-chairs',
-    'pussyfooting',
-    'putman',
-    'puzznic',
-    'pvmc3',
-    'pvs',
-    'px/iris',
     'pydna',
-    'pyrah',
-    'pyramid-shaped',
-    'pyroclastics',
-    'q34',
-    'q7',
-    'q8',
-    'qft',
-    'quadrangular',
-    'quadrimaculata',
-    'quadriplegic',
-    'quantitate',
-    'quantization',
-    'queerest',
-    'quesada',
-    'questionaire',
     'quietism',
-    'quietus',
-    'quil&egrave;s',
-    'quinlivan',
-    'quinolone',
-    'quinquennium',
-    'quint',
-    'r&aring;dhuspladsen',
-    'r&iacute;os',
-    'r.f.i.',
-    'r.h.a.',
-    'r.o.',
-    'r.s.a.',
-    'r2(2)',
-    'r20',
-    'race-horses',
     'racemic',
-    'radiochemical',
-    'raes',
-    'raffael',
-    'raffe',
-    'raggett',
-    'raigmore',
-    'railheads',
-    'railway-workers',
-    'raimondi',
-    'raisonn&eacute;s',
-    'rakhman',
-    'ramets',
-    'ramsey-optimal',
-    'ranade',
-    'ranbir',
     'ranfurly',
-    'rankilburn',
-    'rankine',
-    'rareness',
-    'rases',
-    'rastrick',
-    'ratable',
-    'rathausplatz',
-    'raw-boned',
-    'ray-bans',
-    'razor-blades',
-    'rcf',
-    're-adjustment',
-    're-adopted',
-    're-consider',
-    're-construction',
     're-cycle',
-    're-dialling',
-    're-doing',
-    're-echo',
-    're-editing',
-    're-ignition',
-    're-location',
-    're-roll',
-    're-roofed',
-    're-selection',
-    'reactivities',
-    'readeption',
-    'ready-loaded',
-    'readymade',
-    'reaktion',
-    'reason(s)',
     'reasonable.',
-    'reconvenes',
-    'reconversion',
-    'record-breakers',
-    'recrudescence',
-    'recusancy',
-    'red-coated',
-    'red-coloured',
-    'red-footed',
-    'red-pied',
-    'red-stained',
-    'red-winged',
-    'redefinitions',
-    'redeliver',
-    'rednall',
-    'rednecks',
     'redoaks',
-    'redrew',
-    'reducibility',
-    'reeves-smith',
-    'refits',
-    'refloating',
-    'reformations',
-    'reframing',
-    'refuser',
-    'regard_to',
-    'region-wide',
-    'regions.',
-    'reichskanzlei',
-    'reichsmarshal',
-    'reinaldo',
-    'reinsertion',
     'reinstates',
-    'reinterpretations',
-    'relatedly',
-    'relationally',
-    'relativists',
-    'relativities',
-    'relegation-haunted',
-    'renewable-energy',
-    'renormalizable',
-    'reo',
-    'reparative',
-    'repellents',
-    'replenishes',
-    'replenishments',
-    'reprobation',
-    'reproducer',
     'reproves',
-    'research-oriented',
-    'resectable',
-    'resettlers',
-    'residential/nursing',
-    'resite',
-    'respecters',
-    'respectively.',
-    'respites',
-    'restimulation',
-    'restrictiveness',
-    'resus',
-    'resus.',
-    'reszke',
-    'retells',
-    'reticulata',
     'retractors',
-    'retroscendence',
-    'revelries',
-    'revetment',
-    'reviewz',
-    'reviver',
-    'rewritings',
-    'reynell',
-    'rgm',
-    'rhegion',
-    'rhetorics',
-    'rheumatics',
-    'rhodesias',
-    'rhombomeres',
-    'rhyll',
-    'rib-tickling',
     'ribopatterns',
-    'riborg',
-    'ricardian',
-    'ricercar',
-    'richhill',
-    'ricke',
-    'ridgeon',
-    'ridgewell',
-    'riggins',
-    'right-hemisphere',
-    'right-to-left',
-    'rigors',
-    'rigourous',
-    'riles',
-    'rindi',
-    'risc/ultrix',
     'riseman',
-    'riskily',
-    'ritualism',
-    'riving',
-    'road-builders',
-    'road/rail',
-    'roadburg',
-    'robartes',
-    'robur',
-    'rockabilly\'n\'country',
-    'rod-shaped',
-    'rogelio',
-    'roger-patrice',
-    'roig',
-    'roin',
-    'roja',
     'rolande',
-    'role-reversal',
-    'rolex-jackie',
-    'roll-along',
-    'roller-skates',
-    'romancer',
-    'romanists',
-    'romanticization',
-    'romantsev',
-    'romper',
-    'ront',
-    'roofline',
-    'roombed',
-    'roommate',
-    'ropac',
-    'roquefeuil',
     'rorie',
-    'rorims',
-    'rosenburg',
-    'rosicrucians',
-    'ross/scotland',
-    'rosstrevor',
-    'rotarians',
-    'rotative',
-    'rotoiti',
-    'rotoroa',
-    'rough-coated',
-    'rounding-off',
-    'rowbottom/swindon',
-    'rowlocks',
-    'roy-smith',
-    'royalton-kisch',
     'roydale',
-    'roylance',
-    'rrnd',
-    'rs2000',
-    'rubber-tappers',
-    'rubie',
-    'rubiks',
-    'ruihuan',
-    'ruiperez',
-    'ruiz-gim&eacute;nez',
-    'rula',
-    'rulebooks',
-    'rumanians',
-    'rumors',
-    'rumour-mongers',
-    'running-mates',
     'runscorer',
-    'runton',
-    'rush-seated',
-    'rushy',
-    'ruskinian',
-    'russo-german',
-    'russo-turkish',
-    'rustly',
-    'ruxley',
-    'rydell',
-    's(n)',
-    's-adenosyl',
-    's-tek',
-    's.11',
-    's.133',
-    's.14',
     's.25',
-    's.5',
-    's.5(3)',
-    's.53(2)',
-    's.8',
-    's.92',
-    's.c.f.',
-    's.e.m',
-    's.frugiperda',
-    's.o.s.',
-    's/n',
-    's10(1)',
-    's102',
-    's103(1)',
-    's103(3)',
-    's11(1)',
     's11(4)',
-    's1263',
-    's137',
-    's14(6)',
-    's171',
-    's2(3)',
-    's40',
-    's430c',
-    's61',
-    's69(1)',
-    's70(1)',
-    's740(5)',
-    's741',
-    's86',
-    'sa55',
-    'saadawi',
     'sacambambaspis',
-    'saccadic',
-    'sad-looking',
-    'saddlecloth',
-    'sadhu',
-    'saint-gilles',
-    'saint-palais',
-    'saint-sauveur-le-vicomte',
-    'saint-venant',
-    'saintes-maries',
-    'salam-weinberg',
-    'sallie',
-    'salmon-pink',
-    'saloky',
-    'salt-stained',
-    'same-again',
     'sanctimoniously',
-    'sandwood',
-    'sanni',
-    'sansamp',
-    'sant\'andrea',
-    'santucci',
-    'sartorially',
-    'sassafras',
-    'satisfiers',
-    'satterley',
-    'saturations',
-    'saughall',
-    'saunder',
-    'savov',
-    'savtec',
-    'saw-toothed',
     'saxe-coburg',
-    'sb1',
-    'sc&icirc;nteia',
-    'scadding',
-    'scaled-up',
-    'scalia',
-    'scalpay',
-    'scandalising',
-    'scandens',
-    'scansion',
-    'scarily',
-    'sceattas',
-    'scg',
-    'schapiro',
-    'schauspielhaus',
-    'scherzi',
     'scheurweghs',
-    'schiavone',
-    'schieffelin',
-    'schiltrons',
-    'schneeweis',
-    'schoenbergian',
-    'schomberg',
-    'school-friends',
-    'school-wide',
-    'schools/colleges',
-    'schumpeterian',
-    'scillies',
-    'scissor-like',
-    'scni',
-    'scooting',
-    'scoping',
     'scorgie',
-    'scoters',
-    'scotland-wide',
-    'scotswoman',
-    'scourers',
-    'screwy',
-    'scrimshaws',
-    'scrollwork',
-    'scruffily',
-    'scrumping',
-    'scrutinizes',
-    'scsi-ii',
-    'scud-b',
-    'scullard',
-    'scumble',
-    'sdrp',
     'seafoods',
-    'seaga',
-    'seamline',
-    'seasalt',
-    'seawell',
-    'sebae',
-    'sebeok',
-    'second-minute',
-    'secretagogue',
-    'secretary/manager',
-    'secularity',
-    'secureware',
-    'seductress',
-    'see-er',
-    'seedsman',
-    'seiner',
     'seismicity',
-    'seismologist',
-    'self-deprecatory',
-    'self-enforcing',
-    'self-injuries',
-    'selinus',
-    'selvagens',
-    'semantics/pragmatics',
-    'semi-basement',
-    'semi-mystical',
-    'semi-secret',
-    'semi-voluntary',
-    'semicrystalline',
-    'semifinal',
-    'sempervirens',
-    'sempiternal',
     'senates',
-    'senoi',
-    'sense-spectra',
-    'sensei',
-    'senselessly',
-    'sensori-motor',
-    'separatives',
-    'sequester',
-    'sequestrants',
-    'serefeli',
-    'sergeant-chef',
-    'sergey',
-    'seringueiros',
-    'seroconverters',
-    'serres',
-    'servus',
     'ses/objectbench',
-    'set-theoretic',
-    'seven\'s',
-    'seven-fifteen',
-    'seventh-seeded',
-    'seychellois',
-    'sgn',
-    'shadgeldi',
-    'shaftsbury',
-    'shagari',
-    'shakiness',
-    'shamingly',
-    'shandies',
-    'shangri',
-    'shapelessly',
-    'sharavyn',
     'sharecroppers',
-    'shareowners',
-    'sharkskin',
-    'sharpshooters',
-    'shavian',
-    'shc',
-    'shchapov',
-    'she-mules',
-    'sheavyn',
-    'shee-it',
-    'sheep-like',
-    'sheil',
-    'shek',
-    'shellholes',
-    'shepperd',
-    'sherbourne',
     'shergar',
-    'sherry-coloured',
-    'sherwoods',
-    'shi\'ites',
-    'shiftily',
-    'shifty-eyed',
-    'shih-sen',
-    'shimada',
-    'shiners',
-    'ship-shape',
-    'shiranikha',
-    'shoddily',
-    'shoe-gazers',
-    'shonen',
-    'shop-windows',
-    'shopfitter',
     'short-circuits',
-    'short-necked',
-    'short-termers',
-    'shortfields',
-    'shot-guns',
-    'shoulder-straps',
-    'showbands',
-    'shredders',
-    'shrewton',
-    'shucks',
-    'shwebo',
-    'siberians',
-    'sich',
-    'sideburn',
-    'sideman',
-    'sidewall',
     'sidewalls',
-    'sigistrix',
-    'sigmoidal',
-    'sigmoidoscope',
-    'signalboxes',
-    'signallers',
-    'signboards',
-    'significatory',
-    'sileby',
-    'sillocks',
-    'silpa-archa',
-    'silvana',
-    'silverberg',
-    'similarly-sized',
-    'simpatico',
-    'sin-binned',
     'sinfonie',
-    'sing-songs',
-    'singaround',
-    'singulars',
-    'sinkhole',
-    'sinkings',
-    'siphnian',
-    'sitting-rooms',
-    'six-fifteen',
-    'six-minute',
-    'six-under',
-    'sixth-largest',
-    'sk-n-sh',
-    'skaldic',
-    'skeldale',
-    'skiable',
     'skin\'',
-    'skynner',
-    'skyscapes',
-    'slap-happy',
-    'slate-roofed',
-    'slaughterman',
-    'sleep-safe',
-    'slewy',
-    'slicking',
-    'slightingly',
-    'slim-fitting',
-    'slimcea',
-    'slimly',
-    'slingbacks',
-    'slipperiness',
-    'slipways',
     'slothrop',
-    'slovenliness',
-    'slow-acting',
-    'sluttish',
-    'smackers',
-    'smallbury',
-    'smith/gloucester',
-    'smith/oxford',
-    'smithwicks',
-    'smitti',
-    'sn12',
-    'sn8000',
-    'snakelike',
-    'snakepit',
-    'snellen',
-    'snf',
     'snorter',
-    'snower',
-    'snowline',
-    'snuffboxes',
-    'snugness',
-    'so_erm_that',
-    'social-d&eacute;mocrate',
-    'socially-oriented',
-    'sociologism',
-    'sodbury',
-    'soft-left',
-    'soft-soled',
-    'soi-disant',
-    'soign&eacute;e',
-    'solarisation',
-    'soldeu',
     'solemnities',
-    'solenoids',
-    'solvable',
-    'some-one',
-    'somersetshire',
-    'son_et_lumi&egrave;re',
-    'soothsayers',
-    'sortal',
-    'sosuke',
-    'sotiris',
-    'soulmates',
-    'soundboards',
-    'sousse',
-    'southerness',
-    'sovietskaya',
-    'spaciously',
     'spadefoots',
-    'spahis',
-    'spanish-owned',
-    'sparseness',
-    'sparsholt',
-    'spasov',
-    'speciesist',
-    'speciosa',
-    'specmarks89',
-    'spectrophotometric',
-    'spendthrifts',
-    'spermatogenesis',
-    'sperrle',
-    'sphincteric',
-    'sphincters',
-    'spicier',
     'spier',
-    'spikiness',
-    'spillway',
-    'spindle-shaped',
-    'spiniform',
-    'spiracles',
-    'spite_of',
-    'spleens',
-    'spoil-heaps',
-    'spolka',
-    'spoolers',
-    'spos',
-    'spreadsheet-like',
-    'springboards',
-    'springers',
-    'spritely',
     'spruced-up',
-    'spsg',
-    'sq.m.',
-    'sql*plus',
-    'squirrel-like',
-    'squirrell',
-    'srp60n',
-    'ss.1',
-    'ssdf',
-    'st-germain-des',
-    'st-josse',
-    'stableman',
-    'staff/student',
-    'staffs.',
-    'stagers',
-    'staggs',
     'stairlifts',
-    'stalagmitic',
-    'stall-holder',
-    'stallworthy',
-    'standard-sized',
-    'stanislas',
-    'stanislavskian',
-    'stanovich',
-    'stantondale',
-    'start-rite',
-    'startles',
-    'stationmasters',
-    'stator/rotor',
-    'staudinger',
-    'steadiest',
-    'stelai',
     'stellate',
-    'stem-cuttings',
-    'stepchild',
-    'stephanopoulos',
-    'stepless',
-    'stetchworth',
-    'stetsky',
-    'stickier',
-    'sticklers',
-    'stiffish',
-    'stigmatization',
-    'stil',
-    'stilwell',
-    'stn',
-    'stockham',
-    'stockwork',
     'stoica',
-    'stola',
-    'stoles',
-    'stonehatch',
-    'storm-lashed',
-    'stormtroopers',
-    'stouts',
-    'stps',
-    'strange-sounding',
-    'stratify',
-    'street-lights',
-    'strengthener',
-    'stress-induced',
-    'stricta',
-    'striggio',
-    'strike-prone',
     'stroboscope',
-    'strong-running',
-    'structure-specific',
-    'structureless',
-    'strung-out',
-    'strype',
-    'stunners',
-    'stupid.',
-    'sturm-ruger',
-    'style-conscious',
-    'sub-&dollar;5,000',
-    'sub-&pound;2',
-    'sub-adults',
-    'sub-base',
-    'sub-divide',
-    'sub-organizations',
     'sub-sahara',
-    'sub-sectors',
-    'sub-shells',
-    'sub-spaces',
-    'sub-tasks',
-    'sub-trees',
-    'subaxial',
-    'subconfluent',
-    'subfulminant',
-    'subfusc',
-    'subglobular',
-    'subhorizontal',
-    'subirachs',
-    'subjacent',
-    'subject(s)',
-    'subject/predicate',
     'sublation',
-    'submandibular',
-    'subplot',
-    'subrahmanyam',
-    'subsidizes',
-    'substantiates',
-    'substituent',
-    'subsumption',
-    'subtends',
-    'succinctness',
-    'such_like',
-    'sudeten',
-    'sudies',
-    'suedes',
-    'sueur',
-    'suffolks',
     'sulkiness',
-    'sullenness',
-    'sulph.',
-    'sun-loungers',
-    'sun-up',
-    'sunlaws',
-    'sunnydale',
-    'super-featherweight',
-    'super-g',
-    'super-hero',
-    'super_duper',
-    'superfield',
-    'superfluously',
-    'supergen',
-    'superimposes',
-    'superinfection',
     'superspec',
-    'supramaximal',
-    'supramolecular',
-    'suprisingly',
-    'surabaya',
-    'surat',
-    'suslov',
-    'sustentation',
-    'svartvik',
-    'sw14',
-    'sw15',
-    'sw9',
-    'swannell',
-    'swannson-on-wheels',
-    'swaythling',
-    'sweepings',
     'swf',
-    'swift-hook',
-    'swiftlets',
-    'swineherd',
-    'swing-doors',
-    'swots',
-    'sy1',
-    'syllable-final',
-    'sylvopastoral',
-    'symposiums',
-    'syncretistic',
-    'syndicalists',
-    'synecdoche',
-    'synkinematic',
-    'system-independent',
-    'systematisation',
     'szuluk',
-    't&amp;g',
-    't&amp;gwu',
-    't&amp;m',
-    't-g',
-    't-groups',
-    't-series',
-    't.a.',
-    't.u.c.',
-    'tabla',
-    'table-cloths',
-    'table-mats',
-    'table/figure',
-    'tablespoonful',
-    'tabuchi',
-    'tachymetabolic',
     'tachyons',
-    'taciturnity',
-    'tafos',
-    'taft-hartley',
-    'tailormade',
-    'takin',
-    'talbots',
-    'talgarth',
-    'tall-growing',
-    'tallentires',
-    'tan-coloured',
-    'tangney',
-    'tape-slides',
-    'taras',
-    'tarsiers',
-    'taties',
     'taurodeoxycholic',
-    'tawny-coloured',
-    'tax-approved',
-    'taxicabs',
-    'taylerson',
-    'taylor-gooby',
-    'taylor-morgan',
-    'taymouth',
-    'tbt',
-    'tdy',
-    'teacher-centred',
-    'team-manager',
-    'tear-stains',
-    'teatao',
-    'tebbutt',
-    'tecum',
     'teddy-bears',
-    'tedi',
-    'tee-off',
-    'teeniest',
-    'teesville',
-    'teeters',
-    'tehyi',
-    'telarc',
-    'telemetric',
-    'telepath',
-    'telescopically',
-    'telfos',
-    'tell-tales',
-    'telling-off',
-    'tembisa',
-    'temperately',
     'temple-morris',
-    'tendentiously',
-    'tensioners',
-    'tenters',
-    'tepe',
-    'tergal',
-    'terrane',
-    'terrarium',
-    'tervahauta',
-    'test-drive',
-    'test-status-are',
-    'testings',
-    'tetra-acetic',
-    'tetraplex',
-    'tg1',
-    'tga',
     'thalassaemia',
-    'thanksgivings',
-    'thapa',
-    'thecodontians',
-    'thecodonts',
-    'theodicy',
-    'thermochemical',
-    'thessalonica',
-    'thick-soled',
-    'thick-walled',
-    'thicknesser',
-    'thijs',
-    'thin-section',
-    'thingummybob',
-    'thionville',
-    'third-country',
     'thirkell',
-    'thirty-sixth',
-    'thirty-two-bar',
-    'thirtysomethings',
-    'thomas-ferrand/governor',
-    'thompson/thames',
-    'thoms',
-    'thonemann',
-    'thongsouk',
-    'thopas',
-    'thoresen',
-    'thought-flow',
-    'thp-1',
-    'three-band',
-    'three-dimensionally',
-    'three-spined',
     'thriftiness',
-    'thriftless',
-    'thromboxanes',
-    'thumbprints',
-    'thun-hohensteins',
-    'thunderball',
-    'thunderbass',
-    'thunderheads',
-    'thuringian',
-    'thursby',
-    'thyroglobulin',
-    'thysanura',
-    'tideless',
-    'tidworth',
-    'tie-ups',
-    'tied-in',
     'tieghi',
-    'tieless',
-    'tilbrook',
-    'tilton',
-    'timberwork',
-    'timbs',
-    'time-averaged',
-    'time-locked',
-    'time-periods',
-    'time-tabled',
-    'time-tables',
-    'time-warped',
-    'time-zones',
-    'tin-dipped',
-    'tinctorum',
-    'tinglingly',
     'tip-tilted',
-    'tirith',
-    'tirole',
-    'tiryns',
-    'tita',
-    'tithing',
-    'tivey',
-    'tm262',
-    'tmrtc',
-    'tn.',
-    'tnb',
-    'to\'',
-    'tobashi',
-    'toe-hold',
-    'tokyo-based',
-    'toland',
     'tolkienian',
-    'tomdoun',
-    'tommy-guns',
-    'tompson',
-    'tone-deaf',
-    'too-high',
-    'too-long',
-    'toothpastes',
-    'top-priced',
-    'top-ups',
-    'topi',
-    'topic-based',
-    'topsoils',
-    'toril',
-    'tormentingly',
-    'torrells',
     'totalisations',
-    'tothill',
-    'tottington',
-    'tovey',
-    'towerblock',
-    'townhead',
-    'townsley',
-    'toylike',
-    'trabecular',
-    'traben-trarbach',
-    'trad.',
-    'trade-mark',
-    'tradename',
-    'tradeoff',
-    'traffics',
-    'tragical',
     'trailblazers',
-    'train-sheds',
-    'train-spotters',
-    'tranchettes',
-    'transactivate',
-    'transalpina',
-    'transitionary',
-    'translocations',
-    'traumatically',
-    'treasonous',
-    'treasons',
-    'trebetherick',
-    'trebuchet',
-    'tredell',
-    'tree-fringed',
-    'treforest',
     'trelleborg',
-    'trendsetters',
-    'trestle-tables',
-    'tribally',
-    'trichloroacetic',
-    'tridents',
-    'trihedron',
-    'tripotassium',
-    'tritely',
-    'trop',
-    'trotskyites',
-    'troubleshooters',
-    'trouser-suit',
-    'trustfully',
-    'truth-conditions',
-    'truth-values',
     'ttg',
-    'tuae',
-    'tuberville',
-    'tuc-affiliated',
-    'tuddenham',
-    'tuffet',
-    'tuke',
-    'tundra.',
-    'tunefulness',
-    'tuong',
-    'turbay',
-    'turbochargers',
-    'turbodrive',
-    'turnpenny',
-    'turtons',
-    'tushes',
     'tutee',
-    'tutin',
-    'tutus',
-    'tvmm',
-    'tweddell',
-    'tweedsmuir',
-    'twelve-bar',
-    'twenty-five-year-old',
-    'twenty-pound',
-    'twentysomethings',
-    'twickers',
-    'twinn',
-    'twits',
-    'two-bar',
-    'two-bladed',
-    'two-footed',
     'two-hundred',
-    'two-hundredths',
-    'two-plus-two',
-    'two-to',
-    'two-twenty',
-    'two-wire',
-    'two/three',
-    'twogates',
-    'u87',
-    'uars',
-    'ubayd',
-    'ubial',
-    'ubp',
-    'udege',
-    'uexkull',
-    'ufologists',
     'uie',
-    'ultra-clean',
-    'ultrafoot',
-    'ultramontane',
-    'ultrasparc-iii',
-    'umilta',
-    'un-christian',
-    'un-islamic',
-    'unabashedly',
-    'unaccepted',
-    'unapologetically',
-    'unatt',
-    'unattractively',
-    'unbalances',
-    'unbrushed',
-    'unbuckle',
     'uncertain\'',
-    'uncertified',
-    'uncirculated',
-    'uncodified',
-    'uncompromised',
-    'unconformities',
-    'unconventionality',
-    'undeceived',
-    'under-butler',
-    'under-financed',
-    'under-insurance',
-    'under-occupancy',
-    'under-production',
-    'under-ripe',
-    'undercard',
-    'undercoats',
     'underconstrained',
-    'underdetermined',
-    'underemphasized',
-    'undergarment',
-    'underpayments',
-    'underpopulated',
-    'understrength',
-    'understudied',
-    'undogmatic',
-    'undulator',
-    'unendowed',
-    'unenterprising',
-    'unexpanded',
-    'unfavoured',
-    'unfired',
-    'unforgettably',
     'unfortified',
-    'unglued',
-    'ungraspable',
-    'ungrazed',
-    'unifiers',
-    'uniimog',
-    'unimaginatively',
-    'unimpeachably',
-    'uninfluential',
-    'uninterpreted',
-    'uninterruptible',
-    'unionise',
-    'units/ml',
-    'universit&eacute',
-    'unlikeliness',
-    'unlived-in',
     'unlocated',
-    'unmarriageable',
-    'unmeritorious',
-    'unmetalled',
-    'unmindful',
-    'unmuzzled',
-    'unnavigable',
-    'unnormalised',
-    'unnoted',
-    'unordered',
-    'unpatterned',
-    'unpersuasive',
-    'unpleasurable',
-    'unprofessionally',
-    'unpropertied',
-    'unreadiness',
     'unresisted',
-    'unrestored',
-    'unrighteousness',
-    'unrra',
-    'unseasoned',
-    'unseeable',
-    'unsegregated',
-    'unshiftable',
-    'unshuttered',
-    'unsmoothed',
-    'unsoftened',
-    'unstamped',
-    'unstretched',
-    'unstudied',
-    'unsuspectingly',
-    'unsystematically',
     'untraditional',
-    'untransformed',
-    'unverified',
-    'unweaned',
-    'unworkability',
-    'upper-bound',
-    'upper-storey',
-    'upritchard',
-    'upscale',
-    'upturns',
-    'upward_of',
-    'uraninite',
-    'uribe',
-    'urien',
-    'us&dollar;13,000',
-    'us&dollar;18,000,000',
     'us&dollar;180',
-    'us&dollar;2',
-    'us&dollar;2,200',
-    'us&dollar;2,400',
-    'us&dollar;22,000',
-    'us&dollar;240',
-    'us&dollar;25,000,000',
-    'us&dollar;250,000,000',
-    'us&dollar;3,900',
-    'us&dollar;30,000,000',
-    'us&dollar;40',
-    'us&dollar;450',
-    'us&dollar;6,600',
-    'us&dollar;70,000',
-    'us&dollar;80,000,000',
-    'us-dominated',
     'us-supplied',
-    'ust-kamenogorsk',
-    'usurpations',
-    'utd.',
-    'v&amacr;naprasthin',
-    'v&eacute;ronique',
-    'v-1',
-    'v-necked',
-    'v-signs',
-    'v.32',
-    'v.32terbo',
-    'v.d.u.',
-    'v2000',
-    'vacates',
-    'vaclev',
-    'vacuously',
     'vaginally',
-    'vagus',
-    'valdo',
-    'validators',
-    'valorisation',
-    'valorous',
-    'valtr',
-    'vampish',
-    'vanderheld',
-    'vanderplas',
-    'vanload',
-    'vannes',
-    'varenne',
-    'varennikov',
-    'varian',
-    'variegations',
     'varietal',
-    'vasoconstrictor',
-    'vasodilatation',
-    'vasodilators',
-    'vehicle-taking',
-    'vellacott',
-    'vellan',
-    'venatio',
-    'venepuncture',
-    'vereniging',
-    'vermicelli',
-    'vesiculation',
-    'vestfold',
-    'veterna',
-    'vicarius',
-    'video-recordings',
     'videogram',
-    'vidi/o',
-    'vids',
-    'vies',
-    'vigilantly',
-    'vignoble',
-    'vilar',
-    'vilson',
-    'vinogradov',
-    'violator',
-    'virgate',
-    'virgos',
-    'viscus',
-    'visicalc',
-    'vitalite',
-    'viviparous',
     'viz-&agrave;-viz',
-    'vocatives',
-    'voevody',
-    'vogt',
-    'vogues',
-    'vol-au-vents',
-    'vol.36',
-    'volcaniclastic',
-    'volcanology',
-    'volens',
-    'volx',
-    'vorticist',
-    'vot',
-    'vowel-sounds',
-    'vr422',
-    'vsx4',
     'vulcano',
-    'vulkov',
-    'vulpine',
-    'vulture-like',
-    'vunerable',
-    'vvd',
-    'vxl',
-    'w&amp;m',
-    'w.e.',
-    'w.t.',
-    'w1282x',
-    'w1y',
-    'wacc-pacific',
-    'wadati-benioff',
-    'wagonettes',
-    'wahlberg',
     'wait&mdash;flag',
-    'waiting-lists',
-    'walbury',
-    'waldhof-aschaffenburg',
-    'wallhead',
-    'walloons',
-    'walton-on-the-naze',
-    'wannemacher',
-    'war-weary',
-    'warba',
-    'wardenships',
-    'warm-ups',
-    'warmish',
-    'warneford',
-    'warrantors',
-    'wartberg',
     'washermen',
-    'wassail',
-    'wassilieff',
-    'wastrels',
-    'water-wheels',
-    'watersport',
-    'wave/particle',
-    'waverton',
-    'wb188',
-    'wdrn',
-    'we/us/our/general',
-    'wealth-holders',
-    'weary-looking',
-    'weatherstaff',
-    'weathertop',
-    'weatherwise',
     'weberians',
-    'weeing',
-    'weekly-collection',
-    'weightiness',
-    'weird-looking',
-    'weissbier',
-    'welfare-dependent',
-    'well-filtered',
-    'well-honed',
-    'well-merited',
-    'well-regulated',
-    'well-seasoned',
-    'well-watered',
-    'well-wrapped',
-    'well_of',
-    'welney',
     'west-south',
-    'westoe',
-    'wet-rice',
-    'wet/dry',
-    'wexham',
-    'wgpti',
-    'what-have-you',
-    'whatpc',
-    'wheat-coloured',
-    'wheatfields',
-    'wheatley/oxfordshire',
-    'wheen',
-    'wheey',
-    'whewell',
-    'white-bellied',
-    'whiteboard',
     'whiter-than-white',
-    'whitla',
-    'whittam-smith',
-    'whittingdale',
-    'whittox',
-    'whizzy',
-    'whoomph-whoomph',
-    'whydah',
-    'whydahs',
-    'wibbly',
-    'wicketkeepers',
-    'widdup',
-    'wigginton',
-    'wilkos',
-    'willaston',
-    'willebrand',
     'wilmore',
-    'wilsey',
-    'wiltshier',
-    'wimsey',
-    'wine-glasses',
-    'winebars',
-    'wing-halves',
-    'winsper',
-    'winwick',
-    'wire-framed',
-    'wirelesses',
-    'wirksworth',
-    'wittered',
-    'wkts',
-    'wmyc',
-    'wober',
     'wojtyla',
-    'wonderings',
-    'wontons',
-    'woodbury',
-    'woolbox',
-    'woollaton',
-    'woolliness',
-    'woosh',
-    'word-games',
-    'word-pair',
-    'work-cards',
-    'work-groups',
-    'work-mates',
-    'work-places',
-    'work-station',
-    'working-out',
     'worm-like',
-    'writeable',
-    'writer(s)',
-    'writer/director',
-    'writer/intellectual',
-    'wurttemberg',
-    'wwc',
-    'wycomb',
-    'wyles',
-    'wyville',
-    'x4',
-    'xb2',
-    'xb3',
-    'xb4',
-    'xb7',
-    'xcii',
     'xcl',
-    'xd3',
-    'xe6',
-    'xenonyms',
-    'xf4',
-    'xi\'s',
-    'xii\'s',
-    'xiv.',
-    'xliii',
-    'xlvi',
-    'xrd',
-    'xrf',
-    'xv\'s',
-    'yablonskaya',
-    'yad',
-    'yankeleh',
     'yant',
-    'yaqubi',
-    'yas',
-    'yately',
-    'yaya',
-    'yazoo',
-    'yehuda',
-    'yenici',
-    'yes-men',
-    'yips',
-    'yobboe',
-    'yomiuri',
-    'yordan',
-    'yorkies',
-    'yoshiro',
-    'youth-oriented',
     'yssgaroth',
-    'yts/yt',
-    'yua',
-    'yukagirs',
-    'z%',
-    'z-parameters',
-    'z.506b',
-    'zahedis',
-    'zappala',
-    'zayd',
-    'zeming',
-    'zero-zero-niner-zero-fiver-niner',
-    'zhkh',
-    'zingy',
-    'ziyad',
-    'zoila',
     'zona-free',
-    'zooids',
-    'zoroastrians',
-    'zuhra',
-    'zwicky',
-    'zygo',
+)
+
+blocks_21 = (
+    '!)mdash;not!\'ndash;n!+pound;1,550*"60)#950(#.53*!5($0.1m*!3*!4+!m*"75)/0&ndash;150,000*+,000-a-year)!1',
+    ')"5m)%7,000($2.90)!1)!3)"50)$9.95($3.25*!7($4.14*!3+!m)!4)!8)%9.95p',
+    ')(0million($6.6m*"80*!9($7.5m)!4)!9($8.45*"5m($9.5m\'%2,087($.2bn)"89(#0.5)$0.00',
+    '(#1.3*"99)%2,000($2.5m)"0m)%7,000)!8("39("42(25,000&ndash;35,000)#.99)!5("68("79("8*',
+    ')!9("9m\'%3,750(#.15)"30*!5()00million($1.50)%0,000)!5(%2,500)".5*"95)!7($3.60',
+    '(%49.99($5.95(%6,600)#.95+!9)!3(&70,000($8.43)!9("93\'%4,300(#.20*!9)"7m)"80',
+    '(%3,500)%0,000("49($5.26("68($7.9m)!8(%8,750)!m\'%5,100)#400(#.3m(20,000&ndash;70,000("15(#25m',
+    '(&80,000\'-6&ndash;8,000($,300(#.2m(.0&ndash;80,000)#.00)30,000&ndash;800,000("1m(#20m(%4,000(&80,000($9.95\'(7,171.50(#.3m)#5bn',
+    ')!9(%1,000("40("6m("7m(%9,000)!9\'$8.3m)"49)"6m(%2,000*#500)!0(%3,000)#.25',
+    '(%9,000\'#9.1)!2*!m)!8($9.00\'#nil\'"xx"$rime"&sgr;40!\'sim;100!)times;188(!9\'#400!*uacute;voz',
+    '!$ight!%orses!$they!$urry )**changed"%david!#lee!\'michael!&nguyen!%peter #+++!"56!"ve $-0.5!"45',
+    '!(specific")timulated!$this!"up $.303""57!!9 "/d!!l!#msc!%range *0&middot;1")ndash;25%(%62mph!\'-levels',
+    '#"15$!7#"46"#237"#35%#!c#!m""40#!2#!p""53#"pc""63""73""87',
+    '#"mm!#015"!4"!6"#7\'s"#:10!"11!#235""42""56"!6""82!"30#!3"+1&ndash;469',
+    '$!8!#424""73""80!#536""82"#:41!#601""22"#:47!,71&ndash;387*#637*#734*#839""33',
+    '!#869!$9.00#"30""25""62 ,1&frac14&ins#!t"(ndash;24!#\'17!$,068"31,1-trichloroethane"#2,4##00m"#370"#476',
+    '"\'900,000#"50!&-2-3-4!#.1.$"86##5am"#2.4#"mb""3.#+0&ndash;4pm#!6#!9"#4.2$!3""56',
+    '#"pc"#6.3#!2"#7.1#"5m""92!$/4in!)0&mgr;gml#(ndash;25"#(a)"+,000-15,000\'&strong\'"up"#-18#!2',
+    '#&wicket"%.10pm#"27$!8##3.3#"41$!8"%/4/93"&0-word#\'0&deg;c$"th#!c"+19&mdash;20"#30l""53',
+    '#!9""68"%7,000#!1#!4""83"#:10""cc#%m/4in""fl"!g""mg"!o"#th.!)1&ndash;6',
+    '"#.0%$!5#$20pm$!1$!9#"7%"#/77"$01.2"%3,000#!2#!6""57"%6,000#!3"%7,000',
+    '"%8,000#!a"":1"#ins!%2&deg#(ndash;19)!8"#-16$!8#)month-old"%.15pm#"32#"42$!3#"58',
+    '$"pc"$00mm#"ml")1&ndash;2##(1)"#3rd"#50s"%6,000#"0s#!p"#70s"#:15#!3$!0"!g',
+    '!*3&ndash;11"#(4)"(,000,000"#-16"#.16##2.3##3.2##7.7""/0"#0cm##myr"#30s"#5th"#7cm""83',
+    '"#90s#!7"!b""kb#!m""lb""st!\'4&deg;c#(ndash;21*!5""\'s"#(b)""-0#"19"".0',
+    '##7.3"#000#"mm"\'14/1984""2p""32"#40s"#50s#!2""63#!6"+74&ndash;75"!g"#ins!*5&ndash;13',
+    '"#(3)"!+""-3"#.0%#"1%$!1#"20$!1"\'0&deg;c#,0&ndash;1800##bhp#*c/300f/gas##yds"#2cm"$5bhp',
+    '""8p!$6&ft#(ndash;24"#.11$!5#"30#"45"+0c/325f/gas#!m"-60&ndash;1800"":1""cm""gb"!k#!b',
+    '"#ths!*7&ndash;15)"24"#(2)"!+"(,000,000"\'-minute"#.1%$!5#"45$!p#"8%"&/12/87"$0bhp#"mb',
+    '"+56&ndash;63"#:11!*8&ndash;12*!6)!2"#(3)"#.1%$$0.93#"8%"50&deg;c/350&deg;f/gas##0\'s$!0%!0#!p"*23&ndash;4',
+    '#*9&ndash;40"%4,000#)0&ndash;1"$50\'s#*2&ndash;88"*71&ndash;2"*85&ndash;6#)7&ndash;8"*95&ndash;6"":1"#th.$%/25th!$9(4)##jp)"$,500',
+    '"+24&ndash;25#*6&ndash;27#*7&ndash;33"*35&ndash;6#)7&ndash;8#*9&ndash;41"#41a#,2&ndash;1945#*4&mdash;46#)5&ndash;7#)6&ndash;7+!8"%50-53#*5&ndash;56"+60&ndash;70',
+    '#*8&ndash;74#*9&ndash;72"*71&ndash;2#*2&ndash;73#*5&ndash;85+!9#*6&ndash;79+"81$"/7&!7#*7&ndash;89#*8&ndash;88"*80&ndash;2+"85##1/2',
+    '$!c#$3-87#*4&ndash;86,!7#)5&ndash;7+"87$#-88$$=100#)6&ndash;9#$8-90##9\'s",90&mdash;see$#-95$!f#+1&mdash;see',
+    '#$6-97#$7/98""pc!#:14#!5""26"#500!"an!"bn!"da!"mw!"wk 12&frac12/2&frac12"*micro;g/ml"(ndash;14',
+    '("20!#\'20!#(6)!&,000lb#"48"\'100,000#"18#"40#"50$!8""25#$81.6"%4,5-t"#650"\'700,000',
+    '!/.000.000.000,00#!6#!9""1m"#2.5"#3kb""48"#5.4#"gb"#6.7"#75m#!9"#8.1#!8#!m',
+    '#!9!!/!*0&ndash;20*!7#&percnt"$,500"%-fold"#.1%#!9"50&deg;c/400&deg;f/gas##0\'s##bhp#!c#"kg#"pc',
+    '""17""2p""31""55"+6&ndash;217""70"":1!*1&ndash;19)"20*!8)!7)!8"#.1%$!6$!7',
+    '#"5%#"6%""/6"%6,000""ft!$2.1%$$0.93$!1"$1151#!5""50#!3"#:21"!a"!s',
+    '##400"#.00#"10#"20#"3%#"5%""87#!s!*4&ndash;30"#.06"#000"%8,000!\'5&mgr;m#(ndash;60"*-year-olds',
+    '"$0bhp#"lb""8p""lb""ml!$6.1%#!3#!7#"8%"%/5/87"%5,000"!b!%7&ins#(ndash;30"&/09/93',
+    '"#.7%""0p"&273-74"#4ml""55"#in.!$9(3)"".2#"4%#"6%#"8%"!a!#:14"!4!&d6&ins',
+    '!$inch!"ma!&oz/50g!"tr (3&sol;87!#(b)!(,200,000"#900!%-in-1!#.0%"#1.0##5pm""37#!9"$45pm',
+    '"#5.0$!1"%6/3.5#!6!$/4in!"0+"+,000-strong"%-june##may"#.6%"&/11/87"(0-strong""10"%5,000#"th',
+    '!\'1-april#$feb."#.2%#!8""31""pc!$2.1%#!6""54#!p""9p!#3.1#!6"%5,000""60',
+    ')!5"".3"%8,000!*5&ndash;36)"50*!5"".6"#030#!b#"mm""55"!g!#6.1"#000#"28',
+    '"&169-70""2p"#381"#520#"31#"87$!9"#602#"71$!8"&722-24##337#"94"#810#"43',
+    '#"98"#976#"83$!7"!b"!s!*7&deg;c/80"#(1)"".6#!7"#019#"30$$1-32$!9#"44',
+    '"#112$!6$!9#%21-22$!8#"34#%87-88#"98"&234-35#"62"#305#"10$$2-13$!8#"74',
+    '#"82$!5$!9#"92"&443-44$!4#"53$!8#%66-67$!8#"74#"82"#501#"18#"21',
+    '#%44-45$!6#!p"#605#"10$!2#"29#"44$!5$!9#"69#"96"%7,000#"08#"21',
+    '#"63$$5-66#"75$!9#"81$!5$!6#"90"#824#"44"#904%#-05$!6#"11$!6',
+    '#"34#"55#"65#%77-78#"89#"95"!p#!c!)8&ndash;3)"41)!9"".7$!%"#024#%81-82',
+    '#"92$!5$!8"&127-28#"44#"91$!2$!8"#215#"72$!3#"90"#301#%21-22$!3',
+    '#"45#"51#"85#"91$!4"#409#"14$!9#"20#"36$!7#"44$!6#"55"#517',
+    '#"77$$9-80#"83$!7$!8"#656$$7-59$!8#"62$!6$!9#"80$!1$!3"#710',
+    '#"31$!9#"41$!4#"58#"61#"79"#800$!2$!9#"21#"49#"65$!6#"73',
+    '#"81#%94-95$!6"#915$!6#"30#"71$!6#"80$!2#"91""ft!"9.#!2#"6%',
+    '"#019#"25#"41#"66#"72#"99"#103#"18#"20#"33#"58#"68""kg!":5!"a5',
+    '!#kpc"!w!"ml!!o \'4&aring"*frac12&ins!+,000-strong"#750!$-4-0$!2"!9!#.0%#!2#!5"#1.5',
+    '""33"$5(a)#"pc"#6.0#!m"#7.2#!m!(0&percnt"".2#!3#"5%#"8%"%0-500##000#!4',
+    '"$8mhz"*g/1&amp;oz"$mbps""pp!$1(1)"".4#!5#!6#!8!)2&ndash;3""0p""47"!b""pc!)3&ndash;4',
+    '#"4%#!6#!8!$4(2)!$5.5%#"6%"\'0&deg;f#"kg"#mph!)6&ndash;7"".2""pc!"7a""pc!$8.2%',
+    '"\'6-based##slc$$x/33"!k!#913")th-minute!#:14"!6!#afc!.cm/1&frac12;in!!g!!l!"mt!#ozs!"si',
+    ' (5&frac14"(ndash;18!&\'-side!#(5)""a)!&,000ft!*-year-olds!#.24""32"#4.5#!p""51#"mm"#6.2"#7.2',
+    '""8p"#9.1$!7$!8$!9!"/4!\'0&deg;f#(ndash;75)"80#&percnt"+0&ndash;600#"0m$#rpm##mhz#!x',
+    '""50""86""cc"!f""kg""lb""mb#!g#%l/2fl"$ngml!#1.1#!4#!6!#2.2"%0,000',
+    '""ft""pc!)3&ndash;4"".5"!p!#4.6!)5&ndash;6"!+"".0#!8"#015#!m""65""pc!)6&ndash;7',
+    '#!9"%0,000!)7&ndash;9"".2""00""3p"!a!)8&ndash;9""5p"!b!#9.4!#:17!&cm/2in!"dt!!e',
+    '!!o!"tf!#x10 )6&ndash;6!#(8)!$,100"!7!#.08"#1.3""32""40#!6"$50pm#!2"#8.3',
+    '!*0&ndash;63""1s!*1&ndash;83"".4"!p!+2&ndash;171"".1#$5mhz""00""50"#mhz#"ph!$3(1)"#.3%#!5',
+    '"$5100"!k!$4(4)"!c"!p#!c!#5.5"#0mb""pc!#6.5!"7p!#8.3"#360!#900!#:12',
+    '!#a/b!"ba!#ft.!!l!"r4""ds!#ths *7&ndash;19("21(!7!#(a)!+,000-strong!!-!#.0%"#1.1',
+    '"%3(11)%"2)""43"#6.2#!m!40&deg&ndash;76&deg;f"$-odd"#0th""cl""kg!%100lc!%3,500"$5(1)"!p!"4.',
+    '""2i!*5&ndash;84""ft""ma!$6(2)"$/207&$/eec!)7&ndash;8""00""60!$8.9%""pc!#9pc!":7!"et',
+    '"\'frac12%($&ins"*ndash;10pm)!6(!7!#(c)!"-6"#way!#.05"#2.4#"5%#!7"#4.2#!0"#5pc',
+    '"$8(b)$"c)!#/10!+0&ndash;100"$-odd"#0mm"#2.3""70""km!#1.3"!9"!p!#2.5"#6-a!%4-204',
+    '"&ml/3fl!$6/87""11!*8-year-old""70""91!$lbs.!#min *9&ndash;16("26!$,200"#700!$.1.3"#2.2#!4',
+    '#!7""48""53""78!#/30!$0&ft#(ndash;91"#/10!*1-year-old"!6""st!$2.9%"!2"!s!$3.3%',
+    '##304""70!#406"!b""th!#5.3#!4""lx!#600"!6""mb"!p!#7.5!#8.5!*9-year-old',
+    '"!8#!9""99!"ln!"nb!"pt!"yl $=0.3!!1 (a&bsol;c",dollar;1,000"$flat"&iuml;t"%sharp!!+',
+    '!".3"!4""82"&d.j.g.$"x."$o.c."&p.e.x."$r.p.!"/.!"14""73!#209""10#!5!#321',
+    '!"ao"&ronson#"ru"$taaa!\'bbacies#"es"*doujaparov%!l")erdonians$$soch#!s"%hainn"$isko"!l#%ution',
+    '#*rtifacient#+vementioned"$slom#$olut#+tractionism"\'u-baker#%elito!&ccedes#,ount-holders%\'trement#$ruer#)usatorial")erbically""fa"&harnai',
+    '"\'quaviva""ro",tive/passive"&uleata!(d13/ad15"#a9x#&ptions"(discombe#&uction&"or"#hem"!m#"l.#\'onishes"(ulteries',
+    '#$ices#&owsons"#zic!*etiologies"!w!#fer"(fectedly#\'initive#%lante"!o"&ricano#*opithecins"\'ter_all%%guard%#sun',
+    '#\'panthus"&e-long"+giornamento"!h#&adowey"$leam"\'ressive!"h2""ab"!l"#mat!"i1"!3"!4"&ds/hiv',
+    '$%rifle#\'brushes#.craft-carriers#$side"+x-les-bains!#jay!$kagi"%cyjna!(l-ahmadi#&faisal#%hithi$\'ussaini#\'kadhafi#%shara\'"if',
+    '#(igensian$#nos$#reo#(uminuria"\'chester##ott"(derslade"(e-houses#(ksandras#$ncon#+xanderplatz\'"ro"#fio"%gardi"\'iphatic',
+    '"#kan"(l-around$%cause$(nighters$&people$\'seaters$"up#&emandi$%ndale%!s$&y-ways#$iant#*ochthonous#%round#$time',
+    '*!s"&pamayo#+hanumerical%&tronix""re""sh"\'tenberg#"ho#+ruistically"!w!$m/fm"#586"*bivalently"!e#(rindians',
+    '"!g"#ini$*o-aromatic%+salicylates"-ministrazione"\'nestied"\'orously#$tape"&phlett$$orae##ofo""ro"%un-re#%sedly!#nak',
+    '(#xis#(stamosis&!s\'"io##tom"\'choveta"(dalusite#$rew\'$$ogen%)med&aelig",glo-japanese&$scot"$klet"(na-marie#(o_domini',
+    '"+swerability"&t-like#-agonistically#(ecubital##her$/ropomorphically#)i-biotics%&castro&(limactic&%ommon%\'english%#hbs&&unting%(malarial&%ining',
+    '%$slip%&treaty$!c%*holinergic%*oagulation$)endotoxin$)malarials$(neutrino$(phonally%%roton$&sepsis$%toxin#%onymy"#ura"%yfing',
+    '#\'protein"(pearence%#ser$(ndectomy&!s#)licant(s)#+ortionments#!y".ricot-coloured!!q"&ua-pak$%rists#&ilinum$\'tanians!/r&iacute;stides',
+    '#%chnid(!s#"na$$dora#%vinda"\'borough"$c100$"50"%dente#$wick"%ensky"%golis#)yrophilic"%i070a"(m-chairs',
+    '#%inius#$lock#*s-for-iraq$+trong-jones"%nheim#$oldo#!s"+rangements.##eau#"gh#+hythmogenic#&ogated$(w-shaped"$shad"(t-styles',
+    '$&riolar#$form#!i$(culative)"or$(llerymen#(lessness!-s_,_as_far_as"\'cenders#\'ribable"\'hamedly#$bery#1ford-in-the-water"\'iaticus"$oyan',
+    '#%endos#)hyxiating"!r"#sen$\'ssingly#!n#+ociationist#(uredness",thenospheric"(ynchrony!"t."#aie")hanassios#(erogenic"(tenuates',
+    '#%wooll!\'udebert"(ffenberg"&g/sept"#ras"&sfahrt#)piciously"&tarkic#$eurs#,o-suggestion$*regulation+#ory!)vai-bamhi"&ellana#!z',
+    '!"ww!%xcell"+iomatically!#yot!#z-1"#ana#$riah .b&eacute;ziers"-ucirc;cherons!!+!#-70!%.a.a."$c.c.$$r.s."#eds',
+    '!"/2"%hlh/z"$s/wc!"25!"52!+aby-sitters"&ckfist$(grounder$$spin"%dging##han"$ggot#&ladies$$ioni#%shaws',
+    '"$ha\'i##don"%ilees$!y"&klanov#"ut"\'lakirev#(dacchino$!o$#vin#+l-to-target$"er$"on#%tasar"%mbina',
+    '$%olier$&waggon#$harn#\'k-notes%)sponsored$\'ability##zer""pc",r/restaurant#%athea#\'becuing$$less$$ules#\'e-arsed$!r',
+    '$\'ingside#&nacled#)rier-free#*wise-munro#$yons"\'seplate$"st#$hari#"ia#$sets##ton"(th/basin$$wick#(smanship#-tered-looking',
+    '"$uchi"%ydale#%esian!+bc/pictures!$cecf!#dcs""e.".xprogression/4!\'eatillo#/umont-sur-vesle"#cke$!i%%nsale")d-clothes$&making',
+    '#/rijfsvereniging#%sides#&yngham"(e-eaters#!l##ped"$gbie#(uilingly"\'haviors#$ring"%layed#%eives#\'gioioso##led$(igerency',
+    '$(y-button%$ache#!o$(w-stairs"&ndable#)eficently$#gas$$wick#%skins#(thamites$#ine"(ornhaeth"$recz#7g&egrave;res-les-vertus$"he',
+    '%#uis#\'ibboned#%mudez#&telson$#hon"$shir#$tuur""te#$imes#)ter-class\'&funded"(vercotes"$yers"$zier#\'pecnost',
+    '!"gb!+i-centenary##law&!s"&bulous"#des"&florus")g-hitting$$wigs")llancourt$%etors$$hook$$inge%$onth"(nkworthy',
+    '$%lasts#(polymers##tin"(rd-table#*efringence#\'thtales"#sus")t-perfect%%lanes##ers"(vouacked"%zonal!#l21"+ack-clothed\'%oated',
+    '%$ball%%lands&&isting#(derunner#$goje#$keys#(melessly#%nkety#+st-furnaces#+xploitation#&zingly"&eepers##nch"%itzer#"xa',
+    '#%oding%+thirstiness$!s#&wn-out"\'uelight$(stocking#(ish-grey#&mstein!#mrc!"n3"!h!)oaventura"$dach##mer#%ysuit',
+    '"%ggled#$land"&leslav#"ly"*mb-damaged##ont"(napartes#%dager#)e-handled$$yard#%niest")oby-traps#$gard$%ieing#)k-keepers',
+    '#$lell#%mgate##zed")rraichill"$s/tp#(nasarayi")ttom-line"#uge#&rdelle$+g-en-bresse$#rus"\'werbird)!s#&l-like"%xcars',
+    '#$ling##nes"\'zinovic!"pb"&xpress!,ra&scedil;ov#&iniest#%ngwyn#$ques#$ssed%$work#"ys"\'eathily$"ux#\'cciated',
+    '##nig"%iarty#(dewealth$\'lepaths#\'gadiers#&htnoth#!k#,llat-savarin#%ngers#%oches#(tish-run"*ockhampton%%lesby%#ton#$iled',
+    '#&meliad$%field#)nchoscope($pasm#&odmare$#kie%\'s-baker$$mham##ths#+wn/scotland%(ish-grey%&sville#%xtowe#!z""tt',
+    '#$neau#%vvers!"ts!&ubbies"%chner#\'ketfuls$$nell$!o$%yball)!s",dget-holders".ilding-society"&lgakov#&kiness#(l-headed',
+    '$\'baiting$%frogs$&y-boys"#nds#$gles##ney")pivacaine"%rdock#+eaucratised#$gage$$eons$$reen#"hs#\'meister#$rill',
+    '&(s/thames#&stwick#%tness"\'s-stops#0iness-orientated"\'tadiene$#nol#\'terface$*on-through"$xted"$yer."%zzsaw$!y!+yelarussian"(passable',
+    '!#(1)""2)!"-4##7tp"&banded"&ki-ras!".2"!5"$c.d.$$p.r."$p.s.!"/d"!w!"16""70',
+    '!#3-6""3c!&57bl/6!"=3!$a125##985")ck-handed#&oethes"(ecilians#,rnarvonshire$$went#\'sareans"#ffe"$iner#$ques',
+    '"&kewalk"0lcium-mobilizing($rich$)ulatingly#&ladine$&enbach$)igraphers#)orimetric$$uste#&zolari"$mbex$#ium$"s.#*i-knickers$%sards',
+    '"$nale##dia%&dacies##eel#\'nellini$\'on-ball+!s$$ulas#%tiana"&petown##ons#%stans"\'r-parts#(avanners#\'boxylic',
+    '#\'isbrook#%l-uwe#%nally$$tyne#$ouse#%pinte$$oids#&radale%#nts$\'ied-out$!s$)y-forward#(t-horses$(wheeling",se-histories',
+    '#)telfranco$\'le-like#\'uarinas$!s"(taphoric#$ched#+hedral-like#)tabianchi$%lemen"%urroy#\'satives$$e(s)"%vales%%leria"%wthra',
+    '!#be.!"c2""ta!)d-quality""m7!%ehave""la##led$,s/crypt/hour&"ml"$maes#)entitious#$maes"*nsoriously#(tenarian',
+    '$\'reboard%"ic",real-growing$$brum#"t."#sen#&pitosa#%sford!%g(at)##tg)"!o""ta!2h&acirc;tellerault"%\'ship"".1',
+    '"!2"+allengeable#)mberlayne#&ntrell#%panis$.el-en-le-frith%$rons$#men#,rlottesville$#nov$$sley$"ta%\'busters#"sy#)uffeuring',
+    '#&brikov#&ck-ins%$etts#&dburgh$"li#%edale$%kiest$$ping$%riest$#ver#$mins#"na#%rchez#%smore$$sell',
+    '&*of-drawers#"uk#&valine%$nnes")i-squared#$asma#%gnons#"la$&d-pugh&%sized&%woman&%years%#bed%"er\'#ley',
+    '$%worth#$mica#(nchillas$%ensis#\'pmakers#)ropodists#)valrously"1loroform:methanol"+ocolate-box#$kers$%ingly#-lecystography*%scope%!r$"ic',
+    '#&rleton#&udhari$%mmali$%pette")rist-like&(ocentric#(omium-51#(ysalises""ul#%mmily#\'rlishly!#icb##s/2"+i-honeywell"#mah',
+    '%)icroscopy"*rcuitously%(mvention""t.#(rinellum"/vilian-military$)tavecchia!\'lamours#%ngour$&ranald#"r.$%etian#1ss-differentiated%.ifications-are#&y-rich',
+    '"!d"\'ean-ups$$rway$#ted#(ckheaton#%recia",ient-centred#*ff-hangers&$like#5nical-epidemiological$(ton-gore#%ssold"(ock-rate#)th-capped"$unky',
+    '!\'naps/64"(idarians!1o&ndash;operation",-conspirator#)evolution#*habitation$#eir#&manage)!r#\'partner$+rincipality#)secretary#+trimoxazole%&ustees")achmakers',
+    '$%house#\'rsening#"te#%uthor".balt-bleomycin#)b-douglas"+ckburnspath$$eyed$$rill"1de-characteristic$(breakers#&pieces"$ello##val"(ffee/tea',
+    '&"ed"%ggins#%nates$\'itivism&!o#"wy")habitants#$eres$&sively"(il-helix"&ldweld#*e-hamilton%$king$4ford/gloucestershire#&lacott',
+    '%$tors$&imator%&sional$!s#&mcille#&odense$&nially&"st%&ocytes$&rectum$&ssally$$urs.#&tsfoot"\'mberton$$wich',
+    '$!x#0manders-in-chief$&ensals&%tated$+oditisation&"us%%nable$+unicational\'-st-controlled*%ruled#"p.$&actors$)endiously$#let&&xation',
+    '($oned$/rehensivisation&&ssible%\'omisers$$soft$$utor#%stive"%n-men#%ative#*ceptualism(!s%#rn.$*lusiveness$)upiscence#&dictio',
+    '%$riri#&ferees$\'irmable#,glomerations$$rats#(juration#$nahs$)ectionism$%ollys%.r-g&oacute;mez%&tative##rod#*s-boutboul$(ensually%.rvative-minded',
+    '$\'picuity#-tainerization$)ext-bound$$roll#\'veniens"-pp&eacute;lia#)rocessors#%yable$\'righted"(rallites#$ding\'#ley#+e-periphery#%iacea$"ng',
+    '%#tti#)poratists(#ors$&ulence##rer#%tices#"uh"$sies##roe##sey#,t-efficiency$#ive$&umiers#&worths""tt',
+    '$&erdale$(on/lycra#)yledonary"&unter-()indemnity(&melody)\'ovement(&notice(&offers\'(position\'&vision%+ry-specific%%ywide"(venantal(#ors',
+    '##ill")w-parsley#&abunga#$hide##ies##man##pea"%xites!#pki!.r&ecirc;chendo$2grave;me_de_menthe"$aigy#$nage$&kiness#&tchley',
+    '$&ted-by#*dit-worthy&!o##ese#$nata#$sset#!x"*iminogenic#(pplingly#&status%0ofori-silbermann#+tically-ill""mf"$oaky$"ll',
+    '#%nyism#&plands%"ey#(ss-beams\'$reed&\'grained&$shot\'%treet&)tabulated&$vein%%house#&w-like#$xton"#p-1$$camp',
+    '"%uddas#(ikshanks#)mmackdale$"ps%#ton#&shable",yptosporidia!"s+!"t."!i"$rl/j""vm!$u-ni"%bitus#$oids',
+    '""is"$ldub#"ls$\'ybackey#$pitt#$tins"$ppas")ratorship#%bside#(tainless$#ice$$seys""sa"$test$!x',
+    '""rs!\'yanotic&#ype"\'cleways"&nosure",toprotective /d&eacute;marche**ocratiques!)\'alembert#$mato##rgy$&tagnan#%ubert"$ewes"+harnoncourt',
+    '")orchestre#(utre-mer"%souza!%*note!%-to-a!$.sc.!"=4!%achas"\'gbladet##ens#%obert"&hlerus"#ill%!y"(leswoman',
+    '"&mages.$&scened##ems#!h"(nce-hall##gly##ilo"+r-es-salaam#!c$"ey#"li"&shiell"#ube##mas"*v&iacute;d',
+    '"%y-out$%trips##rut#%times!&b/expo""tg!/e-stalinization"%_trop"&adhead#&minase"&bacles"+celerations#$isis#-lassification$\'ivities',
+    '#*ompensated$)njugation#)reasingly"(duru-oya"$eson")famations#(ecations%%tives#+ibrillators#\'oliated#%rayed"#gel#\'reasing"&igning#(nstalled',
+    '$"ts"%laval#*iciousness$#tti"&merged$\'triades#&i-gods#)onization##uth#*yelination$$onov"%nsign%(tometric#-uclearisation$(nciatory',
+    '#\'opulate#&ressor#"ts#)ut&eacute"*rivatively#$nley#&ridean#%tliev#%vaird"&scaler$$hner$%riber&"ed#$eret#\'ignator',
+    '#$kpro\'"/m#(loughing#)tabilizes$$rier"(tachedly#*ectability#%hrone#\'oxified"+uterostomes"+velopments.#"is"%waxed#"ed#%hirst',
+    '#*ter/author!#fdr!#gxi!\'hss/sbc!\'i-grams"!5"$bben#&rugarh"0dcot/oxfordshire##dly#$n\'t.""ez"(ff-locks$)erentness$%usely',
+    '"\'gesters#%gorys#$hton"&jkstra")latometer#$lard"\'marzios#)ensioning$(risation$7thylsulphate-piperidine#&itrios%#tis"#nan#,ner-jacketed"*s-benefits',
+    '$(ffiliate&*orestments$#rms#\'benefit#+contentment%,urse-deictic#&eases.$&mbowel$(ndowment#(favoured$)iguration#*honourably#+integrative#!p$-roportionally',
+    '$(utations#,respectfully$%upter\'\'iveness##tel%)nsibility$%orter$&rained"&uresis""v1#&ersely%\'timenti!"lc!$m100%$,000',
+    '$"40$"79$"83$"94"\'b&amp;b!.na-pk-mediated!%oable"\'ckbuild#+tor/patient#*umentarist"(ddington#"os"(g-fights$(handlers##ger',
+    '"(llington$#ond#%metta#-phin-friendly##wyn"\'minical"%nelly##lan"$oney#*r-knockers$\'keepers$$nail""ri")s/windows##fax',
+    '"-uble-flowered&$d-up#$gall$)hty-wylie"&wagers#*nregulated$*s/hereford%$ized#$sett")xographic#!y!"px!\'ragonby##ize#\'matises',
+    '#&vograd#)w-strings$#bar$%cords$,ing/painting$\'strings"+ewsteignton"&ibbler#)ft-netted#*nk/driving#\'vetrain"$onne#%xford"#tf1"\'ug-like',
+    '"!r!"tk!+ual-simplex"#cas#(klington#%twork"&etting"&isberg"\'lcibene"$nes.#%garee$$heap#\'nerdale$"o.#$sire',
+    '")rand-ruel"(st-laden$%carts$\'jackets"&tiable"*valierists!"vu!"w."#1.2"-elling-places!#yet"$mock"*namization$(stically"\'spraxia',
+    ' $e\'en!"-r!$.m.f"%p.s.p!"40!\'anflaed"\'r-plugs#"by"\'stender%\'rn-bloc$$wick#*y-to-enter(*understand"!y!%berle',
+    '#&listed""1m""4a"$gric"%hidna$%noids")o-tourism#\'nomique")tothermic""wp!#ddi"&envale"\'gecombe$"ll#%inton',
+    ')(/glasgow"#ns."&omites""s.")utainment!%e.cli"!f"%g/eog"!t"#vin!&f1&bgr"(fleurage#&ulgent"!r!(gelstedt',
+    '#$ists#%tists"!p!)idetiking")gh-teenth$)t-fifteen&(petalled&&seater%)een-month""th!(jections!"l4""98""ca".ection-related',
+    '($weak\'.encephalograms\'%genic\'.lyte-saturated\'*negativity"#ice#"el"#kin"&licott"$mley"!o"$sdon#"ey#$kede%!r',
+    '"\'vington"#xsi"$ytra!+mbarassment$%ssage#.roidery/stitch"#eka#%rsion"#mae##itt")pathizing#+loyee-owned\'"r.!"n2"%angar',
+    '#&odings#*rustations"(dodermal$&gamous$)membranes$*prostheses##ued$&ringly")ergy-loss$%vated",gine-drivers"%kalon#\'ephalin*!s"(lightens',
+    '"Kter&mdash;complete&mdash;root&mdash;package%)prisingly#)ropically"+zymatically%(e-linked!(ostation!#pas"*hemerality"!i##cal#\'didymis$%urals#\'leptics#*phenomenon!-quipotentials',
+    '"#ens")gonomists"!h"$lach""ma"%rors/!&siplan"&kenazi"\'ophagus"$pina"%selte"\'taminet#&relita!0therington-smith#.nic-linguistic',
+    '$)ographies%\'logists"\'iolated"#tle"$yang!\'ugenist"%lalia")phausiids$&onious")ro-disney$(peanwide&$wide%$ress$!s"\'storgio',
+    '!(valuable#/potranspiration"(en-sized#(r-moving!$wers!*x-husbands#$lord#&marine#%naval$$urse#)policemen#$tory"".1"\'archate"\'ceed/nt',
+    '$%rpted#&iseman".ercise-induced"(foliator"/hausted-looking\'%ingly"&isted."\'osphere"+pansionists$%tiate#\'edience#%iated#*loitations#+os&eacute;s"(tortions',
+    '&%trade%$code%\'gastric%%legal%\'sensory$$emum!-yad&eacute;ma"#ing"3non/gloucestershire"$ries (f&eacute"(uuml;rst!%.c.c."$i.a.!$/2.8',
+    '!"7a#!+!"8a!$abbo#"ii",ctory-fitted"\'dlallah"%eroes"$ille#$ring"#kir"$ller#\'sifiers"%miles%#ism',
+    '"\'nciulla#!k"#qih"%r-out$\'ranging#%agher#%mhand"&scista#%erver"#t**%!*#)her-to-be"&ussone",vourableness"+wn-coloured',
+    '"$yres!&c/open"!o!#dgb!-ebruary-april""d.#!v"+licitations$"ds#$loes%)w-workers")nestratum##ney"-rnandez-kelly#.ocious-looking',
+    '"$stal$*ival-goers"(tchingly#$lock#%tling"#uer!"fb""r1##300#!r!#gra!)hearchair!*ibreboards%$pile$#osa',
+    ')"ly".eld-upgradable%\'working"$foot##ty-&%fifth&%sixth"%g.1.5"(laroides#%m-set$$star"+n_de_siecle#(al-round%\'isation$!n',
+    '#+ger-printed##ned")re-eaters&,xtinguishers#"me#)st-aiders&%world"(sh-scale$$bird$$kill"\'tzlewis$&walter"\'ve-game%$iron$(miletown',
+    '"$x-it!$k506!(lagellae#+me-coloured&(polished&#red%\'thrower#%shier"/etcher-campbell"+intcomb-ash"(oatation#)od-waters$(r-boards$"zy#&phouse',
+    '$%tings#)w-through$)er-decked\'\'sellers"&uidics%"ly#"ky#%mmery"%yable#%blown!#m21!(ocusview"$ecke"$geys""is',
+    '#\'k-dance$&eparti$\'lorists$%songs"&ntenay&"ot")od-stuffs#\'t-loose%\'tapping$#bed"\'rbartha#\'d-kenya#(eseeably#&tensky$%ran8x',
+    '"+ssilisation"*theringhay"#uad#$lard#-ndationalists#&r-game%(petalled%"to$%viere"$xing!"pl!-ractionations#\'gmental$$rans#(nchisors',
+    '%)o-african\'\'italian#\'unhofer"%eckly#*e-fighting%%kicks$%house$,port-mcmoran$\'ze/thaw#%ising#,nch-speakers$!d#\'quenter#(scobaldi$(h-cooked',
+    '$)singfield#%tbuzz$$wire"(iability#\'deswide#\'geridus#%ssons#!t$(illaries"&oggies#$nded$!s$&tality%\'bencher%$door',
+    '%\'runners#"om#%ssard$+t-resistant#\'wningly""s."+u&scaron;ka"$ypan#!s!$udah"$eros"$gato"(ji-xerox"#kui"\'ll-body',
+    '#&minate($ions#"ro#$wood"&ndings#*ny-looking"&rmston#,niture-maker"%seway#!i")turoscope!$v37h!&x-1050 $g(n)!\'-banded',
+    '"#men"(proteins"!t!(abiadini"$chot"%dding#%roons#$wall"+insboroughs\'#urg#&rlochy"%lenic#\'lerists$$otta"$mage',
+    '"&ndhian#"em"+r&ccedil;ia#%dened&"s.#\'funkels#&nishes#,rett/swindon$$ucho#%sinde"\'s-lamps#,tronomically&\'scopies"&teacre$(crashers',
+    '"#via#$rilo"%wpers!"be!$ebre")co-prakla"&llatly"(mberling#%mules"3nder-differentiated#)e-culture$&ricism#&illard#&otypic"&oclock',
+    '"(rmicidal#)ontocracy##und"+sticulation!&gfbpp5!%hitac"(ostwatch!\'ibbeted$#ins$"le"#eve"&ffnock#%twrap"&gantea"(lbertson',
+    '$.s-the-murderer#%lance$(is-tweed$$more"#nge%"rs"#ppy"(rls-only#%olami"#sby#&s-giss"(ve-aways$%n/new!+laciologist#%ddens',
+    '$*s-enclosed&%sided\'\'teagall"%edhow#&nville#"ws""ia"#obs##ppo#%ssily#+ttalisation#%veman"(uckstein$*ocorticoid%&sidase',
+    '"\'ycaemia$&osides&$uria#\'phosate!%narly!*o-it-alone",at-antelopes"$bber"&delier"#eth"*ld-flecked%$leaf$&emberg"%nadal%(otropins',
+    '#(freville#.zalez-palacios"\'od-byes$"ge$*s-specific$/win/cirencester\'!s##fed#"li#+se-stepping$"ie"(rchakova#\'ebridge##ney#$onwy',
+    '"(thenberg"$upil"+vernability&%ment\'"#wan!"ph!+ra&ccedil;a#\'in-size#*m-positive#%n\'fer$*d-children&%ducal%&inetti%#mas%$ness',
+    '$\'gefield$&ny-liz##pey$%hemic%*o-phonemic#\'sstrack#%vamen$$iton(!s#&yscale"+eat-looking#)en-coated&\'skinned%$back%%finch',
+    '\'!y%#odd%%ville%(y-yellow$$tham#$icha#%vious#(y-suited$&beards"$imed#\'ndingly#%pings#$sham#%ttily#$zzle',
+    '##mov#$uchy$$p(s)%*-compliant#$wth."(ubbiness#$enen#\'mpiness#%ngers!#t1x"$c380!-u&eacute;rard"!2"!7"(anajuato',
+    '"%ebuza#&sthall"0itarist/vocalist"#lch#\'lshaven#!s")n-runners#"da#!g$&aadorj"\'shingly"%yline#"ot"%zzled!"yr',
+    '"#wir &h.l.r.!$197a!\'a\'porth"$-san"!7"&bakkuk"\'ciendas"%drons""ec#+matopoietic$\'ophilic%,rrhoidectomy"#fiz#"ta',
+    '*$ical"%ibara##nan#&r-thin$&pieces$(sbreadth"#jji"$kami"(lf-awake%%blind%)centuries&*onsciously&%ycles%(familiar%$shut',
+    '\'"ze$%pence#$zman"$mcom#+ilton-jones##mad"#nd-%$guns%%helds%&rolled%(stitched$%maids#)g-gliders%#out&#ver',
+    '#(s-ulrich##ts."&p\'orth#"ly#&penin\'")rassments#)d-done-by%\'muscled#"er$%woman##loe#)monically\'#ses##pur#&rassed',
+    '#(sle-free"\'tchways#"je"#vas#%stock"$ward#%kinge"\'ytiming"\'zelbank!"ba""ba!"ck""ws!\'e\'enalu"*ad-capsule',
+    '%*over-heels%(quarters$$case%%ollar$%ships#,lthy-looking#$rten%$iest#\'thenism&-rington-scott""di"*edlessness"%ftier"\'gemonal"&ighton',
+    '#(nousness"\'lically%+opter-borne#\'lhounds#\'mingham#%pmeet##ter"\'mmed-in#%phill"%nbury#\'dersons##ges$\'istbury#&houses##ney',
+    '#)ceg-bosna#"e\'$"fs#+maphrodites$&estone#$onry#*petologist##yng"\'sletine$&ington"*teroclinic&\'dimeric&&phylla")veningham"*witt-jones',
+    '"%ydays"+zb-i-wahdat!"i-#\'osf/1-m#$watt"(de-bound$\'ousness"(eroglyph")gh-arched%(contrast%\'finesse%"up$*est-ranked$)ly-priced\'&ranked',
+    '$%speed&"ot"#ley#"la""m.#&sworth"*nchinbrook#$dleg$\'quarter"\'ppiedom$&ocampi"$ranu#%eling(!s#$suta',
+    '"&storie"&ttites"#xon!$mmmm!$nc/d!&oakley"*bby-horses##day""el"\'gsheads"+jjatoleslam"\'lder-on#"la$&ington$\'owfibre',
+    '#*orepressor",me-from-home$(building$&liness%#oan$/wood/rushfields#%ildon#)ogenising$&nymous"*ney-blonde"%o-hah##ple"&pcroft"#reb#$mila',
+    '#+s-d\'oeuvres$\'e-boxes%#fly$$path"$tkey")use-bound&&guests&&owners%&steads##ten"\'vingham"$wick")x-b1/lacz!"pd""fs',
+    '!"s1"!2"#554#!b!%u-yan"%aqing"%bcaps"\'cksters""is"%lbert##ing#"ke#3lavington/wiltshire"(man-like#%brian',
+    '#$ilis#$madi#"py"\'nkydory"%rkett#)stmonceux"#tus!\'x8plane!)ybridomas"*drologists"0per-inflationary%&capnic%)documents%$fine%\'osmolar',
+    '#*obranchial$+chlorhydria&.olesterolaemia$\'thermic",sterectomies $i-ay!".1"$c.r."!d""v.!"/0"!c!"af!#ban##rra',
+    '!#c1c""ai""ch"%e-age$(breaking$$cube##axe"&kworth!*deal-types#&ograms"/iosyncratically""ms!#eho!$fscc!%gfets',
+    '"$i/jg"!t!&kebana!#l-1##6re"!d"-l-conditioned&)ordinated$(digested$+intentioned#%egall#(iquidity#$us.2%(ionistic"$ocos',
+    '$%istic$"os"!b"(ipramine"(modestly$%vably",perviousness#-lementational#(ortances$\'ssibles#*risonments$&omptus"$tiaz!&n-feed$&illing',
+    '#$hand##the$$rays"$/out"1_,_in_relation_to#*medias_res"-admissibility$*visability#\'pposite#)rticulacy#%smuch##yat"&c/unix#\'h-thick$%icore',
+    '$\'tements#(lusively")demnifies$(pendance#*ispensible$\'visibly#%riyas"(educable#&rrancy$%tness#)xpressive"-formationally&)ix-online"%going")jury-free',
+    '#&sworth"\'quorate"%scape$!h#(ect-like$)minations$*parability#+ide/outside#"t.$(allments$#ore$)rumentals""t.#%emate$&ndants',
+    '$(r-allied&.denominational&(galactic&)religious&*subjective&%tidal%+est-elastic%(glacials%*iorization%%loans%+pretability%(ruptable%\'systems%\'ventive##ime',
+    '#(ra-urban%(familial%*sentential$\'on/exon%)spectible+$vely$\'usively#)uitionist\'$vity$\'mescent"(veighing$%rloss$&stible!#oan"+n-selective',
+    '!"p1"!e"!o"$sley!(raq-iran"(on-bound"/reconcilability&\'verably$(mediably#\'uptions!#s_a"$abey#,fj&ouml;rdur"#dn2""er',
+    '"%lamey"%obars#$mura"+tv&aacute;n!&tem(s)".tehad-i-islami"\'urralde!#ure!#vie!$wate!#xth")yphalians &j.c.l.""n."$o.c.',
+    '"+ckson-stops"&guthin"\'hanbini##oda"\'ilbirds#"ro"$mbyn#"il"$nkel#$otte#$sson"&ramogi"(untiness")y-walking!.e_ne_sais_quoi',
+    '%*christophe$$etta"&fferys"#nco"$rmey"+t-propelled##set"(yaretnam",zrael-ayesha!!g!"ha!$inan#%drich"$tney!*oachimedes',
+    '##bie"%celin%#yne##ose"(hnstones"*ke-telling##ily"&lliffe%$ties"#ris"(uissance"$vito"$wled%!s"(y-riders',
+    '#\'ousness!\'u-jitsu"#dex#%icata%&iaries"%icier"*l&ndash;28##yen"&nipers#"ky"!r##ado"+stice-clerk&\'ialista!"wt',
+    '!!y"#oti 4k&amacr;l&amacr;dika#-uml;th&egrave!$3560!#858!"aa"(bbalists#$ylia"(fkaesque"%galla#"el""ja"$kadu"&levala',
+    '#$enka"\'ngshung"&pllani"3rad&zcaron;i&cacute$)z-a-karak#&bacher#(l-i-bond#$plus"\'satonov#"di"%t-zet#&lehong"&wamura!$ebir"#cks',
+    '"$lbie#"im##lys#&senian"$mper"$naan"+ratinocytes#*b-crawlers#&chiefs#&r-muir"\'y-board!$g/ha""42!-haki-coloured#%lifas',
+    '#\'ritonov""un#%rshid!%ijevo"&lljoys#&martin##ray",mberly-clark#$onos""na$(esthetic#%dlier#&gsgate%$mere%$wear',
+    '&$orth##ked#$mont#&swomen"+tchen/diner#(ts-nevis"!u!&lasies"#ibi#!s!(nee-pads$#ing"%obser#&w-alls#&xville',
+    '"%yvett!&oenigs"&ivisto"%mpass"%ntron"$okai""ti#!z"#var!"p1!#r11""as##ter#!u"%eisky',
+    '$)tofferson#$tian"!k"&onberg$%quist")uggerrand!#uei"$fran"%hnian"\'nsthaus%(sammlung"*rgan-tyube"!t"\'znetsov!%yburg',
+    '"#nar#"de"(rgyzstan#"le"\'ung-won .l&eacute;onard!,\'agriculture#%quila")education".humanit&eacute",op&eacute;ra!$-glu!$.0.2"$g.u.!&703766',
+    '#!7"!9!,aage-salomon"#bno#-our-dominated\'%force"(cquering"$ddow"(gavullin#&gardly#\'omorphs"%id-up$$back""ki"%mento',
+    '##iel#$lash#$phey"$ndis#\'guages.##nah#!x"&rkhall#2tin/worcestershire"#spi",te-twentieth"#ude#)rencekirk"#van#.ender-coloured',
+    '"(wrentian#)son-finch##ter#*yer/client"+y-dominated$$outs#$line!#cdt!*eader-post$%hills$%screw#$fier$%mould#%n-tos#(therwork',
+    '#$edev"\'cithins#(khampton"$dsam"+e-on-solent##kie",gal/rational""lc"%mmata#*on-scented"(narduzzi#%sless#%thall"%ogang"\'querica',
+    '"+vel-related#\'iathans"\'wis-ann#!y"+xicon-based"\'y-lines!"gg!\'ibandla#(rettists"\'censors"\'dington"$ebow#"na##ut."#fe-',
+    '$\'boatman$%sense$#tex"(ghterman"#hou"$liam#(lywhites"\'me-rich#*nititzkers#&pidity"$ndau$$berg#$gary#$itis"#ong',
+    '"%quify"(stenable"1terary-historical##hic$0ostratigraphical#*igiousness#%vinov"+verpudlians!+lanfairpwll$%haran$!o$$twit$$wern"-ewellyn-smith"#idi',
+    '"!2"%3914n!\'oc._cit(!.#*al-central%*ly-elected#\'hassynt$$wood#%k-ups"\'ftiness"&llocks"%magne")ndon-wide#*g-breathed&%uried',
+    '%\'ranging%$toed$$boat$)er-necked$&issima$&niddry")ose-boxes%$knit%"st"(phophore#$pers"+ris-melikov#!n#&ryload"/thl&oacute;rien',
+    '#\'nge/bar\'%diner#*th-bardney"*ve-affairs%%birds$$bite$,luck-edwards"&w-loss$(spirited$\'waisted#)er-storey%$most#$lier#$ness##ton',
+    '!"s2"!8"#htm"!r"$strt!)ubumbashi"#der#%hiana#*icrousness"&ngworm"$pold"%sardi""ta#%trell"$xton',
+    '!#xiv"%xviii!#ych"#dda#$ians"\'kophron"$nher")ophilised"%phard")re-shaped#&icists :m&eacute;diterran&eacute;e")ouml;bius!&-fifty!#.ed',
+    '!"45!"53"*8&ndash;66!%68000!#aak"%cdhui#-gill/scotland#\'h-based$#aut$"yn#&ilwain#&kensen$#len#$link#\'millans',
+    '#)publisher#(rovision#%shane#%write"%ddest#"el#!i##ryn")eterlinck"(gharians#%icked#,neto-optical&$rons"%hanta"(il-shots',
+    '$#ers#(ntainers$#win")jor-minor"%katon#%e-ups$&rfield"(leffects$"os#\'hamdale%$ndir##oti#$tman#%verns"&mprusi',
+    '$(mountain$&shaped#\'ager(s)$$tees#\'delbaum#$like$+y-warringah#(nheimian$$ings#!o$$evre#$tids#%ukyan#%yatta"\'pperley',
+    '"-r&eacute;chal#(athoners#$ceau$#h-9%%banks##der#/euil-sur-a&yuml#%gins.#\'ie-anne&&louise\'#uce$#off$$scal$%times$$vate',
+    '%%vitch#\'leasing##tti#&y-jane"$saya#$duki##key#"ol#(s/energy#\'ticated"(ternally$%yness#$hura#%theys$%ingly',
+    '"\'wdesley"%x+max##-am#&.flash#%imums#$teds#*well-bloch(&hyslop"&ystadt!(calister"$caig$$lman$#nce%*n-erickson$%rrick',
+    '$$slin$"ul#&luskie#(orkadale%"ry$#wen#&rindle$%ystal#$uaig$"ne"%deere##uck"&erlain"#gaw#$eary',
+    '#%ivern#&onigal$"wn##rew"\'hangama$#rdy"#i\'s#$ndoe"&kitten#%usick"(laughlan"&meekin#%illen"$nabb##ish',
+    '#&ickers!%d-dos"!h!%e109s""_a"(agreness#%nchey""ch"(dium-low#$nick"$etin"\'gafauna$#mix$%rians$%stars',
+    '"$kgwe"(lanocyte%$urum$+stomataceae#\'chester#%huish#$lons#%odeon##ric#$temi$%ingly"4mbrane/intercellular"%ncken#)daciously$&lesham',
+    '#&talism$"on"\'rcadier#%idien$\'tocrats#\'rifield")smerizing#!o$&-scale$&thorax%&rophic#&s-tins#"ta"+ta-analyses$\'bolized',
+    '%&entric$(l-ligand&&rimmed%&ingual%\'logenic\'+proteinases$&theory#(hanogens$%ought#*ro-cammell!"fj!(g-atpase"&/m/day"!3"!t',
+    '%!s"%cahel#(haeljohn#*ro-climate&(economic&(politics%\'adenoma&\'nalysis%%cosms%%molar%(pipettes%)satellite"\'d-1820s&#30s&#60s',
+    '$$680s$&antrim$%boost$$calf$(eleventh$*fourteenth%$ront$$late$(silurian%%peech$$wife#\'dle-man&%brook#"le"$g-21',
+    '"%lcolm#"ds#&enecka$"rs#/itary-appointed%"um#&k-free$$less#\'l-hands$#and$\'enniums$$port$$wood#$vain"+nchampstead',
+    '%)numbingly$#oro#+eralization##gay$%hella#/isters-delegate#.ster-in-thanet#!u$,te-to-minute"%pmip."*rrorshades"(s-shapen$#use#*alignments#&chiefs',
+    '*"ia*!s#&kicked#(labelled%!y#"ra$*ecognition#)sionizing$)tatements#+translation!#l/g#$hour"%1:ml2""so!$m-hm',
+    '"!n"$ol/d%$h/kg"!p"#usi!"ne!(obberley#"ey"&ccasin#$umbi",dernisations("er$#sto""is$#ter',
+    '"&llusca"(narchism#2day&ndash;thursday$!i#)eyspinner#\'falcone#(key-like&#ing#\'ocausal%#led%)otyledons$"dy$%grams$)molecular$\'polizes',
+    '$*hly/weekly$%louis##zon")on-shaped#%rhead"&ralise&#zed$\'toriums#-eton-in-marsh#$gana\'#tic##iah$$yama#%lands#$phic',
+    '#%rells#\'tadella"&skvich#\'s-green#(t-capped"%tcomb#%hball##ile$#vic#!m#\'or-boat#(terstone"\'use.com%#man#&things',
+    '"(zartians!"p1""24!"rm!+s-dos-based"!h"!w!&tezuka!+uch-admired\'(vertised")d-stained#+erris/mufti#$flow#"ra"$ftah',
+    '"&irkirk"#jer"%karji"&llican#)ti-causal&+directional&$page&(vitamins%)component%\'element%%grade%$list%%modal%)plicities"%mming',
+    '#&desley"&rlough"-shroom-shaped#%icali##kie#-tard-coloured"\'tambara"%zenda#$zily!$wrog!\'ycology$\'rrhizae")elography"$nors"\'oclonus',
+    ' \'n&amp;p!,-dimensional"!e!&.c.o.s"$e.c."&f.p.a.""j."&y.s.2d!#185!#=13#!7""22#!4""48!$aaah',
+    '""bs"(ggarothi""ic#!r"%mpula""nc#%nying"#ppe%!s"&rberth#"ey"+sty-looking"&tively%#ist"+vier-stokes',
+    '#$land"&zified!#cds!"d/"(abaningi"$onga!#ead#+r-unanimous$(ly-equal#%tened"(bulosity"&chayev#&k/body"*ed-to-know"!g',
+    '"#ige"+lson-atkins"!n"&opaint"&rudova#*ve-centres"(ugebauer#*raminidase$+obiological%*glycopenic%/physiologically/"st%&ticism#(tropenia",ver-the-less',
+    '$$line#%berry$&orough##ens#$hall#!i#+ly-invented&\'planted\')rivatised\'(urchased&)recruited\'#ich#%mills#\'sagency$(cuttings',
+    '!"fd!#g/g"%awang"$ollo!"h3!&i-cads"\'chollsi#\'k-named#&orette"\'ght-cap&\'workers"-ne-and-a-half%&minute$,teen-fifties",p.bsa-coated',
+    '""s+#"hi")tch-smith#%riles$)ogen-rich(!s!"kp"&umbula!$o.15#"24"%ddies"%gales"$land"&n-arts$$base',
+    '$+combustible\'(parative$)dependent&%viant%+ifferential&(scursive%(omiciled$,economically%\'lective%(thanolic%%urope$*historical$+ideological%*ntentional$\'locking',
+    '$)malignant%+eans-tested&(chanical%&usical$(neuronal$)offenders%\'ptional$+penetrative&)ristaltic%(oisonous&(ssessory%*roblematic%*sychiatric$(relevant$\'skilled',
+    '%*ustainable%\'yllabic&)mmetrical$%tonal%&raders()itionally#$amer#(callable"#ooo#%rduyn"&rchard#!e$*pinephrine#+mal-looking$,oalbuminuria',
+    '%%fleet%#iam%$more"%segay",t-so-distant#)ched-pole#%e-pad"&vakova#\'elettes")w_er_that!*p-complete"!k!#rem!"s1!"tr',
+    '%"on")dibranchs"$flvn"\'llifies"+mber-plates\'#two#*erological"(nnington"$phar"+rse/patient!#w10"!5 %o&amp!&\'-ring"%duffy',
+    '"!k##.w.!#/50!"ab!&badiah"(durately")jectifies"2sessive-compulsive#(tetrical!+ccidentalis#&lusive"#hil"-tamer-taatgar#\'obrists",ulocutaneous',
+    '#"le")oriferous"$p-mt"!r!"eo",sophagectomy!%ffcut#(icership%%iants&"um"\'t-cited#\'entimes!$gdon!$h-oh"#mae',
+    '%!s!&kadaic!+ligopolists"%ufsen".ympia&amp;york!#mos!&nanism"+ce-powerful%&weekly#(oprotein"*e-five-one%\'or-four$&in-ten($hree$&length',
+    '$(one-five$)two-three!$o-er!\'paquely")en/closed#)ra-houses%*tionalised"+hiochondrus""p2#*ositionist#+ressiveness"&ticrom!\'ralists#&torian\'"es',
+    '""f3"\'ganelle%,isation-wide\'#mic%+o-chlorides#$inal\'"ly"(ientates#&flamme"%nella#-ithologically"\'phanges$"ir"%sborn"+thofunction',
+    '")f/1-based%".1",nabr&uuml;ck"\'teomata#$raka"(waldkirk#!y!&tsason"&toline!%udart"*t-sourcing#%grows#\'lasting#+performance#%soles',
+    '!&vedale#%r-16s%+abstraction&\'mbition%,bureaucratic%)eagerness&\'mphatic&(xuberant%+imaginative%*protection%#ran&$igid%-sophisticated&%tated*$ment',
+    '%#ury$,enthusiastic$&flight*!s$+involvement$(kingship$&spends%\'trained$\'tighten$\'zealous!)wn-labels#&erless!"x8"%burgh")ygen-rich',
+    '!.yster-catchers!#z/2$$00ml .p&aacute;lsson!#(0)!\'-please!#.11$!1""26""37""40#!6""52#!8#!9',
+    '""81#!8"&g.c.e."#p.m""t.!&1*/lp0"".i$!i%!i""1d"!3!"20!$3/t1$!4!$4/t1',
+    '!"82!"96!&=0.003&!4%"12$"11$!2!+ace-setters$#ley"$dova"(isleyite"&ladins$/eoenvironmental1!s&)geography',
+    '##mae$$eras$%itoyl#!p$!s")nathenaic##cev&#ski#$icea#%nella$$witz#"ov")pierwerke$\'llotomy#\'penheim',
+    '#$frey#&quetry#%roted#%slows#.ticipant-roles&%ulier$&ner(s)$#way$&y-size#%venus"%scoal#$hley#&s-back$\'agework$$book',
+    '"&tchway#.e_de_foie_gras$%ntees#(isseries#&rolmen#(ternings"$ulos#*perization"%viors!$bmcs!$c/at"#bcr"#sps"!v!#dms',
+    '#$hens"#cos"%ddars$#ler#0estrian-friendly#%retti"&el-off"(gmatites"&ignoir"(ke-faced"(llington$%ucida#(ycosaurs"+n-portraits#,ning-rowsell',
+    '#$twyn"%ptone"+rambulators##cha$\'ipience$*ussionists#%fects$,ormance-wise$%umers#)ivascular#(missable#%onism#%ricos%"ng#,sonalisation',
+    '#%ugini#)versities"#sme#(tiferous"(t-owners##kel#\'rifying%$kova$(odollars%)technical"$xlib!$f1/1!&gex-2t!(harisaic$\'yngitis',
+    '%)typically"$ilae%$tely$(hellenes$$onym$%potts#$pson"$obos#%nebox%\'ticians#,to-sensitive%$fits%)reception"(ragmites"\'ysiques',
+    '!&iatkus"+ck-your-own$%vance"(e-charts#&rluigi$/re-saint-martin&%fitte#&tistic#+zo-electric")geonholed"$lier#+kinsulation"&miento#$lott")n-stripes',
+    '##ger#%jarra##kly#$nies#*t/2&frac12"*pe-trained##per$#ins"#ran##sig"%tbull!*la&icirc;t#(ce-based$$idia#\'neloads',
+    '$$form#%stica#(telayers$&ydoras#&ytimes"\'easence&!r&"th#$ming#\'siosaur#&xiglas""in"\'umbline#*riactivity#%tonic',
+    '!"ml"!p!*ocket-size&$book",int-by-point",larizability#\'epieces$+ward-moving#2itically-sensitive#"ja#(yandrous$)chromatic$+isobutylene$(metallic$$nyas',
+    '"$maks"+nderousness$\'keepers#"sa#+ting/league"$okas#\'l-jones#\'rhouses")rtchester$$iera$*opulmonary"#sey#&sesion#\'t-april%(siberian',
+    '$&coital$&eriors"(tboilers#%shots"*ughkeepsie#-lteney-crosse&#rer"%wer/4!,p.98&ndash;9"%atrc5""ls!-r&eacute;lude"&achner"/e-associateship$!b',
+    '%*ompetitive&)ntractual$$game$$head&&llenic$$inca$%legal$)political%\'randial$&select&$nile%)tructured#$achy#%della#)formation',
+    '#)historian#&linger\'%ually#&mises.#%neste##ppy#)scribable$%ocial$.sure-sensitive$*ton-mafham$*ymptomatic#&tarsus"-ice-conscious#0nt/retain/delete%$head',
+    '#&vative#)zefighter"+o-celebrity$#plo$$tory$\'yeltsin#"ba$+lem-solvers\'(.solving#(creative$*yclin/parp#,duct/service\'\'ivities#)fitbosses#,gnostication',
+    '#(karyotic##les$)iferators#,nunciamiento#&pliner$#ter#(rogation#/sperous-looking#)testingly$\'ractors$!z#+visionality#%wlers#+ximo-distal""pb',
+    '!-salm-settings"+ephological#-udo-religious&&nymous&\'science"$i/ft#!2"&yching%(ocentric!,ublicity-shy"#mpy"\'nchball$$tata#(ishingly$(tiveness',
+    '#(gatorial#%ifier#+nell/thames#&omycin#%posed#"ry#%suant#$veys")sh-chairs#)syfooting"$tman"%zznic!$vmc3"!s!&x/iris',
+    '"#rah$*mid-shaped#)oclastics #q34!!7!!8!"ft!+uadrangular%)imaculata&&plegic#\'ntitate&&zation"&eerest#$sada$(tionaire',
+    '%"us#*l&egrave;s#&nlivan$%olone$(quennium$!t 3r&aring;dhuspladsen")iacute;os!%.f.i."$h.a.""o."$s.a.!$2(2)"!0!*ace-horses',
+    '"+diochemical""es"%ffael$!e"%ggett"&igmore#&lheads$+way-workers#%mondi#-sonn&eacute;s"%khman"$mets#+sey-optimal"$nade##bir',
+    '#\'kilburn%"ne"&reness"#ses#%trick"%table#)hausplatz"\'w-boned"&y-bans"*zor-blades!"cf!,e-adjustment%%opted#(consider\'(truction',
+    '#(dialling$$oing#$echo$&diting#(ignition#(location#$roll%$ofed#)selection"*activities#\'deption$(y-loaded%$made#%ktion#&son(s)',
+    '"(convenes\'%rsion$+rd-breakers#*rudescence#&usancy"(d-coated&&loured$&footed$$pied$\'stained$&winged#*efinitions$%liver#$nall$$ecks',
+    '##rew#)ucibility"*eves-smith"$fits#\'loating#)ormations#&raming#$user"\'gard_to#(ion-wide&"s."+ichskanzlei&\'marshal#%naldo$\'sertion',
+    '$-terpretations"\'latedly%\'ionally&%vists($ties#/egation-haunted".newable-energy#+ormalizable"!o"(parative#\'ellents#(lenishes)%ments#(robation%%ducer',
+    '"/search-oriented$&ctable$&ttlers#0idential/nursing$"te#\'pecters\'&ively.$$ites#*timulation$+rictiveness#"us%!.##zke"%tells#\'iculata',
+    '$*oscendence"\'velries$%tment#$iewz$#ver"(writings"%ynell!"gm!&hegion#&torics#\'umatics"\'odesias#(mbomeres"#yll!+ib-tickling',
+    '$"rg"\'cardian#%ercar#%hhill#"ke"%dgeon%$well"%ggins#-ht-hemisphere&\'to-left##ors$%urous"#les"#ndi")sc/ultrix',
+    '#$kily"\'tualism"$ving!,oad-builders$%/rail$$burg"&bartes#"ur"2ckabilly\'n\'country"(d-shaped"%gelio$)r-patrice""ig#!n""ja',
+    '#*e-reversal$(x-jackie#\'l-along$)er-skates"&mancer%$ists%*ticization&#sev##per""nt"&ofline#$mbed$$mate"#pac"(quefeuil',
+    '$"ms"\'senburg#)icrucians#*s/scotland$&trevor"\'tarians$$tive#$oiti$#roa"*ugh-coated#)nding-off"/wbottom/swindon#%locks"\'y-smith#+alton-kisch',
+    '#%lance!#rnd!%s2000!-ubber-tappers#"ie$"ks"%ihuan#%perez#0z-gim&eacute;nez""la#&ebooks"\'manians##ors$*ur-mongers"+nning-mates',
+    '##ton")sh-seated$!y#&kinian#)so-german&\'turkish##tly"$xley!%ydell $s(n)!)-adenosyl"#tek!#.11#"33#!4',
+    '"!5##(3)#$3(2)"!8""92"$c.f."#e.m"*frugiperda"$o.s.!"/n!%10(1)#!2#$3(1)%"3)"$1(1)',
+    '"#263""37"$4(6)""71!$2(3)!"40"#30c!"61"$9(1)!%70(1)"%40(5)#!1!"86!#a55"%adawi',
+    '#%cadic")d-looking#(dlecloth#"hu"*int-gilles&&palais&2sauveur-le-vicomte&&venant%)es-maries",lam-weinberg##lie#(mon-pink##oky#)t-stained"(me-again',
+    '#%dwood#"ni#$samp#(t\'andrea$$ucci")rtorially"\'ssafras"(tisfiers#&terley#(urations"&ughall#$nder"#vov##tec")w-toothed',
+    '!"b1!-c&icirc;nteia"&adding#&led-up$"ia$#pay#)ndalising%#ens$$sion#$rily"&eattas"!g"&hapiro$*uspielhaus#$erzi',
+    '#&iavone$\'effelin$&ltrons#\'neeweis#*oenbergian$%mberg$*ol-friends\'$wide&*s/colleges#*umpeterian"&illies#)ssor-like""ni"&ooting#$ping',
+    '#$ters$)land-wide$&swoman#%urers"$rewy#\'imshaws#\'ollwork#&uffily$%mping$\'tinizes"%si-ii"$ud-b#%llard#$mble!#drp',
+    '#"ga#%mline#$salt#$well"#bae##eok"+cond-minute#)retagogue\'*ry/manager#\'ularity$&reware"(ductress"$e-er#%dsman"$iner',
+    '%\'ologist".lf-deprecatory%)enforcing%(injuries#$inus#&vagens"2mantics/pragmatics#*i-basement%(mystical%&secret%)voluntary$+crystalline$%final#)pervirens$\'iternal',
+    '#"oi#*se-spectra%!i%&lessly$)ori-motor")paratives"\'quester\'%rants"&refeli#*geant-chef%!y#)ingueiros#+oconverters##res##vus',
+    '"+t-theoretic"%ven\'s%(-fifteen%)th-seeded")ychellois!"gn!(hadgeldi#\'ftsbury#$gari#&kiness#&mingly#%ndies$#gri#(pelessly#%ravyn',
+    '%&owners$%kskin$)pshooters#$vian"!c#%hapov"\'e-mules#$avyn#$e-it$&p-like#"il#!k#\'llholes#%pperd#\'rbourne',
+    '$+ry-coloured$%woods"&i\'ites#%ftily%&y-eyed#%h-sen#$mada#$ners#\'p-shape#\'ranikha"&oddily#(e-gazers##nen#)p-windows$&fitter',
+    '&&necked&\'termers%&fields#&t-guns#,ulder-straps#&wbands"\'redders$$wton"$ucks"$webo!(iberians""ch"&deburn$#man$$wall',
+    '"\'gistrix#&moidal\'&oscope#(nalboxes&$lers$&boards$)ificatory"$leby#%locks#(pa-archa#$vana$&erberg"-milarly-sized#&patico"(n-binned',
+    '#\'g-songs$&around$%ulars#%khole$$ings"&phnian"+tting-rooms")x-fifteen$&minute$%under#*th-largest!&k-n-sh"%aldic"&eldale"%iable',
+    '"%ynner#&scapes!)lap-happy#)te-roofed#)ughterman"(eep-safe#"wy"&icking#(ghtingly#)m-fitting$#cea$"ly#\'ngbacks#)pperiness$$ways',
+    '#)venliness#(w-acting"&uttish!\'mackers#&llbury".ith/gloucester&&oxford%%wicks$"ti!#n12"$8000"\'akelike%#pit"%ellen"!f',
+    '##wer$$line"(uffboxes#%gness!*o_erm_that"5cial-d&eacute;mocrate&+ly-oriented$\'ologism"%dbury"\'ft-left%%soled"(i-disant#+gn&eacute;e"*larisation##deu',
+    '$%noids#%vable"&me-one$)rsetshire"3n_et_lumi&egrave;re")othsayers"$rtal"$suke"%tiris"\'ulmates#(ndboards##sse#(therness")vietskaya!)paciously',
+    '##his#*nish-owned#\'rseness%$holt##sov"(eciesist%#osa$\'marks89$.trophotometric#)ndthrifts#,rmatogenesis$#rle")hincteric)!s"%icier',
+    '#&kiness#%llway#+ndle-shaped$%iform#&racles#%te_of"%leens")oil-heaps##lka#%olers#!s".readsheet-like#)ingboards&#ers$$tely',
+    '""sg!$q.m."&l*plus"+uirrel-like(!l!%rp60n!#s.1""df!-t-germain-des#%josse"\'ableman#*ff/student%"s.#$gers$"gs',
+    '#(lagmitic$(l-holder%&worthy#+ndard-sized$%islas(&vskian$%ovich$\'tondale#\'rt-rite%#les#+tionmasters$(or/rotor#\'udinger"\'eadiest##lai',
+    '#*m-cuttings#&pchild$*hanopoulos$$less#(tchworth$#sky"&ickier%$lers#%ffish#+gmatization#!l$$well"!n"&ockham%$work',
+    '#"la$"es#\'nehatch#)rm-lashed%(troopers##uts""ps".range-sounding$$tify#*eet-lights$(ngthener$*ss-induced#$icta$$ggio$(ke-prone',
+    '$*ng-running#/ucture-specific)$less$&ng-out##ype"&unners#$pid.#(rm-ruger"-yle-conscious!0ub-&dollar;5,000%\'pound;2$&adults$$base$&divide$-organizations',
+    '%&ectors%%hells%%paces$%tasks%$rees#%axial#)confluent#)fulminant%"sc#(globular#*horizontal#&irachs#&jacent$&ect(s)\'*/predicate',
+    '#*mandibular#$plot#)rahmanyam#\'sidizes$)tantiates%&ituent$\'umption#%tends"*ccinctness#&h_like"%deten##ies"$edes#"ur"&ffolks',
+    '#\'lenness##ph."*n-loungers$"up#$laws#&nydale"1per-featherweight&!g&$hero%&_duper%%field&\'luously%#gen%\'imposes&(nfection',
+    '#)ramaximal&(olecular$\'isingly"&rabaya$!t"$slov#)tentation!\'vartvik!#w14#!5"!9"&annell%-son-on-wheels#\'ythling"\'eepings',
+    '"(ift-hook%$lets#&neherd$\'g-doors"#ots!"y1",llable-final#*vopastoral"(mposiums"*ncretistic#)dicalists#\'ecdoche#)kinematic"0stem-independent&)atisation',
+    ' \'t&amp;g\'"wu&!m!"-g#%roups"&series!#.a."$u.c.!$abla$(e-cloths&$mats%\'/figure%(spoonful#$uchi",chymetabolic',
+    '#(iturnity"#fos#)t-hartley"(ilormade"#kin"%lbots#%garth#)l-growing$\'entires"*n-coloured#$gney")pe-slides"#ras#%siers"$ties',
+    '",wny-coloured"*x-approved#%icabs"\'ylerson$(or-gooby\'&morgan#%mouth!"bt!"dy!.eacher-centred#)m-manager#(r-stains##tao"%bbutt"#cum',
+    '#!i"%e-off#%niest#&sville#$ters"#hyi"$larc#\'emetric$$path$*scopically##fos#\'l-tales$\'ing-off"%mbisa#(perately',
+    '"+ndentiously#\'sioners#$ters""pe"$rgal#$rane%$rium#\'vahauta"(st-drive%*status-are$$ings"*tra-acetic%$plex!"g1"!a',
+    '#*nksgivings#"pa"+ecodontians)!s#%odicy#+rmochemical#)ssalonica")ick-soled&&walled%&nesser#"js#)n-section$(gummybob#\'onville#*rd-country',
+    '$(ty-sixth\'\'two-bar&*somethings"5omas-ferrand/governor$+pson/thames$!s#&nemann$%gsouk##pas#%resen#)ught-flow"#p-1"(ree-band&-dimensionally&&spined',
+    '&$less#)omboxanes")umbprints#-n-hohensteins$\'derball)"ss\'%heads#\'ringian$#sby"+yroglobulin#&sanura!\'ideless#%worth"%e-ups#$d-in',
+    '#$less"&lbrook##ton"(mberwork$!s#*e-averaged%&locked%\'periods%&tabled*!s%&warped%%zones"(n-dipped#&ctorum#\'glingly',
+    '"$rith##ole##yns""ta#$hing"#vey!$m262"#rtc!"n."!b!"o\'"%bashi"&e-hold")kyo-based"$land',
+    '"%mdoun#\'my-guns#$pson"\'ne-deaf"&o-high$$long#(thpastes"(p-priced$#ups#!i$\'c-based#%soils"#ril#)mentingly#%rells',
+    '#$hill#\'tington"#vey"(werblock#%nhead$$sley"%ylike!)rabecular%*n-trarbach#"d.$&e-mark%$name%#off#%ffics#%gical',
+    '$\'n-sheds\'\'potters#(nchettes$)sactivate&%lpina%(itionary%)locations#*umatically"(easonous\'!s#)betherick$%uchet#$dell#)e-fringed#&forest',
+    '#)ndsetters#+stle-tables"&ibally#,chloroacetic#%dents#&hedron#)potassium#$tely""op#(tskyites#,ubleshooters$(ser-suit"(ustfully#-th-conditions&&values',
+    '!#uae"(berville",c-affiliated"\'ddenham"$ffet""ke"%ndra.#(efulness"#ong"$rbay$)ochargers%%drive#&npenny#$tons"$shes',
+    '#"in#"us!#vmm!\'weddell#\'edsmuir#\'lve-bar#1nty-five-year-old\'%pound&*somethings"&ickers#"nn#"ts"%o-bar%%laded$&footed',
+    '+#ths$(plus-two$"to%%wenty$$wire#&/three#%gates #u87!#ars!$bayd"#ial"!p!$dege!&exkull!)fologists',
+    '!*ltra-clean%$foot%\'montane%)sparc-iii!%milta!+n-christian#\'islamic")abashedly#\'ccepted#-pologetically#"tt%)ractively"(balances#&rushed#%uckle',
+    '&%ified#)irculated#\'odified$)mpromised$*nformities%,ventionality"(deceived$(r-butler&(financed&)insurance&)occupancy&*production&$ripe%$card&$oats',
+    '%*determined%*emphasized%\'garment%(payments&(opulated%(strength\'%udied#\'ogmatic#&ulator"\'endowed$*terprising#\'xpanded"(favoured#$ired#*orgettably',
+    '"%glued#(raspable%#zed"&ifiers#$imog#,maginatively$)peachably#*nfluential$)terpreted\'(ruptible#%onise#%ts/ml#-versit&eacute"*likeliness$&ved-in',
+    '",marriageable#*eritorious$&talled#&indful#&uzzled")navigable#)ormalised$#ted"\'ordered")patterned#)ersuasive#*leasurable#-rofessionally%\'pertied")readiness',
+    '%%tored#,ighteousness#"ra"(seasoned$%eable$(gregated#(hiftable$\'uttered#\'moothed#\'oftened#&tamped$\'retched$%udied#+uspectingly#-ystematically',
+    '%(nsformed"(verified"&weaned#*orkability!*pper-bound&&storey"(ritchard"%scale"%turns"\'ward_of!(raninite"#ibe#"en!/s&dollar;13,000+)8,000,000',
+    '*!2+$,200,#400+%2,000+"40+)5,000,000,)0,000,000*%3,900+)0,000,000*"40+"50*%6,600*&70,000**80,000,000"*-dominated',
+    '"-t-kamenogorsk")urpations!#td. 2v&amacr;naprasthin".eacute;ronique!"-1"&necked"%signs!#.32$%terbo"$d.u.!$2000!&acates##lev#&uously',
+    '#"us"#ldo#\'idators#)orisation%#ous#"tr"%mpish"(nderheld&$plas#$load##nes"%renne&$ikov##ian$(egations',
+    '"-soconstrictor$*dilatation)#ors!-ehicle-taking"\'llacott%!n"%natio#)epuncture"(reniging#\'micelli"*siculation#%tfold"%terna!\'icarius".deo-recordings',
+    '##i/o#!s""es"(gilantly#%noble"#lar##son"(nogradov"&olator"%rgate$"os"$scus#%icalc"&talite"(viparous',
+    '!(ocatives"%evody""gt##ues"*l-au-vents##.36#+caniclastic&%ology##ens#!x"\'rticist"!t"*wel-sounds!$r422!#sx4',
+    '##kov#$pine#)ture-like"\'nerable!"vd!"xl \'w&amp;m!#.e.""t.!%1282x"!y!+acc-pacific",dati-benioff"(gonettes"&hlberg',
+    '$)ing-lists"%lbury#2dhof-aschaffenburg#%lhead$$oons#/ton-on-the-naze")nnemacher"\'r-weary#"ba#(denships#%m-ups$#ish#&neford#\'rantors#%tberg',
+    '#$sail$&ilieff#%trels"*ter-wheels%%sport"+ve/particle$$rton!$b188!#drn!0e/us/our/general",alth-holders#*ry-looking#)therstaff\'#top\'$wise',
+    '"$eing#.kly-collection")ightiness#*rd-looking#&ssbier"/lfare-dependent#*l-filtered%%honed%\'merited%)regulated%(seasoned%\'watered&&rapped$#_of##ney',
+    '$"oe"&t-rice#$/dry"$xham!$gpti!,hat-have-you$"pc",eat-coloured%&fields%/ley/oxfordshire#"en$!y#$well"+ite-bellied%%board',
+    '$"la$)tam-smith%\'ingdale%"ox##zzy"-oomph-whoomph"$ydah&!s!%ibbly"+cketkeepers"$ddup"\'gginton"$lkos#&laston$&ebrand',
+    '##sey#&tshier"$msey"*ne-glasses$$bars#(g-halves#$sper#$wick")re-framed$&lesses#\'ksworth"&ttered!#kts!#myc!$ober',
+    '"(nderings#$tons"&odbury#$lbox$%laton%%iness#"sh"(rd-games%$pair#\'k-cards%&groups%%mates%&places%\'station$\'ing-out',
+    '!(riteable%$r(s)&)/director\',intellectual!*urttemberg!"wc!%ycomb"#les"%ville "x4!"b2"!3"!4"!7!#cii',
+    '!"d3!"e6"&nonyms!"f4!#i\'s"#i\'s""v.!$liii""vi!"rd"!f!#v\'s +yablonskaya"!d"&nkeleh',
+    '"$qubi"!s"$tely""ya"#zoo!%ehuda"$nici"%s-men!#ips!%obboe"%miuri"$rdan#$kies"%shiro",uth-oriented',
+    '!%ts/yt!"ua"&kagirs "z%!+-parameters!%.506b!&ahedis"%ppala""yd!%eming">ro-zero-niner-zero-fiver-niner!#hkh!$ingy"#yad!$oila',
+    '"$oids"*roastrians!$uhra!%wicky!#ygo',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_22 = (
+count_22 = 6694
+
+heads_22 = (
     '&agr;-helices',
-    '&agr;-linolenic',
-    '&amp;and',
-    '&amp;safety',
-    '&amp;sup222',
-    '&aring;ngstr&ouml;m',
-    '&ast&ast&ast&ast&ast',
-    '&bsol;dos',
-    '&dgr;z',
-    '&dollar;0.0090497',
-    '&dollar;0.06',
-    '&dollar;0.34',
-    '&dollar;0.36',
-    '&dollar;0.40',
-    '&dollar;0.46',
-    '&dollar;0.52',
     '&dollar;1,300m',
-    '&dollar;1,400m',
-    '&dollar;1.5bn',
-    '&dollar;1.61',
-    '&dollar;1.84',
-    '&dollar;1.9',
-    '&dollar;10.3m',
-    '&dollar;10.6m',
-    '&dollar;10.8m',
-    '&dollar;100million',
-    '&dollar;11.4m',
-    '&dollar;11.5m',
-    '&dollar;115m',
-    '&dollar;116',
-    '&dollar;14.5m',
-    '&dollar;14.6m',
     '&dollar;140m',
-    '&dollar;145',
-    '&dollar;150,000&ndash;200,000',
-    '&dollar;17.3m',
-    '&dollar;17.4m',
-    '&dollar;17.6m',
-    '&dollar;18.8m',
-    '&dollar;2&ndash;3',
-    '&dollar;2,500m',
-    '&dollar;2.6',
-    '&dollar;2.80',
-    '&dollar;20.2m',
-    '&dollar;20.5m',
-    '&dollar;200,000&ndash;300,000',
-    '&dollar;22,000',
-    '&dollar;22.2m',
     '&dollar;22.95',
-    '&dollar;220',
-    '&dollar;220,000',
-    '&dollar;225m',
-    '&dollar;230,000',
-    '&dollar;24,000',
-    '&dollar;240,000',
-    '&dollar;240m',
-    '&dollar;250,000,000',
-    '&dollar;26.8m',
-    '&dollar;26.9m',
-    '&dollar;260,000',
-    '&dollar;260m',
-    '&dollar;3,750',
-    '&dollar;3.2',
-    '&dollar;3.50',
     '&dollar;3.8',
-    '&dollar;3.9',
-    '&dollar;30.3m',
-    '&dollar;320,000',
-    '&dollar;34,000',
-    '&dollar;350&ndash;530,000',
-    '&dollar;360,000',
-    '&dollar;375,000',
-    '&dollar;37m',
-    '&dollar;38m',
-    '&dollar;39.6m',
-    '&dollar;42',
-    '&dollar;5.3',
-    '&dollar;53m',
-    '&dollar;56m',
-    '&dollar;570m',
     '&dollar;580m',
-    '&dollar;58m',
-    '&dollar;6,500',
-    '&dollar;6.1',
-    '&dollar;6.6m',
-    '&dollar;650m',
-    '&dollar;67',
-    '&dollar;73,000',
-    '&dollar;76,000',
-    '&dollar;7bn',
-    '&dollar;8.8m',
-    '&dollar;80,000,000',
-    '&dollar;800,000,000',
-    '&dollar;84,000',
-    '&dollar;85m',
-    '&dollar;9.1m',
     '&dollar;9.6m',
-    '&dollar;90,000',
-    '&dollar;e&lsqb',
-    '&dollar;sup12',
-    '&eacute;litists',
-    '&eacute;pater',
-    '&eacute;tat',
-    '&egrave',
-    '&flat;7th',
-    '&formula;1i',
-    '&formula;4',
-    '&frac12%',
-    '&frac12;-1',
-    '&frac12;-inch',
-    '&frac12;cm',
-    '&frac12;d',
     '&frac12;m',
-    '&frac16',
-    '&frac34;inch',
-    '&gt;1',
-    '&gt;7',
-    '&iexcl',
-    '&lgr;1-3',
-    '&lt;0',
-    '&lt;0.0001',
-    '&lt;4',
-    '&lt;5%',
-    '&lt;90%',
-    '&lt;index&gt',
-    '&mdash;is',
-    '&micro;g/kg/hour',
-    '&micro;g/mmol',
     '&micro;mol/hour',
-    '&ndash;s',
-    '&ndash;you',
-    '&ouml;resund',
-    '&ouml;sterreichs',
-    '&ouml;tv',
-    '&plus;0.068',
-    '&plusmn;1',
-    '&pound;0',
-    '&pound;1&frac12;m',
-    '&pound;1,000-worth',
-    '&pound;1,080',
-    '&pound;1,295',
-    '&pound;1,500,000',
-    '&scedil;ah',
-    '\'arf',
     '\'arold',
-    '\'b\'',
-    '\'eft',
-    '\'of',
-    '\'twixt',
-    '\'would',
-    '-2300bp',
-    '-boundary',
-    '-by',
-    '-ribbon',
-    '-x',
-    '0-6-0t',
-    '0-level',
-    '0.5-micron',
-    '1&ndash',
-    '100-',
     '100-index',
-    '100-member',
-    '100-page',
-    '1000m',
-    '10am-6pm',
-    '10am-noon',
-    '11&ndash;10',
-    '11&ndash;5',
-    '11-day',
-    '1170s',
-    '12&ndash;24',
-    '12-place',
-    '12-pounder',
-    '1200s',
-    '13&ndash;2',
-    '13-hour',
     '13-week',
-    '1400s',
-    '15-yard',
-    '155mm',
-    '15q11-q13',
-    '16&ndash;29',
-    '16-day',
-    '16-plus',
-    '16f',
-    '17&ndash;4',
-    '17.5p',
-    '18-foot',
-    '18-track',
-    '1899&ndash;1900',
-    '1910&ndash;14',
-    '2&ndash;5pm',
     '2-way',
-    '2-year-old',
-    '2.8-litre',
-    '20-way',
-    '200-page',
-    '20lbs',
-    '21&ndash;feb',
-    '21(1)',
-    '22&ndash;jan',
-    '225mm',
-    '24&ndash;nov',
-    '24&ndash;oct',
-    '24-carat',
-    '24-track',
-    '25-metre',
-    '25-pin',
     '26-year',
-    '26m',
-    '27ft',
-    '3-deazaadenine',
-    '3-way',
-    '30-acre',
-    '30-metre',
-    '30-ton',
-    '300&ndash;500',
-    '300-foot',
-    '300-page',
-    '34-year',
-    '38cm',
-    '4-day',
-    '4-digit',
-    '4-inch',
     '4-wheel',
-    '4.8p',
-    '40-acre',
-    '40-second',
-    '45-year',
-    '48-page',
-    '5&ndash',
-    '5\'-3\'',
-    '5\'-cc',
-    '5-litre',
-    '5-min',
-    '5-wood',
-    '50-day',
-    '51-member',
-    '520s',
-    '5s-rna',
     '6-cylinder',
-    '6-day',
-    '6-glucuronide',
-    '60-foot',
-    '60-metre',
-    '60-year',
-    '600s',
-    '610mm',
-    '66&ndash;1',
-    '7-year-old',
-    '72-member',
-    '8.1p',
-    '83p',
-    '8jr',
-    '9-year-old',
-    '96&ndash;7',
     'a&ndash;26',
-    'a-15',
-    'a.i',
-    'a26',
-    'a525',
-    'a61',
-    'aac',
-    'aam',
-    'aargau',
-    'aat',
-    'abase',
-    'abased',
-    'abaya',
-    'abdicates',
-    'abdulrahman',
-    'aberangell',
     'abilene',
-    'abitur',
-    'abominated',
-    'acci&ograve;n',
-    'accola',
-    'accreting',
-    'accusative',
-    'acet-link',
-    'acid-treated',
-    'acidifying',
-    'acir',
-    'acn',
-    'acos',
-    'acrg',
-    'acrl',
-    'acrylonitrile',
     'acte',
-    'action\'',
-    'actorish',
-    'actt',
-    'actuate',
-    'actuating',
-    'acuminata',
-    'acz',
-    'adaworld',
-    'addictiveness',
-    'adelchis',
-    'adem',
-    'adireksarn',
-    'adm-19',
-    'admir',
-    'adriaen',
     'adrk',
-    'adulated',
-    'adulterate',
-    'adumbrate',
-    'advected',
-    'adventured',
-    'adventuredom',
-    'adventuress',
-    'advocate-depute',
-    'adzes',
-    'aelred',
-    'aep',
-    'aeroengineering',
-    'aeronautica',
-    'aesculapius',
-    'aethelhere',
     'affectivity',
-    'affixation',
-    'afropithecini',
-    'after-show',
-    'afterword',
-    'agatis',
-    'agdam',
-    'age-based',
-    'agena',
-    'aggrey',
-    'aginst',
-    'agit-prop',
-    'agnus',
-    'agon',
-    'agp',
-    'agricole',
     'agrobacterium',
-    'ahlbrandt',
-    'aideen',
-    'aimsley',
-    'ainaro',
-    'ainderby',
-    'air-conditioner',
-    'air-space',
-    'airbases',
-    'airbreak',
-    'airconditioned',
-    'aircraftman',
-    'aircrash',
-    'airmobile',
-    'airpacks',
-    'airpass',
     'aisgill',
-    'ajami',
-    'ajuga',
-    'akc',
-    'akel',
-    'akiko',
-    'akkadian',
-    'akroteria',
-    'al-atheer',
-    'al-hariri',
-    'al-hassan',
-    'al-za\'atar',
-    'alang',
-    'alarc&oacute;n',
-    'alaris',
-    'alberge',
     'albertini',
-    'alc',
-    'alcmaeon',
-    'aldehyde',
-    'alderly',
-    'aldershaw',
-    'alea',
-    'alectoris',
-    'alekhine',
-    'aleuads',
-    'alexius',
-    'alfama',
-    'alfgar',
-    'algaes',
-    'algren',
-    'alingue',
     'alkylation',
-    'all\'',
-    'all-seated',
-    'all-square',
-    'all-too-brief',
-    'all-woman',
-    'allays',
-    'allestry',
-    'alley-way',
-    'allopathic',
-    'almack',
-    'almsgiving',
-    'alne',
-    'alnus',
-    'alpheratz',
-    'altarus',
     'altea',
-    'althing',
-    'altnagelvin',
-    'altus',
-    'alvares',
-    'amar&uacute',
-    'amarilis',
-    'amasis',
-    'amba',
-    'ambasciatori',
-    'amc',
-    'amdea',
-    'amega',
-    'americanized',
-    'amides',
-    'amie',
     'amipro',
-    'amnio',
-    'amokachi',
-    'amontillado',
-    'amphictyony',
-    'amphioplus',
-    'amre',
-    'anab',
-    'anadarko',
-    'anaesthetise',
-    'anagni',
-    'anaitis',
-    'anat',
-    'anathematised',
-    'anda',
-    'andalus',
     'andor',
-    'andrejcak',
-    'andrew-wa',
-    'anecdotage',
-    'anglophobia',
-    'angmering',
-    'angol',
-    'angstroms',
-    'anguishing',
-    'animal-loving',
-    'animal-watcher',
-    'anjum',
-    'annfield',
-    'annuar',
-    'anopheline',
-    'anoth',
     'anouilh',
-    'ansermet',
-    'anspach',
-    'ant-hill',
-    'ant-lion',
-    'antacid',
-    'ante-chamber',
-    'antedate',
-    'antedates',
-    'antelami',
-    'antes',
-    'anthologised',
-    'anti-alcohol',
-    'anti-appeasement',
-    'anti-colonialism',
-    'anti-colonialist',
     'anti-correctionalist',
-    'anti-e-cadherin',
-    'anti-fascism',
-    'anti-humanist',
-    'anti-market',
-    'anti-materialist',
-    'anti-militarist',
-    'anti-oxidant',
-    'anti-pop',
-    'anti-porn',
-    'anti-science',
-    'anti-ship',
-    'anti-shipping',
-    'anti-stalinist',
-    'anti-statist',
-    'anti-unemployment',
     'anti-violence',
-    'anti-waste',
-    'antifeminism',
-    'antimouse',
-    'antiqued',
-    'antiretroviral',
-    'antirrhinum',
-    'antney',
-    'antofagasta',
-    'antonella',
-    'antrobus',
-    'anuradhapura',
-    'aouita',
-    'apack',
-    'apacked',
-    'apeldoorn',
     'aph',
-    'aphis',
-    'apicella',
-    'apil',
-    'apob',
-    'apollonian',
-    'apple-pie',
-    'appliqued',
-    'apr&egrave;s-midi',
-    'apud',
-    'aquil&aelig',
-    'arachne',
-    'arachnophobia',
-    'arawak',
-    'arbenz',
-    'arbitan',
     'arbitrated',
-    'archaebacteria',
-    'archerfield',
-    'archimedean',
-    'arcic',
-    'arcseconds',
-    'ard&egrave;che',
-    'ardizzone',
-    'ardzinba',
-    'arema',
-    'argentatus',
-    'argh',
-    'arguello',
-    'aringo',
-    'arklow',
-    'arlen',
     'arlow',
-    'armored',
-    'armrests',
-    'arn',
-    'arnet',
-    'arnish',
-    'arrestment',
-    'arrow-slit',
-    'art-world',
-    'arteriopathy',
-    'artes',
-    'ascap',
-    'ascaridia',
-    'asclepiadaceae',
-    'asean-4',
-    'asfa',
     'ash-shoura',
-    'ashagre',
-    'ashdjian',
-    'ashwina',
-    'asiatics',
-    'askews',
-    'asmusa',
-    'asparate',
-    'asphalted',
-    'assessment.',
-    'astarte',
-    'astilbe',
-    'astin',
-    'astm',
-    'astounds',
-    'astras',
     'astringency',
-    'astron',
-    'astyanax',
-    'asylnuratova',
-    'atbash',
-    'atcher',
-    'atgcaaat',
-    'athenia',
-    'athenry',
-    'athy',
-    'atlanticism',
-    'atocha',
-    'atomics',
-    'atomstyle',
-    'atr',
-    'atropurpurea',
     'attar',
-    'attas',
-    'atubu',
-    'aubade',
-    'aubry',
-    'audetto',
-    'augean',
-    'aumbry',
-    'aure',
-    'austerberry',
-    'austicks',
-    'austinian',
-    'auto-da-f&eacute',
-    'autobus',
-    'autoclaved',
-    'autolatina',
     'autoseeker',
-    'autoshaping',
-    'avantgarde',
-    'avatar',
-    'aven',
-    'avions',
-    'awaking',
-    'award-winner',
-    'awcc',
-    'awfy',
-    'axenstrasse',
-    'azcu&eacute',
-    'b&eacute;zier',
-    'b&ecirc;te',
-    'b&uuml;rgermeister',
-    'b-24',
     'b.j.',
-    'ba\'athist',
-    'ba.',
-    'babb',
-    'babu',
-    'baby-swop',
-    'babygro',
-    'baccalaureat',
-    'bacchante',
-    'bache',
-    'back-biting',
-    'back-bone',
-    'back-channel',
-    'back-kitchen',
-    'back-line',
-    'back-lit',
     'back-pedalling',
-    'back-scratching',
-    'back-track',
-    'backaches',
-    'backboned',
-    'backcombing',
-    'backdating',
-    'backslapping',
-    'backstabbing',
-    'badakhshan',
-    'baddam',
-    'bagaza',
-    'bage',
-    'baggers',
-    'baglan',
-    'bagman',
     'bagn&egrave;res',
-    'baguley',
-    'bahriyah',
-    'baig',
-    'baikonur',
-    'baillieston',
-    'bailly',
-    'baize-covered',
-    'bajaur',
-    'bajazeth',
-    'bakeware',
-    'bako',
-    'baksh',
-    'bakshi',
-    'bakunin',
-    'balalaika',
     'balanescu',
-    'balawi',
-    'baleycourt',
-    'ball-by-ball',
-    'ball-park',
-    'balladry',
-    'ballin',
-    'ballinderry',
-    'ballivi&aacute;n',
-    'balloch',
-    'ballpoints',
-    'ballyearl',
-    'balthazar',
-    'bamborough',
-    'banavie',
-    'bandoleer',
     'banjara',
-    'banksides',
-    'barakai',
-    'baram',
-    'barbatus',
-    'barbier',
-    'barcarolle',
-    'bardfield',
-    'bare-legged',
-    'barebow',
-    'baren',
-    'bargain-hunters',
-    'barnaba',
-    'barnack',
-    'barraga',
-    'barreto',
     'barrowgate',
-    'barthelsson',
-    'bartoli',
-    'basdeo',
-    'base-born',
-    'base-man',
-    'basham',
-    'bashkirs',
-    'bason',
-    'bastardo',
-    'batched',
-    'bath-chair',
-    'bathtubs',
-    'batoni',
-    'battery-driven',
-    'bau-bau',
     'bawoyeu',
-    'bay-window',
-    'baysday',
-    'bco',
-    'bcob',
-    'bdf',
-    'beachamp',
-    'beame',
-    'beata',
-    'beauforts',
-    'beaven',
-    'becasue',
-    'becca',
-    'bectu',
-    'bed-chamber',
-    'bed-ridden',
     'bed-sitting-room',
-    'bednota',
-    'bee-keeping',
-    'beech-tree',
-    'beechers',
-    'beechmount',
-    'beegee',
-    'beekman',
-    'beenhakker',
-    'before-and-after',
-    'beginnin\'',
-    'begrimed',
-    'begrudges',
-    'beleagured',
-    'beleived',
-    'believeth',
     'bellaigue',
-    'belliss',
-    'bellwether',
-    'below-ground',
-    'belt-buckle',
-    'bemedalled',
-    'bemerton',
-    'bemusing',
-    'benchtop',
-    'bendectin',
-    'benfield',
-    'bengalis',
-    'benita',
-    'bennachie',
-    'benolin',
-    'benskin',
     'benwell',
-    'beonna',
-    'beral',
-    'berenguer',
-    'bergenia',
-    'bergstrom',
-    'beringar',
-    'berke',
-    'berkhampstead',
-    'bernera',
-    'bernt',
-    'bersonin',
-    'berzins',
-    'bessa',
-    'best-case',
-    'best-trained',
     'bestirred',
-    'besuited',
-    'betake',
-    'betancourt',
-    'betelgeuse',
-    'betta',
-    'bettiscombe',
-    'bewey',
-    'bews',
-    'bezel',
-    'bezique',
-    'bh&amacr;i',
-    'bhavana',
-    'bhk-21',
-    'bi-',
-    'biblia',
     'biblicum',
-    'bibliogr',
-    'bickered',
-    'bifs',
-    'big-race',
-    'big-shot',
-    'biked',
-    'bikini-top',
-    'billingford',
-    'billroth',
-    'bilson',
-    'biodegrade',
-    'bioengineering',
-    'biohome',
-    'biomimetic',
-    'biotype',
     'bird-life',
-    'birka',
-    'birkenau',
-    'birth-weight',
-    'bisbee',
-    'bishton',
-    'bit-image',
-    'bitched',
-    'bitonality',
-    'bivalents',
-    'bizat',
-    'bizzare',
-    'bjelland',
-    'bki',
-    'bkks',
-    'black-bellied',
     'black-brown',
-    'blackhawk',
-    'blackleading',
-    'blackstaff',
-    'blackstock',
-    'blacktop',
-    'blakeman',
-    'blam',
-    'blamire',
-    'blanches',
-    'blanchtower',
-    'blasier',
-    'blast-furnace',
-    'blattern',
-    'blazons',
-    'bleckner',
     'blenkiron',
-    'blenny',
-    'bletchingley',
-    'blewett',
-    'blimps',
-    'blixen',
-    'bloat',
-    'bloaters',
-    'blockheads',
-    'blood-clotting',
-    'bloodthirster',
-    'bloomwater',
-    'blotting-paper',
-    'blue-',
-    'blue-rinsed',
-    'blue-tinted',
     'blueharts',
-    'blundy',
-    'blurts',
-    'bmft',
-    'bo-peep',
-    'boardwalks',
-    'boated',
-    'bocage',
-    'body-armour',
-    'bodypositive',
-    'bodytoner',
-    'boetsch',
-    'bogging',
-    'bohanna',
-    'boilerman',
-    'boldface',
     'boldini',
-    'boliviano',
-    'bombay-based',
-    'bona-fido',
-    'bonanno',
-    'bone-chilling',
-    'bone-headed',
-    'bone-white',
-    'bonecrusher',
-    'bonet',
-    'bonsanti',
-    'bonum',
-    'boo&die;tes',
-    'boogey',
-    'boogie-woogie',
-    'book-signing',
     'bookland',
-    'boot-up',
-    'borde',
-    'borderlines',
-    'boreen',
-    'borgalini',
-    'borge',
-    'borgenicht',
-    'borralan',
-    'borzoi',
-    'boss-9000',
-    'bostonian',
-    'boteh',
-    'bothway',
-    'botnar',
-    'botrytis',
     'bottlang',
-    'boulenger',
-    'bowart',
-    'bowdlerized',
-    'bowering',
-    'bowry',
-    'bowsey',
-    'bowy',
-    'boyar',
-    'bpo',
-    'braggarts',
-    'brain-wave',
-    'braley',
-    'branch-line',
-    'brandeston',
-    'brandi',
     'braniff',
-    'brantwood',
-    'branxton',
-    'brasseywing',
-    'brassneck',
-    'brat-pack',
-    'brathwait',
-    'bratianu',
-    'bratti',
-    'brausen',
-    'bread-making',
-    'breaded',
-    'breaking-in',
-    'breaky',
-    'breedon',
-    'brehmer',
     'brend',
-    'brentnall',
-    'brezinski',
-    'brickyard',
-    'bridge-builder',
-    'bridgehaugh',
-    'bridgemere',
-    'brienz',
-    'brierton',
-    'brigadef&uuml;hrer',
-    'bright-coloured',
-    'brighthelmstone',
-    'brightsiders',
-    'brigit',
-    'brigs',
-    'brihtheah',
     'brihtric',
-    'briley',
-    'brimelow',
-    'bringeth',
-    'bringin\'',
-    'bristlenose',
-    'britannique',
-    'britax',
-    'britelite',
-    'british-led',
-    'brn-2',
-    'brochet',
-    'brodsgaard',
-    'broken-nosed',
-    'brontosaurs',
-    'brooktree',
     'brosettes',
-    'brosnan',
-    'brown-black',
-    'brownish-red',
-    'brownstones',
-    'bruck',
-    'brue',
-    'brunig',
-    'bruxelles',
-    'brygos',
-    'brynley',
-    'bryon',
-    'bryozoan',
-    'bryzgin',
-    'bubble-jet',
-    'bubby',
     'buccleuth',
-    'buckner',
-    'buffo',
-    'buffons',
-    'bug-free',
-    'bugey',
-    'build-in',
-    'building-site',
-    'bukit',
-    'buklod',
-    'bulgari',
-    'bullet-headed',
-    'bullfighters',
-    'bullfinches',
-    'bullhouse',
-    'bullrush',
     'bullshitting',
-    'bummed',
-    'bunkhouse',
-    'buon',
-    'burberrys',
-    'burette',
-    'burgundy-coloured',
-    'burkeian',
-    'burkinshaw',
-    'burn-up',
-    'burnaston',
-    'burnfoot',
-    'burrowers',
-    'burstow',
-    'burthen',
-    'burthens',
     'bus-driver',
-    'busek',
-    'bushby',
-    'business-school',
-    'butcher-block',
-    'butskellism',
-    'butter-yellow',
-    'buttholes',
-    'button-up',
-    'buzaglo',
-    'buzza',
-    'bw-server',
-    'bwg',
-    'bye-election',
-    'bylaw',
-    'bynum',
     'byzantion',
-    'c\'zaki',
-    'c-5',
-    'c-axis',
-    'c-g',
-    'c-series',
-    'c-terminus',
-    'c.k.',
-    'c14',
-    'c41',
-    'cabana',
-    'cabarets',
-    'cabi',
-    'cach',
-    'cadder',
-    'caddie-master',
     'cadette',
-    'cador',
-    'cafiero',
-    'cagots',
-    'caisse',
-    'calanscio',
-    'calera',
-    'caley',
-    'caliphs',
-    'calking',
-    'calla',
-    'callaway',
-    'callendar',
-    'callouses',
-    'calocera',
-    'caltha',
     'calvocoressi',
-    'camel-hair',
-    'cami',
-    'camkii',
-    'cammy',
-    'campanella',
-    'canadair',
-    'canalised',
-    'canan',
-    'canap&eacute',
-    'candidus',
-    'cannabich',
-    'cannibalized',
-    'cannot',
-    'cannulated',
-    'cannutt',
     'canoed',
-    'canp',
-    'canti',
-    'canucks',
-    'canzon',
-    'caolan',
-    'capcom',
-    'capitan',
-    'capitoline',
-    'caprivi',
-    'caproni',
-    'captn',
-    'capua',
-    'car-owning',
-    'car-phone',
-    'caratti',
     'carbon-copy',
-    'carbonate-hosted',
-    'carbonation',
-    'carbone',
-    'carboxy-terminus',
-    'carcanet',
-    'card-table',
-    'cardiothoracic',
-    'cardmember',
-    'cardoen',
-    'careening',
-    'career-orientated',
-    'career-oriented',
-    'career-woman',
-    'carless',
-    'carlill',
     'carlzon',
-    'carnedd',
-    'carnel',
-    'carnian',
-    'carolco',
-    'caroliniana',
-    'carolled',
-    'carpaccio',
-    'carretto',
-    'carriere',
-    'carrog',
-    'cart-horse',
-    'carta',
-    'cartes',
-    'carvey',
-    'casaroli',
     'casas',
-    'casburn',
-    'case-work',
-    'cassette-player',
-    'cassini',
-    'castellabate',
-    'castle-guard',
-    'castlethorpe',
-    'casualwear',
-    'catallaxy',
-    'catalunya',
-    'catechol',
-    'catinat',
-    'cau',
-    'causticum',
-    'cauterise',
     'cauterised',
-    'cautery',
-    'cauty',
-    'caws',
-    'caxford',
-    'cazden',
-    'cbes',
-    'cbsi',
-    'ccf',
-    'ccup',
-    'cd3-',
-    'cdrom',
-    'cdrs',
-    'ceausescus',
-    'ceci',
-    'cedd',
     'cedok',
-    'cell-count',
-    'cell-mate',
-    'cellmark',
-    'cels',
-    'cem',
-    'cenco',
-    'ceneca',
-    'centaury',
-    'centra',
-    'centrophenoxine',
-    'centurions',
-    'century-maker',
-    'cepgl',
-    'cephalopod',
-    'cepheus',
     'cere',
-    'cerene',
-    'certificat',
-    'cervo',
-    'cessnas',
-    'cf-200',
-    'cflo',
-    'cfup',
-    'ch&acirc;tillon',
-    'chadderton',
-    'chagalls',
-    'chain-saw',
-    'chair-lift',
-    'chairbound',
-    'chalet-style',
-    'chaloners',
     'chambery',
-    'chamfering',
-    'chamlang',
-    'champ&ecirc;tre',
-    'chanak',
-    'chandley',
-    'channings',
-    'chapbook',
-    'chapel-going',
-    'chaperoning',
-    'character-drawing',
-    'character-forming',
-    'charan',
-    'charcoaled',
-    'charcot',
-    'charge-hand',
     'charlady',
-    'charlot',
-    'chart-based',
-    'chart-topper',
-    'charter-train',
-    'chartier',
-    'chasseur',
-    'chattahoochee',
-    'chattanooga',
-    'chaudhry',
-    'cheap-looking',
-    'checkered',
-    'cheek-by-jowl',
-    'chemisorbed',
-    'chemwindow',
-    'chengjiang',
     'cherryfield',
-    'chester-lestreet',
-    'chettiar',
-    'chi-rho',
-    'chicot',
-    'chicxulub',
-    'chiefs-of-staff',
-    'chiff-chaff',
-    'chiffchaff',
-    'chilaw',
-    'child-',
-    'child-birth',
-    'child-wife',
-    'chill-out',
-    'chimango',
-    'chimie',
     'chimney-sweep',
-    'chimoio',
-    'chinese-backed',
-    'chinned',
-    'chip-set',
-    'chipchase',
-    'chipley',
-    'chipmunks',
-    'chirality',
-    'chittering',
-    'chiyonofuji',
-    'choc-a-block',
-    'choccy',
-    'chock-full',
-    'chocolat',
-    'cholecystectomised',
     'cholecystokinin-8',
-    'cholestyramine',
-    'cholla',
-    'choquette',
-    'chronica',
-    'chuckin\'',
-    'chungchong',
-    'chunkies',
-    'church-as-a-field',
-    'churched',
-    'churchstoke',
-    'churnet',
-    'chyluria',
-    'cigar-shaped',
-    'cilicia',
-    'cimmerian',
     'cimmyt',
-    'cior',
-    'circ',
-    'citronella',
-    'citylink',
-    'cive',
-    'clacked',
-    'clades',
-    'clangula',
-    'clapp',
-    'clarifoil',
-    'clarkston',
-    'class-struggle',
-    'classiques',
-    'clastics',
-    'clava',
     'clavering',
-    'clawson',
-    'clay-pigeon',
-    'clea',
-    'cleal',
-    'cleanin\'',
-    'clear-felling',
-    'clearchus',
-    'clementines',
-    'clementis',
-    'click-click',
-    'cliff-hanging',
-    'cliff-path',
-    'clime',
-    'cliss',
-    'clitoral',
     'clocaenog',
-    'clockmaking',
-    'clodumar',
-    'cloe',
-    'clogger',
-    'clohessy',
-    'close&num',
-    'cloth-making',
-    'clothes-horse',
-    'clutters',
-    'clyde-built',
-    'cmb',
-    'cna',
-    'co-incided',
-    'co-published',
-    'coachbuilders',
     'coachbuilding',
-    'coal-dust',
-    'coarse-textured',
-    'cobh',
-    'cobo',
-    'cochlea',
-    'cockatrice',
-    'cockell',
-    'cocooning',
-    'cocteaus',
-    'code-breaking',
-    'code-word',
-    'codies',
-    'coeli',
-    'coffee-making',
-    'cognex',
     'cohn-bendit',
-    'cokey',
-    'colchester-based',
-    'colden',
-    'colenso',
-    'colesfield',
-    'collectivize',
-    'collioure',
-    'collyhurst',
-    'colobines',
-    'colonel-general',
-    'colorfast',
-    'colorful',
-    'colour-treated',
-    'colourcode',
-    'comarco',
     'combattimento',
-    'combinatorics',
-    'combusted',
-    'comini',
-    'comique',
-    'comoran',
-    'company-car',
-    'compartmentalise',
-    'competence-based',
-    'compilatio',
-    'compositae',
-    'compotier',
-    'comprends',
-    'compserver',
-    'computer-',
-    'computer-drawn',
     'con-man',
-    'conceptualist',
-    'concertantes',
-    'concertinaed',
-    'concessionaire',
-    'concilio',
-    'concilium',
-    'condepa',
-    'condominiums',
-    'conf',
-    'conistone',
-    'conjunct',
-    'connexional',
-    'cononish',
-    'consequentialist',
-    'consiglio',
     'consumer-orientated',
-    'containerized',
-    'context-dependence',
-    'context-stimulus',
-    'contextualised',
-    'contextualized',
-    'contrariety',
-    'contraves',
-    'control\'',
-    'controller-general',
-    'controverted',
-    'conventionalized',
-    'convento',
-    'conways',
-    'cookability',
-    'cookshop',
     'cooltempo',
-    'coom',
-    'cooperage',
-    'cooperia',
-    'copper-alloy',
-    'copper-nickel',
-    'coppin',
-    'copy-cat',
-    'copycats',
-    'copyholds',
-    'copywriting',
-    'corbiere',
-    'corcaguiney',
-    'corde',
-    'cordes',
-    'cordilleras',
     'cordoning',
-    'corigliano',
-    'corpo',
-    'corporate-bond',
-    'corporate-finance',
-    'corregin',
-    'corrida',
-    'corsini',
-    'cort',
-    'cortijo',
-    'corvision',
-    'corys',
-    'cos-7',
-    'coshe',
-    'coskun',
-    'cosmodrome',
     'cosmography',
-    'cotgrave',
-    'cotton-spinning',
-    'coull',
-    'counter-punch',
-    'counter-strike',
-    'counter-trade',
-    'counterattacked',
-    'counterforce',
-    'counterpack',
-    'countersink',
-    'countesthorpe',
-    'courte',
-    'courvoisier',
-    'couvelaire',
-    'cowpen',
     'coxhoe',
-    'coxwell',
-    'cozens-hardy',
-    'cpes',
-    'cpgb',
-    'cpim',
-    'cpns',
-    'cpp-ml',
-    'cqsw',
-    'crabapple',
-    'crabbit',
-    'crabgrass',
-    'cradle-to-grave',
-    'craghoppers',
-    'cragside',
-    'crammers',
     'crash-helmet',
-    'crassipes',
-    'crawly',
-    'crea',
-    'credential',
-    'crematogaster',
-    'cremonini',
-    'crimdon',
-    'cringes',
-    'critchlow',
-    'criterium',
-    'croan',
-    'crocetto',
-    'cronkite',
-    'crop-protection',
-    'cross-course',
     'cross-current',
-    'cross-grain',
-    'cross-link',
-    'cross-subsidise',
-    'cross-training',
-    'crossens',
-    'crosstalk',
-    'crotone',
-    'crouesty',
-    'croupy',
-    'cruas',
-    'crucifixions',
-    'crue',
-    'crumples',
-    'crusting',
-    'crutched',
     'cryin',
-    'ctagag',
-    'cubana',
-    'cubistes',
-    'cudlipp',
-    'cug',
-    'cuisini&egrave;res',
-    'cuito',
-    'cullet',
-    'cullinane',
-    'culm',
-    'culme',
-    'cult-statue',
-    'cumi',
-    'cumulate',
-    'cunobelinos',
     'cuppers',
-    'cura&ccedil&atilde;o',
-    'curating',
-    'curbridge',
-    'curraghinalt',
-    'currey',
-    'curriers',
-    'curs',
-    'curst',
-    'curtain\'',
-    'cus',
-    'cussing',
-    'custodio',
-    'cuttin\'',
-    'cva',
-    'cvni',
     'cyanoacrylate',
-    'cybil',
-    'cyclostyled',
-    'cynara',
-    'cypripack',
-    'cyrenaean',
-    'cystopurin',
-    'cyto',
-    'cytospin',
-    'czech-slovak',
-    'd&aacute;vila',
-    'd&eacute;collet&eacute',
-    'd&ouml;ldissen',
-    'd\'arc',
-    'd\'esprit',
-    'd-shaped',
     'd.p.',
-    'dactylic',
-    'daemon-room',
-    'daeria',
-    'daevas',
-    'daeve',
-    'daines',
-    'daintees',
-    'dairylea',
-    'dalcroze',
-    'dallaway',
-    'damn\'',
-    'dampier',
-    'danbridge',
-    'dancey',
-    'danchet',
     'dangereuses',
-    'daniela',
-    'danieli',
-    'dansette',
-    'danseuses',
-    'danton',
-    'darchem',
-    'dargue',
-    'darko',
-    'darsena',
-    'darton',
-    'dasha',
-    'databook',
-    'datacare',
-    'datalink',
-    'datarange',
     'datavision',
-    'datchet',
-    'date-stamped',
-    'daten',
-    'datis',
-    'dauberval',
-    'daunton',
-    'davenports',
-    'dawsons',
-    'dbe',
-    'dc-10s',
-    'ddc',
-    'de-la-noy',
-    'deadest',
-    'deadlocking',
-    'deathwatch',
     'debarring',
-    'debouched',
-    'debraces',
-    'debt-burdened',
-    'debtline',
-    'debuggers',
-    'decalogue',
-    'deci',
-    'decision&mdash;making',
-    'deckhand',
-    'deconstructs',
-    'decontrolled',
-    'decretio',
-    'dedial',
-    'deehan',
-    'deering',
     'deery',
-    'deficit-reduction',
-    'defm',
-    'defregger',
-    'degassing',
-    'degnan',
-    'degre',
-    'deja-vu',
-    'dejeuner',
-    'delahaye',
-    'delaporte',
-    'delaunays',
-    'delf',
-    'deliverables',
-    'delmonte',
-    'delong',
     'delphinus',
-    'delphy',
-    'dematerialize',
-    'demilitarize',
-    'democrat-led',
-    'demokratikong',
-    'demonizing',
-    'demotivated',
-    'demurring',
-    'denature',
-    'dentinox',
-    'deols',
-    'departmentalised',
-    'deput&eacute;s',
-    'dernier',
-    'derriere',
     'dervla',
-    'desertmartin',
-    'desilva',
-    'desposyni',
-    'destry',
-    'detotalizing',
-    'detraction',
-    'detuned',
-    'deukmejian',
-    'devastates',
-    'devey',
-    'devismes',
-    'devitrification',
-    'dewlap',
-    'deya',
-    'dez',
     'dezful',
-    'dfm',
-    'dfn',
-    'dhondt',
-    'dhoti',
-    'diamanda',
-    'dibber',
-    'dichotomize',
-    'dichter',
-    'dickler',
-    'dicynodont',
-    'diddley',
-    'didnt',
-    'diencephalon',
-    'diff&eacute;rence',
-    'difficile',
     'difficultly',
-    'diffin',
-    'digithurst',
-    'dilates',
-    'dimensioned',
-    'dinesh',
-    'dingbat',
-    'dining-car',
-    'dinner-dance',
-    'dinorwic',
-    'diophantine',
-    'diphda',
-    'diplomatist',
-    'directorate-general',
-    'direkt',
-    'dirges',
     'disaggregating',
-    'disbands',
-    'discoursal',
-    'disempowerment',
-    'dishonours',
-    'disinter',
-    'dismore',
-    'disowns',
-    'disparages',
-    'displeases',
-    'dispute-resolution',
-    'disrobed',
-    'dissard',
-    'distributary',
-    'dithery',
-    'diu',
     'divisionals',
-    'divulges',
-    'dizy',
-    'djwa',
-    'dna-affinity',
-    'dnf',
-    'dnvp',
-    'doa',
-    'dobbins',
-    'dobre',
-    'dobro',
-    'dobunni',
-    'doch',
-    'dockerty',
-    'docketed',
-    'document-based',
     'dodemaide',
-    'dog\'s-tooth',
-    'dog-training',
-    'dogonyaro',
-    'dohti',
-    'doitsu',
-    'dollo',
-    'domi',
-    'dominator',
-    'domingue',
-    'domum',
-    'donchin',
-    'donemana',
-    'donnelley',
-    'donohoe',
-    'donoso',
     'doodlebug',
-    'doodlebugs',
-    'doodled',
-    'dooh',
-    'doohickey',
-    'door-keeper',
-    'doorknobs',
-    'doorstepping',
-    'dopant',
-    'dopers',
-    'dopes',
-    'doppler-shifted',
-    'dorati',
-    'dorciss',
-    'dorment',
-    'dorotheum',
     'dorre',
-    'dorso-ventral',
-    'dosserets',
-    'dossy',
-    'dotterel',
-    'douai',
-    'double-bind',
-    'double-reed',
-    'doublethink',
-    'douggie',
-    'douglass',
-    'dougy',
-    'down-filled',
-    'down-sizing',
-    'down-stream',
-    'downflow',
     'dr&zcaron;i&cacute',
-    'drach',
-    'drachmae',
-    'draft-dodger',
-    'dragon-lady',
-    'dragonette',
-    'dragontamer',
-    'drainage-basin',
-    'drangaj&ouml;kull',
-    'drau',
-    'drem',
-    'dressler',
-    'drikus',
-    'drinkie',
-    'drools',
-    'drowners',
     'druk',
-    'drumkeen',
-    'drunk-driving',
-    'dry-cleaned',
-    'dry-cleaner',
-    'drylands',
-    'dryopteris',
-    'dual-control',
-    'dual-cpu',
-    'dual-voltage',
-    'dube',
-    'duca',
-    'duchesnay',
-    'duck-rabbit',
-    'ducruet',
-    'dudo',
     'duffed',
-    'duhem',
-    'dukinfield',
-    'dull-eyed',
-    'dumbshow',
-    'dunegal',
-    'dunelm',
-    'dunera',
-    'dungy',
-    'dunny',
-    'duodecimo',
-    'duport',
-    'durdin',
-    'durenberger',
-    'durgnat',
-    'durin\'',
     'durini',
-    'durr',
-    'dust-cart',
-    'dust-pan',
-    'dustcart',
-    'dustsheets',
-    'dutch-based',
-    'duvaliers',
-    'duzme',
-    'dva-4000',
-    'dyak',
-    'dyaks',
-    'dynevor',
-    'dysphasic',
-    'dzorig',
-    'e-zee',
     'e.e',
-    'e16',
-    'e17',
-    'e9',
-    'each-uisge',
-    'eaec',
-    'eagar',
-    'eaglesfield',
-    'eakin',
-    'ealdhun',
-    'ear\'ole',
-    'ear-lobe',
-    'ear-shattering',
-    'ear-shot',
-    'earbery',
-    'early-twentieth-century',
     'earth-shaking',
-    'earthscan',
-    'east-end',
-    'east-south-east',
-    'easthall',
-    'easylink',
-    'eatanswill',
-    'eatery',
-    'eave',
-    'eazilink',
-    'ecclesiasticus',
-    'echinops',
-    'echo-location',
-    'echt',
-    'eckert',
-    'eclairs',
     'eclogue',
-    'ecotype',
-    'ecrs',
-    'ecton',
-    'eddings',
-    'edessa',
-    'edge-of-town',
-    'ediacara',
-    'edinburgh-born',
-    'edinvar',
-    'edman',
-    'edsi',
-    'eduskunta',
-    'eeigs',
-    'een',
-    'egeria',
     'eglin',
-    'egmont',
-    'ego-boosting',
-    'egyptologist',
-    'ehrich',
-    'eichhornia',
-    'eie',
-    'eiga',
-    'eight-cylinder',
-    'eight-lozenge',
-    'eight-part',
-    'eight-port',
-    'eight-user',
-    'eight-valve',
-    'eighty-year',
-    'eilde',
     'eilish',
-    'eisenstadt',
-    'ej&eacute;rcito',
-    'ejaculating',
-    'el-sayed',
-    'electa',
-    'electability',
-    'electrophysiology',
-    'elementals',
-    'eleutherococcus',
-    'elides',
-    'elispot',
-    'elissia',
-    'elmfield',
-    'elmhurst',
-    'elmira',
     'elodea',
-    'elvetham',
-    'elvy',
-    'elwis',
-    'emancipator',
-    'embittering',
-    'emeric',
-    'emgs',
-    'emh',
-    'emig',
-    'emrys',
-    'emulex',
-    'emulsifiers',
-    'emuruangogolak',
-    'enaye',
-    'encashed',
     'encrypt',
-    'end-1992',
-    'end-folding',
-    'end-time',
-    'ender',
-    'enderley',
-    'energia',
-    'energis',
-    'energy-consuming',
-    'energy-generating',
-    'enfleurage',
-    'engeham',
-    'engine-driver',
-    'englewood',
-    'enloe',
-    'enmesh',
     'ennodius',
-    'enps',
-    'enriqueta',
-    'ensnares',
-    'ensnaring',
-    'entwhistle',
-    'environmentally-sound',
-    'envisioning',
-    'enza',
-    'eoka',
-    'epaminondas',
-    'epee',
-    'epiktetos',
-    'epilobium',
-    'epine',
-    'epl-4000',
     'epona',
-    'equi',
-    'equinus',
-    'equipage',
-    'ercs',
-    'erdas',
-    'ergoview',
-    'eridanus',
-    'erling',
-    'erriquez',
-    'error-correction',
-    'erse',
-    'es-335',
-    'escargot',
-    'escheated',
-    'escritor',
     'esd',
-    'esgs',
-    'espagnole',
-    'esparto',
-    'esprix',
-    'essai',
-    'esseff',
-    'est-ce',
-    'esta',
-    'etablissements',
-    'etaples',
-    'etchant',
-    'etsu',
-    'etta',
-    'euboea',
-    'eucalypti',
     'eukaryote',
-    'eul',
-    'eulogised',
-    'euphues',
-    'euro-communist',
-    'euro-rebel',
-    'euroinfo',
-    'euromoney',
-    'europarks',
-    'europe\'',
-    'evalina',
-    'evallonia',
-    'evangelised',
-    'evapo-transpiration',
-    'eve-of-poll',
-    'evenki',
     'eventuate',
-    'eventuated',
-    'evernet',
-    'evgeni',
-    'evgeny',
-    'ewelme',
-    'ewo',
-    'ewok',
-    'ex-boxer',
-    'ex-cop',
-    'ex-editor',
-    'ex-liberal',
-    'ex-paratrooper',
-    'ex-presidents',
-    'ex-socialist',
-    'ex-teacher',
     'ex-vat',
-    'ex-world',
-    'exchange-value',
-    'exclusivism',
-    'excoriating',
-    'excursionist',
-    'exequy',
-    'exocets',
-    'expropriating',
-    'extenders',
-    'externalised',
-    'extorts',
-    'extra-strong',
-    'extracodes',
-    'extruder',
-    'eye-',
     'eye-shadow',
-    'eye-socket',
-    'eyecron',
-    'eyecup',
-    'ezechiel',
-    'ezer',
-    'ezx',
-    'f-117',
-    'f-117a',
-    'f-4',
-    'f-factor',
-    'f-test',
-    'f.m',
-    'f1-11',
-    'f4u-7',
-    'fabbri',
     'fabienne',
-    'fabiola',
-    'fablel',
-    'fabms',
-    'face-up',
-    'factorised',
-    'factory-applied',
-    'fada',
-    'fag-end',
-    'fagging',
-    'fahy',
-    'failte',
-    'fairbridge',
-    'fairy-stories',
-    'faits',
-    'falke',
     'fallibilism',
-    'fallibilist',
-    'falvey',
-    'famiglia',
-    'fancy-free',
-    'fannie',
-    'fantaisie',
-    'fantasises',
-    'fantasque',
-    'fanworms',
-    'farben',
-    'faria',
-    'farm-based',
-    'farmborough',
-    'farzad',
-    'fasciclin',
     'fassbaender',
-    'fassbinder',
-    'fastext',
-    'fastfit',
-    'fastlink',
-    'fastnet',
-    'fat-frank',
-    'fatialofa',
-    'fattier',
-    'fault-line',
-    'fault-zone',
-    'faut',
-    'faute',
-    'fawzia',
-    'fax-email',
-    'fcrs',
     'fd',
-    'fe(ii)',
-    'featherstonehaughs',
-    'feature-length',
-    'fedden',
-    'federate',
-    'fee-for-service',
-    'feeble-mindedness',
-    'feeding-place',
-    'feiffer',
-    'feigns',
-    'feingold',
-    'fellow-traveller',
-    'felsenstein',
-    'felt-tipped',
-    'fenix',
     'fenrir',
-    'ferget',
-    'fermin',
-    'fernande',
-    'ferndean',
-    'fernies',
-    'ferre',
-    'ferrol',
-    'festing',
-    'festschrift',
-    'fettuccine',
-    'fibbens',
-    'fibber',
-    'fibbing',
-    'fibromyalgia',
-    'ficino',
     'fiddy',
-    'fieldman',
-    'fier',
-    'fiera',
-    'fierro',
-    'figging',
-    'filaria',
-    'filden',
-    'filgueira',
-    'film-viewing',
-    'finchampstead',
-    'finching',
-    'fine-grain',
-    'finger-printing',
-    'finger-wagging',
-    'finrot',
     'fiori',
-    'fipresci',
-    'fireglow',
-    'firminus',
-    'first-11',
-    'first-grade',
-    'firstdirect',
-    'fishcakes',
-    'fishing-rod',
-    'fishpool',
-    'fist-fight',
-    'fist-in-a-bag',
-    'fisting',
-    'five-ish',
-    'five-pointed',
-    'five-test',
     'fizzles',
-    'fl&egrave;che',
-    'flaa',
-    'flamande',
-    'flameback',
-    'flamenca',
-    'flapjack',
-    'flashband',
-    'flashgun',
-    'flat-pack',
-    'flea-bitten',
-    'flea-ridden',
-    'fledgeby',
-    'flesh-eating',
-    'flesh-pink',
-    'flip-top',
     'flittered',
-    'flood-hit',
-    'flood-lit',
-    'floor-space',
-    'floorplan',
-    'florendo',
-    'floridante',
-    'floridian',
-    'flossing',
-    'fluidized',
-    'fluorides',
-    'fluorocarbons',
-    'fly-ash',
-    'fly-leaf',
-    'fly-on-the-wall',
-    'flyin\'',
     'flysheets',
-    'fme',
-    'fmol',
-    'foaled',
-    'foi',
-    'fojcik',
-    'folk-rock',
-    'folk-song',
-    'folkman',
-    'foltene',
-    'fontware',
-    'food-gathering',
-    'food-supply',
-    'footbridges',
-    'footwell',
-    'forall',
     'forasmuch',
-    'forber',
-    'force-feed',
-    'forecloses',
-    'foreign-made',
-    'forfaiting',
-    'formentor',
-    'formica-topped',
-    'formol',
-    'formosan',
-    'fornicator',
-    'fortune-hunter',
-    'forty-five-year-old',
-    'forty-four-year-old',
-    'forval',
-    'fos-core-esqe',
     'fosbrooke',
-    'fosco',
-    'foster-father',
-    'foston',
-    'foul-up',
-    'fouler',
-    'foulston',
-    'founder-director',
-    'four-acre',
-    'four-horse',
-    'four-line',
-    'four-litre',
-    'four-phase',
-    'four-speaker',
-    'four-wicket',
-    'fourteen-year',
     'fox-pitt',
-    'foxcroft',
-    'foxford',
-    'foxhound',
-    'foxhunter',
-    'frac',
-    'fragrance-free',
-    'francey',
-    'franche-comt&eacute',
-    'franco-american',
-    'fraternisation',
-    'fraternize',
-    'fraternizing',
-    'fratricide',
-    'frauenkirche',
-    'frazers',
     'frcs',
-    'freakin\'',
-    'fredemo',
-    'free-format',
-    'free-of-charge',
-    'freebase',
-    'freelanced',
-    'freesia',
-    'freewheeled',
-    'freidle',
-    'french-backed',
-    'french-language',
-    'frisco',
-    'frizzled',
-    'fromes',
-    'fromme',
     'front&oacute;n',
-    'front-engined',
-    'front-man',
-    'frontierland',
-    'frou-frou',
-    'fsi',
-    'fsu',
-    'fuad',
-    'fuddy',
-    'fuel-cycle',
-    'fuerteventura',
-    'fuggers',
-    'fukase',
-    'fule',
-    'full-line',
-    'full-throated',
     'full-timer',
-    'full-width',
-    'fully-configured',
-    'fully-developed',
-    'fumigant',
-    'funcoast',
-    'furbush',
-    'furlanetto',
-    'furrowing',
-    'fusaria',
-    'fusarium',
-    'fusarri',
-    'futuro',
-    'g&ouml;del',
-    'g&ouml;tterd&auml;mmerung',
-    'g\'day',
     'g\'night',
-    'g-2',
-    'g-man',
-    'g.r.',
-    'gaastra',
-    'gaboon',
-    'gaeltacht',
-    'gagauzes',
-    'gai-jin',
-    'gailey',
-    'gais',
-    'gait&aacute;n',
-    'gaits',
-    'galante',
-    'galea',
-    'galeries',
     'galia',
-    'gall-bladder',
-    'gallien',
-    'gallow',
-    'galumphing',
-    'gamba',
-    'gamecock',
-    'gamegear',
-    'gaminara',
-    'gamma-interferon',
-    'gandhara',
-    'gandolfo',
-    'gang-rape',
-    'gang-raped',
-    'gangcults',
-    'gar&ccedil;on',
     'garavogue',
-    'garba',
-    'garcilaso',
-    'gareloch',
-    'gares',
-    'garganey',
-    'garretta',
-    'garrisoning',
-    'gartcosh',
-    'garthwaite',
-    'gas-guzzling',
-    'gas-works',
-    'gasan',
-    'gasohol',
-    'gasparovic',
-    'gate-house',
     'gate-keeper',
-    'gatecrashing',
-    'gatefold',
-    'gatenby',
-    'gath',
-    'gatherum',
-    'gattefoss&eacute',
-    'gauden',
-    'gavroche',
-    'gawk',
-    'gazumped',
-    'gc(at)',
-    'gd-dtpa',
-    'gear-box',
-    'gearty',
-    'geddes-brown',
     'geeta',
-    'gelbard',
-    'geldenhuys',
-    'gelderd',
-    'gem&uuml;tlich',
-    'genappe',
-    'genbank',
-    'genda',
-    'gender-differentiation',
-    'geneclean',
-    'gentilis',
-    'gentlemens',
-    'geoid',
-    'geophagines',
-    'geriatrician',
-    'german-american',
     'german-made',
-    'germon',
-    'gervais',
-    'gerver',
-    'gesting',
-    'get_out',
-    'gewurztraminer',
-    'ggf-iii',
-    'ghettoised',
-    'ghose',
-    'ghosting',
-    'giant-killer',
-    'gib\'sea',
-    'gibran',
-    'gies',
-    'giessen',
     'gift-wrapping',
-    'gigawatts',
-    'gilbos',
-    'gilby',
-    'gillecrist',
-    'gillerthwaite',
-    'gillet',
-    'gilli',
-    'gillroy',
-    'gimp',
-    'ging',
-    'giral',
-    'girasole',
-    'giros',
-    'girozentrale',
-    'gis&egrave;le',
     'giv&oacute;n',
-    'givaudan',
-    'glac&eacute;s',
-    'glasgay',
-    'glasnost\'',
-    'glass-house',
-    'gleason',
-    'glemnitz',
-    'glenastle',
-    'glenavy',
-    'glencar',
-    'glencross',
-    'glenfield',
-    'glenhead',
-    'glisseuse',
-    'global-mean',
     'globo',
-    'gloire',
-    'glomach',
-    'glowacz',
-    'glueck',
-    'glueing',
-    'glx',
-    'glycocholate',
-    'glyders',
-    'go-cart',
-    'go-team',
-    'goanese',
-    'goatfell',
-    'gob-smacked',
-    'gobsmacking',
-    'gockley',
     'goddes',
-    'godin',
-    'godmersham',
-    'godwine',
-    'going-over',
-    'golda',
-    'goldfield',
-    'goldfinch',
-    'goldhawk',
-    'goldwell',
-    'goleta',
-    'golf-ball',
-    'goll',
-    'gollnisch',
-    'gompels',
-    'good-enough',
     'good-looker',
-    'good-value',
-    'goodburn',
-    'goodhew',
-    'goosanders',
-    'gopal',
-    'gopher',
-    'gorden',
-    'gorget',
-    'gort',
-    'goschen',
-    'goscinny',
-    'gostelow',
-    'got_a',
-    'gotland',
-    'gottingen',
     'gouin',
-    'government-led',
-    'gr&uuml;nstedt',
-    'grabbers',
-    'gracechurch',
-    'graders',
-    'gradin',
-    'graeca',
-    'graft-versus-host',
-    'grain-growing',
-    'grammatikos',
-    'grana',
-    'grand-daddy',
-    'grandslam',
-    'grants-in-aid',
-    'graphed',
     'gratton',
-    'gravid',
-    'gravure',
-    'grayswood',
-    'greas',
-    'greasley',
-    'green-black',
-    'green-faced',
-    'greenfinches',
-    'greenleaf',
-    'greenmantle',
-    'greenmount',
-    'greenough',
-    'greenskins',
-    'greenspot',
-    'grep',
     'gretsches',
-    'gridford',
-    'grifters',
-    'grimms',
-    'grittleton',
-    'groby',
-    'groen',
-    'grond',
-    'grosgrain',
-    'grossard',
-    'grosses',
-    'grossglockner',
-    'groundbaiting',
-    'grow-bag',
-    'gruchy',
-    'grudge-bearing',
     'gruinart',
-    'gsee',
-    'gso',
-    'gts',
-    'gudauta',
-    'gueldres',
-    'guelphs',
-    'guest-room',
-    'guested',
-    'gugelmin',
-    'guidarello',
-    'guigou',
-    'guilin',
-    'guillotining',
-    'guilt-inducing',
-    'guines',
     'guitar-playing',
-    'guitare',
-    'gullick',
-    'gumming',
-    'gun-metal',
-    'gun-room',
-    'gunby',
-    'gundogs',
-    'gunga',
-    'gunnis',
-    'gunns',
-    'gurage',
-    'gurdwara',
-    'gurinder',
-    'gutekunst',
-    'gutmann',
     'guyanan',
-    'guzzler',
-    'gwala',
-    'gwendraeth',
-    'gwindy',
-    'gwydir',
-    'gwyllam',
-    'gy&ouml;r',
-    'gymraeg',
-    'gyrfalcon',
-    'h&eacute;ger',
-    'haakon',
-    'haaland',
-    'habomai',
-    'hac',
-    'hadaway',
     'hadham',
-    'haematopus',
-    'haemodynamics',
-    'haemorrhaged',
-    'hafod',
-    'hagstrom',
-    'haida',
-    'hailstorms',
-    'hairdrier',
-    'haire',
-    'hairgrips',
-    'hajime',
-    'hak',
-    'hakan',
-    'hakims',
-    'haled',
     'half-dark',
-    'half-fit',
-    'half-rose',
-    'half-sitting',
-    'half-strength',
-    'half-timber',
-    'half-timbering',
-    'half-ton',
-    'half-trained',
-    'half-turn',
-    'half-understood',
-    'hall-door',
-    'halm',
-    'halothane',
-    'halters',
-    'halzen',
     'hambly',
-    'hamfisted',
-    'hamiltonian',
-    'hamitic',
-    'hammarskjold',
-    'hamson',
-    'hamstead',
-    'hanaper',
-    'hanby',
-    'hand-book',
-    'hand-lens',
-    'hand-mirror',
-    'hand-pump',
-    'hand-setting',
-    'handcarts',
-    'handlist',
     'hanfstaengl',
-    'hang-dog',
-    'hangarage',
-    'hankinson',
-    'hanratty',
-    'hanrott',
-    'hanslick',
-    'hapu',
-    'harada',
-    'haraldsen',
-    'haraldsson',
-    'harangues',
-    'harappan',
-    'harcourts',
-    'hard&rehy;working',
-    'hard-fighting',
     'hard-worked',
-    'hardanger',
-    'hardinge',
-    'hardtop',
-    'hardyment',
-    'hareven',
-    'haricots',
-    'harington',
-    'harlan',
-    'harness-maker',
-    'harrendle',
-    'harrises',
-    'harrytown',
-    'harton',
-    'harvest-time',
-    'hasegawa',
     'hashed',
-    'hassel',
-    'hat-stand',
-    'hatchett',
-    'hatchli',
-    'hatshepsut',
-    'hautes',
-    'havanas',
-    'havis',
-    'hay-loft',
-    'hayes-roth',
-    'hazarding',
-    'hazelden',
-    'hd-mac',
-    'head-scratching',
-    'headin\'',
     'headingly',
-    'headon',
-    'headrests',
-    'headstall',
-    'headstay',
-    'headwater',
-    'heahberht',
-    'health-service',
-    'heartbreaker',
-    'heathcliffe',
-    'heathertons',
-    'heatstroke',
-    'heavers',
-    'heavily-used',
-    'heaviside',
-    'heavy-footed',
     'heavy-looking',
-    'heavy-weight',
-    'heckington',
-    'hectored',
-    'heffers',
-    'hehehe',
-    'heifetz',
-    'heimat',
-    'heinen',
-    'helenium',
-    'heliconius',
-    'helicoptered',
-    'heliskiing',
-    'hellenizers',
-    'hellraising',
-    'helmet-plate',
     'hemianopia',
-    'hemsley',
-    'hena',
-    'henricus',
-    'heparin-bsa',
-    'heparin-sepharose',
-    'hephaistos',
-    'herakleitos',
-    'herath',
-    'herb-garden',
-    'herbst',
-    'herla',
-    'hermano',
-    'hero-worshipped',
-    'herrerasaurus',
-    'herreweghe',
     'herscovici',
-    'hertha',
-    'herwald',
-    'heterakis',
-    'heteroplasmy',
-    'hett',
-    'heuga',
-    'heugh',
-    'heureux',
-    'hewed',
-    'hexalite',
-    'hi-gain',
-    'hibbard',
-    'hickam',
-    'high-coloured',
-    'high-dose',
     'high-explosive',
-    'high-falutin\'',
-    'high-fidelity',
-    'high-gain',
-    'high-growth',
-    'high-heels',
-    'high-productivity',
-    'high-revving',
-    'high-society',
-    'high-sugar',
-    'high-tax',
-    'higher-education',
-    'higher-performance',
-    'highlife',
-    'highly-developed',
-    'hilduin',
     'hill-climbing',
-    'hillclimb',
-    'hillcrest',
-    'hilltribe',
-    'himera',
-    'hinderwell',
-    'hinshaw',
-    'hintons',
-    'hippisley',
-    'hippix',
-    'hippodameia',
-    'hippyish',
-    'hirsh',
-    'hirszowicz',
-    'hirundo',
-    'hissy',
     'hit-men',
-    'hit-run',
-    'hitlist',
-    'hmmph',
-    'hoebridge',
-    'hoegrass',
-    'hoffmeister',
-    'hogben',
-    'hoghughi',
-    'hoh',
-    'hohne',
-    'hollyhead',
-    'hollywood-style',
-    'holmewood',
-    'holo',
-    'holsten',
     'holtzapffel',
-    'holub',
-    'holwell',
-    'holy-water',
-    'hom&oelig;opaths',
-    'homais',
-    'hombres',
-    'home-',
-    'home-going',
-    'home-time',
-    'homebuyer',
-    'homemaking',
-    'homeothermic',
-    'homesitters',
-    'homewood',
-    'homophobes',
     'homophone',
-    'homozygote',
-    'hondo',
-    'honest-to-goodness',
-    'honeybourne',
-    'honeyman',
-    'honeypots',
-    'honeysuckles',
-    'honorable',
-    'hoodies',
-    'hooding',
-    'hoofer',
-    'hooh',
-    'hooky',
-    'hoorn',
-    'hopkinton',
     'hoppe',
-    'horgan',
-    'hornes',
-    'hornton',
-    'horrobin',
-    'horrox',
-    'horsebere',
-    'horseflies',
-    'horsemeat',
-    'horvat',
-    'hoshino',
-    'hosier',
-    'host-country',
-    'hotchkiss',
-    'hotdogging',
-    'hotelware',
     'hothead',
-    'hottentots',
-    'houlihan',
-    'house-room',
-    'housecroft',
-    'houselights',
-    'housemates',
-    'houston-based',
-    'hoverport',
-    'hovhannesyan',
-    'howar',
-    'howdy',
-    'hoxd-13',
-    'hpa',
-    'hsiang',
-    'huanghe',
     'huddlestons',
-    'hudevad',
-    'huerta',
-    'huet',
-    'hufbauer',
-    'hugger-mugger',
-    'huguette',
-    'huitzilopochtli',
-    'huldah',
-    'huma',
-    'humbugged',
-    'humby',
-    'hundred-dollar',
-    'hungarian-born',
-    'hungarian-speaking',
-    'hunmanby',
     'huntspill',
-    'hurdy',
-    'hurdy-gurdy',
-    'huskies',
-    'hussainara',
-    'hutchinsons',
-    'huttwil',
-    'huynh',
-    'hvo',
-    'hyaluronidase',
-    'hybridus',
-    'hydrate',
-    'hydrometer',
-    'hygienics',
-    'hymned',
-    'hyperodapedon',
     'hyperreal',
-    'hypomagnesaemia',
-    'hypostyle',
-    'hypothesis-testing',
-    'i-iii',
-    'ibase',
-    'ibercorp',
-    'ibmulator',
-    'icco',
-    'icd-8',
-    'ice-hockey',
-    'icpi',
-    'idealizing',
-    'ideogram',
-    'idle-up',
-    'idolises',
     'idos',
-    'igcc',
-    'iiasa',
-    'iiic',
-    'iip',
-    'ijaz',
-    'iliac',
-    'ill-clad',
-    'ill-made',
-    'illywhacker',
-    'ilog',
-    'imaginaire',
-    'imbricated',
-    'imm',
-    'imma',
-    'immobilises',
     'imodium',
-    'imola',
-    'importunity',
-    'imray',
-    'in-crowd',
-    'inamura',
-    'inc\'',
-    'inchnadamph',
-    'incipit',
-    'inclose',
-    'inculcates',
-    'inde',
-    'independiente',
-    'indi',
-    'indicting',
-    'indosuez',
     'industria',
-    'industrielle',
-    'inelegance',
-    'inferotemporal',
-    'infibulation',
-    'inflames',
-    'inflammed',
-    'inflation-proofing',
-    'influence-peddling',
-    'infosystems',
-    'ingenia',
-    'inghams',
-    'ingratiation',
-    'ingy',
-    'initec',
-    'initialise',
     'initialized',
-    'ink-blot',
-    'inkhorn',
-    'inking',
-    'inner-ring',
-    'innholders',
-    'innumerate',
-    'inserm',
-    'insitute',
-    'inskip',
-    'insomuch',
-    'inspecteur',
-    'intellifex',
-    'intellitic',
-    'intention-to-treat',
-    'inter-arab',
     'inter-league',
-    'inter-office',
-    'inter-rater',
-    'interbred',
-    'interconnects',
-    'intercurrent',
-    'interestin\'',
-    'interferons',
-    'interjecting',
-    'interline',
-    'intermarriages',
-    'intermediated',
-    'intermodulation',
-    'internalising',
-    'interpenetrated',
-    'interring',
     'intra-assay',
-    'intra-plate',
-    'intraobserver',
-    'intrusives',
-    'inula',
-    'inundate',
-    'inv',
-    'investment-grade',
-    'invigilate',
-    'invitrogen',
-    'inwood',
-    'ionithermie',
-    'ionophores',
-    'ipi',
-    'ipms',
-    'ipoh',
     'iprs',
-    'ir10&ndash;1',
-    'iremonger',
-    'irfel',
-    'irisa',
-    'irish-style',
-    'iron-free',
-    'iron-shod',
-    'ironman',
-    'ironweed',
-    'irradiate',
-    'isaf',
-    'isai',
-    'ischaemia-reperfusion',
-    'isco',
-    'iskander',
     'iskratel',
-    'islamique',
-    'island-based',
-    'ismailia',
-    'ismene',
-    'isn\'t',
-    'isoleucine',
-    'isomerase',
-    'isotherms',
-    'ispa',
-    'issaqs',
-    'issue-based',
-    'isug',
-    'isva',
-    'it&mdash',
-    'italdesign',
     'italian-born',
-    'itd',
-    'itemizing',
-    'ithaka',
-    'itineris',
-    'iulian',
-    'ivanovitch',
-    'iwa',
-    'ixbuild',
-    'ixyphal',
-    'j&oacute;n',
-    'j\'accuse',
-    'ja\'bari',
-    'jaccarino',
-    'jack-in-a-box',
-    'jack-knife',
     'jackanapes',
-    'jackart',
-    'jackpots',
-    'jaffer',
-    'jagan',
-    'jagdish',
-    'jaggar',
-    'jaggs',
-    'jahn-teller',
-    'jakali',
-    'jakobs',
-    'jalousie',
-    'jamiroquai',
-    'jammes',
-    'jandia',
-    'jannis',
     'janowski',
-    'japonisme',
-    'jarndyce',
-    'jarrah',
-    'jarrold',
-    'jaspers',
-    'jaume',
-    'jayaben',
-    'jayalalitha',
-    'jazzers',
-    'jazzmaster',
-    'jazzmen',
-    'jcm',
-    'jco',
-    'jeb',
-    'jefe',
     'jenners',
-    'jesper',
-    'jesselton',
-    'jet-setter',
-    'jetranger',
-    'jeunes',
-    'jhelum',
-    'jhs',
-    'jian',
-    'jic',
-    'jilinski',
-    'jinotega',
-    'jmt',
-    'joannides',
-    'job-share',
-    'jobsworth',
     'jocko',
-    'jogjakarta',
-    'johannitsa',
-    'johore',
-    'jomtien',
-    'jonnie',
-    'jorden',
-    'jorg',
-    'jorginho',
-    'josu',
-    'jotters',
-    'joule',
-    'journey-to-work',
-    'jouy',
-    'joy-ride',
-    'judg',
     'juge',
-    'jugged',
-    'juiced',
-    'juilliard',
-    'juliaca',
-    'jun.',
-    'junctures',
-    'juney',
-    'junid',
-    'junio',
-    'jupe',
-    'justice-general',
-    'justinette',
-    'k-tel',
-    'k.c.',
-    'k5',
     'ka-shing',
-    'kabaka',
-    'kabore',
-    'kach',
-    'kadir',
-    'kahanamoku',
-    'kaisha',
-    'kajiyama',
-    'kakap',
-    'kallen',
-    'kamasan',
-    'kami',
-    'kamlang-ek',
-    'kanak',
-    'kandersteg',
-    'kandyans',
     'kanisius',
-    'kantaris',
-    'karadjic',
-    'kardus',
-    'karpaty',
-    'kasha',
-    'kashi',
-    'kashmiris',
-    'kaszubia',
-    'katsaris',
-    'katunarich',
-    'katushki',
-    'katze',
-    'kaul',
-    'kayan',
-    'kc-400',
     'keat',
-    'kececiler',
-    'kedie',
-    'keek',
-    'keepin',
-    'keer',
-    'kehoe',
-    'kellie',
-    'kelsale',
-    'kelvinside',
-    'kemmendine',
-    'kemps',
-    'kennel-maid',
-    'keohane',
-    'keppoch',
-    'keres',
     'kerfing',
-    'kernigan',
-    'kerrs',
-    'kersley',
-    'kestenbaum',
-    'ketches',
-    'ketones',
-    'keuper',
-    'kewensis',
-    'keyboarded',
-    'keynas',
-    'keyserling',
-    'keyte',
-    'khaing',
-    'khas',
-    'khelil',
     'khizha',
-    'khorne',
-    'khudayyir',
-    'kian',
-    'kibun',
-    'kick-boxing',
-    'kickboxing',
-    'kiddin\'',
-    'kiddiswap',
-    'kievan',
-    'kil',
-    'kildimo',
-    'killary',
-    'killicomaine',
-    'kilocreds',
-    'kilohertz',
     'kimo',
-    'kineth',
-    'king-emperor',
-    'kingsdown',
-    'kingstonians',
-    'kinley',
-    'kintanar',
-    'kircher',
-    'kirgizia',
-    'kirkburton',
-    'kirkeby',
-    'kirkhope',
-    'kirtland',
-    'kissin',
-    'kiswahili',
-    'kit-bag',
     'kitcher',
-    'kite-maker',
-    'kithairon',
-    'kittay',
-    'kitzsteinhorn',
-    'kizzy',
-    'kjetil',
-    'klausen',
-    'kleibers',
-    'kleiner',
-    'kleitman',
-    'klement',
-    'klemkosky',
-    'klensch',
-    'klestil',
-    'klondykers',
     'klopstock',
-    'klub',
-    'knapsacks',
-    'knazko',
-    'kne',
-    'knee-capping',
-    'knitleader',
-    'knobbed',
-    'knobbled',
-    'knockhill',
-    'knockin\'',
-    'knot-count',
-    'knutson',
-    'kobus',
-    'koda',
-    'koerner',
     'koftas',
-    'koizumi',
-    'kokataylo',
-    'kol',
-    'kolkhoz',
-    'kominto',
-    'kon-tiki',
-    'kona',
-    'kondrashin',
-    'konr',
-    'konzertmeister',
-    'koon',
-    'kora',
-    'korifi',
-    'korovin',
-    'korthaus',
     'kossen',
-    'kotoko',
-    'koty',
-    'koulash',
-    'kovno',
-    'kow-tow',
-    'kpodzro',
-    'kpr',
-    'kraag',
-    'krader',
-    'krebber',
-    'kren',
-    'kronos',
-    'krystom',
-    'ksc',
-    'kuangchi',
     'kubelwagen',
-    'kudielka',
-    'kuffs',
-    'kufstein',
-    'kuhnau',
-    'kuiti',
-    'kulin',
-    'kulon',
-    'kulyab',
-    'kumi',
-    'kummel',
-    'kunming',
-    'kuzmitch',
-    'kwa',
-    'kynge',
-    'kyongsang',
     'kyprianou',
-    'l\'affaire',
-    'l\'afrique',
-    'l\'union',
-    'l-rhamnose',
-    'l.r.t.',
-    'laar',
-    'labeling',
-    'labour-held',
-    'labourist',
-    'labtech',
-    'lacandona',
-    'lacanianism',
-    'lacerate',
-    'lackland',
-    'lady-friend',
     'lady-love',
-    'lafford',
-    'laigueglia',
-    'lairig',
-    'laisser-faire',
-    'lakas-nucd',
-    'lakota',
-    'laleham',
-    'lalumi&egrave;re',
-    'lamba',
-    'lambent',
-    'lamerton',
-    'lammiman',
-    'lanacane',
-    'land-bridge',
-    'landa',
     'landaus',
-    'lande',
-    'landfarming',
-    'landing-place',
-    'landlubber',
-    'landsurfaces',
-    'lanesborough',
-    'langholme',
-    'langnau',
-    'language-teaching',
-    'language-use',
-    'language-user',
-    'langurs',
-    'lansberry',
-    'lanzone',
-    'laois',
     'lap-dog',
-    'lap-steel',
-    'lapp&eacute',
-    'lappet-faced',
-    'lappin',
-    'laqueur',
-    'lasalle',
-    'laser-printer',
-    'lasker',
-    'lasse',
-    'lasser',
-    'lassiere',
-    'lassoing',
-    'lat.',
-    'late-1980s',
-    'late-afternoon',
     'late-comer',
-    'late-eighteenth',
-    'late-seventies',
-    'lath-and-plaster',
-    'lathyrus',
-    'latifolia',
-    'latish',
-    'latters',
-    'latto',
-    'launders',
-    'laurasia',
-    'laureen',
-    'laurentide',
-    'laurenzana',
-    'lautner',
-    'lavenders',
     'law-keeping',
-    'lawnswood',
-    'laybacking',
-    'lbj',
-    'lcac',
-    'lcas',
-    'lcp',
-    'ldds',
-    'lead-lag',
-    'leadeth',
-    'leaf-eating',
-    'leaf-stalk',
-    'leatgs',
-    'leatherjackets',
-    'leathersellers',
-    'leavetaking',
     'lebanese-born',
-    'lebas',
-    'left-angled',
-    'lefthander',
-    'leg-side',
-    'leguizamo',
-    'lehto',
-    'leipziger',
-    'leleu',
-    'lempira',
-    'lenno',
-    'lentement',
-    'leodwald',
-    'leonce',
-    'leontes',
-    'lepanto',
     'lepidopteran',
-    'lepper',
-    'lepra',
-    'lermoos',
-    'lernoux',
-    'leroux',
-    'letter-book',
-    'levey',
-    'levite',
-    'levshin',
-    'lewesdon',
-    'lewis-smith',
-    'leybourne',
-    'leysin',
-    'lfm',
-    'lia',
     'liamuiga',
-    'liberon',
-    'libertys',
-    'library-based',
-    'libyan-backed',
-    'licht',
-    'licorice',
-    'lie-detector',
-    'liesl',
-    'lif',
-    'life-energy',
-    'life-experience',
-    'life-expired',
-    'life-insurance',
-    'lift-up',
-    'lightning-conductor',
     'lightplane',
-    'lika',
-    'lilium',
-    'liminoid',
-    'limitada',
-    'limnophila',
-    'limy',
-    'lindenhof',
-    'lindwall',
-    'lindzen',
-    'lingotto',
-    'linkbuilder',
-    'linke',
-    'linus',
-    'lionised',
-    'lipp',
     'lippi',
-    'liquidity-preference',
-    'liquin',
-    'liselotte',
-    'liste',
-    'lithosols',
-    'litter-bin',
-    'litter-strewn',
-    'little-boy',
-    'liturgique',
-    'live-born',
-    'liver-bowel',
-    'lizaveta',
-    'llay',
-    'llechwedd',
-    'lliure',
     'llugwy',
-    'lmp',
-    'loanhead',
-    'lobon',
-    'lobotomised',
-    'lock-in',
-    'lockouts',
-    'lodore',
-    'log2',
-    'logic-chopping',
-    'logoff',
-    'lollardy',
-    'long-continued',
-    'long-day',
-    'long-grain',
-    'longer-range',
     'longmont',
-    'longney',
-    'longship',
-    'loppy',
-    'lorass',
-    'loreley',
-    'loring',
-    'lorryloads',
-    'losanna',
-    'loseley',
-    'losin\'',
-    'loud-speaker',
-    'lougher',
-    'loused',
-    'loutrouvia',
-    'lovatts',
     'love-sick',
-    'low-born',
-    'low-carbohydrate',
-    'low-coupon',
-    'low-floor',
-    'low-hanging',
-    'low-light',
-    'low-loader',
-    'low-odour',
-    'low-paying',
-    'low-tar',
-    'low-value',
-    'low-wing',
-    'low-yielding',
-    'lower-',
-    'lower-end',
     'lowercase',
-    'lpdl',
-    'ls-pcr',
-    'lsg',
-    'lsstop',
-    'lubys',
-    'lucida',
-    'lucignano',
-    'ludington',
-    'ludlum',
-    'ludovisi',
-    'luffing',
-    'lugiato',
-    'luise',
-    'lukey',
-    'lumpfish',
     'lumsdon',
-    'lunch-times',
-    'lurie',
-    'lutchmeenaraidoo',
-    'luteinising',
-    'luxembourg-based',
-    'luxulyan',
-    'luxuriated',
-    'lybke',
-    'lychee',
-    'lychnis',
-    'lycidas',
-    'lyd',
-    'lymphadenitis',
-    'lymphoblastoid',
-    'lymphogranuloma',
     'lysimachus',
-    'lysines',
-    'lysolecithin',
-    'm&ouml;ller',
-    'm&uuml;nch',
-    'm.b.e',
-    'm60',
-    'm82',
-    'ma\'badong',
-    'macassar',
-    'maceral',
-    'machine-',
-    'macrotrichia',
-    'maculatum',
-    'maddie',
-    'madurodam',
     'maggert',
-    'maggon',
-    'magherally',
-    'magrit',
-    'magua',
-    'mah-jongg',
-    'mahu',
-    'maine-anjou',
-    'mairie',
-    'maj.-',
-    'majnun',
-    'majority-owned',
-    'malis',
-    'mallorys',
-    'malpedar',
-    'maltz',
     'malus',
-    'man-environment',
-    'managuense',
-    'manasseh',
-    'manatee',
-    'mancham',
-    'mancroft',
-    'mancuso',
-    'mand',
-    'mandarinate',
-    'manetho',
-    'mange-tout',
-    'manicuring',
-    'manifeste',
-    'manisha',
-    'manlove',
     'manport',
-    'mansells',
-    'manumit',
-    'manze',
-    'manzi',
-    'mapam',
-    'mapletoft',
-    'marabou',
-    'maratea',
-    'marazzoli',
-    'marcham',
-    'marchantia',
-    'marchese',
-    'marchetto',
-    'marcie',
-    'marcuson',
     'margarit',
-    'margit',
-    'margrove',
-    'margy',
-    'marias',
-    'marjolaine',
-    'market-type',
-    'marketeering',
-    'markie',
-    'marmalades',
-    'marner',
-    'marquesa',
-    'marschallin',
-    'marthus',
-    'marv',
-    'maryland-based',
     'masao',
-    'maseratis',
-    'masheder',
-    'mashers',
-    'maslins',
-    'masood',
-    'masqueraded',
-    'mass-produce',
-    'masse',
-    'masseuses',
-    'massis',
-    'massud',
-    'masterminds',
-    'matan',
-    'matchday',
-    'matchmen',
     'matelot',
-    'materializing',
-    'mathematic',
-    'matiukhin',
-    'matra-hachette',
-    'matruh',
-    'mattia',
-    'mattioli',
-    'mattox',
-    'mauduit',
-    'maun',
-    'maunders',
-    'maven',
-    'mavic',
-    'max103-vp16',
-    'maximian',
     'maxwell-boltzmann',
-    'maydown',
-    'mayon',
-    'maytime',
-    'maza',
-    'mazz',
-    'mazzocchi',
-    'mbabane',
-    'mbasogo',
-    'mbatian',
-    'mct',
-    'mct-adr',
-    'mct-dp',
-    'meanin\'',
-    'meathead',
-    'mechanize',
     'medallion-and-corner',
-    'meddler',
-    'medi',
-    'medick',
-    'medievalism',
-    'mediterranean-style',
-    'medlam',
-    'megalopolis',
-    'mehew',
-    'mehr',
-    'mehrabad',
-    'meikles',
-    'melazzano',
-    'mellencamp',
-    'melloul',
-    'melstead',
     'meltem',
-    'melzi',
-    'membrane-spanning',
-    'memorialised',
-    'menders',
-    'mendozas',
-    'menge',
-    'menhirs',
-    'menteith',
-    'mentone',
-    'mercad',
-    'mercado',
-    'mercat',
-    'mercato',
-    'mercerised',
-    'merchant-banking',
     'merrison',
-    'merse',
-    'merstam',
-    'mertseger',
-    'meru',
-    'mesophyll',
-    'message-based',
-    'messam',
-    'mesur&eacute;e',
-    'metabolize',
-    'metadata',
-    'metalpoint',
-    'metcalfes',
-    'metellus',
-    'methaemoglobinaemia',
-    'metheny',
     'methodius',
-    'metoprolol',
-    'metra',
-    'mettingham',
-    'metty',
-    'metzger',
-    'meum',
-    'mglur',
-    'mhr',
-    'miaco',
-    'miami-based',
-    'michalis',
-    'michelins',
-    'michelozzo',
-    'mickley',
-    'micro-sized',
     'microage',
-    'microcom',
-    'microconcord',
-    'microforge',
-    'microsparc-based',
-    'microsparc-ii',
-    'microteaching',
-    'microware',
-    'mid-1980',
-    'mid-east',
-    'mid-pay',
-    'mid-square',
-    'middle-ear',
-    'middle-ground',
-    'middlemiss',
-    'middlesborugh',
     'middletown',
-    'midianite',
-    'mignet',
-    'mih',
-    'milankovitch',
-    'milcombe',
-    'militari',
-    'milius',
-    'milk-bottle',
-    'milkovici',
-    'millefiori',
-    'millen',
-    'milli',
-    'millicom',
-    'millisieverts',
-    'millmead',
     'millstream',
-    'mims',
-    'mind-reading',
-    'mindham',
-    'mini-market',
-    'minicells',
-    'miniclinic',
-    'minitower',
-    'mintec',
-    'minteg',
-    'miracle-working',
-    'miron',
-    'mis-spelt',
-    'mis-spent',
-    'misbehaves',
-    'miscalled',
     'mischo',
-    'misdeed',
-    'misdirecting',
-    'misericord',
-    'miseroni',
-    'miservers',
-    'misg',
-    'misinterprets',
-    'miskito',
-    'miskitu',
-    'missel',
-    'missense',
-    'mississipian',
-    'mistle',
-    'mitchinson',
-    'mitroff',
     'miura',
-    'mk.',
-    'mmmn',
-    'mnuchin',
-    'mock-heroic',
-    'moderati',
-    'moderato',
-    'moderna',
-    'modula',
-    'moed',
-    'mogollon',
-    'mohammedans',
-    'mohaved',
-    'mohs',
-    'moid',
-    'moisturizing',
     'molay',
-    'molise',
-    'molitor',
-    'mollands',
-    'mommsen',
-    'money-grubbing',
-    'moneychangers',
-    'mongoloid',
-    'moni',
-    'monit',
-    'monoceros',
-    'monoclinic',
-    'montagnier',
-    'montoneros',
-    'montree',
-    'mooed',
     'mooned',
-    'moorehead',
-    'moorfield',
-    'moorsbus',
-    'mop-up',
-    'moralee',
-    'morathi',
-    'morazan',
-    'moredon',
-    'morgul',
-    'morgund',
-    'morning-after',
-    'morpho',
-    'morrey',
-    'mortem',
-    'morts',
     'moruroa',
-    'morwellham',
-    'mossend',
-    'most-favoured',
-    'moszkowicz',
-    'mothballing',
-    'motion-perception',
-    'motorail',
-    'motspur',
-    'moulay',
-    'mountebank',
-    'mountleigh',
-    'mouse-driven',
-    'mousetraps',
-    'moustapha',
-    'movie-star',
     'movietone',
-    'mowbrays',
-    'mpt',
-    'mro',
-    'mrt',
-    'mse',
-    'mtns',
-    'mto',
-    'much-modified',
-    'much-touted',
-    'mucilage',
-    'muckrakers',
-    'muckross',
-    'mucopolysaccharides',
-    'mud-caked',
-    'mudlark',
     'mukula',
-    'mulgrew',
-    'mullery',
-    'multi-culturalism',
-    'multi-megabit',
-    'multi-occupation',
-    'multi-occupied',
-    'multi-port',
-    'multi-subject',
-    'multi-warhead',
-    'multilayered',
-    'multiphase',
-    'multiplexer',
-    'mulverin',
-    'mundell',
-    'mura',
     'murnin',
-    'murrey',
-    'musem',
-    'music-drama',
-    'music-loving',
-    'musikhochschule',
-    'muslimeen',
-    'mustelid',
-    'mutang\'ang\'i',
-    'mvp',
-    'mycoplasmas',
-    'myn',
-    'myr',
-    'myskow',
-    'mythologising',
-    'n&eacute;ouvielle',
     'n.a.s.a.',
-    'nacne',
-    'naias',
-    'naidoo',
-    'naihe',
-    'nailfile',
-    'naima',
-    'najma',
-    'nakhodka',
-    'nall',
-    'namawar',
-    'nand',
-    'nanda',
-    'nanga',
-    'nanno',
-    'naos',
     'narco',
-    'narco-terrorism',
-    'narita',
-    'nasonia',
-    'nasrallah',
-    'nastassia',
-    'natick',
-    'nau',
-    'naur',
-    'nautch',
-    'navarone',
-    'navel-gazing',
-    'navigacion',
-    'navis',
-    'nazarene',
-    'nccalman',
     'nccsl',
-    'ncis',
-    'ncoi',
-    'near-bankrupt',
-    'near-certainty',
-    'near-death',
-    'near-ideal',
-    'near-record',
-    'neckar',
-    'necromundan',
-    'needle-exchange',
-    'neela',
-    'neem',
-    'neethling',
-    'neha',
-    'nej',
     'neo-communist',
-    'neo-dada',
-    'neo-liberalism',
-    'neo-stalinist',
-    'neopolitan',
-    'nephilim',
-    'neri',
-    'nerve-centre',
-    'nerve-cord',
-    'nerve-shattering',
-    'nesad',
-    'netanyahu',
-    'netherby',
-    'netherwood',
-    'netline',
-    'netlines',
     'neverthless',
-    'newburn',
-    'newcome',
-    'newgrange',
-    'newly-found',
-    'newpassword',
-    'news-letter',
-    'newscast',
-    'newscasts',
-    'nextworld',
-    'nf-m',
-    'nfes',
-    'nfha',
-    'nft',
-    'niblit',
-    'nicaraguense',
     'nicene',
-    'nicetius',
-    'nicker',
-    'nicma',
-    'nidden',
-    'niehaus',
-    'nien',
-    'niente',
-    'niewiarowski',
-    'nightlights',
-    'nijinska',
-    'nikel',
-    'nikisch',
-    'nikitenko',
-    'nikram',
-    'nimbler',
     'nimoy',
-    'nine-',
-    'nine-match',
-    'nine-page',
-    'nine-storey',
-    'nineteen-year',
-    'ninewells',
-    'ning',
-    'nioc',
-    'nitrifying',
-    'nitwit',
-    'nitzer',
-    'niv',
-    'nneb',
-    'no-decompression',
-    'no-fee',
     'no-fuss',
-    'no-hope',
-    'no-name',
-    'no-tax',
-    'nobbling',
-    'noctuid',
-    'nogin',
-    'non-absorbent',
-    'non-client',
-    'non-cognate',
-    'non-commodity',
-    'non-curative',
-    'non-decision',
-    'non-degenerate',
-    'non-denaturing',
-    'non-drinking',
     'non-fulfilment',
-    'non-fusion',
-    'non-greek',
-    'non-integer',
-    'non-integrin',
-    'non-leeds',
-    'non-locality',
-    'non-meaning',
-    'non-occurring',
-    'non-original',
-    'non-policy',
-    'non-priority',
-    'non-procedural',
-    'non-scheme',
-    'non-scientist',
-    'non-seriousness',
     'non-shareholder',
-    'non-solicitation',
-    'non-therapeutic',
-    'non-time-related',
-    'non-treaty',
-    'non-turbocharged',
-    'non-vocal',
-    'nonwoven',
-    'noraid',
-    'norbank',
-    'nordin',
-    'nortel',
-    'northedge',
-    'northleigh',
-    'norths',
-    'norwalk',
     'nosce',
-    'noseir',
-    'nostalgie',
-    'nottage',
-    'nouadhibou',
-    'novacek',
-    'now-closed',
-    'noxid',
-    'noye',
-    'npap',
-    'npo',
-    'nrf',
-    'nuffin\'',
-    'numero',
-    'nursie',
-    'nutbeam',
     'nuthatches',
-    'nuwss',
-    'nwrrl',
-    'nyali',
-    'nymans',
-    'nymphet',
-    'nymphoides',
-    'o&ugrave',
-    'o\'the',
-    'o(n)',
-    'o-',
-    'oakgrove',
-    'oberoi',
-    'object-orientation',
-    'objet',
-    'occlude',
     'occupationalist',
-    'oceanarium',
-    'oddsson',
-    'odeons',
-    'odjob',
-    'odorata',
-    'odtaa',
-    'off-beam',
-    'off-camera',
-    'off-fore',
-    'off-target',
-    'off-world',
-    'off-worlder',
-    'officals',
-    'office-based',
-    'officer-councillor',
     'offler',
-    'offtake',
-    'ofis',
-    'often-quoted',
-    'ogis',
-    'ogni',
-    'ogwo',
-    'oich',
-    'oidium',
-    'oil-export',
-    'okar',
-    'okhrana',
-    'okondo',
-    'okuda',
-    'olajade',
-    'old\'uns',
     'old-hat',
-    'oldsmobile',
-    'olmert',
-    'olongapo',
-    'om-45',
-    'omari',
-    'omonia',
-    'omr',
-    'omri',
-    'on\'',
-    'on-cost',
-    'on-licence',
-    'on-licensed',
-    'on-type',
-    'ona',
-    'once-a-week',
     'onchocerciasis',
-    'ondo',
-    'one-metre',
-    'one-paced',
-    'one-pound',
-    'one-tier',
-    'one-trial',
-    'one-up',
-    'one-volume',
-    'one-vote',
-    'onopko',
-    'ontong',
-    'oof',
-    'opacs',
-    'opaline',
-    'open-palm',
     'ophioscolex',
-    'opinion-poll',
-    'opti',
-    'orangutang',
-    'orchin',
-    'ordains',
-    'ordonez',
-    'ordre',
-    'orellana',
-    'organophosphate',
-    'orientale',
-    'origines',
-    'orionis',
-    'orly',
-    'orlygsson',
-    'orphist',
     'orry',
-    'orsino',
-    'osc',
-    'oscano',
-    'osier',
-    'osso',
-    'ostermilk',
-    'ostmarks',
-    'ostp',
-    'ostrog',
-    'otakar',
-    'otanes',
-    'otif',
-    'otopeni',
-    'ottakars',
-    'ottley',
     'ottringham',
-    'ouguiya',
-    'out-numbered',
-    'out-of-the',
-    'out-take',
-    'outcompete',
-    'outerwear',
-    'outfaced',
-    'outfought',
-    'outhoused',
-    'outplay',
-    'outranked',
-    'outro',
-    'outshot',
-    'outside-the-scope',
-    'ovamboland',
     'oven-to-tableware',
-    'over-35s',
-    'over-decorated',
-    'over-dependent',
-    'over-extend',
-    'over-flowing',
-    'over-high',
-    'over-hyped',
-    'over-rate',
-    'over-reading',
-    'over-recording',
-    'over-regulated',
-    'over-sexed',
-    'over-simplify',
-    'over-simplifying',
-    'overbear',
     'overbye',
-    'overcompensate',
-    'overdubbed',
-    'overladen',
-    'overpaint',
-    'overqualified',
-    'overreacted',
-    'overset',
-    'overtrading',
-    'overvalue',
-    'overwrap',
-    'owner-trainer',
-    'oxnard',
-    'oxos',
-    'oxygen-carrying',
-    'oxygenate',
     'p&icirc;tres',
-    'p\'daytabird',
-    'p\'ien',
-    'p(x)',
-    'p-atp',
-    'p.k.',
-    'p102',
-    'p103',
-    'p111',
-    'p27',
-    'p28',
-    'pa-o',
-    'pa.',
-    'paasio',
-    'pabst',
-    'pabxes',
     'paca',
-    'pacbase',
-    'pace-setting',
-    'pacemaking',
-    'pacifique',
-    'packhorses',
-    'paddocked',
-    'paets',
-    'paginated',
-    'pahaska',
-    'paideuma',
-    'pairwork',
-    'pakamac',
-    'palach',
-    'palaeoclimate',
-    'palaeoecology',
     'palafox',
-    'palairet',
-    'palandri',
-    'palimony',
-    'pall-bearer',
-    'palm-frond',
-    'palmeri',
-    'palmette',
-    'palmolive',
-    'pancks',
-    'panettone',
-    'panhard',
-    'pantyhose',
-    'panzers',
-    'paper-bag',
-    'paper-round',
     'paper-work',
-    'par-3',
-    'par-3s',
-    'para-medic',
-    'parabasis',
-    'paraboloid',
-    'paracrine',
-    'parallelograms',
-    'parch',
-    'parching',
-    'parcours',
-    'paree',
-    'parerga',
-    'paretian',
-    'parfit',
-    'parisien',
     'park-keeper',
-    'parkhill',
-    'parlez',
-    'parmigiani',
-    'parmigiano',
-    'parot',
-    'parotid',
-    'parred',
-    'part-of-speech',
-    'part-writing',
-    'parthenos',
-    'participant-observation',
-    'particularized',
-    'partly-paid',
-    'passau',
-    'passione',
     'passos',
-    'pasture-land',
-    'patch-based',
-    'patino',
-    'patnaik',
-    'patrouille',
-    'pattern-making',
-    'patwa',
-    'pavane',
-    'pay-as-you-drive',
-    'pay-as-you-earn',
-    'payables',
-    'paycheck',
-    'payola',
-    'paysanne',
-    'pazzi',
     'pby',
-    'pc-interface',
-    'pc-ometer',
-    'pdge',
-    'peace-maker',
-    'peachtree',
-    'peachum',
-    'peafowl',
-    'peale',
-    'peall',
-    'peaseblossom',
-    'peat-based',
-    'pecking-order',
-    'pederasts',
-    'pedunculate',
-    'peekaboo',
     'peeow',
-    'peep-show',
-    'peeresses',
-    'peerie',
-    'peintres',
-    'pel&eacute',
-    'pelje&scaron;ac',
-    'pell&eacute;as',
-    'pelle',
-    'pells',
-    'pels-leusden',
-    'pemberton-billing',
-    'penalosa',
-    'pendrich',
-    'penfriends',
-    'penini',
     'penknives',
-    'pennel',
-    'pennyland',
-    'penpal',
-    'penrod',
-    'penseroso',
-    'penstemon',
-    'pentaline',
-    'pentiford',
-    'peopling',
-    'pepler',
-    'per-second',
-    'peradventure',
-    'perborate',
-    'perceptual-motor',
-    'perdix',
     'peregrina',
-    'perelandra',
-    'peripatetics',
-    'permutit',
-    'perots',
-    'perpetua',
-    'perri',
-    'persei',
-    'persistance',
-    'personalising',
-    'perugino',
-    'perutz',
-    'peskin',
-    'petanque',
-    'peterkin',
-    'pethick',
     'petroff',
-    'petrographer',
-    'petrossian',
-    'petter',
-    'petty-minded',
-    'peut-&ecirc;tre',
-    'pforta',
-    'pgces',
-    'pgs',
-    'ph-changing',
-    'phagemid',
-    'phantasmagoric',
-    'pharay',
-    'phasing-in',
-    'phenix',
-    'phenomenalist',
     'phibbs',
-    'philhellene',
-    'philippino',
-    'phineas',
-    'phiz',
-    'phol',
-    'pholy',
-    'phonecalls',
-    'phosphatidyl',
-    'phosphotransferase',
-    'phosphotyrosine',
-    'photo-cd',
-    'photo-copier',
-    'photo-copy',
-    'photo-copying',
-    'photo-me',
     'photolithography',
-    'photometer',
-    'photosynthesising',
-    'photosynthesize',
-    'phototypesetter',
-    'phragmata',
-    'phrynichos',
-    'phut-phut',
-    'phylakopi',
-    'phylloxera-free',
-    'picadilly',
-    'piccinni',
-    'picciotto',
-    'picture-framing',
-    'piemonte',
-    'pierrette',
     'pig-headedness',
-    'pig-sticking',
-    'pigg',
-    'pigged',
-    'piggotts',
-    'pigmentosa',
-    'pigmy',
-    'pii',
-    'pima',
-    'pinafores',
-    'pinard',
-    'pineda',
-    'pinioning',
-    'pink-tipped',
-    'pioline',
-    'pipchin',
     'pirenne',
-    'pit-lane',
-    'pitkeathley',
-    'pitton',
-    'pkf',
-    'pklite',
-    'plagiarize',
-    'plain-looking',
-    'plaister',
-    'planit',
-    'plant-eating',
-    'plantastics',
-    'plantes',
-    'plasticised',
-    'platen',
-    'platon',
     'platonism',
-    'play-group',
-    'playacting',
-    'playday',
-    'playdoh',
-    'playgoers',
-    'playing-time',
-    'playpower',
-    'plecostomus',
-    'plena',
-    'pluming',
-    'plummers',
-    'pluton',
-    'pluvinel',
-    'plynus',
-    'pmg',
     'pnas',
-    'pneuma',
-    'pocket-watch',
-    'pocus',
-    'podger',
-    'podospora',
-    'podzol',
-    'pogorelich',
-    'poin',
-    'poinding',
-    'pok',
-    'pokhara',
-    'pole-lathe',
-    'polhill',
-    'politbureau',
-    'politicize',
     'politiques',
-    'pollards',
-    'polovtsian',
-    'poly-l-lysine',
-    'polybutylene',
-    'polyeuktos',
-    'polyfilter',
-    'polymerase-promoter',
-    'polyphemus',
-    'polyripple',
-    'polysar',
-    'polysorbate',
-    'polytonality',
-    'pombal',
-    'ponc',
-    'pondweed',
     'pontificated',
-    'pontificates',
-    'pontine',
-    'poofy',
-    'poor-relief',
-    'poor-world',
-    'poovey',
-    'pop-eye',
-    'popieluszko',
-    'popolo',
-    'pora',
-    'porot',
-    'porphyry-style',
-    'porshe',
-    'portakabins',
-    'porterhouse',
     'portioned',
-    'portlington',
-    'posada',
-    'positive-sum',
-    'posolskii',
-    'post-1976',
-    'post-coup',
-    'post-crash',
-    'post-haste',
-    'post-hcg',
-    'post-interview',
-    'post-privatisation',
-    'post-processing',
-    'post-reform',
-    'post-revolution',
-    'post-termination',
     'post-treatment',
-    'postclassic',
-    'postcoded',
-    'postscript-based',
-    'postulant',
-    'pot-hole',
-    'poteen',
-    'poun',
-    'poundages',
-    'pourer',
-    'povoas',
-    'powder-blue',
-    'powder-puff',
-    'powderhall',
-    'power-on',
-    'power-struggle',
     'power-tool',
-    'powerpack',
-    'powershift',
-    'powney',
-    'poxviruses',
-    'ppf',
-    'ppk',
-    'pr&auml;sidium',
-    'praemunire',
-    'prances',
-    'pranged',
-    'praps',
-    'prating',
-    'pratzen',
-    'prayer-rug',
-    'pre-adult',
     'pre-application',
-    'pre-commitment',
-    'pre-communist',
-    'pre-configured',
-    'pre-copernican',
-    'pre-cum',
-    'pre-existed',
-    'pre-med',
-    'pre-pack',
-    'pre-show',
-    'pre-theatre',
-    'preceeding',
-    'precepting',
-    'preciosa',
-    'precontracted',
-    'prefectures',
     'pregnancy-related',
-    'preloaded',
-    'premaxillary',
-    'preplanned',
-    'preprinted',
-    'prerecording',
-    'presidente',
-    'pretale',
-    'prevaricates',
-    'preverbal',
-    'previsla',
-    'price-list',
-    'primero',
-    'primmer',
-    'prin',
-    'princeling',
     'prinsep',
-    'print-making',
-    'print-run',
-    'pripyat',
-    'prisoned',
-    'pritzker',
-    'private-',
-    'private-placement',
-    'prizefighting',
-    'pro-capitalist',
-    'pro-republican',
-    'problematize',
-    'procaccini',
-    'procase',
-    'proce',
-    'proconsuls',
     'procrastinator',
-    'prodder-armed',
-    'prodders',
-    'profaned',
-    'proferred',
-    'profession-centred',
-    'professionally-trained',
-    'profit-seeking',
-    'proform',
-    'prograded',
-    'program-to-program',
-    'projectionists',
-    'proman',
-    'promenaded',
-    'promethean',
-    'promix',
     'promotion-chasing',
-    'prontosil',
-    'proof-reader',
-    'proopsie',
-    'propitiated',
-    'propitiating',
-    'proscribing',
-    'proselytize',
-    'proslogion',
-    'prosy',
-    'protamine',
-    'protectress',
-    'proteinoid',
-    'protocerebral',
-    'protogeometric',
-    'protura',
     'provi',
-    'prutec',
-    'pruth',
-    'pryse-jones',
-    'przeworski',
-    'ps\'soft',
-    'pssst',
-    'psychoanalyse',
-    'psychologie',
-    'psychophysiology',
-    'psychos',
-    'pterygotes',
-    'ptl',
-    'ptsob',
-    'ptyr',
-    'public-order',
     'puebla',
-    'puffa',
-    'pugliese',
-    'puhlhofer',
-    'pulcinella',
-    'pulgrum',
-    'punchard',
-    'purgatorio',
-    'purnells',
-    'purple-blue',
-    'purple-brown',
-    'purpling',
-    'pusc',
-    'pushell',
-    'pushtuns',
-    'pustule',
     'put-put',
-    'putrefying',
-    'puttered',
-    'pvt',
-    'pwa',
-    'pyman',
-    'pyrrhus',
-    'pytle',
-    'pyxis',
-    'pz',
-    'q-beta',
-    'q10',
-    'q5',
-    'qassam',
-    'qattara',
-    'qeh',
     'qena',
-    'qis',
-    'qmh',
-    'qu\'il',
-    'qu\'on',
-    'quadrangles',
-    'quadrilles',
-    'quadruplicate',
-    'quain',
-    'quali',
-    'quantel',
-    'quarter-wavelength',
-    'quartermaine',
-    'quasi-contract',
-    'quasimodo',
-    'queneau',
     'querelle',
-    'queripel',
-    'quesne',
-    'question-answer',
-    'quetzalcoatl',
-    'quilters',
-    'quint&iacute;n',
-    'quintilian',
-    'quinze',
-    'quistgaard',
-    'quiverful',
-    'quix',
-    'quoi',
-    'quorate',
-    'r4400-based',
-    'r74(1&ndash;435)',
     'r74(205&ndash;517)',
-    'ra&scaron;ka',
-    'rabar',
-    'rabkrin',
-    'rack-and-pinion',
-    'radio-tracking',
-    'radionics',
-    'radwaste',
-    'rafamacs',
-    'rafeedie',
-    'rafelski',
-    'raggers',
-    'ragnarok',
-    'rah',
-    'raichle',
-    'raidtec',
     'rail-based',
-    'railwayana',
-    'rain-hit',
-    'rainbowed',
-    'rajih',
-    'rakhmon',
-    'rame',
-    'ramify',
-    'randal',
-    'randles',
-    'range-topping',
-    'rans',
-    'rapin',
-    'rapporteurs',
-    'rarified',
-    'rase',
     'raspail',
-    'rastaman',
-    'rasul',
-    'rat-faced',
-    'ratcheted',
-    'rate-limiting',
-    'ratiu',
-    'ratt',
-    'ravana',
-    'ravey',
-    'rawlplug',
-    'ray-gun',
-    'raymonda',
-    'razor-wire',
-    'razorbill',
-    'rcl',
     'rco',
-    'rdf',
-    're-adjusted',
-    're-afforested',
-    're-assessing',
-    're-compile',
-    're-decorating',
-    're-direct',
-    're-distributed',
-    're-drafting',
-    're-edit',
-    're-focusing',
-    're-imported',
-    're-installed',
-    're-lay',
-    're-naming',
     're-positioning',
-    're-programme',
-    're-record',
-    're-seal',
-    're-setting',
-    're-shape',
-    're-site',
-    're-sited',
-    're-starting',
-    're-stock',
-    're-study',
-    're-surface',
-    're-test',
-    're-tested',
-    're-tiling',
-    're-visited',
     're-work',
-    'read-outs',
-    'readdressed',
-    'reading-room',
-    'readopted',
-    'readshaw',
-    'ready-cooked',
-    'ready-mades',
-    'ready-mix',
-    'reallocating',
-    'realos',
-    'realtime',
-    'reamhar',
-    'rear-drive',
-    'reb',
-    'recently-acquired',
     'recently-arrived',
-    'recommissioning',
-    'recomposed',
-    'reconfigure',
-    'reconfigured',
-    'recontacted',
-    'recyclables',
-    'red-tape',
-    'redcaps',
-    'reddings',
-    'redhanded',
-    'redisplayed',
-    'redistricting',
-    'redpoll',
-    'reduced-sugar',
-    'reeder',
     'reemerge',
-    'reeperbahn',
-    'reevaluate',
-    'refeeding',
-    'reflexed',
-    'reflow',
-    'reformatories',
-    'refrigerating',
-    'refulgent',
-    'refunding',
-    'rega',
-    'regini',
-    'regrowing',
-    'regula',
-    'reichsrundfunk',
-    'reimbursing',
     'reinstalled',
-    'reintegrating',
-    'reinterred',
-    'reinvigorating',
-    'reissland',
-    'relabelling',
-    'relcom',
-    'relf',
-    'religieuse',
-    'relined',
-    'relph',
-    'remanent',
-    'remarries',
-    'remixers',
-    'renaissance-style',
-    'renko',
     'renmin',
-    'rennies',
-    'renoirs',
-    'renoso',
-    'reorganises',
-    'repacking',
-    'repaved',
-    'repington',
-    'replicability',
-    'repopulated',
-    'repricing',
-    'republica',
-    'requester',
-    'requet&eacute',
-    'requiems',
-    'rer',
     'rescalc',
-    'resende',
-    'resistencia',
-    'resized',
-    'resizing',
-    'reso',
-    'rest-room',
-    'restano',
-    'restatements',
-    'restrop',
-    'resurfaces',
-    'retaliates',
-    'retardants',
-    'retesting',
-    'rethymnon',
-    'retir',
     'retorting',
-    'rettig',
-    'retyping',
-    'revans',
-    'revcounter',
-    'reve',
-    'reverdy',
-    'revolutionibus',
-    'revolutionizing',
-    'rewald',
-    'rewrapped',
-    'rexroth',
-    'rezia',
-    'reznichenko',
-    'rfp',
-    'rhapsodised',
     'rhaw',
-    'rheinschild',
-    'rheinzink',
-    'rheum',
-    'rhianon',
-    'rhinns',
-    'rhodamine',
-    'rhomboid',
-    'rhosili',
-    'rhotic',
-    'rhyd',
-    'rhymer',
-    'ricalde',
-    'richafort',
-    'ricin',
-    'rickaby',
     'ricki',
-    'ridgeback',
-    'riegl',
-    'riegle',
-    'riego',
-    'right\'',
-    'right-footed',
-    'rigunth',
-    'rii',
-    'rikoran',
-    'rinso',
-    'rios-based',
-    'rivacre',
-    'river-crossing',
-    'riverbus',
-    'rlpo',
     'rno',
-    'road-widening',
-    'road-works',
-    'robbia',
-    'rober',
-    'robertshaw',
-    'robleh',
-    'robusta',
-    'roce',
-    'rockhart',
-    'rockumentary',
-    'rodborough',
-    'roddymoor',
-    'rodolphe',
-    'roes',
-    'rogered',
     'rognvald',
-    'role-slot',
-    'rollered',
-    'romanesca',
-    'romanticise',
-    'romanus',
-    'roncraft',
-    'rondeau',
-    'roneo-ed',
-    'ronke',
-    'rons',
-    'roof-space',
-    'root-index',
-    'rootham',
-    'rorke',
-    'roscheck',
     'rose-grower',
-    'rose-growing',
-    'rossler',
-    'rotatory',
-    'rothamsted',
-    'rothorn',
-    'roubanova',
-    'roumelia',
-    'round-backed',
-    'roundtable',
-    'roundtree',
-    'rousse',
-    'roust',
-    'routefinding',
-    'routier',
-    'rowand',
     'rowes',
-    'rowing-boat',
-    'roxanna',
-    'royscot',
-    'roza',
-    'rozzer',
-    'rrl',
-    'rrs',
-    'rsdlp',
-    'rsso',
-    'rth',
-    'rubery',
-    'rubi',
-    'ruckelshaus',
-    'rucker',
-    'ruckers',
     'ruddle',
-    'ruffini',
-    'ruinart',
-    'ruing',
-    'rumbaugh',
-    'running-account',
-    'running-shed',
-    'runout',
-    'runyon',
-    'ruscote',
-    'rushbrooke',
-    'russian-style',
-    'russified',
-    'russolo',
-    'rusticana',
-    'ruta',
     'ruthenia',
-    'ryden',
-    'ryders',
-    'rystrom',
-    'ryvoan',
-    's&eacute;jour',
-    's&ouml;ll',
-    's\'amfora',
-    's\'xpress',
-    's-',
-    's-phase',
-    'sabally',
-    'sabre-rattling',
-    'sabre-tooth',
-    'saceur',
-    'saddle-bag',
     'saddle-cloth',
-    'saddleback',
-    'sadock',
-    'saebbi',
-    'saenredam',
-    'safeall',
-    'safety-chain',
-    'safina',
-    'sag-bag',
-    'sagarika',
-    'sagittal',
-    'sagittaria',
-    'saibol',
-    'saifur',
-    'saillard',
-    'saker',
     'sakkratian',
-    'salagamas',
-    'salalah',
-    'salang',
-    'salaud',
-    'salis',
-    'salo',
-    'salolainen',
-    'salt-marsh',
-    'saltcake',
-    'salton',
-    'salud',
-    'salvadores',
-    'salvian',
-    'samater',
-    'sambucus',
     'sammut',
-    'sanctions-busting',
-    'sand-dune',
-    'sandaway',
-    'sandell',
-    'sandplover',
-    'sandridge',
-    'sandyport',
-    'sangalla',
-    'sangr&iacute;a',
-    'sanguinetti',
-    'sanitisation',
-    'sanssouci',
-    'sapsan',
-    'sargood',
-    'sarl',
     'sary',
-    'sasse',
-    'satirised',
-    'sauber',
-    'saucissons',
-    'saunters',
-    'savall',
-    'savigny',
-    'savoldo',
-    'savonarola',
-    'sawston',
-    'saxena',
-    'sayd',
-    'sbd',
-    'scaa',
-    'scacchi',
     'scalene',
-    'scandal-hit',
-    'scarfs',
-    'sceptred',
-    'schatten',
-    'schecter',
-    'scheidegg',
-    'scheidt',
-    'schendel',
-    'scher',
-    'scherings',
-    'schine',
-    'schistocerca',
-    'schistosomes',
-    'schleswig',
-    'schliemann',
     'schlock',
-    'schluter',
-    'schmeisser',
-    'schminke',
-    'schneerson',
-    'schneid',
-    'scholtz',
-    'schreber',
-    'schreiner',
-    'schrempp',
-    'schwarzhelm',
-    'science-related',
-    'scindia',
-    'scintillate',
-    'scissorhands',
-    'scla',
     'sclerotized',
-    'scoble',
-    'scoda',
-    'scole',
-    'scorched-earth',
-    'scotbis',
-    'scottish-born',
-    'scottishness',
-    'scoutmaster',
-    'scpr',
-    'scratchley',
-    'scrawly',
-    'screamadelica',
-    'screenshow',
-    'screwtop',
-    'scribner',
     'scrimp',
-    'script-writing',
-    'scrivening',
-    'scrummy',
-    'scrying',
-    'scumbled',
-    'scweams',
-    'scyld',
-    'sea-bathing',
-    'sea-god',
-    'seafloor',
-    'seagrove',
-    'seahorses',
-    'sealdah',
-    'searchtools',
-    'sebastiane',
     'sebastiao',
-    'seck',
-    'second-choice',
-    'second-guessing',
-    'second-lieutenant',
-    'secretarius',
-    'secrett',
-    'sedex',
-    'seed-corn',
-    'seepages',
-    'seesaws',
-    'segre',
-    'segregates',
-    'sei-sen',
-    'seiffert',
-    'seil',
     'selare',
-    'selbourne',
-    'selectron',
-    'self-assertiveness',
-    'self-citation',
-    'self-exploration',
-    'self-heating',
-    'self-instruction',
-    'self-investment',
-    'self-lacerating',
-    'self-organisation',
-    'self-organized',
-    'self-praise',
-    'self-produced',
-    'self-recrimination',
-    'self-renewal',
     'self-reproducing',
-    'self-reward',
-    'self-tanning',
-    'selfcatering',
-    'selfe',
-    'sell-on',
-    'selman',
-    'sematech',
-    'semele',
-    'semi-free',
-    'semi-liquid',
-    'semi-synthetic',
-    'semie',
-    'seminarian',
-    'sempringham',
-    'sensate',
     'sensornet',
-    'sensus',
-    'sentimentalized',
-    'sepon',
-    'sere',
-    'seriatim',
-    'serjeanty',
-    'serplan',
-    'serrl',
-    'seta',
-    'settis',
-    'setzer',
-    'seven-mile',
-    'seven-piece',
-    'seven-wicket',
-    'seventy-',
     'severalls',
-    'sex-related',
-    'sex-symbol',
-    'seydou',
-    'seyhulislam',
-    'seymours',
-    'seyval',
-    'sezession',
-    'sezs',
-    'sgarbi',
-    'sgor',
-    'shaanxi',
-    'shac',
-    'shade-loving',
-    'shadowfax',
-    'shafto',
     'shalbe',
-    'shambhala',
-    'shamil',
-    'shandell',
-    'shaney',
-    'shanny',
-    'shantytown',
-    'share-cropping',
-    'sharedealer',
-    'shari\'a',
-    'sharp-pointed',
-    'shchukin',
-    'sheahy',
-    'shean',
-    'sheaved',
-    'shechem',
     'shedded',
-    'sheeba',
-    'sheene',
-    'sheep-pen',
-    'sheering',
-    'sheerly',
-    'sheet-metal',
-    'sheisshaus',
-    'shelf-space',
-    'shelfold',
-    'shell-less',
-    'shenandoah',
-    'shenton',
-    'sherbets',
-    'sherbrooke',
-    'sheri',
     'sherie',
-    'sheriff-depute',
-    'shez',
-    'shibden',
-    'shikotan',
-    'shim',
-    'shimi',
-    'shippen',
-    'shirt-sleeve',
-    'shirtsleeve',
-    'shitbag',
-    'shive',
-    'shivling',
-    'shoaled',
-    'sholto',
-    'shome',
     'shopworker',
-    'shore-line',
-    'shoreward',
-    'shorrock',
-    'short-barrelled',
-    'shortheath',
-    'shoulder-blade',
-    'shouldst',
-    'showboat',
-    'shrimper',
-    'shrimsley',
-    'shrovetide',
-    'shtetl',
-    'shumeiko',
-    'siamang',
-    'sic&agrave;n',
     'sidaway',
-    'siddique',
-    'side-arm',
-    'side-car',
-    'side-foot',
-    'side-room',
-    'side-to-side',
-    'sidewinder',
-    'siebe',
-    'siew',
-    'siezed',
-    'sigglesthorne',
-    'sightscreen',
-    'sigmaplot',
-    'signac',
-    'sihtric',
     'silage-making',
-    'silajdzic',
-    'silius',
-    'sillibubs',
-    'silvan',
-    'silver-store',
-    'silver-tipped',
-    'silvery-grey',
-    'silvestre',
-    'simazine',
-    'simes',
-    'simmo',
-    'simond',
-    'simonescu',
-    'simplicio',
-    'single-ended',
     'single-market',
-    'single-movement',
-    'singleton-green',
-    'sinh',
-    'sipcott',
-    'siple',
-    'sirdar',
-    'siret',
-    'sirhan',
-    'sirimavo',
-    'siring',
-    'siris',
-    'sissie',
-    'sita',
-    'sivell',
-    'six-footer',
     'six-person',
-    'sixth-floor',
-    'sjogren',
-    'sk&aring;l',
-    'skaftafell',
-    'skb',
-    'skene',
-    'sketchley',
-    'skewering',
-    'ski-jump',
-    'ski-slope',
-    'ski-suit',
-    'skillery',
-    'skiplam',
-    'skirling',
-    'skyscape',
     'slab-sided',
-    'slac',
-    'slathered',
-    'slaughter-house',
-    'slavophile',
-    'slejf',
-    'sliema',
-    'sligos',
-    'slingers',
-    'slip-road',
-    'slippering',
-    'slobbery',
-    'slobo',
-    'sloughs',
-    'slowly-run',
-    'smac',
     'smai',
-    'small-diameter',
-    'small-firm',
-    'small-screen',
-    'smart-alec',
-    'smart-ass',
-    'smartlink',
-    'smartly-dressed',
-    'sme',
-    'smh',
-    'smocking',
-    'smoke-belching',
-    'smokies',
-    'smoulders',
-    'smurthwaite',
-    'snailbeach',
     'snazz',
-    'snee',
-    'sneinton',
-    'snelgrove',
-    'snickers',
-    'snivelled',
-    'snow-plough',
-    'snowfield',
-    'snowmobile',
-    'snowshoe',
-    'soap-box',
-    'sobel',
-    'social-welfare',
-    'sociaux',
-    'societ&eacute',
-    'soderstrom',
     'soering',
-    'sofaer',
-    'soffits',
-    'soft-footed',
-    'soft-headed',
-    'softkey',
-    'software-based',
-    'sogono',
-    'sokolovi&cacute',
-    'solaced',
-    'solaglas',
-    'solaire',
-    'solange',
-    'solano',
-    'solder-ring',
-    'soleiman',
     'solemnized',
-    'solicits',
-    'solidasarock',
-    'soltan',
-    'solvent-free',
-    'solvent-welded',
-    'solvent-welding',
-    'sombart',
-    'somefing',
-    'somethin',
-    'sommeil',
-    'soneryl',
-    'song-dam',
-    'sonntag',
-    'soot-black',
-    'soother',
     'sorabji',
-    'sorel',
-    'sotogrande',
-    'sotomayor',
-    'sound-bite',
-    'sound-proof',
-    'sour-faced',
-    'south-south',
-    'southfork',
-    'southmet',
-    'southway',
-    'sov',
-    'sozzled',
-    'spaight',
-    'spangly',
-    'sparcard',
     'sparcengine',
-    'sparcle',
-    'sparkie',
-    'spatulate',
-    'spd-fdp',
-    'speakeasy',
-    'speccy',
-    'speckling',
-    'spectragraphics',
-    'speedfit',
-    'sperzel',
-    'spews',
-    'spic',
-    'spiess',
-    'spiggy',
-    'spindler',
     'spinnery',
-    'spinrad',
-    'spinrite',
-    'spirin',
-    'spitted',
-    'splats',
-    'splays',
-    'spline',
-    'spod',
-    'sportspeople',
-    'spotland',
-    'spring-clean',
-    'spring-summer',
-    'sprinkles',
-    'spy-glass',
-    'square-bashing',
     'square-ended',
-    'square-shouldered',
-    'squidge',
-    'squished',
-    'sr-71',
-    'srinath',
-    'srl',
-    'sss',
-    'st.g',
-    'stadio',
-    'stage-diving',
-    'staging-post',
-    'stagy',
-    'stairlift',
-    'stake-out',
-    'stakhanovite',
     'stalkinghorse',
-    'staloluokta',
-    'stalwort',
-    'standen',
-    'stannah',
-    'stap',
-    'staplers',
-    'starck',
-    'stargazer',
-    'starre',
-    'starstruck',
-    'startrac',
-    'stashing',
-    'state-backed',
-    'state-pension',
-    'stationeri',
     'statu',
-    'status&mdash;return',
-    'stay-behind',
-    'staythorpe',
-    'steama',
-    'stecca',
-    'stehr',
-    'steiglitz',
-    'stelazine',
-    'steller',
-    'sternlicht',
-    'steventon',
-    'sticking-point',
-    'stickley',
-    'stiff-backed',
-    'stiffy',
     'stiftungs',
-    'stille',
-    'stillwell',
-    'stinko',
-    'stirk',
-    'stit',
-    'stojkovic',
-    'stolz',
-    'stonethwaite',
-    'stop-loss',
-    'storefront',
-    'stoved',
-    'stowood',
-    'stracar',
-    'stradivarius',
-    'strass',
     'stratfield',
-    'streptococci',
-    'stressholme',
-    'stri',
-    'strid',
-    'strider',
-    'strieber',
-    'strikland',
-    'strong-armed',
-    'struth',
-    'strydom',
-    'stumm',
-    'sture',
-    'sturminster',
-    'stylesetter',
-    'su-25',
     'sub-total',
-    'subclone',
-    'subcropping',
-    'subdural',
-    'subgrouping',
-    'sublittoral',
-    'submerse',
-    'subsalicylate',
-    'subst',
-    'succours',
-    'sucklers',
-    'sucres',
-    'suda',
-    'sudirman',
-    'suffolk-based',
-    'sulman',
     'sulphur-dioxide',
-    'sulzer',
-    'sumach',
-    'sumeria',
-    'summate',
-    'summering',
-    'summerlee',
-    'sumter',
-    'sun-cream',
-    'sunbather',
-    'sunblest',
-    'sunbursts',
-    'sundaes',
-    'sunderbans',
-    'sunlust',
-    'sunman',
     'sunnycliffe',
-    'sunspectrum',
-    'sunvision',
-    'suo',
-    'super-',
-    'super-giant',
-    'superbarrio',
-    'superbikes',
-    'supercouloir',
-    'supercut',
-    'superfamilies',
-    'superfile',
-    'superfinal',
-    'superfluid',
-    'superjanet',
-    'superlead',
     'supermario',
-    'supernet',
-    'supernode',
-    'superphosphate',
-    'superpipelined',
-    'supersavers',
-    'supersparc-based',
-    'superstrat',
-    'supertips',
-    'supertram',
-    'supertrim',
-    'supper-time',
-    'supplants',
-    'supplementary-benefit',
-    'supplicius',
-    'supra-individual',
     'supraphon',
-    'supremes',
-    'sure-footedness',
-    'sureseam',
-    'surface-mounting',
-    'surgeon-general',
-    'surinder',
-    'surjit',
-    'surtsey',
-    'suspiciousness',
-    'susquehannah',
-    'suster',
-    'suvar',
-    'sviridenko',
-    'swadlincote',
-    'swaggart',
     'swagged',
-    'swaleh',
-    'swamy',
-    'swan-upping',
-    'swanee',
-    'swds',
-    'sweat-stained',
-    'sweet-shop',
-    'sweet-tasting',
-    'sweet-tempered',
-    'sweetlips',
-    'sweltered',
-    'swigert',
-    'swills',
-    'swing-seat',
-    'swinnerton',
     'swiss-born',
-    'swoosh',
-    'sword-hilt',
-    'swp',
-    'swr',
-    'sya',
-    'syb',
-    'sybarite',
-    'sydney-based',
-    'sylv',
-    'symeon',
-    'symmetrix',
-    'symmetry-related',
-    'synfuel',
-    'syntagma',
-    't&eacute;l&eacute;ph&eacute;rique',
     't-square',
-    'tabac',
-    'tabiner',
-    'tabun',
-    'tadjoura',
-    'tadorna',
-    'tailboom',
-    'tailfin',
-    'taken-over',
-    'talavera',
-    'taler',
-    'tallage',
-    'tallulah',
-    'talulah',
-    'tamazapam',
-    'tambini',
     'tamerlane',
-    'tamesin',
-    'tampers',
-    'tamping',
-    'tana',
-    'tann',
-    'tannen',
-    'taoism',
-    'tap-tapping',
-    'tap-water',
-    'tapley',
-    'taqi',
-    'taroudant',
-    'tarsal',
-    'tartary',
-    'tatin',
     'taube',
-    'taureans',
-    'tauro',
-    'tavener',
-    'tax-collecting',
-    'tax-relief',
-    'taxi-rank',
-    'taxol',
-    'taxpaying',
-    'tayif',
-    'tazio',
-    'tc-dtpa',
-    'tc-lc',
-    'tcdd',
-    'tea-boy',
-    'tea-cosy',
     'tea-urn',
-    'team-member',
-    'team-working',
-    'teamware',
-    'teasel',
-    'teazle',
-    'technische',
-    'technology-related',
-    'tecks',
-    'tees-side',
-    'teeswatch',
-    'tegl',
-    'teign',
-    'teint',
-    'teipsum',
-    'tekoa',
     'telana',
-    'teleprocessor',
-    'televison',
-    'temperley',
-    'tempore',
-    'temporizing',
-    'ten-storey',
-    'tenderloin',
-    'tenebrous',
-    'tenpenny',
-    'tensioning',
-    'terabyte',
-    'terminal-based',
-    'terrassa',
-    'terrasse',
-    'terray',
     'teryho',
-    'tesla',
-    'tesselmann',
-    'test&mdash;mode',
-    'test-best',
-    'test-curve',
-    'teton',
-    'teutons',
-    'texels',
-    'text-processing',
-    'tfiiia',
-    'tft',
-    'tgf-',
-    'th&eacute;ophile',
-    'th\'should',
-    'thakur',
     'thalay',
-    'that-clause',
-    'thavies',
-    'theakstons',
-    'theekit',
-    'thees',
-    'thekla',
-    'themis',
-    'thems',
-    'thermopylae',
-    'thespiai',
-    'theudebald',
-    'thiabendazole',
-    'thieved',
-    'third-place',
-    'thirty-mile',
     'thixotropic',
-    'thondaman',
-    'thorley',
-    'thorngumbald',
-    'thornless',
-    'thoughout',
-    'thousand-dollar',
-    'three-acre',
-    'three-act',
-    'three-field',
-    'three-horse',
-    'three-o',
-    'three-room',
-    'three-score',
-    'three-terminal',
-    'three-test',
     'three-tone',
-    'three-wheel',
-    'threnody',
-    'threonine',
-    'throw-over',
-    'tht',
-    'thunderflashes',
-    'thurgau',
-    'tiaan',
-    'tice',
-    'tickertape',
-    'ticket-collector',
-    'ticky',
-    'tiddler',
-    'tide-line',
-    'tidswell',
     'tie-pin',
-    'tight-packed',
-    'tightrope-walker',
-    'tigrett',
-    'tilery',
-    'timbrel',
-    'time-lock',
-    'time-saver',
-    'time-slot',
-    'time-stretch',
-    'time-structure',
-    'time-window',
-    'timeplex',
-    'timeshares',
-    'timi',
-    'timmons',
     'tindell',
-    'tinka',
-    'tinnock',
-    'tino',
-    'tippe-top',
-    'tirage',
-    'tireder',
-    'tisanes',
-    'tissue-typed',
-    'tisza',
-    'tit-bit',
-    'titaghur',
-    'title-winning',
-    'titmus',
-    'tix',
-    'tm-13',
     'tna',
-    'tns',
-    'to&mdash',
-    'tob',
-    'toe-rag',
-    'toe-sucking',
-    'toe-tapping',
-    'togliatti',
-    'tohian',
-    'toksvig',
-    'tolka',
-    'tollcross',
-    'tolstoi',
-    'tomislav',
-    'tomsk-7',
-    'tone-painting',
     'toners',
-    'tonya',
-    'toohey',
-    'tooke',
-    'tookey',
-    'tool-box',
-    'tool-using',
-    'toolchest',
-    'top-coat',
-    'top-weight',
-    'topkapi',
-    'topping-up',
-    'torbrex',
-    'torphin',
-    'torpoint',
-    'torquatus',
     'torquemada',
-    'torry',
-    'tortola',
-    'tortrix',
-    'torty',
-    'tory-run',
-    'totalising',
-    'toth',
-    'touch-down',
-    'touch-tone',
-    'touchscreen',
-    'tough-tackling',
-    'toulmin',
-    'tovarich',
-    'town-house',
-    'towner',
     'toyo',
-    'tpi',
-    'tpu',
-    'tr&eacute;pail',
-    'trace-element',
-    'track-record',
-    'tracksuited',
-    'tractability',
-    'tradicionalista',
-    'traffic-related',
-    'train-spotter',
-    'trainglot',
-    'transbinary',
-    'transected',
-    'transfixing',
-    'transfrontier',
     'transitioned',
-    'transvision',
-    'tratsch',
-    'travelers',
-    'travelmate',
-    'tree-bark',
-    'tree-creeper',
-    'treebeard',
-    'treelined',
-    'trefor',
-    'treitel',
-    'trela',
-    'tremaynes',
-    'trendlewood',
-    'trenholme',
-    'tresor',
     'triaca',
-    'trianguli',
-    'triangulum',
-    'trichoptera',
-    'trichostrongyloid',
-    'triestino',
-    'trigat',
-    'trinzic',
-    'tripartism',
-    'tritsch',
-    'trivandrum',
-    'trix',
-    'trl',
-    'troc',
-    'trofin',
-    'troke',
     'trood',
-    'trophectoderm',
-    'trudges',
-    'true-life',
-    'truevision',
-    'truing',
-    'trusties',
-    'tseep',
-    'tsemi',
-    'tsoy',
-    'ttf',
-    'tti',
-    'tucano',
-    'tudor-style',
-    'tufte',
-    'tuigamala',
     'tuk',
-    'tulipa',
-    'tulley',
-    'tulloh',
-    'tulyar',
-    'tumble-drier',
-    'tungsram',
-    'tunku',
-    'turandot',
-    'turcotte',
-    'turgot',
-    'turi',
-    'turmeau',
-    'turvy',
-    'tustian',
-    'tutty',
     'tvam',
-    'twelve-page',
-    'twelve-year',
-    'twenty-five-year',
-    'twenty-two-year-old',
-    'twigging',
-    'twin\'',
-    'twinings',
-    'twiss',
-    'twitters',
-    'two-control',
-    'two-letter',
-    'two-member',
-    'two-parameter',
-    'two-pass',
-    'two-state',
     'two-tailed',
-    'twoyear-old',
-    'twyman',
-    'tybalt',
-    'tyneside-based',
-    'type-a',
-    'tytherington',
-    'u_',
-    'ubc',
-    'uclaf',
-    'ucw',
-    'udalric',
-    'uddin',
-    'udex',
-    'ues',
-    'ugms',
     'uighurs',
-    'ulay',
-    'ullathorne',
-    'ullo',
-    'ultra-light',
-    'umanskii',
-    'umhausen',
-    'un-american',
-    'un-controlled',
-    'un-noticed',
-    'unamic',
-    'uncapping',
-    'unclench',
-    'unclos',
-    'uncork',
-    'uncorking',
     'under-12s',
-    'under-equipped',
-    'under-populated',
-    'under-provided',
-    'under-trained',
-    'underfur',
-    'undergirding',
-    'underpaying',
-    'underplanting',
-    'unfdac',
-    'unhuman',
-    'uniao',
-    'unie',
-    'unification-based',
-    'unilluminating',
-    'uniscan',
     'unitel',
-    'universalizing',
-    'universit&auml;t',
-    'unkept',
-    'unknotting',
-    'unlaid',
-    'unlearning',
-    'unmould',
-    'unneighbourly',
-    'unpunctual',
-    'unputdownable',
-    'unr',
-    'unreeling',
-    'unrolls',
-    'unscrews',
-    'unser',
     'unsocialist',
-    'unstrung',
-    'unstuffy',
-    'untaken',
-    'unthought',
-    'untill',
-    'unzen',
-    'up-dates',
-    'up-stream',
-    'upas',
-    'upload',
-    'upmeadow',
-    'uppermill',
-    'uprona',
-    'upsall',
-    'upstair',
     'urbs',
-    'urchfont',
-    'urgel',
-    'urtica',
-    'urubamba',
-    'us-canadian',
-    'usac',
-    'uscg',
-    'usd',
-    'user-led',
-    'user-level',
-    'user-specified',
-    'ush',
-    'usn',
-    'usno',
-    'ussuri',
     'usurps',
-    'utton',
-    'utu',
-    'uygur',
-    'v&eacute;lez',
-    'v.w.',
-    'vaccinating',
-    'vaccinator',
-    'vacillate',
-    'vair',
-    'valadier',
-    'valais',
-    'valdano',
-    'valences',
-    'vallely',
-    'value-science',
     'valus',
-    'vananu',
-    'vanek',
-    'vanne',
-    'vanuata',
-    'varanasi',
-    'vardar',
-    'vario',
-    'varn',
-    'varvitsiotis',
-    'vasareley',
-    'vasarhelyi',
-    'vasile',
-    'vastatrix',
-    'vasulka',
-    'vatra',
     'vavuniya',
-    'vegetate',
-    'veguer',
-    'veing',
-    'veka',
-    'velasca',
-    'velchanos',
-    'veljanovski',
-    'vell',
-    'vella',
-    'velo',
-    'veloso',
-    'velzen',
-    'venation',
-    'venceremos',
-    'vend&eacute;e',
     'venez',
-    'venezuelans',
-    'vengs&oslash;ya',
-    'venter',
-    'verneuil',
-    'verplank',
-    'verse-form',
-    'ves',
-    'vestigia',
-    'vetches',
-    'vg-15',
-    'viaticum',
-    'vibroverb',
-    'vicchiomaggio',
-    'vice-ch',
-    'victimise',
     'video-recorded',
-    'videofit',
-    'videotaping',
-    'vidipc',
-    'vierchowod',
-    'vierge',
-    'viett',
-    'viewfinders',
-    'vig',
-    'vigier',
-    'viki',
-    'village-based',
-    'villanelle',
-    'villeroy',
-    'vindiciae',
-    'vindolanda',
     'vinestock',
-    'vinho',
-    'vintage-style',
-    'virchow',
-    'virtus',
-    'viscontis',
-    'viscounty',
-    'visionhire',
-    'visualises',
-    'vlachy',
-    'vladikavkaz',
-    'vn',
-    'vobster',
-    'voc',
-    'vocalization',
-    'vogelstein',
     'voiceover',
-    'volante',
-    'voluptuary',
-    'vondelpark',
-    'vonetta',
-    'vookodlaks',
-    'voorhies',
-    'vora',
-    'vorontseff',
-    'vorsprung',
-    'vote-buying',
-    'vote-winner',
-    'vote-winning',
-    'vought',
-    'voxes',
-    'vpe',
     'vpo',
-    'vpos',
-    'vsat',
-    'vsoe',
-    'vsop',
-    'vtam',
-    'vtol',
-    'vulliamy',
-    'vulso',
-    'vwag',
-    'w10',
-    'wac',
-    'waffler',
-    'waggles',
-    'wagland',
-    'wagoner',
     'wahlitits',
-    'wailer',
-    'waisale',
-    'waist-level',
-    'waistlines',
-    'wakenshaw',
-    'wallies',
-    'wallows',
-    'wallraf',
-    'walshe',
-    'wan\'',
-    'war-',
-    'war-god',
-    'war-horse',
-    'war-leader',
-    'war-tax',
     'war-work',
-    'warcup',
-    'warleigh',
-    'warm-water',
-    'warmonger',
-    'warndon',
-    'warouw',
-    'warrilow',
-    'wasa',
-    'wasn',
-    'wassa',
-    'watchin\'',
-    'watchkeeping',
-    'water-',
-    'water-buffalo',
-    'water-hole',
     'water-related',
-    'waterbuck',
-    'waterkloof',
-    'waterpark',
-    'waterproofer',
-    'waterstock',
-    'waterworld',
-    'watman',
-    'watmoughs',
-    'wattisham',
-    'wau',
-    'wavefronts',
-    'wavelan',
-    'waxwing',
-    'we\'d',
-    'wee-wee',
     'weee',
-    'week-by-week',
-    'weener',
-    'weeting',
-    'weighell',
-    'weight-saving',
-    'weissbr&auml;u',
-    'well\'',
-    'well-dressing',
-    'well-entrenched',
-    'well-lighted',
-    'well-orchestrated',
-    'well-packaged',
-    'well-recorded',
-    'well-studied',
-    'well-wrought',
     'wellesbourne',
-    'wenn',
-    'west-european',
-    'westcombe',
-    'westernizers',
-    'westhoughton',
-    'westrup',
-    'wests',
-    'wexler',
-    'whacker',
-    'what\'s-a-name',
-    'what\'s-his-name',
-    'whatcha',
-    'wheater',
-    'wheatlands',
-    'wheelslip',
     'whensoever',
-    'whereabout',
-    'whickered',
-    'whickering',
-    'whinged',
-    'whinlatter',
-    'whir',
-    'whishaw',
-    'whistlers',
-    'white-and-red',
-    'white-gold',
-    'whitebeam',
-    'whiteheaded',
-    'whitespot',
-    'whiz-kid',
-    'who-dun-it',
     'whole-body',
-    'wholegrains',
-    'wicket-keeping',
-    'wicketkeeping',
-    'widdel',
-    'widdows',
-    'wide-area',
-    'wide-boy',
-    'wide-reaching',
-    'wideawake',
-    'widgeon',
-    'wieman',
-    'wieniawski',
-    'wierzbicka',
-    'wieslaw',
-    'wifes',
     'wiggington',
-    'wiggy',
-    'wigheard',
-    'wildish',
-    'willats',
-    'willison',
-    'windebank',
-    'windows-style',
-    'winfried',
-    'wing-membrane',
-    'wingeing',
-    'winnebago',
-    'wire-tapping',
-    'wishplants',
-    'wissmann',
-    'wit\'',
     'witherings',
-    'withies',
-    'within-subject',
-    'withy',
-    'witkin',
-    'witted',
-    'wittet',
-    'wixom',
-    'wizz',
-    'wlog',
-    'wo-man',
-    'wo2',
-    'wodges',
-    'wojtowicz',
-    'wolfhead',
-    'wolford',
     'wolkind',
-    'wolley',
-    'wolviston',
-    'woman-identified',
-    'wonderwest',
-    'wood-based',
-    'wood-block',
-    'wood-boring',
-    'wood-lice',
-    'wood-store',
-    'woodcarvings',
-    'woodchester/gloucestershire',
-    'woodfit',
-    'woodfull',
-    'wooding',
-    'woodland.',
     'woodner',
-    'woodthorpe',
-    'woodworth',
-    'wooer',
-    'woofers',
-    'woolpack',
-    'worby',
-    'word-meanings',
-    'word-setting',
-    'worde',
-    'wordiness',
-    'wordly',
-    'wordsmiths',
-    'worgan',
-    'work-bench',
-    'work-reddened',
     'work-space',
-    'work-table',
-    'work-worn',
-    'workbench/6000',
-    'workboat',
-    'workflo',
-    'working-',
-    'workman-like',
-    'workplans',
-    'workspaces',
-    'workstart',
-    'workstation-based',
-    'workstream',
-    'world-scale',
-    'world-shaking',
-    'world-shattering',
     'worldcom',
-    'worlder',
-    'worlingworth',
-    'wormserstrasse',
-    'worriers',
-    'worse-than-expected',
-    'worsteds',
-    'wotan',
-    'wotsits',
-    'woundings',
-    'wr14',
-    'wra',
-    'wraf',
-    'wrangled',
-    'wrapp',
-    'wrapping-paper',
     'wrecclesham',
-    'wrex',
-    'wrily',
-    'wristy',
-    'write-protected',
-    'writedowns',
-    'wrn',
-    'wrong-foot',
-    'wrongfooted',
-    'wryneck',
-    'wryness',
-    'wsl',
-    'wt/wt',
-    'wulf',
-    'wulfgeat',
-    'wunt',
     'wuppertal',
-    'wurly',
-    'wurtz',
-    'ww/may',
-    'ww1',
-    'ww2',
-    'wy',
-    'wychavon',
-    'wycliffes',
-    'wyevale',
-    'wykes',
-    'wyle',
-    'wyler',
-    'wymbush',
-    'wynds',
-    'wynne-morgan',
     'wynton',
-    'x-amp',
-    'x-axis',
-    'x-cellerator',
-    'x-direction',
-    'x-linked',
-    'x-station',
-    'x12',
-    'x69115',
-    'x8',
-    'xa7',
-    'xanten',
-    'xanthippe',
-    'xapuri',
-    'xaver',
-    'xciii',
     'xe1',
-    'xedos',
-    'xenofon',
-    'xg5',
-    'xh8',
-    'xiang',
-    'xiii\'s',
-    'xionics',
-    'xircom',
-    'xk488',
-    'xms',
-    'xoliswa',
-    'xp2',
-    'xp338p',
-    'xq21.3-xq22',
-    'xr2',
     'xr4x4',
-    'xstation',
-    'xud',
-    'xxxix',
-    'xxxviii',
-    'y\'ar',
-    'y\'fiprehaude',
-    'y\'frike',
-    'y-located',
-    'y321',
-    'ya/33/25/0046',
-    'yaar',
-    'yaik',
-    'yakka',
-    'yalding',
-    'yamada',
     'yamani',
-    'yamazaki',
-    'yanomamo',
-    'yantra',
-    'yappy',
-    'yarborough',
-    'yard-arm',
-    'yard-long',
-    'yardland',
-    'yarrell',
-    'yarrington',
-    'yass',
-    'yat-sen',
-    'yatra',
-    'year\'',
-    'year-book',
     'year.the',
-    'yeare',
-    'yellen',
-    'yellow-bellied',
-    'yellow-orange',
-    'yellow/green',
-    'yellowlegs',
-    'yemens',
-    'yenilmez',
-    'yerushalmy',
-    'yes-no',
-    'yetminster',
-    'yevgeniev',
-    'yevonde',
-    'yf',
-    'yidana',
     'yilma',
-    'yins',
-    'yisroel',
-    'yo-ho-ho',
-    'yo1',
-    'yoh',
-    'yomp',
-    'yonson',
-    'york-bournemouth',
-    'yorked',
-    'yorvik',
-    'yoshiyama',
-    'yossi',
-    'youngers',
-    'yourcenar',
-    'yoyo',
     'ysabel',
-    'ysgubor',
-    'ysl',
-    'ysterplaat',
-    'ystrad',
-    'ystradgynlais',
-    'ytterbium',
-    'ytv',
-    'yub',
-    'yuille',
-    'yuki',
-    'yumjaagiyn',
-    'yuriy',
-    'yuval',
-    'yvetot',
-    'z&eacute;phirine',
     'z-cars',
-    'z-direction',
-    'z-scores',
-    'za',
-    'zabat',
-    'zadokite',
-    'zaghlul',
-    'zags',
-    'zakynthos',
-    'zamberlan',
-    'zandra',
-    'zassoursky',
-    'zealand-born',
-    'zeitschrift',
-    'zelia',
-    'zelmer',
     'zelotes',
-    'zemaitis',
-    'zeman',
-    'zemun',
-    'zengpei',
-    'zenithal',
-    'zephyrs',
-    'zero-beta',
-    'zero-crossing',
-    'zesty',
-    'zf',
-    'zhanna',
-    'zike',
-    'ziman',
-    'zinging',
-    'zit',
     'zlenko',
-    'znf37b',
-    'zoanthids',
-    'zodiaque',
-    'zoia',
-    'zolot',
-    'zomba',
-    'zonae',
-    'zoologically',
-    'zoran',
-    'zorna',
-    'zs',
-    'zsofia',
-    'zu&ntilde;iga',
-    'zucker',
-    'zug',
     'zuid',
-    'zvereva',
-    'zvonimir',
-    'zwinger',
-    'zzt',
-    'zzz',
+)
+
+blocks_22 = (
+    '&)linolenic"&mp;and%&safety&%up222"1ring;ngstr&ouml;m"2st&ast&ast&ast&ast!(bsol;dos!%dgr;z"/ollar;0.0090497+!6*"34+!6*"40+!6*"52',
+    '*$400m)$.5bn*"61*"84*!9)$0.3m+"6m+"8m*(0million)$1.4m+"5m*"5m*!6)$4.5m+"6m',
+    '*!5)450,000&ndash;200,000)$7.3m+"4m+"6m)$8.8m()2&ndash;3)%,500m)".6*"80)$0.2m+"5m*30,000&ndash;300,000)%2,000*#.2m',
+    '*!0+$,000*"5m)&30,000)%4,000*%0,000+!m)*50,000,000)$6.8m+"9m*%0,000+!m(%3,750)".2*"50',
+    '*!9)$0.3m)&20,000)%4,000)050&ndash;530,000)&60,000)&75,000*!m)"8m)$9.6m("42(#5.3)"3m)"6m)#70m',
+    '*!m(%6,500)".1*"6m)#50m)!7(&73,000)%6,000)"bn($8.8m))0,000,000*)0,000,000)%4,000)"5m($9.1m',
+    ')%0,000(&e&lsqb(%sup12!.eacute;litists(%pater(#tat"%grave!(flat;7th")ormula;1i)!4"&rac12%\'#;-1)$inch("cm(!d',
+    '&!6%\'34;inch!$gt;1$!7!%iexcl!\'lgr;1-3"#t;0%%.0001$!4$"5%$#90%$(index&gt!(mdash;is".icro;g/kg/hour)$mmol',
+    '!\'ndash;s\'#you!+ouml;resund&*sterreichs&"tv!*plus;0.068%$mn;1"&ound;0\'*1&frac12;m(*,000-worth*"80)#295)\'500,000!)scedil;ah $\'arf',
+    '!"b\'!#eft!"of!%twixt!%would \'-2300bp!(boundary"!y!&ribbon!!x &0-6-0t"%level!).5-micron \'1&ndash!#00-',
+    '$&member$$page#"0m"&am-6pm%$noon!*1&ndash;10)!5"$-day"#70s!*2&ndash;24"&-place$&ounder"#00s!)3&ndash;2"%-hour',
+    '!$400s!&5-yard"#5mm"\'q11-q13!*6&ndash;29"$-day#$plus"!f!)7&ndash;4"#.5p!&8-foot#%track"-99&ndash;1900!,910&ndash;14 +2&ndash;5pm',
+    '"(year-old!(.8-litre!%0-way"&0-page"#lbs!+1&ndash;feb"#(1)!+2&ndash;jan"#5mm!+4&ndash;nov)#oct"&-carat#%track!\'5-metre##pin',
+    '"!m!#7ft .3-deazaadenine"#way!&0-acre#%metre##ton"+0&ndash;500#%-foot$$page!&4-year!#8cm %4-day#$igit"$inch',
+    '!#.8p!&0-acre#&second!&5-year!&8-page \'5&ndash!$\'-3\'#"cc!&-litre"#min"$wood!%0-day!(1-member!#20s!%s-rna',
+    '"#day"+glucuronide!&0-foot#%metre#$year""0s!$10mm!)6&ndash;1 *7-year-old!(2-member $8.1p!"3p!"jr *9-year-old!)6&ndash;7',
+    '!#-15!".i!"26!#525!"61!"ac"!m"$rgau"!t!$base%!d#"ya"\'dicates#(ulrahman"(erangell',
+    '##tur"(ominated!,cci&ograve;n##ola#&reting#\'usative"\'et-link"*id-treated$&ifying#!r"!n""os""rg#!l#*ylonitrile',
+    '#$ion\'#%orish#!t#$uate&#ing"\'uminata"!z!\'daworld"+dictiveness"&elchis#!m"(ireksarn"$m-19#"ir"%riaen',
+    '"&ulated$&terate#&mbrate"&vected$&ntured*"om)"ss#,ocate-depute"#zes!%elred"!p"-roengineering$\'nautica")sculapius"(thelhere',
+    '#\'ixation"+ropithecini"(ter-show%$word!%gatis"#dam"\'e-based#"na"$grey"$inst#&t-prop"#nus""on"!p"&ricole',
+    '!(hlbrandt!%ideen"%msley"$naro#%derby"-r-conditioner$%space#%bases$$reak#+conditioned$\'raftman&"sh#&mobile#%packs%"ss',
+    '!$jami"#uga!"kc""el"#iko"&kadian"\'roteria!(l-atheer#&hariri%$ssan#\'za\'atar"#ang#+rc&oacute;n$"is"%berge',
+    '"!c#%maeon"&dehyde$#rly%$shaw""ea#&ctoris#%khine#$uads#$xius"$fama##gar"$gaes##ren"%ingue',
+    '""l\'#\'-seated%%quare$)too-brief$%woman##ays#%estry$%y-way#\'opathic"$mack#\'sgiving""ne#"us"\'pheratz"%tarus',
+    '#$hing#(nagelvin#"us"%vares!*mar&uacute$$ilis##sis""ba$(sciatori"!c"#dea"#ega#)ricanized"$ides#!e',
+    '"#nio"&okachi#(ntillado")phictyony%%oplus""re!#nab#%darko#)esthetise##gni#$itis#!t$)hematised""da$#lus',
+    '#&rejcak%$w-wa"(ecdotage")glophobia#&mering#"ol#&stroms#\'uishing"+imal-loving\'\'watcher"#jum"&nfield##uar"(opheline#"th',
+    '"&sermet#$pach"&t-hill$$lion#$acid#)e-chamber$$date(!s$$lami$!s#)hologised#)i-alcohol&*ppeasement%+colonialism/!t',
+    '%*e-cadherin%\'fascism%(humanist%&market\')terialist&)ilitarist%\'oxidant%#pop\'"rn%\'science&#hip)$ping&(talinist($tist%,unemployment',
+    '%%waste$(feminism$%mouse$$qued$*retroviral%&rhinum##ney#(ofagasta$%nella#%robus"*uradhapura!%ouita!$pack%"ed"\'eldoorn',
+    '#"is"&icella#!l""ob#\'llonian"\'ple-pie$%iqued"/r&egrave;s-midi""ud!*quil&aelig!&rachne&\'ophobia##wak"$benz#$itan',
+    '",chaebacteria$\'erfield$\'imedean#"ic#\'seconds",d&egrave;che#&izzone#%zinba"#ema"(gentatus#!h#%uello"$ingo"$klow"#len',
+    '"%mored#%rests"!n#"et##ish"(restment#\'ow-slit"\'t-world#)eriopathy$!s!$scap$%ridia#+lepiadaceae"%ean-4""fa',
+    '#$agre#%djian#$wina"&iatics"$kews"$musa"&parate#&halted")sessment."%tarte#$ilbe$!n#!m#%ounds##ras',
+    '$"on#%yanax"*ylnuratova!%tbash"$cher"&gcaaat"%henia%"ry#!y")lanticism"$ocha#$mics$%style"!r#)opurpurea',
+    '$!s"#ubu!%ubade#"ry"%detto"$gean"$mbry""re")sterberry$$icks%$nian".to-da-f&eacute$#bus$&claved$&latina',
+    '%&haping!)vantgarde##tar""en"$ions!&waking#)rd-winner""cc""fy!*xenstrasse!*zcu&eacute -b&eacute;zier#\'circ;te"0uuml;rgermeister!#-24',
+    '!(a\'athist"!.""bb#!u#&y-swop$#gro"*ccalaureat$%hante#"he#(k-biting&#one%\'channel%\'kitchen%$line\'!t',
+    '%*scratching%%track$%aches$%boned$\'combing$&dating$(slapping%\'tabbing"(dakhshan##dam"$gaza#!e#$gers##lan##man',
+    '#$uley"&hriyah""ig#%konur#(llieston%!y#*ze-covered"$jaur$$zeth"&keware#!o#"sh%!i#$unin"\'lalaika',
+    '$"wi#\'eycourt#)l-by-ball%$park$$adry$"in&%derry%+vi&aacute;n$#och$&points$%yearl#&thazar"(mborough"%navie#&doleer',
+    '#&ksides"%rakai$!m#%batus$#ier#\'carolle#&dfield#(e-legged$#bow$!n#,gain-hunters#$naba%"ck#$raga$#eto',
+    '#(thelsson$#oli"$sdeo#&e-born%#man##ham$$kirs#"on#%tardo"%tched#\'h-chair$$tubs##oni#+tery-driven"%u-bau',
+    '"(y-window#$sday!"co#!b!"df!\'eachamp#"me#"ta#&uforts##ven"%casue#"ca#"tu")d-chamber$&ridden',
+    '#$nota")e-keeping#\'ch-tree%#ers%%mount##gee#$kman#\'nhakker".fore-and-after"\'ginnin\'#%rimed$%udges"(leagured$$ived#&ieveth',
+    '$#iss$&wether#)ow-ground#(t-buckle"(medalled$$rton#%using"&nchtop#&dectin#%field#%galis##ita#&nachie#$olin#$skin',
+    '"$onna"#ral#&enguer#%genia$%strom#%ingar#"ke$)hampstead#$nera$!t#%sonin#$zins"#ssa#&t-case%\'trained',
+    '#%uited"$take$&ncourt#\'elgeuse#"ta$\'iscombe"#wey#!s"#zel#$ique!)h&amacr;i"%avana"$k-21!"i-"$blia',
+    '%#ogr"&ckered""fs"&g-race$$shot"#ked#\'ini-top")llingford$$roth##son"(odegrade#+engineering#$home#\'mimetic#$type',
+    '#"ka$$enau#)th-weight"$sbee#$hton"\'t-image#$ched#\'onality"\'valents"#zat#$zare!\'jelland!"ki""ks!,lack-bellied',
+    '%$hawk%\'leading%%staff\'#ock%#top#%keman#!m$#ire#%nches&%tower#$sier$)t-furnace#%ttern#$zons"&eckner',
+    '$"ny#)tchingley#$wett"$imps##xen"#oat%#ers#\'ckheads#+od-clotting%(thirster$&mwater#+tting-paper"#ue-%&rinsed%&tinted',
+    '##ndy##rts!#mft!&o-peep"(ardwalks##ted"$cage")dy-armour$(positive$%toner"%etsch"%gging"%hanna"\'ilerman"&ldface',
+    '#&iviano"*mbay-based"\'na-fido$#nno#*e-chilling%&headed%%white$\'crusher$!t#%santi#"um")o&die;tes##gey$)ie-woogie#)k-signing',
+    '#$t-up"#rde%&rlines##een#&galini$!e%%nicht#%ralan##zoi"\'ss-9000#&tonian"#teh#$hway##nar#%rytis',
+    '"\'ulenger"$wart#(dlerized#%ering#"ry##sey#!y"#yar!"po!(raggarts#\'in-wave##ley#(nch-line$&deston%!i',
+    '$%twood$$xton#(sseywing%$neck#&t-pack$%hwait$$ianu$"ti#$usen"*ead-making%"ed$\'king-in%!y#$edon#$hmer',
+    '$%tnall#&zinski"\'ickyard#+dge-builder&%haugh&$mere##enz$$rton#/gadef&uuml;hrer$+ht-coloured&)helmstone&&siders$"it$!s#&htheah',
+    '##ley#%melow#%ngeth%#in\'#(stlenose#(tannique%!x$%elite$\'ish-led"#n-2"%ochet#\'dsgaard#)ken-nosed#(ntosaurs#&oktree',
+    '$#nan#(wn-black%\'ish-red%&stones"#uck#!e##nig#&xelles"$ygos#$nley#"on$$zoan#$zgin!)ubble-jet$!y',
+    '#$kner"#ffo%"ns"&g-free#"ey"&ild-in%(ing-site"#kit##lod"%lgari#*let-headed$(fighters&%nches$%house$$rush',
+    '"$mmed"\'nkhouse""on"\'rberrys#$ette#.gundy-coloured#%keian$&inshaw#$n-up$%aston$$foot#&rowers#$stow#$then\'!s',
+    '#"ek##hby#,iness-school"+tcher-block#(skellism#*ter-yellow$%holes$%on-up"%zaglo#"za!(w-server"!g!+ye-election"#law"#num',
+    ' &c\'zaki!"-5"$axis"!g"&series"(terminus!#.k.!"14!"41!%abana$$rets#!i""ch"$dder$)ie-master',
+    '#"or"%fiero"$gots"$isse"\'lanscio##era$!y#$iphs#$king#"la%#way$%endar$%ouses#%ocera##tha',
+    '"(mel-hair#!i##kii#"my#\'panella"&nadair$%lised$!n$(p&eacute#%didus#&nabich$(ibalized$"ot$&ulated%"tt',
+    '#!p#"ti#$ucks##zon"$olan"$pcom#$itan%%oline#$rivi$#oni#"tn#"ua"(r-owning$%phone#$atti',
+    '&*ate-hosted(#ion&!e%+xy-terminus#%canet#\'d-table$*iothoracic$&member$#oen#&eening%,r-orientated-"ed\'%woman#$less$#ill',
+    '#$nedd%!l$#ian#$olco%&iniana%#led#&paccio#%retto$$iere$"og#\'t-horse$!a$"es##vey"&saroli',
+    '#$burn#&e-work#,sette-player$#ini#)tellabate$(le-guard&&thorpe#\'ualwear"\'tallaxy%$unya#%echol#$inat"!u#&sticum#&terise',
+    '&!y$!y""ws"%xford"$zden!#bes""si!"cf""up!#d3-"#rom#!s!)eausescus""ci""dd',
+    '"(ll-count%$mate$$mark#!s"!m"#nco##eca#%taury$"ra%*ophenoxine$&urions&\'y-maker"#pgl#\'halopod$#eus',
+    '$"ne#\'tificat#"vo"%ssnas!%f-200""lo""up!.h&acirc;tillon"(adderton#%galls#&in-saw$&r-lift%%bound#)let-style$%oners',
+    '$&fering$$lang$+p&ecirc;tre##nak$$dley$%nings#%pbook$(el-going%&roning#.racter-drawing*\'forming%!n$&coaled&!t$\'ge-hand',
+    '%"ot$\'t-based&&topper%(er-train%#ier#%sseur#*ttahoochee&%nooga#%udhry"+eap-looking#&ckered#*ek-by-jowl#(misorbed$&window#\'ngjiang',
+    '#-ster-lestreet#%ttiar"%i-rho##cot$%xulub#,efs-of-staff#(ff-chaff%%chaff##law$"d-&%birth&$wife$%l-out#%mango$"ie',
+    '$#oio#+nese-backed$#ned#%p-set$%chase$#ley$%munks#&rality#\'ttering#(yonofuji"*oc-a-block$"cy$&k-full$$olat#/lecystectomised',
+    '%)styramine$"la#&quette"&ronica"&uckin\'#\'ngchong$$kies#.rch-as-a-field&"ed&%stoke$#net"&yluria!+igar-shaped"%licia"\'mmerian',
+    '""or""rc"(tronella#%ylink""ve!&lacked##des#%ngula#"pp#&rifoil$%kston#+ss-struggle%%iques$$tics#"va',
+    '#$wson#(y-pigeon""ea$!l$$nin\'$)r-felling%$chus#(mentines(!s")ick-click#*ff-hanging&$path#"me#"ss#%toral',
+    '$\'kmaking#%dumar#!e#$gger#%hessy#&se&num#)th-making%(es-horse"&utters")yde-built!"mb!"na!)o-incided#)published"+achbuilders',
+    '#&l-dust#,rse-textured""bh#!o"%chlea#\'katrice$#ell#&ooning#%teaus"+de-breaking%$word##ies"#eli"+ffee-making"$gnex',
+    '"#key".lchester-based##den#$enso$&sfield#)lectivize$%ioure$&yhurst#&obines$+nel-general$%rfast&"ul$*ur-treated&$code"%marco',
+    '$)inatorics$%usted##ini$#que#$oran#(pany-car%+rtmentalise$,etence-based$&ilatio$&ositae%$tier$%rends$&server$%uter-)%drawn',
+    '#*ceptualist%\'rtantes\'%inaed%)ssionaire$$ilio\'"um#$depa$(ominiums#!f#&istone#%junct#(nexional#%onish#-sequentialist$%iglio',
+    '#*tainerized$.ext-dependence((stimulus\'\'ualised+#zed$\'rariety&#ves%#ol\'\'+ler-general&&verted#-ventionalized\'!o#$ways")okability$$shop',
+    '#!m#&perage&"ia"*pper-alloy\'&nickel$"in#%y-cat$$cats$%holds$\'writing"&rbiere#(caguiney#"de%!s$\'illeras',
+    '#\'igliano#"po%)rate-bond*\'finance#%regin$#ida#$sini#!t$#ijo#&vision#"ys"#s-7#"he##kun#\'modrome',
+    '"&tgrave#,ton-spinning"#ull#*nter-punch(&strike(%trade\'(attacked\'%force\'$pack\'$sink&\'sthorpe##rte$\'voisier#\'velaire"$wpen',
+    '#$well"*zens-hardy!#pes""gb""im""ns"$p-ml!#qsw!(rabapple$#bit$%grass#,dle-to-grave#(ghoppers$$side#%mmers',
+    '$%sipes##wly""ea#\'dential#*matogaster$%onini"%imdon#$nges#&tchlow$%erium"#oan#%cetto#%nkite#,p-protection#)ss-course',
+    '&%grain&$link&)subsidise&(training%#ens%$talk#$tone#%uesty$"py"#uas#)cifixions#!e#%mples#%sting#%tched',
+    '!%tagag!%ubana#%istes"%dlipp"!g"0isini&egrave;res#"to"$llet$%inane#!m$!e#(t-statue""mi#%ulate")nobelinos',
+    '"2ra&ccedil&atilde;o$$ting#&bridge#)raghinalt$"ey$$iers#!s$!t#%tain\'"!s#$sing#%todio"%ttin\'!"va""ni',
+    '"#bil")clostyled"$nara"\'pripack"\'renaean"(stopurin""to$$spin!+zech-slovak -d&aacute;vila"4eacute;collet&eacute",ouml;ldissen!$\'arc"&esprit!\'-shaped',
+    '!\'actylic")emon-room##ria##vas$!e"$ines$$tees#%rylea"&lcroze#%laway"#mn\'#$pier"\'nbridge##cey$#het',
+    '#$iela&!i#%sette%$uses##ton"%rchem##gue#"ko#$sena##ton"#sha"&tabook$$care$$link$%range',
+    '#$chet#)e-stamped$!n#"is"\'uberval#$nton"(venports"%wsons!"be!%c-10s!"dc!(e-la-noy"%adest$\'locking#\'thwatch',
+    '#&ouched#%races#*t-burdened$$line#&uggers"\'calogue#!i$1sion&mdash;making#%khand#)onstructs%\'trolled#%retio"$dial"$ehan#$ring',
+    '"/ficit-reduction#!m#&regger"\'gassing##nan#"re"%ja-vu#%euner"&lahaye$%porte$%unays#!f#)iverables#%monte##ong',
+    '%!y"+materialize#)ilitarize#)ocrat-led$)kratikong$&nizing$\'tivated#&urring"&nature#%tinox"#ols".partmentalised#+ut&eacute;s"%rnier#%riere',
+    '"*sertmartin#$ilva#&posyni##try"*totalizing#\'raction#$uned"(ukmejian"(vastates#"ey#%ismes$+trification"$wlap""ya"!z',
+    '!"fm"!n!%hondt#"ti!\'iamanda"$bber")chotomize$#ter#$kler#\'ynodont"%ddley#"nt"*encephalon"/ff&eacute;rence$%icile',
+    '%!n"(githurst"%lates")mensioned"$nesh#$gbat#\'ing-car#)ner-dance#%orwic")ophantine"$phda#(lomatist"1rectorate-general$"kt##ges',
+    '#%bands#\'coursal#+empowerment#\'honours#%inter#$more#$owns#\'parages$&leases$.ute-resolution#%robed#$sard#)tributary"%thery"!u',
+    '#%ulges""zy!#jwa!+na-affinity"!f""vp!"oa"%bbins#"re$!o#$unni""ch#%kerty%#ted#+ument-based',
+    '")g\'s-tooth#)-training#&onyaro"#hti"$itsu"#llo""mi$%nator%#gue#"um"%nchin#%emana#&nelley#$ohoe$"so',
+    ')!s&!d#!h$%ickey#(r-keeper$%knobs$(stepping"$pant##ers$!s#,pler-shifted"$rati#$ciss#$ment#&otheum',
+    '#*so-ventral"\'sserets$!y"&tterel"#uai#(ble-bind\'$reed&%think#$ggie$$lass$!y")wn-filled%&sizing&%tream$$flow',
+    '"#ach%#mae#)ft-dodger#(gon-lady&$ette&%tamer#+inage-basin#.ngaj&ouml;kull#!u""em#%ssler"$ikus#$nkie"$ools#%wners',
+    '#%mkeen#*nk-driving")y-cleaned*!r#%lands#\'opteris!+ual-control&"pu%\'voltage""be""ca#&hesnay#(k-rabbit#$ruet""do',
+    '"#hem"(kinfield"\'ll-eyed"&mbshow"%negal$"lm$"ra#"gy#"ny"\'odecimo"$port"$rdin#(enberger#$gnat##in\'',
+    '#!r"\'st-cart%#pan$$cart$&sheets")tch-based"\'valiers"#zme!\'va-4000!#yak$!s"%nevor"\'sphasic!%zorig %e-zee',
+    '!"16"!7!!9!)ach-uisge""ec"#gar#(lesfield"#kin"%ldhun"%r\'ole#%-lobe$*shattering&"ot#$bery#4ly-twentieth-century',
+    '%$scan"&st-end%*south-east$$hall#%ylink"(tanswill##ery""ve"&zilink!-cclesiasticus"&hinops#*o-location#!t"$kert"%lairs',
+    '"%otype""rs"#ton!&ddings"$essa"*ge-of-town"&iacara#+nburgh-born$#var"#man""si"\'uskunta!$eigs"!n!%geria',
+    '"$mont"*o-boosting"*yptologist!%hrich!)ichhornia"!e""ga#+ht-cylinder&\'lozenge&$part\'#ort&$user&%valve%&y-year"#lde',
+    '"(senstadt!.j&eacute;rcito")aculating!\'l-sayed"$ecta&&bility%,rophysiology#\'mentals#,utherococcus"$ides#$spot$#sia"&mfield#%hurst##ira',
+    '"&vetham#!y"#wis!*mancipator")bittering"$eric""gs"!h""ig"#rys"$ulex$\'sifiers#+ruangogolak!$naye"&cashed',
+    '"&d-1992$\'folding$$time#"er%#ley"%ergia&!s%+y-consuming\'*generating"(fleurage"%geham#*ine-driver#&lewood"#loe"$mesh',
+    '""ps"\'riqueta"&snares&#ing"(twhistle"3vironmentally-sound$\'sioning""za!#oka!*paminondas""ee"\'iktetos#&lobium#"ne"&l-4000',
+    '!#qui$#nus$$page!#rcs"#das"&goview"&idanus"$ling"&riquez#-or-correction""se!%s-335"&cargot#&heated#%ritor',
+    '""gs"\'pagnole$#rto##rix"#sai##eff"$t-ce#!a!-tablissements#$ples"%chant""su""ta!%uboea"\'calypti',
+    '"!l#&ogised"%phues",ro-communist%%rebel$$info$%money$%parks%"e\'!&valina$%lonia#(ngelised#0po-transpiration")e-of-poll##nki',
+    ')!d#$rnet"$geni%!y!%welme"!o#!k!\'x-boxer##cop#&editor#\'liberal#+paratrooper$)residents#)socialist#\'teacher',
+    '#%world",change-value#(lusivism#(oriating#)ursionist"$equy"%ocets"+propriating"\'tenders$(rnalised#$orts#)ra-strong%%codes$$uder!#ye-',
+    '%%ocket#$cron$"up!\'zechiel#!r"!x %f-117%!a"!4"&factor"$test!".m!$1-11!$4u-7!%abbri',
+    '$#ola##lel#"ms"%ce-up#\'torised&)y-applied""da"%g-end#$ging""hy"$ilte#\'rbridge$)y-stories#"ts"#lke',
+    '*!t##vey"&miglia"(ncy-free##nie#&taisie%%sises&#que#%worms"$rben#"ia#\'m-based$\'borough##zad"\'sciclin',
+    '%%inder#$text$#fit$$link$#net"\'t-frank#&ialofa#$tier"(ult-line&$zone#!t$!e"$wzia"\'x-email!#crs',
+    '!%e(ii)"0atherstonehaughs$*ure-length"$dden#%erate"-e-for-service#.ble-mindedness#*ding-place"%iffer##gns#%ngold".llow-traveller#(senstein#(t-tipped"#nix',
+    '"$rget##min#%nande$$dean$#ies#"re$"ol"%sting$\'schrift"(ttuccine!&ibbens%!r$#ing#)romyalgia"$cino',
+    '"&eldman#!r$!a$"ro"%gging"%laria##den#&gueira#)m-viewing"+nchampstead%#ing#\'e-grain#,ger-printing\'\'wagging##rot',
+    '"&presci"&reglow#%minus#%st-11&%grade%&direct"\'shcakes$\'ing-rod$$pool#\'t-fight%(in-a-bag$#ing"&ve-ish%\'pointed%$test',
+    '!,l&egrave;che""aa#%mande$%eback%#nca#%pjack#&shband%#gun#&t-pack")ea-bitten%&ridden#%dgeby#)sh-eating&$pink"&ip-top',
+    '"\'ood-hit&#lit$\'r-space%$plan#%rendo$&idante&#ian#%ssing"\'uidized#&orides%(ocarbons"%y-ash$$leaf$+on-the-wall##in\'',
+    '!"me""ol!%oaled"!i"$jcik"\'lk-rock%$song$#man#$tene"&ntware",od-gathering%&supply#(tbridges$$well"$rall',
+    '##ber#\'ce-feed#\'ecloses$(ign-made#\'faiting#&mentor$*ica-topped$"ol%#san#\'nicator#+tune-hunter$/y-five-year-old\',our-year-old##val"+s-core-esqe',
+    '#"co#*ter-father$"on"%ul-up$"er$$ston#-nder-director#&r-acre%%horse%$line\'#tre%%phase%\'speaker%&wicket$)teen-year',
+    '#%croft#$ford#%hound$%unter!#rac#+grance-free#$ncey%.he-comt&eacute%*o-american#+ternisation("ze)#ing$&ricide#)uenkirche#$zers',
+    '"&eakin\'#$demo#(e-format%)of-charge$$base$&lanced$#sia$\'wheeled#$idle#*nch-backed\'(language"$isco#%zzled"$omes$"me',
+    '%(-engined&#man%\'ierland#&u-frou!"si"!u!#uad"#ddy"(el-cycle#*rteventura"%ggers"$kase""le#&l-line%(throated',
+    '%%width$,y-configured&)developed"&migant"&ncoast"%rbush#\'lanetto#&rowing"%saria&"um%"ri"$turo *g&ouml;del\'2tterd&auml;mmerung!$\'day',
+    '!"-2"#man!#.r.!&aastra"$boon"\'eltacht"&gauzes"%i-jin##ley#!s#*t&aacute;n$!s"%lante#"ea$$ries',
+    '#)l-bladder$#ien$"ow#\'umphing"#mba#%ecock$$gear#%inara#-ma-interferon"&ndhara$$olfo#&g-rape)!d$%cults"+r&ccedil;on',
+    '#"ba#&cilaso#%eloch$!s#%ganey#%retta$\'isoning#%tcosh$&hwaite"*s-guzzling$%works#"an#$ohol#\'parovic"(te-house',
+    '$(crashing$$fold$#nby#!h$$erum#-tefoss&eacute"$uden"&vroche""wk"&zumped!%c(at)!&d-dtpa!\'ear-box$"ty"*ddes-brown',
+    '"%lbard#\'denhuys%"rd",m&uuml;tlich"%nappe#$bank#"da$2er-differentiation#&eclean#%tilis$&lemens"#oid#(phagines"*riatrician#,man-american',
+    '$"on#$vais$"er"%sting"%t_out",wurztraminer!&gf-iii!)hettoised"#ose$$ting!+iant-killer"%b\'sea##ran""es$#sen',
+    '"\'gawatts"$lbos$!y#\'lecrist%(rthwaite%!t$!i$#roy""mp""ng"#ral$$sole#"os$(zentrale"+s&egrave;le',
+    '#%audan!,lac&eacute;s#$sgay$%nost\'$\'s-house"%eason#%mnitz#&nastle%"vy$#car%$ross$%field$$head"\'isseuse")obal-mean',
+    '##ire#$mach#$wacz"$ueck$#ing"!x"*ycocholate#$ders!&o-cart#$team"%anese#%tfell")b-smacked#(smacking"%ckley',
+    '#"in#\'mersham#$wine"(ing-over"#lda$%field&#nch$$hawk$$well##eta#&f-ball#!l$%nisch"%mpels")od-enough',
+    '%%value$$burn$#hew#\'sanders"#pal##her"$rden##get#!t"%schen$$inny#%telow"#t_a#$land#&tingen',
+    '",vernment-led!-r&uuml;nstedt"&abbers#(cechurch#$ders$"in##eca#.ft-versus-host#*in-growing#(mmatikos#"na$\'d-daddy%$slam$)ts-in-aid#$phed',
+    '##vid$#ure#&yswood"#eas%#ley#(en-black&%faced%\'finches%$leaf%&mantle&$ount%$ough%%skins&#pot#!p',
+    '"&idford#%fters##mms#\'ttleton"#oby#"en#"nd#&sgrain$$sard%"es%(glockner#*undbaiting#%w-bag"$uchy#+dge-bearing',
+    '!#see"!o!"ts!&udauta"&eldres$#phs#\'st-room%"ed"&gelmin"(idarello##gou##lin$(lotining$*t-inducing##nes',
+    '&!e"%llick"%mming"\'n-metal$$room#"by#$dogs#"ga##nis$!s"$rage#%dwara#%inder"\'tekunst#$mann',
+    '"%zzler!$wala"(endraeth"$indy"$ydir#$llam!(y&ouml;r"%mraeg"\'rfalcon ,h&eacute;ger!%aakon#$land"%bomai"!c"%daway',
+    '"(ematopus$)odynamics%\'rrhaged"#fod"&gstrom"#ida#\'lstorms#&rdrier$!e$%grips"$jime"!k#"an##ims"#led',
+    '%#fit%$rose%\'sitting&\'trength%&timber+#ing&"on&&rained&#urn%*understood#&l-door#!m#&othane#$ters##zen',
+    '#&fisted#(iltonian$#tic#)marskjold##son$$tead"%naper#"by#&d-book%$lens%&mirror%$pump%\'setting$%carts$$list',
+    '#%g-dog$%arage#&kinson#%ratty$#ott#%slick""pu"$rada$%ldsen\'#son$%ngues$$ppan#&courts#.d&rehy;working$)-fighting',
+    '$%anger$$inge$#top$%yment#$even#%icots$%ngton##lan#*ness-maker#&rendle$$ises$%ytown##ton#)vest-time"&segawa',
+    '##sel"\'t-stand#%chett%"li#\'shepsut"$utes"%vanas#"is"&y-loft#\'es-roth"\'zarding#%elden!%d-mac!.ead-scratching$#in\'',
+    '$"on$%rests$%stall\'!y$%water#&hberht#+lth-service#)rtbreaker#(thcliffe%&ertons$&stroke#$vers$(ily-used%$side$(y-footed',
+    '&&weight"(ckington#%tored"%ffers"$hehe"%ifetz##mat##nen"&lenium#\'iconius&&ptered$&skiing#(lenizers$\'raising#)met-plate',
+    '#$sley""na#%ricus")parin-bsa()sepharose#\'haistos")rakleitos$"th#(b-garden$"st#"la#$mano#,o-worshipped#*rerasaurus%%weghe',
+    '##tha#$wald"\'terakis%\'oplasmy#!t"#uga$!h#$reux"#wed"&xalite!&i-gain"%bbard"$ckam"+gh-coloured%$dose',
+    '%(falutin\'&\'idelity%$gain&%rowth%%heels%,productivity%\'revving%\'society&$ugar%#tax$,er-education\'+performance$$life%+y-developed"%lduin',
+    '$%climb%$rest$%tribe"$mera"(nderwell#$shaw#$tons"\'ppisley%!x$\'odameia$$yish"#rsh$&zowicz#$undo"#ssy',
+    '$#run#$list!$mmph!(oebridge#%grass")ffmeister"$gben#%hughi"!h#"ne"\'llyhead%*wood-style#&mewood#!o#$sten',
+    '#"ub#$well#\'y-water".m&oelig;opaths##ais#$bres#"e-%%going%$time$%buyer$&making$(othermic$\'sitters$$wood#\'ophobes',
+    '$&zygote"#ndo#/est-to-goodness$\'ybourne%#man%$pots%\'suckles#&orable"%odies%"ng##fer#!h#"ky#"rn"\'pkinton',
+    '"$rgan##nes$#ton#%robin%!x#&sebere%%flies%$meat##vat"%shino##ier#)t-country"\'tchkiss#\'dogging#&elware',
+    '#\'tentots"&ulihan#\'se-room%%croft%&lights%%mates$)ton-based"\'verport#)hannesyan"#war#"dy"%xd-13!"pa!%siang!&uanghe',
+    '#$evad"$erta#!t"&fbauer"+gger-mugger#%uette"-itzilopochtli"$ldah""ma#&bugged$!y",ndred-dollar#+garian-born*(speaking#%manby',
+    '"#rdy%&-gurdy"%skies#\'sainara")tchinsons#$twil"#ynh!"vo!,yaluronidase"&bridus"%drate$&ometer"\'gienics"$mned"+perodapedon',
+    '#,omagnesaemia$%style$.thesis-testing %i-iii!$base"&ercorp"\'mulator!#cco"#d-8"(e-hockey""pi!)dealizing#%ogram"%le-up"&olises',
+    '!#gcc!$iasa""ic"!p!#jaz!$liac"&l-clad$$made#(ywhacker""og!)maginaire"(bricated"!m#!a#(obilises',
+    '#"la")portunity"#ray!\'n-crowd"%amura""c\'#(hnadamph#$ipit#$lose#\'ulcates""de$)pendiente#!i$%cting#%osuez',
+    '($elle"(elegance",ferotemporal#)ibulation#%lames&#med%-tion-proofing$.uence-peddling#(osystems"%genia#$hams#)ratiation#!y"$itec$&ialise',
+    '"&k-blot#$horn##ing"(ner-ring#\'holders#\'umerate"$serm#%itute##kip#%omuch#\'pecteur"(tellifex\'#tic$.ntion-to-treat$&r-arab',
+    '&&office&%rater%$bred%(connects&&urrent%&estin\'%&ferons%\'jecting%$line%)marriages&\'ediated&)odulation%(nalising%*penetrated%$ring',
+    '&%plate%(observer$&usives"#ula#%ndate"!v#-estment-grade#\'igilate$&trogen"$wood!*onithermie#\'ophores!"pi""ms""oh',
+    '!+r10&ndash;1"\'emonger"#fel"#isa$\'h-style"\'on-free%$shod$#man$$weed"\'radiate!#saf#!i"3chaemia-reperfusion#!o"&kander',
+    '"\'lamique$(nd-based"&mailia##ene"#n\'t"(oleucine#&merase#&therms""pa"$saqs#(ue-based""ug""va!\'t&mdash"(aldesign',
+    '"!d"\'emizing"$haka"&ineris!%ulian!)vanovitch!"wa!&xbuild"%yphal *j&oacute;n!\'\'accuse!&a\'bari"\'ccarino#*k-in-a-box%%knife',
+    '%"rt$$pots"$ffer"#gan#$dish##gar$!s")hn-teller"$kali##obs"&lousie"(miroquai##mes"$ndia##nis',
+    '"\'ponisme"&rndyce##rah$#old"%spers"#ume"%yaben$\'lalitha"%zzers$&master%"en!"cm"!o!"eb""fe',
+    '"$sper#&selton"(t-setter#&ranger"$unes!%helum"!s!#ian"!c"&linski"&notega!"mt!(oannides"\'b-share#&sworth',
+    '"(gjakarta"(hannitsa##ore"%mtien"$nnie"$rden#!g$$inho""su"%tters"#ule#,rney-to-work#!y"&y-ride!#udg',
+    '##ged"$iced#&lliard"%liaca""n.#&ctures#"ey#"id$!o""pe"-stice-general%%nette %k-tel!#.c.!!5',
+    '"$baka##ore""ch"#dir"(hanamoku"$isha"&jiyama"#kap"$llen"%masan#!i#\'lang-ek"#nak#\'dersteg$$yans',
+    '#%taris"&radjic##dus#$paty"#sha$!i$%miris#%zubia"&tsaris#\'unarich$$shki#"ze""ul"#yan!%c-400',
+    '"\'ceciler"#die""ek##pin#!r"#hoe"$llie#$sale#\'vinside"(mmendine#"ps")nnel-maid"%ohane"%ppoch"#res',
+    '#%nigan#"rs#$sley"(stenbaum"%tches#$ones"$uper"&wensis"(yboarded##nas#\'serling#"te!%haing#!s"$elil',
+    '"$orne"\'udayyir!#ian"#bun")ck-boxing$&boxing"%ddin\'%$swap"$evan"!l#$dimo#$lary$(icomaine#&ocreds$%hertz',
+    '"$neth#)g-emperor$%sdown%\'tonians##ley#%tanar"%rcher#%gizia#\'kburton$#eby$$hope#%tland"$ssin#&wahili"%t-bag',
+    '#\'e-maker#&hairon##tay#*zsteinhorn"#zzy!%jetil!&lausen"&eibers$#ner$$tman#$ment$%kosky#$nsch#$stil"(ondykers',
+    '""ub!(napsacks##zko"!e#)e-capping"(itleader"%obbed%#led#&ckhill%#in\'#\'t-count"%utson!$obus""da"%erner',
+    '"%izumi"\'kataylo"!l#$khoz"%minto"&n-tiki#!a#\'drashin#!r#+zertmeister""on""ra##ifi#$ovin#%thaus',
+    '"$toko#!y"%ulash"#vno"%w-tow!&podzro"!r!$raag##der"%ebber#!n"$onos"%ystom!"sc!\'uangchi',
+    '"&dielka"#ffs#%stein"$hnau"#iti"#lin#"on##yab""mi##mel"%nming"&zmitch!"wa!$ynge"\'ongsang',
+    ' )l\'affaire$%rique"%union!)-rhamnose!%.r.t.!#aar"&beling#(our-held&#ist#$tech"\'candona%&ianism#%erate#%kland")dy-friend',
+    '"%fford"(igueglia##rig#*sser-faire"(kas-nucd##ota"%leham#-umi&egrave;re"#mba$#ent#%erton#%miman"&nacane#(d-bridge$!a',
+    '$!e$\'farming$)ing-place$&lubber$(surfaces#)esborough#&gholme$#nau$-uage-teaching)#use,!r%"rs#&sberry#$zone"#ois',
+    '$%steel#(p&eacute$(et-faced$"in"%queur"%salle#*er-printer##ker#"se%!r$$iere$$oing""t.#\'e-1980s%)afternoon',
+    '%*eighteenth%)seventies#-h-and-plaster$$yrus#&ifolia$"sh#$ters$!o"&unders#%rasia$#een%%ntide&$zana#$tner"\'venders',
+    '#&nswood"(ybacking!"bj!#cac#!s"!p!#dds!\'ead-lag$#eth#(f-eating%%stalk##tgs$*herjackets\'\'sellers#(vetaking',
+    '$!s")ft-angled$&hander"&g-side#&uizamo"#hto"\'ipziger"#leu"%mpira"#nno#&tement"&odwald##nce$#tes"%panto',
+    '##per#"ra"%rmoos#$noux##oux")tter-book"#vey##ite#$shin"&wesdon#(is-smith"\'ybourne##sin!"fm!"ia',
+    '"%beron%#tys#*rary-based#*yan-backed"#cht#%orice"*e-detector#"sl"!f#(e-energy&)xperience($ired%)insurance#$t-up"1ghtning-conductor',
+    '""ka"$lium"&minoid$$tada#\'nophila#!y"\'ndenhof$$wall$#zen#%gotto#(kbuilder$!e#"us"&onised""pp',
+    '"2quidity-preference%!n"\'selotte#"te"\'thosols#\'ter-bin\'&strewn$&le-boy#\'urgique"\'ve-born$\'r-bowel"&zaveta!#lay"\'echwedd"$iure',
+    '!"mp!\'oanhead"#bon$\'tomised"%ck-in$$outs"$dore""g2#+ic-chopping##off"&llardy",ng-continued%#day%%grain$(er-range',
+    '$#ney$$ship"#ppy"$rass#$eley##ing#\'ryloads"%sanna#$eley##in\'"*ud-speaker#$gher##sed#\'trouvia"%vatts',
+    '"&w-born$,carbohydrate%%oupon$%floor$\'hanging$%light%%oader$%odour$&paying$#tar$%value$$wing$(yielding##er-&#end',
+    '!#pdl!%s-pcr"!g"$stop!$ubys"$cida$%gnano"\'dington##lum#%ovisi"%ffing"%giato"#ise"#key"&mpfish',
+    '")nch-times"#rie".tchmeenaraidoo#(einising".xembourg-based#%ulyan$&riated!$ybke"$chee$#nis#$idas"!d"+mphadenitis%)oblastoid&)granuloma',
+    '$#nes#)olecithin +m&ouml;ller"(uuml;nch!$.b.e!"60!"82!(a\'badong"&cassar#$eral#%hine-#)rotrichia#&ulatum"$ddie#&urodam',
+    '$"on#\'herally##rit#"ua"\'h-jongg#!u")ine-anjou##rie"#j.-##nun#+ority-owned"#lis#%lorys#%pedar#"tz',
+    '"-n-environment#\'aguense$$sseh$#tee#$cham$$roft$#uso#!d$\'arinate#$etho#\'ge-tout#\'icuring$%feste$#sha#$love',
+    '#%sells#$umit#"ze$!i"#pam#&letoft"%rabou$#tea$%zzoli#$cham&$ntia%#ese&#tto$"ie$$uson',
+    '$"it$$rove$!y##ias#\'jolaine#(ket-type&&eering$"ie#\'malades##ner#%quesa#(schallin#$thus#!v#+yland-based',
+    '#&eratis#%heder%"rs#$lins##ood#(queraded#)s-produce$!e%$uses$"is$"ud#(terminds"#tan#%chday%#men',
+    '$)rializing#\'hematic#&iukhin#+ra-hachette$"uh##tia%#oli$"ox"%uduit#!n$$ders"#ven#"ic")x103-vp16#%imian',
+    '"%ydown#"on#$time""za#!z$%occhi!&babane#$sogo#$tian!"ct#$-adr$"dp!&eanin\'#%thead"\'chanize',
+    '#$dler#!i$"ck$\'evalism$/terranean-style##lam")galopolis"#hew#!r$$abad"%ikles"\'lazzano#\'lencamp$#oul#%stead',
+    '#"zi"/mbrane-spanning#)orialised"%nders$$ozas#"ge#$hirs#%teith$#one"$rcad&!o%!t&!o$&erised$,hant-banking',
+    '#"se$#tam#&tseger#!u"\'sophyll#*sage-based%!m#+ur&eacute;e"(tabolize$$data$&lpoint#&calfes#%ellus#0haemoglobinaemia$#eny',
+    '#\'oprolol#"ra#\'tingham$!y#$zger""um!$glur!"hr!$iaco#(mi-based"&chalis$%elins&$ozzo#$kley#(ro-sized',
+    '%#com\'%ncord%%forge%+sparc-based+"ii%(teaching%$ware"&d-1980$$east$#pay$&square#\'dle-ear\'&ground&$miss&\'sborugh',
+    '#&ianite"$gnet"!h"*lankovitch#%combe#%itari$"us#(k-bottle$%ovici#\'lefiori%!n$!i%#com%(sieverts$$mead',
+    '""ms"*nd-reading$#ham#(i-market$%cells%%linic$%tower##tec%!g"-racle-working#"on"\'s-spelt\'"nt#\'behaves#&called',
+    '#$deed$(irecting#\'ericord%#oni%$vers#!g#*interprets#$kito&!u##sel%#nse$(issipian##tle"(tchinson#$roff',
+    '!"k.!#mmn!&nuchin!*ock-heroic"&derati\'!o%"na##ula""ed"&gollon")hammedans$#ved#!s""id#)sturizing',
+    '##ise$#tor#%lands"%mmsen",ney-grubbing%(changers#&goloid#!i$!t#&oceros%%linic#\'tagnier$&oneros$#ree"#oed',
+    '#&rehead$%field$$sbus"$p-up"%ralee$#thi$#zan#$edon##gul%"nd#*ning-after##pho##rey##tem$!s',
+    '#\'wellham"%ssend#*t-favoured#\'zkowicz")thballing#.ion-perception#%orail#$spur"$ulay#\'ntebank%%leigh#)se-driven%%traps$%tapha"(vie-star',
+    '"&wbrays!"pt!"ro"!t!"se!#tns"!o!,uch-modified%&touted#%ilage#\'krakers%#oss#0opolysaccharides"\'d-caked#$lark',
+    '"%lgrew#$lery#.ti-culturalism&\'megabit&*occupation+#ied&$port&\'subject&\'warhead%\'layered%%phase&%lexer#%verin"%ndell""ra',
+    '##rey"#sem#(ic-drama&&loving$+khochschule#&limeen#%telid"*tang\'ang\'i!"vp!*ycoplasmas"!n"!r"$skow"+thologising 1n&eacute;ouvielle',
+    '!$acne"#ias##doo#"he#%lfile#"ma"#jma"&khodka""ll"%mawar""nd$!a#"ga#"no""os',
+    '%*-terrorism##ita"%sonia#&rallah#&tassia"$tick"!u#!r##tch"&varone#)el-gazing#\'igacion$!s"&zarene!\'ccalman',
+    '""is""oi!,ear-bankrupt%)certainty%%death%%ideal%&record"$ckar#(romundan"-edle-exchange#"la#!m#&thling""ha"!j',
+    '$$dada$*liberalism$)stalinist#\'politan"&philim""ri#)ve-centre\'#ord&*shattering"#sad"\'tanyahu#%herby&$wood#$line\'!s',
+    '"%wburn#$come#&grange#(ly-found#(password#(s-letter$$cast(!s"\'xtworld!#f-m""es""ha"!t!%iblit"*caraguense',
+    '$$tius##ker#"ma"$dden"%ehaus#!n$"te#)wiarowski")ghtlights"&jinska"#kel#$isch$%tenko##ram"%mbler',
+    '"#ne-%%match%$page%&storey$)teen-year$%wells#!g""oc"(trifying##wit##zer"!v!#neb!/o-decompression##fee',
+    '#$hope#$name##tax"&bbling"%ctuid"#gin"+n-absorbent$&client%&ognate&\'mmodity%\'urative$(decision&(generate&(naturing%\'rinking',
+    '&$sion$%greek$\'integer)#rin$%leeds%\'ocality$\'meaning$)occurring%\'riginal$&policy%\'riority&(ocedural$&scheme&\'ientist%*eriousness',
+    '%+olicitation$+therapeutic%+ime-related%%reaty%+urbocharged$%vocal#%woven"$raid#$bank##din##tel$%hedge%%leigh%!s#$walk',
+    '##eir#&talgie"%ttage"(uadhibou"%vacek"(w-closed"#xid""ye!#pap"!o!"rf!&uffin\'"$mero"$rsie"%tbeam',
+    '"#wss!$wrrl!$yali"$mans#$phet%%oides (o&ugrave!$\'the!#(n)!!-!\'akgrove!%beroi"0ject-orientation$!t!&cclude',
+    '"(eanarium!&ddsson"$eons"#job"%orata"#taa!\'ff-beam$&camera$$fore$&target$%world)"er#%icals%\'e-based&,r-councillor',
+    '#$take""is"*ten-quoted!#gis""ni""wo!#ich"$dium"(l-export!#kar"%hrana"$ondo"#uda!&lajade"%d\'uns',
+    '#\'smobile"$mert"&ongapo!$m-45"#ari"$onia"!r#!i!"n\'"%-cost#\'licence(#sed#$type"!a")ce-a-week',
+    '""do"\'e-metre$%paced%$ound$$tier%$rial$"up$&volume&"te"$opko"$tong!"of!$pacs#$line"\'en-palm',
+    '"*inion-poll""ti!)rangutang"$chin"%dains#$onez#"re"&ellana"-ganophosphate"\'ientale#%gines#$onis""ly$%gsson"%phist',
+    '"$sino!"sc##ano"#ier""so"\'termilk#%marks#!p##rog!%takar##nes""if"%openi"&takars##ley',
+    '!&uguiya"*t-numbered$&of-the$$take#\'compete#&erwear#%faced$%ought#&housed#$play#&ranked$!o#$shot$-ide-the-scope!)vamboland',
+    '#%r-35s%)decorated\'\'pendent%&extend%\'flowing%$high&$yped%$rate&&eading\'\'cording\'\'gulated%%sexed&\'implify-#ing$$bear',
+    '$*compensate$&dubbed$%laden$%paint$)qualified$\'reacted$#set$\'trading$%value$$wrap!,wner-trainer!%xnard""os"-ygen-carrying&#ate',
+    '!*\'daytabird"#ien!#(x)!$-atp!#.k.!#102#!3""11!"27"!8!#a-o"!."$asio"#bst##xes',
+    '#$base#)e-setting$&making#&ifique#\'khorses"\'ddocked"#ets"\'ginated"%haska"&ideuma#%rwork"%kamac"$lach$)eoclimate&\'ecology',
+    '$$iret$$ndri#%imony#(l-bearer#\'m-frond$#eri%#tte$%olive"$ncks#&ettone#$hard#&tyhose#$zers"\'per-bag&%round',
+    '"#r-3%!s#\'a-medic$%basis%%oloid$%crine$*llelograms#"ch%#ing$$ours#"ee$#rga$$tian##fit#%isien',
+    '$$hill##lez#\'migiani)!o#"ot%"id##red#+t-of-speech%\'writing$%henos$3icipant-observation&(ularized$\'ly-paid"$ssau$$ione',
+    '#)ture-land")tch-based##ino#$naik#\'rouille#+tern-making#"wa"$vane".y-as-you-drive+$earn#%ables#%check##ola#%sanne"#zzi',
+    '!+c-interface#&ometer!#dge!*eace-maker$%htree%"um#$fowl#"le$!l#)seblossom#\'t-based"+cking-order"\'derasts#(unculate"&ekaboo',
+    '#&p-show#&resses$"ie"&intres"(l&eacute#,je&scaron;ac#+l&eacute;as$!e$!s#)s-leusden"/mberton-billing"&nalosa#%drich#\'friends##ini',
+    '##nel$%yland##pal##rod#&seroso$%temon#&taline$%iford"&opling"$pler"(r-second#)adventure#&borate#-ceptual-motor##dix',
+    '$&landra#)ipatetics#%mutit##ots#%petua#"ri##sei$\'istance$)onalising#%ugino$"tz"$skin"&tanque#%erkin#$hick',
+    '%\'grapher%%ssian##ter$(y-minded"-ut-&ecirc;tre!%forta!$gces"!s!*h-changing"&agemid#+ntasmagoric##ray#\'sing-in"$enix$)omenalist',
+    '#(lhellene$&ippino#$neas#!z""ol$!y#\'necalls#)sphatidyl&,otransferase(\'yrosine#%to-cd\'%opier)!y*#ing&"me',
+    '%%meter%,synthesising-"ze%*typesetter"\'ragmata#\'ynichos"\'ut-phut"\'ylakopi$+loxera-free!(icadilly#%cinni%$otto#,ture-framing"&emonte#&rrette',
+    '$(sticking#!g$"ed$$otts#\'mentosa$!y"!i""ma"\'nafores$"rd##eda#&ioning#(k-tipped"%oline"%pchin',
+    '"&t-lane#(keathley##ton!"kf"$lite!)lagiarize#*in-looking$$ster##nit$(t-eating%&astics%"es#(sticised##ten$"on',
+    '#\'y-group$&acting$#day%"oh$%goers$(ing-time$%power")ecostomus#"na"%uming$$mers##ton#%vinel"$ynus!"mg',
+    '"$euma!+ocket-watch#"us"$dger#&ospora##zol"(gorelich""in$$ding"!k#$hara"(le-lathe#$hill#(itbureau%%icize',
+    '#%lards#\'ovtsian#*y-l-lysine$(butylene$&euktos$&filter$/merase-promoter$&phemus$&ripple$#sar%&orbate$(tonality"$mbal""nc#%dweed',
+    '+!s%"ne"#ofy#(r-relief%%world##vey"%p-eye#(ieluszko##olo""ra#"ot#+phyry-style##she#(takabins$\'erhouse',
+    '$\'lington"$sada#)itive-sum#&olskii#&t-1976%$coup&$rash%%haste&"cg%)interview%-privatisation\'(ocessing%&reform\'(volution%+termination',
+    '$\'classic%$oded$,script-based$%ulant"&t-hole##een""un$%dages##rer"$voas")wder-blue\'$puff&$hall#%er-on&(struggle',
+    '%$pack%%shift##ney"(xviruses!"pf"!k!-r&auml;sidium"(aemunire#$nces$#ged#"ps#$ting$#zen#\'yer-rug"\'e-adult',
+    '$*commitment(%unist&(nfigured&(pernican%"um$\'existed$#med$$pack$$show$\'theatre#\'ceeding%%pting$$iosa$)ontracted#(fectures',
+    '#&loaded#)maxillary#\'planned$&rinted#)recording#\'sidente#$tale#)varicates$%erbal$$isla"(ice-list#$mero$#mer#!n$&celing',
+    '$(t-making&#run#$pyat#%soned#%tzker#%vate-()placement#*zefighting",o-capitalist$*republican#)blematize#\'caccini%"se$!e$&onsuls',
+    '#*dder-armed\'!s#%faned$%erred%-ssion-centred*,ally-trained$*it-seeking$#orm#&graded&,m-to-program#+jectionists##man$&enaded%%thean$"ix',
+    '#&ntosil#)of-reader$$psie#(pitiated)#ing#(scribing$\'elytize$&logion$!y#&tamine$\'ectress%%inoid$)ocerebral%)geometric$#ura',
+    '"$utec$!h")yse-jones"(zeworski!&s\'soft"#sst"+ychoanalyse&%logie&*physiology&!s!)terygotes"!l"#sob""yr!+ublic-order',
+    '"#ffa"&gliese"\'hlhofer"(lcinella#$grum"&nchard"(rgatorio#%nells#(ple-blue($rown%#ing""sc#$hell$$tuns#$tule',
+    '#\'refying#%tered!"vt!"wa!$yman"%rrhus"#tle"#xis!!z &q-beta!"10!!5!%assam"%ttara!"eh',
+    '!"is!"mh!$u\'il#"on")adrangles%%illes%(uplicate#"in#"li#$ntel#/rter-wavelength\'%maine#+si-contract%$modo"%eneau',
+    '$$ipel##sne$+tion-answer#)tzalcoatl"&ilters#+nt&iacute;n%%ilian$"ze#\'stgaard#&verful#!x""oi#$rate +r4400-based!/74(1&ndash;435)',
+    '!+a&scaron;ka"#bar#$krin"-ck-and-pinion",dio-tracking%$nics#%waste"&famacs#%eedie$$lski"%ggers#%narok"!h"%ichle#$dtec',
+    '$&wayana#%n-hit$%bowed"#jih"%khmon""me##ify"$ndal$#les#*ge-topping#!s"#pin#(porteurs"&rified""se',
+    '#%taman#"ul"\'t-faced#&cheted#*e-limiting#"iu#!t"$vana#"ey"&wlplug"%y-gun#%monda"(zor-wire%$bill!"cl',
+    '!"df!*e-adjusted$)fforested$(ssessing#\'compile#*decorating$%irect%)stributed$\'rafting#$edit#(focusing#(imported$(nstalled##lay#&naming',
+    '$(rogramme#&record#$seal%%tting$$hape$#ite\'!d$\'tarting%#ock%#udy$&urface#$test\'"ed$%iling#\'visited',
+    '"\'ad-outs$\'dressed$(ing-room$%opted$$shaw$(y-cooked&%mades\'"ix#)llocating$"os$$time#$mhar#\'r-drive"!b"/cently-acquired',
+    '#,ommissioning%%posed$\'nfigure+!d%&tacted#(yclables"&d-tape#$caps#%dings#&handed#(isplayed%(tricting#$poll#*uced-sugar"$eder',
+    '#\'perbahn#\'valuate"\'feeding#%lexed$"ow#*ormatories#*rigerating#&ulgent$%nding""ga##ini#&rowing##ula",ichsrundfunk#(mbursing',
+    '$)tegrating&$rred$*vigorating#&ssland")labelling##com#!f#\'igieuse$#ned#"ph"&manent$%rries#%ixers"/naissance-style#"ko',
+    '#$nies#$oirs$"so")organises"\'packing$#ved#&ington#*licability#(opulated#&ricing#&ublica"\'quester%(t&eacute$$iems"!r',
+    '#$ende#(istencia$#zed%#ing#!o#&t-room$#ano%\'tements$#rop#\'urfaces"(taliates$&rdants#&esting#&hymnon#"ir',
+    '##tig#%yping"$vans#\'counter#!e$#rdy#+olutionibus+$zing"$wald#&rapped"%xroth"#zia#(nichenko!"fp!*hapsodised',
+    '")einschild%$zink#"um"%ianon##nns"\'odamine#%mboid#$sili##tic""yd##mer!&icalde#&hafort#"in#$kaby',
+    '"\'dgeback"#egl%!e$!o"$ght\'%\'-footed#$unth"!i"%koran"#nso"(os-based"%vacre#+er-crossing%#bus!#lpo',
+    '!,oad-widening&$orks"$bbia#"er%%tshaw##leh#$usta""ce#%khart$(umentary"(dborough#&dymoor#%olphe""es"%gered',
+    '"\'le-slot#%lered"\'manesca%&ticise%"us"&ncraft#$deau#%eo-ed#"ke#!s"(of-space#\'t-index$#ham"#rke"&scheck',
+    ')#ing#$sler"&tatory#\'hamsted$#orn"\'ubanova#%melia#)nd-backed%%table&#ree##sse$!t#)tefinding$#ier"$wand',
+    '#(ing-boat"%xanna"%yscot""za##zer!"rl"!s!$sdlp""so!"th!%ubery#!i")ckelshaus%!r&!s',
+    '"%ffini"%inart$!g"&mbaugh"-nning-account($shed##out##yon"%scote#\'hbrooke#*sian-style%$fied$#olo#&ticana""ta',
+    '!$yden$"rs"%strom"$voan -s&eacute;jour"\'ouml;ll!\'\'amfora"&xpress!!-"%phase!&abally#+re-rattling&%tooth"$ceur"(ddle-bag',
+    '&$back##ock"$ebbi#&nredam"%feall$(ty-chain##ina"%g-bag#%arika#%ittal\'#ria"$ibol##fur#%llard"#ker',
+    '"\'lagamas$#lah$"ng$"ud#"is#!o$&lainen#\'t-marsh$$cake$"on#"ud#\'vadores$#ian"%mater#%bucus',
+    '"/nctions-busting#&d-dune$$away$#ell$&plover$%ridge$%yport#%galla$*r&iacute;a$\'uinetti#)itisation#&ssouci"$psan"%rgood#!l',
+    '"#sse"\'tirised"$uber#\'cissons#%nters"$vall#$igny#$oldo$&narola"%wston"$xena""yd!"bd!#caa#$cchi',
+    '#(ndal-hit##rfs"&eptred"&hatten#%ecter$%idegg&!t$$ndel$!r%$ings##ine$(stocerca\'%somes#&leswig$&iemann',
+    '$$uter#\'meisser$$inke#\'neerson%"id#$oltz#%reber%$iner%#mpp#(warzhelm"-ience-related#$ndia$\'tillate#)ssorhands""la',
+    '"$oble#"da#"le#+rched-earth#$tbis$)tish-born($ness#(utmaster""pr"(ratchley$#wly#*eamadelica$&enshow$$wtop#%ibner',
+    '$*pt-writing$&vening#$ummy#$ying"&umbled"%weams"#yld!*ea-bathing$#god#%floor#%grove#&horses#$ldah#(rchtools"(bastiane',
+    '""ck#*ond-choice\'(guessing\'*lieutenant#(retarius&!t"#dex"\'ed-corn#%pages#$saws"#gre%%gates"%i-sen#%ffert#!l',
+    '#&bourne#&ectron#/f-assertiveness%(citation%+exploration%\'heating%+instruction\'(vestment%*lacerating%,organisation+#zed%&praise\'&oduced%-recrimination\'%newal',
+    '\'$ward%\'tanning$(catering$!e#$l-on##man"&matech##ele#&i-free%&liquid%)synthetic$!e$&narian#(pringham"%nsate',
+    '$"us#,timentalized"#pon""re#%iatim#&jeanty#$plan#"rl""ta##tis##zer"(ven-mile&%piece&&wicket%#ty-',
+    '")x-related$&symbol"$ydou#(hulislam#%mours##val"\'zession#!s!%garbi""or!&haanxi#!c#)de-loving$%owfax##fto',
+    '#&mbhala$"il#%ndell$"ey$"ny$&tytown#+re-cropping%&dealer$#i\'a$)p-pointed"&chukin"$eahy$!n$#ved#$chem',
+    '##eba$"ne$%p-pen$$ring%"ly$\'t-metal#\'isshaus#(lf-space%#old$&l-less#\'nandoah$#ton#%rbets%%rooke$!i',
+    '%)ff-depute#!z"%ibden#%kotan#!m$!i#$ppen#)rt-sleeve%&sleeve#$tbag#"ve$$ling"%oaled##lto#"me',
+    '#\'re-line%$ward$$rock$+t-barrelled%%heath#+ulder-blade&"st#%wboat"&rimper%$sley#\'ovetide"$tetl"&umeiko!&iamang"*c&agrave;n',
+    '#%dique#%e-arm%#car%$foot%$room%\'to-side$&winder"#ebe#!w##zed"+gglesthorne#(htscreen#&maplot##nac"%htric',
+    '$%jdzic##ius#&libubs##van$(er-store\'&tipped&&y-grey%$stre"&mazine#"es#"mo##ond%$escu#&plicio"*ngle-ended',
+    '(\'ovement&)ton-green#!h"%pcott#"le"$rdar#"et##han#%imavo$"ng$!s"$ssie""ta"$vell"(x-footer',
+    '#(th-floor!&jogren!)k&aring;l"(aftafell"!b"#ene#&tchley#&wering"&i-jump$%slope%#uit#%llery#$plam#%rling"&yscape',
+    '#!c#&thered#,ughter-house#\'vophile"#ejf"$iema##gos#%ngers#&p-road$&pering"&obbery$!o#$ughs#\'wly-run!#mac',
+    '#+ll-diameter&$firm&&screen#\'rt-alec\'"ss%$link&)y-dressed"!e"!h"&ocking#+ke-belching$#ies#&ulders")urthwaite!)nailbeach',
+    '""ee#%inton#&lgrove"&ickers#&velled")ow-plough$%field$&mobile$$shoe!\'oap-box"#bel",cial-welfare%"ux$)et&eacute"(derstrom',
+    '"$faer#$fits#(t-footed%&headed$#key$*ware-based"$gono"-kolovi&cacute"%laced$$glas$#ire$#nge%!o#(der-ring#%eiman',
+    '#%icits$(dasarock##tan#)vent-free(&welded,#ing"%mbart#%efing$$thin#$meil"%neryl#%g-dam#$ntag"(ot-black$#her',
+    '#"el"(togrande$%mayor"(und-bite&%proof#\'r-faced#(th-south%$fork%#met%#way"!v"%zzled!&paight#$ngly#%rcard',
+    '%"le$#kie#&tulate"%d-fdp"\'eakeasy##ccy$%kling$+tragraphics#%edfit#$rzel#"ws""ic##ess##ggy#%ndler',
+    '$#rad%#ite##rin#$tted"$lats$"ys##ine""od#)rtspeople#%tland"*ring-clean\'&summer%$kles"\'y-glass!-quare-bashing',
+    '\'*shouldered#$idge$$shed!$r-71"%inath"!l!"ss!#t.g"$adio#)ge-diving$(ing-post$!y#&irlift#&ke-out$(hanovite',
+    '$\'oluokta$$wort#$nden$#nah#!p$$lers##rck$%gazer$"re$&struck$$trac#%shing#)te-backed&\'pension$&ioneri',
+    '%.s&mdash;return#(y-behind$&thorpe"$eama##cca#"hr#&iglitz#&lazine$#ler#\'rnlicht#&venton",icking-point%#ley#)ff-backed%!y',
+    '##lle%$well##nko#"rk#!t"\'ojkovic#"lz#)nethwaite#&p-loss#\'refront##ved#$wood"%racar$(divarius$"ss',
+    '#)eptococci$\'ssholme#!i$!d%"er$$eber$%kland#)ong-armed##uth#$ydom"#umm#"re$\'minster")ylesetter!$u-25',
+    '#%clone$\'ropping#%dural#(grouping#(littoral#%merse#*salicylate$!t"&ccours#%klers##res""da#%irman"+ffolk-based"$lman',
+    '##zer"$mach#$eria#$mate$%ering&#lee##ter"\'n-cream#&bather$$lest$%ursts#$daes$&erbans#$lust##man',
+    '#(spectrum#&vision"!o"$per-&%giant%&barrio&$ikes%\'couloir&"ut%(families&#ile\'#nal&$luid%%janet%$lead',
+    '%#net&#ode%)phosphate&(ipelined%&savers&*parc-based&$trat%$tips&#ram\'"im#(per-time$%lants%0ementary-benefit%%icius#-ra-individual',
+    '$$emes"-re-footedness$$seam#-face-mounting#,geon-general#%inder##jit#$tsey",spiciousness#)quehannah##ter"#var!)viridenko!*wadlincote#%ggart',
+    '##leh#"my#(n-upping$"ee""ds"+eat-stained#\'et-shop&\'tasting\'\'empered%$lips#&ltered"%igert##lls#\'ng-seat$&nerton',
+    '"$oosh#\'rd-hilt"!p"!r!"ya"!b#%arite"*dney-based""lv"$meon#&metrix\')y-related"%nfuel#%tagma At&eacute;l&eacute;ph&eacute;rique',
+    '!$abac#$iner#"un"&djoura#$orna"&ilboom$#fin"(ken-over"&lavera#"er#$lage$$ulah#$ulah"\'mazapam#$bini',
+    '$#sin#$pers$#ing""na#!n$"en"$oism")p-tapping$%water##ley""qi"\'roudant##sal#$tary"#tin',
+    '#%reans$!o"%vener",x-collecting$&relief#&i-rank#"ol#&paying"#yif"#zio!&c-dtpa#"lc""dd!&ea-boy$$cosy',
+    '#(m-member%\'working$$ware##sel##zle"(chnische%-ology-related#"ks"\'es-side$%watch""gl"#ign#"nt#$psum"#koa',
+    '#*eprocessor$%vison"\'mperley$#ore&%izing"(n-storey#\'derloin#&ebrous#%penny#\'sioning"&rabyte#+minal-based#%rassa\'!e%!y',
+    '"#sla#\'selmann#,t&mdash;mode$%-best%%curve"#ton"%utons"$xels#,t-processing!%fiiia"!t!#gf-!/h&eacute;ophile"\'\'should"$akur',
+    '#(t-clause#$vies"(eakstons#$ekit$!s##kla##mis$!s#(rmopylae#%spiai#\'udebald"+iabendazole#$eved#(rd-place$\'ty-mile',
+    '"\'ondaman#$rley$(ngumbald%$less#&ughout$+sand-dollar"(ree-acre(!t&%field&%horse&!o&$room&%score&(terminal("st',
+    '&%wheel$$nody$%onine#\'ow-over"!t",underflashes#$rgau!$iaan""ce#\'kertape%+t-collector$!y"%ddler#&e-line#%swell',
+    '"*ght-packed%+rope-walker#$rett"$lery"%mbrel#&e-lock%%saver&#lot&&tretch(&ucture%&window$$plex$&shares#!i#$mons',
+    '#"ka#$nock#!o"\'ppe-top"$rage#$eder"%sanes#)sue-typed#"za"%t-bit#%aghur#*le-winning##mus"!x!$m-13',
+    '"!s!\'o&mdash"!b"%e-rag$\'sucking$\'tapping"\'gliatti"$hian"%ksvig"#lka#&lcross#$stoi"&mislav#$sk-7"+ne-painting',
+    '#"ya"$ohey#"ke%!y#%l-box%%using$%chest"&p-coat$&weight#$kapi#\'ping-up"%rbrex#$phin$$oint#&quatus',
+    '#"ry#$tola$#rix$!y#%y-run"(talising#!h"(uch-down&$tone%&screen#+gh-tackling#$lmin"&varich"(wn-house$"er',
+    '!"pi"!u!-r&eacute;pail"+ace-element$(k-record%&suited$(tability#,dicionalista#,ffic-related#*in-spotter%$glot#(nsbinary%%ected%&fixing&\'rontier',
+    '%&vision#$tsch#&velers&$mate"\'ee-bark%\'creeper$%beard$%lined##for#$itel#"la#&maynes#(ndlewood$%holme##sor',
+    '$%nguli("um#(choptera&+strongyloid#&estino##gat#$nzic#\'partism#$tsch#\'vandrum#!x"!l""oc##fin#"ke',
+    '#*phectoderm"%udges#&e-life$&vision##ing#%sties!$seep#"mi""oy!"tf"!i!%ucano")dor-style"#fte"\'igamala',
+    '"$lipa##ley$"oh##yar"*mble-drier"&ngsram#"ku"&randot#%cotte##got#!i#$meau#"vy"%stian"#tty',
+    '!*welve-page\'$year#-nty-five-year\',two-year-old"&igging#"n\'$$ings#"ss#%tters")o-control$&letter$&member$)parameter&"ss$%state',
+    '#(year-old"$yman!%ybalt",neside-based"$pe-a"*therington "u_!"bc!$claf"!w!&dalric"#din""ex!"es!#gms',
+    '!#lay"(lathorne#!o")tra-light!\'manskii"&hausen!*n-american#*controlled#\'noticed"$amic"\'capping#%lench$"os##ork&#ing',
+    '&(equipped&)populated\'\'rovided&\'trained%#fur%\'girding%&paying&\'lanting"$fdac"%human"#iao#!e#.fication-based#+lluminating#$scan',
+    '#+versalizing\')it&auml;t"$kept#\'notting"$laid#\'earning"%mould"+neighbourly"(punctual$)tdownable"!r#&eeling#$olls"&screws#"er',
+    '#%trung$$uffy"%taken#&hought##ill"#zen!\'p-dates#&stream""as"$load"&meadow"\'permill"$rona"$sall#$tair',
+    '"&chfont"#gel"$tica"&ubamba!*s-canadian""ac""cg"!d"&er-led\'#vel%)specified"!h"!n#!o"$suri',
+    '!$tton"!u!$ygur ,v&eacute;lez!#.w.!*accinating("or#&illate""ir"&ladier$"is#$dano#%ences#$lely#*ue-science',
+    '"$nanu#"ek#"ne#$uata"&ranasi##dar#"io#!n#)vitsiotis"\'sareley%%helyi##ile#&tatrix#$ulka"#tra',
+    '!\'egetate##uer"#ing""ka"%lasca#&chanos#(janovski#!l$!a#!o$"so##zen"&nation#\'ceremos#*d&eacute;e',
+    '%&uelans#,gs&oslash;ya##ter"&rneuil#%plank#\'se-form"!s#%tigia"%tches!$g-15!\'iaticum"\'broverb"+cchiomaggio#$e-ch#&timise',
+    '%#fit%&taping##ipc"(erchowod$"ge#"tt#(wfinders"!g##ier""ki"+llage-based%%nelle$$eroy"\'ndiciae$&olanda',
+    '#"ho#*tage-style"%rchow##tus"\'scontis%$unty#\'ionhire#\'ualises!%lachy#(dikavkaz!!n!&obster"!c#)alization"(gelstein',
+    '"%lante#\'uptuary"(ndelpark#$etta"(okodlaks#%rhies""ra#\'ontseff#&sprung")te-buying%&winner)#ing"$ught"#xes!"pe',
+    '#!s!#sat""oe#!p!#tam""ol!\'ulliamy#"so!#wag #w10!"ac"%ffler"%ggles#$land#$oner',
+    '"$iler#$sale$\'t-level%%lines"\'kenshaw"%llies$#ows$#raf##she""n\'""r-$#god$%horse$&leader$#tax',
+    '##cup#%leigh#\'m-water$%onger#$ndon##ouw#%rilow""sa#!n#"sa"&tchin\'%\'keeping##er-&\'buffalo&$hole',
+    '%$buck%%kloof%$park&&roofer%%stock%%world##man$%oughs#&tisham"!u"(vefronts$#lan"%xwing!#e\'d"%e-wee',
+    '#)k-by-week##ner#$ting"&ighell%(t-saving#+ssbr&auml;u"#ll\'$)-dressing%*entrenched%\'lighted%,orchestrated%(packaged%(recorded%\'studied%\'wrought',
+    '""nn"+st-european$%combe$(ernizers$(houghton$#rup$!s"$xler!&hacker#*t\'s-a-name\'(his-name$#cha"%eater%%lands#&elslip',
+    '#\'reabout"\'ickered\'#ing#$nged$&latter#!r#$shaw$%tlers#*te-and-red&$gold%$beam%&headed%$spot#%z-kid"(o-dun-it',
+    '%&grains!-icket-keeping&\'keeping"$ddel$#ows#&e-area%#boy%(reaching$%awake#$geon"$eman#\'niawski#\'rzbicka#$slaw"#fes',
+    '$!y#%heard"%ldish#$lats$$ison"\'ndebank$)ows-style#%fried#*g-membrane$$eing#&nebago"*re-tapping"(shplants#%smann""t\'',
+    '$#ies%)n-subject$!y##kin##ted%!t"#xom""zz!#log!%o-man"!2"$dges"\'jtowicz"&lfhead$#ord',
+    '##ley#&viston".man-identified"(nderwest"(od-based&$lock&%oring%$lice%%store$(carvings%6hester/gloucestershire$#fit%#ull$#ing$%land.',
+    '$&thorpe$%worth#"er#$fers#%lpack"#rby#*d-meanings%\'setting$!e$%iness$"ly$&smiths##gan#\'k-bench%(reddened',
+    '%%table%$worn$*bench/6000%#oat$#flo$$ing-$(man-like$%plans$&spaces%$tart\'*tion-based&$ream#(ld-scale\'&haking)\'ttering',
+    '%"er$(ingworth#+mserstrasse#%riers#0se-than-expected$$teds"#tan#$sits"\'undings!#r14"!a#!f#%ngled#"pp%)ing-paper',
+    '#!x"#ily##sty#,te-protected%%downs"!n"(ong-foot%&footed"%yneck%"ss!"sl!$t/wt!#ulf$$geat""nt',
+    '"#rly#"tz!%w/may"!1"!2!!y"&chavon#&liffes"%evale"#kes""le$!r"%mbush"#nds#)ne-morgan',
+    ' %x-amp##xis"*cellerator")direction"&linked"\'station!"12!%69115!!8!"a7"$nten$%hippe"$puri"#ver!$ciii',
+    '"#dos"%nofon!"g5!"h8!$iang"$ii\'s"%onics"$rcom!$k488!"ms!&oliswa!"p2"$338p!*q21.3-xq22!"r2',
+    '!\'station!"ud!$xxix#$viii $y\'ar"*fiprehaude#$rike!(-located!#321!,a/33/25/0046""ar""ik"#kka"%lding"$mada',
+    '$$zaki"&nomamo##tra"#ppy"(rborough#%d-arm%$long$$land#$rell$&ington""ss"%t-sen#"ra!$ear\'$%-book',
+    '$!e"$llen$*ow-bellied\'&orange&&/green&$legs"$mens"&nilmez"(rushalmy"$s-no"(tminster"\'vgeniev#$onde!!f!%idana',
+    '""ns"%sroel!\'o-ho-ho"!1"!h""mp"$nson".rk-bournemouth$"ed##vik"\'shiyama#"si"&ungers#&rcenar""yo',
+    '"%gubor"!l"(terplaat##rad&\'gynlais!(tterbium"!v!"ub"$ille""ki"(mjaagiyn"#riy"#val!%vetot 0z&eacute;phirine',
+    '")direction"&scores!!a"#bat"&dokite"%ghlul#!s"\'kynthos"\'mberlan"$ndra"(ssoursky!+ealand-born")itschrift"#lia##mer',
+    '"&maitis$!n#"un"%ngpei#%ithal"%phyrs"\'ro-beta%(crossing"#sty!!f!%hanna!#ike"#man"%nging"!t',
+    '!%nf37b!(oanthids"&diaque""ia"#lot"#mba"#nae"*ologically"#ran#"na!!s"$ofia!,u&ntilde;iga"$cker"!g',
+    '!&vereva"&onimir!&winger!"zt"!z',
 )
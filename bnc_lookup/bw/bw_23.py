@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_23 = (
+count_23 = 6694
+
+heads_23 = (
     '9.8.0',
-    '9.83',
-    '90&deg;c',
-    '90&ndash;100',
-    '90-second',
-    '90/greens',
-    '9021',
-    '9030',
-    '91&ndash;92',
-    '92&frac12&deg',
-    '92(1)',
-    '92.5',
-    '92/93',
-    '92355',
-    '93&ndash;4',
-    '93(1)',
     '93.5%',
-    '93.7%',
-    '930303',
-    '939',
-    '94.6',
-    '9466',
-    '95&ndash;6',
-    '95.6',
-    '96-well',
-    '96.2',
-    '960s',
-    '96mph',
-    '96pp',
-    '97p',
-    '980b',
-    '981',
     '983/1575',
-    '98pc',
-    '99&ndash;100',
-    '99.8',
-    '996',
-    '99pc',
-    '99th',
-    '9:2',
-    '9fl',
-    '9jt',
-    '9jy',
-    '9ld',
-    '9nl',
-    '9ozs',
-    '=100',
-    '=e',
     'a&dollar;1',
-    'a&dollar;100,000',
-    'a&dollar;8billion',
-    'a&mdash;1',
-    'a-particles',
-    'a.861',
-    'a.k.a.',
-    'a.l.r.',
-    'a.p.c.m.',
-    'a.q.',
-    'a/16/25/0000',
-    'a/v',
-    'a204',
-    'a21',
-    'a214',
-    'a340',
     'a427',
-    'a49',
-    'a494',
-    'a59',
-    'a591',
-    'a684',
-    'a92',
-    'aamodt',
-    'abbasi',
-    'abbell',
-    'abdal&aacute',
-    'abdel-aziz',
-    'abdelaziz',
-    'abdi&cacute',
-    'abdollah',
-    'abductees',
     'abductive',
-    'abdulai',
-    'abessolo',
-    'abler',
-    'abouts',
-    'abril',
-    'abrogates',
-    'absamat',
-    'absconders',
-    'absi',
-    'absurdism',
-    'abysm',
-    'acadians',
-    'acceptation',
-    'accommodative',
-    'acconci',
     'accountably',
-    'accreditations',
-    'acetabulum',
-    'achaemenids',
-    'achenbach',
-    'achr&agr',
-    'acid/g',
-    'acquisitional',
-    'acris',
-    'across-the-curriculum',
-    'acted-out',
-    'actin-binding',
-    'actinides',
-    'action-orientated',
-    'activity-dependent',
-    'acuminatum',
     'acuta',
-    'ad4',
-    'ad_',
-    'adamafio',
-    'adderbury',
-    'adderley',
-    'addie',
-    'adducts/10',
-    'adenylyl',
-    'adhesins',
-    'adlayer',
-    'administrative-judicial',
-    'adra',
-    'adrenoceptor',
-    'adriamycin',
-    'ads/3000',
     'adspersus',
-    'adumbration',
-    'advisee',
-    'aelfwine',
-    'aequidens',
-    'aerodynamicist',
-    'aerolineas',
-    'af1',
-    'affordably',
-    'ag.',
-    'agache',
-    'agenda.',
-    'agentless',
-    'agents.',
-    'agggccctagaggggccctag',
-    'agglestone',
     'aggregative',
-    'aggregatory',
-    'aggrievedly',
-    'agist',
-    'agnos',
-    'agonistic',
-    'aguas',
-    'aguilera',
-    'ahah',
-    'ahlquist',
-    'ahmadis',
-    'ahmedi',
-    'aias',
-    'aides-de-camp',
-    'aids-like',
-    'air-dry',
     'air-holes',
-    'air-powered',
-    'air-waves',
-    'air/ground',
-    'airiness',
-    'airmanship',
-    'airwoman',
-    'aisbitt',
-    'aisleless',
-    'aiton',
-    'akame',
-    'akhaimenes',
-    'akida',
-    'akos',
-    'al-abidine',
-    'al-aksarayi',
     'al-aziz',
-    'al-fenari',
-    'al-ghazal',
-    'al-iryani',
-    'al-islami',
-    'al-mahgoub',
-    'al-quds',
-    'al-sanusi',
-    'al-zubaydi',
-    'alarielle',
-    'alawite',
-    'albanaid',
-    'albrighton',
-    'album.',
-    'albumin:creatinine',
-    'alchfrith',
     'aldbrough',
-    'alderbury',
-    'aldermary',
-    'aldersley',
-    'aldford',
-    'aldrovandi',
-    'aldworth',
-    'alechinsky',
-    'aleka',
-    'aleutians',
-    'alexandrovich',
-    'alexeev',
-    'alexey',
-    'alfonsists',
-    'alginates',
-    'algol-type',
     'alimentarius',
-    'alirio',
-    'aliyev',
-    'alka',
-    'alkanols',
-    'all-correct',
-    'all-expenses',
-    'all-valve',
-    'allegan',
-    'allegoric',
-    'allergist',
-    'allertonshire',
-    'allocators',
-    'allotropes',
-    'allots',
-    'allworthy',
     'allyn',
-    'alocentric',
-    'alpha-numeric',
-    'alpinism',
-    'altens',
-    'altesse',
-    'altitudinal',
-    'altstadt',
-    'aluminate',
-    'alwight',
-    'alyce-faye',
-    'amalia',
-    'amellus',
-    'americain',
-    'amniote',
-    'amoebas',
     'amoebic',
-    'amorites',
-    'amourette',
-    'amoxicillin/omeprazole',
-    'ampullary',
-    'amstad',
-    'anagogical',
-    'analagous',
-    'analytes',
-    'anatol',
-    'anciens',
-    'and_a',
-    'and_and_so_on',
-    'and_in',
-    'andantino',
-    'andovers',
     'angleside',
-    'angleton',
-    'anglophiles',
-    'angustifolius',
-    'anicia',
-    'anka',
-    'ankober',
-    'annetwell',
-    'anointment',
-    'anomalocariids',
-    'anorthosite',
-    'answers/argument',
-    'antaeus',
-    'ante-rooms',
-    'antecedently',
-    'antenatally',
     'anti-aa',
-    'anti-albanian',
-    'anti-authoritarian',
-    'anti-europeans',
-    'anti-feminists',
-    'anti-fos',
-    'anti-h',
-    'anti-hippy',
-    'anti-hungarian',
-    'anti-jun',
-    'anti-lewis',
-    'anti-logging',
-    'anti-microbial',
-    'anti-noriega',
-    'anti-perspirants',
-    'anti-police',
     'anti-spartan',
-    'anti-symmetric',
-    'anti-turkish',
-    'anti-unionists',
-    'anti-white',
-    'antiaggregatory',
-    'antidiarrhoeal',
-    'antidisestablishmentarianism',
-    'antigen-1',
-    'antigen-specific',
-    'antinatriuretic',
-    'antiparasite',
-    'antivivisection',
-    'anusavice',
-    'anxious-looking',
-    'aotearoa/new',
     'ap-1',
-    'aparicio',
-    'apck3',
-    'apine',
-    'apistos',
-    'apodis',
-    'apolar',
-    'apollos',
-    'apophis',
-    'apoproteins',
-    'aposematism',
-    'appetizer',
-    'applebank',
-    'applejack',
-    'applescript',
-    'apprehensiveness',
     'approved-by',
-    'apterous',
-    'apto',
-    'apulian',
-    'aquality',
-    'aqualung',
-    'aquaware',
-    'aquitainian',
-    'arc-lamps',
-    'arc-lights',
-    'arc-like',
-    'arcadians',
-    'arch-enemies',
-    'archaebacterial',
-    'archetypally',
-    'arctic-alpine',
     'ardboe',
-    'ardebil',
-    'ardentes',
-    'ardersier',
-    'arduously',
-    'area(s)',
-    'arete',
-    'arguement',
-    'arils',
-    'armatrading',
-    'armatus',
-    'armenian-populated',
-    'armistead',
-    'armlets',
-    'armload',
-    'armoy',
     'arnesen',
-    'arquebuses',
-    'arrestments',
-    'arriba',
-    'arrogation',
-    'ars1',
-    'arse-hole',
-    'artaudian',
-    'arthouse',
-    'arthrodesis',
-    'artificials',
-    'artiodactyls',
-    'arvee',
-    'as-levels',
-    'asari',
-    'asba',
     'aschenbach',
-    'ascomycetes',
-    'asgard',
-    'asger',
-    'aspatria',
-    'aspidoras',
-    'aspreys',
-    'assailable',
-    'assailing',
-    'assails',
-    'asset-liability',
-    'assif',
-    'asthmaticus',
-    'astigmatic',
-    'astir',
-    'astringently',
     'astrocyte',
-    'asus2',
-    'at-rich',
-    'athanasian',
-    'atmospherically',
-    'atomiser',
-    'atp-binding',
-    'attack-minded',
-    'auchtermuchty',
-    'aude',
-    'audie',
-    'audio-tape',
-    'audio-visuals',
-    'audio/visual',
-    'audiocassette',
-    'audiological',
     'auditor/adviser',
-    'auditoria',
-    'aureoles',
-    'auricular',
-    'aurig&aelig',
-    'aurochs',
-    'aurorae',
-    'auroras',
-    'australia/new',
-    'austro-prussian',
-    'author(s)',
-    'authority-run',
-    'auto-wind',
-    'autochthonous',
-    'autoclaving',
-    'autodidact',
     'autogenic',
-    'automaticity',
-    'automatization',
-    'auvillars',
-    'avenges',
-    'avenue/viewfield',
-    'averil',
-    'averments',
-    'avoidably',
-    'axiological',
-    'axle-boxes',
-    'aye-aye',
-    'aykley',
-    'ayletts',
-    'aymes',
-    'aynho',
     'ayyad',
-    'azerbaijan/armenia',
-    'azov',
-    'b&eacute;d&eacute',
-    'b&eacute;rard',
-    'b-17s',
-    'b-e',
-    'b-y',
-    'b.3',
-    'b.c.l.c.',
-    'b.n.',
-    'b/1',
-    'b/b',
-    'b0',
-    'b3306',
-    'babette',
     'baby-blue',
-    'backlighting',
-    'backus',
-    'bacterially-synthesised',
-    'bacteroides',
-    'bad-mannered',
-    'badedas',
-    'baggages',
-    'bagpuize',
-    'bahujan',
-    'baikie',
-    'baiocchi',
-    'bairdwear',
-    'balbazian',
-    'baldest',
-    'baldies',
     'balenciaga',
-    'balerno/baberton',
-    'balev',
-    'balka',
-    'balladeers',
-    'ballinspittle',
-    'ballynure',
-    'balzacian',
-    'bambini',
-    'banagher',
-    'bancroftian',
-    'band-aids',
-    'bandanna',
-    'bandeau',
-    'bandol',
-    'bandwidths',
     'bangarappa',
-    'bangham',
-    'bangor-on-dee',
-    'banh',
-    'banus',
-    'bar&eacute;ges',
-    'bar/lounge',
-    'barbadians',
-    'barbier-beltz',
-    'barbier-mueller',
-    'bare-rooted',
-    'bareham',
-    'bargeboards',
-    'baritones',
-    'barkston',
-    'barkworth',
     'barlach',
-    'barnado',
-    'barnekov',
-    'barnes/abingdon',
-    'barnston',
-    'barracudas',
-    'barringtons',
-    'barrowload',
-    'barson',
-    'barthesian',
-    'barton-on-humber',
-    'barwick-in-elmet',
-    'barycentric',
-    'basal-subtracted',
-    'basalar',
-    'base/superstructure',
     'baseman',
-    'baskin-robbins',
-    'basophilic',
-    'bassae',
-    'basty',
-    'batesian',
-    'bath-water',
-    'bathilde',
-    'bathroom/w.c',
-    'battallions',
-    'battlecruisers',
-    'baudin',
-    'bawtry',
-    'bcef',
-    'bd75e',
-    'beach-head',
     'beachhead',
-    'beansprouts',
-    'beardall',
-    'bearding',
-    'beastlings',
-    'beatable',
-    'beau_monde',
-    'beaumann',
-    'bebbington',
-    'beche',
-    'beckus',
-    'becomingly',
-    'bed-sits',
-    'bed-sitters',
-    'bedchambers',
-    'bedgebury',
     'bedsheet',
-    'beechwoods',
-    'beeper',
-    'beer-cans',
-    'beerhouses',
-    'beetle-like',
-    'befalling',
-    'befiex',
-    'befit',
-    'befriender',
-    'begampur',
-    'beholders',
-    'bekesi',
-    'beko',
-    'belarussian',
-    'belgian-born',
     'belgium/luxembourg',
-    'believably',
-    'belleeks',
-    'bellerive',
-    'belly-up',
-    'belonogov',
-    'beltless',
-    'beltsville',
-    'belvin',
-    'ben-tovim',
-    'benbury',
-    'beneficiarii',
-    'beneficium',
-    'benne',
-    'benon',
-    'benzo(a)pyrene',
     'benzoin',
-    'benzoyl',
-    'benzyl',
-    'berelson',
-    'berenyi',
-    'bergenias',
-    'berkeley/gloucestershire',
-    'berlins',
-    'berrie',
-    'berry-hill',
-    'bessmertnova',
-    'best-of-seven',
-    'best-of-three',
-    'best-priced',
-    'best-suited',
-    'bester',
     'better-placed',
-    'betwe',
-    'between-group',
-    'beugge',
-    'beyrand',
-    'beza',
-    'bh4',
-    'bhalla',
-    'bharat',
-    'bhd',
-    'bhd.',
-    'bi-focals',
-    'bichir',
-    'bickley',
-    'biderman',
-    'biedermann',
     'biehn',
-    'biens',
-    'bifilar-wound',
-    'big-bellied',
-    'big-endians',
-    'big-nosed',
-    'bigamist',
-    'biggies',
-    'bikov',
-    'bikram',
-    'bilaterals',
-    'bilayers',
-    'bilinear',
-    'billiere',
-    'billy-goats',
-    'billycan',
     'biloba',
-    'bilsdale',
-    'bin-liners',
-    'bio-degradable',
-    'bio-psychosocial',
-    'bioassay',
-    'biologic',
-    'biologism',
-    'bion',
-    'biostratigraphic',
-    'birched',
-    'birder',
-    'birnie',
-    'bishopgate',
-    'bitov',
-    'bitton',
     'bjelke-petersen',
-    'bl&uuml;m',
-    'blabbed',
-    'black-browed',
-    'black-shirted',
-    'blackguards',
-    'blackhead',
-    'blacklists',
-    'blaggers',
-    'blaina',
-    'blanpain',
-    'blastoids',
-    'bleached-out',
-    'bleatings',
-    'bleddyn',
-    'blenkarn',
     'blood-lines',
-    'bloodstreams',
-    'blow-dry',
-    'blow-hole',
-    'blowzy',
-    'blp',
-    'bludov',
-    'blue-ringed',
-    'blue/green',
-    'blue/grey',
-    'bluestack',
-    'bluetit',
-    'bluetree',
-    'bn22',
-    'bns',
-    'boadway',
     'boahen',
-    'boarshaw',
-    'boastfully',
-    'boat-shaped',
-    'boatloads',
-    'bocock',
-    'body-centred',
-    'body-hugging',
-    'boehringer-mannheim',
-    'bog-hat',
-    'boggin',
-    'bohdan',
-    'boho',
-    'bohs',
-    'bois-reymond',
-    'boisterousness',
     'boksic',
-    'bomb-sites',
-    'bombays',
-    'boness',
-    'bongard',
-    'bongho-nouarra',
-    'bonnici',
-    'book-binding',
-    'bookham',
-    'bookstein',
-    'boorishness',
-    'boosbeck',
-    'boppers',
-    'borane',
-    'boranes',
-    'borderless',
     'boric',
-    'born-haber',
-    'borvel',
-    'boseley',
-    'bosherston',
-    'bossily',
-    'bostwick',
-    'boswellian',
-    'botsford',
-    'botulinum',
-    'boulangerie',
-    'boulois',
-    'boundary-less',
-    'boundary-value',
-    'bourbourg',
-    'bourdon-smith',
     'bourhan',
-    'bourne-arton',
-    'bow-fronted',
-    'bowness-on-windermere',
-    'bowood',
-    'boxed-in',
-    'boxmoor',
-    'braa',
-    'braamfontein',
-    'braefoot',
-    'braggadocio',
-    'braine-le-comte',
-    'brainerd',
-    'branchline',
-    'brannon',
-    'brantford',
     'brasel',
-    'braunschweig',
-    'bravefoot',
-    'braveman',
-    'brawlers',
-    'brawner',
-    'brazza',
-    'breacan-feile',
-    'break-dancing',
-    'breaking-off',
-    'breakouts',
-    'breakspearean',
-    'breaktime',
-    'breos',
-    'bretonnians',
-    'breuil',
     'bridgeborough',
-    'bridgecare',
-    'bridgeford',
-    'bridgeheads',
-    'brigantine',
-    'brightish',
-    'brimham',
-    'bring-and-buy',
-    'bringwyn',
-    'brinks-mat',
-    'bristols',
-    'brit-pol',
-    'brn-1',
-    'broadway/worcestershire',
-    'brockbank/rspca',
-    'brockworth/gloucestershire',
     'brodovitch',
-    'bromby',
-    'bronfman',
-    'brookline',
-    'brookmans',
-    'brothel-keepers',
-    'brough-on-humber',
-    'brownish-yellow',
-    'broxburn',
-    'brps',
-    'brudenell',
-    'brujo',
-    'brundish',
-    'bruntscar',
-    'brush-and-comb',
-    'brush-strokes',
     'bs8',
-    'bsps',
-    'bt.',
-    'btc',
-    'btcv',
-    'bttp',
-    'buchi',
-    'buddleias',
-    'budget-maximizing',
-    'bueche',
-    'built-by',
-    'bujak',
-    'bulbosus',
-    'bull-dwyer',
-    'bull-leapers',
-    'bullishness',
     'bullshitter',
-    'bullworthy',
-    'bulwer-lytton',
-    'bumble-bees',
-    'bunnak',
-    'bunostomum',
-    'buntingford',
-    'burden-sharing',
-    'buri',
-    'burlatsky',
-    'burmantofts',
-    'burningly',
-    'burwash',
-    'bush-aziz',
-    'bush-gorbachev',
-    'bush/fallow',
     'bushi',
-    'bushy-tailed',
-    'business-critical',
-    'businesses.',
-    'busway',
-    'butkus',
-    'butolphi',
-    'butt-ring',
-    'buttafuoco',
-    'buy-backs',
-    'bvm&amp;s',
-    'by-blow',
-    'by-employment',
-    'by-employments',
-    'by-now',
-    'by-word',
     'bydown',
-    'byeline',
-    'byelorussians',
-    'c&amp;j',
-    'c&amp;m',
-    'c&atilde;mara',
-    'c&dollar;58',
-    'c&eacute;zannesque',
-    'c&oacute;rdobas',
-    'c***',
-    'c.1730',
-    'c.i.a.',
-    'c.o.b.',
-    'c.p.e.',
-    'c/ebp-related',
-    'c/n',
     'c/s',
-    'c104',
-    'c18:3n3',
-    'c20:3n6',
-    'c38',
-    'c=2',
-    'ca2+',
-    'ca3',
-    'caat',
-    'cabinet*',
-    'cabletron',
-    'cabriole',
-    'caciques',
-    'cackett',
-    'cadafael',
-    'cadaveric',
     'caddises',
-    'caeruleus',
-    'cainca',
-    'cairnryan',
-    'caisley',
-    'caistor',
-    'cal&iacute',
-    'calcification',
-    'calculational',
-    'calderstones',
-    'calderwood/swindon',
-    'calgiari',
-    'calicoes',
-    'callimachus',
-    'calthorpes',
-    'calvert-smith',
     'calvings',
-    'calyces',
-    'camarthen',
-    'camelsdale',
-    'cameroonian',
-    'camisoles',
-    'cammel',
-    'campanulas',
-    'camulodunon',
-    'canaliculata',
-    'canderel',
-    'candu',
-    'canids',
-    'cankers',
-    'cannell',
-    'canon-williams-renault',
     'canonists',
-    'canterbury-bankstown',
-    'canzonas',
-    'canzonets',
-    'capacitative',
-    'capelin',
-    'capelle',
-    'capisce',
-    'cappadocia',
-    'cappuccinos',
-    'capsicums',
-    'capsizes',
-    'captivates',
-    'car-keys',
-    'carajas',
-    'carbert',
     'carbonless',
-    'carchedi',
-    'cardmembers',
-    'cardo',
-    'cardoun',
-    'care-takers',
-    'career-minded',
-    'careys',
-    'carle',
-    'carmaker',
-    'carmontelle',
-    'carnatic',
-    'carnevale',
-    'carnivalesque',
-    'carnoy',
-    'carpel',
     'carrados',
-    'carreira',
-    'carried-forward',
-    'carris',
-    'carroburg',
-    'carrolls',
-    'carrying-out',
-    'carstensen',
-    'cart&oacute;n',
-    'carterton/oxfordshire',
-    'cartesians',
-    'cartoony',
-    'carvell',
-    'cas&oacute;n',
-    'caseworker',
-    'caseworkers',
     'cashless',
-    'casque',
-    'cassey',
-    'casteleyn',
-    'castiglioni',
-    'castleblaney',
-    'casualisation',
-    'casus_belli',
-    'cat-lovers',
-    'cat.',
-    'cataleptic',
-    'catalyser',
-    'categorizes',
-    'catenian',
-    'catholme',
-    'catrina',
     'catsuits',
-    'catte',
-    'cattleman',
-    'caudwell',
-    'caught-behind',
-    'cause/effect',
-    'causley',
-    'caveney',
-    'cavesson',
-    'cavtat',
-    'cawoods',
-    'caxias',
-    'caygill',
-    'cayley-hamilton',
-    'cb2',
-    'cbp',
     'cd4+',
-    'cdpp',
-    'cdu/cdm',
-    'cedc',
-    'cefotaxime',
-    'celerity',
-    'cell-mediated',
-    'cellarman',
-    'celor',
-    'cemali',
-    'cemetry',
-    'cen4',
-    'cenotaphs',
-    'census-takers',
-    'centrally-determined',
-    'centromeric',
     'cepi',
-    'cerci',
-    'certifications',
-    'cf1',
-    'cfds',
-    'cg(tta)',
-    'cgcg',
-    'cgrp',
-    'ch\'i-ch\'ang',
-    'ch.2',
-    'ch4',
-    'chadband',
-    'chadburn',
-    'chaguaramas',
-    'chains.',
-    'chairman-elect',
     'chalklands',
-    'chalkley',
-    'challener',
-    'chaminda',
-    'changing.',
-    'chanterelles',
-    'chantrey',
-    'chapelle-charbons',
-    'chaperonage',
-    'character(s)',
-    'charcoal-burners',
-    'charcoals',
-    'charge-payers',
-    'charge/council',
-    'charge/poll',
-    'charidee',
     'charltons',
-    'charlynch',
-    'charmlessness',
-    'charwomen',
-    'chastises',
-    'cheal',
-    'chearful',
-    'cheb',
-    'checheno-ingushetia',
-    'checked-by',
-    'cheekiness',
-    'cheeking',
-    'cheeseburgers',
-    'chelwood',
-    'chemco',
-    'cheque/postal',
     'cherfas',
-    'cherkasov',
-    'cherokees',
-    'chesnokov',
-    'chesterholm',
-    'chf',
-    'chhuma',
-    'chievely',
-    'chikatilo',
-    'child(ren)',
-    'child/children',
-    'childeberti',
-    'chilton/oxfordshire',
-    'chimaerism',
-    'chimanes',
-    'chimney-stacks',
     'chimneybreast',
-    'china-blue',
-    'chinampas',
-    'chinaware',
-    'chintzes',
-    'chipsets',
-    'chirpily',
-    'chitons',
-    'chocky',
-    'chocoholics',
-    'choeur',
-    'cholesterol-rich',
-    'chosh&uacute;0',
-    'christ-centred',
-    'chromaticisms',
-    'chromophore',
     'chromosomally',
-    'chrzanowski',
-    'chthonic',
-    'chubei',
-    'chugga',
-    'chuguo',
-    'chulainn',
-    'chumminess',
-    'churche',
-    'churchills',
-    'chymical',
-    'ciespal',
-    'cimma',
-    'cintra',
-    'ciparis',
-    'circolo',
     'circumscription',
-    'circumstantially',
-    'cirrhosa',
-    'cis-trans',
-    'civil-defence',
-    'civil-liberties',
-    'ckbs',
-    'ckii',
-    'clackmannanshire',
-    'cladeus',
-    'clague',
-    'clamminess',
-    'clarey',
-    'clarisse',
-    'clarridge',
-    'claspers',
     'class(es)',
-    'class-party',
-    'class-theoretical',
-    'classes-in-struggle',
-    'classicus',
-    'claudication',
-    'clause.',
-    'clayey-lignites',
-    'claymores',
-    'clemenhagen',
-    'clerkships',
-    'cleverdon',
-    'clinkers',
-    'clinkham',
-    'clinopyroxene',
-    'clodius',
     'clofesho',
-    'clonality',
-    'clontech',
-    'close-coupled',
-    'close-to',
-    'cloth-bound',
-    'clothes-pegs',
-    'clothesline',
-    'clouseau',
-    'clove-like',
-    'clpd',
-    'club-style',
-    'clubber',
-    'clumpiness',
-    'clusterers',
-    'clutchless',
     'clutterbuck/morland',
-    'clydesiders',
-    'cm-wide',
-    'cm/h',
-    'cm20',
-    'cmbr',
-    'cmrl',
-    'cnm',
-    'cnvs',
-    'co-existent',
-    'co-leader',
-    'co-market',
-    'co-pilots',
-    'co-publisher',
-    'co-responsibility',
-    'co-trustee',
     'coachroof',
-    'coadjutor',
-    'coal-hole',
-    'coal-miners',
-    'coaldust',
-    'coalitionist',
-    'coat-dress',
-    'coatstand',
-    'coauthors',
-    'cobas',
-    'cobden-sanderson',
-    'cobwebby',
-    'coccoliths',
-    'coccus',
-    'cockboat',
-    'cockerington',
     'cockfosters',
-    'codifies',
-    'coe-jones',
-    'coeducation',
-    'coelacanths',
-    'coelurosaurs',
-    'coevolutionary',
-    'cognitive&ndash;behavioural',
-    'cogwheel',
-    'cohabitee',
-    'coital',
-    'cold-seal',
-    'coldwell',
-    'coleg',
-    'coleshill',
-    'coliform',
     'collator',
-    'collinswood',
-    'collosum',
-    'collusively',
-    'colney',
-    'colomb',
-    'colonizer',
-    'colouristic',
-    'coltishall',
-    'colugo',
-    'colugos',
-    'columbianum',
-    'column-inches',
-    'colwall',
-    'comandantes',
-    'comando',
     'combings',
-    'comelec',
-    'comercial',
-    'command-administrative',
-    'command.com',
-    'commensurable',
-    'commercially-minded',
-    'commerson',
-    'commissaires',
-    'committeeman',
-    'committo',
-    'common-sensical',
-    'comnenus',
-    'compadre',
-    'compadres',
-    'compellable',
     'compendious',
-    'complaisance',
-    'complementaries',
-    'comportment',
-    'compris',
-    'comptoirs',
-    'compunctions',
-    'computer-game',
-    'computerland',
-    'comunale',
-    'comunidades',
-    'concanavalin',
-    'concatenate',
-    'concealments',
-    'concei&ccedil&atilde;o',
-    'conceicao',
     'concepcion',
-    'concepta',
-    'concha',
-    'concolor',
-    'concrete-lined',
-    'condescends',
-    'conflict-of-laws',
-    'confluences',
-    'confr&egrave;res',
-    'confusability',
-    'congeneric',
-    'congeries',
-    'congregants',
-    'congresswoman',
-    'congruous',
-    'conservative-historical',
     'consolidators',
-    'constrictive',
-    'constrictors',
-    'consulter',
-    'contado',
-    'content/bone',
-    'conterchi',
-    'contra-charges',
-    'contran',
-    'contrapositive',
-    'contrariants',
-    'control:manufacturing',
-    'convalescents',
-    'conveniency',
-    'convertability',
-    'convery/scotland',
     'cooperativeness',
-    'coors',
-    'coper',
-    'copper-bottomed',
-    'copthall',
-    'copular',
-    'copulatory',
-    'copyholder',
-    'copywriters',
-    'coracles',
-    'core-level',
-    'corer',
-    'coretest',
-    'cornerville',
-    'cornes',
-    'corpse-like',
     'corralling',
-    'correia',
-    'correlator',
-    'corroboree',
-    'corselet',
-    'corv&eacute;e',
-    'cost-per-case',
-    'costatus',
-    'costello-roberts',
-    'cotazym',
-    'cotransfection',
-    'cotti',
-    'cottonwool',
-    'cottony',
-    'cotyledons',
-    'coubertin',
     'couldnae',
-    'coulport',
-    'countback',
-    'counter-allegations',
-    'counter-indemnities',
-    'counter-process',
-    'counter-service',
-    'counter-statement',
-    'counter-strategy',
-    'counter-theory',
-    'counter-weight',
-    'counterrevolution',
-    'countersignature',
-    'countersuit',
-    'countline',
-    'country-and-western',
     'courr&egrave;ges',
-    'course-wide',
-    'coursers',
-    'court/london',
-    'courteney',
-    'courthouses',
-    'courtliness',
-    'courtside',
-    'cover-drive',
-    'covered-up',
-    'covetable',
-    'covington-pyms',
-    'cow-houses',
-    'cow-like',
-    'cow-pats',
-    'cowherd',
     'coxite',
-    'cps/gls',
-    'crackdowns',
-    'craftswomen',
-    'craigend',
-    'cramp-like',
-    'craniate',
-    'crashingly',
-    'cratonic',
-    'cratons',
-    'crd',
-    'creakily',
-    'creepily',
-    'creetown',
-    'creolisms',
-    'cri_de_coeur',
     'crichel',
-    'crighton',
-    'crime-prone',
-    'crisis.',
-    'criste',
-    'croasdale',
-    'crocodilians',
-    'cromcruach',
-    'crookery',
-    'croquettes',
-    'cross-connections',
-    'cross-culturally',
-    'cross-functional',
-    'cross-media',
-    'cross-overs',
-    'cross-ownership',
     'cross-rhythms',
-    'crossfield',
-    'crosshead',
-    'crosspiece',
-    'croughton',
-    'crowd-pullers',
-    'crowhurst',
-    'crowndale',
-    'crp-2',
-    'crummles',
-    'crutchless',
-    'cryptographic',
-    'cryptosporidial',
-    'crystallographers',
-    'crystallographically',
-    'cscs',
     'csg',
-    'csv',
-    'ctts',
-    'cuban-american',
-    'cube-shaped',
-    'cubillas',
-    'cucullati',
-    'cue/prompt',
-    'cuistots',
-    'culham/oxfordshire',
-    'culotte',
-    'culture-bound',
-    'cunnington',
-    'curation',
-    'curien',
-    'curled-up',
     'curlier',
-    'current-affairs',
-    'current-cost',
-    'custom-build',
-    'cut-rate',
-    'cuter',
-    'cuttack',
-    'cyc',
-    'cyclamens',
-    'cycle/pedestrian',
-    'cyclicity',
-    'cyclooxygenase',
-    'cyclopedia',
-    'cyclopropyl',
-    'cypa-csa',
-    'cyrenians',
     'd&amacr',
-    'd&amp;ps',
-    'd&ndash;e',
-    'd\'agneau',
-    'd\'avila',
-    'd\'ayala',
-    'd\'costa',
-    'd\'elite',
-    'd\'horizon',
-    'd\'instruction',
-    'd\'orleans',
-    'd\'urgell',
-    'd-asp',
-    'd.h.lawrence',
-    'd.i',
-    'd.p.c',
     'd/dt',
-    'd1500',
-    'd=1',
-    'dabi',
-    'daddy-long-legs',
-    'dagley',
-    'daiches',
-    'daintiness',
-    'dallams',
-    'dalton-in-furness',
-    'damart',
-    'damnas',
-    'damselfly',
-    'danaan',
-    'dance-music',
-    'danevirke',
     'danseur',
-    'danzig-polish',
-    'darcian',
-    'dark-complexioned',
-    'darksome',
-    'darky',
-    'darrin',
-    'daszczuk',
-    'datacomm',
-    'datamation',
-    'datums',
-    'daubigny',
-    'davaadorjiyn',
-    'davenport-hines',
-    'day-clothes',
-    'daybed',
     'dbayeh',
-    'dc-3s',
-    'dcp',
-    'dctp',
-    'de-select',
-    'de_rigeur',
-    'deaconesses',
-    'deafer',
-    'death-announcements',
-    'death-cliffs',
-    'death-throes',
-    'death.',
-    'deathlike',
-    'deb&acirc;cle',
-    'debratz',
-    'debt/equity',
     'dec/jan',
-    'decarboxylation',
-    'decem',
-    'decent-looking',
-    'deckhands',
-    'deckhead',
-    'decomposable',
-    'decorativeness',
-    'decorticate',
-    'decs',
-    'decumbens',
-    'dedicator',
-    'deductibles',
-    'deductively',
-    'deep-blue',
-    'deep-bowled',
     'deep-felt',
-    'defacement',
-    'defendable',
-    'definitionally',
-    'degeneracies',
-    'degradations',
-    'dehra',
-    'dehumanization',
-    'dehumidifier',
-    'deibler',
-    'deinstitutionalization',
-    'delegate(s)',
-    'delimits',
-    'delirium_tremens',
-    'dellor',
-    'delmas',
     'delocalization',
-    'delusory',
-    'delville',
-    'demandingly',
-    'demeans',
-    'demi-monde',
-    'demobilise',
-    'demoniacal',
-    'demonically',
-    'demotions',
-    'demsetz',
-    'demutualisation',
-    'denazification',
-    'dendy',
-    'denford',
-    'deniable',
     'denigrates',
-    'dennant',
-    'denseness',
-    'deoxycholic',
-    'dependably',
-    'depilator',
-    'depos',
-    'deprecation',
-    'depressed-looking',
-    'dequasie',
-    'derby-based',
-    'derby-lewis',
-    'dermatologically',
-    'desargues',
-    'descampe',
-    'descendeur',
     'desegregate',
-    'deselection',
-    'designcare',
-    'desk-bound',
-    'despoiling',
-    'despotically',
-    'detlef',
-    'detractor',
-    'dev.',
-    'developable',
-    'deviser',
-    'dexters',
-    'dgtp',
-    'diacetylenic',
-    'diametrical',
-    'diamondback',
     'diatonicism',
-    'diba',
-    'dibb',
-    'dich',
-    'dichotically',
-    'dick-head',
-    'dickstein',
-    'dictums',
-    'diferencias',
-    'dignidad',
-    'digweed',
-    'dihomo-t&gt',
-    'dilatoriness',
-    'dilators',
-    'dilettantism',
-    'dilly-dally',
     'dimas',
-    'dinginess',
-    'dingiri',
-    'dingwalls',
-    'diningroom',
-    'dinosaur-like',
-    'diplomasi',
-    'dipyridamole',
-    'dirleton',
-    'dis-economies',
-    'discipline-oriented',
-    'discordantly',
-    'discriminators',
-    'discursiveness',
-    'disentanglement',
-    'disharmonies',
     'disincorporation',
-    'dislodges',
-    'disposal.',
-    'disrupters',
-    'dissensus',
-    'dissuasion',
-    'distance/time',
-    'distillations',
-    'distorters',
-    'distortive',
-    'distressful',
-    'disturbers',
-    'ditzel',
-    'diumal',
-    'div2',
-    'diversifies',
     'divertimentos',
-    'dixter',
-    'djuna',
-    'dkp',
-    'dm10,000',
-    'dm120',
-    'dm2.36',
-    'dm2.39',
-    'dm2.81',
-    'dm2.90',
-    'dm250,000',
-    'dm3,000',
-    'dm40,200',
-    'dm400',
-    'dm5,000',
-    'dmb',
     'dmm',
-    'dna-bound',
-    'dobb',
-    'documentations',
-    'dodie',
-    'doe-eyed',
-    'dog-friendly',
-    'dog-legs',
-    'dog-star',
-    'dogana',
-    'dogwhelk',
-    'dojo',
-    'dollan',
-    'dollars-worth',
-    'dollie',
-    'dolours',
     'domhoff',
-    'domokos',
-    'don-e',
-    'donatists',
-    'dondi',
-    'donkey-boys',
-    'donop',
-    'donoughue',
-    'donwell',
-    'doom-mongers',
-    'doorless',
-    'doorstop',
-    'dorien',
-    'doriskos',
-    'dormington',
-    'dossett',
     'dostoyevsky',
-    'dottor',
-    'double_entendre',
-    'doubloons',
-    'doug.',
-    'dowitcher',
-    'downhome',
-    'downshire',
-    'downsizers',
-    'downsville',
-    'doxies',
-    'dpck',
-    'dr.williams',
-    'draft-dodgers',
-    'draggy',
-    'dragonriders',
     'draught-free',
-    'drawing-pins',
-    'draycote',
-    'dreadfulness',
-    'dream-books',
-    'dreamlessly',
-    'dreamscape',
-    'dreck',
-    'dredd',
-    'dreikurs',
-    'drell',
-    'dreme',
-    'dribbly',
-    'drift-back',
-    'dring',
-    'driver-only',
     'drs3000',
-    'drs6000s',
-    'drtf1a',
-    'drug-addicts',
-    'druridge',
-    'dry-cleaners',
-    'dry-roasted',
-    'dry/damaged',
-    'dsl',
-    'dual-career',
-    'dubernard',
-    'dubiousness',
-    'duclos-lasalle',
-    'ductus',
-    'dufftown',
-    'dug-in',
     'dull-coloured',
-    'dull-looking',
-    'dunadd',
-    'dunbars',
-    'dundrennan',
-    'dunga',
-    'dunkerque',
-    'dunna',
-    'dunnion',
-    'dunsyre',
-    'durango',
-    'dustbag',
-    'dustless',
-    'dutchwoman',
-    'duttons',
-    'duty-frees',
     'dw/ld',
-    'dwolding',
-    'dxs14',
-    'dyads',
-    'dysmotility',
-    'dysphasia',
-    'dzhakhar',
-    'e-data',
-    'e-h',
-    'e-values',
-    'e.c.h.r.',
-    'e.d.',
-    'e0',
-    'e5+',
-    'e6+',
-    'e851/71',
     'eade',
-    'eadhaed',
-    'eaglesham',
-    'ealdermen',
-    'eanes',
-    'ear-piercing',
-    'earnshaws',
-    'earpieces',
-    'earthwards',
-    'easebourne',
-    'east-central',
-    'easterness',
-    'easthampstead',
-    'easy-clean',
-    'easy-to-grow',
-    'easy-to-make',
     'eating-houses',
-    'eaux-chaudes',
-    'ebon',
-    'ebulliently',
-    'ec-like',
-    'ec3',
-    'ec4',
-    'ec4y',
-    'ecclesiarum',
-    'echocardiographic',
-    'eclectically',
-    'economic/financial',
-    'ecr-90',
-    'eddison',
-    'eddius',
-    'edger',
     'edgson',
-    'edibles',
-    'edinburgh-glasgow',
-    'editoriale',
-    'edlib',
-    'edmondo',
-    'edmonston',
-    'educability',
-    'educated.',
-    'educational/vocational',
-    'edwige',
-    'ee549',
-    'eejits',
-    'eeriness',
-    'effortfully',
-    'egf-like',
     'egg-shells',
-    'eggcup',
-    'eggington',
-    'egomaniac',
-    'egotistic',
-    'eibhinn',
-    'eight-bar',
-    'eight-cell',
-    'eight-iron',
-    'eight-times',
-    'einheit',
-    'ekaterinberg',
-    'elapsing',
-    'elastane',
-    'electrically-operated',
-    'electrodynamometer',
     'electrogastrography',
-    'electromagnetically',
-    'electromyography',
-    'electron-volts',
-    'electrophilic',
-    'elenya',
-    'elevational',
-    'eliab',
-    'eliminable',
-    'eliminators',
-    'elizardo',
-    'ellipsoids',
-    'elmswell',
-    'elongatus',
-    'else\'',
-    'embedment',
     'embellishes',
-    'embezzler',
-    'emblematically',
-    'embolisation',
-    'embonpoint',
-    'embrittlement',
-    'emeraude',
-    'emigr&eacute;s',
-    'emilia-romagna',
-    'emm386.exe',
-    'emmott',
-    'emotivist',
-    'empetrum',
-    'employer-related',
-    'en-1',
-    'enablement',
     'encash',
-    'enceinte',
-    'encha&icirc;nement',
-    'enchants',
-    'end-of-terrace',
-    'end-points',
-    'endell',
-    'endlessness',
-    'endocervical',
-    'endocrinologist',
-    'endogamy',
-    'endomorph',
-    'endonym',
-    'enervation',
-    'enforcement/advisory',
-    'engine-driven',
     'enrols',
-    'entailments',
-    'entasis',
-    'enteroscopy',
-    'enterotoxins',
-    'enthrall',
-    'enthralment',
-    'enticements',
-    'entrelacement',
-    'entrepreneurialism',
-    'entry/exit',
-    'enugu',
-    'enunciations',
-    'epeirogenic',
-    'epeirogeny',
-    'ephemeroptera',
     'epicranium',
-    'epipheny',
-    'epiphysis',
-    'episiotomies',
-    'epistemologies',
-    'epistemologists',
-    'epitaxial',
-    'eq/l',
-    'equability',
-    'equal-opportunities',
-    'equipotent',
-    'equisetum',
-    'equivalenced',
-    'eranthis',
-    'erastian',
-    'erectile',
     'erms',
-    'erodibility',
-    'erythematosus',
-    'es295',
-    'es335',
-    'esa-pekka',
-    'escalations',
-    'escape-proof',
-    'escheikh',
-    'esmeralda',
-    'espectador',
-    'espelette',
-    'espetada',
-    'espinosa',
-    'esps',
-    'esrc/cnrs',
     'esrc/serc',
-    'esslemont',
-    'estanislao',
-    'esthwaite',
-    'esztergom',
-    'etcher',
-    'etemesi',
-    'eternities',
-    'ethene',
-    'etherlink',
-    'ethica',
-    'ethico-political',
-    'ethnic-albanian',
-    'etoposide',
-    'ettlinger',
-    'eucrites',
     'eugenicist',
-    'eunson',
-    'eupterus',
-    'euro-dm',
-    'euro-dollars',
-    'eurodass',
-    'eurypterids',
-    'evanescence',
-    'evangelize',
-    'evans-lombe',
-    'evaporative',
-    'evason',
-    'evay',
-    'ever-better',
-    'ever-escalating',
-    'ever-open',
     'ever-optimistic',
-    'ever-so-slightly',
-    'ews4800',
-    'ex-irish',
-    'ex-mod',
-    'ex-nazis',
-    'ex-rights',
-    'ex-shop',
-    'ex-udr',
-    'ex.2',
-    'ex_libris',
-    'exa',
-    'exam.',
-    'exchequers',
-    'exciter',
-    'excoriation',
     'exculpation',
-    'exemplifications',
-    'exfoliators',
-    'exhuming',
-    'exigences',
-    'exilic',
-    'existentialists',
-    'exocuticle',
-    'exon-intron',
-    'exorcists',
-    'exotoxin',
-    'expellees',
-    'expertness',
-    'explosiveness',
-    'express/mail',
-    'exsurge',
     'ext&num;-1',
-    'extemporisation',
-    'extortionists',
-    'extra-cellular',
-    'extra-economic',
-    'extra-ordinary',
-    'extracontractual',
-    'extrafloral',
-    'extraordinaries',
-    'extraverts',
-    'exudative',
-    'eyecatcher',
-    'eyesockets',
-    'eyestripes',
-    'f&bsol;g',
-    'f&lt;t',
     'f(c)',
-    'f-1',
-    'f.2d',
-    'f.b.i.',
-    'f.c.j.',
-    'f.r.s.',
-    'f/t',
-    'f/x',
-    'f1,200',
-    'f2b',
-    'f35',
-    'f4u',
-    'f8+',
-    'f8b',
-    'facias',
-    'factor-&agr',
     'fadil',
-    'fag-ends',
-    'fagans',
-    'fair-traded',
-    'fairfaxes',
-    'fairgrieves',
-    'falloon',
-    'fallowfield',
-    'famara',
-    'familar',
-    'familiar-looking',
-    'familiarities',
-    'familiarizing',
-    'family-orientated',
-    'fanagan',
-    'fangataufa',
     'fanlights',
-    'farma',
-    'farnon',
-    'farnsworth',
-    'farrance',
-    'farrand',
-    'farrar-hockley',
-    'fasano',
-    'fat****',
-    'fatet',
-    'fatimids',
-    'fauldhouse',
-    'fault-bounded',
-    'faune',
-    'fb.11',
-    'fbas',
     'fbp',
-    'fc(m)',
-    'feakle',
-    'feargach',
-    'feastings',
-    'feather-bedded',
-    'featherlight',
-    'fechan',
-    'federle',
-    'feeblest',
-    'feebury',
-    'fegan',
-    'fegel',
-    'feiners',
-    'felce',
-    'felicific',
     'feliks',
-    'fellow-prisoners',
-    'fellow-writers',
-    'felt-tips',
-    'felthams',
-    'femininities',
-    'fenastras',
-    'fencers',
-    'fenestralis',
-    'fenmen',
-    'ferlie',
-    'fermenter',
-    'ferr&eacute',
-    'ferrebee',
-    'ferrebourg',
-    'ferrous-brown',
     'fessenheim',
-    'festae',
-    'festers',
-    'fewtrell',
-    'feyness',
-    'ffr1.2',
-    'ffr20',
-    'ffr30',
-    'fgtl',
-    'fibre****',
-    'fibroids',
-    'fideicommissarius',
-    'field-dependent',
-    'field-notes',
-    'fieldnames',
-    'fierily',
     'fietje',
-    'fifth-seeded',
-    'fifth-year',
-    'fifty-five-year-old',
-    'fifty-fourth',
-    'fight.',
-    'fighting-men',
-    'filali',
-    'filatov',
-    'fillan',
-    'film-goers',
-    'finded',
-    'fine-textured',
-    'fingery',
-    'fino',
-    'finreir',
     'finsberg',
-    'finv',
-    'fire-irons',
-    'firesides',
-    'firewater',
-    'firgorran',
-    'firmead',
-    'first-cousins',
-    'first-mentioned',
-    'first-teamers',
-    'firstfruit',
-    'fischbach',
-    'fischl',
-    'fishable',
-    'fisherwick',
-    'fisherwomen',
     'fishfingers',
-    'fishings',
-    'fishwives',
-    'fistic',
-    'fiszbach',
-    'fitnesses',
-    'fitzgeoffrey',
-    'five-cylinder',
-    'five-eighth',
-    'five-fifteen',
-    'five-seat',
-    'fixatives',
-    'flag-draped',
-    'flagstoned',
-    'flail-threshing',
-    'flambeaux',
     'flandres',
-    'flare-like',
-    'flatlet',
-    'flatware',
-    'flaubertian',
-    'flesh-pots',
-    'fleshed-out',
-    'fleurs-de-lis',
-    'flickerings',
-    'flickery',
-    'flimsiness',
-    'flinter',
-    'flocs',
-    'floggers',
-    'flood-damaged',
-    'floor-mounted',
     'floorpan',
-    'floozie',
-    'floral-inspired',
-    'florentin',
-    'florette',
-    'flouncy',
-    'flow-charts',
-    'flower-sprigged',
-    'flowerings',
-    'floyds',
-    'flucloxacillin',
-    'fluoresces',
-    'fluoroquinolones',
-    'flyback',
-    'fmol/tube',
-    'fmu',
     'focalisation',
-    'focally',
-    'fogbound',
-    'folk-memory',
-    'folkeskole',
-    'folklorist',
-    'folktale',
-    'followed-up',
-    'fomites',
-    'fonbrune',
-    'fondamenta',
-    'fondazione',
-    'food-intolerant',
-    'fool-proof',
-    'footrail',
-    'fore-and-aft',
     'forelocks',
-    'foresail',
-    'forests.',
-    'forgivingness',
-    'forkner',
-    'formazan',
-    'forrestal',
-    'forschung',
-    'forsell',
-    'forton',
-    'fortrose',
-    'fortune-tellers',
-    'forty-',
-    'forty-first',
-    'forty-five-minute',
-    'forty-minute',
     'fosbury',
-    'foscarnet',
-    'foudre',
-    'four-bladed',
-    'four-horned',
-    'four-pack',
-    'four-pocket',
-    'four-tenths',
-    'fourth-seeded',
-    'foyles',
-    'fpm',
-    'fqs',
-    'fr&iacute;as',
-    'fragile-looking',
-    'frameless',
-    'franklyns',
     'frasca',
-    'fraser-smith',
-    'freakishly',
-    'freakster',
-    'free-moving',
-    'free-roaming',
-    'free-traders',
-    'freebooter',
-    'freebooters',
-    'freehouses',
-    'freight-only',
-    'french-inspired',
-    'frenchies',
-    'frens',
-    'fresh-baked',
-    'fresh-looking',
     'fricassee',
-    'frigidarium',
-    'frigidly',
-    'frings',
-    'fris&eacute;e',
-    'frishkopf',
-    'fritjof',
-    'fritschy',
-    'fritwell',
-    'frobenius',
-    'front_of',
-    'frontbenchers',
-    'frontrunner',
-    'frontside',
-    'fross',
-    'frpb',
     'fructus',
-    'fruit-eaters',
-    'fruitier',
-    'fruticosus',
-    'fsd',
-    'fsh-rh',
-    'ft&mdash;se',
-    'fts',
-    'ftse-100',
-    'fuchsin',
-    'fucked-up',
-    'fuckin',
-    'fulbert',
-    'fulgor',
-    'full&rehy;time',
-    'full-nerved',
     'fullblast',
-    'fullstop',
-    'fungibility',
-    'funicolare',
-    'furniture-makers',
-    'furumoto',
-    'fvnf',
-    'fx80',
-    'fxg4',
-    'fyfield',
-    'fyge',
-    'fyodorov',
-    'fyrd',
-    'g&amp;sharp',
-    'g&amp;t',
-    'g-ayih',
     'g-mek',
-    'g-strings',
-    'g.n.',
-    'g/ml',
-    'g10\'',
-    'g26',
-    'g418-resistant',
-    'gabbing',
-    'gabriels',
-    'gaffers',
-    'gaieties',
-    'galata',
-    'galatica',
-    'galdikas',
-    'galgate',
-    'galin',
     'gallopers',
-    'galston',
-    'gamester',
-    'gamini',
-    'gamma/volt',
-    'ganda',
-    'ganglioside',
-    'gangpath',
-    'gardon',
-    'garesfield',
-    'gasco',
-    'gastoldi',
-    'gastroscope',
-    'gatekirk',
-    'gates/fa',
-    'gatsha',
     'gauchos',
-    'gaudier-brzeska',
-    'gaudiness',
-    'gauntness',
-    'gavrelle',
-    'gaydon',
-    'gazelle-like',
-    'gc(ta)',
-    'gcse/gce',
-    'gearstick',
-    'gellatley',
-    'genaro',
-    'gene-seed',
-    'generales',
-    'geneville',
-    'gentes',
     'gentle-hearted',
-    'geo.',
-    'geochemist',
-    'geochemists',
-    'geoffry',
-    'gerallt',
-    'geran',
-    'gerar',
-    'gerberas',
-    'gesticulations',
-    'gesualdo',
-    'getting-to-know-you',
-    'gfcc\'',
-    'gfccg',
-    'gharrgoyle',
-    'gherpotean',
     'ghetto-blasters',
-    'ghlas',
-    'ghoulishly',
-    'giantism',
-    'giantkillers',
-    'gibbous',
-    'gibson-like',
-    'giddins',
-    'gidea',
-    'gigacube',
-    'giggler',
-    'gigolos',
-    'gilani',
-    'gilberts',
-    'gillbrook',
-    'gilliatt',
     'gilson',
-    'gin-and-water',
-    'ginkgos',
-    'gir&atilde;o',
-    'girard',
-    'girja',
-    'girke',
-    'gisbert',
-    'gisp2',
-    'giurgiu',
-    'glamorganshire',
-    'glancingly',
-    'glasgay!',
-    'glasgow-london',
-    'glass-bottomed',
-    'glass-domed',
     'glassed-in',
-    'glassmakers',
-    'glenthorne',
-    'glibness',
-    'glomerulonephritis',
-    'gloopy',
-    'glossiest',
-    'glostrup',
-    'glu238',
-    'glueings',
-    'gluten-free',
-    'glycerin',
-    'glycolytic',
-    'glycyrrhizic',
-    'gnvqs',
-    'go-anywhere',
     'go/no-go',
-    'goal-conditions',
-    'goalline',
-    'goatherd',
-    'gobbin',
-    'gobelins',
-    'goble',
-    'gobowen',
-    'god-shaped',
-    'godlingston',
-    'gold-embossed',
-    'gold-embroidered',
-    'gold-leafed',
-    'gold-mine',
-    'gold-ringed',
-    'gold-weights',
     'gold/silver',
-    'golden-red',
-    'golden-skinned',
-    'gomantak',
-    'gomersall',
-    'gomm',
-    'goncalvez-herrera',
-    'gonchigdorj',
-    'gonner',
-    'good-neighbourly',
-    'good/bad',
-    'goodell',
-    'gooderham',
-    'goods/services',
-    'goodwin/tewkesbury',
-    'goofing',
     'goose-pimpled',
-    'gorbachevian',
-    'gorgie',
-    'gork',
-    'gorphal',
-    'gos',
-    'gosfield',
-    'gosol',
-    'gothia',
-    'gotobeds',
-    'gougane',
-    'governable',
-    'government-financed',
-    'governmentally',
-    'gowans',
-    'goyim',
     'gp168',
-    'gpp',
-    'gppbs',
-    'gradualistic',
-    'gradualness',
-    'graecia',
-    'grafham',
-    'grafter',
-    'gramineae',
-    'gramm',
-    'grammatic',
-    'grammaticalization',
-    'grange-over-sands',
-    'grant/deny',
-    'grantees',
-    'grantown',
     'granule-like',
-    'granville-barker',
-    'grapefruits',
-    'grapnel',
-    'graspable',
-    'grassgill',
-    'gratiano',
-    'grave-robbers',
-    'grb2-sos',
-    'greasily',
-    'green-and-white',
-    'greenane',
-    'greenbacks',
-    'greensboro',
-    'greentoft',
-    'greggs',
     'grey-streaked',
-    'griffons',
-    'grim-looking',
-    'grimwade',
-    'grisell',
-    'grisewood',
-    'grivas',
-    'grizzle-haired',
-    'groenewald',
-    'groombridge',
-    'groomsport',
-    'grotius',
-    'ground-effects',
-    'groundings',
-    'groundstrokes',
-    'groupworkers',
     'growth-rate',
-    'gruffness',
-    'grynd',
-    'gs&amp;w',
-    'gs1/2',
-    'gtx2',
-    'gu9',
-    'guatemalteca',
-    'guerreiro',
-    'guevarism',
-    'gugsa',
-    'guiden',
-    'guileful',
-    'guilelessly',
-    'gundulf',
-    'gundy',
     'gunnels',
-    'gunnergate',
-    'gunroom',
-    'gunzburg',
-    'gures',
-    'gushy',
-    'gussets',
-    'gussie',
-    'gutermann',
-    'guthlaci',
-    'guttmann',
-    'gweedore',
-    'gwenny',
-    'gwernol',
-    'gwytherin',
-    'gxf6',
     'gynocentric',
-    'gyppos',
-    'gypsades',
-    'gyroscopic',
-    'h&amp;c',
-    'h&eacute;ireann',
-    'h&eacute;lio',
-    'h\'s',
-    'h-parameter',
-    'h-r',
-    'h.influenzae',
-    'h.r.',
-    'h/p',
-    'h0',
-    'h2t',
-    'h7+',
     'ha-ha-ha',
-    'habitu&eacute',
-    'haboldt',
-    'hadj',
-    'hadlow',
-    'hahgwehdiyu',
-    'hailstorm',
-    'hairdriers',
-    'hairnet',
-    'hakewill',
-    'half-aware',
-    'half-cantons',
-    'half-demolished',
-    'half-deserted',
-    'half-digested',
-    'half-educated',
     'half-human',
-    'half-marathons',
-    'half-pints',
-    'half-points',
-    'half-sections',
-    'half-seven',
-    'half-siblings',
-    'half-sites',
-    'half-stepping',
-    'half-ten',
-    'half-volley',
-    'halfbacks',
-    'halfmeas',
-    'halidi',
-    'halikarnas',
-    'halikarnassus',
     'halkieriids',
-    'hallkeeper',
-    'halloa',
-    'halloo',
-    'halpin-tsai',
-    'haltwhistle',
-    'hamilton-paterson',
-    'hammermen',
-    'hammoudi',
-    'hand-embroidered',
-    'hand-gun',
-    'hand-off',
-    'hand-overs',
-    'hand-sized',
-    'handels',
-    'handicappers',
     'handless',
-    'handpiece',
-    'hanes',
-    'hangnail',
-    'hanmers',
-    'hannes',
-    'hanrahan',
-    'hans-joachim',
-    'hans-wilhelm',
-    'hanscombe',
-    'hansons',
-    'hantavirus',
-    'happenstance',
-    'harasses',
-    'harcourt-browne',
-    'hard-boned',
     'hard-to-get',
-    'hardcard',
-    'hardware-specific',
-    'hardware.intensive',
-    'hardys',
-    'harghita',
-    'harlowe',
-    'harmodios',
-    'harpaz',
-    'harper-collins',
-    'hartill',
-    'harvey-beaumonts',
-    'harvison',
-    'harwin',
-    'harworth',
-    'hashin',
     'hasta_la_vista',
-    'hat-pin',
-    'hatband',
-    'hatbox',
-    'hatorah',
-    'haughton-le-skerne',
-    'haulm',
-    'haulms',
-    'hautefort',
-    'hauz',
-    'havanna',
-    'hawari',
-    'hawk-eyed',
-    'hawkesbury',
-    'hawkhurst',
-    'hawsers',
     'hawtin',
-    'hayes/political',
-    'haziness',
-    'hdc',
-    'hdml',
-    'he-goats',
-    'he/she/it',
-    'heacham',
-    'head-scarves',
-    'head-teacher',
-    'headed-up',
-    'headedness',
-    'headily',
-    'headlock',
-    'headwinds',
-    'hearing-aids',
     'heart-throbs',
-    'heartlessness',
-    'heath-stubbs',
-    'heavings',
-    'hebdomadal',
-    'hedderwick',
-    'heel.',
-    'hefei',
-    'heglund',
-    'heigh-ho',
-    'heigham',
-    'helicoidal',
-    'heliopithecus',
-    'heliopolitan',
-    'hell-raisers',
-    'helles',
     'hellier',
-    'hellifield',
-    'helmawr',
-    'helming',
-    'helmuth',
-    'helwick',
-    'hemicolectomy',
-    'hemler',
-    'hender',
-    'heneaghan',
-    'henjak',
-    'henllan',
-    'hepatorenal',
-    'heppenstall',
-    'her/him',
-    'heraldically',
     'herbaria',
-    'herdwicks',
-    'herle',
-    'herm&eacute;s',
-    'hermanas',
-    'hermaphroditism',
-    'hermeneutical',
-    'hermitian',
-    'herodian',
-    'herrnstein',
-    'hesilrige',
-    'heton',
-    'heyworth',
-    'hezb-e-islami',
-    'hhcl',
-    'high-domed',
     'high-impact',
-    'high-jinks',
-    'high-low',
-    'high-stakes',
-    'high-tec',
-    'high/kelvinside',
-    'highbridge',
-    'higher-dimensional',
-    'higher-priced',
-    'highest-priced',
-    'highest-quality',
-    'highfalutin',
-    'highly-competitive',
-    'highly-polished',
-    'highly-publicised',
-    'highnam',
     'higinbotham',
-    'hilal',
-    'hilar',
-    'hill/gloucestershire',
-    'hillage',
-    'hillis',
-    'hilmar',
-    'hiltons',
-    'him/',
-    'himmel',
-    'hinaidi',
-    'hind-quarters',
-    'hindenberg',
-    'hindmost',
-    'hipness',
-    'hippel',
     'hirsutism',
-    'hispanica',
-    'hispidus',
-    'histologic',
-    'historisches',
-    'hitam',
-    'hitcher',
-    'hm2',
-    'ho-ho',
-    'hochschule',
-    'hocke',
-    'hockett',
-    'holcroft',
-    'hold-alls',
-    'holding-period',
-    'holistically',
     'hollingbury',
-    'holly-tallis',
-    'holmia',
-    'home-like',
-    'homeobox',
-    'homi',
-    'homiletic',
-    'homoeopath',
-    'homosexual/bisexual',
-    'homothetic',
-    'honey-bees',
-    'honores',
-    'hook-ups',
-    'hoolock',
-    'hoop-la',
-    'horology',
     'horoscopic',
-    'horribilis',
-    'horridly',
-    'horse/pony',
-    'horsell',
-    'horsemasters',
-    'hospedaje',
-    'hot-eyed',
-    'hot-wires',
-    'hotcakes',
-    'hotelling',
-    'hotpants',
-    'houari',
-    'hougham',
-    'houlgate',
-    'houndstooth',
     'hourani',
-    'houris',
-    'house-painter',
-    'housen',
-    'housewor',
-    'houy',
-    'hoveton',
-    'howieson',
-    'hp6',
-    'hp8',
-    'hpx',
-    'hpyc',
-    'hrududu',
-    'hs3',
-    'hsls',
-    'huancayo',
     'hub-and-spoke',
-    'huer',
-    'huett',
-    'hugenberg',
-    'huger',
-    'hughlings',
-    'hugill',
-    'hullmandel',
-    'human-sized',
-    'human/dolphin',
-    'humanitarians',
-    'humboldtian',
-    'humidor',
-    'humming-birds',
-    'humourist',
-    'humus-iron',
     'huncote',
-    'huntcliff',
-    'hurly',
-    'hursley',
-    'hurufis',
-    'husband/father',
-    'huzzi',
-    'hydrocephalic',
-    'hydrodynamics',
-    'hydrophane',
-    'hydrothermally',
-    'hygroscopic',
-    'hymas',
-    'hynds',
-    'hyostrongylus',
-    'hyper-active',
     'hyper-bases',
-    'hypercritical',
-    'hypersplenism',
-    'hyphal',
-    'hypnotises',
-    'hypomania',
-    'hypothesizes',
-    'hypsometric',
-    'hysteroscopy',
-    'i-labelled',
-    'i-thou',
-    'i-threes',
-    'i.b.',
-    'i.c.a.c.',
-    'i.h.',
-    'i.i',
     'i.l',
-    'i.r.',
-    'i/2',
-    'i5',
-    'i9',
-    'ibbeth',
-    'ic1d',
-    'iced-up',
-    'icem',
-    'ickringill',
-    'iconograph',
-    'icsl',
-    'idealizes',
-    'ideator',
-    'identifier/client',
-    'identifier/product',
     'identity.',
-    'ideographic',
-    'idiosyncracies',
-    'idiot-proof',
-    'idowu',
-    'ienaga',
-    'iford',
-    'ignazio',
-    'ii.i.',
-    'iii(n)',
-    'iii+',
-    'iii/v',
-    'ikbs/mmi/ai',
-    'ileostomies',
-    'ilkka',
-    'ill-adapted',
     'ill-humoured',
-    'ill-thought-out',
-    'illegalities',
-    'illegals',
-    'iller',
-    'illimitable',
-    'illtyd',
-    'illumines',
-    'illus.l',
-    'illustration/map',
-    'immendorf',
-    'immensities',
-    'immorally',
-    'immunoaffinity',
-    'immunodiffusion',
-    'immunoregulatory',
     'imperturbability',
-    'impingements',
-    'important-looking',
-    'impressionability',
-    'impressionistically',
-    'impressive-looking',
-    'in-bred',
-    'in-thing',
-    'in_,_in_order',
-    'in_,_in_terms_of',
-    'inabilities',
-    'inacio',
-    'inactivates',
-    'inadvertantly',
-    'inapplicability',
-    'inapt',
     'inattentiveness',
-    'inc-ibm',
-    'incalculably',
-    'incase',
-    'inch-high',
-    'inch-long',
-    'inch-perfect',
-    'inclemency',
-    'inclosures',
-    'inclusionary',
-    'incohesion',
-    'income-earners',
-    'incommunicable',
-    'incongruent',
-    'inconnu',
-    'inconsiderately',
     'indebiti',
-    'independently-minded',
-    'indexically',
-    'indiscreetly',
-    'inducers',
-    'industriale',
-    'industriali',
-    'ineffably',
-    'ineptness',
-    'ineradicably',
-    'inexorability',
-    'infatuations',
-    'infield',
-    'infinitude',
-    'inflation-proof',
-    'inflation-proofed',
     'inflexibilities',
-    'informalism',
-    'ingrowth',
-    'inguinale',
-    'inhomogeneity',
-    'inhomogeneously',
-    'initally',
-    'initiatory',
-    'injudiciously',
-    'ink-black',
-    'inmigration',
-    'inner/outer',
-    'innerleithen',
-    'inners',
-    'inornatum',
-    'inotropic',
     'inotta',
-    'insatiably',
-    'insectile',
-    'insider-trading',
-    'insinuatingly',
-    'insistance',
-    'insouciantly',
-    'inspection-houses',
-    'inspectors/advisers',
-    'inspiringly',
-    'instars',
-    'institution.',
-    'instructions.',
-    'insubstantiality',
-    'intaglios',
-    'integrations',
     'intensionally',
-    'inter-active',
-    'inter-connecting',
-    'inter-connections',
-    'inter-provincials',
-    'inter.stimulus',
-    'interactants',
-    'intercedes',
-    'intercessions',
-    'intercessors',
-    'intercessory',
-    'intercirculation',
-    'intercommunion',
-    'interconnectable',
-    'interconversions',
-    'intercostal',
     'interdigestive',
-    'interes',
-    'interest-elasticity',
-    'interleukin-1',
-    'interlinkages',
-    'intermediate-acting',
-    'internship',
-    'interprovincial',
-    'interrupter',
-    'interruptible',
-    'intertestamental',
-    'interviewer(s)',
-    'intifada-related',
-    'intra-arterially',
-    'intra-generational',
-    'intragenomic',
     'intranational',
-    'intraplate',
-    'intratextual',
-    'intraventricular',
-    'introspect',
-    'inundating',
-    'invalidism',
-    'invergarry',
-    'inverses',
-    'investment.',
-    'invitation-only',
-    'invitees',
-    'involvment',
-    'iodosorb',
-    'ipso',
-    'iran-us',
     'irishwoman',
-    'irmgard',
-    'iron-framed',
-    'iron-rimmed',
-    'ironbeard',
-    'irreconcilables',
-    'is-dependent-on',
-    'is-described-by',
-    'is-the-mitsubishi-scratched-yet',
-    'is/are',
-    'is231',
-    'is_in',
-    'isengard',
-    'iskandarov',
-    'iskandrov',
-    'iso9001',
     'isobaric',
-    'isolator',
-    'isoprene',
-    'israeli-egyptian',
-    'israeli-us',
-    'issachars',
-    'issuances',
-    'issue-oriented',
-    'it_were',
-    'iterating',
-    'iv/v',
-    'ixview/sql',
-    'j&amp;b',
-    'j&amp;j',
-    'j&lsqb;x&rsqb',
-    'j&uacute;lio',
     'j.p.m.',
-    'j/24',
-    'ja\'far',
-    'jablonka',
-    'jack2',
-    'jacquemin',
-    'jadeja',
-    'jaelani',
-    'jaggedly',
-    'jagiello',
-    'jahan',
-    'jainism',
-    'jalil',
-    'jalu',
-    'janardhan',
-    'janus-like',
     'japanese-american',
-    'japanese-owned',
-    'jaremko',
-    'jatis',
-    'jayananda',
-    'jean-charles',
-    'jean-pascal',
-    'jeanes',
-    'jelf',
-    'jellett',
-    'jensens',
-    'jeopardites',
-    'jeremiahs',
-    'jerrican',
-    'jerricans',
-    'jesson',
     'jewellry',
-    'jex',
-    'jft',
-    'jiatun',
-    'jie',
-    'jmcs',
-    'jmh',
-    'job-number',
-    'jocky',
-    'joist-ends',
-    'jolande',
-    'jolliest',
-    'jollification',
-    'jollifications',
-    'joong',
-    'journeymole',
     'journeymoles',
-    'jovovich',
-    'joynson',
-    'judg.',
-    'jufti',
-    'jugal',
-    'julianne',
-    'julies',
-    'juncea',
-    'juste',
-    'k.d.',
-    'k.o.',
-    'k6e',
-    'k8',
-    'kaapvaal',
-    'kaena',
     'kaganovich',
-    'kagoul',
-    'kahveci',
-    'kai-foon',
-    'kairaba',
-    'kaj',
-    'kakouetta',
-    'kandal',
-    'kandi',
-    'kandoras',
-    'kanellopoulos',
-    'kanpur',
-    'karamani',
-    'karava',
-    'kardex',
-    'karg-elert',
     'karians',
-    'karka',
-    'karolyi',
-    'karsales',
-    'kawaller',
-    'kayseria',
-    'kc1',
-    'keagan',
-    'keaney',
-    'kearney/thames',
-    'keatings',
-    'keevill',
-    'kefe',
-    'keills',
-    'kellaways',
-    'kelvins',
     'kemp-roth',
-    'kendricks',
-    'kenotic',
-    'kentra',
-    'keplerian',
-    'keri',
-    'kerygma',
-    'kewish',
-    'keyframe',
-    'kf7',
-    'kg/h',
-    'khalatnikov',
-    'khaliq',
-    'khana',
-    'khirgiz',
-    'khlestov',
     'khmelnytsky',
-    'khomeinis',
-    'kibale',
-    'kicks-off',
-    'kidan',
-    'kilcott',
-    'kildale',
-    'kildrummy',
-    'kilford',
-    'killea',
-    'killiecrankie',
-    'killilan',
-    'killybegs',
-    'kilmacolm',
-    'kiloton',
-    'kilotonnes',
     'kilowatt-hours',
-    'kilrea',
-    'kilspindie',
-    'kin-group',
-    'king-murray',
-    'kingsclere',
-    'kinlet',
-    'kinnerton',
-    'kiprono',
-    'kisdon',
-    'kiss-and-tell',
-    'kissable',
-    'kit-bags',
-    'kition',
-    'kitzingen',
-    'kjp',
     'klara-lettkin-strasse',
-    'kleinsorge',
-    'kleitias',
-    'kleptomaniac',
-    'klystron',
-    'km/hr',
-    'knee-capped',
-    'knee-caps',
-    'kneeshaw',
-    'knezovi',
-    'knife-like',
-    'knifeblade',
-    'knifefish',
-    'knifes',
-    'knockdowns',
-    'knossian',
     'knowers',
-    'knowesouth',
-    'knowledgable',
-    'kodras',
-    'koester',
-    'koh-i-noor',
-    'koku',
-    'koliba',
-    'konan',
-    'konjevic',
-    'kopitar',
-    'kopke',
-    'koppes',
-    'kosrae',
-    'kostov',
-    'kouvelas',
     'kox2-related',
-    'kragujevac',
-    'krasnov',
-    'kratzmann',
-    'krefeld',
-    'kreon',
-    'kretschmer',
-    'kreuger',
-    'kriminalpolizei',
-    'kritios',
-    'krustyu',
-    'krystar',
-    'krytrons',
-    'krzaklewski',
-    'kumari',
-    'kundi',
     'kunze',
-    'kupang',
-    'kuria',
-    'kussmaul',
-    'kuttub',
-    'kuwait-iraq',
-    'kuys',
-    'kwanzas',
-    'kyleakin',
-    'kylix',
-    'l\'arrivee',
-    'l\'asie',
-    'l\'espresso',
-    'l\'etat',
-    'l\'etoile',
-    'l\'inspecteur',
     'l\'orient',
-    'l\'osservatore',
-    'l-g-17',
-    'l.j.k.b.',
-    'l/2',
-    'l2164',
-    'l991',
-    'la9',
-    'lab.',
-    'labourites',
-    'lacina',
-    'ladbury',
-    'ladoga',
-    'laevigata',
-    'lafferty/bristol',
-    'lagrimone',
     'laibach',
-    'laicos',
-    'laid-off',
-    'lakeman',
-    'lallu',
-    'laminae',
-    'lamisil',
-    'lampleigh',
-    'lanaghan',
-    'land-',
-    'land-agents',
-    'land-bridges',
-    'landaulet',
-    'landel',
-    'landtage',
-    'langbein',
     'lap-dogs',
-    'laptev',
-    'larak',
-    'large-breasted',
-    'large-strain',
-    'largemouth',
-    'larmer',
-    'larne-stranraer',
-    'laruns',
-    'lasky',
-    'lassalle',
-    'latchcord',
-    'late-acting',
-    'laterolog',
-    'latimeria',
-    'laudesi',
     'launcelot',
-    'laurasian',
-    'lavalle',
-    'lavenza',
-    'lavergne',
-    'laville',
-    'lavington',
-    'lawani',
-    'lawrance',
-    'lazaro',
-    'ldht',
-    'lead-bearing',
-    'leaden-footed',
-    'leadgate',
-    'leaf-litter',
-    'leafield',
     'leanest',
-    'learnedly',
-    'learnings',
-    'learoyd',
-    'leatham',
-    'leathard',
-    'leavenworth',
-    'leavisian',
-    'lebyadkin',
-    'lechuga',
-    'leckford',
-    'lecture/demonstration',
-    'lederle',
-    'lees-milne',
-    'left-circularly',
-    'leftie',
     'leg-like',
-    'leghold',
-    'leiber',
-    'leijonhufvud',
-    'leishmaniasis',
-    'lelands',
-    'lempiras',
-    'lemy',
-    'lenience',
-    'lennard-jones',
-    'lenneberg',
-    'leonino',
-    'leonor',
-    'lernfreiheit',
-    'lerroux',
-    'lesley-anne',
     'lessels',
-    'lesslie',
-    'letterworth',
-    'lettrist',
-    'leucocytosis',
-    'leukaemic',
-    'leumi',
-    'levantines',
-    'levett',
-    'lewinton',
-    'lewknor',
-    'lexifier',
-    'lhw',
-    'li-an',
-    'liability.',
-    'liasing',
     'liberatio',
-    'liberta&ccedil;ao',
-    'libertinism',
-    'libourne',
-    'librations',
-    'licio',
-    'licl',
-    'lief',
-    'liferaft',
-    'lifshitz',
-    'liftmaster',
-    'light-wells',
-    'lightning-fast',
-    'lightpen',
-    'likable',
-    'likangloe',
     'likelihoods',
-    'likhachev',
-    'liklihood',
-    'lilburne',
-    'liles',
-    'lillehammer',
-    'lily-like',
-    'limbert',
-    'lime-free',
-    'limine',
-    'limpsfield',
-    'linchpins',
-    'lindell',
-    'lineamenta',
-    'lineata',
-    'linkenholt',
     'linkman',
-    'linnarz',
-    'linotron',
-    'linv',
-    'lion-hearted',
-    'lipgloss',
-    'lipocalins',
-    'lipopolysaccharide',
-    'lippard',
-    'liquefies',
-    'lisandro',
-    'lisible',
-    'lita',
-    'literacies',
-    'literals',
-    'lithotomy',
     'litigators',
-    'litman',
-    'littledale',
-    'littleover',
-    'liturgists',
-    'liubinskas',
-    'liveborn',
-    'livelong',
-    'liver-stage-specific',
-    'livingstones',
-    'ljaclc',
-    'lk.',
-    'llandyssul',
-    'llanelly',
-    'llanelwedd',
-    'llangernyw',
     'llanilar',
-    'llansantffraid',
-    'llanuwchllyn',
-    'llanwrtyd',
-    'llud',
-    'lm/military',
-    'lmp7',
-    'lobar',
-    'localness',
-    'locationally',
-    'lockie',
-    'locksfields',
-    'locombe-stableford',
-    'locusta',
-    'lodging-houses',
-    'loganberry',
     'lohan',
-    'lohner',
-    'lokendra',
-    'loknath',
-    'lomas/msf',
-    'lomnicky',
-    'londis',
-    'long-departed',
-    'long-disused',
-    'long-finned',
-    'long-hand',
-    'long-since',
-    'long-sought',
-    'longer-dated',
-    'longueville',
-    'lontano',
     'loofahs',
-    'look/sniff',
-    'looking-glasses',
-    'lop-eared',
-    'lorin',
-    'loriod',
-    'loss/damage',
-    'lothbury',
-    'lotu',
-    'loudhailers',
-    'loudun',
-    'loughrea',
-    'lousada',
-    'love-in',
-    'love/hate',
-    'low-necked',
     'lowenstein',
-    'lower-intermediate',
-    'lower-lying',
-    'lowinsky',
-    'loys',
-    'lozanov',
-    'lp2',
-    'lpii',
-    'ls.',
-    'ls1',
-    'lstrain.dat',
-    'ltss',
-    'lubricity',
-    'lucasian',
-    'ludham',
-    'ludlow/shropshire',
     'lugubrious-looking',
-    'luing',
-    'lukens',
-    'lumberjills',
-    'luminaires',
-    'luminoscope&reg',
-    'lumpectomy',
-    'lunchers',
-    'lundberg',
-    'lupe',
-    'lupinus',
-    'lupoi',
-    'lusciously',
-    'lustrian',
-    'luterell',
-    'luxmoore-may',
     'lvnf',
-    'lx-800',
-    'lxii',
-    'lxv',
-    'lxxi',
-    'lxxvi',
-    'lxxxii',
-    'lyddington',
-    'lyellian',
-    'lymphocytosis',
-    'lymphomatous',
-    'lyre-horned',
-    'lysodeikticus',
-    'lyth',
-    'lzw',
-    'm&amp;sup2',
     'm&eacute;li&egrave;s',
-    'm&eacute;xico',
-    'm&egrave;res',
-    'm&ouml;ssbauer',
-    'm&uuml;ller-lyer',
-    'm\'boy',
-    'm\'bro',
-    'm\'naghten',
-    'm.i.t.',
-    'm.p.g',
-    'm.sc.',
-    'm21',
-    'ma-in-law',
-    'mabapa',
-    'mac-on-risc',
-    'maccabee',
     'maccurtain',
-    'maceachan',
-    'mach&eacute',
-    'machairs',
-    'machilidae',
-    'machine-dependent',
-    'machuca',
-    'macillarry',
-    'macintosh-like',
-    'mackenna',
-    'mackennal',
-    'mackenzies',
-    'mackett',
-    'mackies',
-    'mackinder',
-    'mackle',
     'maclehose',
-    'macleish',
-    'macmanaway',
-    'macmaster',
-    'macphee',
-    'macquitty',
-    'macraes',
-    'macro-model',
-    'macroadenoma',
-    'macrobius',
-    'macrophylla',
-    'macsen',
-    'maculatus',
-    'maddren',
-    'madrigalist',
-    'maestoso',
     'mafic',
-    'mafinyani',
-    'magalhaes',
-    'magas',
-    'magirius',
-    'magri',
-    'magritte-giraudon',
-    'mahachi',
-    'mahamidou',
-    'maharashtrawadi',
-    'mahendra',
-    'mahfoud',
-    'mahouts',
-    'maie',
-    'mailable',
-    'mailly-champagne',
     'mainframe-like',
-    'mainland-elected',
-    'mainsforth',
-    'mainsprings',
-    'maio',
-    'major-generals',
-    'makallah',
-    'makoni',
-    'mal&eacute;vich',
-    'malabo',
-    'malapropisms',
-    'malawians',
-    'male-biased',
-    'male-orientated',
-    'male:female',
-    'maleeva-fragniere',
     'malines',
-    'malm&ouml',
-    'malthusians',
-    'malum',
-    'malyne',
-    'mammograms',
-    'man-things',
-    'man-trap',
-    'manageably',
-    'manat',
-    'manchester-born',
-    'manchet',
-    'mandrel',
-    'manea',
-    'mangonel',
-    'maniak',
     'mankulam',
-    'mannoia',
-    'manoel',
-    'manoeuvre-induced',
-    'manometrically',
-    'mantas',
-    'mantel-haenzel',
-    'mantleshelf',
-    'manto',
-    'mantri',
-    'manualists',
-    'map-makers',
-    'mappable',
-    'mapunits',
-    'maquette',
-    'mar&ndash;12',
     'mar&ndash;25',
-    'maralal',
-    'marangos',
-    'maraschino',
-    'marcantonio',
-    'marcelino',
-    'marchesa',
-    'marea',
-    'mariinsky',
-    'marilyns',
-    'marital-rape',
-    'market-wide',
-    'marketings',
-    'markievicz',
-    'markley',
-    'markstone',
     'marmoratus',
-    'marrish',
-    'marrs',
-    'martagon',
-    'martial-law',
-    'martin-gropius-bau',
-    'martyrdoms',
-    'marui',
-    'marxisms',
-    'mary-anne',
-    'masaliyev',
-    'masolino',
-    'massachussetts',
-    'massarik',
-    'masser',
-    'mast-head',
     'masterton',
-    'mat.',
-    'mateer',
-    'matrix-churchill',
-    'matthaeus',
-    'matthiesen',
-    'matthiessen',
-    'mattu',
-    'maturely',
-    'maturers',
-    'matzner',
-    'maumoun',
-    'mauritian',
-    'mauritshuis',
-    'mava',
-    'mawes',
     'mawkishness',
-    'maximalist',
-    'maximum/minimum',
-    'maxwellian',
-    'mayas',
-    'mayhill',
-    'mayoralties',
-    'mayumi',
-    'mbps',
-    'mc-903',
-    'mcanally',
-    'mcaree',
-    'mcbarnet',
-    'mccarley',
-    'mccarthyite',
-    'mccary',
     'mccaughey',
-    'mccleary',
-    'mccloys',
-    'mccolm',
-    'mccolvin',
-    'mcconaghie',
-    'mcgahey',
-    'mcgilchrist',
-    'mcglone',
-    'mcguffog',
-    'mcilwain',
-    'mckane',
-    'mckelvie',
-    'mckerlie',
-    'mckinna',
-    'mclaurin',
     'mclelland',
-    'mcm',
-    'mcnichol',
-    'mcniff',
-    'mcphilips',
-    'mcquillen',
-    'mcreynolds',
-    'mcrobb',
-    'mctell',
-    'mcwalters',
-    'mdi',
-    'meadowses',
-    'mean-minded',
-    'meannesses',
-    'measurer',
-    'mebmt1oh',
     'mecklenburgh',
-    'medi-physics',
-    'meditational',
-    'mediterraneans',
-    'medium-framed',
-    'medium-pacers',
-    'megatonnes',
-    'meiklejohn',
-    'meis',
-    'meja',
-    'melanocorypha',
-    'melburn',
-    'melisande',
-    'melodiously',
-    'membrane-bound',
-    'membury',
     'menageries',
-    'mensah',
-    'mercantilism',
-    'mercurials',
-    'meret',
-    'merfyn',
-    'merkadale',
-    'mervis',
-    'mesas',
-    'meseta',
-    'metabisulphite',
-    'metal-studded',
-    'metal-tipped',
-    'metallers',
-    'metallically',
-    'metalloproteinase',
     'metaphysicians',
-    'metasomatic',
-    'metasomites',
-    'metastrongylus',
-    'metherell',
-    'metonymically',
-    'metrology',
-    'metron',
-    'metsola',
-    'meulan',
-    'meus',
-    'mevagissey',
-    'meynell',
-    'mglu',
-    'mhlaba',
-    'mhuilinn',
     'miaowed',
-    'michaelson',
-    'micro-fossils',
-    'micro-instructions',
-    'micro-political',
-    'micro-processes',
-    'microfilaments',
-    'micrometers',
-    'microprocessor.based',
-    'microsociety',
-    'microtus',
-    'microvillar',
-    'microworld',
-    'mid-17th',
-    'mid-classes',
-    'mid-latitudes',
     'mid-nineties',
-    'mid-period',
-    'mid-town',
-    'middelburg',
-    'middleton-st-george',
-    'midianites',
-    'midspread',
-    'midspreads',
-    'mihailovich',
-    'mihaljcic',
-    'mihaly',
-    'mil&aacute',
-    'milhous',
-    'milieus',
-    'militarists',
-    'military-bureaucratic',
     'milites',
-    'milkie',
-    'mill-ponds',
-    'millerand',
-    'millican',
-    'millthrop',
-    'millworkers',
-    'milometer',
-    'milverton',
-    'mim&eacute;tisme',
-    'minatom',
-    'mind-stretching',
-    'mine-laying',
-    'mineworker',
-    'minhas',
-    'mini-aquarium',
     'mini-leagues',
-    'mini-roundabout',
-    'miniaturists',
-    'minimal.',
-    'minister-president',
-    'ministere',
-    'ministerie',
-    'minisupercomputers',
-    'minora',
-    'minorco',
-    'minoris',
-    'minshull',
-    'miquelon',
-    'mir-nm',
-    'mira-smith',
-    'mirebeau',
     'mirror-images',
-    'miry',
-    'mis-spellings',
-    'misc.',
-    'misdeclaration',
-    'misdirects',
-    'misperceptions',
-    'mispronunciations',
-    'mistiness',
-    'mitev',
-    'mitry',
-    'mix-ups',
-    'mizza',
-    'mk3',
-    'mkapa',
-    'ml/30',
     'mm/h',
-    'mm2',
-    'mnemosyne',
-    'mnsd',
-    'moada',
-    'moamar',
-    'moaners',
-    'moas',
-    'mobilizer',
-    'mock-transfected',
-    'mockford',
-    'moczulski',
-    'mod.',
-    'model-interpretive',
-    'moderate-sized',
-    'modersohn-becker',
     'modulators',
-    'modulatory',
-    'moezzi',
-    'mogens',
-    'mohammed-holgate',
-    'mohne',
-    'moinet',
-    'moist-eyed',
-    'moistens',
-    'moistly',
-    'mol%',
-    'molecule-1',
-    'mollandius',
-    'molotov-ribbentrop',
-    'molucca',
-    'momentously',
     'momir',
-    'momulv',
-    'monadhliath',
-    'mondale',
-    'mondano-in-chianti',
-    'money-conscious',
-    'money-oriented',
-    'money-wages',
-    'moneyspinners',
-    'mongolism',
-    'monitorial',
-    'monna',
-    'monomaniac',
-    'mononucleosis',
-    'monopod',
-    'monopolar',
     'monotraumatic',
-    'monsewer',
-    'monterrey',
-    'montfortians',
-    'moonlike',
-    'moonstones',
-    'moorends',
-    'mooth',
-    'moratoria',
-    'moravia-silesia',
-    'moreish',
-    'morell',
-    'morillo',
-    'morlich',
-    'moroseness',
-    'morphologists',
     'morrill',
-    'morro',
-    'morse/zenith',
-    'morta',
-    'mortifyingly',
-    'morwenna',
-    'mosco',
-    'moth-balled',
-    'motherfuckers',
-    'moti',
-    'motif-like',
-    'motorhomes',
-    'motorwagons',
-    'mottola',
-    'moubarak',
-    'moudud',
     'mountain-sides',
-    'mounth',
-    'moven',
-    'moviewatch',
-    'mp/environment',
-    'mp/foreign',
-    'mroudjae',
-    'ms8',
-    'mszp',
-    'mtp',
-    'much-abused',
-    'much-fancied',
-    'much-favoured',
-    'much-feared',
-    'much-trumpeted',
-    'mucins',
     'mudguard',
-    'muenchberg',
-    'mugemana',
-    'mugen',
-    'muhtarram',
-    'muldowney',
-    'mulroy',
-    'multi-authored',
-    'multi-part',
-    'multi-period',
-    'multi-valued',
-    'multi-variant',
-    'multifasciatus',
-    'multifilament',
-    'multihull',
-    'multilaterals',
     'multimeric',
-    'multipartite',
-    'multiple-section',
-    'multiple.length',
-    'multiprofessional',
-    'multivalent',
-    'mundanely',
-    'municipally',
-    'muralidharan',
-    'muralists',
-    'murri',
-    'murtaza',
-    'mus.',
-    'mushers',
-    'musicianly',
-    'mustardy',
     'mvs/nfs',
-    'mvtr',
-    'mwai',
-    'mwangale',
-    'mx5',
-    'mycologists',
-    'mynah',
-    'myopathic',
-    'myriam',
-    'myrin',
-    'myrtilos',
-    'mystifications',
-    'mystifyingly',
-    'myth-makers',
-    'n&oacute;brega',
-    'n&uuml;rnberg',
     'n\'hampton',
-    'n\'test',
-    'n-linked',
-    'n-nothing',
-    'n-oct-3',
-    'n.e.b.e.',
-    'n.p.',
-    'n.uist',
-    'n5520',
-    'n=14',
-    'n=19',
-    'n=21',
-    'n=25',
-    'nacelles',
-    'nafi',
-    'naggingly',
     'nalson',
-    'nameable',
-    'nang',
-    'nanometre',
-    'nanotubes',
-    'nanton',
-    'narrations',
-    'nasally',
-    'nasey',
-    'nash-wortham',
-    'nasir-ud-din',
-    'nasopharyngeal',
-    'natalya',
-    'nathanael',
-    'nattily',
-    'naturalistically',
     'naude',
-    'naughtier',
-    'naughtiest',
-    'naumburg',
-    'navaids',
-    'navin',
-    'navion',
-    'navona',
-    'nawa',
-    'nazarbaev',
-    'nbx850',
-    'nc5',
-    'nccs',
-    'ndpd',
-    'ne98',
-    'near-black',
     'near-eastern',
-    'near-full',
-    'near-neighbours',
-    'near-normal',
-    'near-sighted',
-    'nearest-neighbour',
-    'neasom',
-    'neatham',
-    'nebular',
-    'neckcloth',
-    'neckties',
-    'nederlands',
-    'nederlandse',
-    'negations',
-    'negombo',
-    'negotio',
     'negs',
-    'neiland',
-    'nemukhin',
-    'neo-darwinian',
-    'nestful',
-    'net-work',
-    'nettl',
-    'network-ready',
-    'neuberg',
-    'neufuz4',
-    'neugebauer-kramer',
-    'neurasthenic',
-    'neurochemical',
-    'neurodegenerative',
-    'neurokinin-1',
-    'neuromodulators',
     'neurotoxins',
-    'neustrian',
-    'never-failing',
-    'nevzorov',
-    'new-minted',
-    'newcastle-liverpool',
-    'newdigate',
-    'newie',
-    'newly-designed',
-    'newman-keuls',
-    'news-sheets',
-    'newsrooms',
-    'newsworthiness',
-    'newtondale',
-    'nf2',
-    'nf6',
     'ngiratkel',
-    'ngl',
-    'ngultrum',
-    'nias',
-    'niazy',
-    'nicey',
-    'nicholai',
-    'nicholson/trainer',
-    'nickel-iron',
-    'nickelodeons',
-    'niederhoffer',
-    'niemoller',
-    'nierendorf',
-    'nightfighter',
-    'nigrum',
-    'nijazi',
     'nikias',
-    'nilgai',
-    'nilghard',
-    'nimble-fingered',
-    'ninereeds',
-    'ninete',
-    'nineteen-sixties',
-    'nineteen-thirties',
-    'nineteen-twenties',
-    'nirje',
-    'nirmal',
-    'nish',
-    'nitida',
-    'nivelles',
-    'njazidja',
-    'nm23',
     'nmod',
-    'nmol/&micro;g',
-    'nn1',
-    'no-through',
-    'no10',
-    'no4',
-    'no_matter_when',
-    'noailles',
-    'nobuil',
-    'noches',
-    'nog',
-    'noissue',
-    'nokomis',
-    'nome-sized',
-    'nomvete',
-    'non&rehy;existent',
     'non-abrasive',
-    'non-accountants',
-    'non-actual',
-    'non-acute',
-    'non-americans',
-    'non-asian',
-    'non-authorised',
-    'non-being',
-    'non-beneficial',
-    'non-binary',
-    'non-black',
-    'non-calcareous',
-    'non-coercive',
-    'non-colonised',
-    'non-combinatorial',
-    'non-complex',
     'non-confidential',
-    'non-conscious',
-    'non-constant',
-    'non-contiguous',
-    'non-covalent',
-    'non-decisions',
-    'non-defective',
-    'non-digital',
-    'non-divided',
-    'non-dreamers',
-    'non-eec',
-    'non-examination',
-    'non-existing',
-    'non-flammable',
-    'non-fluid',
-    'non-genuine',
     'non-gilt',
-    'non-gravitational',
-    'non-hospital',
-    'non-hostile',
-    'non-humans',
-    'non-hygienic',
-    'non-individualistic',
-    'non-industrialized',
-    'non-infectious',
-    'non-ketotic',
-    'non-linearities',
-    'non-medically',
-    'non-membership',
-    'non-musicians',
-    'non-noble',
-    'non-obligatory',
     'non-observable',
-    'non-patented',
-    'non-polyposis',
-    'non-readers',
-    'non-relativistic',
-    'non-repayable',
-    'non-serc',
-    'non-sinusoidal',
-    'non-spanish',
-    'non-sticky',
-    'non-straightforward',
-    'non-synonymous',
-    'non-systematic',
-    'non-toxigenic',
-    'non-transgenic',
-    'non-tuc',
     'non-variceal',
-    'non-venereal',
-    'nonacademic',
-    'nonagenarians',
-    'nonaggression',
-    'noncalcareous',
-    'nondeterminism',
-    'nonexecutive',
-    'nonexistence',
-    'nonfiction',
-    'nonmuscle',
-    'nonparametric',
-    'nonperiodic',
-    'nonwhite',
-    'noordwijk',
-    'nor-man',
     'norberto',
-    'normative-re-educative',
-    'normatively',
-    'northampton-based',
-    'northern-most',
-    'northwesterly',
-    'nose-diving',
-    'not-out',
-    'not-so',
-    'notal',
-    'notata',
-    'notatum',
-    'note-books',
-    'note-combinations',
-    'note-successions',
-    'note-values',
     'notetaking',
-    'noticable',
-    'notum',
-    'noumena',
-    'noureddine',
-    'novell/usl',
-    'npktf',
-    'nswp',
-    'nt5000',
-    'ntoni-nzinga',
-    'nubians',
-    'nucleii',
-    'nucleosynthesis',
-    'nullification',
-    'numa',
-    'numeration',
     'numismatist',
-    'nurdin',
-    'nutku',
-    'nutrient-poor',
-    'nuttiness',
-    'nwrr',
-    'nyanja',
-    'nyheter',
-    'nymphets',
-    'nyrup',
-    'o&amp;m',
-    'o\'byrne',
-    'o\'conner',
-    'o\'day',
-    'o\'faolain',
-    'o\'field',
     'o\'viv',
-    'o.d.',
-    'o.u.p.',
-    'oakwoods',
-    'ob.',
-    'obili&cacute',
-    'objectual',
-    'obligatoriness',
-    'obnoxiously',
-    'obock',
-    'obree',
-    'obsessiveness',
-    'obtrudes',
-    'occupance',
-    'ocellatus',
-    'octapeptide',
     'october&ndash;2',
-    'october-november',
-    'oden',
-    'odiously',
-    'odora',
-    'odoratum',
-    'oecumenical',
-    'oesophagogastroduodenoscopy',
-    'oestrogenic',
-    'of.the',
-    'off-handedly',
-    'off-roaders',
-    'offence.',
-    'offices.',
-    'officialese',
-    'oh-four-one',
     'oh-ho',
-    'ohd',
-    'ohlin',
-    'oiks',
-    'okayama',
-    'ol&eacute',
-    'olarticochea',
-    'old-new',
-    'old-regime',
-    'oldenburgs',
-    'oldland',
-    'oligarch',
-    'oligomeric',
-    'ollero',
-    'olter',
-    'ondaatje',
     'one-class',
-    'one-eleven',
-    'one-for-three',
-    'one-hundred',
-    'one-sixtieth',
-    'one-thirtieth',
-    'one-twos',
-    'onl',
-    'ooh-ah',
-    'oosthuysen',
-    'opaqueness',
-    'open-on',
-    'open-system',
-    'opera-goers',
-    'opercularis',
-    'ophiactis',
     'ophiurinae',
-    'ophthalmoscope',
-    'opinion.',
-    'opossums',
-    'oppidans',
-    'oppidum',
-    'opponants',
-    'opportunites',
-    'oppositifolia',
-    'opran',
-    'oprichnina',
-    'opsahl',
-    'opthalmic',
-    'optimizes',
-    'optrex',
-    'or_at',
     'oral-facial',
-    'orangeade',
-    'orat.',
-    'orazio',
-    'orbell',
-    'ordinals',
-    'orenburg',
-    'organicism',
-    'organochlorides',
-    'organotypic',
-    'orientalium',
-    'orients',
-    'oriole',
-    'ornee',
-    'orthorhombic',
-    'oruene',
     'osawa',
-    'osi/dtp',
-    'osiander',
-    'osten',
-    'osterley',
-    'ostralegus',
-    'otford',
-    'otic',
-    'otkel',
-    'ottershaw',
-    'oughtibridge',
-    'ouspensky',
-    'out-of',
-    'out-stations',
-    'out-stretched',
-    'outcroppings',
     'outdoes',
-    'outfielder',
-    'outgas',
-    'outgun',
-    'outpaces',
-    'outrageousness',
-    'outrance',
-    'outskirters',
-    'outward-going',
-    'ovcharov',
-    'over-attachment',
-    'over-estimation',
-    'over-excitement',
-    'over-exertion',
-    'over-exploit',
-    'over-simplistic',
     'over-specification',
-    'overbook',
-    'overlookers',
-    'overmighty',
-    'oversimplistic',
-    'overspecialization',
-    'oversubscription',
-    'overtaxing',
-    'overvaluation',
-    'owlets',
-    'owner-directors',
-    'oxendown',
-    'oxymoron',
-    'ozanne',
-    'ozone-depleted',
-    'ozone-rich',
     'p&lt;0.0002',
-    'p&lt;0.025',
-    'p-90',
-    'p.10',
-    'p.100',
-    'p.1067',
-    'p.218',
-    'p.25',
-    'p.32',
-    'p.35',
-    'p.57',
-    'p.64',
-    'p.68',
-    'p.70',
-    'p.80',
-    'p.82',
     'p.83',
-    'p.91',
-    'p.98',
-    'p.e.s.p.',
-    'p.r.s.',
-    'p0.05',
-    'p1/lp0',
-    'p104',
-    'p106',
-    'p108',
-    'p114l',
-    'p2/t4',
-    'p21/',
-    'p3/ns',
-    'p39',
-    'p4/t2',
     'p52/',
-    'p77',
-    'p99',
-    'p=0.008',
-    'p=0.009',
-    'p=0.014',
-    'p=0.015',
-    'p=0.25',
-    'p=0.4',
-    'p=0.63',
-    'pa\'anga',
-    'pace-egg',
-    'pacifically',
-    'pacifics',
-    'package(s)',
-    'packet-switched',
     'packmen',
-    'padgate',
-    'paek',
-    'paestra',
-    'pagi',
-    'pagnamenta',
-    'paisiello',
-    'paisleyites',
-    'palacath',
-    'palaeogeothermal',
-    'palaeomagnetism',
-    'palatina',
-    'palernians',
-    'palestine/israel',
-    'palgrave',
-    'pallon',
     'palm-thatched',
-    'palmettes',
-    'palpating',
-    'palynological',
-    'pan-national',
-    'pancreatography',
-    'panga',
-    'panicles',
-    'pankaj',
-    'panne',
-    'panthic',
-    'pantomimic',
-    'pantothenic',
-    'par&aacute',
-    'paracetamols',
-    'paraffins',
     'parallel-group',
-    'parapsychological',
-    'parent-governors',
-    'parent/teacher',
-    'paris-brussels',
-    'paris-match',
-    'park/courtesy',
-    'parkinson-like',
-    'parlez-vous',
-    'parlourmaids',
-    'parodi',
-    'paroxysmal',
-    'parsings',
-    'part-funded',
-    'part-songs',
-    'partb',
     'parthians',
-    'participations',
-    'party-military',
-    'party-poopers',
-    'parun',
-    'pasanda',
-    'pascual',
-    'pasifika',
-    'passet',
-    'passionnel',
-    'passivation',
-    'pasty-faced',
-    'patas',
-    'patek',
-    'paternalistically',
-    'pathologization',
     'patient/client',
-    'patri&oacute;tico',
-    'patriarchates',
-    'patriciate',
-    'patricks',
-    'patroclus',
-    'patronymic',
-    'patternless',
-    'paul-marie',
-    'paw-o-vision',
-    'pay-beds',
-    'payd',
-    'pbendu',
-    'pbys',
-    'pc-x',
-    'pc/nfs',
     'pc/xt',
-    'pc12',
-    'pcrs',
-    'pdcneo',
-    'peahen',
-    'pearl-grey',
-    'peasenhall',
-    'peculation',
-    'peculier',
-    'pederast',
-    'pedestrianising',
-    'pego',
-    'pekka',
-    'pemell',
-    'pempie',
-    'pemsel',
     'pencaitland',
-    'pendre',
-    'penketh',
-    'penmaen',
-    'penologists',
-    'pentane',
-    'pentium-only',
-    'penyffordd',
-    'people-oriented',
-    'peoria',
-    'pepperoni',
-    'pepsinogens',
-    'peptidyl-prolyl',
-    'peramuna',
-    'percale',
-    'perchloric',
     'peregrinus',
-    'performatives',
-    'pergascript',
-    'periastron',
-    'pericarditis',
-    'periclymenum',
-    'periconceptional',
-    'periodicities',
-    'peripheralization',
-    'perishers',
-    'peristyles',
-    'perithecium',
-    'perkiness',
-    'peroni',
-    'persatuan',
-    'persistency',
     'personalizes',
-    'pervasively',
-    'pesaran',
-    'pestana',
-    'petherington',
-    'petit-clamart',
-    'petrographers',
-    'petromed',
-    'petromizer',
-    'petterson',
-    'pettinger',
-    'petty-commodity',
-    'pfrc64',
-    'pfs:windowworks',
-    'pg/h',
-    'pgex2t',
     'ph&lt;4',
-    'phallocentrism',
-    'pharmaceutica',
-    'pharmacokinetic',
-    'phaw',
-    'phg',
-    'philippines-marxist',
-    'phillippe',
-    'philonous',
-    'phlebitis',
-    'phlegmatically',
-    'phlegmy',
-    'phls',
-    'phonies',
-    'phoniness',
-    'phonolexical',
     'phosphatidylcholines',
-    'photochemically',
-    'photocopiable',
-    'photogeology',
-    'photostyler',
-    'phototh&egrave;que',
-    'phra',
-    'phrenologist',
-    'phthalo',
-    'phytic',
-    'phytoliths',
-    'pi&egrave;ce',
-    'pi/open',
-    'picato',
-    'pickmen',
-    'pickworth',
     'picture-window',
-    'pictures/tim',
-    'piece-rates',
-    'pierre-louis',
-    'pig-tailed',
-    'pikedaw',
-    'pillowing',
-    'pimento',
-    'pinderfields',
-    'pintada',
-    'pintar',
-    'pintas',
-    'piola',
-    'piperazine',
-    'piperidine',
-    'pirogues',
     'pissed-off',
-    'pit-stops',
-    'pitch-support',
-    'pitchblende',
-    'pitnacree',
-    'pittenweem',
-    'pjel126',
-    'pjel152',
-    'pl28',
-    'plaguey',
-    'plane-trees',
-    'planeload',
-    'plaquettes',
-    'plascrystal',
-    'plastic-coated',
-    'plastov',
     'platers',
-    'plawsworth',
-    'playaway',
-    'playbacks',
-    'player/manager',
-    'playing-cards',
-    'playing-fields',
-    'playlet',
-    'pleached',
-    'plectrums',
-    'pledger',
-    'plenipotentiaries',
-    'pleurites',
-    'ploughable',
-    'plugge',
-    'plumptry',
     'plumridge',
-    'plunderers',
-    'pluralities',
-    'pluripotent',
-    'plushy',
-    'pmmlib.gimmsmap1',
-    'pmnl',
-    'pmol/',
-    'pmsd',
-    'pmt2',
-    'pneumophila',
-    'pnk',
-    'pnpp',
-    'po1',
-    'pohnpei',
-    'pointillism',
     'poiseuille',
-    'pokhari',
-    'pol.',
-    'polders',
-    'polemaster',
-    'poleniers',
-    'poley',
-    'police-community',
-    'policy-oriented',
-    'poliii',
-    'political/economic',
-    'political/military',
-    'politico-religious',
-    'pollitzer',
-    'polmont',
-    'polska',
     'polwhele',
-    'poly(tetrafluoroethylene)',
-    'polyb.',
-    'polychlorinatedbiphenyls',
-    'polyester/cotton',
-    'polysymptomatic',
-    'polytheists',
-    'polytraumatic',
-    'ponant',
-    'pondfish',
-    'pondwater',
-    'pongpanit',
-    'ponselle',
-    'pooches',
-    'pooh-bah',
-    'poosie',
     'pop-soul',
-    'poppadums',
-    'populariser',
-    'popularism',
-    'porchway',
-    'porthtowan',
-    'portsoy',
-    'portuguese-',
-    'portway',
-    'poshest',
-    'positiveness',
-    'possuelo',
-    'post-biblical',
-    'post-card',
-    'post-chernobyl',
-    'post-darwinian',
     'post-dates',
-    'post-dating',
-    'post-era',
-    'post-ministerial',
-    'post-placement',
-    'post-stalin',
-    'post-tiananmen',
-    'post-transcriptional',
-    'postfeminist',
-    'postive',
-    'postverbals',
-    'potvin',
-    'pouch-anal',
-    'pouch-like',
-    'pound-dollar',
-    'poundians',
     'power-crazed',
-    'power-looms',
-    'power-mad',
-    'power/knowledge',
-    'powerboaters',
-    'powerlock',
-    'powlett',
-    'ppss',
-    'praga',
-    'prandy',
-    'prangs',
-    'praphat',
-    'prayerbook',
-    'pre-1986',
-    'pre-20th',
-    'pre-british',
     'pre-classical',
-    'pre-coded',
-    'pre-compiled',
-    'pre-democratic',
-    'pre-electoral',
-    'pre-emptively',
-    'pre-ernie',
-    'pre-filters',
-    'pre-final',
-    'pre-gulf',
-    'pre-insulated',
-    'pre-keynesian',
-    'pre-maastricht',
-    'pre-meditated',
-    'pre-morbid',
-    'pre-nhs',
     'pre-poll',
-    'preadolescent',
-    'preantennal',
-    'prebendal',
-    'precipitations',
-    'precociousness',
-    'predestinarianism',
-    'preeminently',
-    'preformationist',
-    'premolar',
-    'prenominally',
-    'preprogastrin',
-    'prepyloric',
-    'prescientific',
-    'presciently',
-    'preservationist',
     'presidentially',
-    'presly',
-    'press&eacute',
-    'press-cuttings',
-    'pressure-dependent',
-    'pressureless',
-    'prestonfield',
-    'prestre',
-    'presumptuously',
-    'preuss',
-    'prevarications',
-    'prilep',
-    'principalship',
-    'prioritizes',
-    'priority.',
-    'prison-ships',
     'privatisers',
-    'pro-actively',
-    'pro-aristide',
-    'pro-ershad',
-    'pro-indian',
-    'pro-iraq',
-    'pro-russian',
-    'proband',
-    'problem-centred',
-    'process-oriented',
-    'procles',
-    'procumbens',
-    'procurers',
-    'produceth',
-    'product-specific',
-    'product/market',
     'profanation',
-    'professedly',
-    'proffitt',
-    'profit-motivated',
-    'program-level',
-    'progressive-minded',
-    'progressivist',
-    'prokaryote',
-    'prokhorov',
-    'prokofyev',
-    'proline-rich',
-    'promethazine',
-    'prominenti',
-    'promotable',
-    'promotive',
-    'promotor',
     'propagandistic',
-    'propellor',
-    'prophylactically',
-    'propshaft',
-    'proselytism',
-    'prosperously',
-    'prostanoids',
-    'prosthetist',
-    'prostituting',
-    'prostrating',
-    'proteolysis',
-    'prothoracic',
-    'provincially',
-    'prudes',
-    'pryke',
-    'pseudorandom',
     'psf',
-    'psikhushka',
-    'psionic',
-    'pspc',
-    'psycho-geriatric',
-    'psychometrically',
-    'pterines',
-    'pterodactyls',
-    'public-works',
-    'puddletown',
-    'puff-ball',
-    'pull-through',
-    'pulman',
-    'puls',
-    'pumped-up',
-    'punchier',
     'pungens',
-    'punt-pole',
-    'puolue',
-    'pur&eacute;pecha',
-    'purblind',
-    'purgation',
-    'push/pull',
-    'pusilla',
-    'pusillanimity',
-    'put-you-up',
-    'putiatin',
-    'puttees',
-    'puttenham',
-    'puy-de-dome',
-    'pycnogonids',
-    'pyons',
     'pyridoxine',
-    'pythonesque',
-    'qapackmax',
-    'qc.',
-    'qcd',
-    'qtr-finals',
-    'quadrata',
-    'quagga',
-    'quality-adjusted',
-    'quandaries',
-    'quantative',
-    'quarterbacks',
-    'quasi-colonial',
-    'quasi-political',
-    'quat\'',
-    'quaysides',
     'queering',
-    'quells',
-    'questionably',
-    'questionings',
-    'quicke',
-    'quietens',
-    'quillons',
-    'quiney',
-    'r&amp;h',
-    'r&eacute;p&eacute;titeur',
-    'r&eacute;sistance',
-    'r&iacute;o',
-    'r&uuml;desheim',
-    'r-c',
-    'r.5',
-    'r.a.d.d.',
     'r.a.f.a.',
-    'r.s.p.c.a.',
-    'r/c',
-    'r1.1',
-    'r2.1',
-    'r2.2',
-    'r4.2(2)',
-    'r4000mp',
-    'r4000sc',
-    'r_',
-    'ra.',
-    'rabbit-holes',
-    'rabina',
-    'rachaiah',
-    'racier',
-    'radio-friendly',
     'radiocaesium',
-    'radnaasumbereliyn',
-    'raffel',
-    'ragazza',
-    'raggedness',
-    'ragland',
-    'railworks',
-    'rain-softened',
-    'rainfalls',
-    'raisons',
-    'rajathuk',
-    'rake-off',
-    'ramadhin',
-    'ramrod-straight',
-    'ramsbotham',
-    'randalls',
     'randhir',
-    'ransfer',
-    'rapanelli',
-    'rapson',
-    'rarefaction',
-    'rashidi',
-    'ratafias',
-    'rathmullan',
-    'ratlines',
-    'rattenberg',
-    'raubvogel',
-    'raunchiest',
-    'raven-black',
-    'ravensdale',
-    'raworth',
-    'rayigam',
     'razumikhin',
-    'rbyc',
-    'rcgp',
-    'rcj',
-    'rcvs',
-    're&ndash;organisation',
-    're-activation',
-    're-adjustments',
-    're-adoption',
-    're-affirm',
-    're-arm',
-    're-configurable',
-    're-configure',
-    're-contra',
-    're-creates',
-    're-dedicated',
     're-drawn',
-    're-emigration',
-    're-engaging',
-    're-erect',
-    're-establishes',
-    're-fuel',
-    're-grow',
-    're-introduces',
-    're-style',
-    're-survey',
-    'reactivates',
-    'readdress',
-    'reader-dominated',
-    'reagans',
-    'reali',
-    'rearwards',
     'reasonably-sized',
-    'rebirths',
-    'recaff',
-    'recantations',
-    'recently-appointed',
-    'reception.',
-    'reclusiam',
-    'recolonise',
-    'recommencement',
-    'recommences',
-    'reconceptualisation',
-    'reconceptualization',
-    'recreationally',
-    'recruit-cosmos',
-    'recrystallization',
-    'rectally',
     'rectifiers',
-    'red-veined',
-    'redesignate',
-    'redmayne',
-    'redressement',
-    'redwings',
-    'reevaluation',
-    'reeve/oxford',
-    'ref.16',
-    'referrers',
-    'refin',
-    'reg\'lar',
-    'regalist',
-    'regionalists',
-    'registry.',
-    'regulationism',
     'reichel',
-    'reichmarks',
-    'reichsbank',
-    'reimbursements',
-    'reincorporate',
-    'reinscribe',
-    'reinvention',
-    'reinz',
-    'relativistically',
-    'relaxants',
-    'relentlessness',
-    'relic-seller',
-    'relievable',
-    'remanence',
-    'remeynes',
-    'remonstrations',
     'remounting',
-    'renaie',
-    'renationalization',
-    'renault/volvo',
-    'renilworth',
-    'rennell',
-    'renovaci&oacute;n',
-    'reoccurrence',
-    'reopenings',
-    'repetitiousness',
-    'reponsibility',
-    'reptans',
-    'repulsively',
-    'requires-binary-of',
-    'reroute',
-    'resizable',
     'resochin',
-    'resolution.',
-    'respect_of',
-    'respectable-looking',
-    'restage',
-    'restitutive',
-    'restrictors',
-    'restyle',
-    'resurrections',
-    'retable',
-    'retie',
-    'retried',
-    'retrosternal',
-    'retrovizor',
-    'retum',
-    'retying',
     'revanche',
-    'reverences',
-    'reversioner',
-    'revigny',
-    'revisers',
-    'reviseur',
-    'revolution.',
-    'rffs',
-    'rg1',
-    'rhinestones',
-    'rhiw',
-    'rhoades',
-    'rhomboidal',
-    'rhombomere',
-    'rhydd',
-    'rhyolitic',
     'riaz',
-    'ribvaria',
-    'riddings',
-    'riek',
-    'right-handers',
-    'right-off',
-    'rightwinger',
-    'righty',
-    'rijn',
-    'ring-pulls',
-    'ringhals',
-    'ringmere',
-    'riopelle',
-    'riquard',
-    'risborough/buckinghamshire',
-    'risinghurst',
     'rital',
-    'ritschlian',
-    'riverview',
-    'rjb',
-    'rlf',
-    'rnasin',
-    'road-traffic',
-    'robinson/solicitor',
-    'rock-climbers',
-    'rock-rock-rock-rock-rocket',
-    'rock-steady',
-    'rock/blues',
-    'rocket-launchers',
-    'rocketry',
-    'rockfalls',
-    'roda',
     'rodgerson',
-    'roelandts',
-    'roll-ups',
-    'romande',
-    'romanization',
-    'romanticisation',
-    'romanyshyn',
-    'rombalds',
-    'ronell',
-    'roof-tiles',
-    'roofscape',
-    'roomier',
-    'roommates',
-    'roosen',
-    'roosters',
-    'root-ball',
     'rootlessness',
-    'roscrea',
-    'rose-ann',
-    'roshier',
-    'rostrata',
-    'rotundity',
-    'rou&eacute',
-    'rough-haired',
-    'rough-legged',
-    'round-britain',
-    'roundback',
-    'roundshot',
-    'roundsman',
-    'roundworm',
-    'routeway',
-    'routings',
     'roves',
-    'row/column',
-    'rowboat',
-    'roworth',
-    'rows.',
-    'rowthorne',
-    'rpbs',
-    'rsdg',
-    'rsp',
-    'rub&eacute;n',
-    'ruffell',
-    'ruggerio',
-    'ruggles-brise',
-    'rule-books',
-    'ruli',
-    'rumar',
     'rummas',
-    'rumpy',
-    'run-around',
-    'ruralism',
-    'russian-populated',
-    'rustaveli',
-    'rutbah',
-    'ruydiez',
-    'ryberg',
-    'rychner',
-    'ryelands',
-    'ryley/oxford',
-    'ryley/reporting',
-    'ryt&iacute&rcaron;sk&aacute',
-    'ryzkhov',
-    'rzb',
     's&amp;dr',
-    's&amp;r',
-    's***',
-    's-a-s',
-    's-vhs',
-    's.1(1)',
-    's.2(2)',
-    's.26',
-    's.4(1)',
-    's.5(2)',
-    's.58',
-    's.94(5)',
-    's.99',
-    's.a.e',
-    's.c.e.',
-    's.n.m.',
     's.p.r.l.',
-    's1(3)',
-    's100',
-    's110',
-    's1264',
-    's132',
-    's13a(2)',
-    's18(2)',
-    's48(4)',
-    's5(1)',
-    's62',
-    's65',
-    's67',
-    's670',
-    's683',
-    's69',
     's69(2)',
-    's739(1)',
-    's77',
-    'saas',
-    'sabel',
-    'sachsenhausen',
-    'sacristan',
-    'sacy',
-    'saddlebrook',
-    'saed',
-    'saettler',
-    'safety-belt',
-    'saffran',
-    'saffron-coloured',
-    'safranes',
-    'sagrajas',
     'saha',
-    'saidu',
-    'saifullah',
-    'sailboats',
-    'sailplane',
-    'saint-l&eacute;on',
-    'saint-lazare',
-    'saint-s&auml;ens',
-    'sainte-marie',
-    'saipan',
-    'sales-off',
-    'salespersons',
-    'salmi',
-    'salomes',
-    'salpingitis',
-    'salterton',
     'salvagers',
-    'saly',
-    'sammarinese',
-    'sanaig',
-    'sand-textured',
-    'sandage',
-    'sandall/wiltshire',
-    'sandgrounders',
-    'sandholme',
-    'sandostatin',
-    'sandrats',
-    'sandwick',
-    'sandy-lignites',
-    'sangatte',
-    'sanitise',
-    'sanitiser',
     'santilli',
-    'santorin',
-    'saphenous',
-    'sarsfield',
-    'sasoo',
-    'sassetta',
-    'satchwell',
-    'satin-smooth',
-    'sating',
-    'satirising',
-    'satirizes',
-    'satnam',
-    'saucerful',
-    'sauers',
-    'saunby/scotland',
-    'saussurian',
     'sauveterre',
-    'savas',
-    'save&mdash;set',
-    'savilian',
-    'saward',
-    'sawers',
-    'saxaphone',
-    'saxe-coburg-gotha',
-    'saxman',
-    'sayce',
-    'sbg',
-    'sc13',
-    'scaffolders',
-    'scapegrace',
-    'scapulae',
-    'scarff',
     'scarsborough',
-    'scarva',
-    'scd',
-    'scena',
-    'schantz',
-    'schatz',
-    'schmaltzy',
-    'schmuller',
-    'schonell',
-    'school-level',
-    'schoolbus',
-    'schupfheim',
-    'schweins',
-    'scimitars',
-    'scintigrams',
-    'sciolla',
     'scipione',
-    'sclerotic',
-    'scorches',
-    'scoticum',
-    'scranton',
-    'screwworm',
-    'scrofulous',
-    'scroller',
-    'scruffiest',
-    'scrump',
-    'sdn',
-    'sdos',
-    'sdpr',
-    'sds/page',
-    'se&eacute;s',
-    'se-100',
     'se5',
-    'sea-battle',
-    'sea-lanes',
-    'sea-walls',
-    'seabeasts',
-    'seagen',
-    'sealpoint',
-    'sealstone',
-    'seamanlike',
-    'searleman',
-    'seasonally-adjusted',
-    'sebastiana',
-    'secano',
-    'second-home',
-    'secondary-modern',
-    'sedentarius',
     'sedlmayer',
-    'seelpi',
-    'segonzac',
-    'seigel',
-    'seine-et-marne',
-    'seldom-used',
-    'selectional',
-    'self-alienation',
-    'self-builders',
-    'self-confessedly',
-    'self-deceptions',
-    'self-enclosed',
-    'self-hypnosis',
-    'self-select',
-    'self-sustained',
-    'selfconscious',
     'selfconsciously',
-    'seljuk',
-    'sellar',
-    'semanticists',
-    'semesters',
-    'semi-aquatic',
-    'semi-colonial',
-    'semi-colons',
-    'semi-dry',
-    'semi-serious',
-    'semi-solid',
-    'semi-sweet',
-    'semi-tone',
-    'semicircles',
-    'semicolons',
-    'semifinals',
     'semipalatinsk',
-    'semites',
-    'semitonal',
-    'sending-in',
-    'seniority-based',
-    'senlis',
-    'sennybridge',
-    'sense-sphere',
-    'separability',
-    'separative',
-    'sequestrations',
-    'sequoias',
-    'serbrock',
-    'serf-owning',
-    'sergeyev',
-    'sergt.',
     'serious-looking',
-    'seroconversions',
-    'serosa',
-    'serow',
-    'serpa',
-    'service-users',
-    'sescas',
-    'sestet',
-    'set-square',
-    'settlements.',
-    'seven-tenths',
-    'seven-try',
-    'seventeen-year-olds',
-    'severities',
-    'severo',
-    'sexological',
     'sexualization',
-    'sha-la-la',
-    'shackell',
-    'shadier',
-    'shadrach',
-    'shahal',
-    'shahnawaz',
-    'shahrur',
-    'shakeout',
-    'shakespears',
-    'shalala',
-    'shalford',
-    'shami',
-    'shannies',
-    'shapelessness',
-    'shapinsay',
     'sharedealers',
-    'sharp-tongued',
-    'sharp-toothed',
-    'sharratt',
-    'shatford',
-    'shatost',
-    'shatwell',
-    'shaw/prisoner',
-    'she-who-is-alone',
-    'she/pandora',
-    'sheep/hectare',
-    'shelima',
-    'shenyang',
-    'shergolds',
-    'sheriffship',
-    'shews',
     'shiffrin',
-    'shiksa',
-    'shillcock',
-    'shio',
-    'shiromani',
-    'shirtwaister',
-    'shneidman',
-    'shoe-laces',
-    'shoeing-smiths',
-    'shop-fronts',
-    'short-handled',
-    'short-priced',
-    'shortlists',
-    'shortly.',
-    'shostakovsky',
-    'show-stoppers',
     'showin\'',
-    'shridath',
-    'shrugged.',
-    'shunichi',
-    'sial',
-    'sialkot',
-    'sibbes',
-    'sibilance',
-    'side-lanes',
-    'side-reins',
-    'side-roads',
-    'side-sheets',
-    'side-steps',
-    'sidecars',
-    'sidefoot',
-    'sidesman',
     'sidespin',
-    'sidki',
-    'siebert',
-    'siegal',
-    'siege-engines',
-    'sigel',
-    'sigered',
-    'sign-posts',
-    'silicic',
-    'silk-lined',
-    'silted-up',
-    'silverado',
-    'silvino',
-    'similar-looking',
-    'simulationist',
-    'singer/',
     'single-glazed',
-    'single-positive',
-    'single-storeyed',
-    'singlets',
-    'sino-russian',
-    'sio4',
-    'sirikit',
-    'sirisamphan',
-    'sisavat',
-    'sister-party',
-    'sitars',
-    'sitrep',
-    'situs',
-    'six-time',
-    'sk740',
-    'skdl',
     'skeggs',
-    'skelding',
-    'skep',
-    'sketchier',
-    'sketchiness',
-    'skilfulness',
-    'skillfully',
-    'skilton',
-    'skirving',
-    'slabbert',
-    'slack-jawed',
-    'slalomists',
-    'slate-coloured',
-    'slayings',
-    'sleazeball',
-    'sleekest',
     'sleepier',
-    'slightly-built',
-    'sligo/mullingar',
-    'slit-like',
-    'slow-selling',
-    'slum-dwellers',
-    'slyness',
-    'small-leaved',
-    'smederovo',
-    'smelliest',
-    'smil',
-    'smithard',
-    'smokable',
-    'smokehouse',
-    'smolsky',
-    'sn-w',
     'snagsby',
-    'snarl-up',
-    'snia',
-    'sniffable',
-    'snorer',
-    'snow-bound',
-    'snow-free',
-    'snowplough',
-    'snowy-white',
-    'snrna',
-    'snrs',
-    'snuffbox',
-    'snyders',
-    'so13',
-    'soap-based',
-    'sober-suited',
     'sobre',
-    'socage',
-    'soccer-mad',
-    'socialisme',
-    'sociedade',
-    'socio-ecological',
-    'socio-medical',
-    'sociopath',
-    'sockliner',
-    'sofres',
-    'software-only',
-    'software.',
-    'sojourner',
-    'sokolnitz',
-    'solar-wind',
-    'solaris-on-sparc',
     'soldern',
-    'solidaristic',
-    'sollers',
-    'solubilisation',
-    'somalians',
-    'somesuch',
-    'son-hee',
-    'sonatrach',
-    'sonnenberg',
-    'sonography',
-    'sooo',
-    'soot-blackened',
-    'soozi',
-    'sophisms',
-    'sopot',
-    'sorabi',
     'sorceries',
-    'sottish',
-    'soubrette',
-    'sought-for',
-    'soul-less',
-    'soul-mates',
-    'soulages',
-    'soulsby',
-    'soumaila',
-    'sound-effects',
-    'sound-level',
-    'sound-track',
-    'soundbox',
-    'sounders',
-    'soupcon',
-    'sourrouille',
     'southwesterly',
-    'southwestwards',
-    'sovereignties',
-    'soviet-afghan',
-    'soviet-cuban',
-    'soviet-dominated',
-    'sp/ps',
-    'space-filled',
-    'space/time',
-    'spains',
-    'spanish-',
-    'sparccard',
-    'specrate&mdash;int92',
-    'spectrographs',
-    'spellcheckers',
-    'spencer-churchill',
     'spicoli',
-    'spidergobs',
-    'spilitic',
-    'spillard',
-    'spin-1',
-    'spiralis',
-    'spirituali',
-    'spiritualities',
-    'spiros',
-    'spittoon',
-    'spittoons',
-    'spix',
-    'splendoured',
-    'splenectomy',
-    'split-half',
-    'split-site',
     'sponge-like',
-    'spongiosum',
-    'spooled',
-    'spoon-feeding',
-    'sportsdesk',
-    'sprawlers',
-    'spreadbury',
-    'springs-based',
-    'sprogs',
-    'sprue',
-    'spss/pc+',
-    'sq._m.',
-    'sql/400',
-    'square-shaped',
-    'squircles',
-    'squyer',
     'sr/',
-    'ss1',
-    'ssts',
-    'st&auml;nderat',
-    'st-honor&eacute',
-    'st-martin',
-    'st-nom-la-breteche',
-    'st62',
-    'stabler/gloucestershire',
-    'staddon',
-    'staechmann',
-    'staff-cabins',
-    'staider',
-    'stain-resistant',
-    'stainby',
-    'stainton-kelly',
     'stalemates',
-    'stalham',
-    'stamens.',
-    'stancombe',
-    'standley',
-    'stanegate',
-    'stannards',
-    'starfishes',
-    'starfruit',
-    'starodubtsev',
-    'state-like',
-    'statelets',
-    'statens',
-    'states-backed',
-    'statni',
-    'stauffenberg',
     'staverman',
-    'stay-at-homes',
-    'steakhouse',
-    'steambath',
-    'steatite',
-    'steeliness',
-    'steely-eyed',
-    'steeton',
-    'stefani',
-    'stefanos',
-    'steinheim',
-    'step-grandparents',
-    'step-wise',
-    'stephanurus',
-    'stepmothers',
-    'stepmum',
     'stereoscope',
-    'sterritt',
-    'stewardships',
-    'stewartstown',
-    'stihl',
-    'stillroom',
-    'stimmen',
-    'stimulative',
-    'stingers',
-    'stingingly',
-    'stink-bomb',
-    'stinting',
-    'stitch-up',
-    'stoas',
-    'stockinette',
-    'stockyards',
     'stogdon',
-    'stoja',
-    'stojane',
-    'stomper',
-    'stone-paved',
-    'stonebench/gloucestershire',
-    'stonefish',
-    'stony-hearted',
-    'stop-overs',
-    'stopcocks',
-    'stopping-off',
-    'store/restore',
-    'storm-damaged',
-    'story-lines',
-    'stown',
-    'stows',
     'strahov',
-    'strai',
-    'strait-jackets',
-    'straitjackets',
-    'stranglings',
-    'straps/attachment',
-    'stratigraphers',
-    'streamlet',
-    'streamliners',
-    'strebel',
-    'streptocarpus',
-    'string-like',
-    'striplights',
-    'strongs',
-    'strongyle',
-    'structural-functional',
     'struldbrugs',
-    'studdert',
-    'studenica',
-    'students/trainees',
-    'study*',
-    'stx',
-    'styleless',
-    'stylolite',
-    'sub-adult',
-    'sub-bands',
-    'sub-classes',
-    'sub-functions',
-    'sub-lunar',
-    'sub-markets',
-    'sub-population',
-    'sub-problems',
     'sub-skills',
-    'sub-teams',
-    'sub-texts',
-    'subassembly',
-    'subdues',
-    'subgenre',
-    'subhead',
-    'subject-orientated',
-    'subject-predicate',
-    'sublevels',
-    'subproblems',
-    'subramaniam',
-    'subregulus',
-    'subrents',
-    'subsidization',
-    'substages',
     'subtenancy',
-    'subtend',
-    'subulata',
-    'subversively',
-    'subversiveness',
-    'succ',
-    'succ&egrave;s',
-    'succesfully',
-    'success/failure',
-    'succinic',
-    'succubus',
-    'suffocatingly',
-    'sug',
-    'sugarmill',
-    'suggestibility',
-    'suguta',
     'sulby',
-    'sulphate-reducing',
-    'sulphation',
-    'sultriness',
-    'summersby',
-    'sun-worshippers',
-    'suntans',
-    'super-beings',
-    'super-constituencies',
-    'super-continent',
-    'super-egos',
-    'super-lunar',
-    'super-ministry',
-    'superciliousness',
-    'superclusters',
-    'superellipse',
     'superficialities',
-    'superfluidity',
-    'superfly',
-    'supergiants',
-    'superius',
-    'superscalars',
-    'superscripts',
-    'supersparc-ii',
-    'supmarine',
-    'supportively',
-    'sups',
-    'supt.',
-    'suratensis',
-    'suresh',
-    'surman',
-    'survey-style',
     'susey',
-    'susp',
-    'sussmeyer',
-    'susurration',
-    'sutton-on-trent',
-    'suvorov',
-    'svennevig',
-    'svenson',
-    'sverdlov',
-    'svolv&aelig;r',
-    'sw18',
-    'sw1a',
-    'sw20',
-    'swanston',
-    'swarbrick',
-    'swarthiness',
     'swear-words',
-    'sweat-shops',
-    'sweepingly',
-    'sweet-and-sour',
-    'swelter',
-    'switched-star',
-    'swithin',
-    'sydonian',
-    'syeda',
-    'symbolisation',
-    'symphoniae',
-    'symphysis',
-    'synergism',
-    'syngeneic',
-    'synodic',
-    'synodical',
     'syntagmatically',
-    'synthesis-promoting',
-    'synthesist',
-    'sysnam',
-    'system-sentences',
-    'system.ini',
-    'szilard',
-    't&amp;a',
-    't&amp;s',
-    't&uuml;v',
-    't+1',
-    't-62',
-    't-bar',
-    't-h-r',
-    't-junctions',
-    't-zone',
     't.a',
-    't7a1',
-    't800',
-    'taal',
-    'tabbies',
-    'tablespoonsful',
-    'tache',
-    'tacksmen',
-    'taconian',
-    'tacticians',
-    'taffler',
-    'tage',
-    'taget',
-    'tail-feathers',
-    'taine',
-    'take-it-or-leave-it',
     'takeda',
-    'taking-off',
-    'talib',
-    'talking-to',
-    'tamaki',
-    'tanacetum',
-    'tanah',
-    'tanganyikans',
-    'tank-landing',
-    'tank/fish',
-    'tantalized',
-    'tarbolton',
-    'tarda',
-    'target.',
-    'tarnower',
-    'tarvin',
     'task-orientated',
-    'taskopruzade/mecdi',
-    'tatie',
-    'tattwas',
-    'tax-collectors',
-    'tax-inclusive',
-    'tayeb',
-    'tb20',
-    'tce',
-    'tcp/ip-based',
-    'tds.3',
-    'tea-houses',
-    'tea-shops',
-    'teacher-dominated',
-    'teall',
-    'teamers',
     'teamleader',
-    'tear-gassed',
-    'tearfulness',
-    'teashops',
-    'teasp.',
-    'technetium',
-    'tediousness',
-    'teenies',
-    'teenyboppers',
-    'tele-sales',
-    'teleconference',
-    'telemagmatic',
-    'temenos',
-    'temp.',
-    'tempeh',
-    'tempelhof',
     'ten\'s',
-    'ten-forty-five',
-    'ten-month',
-    'ten15',
-    'tendential',
-    'tene',
-    'tenesmus',
-    'tepahlewam',
-    'terabytes',
-    'teradyne',
-    'terga',
-    'term-limit',
-    'terrorist-related',
-    'terroristic',
-    'tert-butyl',
-    'tertium',
     'tessellation',
-    'tetanus-induced',
-    'tetrads',
-    'tetramer',
-    'tetrameric',
-    'text-only',
-    'texte',
-    'tg100',
-    'tg3',
-    'th&eacute',
-    'th1',
-    'thames/oxfordshire',
-    'thanes',
-    'thatch-roofed',
-    'thelonius',
-    'theoreticist',
     'theorisation',
-    'theory-dependent',
-    'theosophists',
-    'thermic',
-    'thessalonika',
-    'thick-shelled',
-    'thickeners',
-    'thickenings',
-    'thicko',
-    'thierse',
-    'thigh-deep',
-    'thimphu',
-    'third-ranking',
-    'third-tier',
-    'thirteen-year-olds',
-    'thirty-something',
     'thoc1',
-    'thoc3',
-    'thornicroft',
-    'thorniest',
-    'thorniley',
-    'thousand-and-one',
-    'threader',
-    'three-address',
-    'three-column',
-    'three-fifteen',
-    'three-fourths',
-    'three-strong',
-    'three-to',
-    'three-week-old',
-    'thring',
-    'thrombocytopenic',
     'thrombogenesis',
-    'thunderbox',
-    'thurles',
-    'thyrotoxicosis',
-    'tiago',
-    'tibbetts',
-    'tibiae',
-    'tickel',
-    'tickers',
-    'ticketless',
-    'tideswell',
-    'tidiest',
-    'tiding',
-    'tie-beams',
-    'tigersharks',
-    'tiggele',
     'tiggelen',
-    'tigris-euphrates',
-    'tiit',
-    'tile-hung',
-    'tilers',
-    'timaru',
-    'timbuctoo',
-    'time-barred',
-    'time-sheets',
-    'timepieces',
-    'timeworn',
-    'timins',
-    'tin-can',
-    'tinder-dry',
-    'tingewick',
-    'tinsulanonda',
     'tipi',
-    'tipitapa',
-    'titchfield',
-    'titchwell',
-    'titfield',
-    'titrations',
-    'tivoli/works',
-    'tizyakov',
-    'tizzard',
-    'tlot-tlot',
-    'tmca:na',
-    'toad-like',
-    'toasty',
-    'today/18.10.93',
-    'toe-caps',
-    'toggenburg',
     'toghill',
-    'tognoli',
-    'toilsome',
-    'tom-toms',
-    'tomcats',
-    'tomei',
-    'tomkies',
-    'tomogram',
-    'tone-quality',
-    'tonsilitis',
-    'too-large',
-    'toolmakers',
-    'toolshed',
-    'toombs',
-    'top-cover',
-    'top-three',
     'topliff',
-    'topographers',
-    'topweight',
-    'tord',
-    'torez',
-    'torn-up',
-    'torsten',
-    'toscana',
-    'totalitarianisms',
-    'totemistic',
-    'touch-sensitive',
-    'touchen',
-    'touessrok',
-    'tourers',
-    'tourlaville',
-    'tourneur',
     'touzel',
-    'tower-blocks',
-    'townees',
-    'townson',
-    'townsville',
-    'toxicologists',
-    'toxin-sensitive',
-    'tp+',
-    'tpk',
-    'tqt',
-    'tr5',
-    'tracheo-oesophageal',
-    'trachis',
-    'tractive',
-    'trade-the-cheapest',
-    'tradeoffs',
     'tradesperson',
-    'traeth',
-    'tragicomic',
-    'traineeship',
-    'trajanic',
-    'trans-continental',
-    'trans-historical',
-    'trans-oceanic',
-    'trans-shipped',
-    'transcutaneous',
-    'transeptal',
-    'transferpro',
-    'transmutationists',
-    'transnationally',
-    'transportability',
-    'transshipment',
     'trashcans',
-    'traversals',
-    'treacheries',
-    'trechmann',
-    'tree-shaded',
-    'treefall',
-    'treharne',
-    'treig',
-    'trekker',
-    'trenchers',
-    'trend-setters',
-    'trenholm',
-    'tresham',
-    'tri-d',
-    'tri-grams',
-    'tri-partite',
     'tri-radial',
-    'triangular-shaped',
-    'triapsidal',
-    'trichomoniasis',
-    'trichoneme',
-    'trichonemes',
-    'trichotomy',
-    'trihalomethanes',
-    'trimesters',
-    'trimphone',
-    'trimpot',
-    'tringham',
-    'triploblastic',
-    'triploblasts',
-    'tris-buffered',
-    'trisyllabic',
     'trittys',
-    'trogir',
-    'troilism',
-    'trolley-buses',
-    'trombonists',
-    'tropisms',
-    'troschel',
-    'trotwood',
-    'trouble-spots',
-    'troyens',
-    'trp1',
-    'trump-cards',
-    'trustful',
-    'try-line',
-    'tserenpiliyn',
-    'tsmdesk',
     'tuatha',
-    'tuckwell',
-    'tuekakas',
-    'tuesby',
-    'tuffield',
-    'tuffley',
-    'tugboat',
-    'tulles',
-    'tumen',
-    'tumescence',
-    'tumescent',
-    'tumim/chief',
-    'tumoral',
-    'tumorigenesis',
-    'tuning-fork',
-    'tuppen',
     'tura',
-    'turania',
-    'turbodiesel',
-    'turbojet',
-    'turfing',
-    'turn-of-the',
-    'turquoises',
-    'turtle-neck',
-    'tuskers',
-    'tutor/supervisor',
-    'tuttis',
-    'tvz',
-    'twankey',
-    'tway',
-    'twenty-seven-year-old',
-    'twilights',
     'twin-towered',
-    'two-all',
-    'two-class',
-    'two-dozen',
-    'two-mile-long',
-    'two-phoneme',
-    'two-storied',
-    'two-strokes',
-    'two-tenths',
-    'two-toned',
-    'two-under',
-    'tychonic',
-    'tymes',
-    'types-and-names-of-contents-are',
-    'tyra',
-    'tysties',
     'u-pb',
-    'u.c.m.',
-    'u.v.',
-    'u/11',
-    'u14',
-    'udaipur',
-    'ugly-looking',
-    'ugolotti',
-    'ujung',
-    'uk/netherlands',
-    'ukiyo-e',
-    'ukpanah',
-    'ukuleles',
-    'ukusa',
-    'uley',
-    'ullah',
     'ulmus',
-    'ulsters',
-    'ultimacy',
-    'ultimata',
-    'uma&ntilde;a',
-    'un-brokered',
-    'un-canny',
-    'un-mediated',
-    'unaesthetic',
-    'unaggressive',
-    'unalarmed',
-    'unalterably',
-    'unambiguity',
-    'unanswerably',
-    'unappeased',
-    'unarmoured',
     'unassimilated',
-    'unbaked',
-    'unbeneficed',
-    'unblest',
-    'unblinded',
-    'unbreachable',
-    'uncelebrated',
-    'uncentralized',
-    'unchivalrous',
-    'unclarity',
-    'uncleaned',
-    'uncollectable',
-    'uncomely',
-    'uncommissioned',
-    'unconsecrated',
-    'unconstitutionality',
     'uncontradicted',
-    'uncontradictory',
-    'uncontroversially',
-    'undenominational',
-    'undependable',
-    'under-5s',
-    'under-development',
-    'under-eights',
-    'under-estimation',
-    'under-performance',
-    'under-sheriff',
-    'under-surface',
-    'under-threes',
-    'under-utilisation',
-    'underappreciated',
-    'underlit',
     'underplanted',
-    'unders',
-    'undersaturated',
-    'understatements',
-    'undertrained',
-    'undifferentiation',
-    'undiscussed',
-    'undred',
-    'undynamic',
-    'uneconomically',
-    'unemployability',
-    'unenforced',
-    'unenjoyable',
-    'unequals',
-    'unequivocably',
-    'unexcludable',
     'unexperienced',
-    'unexpressive',
-    'unfalteringly',
-    'unfathomed',
-    'unfeathered',
-    'unforgiveness',
-    'unfudgeable',
-    'ungeared',
-    'ungracefully',
-    'ungrudgingly',
-    'unguardedly',
-    'unguicularis',
-    'unhydrolysed',
-    'uni-q',
-    'uniaxial',
-    'unignorable',
     'unijet',
-    'unilineal',
-    'uninflected',
-    'uninhibitedly',
-    'uninvested',
-    'uninvestigated',
-    'unitholders',
-    'universalizability',
-    'universities.',
-    'university/wea',
-    'unix-to-ibm',
-    'unkiar-skelessi',
-    'unlacing',
-    'unle',
-    'unlogged',
-    'unloosed',
     'unmade-up',
-    'unmanifested',
-    'unmarred',
-    'unmelted',
-    'unmethylated',
-    'unmourned',
-    'unnecessitated',
-    'unobservables',
-    'unostentatious',
-    'unpackaged',
-    'unpalatability',
-    'unpersuaded',
-    'unphysical',
-    'unplanted',
-    'unplasticised',
-    'unpolarised',
     'unpossessed',
-    'unpowered',
-    'unpretentiously',
-    'unprinted',
-    'unprofessionalism',
-    'unpublicized',
-    'unpublishable',
-    'unpunctuality',
-    'unpunctuated',
-    'unraced',
-    'unreacted',
-    'unrecoverable',
-    'unrelaxed',
-    'unrequired',
-    'unreturned',
-    'unreviewable',
     'unrotted',
-    'unscrupulously',
-    'unseasonally',
-    'unseaworthiness',
-    'unseaworthy',
-    'unsedated',
-    'unselective',
-    'unselfconsciousness',
-    'unsellable',
-    'unsexed',
-    'unshakeably',
-    'unshaped',
-    'unshared',
-    'unshifted',
-    'unshocked',
-    'unsportsmanlike',
     'unstoppered',
-    'unstrained',
-    'unstratified',
-    'unsubdued',
-    'unsubsidised',
-    'unsupercharged',
-    'unsuppressed',
-    'unsurmountable',
-    'unsworn',
-    'untenability',
-    'untethered',
-    'untheoretical',
-    'unthinned',
-    'untrainable',
-    'untravelled',
-    'untrustworthiness',
     'untwined',
-    'untwisted',
-    'unvaccinated',
-    'unvaried',
-    'unverdorben',
-    'unwarily',
-    'unwatched',
-    'unwisdom',
-    'unwomanly',
-    'unwraps',
-    'up-bringing',
-    'up/lighting',
-    'up4800',
-    'upgradings',
-    'upmost',
-    'upper-world',
     'upperlands',
-    'upregulation',
-    'upwarp',
-    'uranus-neptune',
-    'urbach',
-    'urbanek',
-    'urbgen',
-    'urens',
-    'urquell',
-    'us&dollar;2,300',
-    'us&dollar;22,000,000',
-    'us&dollar;23,000,000',
-    'us&dollar;26,000',
-    'us&dollar;26,000,000',
-    'us&dollar;27,000,000',
-    'us&dollar;3,200',
     'us&dollar;30,000',
-    'us&dollar;350',
-    'us&dollar;360',
-    'us&dollar;5,500',
-    'us&dollar;60',
-    'us&dollar;70',
-    'us&dollar;85,000,000',
-    'us&dollar;900',
-    'us&dollar;900,000,000',
-    'us-born',
-    'usa\'94',
-    'user-centred',
-    'user-definable',
-    'user-hostile',
-    'user-installable',
-    'user-specific',
     'usl/novell',
-    'uulaa-la',
-    'uyttenbogaert',
-    'uzbak',
-    'v&amp;sub2',
-    'v(b)',
-    'v.4-based',
-    'v/m',
-    'v1s',
-    'v42',
-    'v5.41',
-    'vacancy-wage',
-    'vacher',
-    'vacuum-packed',
-    'valinor',
-    'vallens',
     'valluy',
-    'valorization',
-    'valpy',
-    'vals',
-    'vandal-proof',
-    'vandalistic',
-    'vannevar',
-    'vaporetto',
-    'vaporiser',
-    'varda',
-    'variegation',
-    'variousness',
-    'vasculitic',
-    'vata',
-    'velupillai',
-    'vendeuse',
     'verbalize',
-    'verbrugge',
-    'verglas',
-    'verifications',
-    'veris',
-    'vermeij',
-    'verrijzer',
-    'versorelli',
-    'vertexes',
-    'vestibular',
-    'vetsera',
-    'vibronic',
-    'vice-chairmen',
-    'victorianism',
-    'viens',
-    'vieuxbois',
     'view-points',
-    'vigilantees',
-    'vihuela',
-    'vil\'na',
-    'vilamoura',
-    'viles',
-    'villier',
-    'villu',
-    'vincenc',
-    'vinyl-coated',
-    'viorel',
-    'vipava',
-    'viraemia',
-    'virgilianism',
-    'virtuosos',
-    'vis_&agrave_vis',
     'vishakhapatnam',
-    'vitrification',
-    'vixens',
-    'vlcc',
-    'vnqdd',
-    'vojislav',
-    'vol.ii',
-    'volatility-maturity',
-    'volitional',
-    'volkswagens',
-    'volmac',
-    'volos',
-    'volpi',
-    'voltai',
-    'voluntaries',
-    'volupine',
     'vorkuta',
-    'votary',
-    'vouli',
-    'vriki',
-    'vt100',
-    'vt600',
-    'vtls',
-    'vulnerable.',
-    'vulnerably',
-    'vumba',
-    'vvip',
-    'vxt',
-    'vyne',
-    'w.h.r',
-    'w.i.r.',
-    'w/r',
     'w/w',
-    'wadforth',
-    'wage-rates',
-    'wage-workers',
-    'wagonette',
-    'wagonloads',
-    'waine',
-    'waldie',
-    'walham',
-    'walkable',
-    'walking-out',
-    'wall-sconces',
-    'wallchaser',
-    'walle',
-    'wandersman',
-    'wandrille',
     'wangford',
-    'wannabees',
-    'waorani',
-    'war-crimes',
-    'war-horses',
-    'warband',
-    'warbreck',
-    'wardships',
-    'wardwell',
-    'warelwast',
-    'warier',
-    'warmhearted',
-    'warner/chappell',
-    'warrenne',
-    'wartaputra',
-    'wartburgs',
     'warts-and-all',
-    'wash-houses',
-    'washingtonians',
-    'washtub',
-    'wasp-waisted',
-    'water-furrows',
-    'water-mediated',
-    'water-pipes',
-    'water-skiers',
-    'waterhouses',
-    'watertable',
-    'wave-lengths',
-    'wavecrest',
-    'wavelet',
-    'waypoints',
-    'wc1a',
     'wc1e',
-    'wc2b',
-    'wd1',
-    'wearier',
-    'weather-resistant',
-    'weathertight',
-    'wedmore',
-    'weighbridges',
-    'weisinger',
-    'weitzman',
-    'well-argued',
-    'well-cushioned',
-    'well-done',
-    'well-flavoured',
-    'well-head',
-    'well-regarded',
     'well-tested',
-    'wellheads',
-    'wells/worcestershire',
-    'wellworthy',
-    'wentnor',
-    'wertrational',
-    'west-pacific',
-    'westcliff-on-sea',
-    'westfall',
-    'westlakes',
-    'wet-and-dry',
-    'wetherfield',
-    'wetzel',
-    'wexlar',
-    'weyden',
-    'weyside',
     'what-if',
-    'whate',
-    'whatsernames',
-    'whatsname',
-    'whch',
-    'wheathampstead',
-    'wheel-thrown',
-    'wheelchair-accessible',
-    'wheeldale',
-    'wheeler-bennett',
-    'wheezily',
-    'whereafter',
-    'whernish',
-    'whets',
-    'whh',
-    'whig&mdash;tory',
     'whimsicality',
-    'whins',
-    'whippers-in',
-    'whirl-y-gig',
-    'white-clothed',
-    'white-eyed',
-    'white-feathered',
-    'white-lipped',
-    'white-spotted',
-    'white-tipped',
-    'white-winged',
-    'whitefish',
-    'whitminster/gloucestershire',
-    'whittell',
-    'whiz-kids',
-    'whole-house',
     'wholefoods',
-    'wholistic',
-    'whoolly',
-    'why-dun-it',
-    'wicket-gate',
-    'wickhams',
-    'wicking',
-    'wickins',
-    'wide-apart',
-    'widnae',
-    'wiest',
-    'wigton',
-    'wih',
-    'williamwood',
-    'willin\'',
-    'willowbrook',
     'wiltons',
-    'win16',
-    'win32s',
-    'win:win',
-    'wincham',
-    'wind-breaks',
-    'windbreaker',
-    'window-cleaners',
-    'window-shutters',
-    'wine-tastings',
-    'wingflaps',
-    'wirch',
-    'wirecutters',
-    'wired-up',
-    'wise/thames',
-    'wiseacres',
     'wised-up',
-    'witchball',
-    'with-it',
-    'with_a',
-    'withams',
-    'withamshaw',
+)
+
+blocks_23 = (
+    '#!3!\'0&deg;c#)ndash;100"\'-second"\'/greens""21""30!*1&ndash;92!,2&frac12&deg"#(1)"".5"#/93"#355!)3&ndash;4"#(1)',
+    '#"7%"$0303"!9!#4.6""66!)5&ndash;6"".6!&6-well"".2""0s"#mph""pp!"7p!#80b"!1',
+    '""pc!+9&ndash;100"".8"!6""pc""th!":2!"fl!"jt"!y!"ld!"nl!#ozs $=100!!e',
+    '*&00,000)(8billion"\'mdash;1!*-particles!$.861"$k.a."$l.r."&p.c.m.""q.!+/16/25/0000"!v!#204"!1#!4!#340',
+    '"!9#!4!"59#!1!#684!"92!%amodt!%bbasi##ell"*dal&aacute#\'el-aziz%$aziz#(i&cacute#%ollah#&uctees',
+    '$#lai"&essolo"#ler"$outs"#ril#&ogates"%samat#\'conders#!i#&urdism"#ysm!\'cadians")ceptation#*ommodative$#nci',
+    '#+reditations"(etabulum")haemenids#&enbach#%r&agr"$id/g"+quisitional"#ris#2oss-the-curriculum"\'ted-out#*in-binding%$ides$-on-orientated$.vity-dependent"(uminatum',
+    '!"d4"!_"&amafio"\'derbury%#ley#"ie#\'ucts/10"&enylyl"&hesins"%layer"5ministrative-judicial""ra#)enoceptor#\'iamycin"&s/3000',
+    '")umbration"%visee!\'elfwine"\'quidens",rodynamicist$&lineas!"f1"(fordably!"g."$ache"%enda.$%tless%"s."3ggccctagaggggccctag#\'lestone',
+    '(#ory$\'ievedly"#ist"#nos"\'onistic"#uas#%ilera!#hah"&lquist"%madis##edi!#ias"+des-de-camp#&s-like"%r-dry',
+    '$\'powered$%waves#\'/ground#%iness#\'manship#%woman"%sbitt#&leless"#ton!$kame"(haimenes"#ida""os!)l-abidine$\'ksarayi',
+    '#&fenari#&ghazal#&iryani$%slami#\'mahgoub#$quds#&sanusi#\'zubaydi"\'arielle#$wite"&banaid#\'righton##um.%-in:creatinine"\'chfrith',
+    '#&erbury%$mary%$sley#$ford#\'rovandi#%worth"(echinsky#"ka#&utians#*xandrovich$#eev%!y"(fonsists"\'ginates#\'ol-type',
+    '##rio##yev""ka$$nols")l-correct$(expenses$%valve#$egan%$oric$%rgist%(tonshire#\'ocators$&tropes%!s#&worthy',
+    '"(ocentric"+pha-numeric#%inism"$tens$#sse#(itudinal#%stadt"\'uminate"%wight"(yce-faye!%malia"%ellus#&ricain"%niote"%oebas',
+    '#%rites#&urette#3xicillin/omeprazole"\'pullary"$stad!)nagogical#&lagous$$ytes##tol"%ciens"#d_a%(nd_so_on$"in#&antino#%overs',
+    '%#ton$\'ophiles#*ustifolius"$icia""ka#$ober"\'netwell"(ointment#+malocariids#(rthosite".swers/argument"%taeus#\'e-rooms$(cedently$\'natally',
+    '&\'lbanian&,uthoritarian%)europeans%)feminists&"os%!h&$ippy&(ungarian%#jun%%lewis&&ogging%)microbial%\'noriega%+perspirants&%olice',
+    '&(ymmetric%\'turkish%)unionists%%white$+aggregatory$*diarrhoeal&6sestablishmentarianism$%gen-1((specific$+natriuretic$(parasite$+vivisection"\'usavice"-xious-looking!+otearoa/new',
+    '"&aricio"#ck3"#ine#$stos"$odis##lar$#los#$phis$\'roteins#(sematism"\'petizer#&lebank%$jack%&script#-rehensiveness',
+    '"&terous#!o"%ulian!\'quality%#ung$$ware#(itainian!(rc-lamps%%ights&"ke#&adians#)h-enemies$+aebacterial$(etypally#*tic-alpine',
+    '#$ebil$$ntes$%rsier#&uously"%ea(s)#"te"\'guement"#ils")matrading%"us#/enian-populated#&istead#$lets$#oad#"oy',
+    '"(quebuses")restments##iba#\'ogation""s1#&e-hole"\'taudian#%house$\'rodesis#(ificials$(odactyls"#vee!(s-levels"#ari""ba',
+    '#(omycetes"$gard#"er"&patria#&idoras#$reys"(sailable&#ing&!s#,et-liability#"if")thmaticus#\'igmatic$!r#)ringently',
+    '"#us2!&t-rich"(hanasian"-mospherically"&omiser")p-binding"+tack-minded!,uchtermuchty""de#"ie$&o-tape&\'visuals%\'/visual%(cassette%\'logical',
+    '\'"ia"&reoles#&icular$\'g&aelig#$ochs$#rae&!s"+stralia/new%*o-prussian"\'thor(s)&\'ity-run#&o-wind$)chthonous%&laving$&didact',
+    '$(maticity(&zation"\'villars!&venges$,ue/viewfield##ril$%ments"\'oidably!*xiological"(le-boxes!&ye-aye"$kley"%letts"#mes"#nho',
+    '!1zerbaijan/armenia""ov 1b&eacute;d&eacute)$rard!$-17s"!e"!y!".3"&c.l.c.""n.!"/1"!b!!0!$3306!&abette',
+    '"*cklighting$"us#4terially-synthesised&%oides"*d-mannered#$edas"&ggages#%puize"%hujan"$ikie#%occhi#&rdwear"\'lbazian#$dest$#ies',
+    '$,rno/baberton$!v#"ka#\'ladeers$)inspittle$%ynure#&zacian"%mbini"&nagher#(croftian#&d-aids$$anna$#eau$"ol$&widths',
+    '$#ham$)or-on-dee#!h#"us",r&eacute;ges#\'/lounge#\'badians$)ier-beltz(\'mueller#(e-rooted$#ham#(geboards#&itones#%kston$%worth',
+    '#$nado$$ekov%*s/abingdon$$ston#\'racudas$\'ingtons$&owload##son#\'thesian$,on-on-humber#-wick-in-elmet#(ycentric".sal-subtracted%"ar#0e/superstructure',
+    '#+kin-robbins#\'ophilic##sae#"ty"&tesian#\'h-water$$ilde$(room/w.c#(tallions$*lecruisers"$udin"$wtry!#cef!$d75e!)each-head',
+    '#(nsprouts#%rdall%#ing#\'stlings#%table#\'u_monde$$mann"(bbington"#che##kus#\'omingly"&d-sits\'$ters#(chambers#&gebury',
+    '"(echwoods##per#&r-cans$&houses#(tle-like"\'falling##iex$!t#\'riender"&gampur"\'holders"$kesi#!o")larussian#)gian-born',
+    '#\'ievably#%leeks%$rive$$y-up#&onogov#%tless$&sville##vin"\'n-tovim#$bury#)eficiarii("um#"ne#"on#+zo(a)pyrene',
+    '%"yl$"yl"&relson$#nyi#&genias#5keley/gloucestershire#$lins##rie$&y-hill"*ssmertnova#*t-of-seven(%three%&priced%&suited$"er',
+    '#"we%(en-group"$ugge"%yrand""za!"h4"$alla##rat"!d#!.!(i-focals"$chir#$kley"&derman"(edermann',
+    '#"ns"+filar-wound")g-bellied$\'endians$%nosed#%amist#$gies"#kov##ram"(laterals$$yers#%inear#%liere$\'y-goats%#can',
+    '#%sdale"(n-liners",o-degradable$,psychosocial#%assay#%logic\'"sm#!n#-stratigraphic"%rched##der##nie"(shopgate"#tov##ton',
+    '!(l&uuml;m"%abbed#)ck-browed&\'shirted%&guards%$head%%lists#%ggers##ina#%npain#&stoids"*eached-out$%tings#$ddyn#%nkarn',
+    '%\'streams#%w-dry%$hole$"zy"!p"$udov#(e-ringed$&/green(!y$%stack$#tit%#ree!#n22"!s!&oadway',
+    '#%rshaw#\'stfully#(t-shaped$%loads"$cock"*dy-centred%\'hugging"1ehringer-mannheim"%g-hat##gin"$hdan#!o#!s"*is-reymond$*terousness',
+    '"(mb-sites$#ays"$ness#$gard$*ho-nouarra#$nici"*ok-binding$#ham$%stein#(rishness#%sbeck"%ppers"$rane&!s#\'derless',
+    '#\'n-haber##vel"%seley#\'herston#$sily#%twick#\'wellian"&tsford#&ulinum")ulangerie$#ois#*ndary-less)%value#&rbourg$)don-smith',
+    '$(ne-arton")w-fronted#2ness-on-windermere##ood"&xed-in#$moor!#raa$(mfontein#%efoot#(ggadocio#,ine-le-comte&"rd#\'nchline$#non$%tford',
+    '#)unschweig#&vefoot%#man#%wlers$#ner##zza"+eacan-feile$)k-dancing%\'ing-off%$outs%(spearean%$time#"os#(tonnians##uil',
+    '&$care&$ford&%heads#\'gantine$%htish#$mham#*ng-and-buy%#wyn$&ks-mat#%stols#%t-pol"#n-1"5oadway/worcestershire#,ckbank/rspca%5worth/gloucestershire',
+    '##mby#%nfman#&okline%$mans#,thel-keepers#-ugh-on-humber#,wnish-yellow#%xburn""ps"\'udenell#"jo#%ndish$%tscar#+sh-and-comb&\'strokes',
+    '""ps!"t."!c#!v""tp!$uchi"\'ddleias#.get-maximizing"$eche"&ilt-by"#jak"&lbosus#\'l-dwyer%\'leapers$\'ishness',
+    '$&worthy#*wer-lytton")mble-bees"$nnak#\'ostomum#(tingford",rden-sharing#!i#&latsky#(mantofts#&ningly#$wash"\'sh-aziz%)gorbachev$\'/fallow',
+    '$(y-tailed#.iness-critical(#es.##way"$tkus#%olphi#&t-ring$&afuoco"\'y-backs!(vm&amp;s!&y-blow#*employment-!s##now#$word',
+    '"%eline$)orussians \'c&amp;j&!m#*tilde;mara")dollar;58"0eacute;zannesque"-oacute;rdobas!#***!%.1730"$i.a."$o.b."$p.e.!,/ebp-related"!n',
+    '!#104"%8:3n3!&20:3n6!"38!"=2!#a2+"!3""at"&binet*#&letron#%riole"&ciques#$kett"&dafael$%veric',
+    '"\'eruleus"$inca#&rnryan#$sley$#tor"(l&iacute#*cification$)ulational#)derstones&,wood/swindon#%giari#%icoes#(limachus#\'thorpes#*vert-smith',
+    '#$yces"\'marthen#\'elsdale$\'roonian#&isoles##mel#\'panulas#(ulodunon"*naliculata#%derel$!u##ids#$kers#$nell#3on-williams-renault',
+    '#1terbury-bankstown#%zonas&#ets"*pacitative#$elin%"le#$isce#\'padocia$\'uccinos#&sicums%#zes#\'tivates"&r-keys#$ajas#$bert',
+    '#%chedi#(dmembers$!o%"un#(e-takers$)er-minded$"ys#"le#%maker$\'ontelle#%natic$%evale$)ivalesque$"oy##pel',
+    '$$eira$+ied-forward%!s$%oburg%#lls$(ying-out#\'stensen#*t&oacute;n$1erton/oxfordshire%%sians$$oony#$vell"*s&oacute;n#\'eworker*!s',
+    '##que##sey#&teleyn$\'iglioni$(leblaney#*ualisation$\'s_belli"(t-lovers#!.#\'aleptic%$yser#(egorizes$$nian#%holme#$rina',
+    '#"te$%leman"&udwell#*ght-behind#)se/effect$#ley"%veney$$sson##tat"%woods"$xias"%ygill#,ley-hamilton!"b2"!p',
+    '""pp"%u/cdm!#edc"(fotaxime"&lerity#*l-mediated$%arman#"or"$mali#$etry""n4#&otaphs#*sus-takers#1trally-determined%&omeric',
+    '"#rci#+tifications!"f1""ds!&g(tta)""cg""rp!*h\'i-ch\'ang"".2"!4"&adband%#urn#(guaramas#$ins.$*rman-elect',
+    '&"ey$%lener#%minda#&nging.$(terelles%#rey#.pelle-charbons%&ronage#)racter(s)$,coal-burners(!s$)ge-payers&(/council\'$poll$$idee',
+    '%$ynch$)mlessness$%women#&stises"#eal$$rful#!b#0cheno-ingushetia$&ked-by#\'ekiness\'!g$)seburgers#%lwood##mco#*que/postal',
+    '$%kasov$%okees#&snokov$\'terholm"!f"$huma"&ievely#&katilo#\'ld(ren)%)/children%&eberti$/ton/oxfordshire#\'maerism%#nes$*ney-stacks',
+    '#\'na-blue%$mpas%$ware$$tzes#%psets#%rpily#$tons"$ocky$\'oholics##eur#-lesterol-rich#+sh&uacute;0",rist-centred#*omaticisms%&ophore',
+    '#(zanowski"&thonic"$ubei##gga$"uo#%lainn#\'mminess#$rche&$ills"&ymical!&iespal"#mma"$ntra"%paris"%rcolo',
+    '\')tantially#%rhosa"\'s-trans"+vil-defence&)liberties!#kbs""ii!/lackmannanshire#$deus##gue#\'mminess##rey$$isse$%ridge#%spers',
+    '%&-party&+theoretical%.es-in-struggle%$icus#)udication$#se.#,yey-lignites$%mores")emenhagen#\'rkships#&verdon"&inkers%#ham$)opyroxene"%odius',
+    '#&nality$$tech#*se-coupled&"to#(th-bound%\'es-pegs\'$line#%useau#\'ve-like""pd"(ub-style$#ber#\'mpiness#\'sterers#\'tchless',
+    '")ydesiders!&m-wide""/h""20""br""rl!"nm""vs!*o-existent#&leader#&market#&pilots$(ublisher#.responsibility#\'trustee',
+    '#&djutor#&l-hole%&miners$$dust$(itionist#\'t-dress$%stand#&uthors"#bas#-den-sanderson#%webby"(ccoliths$"us#%kboat$(erington',
+    '"&difies"\'e-jones#(ducation#(lacanths$(urosaurs#+volutionary"9gnitive&ndash;behavioural#%wheel"\'habitee"$ital"\'ld-seal$$well#"eg$%shill#%iform',
+    '$\'inswood$$osum$\'usively##ney##omb$%nizer$\'uristic#\'tishall##ugo&!s$\'mbianum%(n-inches#$wall")mandantes&!o',
+    '#$elec$%rcial#3mand-administrative\'$.com$)ensurable%.rcially-minded&#son$(issaires%\'tteeman\'!o$+on-sensical#%nenus#%padre(!s$\'ellable',
+    '$(laisance%*ementaries$\'ortment$#ris$%toirs$(unctions%(ter-game($land#%unale%&idades"*ncanavalin%&tenate$(ealments%1i&ccedil&atilde;o&#cao',
+    '&"ta$"ha$$olor$*rete-lined#(descends#-flict-of-laws%&uences$,r&egrave;res$)usability#\'generic%$ries$\'regants&\'sswoman%$uous#4servative-historical',
+    '$(trictive)#ors$%ulter#$tado$(ent/bone%$rchi$*ra-charges&!n&(positive&&riants%0ol:manufacturing#*valescents$\'eniency%)rtability&*y/scotland',
+    '#"rs"#per#,per-bottomed#%thall#$ular&$tory#\'yholder$\'writers"&racles#\'e-level$!r$$test#(nerville%!s#(pse-like',
+    '$#eia%%lator$&oboree#%selet#*v&eacute;e"+st-per-case$$atus$,ello-roberts"%tazym#+ransfection#"ti$&onwool&!y#\'yledons"\'ubertin',
+    '$$port#&ntback%.er-allegations(+indemnities(\'process(\'service)(tatement*&rategy(&theory(&weight\'*revolution\')signature(#uit%$line%.ry-and-western',
+    '$\'se-wide&"rs$(t/london%$eney%&houses%&liness%$side")ver-drive%%ed-up$%table#+ington-pyms"(w-houses$$like$$pats#$herd',
+    '!&ps/gls!)rackdowns#(ftswomen#%igend#\'mp-like#%niate#\'shingly#%tonic&!s"!d"&eakily#%epily$$town#&olisms"*i_de_coeur',
+    '#%ghton#(me-prone#$sis.$"te"\'oasdale#)codilians#\'mcruach#%okery#\'quettes#.ss-connections\')ulturally&*functional&%media&%overs\'(wnership',
+    '%%field%$head%%piece#&ughton#*wd-pullers$%hurst$%ndale"#p-2"&ummles#\'tchless"+yptographic&)sporidial#.stallographers.&ically!#scs',
+    '"!v!#tts!-uban-american#(e-shaped#%illas"\'cullati"(e/prompt"&istots"0lham/oxfordshire#$otte#*ture-bound"(nnington"&ration##ien#&led-up',
+    '#,rent-affairs($cost"*stom-build"&t-rate#"er#$tack!"yc#&lamens$,e/pedestrian$%icity$*ooxygenase%%pedia&%ropyl"&pa-csa"\'renians',
+    '$$p;ps"\'ndash;e!\'\'agneau#$vila#$yala"%costa"%elite"\'horizon"+instruction"\'orleans"&urgell!$-asp!+.h.lawrence"!i"#p.c',
+    '!$1500!"=1!#abi"-ddy-long-legs"$gley"%iches#\'ntiness"%llams#.ton-in-furness"$mart##nas#&selfly"$naan#(ce-music#&evirke',
+    '#*zig-polish"%rcian#.k-complexioned$$some$!y##rin"&szczuk"&tacomm$&mation##ums"&ubigny"*vaadorjiyn#,enport-hines")y-clothes##bed',
+    '!$c-3s"!p""tp!(e-select"\'_rigeur")aconesses##fer#0th-announcements&&cliffs&&throes%!.%$like"+b&acirc;cle#$ratz#(t/equity',
+    '#,arboxylation#"em$*nt-looking#&khands%#ead#)omposable$*rativeness%&ticate#!s#&umbens"\'dicator#(uctibles\'$vely"\'ep-blue&%owled',
+    '"(facement#\'endable#+initionally"*generacies#)radations"#hra#+umanization%\'idifier"%ibler#3nstitutionalization")legate(s)#%imits$,rium_tremens##lor##mas',
+    '#%usory#%ville")mandingly#$eans#\'i-monde#\'obilise$&niacal&%cally$%tions#$setz#,utualisation",nazification#"dy#$ford#%iable',
+    '#$nant#&seness")oxycholic"(pendably#&ilator#"os#(recation%,ssed-looking"&quasie")rby-based&%lewis#-matologically"\'sargues#%campe$&endeur',
+    '$\'lection#\'igncare#\'k-bound#\'poiling%\'tically"$tlef#&ractor""v.#(elopable#$iser"%xters!#gtp!+iacetylenic#(metrical$\'ondback',
+    '""ba#!b""ch$(otically#&k-head$%stein#$tums")ferencias"&gnidad#$weed")homo-t&gt"*latoriness\'!s#)ettantism#(ly-dally',
+    '"\'nginess%"ri$%walls#\'ingroom#*osaur-like"\'plomasi#)yridamole"&rleton"+s-economies#0cipline-oriented$(ordantly$*riminators$*ursiveness#,entanglement#)harmonies',
+    '#&lodges#&posal.#\'rupters#&sensus$&uasion#*tance/time$)illations$&orters\'#ive$\'ressful$&urbers"$tzel"$umal""v2#(ersifies',
+    '"$xter!$juna!"kp!\'m10,000#"20"$2.36%!9$"81$"90#&50,000"%3,000"&40,200$!0"%5,000"!b',
+    '!(na-bound!#obb",cumentations"#die"&e-eyed"*g-friendly$$legs$$star##ana#%whelk""jo"$llan%(rs-worth$"ie#$ours',
+    '#$okos"#n-e#&atists#"di#(key-boys#"op$%ughue#$well"*om-mongers#%rless$$stop"$rien$$skos#\'mington"%ssett',
+    '"$ttor"-uble_entendre%$oons#"g."\'witcher#%nhome$%shire%%izers%%ville"$xies!#pck!*r.williams"+aft-dodgers##ggy$(onriders',
+    '#)wing-pins#%ycote"*eadfulness$\'m-books%&lessly%%scape#"ck#"dd#%ikurs#"ll#"me"%ibbly#\'ft-back#"ng#(ver-only',
+    '#%6000s"$tf1a"*ug-addicts#%ridge"*y-cleaners$\'roasted#(/damaged!"sl!*ual-career"\'bernard#(iousness",clos-lasalle##tus"&fftown"$g-in',
+    '%\'looking"$nadd#$bars#\'drennan#"ga#&kerque#"na$#ion#$syre"%rango"%stbag$$less"(tchwoman#$tons#\'y-frees',
+    '"&olding!$xs14!$yads")smotility#&phasia!\'zhakhar &e-data"!h"&values!\'.c.h.r.""d.!!0!"5+!"6+!&851/71',
+    '#$haed"\'glesham"\'ldermen"#nes"*r-piercing#&nshaws#&pieces#\'thwards"(sebourne#)t-central$&erness$)hampstead#\'y-clean%\'to-grow($make',
+    '"*ux-chaudes!#bon")ulliently!&c-like"!3"!4#!y")clesiarum"/hocardiographic"*lectically"0onomic/financial"$r-90!&ddison$"us"#ger',
+    '"%ibles#.nburgh-glasgow#\'toriale"#lib"%mondo%$ston")ucability%$ted.&0ional/vocational"$wige!$e549"$jits"&riness!*ffortfully!\'gf-like',
+    '##cup#&ington"\'omaniac#&tistic!&ibhinn"\'ght-bar&$cell&$iron&%times"%nheit!+katerinberg!\'lapsing#%stane"3ectrically-operated&,odynamometer',
+    '\',magnetically((yography\'\'n-volts\'&philic##nya#(vational"#iab#\'minable\'$tors#%zardo"(lipsoids"&mswell"\'ongatus"#se\'!(mbedment',
+    '$%zzler#+lematically#)olisation$&npoint#*rittlement"&eraude",igr&eacute;s#+lia-romagna"(m386.exe##ott"\'otivist"&petrum#-loyer-related!#n-1"(ablement',
+    '#%einte#/ha&icirc;nement%#nts",d-of-terrace$&points##ell#(lessness#)ocervical%*rinologist$$gamy$%morph$#nym"(ervation"2forcement/advisory"+gine-driven',
+    '")tailments$#sis#(eroscopy&&toxins#%hrall\'$ment#(icements#*relacement%-preneurialism$&y/exit"#ugu#)nciations!*peirogenic)!y"+hemeroptera',
+    '#%pheny%$ysis#)siotomies$*temologies,#sts#&taxial!#q/l"(uability$/l-opportunities#\'ipotent$%setum$(valenced!\'ranthis#%stian"&ectile',
+    '")odibility"+ythematosus!$s295"#335"\'a-pekka")calations$(pe-proof#%heikh"\'meralda"(pectador$%lette$$tada#%inosa#!s"\'rc/cnrs',
+    '"\'slemont"(tanislao#&hwaite"\'ztergom!%tcher"%emesi#\'rnities"$hene$%rlink##ica%+o-political#,nic-albanian"\'oposide"\'tlinger!\'ucrites',
+    '"$nson"&pterus"%ro-dm&&ollars$$dass#(ypterids!*vanescence$&gelize$\'s-lombe#(porative##son#!y")er-better%*escalating%$open',
+    '%+so-slightly!&ws4800!\'x-irish##mod#%nazis#&rights#$shop##udr"".2"\'_libris"!a#"m."(chequers#$iter#(oriation',
+    '".emplifications")foliators"&huming"\'igences##lic#,stentialists"(ocuticle#(n-intron#&rcists#%toxin"\'pellees$&rtness#*losiveness#)ress/mail"%surge',
+    '#,emporisation#*ortionists#+ra-cellular&(economic&(ordinary%+contractual%&floral%*ordinaries%%verts"\'udative!)yecatcher#\'sockets$&tripes (f&bsol;g"$lt;t',
+    '!"-1!#.2d"$b.i."$c.j."$r.s.!"/t"!x!%1,200!"2b!"35!"4u!"8+"!b!%acias#(tor-&agr',
+    '"&g-ends##ans")ir-traded$%faxes$\'grieves"%lloon%&wfield"$mara#$ilar%+iar-looking(%ities)$zing%,y-orientated"%nagan#\'gataufa',
+    '"#rma##non$&sworth#%rance&!d%)r-hockley"$sano"%t****#"et#%imids"(uldhouse$)t-bounded#"ne!$b.11""as',
+    '!$c(m)!%eakle#%rgach#&stings#+ther-bedded\'%light"$chan"%derle"&eblest$#ury"#gan#"el"%iners"#lce#&icific',
+    '#-low-prisoners\'\'writers#&t-tips$$hams"*mininities"\'nastras#$cers#(estralis##men"$rlie#&menter#(r&eacute$$ebee&$ourg$)ous-brown',
+    '##tae$#ers"&wtrell"%yness!%fr1.2#"20#"30!#gtl!(ibre****$$oids"/deicommissarius"-eld-dependent&%notes%%names#$rily',
+    '"*fth-seeded&$year$/y-five-year-old\'%ourth"$ght.%\'ing-men"$lali$#tov##lan#\'m-goers"$nded#*e-textured#$gery#!o#$reir',
+    '#!v"(re-irons$%sides$%water#&gorran#$mead#*st-cousins&)mentioned&\'teamers%%fruit"\'schbach%!l#%hable$&erwick\'$omen',
+    '$$ings$%wives##tic#%zbach"\'tnesses#)zgeoffrey"+ve-cylinder%&eighth%\'fifteen%$seat"\'xatives!*lag-draped$&stoned#,il-threshing#&mbeaux',
+    '#\'re-like#$tlet$$ware#(ubertian"(esh-pots%&ed-out#*urs-de-lis")ickerings\'!y#\'msiness#$nter"#ocs#%ggers#*od-damaged$)r-mounted',
+    '$#zie#,ral-inspired$%entin%#tte#$uncy#(w-charts$+er-sprigged&$ings##yds",ucloxacillin#\'oresces%+oquinolones"%yback!(mol/tube"!u',
+    '%"ly"&gbound")lk-memory$&eskole$&lorist$$tale#(lowed-up"%mites"&nbrune#\'damenta%%zione"-od-intolerant#\'l-proof#%trail"*re-and-aft',
+    '$$sail%#ts.#*givingness#$kner#%mazan#&restal#&schung$#ell##ton$$rose$+une-tellers$"y-&%first()ve-minute&&minute',
+    '#&carnet"$udre#(r-bladed%&horned%$pack&%ocket%&tenths$)th-seeded"$yles!"pm!"qs!+r&iacute;as"-agile-looking#&meless#&nklyns',
+    '$(er-smith"(eakishly%$ster#(e-moving%\'roaming%\'traders$&booter*!s$&houses#)ight-only#,nch-inspired&#ies$!s#(sh-baked&\'looking',
+    '#(gidarium&"ly##ngs#*s&eacute;e$%hkopf#$tjof$$schy$$well"\'obenius#%nt_of%(benchers%&runner%$side#"ss""pb',
+    '#)it-eaters%#ier#\'ticosus!"sd"$h-rh!*t&mdash;se"!s#%e-100!&uchsin#&ked-up$"in"%lbert##gor#+l&rehy;time$\'-nerved',
+    '$$stop")ngibility#\'icolare".rniture-makers#%umoto!#vnf!#x80""g4!&yfield""ge"&odorov""rd +g&amp;sharp&!t!%-ayih',
+    '"\'strings!#.n.!#/ml!#10\'!"26!-418-resistant!&abbing#%riels"%ffers"&ieties"$lata%#ica#%dikas#$gate#"in',
+    '#$ston"&mester##ini#\'ma/volt"#nda#(glioside$$path"$rdon#\'esfield"#sco#%toldi$\'roscope"&tekirk$$s/fa##sha',
+    '#,dier-brzeska%$ness#&ntness"&vrelle"$ydon"*zelle-like!%c(ta)"&se/gce!(earstick"\'llatley"$naro#&e-seed$%rales$%ville##tes',
+    '""o.#\'chemist*!s#$ffry"%rallt$!n$!r#%beras",sticulations#%ualdo"1tting-to-know-you!$fcc\'$!g!)harrgoyle"(erpotean',
+    '"#las"(oulishly!\'iantism%\'killers"%bbous#(son-like"%ddins#"ea"&gacube#$gler#$olos"$lani#%berts#&lbrook$$iatt',
+    '"+n-and-water#$kgos"*r&atilde;o##ard#"ja#"ke"%sbert#"p2"%urgiu!-lamorganshire#\'ncingly#%sgay!%)ow-london$*s-bottomed&%domed',
+    '%&makers"(enthorne"&ibness"0omerulonephritis##opy#&ssiest$$trup"$u238#%eings#(ten-free"&ycerin$&olytic$(yrrhizic!$nvqs!*o-anywhere',
+    '"-al-conditions$$line#%therd"$bbin#%elins#"le#$owen"(d-shaped#(lingston"+ld-embossed((roidered%&leafed%$mine%&ringed%\'weights',
+    '$&en-red\'\'skinned"&mantak#&ersall#!m"/ncalvez-herrera$\'higdorj##ner".od-neighbourly$$/bad$#ell%$rham$*s/services$.win/tewkesbury#$fing',
+    '"*rbachevian##gie#!k#$phal"!s#%field#"ol"$thia#%obeds"%ugane"(vernable&-ment-financed*$ally"$wans"#yim',
+    '"!p#"bs!+radualistic\'$ness#$ecia#$fham$#ter#&mineae$!m%$atic))alization#.nge-over-sands$&t/deny%#ees%#own',
+    '$,ville-barker#(pefruits$#nel#&spable$%sgill#%tiano#*ve-robbers"&b2-sos"&easily#,en-and-white%#ane%%backs%%sboro%$toft##ggs',
+    '"&iffons#)m-looking$$wade#$sell%$wood##vas#+zzle-haired"(oenewald#(ombridge%%sport#$tius#+und-effects&$ings&\'strokes$(pworkers',
+    '"\'uffness"#ynd!\'s&amp;w"#1/2!#tx2!"u9"*atemalteca"\'erreiro#&varism"#gsa"$iden#%leful%&lessly"%ndulf$!y',
+    '%%rgate#$room#%zburg"#res"#shy#$sets$"ie"\'termann#%hlaci#%tmann!\'weedore##nny#$rnol"\'ytherin!#xf6',
+    '"$ppos#%sades"(roscopic \'h&amp;c"-eacute;ireann)#lio!"\'s!*-parameter"!r!+.influenzae""r.!"/p!!0!"2t!"7+',
+    '"+bitu&eacute#$oldt""dj##low")hgwehdiyu"\'ilstorm#\'rdriers$#net"&kewill"(lf-aware%\'cantons%*demolished\'&serted&\'igested%(educated',
+    '%)marathons%%pints&%oints%(sections\'#ven&\'iblings\'#tes&\'tepping%#ten%&volley$%backs$$meas##idi$&karnas*#sus',
+    '#\'lkeeper$"oa%!o#(pin-tsai#(twhistle"/milton-paterson#&mermen$$oudi".nd-embroidered%#gun%#off&$vers%%sized$#els$(icappers',
+    '$%piece#"es#%gnail#$mers##nes#%rahan#)s-joachim%\'wilhelm$%combe$#ons#\'tavirus"*ppenstance"&rasses#,court-browne#\'d-boned',
+    '$$card$-ware-specific(*.intensive$"ys#%ghita#$lowe#&modios##paz$*er-collins#$till#-vey-beaumonts$$ison##win$$orth"$shin',
+    '"%t-pin#$band$"ox#$orah"0ughton-le-skerne#"lm%!s#&tefort#!z"%vanna"$wari#&k-eyed$&esbury$%hurst#$sers',
+    '"-yes/political"&ziness!"dc""ml!\'e-goats"\'/she/it"%acham#)d-scarves%\'teacher$%ed-up&$ness$#ily$$lock$%winds#)ring-aids',
+    '%(lessness#)th-stubbs#%vings"(bdomadal"(dderwick"#el."#fei"%glund"&igh-ho%"am"(licoidal$)opithecus&&olitan#)l-raisers$"es',
+    '%%field#$mawr$#ing$#uth#$wick"+micolectomy##ler"$nder#&eaghan##jak#$llan")patorenal#(penstall"%r/him#)aldically',
+    '#&dwicks#"le#*m&eacute;s$$anas%*phroditism$)eneutical$%itian#%odian#\'rnstein"\'silrige"#ton"&yworth"+zb-e-islami!#hcl!)igh-domed',
+    '%%jinks%#low%&stakes%#tec$+/kelvinside$&bridge$.er-dimensional\'&priced%)st-priced(\'quality$\'falutin$.ly-competitive\'(polished()ublicised$#nam',
+    '"#lal$!r#1l/gloucestershire$#age$"is##mar#$tons""m/##mel"%naidi#*d-quarters$&enberg$$most"%pness##pel',
+    '"\'spanica$$idus#\'tologic%\'risches"#tam#$cher!"m2!$o-ho"(chschule#"ke%"tt"&lcroft#&d-alls$*ing-period#)istically',
+    '$(y-tallis##mia"\'me-like$$obox#!i$%letic#\'oeopath$/sexual/bisexual$&thetic"(ney-bees#$ores"&ok-ups#$lock#$p-la"&rology',
+    '#\'ribilis%#dly#\'se/pony%"ll%\'masters"\'spedaje"&t-eyed$%wires#%cakes#&elling#%pants"$uari#$gham#%lgate#(ndstooth',
+    '$"is#*se-painter%!n%#wor#!y"%veton"&wieson!"p6"!8"!x""yc!&rududu!"s3""ls!\'uancayo',
+    '""er#"tt"\'genberg$!r#&hlings##ill"(llmandel")man-sized%(/dolphin%(itarians#(boldtian#$idor#*ming-birds#&ourist#\'us-iron',
+    '#&tcliff"#rly#$sley#$ufis",sband/father"#zzi!,ydrocephalic%(dynamics%%phane%)thermally")groscopic"#mas"#nds"+ostrongylus"*per-active',
+    '%(critical%(splenism##hal#\'notises#&omania$(thesizes#(sometric"*steroscopy *i-labelled"$thou$$rees!#.b."&c.a.c.""h."!i',
+    '""r.!"/2!!5!!9!%bbeth!#c1d"%ed-up#!m"(kringill"(onograph""sl!(dealizes$#tor#.ntifier/client+\'product',
+    '#(ographic",iosyncracies$\'t-proof"#owu!%enaga!$ford!&gnazio!$i.i."$i(n)#!+#"/v!*kbs/mmi/ai!*leostomies"#kka")l-adapted',
+    '$+thought-out#)egalities\'!s$!r#(imitable##tyd#&umines$#s.l%+tration/map!(mmendorf%&sities#&orally#+unoaffinity&)diffusion&*regulatory',
+    '#)ingements#.ortant-looking#.ressionability*)istically(*ve-looking!&n-bred#%thing"+_,_in_order((terms_of")abilities##cio$\'tivates#*dvertantly#,pplicability$!t',
+    '"%c-ibm#)alculably$"se#&h-high%$long%\'perfect#\'lemency$&osures$(usionary#\'ohesion$*me-earners%)municable$\'ngruent%"nu%*siderately',
+    '$0pendently-minded$\'xically#)iscreetly#%ucers$\'striale*!i"\'effably#&ptness#)radicably#*xorability"*fatuations#$ield$&nitude#,lation-proof/"ed',
+    '#(ormalism"&growth#&uinale"+homogeneity*%ously"&itally$&iatory"+judiciously"\'k-black")migration")ner/outer%\'leithen%!s"\'ornatum#&tropic',
+    '"(satiably#&ectile#,ider-trading$)nuatingly$&stance#)ouciantly#.pection-houses\',ors/advisers$\'iringly#$tars$(itution.$)ructions.#-ubstantiality"\'taglios#)egrations',
+    '$(r-active&*connecting.#ons&+provincials%).stimulus%\'actants%%cedes\'&ssions)#ors+!y&*irculation&(ommunion\')nnectable((versions\'$stal',
+    '%"es\',t-elasticity%(leukin-1&\'inkages%.mediate-acting%%nship%*provincial%&rupter)$ible%+testamental%)viewer(s)#-ifada-related#-ra-arterially&,generational%\'genomic',
+    '%%plate%\'textual%+ventricular$&ospect"(undating"(validism#\'ergarry%#ses$\'stment.#,itation-only%#ees#\'olvment!\'odosorb!#pso!&ran-us',
+    '"%mgard")on-framed%&rimmed$%beard"-reconcilables!.s-dependent-on%*scribed-by#<the-mitsubishi-scratched-yet"$/are"#231"#_in"&engard"(kandarov&#rov"%o9001',
+    '#%lator#%prene".raeli-egyptian("us"\'sachars#&uances$*e-oriented!&t_were"\'erating!#v/v!)xview/sql \'j&amp;b&!j"+lsqb;x&rsqb"*uacute;lio',
+    '!#/24!%a\'far"&blonka"#ck2#&quemin"$deja"%elani"&ggedly#%iello"#han"%inism"#lil#!u"\'nardhan#\'us-like',
+    ')%owned"%remko"#tis"\'yananda!+ean-charles%&pascal$"es""lf#$lett"%nsens")opardites"\'remiahs#%rican(!s"$sson',
+    '"!x!"ft!%iatun"!e!#mcs"!h!)ob-number"#cky"(ist-ends"%lande#%liest%(fication-!s"#ong")urneymole',
+    '"&vovich"%ynson!$udg."#fti"#gal"&lianne$"es"$ncea"#ste $k.d.""o.!"6e!!8!\'aapvaal"#ena',
+    '##oul"%hveci"&i-foon#$raba"!j"\'kouetta"$ndal$!i$$oras#*ellopoulos##pur"&ramani$"va##dex#\'g-elert',
+    '#"ka#$olyi#%sales"&waller"&yseria!"c1!%eagan##ney#+rney/thames#%tings"%evill""fe"$ills"\'llaways#$vins',
+    '"\'ndricks#$otic##tra"\'plerian""ri#$ygma"$wish"&yframe!"f7!#g/h!*halatnikov$"iq#"na"%irgiz"&lestov',
+    '"\'omeinis!%ibale"\'cks-off"#dan"%lcott#$dale$%rummy#$ford##lea$)iecrankie%#lan$%ybegs#&macolm#$oton\'#nes',
+    '##rea#\'spindie"\'n-group#(g-murray$&sclere##let#&nerton"%prono"$sdon#*s-and-tell$$able"&t-bags##ion#&zingen!"jp',
+    '"(einsorge$$tias#)ptomaniac"&ystron!$m/hr!*nee-capped(!s$$shaw#$zovi"(ife-like%%blade%$fish%!s"(ockdowns#%ssian',
+    '%%south$(ledgable!%odras"%ester"(h-i-noor""ku"$liba"#nan#%jevic"%pitar#"ke##pes"$srae##tov"&uvelas',
+    '!)ragujevac#$snov#&tzmann"%efeld#"on#\'tschmer#$uger"-iminalpolizei#$tios"%ustyu"%ystar#%trons")zaklewski!%umari"#ndi',
+    '"$pang"#ria"&ssmaul"$ttub")wait-iraq""ys!&wanzas!\'yleakin#"ix )l\'arrivee##sie"(espresso##tat$$oile"*inspecteur',
+    '#*sservatore!%-g-17!\'.j.k.b.!"/2!$2164!#991!"a9""b.#\'ourites"$cina"%dbury##oga"\'evigata".fferty/bristol"\'grimone',
+    '##cos#%d-off"%keman"#llu"%minae$#sil#&pleigh"&naghan#"d-%&agents%\'bridges$%aulet$"el$$tage#%gbein',
+    '##tev"#rak#+ge-breasted&&strain%%mouth##mer#,ne-stranraer##uns"#sky#%salle"\'tchcord#(e-acting$%rolog#&imeria"%udesi',
+    '#&rasian"%valle#$enza$$rgne#$ille$%ngton"$wani#%rance"$zaro!#dht!+ead-bearing$)en-footed$$gate#(f-litter$$ield',
+    '#&rnedly%$ings$#oyd#$tham&"rd#(venworth$%isian"\'byadkin"%chuga#%kford#2ture/demonstration"%derle"(es-milne"-ft-circularly$"ie',
+    '#$hold"$iber#)jonhufvud#*shmaniasis"%lands"&mpiras#!y"&nience#*nard-jones$%eberg"%onino$"or"*rnfreiheit#$roux")sley-anne',
+    '$#lie")tterworth$$rist"*ucocytosis#&kaemic#"mi"(vantines##ett"&winton#$knor"&xifier!"hw!$i-an"(ability.#$sing',
+    '%,ta&ccedil;ao&%inism#%ourne#\'rations"#cio#!l""ef"&feraft#%shitz#\'tmaster")ght-wells%)ning-fast%#pen"%kable$%ngloe',
+    '#&hachev#&lihood"&lburne#"es#(lehammer#&y-like"%mbert#&e-free##ine#\'psfield"\'nchpins#$dell#\'eamenta%"ta#\'kenholt',
+    '#$narz#%otron#!v"*on-hearted"&pgloss#\'ocalins$.polysaccharide#$pard"\'quefies"&sandro#$ible""ta#\'eracies&"ls#&hotomy',
+    '##man#\'tledale&$over#\'urgists"(ubinskas"&veborn$$long$0r-stage-specific#)ingstones!%jaclc!"k.!)landyssul$$elly&$wedd$&gernyw',
+    '$*santffraid$(uwchllyn$%wrtyd""ud!*m/military""p7!$obar"\'calness$(tionally##kie$\'sfields#/ombe-stableford#$usta",dging-houses"(ganberry',
+    '##ner"&kendra#$nath"\'mas/msf#%nicky"$ndis#*g-departed&&isused%&finned%$hand%%since&%ought$(er-dated$\'ueville#$tano',
+    '#\'k/sniff$+ing-glasses"\'p-eared"#rin$"od")ss/damage"&thbury#!u")udhailers$"un#%ghrea#$sada"%ve-in$%/hate"(w-necked',
+    '$.r-intermediate&%lying#%insky""ys"%zanov!"p2""ii!"s."!1")train.dat!#tss!(ubricity"&casian"$dham#.low/shropshire',
+    '"#ing"$kens")mberjills#\'inaires%*oscope&reg#\'pectomy"&nchers#%dberg""pe#$inus#"oi"(sciously#%trian"&terell"*xmoore-may',
+    '!%x-800""ii"!v""xi#"vi##xii!)yddington"&ellian"+mphocytosis&&matous")re-horned"+sodeikticus""th!"zw *m&amp;sup2',
+    ')$xico#)grave;res",ouml;ssbauer".uuml;ller-lyer!$\'boy#"ro"\'naghten!%.i.t."#p.g"#sc.!"21!(a-in-law"$bapa")c-on-risc#%cabee',
+    '#&eachan#(h&eacute$$airs$&ilidae%,ne-dependent$#uca#\'illarry$*ntosh-like#%kenna(!l&$zies%"tt$#ies%$nder$"le',
+    '%#ish#\'manaway%$ster#$phee#&quitty#$raes$\'o-model%\'adenoma%$bius%&phylla##sen#&ulatus"%ddren#(rigalist"&estoso',
+    '$%nyani"\'galhaes$!s#%irius#"ri%,tte-giraudon"%hachi$%midou$+rashtrawadi#%endra#$foud#$outs""ie#%lable$,ly-champagne',
+    '$,land-elected$&sforth%&prings#!o",jor-generals"&kallah##oni"-l&eacute;vich##abo$(propisms$%wians#(e-biased%*orientated$\':female$-eva-fragniere',
+    '#&m&ouml#(thusians#"um##yne"(mmograms"(n-things%#rap#\'ageably$!t#,chester-born&!t#$drel#"ea#%gonel##iak',
+    '#$noia##oel%,uvre-induced$*metrically##tas$*el-haenzel$\'leshelf$!o$"ri#\'ualists"(p-makers#%pable#%units"&quette"*r&ndash;12',
+    '#$alal$$ngos$&schino#(cantonio$%elino$$hesa#"ea#&iinsky$$lyns$(tal-rape#(ket-wide&$ings$&ievicz$#ley$%stone',
+    '#$rish$!s#%tagon$\'ial-law%-n-gropius-bau$&yrdoms#"ui#%xisms#&y-anne"\'saliyev#%olino#+sachussetts%#rik$"er#&t-head',
+    '""t.##eer#-rix-churchill#&thaeus%%iesen(#sen$!u#%urely&"rs#$zner"%umoun#&ritian&%shuis""va"#wes',
+    '"(ximalist%*um/minimum#\'wellian"#yas#$hill#(oralties##umi!#bps!%c-903"&anally##ree"&barnet"&carley%&thyite%!y',
+    '#%leary$#oys##olm%#vin$&naghie"%gahey#(ilchrist#$lone#%uffog"&ilwain"$kane#%elvie$$rlie#$inna"&laurin',
+    '"!m"&nichol$"ff"\'philips"\'quillen"(reynolds##obb"$tell"\'walters!"di!(eadowses#(n-minded$&nesses#%surer"&bmt1oh',
+    '"*di-physics$(tational%)erraneans$)um-framed\'&pacers"(gatonnes"(iklejohn#!s""ja"+lanocorypha#$burn#&isande#(odiously",mbrane-bound$#ury',
+    '##sah"*rcantilism$&urials#"et##fyn#&kadale##vis"#sas##eta",tabisulphite$)l-studded&&tipped%$lers&&ically&+oproteinase',
+    '$\'somatic\'$ites%)trongylus#&herell#*onymically#&rology%!n#$sola"$ulan#!s"(vagissey"%ynell!#glu!%hlaba"&uilinn',
+    '"(chaelson#*ro-fossils&,instructions&)political\'(rocesses%)filaments%&meters%/processor.based%\'society%#tus%&villar%%world"&d-17th$\'classes$)latitudes',
+    '$&period$$town#\'delburg$/leton-st-george#\'ianites#&spread)!s")hailovich$%ljcic%!y"(l&aacute#$hous#$ieus$\'tarists\'.y-bureaucratic',
+    '##kie#\'l-ponds$%erand$$ican$%throp$\'workers#&ometer#&verton".m&eacute;tisme"%natom#,d-stretching#(e-laying$&worker##has#*i-aquarium',
+    '%*roundabout$(aturists$$mal.$.ster-president(!e("ie%-upercomputers##ora%"co%"is#%shull"&quelon"$r-nm#\'a-smith#%ebeau',
+    '#!y"+s-spellings#"c.#+declaration$&irects#+perceptions$-ronunciations#&tiness"#tev#"ry"%x-ups"#zza!"k3"#apa!$l/30',
+    '"!2!(nemosyne""sd!$oada##mar#$ners#!s"\'bilizer".ck-transfected$$ford#&zulski""d.#/el-interpretive$*rate-sized%+sohn-becker',
+    ')!y"$ezzi"$gens".hammed-holgate#"ne"$inet#\'st-eyed%#ens%"ly""l%#\'ecule-1#\'landius#/otov-ribbentrop#$ucca")mentously',
+    '##ulv")nadhliath#$dale%-no-in-chianti#,ey-conscious&(oriented&%wages%(spinners#&golism#\'itorial#"na#\'omaniac$)nucleosis$#pod&#lar',
+    '#%sewer#&terrey$(fortians"&onlike$&stones#%rends#"th"\'ratoria$+via-silesia#$eish$"ll#$illo#$lich#\'oseness#*phologists',
+    '$!o#)se/zenith#"ta$(ifyingly#%wenna"#sco")th-balled$)erfuckers#!i$&f-like#\'orhomes%&wagons#$tola"&ubarak##dud',
+    '%!h"#ven#\'iewatch!-p/environment#\'foreign!\'roudjae!"s8""zp!"tp!*uch-abused%\'fancied\'&voured&%eared%)trumpeted##ins',
+    '"(enchberg"&gemana$!n"\'htarram"\'ldowney##roy#+ti-authored&$part\'%eriod&&valued(%riant%)fasciatus&\'ilament%$hull%(laterals',
+    '%\'partite&*le-section(\'.length&+rofessional%&valent"\'ndanely#(icipally"*ralidharan&#sts#"ri#$taza""s.#$hers#\'icianly#%tardy',
+    '""tr!#wai#%ngale!"x5!*ycologists"#nah"\'opathic"$riam$!n#%tilos",stifications&&yingly")th-makers .n&oacute;brega"+uuml;rnberg',
+    '"$test!\'-linked"\'nothing"%oct-3!\'.e.b.e.""p."$uist!$5520!#=14#!9""21#!5!\'acelles""fi"\'ggingly',
+    '"&meable""ng#&ometre$%tubes##ton"(rrations"%sally#"ey#)h-wortham#)ir-ud-din#+opharyngeal"%talya#&hanael#$tily#-uralistically',
+    '#&ghtier("st#%mburg"%vaids#"in$"on##ona""wa"\'zarbaev!%bx850!"c5""cs!#dpd!#e98"(ar-black',
+    '%$full%*neighbours&%ormal%\'sighted$-est-neighbour##som#$tham"%bular"\'ckcloth$$ties"(derlands*!e"\'gations#$ombo$#tio',
+    '"%iland"&mukhin"+o-darwinian"%stful"&t-work#"tl#*work-ready"%uberg#$fuz4#.gebauer-kramer#)rasthenic$)ochemical%,degenerative%\'kinin-1%*modulators',
+    '#&strian"+ver-failing#%zorov"(w-minted#0castle-liverpool#&digate#"ie#+ly-designed#)man-keuls#(s-sheets$%rooms$*worthiness#\'tondale!"f2"!6',
+    '"!l"&ultrum!#ias#"zy"#cey#%holai&+son/trainer#(kel-iron&&odeons"*ederhoffer#&moller#\'rendorf"*ghtfighter##rum"$jazi',
+    '"$lgai$$hard"-mble-fingered"\'nereeds$"te&*en-sixties)(thirties*\'wenties"#rje##mal""sh"$tida"&velles!\'jazidja!#m23',
+    '#*l/&micro;g!"n1!)o-through""10"!4",_matter_when"&ailles"$buil"$ches"!g"%issue"%komis"(me-sized#$vete"/n&rehy;existent',
+    '%*ccountants&$tual&#ute%(mericans%$sian%)uthorised$%being&(neficial%%inary%$lack$*calcareous%\'oercive&\'lonised&+mbinatorial\'$plex',
+    '\'&scious($tant\'\'tiguous&&valent$)decisions&\'fective%&igital&%vided%\'reamers$#eec%*xamination&&isting$)flammable&#uid$\'genuine',
+    '%,ravitational$(hospital\'$tile%%umans%\'ygienic$/individualistic\'+ustrialized&(fectious$\'ketotic$+linearities$)medically&(mbership%(usicians$%noble$*obligatory',
+    '$(patented%(olyposis$\'readers&*lativistic&\'payable$$serc%)inusoidal%&panish%%ticky&-raightforward%)ynonymous&(stematic$)toxigenic%)ransgenic%"uc',
+    '%\'enereal#(academic$)genarians%(gression#*calcareous#+determinism#)executive%\'istence#\'fiction#&muscle#*parametric$\'eriodic#%white"\'ordwijk"%r-man',
+    '#3mative-re-educative)"ly#.thampton-based%(ern-most%(westerly")se-diving"%t-out$"so#"al$"ta%"um#\'e-books%,combinations%+successions%&values',
+    '#&icable#"um"%umena#\'reddine"(vell/usl!$pktf!#swp!%t5000"*oni-nzinga!&ubians"%cleii%*osynthesis"+llification""ma#\'eration',
+    '"$rdin"#tku#*rient-poor#&tiness!#wrr!%yanja"%heter"&mphets"#rup \'o&amp;m!&\'byrne"&conner"#day"\'faolain#$ield',
+    '!#.d."$u.p.!\'akwoods!"b."*ili&cacute"\'jectual",ligatoriness")noxiously"#ock"#ree"+sessiveness"&trudes!(ccupance"\'ellatus")tapeptide',
+    '\')-november!#den"&iously"#ora%#tum!*ecumenical"9sophagogastroduodenoscopy#(trogenic!%f.the"*f-handedly$\'roaders#%ence.#%ices.%&ialese!*h-four-one',
+    '"!d"#lin!#iks!&kayama!(l&eacute"*articochea"%d-new$&regime#\'enburgs#$land"&igarch$&omeric"$lero"#ter!\'ndaatje',
+    '$&eleven$)for-three$\'hundred$(sixtieth$)thirtieth%#wos"!l!%oh-ah"(sthuysen!)paqueness"%en-on%&system#(ra-goers$\'cularis"\'hiactis',
+    '#+thalmoscope"&inion."&ossums"&pidans%"um#&onants$(rtunites$)sitifolia"#ran#\'ichnina"$sahl"\'thalmic#&imizes##rex!$r_at',
+    '#&ngeade#"t.##zio"$bell"&dinals"&enburg"(ganicism%*ochlorides&%typic")ientalium&!s##ole"#nee"*thorhombic"$uene',
+    '"%i/dtp#%ander"#ten$$rley#\'ralegus!%tford""ic"#kel"\'tershaw!+ughtibridge"\'spensky"$t-of$(stations&\'retched#)croppings',
+    '#\'fielder##gas$"un#%paces#+rageousness%#nce#(skirters#*ward-going!\'vcharov"-er-attachment%*estimation&)xcitement\'&ertion\'%ploit%*simplistic',
+    '$$book$\'lookers$&mighty$*simplistic%-pecialization%+ubscription$&taxing$)valuation!%wlets"-ner-directors!\'xendown"&ymoron!%zanne",one-depleted&$rich',
+    '("25!#-90!#.10$!0$"67"#218#!5""32#!5""57""64#!8""70""80#!2',
+    '""91#!8"&e.s.p."$r.s.!$0.05!%1/lp0""04#!6#!8"#14l!$2/t4""1/!$3/ns"!9!$4/t2',
+    '!"77!"99!&=0.008&!9%"14&!5$"25$!4$"63!&a\'anga"&ce-egg#(ifically\'!s#\'kage(s)$+et-switched',
+    '"%dgate""ek#$stra""gi#\'namenta"\'isiello$\'leyites"&lacath$,eogeothermal&)magnetism$$tina#\'ernians$,stine/israel#%grave##lon',
+    '$%ettes#&pating#*ynological"*n-national#,creatography#"ga#%icles##kaj#"ne#$thic$&omimic%&thenic"(r&aacute#)acetamols$%ffins',
+    '$-psychological#-ent-governors&(/teacher#+is-brussels&%match#*k/courtesy$*inson-like#(lez-vous$(ourmaids##odi$&xysmal#%sings#(t-funded%%songs$!b',
+    '$*icipations$*y-military&\'poopers#"un"%sanda#$cual#%ifika##set$&ionnel%&vation#(ty-faced"#tas#"ek$-rnalistically#,hologization',
+    '#.ri&oacute;tico%(archates%%ciate&"ks$%oclus%%nymic#(ternless"(ul-marie"*w-o-vision"&y-beds#!d!%bendu""ys!#c-x"$/nfs',
+    '""12""rs!%dcneo!%eahen#\'rl-grey#\'senhall"(culation%#ier"&derast$+strianising""go"#kka"$mell##pie##sel',
+    '##dre#$keth#$maen#(ologists#$tane$(ium-only#\'yffordd"-ople-oriented##ria"\'pperoni#(sinogens#,tidyl-prolyl"&ramuna#$cale$&hloric',
+    '#*formatives#(gascript#\'iastron$(carditis%\'lymenum%+onceptional$)odicities$-pheralization$%shers%%tyles$\'thecium#&kiness##oni#&satuan$\'istency',
+    '#(vasively"%saran#$tana"*therington#*it-clamart#*rographers%#med&$izer#&terson$%inger$+y-commodity!%frc64"-s:windowworks!#g/h"$ex2t',
+    '",allocentrism#*rmaceutica\'(okinetic#!w"!g"1ilippines-marxist$%lippe$%onous"\'lebitis$*gmatically&!y#!s"%onies%$ness$(olexical',
+    '#,tochemically&\'opiable%\'geology%&styler%-th&egrave;que""ra#)enologist"%thalo"$ytic$&oliths!+i&egrave;ce"%/open"$cato#$kmen$%worth',
+    '\'%s/tim")ece-rates#)rre-louis"(g-tailed"%kedaw"\'llowing"%mento"*nderfields#$tada%!r%!s"#ola"(perazine%%idine"&rogues',
+    '"\'t-stops#*ch-support%&blende#&nacree#\'tenweem!&jel126%"52!#l28"%aguey#(ne-trees%$load#\'quettes#(scrystal$*tic-coated%"ov',
+    '#\'wsworth#%yaway$%backs$*er/manager$)ing-cards(&fields$#let"&eached#&ctrums#$dger#.nipotentiaries#&urites"(oughable"$ugge#%mptry',
+    '#\'nderers#(ralities$\'ipotent##shy!/mmlib.gimmsmap1""nl"#ol/""sd""t2!*neumophila"!k""pp!"o1"%hnpei")intillism',
+    '"%khari""l.#$ders#\'emaster$%niers$!y#-ice-community%*y-oriented$"ii$.tical/economic*(military\'+o-religious#&litzer#$mont##ska',
+    '#6y(tetrafluoroethylene)$"b.$4chlorinatedbiphenyls$,ester/cotton$+symptomatic$\'theists%(raumatic"$nant#%dfish$%water#&gpanit#%selle"%oches#%h-bah##sie',
+    '#&padums#(ulariser)!m"&rchway#\'thtowan$#soy$\'uguese-$#way"%shest#)itiveness#%suelo#*t-biblical%$card&(hernobyl%)darwinian',
+    '(#ing%#era%+ministerial%)placement%&stalin%)tiananmen&.ranscriptional$(feminist$#ive$\'verbals"$tvin"(uch-anal&$like#)nd-dollar%$ians',
+    '&%looms&#mad%*/knowledge%\'boaters%$lock#$lett!#pss!$raga##ndy$"gs#$phat#\'yerbook"&e-1986$$20th$\'british',
+    '%$oded&&mpiled$*democratic$)electoral%(mptively%$rnie$\'filters&#nal$$gulf$)insulated$)keynesian$*maastricht%(editated%%orbid$#nhs',
+    '#*adolescent$\'ntennal#&bendal#+cipitations$*ociousness#.destinarianism#)eminently#,formationist#%molar#)nominally#*progastrin$&yloric#*scientific)"ly$+ervationist',
+    '$"ly$(s&eacute%)-cuttings%-ure-dependent($less$(tonfield%"re$*umptuously##uss#+varications"$ilep#*ncipalship#(oritizes\'"y.#)son-ships',
+    '"*o-actively%\'ristide$&ershad$&indian%#raq$\'russian#$band$+lem-centred#-cess-oriented$#les$&umbens%$rers#&duceth&*t-specific\'\'/market',
+    '$\'essedly$$fitt$,it-motivated#*gram-level%-essive-minded*#ist#\'karyote$%horov$%ofyev#)line-rich#)methazine$&inenti$&otable&#ive&"or',
+    '$%ellor$,hylactically$%shaft#(selytism$(perously$\'tanoids%&hetist%\'ituting%&rating#(teolysis$\'horacic#)vincially"$udes"#yke!+seudorandom',
+    '"(ikhushka#$onic""pc".ycho-geriatric&*metrically!\'terines$(odactyls!+ublic-works"(ddletown"\'ff-ball"*ll-through##man#!s"\'mped-up"&nchier',
+    '#&t-pole"$olue".r&eacute;pecha#%blind#&gation"\'sh/pull#$illa\'&nimity"(t-you-up#%iatin#$tees%$nham")y-de-dome!*ycnogonids"#ons',
+    '")thonesque )qapackmax!"c."!d!)tr-finals!\'uadrata##gga#-lity-adjusted#\'ndaries$&tative#)rterbacks#+si-colonial&)political#"t\'#&ysides',
+    '##lls#)stionably($ings"$icke#%etens#%llons##ney \'r&amp;h"6eacute;p&eacute;titeur)(sistance"(iacute;o",uuml;desheim!"-c!".5"&a.d.d.',
+    '"(s.p.c.a.!"/c!#1.1!#2.1#!2!&4.2(2)"%000mp%"sc!!_!"a."*bbit-holes##ina"&chaiah##ier",dio-friendly',
+    '#.naasumbereliyn"$ffel"%gazza#\'gedness#$land"\'ilworks#*n-softened$%falls#$sons"&jathuk"&ke-off"&madhin#,rod-straight#\'sbotham"&ndalls',
+    '#$sfer"\'panelli##son")refaction"%shidi"&tafias#\'hmullan#%lines#\'tenberg"\'ubvogel#\'nchiest")ven-black%%sdale"%worth"%yigam',
+    '!#byc!#cgp"!j""vs!4e&ndash;organisation"+-activation$*djustments%&option$%ffirm$"rm#,configurable+!e&#tra$&reates#)dedicated',
+    '#*emigration$\'ngaging$$rect$*stablishes#$fuel#$grow#*introduces#%style$%urvey")activates#&ddress$,er-dominated#$gans#"li#&rwards',
+    '"&births"$caff$(ntations#/ently-appointed$&ption.#&lusiam#\'olonise$*mmencement*!s$/nceptualisation-&zation#+reationally$*uit-cosmos$-ystallization#%tally',
+    '"(d-veined#(esignate#%mayne#)ressement#%wings"*evaluation$(e/oxford"$f.16#&errers#"in"%g\'lar#%alist#)ionalists$%stry.#*ulationism',
+    '%%marks%%sbank#+mbursements#*ncorporate$&scribe$\'vention$!z".lativistically$%xants#+entlessness#)ic-seller$&evable"\'manence#%eynes#+onstrations',
+    '"$naie$-tionalization$)ult/volvo#\'ilworth#$nell#.ovaci&oacute;n"*occurrence#\'penings"-petitiousness#*onsibility#$tans#(ulsively"0quires-binary-of"%route"\'sizable',
+    '$\'lution.#\'pect_of\',able-looking#$tage$\'itutive$\'rictors$#yle#*urrections"%table#"ie#$ried$(osternal%%vizor#"um#$ying',
+    '#\'erences%&sioner#$igny$$sers&"ur#(olution.!#ffs!"g1!*hinestones#!w"%oades#\'mboidal&$mere"#ydd#&olitic',
+    '"&bvaria"&ddings""ek"+ght-handers&#off%&winger%!y""jn"(ng-pulls$$hals$$mere"&opelle"%quard"8sborough/buckinghamshire#(inghurst',
+    '#\'schlian"\'verview!"jb!"lf!%nasin!+oad-traffic"0binson/solicitor"+ck-climbers%5rock-rock-rock-rocket%&steady$&/blues$,et-launchers&"ry$%falls""da',
+    '"\'elandts"&ll-ups"%mande%\'ization%*ticisation%%yshyn#%balds"$nell"(of-tiles$%scape#$mier$%mates##sen$$ters#&t-ball',
+    '"%screa#%e-ann#$hier#%trata"\'tundity"(u&eacute#)gh-haired&&legged#*nd-britain%$back%$shot&#man%$worm#%teway$$ings',
+    '"(w/column#$boat#$orth#"s.#&thorne!#pbs!#sdg"!p!+ub&eacute;n"%ffell"&ggerio$)les-brise"(le-books#!i"#mar',
+    '#"py"(n-around"&ralism"/ssian-populated#&taveli"$tbah"%ydiez!%yberg"%chner"&elands"*ley/oxford&)reporting"9t&iacute&rcaron;sk&aacute"%zkhov!"zb',
+    '&!r!#***!$-a-s"#vhs!%.1(1)"$2(2)#!6"$4(1)"$5(2)#!8"%94(5)#!9"#a.e"$c.e."$n.m.',
+    '!$1(3)""00""10"#264""32#$a(2)"$8(2)!%48(4)!$5(1)!"62"!5"!7#!0""83"!9',
+    '!&739(1)"!7!#aas"#bel"+chsenhausen#&ristan#!y")ddlebrook""ed#%ttler")fety-belt#$fran%+on-coloured#%ranes"&grajas',
+    '"#idu#&fullah#&lboats$%plane#.nt-l&eacute;on\'%azare&*s&auml;ens%\'e-marie##pan"\'les-off%\'persons#"mi#$omes#(pingitis#&terton',
+    '#!y")mmarinese"$naig#*d-textured$#age%,ll/wiltshire$)grounders$%holme$\'ostatin$$rats$$wick$*y-lignites#%gatte#%itise(!r',
+    '$$orin"\'phenous"\'rsfield"#soo#%setta"\'tchwell#)in-smooth%!g$&rising&#zes##nam"\'ucerful##ers#,nby/scotland#\'ssurian',
+    '"#vas#+e&mdash;set#%ilian"$ward##ers"\'xaphone#.e-coburg-gotha##man"#yce!"bg!#c13")affolders#\'pegrace$$ulae##rff',
+    '$"va"!d"#ena"%hantz$"tz#&maltzy$%uller#%onell$(ol-level&#bus#\'upfheim#%weins"\'imitars#(ntigrams#$olla',
+    '"\'lerotic"&orches#%ticum"&ranton#&ewworm#\'ofulous$$ller#\'uffiest$"mp!"dn""os""pr"&s/page!*e&eacute;s"$-100',
+    '"(a-battle$%lanes$%walls#&beasts##gen#&lpoint$%stone#\'manlike#&rleman#0sonally-adjusted"(bastiana"$cano#(ond-home&*ary-modern")dentarius',
+    '"$elpi"&gonzac"$igel#+ne-et-marne")ldom-used#(ectional#,f-alienation%(builders%+confessedly%*deceptions%(enclosed%(hypnosis%&select&(ustained$)conscious',
+    '##juk##lar"*manticists#&esters#)i-aquatic%(colonial*!s%#dry%\'serious&$olid&$weet%$tone$\'circles%%olons$&finals',
+    '$#tes%$onal"(nding-in#,iority-based##lis#(nybridge#)se-sphere"*parability&$tive",questrations$$oias"&rbrock#(f-owning#%geyev$"t.',
+    '#,oconversions$"sa$!w#"pa#*vice-users"$scas##tet"(t-square#)tlements."*ven-tenths\'"ry%.teen-year-olds$&rities%!o")xological',
+    '!(ha-la-la#%ckell#$dier$$rach##hal$%nawaz$#rur#%keout%&spears#$lala$$ford#"mi#%nnies#*pelessness$%insay',
+    '$)p-tongued(%othed$$ratt#%tford$#ost$$well#*w/prisoner".e-who-is-alone#(/pandora#*ep/hectare#$lima#%nyang#&rgolds$\'iffship#"ws',
+    '##ksa#&llcock#!o#&romani$(twaister"\'neidman"(oe-laces$*ing-smiths#(p-fronts#*rt-handled&&priced%%lists&"y.#)stakovsky#*w-stoppers',
+    '"&ridath#&ugged."&unichi!#ial$#kot"$bbes#&ilance"(de-lanes%%reins&$oads%&sheets&$teps$$cars$$foot$$sman',
+    '#"ki"%ebert##gal$)e-engines"#gel$#red#\'n-posts"%licic#\'k-lined#&ted-up#&verado$#ino"-milar-looking#*ulationist"%nger/',
+    '\'(positive\'(storeyed&"ts#)o-russian""o4"%rikit$\'samphan"%savat#)ter-party"$tars##rep#"us"&x-time!$k740""dl',
+    '#%lding#!p#&tchier\'$ness")ilfulness$&lfully$#ton#%rving!\'labbert#(ck-jawed#\'lomists#+te-coloured#%yings"(eazeball#%ekest',
+    '",ightly-built$+o/mullingar#&t-like"*ow-selling"+um-dwellers"%yness!+mall-leaved"\'ederovo#&lliest""il#%thard"&okable$&ehouse#$lsky!#n-w',
+    '#%rl-up""ia#&ffable"$orer#\'w-bound%$free$&plough$\'y-white"#rna#!s"&uffbox"%yders!#o13"(ap-based"*ber-suited',
+    '"$cage#\'cer-mad#\'ialisme$%edade$,o-ecological&\'medical%$path#&kliner"$fres#*tware-only(!."\'journer"\'kolnitz"(lar-wind%+is-on-sparc',
+    '#)idaristic#$lers#+ubilisation"\'malians#%esuch"%n-hee#&atrach#\'nenberg#\'ography""oo#+t-blackened#"zi"&phisms#"ot"$rabi',
+    '"%ttish"\'ubrette#\'ght-for#&l-less%%mates$$ages$#sby#%maila#*nd-effects&%level&%track%#box%#ers#$pcon#(rrouille',
+    ')%wards"+vereignties#*iet-afghan\'%cuban\')dominated!$p/ps"*ace-filled%%/time##ins#%nish-#&rccard"2ecrate&mdash;int92$)trographs#*llcheckers#.ncer-churchill',
+    '#\'dergobs#%litic$$lard##n-1#%ralis$&ituali*$ties$"os#%ttoon(!s#!x")lendoured%&ectomy#\'it-half&$site',
+    '%%iosum#$oled$)n-feeding#\'rtsdesk"\'rawlers#\'eadbury#*ings-based##ogs#"ue"&ss/pc+!%q._m."%l/400"+uare-shaped#&ircles##yer',
+    '!"s1""ts!-t&auml;nderat"--honor&eacute#&martin#/nom-la-breteche""62"5abler/gloucestershire#$ddon#\'echmann#)ff-cabins#$ider$+n-resistant%"by%)ton-kelly',
+    '$#ham#%mens.#&ncombe$$dley$%egate$%nards#\'rfishes%$ruit$(odubtsev#\'te-like%$lets%"ns%(s-backed$"ni#)uffenberg',
+    '#*y-at-homes"(eakhouse$%mbath$$tite#\'eliness%&y-eyed$#ton#$fani&"os#&inheim#.p-grandparents%$wise$\'hanurus$\'mothers%"um',
+    '$$ritt#)wardships&&tstown"#ihl#&llroom#$mmen$\'ulative#%ngers%%ingly$&k-bomb$$ting#&tch-up"#oas#(ckinette%%yards',
+    '#"ja%"ne#$mper#(ne-paved%5bench/gloucestershire%$fish$)y-hearted#\'p-overs$%cocks$(ping-off#*re/restore$)m-damaged$\'y-lines#"wn$!s',
+    '$!i%)t-jackets&\'jackets$\'nglings$-ps/attachment$*tigraphers#&eamlet\'%iners$#bel$)ptocarpus#(ing-like$\'plights#$ongs&#yle#2uctural-functional',
+    '"&uddert$%enica&+ts/trainees$"y*"!x"\'yleless$%olite!(ub-adult$%bands$\'classes$)functions$%lunar$\'markets$*population%\'roblems',
+    '$%teams&#xts#(assembly#$dues#%genre#$head#/ject-orientated()predicate#&levels#(problems#(ramaniam$&egulus%#nts#*sidization$%tages',
+    '&!d#%ulata#)versively*$ness""cc$)&egrave;s$\'esfully&)s/failure$$inic$$ubus"+ffocatingly"!g#&armill#+gestibility##uta',
+    '#.phate-reducing\'#ion#\'triness"\'mmersby"-n-worshippers#$tans"*per-beings&.constituencies)&tinent&$egos&%lunar&(ministry%+ciliousness&\'lusters%\'ellipse',
+    '&\'luidity\'!y%&giants%#ius%\'scalars\'%ripts&\'parc-ii#&marine#)portively#!s#"t."(ratensis##esh##man#)vey-style',
+    '#!p#&smeyer#(urration"-tton-on-trent"%vorov!(vennevig$#son#%rdlov"+olv&aelig;r!#w18#!a""20"&anston#&rbrick$\'thiness',
+    '$\'t-shops#\'epingly$*t-and-sour#$lter"+itched-star$#hin!\'ydonian"#eda"+mbolisation#\'phoniae%$ysis"\'nergism#&geneic#$odic\'"al',
+    '$/hesis-promoting)!t"$snam#-tem-sentences&$.ini!&zilard \'t&amp;a&!s"&uuml;v!"+1!#-62"#bar"#h-r")junctions"$zone',
+    '!#7a1!#800!#aal"%bbies#+lespoonsful"#che#%ksmen#%onian#\'ticians"%ffler""ge$!t"+il-feathers#"ne"1ke-it-or-leave-it',
+    '#\'ing-off"#lib#\'king-to"$maki"\'nacetum$!h#)ganyikans#)k-landing$%/fish#\'talized"\'rbolton#"da#$get.#%nower##vin',
+    '$.opruzade/mecdi"#tie#$twas",x-collectors$)inclusive"#yeb!#b20!"ce"*p/ip-based!$ds.3!)ea-houses$%shops#.cher-dominated#"ll#$mers',
+    '#(r-gassed$\'fulness#%shops$"p."(chnetium")diousness"%enies$(yboppers"(le-sales$*conference$(magmatic"%menos#"p.$"eh%$lhof',
+    '#+-forty-five$%month#"15#\'dential#!e$$smus"(pahlewam"\'rabytes$$dyne#"ga#\'m-limit#.rorist-related)"ic#\'t-butyl$#ium',
+    '"-tanus-induced#$rads%#mer("ic"\'xt-only$!e!$g100"!3!(h&eacute"!1"0ames/oxfordshire##nes#*tch-roofed"\'elonius#)oreticist',
+    '%+y-dependent$(sophists#$rmic#)ssalonika"+ick-shelled%%eners\'$ings%!o#$erse#\'gh-deep#$mphu#*rd-ranking&$tier$.teen-year-olds%+y-something',
+    '$!3#(rnicroft&#est&#ley#-usand-and-one"&reader$)e-address&&column&\'fifteen\'&ourths&&strong&"to&(week-old##ing#-ombocytopenic',
+    '"(underbox#$rles",yrotoxicosis!$iago"&bbetts##iae"$ckel%"rs%%tless"\'deswell#$iest$"ng"\'e-beams")gersharks#$gele',
+    '#-ris-euphrates""it"\'le-hung$"rs"$maru#&buctoo#(e-barred%&sheets$&pieces$$worn##ins"%n-can#\'der-dry#&gewick#)sulanonda',
+    '$$tapa"(tchfield%$well#%field#\'rations"*voli/works"&zyakov#$zard!(lot-tlot!&mca:na!(oad-like##sty",day/18.10.93"&e-caps"(ggenburg',
+    '#$noli"&ilsome"&m-toms#$cats#"ei#$kies#%ogram"*ne-quality#\'silitis"\'o-large#\'lmakers$$shed##mbs"\'p-cover$%three',
+    '#)ographers#&weight""rd#"ez#$n-up#$sten"%scana".talitarianisms#\'emistic"-uch-sensitive%"en#&essrok#$rers$\'laville$$neur',
+    '"*wer-blocks#$nees$#son%%ville"+xicologists$+n-sensitive!"p+"!k!"qt!"r5"1acheo-oesophageal%"is$$tive#/de-the-cheapest%$offs',
+    '##eth#\'gicomic#(ineeship#%janic#.ns-continental&*historical&\'oceanic&\'shipped%)cutaneous%%eptal%&ferpro%,mutationists%*nationally%+portability%(shipment',
+    '#\'versals")eacheries#&chmann#(e-shaded$$fall#%harne#"ig#$kker#&nchers$)d-setters$$holm#$sham"#i-d$%grams$\'partite',
+    '#.angular-shaped$&psidal#+chomoniasis&$neme*!s&$tomy#,halomethanes#\'mesters$%phone%"ot#%ngham#*ploblastic+!s#*s-buffered$\'yllabic',
+    '"$ogir#%ilism#*lley-buses#(mbonists#%pisms#%schel#%twood#*uble-spots#$yens""p1")ump-cards#%stful"&y-line!+serenpiliyn"%mdesk',
+    '"&ckwell"&ekakas##sby"&ffield$#ley"%gboat"$lles"#men$&scence(!t#(im/chief#$oral%(igenesis")ning-fork"$ppen',
+    '$#nia#(bodiesel%#jet#$fing#(n-of-the#\'quoises#(tle-neck"%skers".tor/supervisor##tis!"vz!&wankey#!y"3enty-seven-year-old"\'ilights',
+    '"%o-all$%class$%dozen$)mile-long$\'phoneme$\'storied&%rokes$&tenths%$oned$%under!\'ychonic"#mes"=pes-and-names-of-contents-are""ra"%sties',
+    '!%.c.m.""v.!#/11!"14!&daipur!+gly-looking"&olotti!$jung!-k/netherlands"%iyo-e"%panah"&uleles#"sa!#ley"#lah',
+    '"%sters"&timacy&"ta!+ma&ntilde;a!*n-brokered#%canny#(mediated")aesthetic#)ggressive#&larmed$\'terably#(mbiguity#)nswerably#\'ppeased#\'rmoured',
+    '"%baked#(eneficed#$lest$%inded#)reachable"*celebrated$)ntralized#)hivalrous#&larity$%eaned#*ollectable$$mely%)missioned$)nsecrated&-titutionality',
+    ',#ory\'*oversially".denominational$(pendable$$r-5s&+development&&eights\')stimation&+performance&\'sheriff\'&urface&&threes&+utilisation%+appreciated%#lit',
+    '%!s&(aturated&)tatements%\'trained#.ifferentiation$\'scussed##red#&ynamic",economically#,mployability#\'nforced$\'joyable#%quals%(ivocably#)xcludable',
+    '%\'ressive"+falteringly$&thomed#(eathered#*orgiveness#(udgeable"&geared#)racefully$(udgingly#(uardedly$(icularis"*hydrolysed"#i-q#%axial#(gnorable',
+    '#&lineal#(nflected$)hibitedly$&vested(&igated#(tholders#/versalizability\'&ities.)%y/wea#(x-to-ibm"-kiar-skelessi"&lacing#!e#%ogged$$osed',
+    '$(nifested$$rred#%elted$(thylated#&ourned",necessitated"+observables#+stentatious"(packaged$*latability#(ersuaded#\'hysical#&lanted%(sticised#(olarised',
+    '$%wered#,retentiously$%inted$-ofessionalism#)ublicized\'&shable$)nctuality)#ted"%raced#&eacted$)coverable$%laxed$&quired$&turned$(viewable',
+    '",scrupulously#)easonally%*worthiness*!y$%dated$\'lective%.fconsciousness%%lable$#xed#(hakeably%#ped%#red$%ifted$%ocked#,portsmanlike',
+    '$&rained&&tified#&ubdued%\'sidised$*percharged%\'pressed$*rmountable#$worn"*tenability$&thered#*heoretical$%inned#(rainable%&velled$-ustworthiness',
+    '%$sted"*vaccinated$$ried#(erdorben"&warily$%tched#%isdom#&omanly#$raps!*p-bringing")/lighting"$4800"(gradings"$most")per-world',
+    '"*regulation"$warp!-ranus-neptune"$bach$#nek##gen"#ens"%quell!.s&dollar;2,300+)2,000,000+)3,000,000+%6,0000$,000+)7,000,000*%3,200',
+    '+"50+"60*%5,500*"60*"70**85,000,000*#900-(,000,000"%-born"$a\'94"*er-centred%)definable%\'hostile%+installable%(specific',
+    '!\'ulaa-la!,yttenbogaert!$zbak *v&amp;sub2!#(b)!(.4-based!"/m!"1s!"42!$5.41!+acancy-wage##her#*uum-packed"%linor#$lens',
+    '#)orization#"py#!s"*ndal-proof&%istic#%nevar"\'poretto%$iser"#rda#(iegation$\'ousness"(sculitic""ta!)elupillai"&ndeuse',
+    '$%rugge#$glas#*ifications$!s#$meij#&rijzer#\'sorelli#%texes"(stibular"%tsera!\'ibronic"+ce-chairmen#)torianism"#ens#&uxbois',
+    '")gilantees"%huela"$l\'na#&amoura#"es#$lier$!u"%ncenc#)yl-coated"$orel"$pava"&raemia#)gilianism#&tuosos"-s_&agrave_vis',
+    '"+trification"$xens!#lcc!$nqdd!\'ojislav"$l.ii#0atility-maturity#\'itional#(kswagens##mac#"os#"pi##tai#(untaries$$pine',
+    '"$tary"#uli!$riki!$t100"#600""ls!*ulnerable.)!y"#mba!#vip!"xt!#yne %w.h.r"$i.r.!"/r',
+    '!\'adforth"(ge-rates%\'workers#&onette%%loads"#ine"$ldie##ham#%kable$\'ing-out#)l-sconces$&chaser$!e"(ndersman$%rille',
+    '#&nabees"%orani"(r-crimes$&horses#$band$$reck#&dships$$well#&elwast##ier#(mhearted#,ner/chappell#%renne#\'taputra$%burgs',
+    '")sh-houses$*ingtonians$#tub#)p-waisted"+ter-furrows&(mediated&%pipes&&skiers%&houses%%table"*ve-lengths$%crest$#let"\'ypoints!#c1a',
+    '""2b!"d1!&earier#.ther-resistant\'%tight"%dmore"*ighbridges#&singer#%tzman")ll-argued%)cushioned%$done%)flavoured%$head%(regarded',
+    '$%heads$0s/worcestershire$&worthy"%ntnor"*rtrational"*st-pacific$,cliff-on-sea$$fall$%lakes")t-and-dry#(herfield##zel"$xlar"$yden#$side',
+    '$!e$(sernames%$name""ch",eathampstead#)el-thrown%0chair-accessible%$dale%*er-bennett$$zily#\'reafter$$nish#"ts"!h"-ig&mdash;tory',
+    '#"ns#(ppers-in#(rl-y-gig#*te-clothed&$eyed&)feathered&&lipped&\'spotted&&tipped&&winged%$fish$7minster/gloucestershire$$tell#&z-kids")ole-house',
+    '$%istic#$olly"(y-dun-it!*icket-gate$$hams$#ing&!s"(de-apart##nae"#est"$gton"!h")lliamwood%"n\'$\'owbrook',
+    '"#n16##32s#$:win#$cham#(d-breaks$\'breaker$+ow-cleaners\'(shutters#*e-tastings#&gflaps"#rch#(ecutters$$d-up")se/thames$%acres',
+    '"\'tchball#$h-it$"_a$#ams\'#haw',
 )
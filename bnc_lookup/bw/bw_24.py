@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_24 = (
+count_24 = 6694
+
+heads_24 = (
     '%ibw',
-    '&aelig;thelings',
-    '&agr;-granule',
-    '&agr;2',
-    '&amp;b',
-    '&amp;land',
-    '&amp;m',
-    '&amp;names',
-    '&amp;phone',
-    '&amp;spencer',
-    '&bsol;windows',
-    '&ccedil;iftlik',
-    '&dgr;-endotoxin',
-    '&dgr;72',
-    '&dgr;e',
-    '&dgr;f',
     '&dgr;y',
-    '&dollar;0.27',
-    '&dollar;0.29',
-    '&dollar;0.33',
-    '&dollar;0.39',
-    '&dollar;0.42',
-    '&dollar;0.74',
-    '&dollar;0.76',
-    '&dollar;0.77',
-    '&dollar;0.78',
-    '&dollar;0.95',
-    '&dollar;1,100m',
-    '&dollar;1,150',
-    '&dollar;1,300,000',
-    '&dollar;1,700m',
-    '&dollar;1,800m',
     '&dollar;1.0m',
-    '&dollar;1.10',
-    '&dollar;1.15',
-    '&dollar;1.42',
-    '&dollar;1.86',
-    '&dollar;1.87',
-    '&dollar;1.88',
-    '&dollar;10,000m',
-    '&dollar;10.1m',
-    '&dollar;10.5m',
-    '&dollar;11.7m',
-    '&dollar;12.7m',
-    '&dollar;123m',
-    '&dollar;13,500',
-    '&dollar;13.1m',
-    '&dollar;13.2',
     '&dollar;13.2m',
-    '&dollar;13.5m',
-    '&dollar;13.6m',
-    '&dollar;14,000,000',
-    '&dollar;14,400',
-    '&dollar;14,700',
-    '&dollar;14.4m',
-    '&dollar;14.7m',
-    '&dollar;14.9m',
-    '&dollar;145,000',
-    '&dollar;145m',
-    '&dollar;15.6m',
-    '&dollar;15.8m',
-    '&dollar;1500',
-    '&dollar;16.7m',
-    '&dollar;17.5m',
     '&dollar;170,000',
-    '&dollar;175m',
-    '&dollar;18.5m',
-    '&dollar;189',
-    '&dollar;19,000',
-    '&dollar;192,000',
-    '&dollar;2.0m',
-    '&dollar;2.5m.',
-    '&dollar;21.5m',
-    '&dollar;22.8m',
-    '&dollar;220m',
-    '&dollar;225',
-    '&dollar;23.2m',
-    '&dollar;24,000,000',
-    '&dollar;243m',
-    '&dollar;26,500',
     '&dollar;26.4m',
-    '&dollar;260',
-    '&dollar;27,000',
-    '&dollar;270m',
-    '&dollar;275',
-    '&dollar;280,000',
-    '&dollar;285,000',
-    '&dollar;2bn',
-    '&dollar;3,400',
-    '&dollar;3,950',
-    '&dollar;3.1',
-    '&dollar;3.6',
-    '&dollar;32',
-    '&dollar;32,000',
-    '&dollar;32,000,000',
-    '&dollar;325m',
     '&dollar;32m',
-    '&dollar;340,000',
-    '&dollar;35&ndash;55,000',
-    '&dollar;35,000,000',
-    '&dollar;36,000',
-    '&dollar;37,000',
-    '&dollar;37.50',
-    '&dollar;38,000',
-    '&dollar;380,000',
-    '&dollar;40,000&ndash;60,000',
-    '&dollar;41,000',
-    '&dollar;44,000',
-    '&dollar;46,000',
-    '&dollar;47',
-    '&dollar;47,000',
-    '&dollar;480',
     '&dollar;480,000',
-    '&dollar;5,800',
-    '&dollar;5.4',
-    '&dollar;5.50',
-    '&dollar;50&ndash;70,000',
-    '&dollar;500&ndash;700,000',
-    '&dollar;53.9',
-    '&dollar;55&ndash;90,000',
-    '&dollar;580',
-    '&dollar;6,000m',
-    '&dollar;6,300',
-    '&dollar;6.0m',
-    '&dollar;6.3',
-    '&dollar;600,000&ndash;800,000',
-    '&dollar;62.5m',
-    '&dollar;630',
     '&dollar;64',
-    '&dollar;65,000,000',
-    '&dollar;66,000',
-    '&dollar;7,000m',
-    '&dollar;7,200',
-    '&dollar;7.3m',
-    '&dollar;7.50',
-    '&dollar;700,000&ndash;900,000',
-    '&dollar;8,500',
-    '&dollar;8,600',
-    '&dollar;8.3m',
-    '&dollar;81m',
-    '&dollar;83,000',
-    '&dollar;9.5',
-    '&dollar;9.9m',
-    '&dollar;95,000',
     '&dollar;m',
-    '&dollar;show',
-    '&eacute;clairs',
-    '&eacute;tats',
-    '&egr&prime',
-    '&frac12;ft',
-    '&gt;nine',
-    '&gt=70/min',
-    '&lt;escape&gt',
-    '&lt;inst&gt',
-    '&lt;module',
-    '&lt;n',
-    '&mdash;if',
-    '&mdash;on',
-    '&micro;g/hour',
-    '&micro;mol/',
     '&natur',
-    '&oslash',
-    '&pound&frac12;m',
-    '&pound&pound&pound;s',
-    '&pound;0.6m',
-    '&pound;1&ndash;1.5',
-    '&pound;1,145',
-    '&pound;1,280',
-    '&pound;1,450',
-    '&pound;1,575',
-    '&pound;1.26',
-    '&pound;1.39',
-    '&pound;1.54',
-    '&pound;1.6million',
-    '&pound;1.7bn',
-    '&pound;1.8billion',
     '&pound;1.8bn',
-    '&pound;1.8m.',
-    '&pound;10,000,000',
-    '&pound;10.',
-    '&pound;10.2',
-    '&pound;10.58',
-    '&pound;10.7m',
-    '&pound;102m',
-    '&pound;109m',
-    '&pound;11.00',
-    '&pound;11.3',
-    '&pound;117,000',
-    '&pound;118m',
-    '&pound;119,000',
-    '&pound;12.4',
-    '&pound;12.65',
     '&pound;12.7',
-    '&pound;12.75',
-    '&pound;12.80',
-    '&pound;12000',
-    '&pound;124m',
-    '&pound;129m',
-    '&pound;13.2m',
-    '&pound;13.5',
-    '&pound;13.6',
-    '&pound;13.75',
-    '&pound;131m',
-    '&pound;134,000',
-    '&pound;13bn',
-    '&pound;143',
-    '&pound;147,000',
-    '&pound;153',
     '&pound;16.2m',
-    '&pound;16.5m',
-    '&pound;16.9m',
-    '&pound;161',
-    '&pound;164',
-    '&pound;169.99',
-    '&pound;17,200',
-    '&pound;17.00',
-    '&pound;17.47',
-    '&pound;170m',
-    '&pound;176',
-    '&pound;178',
-    '&pound;18.8m',
-    '&pound;18.9m',
-    '&pound;181',
-    '&pound;181m',
     '&pound;182',
-    '&pound;186',
-    '&pound;19.25',
-    '&pound;196m',
-    '&pound;199.99',
-    '&pound;2&frac12',
-    '&pound;2.05',
-    '&pound;2.79',
-    '&pound;2.8bn',
-    '&pound;20.5m',
-    '&pound;20m.',
-    '&pound;20million',
-    '&pound;211',
-    '&pound;22.8',
-    '&pound;22.85',
-    '&pound;229.99',
     '&pound;23.00',
-    '&pound;23.4',
-    '&pound;231',
-    '&pound;234,000',
-    '&pound;236',
-    '&pound;250000',
-    '&pound;257',
-    '&pound;263',
-    '&pound;264',
-    '&pound;27,500',
-    '&pound;270m',
-    '&pound;285,000',
-    '&pound;295,000',
-    '&pound;2billion',
-    '&pound;3,445',
-    '&pound;3,900',
     '&pound;3.18',
-    '&pound;3.66',
-    '&pound;3.69',
-    '&pound;30-&pound;40',
-    '&pound;30.3m',
-    '&pound;30.9m',
-    '&pound;300000',
-    '&pound;31.1m',
-    '&pound;313',
-    '&pound;32.99',
-    '&pound;324',
-    '&pound;33,500',
-    '&pound;33.50',
-    '&pound;35.99',
-    '&pound;35000',
-    '&pound;351',
     '&pound;357',
-    '&pound;359',
-    '&pound;368',
-    '&pound;37.95',
-    '&pound;38.50',
-    '&pound;38.6m',
-    '&pound;4,250',
-    '&pound;4.65',
-    '&pound;4.76',
-    '&pound;40.4m',
-    '&pound;400&ndash;600,000',
-    '&pound;400,000&ndash;533,000',
-    '&pound;40k',
-    '&pound;42.99',
-    '&pound;435',
-    '&pound;444',
     '&pound;455',
-    '&pound;460m',
-    '&pound;47.50',
-    '&pound;47.7m',
-    '&pound;485',
-    '&pound;5,250',
-    '&pound;5,300',
-    '&pound;5,600',
-    '&pound;5-a-race',
-    '&pound;5.30',
-    '&pound;5.35',
-    '&pound;5.7',
-    '&pound;5.70',
-    '&pound;5.85',
-    '&pound;5.90',
-    '&pound;500-a-night',
     '&pound;50million',
-    '&pound;52.5m',
-    '&pound;521',
-    '&pound;53,000',
-    '&pound;53.40',
-    '&pound;53m',
-    '&pound;545',
-    '&pound;54million',
-    '&pound;56,250',
-    '&pound;564',
-    '&pound;58million',
-    '&pound;6,250',
-    '&pound;6,750',
-    '&pound;6.6m',
-    '&pound;608',
-    '&pound;610',
     '&pound;625,000',
-    '&pound;626',
-    '&pound;628',
-    '&pound;62m',
-    '&pound;63,047',
-    '&pound;63m',
-    '&pound;640',
-    '&pound;643',
-    '&pound;650m',
-    '&pound;66m',
-    '&pound;670,000',
-    '&pound;680',
-    '&pound;688',
-    '&pound;69,950',
-    '&pound;690,000',
-    '&pound;7,200',
     '&pound;7.4m',
-    '&pound;7.80',
-    '&pound;7.90',
-    '&pound;7.9m',
-    '&pound;70&ndash;100,000',
-    '&pound;725,000',
-    '&pound;73m',
-    '&pound;749',
-    '&pound;74m',
-    '&pound;760',
-    '&pound;760,000',
-    '&pound;763',
-    '&pound;77,000',
-    '&pound;789',
-    '&pound;7million',
-    '&pound;8,250',
     '&pound;8.3',
-    '&pound;8.6',
-    '&pound;8.8',
-    '&pound;80.00',
-    '&pound;80000',
-    '&pound;84,000',
-    '&pound;84m',
-    '&pound;851',
-    '&pound;86m',
-    '&pound;89.50',
-    '&pound;9.1m',
-    '&pound;9.3m',
-    '&pound;9.7',
-    '&pound;9.8m',
-    '&pound;92m',
-    '&pound;93,000',
     '&pound;940',
-    '&pound;945',
-    '&pound;950,000',
-    '&pound;96m',
-    '&pound;995,000',
-    '&pound;s',
-    '&times;20',
-    '&times;30',
-    '&times;40',
-    '&times;56',
-    '&trade',
-    '&uuml;ber',
-    '\'77',
-    '\'95',
-    '\'98',
-    '\'am',
     '\'ate',
-    '\'eck',
-    '\'fifties',
-    '\'g\'',
-    '\'how',
-    '\'kin',
-    '\'night',
-    '\'ole',
-    '\'oss',
-    '\'photograph',
-    '\'said',
-    '\'sixties',
-    '\'then',
-    '\'twere',
-    '\'vehicle\'',
-    '***lt.',
     '**appointed',
-    '**datuk',
-    '*abd',
-    '*against',
-    '*c',
-    '*dan',
-    '*excluding',
-    '*kim',
-    '*medlearn*',
-    '*michel',
-    '*syed',
-    '*u',
-    '+&amp;plus',
-    '+0200',
-    '+100',
-    '+12',
     '+18',
-    '+50',
-    '+75',
-    '-&gt',
-    '-(1.7)',
-    '-0',
-    '-0.01',
-    '-11',
-    '-15&deg;c',
-    '-16',
-    '-19',
-    '-287',
-    '-30&deg',
-    '-30&deg;c',
-    '-41.5',
-    '-55-',
     '-75',
-    '-aminobenzoic',
-    '-c.',
-    '-f',
-    '-he',
-    '-isms',
-    '-linolenic',
-    '-p',
-    '-ribbons',
-    '-space',
-    '-tion',
-    '-with',
-    '/0/',
-    '/b/',
-    '/data',
-    '/m',
     '/n',
-    '/n/',
-    '/t',
-    '/u',
-    '0&ndash;100',
-    '0&ndash;15',
-    '0&ndash;4&ndash;0',
-    '0&ndash;8',
-    '0-1',
-    '0.026',
-    '0.04%',
-    '0.1&mgr;m',
-    '0.134',
-    '0.74',
-    '0.8m',
-    '000000',
     '00:31',
-    '00:32',
-    '00:33',
-    '00:35',
-    '00:36',
-    '012',
-    '01:30',
-    '020',
-    '0200',
-    '0201',
-    '0204',
-    '0224',
-    '0227',
-    '0253',
-    '02:12',
-    '02:30',
     '02:33',
-    '030&deg',
-    '0305',
-    '0323',
-    '035',
-    '0372',
-    '0376',
-    '040',
-    '0403',
-    '041-332-8787',
-    '0429',
-    '043',
-    '0430',
-    '0434',
-    '0454',
-    '05.00',
     '0502.5',
-    '0506',
-    '0507',
-    '0509',
-    '0539',
-    '055',
-    '05:27',
-    '05:51',
-    '05:53',
-    '05:54',
-    '06.00',
-    '060',
-    '0608',
-    '0609',
-    '0634',
-    '0639',
     '06:05',
-    '06:24',
-    '06:25',
-    '06:27',
-    '06:39',
-    '06:45',
-    '071&ndash;245',
-    '071&ndash;351',
-    '071&ndash;437',
-    '071&ndash;629',
-    '071&ndash;928',
-    '0722',
-    '0743',
-    '0782',
-    '0784',
-    '07:02',
     '07:20',
-    '08.45',
-    '0836',
-    '08:29',
-    '0915',
-    '0923',
-    '0969',
-    '0983',
-    '0=no',
-    '0bj',
-    '0dh',
-    '0pts',
-    '1&frac12;d',
-    '1&micro;m',
-    '1&ndash;17',
-    '1&ndash;18',
     '1&ndash;22',
-    '1&ndash;23',
-    '1&ndash;2min',
-    '1(7)',
-    '1,000-up',
-    '1,000dpi',
-    '1,000kms',
-    '1,008',
-    '1,075',
-    '1,089',
-    '1,160',
-    '1,2,3,4',
-    '1,200dpi',
-    '1,200kg',
-    '1,412',
-    '1,500-strong',
     '1,760',
-    '1-8',
-    '1-axis',
-    '1-litre',
-    '1.06',
-    '1.09',
-    '1.1.5',
-    '1.15pm',
-    '1.2pc',
-    '1.3gb',
-    '1.4.10',
-    '1.43',
-    '1.4s',
-    '1.5&ins',
-    '1.54',
-    '1.5kg',
     '1.5kpc',
-    '1.5v',
-    '1.5w',
-    '1.60',
-    '1.69',
-    '1.71',
-    '1.74',
-    '1.75%',
-    '1.82',
-    '1.86',
-    '1.87',
-    '1.89',
-    '1.91',
-    '1.95',
-    '1/10',
-    '1/11.93',
     '1/2p',
-    '1/50',
-    '1/8',
-    '1/r',
-    '10&frac14',
-    '10&ndash;17',
-    '10&ndash;50',
-    '10\'s',
-    '10,300',
-    '10,700',
-    '10,700,000',
-    '10-16',
-    '10-cm',
-    '10-stone',
-    '10.01',
-    '10.21',
     '10.29',
-    '10.33',
-    '10.36',
-    '10.44',
-    '10.52',
-    '10.64',
-    '10.73',
-    '10.95',
-    '10.99',
-    '10/1',
-    '10/20',
-    '100&micro;m',
-    '100,000-strong',
-    '100-foot',
-    '100.00',
-    '1000gns',
     '1000km',
-    '1003.2',
-    '1009&mdash;12',
-    '100lbs',
-    '100mh',
-    '101%',
-    '101.6',
-    '1024x768',
-    '1038',
-    '103p',
-    '104,000',
-    '1041',
-    '1043',
-    '1048',
-    '1049',
-    '105&ndash;6',
     '105cm',
-    '105p',
-    '106&ndash;7',
-    '106th',
-    '107.8',
-    '1073',
-    '108%',
-    '1081',
-    '108th',
-    '109th',
-    '10:16',
-    '10:32',
-    '10b',
-    '10inch',
-    '10l',
-    '10mins',
     '10pt',
-    '11&ndash;08',
-    '11&ndash;21',
-    '11&plus;1',
-    '11(7)',
-    '11(a)',
-    '11,200',
-    '11-',
-    '11.00pm',
-    '11.15pm',
-    '11.19',
-    '11.2.1',
-    '11.28',
-    '11.31',
-    '11.45am',
-    '11.50',
     '11.57',
-    '1108.1',
-    '111,000',
-    '112%',
-    '112cm',
-    '1137',
-    '113p',
-    '114th',
-    '115g',
-    '115p',
-    '119,000',
-    '1195',
-    '11:21',
-    '11am-5pm',
-    '11am-6pm',
-    '11d.',
     '11mm',
-    '12&ndash;2',
-    '12&ndash;36',
-    '12,000-strong',
-    '12,400',
-    '12-step',
-    '12.11',
-    '12.2(a)',
-    '12.22',
-    '12.33',
-    '12.41',
-    '12.51',
-    '12.55',
-    '12.57',
-    '12.5p',
-    '12.99',
     '120,000-strong',
-    '120-strong',
-    '1220s',
-    '1229',
-    '124%',
-    '1241',
-    '125cm',
-    '1273&ndash;5',
-    '1279&ndash;80',
-    '1294&ndash;8',
-    '12:1',
-    '12:2',
-    '12cms',
-    '12lbs',
-    '12pm',
-    '12th-minute',
     '13&frac12',
-    '13&frac34',
-    '13&ndash;19',
-    '13,600',
-    '13-',
-    '13-17',
-    '13.06',
-    '13.13',
-    '13.2.1',
-    '13.20',
-    '13.21',
-    '13.6.1',
-    '13.6.8',
-    '13/11/74',
-    '13/16',
-    '130%',
     '130-member',
-    '13000',
-    '130mb',
-    '130r(5)',
-    '1340&ndash;1',
-    '137,000',
-    '14&deg',
-    '14&ndash;0',
-    '14&ndash;10',
-    '14&ndash;13',
-    '14&ndash;3',
-    '14(7)',
-    '14-mile',
-    '14-page',
-    '14.20',
-    '14.3.1',
     '14.30',
-    '14.44',
-    '14.50',
-    '140%',
-    '140&ndash;1',
-    '1409',
-    '143,000',
-    '1434',
-    '1436',
-    '143mph',
-    '1446',
-    '14:1',
-    '14cm',
-    '14e',
-    '14m1',
-    '14th.',
     '15&frac12',
-    '15&ndash;12',
-    '15&ndash;21',
-    '15&ndash;64',
-    '15&percnt',
-    '15,000-strong',
-    '15,600',
-    '15,900',
-    '15-1',
-    '15-fold',
-    '15-inch',
-    '15.50',
-    '15.6.5',
-    '15/5/87',
-    '150,000-strong',
-    '1500msc',
     '150ml/',
-    '150pc',
-    '153&ndash;4',
-    '153,000',
-    '155&ndash;6',
-    '155,000',
-    '155mbps',
-    '155mph',
-    '158&ndash;9',
-    '1596&ndash;1650',
-    '15:20',
-    '15:21',
-    '15:22',
-    '15:26',
-    '15kms',
-    '15st',
     '15th.',
-    '16&deg;c',
-    '16&frac12',
-    '16&ndash;07',
-    '16&ndash;10',
-    '16&ndash;13',
-    '16&plus',
-    '16-megabit',
-    '16.13',
-    '16.37',
-    '16.3hh',
-    '16.48',
-    '16/3/87',
-    '16000',
-    '160mb',
-    '160mph',
     '162bp',
-    '1632&ndash;1704',
-    '164.0',
-    '165p',
-    '166,000',
-    '1660&ndash;1851',
-    '168&ndash;9',
-    '1689&ndash;90',
-    '16:20',
-    '16:8',
-    '16:9',
-    '16km/10mls',
-    '16pp',
-    '17&frac12;p',
-    '17&ndash;0',
-    '17&ndash;13',
     '17-23',
-    '17.0%',
-    '17.10',
-    '17.19',
-    '17.6%',
-    '17.7%',
-    '17/10/93',
-    '170%',
-    '1701&ndash;2',
-    '174,000',
-    '1748&ndash;9',
-    '1750&ndash;1880',
-    '1754&ndash;1790',
-    '175ml/6fl',
-    '176&ndash;7',
-    '177,000',
     '1790&ndash;1820',
-    '1798&ndash;1857',
-    '179th',
-    '17s',
-    '17st',
-    '18&deg',
-    '18&ndash;0',
-    '18&ndash;15',
-    '18&ndash;24in',
-    '18&ndash;35',
-    '18&ndash;44',
-    '18-23',
-    '180-member',
-    '1820&ndash;1903',
-    '1830s/1840s',
-    '1848&ndash;50',
     '1849&ndash;50',
-    '1850-1914',
-    '1858&ndash;1917',
-    '1858&ndash;9',
-    '1859&ndash;61',
-    '1860&ndash;1',
-    '1865u',
-    '1875&ndash;6',
-    '1879&ndash;80',
-    '187p',
-    '1882&ndash;3',
-    '1888&ndash;9',
-    '189,000',
-    '1890\'s',
-    '1891&ndash;2',
-    '1894&ndash;5',
     '1894&ndash;95',
-    '1896&ndash;7',
-    '1897&ndash;8',
-    '1899&ndash;1902',
-    '18cm/7in',
-    '18ct',
-    '18q',
-    '19&deg;c',
-    '19(3)',
-    '19,200',
-    '19.30',
-    '19.5%',
-    '1907&ndash;08',
-    '1907&ndash;8',
-    '1908&ndash;11',
-    '190e',
     '190p',
-    '1911&ndash;13',
-    '1914-18',
-    '192,000',
-    '1922a',
-    '1923&ndash;24',
-    '1926&ndash;7',
-    '1927&ndash;30',
-    '1928&ndash;32',
-    '1929&ndash;32',
-    '192mb',
-    '192p',
-    '1930s/1940s',
-    '1933&ndash;4',
-    '1937&ndash;45',
-    '1938&ndash;9',
     '194,000',
-    '1942-44',
-    '1943&ndash;77',
-    '1944&ndash;45',
-    '1945&mdash;46',
-    '1945.',
-    '1947&ndash;9',
-    '1948b',
-    '1950&ndash;2',
-    '1950a',
-    '1954a',
-    '1955&ndash;70',
-    '1963&ndash;4',
-    '1965&ndash;1975',
-    '1965a',
-    '1968&ndash;75',
     '1968&ndash;9',
-    '1969&ndash;71',
-    '1970&ndash;89',
-    '1970/71',
-    '1971&ndash;72',
-    '1971&ndash;78',
-    '1971&ndash;79',
-    '1972&ndash;4',
-    '1972.',
-    '1973&ndash;75',
-    '1974&ndash;6',
-    '1974&ndash;77',
-    '1974&ndash;9',
-    '1974-75',
-    '1975-84',
-    '1976&ndash;80',
     '1976-83',
-    '1977&ndash;79',
-    '1977&ndash;84',
-    '1977&ndash;87',
-    '1978&ndash;89',
-    '1979&ndash;86',
-    '1979&ndash;89',
-    '1979-83',
-    '1981&ndash;3',
-    '1981&ndash;6',
-    '1982&ndash;1992',
-    '1982&ndash;5',
-    '1982&ndash;84',
-    '1983&ndash;88',
-    '1983-4',
-    '1984&ndash;6',
     '1985-87',
-    '1985.',
-    '1986&ndash;7c',
-    '1989-93',
-    '1992&ndash;1993',
-    '1992&ndash;friday',
-    '1992/milton',
-    '1993\'s',
-    '1996/97',
-    '19:1&ndash;10',
-    '19:8',
-    '19b',
-    '19e',
-    '19th-',
-    '19y0',
-    '1:03',
     '1:21',
-    '1:250000',
-    '1aa',
-    '1ea',
-    '1eb',
-    '1ff',
-    '1gbps',
-    '1lh',
-    '1mg/ml',
-    '1sb',
-    '1tb',
-    '1tt',
-    '1x',
-    '2&frac12;cms',
-    '2&ndash;30',
-    '2&ndash;36',
     '2&ndash;3in',
-    '2&ndash;4%',
-    '2&pgr',
-    '2\'',
-    '2(13)',
-    '2(i)',
-    '2+2',
-    '2,001',
-    '2,050',
-    '2,128',
-    '2,131',
-    '2,147',
-    '2,151',
-    '2,165',
-    '2,175',
-    '2,185',
     '2,200-mile',
-    '2,3,4',
-    '2,350',
-    '2,400bps',
-    '2,550',
-    '2-30pm',
-    '2-8',
-    '2-8-0',
-    '2-9',
-    '2-day',
-    '2-dimensional',
-    '2-lb',
-    '2-line',
-    '2-week',
-    '2.0a',
-    '2.10pm',
     '2.1p',
-    '2.2.0',
-    '2.25%',
-    '2.25m',
-    '2.3.5',
-    '2.31',
-    '2.3p',
-    '2.4p',
-    '2.51',
-    '2.6-kb',
-    '2.6.5',
-    '2.60',
-    '2.69',
-    '2.6k',
-    '2.7.1.1',
-    '2.70',
     '2.72',
-    '2.85',
-    '2.9.3',
-    '2/11',
-    '20&ndash;18',
-    '20&ndash;4',
-    '20\'',
-    '20,300',
-    '20-24',
-    '20-mar',
-    '20-ton',
-    '20.7%',
-    '20/21',
-    '200&ndash;400',
-    '200+',
-    '200,000,000',
     '200-acre',
-    '200-odd',
-    '200-s',
-    '2009',
-    '2019',
-    '20207',
-    '2026',
-    '2035',
-    '2045',
-    '2048',
-    '205gti',
-    '207&ndash;8',
-    '2087',
-    '208pp',
-    '2099',
-    '20:17',
     '20myr',
-    '21&ndash;18',
-    '21&ndash;3',
-    '21&ndash;30',
-    '21&ndash;4',
-    '21&ndash;apr',
-    '21&ndash;april',
-    '21-26',
-    '21-28',
-    '21-9',
-    '21-cm',
-    '21-may',
-    '21-seat',
-    '21.0',
-    '21.00',
-    '21.30',
     '21.32',
-    '2124',
-    '214,000',
-    '2140',
-    '2155',
-    '217,000',
-    '219p',
-    '21c',
-    '21cm',
-    '21k',
-    '21m',
-    '22&ndash;0',
-    '22&ndash;13',
-    '22&ndash;25',
-    '22&ndash;july',
-    '22,000,000',
     '22,086,000',
-    '22-27',
-    '22-month-old',
-    '22.0',
-    '22.30',
-    '22.39',
-    '22.5%',
-    '2201',
-    '222,000',
-    '22482',
-    '2251',
-    '2252',
-    '228,000',
-    '2286',
-    '22lb',
-    '22m',
     '23&deg;c',
-    '23(1)',
-    '23-26',
-    '23.59',
-    '230&deg;c',
-    '2303',
-    '231,000',
-    '2310',
-    '2313',
-    '235,000',
-    '237p',
-    '238,000',
-    '23cm/9in',
-    '24&ndash;10',
-    '24&ndash;21',
-    '24(1)',
     '24,500',
-    '24-27',
-    '24.0',
-    '24.8%',
-    '240mb',
-    '242561',
-    '243,000',
-    '24391',
-    '245,000',
-    '24a',
-    '25&frac12&ins',
-    '25&ndash;28',
-    '25&ndash;9',
-    '25&shilling',
-    '25,000,000',
-    '25,26',
     '25,500',
-    '25-day',
-    '25-strong',
-    '25.0',
-    '25.5%',
-    '25.7%',
-    '25.8%',
-    '25.9',
-    '25/3/74',
-    '250%',
-    '250&deg;c',
-    '252252',
-    '256,000',
-    '256p',
-    '25c',
-    '25cl',
     '25kv',
-    '26&deg;c',
-    '26,000,000',
-    '26.0',
-    '26.01',
-    '26.1',
-    '26.3%',
-    '26.8',
-    '260-day',
-    '260516',
-    '262&ndash;3',
-    '262s',
-    '265-day',
-    '265p',
-    '268(1)',
-    '269396',
     '27&ndash;33',
-    '27&ndash;35',
-    '27&sol;80',
-    '27,000,000',
-    '27-31',
-    '27.0',
-    '27.2%',
-    '27.5%',
-    '27.7',
-    '270p',
-    '275g',
-    '276p',
-    '2782',
-    '279678',
-    '27secs',
-    '28.0',
     '28.9%',
-    '280g',
-    '283,000',
-    '28:19',
-    '28a',
-    '29&frac12',
-    '29.',
-    '29.1',
-    '29.3%',
-    '29.5%',
-    '29.9%',
-    '29/30',
-    '2971',
-    '29990',
-    '299p',
-    '29lb',
     '2:1&ndash;12',
-    '2:10',
-    '2:11',
-    '2:28',
-    '2bb',
-    '2kb',
-    '2mins',
-    '2pt',
-    '2pts',
-    '2rd',
-    '2ta',
-    '2tt',
-    '2ye',
-    '3&frac12/3&frac12',
-    '3&ndash;15',
-    '3&ndash;16',
     '3&ndash;4min',
-    '3&ndash;5%',
-    '3&shilling;6',
-    '3&times;10',
-    '3\'-end',
-    '3(6a)',
-    '3,350',
-    '3,5',
-    '3,800,000',
-    '3-14',
-    '3-cycle',
-    '3-pin',
-    '3.0.1',
-    '3.06',
-    '3.142',
-    '3.1a',
     '3.24(b)',
-    '3.25%',
-    '3.43',
-    '3.44',
-    '3.5.3',
-    '3.5in',
-    '3.60',
-    '3.6p',
-    '3.7.3',
-    '3.75p',
-    '3.8m',
-    '3.95',
-    '3/6',
-    '3/8',
-    '3/84',
-    '30&ndash;80',
     '30&ndash;90',
-    '30&shilling',
-    '30-',
-    '30-july',
-    '30.6',
-    '300,000-strong',
-    '300-akce',
-    '30amp',
-    '30hz',
-    '31&deg',
-    '31-aug.',
-    '31.',
-    '31.0',
-    '31.6',
-    '31/10/93',
-    '3120',
     '317s',
-    '31c',
-    '31m',
-    '32.4',
-    '32.7%',
-    '32.9',
-    '3205',
-    '320mb',
-    '320sc',
-    '33&frac13',
-    '33&ndash;4',
-    '33.0',
-    '33.4',
-    '33.5%',
-    '330p',
-    '3330',
     '336,000',
-    '34&ins',
-    '34.6%',
-    '34027',
-    '340g',
-    '345,000',
-    '345p',
-    '346,000',
-    '34767-68',
-    '34889',
-    '34a',
-    '35&ndash;9',
-    '35.1',
-    '35.2',
-    '35.2%',
-    '35.3',
     '35.7',
-    '350&deg',
-    '350&deg;f/gas',
-    '35000',
-    '35005',
-    '35440-42',
-    '35534',
-    '35678',
-    '356p',
-    '35792',
-    '359th',
-    '35b',
-    '36&ndash;43',
-    '36&ndash;7',
-    '36,000,000',
-    '36-bit',
     '36.1%',
-    '36230',
-    '36350',
-    '36367-69',
-    '36394',
-    '36403',
-    '36404',
-    '36415',
-    '36466',
-    '36470',
-    '36493',
-    '36508',
-    '36519',
-    '36523',
-    '36526',
-    '36573',
     '36579-80',
-    '36669',
-    '36726',
-    '36728',
-    '36764',
-    '36765',
-    '3677',
-    '36780',
-    '36816',
-    '36837',
-    '36855',
-    '36891',
-    '36893',
-    '36900',
-    '36909',
-    '36945',
     '36968',
-    '36973',
-    '36977',
-    '36991',
-    '36cm',
-    '36pc',
-    '37&ndash;8',
-    '37.04',
-    '37.1%',
-    '37.2',
-    '37.9',
-    '37.9%',
-    '37014',
-    '37030-31',
-    '37037',
-    '37051',
     '37052',
-    '37054',
-    '37104-05',
-    '37109',
-    '37150',
-    '37170',
-    '37173',
-    '37177',
-    '37182',
-    '37183-84',
-    '37188',
-    '37196',
-    '37197',
-    '37224',
-    '37236',
-    '37238',
     '37247',
-    '37248',
-    '37251',
-    '37263',
-    '37265',
-    '37299',
-    '37323',
-    '37325-26',
-    '37328',
-    '37331',
-    '37333',
-    '37357',
-    '37371',
-    '37371-72',
-    '37377',
-    '37378',
     '37383',
-    '37386',
-    '37412',
-    '37437',
-    '37443',
-    '37472-73',
-    '37480',
-    '37509',
-    '37522',
-    '37530',
-    '37531',
-    '37541',
-    '37547',
-    '37548',
-    '37551',
-    '37607',
     '37611',
-    '37620',
-    '37622',
-    '37623',
-    '37637',
-    '37651',
-    '37652',
-    '37652-53',
-    '37668',
-    '37677',
-    '37684',
-    '37709',
-    '37737',
-    '37746',
-    '37755',
-    '37765',
     '37777',
-    '37789',
-    '37791',
-    '37794',
-    '37797',
-    '37802',
-    '37807',
-    '37817',
-    '37839-40',
-    '37842',
-    '37852',
-    '37854-55',
-    '37856',
-    '37871',
-    '37875',
-    '37897',
     '37898',
-    '37912',
-    '37932',
-    '37940',
-    '37942',
-    '37943',
-    '37946-47',
-    '37953',
-    '37961',
-    '37963',
-    '37971',
-    '37988',
-    '37a',
-    '37s',
-    '38&deg;c',
-    '38.1',
     '38.2',
-    '38.2%',
-    '38003',
-    '38014',
-    '38015',
-    '38023',
-    '38026',
-    '38105',
-    '38108',
-    '38114',
-    '38117',
-    '3812',
-    '38131',
-    '38132',
-    '38133',
-    '38135',
     '38146',
-    '38154',
-    '38157',
-    '38163',
-    '38179',
-    '38187',
-    '381a',
-    '38206',
-    '38208',
-    '38274-75',
-    '38275',
-    '38302',
-    '38321',
-    '38325',
-    '38327',
-    '38347',
     '38358',
-    '38363',
-    '38378',
-    '38387',
-    '3839',
-    '38392',
-    '38395',
-    '38405',
-    '38425',
-    '38428',
-    '38432',
-    '38434',
-    '38448',
-    '38465',
-    '38520',
-    '38530',
     '38535',
-    '38539',
-    '38541',
-    '38554',
-    '38580',
-    '38591',
-    '38599',
-    '386&ndash;400',
-    '38676',
-    '38685-86',
-    '38695',
-    '386nx',
-    '386sl',
-    '38706',
-    '38709',
-    '38721',
     '38722',
-    '38730',
-    '38737',
-    '38744-45',
-    '38755',
-    '38762',
-    '38769-70',
-    '38790',
-    '387dx',
-    '38820',
-    '38827',
-    '38833',
-    '38842',
-    '38856',
-    '38872',
-    '38875',
     '38878',
-    '38885',
-    '38887',
-    '38888-89',
-    '38901',
-    '38906',
-    '38917',
-    '38924',
-    '38970',
-    '38972',
-    '38975',
-    '38990',
-    '38mm',
-    '39&frac12',
-    '39(11)',
-    '39(3)',
     '39,800',
-    '39-cm',
-    '39.1',
-    '39.3',
-    '39.8',
-    '39000',
-    '39002',
-    '39007',
-    '39017',
-    '39037',
-    '39045-46',
-    '39049',
-    '39058',
-    '39073',
-    '39094',
-    '39095',
     '39105',
-    '39115',
-    '39132',
-    '39159',
-    '39167',
-    '394.5',
-    '39a',
-    '39ft',
-    '3:12',
-    '3:13',
-    '3:17',
-    '3:4',
-    '3:7',
-    '3:8',
-    '3i\'s',
-    '3k',
     '3mb',
-    '3nl',
-    '3rds',
-    '3rh',
-    '3tbsp',
-    '4&commat;1/2',
-    '4&frac12;in',
-    '4&ndash;12',
-    '4&ndash;30',
-    '4&ndash;4&ndash;0',
-    '4&ndash;4-2',
-    '4&ndash;5%',
-    '4&ndash;5min',
-    '4,096',
-    '4,5,6',
-    '4-10',
     '4-way',
-    '4.1(b)',
-    '4.1.4',
-    '4.11(b)',
-    '4.2.5',
-    '4.26',
-    '4.2b',
-    '4.35',
-    '4.3kb',
-    '4.3m',
-    '4.47',
-    '4.4m',
-    '4.5(b)',
-    '4.5mm',
-    '4.5p',
-    '4.6.2',
     '4.7(b)',
-    '4.7pc',
-    '4.9pc',
-    '4/',
-    '4/6',
-    '4/89',
-    '40&ndash;43',
-    '40&ndash;50%',
-    '40(3)',
-    '40+',
-    '40-mile',
-    '40.9%',
-    '400,000-volt',
-    '400-day',
-    '400-plus',
-    '400-year-old',
     '400lb',
-    '4011',
-    '4013',
-    '4050',
-    '4064/89',
-    '408p',
-    '40lb',
-    '41&ndash;2',
-    '41.8%',
-    '410,000',
-    '4113',
-    '4114',
-    '412,000',
-    '42-mers',
-    '42.3',
-    '425,000',
     '425g/15oz',
-    '425mb',
-    '43(1)',
-    '43.1',
-    '43.1%',
-    '43.2',
-    '43.5',
-    '43.6%',
-    '43.9',
-    '4319',
-    '435p',
-    '44(1)',
-    '44.4',
-    '44.6%',
-    '44.7%',
-    '44.9',
     '443p',
-    '4468',
-    '44a',
-    '45&ndash;90',
-    '45,000,000',
-    '45-degree',
-    '45.4',
-    '45.7%',
-    '45.8',
-    '450-seat',
-    '450th',
-    '453-3366',
-    '45596',
-    '455p',
-    '459p',
-    '45lb',
     '46.6%',
-    '4680',
-    '47(2)',
-    '47-hour',
-    '47.1',
-    '47.1%',
-    '47.3',
-    '47.6%',
-    '4771',
-    '48(1)',
-    '48-member',
-    '48.',
-    '48.2',
-    '484p',
-    '485p',
-    '486/smp',
     '48a',
-    '48p/minute',
-    '49.2',
-    '49.3%',
-    '49.7',
-    '490,000',
-    '491212',
-    '4:10',
-    '4af',
-    '4bn',
-    '4de',
-    '4er',
-    '4fl',
-    '4hz',
-    '4i',
-    '4kev',
     '4km',
-    '4x400',
-    '5&frac14&ins',
-    '5&micro;g',
-    '5&ndash;3&ndash;2',
-    '5&ndash;30',
-    '5&ndash;6ft',
-    '5\'-ag',
-    '5,128',
-    '5,240',
-    '5,626',
-    '5-11',
-    '5-flourouracil',
-    '5-fold',
-    '5-ht',
-    '5-speed',
     '5.00am',
-    '5.04.93',
-    '5.1.4',
-    '5.10(b)',
-    '5.17(a)',
-    '5.2a',
-    '5.38',
-    '5.4.6',
-    '5.42',
-    '5.48',
-    '5.5.1',
-    '5.59',
-    '5.6.1',
-    '5.61',
-    '5.65',
-    '5.8.3',
     '5/-',
-    '5/8',
-    '5/8in',
-    '50&ins',
-    '50&mgr;m',
-    '50&ndash;55',
-    '50&ndash;70%',
-    '50-',
-    '50-70%',
-    '50.7%',
-    '500-page',
-    '5000s',
-    '500mg',
-    '5080',
-    '50cms',
-    '5150',
     '51k4',
-    '51mm',
-    '52&ndash;53',
-    '52(1)',
-    '52-week',
-    '52.1',
-    '52.5%',
-    '52.9',
-    '528p',
-    '53.3',
-    '53.6%',
-    '530,000',
-    '5300',
-    '53f5',
-    '53pc',
-    '54&ndash;5',
     '54(2)',
-    '54.3',
-    '54.5%',
-    '5454',
-    '55-member',
-    '55-mer',
-    '55.7%',
-    '55f',
-    '55m',
-    '56.4',
-    '56.8%',
-    '5656',
-    '57.6',
-    '570,000',
-    '577-seat',
-    '57ft',
     '58.1',
-    '58.4',
-    '59.8',
-    '59.9',
-    '5:21',
-    '5:4',
-    '5:5',
-    '5ths',
-    '6&frac12;d',
-    '6&ndash;42',
-    '6&ndash;60',
-    '6&ndash;9in',
-    '6&shilling',
-    '6(5)',
-    '6,000-strong',
-    '6-15',
     '6-week',
-    '6.0&ndash;7.0',
-    '6.0.0',
-    '6.22d',
-    '6.2p',
-    '6.37',
-    '6.39',
-    '6.4b',
-    '6.5&ndash;7.5',
-    '6.6.4',
-    '6.6b',
-    '6.80',
-    '6/6',
-    '6/60',
-    '60&ft',
-    '60&ndash;61',
     '60&ndash;69',
-    '60&ndash;70%',
-    '60&ndash;75',
-    '60.2',
-    '60/65',
-    '600-acre',
-    '600-page',
-    '6010',
-    '605p',
-    '606200',
-    '60mg',
-    '60min',
-    '61.0',
-    '6120',
-    '61f',
-    '61pc',
     '62,500',
-    '620,000',
-    '63&ndash;4',
-    '63&ndash;6',
-    '63,500',
-    '63-member',
-    '63.3',
-    '63b',
-    '63p',
-    '63pc',
-    '645169',
-    '65&ndash;9',
-    '65(2)',
-    '65-member',
-    '65535',
-    '65cm',
     '66&deg;f',
-    '66&ndash;74',
-    '6611',
-    '67&deg',
-    '67,500',
-    '67.5',
-    '67.6',
-    '68&deg&ndash;78&deg;f',
-    '68.4',
-    '680x0-based',
-    '6878',
-    '68k4',
-    '68pc',
-    '69.8%',
-    '690mp',
-    '6:1',
     '6br',
-    '6oz/175g',
-    '7&frac12%',
-    '7&frac12;cms',
-    '7&ndash;14',
-    '7,250',
-    '7,500,000',
-    '7-18',
-    '7-year',
-    '7.19',
-    '7.21',
-    '7.3(a)',
-    '7.3.5',
-    '7.30&ndash;10.30pm',
-    '7.30&ndash;8.30pm',
-    '7.4.0',
     '7.5pc',
-    '7.6.1',
-    '7.6.5',
-    '7.99%',
-    '70-year',
-    '700p',
-    '7050',
-    '7070',
-    '70m',
-    '70mhz',
-    '71.3%',
-    '7134',
-    '72&deg&ndash;74&deg;f',
-    '72(4)',
-    '72.',
-    '72.5',
     '72/160',
-    '72/73',
-    '720c',
-    '73.3',
-    '73.5',
-    '7300',
-    '731p',
-    '74&deg&ndash;76&deg;f',
-    '74&deg&ndash;78&deg;f',
-    '740,000',
-    '747&ndash;400',
-    '74a',
-    '75.8',
-    '750g',
-    '750p',
-    '7532',
     '75mh',
-    '76\'s',
-    '76.8%',
-    '76p',
-    '78&deg;f',
-    '78(1)',
-    '78.1%',
-    '7819',
-    '78p',
-    '79-member',
-    '79.3%',
-    '7egns',
-    '7en',
-    '7fe',
-    '7g',
-    '7hl',
     '7sb',
-    '8(b)',
-    '8,100',
-    '8,192',
-    '8,400,000',
-    '8,500,000',
-    '8,600',
-    '8,800',
-    '8-day',
-    '8.10(a)',
-    '8.34',
-    '8.36',
-    '8.3p',
-    '8.3secs',
-    '8.42',
-    '8.5&ins',
     '80&ndash;20',
-    '800-year-old',
-    '800g',
-    '80860-based',
-    '80m',
-    '80th-minute',
-    '82&sol;77',
-    '82.5%',
-    '8200',
-    '821908',
-    '825281',
-    '82mm',
-    '83&ndash;84',
-    '83(2)',
-    '844/1440&ndash;1',
-    '85&ndash;86',
     '86&deg;f',
-    '86,000',
-    '860,000',
-    '86003',
-    '862',
-    '863/1459',
-    '87-member',
-    '87.5',
-    '8733',
-    '8765',
-    '88.2%',
-    '8888',
-    '89-year-old',
-    '896',
-    '899',
-    '8:15',
     '8:26',
-    '8e',
-    '8h',
-    '8ra',
-    '8th.',
-    '8x10',
-    '9&frac34',
-    '9&ndash;21',
-    '9,10',
-    '9,300',
-    '9-14',
-    '9.1.0',
-    '9.14(a)',
-    '9.25pm',
-    '9.2pc',
-    '9.3.2',
     '9.4.1',
-    '9.51',
-    '9.54',
-    '9.5d.p.c.',
-    '9.5m',
-    '9.6(a)',
-    '9.66',
-    '9.79',
-    '9.7p',
-    'a&ntilde;os',
-    'a16',
-    'a20',
-    'a28',
-    'a487',
-    'a_,_a_bit',
-    'abasing',
     'abass',
-    'abbel',
-    'abdoulkarim',
-    'abdurrahman',
-    'abela',
-    'abra',
-    'abrahamson',
-    'absol',
-    'academicus',
-    'acausal',
-    'achilleas',
-    'ackell',
-    'acquirement',
-    'acrylate',
-    'actionwoman',
-    'actualised',
     'acustar',
-    'acutes',
-    'additive-free',
-    'adelman',
-    'adoum',
-    'adrenalin-pumping',
-    'adsorbate',
-    'aee',
-    'aeronaut',
-    'afcac',
-    'afdb',
-    'africana',
-    'afro-lingua',
-    'afrocentric',
-    'againe',
-    'agatean',
     'agathangelou',
-    'agave',
-    'age-regression',
-    'aggleton',
-    'agius',
-    'agl',
-    'aglaia',
-    'agronomy',
-    'ahusquy',
-    'air-travel',
-    'aixe',
-    'ajello',
-    'akim',
-    'akkawi',
-    'akkerman',
-    'ako',
     'al-fau',
-    'al-sabbagh',
-    'al-solh',
-    'al-yamamah',
-    'alanbrooke',
-    'alasitas',
-    'alava',
-    'albinoni',
-    'albuin',
-    'alcaeus',
-    'alcalde',
-    'alco',
-    'ald',
-    'aldcroft',
-    'aldebrand',
-    'alington',
     'alizon',
-    'all-blacks',
-    'all-paper',
-    'allain',
-    'allander',
-    'allnut',
-    'allod',
-    'aloha',
-    'alouette',
-    'alread',
-    'altarnun',
-    'alteceans',
-    'alternet',
-    'alts',
-    'alv&aacute;rez',
-    'alway',
     'amalgams',
-    'amara',
-    'amenartas',
-    'americanize',
-    'amerika',
-    'aminta',
-    'amiroutzes',
-    'ammoniacal',
-    'amortising',
-    'amossy',
-    'ampoule',
-    'amtel',
-    'anaeas',
-    'analogue-to-digital',
-    'anc-inkatha',
-    'anchorite',
     'andernach',
-    'andino',
-    'andouille',
-    'andree',
-    'andrieu',
-    'angeloz',
-    'anglophones',
-    'ann&eacute;es',
-    'annalisa',
-    'anopaia',
-    'anr',
-    'antal',
-    'anthoxanthum',
-    'anti-athenian',
-    'anti-car',
-    'anti-growth',
     'anti-independence',
-    'anti-invasion',
-    'anti-parliamentarianism',
-    'anti-partisan',
-    'anti-perfectionism',
-    'anti-piracy',
-    'anti-satellite',
-    'anti-splash',
-    'anti-thatcherite',
-    'anti-venin',
-    'antidrama',
-    'antiquit&eacute;s',
-    'antirrhinums',
-    'antitype',
-    'antm',
-    'apck',
     'apeshit',
-    'apexes',
-    'apollonia',
-    'apple-cart',
-    'applecarts',
-    'appleshaw',
-    'apprehends',
-    'appriou',
-    'apre',
-    'april-19',
-    'apterygotes',
-    'aquaba',
-    'araglin',
-    'aramis',
-    'archipelagos',
-    'ardagh',
     'ardingly',
-    'areesh',
-    'arga&ntilde;a',
-    'argonne',
-    'arlindo',
-    'armer',
-    'armorials',
-    'army-surplus',
-    'arnfieldi',
-    'arona',
-    'arroyo',
-    'arscott',
-    'arsenazo',
-    'artaria',
-    'artus',
-    'asad',
     'asfordby',
-    'ash-grey',
-    'ashqelon',
-    'ashrafieh',
-    'asphyxiate',
-    'aspro',
-    'assignability',
-    'asteroschema',
-    'asthana',
-    'aswdu',
-    'asystole',
-    'athenaeus',
-    'athenix',
-    'atif',
-    'atti',
-    'aucheneen',
     'auchonvillers',
-    'auldjo',
-    'aulenti',
-    'australopithecines',
-    'austro-russian',
-    'autoclave',
-    'autopoiesis',
-    'autopolis',
-    'autumn-sown',
-    'auty',
-    'avant-gardism',
-    'awan',
-    'awareness-raising',
-    'azurite',
-    'b&amacr;han',
-    'b&auml;cklund',
     'b&ecirc;tes',
-    'bacaudae',
-    'baccara',
-    'bacchic',
-    'back-heeled',
-    'back-pedalled',
-    'back-tracked',
-    'backland',
-    'backlot',
-    'backpedalling',
-    'backslide',
-    'bagger',
-    'baker-shevardnadze',
-    'balie',
-    'ballycarry',
-    'ballysadare',
     'bambara',
-    'bamilike',
-    'bannerets',
-    'bansa',
-    'bapaume',
-    'bar-headed',
-    'bar-ilan',
-    'barabb',
-    'barbered',
-    'barcelona-based',
-    'barnardiston',
-    'barnstormers',
-    'baroni',
-    'barphone',
-    'barrie-brown',
-    'barstool',
     'bart.',
-    'bartholomeus',
-    'bartoszcze',
-    'basutho',
-    'bat-pad',
-    'bavieca',
-    'bawdiness',
-    'bawnmore',
-    'baydun',
-    'bc.',
-    'be_a',
-    'beart',
-    'beastblood',
-    'beatus',
-    'beauport',
-    'becaks',
     'bed-table',
-    'beer-bellied',
-    'befuddle',
-    'begemder',
-    'beghin',
-    'begining',
-    'beginning-of-year',
-    'beguine',
-    'bein',
-    'bela&uacute;nde',
-    'belafonte',
-    'belbo',
-    'belturbet',
-    'bendel',
-    'bentalls',
-    'beqa',
     'berel',
-    'berelands',
-    'berendt',
-    'berlei',
-    'bermans',
-    'bernama',
-    'bernstock',
-    'besa',
-    'besht',
-    'beskett',
-    'besmirch',
-    'beta-carotene',
-    'better-heeled',
-    'bhairon',
-    'bhaktapur',
-    'bhattacharya',
     'bhatti',
-    'bheag',
-    'bicultural',
-    'bidassoa',
-    'biedenkopf',
-    'big-business',
-    'biggerstaff',
-    'bijeljina',
-    'binbag',
-    'binnie',
-    'bio-',
-    'bioenergetics',
-    'biotec',
-    'bioturbated',
-    'birdoswald',
-    'birdseed',
     'birgitta',
-    'bisexuals',
-    'bitterroot',
-    'bitterroots',
-    'black-',
-    'black-belt',
-    'blackbuck',
-    'blackwash',
-    'blais',
-    'blakeston',
-    'blakethwaite',
-    'blatcham',
-    'bleakland',
-    'blessington',
-    'bletchingly',
-    'blincoe',
     'blood-brain',
-    'blood-splattered',
-    'bloodsport',
-    'blubbered',
-    'blueish',
-    'blueshifted',
-    'blumer',
-    'blushers',
-    'bo-bos',
-    'boanareke',
-    'boarding-out',
-    'boat-train',
-    'bobbling',
-    'bodegas',
-    'bodser',
-    'boesak',
     'bohunice',
-    'boisset',
-    'bolle',
-    'boller',
-    'bonhomme',
-    'boof',
-    'bookbank',
-    'bophutatswana',
-    'bordallo',
-    'bordesley',
-    'bordone',
-    'borrowby',
-    'bossidy',
-    'bostic',
-    'bottle-feed',
-    'boull&eacute;e',
     'boulonnais',
-    'boundedness',
-    'bouveries',
-    'bovin',
-    'bow-wow',
-    'bowdoin',
-    'boxplot',
-    'bradgate',
-    'brafield',
-    'brain-numbing',
-    'brainwork',
-    'brandeis',
-    'brass-band',
-    'brassai',
-    'bratina',
-    'bratt',
     'brazened',
-    'bread-bin',
-    'break-point',
-    'breakbeat',
-    'breakpoints',
-    'bredcroft',
-    'breese',
-    'brehme',
-    'breslow',
-    'brevet',
-    'brewking',
-    'bricking',
-    'bridgeworks',
-    'bridies',
-    'brienne',
-    'brigadoon',
     'briganti',
-    'brington',
-    'brislington',
-    'britpop',
-    'brizola',
-    'brocquy',
-    'brokerages',
-    'bronze-age',
-    'bronzino',
-    'broomhall',
-    'broughty',
-    'brown-skinned',
-    'broyle',
-    'brucei',
-    'brummy',
-    'brynmor',
     'bsco',
-    'bt&ndash;13',
-    'buachaille',
-    'bucephala',
-    'buchs',
-    'buffallo',
-    'bufton',
-    'bugattis',
-    'buggins',
-    'bulak',
-    'bulk-buying',
-    'bullimore',
-    'bullseyes',
-    'bumble-bee',
-    'bumbled',
-    'bumpstead',
     'bunkbeds',
-    'buno',
-    'bunuel',
-    'buran',
-    'burkha',
-    'burlap',
-    'burtt',
-    'busfield',
-    'bushwackers',
-    'business-to-business',
-    'businesswomen',
-    'buyhoff',
-    'byroads',
-    'c94',
-    'ca-dbfast',
-    'cacao',
     'cacex',
-    'caden',
-    'cadwell',
-    'caesarism',
-    'cafane',
-    'cairney',
-    'calamares',
-    'calends',
-    'calli&egrave;res',
-    'callidus',
-    'callistus',
-    'calogero',
-    'calorie-controlled',
-    'calyxes',
-    'camazotz',
-    'camelhair',
     'camserney',
-    'can-do',
-    'canepa',
-    'canet',
-    'cannibalize',
-    'cannizzaro',
-    'canosa',
-    'cantelupe',
-    'cantilupe',
-    'canzonette',
-    'capitular',
-    'caprea',
-    'capricorns',
-    'carassius',
-    'carax',
-    'carboxyhaemoglobin',
     'caretta',
-    'cari',
-    'cariboo',
-    'caricaturist',
-    'carillo',
-    'carloads',
-    'carpendens',
-    'carritt',
-    'carryin\'',
-    'carthy',
-    'casanare',
-    'case-finding',
-    'case-room',
-    'caskey',
-    'castedo',
-    'castineau',
     'castlebrae',
-    'castlehaven',
-    'catamarca',
-    'catechetics',
-    'catheterised',
-    'catia',
-    'cauterized',
-    'cavazzoni',
-    'cawl',
-    'cbm',
-    'cecht',
-    'celcius',
-    'cellarer',
-    'cenelec',
-    'centroskew',
-    'cepacia-colonised',
     'cerafoam',
-    'cge-alcatel',
-    'cgg',
-    'chaldeans',
-    'chamade',
-    'champaign',
-    'champed',
-    'champignons',
-    'champillon',
-    'chania',
-    'channi',
-    'chanterelle',
-    'chantiers',
-    'chaot',
-    'chap.',
-    'chasuble',
     'chatterji',
-    'chauffeuse',
-    'chauvel',
-    'cheapskates',
-    'checking-in',
-    'chemdata',
-    'cheramyes',
-    'chernobyl-type',
-    'cherubino',
-    'chestnut-seller',
-    'chiaia',
-    'chiarella',
-    'chiarelli',
-    'chicken-and-egg',
-    'chickpea',
-    'chidren',
     'chigaga',
-    'chikamatsu',
-    'childen',
-    'chilodonella',
-    'chim',
-    'chimney-stack',
-    'ching-kuo',
-    'chinooks',
-    'chivay',
-    'chlorine-free',
-    'choleacs',
-    'cholyglycine',
-    'choosey',
-    'chromatograms',
-    'chromodynamics',
-    'chronograph',
     'chucky',
-    'churchgate',
-    'churchs',
-    'chynoweth',
-    'cipollini',
-    'circlip',
-    'circularized',
-    'cistus',
-    'civets',
-    'cizeta',
-    'classbook',
-    'clc',
-    'clear-sightedness',
-    'clearwell',
-    'clempson',
-    'clenched-fist',
     'clerico',
-    'clewlow',
-    'clontarf',
-    'close-hauled',
-    'closely-fought',
-    'club-shaped',
-    'clubmosses',
-    'clumhach',
-    'cmhc',
-    'cmo',
-    'co-ack',
-    'co-heiress',
-    'co-sponsoring',
-    'coach-driver',
-    'coal-steel',
-    'coalfired',
     'cobol-based',
-    'cockspur',
-    'codeff',
-    'coenties',
-    'coffee-coloured',
-    'cofferer',
-    'coireachan',
-    'coldbath',
-    'colour-code',
-    'commendo',
-    'commissionership',
-    'commonly-held',
-    'commpress',
-    'company-based',
-    'compatability',
-    'comprehensivization',
     'compresent',
-    'compression-moulded',
-    'comunidad',
-    'conation',
-    'concelebration',
-    'conclaves',
-    'conferral',
-    'confiserie',
-    'conflict-free',
-    'congr&egrave;s',
-    'conjecturing',
-    'connons',
-    'consitutional',
-    'constricts',
-    'containerised',
-    'contassium',
     'conundra',
-    'convolutes',
-    'cookridge',
-    'cooksey',
-    'coomb',
-    'coopering',
-    'cop-shop',
-    'cordwood',
-    'cordyline',
-    'corm',
-    'cornall',
-    'cornelis',
-    'correpondent',
-    'cosgrave',
-    'cosima',
-    'coslow',
     'cosper',
-    'cossutta',
-    'cost-consciousness',
-    'cost-improvement',
-    'cotransfected',
-    'cotransport',
-    'couldna',
-    'couns',
-    'counter-measure',
-    'counterattacks',
-    'counterposing',
-    'countrywomen',
-    'courbevoie',
-    'courrier',
-    'course-detail',
-    'cover-glass',
     'cow-catcher',
-    'cow-house',
-    'cowcaddens',
-    'cowdry',
-    'cr&ecirc;ches',
-    'craigantlet',
-    'craigen',
-    'crankos',
-    'crans-sur-sierre',
-    'crawlspace',
-    'crbc',
-    'crespy',
-    'cretonne',
-    'crime-free',
-    'crimond',
-    'crina',
     'crinkle-crankle',
-    'crisan',
-    'crist',
-    'critcher',
-    'critters',
-    'crocodile-skin',
-    'croissy',
-    'crolla',
-    'cromoglycate',
-    'crosier',
-    'cross-impact',
-    'cross-in-square',
-    'crossgar',
-    'crossway',
-    'croupiers',
-    'croute',
     'crow-stepped',
-    'crowle',
-    'culturelink',
-    'cumi&egrave;res',
-    'cuming',
-    'curmudgeonly',
-    'curviceps',
-    'cuscus',
-    'cutey',
-    'cutshall',
-    'cycad',
-    'cyclohexane',
-    'cyclophilin-cyclosporin',
-    'cyert',
-    'cynosurus',
-    'd\'armes',
     'd-5',
-    'd-t',
-    'd19',
-    'dabrowski',
-    'dacoits',
-    'dacosta',
-    'dagan',
-    'daidle',
-    'daisy-wheel',
-    'dakers',
-    'dakka',
-    'dancy',
-    'dandled',
-    'danismend',
-    'danks',
-    'darci',
     'dark-clad',
-    'darnay',
-    'dassler',
-    'datamax',
-    'datapoints',
-    'dataviews',
-    'datrino',
-    'davinson',
-    'day-case',
-    'daye',
-    'daysacks',
-    'dead-eyed',
-    'deadheads',
-    'dealin\'',
-    'death-trap',
-    'debden',
     'debuting',
-    'decd',
-    'deckle',
-    'decleor',
-    'deconsecrated',
-    'decontaminate',
-    'dect',
-    'decworld',
-    'deep-rooting',
-    'deepish',
-    'defaming',
-    'defarge',
-    'defrocked',
-    'defty',
-    'deigns',
-    'deindustrialisation',
     'delamont',
-    'delayed-action',
-    'delayed-return',
-    'delboy',
-    'delphini',
-    'dematerialise',
-    'demontfort',
-    'denney',
-    'deputized',
-    'derailing',
-    'dersch',
-    'desborough',
-    'descombes',
-    'design-based',
-    'destutt',
-    'deutocerebrum',
     'deutschemarks',
-    'deutschen',
-    'devall',
-    'developing-country',
-    'devo',
-    'dexamethazone',
-    'dhc',
-    'diable',
-    'diamond-impregnated',
-    'dibich',
-    'dibutyryl',
-    'dideoxy',
-    'dietl',
-    'dieudonn&eacute',
-    'differe',
-    'digester',
     'digitalfilm',
-    'dimerise',
-    'dimethylsulphoxide',
-    'dimlington',
-    'dinescu',
-    'diogo',
-    'diouri',
-    'directors-general',
-    'dirty-minded',
-    'discomposure',
-    'discordia',
-    'disdains',
-    'disentitlement',
-    'disfranchised',
-    'disintegrator',
-    'dispirit',
     'dlabel',
-    'doant',
-    'dogshit',
-    'doleys',
-    'dolf',
-    'dolts',
-    'donmar',
-    'door-step',
-    'doorknocker',
-    'doppelgangers',
-    'dorpat',
-    'dorrance',
-    'double-click',
-    'double-height',
-    'dowey',
-    'draft-dodging',
     'drancy',
-    'drb',
-    'dressing-gowned',
-    'drinking-horn',
-    'drivechart',
-    'driving-force',
-    'druim',
-    'dse',
-    'dual-bus',
-    'dubosc',
-    'ducrocq',
-    'duenna',
-    'duergar',
-    'dugong',
-    'dum-dum',
-    'dumbbell',
     'dumbuya',
-    'dumpbins',
-    'duncairn',
-    'dunloy',
-    'dunscroft',
-    'durfey',
-    'durga',
-    'durman',
-    'durotriges',
-    'duxford-based',
-    'dwellinghouses',
-    'dwerringhouse',
-    'dwr',
-    'dyno',
-    'e-ferol',
-    'e-systems',
     'e13',
-    'eafe',
-    'eam',
-    'earnley',
-    'ebba',
-    'eboli',
-    'ebrahimi',
-    'ecclesiologist',
-    'ecevit',
-    'echekratidas',
-    'eckhard',
-    'eckhart',
-    'ecml',
-    'ecopetrol',
-    'ecotech',
-    'ecta',
     'edell',
-    'educa',
-    'edup',
-    'eeiba',
-    'effervesce',
-    'egeus',
-    'eggborough',
-    'egglestone',
-    'egyptologists',
-    'ehrenpreis',
-    'eigengesetzlichkeit',
-    'eight-wicket',
-    'einsiedeln',
-    'eiris',
-    'eiscat',
-    'eitc',
     'eleazar',
-    'election-night',
-    'electrica',
-    'electro-chemical',
-    'electro-encephalogram',
-    'electrochemically',
-    'electroshock',
-    'eleven-year',
-    'elevenish',
-    'elfswitha',
-    'elidir',
-    'ellmann',
-    'elmhirst',
-    'elongating',
-    'elsivir',
-    'elsner',
     'embezzle',
-    'embitter',
-    'empiric',
-    'emx',
-    'en-bloc',
-    'enculturation',
-    'encylopedia',
-    'end-feed',
-    'end-stage',
-    'endeth',
-    'endothelin-converting',
-    'engelhard',
-    'engell',
-    'engen',
-    'enguli',
-    'enormo',
     'enterprise-zone',
-    'entity-identifying',
-    'entoto',
-    'entremont',
-    'environ',
-    'environmentally-damaging',
-    'eoghan',
-    'epg',
-    'ephos',
-    'epirus',
-    'erastus',
-    'erdal',
-    'erminia',
-    'ernulf',
-    'erotics',
-    'escrima',
     'esops',
-    'esqre',
-    'esri',
-    'esses',
-    'estcourt',
-    'esteems',
-    'esterh&aacute;zy',
-    'estreito',
-    'etherley',
-    'eupatorium',
-    'euro-election',
-    'eurocard',
-    'eurocommunist',
-    'eurodif',
-    'europhobes',
-    'eustathius',
     'eusthenopteron',
-    'evacuates',
-    'evangelische',
-    'ever-closer',
-    'ever-shifting',
-    'ewaso',
-    'ex-ante',
-    'ex-drug',
-    'ex-empire',
-    'ex-l.c.c',
-    'ex-pugilist',
-    'ex-security',
-    'ex_cathedra',
-    'exhalative',
-    'extra-thick',
-    'extremis',
     'eye-appeal',
-    'eye-catcher',
-    'eyeballed',
-    'ezek.',
-    'f&eacute;n&eacute;on',
-    'f&uuml;rstin',
-    'f(y)',
-    'f-111s',
-    'f-number',
-    'f50',
-    'fabbio',
-    'fabris',
-    'face-painting',
-    'facs',
-    'facta',
-    'factory-based',
     'factory-made',
-    'faial',
-    'fairy-cycle',
-    'fakie',
-    'false-bottomed',
-    'famae',
-    'familymakers',
-    'fanni',
-    'fantoni',
-    'far-red',
-    'farco',
-    'fareda',
-    'fasces',
-    'fasciatus',
-    'fasl',
-    'fat-faced',
     'fatimah',
-    'fattafattafattafatta',
-    'fatwah',
-    'faulknerite',
-    'fedra',
-    'feinting',
-    'female-headed',
-    'fen&ecirc;tre',
-    'fenza',
-    'ferraro',
-    'ferrat',
-    'ferrie',
-    'ferruccio',
-    'feversham',
-    'fff',
-    'fibre-reinforced',
     'fideles',
-    'fidway',
-    'fieri',
-    'fifteen-year-olds',
-    'fifteenth-',
-    'figleaf',
-    'filigreed',
-    'filizzola',
-    'finks',
-    'fire-bombing',
-    'firebombers',
-    'firecracker',
-    'firefox',
-    'firestorm',
-    'fischel',
-    'fish-tail',
     'fisherfield',
-    'fishpaste',
-    'fitzwilliams',
-    'five-act',
-    'five-time',
-    'five-yard',
-    'flabagon',
-    'flashcard',
-    'flat-backed',
-    'flatfoot',
-    'flatted',
-    'flatwoven',
-    'fledgelings',
-    'flemington',
-    'flemish-dutch',
-    'flickscreen',
     'flm',
-    'flockmasters',
-    'flower-vase',
-    'flyway',
-    'fofana',
-    'fohn',
-    'foinaven',
-    'foldaway',
-    'fong',
-    'for-job',
-    'force-land',
-    'foregut',
-    'forehands',
-    'foreign-aid',
-    'foresman',
-    'forestomach',
     'foretells',
-    'forey',
-    'foro',
-    'forsooth',
-    'fortnums',
-    'fossilize',
-    'four-bed',
-    'four-channel',
-    'four-wheeler',
-    'four-wood',
-    'fourie',
-    'fourth-',
-    'foutue',
-    'foxwell',
-    'fr&egrave;res',
-    'framlington',
     'franciscana',
-    'francoeur',
-    'franjiyah',
-    'frari',
-    'fraternise',
-    'freckle-faced',
-    'fredkin',
-    'free-marketeer',
-    'free-transfer',
-    'freedmans',
-    'freekick',
-    'freeloaders',
-    'fren',
-    'frequency-range',
-    'fresh-air',
-    'freshwaters',
     'fretwell',
-    'friba',
-    'fricourt',
-    'fridolin',
-    'front-bencher',
-    'frontieres',
-    'frostrow',
-    'fruitella',
-    'fsh',
-    'fudd',
-    'fuel-oil',
-    'fugard',
-    'full-flavoured',
-    'full-house',
-    'full-out',
-    'furka',
     'fussler',
-    'futuna',
-    'g-orgi',
-    'g50',
-    'gado',
-    'gadsden',
-    'gaidheal',
-    'gaiman',
-    'gaisford',
-    'galactosidase',
-    'galan',
-    'galaxie',
-    'gallaghers',
-    'gallegos',
-    'gallinago',
-    'gallinule',
     'games-playing',
-    'ganesa',
-    'gang-boss',
-    'gang-plank',
-    'gants',
-    'gap-filling',
-    'gardem',
-    'gardenwise',
-    'garrynahine',
-    'garthorpe',
-    'gascoine',
-    'gaslamps',
-    'gasper',
-    'gastronorm',
-    'gauger',
-    'gaught',
     'gauzes',
-    'gava',
-    'gaveller',
-    'gawler',
-    'gaylord',
-    'gbarnga',
-    'gblsections',
-    'gcds',
-    'gcp',
-    'gdc',
-    'gelson',
-    'gender-biased',
-    'genealogists',
-    'genotyping',
-    'genoves',
-    'genstar',
     'geodetic',
-    'geomagnetism',
-    'gerand',
-    'gerbner',
-    'gesneriaceae',
-    'gestating',
-    'geting',
-    'ghede',
-    'giaconda',
-    'giaffer',
-    'gianna',
-    'gigg',
-    'gijssen',
-    'gillingwater',
-    'gimingham',
-    'ginkgo',
     'girdling',
-    'glaber',
-    'glaciology',
-    'glaive',
-    'glaspie',
-    'gleaner',
-    'glenburn',
-    'glenview',
-    'glesca',
-    'glinka',
-    'glitterbest',
-    'gloddfa',
-    'glossina',
-    'glycocalyx',
-    'go-back',
-    'godammit',
     'godding',
-    'golconda',
-    'gold-braided',
-    'goldline',
-    'golovnin',
-    'gonatas',
-    'goncourts',
-    'goo\'',
-    'gordan',
-    'gorias',
-    'gosset',
-    'gotfryd',
-    'goudge',
-    'goulston',
-    'gouty',
-    'gr&eacute;try',
     'gr&uuml;ndgens',
-    'gramont',
-    'grandaughter',
-    'granges',
-    'grau',
-    'graucob',
-    'greaseball',
-    'greaser',
-    'greatsword',
-    'grech',
-    'green-brown',
-    'green-gold',
-    'greengages',
-    'grenadilla',
-    'grevy',
-    'grian',
     'grianan',
-    'griddles',
-    'grimspound',
-    'grimstone',
-    'grinton',
-    'grizz',
-    'grossi',
-    'grouch',
-    'growbags',
-    'growing-on',
-    'grykes',
-    'guanxi',
-    'guardasoni',
-    'guarini',
-    'gubyenko',
-    'gudauri',
     'gudjonsson',
-    'guemar',
-    'guenons',
-    'guenther',
-    'guffy',
-    'guienne',
-    'guitar-orientated',
-    'gumede',
-    'gundulph',
-    'gunmakers',
-    'gunthorpe',
-    'gurland',
-    'guston',
-    'guttuso',
-    'guyon',
-    'gye',
     'h.k.',
-    'h21',
-    'habbakuk',
-    'haben',
-    'haberup',
-    'hackforth',
-    'hackmann',
-    'hadmor',
-    'haga',
-    'hager',
-    'hagglers',
-    'haikus',
-    'hailstone',
-    'hakel',
-    'hakkio',
-    'half-german',
     'half-holiday',
-    'half-joking',
-    'half-smiling',
-    'half-undressed',
-    'half-whisper',
-    'halshaw',
-    'hamersley',
-    'hammoon',
-    'hammurabi',
-    'hand-crafting',
-    'handal',
-    'hankley',
-    'hannis',
-    'harbah',
-    'harbison',
-    'harclay',
     'hard-to-reach',
-    'hardcpy',
-    'hardpressed',
-    'hareems',
-    'haren',
-    'harkabi',
-    'harpin',
-    'hartleys',
-    'hausner',
-    'haute-contre',
-    'haversacks',
-    'hawaga',
-    'hawiye',
-    'hayira',
-    'haymaker',
-    'hayrick',
     'haytey',
-    'hazelby',
-    'hazelton',
-    'hazenbrouck',
-    'hca',
-    'hclo',
-    'hcmodules',
-    'head-scarf',
-    'head-wrap',
-    'headbutted',
-    'health-promoting',
-    'heartier',
-    'heaterstats',
-    'heathcoat',
-    'heavenfield',
-    'hedlunds',
     'hedstrom',
-    'hedt',
-    'hedwige',
-    'heidorn',
-    'heino',
-    'hejaz',
-    'helikite',
-    'helium-xenon',
-    'hellena',
-    'hellgill',
-    'hellicar',
-    'helme',
-    'hepatocyte-matrix',
-    'heptarchy',
-    'herat',
-    'herz',
     'heuliez',
-    'heyden',
-    'heyman',
-    'heynckes',
-    'hiccuped',
-    'higby',
-    'higgenbotham',
-    'high-denomination',
-    'high-factor',
-    'high-sulphur',
-    'highhanded',
-    'hightech',
-    'hillen',
-    'hillfoots',
-    'hingley',
-    'hinterzarten',
     'hirobumi',
-    'hitech',
-    'hitlers',
-    'hl-60',
-    'hmmn',
-    'hoban',
-    'hobman',
-    'hobnail',
-    'hock&eacute',
-    'hockaday',
-    'hoffmans',
-    'hoflins',
-    'hogarthian',
-    'hoi-polloi',
-    'holdernesse',
-    'hollein',
     'hollin',
-    'hollywell',
-    'holmans',
-    'holmes-smith',
-    'homard',
-    'home-country',
-    'home-range',
-    'homefront',
-    'honeysett',
-    'hoogeveen',
-    'hooghly',
-    'hookes',
-    'hori',
-    'hormone-related',
-    'horror-film',
-    'horse-breeding',
     'horticulturalist',
-    'hospital-acquired',
-    'hotheaded',
-    'hotson',
-    'houphouet',
-    'hoveyda',
-    'hp-rt',
-    'hrothgar',
-    'hubbards',
-    'huckster',
-    'hugman',
-    'hugues',
-    'huissiers',
-    'hulagu',
-    'hulley',
-    'humes',
     'humidifiers',
-    'husband-and-wife',
-    'husband-wife',
-    'husqvarna',
-    'huygens',
-    'hyaline',
-    'hydecat',
-    'hydr&aelig',
-    'hydrocharitaceae',
-    'hydrologist',
-    'hyll',
-    'hypersparcs',
-    'hypocerebral',
-    'i-ching',
-    'i-s',
-    'i.c',
     'icon-based',
-    'ideation',
-    'idoc',
-    'idrc',
-    'ierapetra',
-    'ignoramuses',
-    'ill-',
-    'ill-written',
-    'illustrational',
-    'illwill',
-    'imageflow',
-    'imai',
-    'ime',
-    'imjin',
-    'immigrate',
-    'immunize',
     'immunoblots',
-    'immunoprecipitate',
-    'immunosuppressed',
-    'implementor',
-    'in-breath',
-    'in-file',
-    'in-package',
-    'inbye',
-    'indiarubber',
-    'industrials',
-    'industry-based',
-    'industry-level',
-    'industy',
-    'infantilised',
-    'inflation-busting',
-    'ingalls',
     'initialises',
-    'initialization',
-    'ink-stained',
-    'innumeracy',
-    'installment',
-    'insteps',
-    'intangibility',
-    'intec',
-    'integrase',
-    'intellicorp',
-    'intension',
-    'inter-enterprise',
-    'interex',
-    'interferogram',
-    'interfirm',
-    'intermezzo',
     'interpon',
-    'intersectoral',
-    'intoxicate',
-    'intra-bloc',
-    'inverkirkaig',
-    'ion-exchange',
-    'ionize',
-    'iothalamate',
-    'ipcs',
-    'iquique',
-    'iron-founder',
-    'iroul&eacute;guy',
-    'ischigualasto',
-    'isigny',
-    'isildur',
-    'isl',
     'ison',
-    'itab',
-    'ithell',
-    'itis',
-    'itr',
-    'ivife',
-    'ivrea',
-    'iwerks',
-    'izumi',
-    'j.v.',
-    'j7',
-    'jacquards',
-    'jaloux',
-    'jameel',
-    'janzen',
-    'japlac',
     'jasmines',
-    'jasray',
-    'jatinder',
-    'jatta',
-    'jazzman',
-    'jcpt',
-    'jell',
-    'jello',
-    'jeroboam',
-    'jet-skiing',
-    'jetro',
-    'jetta',
-    'jim-jams',
-    'jinkinson',
-    'jivaro',
-    'jk',
     'jobfile',
-    'jodelet',
-    'joergen',
-    'johanneson',
-    'johannis',
-    'jointure',
-    'jongleurs',
-    'josse',
-    'jots',
-    'jovinus',
-    'jubair',
-    'jubbly',
-    'jule',
-    'julieanne',
-    'jungfraujoch',
-    'juran&ccedil;on',
     'justiceship',
-    'jyacc',
-    'k-rase',
-    'kabbaras',
-    'kadare',
-    'kaimann',
-    'kaler',
-    'kalymnos',
-    'kamares',
-    'kameez',
-    'kamotho',
-    'kangeroo',
-    'kanja',
-    'kansas-based',
-    'kareem',
-    'karsavina',
     'kasuya',
-    'kati',
-    'katsamba',
-    'kavsadze',
-    'kayhan',
-    'kazim',
-    'keadilan',
-    'keender',
-    'keepsafe',
-    'keezer',
-    'kelaher',
-    'kellynch',
-    'kenyapithecini',
-    'kerns',
-    'ketley',
-    'khadras',
     'khodjent',
-    'khor',
-    'khvarism',
-    'kiesling',
-    'kievs',
-    'kiftsgate',
-    'kik-step',
-    'kilchiaran',
-    'killies',
-    'killing-cauchy',
-    'kilpeck',
-    'kinderszenen',
-    'kinghan',
-    'kinlochhourn',
-    'kinsk&yacute',
-    'kirtle',
     'kisekka',
-    'kissingen',
-    'kite-shaped',
-    'kl&ouml;tzer',
-    'klicks',
-    'kneeler',
-    'knockanemore',
-    'kocanek',
-    'kolestral-super',
-    'koll',
-    'komm',
-    'kommen',
-    'kongo',
-    'koop',
-    'kopeks',
-    'kordt',
     'korosi',
-    'kosa',
-    'koster',
-    'kosterlitz',
-    'kotai',
-    'krassner',
-    'krat',
-    'krawczyk',
-    'kretser',
-    'krista',
-    'krizia',
-    'krugman',
-    'kubelik',
-    'kugelmann',
-    'kurator',
-    'kuzmin',
     'l&auml;ndler',
-    'l\'alouette',
-    'l\'opera',
-    'l-field',
-    'l0',
-    'laboratoires',
-    'labyrinthe',
-    'lackaday',
-    'lackner',
-    'ladefoged',
-    'ladenis',
-    'laguardia',
-    'lakas',
-    'lakehoff',
-    'lambda-matrices',
-    'lammermuirs',
     'lamonts',
-    'lampbase',
-    'lampooning',
-    'land-fill',
-    'landell',
-    'landesamt',
-    'landfalls',
-    'landgrave',
-    'landplane',
-    'landscapers',
-    'langhorne',
-    'laredo',
-    'larghetto',
-    'laser-doppler',
-    'last-wicket',
-    'latchett',
     'laters',
-    'laundromat',
-    'laundry-basket',
-    'launton',
-    'laurier',
-    'laypeople',
-    'lazzards',
-    'leaback',
-    'leadline',
-    'leadman',
-    'leaf-hair',
-    'leather-worker',
-    'lebaron',
-    'leekes',
-    'left-most',
-    'lehrman',
     'leiderman',
-    'lenta',
-    'lentricchia',
-    'lepismatidae',
-    'lernaean',
-    'lestat',
-    'letter-bomb',
-    'lettermacaward',
-    'leveaux',
-    'lewises',
-    'lews',
-    'leyraud',
-    'lgbc',
-    'lhr',
-    'librarium',
-    'licensor',
     'licinius',
-    'ligase',
-    'light-dark',
-    'light-welterweight',
-    'lightly-built',
-    'lilford',
-    'lill',
-    'lily-flowered',
-    'lime-hating',
-    'lindblad',
-    'line-management',
-    'lineation',
-    'linguistics-based',
-    'linsley',
-    'liquid-crystal',
-    'lisner',
     'lisps',
-    'lisztian',
-    'literaturnaya',
-    'litle',
-    'litmus-test',
-    'littleblood',
-    'litz',
-    'liversedge',
-    'liverton',
-    'liveth',
-    'lizard-hipped',
-    'llanbrynmair',
-    'lobe-finned',
-    'lobophytum',
-    'lobworms',
-    'location-factor',
     'log-log',
-    'lolls',
-    'long-faced',
-    'longbowmen',
-    'longer-serving',
-    'longways',
-    'lopatin',
-    'lopokova',
-    'lotz',
-    'lovie',
-    'low-inflation',
-    'low-trust',
-    'lowdens',
-    'lowermoor',
-    'lowfield',
-    'lowis',
     'lubaina',
-    'lucienne',
-    'lukla',
-    'lumme',
-    'lupi',
-    'lurve',
-    'lustral',
-    'lutzemberger',
-    'luu',
-    'lycia',
-    'lyde',
-    'lyke',
-    'lyndall',
-    'lyne-pirkis',
-    'm&eacute;doc',
-    'm&eacute;lisande',
     'm&uuml;ller-thurgau',
-    'm\'am',
-    'm\'gonigle',
-    'm.t.',
-    'm55',
-    'm65',
-    'machine-gunning',
-    'machine-washable',
-    'machinehead',
-    'macrodiffusion',
-    'macrostructure',
-    'madelin',
-    'madell',
-    'maenad',
-    'magg',
-    'maguires',
     'mah-jong',
-    'maiga',
-    'maina',
-    'maja',
-    'majewski',
-    'majuscule',
-    'make-',
-    'maksud',
-    'malate',
-    'malediction',
-    'maleo',
-    'malerba',
-    'mallinson',
-    'mallows',
-    'manfredo',
-    'mangement',
     'maniera',
-    'manolis',
-    'manrent',
-    'manrico',
-    'maoism',
-    'mape',
-    'marcellina',
-    'marciana',
-    'marengo',
-    'margetts',
-    'marie-antoinette',
-    'markarian',
-    'marmara',
-    'marryin\'',
-    'martin&uring',
-    'martinazzoli',
     'martinez\'',
-    'marxist-leninism',
-    'marxist-leninist-maoist',
-    'maryan',
-    'maserfelth',
-    'mass-marketed',
-    'mass-producing',
-    'masted',
-    'masturbator',
-    'matadors',
-    'maton',
-    'matrilines',
-    'mavra',
-    'maxial',
-    'may-day',
-    'mazeppa',
     'mcclymont',
-    'mcf',
-    'mdb',
-    'me&mdash',
-    'means-end',
-    'meare',
-    'meat-packing',
-    'medd',
-    'mediatron',
-    'medicate',
-    'medjugorje',
-    'meeting-point',
-    'megarid',
-    'megiddo',
-    'mel&eacute;ndez',
-    'melanee',
     'melisma',
-    'melqu&iacute;ades',
-    'melt-in-the-mouth',
-    'membrane-associated',
-    'memoria',
-    'menahem',
-    'menelaus',
-    'menzion',
-    'meowed',
-    'meribah',
-    'meripol',
-    'meriwether',
-    'merks',
-    'mero',
-    'merrem',
-    'merril',
     'mesdames',
-    'mesentery',
-    'mesoscale',
-    'message-level',
-    'messers',
-    'messum',
-    'metal-bashing',
-    'metalbox',
-    'metallacta',
-    'metasilicate',
-    'methody',
-    'methringham',
-    'metrocabs',
-    'meuni&egrave;re',
-    'mexican-american',
-    'mexico-based',
     'mfoumou',
-    'mgarr',
-    'mhuillinn',
-    'microcephalic',
-    'microdiffusion',
-    'microdisney',
-    'microfilms',
-    'microfossils',
-    'microlin',
-    'micromark',
-    'mid-\'50s',
-    'mid-1944',
-    'mid-1960',
-    'mid-1971',
-    'mid-1983',
-    'mid-grey',
     'mid-pleistocene',
-    'mid-post-glacial',
-    'mid-sixteenth-century',
-    'mid-sized',
-    'middle-american',
-    'middle-of-the-range',
-    'middlethorpe',
-    'mifepristone',
-    'mifsud',
-    'mihailovitch',
-    'mihrab',
-    'mikel',
-    'mileometer',
-    'millefolium',
-    'millin',
-    'minda',
     'mineral-energy',
-    'mingulay',
-    'minhinnick',
-    'mini-flyweight',
-    'mini-version',
-    'minicabs',
-    'mirphak',
-    'misbourne',
-    'miseria',
-    'mississauga',
-    'mistrusts',
-    'mithraeum',
-    'mithridates',
-    'mitral',
-    'mmei',
-    'moais',
     'moana',
-    'moco',
-    'moeurs',
-    'mogadishou',
-    'mohieddin',
-    'mohsen',
-    'mojacar',
-    'molineaux',
-    'mollet',
-    'mollison',
-    'moluccan',
-    'mon-fri',
-    'monday&ndash;friday',
-    'moneo',
-    'monopolizing',
-    'monreale',
     'moonwalker',
-    'mootwalk',
-    'mopp',
-    'moralize',
-    'morceaux',
-    'mordkovitch',
-    'mordred',
-    'morpheus',
-    'mortgage-backed',
-    'mosside',
-    'most-used',
-    'mother-to-mother',
-    'motor-home',
-    'motorsports',
-    'mouffe',
-    'moumin',
     'mountain-bike',
-    'mourabitoun',
-    'mousseline',
-    'moutiers',
-    'movealong',
-    'movilla',
-    'movsisyan',
-    'mowery',
-    'moyes',
-    'moynahan',
-    'mpw',
-    'msuya',
-    'muang',
-    'mud-walled',
-    'mudarra',
-    'mudbanks',
     'muellerius',
-    'muesli-type',
-    'muffles',
-    'muguruza',
-    'muhamet',
-    'muick',
-    'muirs',
-    'mukasa',
-    'mulla',
-    'multi-author',
-    'multi-bit',
-    'multi-fibre',
-    'multi-step',
-    'multilumen',
-    'multiple-objective',
-    'mulvaney',
     'municipal-bond',
-    'muriaticum',
-    'murt',
-    'musak',
-    'muscari',
-    'mutagen',
-    'myelopathy',
-    'myftiu',
-    'myndie',
-    'mytho-history',
-    'n&aacute;prstek',
-    'n&egrave;gre',
-    'n\'y',
-    'n-joi',
-    'n.m.',
-    'n.t.',
     'n12',
-    'n16',
-    'nabatiyeh',
-    'nachtigall',
-    'nadp',
-    'nafuth',
-    'nahdah',
-    'nakatani',
-    'nal',
-    'nalu',
-    'name-plate',
-    'nampa',
-    'narrowly-defined',
-    'nashe',
-    'natvacs',
-    'navarran',
     'navron',
-    'nazi-occupied',
-    'nbcw',
-    'ndola',
-    'near-disaster',
-    'negresses',
-    'nenad',
-    'neo-darwinists',
-    'nerds',
-    'neroccio',
-    'nerurkar',
-    'netherlanders',
-    'netinfo',
-    'netway',
-    'neuropeptides',
-    'neuropsychiatric',
     'neurulation',
-    'new-mown',
-    'new-product',
-    'newly-cut',
-    'newly-introduced',
-    'newsflashes',
-    'newswire',
-    'nexhmije',
-    'nial',
-    'niazi',
-    'niblett',
-    'nichimen',
-    'nicholaevan',
-    'nickalls',
-    'nicotra',
-    'niesr',
     'night-dark',
-    'nignog',
-    'nikiforuk',
-    'nimrud',
-    'nincompoops',
-    'nine-foot',
-    'nine-iron',
-    'nine-man',
-    'nitrification',
-    'nittis',
-    'nivkhs',
-    'nmaa',
-    'nmi',
-    'nofc',
-    'nofziger',
-    'noggins',
     'noise-free',
-    'non-accelerating',
-    'non-dualism',
-    'non-examined',
-    'non-hardware',
-    'non-indian',
-    'non-intel',
-    'non-labour',
-    'non-management',
-    'non-molestation',
-    'non-operating',
-    'non-organized',
-    'non-plo',
-    'non-receipt',
-    'non-recurrent',
-    'non-secretor',
     'non-sustained',
-    'non-test',
-    'non-uk-resident',
-    'non-utilitarian',
-    'nonconformism',
-    'nonidet',
-    'nopps',
-    'nordbanken',
-    'norm-referencing',
-    'norrice',
-    'north-easterners',
-    'noseband',
-    'nossal',
-    'notchy',
-    'nottinghamshire-based',
-    'nro',
     'ntc',
-    'nu-swift',
-    'num.',
-    'nusrat',
-    'nut-case',
-    'nutmegs',
-    'nyos',
-    'oake',
-    'oath-taking',
-    'oaxaca',
-    'oblate',
-    'obv',
-    'occitan',
-    'oceanward',
-    'octans',
-    'odd-numbered',
     'odovacer',
-    'odum',
-    'oedipa',
-    'oersted',
-    'offerer',
-    'officiis',
-    'offscreen',
-    'ofmc',
-    'often-used',
-    'oil-consuming',
-    'oil-filled',
-    'ojibwa',
-    'okan',
-    'okey-cokey',
-    'okoyong',
-    'okura',
     'ol&eacute;ron',
-    'olr',
-    'olympiads',
-    'omg-compliant',
-    'omnicompetent',
-    'on-disk',
-    'one-over-par',
-    'one-part',
-    'one-season',
-    'openframework',
-    'ophiotreta',
-    'optronics',
-    'orange-blossom',
-    'orban',
-    'orden',
-    'orisons',
     'ormsby-gore',
-    'osaka-based',
-    'oscott',
-    'osler',
-    'osphronemus',
-    'osram',
-    'ossau',
-    'ossetes',
-    'ossmodula',
-    'osteosarcoma',
-    'ostmark',
-    'ostracising',
-    'ostracods',
-    'other-regarding',
-    'otocinclus',
-    'otus',
     'ouchi',
-    'oudh',
-    'oued',
-    'ousts',
-    'out\'',
-    'out-of-sight',
-    'out-of-sorts',
-    'out-of-state',
-    'out-point',
-    'out-voted',
-    'outer-wear',
-    'outhaul',
-    'outland',
-    'outliving',
-    'outloading',
-    'outrightly',
     'outscoring',
-    'outward-bound',
-    'ovaltiney',
-    'over-balance',
-    'over-borrowing',
-    'over-commit',
-    'over-committing',
-    'over-concern',
-    'over-feeding',
-    'over-influenced',
-    'over-much',
-    'over-pricing',
-    'over-read',
-    'over-stressing',
-    'over-supplied',
-    'over-the-hill',
     'over-weight',
-    'over-wintered',
-    'overalled',
-    'overbooked',
-    'overcommitment',
-    'overcompensating',
-    'overcrowd',
-    'overfamiliarity',
-    'overhauser',
-    'overholland',
-    'overprint',
-    'overtyping',
-    'overwater',
-    'ows',
-    'ox-cart',
-    'ox-eye',
     'ox-roasting',
-    'oxidises',
-    'oxy-acetylene',
-    'oyama',
-    'ozaki',
-    'p&acirc;tissi&egrave;re',
-    'p(ii)',
-    'p-2',
-    'p-40s',
-    'p-47',
-    'p-trap',
-    'p.f.',
-    'p.p.s.',
-    'p32',
-    'p42',
-    'p56',
     'pa-7100',
-    'paavo',
-    'pachyphylax',
-    'package-holiday',
-    'pacquet',
-    'pactum',
-    'pada',
-    'padayachee',
-    'padeswood',
-    'padjelanta',
-    'padley',
-    'padlocking',
-    'paeniu',
-    'paese',
-    'page-turner',
-    'pagefield',
     'paguera',
-    'pahlavis',
-    'paillard',
-    'paintball',
-    'paionios',
-    'palaeocene',
-    'palatino',
-    'palcy',
-    'pale-brown',
-    'palladianism',
-    'palletizing',
-    'palliasses',
-    'palmar',
-    'palmier',
-    'palpate',
-    'pamir',
     'pamyat',
-    'pana',
-    'panamas',
-    'panaragua',
-    'pangloss',
-    'pangu',
-    'panky',
-    'panslavists',
-    'pantheist',
-    'papaioannou',
-    'papanek',
-    'paparemborde',
-    'paper-chase',
-    'paper-clip',
-    'paper-maker',
-    'paperbacked',
     'pappas',
-    'paq',
-    'parados',
-    'parallel-plate',
-    'parallel-processing',
-    'parallelised',
-    'paralyzed',
-    'paraset',
-    'parasitising',
-    'parathion',
-    'paray',
-    'parboiled',
-    'parcham',
-    'parente',
-    'parfait',
-    'parizeau',
     'parlac&eacute;n',
-    'parlee',
-    'parliament-in-exile',
-    'parlyament',
-    'parmar',
-    'parndon',
-    'parnelli',
-    'parreira',
-    'part-payment',
-    'part-word',
-    'partearroyo',
-    'parthenia',
-    'participant-role',
-    'particular-identity',
-    'particularised',
-    'party-list',
     'pascoes',
-    'pascucci',
-    'pasdaran',
-    'pashtuns',
-    'pasiteles',
-    'passenger-door',
-    'passeron',
-    'pastore',
-    'patan',
-    'path-building',
-    'pathcraft',
-    'patries',
-    'patriotique',
-    'patronises',
-    'patronymics',
-    'paulton',
     'paup',
-    'pavan',
-    'paving-stone',
-    'pavis',
-    'paymaster-general',
-    'paynter',
-    'pbendp',
-    'pc-type',
-    'pdry',
-    'peak-to-trough',
-    'peard',
-    'peasley',
-    'peasy',
-    'peate',
-    'pebble-dashed',
-    'peccadillo',
     'pechorin',
-    'pecquet',
-    'peddles',
-    'peenemunde',
-    'peep-toe',
-    'peirson',
-    'pelagius',
-    'pelton',
-    'pen-driven',
-    'pen-y-graig',
-    'penality',
-    'pencil-case',
-    'pendennis',
-    'pendulus',
-    'pennine-style',
-    'pennings',
     'pense',
-    'pensiones',
-    'penson',
-    'pentecostalist',
-    'pentel',
-    'pentire',
-    'penywaun',
-    'per-unit',
-    'perc',
-    'performance-based',
-    'performance-enhancing',
-    'perfusates',
-    'peripherique',
-    'peristroika',
-    'perjuangan',
-    'perner',
     'peroxy',
-    'perranporth',
-    'perrick',
-    'persian-style',
-    'person-centred',
-    'perspecta',
-    'perspicuity',
-    'perv',
-    'pestel',
-    'peston',
-    'petalled',
-    'petit-point',
-    'petrofina',
-    'pettish',
-    'pewp',
-    'pewter-grey',
     'phang',
-    'pharaon',
-    'pharma',
-    'pharmacokinetics',
-    'phaseout',
-    'phaser',
-    'phear',
-    'phemister',
-    'phenylephrine',
-    'phh',
-    'philosophise',
-    'philson',
-    'phlebas',
-    'phocaean',
-    'phocaeans',
-    'phoma',
     'phonographs',
-    'phormio',
-    'phosphatidylglycerol',
-    'phosphine',
-    'phosphoamino',
-    'photomicrographs',
-    'pi-meson',
-    'piccoli',
-    'piccolomini',
-    'picea',
-    'pidgeon',
-    'pierres',
-    'pieta',
-    'pif',
-    'pig-keeping',
-    'pigmentary',
     'pilch',
-    'pillories',
-    'pilmore',
-    'pilsener',
-    'pilz',
-    'pinafored',
-    'pingel',
-    'pinkies',
-    'pinko',
-    'pinson',
-    'pipa',
-    'pipe-laying',
-    'pipe-line',
-    'pipetted',
-    'pippo',
-    'piri',
     'pironi',
-    'piscina',
-    'pisin',
-    'piskies',
-    'pisshead',
-    'pisticci',
-    'pitchy',
-    'pitmans',
-    'pitr',
-    'pittagora',
-    'pittard',
-    'pixar',
-    'pizzarama',
-    'pizzettas',
-    'pizzey',
-    'pjc-2',
     'plagiarizing',
-    'plainmoor',
-    'plainpalais',
-    'plaistowe',
-    'plaka',
-    'plan-making',
-    'plantains',
-    'plarr',
-    'plas-yn-rhiw',
-    'plaseth',
-    'plash',
-    'plaskow',
-    'plastow',
-    'platinum-blonde',
-    'plats',
-    'plaw',
     'play-fighting',
-    'pleasure-seeking',
-    'pleco',
-    'plesu',
-    'plomley',
-    'plops',
-    'plte',
-    'plu',
-    'plumb-line',
-    'plunk',
-    'plutchik',
-    'plze&ncaron',
-    'pneumococci',
-    'poati-souchalaty',
-    'pock',
-    'poeple',
     'pointblank',
-    'points-scoring',
-    'polarlite',
-    'polden',
-    'polic',
-    'policiano',
-    'policy-orientated',
-    'political-business',
-    'pollinates',
-    'pollocks',
-    'pollution-control',
-    'polo-playing',
-    'polya',
-    'polycenter',
-    'polydisperse',
-    'polymerized',
     'polytene',
-    'polzeath',
-    'pomak',
-    'pommels',
-    'pommie',
-    'poncy',
-    'poniatowski',
-    'pontcysyllte',
-    'pontepool',
-    'pontevedra',
-    'ponytails',
-    'poopers',
-    'popovic',
-    'poprad',
-    'porco',
-    'porifera',
     'port-wine',
-    'porterage',
-    'portersept',
-    'portnoy',
-    'portugais',
-    'positional-level',
-    'posnett',
-    'post-aids',
-    'post-auditing',
-    'post-capitalist',
-    'post-completion',
-    'post-infarction',
-    'post-marketing',
-    'post-restoration',
-    'post-term',
-    'postdate',
     'poste_restante',
-    'postfixed',
-    'postmarks',
-    'postmasters',
-    'postmultiplied',
-    'postojna',
-    'postscripts',
-    'postured',
-    'potentiates',
-    'potlatch',
-    'potrovsky',
-    'potteric',
-    'potty-training',
-    'poudre',
-    'pov',
-    'poverty-ridden',
     'powder-keg',
-    'powells',
-    'power-broker',
-    'power-cut',
-    'power-dependence',
-    'power-drill',
-    'power-holder',
-    'powerbooks',
-    'powerframe',
-    'powersafe',
-    'powersystems',
-    'powley',
-    'pozo',
-    'pr&eacute;v&ocirc;ts',
-    'prada',
-    'praepositus',
     'prague-based',
-    'praha',
-    'prayin\'',
-    'pre-1940',
-    'pre-1948',
-    'pre-1965',
-    'pre-1970',
-    'pre-1991',
-    'pre-accident',
-    'pre-breakfast',
-    'pre-decimal',
-    'pre-departure',
-    'pre-designation',
-    'pre-designed',
-    'pre-discharge',
-    'pre-enrolment',
     'pre-mixed',
-    'pre-owned',
-    'pre-petition',
-    'pre-pilot',
-    'pre-placement',
-    'pre-plague',
-    'pre-punk',
-    'pre-recording',
-    'pre-reform',
-    'pre-sold',
-    'pre-stall',
-    'pre-tested',
-    'pre-treated',
-    'pre-twentieth-century',
-    'pre-unification',
-    'pre-velar',
     'precisions',
-    'prefixing',
-    'prego',
-    'prelapsarian',
-    'prentice-hall',
-    'preseli',
-    'preservative-treated',
-    'pressgang',
-    'presso',
-    'preterite',
-    'preti',
-    'prevert',
-    'prevost',
-    'prf',
-    'price-elastic',
-    'prima-facie',
     'primaquine',
-    'primeval-soup',
-    'print-maker',
-    'printing-press',
-    'prisma',
-    'priviledge',
-    'prize-fighter',
-    'pro-catholic',
-    'pro-fascist',
-    'pro-hindu',
-    'pro-lifers',
-    'pro-mining',
-    'probeorder',
-    'probst',
-    'proc&lowbar;save',
-    'procellaridae',
     'process-response',
-    'procurer',
-    'prodger',
-    'produ',
-    'progenoid',
-    'prognosticates',
-    'programme-maker',
-    'progres',
-    'project-oriented',
-    'promis',
-    'pronase',
-    'prontaprint',
-    'proofreaders',
-    'propanone',
-    'property-casualty',
-    'propofol',
     'propositioning',
-    'propounds',
-    'proprio',
-    'proselytise',
-    'proshare',
-    'protein-based',
-    'protokol',
-    'pruners',
-    'psalm-singing',
-    'psbc',
-    'pseudo-democracy',
-    'pseudo-history',
-    'psi2-nipenv5',
-    'psions',
-    'psych-out',
-    'psycho-motor',
     'psychoanalytically-influenced',
-    'psychologizing',
-    'ptpase',
-    'puerta',
-    'puked',
-    'pulex',
-    'pulford',
-    'pulver',
-    'pulverise',
-    'pulverising',
-    'pulverizing',
-    'pump-and-treat',
-    'pupillary',
-    'puppy-dog',
-    'purdeys',
-    'purpurascens',
     'purslane',
-    'pushin\'',
-    'putto',
-    'puzzle-solving',
-    'pwei',
-    'pwmi',
-    'pynson',
-    'pyper',
-    'pyr&eacute;n&eacute;es',
-    'pyramus',
-    'pyrmont',
-    'pythagoreanism',
-    'pzazz',
-    'q-analysis',
-    'qadesiyah',
-    'qamar',
     'qannaas',
-    'qatif',
-    'qazi',
-    'qeb',
-    'quaddus',
-    'quaderno',
-    'quadriathlon',
-    'quair',
-    'quality-monitoring',
-    'quarter-',
-    'quarter-point',
-    'quartermasters',
-    'quartette',
-    'quate',
-    'quatorze',
-    'queenborough',
     'queenslander',
-    'queipo',
-    'quern',
-    'ques',
-    'questionnaire-based',
-    'quexos',
-    'quezada',
-    'quick-moving',
-    'quick-service',
-    'quicksave',
-    'quiffed',
-    'quiller',
-    'quinean',
-    'quinidine',
-    'quinney',
-    'quintero',
     'quivery',
-    'quizmaster',
-    'quoom',
-    'qvision',
-    'r&eacute;aux',
-    'r&eacute;gence',
-    'r&eacute;gionaux',
-    'r&eacute;publicain',
-    'r&ouml;sti',
-    'r-1830',
-    'r-value',
-    'r.r.p.',
-    'r342a4-b14',
-    'rabbit-hole',
-    'rabble-rouser',
-    'radcliff',
     'radio-paging',
-    'radio-telescope',
-    'radox',
-    'raducanu',
-    'raffo',
-    'raghunath',
-    'ragley',
-    'ragnar',
-    'ragnvald',
-    'raif',
-    'rail-borne',
-    'railman',
-    'raion',
-    'rajasthani',
-    'raju',
-    'ramanayake',
     'rampages',
-    'ramsamy',
-    'ramstein',
-    'ramtek',
-    'ramzan',
-    'ranched',
-    'rands',
-    'rangkul',
-    'rano',
-    'ransford',
-    'ranza',
-    'rapid-deployment',
-    'rapido',
-    'rapiers',
-    'rapine',
-    'raptly',
     'rara',
-    'raskol',
-    'rastafari',
-    'rat-running',
-    'rat-tail',
-    'rat-tat',
-    'ratafia',
-    'ratbags',
-    'ratcatcher',
-    'rationalises',
-    'rattarattarattaratta',
-    'rattly',
-    'ratz',
-    'rauh',
-    'ravara',
-    'ravenhead',
     'raw-material',
-    'raznochintsy',
-    'razored',
-    'razzaq',
-    're&ccedil;ues',
-    're\'',
-    're-amended',
-    're-applying',
-    're-badged',
-    're-balance',
-    're-boot',
-    're-christened',
-    're-confirmed',
-    're-covering',
-    're-designing',
-    're-develop',
     're-discounted',
-    're-displayed',
-    're-employ',
-    're-exposed',
-    're-furbished',
-    're-group',
-    're-house',
-    're-hung',
-    're-identified',
-    're-interpreting',
-    're-iterated',
-    're-lived',
-    're-living',
-    're-negotiating',
-    're-organize',
-    're-orientate',
     're-paint',
-    're-positioned',
-    're-potting',
-    're-rating',
-    're-register',
-    're-roof',
-    're-settle',
-    're-structure',
-    're-structured',
-    're-told',
-    're-upholstered',
-    're-wind',
-    'reachout',
-    'reader-response',
-    'reading-desk',
-    'reall',
     'reanalysed',
-    'rear-seat',
-    'rearticulated',
-    'reassume',
-    'reaves',
-    'rebello',
-    'rebinding',
-    'rebled',
-    'rebleeders',
-    'rebreathe',
-    'recently-developed',
-    'recharger',
-    'rechtschaffen',
-    'recirculate',
-    'recirculating',
-    'reclassifying',
     'recolonised',
-    'recoloured',
-    'recommodification',
-    'recopied',
-    'record-setting',
-    'recyclability',
-    'red-billed',
-    'reda',
-    'reddie',
-    'rededicate',
-    'rededicated',
-    'redesigns',
-    'redetermined',
-    'rednal',
-    'redworm',
-    'reed-bed',
     'reemphasize',
-    'reestablishing',
-    'refastened',
-    'referent-qualification',
-    'refinanced',
-    'refix',
-    'reflexions',
-    'refocussing',
-    'refret',
-    'regie',
-    'regrown',
-    'regularizing',
-    'rehoming',
-    'reichert',
-    'reichian',
-    'reig',
     'reiki',
-    'reinstall',
-    'reintegrative',
-    'reise',
-    'reiser',
-    'rejuvenator',
-    'relearned',
-    'relighting',
-    'relinquo',
-    'relly',
-    'remaindering',
-    'remapped',
-    'remedios',
-    'remembrancer',
-    'remoulding',
-    'renbourn',
     'rendcombe',
-    'rendle',
-    'rennweg',
-    'rent-a-picket',
-    'rent-seeking',
-    'rente',
-    'reoccupy',
-    'reorientate',
-    'repas',
-    'repass',
-    'repatriates',
-    'repin',
-    'republicana',
-    'republique',
-    'requite',
-    'rerelease',
     'rescaling',
-    'reserva',
-    'reshoot',
-    'resource-allocation',
-    'respighi',
-    'restrepo',
-    'restyling',
-    'resuspending',
-    'resuspension',
-    'rethinks',
-    'reticular',
-    'retirement-pension',
-    'retouch',
-    'retson',
-    'revegetation',
-    'revenue-earning',
     'reverbs',
-    'revient',
-    'reznor',
-    'rhaetian',
-    'rhamnose',
-    'rhapsodie',
-    'rhian',
-    'rhimes',
-    'rhinegold',
-    'rhyd-ddu',
-    'riah',
-    'riccioli',
-    'richemond',
-    'richemont',
-    'rickenbackers',
-    'riddor',
     'rideal',
-    'rienzi',
-    'rifle-shot',
-    'riha',
-    'rihand',
-    'riksbank',
-    'rimet',
-    'rimmington',
-    'rimnet',
-    'ring-road',
-    'ringdufferin',
-    'ringill',
-    'riseth',
-    'risinghill',
-    'ritchin',
-    'riverfront',
     'riyal',
-    'rjwg',
-    'rkrp',
-    'road-bridge',
-    'road-going',
-    'road-holding',
-    'roaster',
-    'robeck',
-    'robertus',
-    'rochead',
-    'rock-a-nore',
-    'rock-cut',
-    'rockist',
-    'rockpools',
-    'roditi',
-    'rogernomics',
     'rogger',
-    'rognons',
-    'rolexes',
-    'rollerson',
-    'rolly',
-    'romalpa',
-    'roman-style',
-    'romeu',
-    'romish',
-    'romkes',
-    'romulo',
-    'ronaldsway',
-    'ronda',
-    'roof-light',
-    'roond',
-    'rooves',
     'ropewalk',
-    'rorqual',
-    'rosacea',
-    'rosaleen',
-    'roscius',
-    'rose-covered',
-    'rose-water',
-    'rosehill',
-    'roseland',
-    'rosella',
-    'rosenblooms',
-    'rosenzweig',
-    'roset',
-    'rosoman',
-    'rospigliosi',
-    'rostow',
     'rothenberger',
-    'rotisserie',
-    'rotliegende',
-    'rotorcraft',
-    'rotosound',
-    'rotz',
-    'rough-house',
-    'roumania',
-    'round-ended',
-    'roustabout',
-    'route-march',
-    'rov',
-    'roxby',
-    'roztoky',
-    'rtmas',
-    'ruberti',
     'rubstic',
-    'rudergrams',
-    'rudling',
-    'rudolpho',
-    'rued',
-    'rues',
-    'ruffo',
-    'rugg',
-    'rugosas',
-    'rumaneh',
-    'rumblebow',
-    'rumbolds',
-    'ruml',
-    'run-round',
-    'runneth',
-    'running-water',
     'ruprecht',
-    'rurality',
-    'russian-trained',
-    'rust-free',
-    'rustam',
-    'rustproof',
-    'ruswarp',
-    'rutlish',
-    'ruysch',
-    'ruzski',
-    'rx-7',
-    'ryburn',
-    'rycroft',
-    'ryeford',
-    'ryobi',
-    'rysbrack',
     'ryuzhet',
-    's&eacute;n&eacute;galais',
-    's&oacute;lnes',
-    's&uuml;ssmuth',
-    's\'posed',
-    's.r.n.',
-    'saabs',
-    'saarbrucken',
-    'sabines',
-    'sabini',
-    'sabor',
-    'saburo',
-    'sacc',
-    'sachmeyer',
-    'sacramentary',
-    'sacrosanctum',
     'sadc',
-    'sadia',
-    'sadou',
-    'saegusa',
-    'safet',
-    'safety-catch',
-    'safex',
-    'safranski',
-    'sagres',
-    'saich',
-    'saignakong',
-    'saihou',
-    'sailfin',
-    'sain',
-    'saint-paul',
-    'sainte-beuve',
     'sakura',
-    'salama',
-    'salata',
-    'saleem',
-    'salengro',
-    'salesian',
-    'salibi',
-    'salifou',
-    'salima',
-    'salm',
-    'salmin',
-    'salona',
-    'salus',
-    'salves',
-    'salway',
-    'samaj',
     'samarin',
-    'sammath',
-    'samo',
-    'samol',
-    'samtampa',
-    'san\'a',
-    'sanabu',
-    'sancta',
-    'sancto',
-    'sancy',
-    'sandfords',
-    'sandler',
-    'sandoval',
-    'sangfroid',
-    'santapaola',
-    'santar&eacute;m',
     'santhome',
-    'santiaguito',
-    'santon',
-    'sanvitale',
-    'saponin',
-    'saraband',
-    'sarantopoulos',
-    'sargon',
-    'sarhwu',
-    'sarita',
-    'sarkaria',
-    'sartor',
-    'sarus',
-    'sati',
-    'satirise',
-    'satirizing',
     'satyre',
-    'saudi-backed',
-    'saudia',
-    'sault',
-    'saumon',
-    'sauri',
-    'saurian',
-    'sauro',
-    'saus',
-    'savate',
-    'savoia',
-    'savoyards',
-    'saw-i',
-    'sawallisch',
-    'saxo',
-    'sayaf',
     'sayyedati',
-    'scaevolan',
-    'scale-up',
-    'scaliger',
-    'scandinavian-style',
-    'scanjet',
-    'scanmar',
-    'scanworx',
-    'scaramouche',
-    'scarpia',
-    'sceaux',
-    'scfe',
-    'schach',
-    'schalk',
-    'schattschneider',
-    'schefflera',
     'scheider',
-    'scheingold',
-    'schematics',
-    'scherrer',
-    'schiltz',
-    'schizoaffective',
-    'schlepp',
-    'schlossmuseum',
-    'schmalensee',
-    'schniedau',
-    'schoendoerffer',
-    'schola',
-    'schonbrunn',
-    'schoo',
-    'schoolfellows',
-    'schoolgirlish',
     'schrag',
-    'schtick',
-    'schulman',
-    'schulze',
-    'scitex',
-    'scoon',
-    'score-sheet',
-    'scotching',
-    'scotney',
-    'scotstoun',
-    'screentest',
-    'screw-eye',
-    'scuderia',
-    'scuffs',
-    'sculled',
-    'sculpturing',
     'scumtona',
-    'scythia',
-    'sea-loch',
-    'sea-power',
-    'sea-sick',
-    'sealga',
-    'seapower',
-    'sebsky',
-    'secchi',
-    'seclude',
-    'second-storey',
-    'secretary-manager',
-    'secrist',
-    'sedaka',
-    'seewinkel',
-    'segerstam',
     'seguin',
-    'sehe',
-    'sehzade',
-    'seirawan',
-    'seismographs',
-    'selanik',
-    'selecta',
-    'self&rehy;evident',
-    'self-acting',
-    'self-aggrandizement',
-    'self-checking',
-    'self-denigration',
-    'self-direction',
-    'self-executing',
-    'self-generation',
-    'self-helping',
     'self-intersecting',
-    'self-recognition',
-    'self-repairing',
-    'self-sow',
-    'self-stimulation',
-    'self-surrender',
-    'self-talk',
-    'sell-outs',
-    'selley',
-    'sello',
-    'sellsword',
-    'selston',
-    'selters',
-    'semaan',
-    'semaria',
-    'semi-contact',
     'semi-legendary',
-    'seminarians',
-    'semitransparent',
-    'sems',
-    'senada',
-    'senato',
-    'senggigi',
-    'senigallia',
-    'senneh',
-    'sentence-completion',
-    'sentimentalize',
-    'sequiturs',
-    'seraphina',
-    'serfontein',
-    'seriat',
-    'series-inserted',
     'serpens',
-    'serrania',
-    'serratus',
-    'servicios',
-    'serving-maid',
-    'sesto',
-    'seston',
-    'sestri',
-    'settelen',
-    'seven-day-a-week',
-    'seven-match',
-    'seven-pound',
-    'seventh-day',
-    'severals',
-    'sewel',
-    'sex-obsessed',
     'sexualising',
-    'seyoum',
-    'sfr',
-    'sgc',
-    'shaban',
-    'shadowgraph',
-    'shahpur',
-    'shaibah',
-    'shanta',
-    'shape-perception',
-    'shape-shifter',
-    'shapero',
-    'share-owning',
-    'share-pushing',
-    'shared-space',
-    'shawled',
     'shaye',
-    'she\'an',
-    'shebeen',
-    'sheed',
-    'sheep-dog',
-    'sheepfolds',
-    'sheerwater',
-    'shefford',
-    'sheilah',
-    'shekhawat',
-    'shelfmark',
-    'shelleyan',
-    'shelmerdine',
-    'shenington',
-    'shepherdson',
-    'sherfey',
     'sheriffhall',
-    'sherine',
-    'sherland',
-    'sherwani',
-    'shikar',
-    'shikuku',
-    'shills',
-    'ship-borne',
-    'shipowning',
-    'shipper-consignor',
-    'shippon',
-    'shirai',
-    'shirt-tail',
-    'shitman',
-    'shoard',
-    'shobana',
     'shoop',
-    'shooted',
-    'shop-owner',
-    'shopaholic',
-    'shoreside',
-    'shoring-up',
-    'short-billed',
-    'short-hop',
-    'short-listing',
-    'short-notice',
-    'shortcake',
-    'shosha',
-    'shotesham',
-    'shotten',
-    'shoulda',
-    'shoutin\'',
     'show-jumper',
-    'showcaves',
-    'shows\'n\'rides',
-    'shrills',
-    'shrimpers',
-    'shshsh',
-    'shuddery',
-    'shuggie',
-    'shujat',
-    'shulamit',
-    'shulamith',
-    'shumen',
-    'shunt-voltage',
-    'shut-eye',
-    'shutes',
-    'shyok',
     'siamangs',
-    'sick-bay',
-    'sicked',
-    'sickle-cell',
-    'siddy',
-    'side-impact',
-    'side-splitting',
-    'sieur',
-    'sigehere',
-    'sight-read',
-    'signaled',
-    'sigriswil',
-    'sigtuna',
-    'sike',
-    'silk-screened',
-    'silphium',
     'silvanus',
-    'silver-gold',
-    'silverplatter',
-    'silvex',
-    'simfic',
-    'similiar',
-    'simister',
-    'simonian',
-    'simonon',
-    'simul-class',
-    'simulcast',
-    'sin-bin',
-    'sina',
-    'sindh',
-    'sindical',
-    'singapura',
     'single-bit',
-    'single-leaf',
-    'single-room',
-    'single-section',
-    'siobham',
-    'siskina',
-    'sistem',
-    'sistren',
-    'sitges',
-    'sitthi',
-    'sitting-out',
-    'siumut',
-    'siv',
-    'sive',
-    'six-chip',
-    'six-night',
     'six-pointed',
-    'six-speaker',
-    'six-wheel',
-    'six-wheeler',
-    'sixers',
-    'sixty-year',
-    'size-frequency',
-    'skase',
-    'skeat',
-    'skeeter',
-    'skeggie',
-    'skegs',
-    'skeldon',
-    'skeps',
-    'skewbald',
-    'ski-jacket',
     'ski-shop',
-    'skim-reading',
-    'skin-brushing',
-    'skin-diving',
-    'skintone',
-    'skirpenbeck',
-    'skito',
-    'skottis',
-    'skullcaps',
-    'skylarking',
-    'slag-bank',
-    'slam-door',
-    'slantwise',
-    'slaphead',
-    'slave-driver',
-    'slave-grown',
     'slave-owner',
-    'slavemaster',
-    'slavko',
-    'slea',
-    'sleep-walker',
-    'slender-billed',
-    'slg',
-    'slicked-down',
-    'slide-out',
-    'sliding-scale',
-    'slines',
-    'slinger',
-    'slinkton',
-    'slipover',
-    'sloshes',
-    'slovan',
     'slovenians',
-    'slow-release',
-    'slower-moving',
-    'slumkey',
-    'smadja',
-    'smales',
-    'small-business',
-    'small-headed',
-    'smallbore',
-    'smartscan',
-    'smeddon',
-    'smell-brain',
-    'smelser',
-    'smiddy',
-    'smidovitch',
-    'smir',
     'smm',
-    'smoke-damaged',
-    'smoothy',
-    'smout',
-    'smylie',
-    'snecky',
-    'snettisham',
-    'snib',
-    'snicked',
-    'snicker',
-    'snider',
-    'snidey',
-    'snit',
-    'snitch',
-    'snood',
-    'snoods',
     'snooped',
-    'snoozes',
-    'snow-clad',
-    'snow-laden',
-    'snuffs',
-    'soaky',
-    'soba',
-    'sochi',
-    'social-climbing',
-    'societa',
-    'socioecology',
-    'socioeconomics',
-    'socketed',
-    'socotra',
-    'soda-water',
-    'soeriaatmadja',
     'soft-core',
-    'softening-up',
-    'softimage',
-    'software&mdash;library',
-    'soixante-neuf',
-    'sol&iacute;s',
-    'solariums',
-    'solaro',
-    'soldano',
-    'solidago',
-    'solidi',
-    'soliz',
-    'solubilized',
-    'solvent-polymer',
-    'somisa',
-    'sommers',
     'songqiao',
-    'sonko',
-    'sonus',
-    'soong',
-    'sopade',
-    'sora',
-    'sorority',
-    'sory',
-    'sotherton',
-    'souch',
-    'soundman',
-    'soup-plate',
-    'source-machine',
-    'souterrain',
-    'southampton-based',
-    'southminster',
     'southover',
-    'soviet-chinese',
-    'soviet-led',
-    'soviet-trained',
-    'sowers',
-    'sp&auml;tlese',
-    'space-filling',
-    'spaceprints',
-    'spanhoe',
-    'spannier',
-    'sparkford',
-    'speakes',
-    'specialeyes',
-    'specially-made',
-    'specially-trained',
-    'speckle',
     'specter',
-    'spectrograph',
-    'speech-based',
-    'speeding-up',
-    'speedster',
-    'spell-bound',
-    'sperling',
-    'sperone',
-    'sphingomyelin',
-    'spignel',
-    'spikenard',
-    'spinsterish',
-    'spiraea',
-    'spirit-world',
-    'spiriting',
-    'spiritism',
     'spirituals',
-    'spiroiu',
-    'spitak',
-    'split-type',
-    'splott',
-    'sponge-bag',
-    'spongs',
-    'spot-check',
-    'sprach',
-    'spratton',
-    'sprechen',
-    'spring-sown',
-    'springwood',
-    'sprinkleroom',
-    'sprit',
-    'sputniks',
     'square-rigged',
-    'srem',
-    'ss-18',
-    'ss-4',
-    'sseb',
-    'sso',
-    'sspe',
-    'ssurrna',
-    'st&uuml;tzer',
-    'st-germain',
-    'staff-patient',
-    'stage-hand',
-    'stage-play',
-    'stage-whisper',
-    'stain\'',
-    'stammerers',
     'stanculescu',
-    'standard-issue',
-    'staphisagria',
-    'staphylokinase',
-    'star-filled',
-    'star-forming',
-    'starfire',
-    'starn',
-    'state-of-the-nation',
-    'state-to-state',
-    'statis',
-    'stauffer',
-    'stavangers',
-    'staxton',
-    'steamtown',
-    'steatopygous',
     'stechkin',
-    'steenway',
-    'steepler',
-    'stefanini',
-    'stehelin',
-    'steigenberger',
-    'stellaria',
-    'stenches',
-    'stenurus',
-    'stepfamilies',
-    'stephanus',
-    'stercorarius',
-    'sterling-dollar',
-    'stern-faced',
-    'stevely',
-    'stevenston',
     'stewartry',
-    'sth',
-    'stick-up',
-    'stigle',
-    'still-sleeping',
-    'still-water',
-    'stinsford',
-    'stipplechoice',
-    'stir-frying',
-    'stock-control',
-    'stock-index',
-    'stockwith',
-    'stockyard',
-    'stolichnaya',
-    'stone-free',
-    'stonecutter',
     'stooked',
-    'stop-and-search',
-    'stop-cock',
-    'storch',
-    'storyboarding',
-    'stovepipe',
-    'stox',
-    'strachen',
-    'straggles',
-    'stralsund',
-    'stramness',
-    'stramongate',
-    'strandhill',
-    'strandman',
-    'strangways',
-    'strathbogie',
     'strathdee',
-    'stratocasters',
-    'stratocruiser',
-    'stratoscoop',
-    'strecker',
-    'stremnish',
-    'strimmers',
-    'strobing',
-    'strome',
-    'strone',
-    'strong-boned',
-    'strongylus',
-    'stubbings',
-    'stucc',
-    'studiomaster',
-    'stuffer',
     'stuffies',
-    'stupefy',
-    'sturisoma',
-    'sturmabteilung',
-    'sturmer',
-    'sturne',
-    'stylobate',
-    'sub-plan',
-    'sub-range',
-    'sub-schema',
-    'sub-topic',
-    'subalpine',
-    'subarus',
-    'subcomponent',
-    'suberi',
-    'subh&ndash&ndash',
     'subj',
-    'subject-area',
-    'submillimetre',
-    'subotica',
-    'subprocesses',
-    'success-starved',
-    'suce',
-    'sudley',
-    'sudnow',
-    'sudrajat',
-    'sugg',
-    'sugihan',
-    'suk',
-    'sukie',
-    'sulber',
-    'sulph',
     'sulphadimidine',
-    'sulphanilamide',
-    'sulphapyridine',
-    'sume',
-    'summiteers',
-    'sun-disc',
-    'sun-loving',
-    'sundeck',
-    'sunergy',
-    'sunesson',
-    'sunned',
-    'sunrays',
-    'sunroofs',
-    'sunsonic',
-    'sunsun',
-    'sunview',
     'super-fast',
-    'super-heated',
-    'superbrain',
-    'supercool',
-    'superego-development',
-    'superfecundation',
-    'supernaturals',
-    'supershow',
-    'supersprinter',
-    'supertramp',
-    'supertravel',
-    'supranationals',
-    'suprema',
-    'surficial',
-    'surgeon-commander',
-    'surgicentre',
     'suri',
-    'surmising',
-    'surround-sound',
-    'susi',
-    'sutter',
-    'suworow',
-    'suzan',
-    'svay',
-    'svenska',
-    'sviatoslav',
-    'swain\'',
-    'swalec',
-    'swan-neck',
-    'swapper',
-    'swapshop',
-    'sweet-talking',
     'sweet-toothed',
-    'swervedriver',
-    'swete',
-    'swift-flowing',
-    'swifty',
-    'swindon-built',
-    'swingweight',
-    'swithhelm',
-    'sx-3',
-    'sxt',
-    'sycophant',
-    'sydon',
-    'syllable-initial',
-    'symbolisme',
-    'symond',
-    'syndic',
     'syngamus',
-    'syntex',
-    'syringa',
-    'syringed',
-    'syringing',
-    'sysland',
-    'systematising',
-    'szczecin',
-    'szeliga',
-    't&ndash',
-    't&ndash;6',
-    't&oslash;nder-2',
-    't\'aime',
-    't\'be',
-    't(at)',
-    't.f.',
     't.g.',
-    't.m.',
-    'ta\'kwanya',
-    'tabet',
-    'tabone',
-    'tacey',
-    'tachometer',
-    'tack-room',
-    'taddeo',
-    'taffarel',
-    'taihang',
-    'taihu',
-    'tail-board',
-    'tail-in',
-    'tail-less',
-    'taildraggers',
     'tailgating',
-    'tailwaggers',
-    'taiwo',
-    'takare',
-    'take-down',
-    'takeuchi',
-    'tali-tying',
-    'talke',
-    'tallis-holly',
-    'talorcan',
-    'tamariz',
-    'tamba',
-    'tamirat',
-    'tamit',
-    'tanga',
-    'tangarana',
     'tanglewood',
-    'tangshan',
-    'tank-bred',
-    'tannahill',
-    'tanucci',
-    'tanvir',
-    'tap-dancing',
-    'tap-room',
-    'tape-record',
-    'taphonomy',
-    'taraki',
-    'tarat',
-    'target-language',
-    'tarim',
-    'tarquinia',
-    'tarsi',
     'tartuffe',
-    'tatian',
-    'tatlow',
-    'tauntonians',
-    'taurocholate',
-    'tautening',
-    'taverham',
-    'tavern-keeper',
-    'tax-',
-    'taylour',
-    'tdrs',
-    'tea-caddy',
-    'tea-kettle',
-    'tea-shop',
-    'tea-stall',
-    'teacher-directed',
     'teacher-led',
-    'team-leader',
-    'teamoffice',
-    'tear-down',
-    'tear-out',
-    'techne',
-    'technetium-99m',
-    'technica',
-    'technicon',
-    'tecla',
-    'tedo',
-    'teena',
-    'teethmarks',
-    'tegid',
-    'teikoku',
-    'teilhard',
     'tekek',
-    'tekelec',
-    'telecast',
-    'telesmart',
-    'television-watching',
-    'telstra',
-    'teluk',
-    'telus',
-    'temozolomide',
-    'templemore',
-    'ten-month-old',
-    'ten-second',
-    'tenn',
-    'tennish',
-    'tentage',
-    'tenwolde',
     'teorema',
-    'terai',
-    'teresita',
-    'terje',
-    'terjung',
-    'ternum',
-    'tervoort',
-    'tessiers',
-    'tetsuo',
-    'textline',
-    'tgca',
-    'th&egrave;ses',
-    'thabit',
-    'thakins',
-    'thal',
-    'thanx',
     'thatcherland',
-    'the-',
-    'theatrics',
-    'theddlethorpe',
-    'theenk',
-    'theller',
-    'theming',
-    'theodorakis',
-    'theodorus',
-    'theologizing',
-    'theophylact',
-    'theory-dependence',
-    'thereabout',
-    'thermoclear',
-    'thermohaline',
-    'theseion',
     'thew',
-    'theyre',
-    'thiamin',
-    'thiel',
-    'thigh-slapping',
-    'thighbone',
-    'thin-ended',
-    'thinh',
-    'thinnet',
-    'thinsulate',
-    'third-highest',
-    'third-wicket',
-    'thirstlessness',
-    'thisbe',
-    'thoburn',
-    'thorin',
     'thornthwaite',
-    'thorowgood',
-    'thou\'rt',
-    'threadfin',
-    'three-and-a-half-year',
-    'three-dimensionality',
-    'three-in-a-bed',
-    'three-jaw',
-    'three-nil',
-    'three-slot',
-    'three-ton',
-    'thrill-seeking',
-    'through-ball',
-    'through-neck',
-    'through-put',
-    'through-traffic',
     'throughputs',
-    'throwleigh',
-    'thumb-sucking',
-    'thurcroft',
-    'thurgarton',
-    'thurne',
-    'thymes',
-    'ti-lo',
-    'tibthorpe',
-    'ticket-of-leave',
-    'tico',
-    'tiddle',
-    'tiddlywinks',
-    'tietmeyer',
-    'tieying',
-    'tiflis',
     'tigg',
-    'tightening-up',
-    'tildesley',
-    'tilehurst',
-    'tillard',
-    'tillekeratne',
-    'tillou',
-    'tilman',
-    'tilsit',
-    'tim.',
-    'timagenes',
-    'time-and-motion',
-    'time-bound',
-    'time-tested',
-    'time-travel',
-    'timeline',
     'timesed',
-    'timewarp',
-    'timporley',
-    'timurid',
-    'tin-bronze',
-    'tinder-box',
-    'tingay',
-    'tinsy',
-    'tintas',
-    'tippet',
-    'tipples',
-    'tipstaff',
-    'tiswas',
-    'titoism',
-    'titterton',
-    'tjongarero',
     'tlp',
-    'tmcl',
-    'tms',
-    'toadies',
-    'toba',
-    'tobacco-to-insurance',
-    'tobback',
-    'toboggans',
-    'tocher',
-    'todos',
-    'toerag',
-    'tokeny',
-    'tolambo',
-    'tolan',
-    'tolentino',
-    'tollemache',
     'tolmezzo',
-    'tolo',
-    'tomduff',
-    'tomelty',
-    'tominahs',
-    'tomkin',
-    'tompa',
-    'tondo',
-    'tonge',
-    'toole',
-    'top-drawer',
-    'top-hung',
-    'top-priority',
-    'top-roping',
-    'top-sellers',
-    'top-tier',
     'topsel',
-    'torba',
-    'torcello',
-    'torelli',
-    'torside',
-    'tortellini',
-    'tortiglioni',
-    'toru&ntilde;o',
-    'torvale',
-    'toshiyuki',
-    'totham',
-    'toucher',
-    'touchiness',
-    'touchwood',
-    'toun',
-    'tow-truck',
     'town-based',
-    'townhouses',
-    'toxic-shock',
-    'toy-town',
-    'trabukos',
-    'track-suit',
-    'trackbeds',
-    'trademarked',
-    'traffic-light',
-    'trail-blazer',
-    'trailblazing',
-    'train-spotting',
-    'trait&eacute',
-    'tram-car',
-    'trammels',
-    'trampers',
     'trampolines',
-    'trangmar',
-    'trani',
-    'trans-am',
-    'transcribes',
-    'transcultural',
-    'transduced',
-    'transect',
-    'transfect',
-    'transl',
-    'transmogrification',
-    'transpots',
-    'traumatising',
-    'travancore',
-    'trawlerman',
-    'treatt',
     'tree-line',
-    'tree-of-life',
-    'treehouse',
-    'treitz',
-    'trencherwood',
-    'trendsetter',
-    'trengganu',
-    'trente',
-    'treswell',
-    'trethowan',
-    'tretinoin',
-    'treuherz',
-    'trevaskis',
-    'tribunali',
-    'trichoderma',
-    'trichodina',
     'trigona',
-    'trinitas',
-    'triple-time',
-    'triploid',
-    'tripod-mounted',
-    'tritons',
-    'tro',
-    'trogus',
-    'trojanowicz',
-    'tromsdalen',
-    'trondra',
-    'trone',
-    'troopies',
-    'trophy-winning',
-    'trotman',
-    'trounson',
     'troup',
-    'trubar',
-    'trueeffects',
-    'trumpers',
-    'truncate',
-    'trypanosoma',
-    'tsardom',
-    'tsdo',
-    'tssa',
-    'tsumeb',
-    'tua',
-    'tubed',
-    'tubeworms',
-    'tucum&aacute;n',
-    'tuda',
-    'tude',
     'tufton',
-    'tui',
-    'tulane',
-    'tullermeny',
-    'tulum',
-    'tunberht',
-    'tunde',
-    'tunicates',
-    'tunick',
-    'tunks',
-    'tunn',
-    'tunstill',
-    'tupman',
-    'turbo-67',
-    'turbojets',
-    'turfy',
     'turkish-speaking',
-    'turn-back',
-    'turneth',
-    'turnmill',
-    'turturro',
-    'tush',
-    'tusser',
-    'tutchin',
-    'tute',
-    'tutt',
-    'tv-watching',
-    'tvp',
-    'tvx',
-    'twelfth-',
-    'twelve-furrow',
-    'twenty-dollar',
     'twenty-five-foot',
-    'twenty-fourther',
-    'twiceover',
-    'twills',
-    'twin-car',
-    'twin-rotor',
-    'twinky',
-    'twitchett',
-    'twittish',
-    'two-camera',
-    'two-carbon',
-    'two-coat',
-    'two-component',
-    'two-dog',
-    'two-earner',
-    'two-equation',
     'two-lane',
-    'two-leaf',
-    'two-leg',
-    'two-nature',
-    'two-ounce',
-    'two-parter',
-    'two-toed',
-    'tychy',
-    'tygon',
-    'tym',
-    'typerite',
-    'tyring',
-    'tyrus',
-    'uamh',
-    'uas',
-    'ubbink',
     'ucg',
-    'uchaf',
-    'udhr',
-    'udzima',
-    'uhlenhorst',
-    'uhmm',
-    'uige',
-    'ukrofs',
-    'ulbricht',
-    'ulcerating',
-    'uleac',
-    'ulisse',
-    'ulla',
-    'ulomi',
-    'ulsi',
-    'ulster-born',
     'ultimedia',
-    'ultor',
-    'ultra-low',
-    'ultracold',
-    'ultralite',
-    'ultrapure',
-    'ultras',
-    'ultravox',
-    'ulva',
-    'ulwell',
-    'umatilla',
-    'umbelliferae',
-    'umf',
-    'umoa',
-    'un-german',
-    'un-thatcherite',
     'uncinaria',
-    'unclamped',
-    'unclipping',
-    'uncorrupt',
-    'unde',
-    'under-11s',
-    'under-14s',
-    'under-20',
-    'under-determined',
-    'under-performed',
-    'under-powered',
-    'under-recorded',
-    'underbidding',
-    'underblankets',
-    'undercarriages',
-    'underfeeding',
     'underrates',
-    'underst',
-    'underuse',
-    'underwoods',
-    'unemploy',
-    'ungreen',
-    'unhitch',
-    'uni-',
-    'uni-male',
-    'unicam',
-    'unimog',
-    'uniprint',
-    'uniroyal',
-    'unisat',
-    'univeristy',
-    'unlatched',
     'unloads',
-    'unmasks',
-    'unna',
-    'unobservant',
-    'unoccupancy',
-    'unplugging',
-    'unpoetic',
-    'unsaturation',
-    'unscear',
-    'unseal',
-    'unshod',
-    'unstrap',
-    'unsweet',
-    'untermensch',
-    'untermenschen',
-    'unterwalden',
     'unties',
-    'unum',
-    'unver',
-    'unw',
-    'unzips',
-    'uoc',
-    'up-hill',
-    'up-keep',
-    'up_up_to',
-    'upadhyaya',
-    'upcher',
-    'upchers',
-    'updata',
-    'upgradeability',
-    'upholland',
-    'upn',
     'upper-hab',
-    'upper-middle-income',
-    'upskilling',
-    'urba',
-    'urbanising',
-    'urbatechnic',
-    'urdu-speaking',
-    'urengoy',
-    'uridia',
-    'urodeles',
-    'urs',
-    'ursuline',
-    'us-mexican',
-    'usan',
-    'usenet',
-    'user-based',
     'user-selected',
-    'user-system',
-    'ushba',
-    'uso',
-    'ustashe',
-    'usx',
-    'utan',
-    'utm',
-    'uwgcg',
-    'v&auml;nsterpartiet',
-    'v-6',
-    'v5',
-    'vacani',
-    'vacationing',
-    'vaches',
-    'vagliano',
     'vain\'',
-    'valchek',
-    'valence-shell',
-    'valeriu',
-    'valeriy',
-    'valeta',
-    'valetudinarian',
-    'valmir',
-    'valspar',
-    'value-shifting',
-    'vamplew',
-    'vamps',
-    'vamuzo',
-    'van\'t',
-    'vandalize',
-    'vanden',
     'vanguards',
-    'vanners',
-    'vannotti',
-    'vanquishing',
-    'vaporises',
-    'vaporize',
-    'variegatum',
-    'varr',
-    'vascar',
-    'vashem',
-    'vassilis',
-    'vasso',
-    'vaubrun',
-    'vaucluse',
-    'vazgen',
-    'vc.',
     'vectra',
-    'veena',
-    'velha',
-    'vellu',
-    'velma',
-    'venet',
-    'veni',
-    'veniamin',
-    'venise',
-    'venlo',
-    'ventoris',
-    'ventoux',
-    'veratrum',
-    'vercoe',
-    'vermeers',
-    'verna',
     'verrier',
-    'verrocchio',
-    'vertes',
-    'vervets',
-    'vest-top',
-    'vestron',
-    'vetinary',
-    'veux',
-    'vexes',
-    'vfa',
-    'vho',
-    'vib',
-    'vibroseis',
-    'viccei',
-    'vice-chamberlain',
-    'viceregal',
     'vicorp',
-    'vienna-based',
-    'vierwaldstattersee',
-    'viger',
-    'viktoria',
-    'villanuova',
-    'villard',
-    'villasimius',
-    'villedommange',
-    'vincentian',
-    'vine-growing',
-    'viners',
-    'vini',
-    'vinification',
-    'virtual-reality',
-    'virtualpagecnt',
     'visayan',
-    'visean',
-    'visher',
-    'visualworks',
-    'vitra',
-    'vittas',
-    'vivat',
-    'vladislaw',
-    'vladmir',
-    'vlbi',
-    'vlla',
-    'vlore',
-    'vlotho',
-    'vme-based',
-    'vms-based',
-    'vocale',
     'voes',
-    'voice-mail',
-    'voicemail',
-    'volkmar',
-    'volksgerichte',
-    'volost',
-    'voltarol',
-    'volumatic',
-    'volvox',
-    'vongole',
-    'vorderman',
-    'vreni',
-    'vrije',
-    'vrijheid',
-    'vtec',
-    'vulpecul&aelig',
     'vwoa',
-    'vx',
-    'vzglyad',
-    'w.n.',
-    'w.p.',
-    'w.v.s.',
-    'waag',
-    'wace',
-    'waddles',
-    'wafa',
-    'waffled',
-    'wage-dependency',
-    'wagenaar',
-    'waggish',
-    'wagwin',
-    'wahed',
     'wahhabi',
-    'wahid',
-    'wainscotted',
-    'wais',
-    'waistbands',
-    'wakey-wakey',
-    'wakings',
-    'waldenses',
-    'walensee',
-    'waleran',
-    'walk-outs',
-    'walking-frame',
-    'wall-eye',
-    'wall-paper',
-    'wallbank',
-    'wallia',
     'wallman',
-    'walshaw',
-    'walshok',
-    'wandle',
-    'wanganui',
-    'wanked',
-    'wapentake',
-    'wapiti',
-    'war-mongering',
-    'war-paint',
-    'war-party',
-    'warham',
-    'wario',
-    'warnford',
-    'warnod',
-    'wasbrough',
     'washbourne',
-    'waskerley',
-    'wassen',
-    'waste-ground',
-    'waste-land',
-    'water-horse',
-    'water-line',
-    'water-polo',
-    'water-trough',
-    'water-vapour',
-    'waterfoot',
-    'waterhall',
-    'waterleaf',
-    'watermaker',
-    'watoo',
-    'wattam',
     'wattis',
-    'wattled',
-    'waughs',
-    'way\'',
-    'wayplanner',
-    'weally',
-    'weatherboarding',
-    'weathermatic',
-    'weaver-bird',
-    'wedding-breakfast',
-    'wedding-day',
-    'weeding-out',
-    'weeee',
-    'weekly-paid',
-    'weeknight',
-    'weepies',
     'weer',
-    'weicker',
-    'weigh-bridge',
-    'weight-reducing',
-    'weisner',
-    'weisse',
-    'welby',
-    'weldex',
-    'welk',
-    'well&rehy;established',
-    'well-acquainted',
-    'well-advanced',
-    'well-chilled',
-    'well-conducted',
-    'well-covered',
-    'well-disguised',
     'well-drawn',
-    'well-expressed',
-    'well-favoured',
-    'well-intended',
-    'well-named',
-    'well-populated',
-    'well-shaft',
-    'well-typed',
-    'wellamotkin',
-    'wellock',
-    'werther',
-    'wery',
-    'weskit',
-    'westaby',
-    'westend',
-    'westerplatte',
     'westerwood',
-    'wga-hrp',
-    'whaat',
-    'whalsay',
-    'whatsits',
-    'wheat-rick',
-    'wheelclamping',
-    'wheeziness',
-    'wher',
-    'whereto',
-    'whiddett',
-    'whig-dominated',
-    'whistleblower',
-    'white-slave',
-    'whitefoot',
-    'whiteheads',
     'whitelion',
-    'whitemore',
-    'whitlam',
-    'whitnall',
-    'whole-cell',
-    'whoooo',
-    'wickenden',
-    'wicky',
-    'wide-',
-    'wide-shouldered',
-    'widely-accepted',
-    'wife-murderer',
-    'wiggin',
-    'wigging',
-    'wiht',
-    'wiiija',
     'wildings',
-    'willage',
-    'willingdon',
-    'williston',
-    'willmer',
-    'wimmer',
-    'wind-break',
-    'wind-down',
-    'wind-surf',
-    'windjammer',
-    'windmilling',
-    'window-based',
-    'windpower',
-    'windsmoor',
-    'winedit',
-    'wineglasses',
     'wing-span',
-    'wingco',
-    'wingham',
-    'wingrave',
-    'winix',
-    'winna',
-    'winpad',
-    'winterreise',
-    'winthorpe',
-    'wiretap',
-    'wishy',
-    'wismar',
-    'wisped',
-    'wisson',
-    'wisting',
-    'wiston',
     'witbank',
-    'witch-hazel',
-    'withall',
-    'witholding',
-    'witold',
-    'wks',
-    'woah',
-    'wohlmut',
-    'wohltat',
-    'wolbachia',
-    'wole',
-    'wolferton',
-    'wolfie',
-    'wond',
-    'wonderstuff',
-    'wongwan',
     'wood-turning',
-    'woodcarvers',
-    'woodsy',
-    'wool-sucking',
-    'woolhouse',
-    'woooh',
-    'word-',
-    'word-string',
-    'wordwrap',
-    'work-card',
-    'work-life',
-    'work-study',
-    'work-top',
-    'worker-client',
-    'workshop-based',
-    'worksite',
     'wormell',
-    'wormtongue',
-    'worn-down',
-    'woronin',
-    'worple',
-    'worsall',
-    'wound-up',
-    'wpg',
-    'wragge',
-    'wrap-over',
-    'wreathing',
-    'wrenwood',
-    'wrfe',
-    'wristbands',
-    'wrong-footing',
-    'wsc',
     'wspa',
-    'wt-promoter',
-    'wundercheck',
-    'wyche',
-    'x-15',
-    'x-designer',
-    'x-radiation',
-    'x-radiography',
-    'x400-based',
-    'xcopy',
-    'xiao',
-    'xitong',
-    'xoftware',
-    'xplor',
-    'xrunner',
-    'xylocopa',
     'y-axis',
-    'yamamura',
-    'yammoussoukro',
-    'yana',
-    'yanina',
-    'yarislavl',
-    'yaroslavl',
-    'yashica',
-    'yaxley',
-    'yazz',
-    'yeatman',
-    'yellow-painted',
-    'yellowish-green',
-    'yeremey',
-    'yersinia',
-    'yeux',
     'yewbarrow',
-    'ym',
-    'yockey',
-    'yoi',
-    'yomping',
-    'york-born',
-    'youll',
-    'youve',
-    'yue',
-    'yukpa',
-    'yuli',
-    'yvan',
-    'z&eacute;ro',
-    'z-station',
-    'zaghawa',
-    'zahavi',
     'zala',
-    'zaman',
-    'zaporizha',
-    'zech.',
-    'zemeckis',
-    'zenocrate',
-    'zephandra',
-    'zerodur',
-    'zerrer',
-    'zibf',
-    'zif',
-    'ziff-davis',
-    'zinnia',
-    'zivko',
-    'zizyphus',
-    'zondervan',
     'zooropa',
-    'zosers',
-    'zouch',
-    'zukerman',
-    'zurbar&aacute;n',
-    'zurvan',
-    'zydeco',
+)
+
+blocks_24 = (
+    ' /&aelig;thelings"+gr;-granule%!2"$mp;b%$land%!m%%names%%phone%\'spencer!,bsol;windows!-ccedil;iftlik!.dgr;-endotoxin%"72%!e%!f',
+    '"*ollar;0.27+!9*"33+!9*"42*"74+!6+!7+!8*"95(&1,100m+"50*\'300,000*$700m*$800m',
+    '*"10+!5*"42*"86+!7+!8)&0,000m*#.1m+"5m)$1.7m)$2.7m*"3m)%3,500*#.1m+!2',
+    '+"5m+"6m))4,000,000+#400+#700*#.4m+"7m+"9m*%5,000+!m)$5.6m+"8m*"00)$6.7m)$7.5m',
+    '*"5m)$8.5m*!9)%9,000*%2,000($2.0m*#5m.)$1.5m)$2.8m*"0m*!5)$3.2m))4,000,000*"3m)%6,500',
+    '*!0)%7,000*"0m*!5)&80,000*%5,000)"bn(%3,400*#950)".1*!6)!2*$,000.$,000*"5m',
+    ')&40,000).5&ndash;55,000*(,000,000)%6,000)%7,000*#.50)%8,000*%0,000(340,000&ndash;60,000)%1,000)%4,000)%6,000)!7*$,000)"80',
+    '(%5,800)".4*"50).0&ndash;70,000*/0&ndash;700,000)#3.9).5&ndash;90,000)"80(&6,000m*#300)#.0m*!3)400,000&ndash;800,000)$2.5m)"30',
+    '))5,000,000)%6,000(&7,000m*#200)#.3m*"50)400,000&ndash;900,000(%8,500*#600)#.3m)"1m)%3,000(#9.5*"9m)%5,000',
+    '($show!-eacute;clairs($tats"(gr&prime!)frac12;ft!\'gt;nine#\'=70/min!,lt;escape&gt$\'inst&gt$&module$!n!(mdash;if\'"on"+icro;g/hour\'$mol/',
+    '!&oslash!.pound&frac12;m\'-pound&pound;s&%;0.6m\'+1&ndash;1.5($,145)#280)#450)#575(#.26)"39)"54)(6million)#7bn)(8billion',
+    '*"m.()0,000,000)!.*!2*"58*"7m)"2m)"9m($1.00*!3)%7,000)"8m)%9,000(#2.4*"65',
+    '+!5*"80)#000)"4m)"9m($3.2m*!5*!6*"75)"1m)%4,000)"bn("43)%7,000("53',
+    '*"5m*"9m)!1)!4)$9.99(%7,200)#.00*"47)"0m)!6)!8($8.8m*"9m)!1*!m',
+    ')!6($9.25)"6m)$9.99\'(2&frac12(#.05)"79)#8bn($0.5m)"m.*&illion("11(#2.8+!5)$9.99',
+    '*!4)!1)%4,000)!6(%50000)!7("63)!4(%7,500)"0m(&85,000(&95,000(\'billion\'%3,445)#900',
+    ')"66*!9(+0-&pound;40)#.3m*"9m)$0000($1.1m)!3($2.99)!4(%3,500)#.50($5.99)#000)!1',
+    ')!9("68($7.95($8.50*"6m\'%4,250(#.65)"76($0.4m)/0&ndash;600,000*2,000&ndash;533,000)!k($2.99("35("44',
+    '(#60m($7.50*"7m("85\'%5,250)#300)#600(\'-a-race(#.30*!5)!7*!0)"85)"90(*00-a-night',
+    '($2.5m)!1(%3,000)#.40)!m("45)\'million(%6,250)!4((8million\'%6,250)#750(#.6m("08("10',
+    ')!6)!8)!m(%3,047)!m("40)!3(#50m("6m(&70,000("80)!8(%9,950)%0,000\'%7,200',
+    ')"80)"90*!m(/0&ndash;100,000(&25,000("3m("49)!m("60*$,000)!3(%7,000("89(\'million\'%8,250',
+    ')!6)!8($0.00)#000(%4,000)!m("51("6m($9.50\'$9.1m)"3m)!7)"8m("2m(%3,000',
+    ')!5(&50,000("6m(&95,000\'!s!(times;20\'"30\'"40\'"56"$rade!(uuml;ber #\'77!"95"!8!"am',
+    '!#eck!\'fifties!"g\'!#how!#kin!%night!#ole""ss!*photograph!$said"&ixties!$then"$were!(vehicle\' &***lt.',
+    '"%datuk!#abd"&gainst!!c!#dan!)excluding!#kim!)medlearn*"%ichel!$syed!!u *+&amp;plus!$0200!#100"!2',
+    '!"50!"75 $-&gt!%(1.7)!!0"#.01!"11"\'5&deg;c"!6"!9!#287!&30&deg\'";c!$41.5!#55-',
+    '!,aminobenzoic!"c.!!f!"he!$isms!)linolenic!!p!\'ribbons!%space!$tion!$with #/0/!"b/!$data!!m',
+    '"!/!!t!!u +0&ndash;100)!5()4&ndash;0(!8!"-1!$.026#"4%"\'1&mgr;m#"34""74""8m!%00000',
+    '$!2$!3$!5$!6!"12"#:30!"20#!0#!1#!4""24#!7""53"#:12#"30',
+    '!&30&deg#!5""23"!5""72#!6!"40#!3"*1-332-8787""29"!3#!0#!4""54!$5.00',
+    '#!6#!7#!9""39"!5"#:27#"51$!3$!4!$6.00"!0#!8#!9""34#!9',
+    '#"24$!5$!7#"39#"45!,71&ndash;245*#351*#437*#629*#928""22""43""82#!4"#:02',
+    '!$8.45""36"#:29!#915""23""69""83!#=no!"bj!"dh!#pts *1&frac12;d"\'micro;m"(ndash;17)!8',
+    ')!3)#min!#(7)!\',000-up%#dpi%#kms$!8#"75#"89"#160"%2,3,4#%00dpi%"kg"#412"*500-strong',
+    '!"-8"$axis"%litre!#.06#!9"#1.5##5pm"#2pc"#3gb"$4.10#!3#!s"%5&ins#!4#"kg',
+    '#!v#!w""60#!9""71#!4#"5%""82#!6#!7#!9""91#!5!#/10#$1.93',
+    '""50"!8"!r!(0&frac14#(ndash;17)"50""\'s"$,300##700&$,000"#-16#"cm#%stone"#.01#"21',
+    '#"33$!6#"44#"52#"64#"73#"95$!9""/1#"20")0&micro;m#+,000-strong#%-foot##.00#$0gns',
+    '##3.2#*9&mdash;12##lbs#"mh""1%#".6"&24x768""38#!p"%4,000#!1#!3#!8#!9")5&ndash;6',
+    '#!p")6&ndash;7#"th"#7.8#!3""8%#!1#"th"#9th"#:16#"32"!b"$inch"!l"$mins',
+    '!*1&ndash;08)"21#&plus;1"#(7)#"a)"$,200"!-"%.00pm#$15pm$!9##2.1$!8#"31#$45am#"50',
+    '"$08.1"%1,000""2%#"cm""37#!p"#4th""5g#!p"%9,000#!5"#:21"&am-5pm%#6pm""d.',
+    '!)2&ndash;2)"36"+,000-strong##400"%-step"#.11#$2(a)$!2#"33#"41#"51$!5$!7$!p#"99',
+    '#\'-strong"#20s#!9""4%#!1"#5cm"*73&ndash;5#*9&ndash;80"*94&ndash;8"":1#!2"#cms"#lbs""pm")th-minute',
+    '\'"34#(ndash;19"$,600"!-#"17"#.06#"13##2.1$!0$!1##6.1%!8"&/11/74$!6""0%',
+    '#"00#"mb#$r(5)"*40&ndash;1"%7,000!%4&deg#\'ndash;0)"10*!3)!3"#(7)"%-mile#$page"#.20##3.1',
+    '#"44#"50""0%#(&ndash;1#!9"%3,000#!4#!6##mph""46"":1""cm"!e""m1"#th.',
+    '#(ndash;12)"21)"64#&percnt"+,000-strong##600##900""-1#$fold#$inch"#.50##6.5"%/5/87",0,000-strong#$0msc',
+    '#"pc")3&ndash;4#$,000")5&ndash;6#$,000#$mbps$"ph")8&ndash;9"-96&ndash;1650"#:20$!1$!2$!6"#kms""st',
+    '!\'6&deg;c#&frac12#(ndash;07)"10*!3#$plus"(-megabit"#.13#"37$"hh#"48"%/3/87"#000#"mb$"ph',
+    '"-32&ndash;1704"#4.0""5p"%6,000#,0&ndash;1851")8&ndash;9#*9&ndash;90"#:20#!8#!9"(km/10mls""pp!*7&frac12;p#\'ndash;0)"13',
+    '"#.0%#"10$!9#"6%#"7%"&/10/93""0%#)1&ndash;2"%4,000#)8&ndash;9"-50&ndash;1880#,4&ndash;1790#&ml/6fl")6&ndash;7"%7,000',
+    '#,8&ndash;1857#"th"!s#!t!%8&deg#\'ndash;0)"15)$24in)"35)"44"#-23"(0-member"-20&ndash;1903")30s/1840s"+48&ndash;50',
+    '"\'50-1914#,8&ndash;1917+!9#*9&ndash;61"*60&ndash;1#"5u"*75&ndash;6#*9&ndash;80#!p"*82&ndash;3#)8&ndash;9"%9,000##0\'s#)1&ndash;2#)4&ndash;5',
+    '#)6&ndash;7#)7&ndash;8#,9&ndash;1902"&cm/7in#!t"!q!\'9&deg;c"#(3)"$,200"#.30#"5%"+07&ndash;08+!8#*8&ndash;11#!e',
+    '"+11&ndash;13#$4-18"%2,000#"2a#*3&ndash;24#)6&ndash;7#*7&ndash;30#*8&ndash;32#*9&ndash;32#"mb#!p")30s/1940s#)3&ndash;4#*7&ndash;45#)8&ndash;9',
+    '#$2-44#*3&ndash;77#*4&ndash;45#*5&mdash;46$!.#)7&ndash;9#"8b"*50&ndash;2$!a#"4a#*5&ndash;70"*63&ndash;4#,5&ndash;1975$!a#*8&ndash;75',
+    '#*9&ndash;71"+70&ndash;89$#/71#*1&ndash;72,!8,!9#)2&ndash;4$!.#*3&ndash;75#)4&ndash;6+"77+!9$#-75#$5-84#*6&ndash;80',
+    '#*7&ndash;79+"84,!7#*8&ndash;89#*9&ndash;86,!9$#-83"*81&ndash;3+!6#,2&ndash;1992+!5+"84#*3&ndash;88$"-4#)4&ndash;6',
+    '$!.#*6&ndash;7c#$9-93"-92&ndash;1993+&friday$\'/milton##3\'s#$6/97"+:1&ndash;10#!8"!b"!e"#th-""y0!#:03',
+    '#%50000!"aa!"ea"!b!"ff!$gbps!"lh!%mg/ml!"sb!"tb"!t!!x ,2&frac12;cms"(ndash;30)!6',
+    '("4%"#pgr!!\'!$(13)""i)!"+2!$,001#"50"#128#"31#"47#"51#"65#"75#"85',
+    '"#3,4#"50"&400bps"#550!%-30pm"!8#"-0"!9"#day#*imensional""lb##ine"$week!#.0a"$10pm',
+    '"#2.0#"5%$!m"#3.5#!1#!p""4p""51"$6-kb#".5#!0#!9#!k"%7.1.1#!0',
+    '""85"#9.3!#/11!*0&ndash;18)!4"!\'"$,300"#-24##mar##ton"#.7%"#/21"+0&ndash;400#!+#(,000,000',
+    '$#odd$!s#!9""19"#207#!6""35""45#!8"$5gti")7&ndash;8""87#"pp""99"#:17',
+    '!*1&ndash;18)!3*!0)!4)#apr,"il"#-26$!8#!9#"cm##may#$seat"".0$!0#"30',
+    '""24"%4,000#!0""55"%7,000""9p"!c#!m"!k"!m!)2&ndash;0)"13)"25)$july"(,000,000',
+    '"#-27#)month-old"".0#"30$!9#"5%""01"%2,000"#482""51#!2"%8,000#!6""lb"!m',
+    '"#(1)"#-26"#.59"\'0&deg;c#!3"%1,000#!0#!3"%5,000""7p"%8,000"&cm/9in!*4&ndash;10)"21"#(1)',
+    '"#-27"".0#"8%"#0mb"$2561"%3,000#"91"%5,000"!a!,5&frac12&ins#(ndash;28)!9#(shilling"(,000,000#"26',
+    '"$-day#&strong"".0#"5%#"7%#"8%#!9"%/3/74""0%#&&deg;c"$2252"%6,000#!p"!c#!l',
+    '!\'6&deg;c"(,000,000"".0$!1#!1#"3%#!8"%0-day##516")2&ndash;3#!s"%5-day#!p"$8(1)"$9396',
+    '*!5#&sol;80"(,000,000"#-31"".0#"2%#"5%#!7""0p""5g""6p""82"$9678"$secs!#8.0',
+    '""0g"%3,000"#:19"!a!(9&frac12"!.#!1#"3%#"5%#"9%"#/30""71"#990#!p""lb',
+    '#!0#!1""28!"bb!"kb!$mins!"pt#!s!"rd!"ta"!t!"ye 13&frac12/3&frac12"(ndash;15)!6',
+    '("5%"*shilling;6"(times;10!%\'-end!$(6a)!$,350"!5"\'800,000!#-14"%cycle"#pin!$.0.1#!6"#142#!a',
+    '#"5%""43#!4"#5.3#"in""60#!p"#7.3#"5p""8m""95!"/6"!8#!4!*0&ndash;80',
+    '#(shilling"!-#$july"".6",0,000-strong#%-akce"#amp""hz!%1&deg"%-aug."!.#!0#!6"&/10/93""20',
+    '"!c"!m!#2.4#"7%#!9""05#"mb#"sc!(3&frac13#\'ndash;4"".0#!4#"5%""0p""30',
+    '!%4&ins"#.6%"#027#!g"%5,000#!p"%6,000"&767-68"#889"!a!)5&ndash;9"".1#!2$!%#!3',
+    '"%0&deg\'&;f/gas#"00$!5"&440-42"#534"#678#!p"#792"#9th"!b!*6&ndash;43)!7"(,000,000"$-bit',
+    '"#230"#350#%67-69#"94"#403$!4#"15#"66#"70#"93"#508#"19#"23$!6#"73',
+    '"#669"#726$!8#"64$!5#!7#"80"#816#"37#"55#"91$!3"#900$!9#"45',
+    '#"73$!7#"91""cm""pc!)7&ndash;8"#.04#"1%#!2#!9$!%"#014#%30-31$!7#"51',
+    '$!4"&104-05$!9#"50#"70$!3$!7#"82$$3-84$!8#"96$!7"#224#"36$!8',
+    '$!8#"51#"63$!5#"99"#323$$5-26$!8#"31$!3#"57#"71%#-72$!7$!8',
+    '$!6"#412#"37#"43#%72-73#"80"#509#"22#"30$!1#"41$!7$!8#"51"#607',
+    '#"20$!2$!3#"37#"51$!2%#-53#"68#"77#"84"#709#"37#"46#"55#"65',
+    '#"89#"91$!4$!7"#802$!7#"17#%39-40#"42#"52$$4-55$!6#"71$!5#"97',
+    '"#912#"32#"40$!2$!3$$6-47#"53#"61$!3#"71#"88"!a"!s!\'8&deg;c"".1',
+    '$!%"#003#"14$!5#"23$!6"#105$!8#"14$!7#!2#"31$!2$!3$!5',
+    '#"54$!7#"63#"79#"87#!a"#206$!8#%74-75$!5"#302#"21$!5$!7#"47',
+    '#"63#"78#"87#!9$!2$!5"#405#"25$!8#"32$!4#"48#"65"#520#"30',
+    '$!9#"41#"54#"80#"91$!9"+6&ndash;400#"76#%85-86#"95#"nx#"sl"#706$!9#"21',
+    '#"30$!7#%44-45#"55#"62$$9-70#"90#"dx"#820$!7#"33#"42#"56#"72$!5',
+    '#"85$!7$$8-89"#901$!6#"17#"24#"70$!2$!5#"90""mm!(9&frac12"$(11)#"3)',
+    '"#-cm"".1#!3#!8"#000$!2$!7#"17#"37#%45-46$!9#"58#"73#"94$!5',
+    '#"15#"32#"59#"67"#4.5"!a""ft!#:12#!3#!7"!4"!7"!8!#i\'s!!k',
+    '!"nl!#rds"!h!$tbsp ,4&commat;1/2")frac12;in"(ndash;12("30()4&ndash;0)"-2("5%)#min!$,096"#5,6!#-10',
+    '!%.1(b)#".4#$1(b)"#2.5#!6#!b""35#"kb#!m""47#!m"$5(b)#"mm#!p"#6.2',
+    '#"pc"#9pc!!/"!6""89!*0&ndash;43)#50%"#(3)"!+"%-mile"#.9%"*0,000-volt#$-day$$plus$(year-old',
+    '""11#!3""50"%64/89""8p""lb!)1&ndash;2"#.8%"%0,000""13#!4"%2,000!&2-mers"".3"%5,000',
+    '#"mb!$3(1)"".1$!%#!2#!5#"6%#!9""19""5p!$4(1)"".4#"6%#"7%#!9',
+    '""68"!a!*5&ndash;90"(,000,000"\'-degree"".4#"7%#!8"&0-seat#"th"&3-3366"#596#!p""9p""lb',
+    '""80!$7(2)"%-hour"".1$!%#!3#"6%""71!$8(1)"\'-member"!.#!2""4p""5p"%6/smp',
+    '"(p/minute!#9.2#"3%#!7"%0,000"$1212!#:10!"af!"bn!"de!"er!"fl!"hz!!i!#kev',
+    '!$x400 ,5&frac14&ins"\'micro;g"/ndash;3&ndash;2)!0(#6ft!$\'-ag!$,128"#240"#626!#-11",flourouracil##old""ht"%speed',
+    '#$4.93"#1.4#$0(b)#$7(a)""2a""38"#4.6#!2#!8"#5.1#!9"#6.1#!1#!5"#8.3',
+    '"!8#"in!%0&ins#%mgr;m#(ndash;55)#70%"!-##70%"#.7%"&0-page#"0s#"mg""80"#cms!#150',
+    '""mm!*2&ndash;53"#(1)"%-week"".1#"5%#!9""8p!#3.3#"6%"%0,000#!0""f5""pc!)4&ndash;5',
+    '"".3#"5%""54!(5-member%!r"#.7%"!f"!m!#6.4#"8%""56!#7.6"%0,000"&7-seat""ft',
+    '#!4!#9.8#!9!#:21"!4"!5!#ths *6&frac12;d"(ndash;42("60(#9in"(shilling!#(5)!+,000-strong!#-15',
+    '!,.0&ndash;7.0#".0"#22d#!p""37#!9""4b"+5&ndash;7.5"#6.4#!b""80!"/6#!0!$0&ft#(ndash;61',
+    ')#70%*!5"".2"#/65"&0-acre$$page""10""5p"$6200""mg#"in!#1.0""20"!f""pc',
+    '"%0,000!)3&ndash;4)!6"$,500"\'-member"".3"!b"!p#!c!%45169!)5&ndash;9"#(2)"\'-member"#535""cm',
+    '#(ndash;74""11!%7&deg"$,500"".5#!6!48&deg&ndash;78&deg;f"".4")0x0-based""78""k4""pc!$9.8%"#0mp!":1',
+    '!\'oz/175g )7&frac12%($;cms"(ndash;14!$,250"\'500,000!#-18"$year!#.19""21"$3(a)#".5#/0&ndash;10.30pm+&8.30pm"#4.0',
+    '"#6.1$!5"#99%!&0-year""0p""50""70"!m#"hz!$1.3%""34!42&deg&ndash;74&deg;f"#(4)"!.#!5',
+    '#"73""0c!#3.3#!5""00""1p!44&deg&ndash;76&deg;f.\'8&deg;f"%0,000"+7&ndash;400"!a!#5.8""0g#!p""32',
+    '!#6\'s"#.8%"!p!\'8&deg;f"#(1)"#.1%""19"!p!(9-member"#.3%!$egns"!n!"fe!!g!"hl',
+    ' $8(b)!$,100#"92"\'400,000"\'500,000"#600"#800!$-day!&.10(a)""34#!6#!p#$secs""42"%5&ins',
+    '"*0-year-old#!g")860-based"!m")th-minute!(2&sol;77"#.5%""00"$1908"$5281""mm!*3&ndash;84"#(2)!/44/1440&ndash;1!*5&ndash;86',
+    '"$,000"%0,000#"03"!2"&3/1459!(7-member"".5""33""65!$8.2%""88!*9-year-old"!6"!9!#:15',
+    '!!e!!h!"ra!#th.!#x10 (9&frac34"(ndash;21!#,10"#300!#-14!$.1.0#$4(a)"$25pm#"pc"#3.2',
+    '""51#!4#&d.p.c.#!m"$6(a)#!6""79#!p +a&ntilde;os!"16!"20"!8!#487!(_,_a_bit!&basing',
+    '"#bel")doulkarim#(urrahman"#ela""ra$&hamson"#sol!)cademicus#$usal"\'hilleas"$kell")quirement"&rylate")tionwoman#\'ualised',
+    '##tes!,dditive-free"%elman"#oum"/renalin-pumping"\'sorbate!"ee"&ronaut!$fcac""db"&ricana#(o-lingua$\'centric!%gaine#$tean',
+    '#"ve",e-regression"&gleton"#ius"!l##aia"&ronomy!&husquy!)ir-travel""xe!%jello!#kim"$kawi#%erman"!o',
+    '#\'sabbagh$#olh#\'yamamah"(anbrooke#%sitas#"va"&binoni##uin"%caeus$#lde#!o"!d#%croft#&ebrand"&ington',
+    '"(l-blacks$%paper##ain$$nder##nut#"od"#oha#%uette"$read"&tarnun#&eceans$$rnet#!s",v&aacute;rez"#way',
+    '#"ra"\'enartas#(ricanize%"ka"$inta#\'routzes"(moniacal"(ortising##ssy"%poule"#tel!%naeas#0logue-to-digital")c-inkatha#&horite',
+    '##ino#&ouille##ree$#ieu"%geloz#(lophones"+n&eacute;es#%alisa"%opaia"!r"#tal#)hoxanthum#*i-athenian%#car%&growth',
+    '\'&vasion%2parliamentarianism(%tisan&,erfectionism&%iracy%)satellite&%plash%+thatcherite%%venin$%drama$-quit&eacute;s$(rrhinums$$type#!m!#pck',
+    '##xes"\'ollonia"(ple-cart%%carts%$shaw#\'rehends$#iou""re#%il-19")terygotes!%quaba!&raglin##mis"*chipelagos"$dagh',
+    '"$eesh"+ga&ntilde;a#$onne"%lindo"#mer#&orials#)y-surplus"\'nfieldi"#ona"$royo"%scott#%enazo"%taria#"us!#sad',
+    '"&h-grey#%qelon#&rafieh"(phyxiate#"ro"+signability"*teroschema#$hana"#wdu"&ystole!(thenaeus%"ix""if""ti!(ucheneen',
+    '"$ldjo#$enti"0stralopithecines%)o-russian"\'toclave$\'poiesis&#lis#(umn-sown#!y!,vant-gardism!#wan#.reness-raising!&zurite +b&amacr;han#*uml;cklund',
+    '!\'acaudae#$cara$#hic#(k-heeled%(pedalled%\'tracked$$land%"ot$)pedalling$%slide"$gger"0ker-shevardnadze"#lie#\'lycarry%&sadare',
+    '#%ilike"\'nnerets#"sa"%paume"(r-headed$$ilan##abb#%bered#,celona-based#)nardiston$(stormers##oni#%phone#)rie-brown#%stool',
+    '$(holomeus$&oszcze"%sutho"%t-pad"%vieca"\'wdiness#%nmore"$ydun!"c.!#e_a"#art#\'stblood##tus#%uport"$caks',
+    '"*er-bellied"&fuddle"&gemder##hin#%ining%,ning-of-year#$uine""in"-la&uacute;nde$%fonte#"bo#&turbet"$ndel#%talls""qa',
+    '%$ands$#ndt##lei#$mans#$nama$%stock""sa#"ht#$kett#%mirch"+ta-carotene#*ter-heeled!&hairon#&ktapur#)ttacharya',
+    '"#eag!)icultural"&dassoa"(edenkopf"*g-business#(gerstaff"\'jeljina"$nbag##nie""o-#*energetics##tec$\'urbated"(rdoswald$$seed',
+    '"\'sexuals"(tterroot*!s!%lack-&$belt%$buck%$wash#"is#&keston%\'thwaite#%tcham"\'eakland#(ssington#(tchingly"%incoe',
+    '&*splattered%%sport"\'ubbered#$eish$\'shifted##mer#%shers!%o-bos"\'anareke#)rding-out#\'t-train"&bbling"%degas##ser"$esak',
+    '"%isset"#lle%!r"&nhomme""of#%kbank"+phutatswana"&rdallo$%esley$#one#%rowby"%ssidy##tic")ttle-feed",ull&eacute;e',
+    '#(ndedness#&veries"#vin"%w-wow#$doin"%xplot!\'radgate#%field#*in-numbing%$work#%ndeis#\'ss-band%"ai#$tina$!t',
+    '"\'ead-bin$\'k-point%$beat%&points#&dcroft##ese##hme#$slow##vet#%wking"&icking#(dgeworks$#ies#$enne#&gadoon',
+    '#%ngton#(slington#$tpop#$zola"%ocquy#\'kerages#\'nze-age%#ino#&omhall#%ughty#*wn-skinned##yle"$ucei##mmy"%ynmor',
+    '!*t&ndash;13!)uachaille"\'cephala#"hs"&ffallo##ton"&gattis#$gins"#lak#(k-buying#&limore$%seyes"(mble-bee&!d#&pstead',
+    '#!o##uel"#ran##kha##lap#"tt"&sfield#(hwackers#1iness-to-business(%women"%yhoff!&yroads #c94!(a-dbfast"#cao',
+    '"#den#$well"\'esarism"$fane"%irney"\'lamares#$ends#-li&egrave;res%#dus%$stus#%ogero$.rie-controlled#$yxes"&mazotz#&elhair',
+    '"$n-do##epa$!t#(nibalize%%zzaro##osa#&telupe$%ilupe#\'zonette"\'pitular##rea$&icorns"\'rassius$!x#/boxyhaemoglobin',
+    '#!i$#boo$(caturist$#llo#%loads#\'pendens#$ritt$$yin\'##thy"&sanare#)e-finding%$room##key#$tedo$%ineau',
+    '&%haven"\'tamarca#(echetics#)heterised#"ia"(uterized"\'vazzoni""wl!"bm!$echt"%lcius#%larer"%nelec#\'troskew"/pacia-colonised',
+    '!*ge-alcatel"!g!(haldeans#$made$%paign%"ed%&ignons&$llon##nia$"ni$\'terelle%$iers#"ot#"p.#%suble',
+    '#\'uffeuse$#vel")eapskates#(cking-in#%mdata#&ramyes$*nobyl-type$%ubino#,stnut-seller"$iaia$%rella(!i#,cken-and-egg%#pea#$dren',
+    '#\'kamatsu#$lden$(odonella#!m$)ney-stack#&ng-kuo$$ooks##vay"+lorine-free"&oleacs$(yglycine#$osey"+romatograms%)odynamics$\'nograph',
+    '#\'rchgate&!s"\'ynoweth!(ipollini"%rclip$(ularized"$stus"$vets"$zeta!(lassbook"!c"/ear-sightedness%$well#%mpson#*nched-fist',
+    '#$wlow"&ontarf#)se-hauled%)ly-fought")ub-shaped$&mosses#%mhach!#mhc"!o!%o-ack#\'heiress#*sponsoring"*ach-driver#\'l-steel$%fired',
+    '"&ckspur"$deff"&enties"-ffee-coloured%#rer"(ireachan"&ldbath#(our-code"&mmendo$,issionership$)only-held$%press#*pany-based%(tability$/rehensivization',
+    '\',sion-moulded#&unidad"&nation#+celebration$%laves#&ferral$&iserie$)lict-free#+gr&egrave;s#)jecturing#$nons#*situtional$&tricts#*tainerised%%ssium',
+    '#\'volutes"\'okridge$#sey#"mb#&pering"&p-shop"&rdwood$%yline#!m#$nall$$elis#)repondent"&sgrave##ima##low',
+    '#%sutta#/t-consciousness%+improvement"+transfected\'$port"%uldna#"ns$+ter-measure\'\'attacks\'&posing%\'rywomen#\'rbevoie$$rier$)se-detail")ver-glass',
+    '$%house#\'caddens##dry!,r&ecirc;ches")aigantlet%"en#$nkos$,s-sur-sierre#\'wlspace""bc"$espy#%tonne"(ime-free$#ond#"na',
+    '##san$!t#%tcher$$ters",ocodile-skin#$issy##lla#)moglycate#$sier$(s-impact\'(n-square%#gar%#way#&upiers$"te',
+    '$"le!*ulturelink"-mi&egrave;res$"ng"*rmudgeonly#&viceps"$scus"#tey#%shall!$ycad#(lohexane%2philin-cyclosporin"#ert"\'nosurus \'d\'armes',
+    '"!t!"19!(abrowski"%coits$#sta"#gan"$idle#(sy-wheel"$kers#"ka"#ncy#$dled#&ismend#"ks"#rci',
+    '##nay"%ssler"%tamax$&points$%views#$rino"&vinson"&y-case#!e#%sacks!(ead-eyed$%heads#$lin\'#\'th-trap"$bden',
+    '""cd##kle#$leor#*onsecrated%(taminate#!t#%world"*ep-rooting$#ish"&faming$#rge#&rocked#"ty"$igns#0ndustrialisation',
+    '$*yed-action(&return##boy#%phini"+materialise#\'ontfort"$nney"\'putized"\'railing##sch"(sborough#&combes#)ign-based#$tutt"+utocerebrum',
+    '(!n"$vall#/eloping-country#!o"+xamethazone!"hc!%iable#0mond-impregnated"$bich#&utyryl"%deoxy"#etl#,udonn&eacute"%ffere"&gester',
+    '"&merise$.thylsulphoxide#\'lington"%nescu"#ogo##uri"/rectors-general#)ty-minded"*scomposure%$rdia#%dains#+entitlement#*franchised#*integrator#%pirit',
+    '!$oant"%gshit"$leys#!f#"ts"$nmar"\'or-step$\'knocker"+ppelgangers"$rpat#%rance"*uble-click\'&height"#wey!,raft-dodging',
+    '"!b"-essing-gowned"+inking-horn#\'vechart$)ing-force"#uim!"se!\'ual-bus"$bosc"%crocq"$enna#$rgar"$gong"%m-dum#%bbell',
+    '#%pbins"&ncairn##loy#&scroft"$rfey#"ga##man#\'otriges"+xford-based!-wellinghouses#*rringhouse"!r!#yno \'e-ferol"\'systems',
+    '!#afe"!m"%rnley!#bba"#oli"&rahimi!-cclesiologist"$evit"*hekratidas"%khard&!t""ml"\'opetrol#$tech""ta',
+    '"#uca#!p!$eiba!)ffervesce!$geus"(gborough#\'lestone"+yptologists!)hrenpreis!2igengesetzlichkeit#)ht-wicket"(nsiedeln"#ris"$scat""tc',
+    '#+ction-night%$rica&*o-chemical(-encephalogram\'*chemically\'%shock#(ven-year&#ish"\'fswitha"$idir"%lmann"&mhirst"(ongating"%sivir##ner',
+    '#%itter"%piric"!x!&n-bloc"+culturation#(ylopedia"&d-feed$%stage##eth#2othelin-converting"\'gelhard%!l$!n##uli"$ormo',
+    '#/ity-identifying##oto#&remont"%viron\'1mentally-damaging!%oghan!"pg"#hos"$irus!&rastus"#dal"%minia"$nulf"%otics!&scrima',
+    '"#qre""ri"#ses"&tcourt#$eems$,rh&aacute;zy#%reito!\'therley!)upatorium"+ro-election$$card%(ommunist$#dif$&phobes"(stathius',
+    '!(vacuates#)ngelische")er-closer%(shifting!$waso!&x-ante#$drug#&empire#%l.c.c#(pugilist#(security")_cathedra"(halative")tra-thick$$emis',
+    '$\'catcher#&balled!$zek. 4f&eacute;n&eacute;on"*uuml;rstin!#(y)!%-111s"&number!"50!%abbio##ris"+ce-painting#!s#"ta$)ory-based',
+    '"#ial#(ry-cycle"#kie",lse-bottomed"#mae#)ilymakers"#nni#$toni"%r-red#"co##eda"$sces$%iatus#!l"\'t-faced',
+    '#1tafattafattafatta##wah")ulknerite!$edra"&inting"+male-headed"+n&ecirc;tre#"za"%rraro%!t$"ie$%uccio"\'versham!"ff!/ibre-reinforced',
+    '##way"#eri"/fteen-year-olds\'#th-"%gleaf"\'ligreed$%zzola"#nks"*re-bombing$\'bombers$\'cracker$#fox$%storm"%schel#&h-tail',
+    '$%paste"*tzwilliams"&ve-act%$time%$yard!\'labagon#&shcard#(t-backed$$foot$#ted$%woven")edgelings#\'mington%(sh-dutch")ickscreen',
+    '"*ockmasters#(wer-vase"$yway!%ofana""hn"&inaven"&ldaway""ng"%r-job#\'ce-land#$egut$%hands$\'ign-aid$$sman%&tomach',
+    '$!y#!o#%sooth#%tnums"\'ssilize"&ur-bed%\'channel%\'wheeler&#ood$"ie$#th-##tue"%xwell!,r&egrave;res")amlington',
+    '%$oeur$%jiyah#"ri#\'ternise"+eckle-faced#$dkin#+e-marketeer%(transfer$%dmans$$kick$\'loaders#!n#,quency-range#&sh-air%&waters',
+    '"#iba#%court#%dolin"+ont-bencher%%ieres#%strow"\'uitella!"sh!#udd"&el-oil"$gard",ll-flavoured%%house%#out"#rka',
+    '"$tuna &g-orgi!"50!#ado#$sden"&idheal##man#%sford"+lactosidase$!n$#xie#\'laghers$$egos$%inago&#ule',
+    '"$nesa#&g-boss%%plank#"ts")p-filling"$rdem%%nwise#(rynahine#&thorpe"&scoine#%lamps##per#\'tronorm"$uger$"ht',
+    '""va#%eller"$wler"%ylord!&barnga")lsections!#cds"!p!"dc!%elson"+nder-biased#)ealogists#\'otyping$#ves#$star',
+    '#)magnetism"$rand#$bner"*sneriaceae#&tating"$ting!$hede!\'iaconda#$ffer##nna""gg"%jssen"*llingwater"\'mingham"$nkgo',
+    '!%laber#\'ciology##ive#$spie"%eaner#%nburn$$view##sca"$inka#(tterbest"%oddfa#%ssina"(ycocalyx!&o-back"&dammit',
+    '"&lconda#)d-braided$$line#%ovnin"%natas#&courts""o\'"$rdan##ias"$sset"%tfryd"$udge#%lston#"ty!,r&eacute;try',
+    '"%amont#)ndaughter$#ges#!u$#cob"(easeball&!r$&tsword#"ch#(en-brown&$gold%%gages#\'nadilla#"vy"#ian',
+    '#%ddles#\'mspound%$tone#$nton#"zz"$ossi##uch#%wbags$&ing-on"$ykes!%uanxi#\'rdasoni$#ini"&byenko"%dauri',
+    '"$emar#$nons$$ther"#ffy"%ienne#.tar-orientated"$mede"&ndulph#&makers#&thorpe"%rland"$ston"%ttuso"#yon!"ye',
+    '!"21!\'abbakuk#"en$#rup"\'ckforth$$mann"$dmor""ga#"er#%glers"$ikus#&lstone"#kel##kio")lf-german',
+    '%&joking%\'smiling%)undressed%\'whisper#$shaw"\'mersley#$moon$%urabi"+nd-crafting$"al#$kley##nis"$rbah$$ison#$clay',
+    '$#cpy$\'pressed#$eems$!n#$kabi##pin#%tleys"%usner#)te-contre"(versacks"$waga##iye"$yira#%maker#$rick',
+    '"%zelby%#ton$\'nbrouck!"ca""lo"\'modules!)ead-scarf%$wrap$&butted#-lth-promoting#%rtier#(terstats$%hcoat#(venfield"&dlunds',
+    '#!t#$wige"%idorn#"no"#jaz"&likite$(um-xenon#$lena$$gill$$icar#"me"/patocyte-matrix#&tarchy"#rat#!z',
+    '"$yden##man#%nckes!\'iccuped"#gby#)genbotham#.h-denomination%&factor%\'sulphur$&handed$$tech"$llen$%foots"%ngley#)terzarten',
+    '"$tech#$lers!$l-60!#mmn!$oban##man#$nail")ck&eacute$$aday"&ffmans#$lins"(garthian"(i-polloi")ldernesse#$lein',
+    '$%ywell#$mans$(es-smith"$mard#)e-country%%range$%front"\'neysett"\'ogeveen$#hly##kes""ri#,mone-related#(ror-film#+se-breeding',
+    '"/spital-acquired"\'theaded##son"\'uphouet"%veyda!$p-rt!\'rothgar!\'ubbards"&ckster"$gman##ues"\'issiers"$lagu##ley"#mes',
+    '".sband-and-wife($wife#&qvarna"%ygens!&yaline"%decat#\'r&aelig$,ocharitaceae%&logist""ll")persparcs#)ocerebral \'i-ching"!s!".c',
+    '!\'deation""oc""rc!(erapetra!*gnoramuses!#ll-$\'written#+ustrational#$will!(mageflow#!i"!e"#jin"\'migrate#%unize',
+    '&+precipitate&*suppressed")plementor!(n-breath#$file#\'package"#bye")diarubber#(ustrials\'\'y-based)%level&!y"*fantilised#.lation-busting"%galls',
+    '(&zation")k-stained"(numeracy")stallment$#eps"+tangibility#"ec$%grase$\'llicorp$%nsion$,r-enterprise%"ex%(ferogram&#irm%%mezzo',
+    '%(sectoral#\'oxicate#\'ra-bloc"*verkirkaig!+on-exchange##ize")thalamate!#pcs!&quique!+ron-founder#-ul&eacute;guy!,schigualasto"$igny#$ldur"!l',
+    '!#tab"$hell""is"!r!$vife"#rea!%werks!$zumi $j.v.!!7!(acquards"$loux"$meel"$nzen"$plac',
+    '##ray"&tinder#"ta"%zzman!#cpt!#ell$!o"&roboam"(t-skiing#"ro#"ta!\'im-jams"\'nkinson"$varo!!k',
+    '"%delet"%ergen"(hanneson&"is"&inture"\'ngleurs"#sse""ts"%vinus!%ubair##bly""le#&ieanne"*ngfraujoch"-ran&ccedil;on',
+    '!$yacc &k-rase!\'abbaras"$dare"%imann"#ler#%ymnos"%mares##eez#$otho"&ngeroo#"ja#)sas-based"$reem#&savina',
+    '""ti#%samba"&vsadze"$yhan"#zim!\'eadilan"%ender#%psafe##zer"%laher#%lynch",nyapithecini"#rns"$tley!&hadras',
+    '#!r"&varism!\'iesling#"vs"\'ftsgate"&k-step"(lchiaran#$lies%)ng-cauchy#$peck"*nderszenen#$ghan#)lochhourn#)sk&yacute"$rtle',
+    '#&singen")te-shaped!+l&ouml;tzer"$icks!&neeler"*ockanemore!&ocanek"-lestral-super#!l""mm$"en"#ngo""op"$peks"#rdt',
+    '""sa##ter&$litz"#tai!\'rassner#!t#%wczyk"%etser"$ista##zia"%ugman!&ubelik"\'gelmann"%rator"$zmin',
+    '!)\'alouette"%opera!&-field!!0!+aboratoires#\'yrinthe"&ckaday$#ner"\'defoged$#nis"\'guardia"#kas#%ehoff"-mbda-matrices#(mermuirs',
+    '#%pbase$&ooning"\'nd-fill$#ell%$samt$%falls$%grave$%plane$\'scapers#&ghorne"$redo#&ghetto"+ser-doppler#(t-wicket"&tchett',
+    '"(undromat&(y-basket$#ton#$rier"\'ypeople"&zzards!&eaback#%dline$#man#&f-hair#+ther-worker"%baron"$ekes"\'ft-most"%hrman',
+    '"#nta$\'ricchia"*pismatidae"&rnaean"$stat")tter-bomb&(macaward"%veaux"%wises#!s"%yraud!#gbc!"hr!(ibrarium"&censor',
+    '"$gase#\'ht-dark&,welterweight%(ly-built"%lford#!l#*y-flowered")me-hating"&ndblad#,e-management$%ation#.guistics-based#$sley",quid-crystal"$sner',
+    '#%ztian"+teraturnaya#"le#(mus-test#(tleblood#!z"(versedge%#ton$"th"+zard-hipped!+lanbrynmair!*obe-finned#\'ophytum#%worms"-cation-factor',
+    '"#lls"(ng-faced$&bowmen$*er-serving$$ways"%patin#%okova""tz"#vie"+w-inflation$%trust#$dens#&ermoor#%field#"is',
+    '"&cienne"#kla"#mme""pi"#rve"%stral"*tzemberger"!u!$ycia""de""ke"%ndall#(e-pirkis ,m&eacute;doc)\'lisande',
+    '!#\'am"\'gonigle!#.t.!"55!"65!.achine-gunning((washable\'$head#+rodiffusion%)structure"%delin%!l"$enad""gg#%uires',
+    '"#iga#"na""ja#%ewski#&uscule"#ke-##sud"$late#(ediction$!o$#rba#&linson$#ows"&nfredo#&gement',
+    '#$olis#$rent$#ico"$oism""pe"(rcellina$$iana#$engo#%getts#-ie-antoinette#&karian#$mara#%ryin\'#)tin&uring&&azzoli',
+    '#-xist-leninism/(t-maoist##yan"(serfelth#*s-marketed%)producing##ted$\'urbator"&tadors#"on#\'rilines"#vra"$xial"%y-day"%zeppa',
+    '"!f!"db!\'e&mdash"\'ans-end#"re#)t-packing""dd#&iatron$$cate#\'jugorje"+eting-point"%garid#$iddo"-l&eacute;ndez#$anee',
+    '#.qu&iacute;ades#.t-in-the-mouth"1mbrane-associated#$oria"%nahem#%elaus#$zion"$owed"%ribah$#pol$&wether#"ks#!o##rem$"il',
+    '#&entery#&oscale#*sage-level$#ers$"um"+tal-bashing%#box%%lacta$(silicate#$hody$\'ringham#&rocabs"-uni&egrave;re".xican-american%\'o-based',
+    '!$garr!(huillinn!,icrocephalic%)diffusion\'$sney%%films&&ossils%#lin%$mark"&d-\'50s$$1944&"60&"71&"83$$grey',
+    '%+ost-glacial$1sixteenth-century&#zed#,dle-american\',of-the-range&&thorpe"*fepristone##sud"*hailovitch##rab"#kel"(leometer#(lefolium$"in"#nda',
+    '#%gulay#\'hinnick#+i-flyweight%\'version$$cabs"%rphak"\'sbourne#$eria#(sissauga#&trusts"\'thraeum%&idates##ral!#mei!$oais',
+    '""co"$eurs"(gadishou"\'hieddin##sen"%jacar"\'lineaux##let$$ison#%uccan"%n-fri#0day&ndash;friday#"eo#)opolizing#%reale',
+    '#%twalk""pp"&ralize#%ceaux#(dkovitch$#red#%pheus#,tgage-backed"%sside#&t-used".ther-to-mother#\'or-home%&sports"$uffe##min',
+    '#(rabitoun#\'sseline#%tiers"\'vealong#$illa#&sisyan"$wery"#yes#%nahan!"pw!$suya!$uang"(d-walled#$arra#%banks',
+    '#(sli-type"%ffles"&guruza"%hamet"#ick#"rs"$kasa"#lla#)ti-author&#bit&%fibre&$step%%lumen%-ple-objective#%vaney',
+    '"(riaticum#!t"#sak#$cari"%tagen!)yelopathy"$ftiu"$ndie"+tho-history /n&aacute;prstek"*egrave;gre!"\'y!$-joi!#.m.""t.',
+    '"!6!(abatiyeh"(chtigall""dp"$futh"$hdah"&katani"!l#!u"(me-plate#"pa".rrowly-defined"#she"%tvacs"&varran',
+    '"+zi-occupied!#bcw!$dola!,ear-disaster"\'gresses"#nad",o-darwinists"#rds#%occio#%urkar"+therlanders#$info##way"+uropeptides&*sychiatric',
+    '"&w-mown$\'product#&ly-cut&*introduced#(sflashes$$wire"&xhmije!#ial#"zi"%blett"&chimen$\'olaevan#%kalls#$otra"#esr',
+    '##nog"\'kiforuk"$mrud")ncompoops#&e-foot%$iron%#man"+trification##tis"$vkhs!#maa"!i!#ofc#%ziger"%ggins',
+    '".n-accelerating$\'dualism$(examined$(hardware$&indian&#tel$&labour$*management%*olestation$)operating%(rganized$#plo$\'receipt\'&urrent$(secretor',
+    '$$test$+uk-resident%*tilitarian#*conformism#$idet"#pps"(rdbanken#-m-referencing#$rice#-th-easterners"&seband##sal"$tchy#2tinghamshire-based!"ro',
+    '!\'u-swift""m."$srat"&t-case#$megs!#yos $oake")th-taking"$xaca!%blate"!v!&ccitan"\'eanward"$tans!+dd-numbered',
+    '""um!%edipa"%rsted!&fferer#%iciis#&screen""mc"(ten-used!,il-consuming$&filled!%jibwa!#kan"(ey-cokey"%oyong"#ura',
+    '"!r"\'ympiads!,mg-compliant"+nicompetent!&n-disk"*e-over-par$$part$&season!,penframework"(hiotreta"\'tronics!-range-blossom"#ban"#den"%isons',
+    '!*saka-based"$cott"#ler")phronemus"#ram"#sau#$etes#&modula"*teosarcoma#$mark#(racising&#ods!.ther-regarding"(ocinclus""us',
+    '""dh""ed"#sts""t\'#)-of-sight($orts($tate$%point$%voted#\'er-wear#$haul#$land$%iving$&oading#\'rightly',
+    '#*ward-bound!(valtiney"*er-balance&(orrowing%&commit+$ting\'%ncern%\'feeding%*influenced%$much%\'pricing%$read%)stressing&\'upplied%(the-hill',
+    '&\'intered$%alled$&booked$*commitment\')pensating%$rowd$+familiarity$&hauser%&olland$%print$&typing$%water!"ws!&x-cart##eye',
+    '"&idises"+y-acetylene!$yama!$zaki 7p&acirc;tissi&egrave;re!$(ii)!"-2"#40s#!7"$trap!#.f."$p.s.!"32!"42!"56',
+    '"#avo")chyphylax#,kage-holiday#$quet##tum""da$&yachee#&eswood#\'jelanta##ley$&ocking"$eniu#"se")ge-turner$%field',
+    '"&hlavis"&illard#&ntball#%onios"(laeocene$$tino#"cy#\'e-brown#)ladianism$\'etizing$&iasses##mar$#ier#$pate"#mir',
+    '""na$#mas$%ragua#%gloss$!u#"ky#(slavists#&theist")paioannou$#nek$(remborde#(er-chase\'#lip&%maker%&backed',
+    '"!q"%rados$*llel-plate*)rocessing($ised%$yzed$#set%\'itising$%thion$!y#&boiled#$cham#$ente#$fait#%izeau',
+    '$"ee$/iament-in-exile$&yament##mar#$ndon$$elli#%reira#)t-payment%$word$\'earroyo$%henia$,icipant-role&-ular-identity*$ised$&y-list',
+    '$$ucci#%daran#%htuns#&iteles#+senger-door%#ron#$tore"#tan#*h-building$%craft#$ries%&otique$&onises&%ymics"%ulton',
+    '"#van#)ing-stone$!s"/ymaster-general#$nter!%bendp!&c-type!#dry!-eak-to-trough#"rd#$sley$!y#"te"+bble-dashed"(ccadillo',
+    '#$quet"%ddles"(enemunde#%p-toe"%irson"&lagius##ton"(n-driven$\'y-graig#%ality#(cil-case#&dennis$$ulus#*nine-style&"gs',
+    '$%iones$"on#+tecostalist%!l$#ire#%ywaun"&r-unit#!c#.formance-based,)enhancing$&usates#)ipherique$\'stroika#\'juangan##ner',
+    '#(ranporth$#ick#*sian-style$*on-centred$%pecta%&icuity#!v"$stel$"on"&talled#(it-point#&rofina#$tish""wp#(ter-grey',
+    '#$raon$"ma&*cokinetics#%seout%!r"#ear#&mister#*nylephrine"!h"*ilosophise$#son"%lebas"&ocaean(!s#"ma',
+    '#$rmio#1sphatidylglycerol&#ine&&oamino#-tomicrographs!\'i-meson"%ccoli&%omini#"ea"%dgeon"%erres#"ta"!f")g-keeping#\'mentary',
+    '#&lories#$more#%sener#!z"\'nafored##gel#$kies$!o##son""pa#(e-laying&#ine$$tted#"po""ri',
+    '"%scina#"in#$kies#%shead#%ticci"$tchy#$mans#!r#&tagora%"rd"#xar"\'zzarama$%ettas%!y!$jc-2',
+    '#&inmoor%&palais$%stowe#"ka#(n-making$%tains#"rr#)s-yn-rhiw$#eth$!h$#kow$#tow#,tinum-blonde$!s#!w',
+    '".easure-seeking#"co#"su"%omley#"ps""te"!u#\'mb-line#"nk#%tchik")ze&ncaron!*neumococci!/oati-souchalaty""ck"$eple',
+    '%)s-scoring"\'larlite##den#"ic%$iano%,y-orientated$.tical-business#\'linates$$ocks$-ution-control#)o-playing#"ya$&center$(disperse$\'merized',
+    '#%zeath"#mak#$mels$"ie"#ncy#(iatowski#)tcysyllte$%epool%%vedra#&ytails"%opers"%povic##rad"#rco#%ifera',
+    '$%erage&$sept$#noy$%ugais".sitional-level#$nett#&t-aids&\'uditing%*capitalist&)ompletion%*infarction%)marketing%+restoration%$term$$date',
+    '$%fixed$%marks&%sters%)ultiplied$$ojna$\'scripts$$ured")tentiates#%latch#&rovsky#%teric$*y-training"$udre"!v#+erty-ridden',
+    '#$ells$(r-broker&#cut&*dependence\'$rill&&holder%%books%%frame%$safe&&ystems##ley""zo!3r&eacute;v&ocirc;ts"#ada#(epositus',
+    '#"ha#$yin\'"&e-1940\'!8&"65&"70&"91$(accident$)breakfast$\'decimal&\'parture&)signation*"ed%(ischarge$)enrolment',
+    '$%owned$(petition%$ilot%(lacement\'#gue%#unk$)recording&$form$$sold%$tall$&tested%&reated%0wentieth-century$+unification$%velar',
+    '#&fixing#"go#)lapsarian#*ntice-hall#$seli%/rvative-treated$%sgang%!o#&terite$!i#$vert$#ost"!f"+ice-elastic#(ma-facie',
+    '$)eval-soup#(nt-maker%)ing-press##sma#\'viledge#*ze-fighter"*o-catholic$\'fascist$%hindu$&lifers$&mining#\'beorder$"st#-c&lowbar;save$)ellaridae',
+    '$$urer#$dger$!u#&genoid$*nosticates$+ramme-maker%"es#-ject-oriented##mis#$nase$\'taprint#)ofreaders#&panone$-erty-casualty$$ofol',
+    '%$unds$#rio#(selytise$$hare#*tein-based$$okol"%uners!,salm-singing""bc".eudo-democracy\'\'history"*i2-nipenv5##ons"\'ych-out%\'o-motor',
+    '&(logizing!%tpase!%uerta"#ked"#lex#$ford##ver&#ise(#ing\'$zing",mp-and-treat"\'pillary#&py-dog"%rdeys#)purascens',
+    '"%shin\'"#tto",zzle-solving!#wei""mi!%ynson"#per"4r&eacute;n&eacute;es#$amus#$mont",thagoreanism!$zazz *q-analysis!(adesiyah"#mar',
+    '"#tif""zi!"eb!&uaddus$$erno$(riathlon#"ir#/lity-monitoring#%rter-(%point\'\'masters&#tte#"te$$orze"*eenborough',
+    '##ipo#"rn#!s$/tionnaire-based##xos#$zada"*ick-moving&\'service%$save#$ffed#$ller#$nean$%idine$#ney$$tero',
+    '#\'zmaster"#oom!&vision ,r&eacute;aux)%gence*&ionaux))publicain"(ouml;sti!%-1830"%value!%.r.p.!)342a4-b14!*abbit-hole$)le-rouser"&dcliff',
+    '&)telescope#"ox#%ucanu"#ffo"\'ghunath##ley##nar$$vald""if#\'l-borne$#man#"on"(jasthani#!u"(manayake',
+    '#$samy$$tein##tek##zan"%nched#"ds#$gkul#!o#%sford#"za".pid-deployment%!o$#ers$"ne##tly',
+    '"$skol#&tafari")t-running$$tail&!t#$afia#$bags#\'catcher#)ionalises#1tarattarattaratta$"ly#!z""uh"$vara#&enhead',
+    '"*znochintsy#$ored##zaq!,e&ccedil;ues"!\'"(-amended$\'pplying#&badged%%lance$#oot#*christened$(onfirmed%&vering#)designing%%velop',
+    '&&played#&employ$&xposed#)furbished#%group#%house$#ung#*identified$+nterpreting$\'terated#%lived&#ing#+negotiating#(organize%\'ientate',
+    '$)ositioned%%tting#&rating$\'egister$#oof#&settle$(tructure,!d#$told#+upholstered#$wind"&achout#,der-response$(ing-desk#"ll',
+    '#&r-seat$)ticulated#%ssume##ves"%bello#&inding##led%%eders#&reathe"0cently-developed#&harger$)tschaffen#(irculate*#ing#*lassifying',
+    '&$ured$-mmodification$$pied$*rd-setting#*yclability"(d-billed#!a##die#\'edicate*!d$%signs$(termined##nal#$worm"&ed-bed',
+    '#+stablishing"(fastened#3erent-qualification#\'inanced$!x#\'lexions#(ocussing##ret"#gie#$rown#)ularizing"&homing"&ichert%#ian#!g',
+    '#&nstall$)tegrative#"se%!r")juvenator"\'learned#\'ighting$$nquo#"ly"*maindering$$pped#%edios$(mbrancer#\'oulding"&nbourn',
+    '$"le#$nweg#*t-a-picket%\'seeking$!e"&occupy#(rientate"#pas%!s$\'triates#"in#(ublicana\'#que"%quite"\'release',
+    '#$erva#$hoot#0ource-allocation#%pighi#%trepo$%yling#)uspending($sion"&thinks#&icular$.rement-pension#$ouch##son"*vegetation$+nue-earning',
+    '#$ient"$znor!\'haetian#%mnose#&psodie"#ian##mes#&negold"&yd-ddu!#iah"&ccioli#&hemond(!t#*kenbackers"$ddor',
+    '"$enzi"(fle-shot""ha$"nd"&ksbank"#met#\'mington##net"\'ng-road$(dufferin$#ill"$seth#\'inghill"%tchin"(verfront',
+    '!#jwg!#krp!*oad-bridge%%going%\'holding#$ster"$beck$$rtus"%chead#(k-a-nore%#cut$#ist$%pools"$diti")gernomics',
+    '#$nons"%lexes#&lerson$!y"%malpa$\'n-style#"eu##ish##kes##ulo"(naldsway#"da"(of-light#"nd##ves',
+    '"%rqual"%sacea$$leen#$cius#)e-covered%%water$$hill$$land%"la$\'nblooms%%zweig$!t#$oman#(pigliosi##tow',
+    '#\'isserie#(liegende#\'orcraft$%sound#!z")ugh-house#%mania#(nd-ended#\'stabout#(te-march"!v"#xby"%ztoky!$tmas!&uberti',
+    '"(dergrams#$ling#%olpho""ed#!s"#ffo""gg#$osas"%maneh#&blebow$$olds#!l"\'n-round#$neth$)ing-water',
+    '"&rality"-ssian-trained#&t-free$"am$%proof#$warp"%tlish"$ysch"$zski!#x-7!%yburn"%croft"%eford"#obi"&sbrack',
+    ' 8s&eacute;n&eacute;galais"+oacute;lnes"+uuml;ssmuth!&\'posed!%.r.n.!$aabs#(rbrucken"%bines%!i#"or##uro""cc#&hmeyer#)ramentary$(osanctum',
+    '#"ia#"ou"%egusa"#fet%\'y-catch$!x#&ranski"$gres"#ich#\'gnakong##hou#$lfin#!n$&t-paul%\'e-beuve',
+    '"$lama$"ta##eem$$ngro$$sian##ibi$#fou$"ma#!m$"in##ona#"us##ves##way"#maj',
+    '#$math#!o$!l#%tampa"#n\'a##abu##cta%!o$!y#&dfords$#ler$$oval#&gfroid#\'tapaola%*r&eacute;m',
+    '$\'iaguito$"on#&vitale"%ponin"&raband$)ntopoulos##gon##hwu##ita#%karia##tor#"us""ti$$rise&$zing',
+    '"*udi-backed%!a#"lt##mon#"ri%"an$!o#!s"$vate##oia$%yards"#w-i#\'allisch""xo"#yaf',
+    '!(caevolan#%le-up$$iger#/ndinavian-style$#jet$#mar$$worx#(ramouche$#pia"$eaux""fe"$hach$"lk$+ttschneider#\'efflera',
+    '%%ngold$&matics$$rrer#$iltz$+zoaffective#$lepp$)ossmuseum#(malensee#&niedau#+oendoerffer$"la$&nbrunn$!o%(lfellows&\'girlish',
+    '#$tick#%ulman%"ze"$itex"#oon#(re-sheet#&tching$#ney$%stoun"(reentest$%w-eye"&uderia##ffs#$lled$\'pturing',
+    '"%ythia!\'ea-loch$%power$$sick##lga#%power"$bsky"$cchi#$lude#*ond-storey#.retary-manager$#ist"$daka"\'ewinkel"\'gerstam',
+    '""he#$zade"&irawan#)smographs"%lanik#$ecta#.f&rehy;evident$\'-acting&-ggrandizement%(checking%+denigration&(irection%)executing%*generation%\'helping',
+    '%+recognition\'\'pairing%#sow&*timulation&(urrender%$talk#&l-outs$"ey$!o$%sword#$ston#$ters"$maan$#ria#)i-contact',
+    '$\'narians$+transparent#!s"$nada$"to#%ggigi#\'igallia##neh#0tence-completion$*imentalize"\'quiturs"\'raphina#\'fontein##iat$+es-inserted',
+    '#%rania%#tus#&vicios%\'ng-maid"#sto%!n$"ri"&ttelen".ven-day-a-week&%match&%pound%&th-day$$rals"#wel"*x-obsessed',
+    '"$youm!"fr!"gc!%haban#(dowgraph#$hpur#$ibah##nta#-pe-perception&\'shifter%"ro#)re-owning&\'pushing%\'d-space#$wled',
+    '"$e\'an#$been#"ed$%p-dog%%folds$&rwater#%fford#$ilah#&khawat#&lfmark$%leyan$\'merdine#\'nington#(pherdson#$rfey',
+    '%"ne$$land$$wani"$ikar$#uku##lls#\'p-borne$&owning$-per-consignor%"on##rai$&t-tail#$tman"$oard#$bana',
+    '$#ted#\'p-owner$&aholic#&reside$&ing-up$(t-billed&#hop&\'listing&&notice%$cake##sha#&tesham$#ten#$ulda$$tin\'',
+    '$%caves$)s\'n\'rides"%rills$%mpers"$shsh"&uddery#$ggie##jat#%lamit(!h##men#*nt-voltage#%t-eye$"es"#yok',
+    '"&ck-bay$"ed$\'le-cell"#ddy#(e-impact%)splitting"#eur"&gehere#\'ht-read#%naled#&riswil#$tuna""ke"+lk-screened#%phium',
+    '$\'er-gold&\'platter%!x"$mfic#%iliar$$ster#%onian%"on#(ul-class%$cast"%n-bin#!a#"dh$$ical#&gapura',
+    '\'$leaf\'$room\'\'section"%obham"%skina##tem$#ren"$tges##thi$\'ing-out"$umut"!v#!e"&x-chip$%night',
+    '$\'speaker$%wheel)"er##ers#\'ty-year",ze-frequency!$kase"#eat#$eter#$ggie$!s#$ldon#"ps#%wbald"(i-jacket',
+    '#)m-reading#*n-brushing%&diving$$tone#(rpenbeck#"to"%ottis"\'ullcaps"(ylarking!(lag-bank#&m-door#&ntwise#%phead#)ve-driver&%grown',
+    '%&master$"ko""ea#)ep-walker#+nder-billed"!g"*icked-down#&de-out$)ing-scale##nes$#ger$$kton#%pover"%oshes##van',
+    '#)w-release$)er-moving"%umkey!%madja##les$*l-business&&headed%$bore#&rtscan"%eddon#(ll-brain$#ser"$iddy$&ovitch#!r',
+    '"+oke-damaged#$othy#"ut"$ylie!%necky#\'ttisham""ib#$cked&!r##der%!y#!t$"ch"#ood%!s',
+    '$#zes#&w-clad%%laden"$uffs!$oaky""ba"#chi#,ial-climbing$#eta$(oecology(&nomics#%keted#$otra"(da-water"+eriaatmadja',
+    '$(ening-up$%image$2ware&mdash;library"+ixante-neuf"*l&iacute;s#&ariums%!o#$dano#%idago%!i$!z#(ubilized#,vent-polymer"$misa#$mers',
+    '#"ko#"us"#ong"$pade""ra#%ority#!y"\'therton"#uch#%ndman#\'p-plate#+rce-machine#\'terrain$-hampton-based%\'minster',
+    '",viet-chinese\'#led\'\'trained"$wers!,p&auml;tlese"+ace-filling%&prints#$nhoe$$nier#&rkford"%eakes#(cialeyes\'\'ly-made*\'trained$#kle',
+    '%\'rograph#)ech-based$\'ding-up%$ster#(ll-bound#%rling$#one"+hingomyelin"%ignel#&kenard#(nsterish#$raea$(it-world&#ing\'"sm',
+    '$#oiu##tak"(lit-type##ott"(onge-bag%!s#\'t-check"$rach$$tton#%echen#(ing-sown&$wood%\'kleroom$!t"&utniks',
+    '!#rem!$s-18#!4""eb"!o""pe"%urrna!+t&uuml;tzer"(-germain"+aff-patient#\'ge-hand&$play&\'whisper##in\'#\'mmerers',
+    '$*dard-issue#)phisagria%)ylokinase#(r-filled&&orming$$fire$!n#0te-of-the-nation&(to-state$"is#%uffer#\'vangers#$xton"\'eamtown$(topygous',
+    '#%enway$$pler#&fanini#%helin#*igenberger#&llaria#%nches$$urus#)pfamilies$%hanus#)rcorarius$+ling-dollar$\'n-faced#$vely%%nston',
+    '"!h"&ick-up##gle#+ll-sleeping&%water#&nsford#*pplechoice#(r-frying"+ock-control&%index%$with%$yard#(lichnaya#\'ne-free%&cutter',
+    '#,p-and-search%$cock##rch$)yboarding#&vepipe#!x"&rachen$%ggles$%lsund$%mness%&ongate$&ndhill&#man%%gways$\'thbogie',
+    '%(ocasters\'&ruiser&%scoop#%ecker$%mnish#&immers#%obing$"me$"ne%\'g-boned&$ylus"\'ubbings#"cc#)diomaster#$ffer',
+    '#$pefy#&risoma$*mabteilung%"er$"ne"\'ylobate!\'ub-plan$%range$&schema$%topic#&alpine$#rus#)component##eri#-h&ndash&ndash',
+    '$(ect-area#*millimetre#%otica#)processes"-ccess-starved#!e"$dley##now#%rajat""gg#$ihan"!k#"ie"$lber#"ph',
+    '&(nilamide&(pyridine""me#\'miteers"&n-disc$&loving#$deck#$ergy$$sson##ned#$rays$$oofs#%sonic$"un#$view',
+    '&&heated%%brain%$cool%/ego-development%+fecundation%(naturals%$show&\'printer%%tramp(#vel#+ranationals$#ema"\'rficial#.geon-commander$\'icentre',
+    '#&mising#+round-sound""si"$tter"%worow"#zan!#vay"%enska"(iatoslav!%wain\'##lec#&n-neck#$pper$$shop"+eet-talking',
+    '#)rvedriver#"te"+ift-flowing%!y#*ndon-built$\'gweight#&thhelm!#x-3"!t!(ycophant"#don".llable-initial"(mbolisme##ond"$ndic',
+    '##tex"%ringa&"ed&#ing"%sland#*tematising!\'zczecin"%eliga \'t&ndash\'";6"-oslash;nder-2!%\'aime""be!$(at)!#.f.',
+    '""m.!(a\'kwanya"#bet##one"#cey#\'hometer#&k-room"$ddeo"&ffarel"%ihang$!u#\'l-board%"in%$less$(draggers',
+    '$\'waggers#"wo"$kare#&e-down$$uchi"(li-tying#"ke#)lis-holly#%orcan"%mariz#"ba#$irat$!t"#nga%$rana',
+    '$$shan#&k-bred#&nahill#$ucci##vir")p-dancing$$room#(e-record#&honomy"$raki$!t#,get-language#"im#&quinia#"si',
+    '"$tian##low")untonians#)rocholate#&tening"&verham%(n-keeper""x-"%ylour!#drs!(ea-caddy$&kettle$$shop%$tall#-cher-directed',
+    '#(m-leader$&office#&r-down%#out"$chne&(tium-99m%#ica\'"on#"la""do"#ena#\'thmarks"#gid"%ikoku#%lhard',
+    '$#lec"&lecast$%smart$/vision-watching#$stra#"uk$!s"*mozolomide#\'plemore"+n-month-old$&second#!n$#ish#$tage#%wolde',
+    '"#rai#%esita#"je$#ung##num#%voort"&ssiers"$tsuo"&xtline!#gca!,h&egrave;ses"$abit#$kins#!l#"nx',
+    '""e-#&atrics#*ddlethorpe##enk#$ller#$ming#(odorakis\'"us$(logizing$\'phylact$-ry-dependence#\'reabout$\'moclear&&haline#%seion',
+    '##yre"%iamin#"el#+gh-slapping%$bone#\'n-ended$!h$#net$&sulate#*rd-highest&&wicket$*stlessness##sbe"%oburn##rin',
+    '$&owgood#$u\'rt"\'readfin$1e-and-a-half-year&.dimensionality&(in-a-bed&#jaw&#nil&$slot&#ton#+ill-seeking#)ough-ball($neck(#put(\'traffic',
+    '$&wleigh"+umb-sucking#&rcroft$&garton$"ne"$ymes!$i-lo"\'bthorpe"-cket-of-leave#!o"$ddle%&ywinks"\'etmeyer#$ying"$flis',
+    '#*htening-up"\'ldesley#&ehurst#$lard$(ekeratne$"ou##man##sit""m.#&agenes#,e-and-motion%%bound%&tested&%ravel$$line',
+    '$$warp#&porley#$urid"(n-bronze#\'der-box##gay#"sy##tas"$ppet$#les#%staff"$swas"%toism#&terton!)jongarero',
+    '!#mcl"!s!&oadies""ba$0cco-to-insurance#$back#&oggans"$cher"#dos"$erag"$keny"%lambo$!n#&entino#\'lemache',
+    '#!o"%mduff#$elty#%inahs##kin#"pa"#ndo#"ge"#ole"(p-drawer$$hung$(priority$&roping$\'sellers$$tier',
+    '"#rba#%cello#$elli#$side#\'tellini$\'iglioni#*u&ntilde;o#$vale"\'shiyuki"$tham"%ucher%%iness%$wood#!n"\'w-truck',
+    '$&houses")xic-shock"&y-town!\'rabukos#\'ck-suit%$beds#(demarked#*ffic-light#)il-blazer%\'blazing$*n-spotting$(t&eacute#%m-car$$mels$$pers',
+    '#%ngmar$!i$$s-am%&cribes&\'ultural%%duced%#ect%$fect%!l%-mogrification%$pots#)umatising#\'vancore#\'wlerman"$eatt',
+    '%\'of-life$%house##itz#)ncherwood$\'dsetter$%gganu$"te#%swell#&thowan$%inoin#%uherz#&vaskis"\'ibunali#(choderma\'#ina',
+    '#%nitas#(ple-time%#oid$*od-mounted#$tons"!o##gus#(janowicz#\'msdalen#$ndra$!e#%opies#+phy-winning#$tman#%unson',
+    '"$ubar#(eeffects#%mpers#%ncate")ypanosoma!&sardom""do""sa"$umeb!"ua"#bed$%worms",cum&aacute;n""da#!e',
+    '"!i"$lane#\'lermeny#"um"&nberht#"de#&icates%!k#"ks#!n#%still"$pman"&rbo-67%$jets#"fy',
+    '#&n-back$#eth$$mill#%turro""sh##ser"%tchin#!e#!t!*v-watching"!p"!x!\'welfth-$)ve-furrow#*nty-dollar',
+    '(\'ourther"\'iceover##lls#%n-car%%rotor$"ky#&tchett$$tish"(o-camera&$rbon%#oat&\'mponent$#dog$&earner%\'quation',
+    '%#eaf&!g$&nature$%ounce$&parter$$toed!$ychy"#gon"!m"&perite"$ring#"us $uamh"!s!%bbink',
+    '"#haf!#dhr"$zima!)hlenhorst""mm!#ige!%krofs!\'lbricht"(cerating"#eac"$isse""la"#omi""si#(ter-born',
+    '#"or#&ra-low%$cold%$lite%$pure%!s%#vox""va"$well!\'matilla"*belliferae"!f""oa!(n-german#+thatcherite',
+    '#&lamped$&ipping#&orrupt""de$%r-11s\'"4s&"20&*determined&)performed\'&owered&(recorded%\'bidding&\'lankets%)carriages%\'feeding',
+    '%"st%#use%%woods"&employ"%green"%hitch""i-$$male##cam##mog#%print#%royal##sat#\'veristy"\'latched',
+    '"%masks""na")observant#(ccupancy"(plugging#%oetic"*saturation#$cear##eal##hod#$trap#$weet")termensch+"en%&walden',
+    '""um"#ver"!w"$zips!"oc!&p-hill#$keep"&_up_to"\'adhyaya"$cher&!s"$data",gradeability"\'holland"!n',
+    '&-middle-income"(skilling!#rba$&nising$\'technic"+du-speaking"%engoy"$idia"&odeles"!s#%uline!)s-mexican""an"$enet#\'r-based',
+    '&%ystem"#hba"!o"%tashe"!x!#tan"!m!$wgcg 3v&auml;nsterpartiet!"-6!!5!%acani$\'tioning##hes"&gliano',
+    '"%lchek#*ence-shell$#riu&!y$"ta%)udinarian##mir#$spar#+ue-shifting"%mplew$!s##uzo"#n\'t#&dalize$"en',
+    '#$ners$$otti#(quishing"\'porises&"ze"(riegatum#!r"$scar##hem#%silis$!o"%ubrun#%cluse"$zgen!"c.',
+    '"#ena"#lha#"lu#"ma"#net#!i$$amin$"se#"lo#%toris%"ux"&ratrum##coe#%meers#"na',
+    '$&occhio##tes#$vets"&st-top$#ron"&tinary""ux"#xes!"fa!"ho!"ib#&roseis"$ccei#-e-chamberlain$%regal',
+    '"*enna-based#/rwaldstattersee"#ger"&ktoria"(llanuova%"rd%&simius$)edommange"(ncentian#)e-growing$"rs#!i$(fication"-rtual-reality\'\'pagecnt',
+    '##ean##her#(ualworks"#tra##tas"#vat!(ladislaw$#mir""bi""la"#ore##tho!(me-based"\'s-based!%ocale',
+    '"(ice-mail%$mail"%lkmar$)sgerichte##ost#%tarol#&umatic##vox"%ngole"\'rderman!$reni"#ije$$heid!#tec!-ulpecul&aelig',
+    '!!x!&zglyad $w.n.""p."$v.s.!#aag""ce"%ddles""fa#$fled"-ge-dependency$$naar#$gish##win"#hed',
+    '#"id")inscotted#!s$&tbands")key-wakey#$ings"\'ldenses#%ensee$#ran#&k-outs$)ing-frame#%l-eye%%paper$$bank$"ia',
+    '#$shaw%"ok"$ndle#%ganui##ked"\'pentake##iti"+r-mongering$%paint&#rty##ham#"io#%nford$"od"\'sbrough',
+    '#&kerley##sen#)te-ground&$land")ter-horse&$line&$polo&&trough&&vapour%$foot%$hall%$leaf%%maker#"oo##tam',
+    '$#led"$ughs""y\'#\'planner!%eally#,therboarding\'%matic#(ver-bird"/dding-breakfast(#day")eding-out#"ee#(kly-paid$%night#$pies',
+    '"%icker#)gh-bridge%*t-reducing#$sner$"se"#lby##dex#!k#2l&rehy;established$+-acquainted&\'dvanced%\'chilled&(onducted\'%vered%)disguised',
+    '%)expressed%(favoured%(intended%%named%)populated%%shaft%%typed$\'amotkin$#ock"%rther#!y"$skit#$taby$#end%\'rplatte',
+    '!&ga-hrp!$haat#$lsay#%tsits"(eat-rick#*elclamping$&ziness#!r$#eto"&iddett#+g-dominated#*stleblower#(te-slave%$foot%%heads',
+    '%$more$#lam$$nall"(ole-cell##ooo!(ickenden$!y"#de-%*shouldered$+ly-accepted"+fe-murderer"$ggin&!g""ht"$iija',
+    '#$lage$&ingdon%$ston$#mer"$mmer"(nd-break%$down%$surf$&jammer$\'milling$(ow-based$%power$%smoor#$edit$\'glasses',
+    '$"co$#ham$$rave#"ix#"na##pad#(terreise$%horpe"%retap"#shy##mar##ped##son#$ting$"on',
+    '#(ch-hazel#$hall$&olding##old!"ks!#oah"%hlmut$#tat"\'lbachia#!e#&ferton$"ie""nd$\'erstuff#$gwan',
+    '$\'carvers$"sy#)l-sucking$%house#"oh"#rd-%&string$$wrap#&k-card%$life%%study%#top$)er-client$*shop-based%#ite',
+    '$&tongue#&n-down#$onin##ple#$sall"&und-up!"pg!%ragge#&p-over"\'eathing#%nwood""fe"(istbands"+ong-footing!"sc',
+    '!*t-promoter!*undercheck!$yche $x-15"(designer")radiation&\'ography!)400-based!$copy!#iao"$tong!\'oftware!$plor!&runner!\'ylocopa',
+    '!\'amamura#*moussoukro""na##ina"\'rislavl#&oslavl"%shica"$xley""zz!&eatman",llow-painted&)ish-green"%remey#%sinia""ux',
+    '!!m!%ockey"!i"%mping"\'rk-born"#ull#"ve!"ue"#kpa""li!#van +z&eacute;ro!(-station!&aghawa"$havi',
+    '"#man"\'porizha!$ech."&meckis"\'nocrate"\'phandra"%rodur##rer!#ibf"!f#\'f-davis"$nnia"#vko"&zyphus!(ondervan',
+    '"$sers"#uch!\'ukerman"-rbar&aacute;n##van',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_25 = (
+count_25 = 6694
+
+heads_25 = (
     '&aelig;lfwine',
-    '&ccaron;edok',
-    '&eacute;l&eacute;mentaire',
-    '&mdash;led',
-    '&ndash;1',
-    '&num',
-    '&oslash;ster',
-    '&scaron;umadija',
-    '\'73',
-    '\'79',
-    '\'angin\'',
-    '\'ates',
-    '\'c\'',
-    '\'eighties',
-    '\'subject',
-    '--------------------',
     '-colonel',
-    '-free',
-    '-ine',
-    '-less',
-    '-owned',
-    '-related',
-    '-see',
-    '-wa',
-    '0-6-0st',
-    '0.75p',
-    '1&frac12&ndash;3',
-    '1&frac12;-inch',
-    '1-direction',
-    '1.75p',
-    '1.9p',
-    '100-acre',
     '100-day',
-    '100-watt',
-    '100base-vg',
-    '105mm',
-    '1070s',
-    '10am-3pm',
-    '10mw',
-    '11-week',
-    '12-page',
-    '12-stone',
-    '12-track',
-    '120-day',
-    '14-',
-    '15.6p',
-    '150-year',
-    '16-point',
     '18th-',
-    '19-day',
-    '1942&ndash;3',
-    '1989-see',
-    '2&ndash',
-    '2&ndash;2&frac12',
-    '2&ndash;3ft',
-    '2-star',
-    '2-tailed',
-    '2.75p',
-    '20-point',
-    '208-pin',
-    '21-gun',
-    '21-inch',
-    '24-hours-a-day',
-    '250-mile',
     '25in',
-    '270-member',
-    '29-member',
-    '30-page',
-    '300-acre',
-    '300-member',
-    '31s',
-    '32-page',
-    '35-day',
-    '36-year',
-    '386-based',
-    '400-member',
-    '5-day',
-    '50-footer',
-    '500&ndash;1',
-    '550mm',
     '6-bit',
-    '7.25p',
-    '7100-based',
-    '737s',
-    '75-member',
-    '8-valve',
-    '80386-based',
-    '85ft',
-    '9-iron',
-    '9am-5pm',
-    '9f',
-    'a-26',
-    'a-320',
-    'a-a',
-    'a330',
-    'aa\'',
     'aacc',
-    'abbo',
-    'abbotsley',
-    'abcs',
-    'abdesselam',
-    'abdulkarim',
-    'abdurahman',
-    'abis',
-    'abrading',
-    'absconds',
-    'absu',
-    'abt',
-    'abutted',
-    'acanthaceae',
-    'accessioned',
-    'accessorise',
     'accessorised',
-    'accidentally-on-purpose',
-    'acetonitrile',
-    'acg',
-    'acha',
-    'achard',
-    'achimota',
-    'achym',
-    'acidy',
-    'aclu',
-    'acop',
-    'acrostic',
-    'acss',
-    'actifed',
-    'acucobol',
-    'adjani',
     'adjudicates',
-    'administrator-general',
-    'adventureland',
-    'aerotow',
-    'aetna',
-    'afaik',
-    'afan',
-    'afdam',
-    'afflick',
-    'affricate',
-    'affricates',
-    'afrocentrism',
-    'agates',
-    'agaw',
-    'aglionby',
-    'agri',
     'agu',
-    'ahasuerus',
-    'ahd',
-    'ahimsa',
-    'ahrens',
-    'ahsan',
-    'ahve',
-    'aidid',
-    'ainscow',
-    'ainsi',
-    'air-lock',
-    'airbed',
-    'airfares',
-    'airforces',
-    'airline-style',
-    'akar',
     'akenfield',
-    'akerman',
-    'akrokorinth',
-    'al-bakr',
-    'al-hoss',
-    'al-kaisy',
-    'alack',
-    'albarn',
-    'albergo',
-    'albrechtstrasse',
-    'aldea',
-    'aldudes',
-    'alfs',
-    'alg',
-    'aliki',
-    'alinova',
     'aliou',
-    'alker',
-    'alkynes',
-    'all-age',
-    'all-wheel',
-    'allam',
-    'allders',
-    'alleycat',
-    'alli',
-    'allibar',
-    'alloted',
-    'almain',
-    'almaviva',
-    'almay',
-    'almithak',
-    'almitrine',
     'almond-green',
-    'alo',
-    'alpenblick',
-    'alpha-amanitin',
-    'alphafetoprotein',
-    'alphameric',
-    'alpini',
-    'alsogaray',
-    'alten',
-    'altern-8',
-    'althorps',
-    'alu-pcr',
-    'alyattes',
-    'am&eacute;ricain',
-    'amada',
-    'amadeo',
     'amberjack',
-    'amberlyst',
-    'ambon',
-    'ameling',
-    'american-built',
-    'americanness',
-    'americanus',
-    'amf',
-    'ammon',
-    'ammonia-soda',
-    'amphetamine-based',
-    'amrit',
-    'amyntas',
-    'ananas',
-    'anarch',
-    'anastomosed',
     'anatolii',
-    'anchor-man',
-    'ancienne',
-    'and&mdash',
-    'and\'',
-    'andriamanjato',
-    'andromache',
-    'anesthesia',
-    'anglophilia',
-    'animal-welfare',
-    'anixter',
-    'anja',
-    'ankylosaurs',
-    'anm',
-    'annecy',
-    'annona',
     'anny',
-    'anostomus',
-    'anothers',
-    'ansr',
-    'ansty',
-    'antenne',
-    'anterograde',
-    'anthropomorphised',
-    'anti-congress',
-    'anti-defection',
-    'anti-emetic',
-    'anti-fraud',
-    'anti-gipsy',
-    'anti-immigration',
-    'anti-marxism',
-    'anti-p107',
     'anti-pluralist',
-    'anti-rat',
-    'anti-serum',
-    'anti-sexism',
-    'anti-strike',
-    'anti-terror',
-    'antibonding',
-    'anticlimactic',
-    'antillean',
-    'antiscum',
-    'antisthenes',
-    'antivirus',
-    'antiwar',
-    'any\'ow',
-    'anyfink',
-    'aouzou',
     'apostates',
-    'appaloosa',
-    'apperley',
-    'appertained',
-    'appl',
-    'aprch',
-    'aprile',
-    'apsac',
-    'apsimon',
-    'apuan',
-    'aquastar',
-    'aquitania',
-    'araucaria',
-    'arawa',
-    'arbeit',
-    'arborio',
     'arcam',
-    'arcot',
-    'arcsystem',
-    'arcuated',
-    'ardern',
-    'ardleigh',
-    'aren',
-    'argc',
-    'argentea',
-    'argie',
-    'arial',
-    'aril',
-    'aristogeiton',
-    'arizona-based',
-    'arkwrights',
-    'arm-band',
     'arm-waving',
-    'arme',
-    'armentieres',
-    'armor',
-    'armouring',
-    'arncott',
-    'arnolfini',
-    'arpino',
-    'arr&oacute;spide',
-    'arrate',
-    'arrau',
-    'artcare',
-    'arvon',
-    'ascherson',
-    'ascott',
-    'ashpole',
     'ashtiani',
-    'asikpasazade',
-    'asio',
-    'asmt',
-    'asner',
-    'aspley',
-    'assumpta',
-    'at-the-money',
-    'atabai',
-    'atchoo',
-    'atl',
-    'atlanta-based',
-    'atlanticist',
-    'atol',
-    'atossa',
-    'atropos',
     'attachmate',
-    'attainders',
-    'atween',
-    'auber',
-    'aubern',
-    'aucctu',
-    'audio-tutorial',
-    'audioline',
-    'aujourd\'hui',
-    'aul',
-    'aumann',
-    'austravel',
-    'autogiro',
-    'autotrol',
-    'autry',
-    'autumn-flowering',
     'auvers-sur-oise',
-    'avalanched',
-    'avion',
-    'avo',
-    'aw\'',
-    'away-day',
-    'awbl',
-    'axe-wielding',
-    'azande',
-    'azed',
-    'azhari',
-    'b&acirc;teau',
-    'b&amacr;rakotes',
-    'b&eacute;atrice',
-    'b\'ham',
-    'b20',
     'babied',
-    'babolat',
-    'babying',
-    'babysat',
-    'babysun',
-    'bacco',
-    'baccouche',
-    'bach-busoni',
-    'bacillary',
-    'back-garden',
-    'back-siphonage',
-    'back-to-work',
-    'back-tracking',
-    'backfiring',
-    'backflush',
-    'backsliders',
     'backstitch',
-    'backtracks',
-    'badakshan',
-    'baderini',
-    'bagendon',
-    'baha',
-    'baika',
-    'baile',
-    'bailie-depute',
-    'bailies',
-    'bajrang',
-    'baka',
-    'bale-arm',
-    'ball-and-socket',
-    'ball-winning',
-    'ballasted',
     'balletti',
-    'balli',
-    'ballinary',
-    'ballinascreen',
-    'ballycotton',
-    'ballytreabhair',
-    'balstrode',
-    'balwinder',
-    'balza',
-    'bancilhon',
-    'banesto',
-    'bangler',
-    'banktrak',
-    'banteng',
-    'bar-belle',
-    'bar-top',
     'barber-surgeon',
-    'barbiere',
-    'barclayshare',
-    'barcoding',
-    'bardolet',
-    'bardolph',
-    'barge-boarding',
-    'barlerin',
-    'barnato',
-    'barrani',
-    'barrass',
-    'barri',
-    'barrow-load',
-    'barshai',
-    'bartoncik',
-    'bashkir',
     'basisplus',
-    'bass-playing',
-    'basse',
-    'bassenthwaite',
-    'basuki',
-    'bata',
-    'batak',
-    'batelle',
-    'batneec',
-    'bau',
-    'baulig',
-    'baumann',
-    'bavins',
-    'bayadere',
-    'bayleaf',
-    'bayt',
     'be-',
-    'beana',
-    'bear-hug',
-    'bearwood',
-    'beauchamps',
-    'beauharnais',
-    'beaut&eacute',
-    'beckets',
-    'bed-hopping',
-    'bedazzled',
-    'bedizened',
-    'bedsitting-room',
-    'bedt-ttf',
-    'beebob',
-    'beechcraft',
-    'beek',
     'beets',
-    'befogged',
-    'beggary',
-    'beh',
-    'bejan',
-    'beli',
-    'belive',
-    'bell-pull',
-    'bellfield',
-    'belliustin',
-    'bellringer',
-    'belltower',
-    'belly-aching',
-    'belly-laugh',
-    'belmarsh',
-    'benedettini',
     'beningbrough',
-    'benli',
-    'benneton',
-    'beno',
-    'benredjeb',
-    'berg&eacute',
-    'bergeron',
-    'bergotte',
-    'bergs',
-    'berhtfrith',
-    'berko',
-    'berlaymont',
-    'bernardin',
-    'berol',
-    'berrington',
-    'berryfield',
     'berthelot',
-    'beschastnikh',
-    'bessborough',
-    'best-rule',
-    'beta-blocker',
-    'betinna',
-    'betweeen',
-    'bevelling',
-    'bew',
-    'bewa',
-    'bewigged',
-    'beyen',
-    'bhave',
-    'biazon',
-    'biblios',
-    'bicarb',
     'bicolor',
-    'bierkeller',
-    'bifurcates',
-    'big-bang',
-    'bights',
-    'bikini-clad',
-    'billetted',
-    'billiard-ball',
-    'bilney',
-    'bio-chemical',
-    'bio-engineering',
-    'bioethics',
-    'biofuel',
-    'biometrics',
-    'biopics',
-    'bioproducts',
     'biotherm',
-    'birchin',
-    'bismark',
-    'bit-by-bit',
-    'bitci',
-    'bitumen-based',
-    'bivouacking',
-    'blabbing',
-    'black-leather',
-    'black-tie',
-    'blackcap',
-    'blackfriar',
-    'blacklead',
-    'blackwatch',
-    'blastoid',
-    'blazered',
     'bleriot',
-    'blessin\'',
-    'bliddy',
-    'blissed',
-    'blisset',
-    'blitheman',
-    'blitzes',
-    'block-grant',
-    'blockhead',
-    'blogg',
-    'blondin',
-    'bloodheart',
-    'bloodsucking',
-    'blougram',
-    'blowflies',
-    'bls',
     'blubbing',
-    'blue-water',
-    'blueman',
-    'blundstone',
-    'blunt-ended',
-    'bmiss',
-    'boatbuilding',
-    'boavista',
-    'bobbio',
-    'bodoni',
-    'body-image',
-    'bodycare',
-    'bodyshop',
-    'bohem',
-    'bolivianos',
-    'bollin',
     'bollocksed',
-    'bombe',
-    'bombload',
-    'bonanzas',
-    'bonatti',
-    'bondholding',
-    'bone-crunching',
-    'bone-setter',
-    'bonita',
-    'bonneted',
-    'bonomi',
-    'bontcho',
-    'boohaker',
-    'book-learning',
-    'book-publishing',
-    'book-to-bill',
     'bookmatched',
-    'boomerangs',
-    'boore',
-    'bootlegged',
-    'bops',
-    'borb&oacute;n',
-    'bordah',
-    'borgias',
-    'borough-wide',
-    'boroughmongers',
-    'botallack',
-    'bots',
-    'bottle-top',
-    'bottlenecking',
-    'boubaker',
-    'bouchet',
     'boue',
-    'bouguereau',
-    'bourdichon',
-    'bouvier',
-    'bove',
-    'bowfin',
-    'bowmaker',
-    'box-car',
-    'box-room',
-    'boxfish',
-    'bpeo',
-    'braby',
-    'brache',
-    'bradleys',
-    'bradlow',
-    'brafman',
     'brahm',
-    'brahmans',
-    'brancacci',
-    'brandoni',
-    'bratseth',
-    'brauner',
-    'braunston',
-    'braziliense',
-    'bread-knife',
-    'bread-winner',
-    'breakfast/dining',
-    'breeze-block',
-    'bres',
-    'brickbat',
-    'bridgett',
-    'brimpsfield',
     'brisa',
-    'brith',
-    'broad-',
-    'brocken',
-    'brockman',
-    'brokering',
-    'bronze-medal',
-    'brothel-keeper',
-    'brouage',
-    'browbone',
-    'brownsett',
-    'brownshirts',
-    'broxhead',
-    'brugnoni',
-    'bruguera',
-    'bruichladdich',
     'brune',
-    'brunhoff',
-    'brush-stroke',
-    'brylcream',
-    'brynamlwg',
-    'bsg',
-    'bte',
-    'bubbleshake',
-    'bucco',
-    'buckbarrow',
-    'buckenham',
-    'buddeke',
-    'budden',
-    'budmouth',
-    'budworm',
-    'buin',
     'bulgy',
-    'bull-fighting',
-    'bull-leaper',
-    'bumbles',
-    'bunyip',
-    'burghes',
-    'burghill',
-    'burglar-alarm',
-    'burgo',
-    'burks',
-    'burnand',
-    'burne',
-    'burnie',
-    'burnin\'',
-    'bursate',
-    'burson',
     'burzoi',
-    'bus-shelter',
-    'bushing',
-    'busked',
-    'but&mdash',
-    'but\'',
-    'butser',
-    'butterfish',
-    'buttermen',
-    'buttimore',
-    'bux',
-    'bwana',
-    'byran',
-    'byss',
-    'c&mdash;s',
-    'c-cap',
     'c22&ndash;3',
-    'cab-rank',
-    'cabez&oacute;n',
-    'cabine',
-    'cadds',
-    'caenorhabditis',
-    'cafe-style',
-    'cafs',
-    'cagr',
-    'cailleach',
-    'cailliet',
-    'caisteal',
-    'cakobau',
-    'calceolaria',
-    'caledonides',
-    'call-beam',
     'calliope',
-    'callsign',
-    'calmodulin-binding',
-    'calyx-krater',
-    'camargo',
-    'cambon',
-    'campanian',
-    'canal-side',
-    'canasta',
-    'canby',
-    'candle-snuffer',
-    'canion',
-    'cannon-fire',
-    'cannonading',
-    'canonise',
-    'capac',
     'capital-rationing',
-    'capitale',
-    'capitulary',
-    'car-ownership',
-    'carabiniere',
-    'carasco',
-    'carbon-12',
-    'carbonnade',
-    'card-players',
-    'careened',
-    'caringolat',
-    'carlot',
-    'carnmore',
-    'carolines',
-    'carrol',
-    'carronade',
     'carwash',
-    'casal',
-    'case-based',
-    'cash-register',
-    'cassese',
-    'cassoulet',
-    'castle-building',
-    'catalpa',
-    'catalyzed',
-    'catching-up',
-    'catchpool',
-    'caterplan',
-    'caterwaul',
-    'cathail',
-    'catkin',
-    'catnip',
     'cator',
-    'catteau',
-    'cauli',
-    'caulked',
-    'cauterize',
-    'cavalletto',
-    'cayetano',
-    'cc-m2',
-    'cebs',
-    'celandine',
-    'cellinis',
-    'celtics',
-    'centre-section',
-    'centrecourt',
-    'ceph',
-    'cerveteri',
     'cewtec',
-    'ceyhan',
-    'ch&acirc;telet',
-    'chabertia',
-    'chaco',
-    'chagas',
-    'chailey',
-    'chain-driven',
-    'chainbelt',
-    'chalybeate',
-    'chambon',
-    'chamfers',
-    'champerty',
-    'champetre',
-    'champlain',
-    'chapelton',
     'charbonni&egrave;re',
-    'chargehands',
-    'charmian',
-    'chart-room',
-    'chaumes',
-    'chauncys',
-    'chaz',
-    'chelys',
-    'chemical-free',
-    'chemiosmotic',
-    'chemoxy',
-    'cheong',
-    'chester-based',
-    'chevreul',
-    'chicka',
-    'chicken-feed',
     'chickenfeed',
-    'chihuahuas',
-    'child-free',
-    'child-safe',
-    'china-clay',
-    'chinstrap',
-    'chipcom',
-    'chippewa',
-    'chironomid',
-    'chlorohydra',
-    'chlorus',
-    'choc-ice',
-    'choisya',
-    'choonhavan',
-    'chop-house',
-    'choppin',
     'choreographing',
-    'choukeir',
-    'choy',
-    'christ-child',
-    'chromatographed',
-    'chrysanthus',
-    'chukar',
-    'chukchi',
-    'chumbawamba',
-    'churkin',
-    'churruca',
-    'ciae',
-    'ciano',
-    'ciav',
-    'cilss',
-    'cimflex',
     'cinco',
-    'cinefantastique',
-    'cinquefoil',
-    'circumscribes',
-    'cirv',
-    'cis-acting',
-    'cisalpine',
-    'ciss&eacute',
-    'cisternae',
-    'citroens',
-    'citydesk',
-    'citywatch',
-    'civilianised',
-    'cl&eacute;risseau',
-    'clai',
-    'clao',
     'class-mark',
-    'clausthaler',
-    'clearblue',
-    'cleddau',
-    'cleghorn',
-    'clericis',
-    'clerihew',
-    'clews',
-    'clientpak',
-    'cliff-edge',
-    'cliffed',
-    'clippety',
-    'clock-making',
-    'clock-shifted',
-    'clodion',
-    'clomp',
     'clomping',
-    'clonidine',
-    'clooney',
-    'close-down',
-    'close-quarter',
-    'cloud-cuckoo',
-    'clouet',
-    'clouston',
-    'clouts',
-    'clubby',
-    'clubgoers',
-    'clytie',
-    'cnicht',
-    'cnid',
-    'cnx',
-    'co-adapted',
     'co-ed',
-    'co-habiting',
-    'co-located',
-    'co-prosperity',
-    'co-respondent',
-    'coachbuilder',
-    'coagulates',
-    'coal-carrying',
-    'coal-cutting',
-    'coal-effect',
-    'coal-miner',
-    'coastwatch',
-    'cobber',
-    'cobles',
-    'cockling',
-    'cockup',
     'cocodamol',
-    'codebreaker',
-    'cof',
-    'coffee-machine',
-    'coffee-maker',
-    'coffee-room',
-    'coffin\'',
-    'cognizant',
-    'coiffures',
-    'coketown',
-    'colca',
-    'cold-bloodedness',
-    'colegio',
-    'colgrave',
-    'collectanea',
-    'colombey',
     'colonaise',
-    'colonna',
-    'colthurst',
-    'comart',
-    'combi-steaming',
-    'combust',
-    'come-down',
-    'comigrated',
-    'commendatore',
-    'commercial-bank',
-    'comming',
-    'commited',
-    'compacting',
-    'composing-room',
-    'compounders',
-    'compter',
     'computer-linked',
-    'concepci&oacute;n',
-    'concept-based',
-    'concho-spiral',
-    'condicote',
-    'condign',
-    'condyloma',
-    'confectionary',
-    'confindustria',
-    'confit',
-    'cons.',
-    'conservers',
-    'constans',
-    'constitutionum',
-    'constraint-based',
-    'context-based',
     'contorta',
-    'contorts',
-    'contra-indication',
-    'convect',
-    'conversation-stopper',
-    'cooper-key',
-    'copers',
-    'copper-working',
-    'coppertone',
-    'corday',
-    'cordery',
-    'corian',
-    'cork-based',
-    'corkin',
-    'corne',
-    'cornemuse',
     'corrin',
-    'corstopitum',
-    'coruscating',
-    'corydalis',
-    'coss',
-    'cost-sharing',
-    'cotinus',
-    'cotton-mill',
-    'couchant',
-    'coucher',
-    'couldny',
-    'counter-clockwise',
-    'countershading',
-    'coupole',
-    'course-based',
-    'course-module',
     'coxall',
-    'crabface',
-    'crack-down',
-    'cradle-snatching',
-    'crafter',
-    'crams',
-    'crashers',
-    'cravens',
-    'crayoned',
-    'cream-filled',
-    'creator-man',
-    'creaturely',
-    'credit-broker',
-    'creditmen',
-    'creditscan',
-    'cremant',
     'cremating',
-    'creole-speaking',
-    'crepinet',
-    'crib-biting',
-    'cricked',
-    'crimpers',
-    'crinoidea',
-    'crisscrossing',
-    'cristie',
-    'critisised',
-    'croma',
-    'cronica',
-    'cronstadt',
-    'cropnose',
-    'cross-bow',
-    'cross-examines',
     'cross-hatch',
-    'cross-industry',
-    'cross-license',
-    'cross-react',
-    'cross-sector',
-    'cross-selling',
-    'crowd-puller',
-    'crude-oil',
-    'crummack',
-    'cseu',
-    'cson',
-    'cta',
-    'cubits',
-    'cucchi',
-    'cudgelled',
-    'cuiab&aacute',
     'cumbered',
-    'cumbre',
-    'cummin',
-    'cupplewaite',
-    'curator-in-chief',
-    'curgenven',
-    'curiosa',
-    'curr',
-    'currabinny',
-    'currane',
-    'curtseying',
-    'curtsying',
-    'customerq',
-    'cvh',
-    'cvo',
-    'cycle-length',
     'cyclopaedia',
-    'cynthio',
-    'cytogenetics',
-    'czech-born',
-    'd&iacute;as',
-    'd\'amore',
-    'd-mannose',
-    'd.i.y.',
-    'dacs',
-    'dadabhai',
-    'dalesmen',
-    'dam-building',
-    'damascene',
-    'damjanovic',
-    'damselfish',
-    'dance-band',
     'dancewear',
-    'danke',
-    'danseuse',
-    'darrow',
-    'dasher',
-    'databasing',
-    'dataloggers',
-    'datta',
-    'dau',
-    'dauphinoise',
-    'dav',
-    'davern',
-    'davidia',
-    'davidman',
-    'davni',
-    'dawber',
     'day-night',
-    'daylighting',
-    'dco',
-    'dd-10',
-    'ddyfi',
-    'de\'medici',
-    'de-briefing',
-    'de-clawing',
-    'de-emphasized',
-    'de-rigging',
-    'dead-headed',
-    'deadbait',
-    'deaf-mute',
-    'deaux',
-    'debugged',
-    'dechlorinated',
     'declassed',
-    'decom',
-    'decongestant',
-    'decontaminating',
-    'decoupage',
-    'decval',
-    'deejaying',
-    'deeply-cut',
-    'deepset',
-    'deerbolt',
-    'deerhunter',
-    'defaecate',
-    'defamiliarized',
-    'deficit-cutting',
-    'deflates',
-    'defrenne',
     'degree-awarding',
-    'deighan',
-    'deinomenes',
-    'deionized',
-    'deland',
-    'delco',
-    'delibes',
-    'delrosa',
-    'deltics',
-    'demande',
-    'dematerialised',
-    'demdykes',
-    'democritean',
-    'demogorgon',
-    'demonised',
-    'demythologising',
     'dendrocopos',
-    'denetting',
-    'dengist',
-    'densan',
-    'dentil',
-    'depersonalizing',
-    'depreciates',
-    'deram',
-    'derbi',
-    'deregistered',
-    'derg',
-    'dermavate',
-    'derricks',
-    'derring',
-    'derris',
-    'desaparecidos',
     'descamps',
-    'desertas',
-    'desfoutue',
-    'designer-label',
-    'deskwork',
-    'dessy',
-    'destruct',
-    'detuning',
-    'deutschherrenhaus',
-    'devilling',
-    'dewatering',
-    'dexion',
-    'dharmowtee',
-    'dhe',
-    'dhrystone',
-    'diabolo',
     'dial-access',
-    'dialect-divergent',
-    'dialogo',
-    'diazo',
-    'dicentra',
-    'dichotomised',
-    'dichotomized',
-    'dicitratobismuthate',
-    'dickering',
-    'dickory',
-    'didny',
-    'dieffenbachia',
-    'diemberger',
-    'diet-related',
-    'diffract',
-    'digi',
     'diller',
-    'dillinger',
-    'dindisc',
-    'dinefwr',
-    'dingbats',
-    'dining-hall',
-    'dinning',
-    'dinos',
-    'dinosauria',
-    'dipad',
-    'diplomate',
-    'direct-mail',
-    'direction-finder',
-    'disarrayed',
-    'disarticulated',
-    'discofilm',
     'discours',
-    'diskcopy',
-    'dismasted',
-    'disobliging',
-    'dispreferred',
-    'disquisitiones',
-    'dissatisfying',
-    'dissimulating',
-    'dissing',
-    'distance-learning',
-    'divisionalized',
-    'divvied',
-    'djin',
-    'doce',
-    'docksill',
-    'docteur',
     'dodders',
-    'doesn',
-    'dog-fight',
-    'dog-food',
-    'dolichenus',
-    'dolorosa',
-    'dominick',
-    'domobranci',
-    'donana',
-    'doodle-bug',
-    'doot',
-    'dorfman',
-    'dormition',
-    'dormobiles',
-    'dormy',
-    'dorsi',
     'dossed',
-    'double-entendre',
-    'doublespeak',
-    'douches',
-    'douching',
-    'doughs',
-    'douk',
-    'down-hill',
-    'dpq',
-    'draconis',
-    'drafix',
-    'draggled',
-    'dragonara',
-    'draught-proof',
-    'drava',
-    'dreadlock',
     'dress-sense',
-    'dressing-down',
-    'drewery',
-    'drexler',
-    'drilon',
-    'dros',
-    'drought-ridden',
-    'droving',
-    'drownded',
-    'drowse',
-    'drum-roll',
-    'drv',
-    'dryburn',
-    'drying-up',
-    'dstsp',
-    'dtacs',
     'dual-route',
-    'duao',
-    'duathlon',
-    'dubar',
-    'duch',
-    'duck-down',
-    'dudman',
-    'duellist',
-    'duffil',
-    'duh',
-    'duhalde',
-    'dulais',
-    'dumitrescu',
-    'dunghills',
-    'dunnet',
-    'dunnit',
     'dunya',
-    'dupea',
-    'durafour',
-    'durfort',
-    'durno',
-    'dwelly',
-    'dyking',
-    'dynamight',
-    'dynamike',
-    'dynamique',
-    'dynamited',
-    'dynatech',
-    'dzhungar',
-    'dzos',
-    'e10',
-    'e14',
     'ean',
-    'earthlets',
-    'easoe',
-    'east-north-east',
-    'easy-care',
-    'easy-to-assemble',
-    'ebb-tide',
-    'ebc',
-    'ebroin',
-    'ecce',
-    'echo-chamber',
-    'echolocating',
-    'ecma',
-    'econo',
-    'economica',
-    'economics-based',
     'economized',
-    'ectf',
-    'ecurie',
-    'ed-din',
-    'edding',
-    'eddoe',
-    'edenhall',
-    'edgardo',
-    'edit-in',
-    'ednyfed',
-    'eds-gfi',
-    'eds-scicon',
-    'edwardian-style',
-    'edy',
-    'eekelaar',
-    'efan',
     'efqm',
-    'efs',
-    'efti',
-    'egad',
-    'egg-shell',
-    'egg-yolk',
-    'eggars',
-    'eggstone',
-    'eggstravaganza',
-    'ego-psychology',
-    'ego-strengthening',
-    'ehe',
-    'einer',
-    'einion',
-    'eitan',
-    'eiug',
     'ekeko',
-    'ektron',
-    'elate',
-    'elbow-length',
-    'eleison',
-    'elina',
-    'elli',
-    'eloff',
-    'elohim',
-    'eloisa',
-    'elserino',
-    'elsfield',
-    'elsley',
-    'eltec',
-    'elvan',
-    'embarassed',
     'embowered',
-    'emend',
-    'emer',
-    'emeruwa',
-    'emigrates',
-    'emory',
-    'emulsified',
-    'enb',
-    'encarsia',
-    'encoffined',
-    'encroaches',
-    'end-1989',
-    'end-of-word',
-    'ende',
-    'endnote',
-    'enfin',
     'eng-2',
-    'engag&eacute',
-    'englande',
-    'englische',
-    'english-trained',
-    'english-type',
-    'engrailed',
-    'enlil',
-    'enquiry-based',
-    'entity-identification',
-    'epcc',
-    'epdm',
-    'era-wacc',
-    'erat',
-    'erf',
-    'ergasilus',
     'eridani',
-    'ernact',
-    'erth',
-    'esb',
-    'escalopes',
-    'escourt',
-    'esman',
-    'esn(s)',
-    'espada',
-    'esperanza',
-    'espinasse',
-    'espinear',
-    'espirito',
-    'esquivat',
-    'essc',
-    'esterase',
     'estima',
-    'estrith',
-    'etc-',
-    'etchegaray',
-    'eternit',
-    'etherexpress',
-    'ethnics',
-    'etrangers',
-    'etuc',
-    'euhedral',
-    'euro-fighter',
-    'euroclass',
-    'eurocom',
-    'eurocontrol',
-    'european-made',
-    'euroyen',
     'evaders',
-    'eveline',
-    'everthing',
-    'everyfing',
-    'everyones',
-    'evi',
-    'evm',
-    'ewert',
-    'ews',
-    'ex-ambassador',
-    'ex-enemy',
-    'ex-fianc&eacute',
-    'ex-french',
-    'ex-mayor',
-    'ex-priest',
-    'ex-smoker',
     'exabyte',
-    'exampled',
-    'excell',
-    'excelsa',
-    'explanted',
-    'expotel',
-    'expunging',
-    'extemporised',
-    'extended-reach',
-    'externalize',
-    'eyewear',
-    'eyot',
-    'eyup',
-    'f&eacute;licit&eacute',
-    'f-104',
-    'f-f',
     'f.h.',
-    'f11',
-    'face-mask',
-    'face-pack',
-    'face-saver',
-    'facelifted',
-    'factorises',
-    'factory-produced',
-    'faddiness',
-    'fader',
-    'fagioli',
-    'fainlight',
-    'falashas',
-    'falck',
-    'falkingham',
-    'falled',
     'falotti',
-    'familiares',
-    'family-tree',
-    'famine-hit',
-    'fan-club',
-    'fanie',
-    'fanta',
-    'fantasyland',
-    'fanti',
-    'fany',
-    'faridabad',
-    'fariz',
-    'farrowed',
-    'farrs',
-    'fast-developing',
-    'fast-lane',
     'fasti',
-    'fat-cat',
-    'fatale',
-    'fauns',
-    'fbu',
-    'feart',
-    'feasant',
-    'feather-bedding',
-    'fecma',
-    'felco',
-    'felspar',
-    'feltrim',
-    'felty',
-    'femurs',
-    'fenestral',
-    'fenice',
     'feria',
-    'fernan',
-    'fernhurst',
-    'feroza',
-    'ferrars',
-    'fetishized',
-    'fets',
-    'fever-pitch',
-    'ffyona',
-    'figee',
-    'figure-work',
-    'filaret',
-    'filling-station',
-    'filmgoers',
-    'fimrite',
-    'finca',
     'fine-cut',
-    'fine-mesh',
-    'fingerpost',
-    'finiver',
-    'fiordiligi',
-    'fire-eating',
-    'fire-raising',
-    'firemaster',
-    'firewalls',
-    'firmenich',
-    'firmian',
-    'firty',
-    'fiterman',
-    'fitting-room',
-    'five-acre',
-    'five-sided',
     'flagellates',
-    'flamb&eacute',
-    'flarepath',
-    'flat-faced',
-    'flat-lying',
-    'flatpattern',
-    'flavonia',
-    'flavour-of-the-month',
-    'fleetway',
-    'flexibles',
-    'flg',
-    'flibbertigibbet',
-    'floe',
-    'flood-tide',
-    'floodtide',
-    'floor-covering',
     'flossy',
-    'flow-rate',
-    'flue-gas',
-    'fluked',
-    'flunk',
-    'fly-paper',
-    'flyes',
-    'fntt',
-    'foel',
-    'fokkers',
-    'fold-down',
-    'folded-over',
-    'fondues',
-    'fontevraud',
-    'food-poisoning',
-    'foot-controller',
     'foot-dragging',
-    'foot-rot',
-    'foothill',
-    'foppington',
-    'for\'',
-    'foran',
-    'fordington',
-    'forgemasters',
-    'form\'',
-    'formate',
-    'forncett',
-    'fosses',
-    'foulmouthed',
-    'foundation-laying',
-    'four-digit',
-    'four-quadrant',
     'four-set',
-    'four-swastika',
-    'foure',
-    'fourgen',
-    'fouts',
-    'foxtrots',
-    'foyly',
-    'framboise',
-    'francaises',
-    'francisca',
-    'fraternized',
-    'fratter',
-    'freedom-fighter',
-    'freedom-loving',
-    'freikorps',
-    'fresh-cut',
     'fresson',
-    'frigidaire',
-    'fritillary',
-    'froggie',
-    'frolinat',
-    'front-wheel-drive',
-    'froths',
-    'fruit-juice',
-    'fss',
-    'fujiwara',
-    'full-range',
-    'full-up',
-    'fullsail',
-    'fully-paid',
-    'fumigating',
-    'fun-fair',
     'fun-lover',
-    'funbreaks',
-    'fungused',
-    'funpark',
-    'fur-bearing',
-    'furniture-making',
-    'further-reaching',
-    'furtwangler',
-    'fusses',
-    'fuzzed',
-    'fuzzytech',
-    'fwancis',
-    'fynes',
-    'g&eacute;ographie',
-    'g-10',
-    'g-3',
     'g.m.b.h',
-    'gabbidon',
-    'gable-end',
-    'gach',
-    'gaffed',
-    'galacvid',
-    'galatia',
-    'galc',
-    'galette',
-    'gallini',
-    'gambrinus',
-    'gamps',
-    'ganol',
-    'garcete',
-    'gardez',
-    'gardom',
     'garrigue',
-    'gas-bag',
-    'gas-burning',
-    'gas-light',
-    'gasmasks',
-    'gateshead-based',
-    'gateskill',
-    'gatti',
-    'gau',
-    'gaudier',
-    'gayfield',
-    'gazetteers',
-    'gbedemah',
-    'gdlyan',
-    'gear-change',
-    'gear-stick',
     'geeks',
-    'geh',
-    'gelt',
-    'genc',
-    'generation-gap',
-    'genevan',
-    'genk',
-    'georgian-style',
-    'german-language',
-    'germinates',
-    'gershtein',
-    'gertrud',
-    'gervasutti',
-    'gesang',
-    'getronics',
-    'gheluvelt',
     'giang',
-    'gias',
-    'giddings',
-    'giglio',
-    'gign',
-    'gilboy',
-    'gilligrew',
-    'gillows',
-    'gillyanne',
-    'giner',
-    'ginette',
-    'gingered',
-    'ginguene',
-    'gio',
-    'giovan',
-    'gip',
     'glackens',
-    'glancy',
-    'glanrhyd',
-    'glassmaking',
-    'glasspaper',
-    'glastyn',
-    'glaux',
-    'gled',
-    'glendenning',
-    'glenelly',
-    'glissandi',
-    'glo',
-    'gloriosa',
-    'glowers',
-    'glowworm',
-    'glr',
     'glt',
-    'glubbdubdrib',
-    'gluhwein',
-    'gm-csf',
-    'gn&auml;dige',
-    'goalkicking',
-    'goar',
-    'god-man',
-    'gododdin',
-    'godstow',
-    'goe',
-    'goest',
-    'gold-rush',
-    'golden-eye',
-    'goldrush',
-    'gomis',
     'good\'',
-    'goose-girl',
-    'gooseflesh',
-    'gorig&amacr;u',
-    'goshiki',
-    'gosstandard',
-    'gothic-style',
-    'goudimel',
-    'gourmand',
-    'government-guaranteed',
-    'government-issue',
-    'gozzoli',
-    'gr&uuml;nert',
-    'gr.',
-    'graduate-level',
-    'graining',
     'granados',
-    'grand-prix',
-    'granovetter',
-    'graphics-based',
-    'grasset',
-    'gratia',
-    'gratias',
-    'graying',
-    'green-blue',
-    'green-house',
-    'greenhoff',
-    'greenish-brown',
-    'greshornish',
-    'grif',
-    'grillo',
-    'grindcore',
     'griped',
-    'grisone',
-    'grollet',
-    'ground-clearing',
-    'ground-cover',
-    'groundsheets',
-    'grouses',
-    'grrrr',
-    'grudgers',
-    'grumps',
-    'grunert',
-    'gruppe',
-    'gsni',
-    'guanacaste',
-    'guanine-nucleotide',
-    'guarani',
     'gubec',
-    'guelder',
-    'guernseys',
-    'guilt-offering',
-    'guinea-fowl',
-    'guizhou',
-    'gujurati',
-    'gullah',
-    'gumbaridze',
-    'gumnut',
-    'gun-battle',
-    'gurk',
-    'guzzi',
-    'gwyther',
-    'gylby',
-    'h-reg',
     'ha-',
-    'ha-2',
-    'habe',
-    'had_a',
-    'hadash',
-    'hade',
-    'hadjerai',
-    'haefliger',
-    'hainge',
-    'hakem',
-    'haksar',
-    'half-believed',
-    'half-cut',
-    'half-drawn',
-    'half-graben',
-    'half-metre',
     'half-woman',
-    'halfwits',
-    'haliakmon',
-    'halket',
-    'hamada',
-    'hammerite',
-    'hammerman',
-    'hance',
-    'hand-cream',
-    'hand-set',
-    'hand-sewing',
-    'handjobs',
-    'hanford',
-    'hangout',
-    'hard-liner',
-    'hard-looking',
     'hard-riding',
-    'hard-rock',
-    'hard-running',
-    'hardbacked',
-    'hardee',
-    'hardware-software',
-    'harpic',
-    'harrer',
-    'harrigan',
-    'hartsdown',
-    'harum-scarum',
-    'hashem',
-    'haslet',
-    'hassy',
-    'hatchet-faced',
-    'hauberks',
     'haud',
-    'haveing',
-    'havelange',
-    'hawtree',
-    'haye',
-    'haygarth',
-    'hazing',
-    'hcmap',
-    'hdra',
-    'he\'e',
-    'head-counting',
-    'head-to-toe',
-    'head-turner',
-    'headcleaner',
-    'headleands',
-    'hearth-rug',
     'hearth-stone',
-    'heartsease',
-    'heat-shock',
-    'heather-clad',
-    'heavey',
-    'hedge-laying',
-    'hehe',
-    'heinrichsmeyer',
-    'held-back',
-    'helfer',
-    'helfet',
-    'helicon',
-    'hell-for-leather',
-    'hell-raising',
-    'hellbound',
-    'hellenised',
     'hellingborough',
-    'helmund',
-    'hema',
-    'henan',
-    'hendred',
-    'hensen',
-    'hepper',
-    'herakleides',
-    'herborising',
-    'heredia',
-    'hershman',
-    'hert',
-    'hesh',
-    'hexapol',
-    'hezza',
-    'hgo',
     'hi-jack',
-    'hiccoughing',
-    'hide-outs',
-    'hideyoshi',
-    'higgin',
-    'higgle-piggle',
-    'high-caste',
-    'high-inflation',
-    'high-riding',
-    'high-wage',
-    'higher-risk',
-    'hil',
-    'hill-side',
-    'hill-slope',
-    'hillbark',
-    'himantopus',
     'hing',
-    'hinkin',
-    'hinxton',
-    'hispanic-american',
-    'historicize',
-    'hitchhike',
-    'hitzig',
-    'hkrfu',
-    'hla-b51',
-    'hla-b8',
-    'hla-dr3',
-    'hmph',
-    'hnu',
-    'hoares',
-    'hob-nob',
-    'hobnails',
     'hocbul',
-    'hoddom',
-    'hofer',
-    'hoffert',
-    'holbeche',
-    'holdstock',
-    'holdups',
-    'hole-nesting',
-    'holmdel',
-    'holophonics',
-    'holzer',
-    'home-work',
-    'homefire',
-    'homesteading',
-    'homstat',
-    'honan',
     'honey-bee',
-    'honore',
-    'hoorah',
-    'horam',
-    'horby',
-    'hore',
-    'horfield',
-    'hornpipes',
-    'horse-chestnut',
-    'horse-rider',
-    'horse-thief',
-    'horseshit',
-    'horsetrading',
-    'horsewatch',
-    'horsewhip',
-    'hort',
     'hot-footed',
-    'hot-key',
-    'hot-metal',
-    'household-based',
-    'househunting',
-    'houshiary',
-    'houstoun',
-    'hovermarine',
-    'howat',
-    'howth',
-    'hu-25a',
-    'hugger',
-    'humaine',
-    'hurdiss',
-    'hushes',
-    'husker',
     'hx',
-    'hydrating',
-    'hydri',
-    'hydrogeochemical',
-    'hydrophones',
-    'hyla',
-    'hymn-singing',
-    'hyperhead',
-    'hyster',
-    'i&ndash',
-    'iad',
-    'iamb',
-    'ibisys',
-    'icam-2',
-    'ice-man',
-    'iceman',
     'icfc',
-    'icklingham',
-    'icy-cold',
-    'if-',
-    'ifat',
-    'iftikhar',
-    'igd',
-    'ihc',
-    'iiin',
-    'ijf',
-    'ileana',
-    'ill-designed',
-    'ill-kempt',
-    'ill-placed',
-    'ill-planned',
-    'ill-repute',
     'ill-thought',
-    'illert',
-    'illuminati',
-    'ilopango',
-    'ilt',
-    'image-based',
-    'image-forming',
-    'immunotech',
-    'imnaha',
-    'imp&eacute;riale',
-    'impastoed',
-    'imploding',
-    'in-cab',
-    'in-country',
-    'in-keeping',
-    'inacom',
     'inaros',
-    'inax',
-    'incentive-based',
-    'incising',
-    'inclosed',
-    'inconveniencing',
-    'indecs',
-    'indescon',
-    'indesit',
-    'individualizing',
-    'indorsed',
-    'indri',
-    'indurate',
-    'industry-led',
-    'infolded',
-    'infosheets',
     'infy',
-    'ingushis',
-    'inishturk',
-    'inl&eacute',
-    'inn-yard',
-    'input-specificity',
-    'inscribes',
-    'insect-eating',
-    'insein',
-    'insider-dealing',
-    'instrument-making',
-    'intal',
-    'intelliserver',
-    'inter-clan',
-    'inter-counties',
-    'interchain',
     'interiorized',
-    'interleaving',
-    'interleukin-8',
-    'intermeshed',
-    'intermix',
-    'interpellated',
-    'interplanted',
-    'interq',
-    'interspaced',
-    'intervet',
-    'interworking',
-    'intoxicant',
-    'intrenched',
-    'intubated',
-    'inveresk',
-    'inverness-based',
     'ione',
-    'ionica',
-    'iopcf',
-    'ipl',
-    'ippf',
-    'ippon',
-    'ippr',
-    'ipse',
-    'ipsum',
-    'ipswich-based',
-    'ird',
-    'ireshopeburn',
-    'iridomyrmex',
-    'irigoyen',
-    'irised',
-    'irmtraut',
     'irrationalist',
-    'isethionate',
-    'islamiya',
-    'ismaili',
-    'isoamylase',
-    'isopods',
-    'israeli-arab',
-    'italian-based',
-    'italian-made',
-    'italienne',
-    'itco',
-    'ivis',
-    'ivorien',
-    'iwf',
-    'iy',
-    'izu',
     'j-cloth',
-    'jacketed',
-    'jadey',
-    'jak',
-    'jaleo',
-    'jam-jar',
-    'jam-making',
-    'jambalaya',
-    'jamestown',
-    'jang',
-    'japanese-made',
-    'jari',
-    'jarol',
-    'jarry',
-    'jaw-line',
-    'jazeel',
     'jba',
-    'jec',
-    'jeet',
-    'jeh',
-    'jenkinses',
-    'jenson',
-    'jequetepeque',
-    'jet&eacute;s',
-    'jewtown',
-    'jf1-23b13',
-    'jiaqi',
-    'jing',
-    'jknlf',
-    'joakim',
-    'job-creating',
-    'joggle',
     'john\'',
-    'joisted',
-    'joke-shop',
-    'jokhang',
-    'jolen',
-    'jolies',
-    'jollying',
-    'jongert',
-    'jordanova',
-    'jovo',
-    'jra',
-    'judaica',
-    'jumble-sale',
-    'jungmann',
-    'junod',
-    'juris',
     'jurkans',
-    'justicz',
-    'jusuf',
-    'k&ouml;ln',
-    'k-12',
-    'kadiatu',
-    'kaiserstrasse',
-    'kakilashvili',
-    'kalbarri',
-    'kalff',
-    'kalmykia',
-    'kalpana',
-    'kamrok',
-    'kander',
-    'kangwane',
-    'kann',
     'kansai',
-    'kaprow',
-    'karja',
-    'karon',
-    'karpathos',
-    'karpin',
-    'karyotypes',
-    'kass',
-    'katzman',
-    'kazador',
-    'kazoo',
-    'kcvo',
-    'keadby',
-    'keiki',
-    'keine',
-    'kellet',
     'kelsang',
-    'kempinski',
-    'kemptown',
-    'kendler',
-    'kenmare',
-    'kennecott',
-    'kenolty',
-    'keos',
-    'kerikeri',
-    'kerlin',
-    'kesrouan',
-    'kewal',
-    'kewill',
-    'keyb',
-    'keyline',
-    'keylock',
     'keystage',
-    'khadi',
-    'khang',
-    'khatun',
-    'khaur',
-    'khepri',
-    'khristo',
-    'kiang',
-    'kieslowki',
-    'kiffin',
-    'kii',
-    'kikkoman',
-    'killynure',
-    'kilobase',
-    'kilobyte',
-    'kilowatt-hour',
     'kilroot',
-    'kiplin',
-    'kiplingcotes',
-    'kirklevington',
-    'kirtana',
-    'kis',
-    'kitchings',
-    'kitkat',
-    'kitschy',
-    'kittle',
-    'klebbich',
-    'klepper',
-    'knackering',
-    'knepp',
-    'knife-edged',
-    'knife-throwing',
     'knight-errant',
-    'knip',
-    'knittin\'',
-    'knocknarea',
-    'know-',
-    'koban',
-    'kobayashi',
-    'kod',
-    'kohaku',
-    'koi-keeper',
-    'kojo',
-    'kold',
-    'kolwezi',
-    'komoto',
-    'kondo',
-    'kone',
     'koopa',
-    'koor',
-    'kordofan',
-    'koriyama',
-    'kork',
-    'koro',
-    'kosice',
-    'kosovar',
-    'koss',
-    'kost',
-    'kot',
-    'kraljevi&cacute',
-    'kramarae',
-    'kratzman',
-    'kriegsmarine',
-    'kroger',
     'krook',
-    'krygier',
-    'kua',
-    'kukkay',
-    'kune',
-    'kur',
-    'kurier',
-    'kuriles',
-    'kursell',
-    'kusaal',
-    'kutaisi',
-    'kuttner',
-    'kveim',
-    'kx-p1124i',
-    'l&uacute;der',
-    'l\'ancienne',
     'l\'empire',
-    'l\'oeuvre',
-    'l\'ordre',
-    'l-fields',
-    'la-di-da',
-    'laa',
-    'labone',
-    'laboulbenia',
-    'lacona',
-    'lacrimae',
-    'ladino',
-    'laffont',
-    'lafite',
-    'laide',
-    'lairgs',
-    'laissez',
     'laithe',
-    'lakeshore',
-    'lakshadweep',
-    'lamp-lit',
-    'lampholder',
-    'lamplough',
-    'lan-based',
-    'lanchbery',
-    'land\'',
-    'land-hunger',
-    'land-mine',
-    'landlines',
-    'language-related',
-    'lani',
-    'lanman',
-    'lanteglos',
     'lanyards',
-    'lanza',
-    'laomedon',
-    'lapidus',
-    'lapierre',
-    'lapiths',
-    'laplink',
-    'larchgrove',
-    'large-calibre',
-    'large-print',
-    'largent',
-    'larnax',
-    'lasdun',
-    'lasered',
-    'lasithi',
-    'lassoed',
     'last-born',
-    'lastolite',
-    'latakia',
-    'late-eighteenth-century',
-    'latinised',
-    'latissimus',
-    'latus',
-    'laub',
-    'laudi',
-    'laus',
-    'lausd',
-    'lavender-blue',
-    'law\'',
-    'law-',
-    'law-breaker',
-    'law-code',
     'law-giving',
-    'lawbreaking',
-    'lawed',
-    'lawfull',
-    'lawtel',
-    'leaf-green',
-    'leafleted',
-    'least-known',
-    'leathered',
-    'leche',
-    'leckpatrick',
-    'lecythidaceae',
-    'leena',
-    'left-centre',
-    'left-side',
-    'leftfield',
     'leg-room',
-    'leh&aacute;r',
-    'lehninger',
-    'leicester-based',
-    'leishmania',
-    'leli&egrave;pvre',
-    'lellow',
-    'lem',
-    'lenexa',
-    'lenin\'',
-    'leporello',
-    'lesothan',
-    'lesthaeghe',
-    'letter-by-letter',
-    'letterheading',
-    'levasseur',
     'level-par',
-    'leveque',
-    'levermore',
-    'levitzki',
-    'lezghin',
-    'lfo',
-    'lha',
-    'libeskind',
-    'licat',
-    'lieges',
-    'lieven',
-    'lifeid',
-    'lift-shaft',
-    'ligand-binding',
-    'ligging',
-    'light-box',
     'light-filled',
-    'light-middle',
-    'light-welter',
-    'lightfast',
-    'lime-soda-softening',
-    'limeys',
-    'limulus',
-    'linch',
-    'lindeman',
-    'line-of-rail',
-    'lineman',
-    'linex',
-    'link-man',
-    'linsay',
-    'lion-heart',
-    'lip-smacking',
     'liquide',
-    'lista',
-    'listenin\'',
-    'litani',
-    'literatur',
-    'litter-free',
-    'littleport',
-    'live-action',
-    'live-wire',
-    'lk',
-    'll.d.',
-    'llydaw',
-    'loafed',
-    'lochend',
-    'lockstitch',
-    'lod',
     'log-in',
-    'logotheti',
-    'logrones',
-    'lollard',
-    'long-bodied',
-    'long-case',
-    'long-closed',
-    'long-play',
-    'longeaton',
-    'longhaired',
-    'longo',
-    'longranger',
-    'longtemps',
-    'lonhro',
-    'loose-end',
-    'loosely-woven',
     'lopo',
-    'lopresti',
-    'lorde',
-    'loricariids',
-    'loro',
-    'lortie',
-    'loss-maker',
-    'lotsa',
-    'loud-hailer',
-    'loupe',
-    'love-letter',
-    'love-song',
-    'lovernius',
-    'lovesong',
-    'lovestruck',
-    'low-battery',
     'low-fibre',
-    'low-mid',
-    'low-pay',
-    'low-priority',
-    'low-scoring',
-    'low-set',
-    'lowa',
-    'lower-frequency',
-    'lower-grade',
-    'lower-middle-income',
-    'lowman',
-    'lpu',
-    'lti',
-    'lugosi',
-    'luman',
-    'lumbers',
     'lumet',
-    'lun',
-    'lunny',
-    'lupescu',
-    'lurg',
-    'lury',
-    'luzzaschi',
-    'lwo',
-    'lyamshin',
-    'lycopods',
-    'lydiate',
-    'lympstone',
-    'lyndsay',
-    'lyonnaise',
-    'm17',
-    'm700&ndash;10',
     'maam',
-    'maarouf',
-    'machina',
-    'machine-breaking',
-    'machine-code',
-    'machine-pistol',
-    'macrame',
-    'madhu',
-    'madonnina',
-    'madriya',
-    'maggid',
-    'maglev',
-    'magnall',
-    'magnifico',
-    'magnifique',
-    'magog',
     'magonsaete',
-    'mahala',
-    'mahavishnu',
-    'maime',
-    'mainlaying',
-    'majestie',
-    'make-work',
-    'maki',
-    'makro',
-    'maksim',
-    'malbec',
-    'malbis',
-    'male-orientation',
-    'male-voice',
-    'malina',
-    'malingue',
     'malostransk&eacute',
-    'malvy',
-    'mamdani',
-    'man-woman',
-    'man-year',
-    'manannan',
-    'manas',
-    'manau',
-    'mandelstam',
-    'mandingo',
-    'mandovi',
-    'mandroid',
-    'manere',
-    'mang',
-    'mangla',
-    'mangram',
     'mani&egrave;re',
-    'maniguet',
-    'manila-based',
-    'maninder',
-    'manticore',
-    'mantoux',
-    'many-layered',
-    'mapics',
-    'marcam',
-    'marce',
-    'margarite',
-    'marginata',
-    'marianna',
-    'mariette',
-    'market-',
-    'market-day',
     'marktrace',
-    'marku',
-    'markusen',
-    'marmor',
-    'marmorata',
-    'marplan',
-    'marrieds',
-    'marsilea',
-    'martia',
-    'martin\'',
-    'martinque',
-    'marwash',
-    'masculinized',
-    'mase',
-    'masjumi',
-    'maskery',
     'masongill',
-    'mass-selling',
-    'massaccio',
-    'massingberd-mundy',
-    'massy',
-    'master-in-charge',
-    'master-stroke',
-    'mat-forming',
-    'matabele',
-    'match-saving',
-    'mathe',
-    'matolcsy',
-    'matusow',
-    'maundering',
-    'maxam',
-    'mayobridge',
     'mazzucchelli',
-    'mbis',
-    'mccullochs',
-    'mchoans',
-    'mdos',
-    'meam',
-    'mean-looking',
-    'means-test',
-    'meas',
-    'measurability',
-    'meat-eater',
-    'mecc',
-    'medecins',
-    'meinhold',
-    'meko',
-    'melanism',
     'melkrom',
-    'melloni',
-    'melot',
-    'melpomene',
-    'men\'',
-    'menderes',
-    'menestrel',
-    'mentis',
-    'meridiana',
-    'meritt',
-    'merrett',
-    'merryweather',
-    'mescalin',
-    'mesfin',
-    'mesoamerican',
-    'mesquite',
     'metallics',
-    'metalling',
-    'metes',
-    'meth',
-    'metocean',
-    'metrix',
-    'metzler',
-    'mhi',
-    'mickelson',
-    'microfocus',
-    'microprolog',
-    'microsequencing',
-    'microstratigraphy',
-    'mid-1979',
-    'mid-70',
-    'middle-market',
     'middleaged',
-    'might\'n',
-    'mik',
-    'militaris',
-    'militarised',
-    'millau',
-    'million-selling',
-    'millmoor',
-    'milmo',
-    'miloslav',
-    'minches',
-    'minchmoor',
-    'mind-body-spirit',
-    'mindblowing',
-    'mini-computer',
-    'mini-fridge',
     'minimata',
-    'minimum-wage',
-    'minotels',
-    'mintoff',
-    'mirador',
-    'mirko',
-    'mirpuri',
-    'mirror-glass',
-    'mis-matched',
-    'mis-named',
-    'misc',
-    'miscasting',
-    'mish',
-    'mishearing',
-    'misidentified',
-    'misinforming',
     'mismanage',
-    'missin\'',
-    'mithril',
-    'mitsibushi',
-    'mitteleuropa',
-    'mitter',
-    'mitzie',
-    'mixed-method',
-    'mizzen',
-    'mki',
-    'mms',
-    'mmus',
-    'mobitex',
-    'moch',
-    'mockler',
-    'moctar',
     'modeled',
-    'moderatus',
-    'modleski',
-    'modularized',
-    'moely',
-    'mogs',
-    'moho',
-    'moisturised',
-    'moisturises',
-    'moje',
-    'mokey',
-    'mokhtar',
-    'molapo',
-    'molded',
-    'moley',
-    'molin',
     'mollifying',
-    'mollycoddle',
-    'moment-by-moment',
-    'money-based',
-    'money-maker',
-    'money-supply',
-    'moneysaver',
-    'monis',
-    'monocerotis',
-    'monounsaturated',
-    'monsterland',
-    'montalban',
-    'montets',
-    'month-on-month',
-    'moonchild',
-    'moonraker',
     'moorby',
-    'mor&aacute;n',
-    'morbihan',
-    'morestore',
-    'moretti',
-    'morticed',
-    'mortised',
-    'mortising',
-    'motabeng',
-    'mother\'',
-    'mother-figure',
-    'mottley',
-    'mounded',
-    'mounsher',
-    'mountain-building',
-    'mourou',
     'mouse-trap',
-    'mousseux',
-    'movie-going',
-    'moviegoers',
-    'moys',
-    'mozartean',
-    'mptn',
-    'mptp',
-    'mrpa',
-    'msu',
-    'mte',
-    'mthimkulu',
-    'much-changed',
-    'much-trodden',
-    'muddington',
-    'mudfog',
     'mudrocks',
-    'muffat',
-    'mugby',
-    'mugwort',
-    'muharram',
-    'mujahedeen',
-    'mukong',
-    'mulligatawny',
-    'multi-choice',
-    'multi-service',
-    'multi-strand',
-    'multi-tier',
-    'multi-tone',
-    'multicray',
-    'multiplexed',
-    'multivalve',
     'mulumba',
-    'murrie',
-    'muscidifurax',
-    'muscle-building',
-    'musicum',
-    'musket-fire',
-    'muslim-held',
-    'musset',
-    'mutawa',
-    'muthanna',
-    'mvt',
-    'mwu',
-    'mycil',
-    'mycroft',
-    'mykale',
-    'mykenai',
     'myodil',
-    'mythopoeia',
-    'n&iacute',
-    'n\'dosi',
-    'n-plant',
-    'n.k.',
-    'nabob',
-    'nacods',
-    'nadder',
-    'naiad',
-    'nakamichi',
-    'nanbu',
-    'nanchang',
-    'napolitano',
-    'napped',
-    'nara-wacc',
     'naral',
-    'nares',
-    'narrow-based',
-    'nasiriyah',
-    'nasr',
-    'native-speaker',
-    'natural-sounding',
-    'naturalizing',
-    'nature-lover',
-    'nawabs',
-    'nawaf',
-    'nawk',
-    'naxalite',
-    'nayanar',
-    'ncg',
-    'ncra',
     'ncrc-11',
-    'ndiaye',
-    'near-panic',
-    'near-side',
-    'necronomicon',
-    'nedim',
-    'needs-based',
-    'neele',
-    'neeow',
-    'neet',
-    'negativing',
-    'nemery',
-    'neo-evolutionism',
-    'neo-jacobean',
-    'neo-malthusianism',
-    'nerlove',
     'nerve-end',
-    'netclasses',
-    'netwic',
-    'neuadd',
-    'neuch&acirc;tel',
-    'neumeier',
-    'neurath',
-    'nevaire',
-    'never-to-be-repeated',
-    'newly-named',
-    'newminster',
-    'newsbeat',
-    'newsday',
-    'newsgirl',
-    'newslink',
-    'newwave',
     'nexpert',
-    'next-day',
-    'nf-il6',
-    'niaaf',
-    'niccl',
-    'nickel-cadmium',
-    'niemeyer',
-    'night-duty',
-    'night-school',
-    'night-soil',
-    'night-work',
-    'nightsitting',
-    'nihe',
-    'nijaz',
-    'nijholt',
-    'nilson',
     'nimrodel',
-    'niosh',
-    'nipa',
-    'nitram',
-    'nmiu',
-    'nmt',
-    'no-warning',
-    'nobo',
-    'noesy',
-    'nol',
-    'nom-de-plume',
-    'nombre',
-    'non-armed',
-    'non-cfc',
-    'non-communication',
-    'non-congress',
     'non-correlation',
-    'non-data-ink',
-    'non-decision-making',
-    'non-demeaning',
-    'non-development',
-    'non-euclidean',
-    'non-excludability',
-    'non-feminist',
-    'non-housing',
-    'non-ionics',
-    'non-nazi',
-    'non-prescription',
-    'non-production',
-    'non-ratification',
-    'non-regulation',
-    'non-relapsing',
     'non-rotating',
-    'non-sick',
-    'non-tumour',
-    'non-turf',
-    'nonjuring',
-    'nonne',
-    'nony',
-    'noontide',
-    'norbord',
-    'norfolk-based',
-    'norgrove',
-    'normax',
-    'norrish',
-    'norwell',
-    'nosedived',
-    'nosema',
     'nost',
-    'nothhelm',
-    'notturno',
-    'nowaks',
-    'nowell',
-    'nslc',
-    'nsx',
-    'nubs',
-    'nucps',
-    'nudge-nudge',
-    'nula',
-    'numbskull',
-    'nursery-school',
-    'nush',
-    'nut-cracking',
-    'nuthin\'',
     'ny-5',
-    'nymphaeaceae',
-    'nyoka',
-    'nyquist',
-    'o\'course',
-    'o1',
-    'oak-tree',
-    'oakapple',
-    'oakenshaw',
-    'oakleaf',
-    'oal',
-    'oase',
-    'oasys',
-    'obas',
-    'obfuscating',
-    'obits',
     'object-glass',
-    'object-linking',
-    'obligin\'',
-    'obo',
-    'occasion-setting',
-    'occidentale',
-    'ocellated',
-    'ocmp',
-    'odem',
-    'oduber',
-    'oesterley',
-    'oestreicher',
-    'of&mdash',
-    'off-cut',
-    'off-form',
-    'off-width',
     'offerin\'',
-    'offprints',
-    'oft-stated',
-    'ogilby',
-    'ogof',
-    'ogonyok',
-    'ohka',
-    'oies',
-    'oil-drum',
-    'oil-production',
-    'oil-slick',
-    'oink',
-    'oj',
-    'okigbo',
-    'olah',
-    'olde-worlde',
     'oliveto',
-    'olle',
-    'olschewski',
-    'olshan',
-    'olu',
-    'olvia',
-    'olympik',
-    'on-pack',
-    'onan',
-    'one-cap',
-    'one-child',
-    'one-coat',
-    'one-sentence',
-    'onion-skin',
-    'ooa',
-    'opdebeeck',
     'open-access',
-    'open-end',
-    'open-ground',
-    'open-house',
-    'open-neck',
-    'open-work',
-    'openbaar',
-    'oper',
-    'opera-ballet',
-    'ophiomedea',
-    'ophiuroid',
-    'opole',
-    'optical-fibre',
-    'opticals',
-    'oracle-based',
-    'orbitosphenoid',
     'orchidea',
-    'organizaci&oacute;n',
-    'organum',
-    'orgon',
-    'orinthia',
-    'ornithischian',
-    'orontea',
-    'orsz&aacute;ggy&uuml;les',
-    'ortho',
-    'osburn',
-    'osha',
-    'ota',
-    'othe',
-    'out-of-tune',
-    'outcrossing',
-    'outmatched',
     'ouzel',
-    'over-bearing',
-    'over-cooked',
-    'over-educated',
-    'over-filled',
-    'over-hunting',
-    'over-painted',
-    'over-provided',
-    'over-qualified',
-    'over-ruddering',
-    'over-stocked',
-    'over-the-head',
-    'overcoated',
-    'overcommitted',
-    'overcooking',
-    'overexposed',
     'oversupplied',
-    'overweighted',
-    'oxoid',
-    'p-postlabelling',
-    'pabulum',
-    'packeted',
-    'pacrim',
-    'palouse',
-    'panayiotou',
-    'pantie',
-    'pantocrator',
-    'parafoils',
-    'parallelepiped',
-    'paramo',
-    'partha',
-    'passio',
     'patch-work',
-    'pauperum',
-    'pcdma',
-    'pcte',
-    'peace-keeper',
-    'pearling',
-    'pedestrianized',
-    'pelleting',
-    'penlight',
-    'pentate',
-    'pentrite',
-    'perambulating',
-    'perchlorate',
-    'periclean',
-    'peroxided',
-    'perpetuum',
     'ph&egrave;dre',
-    'philair',
-    'photo-montage',
-    'phrase-book',
-    'phut',
-    'piano-playing',
-    'pigeonholing',
-    'pipe-cleaner',
-    'pipelined',
-    'pipelining',
-    'pipi',
-    'pit-bull',
-    'pit-cnt',
-    'pitsligo',
-    'plashing',
-    'plde',
     'plussing',
-    'pneumatics',
-    'poetry-reading',
-    'pogue',
-    'pohive',
-    'pointillist',
-    'polagraph',
-    'polygala',
-    'polymethylmethacrylate',
-    'pomarine',
-    'popi',
-    'popsie',
-    'portinatx',
-    'posa',
-    'post-bus',
-    'post-modernization',
     'power-house',
-    'powercd',
-    'powerlifting',
-    'ppfe',
-    'pre-filtration',
-    'pre-heating',
-    'preki',
-    'preselect',
-    'prijon',
-    'printability',
-    'printware',
-    'priore',
-    'priskin',
-    'problem-posing',
-    'prolegomena',
-    'promontoire',
     'proof-printing',
-    'propamidine',
-    'proprinter',
-    'proteobacteria',
-    'provignage',
-    'provincia',
-    'pubblico',
-    'puella',
-    'puer',
-    'pyon',
-    'pyth.',
-    'q66.9',
-    'q_',
-    'qai',
-    'qara',
-    'qaryat',
     'qatari',
-    'qataris',
-    'qdr',
-    'qili',
-    'qma',
-    'qms',
-    'qrs',
-    'qsl',
-    'qsv',
-    'qtr-final',
-    'quadling',
-    'quadraplegic',
-    'quadrat',
-    'quadrupedal',
-    'quaere',
-    'qualitas',
     'quallofil',
-    'quantico',
-    'quarter-deck',
-    'quarter-million',
-    'quarterfinal',
-    'quartiles',
-    'quasi-criminal',
-    'quasi-democratic',
-    'quasi-feudal',
-    'quasi-nominal',
-    'quasi-science',
-    'quasi-sensuous',
-    'quatermain',
-    'quatuor',
-    'queasily',
-    'quee',
     'queen-size',
-    'quekett',
-    'quelea',
-    'quer&eacute;taro',
-    'question/answer',
-    'quick-to-make',
-    'quiddity',
-    'quidenham',
-    'quillersedge',
-    'quinary',
-    'quing',
-    'quink',
-    'quintuplets',
-    'quirinius',
-    'quirinus',
-    'quirkily',
     'quoich',
-    'quoin',
-    'qx15',
-    'r&amp;m',
-    'r&eacute',
-    'r&eacute;gisseur',
-    'r&eacute;n&eacute',
-    'r&mdash',
-    'r&uuml;ckriem',
-    'r+',
-    'r.ebright',
-    'r.i.b.a.',
-    'r.p.m',
-    'r.s.f.',
-    'r.s.s',
-    'r.us',
     'r/hand',
-    'r/s',
-    'r1.2',
-    'r10(8)',
-    'r100',
-    'r11(9)',
-    'r17',
-    'r2.1.1',
-    'r2.1.2',
-    'r213',
-    'r28',
-    'r360',
-    'r4.10(8)',
-    'r4000pc',
-    'r4000s',
-    'r645/59',
     'r74(356&ndash;517)',
-    'r74s',
-    'r7a',
-    'r=0',
-    'r=0.78',
-    'ra4',
-    'raaa',
-    'rabah',
-    'rabbit-runs',
-    'rabbitte',
-    'rac1',
-    'raccordo',
-    'race-goers',
-    'rachinburgi',
-    'rack-mountable',
-    'rack-mounting',
     'racketts',
-    'racoon',
-    'racoons',
-    'radiation-linked',
-    'radiatively',
-    'radicaux',
-    'radicofani',
-    'radio-',
-    'radio-telescopes',
-    'radioing',
-    'radiometers',
-    'radiotherapist',
-    'radiused',
-    'radowitz',
-    'radtke',
-    'raffaele',
     'raffan',
-    'rafvr',
-    'ragdale',
-    'raggas',
-    'ragpickers',
-    'rahmonov',
-    'raikes',
-    'railway-owned',
-    'rain-streaked',
-    'rainbow-hued',
-    'rainfords',
-    'rainman',
-    'rainworth',
-    'rajmohan',
-    'rakata',
-    'rakhmanov',
     'ralls',
-    'ram-raid',
-    'ram.0',
-    'ramamurthy',
-    'ramasandra',
-    'rambutans',
-    'ramirezi',
-    'ramraiders',
-    'ramster',
-    'rannerdale',
-    'ransoming',
-    'ranzau',
-    'rapaciously',
-    'rapapis',
-    'rapidly-changing',
-    'raraku',
     'rashbrook',
-    'rasheeda',
-    'rashidov',
-    'rasiklal',
-    'rasse',
-    'rassendylls',
-    'rastenburg',
-    'rasterized',
-    'rasters',
-    'ratchets',
-    'rate-support',
-    'ratemahatmaya',
-    'raters',
-    'rathje',
-    'raths',
-    'rational-scientific',
     'rattlers',
-    'ratvick',
-    'raucousness',
-    'raukov',
-    'rauti',
-    'rauwolfia',
-    'ravenscar',
-    'ravetz',
-    'ravin\'',
-    'ravisher',
-    'rawling',
-    'ray-ban',
-    'rcmp',
-    'rdbisetup.com',
-    're-adjust',
-    're-admission',
     're-affiliation',
-    're-afforestation',
-    're-appears',
-    're-application',
-    're-argued',
-    're-attached',
-    're-chargeable',
-    're-classify',
-    're-commence',
-    're-compiled',
-    're-convened',
-    're-creations',
-    're-decoration',
-    're-defining',
-    're-discovery',
-    're-distribute',
     're-emphasises',
-    're-energise',
-    're-enrol',
-    're-estimated',
-    're-exporting',
-    're-formation',
-    're-generation',
-    're-grouping',
-    're-identifiable',
-    're-ignite',
-    're-imposed',
-    're-imposition',
-    're-inforced',
-    're-inforcing',
-    're-invention',
-    're-iterate',
     're-mortgage',
-    're-occurring',
-    're-organisations',
-    're-packaged',
-    're-presents',
-    're-readings',
-    're-sealed',
-    're-seller',
-    're-shaping',
-    're-surfaced',
-    're-tried',
-    're-typing',
-    're:the',
-    'reaction-diffusion',
-    'reaction.',
-    'reactively',
     'read-off',
-    'readably',
-    'readjusts',
-    'ready-printed',
-    'ready-rolled',
-    'reaganism',
-    'reagin',
-    'realer',
-    'reallocations',
-    'really.',
-    'realtors',
-    'realy',
-    'reamer',
-    'reaming',
-    'reappearances',
-    'reapportion',
     'reappropriation',
-    'reattribution',
-    'reauthorisation',
-    'reavers',
-    'rebalance',
-    'rebid',
-    'rebka',
-    'reboard',
-    'rebuts',
-    'recalcitrants',
-    'recalibration',
-    'recapitulations',
-    'recaption',
-    'reccione',
-    'recently-approved',
-    'reception-room',
     'receptor-independent',
-    'recession-bashed',
-    'rechenburg',
-    'reckmann',
-    'reckonings',
-    'recliner',
-    'recognitional',
-    'recognizance',
-    'recognizances',
-    'recomputed',
-    'reconverting',
-    'recoupment',
-    'recoverin',
-    'recreolisation',
-    'recruitments',
-    'recrystallized',
     'rectangular-shaped',
-    'rectifications',
-    'rectifies',
-    'rectilinearity',
-    'rectus',
-    'recueil',
-    'recuperable',
-    'red-bed',
-    'red-crested',
-    'red-heads',
-    'red-shirted',
-    'red-tipped',
-    'red/green',
-    'redburna',
-    'redburns',
-    'redcross',
     'reddens',
-    'redetermination',
-    'redevelopments',
-    'redheaded',
-    'redintegratio',
-    'redivision',
-    'redmane',
-    'redolence',
-    'redraws',
-    'redundantly',
-    'reed-fringed',
-    'reed-like',
-    'reentrant',
-    'rees-williams',
-    'reevaluating',
-    'ref.18',
     'references-are',
-    'referent-qualifiers',
-    'refering',
-    'referrer',
-    'reffell',
-    'refixing',
-    'reflationary',
-    'reflexologists',
-    'refractions',
-    'reframe',
-    'refu',
-    'refusers',
-    'regarder',
-    'registrant',
-    'regreening',
-    'regurgitates',
     'rehbein',
-    'rehn',
-    'reignite',
-    'reincarnations',
-    'reinhardtii',
-    'reinsuring',
-    'reiterhof',
-    'rejigged',
-    'rejigging',
-    'rejoinders',
-    'relabelled',
-    'relation_to',
-    'relationship-oriented',
-    'relaxin',
-    'religation',
-    'religious/cultural',
     'remanufacture',
-    'remonstrances',
-    'remunerations',
-    'renames',
-    'renard',
-    'renascent',
-    'renascians',
-    'renatured',
-    'renatus',
-    'renfield',
-    'renny',
-    'renomination',
-    'rentable',
-    'rentcharges',
-    'rentham',
-    'renville',
     'reoccurring',
-    'reoperation',
-    'reorientating',
-    'reorienting',
-    'repassing',
-    'repealer',
-    'replaced.',
-    'reponse',
-    'reporters.',
-    'repp',
-    'repre',
-    'representationally',
-    'repulses',
-    'repulsions',
-    'requisitioners',
-    'reroughing',
     'rescale',
-    'reselections',
-    'residually',
-    'resistence',
-    'resister',
-    'resistless',
-    'resited',
-    'resoluteness',
-    'resolven',
-    'resorcinol',
-    'resource-rich',
-    'resplendently',
-    'responsively',
-    'responsivity',
-    'restimulate',
-    'restio',
     'restitutio',
-    'restively',
-    'restorable',
-    'restrictions.',
-    'restrictor',
-    'restroom',
-    'resurrectionists',
-    'resurveys',
-    'resuscitative',
-    'retain-and-transfer',
-    'retest',
-    'reticences',
-    'reticulation',
-    'reticulocytosis',
-    'retool',
-    'retreatism',
     'retributory',
-    'retrogrades',
-    'retroperitoneum',
-    'retros',
-    'retrospects',
-    'retselisitsoe',
-    'retz',
-    'reubens',
-    'reusability',
-    'revanchism',
-    'revanchist',
-    'revengeful',
-    'reverse-transcribed',
-    'revery',
-    'revesby',
-    'revetments',
     'reviglio',
-    'revocations',
-    'revoltingly',
-    'revueltos',
-    'rew',
-    'rewashering',
-    'rewinds',
-    'reworded',
-    'rfd9',
-    'rfe/rl',
-    'rfk',
-    'rflvs',
-    'rg21',
-    'rgd',
-    'rhd',
-    'rhead',
     'rheology',
-    'rhett',
-    'rheumatologist',
-    'rhoads',
-    'rhombomeric',
-    'rhune',
-    'rhys-jones',
-    'rhythmicality',
-    'riac',
-    'riace',
-    'rices',
-    'rich-tasting',
-    'richmond/mother',
-    'richtofen',
-    'rickstones',
-    'ricostruzione',
     'riddifords',
-    'rideable',
-    'riderhood',
-    'ridiculous.',
-    'right-half',
-    'right-holder',
-    'right-size',
-    'rigler',
-    'rikanovic',
-    'rimbo',
-    'rimed',
-    'rimer',
-    'ring-segments',
-    'ring-tailed',
-    'ringgit',
-    'ringk&oslash;ping-fyn',
     'ringsiders',
-    'ringwork',
-    'rino',
-    'rioseco',
-    'rioter',
-    'riparian',
-    'ripault',
-    'ripley-rust',
-    'ripped-off',
-    'rire',
-    'rison',
-    'ritardando',
-    'ritournelle',
-    'ritt',
-    'ritualists',
-    'riu',
     'river-horse',
-    'riverwalk',
-    'rivetus',
-    'rixon',
-    'riza',
-    'rj1',
-    'rm600',
-    'rmjm',
-    'rn\'',
-    'rn228',
-    'ro-railer',
-    'road/baberton',
-    'roadless',
-    'roadworkers',
-    'roamer',
-    'roasty',
     'robaina',
-    'robelo',
-    'robinswood',
-    'robobird',
-    'robovitch',
-    'rock-falls',
-    'rock/folk',
-    'rock/pop',
-    'rockbourne',
-    'rockhopper',
-    'rockley',
-    'rockoff',
-    'rockpoolers',
-    'rocksteady',
-    'roddons',
-    'rodent-run',
     'rodge',
-    'rodlike',
-    'roederer',
-    'roffel',
-    'roffense',
-    'rog&eacute;rio',
-    'rogate',
-    'rogationtide',
-    'rogo',
-    'roguery',
-    'roheim',
-    'rojanani',
-    'roky',
-    'roleplaying',
-    'roles.dat',
-    'roll-calls',
     'roll-ons',
-    'rolla',
-    'roller-coasters',
-    'rollerskates',
-    'rollings',
-    'romancers',
-    'romanian-born',
-    'romanis',
-    'romanowski',
-    'romita',
-    'romorantin',
-    'ronaasen',
-    'roof-beams',
-    'roofers',
-    'roofrack',
-    'roome',
     'roose',
-    'root-indices',
-    'root-mean-square',
-    'root-stock',
-    'rootedly',
-    'rootedness',
-    'rootin\'',
-    'ropner',
-    'rosabeth',
-    'rose-beds',
-    'rose-noelle',
-    'rose-scented',
-    'rosena',
-    'rosendahl',
-    'rosenfield',
-    'roskell',
     'rossen',
-    'rosseter',
-    'rossmore',
-    'rot-resistant',
-    'rotemberg',
-    'rothenburg',
-    'rotovators',
-    'rottenberg',
-    'rottmayer',
-    'rottweiller',
-    'rougemont',
-    'rough-shod',
-    'roughly-cut',
-    'roughnecks',
-    'rouille',
-    'rouleau',
     'round-bottomed',
-    'round-winged',
-    'roundworms',
-    'routinised',
-    'roux-en-y',
-    'rovacchia',
-    'rowan-robinson',
-    'rowbottom/abingdon',
-    'rowbottom/newent',
-    'rowdier',
-    'rowen',
-    'rowles',
-    'rox',
-    'roxane',
-    'roxbury',
-    'royalism',
     'roybal-allard',
-    'roydon',
-    'rp50',
-    'rpcs',
-    'rs10,000',
-    'rs5,000',
-    'rsai',
-    'rsdwp',
-    'rsf',
-    'rssf',
-    'rtu',
-    'rtw',
-    'rubika',
-    'rubrum',
-    'ruckwood',
-    'ruddigore',
     'ruddiness',
-    'ruddy-cheeked',
-    'rudland',
-    'rueda',
-    'ruefulness',
-    'ruhigira',
-    'ruksana',
-    'rule-breakers',
-    'rumalla',
-    'ruminates',
-    'rumination',
-    'rums',
-    'run/stop',
-    'runge',
-    'runnier',
-    'running-in',
     'runoffs',
-    'runpast',
-    'runs=0:40',
-    'runs=1:30',
-    'runtish',
-    'runts',
-    'rupa',
-    'rural/urban',
-    'rurally',
-    'ruritanians',
-    'rusayev',
-    'rusby',
-    'ruscombe',
-    'rush-bottomed',
-    'rushall',
-    'rushbrooks',
     'rushlights',
-    'russkies',
-    'rust-resistant',
-    'rust-streaked',
-    'rustenburg-l',
-    'rustington',
-    'rutjes',
-    'ruut',
-    'ruwai',
-    'ruzimatov',
-    'rydberg',
-    'rye-grasses',
-    'rykiel',
-    'rylance',
-    'ryn',
-    'ryr3',
     'ryswick',
-    's&amacr;un',
-    's&eacute;gur',
-    's&oacute;crates',
-    's&uuml;ss',
-    's-kn-sh',
-    's-sorry',
-    's-waves',
-    's.1(4)',
-    's.10(b)',
-    's.14(1)',
-    's.15(2)',
-    's.17(1)',
-    's.17(4)',
-    's.23',
-    's.24',
     's.34(2)',
-    's.39',
-    's.4(3)',
-    's.7',
-    's.89',
-    's.9(4)',
-    's.93',
-    's.94',
-    's.94(4)',
-    's.l.r.',
-    's.m.r.',
-    's.o.e.',
-    's.p.c.k.',
-    's.shibatae',
-    's.uist',
-    's.v',
     's/nvq',
-    's10(3)',
-    's10(4)',
-    's11(2)',
-    's117',
-    's13(4)',
-    's151',
-    's162',
-    's176',
-    's179',
-    's18(1)',
-    's19(1)',
-    's2\'s',
-    's209',
-    's21',
-    's24(1)',
     's28',
-    's29',
-    's3/4',
-    's34(3)',
-    's36',
-    's38(6)',
-    's4(2)',
-    's41(3)',
-    's419',
-    's58(3)',
-    's6(2)',
-    's674',
-    's7(2)',
-    's74',
-    's75',
-    's76(1)',
     's776',
-    's87',
-    's94',
-    'saalbach-hinterglemm',
-    'saalfelden',
-    'sabahs',
-    'sabbaths',
-    'sabey',
-    'sabir',
-    'sabs',
-    'sac-like',
-    'saccade',
-    'sackable',
-    'sackless',
-    'sacrist',
-    'sad-eyed',
     'saddek',
-    'saddle-shaped',
-    'saddoo',
-    'sadly.',
-    'safe-houses',
-    'safety-critical',
-    'saffron-yellow',
-    'safwan',
-    'sagarmatha',
-    'said.',
-    'sail-off',
-    'sailer',
-    'sailor-suited',
-    'sailplanes',
-    'sainbury',
-    'saint-andr&eacute',
     'saint-cult',
-    'saint-georges',
-    'saint-lary',
-    'saint-martin',
-    'saint-michel',
-    'saint-moritz',
-    'saiph',
-    'saive',
-    'sakeasi',
-    'sal&egrave;ve',
-    'salaciousness',
-    'salama-caro',
-    'salander-o\'reilly',
-    'salcininkai',
-    'salia',
-    'salian',
     'saliency',
-    'saliers',
-    'salina',
-    'salisburys',
-    'salkeld',
-    'sallins',
-    'sallyport',
-    'saloner',
-    'salonica',
-    'salotto',
-    'salt-loving',
-    'salt-marshes',
-    'saltier',
-    'salvageable',
-    'samaja',
-    'samak',
     'samakki',
-    'samal',
-    'samayoa',
-    'same/different',
-    'samet',
-    'samians',
-    'samlesbury',
-    'sammer',
-    'samms',
-    'sampan',
-    'sampans',
-    'samsonite',
-    'samukhela',
-    'sanan',
-    'sanchis',
-    'sanctae',
     'sancton-baston',
-    'sand-hills',
-    'sand-iron',
-    'sandboy',
-    'sandia',
-    'sandier',
-    'sandpapering',
-    'sandshoes',
-    'sangheli',
-    'sanitizer',
-    'sanjaasurengiyn',
-    'sanjak',
-    'santamar&iacute;a',
-    'sapcote',
-    'saponins',
-    'sapronov',
     'saraceni',
-    'sarahs',
-    'sarasota',
-    'sarcasms',
-    'sarcolemma',
-    'sarcoptes',
-    'sardi',
-    'sarhadi',
-    'sarnoff',
-    'saronno',
-    'sarsi',
-    'sartre-type',
-    'sat/sun',
-    'satcam',
-    'satcom',
-    'sativus',
     'satrapal',
-    'satrapies',
-    'saudi-arabia',
-    'saundersfoot',
-    'saundersons',
-    'sauropodomorphs',
-    'sausage-like',
-    'sauzee',
-    'saveloy',
-    'savilles',
-    'savini',
-    'savvas',
-    'saw-cuts',
-    'sawbones',
-    'saxophonists',
-    'sayeeda',
     'saysangkhi',
-    'sazhens',
-    'sb.',
-    'sb401',
-    'sbci',
-    'sc&egrave;ne',
-    'sc.d.',
-    'sc20',
-    'sc3',
-    'scambler',
-    'scandalmonger',
-    'scannable',
-    'scarabus',
-    'scarcest',
-    'scarved',
-    'scatalogical',
     'scatophagus',
-    'scatterbrained',
-    'sceptres',
-    'sceva',
-    'sch&ouml;nborn',
-    'sch&ouml;ne',
-    'sch&uuml;ssel',
-    'schacht',
-    'schangnau',
-    'schaumburg',
-    'schedual',
-    'schedulers',
-    'scheel',
-    'scheherezade',
-    'schematized',
-    'scherzando',
     'schirmer',
-    'schlee',
-    'schlesingers',
-    'schlieren',
-    'schmitz',
-    'schmooze',
-    'schneiderei',
-    'scholarliness',
-    'scholly-ka',
-    'scholten',
-    'school-books',
-    'school/industry',
-    'schools-industry',
-    'schoonhoven',
-    'schouten',
-    'schr&ocirc;der',
     'schrodinger',
-    'schtum',
-    'schucking',
-    'schuell',
-    'schull',
-    'schulte',
-    'schurmann',
-    'schwammberger',
-    'schwarz-schilling',
-    'scid',
-    'science/hci',
-    'scleractinian',
-    'sclerosus',
-    'scoreboards',
-    'scorebox',
-    'scotomas',
     'scotophobin',
-    'scots-irish',
-    'scotvec-devised',
-    'scrappers',
-    'scratchiness',
-    'screenprint',
-    'screensport',
-    'screeton',
-    'screw-holes',
-    'scriptoria',
-    'scrubbin\'',
-    'scrummager',
-    'scrunched-up',
-    'scrunchies',
-    'scuffers',
-    'scumchester',
     'scumites',
-    'scumland',
-    'scumniks',
-    'scutes',
-    'sdd',
-    'sdrt',
-    'sdss',
-    'se&ntilde;orios',
-    'se/30',
-    'se9',
-    'sea-beet',
-    'sea-gulls',
-    'sea-legs',
-    'sea-pinks',
-    'sea-routes',
-    'sea-salt',
     'sea-washed',
-    'seaa',
-    'seaboots',
-    'sealions',
-    'search-space',
-    'searchin\'',
-    'season-ending',
-    'season-long',
-    'seaspray',
-    'seat-only',
-    'seatback',
-    'seats*',
-    'seawind',
-    'seaworthiness',
-    'sebastien',
-    'sebel',
     'seberg',
-    'sec160',
-    'secco',
-    'secessionism',
-    'secluding',
-    'second-bottom',
-    'second-guessed',
-    'second-joystick',
-    'second-last',
-    'sectarians',
-    'sectionalism',
-    'sector-led',
-    'sectoralisation',
-    'sectorization',
-    'secularizing',
-    'secularly',
     'security-minded',
-    'security1',
-    'sedburgh',
-    'sedlescombe',
-    'sedrun',
-    'sedums',
-    'seed-eaters',
-    'seefried',
-    'seend',
-    'seeram',
-    'seery',
-    'segoura',
-    'sehayek',
-    'seifart',
-    'seiguard',
-    'seixal',
     'sekhonyana',
-    'selectins',
-    'selectionist',
-    'selectionistic',
-    'selena',
-    'selenomethionyl',
-    'self&rehy;destructive',
-    'self-ascription',
-    'self-balancing',
-    'self-certification',
-    'self-deprecatingly',
-    'self-descriptions',
-    'self-evidence',
-    'self-glorification',
-    'self-governed',
-    'self-improving',
     'self-indexed',
-    'self-interruptions',
-    'self-launching',
-    'self-offering',
-    'self-perceived',
-    'self-ratings',
-    'self-reflective',
-    'self-reports',
-    'self-reproaches',
-    'self-sufficiently',
-    'self-timer',
-    'self-treatment',
-    'self-validating',
-    'selfconsciousness',
-    'selkie',
-    'sellassi&eacute',
     'selvam',
-    'selz',
-    'semantico-grammatical',
-    'sembene',
-    'semedo',
-    'semi-annually',
-    'semi-automated',
-    'semi-classical',
-    'semi-cubist',
-    'semi-deserts.',
-    'semi-erect',
-    'semi-industrial',
-    'semi-mythical',
-    'semi-periphery',
-    'semi-permanently',
-    'semi-political',
     'semi-proletarianisation',
-    'semi-religious',
-    'semiannual',
-    'semiquantitative',
-    'semmes',
-    'sempill',
-    'sence',
-    'sendall',
-    'sendin\'',
-    'senghenydd',
-    'sengupta',
-    'senorita',
-    'senoussi',
-    'sense-qualifying',
-    'sensilla',
-    'sensitizing',
     'sensorial',
-    'sensu',
-    'sentence-types',
-    'senussi',
-    'sepabhodi',
-    'september-12',
-    'sepulchrally',
-    'sequestering',
-    'sequestrant',
-    'sequestrators',
-    'ser54',
-    'sergeev',
-    'sergiu',
-    'serialled',
-    'serigne',
-    'serjeant-at-law',
     'serjeanties',
-    'serjeants-at-arms',
-    'serous',
-    'serpae',
-    'serpent-like',
-    'server/6000',
-    'servian',
-    'serviceability',
-    'services/6000',
-    'servites',
-    'servius',
-    'servomechanisms',
-    'serwal',
-    'sesfontein',
-    'sessilis',
-    'sessions.',
     'seticornis',
-    'setpiece',
-    'seulement',
-    'seven-',
-    'seven-eighths',
-    'seven-headed',
-    'sevenhampton',
-    'seventhly',
-    'seventy-odd',
-    'seventy-two-year-old',
-    'severe-looking',
-    'severnaya',
-    'sevillian',
-    'sewn-up',
-    'sex-differentiated',
-    'sex-marking',
     'sex-neutral',
-    'sex-segregation',
-    'sex-specific',
-    'sex-symbols',
-    'sexpartite',
-    'seyd',
-    'seydina',
-    'sfe-sfc',
-    'sfii/noti',
-    'sforzando',
-    'sg14',
-    'sgian',
-    'sgp',
-    'sgreccia',
-    'sh1',
-    'shaati',
     'shabashniki',
-    'shabby-genteel',
-    'shace',
-    'shacking',
-    'shacklebury',
-    'shadiest',
-    'shaggy-haired',
-    'shahryar',
-    'shailendra',
-    'shakang',
-    'shakeholes',
-    'shakhnazarov',
-    'shaki',
-    'shakiest',
-    'shakurulla',
-    'shale-type',
     'shalla',
-    'shallard',
-    'shalom',
-    'shamanist',
-    'shankie',
-    'shankland',
-    'shans',
-    'shapeliness',
-    'shapira',
-    'shara',
-    'share-buying',
-    'share-for-debenture',
-    'share-holding',
-    'shareholders.',
-    'shareowner',
-    'sharpers',
     'sharpness/gloucestershire',
-    'shatz',
-    'she\'',
-    'she-asses',
-    'sheafs',
-    'sheals',
-    'shearbridge',
-    'shedir',
-    'sheel',
-    'sheep-owners',
-    'sheep-shearers',
-    'sheepe',
-    'sheepscombe',
-    'sheffrin',
-    'sheikhdoms',
-    'sheilings',
     'shekinah',
-    'shelborne',
-    'shelbyville',
-    'shell-dwellers',
-    'shell-sand',
-    'shellsuits',
-    'shelter-belts',
-    'shenzen',
-    'sheremetyevo',
-    'shield-like',
-    'shield-shaped',
-    'shift+enter',
-    'shift-workers',
-    'shiggy',
-    'shikoku',
-    'shiksas',
     'shima',
-    'shin/instep',
-    'shing',
-    'shinkansen',
-    'shinui',
-    'shinwa',
-    'shiozaki',
-    'ship-owner',
-    'shiplap',
-    'shipmasters',
-    'shipmen',
-    'shippens',
-    'shipway',
-    'shirebrook',
-    'shireoaks',
-    'shirley-quirk',
     'shirreff',
-    'shit-hot',
-    'shitted',
-    'shitwork',
-    'shoe-boxes',
-    'shoosh',
-    'shooting-stick',
-    'shop-girls',
-    'shop-keepers',
-    'shoplifted',
-    'shopmobility',
-    'shopowners',
-    'shoreham-by-sea',
-    'short-form',
-    'short-skirted',
-    'short-to',
     'short-wheelbase',
-    'shorter-tailed',
-    'shorthouse',
-    'shortland',
-    'shotector',
-    'shoto',
-    'shottle',
-    'shottley',
-    'show-offs',
-    'showercub',
-    'showerproof',
-    'shrimping',
-    'shrinkable',
-    'shrops',
-    'shubei',
-    'shudderingly',
     'shuja',
-    'shuttleway',
-    'shysters',
-    'siachen',
-    'siatalimi',
-    'sible',
-    'sibsey',
-    'sibthorpe',
-    'sibuet',
-    'sicco',
-    'sicilies',
-    'sicli',
-    'siddal',
-    'side-cars',
-    'side-parted',
-    'side-slipped',
     'side-swipes',
-    'sidebotham',
-    'sideshoot',
-    'sidina',
-    'sidonians',
-    'sidtis',
-    'sieghart',
-    'siegmund',
-    'sightlines',
-    'sightsee',
-    'sigmas',
-    'signed-up',
-    'significate',
-    'signinum',
-    'siirt',
-    'sika',
     'silberner',
-    'silicosis',
-    'silk-smooth',
-    'sillabub',
-    'sillas',
-    'sillily',
-    'silmaril',
-    'silver-leaved',
-    'silverlode',
-    'silverstone/northamptonshire',
-    'sim-fix',
-    'sima',
-    'simba',
-    'simferopol',
-    'similis',
-    'simmentals',
     'simmenthal',
-    'simpliste',
-    'simplon-orient-express',
-    'simulatio',
-    'sinewaves',
-    'singable',
-    'singer/superba',
-    'single-a',
-    'single-coil',
-    'single-concept',
-    'single-figure',
-    'single-seaters',
-    'single-union',
-    'sinlessness',
-    'sinnet',
-    'sinop',
     'sinusoids',
-    'sio',
-    'sione',
-    'siphonic',
-    'sippel',
-    'sipra',
-    'siq',
-    'siqueiros',
-    'siree',
-    'sisomphone',
-    'sistemas',
-    'sister-wife',
-    'siswick',
-    'sit-downs',
-    'siteke',
-    'sites.',
     'sitting_room',
-    'situa',
-    'situation-specific',
-    'six-pound',
-    'six-shooter',
-    'six-to',
-    'six-under-par',
-    'sixth-',
-    'sjambok',
-    'skald',
-    'skalds',
-    'skanform',
-    'skateboarders',
-    'skating-rink',
-    'skeeby',
-    'skeleton-forming',
     'skelf',
-    'skelhorne',
-    'skem',
-    'skew-hermitian',
-    'skidelsky',
-    'skillets',
-    'skippings',
-    'skirlaw',
-    'skivers',
-    'skogstr&ouml;m',
-    'skouras',
-    'skp',
-    'skragged',
-    'skrowaczewski',
-    'skullduggery',
-    'skydive',
     'skyraider',
-    'sl6',
-    'slabbed',
-    'slack-key',
-    'slackers',
-    'slaphappy',
-    'slator',
-    'slaughterers',
-    'slaughtermen',
-    'slave-driving',
-    'slavered',
-    'slavin',
-    'sleepin\'',
-    'slenderly',
-    'slickest',
-    'sliding-door',
     'sloboda',
-    'slopping-out',
-    'slowish',
-    'slug-like',
-    'slugger',
-    'sluice-gates',
-    'slyme',
-    'sm845',
-    'smack-a-mac',
-    'small-calibre',
-    'small-paned',
-    'small-to',
-    'small-to-medium',
-    'small/medium',
-    'smalltalk/v',
-    'smark',
     'smarm',
-    'smds',
-    'smidge',
-    'smidovich',
-    'smidt',
-    'smites',
-    'smith-corona',
-    'smith-gods',
-    'smith/',
-    'smith/united',
-    'smoggy',
-    'smohalla',
-    'smokescreens',
-    'smooth-tongued',
-    'smoothies',
-    'smpte',
     'smythies',
-    'sn-cu',
-    'sn2',
-    'snappier',
-    'snappiness',
-    'snavely',
-    'snipe-like',
-    'snobbishly',
-    'snoops',
-    'snow-drifts',
-    'snow-making',
-    'snow-ploughs',
-    'snowcock',
-    'sns+',
-    'snuffer',
-    'snx',
     'so_,_so_that',
-    'so_forth',
-    'soapsuds',
-    'sober-minded',
-    'social-political',
-    'social-science',
-    'social-services',
-    'social/cultural',
-    'socialist/community',
-    'socii',
-    'socio-biological',
-    'socio-biologists',
-    'socio-sexual',
-    'socio-spatial',
-    'sociolinguistically',
-    'sociometric',
     'sociopaths',
-    'sociopathy',
-    'socium',
-    'sodium-rich',
-    'soffre',
-    'sofianos',
-    'soft-faced',
-    'soft-looking',
-    'soft-nosed',
-    'softish',
-    'software-compatible',
-    'software-intensive',
-    'software/hardware',
-    'sohn',
-    'soka',
-    'solafidianism',
     'solanas',
-    'solander',
-    'solebar',
-    'solera',
-    'solidary',
-    'soliders',
-    'soline',
-    'sollas',
-    'solution.',
-    'somaclonal',
-    'sombreros',
-    'somebodies',
-    'someren',
-    'sommersby',
-    'somniferum',
-    'somnolently',
     'son_et_lumiere',
-    'sonare',
-    'songes',
-    'soopa',
-    'sophistries',
-    'sordidness',
-    'sorer',
-    'soroti',
-    'sort-out',
-    'sorte',
-    'sosenko',
-    'sotades',
-    'soteriology',
-    'sotto',
-    'soudan',
-    'souillac',
     'souilly',
-    'souna',
-    'sound-alike',
-    'sound-changes',
-    'sound-quality',
-    'sound-tracks',
-    'sound-waves',
-    'soundalike',
-    'soundbites',
-    'soungui',
-    'souquet',
-    'sour-smelling',
-    'sourer',
-    'sourish',
-    'south-westward',
-    'southeasterly',
     'southern-most',
-    'soviet-third',
-    'sp.in',
-    'sp2',
-    'space-lab',
-    'spada',
-    'spadafora',
-    'spade-shaped',
-    'spagna',
-    'spalato',
-    'spandrel',
-    'spanish-speakers',
-    'spann',
-    'sparc90',
-    'spareness',
-    'sparling',
     'sparrow-sized',
-    'sparsely-populated',
-    'spates',
-    'spaunton',
-    'spawner',
-    'speaker-variables',
-    'spear-like',
-    'spear-points',
-    'special-effects',
-    'species-wide',
-    'speciesism',
-    'spectaclemakers',
-    'spectra-physics',
-    'spectroscopists',
-    'speechmaker',
-    'speed-ups',
     'speedsters',
-    'spel',
-    'spellcaster',
-    'spellcheck',
-    'spencer-nairn',
-    'spendable',
-    'spenserian',
-    'speri',
-    'sperzels',
-    'spezzati',
-    'sphericity',
-    'spheroidal',
-    'spicey',
-    'spider-like',
-    'spider-thing',
-    'spiker',
     'spilsbury',
-    'spinario',
-    'spindly-legged',
-    'spinelike',
-    'spiritualistic',
-    'spitaels',
-    'spital',
-    'splendiferous',
-    'splendors',
-    'splenorenal',
-    'splotch',
-    'splutterings',
-    'spongeable',
-    'spoofing',
-    'spooking',
-    'spoonbills',
     'sportsmanlike',
-    'sportsperson',
-    'sportswriter',
-    'spottiswood',
-    'spousal',
-    'sprache',
-    'spradley',
-    'spray-can',
-    'sprayed-on',
-    'spri',
-    'sprightliness',
-    'springstein',
-    'sprogg',
-    'sprotborough',
-    'spruces',
-    'sprung-edged',
     'spurzheim',
-    'sq.metres',
-    'sq_cm',
-    'sq_metres',
-    'sq_miles',
-    'sqms',
-    'squamata',
-    'squealers',
-    'squeegees',
-    'squint-eyed',
-    'squirrelling',
-    'sr.n6s',
-    'sranan',
-    'srifi',
-    'srt',
-    'ss.18',
     'ss31.exe',
-    'ss5',
-    'ss671',
-    'ssat',
-    'sscc',
-    'ssf',
-    'ssfc',
-    'ssrl',
-    'ssssh',
-    'ssssussann',
-    'st-riquier',
-    'staatsgalerie',
-    'staatskanzlei',
-    'stabile',
-    'stabilimentum',
-    'stabilities',
     'stack-yard',
-    'stackelberg',
-    'stadtverkehr',
-    'staff-intensive',
-    'stage-manager',
-    'stage-set',
-    'stagedivers',
-    'stagefright',
-    'stagehand',
-    'staginess',
-    'stagnogleys',
-    'stainthorpe',
-    'stair-rails',
-    'staler',
-    'stalking-horse',
-    'stall-fed',
     'stamocap',
-    'stampers',
-    'standard-class',
-    'standard-size',
-    'standesamt',
-    'stanes',
-    'stanislovas',
-    'staplina',
-    'star-fields',
-    'stara',
-    'stargazers',
-    'starkist',
-    'starnberg',
-    'start-year',
-    'stasys',
-    'state\'',
     'state-regulated',
-    'state-supported',
-    'stater',
-    'stathmokinetic',
-    'stauder',
-    'staunchness',
-    'staunin\'',
-    'stavridis',
-    'stay-away',
-    'stayaway',
-    'steel-blue',
-    'steel-capped',
-    'steelmakers',
-    'steeply-pitched',
-    'steeply-sloping',
-    'stegmann',
     'steinbach',
-    'steinhardt',
-    'steisel',
-    'stelae',
-    'stellarator',
-    'stenay',
-    'stenholm',
-    'stening',
-    'stenopus',
-    'stenz',
-    'step-brothers',
-    'stepdaughters',
-    'stereo-typed',
-    'stereospecific',
-    'sterilant',
-    'sterilizations',
     'sterilizers',
-    'sterl.',
-    'stertorous',
-    'stewie',
-    'stibbard',
-    'stichus',
-    'stieger',
-    'stiff-faced',
-    'stiffener',
-    'stik',
-    'stiletto-heeled',
-    'still-births',
-    'stillings',
-    'stinginess',
-    'stipendiaries',
-    'stirrers',
     'stitcher',
-    'stma2000',
-    'stock-proof',
-    'stockbuilding',
-    'stockford',
-    'stockily',
-    'stockworks',
-    'stoessl',
-    'stoffel',
-    'stoichkov',
-    'stoke-by-nayland',
-    'stokely',
-    'stoloyan',
-    'stone-deaf',
-    'stone-throwers',
-    'stonechuckling',
     'stones.',
-    'stonewashed',
-    'stools/day',
-    'stoop-shouldered',
-    'stope',
-    'stoppit',
-    'storers',
-    'storeton',
-    'storied',
-    'stork-like',
-    'storm-driven',
-    'storm-trooper',
-    'storskarfjell',
-    'storyboards',
-    'stotherts',
-    'stoute-trained',
     'stoutish',
-    'stoutness',
-    'strachans',
-    'straight-forwardly',
-    'straight-sets',
-    'straight-six',
-    'straightish',
-    'strain\'',
-    'straney',
-    'strap-shaped',
-    'strasky',
-    'strathaven',
-    'strathdon',
-    'stratigraphically',
-    'stratigraphies',
-    'stratocumulus',
     'straub',
-    'streamlets',
-    'street-children',
-    'street-door',
-    'street-lighting',
-    'street-smart',
-    'streetscape',
-    'streetwalkers',
-    'strenuousness',
-    'streptomyces',
-    'stress-prone',
-    'stressed-out',
-    'stretchsuits',
-    'stretham',
-    'stridulation',
-    'strigil',
     'stringer/greenpeace',
-    'strip-lights',
-    'striplings',
-    'stripped-out',
-    'stromatoporoids',
-    'stromberg',
-    'strong-looking',
-    'strongbox',
-    'strongly-fancied',
-    'strongyloids',
-    'stronnictwo',
-    'stroock',
-    'stru',
-    'strutters',
-    'struve',
-    'stubbes',
     'stubbins',
-    'stuccoist',
-    'stucki',
-    'student-name',
-    'studien',
-    'studwork',
-    'stuporous',
-    'sturdiest',
-    'sturluson',
-    'sturman',
-    'sturridge',
-    'stylings',
-    'suakin',
-    'sub-arterial',
-    'sub-central',
-    'sub-classified',
     'sub-consciously',
-    'sub-dictionaries',
-    'sub-faculty',
-    'sub-heads',
-    'sub-integrator',
-    'sub-machine-guns',
-    'sub-maxim',
-    'sub-options',
-    'sub-orbital',
-    'sub-permian',
-    'sub-processes',
-    'sub-rule',
-    'sub-satellite',
-    'sub-schemas',
-    'sub-series',
-    'sub-stage',
     'sub-surfaces',
-    'subalar',
-    'subarea',
-    'subbies',
-    'subcategory',
-    'subcommission',
-    'subcontinental',
-    'subcontracts',
-    'subcostal',
-    'subdiscipline',
-    'subducting',
-    'subfraction',
-    'subfragment',
-    'subject-areas',
-    'subject-oriented',
-    'subject-related',
     'subject/object',
-    'subjecthood',
-    'subjectivists',
-    'subjectless',
-    'submergent',
-    'subnets',
-    'suborbital',
-    'suborn',
-    'subramanian',
-    'subrange',
-    'subspecialty',
-    'substantia',
-    'subtitling',
-    'subtleness',
-    'suburbias',
-    'succouring',
     'succulently',
-    'sucessful',
-    'suckering',
-    'suckley',
-    'suction-boots',
-    'sud-aviation',
-    'sudanis',
-    'sudomotor',
-    'suffering.',
-    'suffusion',
-    'sugar-phosphate',
-    'sugarloaf',
-    'suitably-sized',
-    'suite.',
-    'sukhothai',
-    'sulphites',
     'sulpice',
-    'sultanov',
-    'summa_cum_laude',
-    'summariser',
-    'summer-flowering',
-    'summered',
-    'summerhouses',
-    'sumner/ti',
-    'sun-compatible',
-    'sunbaked',
-    'sunderlal',
-    'sundragon',
-    'sundresses',
-    'sunlight-based',
-    'sunlounger',
-    'sunnily',
     'sunnyfield',
-    'sunsolve',
-    'super-delegates',
-    'super-format',
-    'super-glued',
-    'super-intelligent',
-    'super-phenix',
-    'super-regional',
-    'super-sub',
-    'superbrat',
-    'superdrive',
-    'superhumanly',
-    'superhumans',
-    'superimposable',
-    'supermarioland',
-    'superminis',
     'supernaturally',
-    'supernature',
-    'superscape',
-    'superscription',
-    'supershift',
-    'supersoap',
-    'superstation',
-    'superswitch',
-    'supply-room',
-    'supply-siders',
-    'supportpack',
-    'suppressions',
-    'supra-historical',
-    'supra-regional',
-    'supramarginal',
-    'supratidal',
     'supremos',
-    'surface/surface',
-    'surgeonfish',
-    'surgery.',
-    'surpassingly',
-    'surveilance',
-    'sus4',
-    'sutapa',
-    'suvla',
-    'suxavat',
-    'suya',
-    'svdp',
-    'svr4-compatible',
-    'sw2',
-    'swagger-stick',
-    'swainby',
     'swallow-tailed',
-    'swanlike',
-    'swashbucklers',
-    'swastika-peltae',
-    'swayles',
-    'sweat-pants',
-    'sweatily',
-    'sweatpants',
-    'swedish-owned',
-    'sweetpapers',
-    'swept-wing',
-    'swiecicki',
-    'swieten',
-    'swindlehurst',
-    'swingboats',
-    'swinner',
     'swirlings',
-    'switchbacks',
-    'switched-on',
-    'switcher',
-    'switching-off',
-    'swizzle',
-    'sword-shaped',
-    'swords-isherwood',
-    'sworn-in',
-    'sws715',
-    'swynford',
-    'sy35',
-    'sy85',
-    'sybyl/nmr',
-    'syc',
-    'syer',
     'sylla',
-    'sylph',
-    'sylphs',
-    'sylvius',
-    'symms',
-    'symphonically',
-    'synapomorphies',
-    'synaptosomes',
-    'synchronises',
-    'syncopal',
-    'syncrotron',
-    'syncytial',
-    'synergetic',
-    'synspilus',
-    'syntactic-semantic',
-    'syremont',
     'syrian-israeli',
-    'syst&egrave;me',
-    'systartup&mdash;v5.com',
-    'system/360',
-    'system/6000',
-    'systematists',
-    'systeme',
-    'systemview',
-    'sz&uuml;r&ouml;s',
-    'szajgin',
-    'szarkowski',
-    'szeremietiew',
-    't&acirc;tonnement',
-    't&eacute;llez',
-    't\'best',
-    't\'top',
     't+',
-    't+3',
-    't-54',
-    't-6',
-    't-butyl',
-    't-rna',
-    't-tests',
-    't.1',
-    't.3',
-    't.55',
-    't.7',
-    't.b.',
-    't.d.',
-    't.e.c.a.',
-    't.u.',
-    't.v.e.i.',
     't/maker',
-    't3n1',
-    't400',
-    'ta-ta-ta-ta',
-    'taarti',
-    'tab-packaged',
-    'tabi',
-    'tablada',
-    'table-tops',
-    'tabram',
-    'tachai',
-    'tachistoscopically',
-    'tachyarrhythmia',
-    'tactility',
-    'tactus',
-    'tadao',
     'tadd',
-    'tag-gy',
-    'tagaloa',
-    'tageia',
-    'taghribirdi',
-    'tail-fins',
-    'tail-light',
-    'tailcoats',
-    'tailcone',
-    'tailenders',
-    'tailoress',
-    'tailpieces',
-    'takaroa',
-    'takizaki',
-    'talapoin',
-    'talar',
     'talich',
-    'talionis',
-    'talland',
-    'talley',
-    'tally-ho',
-    'tanase',
-    'tangly',
-    'tanguts',
-    'tank-like',
-    'tantum',
-    'tanura',
-    'tanys',
-    'tapescript',
-    'tappah',
-    'tarasiewicz',
-    'tarasov',
     'tardelli',
-    'tardigrades',
-    'tardis-like',
-    'targowski',
-    'tarsiidae',
-    'tarsis',
-    'tartaric',
-    'tasgi',
-    'taskmasters',
-    'tata(cg)',
-    'tatata(cg)',
-    'tatersal',
-    'tattenhall',
-    'tattie',
-    'tatting',
-    'tavola',
     'tawdriness',
-    'tawil',
-    'tax-cuts',
-    'tax-exemption',
-    'tax-induced',
-    'taxonomist',
-    'taylor-young',
-    'tazieff',
-    'tc-fresh',
-    'tchakarov',
-    'tcl',
-    'tdf-i',
-    'tdfc',
-    'tdlb',
-    'tdwg',
-    'tea-drinking',
     'teaboy',
-    'teaching/training',
-    'teamed-up',
-    'teams.',
-    'tebaldi',
-    'tech-greens',
-    'technofear',
-    'technologie',
-    'technopole',
-    'tedjini',
-    'teethgrinder',
-    'teewurst',
-    'teillay',
-    'teitelbaum',
-    'tel.no.',
-    'tel.redcar',
     'telegraphing',
-    'telemetrix',
-    'telesoftware',
-    'televisionist',
-    'telidon',
-    'tell-all',
-    'telluride',
-    'telson',
-    'telt',
-    'tembu',
-    'temelin',
-    'temerlin',
-    'temiar',
-    'temperature-dependent',
-    'temple-like',
-    'tempters',
     'ten-bed',
-    'ten-forty',
-    'ten-to-one',
-    'ten-yearly',
-    'tenax',
-    'tendentiousness',
-    'tenormin',
-    'tensioner',
-    'teoctist',
-    'tepee',
-    'tepees',
-    'tepidity',
-    'teratogenic',
-    'teratogens',
-    'terday',
-    'tergiversations',
     'terminalis',
-    'termino',
-    'termtime',
-    'ternata',
-    'terreiro',
-    'terrorem',
-    'terrorises',
-    'terseness',
-    'tertiaries',
-    'tertulia',
-    'tesol',
-    'tessellata',
-    'tesseract',
-    'testatrix',
-    'testbed',
-    'testee',
     'testees',
-    'testimonium',
-    'testis-determining',
-    'tetney',
-    'tetragonal',
-    'tetralogy',
-    'tetraplegic',
-    'tewksbury',
-    'textrix',
-    'texturally',
-    'tfd',
-    'tgf&agr',
-    'thabor',
-    'thaddaeus',
-    'thaim',
-    'thalamic',
     'thankyous',
-    'thannhauser',
-    'thapsigargin',
-    'thatto',
-    'the\'',
-    'the_same',
-    'theatral',
-    'theatregoer',
-    'theatreland',
-    'theea',
-    'theed',
-    'thematize',
-    'themistocles',
-    'themistoklean',
-    'theodorou',
-    'theodosian',
     'theorisations',
-    'therm',
-    'thermai',
-    'thermalling',
-    'thermionic',
-    'thermocouples',
-    'thermography',
-    'therrien',
-    'thers',
-    'thesis-related',
-    'they\'',
-    'thiazoline',
-    'thibault',
-    'thick-enamelled',
-    'thickener',
-    'thickhead',
     'thiemens',
-    'thilo',
-    'thin-shelled',
-    'thingamy',
-    'thingey',
-    'thinly-veiled',
-    'thirsted',
-    'thirstier',
-    'thirty-five-foot',
-    'thirty-plus',
-    'thirty-two-year-old',
-    'thistlethwaite',
-    'thlayli',
-    'thole',
-    'thomae',
-    'thommie',
     'thompson/labour',
-    'thompson/northampton',
-    'thoracotomy',
-    'thornewallis',
-    'thornier',
-    'thornton-norris',
-    'thorsteinn',
-    'thorsten',
-    'thous',
-    'thousand-fold',
-    'thousands.',
-    'thowt',
-    'thr-231',
-    'thraldom',
-    'thrashers',
-    'thrashy',
     'thrasydaios',
-    'thrawn',
-    'three-axis',
-    'three-child',
-    'three-day-old',
-    'three-engined',
-    'three-foot-high',
-    'three-four',
-    'three-in-one',
-    'three-months',
-    'three-parts',
-    'three-pin',
-    'three-putting',
-    'three-roomed',
-    'three-second',
-    'three-shot',
     'three-twenty',
-    'three-two',
-    'three-yard',
-    'threeish',
-    'threepennies',
-    'threesomes',
-    'throckley',
-    'thromboembolism',
-    'thrombolytics',
-    'thrombotic',
-    'through-composed',
-    'throwaways',
-    'thrustful',
-    'thse',
-    'thuja',
-    'thundercloud',
     'thyristor',
-    'tibaldi',
-    'tibatto',
-    'tiberias',
-    'tickell/friends',
-    'tidemarks',
-    'tidemills',
-    'tienchai',
-    'tietz',
-    'tightly-coupled',
-    'tilsley',
-    'timakata',
-    'timar',
-    'timarli',
-    'time&rehy;consuming',
-    'time-independent',
     'time-up',
-    'timesing',
-    'timeslips',
-    'timman-speelman',
-    'timorously',
-    'tin(s)',
-    'tin-openers',
-    'tinamou',
-    'tinctoria',
-    'tindouf',
-    'tinkhundla',
-    'tinnunculus',
-    'tinsmith',
-    'tinsmiths',
-    'tinto-zinc',
-    'tintswalo',
     'tipplers',
-    'tipsily',
-    'tiranti',
-    'tissue-type',
-    'titism',
-    'title-holders',
-    'title-role',
-    'titleist',
-    'titterington',
-    'tm2',
-    'tmca',
-    'tms320c30',
-    'tn28',
-    'tn5',
-    'tne',
-    'to-ings',
     'toad-in-the-hole',
-    'tobey',
-    'toda',
-    'today/25.10.93',
-    'toe-rags',
-    'toffee-brown',
-    'toisech',
-    'tokay',
-    'tomahawks',
-    'tomasek',
-    'tomasinianus',
-    'tomen',
-    'tomograms',
-    'tomonori',
-    'tomorrer',
-    'toned-down',
     'tongo',
-    'tonsures',
-    'too-close',
-    'too-tight',
-    'tooby',
-    'tooheys',
-    'toothpicks',
-    'toothpluckling',
-    'tooths',
-    'top-fermenting',
-    'top-six',
-    'top-two',
-    'topix',
-    'torajaland',
-    'torao',
-    'torchlights',
     'torchraven',
-    'torcs',
-    'torfwerk',
-    'torkington',
-    'torn-off',
-    'toror',
-    'torville',
-    'tosani',
-    'tosg',
-    'tossers',
-    'toted',
-    'totoaba',
-    'totty',
-    'toupees',
-    'tour-de-force',
-    'tour-operators',
     'touraction',
-    'tourish',
-    'tousle',
-    'tow-rope',
-    'tower-block',
-    'tower-house',
-    'toweringly',
-    'town-bred',
-    'towneley',
-    'toxicologist',
-    'toy-like',
-    'toyah',
-    'toyboys',
-    'toymaker',
-    'toymakers',
-    'toyoda',
     'tpfr',
-    'tpp',
-    'tpsb',
-    'tr-1',
-    'tr4',
-    'trabajo',
-    'traceless',
-    'trachoma',
-    'trachtenberg',
-    'trachyte',
-    'trade-unionist',
-    'trading.',
-    'tradition-bound',
-    'traffic-jams',
-    'tragedienne',
-    'tragi-comic',
     'train-set',
-    'traineeships',
-    'training-ground',
-    'traitorously',
-    'tralbaut',
-    'tram-cars',
-    'tramp-like',
-    'tranent/musselburgh',
-    'tranquiliser',
-    'trans-alpine',
-    'trans-andean',
-    'trans-binary',
-    'trans-pyrenean',
-    'trans.',
-    'transexuals',
-    'transferrable',
     'transferrin/creatinine',
-    'transfiguring',
-    'transformatory',
-    'transfuse',
-    'transliteration',
-    'transmittable',
-    'transmitter/receiver',
-    'transnasally',
-    'transoceanic',
-    'transome',
-    'transperambulation',
-    'transplantable',
-    'transplastix',
-    'transportations',
-    'transsexuality',
-    'trapaud',
     'traub',
-    'trav\'us',
-    'travailliste',
-    'traveled',
-    'traversers',
-    'traylor',
-    'treasurable',
-    'treatwater',
-    'tree-structured',
-    'treecreepers',
-    'treet',
-    'treetrunk',
-    'treitschke',
-    'tremain',
-    'tremblings',
-    'tremolos',
     'trencherman',
-    'trenck',
-    'trendily',
-    'trendsetting',
-    'trentin',
-    'trento',
-    'trenz',
-    'trerice',
-    'tressler',
-    'trevellian',
-    'trewin',
-    'tri-colour',
-    'tri-coloured',
-    'tri-lux',
-    'triatomic',
-    'tricart',
     'trichostrongyle',
-    'trifoliata',
-    'trifoliate',
-    'triggs',
-    'trikes',
-    'trimalchio',
-    'trimley',
-    'trin',
-    'trinculo',
-    'trinidads',
-    'trinnacle',
-    'trinordiol',
-    'triodontophorus',
-    'trip-wires',
-    'triphosphates',
-    'triphthong',
     'triple-b',
-    'tripleprint',
-    'triplicates',
-    'triploids',
-    'triptychs',
-    'tris/hcl',
-    'trisomet',
-    'trivializes',
-    'trobe',
-    'trochantin',
-    'trofimovich',
-    'troisi&egrave;me',
-    'troleyadan',
-    'tronic',
-    'troubleshoot',
-    'troubridge',
     'troumouse',
-    'troupp',
-    'troutsdale',
-    'trouv&eacute;s',
-    'trouv&egrave;res',
-    'trs',
-    'truan',
-    'truesdale',
-    'truff&eacute',
-    'truffes',
-    'trummelbach',
-    'trumwine',
-    'trussler',
-    'truth.',
-    'try-count',
-    'try-on',
     'trybuna',
-    'tryscorers',
-    'ts4525',
-    'tseveenjavyn',
-    'tso',
-    'tsxp2',
-    'tte',
-    'tube.',
-    'tubulars',
-    'tuckoo',
-    'tudev',
-    'tudy',
-    'tug-boat',
-    'tugendhat',
-    'tughluks',
-    'tulip-shaped',
     'tullius',
-    'tullos',
-    'tully-west',
-    'tumbaga',
-    'tumorigenicity',
-    'tundra-like',
-    'tundras',
-    'tunefully',
-    'tunesmiths',
-    'tunnel-related',
-    'tunnel-visioned',
-    'tunstalls',
-    'tupe',
-    'tupelo',
-    'turan',
-    'turbo-charging',
     'turgidity',
-    'turkey-red',
-    'turki',
-    'turkish-born',
-    'turlough',
-    'turn-in',
-    'turncoats',
-    'turned-on',
-    'turner-harvest-ramirez',
-    'turnkeys',
-    'turnwise',
-    'turquin',
-    'turtle-doves',
-    'tussore',
-    'tut-tuts',
-    'tuta',
     'tutor-librarian',
-    'tvlr',
-    'tw11',
-    'tw3',
-    'twangy',
-    'tweezer',
-    'twel',
-    'twelve-forty-five',
-    'twenty-something',
-    'twentysomething',
-    'tweseldown',
-    'twid',
-    'twin/double',
-    'twinem',
-    'twinkles',
-    'twinkleton',
     'twisleton',
-    'twitchiness',
-    'two-facedness',
-    'two-foot-high',
-    'two-male',
-    'two-masted',
-    'two-monthly',
-    'two-octave',
-    'two-on-one',
-    'two-piano',
-    'two-two',
-    'two-under-par',
-    'twynham',
-    'tympana',
-    'typhis',
-    'tyrannically',
     'tyrannised',
-    'tyube',
-    'tzintzuntzan',
-    'u&prime',
-    'u-shape',
-    'u.21',
-    'u.556',
-    'u.e.e.',
-    'u/',
-    'u/mg',
-    'u3',
-    'u4',
-    'u6-rna',
-    'uab',
-    'ub40s',
-    'ubar',
     'uberrimae',
-    'ucnw',
-    'udall',
-    'udf-affiliated',
-    'uemura',
-    'uezdy',
-    'uferi',
-    'ufficio',
-    'ufologist',
-    'uk-usa',
-    'uk2000',
-    'ulman',
-    'ulmaria',
-    'ulsterior',
-    'ultra-cautious',
-    'ultra-safe',
     'ultra-violent',
-    'ultramodern',
-    'ultranationalism',
-    'ultrasparcs',
-    'ululation',
-    'ulyanov',
-    'umax',
-    'umb',
-    'umbo',
-    'umc',
-    'un-french',
-    'unadapted',
-    'unadventurously',
-    'unadvertised',
-    'unaligned',
-    'unan',
     'unanalytical',
-    'unapparent',
-    'unappeasable',
-    'unargued',
-    'unascertainable',
-    'unasked-for',
-    'unbanded',
-    'unbecomingly',
-    'unbiblical',
-    'unblessed',
-    'unblushing',
-    'unbraided',
-    'unbridged',
-    'unbruised',
-    'unbuttressed',
-    'uncalibrated',
     'uncared-for',
-    'uncashed',
-    'uncatalogued',
-    'uncatchable',
-    'uncategorisable',
-    'uncharacterised',
-    'unchastened',
-    'unchildlike',
-    'unchipped',
-    'uncle-in-law',
-    'unclearly',
-    'uncomforted',
-    'unconsumed',
-    'uncontestable',
-    'uncontrollability',
-    'uncorroded',
     'uncracked',
-    'uncreased',
-    'uncropped',
-    'uncrossable',
-    'uncrossing',
-    'undecidable',
-    'undemocratically',
-    'under-13s',
-    'under-carriage',
-    'under-class',
-    'under-counted',
-    'under-explored',
-    'under-exposure',
-    'under-floor',
-    'under-gardener',
-    'under-housemaid',
     'under-insured',
-    'under-occupied',
-    'under-par',
-    'under-pinning',
-    'under-pressure',
-    'underbidders',
-    'undercount',
-    'underflow',
-    'underforesters',
-    'underlyingly',
-    'undermanning',
-    'undermentioned',
-    'underprovision',
-    'underreported',
-    'underresourced',
-    'underslip',
     'undersoil',
-    'underspecified',
-    'undertenants',
-    'underutilised',
-    'underworked',
-    'undesirably',
-    'undiscerning',
-    'undissolved',
-    'undomesticated',
-    'undulants',
-    'undulatus',
-    'unelectability',
-    'unembittered',
-    'unemployment.',
-    'unexportable',
-    'unextended',
     'unfaded',
-    'unfading',
-    'unfairnesses',
-    'unfamous',
-    'unfeasibly',
-    'unfelt',
-    'unfermented',
-    'unfished',
-    'unflurried',
-    'unfluted',
-    'unforgotten',
-    'unfractured',
-    'unfurrowed',
-    'ungrafted',
-    'unhand',
-    'unharmonious',
     'unhatched',
-    'unhewn',
-    'unicorn-kanchana',
-    'unida',
-    'unidiomatic',
-    'unifier',
-    'unimpassioned',
-    'unimplemented',
-    'uninduced',
-    'uninflamed',
-    'uninspected',
-    'uninterestedly',
-    'union-patriotic',
-    'union-set',
-    'union-wide',
-    'unisons',
     'unitatis',
-    'universalisability',
-    'universelle',
-    'unix-on-the-desktop',
-    'unix-type',
-    'unkissed',
-    'unlatch',
-    'unlistenable',
-    'unloose',
-    'unmelodious',
-    'unmerciful',
-    'unmlo',
-    'unmodernised',
-    'unmoored',
-    'unnameable',
-    'unnormalized',
     'unobscured',
-    'unobtrusiveness',
-    'unocal',
-    'unoriented',
-    'unostentatiously',
-    'unpacks',
-    'unpardonably',
-    'unpasteurized',
-    'unpenalised',
-    'unpfa',
-    'unphilosophical',
-    'unplayed',
-    'unposed',
-    'unprecendented',
-    'unprescribed',
-    'unpressurized',
     'unpretending',
-    'unprimed',
-    'unprofitability',
-    'unprogrammed',
-    'unprovocative',
-    'unquenched',
-    'unrecognisably',
-    'unreduced',
-    'unreeled',
-    'unregimented',
-    'unreinforced',
-    'unremitted',
-    'unremunerated',
-    'unrepresentativeness',
-    'unresistingly',
-    'unrestrainedly',
     'unromantically',
-    'unscrambled',
-    'unself-conscious',
-    'unsentimentally',
-    'unsettlement',
-    'unshadowed',
-    'unshaved',
-    'unshelled',
-    'unshipped',
-    'unsmoked',
-    'unspecialised',
-    'unsportingly',
-    'unsprayed',
-    'unstandardised',
-    'unstreaked',
-    'unsubsidized',
     'unsubstantial',
-    'unsulphated',
-    'unsummoned',
-    'unsusceptible',
-    'unswept',
-    'unsynchronised',
-    'unterberg',
-    'untermeyer',
-    'untimetabled',
-    'untruthfulness',
-    'untucked',
-    'untuned',
-    'untwist',
-    'untwisting',
-    'unusual-looking',
-    'unusualness',
     'unversed',
-    'unviolated',
-    'unwatered',
-    'unweighted',
-    'unwelcomed',
-    'unwerth',
-    'unwieldiness',
-    'unwished',
-    'unworn',
-    'unworthily',
-    'up-coming',
-    'up-to-',
-    'upa',
-    'updatable',
-    'upendra',
-    'upgradability',
     'uploading',
-    'upper-floor',
-    'uppish',
-    'upratings',
-    'uprush',
-    'upshire',
-    'upsidedown',
-    'upsta',
-    'upstroke',
-    'upswings',
-    'urairat',
-    'urania',
-    'urban/rural',
-    'ureilites',
-    'urgencies',
-    'urgency.',
     'uridian',
-    'urinous',
-    'urm',
-    'urnst',
-    'urogenital',
-    'us&amp&dollar',
-    'us&dollar;000',
-    'us&dollar;1,100,000',
-    'us&dollar;1,600,000',
-    'us&dollar;1.00=280.5000',
-    'us&dollar;1.00=a&dollar;1.2481',
-    'us&dollar;120,000,000',
-    'us&dollar;13,500',
-    'us&dollar;130',
-    'us&dollar;130,000,000',
-    'us&dollar;14,000',
     'us&dollar;16,000',
-    'us&dollar;17,000,000',
-    'us&dollar;170',
-    'us&dollar;18',
-    'us&dollar;19,000,000',
-    'us&dollar;2,500,000',
-    'us&dollar;2,600',
-    'us&dollar;2,800',
-    'us&dollar;29,000',
-    'us&dollar;3,800',
-    'us&dollar;300,000',
-    'us&dollar;33,000',
-    'us&dollar;4,100',
-    'us&dollar;4,750',
-    'us&dollar;400,000',
-    'us&dollar;430',
     'us&dollar;44,000',
-    'us&dollar;45,000,000',
-    'us&dollar;450,000,000',
-    'us&dollar;49,000,000',
-    'us&dollar;5',
-    'us&dollar;50',
-    'us&dollar;55',
-    'us&dollar;570',
-    'us&dollar;6,500',
-    'us&dollar;600,000',
-    'us&dollar;7,000,000',
-    'us&dollar;7,600',
-    'us&dollar;700,000,000',
-    'us&dollar;8',
-    'us&dollar;90,000,000',
-    'us&dollar;930',
     'us-iraqi',
-    'us-registered',
-    'us-uk',
-    'us3',
-    'usa/1989/cert',
-    'used_in',
-    'user-configurable',
-    'user-interface',
-    'user/carer',
-    'userid',
-    'utamaro',
-    'uth',
-    'utopie',
-    'utterance-initial',
-    'uv/vis',
-    'uvc',
     'uxp/m',
-    'uzzan',
-    'v&aelig;r&oslash;y',
-    'v&eacute;raison',
-    'v-2s',
-    'v-necks',
-    'v-tools',
-    'v.-p.',
-    'v.32bis',
-    'v.4-compliant',
-    'v.a.',
-    'v.s.',
-    'v/multi-level',
-    'v/r',
-    'v21',
-    'v22',
     'v27ter',
-    'v29',
-    'v3.0',
-    'v42bis',
-    'vacances',
-    'vacante',
-    'vacantia',
-    'vacaroiu',
-    'vacational',
-    'vaccae',
-    'vadasz',
-    'vadis',
-    'vaea',
-    'vaidya',
-    'vaison-la-romaine',
-    'vajda',
     'valdieu',
-    'valence-electron',
-    'valent&iacute;n',
-    'valify.txt',
-    'valk',
-    'valladares',
-    'vallecas',
-    'valles',
-    'valls',
-    'valtellina',
-    'value-added/success',
-    'value-components',
-    'value-orientation',
-    'value-systems',
-    'valvular',
-    'vanda',
     'vandivier',
-    'vapeur',
-    'vapidity',
-    'vapourchips',
-    'vapourware',
-    'varanger',
-    'vardar-morava',
-    'varesco',
-    'variabilities',
-    'variance-covariance',
-    'variator',
-    'varlan',
-    'varyingly',
-    'vascons',
-    'vascularisation',
-    'vase-decoration',
     'vase-painter',
-    'vasospasm',
-    'vat-exclusive',
-    'vathek',
-    'vatnaj&ouml;kull',
-    'vautrin',
-    'vaxstation',
-    'vazirani',
-    'vc10s',
-    'vdb',
-    'veazey',
-    'vedder',
-    'veerasamy',
-    'veevers',
-    'vegetatively',
-    'veivers',
     'veldt',
-    'velux',
-    'venational',
-    'venationes',
-    'vendale',
-    'vendor-neutral',
-    'vene',
-    'venecia',
-    'venerability',
-    'venereologists',
-    'venerunt',
-    'vennel',
-    'ventersdorp',
-    'ventralis',
-    'ventriloquial',
-    'venulosum',
     'verbalisations',
-    'verbalised',
-    'verbalization',
-    'verbascum',
-    'verbenaceae',
-    'verbex',
-    'verbless',
-    'vercueil',
-    'verden',
-    'verge-and-foliot',
-    'veritably',
-    'verne-smiths',
-    'veronico',
-    'verticillata',
-    'veruschka',
-    'vervain',
     'verversity',
-    'vesalius',
-    'veseth',
-    'vesle',
-    'veta',
-    'vexillation',
-    'vi&sacute;i',
-    'vi-3',
-    'viadana',
-    'vibrance',
-    'vibrissae',
-    'vice-chairmanship',
-    'vice-governor',
-    'vice-ministerial',
-    'vice-regal',
-    'vice_versa.',
     'vickey',
-    'vicoli',
-    'vidal-saint',
-    'vidal-saint-phalle',
-    'video-cassettes',
-    'video-in',
-    'video-recorders',
-    'video/jessica',
-    'video/kim',
-    'video/tim',
-    'viewindex',
-    'vigars',
-    'vigleik',
-    'vignoles',
-    'vigon',
-    'viii.',
     'vijaya',
-    'viliam',
-    'villafranca',
-    'village-like',
-    'villainous-looking',
-    'vimukti',
-    'vincent-jones',
-    'vinct',
-    'vinerian',
-    'vinha',
-    'vinified',
-    'vintry',
-    'violinschule',
-    'vionville',
-    'vipond',
-    'virally',
     'virden',
-    'virens',
-    'virginiana',
-    'virtualstation',
-    'viscerally',
-    'viscious',
-    'vishwendra',
-    'visick',
-    'visioncare',
-    'visionless',
-    'visitatorial',
-    'visky',
-    'visualizes',
-    'vitalizing',
-    'vitc',
-    'viticella',
     'vitou',
-    'vitrines',
-    'vitronectin',
-    'vittatus',
-    'viverify',
-    'vivified',
-    'vivoli',
-    'viziers',
-    'vlahs',
-    'vlbw',
-    'vlf',
-    'vlll',
-    'vln',
-    'vm+',
-    'vmro-dpmne',
-    'vocalised',
     'voicebox',
-    'vol&eacute;e',
-    'vol:vol',
-    'volagir',
-    'volkhov',
-    'voltage-controlled',
-    'voltage-operated',
-    'voltage.controlled',
-    'voltammetry',
-    'voltigeur',
-    'volumnia',
-    'vortec',
-    'vorticists',
-    'voskresenie',
-    'vostro',
-    'votaries',
     'votes.',
-    'vould',
-    'vraiment',
-    'vrej',
-    'vrto',
-    'vt/vf',
-    'vt229',
-    'vt3',
-    'vtc',
-    'vtsik',
-    'vulgarism',
-    'vulgarization',
-    'vynal',
-    'vyshinsky',
-    'w.11',
-    'w.bl.',
     'w/1',
-    'w13',
-    'w1e',
-    'wa7',
-    'wacc-asia',
-    'wacc-europe',
-    'wacc-sponsored',
-    'wackersdorf',
-    'wackier',
-    'waffly',
-    'wage-allowance',
-    'wage-books',
-    'wageless',
-    'wagons-lits',
-    'wagstaffe',
-    'waiflike',
     'wait&mdash;flag/',
-    'wajda',
-    'wakara',
-    'wakely',
-    'waldren',
-    'waley',
-    'walk-off',
-    'walk-through',
-    'walkden',
-    'walklin',
-    'wall-hanging',
-    'wall-plates',
-    'wallac',
-    'walled-in',
-    'wallet-sized',
-    'wallplate',
     'wallpowered',
-    'wallrafplatz',
-    'wallsworth',
-    'walter-guillaume',
-    'walzerkoenig',
-    'wamwere',
-    'wandsbergh',
-    'want-away',
-    'wanted.',
-    'war-memorial',
-    'warden/manager',
-    'ware\'ouse',
-    'warfield',
-    'wargrave',
-    'warm-white',
-    'warmington',
     'warnin\'',
-    'warrior-king',
-    'wart-like',
-    'wartburg',
-    'wash-down',
-    'washbrooke',
-    'washerman',
-    'washing-day',
-    'wasi',
-    'wasp-like',
-    'wasserstein',
-    'watcha',
-    'watchfires',
-    'watchkeeper',
-    'water-boatmen',
-    'water-chestnuts',
     'water-fleas',
-    'water-proof',
-    'water-quality',
-    'waterbeach',
-    'waterslide',
-    'waterspout',
-    'waterstart',
-    'watsonian',
-    'watsonville',
-    'wavelike',
-    'waverer',
-    'waveringly',
-    'waxbill',
-    'waziers',
-    'wd/06/25/0001',
-    'wdn',
     'wdv',
-    'we/they',
-    'weakley',
-    'weapons-free',
-    'weare/raf',
-    'wearies',
-    'weather-stained',
-    'weather-stripping',
-    'weatherboards',
-    'weathercocking',
-    'weatherstone',
-    'weavings',
-    'webbington',
-    'wed&ndash;fri',
-    'wedding-present',
-    'weed-choked',
     'weedbed',
-    'week-day',
-    'week-in',
-    'weekly-payment',
-    'weeow',
-    'wegmuller',
-    'weightlessly',
-    'weinburg',
-    'weinrich-haste',
-    'weippe',
-    'weizenbaum',
-    'weld-blundell',
-    'welfare-state',
-    'well-bedded',
-    'well-cared',
-    'well-deserving',
     'well-drafted',
-    'well-priced',
-    'well-referenced',
-    'well-sheltered',
-    'well-sorted',
-    'well-staffed',
-    'wellingtonia',
-    'wellsian',
-    'wenceslaus',
-    'wessis',
-    'west-end',
-    'west-north-west',
-    'westbury-sub-mendip',
-    'western-educated',
-    'westfalen',
-    'westford',
     'westgarth',
-    'westminister',
-    'westphalians',
-    'wet-into-wet',
-    'wet-nursing',
-    'wetherill',
-    'wetters',
-    'wgfp',
-    'whaa',
-    'whatever-it-was',
-    'wheedles',
-    'wheelarch',
-    'while-you-wait',
-    'whimsey',
-    'whinchat',
-    'whinings',
     'whipper-in',
-    'whippings',
-    'whish',
-    'whisperer',
-    'whistle-blowers',
-    'whistlestop',
-    'whitakers',
-    'whitall',
-    'white-beaked',
-    'white-cheeked',
-    'white-topped',
-    'whiteabbey',
-    'whiteadder',
-    'whitedown',
-    'whitesand',
-    'whitesands',
     'whiteson',
-    'whitewood',
-    'whitland',
-    'whitting',
-    'whizz-kids',
-    'whizzkids',
-    'whoomph',
-    'whooping-cough',
-    'whw',
-    'wibberley',
-    'wibble',
-    'wicketless',
-    'wickson',
-    'wide-angled',
-    'wide-band',
-    'wide-boys',
     'wide-necked',
-    'wide-toothed',
-    'widely-available',
-    'widescreen',
-    'widman',
-    'wieden',
-    'wiener_schnitzel',
-    'wife-givers',
-    'wife/husband',
-    'wilce',
-    'wildbrooks',
-    'wildfowlers',
-    'wildfowling',
-    'wildsmith',
-    'wiliness',
-    'willful',
     'willie-john',
-    'willmouse',
-    'willner',
-    'willoughbys',
-    'willowbank',
-    'wilson-johnson',
-    'wilson-smith',
-    'win/loss',
-    'wina',
-    'winbond',
-    'winceyette',
-    'winchburgh',
-    'winchman',
-    'wind-pollinated',
-    'wind-stirring',
-    'wind-tossed',
     'windcheaters',
-    'windlesham',
-    'windows-like',
-    'windows-to-unix',
-    'windows4gl',
-    'windrow',
-    'windscreen-wipers',
-    'wine-coloured',
-    'wine-shippers',
-    'winecellars',
-    'wines.',
-    'wing-bars',
-    'wingates',
-    'wingback',
-    'wingman',
-    'wingnuts',
     'winkle-pickers',
-    'winless',
-    'winstone/rspca',
-    'winter/spring',
-    'wire-rimmed',
-    'wired-in',
-    'wish-lists',
-    'wishfully',
-    'wissembourg',
-    'wist',
-    'witchard',
-    'with_each',
-    'withington/gloucestershire',
-    'witnesham',
-    'wizzo',
-    'wlaa',
     'woa',
-    'wobblers',
-    'wohlenberg',
-    'wolage',
-    'wolfit',
-    'wolfowitz',
-    'wolfschmidt',
-    'wolhusen',
-    'wollastonite',
-    'womanish',
-    'womans',
-    'women-folk',
-    'women-years',
-    'wonderfull',
-    'wonderlands',
-    'wonderments',
     'wonford',
-    'wood-cuts',
-    'wood-engravings',
-    'woodchucks',
-    'woodcutting',
-    'wooden-framed',
-    'woodies',
-    'woodmansey',
-    'woodrop',
-    'woodsmen',
-    'woolleys',
-    'woolrych',
-    'woomph-woomph',
-    'wootten',
-    'woozily',
-    'woozley',
     'word-final',
-    'word-maker',
-    'word-pictures',
-    'wordcraft',
-    'words/min',
-    'work-flow',
-    'work-horses',
-    'work-hours',
-    'work-hungry',
-    'work/leisure',
-    'workcards',
-    'workchart',
-    'worker.',
-    'workerist',
-    'working-level',
-    'world-ranked',
     'world-sheet',
-    'world-soul',
-    'worlock',
-    'worm-lions',
-    'worner',
-    'worshipable',
-    'worthiest',
-    'wortmann',
-    'worzel',
-    'woss',
-    'wotsit',
-    'wrang',
-    'wrapover',
-    'wraysbury',
-    'wrestlemania',
-    'wright/gloucestershire',
     'wright/senior',
-    'wrinkliness',
-    'wriston',
-    'write/paint/draw',
-    'writedown',
-    'writen',
-    'writhings',
-    'writing-up',
-    'wrong-headedness',
-    'wt-',
-    'wt-like',
-    'wt/vol',
-    'wulfsige',
-    'wun',
-    'wunnerful',
-    'wus(uk)',
     'wv',
-    'wyching',
-    'wymark',
-    'wymington',
-    'wynberg',
-    'wynde',
-    'wynkyn',
-    'wynne-williams',
-    'x*',
-    'x-alt',
-    'x-cell',
-    'x-chromosome',
-    'x-shaped',
-    'x/y',
-    'x5',
-    'xa(c)',
     'xa1',
-    'xanana',
-    'xaverians',
-    'xd2',
-    'xe1+',
-    'xenobiotics',
-    'xg2',
-    'xg3',
-    'xg6',
-    'xh2',
-    'xhoi',
-    'xi.',
-    'xingu',
-    'xinu',
-    'xk120',
-    'xlviii',
     'xor',
-    'xpc',
-    'xrt/3d',
-    'xuanping',
-    'xv-a-side',
-    'xxii\'s',
-    'xxxxxx',
-    'y\'got',
-    'y-maze',
-    'y9,700',
-    'yaa-ma',
-    'yacimientos',
-    'yagcibedir',
-    'yagub',
-    'yakut',
-    'yamato-1',
     'yanaev',
-    'yankel',
-    'yann',
-    'yaovi',
-    'yarkand',
-    'yarmuk',
-    'yarnell',
-    'yarraman',
-    'yasukuni',
-    'yasuo',
-    'yawed',
-    'yc5',
-    'yd3',
-    'ye-e-es',
-    'year-in',
-    'yeares',
     'yearley',
-    'yearned-for',
-    'yeeeow',
-    'yellow-legged',
-    'yellowish-brown',
-    'yellowlees',
-    'yellowy-green',
-    'yemer',
-    'yendle',
-    'yeni&ccedil;eri',
-    'yerse',
-    'yevgeniy',
-    'yj',
-    'yndamiro',
-    'yntt',
-    'yohei',
     'yoichi',
-    'yoka',
-    'yoksam',
-    'yolky',
-    'yorckstrasse',
-    'yorkshire-tyne',
-    'yorkshirewoman',
-    'you_at',
-    'ythanbank',
-    'yuichi',
-    'yunan',
-    'yurchenko',
-    'yvelines',
-    'yyyy',
-    'z01',
-    'zagora',
     'zagros',
-    'zahn',
-    'zaim',
-    'zalewski',
-    'zambonini',
-    'zanda',
-    'zandering',
-    'zaslaw',
-    'zayn',
-    'zbonszyn',
-    'zborowskis',
-    'zdzislaw',
-    'zealotry',
-    'zeldovich',
-    'zenana',
-    'zhinsky',
     'zhirinovsky',
-    'ziaur',
-    'zieten',
-    'zilligen',
-    'zilzal',
-    'ziming',
-    'zingari',
-    'zinkeisen',
-    'zmodem',
-    'znf37',
-    'zoetrope',
-    'zombie-like',
-    'zonula',
-    'zopyros',
-    'zubaydat',
-    'zubin',
     'zunfthaus',
-    'zunz',
-    'zurichers',
-    'zweeloo',
-    'zwelakhe',
-    'zygotes',
+)
+
+blocks_25 = (
+    '!+ccaron;edok!8eacute;l&eacute;mentaire!)mdash;led!\'ndash;1""um!+oslash;ster!.scaron;umadija #\'73"!9!&angin\'"#tes!"c\'!(eighties!\'subject 4--------------------',
+    '!$free!#ine!$less!%owned!\'related!#see!"wa \'0-6-0st!$.75p 01&frac12&ndash;3(&;-inch!*-direction!$.75p""9p!\'00-acre',
+    '$$watt#\'base-vg"#5mm"#70s"&am-3pm""mw!&1-week!&2-page#%stone#%track"%0-day!"4-!$5.6p"&0-year!\'6-point',
+    '!%9-day"*42&ndash;3"&89-see \'2&ndash\');2&frac12(#3ft!%-star"&tailed!$.75p!\'0-point"%8-pin!%1-gun#$inch!-4-hours-a-day!\'50-mile',
+    '!)70-member!(9-member \'30-page"&0-acre$&member!"1s!&2-page!%5-day!&6-year!(86-based *400-member %5-day!(0-footer")0&ndash;1!$50mm',
+    ' %7.25p!)100-based!#37s!(5-member \'8-valve!*0386-based!#5ft &9-iron!&am-5pm!!f $a-26"#320"!a!#330!"a\'',
+    '!#bbo$%tsley""cs"(desselam#\'ulkarim$&rahman""is"&rading"&sconds#!u"!t"%utted!*canthaceae")cessioned&%orise',
+    '#4identally-on-purpose"*etonitrile"!g""ha$"rd#%imota#"ym"#idy""lu""op"&rostic""ss"%tifed"&ucobol!%djani',
+    '"3ministrator-general"+ventureland!&erotow"#tna!$faik#!n"#dam"%flick#&ricate)!s"*rocentrism!%gates#!w"&lionby""ri',
+    '!(hasuerus"!d"$imsa"$rens"#san""ve!$idid"%nscow$!i"&r-lock##bed#%fares$%orces#*line-style!#kar',
+    '#$rman")rokorinth!&l-bakr#$hoss#%kaisy"#ack"$barn#$ergo#,rechtstrasse"#dea#$udes""fs"!g"#iki#$nova',
+    '"#ker#$ynes"%l-age$%wheel#"am#$ders#%eycat#!i$#bar#$oted"$main$$viva$!y#%ithak%$rine',
+    '"!o"(penblick#+ha-amanitin%+fetoprotein%%meric##ini"\'sogaray"#ten$$rn-8#%horps"%u-pcr"&yattes!/m&eacute;ricain"#ada$"eo',
+    '%$lyst#"on"%eling#+rican-built($ness("us"!f"#mon%\'ia-soda"/phetamine-based"#rit"%yntas!%nanas##rch#(stomosed',
+    '"(chor-man#%ienne"\'d&mdash#!\'#*riamanjato$&omache"(esthesia")glophilia",imal-welfare#$xter""ja")kylosaurs"!m"$necy##ona',
+    '"\'ostomus#%thers""sr#"ty"%tenne$\'rograde#.hropomorphised#*i-congress%)defection%&emetic%%fraud%%gipsy%+immigration%\'marxism%$p107',
+    '%#rat%%serum\'$xism&%trike%&terror$\'bonding$)climactic$%llean$$scum%&thenes$%virus$#war"$y\'ow#$fink!%ouzou',
+    '"\'paloosa#%erley%&tained#!l"#rch##ile"#sac#$imon"#uan!\'quastar#&itania!(raucaria#"wa"$beit#$orio',
+    '#"ot#&system#%uated"$dern#%leigh""en""gc#%entea#"ie"#ial#!l#)stogeiton#*zona-based"(kwrights"&m-band',
+    '#!e$\'ntieres#"or$%uring"%ncott#&olfini"$pino".r&oacute;spide##ate$!u"%tcare"#von!(scherson##ott"%hpole',
+    '"*ikpasazade#!o""mt"#ner"$pley"&sumpta!+t-the-money"$abai"$choo"!l#*anta-based&%icist""ol##ssa"%ropos',
+    '$&inders"$ween!$uber%!n"$cctu",dio-tutorial%$line")jourd\'hui"!l"$mann"\'stravel"&togiro$$trol#"ry#-umn-flowering',
+    '!)valanched"#ion"!o!"w\'"&ay-day""bl!+xe-wielding!%zande""ed"$hari ,b&acirc;teau#,macr;rakotes"-eacute;atrice!$\'ham!"20',
+    '#$olat#$ying$#sat%"un"#cco%$uche#(h-busoni#&illary#(k-garden%)siphonage%\'to-work&\'racking$&firing%$lush$\'sliders',
+    '$&tracks"\'dakshan#%erini"&gendon""ha"#ika#"le$)ie-depute&!s"%jrang""ka"&le-arm#,l-and-socket%\'winning$%asted',
+    '$!i%$nary\'&screen$\'ycotton%)treabhair#&strode#&winder#"za"\'ncilhon#$esto#$gler#%ktrak#$teng"\'r-belle$#top',
+    '$$iere#)clayshare$%oding#%dolet&"ph#+ge-boarding#%lerin#$nato#$rani%"ss$!i$\'ow-load#$shai#&toncik"%shkir',
+    '#)s-playing$!e%(nthwaite##uki""ta$!k#$elle#$neec"!u##lig#$mann"$vins"&yadere#$leaf#!t',
+    '"#ana#%r-hug$$wood#\'uchamps$\'harnais$(t&eacute"%ckets")d-hopping#&azzled#&izened#,sitting-room#%t-ttf"$ebob#\'chcraft#!k',
+    '"&fogged"%ggary"!h"#jan""li$"ve#&l-pull$%field$&iustin$&ringer$%tower$(y-aching&%laugh#%marsh")nedettini',
+    '#"li#%neton#!o#&redjeb")rg&eacute$$eron$$otte$!s#\'htfrith#"ko#\'laymont#&nardin#"ol#\'rington$&yfield',
+    '"*schastnikh#(sborough#&t-rule"*ta-blocker#$inna#%weeen"\'velling"!w#!a#%igged"#yen!$have!%iazon"%blios"$carb',
+    '"(erkeller"(furcates"&g-bang##hts")kini-clad"\'lletted$)iard-ball##ney"*o-chemical$+engineering#&ethics#$fuel#\'metrics#$pics$\'roducts',
+    '"%rchin"%smark"(t-by-bit#"ci#*umen-based")vouacking!\'labbing#*ck-leather&#tie%#cap%%friar%$lead%%watch#%stoid#%zered',
+    '#%ssin\'"$iddy#$ssed&!t#&theman$#zes")ock-grant%$head#"gg#$ndin#\'odheart%\'sucking#%ugram#&wflies"!s',
+    '#\'e-water$#man#\'ndstone$\'t-ended!$miss!+oatbuilding#%vista"$bbio"$doni#\'y-image$$care$$shop"#hem"(livianos##lin',
+    '"#mbe$$load"&nanzas$#tti#(dholding#+e-crunching%&setter##ita#%neted##omi#$tcho"&ohaker#*k-learning%*publishing%\'to-bill',
+    '#\'merangs#"re#\'tlegged""ps"+rb&oacute;n##dah#$gias#)ough-wide\'\'mongers"\'tallack#!s#\'tle-top&\'necking"&ubaker#$chet',
+    '#\'guereau#\'rdichon#$vier""ve"$wfin#%maker"%x-car$$room#$fish!#peo!$raby##che#%dleys%"ow#$fman',
+    '%#ans#&ncacci$$doni#%tseth#$uner%$ston#(ziliense")ead-knife&&winner$,kfast/dining#)eze-block#!s"&ickbat#%dgett#(mpsfield',
+    '#"th"$oad-#$cken%#man#&kering#)nze-medal#+thel-keeper#$uage#%wbone$%nsett&%hirts#%xhead"&ugnoni$$uera#*ichladdich',
+    '$$hoff#)sh-stroke"\'ylcream#&namlwg!"sg!"te!*ubbleshake"#cco#\'kbarrow$%enham"%ddeke%!n#%mouth#$worm""in',
+    '#*l-fighting%&leaper"%mbles"$nyip"%rghes%#ill$)lar-alarm$!o#"ks#$nand$!e$"ie%"n\'#$sate$"on',
+    '")s-shelter#$hing##ked"\'t&mdash#!\'##ser#\'terfish&#men$%imore"!x!$wana!$yran""ss )c&mdash;s!$-cap',
+    '!\'ab-rank#+ez&oacute;n##ine"#dds",enorhabditis"(fe-style#!s""gr"\'illeach%#iet#%steal"%kobau")lceolaria#(edonides#&l-beam',
+    '$$sign#/modulin-binding#)yx-krater"%margo##bon#&panian"(nal-side$#sta#"by#+dle-snuffer##ion#(non-fire&%ading#%onise"#pac',
+    '\'!e%%ulary"+r-ownership#(abiniere$#sco#&bon-12&$nade#)d-players#%eened#\'ingolat##lot#%nmore#&olines##rol%$nade',
+    '"#sal#\'e-based#*h-register#$sese$%oulet#,tle-building"%talpa%$yzed#(ching-up%$pool#&erplan%$waul#$hail##kin##nip',
+    '#$teau"#uli$#ked#&terize"(valletto"&yetano!$c-m2!#ebs"\'landine#%linis#$tics",ntre-section&%court""ph"\'rveteri',
+    '"$yhan!-h&acirc;telet"\'abertia#"co##gas#$iley$(n-driven%$belt#\'lybeate#$mbon$$fers$%perty&#tre%$lain#&pelton',
+    '$\'gehands$$mian$&t-room#$umes$$ncys#!z"$elys#*mical-free%\'osmotic$#oxy##ong#*ster-based#%vreul"$icka%\'en-feed',
+    '#\'huahuas#\'ld-free&$safe#\'na-clay$%strap#$pcom$$pewa#\'ronomid")lorohydra%"us"&oc-ice#$isya#\'onhavan#\'p-house$#pin',
+    '#%ukeir#!y"*rist-child#,omatographed#(ysanthus"$ukar$#chi#(mbawamba#$rkin$$ruca!#iae#"no#!v"#lss"%mflex',
+    '#,efantastique#\'quefoil"+rcumscribes#!v"(s-acting#&alpine#(s&eacute#&ternae"&troens#%ydesk$%watch"*vilianised!0l&eacute;risseau""ai#!o',
+    '#(usthaler"\'earblue#$ddau#%ghorn#%ricis%#hew#"ws"\'ientpak#\'ff-edge%"ed#%ppety"*ock-making&\'shifted#$dion#"mp',
+    '#&nidine#$oney#\'se-down&\'quarter#)ud-cuckoo$"et$$ston$"ts"$ubby$%goers"$ytie!%nicht#!d"!x!)o-adapted',
+    '#(habiting#\'located#*prosperity#*respondent"*achbuilder#\'gulates#*l-carrying&&utting%&effect%%miner#\'stwatch"$bber##les"&ckling$"up',
+    '")debreaker"!f#+fee-machine)#ker\'$room$#in\'"\'gnizant"\'iffures"&ketown"#lca#-d-bloodedness#$egio#%grave#(lectanea#%ombey',
+    '%"na#&thurst"$mart#+bi-steaming$#ust#&e-down#\'igrated#)mendatore%*rcial-bank$#ing%#ted#\'pacting$*osing-room%&unders$#ter',
+    '"/ncepci&oacute;n&\'t-based$)ho-spiral#&dicote%"gn$%yloma#*fectionary$)industria%!t#"s.$&ervers$$tans%)itutionum%+raint-based#*text-based',
+    '\'!s$-ra-indication#$vect%/rsation-stopper"(oper-key"$pers#+per-working&$tone"$rday$#ery##ian#\'k-based$"in#"ne%$muse',
+    '#(stopitum#(uscating#&ydalis""ss#)t-sharing"%tinus#(ton-mill"&uchant%"er#$ldny#.nter-clockwise\'\'shading#$pole#)rse-based\'&module',
+    '!\'rabface#\'ck-down#-dle-snatching#$fter#"ms#%shers#$vens#%yoned"*eam-filled$\'tor-man%%urely#*dit-broker&#men&$scan#$mant',
+    '#,ole-speaking#%pinet")ib-biting#$cked#%mpers#&noidea#*sscrossing$#tie#\'tisised"#oma#$nica$%stadt#%pnose#&ss-bow&(examines',
+    '&(industry&\'license&%react&&sector(%lling#)wd-puller"\'ude-oil#%mmack!#seu""on!"ta!%ubits"$cchi"\'dgelled"*iab&aacute',
+    '$"re##min")pplewaite".rator-in-chief#&genven#$iosa#!r$&abinny%"ne#\'tseying%$ying"\'stomerq!"vh"!o!+ycle-length',
+    '"%nthio"*togenetics!)zech-born +d&iacute;as!&\'amore!(-mannose!%.i.y.!#acs"&dabhai"&lesmen"*m-building#&ascene#\'janovic#\'selfish"(nce-band',
+    '#"ke#%seuse"$rrow"$sher"(tabasing$\'loggers#"ta"!u#(phinoise"!v##ern#$idia%#man#"ni"$wber',
+    '#(lighting!"co!$d-10"#yfi!(e\'medici")-briefing#\'clawing#*emphasized#\'rigging")ad-headed$$bait#&f-mute#"ux"&bugged"+chlorinated',
+    '#"om$(ngestant%*taminating$%upage##val"\'ejaying#\'ply-cut$#set#%rbolt$&hunter"\'faecate$*miliarized#,icit-cutting#%lates#%renne',
+    '"%ighan#\'nomenes#&onized"$land#"co#$ibes#$rosa#$tics"%mande$*terialised#%dykes#(ocritean$&gorgon$%nised#,ythologising',
+    '#&etting#$gist##san##til"-personalizing#(reciates"#ram#"bi#)egistered#!g#&mavate#%ricks%"ng%!s"+saparecidos',
+    '#%ertas#&foutue#+igner-label#%kwork#"sy#%truct"&tuning"/utschherrenhaus"\'villing"(watering"$xion!)harmowtee"!e"\'rystone!&iabolo',
+    '$-ect-divergent$#ogo#"zo"&centra#)hotomised)#zed#0itratobismuthate#&kering$#ory"#dny"+effenbachia#\'mberger#)t-related"&ffract""gi',
+    '$%inger"%ndisc#$efwr#%gbats#(ing-hall#$ning#"os%%auria"#pad#&lomate")rect-mail&*ion-finder"(sarrayed%)ticulated#&cofilm',
+    '#%kcopy#&masted#(obliging#)preferred#+quisitiones#*satisfying$)imulating%"ng#.tance-learning",visionalized#$vied!#jin!#oce#%ksill#$teur',
+    '"#esn"\'g-fight%#ood"(lichenus#%orosa"&minick#\'obranci"$nana"(odle-bug#!t"%rfman#&mition$&obiles$!y#"si',
+    '"-uble-entendre&%speak#$ches%#ing##ghs#!k"\'wn-hill!"pq!\'raconis##fix#%ggled$%onara#*ught-proof#"va"\'eadlock',
+    '%(ing-down#$wery#$xler"$ilon""os#+ught-ridden#$ving#%wnded$"se"\'um-roll"!v"%yburn#&ing-up!$stsp!$tacs',
+    '#!o#%thlon"#bar""ch#&k-down"$dman"&ellist"$ffil"!h#$alde"$lais"(mitrescu"\'nghills##net$"it',
+    '"#pea"&rafour#$fort#"no!%welly!%yking"\'namight&"ke&#que&#ted$$tech!\'zhungar""os #e10"!4',
+    '"\'rthlets"#soe#,t-north-east#&y-care%+to-assemble!\'bb-tide"!c"$roin!#cce"*ho-chamber$(locating""ma"#ono%$mica(\'s-based',
+    '""tf"$urie!%d-din"$ding#"oe"&enhall"%gardo"%it-in"%nyfed"%s-gfi$&scicon"-wardian-style"!y!\'ekelaar!#fan',
+    '"!s""ti!#gad"\'g-shell$$yolk##ars#%stone%)ravaganza",o-psychology$-strengthening!"he!$iner##ion"#tan""ug',
+    '"$tron!$late"*bow-length"%eison"#ina""li"#off##him##isa"&serino#%field##ley"#tec"#van!)mbarassed',
+    '"#end#!r$#uwa"\'igrates"#ory"(ulsified!"nb"&carsia#\'offined#\'roaches"&d-1989$\'of-word#!e#$note"#fin',
+    '#)ag&eacute#%lande$%ische&)h-trained)#ype#&railed"#lil"+quiry-based"3tity-identification!#pcc""dm!\'ra-wacc#!t"!f"\'gasilus',
+    '"$nact""th!"sb"\'calopes#$ourt"#man"$n(s)"$pada#&eranza#&inasse%#ear$$rito"&quivat""sc"&terase',
+    '#$rith!#tc-#\'hegaray"%ernit"*herexpress#$nics"\'rangers""uc!\'uhedral"*ro-fighter$%class%"om&%ntrol$)pean-made$#yen',
+    '"%eline#&rthing$%yfing%$ones"!i"!m!$wert"!s!,x-ambassador#%enemy#,fianc&eacute$%rench#%mayor#&priest#&smoker',
+    '#%mpled"$cell%"sa"\'planted#$otel#&unging"*temporised$*nded-reach$\'rnalize!&yewear""ot""up 5f&eacute;licit&eacute!$-104"!f',
+    '!"11!(ace-mask%$pack%%saver$&lifted#\'torises&*y-produced"\'ddiness#"er"%gioli"\'inlight"&lashas#"ck#\'kingham##led',
+    '"(miliares%&y-tree$&ne-hit"&n-club#"ie#"ta%&syland$!i#!y"\'ridabad$!z#%rowed$!s"-st-developing%$lane',
+    '"%t-cat##ale"#uns!"bu!$eart#$sant#,ther-bedding"#cma"#lco#$spar#$trim$!y"$murs"\'nestral##ice',
+    '##nan$%hurst##oza#$rars"(tishized#!s")ver-pitch!%fyona!$igee#(ure-work"%laret#,ling-station#&mgoers"%mrite"#nca',
+    '%$mesh#\'gerpost#$iver"(ordiligi")re-eating%\'raising$&master$%walls#&menich$#ian#"ty"&terman#)ting-room"\'ve-acre%%sided',
+    '#)mb&eacute#&repath#\'t-faced%%lying$\'pattern#%vonia%/ur-of-the-month"&eetway#&xibles"!g"-ibbertigibbet""oe#\'od-tide%$tide$*r-covering',
+    '#&w-rate"&ue-gas##ked#"nk"\'y-paper#"es!#ntt!#oel"%kkers"\'ld-down$\'ed-over"%ndues#\'tevraud",od-poisoning#,t-controller',
+    '%#rot$$hill"(ppington""r\'#"an#\'dington#)gemasters#"m\'$#ate#%ncett"$sses")ulmouthed#.ndation-laying#\'r-digit%(quadrant',
+    '&\'wastika$!e$#gen#"ts"&xtrots"#yly!(ramboise#\'ncaises%$isca#(ternized$#ter"-eedom-fighter(&loving#&ikorps#&sh-cut',
+    '"(igidaire#\'tillary"%oggie#%linat#.nt-wheel-drive##ths")uit-juice!"ss!\'ujiwara"(ll-range%"up$$sail$&y-paid"(migating"&n-fair',
+    '#&breaks#%gused#$park")r-bearing#-niture-making#-ther-reaching$\'wangler"$sses"$zzed$%ytech!&wancis!$ynes 1g&eacute;ographie!#-10"!3',
+    '!\'abbidon#&le-end""ch"$ffed"&lacvid$#tia#!c#$ette#$lini"\'mbrinus#"ps"#nol"%rcete##dez$"om',
+    '"%s-bag%&urning$%light#%masks"-teshead-based%$kill#"ti"!u#$dier"&yfield"(zetteers!\'bedemah!%dlyan!*ear-change%%stick',
+    '"!h""lt""nc#+eration-gap$#van#!k",orgian-style"-rman-language$&inates#&shtein#$trud#\'vasutti"$sang"\'tronics!(heluvelt',
+    '#!s"&ddings"$glio#!n"$lboy#&ligrew$#ows$%yanne"#ner$#tte#%gered$$uene"!o##van"!p',
+    '##ncy$$rhyd#(ssmaking%%paper$#tyn#"ux""ed#(ndenning$$elly"\'issandi"!o#%riosa#$wers$$worm"!r',
+    '"*ubbdubdrib#%hwein!%m-csf!+n&auml;dige!*oalkicking#!r"%d-man#%oddin#$stow"!e#"st"\'ld-rush$&en-eye$$rush"#mis',
+    '#\'se-girl%%flesh"+rig&amacr;u"%shiki#(standard"*thic-style"&udimel#%rmand"3vernment-guaranteed+%issue"%zzoli!+r&uuml;nert"!.",aduate-level#%ining',
+    '$&d-prix$\'ovetter#+phics-based#$sset##tia&!s#$ying"(een-blue&%house%$hoff%)ish-brown#(shornish""if##llo#&ndcore',
+    '#$sone"%ollet#,und-clearing($over&&sheets$#ses"#rrr"&udgers##mps#$nert##ppe!#sni!)uanacaste$.ine-nucleotide#$rani',
+    '"%elder#&rnseys",ilt-offering#(nea-fowl#$zhou"&jurati"$llah"(mbaridze##nut"(n-battle""rk"#zzi!&wyther!$ylby %h-reg',
+    '#!2""be"#d_a##ash#!e#%jerai"\'efliger"$inge"#kem##sar"+lf-believed%#cut%%drawn%&graben%%metre',
+    '$$wits#&iakmon##ket"$mada#&merite&#man"#nce#\'d-cream%#set\'$wing$$jobs#$ford#$gout"(rd-liner&&ooking',
+    '&#ock&&unning$&backed$"ee$-ware-software##pic##rer$$igan#&tsdown#)um-scarum"$shem##let#"sy"+tchet-faced"&uberks',
+    '"%veing$%lange"%wtree""ye#%garth"$zing!$cmap!#dra!#e\'e"+ad-counting%&to-toe&%urner$\'cleaner$&leands#\'rth-rug',
+    '%%sease#\'t-shock$(her-clad##vey"*dge-laying""he",inrichsmeyer"\'ld-back##fer%!t#$icon#-l-for-leather%\'raising$%bound$&enised',
+    '#$mund""ma"#nan#$dred##sen"$pper")rakleides#(borising#$edia#%shman#!t""sh"%xapol"#zza!"go',
+    '")ccoughing"\'de-outs$%yoshi"$ggin$)le-piggle#\'h-caste%)inflation%&riding%$wage$\'er-risk"!l#&l-side&$lope$$bark"(mantopus',
+    '##kin#$xton"/spanic-american#(toricize"\'tchhike##zig!$krfu!&la-b51%!8$#dr3!#mph!"nu!%oares"%b-nob#%nails',
+    '"$ddom"#fer#$fert"&lbeche#&dstock$#ups#)e-nesting#$mdel#(ophonics##zer"\'me-work$$fire$(steading#$stat"#nan',
+    '##ore"$orah"#ram#"by#!e#%field#&npipes#+se-chestnut&%rider&%thief%$shit%\'trading%%watch&#hip#!t',
+    '$#key$%metal"-usehold-based&&unting$%hiary$$toun")vermarine"#wat#"th!%u-25a"$gger"%maine"%rdiss"$shes##ker',
+    '!(ydrating$!i$,ogeochemical%&phones""la"*mn-singing"\'perhead"$ster \'i&ndash!"ad""mb!%bisys!%cam-2"%e-man##man',
+    '"(klingham"&y-cold!"f-""at"&tikhar!"gd!"hc!#iin!"jf!%leana"*l-designed$%kempt$&placed\'$nned$&repute',
+    '##ert#\'uminati"&opango"!t!*mage-based&\'forming"(munotech"$naha".p&eacute;riale#&astoed#&loding!%n-cab$&ountry#\'keeping"$acom',
+    '#!x"-centive-based#%ising#%losed#,onveniencing"$decs$$scon%"it#,ividualizing#%orsed#"ri#%urate$(stry-led"&folded$&sheets',
+    '"&gushis"\'ishturk"(l&eacute"&n-yard"/put-specificity"\'scribes#*ect-eating$"in#,ider-dealing#.trument-making"#tal#*elliserver$&r-clan\'\'ounties%%chain',
+    '%\'leaving\'&ukin-8%&meshed&"ix%(pellated&&lanted%!q%&spaced%#vet%\'working#\'oxicant#\'renched#&ubated"&veresk%*ness-based',
+    '##ica"#pcf!"pl""pf#"on#!r""se#"um#*wich-based!"rd"*eshopeburn")idomyrmex#%goyen##sed"&mtraut',
+    '!*sethionate"&lamiya"%maili"(oamylase#$pods"*raeli-arab!,talian-based($made%$enne""co!#vis"%orien!"wf!!y!"zu',
+    '!\'acketed"#dey"!k"#leo"%m-jar$&making#&balaya#&estown""ng"+panese-made""ri#"ol#"ry"&w-line"$zeel',
+    '!"ec""et"!h"\'nkinses##son"*quetepeque"*t&eacute;s"%wtown!(f1-23b13!$iaqi""ng!$knlf!%oakim"*b-creating"$ggle',
+    '"%isted"\'ke-shop#$hang"#len##ies#%lying"%ngert"\'rdanova""vo!"ra!&udaica")mble-sale"&ngmann#"od"#ris',
+    '"%sticz#"uf )k&ouml;ln!#-12!&adiatu"+iserstrasse"*kilashvili"&lbarri#"ff#%mykia#$pana"$mrok"$nder#%gwane#!n',
+    '"$prow"#rja#"on#&pathos$"in#\'yotypes""ss"%tzman"%zador#"oo!#cvo!%eadby"#iki#"ne"$llet',
+    '"\'mpinski$$town"%ndler#$mare#&necott#$olty""os"&rikeri##lin"&srouan"#wal##ill""yb#$line$#ock',
+    '!$hadi#"ng##tun#"ur"$epri"%risto!$iang"\'eslowki"$ffin"!i"&kkoman"\'llynure#%obase%#yte$)watt-hour',
+    '"$plin&&gcotes"+rklevington#$tana"!s"\'tchings##kat#$schy##tle!\'lebbich#$pper!)nackering"#epp")ife-edged&(throwing',
+    '#!p#%ttin\'"(ocknarea#"w-!$oban$%yashi"!d"$haku"(i-keeper""jo""ld#$wezi"$moto"#ndo#!e',
+    '#!r"&rdofan#%iyama#!k#!o"$sice#$ovar#!s#!t"!t!.raljevi&cacute#%marae#%tzman"*iegsmarine"$oger',
+    '"%ygier!"ua"$kkay""ne"!r##ier$#les#$sell"$saal"%taisi#$tner!$veim!(x-p1124i ,l&uacute;der!)\'ancienne',
+    '"&oeuvre#$rdre!\'-fields!\'a-di-da"!a"$bone$\'ulbenia"$cona#%rimae"$dino"%ffont##ite"#ide##rgs#$ssez',
+    '"\'keshore#(shadweep"&mp-lit$&holder$%lough"\'n-based#&chbery#"d\'$\'-hunger%$mine$%lines#-guage-related#!i##man#&teglos',
+    '#"za"&omedon"%pidus$$erre$#ths#$link"(rchgrove#*ge-calibre&%print%"nt##nax"$sdun#$ered#$ithi#$soed',
+    '$%olite"%takia#4e-eighteenth-century#&inised$&ssimus#"us""ub#"di#!s$!d"+vender-blue""w\'#!-$\'breaker$$code',
+    '#(breaking#"ed#$full##tel!)eaf-green$%leted#(st-known#&thered"#che#(kpatrick#*ythidaceae"#ena")ft-centre%$side$%field',
+    '"*h&aacute;r#&ninger"-icester-based#\'shmania".li&egrave;pvre##low"!m"$nexa##in\'"\'porello"&sothan#\'thaeghe".tter-by-letter&\'heading"\'vasseur',
+    '$#que$%rmore#%itzki"%zghin!"fo!"ha!(ibeskind"#cat"$eges##ven"$feid#\'t-shaft",gand-binding#$ging#&ht-box',
+    '&&middle&&welter%$fast"1me-soda-softening$"ys#$ulus"#nch#%deman#)e-of-rail$#man$!x#%k-man##say"(on-heart"*p-smacking',
+    '"#sta$%enin\'"$tani#&eratur#(ter-free$&leport")ve-action%$wire!!k!$l.d."$ydaw!%oafed"%chend#\'kstitch"!d',
+    '#&otheti#%rones"%llard")ng-bodied%$case&%losed%$play$%eaton$&haired$!o$&ranger$%temps##hro"\'ose-end%(ly-woven',
+    '#%resti"#rde#(icariids#!o##tie"(ss-maker"#tsa")ud-hailer#"pe")ve-letter%$song$%rnius$$song%%truck")w-battery',
+    '$#mid$#pay%\'riority$\'scoring%"et#!a#,er-frequency&%grade&-middle-income##man!"pu!"ti!%ugosi"#man#$bers',
+    '"!n#"ny"%pescu""rg#!y"\'zzaschi!"wo!\'yamshin"&copods"%diate"\'mpstone"%ndsay"\'onnaise #m17!,700&ndash;10',
+    '#$rouf"%china&*e-breaking($code(&pistol#$rame"#dhu#&onnina#$riya"$ggid##lev#$nall$%ifico\'#que#"og',
+    '"$hala$&vishnu"#ime#\'nlaying"&jestie"\'ke-work#!i#"ro##sim"$lbec$"is#-e-orientation%%voice##ina%#gue',
+    '#"vy"%mdani"\'n-woman$$year#%annan$!s$!u#\'delstam$$ingo$#ovi$$roid##ere#!g$"la$#ram',
+    '$$guet$(la-based$$nder#&ticore$#oux#)y-layered"$pics"$rcam$!e#&garite$%inata#%ianna$$ette#$ket-\'#day',
+    '$!u%#sen##mor&#ata#$plan#%rieds#%silea##tia%"n\'&#que#$wash"*sculinized#!e#$jumi#$kery',
+    '#)s-selling$%accio$-ingberd-mundy$!y#-ter-in-charge\'&stroke")t-forming#%abele#)ch-saving#"he#%olcsy#$usow"(undering"#xam"(yobridge',
+    '!#bis!)ccullochs"%hoans!#dos!#eam#)n-looking$&s-test#!s$)urability#\'t-eater""cc"&decins"&inhold""ko"&lanism',
+    '#$loni#"ot#&pomene""n\'#%deres#&estrel##tis"\'ridiana$"tt#$rett$(yweather"&scalin##fin#)oamerican#%quite',
+    '\'"ng#"es#!h#%ocean##rix#$zler!"hi!(ickelson#\'rofocus%&prolog%*sequencing&+tratigraphy"&d-1979$"70#*dle-market',
+    '"%ght\'n"!k"\'litaris)"ed##lau$+ion-selling$$moor#"mo#%oslav"%nches%$moor#-d-body-spirit$\'blowing#*i-computer%&fridge',
+    '%\'um-wage#%otels#$toff"%rador#"ko#$puri#)ror-glass")s-matched$%named#!c$&asting#!h$&earing#*identified$(nforming',
+    '#$sin\'"%thril#\'sibushi#)teleuropa%!r##zie"*xed-method"$zzen!"ki!"ms""us!&obitex""ch#$kler##tar',
+    '$%ratus#%leski#(ularized"#ely""gs""ho")isturised*!s""je"#key#$htar"$lapo##ded#"ey#"in',
+    '$\'ycoddle".ment-by-moment")ney-based&%maker&&supply%%saver#"is#(ocerotis$+unsaturated#(sterland#&talban$#ets$*h-on-month"\'onchild$%raker',
+    '"*r&aacute;n#%bihan#&estore$#tti#%ticed%#sed&#ing"&tabeng#$her\'&\'-figure#$tley"%unded$$sher$-tain-building##rou',
+    '$$seux")vie-going%%goers""ys"\'zartean!#ptn#!p!#rpa!"su!"te"\'himkulu!+uch-changed%\'trodden"(ddington##fog',
+    '"$ffat"#gby#$wort"&harram"(jahedeen"$kong"*lligatawny#)ti-choice&\'service\'%trand&$tier\'#one%$cray%&plexed%%valve',
+    '"$rrie"*scidifurax$+le-building#$icum#(ket-fire#(lim-held##set"$tawa#%hanna!"vt!"wu!$ycil#$roft"$kale#$enai',
+    '"(thopoeia (n&iacute!%\'dosi!&-plant!#.k.!$abob"$cods"$dder"#iad"\'kamichi"#nbu#%chang"(politano##ped"\'ra-wacc',
+    '#"es#)row-based"\'siriyah#!r",tive-speaker#-ural-sounding\'%izing%\'e-lover"$wabs$!f#!k"&xalite"%yanar!"cg""ra',
+    '!%diaye!)ear-panic%$side"*cronomicon"#dim")eds-based#"le#"ow#!t"(gativing"$mery".o-evolutionism$(jacobean$-malthusianism"%rlove',
+    '"(tclasses##wic"$uadd#,ch&acirc;tel#%meier#$rath"%vaire#1er-to-be-repeated")wly-named#\'minster#%sbeat$#day$$girl$$link#$wave',
+    '#%t-day!%f-il6!$iaaf"#ccl#+kel-cadmium"&emeyer"(ght-duty&&school\'#oil&$work%\'sitting""he"#jaz#$holt"$lson',
+    '"#osh""pa"$tram!#miu"!t!)o-warning""bo"#esy"!l"*m-de-plume##bre"\'n-armed$#cfc%,ommunication&&ngress',
+    '$(data-ink%.ecision-making&\'meaning&)velopment$)euclidean%,xcludability$(feminist$\'housing$&ionics$$nazi$,prescription&(oduction$,ratification%)egulation&\'lapsing',
+    '$$sick$&tumour&"rf#&juring#"ne#!y"&ontide"%rbord#*folk-based#%grove##max#$rish#$well"\'sedived$"ma',
+    '"&thhelm#%turno"$waks##ell!#slc"!x!#ubs"#cps")dge-nudge""la"\'mbskull",rsery-school""sh"*t-cracking#$hin\'',
+    '"*mphaeaceae"#oka"%quist (o\'course!!1!\'ak-tree#%apple#&enshaw#$leaf"!l""se#"ys!#bas")fuscating"#its',
+    '\'\'linking"&ligin\'"!o!/ccasion-setting#(identale"\'ellated""mp!#dem"$uber!(esterley$\'reicher!\'f&mdash"%f-cut$$form$%width',
+    '#&prints"(t-stated!%gilby""of#$nyok!#hka!#ies"&l-drum$*production$%slick""nk!!j!%kigbo!#lah")de-worlde',
+    '""le"(schewski##han"!u"#via"%ympik!&n-pack""an"%e-cap%$hild%#oat$(sentence"(ion-skin!"oa!(pdebeeck',
+    '%#end%&ground%%house%$neck%$work$$baar#!r$(a-ballet"(hiomedea$%uroid"#ole"+tical-fibre\'!s!+racle-based",bitosphenoid',
+    '"1ganizaci&oacute;n%"um#"on"&inthia"+nithischian"%ontea"6sz&aacute;ggy&uuml;les"#tho!%sburn""ha!"ta""he!*ut-of-tune#(crossing#\'matched',
+    '!+ver-bearing%&cooked%(educated%&filled%\'hunting%\'painted&\'rovided%)qualified%)ruddering%\'stocked%(the-head$&coated&\'mmitted&%oking$\'exposed',
+    '$(weighted!$xoid /p-postlabelling!&abulum"&cketed##rim"%louse"(nayiotou##tie$\'ocrator"\'rafoils$*llelepiped$"mo##tha"$ssio',
+    '"&uperum!$cdma""te!+eace-keeper#%rling",destrianized"\'lleting"&nlight#$tate$$rite"+rambulating#(chlorate#&iclean#&oxided#&petuum',
+    '"%ilair"+oto-montage")rase-book""ut!,iano-playing"*geonholing"*pe-cleaner$%lined\'#ing#!i"&t-bull$#cnt#%sligo!\'lashing""de',
+    '!)neumatics!-oetry-reading"#gue"$hive")intillist"\'lagraph#%ygala$2methylmethacrylate"&marine""pi##sie"\'rtinatx""sa#%t-bus%-modernization',
+    '%"cd%\'lifting!#pfe!-re-filtration$\'heating#"ki#&select"$ijon#)ntability%$ware##ore#$skin",oblem-posing#(legomena#(montoire',
+    '#(pamidine$&rinter#+teobacteria#\'vignage%$ncia!\'ubblico"$ella#!r!#yon"#th. %q66.9!!_!"ai""ra##yat',
+    '&!s!"dr!#ili!"ma"!s!"rs!"sl"!v!(tr-final!\'uadling$(raplegic&!t%&upedal##ere#%litas',
+    '#%ntico#)rter-deck(\'million\'%final%$iles#+si-criminal&*democratic&&feudal&\'nominal&\'science\'\'ensuous#\'termain$#uor"&easily#!e',
+    '#$kett##lea#-r&eacute;taro#,stion/answer"+ick-to-make#%ddity$%enham#)llersedge#$nary$!g$!k$\'tuplets#&rinius&"us$$kily',
+    '$!n!#x15 \'r&amp;m"&eacute((;gisseur)(n&eacute"%mdash"+uuml;ckriem!!+!(.ebright"&i.b.a."#p.m"$s.f.$!s""us',
+    '"!s!#1.2"$0(8)#!0"$1(9)"!7!%2.1.1%!2""13"!8!#360!\'4.10(8)"%000pc%!s!&645/59',
+    '#!s"!a!"=0##.78!"a4""aa"#bah#(bit-runs&"te""c1#%cordo#\'e-goers#(hinburgi#+k-mountable*#ing',
+    '##oon&!s".diation-linked\'$vely$$caux%%ofani$"o-&*telescopes%#ing%&meters%)therapist$$used#%owitz##tke"&ffaele',
+    '#"vr"%gdale##gas#\'pickers"&hmonov"$ikes#*lway-owned#*n-streaked$(bow-hued$%fords$#man$%worth"&jmohan"$kata#&hmanov',
+    '"&m-raid#".0#\'amurthy$&sandra#&butans#%irezi#\'raiders#$ster"(nnerdale#&soming##zau")paciously$#pis#-idly-changing"$raku',
+    '$$eeda$$idov#%iklal#"se%&ndylls#\'tenburg%%rized&!s"&tchets#)e-support$)mahatmaya$"rs##hje$!s#0ional-scientific',
+    '#$vick")ucousness##kov#"ti#&wolfia"\'venscar$"tz##in\'$$sher"%wling"%y-ban!#cmp!,dbisetup.com!(e-adjust%\'mission',
+    '&*orestation$&ppears&(lication$%rgued$\'ttached#*chargeable$\'lassify$\'ommence&%piled%&nvened$(reations#*decoration%&fining$(iscovery&\'tribute',
+    '$\'nergise%#rol$(stimated$(xporting#)formation#*generation$\'rouping#,identifiable$%gnite$&mposed(%ition$\'nforced)#ing%\'vention$&terate',
+    '#)occurring$,rganisations#(packaged$\'resents#(readings#&sealed%$ller$&haping$\'urfaced#%tried$%yping"$:the"0action-diffusion(!.&$vely',
+    '$$ably$%justs$)y-printed&&rolled#&ganism$"in##ler$)locations%"y.$$tors$!y##mer$#ing#*ppearances%&ortion',
+    '#*ttribution#,uthorisation#$vers"\'balance#"id#"ka#$oard##uts"+calcitrants%(ibration$+pitulations%$tion#%cione#.ently-approved$*ption-room',
+    '$,ssion-bashed#\'henburg#%kmann$&onings#%liner#*ognitional\'%zance,!s$&mputed$(nverting$&upment$%verin#+reolisation$(uitments$*ystallized',
+    '$*ifications\'"es%)linearity$"us#$ueil$\'perable"%d-bed$\'crested$%heads$\'shirted$&tipped#&/green#%burna\'!s#%cross',
+    '#,etermination$*velopments#&headed#*integratio$&vision#$mane#&olence#$raws#(undantly"*ed-fringed%$like#&ntrant#*s-williams#)valuating"$f.18',
+    '\',t-qualifiers%#ing%#rer#$fell#%ixing#)lationary$*exologists#(ractions%"me#!u$$sers"&garder#\'istrant#\'reening#)urgitates',
+    '#!n"&ignite#+ncarnations$\'hardtii$&suring#&terhof"&jigged&#ing#\'oinders"(labelled$\'tion_to(-ship-oriented$#xin#\'igation%-ious/cultural',
+    '#*onstrances#*unerations"%names$"rd$%scent&$ians$%tured&!s#%field#"ny#)omination#%table$\'charges$#ham#%ville',
+    '#(peration#*rientating(#ing"\'passing#%ealer#&laced.#$onse$&rters.#!p#"re%-sentationally#%ulses&$ions",quisitioners"(roughing',
+    '#)elections#\'idually$&stence\'!r&$less$#ted#)oluteness%#ven$&rcinol$)urce-rich#*plendently$(onsively)#ity#(timulate%!o',
+    '%$vely$&orable$)rictions.("or%#oom#-urrectionists%$veys$)scitative"1tain-and-transfer##est#\'icences%\'ulation\'(ocytosis##ool#\'reatism',
+    '$\'ogrades%*peritoneum%!s&%pects#*selisitsoe#!z"%ubens#(sability"(vanchism)!t#\'engeful$/rse-transcribed%!y$#sby$&tments',
+    '#(ocations$\'ltingly#&ueltos"!w#(ashering#$inds#%orded!#fd9"$e/rl"!k"#lvs!#g21"!d!"hd"#ead',
+    '#"tt#+umatologist"$oads#(mbomeric"#une"(ys-jones#*thmicality!#iac$!e"#ces#)h-tasting$+mond/mother$%tofen#\'kstones#*ostruzione',
+    '#%eable$%rhood#(iculous."(ght-half\'%older&$size##ler"\'kanovic"#mbo#"ed$!r"+ng-segments%&tailed$#git$1k&oslash;ping-fyn',
+    '$$work#!o"%oseco##ter"&parian$#ult#(ley-rust#\'ped-off""re"#son"(tardando#(ournelle#!t#\'ualists"!u',
+    '%$walk$#tus"#xon""za!"j1!$m600""jm!"n\'"#228!(o-railer"+ad/baberton$$less$\'workers##mer##sty',
+    '##elo#\'inswood#%obird$%vitch"(ck-falls$%/folk%#pop$&bourne$&hopper$#ley$#off$\'poolers$&steady"%ddons#\'ent-run',
+    '#$like"&ederer"$ffel%#nse",g&eacute;rio##ate%\'iontide#!o#$uery"$heim"&janani""ky")leplaying$%s.dat#\'l-calls',
+    '$!a$+er-coasters&&skates$$ings"\'mancers%(ian-born&!s%%owski##ita#\'orantin"&naasen"(of-beams$#ers$$rack#"me',
+    '#)t-indices%+mean-square%%stock$$edly&$ness$#in\'"$pner"&sabeth#&e-beds%&noelle%\'scented$"na%$dahl%%field#$kell',
+    '%#ter$$more"+t-resistant#&emberg#\'henburg#\'ovators#\'tenberg$%mayer$\'weiller"\'ugemont$&h-shod%&ly-cut%%necks#$ille#$leau',
+    '&&winged%%worms#\'tinised#&x-en-y"\'vacchia",wan-robinson#/bottom/abingdon*&newent#$dier#"en##les"!x##ane#$bury"&yalism',
+    '##don!#p50""cs!\'s10,000"%5,000""ai"#dwp"!f""sf!"tu"!w!%ubika##rum"&ckwood"\'ddigore',
+    '$)y-cheeked#$land"#eda#\'fulness"&higira"%ksana"+le-breakers"%malla#&inates\'#ion#!s"&n/stop#"ge#$nier%%ng-in',
+    '#$past#&s=0:40%$1:30#$tish$!s""pa")ral/urban%"ly#(itanians"%sayev#"by#%combe#*h-bottomed$#all$&brooks',
+    '#%skies#+t-resistant%(streaked$(enburg-l$&ington"$tjes""ut"#wai"\'zimatov!&ydberg")e-grasses"$kiel"%lance"!n""r3',
+    ' *s&amacr;un"*eacute;gur"-oacute;crates"\'uuml;ss!&-kn-sh"%sorry"%waves!%.1(4)#$0(b)#$4(1)#$5(2)#$7(1)%"4)""23#!4',
+    '#!9"$4(3)"!7""89"$9(4)#!3#!4$#(4)"$l.r."$m.r."$o.e."&p.c.k."(shibatae"$uist"!v',
+    '!%10(3)$"4)"$1(2)#!7"$3(4)""51""62""76#!9"$8(1)"$9(1)!#2\'s""09"!1"$4(1)',
+    '"!9!#3/4"$4(3)"!6"$8(6)!$4(2)"$1(3)#!9!%58(3)!$6(2)""74!$7(2)"!4"!5"$6(1)',
+    '!"87!"94!3aalbach-hinterglemm$&felden"$bahs#%baths#"ey#"ir#!s"&c-like#$cade#%kable$$less#$rist"&d-eyed',
+    '$)le-shaped$"oo##ly.")fe-houses$+ty-critical#+fron-yellow##wan"(garmatha"#id.#%l-off$"er$)or-suited$&planes#%nbury$-t-andr&eacute',
+    '&\'georges&$lary&&martin\'%ichel\'%oritz#"ph#"ve"%keasi"+l&egrave;ve#*aciousness$\'ma-caro$-nder-o\'reilly#(cininkai#"ia%!n',
+    '%"rs$"na$&sburys#$keld#$lins$%yport#$oner%#ica$#tto#(t-loving%\'marshes$#ier#(vageable"$maja$!k',
+    '$!l$#yoa#+e/different$!t#$ians#\'lesbury##mer$!s##pan&!s#&sonite#&ukhela"#nan#$chis$#tae',
+    '#\'d-hills%$iron$#boy$"ia%"er$(papering$%shoes#%gheli#&itizer#,jaasurengiyn%!k#.tamar&iacute;a"%pcote#%onins#%ronov',
+    '$"hs$$sota#%casms$&olemma%$ptes#"di#$hadi#$noff#$onno#"si#(tre-type"%t/sun##cam$"om#$ivus',
+    '&#ies"*udi-arabia#)ndersfoot(#ons#,ropodomorphs#)sage-like##zee"%veloy#%illes$"ni##vas"&w-cuts#%bones"*xophonists"%yeeda',
+    '"%zhens!"b."#401""ci!+c&egrave;ne"#.d.""20"!3"&ambler#*ndalmonger$%nable#%rabus$$cest$#ved#)talogical',
+    '$*terbrained"&eptres#"va",h&ouml;nborn*!e$)uuml;ssel#$acht$%ngnau$&umburg#%edual&$lers$"el$(herezade$\'matized$&rzando',
+    '##lee%\'singers$%ieren#$mitz$$ooze#(neiderei#*olarliness%%ly-ka%#ten$(ol-books&)/industry&*s-industry%&nhoven$$uten#+r&ocirc;der',
+    '##tum#&ucking$#ell$"ll%"te$%rmann#*wammberger%,rz-schilling""id#(ence/hci"+leractinian%$osus")oreboards\'!x#%tomas',
+    '$\'s-irish$+vec-devised"\'rappers$(tchiness#(eenprint&%sport%#ton$\'w-holes#\'iptoria#&ubbin\'$&mmager$(nched-up\'#ies"&uffers#(mchester',
+    '$$land$$niks##tes!"dd""rt""ss!.e&ntilde;orios"#/30"!9"&a-beet$%gulls$$legs$%pinks$&routes$$salt',
+    '#!a#%boots#%lions#)rch-space&#in\'#*son-ending\'$long$$pray#&t-only$$back$"s*#$wind$)orthiness"\'bastien#"el',
+    '"$c160#"co#)essionism#&luding#*ond-bottom\'\'guessed\'(joystick\'$last#\'tarians$(ionalism$&or-led&)alisation&\'ization#)ularizing\'"ly',
+    '(!1"&dburgh#(lescombe##run##ums")ed-eaters#%fried#"nd##ram$!y"%goura"%hayek"%ifart#%guard##xal',
+    '"\'lectins\'%onist,"ic$"na%*omethionyl#2f&rehy;destructive$+-ascription%)balancing%-certification%-deprecatingly\'*scriptions%(evidence%-glorification&\'overned%)improving',
+    '\'+terruptions%)launching%(offering%)perceived%\'ratings&)eflective\'%ports(\'roaches%,sufficiently%%timer&(reatment%*validating$-consciousness##kie#,lassi&eacute',
+    '#!z"3mantico-grammatical#$bene##edo#*i-annually&(utomated%)classical&%ubist%(deserts.%%erect%*industrial%(mythical%)periphery((manently&(olitical',
+    '%)religious$&annual$,quantitative##mes#$pill"#nce#$dall$#in\'#\'ghenydd$$upta#%orita$$ussi#-se-qualifying$$illa%&tizing',
+    '$!u#+tence-types#$ussi"\'pabhodi#)tember-12#)ulchrally"*questering\'$rant)$tors"#r54#$geev$"iu#&ialled$#gne#,jeant-at-law',
+    '()s-at-arms##ous##pae$(ent-like#(ver/6000$#ian%)ceability\'&s/6000%#tes%"us$+omechanisms##wal"(sfontein#%silis%$ons.',
+    '#%piece"\'ulement"$ven-&\'eighths&&headed%\'hampton%$thly&%y-odd(,two-year-old$*re-looking%$naya#&illian"%wn-up"0x-differentiated$\'marking',
+    '$+segregation%\'pecific%&ymbols#\'partite""yd$#ina!&fe-sfc"\'ii/noti"\'orzando!#g14"#ian"!p"&reccia!"h1"$aati',
+    '$*by-genteel#"ce$$king%&lebury#%diest#*ggy-haired#%hryar#\'ilendra#$kang$&eholes$(hnazarov$!i%#est$&urulla#\'le-type',
+    '&"rd$"om#&manist#$nkie%$land$!s#(peliness$#ira#"ra$(e-buying&-for-debenture&\'holding%(holders.%%owner$$pers',
+    '#"tz""e\'#&-asses##afs$"ls$\'rbridge##dir#"el$(p-owners&(shearers%!e%&scombe#%ffrin#\'ikhdoms$%lings',
+    '#&lborne%&yville$*l-dwellers&$sand%%suits$)ter-belts#$nzen#)remetyevo")ield-like\'&shaped#(ft+enter%(-workers##ggy#$koku$#sas',
+    '#(n/instep$!g$&kansen$"ui$"wa#%ozaki#\'p-owner$#lap$\'masters%"en$$pens$#way#\'rebrook%$oaks$)ley-quirk',
+    '#%t-hot$#ted$$work"(oe-boxes##osh$*ting-stick#\'p-girls%\'keepers$&lifted$(mobility$&owners#,reham-by-sea$&t-form&\'skirted&"to',
+    '%)er-tailed%%house%$land#&tector$!o$#tle\'!y#&w-offs$%ercub&%proof"\'rimping$&nkable##ops"$ubei#)dderingly',
+    '#\'ttleway"&ysters!&iachen#&talimi"#ble##sey#&thorpe##uet"#cco#%ilies#"li"$ddal#&e-cars%&parted%\'slipped',
+    '$&botham$%shoot##ina#&onians##tis"&eghart$$mund"(ghtlines%#see##mas#&ned-up$\'ificate%#num"#irt""ka',
+    '#&icosis#(k-smooth#%labub%!s$#ily#%maril#*ver-leaved&$lode&6stone/northamptonshire"%m-fix#!a#"ba#\'feropol#$ilis#\'mentals',
+    '#&pliste%1on-orient-express#&ulatio"\'newaves#%gable$*er/superba$$le-a\'$coil)%ncept\'&figure\'\'seaters\'%union#(lessness##net#"op',
+    '"!o#"ne"&phonic##pel#"ra"!q#&ueiros"#ree"(somphone#%temas%&r-wife#$wick"\'t-downs##eke$"s.',
+    '#"ua%-tion-specific"\'x-pound$\'shooter$"to$)under-par##th-!&jambok!$kald%!s#%nform#*teboarders$(ing-rink"$eeby#-leton-forming',
+    '$%horne#!m#+w-hermitian"\'idelsky#%llets#&ppings#$rlaw#$vers",ogstr&ouml;m#$uras"!p"&ragged#*owaczewski"*ullduggery"%ydive',
+    '!"l6"%abbed#&ck-key%#ers#&phappy##tor#)ughterers)#men#*ve-driving%#red$"in"&eepin\'#&nderly"&ickest#)ding-door',
+    '#)pping-out#$wish"\'ug-like$#ger#)ice-gates"#yme!$m845")ack-a-mac#*ll-calibre&%paned&"to(\'-medium%\'/medium%&talk/v#"rk',
+    '""ds"$idge$%ovich$!t##tes$(h-corona&$gods%!/&&united"$oggy#%halla#)kescreens#+oth-tongued&#ies"#pte',
+    '!$n-cu"!2"&appier&$ness#$vely"(ipe-like"(obbishly##ops#(w-drifts%&making%\'ploughs$$cock""s+"%uffer"!x',
+    '#%forth"&apsuds"*ber-minded".cial-political\'\'science(\'ervices&)/cultural&-ist/community$!i$,o-biological-#sts&&sexual\'&patial%.linguistically%&metric',
+    ')!y$"um")dium-rich"$ffre#%ianos#\'t-faced%\'looking%%nosed$#ish$/ware-compatible))intensive()/hardware""hn""ka"+lafidianism',
+    '%#der#$ebar$"ra#%idary%#ers$"ne##las#&ution."(maclonal#&breros#\'ebodies$#ren#&mersby#\'niferum$\'olently',
+    '##are##ges"#opa")phistries"(rdidness#"er##oti#%t-out$!e"%senko"%tades#(eriology#"to"$udan#%illac',
+    '#"na$\'d-alike&\'changes&\'quality&&tracks&%waves%%alike%%bites$#gui#$quet#*r-smelling$"er$#ish#+th-westward%(easterly',
+    '"*viet-third!$p.in"!2"\'ace-lab#"da%$fora$(e-shaped##gna#$lato#%ndrel$,ish-speakers$!n#$rc90$%eness$$ling',
+    '$.sely-populated##tes#%unton#$wner"/eaker-variables$&r-like&&points#,cial-effects%\'es-wide\'#ism$+taclemakers%*ra-physics&)oscopists#(echmaker$%d-ups',
+    '#!l$\'lcaster&$heck#*ncer-nairn$%dable$&serian#"ri$$zels#%zzati"(hericity%%oidal"$icey#(der-like\'%thing##ker',
+    '#%nario$*dly-legged$%elike#+ritualistic#%taels%!l"+lendiferous&#ors%&orenal#$otch#)utterings"(ongeable#%ofing$$king$&nbills',
+    '&&person&&writer#(ttiswood#$usal"%rache$$dley$%y-can%%ed-on#!i$)ghtliness$\'ngstein##ogg$(tborough#$uces$(ng-edged',
+    '!(q.metres"#_cm#&metres$$iles""ms"&uamata#&ealers$%egees#(int-eyed$(rrelling!%r.n6s"$anan"#ifi"!t!$s.18',
+    '"!5"#671""at""cc"!f#!c""rl"#ssh$&ussann!)t-riquier"+aatsgalerie&\'kanzlei#$bile&\'imentum\'$ties',
+    '%&elberg#)dtverkehr#,ff-intensive#*ge-manager&#set%&divers%&fright%$hand$%iness$\'nogleys#(inthorpe$\'r-rails##ler$*king-horse$%l-fed',
+    '$$pers#+ndard-class)$size%%esamt$"es$\'islovas#%plina#(r-fields$!a$&gazers$$kist$%nberg$&t-year##sys##te\'',
+    '&)supported%!r$*hmokinetic#$uder$\'nchness%#in\'#&vridis#&y-away$$away"(eel-blue&&capped%&makers$+ply-pitched(\'sloping#%gmann',
+    '%%hardt$#sel##lae$\'larator##nay$$holm$#ing$$opus$!z#*p-brothers$)daughters#)reo-typed&(specific$%ilant&(izations',
+    '$"l.$&torous##wie"&ibbard#$chus#$eger#(ff-faced%$ener#!k#,letto-heeled$(l-births%$ings#\'nginess#*pendiaries#%rrers',
+    '"&ma2000")ock-proof%(building%$ford%#ily%%works#$essl#$ffel#&ichkov#-ke-by-nayland%"ly#%loyan#\'ne-deaf&(throwers%)chuckling',
+    '%&washed#\'ols/day$,p-shouldered#"pe$#pit#$rers%#ton$#ied$&k-like$(m-driven&\'trooper$)skarfjell$\'yboards#&therts#+ute-trained',
+    '%$ness"\'rachans$.ight-forwardly)$sets*"ix(#ish%"n\'$#ney$(p-shaped$#sky$&thaven&#don%,igraphically,"es%(ocumulus',
+    '#\'eamlets$+et-children\'$door\'(lighting\'%smart&%scape&\'walkers$)nuousness$(ptomyces$(ss-prone&&ed-out$(tchsuits%#ham#)idulation$#gil',
+    '$(p-lights%%lings%\'ped-out#,omatoporoids%$berg$*ng-looking&#box&*ly-fancied&&yloids%&nictwo$#ock#!u$%tters$"ve"%ubbes',
+    '#&ccoist$"ki#)dent-name$#ien$$work#&porous#&rdiest$%luson$#man$%ridge"&ylings!%uakin"*b-arterial$\'central%)lassified',
+    '$,dictionaries$\'faculty$%heads$*integrator$,machine-guns&#xim$\'options%&rbital$\'permian%(rocesses$$rule$)satellite%&chemas%%eries%$tage',
+    '#$alar$#rea#$bies#(category$)ommission%)ntinental\'%racts%$stal#*discipline$&ucting#(fraction&%gment#*ject-areas((oriented(\'related',
+    '\'$hood\'&ivists\'$less#\'mergent#$nets#\'orbital%!n#(ramanian%#nge#)specialty$&tantia#\'titling$&leness#&urbias"(ccouring',
+    '#&essful#&kering$#ley#*tion-boots"*d-aviation#$anis#&omotor"(ffering.$%usion"-gar-phosphate%$loaf",itably-sized$"e."\'khothai"\'lphites',
+    '#%tanov"-mma_cum_laude%%riser$,er-flowering&"ed&&houses#&ner/ti",n-compatible#%baked#&derlal$%ragon%%esses#+light-based$&ounger#$nily',
+    '#%solve"-per-delegates&&format&%glued&+intelligent&&phenix&(regional&#sub%$brat%%drive%\'humanly*!s%)imposable%)marioland&$inis',
+    '*!e%%scape\'\'ription&$hift&#oap&&tation&%witch#(ply-room\'&siders$\'ortpack$(ressions#-ra-historical&(regional%(marginal%%tidal',
+    '"-rface/surface#(geonfish%#ry.#)passingly#(veilance""s4"$tapa"#vla"%xavat""ya!#vdp"-r4-compatible!"w2"+agger-stick#$inby',
+    '#%nlike#*shbucklers$+tika-peltae#$yles")eat-pants%#ily%%pants#*dish-owned#(etpapers#\'pt-wing"\'iecicki$#ten#)ndlehurst$&gboats$#ner',
+    '#(tchbacks&%ed-on\'!r&\'ing-off#$zzle"*ord-shaped%+s-isherwood$$n-in"$s715"&ynford!#y35""85"\'byl/nmr"!c""er',
+    '#"ph%!s#$vius"#mms#*phonically",napomorphies%\'tosomes#)chronises$$opal$&rotron$%ytial#\'ergetic#&spilus#/tactic-semantic"&remont',
+    '",st&egrave;me$2artup&mdash;v5.com$&em/360\'$6000&&atists&!e&$view!/z&uuml;r&ouml;s"%ajgin#\'rkowski"*eremietiew 1t&acirc;tonnement"+eacute;llez!%\'best"#top',
+    '"!3!#-54"!6"%butyl"#rna"%tests!".1"!3""55"!7""b.""d."&e.c.a.""u."&v.e.i.',
+    '!#3n1!#400!*a-ta-ta-ta"$arti"*b-packaged#!i#$lada$&e-tops##ram"$chai$.istoscopically$+yarrhythmia#&tility$"us"#dao',
+    '"$g-gy#$aloa##eia#(hribirdi"\'il-fins%%light$%coats&"ne$&enders$%oress$&pieces"%karoa#%izaki"&lapoin$!r',
+    '$$onis#$land$"ey$$y-ho"$nase##gly$#uts#&k-like##tum##ura#"ys"(pescript##pah")rasiewicz%"ov',
+    '$\'igrades%&s-like#&gowski#&siidae%!s#%taric"#sgi#(kmasters"&ta(cg)$&ta(cg)#%ersal#\'tenhall$"ie%"ng"$vola',
+    '#"il"&x-cuts$)exemption$\'induced#\'onomist"*ylor-young"%zieff!\'c-fresh"\'hakarov"!l!$df-i#!c""lb""wg!+ea-drinking',
+    '#.ching/training#&med-up$"s."%baldi")ch-greens$&nofear&%logie&$pole"%djini"*ethgrinder#%wurst"%illay#\'telbaum"%l.no.$&redcar',
+    '$&metrix$(software$)visionist#$idon#%l-all$%uride##son#!t"#mbu#$elin$$rlin##iar#2perature-dependent$\'le-like$$ters',
+    '$%forty$&to-one$&yearly#"ax#,dentiousness#%ormin#&sioner"&octist"#pee%!s#%idity")ratogenic)!s##day#,giversations',
+    '&!o$$time#$nata#%reiro$$orem&$ises#&seness#\'tiaries$$ulia"#sol#\'sellata%$ract#&tatrix$#bed$"ee',
+    '$\'imonium%-s-determining"$tney#\'ragonal%$logy%&plegic"\'wksbury"%xtrix$&urally!"fd!&gf&agr!%habor#&ddaeus#"im#%lamic',
+    '$\'nhauser#)psigargin##tto""e\'#%_same#%atral&%egoer\'$land#"ea$!d#&matize$(istocles(%klean#&odorou&$sian',
+    '#"rm%"ai&%lling%%ionic%(ocouples&&graphy$$rien$!s#+sis-related#"y\'"(iazoline#%bault#,ck-enamelled%$ener%$head',
+    '#"lo#)n-shelled$$gamy%"ey$)ly-veiled#%rsted&#ier$,ty-five-foot\'$plus\',two-year-old#+stlethwaite"%layli"#ole##mae$#mie',
+    ')+northampton#(racotomy$(newallis%#ier%*ton-norris$&steinn\'!n#"us%(and-fold("s.#"wt"%r-231#%aldom$%shers&!y',
+    '$"wn#\'ee-axis&%child&\'day-old&\'engined&)foot-high("ur&&in-one&&months&%parts\'"in\'&utting&&roomed&&second\'#hot',
+    '(!o&$yard%#ish%\'pennies%%somes#&ockley$+mboembolism\'&lytics\'#tic$,ugh-composed$&waways#&ustful""se"#uja#)ndercloud',
+    '!&ibaldi$#tto#%erias"-ckell/friends"\'demarks%$ills"&enchai#"tz"-ghtly-coupled"%lsley"&makata$!r%"li#0e&rehy;consuming$,-independent',
+    '$$sing%$lips#,man-speelman#\'orously"$n(s)#(-openers#$amou#&ctoria#$douf#\'khundla#(nunculus#%smith(!s#\'to-zinc$%swalo',
+    '#$sily"%ranti")ssue-type"$tism#*le-holders&$role%#ist#)terington!"m2""ca"\'s320c30!#n28"!5"!e!&o-ings',
+    '"#bey""da$*y/25.10.93"&e-rags"*ffee-brown"%isech"#kay"\'mahawks$#sek%\'inianus#"en#&ograms$$nori$$rrer"(ned-down',
+    '#%sures"\'o-close$%tight#"by#$heys#\'thpicks&(luckling%!s",p-fermenting$#six$#two#"ix"(rajaland$!o#(chlights',
+    '$!s#%fwerk#\'kington#%n-off#"or#%ville"$sani#!g#$sers"#ted#$oaba#"ty"%upees#*r-de-force%)operators',
+    '$#ish##sle"&w-rope#(er-block&%house%%ingly#&n-bred$$eley"*xicologist"&y-like#"ah#$boys#%maker(!s##oda',
+    '"!p""sb!#r-1"!4"%abajo#&celess$$homa%\'tenberg%#yte#+de-unionist$$ing.%*tion-bound#)ffic-jams#(gedienne$\'i-comic',
+    '%\'eeships%*ing-ground$(torously#%lbaut#&m-cars$&p-like#0nent/musselburgh$(quiliser$(s-alpine\'%ndean&&binary&(pyrenean%!.%&exuals%(ferrable',
+    '&\'iguring&(ormatory&#use%*literation%(mittable)+er/receiver%\'nasally%\'oceanic&"me%-perambulation&(lantable($stix&)ortations%)sexuality#$paud',
+    '#$v\'us$(ailliste$$eled%%rsers#$ylor")easurable$&twater#,e-structured$(creepers$!t%$runk#\'itschke#$main$&blings$$olos',
+    '%!k$$dily%\'setting$#tin%!o$!z#$rice#%ssler#\'vellian##win"(i-colour*"ed$#lux#&atomic#$cart',
+    '#\'foliata)!e##ggs##kes#\'malchio$#ley#!n$$culo$%idads$%nacle$&ordiol#,odontophorus#\'p-wires$)hosphates%%thong',
+    '&%print%&icates%$oids$%tychs#%s/hcl$$omet#(vializes"#obe#\'chantin#(fimovich#-isi&egrave;me#\'leyadan##nic#)ubleshoot%%ridge',
+    '$"pp$&tsdale$*v&eacute;s\')grave;res"!s"#uan#&esdale#)ff&eacute%"es#(mmelbach$$wine#%ssler##th."\'y-count$"on',
+    '#\'scorers!%s4525"*eveenjavyn"!o"#xp2!"te!$ube.#%ulars"$ckoo"#dev#!y"&g-boat#&endhat#%hluks"*lip-shaped',
+    '$"os$&y-west"%mbaga#+origenicity")ndra-like&!s#&efully$&smiths#+nel-related\'(visioned#&stalls""pe$"lo"#ran#+bo-charging',
+    '#\'key-red$!i%\'sh-born#%lough#$n-in$%coats$%ed-on%1r-harvest-ramirez$$keys$$wise#$quin#)tle-doves"%ssore"&t-tuts#!a',
+    '!#vlr!#w11"!3"$angy"%eezer#!l$-ve-forty-five#-nty-something&)something#\'seldown""id#(n/double$"em$$kles\'#ton',
+    '#(tchiness"+o-facedness%(oot-high$$male&$sted%&onthly$&octave%%n-one$%piano$#two$)under-par"%ynham!&ympana"$phis"*rannically',
+    '"#ube!+zintzuntzan \'u&prime!&-shape!#.21"#556"$e.e.!!/""mg!!3!!4!%6-rna!"ab!$b40s""ar',
+    '!#cnw!$dall",f-affiliated!%emura"#zdy!$feri"%ficio"\'ologist!%k-usa"$2000!$lman$#ria"\'sterior",tra-cautious&$safe',
+    '%&modern%+nationalism%&sparcs"\'ulation"%yanov!#max"!b#!o"!c!(n-french"\'adapted$+venturously&&rtised#&ligned#!n',
+    '#\'pparent%\'easable#%rgued#,scertainable$\'ked-for"&banded#)ecomingly#\'iblical#&lessed$&ushing#&raided$%idged$%uised#)uttressed"*calibrated',
+    '$$shed$(talogued%&chable%*egorisable#,haracterised%&stened$\'ildlike%$pped#)le-in-law%$arly#(omforted$&nsumed%(testable&+rollability$&rroded',
+    '$%eased$%opped%&ssable\'#ing")decidable$,mocratically$%r-13s&(carriage\'$lass\'&ounted&(explored)%osure&%floor&(gardener&)housemaid',
+    '&(occupied&#par\'&inning\'\'ressure%\'bidders%%count%$flow&(oresters%\'lyingly%\'manning&(entioned%)provision%(reported\'\'sourced%$slip',
+    '&(pecified%\'tenants%(utilised%&worked$\'sirably#)iscerning%&solved#+omesticated#&ulants&#tus",electability#)mbittered$)ployment.#)xportable$&tended',
+    '%#ing$(irnesses$$mous#\'easibly$"lt$\'rmented#%ished#\'lurried%#ted#(orgotten#(ractured#\'urrowed"\'grafted"$hand$(rmonious',
+    '##ewn".icorn-kanchana#"da$\'iomatic#$fier#*mpassioned%(lemented#&nduced$&flamed$\'spected$*terestedly#,on-patriotic&#set&$wide#$sons',
+    '#/versalisability\'$elle#0x-on-the-desktop%$type"&kissed"%latch#)istenable#$oose")melodious$&rciful#"lo#)odernised$$ored"(nameable#)ormalized',
+    '$+trusiveness##cal#\'riented#-stentatiously"%packs$(rdonably$)steurized#(enalised#"fa#,hilosophical#%layed#$osed#+recendented%\'scribed&\'surized',
+    '$$imed$+ofitability%\'grammed%(vocative"(quenched",recognisably$%duced$$eled$(gimented$(inforced$&mitted%(unerated$0presentativeness$)sistingly%)trainedly',
+    '")scrambled#-elf-conscious$+ntimentally$(ttlement#\'hadowed%#ved$%elled$%ipped#%moked#*pecialised$(ortingly$%rayed#+tandardised$&reaked#)ubsidized',
+    '$\'lphated$&mmoned$)sceptible#$wept#+ynchronised"\'terberg%%meyer#)imetabled#+ruthfulness#%ucked$#ned#$wist\'#ing"-usual-looking\'$ness',
+    '#\'iolated"\'watered#\'eighted$&lcomed$#rth#)ieldiness$$shed##orn%%thily!(p-coming##to-"!a"\'datable"%endra"+gradability',
+    '")per-floor##ish"\'ratings##ush"%shire#\'idedown#"ta$$roke#%wings!&rairat##nia")ban/rural"\'eilites"\'gencies&"y.',
+    '#$nous"!m"#nst"(ogenital!,s&amp&dollar#*dollar;000*)1,100,000,\'600,000+,.00=280.5000//a&dollar;1.2481+*20,000,000+%3,500,!0-(,000,000+%4,000',
+    '+)7,000,000,!0+!8+)9,000,000*)2,500,000,#600,#800+%9,000*%3,800+&00,000+%3,000*%4,100,#750+&00,000+"30',
+    '+)5,000,000,)0,000,000+)9,000,000*!5+!0+!5+"70*%6,500+&00,000*)7,000,000,#600+*00,000,000*!8**90,000,000+"30',
+    '#*registered#"uk"!3"+a/1989/cert"%ed_in#.r-configurable%)interface$&/carer$"id!&tamaro"!h"$opie"/terance-initial!%v/vis"!c',
+    '!$zzan 2v&aelig;r&oslash;y"-eacute;raison!#-2s"%necks"%tools!$.-p."%32bis"+4-compliant""a.""s.!,/multi-level"!r!"21"!2',
+    '"!9!#3.0!%42bis!\'acances%"te&"ia$$roiu$&tional##cae"$dasz#"is""ea"$idya#.son-la-romaine"#jda',
+    '#-ence-electron%*t&iacute;n#\'ify.txt#!k#\'ladares$$ecas%!s$!s#\'tellina#0ue-added/success&*components&+orientation&\'systems#%vular"#nda',
+    '"$peur#%idity#(ourchips&$ware"&ranger#*dar-morava#$esco#*iabilities%.nce-covariance%#tor##lan#&yingly"%scons$+ularisation#,e-decoration',
+    '#&ospasm"+t-exclusive##hek#-naj&ouml;kull"%utrin"(xstation"&zirani!$c10s!"db!%eazey"$dder"\'erasamy#$vers"*getatively"%ivers',
+    '#"ux"(national("es#$dale$*or-neutral#!e$#cia$(rability%)eologists%#unt##nel#(tersdorp$%ralis%(iloquial#&ulosum',
+    '("ed\'&zation%$scum$\'enaceae%!x$$less#%cueil##den#-ge-and-foliot#&itably#)ne-smiths#%onico#)ticillata#&uschka#$vain',
+    '"&salius##eth#"le""ta")xillation!*i&sacute;i""-3"%adana"&brance$%issae"/ce-chairmanship%(governor%+ministerial%%regal$\'_versa.',
+    '##oli")dal-saint+\'-phalle#,eo-cassettes&"in&)recorders%(/jessica&#kim&#tim"\'ewindex"$gars#$leik#%noles#"on"#ii.',
+    '"$liam#(lafranca%\'ge-like%-inous-looking"%mukti"+ncent-jones$!t#%erian#"ha#%ified##try"*olinschule#&nville"$pond"%rally',
+    '##ens#\'giniana#+tualstation"(scerally$$ious#\'hwendra##ick$&oncare&$less$(tatorial#"ky#\'ualizes"(talizing#!c#&icella',
+    '#%rines$\'onectin#%tatus"&verify#%ified##oli"%ziers!$lahs""bw"!f""ll"!n!"m+"(ro-dpmne!(ocalised',
+    '"*l&eacute;e#$:vol#$agir#$khov#/tage-controlled((operated\'+.controlled%&mmetry$%igeur#%umnia"$rtec$&icists")skresenie##tro"&taries',
+    '"#uld!\'raiment""ej""to!$t/vf"#229"!3"!c"#sik!(ulgarism\'&zation!$ynal"\'shinsky $w.11"#bl.',
+    '!"13"!e!"a7"\'cc-asia%&europe%)sponsored#(kersdorf$#ier"$ffly",ge-allowance%%books$$less#(ons-lits#&staffe"&iflike',
+    '"#jda"$kara##ely"%ldren#"ey#%k-off%\'through$#den$#lin#)l-hanging%&plates$"ac$%ed-in%\'t-sized$%plate',
+    '$(rafplatz$&sworth#-ter-guillaume#)zerkoenig"%mwere"(ndsbergh#&t-away$#ed."*r-memorial#+den/manager#&e\'ouse#%field#%grave#\'m-white$&ington',
+    '#)rior-king#&t-like$$burg"\'sh-down$&brooke$%erman$\'ing-day#!i#&p-like#(serstein"$tcha%%fires%&keeper#*er-boatmen&)chestnuts',
+    '&%proof&\'quality%%beach%%slide&$pout&$tart#&sonian&%ville"&velike$#rer%%ingly"%xbill"%ziers!,d/06/25/0001"!n',
+    '!&e/they"%akley#)pons-free#&re/raf$#ies#,ther-stained*\'ripping\'&boards\'\'cocking\'%stone#%vings"(bbington"+d&ndash;fri#,ding-present")ed-choked',
+    '#%k-day%"in$*ly-payment#"ow"\'gmuller"*ightlessly#%nburg$*rich-haste##ppe#\'zenbaum"+ld-blundell#*fare-state#(l-bedded%%cared%)deserving',
+    '%&priced%*referenced%)sheltered&%orted&&taffed$(ingtonia$$sian"(nceslaus"$ssis#%t-end%*north-west$/bury-sub-mendip$,ern-educated$%falen%#ord',
+    '$(minister$(phalians"*t-into-wet$\'nursing#&herill#$ters!#gfp!#haa#,tever-it-was"&eedles$%larch",ile-you-wait#$msey#%nchat$$ings',
+    '%$ings#"sh$%perer$+tle-blowers\'$stop#&takers%"ll$(e-beaked&\'cheeked&&topped%%abbey&$dder%$down%$sand)!s',
+    '%$wood$$land$$ting#\'zz-kids%$kids"%oomph$*ping-cough"!w!(ibberley$"le"(cketless$#son")de-angled%$band&#oys',
+    '%\'toothed$,ly-available$&screen##man"$eden#-ner_schnitzel")fe-givers$(/husband"#lce#\'dbrooks$\'fowlers(#ing$%smith#%iness#$lful',
+    '$%mouse$#ner$\'oughbys%%wbank#+son-johnson\'%smith"&n/loss#!a#$bond#\'ceyette$&hburgh%#man#,d-pollinated%(stirring%&tossed',
+    '$&lesham$(ows-like(\'to-unix\'#4gl$#row$-screen-wipers#*e-coloured%(shippers$\'cellars$"s.#&g-bars$$ates$$back$#man$$nuts',
+    '#$less#+stone/rspca#*ter/spring")re-rimmed$$d-in"(sh-lists$%fully#(sembourg#!t"&tchard#&h_each$6ington/gloucestershire#&nesham"#zzo!#laa',
+    '"&bblers"(hlenberg"$lage##fit$%owitz$\'schmidt#%husen#)lastonite"&manish%!s#\'en-folk&%years"(nderfull&%lands&%ments',
+    '"\'od-cuts%*engravings$&chucks%&utting$)en-framed$#ies$&mansey$#rop$$smen#%lleys$$rych#*mph-woomph#$tten#$zily$#ley',
+    '%%maker%(pictures$%craft$%s/min#&k-flow%&horses\'#urs&%ungry$(/leisure$%cards%$hart$#er.&#ist$)ing-level#)ld-ranked',
+    '\'#oul$#ock#\'m-lions##ner#(shipable#&thiest$$mann##zel""ss"$tsit!$rang#%pover#&ysbury"*estlemania"4ight/gloucestershire',
+    '#(nkliness#$ston#-te/paint/draw%$down%!n$%hings$&ing-up".ong-headedness!"t-#$like"$/vol!\'ulfsige"!n#&nerful"%s(uk)',
+    '!&yching"$mark#&ington"%nberg#"de##kyn#+ne-williams "x*!$-alt"$cell#)hromosome"&shaped!"/y!!5!$a(c)',
+    '"$nana"\'verians!"d2!#e1+")nobiotics!"g2"!3"!6!"h2""oi!"i."#ngu#!u!$k120!%lviii',
+    '!"pc!%rt/3d!\'uanping!(v-a-side!%xii\'s"$xxxx %y\'got!%-maze!%9,700!%aa-ma")cimientos"(gcibedir#"ub"#kut"&mato-1',
+    '##kel#!n"#ovi"%rkand##muk#$nell#%raman"&sukuni$!o"#wed!"c5!"d3!&e-e-es"%ar-in$"es',
+    '$\'ned-for"$eeow"+llow-legged&)ish-brown&$lees&\'y-green"#mer"$ndle#,i&ccedil;eri"#rse"&vgeniy!!j!\'ndamiro""tt!$ohei',
+    '""ka##sam"#lky"*rckstrasse#+kshire-tyne)%woman"$u_at!(thanbank!%uichi"#nan"\'rchenko!\'velines!#yyy #z01!%agora',
+    '""hn""im"&lewski"\'mbonini"#nda$%ering"$slaw""yn!\'bonszyn#\'rowskis!\'dzislaw!\'ealotry"\'ldovich"$nana!&hinsky',
+    '!$iaur"$eten"&lligen##zal"$ming"%ngari#&keisen!%modem!$nf37!\'oetrope")mbie-like"$nula"%pyros!\'ubaydat#"in',
+    '#!z"\'richers!&weeloo#%lakhe!%ydeco',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_26 = (
+count_26 = 6695
+
+heads_26 = (
     'bougies',
-    'bouncier',
-    'boung',
-    'bouraima',
-    'bouraleh',
-    'bourdieuan',
-    'bourgie',
-    'bourneville',
-    'bouvines',
-    'bovid',
-    'bowaters',
-    'bowbelle',
-    'bowburn',
-    'bowd/bristol',
-    'bowd/london',
-    'bowd/northampton',
     'bowhead',
-    'bowlem',
-    'bowman/environmental',
-    'bowra',
-    'bowshot',
-    'bowstrings',
-    'box-bed',
-    'boyishness',
-    'boyton',
-    'bozize',
-    'bp-long',
-    'bpt',
-    'bpx-a',
-    'bq/m',
-    'br&uuml;nnhilde',
-    'br1',
     'bra-less',
-    'bracebridge',
-    'bracelet.',
-    'brachial',
-    'brackenhoe',
-    'brackmills',
-    'braddon',
-    'bradwardine',
-    'braemount',
-    'bragge',
-    'brahim',
-    'braillers',
-    'brain-cells',
-    'brain-specific',
-    'brain-storm',
-    'brain-tree',
     'brainbox',
-    'braiswick',
-    'braitenberg',
-    'brakevans',
-    'braks',
-    'braless',
-    'branchester',
-    'brandenburg-prussia',
-    'brass-topped',
-    'brassi&egrave;res',
-    'brauer',
-    'brawnier',
-    'brayford',
-    'braziliensis',
-    'breac',
-    'breadbasket',
     'breadheads',
-    'breadknife',
-    'breakbeats',
-    'breakdancer',
-    'breakey',
-    'breakin\'',
-    'breast-milk',
-    'breathalysers',
-    'breathers',
-    'brecciation',
-    'brechfa',
-    'breeks',
-    'breeze-blocks',
-    'brega',
-    'breitenbach',
-    'brens',
     'bretherton',
-    'brettargh',
-    'brettel',
-    'brewood',
-    'bricked-up',
-    'brickmaker',
-    'brickwall',
-    'brid',
-    'bridbury',
-    'bridge-builders',
-    'bridge-mounted',
-    'bridgstock',
-    'brigach',
-    'brigden',
-    'bright-blue',
-    'brightnesses',
     'brightwork',
-    'brihtwine',
-    'brillient',
-    'brimington',
-    'brimmell',
-    'bringmann',
-    'brissaud',
-    'bristlewhite',
-    'bristleworm',
-    'bristol-siddeley',
-    'brither',
-    'brittan/race',
-    'britten-norman',
-    'broackes',
-    'broad-class',
-    'broad-classes',
     'broad-fronted',
-    'broadcloths',
-    'broadmead',
-    'brocard',
-    'brochettes',
-    'brockham',
-    'brodmann',
-    'brodribb',
-    'brodskys',
-    'broggers',
-    'brok',
-    'brombach',
-    'bromell',
-    'bromich',
-    'brompton-on-swale',
-    'bronchoalveolar',
     'bronchoconstriction',
-    'bronzers',
-    'bronzework',
-    'brookland',
-    'broos',
-    'brorsen',
-    'brossa',
-    'brother/sister',
-    'broudie',
-    'broughshane',
-    'broughton-in-furness',
-    'brown-field',
-    'browned-off',
-    'brownless',
-    'bruce-gardyne',
-    'bruen',
     'bruhl',
-    'bruited',
-    'brunete',
-    'brunhart',
-    'brunt-v&auml;is&auml;l&auml',
-    'brunyate',
-    'brunzell',
-    'bruyce-hoare',
-    'brydie',
-    'brympton',
-    'brynulf',
-    'bs1',
-    'bt&amp;d',
-    'bt52',
-    'bubastis',
-    'buber-neumann',
     'buccinum',
-    'buckeridge',
-    'buckfast',
-    'buckingham-hatfield',
-    'buckminster',
-    'budd-pieterse',
-    'buddha-like',
-    'budget-conscious',
-    'budleigh',
-    'budwood',
-    'budyn',
-    'buffalos',
-    'buffetaud',
-    'buffetings',
-    'buglers',
-    'bugti',
     'buk',
-    'bull-like',
-    'bulletholes',
-    'bullishly',
-    'bullows',
-    'bulpitt',
-    'bumpier',
-    'bumpouses',
-    'bundesbahn',
-    'bundini',
-    'buquoy',
-    'burcher',
-    'burgh-le-marsh',
-    'burgomaster',
-    'burin',
-    'burkes',
     'burlier',
-    'burlingtons',
-    'burniston',
-    'burnopfield',
-    'burrington',
-    'burseraceae',
-    'burstyn',
-    'burwick',
-    'bushbaby',
-    'bushley',
-    'bushwick',
-    'businessperson',
-    'bust-ups',
-    'butai',
-    'buto',
-    'butragueno',
     'butterfly-like',
-    'butyrate/',
-    'buvina',
-    'buzz-pop',
-    'bxa4',
-    'bxc5',
-    'by-gone',
-    'by-lines',
-    'by-road',
-    'by-standers',
-    'bydales',
-    'bye-',
-    'bynner',
-    'bywords',
-    'c&amp;b',
-    'c&amp;c',
     'c&amp;tl',
-    'c&eacute;l&egrave;bres',
-    'c&lsqb;x&rsqb',
-    'c\'&egrave',
-    'c*ntona',
-    'c-1',
-    'c-could',
-    'c-gevs',
-    'c-scope',
-    'c.1',
-    'c.1300',
-    'c.1500',
-    'c.1700',
-    'c.1930',
-    'c.3',
-    'c.4',
     'c.450',
-    'c.b.c.',
-    'c.c.u.',
-    'c.elegans',
-    'c.f',
-    'c.i.',
-    'c.i.f.',
-    'c.itoh',
-    'c.j.s.',
-    'c.l.j.',
-    'c.m.e.',
-    'c.p.a.',
-    'c.p.v.e.',
-    'c.u.',
-    'c/c',
-    'c/t',
     'c12',
-    'c130',
-    'c152',
-    'c1716t',
-    'c20:4n6',
-    'c57b1/6-wld',
-    'c6h6',
-    'c:cure',
-    'ca-unicenter/125',
-    'ca2',
-    'cab-drivers',
-    'cabinetry',
-    'cable-connected',
-    'caceres',
-    'cachemaster',
-    'cadential',
     'cadot',
-    'caelidhes',
-    'caf&eacute;-concerts',
-    'cafard',
-    'caffrey',
-    'caffs',
-    'cage.',
-    'cagnes-sur-mer',
-    'cailaco',
-    'cajoles',
-    'cake-stand',
-    'cal-volair',
-    'calc.',
-    'calcareous-silty',
-    'calcic',
-    'calcium-activated',
     'caldbecks',
-    'calibres',
-    'calif',
-    'californica',
-    'californie',
-    'caligari',
-    'caliphates',
-    'call-ups',
-    'called-up',
-    'callington',
-    'calo',
-    'calprotectin',
-    'caltex',
-    'calthrop',
-    'calzini',
-    'camberwick',
     'cambri&aelig',
-    'camera-shake',
-    'camilien',
-    'campaniles',
-    'campell',
-    'campestris',
-    'campground',
-    'campora',
-    'camusfearna',
-    'canards',
-    'canarian',
-    'canhas',
-    'cannibalise',
-    'cannich',
-    'canniesburn',
-    'canonbury',
     'canonically',
-    'cantalupo',
-    'cantonments',
-    'cantrefmawr',
-    'canute-like',
-    'canvex',
-    'canyon-like',
-    'capacitor-coupled',
-    'capaldi',
-    'capital-budgeting',
-    'capital/',
-    'capital/output',
-    'capitalisms',
-    'capitulum',
-    'capovilla',
-    'caprimulgus',
     'capris',
-    'capsicum',
-    'capuchon',
-    'car-less',
-    'car-like',
-    'caraj&aacute;s',
-    'caramazza',
-    'carboys',
-    'carcinoidosis',
-    'carcinomatous',
-    'carders',
-    'cardie',
-    'cardinalate',
-    'cardiological',
-    'cardiologists',
-    'cardona',
     'carefully-worded',
-    'carillon',
-    'carload',
-    'carlon',
-    'carnaud-metalbox',
-    'carnega',
-    'carneiro',
-    'carnell',
-    'caroll',
-    'carolyne',
-    'carparks',
-    'carr&eacute;e',
-    'carr-saunders',
-    'carrels',
-    'carri-med',
-    'carrick-on-shannon',
     'carrier-bags',
-    'carriles',
-    'carrogis',
-    'carry-back',
-    'carry-ons',
-    'carsat',
-    'carsten',
-    'cartoo',
-    'caruana',
-    'carus-wilson',
-    'case-load',
-    'casei',
-    'cashable',
-    'casodex',
-    'cassegrain',
-    'cassiodorus',
     'casta',
-    'castalians',
-    'castellanies',
-    'castellations',
-    'castelo',
-    'castiella',
-    'castlehead',
-    'castoffs',
-    'castrey',
-    'castroism',
-    'cat-o\'-nine-tails',
-    'cat/dog',
-    'catabolic',
-    'cataclysms',
-    'cataglyphis',
-    'cataldo',
     'catalogs',
-    'cataloguing-in-publication',
-    'catamite',
-    'catamites',
-    'catarrhine',
-    'catch-as-catch-can',
-    'catchiness',
-    'cateau',
-    'category.',
-    'cateran',
-    'catfood',
-    'catherines',
-    'cathryn',
-    'cattiness',
-    'cattle-stealing',
-    'cattle-wade',
     'cauchy-green',
-    'cauldon',
-    'cautio',
-    'cava&ccedil;o',
-    'cavagna',
-    'cave-paintings',
-    'caved-in',
-    'cavernosa',
-    'cavernosum',
-    'cavitation',
-    'cawnpore',
-    'cb7',
-    'cbs/fox',
-    'cbv',
-    'ccdfg',
-    'ccl4',
     'ccop',
-    'ccsce',
-    'cd-rom-based',
-    'cd4-positive',
-    'cd45r0-positive',
-    'cd45ra-positive',
-    'cebada',
-    'cedel',
-    'ceilingwards',
-    'celac',
-    'celandines',
-    'celebren',
-    'celest',
-    'cellarmaster',
-    'cellblock',
-    'cellobiose/mannitol',
     'cellularity',
-    'celluloses',
-    'celon',
-    'celuform',
-    'cemetery.then',
-    'cennini',
-    'centenaries',
-    'centenery',
-    'centimetric',
-    'centimorgans',
-    'centrafricain',
-    'centralisers',
-    'centrally-imposed',
-    'centre-devised',
-    'centre-parted',
-    'centre-tapped',
     'centrocyte',
-    'centuries-long',
-    'cephalosporin',
-    'ceramically',
-    'cerebro-spinal',
-    'cerebro-vascular',
-    'cerney/gloucestershire',
-    'certifieds',
-    'ceruloplasmin',
-    'cervicornis',
-    'cesaris',
-    'cespitosus',
-    'cesser',
-    'cetina',
-    'cevennes',
-    'cg(aat)',
     'ch.3',
-    'chaban-delmas',
-    'chacin',
-    'chador',
-    'chaetognaths',
-    'chain-making',
-    'chair-leg',
-    'chairmaster',
-    'chalabi',
-    'chaldecott',
-    'chalkland',
-    'chalumeau',
-    'chamber-pots',
-    'champs-elysees',
-    'chancelleries',
-    'change-management',
     'channel-associated',
-    'chapatis',
-    'chapbooks',
-    'chaplets',
-    'chaptal',
-    'character-oriented',
-    'characterisable',
-    'charango',
-    'charcoal-grilled',
-    'charcutiers',
-    'charge-hands',
-    'charge_d\'affaires',
-    'chari',
-    'charringtons',
-    'charterparty',
-    'chatel',
     'chatterboxes',
-    'chatteris',
-    'chattiness',
-    'chb',
-    'checkconsistency',
-    'checkstays',
-    'cheek-pieces',
-    'cheekier',
-    'cheeriness',
-    'cheeringly',
-    'cheeseboards',
-    'chef/proprietor',
-    'chelation',
-    'chelator',
-    'chemical-weapons',
-    'chemolitholytic',
     'chenas',
-    'cheque-books',
-    'cherishable',
-    'chernishov',
-    'cherrykino',
-    'chesshire',
-    'chessman',
-    'chessplayers',
-    'chesterle-street',
-    'chetwood',
-    'chevauch&eacute;es',
-    'chewable',
-    'chewed-up',
-    'chewonki',
-    'cheynes',
-    'chez_nous',
     'chi-ming',
-    'chiarodo',
-    'chiasm',
-    'chickadees',
-    'chief-inspector',
-    'chieftainship',
-    'child-friendly',
-    'child/adult',
-    'chile-peru',
-    'chillerton',
-    'chillims',
-    'chimney-sweeps',
-    'chimonanthus',
-    'chinchen',
-    'chipboards',
-    'chisel-like',
     'chisi',
-    'chlamydial',
-    'chlidonias',
-    'chlorines',
-    'chn',
-    'choc-bar',
-    'chocka',
-    'chocolate-flavoured',
-    'choiseul-gouffier',
-    'chokily',
-    'cholangiographic',
-    'cholecystostomy',
-    'choleresis',
-    'cholinesterase',
-    'cholmeley',
-    'chondrite',
     'chondritic',
-    'chopped.',
-    'choppier',
-    'chopstick',
-    'chordate',
-    'choreartium',
-    'chorillo',
-    'chorion',
-    'chotek',
-    'choyce',
-    'choyjamtsyn',
-    'chracian',
-    'christadelphians',
-    'christiani',
-    'christlikeness',
-    'christmas-',
     'chromate-free',
-    'chromatids',
-    'chromatogram',
-    'chromosphere',
-    'chroniques',
-    'chroustova',
-    'chs.800/87',
-    'chucker',
-    'chucking-out',
-    'chunky-knit',
-    'chupp',
-    'church-like',
-    'church-wardens',
-    'churchdown',
-    'churlishness',
-    'churston',
     'chussil',
-    'chyme',
-    'ciche',
-    'cife',
-    'cigar-case',
-    'ciggy',
-    'ciliary',
-    'cinematographers',
-    'cinephiles',
-    'cinven',
-    'circle-to-land',
-    'circs',
-    'circumcincta',
-    'circumlocutory',
-    'circumnavigators',
-    'cisternino',
     'citator',
-    'citifluor',
-    'citizen-soldiers',
-    'citizenly',
-    'city-bred',
-    'citywide',
-    'civic-minded',
-    'civil-engineering',
-    'civil-military',
-    'civitatis',
-    'cix',
-    'cjd',
-    'cladistic',
-    'cladograms',
-    'claggy',
-    'claimer',
     'clampers',
-    'clanfield',
-    'clangers',
-    'clanks',
-    'clap-trap',
-    'claphamites',
-    'clapotis',
-    'clapperboard',
-    'clarinetist',
-    'clarrie',
-    'class-mates',
-    'class-members',
-    'class-neutral',
-    'class-oriented',
-    'class-rooms',
-    'classism',
     'clause(s)',
-    'clean-in-place',
-    'clearout',
-    'cleatlam',
-    'cleavers',
-    'cleits',
-    'clemenciae',
-    'clemmett',
-    'clergy-laity',
-    'cleverley',
-    'clicky',
-    'clientship',
-    'cliff-tops',
-    'climacteric',
-    'climb-out',
-    'clinicopathologic',
     'clippie',
-    'clipson',
-    'cliquey',
-    'clist',
-    'clitic',
-    'clivus',
-    'clmscase',
-    'cloacal',
-    'clock-radio',
-    'clocktower',
-    'clodd',
-    'close-cut',
-    'close-grained',
-    'close-mouthed',
-    'close_to',
-    'closely-fitting',
     'closely-linked',
-    'cloth-eared',
-    'cloudwatchers',
-    'cloyingly',
-    'club-mates',
-    'cluj-napoca',
-    'clunies-ross',
-    'clutterbucks',
-    'clvi',
-    'clx',
-    'clyro',
-    'cm1',
-    'cm17',
-    'cmaj7',
-    'cmd',
-    'cmfh',
     'cmnd.4506',
-    'cnaa-validated',
-    'co-ax',
-    'co-efficients',
-    'co-evolved',
-    'co-factors',
-    'co-habitee',
-    'co-nationals',
-    'co-optimists',
-    'co-products',
-    'co-reference',
-    'co-seigneurs',
-    'co-signatories',
-    'co-tenant',
-    'co-terminous',
-    'co-transfection',
     'co-writing',
-    'co2-free',
-    'coach-load',
-    'coachhouse',
-    'coal-laden',
-    'coal-owners',
-    'coal-pits',
-    'coalie',
-    'coalminer',
-    'coamings',
-    'coarticulation',
-    'coasts.',
-    'cobak',
-    'cobban',
-    'cobblestone',
-    'coccoidea',
     'coch&egrave;res',
-    'cochem',
-    'cocherel',
-    'cock-crow',
-    'cockchafers',
-    'cockernee',
-    'cockley',
-    'cocky\'s',
-    'coddington',
-    'code-breakers',
-    'codenet',
-    'coding-details-are',
-    'coed-eva',
-    'coeducational',
-    'coequal',
-    'coffee-breaks',
     'coho',
-    'cohr',
-    'coignetiae',
-    'coin-ops',
-    'coinbox',
-    'coiners',
-    'coinfection',
-    'coked-up',
-    'colchicus',
-    'colcloughs',
-    'cold-related',
-    'cold-shoulder',
-    'cold-water',
-    'colebrooke-cameron',
-    'colectivo',
-    'colectomies',
     'colerne',
-    'colinic',
-    'colins',
-    'collectivists',
-    'collicts',
-    'collicutt',
-    'collinear',
-    'colludes',
-    'colonizaci&oacute;n',
-    'colonus',
-    'colorless',
-    'colour-shaded',
-    'colourlessly',
-    'columbus-america',
-    'colvill',
-    'colworth',
     'com.',
-    'com1',
-    'comaneci',
-    'comb-like',
-    'comb-out',
-    'combas',
-    'comber-dundonald',
-    'combiners',
-    'combustiveis',
-    'come-ons',
-    'comfier',
-    'comhairle',
-    'comisiones',
-    'comiston',
-    'command-level',
-    'commando-like',
     'commandoes',
-    'commital',
-    'commodity-producing',
-    'common/worcestershire',
-    'commotions',
-    'communiques',
-    'communistes',
-    'commutations',
-    'comon',
-    'compak',
-    'compartmentalism',
-    'compendiums',
-    'compl&egrave;te',
-    'complementarities',
-    'completly',
-    'composite-rate',
     'comprehensibly',
-    'compromiser',
-    'comptrollership',
-    'compute-intensive',
-    'computer-driven',
-    'computer-like',
-    'computer-to-unix',
-    'comset',
-    'comsport',
-    'comt&eacute;s',
-    'comuni&oacute;n',
-    'concentratedly',
-    'concentration-dependent',
-    'concentrative',
-    'conceptualizes',
-    'conceptuses',
     'concert-halls',
-    'concertedly',
-    'concertinas',
-    'concerting',
-    'conchas',
-    'conclusions.',
-    'condensers',
-    'condensor',
-    'conditons',
-    'condos',
-    'condyle',
-    'condylomata',
-    'confessedly',
-    'confidence-booster',
-    'confider',
-    'confiscatory',
     'conflab',
-    'conflagrations',
-    'conformally',
-    'confusional',
-    'congest',
-    'congruency',
-    'conium',
-    'conjunctiva',
-    'conjurations',
-    'connaughton',
-    'connection_with',
-    'connectivities',
-    'conquistadore',
-    'conservation.',
-    'conservative/liberal',
-    'constable/thames',
     'constancies',
-    'construals',
-    'constructible',
-    'construction.',
-    'constructionally',
-    'constructionism',
-    'constructionists',
-    'constructivists',
-    'consubstantial',
-    'consubstantiation',
-    'consularis',
-    'consulship',
-    'consulting-rooms',
-    'consummating',
-    'contadini',
-    'contains-binary-of',
     'contamines',
-    'contemplatif',
-    'contemplations',
-    'context-specification',
-    'continous',
-    'continuity/discontinuity',
-    'contra-indications',
-    'contract-based',
-    'contracts.',
-    'contributive',
-    'contributories',
-    'controls.',
-    'controversialists',
-    'contumacious',
-    'convectors',
-    'convergencia',
     'conveyance/transfer',
-    'coolbox',
-    'cooman',
-    'cooptation',
-    'copings',
-    'coppa',
-    'coppinger',
-    'copters',
-    'copy-plan',
-    'copy-protected',
-    'copy-writers',
-    'copyguards',
-    'coralife',
-    'corbio',
-    'corcuera',
-    'cord&oacute;n',
     'cordingly',
-    'cordy-simpson',
-    'core-mantle',
-    'corgan',
-    'cori',
-    'corinian',
-    'corkboard',
-    'corn-dolly',
-    'cornburgh',
-    'cornelians',
-    'cornelio',
-    'cornlands',
-    'cornwallis-west',
-    'coronoid',
-    'corporeality',
-    'correctionalists',
     'corrector',
-    'corridor-like',
-    'corrigibility',
-    'corrodies',
-    'corrody',
-    'corrosion-proofing',
-    'corrosiveness',
-    'corrugation',
-    'corruptibility',
-    'corsetry',
-    'corte',
-    'corvids',
-    'cosiest',
-    'cosmedin',
-    'cosmic-rays',
-    'cost-',
     'cost-benefits',
-    'cost-minimizing',
-    'cost-reducing',
-    'costelloe',
-    'cotectic',
-    'cotel',
-    'cotransporter',
-    'cotrubas',
-    'cotton/35%',
-    'coulda',
-    'couldaint',
-    'coulsdon',
-    'council-funded',
-    'counter-alliances',
-    'counter-charges',
-    'counter-cultures',
     'counter-elite',
-    'counter-ideology',
-    'counter-position',
-    'counter-rumours',
-    'counter-stroke',
-    'counter-tenors',
-    'countermeasure',
-    'counterpanes',
-    'counterposes',
-    'counterproposal',
-    'counterregulatory',
-    'counterrevolutionary',
-    'countley',
-    'countship',
-    'county-district',
-    'courchevel',
     'coureurs',
-    'course-integrated',
-    'course-name',
-    'courtenay/oxfordshire',
-    'courthill',
-    'courtley',
-    'cousens',
-    'couto',
-    'covariates',
-    'covariation',
-    'coverers',
-    'cowbridge',
-    'cox/managing',
-    'coxon-barringford',
-    'coxswain/mechanic',
-    'coyles',
     'cozumel',
-    'cp6.1',
-    'cp6.2',
-    'cpb',
-    'crablike',
-    'crack-brained',
-    'cracklines',
-    'cracksman',
-    'cradleboard',
-    'crafthole',
-    'craftsmanlike',
-    'craftswoman',
-    'craftworkers',
-    'craftworks',
-    'craigannet',
-    'craigmuir',
     'craniates',
-    'cranna',
-    'crayola',
-    'craythorne',
-    'creamily',
-    'crease-resistant',
-    'creatives',
-    'credit-based',
-    'credland',
-    'creds',
-    'credta/l-rhamnose',
-    'crepitations',
-    'cressing',
-    'crestacare',
-    'cretaceous/tertiary',
-    'cretans',
     'creteil',
-    'crewmates',
-    'creys-malville',
-    'cricetids',
-    'crichlow',
-    'crichton-smith',
-    'cricketline',
-    'crigman',
-    'crime-busting',
-    'criminal-justice',
-    'criminologies',
-    'crine',
-    'cringletie',
-    'crioulo',
-    'cripo',
-    'crise',
     'critikon',
-    'critten',
-    'critter',
-    'croakily',
-    'croes',
-    'cromac',
-    'crop-marks',
-    'crop-spraying',
-    'cross-departmental',
-    'cross-domain',
-    'cross-domed',
-    'cross-dressers',
-    'cross-examinations',
-    'cross-hairs',
-    'crossbills',
-    'crosskeys',
     'crossmember',
-    'crossness',
-    'crotchless',
-    'croudace',
-    'crousel-robelin-bama',
-    'crow\'s-feet',
-    'crowcombe',
-    'crowd-pleasers',
-    'crowdy',
-    'crowther-hunt',
-    'croyland',
-    'crudo',
-    'cruets',
-    'cruisbruk',
-    'crunched-up',
-    'crustier',
     'crustless',
-    'cryings',
-    'cryne',
-    'crypt/hour',
-    'crypt/villus',
-    'cryptologist',
-    'crystallographer',
-    'csaba',
-    'csbm',
-    'csfs',
-    'cslewis',
-    'csrs',
-    'csurka',
-    'ctg',
-    'ctrn',
-    'cu-pb-zn',
     'cu1',
-    'cuarto',
-    'cuban-heeled',
-    'cuboidal',
-    'cucurbitaceae',
-    'cuevas',
-    'culford',
-    'culminations',
-    'cultist',
-    'culturalideological',
-    'culturalists',
-    'cumae',
-    'cumbey',
-    'cuningham',
-    'cunliffe-lister',
-    'cup-a-soup',
     'curcio',
-    'curll',
-    'curriculum.',
-    'cursings',
-    'cursively',
-    'curtained-off',
-    'curtea',
-    'curthose',
-    'curtiss-wright',
-    'curvatus',
-    'cushley',
-    'cut-out-and-keep',
-    'cutting-off',
-    'cuv&eacute;es',
-    'cuve',
-    'cuvette',
     'cv12',
-    'cv470',
-    'cvp/pdc',
-    'cwc',
-    'cwm-parc',
-    'cxii',
-    'cxl',
-    'cyanoguttatum',
-    'cycloaddition',
-    'cycloaracylation',
-    'cyclorama',
-    'cynegils',
-    'cynllaith',
-    'cypriot-registered',
-    'cytogenetically',
-    'cytogeneticist',
     'cytolytic',
-    'cytophotometric',
-    'czechowska',
-    'czirr',
-    'd&amp;r',
-    'd&flat',
-    'd\'66',
-    'd\'abreu',
-    'd\'amico',
-    'd\'amitie',
-    'd\'annunzio',
-    'd\'aosta',
-    'd\'arblay',
-    'd\'aspin',
-    'd\'aubisque',
-    'd\'auge',
     'd\'austerlitz',
-    'd\'avocourt',
-    'd\'hauterive',
-    'd\'oggiono',
-    'd(i-c)',
-    'd(n)',
-    'd-1',
-    'd-did',
-    'd-notice',
-    'd.2',
-    'd.a.k.',
-    'd/03/25/0001',
-    'd/a',
-    'd/f',
-    'd15',
-    'd15s12',
     'd200',
-    'd3ca',
-    'd=',
-    'da-da',
-    'dabblings',
-    'dachauer',
-    'dacko',
-    'dadaism',
-    'daff',
-    'dagblad',
-    'daggerboards',
-    'dagvasurengiyn',
-    'dagworth',
-    'dahabeeyahs',
-    'daies',
-    'dailey',
     'dairen',
-    'daisan',
-    'daisy-like',
-    'dalbergia',
-    'dalbir',
-    'dallara',
-    'dallas-fort',
-    'dalley',
-    'dallimore',
-    'dalmation',
-    'dalton-on-tees',
-    'damasio',
-    'dammers',
-    'damn-all',
-    'damph',
-    'damping-off',
     'damselflies',
-    'damsells',
-    'danca',
-    'dancefloors',
-    'danebury',
-    'danesfield',
-    'dankness',
-    'daohan',
-    'daring-do',
-    'darkfield',
-    'darkrooms',
-    'darleyensis',
-    'darly',
-    'darwinistic',
-    'dasgupta',
-    'data-oriented',
     'database-independent',
-    'databasename',
-    'datacentre',
-    'datapath',
-    'dateless',
-    'daudet',
-    'daughterly',
-    'daulte',
-    'davidson/scotland',
-    'davies-hale',
-    'davisian',
-    'day-bed',
-    'dayal',
-    'dayside',
-    'daytrippers',
-    'dbd',
     'dbl',
-    'dbp',
-    'dbq',
-    'dbt',
-    'dc3',
-    'dd-1',
-    'de-caf\'',
-    'de-emphasizing',
-    'de-loan',
-    'de-selection',
-    'dea/cia',
-    'deactivation',
-    'dead-looking',
-    'dead-white',
-    'deadens',
-    'deader',
     'deadpans',
-    'deaf-and-dumb',
-    'deanshanger',
-    'dearies',
-    'dearle',
-    'debatably',
-    'debateable',
-    'debauchees',
-    'debridement',
-    'debt-crippled',
-    'debt-driven',
-    'debtee',
-    'dec/3000',
-    'decaff',
-    'decagon',
-    'deceitfully',
     'decelea',
-    'decelerates',
-    'december-14',
-    'deceptiveness',
-    'decerns',
-    'decidable',
-    'decision-problems',
-    'declamations',
-    'declarator',
-    'declension',
-    'decollement',
-    'decommission',
-    'decompile',
-    'dedicatees',
-    'deena',
-    'deep-bodied',
     'deep-breathing',
-    'deep-chested',
-    'deeping',
-    'deepwell',
-    'deerey',
-    'deewatch',
-    'defamer',
-    'defames',
-    'defect-free',
-    'defendents',
-    'definites',
-    'deflectors',
-    'defloration',
-    'deflower',
-    'deformable',
-    'defragmentation',
     'deglutition',
-    'degradable',
-    'degradative',
-    'degree/diploma',
-    'degrees.',
-    'dehumidifiers',
-    'dehydrates',
-    'deiniol',
-    'delarivi&egrave;re',
-    'delation',
-    'delectably',
-    'delegator',
-    'deleteriously',
-    'delhi-wallah',
-    'deliberates',
-    'delimiters',
     'delisted',
-    'delluc',
-    'deloney',
-    'dels',
-    'delta-t',
-    'deltoids',
-    'demagoguery',
-    'demander',
-    'demarche',
-    'demba',
-    'demerol',
-    'demery',
-    'demesmen',
-    'demilitarise',
-    'demisters',
-    'democracy.',
     'demulch',
-    'demystifies',
-    'denchworth',
-    'denisov',
-    'deniz',
-    'denization',
-    'dennys',
-    'denol',
-    'denotative',
-    'denotive',
-    'denuclearization',
-    'departements',
-    'dependentistas',
-    'depersonalisation',
-    'depleters',
-    'depoliticisation',
     'deportee',
-    'deprecates',
-    'depreciatory',
-    'depressurisation',
-    'deracialization',
-    'deradicalization',
-    'derbs.',
-    'derived-term',
-    'derri&egrave;re',
-    'derryanville',
-    'deryk',
-    'des/welsh',
-    'description/classification',
-    'desiccating',
-    'design/development',
-    'desimir',
     'desists',
-    'deskstation',
-    'desmocollinite',
-    'despoiler',
-    'desquamation',
-    'dessus',
-    'dest',
-    'dester',
-    'destructions',
-    'determiend',
-    'dethronement',
-    'devasted',
-    'developement',
-    'devenney',
-    'deverell',
-    'deviationist',
     'deviatoric',
-    'deville',
-    'dewclaws',
-    'dewitt',
-    'dextra',
-    'deyneka',
-    'deza',
-    'dh.90',
-    'dh1',
-    'dhanab',
-    'dhanraj',
-    'dharan',
-    'dhfrs',
-    'dhi',
-    'dhobis',
-    'dhundi',
     'di6',
-    'diabate',
-    'diabolus',
-    'diachronically',
-    'diagnosable',
-    'diagnosis/isolation',
-    'diagrammatical',
-    'dialectological',
-    'dialectologists',
-    'diamond-studded',
-    'dianette',
-    'diani',
-    'diball',
-    'dibby',
-    'dichlorvos',
-    'dictatorially',
     'dida',
-    'didgeridoos',
-    'die-off',
-    'dieman',
-    'diesel/electric',
-    'difference-of-squares',
-    'different-looking',
-    'differentiated-product',
-    'differentiators',
-    'differently.',
-    'difformis',
-    'diffusible',
-    'diffusivities',
-    'digged',
-    'digitrapper',
-    'dignatories',
     'digressive',
-    'dihydrochloride',
-    'dilatata',
-    'dilatations',
-    'dillenius',
-    'dilston',
-    'dilwyn',
-    'dimethylnitrosamine',
-    'dimpfel',
-    'dimsdale',
-    'dimwits',
-    'dinaedta',
-    'dining-rooms',
-    'dinkies',
-    'dinkly',
-    'dintenfass',
     'diopside',
-    'diorites',
-    'dioxides',
-    'dioxin-contaminated',
-    'dioxygen',
-    'diploids',
-    'dipsomaniacs',
-    'diptheria',
-    'direct-link',
-    'directe',
-    'directionality',
-    'directors.',
-    'direly',
-    'dirigible',
-    'dirt-poor',
-    'dirty-looking',
     'disablism',
-    'disanalogy',
-    'disappeared.',
-    'disbeliever',
-    'disc-jockeys',
-    'discerningly',
-    'discipline-orientated',
-    'discouragements',
-    'discretion.',
-    'discussion.',
-    'disease-specific',
-    'disempowers',
-    'disenfranchises',
-    'disentis',
-    'disequilibria',
-    'disfranchisement',
     'disgracing',
-    'dishayloo',
-    'dishevelment',
-    'disillusionments',
-    'disingenuousness',
-    'dismantlers',
-    'dismayingly',
-    'dismissable',
-    'dismissible',
-    'disorient',
-    'dispersionists',
-    'disproportional',
-    'disquietude',
-    'disruptively',
-    'dissatisfiers',
-    'disse',
     'disserendi',
-    'dissipations',
-    'dissociable',
-    'dissolutionary',
-    'dissolutions',
-    'dissuasive',
-    'distamycin-a',
-    'distinguishability',
-    'distributer',
-    'distrustfully',
-    'ditchers',
-    'ditchingham',
-    'ditchling',
-    'ditfurth',
-    'dithyrambic',
-    'ditta',
     'diurnally',
-    'divismore',
-    'diyers',
-    'djebel',
-    'djibrine',
-    'dkbs',
-    'dlr',
-    'dm/svr4',
-    'dm1.4',
-    'dm12',
-    'dm128',
-    'dm150,000',
-    'dm20',
-    'dm20,000',
-    'dm28',
-    'dm48',
     'dm6,000',
-    'dm60',
-    'dmem/10%fbs',
-    'dmh',
-    'dmix',
-    'dmp',
-    'dnc',
-    'dntp',
-    'dobhrain',
-    'doblin',
-    'dobr&yacute',
-    'doci',
-    'documentarists',
-    'dodimeads',
-    'dodswell',
-    'doe/welsh',
     'doesburg',
-    'doeskin',
-    'doey',
-    'doggy-do',
-    'doglike',
-    'dollar-based',
-    'dollarization',
-    'dolomitisation',
-    'dolors',
-    'dolphin-safe',
-    'domain/os',
-    'domatia',
-    'domenican',
-    'domestically-owned',
-    'dominations',
-    'donachie',
     'donaghey',
-    'donald/oxford',
-    'donalds',
-    'donaueschingen',
-    'dondelinger',
-    'donella',
-    'dongen',
-    'donkey-vous',
-    'donnan',
-    'donnaregina',
-    'doof',
-    'doogan',
-    'doomsters',
-    'doomy',
-    'doorchime',
-    'doorposts',
     'dorada',
-    'dorham',
-    'dorians',
-    'dorrington',
-    'dortoir',
-    'doryphoros',
-    'dos-compatible',
-    'dos/v',
-    'dotard',
-    'douane',
-    'double-booked',
-    'double-head',
-    'double-shelled',
-    'double-skinned',
-    'double-stops',
-    'doublespace',
     'douceurs',
-    'dovelands',
-    'dowens',
-    'down-curved',
-    'down-regulation',
-    'downpayment',
-    'downwave',
-    'dozily',
-    'dpts',
-    'dragonish',
-    'drainers',
-    'dratslingers',
-    'draupadi',
-    'drawperfect',
-    'drd2',
-    'dreg',
     'dress-fasteners',
-    'dress-rehearsal',
-    'dressingroom',
-    'driebergen',
-    'driffill',
-    'drill-indicated',
-    'drink-up',
-    'drink/drive',
-    'driveability',
-    'drole',
-    'drolly',
-    'drottningholm',
-    'drove-ways',
-    'drowsed',
-    'drude',
-    'drug-resistant',
     'drug-runners',
-    'drukpa',
-    'drumshanbo',
-    'dry-clean',
-    'dry/treated',
-    'drysuits',
-    'ds/90',
-    'ds2',
-    'dshs',
-    'dsp32(c)',
-    'dt1',
-    'dua',
-    'dual-action',
-    'dubah',
-    'dubilier',
-    'dubious-looking',
     'ducat',
-    'duchinsky',
-    'duckbilled',
-    'ductility',
-    'dudding',
-    'dufka',
-    'dufton',
-    'dugs',
-    'dukedoms',
-    'dum-a-di-dum',
-    'dumaagiyn',
-    'dumbartonshire',
-    'dumbbells',
-    'dummer',
-    'dumpier',
-    'dumpsites',
     'dunbabin',
-    'duncanson',
-    'dungavel',
-    'dunheved',
-    'dunion',
-    'dunkin\'',
-    'dunlaoghaire',
-    'dunlins',
-    'dunnabie',
-    'dunnington',
-    'dunstanburgh',
-    'dunstone',
-    'duplicators',
-    'duppa',
-    'dupree',
-    'duraglit',
     'durbin-watson',
-    'durden',
-    'durians',
-    'durnall',
-    'durrani',
-    'dust-covers',
-    'dutch-belgians',
-    'dutschke',
-    'duvalle',
-    'duwayne',
-    'dwina',
-    'dxc6',
-    'dyeworks',
-    'dyeyard',
-    'dyfed-powys',
-    'dykehead',
     'dym',
-    'dyserth',
-    'dysgenic',
-    'dyskinesia',
-    'dzhaba',
-    'e&amp;p',
-    'e&ndash;g',
-    'e-khalq',
-    'e-mu',
-    'e.cli',
-    'e.l.r.',
-    'e.m.f.s',
-    'e.v.a.',
-    'e24',
-    'e2l',
-    'e4s',
     'e=mc',
-    'eadui',
-    'eal',
-    'ealhflaed',
-    'ear-phones',
-    'earless',
-    'early-maturing',
-    'early-victorian',
-    'earsdon',
-    'eartha',
-    'earthier',
-    'earthquake-proof',
-    'easegill',
-    'easi-stow',
-    'east-',
-    'easterday',
     'eastley',
-    'eastmount',
-    'eastwood/thorogood',
-    'easyclean',
-    'eazy-e',
-    'eban',
-    'ebbsworth',
-    'ebbutt',
-    'ebionites',
-    'ebo',
-    'ebsworth',
-    'ec-brokered',
-    'ec2m',
-    'ec4m',
-    'ec4n',
-    'eccd-1',
     'ecchinswell',
-    'ecezade',
-    'echinata',
-    'echinosperma',
-    'echography',
-    'echolalia',
-    'eclogite',
-    'ecmm',
-    'ecogen',
-    'ecoles',
-    'econ.',
-    'econometrically',
-    'ecrins',
-    'ectodermal',
-    'ectomorph',
-    'ecu2,000',
     'ecum&eacute;nica',
-    'ecumenicalism',
-    'eday',
-    'eddleston',
-    'edendale',
-    'edentatus',
-    'edgecote',
-    'edgley',
-    'edi*net',
-    'edibility',
-    'edney',
-    'education/industry',
-    'eec-funded',
-    'eery',
-    'efacoat',
-    'effec',
     'effectors',
-    'effluences',
-    'effra',
-    'efter',
-    'egford',
-    'egg-cups',
-    'egger',
-    'egginton',
-    'eggless',
-    'egleton',
-    'eh12',
-    'ehi',
-    'eibl-eibesfeldt',
-    'eichel',
-    'eichholz',
-    'eight-pack',
     'eight-strong',
-    'eighteenth-and',
-    'eighth-minute',
-    'eighty-odd',
-    'eisberg',
-    'eisteddfods',
-    'either-or',
-    'ejaculatory',
-    'ekkehard',
-    'eklund',
-    'ekonomska',
-    'el-essawy',
-    'elastic-sided',
-    'elayne',
-    'elbereth',
-    'electro-optical',
     'electrochemist',
-    'electroencephalographic',
-    'electromagnet',
-    'electromail',
-    'electromotive',
-    'electromyographic',
-    'electron-dense',
-    'electrophysiologically',
-    'element(s)',
-    'elephant-like',
-    'elfyn',
-    'eligius',
-    'eliminations',
-    'elion',
-    'elkanah',
-    'ellegard',
     'ellenby',
-    'ellingham',
-    'ellis/hepper',
-    'ellos',
-    'elongations',
-    'eloy',
-    'elphbergs',
-    'eltz',
-    'elute',
-    'elutions',
-    'elvel',
-    'elwell',
-    'emacs',
-    'embayments',
-    'embiricos',
-    'emergents',
     'emigrations',
-    'emma-jane',
-    'emmison',
-    'emollients',
-    'emotively',
-    'emulsifies',
-    'emuss',
-    'enantiomeric',
-    'enchanters',
-    'encomiums',
-    'encumber',
-    'encyclopaedist',
-    'end-gaining',
-    'end-november',
-    'end-of-classifications',
-    'end-of-course',
     'endeavor',
-    'endemically',
-    'endoanal',
-    'endocardial',
-    'endogenetic',
-    'endometriotic',
-    'endoperoxide',
-    'endorser',
-    'endoskeletal',
-    'endosternites',
-    'endotoxic',
-    'endpin',
-    'enemy/private',
-    'energy-hungry',
-    'enfeeblement',
-    'enfilade',
     'enforcements',
-    'engelbert',
-    'engine-out',
-    'englemere',
-    'english-like',
-    'english/french',
-    'engrians',
-    'enharmonic',
-    'enjoyer',
-    'enlister',
-    'enmore',
-    'ennoble',
-    'enochs',
-    'enodoc',
-    'enraf-nonius',
-    'ensall',
     'enterococcus',
-    'enterocutaneous',
-    'enterprise-level',
-    'enterprise/transferable',
-    'enthalpic',
-    'entomb',
-    'entrance-hall',
-    'entrance/exit',
-    'entre-deux-mers',
-    'entrepreneur-producers',
-    'entryists',
-    'enumerations',
-    'ep.',
-    'epergne',
-    'epi-classical',
-    'epicardial',
     'epicyclic',
-    'epifluorescence',
-    'epigraphic',
-    'epileptiform',
-    'epimeron',
-    'epistemes',
-    'epitomising',
-    'epitomizing',
-    'epitomy',
-    'eponymously',
-    'equal-sized',
-    'equally-sized',
-    'equative',
-    'equipoise',
-    'equuleus',
-    'erbo',
     'erch',
-    'erdenijn',
-    'eriptychius',
-    'eritel',
-    'eriya',
-    'erlund',
-    'ermler',
-    'ernste',
-    'erosivity',
-    'erratics',
-    'error.log',
-    'errors-reported-are',
-    'errors.',
-    'ers-2',
-    'eryngiums',
-    'esat',
     'escallonia',
-    'escargots',
-    'esch',
-    'eschaton',
-    'escrick',
-    'escritoire',
-    'esculenta',
-    'esculentum',
-    'esgob',
-    'esnaola',
-    'esoterics',
-    'esp.',
-    'espacio',
-    'espanola',
-    'esperantists',
-    'espie',
     'esplin',
-    'esql',
-    'essendon',
-    'essentia',
-    'essett',
-    'esslin',
-    'est-a-laine',
-    'estado',
-    'estate-agents',
-    'estudios',
-    'et.al.',
-    'etampes',
-    'eteokles',
-    'etes',
-    'ethanolamine',
-    'ethnographically',
     'ethnologist',
-    'ethnos',
-    'ets-1',
-    'etu02',
-    'eudaemonistic',
-    'eudemian',
-    'eugenically',
-    'euglossine',
-    'euglossines',
-    'eung',
-    'euphorbias',
-    'euro-credits',
-    'euro-discus',
-    'euroclear',
-    'eurodeutschmark',
-    'europ&eacute;enne',
     'europaea',
-    'european-american',
-    'europeens',
-    'europium',
-    'eurwyn',
-    'eurydice',
-    'eurystheus',
-    'eustatius',
-    'ev45',
-    'evallonian',
-    'evaluated.',
-    'evan-thomas',
-    'evang&eacute;lico',
-    'evangelically',
-    'evans/wiltshire',
-    'evaristus',
     'evening-out',
-    'evenly-spaced',
-    'ever-dependable',
-    'ever-higher',
-    'ever-loyal',
-    'ever-reliable',
-    'ever-smaller',
-    'everall',
-    'evertonians',
-    'evil-intentioned',
-    'evildoers',
-    'evington',
-    'evisceration',
-    'evitts',
-    'ewwf',
-    'ex-cambridge',
     'ex-children',
-    'ex-civil',
-    'ex-colleagues',
-    'ex-dec',
-    'ex-dpr',
-    'ex-ibm',
-    'ex-liberals',
-    'ex-library',
-    'ex-managers',
-    'ex-mirror',
-    'ex-miss',
-    'ex-navy',
-    'ex-patients',
-    'ex-plessey',
-    'ex-python',
-    'ex-red',
     'ex-sas',
-    'ex-southern',
-    'ex-tech',
-    'ex-test',
-    'ex-union',
-    'ex-wigan',
-    'ex-workers',
-    'exactingly',
-    'exanthemata',
-    'excavates',
-    'exceed/xpress',
-    'exceptionable',
-    'excepts',
-    'excluded.',
-    'exclusive-or',
-    'excommunications',
     'excon',
-    'exculpatory',
-    'exd5',
-    'exec.',
-    'exhibitionistic',
-    'exhilaratingly',
-    'exigible',
-    'exiguus',
-    'eximbank',
-    'exning',
-    'exorcizing',
-    'exoskeletons',
-    'expectin\'',
-    'explaiend',
-    'export/import',
-    'exposers',
     'exquisiteness',
-    'extensiveness',
-    'extenso',
-    'externa',
-    'extinguishes',
-    'extortionately',
-    'extra-area',
-    'extra-constitutional',
-    'extra-cover',
-    'extra-familial',
-    'extrachromosomal',
-    'extranodal',
-    'extraordinariness',
-    'extrasure',
-    'extrication',
-    'eye-drops',
     'eye-gaze',
-    'eye-pieces',
-    'eye/hand',
-    'eyelines',
-    'eynstone',
-    'f%',
-    'f&amp;sub1&agr',
-    'f&pound',
-    'f(d)',
-    'f---ing',
-    'f-holes',
-    'f.b.',
-    'f.b.i.m.',
-    'f.c.i.s.',
-    'f.m.',
-    'f.r',
     'f.r.m.s.',
-    'f.s.',
-    'f/a-18',
-    'f100xp',
-    'f135xp',
-    'f7+',
-    'f7b+',
-    'f7c+',
-    'f95',
-    'fa&ccedil;on',
-    'fa-mas',
-    'faarsay',
-    'fabalis',
-    'fabulist',
-    'faburden',
-    'face-downwards',
     'face-mounted',
-    'face-packs',
-    'facecloth',
-    'facelets',
-    'facemask',
-    'facilties',
-    'fact-sheets',
-    'factionalization',
-    'factorize',
-    'factotums',
-    'faetten',
-    'fafnir',
-    'fafunwa',
-    'faigenbaum',
-    'faint-hearts',
-    'fairfields',
     'fairy-lights',
-    'fairy-like',
-    'fais',
-    'faiz',
-    'fakery',
-    'falkland/malvinas',
-    'fallenness',
-    'fallers',
-    'falling-away',
-    'falstaffian',
-    'faltour',
-    'familistic',
-    'family/friends',
-    'fancifulness',
-    'fangdale',
-    'far-southern',
     'farbrace',
-    'farhad',
-    'farm-centred',
-    'farm-work',
-    'farmgate',
-    'farmland.',
-    'farrimond',
-    'fascicle',
-    'fascicles',
-    'fasciculata',
-    'fashionability',
-    'fasold',
-    'fast-drying',
-    'fastcash',
-    'fat/g',
-    'fathead',
     'father-and-son',
-    'father-of-five',
-    'father/son',
-    'fattens',
-    'fatuity',
-    'faulk',
-    'fault-resilient',
-    'favorites',
-    'favret-saada',
-    'fayetteville',
-    'fdd',
-    'fdg',
-    'fdp/prd',
-    'fds',
-    'fearnley-whittingstall',
-    'feb/march',
     'febrifuge',
-    'february-25',
-    'february-6',
-    'feder',
-    'federal-provincial',
-    'fee-earners',
-    'feebles',
-    'feed-through',
-    'feelings.',
-    'feldmann',
-    'felicitously',
-    'fellow-diners',
-    'fellow-member',
-    'fellow-members',
-    'fellow-passengers',
-    'felsham',
     'female-oriented',
-    'female-to-male',
-    'feminisation',
-    'feminization',
-    'feng-chan',
-    'fenno-scandian',
-    'ferae',
-    'ferens',
-    'fergana',
-    'fergurson',
-    'ferito',
-    'fermions',
-    'fermor-hesketh',
-    'ferner',
-    'fernlea',
-    'ferreiro',
     'ferreri',
-    'ferril',
-    'ferring',
-    'ferrucci',
-    'ferry/oxford',
-    'ferryboat',
-    'fertility.',
-    'feshbach',
-    'festas',
-    'feuduties',
-    'feurle',
-    'ffos-y-mynach',
-    'ffr1.1',
-    'ffr100',
-    'ffr15',
-    'ffr2',
     'ffr2.5',
-    'ffr3.5',
-    'ffr350',
-    'ffr4',
-    'ffr5',
-    'ffr500,000',
-    'ffr6',
-    'fg10sa',
-    'fibre-free',
-    'fibrillating',
-    'fibrillator',
-    'fichu',
-    'fiction.',
-    'fiction/non-fiction',
-    'fiddes',
-    'fiducial',
     'field-mice',
-    'fieldmice',
-    'fieseler',
-    'fifteen-day',
-    'fifth-formers',
-    'fifth-round',
-    'fifty/fifty',
-    'fig.7',
-    'filedt',
-    'filing-cabinets',
-    'filled-up',
-    'filodrammatici',
-    'filonov',
-    'filshin',
-    'filthily',
-    'fimber',
     'fimir',
-    'finalises',
-    'financial-services',
-    'fincham',
-    'finding/marking',
-    'findon',
-    'findspot',
-    'fine-featured',
-    'fine-leaved',
-    'finger-marks',
-    'finger-nail',
-    'fingleton',
-    'finialled',
-    'finishing-off',
-    'finito',
-    'finkel',
     'finstown',
-    'fionnphort',
-    'fips',
-    'fire-bellied',
-    'fire-ravaged',
-    'firewoman',
-    'first-tier',
-    'firstclass',
-    'fiscales',
-    'fischer-tropsch',
-    'fish-cakes',
-    'fish-kettle',
-    'fish-packing',
-    'fishbowl',
-    'fishlike',
-    'fist-fights',
     'fitness.',
-    'fitzallan',
-    'fitzjames',
-    'five-a-sides',
-    'five-aisled',
-    'five-bone',
-    'five-dollar',
-    'five-pronged',
-    'five-sailed',
-    'five-thousand',
-    'five-to',
-    'five-track',
-    'five-week-old',
-    'five/six',
-    'fiveways',
-    'fixating',
     'fixin\'',
-    'fjm',
-    'fl070',
-    'flame-proof',
-    'flame-throwers',
-    'flamengo',
-    'flamsteed',
-    'flat-bladed',
-    'flat-iron',
-    'flattened-out',
-    'flatteries',
-    'flautists',
-    'flavescens',
-    'fleece-lined',
-    'fleetham',
-    'fler',
     'fleurus',
-    'flexuosa',
-    'flint-based',
-    'flixton',
-    'flockmaster',
-    'flogas',
-    'flood-gates',
-    'floor-games',
-    'floorcloth',
-    'floorings',
-    'floppy.',
-    'floptical',
-    'floristically',
-    'florovsky',
-    'flotille',
-    'flower-pots',
     'flower-rich',
-    'flowerlike',
-    'flowstone',
-    'flude',
-    'fluence',
-    'flukey',
-    'flunky',
-    'fluoroscein',
-    'flush-fitting',
-    'flutterings',
-    'fly-bys',
-    'fn.',
-    'fndr',
-    'foa',
-    'foam-flecked',
-    'focaccia',
     'focaliser',
-    'focus:a',
-    'fogel',
-    'foggin',
-    'fogh',
-    'foists',
-    'foldback',
-    'folding-carton',
-    'folkard',
-    'folkie',
-    'folkies',
-    'followup',
-    'fonsagrive',
-    'food-related',
-    'food-sensitive',
-    'food-stained',
     'food-wise',
-    'foot-based',
-    'football-mad',
-    'football-sized',
-    'footgear',
-    'footpad',
-    'footpedal',
-    'footplatemen',
-    'footsword',
-    'for-profit',
-    'for_,_for_example',
-    'foraminiferans',
-    'foraminifers',
-    'forceplate',
-    'fore-legs',
-    'fore/aft',
     'foreburn',
-    'forehill',
-    'foreign-looking',
-    'foreign-registered',
-    'foreign/second',
-    'forepart',
-    'forero',
-    'foresterships',
-    'forestland',
-    'forgathered',
-    'forgetfully',
-    'forgotton',
-    'forgue',
-    'forgus',
-    'form-words',
-    'formal/informal',
     'formalist/prague',
-    'format/',
-    'formateurs',
-    'fornicators',
-    'forstmann',
-    'fortey',
-    'forth-coming',
-    'fortnight-long',
-    'fortuity',
-    'forty-fifth',
-    'forty-third',
-    'forum.',
-    'fothaid',
-    'fotoman',
-    'fougasses',
-    'foundationalisms',
     'foundland',
-    'fountain-head',
-    'fouquet',
-    'four-bar',
-    'four-chambered',
-    'four-hourly',
-    'four-leafed',
-    'four-seaters',
-    'four-storeyed',
-    'four-to-one',
-    'four-twenty',
-    'fourballs',
-    'fournet-fayard',
-    'fourth-minute',
-    'fowell',
-    'fowlkes',
     'fox-collier',
-    'foxbase',
-    'foxon',
-    'fr&oacute;mista',
-    'fragrantissima',
-    'fragrantly',
-    'frampton-cox',
-    'francesc',
-    'franci',
-    'franco-belgian',
-    'frankby',
-    'frankenheimer',
-    'fraser/wiltshire',
-    'fraud.',
-    'fraudulence',
-    'fraxillians',
     'fraxinus',
-    'freakshow',
-    'fred3',
-    'freds',
-    'free-flowering',
-    'free-free',
-    'free-will',
-    'freebooting',
-    'freedom-fighters',
-    'freegrove',
-    'fregean',
-    'freirian',
-    'frejus',
-    'fremlins',
-    'frenard',
-    'french-influenced',
     'french/german',
-    'french/spanish',
-    'frenchgate',
-    'freons',
-    'frequency.',
-    'frequent-use',
-    'frequently-used',
-    'fresca',
-    'fressange',
-    'freston',
-    'frewin',
-    'fri.',
-    'friedberg',
-    'friesen',
-    'friesenheim',
-    'frightfulness',
     'frikartii',
-    'frindsbury',
-    'frinton-on-sea',
-    'frio',
-    'friskies',
-    'froken',
-    'frontals',
-    'frontbenches',
-    'frontiersman',
-    'frost-hardened',
-    'frost-prone',
-    'frost-proof',
-    'frostings',
-    'frugiperda',
-    'frugivore',
-    'fruiterers',
     'fruiters',
-    'frutectosus',
-    'frutescens',
-    'fs1',
-    'fsk',
-    'ftbs',
-    'fuck-up',
-    'fuckwit',
-    'fugazi',
-    'fuglicaa',
-    'fuguitt',
-    'full-dress',
-    'full-fare',
-    'fully-built',
-    'fully-fitted',
-    'fulness',
     'fumarolic',
-    'fun-and-games',
-    'function/cost',
-    'funker',
-    'funniness',
-    'funnymen',
-    'furby/abingdon',
-    'furred-up',
-    'fursey',
-    'furuta',
-    'fuse-boxes',
-    'fusillades',
-    'fustiness',
-    'fw15',
-    'fwd',
-    'fwuits',
     'fxe6',
-    'fxh',
-    'fyles',
-    'fyvel',
-    'g&acirc;teaux',
-    'g&eacute;orgiques',
-    'g&flat',
-    'g&ndash;fury',
-    'g&ouml;tz',
-    'g\'n\'r',
-    'g(v)',
-    'g-d',
-    'g-registered',
-    'g-spot',
-    'g.a.n.',
-    'g.b.s.',
     'g.i.',
-    'g.i.t.',
-    'g/100',
-    'g4fai',
-    'gabin',
-    'gabions',
-    'gac',
-    'gadflies',
-    'gadgil',
-    'gadgy',
-    'gadsby',
-    'gaffin',
-    'gaiah',
-    'gaithersburg',
-    'gaitskill',
-    'gakkai',
     'galacnet',
-    'galbally',
-    'gald&oacute;s',
-    'galeras',
-    'galileans',
-    'gallier',
-    'gallist',
-    'galloni',
-    'galvez',
-    'gamegards',
-    'gameson',
-    'gamlingay',
-    'gammons',
-    'ganache',
-    'ganciclovir',
-    'gangers',
     'gannetry',
-    'garage/parking',
-    'gardam',
-    'gargett',
-    'garlickhythe',
-    'garmhausen',
-    'garnons',
-    'garrafad',
-    'garratts',
-    'garrets',
-    'garrett/milton',
-    'garrisonians',
-    'garswood',
-    'gas-cleaning',
-    'gas-generative',
-    'gaslit',
     'gasman',
-    'gassac',
-    'gastrinoma',
-    'gastronomes',
-    'gastroprotection',
-    'gastrula',
-    'gate-crashers',
-    'gatherer/oxfordshire',
-    'gatos',
-    'gatton',
-    'gauleiters',
-    'gaume',
-    'gaunches',
-    'gautet',
-    'gavest',
-    'gavottes',
     'gawra',
-    'gayatri',
-    'gayles',
-    'gazer',
-    'gcms',
-    'gdns',
-    'gdps',
-    'gear-boxes',
-    'gearless',
-    'gearstones',
-    'gebel',
-    'gedding',
-    'gee-a',
-    'gee-whiz',
-    'gefilte',
-    'gein',
     'gelid',
-    'gelsenkirchen',
-    'geminian',
-    'gender-linked',
-    'genderless',
-    'gene(s)',
-    'genealogically',
-    'generalisability',
-    'generous-hearted',
-    'genetically-determined',
-    'gennadi',
-    'gensyn',
-    'gentlemanliness',
-    'gentoo',
-    'genuflection',
-    'geomancers',
     'geometricks',
-    'geor',
-    'georgey',
-    'georgian/victorian',
-    'georgiou',
-    'geosafari',
-    'geoteam',
-    'geotextile',
-    'geourgos',
-    'gerhardsen',
-    'german-speakers',
-    'german/english',
-    'germyl',
-    'gerome',
-    'gerstmann-str&auml;ussler',
-    'gerstmann-straussler-scheinker',
     'gestae',
-    'get&dollar',
-    'get-up-and-go',
-    'getachew',
-    'gettings',
-    'getz',
-    'geums',
-    'gey',
-    'ggk',
-    'ghanashyam',
-    'ghanouchi',
-    'ghassan',
-    'ghettoisation',
-    'ghibellines',
-    'ghn',
-    'ghostlike',
     'giaches',
-    'giambattista',
-    'giant-eyed',
-    'gibbs-smith',
-    'gibed',
-    'giddy-up',
-    'giftedness',
-    'gigajoule',
-    'gij&oacute;n',
-    'gilels',
-    'gilfillan',
-    'gillamoor',
-    'gillbanks',
-    'gimlet-eyed',
-    'gimlets',
-    'gimmie',
     'gin-clear',
-    'gingerish',
-    'gintis',
-    'giraldi',
-    'girlishness',
-    'girma',
-    'girsby',
-    'gisella',
-    'gitsham',
-    'gittel-plus-nine',
-    'giustizia',
-    'gk-2',
-    'gl77',
-    'glabra',
-    'glacialis',
-    'glaciological',
     'glaciologists',
-    'gladwyn',
-    'glafcos',
-    'glanford',
-    'glanvil',
-    'glasgow/edinburgh',
-    'glass-eyed',
-    'glassless',
-    'glenfair',
-    'glenties',
-    'glioma',
-    'glitterball',
-    'globins',
-    'glomar',
-    'glomerulus',
-    'glomset',
     'glottochronological',
-    'gloucestershire-based',
-    'gloucs.',
-    'gloxinias',
-    'glu204',
-    'glue-sniffers',
-    'glutei',
-    'glyn-neath',
-    'glynne',
-    'glyphs',
-    'gm06318',
-    'gmd',
-    'gnicia',
-    'gnps',
-    'gns',
-    'go-around',
     'go-karts',
-    'gobain',
-    'gobryas',
-    'god-send',
-    'god/dess',
-    'godardian',
-    'gola',
-    'golasecca',
-    'gold-brown',
-    'gold-fields',
-    'gold-nibbed',
-    'gold-winning',
-    'goldbergs',
-    'golden-fleeced',
-    'golden-leaved',
-    'goldhaber',
     'goldmans',
-    'golf-courses',
-    'golf-mad',
-    'golomshtok',
-    'golongan',
-    'gonapophysis',
-    'gonda',
-    'good-mannered',
-    'good-nights',
-    'goodlace',
-    'goodmans',
-    'goodsir',
-    'goodwin/hereford',
-    'goodyer',
-    'gooedy',
-    'gorbachevs',
     'gorbels',
-    'gore-langton',
-    'gorilla-like',
-    'gorman/swindon',
-    'gorman/town',
-    'gorny',
-    'gostly',
-    'gosudarstvennoi',
-    'goswamy',
-    'goswell',
-    'goteborg',
-    'gottardo',
-    'gotterdammerung',
-    'gottfredson',
-    'gotz',
-    'gould/vale',
     'goulooze',
-    'gouteev',
-    'gouvernement',
-    'government-approved',
-    'government-proposed',
-    'government-sanctioned',
-    'governorates',
-    'gowk',
-    'goymour',
-    'gozzett',
-    'gp+envam12-babepuro',
-    'gpr',
-    'gr&aacute;g&aacute;s',
-    'gr&uuml;ne',
-    'gr10',
-    'grab-rails',
     'grabar',
-    'gracanin',
-    'grade-separated',
-    'grade/',
-    'gradualists',
-    'graduands',
-    'graham-dixon',
-    'grails',
-    'grain-surplus',
-    'graininess',
-    'graminea',
-    'gramscian',
-    'grand-father',
-    'grand-sounding',
-    'grandaddy',
-    'granddads',
     'grandiloquently',
-    'grandmaison',
-    'grani&ccaron;ari',
-    'granite-grey',
-    'grant-related',
-    'grantorto',
-    'graph-based',
-    'graphicacy',
-    'grapplings',
-    'grassini',
-    'grassless',
-    'grattans',
-    'gratuitousness',
-    'gratwicke',
-    'graubard',
-    'grauerholz',
     'gravamina',
-    'gravies',
-    'graville',
-    'grazier',
-    'grease-stained',
-    'greasiest',
-    'great-great',
-    'great-great-great-grandfather',
-    'great-uncles',
-    'greatend',
-    'greatgrandfather',
-    'grecos',
-    'greedier',
-    'green-shuttered',
-    'green-tinted',
-    'green-uniformed',
     'greenhall',
-    'greenies',
-    'greenisland',
-    'greenlanders',
-    'gregariously',
-    'gregories',
-    'grenvilles',
-    'greystokes',
-    'gricers',
-    'grid-like',
-    'grid-referenced',
-    'griffin-heads',
-    'griffiths-jones',
-    'grillsafe',
-    'grimaldi',
-    'grimier',
     'grimmett',
-    'grin\'stone',
-    'grindrod',
-    'grindsbrook',
-    'grindstones',
-    'griseus',
-    'grishman',
-    'grivel',
-    'grizel',
-    'grodno',
-    'groovesome',
-    'gropings',
-    'grossart',
-    'grossholtz',
-    'groth',
-    'groughs',
     'ground-bombs',
-    'group-oriented',
-    'grouville',
-    'gruenberg',
-    'gruesomely',
-    'grumblers',
-    'grundart',
-    'grunsell',
-    'gsp-21',
-    'gsvqs',
-    'gt1',
-    'gth',
-    'guadeloup&eacute;enne',
-    'guaidbre',
-    'guanethidine',
-    'guardchamber',
     'guatamala',
-    'guchkov',
-    'gudni',
-    'guechi',
-    'guenelon',
-    'guerdon',
-    'guest-houses',
-    'guestworkers',
-    'guide-track',
-    'guilsfield',
-    'guin&eacute;e',
-    'guinto',
-    'guip&uacute;zcoa',
-    'guiraudios',
-    'gull-billed',
-    'gundel',
     'gurney-dixon',
-    'gutfreund',
-    'guttman',
-    'guzel',
-    'guzzlers',
-    'gwersyllt',
-    'gwilliam',
-    'gwladys',
-    'gwynnes',
-    'gwynneth',
-    'gxf4',
-    'gxu3',
-    'gyal',
-    'gymkhanas',
-    'gypsy-like',
-    'gyves',
     'h&amp;j',
-    'h&eacute;rard',
-    'h&ngr',
-    'h&ocirc;tel-dieu',
-    'h&ouml;ll',
-    'h-how',
-    'h-series',
-    'h.261',
-    'h.p',
-    'h1&deg',
-    'h1\'',
-    'h1_',
-    'h24/v72',
-    'h2b',
-    'h3\'',
-    'h3x',
     'h400d',
-    'h57&ndash;597',
-    'h6+',
-    'ha&iuml;ti',
-    'ha\'pennies',
-    'habana',
-    'habibullah',
-    'hachinski',
-    'hacmp/6000',
-    'haddocks',
-    'hadn\'t',
-    'hadrosaurs',
-    'haemagglutinin',
-    'haematologist',
-    'haemoglobin/serum',
-    'hafizullah',
     'hafodunos',
-    'hagiographic',
-    'haiba',
-    'haidara',
-    'hair-styles',
-    'hairstreaks',
-    'hairy-nosed',
-    'hakam',
-    'hal.',
-    'halbert',
-    'half-a-billion',
-    'half-acknowledged',
-    'half-afraid',
-    'half-alive',
-    'half-blue',
-    'half-child',
     'half-collapsed',
-    'half-concealed',
-    'half-glazed',
-    'half-hours',
-    'half-indian',
-    'half-italian',
-    'half-lidded',
-    'half-lines',
-    'half-litres',
-    'half-lowered',
-    'half-men',
-    'half-rhymes',
-    'half-seriously',
-    'half-sized',
-    'half-terms',
-    'half-title',
     'half-titles',
-    'half-written',
-    'halfe',
-    'halibut.txt',
-    'hallier',
-    'hallington',
-    'halwell',
-    'ham-and-tomato',
-    'hambleden',
-    'hammer-ons',
-    'hammerings',
-    'hamrin',
-    'hanburys',
-    'hand-bags',
-    'hand-basin',
-    'hand-knit',
     'handbells',
-    'handle-bars',
-    'handwheel',
-    'handyside',
-    'hangar-like',
-    'hannaway',
-    'hannemann',
-    'hanns-martin',
-    'hans-martin',
-    'hanton',
-    'haoles',
-    'harambels',
-    'harbert',
-    'harcros',
-    'hard/hard/easy/very',
-    'hardest-working',
     'hardily',
-    'hardman/swindon',
-    'hardwicke/gloucestershire',
-    'hargate',
-    'harilaos',
-    'harlsey',
-    'harp-strings',
-    'harre',
-    'harries/bishop',
-    'harrow-on-the-hill',
-    'harsanyi',
-    'hart/gloucestershire',
-    'harthill',
-    'hartpury',
-    'hartsbourne',
-    'harvard-smithsonian',
     'harvington',
-    'harward',
-    'harwood-in-teesdale',
-    'harzburgite',
-    'hascosay',
-    'hasparren',
-    'hasselfeldt',
-    'hasteds',
-    'hastilow',
-    'hatcham',
-    'hate-mail',
-    'hattin',
-    'haugen',
-    'hauppauge',
-    'hausfrau',
-    'haustorium',
     'haute-loire',
-    'hawaria',
-    'hawi',
-    'hawkesworth',
-    'hawkstone',
-    'hayes-compatible',
-    'hayne',
-    'haynet',
-    'hbb',
-    'hbf',
-    'hcl(aq)',
-    'hcoa',
-    'hctb',
-    'hdr',
-    'he(i)',
-    'he-goat',
     'he/',
-    'headings.',
-    'headlice',
-    'headliner',
-    'headsails',
-    'healthfood',
-    'healthquest',
-    'healths',
-    'healthwatch',
-    'heart-beats',
-    'heartbreakingly',
-    'heartbreaks',
-    'heat-loss',
-    'heat-pain',
-    'heat/speed',
-    'heater/stat',
     'heavily-populated',
-    'hebbian',
-    'hebraists',
-    'hedeby',
-    'heedfully',
-    'heeks',
-    'hegemonial',
-    'heinrichs',
-    'heires',
-    'helford',
-    'helg&ouml',
-    'helge',
-    'helio',
-    'heliocentric',
-    'heliodorus',
-    'hellenist',
     'hellooo',
-    'helmore',
-    'helmstadt',
-    'helton',
-    'hemes',
-    'hemichordates',
-    'hemicrypts',
-    'hemizygous',
-    'hemmington',
-    'hemopexin',
-    'hempstone',
-    'hemswell',
-    'hen-pecked',
-    'henbest',
-    'hendaye-plage',
-    'hengst',
     'henley-in-arden',
-    'hennell',
-    'henri-clement',
-    'henriksen',
-    'hepatics',
-    'hepes-buffered',
-    'hepes/arginine',
-    'herbacea',
-    'heredes',
-    'herioter',
-    'hero.',
-    'herodas',
-    'heroisms',
-    'heron-like',
-    'herries',
-    'herriott',
     'hersham',
-    'hertzian',
-    'hervey-bathurst',
-    'herxheimer',
-    'heseltine/kinnock',
-    'hesitancies',
-    'hessischer',
-    'hessler',
-    'heterochromatin',
-    'heteromorphy',
-    'heteroplasmic',
-    'heterostracan',
-    'heterotopic',
-    'heuchera',
-    'heumensoord',
-    'hevey',
     'hexachlorobenzene',
-    'hexameters',
-    'hexaploid',
-    'heycock',
-    'heydean',
-    'hfc134a',
-    'hg&times;s',
-    'hg92',
-    'hibaldstow',
-    'hiccoughed',
-    'hiccupped',
-    'hickling',
-    'hickok',
-    'hiebert',
-    'hierapolis',
-    'hierophants',
     'higgens',
-    'high-chair',
-    'high-placed',
-    'high-rate',
-    'high-seas',
-    'high-tensile',
-    'highbrook',
-    'highclass',
-    'highcliffe',
-    'highest-scoring',
-    'highjackers',
-    'highley',
-    'highly-productive',
-    'highpoints',
-    'highroad',
-    'hightail',
     'highwater',
-    'higman',
-    'hildesheimer',
-    'hilferding',
-    'hill-tops',
-    'hill/oxfordshire',
-    'hillaby',
-    'hillary-jones',
-    'hillbrook',
-    'hille',
-    'hillersland',
-    'hillmaster',
-    'himation',
-    'hindu-revivalist',
-    'hinterthal',
-    'hip-length',
     'hipkiss',
-    'hirael',
-    'hirmer',
-    'hirschmann',
-    'his3',
-    'hisashi',
-    'histiocytosis',
-    'histochemistry',
-    'historisch',
-    'hitchell',
-    'hitchington',
-    'hitchins',
-    'hitoshi',
-    'hiv-seronegative',
-    'hived-off',
-    'hiverneurs',
     'hn1',
-    'hnatyshyn',
-    'hnp',
-    'ho!',
-    'ho-sainteny',
-    'hoarser',
-    'hobnobs',
-    'hockenos',
-    'hoddnett',
-    'hodsoll',
-    'hoge',
-    'hohitsu',
-    'holbeach',
-    'holberton',
-    'holditch',
-    'holdup',
     'holles',
-    'hollett',
-    'hollier',
-    'hollman',
-    'holloways',
-    'hollowings',
-    'holmgren',
-    'holstering',
-    'homages',
-    'home-centred',
-    'home-cured',
-    'home/ec',
-    'homelike',
-    'homeownership',
-    'homo-ing',
-    'homodimer',
     'homoeopathically',
-    'homogeniser',
-    'homologs',
-    'homophobe',
-    'homophora',
-    'homopolymeric',
-    'homos',
-    'homozygosity',
-    'honey-sweet',
-    'honeychurch',
-    'honors',
-    'honorum',
-    'hons.',
-    'hoofstraat',
-    'hook-like',
-    'hookey',
     'hookstone',
-    'hooson',
-    'hopkins-thomas',
-    'hoplite',
-    'hopsital',
-    'horae',
-    'horatius',
-    'horchata',
-    'horizonte',
-    'horn-glazed',
-    'horndale',
-    'horrifies',
-    'horror-stricken',
-    'horse-dealer',
-    'horse-play',
-    'horseboxes',
     'horstead',
-    'hortensius',
-    'horwitz',
-    'hosses',
-    'hot/cold',
-    'hotch',
-    'hotching',
-    'hoton',
-    'house-boy',
-    'house-holders',
-    'house-servants',
-    'house-sized',
-    'housecarls',
-    'household-below-stairs',
-    'housemen',
-    'housemother',
     'houseowners',
-    'housestyle',
-    'houssaye',
-    'how-to',
-    'howletts',
-    'hox/lacz',
-    'hoxd-11',
-    'hs.125',
-    'hsv-tk',
-    'hu-akbar',
-    'hubba',
-    'hubbard-ford',
-    'hubbie',
-    'huberts',
-    'huddlestone',
-    'hudgell',
     'hudsons',
-    'huertas',
-    'hulmes',
-    'hulsby',
-    'hulsbys',
-    'humain',
-    'human/computer',
-    'humanization',
-    'humbles',
-    'humbugging',
-    'humongous',
-    'humouredly',
-    'humus-rich',
-    'hunchbacks',
-    'hundred-strong',
-    'hundred-weight',
     'hunkering',
-    'hunold',
-    'hunslets',
-    'hunting-grounds',
-    'hurals',
-    'huridocs',
-    'hurrell',
-    'hurst/hereford',
-    'hurstpierpoint',
-    'husbandless',
-    'hushed-up',
-    'husni',
-    'husseys',
-    'hussies',
-    'hut-like',
-    'huta',
     'hutten',
-    'hutton-le-hole',
-    'hvar',
-    'hxg4',
-    'hyacinth-coloured',
-    'hyb100',
-    'hybrida',
-    'hydras',
-    'hydrastis',
-    'hydro-quebec',
-    'hydrocolloids',
-    'hydrocyanic',
-    'hydrofluoric',
-    'hydrofluorocarbons',
-    'hydroids',
-    'hydroperoxide',
     'hydropneumatic',
-    'hyper-base',
-    'hyperacute',
-    'hyperalgesia',
-    'hyperboles',
-    'hypercolumns',
-    'hypercorrection',
-    'hyperfax',
-    'hyperlipoproteinaemia',
-    'hypermnesia',
-    'hyperparasite',
-    'hyperpnoea',
-    'hyperpolarize',
-    'hypocausts',
-    'hypokinesia',
-    'hyponymous',
     'hypovolaemia',
-    'hyun-hui',
-    'i-d',
-    'i.2',
-    'i.5',
-    'i.l.e.a.',
-    'i.p.',
-    'i.q.',
-    'i.r.l.r.',
-    'i.t.c.',
-    'i.u.',
-    'i/d',
-    'i/xho',
-    'i0',
-    'i968',
-    'iadb',
     'iafai',
-    'ial',
-    'ianotta',
-    'ib.',
-    'ibfs',
-    'ibm-motorola',
-    'ibm/motorola',
-    'ibm/ssl',
-    'ibmx',
-    'ibp',
-    'icahn',
-    'ice-locked',
-    'ice-skates',
-    'ichneumon',
-    'icings',
-    'iconically',
     'iconicity',
-    'icpes',
-    'id-impulses',
-    'id2',
-    'identificatory',
-    'idiogram',
-    'idiomatically',
-    'iditarod',
-    'ie180',
-    'if/when',
-    'igbo-ukwu',
-    'ige-mediated',
-    'igloos',
-    'ignatian',
-    'igniter',
-    'ignobly',
     'ii-positive',
-    'iici',
-    'iitp',
-    'ijmuiden',
-    'ikarus',
-    'il&uacute;vatar',
-    'il-2r-positive',
-    'il-quccija',
-    'ilda',
-    'ilexes',
-    'ilizarov',
-    'ill-attended',
-    'ill-behaved',
-    'ill-clothed',
-    'ill-constructed',
-    'ill-focused',
     'ill-manners',
-    'ill-nourished',
-    'ill-omened',
-    'ill-shaven',
-    'ill-ventilated',
-    'ill-washed',
-    'illegally-owned',
-    'illegibility',
-    'illes',
-    'illfated',
-    'illington',
-    'illington-lackford',
-    'illogic',
-    'illogicalities',
-    'ilsley',
-    'ilusiones',
     'image-centred',
-    'image-conscious',
-    'imf/world',
-    'imferon',
-    'immateriality',
-    'immemorially',
-    'immer',
-    'immiseration',
-    'immodesty',
-    'immoveable',
-    'immunoadsorption',
-    'immunocytological',
-    'immunologist',
-    'immunologists',
-    'immunopathological',
-    'immunopathology',
     'immunoreaction',
-    'impasses',
-    'impassible',
-    'impeachable',
-    'imperially',
-    'imperiousness',
-    'impermeability',
-    'impero',
-    'impetuousness',
-    'imphal',
-    'implicitness',
-    'imployed',
-    'impo',
-    'imposingly',
-    'impossible/very',
-    'impoundments',
     'impoverishes',
-    'impractically',
-    'in&aacute;cio',
-    'in-1',
-    'in-betweens',
-    'in-class',
-    'inactions',
-    'inalienably',
-    'inaudibility',
-    'incapacitatory',
-    'incapacities',
-    'incivility',
-    'includers',
-    'incommode',
-    'incompetency',
-    'inconclusiveness',
     'inconsequent',
-    'incontestably',
-    'inconvertible',
-    'incorporations',
-    'incumbrance',
-    'indebitatus',
-    'indecencies',
-    'indelicacy',
-    'independency',
-    'indestructibly',
-    'indeterminable',
-    'indetermination',
-    'indexed-sequential',
-    'indigence',
-    'indiscernible',
-    'indissociable',
     'indiv',
-    'individual/consultant',
-    'individuals/groups',
-    'indivisibilities',
-    'indo-soviet',
-    'indubitability',
-    'industrias',
-    'inequitably',
-    'inexpressibly',
-    'inextinguishable',
-    'infeasibility',
-    'infelicitous',
-    'inferable',
-    'infernally',
-    'informationssystemes',
-    'infraspecific',
     'ing&oacute;lfsh&ouml;fdi',
-    'ingenuities',
-    'ingenuousness',
-    'ingleby-mackenzie',
-    'ingloriously',
-    'ingoldby',
-    'ingres/enhanced',
-    'ingulph',
-    'inhutani',
-    'injectables',
-    'injunct',
-    'injured.',
-    'inkombank',
-    'inkstand',
-    'inlcuding',
-    'innis',
     'innocuous-looking',
-    'innocuously',
-    'innocuousness',
-    'innovates',
-    'inoculators',
-    'inoculum',
-    'inpayments',
-    'inquirers',
-    'inr1',
-    'insatiability',
-    'insensitivities',
-    'inside-forwards',
-    'inside-left',
-    'insolubility',
-    'inspec',
-    'inspection.',
     'instantiates',
-    'instrumatic',
-    'instruments.',
-    'insufflation',
-    'insurrectional',
-    'insurrectionists',
-    'intendment',
-    'intensifiers',
-    'inter-community',
-    'inter-national',
-    'inter-reef',
-    'inter-relatedness',
-    'inter-statal',
-    'intercolumniation',
-    'interconnectiveness',
-    'intercorrelations',
     'interfield',
-    'interfilm',
-    'interfit',
-    'intermezzos',
-    'intermodels',
-    'internal-combustion',
-    'internalizes',
-    'internation',
-    'internationales',
-    'internee',
-    'interneuron',
-    'interplays',
-    'interposes',
-    'interpretatively',
-    'intersentential',
-    'intervallum',
     'interventionists',
-    'interview-rooms',
-    'interwork',
-    'intr',
-    'intra-epithelial',
-    'intra-family',
-    'intra-national',
-    'intra-palestinian',
-    'intra-venous',
-    'intra-verbal',
-    'intragenerational',
-    'intrarectal',
-    'intraspecific',
-    'intrathoracic',
-    'intrest',
-    'introit',
     'introspections',
-    'inuits',
-    'invalidation',
-    'invaluably',
-    'invasiveness',
-    'invectives',
-    'inventively',
-    'inverlaidnan',
-    'inversive',
-    'invertible',
-    'investment-led',
-    'inveterately',
-    'invigilators',
-    'invincibly',
-    'invitee',
-    'invm',
     'inya',
-    'ionesco',
-    'ipsam',
-    'iraqi-jordanian',
-    'iria',
-    'iribarne',
-    'irish-owned',
-    'irminger',
-    'iron-porphyrin',
-    'ironists',
-    'ironstones',
-    'irradiaci&oacute;n',
-    'irregular-shaped',
-    'irrelevances',
-    'irresectable',
-    'irritancy',
     'irritans',
-    'is/is',
-    'is/was',
-    'is186',
-    'is421',
-    'is900-',
-    'isakov',
-    'isao',
-    'isdale',
-    'ishan',
-    'islamicize',
-    'islamisation',
-    'islamization',
-    'islay.',
-    'iso9002',
-    'isometry',
     'isostatically',
-    'israel/palestine',
-    'israeli-jordanian',
-    'israeli-syrian',
-    'israels',
-    'issaias',
-    'issaquah',
-    'issoire',
-    'it-was',
-    'it_in',
-    'itac',
-    'italian-owned',
-    'italicising',
-    'italicize',
-    'itasca',
-    'itca/bbc',
     'item-by-item',
-    'itemization',
-    'iv+',
-    'ivanchuk',
-    'ivanovka',
-    'ivans',
-    'iversen',
-    'iwakura',
-    'iwtc',
-    'ix.',
-    'ixion',
-    'j-m',
-    'j-shaped',
-    'j.c.r.',
-    'j.c.s.',
-    'j39',
     'jaba',
-    'jabouille',
-    'jaca',
-    'jack-of-all-trades',
-    'jackbooted',
-    'jacob/esau',
-    'jadallah',
-    'jaffar',
-    'jaine',
-    'jamborees',
-    'jamey',
-    'jamiat-i-islami',
-    'jan/feb',
-    'janatha',
-    'janeplus',
-    'jann',
     'janowitz',
-    'jansenism',
-    'jansky',
-    'january/march',
-    'jara',
-    'jardins',
-    'jargon-free',
-    'jarley',
-    'jaslow',
-    'jasus',
-    'jawad',
-    'jbel',
-    'jbs',
-    'jchmt',
-    'jealott',
-    'jean-antoine',
     'jeavons',
-    'jekyll-and-hyde',
-    'jeni',
-    'jeopardizes',
-    'jeremie',
-    'jerker',
-    'jerkiness',
-    'jerricault',
-    'jerry-cans',
-    'jervis-smith',
-    'jessa',
-    'jessey',
-    'jet-like',
-    'jethuth',
-    'jetstreams',
-    'jewel-bright',
     'jhl',
-    'jiangxi',
-    'jicnars',
-    'jil',
-    'jiminez',
-    'jinhua',
-    'jinxy',
-    'jj.a.',
-    'jmd',
-    'jmtc',
-    'jo&euml;lle',
-    'jo-jo',
-    'joannes',
-    'job-starved',
-    'jobsearch',
-    'jobshare',
     'jocoso',
-    'joelson',
-    'jogpants',
-    'john-paul',
-    'johnners',
-    'joint-ill',
-    'jokin\'',
-    'joliffe',
-    'joll',
-    'jollily',
-    'jolly-looking',
-    'jones/liberal',
-    'joppa',
-    'jordanian-plo',
-    'jorgan',
-    'jorgensen',
     'jornal',
-    'josceline',
-    'josefa',
-    'joss-sticks',
-    'joubert/nivelt',
-    'jourdan-barry',
-    'jourgenson',
-    'journal-to-journal',
-    'jousiffe',
-    'joylessly',
-    'jrs',
-    'jtpcs',
-    'jua',
-    'judgement.',
-    'judgmentalism',
-    'judiciousness',
     'judie',
-    'jugendpflege',
-    'juggy',
-    'juicily',
-    'juktas',
-    'jul&ndash;21',
-    'julianna',
-    'jump-cut',
-    'jump-cuts',
-    'junketings',
-    'justness',
-    'justyn',
-    'jybe',
-    'k&amp;r',
-    'k&ocirc;r',
-    'k-',
     'k-swiss',
-    'k.a.',
-    'k.t.',
-    'k.w.s.',
-    'k15',
-    'k19',
-    'k2s',
-    'k6',
-    'kaba',
-    'kabi',
-    'kabusaki',
-    'kabwe',
-    'kaelin',
-    'kafoozalem',
-    'kahnawake',
-    'kais',
     'kalecki',
-    'kaleidoscopes',
-    'kalemouth',
-    'kalley',
-    'kamalians',
-    'kameyama',
-    'kampucheans',
-    'kanaan',
-    'kanagawa',
-    'kanerva',
-    'kania',
-    'kaonde',
-    'kaos',
-    'kappen',
-    'kapre',
-    'kar',
     'karainagar',
-    'karate-do',
-    'kardomah',
-    'karian',
-    'karik/numerik',
-    'karl-marx-stadt',
-    'karl-otto',
-    'karlsbad',
-    'karlshorst',
-    'karmelitsk&aacute',
-    'karneia',
-    'karneian',
-    'karori',
-    'karran',
-    'karunanidhi',
-    'karya',
     'kasem',
-    'kassoma',
-    'katamba',
-    'kategaya',
-    'katheryn',
-    'katorga',
-    'kaunas',
-    'kawz',
-    'kaya',
-    'kbq',
-    'kcalories',
-    'kcals',
-    'kdv',
-    'ke3',
-    'keasey',
-    'keddy',
     'keened',
-    'keeness',
-    'kei',
-    'keiji',
-    'keita',
-    'kekova',
-    'kelloway',
-    'kelt',
-    'kemij&auml;rvi',
-    'kenchington',
-    'kenichi',
-    'kenilorea',
-    'kennett-orpwood',
-    'kenspeckle',
-    'keobounphanh',
-    'kerbstones',
     'kerney',
-    'kernick',
-    'kerstin',
-    'kerwin',
-    'keryneian',
-    'keszthely',
-    'ketanserin',
-    'key-operated',
-    'key-rings',
-    'keycards',
-    'keyless',
-    'keynames',
-    'keziah',
-    'kfp',
-    'kg53',
-    'kg9',
     'kgdc',
-    'kghm',
-    'kh710',
-    'khaida',
-    'khairallah',
-    'khakis',
-    'khales',
-    'khani',
-    'khiam',
-    'khojali',
-    'khonsu',
-    'khosla',
-    'khreesat',
-    'khudiakova',
-    'ki.107',
-    'kibles',
     'kibosh',
-    'kickoff',
-    'kidlington/oxfordshire',
-    'kidology',
-    'kilborn',
-    'kileady',
-    'kilellan',
-    'killerow',
-    'killin\'',
-    'killorglin',
-    'kilmorey',
-    'kilobars',
-    'kilohms',
-    'kilton',
-    'kilvarow',
-    'kinch',
     'kindreds',
-    'king-smith',
-    'kinglets',
-    'kingshurst',
-    'kingswell',
-    'kingswells',
-    'kingussie',
-    'kinleith',
-    'kinnell',
-    'kinnockite',
-    'kinokuni',
-    'kippah',
-    'kirklington',
-    'kirkyards',
-    'kirriemuir',
-    'kirsham',
     'kirsner',
-    'kirtley',
-    'kitcat',
-    'kite-makers',
-    'kitted-out',
-    'kittelson',
-    'kitti',
-    'kivas',
-    'kjell-arne',
-    'klans',
-    'klassen',
-    'klatzky',
-    'kleinian',
-    'kling',
-    'klinowska',
-    'klute',
     'kmph',
-    'kneejerk',
-    'knez',
-    'knibb',
-    'knife-sharp',
-    'knobkerry',
-    'knock-outs',
-    'knoebel',
-    'knottiest',
-    'knox-johnson',
-    'kobenhaven',
-    'kobrin',
-    'koca',
-    'kocurek',
-    'kodicek',
-    'kohr',
     'koi-keeping',
-    'koitobos',
-    'koka',
-    'kolaneci',
-    'kolia',
-    'koltsov',
-    'kolumbegov',
-    'kolyma',
-    'komag',
-    'komarov',
-    'komeda',
-    'komi',
-    'konig',
-    'konigsberg',
-    'konno',
-    'konovalov',
     'kool-aid',
-    'kopensky',
-    'korean-made',
-    'koroma',
-    'koshelev',
-    'koslov',
-    'kosta',
-    'kostalas',
-    'kostomarov',
-    'kotromani&cacute',
-    'kott',
-    'koukou',
-    'kouse',
-    'kox2-hybridising',
-    'kozlenkov',
-    'kps',
     'krak&oacute;w',
-    'kranjska',
-    'kranner',
-    'kraszna-krausz',
-    'krateros',
-    'kreps',
-    'kreymborg',
-    'kritsanachan',
-    'kronenburg',
-    'kropivnitskaya',
-    'krotkov',
-    'kruckenberg',
-    'kruger-daine',
-    'kt17',
-    'kubismus',
-    'kuehn',
     'kugel',
-    'kulishov',
-    'kult',
-    'kulturbesitz',
-    'kundry',
-    'kunkel',
-    'kurdish-controlled',
-    'kurhaus',
-    'kurrein',
-    'kurrr',
-    'kutuzov',
-    'kwasniewski',
-    'kwassivi',
-    'kwei',
-    'kz',
-    'l%',
     'l&amp;g',
-    'l&eacute;opold',
-    'l&egrave;se-majest&eacute',
-    'l&ndash;r',
-    'l&ouml;schnak',
-    'l&ouml;ve',
-    'l\'ain',
-    'l\'angleterre',
-    'l\'antique',
-    'l\'autre',
-    'l\'echo',
-    'l\'energie',
-    'l\'engle',
-    'l\'espagne',
-    'l\'esquire',
-    'l\'esquiriel',
     'l\'orme',
-    'l\'urss',
-    'l-ka\'da',
-    'l-section',
-    'l.j.ch.',
-    'l.r.d.g.',
-    'l/',
-    'l/a',
-    'l/hotteterre',
-    'l200',
-    'l24',
-    'l950s',
-    'l960s',
-    'l992',
-    'la&iacute;n',
-    'la_carte',
     'labellers',
-    'laboriousness',
-    'labour-liberal',
-    'labour-relations',
-    'labour-services',
-    'lacanau',
-    'lacanians',
-    'lace-frilled',
-    'laced-up',
-    'ladderback',
-    'laddies',
-    'laddis',
-    'ladleful',
-    'lady-friends',
-    'ladyfriends',
-    'lafferty/malvern',
     'lagard&egrave;re',
-    'lager-louts',
-    'lagganlochan',
-    'lagrime',
-    'lahnstein',
-    'lake-side',
-    'lakedaimonians',
-    'lakefield',
-    'lakhani',
-    'lakoi',
-    'lalas',
-    'lall',
-    'lalu',
-    'lambertian',
-    'lambrook',
-    'lamm',
     'landbridge',
-    'lander/political',
-    'landlord/tenant',
-    'landlubbers',
-    'landmasses',
-    'lando',
-    'landslipping',
-    'lane/oxfordshire',
-    'langbank',
-    'langcliffe',
-    'language-impaired',
-    'language/network',
-    'lanning',
-    'lanthanide',
-    'lanthanides',
-    'lantz',
     'lanz',
-    'lares',
-    'large-framed',
-    'large-size',
-    'lark-like',
-    'laroque',
-    'larrau',
-    'larrey',
-    'larrousse',
-    'lascub&eacute',
-    'laser-beam',
-    'laser-induced',
-    'laser-like',
-    'laser-printers',
-    'laspistol',
-    'laspistols',
     'lastingham',
-    'late-lamented',
-    'late-life',
-    'latently',
-    'latin-speaking',
-    'latitudinally',
-    'lattimore',
-    'lattisnet',
-    'laudably',
-    'laund',
-    'launderers',
-    'lautaro',
-    'law-book',
-    'law-courts',
-    'law-suits',
-    'law-worthy',
     'lawbreaker',
-    'laxmi',
-    'layaways',
-    'layed',
-    'lazarev',
-    'lazarevi&cacute',
-    'lazonby',
-    'lb-ft',
-    'lbg',
-    'lc-kc',
-    'lck',
-    'lcrc',
-    'lead-acid',
-    'lead-miners',
-    'lead-mines',
-    'leadless',
     'leaf-strewn',
-    'leafleters',
-    'league-sponsored',
-    'leakproof',
-    'leaming',
-    'learner-centred',
-    'learning/',
-    'leather-topped',
-    'leava',
-    'leave-takings',
-    'leavisites',
-    'leazes',
-    'lebong',
-    'lecce',
-    'lecherously',
-    'lechfeld',
     'lechner.',
-    'lect',
-    'lecture-demonstrations',
-    'ledermann',
-    'ledward',
-    'leeds-bradford',
-    'lees/gavin',
-    'lef-1',
-    'left-hemisphere',
-    'left-oriented',
-    'lefthandedness',
-    'leg-breaks',
-    'leg-byes',
-    'leg-cuffs',
-    'legata',
-    'legatum',
     'leggo',
-    'legia',
-    'legno',
-    'legras',
-    'legwear',
-    'leh',
-    'leiarius',
-    'leinberger',
-    'leiris',
-    'leitdorf',
-    'lemmatisation',
-    'lendings',
-    'lene',
-    'lenehan',
-    'leninists',
-    'lennoxtown',
     'lenora',
-    'lenska',
-    'leonina',
-    'leonskaja',
-    'leontyne',
-    'leopardi',
-    'leopoldville',
-    'lepidopterists',
-    'lepidopterous',
-    'lepley',
-    'lesieutre',
-    'less-successful',
-    'less-than-perfect',
-    'let-downs',
-    'let_,_let\'s',
-    'let_let\'s',
     'lethington',
-    'lett-haines',
-    'letter-quality',
-    'letterbombs',
-    'leuser',
-    'leuthold',
-    'leva&ccaron;i&cacute',
-    'level-1',
-    'leverington',
-    'levinsky',
-    'lewens',
-    'leycester',
-    'lfrs',
-    'lfv',
-    'lge.',
-    'liautaud',
     'liberal-historical',
-    'library/resource',
-    'lichened',
-    'lichnowsky',
-    'lie-ins',
-    'liegeman',
-    'life-lines',
-    'life-rafts',
-    'life-savers',
-    'life-stories',
-    'life-times',
-    'lightbox',
-    'lighter-hearted',
-    'lightly-raced',
-    'lightshow',
-    'lignum',
     'ligusticum',
-    'likeably',
-    'liliaceae',
-    'lilienthal',
-    'lilli',
-    'limas',
-    'lime-kilns',
-    'limonite',
-    'limpley',
-    'linderhof',
-    'lindstr&oslash;m',
-    'line(s)',
-    'line-shafting',
-    'lined-up',
-    'linekar',
-    'linewidths',
     'link-ups',
-    'linkleter',
-    'lioniser',
-    'lipline',
-    'lipocalin',
-    'lipolytic',
-    'lippings',
-    'lipscomb',
-    'liquid-junction',
-    'liquidizer',
-    'lisc',
-    'lisch',
-    'lisnaskea',
-    'lissadell',
-    'lissome',
-    'listable',
     'litas',
-    'liteflite',
-    'literalistic',
-    'literalists',
-    'literalness',
-    'lithofacies',
-    'lithogenic',
-    'litres/2',
-    'litres/3',
-    'litres/minute',
-    'litter-mates',
-    'little-explored',
-    'little-girl-lost',
-    'litvac',
-    'liv.',
-    'live-saving',
     'livefoods',
-    'lividity',
-    'livingroom',
-    'liza-lu',
-    'lizot',
-    'llanbadarn',
-    'llanbedr',
-    'llandrinio',
-    'llangurig',
-    'llantarnam',
-    'llanybydder',
-    'llanymynech',
-    'llbertas',
-    'llewellin',
-    'llin',
-    'llm',
     'llyswen',
-    'lm4',
-    'lmf',
-    'lobato',
-    'lobelias',
-    'localcall',
-    'locally-owned',
-    'location-specific',
-    'lochmaddy',
-    'locked-room',
-    'locked-up',
-    'lockshield',
-    'locomotory',
-    'lodgment',
-    'lodhi',
-    'loeschnak',
     'log&mdash;io',
-    'log-hyperbolic',
-    'log-rank',
-    'logicality',
-    'logicasiel',
-    'logjams',
-    'lognormal',
-    'logoff\'',
-    'loiters',
-    'lojze',
-    'london-brighton',
-    'london/jamaican',
-    'lonergan',
-    'loney',
-    'long-hairs',
-    'long-reaching',
     'long-shafted',
-    'long-termers',
-    'long-vowel',
-    'longboats',
-    'longcroft',
-    'longer-legged',
-    'longer/shorter',
-    'longest-ever',
-    'longhorsley',
-    'longleigh',
-    'longshoremen',
-    'longside',
-    'longwave',
-    'lons',
-    'looniest',
-    'loop-holes',
     'loopa',
-    'loose-bottomed',
-    'loose-knit',
-    'lopes-virella',
-    'lopham',
-    'loranthi',
-    'loreburn',
-    'loricariid',
-    'lorrie',
-    'lorry-drivers',
-    'lorryman',
-    'lossdale',
-    'lost-time',
-    'lotharingia',
-    'louvain-la-neuve',
-    'louveciennes',
     'love-ins',
-    'love-lorn',
-    'loveplay',
-    'lover-like',
-    'lovesey',
-    'lovich',
-    'low-ability',
-    'low-arched',
-    'low-attaining',
-    'low-beamed',
-    'low-cal',
-    'lowbrows',
-    'lower-division',
-    'lower-hemisphere',
-    'lower-off',
-    'lower-pitched',
     'lowerre',
-    'lowest-ever',
-    'lowi',
-    'lowliness',
-    'lowsons',
-    'loyne',
-    'loza',
-    'lozada',
-    'lpd',
-    'lrcp',
-    'lrcs',
-    'lspan.lstrain',
-    'lss',
-    'lt.-',
-    'lt.cdr',
-    'ltpd',
     'lu1',
-    'luba',
-    'lubac',
-    'lubos',
-    'lubrani',
-    'luces',
-    'luchembe',
-    'luckes',
-    'luckham',
-    'lucratively',
-    'lucrezia',
-    'ludgershall',
-    'ludwigsburg',
-    'luers',
-    'lufbery',
-    'lughnasa',
     'lumiere',
-    'luminance',
-    'luminosities',
-    'lumpily',
-    'lumpiness',
-    'luneburg',
-    'lunensis',
-    'lunettes',
-    'luong',
-    'lupeni',
-    'lurkers',
-    'lurkie',
-    'lusman',
-    'luteum',
-    'luvale',
-    'luvvies',
     'luvvy',
-    'luyn',
-    'lvii',
-    'lxi',
-    'lxix',
-    'lxxix',
-    'lxxxviii',
-    'lydbrook',
-    'lydbrook/gloucestershire',
-    'lyddon',
-    'lymani',
-    'lymphoblasts',
-    'lymphoepithelial',
-    'lynchets',
-    'lynds',
-    'lynlea',
     'lyres',
-    'lysmata',
-    'lysylendopeptidase',
-    'm&aacute;cha',
-    'm&amp;its',
-    'm&amp;sup3',
-    'm&auml;lar',
-    'm&eacute;lodies',
-    'm&eacute;nard',
-    'm&eacute;rite',
-    'm&ocirc;n',
-    'm&ucirc;nchmeyer',
-    'm\'aimes',
-    'm\'daghri',
-    'm\'mselle',
-    'm(b)',
     'm(x)',
-    'm-16s',
-    'm-audio',
-    'm-h',
-    'm-mean',
-    'm.c.c.',
-    'm.phil',
-    'm.v.',
-    'm.w.',
-    'm18',
-    'm39',
-    'm4/wiltshire',
-    'm40/oxfordshire',
-    'm57',
-    'm66',
-    'm:f',
     'ma&ndash;or',
-    'ma\'e',
-    'ma(ed)',
-    'mabogunje',
-    'mabuni',
-    'macalpin',
-    'macaraig',
-    'macaranga',
-    'macardle',
-    'macbean',
-    'maccabeus',
-    'macchi',
-    'macdonald/oxfam',
-    'mace/oxfordshire',
-    'macerlean',
-    'macfee',
     'mach386',
-    'machination',
-    'machine-pistols',
-    'machine-printed',
-    'machineguns',
-    'machinery-of-government',
-    'machins',
-    'machrie',
-    'macigno',
-    'macilraith',
-    'macker',
-    'mackillop',
-    'mackley',
-    'maclise',
-    'macmach',
-    'macmichael',
     'macondo',
-    'macouly',
-    'macoute',
-    'macro-economics',
-    'macroeconometric',
-    'mactaggart',
-    'mactan',
-    'maculicauda',
-    'maden',
-    'madonna-like',
-    'madrell',
-    'mads',
-    'mael-isu',
-    'maenads',
-    'maestra',
-    'mafia-like',
     'magdalenian',
-    'magdi',
-    'maginness',
-    'magnetospheres',
-    'mahanaim',
-    'mahlerian',
-    'mahmut',
-    'maidenhood',
-    'maier-witt',
-    'maighread',
-    'maikov',
-    'mail-it',
-    'mailman',
-    'main-frame',
-    'mainardi',
-    'mainliners',
     'mainplane',
-    'mains-fed',
-    'mainsborne',
-    'mairtin',
-    'maitre_d\'hotel',
-    'maitreya',
-    'maj7',
-    'maj7th',
-    'majoritarianism',
-    'makashov',
-    'makavejev',
-    'make&ndash;up',
-    'make-overs',
-    'mal&eacute',
-    'malagodi',
-    'malar',
     'malarky',
-    'malatesta',
-    'malaysian/singapore',
-    'malca',
-    'male-only',
-    'malecela',
-    'maleme',
-    'malestroit',
-    'malignance',
-    'malindi',
-    'malky',
-    'mallin',
-    'malswick',
-    'mamalian',
-    'mamman',
-    'man-boy',
     'man-handled',
-    'man-hungry',
-    'man-readable',
-    'management/employee',
-    'manager/x',
-    'manceville',
-    'manchego',
-    'mancozeb',
-    'mandalas',
-    'mandragora',
-    'manias',
-    'maniero',
-    'manko',
-    'manlin',
-    'manorbier',
-    'manouevres',
     'manouvres',
-    'manq34',
-    'mansbach',
-    'manservants',
-    'mantra-like',
-    'mantraps',
-    'manually-operated',
-    'many-breasted',
-    'mapleton',
-    'mapley',
-    'mar&ndash;26',
-    'maracana',
-    'marahau',
-    'marathoner',
-    'maravillas',
-    'marazion',
     'marcan',
-    'march&ndash;april',
-    'march-2',
-    'marchpane',
-    'marcin',
-    'mardones',
-    'mareth',
-    'marett',
-    'marfa',
-    'marginalizes',
-    'marginson',
-    'marich',
-    'marie-ang&egrave;le',
-    'marie-jo',
-    'marie-laure',
-    'marie-th&eacute;r&egrave;se',
     'maritimus',
-    'mark-houwink',
-    'marked-up',
-    'market-seeking',
-    'market/product',
-    'markinch',
-    'markova',
-    'marnell',
-    'maroony',
-    'marquesas',
-    'marquetarians',
-    'marra',
-    'marriotts',
-    'marscal',
-    'marshbrook',
-    'martin-jones',
     'martir',
-    'martock',
-    'marvyn',
-    'marwat',
-    'marya',
-    'mascaras',
-    'maschinenfabrik',
-    'mascie-taylor',
-    'masculine-dominated',
-    'masculinity/femininity',
-    'massinger',
-    'mastaba',
-    'mastics',
-    'mat&ecaron;j',
-    'mat-like',
-    'matalin',
     'matchbook',
-    'materialisation',
-    'materializes',
-    'maternalist',
-    'mateus',
-    'mathematica',
-    'matildine',
-    'matriculating',
-    'matrix-isolated',
-    'matsunaga',
-    'matsuura',
-    'matthaei',
-    'mattlock',
-    'matyas',
-    'maude-roxby',
-    'maund',
     'maunderings',
-    'maurepas',
-    'maurus',
-    'mauses',
-    'mauves',
-    'mavica',
-    'mawkishly',
-    'mawulikplimi',
-    'maximiser',
-    'maxwell-fyfe',
-    'may&ndash;12',
-    'may&ndash;5',
-    'may&ndash;june',
-    'may-25',
-    'mayell',
-    'maylett',
     'mayne/thames',
-    'mayor-elect',
-    'maypoles',
-    'mazdah',
-    'maze-like',
-    'mazilu',
-    'mazuria',
-    'mazzola',
-    'mazzotta',
-    'mbatha',
-    'mbl',
-    'mbonimpa',
-    'mbr',
-    'mc200',
-    'mc5',
-    'mcanerney',
     'mcbean',
-    'mcbirney',
-    'mcbriar',
-    'mccarney',
-    'mccarrison',
-    'mccaughan',
-    'mccawley',
-    'mcchicken',
-    'mcclintoch',
-    'mccomb',
-    'mcconaghy',
-    'mcconchie',
-    'mcconnel',
-    'mccoosh',
-    'mccorriston',
-    'mcdaniel',
     'mcdarroch',
-    'mcdoodle',
-    'mcdugald',
-    'mcenhill',
-    'mcentee',
-    'mcfetridge',
-    'mcg3500',
-    'mcgaffin',
-    'mcginnis',
-    'mcgloin',
-    'mcgookin',
-    'mcgowen',
-    'mcgrugan',
-    'mcguires',
-    'mchargue',
-    'mcillvoil',
     'mcilwraith',
-    'mcinstry',
-    'mckays',
-    'mckeegan',
-    'mckeich',
-    'mckerracher',
-    'mclarty',
-    'mclatchie',
-    'mclauchlan',
-    'mclay',
-    'mcleod-wright',
-    'mcmullin',
-    'mcmurtry',
-    'mcnarry',
-    'mcneilly',
-    'mcneish',
     'mcnicholl',
-    'mcnuggets',
-    'mcpeake',
-    'mcphillips',
-    'mcquaker',
-    'mcquay',
-    'mcquilken',
-    'mcr',
-    'mcroberts',
-    'mcsp',
-    'mcspadden',
-    'mctiernan',
-    'mcv',
-    'mdst',
-    'meadhaven',
-    'meadville',
     'meallan',
-    'meaness',
-    'meanies',
-    'means_of',
-    'meanwood',
-    'measach',
-    'mechanise',
-    'medal-winners',
-    'medalla',
-    'medau-schule',
-    'mediaevalist',
-    'medias',
-    'mediately',
-    'medicale',
-    'medico-psychological',
-    'medicos',
     'meditationes',
-    'meditators',
-    'mediterranean-dead',
-    'medium-to',
-    'medium-to-large',
-    'mediumistic',
-    'mediwell',
-    'medlars',
-    'meekest',
-    'mega-bucks',
-    'megalomaniacs',
-    'megarectum',
-    'megastardom',
-    'megistias',
-    'megrahi',
-    'megrez',
     'meitner',
-    'meknes',
-    'melanistic',
-    'mele',
-    'mellows',
-    'mellstock',
-    'melmerby',
-    'melnikov',
-    'meltzer',
-    'melvil',
-    'memba',
-    'member-countries',
-    'member/members',
-    'memoirist',
-    'memorialists',
-    'men-about-town',
     'men-folk',
-    'mendeleyev',
-    'mendelism',
-    'mendi',
-    'mendicants',
-    'meni&ntilde;as',
-    'menro',
-    'menyanthes',
-    'meowing',
-    'mephostophilis',
-    'meran',
-    'mercaptans',
-    'mercaptoethanol',
-    'mercenaries.',
-    'mercersburg',
-    'merchantibility',
     'merdle',
-    'merewalh',
-    'meritless',
-    'merligen',
-    'merlons',
-    'merlyn-rees',
-    'merope',
-    'merr',
-    'merriest',
-    'merville',
-    'mesake',
-    'mesembria',
-    'mesodermal',
-    'mesopotamians',
-    'message(s)',
-    'messham',
     'met-',
-    'meta-analytic',
-    'metabotropic',
-    'metachronous',
-    'metal-bound',
-    'metalsmith',
-    'metalworker',
-    'metapontum',
-    'methanol:glacial',
-    'methylation-free',
-    'methyldopa',
-    'metre-long',
-    'metropol',
-    'metropolitans',
-    'mettlesome',
-    'meval11',
     'meynert',
-    'mezzo_soprano',
-    'mfaume',
-    'mfg',
-    'mg&times;6',
-    'mg/1.',
-    'mg/kg/',
-    'mgm/ua',
-    'mianded',
-    'miano',
-    'miasmatic',
-    'micaceous',
-    'micklemas',
-    'micro-foundations',
-    'micro-scale',
-    'micro-technology',
     'microcar',
-    'microdensitometer',
-    'microelectrode',
-    'microfile',
-    'microfossil',
-    'microinvasive',
-    'micrometre',
-    'micronesian',
-    'micronutrients',
-    'microplates',
-    'micropolitical',
-    'microprograms',
-    'microscale',
-    'microspheres',
-    'microswitch',
-    'microtome',
     'mid-16th',
-    'mid-1890s',
-    'mid-1982',
-    'mid-20th',
-    'mid-and',
-    'mid-autumn',
-    'mid-brain',
-    'mid-cheshire',
-    'mid-festival',
-    'mid-fielder',
-    'mid-latitude',
-    'mid-mar',
-    'mid-session',
-    'mid-surrey',
-    'mid-sussex',
-    'mid-word',
     'mideast',
-    'midshire',
-    'miei',
-    'might_as',
-    'mighten',
-    'mightest',
-    'migne',
-    'mikhayl',
-    'mikio',
-    'mikolaj',
-    'mil&aacute&ccaron;ku',
-    'milan-based',
-    'mile-high',
-    'mileometers',
-    'militarize',
-    'military-technical',
     'milk-in-schools',
-    'mill-races',
-    'millars',
-    'millboard',
-    'millburn',
-    'millcote',
-    'miller/manager',
-    'milletti',
-    'millfields',
-    'millimoles',
-    'millmasters',
-    'milovan',
-    'milutin',
-    'mind-control',
-    'mind-like',
-    'mind-wandering',
     'mine-workers',
-    'minervois',
-    'minesweeping',
-    'miney',
-    'minge',
-    'mini-meadow',
-    'mini-revival',
-    'miniaturization',
-    'minicassettes',
-    'minicholecystectomy',
-    'minifundia',
-    'minimalistic',
-    'minimalists',
-    'miniprep',
-    'minipreparation',
-    'minipumps',
     'minirhizotrons',
-    'minister-without-portfolio',
-    'ministre',
-    'ministri',
-    'minisupercomputer',
-    'mink-lined',
-    'minoprio',
-    'minorities.',
-    'mint-flavoured',
-    'mintz',
-    'mirabilite',
-    'mirsaidov',
-    'mirthful',
-    'mis-management',
-    'mis-specification',
-    'mis-statement',
     'mis-translation',
-    'mis:press',
-    'misalliance',
-    'misconstrue',
-    'mise-en-scene',
-    'mishakov',
-    'mislip',
-    'misogynism',
-    'misplacement',
-    'misrepresentative',
-    'misto',
-    'mitan',
-    'mitbestimmung',
-    'mitcheldean',
-    'mitchelson',
-    'mitre-shaped',
     'mitridate',
-    'mitropoulos',
-    'mizzards',
-    'mk7',
-    'ml/15',
-    'ml/d',
-    'ml1',
-    'mloo9',
-    'mm-hmm',
-    'mme.',
-    'mmol/24',
-    'mmol/day',
-    'mn/m2',
-    'mnlf',
-    'mns',
-    'mo1',
     'mo3',
-    'mobb',
-    'mobilities',
-    'mock-gothic',
-    'mock-medieval',
-    'mod-by',
-    'modan',
-    'model-calculated',
-    'moderacy',
-    'modern-looking',
-    'modern-minded',
-    'modernisers',
-    'modestly-sized',
-    'moerheim',
-    'mohammedi',
-    'mohnyin',
     'mojahedin-e',
-    'molchanov',
-    'mollicomata',
-    'mollissima',
-    'molomjamts',
-    'mols',
-    'moms',
-    'mon&eacute;taire',
-    'monadnock',
-    'monarchial',
-    'monastici',
-    'monatomic',
-    'monazite',
-    'monch',
-    'money-makers',
-    'money-spinners',
     'money-winner',
-    'money-wise',
-    'moneyless',
-    'mongering',
-    'monico',
-    'monk-like',
-    'monkshood',
-    'monobloc',
-    'monoblock',
-    'monoclonals',
-    'monocyclic',
-    'monogenic',
-    'monomania',
-    'monoplank',
-    'monopolistically',
-    'monorails',
     'monosaccharides',
-    'monosyllabically',
-    'monotheists',
-    'monotherapy',
-    'monsoonal',
-    'montale',
-    'montano',
-    'monte-carlo',
-    'montfortian',
-    'montgolfier',
-    'montgomery-massingberd',
-    'monumentalise',
-    'mood-swings',
-    'moonboots',
-    'moore/hampton',
-    'mooring-ropes',
     'moorish-style',
-    'moormen',
-    'mopti',
-    'morans',
-    'morellet',
-    'morelos',
-    'moret-sur-loing',
-    'moreton-in-marsh/gloucestershire',
-    'moric',
-    'mormaer',
-    'morni',
-    'moroney',
-    'moroneys',
-    'morph-plus',
-    'morris/driver',
-    'morrisonian',
     'morrit',
-    'mortage',
-    'mortes',
-    'mortgage-holders',
-    'mortuaries',
-    'mortuis',
-    'morula',
-    'moschata',
-    'mosquera',
-    'mosquito-infested',
-    'mossgiel',
-    'moth-like',
-    'mother-fuckers',
-    'mother/daughter',
-    'motor-launch',
-    'motor/drive',
     'motorcades',
-    'motoyama',
-    'motsoaledi',
-    'mottet',
-    'mottisfont',
-    'mouawad',
-    'mounsa',
-    'mountain-tops',
-    'mountstuart',
-    'moura',
-    'mouse-coloured',
-    'moustachios',
-    'moutsa',
-    'moyser',
-    'mp/cirencester',
-    'mp/former',
     'mp/president/board',
-    'mpe/xl',
-    'mpvs',
-    'ms-dos-compatible',
-    'ms-dos/windows',
-    'ms082',
-    'msb',
-    'msup3',
-    'mt/pa',
-    'mua0',
-    'much-missed',
-    'much-rumoured',
-    'muche',
-    'muchness',
-    'mucinous',
-    'mud-brown',
     'mud-spattered',
-    'muddier',
-    'mueyyedzade',
-    'muezzins',
-    'mugen-honda',
-    'muid',
-    'muindi',
-    'mukwala',
-    'mulberry-coloured',
-    'mulieres',
-    'muliro',
-    'mullaittivu',
-    'mullerian',
-    'multi-annual',
-    'multi-barrelled',
-    'multi-celled',
     'multi-class',
-    'multi-generational',
-    'multi-lane',
-    'multi-mode',
-    'multi-player',
-    'multi-portions',
-    'multi-storeyed',
-    'multi-vehicle',
-    'multicompany',
-    'multicopy',
-    'multiethnic',
-    'multiflora',
-    'multigene',
-    'multilateralists',
-    'multimers',
-    'multiply-handicapped',
     'multivite/singletons',
-    'mulvie',
-    'mum-in-law',
-    'municipalisation',
-    'munroists',
-    'muntzer',
-    'murata',
-    'murlens',
-    'murteira',
-    'musca',
-    'muscle-specific',
-    'muselier',
-    'music-historical',
-    'musicassettes',
-    'musico-dramatic',
-    'musoca',
     'mussadeq',
-    'mustad',
-    'mustaine',
-    'mustard-plasters',
-    'mustela',
-    'mutafchiev',
-    'mutagenized',
-    'mutism',
-    'mutuals',
-    'muzio',
-    'mvga',
-    'myelination',
-    'myeni',
-    'mykura',
-    'mylonites',
-    'myoclonic',
     'myocyte',
-    'myofilaments',
-    'myogenic',
-    'myogenin',
-    'myringotomy',
-    'myristylation',
-    'myrtos',
-    'myson',
-    'myxazin',
-    'n-acetyl-5-asa',
-    'n-acetyltransferase',
-    'n-sure',
-    'n.a.t.o.',
-    'n.c.m.a.',
-    'n.e.a.',
-    'n.f.',
     'n.s.w.',
-    'n0',
-    'n240',
-    'n241',
-    'n400',
-    'n9837a',
-    'n=27',
-    'n=29',
-    'n=32',
-    'n=40',
-    'n=72',
-    'naamen',
-    'nabo',
-    'nadd',
-    'nadezhda',
-    'naevius',
     'naffness',
-    'nagelmackers',
-    'nagra',
-    'naguib',
-    'nahat',
-    'nahr',
-    'nailer',
-    'naivity',
-    'nakahira',
-    'name&lsqb;s&rsqb',
-    'name-plates',
-    'namecode',
-    'nanocomposite',
-    'nanocuries',
-    'napoleons',
-    'narcolepsy',
     'narcosis',
-    'narky',
-    'narratological',
-    'narv&aacute;ez',
-    'nasogastrically',
-    'nasopharynx',
-    'natchez',
-    'national-territorial',
-    'naturalizes',
-    'nature-culture',
-    'navada',
-    'naved',
-    'naviede',
-    'navs',
-    'naxian',
-    'nazianzus',
     'nazification',
-    'ncoi-ecori',
-    'ndalu',
-    'ndei',
-    'ndindiliyimana',
-    'ndm',
-    'nealle',
-    'near-continuous',
-    'near-derelict',
-    'near-identical',
-    'near-miraculous',
-    'near-nakedness',
-    'near-poverty',
-    'nearly-new',
-    'necessaire',
-    'necheaev',
     'neckguard',
-    'neckless',
-    'necklet',
-    'nectars',
-    'nedc/msc',
-    'nefertum',
-    'neg.',
-    'negara',
-    'neglig&eacute;e',
-    'negrine',
-    'negrophobic',
-    'nehemlis',
-    'nehru-gandhi',
-    'neighbourhoods.',
-    'nelis',
-    'nem_con',
     'nema',
-    'nembutal',
-    'nemours',
-    'neo-conservatives',
-    'neo-dadaists',
-    'neo-freudian',
-    'neocortical',
-    'neomycin',
-    'neopallial',
-    'nephrological',
-    'nerchinsk',
-    'neritic',
-    'nernst',
-    'nervous-looking',
-    'nesdis',
-    'nessan',
     'nessus',
-    'nest-boxes',
-    'net-armed',
-    'netas',
-    'netful',
-    'netherallan',
-    'netherley',
-    'nettlecombe',
-    'neubauten',
-    'neuroanatomist',
-    'neurobiologist',
-    'neuropathies',
-    'neurotoxin',
-    'nevalainen',
-    'new-laid',
-    'new-made',
     'newell/governor',
-    'newly-baked',
-    'newly-refurbished',
-    'newly-won',
-    'newmanites',
-    'newmann',
-    'newmill-1',
-    'newmilns',
-    'newne',
-    'news-based',
-    'news-hungry',
-    'newtonians',
-    'nfr90',
-    'nges',
-    'ngulinzaira',
-    'nhan',
     'ni&scaron',
-    'ni1000',
-    'niachos',
-    'niagara-on-the-lake',
-    'niblick',
-    'nicci',
-    'nickeliferous',
-    'nickles',
-    'nicknaming',
-    'nickson',
-    'nidus',
-    'nierenberg',
-    'nigerian-led',
-    'night-clothes',
-    'night-dress',
-    'night-lights',
     'night-times',
-    'night-watchmen',
-    'night-worker',
-    'nightscape',
-    'nihell',
-    'niknam',
-    'nikolayevich',
-    'nilsonne',
-    'nind',
-    'nine-carat',
-    'nine-country',
-    'nine-track',
-    'ninetee',
-    'nineteen-eighteen',
-    'nineteen-forties',
-    'ninety-minute',
     'ninety/one',
-    'nivalis',
-    'niyibigira',
-    'nizhni',
-    'nizhniy',
-    'nlsls',
-    'nmol/h/&micro;g',
-    'no-holds',
-    'no-load',
-    'no.18',
-    'no.19',
-    'no.22',
-    'no5',
-    'noar',
-    'nobes',
-    'noisette',
     'nom_de_guerre',
-    'non&ndash;compliance',
-    'non-absolute',
-    'non-academics',
-    'non-action',
-    'non-activated',
-    'non-actors',
-    'non-affluent',
-    'non-allergenic',
-    'non-allergic',
-    'non-approval',
-    'non-approved',
-    'non-aqueous',
-    'non-biodegradable',
-    'non-books',
-    'non-bureaucrats',
     'non-buyers',
-    'non-canonical',
-    'non-carers',
-    'non-charitable',
-    'non-cics',
-    'non-colonial',
-    'non-commital',
-    'non-commutative',
-    'non-consumers',
-    'non-crystalline',
-    'non-dancers',
-    'non-delegable',
-    'non-deliberate',
-    'non-depreciation',
-    'non-dipolar',
-    'non-doctors',
     'non-dramatic',
-    'non-drying',
-    'non-earning',
-    'non-ecclesiastical',
-    'non-economists',
-    'non-electric',
-    'non-envious',
-    'non-examinable',
-    'non-exhaustive',
-    'non-explicit',
-    'non-expressive',
-    'non-fluorescent',
-    'non-grammatical',
-    'non-homogeneous',
-    'non-immune',
-    'non-intending',
     'non-intensive',
-    'non-investment',
-    'non-involved',
-    'non-italians',
-    'non-kinsmen',
-    'non-legalistic',
-    'non-literature',
-    'non-marketing',
-    'non-mobile',
-    'non-monastic',
-    'non-monetarized',
-    'non-neural',
-    'non-nhs',
-    'non-oily',
-    'non-operated',
-    'non-optimal',
     'non-orthodox',
-    'non-patrials',
-    'non-pedigree',
-    'non-permissive',
-    'non-persistent',
-    'non-personal',
-    'non-pharmacological',
-    'non-physiological',
-    'non-players',
-    'non-poetic',
-    'non-practical',
-    'non-preferential',
-    'non-privileged',
-    'non-profitmaking',
-    'non-publishing',
-    'non-purposive',
     'non-qualified',
-    'non-ratepayers',
-    'non-real',
-    'non-recoverable',
-    'non-regional',
-    'non-reporting',
-    'non-representational',
-    'non-rigorous',
-    'non-runner',
-    'non-scheduled',
-    'non-seasonal',
-    'non-self',
-    'non-serbs',
-    'non-socialists',
-    'non-sociological',
-    'non-specialised',
     'non-spherical',
-    'non-starters',
-    'non-trem',
-    'non-unit',
-    'non-vascular',
-    'non-velar',
-    'non-visual',
-    'non-windows',
-    'non-workers',
-    'nondeterministic',
-    'nonfeasance',
-    'nong',
-    'nongkhai',
-    'nonmanual',
-    'nonpolitical',
-    'nonprofessional',
     'nooo',
-    'nordale',
-    'norm-enforcement',
-    'north-east-facing',
-    'northbrooks',
-    'northeastwards',
-    'northfields',
-    'northleach',
-    'northpoint',
-    'nortman',
-    'norvegica',
-    'nose-high',
-    'not-men',
-    'not-so-bright',
-    'not-so-famous',
-    'not-so-good',
     'not-so-young',
-    'note-perfect',
-    'notec',
-    'noteman',
-    'nothing_at',
-    'notizario',
-    'notochord',
-    'nousts',
-    'nouveau-riche',
-    'novarum',
-    'novato',
-    'novorum',
-    'now\'t',
-    'now-notorious',
-    'now-vanished',
-    'nr.',
     'nsukka',
-    'ntl',
-    'nucleolar',
-    'nucleosomes',
-    'nudd',
-    'nuenen',
-    'nuestra',
-    'numberpower',
-    'numen',
-    'numerators',
-    'numerosity',
-    'nunez',
-    'nussberg',
-    'nutcases',
-    'nutfield',
-    'nuthouse',
     'nutristem',
-    'nutu',
-    'nvp',
-    'nvunda',
-    'nwl',
-    'nxn',
-    'nyahwa',
-    'nyi',
-    'nymphomania',
-    'o&amp;sub5',
-    'o\'clery',
-    'o\'connors',
-    'o\'dea',
-    'o\'dells',
-    'o\'donald',
-    'o\'flynn',
     'o\'hanlons',
-    'o-o',
-    'o/',
-    'o/55',
-    'o/a',
-    'oak-beamed',
-    'oanh',
-    'obeisances',
-    'oberfeldwebel',
-    'oberstleutnant',
-    'obfuscates',
-    'object-centred',
-    'object-like',
-    'objectives.',
-    'oblasti',
-    'oblation',
     'oblations',
-    'obligation.',
-    'obligato',
-    'obliviously',
-    'obras',
-    'obrecht',
-    'obreras',
-    'obscuration',
-    'obsequiousness',
-    'observably',
-    'obstat',
-    'obstructiveness',
-    'obstruents',
-    'obtrusively',
-    'occasions.',
-    'occlusions',
     'occupation.',
-    'oceanside',
-    'ochils',
-    'ochre-coloured',
-    'ochreous',
-    'oct-3/4',
-    'octanoic',
-    'octopodes',
-    'octosyllabic',
-    'oculus',
-    'odd-sounding',
-    'odeneal',
-    'odling-smee',
-    'odometers',
-    'odontodactylus',
-    'oeconomicus',
     'oerlikons',
-    'of_,_of_course',
-    'of_a',
-    'off-board',
-    'off-breaks',
-    'off-setting',
-    'off-spinners',
-    'off-the-books',
-    'offenburg',
-    'offertorium',
-    'officiant',
-    'offspin',
-    'offsprings',
-    'offtakes',
-    'ogarkov',
-    'ogawa',
     'ogilvys',
-    'ogons',
-    'ohmic',
-    'oib-like',
-    'oil-bound',
-    'oil-burners',
-    'oil-soaked',
-    'oil/gas',
-    'oilbars',
-    'oilbird',
-    'oilbirds',
-    'oilcan',
-    'ojukwu',
-    'okeechobee',
-    'oktober',
-    'old\'un',
     'oldenberg',
-    'oldness',
-    'oldrich',
-    'oldster',
-    'oleographs',
-    'oleoyl',
-    'olin',
-    'olmecs',
-    'olympic-sized',
-    'ombersley',
-    'omega-6',
-    'omentum',
-    'omicron&amp;sup2',
-    'ominami',
-    'omissible',
-    'omissus',
     'omm',
-    'omni-bearing',
-    'omnivore',
-    'omomyidae',
-    'once-daily',
-    'oncers',
-    'oncophora',
-    'ondra',
-    'ondyne',
-    'one-china',
-    'one-dollar',
-    'one-fiftieth',
-    'one-fold',
-    'one-fourth',
-    'one-in-four',
-    'one-phase.on',
     'one-product',
-    'one-sidedly',
-    'one-thousand',
-    'one-thousandth',
-    'one/2',
-    'one/6000',
-    'oner',
-    'onion-domed',
-    'onna',
-    'ontime',
-    'onwards.',
-    'oort',
-    'oosd/c++',
-    'op\'',
-    'opacities',
-    'opalescence',
     'open-book',
-    'open/36',
-    'open/image',
-    'operationalization',
-    'operatorship',
-    'ophiolitic',
-    'ophiologimus',
-    'oppon',
-    'opr',
-    'optonic',
-    'opulus',
-    'or/and',
-    'orals',
-    'orangutans',
-    'orare',
-    'orbats',
     'orbitally',
-    'orchestrally',
-    'orchestrations',
-    'orderable',
-    'ordinator',
-    'orgady',
-    'organgymnastik',
-    'organophosphates',
-    'organophosphorus',
-    'oriels',
-    'orielton',
-    'origanum',
-    'orl&eacute;anist',
-    'ornamenter',
-    'orphange',
-    'orthodontic',
     'orthodoxly',
-    'orthopyroxene',
-    'os/32',
-    'os/vs',
-    'oscilloscopes',
-    'oshun',
-    'osiatynski',
-    'osma',
-    'osmania',
-    'osmometry',
-    'osmotherly',
-    'osmotically',
-    'ossand&oacute;n',
-    'ossio',
-    'osteopathic',
-    'osteostracans',
     'ostracize',
-    'oswaldo',
-    'otalgia',
-    'otc-traded',
-    'otero',
-    'other(s)',
-    'otherworldliness',
-    'otolaryngology',
-    'otoscopy',
-    'oudin',
-    'oueddei',
-    'ouen',
-    'oujda',
-    'out-county',
-    'out-group',
-    'out-haul',
     'out-of-order',
-    'out-of-print',
-    'out_,_out_of',
-    'outboards',
-    'outcaste',
-    'outclassing',
-    'outdistance',
-    'outersole',
-    'outjumped',
-    'outliner',
-    'outnumbers',
-    'outred',
-    'outruns',
-    'outspeed',
-    'outswinger',
-    'outward-pointing',
     'outworks',
-    'ovensman',
-    'over-75s',
-    'over-anxiety',
-    'over-careful',
-    'over-commitment',
-    'over-compensation',
-    'over-competitive',
-    'over-complex',
-    'over-elaboration',
-    'over-enthusiastically',
-    'over-fifties',
-    'over-fond',
-    'over-forties',
-    'over-hastily',
-    'over-heavy',
     'over-investment',
-    'over-loud',
-    'over-ornate',
-    'over-powerful',
-    'over-producing',
-    'over-rapid',
-    'over-reactive',
-    'over-readiness',
-    'over-rich',
-    'over-seeing',
-    'over-sentimental',
-    'over-tunic',
-    'overactivity',
-    'overanxious',
-    'overawe',
-    'overbeat',
     'overclouded',
-    'overconscientious',
-    'overdependence',
-    'overdoes',
-    'overemphasizing',
-    'overexpansion',
-    'overfields',
-    'overgenerous',
-    'overlayer',
-    'overplaying',
-    'overplus',
-    'overprotection',
-    'overrules',
-    'oversimplifications',
-    'overstressing',
-    'overthrusting',
     'oviposition',
-    'owner-occupants',
-    'owner/manager',
-    'owona',
-    'ox5',
-    'ox7',
-    'oxidizes',
-    'oxocarbon',
-    'oxycraspedon',
-    'oxyrhynchus',
-    'oyugi',
-    'oz/125ml',
-    'ozanam',
-    'ozdemir',
-    'ozolins',
-    'p&aacute;tio',
     'p&lt;0.003',
-    'p&lt;0.004',
-    'p&lt;0.03',
-    'p&lt;0.04',
-    'p&lt;0.05&ndash;0.01',
-    'p(2)',
-    'p(4)',
-    'p(i)',
-    'p(j)',
-    'p-26',
-    'p-end-labelled',
-    'p.102',
-    'p.1127',
-    'p.126',
-    'p.133',
-    'p.16',
     'p.161',
-    'p.163',
-    'p.19',
-    'p.30',
-    'p.38',
-    'p.41',
-    'p.44',
-    'p.45',
-    'p.50',
-    'p.62',
-    'p.67',
-    'p.72',
-    'p.86',
-    'p.89',
-    'p.93',
-    'p.96',
     'p.i.t.',
-    'p.o.w.',
-    'p.p.k.',
-    'p.p.o.w.',
-    'p.y.a.',
-    'p/',
-    'p/20/',
-    'p1*',
-    'p1/lp3',
-    'p1/lp5',
-    'p1/lp6',
-    'p1/t4',
-    'p105',
-    'p112',
-    'p116',
-    'p140',
     'p2/t2',
-    'p2/t5',
-    'p3*',
-    'p3/ns-1/1-ag4.1',
-    'p3/t2',
-    'p3/t3',
-    'p4/t3',
-    'p54/',
-    'p585t7avt2x',
-    'p63',
-    'p69',
-    'p6s',
-    'p76',
-    'p90s',
-    'p=0.002',
-    'p=0.011',
     'p=0.017',
-    'p=0.034',
-    'p=0.038',
-    'p=0.26',
-    'p=0.52',
-    'pachkoria',
-    'pachystomias',
-    'pacings',
-    'pack-years',
-    'packstones',
-    'pad2bend',
-    'paddle-shaped',
-    'paddon',
-    'paddy-fields',
-    'paeonies',
-    'paes',
     'page-boys',
-    'page-long',
-    'page-numbers',
-    'page-three',
-    'paihama',
-    'paint-splattered',
-    'painterliness',
-    'pakdemirli',
-    'paktin',
-    'pal:ype',
-    'pala&tcedil;ul',
-    'palacios',
-    'palaeobotanical',
-    'palaeozoics',
-    'palamine',
-    'palanquin',
     'palanquins',
-    'palantir',
-    'palapas',
-    'palatalization',
-    'palazzos',
-    'paleontological',
-    'palindromic',
-    'paliokrassas',
-    'palios',
-    'pallatine',
-    'pallbearers',
-    'pallett',
-    'pallo',
-    'palm-oil',
-    'palmeira',
-    'palmer-radford',
     'palominos',
-    'paludarium',
-    'pan-americana',
-    'panamena',
-    'panapa',
-    'pancolitis',
-    'pancolonic',
-    'pancreaticobiliary',
-    'panglossian',
-    'pankow',
-    'pannal',
-    'pannenberg',
-    'panners',
-    'panspermic',
-    'panstick',
-    'pantai',
     'pantin',
-    'papally',
-    'paper&mdash;ranges',
-    'paper-clips',
-    'paper-type',
-    'papermakers',
-    'paperworks',
-    'papiamento',
-    'papier-mach&eacute',
-    'papilloma',
-    'pappous',
-    'paquita',
-    'para-medical',
-    'parabear',
-    'parabroteas',
-    'paracelsians',
     'paraesthesia',
-    'paraflocculus',
-    'paraga',
-    'paraiba',
-    'parallelises',
-    'paralogous',
-    'paramammals',
-    'paramecium',
-    'parameres',
-    'parametrization',
-    'paranational',
-    'paraphrasable',
-    'parasitoids',
-    'parchment-like',
-    'pardner',
-    'paregoric',
     'parentally',
-    'pareo',
-    'pargeters',
-    'paris-tours',
-    'park-like',
-    'parker-tweedale',
-    'parkinsonian',
-    'parnas',
-    'parodist',
-    'parrot-like',
-    'parry-jones',
-    'parry-williams',
-    'parsimoniously',
-    'parsippany',
-    'parsonnet',
-    'parterres',
     'participial',
-    'particle-physics',
-    'particularist',
-    'partietal',
-    'partly-clothed',
-    'party-time',
-    'parus',
-    'parviflora',
-    'pas&amacr;i',
-    'pasadenas',
-    'pasi&oacute;n',
-    'pass/fail',
-    'passion-fruit',
-    'passiveness',
-    'passport-size',
-    'past-time',
     'pastellist',
-    'pastern',
-    'pasteurization',
-    'pasturelands',
-    'patcham',
-    'patel/reporting',
-    'pathognomonic',
-    'patricius',
-    'patscherkofel',
-    'patsies',
-    'patteson',
-    'pavin',
-    'pavonis',
-    'pawleyne',
-    'pax_romana',
-    'payment.',
     'paypacket',
-    'pazner',
-    'pc-like',
-    'pd/mvs',
-    'pdl',
-    'pe18',
-    'peace-makings',
-    'pearce-higgins',
-    'pearlberg',
-    'peasant-style',
-    'peasantries',
-    'peat-stained',
-    'pecans',
-    'pectinata',
-    'pectoris',
-    'peddar',
     'pedelty',
-    'pederson',
-    'pedestrian-cycle',
-    'pediculosis',
-    'pedimental',
-    'pedrarias',
-    'peduncles',
-    'pedunculata',
-    'pedy',
-    'peel-back',
-    'peenem&uuml;nde',
-    'pegmatite',
-    'pehin',
-    'peintre',
-    'peko-wallsend',
-    'pelf',
     'pellagra',
-    'pelosi',
-    'penannular',
-    'pencader',
-    'pencilfish',
-    'pendarves',
-    'penders',
-    'penetrometers',
-    'penhale',
-    'penita',
-    'pennano',
-    'pensioned-off',
-    'penstand',
-    'pentachlorophenol',
-    'pentapeptide',
-    'pentimenti',
     'penwortham',
-    'penygroes',
-    'peonage',
-    'peor',
-    'pep-talks',
-    'perambulator',
-    'perceptors',
-    'percy-lancaster',
-    'perdris',
-    'peregrination',
-    'perelini',
-    'perfectible',
-    'perfoliatum',
-    'performance-indicators',
-    'perham',
-    'peri-',
     'periderm',
-    'peridor',
-    'period(s)',
-    'perioperatively',
-    'periphrasis',
-    'peris',
-    'periscopes',
-    'peritas',
-    'peritus',
-    'perjur',
-    'perkier',
-    'perkily',
-    'perla',
-    'perorations',
-    'perpetrates',
-    'perriam',
     'perrysurance',
-    'perseveringly',
-    'persiflage',
-    'perths',
-    'perturbs',
-    'peruses',
-    'pervy',
-    'pestis',
-    'petasites',
-    'petergate',
-    'petersberg',
-    'petherick',
-    'petiolare',
-    'petitionary',
-    'petrofabrics',
-    'petrogenesis',
     'petsos',
-    'pettyway',
-    'pewtall',
-    'pf03',
-    'pf1/2',
-    'pf1/3',
-    'pf1/6',
-    'pfcrn',
-    'pg404',
-    'pgk-',
-    'ph8',
-    'phalaris',
-    'phallocratic',
-    'phalloidin',
-    'pharmacal',
-    'phase-shift',
     'pheasant-tailed',
-    'phekoo',
-    'phenytoin',
-    'philanthropically',
-    'philatelist',
-    'philatelists',
-    'phillsburgh',
-    'philonyms',
-    'philoprogenitive',
-    'philosopher-kings',
-    'phils',
-    'phiri',
-    'phlogopite',
-    'phobics',
-    'phonebase',
-    'phorever',
     'phormiums',
-    'phosphoinositide-derived',
-    'phosphokinase',
-    'photax',
-    'photo-composition',
-    'photo-shoot',
-    'photoconductor',
-    'photodynamic',
-    'photoradiation',
-    'photosetter',
-    'phototubes',
-    'phrase-lengths',
-    'phratries',
-    'phreatic',
-    'phthirus',
-    'phuoc',
     'phusi',
-    'physiocrats',
-    'physiognomic',
-    'phytohaemagglutinin',
-    'pianeta',
-    'pianissimos',
-    'piccalilli',
-    'piccy',
-    'pick-based',
-    'pick-derived',
-    'picoamps',
-    'picp4bend',
-    'picton-howell',
-    'picture-taking',
-    'piddletrenthide',
-    'pied-&agrave;-terre',
     'piedboeuf',
-    'piedmontian',
-    'pieman',
-    'pierceable',
-    'piercement',
-    'pierette',
-    'pierhead',
-    'pierre-elise',
-    'pierre-marie',
-    'piersanti',
-    'pifer',
-    'pig-faced',
-    'pig-out',
-    'pig-tails',
-    'pigafetta',
-    'pigeon-like',
     'pigeon-toed',
-    'pigot',
-    'pigtailed',
-    'pilings',
-    'pilinski',
-    'pilrig',
-    'pinecones',
-    'pinhey',
-    'pink-grey',
-    'pinn',
-    'pinnell',
-    'pinnules',
-    'pinsent/oxford',
-    'piore',
-    'pipefish',
-    'piperno',
     'pipiens',
-    'pippard',
-    'pirnia',
-    'piroshky',
-    'pirrip',
-    'pisolitic',
-    'piss-pot',
-    'piston-powered',
-    'pistou',
-    'pit-props',
-    'pitest.pas',
-    'pitham',
-    'pitheads',
-    'pitiably',
-    'pitreavie',
-    'piu',
     'piven',
-    'pixley',
-    'pixtex/efs',
-    'pizzerias',
-    'pizzetti',
-    'pj7',
-    'pl/1',
-    'place-deictic',
-    'placentals',
-    'placerco',
-    'placers',
-    'placky',
-    'plaimont',
-    'plainfield',
-    'planche',
-    'planet-wide',
     'planetariums',
-    'planetside',
-    'plantae',
-    'plantiff',
-    'plaquette',
-    'plasser',
-    'plassey',
-    'plasticy',
-    'plastiques',
-    'plateglass',
-    'plates.',
-    'platonically',
-    'platting',
-    'plava',
-    'play-groups',
-    'play-pen',
     'play-pens',
-    'playhouses',
-    'playlists',
-    'playscripts',
-    'plcnd',
-    'pleader',
-    'pleasure-giving',
-    'pleasure-seekers',
-    'pledgor',
-    'plh',
-    'plornish',
-    'plot-lines',
-    'plotless',
-    'ploughboy',
-    'plovdiv',
-    'plso.cat',
     'plucker',
-    'plum-like',
-    'plumbed-in',
-    'plumps',
-    'plunderer',
-    'plushness',
-    'pm/kg',
-    'pmmlib.gimmsaf',
-    'po-hsiung',
-    'pobedonostsev',
-    'pochards',
-    'pochettes',
-    'pockets.',
-    'podiceps',
-    'podujevo',
-    'poeticisms',
     'poilus',
-    'point-to-pointers',
-    'points-scorer',
-    'pointwork',
-    'pokin\'',
-    'polarisations',
-    'polarizations',
-    'pole-vaulter',
-    'polebrook',
-    'polegate',
-    'polemically',
-    'policy-relevant',
-    'politenesses',
-    'politically-conscious',
-    'polk',
-    'polkas',
     'pollution-related',
-    'polyacrylamide-urea',
-    'polycythaemia',
-    'polydienes',
-    'polydispersity',
-    'polydrug',
-    'polyether',
-    'polyhedrons',
-    'polymer-solvent',
-    'polymorpha',
-    'polytetrafluoroethylene',
-    'polytonal',
-    'polytrichum',
-    'pomerance',
-    'pomestie',
-    'pompeo',
     'pomposa',
-    'ponderings',
-    'pontifexes',
-    'pontifications',
-    'pontydd',
-    'poorly-maintained',
-    'pop-in',
-    'pop-stars',
-    'popdown',
-    'poperen',
-    'poppei',
-    'poppie',
-    'popularizer',
-    'porceddu',
-    'porcheddu',
-    'poreta',
     'port-related',
-    'portentousness',
-    'portfolio-matrix',
-    'portfolio.',
-    'porthmoina',
-    'portknox',
-    'portlethen',
-    'portpatrick',
-    'portstewart-coleraine-portrush',
-    'portugu&ecirc;s',
-    'poruva',
-    'porvoo',
-    'posadas',
-    'positos',
-    'possessives',
-    'possibilities.',
     'post-1832',
-    'post-accretional',
-    'post-apocalyptic',
-    'post-big',
-    'post-carboniferous',
-    'post-cartesian',
-    'post-civil',
-    'post-coordinate',
-    'post-copular',
-    'post-cued',
-    'post-falklands',
-    'post-feminists',
-    'post-franco',
-    'post-funeral',
-    'post-game',
-    'post-hiroshima',
     'post-infection',
-    'post-keynesian',
-    'post-mixing',
-    'post-natally',
-    'post-nirvana',
-    'post-nuclear',
-    'post-orogenic',
-    'post-professional',
-    'post-redundancy',
-    'post-secondary',
-    'post-solidarity',
-    'post-structuralists',
-    'post-trial',
-    'postance',
-    'postboxes',
-    'postcard-sized',
     'postcode/enumeration',
-    'poster-sized',
-    'postface',
-    'postindustrial',
-    'postlingual',
-    'postnominals',
-    'postoccipital',
-    'postpatent',
-    'postsurgical',
-    'postvocalic',
-    'pot-shots',
-    'potatos',
-    'potboy',
-    'poteau',
-    'pother',
-    'potier',
     'pounds-worth',
-    'pountain',
-    'pousadas',
-    'powell/cheltenham',
-    'power-cuts',
-    'power-law',
-    'power-management',
-    'power-operated',
-    'power-relations',
-    'power-tools',
-    'powerfusion',
-    'powerstations',
-    'powertrain',
-    'pp.20&ndash;1',
-    'ppi',
-    'ppmko-1',
     'pr.3',
-    'pr.3s',
-    'practices/customs',
-    'praetorium',
-    'prafulla',
-    'prandial',
-    'pranger',
-    'prashad',
-    'pratensis',
-    'pratfalls',
-    'pratworth',
-    'prawle',
-    'prayerfulness',
-    'pre-1982',
-    'pre-alpine',
-    'pre-cancerous',
     'pre-car',
-    'pre-cleaned',
-    'pre-drawn',
-    'pre-era',
-    'pre-fab',
-    'pre-fabs',
-    'pre-immune',
-    'pre-islamic',
-    'pre-judge',
-    'pre-legislative',
-    'pre-malignant',
-    'pre-merger',
-    'pre-nasal',
-    'pre-oiled',
-    'pre-olympic',
-    'pre-physical',
     'pre-project',
-    'pre-punched',
-    'pre-qualify',
-    'pre-recession',
-    'pre-record',
-    'pre-schoolers',
-    'pre-sexological',
-    'pre-supposes',
-    'pre-tensioners',
-    'pre-tests',
-    'pre-vocalic',
-    'pre-west',
-    'pre-wimbledon',
-    'pre-wired',
-    'preah',
-    'preattentive',
     'preceptor',
-    'preciseness',
-    'precompilers',
-    'predicatively',
-    'predicatives',
-    'preinitiation',
-    'prejudicially',
-    'premandibular',
-    'premierships',
-    'premio',
-    'premorbid',
-    'prenatally',
-    'preposed',
-    'prepotent',
-    'preprandial',
-    'prepublication',
     'prequalification',
-    'presale',
-    'presbyterie',
-    'presbytis',
-    'prescutum',
-    'presentee',
-    'presentment',
-    'preservations',
-    'presshouse',
-    'pressor',
-    'pressure/volume',
-    'preston-shoot',
-    'presum',
-    'pretor',
-    'prevocational',
-    'priapulids',
     'price-competitive',
-    'price-setting',
-    'priciest',
-    'pricy',
-    'prien',
-    'prigogine',
-    'primaverii',
-    'primogenitus',
-    'primorac',
-    'prina',
-    'princedale',
-    'print.exe',
-    'prinzmetal',
-    'priscus',
-    'pritchard-gordon',
-    'privately-rented',
     'prizzi',
-    'pro-allied',
-    'pro-apartheid',
-    'pro-benzimidazoles',
-    'pro-competitive',
-    'pro-democratic',
-    'pro-family',
-    'pro-formas',
-    'pro-islamic',
-    'pro-kurdish',
-    'pro-regional',
-    'pro-union',
-    'proaggregatory',
-    'prob/11/pcc',
-    'probab',
-    'problematically',
     'proctocolitis',
-    'procuress',
-    'procyclically',
-    'product-oriented',
-    'producteurs',
-    'production-wise',
-    'proenzyme',
-    'profaneness',
-    'profe',
-    'professionnelle',
-    'proficiently',
-    'profundities',
-    'profuturus',
-    'progestogens',
-    'proglacial',
-    'prohibitionist',
     'prolegs',
-    'proliferation.',
-    'proliferations',
-    'prominences',
-    'promises-to-pay',
-    'promotion-chasers',
-    'pronuptia',
-    'prop.',
-    'propate',
-    'property-holders',
-    'propionic',
-    'proselytes',
-    'prosperpoint',
-    'protectionless',
-    'protein.',
-    'protein/ml',
     'protistans',
-    'protocol-independent',
-    'protoplasmic',
-    'protoxins',
-    'proudhon',
-    'proustian',
-    'provence-alpes-c&ocirc;te',
-    'provers',
-    'provie',
-    'provies',
-    'prpsc',
-    'prudential-bache',
-    'pruitt',
-    'pruner',
-    'prynne',
-    'ps/2-30',
     'ps2',
-    'ps2/70',
-    'psephologist',
-    'pseudo-academic',
-    'pseudo-cosmic',
-    'pseudo-historical',
-    'pseudo-random',
-    'pseudo-relations',
-    'pseudomonads',
-    'psiax',
-    'psmy2.6',
-    'psycho-analysts',
-    'psycho-physical',
-    'psychoanalysing',
-    'psychocentrics',
-    'psychogeriatrics',
     'psychoneuroimmunology',
-    'psyker',
-    'pt/',
-    'public-houses',
-    'public-housing',
-    'puckett',
-    'pucnik',
-    'puddephatt',
-    'pudendum',
-    'puerperium',
-    'pugsley',
-    'pulcherimus',
-    'pull-cord',
-    'pulmonarias',
-    'pultrex',
-    'pumpsaint',
     'punchers',
-    'punctilio',
-    'punctiliousness',
-    'punctuational',
-    'punctuations',
-    'pungar',
-    'pupless',
-    'pupped',
-    'puppish',
-    'puranas',
-    'purchasable',
-    'purchaser&mdash;provider',
-    'pure-white',
-    'pure/applied',
-    'purifiers',
-    'purlin',
     'purple-black',
-    'purposiveness',
-    'pursat',
-    'purtill',
-    'pushrod',
-    'pustejovsky',
-    'puting',
-    'putra',
-    'putumayo',
-    'puvai',
-    'puvis',
-    'puzzlers',
-    'pv17',
-    'pvd',
-    'pvm',
-    'pvv',
     'pw2',
-    'pwll',
-    'pwm',
-    'py53.3',
-    'pye-dogs',
-    'pylyshyn',
+)
+
+blocks_26 = (
+    '#%ncier$!g#%raima%#leh$&dieuan$#gie$\'neville#%vines"#vid"&waters#%belle$#urn#)d/bristol%&london%+northampton',
+    '##lem#1man/environmental#"ra#$shot$&trings"%x-bed"(yishness##ton"$zize!&p-long"!t"#x-a!#q/m!.r&uuml;nnhilde"!1',
+    '#(cebridge%$let.$$hial$&kenhoe%%mills#$ddon$\'wardine#&emount##gge##him#&illers$\'n-cells&(specific\'$torm&$tree',
+    '$%swick$\'tenberg#&kevans$!s#$less#(nchester$/denburg-prussia#)ss-topped%,i&egrave;res##uer#%wnier#%yford#)ziliensis"#eac$\'dbasket',
+    '%%knife$&kbeats%&dancer%"ey%#in\'$\'st-milk$)thalysers&#ers#(cciation$#hfa##eks$)ze-blocks#"ga#(itenbach#"ns',
+    '$%targh%"el#$wood"(icked-up%%maker%$wall#!d$$bury$+ge-builders\'\'mounted%%stock#$gach$#den$\'ht-blue&&nesses',
+    '#&htwine#&llient#\'mington$$mell#&ngmann#%ssaud$(tlewhite(#orm%+ol-siddeley#$ther$(tan/race%)en-norman"&oackes$\'d-class+"es',
+    '%&cloths%$mead#$card$&hettes$$kham#%dmann$$ribb$$skys#%ggers#!k#%mbach$#ell$#ich$-pton-on-swale#,nchoalveolar',
+    '$$zers&$work#&okland$!s#$rsen##ssa#+ther/sister#$udie$\'ghshane&.ton-in-furness#(wn-field%&ed-off%$less"+uce-gardyne#"en',
+    '#$ited#$nete$$hart$7t-v&auml;is&auml;l&auml$$yate$$zell#)yce-hoare"$ydie#%mpton#$nulf!"s1!\'t&amp;d""52!\'ubastis#*er-neumann',
+    '#\'keridge$$fast$/ingham-hatfield$\'minster"+dd-pieterse$\'ha-like#-get-conscious#%leigh#$wood#"yn"&ffalos$%etaud&$ings"%glers#"ti',
+    '"\'ll-like$\'etholes$%ishly$#ows#$pitt"%mpier$%ouses"(ndesbahn$#ini"$quoy"%rcher#+gh-le-marsh$\'omaster#"in##kes',
+    '%&ngtons#&niston$\'opfield#\'rington#(seraceae$#tyn#$wick"&shbaby$#ley$$wick#+inessperson#%t-ups"#tai#!o#\'ragueno',
+    '#&yrate/"$vina"&zz-pop!#xa4""c5!&y-gone#%lines#$road#(standers"%dales""e-"$nner"%words \'c&amp;b&!c',
+    '"4eacute;l&egrave;bres"+lsqb;x&rsqb!(\'&egrave!&*ntona!"-1"%could"$gevs"%scope!".1##300##500##700##930"!3"!4',
+    '"$b.c."$c.u."\'elegans"!f""i.$"f.##toh"$j.s."$l.j."$m.e."$p.a.$$v.e.""u.!"/c"!t',
+    '""30""52"$716t!&20:4n6!*57b1/6-wld!#6h6!%:cure!/a-unicenter/125"!2")b-drivers#&inetry#,le-connected"%ceres#(hemaster"\'dential',
+    '"\'elidhes"2f&eacute;-concerts##ard#$frey$!s"#ge.#+nes-sur-mer"%ilaco"%joles"(ke-stand"(l-volair#"c.$,areous-silty$"ic%,um-activated',
+    '#%ibres$!f%&ornica)!e$$gari$&phates#%l-ups$%ed-up$&ington#!o#)protectin##tex$$hrop#$zini"(mberwick',
+    '#)era-shake#%ilien#\'paniles$#ell%%stris$&ground$#ora#(usfearna"%nards%#ian##has#(nibalise%"ch%&esburn#&onbury',
+    '#&talupo$\'onments$\'refmawr#(ute-like##vex#(yon-like"/pacitor-coupled$#ldi#.ital-budgeting\'!/(&output\'$isms%$ulum#&ovilla#(rimulgus',
+    '#%sicum#%uchon"&r-less%#ike#+aj&aacute;s$%mazza#$boys#*cinoidosis\'&matous#$ders$"ie%&nalate%(ological*#sts$#ona',
+    '#%illon#$load%!n#-naud-metalbox$#ega%#iro%"ll##oll%#yne#%parks#*r&eacute;e$)-saunders$#els$%i-med%-ck-on-shannon',
+    '%#les$$ogis$&y-back&#ons##sat$#ten##too#$uana$(s-wilson"\'se-load$!i#%hable#$odex#\'segrain$\'iodorus',
+    '%%lians$(ellanies(%tions&!o$%iella$&lehead$$offs$#rey%$oism"/t-o\'-nine-tails#$/dog#&abolic$&clysms$\'glyphis$#ldo',
+    '\'3uing-in-publication$$mite(!s$&rrhine#/ch-as-catch-can%%iness##eau$%gory.$#ran#$food#\'herines$#ryn#&tiness$+le-stealing\'$wade',
+    '#$ldon##tio"+va&ccedil;o$#gna#+e-paintings$$d-in$%rnosa("um#\'itation"&wnpore!"b7"%s/fox"!v!$cdfg""l4',
+    '"#sce!+d-rom-based"*4-positive#,5r0-positive%*a-positive!%ebada"#del"*ilingwards"#lac$&ndines#%ebren$"st#)larmaster$%block$/obiose/mannitol',
+    '&$oses#"on#%uform"+metery.then"%nnini#(tenaries&#ery$\'imetric&&organs$)rafricain&&lisers\'*ly-imposed%)e-devised\'&parted\'&tapped',
+    '$*uries-long"+phalosporin")ramically#+ebro-spinal((vascular#3ney/gloucestershire#\'tifieds#*uloplasmin#(vicornis"%saris#\'pitosus##ser"$tina"&vennes!&g(aat)',
+    '"+aban-delmas##cin##dor#)etognaths#)in-making$%r-leg%&master#$labi$&decott$%kland$%umeau#)mber-pots$*ps-elysees#*ncelleries$-ge-management',
+    '#%patis$%books$$lets$#tal#/racter-oriented)&isable%#ngo$,coal-grilled%&utiers$(ge-hands&+_d\'affaires$!i$(ringtons$(terparty##tel',
+    '\'"is%%iness"!b".eckconsistency%%stays#)ek-pieces%#ier$&riness\'#gly$(seboards#,f/proprietor#&lation&"or#-mical-weapons$+olitholytic',
+    '#)que-books#(rishable$&nishov$&rykino#&sshire%#man%\'players$,terle-street#%twood#/vauch&eacute;es#%wable$%ed-up$$onki#$ynes#&z_nous',
+    '#%arodo$"sm#\'ckadees#,ef-inspector%(tainship#+ld-friendly%&/adult$&e-peru$&lerton%#ims#+mney-sweeps$(onanthus#%nchen#\'pboards#(sel-like',
+    '"(lamydial#\'idonias#&orines"!n"&oc-bar$"ka$/olate-flavoured#.iseul-gouffier#$kily#-langiographic$+ecystostomy%%resis$*inesterase$%meley#&ndrite',
+    '#%pped.%#ier$%stick#%rdate$\'eartium$$illo%"on##tek##yce$\'jamtsyn"&racian#-istadelphians&$iani&(likeness&$mas-',
+    '\'#ids\'%ogram%\'osphere$&niques$&ustova"(s.800/87"%ucker%\'ing-out#(nky-knit#"pp#(rch-like\'\'wardens&$down$(lishness$$ston',
+    '"#yme!$iche""fe"(gar-case#"gy"%liary".nematographers$&philes##ven",rcle-to-land$!s$(umcincta&(locutory&*navigators"(sternino',
+    '#&ifluor$,zen-soldiers\'"ly#&y-bred$$wide"*vic-minded$-l-engineering&(military$%tatis"!x!"jd!(ladistic$&ograms##ggy#$imer',
+    '#&nfield$$gers$"ks#&p-trap$\'hamites$$otis$(perboard#(rinetist$#rie#(ss-mates\'&embers&\'neutral&(oriented&%rooms%#ism',
+    '",ean-in-place$$rout$$tlam$$vers##its#\'menciae$$mett#)rgy-laity#&verley"$icky#\'entship#\'ff-tops#(macteric$%b-out#.nicopathologic',
+    '$#son#$quey#"st##tic##vus"&mscase"%oacal#(ck-radio%%tower#"dd#&se-cut&\'grained&\'mouthed%#_to%*ly-fitting',
+    '#(th-eared#*udwatchers#&yingly"(ub-mates#(j-napoca#)nies-ross#)tterbucks""vi"!x"#yro!"m1#!7"#aj7"!d""fh',
+    '!-naa-validated!$o-ax#*efficients$&volved#\'factors#\'habitee#)nationals#)optimists#(products#)reference#)seigneurs$*ignatories#&tenant%\'rminous$+ransfection',
+    '"&2-free"(ach-load%%house#\'l-laden%&owners%$pits$"ie$%miner#%mings#+rticulation#$sts."#bak##ban$\'lestone"\'ccoidea',
+    '$"em%#rel#&k-crow$\'chafers$%ernee$#ley$#y\'s"(ddington#*e-breakers$#net#/ing-details-are"&ed-eva$)ucational#$qual"+ffee-breaks',
+    '#!r"(ignetiae#%n-ops$#box$#ers$\'fection"&ked-up"\'lchicus$&loughs#)d-related%(shoulder%%water#/ebrooke-cameron$%ctivo&%omies',
+    '#$inic%!s#*lectivists$$icts&#utt%$near$$udes#0onizaci&oacute;n%"us$%rless$)ur-shaded&&lessly#-umbus-america#$vill#%worth',
+    '#!1#%aneci#&b-like%#out$"as$,er-dundonald$%iners$(ustiveis#%e-ons#$fier#&hairle#\'isiones%#ton#*mand-level\'&o-like',
+    '$$ital$/odity-producing%0n/worcestershire%%tions$\'uniques\'$stes%\'tations#"on##pak%+rtmentalism$\'endiums$+l&egrave;te%,ementarities&#tly$*osite-rate',
+    '%&omiser$+trollership$-ute-intensive\'(r-driven)$like)\'to-unix##set$$port#*t&eacute;s#,uni&oacute;n",ncentratedly*-ion-dependent+"ve%)ptualizes(#ses',
+    '\'$edly\'$inas)!g$#has$(lusions.#\'densers\'"or$%itons$"os$#yle&%omata#(fessedly$.idence-booster\'!r%\'scatory',
+    '&(grations$\'ormally$\'usional#$gest$&ruency##ium#(junctiva%\'rations#(naughton$+ection_with(&vities#*quistadore#*servation.**ve/liberal$,table/thames',
+    '%%ruals\'&ctible*#on.,$ally,#ism."ts*%vists$*ubstantial-$tion%%laris&$ship&*ting-rooms%\'mmating#&tadini%-ins-binary-of',
+    '$(emplatif+#ons%0xt-specification$%inous&2uity/discontinuity$.ra-indications&(ct-based("s.%\'ibutive)%ories%$ols.&+versialists$(umacious#\'vectors%\'rgencia',
+    '"%olbox##man#\'ptation"%pings#"pa$%inger#$ters#&y-plan&(rotected%\'writers$&guards"&ralife##bio#%cuera#*d&oacute;n',
+    '$)y-simpson#(e-mantle##gan#!i$$nian#&kboard#\'n-dolly$%burgh$&elians\'!o$%lands$+wallis-west#%onoid#)poreality#-rectionalists',
+    '$)idor-like%(gibility$%odies&!y%-sion-proofing\'&veness$\'ugation%)ptibility#%setry#"te#$vids"%siest#%medin$\'ic-rays#"t-',
+    '%*minimizing%(reducing$%elloe"&tectic$!l#*ransporter$$ubas#\'ton/35%"$ulda&#int$$sdon#+ncil-funded$-ter-alliances(\'charges)\'ultures',
+    '((ideology((position(\'rumours(&stroke(&tenors\'\'measure\'%panes($oses(\'roposal\'*regulatory)+volutionary%#ley%$ship%*y-district#\'rchevel',
+    '$-se-integrated\'$name$1tenay/oxfordshire%$hill%#ley#$sens#"to"(variates(#ion#%erers"\'wbridge"*x/managing#.on-barringford#.swain/mechanic"$yles',
+    '!$p6.1$!2"!b!\'rablike#*ck-brained%%lines%$sman#(dleboard#&fthole%(smanlike&%woman%\'workers)!s#\'igannet%$muir',
+    '$"na#$yola$&thorne"&eamily$,se-resistant$%tives#)dit-based$$land$!s$-ta/l-rhamnose#)pitations#%ssing$&tacare#0taceous/tertiary%"ns',
+    '#&wmates#+ys-malville"\'icetids$$hlow%)ton-smith$\'ketline#$gman#*me-busting$,inal-justice&\'ologies#"ne$&gletie#$oulo#"po#"se',
+    '$#ten&!r"&oakily#"es##mac#\'p-marks%(spraying#/ss-departmental\'%omain)"ed\'\'ressers&,examinations&%hairs%%bills%$keys',
+    '%$ness#\'tchless#%udace$0sel-robelin-bama#(w\'s-feet$%combe$*d-pleasers%!y$)ther-hunt#%yland"#udo##ets#&isbruk#(nched-up#%stier',
+    '"%yings#"ne#\'pt/hour&&villus%\'ologist#-stallographer!$saba""bm""fs"%lewis""rs"$urka!"tg""rn!\'u-pb-zn',
+    '"$arto"*ban-heeled#%oidal"+curbitaceae"$evas"%lford#)minations#$tist$/uralideological)#sts"#mae##bey"\'ningham#,liffe-lister"(p-a-soup',
+    '#"ll#(riculum.#%sings%$vely#*tained-off$"ea$$hose$*iss-wright#%vatus"%shley".t-out-and-keep#(ting-off"+v&eacute;es#!e$#tte',
+    '"#470"%p/pdc!"wc"&m-parc!#xii"!l!,yanoguttatum"+cloaddition&*racylation%$rama"&negils#&llaith"0priot-registered"-togenetically+#ist',
+    '$+photometric!)zechowska"#irr \'d&amp;r"$flat!#\'66"%abreu#$mico%#tie#\'nnunzio#$osta#%rblay#$spin#\'ubisque$"ge',
+    '#\'vocourt")hauterive"\'oggiono!%(i-c)""n)!"-1"#did"&notice!".2"$a.k.!+/03/25/0001"!a"!f!"15##s12',
+    '!#3ca!!=!$a-da"\'bblings"&chauer#"ko"%daism""ff"%gblad#)gerboards#+vasurengiyn#%worth")habeeyahs"#ies##ley',
+    '##san$&y-like"\'lbergia$"ir#$lara%&s-fort$"ey$%imore#&mation#+ton-on-tees"%masio#$mers#%n-all#"ph$\'ing-off',
+    '&"ls"#nca$\'efloors#%ebury$&sfield#%kness"$ohan"\'ring-do#&kfield$%rooms#(leyensis$!y#(winistic"&sgupta"+ta-oriented',
+    '($name$&centre$$path#%eless"$udet#\'ghterly##lte"/vidson/scotland$\'es-hale$$sian"%y-bed#"al#$side#(trippers!"bd',
+    '"!p"!q"!t!"c3!#d-1!&e-caf\'#+emphasizing#$loan#)selection"%a/cia#)ctivation#)d-looking%%white$#ens%!r',
+    '#*f-and-dumb#(nshanger#$ries$"le"\'batably%%eable$&uchees#(ridement#*t-crippled%&driven$"ee"&c/3000##aff$#gon#(eitfully',
+    '&%rates$\'mber-14$)ptiveness$#rns#&idable$-sion-problems#)lamations%%rator$&ension#(ollement$(mmission%$pile"(dicatees"#ena#(p-bodied',
+    '%\'chested$#ing$$well##rey#%watch"%famer&!s#(ect-free$&ndents#&inites#\'lectors$\'oration%#wer#\'ormable#,ragmentation',
+    '#\'radable\'$tive$*ee/diploma&"s."+humidifiers#\'ydrates"%iniol"0larivi&egrave;re$$tion#\'ectably$%gator$)teriously#)hi-wallah#(iberates$&miters',
+    '##luc#$oney#!s#$ta-t$$oids")magoguery$$nder$$rche#"ba#$erol%!y$$smen#)ilitarise$%sters#\'ocracy.',
+    '#(ystifies"(nchworth#$isov$!z%%ation##nys#"ol$&tative%#ive#-uclearization"*partements#+endentistas$-rsonalisation#&leters#-oliticisation',
+    '#\'recates&&iatory%+ssurisation"-racialization$,dicalization##bs.#)ived-term#,ri&egrave;re$(yanville#"yk"\'s/welsh#7cription/classification#(iccating$.gn/development$#mir',
+    '#(kstation#+mocollinite#&poiler#)quamation##sus#!t$"er$(ructions"(termiend#)hronement"&vasted#)elopement$$nney$$rell#)iationist',
+    '$#lle"&wclaws##itt"$xtra"%yneka""za!$h.90"!1"$anab$#raj##ran"#frs"!i"$obis"$undi',
+    '"%abate$$olus#+chronically#(gnosable\',is/isolation$*rammatical#,lectological,#sts#,mond-studded#%nette$!i"$ball#"by"(chlorvos#*tatorially',
+    '#(geridoos"%e-off##man#,sel/electric"3fference-of-squares()t-looking)-iated-product,#ors)#ly.$%ormis$&usible\'&vities"$gged#(itrapper#(natories',
+    '"-hydrochloride"&latata\'$ions#&lenius#$ston##wyn"1methylnitrosamine#$pfel#%sdale#$wits"&naedta#)ing-rooms#$kies$"ly#\'tenfass',
+    '#%rites#%xides%.n-contaminated$$ygen"&ploids#)somaniacs#&theria")rect-link&!e&(ionality&$ors.$"ly#&igible#&t-poor$)y-looking',
+    '$&nalogy$(ppeared.#(believer#)c-jockeys$(erningly$1ipline-orientated$+ouragements$\'retion.$\'ussion.#-ease-specific$\'mpowers$+nfranchises%#tis$)quilibria#-franchisement',
+    '#&hayloo$(evelment#-illusionments$,ngenuousness#(mantlers%&yingly$\'issable\'$ible#&orient#+persionists$+roportional#(quietude#)ruptively#*satisfiers$!e',
+    '$(ipations$\'ociable%)lutionary+!s$&uasive#)tamycin-a$.inguishability$\'ributer%(ustfully"&tchers%&ingham%$ling#%furth#(hyrambic#"ta',
+    '"\'vismore"$yers!%jebel"&ibrine!#kbs!"lr!&m/svr4"#1.4#!2$!8#&50,000""20$$,000#!8""48',
+    '#!0")em/10%fbs"!h""ix"!p!"nc""tp!\'obhrain##lin#(r&yacute""ci#+umentarists"\'dimeads#%swell"\'e/welsh',
+    '$#kin#!y"&ggy-do#$like"*llar-based&\'ization#+omitisation$"rs#)phin-safe"\'main/os$#tia#&enican$.stically-owned#(inations"&nachie',
+    '$)ld/oxford&!s$*ueschingen#(delinger#$ella##gen#(key-vous##nan%&regina""of##gan#&msters$!y#&rchime$%posts',
+    '##ham#$ians#\'rington#$toir#\'yphoros",s-compatible#"/v"$tard"$uane#*ble-booked\'$head\'\'shelled(&kinned($tops&%space',
+    '"\'velands"$wens#(n-curved%*regulation$\'payment$$wave"$zily!#pts!(ragonish#%iners#)tslingers#%upadi#(wperfect""d2""eg',
+    '&)rehearsal%\'ingroom"(iebergen#%ffill#,ll-indicated#%nk-up%&/drive#)veability"#ole$"ly#*ttningholm#\'ve-ways#$wsed"#ude#+g-resistant',
+    '##kpa#\'mshanbo"\'y-clean#(/treated#%suits!$s/90"!2""hs"&p32(c)!"t1!"ua#(l-action"#bah#%ilier$+ous-looking',
+    '#&hinsky#\'kbilled#&tility"%dding"#fka##ton""gs"&kedoms"*m-a-di-dum#&aagiyn#+bartonshire$%bells##mer#$pier$%sites',
+    '#&canson#%gavel#%heved##ion#$kin\'#)laoghaire$#ins#%nabie$&ington#)stanburgh%#one")plicators#"pa##ree"&raglit',
+    '##den#$ians#$nall#$rani")st-covers",tch-belgians#%schke"%valle"%wayne!$wina!#xc6!\'yeworks#$yard")fed-powys"&kehead',
+    '"%serth#%genic#\'kinesia!%zhaba \'e&amp;p"\'ndash;g!&-khalq""mu!$.cli"$l.r."%m.f.s"$v.a.!"24"!l!"4s',
+    '!$adui"!l#&hflaed"(r-phones#$less$*y-maturing&)victorian#$sdon##tha%#ier%+quake-proof"&segill#&i-stow#"t-$%erday',
+    '$%mount$.wood/thorogood#&yclean"$zy-e!#ban"\'bsworth##utt"\'ionites"!o"&sworth!*c-brokered""2m""4m#!n"$cd-1',
+    '"%ezade"&hinata%\'osperma#\'ography$%lalia"&logite""mm"$ogen##les#"n.$+ometrically"$rins"(todermal$%morph"&u2,000',
+    '$)enicalism!#day"\'dleston"&endale$%tatus"&gecote##ley"%i*net#&bility"#ney"0ucation/industry!)ec-funded""ry!&facoat"#fec',
+    '#\'luences#"ra"#ter!%gford"&g-cups#"er#%inton#$less"%leton!#h12"!i!.ibl-eibesfeldt"$chel$$holz"(ght-pack',
+    '%)eenth-and%(h-minute%%y-odd"%sberg#(teddfods"\'ther-or!*jaculatory!\'kkehard"$lund"\'onomska!(l-essawy"+astic-sided##yne"&bereth"-ectro-optical',
+    '\'0encephalographic\'&magnet)"il(%otive()yographic\'\'n-dense\'/physiologically#\'ment(s)#*phant-like"#fyn"%igius#)minations#"on"%kanah"&legard',
+    '#&ingham$(s/hepper#"os")ongations#!y"\'phbergs""tz"#ute$$ions"#vel"$well!$macs"(bayments#&iricos"\'ergents',
+    '"\'ma-jane#$ison"(ollients#&tively"(ulsifies#"ss!+nantiomeric"(chanters#&omiums#%umber#+yclopaedist")d-gaining$(november$2of-classifications(%ourse',
+    '$\'mically#%oanal$\'cardial$\'genetic$)metriotic$(peroxide$$rser$(skeletal%(ternites$%toxic##pin"+emy/private#*rgy-hungry"*feeblement#%ilade',
+    '"\'gelbert#\'ine-out#&lemere$(ish-like\'\'/french#%rians"(harmonic"%joyer"&lister"$more"%noble"$ochs##doc"*raf-nonius"$sall',
+    '\'(utaneous%+prise-level*-/transferable#&halpic##omb#*rance-hall(%/exit$+e-deux-mers%1preneur-producers$%yists"*umerations!"p."%ergne"+i-classical#\'cardial',
+    '#,fluorescence#\'graphic#)leptiform#%meron#&stemes#(tomising\'$zing&!y")onymously!*qual-sized%(ly-sized$$tive#&ipoise#%uleus!#rbo',
+    '"&denijn")iptychius##tel#"ya"$lund"$mler"$nste"\'osivity"&ratics#&or.log%.s-reported-are&!."#s-2"\'yngiums!#sat',
+    '$%rgots#!h$$aton#$rick%%toire#&ulenta("um"#gob"%naola"\'oterics""p.#$acio$$nola#)erantists#"ie',
+    '""ql"&sendon%#tia$"tt##lin")t-a-laine##ado$)te-agents#%udios!%t.al."%ampes"&eokles#!s"*hanolamine#-nographically',
+    '%!s"#s-1"#u02!,udaemonistic#%emian")genically#\'lossine*!s""ng"(phorbias"*ro-credits%&discus$%clear$+deutschmark$-p&eacute;enne',
+    '%,ean-american&#ens%#ium##wyn#%ydice$&stheus"\'statius!#v45"(allonian$&uated.#(n-thomas$-g&eacute;lico%(elically$+s/wiltshire#&ristus',
+    '$)ly-spaced#,r-dependable%&higher%%loyal%(reliable%\'smaller$#all$\'tonians".il-intentioned$%doers#%ngton#)sceration##tts!#wwf!+x-cambridge',
+    '$$ivil$)olleagues##dec$"pr##ibm#(liberals&$rary#(managers$%irror%"ss#$navy#(patients$&lessey$%ython##red',
+    '$\'outhern#$tech%"st#%union#%wigan$&orkers"(actingly#(nthemata"\'cavates#*eed/xpress$)ptionable&!s#&luded.%\'sive-or#-ommunications',
+    '#(ulpatory""d5"#ec."-hibitionistic$*laratingly"&igible$#uus#%mbank"$ning"(orcizing#)skeletons"\'pectin\'#&laiend#*ort/import$$sers',
+    '"+tensiveness&!o$#rna#)inguishes#+ortionately#\'ra-area&.constitutional(#ver&(familial%+chromosomal%%nodal%,ordinariness%$sure$\'ication!(ye-drops',
+    '$&pieces#%/hand#%lines"&nstone "f%!-&amp;sub1&agr"%pound!#(d)!&---ing"%holes!#.b.$$i.m."&c.i.s.""m."!r',
+    '""s.!%/a-18!%100xp"$35xp!"7+""b+""c+!"95!+a&ccedil;on"$-mas"%arsay"%balis#%ulist$$rden",ce-downwards',
+    '%%packs$%cloth$$lets$$mask#&ilties#(t-sheets$,ionalization$%orize%$tums"%etten"$fnir#$unwa"(igenbaum#)nt-hearts#\'rfields',
+    '("ke#!s#!z"$kery"/lkland/malvinas#\'lenness%"rs$(ing-away#(staffian#$tour"(milistic%)y/friends"*ncifulness#%gdale"*r-southern',
+    '##had#)m-centred%$work$$gate$%land.#&rimond"&scicle(!s&%ulata#+hionability##old#(t-drying$$cash"#t/g#$head',
+    '\'\'of-five&$/son#$tens#$uity"#ulk$+t-resilient"\'vorites#)ret-saada"*yetteville!"dd"!g"%p/prd"!s!5earnley-whittingstall"\'b/march',
+    '$\'uary-25)!6"#der%-al-provincial")e-earners#$bles#)d-through#&lings."&ldmann#)icitously#*low-diners\'&member-!s\'*passengers#$sham',
+    '\'\'to-male#)inisation&&zation"\'ng-chan#+no-scandian"#rae##ens#$gana$%urson##ito#%mions$*or-hesketh##ner$#lea#%reiro',
+    '$"il%"ng$$ucci$(y/oxford%$boat#\'tility."&shbach##tas"\'uduties##rle!,fos-y-mynach"$r1.1$"00$!5#!2',
+    '##3.5$"50#!4#!5$&00,000#!6!%g10sa!)ibre-free$(illating)"or"#chu#%tion.\',/non-fiction"$ddes#%ucial',
+    '%$mice#%seler")fteen-day$)h-formers&%round$\'y/fifty"#g.7"$ledt#,ing-cabinets#&led-up#+odrammatici$#nov#$shin#%thily"$mber',
+    '"\'nalises$.ncial-services#$cham#,ding/marking$"on$$spot#*e-featured%&leaved#)ger-marks\'$nail$%leton#&ialled$)shing-off$"to##kel',
+    '"(onnphort""ps"*re-bellied%\'ravaged$%woman#\'st-tier%%class"&scales$+her-tropsch#\'h-cakes%&kettle%\'packing$$bowl$$like#(t-fights',
+    '#&zallan$%james"*ve-a-sides&%isled%$bone%&dollar%\'pronged%&sailed%(thousand&!o&$rack%(week-old$$/six$$ways"&xating',
+    '!"jm!$l070")ame-proof&(throwers%#ngo$%steed#(t-bladed%$iron$)tened-out&$ries#&utists#\'vescens"*eece-lined$$tham#!r',
+    '#%xuosa")int-based#$xton")ockmaster##gas#(od-gates$\'r-games%%cloth%$ings#$ppy.$%tical#*ristically$%ovsky#%tille#(wer-pots',
+    '&$like$%stone"#ude#$ence##key##nky#(oroscein#*sh-fitting#(tterings"%y-bys!"n.""dr!"oa#)m-flecked"&caccia',
+    '#$us:a"#gel##gin#!h"$ists"&ldback$*ing-carton#$kard$"ie&!s#%lowup"(nsagrive"*od-related%)sensitive&&tained',
+    '#\'t-based$(ball-mad)%sized$$gear$#pad%$edal%\'latemen$%sword"(r-profit#._,_for_example#+aminiferans+!s#\'ceplate#&e-legs$$/aft',
+    '$$hill$+ign-looking(*registered\'\'/second$$part$"ro$)sterships&$land#(gathered$\'etfully$%otton$"ue%!s#\'m-words$+al/informal',
+    '%"t/&$eurs#(nicators#&stmann##tey$(h-coming$*night-long$$uity$\'y-fifth&%third##um."%thaid#$oman"\'ugasses#-ndationalisms',
+    '$)tain-head#$quet#%r-bar%)chambered%&hourly%&leafed%\'seaters&\'toreyed%&to-one&%wenty$%balls$*net-fayard$)th-minute"$well#$lkes',
+    '#$base#"on!.r&oacute;mista",agrantissima("ly#)mpton-cox#%ncesc%!i%)o-belgian$#kby%(enheimer#-ser/wiltshire##ud.%&ulence#(xillians',
+    '"\'eakshow#"d3$!s#+e-flowering&#ree%$will$\'booting$,dom-fighters$%grove#$gean#%irian##jus#%mlins#$nard$-ch-influenced',
+    '\'\'spanish&$gate##ons#\'quency.\'%t-use(\'ly-used##sca$%sange$#ton##win""i.#&edberg$#sen\'$heim#*ghtfulness',
+    '#\'ndsbury$*ton-on-sea#!o#%skies"$oken#%ntals%\'benches%\'iersman#+st-hardened&%prone)"of%$ings"(ugiperda%$vore#\'iterers',
+    '#(tectosus%%scens!"s1"!k!#tbs!&uck-up$#wit"$gazi#%licaa#$uitt"(ll-dress%$fare$\'y-built&&fitted#$ness',
+    '"+n-and-games#*ction/cost##ker#&niness$$ymen",rby/abingdon#&red-up##sey##uta"(se-boxes#\'illades#&tiness!#w15"!d"$uits',
+    '"!h!$yles"#vel -g&acirc;teaux"/eacute;orgiques"$flat"*ndash;fury"\'ouml;tz!$\'n\'r!#(v)!"-d"*registered"$spot!%.a.n."$b.s.',
+    '$"t.!$/100!$4fai!$abin$#ons"!c"&dflies##gil$!y##sby"$ffin"#iah#)thersburg$%skill"$kkai',
+    '#%bally#*d&oacute;s#$eras#&ileans#$lier%"st$#oni##vez"\'megards$#son#&lingay#$mons"%nache#(ciclovir#$gers',
+    '",rage/parking##dam#$gett#)lickhythe#\'mhausen#$nons#%rafad%#tts$#ets&(t/milton$(isonians#%swood"*s-cleaning$*generative##lit',
+    '##sac#\'trinoma%&onomes&*protection%#ula"+te-crashers#1herer/oxfordshire#"os##ton"(uleiters#"me#%nches##tet"$vest#%ottes',
+    '"%yatri##les"#zer!#cms!#dns""ps!)ear-boxes$$less$&stones"#bel"%dding"#e-a$$whiz"%filte""in',
+    '#*senkirchen"&minian"+nder-linked&$less#$e(s)$*alogically$,ralisability%+ous-hearted$2tically-determined#$nadi##syn#,tlemanliness$"oo#)uflection"(omancers',
+    '#!r$#gey%-ian/victorian&"ou#&safari#$team%%xtile#%urgos"(rhardsen#,man-speakers&(/english$"yl##ome#6stmann-str&auml;ussler-1aussler-scheinker',
+    '"(t&dollar#*-up-and-go#%achew#%tings#!z"#ums"!y!"gk!)hanashyam$%ouchi#$ssan"+ettoisation")ibellines"!n"\'ostlike',
+    '#)mbattista#\'nt-eyed")bbs-smith#"ed"&ddy-up"(ftedness"\'gajoule"*j&oacute;n"$lels#&fillan#&lamoor$%banks")mlet-eyed&!s##mie',
+    '#&gerish##tis"%raldi#(lishness#"ma##sby"%sella"%tsham#-tel-plus-nine"\'ustizia!#k-2!#l77"$abra#&cialis%(ological',
+    '#$dwyn#$fcos#%nford$#vil#.sgow/edinburgh$&s-eyed%$less"&enfair$$ties"$ioma#(tterball"%obins##mar$&erulus$#set',
+    '#2ucestershire-based%"s.#&xinias"$u204#*e-sniffers##tei"(yn-neath$"ne##phs!&m06318"!d!%nicia""ps"!s!(o-around',
+    '"$bain#$ryas"&d-send#%/dess#&ardian""la$%secca#\'d-brown%&fields%&nibbed%\'winning$%bergs$*en-fleeced\'&leaved$%haber',
+    '#)f-courses%#mad#\'omshtok$$ngan"*napophysis#"da"+od-mannered%&nights$$lace$$mans$#sir$,win/hereford$#yer##edy"(rbachevs',
+    '#)e-langton#)illa-like#+man/swindon\'$town#"ny"$stly#,udarstvennoi#$wamy$#ell"&teborg#%tardo$+erdammerung$\'fredson#!z"(uld/vale',
+    '#$teev#)vernement"1vernment-approved+(proposed+*sanctioned&&orates""wk"%ymour"%zzett!2p+envam12-babepuro"!r!3r&aacute;g&aacute;s#\'uuml;ne""10"(ab-rails',
+    '#%canin#,de-separated%!/$\'ualists&#nds#)ham-dixon##ils$)n-surplus%%iness#%minea$%scian#)nd-father&(sounding%$addy%$dads',
+    '%&maison$,i&ccaron;ari%\'te-grey$)t-related%$orto#(ph-based%%icacy$&plings#%ssini%$less#%ttans$*uitousness$%wicke#%ubard$&erholz',
+    '$#ies%#lle#$zier",ease-stained%$iest$\'t-great+2-great-grandfather&&uncles%#end%+grandfather##cos#%edier$+n-shuttered&&tinted&)uniformed',
+    '%#ies&%sland%\'landers#)gariously$%ories#\'nvilles#\'ystokes"%icers#&d-like%*referenced#*ffin-heads&)ths-jones#&llsafe#%maldi$#ier',
+    '#\'n\'stone$$drod%&sbrook&%tones#$seus$$hman##vel##zel"$odno#\'ovesome#%pings#%ssart%%holtz#"th#$ughs',
+    '$*p-oriented$%ville"\'uenberg$&somely#&mblers#%ndart$$sell!%sp-21"#vqs!"t1"!h!4uadeloup&eacute;enne#%idbre#)nethidine#)rdchamber',
+    '"%chkov"#dni"$echi#%nelon#$rdon#)st-houses%\'workers")ide-track#\'lsfield#*n&eacute;e$"to#-p&uacute;zcoa#\'raudios")ll-billed"$ndel',
+    '"\'tfreund#$tman"#zel#%zlers!(wersyllt"&illiam"%ladys"%ynnes&"th!#xf4""u3!#yal"\'mkhanas"(psy-like"#ves',
+    '"+eacute;rard"#ngr".ocirc;tel-dieu#&uml;ll!$-how"&series!$.261"!p!%1&deg"!\'"!_!&24/v72"!b!"3\'"!x',
+    '!,57&ndash;597!"6+!)a&iuml;ti"(\'pennies"$bana#\'ibullah"\'chinski#\'mp/6000"&ddocks##n\'t#\'rosaurs",emagglutinin%(tologist$-oglobin/serum"(fizullah',
+    '"*giographic"#iba#$dara#(r-styles$\'streaks$\'y-nosed"#kam""l.#$bert#+f-a-billion&+cknowledged&%fraid&$live%$blue%%child',
+    '\'\'ncealed%&glazed%%hours%&indian&&talian%&lidded\'#nes\'$tres&&owered%#men%&rhymes%)seriously&$ized%%terms&$itle',
+    '%\'written$!e#(ibut.txt#$lier%%ngton#$well",m-and-tomato#&bleden#\'mer-ons&$ings##rin"&nburys#&d-bags\'#sin%$knit',
+    '$\'le-bars$%wheel$%yside#(gar-like#%naway$%emann$(s-martin#(s-martin##ton"$oles"\'rambels#$bert#$cros#0d/hard/easy/very$+est-working',
+    '$+man/swindon$5wicke/gloucestershire#$gate#%ilaos#$lsey#)p-strings#"re$*ies/bishop$.ow-on-the-hill#%sanyi#1t/gloucestershire$$hill$$pury$\'sbourne#0vard-smithsonian',
+    '#$ward$/ood-in-teesdale#(zburgite"&scosay#&parren#(selfeldt#$teds$$ilow"%tcham#&e-mail##tin"$ugen#&ppauge#%sfrau$&torium',
+    '"%waria#!i#(kesworth$%stone".yes-compatible#"ne%!t!"bb"!f!&cl(aq)""oa""tb!"dr!$e(i)"%-goat',
+    '"\'adings.$$lice&#ner$%sails#\'lthfood&%quest&!s&%watch#(rt-beats%*breakingly*!s#&t-loss%$pain$&/speed$\'er/stat',
+    '"%bbian#&raists"$deby"\'edfully#"ks"(gemonial"\'inrichs##res"%lford#&g&ouml$!e#"io%\'centric%%dorus#&lenist',
+    '#$more$%stadt##ton"#mes#*ichordates%%rypts$&zygous#\'mington#&opexin#&pstone#%swell"(n-pecked#$best#*daye-plage##gst',
+    '#$nell#*ri-clement%$ksen"&patics#+es-buffered%)/arginine"&rbacea#$edes#%ioter#"o.$#das$$isms$&n-like#$ries%#ott',
+    '#%tzian#,vey-bathurst#\'xheimer"/seltine/kinnock#(itancies#\'sischer$#ler"-terochromatin&&morphy&\'plasmic&\'stracan&%topic"&uchera#(mensoord"#vey',
+    '$&meters$%ploid"%ycock#$dean!&fc134a!)g&times;s""92!)ibaldstow"(ccoughed$%upped#%kling$"ok"%ebert#\'rapolis$\'ophants',
+    '#\'h-chair%&placed%$rate%$seas%\'tensile$%brook$%class&$iffe$+est-scoring$\'jackers$#ley%,y-productive$&points$$road$$tail',
+    '##man"*ldesheimer#\'ferding#&l-tops$,/oxfordshire$#aby%(ry-jones$%brook$!e%&rsland$&master"&mation".ndu-revivalist#\'terthal"(p-length',
+    '"$rael##mer#\'schmann""s3#$ashi#*tiocytosis$*ochemistry%%risch"&tchell%&ington\'!s#$oshi".v-seronegative#&ed-off$&rneurs',
+    '"\'atyshyn"!p!"o!")-sainteny"%arser"%bnobs"&ckenos"&ddnett#$soll""ge"%hitsu"&lbeach%$rton#%ditch$"up',
+    '%"tt$#ier$#man$%oways&$ings#%mgren#\'stering"%mages#)e-centred&$ured$#/ec$$like$)ownership#%o-ing$%dimer',
+    '$\'geniser$$logs$%phobe\'"ra%(olymeric$!s$(zygosity")ney-sweet%&church##ors%"um#"s."(ofstraat#&k-like$"ey',
+    '##son",pkins-thomas#$lite#%sital"#rae$$tius#%chata#&izonte#(n-glazed$$dale#&rifies$+or-stricken#)se-dealer&$play%%boxes',
+    '#\'tensius#$witz"$sses"&t/cold#"ch%#ing#"on"\'use-boy&\'holders&(servants\'$ized%%carls%1hold-below-stairs%#men&%other',
+    '%%style$$saye"$w-to#%letts"&x/lacz#$d-11!%s.125"$v-tk!\'u-akbar"#bba%\'rd-ford$"ie#$erts")ddlestone#$gell',
+    '"%ertas"$lmes##sby&!s"$main$*n/computer%\'ization#$bles$&ugging#&ongous$&uredly#\'us-rich"(nchbacks#+dred-strong(&weight',
+    '##old#%slets#,ting-grounds"$rals#%idocs#$rell#+st/hereford%)pierpoint")sbandless#&hed-up#"ni#$seys$#ies"&t-like#!a',
+    '$*on-le-hole!#var!#xg4!0yacinth-coloured"$b100#$rida"$dras&#tis$(o-quebec%(colloids&%yanic%\'fluoric*(ocarbons%#ids%(peroxide',
+    '"(per-base%%acute&&lgesia%%boles%\'columns\'(rrection%#fax%0lipoproteinaemia%&mnesia%(parasite&$noea&\'olarize#\'ocausts$\'kinesia$&nymous',
+    '"&un-hui #i-d!".2"!5"&l.e.a.""p.""q."&r.l.r."$t.c.""u.!"/d"#xho!!0!#968!#adb',
+    '"!l"%notta!"b.""fs"*m-motorola#)/motorola$#ssl#!x"!p!$cahn"(e-locked$&skates"\'hneumon"$ings"(onically',
+    '"#pes!*d-impulses"!2",entificatory"&iogram$)matically#%tarod!$e180!&f/when!(gbo-ukwu"*e-mediated"$loos"&natian#$iter#$obly',
+    '""ci""tp!\'jmuiden!%karus!.l&uacute;vatar",-2r-positive#\'quccija""da"$exes"&izarov"*l-attended$\'behaved$\'clothed%*onstructed$\'focused',
+    '$)nourished$&omened$&shaven$*ventilated$&washed#,egally-owned%\'ibility$!s#%fated#&ington))-lackford#$ogic\'\'alities"$sley"\'usiones',
+    '\'(onscious"\'f/world#$eron"+materiality#)emorially$!r#)iseration#&odesty$&veable#-unoadsorption&+cytological&&logist,!s&,pathological.!y',
+    '"&passes&$ible#(eachable$&rially&\'ousness%)meability%!o$)tuousness##hal#)licitness$$oyed#!o$&singly%*sible/very$(undments',
+    '#*ractically!,n&aacute;cio""-1#(betweens#%class"\'actions#(lienably#)udibility",capacitatory)#ies#\'ivility#&luders#&ommode%\'petency$,nclusiveness',
+    '%(testably%(vertible$*rporations#(umbrance")debitatus$\'cencies$&licacy$(pendency$*structibly$*terminable+$tion$.xed-sequential#&igence$)scernible%(sociable',
+    '%0idual/consultant*(s/groups&*sibilities#(o-soviet#+ubitability$&strias")equitably#*xpressibly$,tinguishable"+feasibility$(licitous$%rable%%nally#1ormationssystemes#*raspecific',
+    '#(enuities&\'ousness#.leby-mackenzie$(oriously#%oldby#,res/enhanced#$ulph"&hutani")jectables#$unct$$red."\'kombank#%stand"\'lcuding"#nis',
+    ')"ly)$ness$%vates")oculators&"um"(payments"\'quirers""r1"+satiability#,ensitivities#,ide-forwards\'$left#)olubility##pec&%tion.',
+    '$\'rumatic\'%ents.#)ufflation$*rrectional,$ists"(tendment%\'sifiers$+r-community&(national&$reef()latedness&&statal%,columniation\',nnectiveness\'*rrelations',
+    '\'"lm\'!t%&mezzos&%odels%.nal-combustion($izes\'$tion+$ales&"ee\'$uron%%plays&$oses&*retatively%*sentential%&vallum',
+    '&)iew-rooms%$work#!r$,a-epithelial&&family&(national&+palestinian&&venous($rbal%,generational%&rectal%(specific%(thoracic$#est$#oit',
+    '"$uits"*validation%%uably$(siveness#\'ectives$\'ntively$(rlaidnan%$sive%%tible$*stment-led$(terately#)igilators$&ncibly$#tee#!m',
+    '!&onesco!$psam!.raqi-jordanian""ia#%barne#(sh-owned"&minger",on-porphyrin$$ists$&stones"0radiaci&oacute;n#-egular-shaped$(levances$(sectable#&itancy',
+    '!$s/is##was"#186"#421"$900-"$akov#!o"$dale"#han"(lamicize&&sation&&zation$"y."%o9002#%metry',
+    '".rael/palestine&+i-jordanian(&syrian&!s"%saias$$quah#$oire!%t-was"#_in""ac#*lian-owned%&cising\'"ze##sca"&ca/bbc',
+    '$\'ization!"v+"&anchuk$$ovka$!s"%ersen!&wakura""tc!"x."#ion #j-m"&shaped!%.c.r.$"s.!"39',
+    '#&ouille""ca#/k-of-all-trades$&booted#\'ob/esau"&dallah"$ffar"#ine"\'mborees#"ey#,iat-i-islami"%n/feb#$atha#%eplus#!n',
+    '#&senism$"ky#*uary/march""ra#$dins#(gon-free##ley"$slow#"us"#wad!#bel"!s!$chmt!&ealott#)n-antoine',
+    '"-kyll-and-hyde""ni")opardizes"%remie##ker$%iness#\'ricault$&y-cans#)vis-smith"#ssa$"ey"&t-like#$huth#\'streams"*wel-bright',
+    '!&iangxi"%cnars"!l"%minez"$nhua#"xy!$j.a.!"md""tc!*o&euml;lle"#-jo"%annes")b-starved#&search$$hare',
+    '"%elson"&gpants"\'hn-paul$$ners"\'int-ill"$kin\'"%liffe#!l$#ily$)y-looking"+nes/liberal"#ppa"+rdanian-plo##gan$%ensen',
+    '"\'sceline##efa#(s-sticks",ubert/nivelt#*rdan-barry$&genson$.nal-to-journal#%siffe"\'ylessly!"rs!$tpcs!"ua"(dgement.$)mentalism#*iciousness',
+    '"*gendpflege#"gy"%icily"$ktas"*l&ndash;21#%ianna"&mp-cut(!s"(nketings"&stness$"yn!#ybe \'k&amp;r"\'ocirc;r!!-',
+    '!#.a.""t."$w.s.!"15"!9!"2s!!6!#aba#!i#%usaki#"we"$elin"(foozalem"\'hnawake""is',
+    '$)idoscopes$%mouth##ley"\'malians#%eyama#(pucheans"$naan$$gawa#$erva#"ia"$onde#!s"$ppen#"re"!r',
+    '$%te-do#%domah##ian$)k/numerik#,l-marx-stadt%$otto$$sbad%%horst#.melitsk&aacute#$neia\'!n##ori##ran#(unanidhi#"ya',
+    '#$soma"%tamba#%egaya#%heryn#$orga"$unas""wz""ya!"bq!(calories$!s!"dv!"e3"$asey"#ddy',
+    '%"ss"!i#"ji#"ta"$kova"&lloway#!t",mij&auml;rvi")nchington#$ichi$%lorea#,nett-orpwood#\'speckle"*obounphanh"(rbstones',
+    '$#ick#$stin##win#&yneian"\'szthely"(tanserin"*y-operated$%rings#%cards#$less#%names"$ziah!"fp!#g53"!9',
+    '""hm!$h710"$aida$&rallah##kis##les#"ni"#iam"%ojali##nsu##sla"&reesat"(udiakova!%i.107"$bles',
+    '"%ckoff"4dlington/oxfordshire#%ology"%lborn#$eady$$llan#%lerow$#in\'$&orglin#%morey#%obars$#hms##ton#%varow"#nch',
+    '#\'g-smith$$lets$&shurst%$well)!s$%ussie#%leith#$nell$&ockite#%okuni"$ppah")rklington$%yards#\'riemuir#$sham',
+    '#$tley"$tcat#(e-makers#\'ted-out%$lson$!i"#vas!)jell-arne!$lans#$ssen#$tzky"&einian"#ing$%owska"#ute',
+    '!\'neejerk#!z"#ibb#(fe-sharp"\'obkerry#\'ck-outs#$ebel#&ttiest#)x-johnson!)obenhaven##rin""ca#$urek"%dicek""hr',
+    '#%tobos""ka"&laneci#"ia#$tsov#\'umbegov##yma"#mag$#rov##eda#!i"#nig%%sberg#"no#&ovalov',
+    '"&pensky")rean-made##oma"&shelev##lov#"ta%#las$&omarov".tromani&cacute#!t"$ukou#"se".x2-hybridising"\'zlenkov!"ps',
+    '#%njska$#ner#+szna-krausz#%teros"#eps#&ymborg"*itsanachan"(onenburg#+pivnitskaya#$tkov")uckenberg#)ger-daine!#t17!\'ubismus"#ehn',
+    '"&lishov#!t$(urbesitz"$ndry##kel"0rdish-controlled#$haus#$rein$!r"%tuzov!*wasniewski$$sivi""ei!!z "l%',
+    '",eacute;opold#6grave;se-majest&eacute"\'ndash;r"+ouml;schnak\'"ve!$\'ain#)ngleterre$%tique#$utre"$echo#&nergie$#gle#&spagne$%quire(#iel',
+    '"$urss!&-ka\'da"\'section!&.j.ch."&r.d.g.!!/"!a"*hotteterre!#200"!4!$950s"#60s""92!*a&iacute;n"&_carte',
+    '#*oriousness$*ur-liberal\')relations\'(services"%canau%$ians#)e-frilled$$d-up"(dderback$#ies%!s#%leful#)y-friends$\'friends".fferty/malvern',
+    '#(er-louts#)ganlochan#$rime"\'hnstein"\'ke-side$*daimonians$%field#$hani#"oi"#las#!l#!u"(mbertian$$rook#!m',
+    '$,er/political$+lord/tenant%&ubbers$&masses$!o$(slipping#-e/oxfordshire#%gbank$&cliffe$-uage-impaired((/network#$ning#\'thanide*!s$!z',
+    '"#res#)ge-framed&$size#&k-like#$oque##rau$"ey$%ousse"+scub&eacute#\'er-beam&\'induced&$like&(printers#&pistol)!s',
+    '"+te-lamented&#ife$$ntly#+in-speaking$)tudinally#&timore%$snet"&udably#"nd%%erers#$taro"&w-book$&courts$%suits$&worthy',
+    '"#xmi"&yaways#"ed"%zarev\'(i&cacute#$onby!$b-ft"!g!$c-kc"!k""rc!(ead-acid%&miners)!s$$less',
+    '$&leters#-gue-sponsored#&kproof#$ming#,rner-centred%$ing/#+ther-topped#"va$)e-takings$&isites##zes"$bong"#cce#(herously$$feld',
+    '#!t$2ure-demonstrations"\'dermann#$ward",eds-bradford#\'s/gavin"#f-1#,t-hemisphere%(oriented$*handedness"(g-breaks%#yes$%cuffs##ata%"um',
+    '#"ia#"no##ras#$wear"!h"&iarius#\'nberger##ris#%tdorf"+mmatisation"&ndings#!e$#han#&inists#\'noxtown',
+    '##ska"%onina$%skaja$$tyne#%pardi$(oldville",pidopterists*#ous##ley"\'sieutre#,s-successful%,than-perfect"\'t-downs#(_,_let\'s$%let\'s',
+    '#(t-haines$*er-quality&%bombs"$user#%thold"2va&ccaron;i&cacute#$el-1$\'rington#%insky"$wens"\'ycester!#frs"!v!#ge.!\'iautaud',
+    '#-rary/resource"&chened$&nowsky"%e-ins#%geman"(fe-lines%%rafts%&savers&&tories%%times"&ghtbox%*er-hearted%(ly-raced%$show##num',
+    '"&keably"\'liaceae$&enthal#"li"#mas#\'e-kilns#%onite#$pley"\'nderhof$,str&oslash;m#$e(s)$)-shafting$$d-up$#kar$&widths',
+    '$%leter"&oniser"%pline#&ocalin$%lytic#%pings#%scomb"-quid-junction&$izer""sc$!h#&naskea#&sadell$#ome#%table',
+    '#&eflite$(ralistic*!s\'$ness#(hofacies%%genic#%res/2\'!3\'&minute#)ter-mates$+le-explored\')girl-lost##vac""v.#(e-saving',
+    '#%idity$&ngroom"%za-lu#"ot!)lanbadarn%#edr$&drinio$%gurig$&tarnam$\'ybydder%&mynech"&bertas"\'ewellin""in"!m',
+    '!"m4"!f!%obato#%elias"\'calcall%(ly-owned$-tion-specific#&hmaddy#(ked-room\'"up$&shield#\'omotory"&dgment#"hi"\'eschnak',
+    '#+-hyperbolic$$rank#\'icality&$siel#$jams#&normal#$off\'"%iters"#jze"-ndon-brighton&)/jamaican#%ergan$!y#\'g-hairs%(reaching',
+    '%\'termers%%vowel$%boats$%croft$)er-legged&(/shorter%\'st-ever$\'horsley$%leigh$(shoremen%#ide$$wave#!s"&oniest#\'p-holes',
+    '#+se-bottomed&$knit"+pes-virella##ham"&ranthi#%eburn#\'icariid##rie$)y-drivers%#man"&ssdale#&t-time")tharingia".uvain-la-neuve$(eciennes',
+    '%$lorn$$play$&r-like$#sey##ich")w-ability%%rched%(ttaining$&beamed$#cal#%brows#+er-division&*hemisphere&#off&\'pitched',
+    '$\'st-ever#!i#&liness#$sons"#yne""za$"da!"pd!#rcp#!s!,span.lstrain"!s!#t.-##cdr""pd',
+    '""ba$!c#"os#$rani"#ces#%hembe##kes$#ham#(ratively$$ezia")dgershall#(wigsburg"#ers"%fbery"&ghnasa',
+    '$%nance%\'osities#$pily%$ness"&neburg$$nsis$$ttes"#ong"$peni"%rkers$"ie"$sman"$teum"$vale#$vies',
+    '""yn!#vii!"xi#!x"#xix#%xviii!\'ydbrook(0/gloucestershire##don"$mani#)phoblasts&*epithelial"&nchets#"ds##lea',
+    '"%smata#/ylendopeptidase ,m&aacute;cha#&mp;its&$sup3#\'uml;lar"-eacute;lodies)$nard)$rite"\'ocirc;n".ucirc;nchmeyer!&\'aimes"&daghri"&mselle!#(b)',
+    '!$-16s"%audio"!h"$mean!%.c.c."$phil""v.""w.!"18!"39!+4/wiltshire"-0/oxfordshire!"57!"66!":f',
+    '""\'e"$(ed)"\'bogunje##uni"&calpin$$raig&#nga%#dle#$bean#&cabeus$"hi#,donald/oxfam#-e/oxfordshire$%rlean##fee',
+    '$\'ination&)e-pistols)&rinted\'$guns\'0ry-of-government&!s$#rie#$igno$&lraith##ker$%illop$#ley#$lise#$mach$&ichael',
+    '$#uly%"te#,ro-economics%+econometric#\'taggart%!n#(ulicauda"#den#)onna-like#$rell#!s"&el-isu#$nads#$stra"(fia-like',
+    '$!i#&inness#+netospheres"&hanaim#&lerian##mut"(idenhood#\'er-witt#&ghread##kov#$l-it$#man#\'n-frame$$ardi$&liners',
+    '$%s-fed%%borne#$rtin#+tre_d\'hotel&"ya""j7$"th#,oritarianism"&kashov$%vejev#*e&ndash;up$&-overs"(l&eacute#%agodi$!r',
+    '$%testa$/ysian/singapore#"ca#&e-only$$cela$"me$&stroit#\'ignance$#ndi#"ky##lin#%swick"&malian##man"%n-boy',
+    '%%ungry$(readable#0agement/employee&#r/x#\'ceville$$hego$$ozeb#%dalas$&ragora##ias$#ero#"ko##lin#&orbier$&uevres',
+    '##q34#%sbach$\'ervants#(tra-like&"ps#.ually-operated#*y-breasted"&pleton%!y"*r&ndash;26#%acana$#hau$&thoner$&villas$$zion',
+    '$-h&ndash;april%"-2%$pane$"in#%dones##eth%!t#"fa#)ginalizes&#son##ich$/e-ang&egrave;le&"jo&%laure&5th&eacute;r&egrave;se',
+    '#)k-houwink$%ed-up%)t-seeking&(/product$$inch$#ova#$nell#$oony#&quesas&\'tarians#"ra$%iotts#$scal$&hbrook#)tin-jones',
+    '$#ock##vyn##wat#"ya"&scaras$+hinenfabrik$)ie-taylor$/uline-dominated(.ity/femininity#&singer#$taba$#ics"*t&ecaron;j#%-like#$alin',
+    '#,erialisation)#zes%&nalist$"us#(hematica#&ildine#*riculating%*x-isolated#&sunaga%#ura#%thaei$$lock##yas")ude-roxby#"nd',
+    '#%repas$"us##ses##ves"$vica"\'wkishly#)ulikplimi"\'ximiser#)well-fyfe"*y&ndash;12*!5*$june##-25##ell#$lett',
+    '#(or-elect#%poles"$zdah#&e-like##ilu#$uria#$zola%#tta!%batha"!l"&onimpa"!r!$c200"!5"\'anerney',
+    '#%irney#$riar"&carney%%rison$%ughan$$wley#&hicken#\'lintoch##omb$%naghy%$chie%#nel$#osh$\'rriston"&daniel',
+    '#%oodle#%ugald"&enhill$#tee"(fetridge"%g3500#%affin#%innis#$loin#%ookin$#wen#%rugan#%uires"&hargue"\'illvoil',
+    '#%nstry"$kays#%eegan$#ich$\'rracher"%larty$%tchie$&uchlan$!y#*eod-wright"&mullin$$rtry"%narry#%eilly%"sh',
+    '#&uggets"%peake#\'hillips"&quaker%!y$%ilken"!r#&oberts""sp$%adden"\'tiernan"!v!#dst!(eadhaven$%ville',
+    '#$ness$#ies$$s_of$$wood#$sach"\'chanise"+dal-winners%"la$(u-schule#)iaevalist%!s%$tely$$cale%/o-psychological&!s',
+    '\'#ors%-erranean-dead$%um-to)&-large&%istic$$well#$lars"%ekest"(ga-bucks$)lomaniacs$&rectum$\'stardom#&istias#$rahi$"ez',
+    '"$knes"(lanistic#!e#$lows$%stock#%merby#%nikov#$tzer##vil"#mba$,er-countries&(/members#&oirist$(rialists",n-about-town',
+    '#\'deleyev&#ism$!i%%cants#+i&ntilde;as#"ro#\'yanthes"%owing",phostophilis"#ran#\'captans\'(oethanol$(enaries.%&rsburg$+hantibility',
+    '#%ewalh#&itless#%ligen$#ons$\'yn-rees##ope#!r$$iest#%ville"$sake#&embria#\'odermal$)potamians#\'sage(s)$#ham',
+    '#*a-analytic$(botropic$(chronous$\'l-bound%%smith%&worker$&pontum#-hanol:glacial$,ylation-free&$dopa#\'re-long$$opol(%itans#\'tlesome"%val11',
+    '"+zzo_soprano!%faume"!g!)g&times;6"#/1.##kg/"$m/ua!&ianded$!o#&smatic"\'caceous#&klemas#.ro-foundations&%scale&*technology',
+    '%,densitometer%)electrode%$file&%ossil%(invasive%%metre%&nesian&(utrients%&plates&(olitical&\'rograms%%scale&&pheres&%witch%$tome',
+    '%$890s%#982$$20th$#and%%utumn$%brain$(cheshire$(festival%&ielder$(latitude$#mar$\'session%%urrey&$ssex$$word',
+    '#%shire""ei"&ght_as%"en&"st#"ne"%khayl#"io#$olaj"2l&aacute&ccaron;ku#(an-based#&e-high$\'ometers#\'itarize\'+y-technical',
+    '#\'l-races$#ars$%board%#urn$$cote$*er/manager%#tti$&fields$&imoles$\'masters#$ovan#$utin"*nd-control%$like%)wandering',
+    '$%rvois$(sweeping$!y#"ge#(i-meadow%\'revival$+aturization$)cassettes%.holecystectomy$&fundia$(malistic*!s$$prep(\'aration%$umps',
+    '$6ster-without-portfolio&"re\'!i%,upercomputer#\'k-lined#%oprio$\'rities.#+t-flavoured$!z"(rabilite#&saidov#%thful",s-management$-specification%(tatement',
+    '#&:press#(alliance#(construe#*e-en-scene#%hakov##lip#\'ogynism#)placement#.representative#"to"#tan#*bestimmung#(cheldean\'#son#)re-shaped',
+    '$\'opoulos"&zzards!"k7!$l/15#!d"!1"#oo9!%m-hmm""e."%ol/24%#day!$n/m2""lf"!s!"o1',
+    '""bb#\'ilities")ck-gothic%(medieval"$d-by#"an#-el-calculated$$racy%)n-looking\'&minded&%isers$*stly-sized"&erheim"\'hammedi#$nyin',
+    '"\'lchanov#(licomata%%ssima#\'omjamts#!s""ms".n&eacute;taire#&adnock$&rchial$%stici$%tomic$$zite#"ch#)ey-makers&(spinners',
+    '("se%$less#&gering##ico#&k-like$%shood#%obloc(!k$\'clonals%%yclic$%genic$%mania$%plank%+olistically$%rails',
+    '%+yllabically$\'theists\'$rapy#&soonal#$tale%"no$\'e-carlo$\'fortian$\'golfier&0mery-massingberd#*umentalise")od-swings#&nboots#*re/hampton$)ing-ropes',
+    '$#men"#pti"$rans#%ellet%"os$+t-sur-loing%;on-in-marsh/gloucestershire#"ic#$maer#"ni#$oney\'!s#\'ph-plus#*ris/driver&%onian',
+    '#$tage$"es$,gage-holders$&uaries%"is##ula"&schata#%quera%,ito-infested#%sgiel"\'th-like$*er-fuckers&)/daughter#)or-launch%&/drive',
+    '$$yama#\'soaledi##tet$&isfont"%uawad##nsa$)tain-tops%&stuart#"ra#+se-coloured$\'tachios##tsa"$yser!-p/cirencester#&former',
+    '"$e/xl""vs!0s-dos-compatible&(/windows"#082"!b"#up3!$t/pa!#ua0")ch-missed%(rumoured$!e$$ness#%inous"\'d-brown',
+    '#$dier")eyyedzade#%zzins")gen-honda""id##ndi"%kwala"/lberry-coloured#%ieres$"ro#(laittivu$%erian#)ti-annual&)barrelled&&celled',
+    '&,generational&$lane&$mode&&player\'\'ortions&(storeyed&\'vehicle%\'company\'"py%&ethnic%%flora%$gene%+lateralists%$mers%/ply-handicapped',
+    '##vie"(m-in-law".nicipalisation#&roists#$tzer"$rata#$lens#%teira"#sca$+le-specific#%elier#-ic-historical%(assettes%*o-dramatic##oca',
+    '##tad%#ine%+rd-plasters$#ela"(tafchiev$\'genized##ism#$uals"#zio!#vga!*yelination#"ni"$kura"\'lonites"\'oclonic',
+    '#)filaments#%genic\'!n")ringotomy$)stylation##tos"#son"%xazin .n-acetyl-5-asa(+transferase"$sure!\'.a.t.o."&c.m.a."$e.a.""f.',
+    '!!0!#240#!1!#400!%9837a!#=27#!9""32""40""72!%aamen""bo""dd#%ezhda"%evius',
+    '"*gelmackers#"ra##uib"#hat#!r"$iler#$vity"&kahira".me&lsqb;s&rsqb$\'-plates$$code"+nocomposite%%uries"\'poleons"(rcolepsy',
+    '#"ky#+ratological#+v&aacute;ez"-sogastrically$\'pharynx"%tchez#1ional-territorial#(uralizes%)e-culture"$vada#"ed#$iede#!s"$xian"\'zianzus',
+    '!)coi-ecori!$dalu""ei",indiliyimana"!m!%ealle#,r-continuous%(derelict%)identical%*miraculous%)nakedness%\'poverty$&ly-new"(cessaire#%heaev',
+    '$$less&!t#$tars"&dc/msc"&fertum""g.##ara#,lig&eacute;e#$rine$\'ophobic"&hemlis#)ru-gandhi"-ighbourhoods."#lis"%m_con',
+    '#%butal#$ours"/o-conservatives$(dadaists$(freudian#(cortical#%mycin#\'pallial"+phrological"\'rchinsk#$itic##nst#,vous-looking"$sdis##san',
+    '#\'t-boxes"\'t-armed#"as##ful#(herallan&#ley#(tlecombe"\'ubauten#+roanatomist%)biologist%\'pathies%%toxin"(valainen"&w-laid$$made',
+    '#(ly-baked&+refurbished&#won#\'manites&!n$%ill-1&"ns#"ne#\'s-based%&hungry#\'tonians!$fr90!#ges")ulinzaira!#han',
+    '"$1000"%achos#0gara-on-the-lake"%blick"#cci#*keliferous$#les$&naming$#son"#dus"(erenberg"*gerian-led#*ht-clothes&%dress&&lights',
+    '&(watchmen\'%orker%%scape"$hell"$knam#)olayevich"&lsonne""nd#\'e-carat&&ountry%%track$#tee\'*n-eighteen)\'forties%(y-minute',
+    '"%valis"(yibigira"$zhni&!y!$lsls!.mol/h/&micro;g!\'o-holds#$load"#.18$!9#"22"!5""ar"#bes"&isette',
+    '"2n&ndash;compliance#)-absolute%(cademics&$tion(%vated\'#ors%\'ffluent%)llergenic*"ic%\'pproval*"ed%&queous$-biodegradable%$ooks%*ureaucrats',
+    '$)canonical&$rers%)haritable%#ics%\'olonial&&mmital(\'utative&\'nsumers%*rystalline$\'dancers%(elegable\'\'iberate&*preciation%&ipolar%&octors',
+    '&$ying$\'earning%-cclesiastical&(onomists%\'lectric%&nvious%)xaminable&(haustive&&plicit\'\'ressive$+fluorescent$+grammatical$+homogeneous$&immune%(ntending',
+    '&(vestment\'%olved%\'talians$\'kinsmen$*legalistic%)iterature$)marketing%%obile&&nastic\'(etarized$&neural%"hs$$oily%\'perated&%timal',
+    '$(patrials%\'edigree&(rmissive\'\'sistent($onal%.harmacological&+ysiological%&layers%%oetic%(ractical&*eferential&(ivileged&*ofitmaking%)ublishing&\'rposive',
+    '$*ratepayers%#eal&)coverable&&gional&\'porting\'-resentational%\'igorous%%unner$)scheduled%\'easonal&"lf&#rbs%)ocialists((ological%*pecialised',
+    '%\'tarters$$trem$$unit$(vascular%$elar%%isual$\'windows%&orkers#-deterministic#(feasance#!g$$khai#&manual#)political$+rofessional',
+    '"%rdale#-m-enforcement#.th-east-facing%&brooks%)eastwards%&fields%%leach%%point$#man#&vegica"\'se-high"%t-men$)so-bright\'&famous\'$good',
+    '#)e-perfect$!c$#man#\'hing_at#&izario#&ochord"$usts#*veau-riche"%varum$"to#$orum"#w\'t#*-notorious$(vanished!"r.',
+    '!"tl!(ucleolar&%somes""dd"$enen#$stra")mberpower#"en$&rators%%osity"#nez"&ssberg"&tcases#%field#%house',
+    '#!u!"vp"$unda!"wl!"xn!%yahwa"!i")mphomania *o&amp;sub5!&\'clery#&onnors"#dea$#lls#%onald"%flynn',
+    '!"-o!!/""55"!a!)ak-beamed""nh!)beisances#*rfeldwebel$*stleutnant"(fuscates",ject-centred\'$like&%ives."%lasti$$tion',
+    '#(igation.\'!o$\'viously"#ras#$echt$#ras")scuration#+equiousness$&rvably##tat$+ructiveness&$ents")trusively!)ccasions.#\'lusions',
+    '"\'eanside"$hils#+re-coloured%#ous"%t-3/4#%anoic#&opodes$(syllabic"$ulus!+dd-sounding"%eneal")ling-smee"\'ometers#+ntodactylus!*economicus',
+    '!-f_,_of_course#!a"\'f-board%%reaks$\'setting%\'pinners$)the-books#&enburg$\'rtorium#&iciant#$spin%%rings#%takes!&garkov#"wa',
+    '"#ons!$hmic!\'ib-like"\'l-bound%&urners$&soaked#$/gas#$bars$#ird\'!s##can!%jukwu!)keechobee"%tober!%ld\'un',
+    '#$ness#$rich#$ster"(eographs$"yl""in"$mecs"+ympic-sized!(mbersley"%ega-6#$ntum".icron&amp;sup2#$nami#&ssible%"us',
+    '"*ni-bearing$$vore"\'omyidae!)nce-daily$"rs#&ophora"#dra##yne"\'e-china$&dollar$(fiftieth%#old&$urth$\'in-four$(phase.on',
+    '$\'sidedly$(thousand,"th#"/2$$6000#!r")ion-domed""na"$time"&wards.!#ort"&sd/c++!"p\'"\'acities#(lescence',
+    '$#/36%%image#/rationalization&&orship"(hiolitic&&ogimus"#pon"!r"%tonic"$ulus!%r/and"#als#\'ngutans#"re"$bats',
+    '"*chestrally)%tions"\'derable#&inator"$gady$*ngymnastik%+ophosphates,$orus"$iels%#ton#%ganum".l&eacute;anist"(namenter"&phange")thodontic',
+    '%(pyroxene!$s/32#"vs"+cilloscopes"#hun"(iatynski""ma$#nia#&ometry$&therly%&ically"-sand&oacute;n#"io")teopathic%(stracans',
+    '"%waldo!&talgia"(c-traded"#ero"&her(s)%+worldliness",olaryngology#%scopy!$udin"%eddei#!n"#jda"(t-county$%group$$haul',
+    '\'%print#)_,_out_of#&boards#%caste$\'lassing#(distance#&ersole#&jumped#%liner#\'numbers##red$#uns#%speed$&winger#-ward-pointing',
+    '!\'vensman#%r-75s%\'anxiety%\'careful&)ommitment()pensation*&titive)#lex%+elaboration&/nthusiastically%\'fifties&#ond\'%rties%\'hastily&$eavy',
+    '%$loud%&ornate%(powerful&(roducing%%rapid&\'eactive(&diness&#ich%&seeing\')ntimental%%tunic$(activity%&nxious%"we$$beat',
+    '%,onscientious$*dependence%#oes$+emphasizing%(xpansion$&fields$(generous$%layer$\'playing&"us%)rotection$%rules$/simplifications%(tressing$)thrusting',
+    '!.wner-occupants%(/manager"#ona!"x5"!7"&idizes"\'ocarbon"*ycraspedon#(rhynchus!$yugi!\'z/125ml"$anam"%demir"%olins ,p&aacute;tio',
+    ')!4(!3(!4(,5&ndash;0.01!#(2)""4)""i)""j)!#-26",end-labelled!$.102##127#"26#"33#!6',
+    '$!3#!9""30#!8""41#!4#!5""50""62#!7""72""86#!9""93#!6',
+    '"$o.w."$p.k.$$o.w."$y.a.!!/"#20/!"1*"$/lp3%!5%!6#"t4""05""12#!6""40',
+    '$!5!"3*"-/ns-1/1-ag4.1#"t2$!3!$4/t3!#54/")85t7avt2x!"63"!9"!s!"76!#90s!&=0.002%"11',
+    '%"34&!8$"26$"52!(achkoria$(ystomias#$ings#\'k-years$&stones"&d2bend#*dle-shaped$"on$(y-fields"&eonies#!s',
+    '%$long%\'numbers%%three"%ihama#-nt-splattered%(erliness"(kdemirli##tin"%l:ype#+a&tcedil;ul$$cios$+eobotanical&%zoics$$mine$%nquin',
+    '%#tir$#pas$*talization$$zzos#,eontological#(indromic$(okrassas%!s#&latine$\'bearers$#ett$!o#%m-oil$$eira%)r-radford',
+    '#\'udarium"+n-americana#%amena$"pa#\'colitis&$onic$.reaticobiliary#(glossian##kow##nal$&enberg%"rs#\'spermic$$tick##tai',
+    '"%pally#/er&mdash;ranges%&-clips&$type%&makers%%works#\'iamento$.er-mach&eacute$%lloma#$pous"%quita"*ra-medical$$bear%&roteas$(celsians',
+    '$)flocculus$"ga$#iba$(llelises%%ogous$\'mammals%%ecium&#res&)trization$(national$)phrasable$\'sitoids#+chment-like#$dner#&egoric',
+    '$!o#&geters#(is-tours#&k-like$+er-tweedale$(insonian##nas#%odist#(rot-like$\'y-jones&(williams#+simoniously%%ppany$%onnet#&terres',
+    '&*le-physics&\'ularist%$etal$*ly-clothed$&y-time#"us#\'viflora")s&amacr;i#&adenas#*i&oacute;n#&s/fail$)ion-fruit%&veness$)port-size#&t-time',
+    '%"rn%)urization$(urelands"%tcham#,el/reporting#*hognomonic#&ricius#*scherkofel$#ies#%teson"#vin#$onis"&wleyne"(x_romana"&yment.',
+    '"$zner!&c-like!%d/mvs"!l!#e18"+ace-makings#+rce-higgins$%lberg#*sant-style\'$ries#)t-stained"$cans#&tinata$$oris"$ddar',
+    '$$rson$,strian-cycle#(iculosis$&mental#&rarias#&uncles&%ulata#!y"\'el-back#,nem&uuml;nde"\'gmatite"#hin"%intre"+ko-wallsend""lf',
+    '##osi"(nannular#%cader$&ilfish#&darves$#ers#*etrometers#$hale##ita#$nano#*sioned-off$$tand#.tachlorophenol%\'peptide$&imenti',
+    '#&ygroes"%onage#!r"\'p-talks"*rambulator#\'ceptors$+y-lancaster#$dris#*egrination$$lini#(fectible$\'oliatum%1rmance-indicators##ham#"i-',
+    '%"or$%od(s)%*peratively$\'phrasis$!s%%copes$#tas%"us##jur#$kier%"ly#"la#(orations#(petrates#$riam',
+    '#*severingly$&iflage##ths$$urbs#$uses#"vy"$stis"\'tasites#&ergate%%sberg#&herick#&iolare$\'tionary#)rofabrics%\'genesis',
+    '#%tyway"%wtall!#f03"#1/2$!3$!6"#crn!$g404""k-!"h8"&alaris$(locratic&$idin#&rmacal#(se-shift',
+    '##koo#&nytoin"/ilanthropically%&telist+!s$\'lsburgh$%onyms%+progenitive%,sopher-kings$!s#"ri"(logopite"%obics#&nebase#%rever',
+    '#5sphoinositide-derived\'&kinase##tax$-o-composition&%shoot%)conductor%\'dynamic%)radiation%&setter%%tubes",rase-lengths$%tries#%eatic"&thirus"#uoc',
+    '")ysiocrats&&gnomic#0tohaemagglutinin!&ianeta$\'issimos"(ccalilli$!y#\'k-based%\'derived#%oamps#&p4bend#*ton-howell$*ure-taking"-ddletrenthide"1ed-&agrave;-terre',
+    '$\'montian##man#\'rceable&$ment$$ette$$head$(re-elise\'%marie$%santi"#fer"\'g-faced$#out$%tails#&afetta#(eon-like',
+    '#"ot#&tailed"%lings%#ski##rig"\'necones##hey#&k-grey#!n$#ell$$ules#+sent/oxford"#ore"&pefish$#rno',
+    '#$pard"$rnia#%oshky##rip"\'solitic#%s-pot#+ton-powered%!u"\'t-props#\'est.pas##ham$$eads#%iably#&reavie"!u',
+    '"$xley#\'tex/efs"\'zzerias%#tti!"j7!#l/1"+ace-deictic%%ntals%#rco&!s$"ky#%imont$&nfield#$nche$\'et-wide',
+    '&$side$#tae%#iff#&quette#$sser&!y$$ticy&$ques#\'teglass%"s.$(onically$$ting#"va#(y-groups%#pen',
+    '$&houses$%lists$\'scripts"#cnd"%eader$+sure-giving)\'seekers#$dgor"!h"&ornish#\'t-lines$$less#&ughboy#$vdiv"&so.cat',
+    '#&m-like$&bed-in$"ps#&nderer#&shness!$m/kg",mlib.gimmsaf!(o-hsiung"+bedonostsev"&chards$%ettes#%kets."&diceps#%ujevo"(eticisms',
+    '#.nt-to-pointers%(s-scorer%$work"$kin\'"+larisations&\'zations#)e-vaulter$%brook$$gate$\'mically#,icy-relevant$(tenesses%0ically-conscious#!k$"as',
+    '#0yacrylamide-urea$)cythaemia$&dienes&(spersity%#rug$%ether$\'hedrons$+mer-solvent%%orpha$3tetrafluoroethylene%$onal%&richum"\'merance$$stie##peo',
+    '"(nderings#\'tifexes&(ications$#ydd"/orly-maintained"$p-in$%stars#$down#$eren##pei$"ie#(ularizer"&rceddu$%heddu##eta',
+    '$*entousness$,folio-matrix)!.$&hmoina$$knox$&lethen$\'patrick$:stewart-coleraine-portrush$+ugu&ecirc;s##uva##voo"%sadas#$itos#(sessives$*ibilities.',
+    '%+accretional&*pocalyptic%#big%-carboniferous(&tesian&$ivil&)oordinate\'%pular&#ued%)falklands&(eminists&%ranco&&uneral%$game%)hiroshima',
+    '%)keynesian%&mixing%\'natally&&irvana&&uclear%(orogenic%,professional%*redundancy%)secondary&)olidarity&-tructuralists%%trial$$ance$%boxes$*card-sized',
+    '$(er-sized$$face$*industrial$\'lingual$(nominals$)occipital$&patent$(surgical$\'vocalic"\'t-shots#$atos##boy##eau##her##ier',
+    '$$tain#%sadas"/well/cheltenham$&r-cuts&#law&*management&(operated&)relations&%tools%&fusion%(stations%%train!,p.20&ndash;1"!i"%mko-1',
+    '$!s"/actices/customs#\'etorium#%fulla#%ndial$#ger#$shad#&tensis$%falls$%worth##wle#*yerfulness"&e-1982$&alpine$)cancerous',
+    '%&leaned$%drawn$#era$#fab\'!s$&immune%&slamic$%judge$+legislative$)malignant%%erger$%nasal$%oiled%&lympic$(physical',
+    '%&unched$\'qualify$)recession\'#ord$)schoolers%*exological%\'upposes$*tensioners&#sts$\'vocalic$$west%(imbledon&#red#"ah$(ttentive',
+    '$\'iseness$(ompilers#*dicatively+!s#*initiation#*judicially#*mandibular$(ierships%!o$%orbid#\'natally#%posed%$tent$\'randial$*ublication',
+    '#$sale$\'byterie\'"is$%cutum$%entee\'$ment%(rvations$&shouse%"or%*ure/volume$)ton-shoot$"um##tor#*vocational"(iapulids',
+    '&\'setting$$iest$!y#"en#&gogine#\'maverii$(ogenitus%#rac#"na$&cedale$%t.exe$&zmetal#$scus#-tchard-gordon#-vately-rented',
+    '"(o-allied%(partheid$.benzimidazoles$+competitive$*democratic$&family%%ormas$\'islamic$\'kurdish$(regional$%union#+aggregatory#(b/11/pcc$"ab$+lematically',
+    '$%uress$)yclically#-duct-oriented\'$eurs\'(ion-wise#&enzyme#(faneness$!e%*ssionnelle$(iciently$(undities%%turus#)gestogens$&lacial#+hibitionist',
+    '$*iferation.-!s#(minences%*ses-to-pay$-otion-chasers#&nuptia#"p.$#ate$,erty-holders$%ionic#\'selytes$(perpoint#+tectionless%#in.\'#/ml',
+    '$0ocol-independent%\'plasmic%$xins#%udhon$%stian#6vence-alpes-c&ocirc;te%"rs$"ie&!s"#psc".udential-bache##itt##ner"$ynne!&s/2-30',
+    '##/70"*ephologist#,udo-academic\'&cosmic\'*historical\'&random((elations&&monads"#iax"%my2.6"-ycho-analysts\'(physical&)analysing&(centrics&*geriatrics',
+    '##ker!"t/!,ublic-houses+#ing"%ckett##nik"(ddephatt#%endum"(erperium"%gsley")lcherimus#&l-cord#(monarias#$trex"\'mpsaint',
+    '$%tilio)&usness%(uational+!s##gar"%pless##ped$#ish"%ranas#(chasable\'1er&mdash;provider#\'e-white$(/applied#&ifiers##lin',
+    '$)osiveness##sat#$till"%shrod#(tejovsky"$ting#"ra#%umayo"#vai#"is"&zzlers!#v17"!d"!m"!v',
+    '""ll"!m!%y53.3"&e-dogs"&lyshyn \'zygotes',
 )
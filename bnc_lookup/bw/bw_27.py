@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_27 = (
+count_27 = 6694
+
+heads_27 = (
     '&agr;-256',
-    '&agr;-amanitin',
-    '&agr;-subunits',
-    '&amp;a',
-    '&amp;control',
-    '&amp;johnson',
-    '&amp;mcmanus',
-    '&amp;o',
-    '&amp;pettijohn',
-    '&amp;plus',
-    '&amp;pray',
-    '&amp;q',
-    '&amp;ring',
-    '&amp;sup214',
-    '&amp;t',
-    '&aring;berg',
     '&aring;d',
-    '&aring;ngstr&ouml;ms',
-    '&bgr;-carotene',
-    '&bgr;-cell',
-    '&bsol;lite&bsol;pcprobe&bsol*',
-    '&ccedil;ift',
-    '&commat;echo',
-    '&deg;n',
-    '&dgr&ngr',
-    '&dgr&rgr',
-    '&dgr;-endotoxins',
-    '&dgr;c',
-    '&dgr;l',
-    '&dgr;w',
-    '&dollar;0.43',
-    '&dollar;0.44',
     '&dollar;0.48',
-    '&dollar;0.49',
-    '&dollar;0.51',
-    '&dollar;0.63',
-    '&dollar;0.66',
-    '&dollar;0.67',
-    '&dollar;0.81',
-    '&dollar;0.86',
-    '&dollar;1,130',
-    '&dollar;1,200m',
-    '&dollar;1,350',
-    '&dollar;1,480m',
-    '&dollar;1,750',
-    '&dollar;1,750m',
-    '&dollar;1,850',
-    '&dollar;1.02',
     '&dollar;1.12',
-    '&dollar;1.21',
-    '&dollar;1.25m',
-    '&dollar;1.36',
-    '&dollar;1.81',
-    '&dollar;1.99',
-    '&dollar;10,500',
-    '&dollar;100&ndash;140,000',
-    '&dollar;10000',
-    '&dollar;102,000',
-    '&dollar;105,000',
-    '&dollar;10bn',
-    '&dollar;11,000,000',
-    '&dollar;11.2',
-    '&dollar;11.8m',
-    '&dollar;11.9m',
     '&dollar;113',
-    '&dollar;118,000',
-    '&dollar;12.2m',
-    '&dollar;12.50',
-    '&dollar;120,000,000',
-    '&dollar;13.4',
-    '&dollar;13.9m',
-    '&dollar;135,000',
-    '&dollar;139',
-    '&dollar;14,000m',
-    '&dollar;14,500',
-    '&dollar;14.8m',
-    '&dollar;15.50',
-    '&dollar;15.8',
-    '&dollar;16.3m',
-    '&dollar;16.8m',
     '&dollar;160',
-    '&dollar;162',
-    '&dollar;165,000',
-    '&dollar;17,500',
-    '&dollar;17.7m',
-    '&dollar;17.8m',
-    '&dollar;170m',
-    '&dollar;18,500',
-    '&dollar;18.3m',
-    '&dollar;185',
-    '&dollar;185m',
-    '&dollar;19,500',
-    '&dollar;19.4',
-    '&dollar;19.7m',
-    '&dollar;195,000',
-    '&dollar;196m',
     '&dollar;199',
-    '&dollar;2,100m',
-    '&dollar;2,150',
-    '&dollar;2,900',
-    '&dollar;2.5&ndash;3.5',
-    '&dollar;2.8bn',
-    '&dollar;2.9bn',
-    '&dollar;20,500',
-    '&dollar;200&ndash;250,000',
-    '&dollar;21.6m',
-    '&dollar;210,000',
-    '&dollar;22.4m',
-    '&dollar;22.9m',
-    '&dollar;23',
-    '&dollar;230m',
-    '&dollar;24.5m',
     '&dollar;249',
-    '&dollar;25&ndash;35,000',
-    '&dollar;25.7m',
-    '&dollar;255',
-    '&dollar;26.1m',
-    '&dollar;26.2m',
-    '&dollar;270,000',
-    '&dollar;274,000',
-    '&dollar;28.6m',
-    '&dollar;280m',
-    '&dollar;29',
-    '&dollar;29.2m',
-    '&dollar;29.5m',
-    '&dollar;295',
-    '&dollar;29m',
-    '&dollar;2billion',
     '&dollar;2m.',
-    '&dollar;3&ndash;4',
-    '&dollar;3.45',
-    '&dollar;3.75',
-    '&dollar;30.9m',
-    '&dollar;31,500',
-    '&dollar;31.1m',
-    '&dollar;31.2m',
-    '&dollar;31m',
-    '&dollar;326m',
-    '&dollar;335m',
-    '&dollar;34',
-    '&dollar;344m',
-    '&dollar;365',
-    '&dollar;36m',
-    '&dollar;370m',
     '&dollar;374',
-    '&dollar;375',
-    '&dollar;38',
-    '&dollar;38.6m',
-    '&dollar;399',
-    '&dollar;4,200',
-    '&dollar;4,600m',
-    '&dollar;4.3',
-    '&dollar;4.6',
-    '&dollar;40&ndash;60,000',
-    '&dollar;400&ndash;600,000',
-    '&dollar;400,000&ndash;600,000',
-    '&dollar;41.9m',
-    '&dollar;42,000',
-    '&dollar;422m',
-    '&dollar;43,000',
     '&dollar;435',
-    '&dollar;43m',
-    '&dollar;45&ndash;60,000',
-    '&dollar;46m',
-    '&dollar;470',
-    '&dollar;470m',
-    '&dollar;475,000',
-    '&dollar;48',
-    '&dollar;480m',
-    '&dollar;489m',
-    '&dollar;49',
-    '&dollar;49,000',
-    '&dollar;495',
-    '&dollar;4bn',
-    '&dollar;5,100',
-    '&dollar;5,300',
     '&dollar;5,600',
-    '&dollar;500&ndash;600,000',
-    '&dollar;50bn',
-    '&dollar;51,000',
-    '&dollar;51m',
-    '&dollar;520,000',
-    '&dollar;525,000',
-    '&dollar;545',
-    '&dollar;560',
-    '&dollar;595m',
-    '&dollar;6,600',
-    '&dollar;6.4m',
-    '&dollar;600&ndash;800,000',
-    '&dollar;62,000',
-    '&dollar;625m',
-    '&dollar;62m',
     '&dollar;63',
-    '&dollar;63,000',
-    '&dollar;63m',
-    '&dollar;668m',
-    '&dollar;670m',
-    '&dollar;7000',
-    '&dollar;714',
-    '&dollar;720',
-    '&dollar;72m',
-    '&dollar;73.5m',
-    '&dollar;78m',
-    '&dollar;8.2m',
-    '&dollar;8.5',
-    '&dollar;8.7m',
-    '&dollar;81',
-    '&dollar;84m',
     '&dollar;86m',
-    '&dollar;9,500',
-    '&dollar;9.6',
-    '&dollar;9.9',
-    '&dollar;90,000,000',
-    '&dollar;96',
-    '&dollar;97,000',
-    '&dollar;sup13',
-    '&eacute;chevins',
-    '&eacute;cus',
-    '&eacute;l&eacute;vation',
-    '&eacute;lie',
-    '&eacute;paulement',
-    '&egr&prime&prime',
-    '&frac12;d.',
-    '&frac12;miles',
     '&frac18&ins',
-    '&frac35',
-    '&frac45',
-    '&gt;0.5',
-    '&gt;1000',
-    '&gt;12',
-    '&gt;60',
-    '&gt;80%',
-    '&gt;six',
-    '&gt=60/min',
-    '&iexcl;dame',
-    '&iexcl;mi',
-    '&ins;.',
-    '&kgr/&kgr',
-    '&le;1',
-    '&lsqb;i&rsqb;t',
     '&lt&gt',
-    '&lt;0.01',
-    '&lt;0.02',
-    '&lt;1%',
-    '&lt;10%',
-    '&lt;2.4',
-    '&lt;20',
-    '&lt;30',
-    '&lt;35',
-    '&lt;4.0',
-    '&lt;50%',
-    '&lt;60',
-    '&lt;9',
-    '&lt;i&gt',
-    '&mdash;durham',
-    '&mdash;had',
     '&mdash;like',
-    '&mdash;no',
-    '&mdash;particularly',
-    '&mdash;so',
-    '&mdash;this',
-    '&mdash;who',
-    '&micro;s',
-    '&micro;u',
-    '&ndash;3',
-    '&ndash;o',
-    '&oacute;engus',
-    '&plus;0.193',
-    '&plus;0.386',
-    '&pound;0.7',
-    '&pound;1,020',
-    '&pound;1,070',
     '&pound;1,130',
-    '&pound;1,140',
-    '&pound;1,300,000',
-    '&pound;1,350',
-    '&pound;1,695',
-    '&pound;1.01',
-    '&pound;1.03',
-    '&pound;1.06',
-    '&pound;1.11',
-    '&pound;1.18',
-    '&pound;1.27',
-    '&pound;1.5billion',
-    '&pound;1.65m',
-    '&pound;1.69',
-    '&pound;1.71',
-    '&pound;1.79',
     '&pound;1.7million',
-    '&pound;1.82',
-    '&pound;1.99/150ml',
-    '&pound;10&ndash&pound;15',
-    '&pound;10.3m',
-    '&pound;10.40',
-    '&pound;10.70',
-    '&pound;100,000&ndash;150,000',
-    '&pound;100,000,000',
-    '&pound;100.',
-    '&pound;10000',
-    '&pound;102.7m',
-    '&pound;106m',
-    '&pound;108m',
-    '&pound;11,500',
-    '&pound;11.4m',
     '&pound;11.5m',
-    '&pound;11.6m',
-    '&pound;114m',
-    '&pound;115.00',
-    '&pound;1150',
-    '&pound;116m',
-    '&pound;117',
-    '&pound;118,000',
-    '&pound;11billion',
-    '&pound;11m.',
-    '&pound;12,600',
-    '&pound;12,800',
-    '&pound;12.2',
-    '&pound;121,000',
-    '&pound;127,000',
-    '&pound;128m',
     '&pound;129.00',
-    '&pound;12bn',
-    '&pound;13,700',
-    '&pound;13.4',
-    '&pound;13.4m',
-    '&pound;13.7m',
-    '&pound;134',
-    '&pound;135m',
-    '&pound;14.2',
-    '&pound;14.6m',
-    '&pound;14.70',
-    '&pound;140,000-a-year',
-    '&pound;143m',
-    '&pound;14million',
-    '&pound;15,000-a-year',
-    '&pound;15.24',
     '&pound;15.45',
-    '&pound;15.5',
-    '&pound;15.5m',
-    '&pound;15.75',
-    '&pound;152,000',
-    '&pound;153,000',
-    '&pound;155,000',
-    '&pound;16,500',
-    '&pound;16,700',
-    '&pound;16.1m',
-    '&pound;16.25',
-    '&pound;16.5',
-    '&pound;162,000',
-    '&pound;163',
-    '&pound;165,000',
-    '&pound;168,000',
     '&pound;16bn',
-    '&pound;17.25',
-    '&pound;17.7',
-    '&pound;1700',
-    '&pound;1750',
-    '&pound;175m',
-    '&pound;179.95',
-    '&pound;18.1',
-    '&pound;186m',
-    '&pound;187,000',
-    '&pound;19.00',
-    '&pound;19.2',
-    '&pound;19.90',
-    '&pound;196',
-    '&pound;199.95',
-    '&pound;1m-plus',
     '&pound;2,000-&pound;3,000',
-    '&pound;2,650',
-    '&pound;2,845',
-    '&pound;2,950',
-    '&pound;2.06',
-    '&pound;2.09',
-    '&pound;2.0m',
-    '&pound;2.1million',
-    '&pound;2.39',
-    '&pound;2.3million',
-    '&pound;2.4bn',
-    '&pound;2.68',
-    '&pound;2.6bn',
-    '&pound;2.75m',
-    '&pound;20&ndash;25,000',
-    '&pound;20,280',
     '&pound;20.20',
-    '&pound;20.9m',
-    '&pound;200,000&ndash;300,000',
-    '&pound;200million',
-    '&pound;203,000',
-    '&pound;205,000',
-    '&pound;208,000',
-    '&pound;21,300',
-    '&pound;21.3m',
-    '&pound;21.40',
-    '&pound;21.7m',
-    '&pound;210m',
-    '&pound;213',
-    '&pound;214',
-    '&pound;215million',
-    '&pound;217',
     '&pound;218',
-    '&pound;219',
-    '&pound;22.00',
-    '&pound;22.5',
-    '&pound;22.75',
-    '&pound;22.99',
-    '&pound;224,000',
-    '&pound;226',
-    '&pound;23,700',
-    '&pound;23.30',
-    '&pound;23.95',
-    '&pound;23.99',
-    '&pound;232',
-    '&pound;24.00',
-    '&pound;242m',
-    '&pound;25,500',
     '&pound;25.3m',
-    '&pound;25.80',
-    '&pound;250,000&ndash;350,000',
-    '&pound;255,000',
-    '&pound;26.3m',
-    '&pound;26.50',
-    '&pound;267',
-    '&pound;27.6',
-    '&pound;271',
-    '&pound;272',
-    '&pound;273',
-    '&pound;275m',
-    '&pound;276',
-    '&pound;28-a-day',
-    '&pound;28.3m',
-    '&pound;28.95',
     '&pound;282,000',
-    '&pound;283',
-    '&pound;285m',
-    '&pound;288',
-    '&pound;28bn',
-    '&pound;290m',
-    '&pound;292',
-    '&pound;3&ndash;5,000',
-    '&pound;3,450',
-    '&pound;3,670',
-    '&pound;3.6million',
-    '&pound;3.70',
-    '&pound;3.85',
-    '&pound;30,000&ndash;50,000',
-    '&pound;30,000,000',
-    '&pound;30.1m',
     '&pound;30.5',
-    '&pound;30.95',
-    '&pound;30000',
-    '&pound;302',
-    '&pound;307',
-    '&pound;30k',
-    '&pound;31.6m',
-    '&pound;311',
-    '&pound;318',
-    '&pound;320m',
-    '&pound;326',
-    '&pound;333',
-    '&pound;333,000&ndash;466,000',
-    '&pound;339',
-    '&pound;34.50',
-    '&pound;340m',
     '&pound;342',
-    '&pound;344',
-    '&pound;346',
-    '&pound;346,800',
-    '&pound;347',
-    '&pound;355',
-    '&pound;355,000',
-    '&pound;36.25',
-    '&pound;36.50',
-    '&pound;37.00',
-    '&pound;376',
-    '&pound;379',
-    '&pound;38.5m',
-    '&pound;386,000',
-    '&pound;388',
-    '&pound;39*',
     '&pound;390,000',
-    '&pound;395m',
-    '&pound;4&ndash;6,000',
-    '&pound;4,750',
-    '&pound;4.10',
-    '&pound;4.19',
-    '&pound;4.5m.',
-    '&pound;4.5million',
-    '&pound;4.85',
-    '&pound;40,000,000',
-    '&pound;406',
-    '&pound;409,000',
-    '&pound;40million',
-    '&pound;41.6m',
-    '&pound;428,000',
-    '&pound;432',
     '&pound;4335.70',
-    '&pound;44.50',
-    '&pound;45.50',
-    '&pound;452,000',
-    '&pound;459',
-    '&pound;460,000',
-    '&pound;465',
-    '&pound;47.99',
-    '&pound;473',
-    '&pound;48,500',
-    '&pound;48.50',
-    '&pound;480,000',
-    '&pound;480m',
-    '&pound;49,000',
-    '&pound;49m',
-    '&pound;4billion',
     '&pound;5&ndash;7,000',
-    '&pound;5,350',
-    '&pound;5,700',
-    '&pound;5,750',
-    '&pound;5,900',
-    '&pound;5.24',
-    '&pound;5.3billion',
-    '&pound;5.40',
-    '&pound;5.45',
-    '&pound;5.5million',
-    '&pound;5.9m',
-    '&pound;5/kg',
-    '&pound;50&ndash;70,000',
-    '&pound;50,000&ndash;80,000',
-    '&pound;500,000-rated',
-    '&pound;500000',
     '&pound;504',
-    '&pound;50k',
-    '&pound;51,500&ndash;77,300',
-    '&pound;512',
-    '&pound;512m',
-    '&pound;5227.63',
-    '&pound;525,000',
-    '&pound;536',
-    '&pound;54,500',
-    '&pound;54.50',
-    '&pound;54.95',
-    '&pound;54.99',
-    '&pound;549',
-    '&pound;560m',
-    '&pound;57.50',
-    '&pound;571m',
     '&pound;577',
-    '&pound;6,150',
-    '&pound;6,600',
-    '&pound;6.20',
-    '&pound;6.40',
-    '&pound;6.49',
-    '&pound;6.60',
-    '&pound;635',
-    '&pound;639',
-    '&pound;64.50',
-    '&pound;640,000',
-    '&pound;645m',
-    '&pound;656',
-    '&pound;6600',
-    '&pound;662',
-    '&pound;666,000&ndash;1,000,000',
     '&pound;667',
-    '&pound;67,500',
-    '&pound;676',
-    '&pound;68m',
-    '&pound;6m.',
-    '&pound;6million',
-    '&pound;7,800',
-    '&pound;7,950',
-    '&pound;7.1',
-    '&pound;7.29',
-    '&pound;7.40',
-    '&pound;7.41',
-    '&pound;7.45',
-    '&pound;7.65',
-    '&pound;70&ndash;90,000',
-    '&pound;70.00',
     '&pound;707',
-    '&pound;71m',
-    '&pound;73,000',
-    '&pound;732',
-    '&pound;75.00',
-    '&pound;758',
-    '&pound;77,400',
-    '&pound;775',
-    '&pound;775,000',
-    '&pound;79,950',
-    '&pound;8&ndash;10',
-    '&pound;8&ndash;12,000',
-    '&pound;8,800',
-    '&pound;8.1bn',
-    '&pound;8.1m',
-    '&pound;8.2',
     '&pound;8.40',
-    '&pound;8.4m',
-    '&pound;8.65',
-    '&pound;8.7',
-    '&pound;8.80',
-    '&pound;810',
-    '&pound;810,000',
-    '&pound;820,000',
-    '&pound;825,000',
-    '&pound;837m',
-    '&pound;843m',
-    '&pound;8500',
-    '&pound;850m',
-    '&pound;88.45',
-    '&pound;88m',
-    '&pound;89.00',
     '&pound;9,240',
-    '&pound;9,250',
-    '&pound;9,400',
-    '&pound;9,999',
-    '&pound;9.4',
-    '&pound;9.41',
-    '&pound;9.49',
-    '&pound;9.6',
-    '&pound;9.65',
-    '&pound;9.6m',
-    '&pound;9.80',
-    '&pound;9.9',
-    '&pound;9.90',
-    '&pound;9.9m',
-    '&pound;91.7m',
-    '&pound;925,000',
     '&pound;935m',
-    '&pound;93m',
-    '&pound;949',
-    '&pound;950m',
-    '&pound;97,000',
-    '&pound;98m',
-    '&pound;990',
-    '&pound;99m',
-    '&pound;9million',
-    '&pound;cp',
-    '&pound;million',
-    '&sect;270',
-    '&sim;10',
-    '&times;1000',
-    '&times;12',
-    '&times;18',
     '&verbar&verbar',
-    '&verbar;device&verbar',
-    '\'58',
-    '\'67',
-    '\'69/\'70',
-    '\'97',
-    '\'boks',
-    '\'clock',
-    '\'eads',
-    '\'eaven',
-    '\'ers',
-    '\'ighly',
-    '\'im.',
-    '\'lo',
-    '\'m_a',
-    '\'now',
     '\'omeless',
-    '\'ook',
-    '\'re_all',
-    '\'shin',
-    '\'some',
-    '\'specially',
-    '\'to',
-    '\'undred',
-    '\'who',
-    '*******',
-    '**john',
-    '**michael',
-    '**mohammad',
-    '**peter',
-    '**robert',
-    '*.',
     '*1',
-    '*abdol',
-    '*abdullah',
-    '*ahmad',
-    '*alhaji',
-    '*b',
-    '*bernard',
-    '*cli',
-    '*gen',
-    '*ibrahim',
-    '*if*',
-    '*in',
-    '*jean',
-    '*jorge',
-    '*le',
-    '*marcel',
     '*members',
-    '*might*',
-    '*one',
-    '*pierre',
-    '*samir',
-    '*w3',
-    '+&gt',
-    '+33',
-    '+40',
-    '+57',
-    '+8',
-    '+90',
-    '+vat',
-    '-&dgr;h',
-    '-0.48',
-    '-0.6',
     '-10&deg;c',
-    '-100&deg',
-    '-108',
-    '-13',
-    '-21',
-    '-3.0',
-    '-36',
-    '-37',
-    '-38',
-    '-451',
-    '-50&deg;c',
-    '-55',
-    '-73',
-    '-90&deg',
-    '-an',
-    '-coated',
     '-derived',
-    '-era',
-    '-four',
-    '-hcg',
-    '-help',
-    '-led',
-    '-monomethy-d-arginine',
-    '-of',
-    '-of-',
-    '-positive',
-    '-repair',
-    '-sec',
-    '-six',
-    '-they',
-    '-us&dollar;700',
-    '.01',
     '.1745',
-    '.303in',
-    '.37',
-    '.44',
-    '/5%',
-    '/ae/',
-    '/bcl-2',
-    '/calcium',
-    '/copy',
-    '/d/',
-    '/day',
-    '/e',
-    '/o/',
-    '/p',
-    '/r',
-    '/the',
     '/v/',
-    '/what',
-    '/who',
-    '0&middot;001',
-    '0&middot;01',
-    '0&middot;063',
-    '0&middot;3',
-    '0&middot;4',
-    '0&middot;6',
-    '0&ndash;11',
-    '0&ndash;62',
-    '0&ndash;63',
-    '0&ndash;7',
-    '0\'clock',
-    '0,0,0',
-    '0,000',
     '0-4-0t',
-    '0-5',
-    '0.00001',
-    '0.006',
-    '0.009',
-    '0.014',
-    '0.028',
-    '0.035',
-    '0.083',
-    '0.0z',
-    '0.1&ndash;0.2',
-    '0.15%',
-    '0.25&ndash;0.5',
-    '0.3&mgr;g',
-    '0.413',
-    '0.45&micro;m-filtered',
     '0.46',
-    '0.5&ndash;1',
-    '0.5&ndash;1.0',
-    '0.6pc',
-    '0.75&ins',
-    '0.75ms',
-    '0.9kg',
-    '0/3',
-    '0002&ndash;0002',
-    '0011',
-    '0030',
-    '009',
-    '00:06',
-    '00:43',
-    '00:48',
-    '00:50',
     '01-928',
-    '01.00',
-    '01:06',
-    '01:31',
-    '01:32',
-    '01:34',
-    '01:35',
-    '01:38',
-    '01:48',
-    '0208',
-    '0230',
-    '025',
-    '0270',
-    '029',
-    '02:10',
-    '02:11',
     '02:20',
-    '02:29',
-    '02:35',
-    '02:39',
-    '0302',
-    '0326',
-    '0329',
-    '0332',
-    '034',
-    '03:09',
-    '03:12',
-    '0401.3',
-    '0404.2',
-    '0437',
-    '045',
-    '047',
     '0484',
-    '04922182',
-    '0494',
-    '04:39',
-    '0503',
-    '0505',
-    '0505.43',
-    '0505.47',
-    '051-709',
-    '0527',
-    '057',
-    '0590',
-    '05:09',
-    '05:10',
-    '05:14',
-    '05:29',
     '05:35',
-    '05:37',
-    '05:48',
-    '05:55',
-    '05:57',
-    '05:58',
-    '0602.5',
-    '0607',
-    '0623',
-    '0630',
-    '0693',
-    '06:00',
-    '06:10',
-    '06:13',
-    '06:19',
-    '06:20',
     '06:38',
-    '06:57',
-    '0706',
-    '071&ndash;381',
-    '071&ndash;434',
-    '071&ndash;439',
-    '071&ndash;499',
-    '071&ndash;584',
-    '071&ndash;589',
-    '071&ndash;628',
-    '071&ndash;630',
-    '071&ndash;722',
-    '071&ndash;834',
-    '071&ndash;937',
-    '071-242',
-    '0723',
     '0727',
-    '0789',
-    '0795',
-    '07:00',
-    '07:03',
-    '07:10',
-    '07:21',
-    '07:30',
-    '07:42',
-    '0802',
-    '081&ndash;748',
-    '0860',
-    '0895',
-    '08:04',
-    '09.30&ndash;17.30',
-    '0902',
     '0905',
-    '0909',
-    '091&ndash;384',
-    '091&ndash;567',
-    '092',
-    '093',
-    '0934',
-    '0943',
-    '0945',
-    '095',
-    '09:00',
-    '09:01',
-    '09:10',
-    '0ea',
-    '0x',
-    '1&agr',
     '1&amp;frac12',
-    '1&divide;15',
-    '1&frac12;-address',
-    '1&frac14&ndash;1&frac12',
-    '1&frac14;lb',
-    '1&mdash;3',
-    '1&middot;5',
-    '1&ndash;1&ndash;0',
-    '1&ndash;1/4in',
-    '1&ndash;126',
-    '1&ndash;15&ndash;0',
-    '1&ndash;2&deg;c',
-    '1&ndash;21',
-    '1&ndash;28',
-    '1&ndash;31',
-    '1&ndash;7%',
     '1&ndash;80',
-    '1&times;1',
-    '1(c)',
-    '1(d)',
-    '1,000-plus',
-    '1,000-year-old',
-    '1,000ml',
-    '1,003',
-    '1,030',
-    '1,119',
-    '1,120',
-    '1,135',
-    '1,175',
-    '1,178',
-    '1,2,3,5',
-    '1,200ft',
     '1,220',
-    '1,240',
-    '1,260',
-    '1,305',
-    '1,380',
-    '1,536',
-    '1,6',
-    '1,625',
-    '1,640',
-    '1,653',
-    '1,670',
-    '1,704',
-    '1,730',
-    '1,767',
-    '1,800-strong',
-    '1,800ft',
     '1,818m',
-    '1,880',
-    '1-for-1',
-    '1-megabit',
-    '1-relrate',
-    '1.025',
-    '1.1a',
-    '1.1pc',
-    '1.25&ins',
-    '1.34',
-    '1.3kg',
-    '1.3pc',
-    '1.4.0',
-    '1.41',
-    '1.42',
-    '1.45pm',
     '1.4kg',
-    '1.5&ndash;2.5',
-    '1.50pm',
-    '1.51',
-    '1.55%',
-    '1.5gb',
-    '1.6.5',
-    '1.63',
-    '1.65%',
-    '1.65m',
-    '1.7.',
-    '1.7.2',
-    '1.73',
-    '1.76',
-    '1.78',
-    '1.80',
     '1.89%',
-    '1.8p',
-    '1.9-kb',
-    '1.99',
-    '1/16in',
-    '1/26',
-    '1/2d',
-    '1/2m',
-    '1/2oz',
-    '1/5',
-    '1/60th',
-    '1/80th',
-    '1/89',
-    '1/8in',
-    '1/mpg',
-    '10%fcs',
     '10&mgr;g',
-    '10&micro;g/ml',
-    '10&ndash;23',
-    '10&ndash;26',
-    '10&ndash;35',
-    '10+',
-    '10,400',
-    '10,600',
-    '10-17',
-    '10-compatible',
-    '10-user',
-    '10.00&ndash;18.00',
-    '10.00a.m.',
-    '10.15am',
-    '10.1v',
-    '10.25p',
     '10.3a',
-    '10.3b',
-    '10.3d',
-    '10.46',
-    '10.47',
-    '10.50pm',
-    '10.53',
-    '10.5pc',
-    '10.60',
-    '10.65',
-    '10.66',
-    '10.7.6',
-    '10.8(a)',
-    '10/13',
-    '10/2/87',
-    '10/l',
     '100&deg;f',
-    '100&ndash;120',
-    '100(3)',
-    '100,000-plus',
-    '100,000th',
-    '100-1',
-    '100-metres',
-    '100.4',
-    '100000/year',
-    '10017',
-    '1004.5',
-    '100733',
-    '100734',
-    '100bhp',
-    '100khz',
-    '100mev',
     '100mls',
-    '101/2',
-    '1015&mdash;16',
-    '101p',
-    '1035&deg',
-    '103bhp',
-    '104&deg;f',
-    '1046',
-    '10500',
-    '1050s',
-    '105bhp',
-    '105mph',
-    '105th',
-    '1082',
-    '109&ndash;21',
-    '109,000',
     '1092',
-    '10:00',
-    '10:09',
-    '10:15',
-    '10:18',
-    '10:24',
-    '10:30',
-    '10:37',
-    '10:47',
-    '10:54',
-    '10base2',
-    '10inches',
-    '10lc',
-    '10ms',
-    '10myr',
-    '10nm',
     '11&frac14',
-    '11&ndash;0',
-    '11&ndash;25',
-    '11&ndash;43',
-    '11&ndash;7',
-    '11(5)',
-    '11,12',
-    '11,300',
-    '11-2',
-    '11-7',
-    '11.00&ndash;17.00',
-    '11.07',
-    '11.22',
-    '11.24',
-    '11.26',
-    '11.34',
     '11.3bn',
-    '11.41',
-    '11.49',
-    '11.85p',
-    '11.9p',
-    '11/88',
-    '110&deg;c',
-    '110&ndash;11',
-    '1100&deg;c',
-    '1101.10',
-    '1102.12',
-    '1102.7',
-    '1103.1',
-    '1103.2',
-    '1103.3',
-    '1105.00',
     '110hp',
-    '111&ndash;12',
-    '111&ndash;13',
-    '1113',
-    '111th',
-    '112&frac12&deg',
-    '112-day',
-    '1138',
-    '114p',
-    '116a',
-    '116th',
-    '11701',
-    '119.',
-    '11:04',
-    '11:10',
-    '11:20',
     '11:28',
-    '11e',
-    '11km',
-    '12&ndash;4',
-    '12&ndash;7',
-    '12-10',
-    '12-12',
-    '12-6',
-    '12-9',
-    '12-copy',
-    '12-foot',
-    '12-strings',
-    '12.15am',
-    '12.16',
-    '12.18',
-    '12.24',
     '12.37',
-    '12.39',
-    '12.48',
-    '12.5&ins',
-    '12.6p',
-    '120&ndash;25',
-    '120000',
-    '120gb',
-    '120hz',
-    '120m',
-    '120mw',
-    '120th',
-    '121&ndash;122',
-    '1216&ndash;1307',
-    '121mph',
-    '121st',
     '122%',
-    '122p',
-    '123&ndash;4',
-    '124&ndash;5',
-    '124,000',
-    '1253&ndash;4',
-    '127&ndash;52',
-    '127&sol;87',
-    '127,000',
-    '1273&ndash;4',
-    '128&times;128',
-    '1282&ndash;3',
-    '1286&ndash;9',
-    '12:10',
-    '12:12',
-    '12:14',
     '12:28',
-    '12:37',
-    '12ml',
-    '12x',
-    '13&mdash;16',
-    '13&ndash;03',
-    '13&ndash;10',
-    '13&ndash;3',
-    '13&ndash;4',
-    '13&ndash;6',
-    '13&ndash;8',
-    '13&shilling',
-    '13-18',
-    '13-minute',
-    '13-month',
-    '13-month-old',
     '13.12',
-    '13.13.2',
-    '13.19',
-    '13.2.2',
-    '13.24',
-    '13.29',
-    '13.3.1',
-    '13.30',
-    '13.32',
-    '13.33',
-    '13.4p',
-    '13.5.3',
-    '13.59',
-    '13.6p',
-    '13.7.8',
-    '13.99',
     '13.99%',
-    '13/14',
-    '130&deg',
-    '130000',
-    '130km',
-    '130lb',
-    '130th',
-    '131&ndash;2',
-    '131p',
-    '132&ndash;7',
-    '132,000',
-    '1324&ndash;5',
-    '1326&ndash;7',
-    '1328&ndash;9',
-    '132kv',
-    '133722',
     '1346&ndash;7',
-    '1348&ndash;49',
-    '1359&ndash;60',
-    '135mm',
-    '136&ndash;7',
-    '136,000',
-    '1360/1992',
-    '136p',
-    '137mph',
-    '137p',
-    '137th',
-    '138&ndash;9',
-    '138th',
-    '13:10',
-    '13:33',
-    '13:52',
     '13ozs',
-    '14&ndash;11',
-    '14,000,000',
-    '14,200',
-    '14,400',
-    '14,400bps',
-    '14,600',
-    '14,800',
-    '14-6',
-    '14-club',
-    '14.1%',
-    '14.10',
-    '14.15',
-    '14.24',
-    '14.27',
-    '14.3.2',
     '14.3.5',
-    '14.48',
-    '14.7.5',
-    '14.95',
-    '14/77',
-    '142%',
-    '144gb',
-    '144pp',
-    '145&ndash;6',
-    '145mph',
-    '146&ndash;7',
-    '146p',
-    '147,000',
-    '1477/8',
-    '14:17',
-    '14:49',
     '14k',
-    '15&micro;g',
-    '15&ndash;22',
-    '15&ndash;25%',
-    '15&ndash;30%',
-    '15(4)',
-    '15,350',
-    '15-14',
-    '15-24',
-    '15-second',
-    '15-strong',
-    '15.12',
-    '15.13',
-    '15.16',
-    '15.25',
-    '15.41',
     '15.7%',
-    '15.8.3',
-    '150km',
-    '150w',
-    '152,000',
-    '152s',
-    '1561&ndash;1626',
-    '157mph',
-    '1586&ndash;7',
-    '15:1',
-    '15:16',
-    '15:40',
-    '15mb',
-    '15mph',
-    '15o',
-    '15th-',
     '16&deg',
-    '16&frac12;p',
-    '16&ndash;22',
-    '16&ndash;59',
-    '16&ndash;6',
-    '16&ndash;8',
-    '16&ndash;9',
-    '16,000,000',
-    '16-22',
-    '16-bar',
-    '16-race',
-    '16.12',
-    '16.25',
-    '16.4%',
-    '16.55',
-    '16.5m',
     '16.6.89',
-    '16/11/87',
-    '160&deg;c',
-    '1600cc',
-    '1601&ndash;27',
-    '160km',
-    '160mm',
-    '161,000',
-    '162.5',
-    '1628&ndash;9',
-    '163,000',
-    '1639&ndash;40',
-    '1642&ndash;1727',
-    '1647&ndash;8',
-    '1650&ndash;1',
-    '1656&ndash;8',
     '166&ndash;6',
-    '1668&ndash;9',
-    '167&ndash;8',
-    '1687.50',
-    '168p',
-    '1697&ndash;1837',
-    '169p',
-    '16:14',
-    '16:21',
-    '16oz',
-    '17&ndash;11',
-    '17(c)',
-    '17,300',
-    '17,700',
-    '17,800',
-    '17-10',
     '17-17',
-    '17-point',
-    '17.05p',
-    '17.11',
-    '17.25',
-    '17.26',
-    '17.29',
-    '17.40',
-    '17.47',
-    '17.65',
-    '17.95',
-    '1700&ndash;1880',
-    '1700&ndash;1900',
-    '170ft',
-    '171,000',
-    '1711&ndash;76',
     '1724&ndash;1804',
-    '172s',
-    '1733&ndash;4',
-    '1737-1800',
-    '1747&ndash;8',
-    '1749&ndash;50',
-    '1756&ndash;1836',
-    '176,000',
-    '177&ndash;8',
-    '1772&ndash;1834',
-    '1773&ndash;74',
-    '1778&ndash;1830',
-    '177p',
-    '1795&mdash;6',
-    '18&ndash;6',
-    '18,19',
     '18-24',
-    '18-plus',
-    '18-point',
-    '18-stone',
-    '18-strong',
-    '18.10',
-    '18.5p',
-    '18.9%',
-    '180%',
-    '180/pi',
-    '1800&ndash;1840',
-    '1806&ndash;7',
-    '1806&ndash;73',
-    '180mph',
-    '1811&mdash;12',
-    '182&sol;83',
     '1825.0',
-    '1828&ndash;30',
-    '182p',
-    '1836&ndash;7',
-    '1846&ndash;7',
-    '1848&ndash;51',
-    '184p',
-    '1851&ndash;1951',
-    '1853&ndash;4',
-    '1855&ndash;6',
-    '1856&ndash;7',
-    '1859&ndash;60',
-    '1860&ndash;90',
-    '1864&ndash;9',
-    '1866&ndash;7',
-    '1868&ndash;9',
     '1876&ndash;1947',
-    '188&ndash;9',
-    '1880&ndash;1',
-    '1880&ndash;1910',
-    '1880&ndash;1914',
-    '1880\'s',
-    '1884&ndash;5',
-    '1885a',
-    '1887&ndash;9',
-    '189&sol;87',
-    '1892&ndash;3',
-    '1893&ndash;4',
-    '1896&ndash;8',
-    '1898&ndash;99',
-    '18:15',
-    '18:2',
     '18db',
-    '18h',
-    '18lb',
-    '18pts',
-    '19&frac12',
-    '19&ndash;23',
-    '19&ndash;3',
-    '19-25',
-    '19-6',
-    '19-minute',
-    '19-years-old',
-    '19.0',
-    '19.20',
-    '19.45',
-    '19.6%',
-    '19.9%',
     '19/20',
-    '19/9/87',
-    '1900&ndash;2100',
-    '1902&ndash;3',
-    '1903&ndash;5',
-    '1904&ndash;05',
-    '1909&ndash;11',
-    '190cm',
-    '191,000',
-    '1914&ndash;16',
-    '1915&ndash;1932',
-    '1918&ndash;20',
-    '1919&ndash;21',
-    '1920&ndash;2',
-    '1921&ndash;25',
-    '1929&ndash;33',
     '1933b',
-    '1934&ndash;9',
-    '1935&ndash;9',
-    '1936&ndash;9',
-    '1938&ndash;40',
-    '1939-45',
-    '193p',
-    '194&ndash;5',
-    '19405',
-    '1941&ndash;42',
-    '1944.',
-    '1945&ndash;52',
-    '1945&ndash;6',
-    '1945&ndash;9',
-    '1945-50',
-    '1946/47',
     '1948-49',
-    '1949&ndash;51',
-    '1949&ndash;53',
-    '1950&ndash;1',
-    '1950&ndash;51',
-    '19505',
-    '1951&ndash;2',
-    '1951&ndash;5',
-    '1952&ndash;53',
-    '1953&ndash;4',
-    '1953/4',
-    '1957&ndash;8',
-    '1957a',
-    '1958&ndash;59',
-    '1959&ndash;61',
-    '1959&ndash;64',
     '195os',
-    '1960&ndash;63',
-    '1960/61',
-    '1960s.',
-    '1968/69',
-    '1970&ndash;3',
-    '1971&ndash;75',
-    '1971&ndash;88',
-    '1971/72',
-    '1972&ndash;89',
-    '1972/3',
-    '1972/73',
-    '1973&ndash;79',
-    '1973/4',
-    '1974&ndash;78',
-    '1974/5',
     '1975&ndash;77',
-    '1975-78',
-    '1975-79',
-    '1976&ndash;86',
-    '1976c',
-    '1977&ndash;80',
-    '1977/78',
-    '1977/8',
-    '1978/9',
-    '1978c',
-    '1979&ndash;1980',
-    '1979&ndash;88',
-    '1979-1989',
-    '1979-89',
-    '1979c',
-    '197p',
     '1980&ndash;82',
-    '1980&ndash;83',
-    '1980&ndash;86',
-    '1980/1',
-    '1981&ndash;5',
-    '1981&ndash;90',
-    '1981-89',
-    '1982&ndash;89',
-    '1982&ndash;90',
-    '1982&ndash;92',
-    '1983&ndash;85',
-    '1983&ndash;86',
-    '1983-85',
-    '1984&sol;85',
-    '1984/193',
-    '1985-90',
     '1985/7',
-    '1985:21',
-    '1986&ndash;90',
-    '1986-1988',
-    '1986-91',
-    '1986.',
-    '1986/062',
-    '1987&ndash;1988',
-    '1987&ndash;92',
-    '1989f',
-    '198p',
-    '1991&mdash;92',
-    '1991&ndash;96',
-    '1991/swindon/wiltshire',
-    '1991/uckington/gloucestershire',
-    '1991c',
     '1992-3',
-    '1992/castlemorton/worcestershire',
-    '1992/gloucester',
-    '1992/oxford',
-    '1992/richard',
-    '1993&ndash;95',
-    '1993/95',
-    '1996&ndash;7',
-    '1996&ndash;97',
-    '19km',
-    '1:05',
-    '1:30am',
-    '1:33',
-    '1:34',
-    '1:37',
-    '1:41',
     '1:5000',
-    '1ab',
-    '1ap',
-    '1az',
-    '1b2',
-    '1bb',
-    '1g5',
-    '1ghz',
-    '1hn',
-    '1k',
-    '1khz',
-    '1l',
-    '1ld',
-    '1lx',
-    '1m8',
-    '1mgml',
     '1nn',
-    '1qh',
-    '1st.',
-    '1th',
-    '1v',
-    '1x12&ins',
-    '1x15&ins',
-    '1yt',
-    '1yx',
-    '2&ast',
-    '2&frac12&ins',
-    '2&frac12;lb',
-    '2&half',
-    '2&mdash;6',
-    '2&mdash;7',
-    '2&micro;l',
     '2&ndash;13',
-    '2&ndash;16',
-    '2&ndash;17',
-    '2&ndash;2&ndash;2',
-    '2&ndash;23',
-    '2&ndash;5.30pm',
-    '2&times;1',
-    '2\',5\'-oligoadenylate',
-    '2(c)',
-    '2(f)/123',
-    '2,000&ndash;3,000',
-    '2,000-3,000',
-    '2,000-mile',
-    '2,000-plus',
-    '2,000kg',
-    '2,040',
     '2,046',
-    '2,080',
-    '2,129',
-    '2,149',
-    '2,156',
-    '2,218.8',
-    '2,250,000',
-    '2,315',
-    '2,4',
-    '2,400,000',
-    '2,500-litre',
-    '2,500th',
-    '2,583',
-    '2,710',
-    '2,999',
-    '2-compatible',
     '2-dgal',
-    '2-year-olds',
-    '2.02',
-    '2.04',
-    '2.08',
-    '2.0m',
-    '2.1.16',
-    '2.10.3',
-    '2.12(1)',
-    '2.1a',
-    '2.29',
-    '2.3.7',
-    '2.37',
-    '2.42',
-    '2.43',
-    '2.45pm',
     '2.46',
-    '2.49',
-    '2.4ghz',
-    '2.5(a)',
-    '2.5(b)',
-    '2.5.2',
-    '2.5.3',
-    '2.5million',
-    '2.6.1.1',
-    '2.6.6',
-    '2.61',
-    '2.66',
-    '2.6kb',
-    '2.82',
-    '2.83',
-    '2.84',
     '2.90',
-    '2.95',
-    '20&mdash;25p',
-    '20&micro;m',
-    '20&ndash;15',
-    '20&ndash;40%',
-    '20&ndash;45',
-    '20&shilling',
-    '20,002',
-    '20-26',
-    '20-50',
-    '20-akce',
-    '20-bed',
-    '20-c',
-    '20-plus',
-    '20.20',
     '20.30',
-    '20.9%',
-    '20/1',
-    '20/26',
-    '200&mgr;l',
-    '200-plus',
-    '200-word',
-    '200kb',
-    '200w',
-    '2016',
-    '202a',
-    '2030s',
-    '2036',
-    '2038',
-    '2041',
-    '2048k',
     '205&ndash;7',
-    '205(1)',
-    '2052/88',
-    '205th',
-    '2080',
-    '20e',
-    '20gb',
-    '20hz',
-    '20n',
-    '20th/21st',
-    '20v',
-    '21&ndash;12',
-    '21&ndash;21',
-    '21&ndash;6',
-    '21&ndash;9',
-    '21,500',
     '21-10',
-    '21-14',
-    '21-fret',
-    '21-month-old',
-    '21-strong',
-    '21.14',
-    '21.19',
-    '21.2%',
-    '21/apr',
-    '21/may',
-    '2101',
-    '210g',
-    '210m',
-    '212-member',
-    '2126',
-    '213/89',
     '2150',
-    '215p',
-    '2162',
-    '2163',
-    '21b',
-    '22&ndash;10',
-    '22&ndash;14',
-    '22&ndash;20',
-    '22,000ft',
-    '22,500,000',
-    '22,982,000',
-    '22-30',
-    '22.8.89',
-    '22/23',
-    '22/jan',
-    '22/july',
     '22/june',
-    '220&ndash;1',
-    '2207',
-    '220v',
-    '2220',
-    '2237',
-    '2244',
-    '224p',
-    '225&ndash;6',
-    '227p',
-    '2280',
-    '22kt',
-    '22lbs',
-    '23&ndash;13',
-    '23&ndash;28',
-    '23,500',
     '23,500,000',
-    '23.14',
-    '23.6%',
-    '23/dec',
-    '2302',
-    '230c/450f/gas',
-    '233,000',
-    '2331',
-    '2332',
-    '2345',
-    '234p',
-    '235p',
-    '2375',
-    '23e',
-    '23t',
-    '24&ndash;0',
     '24&ndash;12',
-    '24&ndash;42',
-    '24&ndash;6',
-    '24&ndash;aug',
-    '24,200',
-    '24-0',
-    '24-h',
-    '24-oct',
-    '24.3%',
-    '24.7%',
-    '24/aug',
-    '24/nov',
-    '24/sept',
-    '242p',
-    '24402',
-    '2470',
     '2490',
-    '249811',
-    '24:1',
-    '24:47',
-    '24gb',
-    '24s',
-    '25&ins',
-    '25&ndash;3',
-    '25&ndash;44',
-    '25&ndash;64',
-    '25&ndash;74',
-    '25&percnt',
-    '25.4%',
-    '250,000,000',
-    '2500ft',
-    '25029',
     '250w',
-    '251p',
-    '252,000',
-    '2550',
-    '256k',
-    '256m-bit',
-    '257,000',
-    '25:1&ndash;13',
-    '25cms',
-    '25min',
-    '25myr',
-    '25th-minute',
-    '25th.',
-    '26&deg',
-    '26,27',
-    '26-30',
     '26.9%',
-    '26/7',
-    '26000',
-    '2670',
-    '2671',
-    '2680',
-    '269p',
-    '27&deg;c',
-    '27&frac12',
-    '27&ndash;18',
-    '27&ndash;8',
-    '27&ndash;9',
-    '27,500',
-    '27-year',
-    '27.9',
-    '270031',
     '2730',
-    '27301-09',
-    '275,000-volt',
-    '27739',
-    '27c',
-    '27mm',
-    '28.4%',
-    '28.8.90',
-    '28/4/87',
-    '2807',
-    '280e',
-    '283&ndash;284',
-    '285&ndash;286',
-    '286s',
-    '288p',
-    '28lb',
     '28pc',
-    '28xx',
-    '29,500',
-    '29-dec.',
-    '290,000',
-    '29000',
-    '2914',
-    '2915',
-    '297p',
-    '29:1',
-    '29c',
-    '2:19',
-    '2:24',
-    '2:40',
-    '2:5',
-    '2:8',
     '2=',
-    '2bn',
-    '2hrs',
-    '2jx',
-    '2lj',
-    '2lu',
-    '2ml',
-    '2mt',
-    '2nm',
-    '2r',
-    '2w',
-    '2xx',
-    '3&frac12;p',
-    '3&ndash;13',
-    '3&ndash;17',
-    '3&ndash;24',
     '3&shilling;6d',
-    '3(6)',
-    '3(s)',
-    '3,000kg',
-    '3,000th',
-    '3,300,000',
-    '3,700,000',
-    '3,900,000',
-    '3-8',
-    '3-week',
-    '3.03',
-    '3.07',
-    '3.1(b)',
-    '3.1.4',
-    '3.1.6',
-    '3.1pc',
     '3.2.',
-    '3.22(b)',
-    '3.3.1.1',
-    '3.3.1.2',
-    '3.3m',
-    '3.4.4.2',
-    '3.41',
-    '3.47',
-    '3.48',
-    '3.5/3.5',
-    '3.54:1',
-    '3.6.1',
-    '3.6/3.6',
-    '3.64',
-    '3.6a',
-    '3.7.4',
     '3.74',
-    '3.75%',
-    '3.7m',
-    '3.80',
-    '3.88',
-    '3.90',
-    '3/92',
-    '30&ndash;1',
-    '30&ndash;300',
-    '30&ndash;36',
-    '30&ndash;4',
-    '30&percnt',
-    '30(1)',
-    '30,000-tonne',
-    '30-april',
-    '30-feb.',
     '30.2%',
-    '30.5cm',
-    '30.8%',
-    '30.9%',
-    '300&deg',
-    '300,000,000',
-    '300-km',
-    '300-odd',
-    '300g/11oz',
-    '300k',
-    '300kg',
-    '300lb',
-    '300s',
-    '300w',
-    '30150',
-    '3036',
     '3037',
-    '304/306',
-    '304p',
-    '3065',
-    '3080',
-    '3088',
-    '3090s',
-    '3094',
-    '31-year',
-    '31.4%',
-    '31.9',
-    '3101',
-    '312p',
-    '3130',
-    '3132',
-    '3141',
     '315p',
-    '31a',
-    '31b',
-    '32&deg;c',
-    '32&ndash;7',
-    '32(1)',
-    '32-bits',
-    '32-member',
-    '32.4%',
-    '3200/5316',
-    '3200k',
-    '3210',
-    '3212',
-    '321762',
-    '3250',
-    '32767',
     '32gb',
-    '32m',
-    '32pc',
-    '33&ndash;45',
-    '33,600',
-    '33.',
-    '33.2%',
-    '33.9',
-    '33000',
-    '331133',
-    '331p',
-    '332p',
-    '3340',
-    '33467-68',
-    '3355',
-    '33647-48',
     '3390-9',
-    '339p',
-    '33p/minimum',
-    '33p/per',
-    '34&ndash;0',
-    '34&ndash;40',
-    '34&sol;82',
-    '34(3)',
-    '34.063',
-    '34.2',
-    '34.3%',
-    '34.4%',
-    '34070-73',
-    '34072',
-    '34162',
-    '3442',
     '344p',
-    '3450-up',
-    '3455',
-    '34565-68',
-    '3472',
-    '3477',
-    '34989',
-    '34b',
-    '34th-minute',
-    '35&ndash;37',
-    '35&ndash;39',
-    '35&ndash;45',
-    '35&ndash;6',
-    '35,000-strong',
-    '35-40',
-    '35.1%',
     '35.7%',
-    '350&mgr;molmol',
-    '3500rpm',
-    '3500s',
-    '35024',
-    '350bp',
-    '350cc',
-    '350s',
-    '35382',
-    '35388-90',
-    '35600',
-    '35626',
-    '35665',
-    '356th',
-    '35742',
-    '357th',
     '35915',
-    '35922',
-    '35984',
-    '36&ndash;40',
-    '36&ndash;47',
-    '36&ndash;51',
-    '36.5%',
-    '36.6',
-    '36040',
-    '360p',
-    '360s',
-    '36137',
-    '36161',
-    '36238',
-    '36328-29',
-    '36380',
     '36411',
-    '36412',
-    '36423',
-    '36428',
-    '36434',
-    '36455',
-    '36463-64',
-    '36464',
-    '36465',
-    '36473',
-    '36485',
-    '36502',
-    '36508-09',
-    '36525',
-    '36527',
-    '36538',
     '36539',
-    '36553',
-    '36558',
-    '36562',
-    '36564',
-    '36581',
-    '365p',
-    '36603',
-    '36635',
-    '36640-42',
-    '36641-42',
-    '36647',
-    '36658',
-    '36667',
-    '36668',
-    '36700',
     '36727',
-    '36741',
-    '36777',
-    '36778',
-    '36800-01',
-    '36809-10',
-    '36833',
-    '36851',
-    '36892',
-    '368p',
-    '36925-26',
-    '369369',
-    '36951',
-    '36960-61',
-    '36962',
-    '36964',
     '36980',
-    '36in.',
-    '36kb',
-    '36th-minute',
-    '37&frac12',
-    '37&ndash;38',
-    '37,500',
-    '37026',
-    '37028',
-    '37031',
-    '37035',
-    '37036',
-    '37078',
-    '37086',
-    '37096',
-    '37110',
     '37113',
-    '37117-18',
-    '37124-25',
-    '37135',
-    '37137',
-    '37138',
-    '37140',
-    '37160',
-    '37168-70',
-    '37171',
-    '37175',
-    '37178',
-    '37186',
-    '37186-87',
-    '37192',
-    '37200',
     '37209',
-    '37220',
-    '37227',
-    '37239-40',
-    '37241',
-    '37252',
-    '37292',
-    '37297',
-    '37300-02',
-    '37300-03',
-    '37301',
-    '37303',
-    '37307-08',
-    '37314',
-    '37315',
-    '37326',
     '37327',
-    '37353',
-    '37405',
-    '37406',
-    '37436',
-    '37441',
-    '37446',
-    '37463',
-    '37465',
-    '37465-66',
-    '37473',
-    '37490',
-    '375,000',
-    '37500',
-    '37510',
-    '37514',
     '37518-19',
-    '37519',
-    '37524',
-    '37525',
-    '37540-41',
-    '37543',
-    '37546-47',
-    '3755',
-    '37569',
-    '37574',
-    '37593',
-    '37598',
-    '37604',
-    '37617',
-    '37621',
-    '37627',
     '37650',
-    '37655-56',
-    '37676',
-    '37694-97',
-    '37705',
-    '37715',
-    '37716',
-    '37719',
-    '37720',
-    '37723',
-    '37726',
-    '37763-64',
-    '37766',
-    '37768',
-    '37793',
-    '37801',
     '37809',
-    '37816',
-    '37818',
-    '37821',
-    '37829',
-    '37835',
-    '37840',
-    '37847',
-    '37853',
-    '37855',
-    '37857',
-    '37864',
-    '37886',
-    '378p',
-    '37911-12',
-    '37915-16',
     '37923',
-    '37926',
-    '37935',
-    '37946',
-    '37951',
-    '37956',
-    '37957-58',
-    '37962',
-    '37973',
-    '37975-76',
-    '37976',
-    '37987',
-    '37993',
-    '37994',
-    '38&frac12',
-    '38&ndash;39',
     '38&ndash;42',
-    '38,500',
-    '38-year',
-    '38.',
-    '38.4',
-    '38.4%',
-    '38.5%',
-    '38.6%',
-    '38000',
-    '38004',
-    '38008',
-    '38009',
-    '38011',
-    '38022-23',
-    '38025',
-    '38079',
     '38081',
-    '38083-84',
-    '38086',
-    '38095-96',
-    '380z',
-    '38123',
-    '38129',
-    '38136',
-    '38150',
-    '38155-56',
-    '38159',
-    '38162',
-    '38164-65',
-    '38167',
-    '38170-71',
-    '38176-77',
     '38177',
-    '38181',
-    '38189',
-    '38194-95',
-    '38197',
-    '38199-200',
-    '38210',
-    '38219',
-    '38271-72',
-    '38286',
-    '38286-88',
-    '38288',
-    '38291',
-    '38295',
-    '3830',
-    '38318',
     '38320-21',
-    '38330',
-    '38341',
-    '38344',
-    '38365',
-    '38365-66',
-    '38376',
-    '38390-91',
-    '38396',
-    '38399',
-    '38403',
-    '38423',
-    '38424',
-    '38426',
-    '38435',
-    '38440',
     '38442',
-    '38450',
-    '38457-58',
-    '38459',
-    '384th',
-    '38516',
-    '38522',
-    '38524',
-    '38528-29',
-    '38529',
-    '38545',
-    '38547',
-    '38555',
-    '38568',
-    '38582',
-    '38589',
     '38593',
-    '385p',
-    '386/40',
-    '386/486',
-    '38659-60',
-    '38661',
-    '38665',
-    '38670',
-    '38672',
-    '38673',
-    '38675',
-    '38679',
-    '38687-88',
-    '38691',
-    '38699',
-    '38704',
     '38706-07',
-    '38711',
-    '38718',
-    '38729',
-    '38738',
-    '38746',
-    '38754',
-    '38764',
-    '38767',
-    '3877',
-    '38775',
-    '38776',
-    '38778',
-    '38780',
-    '38798',
-    '38807',
     '38811',
-    '38816',
-    '38824',
-    '38831',
-    '38869',
-    '38877',
-    '38894',
-    '38902',
-    '38921',
-    '38926',
-    '38927',
-    '38928',
-    '38935',
-    '38950',
-    '38952',
-    '38954',
     '38965',
-    '38984',
-    '38985-86',
-    '38986',
-    '38994',
-    '38m',
-    '38ml',
-    '39(1)',
-    '39(2)',
-    '39.4',
-    '39.4%',
-    '39.8%',
-    '39005',
-    '39015',
-    '39021',
-    '39030',
     '39033',
-    '39035',
-    '39040',
-    '39042',
-    '39046',
-    '39070',
-    '39071',
-    '39085',
-    '39086',
-    '39098',
-    '39104',
-    '39110',
-    '39129',
-    '39137',
-    '39140',
-    '39145',
     '39151',
-    '39155',
-    '39163',
-    '39165',
-    '39169',
-    '39181',
-    '39193-94',
-    '39240',
-    '394p',
-    '3978',
-    '3:10',
-    '3:11',
-    '3:14',
-    '3:15',
-    '3:23',
-    '3:28',
     '3:3',
-    '3aa',
-    '3br',
-    '3bw',
-    '3d-structure',
-    '3gb',
-    '3hu',
-    '3jl',
-    '3ll',
-    '3px',
-    '3rx',
-    '3sy',
-    '4&agr;-tpa',
-    '4&mgr;l',
-    '4&ndash;14',
-    '4&ndash;5-1',
     '4&ndash;6&ndash;2',
-    '4&ndash;6.',
-    '4&ndash;6in',
-    '4(6)',
-    '4(a)',
-    '4,200,000',
-    '4,500kg',
-    '4,900',
-    '4-6-2',
-    '4-aminosalicylic',
-    '4-channel',
-    '4-h',
-    '4-monthly',
-    '4-year-olds',
-    '4.03%',
-    '4.08',
     '4.1(a)',
-    '4.1.0',
-    '4.1m',
-    '4.2.2.1',
-    '4.2.2.2',
-    '4.25%',
-    '4.27',
-    '4.28',
-    '4.2m',
-    '4.2p',
-    '4.3(a)',
-    '4.3.4',
-    '4.3.5',
-    '4.3.6',
-    '4.34',
-    '4.37',
     '4.5.3',
-    '4.52',
-    '4.53',
-    '4.5in',
-    '4.5kg',
-    '4.5v',
-    '4.6.1',
-    '4.68',
-    '4.7.1',
-    '4/75',
-    '40&ndash;45%',
-    '40&ndash;60%',
-    '40&ndash;80',
-    '40-0',
-    '40-1',
-    '40-45',
     '40-overs',
-    '40.4%',
-    '400kg',
-    '400ml',
-    '4016',
-    '402mp',
-    '4046',
-    '405-line',
-    '4080',
-    '40ml',
-    '41&ndash;42',
-    '411p',
-    '413p',
-    '4141',
-    '414161',
-    '414p',
     '415,000',
-    '4150',
-    '41h3',
-    '42&ndash;4',
-    '42(2)',
-    '42.',
-    '42.0',
-    '42.1%',
-    '42.6',
-    '420mb',
-    '4221',
-    '422p',
-    '425sx',
-    '4277',
-    '42ft',
-    '42mhz',
     '43&deg',
-    '43,500',
-    '43.11',
-    '43.7',
-    '43.8%',
-    '43/4p',
-    '430mhz',
-    '43106',
-    '4341',
-    '43a',
-    '44&ndash;22650',
-    '44&ndash;46',
-    '44&ndash;5',
-    '44&ndash;51',
-    '44-game',
-    '44.2%',
     '44.5%',
-    '44.9%',
-    '44000',
-    '440p',
-    '440s',
-    '441(3)',
-    '4424',
-    '445,000',
-    '445p',
-    '44ft',
-    '44lb',
-    '44mm',
-    '44p/minimum',
-    '44p/per',
-    '45(3)',
-    '45-second',
     '45.3',
-    '450g/1',
-    '451p',
-    '4524',
-    '4538',
-    '457p',
-    '45g',
-    '45rpm',
-    '46&sol;86',
-    '46,500',
-    '46.3',
-    '46.5%',
-    '46.7%',
-    '468p',
-    '46cm',
-    '46cms',
     '47&deg',
-    '47(1)',
-    '47.4%',
-    '47.5%',
-    '47.8',
-    '47/3e',
-    '470kg',
-    '47495',
-    '475,000',
-    '479p',
-    '48&ndash;51',
-    '48.1%',
-    '48.3%',
-    '48.6%',
-    '48.7%',
-    '48/1991',
     '480,000',
-    '48000',
-    '480p',
-    '483p',
-    '48431',
-    '486dx/50',
-    '486sx/25',
-    '49&ndash;52',
-    '49.1',
-    '4900',
-    '490nm',
-    '495p',
-    '49b',
-    '49pc',
-    '4:12',
-    '4:15',
     '4:23',
-    '4:30',
-    '4ah',
-    '4al',
-    '4bw',
-    '4m2',
-    '4ms',
-    '4nb',
-    '4o',
-    '4oz/100g',
-    '4pts',
-    '4th-6th',
-    '4x',
-    '4x400m',
-    '4xx',
-    '5&frac12;p',
     '5&mgr;m',
-    '5&ndash;13',
-    '5&ndash;20%',
-    '5&ndash;32',
-    '5&ndash;36',
-    '5&ndash;40',
-    '5&ndash;6%',
-    '5\'tgcaa',
-    '5,000-strong',
-    '5,200,000',
-    '5,229',
-    '5,300,000',
-    '5,342',
-    '5,400,000',
-    '5,500,000',
-    '5,750',
     '5,870',
-    '5-15',
-    '5.03',
-    '5.1.1.3',
-    '5.1.5',
-    '5.1.7',
-    '5.15(b)',
-    '5.16c',
-    '5.2(a)',
-    '5.24a',
-    '5.25p',
-    '5.2b',
-    '5.36',
-    '5.4.0',
-    '5.41',
-    '5.43',
     '5.47',
-    '5.4b',
-    '5.5(b)',
-    '5.5pc',
-    '5.6.3',
-    '5.6.4',
-    '5.7.4',
-    '5.8.1',
-    '5.8.2',
-    '5.9.11',
-    '5.93',
-    '5.95%',
-    '5/',
-    '50&mdash;60p',
-    '50&ndash;69',
-    '50,000-60,000',
     '50-100',
-    '50-75',
-    '50-fold',
-    '50-odd',
-    '50.1',
-    '50.9',
-    '50/60',
-    '500-1',
-    '500lbs',
-    '504p',
-    '509,000',
-    '50a',
-    '50th-minute',
-    '50yds',
-    '51.1%',
-    '51.3',
     '51.8%',
-    '51b',
-    '51pc',
-    '52.',
-    '52.2%',
-    '52.3',
-    '520b(1)',
-    '520i',
-    '52535',
-    '526p',
-    '53&ndash;56',
-    '53&ndash;7',
-    '53.23',
-    '53.8%',
-    '530p',
-    '530s',
     '535i',
-    '53rd-minute',
-    '54&ndash;55',
-    '54.4',
-    '54.9',
-    '54a',
-    '54kg',
-    '55&deg',
-    '55&ndash;60',
-    '55&ndash;64',
-    '55&ndash;7',
-    '55.1',
-    '55.6',
-    '55.6%',
-    '550th',
-    '558p',
     '55mhz',
-    '55mm',
-    '56&ndash;63',
-    '56-page',
-    '56.3',
-    '56.5',
-    '56b',
-    '56m',
-    '57&ndash;8',
-    '57&sol;86',
-    '57.3',
-    '57.5%',
-    '5766',
-    '576p',
-    '57pc',
-    '58.6',
     '58.7',
-    '580,000',
-    '580p',
-    '583p',
-    '588p',
-    '5890',
-    '58pp',
-    '59&ndash;58',
-    '59.0',
-    '59.5',
-    '594895',
-    '596266',
-    '5995m',
-    '599p',
-    '5:15',
-    '5:2',
     '5a/b',
-    '5as',
-    '5bb',
-    '5l',
-    '5mb',
-    '5os',
-    '5w',
-    '5x',
-    '6&ndash;1/2ft',
-    '6&ndash;15',
-    '6&ndash;7%',
-    '6,000ft',
-    '6,250',
-    '6,900',
-    '6,904m',
-    '6-11',
     '6-13',
-    '6-month-olds',
-    '6.00am',
-    '6.09',
-    '6.10pm',
-    '6.2.0',
-    '6.2.6',
-    '6.22a',
-    '6.22b',
-    '6.25pm',
-    '6.3.6',
-    '6.36',
-    '6.3a',
-    '6.4.4',
-    '6.4.5',
-    '6.42',
     '6.43',
-    '6.49',
-    '6.51',
-    '6.59',
-    '6.6.2',
-    '6.67',
-    '6.7.2',
-    '6.75%',
-    '6.8&ndash;7.0',
-    '6.8.1',
-    '6.8.6',
-    '6.9.3',
-    '6/10',
-    '6/24',
-    '60&ndash;4',
-    '60&ndash;40',
     '60-70',
-    '60-80',
-    '60.4',
-    '60.8',
-    '600&deg;c',
-    '600&ndash;700',
-    '600,000-strong',
-    '600sel',
-    '600sl',
-    '6012hdw',
-    '603p',
-    '604p',
-    '605555',
-    '60a',
-    '60ns',
-    '60z',
     '61&ndash;vi',
-    '61&ndash;xi',
-    '61(3)',
-    '61.5%',
-    '61.6',
-    '6111',
-    '6155',
-    '62.7',
-    '621,000',
-    '6282',
-    '63&deg;c',
-    '63&ndash;65',
-    '63.1',
-    '635348',
-    '637p',
-    '63f',
     '64,500',
-    '64-bits',
-    '64.5%',
-    '64.7%',
-    '640mb',
-    '648p',
-    '64a',
-    '65&deg',
-    '65&ndash;6',
-    '65,536',
-    '65.2',
-    '65.9%',
-    '6550',
-    '66&deg&ndash;76&deg;f',
-    '66-1',
-    '66.2',
     '66.6%',
-    '66.7',
-    '66.8',
-    '660s',
-    '66551',
-    '668833',
-    '669p',
-    '66cm',
-    '66pc',
-    '67.4%',
-    '675g/1&half;lb',
-    '68&deg&ndash;77&deg;f',
-    '68.7',
-    '68.9',
-    '680,000',
-    '68050',
     '69.4%',
-    '69.5',
-    '690s',
-    '69pc',
-    '6:7',
-    '6bn',
-    '6cms',
-    '6fl',
-    '6in.',
-    '6jd',
-    '6nf',
-    '6o',
-    '6tu',
-    '7&ndash;10%',
-    '7&ndash;13',
-    '7&ndash;18',
     '7&ndash;20',
-    '7&ndash;8%',
-    '7&shilling',
-    '7,000ft',
-    '7,130',
-    '7,50',
-    '7,600,000',
-    '7,900',
-    '7-13',
-    '7-14',
-    '7.00am',
-    '7.04fl.',
-    '7.1(b)',
-    '7.10(a)',
-    '7.22',
-    '7.23(1)',
     '7.29',
-    '7.3(2)',
-    '7.3(b)',
-    '7.3.4',
-    '7.33',
-    '7.35',
-    '7.36',
-    '7.37',
-    '7.39',
-    '7.3a',
-    '7.41',
-    '7.45am',
-    '7.5(a)',
-    '7.6.4',
-    '7.99',
-    '7/10',
     '7/30',
-    '7/jg26',
-    '70-80',
-    '70.1',
-    '700&ndash;800',
-    '700/800',
-    '700g',
-    '700kg',
-    '700mm',
-    '7051',
-    '7060',
-    '7063',
-    '706560',
-    '70:30',
-    '70c',
-    '70cm',
     '70k',
-    '70th-minute',
-    '71.',
-    '71.3',
-    '71.4%',
-    '71.8',
-    '71.9',
-    '7120',
-    '7131',
-    '7175',
-    '72&deg&ndash;78&deg;f',
-    '72&deg;f',
-    '72&ndash;3',
-    '72&ndash;4',
-    '72&ndash;73',
-    '720kb',
     '7243',
-    '7250',
-    '72hz',
-    '72pc',
-    '73.',
-    '73.4%',
-    '73156',
-    '73b',
-    '74&ndash;5',
-    '74.3%',
-    '7400',
-    '742b',
-    '742rt',
-    '7490e',
-    '75&deg',
-    '75&ndash;6',
     '75&ndash;92',
-    '75.1',
-    '75.4%',
-    '750g/1&frac12',
-    '750il',
-    '750kg',
-    '750ml/1&frac14',
-    '750s',
-    '755p',
-    '75bhp',
-    '75m',
-    '75ml/3fl',
-    '76(1)',
-    '76.2',
-    '76.8',
-    '768,000',
     '77&deg;f',
-    '77.4',
-    '770s',
-    '77268',
-    '7755',
-    '78&ndash;9',
-    '78.3',
-    '78.4%',
-    '78.5',
-    '78.7%',
-    '780,000',
-    '784&ndash;5',
-    '78in',
-    '79&sol;85',
-    '7:14',
-    '7:15',
     '7f7',
-    '7fl',
-    '7jl',
-    '7o',
-    '7pm.',
-    '8&frac12;p',
-    '8&ndash;10%',
-    '8&ndash;10cm',
-    '8&ndash;11pm',
-    '8&ndash;12in',
-    '8&ndash;23',
-    '8&ndash;24',
-    '8&ndash;39',
-    '8&ndash;43',
-    '8&ndash;60',
-    '8+',
     '8,000-metre',
-    '8,000-strong',
-    '8,000ft',
-    '8-8',
-    '8-series',
-    '8-year-olds',
-    '8.0%',
-    '8.03',
-    '8.1.',
-    '8.1.1',
-    '8.1.2',
-    '8.1.3',
-    '8.10am',
-    '8.17.1',
-    '8.17.4',
-    '8.19',
     '8.23',
-    '8.24',
-    '8.28',
-    '8.3(a)',
-    '8.3(b)',
-    '8.37',
-    '8.44',
-    '8.48',
-    '8.57',
-    '8.7p',
-    '8.8(a)',
-    '80&ndash;81',
-    '80&ndash;85',
-    '80+',
-    '80.6',
-    '80.6%',
     '800&deg;c',
-    '800&ndash;1200',
-    '8000m',
-    '80064',
-    '80079',
-    '800f',
-    '800x600',
-    '80287',
-    '80386sl',
-    '80387',
-    '80486sx/25',
-    '80db',
-    '80g',
-    '80mg',
-    '81&ndash;2',
-    '81.5',
     '81.6',
-    '82&deg;n',
-    '82&deg;s',
-    '82&ndash;83',
-    '822/1419',
-    '824/1421',
-    '827594',
-    '82a',
-    '82pc',
-    '83&ndash;5',
-    '83.7',
-    '83pc',
-    '84,000,000',
-    '84.5',
-    '84.7%',
-    '84.9',
     '85&deg',
-    '85&deg;c',
-    '85&ndash;15',
-    '85&ndash;6',
-    '85.7',
-    '857/1453',
-    '86-type',
-    '86.3',
-    '865/1460&ndash;1',
-    '87.5%',
-    '87.7%',
-    '870/1465&ndash;6',
-    '886',
-    '88th-minute',
-    '89th-minute',
-    '8:11',
     '8:23',
-    '8:29',
-    '8:30am',
-    '8cs',
-    '8ea',
-    '8khz',
-    '8nd',
-    '8rds',
-    '8x',
-    '8x30',
-    '8xe',
-    '9&percnt',
-    '9(a)',
-    '9(b)',
-    '9-3-1',
-    '9-8',
     '9.01',
-    '9.02',
-    '9.03',
-    '9.11(a)',
-    '9.1v',
-    '9.2.4',
-    '9.20pm',
-    '9.25am',
-    '9.29',
-    '9.3.1',
-    '9.38',
-    '9.4.2',
-    '9.4.4',
-    '9.40pm',
-    '9.43',
-    '9.45pm',
     '9.6v',
-    '9.75%',
-    '9.77',
-    '9.85',
-    '9/1',
-    '9/2',
-    '9/80',
-    '9/st.g',
-    '90&deg;w',
-    '90.3%',
-    '9070',
-    '90:10',
-    '90kg',
-    '90ml',
-    '91&ndash;3',
-    '91.5',
     '91/92',
-    '9123',
-    '92.3%',
-    '92351',
-    '93.2%',
-    '93.6%',
-    '934p',
-    '94.1',
-    '94.2%',
-    '94.3',
-    '94c',
-    '95&ndash;100',
-    '95.4%',
-    '9500',
-    '95:5',
-    '96&ndash;9',
     '96.4',
-    '96.4%',
-    '96.50',
-    '9690',
-    '97&ndash;8',
-    '970s',
-    '9714',
-    '97pc',
-    '98&ndash;9',
-    '98.7',
-    '99.3%',
-    '99.5',
-    '990s',
-    '9:9',
-    '9am-noon',
-    '9bn',
     '9df',
-    '9dp',
-    '9dq',
-    '9h',
-    '9inch',
-    '9lbs',
-    '9ss',
-    '9th&ndash;11th',
-    '9uz',
-    '=0.29',
-    '=0.50',
-    '=10',
-    '=1056',
-    '=stant',
-    'a\'court',
-    'a\'mhuilinn',
     'a+u',
-    'a-6',
-    'a-changing',
-    'a-cups',
-    'a-day',
-    'a-helices',
-    'a-minus',
-    'a-p',
-    'a-two',
-    'a-v',
-    'a-y',
-    'a.6',
-    'a.835',
-    'a.890',
-    'a.894',
-    'a.c.g.',
     'a.f.d.',
-    'a.g.m',
-    'a.l.j.r.',
-    'a.l.s.',
-    'a.nidulans',
-    'a.v.',
-    'a.w.e',
-    'a.w.e.',
-    'a/2',
-    'a/cyclophilin',
-    'a1079',
-    'a164',
-    'a171',
-    'a227',
-    'a25',
-    'a300',
     'a31',
-    'a32',
-    'a421',
-    'a5104',
-    'a5119',
-    'a67',
-    'a77',
-    'a:b',
-    'a:lexical',
-    'a=',
-    'a_a_lot',
-    'aa/rac',
-    'aabenraa-1',
-    'aabenraa-l',
-    'aannemers',
-    'ab-negative',
     'abalones',
-    'abba/e',
-    'abbad',
-    'abdel-moneim',
-    'abderamane',
-    'abdomino-perineal',
-    'abdul-aziz',
-    'abdulhadi',
-    'abdulle',
-    'aberaeron',
-    'abermule',
-    'aberporth',
-    'abford',
-    'abjuring',
-    'abora',
-    'abortion-rights',
     'aboveground',
-    'abradial',
-    'absconder',
-    'absorbedly',
-    'absorbingly',
-    'absorbtion',
-    'abstemiousness',
-    'abstractionist',
-    'abulfaz',
-    'abuse.',
-    'ac/190',
-    'acacias',
-    'acc.',
-    'accell/oo',
-    'accentless',
-    'accidentalism',
     'acclaims',
-    'accommodation.',
-    'accompanimental',
-    'accompanists',
-    'accomplis',
-    'accretes',
-    'acellular',
-    'achaete',
-    'acher',
-    'achiet',
-    'achoo',
-    'achtenberg',
-    'acid/',
-    'acosta',
-    'acpd',
-    'acquisition.',
     'acrefair',
-    'acridine',
-    'acron',
-    'acrotergite',
-    'acrux',
-    'acsadi',
-    'action-centred',
-    'action-sequences',
-    'actium',
-    'actuarially',
-    'actuates',
-    'actvity',
-    'acutest',
-    'acyanogenic',
-    'ad/m-19',
-    'ad534',
     'adaptational',
-    'additively',
-    'adelizia',
-    'adeptness',
-    'ader-tajan',
-    'adh3',
-    'adjustability',
-    'adma',
-    'admonishments',
-    'adp-induced',
-    'adscombe',
-    'adsorptive',
-    'adswood',
-    'adult-like',
-    'advertizing',
-    'advisery',
     'aeas',
-    'aeginetan',
-    'aelius',
-    'aelurostrongylus',
-    'aerogenerators',
-    'aeromedical',
-    'aeromonas',
-    'aesir',
-    'aestheticist',
-    'aestivum',
-    'aetate',
-    'aewha',
-    'afec',
-    'affectionless',
-    'affinal',
-    'affirmatives',
     'afflatus',
-    'affordable-housing',
-    'afman',
-    'africanisation',
-    'afrikaaners',
-    'afro-asia',
-    'afro-cuban',
-    'afterburners',
-    'agaune',
-    'agavi',
-    'agentive',
-    'aggersborg',
-    'agglutinin',
-    'aghios',
-    'agism',
-    'agitato',
     'agnellis',
-    'agnello',
-    'agoge',
-    'agoutis',
-    'agraphia',
-    'agrarianist',
-    'agreements.',
-    'agri-environmental',
-    'agribusinesses',
-    'agrigento',
-    'aguilares',
-    'ahearn',
-    'ahuja',
-    'ahus',
-    'ai\'a',
-    'aim/feb',
     'aine',
-    'aintrey',
-    'air-britain',
-    'air-delivered',
-    'air-fresheners',
-    'air-vents',
-    'air-washed',
-    'air/sea',
-    'airdrionians',
-    'airer',
-    'airfresh',
-    'airing-cupboard',
-    'airmic',
-    'airmotive',
-    'airscrew',
-    'airspaces',
     'airstones',
-    'aishwarya',
-    'ajkharra',
-    'ak47s',
-    'akabussi',
-    'akhromeev',
-    'akinyele',
-    'akoka',
-    'akron',
-    'aksaray',
-    'al&iacute',
-    'al-abairsh',
-    'al-afghani',
-    'al-ahmad',
-    'al-ahram',
-    'al-attiya',
     'al-fasi',
-    'al-mahdi',
-    'al-muntasir',
-    'al-rashid',
-    'al-talhi',
-    'al-zahrani',
-    'al/1',
-    'alaoui',
-    'alarmists',
-    'alate',
-    'alatis',
-    'alayne',
-    'albeda',
-    'albertbridge',
-    'albifrons',
-    'albimanus',
     'alcade',
-    'alcohol-induced',
-    'alda',
-    'aldersbrook',
-    'aldh2',
-    'aldwyns',
-    'alecock',
-    'aleuts',
-    'alevras',
-    'alexanders',
-    'alfalit',
-    'alfredsson',
-    'alfv&eacute;n',
-    'algebraist',
-    'algorithmically',
-    'aliceholt',
     'alienative',
-    'alighieri',
-    'aligot&eacute',
-    'aliment',
-    'alive-o',
-    'aliveness',
-    'alkaid',
-    'alkaios',
-    'alkaline-loving',
-    'alkalinization',
-    'alkaloidal',
-    'alkmaionidai',
-    'all-engulfing',
-    'all-fired',
-    'all-items',
-    'all-merciful',
     'all-points',
-    'all-regular',
-    'all-russia',
-    'all-scottish',
-    'all-season',
-    'all-seasons',
-    'all-through',
-    'all-too-familiar',
-    'allaby',
-    'allanbridge',
-    'allcomers',
-    'allcroft',
-    'allenthorpe',
-    'allgood',
-    'alliterations',
-    'allonby',
     'allora',
-    'allotropic',
-    'almost-empty',
-    'alpenstock',
-    'alpha-',
-    'alpha-helix',
-    'alpha-osf/1',
-    'alpha-particles',
-    'alphanumerically',
-    'alphaville',
-    'alpine-style',
-    'alpinus',
-    'already-existing',
-    'alsation',
-    'alseny',
-    'alsford',
     'alstead',
-    'alsvcott',
-    'altaclarensis',
-    'altbach',
-    'alter-egos',
-    'altoist',
-    'altomani',
-    'altringham',
-    'altruists',
-    'altvater',
-    'altynai',
-    'alveolitis',
-    'alveolus',
-    'alverstoke',
-    'alveston',
-    'amanbayev',
     'amants',
-    'amata',
-    'ambergate',
-    'amblyopia',
-    'ambrosial',
-    'ambusher',
-    'amendable',
-    'americanization',
-    'amfreville',
-    'amiable-looking',
-    'aminopyrine',
-    'amnion',
-    'amounderness',
-    'amp/hr',
-    'amparai',
-    'ampfield',
     'amphotericin',
-    'amphoterics',
-    'amphotropic',
-    'ampullae',
-    'amstetten',
-    'amuck',
-    'an/or',
-    'anacardiaceae',
-    'anacrusis',
-    'anaemias',
-    'anaerobes',
-    'anaesthaesia',
-    'anal-sadistic',
-    'analogia',
-    'analogic',
-    'analysists',
     'analyzes',
-    'anamnesis',
-    'anangel',
-    'ananias',
-    'anatavan',
-    'anatomic',
-    'ancor',
-    'ancrum',
-    'and-a',
-    'and-nuclear',
-    'and-so',
-    'and_no',
-    'andeans',
-    'andf-like',
-    'andimba',
-    'andreae',
     'andrene',
-    'androcles',
-    'andru&tcedil;a',
-    'andsnes',
-    'anemometry',
-    'angelenos',
-    'angelically',
-    'angiosperm',
-    'anglet',
-    'angliae',
-    'anglo-asian',
-    'anglo-boer',
-    'anglo-burman',
-    'anglo-burmans',
-    'anglo-frankish',
-    'anglo-us',
     'angriest',
-    'angustifolia',
-    'animal-derived',
-    'anion-sensitive',
-    'anisopus',
-    'ankle-boots',
-    'anna-lisa',
-    'annalistic',
-    'annalists',
-    'anne-sophie',
-    'annexationist',
-    'anning',
-    'announcment',
-    'annual/extraordinary',
-    'anot',
-    'anouska',
     'ansaldo',
-    'ansari',
-    'anselmian',
-    'ansi/x3/sparc',
-    'answerer',
-    'antagonises',
-    'antechambers',
-    'antechapel',
-    'anterooms',
-    'anthemion',
-    'anthropologies',
-    'anti-apprenticeship',
-    'anti-arafat',
-    'anti-arrhythmic',
-    'anti-brdu',
-    'anti-clotting',
     'anti-diana',
-    'anti-diarrhoeal',
-    'anti-divorce',
-    'anti-fasciclin',
-    'anti-foreign',
-    'anti-hacking',
-    'anti-hcv',
-    'anti-hiv',
-    'anti-industrial',
-    'anti-inflammatories',
-    'anti-leeds',
-    'anti-marketeers',
-    'anti-modern',
-    'anti-nazis',
-    'anti-nsf',
-    'anti-paxos',
     'anti-proliferative',
-    'anti-pylons',
-    'anti-rational',
-    'anti-spanish',
-    'anti-tag',
-    'anti-trade-union',
-    'anti-vivisectionists',
-    'anti-yeltsin',
-    'antibody-injected',
-    'antich',
-    'anticlinal',
-    'anticlines',
-    'anticyclone',
-    'anticyclonic',
-    'antielectron',
-    'antigenically',
     'antiinflammatory',
-    'antineutrinos',
-    'antioestrogenic',
-    'antiphony',
-    'antireligious',
-    'antisemites',
-    'antistatic',
-    'antitrypsin',
-    'antonie',
-    'antoniolli',
-    'anwaar',
-    'anxiety-ridden',
-    'anyth',
-    'ap&eacute;ritifs',
-    'apartment-block',
-    'apelles',
     'aper&ccedil;us',
-    'aphakic',
-    'aphrodisian',
-    'aphrodisians',
-    'apia',
-    'apiary',
-    'apley',
-    'apocynaceae',
-    'appar',
-    'apparantly',
-    'apparentements',
-    'appartement',
-    'appartment',
-    'appelmans',
-    'appendicular',
-    'appendixes',
     'appetisers',
-    'apple-ibm',
-    'apple-like',
-    'apple/ibm',
-    'applies.',
-    'appositional',
-    'appraisee',
-    'appreciated.',
-    'april&ndash;may',
-    'april-1',
-    'apron-strings',
-    'apterygota',
-    'aql',
-    'aqmd',
-    'aquamarines',
-    'aquarium/pond',
     'aquavitae',
-    'ar.iii',
-    'arab-american',
-    'arab-islamic',
-    'arandaspis',
-    'arbib',
-    'arborea',
-    'arboreality',
-    'arch-villain',
-    'archaically',
-    'archaisms',
-    'archdale',
-    'archdeaconries',
-    'archedictyon',
-    'archimage',
-    'archivum',
     'archroy',
-    'arcsystems',
-    'ardeene',
-    'arden-clarke',
-    'ardhowen',
-    'ardila',
-    'ardours',
-    'ardrossan-saltcoats-stevenston',
-    'ardzinov',
-    'arefiev',
-    'aregund',
-    'arels',
-    'arenberg',
-    'arenenberg',
-    'arensberg',
-    'argerich',
     'argille',
-    'arguelles',
-    'argument.',
-    'arguments.',
-    'arguta',
-    'arians',
-    'aricie',
-    'arinze',
-    'arisaig',
-    'aristocratic-looking',
-    'aristocratically',
-    'arkel',
-    'arkengarthdale',
-    'arlebury',
-    'arm-bands',
-    'armella',
     'armenia/azerbaijan',
-    'armida',
-    'arncott/oxfordshire',
-    'arnulfo',
-    'arolium',
-    'arrangment',
-    'arrangments',
-    'arrast&iacute;a',
-    'arrica',
-    'arrien',
-    'arron',
-    'arrow-slits',
-    'arrythmias',
-    'artabanos',
-    'artcs',
-    'arterials',
     'arteriovenous',
-    'articulators',
-    'artnewsletter',
-    'arundale',
-    'arundinacea',
-    'as/set',
-    'as_well.',
-    'asbestos-contaminated',
-    'ascetical',
-    'ascomycetous',
-    'ascriptively',
-    'asexuality',
-    'ashbrook',
-    'asheim',
-    'ashley-cooper',
-    'asian-african',
     'aslett',
-    'asm160',
-    'asociaci&oacute;n',
-    'asoka',
-    'aspera',
-    'asperities',
-    'asportation',
-    'asquithian',
-    'assegais',
-    'assembly-lines',
-    'assessorship',
-    'assiduousness',
-    'assimilative',
-    'assortative',
-    'assortments',
-    'assuagement',
     'assumptive',
-    'astatoreochromis',
-    'asthmatically',
-    'asti_spumante',
-    'astons',
-    'astrik',
-    'aswirl',
-    'asynchronously',
-    'at&amp;t-backed',
-    'at-the',
-    'atanas',
-    'atanasie',
-    'atf-1',
-    'atheer',
-    'athelhampton',
-    'atheoretical',
     'atk.',
-    'atkey',
-    'atmosphere.',
-    'atomist',
-    'atomists',
-    'atrophies',
-    'attendence',
-    'atterbury',
-    'attilio',
-    'attitudes/beliefs',
-    'attleborough',
-    'attoumane',
-    'attractant',
-    'attractive-looking',
-    'aub',
-    'aubretia',
     'auburee',
-    'aucklander',
-    'audaer',
-    'auditable',
-    'auditorily',
-    'augustans',
-    'auken',
-    'aulus',
-    'auratus',
-    'authoritativeness',
-    'authorships',
-    'autoanalyser',
-    'autocracies',
-    'autograph-hunters',
-    'autoinjector',
-    'autopilots',
     'autopoietic',
-    'autoradiographs',
-    'autosomes',
-    'autotitrator',
-    'autumns',
-    'auxie',
-    'auxin',
-    'availabilities',
-    'avails',
-    'avarag',
-    'avatars',
-    'ave.',
-    'avelino',
-    'averheim',
-    'averill',
-    'avocation',
     'avory',
-    'avowing',
-    'avows',
-    'avron',
-    'awarenesses',
-    'awkward-looking',
-    'awud',
-    'axe-head',
-    'axiomatisation',
-    'ayia',
-    'aylard',
-    'ayleston',
-    'aylott',
-    'aylward',
-    'azcuna',
-    'azeotropic',
     'azimuths',
-    'azoic',
-    'azouz',
-    'b&amp;d',
-    'b&prime',
-    'b-boys',
-    'b-cells',
-    'b-movies',
-    'b-values',
-    'b.a.e.c.',
-    'b.c.r.',
-    'b.k.',
-    'b.o.',
-    'b.o.q.',
-    'b.r.o.t.h.e.r',
-    'b.t-h.',
     'b/',
-    'b/05/25/0000',
-    'b1.8',
-    'b1257',
-    'b1700',
-    'b19c12',
-    'b302',
-    'b41',
-    'b52s',
-    'b74',
-    'b8+',
-    'ba-pb-zn',
-    'babbies',
-    'baberton/westburn',
-    'babyishly',
-    'bacca',
     'baccalaur&eacute;at',
-    'back-and-forth',
-    'back-iron',
-    'back:an',
-    'backcloths',
-    'backend',
-    'backlands',
-    'backstitching',
-    'backwards-compatible',
-    'bacterially-expressed',
-    'bad-temperedly',
-    'badly-burned',
-    'badly-damaged',
-    'badly-injured',
-    'badon',
-    'badsworth',
     'badulla',
-    'bagchi',
-    'bagdad',
-    'bagdale',
-    'baggies',
-    'bagheera',
-    'bagmen',
-    'bagots',
-    'bahamians',
-    'bainey',
-    'bainsfair',
-    'baitrunner',
-    'baj',
-    'bakeman',
-    'bakhtinian',
-    'bakhuizen',
     'balaenoptera',
-    'balanus',
-    'balaz',
-    'balbriggan',
-    'balko',
-    'ball-ends',
-    'ballgame',
-    'ballmer',
-    'ballygowan',
-    'ballylee',
-    'balnaan',
-    'baloon',
-    'balquhidder',
-    'balsham',
-    'baltimores',
-    'bambury',
     'bandanas',
-    'bandoleers',
-    'bangert',
-    'banias',
-    'banjos',
-    'bank\'s/organisation',
-    'bankhaus',
-    'bankings',
-    'bannerji',
-    'banquettes',
-    'banteay',
-    'baptie',
-    'baptizes',
-    'baqr',
-    'bar-counter',
-    'bar-giora',
     'bar-lines',
-    'baranczak',
-    'baranja',
-    'barda',
-    'bare-bones',
-    'bargy',
-    'barialay',
-    'bariatinskii',
-    'barillo',
-    'bark.',
-    'barnes/aylesbury',
-    'barnes/london',
-    'barnes/milton',
-    'barnes/raf',
-    'barnetby',
-    'barnett/cheltenham',
     'barnett/reporting',
-    'barouches',
-    'barques',
-    'barras',
-    'bartel',
-    'bartz',
-    'barwise',
-    'base-exchange',
-    'base-lined',
-    'base-pair',
-    'baseliner',
-    'baseload',
-    'baset',
-    'bashall',
-    'bashlachev',
-    'bashmekov',
     'basilio',
-    'basketloads',
-    'basquill',
-    'bass/midrange',
-    'bassett/newent',
-    'bassett/wiltshire',
-    'bassists',
-    'bastable',
-    'bat-uul',
-    'bath-based',
-    'bath/shower/wc',
-    'bathful',
-    'bathing-trunks',
-    'bathonga',
-    'battering-rams',
-    'battlelines',
     'batuan',
-    'baughen',
-    'bauunternehmung',
-    'bawls',
-    'baya',
-    'bayerisches',
-    'bayldon',
-    'baymouth',
-    'bbrc',
-    'bbv',
-    'bcm1',
-    'be\'aviour',
-    'beachampton',
-    'beachballs',
-    'bealer',
-    'beall',
     'beaminster',
-    'beamson',
-    'bean-bayog',
-    'bearlike',
-    'beaumes',
-    'beauveau',
-    'beav.',
-    'becak',
-    'beccarian',
-    'beckham',
-    'beckwith-smith',
-    'bed-chambers',
-    'bedford-st',
-    'bedframe',
-    'bedrolls',
-    'bedsocks',
     'bee-killing',
-    'beefier',
-    'beefs',
-    'beens',
-    'beer-mat',
-    'beer-stained',
-    'beerling',
-    'beesmarket',
-    'beggarman',
-    'begger',
-    'beguinage',
-    'beheadings',
-    'beiersdorf',
-    'beldi',
-    'belemnoids',
-    'belgi&euml',
     'belief-systems',
-    'believed-in',
-    'bell-bottom',
-    'bell-pushes',
-    'bell-ringers',
-    'bell-towers',
-    'bellarosa',
-    'bellass',
-    'bellcrest',
-    'bellin',
-    'bellingshausen',
-    'bellot',
-    'belt-driven',
-    'beltring',
-    'belvederes',
-    'benabou',
     'benard',
-    'benflis',
-    'benford',
-    'benguet',
-    'beni-gomez',
-    'benjaminian',
-    'bennelong',
-    'benninghoff',
-    'bennison',
-    'beno&icirc;t',
-    'benouville',
-    'benthos',
-    'benvolio',
-    'benzaldehyde',
-    'benzoic',
-    'benzylpenicillin',
     'bequeaths',
-    'bergholt',
-    'berinsfield/oxfordshire',
-    'bermudians',
-    'bernarda',
-    'bernardi',
-    'bernays',
-    'bernieranus',
-    'berov',
-    'bertelsen',
-    'berthaultii',
-    'bertotti-robinson',
-    'berwyns',
-    'besner',
-    'bessacarr',
-    'bessant',
     'besson',
-    'best-attended',
-    'best-balanced',
-    'best-of-the-day',
-    'best-run',
-    'bestiaries',
-    'bestirring',
-    'bestwick',
-    'bethlin',
-    'betook',
-    'betrayers',
-    'betrobi',
-    'bettaware',
-    'bettembourg',
-    'better\'n',
-    'better-drained',
     'better-qualified',
-    'better-quality',
-    'better-than-average',
-    'better-value',
-    'betting-slips',
-    'betton',
-    'bettys',
-    'bevanites',
-    'bevvies',
-    'bewitchingly',
-    'beye',
-    'beyga',
-    'bft',
-    'bgbase',
-    'bgq',
-    'bh15',
     'bhajan',
-    'bhandari',
-    'bheur',
-    'bhlh-z',
-    'bhorairaig',
-    'bi-bop',
-    'bi-coloured',
-    'bi-fold',
-    'bi-national',
-    'bi-sexual',
-    'biao',
-    'biblicae',
-    'bibliographically',
-    'bicyclists',
-    'bidwells',
-    'bient&ocirc;t',
     'biersteker',
-    'bifasciatum',
-    'big-punching',
-    'big-serving',
-    'big-spenders',
-    'bigha',
-    'bigland',
-    'bignoniaceae',
-    'bigsun',
-    'biisk',
-    'bikesheds',
-    'bikin',
-    'bikkembergs',
-    'bilaterality',
-    'bildungsroman',
-    'bilineal',
     'billet-doux',
-    'billetor',
-    'billion-a-year',
-    'billionths',
-    'billy-le-grand',
-    'bilquis',
-    'bilsland',
-    'bimolecular',
-    'bin-bags',
-    'binary-compatible',
-    'binary-is',
-    'binchester',
-    'bindingness',
-    'bindon',
-    'binford',
-    'bings',
     'binocs',
-    'bio-life',
-    'bioanalytical',
-    'biodata',
-    'biodynamic',
-    'biogeographic',
-    'biolabs',
-    'biometric',
-    'biophysicist',
-    'biosignal',
-    'birani',
-    'birch-trees',
-    'birchington',
-    'bird-pollinated',
-    'birdbaths',
-    'birdshot',
     'biriani',
-    'birns',
-    'birthday.',
-    'birthdee',
-    'birthstone',
-    'bischoffs',
-    'biscop',
-    'biscuit-tin',
-    'bisection',
-    'biset',
-    'bishen',
-    'bishopscourt',
-    'bislet',
-    'bitburg',
-    'bitola',
-    'bitonal',
     'bitterne',
-    'biumo',
-    'bizone',
-    'bjorlow',
-    'bjornerstedt',
-    'black-flagged',
-    'black-gloved',
-    'black-gowned',
-    'black-marketeers',
-    'black-uniformed',
-    'blackens',
-    'blackflies',
-    'blackheaded',
-    'blacknest',
-    'blade-like',
-    'blaines',
     'blaisdon',
-    'blaise-line',
-    'blakelands',
-    'blane',
-    'blank-eyed',
-    'blanquilla',
-    'blasgo',
-    'blatherwick',
-    'bleb',
-    'bleistein',
-    'blent',
-    'blewbury',
-    'blindbeck',
-    'blindman',
-    'blockhouses',
-    'blockish',
     'bloedel',
-    'bloice',
-    'blomefield',
-    'blood-shot',
-    'blood-smeared',
-    'blood-stream',
-    'blood/crips',
-    'bloodsuckers',
-    'blowback',
-    'blowfly',
-    'blowlamps',
-    'blown-off',
-    'blue-tiled',
-    'blues/rock',
-    'bluesbreaker',
-    'bluesmen',
     'bluffers',
-    'blunderingly',
-    'blundeston',
-    'blvd',
-    'bmif',
-    'bmnh',
-    'bn7',
-    'board-game',
-    'boardgame',
-    'boarding-houses',
-    'boardman-tasker',
-    'boarium',
-    'boat-load',
-    'boat-owners',
-    'boat-people',
-    'bobcat',
     'boddys',
-    'bodhisattva',
-    'bodnantense',
-    'body-size',
-    'boese',
-    'bog-eyed',
-    'bogen',
-    'bogha',
-    'bogomilism',
-    'bogy',
-    'bohan',
-    'boiler-makers',
-    'bolection',
-    'bolivarian',
-    'bolshies',
-    'boltguns',
     'boluses',
-    'bolzano',
-    'bombazine',
-    'bondfield',
-    'bondsman',
-    'bone-dry',
-    'bone-setters',
-    'bone-weary',
-    'bongaarts',
-    'bonifac',
-    'bonjella',
-    'bonkeleh',
-    'bonville',
-    'bonynge',
-    'boo&die;tis',
-    'boody',
     'book-collectors',
-    'boornazian',
-    'boors',
-    'bootable',
-    'bootman',
-    'booz-allen',
-    'booze-ups',
-    'boquhan',
-    'bordure',
-    'borila',
-    'borkovsky',
-    'bornhausen',
-    'borodina',
-    'borofsky',
-    'boros',
-    'bortsch',
     'bosanska',
-    'boskin',
-    'bosnian-serb',
-    'bosnian-serbian',
-    'bosons',
-    'bossy-boots',
-    'bostons',
-    'botafogo',
-    'botta',
-    'bottle-conditioned',
-    'bottle-necks',
-    'bottle-shaped',
-    'bottled-up',
-    'bottlenosed',
-    'bottlers',
-    'boucl&eacute',
     'boudoirs',
-    'boughey',
-    'nature-nurture',
-    'navtec',
-    'nayak',
-    'nazim',
-    'nazirite',
-    'nbfi',
-    'ncdware',
-    'ncga',
-    'ndu',
-    'near-neighbour',
-    'near-post',
-    'near-white',
-    'neare',
-    'nearline',
     'neasa',
-    'nechtansmere',
-    'neckplate',
-    'needin\'',
-    'needle-knife',
-    'needwood',
-    'nef',
-    'negative-going',
-    'negatively-charged',
-    'neighs',
-    'neisse',
-    'nematoda',
-    'nematodiriasis',
-    'nena',
-    'nenko',
-    'neo-norman',
     'neo-realists',
-    'neoliberal',
-    'neopetrolisthes',
-    'neopilina',
-    'nephesh',
-    'nerval',
-    'neryungri',
-    'nesh',
-    'nestos',
-    'netherhall',
-    'netserver',
-    'netsuke',
-    'nettell',
-    'neuromythology',
-    'neuropsychiatry',
-    'neurosyphilis',
     'never-',
-    'never-never-land',
-    'neverending',
-    'new-routing',
-    'new-technology',
-    'newarthill',
-    'newboy',
-    'newly-completed',
-    'newly-made',
-    'newly-married',
-    'newly-privatized',
-    'newsbooks',
-    'next-door-neighbour',
-    'ngatse',
-    'ngau',
-    'nian',
     'niavaran',
-    'nibthwaite',
-    'nicd',
-    'nichetti',
-    'nicholsons',
-    'nickol',
-    'nicolls',
-    'nicomachean',
-    'nicostop',
-    'nicotined',
-    'nieder',
-    'night-fighter',
-    'night-glasses',
-    'night-spot',
-    'nightshifts',
-    'nigrescens',
     'niigata',
-    'nikes',
-    'nikitin',
-    'nilgin',
-    'nilotic',
-    'niman',
-    'nine-ish',
-    'ninth-wicket',
-    'nipponese',
-    'niru',
-    'nitro-chalk',
-    'nitsa',
-    'nitshill',
-    'nixed',
-    'nizhny',
-    'nlrb',
     'nnah',
-    'no-menacing',
-    'nocks',
-    'noelte',
-    'noke',
-    'nomenclatura',
-    'non-adhesive',
-    'non-anglo',
-    'non-assertiveness',
-    'non-authoritarian',
-    'non-bloc',
-    'non-branch',
-    'non-civilian',
-    'non-compact',
-    'non-dancing',
-    'non-discretionary',
     'non-dividing',
-    'non-dollar',
-    'non-dualist',
-    'non-english-speaking',
-    'non-entity',
-    'non-irritant',
-    'non-jury',
-    'non-learning',
-    'non-library',
-    'non-linguist',
-    'non-neutrality',
-    'non-newtonian',
-    'non-ownership',
-    'non-penetrance',
-    'non-pensioner',
-    'non-people',
     'non-possession',
-    'non-primate',
-    'non-receptor',
-    'non-recovery',
-    'non-reducing',
-    'non-reflexive',
-    'non-relative',
-    'non-representative',
-    'non-rival',
-    'non-steroid',
-    'non-stipendiary',
-    'non-striker',
-    'non-success',
-    'non-title',
-    'non-tribal',
-    'non-uniformity',
     'non-ventilated',
-    'non-welsh',
-    'nonces',
-    'nooky',
-    'noranda-kerr',
-    'nordenfalk',
-    'nordics',
-    'normalises',
-    'norman-style',
-    'normansfield',
-    'norplant',
-    'norrback',
-    'northstar',
-    'nose-bleed',
-    'nose-to-nose',
-    'nosh-up',
     'nostovision',
-    'not-',
-    'noticeability',
-    'notker',
-    'notman',
-    'nottingham-born',
-    'notturna',
-    'novasports',
-    'novi-belgii',
-    'nowy',
-    'noyons',
-    'nsm',
-    'nuccio',
-    'nuclear-waste',
-    'nuform',
-    'null-grav',
     'nullius',
-    'number(s)',
-    'nunton',
-    'nupa',
-    'nurul',
-    'nutkins',
-    'nutri-system',
-    'nutton',
-    'nuuk',
-    'nwc',
-    'nyeri',
-    'nylon-strung',
-    'nythyhel',
-    'o\'c',
-    'o\'cathain',
-    'o\'hear',
     'o-clock',
-    'oakenshield',
-    'obat',
-    'obelix',
-    'obholzer',
-    'obrero',
-    'observateur',
-    'obsessing',
-    'ocarina',
-    'occident',
-    'ocean-island',
-    'ocho',
-    'ochshorn',
-    'ockendon',
-    'ockrent',
-    'octal',
     'octobrist',
-    'octopussy',
-    'oddly-shaped',
-    'odones',
-    'odontocetes',
-    'off-the-page',
-    'offbreaks',
-    'offenham',
-    'offor',
-    'offwidth',
-    'ogam',
-    'oil-company',
-    'oil-finished',
-    'oireachtas',
-    'oiseaux',
-    'okidata',
     'oko',
-    'old-',
-    'old-money',
-    'oldcastle',
-    'oldcorn',
-    'older-style',
-    'oldershaw',
-    'olimpico',
-    'olive-branch',
-    'ollo',
-    'olmos',
-    'olo',
-    'oloroso',
-    'ombre',
-    'omnicorp',
-    'on-load',
     'one(s)',
-    'one-night-stand',
-    'one-person-one-vote',
-    'one-teacher',
-    'ongueme',
-    'onofre',
-    'onze',
-    'oold',
-    'open-and-shut',
-    'open-handedness',
-    'open-hearth',
-    'open-palmed',
-    'operationalising',
-    'ophiohelus',
-    'ophiomitra',
-    'ophiotholia',
     'opojaz',
-    'opto-electronics',
-    'optometry',
-    'oranje',
-    'orcas',
-    'orchis',
-    'order-driven',
-    'order-making',
-    'orderwhich',
-    'organ-playing',
-    'orions',
-    'ornamentals',
-    'orthega',
-    'ortner',
-    'orwin',
-    'osa',
     'osbaldeston',
-    'oscaig',
-    'ose',
-    'osenat',
-    'osip',
-    'other-world',
-    'otium',
-    'ottaviano',
-    'ottelia',
-    'otterson',
-    'ottocento',
-    'ouk',
-    'ous',
-    'out-front',
-    'out-house',
-    'out-of-breath',
     'out-of-competition',
-    'out-of-form',
-    'out-of-hospital',
-    'out-of-place',
-    'out-reach',
-    'out-stare',
-    'outbidding',
-    'outlives',
-    'outport',
-    'ovac',
-    'ovenden',
-    'ovensafe',
-    'over-18s',
-    'over-centralized',
-    'over-demanding',
-    'over-eat',
     'over-exploited',
-    'over-fed',
-    'over-head',
-    'over-impressed',
-    'over-invest',
-    'over-played',
-    'over-stretch',
-    'over-the-shoulder',
-    'overnights',
-    'overstand',
-    'overstimulate',
-    'overstrike',
-    'overswing',
-    'overviewing',
-    'ovetari',
-    'ovimbundu',
     'ovono',
-    'ox-tongue',
-    'oxenhall',
-    'oximeter',
-    'oxygenase',
-    'oyu',
-    'p-channel',
-    'p-end',
-    'p.v.c.',
-    'p144-d6',
-    'p47',
-    'paar',
-    'package-tour',
-    'packet-switching',
-    'pacquement',
-    'pactel',
     'padres',
-    'padrone',
-    'paesana',
-    'pagels',
-    'pagnan',
-    'paint-ball',
-    'pairts',
-    'pakiteng',
-    'palacegate',
-    'palcic',
-    'pale-gold',
-    'paleschi',
-    'palipehutu',
-    'palm-reading',
-    'palomine',
-    'pampa',
     'pan-germanism',
-    'pandelis',
-    'panelists',
-    'panja',
-    'panth&eacute;on',
-    'pantos',
-    'papaconstantinou',
-    'papadakis',
-    'papae',
-    'paparazzo',
-    'paper-knife',
-    'papi',
-    'papuans',
-    'paragram',
-    'paraparaumu',
-    'paraprocts',
     'parascaris',
-    'parboil',
-    'parisiennes',
-    'parkview',
-    'parlay',
-    'parlett',
-    'parleying',
-    'parnevik',
-    'parnis',
-    'parrotfish',
-    'parthenius',
-    'party-piece',
-    'partygoer',
-    'parveen',
-    'pass-off',
-    'passage-work',
     'passata',
-    'passo',
-    'patent-leather',
-    'patiens',
-    'patient-care',
-    'patman',
-    'patri&oacute;tica',
-    'pattern-cutting',
-    'patullo',
-    'paullinus',
-    'pauperised',
-    'pavanne',
-    'pavlovo',
-    'pavo',
-    'pawls',
-    'payless',
     'pbs-tween',
-    'pc-5a',
-    'pdp-laban',
-    'peace-line',
-    'pearlstein',
-    'pedestrianise',
-    'pedicel',
-    'pedullas',
-    'peepshow',
-    'pegai',
-    'pelagianism',
-    'pelta-urn',
-    'pelvises',
-    'pen-friend',
-    'penalty-area',
-    'penalty-taker',
     'pencil-line',
-    'pendergrass',
-    'pendos',
-    'pengappah',
-    'penninghame',
-    'pennock',
-    'pennyburn',
-    'pennyman',
-    'penone',
-    'pensarn',
-    'penscynor',
-    'pentecostals',
-    'pentheus',
-    'people-centred',
-    'pep-talk',
-    'pepa',
     'peper',
-    'pepped',
-    'pepping',
-    'pepstatin',
-    'perdikkas',
-    'perdue',
-    'peremptoriness',
-    'perfectly-formed',
-    'perge',
-    'perigueux',
-    'period-instrument',
-    'perivale',
-    'periwinkles',
-    'perlite',
-    'permuterm',
-    'perowne',
     'persica',
-    'personality-type',
-    'perugian',
-    'pescado',
-    'pessoa',
-    'pestles',
-    'peterlin',
-    'petrashevsky',
-    'petrify',
-    'petrocaravi',
-    'petroline',
-    'petrosyan',
-    'pettingill',
-    'pf(i)',
-    'phair',
-    'phalanxes',
     'phaselis',
-    'pheasantry',
-    'phenylamine',
-    'philistia',
-    'philosophiae',
-    'phocylides',
-    'phoenicopterus',
-    'phospho-free',
-    'photo-op',
-    'photo-reconnaissance',
-    'photo-session',
-    'photocolor',
-    'photogrammetry',
-    'photoprocessing',
-    'photorealism',
-    'photosetters',
     'photosynthesizing',
-    'phpa',
-    'phrynius',
-    'phtestr',
-    'pick-handle',
-    'picking-up',
-    'picosiemens',
-    'picquigny',
-    'pictionary',
-    'pie-eyed',
-    'pier-and-door',
-    'piesse',
-    'piga',
-    'piggie',
-    'pigswill',
-    'pikas',
     'pileri',
-    'pilgrim-narrator',
-    'pillagers',
-    'pillorying',
-    'pillow-talk',
-    'pillowslips',
-    'pilobolus',
-    'pilsudski',
-    'pinchinthorpe',
-    'pine-green',
-    'pinetum',
-    'pink-fleshed',
-    'pink-washed',
-    'pinkayan',
-    'pinscher',
-    'piny',
     'piotrovskiy',
-    'piracha',
-    'pisagua',
-    'pisanello',
-    'pisceans',
-    'pisistratid',
-    'pissaladi&egrave;re',
-    'pistol-shot',
-    'pit-closure',
-    'pitch-and-toss',
-    'pitchforked',
-    'pitter',
-    'pitter-patter',
-    'pituriaspids',
-    'pitz',
-    'pixe',
     'pizzicati',
-    'pizzle',
-    'plagiarising',
-    'plagiarized',
-    'plan\'',
-    'planemakers',
-    'plant-life',
-    'plantar',
-    'plantin',
-    'plasmalemma',
-    'plaster-of-paris',
-    'plate-armour',
-    'plautius',
-    'playdays',
-    'playgirl',
-    'playpark',
     'please-',
-    'pleasure-seeker',
-    'pleasureland',
-    'plip',
-    'plot-line',
-    'plou',
-    'pluie',
-    'plumbate',
-    'plynlimon',
-    'pmmlib.gimmspolydat',
-    'poacher-turned-gamekeeper',
-    'pochette',
-    'poetaster',
-    'poing',
-    'point-of-information',
-    'poison-pen',
     'polak',
-    'polarplus',
-    'polehill',
-    'polgars',
-    'polisy',
-    'polkerris',
-    'pollner',
-    'polski',
-    'poly(dg-dc)',
-    'polyclitus',
-    'polyhedral',
-    'polymaths',
-    'polyploidy',
-    'poncey',
-    'pongau',
-    'ponginae',
     'pool-room',
-    'pop-music',
-    'poppy-straw',
-    'port-au',
-    'portabello',
-    'portaloos',
-    'possible\'',
-    'post-1960',
-    'post-budget',
-    'post-collision',
-    'post-divorce',
-    'post-free',
-    'post-holder',
-    'post-initial',
-    'post-modified',
-    'post-ordination',
     'post-paid',
-    'post-sample',
-    'post-test',
-    'postmortems',
-    'pot-belly',
-    'potentiometers',
-    'poulain',
-    'poule',
-    'poult',
-    'pounc',
-    'pound-for-pound',
-    'pountaine',
-    'powell-tuck',
-    'power-broking',
-    'power-dressed',
-    'power-money',
     'power-play',
-    'powerscourt',
-    'pozderac',
-    'ppki',
-    'pr&eacute;sident',
-    'prabhaben',
-    'practioners',
-    'praelector',
-    'praen',
-    'prahalad',
-    'prairietek',
-    'pralines',
-    'prate',
-    'pratense',
-    'praveen',
-    'pre-1900',
     'pre-1960',
-    'pre-antibiotic',
-    'pre-arrangement',
-    'pre-auction',
-    'pre-celtic',
-    'pre-coated',
-    'pre-echo',
-    'pre-embryo',
-    'pre-feasibility',
-    'pre-feminist',
-    'pre-freudian',
-    'pre-interview',
-    'pre-knowledge',
-    'pre-performance',
-    'pre-process',
-    'pre-qualifier',
     'pre-rinse',
-    'pre-schooler',
-    'pre-screening',
-    'pre-sleep',
-    'pre-solo',
-    'pre-trading',
-    'pre-union',
-    'pre-visit',
-    'pre-work',
-    'precoverage',
-    'predischarge',
-    'preempting',
-    'preferred-issue-in-file',
-    'preformationists',
-    'preis',
-    'preplan',
     'prepp',
-    'preprocessing',
-    'prescriptivism',
-    'pressure-volume',
-    'prestissimo',
-    'prevlaka',
-    'prg',
-    'priest-administrator',
-    'primary-care',
-    'primatic',
-    'primeservice',
-    'primigravida',
-    'primos',
-    'princ',
-    'principes',
-    'print-form',
     'printing-house',
-    'prisca',
-    'prison-building',
-    'priyanka',
-    'pro-boer',
-    'pro-contra',
-    'pro-divorce',
-    'pro-range',
-    'probaby',
-    'problematised',
-    'proclaimers',
-    'procurator-general',
-    'prodrug',
-    'product-related',
-    'profix',
-    'profonde',
     'progressiste',
-    'progresso',
-    'progs',
-    'projecta',
-    'promenaders',
-    'promising-looking',
-    'property-',
-    'proportioning',
-    'proprionate',
-    'proscribes',
-    'prot',
-    'proteinases',
-    'proto-modernist',
-    'protostrongylus',
-    'protracting',
-    'provanmill',
     'prowle',
-    'pru-bache',
-    'prutz',
-    'przewalski',
-    'pseudo-',
-    'pseudo-intellectual',
-    'pseudopregnant',
-    'psl-s',
-    'psychodynamics',
-    'pteraspids',
-    'pteropus',
-    'pth',
-    'ptsd',
-    'pubescence',
-    'publ',
-    'public-address',
     'publicis',
-    'puc',
-    'pudden',
-    'pudding-bowl',
-    'puhe',
-    'pulegium',
-    'pull-in',
-    'pull-on',
-    'pull-outs',
-    'pulse-receiver',
-    'pulson',
-    'pumice-stone',
-    'punica',
-    'purdom',
-    'purificacion',
-    'purling',
     'purprestures',
-    'pwg',
-    'pycoma',
-    'pyelogram',
-    'pyscho',
-    'q-factor',
-    'quadrate',
-    'quarrier',
-    'quarter-turn',
-    'quartern',
-    'quatercentenary',
-    'quechua-speaking',
-    'queensborough',
-    'queerfella',
-    'quenya',
-    'questo',
     'queue-jumping',
-    'quich&eacute',
-    'quick-reference',
-    'quickspend',
-    'quieroz',
-    'quiet-spoken',
-    'quinsy',
-    'quintal',
-    'quivertipped',
-    'quondam',
-    'quran',
-    'r\'n\'r',
-    'r-3',
-    'r34',
-    'rabassa',
-    'rabaul',
     'rabotnichesko',
-    'racal-transcom',
-    'racecall',
-    'racegoer',
-    'radics',
-    'radiodiffusion',
-    'radiographers',
-    'radiolabel',
-    'radion',
-    'radiopaque',
-    'radipole',
-    'radji',
-    'radulescu',
-    'radwan',
-    'rafe',
-    'raffi',
     'rafique',
-    'raggatt',
-    'raid-5',
-    'rain-filled',
-    'raincloud',
-    'rainclouds',
-    'rainoldes',
-    'rainout',
-    'raipur',
-    'rajendra',
-    'rajhara',
-    'rakebrand',
-    'rakoff',
-    'ram-headed',
-    'ramaciotti',
-    'rameshwar',
     'ramfhear',
-    'ramgoolam',
-    'ramshorn',
-    'ramsons',
-    'rangpur',
-    'ransome-davies',
-    'rappeneau',
-    'rar',
-    'rare-earth',
-    'rastell',
-    'raster-based',
-    'rat-catchers',
-    'rathenau',
-    'ratina',
-    'ratione',
-    'rauff',
     'ravensbr&uuml;ck',
-    'rawn',
-    'raybould',
-    'raymakers',
-    'raymonde',
-    'rctc',
-    're-allocate',
-    're-allocating',
-    're-assigned',
-    're-balancing',
-    're-born',
-    're-fashion',
-    're-formatting',
-    're-locked',
-    're-placed',
-    're-possession',
     're-printed',
-    're-railing',
-    're-stating',
-    're-thread',
-    're-train',
-    're-tuning',
-    're-uptake',
-    'reacquired',
-    'rearticulate',
-    'rebased',
-    'rebu',
-    'rebuilders',
-    'recalculates',
-    'receivin\'',
-    'reclothed',
-    'recognicionesfeodorum',
     'recommissioned',
-    'recommit',
-    'reconnecting',
-    'record-review',
-    'recycler',
-    'red-noise',
-    'red-orange',
-    'rede',
-    'rediscoveries',
-    'redmoor',
-    'reduced-rate',
-    'reduplicated',
-    'reduplicating',
-    'reedman',
-    'reemerged',
-    'refered',
     'refinishing',
-    'reflectances',
-    'reforested',
-    'refractometer',
-    'reframed',
-    'refrozen',
-    'regionally-based',
-    'reglazed',
-    'rehovot',
-    'reichsmarks',
-    'reigne',
-    'reimer',
-    'reiswig',
-    'relativize',
-    'remnant-ocean',
-    'remortgaged',
     'remotely-controlled',
-    'renminbi',
-    'renouf',
-    'renouveau',
-    'reoccur',
-    'reoffer',
-    'reorient',
-    'repolished',
-    'repolling',
-    'repotting',
-    'representatively',
-    'republishing',
-    'requalifying',
-    'rerecorded',
-    'resealing',
-    'reseated',
     'resitting',
-    'respice',
-    'respiring',
-    'rest-house',
-    'reste',
-    'restormel',
-    'results-oriented',
-    'resupplying',
-    'resurrects',
-    'retiling',
-    'retrofits',
-    'rets',
-    'reva',
-    'revenue-producing',
-    'reverends',
-    'revolutionnaire',
     'reyburns',
-    'reynaud',
-    'rfe',
-    'rhe',
-    'rhodian',
-    'rhodizonate',
-    'rhulen',
-    'rhuvaal',
-    'rhythmics',
-    'ribbon-cutting',
-    'rice-water',
-    'rich-world',
-    'ridgley',
-    'rielly',
-    'rifugio',
-    'rigaud',
     'right-to-life',
-    'right-turn',
-    'rimes',
-    'ring-leader',
-    'ringadoo',
-    'rinns',
-    'riparia',
-    'riptide',
-    'risto',
-    'riunite',
-    'riverbeds',
-    'riverman',
-    'rizlas',
-    'rj-45',
-    'rmo',
-    'rncm',
     'road\'',
-    'road-blocking',
-    'road-rail',
-    'roadman',
-    'robo',
-    'robredo',
-    'rock-drill',
-    'rockboots',
-    'rocket-powered',
-    'rockettes',
-    'rodway',
-    'roecastle',
-    'rolan',
-    'rollneck',
-    'romanian-speaking',
-    'rominger',
     'romiti',
-    'rompers',
-    'rooley',
-    'root&mdash;package&mdash;required',
-    'roozen',
-    'ropers',
-    'rosellina',
-    'rosener',
-    'rosenhan',
-    'rosse',
-    'rossem',
-    'rosy-fingered',
-    'rotherwood',
-    'rotty',
-    'rotumans',
-    'roubaix',
     'roumanian',
-    'rousted',
-    'routerxchange',
-    'roys',
-    'rpr-udf',
-    'rubber-covered',
-    'rubberband',
-    'rubble-filled',
-    'rubbra',
-    'ruchazie',
-    'ruck-maul',
-    'rudolfinum',
-    'rudow',
-    'rueing',
-    'ruffside',
-    'rufinus',
     'ruinas',
-    'ruivo',
-    'ruleset',
-    'rumelia',
-    'run-over',
-    'run-scorer',
-    'runnicles',
-    'running-board',
-    'russian-american',
-    'rust-red',
-    'rustem',
-    'rustika',
-    'ruza',
-    'rwigyema',
-    'ryarsh',
-    'ryding',
     's&oslash;rensen',
-    's\'not',
-    's-shape',
-    's-type',
-    's.t.',
-    's1&ndash;s4',
-    's210',
-    's46',
-    's65(6)&mdash',
-    'sa&ocirc;ne',
-    'sab',
-    'sabira',
-    'sachr',
-    'sacim',
-    'sacko',
-    'sacrified',
     'saddiqi',
-    'saddo',
-    'sadowitz',
-    'sadria',
-    'saffil',
-    'sagittarii',
-    'sailin\'',
-    'saintbridge',
-    'salado',
-    'sale-or-return',
-    'salicornia',
-    'sallows',
-    'salmonella-in-eggs',
-    'salmons',
-    'salpertons',
-    'saltwell',
     'salvadori',
-    'samosa',
-    'samsa',
-    'sand&zcaron;ak',
-    'sand-blasting',
-    'sandflies',
-    'sandhole',
-    'sandshoe',
-    'sandwith',
-    'sandy-coloured',
-    'sangma',
-    'sanguinis',
-    'sankukai',
-    'sansovino',
-    'santacruz',
-    'santal',
     'santoro',
-    'santry',
-    'saqr',
-    'sarabande',
-    'sarat',
-    'sarcomas',
-    'sarekat',
-    'sargassum',
-    'saria',
-    'sarkis',
-    'sarnen',
-    'sarrance',
-    'sarron',
-    'sartain',
-    'sarto',
-    'sata',
     'satin-covered',
-    'satra',
-    'saturday-morning',
-    'satyajit',
-    'saur',
-    'savicevic',
-    'savoir',
-    'sawaeng',
-    'sawgrass',
-    'saya',
-    'scaggs',
-    'scampers',
-    'scandalize',
-    'scandanavia',
-    'scandiaca',
-    'scare-mongering',
     'scarey',
-    'scarify',
-    'scattergrams',
-    'scene-of-the-crime',
-    'scerri',
-    'scet',
-    'schachtner',
-    'schall',
-    'scheinen',
-    'schillaci',
-    'schip',
-    'schirach',
-    'schistosoma',
-    'schlong',
-    'schneidau',
-    'schoener',
     'schollenen',
-    'schonberger',
-    'school-industry',
-    'school-master',
-    'school-parent',
-    'school-related',
-    'schoolteaching',
-    'schotland',
-    'schweig',
-    'schwinger',
-    'scifo',
-    'sciorra',
-    'scissoring',
-    'scoped',
-    'scott-kilvert',
-    'scouseology',
     'scragged',
-    'scrap-metal',
-    'screwgate',
-    'scriptories',
-    'scrooges',
-    'scrum-',
-    'scultura',
-    'scumstopper',
-    'sde',
-    'sds-sequestration',
-    'sea-chest',
-    'sea-coast',
-    'sea-crossing',
-    'sea-guard',
-    'seacontrol',
-    'seago',
     'sealion',
-    'sealskins',
-    'sealwatch',
-    'seamounts',
-    'search-light',
-    'seattle-based',
-    'sebring',
-    'second-ranked',
-    'seconda',
-    'security-building',
-    'seder',
-    'sedimenting',
-    'sedjo',
-    'seear',
-    'seed-time',
-    'seeler',
     'seema',
-    'seeman',
-    'seemani',
-    'seest',
-    'seger',
-    'seigner',
-    'seilern',
-    'selectives',
-    'selenite',
-    'seleskovitch',
-    'self-adjustment',
-    'self-admiration',
-    'self-aggrandizing',
-    'self-composed',
-    'self-copying',
-    'self-depreciation',
     'self-described',
-    'self-dramatizing',
-    'self-elected',
-    'self-emancipation',
-    'self-emptying',
-    'self-flagellation',
-    'self-incriminating',
-    'self-legislation',
-    'self-mastery',
-    'self-perfection',
-    'self-projection',
-    'self-publicity',
-    'self-publishing',
-    'self-regulated',
-    'self-testimony',
-    'self-torture',
     'self-venting',
-    'sell-through',
-    'sellwood',
-    'semarang',
-    'semi-comatose',
-    'semi-dwarfing',
-    'semi-educated',
-    'semi-evergreen',
-    'semi-hidden',
-    'semi-opaque',
-    'semi-rough',
-    'semiarid',
-    'semon',
-    'sempronius',
-    'senj',
-    'senker',
     'senlac',
-    'sentance',
-    'seona',
-    'serkin',
-    'serpins',
-    'servetus',
-    'sess',
-    'set-',
-    'set-down',
-    'set-out',
-    'setanta',
-    'seto',
-    'seva',
-    'seven-page',
-    'severino',
-    'seviche',
     'sex-and-violence',
-    'sex-drive',
-    'sextans',
-    'sh-',
-    'shackel',
-    'shadow-puppet',
-    'shafer',
-    'shag-pile',
-    'shahanshah',
-    'shahi',
-    'shaila',
-    'shakeara',
-    'shakenoak',
-    'shakur',
-    'shallow-draught',
-    'shallow-marine',
     'shammy',
-    'shamu',
-    'shanin',
-    'shanxi',
-    'share-for-share',
-    'sharemarket',
-    'sharking',
-    'shavina',
-    'shawl-collared',
-    'sheblee',
-    'sheelagh',
-    'sheeler',
-    'sheening',
-    'sheep-cropped',
-    'sheep-shearing',
-    'shefstvo',
     'shehadeh',
-    'shenai',
-    'shernazar',
-    'sherrard',
-    'shickman',
-    'shiftworking',
-    'shillingham',
-    'shining-eyed',
-    'shintoism',
-    'ship-burial',
-    'shirelles',
-    'shop-till-you-drop',
-    'shorefield',
-    'short-course',
-    'short-head',
-    'short-leg',
     'short-order',
-    'shorthair',
-    'shoval',
-    'show-stopping',
-    'show-through',
-    'shuard',
-    'shugborough',
-    'shujan',
-    'shukokai',
-    'si-18',
-    'sibenik',
-    'sick-leave',
-    'sicksicksick',
-    'siddington',
-    'siddiqi',
-    'side-footed',
     'side-strain',
-    'side-valley',
-    'side-wall',
-    'sidelamps',
-    'sidestreet',
-    'siegerrebe',
-    'sievert',
-    'sieyes',
-    'siga',
-    'sigbjoern',
-    'sigeion',
-    'siggraph',
-    'sigils',
-    'sign-writing',
-    'sih',
-    'sihler',
     'siju',
-    'sikels',
-    'sikilo',
-    'sikri',
-    'silflay',
-    'silkscreen',
-    'siltanen',
-    'silver-edged',
-    'silver-mounted',
-    'silver-white',
-    'simd',
-    'simplicius',
-    'simsek',
-    'simul',
-    'sindakira',
-    'sindelfingen',
     'sindicato',
-    'single-coloured',
-    'single-cone',
-    'single-instruction',
-    'single-place',
-    'single-syllable',
-    'singular-universal',
-    'sinix-tos',
-    'sinjsko',
-    'sinkful',
-    'sisam',
-    'sisyphean',
-    'site-related',
-    'sitia',
-    'sivota',
-    'siwash',
     'six-bedroomed',
-    'six-berth',
-    'six-length',
-    'six-line',
-    'six-nation',
-    'sixteen-foot',
-    'sixto',
-    'sixty-degree',
-    'skae',
-    'skala',
-    'skea',
-    'skellern',
-    'skender',
-    'sker',
-    'sketchin\'',
-    'skewton',
     'skilifts',
-    'skillmix',
-    'skin-type',
-    'skiptons',
-    'skues',
-    'skyraiders',
-    'slatterns',
-    'sleep-walked',
-    'sleeve-note',
-    'slimey',
-    'slinked',
-    'slinks',
-    'sloppiest',
-    'slot-blot',
-    'sloughy',
-    'slow-set',
     'sluggers',
-    'sluiman',
-    'slummy',
-    'smal',
-    'small-volume',
-    'smallman',
-    'smashie',
-    'smeatonian',
-    'smithmark',
-    'smla',
-    'smog-producing',
-    'smoking-jacket',
-    'smolts',
-    'smooth-bore',
-    'smoothes',
-    'smtp',
     'snakechasing',
-    'snapdragon',
-    'sneha',
-    'snitched',
-    'snodden',
-    'snookums',
-    'snot-green',
-    'snowboarders',
-    'so-named',
-    'soap-dish',
-    'social-control',
-    'social-work',
-    'socialistes',
-    'socinus',
-    'sockett',
-    'socred',
     'sofradex',
-    'soft-drink',
-    'soft-shoe',
-    'soft-skinned',
-    'software-related',
-    'soil-forming',
-    'solarex',
-    'solario',
-    'soldanos',
-    'solidaridad',
-    'solitaria',
-    'solstices',
-    'solution-generating',
-    'somet',
-    'somiryon',
-    'somosierra',
     'sompting',
-    'somthing',
-    'sorauf',
-    'sorption',
-    'soskin',
-    'souleiado',
-    'soumare',
-    'sound-image',
-    'sound-recording',
-    'south-coast',
-    'south-south-west',
-    'southdowns',
-    'southern-based',
-    'southerton',
-    'souths',
-    'southyork',
     'soviet-inspired',
-    'sovs',
-    'sozialistische',
-    'spacefleet',
-    'spanish-language',
-    'spartina',
-    'spd-led',
-    'speakman',
-    'speech-writing',
-    'speling',
-    'spell-checker',
-    'spetse',
-    'spidersuit',
-    'spijkers',
-    'spined',
-    'spinoff',
     'spiral-bound',
-    'spirit-filled',
-    'spirit-self',
-    'splatters',
-    'splish',
-    'spokeshaves',
-    'spondylus',
-    'sportscast',
-    'sportschannel',
-    'spr&uuml;th',
-    'spraining',
-    'sprakes',
-    'spray-wipe',
-    'spring-green',
-    'springflo',
-    'springtails',
     'sprockets',
-    'square-metre',
-    'squashtec',
-    'squiring',
-    'squirrelled',
-    'sras',
-    'srna',
-    'ss-24',
-    'ss13&mdash;15',
-    'st&eacute;phane',
-    'stabil',
-    'staedler',
-    'stage-management',
-    'stage-managing',
-    'stageprop',
-    'staiger',
     'staite',
-    'staled',
-    'stalky',
-    'stallen',
-    'stamina-sapping',
-    'stammerer',
-    'stampings',
-    'stand-down',
-    'stand-to',
-    'standard-fit',
-    'standard-gauge',
-    'standees',
-    'standesbeamte',
-    'stange',
-    'stanghow',
-    'stanislavski',
     'stanko',
-    'stanmer',
-    'stansmore',
-    'star-packed',
-    'starbursts',
-    'starserver',
-    'start-line',
-    'starting-to-work',
-    'startrek',
-    'statfjord',
-    'statio',
-    'statum',
-    'status-symbol',
-    'stavka',
-    'steamdays',
-    'steel-mesh',
     'steepling',
-    'steff',
-    'steiff',
-    'stenoses',
-    'step-printer',
-    'step-sister',
-    'stephie',
-    'stepladders',
-    'stevo',
-    'sticking-plaster',
-    'sticky-backed',
-    'stiebel',
-    'still-smoking',
-    'stilly',
-    'stms',
-    'stobhill',
     'stock-broking',
-    'stockpot',
-    'stockton-based',
-    'stoichactis',
-    'stomacher',
-    'stone-breaking',
-    'stone-strewn',
-    'stonefall',
-    'stonemasonry',
-    'stoos',
-    'stotfield',
-    'stoups',
-    'stoyaeka',
-    'straffan',
-    'straightly',
-    'strap-on',
     'strategems',
-    'strategically-placed',
-    'straths',
-    'stratimirovi&cacute',
-    'straw-burning',
-    'strawcrete',
-    'streamware',
-    'street-based',
-    'street-car',
-    'strepsiades',
-    'strike-rate',
-    'strikeforce',
-    'striking-out',
-    'strip-farming',
-    'strokkur',
-    'stromenti',
     'strongly-built',
-    'strongly-run',
-    'strongylosis',
-    'structural-functionalist',
-    'strummers',
-    'study-group',
-    'sturgiss',
-    'stymphalian',
-    'sub-cabinet',
-    'sub-commission',
-    'sub-delegate',
-    'sub-dividing',
-    'sub-editing',
-    'sub-lessee',
-    'sub-license',
-    'sub-littoral',
     'sub-market',
-    'sub-tribe',
-    'subcitrate',
-    'subfecundity',
-    'subfragments',
-    'sublimates',
-    'submediant',
-    'submersed',
-    'suborder',
-    'subserving',
-    'subtasks',
-    'subthemes',
-    'succentor',
-    'succinate',
-    'sueir',
-    'suen',
     'sultman',
-    'sumurun',
-    'sun-3',
-    'sun-seeking',
-    'suna',
-    'sunclassic',
-    'sundaravej',
-    'sundas',
-    'sundlun',
-    'sunray',
-    'supataps',
-    'superceded',
-    'superiore',
-    'supersilent',
-    'supination',
-    'suppling',
     'surburban',
-    'surendra',
-    'surete',
-    'surfwear',
-    'surjeet',
-    'surveyors-general',
-    'susato',
-    'susini',
-    'sutri',
-    'swainston',
-    'swannay',
-    'swanpool',
-    'sweat-streaked',
-    'swedish-made',
-    'sweepstakes',
-    'swepro',
     'swilken',
-    'swing-tip',
-    'swingswang',
-    'swissre',
-    'swordtail',
-    'syder',
-    'syke',
-    'syllabary',
-    'sylt',
-    'synaesthesia',
-    'synchromesh',
-    'syncline',
-    'synergia',
-    'syrimis',
-    'sysedit',
-    'systema',
     'sze',
-    'szeto',
-    't&eacute;l&eacute;com',
-    't\'lad',
-    't\'missus',
-    't\'sao',
-    't-lymphocyte',
-    't.v',
-    'ta\'kwaru',
-    'tablespace',
-    'tacchino',
-    'tachi',
-    'tacl',
-    'tacma',
-    'taegeuk',
-    'taewa',
     'tageblatt',
-    'taggit',
-    'tagil',
-    'tagle',
-    'tagmout',
-    'taheri',
-    'tahira',
-    'tail-gate',
-    'tail-rhyme',
-    'tailor-make',
-    'tailwagger',
-    'taimyr',
-    'tak-shing',
-    'takis',
-    'taku',
-    'tala',
     'talipes',
-    'talkabout',
-    'talking-head',
-    'talking-shop',
-    'tallaght',
-    'tallboys',
-    'tamora',
-    'tanagers',
-    'tanguy',
-    'tangye',
-    'tanktop',
-    'tannock',
-    'tape-based',
-    'tape-deck',
-    'taquile',
-    'tardive',
     'tarone',
-    'tarpon',
-    'tarpy',
-    'tarshis',
-    'taruffi',
-    'task-leader',
-    'tassled',
-    'tatami',
-    'tatoi',
-    'tattooist',
-    'tauc',
-    'tavares',
-    'tavel',
-    'taveners',
-    'tax-funded',
-    'tax-planning',
     'taxus',
-    'taylorian',
-    'tazmania',
-    'tbf',
-    'tbwa',
-    'tci',
-    'teacher-child',
-    'team-boss',
-    'tear-drop',
-    'techie',
-    'technologically-advanced',
-    'teg',
-    'telangiectasia',
-    'telefis',
-    'teleki',
-    'telekurs',
     'telepanel',
-    'teleprinters',
-    'telesquash',
-    'telled',
-    'tellenoreans',
-    'tellin',
-    'telomere',
-    'temporising',
-    'tempranillo',
-    'ten-bob',
-    'ten-goal',
-    'tengmalm',
-    'teniers',
-    'tennis-court',
-    'tentation',
-    'terauchi',
     'terce',
-    'terenure',
-    'terrans',
-    'terrazze',
-    'terrorist-type',
-    'tessel',
-    'test-piece',
-    'testamento',
-    'teta',
-    'teterborough',
-    'tetrahydrofuran',
-    'tetrarch',
-    'teuco',
-    'th-',
-    'thalassotherapy',
-    'thankee',
     'thanne',
-    'tharos',
-    'theek',
-    'thelonious',
-    'thematics',
-    'theme-park',
-    'then-prevailing',
-    'theory-practice',
-    'thereat',
-    'thermistor',
-    'thia',
-    'thiamine',
-    'thick-billed',
-    'thievin\'',
-    'thinkin',
-    'thinly-sliced',
     'thirlwall',
-    'thirst-quencher',
-    'thirty-eight-year-old',
-    'thirty-one-year-old',
-    'thirty-six-year-old',
-    'thirty-yard',
-    'thoman',
-    'thomasine',
-    'thomism',
-    'thorarin',
-    'thorwall',
-    'thousand-year',
-    'thrang',
-    'thrasyboulos',
-    'thrasymachus',
-    'three-bay',
     'three-core',
-    'three-decade',
-    'three-fight',
-    'three-note',
-    'three-pound',
-    'three-seat',
-    'three-stack',
-    'threshes',
-    'threshhold',
-    'throw-up',
-    'throwbag',
-    'thumbscrew',
-    'thunderclaps',
-    'thurow',
-    'thyme-scented',
-    'thys',
     'tic-tac',
-    'ticinese',
-    'tigrayans',
-    'tilscher',
-    'tima',
-    'time-course',
-    'time-piece',
-    'tinkles',
-    'tiramisu',
-    'tiroler',
-    'tithebarn',
-    'tlass',
-    'tmo',
-    'to-be',
-    'tobacco-sponsored',
-    'tobler',
     'toiles',
-    'toilet-bag',
-    'tojo',
-    'tokais',
-    'tolbertstead',
-    'tolbutamide',
-    'tollers',
-    'tolstoy-liking',
-    'tombolas',
-    'tongham',
-    'tooth-glass',
-    'tooze',
-    'top-',
-    'top-name',
-    'top-seeded',
-    'top-to-tail',
     'topend',
-    'topic-comment',
-    'topps',
-    'topshells',
-    'toreno',
-    'tortolano',
-    'tos',
-    'tota',
-    'totalise',
-    'toton',
-    'toulson',
-    'town-planner',
-    'tozzi',
-    'tpx',
-    'trabasso',
-    'trade-route',
     'trade-up',
-    'traduce',
-    'trag&eacute;die',
-    'traigh',
-    'tramline',
-    'tranby',
-    'trans-american',
-    'trans-border',
-    'trans-boundary',
-    'transistorised',
-    'transito',
-    'transmissibility',
-    'trashcan',
-    'trasylol',
-    'trc',
-    'trecastle',
     'trenet',
-    'treptow',
-    'trevalle',
-    'trevitt',
-    'trh',
-    'tri-annual',
-    'tri-gram',
-    'tribade',
-    'tribus',
-    'tribute-paying',
-    'tricastin',
-    'trickie',
-    'trickstick',
-    'tricoloured',
-    'tricolours',
-    'trierarchs',
     'triffic',
-    'triffin',
-    'triki',
-    'trimphones',
-    'trintignant',
-    'triode',
-    'triomfator',
-    'triplanes',
-    'trobrianders',
-    'trout-rod',
-    'trru',
-    'truck-driver',
-    'trustcard',
-    'trusts.',
-    'tryton',
-    'tsushima',
     'tudball',
-    'tuer',
-    'tug-o\'-war',
-    'tulkinghorn',
-    'tullio',
-    'tulun',
-    'tulving',
-    'tumber',
-    'tumed',
-    'tump',
-    'turca',
-    'turfus',
-    'turismo',
-    'turkic-speaking',
-    'turn-allocation',
-    'turned-back',
     'turnock',
-    'tustin',
-    'tutor-led',
-    'tutor-librarians',
-    'tuum',
-    'tweeny',
-    'twelve-man',
-    'twelveheads',
-    'twelvetrees',
-    'twenty-inch',
-    'twenty-one-year',
-    'twinset',
-    'twiston',
-    'two-and-a-half-hour',
-    'two-course',
-    'two-disc',
     'two-front',
-    'two-furlong',
-    'two-hander',
-    'two-putted',
-    'two-ring',
-    'two-row',
-    'two-slit',
-    'two-socket',
-    'txa',
-    'tybrith',
-    'tygers',
-    'typesize',
-    'typhon',
-    'tyrannicides',
-    'tyre-track',
-    'u-14',
     'u13',
-    'ub-level',
-    'ucits',
-    'ucm',
-    'uganda-based',
-    'uhu',
-    'uighur',
-    'ujam',
-    'ujdaid',
-    'uk-resident',
-    'ukrheeo',
-    'ulab',
-    'ulmo',
-    'ulss',
-    'ulsterfolk',
-    'ultra-leftist',
     'ultra-rightist',
-    'ultrasparc-ii',
-    'ulverton',
-    'umayyad',
-    'umayyads',
-    'umbels',
-    'umegawa',
-    'ummah',
-    'umtali',
-    'unbolt',
-    'unclad',
-    'under-35s',
-    'under-graduates',
-    'under-report',
-    'underrating',
-    'undersell',
     'undersheet',
-    'understan',
-    'underworlds',
-    'undie',
-    'unenglish',
-    'ungo',
-    'unidirect',
-    'unifoyle',
-    'unionize',
-    'unisource',
-    'universalize',
-    'universidad',
-    'universitaire',
-    'university-trained',
-    'unkillable',
-    'unpin',
     'unpo',
-    'unwithdrawn',
-    'unyoke',
-    'up-side',
-    'up-state',
-    'up-wind',
-    'upchurch',
-    'updm',
-    'updo',
-    'uphall',
-    'upholstering',
-    'upleadon',
-    'uppercase',
-    'uppercross',
-    'uranium-235',
-    'urban-core',
     'urben',
-    'uria',
-    'urolithiasis',
-    'uros',
-    'us-built',
-    'us-european',
-    'us-supported',
-    'usamah',
-    'usband',
-    'user-written',
-    'usha',
-    'ustasha',
-    'ustn',
-    'uto',
-    'uzgen',
-    'v&ouml;lker',
     'v-curve',
-    'v-formation',
-    'v-neckline',
-    'v-src',
-    'vacwell',
-    'vade-mecum',
-    'vagog',
-    'valco',
-    'valdimir',
-    'valiants',
-    'valin',
-    'valloire',
-    'vallois',
-    'value-judgement',
-    'vanderford',
-    'vandyck',
     'varadero',
-    'variant-of',
-    'varini',
-    'varty',
-    'vaselined',
-    'vassi',
-    'vatasescu',
-    'vatu',
-    'vaux-balbirnie',
-    'vaynol',
-    'vde',
-    'vdqs',
-    'vedo',
-    'velar-raising',
-    'velayati',
-    'velly',
     'velocipede',
-    'veneras',
-    'venerating',
-    'venette',
-    'veneziano',
-    'venna',
-    'venning',
-    'vente',
-    'venturini',
-    'venutius',
-    'verdad',
-    'verdier',
-    'verheyen',
-    'verificationist',
-    'versets',
-    'versified',
     'versing',
-    'very-long-baseline',
-    'verzekeringswezen',
-    'vesman',
-    'viaje',
-    'vian',
-    'viasa',
-    'vice-kapellmeister',
-    'vichyism',
-    'vichyssoise',
-    'victualled',
-    'vicuna',
-    'videodrome',
-    'videoram',
-    'videorecorder',
-    'vidscreen',
     'viertel',
-    'vietnam-backed',
-    'vietnamese-backed',
-    'vietnamese-installed',
-    'view-point',
-    'viewscreen',
-    'vigna',
-    'vignemale',
-    'vignes',
-    'vigors',
-    'vikki',
-    'villanova',
-    'villers',
-    'villiger',
-    'vilma',
-    'vinkenoog',
     'violet-coloured',
-    'violist',
-    'violoncello',
-    'virginals',
-    'viridis',
-    'visio',
-    'vistbacka',
-    'vitamin-a-supplemented',
-    'vivify',
-    'vix',
-    'vlasman',
-    'vlastimir',
-    'vlissingen',
-    'voice-leading',
-    'voigt-kelvin',
-    'vokani',
     'volare',
-    'volatility-volume',
-    'volgian',
-    'voloshin',
-    'vortexes',
-    'vossen',
-    'vote-maximizing',
-    'vouchsafing',
-    'vousden',
-    'vrabel',
-    'vraie',
-    'vroooom',
-    'vulcanology',
-    'vulpis',
-    'vusela-2',
-    'wachmann',
     'waist-band',
-    'waist-height',
-    'waked',
-    'wakiihuri',
-    'walburga',
-    'walby',
-    'walketh',
-    'walkley',
-    'walkovers',
-    'wall-painter',
-    'wall-walk',
-    'wallsgrove',
-    'wallston',
-    'walras',
-    'war-effort',
-    'warby',
     'warde',
-    'warden-controlled',
-    'wardman',
-    'warninks',
-    'warreners',
-    'waste-collection',
-    'wastewatch',
-    'water-flow',
-    'water-jug',
-    'water-main',
-    'water-saving',
-    'waterspouts',
-    'wattle-and-daub',
-    'wavey',
-    'wawel',
-    'waziristan',
     'wca',
-    'wealands',
-    'wealdmoors',
-    'wealth-generating',
-    'wealth-holding',
-    'weanlings',
-    'weaponless',
-    'weatherburn',
-    'weatherby',
-    'weatherfield',
-    'weathervanes',
-    'wedel',
-    'week-ending',
-    'week.',
-    'weetman',
-    'wegner',
     'weidmann',
-    'weifang',
-    'weighall',
-    'weighers',
-    'weimaraner',
-    'well-brushed',
-    'well-capitalized',
-    'well-conditioned',
-    'well-differentiated',
-    'well-played',
-    'well-provided',
-    'well-shod',
-    'well-sprung',
-    'wellbore',
-    'wellens',
-    'welte',
     'wenfordbridge',
-    'wenilo',
-    'werax',
-    'werl',
-    'werra',
-    'werry',
-    'westerfield',
-    'westite',
-    'westmann',
-    'westoff',
-    'wete',
-    'what\'s-her-name',
-    'whate\'er',
-    'whateley',
-    'wheddon',
-    'wheel-lock',
     'whiche',
-    'whil',
-    'whipper-snapper',
-    'whippersnapper',
-    'whippin\'',
-    'whipping-boy',
-    'whisps',
-    'white-',
-    'white-eye',
-    'white-stone',
-    'whitebred',
-    'whitecliff',
-    'whitecraig',
-    'whitesides',
-    'who\'se',
-    'who-dunnit',
     'whole-word',
-    'whooooooo',
-    'whupped',
-    'wicbc',
-    'wice',
-    'wickability',
-    'wicket-taking',
-    'wide-winged',
-    'wiesenthal',
-    'wifredo',
-    'wigan-based',
-    'wights',
-    'wilburn',
-    'wilford',
-    'wilhautyah',
-    'wiling',
     'wilk',
-    'willems',
-    'willowherb',
-    'wilshere',
-    'wilson-brown',
-    'wiltel',
-    'winalot',
-    'winbush',
-    'winding-down',
-    'windischgr&auml;tz',
-    'window-box',
-    'winegrowers',
-    'wing-patch',
-    'wingbeat',
-    'winkle-picker',
-    'winnersh',
     'winning-post',
-    'wire-netting',
-    'wirework',
-    'wirths',
-    'wised',
-    'wish-wash',
-    'wispa',
-    'witch-finder',
-    'wj',
-    'wll',
-    'wolfblood',
-    'wolfking',
-    'wolfman',
-    'wolpert',
-    'womanpower',
-    'wood-louse',
     'woodbank',
-    'woodscrews',
-    'woofs',
-    'woolhope',
-    'wooller',
-    'woolwork',
-    'word-finding',
-    'word-formation',
-    'wordage',
-    'work-group',
-    'workovers',
-    'workplan',
-    'workrate',
-    'world-changing',
-    'world-market',
-    'world-title',
     'wrasses',
-    'write-back',
-    'writenow',
-    'writing-master',
-    'wrynose',
-    'wspc',
-    'wuff',
-    'wully',
-    'wvr',
-    'wyatts',
-    'wyburn',
-    'wycliffite',
-    'wymer',
-    'wysepower',
-    'wythburn',
-    'wytschaete',
     'x-irradiation',
-    'xenakis',
-    'xerotech',
-    'xeroxed',
-    'xg',
-    'xiannian',
-    'ximp',
-    'yakitori',
-    'yakobi',
-    'yamahas',
-    'yano',
-    'yarm-based',
-    'yarmouk',
-    'yarra',
-    'yasar',
-    'yassa',
     'yasseen',
-    'yefrem',
-    'yellow-gold',
-    'yellowhammers',
-    'yellowtail',
-    'yeni',
-    'yibo',
-    'yippies',
-    'yis',
-    'yishuv',
-    'yockney',
-    'yorder',
-    'yorkstone',
-    'yoshiko',
-    'youghal',
-    'young(ish)',
     'youthaid',
-    'yser',
-    'ysfa',
-    'yucef',
-    'yuji',
-    'yukagir',
-    'ywe',
-    'zabaleta',
-    'zac',
-    'zaheer',
-    'zakks',
-    'zakrewski',
-    'zalman',
-    'zeichnungen',
-    'zein',
-    'zeist',
     'zelenovic',
-    'zettel',
-    'zeyer',
-    'zhores',
-    'zilpah',
-    'zimba',
-    'zimmern',
-    'zinc-plated',
-    'zind-humbrecht',
-    'zineb',
-    'zingiberaceae',
-    'zinkernagel',
-    'zinreich',
-    'zipporah',
-    'zobel',
-    'zobernig',
     'zoppot',
-    'zora',
-    'zoya',
-    'zur&uuml;ck',
-    'zutshi',
-    'zygmunt',
+)
+
+blocks_27 = (
+    '&(amanitin&(subunits"$mp;a%\'control%\'johnson%\'mcmanus%!o%)pettijohn&#lus&#ray%!q%$ring%&sup214%!t")ring;berg',
+    '\'-ngstr&ouml;ms!-bgr;-carotene\'#ell";sol;lite&bsol;pcprobe&bsol*!*ccedil;ift"*ommat;echo!%deg;n"&gr&ngr%#rgr$,;-endotoxins%!c%!l%!w"*ollar;0.43+!4',
+    '+!9*"51*"63+!6+!7*"81+!6(%1,130*$200m*#350*$480m*#750-!m*#850)#.02',
+    '*"21+"5m*"36*"81*"99)%0,500*/0&ndash;140,000+"00*%2,000*%5,000*"bn))1,000,000*".2+"8m+"9m',
+    '*%8,000)$2.2m+"50*)0,000,000)#3.4+"9m*%5,000*!9)&4,000m+#500*#.8m)$5.50+!8)$6.3m+"8m',
+    '*!2*%5,000)%7,500*#.7m+"8m*"0m)%8,500*#.3m*!5+!m)%9,500*".4+"7m*%5,000*"6m',
+    '(&2,100m+"50*#900),.5&ndash;3.5*#8bn*#9bn)%0,500*/0&ndash;250,000)$1.6m*%0,000)$2.4m+"9m)!3*"0m)$4.5m',
+    ').5&ndash;35,000*#.7m*!5)$6.1m+"2m)&70,000*%4,000)$8.6m*"0m)!9*#.2m+"5m*!5*!m)\'billion',
+    '()3&ndash;4)#.45*"75)$0.9m)%1,500*#.1m+"2m*!m)#26m)#35m)!4*"4m)"65*!m)#70m',
+    '*!5)!8*#.6m)"99(%4,200*$600m)".3*!6).0&ndash;60,000*/0&ndash;600,000+2,000&ndash;600,000)$1.9m)%2,000*"2m)%3,000',
+    '*!m).5&ndash;60,000)"6m)"70+!m*%5,000)!8*"0m*"9m)!9*$,000*!5)"bn(%5,100*#300',
+    ')000&ndash;600,000*"bn)%1,000*!m)&20,000*%5,000)"45)"60)#95m(%6,600)#.4m)000&ndash;800,000)%2,000*"5m*!m',
+    '*$,000*!m)#68m)#70m($7000)"14)"20*!m)$3.5m)"8m($8.2m*!5*"7m)!1)"4m',
+    '(%9,500)".6*!9))0,000,000)!6)%7,000(%sup13!.eacute;chevins)"us(/l&eacute;vation)"ie()paulement".gr&prime&prime!)frac12;d.(%miles',
+    '%"35%"45!&gt;0.5$$1000%!2$"60$#80%$#six#\'=60/min!*iexcl;dame\'"mi"$ns;.!(kgr/&kgr!$le;1",sqb;i&rsqb;t',
+    '#%;0.01\'!2$"1%%"0%$#2.4%!0$"30%!5$#4.0$#50%$"60$!9$$i&gt!,mdash;durham\'#had',
+    '\'"no\',particularly\'"so\'$this\'#who"&icro;s\'!u!\'ndash;3\'!o!,oacute;engus!*plus;0.193(#386"(ound;0.7\'%1,020*"70',
+    '*"40)\'300,000*"50)#695(#.01*!3*!6)"11*!8)"27)(5billion)#65m*!9)"71*!9',
+    ')"82)(99/150ml(00&ndash&pound;15)#.3m*"40*"70)30,000&ndash;150,000.$,000*!.*"00)$2.7m)"6m)"8m(%1,500)#.4m',
+    '*"6m)"4m)$5.00*!0)"6m)!7)%8,000)\'billion)"m.(%2,600*#800)".2)%1,000)%7,000)"8m',
+    ')"bn(%3,700)".4+!m*"7m)!4)"5m(#4.2*"6m*"70),0,000-a-year)"3m)\'million(,5,000-a-year)#.24',
+    '*!5+!m*"75)%2,000)%3,000)%5,000(%6,500*#700)#.1m*"25*!5)%2,000)!3)%5,000)%8,000',
+    '($7.25*!7)"00)"50*!m)$9.95(#8.1)"6m)%7,000($9.00*!2*"90)!6)$9.95(&m-plus',
+    ')#650)#845)#950(#.06*!9*!m)(1million)"39*\'million)#4bn)"68*"bn)#75m(.0&ndash;25,000)$,280',
+    '*"9m)30,000&ndash;300,000*\'million)%3,000)%5,000)%8,000(%1,300)#.3m*"40*"7m)"0m)!3)!4)(5million)!7',
+    ')!9($2.00*!5*"75*"99)%4,000)!6(%3,700)#.30*"95+!9)!2($4.00)"2m(%5,500',
+    '*"80)30,000&ndash;350,000)%5,000($6.3m*"50)!7(#7.6)!1)!2)!3)"5m)!6(\'8-a-day)#.3m*"95',
+    ')!3)"5m)!8)"bn(#90m)!2\'-3&ndash;5,000($,450)#670().6million)"70)"85(20,000&ndash;50,000-$,000)#.1m',
+    '*"95)#000)!2)!7)!k($1.6m)!1)!8(#20m)!6("33*2,000&ndash;466,000)!9($4.50)"0m',
+    ')!4)!6*$,800)!7("55*$,000($6.25*"50($7.00)!6)!9($8.5m)%6,000)!8("9*',
+    ')"5m\'-4&ndash;6,000($,750(#.10*!9)#5m.+&illion)"85()0,000,000)!6)%9,000)\'million($1.6m(&28,000("32',
+    '($4.50($5.50)%2,000)!9(&60,000)!5($7.99)!3(%8,500)#.50)%0,000*!m(%9,000)!m(\'billion',
+    '($,350)#700*"50)#900(#.24)(3billion)"40*!5)(5million)"9m(#/kg(.0&ndash;70,000)1,000&ndash;80,000)+0,000-rated*#000',
+    ')!k(21,500&ndash;77,300)!2*!m(&227.63)%5,000("36(%4,500)#.50*"95+!9)!9(#60m($7.50)"1m',
+    '\'%6,150)#600(#.20)"40*!9)"60("35)!9($4.50)%0,000)"5m("56(#600)!2)56,000&ndash;1,000,000',
+    '(%7,500)!6("8m("m.)&illion\'%7,800)#950(".1)"29)"40*!1*!5)"65(.0&ndash;90,000)#.00',
+    '("1m(%3,000)!2($5.00)!8(%7,400)!5*$,000(%9,950\'*8&ndash;100%2,000($,800($.1bn*!m)!2',
+    '*!m)"65)!7)"80("10*$,000(&20,000)%5,000(#37m(#43m(#500*!m($8.45)!m($9.00',
+    '*"50)#400)#999(".4*!1*!9)!6*!5*!m)"80)!9*!0*!m($1.7m(&25,000',
+    ')!m("49(#50m(%7,000("8m("90)!m(\'million\'"cp\'\'million!(sect;270"%im;10!*times;1000(!2(!8',
+    '\'.;device&verbar #\'58!"67"%9/\'70!"97!$boks!%clock!$eads##ven""rs!%ighly""m.!"lo!#m_a!#now',
+    '""ok!&re_all!$shin"#ome"(pecially!"to!&undred!#who \'*******"$john"\'michael#\'ohammad"%peter"&robert!!.',
+    '!%abdol$%ullah"$hmad"%lhaji!!b"&ernard!#cli!#gen!\'ibrahim""f*"!n!$jean"$orge!"le!&marcel',
+    '"%ight*!#one!&pierre!%samir!"w3 $+&gt!"33!"40!"57!!8!"90!#vat \'-&dgr;h!$0.48#!6',
+    '#%0&deg#!8"!3!"21!#3.0"!6"!7"!8!#451!(50&deg;c"!5!"73!&90&deg!"an!&coated',
+    '!#era!$four!#hcg"#elp!#led!4monomethy-d-arginine!"of#!-!(positive!&repair!#sec""ix!$they!-us&dollar;700 #.01',
+    '!%303in"!7!"44 #/5%!#ae/!%bcl-2!\'calcium"#opy!"d/""ay!!e!"o/!!p!!r!#the',
+    '!$what#!o ,0&middot;001*!1*"63)!3)!4)!6"(ndash;11("62)!3(!7!&\'clock!$,0,0#"00',
+    '"!5!&.00001$!6$!9#"14#"28#"35#"83#!z"+1&ndash;0.2#"5%",25&ndash;0.5"\'3&mgr;g"#413#25&micro;m-filtered',
+    '")5&ndash;1+".0"#6pc"&75&ins$"ms"#9kg!"/3!.002&ndash;0002""11""30"!9"#:06#"43$!8#"50',
+    '"#.00"#:06#"31$!2$!4$!5$!8#"48!#208""30"!5""70"!9"#:10$!1',
+    '$!9#"35$!9!#302""26#!9""32"!4"#:09#"12!%401.3##4.2""37"!5"!7',
+    '"&922182#!4"#:39!#503#!5$#.43&!7"%1-709""27"!7""90"#:09#"10$!4#"29',
+    '$!7#"48#"55$!7$!8!%602.5#!7""23""30""93"#:00#"10$!3$!9#"20',
+    '#"57!#706"+1&ndash;381*#434,!9+"99*#584,!9*#628+"30*#722*#834*#937#$-242""23',
+    '""89""95"#:00$!3#"10#"21#"30#"42!#802"+1&ndash;748""60""95"#:04!09.30&ndash;17.30""02',
+    '#!9"+1&ndash;384*#567"!2"!3#!4""43#!5"!5"#:00$!1#"10!"ea!!x %1&agr',
+    '")divide;15"/frac12;-address\'04&ndash;1&frac12(#;lb"\'mdash;3#\'iddot;5"/ndash;1&ndash;0)$/4in)"26))5&ndash;0(\'2&deg;c)!1)!8("31("7%',
+    '"\'times;1!#(c)""d)!),000-plus&(year-old%"ml$!3#"30"#119#"20#"35#"75$!8"%2,3,5#$00ft',
+    '#"40#"60"#305#"80"#536"!6#"25#"40#"53#"70"#704#"30#"67"*800-strong%"ft',
+    '#"80!&-for-1"\'megabit"\'relrate!$.025""1a#"pc"&25&ins""34#"kg#"pc"#4.0#!1#!2##5pm',
+    '"+5&ndash;2.5##0pm#!1#"5%#"gb"#6.5#!3#"5%$!m""7.$!2#!3#!6#!8""80',
+    '#!p"$9-kb#!9!%/16in""26#!d#!m#"oz"!5"$60th"$80th#!9#"in"#mpg!%0%fcs',
+    '$)icro;g/ml#(ndash;23*!6)"35"!+"$,400##600"#-17#*compatible#$user"/.00&ndash;18.00%$a.m.#$15am$!v##25p',
+    '$!b$!d#"46$!7#$50pm$!3$"pc#"60$!5$!6##7.6#$8(a)"#/13#$2/87#!l',
+    '$)ndash;120##(3)#),000-plus\'"th#"-1$&metres#".4#(000/year#"17##4.5##733%!4##bhp##khz##mev',
+    '"#1/2#*5&mdash;16#!p"&35&deg##bhp"\'4&deg;f#!6"#500$!s##bhp##mph#"th""82"*9&ndash;21#$,000',
+    '"#:00$!9#"15$!8#"24#"30$!7#"47#"54"%base2"&inches""lc""ms#"yr""nm',
+    '#\'ndash;0)"25)"43)!7"#(5)"#,12##300""-2#!7"/.00&ndash;17.00$!7#"22$!4$!6#"34',
+    '#"41$!9##85p#"9p"#/88"\'0&deg;c$(ndash;11#\'0&deg;c#$1.10#$2.12%!7##3.1%!2%!3#$5.00',
+    '"*1&ndash;12+!3#!3#"th",2&frac12&deg#$-day""38""4p""6a#"th"#701""9."#:04#"10#"20',
+    '"!e""km!)2&ndash;4)!7"#-10$!2#!6#!9#$copy#$foot#\'strings"%.15am$!6$!8#"24',
+    '$!9#"48#%5&ins#"6p"*0&ndash;25##000#"gb#"hz#!m$!w#"th"+1&ndash;122#,6&ndash;1307##mph#"st',
+    '#!p")3&ndash;4")4&ndash;5#$,000"*53&ndash;4"*7&ndash;52$&sol;87#$,000#)3&ndash;4"+8&times;128#)2&ndash;3#)6&ndash;9"#:10$!2$!4',
+    '#"37""ml"!x!*3&mdash;16#(ndash;03)"10)!3)!4)!6)!8#(shilling"#-18#&minute$$onth($-old',
+    '$#3.2$!9##2.2$!4$!9##3.1$!0$!2$!3#"4p##5.3$!9#"6p##7.8#"99',
+    '"#/14"%0&deg##000#"km#"lb#"th")1&ndash;2#!p")2&ndash;7#$,000#)4&ndash;5#)6&ndash;7#)8&ndash;9#"kv"$3722',
+    '#*8&ndash;49"+59&ndash;60#"mm")6&ndash;7#$,000#&0/1992#!p"$7mph#!p#"th")8&ndash;9#"th"#:10#"33#"52',
+    '!*4&ndash;11"(,000,000##200##400&#bps##600##800""-6#$club"#.1%$!0$!5#"24$!7##3.2',
+    '#"48##7.5#"95"#/77""2%"#4gb#"pp")5&ndash;6##mph")6&ndash;7#!p"%7,000##7/8"#:17#"49',
+    '!)5&micro;g#(ndash;22*"5%)#30%"#(4)"$,350"#-14#"24#&second$%trong"#.12$!3$!6#"25#"41',
+    '##8.3"#0km#!w"%2,000#!s"-61&ndash;1626"$7mph"*86&ndash;7"":1$!6#"40""mb#"ph"!o"#th-',
+    '#(frac12;p#(ndash;22)"59)!6)!8)!9"(,000,000"#-22##bar#$race"#.12#"25#"4%#"55$!m',
+    '"&/11/87"\'0&deg;c##0cc#*1&ndash;27#"km#"mm"%1,000"#2.5#)8&ndash;9"%3,000#*9&ndash;40"-42&ndash;1727#)7&ndash;8"*50&ndash;1#)6&ndash;8',
+    '#)8&ndash;9")7&ndash;8"%87.50#!p"-97&ndash;1837#!p"#:14#"21""oz!*7&ndash;11"#(c)"$,300##700##800"#-10',
+    '#%point"$.05p#"11#"25$!6$!9#"40$!7#"65#"95"-00&ndash;1880,#900#"ft"%1,000#*1&ndash;76',
+    '#!s"*33&ndash;4#&7-1800"*47&ndash;8#*9&ndash;50"-56&ndash;1836"%6,000")7&ndash;8#,2&ndash;1834#*3&ndash;74#,8&ndash;1830#!p"*95&mdash;6!)8&ndash;6"#,19',
+    '#$plus$$oint#%stone%$rong"#.10#"5p#"9%""0%##/pi#,0&ndash;1840#)6&ndash;7,!3##mph"+11&mdash;12"(2&sol;83',
+    '#*8&ndash;30#!p"*36&ndash;7"*46&ndash;7#*8&ndash;51#!p"-51&ndash;1951#)3&ndash;4#)5&ndash;6#)6&ndash;7#*9&ndash;60"+60&ndash;90#)4&ndash;9#)6&ndash;7#)8&ndash;9',
+    '")8&ndash;9#)0&ndash;1,#910.!4$"\'s#)4&ndash;5#"5a#)7&ndash;9"(9&sol;87#)2&ndash;3#)3&ndash;4#)6&ndash;8#*8&ndash;99"#:15#!2',
+    '"!h""lb"#pts!(9&frac12#(ndash;23)!3"#-25#!6#&minute#)years-old"".0#"20#"45#"6%#"9%',
+    '#$9/87"-00&ndash;2100#)2&ndash;3#)3&ndash;5#*4&ndash;05#*9&ndash;11#"cm"%1,000#*4&ndash;16#,5&ndash;1932#*8&ndash;20#*9&ndash;21"*20&ndash;2#*1&ndash;25#*9&ndash;33',
+    '#)4&ndash;9#)5&ndash;9#)6&ndash;9#*8&ndash;40#$9-45#!p")4&ndash;5#"05#*1&ndash;42#"4.#*5&ndash;52+!6+!9$#-50#$6/47',
+    '#*9&ndash;51,!3"*50&ndash;1+"51$!5#)1&ndash;2+!5#*2&ndash;53#)3&ndash;4$"/4#)7&ndash;8$!a#*8&ndash;59#*9&ndash;61,!4',
+    '"+60&ndash;63$#/61$"s.#$8/69"*70&ndash;3#*1&ndash;75+"88$#/72#*2&ndash;89$"/3%"73#*3&ndash;79$"/4#*4&ndash;78$"/5',
+    '$#-78&!9#*6&ndash;86$!c#*7&ndash;80$#/78%!8##8/9$!c#,9&ndash;1980+"88$%-1989%"89$!c#!p',
+    ',!3,!6$"/1#)1&ndash;5+"90$#-89#*2&ndash;89+"90,!2#*3&ndash;85,!6$#-85#(4&sol;85$$/193#$5-90',
+    '$#:21#*6&ndash;90$%-1988%"91$!.$$/062#,7&ndash;1988+"92#"9f#!p"+91&mdash;92%(ndash;96$2/swindon/wiltshire%9uckington/gloucestershire$!c',
+    '$</castlemorton/worcestershire%*gloucester%&oxford%\'richard#*3&ndash;95$#/95#)6&ndash;7+"97""km!#:05"$30am#!3#!4#!7""41',
+    '!"ab"!p"!z!"b2"!b!"g5""hz!"hn!!k""hz!!l"!d"!x!"m8"#gml',
+    '!"qh!#st.!"th!!v!\'x12&ins#%5&ins!"yt"!x %2&ast"*frac12&ins(#;lb"$half"\'mdash;6(!7#&icro;l',
+    ')!6)!7()2&ndash;2)!3(&5.30pm"\'times;1!3\',5\'-oligoadenylate!#(c)"&f)/123!0,000&ndash;3,000%&-3,000&$mile&$plus%"kg#"40',
+    '#"80"#129#"49#"56"%218.8#&50,000"#315"!4#&00,000")500-litre%"th#"83"#710"#999!+-compatible',
+    '")year-olds!#.02#!4#!8#!m"$1.16##0.3#$2(1)#!a""29"#3.7#!7""42#!3##5pm',
+    '#!9##ghz"$5(a)$"b)#".2$!3#\'million"%6.1.1$!6#!1#!6#"kb""82#!3#!4',
+    '#!5!+0&mdash;25p$&icro;m#(ndash;15)#40%*!5#(shilling"$,002"#-26#"50#$akce##bed#!c#$plus"#.20',
+    '#"9%""/1#"26"\'0&mgr;l#%-plus$$word#"kb#!w""16""2a"#30s#!6#!8""41#"8k',
+    '##(1)#$2/88#"th""80"!e""gb""hz"!n"\'th/21st"!v!*1&ndash;12)"21)!6)!9"$,500',
+    '$!4#$fret#)month-old#&strong"#.14$!9#"2%"$/apr##may""01#!g#!m"(2-member#!6"$3/89',
+    '#!p""62#!3"!b!*2&ndash;10*!4)"20"&,000ft#\'500,000#\'982,000"#-30"%.8.89"#/23##jan$#uly',
+    '")0&ndash;1#!7#!v""20""37""44#!p")5&ndash;6""7p""80""kt"#lbs!*3&ndash;13)"28"$,500',
+    '"#.14#"6%"$/dec""02#*c/450f/gas"%3,000#!1#!2""45#!p""5p""75"!e"!t!)4&ndash;0',
+    ')"42)!6)#aug"$,200""-0#!h##oct"#.3%#"7%"$/aug##nov#$sept""2p"#402""70',
+    '##811"":1#"47""gb"!s!%5&ins#\'ndash;3)"44)"64)"74#&percnt"#.4%")0,000,000##0ft#"29',
+    '""1p"%2,000""50""6k#%m-bit"%7,000"+:1&ndash;13"#cms"#min#"yr")th-minute$!.!%6&deg"#,27"#-30',
+    '""/7"#000""70#!1""80""9p!\'7&deg;c#&frac12#(ndash;18)!8)!9"$,500"%-year"".9"$0031',
+    '$$1-09"*5,000-volt"#739"!c""mm!$8.4%#$8.90"%/4/87""07#!e"+3&ndash;284"+5&ndash;286""6s""8p""lb',
+    '""xx!%9,500"%-dec."%0,000#"00""14#!5""7p"":1"!c!#:19""24""40"!5"!8',
+    '!"bn!#hrs!"jx!"lj"!u!"ml"!t!"nm!!r!!w!"xx *3&frac12;p"(ndash;13)!7("24',
+    '!#(6)""s)!&,000kg%"th"\'300,000"\'700,000"\'900,000!"-8"$week!#.03#!7"$1(b)#".4$!6#"pc',
+    '#$2(b)"%3.1.1&!2#!m"%4.4.2#!1#!7#!8"%5/3.5##4:1"#6.1#$/3.6#!4#!a"#7.4',
+    '#"5%#!m""80#!8""90!#/92!)0&ndash;1)#300*!6)!4#&percnt"#(1)"*,000-tonne"&-april#$feb.',
+    '##5cm#"8%#"9%"%0&deg#(,000,000##-km$#odd#&g/11oz#!k$!g#"lb#!s#!w"#150""36',
+    '"%4/306#!p""65""80#!8"#90s#!4!&1-year"#.4%#!9""01""2p""30#!2""41',
+    '"!a"!b!\'2&deg;c#\'ndash;7"#(1)"%-bits#&member"#.4%"\'00/5316$!k""10#!2##762""50"#767',
+    '"!m""pc!*3&ndash;45"$,600"!.#"2%#!9"#000"$1133#!p""2p""40#%67-68""55"&647-48',
+    '#!p")p/minimum$#per!)4&ndash;0)"40#&sol;82"#(3)"$.063#!2#"3%#"4%"&070-73$!2"#162""42',
+    '"%50-up#!5#%65-68""72#!7"#989"!b")th-minute!*5&ndash;37*!9)"45)!6"+,000-strong"#-40"#.1%',
+    '",0&mgr;molmol#$0rpm$!s#"24#"bp#"cc#!s"#382$$8-90"#600#"26#"65#"th"#742#"th',
+    '#"22#"84!*6&ndash;40*!7)"51"#.5%#!6"#040#!p#!s"#137#"61"#238"&328-29#"80',
+    '$!2#"23$!8#"34#"55#%63-64$!4$!5#"73#"85"#502$$8-09#"25$!7#"38',
+    '#"53$!8#"62$!4#"81#!p"#603#"35#%40-42$$1-42$!7#"58#"67$!8"#700',
+    '#"41#"77$!8"&800-01$$9-10#"33#"51#"92#!p"&925-26##369#"51#%60-61$!2$!4',
+    '"#in.""kb")th-minute!(7&frac12#(ndash;38"$,500"#026$!8#"31$!5$!6#"78#"86#"96"#110',
+    '$$7-18#%24-25#"35$!7$!8#"40#"60$$8-70#"71$!5$!8#"86%#-87#"92"#200',
+    '#"20$!7#%39-40#"41#"52#"92$!7"&300-02\'!3$!1$!3$$7-08#"14$!5#"26',
+    '#"53"#405$!6#"36#"41$!6#"63$!5%#-66#"73#"90"%5,000#"00#"10$!4',
+    '$!9#"24$!5#%40-41$!3$$6-47#!5#"69#"74#"93$!8"#604#"17#"21$!7',
+    '$$5-56#"76#%94-97"#705#"15$!6$!9#"20$!3$!6#%63-64$!6$!8#"93"#801',
+    '#"16$!8#"21$!9#"35#"40$!7#"53$!5$!7#"64#"86#!p"&911-12$$5-16',
+    '$!6#"35#"46#"51$!6$$7-58#"62#"73$$5-76$!6#"87#"93$!4!(8&frac12#(ndash;39',
+    '"$,500"%-year"!.#!4$!%#"5%#"6%"#000$!4$!8$!9#"11#%22-23$!5#"79',
+    '$$3-84$!6#%95-96#!z"#123$!9#"36#"50$$5-56$!9#"62$$4-65$!7#%70-71$$6-77',
+    '#"81$!9#%94-95$!7$%9-200"#210$!9#%71-72#"86%#-88$!8#"91$!5""30#"18',
+    '#"30#"41$!4#"65%#-66#"76#%90-91$!6$!9"#403#"23$!4$!6#"35#"40',
+    '#"50$$7-58$!9#"th"#516#"22$!4$$8-29$!9#"45$!7#"55#"68#"82$!9',
+    '#!p"$6/40%"86#%59-60#"61$!5#"70$!2$!3$!5$!9#%87-88#"91$!9"#704',
+    '#"11$!8#"29#"38#"46#"54#"64$!7#!7$!5$!6$!8#"80#"98"#807',
+    '$!6#"24#"31#"69#"77#"94"#902#"21$!6$!7$!8#"35#"50$!2$!4',
+    '#"84$$5-86$!6#"94"!m#!l!$9(1)#"2)"".4$!%#"8%"#005#"15#"21#"30',
+    '$!5#"40$!2$!6#"70$!1#"85$!6#"98"#104#"10#"29#"37#"40$!5',
+    '$!5#"63$!5$!9#"81#%93-94"#240""4p""78!#:10#!1#!4#!5""23#!8',
+    '!"aa!"br"!w!+d-structure!"gb!"hu!"jl!"ll!"px!"rx!"sy *4&agr;-tpa"%mgr;l"(ndash;14(#5-1',
+    ')!.)"in!#(6)""a)!(,200,000"%500kg"#900!$-6-2".aminosalicylic"\'channel"!h"\'monthly")year-olds!$.03%#!8',
+    '#".0#!m"%2.2.1&!2#"5%#!7#!8#!m#!p"$3(a)#".4$!5$!6#!4#!7',
+    '#!2#!3#"in#"kg#!v"#6.1#!8"#7.1!#/75!+0&ndash;45%)#60%)"80""-0#!1#"45',
+    '"#.4%"#0kg#"ml""16"#2mp""46"&5-line""80""ml!*1&ndash;42""1p""3p""41$"61#!p',
+    '#!0""h3!)2&ndash;4"#(2)"!.#!0#"1%#!6"#0mb""21#!p"#5sx""77""ft"#mhz',
+    '"$,500"#.11#!7#"8%"#/4p"$0mhz"#106""41"!a!-4&ndash;22650)"46)!5*!1"%-game"#.2%',
+    '#"9%"#000#!p#!s"$1(3)""24"%5,000#!p""ft""lb""mm")p/minimum$#per!$5(3)"\'-second',
+    '"$0g/1""1p""24""38""7p"!g"#rpm!(6&sol;86"$,500"".3#"5%#"7%""8p""cm$!s',
+    '"#(1)"#.4%#"5%#!8"#/3e"#0kg"#495"%5,000""9p!*8&ndash;51"#.1%#"3%#"6%#"7%"%/1991',
+    '#"00#!p""3p"#431"&6dx/50#%sx/25!*9&ndash;52"".1""00#"nm""5p"!b""pc!#:12#!5',
+    '""30!"ah"!l!"bw!"m2"!s!"nb!!o"&z/100g!#pts!&th-6th!!x"$400m"!x *5&frac12;p',
+    '"(ndash;13(#20%("32)!6("40("6%!&\'tgcaa!+,000-strong"\'200,000#"29"\'300,000#"42"\'400,000"\'500,000"#750',
+    '!#-15!#.03"%1.1.3$!5$!7#$5(b)#"6c"$2(a)#"4a#"5p#!b""36"#4.0#!1#!3',
+    '#!b"$5(b)#"pc"#6.3$!4"#7.4"#8.1$!2"$9.11#!3#"5%!!/!+0&mdash;60p#(ndash;69"+,000-60,000',
+    '#"75#$fold##odd"".1#!9"#/60"#0-1##lbs""4p"%9,000"!a")th-minute"#yds!$1.1%#!3',
+    '"!b""pc!"2.#"2%#!3"%0b(1)#!i"#535""6p!*3&ndash;56)!7"#.23#"8%""0p#!s',
+    '")rd-minute!*4&ndash;55"".4#!9"!a""kg!%5&deg#(ndash;60*!4)!7"".1#!6$!%"#0th""8p',
+    '#!m!*6&ndash;63"%-page"".3#!5"!b"!m!)7&ndash;8#&sol;86"".3#"5%""66#!p""pc!#8.6',
+    '"%0,000#!p""3p""8p""90""pp!*9&ndash;58"".0#!5"$4895"$6266"#95m#!p!#:15"!2',
+    '"!s!"bb!!l!"mb!"os!!w!!x -6&ndash;1/2ft)!5("7%!&,000ft"#250"#900$"4m!#-11',
+    '"*month-olds!%.00am#!9"$10pm"#2.0$!6#"2a$!b##5pm"#3.6#!6#!a"#4.4$!5#!2',
+    '#!9""51#!9"#6.2#!7"#7.2#"5%"+8&ndash;7.0#".1$!6"#9.3!#/10""24!)0&ndash;4*!0',
+    '#"80"".4#!8"\'0&deg;c$)ndash;700#+,000-strong##sel$!l"%12hdw""3p""4p"$5555"!a""ns"!z',
+    ')"xi"#(3)"#.5%#!6""11""55!#2.7"%1,000""82!\'3&deg;c#(ndash;65"".1"$5348""7p"!f',
+    '"%-bits"#.5%#"7%"#0mb""8p"!a!%5&deg#\'ndash;6"$,536"".2#"9%""50!46&deg&ndash;76&deg;f""-1"".2',
+    '#!7#!8""0s"#551"$8833""9p""cm""pc!$7.4%",5g/1&half;lb!48&deg&ndash;77&deg;f"".7#!9"%0,000#"50',
+    '#!5""0s""pc!":7!"bn!#cms!"fl!#in.!"jd!"nf!!o!"tu +7&ndash;10%)!3)!8',
+    '("8%"(shilling!&,000ft"#130""50"\'600,000"#900!#-13#!4!%.00am#$4fl."$1(b)#$0(a)""22#$3(1)',
+    '"$3(2)$"b)#".4#!3#!5#!6#!7#!9#!a""41##5am"$5(a)"#6.4""99!#/10',
+    '"$jg26!$0-80"".1"+0&ndash;800#$/800#!g#"kg#"mm""51""60#!3##560"#:30"!c#!m',
+    '")th-minute!"1.#!3#"4%#!8#!9""20""31""75!42&deg&ndash;78&deg;f&";f#\'ndash;3)!4)"73"#0kb',
+    '""50""hz""pc!"3.#"4%"#156"!b!)4&ndash;5"#.3%""00""2b#"rt"#90e!%5&deg#\'ndash;6',
+    '"".1#"4%"+0g/1&frac12#"il#"kg#+ml/1&frac14#!s""5p"#bhp"!m#%l/3fl!$6(1)"".2#!8"%8,000',
+    '"".4""0s"#268""55!)8&ndash;9"".3#"4%#!5#"7%"%0,000")4&ndash;5""in!(9&sol;85!#:14#!5',
+    '"!l!"jl!!o!#pm. *8&frac12;p")ndash;10%*"cm)#1pm)#2in("23)!4("39("43("60!!+',
+    '&&strong%"ft!"-8"&series")year-olds!#.0%#!3""1.$!1$!2$!3##0am##7.1%!4#!9',
+    '#!4#!8"$3(a)$"b)#!7""44#!8""57""7p"$8(a)!*0&ndash;81*!5"!+"".6$!%',
+    '$*ndash;1200#"0m#"64#"79#!f#$x600"#287"%386sl$!7"(486sx/25""db"!g""mg!)1&ndash;2"".5',
+    '!\'2&deg;n\'!s#(ndash;83"&2/1419"&4/1421"$7594"!a""pc!)3&ndash;5"".7""pc!)4,000,000"".5#"7%#!9',
+    '&";c#(ndash;15)!6"".7"&7/1453!&6-type"".3".5/1460&ndash;1!$7.5%#"7%".0/1465&ndash;6!"86")th-minute!*9th-minute!#:11',
+    '#!9"$30am!"cs!"ea!#khz!"nd!#rds!!x""30"!e (9&percnt!#(a)""b)!$-3-1"!8',
+    '#!2#!3"%11(a)#!v"#2.4##0pm##5am#!9"#3.1#!8"#4.2$!4##0pm#!3##5pm',
+    '"#75%#!7""85!"/1"!2""80"$st.g!\'0&deg;w"#.3%""70"#:10""kg""ml!)1&ndash;3"".5',
+    '""23!$2.3%"#351!$3.2%#"6%""4p!#4.1#"2%#!3"!c!+5&ndash;100"#.4%""00"":5!)6&ndash;9',
+    '$!%#"50""90!)7&ndash;8""0s""14""pc!)8&ndash;9"".7!$9.3%#!5""0s!":9!\'am-noon!"bn',
+    '"!p"!q!!h!$inch!#lbs!"ss!-th&ndash;11th!"uz %=0.29#"50!"10#"56!%stant \'a\'court"(mhuilinn',
+    '!"-6"(changing##ups"#day"\'helices"%minus"!p"#two"!v"!y!".6"#835#"90$!4"$c.g.',
+    '"#g.m"&l.j.r.$"s."(nidulans""v."#w.e%!.!"/2"+cyclophilin!$1079""64""71!#227"!5!#300',
+    '"!2!#421!$5104#"19!"67!"77!":b"\'lexical!!=!&_a_lot!%a/rac"(benraa-1)!l"\'nnemers!*b-negative',
+    '"$ba/e$!d"*del-moneim$&ramane#.omino-perineal#\'ul-aziz%$hadi%"le"\'eraeron$$mule$%porth"$ford"&juring"#ora$+tion-rights',
+    '"&radial"\'sconder#\'orbedly&%ingly&$tion#+temiousness$*ractionist"%ulfaz##se.!%c/190"%acias""c.#&ell/oo$&ntless#*identalism',
+    '#+ommodation.%*panimental)#sts&#lis#%retes"\'ellular"%haete#"er##iet#"oo#\'tenberg"#id/"$osta""pd"*quisition.',
+    '#%idine#"on$\'tergite#"ux"$sadi",tion-centred\')sequences$"um#(uarially%#tes#$vity"%utest")yanogenic!&d/m-19"#534',
+    '"(ditively"&elizia#&ptness#\'r-tajan""h3"+justability""ma#*onishments")p-induced"&scombe#\'orptive#$wood"(ult-like")vertizing#%isery',
+    '"\'ginetan"$lius#-urostrongylus",rogenerators$\'medical%$onas"#sir#)theticist$$ivum"$tate"#wha!#fec"+fectionless#$inal$(rmatives',
+    '#/ordable-housing"#man",ricanisation$\'kaaners#&o-asia%%cuban"*terburners!%gaune#"vi"&entive"(gersborg#\'lutinin"$hios"#ism#$tato',
+    '&!o"#oge#$utis"&raphia$\'rianist#(eements.#/i-environmental$*businesses$%gento"\'uilares!%hearn"#uja#!s!#i\'a"%m/feb',
+    '#$trey")r-britain$)delivered$*fresheners$%vents$&washed#$/sea#)drionians#"er#%fresh#,ing-cupboard##mic$%otive#%screw$%paces',
+    '"\'shwarya!\'jkharra!$k47s"&abussi"\'hromeev"&inyele"#oka"#ron"%saray!(l&iacute"(-abairsh$&fghani$$hmad%#ram$%ttiya',
+    '#%mahdi$\'untasir#&rashid#%talhi#\'zahrani""/1"$aoui#&rmists#"te$"is##yne"$beda$(rtbridge#&ifrons$%manus',
+    '#,ohol-induced""da#(ersbrook#"h2#$wyns"%ecock##uts#$vras#\'xanders"%falit#\'redsson#*v&eacute;n"(gebraist#,orithmically"\'iceholt',
+    '#&ghieri$)ot&eacute#$ment#$ve-o%$ness"$kaid%"os$+line-loving\'\'ization%%oidal#)maionidai"+l-engulfing$%fired$%items$(merciful',
+    '$\'regular%%ussia$(scottish%%eason*!s$\'through%+oo-familiar##aby$\'nbridge#&comers$$roft#(enthorpe#$good#*iterations#$onby',
+    '$&tropic"*most-empty"(penstock##ha-&%helix&%osf/1&)particles%+numerically%%ville#)ine-style%"us".ready-existing"&sation##eny#$ford',
+    '#%vcott"+taclarensis#$bach#\'er-egos#$oist$$mani#\'ringham$%uists#%vater#$ynai"(veolitis&"us$&rstoke$$ston!(manbayev',
+    '#"ta"\'bergate#&lyopia#&rosial#%usher"\'endable#,ricanization"(freville"-iable-looking#(nopyrine"$nion"*ounderness"$p/hr#$arai#%field',
+    '*!s&%ropic#%ullae"\'stetten"#uck!$n/or"+acardiaceae$%rusis#%emias$%robes$(sthaesia#*l-sadistic$$ogia\'!c$&ysists',
+    '#&mnesis#$ngel$#ias#%tavan$$omic"#cor##rum"#d-a$\'nuclear$"so##_no#$eans#&f-like#$imba#$reae',
+    '$%ocles$*u&tcedil;a#$snes"(emometry"\'gelenos%&ically#\'iosperm##let$#iae$\'o-asian&$boer\'%urman,!s&(frankish&"us',
+    '#)ustifolia",imal-derived#,on-sensitive#%sopus")kle-boots"\'na-lisa$&listic(!s#(e-sophie$)xationist##ing#(ouncment#1ual/extraordinary""ot#$uska',
+    '$"ri#&elmian#*i/x3/sparc#%werer")tagonises#)echambers\'#pel$%rooms#&hemion$*ropologies#0i-apprenticeship&%rafat\'(rhythmic%$brdu%(clotting',
+    '(\'rrhoeal\'%vorce%)fasciclin&&oreign%\'hacking&"cv&"iv%*industrial\',flammatories%%leeds%*marketeers&%odern%%nazis&"sf%%paxos',
+    '&%ylons%(rational%\'spanish%#tag&*rade-union%/vivisectionists%\'yeltsin$-body-injected$"ch%%linal("es%&yclone*"ic$(electron$)genically',
+    '$)neutrinos$+oestrogenic$%phony$)religious$\'semites%%tatic$\'trypsin#$onie&$olli"$waar",xiety-ridden"#yth!/p&eacute;ritifs"-artment-block"%elles',
+    '"%hakic#(rodisian+!s""ia$"ry"#ley")ocynaceae"#par%%antly%)entements%&tement&$ment#&elmans$(ndicular\'#xes',
+    '#&le-ibm&$like%$/ibm$$ies.#)ositional#&raisee$(eciated."-ril&ndash;may%"-1#*on-strings"(terygota!"ql""md")uamarines$)rium/pond',
+    '!%r.iii"+ab-american%\'islamic#\'ndaspis"#bib#$orea\'$lity"*ch-villain$\'aically&#sms$$dale%)eaconries$(edictyon$%image%#vum',
+    '#\'systems"%deene$(n-clarke#%howen##ila#$ours#;rossan-saltcoats-stevenston#%zinov"%efiev#$gund#"ls#%nberg$&enberg$%sberg"&gerich',
+    '#&uelles$%ment.("s.$"ta"$ians##cie##nze#$saig$0tocratic-looking,$ally"#kel$*ngarthdale"&lebury"\'m-bands#$ella',
+    '##ida"1ncott/oxfordshire#$ulfo"%olium"(rangment*!s$+st&iacute;a##ica$"en#"on$\'w-slits#\'ythmias"\'tabanos#"cs#&erials',
+    '#)iculators#*newsletter"&undale%&inacea!%s/set"&_well."3bestos-contaminated"\'cetical#)omycetous#)riptively"(exuality"&hbrook##eim#*ley-cooper"+ian-african',
+    '"$m160"/ociaci&oacute;n#"ka"$pera%%ities#(ortation"(quithian"&segais$*mbly-lines$(ssorship#*iduousness$(milative#(ortative&%ments#(uagement',
+    '".tatoreochromis#*hmatically#*i_spumante##ons##rik"$wirl",ynchronously!.t&amp;t-backed"$-the"$anas&"ie"#f-1"$heer$(lhampton$(oretical',
+    '#"ey")mosphere."%omist\'!s"\'rophies"(tendence$%rbury#$ilio$-tudes/beliefs#)leborough#&oumane#\'ractant\'+ive-looking!"ub#%retia',
+    '"(cklander"$daer#&itable%%orily"\'gustans"#ken"#lus"%ratus"/thoritativeness&%ships#)oanalyser$\'cracies$-graph-hunters$(injector$&pilots',
+    '$+radiographs$%somes$(titrator#$umns"#xie$!n!-vailabilities%!s##rag#$tars""e.#$lino#%rheim$#ill"\'ocation',
+    '#$wing$!s"#ron!*warenesses"-kward-looking""ud!\'xe-head",iomatisation!#yia"$lard#%eston##ott#$ward!%zcuna"(eotropic',
+    '"#oic#"uz \'b&amp;d"%prime!%-boys"%cells"&movies"&values!\'.a.e.c."$c.r.""k.""o.$"q."+r.o.t.h.e.r"$t-h.',
+    '"*05/25/0000!#1.8"#257"#700"$9c12!#302!"41!#52s!"74!"8+!\'a-pb-zn"%bbies#.erton/westburn#&yishly"#cca',
+    '#+k-and-forth%$iron$#:an$&cloths$#end$%lands$)stitching$0wards-compatible#2terially-expressed",d-temperedly#)ly-burned&\'damaged&\'injured#"on#&sworth',
+    '"$gchi##dad%"le#$gies#%heera##men##ots"\'hamians"$iney$%sfair#\'trunner"!j"%keman#\'htinian$%uizen',
+    '$#nus$!z#\'briggan#"ko#&l-ends$$game$#mer$&ygowan%#lee#$naan##oon#(quhidder#$sham#\'timores"%mbury',
+    '$&oleers#$gert##ias##jos#0k\'s/organisation$$haus$$ings#%nerji#\'quettes#$teay"$ptie%#zes""qr")r-counter$%giora',
+    '#&anczak%"ja#"da#\'e-bones#"gy#%ialay%\'tinskii$#llo#"k.#-nes/aylesbury\'&london\'&milton\'#raf%#tby&,t/cheltenham',
+    '#&ouches#$ques##ras##tel$!z#$wise"+se-exchange%%lined%$pair$%liner%#oad$!t#$hall$&lachev$%mekov',
+    '#(ketloads#%quill#*s/midrange$*ett/newent()wiltshire$$ists#%table"%t-uul#\'h-based$*/shower/wc$#ful$*ing-trunks$$onga#+tering-rams$\'lelines',
+    '"%ughen#,unternehmung"#wls""ya#(erisches#$ldon#%mouth!#brc"!v!#cm1!(e\'aviour")achampton%%balls##ler$!l',
+    '$#son#\'n-bayog#%rlike#$umes$$veau#"v."#cak#&carian#$kham$*with-smith"*d-chambers#\'ford-st$$rame#%rolls#%socks',
+    '#$fier$!s#"ns#%r-mat%\'stained$$ling#\'smarket"\'ggarman$"er#&uinage"(headings"(iersdorf"#ldi#\'emnoids#\'gi&euml',
+    '%&ved-in#(l-bottom%&pushes%\'ringers%&towers$%arosa%"ss$%crest$"in&(gshausen$"ot#(t-driven$$ring#\'vederes"%nabou',
+    '#$flis$#ord#$guet#\'i-gomez#(jaminian#&nelong$\'inghoff%#son#)o&icirc;t$&uville#$thos#%volio#)zaldehyde$#oic$,ylpenicillin',
+    '"&rgholt#4insfield/oxfordshire#\'mudians#%narda\'!i%"ys$\'ieranus#"ov#&telsen$\'haultii$-otti-robinson#$wyns"$sner#&sacarr%"nt',
+    '#*t-attended%(balanced%*of-the-day%#run$&iaries%%rring$$wick"%thlin##ook#&rayers$#obi#&taware$\'embourg%#r\'n&(-drained',
+    ',"ty\',than-average\'%value$)ing-slips$"on$"ys"\'vanites#$vies"*witchingly""ye#"ga!"ft!%gbase"!q!#h15',
+    '#%ndari"#eur"$lh-z"(orairaig!%i-bop#(coloured#$fold#(national#&sexual""ao"&blicae%,ographically"(cyclists"&dwells"+ent&ocirc;t',
+    '")fasciatum"*g-punching$\'serving%\'penders#"ha#$land#)noniaceae##sun"#isk"\'kesheds#"in#(kembergs"*laterality#*dungsroman#%ineal',
+    '&"or$*ion-a-year\'#ths$*y-le-grand#$quis#%sland")molecular"&n-bags#.ary-compatible\'"is#\'chester#(dingness$"on#$ford#"gs',
+    '"&o-life#*analytical#$data$&ynamic#*geographic#$labs#&metric#)physicist#&signal"$rani#(ch-trees%&ington#,d-pollinated$%baths$$shot',
+    '#"ns#&thday.&"ee%%stone"\'schoffs$"op$\'uit-tin#&ection$!t##hen$(opscourt##let"%tburg##ola$#nal',
+    '"#umo"$zone!&jorlow$(nerstedt!,lack-flagged&&gloved\'%owned&*marketeers&)uniformed%#ens%%flies%&headed%$nest#\'de-like#$ines',
+    '%&e-line#\'kelands#"ne$&k-eyed$&quilla##sgo#(therwick""eb#&istein#"nt#%wbury"\'indbeck%#man")ockhouses%#ish',
+    '##ice#\'mefield#\'od-shot\'&meared\'%tream%&/crips%\'suckers#%wback$#fly$%lamps$%n-off"(ue-tiled$&s/rock%\'breaker%#men',
+    '#)nderingly&$ston""vd!#mif""nh!"n7!)oard-game%$game%*ing-houses%*man-tasker$#ium#&t-load%&owners%&people"$bcat',
+    '#(hisattva#(nantense#&y-size"#ese"&g-eyed#"en#"ha#\'omilism#!y"#han"+iler-makers"\'lection#\'ivarian#%shies#%tguns',
+    '#$zano"\'mbazine"\'ndfield$$sman#%e-dry%\'setters%%weary#&gaarts#$ifac#%jella#%keleh#%ville#$ynge")o&die;tis#"dy',
+    '#\'rnazian$!s#%table$#man#\'z-allen$%e-ups"%quhan"%rdure##ila#&kovsky#\'nhausen#%odina$$fsky$!s#$tsch',
+    '##kin#)nian-serb,#ian##ons#(sy-boots#$tons"&tafogo#"ta$.le-conditioned\'%necks\'&shaped&$d-up&%nosed&"rs"*ucl&eacute',
+    '#$ghey .nature-nurture"$vtec"#yak"#zim$$rite!#bfi!&cdware""ga!"du!-ear-neighbour%$post%%white$!e$$line',
+    '"*chtansmere#&kplate"%edin\'$(le-knife$$wood"!f",gative-going(*ly-charged"$ighs##sse"&matoda\'\'iriasis""na#"ko"(o-norman',
+    '#\'liberal#,petrolisthes$%ilina"%phesh"$rval#&yungri""sh##tos"(therhall#&server$#uke#$tell",uromythology%*psychiatry%(syphilis',
+    '&*never-land%&ending")w-routing$*technology#\'arthill##boy#,ly-completed&$made(%rried&*privatized#&sbooks"1xt-door-neighbour!%gatse#!u!#ian',
+    '"(bthwaite""cd#%hetti$&olsons##kol#$olls$\'machean$$stop$%tined"$eder"+ght-fighter&\'glasses&$spot%&shifts#\'rescens',
+    '"#kes#$itin"$lgin#$otic"#man"&ne-ish#)th-wicket"\'pponese""ru")tro-chalk#"sa$$hill"#xed"$zhny!#lrb',
+    '!*o-menacing"#cks"$elte""ke"*menclatura"*n-adhesive%$nglo%,ssertiveness%,uthoritarian$$bloc%%ranch$(civilian%&ompact$\'dancing%,iscretionary',
+    '%%ollar%&ualist$0english-speaking&$tity$(irritant$$jury$(learning%&ibrary&&nguist$*neutrality&\'wtonian$)ownership$*penetrance\'&sioner&$ople',
+    '%&rimate$(receptor\'%overy&&ducing&\'flexive&&lative&,presentative%$ival$\'steroid&)ipendiary&%riker%&uccess$%title%%ribal$*uniformity',
+    '$%welsh##ces"#oky"*randa-kerr#\'denfalk$#ics#\'malises%\'n-style&&sfield#%plant#%rback#&thstar"(se-bleed%\'to-nose#$h-up',
+    '""t-#*iceability##ker##man#,tingham-born$$urna"(vasports#(i-belgii""wy"$yons!"sm!%uccio#*lear-waste"$form"\'ll-grav',
+    '"\'mber(s)"$nton""pa"#rul"%tkins#)ri-system##ton""uk!"wc!$yeri"*lon-strung"&thyhel #o\'c#&athain"$hear',
+    '!*akenshield!#bat"$elix"&holzer"$rero")servateur$%ssing!&carina"&cident"*ean-island""ho#%shorn"&kendon#$rent"#tal',
+    '$%pussy!+ddly-shaped"$ones$\'tocetes!+ff-the-page#&breaks#%enham#"or#%width!#gam!*il-company$(finished"(reachtas"%seaux!&kidata',
+    '!#ld-$%money#&castle$#orn#(er-style%$shaw"&impico#)ve-branch""lo"#mos"!o#$roso!$mbre"&nicorp!&n-load',
+    '#,-night-stand$/person-one-vote$\'teacher"%gueme"$ofre""ze!#old!,pen-and-shut%*handedness&%earth%&palmed#-rationalising"(hiohelus%%mitra%&tholia',
+    '".to-electronics$%metry!%ranje"#cas##his"*der-driven&&making%%which"+gan-playing"$ions")namentals"%thega##ner"#win!"sa',
+    '"$caig"!e##nat""ip!*ther-world"#ium"\'taviano#$elia$$rson#&ocento!"uk"!s"\'t-front$%house$)of-breath',
+    '\'$form\'(hospital\'%place$%reach$%stare#\'bidding#%lives#$port!#vac"%enden$$safe#%r-18s%+centralized%)demanding%#eat',
+    '%#fed%$head%)impressed&%nvest%&played%\'stretch%,the-shoulder$&nights$%stand&\'imulate&$rike%$wing$\'viewing#$tari"\'imbundu',
+    '!(x-tongue"&enhall"&imeter"\'ygenase!"yu )p-channel"#end!%.v.c.!&144-d6!"47!#aar"*ckage-tour$,et-switching#\'quement##tel',
+    '$#one"%esana"$gels##nan"(int-ball##rts"&kiteng"(lacegate##cic#&e-gold$$schi#\'ipehutu#)m-reading#%omine"#mpa',
+    '#%delis#&elists#"ja#,th&eacute;on$"os".paconstantinou$%dakis$!e$%razzo#(er-knife#!i#$uans"&ragram$\'paraumu%%rocts',
+    '#$boil#(isiennes#%kview##lay$#ett%$ying#%nevik$"is#\'rotfish#\'thenius$\'y-piece%$goer#$veen"&ss-off$(age-work',
+    '$!o",tent-leather#$iens&&t-care##man#.ri&oacute;tica#,tern-cutting#$ullo"\'ullinus#\'perised"%vanne#$lovo#!o"#wls"%yless',
+    '!$c-5a!(dp-laban!)eace-line#\'rlstein"+destrianise#$icel#%ullas"&epshow"#gai")lagianism#&ta-urn#%vises"(n-friend#)alty-area(%taker',
+    '#(dergrass$"os#&gappah#(ninghame$#ock$%yburn%#man##one#$sarn$%cynor#)tecostals$$heus",ople-centred"&p-talk#!a',
+    '##ped$#ing#&statin"\'rdikkas$"ue#+emptoriness#-fectly-formed#"ge#&igueux$-od-instrument$$vale$\'winkles#$lite#&muterm#$owne',
+    '$,onality-type#%ugian"%scado##soa#$tles"&terlin#)rashevsky$#ify$\'ocaravi%$line%$syan#\'tingill!$f(i)!$hair#&lanxes',
+    '"(easantry#(nylamine"\'ilistia$(osophiae"(ocylides#+enicopterus#)spho-free#%to-op&.reconnaissance&\'session%%color%)grammetry%*processing%\'realism%\'setters',
+    '""pa"&rynius"%testr!*ick-handle$&ing-up#(osiemens#&quigny#\'tionary"&e-eyed#*r-and-door##sse""ga##gie#%swill"#kas',
+    '#-grim-narrator#&lagers$&orying%&w-talk&%slips#&obolus#&sudski"+nchinthorpe#\'e-green$#tum#)k-fleshed%&washed$$ayan#%scher#!y',
+    '"%racha"%sagua$%nello#%ceans#(istratid#0saladi&egrave;re#(tol-shot")t-closure#+ch-and-toss%&forked##ter&\'-patter#)uriaspids#!z""xe',
+    '$"le!+lagiarising(#zed#"n\'$\'emakers$&t-life%"ar%"in#(smalemma$,ter-of-paris#)te-armour#%utius#%ydays$$girl$$park',
+    '%*ure-seeker($land""ip"\'ot-line#!u"#uie#%mbate"\'ynlimon!2mmlib.gimmspolydat!8oacher-turned-gamekeeper"&chette"\'etaster"#ing$0t-of-information#\'son-pen',
+    '$%rplus#%ehill#$gars##isy#&kerris#$lner##ski#(y(dg-dc)$&clitus$&hedral$%maths$&ploidy"$ncey##gau$$inae',
+    '"\'p-music#(py-straw"%rt-au$&abello%$loos"\'ssible\'#&t-1960%&budget%)collision%\'divorce%$free%&holder%\'initial%(modified%*ordination',
+    '%&sample%$test$\'mortems"\'t-belly#+entiometers"%ulain$!e$!t#"nc$+d-for-pound$%taine")well-tuck$)r-broking&\'dressed&%money',
+    '%&scourt"&zderac!#pki!/r&eacute;sident"\'abhaben#(ctioners#\'elector$!n#%halad#\'irietek#%lines#"te%#nse#$veen"&e-1900',
+    '$*antibiotic%*rrangement%&uction$&celtic%%oated$$echo%%mbryo$+feasibility&&minist%\'reudian$)interview$)knowledge$+performance%&rocess$)qualifier',
+    '$(schooler&\'reening%$leep%#olo$\'trading$%union$%visit$$work#(coverage#)discharge#\'empting#4ferred-issue-in-file$,ormationists#"is#$plan',
+    '$)rocessing#+scriptivism$+sure-volume$\'tissimo#%vlaka"!g"2iest-administrator#)mary-care%#tic$(eservice$(igravida$"os#"nc%$ipes$&t-form',
+    '##sca$+on-building#%yanka"&o-boer$&contra$\'divorce$%range#$baby$)lematised#(claimers$.urator-general#$drug$+uct-related##fix$$onde',
+    '(!o$!s#%jecta#(menaders$-ising-looking#&perty-$)ortioning$\'rionate#\'scribes#!t$\'einases$+o-modernist%*strongylus$\'racting#\'vanmill',
+    '"\'u-bache#"tz"(zewalski!&seudo-\',intellectual&(pregnant"#l-s",ychodynamics!)teraspids$$opus"!h""sd!)ubescence#!l$*ic-address',
+    '"!c"$dden$(ing-bowl""he"&legium#$l-in%"on&#uts#+se-receiver$"on"*mice-stone"$nica"$rdom#)ificacion#$ling',
+    '!"wg!%ycoma"\'elogram"$scho (q-factor!\'uadrate#%rrier$(ter-turn\'!n#,tercentenary".echua-speaking#*ensborough$&rfella##nya##sto',
+    '"*ich&eacute$+k-reference%%spend#$eroz$(t-spoken##nsy$#tal#)vertipped"%ondam"#ran %r\'n\'r!"-3!"34!&abassa$"ul',
+    '",cal-transcom#%ecall$$goer"$dics$*odiffusion%(graphers%%label%!n%%paque$$pole#"ji#&ulescu##wan""fe#"fi',
+    '"%ggatt"$id-5#(n-filled$%cloud)!s$%oldes%"ut##pur"&jendra#$hara"\'kebrand##off"(m-headed#\'aciotti#&eshwar',
+    '#&goolam#%shorn$#ons"%ngpur#+some-davies"\'ppeneau"!r#\'e-earth"%stell%\'r-based"*t-catchers#%henau##ina$#one"#uff',
+    '""wn"&ybould#&makers$$onde!#ctc!*e-allocate*#ing$\'ssigned#)balancing$#orn#\'fashion$)ormatting#&locked#&placed$)ossession',
+    '#\'railing#\'stating#&thread$$rain$%uning#&uptake"(acquired#)rticulate"%based#!u$&ilders"*calculates#&eivin\'#&lothed#2ognicionesfeodorum',
+    '\'!t$(nnecting$)rd-review#%ycler"\'d-noise$&orange#!e#*iscoveries#$moor#)uced-rate$(plicated*#ing"%edman#&merged"%fered',
+    '#)lectances#\'orested#*ractometer%#med$$ozen".gionally-based#%lazed"%hovot")ichsmarks##gne##mer#$swig"(lativize"+mnant-ocean#(ortgaged',
+    '"&nminbi##ouf%$veau"%occur#$ffer#%rient"(polished%$ling$%tting#-resentatively#)ublishing"*qualifying"(recorded"\'sealing%#ted',
+    '#$pice%$ring#\'t-house$!e$%ormel#-ults-oriented$\'pplying$&rrects"&tiling#&rofits#!s""va#.enue-producing$%rends#,olutionnaire',
+    '#$naud!"fe!"he"%odian%&zonate"$ulen#$vaal"\'ythmics!-ibbon-cutting"(ce-water#\'h-world"%dgley"$elly"%fugio"$gaud',
+    '\'#urn"#mes")ng-leader$$adoo#"ns"%paria#$tide"#sto"%unite"\'verbeds%#man"$zlas!$j-45!"mo!#ncm',
+    '$)-blocking%$rail$#man""bo#$redo"(ck-drill$%boots$*et-powered&#tes"$dway"\'ecastle"#lan#%lneck"/manian-speaking#%inger',
+    '#$pers"$oley#>t&mdash;package&mdash;required##zen"$pers"\'sellina$#ner%#han#"se%!m#*y-fingered"(therwood#"ty#%umans"%ubaix',
+    '#$sted#*terxchange""ys!&pr-udf!-ubber-covered&$band$)le-filled$"ra"&chazie#&k-maul"(dolfinum$!w"$eing"&ffside#$inus',
+    '#"vo"%leset"%melia"&n-over$&scorer#&nicles%(ng-board".ssian-american#%t-red$"em$#ika""za!\'wigyema!%yarsh"$ding',
+    '!$\'not!&-shape"$type!#.t.!*1&ndash;s4!#210!"46!+65(6)&mdash!*a&ocirc;ne"!b##ira"#chr#"im#"ko#&rified',
+    '$!o#%owitz##ria"$ffil"(gittarii"%ilin\'#(ntbridge"$lado#+e-or-return#\'icornia#$lows#/monella-in-eggs&!s#\'pertons#%twell',
+    '"$mosa#"sa",nd&zcaron;ak$)-blasting$%flies$$hole$$shoe$$with$*y-coloured##gma$%uinis#%kukai#&sovino#&tacruz%!l',
+    '$"ry""qr"\'rabande$!t#%comas#$ekat#&gassum#"ia##kis##nen#%rance$"on#$tain$!o""ta',
+    '#"ra#-urday-morning#%yajit""ur"\'vicevic##oir"%waeng#%grass""ya!%caggs#%mpers#\'ndalize&%navia%$iaca#,re-mongering',
+    '$#ify#)ttergrams"0ene-of-the-crime##rri#!t"(hachtner$"ll#%einen#&illaci$!p$$rach$\'stosoma#$long#&neidau#%oener',
+    '$\'nberger$+ol-industry\'&master\'&parent\'\'related&(teaching$%tland#$weig$%inger"#ifo#$orra#\'ssoring"$oped#*tt-kilvert#(useology',
+    '$\'p-metal#&ewgate#(iptories#%ooges##um-"&ultura#(mstopper!"de"/s-sequestration!(ea-chest%$oast%\'rossing$%guard#\'control#"go',
+    '$%skins$%watch#&mounts#)rch-light#*ttle-based"%bring"+cond-ranked&!a#.urity-building"#der#(imenting#"jo"#ear#&d-time##ler',
+    '%!n&!i#"st"#ger"%igner#$lern"(lectives$$nite$(skovitch#,f-adjustment\'(miration&+ggrandizing%(composed\'%pying%,depreciation',
+    '&*ramatizing%\'elected&+mancipation\'&ptying%,flagellation%-incriminating%+legislation%\'mastery%*perfection&)rojection&(ublicity*%shing%)regulated%)testimony&&orture',
+    '#)l-through$$wood"&marang#*i-comatose%(dwarfing%(educated&(vergreen%&hidden%&opaque%%rough$$arid#"on#\'pronius""nj##ker',
+    '#%tance"#ona"$rkin#$pins#%vetus""ss""t-$$down$#out#$anta#!o""va#\'en-page$$rino#$iche',
+    '$%drive#$tans!"h-"%ackel#*dow-puppet##fer#&g-pile#\'hanshah$!i##ila#%keara%$noak$"ur#,llow-draught(&marine',
+    '$!u##nin$"xi#,re-for-share%&market$$king#$vina#+wl-collared"%eblee#%elagh%"er$$ning$)p-cropped&(shearing#%fstvo',
+    '##nai#&rnazar$$rard"&ickman#)ftworking#(llingham#)ning-eyed$%toism#(p-burial#&relles"0op-till-you-drop#\'refield$(t-course&$head&#leg',
+    '%$hair##val#*w-stopping%\'through"$uard#(gborough##jan#%kokai!$i-18"%benik"(ck-leave$(sicksick"(ddington%"qi#(e-footed',
+    '%&valley%$wall$%lamps$&street"(egerrebe#$vert##yes""ga#&bjoern#$eion#%graph##ils#)n-writing"!h##ler',
+    '"$kels##ilo#"ri"%lflay#\'kscreen#%tanen#)ver-edged\'\'mounted\'%white""md#\'plicius##sek#"ul"\'ndakira$(elfingen',
+    '#,gle-coloured)"ne\'+instruction\'%place\'(syllable$.ular-universal#&ix-tos#$jsko#$kful"#sam#&yphean"*te-related#"ia"$vota"$wash',
+    '&#rth$&length%#ine$&nation#)teen-foot$!o$(y-degree!#kae#"la""ea#%llern#$nder#!r#&tchin\'#$wton',
+    '$$lmix#&n-type#%ptons"#ues"(yraiders!(latterns"*eep-walked$\'ve-note"$imey#$nked%!s"\'oppiest#&t-blot#$ughy#%w-set',
+    '#$iman##mmy!#mal$(l-volume%#man#$shie"(eatonian"\'ithmark""la",og-producing#+king-jacket##lts#(oth-bore&"es""tp',
+    '#\'pdragon"#eha"&itched"%odden#%okums#\'t-green#)wboarders!\'o-named"\'ap-dish",cial-control\'$work&%istes$#nus#$kett##red',
+    '#\'t-drink%$shoe&&kinned$,ware-related"*il-forming"%larex%"io#%danos#(idaridad$%taria#&stices#0ution-generating"#met#%iryon#\'osierra',
+    '#%thing"$rauf#%ption"$skin"\'uleiado#$mare#(nd-image&)recording#(th-coast&*south-west%%downs%)ern-based\'#ton%!s%$york',
+    '#!s",zialistische!)pacefleet#-nish-language#%rtina"%d-led"&eakman#+ech-writing#$ling$)l-checker##tse"(idersuit#%jkers##ned$#off',
+    '$)it-filled\'$self"\'latters##ish")okeshaves#&ndylus#\'rtscast\'&hannel")r&uuml;th#&aining$#kes$&y-wipe#)ing-green&#flo&%tails',
+    '!+quare-metre$%shtec#%iring%&relled!#ras""na!$s-24"+13&mdash;15!.t&eacute;phane"$abil#%edler#-ge-management+#ing%$prop#$iger',
+    '##led$"ky$#len#,mina-sapping$%merer$%pings#\'nd-down&"to%\'ard-fit)%gauge%#ees&\'sbeamte$"ge%#how$(islavski',
+    '$#mer$%smore#(r-packed$&bursts$&server$&t-line%+ing-to-work%#rek#&tfjord$"io$"um%(s-symbol##vka"\'eamdays#\'el-mesh',
+    '#"ff##iff#%noses#)p-printer%&sister$#hie$\'ladders#"vo".icking-plaster%(y-backed#$ebel#*ll-smoking%!y""ms"&obhill',
+    '%#pot%)ton-based#(ichactis#&macher#+ne-breaking&&strewn%$fall%\'masonry#"os#&tfield##ups#%yaeka"&raffan$&ightly$$p-on',
+    '\'-ically-placed%"hs%.imirovi&cacute$)w-burning%%crete#\'eamware$(et-based\'#car$\'psiades#(ike-rate&%force%\'ing-out$)p-farming#%okkur$%menti',
+    ')#run&&ylosis#5uctural-functionalist$%mmers")udy-group#%rgiss")ymphalian!*ub-cabinet%)ommission$(delegate%\'ividing$\'editing$&lessee%&icense&&ttoral',
+    '$%tribe#\'citrate#)fecundity$(ragments#\'limates#\'mediant%$rsed#%order#\'serving#%tasks$%hemes"\'ccentor$%inate"#eir#!n',
+    '"%murun"#n-3$\'seeking#!a#\'classic#\'daravej%!s$#lun##ray"&pataps#\'erceded%$iore%&silent#\'ination#%pling',
+    '#%endra$"te#%fwear#$jeet#.veyors-general"$sato##ini"#tri!(wainston#$nnay$$pool",eat-streaked#)dish-made#(epstakes##pro',
+    '#&ng-tip%%swang#$ssre"\'ordtail!$yder""ke"\'llabary#!t"*naesthesia#(chromesh$$line#%ergia"%rimis"%sedit#$tema',
+    '#"to 5t&eacute;l&eacute;com!$\'lad"&missus"#sao!+-lymphocyte!".v!\'a\'kwaru"(blespace"&cchino#"hi#!l#"ma"%egeuk#"wa',
+    '##git#"il#"le#$mout"$heri##ira"\'il-gate%%rhyme$\'or-make$&wagger##myr"\'k-shing#"is#!u""la',
+    '#&kabout$(ing-head($shop#%laght$$boys"$mora"&nagers##guy$"ye#$ktop#$nock"(pe-based%$deck"%quile"%rdive',
+    '##pon$!y#$shis#$uffi")sk-leader#$sled"$tami#"oi#&tooist""uc"%vares#"el$$ners"(x-funded$(planning',
+    '"\'ylorian"&zmania!"bf""wa!"ci!,eacher-child#&m-boss#&r-drop"$chie$4nologically-advanced"!g",langiectasia#$efis$"ki%#urs',
+    '%\'rinters$&squash##led%\'noreans$"in#%omere")mporising$\'ranillo"%n-bob$$goal#%gmalm#$iers#)nis-court#&tation"&rauchi',
+    '#%enure#$rans%#zze$*orist-type"$ssel#\'t-piece$&amento""ta#)erborough#,rahydrofuran%#rch"#uco!"h-"-alassotherapy#$nkee',
+    '##ros"#eek#\'lonious#&matics$&e-park#,n-prevailing#,ory-practice#$reat$&mistor""ia$$mine#)ck-billed#%evin\'#$nkin$)ly-sliced',
+    '$+st-quencher$1ty-eight-year-old\',one-year-old\',six-year-old\'$yard"$oman%$sine$#ism#%rarin$$wall#*usand-year"$rang$(syboulos&&machus#&ee-bay',
+    '&&decade&%fight&$note&%pound&$seat\'$tack$$shes&$hold#%ow-up%#bag"(umbscrew#)nderclaps##row"+yme-scented#!s',
+    '#%inese"\'grayans"&lscher""ma#(e-course%%piece"%nkles"&ramisu#$oler"\'thebarn!$lass!"mo!$o-be"/bacco-sponsored##ler',
+    '%%t-bag""jo"$kais"*lbertstead$\'utamide#$lers#+stoy-liking"&mbolas"%ngham")oth-glass#"ze""p-$$name$&seeded$\'to-tail',
+    '#*ic-comment#"ps#&shells"$reno#&tolano"!s""ta$$lise#"on"%ulson"*wn-planner"#zzi!"px!\'rabasso#(de-route',
+    '$#uce#,g&eacute;die##igh#%mline##nby$*s-american&&border(&undary%)istorised&"to%+missibility#%shcan$$ylol"!c"\'ecastle',
+    '#$ptow#%valle$#itt"!h"(i-annual$$gram#$bade$"us%)te-paying#&castin$#kie%%stick$\'oloured)!s#\'erarchs',
+    '&!n#"ki#\'mphones#(ntignant##ode$&mfator#&planes"*obrianders#&ut-rod""ru"*uck-driver#&stcard%"s."$yton!\'sushima',
+    '""er"(g-o\'-war")lkinghorn##lio#"un#$ving"$mber#"ed#!p"#rca##fus#$ismo#,kic-speaking#,n-allocation$\'ed-back',
+    '"$stin"\'tor-led\')ibrarians""um!%weeny#\'lve-man&%heads&%trees#(nty-inch\'(one-year"%inset#$ston"1o-and-a-half-hour$&course$$disc',
+    '%&urlong$&hander$&putted$$ring%"ow$$slit%%ocket!"xa!&ybrith"$gers"&pesize##hon"*rannicides#\'e-track $u-14',
+    '!\'b-level!$cits"!m!+ganda-based!"hu!%ighur!#jam"$daid!*k-resident"%rheeo!#lab""mo""ss#\'terfolk"+tra-leftist',
+    '%(sparc-ii"&verton!&mayyad\'!s"$bels"%egawa"#mah"$tali!%nbolt"$clad"\'der-35s&)graduates&&report%&rating%$sell',
+    '&#tan%&worlds#"ie"\'english""go"\'idirect#%foyle#%onize#&source#)versalize\'$idad(%taire))y-trained"(killable"#pin',
+    '")withdrawn"$yoke!&p-side$$tate#$wind"&church""dm#!o"$hall#)olstering"&leadon"\'percase&$ross!*ranium-235"(ban-core',
+    '""ia"*olithiasis#!s!\'s-built#(european#)supported"$amah"$band"*er-written""ha"%tasha#!n!"to!$zgen +v&ouml;lker',
+    '")formation"(neckline"#src!&acwell"(de-mecum"#gog"#lco#%dimir#%iants$!n#%loire&!s#,ue-judgement"(nderford$#yck',
+    '#\'iant-of$"ni#"ty"\'selined#"si"\'tasescu#!u",ux-balbirnie"$ynol!"de""qs!#edo"+lar-raising$$yati#"ly',
+    '"%neras&$ting$#tte$%ziano#"na$#ing#"te$%urini#%utius"$rdad$#ier#%heyen#,ificationist#$sets$%ified',
+    '#/y-long-baseline#.zekeringswezen"$sman!$iaje#!n#"sa"0ce-kapellmeister#%hyism%&ssoise#\'tualled##una"(deodrome%#ram&\'ecorder#&screen',
+    '#+tnam-backed\'*ese-backed+)installed#\'w-point$&screen"#gna$%emale%!s##ors"#kki"\'llanova$#ers$$iger#"ma"\'nkenoog',
+    '$#ist$\'oncello"\'rginals#$idis"#sio#&tbacka"4tamin-a-supplemented"$vify"!x!&lasman$%timir"(issingen!,oice-leading#)gt-kelvin"$kani',
+    '$-tility-volume#$gian#%oshin"&rtexes"$ssen"-te-maximizing")uchsafing#$sden!%rabel#"ie"%oooom!*ulcanology##pis"&sela-2 (wachmann',
+    '&&height"#ked#&iihuri"&lburga$!y#$keth$#ley$%overs#)l-painter%$walk$&sgrove%#ton##ras"(r-effort#"by',
+    '%,n-controlled$#man#%ninks#&reners".ste-collection%%watch"(ter-flow&#jug&$main&&saving%&spouts#,tle-and-daub"#vey"#wel"(ziristan',
+    '!\'ealands$&dmoors$-th-generating\'\'holding#&nlings#\'ponless#(therburn(!y\'%field\'%vanes"#del")ek-ending$!.#$tman"$gner',
+    '#$fang#%ghall%#ers#\'maraner"*ll-brushed%+capitalized&*onditioned%.differentiated%&played&\'rovided%$shod&%prung$$bore$#ens#"te',
+    '##ilo"#rax#!l#"ra$!y")sterfield$#ite$$mann$#off""te!.hat\'s-her-name$$e\'er%#ley"%eddon#\'el-lock',
+    '#!l#,pper-snapper\'\'snapper%#in\'\'%g-boy##sps##te-&#eye&%stone%$bred%%cliff&$raig%%sides"$o\'se#\'-dunnit',
+    '#&oooooo"%upped!$icbc#!e#(kability$)et-taking")de-winged"(esenthal"%fredo")gan-based##hts"%lburn#$ford#\'hautyah##ing',
+    '#$lems$&owherb#%shere$(on-brown##tel"%nalot#$bush#)ding-down%-schgr&auml;tz$&ow-box#(egrowers#\'g-patch$$beat#*kle-picker#%nersh',
+    '"*re-netting$$work##ths"#sed#&h-wash#"pa"*tch-finder!!j!"ll!(olfblood$$king$#man#$pert"(manpower"(od-louse',
+    '$&screws#"fs#%lhope$#ler$$work"*rd-finding&(ormation$#age#\'k-group$%overs$$plan$$rate#+ld-changing&&market&%title',
+    '"(ite-back%#now$*ing-master"%ynose!#spc!#uff"#lly!"vr!%yatts"$burn"(cliffite"#mer"\'sepower"&thburn#\'schaete',
+    '!&enakis"&rotech$#xed!!g!\'iannian""mp (yakitori##obi"%mahas""no"(rm-based$#ouk#"ra"#sar#"sa',
+    '!%efrem")llow-gold&\'hammers&$tail""ni!#ibo"%ppies"!s##huv!&ockney"$rder#&kstone"%shiko"%ughal#\'ng(ish)',
+    '!#ser""fa!$ucef""ji"%kagir!"we (zabaleta"!c"$heer"#kks#&rewski"$lman!*eichnungen#!n#"st',
+    '"$ttel"#yer!%hores!%ilpah"#mba#$mern")nc-plated#+d-humbrecht#"eb#*giberaceae#(kernagel#%reich"&pporah!$obel$$rnig',
+    '""ra""ya!*ur&uuml;ck"$tshi!&ygmunt',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_28 = (
+count_28 = 6694
+
+heads_28 = (
     '&aacute;rpad',
-    '&aelig;lfsige',
-    '&eacute;cologie',
-    '&eacute;volu&eacute;s',
-    '&egrave;lite',
-    '&mdash;1',
-    '&mdash;from',
-    '&mdash;should',
-    '&ndash;what',
-    '&oacute',
-    '&scaron;iptars',
-    '&yen;5',
-    '\'arry',
-    '\'ullo',
-    '\'when',
-    '-actinin',
     '-b5',
-    '-chain',
-    '-monomethy-l-arginine',
-    '-so',
-    '-there',
-    '-thymidine',
-    '0.6-micron',
-    '0.7-micron',
-    '0.8p',
-    '1-inch',
-    '1-lb',
-    '1.1-litre',
-    '10&ndash;22',
-    '10-length',
-    '10-second',
-    '10-yard',
     '100-per-cent',
-    '100-plus',
-    '100-seat',
-    '101-year-old',
-    '10am&ndash;4pm',
-    '11-match',
-    '11-nation',
-    '11-point',
-    '12-bit',
-    '12-metre',
-    '12-note',
-    '120-seat',
-    '120-year',
-    '1272&ndash;1307',
-    '13-mile',
-    '13-track',
     '130mm',
-    '14-foot',
-    '14-night',
-    '141-member',
-    '1420s',
-    '14d',
-    '15-acre',
-    '15lbs',
-    '16-match',
-    '16.5p',
-    '17-man',
-    '17-month',
-    '17mm',
-    '18year-old',
-    '1900\'s',
-    '1924&ndash;9',
     '1930s-style',
-    '1942&ndash;43',
-    '1982d',
-    '1m-bit',
-    '2&frac12;-hour',
-    '2&ndash;1/2',
-    '2\'-deoxyoligonucleotides',
-    '2-6-2t',
-    '2-inch',
-    '2-metre',
-    '2.2p',
-    '20-storey',
-    '20-track',
-    '200-year',
-    '21-man',
-    '21-week',
     '22-mile',
-    '238-pin',
-    '23in',
-    '24&ndash;sept',
-    '24-inch',
-    '24-nation',
-    '24-way',
-    '24-well',
-    '25-',
-    '3-course',
-    '3-glucuronide',
-    '3-mile',
-    '3-ply',
-    '3.0-litre',
-    '3.35p',
-    '30-man',
     '300-yard',
-    '31-member',
-    '32-valve',
-    '32-way',
-    '33&ndash;40',
-    '33-year',
-    '34&ndash;35',
-    '34-member',
-    '35-nation',
-    '35cm',
-    '36-member',
-    '37-hour',
-    '400-page',
-    '400-seat',
-    '41-year',
-    '42-year',
     '42in',
-    '45-m',
-    '45-yard',
-    '45year-old',
-    '49-member',
-    '5&ndash;7pm',
-    '500-member',
-    '500-user',
-    '6-year',
-    '6.1p',
-    '6.5mm',
-    '60-a-day',
-    '60-akce',
-    '60-second',
-    '64-megabit',
-    '64-port',
     '64-processor',
-    '64m-bit',
-    '66&ndash;9',
-    '69-member',
-    '69s',
-    '6os',
-    '7-series',
-    '75-year',
-    '750mm',
-    '76mm',
-    '79ad',
-    '7secs',
-    '80486sl-based',
-    '93-year-old',
-    '99-seat',
-    'a(b)',
     'a-10',
-    'a-quiver',
-    'a17',
-    'a422',
-    'aamer',
-    'aapri',
-    'aaw',
-    'ab-type',
-    'abafa',
-    'abbate',
-    'abbesses',
-    'abca',
-    'abdu',
-    'aberarder',
-    'abernant',
-    'abisala',
     'ablate',
-    'aboud',
-    'abso',
-    'acamar',
-    'acaster',
-    'accessorising',
-    'account(s)',
-    'accountant-general',
-    'accum',
-    'accustoms',
-    'acetogenesis',
-    'acheikh',
-    'achintree',
-    'achuar',
-    'acky',
-    'acm',
     'acrington',
-    'acse',
-    'activision',
-    'activity\'',
-    'adamawa',
-    'adamthwaite',
-    'adelstein',
-    'adid',
-    'adou',
-    'adri',
-    'adspeak',
-    'adu',
-    'adua',
-    'advaita',
-    'advan',
-    'advancelink',
     'adzharia',
-    'aeb',
-    'aelfric',
-    'aero-space',
-    'aerobathon',
-    'aeronavale',
-    'aertex',
-    'aetherius',
-    'aetr',
-    'afco',
-    'afeared',
-    'afi',
-    'after-dark',
-    'after-work',
-    'aftr',
-    'aganbegyan',
     'agarawal',
-    'agazadeh',
-    'agcas',
-    'agecroft',
-    'agedabia',
-    'aggarwal',
-    'agricolan',
-    'agro',
-    'agroecosystems',
-    'agrophobia',
-    'agues',
-    'agustus',
-    'ahas',
-    'ahmar',
-    'ahnenerbe',
-    'aina',
     'air-fall',
-    'air-freight',
-    'air-intake',
-    'air-lifted',
-    'air-reinforcement',
-    'airbursts',
-    'aircraft-leasing',
-    'airth',
-    'aissa',
-    'aiwa',
-    'ajeya',
-    'akitt',
-    'akureyri',
-    'al-jaburi',
-    'al-khaimah',
-    'al-khorayef',
     'al-zawi',
-    'alaa',
-    'alamut',
-    'alc&aacute;ntara',
-    'alchohol',
-    'alcian',
-    'alciston',
-    'aldh',
-    'alegria',
-    'alembics',
-    'alexandrina',
-    'alfonse',
-    'alfven',
-    'algo',
-    'algora',
-    'alhamad',
     'alienth',
-    'alikhan',
-    'alksnis',
-    'alkylate',
-    'all-dark',
-    'all-expenses-paid',
-    'all-line',
-    'all-race',
-    'all-wood',
-    'allatt',
-    'allaway',
-    'allbeury',
-    'allem',
-    'allexton',
-    'allotropy',
-    'allways',
     'allwood',
-    'alnair',
-    'alnitak',
-    'along-side',
-    'alpacas',
-    'alpha-tubulin',
-    'alsike',
-    'altan',
-    'alteplase',
-    'alternating-current',
-    'althusserean',
-    'altl&auml;nderstrasse',
-    'altona',
-    'altri',
-    'alvaston',
-    'alvis',
     'amarilli',
-    'amarjeet',
-    'amati',
-    'ambo',
-    'ambrosio',
-    'ambulia',
-    'amefia',
-    'american-japanese',
-    'americanum',
-    'amica',
-    'aminoacyl-trna',
-    'ampelio',
-    'ampex',
-    'amphipods',
-    'amphitrite',
-    'ampton',
     'anableps',
-    'anaesthetize',
-    'anagnostopoulos',
-    'analysys',
-    'ananda',
-    'anastomosal',
-    'anatomized',
-    'anchorians',
-    'andr&aacute;ssy',
-    'anechoic',
-    'angelika',
-    'anghiari',
-    'angiograms',
-    'anglicise',
-    'angsty',
-    'angula',
     'animal-based',
-    'animal-watching',
-    'anionics',
-    'anodonta',
-    'anouk',
-    'anr-pc',
-    'ansii',
-    'antartic',
-    'ante-bellum',
-    'anti-ageist',
-    'anti-alliance',
-    'anti-art',
-    'anti-censorship',
-    'anti-coalition',
-    'anti-condensation',
-    'anti-dutch',
     'anti-essentialist',
-    'anti-granulocyte',
-    'anti-gravity',
-    'anti-hashemite',
-    'anti-italian',
-    'anti-knock',
-    'anti-libertarian',
-    'anti-nt',
-    'anti-statism',
-    'antietam',
-    'antigonus',
-    'antologia',
-    'anton&iacute;n',
-    'anubias',
-    'anuses',
-    'anyting',
     'aonachs',
-    'apang',
-    'apd',
-    'aperto',
-    'apnet',
-    'appealling',
-    'appearance-reality',
-    'appened',
-    'apple-green',
-    'apple-scented',
-    'applets',
-    'apres-ski',
-    'apw',
-    'aquafresh',
-    'aqualisa',
-    'aquanettas',
     'aquilino',
-    'ar-see-nee-yo',
-    'arabiyat',
-    'arbeid',
-    'arbitraging',
-    'arc-welding',
-    'archiac',
-    'archilochus',
-    'arcom',
-    'arcuatus',
-    'arditti',
-    'ardre',
-    'ardshiel',
-    'arebeyat',
-    'arethusa',
-    'arette',
     'arges',
-    'argoed',
-    'arguers',
-    'arieti',
-    'ariola',
-    'aristoc',
-    'arithmeticae',
-    'arkies',
-    'arlesey',
-    'arliss',
-    'armees',
-    'arnauld',
-    'arndt',
-    'arnoult',
-    'arora',
-    'arosa',
     'arrer',
-    'arretine',
-    'arrogating',
-    'arsenale',
-    'art-critic',
-    'artaphernes',
-    'artforms',
-    'arth',
-    'arthus',
-    'arvandus',
-    'arvey',
-    'ascaridoid',
-    'ascender',
-    'ash-brown',
-    'ashcombe',
-    'ashdonian',
     'ashendene',
-    'ashgrove',
-    'ashida',
-    'asiatica',
-    'asli',
-    'assamese',
-    'assan',
-    'assayer',
-    'assisstant',
-    'assuages',
-    'astarielle',
-    'astartes',
-    'astaxanthin',
-    'astilbes',
-    'astrochele',
-    'astropaths',
     'asuneft',
-    'atack',
-    'atahualpa',
-    'atam',
-    'atha',
-    'athanasopoulos',
-    'atitl&aacute;n',
-    'atle',
-    'atochem',
-    'atto',
-    'atts',
-    'atvs',
-    'auchincloss',
-    'auckley',
-    'audiotaped',
-    'autee',
     'auto-offs',
-    'auto-route',
-    'autogyro',
-    'autologic',
-    'autoparts',
-    'avoir',
-    'avr',
-    'avram',
-    'avtk',
-    'awatinas',
-    'awns',
-    'awre',
-    'axils',
-    'aycock',
-    'azcona',
-    'azteca',
     'azzone',
-    'azzurro',
-    'b&eacute;cherel',
-    'b&ouml;rsenverein',
-    'b&uuml;hlmann',
-    'b-c',
-    'b.f.',
-    'b.g.',
-    'baab',
-    'baader',
-    'babila',
-    'babysave',
-    'baccalaur&eacute;ate',
-    'bacchanal',
-    'back-foot',
-    'back-to-the-wall',
     'bacon-curing',
-    'badan',
-    'badb',
-    'badger-baiting',
-    'badia',
-    'badie',
-    'badinter',
-    'badly-managed',
-    'badman',
-    'bads',
-    'bahraini',
-    'baht\'at',
-    'baileyfield',
-    'bailout',
-    'bairds',
-    'baksheesh',
     'balakovo',
-    'balassa',
-    'baldick',
-    'balere',
-    'balfe',
-    'balks',
-    'ball-playing',
-    'ball-valve',
-    'ballards',
-    'balloo',
-    'ballyfolion',
-    'ballymacilroy',
-    'balnibarbi',
-    'balsley',
-    'baltazar',
-    'bamby',
     'band-shift',
-    'bandsaws',
-    'bank-',
-    'bankstown',
-    'baptisia',
-    'baptista',
-    'bapu',
-    'bar&egrave;ges',
-    'bar-sur-seine',
-    'barash',
-    'barbados-born',
-    'barbariga',
-    'barberry',
-    'bargain-hunting',
-    'bargar',
-    'barkerend',
     'barkor',
-    'barlby',
-    'barnbow',
-    'barness',
-    'barossa',
-    'barqa',
-    'barricading',
-    'barrowloads',
-    'barrymores',
-    'bartels',
-    'barth&eacute;lemy',
-    'barthel',
-    'bary',
-    'baseford',
-    'bashkim',
-    'basker',
     'bassin',
-    'basslet',
-    'bat-pollinated',
-    'batam',
-    'batterby',
-    'battle-torn',
-    'battledore',
-    'batus',
-    'baucus',
-    'bawds',
-    'bawn',
-    'baye',
-    'baz&aacute;n',
-    'bazelaire',
-    'bdang',
-    'bdc',
     'beadlam',
-    'beament',
-    'bean-bag',
-    'beanbags',
-    'bearn',
-    'beatriz',
-    'beaty',
-    'beaumonts',
-    'becconsall',
-    'bechhofer',
-    'beck-water',
-    'bed-settee',
-    'bedfield',
-    'bedmate',
-    'bedwell',
-    'beermats',
     'beerse',
-    'befor',
-    'before-hand',
-    'begawan',
-    'behove',
-    'behrendt',
-    'beic',
-    'bejeaned',
-    'belcourt',
-    'belemnita',
-    'beleschenko',
-    'beleza',
-    'belgae',
-    'bellaser',
-    'bellcore',
-    'bellhop',
     'bellringing',
-    'bellrock',
-    'bellwin',
-    'beltr&aacute;n',
-    'belyutin',
-    'bembenek',
-    'bemrose',
-    'benahavis',
-    'benchmarked',
-    'bene&scaron',
-    'benedico',
-    'benefactress',
-    'benefit-cost',
-    'benignant',
-    'bennite',
-    'benomyl',
     'bently',
-    'benyamin',
-    'benylin',
-    'benzina',
-    'berghel',
-    'berglund',
-    'bergmann',
-    'bergomi',
-    'berhthun',
-    'berhtred',
-    'bernardini',
-    'berny-rivi&egrave;re',
-    'beroepen',
-    'berte',
-    'berthier',
-    'bery',
     'beskydy',
-    'besly',
-    'best-organised',
-    'best-value',
-    'bestknown',
-    'beta-testing',
-    'betacom',
-    'bethsiedum',
-    'betsey',
-    'better-trained',
-    'bettye',
-    'bewcastle',
-    'beyazik',
-    'bfk',
-    'bhanu',
-    'bhaw&amacr;ni',
     'bhawana',
-    'bhimani',
-    'bhuller',
-    'bi-colour',
-    'bi-gram',
-    'bi-lateral',
-    'bibb',
-    'bibelots',
-    'bich',
-    'bichard',
-    'bicolour',
-    'bid-price',
-    'bienvenue',
-    'bierhoff',
-    'big-endian',
-    'bigfoot',
     'biggam',
-    'bihari',
-    'biharis',
-    'biju',
-    'bikini-bottom',
-    'bildende',
-    'bilhah',
-    'billiard-table',
-    'bingen',
-    'binnian',
-    'binsted',
-    'binyamin',
-    'bio-chemist',
-    'biofluid',
-    'biokern',
-    'biologically-based',
     'biomagnetic',
-    'biomed',
-    'biosal',
-    'biotopes',
-    'birchill',
-    'bird-dispersed',
-    'birds-eye',
-    'birdsfoot',
-    'birdtables',
-    'birinus',
-    'birkwood',
-    'birmingham-born',
-    'birru',
-    'birstall',
-    'birth-mark',
-    'biryani',
     'bisanzio',
-    'bisguanides',
-    'bist',
-    'bisu',
-    'bit-7',
-    'bitsy',
-    'black-framed',
-    'black-red',
-    'blackies',
-    'blancke',
-    'blankout',
-    'blastocoel',
-    'blaxill',
-    'bleek',
-    'blinker',
-    'blitherdick',
     'bloodletter',
-    'blop',
-    'blowjob',
-    'blue-blackness',
-    'blue-painted',
-    'blue-yellow',
-    'bluebar',
-    'bluglass',
-    'bluish-violet',
-    'blumenthalstrasse',
-    'bmp-4',
-    'bo&eacute;tie',
-    'boafo',
-    'boat-hook',
-    'boat-yard',
-    'bobbin-making',
     'bobu',
-    'bod&oslash',
-    'bodegraven',
-    'bodgers',
-    'bodlender',
-    'body-bag',
-    'body-length',
-    'body-maker',
-    'boenninghausen',
-    'boethian',
-    'bogg',
-    'bolshevist',
-    'bolt-protected',
-    'bomb-aimer',
-    'bomb-blast',
-    'bonaire',
     'boneshaker',
-    'bonior',
-    'boniver',
-    'bonnat',
-    'bonneval',
-    'bonnier',
-    'bonu',
-    'book-reading',
-    'book-room',
-    'book-seller',
-    'bookes',
-    'boom-boom',
-    'boons',
-    'bootlegger',
-    'borer',
-    'borocourt',
     'borovo',
-    'bosco',
-    'bossard',
-    'boublil',
-    'bouffons',
-    'bounderby',
-    'bourdon',
-    'bourlet',
-    'boutet',
-    'bovington',
-    'bowker-saur',
-    'boxmaking',
-    'boy-in-the-box',
-    'br&eacute;che',
-    'bradshaws',
-    'brahmsian',
     'brain-drain',
-    'braining',
-    'bramhope',
-    'brancazio',
-    'brand&atilde;o',
-    'brandade',
-    'brandwood',
-    'bratunac',
-    'braund',
-    'brawne',
-    'braz',
-    'breaking-down',
-    'breast-arrest',
-    'breheny',
-    'brenan',
-    'bresaola',
     'bretby',
-    'bretts',
-    'breydon',
-    'bri-nylon',
-    'brianne',
-    'bridehead',
-    'brideprice',
-    'bridgefoot',
-    'brightfield',
-    'brightwater',
-    'bristen',
-    'british-controlled',
-    'brnovic',
-    'broaches',
-    'broddle',
-    'brokaw',
     'bronfenbrenner',
-    'bronze-',
-    'bronze-green',
-    'brooksbank',
-    'broose',
-    'broude',
-    'broughams',
-    'broussard',
-    'broverman',
-    'brown-grey',
-    'brownstein',
-    'brugha',
-    'brunsson',
-    'bry',
-    'bryde',
-    'bryncrug',
     'bsr',
-    'bth',
-    'btus',
-    'bubble-up',
-    'bucintoro',
-    'buea',
-    'buford',
-    'buhl',
-    'builded',
-    'building-in',
-    'bulb-fibre',
-    'bulk-flow',
-    'bumbane',
-    'bundesamt',
-    'bundessieger',
-    'burco',
     'burdiehouse',
-    'burglen',
-    'burillo',
-    'burri',
-    'burstead',
-    'burtree',
-    'bush-baby',
-    'bushbuck',
-    'bussey',
-    'bussy',
-    'butterfingers',
-    'butteris',
-    'butthead',
-    'button-back',
-    'buttoned-down',
-    'butylbromide',
     'buyer-behaviour',
-    'buyer-borrower',
-    'buying-power',
-    'buz',
-    'buzz-free',
-    'by-',
-    'bydgoszcz',
-    'bye-line',
-    'bys',
-    'byt',
-    'c-anca',
-    'c-e',
-    'c-h',
-    'c-shape',
-    'c.b.e',
-    'c.b.e.',
     'c.g',
-    'c98',
-    'caball&eacute',
-    'cabestan',
-    'cablecomms',
-    'cabon',
-    'cacgtg',
-    'cachous',
-    'cadgers',
-    'cadi',
-    'caeserea',
-    'caffier',
-    'cagnes',
-    'caja',
-    'calciferous',
-    'calhoun',
     'calibans',
-    'caliente',
-    'camarillo',
-    'cambell',
-    'camemberts',
-    'camera-eye',
-    'camerini',
-    'camerounais',
-    'camisard',
-    'camkin',
-    'campagnola',
-    'campesinas',
-    'camshafts',
-    'can-opener',
-    'canadapass',
-    'canal-building',
     'canalize',
-    'candle-making',
-    'candlewax',
-    'candlin',
-    'candoglia',
-    'caneton',
-    'cantorum',
-    'capellino',
-    'capgrave',
-    'capistrano',
-    'capital-logic',
-    'cappuccini',
-    'cappy',
-    'capricornus',
-    'caprine',
-    'car-coat',
     'caracciolo',
-    'caraher',
-    'caramitru',
-    'carbohydrate-based',
-    'carby',
-    'card-playing',
-    'cardenista',
-    'cardinalis',
-    'carduus',
-    'career-threatening',
-    'carefully-chosen',
-    'carefully-selected',
-    'carham',
-    'cariani',
-    'caribbean-born',
-    'carica',
     'carino',
-    'carit&agrave',
-    'carjack',
-    'carkesse',
-    'carnac',
-    'carola',
-    'carolling',
-    'carothers',
-    'carpetbaggers',
-    'carpetland',
-    'carseckie',
-    'cart-tail',
-    'cartrefle',
-    'carvetiorum',
-    'casado',
-    'caseinate',
     'caseous',
-    'cash-settled',
-    'cassels',
-    'cassiano',
-    'castelnuovo',
-    'castor-oil',
-    'castrates',
-    'casu',
-    'catalano',
-    'catalino',
-    'cataluna',
-    'catfight',
-    'cathepsin',
-    'cathodes',
-    'catrin',
-    'caudate',
     'cause-to-effect',
-    'cauvin',
-    'cavalerie',
-    'cavey',
-    'cavils',
-    'caymans',
-    'ccla',
-    'cdw',
-    'ceanothus',
-    'cecil-trained',
-    'cedars-sinai',
-    'cefni',
-    'cegidfa',
-    'celano',
-    'celine',
-    'cell-cell',
     'cellobus',
-    'cenacle',
-    'ceng',
-    'cepaitis',
-    'ceprano',
-    'cerda',
-    'cereus',
-    'cering',
-    'cerrig',
-    'cerus',
-    'cevert',
-    'ceviche',
-    'ch\'kassian',
-    'ch\'nozia',
-    'chaban',
-    'chaff-cutter',
     'chaffy',
-    'chahal',
-    'chaika',
-    'chainstores',
-    'chalder',
-    'chaliapin',
-    'chalk-dust',
-    'chambertin',
-    'champagne-coloured',
-    'chanan',
-    'chanda',
-    'changs',
-    'channeled',
-    'character\'',
-    'charasse',
-    'charentais',
     'charisse',
-    'charity-boy',
-    'charney',
-    'chasin\'',
-    'chatset',
-    'chattopadhyay',
-    'chaucerian',
-    'chaumet',
-    'chausson',
-    'chechens',
-    'check-point',
-    'chee-ow',
-    'cheggers',
-    'chelle',
-    'chelonia',
-    'chenopodium',
     'chereau',
-    'cherkin',
-    'cherney',
-    'cherrie',
-    'cherryhill',
-    'chersonese',
-    'chesewic',
-    'chestnut-bellied',
-    'chevaliers',
-    'chevening',
-    'chevignon',
-    'chhum',
-    'chibnall',
-    'chicas',
-    'chickenwire',
-    'chiffchaffs',
     'chiffonier',
-    'child-spacing',
-    'chimbote',
-    'chinese-american',
-    'chinkin',
-    'chinua',
-    'chip-pan',
-    'chirica',
-    'chitre',
-    'chitwan',
-    'chivenor',
-    'chloramines',
-    'choerilus',
-    'chohan',
-    'chombe',
-    'chomps',
     'choros',
-    'choules',
-    'chown',
-    'christmasses',
-    'christophi',
-    'chromatophores',
-    'chrysolakkos',
-    'chsa',
-    'chua',
-    'chula',
-    'chumps',
-    'church-as-a-force',
-    'church-sponsored',
-    'church-yard',
-    'churton',
-    'chypre',
     'cimiez',
-    'cinalli',
-    'cindery',
-    'cinematheque',
-    'cinerary',
-    'cinestra',
-    'circls',
-    'circularize',
-    'ciria',
-    'citra',
-    'citterio',
-    'city-dweller',
-    'cladistics',
-    'claman',
-    'clann',
-    'claribel',
     'clarinda',
-    'class-leading',
-    'claudie',
-    'claudin',
-    'clavinova',
-    'cle-2',
-    'cleaks',
-    'cleanability',
-    'clear(y)',
-    'clerambault',
-    'cleruchy',
-    'click-clack',
-    'clientelist',
-    'climate-controlled',
-    'climping',
-    'clo-test',
     'cloathed',
-    'clockhouse',
-    'clod-hopping',
-    'clodagh',
-    'cloisonne',
-    'cloisterham',
-    'cloistral',
-    'clonetech',
-    'clopping',
-    'closely-spaced',
-    'cloud-filled',
-    'clrae',
-    'clube',
-    'clubmates',
-    'clubroot',
-    'clwydian',
     'cm-1300',
-    'cmead',
-    'cmyk',
-    'co&euml;me',
-    'co-citing',
-    'co-co',
-    'co-hosted',
-    'co-hosts',
-    'co-organised',
-    'coal-getting',
-    'coal-scuttle',
-    'coatlique',
-    'cobby',
-    'cochons',
-    'cockatrices',
-    'cockfights',
     'cocoa-growing',
-    'cocorico',
-    'codas',
-    'code-free',
-    'codner',
-    'coelomate',
-    'coenen',
-    'coffee-growing',
-    'cogwheels',
-    'cohb',
-    'coiled-coil',
-    'coiner',
-    'coit',
-    'colemanballs',
-    'colibri',
-    'colla',
     'college-educated',
-    'collets',
-    'collette',
-    'colmans',
-    'colombard',
-    'colonello',
-    'colston-hayter',
-    'columbines',
-    'columella',
-    'colway',
-    'comi',
-    'cominform',
-    'comino',
-    'comm-call',
-    'command-line',
-    'commercial-grade',
     'commi',
-    'commingled',
-    'committe',
-    'communi',
-    'community-centred',
-    'community-oriented',
-    'communltel',
-    'comorbid',
-    'competency-based',
-    'competitively-priced',
-    'complan',
-    'compu',
-    'computerize',
-    'conasquay',
-    'concelebrating',
-    'concer',
     'concert-goer',
-    'concertaci&oacute;n',
-    'concubinage',
-    'conduce',
-    'confravision',
-    'conisbee',
-    'conservational',
-    'contin',
-    'conver',
-    'coober',
-    'cooking-pot',
-    'cool-box',
-    'coopting',
-    'cootehill',
-    'copaz',
-    'copd',
     'copdock',
-    'copersucar',
-    'copicat',
-    'coppen',
-    'copper-mining',
-    'corbeau',
-    'cordovan',
-    'corebyte',
-    'corliss',
-    'corn-milling',
-    'corner-kick',
-    'cornfeld',
-    'cornillon',
-    'coronas',
-    'corporis',
-    'corranaich',
     'correctnewpos',
-    'corres',
-    'corsi',
-    'cortinas',
-    'corvine',
-    'corwin',
-    'cossors',
-    'costard',
-    'coston',
-    'cot-death',
-    'cottage-style',
-    'cotton-knit',
-    'couchgrass',
-    'coula',
-    'coulombs',
-    'countenancing',
     'counterexamples',
-    'counterpointing',
-    'countrey',
-    'country-town',
-    'county-by-county',
-    'couthy',
-    'covasna',
-    'covertness',
-    'cowburn',
-    'cowgirls',
-    'cowleaze',
-    'cowpat',
-    'cowpoke',
-    'coylton',
-    'cpn',
-    'cppcc',
     'cr&ecirc;me',
-    'cr-labelled',
-    'crab-apple',
-    'craigmyle',
-    'craigtoun',
-    'crandon',
-    'cransley',
-    'crayoning',
-    'creb-binding',
-    'credit-sale',
-    'creeper-clad',
-    'creeper-covered',
-    'creg',
-    'creperie',
-    'crespo',
-    'creswell',
     'crewcut',
-    'crime-and-punishment',
-    'crispa',
-    'crispen',
-    'crispie',
-    'cristescue',
-    'cristolino',
-    'croesyceiliog',
-    'croggon',
-    'crones',
-    'cross-control',
-    'cross-harbour',
-    'cross-hole',
-    'cross-matched',
-    'cross-module',
-    'cross-piece',
     'cross-subsidising',
-    'crosscurrents',
-    'crossing-point',
-    'crossply',
-    'crouchback',
-    'crowd-pulling',
-    'croxall',
-    'croydex',
-    'cruck',
-    'cruda',
-    'cryptogram',
-    'csl',
-    'ctag',
-    'ctr',
-    'cubi',
-    'cublai',
     'cuirassiers',
-    'cuisia',
-    'culinaire',
-    'cullinan',
-    'cultoon',
-    'cumbrae',
-    'cunhal',
-    'curbar',
-    'curer',
-    'curiowood',
-    'curlicue',
-    'curly-headed',
-    'curriemuirend',
-    'curvier',
-    'custom\'ry',
-    'cut-and-paste',
     'cutoffs',
-    'cutteslowe',
-    'cvc',
-    'cyborgs',
-    'cycletouring',
-    'cycos',
-    'cynethryth',
-    'cyngor',
-    'cynog',
-    'cyperaceae',
-    'cypraea',
-    'cyprinidae',
-    'czars',
-    'czernowitz',
-    'czeslaw',
-    'd&eacute;bat',
     'd&eacute;gag&eacute',
-    'd&mdash;6',
-    'd\'affaire',
-    'd\'origine',
-    'd-block',
-    'd-pawn',
-    'd042',
-    'd26',
-    'dabbles',
-    'dadra',
-    'dafis',
-    'daguerrotypes',
-    'dahlem',
-    'daikin',
-    'dakletons',
-    'dalisons',
     'dallman',
-    'damaraland',
-    'damato',
-    'damer',
-    'dameta',
-    'damiano',
-    'damm',
-    'damyata',
-    'danceteria',
-    'dangler',
-    'danial',
-    'daniella',
-    'danthrone',
-    'daoud',
-    'daph',
-    'dapple',
     'daps',
-    'daran',
-    'daredevils',
-    'dark-stained',
-    'darkley',
-    'darlington-born',
-    'darryll',
-    'darya',
-    'date(s)',
-    'dauphine',
-    'davenham',
-    'dawdles',
-    'dawgs',
-    'dawtrey',
-    'dayglobe',
-    'daylong',
     'dc-9',
-    'de-commissioned',
-    'de-seasonalized',
-    'dearham',
-    'death\'s-head',
-    'death-',
-    'death-mask',
-    'death-squad',
-    'debouching',
-    'decaf',
-    'decalcified',
-    'decision-support',
-    'decius',
-    'deco-style',
-    'deconstructionism',
-    'deene',
     'deep-frying',
-    'deer-park',
-    'defence-in-depth',
-    'defenceman',
-    'deferent',
-    'defoliating',
-    'defraying',
-    'defuses',
-    'defw',
-    'degree-linked',
-    'degw',
-    'deinhard',
-    'delafield',
-    'delander',
-    'delillo',
-    'dellinger',
     'delmonico',
-    'delt',
-    'delvalle',
-    'delvert',
-    'dembina',
-    'demergers',
-    'demoing',
-    'demythologize',
-    'denkmalpflege',
-    'denson',
-    'dentelles',
-    'deon',
-    'departmentalisation',
-    'depoliticize',
-    'derhalli',
-    'dermacare',
     'dermato-venereologist',
-    'derna',
-    'dertouzos',
-    'derv',
-    'desarrollo',
-    'deserta',
-    'desisting',
-    'desk-sergeant',
-    'desperately-needed',
-    'despoins',
-    'destitutes',
-    'detector-operated',
-    'detenus',
-    'detoured',
-    'deuterostome',
-    'devrimci',
     'dhalie',
-    'dhfr',
-    'diag',
-    'diastema',
-    'diatomite',
-    'diazomethane',
-    'dibuama',
-    'dickies',
-    'dictamnus',
-    'diecast',
-    'diepgen',
-    'dietmar',
-    'digital-to-analogue',
-    'dijmarescu',
-    'dikmen',
-    'diktats',
     'dilatometry',
-    'dilger',
-    'dillen',
-    'dimfel',
-    'dimitrovitch',
-    'dimwit',
-    'dinette',
-    'dingleton',
-    'dinoflagellates',
-    'dinwiddy',
-    'dioscuri',
-    'diphones',
-    'diploma-level',
-    'dipole-dipole',
-    'direction-finding',
-    'director-designate',
     'dirndl',
-    'disc-based',
-    'dischidia',
-    'discipling',
-    'discomfit',
-    'disfluency',
-    'disillusions',
-    'disjoined',
-    'disneyhood',
-    'disorganize',
-    'dispute-resolving',
-    'dissanayake',
-    'distalgesic',
-    'disulphated',
-    'dittany',
-    'divine-right',
     'diwali',
-    'dlos',
-    'dmf',
-    'dna-damaging',
-    'do-action',
-    'docu-drama',
-    'doerner',
-    'dog-face',
-    'dog-lover',
-    'dogg',
-    'dogsbodies',
-    'dohrn',
-    'dolfo',
-    'dolin',
-    'dome-car',
-    'doming',
     'dominici',
-    'dominium',
-    'domis',
-    'doms',
-    'donelan',
-    'doorn',
-    'dop',
-    'dope-smoking',
-    'doppler-shift',
-    'doron',
-    'dorsoventral',
-    'dosimat',
-    'dossou',
-    'dottoressa',
-    'double-acting',
-    'double-beam',
     'double-glaze',
-    'double-helix',
-    'double-width',
-    'doubletake',
-    'doucement',
-    'dougald',
-    'doughboy',
-    'doust',
-    'dowayos',
-    'dowelanco',
-    'dowelled',
-    'down-escalator',
-    'downclimbed',
-    'downdo',
-    'downunder',
-    'downwarping',
     'dragonslayer',
-    'dragooning',
-    'draughtproof',
-    'draw-string',
-    'drdos',
-    'dre',
-    'dreamboat',
-    'dreamings',
-    'dreghorn',
-    'driant',
-    'drip-fed',
-    'driveshaft',
-    'drop-ship',
-    'droully',
-    'drug-addicted',
-    'drugget',
     'dry-fried',
-    'dryopithecini',
-    'dth',
-    'dual-task',
-    'dubossary',
-    'duchamp-villon',
-    'dudu',
-    'duker',
-    'dulbeco',
-    'dulness',
-    'dumka',
-    'dumping-ground',
-    'dumyat',
-    'dungl',
-    'dunmail',
-    'dunnichen',
     'dunsden',
-    'duotone',
-    'dupleix',
-    'dutskche',
-    'dva',
-    'dvs',
-    'dxa',
-    'dyhouse',
-    'dymocks',
-    'dynamisante',
-    'dynamised',
-    'dyspareunia',
-    'dzhava',
-    'ealy',
-    'early-nineteenth-century',
-    'earmuffs',
     'earth\'',
-    'earth-stained',
-    'earthlife',
-    'easier-to-use',
-    'east-south',
-    'easterner',
-    'eatables',
-    'eaves-level',
-    'ebg',
-    'ec-efta',
-    'ecclesall',
-    'echenique',
-    'echoic',
-    'ecim',
-    'ecofex',
-    'ecologically-based',
     'economised',
-    'ecosse',
-    'ectim',
-    'edge&oslash;ya',
-    'edge-on',
-    'edgewise',
-    'edin.',
-    'editorializing',
-    'educaci&oacute;n',
-    'education\'',
-    'educorp',
-    'efford',
-    'eftpos',
-    'egenhofer',
-    'eggardon',
-    'ego-trip',
     'egu',
-    'ehh',
-    'ehrenfeld',
-    'eichengreen',
-    'eif',
-    'eight-bedroomed',
-    'eight-piece',
-    'eight-team',
-    'eighteen-carat',
-    'eighteen-year',
-    'eilleen',
-    'eis-type',
-    'eladon',
-    'elanor',
-    'elc',
-    'eldonian',
     'eldoret',
-    'eldrene',
-    'electioneer',
-    'electras',
-    'electro-magnetism',
-    'electroeluted',
-    'electrohydraulic',
-    'electron-microscope',
-    'electronically-controlled',
-    'electroplated',
-    'elin',
-    'eliseo',
-    'ellam',
-    'elliffe',
-    'elorine',
-    'elshtain',
     'eluting',
-    'elyot',
-    'embayment',
-    'emblazoning',
-    'embryonated',
-    'emep',
-    'emerods',
-    'emiliano',
-    'emmer',
-    'emotion-charged',
-    'empennage',
-    'empresas',
-    'emptores',
-    'emulsify',
-    'emulsioned',
-    'encapsulator',
     'encik',
-    'encrease',
-    'encyclop&eacute;die',
-    'end-1991',
-    'end-1993',
-    'endeavors',
-    'endives',
-    'endlow',
-    'endosperm',
-    'enea',
-    'energy-balance',
-    'energy-based',
-    'enets',
-    'engelbart',
-    'enger',
-    'engine-house',
     'engle',
-    'englished',
-    'enmeshing',
-    'ensla',
-    'enssi',
-    'enst',
-    'entangles',
-    'entartete',
-    'entertain\'',
-    'entick',
-    'enuretic',
-    'eomd',
-    'eozs',
-    'epdrf',
-    'ephemerides',
-    'ephialtic',
     'epidauros',
-    'epoc',
-    'epochserv',
-    'epon',
-    'eproms',
-    'equador',
-    'equibrand',
-    'equipment-cost',
-    'equity-based',
-    'eran',
-    'erdman',
-    'erechtheion',
-    'erevan',
-    'ergotimos',
-    'ericht',
-    'erimus',
     'ero',
-    'erszebet',
-    'eryl',
-    'erymanthian',
-    'esade',
-    'esala',
-    'escales',
-    'escalon',
-    'escuela',
-    'esii',
-    'eske',
-    'esler',
-    'espa&ntilde;oles',
-    'esperance',
-    'espey',
-    'espl&eacute;chin',
     'espoirs',
-    'esposito',
-    'esprits',
-    'essanelle',
-    'essay-text',
-    'essendine',
-    'essiet',
-    'esson',
-    'estaing',
-    'estall',
-    'estang',
-    'estrange',
-    'esvem',
-    'etain',
-    'ethelwold',
-    'ethnically-based',
     'ethyne',
-    'ettedgui',
-    'ettington',
-    'etzioni-halevy',
-    'euboulos',
-    'eulaema',
-    'eumenides',
-    'eunetcom',
-    'euripos',
-    'euro-atlantic',
-    'euro-centrism',
-    'euro-communism',
-    'euro-communists',
-    'euro-jargon',
-    'euro-lang',
-    'euro-top',
     'euroaim',
-    'eurobag',
-    'eurocamp',
-    'eurodeposits',
-    'eurodesk',
-    'eurogroup',
-    'eurohub',
-    'europ&eacute;en',
-    'europhiles',
-    'eurospeak',
-    'eurostat',
-    'eurotravel',
-    'eusol',
-    'euterpe',
-    'ev\'n',
-    'ev\'ning',
     'eveleigh',
-    'evenkis',
-    'ever-mounting',
-    'ever-narrowing',
-    'everards',
-    'everite',
-    'everliving',
-    'everlys',
-    'evertonian',
-    'evolvematic',
-    'ewgm',
-    'ewshot',
-    'ex-agricultural',
-    'ex-champion',
-    'ex-colleague',
-    'ex-conduit',
     'ex-general',
-    'ex-heavyweight',
-    'ex-leader',
-    'ex-lner',
-    'ex-lnwr',
-    'ex-love',
-    'ex-nazi',
-    'ex-patriate',
-    'ex-patriot',
-    'ex-pro',
-    'ex-racing',
-    'ex-sergeant',
-    'ex-slave',
-    'ex-town',
-    'ex-trade',
-    'exam-passing',
     'examination-in-chief',
-    'excess-value',
-    'excideuil',
-    'excisemen',
-    'excises',
-    'execrated',
-    'executive-director',
-    'executive-type',
-    'exell',
-    'exeter-based',
-    'exner',
-    'exolon',
-    'expectorate',
-    'experience-based',
-    'expl',
-    'expressen',
     'extn',
-    'extra-',
-    'extra-budgetary',
-    'extraslim',
-    'extrasynaptic',
-    'exurban',
-    'eye-blink',
-    'eye-ring',
-    'eyedness',
-    'eyedrops',
-    'eyv&oslash;r',
-    'ezzoud',
-    'f&auml;rg',
-    'f&iacute;n',
-    'f&iacute;n&aacute;n',
-    'f&mdash;er',
     'f-18',
-    'f-hole',
-    'f15',
-    'fa(n)',
-    'fa-18',
-    'faberge',
-    'fabricius',
-    'face-cloth',
-    'fados',
-    'fair-isle',
-    'faircloth',
-    'fairhaven',
-    'fairmount',
-    'fala',
-    'falconi',
-    'faldi',
     'falkenna',
-    'falltrick',
-    'fambridge',
-    'familly',
-    'fanfani',
-    'fanks',
-    'fantasie',
-    'far-removed',
-    'farg',
-    'farhat',
-    'farideh',
-    'farm-cart',
-    'farm-gate',
-    'farm-yard',
-    'farme',
-    'farmery',
     'farmington',
-    'farmscape',
-    'farmscapes',
-    'farmwatch',
-    'farokh',
-    'farr-designed',
-    'farrag',
-    'farry',
-    'fasciculus',
-    'fass',
-    'fasslabend',
-    'fast-diminishing',
-    'fast-disappearing',
-    'fast-expanding',
-    'faster-growing',
-    'father-daughter',
     'fatin',
-    'fatly',
-    'fatsia',
-    'fauci',
-    'faugh',
-    'faunt',
-    'faustino',
-    'fawehinmi',
-    'fawzi',
-    'fax-based',
-    'fbo',
-    'fea',
-    'fearnside',
-    'febrerista',
-    'fedelma',
-    'federal-style',
     'federazione',
-    'feeley',
-    'feile',
-    'feliciano',
-    'felindre',
-    'fellow-american',
-    'fellow-believers',
-    'fema',
-    'femis',
-    'fence-post',
-    'fenderish',
-    'fenners',
-    'fereday',
-    'fergusons',
-    'ferkhan',
-    'ferl',
     'ferm&eacute',
-    'feros',
-    'ferrabee',
-    'ferret-faced',
-    'ferrety',
-    'ferrin',
-    'fessenden',
-    'fetherstonhaugh',
-    'fetishize',
-    'fettering',
-    'feuded',
-    'fever-ridden',
-    'fevre',
-    'fforest',
-    'ffos',
-    'fh',
     'fhe',
-    'fiachra',
-    'fiah',
-    'fibre-optics',
-    'fida',
-    'fiddle-case',
-    'fids',
-    'fief-rente',
-    'fiegehen',
-    'field-level',
-    'fieldwalking',
-    'fifers',
-    'fifield-hall',
-    'fifine',
-    'fifth-generation',
-    'fifth-wicket',
     'fifty-mile',
-    'fiftyish',
-    'figura',
-    'filarete',
-    'filching',
-    'filipe',
-    'film-going',
-    'filmstrips',
-    'fim',
-    'fin-rot',
-    'final-day',
-    'finance-ministry',
-    'finchie',
-    'finchlea',
-    'finck',
-    'finger-pointing',
     'finger-ring',
-    'finkin\'',
-    'finny',
-    'finstat',
-    'finuval',
-    'fior',
-    'fiorentino',
-    'fipa',
-    'firbush',
-    'fire-box',
-    'fire-drill',
-    'fire-fighter',
-    'fireclay',
-    'fireplan',
-    'firescreen',
-    'firetail',
     'firewall',
-    'firewatching',
-    'first-division',
-    'first-formed',
-    'first-hog-of-summer',
-    'first-language',
-    'first-named',
-    'fish-eye',
-    'fish-paste',
-    'fisherrow',
-    'fissuring',
-    'fitzpeter',
-    'five-line',
-    'five-person',
-    'fixed-alternative',
-    'fixed-income',
     'fixed-pitch',
-    'fixx',
-    'flaco',
-    'flag-flying',
-    'flag-pole',
-    'flame-retardant',
-    'flammarion',
-    'flangers',
-    'flash-point',
-    'flashguns',
-    'flashies',
-    'flat-bedded',
-    'flat-mate',
-    'flat-mounted',
-    'flathman',
-    'flaxperson',
     'fleabane',
-    'fleamarket',
-    'fledge',
-    'flegg',
-    'flehmen',
-    'flenley',
-    'fleurie',
-    'flexifoils',
-    'flick-knife',
-    'flick-on',
-    'flight-note',
-    'flightcased',
-    'flik',
-    'flip-up',
-    'flitch',
-    'flittering',
     'flixborough',
-    'flo-jo',
-    'floating-charge',
-    'floella',
-    'floorshow',
-    'florestan',
-    'florigo',
-    'flow-visualization',
-    'flower-arranging',
-    'flower-seller',
-    'flowerday',
-    'fluconazole',
-    'flugelhorn',
-    'flump',
-    'flunter',
-    'fluorochrome',
     'fly-ridden',
-    'fly-tying',
-    'flying-suit',
-    'fmea',
-    'fna',
-    'fnla',
-    'foam-backed',
-    'foam-blowing',
-    'foce',
-    'focking',
-    'foedera',
-    'foggia',
-    'folk-art',
-    'folk-hero',
-    'foll',
-    'folle',
     'folles',
-    'folliott',
-    'follis',
-    'fondamental',
-    'fondles',
-    'food-chain',
-    'food-finding',
-    'food-mixer',
-    'foot-hold',
-    'foot-soldier',
-    'foot-stamping',
-    'footling',
-    'footplates',
-    'footslogging',
-    'for-',
-    'forebuilding',
     'foreclosures',
-    'foregathered',
-    'foreign-trade',
-    'foremast',
-    'foresighted',
-    'forest-tundra',
-    'forg',
-    'form(s)',
-    'form-master',
-    'fornax',
-    'forney',
-    'foron',
-    'foros',
-    'forposty',
-    'forse',
-    'fortuny',
     'fossanova',
-    'foster-brother',
-    'fotheringham',
-    'foti',
-    'foto',
-    'foucauld',
-    'foundress',
-    'fountain-house',
-    'fountained',
-    'four-blade',
-    'four-cd',
-    'four-chip',
-    'four-hander',
-    'four-iron',
-    'four-person',
-    'four-valve',
     'fourstar',
-    'fourteen-hour',
-    'fourteen-record',
-    'fourteenth-',
-    'fourth-form',
-    'fox-head',
-    'foxbats',
-    'foxcore',
-    'foxholes',
-    'fozz',
-    'fpd',
-    'framjee',
-    'framsden',
-    'framus',
-    'framwell',
-    'fran&ccedil;aises',
     'francisque',
-    'franconian',
-    'frankenstein\'',
-    'frannie',
-    'frappe',
-    'frass',
-    'frat',
-    'fraternization',
-    'freckenhorst',
-    'free-entry',
-    'free-hand',
-    'free-play',
-    'free-radical',
-    'free-space',
-    'free-text',
-    'freefalling',
     'freescape',
-    'freesheet',
-    'freeware',
-    'freeze-drying',
-    'freezebranding',
-    'freezing-point',
-    'freier',
-    'freiheit',
-    'freilicher',
-    'freischutz',
-    'french-built',
-    'french-led',
-    'frenchy',
-    'freshfield',
-    'fressen',
-    'freuchie',
     'freude',
-    'freundlich',
-    'frewer',
-    'freytag',
-    'frias',
-    'fridericianum',
-    'friedlaender',
-    'friedmanite',
-    'friedrichshafen',
-    'frig',
-    'frigoscandia',
-    'frillies',
-    'friston',
-    'fritillaria',
-    'frito',
-    'frizzle',
     'froda',
-    'frolik',
-    'fromow',
-    'fronde',
-    'frontagers',
-    'frost-bite',
-    'frost-hardening',
-    'frostbitten',
-    'frosted-glass',
-    'frottage',
-    'frow',
-    'frse',
-    'fruili',
-    'fruit-cake',
-    'fruit-machine',
-    'fsid',
     'ft-ir',
-    'fuel-saving',
-    'fuit',
-    'fujisankei',
-    'fulbeck',
-    'fulica',
-    'full-circle',
-    'full-drop',
-    'full-power',
-    'full-speed',
-    'full-track',
-    'fullerene-road',
-    'fully-automatic',
-    'fully-clothed',
-    'fully-featured',
-    'fully-laden',
     'fulvio',
-    'fum&eacute',
-    'fun-run',
-    'fund-holder',
-    'funerall',
-    'funguses',
-    'furbished',
-    'furner',
-    'furpulling',
-    'furst',
-    'furtado',
-    'fusilli',
-    'fuss-free',
-    'futurecooks',
-    'fuzzbox',
-    'fuzzies',
     'fychan',
-    'g&ouml;k&ouml;va',
-    'g&uacute;zman',
-    'g-arju',
-    'g-banding',
-    'g-flix',
-    'g-i',
-    'g-meter',
-    'g-protein',
-    'gabalfa',
-    'gabba',
-    'gabbiano',
-    'gabling',
-    'gadamer',
-    'gaea',
-    'gaeta',
     'gainer',
-    'gaios',
-    'gal4-rap30',
-    'galanthus',
-    'galantine',
-    'galatasary',
-    'galba',
-    'gale-lashed',
-    'galeotti',
-    'galiano',
-    'gallego',
-    'gallicas',
-    'gallieni',
-    'gallienus',
-    'gallimany',
-    'gallivant',
     'galop',
-    'galthie',
-    'gam',
-    'gambetta',
-    'game-bird',
-    'games-room',
-    'gammagard',
-    'gang-leader',
-    'gangouo',
-    'gangwar',
-    'gapped',
-    'gapping',
-    'garburn',
-    'garden-bed',
-    'garkain',
-    'garmisch-partenkirchen',
     'garne',
-    'garner-gray',
-    'garrimpero',
-    'garrimpo',
-    'garrisonian',
-    'garrotter',
-    'garrotting',
-    'garrowby',
-    'gartnavel',
-    'gasbag',
-    'gaskells',
-    'gastarbeiter',
-    'gastehaus',
-    'gastein',
-    'gastrin-17',
-    'gastropoda',
     'gate-crashing',
-    'gatehead',
-    'gatwick-based',
-    'gauguins',
-    'gautby',
-    'gauzlin',
-    'gavoty',
-    'gawel',
-    'gay-lussac',
-    'gayler',
-    'gazza-style',
-    'gblpages',
-    'gc-ms',
-    'gdba',
-    'gead',
-    'geal-charn',
     'geddington',
-    'gedok',
-    'geelalookala',
-    'geere',
-    'geet',
-    'geez',
-    'gefarnate',
-    'geireann',
-    'gelbe',
-    'gellert',
-    'gelman',
-    'gemcor',
-    'gendle',
-    'gene\'s-eye',
-    'gene-pool',
-    'general-election',
     'general-interest',
-    'generalis',
-    'genever',
-    'genista',
-    'gennard',
-    'gennery',
-    'genny',
-    'genuflected',
-    'geochronology',
-    'geode',
-    'geographically-based',
-    'geopolitics',
-    'georghiou',
-    'georgii',
-    'georgio',
-    'geos',
     'geosphere',
-    'geotech',
-    'geotechnics',
-    'gerakan',
-    'gerasene',
-    'gerbera',
-    'german-based',
-    'german-built',
-    'german-led',
-    'germanness',
-    'germanus',
-    'gerrett',
-    'gerusalemme',
-    'ges&auml;nge',
-    'gesa',
-    'gettin',
     'geum',
-    'gex',
-    'ggf-i',
-    'ghadames',
-    'gharbi',
-    'ghats',
-    'gheep',
-    'ghiberti',
-    'ghinocerous',
-    'ghost-written',
-    'ghostbuster',
-    'giant-slaying',
-    'gibberd',
-    'gibiliru',
-    'gibraltar-based',
-    'gibs',
     'gidget',
-    'gien',
-    'giga-switch',
-    'gigacubes',
-    'gigantomachy',
-    'giger',
-    'gigots',
-    'gijon',
-    'gilbeys',
-    'gilera',
-    'gilhooley',
-    'gillean',
-    'gillocher',
-    'gillygate',
-    'gilmar',
-    'gilton',
     'gimblett',
-    'gimmel',
-    'gin-and-tonic',
-    'ginger-nut',
-    'ginner',
-    'gioconda',
-    'giolitti',
-    'giovani',
-    'giraudy',
-    'giresse',
-    'gisborough',
-    'gitanes',
-    'gittus',
-    'glaistig',
-    'glam-rock',
-    'glamorising',
     'glamorize',
-    'glamourized',
-    'glaramara',
-    'glasbey',
-    'glascott',
-    'glavkosmos',
-    'glazer',
-    'gleick',
-    'gleitze',
-    'glenafton',
-    'glencroft',
-    'glidepath',
-    'glideslope',
-    'gliffs',
-    'glissade',
-    'glissades',
     'gloats',
-    'globalview',
-    'globke',
-    'glochidia',
-    'glockner',
-    'gloomed',
-    'glop',
-    'glorney',
-    'glory-hole',
-    'glossae',
-    'glost',
-    'gloucester-based',
-    'gloving',
-    'glowlights',
-    'glp-aacr',
-    'glucosamine',
     'gly',
-    'glynwed',
-    'gmbatu',
-    'gmbhs',
-    'gmi',
-    'gmpte',
-    'gnasher',
-    'gnc',
-    'go-slow',
-    'gobble-gobble',
-    'gobshite',
-    'god-directed',
-    'god-worship',
-    'goddess-worship',
-    'goded',
-    'godetia',
     'godomar',
-    'godspell',
-    'goethals',
-    'goethestrasse',
-    'gogo',
-    'goisses',
-    'golborne',
-    'gold-dust',
-    'goldcrests',
-    'goldeneyes',
-    'goldoni',
-    'goldtop',
-    'gom',
-    'gomolzig',
-    'gomorro',
-    'gonarezhou',
     'goncalves',
-    'gonerby',
-    'gonged',
-    'goniatites',
-    'gontran',
-    'gonzo',
-    'good-faith',
-    'good-length',
-    'goodger',
-    'goodrick',
-    'googlies',
-    'gooner',
-    'goosepool',
-    'goot',
-    'gorbachev-yeltsin',
-    'gorblimey',
     'gorbrandt',
-    'goretti',
-    'gornal',
-    'gornall',
-    'goroka',
-    'gorra',
-    'gorry',
-    'gosal',
-    'gotard',
-    'gotch',
-    'goudy',
-    'gourvish',
-    'gouverneur',
-    'government-bond',
-    'gozitan',
-    'gpd',
     'gr&auml;nstr&ouml;m',
-    'gr&oacute;sz',
-    'graaf',
-    'grabrail',
-    'grade-a',
-    'grads',
-    'gradualia',
-    'graffitied',
-    'grafpoint',
-    'grain-',
-    'gramatt&eacute',
-    'gramlich',
-    'grammaticus',
-    'gramola',
-    'granma',
-    'grano',
     'grant-making',
-    'granth',
-    'grape-vine',
-    'graph-paper',
-    'graphische',
-    'grassic',
-    'grassie',
-    'grauves',
-    'grav',
-    'gravad',
-    'gravano',
-    'grave-robbing',
-    'gravestock',
-    'gravett',
-    'gravitates',
-    'gravity-feed',
     'grayshon',
-    'grayston',
-    'great-coat',
-    'great-eyed',
-    'grecque',
-    'greek-turkish',
-    'greenburn',
-    'greencare',
-    'greencloth',
-    'greenfingers',
-    'greengage',
-    'gren',
-    'gretry',
-    'grewal',
-    'grey-coloured',
-    'grey-painted',
     'greyish-blue',
-    'greywacke',
-    'gridley',
-    'gridpad',
-    'griffen',
-    'grignano',
-    'grillade',
-    'grillades',
-    'grinkle',
-    'grinley',
-    'grinols',
-    'grishin',
-    'gro-bag',
-    'groep',
-    'gronovius',
-    'groothandel',
     'grosjean',
-    'gross-out',
-    'grossing-up',
-    'grossmunster',
-    'ground-attack',
-    'ground-rent',
-    'groundcrews',
-    'group-hunting',
-    'groupnet',
-    'grouse-moor',
-    'grovewood',
-    'growed',
-    'groweth',
-    'growth-room',
-    'grs',
-    'grsc',
     'grumped',
-    'grundfos',
-    'grunewald',
-    'gryshenko',
-    'gsf',
-    'gu&eacute;rignys',
-    'gu&euml;t',
-    'guan&aacute',
-    'guangen',
-    'guaran&iacute',
-    'guard-rail',
-    'guarino',
-    'guaruja',
-    'guatama',
-    'guba',
-    'gued&eacute',
     'guerrieri',
-    'guest-list',
-    'guffbry',
-    'guga',
-    'guiacur&uacute',
-    'guiders',
-    'guiler',
-    'guillain',
-    'guillory',
-    'guinier',
-    'guipuzcoa',
-    'guitar-related',
-    'guizot',
-    'gulet',
-    'gull-wing',
-    'gullion',
     'gullying',
-    'gummidge',
-    'gumnutland',
-    'gumpert',
-    'gumpets',
-    'gun-founder',
-    'gun-point',
-    'gunbad',
-    'gundestrup',
-    'gunfighter',
-    'gunfights',
-    'gunflint',
-    'gunrunning',
-    'gunthe',
-    'gurin',
-    'gurton',
     'gurusinghe',
-    'gustason',
-    'gustavsson',
-    'gut-level',
-    'guttner',
-    'guyler',
-    'guzzles',
-    'guzzy',
-    'gwelo',
-    'gwenffrwd',
-    'gwilt',
-    'gwraggedd',
-    'gy&ouml;rgy',
-    'gy&uuml;la',
-    'gyrth',
-    'h&auml;rtel',
     'h&eacute;r&eacute;dia',
-    'h&ouml;fn',
-    'h&uuml;skers',
-    'h\'',
-    'h-',
-    'h-grade',
-    'h-shaped',
-    'h-t',
-    'h11',
-    'hab',
-    'habershon',
-    'habicht',
-    'hacksaws',
-    'hacsg',
-    'had\'',
-    'haddam',
     'haddow',
-    'hadn',
-    'hads',
-    'haemacel',
-    'hagg',
-    'haggett',
-    'haggler',
-    'haggles',
-    'hahnemannian',
-    'haiducu',
-    'haight',
-    'hailman',
-    'haint',
-    'hair\'s-breadth',
-    'hair-care',
-    'hair-covered',
     'hair-dye',
-    'hair-splitting',
-    'hair-trigger',
-    'hairbands',
-    'hairies',
-    'hajj',
-    'hajredin',
-    'haka',
-    'hakkinen',
-    'halabja',
-    'haldanus',
-    'haldingham',
-    'haleemo',
-    'halemaumau',
-    'half-a-century',
-    'half-armour',
     'half-blood',
-    'half-choked',
-    'half-distance',
-    'half-fainting',
-    'half-fill',
-    'half-heard',
-    'half-heartedness',
-    'half-inched',
-    'half-killed',
-    'half-lifted',
-    'half-made',
-    'half-nelson',
-    'half-ounce',
-    'half-power',
-    'half-read',
-    'half-rotted',
     'half-run',
-    'half-seen',
-    'half-sleeping',
-    'half-slope',
-    'half-sovereign',
-    'half-track',
-    'half-whispered',
-    'halikarnassos',
-    'halina',
-    'halkin',
-    'hallax',
-    'hallooed',
-    'halloumi',
-    'hallstatt',
-    'hally',
-    'halmi',
     'halphen',
-    'halter-neck',
-    'halterneck',
-    'halul',
-    'hamadah',
-    'hamat',
-    'hambantota',
-    'hamdon',
-    'hamdy',
-    'hammed',
-    'hammer-beam',
-    'hammer-blow',
-    'hamon',
-    'hamp',
-    'hand-bag',
-    'hand-blown',
     'hand-cut',
-    'hand-hold',
-    'hand-in-glove',
-    'hand-over-hand',
-    'hand-sewn',
-    'hand-worked',
-    'handelian',
-    'handgrips',
-    'handl',
-    'handleigh',
-    'handovers',
-    'handshape',
-    'haner',
-    'hang-on',
-    'hangaroa',
-    'hanging-shed',
     'hangliding',
-    'hanni',
-    'hansards',
-    'hansi',
-    'haow',
-    'harbron',
-    'hard-bound',
-    'hard-going',
-    'hard-hat',
-    'hard-living',
-    'hard-of-hearing',
-    'hard-porn',
-    'hard-sided',
-    'hard-tackling',
-    'hardcourt',
-    'hardstanding',
     'hardyng',
-    'harecastle',
-    'harefoot',
-    'hari-kari',
-    'harmel',
-    'harmo',
-    'harriss',
-    'harrovian',
-    'harryhausen',
-    'hartel',
-    'hartini',
-    'hartlepool-based',
-    'hartstone',
-    'hartwells',
-    'harumphed',
-    'harve',
     'hase',
-    'hasle',
-    'haslington',
-    'hasmoneans',
-    'hasting',
-    'hatha',
-    'hatley',
-    'hatshop',
-    'hattat',
-    'hattula',
-    'hauff',
-    'hauptbahnhof',
-    'hausman',
-    'have_a',
-    'haven\'',
-    'haven-based',
     'havrix',
-    'hawa',
-    'hawaiian-type',
-    'hawing',
-    'hawk-moth',
-    'hawkshaw',
-    'haxthausen',
-    'haybote',
-    'haysey',
-    'hazan',
-    'hazardous-waste',
-    'hazdata',
-    'hazel-rah',
-    'hcfc-123',
-    'hcprocess',
-    'hcspace',
     'hdls',
-    'hdn',
-    'he\'',
-    'head-band',
-    'head-banging',
-    'head-gear',
-    'head-hunter',
-    'headbanger',
-    'heade',
-    'headier',
-    'headrow',
-    'healeys',
-    'heardberht',
-    'hearnden',
-    'heart-free',
-    'heart-shape',
     'heart-whole',
-    'heartshaped',
-    'heat-flow',
-    'heat-of-the-moment',
-    'heat-stroke',
-    'heat-treated',
-    'heavily-laden',
-    'heavy-billed',
-    'heavyside',
-    'heb',
-    'hebdon',
-    'hebog',
-    'hechter',
-    'heckles',
-    'hectolitre',
-    'hedge-sparrow',
     'hedgetrimmer',
-    'hedon',
-    'hedworthfield',
-    'heeney',
-    'heiden',
-    'heiligenstadt',
-    'heilman',
-    'heimaey',
-    'heinsch',
-    'heiser',
-    'hekuran',
-    'heley',
-    'helgi',
-    'heliograph',
-    'helion',
-    'helionetics',
     'heliopsis',
-    'helium-filled',
-    'helix-turn-helix',
-    'hell\'',
-    'hell-cat',
-    'hell-raiser',
-    'hellhole',
-    'hellinck',
-    'helpin\'',
-    'helvetia',
-    'helweh',
-    'hemingways',
-    'hemsted',
-    'hen-harrier',
-    'hendren',
-    'hendrys',
     'henninger',
-    'henrie',
-    'hepburns',
-    'hepher',
-    'heppelmann',
-    'her\'',
-    'her-',
-    'herberstein',
-    'herculis',
-    'hereabout',
-    'hereditarian',
-    'heregulin',
-    'herington',
-    'heriz',
-    'hermissenda',
-    'hermite',
     'hernu',
-    'hero-worshipping',
-    'herrenchiemsee',
-    'hersant',
-    'herweg',
-    'herzlich',
-    'het-up',
-    'heteractis',
-    'heteroduplex',
-    'heteronuclear',
-    'heterotopia',
-    'hetman',
-    'heure',
-    'hexate',
-    'heydweiller',
-    'heygate',
     'hfhl',
-    'hi-hat',
-    'hi-lo',
-    'hibbett',
-    'hiccupping',
-    'hickel',
-    'hickery',
-    'hiddensee',
-    'high-band',
-    'high-bandwidth',
-    'high-conductivity',
-    'high-jump',
-    'high-key',
-    'high-lift',
-    'high-living',
-    'high-rainfall',
     'high-ratio',
-    'high-season',
-    'high-tension',
-    'highchairs',
-    'higher-end',
-    'higher-frequency',
-    'higher-than-expected',
-    'higher-yielding',
-    'highly-parallel',
-    'hikaru',
-    'hilden',
-    'hildred',
-    'hilife',
-    'hillfoot',
-    'hillgate',
-    'hillslope',
     'himid',
-    'himma',
-    'himmelstein',
-    'hindoo',
-    'hinge-bending',
-    'hippodamos',
-    'hiralal',
-    'hiriart',
-    'hirthi',
-    'his-story',
-    'historicizing',
-    'historiographer',
-    'hitcham',
-    'hitchers',
-    'hite',
-    'hitlerism',
     'hiv-2',
-    'hiwatt',
-    'hizbul',
-    'hizbullah',
-    'hjartarson',
-    'hlao',
-    'hlr',
-    'hmong',
-    'hoar-frost',
-    'hobbing',
-    'hobie',
-    'hoboken',
-    'hobor',
-    'hocevar',
-    'hocus-pocus',
-    'hoe-down',
     'hoechstetter',
-    'hoesch',
-    'hoeyre',
-    'hoffberger',
-    'hoggs',
-    'hognose',
-    'hoiked',
-    'holbride',
-    'holburn',
-    'holby',
-    'holdenby',
-    'holdens',
-    'hole-in-the-corner',
-    'holiday-making',
-    'holidayfax',
-    'holladay',
     'hollerith',
-    'hollingwood',
-    'hollinwell',
-    'hollison',
-    'hollo',
-    'hollola',
-    'hollower',
-    'hollybush',
-    'hollyhock',
-    'holty',
-    'holyfield-bowe',
-    'holzman',
-    'homans',
-    'home-brewing',
-    'home-ground',
-    'home-improvement',
     'home-killed',
-    'home-life',
-    'home-loan',
-    'home-taping',
-    'home-working',
-    'homepride',
-    'hominidae',
-    'honeymooning',
-    'honfleur',
-    'honi',
-    'hooey',
-    'hookboots',
-    'hookline',
-    'hoornik',
-    'hopers',
-    'hoppity',
     'horney',
-    'horniman',
-    'hors-texte',
-    'horsbrugh',
-    'horse-back',
-    'horse-dung',
-    'horsefair',
-    'horseheath',
-    'horsemaster',
-    'horstmeyer',
-    'horten',
-    'hospitia',
-    'hostbridge',
-    'hot-bulb',
-    'hot-foot',
-    'hot-seat',
     'hotel-room',
-    'hotfooted',
-    'hotman',
-    'hotung',
-    'houbara',
-    'houdon',
-    'houlder',
-    'house-arrest',
-    'house-moving',
-    'house-training',
-    'housekeep',
-    'housemartin',
-    'hovertravel',
-    'hoves',
-    'howlta',
-    'hozelock',
     'hpgrf',
-    'hrabanus',
-    'hree',
-    'hsuan',
-    'htrams',
-    'hubwards',
-    'huby',
-    'huck',
-    'huckerby',
-    'hucko',
-    'hudud',
-    'huemul',
-    'huffs',
-    'hufton',
-    'huggers',
-    'hukam',
     'hulton-deutsch',
-    'humanises',
-    'humbersiders',
-    'humbrecht',
-    'hummer',
-    'humped-back',
-    'hundred-foot',
-    'hundred-millionth',
-    'hunter-gathering',
-    'hurdla',
-    'husking',
-    'husnu',
-    'hv',
-    'hvannadalshn&uacute;kur',
-    'hydra-headed',
-    'hydro-power',
     'hydrography',
-    'hyksos',
-    'hymettos',
-    'hymie',
-    'hymnbook',
-    'hyoid',
-    'hyperama',
-    'hyperchannel',
-    'hypercube',
-    'hyperkalaemia',
-    'hypermetropia',
-    'hyperpolarizing',
-    'hypersparc-based',
-    'hypnotising',
-    'hypocycloid',
-    'hyrodotus',
     'i\'n',
-    'i(k)',
-    'i-beam',
-    'i.s.',
-    'i486',
-    'i860-based',
-    'iacovleff',
-    'iaps',
-    'iapt',
-    'iasos',
-    'ibidem',
-    'icam',
-    'icbp',
-    'ice-',
-    'ice-core',
-    'ice-filled',
     'ice-rink',
-    'icebreakers',
-    'iceflow',
-    'ichabod',
-    'ichaelan',
-    'ickleton',
-    'icma',
-    'iconology',
-    'icps',
-    'icsa',
-    'idamantes',
-    'idd',
-    'idealising',
-    'idemitsu',
-    'identity-card',
-    'identity-thinking',
     'idomeneus',
-    'idumaea',
-    'idv',
-    'ief',
-    'iesu',
-    'if\'n',
-    'ifceb',
-    'ifg',
-    'ifla',
-    'ihre',
-    'ihsm',
-    'ii-iv',
-    'ii-listed',
-    'iied',
-    'iii(m)',
-    'iiij',
     'il-103',
-    'ilia',
-    'ill-dressed',
-    'ill-effect',
-    'ill-fame',
-    'ill-formedness',
-    'ill-grace',
-    'ill-received',
-    'ill-treat',
-    'illa',
-    'ille',
-    'illetas',
-    'ilmor',
-    'ilmorog',
-    'ilpec',
-    'ilppilp',
     'image-maker',
-    'imco',
-    'imeca',
-    'imeche',
-    'imlac',
-    'immacolata',
-    'immaculata',
-    'immigrated',
-    'impaler',
-    'impenitent',
-    'implementer',
-    'impostures',
-    'impression-management',
-    'in-born',
-    'in-demand',
-    'in-frame',
     'in-joke',
-    'in-love',
-    'in-place',
-    'in-shore',
-    'inbal',
-    'income-based',
-    'incomings',
-    'incoterms',
-    'incrementing',
-    'incy',
-    'indemnifying',
-    'indentified',
-    'indeo',
-    'indes',
-    'indiedom',
-    'indigo-blue',
     'indistinguishability',
-    'individualize',
-    'indore',
-    'industry-sponsored',
-    'indwelt',
-    'inec',
-    'inferone',
-    'infl',
-    'inflation-adjusted',
-    'inflects',
-    'inflowing',
-    'informa',
-    'informix-se',
-    'ingall',
-    'ingegneri',
-    'inglese',
     'ingman',
-    'ingold',
-    'ingratiated',
-    'ingres-based',
-    'ingund',
-    'init',
-    'inkie',
-    'inner-area',
-    'innescourt',
-    'innocenti',
-    'inoc',
-    'inonu',
-    'insect-pollinated',
-    'insee',
-    'inseminate',
-    'inseminator',
     'insensate',
-    'inshaw',
-    'insta',
-    'instinet',
-    'intellectualist',
-    'inteplan',
-    'inter-censal',
-    'inter-communicating',
-    'inter-connectedness',
-    'inter-district',
-    'inter-faculty',
-    'inter-modal',
-    'inter-row',
-    'inter-track',
-    'inter-varsity',
-    'intercensal',
     'interconnectivity',
-    'intercontinent',
-    'intercutting',
-    'interest*',
-    'interface-based',
-    'interfaculty',
-    'interferon-',
-    'interfine',
-    'interfused',
-    'interglass',
-    'interleukin-6',
-    'interlibrary',
-    'internalism',
-    'internationally-acclaimed',
-    'internist',
-    'interpenetrates',
     'interplant',
-    'interpleader',
-    'intersex',
-    'intersleek',
-    'interspace',
-    'intertan',
-    'intertelecom',
-    'intervalence',
-    'interweaves',
-    'interwove',
-    'inteword',
-    'intra-german',
-    'intragroup',
-    'inturned',
-    'invermoriston',
-    'inverpolly',
     'inwit',
-    'iofc',
-    'ionel',
-    'ionescu',
-    'ionisers',
-    'iopi',
-    'ippl',
-    'ippo',
-    'iran-based',
-    'irani',
-    'iranian-born',
-    'irca',
-    'ireland-based',
-    'iridology',
-    'irminsul',
-    'ironclads',
     'ironworkers',
-    'irp',
-    'irs-pcr',
-    'is&egrave;re',
-    'isamaa',
-    'iscsh',
-    'isdns',
-    'ishikawa',
-    'ishmaelite',
-    'iskusstvo',
-    'islanded',
-    'islandpresents',
-    'isley',
-    'iso-elastic',
-    'iso-reflectance',
-    'isocurvature',
     'isokrates',
-    'isopachs',
-    'isotypes',
-    'ispck',
-    'ispf',
-    'issak',
-    'isserlis',
-    'issigeac',
-    'isthmia',
-    'isu',
-    'it&oacute',
-    'italicise',
-    'italicus',
-    'itcf',
-    'itsag',
-    'itsec',
     'itta',
-    'itzin',
-    'iudeu',
-    'ivam',
-    'ivc',
-    'ivct',
-    'ivl',
-    'ivs',
-    'iwamoto',
-    'iwp',
-    'iwt',
-    'iww',
-    'ixmarite',
-    'iyru',
-    'izanagi',
-    'izanami',
     'izard',
-    'izod',
-    'j&ouml;llenbeck',
-    'j-45',
-    'j-boats',
-    'j-l',
-    'jaafer',
-    'jaap',
-    'jabberwock',
-    'jacinta',
-    'jacquemart-andr&eacute',
-    'jacquin',
-    'jaff&eacute',
-    'jaguarsport',
-    'jahr',
-    'jajce',
     'jakhar',
-    'jalhousie',
-    'jallow',
-    'jamaitis',
-    'jamas',
-    'jambo',
-    'jame',
-    'jamerson',
-    'jamesian',
-    'jamir',
-    'janka',
-    'janvry',
-    'japanese-controlled',
-    'japanned',
-    'jase',
-    'jasons',
     'jatte',
-    'javad',
-    'jaw-dropping',
-    'jayabhaya',
-    'jayapura',
-    'jcm-900',
-    'jda',
-    'jeary',
-    'jedforest',
-    'jee',
-    'jeeze',
-    'jefkins',
-    'jehovakill',
-    'jelen',
-    'jelenice',
-    'jella',
     'jentsch',
-    'jeol',
-    'jer.',
-    'jermy',
-    'jetlagged',
-    'jeunehomme',
-    'jewel-encrusted',
-    'jewellery-making',
-    'jharkand',
-    'jhelisa',
-    'jibshit',
-    'jiff',
-    'jiho',
-    'jilt',
-    'jinghpaw',
-    'jink',
     'jintao',
-    'jinty',
-    'jitterbug',
-    'jnandas',
-    'job-destroying',
-    'job-holder',
-    'job-search',
-    'jobfinder',
-    'jobplan',
-    'jockeyed',
-    'jockstraps',
-    'joggling',
-    'johannine',
-    'johny',
-    'joi',
-    'joint-manager',
     'jolivet',
-    'jollied',
-    'jordaan',
-    'jordania',
-    'joss-stick',
-    'jouet',
-    'journ',
-    'journalling',
-    'joycean',
-    'joyeuse',
-    'joyrides',
-    'jubail',
-    'judaean',
-    'juddery',
-    'juif',
-    'juin',
     'juju',
-    'julep',
-    'julietta',
-    'jullunder',
-    'julyan',
-    'jumblies',
-    'jumbling',
-    'jump-start',
-    'june&ndash;september',
-    'junghanns',
-    'jungled',
-    'junk-food',
-    'junketing',
-    'junqueira',
-    'juran',
-    'jurby',
     'jurupari',
-    'jus-rol',
-    'jussi',
-    'justiciability',
-    'justitia',
-    'juvie',
-    'k&aacute;lm&aacute;n',
-    'k&eacute;rastase',
-    'k&oslash;bke',
-    'k&uuml;mmel',
-    'k-9',
-    'k-ar',
-    'k-factor',
-    'k-sb3s',
-    'k.j.',
-    'k.k.',
     'k.p.',
-    'kabbalah',
-    'kabisig',
-    'kabooter',
-    'kabye',
-    'kachrylion',
-    'kadesh',
-    'kadish',
-    'kaffa',
-    'kaffirs',
-    'kagemni',
-    'kahlfuss',
-    'kahrilas',
-    'kainate',
-    'kajiado',
-    'kakiemon',
     'kalanchoe',
-    'kalat',
-    'kalieda',
-    'kalinowski',
-    'kalkan',
-    'kall',
-    'kalli',
-    'kallibunker',
-    'kalmia',
-    'kalt',
-    'kambo',
-    'kambyses',
-    'kamekestrasse',
-    'kamtronics',
-    'kanafani',
-    'kandler',
     'kanebo',
-    'kangchenjunga',
-    'kanhai',
-    'kapitan',
-    'karakorum',
-    'kardam&iacute;li',
-    'kardooni',
-    'kare',
-    'karels',
-    'karisoke',
-    'karkadann',
-    'karlovka',
-    'karn',
-    'karnovsky',
-    'karpass',
-    'karsch',
     'karstic',
-    'karunakaran',
-    'kasprow',
-    'kastner',
-    'katakana',
-    'katarin',
-    'kathrada',
-    'katkin',
-    'kauffer',
-    'kaufmanniana',
-    'kauri',
-    'kavanaugh',
-    'kawai',
-    'kayleigh',
-    'kaysen',
-    'kaza',
     'kealey',
-    'kear',
-    'kearsey',
-    'keates',
-    'keema',
-    'keery',
-    'keidanren',
-    'keilder',
-    'keilly',
-    'kein',
-    'keineg',
-    'kellert',
-    'kelleway',
-    'kempff',
-    'kemptner',
-    'kendle',
     'kenlin',
-    'kenmure',
-    'kennaway',
-    'kennex',
-    'kenwards',
-    'keo',
-    'keppels',
-    'kermadec',
-    'kerries',
-    'kesner',
-    'kessaris',
-    'kessels',
-    'kessingland',
-    'kestel',
-    'kestos',
-    'ketchum',
     'ketos',
-    'kettleborough',
-    'kettler',
-    'key-',
-    'keyholders',
-    'keystages',
-    'keyter',
-    'khaki-clad',
-    'khalk',
-    'khama',
-    'khanna',
-    'khanty',
-    'khantys',
-    'khazakstan',
-    'khe',
-    'kherson',
     'khiyam',
-    'khnum',
-    'khordad',
-    'khouri',
-    'khoury',
-    'khu',
-    'khusam',
-    'kibswell',
-    'kick-in',
-    'kiddington',
-    'kiejman',
-    'kielthy',
-    'kieren',
-    'kigoi',
-    'kilauea',
-    'kilbourn',
     'kilduff',
-    'kilgrimol',
-    'kill\'',
-    'killhope',
-    'killow',
-    'kilmoriarty',
-    'kilnhouse',
-    'kilocalorie',
-    'kiltie',
-    'kimi',
-    'kinahan',
-    'kinawley',
-    'kind-of-coat',
-    'kindel&aacute;n',
-    'kindhearted',
-    'kindles',
     'king\'',
-    'king-hell',
-    'king-pin',
-    'kingcobra',
-    'kingcup',
-    'kingdome',
-    'kinges',
-    'kingsbere',
-    'kingsman',
-    'kingsnorth',
-    'kingsport',
-    'kinnabus',
-    'kinross-shire',
-    'kintour',
-    'kintu',
-    'kinzu',
     'kipnis',
-    'kirkibost',
-    'kirschberry',
-    'kish',
-    'kishon',
-    'kissin\'',
-    'kita',
-    'kitbags',
-    'kitchen-dresser',
-    'kitcheneering',
-    'kizito',
-    'klakkr',
-    'klausner',
-    'kleeneze',
-    'kleidon',
-    'kleinias',
     'kleinig',
-    'kley',
-    'klingsor',
-    'klipstein',
-    'kloss',
-    'klucznik',
-    'km-2',
-    'knapped',
-    'knavery',
-    'kneads',
-    'knedliky',
-    'knickerbox',
-    'knickerless',
-    'knidos',
-    'knife-blade',
-    'knife-carrying',
     'knife-fish',
-    'knife-grinder',
-    'knight-ridder',
-    'knock-about',
-    'knops',
-    'knowest',
-    'knoyle',
-    'knuller',
-    'kobolds',
-    'kodjo',
-    'koechlin',
-    'koffmann',
-    'kohanim',
-    'kohlerwald',
-    'koke',
-    'kokoomus',
     'kolja',
-    'kolowrat',
-    'kombo',
-    'komlan',
-    'kommunist',
-    'kompakt',
-    'koninck',
-    'konopkastrasse',
-    'kooks',
-    'kooy',
-    'kopf',
-    'korea-japan',
-    'korman',
-    'kornilof',
-    'koror',
-    'korsakoff',
     'koru',
-    'koshland',
-    'kotite',
-    'kotze',
-    'kovalenko',
-    'kovel',
-    'kowtowed',
-    'koy',
-    'kozi-tec',
-    'kozo',
-    'kpetigo',
-    'kramol&iacute;n',
-    'kreuz',
-    'krickstein',
-    'kriek',
-    'kriminalamt',
     'kristol',
-    'kritias',
-    'kroeber',
-    'kronk',
-    'krono',
-    'kross',
-    'kru&zcaron;i&cacute',
-    'krumpacker',
-    'krupps',
-    'kry&scaron;tof',
-    'kubri',
-    'kuenen',
-    'kuiken',
-    'kujabi',
-    'kulsrud',
-    'kulti',
     'kultura',
-    'kulu',
-    'kuma',
-    'kumaon',
-    'kundan',
-    'kunst-',
-    'kupfer',
-    'kuroko-style',
-    'kurtag',
-    'kuru',
-    'kuruma',
-    'kurunba',
-    'kuscu',
-    'kutahya',
-    'kutch',
-    'kutlu',
     'kuusinen',
-    'kwangsi',
-    'kwashiorkor',
-    'kwiatkowski',
-    'kwic',
-    'kyffhausen',
-    'kylerhea',
-    'kyshtym',
-    'l&eacute;ontieff',
-    'l&oslash;mo',
-    'l&ouml;we',
-    'l\'&eacute;criture',
-    'l\'administration',
-    'l\'image',
-    'l\'oye',
-    'l\'uomo',
     'l-tense',
-    'l.d.',
-    'l26',
-    'laand',
-    'labatt',
-    'laboratorium',
-    'labour-augmenting',
-    'labour-supporting',
-    'laboureur',
-    'labraunda',
-    'labroides',
-    'lacava',
-    'lacemaking',
-    'lache',
-    'lactalbumin',
-    'lacunar',
     'laddo',
-    'laderoute',
-    'lady-killer',
-    'ladye',
-    'laemmli',
-    'laetacara',
-    'lafarge',
-    'lagavulin',
-    'lah',
-    'lahat',
-    'lahinch',
-    'laika',
-    'lakelands',
-    'lakin',
-    'lakonia',
-    'lallement',
     'lamarcki',
-    'lambear',
-    'lambgate',
-    'lambirth',
-    'lambrianou',
-    'lameducking',
-    'lamica',
-    'lamin',
-    'lamium',
-    'lammed',
-    'lammermuir',
-    'lamp-light',
-    'lamping',
-    'lampost',
-    'lancias',
-    'land-for-peace',
     'land-related',
-    'landais',
-    'landcruiser',
-    'landfilling',
-    'landin\'',
-    'landline',
-    'landlord-tenant',
-    'landolt',
-    'landru',
-    'landsman',
-    'landsting',
-    'landstrasse',
-    'lanfranco',
-    'langevin',
-    'langinger',
-    'langle',
     'langleys',
-    'langlois',
-    'langsam',
-    'langues',
-    'lanighan',
-    'lannagh',
-    'lannaman',
-    'lansford',
-    'laoag',
-    'laodicean',
-    'lapdog',
-    'lapershoek',
-    'laphroaig',
-    'lapin',
-    'lapith',
-    'lapsley',
     'laputans',
-    'lardie',
-    'larding',
-    'large-',
-    'large-magnitude',
-    'larked',
-    'larna',
-    'larouche',
-    'laserball',
-    'laserjets',
-    'lasermaster',
-    'laservision',
-    'lasko',
-    'latchmere',
-    'late-seventeenth',
-    'late-summer',
     'late-twentieth-century',
-    'lathers',
-    'lathom',
-    'lati',
-    'latsis',
-    'latychidas',
-    'laudes',
-    'laundresses',
-    'laurin',
-    'lauterpacht',
-    'lavernock',
-    'lavity',
-    'lawfords',
-    'lawr',
-    'lawyering',
-    'laxness',
     'lay-abbot',
-    'layhe',
-    'lazzaretto',
-    'ldh',
-    'ldl-cholesterol',
-    'le&ccedil;on',
-    'lea-anna',
-    'lea-based',
-    'lead-mine',
-    'leadbelly',
-    'leaf-cutter',
-    'leafcutting',
-    'leapers',
-    'leapfrogs',
-    'leapman',
-    'leapors',
     'learnin\'',
-    'lease-back',
-    'least-cost',
-    'leather-jacketed',
-    'leatherboard',
-    'leathergoods',
-    'leats',
-    'lebanese-american',
-    'lebensordnungen',
-    'lecanuet',
-    'lecoz',
-    'ledoux',
-    'ledwith',
-    'lee-way',
-    'leechgatherer',
-    'leete',
     'leeuwenbrug',
-    'lefkas',
-    'left-hook',
-    'leg-over',
-    'leg-pull',
-    'legal-aid',
-    'legalist',
-    'legenda',
-    'legerdemain',
-    'legionaires',
-    'legitimist',
-    'lehmbruch',
-    'leiferkus',
-    'leis',
-    'leisure-based',
-    'leisureworld',
     'leithian',
-    'leixlip',
-    'leleupi',
-    'lemaire',
-    'lendal',
-    'leninakan',
-    'lentwardine',
-    'lenz',
-    'leofsige',
-    'leontodon',
-    'leotychidas',
-    'lesioned',
-    'letec',
-    'letzeburger',
-    'level-pegging',
-    'levenshulme',
     'levenson',
-    'lever-arch',
-    'levitated',
-    'levs',
-    'levu',
-    'lewenthal',
-    'leybold',
-    'leyfield',
-    'leyhausen',
-    'lgwg',
-    'lianas',
-    'liassic',
-    'lib&eacute;ral',
-    'libelle',
-    'liberazione',
-    'librairie',
     'libros',
-    'libyan-sponsored',
-    'lic',
-    'lice-ridden',
-    'licet',
-    'lieb',
-    'liebowitz',
-    'life-prolonging',
-    'life-world',
-    'lifecard',
-    'lifeforce',
-    'liffen',
-    'light(s)',
-    'light-',
-    'light-footed',
-    'light-handed',
     'light-heartedness',
-    'light-pen',
-    'light-reflecting',
-    'light-speed',
-    'light-water',
-    'lighter-weight',
-    'lightfastness',
-    'lightnin\'',
-    'lightsout',
-    'ligonier',
-    'ligue',
-    'likken',
-    'lilia',
-    'lillibet',
-    'lillistone',
-    'lime-mud',
     'lime-stone',
-    'limmat',
-    'lindrick',
-    'lindstedt',
-    'line-',
-    'lingen',
-    'linggajati',
-    'lings',
-    'linington',
-    'linklaters',
-    'linkmail',
-    'linny',
-    'linocuts',
-    'linotypes',
-    'linpac',
-    'lion-headed',
     'lionheads',
-    'lip-stick',
-    'lipatti',
-    'lipofectin',
-    'lipping',
-    'lipsalve',
-    'liquidambar',
-    'lira-dollar',
-    'lisbeg',
-    'lisberger',
-    'lisglass',
-    'litherwood',
-    'litopterns',
-    'litt&eacute;raire',
-    'liv&eacute;e',
-    'livens',
     'living-space',
-    'liviu',
-    'liwa',
-    'lke',
-    'llan',
-    'load-balancing',
-    'loadbearing',
-    'loam-based',
-    'loane',
-    'local-level',
-    'locally-produced',
-    'loches',
-    'lock-picking',
-    'lock-to-lock',
-    'lockit',
-    'lockspeiser',
     'loco-motion',
-    'loehnis',
-    'loerch',
-    'log-fire',
-    'log-rolling',
-    'logic-based',
-    'loizos',
-    'lokata',
-    'lombardi',
-    'lombardian',
-    'lomnitz',
-    'londinium',
-    'long&rehy;standing',
-    'long-jump',
-    'long-sleeve',
-    'long-stalked',
     'long-wall',
-    'longfin',
-    'longhaul',
-    'longhills',
-    'longlegs',
-    'longmire',
-    'longsword',
-    'longthorpe',
-    'longuet-higgins',
-    'longwinded',
-    'looch',
-    'loonie',
-    'lops',
-    'lorcan',
-    'lorenceau',
-    'lorenzetti',
     'lorenzian',
-    'lorikeets',
-    'lorr',
-    'lorris',
-    'lorry-park',
-    'loscoe',
-    'loss-leader',
-    'lossy',
-    'loti',
-    'lotsi',
-    'lotty',
-    'loughery',
-    'loughside',
-    'loukoum',
-    'loukoumi',
-    'louring',
     'louschart',
-    'lousewort',
-    'lovano',
-    'lovansay',
-    'love-knot',
-    'lovecraft',
-    'lovesome',
-    'loving-kindness',
-    'lovitch',
-    'lovley',
-    'low-altitude',
-    'low-growth',
-    'low-noise',
-    'low-protein',
-    'low-rate',
-    'low-start',
     'low-tide',
-    'low-use',
-    'lowdham',
-    'lower-energy',
-    'lower-fat',
-    'lower-preference',
-    'lower-price',
-    'lower-than-expected',
-    'lozi',
-    'lpc',
-    'lpw2-13',
-    'lsts',
-    'ltu',
-    'ltv',
-    'luan',
-    'luang',
     'lubans',
-    'lubanski',
-    'lubavitcher',
-    'lube',
-    'lubianka',
-    'lucarotti',
-    'lucasfilms',
-    'luciani',
-    'luckhurst',
-    'ludes',
-    'ludu',
-    'ludvigsen',
-    'luhmann',
-    'luikens',
-    'lujan',
-    'lukasiewicz',
     'lukather',
-    'lumber-room',
-    'luminesce',
-    'lumpar',
-    'lunae',
-    'lunch-table',
-    'lungern',
-    'lupu',
-    'lussac',
-    'luteinizing',
-    'luvs',
-    'luxembourgeois',
-    'luxon',
-    'luxury-car',
-    'luy',
-    'luyendyk',
     'lva',
-    'lwin',
-    'lx-80',
-    'lyalin',
-    'lycomings',
-    'lycopod',
-    'lygo',
-    'lymbery',
-    'lymn',
-    'lymon',
-    'lymph-node',
-    'lymphokines',
-    'lynches',
-    'lynskey',
-    'lynxes',
-    'lyre-bird',
     'lysaght',
-    'lyse',
-    'lysias',
-    'lysippus',
-    'lystra',
-    'm&eacute;m&eacute',
-    'm&eacute;zi&egrave;res',
-    'm&ouml;nch',
-    'm&uuml;llers',
-    'm&uuml;nchen',
-    'm-50',
-    'm-60',
-    'm-maddy',
-    'm-series',
-    'm14',
-    'm31',
     'm32',
-    'm35',
-    'm90',
-    'm92',
-    'ma&ntilde;ana',
-    'maamur',
-    'maastrich',
-    'maastrict',
-    'maberly',
-    'mabi',
-    'mabo',
-    'mac-compatible',
-    'macerated',
-    'machine-based',
-    'machine-tools',
-    'macht',
     'macmerry',
-    'macmis',
-    'macro-molecules',
-    'macrobes',
-    'mad-house',
-    'made-to-order',
-    'madin',
-    'madiun',
-    'madog',
-    'madrichim',
-    'madzimbamuto',
-    'maezinha',
-    'mafgal',
-    'mafulke',
-    'maga',
-    'magazin',
     'mageeba',
-    'magharian',
-    'maginco',
-    'magnapop',
-    'magni',
-    'magnificats',
-    'magrath',
-    'magsaysay',
-    'magureanu',
-    'mahabad',
-    'mahamane',
-    'mahat',
-    'mahoud',
-    'maiduguri',
-    'mail-shot',
-    'mailcom',
     'maimonides',
-    'maims',
-    'mainlanders',
-    'mainstreet',
-    'mairs',
-    'maisemore',
-    'maisey',
-    'majabr',
-    'majd',
-    'majeed',
-    'majorite',
-    'makebelieve',
-    'makems',
-    'makerstoun',
-    'makrong',
-    'malabsorb',
     'maldivian',
-    'maleesh',
-    'malgosia',
-    'malima',
-    'mallam',
-    'malos',
-    'malou',
-    'malpighi',
-    'maltreat',
-    'malynes',
-    'mamc',
-    'mamoru',
-    'man-carrying',
-    'man-hating',
-    'man-man',
-    'manageware',
     'manakins',
-    'manali',
-    'manan',
-    'manandafy',
-    'mandell',
-    'mandla',
-    'mandlikova',
-    'mando',
-    'mandresh',
-    'mandrika',
-    'maneb',
-    'mangel',
-    'mangen',
-    'mangnall',
-    'manichaeism',
-    'manigat',
     'manitous',
-    'mannie',
-    'manns',
-    'manque',
-    'manrique',
-    'mansoori',
-    'mantel-haenszel',
-    'mantises',
-    'mantovani',
-    'manucher',
-    'manueline',
-    'manyfold',
-    'mapanje',
-    'mapi',
-    'mapinfo',
-    'mapuche',
     'maquet',
-    'mar&eacute;chaux',
-    'maranhao',
-    'marantaceae',
-    'marchetti',
-    'marchi',
-    'marchon',
-    'marcovic',
-    'mardood',
-    'margay',
-    'marghera',
-    'margrethe',
-    'marhaba',
-    'maricone',
-    'marinara',
-    'marineland',
     'maritim',
-    'maritimo',
-    'mark-dollar',
-    'markazi',
-    'marke',
-    'market-room',
-    'markle',
-    'markman',
-    'marled',
-    'marloes',
-    'marmon',
-    'marochnik',
-    'marprelate',
-    'marshalite',
-    'marsiliana',
-    'martinets',
     'martingale',
-    'martinic',
-    'martinon',
-    'martius',
-    'maryborough',
-    'masculine-feminine',
-    'masetto',
-    'mashes',
-    'mashreq',
-    'masi',
-    'mask-face',
-    'masnun',
-    'massada',
-    'massereene',
-    'massett',
-    'massvac',
     'master-at-arms',
-    'master-mason',
-    'mastino',
-    'mastodon',
-    'mastoid',
-    'masturbates',
-    'matallana',
-    'match-ball',
-    'match-maker',
-    'matera',
-    'materialistically',
-    'mathematised',
-    'mathiesen',
-    'mathurin',
-    'matlin',
-    'matlodge',
     'matricaria',
-    'matricide',
-    'matrilineage',
-    'matrimonio',
-    'matris',
-    'matsui',
-    'mattan',
-    'mattar',
-    'matteotti',
-    'matthieu',
-    'mattson',
-    'matzel',
-    'maudslay',
-    'maugh',
-    'maupin',
-    'mauri',
     'maurie',
-    'mawe',
-    'maxe',
-    'maxen',
-    'maxfield',
-    'maxis',
-    'maxmin',
-    'maxus',
-    'mayella',
-    'mayola',
-    'mayorga',
-    'mazaruni',
-    'mazmanian',
-    'mbayo',
-    'mcalpines',
-    'mcdonald\'s',
     'mcdougalls',
-    'mcphersons',
-    'mdel',
-    'meadow-sweet',
-    'mean-',
-    'meaning\'',
-    'meat-market',
-    'meat-safe',
-    'mebendazole',
-    'mechanicks',
-    'mechanism-based',
-    'mecu',
-    'mecum',
-    'medbourne',
-    'medcalf',
-    'mediastar',
     'medicalise',
-    'medicalized',
-    'mediterran&eacute;e',
-    'medium-speed',
-    'medius',
-    'meerkat',
-    'megabuck',
-    'megagames',
-    'megalosaurus',
-    'mehetabel',
-    'meidner',
-    'meijer',
-    'meillassoux',
-    'meine',
-    'melachusetuck',
-    'melanchthon',
     'melanochromis',
-    'melayu',
-    'melbourn',
-    'melchiori',
-    'meleagris',
-    'melendez',
-    'melms',
-    'melnick',
-    'member-of-parliament',
-    'memolog',
-    'memon',
-    'memory-resident',
-    'memsahib',
-    'mendham',
-    'menges',
-    'menlove',
     'menna',
-    'mentasti',
-    'menuires',
-    'mephistophelean',
-    'mercery',
-    'merckx',
-    'mercy-killing',
-    'meregill',
-    'merehead',
-    'meridith',
-    'meridor',
-    'merill',
-    'merpati',
-    'merseystyle',
-    'mesdag',
-    'mesolect',
     'mesomorph',
-    'message-form',
-    'messenger-rna',
-    'messkit',
-    'meta-data',
-    'meta-deduction',
-    'metabolizing',
-    'metal-based',
-    'metal-work',
-    'metalcraft',
-    'metalhead',
-    'metallgesellschaft',
-    'metel',
-    'meter-reading',
-    'methandianone',
-    'methedrine',
     'methylanthranilate-trained',
-    'methysergide',
-    'meton',
-    'metro-x',
-    'metrohm',
-    'meudon',
-    'mexicano',
-    'mexicanos',
-    'mg.',
-    'mgi',
-    'mhill',
-    'mic.',
-    'michalek',
-    'michies',
-    'mickeys',
-    'micklegate',
     'micklem',
-    'micklewright',
-    'micom',
-    'microbacterium',
-    'microbeads',
-    'microcrystalline',
-    'microdrive',
-    'microelectronics-based',
-    'microhabitats',
-    'microlite',
-    'micropal',
-    'microphotography',
-    'microplate',
-    'micropropagation',
-    'microsleeps',
-    'microsparcs',
     'microtechnology',
-    'microviewdata',
-    'mid-1840s',
-    'mid-18th-century',
-    'mid-1975',
-    'mid-1981',
-    'mid-1985',
-    'mid-19th-century',
-    'mid-blue',
-    'mid-green',
-    'mid-ocean-ridge',
-    'mid-oxon',
-    'mid-seventeenth-century',
-    'mid-sole',
-    'mid-tour',
-    'mid-twentieth-century',
     'midhat',
-    'midian',
-    'midstage',
-    'miemie',
-    'mig-15',
-    'miha',
-    'mihama',
-    'mijas',
-    'miko',
-    'mikon',
-    'mikuni',
-    'milenci',
-    'milepost',
-    'milican',
-    'milice',
-    'militsa',
     'milk-can',
-    'milk-float',
-    'milko',
-    'mill-school',
-    'millhouse',
-    'milli-q',
-    'milliard',
-    'milligans',
-    'milosu',
-    'milstein',
-    'mimeographed',
-    'mimulus',
-    'minar',
-    'minashi',
-    'mindboggling',
-    'minde',
     'mine-shaft',
-    'minera',
-    'mini-break',
-    'mini-summit',
-    'mini-survey',
-    'ministep',
-    'minister-resident',
-    'minivan',
-    'minnehoma',
-    'minqarah',
-    'minstrelsy',
-    'minusinsk',
-    'minute-taking',
-    'minyan',
-    'miracula',
-    'miramar',
     'mireh',
-    'mis-recognised',
-    'mis-specified',
-    'mis-spelling',
-    'mis-timing',
-    'misbah',
-    'miscanthus',
-    'mischief-maker',
-    'misfiled',
-    'mishtake',
-    'misjudges',
-    'miska',
-    'mislabelling',
-    'mislaying',
-    'mispriced',
-    'misquotes',
     'misratah',
-    'misreported',
-    'missolonghi',
-    'misson',
-    'misspell',
-    'misspells',
-    'mistuning',
-    'mitsi',
-    'mitson',
-    'mixing-bowl',
-    'mixtard',
-    'mixte',
-    'miyamoto',
-    'mkiv',
-    'mks',
-    'mladenovic',
     'mlangeni',
-    'mld',
-    'mma',
-    'mmmmmmm',
-    'mmpi',
-    'mnam',
-    'moac',
-    'mob-handed',
-    'moberley',
-    'mobile-phone',
-    'mod&egrave;les',
-    'modelgen',
-    'moder',
-    'modern-sounding',
-    'modiglianis',
-    'module&mdash;access',
     'modulo',
-    'mohmand',
-    'moidart',
-    'mois&eacute;s',
-    'moki',
-    'mole-woman',
-    'molen',
-    'molino',
-    'molisa',
-    'molle',
-    'molony',
-    'momcilo',
-    'monar',
-    'moncreiff',
-    'moncreiffe',
-    'mondavi',
     'monetised',
-    'money-',
-    'money-no-object',
-    'moneybox',
-    'moneymaking',
-    'moneysavers',
-    'moneywise',
-    'monkey-boy',
-    'monnow',
-    'monos',
-    'montagnard',
-    'montalto',
-    'montanamar',
-    'montanist',
-    'montanus',
-    'montb&eacute;liard',
     'month-to-month',
-    'monthu',
-    'montjoie',
-    'montmorillonite',
-    'monumenta',
-    'moodys',
-    'moog',
-    'mool',
-    'mooncult',
-    'moone',
-    'moonrakers',
-    'moorsfield',
-    'moortsel',
-    'mooting',
-    'moravcsik',
-    'moraz&aacute;n',
     'morbidelli',
-    'morcambe',
-    'moresco',
-    'morire',
-    'morlaas',
-    'morndun',
-    'morne',
-    'morningstar',
-    'morphet',
-    'morphosis',
-    'morrant',
-    'morrocco',
-    'mors',
-    'mortgage-interest',
-    'morty',
-    'morven',
     'mosadeq',
-    'moscavisi',
-    'mosh',
-    'moshing',
-    'mosspark',
-    'most-watched',
-    'mother-church',
-    'mother-fucker',
-    'mother-of-five',
-    'motherf&mdash;er',
-    'motilin',
-    'motor-cruiser',
-    'motorlux',
-    'mottle',
-    'motyer',
-    'motzfeldt',
     'mouche',
-    'mouhamedou',
-    'moulaye',
-    'mouldered',
-    'mouldwarp',
-    'mouncey',
-    'mountebanks',
-    'mounter',
-    'mountfort',
-    'mousquetaires',
-    'moussorgsky',
-    'moustachio',
-    'mout',
-    'mouthbrooding',
-    'mov',
-    'move-on',
     'movie-house',
-    'moving-iron',
-    'mowrer',
-    'moxley',
-    'moyard',
-    'moyo',
-    'mozer',
-    'mpi',
-    'mpx-32',
-    'mta',
-    'muan',
-    'muawiyah',
-    'muc',
-    'much&rehy;needed',
-    'much-debated',
-    'much-desired',
     'much-lamented',
-    'muck-spreading',
-    'muckno',
-    'mucopolysaccharide',
-    'mud-covered',
-    'mud-filled',
-    'mud-wrestling',
-    'muda',
-    'mudaliyars',
-    'muddlers',
-    'mudlarks',
-    'mudskippers',
-    'mudslides',
-    'muelle',
-    'muerta',
-    'muf',
     'mufflers',
-    'mufundishi',
-    'mug-shot',
-    'muggs',
-    'mugshot',
-    'muise',
-    'mujahadeen',
-    'mujahid',
-    'muji',
-    'mujuthaba',
-    'mukarovsky',
-    'muleteer',
-    'mulliners',
-    'mulraney',
-    'multi-armed',
-    'multi-disc',
     'multi-mineral',
-    'multi-sport',
-    'multi-system',
-    'multi-tracked',
-    'multi-unionism',
-    'multi-windowing',
-    'multibuy',
-    'multifibre',
-    'multifold',
-    'multigen',
-    'multilateralist',
-    'multiparameter',
-    'multiple-copy',
-    'multiple-warhead',
-    'multiple-word',
-    'multiracialism',
     'multistage',
-    'multisubunit',
-    'multisystem',
-    'multitrack',
-    'mulu',
-    'mum-of-two',
-    'murch',
-    'murdstone',
-    'murl',
-    'muschel',
-    'muscle-wasting',
-    'musclebound',
-    'muscleman',
-    'muscosa',
-    'musculus',
-    'mushed',
     'mushika',
-    'musicales',
-    'musichip',
-    'musici',
-    'musil',
-    'muslim-controlled',
-    'musselwhite',
-    'mussenden',
-    'muszertechnika',
-    'mutation-accumulation',
-    'mutationes',
-    'mutht',
-    'mutiara',
-    'mutton-chop',
-    'muzaffar',
-    'muzaffarabad',
     'muze',
-    'mw(b)',
-    'mx-3',
-    'mxe',
-    'mxr',
-    'myddlewood',
-    'myhrvold',
-    'mynours',
-    'myopotamus',
-    'myosotis',
-    'myrie',
-    'myrobalan',
-    'myrtles',
-    'mytholmroyd',
-    'myxocyprinus',
-    'n&aacute;jera',
     'n&auml;geli',
-    'n&eacute;gociants',
-    'n\'dour',
-    'n\'roses',
-    'n-nitroso',
-    'n-type',
-    'n.g.',
-    'n100',
-    'n17',
-    'n19',
-    'n8',
-    'na-dene',
-    'naaa',
-    'nabc',
-    'naburn',
-    'nacion',
     'nadjita',
-    'naea',
-    'naf',
-    'naffed',
-    'nagacoils',
-    'nagash',
-    'nahdatul',
-    'naht',
-    'najah',
-    'nalder',
-    'namangan',
-    'nambiar',
-    'name-tape',
-    'nanosecond',
-    'nanotechnology',
-    'nanus',
     'napoletana',
-    'nappa',
-    'napper',
-    'naqqar',
-    'narc&iacute;s',
-    'narcisse',
-    'narcissist',
-    'narendra',
-    'narkomnats',
-    'narozhilenko',
-    'narrativity',
-    'narses',
-    'nasal-directed',
-    'nasserite',
-    'nasution',
-    'nately',
     'nation\'',
-    'nation-',
-    'nationally-known',
-    'nationally-recognized',
-    'natpower',
-    'natros',
-    'nattered',
-    'naum',
-    'navar',
-    'navareno',
-    'navigates',
-    'navjot',
-    'ncet',
-    'ncnb',
-    'neaps',
-    'near&rehy;certainty',
     'near-extinction',
-    'neboz&iacute;zek',
-    'necrophiliac',
-    'neeme',
-    'neidhart',
-    'neith',
-    'nemausus',
-    'neo-',
-    'neo-fordist',
-    'neo-imperialist',
-    'nereid',
-    'nest-site',
-    'netherbow',
-    'nethercotts',
-    'netherlander',
-    'neudesk',
     'neuk',
-    'neven',
-    'nevitt',
-    'newcut',
-    'newey',
-    'newly-signed',
-    'newpapers',
-    'news-theatre',
-    'newsgathering',
-    'newshound',
-    'newslines',
-    'newspaper-reading',
-    'ngola',
-    'nhao',
-    'nhic',
-    'niapa',
     'niblet',
-    'nicarag&uuml;ense',
-    'nicols',
-    'night-nurse',
-    'night-owl',
-    'night-vision',
-    'night-watch',
-    'nightbird',
-    'nightbreed',
-    'nikolaikirche',
-    'nilo',
-    'nine-under-par',
-    'ninez',
-    'ninon',
-    'niobe',
-    'nissy',
     'no-account',
-    'no-claim',
-    'no-of-weeks',
-    'no-sex',
-    'no-sugar',
-    'no-through-road',
-    'nodform',
-    'noires',
-    'nomex',
-    'nomina',
-    'nominator',
-    'non-aryan',
-    'non-cohabitation',
-    'non-comprehension',
-    'non-conservation',
-    'non-contradiction',
     'non-fat',
-    'non-function',
-    'non-identity',
-    'non-impact',
-    'non-jew',
-    'non-justiciability',
-    'non-lawyer',
-    'non-male',
-    'non-man',
-    'non-mining',
-    'non-money',
-    'non-oracle',
-    'non-owner',
-    'non-proprietary',
-    'non-reading',
-    'non-repetition',
     'non-replacement',
-    'non-skid',
-    'non-theme',
-    'non-transposing',
-    'non-unionist',
-    'nonconducting',
-    'nondestructive',
-    'nonsmoking',
-    'nonviral',
-    'noraday',
-    'nordisk',
-    'norm\'',
-    'north-north-west',
-    'norwich-based',
-    'nose-dive',
-    'noss',
     'nostri',
-    'not&mdash',
-    'not\'',
-    'not-life',
-    'notams',
-    'nothing\'',
-    'novalis',
-    'novenco',
-    'novorossiisk',
-    'nowacki',
-    'npy',
-    'nrdc',
-    'nrpo',
-    'nscdc',
-    'nsengiyaremye',
-    'nsv',
     'nucleate',
-    'nugroho',
-    'nui',
-    'nurofen',
-    'nut-tree',
-    'nutricia',
-    'nx',
-    'nyanga',
-    'nycomed',
-    'nyctea',
-    'nzsa',
-    'o\'shanter',
-    'oakdene',
-    'objectmaster',
-    'occulobe',
-    'ocp',
     'octamer-taatga',
-    'octoberfest',
-    'odio',
-    'odulf',
-    'oemed',
-    'offed',
-    'officered',
-    'officio',
-    'ofi',
-    'oggetti',
-    'oglala',
-    'ogwr',
-    'ohly',
-    'ohmachi',
-    'ohps',
-    'oil-burning',
     'oil-exporting',
-    'oil-refining',
-    'oil-seed',
-    'oil-spill',
-    'ok.',
-    'okahata',
-    'oldest-established',
-    'oldy-worldy',
-    'ole-christian',
-    'olive-drab',
-    'olivi',
-    'olliver',
-    'omphalos',
-    'one-car',
-    'one-member',
-    'one-place',
     'one-player',
-    'one-street',
-    'onesimos',
-    'onlooking',
-    'ont\'',
-    'oodbms',
-    'oohing',
-    'op-art',
-    'opcas',
-    'open-learning',
-    'openminded',
-    'opentec',
-    'opining',
-    'opinion\'',
-    'optica',
-    'optimi',
     'option-pricing',
-    'opto',
-    'orderit',
-    'oriental-style',
-    'oriente',
-    'ork',
-    'orks',
-    'orowan',
-    'orr-ewing',
-    'osart',
-    'osg',
-    'oshere',
-    'osl',
-    'osmanczyk',
-    'ossia',
-    'ostrander',
     'osuna',
-    'ottaway',
-    'oughton',
-    'ouseley',
-    'out-gun',
-    'out-of-body',
-    'out-to-in',
-    'out-weighed',
-    'outclass',
-    'outflowing',
-    'outreaching',
-    'outselling',
-    'outwash',
-    'outwood',
-    'over-breeding',
-    'over-budget',
     'over-exaggerated',
-    'over-grown',
-    'over-identify',
-    'over-indulged',
-    'over-loaded',
-    'over-made-up',
-    'over-processed',
-    'over-reach',
-    'over-stocking',
-    'over-stretching',
-    'overbuilding',
-    'overdrawing',
-    'overdress',
-    'overexpress',
-    'overflown',
-    'overlearned',
     'overproduced',
-    'overprotect',
-    'oversleeping',
-    'overspilling',
-    'overspread',
-    'overstimulated',
-    'overstrain',
-    'overstraining',
-    'overtop',
-    'ovex',
-    'owings',
-    'ox-bow',
-    'oxborough',
-    'oxenholme',
-    'oxonienses',
-    'oxrad',
     'ozick',
-    'ozric',
-    'p64',
-    'p72',
-    'p95',
-    'pachysandra',
-    'pacione',
-    'package-deal',
-    'packin\'',
-    'padovani',
-    'pago',
-    'paint-effect',
-    'paiute',
-    'pakeha',
-    'pale-looking',
-    'palestinian-israeli',
     'palfium',
-    'palladius',
-    'palombes',
-    'palsied',
-    'paludrine',
-    'pan-nationalist',
-    'panada',
-    'panamarenko',
-    'panamsat',
-    'panavia',
-    'pancaked',
-    'pancreases',
-    'pankrates',
-    'panslavist',
-    'pantominteatret',
-    'paper-backed',
     'papoose',
-    'papp',
-    'pappus',
-    'para-hyponymy',
-    'parametrised',
-    'parasene',
-    'pareil',
-    'parented',
-    'parisina',
-    'parkhouse',
-    'parnaby',
-    'paroled',
-    'parsonages',
-    'part-song',
-    'participant-observer',
-    'partit',
     'pary',
-    'paschero',
-    'pashas',
-    'pat-a-cake',
-    'patch-up',
-    'patissier',
-    'patri',
-    'patronages',
-    'pattern-note',
-    'patthana',
-    'paufer',
-    'pavic',
-    'paw-paw',
-    'pawnbroking',
-    'paxmans',
-    'paxo',
     'pbaa',
-    'pc-12',
-    'pds-3',
-    'peak-to-peak',
-    'pearch',
-    'peary',
-    'peat-covered',
-    'peche',
-    'pediatrics',
-    'pee-wit',
-    'peeks',
-    'peffer',
-    'peg-board',
-    'peisistratid',
-    'pelves',
-    'pelvic-floor',
     'penalithe',
-    'penas',
-    'pend',
-    'penicillamine',
-    'penrhys',
-    'penshaw',
-    'penske',
-    'pentagrams',
-    'penventon',
-    'peplow',
-    'pepper-pot',
-    'pepperami',
-    'per_diem',
-    'perfusing',
-    'pergamene',
-    'perret',
     'perreyve',
-    'pers&eacute;phone',
-    'petrakis',
-    'petrucci',
-    'petty-bourgeoisie',
-    'peugeot-citroen',
-    'phaedra',
-    'phelpses',
-    'phenol-formaldehyde',
-    'philadelphian',
-    'philishave',
-    'philometor',
-    'phoenixa',
-    'phormium',
-    'photo-essay',
-    'photo-fit',
     'photo-processing',
-    'photocards',
-    'phototype',
-    'physical-care',
-    'pi&mdash;submit&mdash;a&mdash;package',
-    'picao',
-    'piccard',
-    'picta',
-    'picti',
-    'picture-frame',
-    'piggy-in-the-middle',
-    'piggybacked',
-    'pignon',
-    'pij',
-    'piking',
-    'pilat',
     'pilfer',
-    'pilsdon',
-    'pimen',
-    'pin-',
-    'pin-money',
-    'pin-tuck',
-    'pinchin\'',
-    'pinnaces',
-    'piobaireachd',
-    'piqr',
-    'pischel',
-    'pitztal',
-    'placide',
-    'plagiarists',
-    'planarian',
-    'planemaking',
     'plant-breeding',
-    'platte',
-    'plattendolomit',
-    'play-act',
-    'play-actor',
-    'play-time',
-    'play-world',
-    'playnes',
-    'playsafe',
-    'playwrite',
-    'plexicushion',
-    'plighted',
-    'plonks',
-    'plooms',
-    'pluckers',
-    'plunked',
     'plunket',
-    'pluperfect',
-    'plysu',
-    'pmi',
-    'po&eacute;tique',
-    'pochala',
-    'pochin',
-    'pogosyan',
-    'pohrt',
-    'poires',
-    'poirier',
-    'polacolor',
-    'pole-vault',
-    'polenier',
-    'police-station',
-    'policy-',
     'polising',
-    'polizei',
-    'pollexton',
-    'polley',
-    'pollitts',
-    'poltroon',
-    'polychromed',
-    'polychromy',
-    'polycye',
-    'polymer-polymer',
-    'polyzalus',
-    'pomaded',
-    'pomanders',
-    'pombe',
-    'pommiers',
-    'pondick',
     'pongs',
-    'pongy',
-    'pontneddfechan',
-    'pooh-pooh',
-    'pool-side',
-    'popa',
-    'popek',
-    'popp',
-    'popsy',
-    'portaloo',
-    'portmadoc',
-    'portoferraio',
-    'poseuses',
-    'posix-compliance',
-    'post-1800',
-    'post-1868',
     'post-1939',
-    'post-banding',
-    'post-hoc',
-    'post-second-world-war',
-    'post-testing',
-    'postdated',
-    'postle',
-    'pot-man',
-    'potterspury',
-    'pottery-making',
-    'pouty',
-    'powell&mdash;pressburger',
-    'power-dive',
-    'power-saving',
-    'powermaster',
-    'pozzolana',
     'ppound',
-    'pr&eacute;paratoires',
-    'prainha',
-    'prasutagus',
-    'pratique',
-    'pratts',
-    'pre-1800',
-    'pre-booking',
-    'pre-conditioned',
-    'pre-cubist',
-    'pre-event',
-    'pre-existence',
-    'pre-ignition',
-    'pre-investment',
-    'pre-revolution',
-    'prebooked',
     'preceeded',
-    'preconfigured',
-    'predator-prey',
-    'predecease',
-    'predetermining',
-    'pregl',
-    'preheating',
-    'preiss',
-    'prejean',
-    'prelim',
-    'premissed',
-    'prentisse',
-    'press-cutting',
-    'pressmark',
-    'presstream',
-    'prestressed',
     'preval',
-    'pribnow',
-    'prie',
-    'priested',
-    'primatologist',
-    'prince-bishop',
-    'prior-year',
-    'prizing',
-    'proa',
-    'problem\'',
-    'proculture',
-    'product-line',
-    'production-based',
-    'professional-style',
-    'professore',
-    'profiler',
     'profit-loss',
-    'proletariats',
-    'property-led',
-    'propp',
-    'protec',
-    'provis',
-    'pseudo-individual',
-    'pseudo-penis',
-    'pseudopods',
-    'psi2-dcneo',
-    'psi2-nipenv5-derived',
-    'psycho-analytic',
-    'psychoanalysed',
-    'puckle',
-    'pudding-basin',
-    'pudim',
     'pujols',
-    'pulsates',
-    'pulverize',
-    'punan',
-    'pung',
-    'pupil-pupil',
-    'pureed',
-    'purfling',
-    'purpled',
-    'pusd',
-    'pussy-footing',
-    'put-on',
-    'puttalam',
-    'pyrgos',
-    'pyridinoline',
-    'pzpr',
     'qibla',
-    'qrf',
-    'qsy',
-    'qu\'est-ce',
-    'quad-processor',
-    'qualifieds',
-    'quarter-light',
-    'quarterpounder',
-    'quasi-',
-    'quene',
-    'question-answering',
-    'questore',
-    'questors',
-    'quierzy',
-    'quinnen',
-    'quinto',
     'quiraing',
-    'quirinal',
-    'quirrinelle',
-    'r&egrave;gles',
-    'r&uuml;cker',
-    'r74(1&ndash;136)',
-    'rabbinate',
-    'rabbuh',
-    'racah',
-    'raczynski',
-    'raffaelli',
-    'rafik',
-    'raggle-taggle',
-    'ragnar&ouml;k',
-    'rain-making',
-    'rajputs',
     'raked-back',
-    'rakotonirina',
-    'ralt',
-    'rambos',
-    'rami',
-    'ramie',
-    'rammy',
-    'ramone',
-    'ramrods',
-    'randomise',
-    'rank-order',
-    'ranken',
-    'rantes',
-    'rape-seed',
-    'rast',
-    'ratti',
     'ravenstone',
-    'raxaul',
-    'raychem',
-    'rayward',
-    're-advertised',
-    're-assured',
-    're-assuring',
-    're-checking',
-    're-connected',
-    're-derived',
-    're-embarked',
-    're-emitted',
-    're-experienced',
-    're-fashioning',
-    're-finance',
-    're-forms',
     're-indexed',
-    're-lining',
-    're-loaded',
-    're-mapping',
-    're-organized',
-    're-painted',
-    're-planting',
-    're-print',
-    're-purchase',
-    're-routeing',
-    're-shaped',
-    're-shoot',
-    're-vamping',
-    'read&mdash;from&mdash;package',
-    'real\'',
-    'realeat',
     'reality-testing',
-    'rear-wheel-drive',
-    'reattached',
-    'rebadged',
-    'rebating',
-    'rebirthers',
-    'rebreathing',
-    'recession-related',
-    'reciprocates',
-    'reck',
-    'recurve',
-    'recutting',
-    'red-',
-    'red-ochre',
-    'red-tile',
-    'redeposit',
     'redfin',
-    'rediscounting',
-    'redissolved',
-    'redmanes',
-    'redpointed',
-    'redway',
-    'reedmace',
-    'refixed',
-    'reflected-sound-of-underground-spirits',
-    'refurnishing',
-    'refus&eacute;s',
-    'regathered',
-    'regnier',
-    'reh',
-    'rehanging',
-    'rehashes',
     'rehashing',
-    'reisch',
-    'reisen',
-    'reitman',
-    'reknowned',
-    'relativized',
-    'relativizing',
-    'relevent',
-    'relief-sculpture',
-    'remakes',
-    'remanufactured',
-    'rendezvoused',
-    'rendus',
-    'rensis',
-    'repack',
-    'repetto',
     'repointed',
-    'repost',
-    'reprieves',
-    'reprobates',
-    'requesters',
-    'research-led',
-    'residentials',
-    'respecified',
-    'responsories',
-    'restauranteurs',
-    'restor',
-    'resubmitting',
-    'rethread',
-    'revering',
-    'revolution\'',
-    'rexx',
     'rgit',
-    'rheinpfalz',
-    'rib-sticking',
-    'ribonucleotide',
-    'riboprobes',
-    'ribotyping',
-    'ribulose',
-    'ricked',
-    'ricochetted',
-    'ridder',
-    'riddy',
-    'ridi',
-    'riesenhuber',
-    'riffing',
-    'riffles',
-    'right-hook',
     'riigikogu',
-    'riling',
-    'rilly',
-    'rinascente',
-    'rinascimento',
-    'ringfenced',
-    'ringstead',
-    'rinky-dink',
-    'ritualist',
-    'rivulare',
-    'rly',
-    'rna-replicase',
-    'road-based',
-    'road-making',
-    'roath',
-    'rock-climb',
     'rocon',
-    'roddam',
-    'roderick-dhu',
-    'rohrer',
-    'roissy',
-    'rollin\'',
-    'romanced',
-    'romano-celtic',
-    'rommus',
-    'roodepoort',
-    'roof-tree',
-    'rooksmoor',
-    'rookwood',
-    'roomsets',
-    'rootle',
-    'roquette',
     'rorer',
-    'rose-bud',
-    'rosehip',
-    'rosicrucian',
-    'rotel',
-    'rotliegend',
-    'roubiliac',
-    'rough-cast',
-    'round-neck',
-    'rousou',
-    'routeburn',
-    'routs',
-    'rowned',
-    'rowten',
-    'roxette',
-    'rozhdestwjenski',
     'rubble-strewn',
-    'ruble',
-    'rud',
-    'ruddick',
-    'ruficollis',
-    'ruine',
-    'rumbler',
-    'rumor',
-    'run-',
-    'run-scoring',
-    'rupel',
-    'ruricius',
-    'rusalka',
-    'rusinga',
-    'russian-made',
-    'ruthy',
     'ruweisat',
-    's&ndash;xl',
-    's\'alright',
-    's(k)',
-    'saami',
-    'sabc',
-    'sabic',
-    'sablon',
-    'sacr&eacute',
-    'safenwil',
-    'saffery',
-    'safire',
-    'saida',
-    'saig&oacute',
-    'saiga',
-    'salien',
     'salif',
-    'saligo',
-    'sallay',
-    'salmonberries',
-    'salving',
-    'samaraweera',
-    'samosata',
-    'samsara',
-    'samstag',
-    'sand-spit',
-    'sandblasting',
-    'sandling',
-    'sangue',
-    'sanouko',
-    'sant\'angelo',
-    'santen',
     'santomaso',
-    'santoni',
-    'santrock',
-    'saphir',
-    'sapienza',
-    'sapphics',
-    'saprolegnia',
-    'sarmiento',
-    'sarnia',
-    'sarong-style',
-    'sartini',
-    'sasine',
-    'sassi',
-    'sasso',
-    'satyagrahi',
-    'satyricon',
     'sauchie',
-    'sausage-making',
-    'sausagemeat',
-    'sauteed',
-    'sawbills',
-    'sawflies',
-    'saxa',
-    'sba',
-    'sbarro',
-    'sbsa',
-    'scagliose',
-    'scandalmongers',
-    'scaredy',
-    'scarified',
-    'schaeffer',
-    'schaff',
     'schl&ouml;ndorff',
-    'schober',
-    'scientologists',
-    'scir&eacute',
-    'scirocco',
-    'scolar',
-    'scorpii',
-    'scotchman',
-    'scotscraig',
-    'scrabo',
-    'scrap-iron',
-    'screamin\'',
-    'screw-in',
-    'scrub-covered',
-    'sculpitecture',
-    'scutage',
     'scuttler',
-    'sd-scicon',
-    'sdu',
-    'sea-',
-    'sea-dog',
-    'sea-shell',
-    'sea-story',
-    'seadog',
-    'sealift',
-    'second-by-second',
-    'second-leg',
-    'second-team',
-    'sedan-chair',
-    'sedating',
-    'seekie',
-    'sehr',
     'seidlitz',
-    'seigniory',
-    'sejnowski',
-    'self-abandonment',
-    'self-action',
-    'self-betrayal',
-    'self-certainty',
-    'self-completion',
-    'self-deliverance',
-    'self-dislike',
-    'self-dramatising',
-    'self-enrichment',
-    'self-learning',
-    'self-organising',
-    'self-published',
-    'self-replicate',
     'self-representation',
-    'self-rotation',
-    'self-seed',
-    'self-support',
-    'self-teaching',
-    'self-training',
-    'sellin',
-    'selway',
-    'semble',
-    'semi-quavers',
-    'semi-recessed',
-    'semi-socialist',
-    'semino',
-    'semipermanent',
-    'semiramis',
-    'septem',
     'serbelloni',
-    'sercial',
-    'serein',
-    'serialise',
-    'series-voltage',
-    'serious-faced',
-    'serna',
-    'servant-girl',
-    'service\'',
-    'serving-girl',
-    'setty',
-    'seurel',
-    'sex-education',
-    'sexualis',
-    'sexualised',
-    'sfax',
     'sfeu',
-    'shabab',
-    'shabbos',
-    'shake-down',
-    'shakeup',
-    'shakti',
-    'shallow-minded',
-    'shamsul',
-    'shankarrao',
-    'sharlott',
-    'shattock',
-    'shaz',
-    'shebeli',
-    'shedid',
-    'shef',
-    'sheilagh',
     'shelden',
-    'sheldons',
-    'shelf-grips',
-    'shellshocked',
-    'sheol',
-    'shepher',
-    'shey',
-    'shhhh',
-    'shiatsu-do',
-    'shillelagh',
-    'shimizu',
-    'ship-based',
-    'shiptonthorpe',
-    'shipways',
-    'shirehorses',
-    'shirt-waister',
     'shoba',
-    'shoctector',
-    'shoed',
-    'shoehorned',
-    'shoon',
-    'shop-keeper',
-    'shop-talk',
-    'shope',
-    'shopgirls',
-    'shorncliffe',
-    'shortterm',
-    'shotting',
-    'show-case',
-    'showerings',
-    'shurdington',
-    'shure',
     'shurmur',
-    'shuss',
-    'shut-in',
-    'shutlingsloe',
-    'sia',
-    'siann',
-    'sibele',
-    'sibirica',
-    'sibylline',
-    'siciliana',
-    'sick-room',
-    'sickener',
-    'side-pond',
-    'sideshoots',
-    'sigint',
-    'signes',
     'signorelli',
-    'sila',
-    'silaging',
-    'silver-',
-    'silver-green',
-    'silverdome',
-    'simbase',
-    'sinaloa',
-    'sine-wave',
-    'single-sheet',
-    'single-shot',
-    'single-stage',
-    'single-warhead',
-    'singsongs',
-    'sipa',
-    'sironi',
     'sitreps',
-    'six-goal',
-    'six-hit',
-    'six-metre',
-    'six-way',
-    'sixish',
-    'sizergh',
-    'skegg',
-    'skhod',
-    'skin-side',
-    'skipbridge',
-    'skirting-board',
-    'skriaig',
-    'skulks',
-    'sky-line',
-    'skyhawk',
     'skyway',
-    'slap-bang',
-    'slave-girl',
-    'sleary',
-    'sleath',
-    'sleepwalked',
-    'slews',
-    'slide-in',
-    'slimed',
-    'slint',
-    'sliproads',
-    'smaczny',
-    'small-ad',
-    'small-subunit',
-    'smallworld',
-    'smart-arse',
     'smegma',
-    'smi',
-    'smoo',
-    'smurf',
-    'snark',
-    'snto',
-    'snuggledown',
-    'soapwort',
-    'soci',
-    'socialistische',
-    'sodhi',
-    'sof',
-    'sofie',
-    'soft-voiced',
-    'softing',
-    'soi',
     'sol-fa',
-    'solari',
-    'solayman',
-    'solider',
-    'solitorium',
-    'solothurn',
-    'solva',
-    'somboon',
-    'some\'ow',
-    'sonatina',
-    'songlines',
-    'sonolux',
-    'soothsaying',
-    'sorbent',
-    'sorella',
-    'sorelli',
     'sospiro',
-    'soth',
-    'soubise',
-    'soughed',
-    'sound-system',
-    'soundalikes',
-    'south-side',
-    'southbank',
-    'souzay',
-    'soviet-based',
-    'soviet-dra',
-    'soviet-sponsored',
-    'soviet-supplied',
-    'soya-bean',
-    'space-charge',
-    'space-ship',
     'spallone',
-    'sparcompilers',
-    'sparer',
-    'spartacist',
-    'spaw',
-    'spazio',
-    'spazz',
-    'speaking-tube',
-    'specac',
-    'speci',
-    'specia',
-    'species-identity',
-    'specked',
-    'speedwing',
-    'spellbinder',
-    'spicing',
     'spider-web',
-    'spielmann',
-    'spielt',
-    'spion',
-    'spirit-level',
-    'splendide',
-    'spoa',
-    'spodoptera',
-    'spoilsports',
-    'spokan',
-    'sponge-cake',
-    'spoofs',
-    'spotlamps',
-    'spreadeagle',
-    'spt',
-    'spudded',
     'spunyarn',
-    'spzs',
-    'squatarola',
-    'squinty',
-    'ss151&mdash;155',
-    'ssru',
-    'stage-door',
-    'stake-building',
-    'stampe',
-    'standard-based',
-    'standard-bearing',
-    'stangl',
-    'star-fire',
-    'star-gazing',
-    'starman',
-    'starting-place',
     'statistique',
-    'status-seeking',
-    'stealin\'',
-    'steall',
-    'steam-filled',
-    'steel-producing',
-    'steindachneri',
-    'stennerskeugh',
-    'stens',
-    'step-down',
-    'sternebeck',
-    'sterotabs',
-    'sticklebricks',
-    'stigmatize',
-    'still-living',
-    'stinton',
     'stirner',
-    'stock-exchange',
-    'stock-flow',
-    'stock-room',
-    'stock-take',
-    'stollmeyer',
-    'stone-clad',
-    'stone-washed',
-    'stonebow',
-    'stonechat',
-    'stooging',
-    'stooking',
-    'stopp',
-    'stormonth',
-    'storying',
-    'stou',
     'strack',
-    'straight-from-the-shoulder',
-    'strakosha',
-    'stratas',
-    'straw-filled',
-    'streamlines',
-    'streete',
-    'strensham',
-    'strepera',
-    'strictly-controlled',
-    'strikebreaking',
-    'strinati',
-    'strong-man',
-    'strops',
-    'strozzi-sacrati',
-    'student-teacher',
     'studio-based',
-    'stuermer',
-    'stupido',
-    'styes',
-    'stylo',
-    'sub-level',
-    'subin',
-    'sublimating',
-    'sublunar',
-    'submerges',
-    'submicron',
-    'subscription-based',
-    'sudreyar',
-    'suga',
-    'sugar-plum',
-    'sulayem',
     'sulentic',
-    'sun-based',
-    'sundews',
-    'sunkyong',
-    'supalite',
-    'super-301',
-    'superabundant',
-    'superdirect',
-    'superintendant',
-    'superstart',
-    'supply-led',
-    'surface-feeding',
-    'surfs',
-    'suristani',
-    'surpised',
-    'sutural',
     'svaneke',
-    'sve',
-    'svid',
-    'svo',
-    'svolik',
-    'swathing',
-    'sweatband',
-    'sweeping-up',
-    'sweethope',
-    'swessex',
-    'swietenia',
-    'swilcan',
-    'swilgate',
-    'swotted',
-    'syclone',
-    'sylheti',
     'sylvared',
-    'sym',
-    'sz&aacute;sz',
-    'szechwan',
-    't\'have',
-    't\'ing',
-    't\'other',
-    't-cut',
-    't.l.',
-    't.w.',
-    't425',
-    'ta\'iz',
-    'tab(x)',
-    'tabarin',
-    'tabb',
-    'tacs',
     'tae-kyon',
-    'taieri',
-    'takayanagi',
-    'taklamakan',
-    'talacre',
-    'talent-spotter',
-    'talent-spotting',
-    'tali-fu',
-    'tam-o\'-shanter',
-    'taman',
-    'tanager',
-    'taniguchi',
-    'tanni',
-    'tanwaru',
-    'tapol',
-    'tappan',
     'tared',
-    'target-setting',
-    'tarka',
-    'tarkowski',
-    'tarmacadamed',
-    'tarradellas',
-    'taslan',
-    'tasm',
-    'tata-box',
-    'tavare',
-    'tax-avoidance',
-    'tax-based',
-    'tax-diversion',
-    'tax-man',
-    'tax-paid',
-    'tax-related',
     'tax-transfer',
-    'taxicard',
-    'tayler',
-    'taz',
-    'tbo',
-    'tbx',
-    'tdma',
-    'teamserver',
-    'tearstained',
-    'teche',
-    'technologised',
-    'technololgy',
-    'tedeschi',
-    'teepol',
-    'teer',
-    'teesside-based',
     'tefs',
-    'tegea',
-    'tehran-based',
-    'tekxpress',
-    'telebit',
-    'teleglobe',
-    'teleshopping',
-    'telexing',
-    'temgesic',
-    'templeton-brown',
-    'ten-a-penny',
-    'ten-truck',
-    'tengku',
-    'tenovus',
-    'tenser',
-    'tereshchenko',
     'terimon',
-    'territoire',
-    'territoires',
-    'terzian',
-    'tesl',
-    'test-flown',
-    'tetrapond',
-    'tfe',
-    'th&eacute;orie',
-    'th\'know',
-    'th\'must',
-    'th\'want',
-    'thanatos',
-    'thatches',
-    'thavorn',
-    'thcream',
     'theoderid',
-    'theosophist',
-    'theran',
-    'there-',
-    'thermocet',
-    'thermomax',
-    'thick-necked',
-    'thiessen',
-    'thievery',
-    'thiomersal',
-    'thiroux',
-    'thirty-day',
-    'this-',
-    'thornborough',
-    'thorson',
-    'thou-',
     'threadworm',
-    'three-chord',
-    'three-metre',
-    'three-space',
-    'three-wood',
-    'threshing-machine',
-    'throat-cutting',
-    'thunderflash',
-    'thwacking',
-    'thynges',
-    'thynk',
-    'tibor',
-    'ticket-booth',
-    'tickton',
-    'tiddy',
-    'tidewater',
     'tiem',
-    'tight-drawn',
-    'tight-rope',
-    'tilli',
-    'time-sharing',
-    'timken',
-    'tin-foil',
-    'tinctured',
-    'tinh',
-    'tinta',
-    'tip-tap',
-    'tip-toeing',
-    'tissue-wrapped',
-    'titivate',
-    'titiyo',
-    'tko',
     'today\'',
-    'toeholds',
-    'toggled',
-    'tohou',
-    'toleafoa',
-    'toll-gate',
-    'tombouctou',
-    'tomilty',
-    'tomor',
-    'tomur',
-    'tonging',
-    'tonking',
-    'tool-making',
-    'toolmaking',
-    'top-dressing',
-    'top-order',
     'top-seed',
-    'toplis',
-    'torch-bearer',
-    'torhthelm',
-    'torkan',
-    'torpantau',
-    'torpedoing',
-    'torriano',
-    'tortoiseshells',
-    'totalize',
-    'touch-judge',
-    'touch-line',
-    'toufah',
-    'toungoo',
-    'toutes',
-    'town-hall',
     'toy-shop',
-    'trabeated',
-    'trabi',
-    'trada',
-    'trade-based',
-    'tradescantia',
-    'trailblazer',
-    'trailbusters',
-    'train-building',
-    'trakback',
-    'tramming',
-    'trans-',
-    'trans-splicing',
-    'transaminases',
-    'transitioning',
-    'translocate',
     'transtech',
-    'trapold',
-    'traprain',
-    'treasure-trove',
-    'treasuring',
-    'tree-covered',
-    'tree-top',
-    'treed',
-    'treetop',
-    'trellising',
-    'trengwainton',
-    'tresadern',
-    'trevethin',
-    'trichonema',
-    'tridacnid',
-    'trigger-guard',
     'trillium',
-    'trinit&agrave',
-    'triolet',
-    'triple-bogey',
-    'triquint',
-    'tristano',
-    'troia',
-    'trolled',
-    'troughed',
-    'trouv&eacute',
-    'troves',
-    'trowelling',
-    'true-kin',
-    'trustee-heir',
-    'tryall',
-    'trygve',
     'tryline',
-    'tsui',
-    'tsurumi',
-    'tuberose',
-    'tucana',
-    'tuckers',
-    'tuenda',
-    'tuff-link',
-    'tugriks',
-    'tullow',
-    'tumorigenecity',
-    'tuna-fish',
-    'tunze',
-    'turbo-alternator',
-    'turbomeca',
-    'turkes',
     'turn-key',
-    'turnbulls',
-    'turnpiked',
-    'turok',
-    'turpins',
-    'tursiops',
-    'tushielaw',
-    'tussie',
-    'tuy&egrave;re',
-    'tvrtko',
-    'twick',
-    'twigrealm',
-    'two-axis',
-    'two-box',
-    'two-cell',
-    'two-over-par',
     'two-run',
-    'two-test',
-    'twopenny',
-    'tynes',
-    'tzakis',
-    'u(t)',
-    'uap',
-    'uber',
-    'uchte',
-    'ugaritic',
-    'ugta',
-    'ukepra',
-    'ultra-cheap',
-    'ultracare',
-    'ultrafleece',
-    'ultranationalist',
     'ululating',
-    'ulv',
-    'umid',
-    'un-hyong',
-    'unaffectionate',
-    'under-arm',
-    'under-dressed',
-    'under-prepared',
-    'underbank',
-    'underfelt',
-    'unembarrassing',
-    'unemployables',
-    'ungiving',
-    'ungor',
-    'ungrudging',
-    'unhip',
     'unibond',
-    'unica',
-    'unicomp',
-    'unipath',
-    'universalising',
-    'unix-on-windows',
-    'unnamable',
-    'unpatronising',
-    'unscriptural',
-    'unset',
-    'untaxing',
-    'unti',
-    'untrusting',
-    'unwearying',
-    'unwept',
-    'up-end',
     'upbuilding',
-    'upregulated',
-    'urbanbuild',
-    'urbe',
-    'urengoi',
-    'urran',
-    'urrutia',
-    'us-german',
-    'us-japanese',
-    'usaac',
-    'uscar',
-    'user&mdash;access',
-    'user&mdash;details',
-    'usmc',
-    'ussing',
-    'usted',
     'usulutan',
-    'utc',
-    'uteem',
-    'uvaq',
-    'vaadad',
-    'vacuum-braked',
-    'valdivia',
-    'valero',
-    'valeted',
-    'valiente',
-    'valmont',
-    'valorizing',
-    'valproate',
-    'valve-driven',
-    'valved',
-    'vanderaerden',
     'varndean',
-    'varnhem',
-    'varpack',
-    'varpro',
-    'vasa',
-    'vasectomized',
-    'vaselines',
-    'vassar',
-    'vaudemanges',
-    'vaunting',
-    'vch',
-    'veep',
-    'vel&aacute;quez',
-    'venedikt',
-    'veng',
-    'veno',
     'ventureforth',
-    'verbalising',
-    'verbeek',
-    'verein',
-    'vermillion',
-    'vernissage',
-    'verry',
-    'versifying',
-    'verus',
-    'vespa',
-    'veteris',
-    'vetiver',
-    'veyrat',
-    'video-cassette',
-    'vient',
-    'vik',
     'vilaseca',
-    'villase&ntilde;or',
-    'villefranche',
-    'vinay',
-    'vinhos',
-    'vis&eacute;an',
-    'visse',
-    'vistavision',
-    'vistec',
-    'vitazoslav',
-    'vith',
-    'viti',
-    'vitty',
-    'vivan',
-    'viverrid',
-    'vkpb',
     'vmail',
-    'vnup',
-    'vobiscum',
-    'voice-box',
-    'voiles',
-    'volcane',
-    'volvox-devt9000',
-    'vonadk',
-    'vonjy',
-    'vp16-rap74',
-    'vpi',
-    'vse',
-    'vsw',
-    'vulpecula',
-    'vxmp',
-    'w&uuml;nsche',
     'w.f.',
-    'w.v.',
-    'wachet',
-    'wacker',
-    'waffenruhe',
-    'wage-bargaining',
-    'wage-determination',
-    'wage-packet',
-    'wahoo',
-    'waldergrave',
-    'walking-tour',
-    'wall-eyed',
-    'wallfisch',
-    'wandel',
-    'wanger',
-    'war\'',
     'war-fighting',
-    'war-related',
-    'warbles',
-    'wardair',
-    'warning-light',
-    'warr&eacute',
-    'warrent',
-    'warri',
-    'warsash',
-    'wartski',
-    'waste-treatment',
-    'waste-water',
-    'wastewater',
-    'water-melon',
-    'water-rock',
-    'water-worn',
     'waterboy',
-    'watercraft',
-    'watty',
-    'wavendon',
-    'way-leave',
-    'way-station',
-    'wazir',
-    'wcml',
-    'weather-',
-    'weatherproofed',
-    'weatherstripping',
-    'weed-covered',
-    'weed-killer',
-    'weerstandsbeweging',
-    'welchman',
-    'welker',
     'well&mdash',
-    'well&rehy;being',
-    'well&rehy;intentioned',
-    'well&rehy;known',
-    'well-painted',
-    'well-represented',
-    'well-sited',
-    'well-spread',
-    'well-water',
-    'welschen',
-    'wentry',
-    'werman',
-    'wernher',
-    'western-sponsored',
-    'westernizing',
-    'westies',
     'westlb',
-    'westness',
-    'wha\'',
-    'whanganui',
-    'whatchamacallit',
-    'wheel-less',
-    'while-loop',
-    'whinchats',
-    'whiplashed',
-    'whiplashes',
-    'whiptail',
-    'whisht',
-    'whispy',
-    'whistle-blower',
-    'whitcher',
-    'whitehurst',
     'whitestone',
-    'whitmee',
-    'whizzy-wig',
-    'who.',
-    'whooshed',
-    'wicca',
-    'widdershin',
-    'widdups',
-    'wide-out',
-    'widowmaker',
-    'wife-killer',
-    'wildscapes',
-    'wilis',
-    'williamses',
-    'wilmer',
-    'wilsonii',
     'wiltzes',
-    'winckler',
-    'windiate',
-    'windsock',
-    'wine-bar',
-    'wine-cellar',
-    'wing-commander',
-    'wing-mirror',
-    'wing-pad',
-    'wing-root',
-    'winny',
-    'winslade',
-    'wire-brushing',
-    'wirtschaftsb&uuml;rgertum',
-    'wistaria',
-    'witsken',
     'wittingham',
-    'wivout',
-    'wizzard',
-    'wkpr',
-    'wolf-whistled',
-    'wolfchild',
-    'wols',
-    'woman-hating',
-    'wombats',
-    'wondow',
-    'woodcape',
-    'woodcare',
-    'wooden-faced',
-    'wooh',
-    'woomph',
-    'wordbase',
     'work-room',
-    'worker-peasant',
-    'wos',
-    'wouldn',
-    'wpb',
-    'wpcs',
-    'wreathes',
-    'wrightsman',
-    'wrong-doer',
-    'wtterc',
-    'wue',
-    'wuko',
-    'wunderbar',
-    'wunderlich',
-    'wwi',
-    'wybrow',
     'wyedean',
-    'x\'pert',
-    'x-based',
-    'x-efficiency',
-    'x-height',
-    'xia',
-    'xidan',
-    'xns',
-    'xoff',
-    'xon',
-    'xp&ndash;59a',
-    'xremote',
-    'xterm',
-    'y\'have',
-    'y-ray',
-    'yabud',
     'yakima',
-    'yalu',
-    'yawk',
-    'ycl',
-    'yeat',
-    'yedinstvo',
-    'yeravan',
-    'yermak',
-    'yester-year',
-    'yew-tree',
-    'yid',
-    'yoash',
-    'yold',
-    'yolkfolk',
-    'yoshikazu',
-    'yoshio',
     'yudkin',
-    'yummo',
-    'yw',
-    'yzr',
-    'z&aacute;polya',
-    'zagorsk',
-    'zalim',
-    'zar',
-    'zaw',
-    'zctu',
-    'zeider',
-    'zer',
-    'zero-gravity',
-    'zhi',
-    'zinger',
-    'zino',
     'zonk',
-    'zonophone',
-    'zoologique',
-    'zostera',
-    'zschau',
-    'zwei',
+)
+
+blocks_28 = (
+    '"+elig;lfsige!.eacute;cologie(-volu&eacute;s"*grave;lite!\'mdash;1\'$from\'&should!*ndash;what!&oacute!-scaron;iptars!%yen;5 %\'arry!$ullo!$when (-actinin',
+    '!%chain!4monomethy-l-arginine!"so!%there#\'ymidine *0.6-micron"(7-micron""8p &1-inch""lb!(.1-litre!*0&ndash;22"\'-length#&second#$yard',
+    '%#lus$$seat"*1-year-old",am&ndash;4pm!\'1-match#&nation#%point!%2-bit#%metre#$note"&0-seat$$year"-72&ndash;1307!&3-mile#%track',
+    '!&4-foot#%night"(1-member"#20s"!d!&5-acre"#lbs!\'6-match"#.5p!%7-man$$onth""mm!)8year-old!%900\'s"*24&ndash;9',
+    '"+42&ndash;43"#82d!%m-bit .2&frac12;-hour")ndash;1/2!7\'-deoxyoligonucleotides!%-6-2t"$inch"%metre!#.2p!(0-storey#%track"&0-year!%1-man#$week',
+    '!&38-pin""in!,4&ndash;sept"%-inch#&nation##way$#ell!"5- (3-course"+glucuronide"$mile"#ply!(.0-litre"#35p!%0-man',
+    '!(1-member!\'2-valve##way!*3&ndash;40"%-year!*4&ndash;35"\'-member!(5-nation""cm!(6-member!&7-hour (400-page$$seat!&1-year!&2-year',
+    '!#5-m#$yard"(year-old!(9-member +5&ndash;7pm!)00-member$$user &6-year!#.1p"#5mm!\'0-a-day$#kce#&second!)4-megabit#$port',
+    '"%m-bit!)6&ndash;9!(9-member"!s!"os (7-series!&5-year"#0mm!#6mm!#9ad!$secs -80486sl-based +93-year-old!&9-seat $a(b)',
+    '"&quiver!"17!#422!$amer"#pri"!w!&b-type"#afa"$bate#%esses""ca""du"\'erarder$$nant"%isala',
+    '"#oud""so!%camar#$ster"+cessorising#\'ount(s)\'+ant-general#"um$%stoms"*etogenesis"%heikh#&intree##uar""ky"!m',
+    '""se"(tivision&#ty\'!&damawa$\'thwaite"\'elstein""id""ou""ri"%speak"!u#!a"%vaita$!n%&celink',
+    '!"eb"%lfric"(ro-space$&bathon$&navale##tex"\'therius#!r!#fco"%eared"!i"(ter-dark&$work#!r!)ganbegyan',
+    '#%zadeh"#cas"&ecroft#%dabia"&garwal"\'ricolan#!o$*ecosystems$&phobia"#ues#$stus!#has"#mar"\'nenerbe!#ina',
+    '%&reight$&intake$&lifted$-reinforcement#&bursts#-craft-leasing#"th"#ssa""wa!$jeya!$kitt"&ureyri!(l-jaburi#\'khaimah%&orayef',
+    '""aa##mut".c&aacute;ntara#%hohol##ian$$ston""dh"%egria#%mbics#(xandrina"%fonse##ven""go$"ra"%hamad',
+    '#$khan"%ksnis#%ylate"&l-dark$-expenses-paid$$line$$race$$wood##att$#way#%beury#"em$$xton#&otropy#$ways',
+    '"$nair#$itak"(ong-side"%pacas#*ha-tubulin"$sike"#tan#&eplase$/rnating-current#)husserean#2l&auml;nderstrasse##ona#"ri"&vaston#"is',
+    '$$jeet#"ti""bo#%rosio#$ulia"$efia#.rican-japanese("um"#ica#+noacyl-trna"%pelio$!x#&hipods%%trite##ton',
+    '#)esthetize#,gnostopoulos#%lysys##nda#(stomosal#\'tomized"(chorians"-dr&aacute;ssy"&echoic"&gelika#%hiari#\'iograms#&licise##sty##ula',
+    '\'(watching#%onics"&odonta#"uk"$r-pc"#sii"&tartic#(e-bellum#(i-ageist&\'lliance&"rt%*censorship&(oalition\'*ndensation%%dutch',
+    '%+granulocyte($vity%)hashemite%\'italian%%knock%+libertarian%"nt%\'statism$$etam$%gonus#&ologia$*n&iacute;n"%ubias##ses"%yting',
+    '!$pang"!d"$erto"#net"(pealling%-rance-reality$#ned#(le-green&\'scented%"ts"\'res-ski"!w!(quafresh$$lisa$&nettas',
+    '!,r-see-nee-yo"&abiyat"$beid#(itraging")c-welding#$hiac%&lochus#"om#%uatus"%ditti#"re#%shiel"&ebeyat#%thusa$"te',
+    '##oed#$uers"$ieti##ola#$stoc#)thmeticae"$kies"%lesey##iss"$mees"%nauld#"dt#$oult"#ora#"sa',
+    '$$tine#\'ogating"&senale"(t-critic#(aphernes#%forms#!h$"us"&vandus#"ey!)scaridoid#%ender"\'h-brown#%combe#&donian',
+    '#%grove##ida"&iatica""li"&samese$!n$#yer#\'isstant#%uages"(tarielle%#tes$\'xanthin#%ilbes#\'rochele%%paths',
+    '!$tack#&hualpa#!m""ha$*nasopoulos",itl&aacute;n""le"%ochem""to#!s""vs!*uchincloss#$kley"(diotaped"#tee',
+    '%%route$$gyro$%logic$%parts!$voir"!r#"am""tk!\'watinas""ns""re!$xils!%ycock!%zcona"$teca',
+    '#$urro /b&eacute;cherel"/ouml;rsenverein"+uuml;hlmann!"-c!#.f.""g.!#aab##der"$bila#%ysave"2ccalaur&eacute;ate$%hanal#&k-foot%+to-the-wall',
+    '"#dan#!b#+ger-baiting#"ia$!e$$nter#*ly-managed##man#!s"&hraini#$t\'at")ileyfield$#out##rds"\'ksheesh',
+    '$#ssa#$dick##ere#"fe#"ks#)l-playing%%valve$$ards$"oo$\'yfolion%(macilroy#\'nibarbi#$sley#%tazar"#mby',
+    '$$saws#"k-$%stown"&ptisia&"ta#!u",r&egrave;ges#*-sur-seine##ash#*bados-born%$riga$$erry#,gain-hunting%!r#&kerend',
+    '##lby#$nbow$#ess#$ossa#"qa#(ricading$\'owloads$&ymores#$tels$-h&eacute;lemy%"el#!y"&seford#$hkim##ker',
+    '$#let",t-pollinated#"am#%terby$\'le-torn&$dore#"us"$ucus"#wds#!n""ye"*z&aacute;n#&elaire!$dang"!c',
+    '#$ment#%n-bag$$bags#"rn#$triz$!y#&umonts"(cconsall#&hhofer#\'k-water"(d-settee#%field#$mate#$well"&ermats',
+    '"#for%&e-hand"%gawan"$hove#%rendt""ic"&jeaned"&lcourt#&emnita$\'schenko$"za##gae#%laser$$core$#hop',
+    '%#ock$#win#+tr&aacute;n#%yutin"&mbenek#$rose"\'nahavis#(chmarked#(e&scaron$$dico$(factress%\'it-cost#&ignant#$nite#$omyl',
+    '#%yamin$#lin#$zina"%rghel$$lund$$mann$#omi#%hthun%#red#\'nardini$0y-rivi&egrave;re#%oepen#"te$$hier#!y',
+    '#"ly#+t-organised%%value$%known"*ta-testing$#com#\'hsiedum##sey#+ter-trained$"ye"\'wcastle"%yazik!"fk!$hanu#*w&amacr;ni',
+    '"%imani"%uller!(i-colour#$gram#\'lateral""bb#%elots""ch$#ard#%olour"\'d-price"\'envenue#%rhoff"(g-endian#$foot',
+    '"$hari&!s""ju"+kini-bottom"&ldende##hah#+liard-table"$ngen#$nian#$sted#%yamin")o-chemist#%fluid#$kern#/logically-based',
+    '$"ed##sal#%topes"&rchill#+d-dispersed$%s-eye%$foot$&tables#$inus#%kwood#,mingham-born#"ru#%stall#\'th-mark#$yani',
+    '#(guanides#!t#!u"#t-7#"sy!+lack-framed&#red%#ies#$ncke$$kout#\'stocoel#$xill"#eek"%inker#(therdick',
+    '#!p#$wjob",ue-blackness%\'painted%&yellow$#bar#%glass#*ish-violet#.menthalstrasse!$mp-4!,o&eacute;tie"#afo#&t-hook%$yard"+bbin-making',
+    '"(d&oslash#\'egraven#$gers#&lender#%y-bag%&length%%maker",enninghausen#%thian""gg"(lshevist#+t-protected"(mb-aimer%%blast"%naire',
+    '##ior$#ver##nat$$eval$#ier#!u"*ok-reading&#oom%&seller$"es#&m-boom#"ns#\'tlegger"#rer#&ocourt',
+    '"#sco#$sard"%ublil#%ffons#&nderby#$rdon$#let##tet"\'vington")wker-saur"\'xmaking",y-in-the-box!,r&eacute;che"\'adshaws#&hmsian',
+    '%#ing#%mhope#&ncazio$*d&atilde;o%#ade%$wood#%tunac##und##wne#!z"+eaking-down$)st-arrest#$heny##nan#%saola',
+    '$"ts#$ydon"\'i-nylon#$anne#&dehead%%price$&gefoot#(ghtfield&%water#$sten#/tish-controlled"%novic"&oaches#$ddle##kaw',
+    '$#ze-\'%green#\'oksbank$"se##ude$%ghams$%ssard#&verman#\'wn-grey%%stein"$ugha#%nsson"!y#"de#%ncrug',
+    '!"th""us!(ubble-up"\'cintoro""ea"$ford""hl"%ilded%&ing-in"(lb-fibre#&k-flow"%mbane"\'ndesamt&&sieger"#rco',
+    '#$glen#$illo#"ri#%stead#$tree"\'sh-baby$$buck##sey$!y"+tterfingers&"is$$head$\'on-back&\'ed-down#)ylbromide',
+    '\'\'orrower#)ing-power"!z#&z-free!"y-"\'dgoszcz"&e-line"!s"!t &c-anca"!e"!h"%shape!$.b.e%!.',
+    '!"98!,aball&eacute#%estan#\'lecomms#"on"$cgtg#$hous"%dgers#!i"&eserea"%ffier"$gnes""ja")lciferous#$houn',
+    '$$ente"\'marillo#$bell#\'emberts$&ra-eye%#ini%&ounais#%isard##kin#\'pagnola$&esinas#&shafts"(n-opener#\'adapass$*l-building',
+    '#*dle-making&#wax%"in$%oglia#$eton#%torum"\'pellino#%grave#\'istrano$)tal-logic#\'puccini$!y#(ricornus%"ne"&r-coat',
+    '$#her$%mitru#/bohydrate-based$!y#)d-playing$&enista$&inalis$#uus#/eer-threatening$,fully-chosen*(selected##ham#$iani$*bbean-born$"ca',
+    '$(t&agrave#$jack#%kesse##nac##ola%$ling$%thers#*petbaggers&$land#&seckie#&t-tail$%refle#(vetiorum"$sado#&einate',
+    '#)h-settled#$sels$$iano#(telnuovo$&or-oil$%rates#!u"&talano%#ino%#una#%fight#&hepsin$$odes##rin"%udate',
+    '##vin"\'valerie#"ey##ils"%ymans!#cla!"dw!(eanothus"+cil-trained"*dars-sinai"#fni"%gidfa"$lano##ine#&l-cell',
+    '"%nacle#!g"&paitis#$rano"#rda##eus##ing##rig#"us"$vert#$iche!)h\'kassian#%nozia"$aban#)ff-cutter',
+    '##hal##ika$\'nstores#$lder$%iapin$&k-dust#\'mbertin$.pagne-coloured##nan$"da$"gs$%neled#\'racter\'%#sse$&entais',
+    '%&ty-boy$#ney#$sin\'#$tset$)topadhyay#\'ucerian$#met$$sson"&echens$\'k-point#$e-ow#%ggers##lle$$onia#(nopodium',
+    '$#kin$#ney$#rie%%yhill$&sonese#%sewic$,tnut-bellied#\'valiers$%ening$%ignon"#hum"&ibnall##cas$\'kenwire#(ffchaffs',
+    '#*ld-spacing#%mbote#-nese-american$#kin$"ua#%p-pan#$rica##tre$#wan#%venor")loramines"\'oerilus##han##mbe$"ps',
+    '#$ules#"wn"*ristmasses&$ophi#+omatophores#)ysolakkos""sa""ua#"la##mps#.rch-as-a-force\')sponsored\'$yard$#ton"$ypre',
+    '"%nalli#$dery#)ematheque$$rary$$stra"$rcls$\'ularize#"ia"#tra#%terio#)y-dweller!)ladistics##man#"nn#%ribel',
+    '#*ss-leading#$udie&!n#&vinova"#e-2##aks$(nability$$r(y)#(rambault$$uchy")ick-clack#(entelist#/mate-controlled$$ping"&o-test',
+    '#\'ckhouse#)d-hopping$#agh#&isonne%&terham&#ral#&netech#%pping#+sely-spaced#)ud-filled"#rae"#ube$%mates$$root"&wydian',
+    '"#ead""yk!)o&euml;me"\'-citing$!o#&hosted\'!s#)organised"*al-getting%\'scuttle#&tlique"#bby"%chons#(katrices$&fights',
+    '$$rico"#das#&e-free##ner"\'elomate##nen",ffee-growing"\'gwheels""hb")iled-coil##ner#!t"*lemanballs#$ibri#"la',
+    '%"ts&"te#$mans#&ombard$%nello#+ston-hayter#\'umbines%$ella##way""mi$%nform%!o#&m-call$(and-line$,ercial-grade',
+    '%%ngled%#tte$#uni\'*ty-centred*(oriented&$ltel#%orbid#-petency-based&.itively-priced$#lan$!u%&terize"\'nasquay#+celebrating%!r',
+    '\',aci&oacute;n$\'ubinage#$duce#)fravision#%isbee#+servational##tin##ver"$ober#(king-pot#%l-box#%pting#&tehill"#paz#!d',
+    '#\'ersucar#$icat##pen%(r-mining"%rbeau#%dovan#%ebyte#$liss#)n-milling$\'er-kick$$feld$%illon#$onas#%poris#\'ranaich',
+    '%!s#"si#%tinas#$vine##win"%ssors#$tard$"on"\'t-death#*tage-style$\'on-knit"(uchgrass#"la$$ombs#*ntenancing',
+    '\'(pointing%#rey&&y-town%+y-by-county##thy"%vasna#\'ertness"%wburn#%girls#%leaze##pat$#oke"%ylton!"pn"#pcc',
+    '")-labelled"(ab-apple#&igmyle%$toun#$ndon$$sley#&yoning"*eb-binding#(dit-sale#)eper-clad)&overed#!g#%perie##spo$$well',
+    '"2ime-and-punishment##spa%"en%"ie$&tescue%%olino"+oesyceiliog#$ggon##nes#*ss-control&\'harbour\'#ole&\'matched\'%odule&%piece',
+    '%(currents%)ing-point%#ply#\'uchback#*wd-pulling#$xall#$ydex"#uck#"da"(yptogram!"sl!#tag"!r!#ubi##lai',
+    '##sia"\'linaire#%linan#$toon"%mbrae"$nhal"$rbar#"er#&iowood#%licue$(y-headed#*riemuirend#$vier"\'stom\'ry"+t-and-paste',
+    '#\'teslowe!"vc!&yborgs"*cletouring#"os"(nethryth##gor#"og"(peraceae#$raea$&inidae!$zars"(ernowitz#$slaw ,d&eacute;bat',
+    '"\'mdash;6!(\'affaire"\'origine!&-block"$pawn!#042!"26!&abbles"#dra"#fis"+guerrotypes"$hlem"$ikin"\'kletons"&lisons',
+    '"(maraland$"to#"er$"ta#$iano#!m#$yata"(nceteria#$gler##ial$$ella#&throne"#oud""ph##ple',
+    '"#ran#\'edevils#)k-stained$#ley#,lington-born#$ryll#"ya"%te(s)"&uphine"&venham"%wdles#"gs#$trey"&yglobe#$long',
+    '!.e-commissioned#,seasonalized"%arham#)th\'s-head%!-&$mask&%squad"(bouching"#caf$\'lcified#-ision-support$"us#\'o-style$-nstructionism"#ene',
+    '#&r-park".fence-in-depth\'#man$$rent#(oliating#&raying#$uses#!w"+gree-linked#!w"&inhard"\'lafield$$nder#$illo#&linger',
+    '#!t#%valle$#ert"%mbina#&ergers#$oing#*ythologize"+nkmalpflege##son#&telles""on"1partmentalisation#)oliticize"&rhalli#&macare',
+    '#"na#&touzos#!v"(sarrollo#$erta#&isting#*k-sergeant#/perately-needed$$oins#\'titutes"/tector-operated$#nus#%oured"*uterostome"&vrimci',
+    '""fr!#iag#%stema#&tomite#)zomethane"%buama"%ckies#&tamnus"%ecast#$pgen#$tmar"1gital-to-analogue"(jmarescu"$kmen#$tats',
+    '##ger##len"$mfel#)itrovitch##wit"%nette#&gleton#,oflagellates#%widdy"&oscuri"&phones#*loma-level#*ole-dipole"/rection-finding&,or-designate',
+    '"(sc-based$%hidia$&ipling$%omfit#\'fluency#)illusions#&joined#\'neyhood#(organize#.pute-resolving#(sanayake#(talgesic#(ulphated"%ttany"*vine-right',
+    '!#los!"mf!+na-damaging!(o-action"(cu-drama"%erner"&g-face$%lover#!g#\'sbodies"#hrn"#lfo#"in"&me-car##ing',
+    '&"um$!s#!s"%nelan"#orn"!p#)e-smoking#*pler-shift"#ron#)soventral"%simat##sou"(ttoressa"+uble-acting\'$beam',
+    '\'%helix\'%width&$take#&cement#$gald$$hboy#"st"%wayos#&elanco%#led#+n-escalator$\'climbed$"do$%under$\'warping',
+    '%%oning#)ughtproof#(w-string"#dos"!e#&amboat%$ings#%ghorn"$iant#%p-fed#\'veshaft"\'op-ship#$ully"+ug-addicted$#get',
+    '#*opithecini!"th!(ual-task"\'bossary",champ-villon""du"#ker"%lbeco#$ness"#mka#+ping-ground##yat"#ngl#$mail#&nichen',
+    '"%otone"%pleix"&tskche!"va"!s!"xa!&yhouse"%mocks")namisante\'"ed")spareunia!%zhava $ealy"6rly-nineteenth-century#%muffs',
+    '%(-stained%$life"+sier-to-use#\'t-south$%erner"&tables")ves-level!"bg!&c-efta"\'clesall"\'henique##oic""im"$ofex#/logically-based',
+    '##sse"#tim!-dge&oslash;ya$#-on$$wise"#in.#+torializing".ucaci&oacute;n%%tion\'$#orp!%fford"$tpos!(genhofer"&gardon"&o-trip',
+    '!"hh"\'renfeld!*ichengreen"!f"-ght-bedroomed&%piece&$team%)een-carat)$year"%lleen"&s-type!%ladon##nor"!c"&donian',
+    '#$rene")ectioneer%#ras&+o-magnetism\'&eluted\')hydraulic\',n-microscope(1ically-controlled\'&plated""in##seo"#lam#$iffe"%orine"&shtain',
+    '"#yot!(mbayment#(lazoning#(ryonated""ep#$rods"&iliano"#mer"-otion-charged"\'pennage#%resas#%tores"&ulsify&$oned!+ncapsulator',
+    '#%rease#0yclop&eacute;die"&d-1991\'!3#&eavors#$ives##low#&osperm""ea#+rgy-balance)#sed#"ts"\'gelbart$!r#)ine-house',
+    '$%ished"\'meshing"#sla#"si#!t"\'tangles$%rtete#\'ertain\'##ick"&uretic!#omd""zs!$pdrf")hemerides#&ialtic',
+    '""oc$%hserv#!n"$roms!&quador#&ibrand$*pment-cost$(ty-based!#ran"$dman")echtheion##van"\'gotimos"$icht##mus',
+    '"&szebet""yl#(manthian!$sade#"la"%cales%"on#$uela""ii""ke"#ler".pa&ntilde;oles#&erance$!y#-l&eacute;chin',
+    '$$sito#$rits"\'sanelle$&y-text#&endine##iet#"on"%taing$"ll$"ng#%range"#vem!$tain"\'helwold#-nically-based',
+    '"&tedgui#&ington",zioni-halevy!\'uboulos"%laema"\'menides"&netcom"%ripos#*o-atlantic%(centrism&(ommunism-"ts%&jargon%$lang%#top',
+    '$#bag$$camp$(deposits&"sk$%group$#hub$+p&eacute;en%%hiles$%speak%#tat$&travel"#sol"%terpe!#v\'n$#ing',
+    '#$nkis#*r-mounting%)narrowing$$ards$#ite$&living%"ys$&tonian")olvematic!#wgm"$shot!.x-agricultural#(champion$(olleague%%nduit',
+    '#+heavyweight#&leader$#ner%"wr$#ove#$nazi#(patriate("ot$"ro#&racing#(sergeant$$lave#$town$$rade"*am-passing',
+    '"*cess-value#&ideuil$%semen&!s"\'ecrated$.utive-director*$type#"ll#)ter-based"#ner"$olon")pectorate$,rience-based#!l#&ressen',
+    '##ra-&)budgetary%$slim&\'ynaptic"%urban!(ye-blink$$ring#%dness$$rops"*v&oslash;r!%zzoud )f&auml;rg"(iacute;n*)&aacute;n"(mdash;er',
+    '"$hole!"15!$a(n)"#-18"%berge#&ricius"(ce-cloth"#dos"\'ir-isle$%cloth$%haven$%mount""la#$coni#"di',
+    '#&ltrick"\'mbridge#$illy"%nfani#"ks#%tasie")r-removed#!g##hat#$ideh#&m-cart%$gate%$yard$!e%"ry',
+    '$%scape)!s$%watch##okh#*r-designed$"ag$!y"(sciculus#!s$&labend#-t-diminishing\'*sappearing%)expanding$*er-growing"-ther-daughter',
+    '#"ly##sia"#uci#"gh#"nt#%stino"\'wehinmi#"zi"\'x-based!"bo!"ea#&rnside"(brerista"%delma$)ral-style',
+    '"$eley"#ile"\'liciano$$ndre#,low-american\')believers""ma#"is"(nce-post#&derish#$ners"%reday#&gusons#$khan#!l',
+    '#"os#%rabee$(et-faced&!y$"in"\'ssenden"-therstonhaugh#&ishize#&tering"$uded"*ver-ridden#"re!&forest#!s!!h',
+    '!&iachra#!h"*bre-optics""da#(dle-case#!s"(ef-rente#%gehen#(ld-level%\'walking"$fers#)ield-hall$"ne#-th-generation&&wicket',
+    '%#ish"$gura"&larete#%ching##ipe#\'m-going$&strips"!m"%n-rot#&al-day$,nce-ministry#$chie%#lea$!k#,ger-pointing',
+    '#$kin\'#"ny#$stat#$uval""or$&entino""pa"%rbush#%e-box%%drill%\'fighter$$clay$$plan$&screen$$tail',
+    '&&tching#+st-division&&formed&-hog-of-summer&(language&%named"&sh-eye%%paste$%errow#&suring"\'tzpeter"\'ve-line%&person"/xed-alternative&&income',
+    '#!x!$laco#(g-flying%$pole#,me-retardant$&marion#%ngers#(sh-point%$guns%#ies#(t-bedded%$mate&&ounted$$hman#\'xperson',
+    '$&market##dge#"gg#$hmen#$nley#$urie#\'xifoils")ick-knife&"on#(ght-note&%cased#!k#$p-up##tch$&tering',
+    '"$o-jo#,ating-charge#$ella#&orshow#&restan$#igo#/w-visualization$,er-arranging\'&seller&#day")uconazole#\'gelhorn#"mp#$nter#)orochrome',
+    '$%tying#(ing-suit!#mea!"na""la!*oam-backed&&lowing""ce#$king"%edera"$ggia"&lk-art%$hero#!l$!e',
+    '$$iott%!s")ndamental$#les"(od-chain%\'finding%%mixer#&t-hold%\'soldier&\'tamping$$ling$&plates$(slogging""r-#)ebuilding',
+    '$(gathered$)ign-trade$$mast$\'sighted%(t-tundra#!g#$m(s)$\'-master##nax$"ey#"on$!s#%posty#"se#$tuny',
+    '#+ter-brother"*theringham#!i#!o"&ucauld#&ndress$*tain-house("ed#\'r-blade%"cd&#hip%&hander%$iron%&person%%valve',
+    '$)teen-hour)&record(#th-%&h-form"&x-head#$bats#$core#%holes""zz!"pd!&ramjee$$sden$"us$$well#.n&ccedil;aises',
+    '%%onian$)kenstein\'$#nie##ppe#"ss#!t$*ernization"*eckenhorst#\'e-entry%$hand%$play%\'radical%%space%$text$\'falling',
+    '%$heet$$ware$)ze-drying&(branding%)ing-point##ier$$heit$&licher$&schutz#)nch-built\'#led&!y#\'shfield$#sen#%uchie',
+    '$&ndlich##wer#$ytag"#ias#*dericianum#)edlaender%&manite%*richshafen#!g$(oscandia#%llies#$ston#(tillaria$!o#$zzle',
+    '##lik##mow##nde$&tagers#\'st-bite&)hardening%&bitten%(ed-glass#%ttage#!w""se"$uili$&t-cake&\'machine!#sid',
+    '!*uel-saving""it"(jisankei"%lbeck##ica#(l-circle%$drop%%power%%speed%%track$*erene-road$+y-automatic&\'clothed&(featured&%laden',
+    '"(m&eacute"%n-run#(d-holder#%erall#%guses"\'rbished##ner#\'pulling#"st#$tado"%silli#&s-free")turecooks"%zzbox$#ies',
+    ' 0g&ouml;k&ouml;va"+uacute;zman!%-arju"\'banding"$flix"!i"%meter"\'protein!&abalfa#"ba$$iano#$ling"%damer""ea#"ta',
+    '#"os"(l4-rap30#&anthus&#ine$&tasary#"ba#(e-lashed$$otti#$iano#$lego$$icas%#eni\'"us%$many%$vant',
+    '#$thie"!m#%betta#&e-bird$&s-room#&magard")ng-leader$#ouo$#war"$pped$#ing"%rburn#\'den-bed#$kain#3misch-partenkirchen',
+    '%&r-gray#\'rimpero\'!o%&sonian$%otter\'#ing%#wby#&tnavel"$sbag#%kells#)tarbeiter$%ehaus%"in$&rin-17%%opoda',
+    '$$head#*wick-based"&uguins##tby#$zlin"$voty"#wel"(y-lussac##ler")zza-style!\'blpages!$c-ms!#dba!#ead#\'l-charn',
+    '#"ok"*elalookala#"re#!t#!z"\'farnate"&ireann"#lbe#$lert##man"$mcor"$ndle#\'e\'s-eye$%-pool$,ral-election',
+    '\'"is$#ver#$ista#$nard$#ery$!y#(uflected"+ochronology#"de#1graphically-based#(politics#&rghiou%"ii&!o#!s',
+    '#$tech\'$nics"%rakan$$sene#$bera#)man-based($uilt\'#led&$ness&"us#$rett#(usalemme"*s&auml;nge#!a"$ttin',
+    '"!x!$gf-i!\'hadames##rbi#"ts"#eep"&iberti#(nocerous"+ost-written%&buster!,iant-slaying"%bberd#%iliru#,raltar-based#!s',
+    '""en")ga-switch$%cubes$(ntomachy#"er##ots"#jon"%lbeys##era#&hooley#$lean$%ocher$%ygate##mar##ton',
+    '##mel"+n-and-tonic#\'ger-nut##ner"&oconda#%litti#$vani"%raudy#$esse"(sborough"%tanes##tus!\'laistig#&m-rock$\'orising',
+    '%&urized#&ramara#$sbey$$cott#\'vkosmos##zer"$eick$#tze#&nafton$%croft"\'idepath%%slope##ffs#%ssade(!s',
+    '#\'balview$"ke#&chidia$$kner#$omed#!p#$rney$&y-hole#$ssae$!t#-ucester-based#$ving#\'wlights"&p-aacr")ucosamine',
+    '#$nwed!%mbatu#"hs"!i"#pte!&nasher"!c!&o-slow"+bble-gobble#%shite"*d-directed$\'worship#,dess-worship#"ed$#tia',
+    '#%spell"&ethals%(estrasse""go"%isses"&lborne#&d-dust$&crests$&eneyes$#oni$#top"!m#%olzig$#rro"(narezhou',
+    '#$erby##ged#\'iatites#$tran#"zo"(od-faith%&length$#ger$$rick#%glies##ner#&sepool#!t"/rbachev-yeltsin$%limey',
+    '#$etti##nal&!l##oka#"ra$!y"#sal"$tard#"ch"#udy#%rvish#\'verneur"-vernment-bond"%zitan!"pd',
+    '#)oacute;sz"#aaf#%brail#$de-a$!s$%ualia#\'ffitied$%point##in-#+matt&eacute$$lich$\'maticus$#ola##nma$!o',
+    '%!h#\'pe-vine$\'h-paper%%ische#$ssic&!e#$uves#!v$"ad%"no$)e-robbing%%stock%"tt$&itates&&y-feed',
+    '%#ton"(eat-coat&$eyed#$cque#*ek-turkish$%nburn%$care&$loth%\'fingers%$gage#!n##try##wal#*y-coloured%\'painted',
+    '$%wacke"%idley$#pad#$ffen#%gnano#%llade(!s#$nkle$#ley$#ols#$shin"%o-bag#"ep#&novius#(othandel',
+    '$%s-out%&ing-up%\'munster#*und-attack\'$rent&%crews$)p-hunting%#net$\'se-moor#&vewood##wed%"th$\'th-room"!s#!c',
+    '#%ndfos$%ewald"\'yshenko!"sf!/u&eacute;rignys$%uml;t")an&aacute$#gen#*ran&iacute$&d-rail$#ino$#uja#$tama""ba")ed&eacute',
+    '#\'st-list"%ffbry""ga",iacur&uacute#$ders##ler$$lain%#ory#$nier#&puzcoa#+tar-related##zot"#let#&l-wing$#ion',
+    '"&mmidge#\'nutland#$pert%"ts")n-founder$%point##bad#\'destrup#\'fighter(!s$$lint#\'running##the"#rin##ton',
+    '"&stason%%vsson"\'t-level#$tner"$yler"%zzles$!y!$welo#&nffrwd"#ilt"\'raggedd!*y&ouml;rgy#\'uuml;la"#rth +h&auml;rtel',
+    '"\'ouml;fn"*uuml;skers!!\'!!-"%grade"&shaped"!t!"11!"ab#&ershon#$icht"&cksaws#"sg""d\'##dam',
+    '#!n#!s"&emacel""gg$#ett$#ler&!s"*hnemannian"%iducu##ght#$lman#"nt#+r\'s-breadth$%-care&&overed',
+    '%)splitting%\'trigger$%bands$#ies""jj#%redin""ka#%kinen"%labja#%danus$&ingham#$eemo$&maumau#+f-a-century&%rmour',
+    '%&choked%(distance%(fainting&#ill%%heard)\'tedness%&inched%&killed%&lifted%$made%&nelson%%ounce%%power%$read&%otted',
+    '%$seen&\'leeping\'#ope&(overeign%%track%)whispered#*ikarnassos$"na##kin##lax$$ooed%#umi$%statt$!y#"mi',
+    '#(ter-neck&$neck#"ul"%madah$!t#\'bantota##don$!y##med%&r-beam(#low#"on#!p"&nd-bag&$lown',
+    '%$hold%(in-glove%)over-hand%$sewn%&worked$%elian$%grips$!l%$eigh$%overs$%shape#"er#$g-on$$aroa$(ing-shed',
+    '#"ni#%sards$!i""ow"%rbron#\'d-bound%%going%#hat%&living%*of-hearing%$porn%%sided%(tackling$%court$(standing',
+    '#\'ecastle$$foot#&i-kari##mel$!o#$riss$%ovian$\'yhausen##tel$#ini$,lepool-based$%stone$%wells#&umphed#"ve',
+    '#"le$&ington#\'moneans#$ting"#tha##ley#$shop##tat$#ula"#uff#)ptbahnhof#$sman"$ve_a$"n\'%&-based',
+    '""wa$)iian-type##ing#&k-moth$$shaw"(xthausen"%ybote##sey"#zan$+rdous-waste#$data#&el-rah!\'cfc-123"\'process"%space',
+    '"!n!"e\'"\'ad-band($ging%$gear%&hunter$&banger$!e$#ier$#row#$leys#\'rdberht$$nden$&t-free&%shape',
+    '%&shaped#&t-flow%-of-the-moment%&stroke%\'treated#*vily-laden$(y-billed%$side"!b##don#"og"%chter#$kles#\'tolitre"+dge-sparrow',
+    '#"on#*worthfield"$eney"$iden#*ligenstadt$#man#$maey#$nsch##ser"%kuran"#ley#"gi#\'iograph%!n&%etics',
+    '$)um-filled$,x-turn-helix#"l\'$$-cat%&raiser$$hole$$inck#$pin\'#%vetia##weh"(mingways#$sted")n-harrier#$dren%"ys',
+    '##rie"&pburns##her#\'pelmann""r\'#!-#(berstein#%culis#&eabout$(ditarian$%gulin#&ington$!z#(missenda%"te',
+    '#-o-worshipping#+renchiemsee#$sant##weg#%zlich"$t-up#\'eractis%\'oduplex&\'nuclear&%topia##man"#ure"$xate")ydweiller#$gate',
+    '!%i-hat#"lo"%bbett"(ccupping##kel%"ry"\'ddensee"\'gh-band)%width%,conductivity%$jump%#key%$lift\'$ving%(rainfall',
+    '%&season%\'tension$&chairs$&er-end\')frequency\'-than-expected\'(yielding$+ly-parallel"$karu"$lden$#red##ife#%lfoot$$gate$%slope',
+    '#"ma$\'elstein"$ndoo#*ge-bending"(ppodamos"%ralal#$iart##thi"\'s-story#*toricizing\'(ographer"%tcham%#ers#!e#&lerism',
+    '"$watt"$zbul&#lah!)jartarson!#lao"!r!$mong!)oar-frost"%bbing#"ie#$oken$!r"%cevar#(us-pocus"&e-down',
+    '##sch##yre"(ffberger"#ggs#$nose"$iked"&lbride$#urn$!y#%denby&!s#/e-in-the-corner#+iday-making\'#fax#%laday',
+    '$\'ingwood&$well%#son$!o%"la%#wer$%ybush%$hock#"ty#+yfield-bowe#$zman"$mans#)e-brewing%&ground%+improvement',
+    '%$life&#oan%&taping%\'working$%pride#&inidae"*neymooning#%fleur#!i"#oey#&kboots$$line#$rnik"$pers#$pity',
+    '$$iman#\'s-texte$%brugh$&e-back&$dung%$fair%%heath%&master$&tmeyer##ten"&spitia#\'tbridge"&t-bulb$$foot$$seat',
+    '#&footed##man##ung"%ubara##don#$lder#)se-arrest&&moving&(training%$keep%&martin")vertravel$!s"$wlta"&zelock',
+    '!\'rabanus""ee!$suan!%trams!\'ubwards#!y""ck$$erby$!o"#dud"$emul"#ffs##ton"%ggers"#kam',
+    '"\'manises#)bersiders$%recht##mer#(ped-back"*ndred-foot()millionth#-ter-gathering"$rdla"%sking#"nu!!v"5annadalshn&uacute;kur!+ydra-headed$\'o-power',
+    '"$ksos"&mettos#"ie#%nbook"#oid"&perama%\'channel&#ube%(kalaemia%(metropia%*polarizing%+sparc-based#(notising#(ocycloid"\'rodotus',
+    '!#(k)!%-beam!#.s.!#486!)860-based!(acovleff""ps#!t"#sos!%bidem!#cam""bp""e-$$core$&filled',
+    '#(breakers#$flow"%habod$$elan"&kleton""ma"\'onology""ps""sa!(damantes"!d"(ealising#%mitsu#*ntity-card)(thinking',
+    '"%umaea"!v!"ef""su!#f\'n"#ceb"!g""la!#hre""sm!$i-iv#&listed""ed"$i(m)#!j',
+    '""ia")l-dressed$&effect$$fame%)ormedness$%grace$(received$%treat#!a#!e$#tas"#mor%"og"#pec#$pilp',
+    '""co"#eca$"he"#lac"(macolata%%ulata#\'igrated"%paler#\'enitent#(lementer#\'ostures#2ression-management!&n-born#&demand#%frame',
+    '#$love#%place#%shore"#bal"*come-based%$ings$%terms#)rementing#!y"*demnifying$\'ntified$!o$!s#%iedom$\'go-blue',
+    '$)vidualize##ore#/ustry-sponsored#$welt""ec"&ferone#!l$.ation-adjusted$$ects$%owing#$orma&%ix-se"$gall#&egneri#$lese',
+    '##old#(ratiated$(es-based##und""it"#kie"(ner-area$&scourt#&ocenti""oc#"nu"/sect-pollinated$!e$&minate)"or',
+    '##haw#"ta$$inet"-tellectualist$$plan$(r-censal\',ommunicating(+nnectedness&(district&\'faculty&%modal&#row&%track&\'varsity%&censal',
+    '(&tinent&&utting%$est*%*face-based($ulty&%eron-&#ine&$used%%glass%(leukin-6&&ibrary%&nalism\'2tionally-acclaimed&#ist%*penetrates',
+    '\'%eader%#sex&$leek&$pace%#tan&&elecom%\'valence%&weaves&#ove$$word#)ra-german%%group#%urned"+vermoriston%%polly',
+    '!#ofc"#nel$#scu#%isers""pi!#ppl#!o!)ran-based$!i%\'an-born""ca"+eland-based"\'idology"&minsul"\'onclads',
+    '"!p"%s-pcr!+s&egrave;re"$amaa"#csh"#dns"&hikawa#\'maelite"\'kusstvo"&landed&(presents#"ey")o-elastic$+reflectance#)curvature',
+    '#%pachs#%types"#pck#!f"#sak#%erlis#%igeac"%thmia"!u!(t&oacute"\'alicise&"us""cf"#sag#"ec',
+    '"#zin!$udeu!#vam"!c#!t"!l"!s!&wamoto"!p"!t"!w!\'xmarite!#yru!&zanagi%"mi',
+    '""od /j&ouml;llenbeck!#-45"%boats"!l!%aafer#!p"(bberwock"%cinta#3quemart-andr&eacute%"in")ff&eacute")guarsport""hr"#jce',
+    '"\'lhousie##low"&maitis$!s#"bo#!e$$rson$$sian#"ir"#nka##vry"1panese-controlled%#ned""se##ons',
+    '"#vad"*w-dropping"\'yabhaya$$pura!&cm-900!"da!$eary"\'dforest"!e#"ze"%fkins"(hovakill"#len%#ice#"la',
+    '""ol""r.#"my"\'tlagged"(unehomme"-wel-encrusted%+lery-making!\'harkand"%elisa!&ibshit""ff""ho""lt"&nghpaw#!k',
+    '$!y"\'tterbug!&nandas!-ob-destroying$&holder$&search#&finder#$plan"&ckeyed$&straps"&ggling"\'hannine#"ny"!i#*nt-manager',
+    '#$lied"%rdaan%#nia"(ss-stick"#uet#"rn%&alling"%ycean#$euse#%rides!%ubail"%daean#$dery""if#!n',
+    '"#lep#%ietta#&lunder##yan"&mblies&"ng#\'p-start"2ne&ndash;september#&ghanns$#led#&k-food$%eting#&queira"#ran#"by',
+    '"%s-rol#"si#+ticiability%#tia"#vie 4k&aacute;lm&aacute;n".eacute;rastase"*oslash;bke")uuml;mmel!"-9""ar"&factor"$sb3s!#.j.""k.',
+    '!\'abbalah#$isig#%ooter#"ye"(chrylion"$desh##ish"#ffa$#irs"%gemni"&hlfuss#%rilas"%inate"%jiado"&kiemon',
+    '$!t#$ieda$&nowski##kan#!l$!i%&bunker##mia#!t"#mbo$$yses#*ekestrasse#\'tronics"&nafani#$dler',
+    '#*gchenjunga##hai"%pitan"\'rakorum#-dam&iacute;li$$ooni#!e$"ls#%isoke#&kadann#%lovka#!n$%ovsky#$pass##sch',
+    '#(unakaran"%sprow#$tner"&takana$#rin#%hrada##kin"%uffer$(manniana#"ri"\'vanaugh"#wai"&yleigh##sen""za',
+    '#!r$#sey##tes"#ema#"ry"\'idanren#$lder$"ly#!n$"eg"%llert%#way"$mpff$$tner"$ndle',
+    '#$mure#%naway$"ex#%wards"!o"%ppels"&rmadec#$ries"$sner#%saris$#els$\'ingland##tel$"os"%tchum',
+    '#*tleborough&!r""y-#\'holders#&stages##ter!)haki-clad#"lk#"ma##nna$"ty&!s#\'zakstan"!e#$rson',
+    '"#num"%ordad##uri%!y"!u##sam!\'ibswell"%ck-in"(ddington"%ejman#$lthy##ren"#goi"%lauea#%bourn',
+    '#&grimol#"l\'$$hope$"ow#(moriarty#&nhouse#(ocalorie##tie""mi"%nahan$$wley#)d-of-coat$+el&aacute;n$\'hearted$#les',
+    '$%-hell%#pin$%cobra%"up$$dome$"es$%sbere%#man%%north%$port#%nabus#*ross-shire#$tour$!u#"zu',
+    '"\'rkibost#(schberry""sh$"on#$sin\'""ta#$bags#,chen-dresser\'&eering"$zito!%lakkr#%usner"&eeneze#$idon$$nias',
+    '#!y"&ingsor#&pstein"#oss"&ucznik!#m-2!&napped#$very"$eads#%dliky"(ickerbox\'$less##dos#(fe-blade&(carrying',
+    '&\'grinder#*ght-ridder")ock-about#"ps#$west##yle"%uller!&obolds"#djo"&echlin"&ffmann"%hanim#\'lerwald""ke#%oomus',
+    '#%owrat"#mbo##lan#&munist#$pakt"%ninck#+opkastrasse"#oks#!y""pf")rea-japan##man#%nilof#"or#&sakoff',
+    '"&shland"$tite#"ze"\'valenko#"el"&wtowed"!y"&zi-tec#!o!&petigo!.ramol&iacute;n"#euz"(ickstein#"ek#(minalamt',
+    '#$tias"%oeber#"nk$!o#"ss"1u&zcaron;i&cacute#\'mpacker##pps",y&scaron;tof!$ubri"$enen"$iken"$jabi"%lsrud#"ti',
+    '#!u""ma$"on"$ndan##st-"$pfer"*roko-style##tag#!u$"ma$#nba"#scu"%tahya#"ch#"lu',
+    '!&wangsi#(shiorkor")iatkowski#!c!)yffhausen"&lerhea"%shtym 0l&eacute;ontieff")oslash;mo#&uml;we!0\'&eacute;criture".administration"%image"#oye"$uomo',
+    '!#.d.!"26!$aand"$batt#)oratorium$-ur-augmenting\'*supporting&#eur#&raunda$%oides"$cava#\'emaking#"he#(talbumin#$unar',
+    '#&eroute#(y-killer$!e"%emmli#&tacara"%farge"\'gavulin"!h#"at#$inch"#ika"\'kelands#"in#$onia"\'llement',
+    '#$bear$$gate$$irth$&rianou#(educking##ica$!n$"um##med%%rmuir#\'p-light$#ing$#ost"%ncias#+d-for-peace',
+    '$#ais$\'cruiser$\'filling$#in\'$$line%*ord-tenant$#olt$"ru$$sman%$ting&%rasse#&franco#%gevin$%inger$"le',
+    '%#ois$#sam$#ues#%ighan#$nagh%#man#%sford"#oag#&dicean"$pdog#\'ershoek#&hroaig#"in$"th#$sley',
+    '"$rdie%"ng##ge-&)magnitude##ked#"na#%ouche"\'serball%$jets%&master%&vision#"ko"\'tchmere#-e-seventeenth&%ummer',
+    '#$hers$"om#!i##sis#\'ychidas"$udes#(ndresses##rin#(terpacht"\'vernock##ity"&wfords#!r#&yering"%xness',
+    '#"he"(zzaretto!"dh"-l-cholesterol!+e&ccedil;on"&a-anna$%based#&d-mine$%belly#(f-cutter$\'cutting#$pers$%frogs$#man$#ors',
+    '#\'se-back$&t-cost#-ther-jacketed\'%board\'%goods$!s"/banese-american#,ensordnungen"&canuet#"oz"$doux#$with"%e-way#*chgatherer#"te',
+    '"$fkas#&t-hook"&g-over$$pull#&al-aid%#ist#$enda$\'rdemain#(ionaires$&timist"\'hmbruch"\'iferkus#!s$)ure-based\'%world',
+    '#$xlip"%leupi"%maire"$ndal#&inakan#(twardine#!z"&ofsige#&ntodon#(tychidas"&sioned"#tec#(zeburger"+vel-pegging$\'nshulme',
+    '$&r-arch#&itated#!s#!u"\'wenthal"%ybold#%field#&hausen!#gwg!%ianas#$ssic",b&eacute;ral#$elle$\'razione#&rairie',
+    '#-yan-sponsored"!c#(e-ridden$!t""eb$%owitz"-fe-prolonging%%world$$card$%force##fen"&ght(s)%!-&&footed&&handed',
+    '&#pen&*reflecting&%speed&%water%)er-weight%(fastness%$nin\'%$sout#%onier#"ue"$kken"#lia#%libet%%stone"&me-mud',
+    '##mat"&ndrick$%stedt#"e-##gen$&gajati$!s#&ington#\'klaters$$mail#"ny#%ocuts$%types##pac")on-headed',
+    '"\'p-stick#$atti#\'ofectin#$ping#%salve")quidambar")ra-dollar"$sbeg%$rger#%glass"(therwood#\'opterns#.t&eacute;raire"*v&eacute;e##ens',
+    '$!u""wa!"ke!#lan!-oad-balancing$\'bearing#\'m-based#"ne")cal-level%+ly-produced##hes#)k-picking%\'to-lock$"it$\'speiser',
+    '"%ehnis##rch"&g-fire$\'rolling#(ic-based"$izos"$kata"&mbardi("an#$nitz"\'ndinium#/g&rehy;standing$%-jump%&sleeve&&talked',
+    '$#fin$$haul%$ills$$legs$$mire$%sword$&thorpe$+uet-higgins$&winded"#och##nie""ps"$rcan#&enceau%%zetti',
+    '#&ikeets#!r$"is$&y-park"$scoe#(s-leader$!y""ti#"si#"ty"&ughery%$side#$koum\'!i#$ring',
+    '$%ewort"$vano%#say#&e-knot$%craft$$some#,ing-kindness$#tch##ley"*w-altitude$&growth$%noise$\'protein$$rate$%start',
+    '$#use#$dham#)er-energy&#fat&*preference(#ice&-than-expected""zi!"pc"%w2-13!#sts!"tu"!v!#uan$!g',
+    '&"ki$\'vitcher#!e#%ianka"\'carotti$&sfilms#$iani#&khurst"#des#!u#&vigsen"%hmann"%ikens"#jan")kasiewicz',
+    '")mber-room#&inesce##par"#nae#(ch-table#$gern""pu"$ssac")teinizing""vs",xembourgeois#"on#\'ury-car"!y#%endyk',
+    '!#win!$x-80!%yalin"\'comings$#pod""go"%mbery#!n#"on#\'ph-node%&okines"%nches#$skey##xes"\'re-bird',
+    '#!e##ias$$ppus##tra 1m&eacute;m&eacute)-zi&egrave;res"(ouml;nch"*uuml;llers\'%nchen!#-50""60"%maddy"&series!"14!"31',
+    '"!5!"90"!2!,a&ntilde;ana"$amur#&strich(!t"%berly#!i#!o",c-compatible#&erated#*hine-based(%tools$!t',
+    '$"is#,ro-molecules%#bes"\'d-house#*e-to-order#"in$"un#"og#&richim#)zimbamuto"&ezinha"$fgal#$ulke""ga$#zin',
+    '#&harian#$inco#%napop$!i%&ficats#$rath#&saysay#&ureanu"%habad$$mane$!t##oud"\'iduguri#&l-shot$#com',
+    '$!s#(nlanders$&street#"rs#&semore%!y"$jabr#!d##eed#%orite")kebelieve$"ms$&rstoun#$rong"\'labsorb',
+    '#$eesh#%gosia##ima##lam#"os$!u#%pighi#%treat#$ynes""mc##oru"*n-carrying$&hating$#man#\'ageware',
+    '$"li$!n%$dafy#$dell$"la%%ikova$!o$$resh%#ika#"eb##gel%!n$$nall#(ichaeism$#gat',
+    '##nie$!s##que#%rique#%soori#,tel-haenszel$$ises$%ovani#%ucher$%eline#%yfold"%panje#!i$#nfo#$uche',
+    '".r&eacute;chaux#%anhao%&taceae#&chetti%!i%"on$$ovic#$dood##gay$$hera$%rethe#$haba#%icone$$nara%%eland',
+    '\'!o#(k-dollar$#azi$!e%&t-room$"le$#man##led$#oes##mon#&ochnik#\'prelate#\'shalite$&iliana#&tinets',
+    '&"ic&"on%"us#(yborough"0sculine-feminine#$etto##hes$#req#!i#&k-face##nun#$sada$&ereene%"tt$#vac',
+    '\'%mason$#ino$$odon%"id$\'urbates"\'tallana#\'ch-ball&%maker##era%,ialistically#)hematised$%iesen$$urin##lin$$odge',
+    '&#ide%\'lineage%%monio%!s##sui##tan%!r$%eotti$$hieu$#son##zel"&udslay#"gh##pin#"ri',
+    '""we""xe$!n#%field#"is##min#"us"%yella##ola$#rga"&zaruni#&manian!$bayo!(calpines"(donald\'s',
+    '"(phersons!#del!+eadow-sweet#"n-$$ing\'#(t-market%$safe")bendazole"(chanicks\'(sm-based#!u$!m"\'dbourne#$calf#&iastar',
+    '(#zed$/terran&eacute;e$(um-speed%!s"%erkat"&gabuck$%games$(losaurus"\'hetabel"%idner##jer#(llassoux#"ne"+lachusetuck$\'nchthon',
+    '$"yu#%bourn#&chiori#&eagris$$ndez#"ms#$nick"2mber-of-parliament#$olog$!n$+ry-resident#%sahib"%ndham##ges#$love',
+    '#%tasti#%uires"-phistophelean"%rcery$"kx$)y-killing#%egill$$head#%idith%"or$"ll#$pati#(seystyle"$sdag#%olect',
+    '#)sage-form$)enger-rna$#kit"\'ta-data&(eduction$(bolizing$\'l-based&$work%%craft%$head%-lgesellschaft#"el$)r-reading#*handianone$&edrine',
+    '%\'sergide#"on#$ro-x%"hm"$udon"&xicano(!s!"g."!i!$hill!#ic.#%halek$#ies#$keys$&legate',
+    '&&wright#"om#+robacterium&$eads%+crystalline%%drive%1electronics-based%(habitats%$lite%#pal&*hotography&$late&*ropagation%&sleeps&%parcs',
+    '%(viewdata"\'d-1840s&*th-century%#975&"81\'!5&*th-century$$blue$%green$+ocean-ridge%#xon$3seventeenth-century%#ole$$tour%0wentieth-century',
+    '##ian#%stage"$emie"$g-15""ha$"ma"#jas""ko$!n##uni"%lenci$$post#$ican%!e$#tsa',
+    '%%float$!o#(l-school$%house$#i-q%#ard%$gans##osu#%stein"*meographed#$ulus"#nar$#shi#)dboggling$!e',
+    '$"ra#\'i-break%&summit\'$rvey$$step\'*r-resident$#van#&nehoma#%qarah#\'strelsy#&usinsk$)te-taking##yan"&racula$#mar',
+    '",s-recognised$)specified\'%lling$&timing##bah#\'canthus$*hief-maker#%filed#%htake#&judges#"ka#)labelling%$ying#&priced#&quotes',
+    '$\'eported#(solonghi%!n$$pell(!s#&tuning"#tsi$"on")xing-bowl#$tard$!e"&yamoto!#kiv"!s!)ladenovic',
+    '"!d!"ma"%mmmmm""pi!#nam!#oac"(b-handed#%erley#)ile-phone",d&egrave;les#%elgen$!r%*n-sounding#(iglianis#0ule&mdash;access',
+    '"%hmand"%idart#*s&eacute;s""ki"(le-woman$!n##ino$"sa#"le##ony"%mcilo"#nar#&creiff)!e#$davi',
+    '$"y-&)no-object%#box%&making%&savers%$wise#\'key-boy##now#"os#\'tagnard%#lto%%namar&#ist&"us$.b&eacute;liard',
+    '%!u$$joie$+morillonite#&umenta"$odys#!g#!l#%ncult$!e$&rakers#\'rsfield$$tsel#$ting"\'ravcsik$*z&aacute;n',
+    '#%cambe#$esco##ire#$laas#$ndun$!e$\'ingstar#$phet%$osis#$rant$$occo#!s#.tgage-interest$!y##ven',
+    '#&cavisi#!h$#ing#%spark#)t-watched"+ther-church\'&fucker\'\'of-five&*f&mdash;er#$ilin#*or-cruiser%#lux##tle##yer#&zfeldt',
+    '#\'hamedou#$laye$%dered%$warp#$ncey$\'tebanks&!r%$fort#*squetaires$\'sorgsky$&tachio#!t$)hbrooding"!v#$e-on',
+    '$\'ng-iron"$wrer"$xley"$yard#!o"#zer!"pi"$x-32!"ta!#uan#%wiyah"!c#-h&rehy;needed$(-debated\'%sired',
+    '#+k-spreading$"no#/opolysaccharide")d-covered$&filled$)wrestling#!a$&liyars#%dlers#%larks#(skippers$%lides"$elle##rta"!f',
+    '#\'undishi"&g-shot#"gs#$shot"#ise"(jahadeen%"id#!i#&uthaba"(karovsky"&leteer#&liners#%raney#(ti-armed&$disc',
+    '&%sport\'%ystem&\'tracked&(unionism&)windowing%#buy%%fibre&#old%#gen%*lateralist%)parameter&\'le-copy)\'warhead*#ord%)racialism',
+    '&&ubunit&%ystem%%track#!u"(m-of-two"#rch#&dstone#!l"%schel$*le-wasting&%bound&#man$#osa$$ulus##hed',
+    '#&icales%#hip%!i$!l#.lim-controlled#(selwhite%$nden#+zertechnika"3tation-accumulation("es#"ht#$iara#(ton-chop"&zaffar($abad',
+    '!$w(b)!#x-3"!e"!r!)yddlewood"&hrvold"%nours"(opotamus#%sotis"#rie#&obalan#$tles")tholmroyd"*xocyprinus -n&aacute;jera',
+    '"/eacute;gociants!%\'dour"%roses!(-nitroso"$type!#.g.!#100"!7"!9!!8!&a-dene""aa""bc##urn"$cion',
+    '""ea"!f##fed"\'gacoils$"sh"&hdatul#!t"#jah"$lder"&mangan#$biar#&e-tape"(nosecond$*technology#"us',
+    '#"pa$"er"$qqar"+rc&iacute;s$$isse\'#ist#%endra#\'komnats#)ozhilenko#(rativity##ses",sal-directed#&serite#%ution"$tely',
+    '&!-&*ally-known+*recognized#%power##ros#%tered""um"#var%#eno#&igates##jot!#cet""nb!$eaps#0r&rehy;certainty',
+    '".boz&iacute;zek"*crophiliac"#eme"&idhart#"th"&mausus""o-$\'fordist$+imperialist"$reid"\'st-site"\'therbow&%cotts&&lander"%udesk',
+    '"#ven##itt"$wcut#"ey#)ly-signed#&papers#)s-theatre$)gathering$%hound$%lines$-paper-reading!$gola!#hao""ic!$iapa',
+    '"/carag&uuml;ense##ols")ght-nurse&#owl&&vision&%watch%$bird&$reed"+kolaikirche""lo",ne-under-par$!z#"on"#obe"#ssy',
+    '#%claim#(of-weeks##sex$$ugar#,through-road"%dform"$ires"#mex##ina&#tor"\'n-aryan$,cohabitation&+mprehension&*nservation\'*tradiction',
+    '%\'unction$(identity%%mpact$#jew%-usticiability$&lawyer$$male&!n%%ining%$oney$&oracle%$wner$+proprietary$\'reading&(petition',
+    '$$skid$%theme%*ransposing$(unionist#*conducting#+destructive#\'smoking#%viral"%raday#$disk#"m\'#-th-north-west#*wich-based"\'se-dive#!s',
+    '"\'t&mdash#!\'#%-life##ams#%hing\'"%valis#$enco#)orossiisk"%wacki!"py!#rdc""po!$scdc"+engiyaremye"!v',
+    '"%groho"!i"%rofen"&t-tree#%ricia!!x!%yanga"%comed##tea!#zsa )o\'shanter!&akdene!+bjectmaster!\'cculobe"!p',
+    '#(oberfest!#dio"#ulf!$emed!$ffed#&icered%"io"!i!&ggetti"$lala""wr!#hly"%machi""ps!*il-burning',
+    '$(refining$$seed%$pill!"k."%ahata!1ldest-established#(y-worldy"+e-christian"(ive-drab$!i"%liver!\'mphalos!&ne-car$&member$%place',
+    '$&street#%simos"\'looking""t\'!%odbms"$hing!%p-art"#cas"+en-learning$&minded$#tec"%ining%#on\'"$tica$"mi',
+    '#!o!&rderit",iental-style&!e"!k#!s"$owan"\'r-ewing!$sart"!g"$here"!l"\'manczyk"#sia"\'trander',
+    '!&ttaway!&ughton"%seley"%t-gun$\'of-body$%to-in$\'weighed#%class#\'flowing#(reaching#\'selling#$wash$#ood!,ver-breeding&%udget',
+    '%%grown%(identify&\'ndulged%&loaded%\'made-up%)processed%%reach%(stocking\'(retching$(building$\'drawing&#ess$\'express$%flown$\'learned',
+    '\'$tect$(sleeping%\'pilling&$read%)timulated&$rain*#ing$#top#!x!%wings!%x-bow"\'borough"\'enholme"(onienses"#rad',
+    '"#ric #p64!"72!"95!*achysandra#$ione#)kage-deal$#in\'"&dovani""go"*int-effect##ute"$keha"*le-looking$/stinian-israeli',
+    '#&ladius#%ombes#$sied#&udrine"-n-nationalist##ada$\'marenko%#sat$#via#%caked$&reases#&krates#\'slavist#,tominteatret"*per-backed',
+    '#!p$"us"+ra-hyponymy$(metrised$$sene##eil$$nted#%isina#&khouse#$naby#$oled#\'sonages#&t-song$0icipant-observer%!t',
+    '"&schero##has"(t-a-cake#%ch-up#&issier#"ri$&onages#)tern-note$$hana"$ufer"#vic"%w-paw#(nbroking"%xmans#!o',
+    '!$c-12!$ds-3!+eak-to-peak##rch$!y#)t-covered"#che"(diatrics"%e-wit#"ks"$ffer"\'g-board"*isistratid"$lves$(ic-floor',
+    '$!s#!d#*icillamine#$rhys#$shaw$"ke#\'tagrams#&venton"$plow#\'per-pot&#ami"&r_diem#&fusing#&gamene##ret',
+    '#.s&eacute;phone"&trakis$$ucci#.ty-bourgeoisie"-ugeot-citroen!&haedra"&elpses#0nol-formaldehyde"+iladelphian$&ishave$&ometor"&oenixa#%rmium#(to-essay&#fit',
+    '%%cards%$type"+ysical-care!Di&mdash;submit&mdash;a&mdash;package"#cao#$card#"ta$!i$)ure-frame"1ggy-in-the-middle%&backed##non"!j"$king"#lat',
+    '#$sdon"#men""n-$%money$$tuck#%chin\'#%naces"*obaireachd""qr"%schel"%tztal!&lacide#(giarists#&narian$\'emaking',
+    '##tte&(ndolomit#%y-act("or%$time%%world$#nes$$safe$%write"*exicushion"&ighted"$onks##oms"&uckers#$nked',
+    '#\'perfect"#ysu!"mi!.o&eacute;tique"%chala$"in"&gosyan"#hrt"$ires$#ier"\'lacolor#\'e-vault$$nier#+ice-station%"y-',
+    '$#zei#&lexton%!y$$itts#%troon#(ychromed)!y%"ye$+mer-polymer$%zalus"%maded$%nders#"be#%miers"%ndick',
+    '$!y#+tneddfechan"\'oh-pooh#&l-side""pa#"ek#!p#"sy"&rtaloo$%madoc$(oferraio"&seuses#-ix-compliance#&t-1800\'"68',
+    '%\'banding%#hoc%0second-world-war%\'testing$%dated$"le"%t-man#(terspury&(y-making"#uty"6well&mdash;pressburger$&r-dive&&saving%&master"\'zzolana',
+    '!3r&eacute;paratoires"%ainha#\'sutagus#%tique$"ts"&e-1800$\'booking$+conditioned%%ubist$%event%(xistence$(ignition%)nvestment$*revolution#&booked',
+    '$)onfigured#*dator-prey$&ecease%)termining#"gl#\'heating##iss#$jean##lim#&missed#&ntisse#*ss-cutting%$mark%%tream$\'tressed',
+    '"%ibnow#!e$$sted#*matologist#*nce-bishop#\'or-year#$zing""oa#%blem\'#\'culture#)duct-line\')ion-based#/fessional-style\'#ore$$iler',
+    '#)letariats#)perty-led$!p##tec##vis!0seudo-individual\'%penis&$pods"(i2-dcneo%/nipenv5-derived"-ycho-analytic&(analysed!%uckle"+dding-basin#"im',
+    '"&lsates#&verize"#nan#!g")pil-pupil"$reed#%fling#$pled""sd#*sy-footing"$t-on#%talam!%yrgos#)idinoline!#zpr',
+    '!"rf!"sy!(u\'est-ce",ad-processor#\'lifieds#*rter-light\'\'pounder##si-"#ene#/stion-answering%#ore\'!s"%ierzy#$nnen$"to',
+    '$$inal$\'rinelle -r&egrave;gles")uuml;cker!/74(1&ndash;136)!(abbinate$"uh"#cah#&zynski"\'ffaelli#"ik"+ggle-taggle#*nar&ouml;k")in-making"%jputs',
+    '#)otonirina""lt"$mbos#!i$!e#"my##one#$rods"\'ndomise#\'k-order$"en##tes"\'pe-seed""st"#tti',
+    '"$xaul"%ychem#$ward!,e-advertised$&ssured(#ing#(checking$(onnected#\'derived#(embarked%%itted$*xperienced#*fashioning$&inance$$orms',
+    '#&lining$%oaded#\'mapping#)organized#\'painted$\'lanting$$rint$\'urchase#(routeing#&shaped%#oot#\'vamping";ad&mdash;from&mdash;package#"l\'$#eat',
+    '#-r-wheel-drive#\'ttached"&badged$$ting#\'irthers#(reathing"/cession-related#)iprocates#!k#$urve$%tting""d-$%ochre$$tile#&eposit',
+    '#*iscounting%&solved#%manes#\'pointed##way"&edmace"%fixed#Clected-sound-of-underground-spirits#)urnishing$*s&eacute;s"(gathered#$nier"!h#&anging$$shes',
+    '"$isch$"en#$tman"\'knowned")lativized)#ing#%event#-ief-sculpture"%makes$*nufactured"*ndezvoused$"us##sis"$pack#$etto',
+    '$"st#&rieves$&obates"(questers"*search-led#)identials#(pecified$(onsories#+tauranteurs$"or#)ubmitting"&thread"&vering#(olution\'""xx',
+    '!)heinpfalz!+ib-sticking#+onucleotide$&probes$&typing#%ulose"$cked#(ochetted"$dder$!y#!i")esenhuber"%ffing$#les"(ght-hook',
+    '"$ling#"ly"(nascente&&imento#\'gfenced$%stead#\'ky-dink"\'tualist"&vulare!"ly!,na-replicase!)oad-based%&making#"th"(ck-climb',
+    '"$ddam#)erick-dhu"$hrer"$issy"%llin\'"&manced%(o-celtic##mus"(odepoort#&f-tree#&ksmoor$$wood#%msets##tle"&quette',
+    '"&se-bud$#hip#(icrucian"#tel#\'liegend"\'ubiliac#\'gh-cast#\'nd-neck##sou#&teburn$!s"$wned##ten"%xette"-zhdestwjenski',
+    '#"le"!d#$dick"(ficollis"#ine"%mbler#"or""n-$\'scoring"#pel"&ricius"%salka#$inga#)sian-made"#thy',
+    ' *s&ndash;xl!(\'alright!#(k)!$aami""bc#"ic##lon")cr&eacute"&fenwil#$fery##ire"#ida#(g&oacute$!a"$lien',
+    '$"go##lay#*monberries#$ving")maraweera#%osata#$sara$#tag"\'nd-spit$(blasting$$ling##gue#$ouko#(t\'angelo$"en',
+    '%"ni$$rock"$phir#%ienza#%phics#(rolegnia"\'rmiento##nia#)ong-style#$tini"$sine#"si$!o"(tyagrahi$%ricon',
+    '#+sage-making\'$meat#$teed"&wbills#%flies""xa!"ba##rro""sa!(cagliose#+ndalmongers#$redy$%ified"\'haeffer$"ff',
+    '#$ober",ientologists#(r&eacute$$occo"$olar#$rpii#&tchman$&scraig"$rabo$&p-iron#&eamin\'$$w-in#*ub-covered"+ulpitecture#$tage',
+    '!(d-scicon"!u!#ea-$#dog$%shell%$tory##dog#$lift".cond-by-second\'#leg\'$team")dan-chair$$ting"$ekie""hr',
+    '#&gniory"\'jnowski".lf-abandonment&%ction%(betrayal%)certainty&)ompletion%+deliverance&&islike&*ramatising%*enrichment%(learning%*organising%)published%)replicate',
+    '&\'otation%$seed&&upport%(teaching&\'raining##lin##way"$mble#)i-quavers%(recessed%)socialist$"no$)permanent$%ramis"$ptem',
+    '#$cial##ein#&ialise$*es-voltage$)ous-faced#"na#)vant-girl$$ice\'%\'ng-girl"#tty"$urel"+x-education#%ualis("ed!#fax',
+    '!%habab$#bos#\'ke-down%"up$"ti#+llow-minded#$msul#\'nkarrao#%rlott#%ttock#!z"%ebeli##did#!f#%ilagh',
+    '%#ons$\'f-grips$(lshocked#"ol#$pher#!y"#hhh"(iatsu-do#\'llelagh#$mizu#\'p-based$)tonthorpe$$ways#(rehorses$)t-waister',
+    '#\'ctector#"ed$&horned#"on#(p-keeper%$talk$!e$%girls#(rncliffe$%tterm#%tting#&w-case$&erings")urdington$!e',
+    '#"ss#$t-in$(lingsloe!"ia#"nn"$bele#%irica#&ylline"\'ciliana#&k-room$$ener"\'de-pond$&shoots"$gint##nes',
+    '""la$$ging#$ver-\'%green&$dome"%mbase"%naloa#&e-wave#)gle-sheet)"ot($tage\'\'warhead$%songs""pa"$roni',
+    '"&x-goal$#hit$%metre$#way##ish"%zergh!$kegg"#hod"\'in-side#\'pbridge#+rting-board"%riaig"$ulks"&y-line#$hawk',
+    '!(lap-bang#\'ve-girl"$eary$"th#(epwalked#"ws"&ide-in##med#"nt#&proads!&maczny#%ll-ad&\'subunit%%world#\'rt-arse',
+    '"!i""oo"#urf!$nark""to")uggledown!\'oapwort""ci$*alistische"#dhi"!f#"ie#(t-voiced$#ing"!i',
+    '##ari$$yman#$ider$&torium#&othurn#"va"%mboon#$e\'ow"&natina#&glines#$olux")othsaying"%rbent#$ella&!i',
+    '""th"%ubise#$ghed#)nd-system%&alikes#\'th-side%$bank##zay"*viet-based\'#dra\')sponsored(\'upplied"\'ya-bean!+pace-charge&$ship',
+    '#*rcompilers$"er$&tacist#!w##zio$!z"+eaking-tube##cac$!i%!a%+es-identity$#ked#&edwing#(llbinder"%icing',
+    '#&elmann%!t#"on#)rit-level"\'lendide""oa#\'doptera#(ilsports##kan#(nge-cake##ofs#&tlamps")readeagle"!t"%udded',
+    '""zs!)quatarola#$inty!.s151&mdash;155""ru!)tage-door#+ke-building##mpe#+ndard-based*&earing$"gl#&r-fire%&gazing$#man$*ting-place',
+    '$*us-seeking"&ealin\'%!l$(m-filled#,el-producing#*indachneri#*nnerskeugh$!s#&p-down#\'rnebeck$%otabs"+icklebricks#\'gmatize#)ll-living#$nton',
+    '",ock-exchange&$flow&$room&$take#\'llmeyer#\'ne-clad&&washed%#bow%$chat#%oging$$king#"pp#&rmonth$$ying#!u',
+    '$6ight-from-the-shoulder$%kosha$#tas$(w-filled#(eamlines$#ete$%nsham$$pera#0ictly-controlled$*kebreaking$$nati#\'ong-man$"ps$+zzi-sacrati"-udent-teacher',
+    '#%ermer#$pido"#yes#"lo!(ub-level#"in#(limating$$unar#&merges$%icron#/scription-based"&dreyar""ga$&r-plum"%layem',
+    '"\'n-based#$dews#%kyong"&palite#&er-301%(abundant%&direct%)intendant%%start#\'ply-led"-rface-feeding$!s#&istani#%pised"%tural',
+    '"!e""id"!o##lik!\'wathing"\'eatband#(eping-up$%thope#$ssex"\'ietenia#$lcan$$gate"%otted!&yclone"%lheti',
+    '"!m!+z&aacute;sz"&echwan &t\'have"#ing"%other!$-cut!#.l.""w.!#425!$a\'iz"$b(x)#$arin#!b""cs',
+    '"$ieri"(kayanagi#\'lamakan"%lacre#+ent-spotter,#ing#$i-fu",m-o\'-shanter#"an"%nager#&iguchi#"ni#$waru"#pol##pan',
+    '#+get-setting#"ka$%owski#)macadamed#(radellas"$slan#!m"&ta-box"$vare"+x-avoidance$%based$)diversion$#man$$paid$\'related',
+    '#%icard"$yler"!z!"bo"!x!#dma!)eamserver#(rstained"#che$)nologised(#lgy"&deschi"$epol#!r#+sside-based',
+    '"#gea"*hran-based"\'kxpress"%lebit$%globe$(shopping$$xing"&mgesic#,pleton-brown")n-a-penny$%truck##gku#$ovus##ser"*reshchenko',
+    '#\'ritoire*!s#$zian""sl#\'t-flown"\'trapond!"fe!-h&eacute;orie"%\'know#$must#$want"&anatos#%tches#$vorn"%cream',
+    '$\'sophist##ran$"e-$%mocet&#max"*ick-necked#%essen$$very#\'omersal#$roux$&ty-day#"s-"*ornborough$#son#"u-',
+    '$\'e-chord&%metre&%space&$wood$-shing-machine#+oat-cutting"*underflash"\'wacking"%ynges$!k!$ibor"*cket-booth$#ton"#ddy#&ewater',
+    '")ght-drawn&$rope"#lli"*me-sharing##ken"&n-foil#&ctured#!h#"ta"%p-tap%%oeing",ssue-wrapped"&tivate$"yo!"ko',
+    '"&eholds"%ggled"#hou"&leafoa#&l-gate"(mbouctou#$ilty#"or#"ur"%nging#$king")ol-making$&making"*p-dressing$%order',
+    '##lis"*rch-bearer#&hthelm##kan#&pantau$&edoing#%riano#+toiseshells"&talize")uch-judge&$line##fah#$ngoo##tes"\'wn-hall',
+    '!(rabeated$!i#"da$\'e-based%\'scantia#(ilblazer&&usters$*n-building#%kback#%mming##ns-&(splicing%(aminases%(itioning%&locate',
+    '#$pold$$rain",easure-trove\'#ing#)e-covered%#top$!d$#top#\'llising#)ngwainton#&sadern#&vethin"(ichonema#&dacnid#*gger-guard',
+    '#*nit&agrave#$olet#)ple-bogey#%quint#%stano"#oia#$lled#%ughed$(v&eacute##ves#\'welling"&ue-kin#)stee-heir"$yall##gve',
+    '!#sui#$rumi!\'uberose"$cana#$kers"$enda"\'ff-link"%griks"$llow",morigenecity"\'na-fish#"ze".rbo-alternator%$meca##kes',
+    '$%bulls$%piked#"ok#$pins#%siops"\'shielaw##sie"+y&egrave;re!%vrtko!$wick#&grealm"&o-axis$#box$$cell$(over-par',
+    '$$test#%penny!$ynes!%zakis $u(t)!"ap!#ber!$chte!\'garitic""ta!%kepra!*ltra-cheap%$care%&fleece%+nationalist',
+    '"!v!#mid!\'n-hyong",affectionate"\'der-arm&\'dressed&(prepared%$bank%$felt",embarrassing$)ployables"&giving#"or#\'rudging"#hip',
+    '#"ca$#omp#$path#+versalising#,x-on-windows"\'namable"+patronising"*scriptural#"et"&taxing#!i#\'rusting"(wearying$"pt!%p-end',
+    '")regulated!)rbanbuild#!e"%engoi"#ran#$utia!(s-german#(japanese"#aac"#car"/er&mdash;access+\'details""mc"$sing"#ted',
+    '!"tc"#eem!#vaq &vaadad"+cuum-braked"&ldivia##ero$#ted#%iente#$mont#\'orizing#&proate#)ve-driven%!d"*nderaerden',
+    '$#hem#$pack$"ro""sa#)ectomized$%lines##sar")udemanges#%nting!"ch!#eep"-l&aacute;quez"&nedikt#!g#!o',
+    '")rbalising$#eek##ein#\'million#\'nissage#"ry#\'sifying#"us"#spa"%teris#$iver"$yrat!-ideo-cassette"#ent"!k',
+    '#.lase&ntilde;or$(efranche"#nay##hos"+s&eacute;an#"se#(tavision$"ec"(tazoslav#!h#!i#"ty"#van#%errid!#kpb',
+    '!#nup!\'obiscum"\'ice-box##les"%lcane#,vox-devt9000"$nadk#"jy!)p16-rap74"!i!"se"!w!(ulpecula!#xmp ,w&uuml;nsche',
+    '""v.!%achet##ker"(ffenruhe"-ge-bargaining%-determination%&packet"#hoo")ldergrave#)king-tour#&l-eyed$%fisch"$ndel##ger""r\'',
+    '$\'related#$bles#$dair#*ning-light#(r&eacute$#ent$!i#$sash#$tski"-ste-treatment&%water%%water")ter-melon&$rock&$worn',
+    '%%craft#"ty"&vendon"\'y-leave$\'station"#zir!#cml!\'eather-\'\'proofed\')stripping"*ed-covered%&killer#/rstandsbeweging"&lchman##ker',
+    '%*rehy;being*+intentioned*%known$(-painted%+represented%%sited&%pread%%water#%schen"$ntry"$rman#$nher"/stern-sponsored\'%izing$#ies',
+    '$$ness!#ha\'#&nganui#,tchamacallit"(eel-less"(ile-loop#&nchats#\'plashed)!s$$tail##sht$"py$*tle-blower#%tcher$&ehurst',
+    '$#mee#\'zzy-wig""o.#%oshed!$icca"(ddershin$#ups#%e-out#\'owmaker")fe-killer"(ldscapes#"is#\'liamses##mer#%sonii',
+    '"&nckler#%diate$$sock#%e-bar%&cellar#+g-commander%&mirror%#pad%$root#"ny#%slade"+re-brushing#6tschaftsb&uuml;rgertum"&staria"%tsken',
+    '"$vout"%zzard!#kpr!,olf-whistled$%child#!s"*man-hating#$bats"$ndow"&odcape&"re$(en-faced#!h##mph"&rdbase',
+    '$*er-peasant"!s"$uldn!"pb""cs!\'reathes"(ightsman"(ong-doer!%tterc!"ue""ko"\'nderbar&$lich!"wi!%ybrow',
+    ' &x\'pert!&-based"*efficiency"&height!"ia"#dan!"ns!#off"!n!+p&ndash;59a!&remote!$term &y\'have!$-ray!$abud',
+    '""lu""wk!"cl!#eat"\'dinstvo"%ravan##mak")ster-year"&w-tree!"id!$oash""ld#%kfolk"\'shikazu%!o',
+    '"#mmo!!w!"zr .z&aacute;polya!&agorsk"#lim"!r"!w!#ctu!%eider"!r#)o-gravity!"hi!%inger#!o',
+    '#&ophone"(ologique"%stera!%schau!#wei',
 )
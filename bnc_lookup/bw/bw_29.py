@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_29 = (
+count_29 = 6694
+
+heads_29 = (
     '&aelig;lfm&aelig;r',
-    '&aelig;thelm&aelig;r',
-    '&bull;the',
-    '&eacute;conomique',
-    '&eacute;cueil',
-    '&eacute;tudes',
-    '&frac12;-year',
-    '&mdash;really&mdash',
-    '&mdash;something',
-    '&mdash;such',
-    '&mdash;yes',
-    '&ndash;5',
-    '&ndash;6',
-    '&ndash;e',
-    '&thorn;ingeyri',
-    '\'59',
     '\'74',
-    '\'78',
-    '\'80',
-    '\'are',
-    '\'gain',
-    '\'nothing',
-    '\'p\'',
-    '\'twould',
-    '-h',
-    '-ism',
-    '-n',
-    '-nitro-l-arginine',
-    '-tun',
-    '1&ndash&frac12',
-    '1.6p',
-    '10-ton',
     '100-rouble',
-    '10am-4.30pm',
-    '10base-2',
-    '11&ndash;7&ndash;8&ndash;4',
-    '11-times',
-    '11-track',
-    '1230s',
-    '125-mile',
-    '125mm',
-    '15-degree',
-    '150-seat',
-    '17-day',
-    '17-match',
-    '17.1p',
-    '17in',
-    '18-country',
     '18-pounder',
-    '1919&ndash;25',
-    '2&mdash',
-    '2-dg6p',
-    '2-hydroxyethyl',
-    '2.0-litre',
-    '2.9-litre',
-    '20-valve',
-    '200s',
-    '22-goal',
-    '23-nation',
-    '24-page',
-    '25-hour',
-    '2cg342&ndash;02',
-    '3-axis',
-    '3.25p',
     '30-hour',
-    '30-plus',
-    '35-member',
-    '36-page',
-    '365-day',
-    '4&ndash',
-    '4-asa',
-    '4-metre',
-    '40-watt',
-    '430-seat',
-    '45-member',
-    '50-seat',
-    '500-metre',
-    '52-member',
-    '59in',
-    '61&ndash;3&ndash',
     '7&ndash;8pm',
-    '7.62mm',
-    '70-',
-    '700-mile',
-    '750ml',
-    '80mm',
-    '90-foot',
-    '95-day',
-    '9jp',
-    'a-begging',
-    'a-buzz',
-    'a-forty-eight',
-    'a-l',
-    'a-plus',
-    'aaaaah',
-    'aad',
     'aag',
-    'aahh',
-    'aang',
-    'aase',
-    'abdala',
-    'abegglen',
-    'aberffraw',
-    'abingdon-based',
-    'aboff',
-    'acard',
-    'acaus',
-    'acesita',
-    'achmed',
-    'acia',
-    'acid-etching',
-    'acid-house',
     'aco',
-    'acstt',
-    'act\'',
-    'actioning',
-    'activ',
-    'acupressure',
-    'adages',
-    'addiston',
-    'addo',
-    'adge',
-    'adjourns',
-    'adjudge',
-    'adlestrop',
-    'adomn&aacute;n',
-    'adria',
-    'adzing',
     'aelian',
-    'aerad',
-    'aeshna',
-    'afforest',
-    'affrighted',
-    'afghani',
-    'afms',
-    'africander',
-    'after-theme',
-    'afterworld',
-    'agathe',
-    'agecat',
-    'aghajan',
-    'aghazadeh',
-    'aghredien',
-    'agnate',
     'agreement-marking',
-    'aids-defining',
-    'aiginetans',
-    'aime',
-    'airikkala',
-    'aitc',
-    'akanthos',
-    'akarnania',
-    'akela',
-    'al-ahmar',
-    'al-habobi',
-    'al-ko',
-    'al-said',
-    'al-umari',
-    'alarp',
-    'albusate',
     'alcmene',
-    'alde',
-    'alderwood',
-    'alenia',
-    'alices',
-    'alisa',
-    'alisjahbana',
-    'alkmeonidai',
-    'all&eacute;es',
-    'all-aluminium',
-    'all-dayer',
-    'all-providing',
-    'all-sky',
-    'allaire',
-    'allerce',
-    'alliance\'',
     'allied-occupied',
-    'allured',
-    'allweather',
-    'almirante',
-    'alpin',
-    'alric',
-    'alsoe',
-    'altovar',
-    'aluminised',
-    'alverton',
-    'amante',
-    'ambroise',
-    'ambuscade',
-    'amhurst',
-    'amigas',
-    'aminophylline',
     'ampler',
-    'amplex',
-    'amsterdam-based',
-    'ana&iuml;s',
-    'anabasis',
-    'anala',
-    'anchorlite',
-    'ancien',
-    'ancilliary',
-    'andalo',
-    'andaluz',
-    'andorran',
-    'anencephalics',
-    'angara',
-    'angier',
-    'anglicising',
     'angoras',
-    'anhui',
-    'ania',
-    'animal-lover',
-    'anither',
-    'anjouan',
-    'ann&eacute;e',
-    'annalen',
-    'annas',
-    'annum',
-    'annwn',
-    'anounced',
-    'ansoff',
-    'anstruther-gray',
-    'antartex',
-    'antartica',
     'anteroposterior',
-    'anti-arab',
-    'anti-collectivist',
-    'anti-elitist',
-    'anti-female',
-    'anti-phase',
-    'anti-radiation',
-    'anti-stress',
-    'anti-toxin',
-    'anti-utopian',
-    'anti-wabi',
-    'anti-welfare',
-    'antibiasing',
-    'anting',
-    'antitumour',
-    'anu',
     'apbc',
-    'appelt',
-    'appiah',
-    'aqc',
-    'aquamassage',
-    'aquaplaning',
-    'arabe',
-    'arachidonate',
-    'arag&oacute;n',
-    'arapesh',
-    'arauca',
-    'arbitrates',
-    'arbutus',
-    'arcevia',
-    'archilochean',
-    'archpriest',
     'are-',
-    'arechaga',
-    'areopagitica',
-    'arepp',
-    'argenta',
-    'arghh',
-    'aristoxenus',
-    'arj',
-    'arm-length',
-    'armalyte',
-    'armee',
-    'armenti&egrave;res',
-    'armilla',
-    'armorican',
-    'armour-glass',
-    'army-issue',
     'arp&egrave;ge',
-    'arri&egrave;re-ban',
-    'arrogates',
-    'arslani&aacute;n',
-    'art-history',
-    'artevelde',
-    'artwatch',
-    'arva',
-    'asam',
-    'ascendent',
-    'ascroft',
-    'aserbine',
-    'aset',
-    'ashgill',
-    'ashmount',
-    'asian-owned',
     'askoli',
-    'asom',
-    'aspected',
-    'asperges',
-    'asrog',
-    'assa',
-    'assez',
-    'assitant',
-    'astro-turf',
-    'async',
-    'at-home',
-    'atbc',
-    'atlantean',
-    'atlee',
-    'atomising',
-    'atpases',
     'atriom',
-    'attrib',
-    'attwater',
-    'aucuba',
-    'audiotex',
-    'audry',
-    'austerfield',
-    'australes',
-    'australia-based',
-    'authentic-looking',
-    'auto-da-fe',
-    'autumn-winter',
-    'avait',
-    'aveline',
-    'averoff',
-    'aves',
     'avestruz',
-    'avmd',
-    'avnet',
-    'awhirl',
-    'awm',
-    'axaf',
-    'axps',
-    'aylesham',
-    'ayme',
-    'ayoreo',
-    'ayuntamiento',
-    'az',
-    'azem',
-    'b-29',
-    'b-d',
-    'b-dna',
     'b19',
-    'babanaft',
-    'babba',
-    'babbidge',
-    'bacau',
-    'bachem',
-    'back-',
-    'back-alley',
-    'back-to-school',
-    'backflow',
-    'backgrounding',
-    'backrests',
-    'backscattered',
-    'bactericide',
-    'badmouthing',
-    'baerman',
     'bag-snatching',
-    'bagatelles',
-    'bagno',
-    'bailer',
-    'baillon',
-    'bajamunde',
-    'bakhtiari',
-    'baklava',
-    'balbi',
-    'balgreen',
-    'balint',
-    'ball-gown',
-    'ball-handling',
-    'ball-winner',
-    'balletts',
-    'ballsy',
     'ballybofey',
-    'ballyboley',
-    'balsams',
-    'bamboozling',
-    'banchieri',
-    'bandicoot',
-    'bandstands',
-    'bank-clerk',
-    'banson',
-    'bar-restaurant',
-    'baragumu',
-    'barba',
-    'barbarina',
-    'barder',
-    'bargeld',
-    'baronetage',
     'barril',
-    'barrowed',
-    'bartolinis',
-    'bashley',
-    'basket-case',
-    'basket-work',
-    'baskin',
-    'bassy',
-    'batac',
-    'bateleur',
-    'batoned',
-    'battle-line',
-    'batwing',
-    'bazz',
-    'bcig',
-    'beanfield',
     'beanos',
-    'beardie',
-    'beatin\'',
-    'bechet',
-    'beckertools',
-    'beckonsfield',
-    'becquerel',
-    'bed-rock',
-    'bed-wetter',
-    'beddows',
-    'bedside-table',
-    'bedsitting',
-    'beed',
-    'beeg',
-    'beenstock',
-    'beeslack',
     'beetled',
-    'beevbilde',
-    'beevers',
-    'begin\'',
-    'begrudging',
-    'behera',
-    'beholds',
-    'behra',
-    'belabouring',
-    'belfast-born',
-    'belisarius',
-    'belkin',
-    'bellacasa',
-    'bellanger',
-    'belmondo',
-    'belmount',
     'beloit',
-    'beltoise',
-    'beman',
-    'benaco',
-    'benaim',
-    'bendcrete',
-    'benedicite',
-    'benj',
-    'bensted',
-    'benster',
-    'benzamidine',
-    'benzedrine',
-    'bep',
-    'berbick',
-    'berengar',
-    'berent',
     'berg&egrave;re',
-    'berkheya',
-    'bernardout',
-    'berre',
-    'bertalanffy',
-    'bertolini',
-    'besiged',
-    'bettacare',
-    'betterball',
-    'bevanite',
-    'bewilders',
-    'bezymianny',
-    'bi-amping',
-    'bienenstock',
-    'biere',
-    'big-busted',
     'bigelow',
-    'bigheaded',
-    'biha&cacute',
-    'bikenibeu',
-    'bilbeque',
-    'billi&egrave;re',
-    'billiard-room',
-    'billies',
-    'billmaier',
-    'bimbim',
-    'binding-site',
-    'biohybrid',
-    'biomechanics',
-    'biomonitoring',
-    'biopharm',
-    'birdwatch',
     'bishopstrow',
-    'bit-on-the-side',
-    'bjork',
-    'black-box',
-    'blackberryin\'',
-    'blackden',
-    'blackmarket',
-    'blackmountain',
-    'blacksmithing',
-    'blagged',
-    'blancmanges',
-    'blares',
-    'blasius',
-    'blasson',
-    'bleachfield',
-    'blenching',
     'blinkbonny',
-    'blipped',
-    'blitzing',
-    'blockx',
-    'bloodyminded',
-    'blote',
-    'bloused',
-    'blue-faced',
-    'blue-flowered',
-    'blue-sky',
-    'blued',
-    'blueing',
-    'bluestones',
-    'bluetts',
-    'bluey-green',
-    'blysmus',
     'blyxa',
-    'boag',
-    'bobroff',
-    'boccherini',
-    'boehme',
-    'boggart',
-    'boghurst',
-    'bogshed',
-    'bohill',
-    'boigny',
-    'boissi&egrave;re',
-    'bolden',
-    'bollman',
-    'bolton-based',
-    'bonacci',
-    'boncompagni',
     'bone-shaker',
-    'bonger',
-    'bonin',
-    'bonks',
-    'boogied',
-    'book-printing',
-    'bookchin',
-    'bookwatch',
-    'boom-bust',
-    'boorsch',
-    'boosh',
-    'boot-boy',
-    'booth-capturing',
-    'boozebusters',
-    'borda',
-    'bordari',
     'bornean',
-    'bororo',
-    'bory',
-    'bosque',
-    'bossert',
-    'botanick',
-    'botia',
-    'bottle-glass',
-    'boudjema',
-    'bouet',
-    'boukary',
-    'boulmer',
-    'boultings',
-    'boundary-layer',
-    'bourque',
-    'boutonni&egrave;re',
     'boylan',
-    'bozidar',
-    'bpu',
-    'brackenburys',
-    'brackenridge',
-    'brackish-water',
-    'bracksy',
-    'bradawl',
-    'bramcote',
-    'bramleys',
-    'branflakes',
-    'brass-faced',
-    'brassington',
-    'brattle',
-    'brau',
-    'braveworld',
     'brawled',
-    'braye',
-    'bread-basket',
-    'breadmaking',
-    'breasbrough',
-    'breath-test',
-    'brebant',
-    'brecbennoch',
-    'brehon',
-    'brickmaking',
-    'briercrest',
-    'bries',
-    'brinkman',
-    'brinley',
-    'briseno',
-    'brizlincote',
     'brokenhearted',
-    'bronowski',
-    'browgill',
-    'brown-and-white',
-    'brown-red',
-    'browndown',
-    'brubeck',
-    'bruff',
-    'brunello',
-    'brunet',
-    'brunstane',
-    'bruny',
-    'bsc(hons)',
-    'bsc(socsci)',
-    'bsso',
-    'bubber',
     'bucher',
-    'buildin',
-    'bul',
-    'bulgin',
-    'bum-bag',
-    'bunbeg',
-    'bundespr&auml;sident',
-    'bundesverband',
-    'bunjy',
-    'bunt',
-    'bunters',
-    'burbedge',
-    'burbles',
-    'burck',
-    'burdick',
-    'burgtheater',
     'burial-place',
-    'burnaby',
-    'bursal',
-    'bus-ride',
-    'bus-tech',
-    'buscopan',
-    'buser',
-    'business-based',
-    'businessage',
-    'businesss',
-    'butkevicius',
-    'buttertubs',
-    'butterwood',
-    'butterwort',
-    'buttery-hatch',
-    'byram',
     'c&iacute;vica',
-    'c\'mere',
-    'c-141',
-    'c-2',
-    'c-drawer',
-    'c-pillar',
-    'c014',
-    'c15',
-    'c3800',
-    'c3s',
-    'ca-db',
-    'ca-whoo',
-    'cabanas',
-    'cabezon',
-    'cabrita',
-    'cadeau',
     'cadhay',
-    'cadpr',
-    'cake-cutting',
-    'calderpark',
-    'caldwells',
-    'calendered',
-    'calgon',
-    'calkin',
-    'call-net',
-    'callot',
-    'callovian',
-    'callpath',
-    'cambozola',
-    'camelia',
-    'camerat',
-    'camp-follower',
     'canadian-style',
-    'cancer-inducing',
-    'cand',
-    'candle-holder',
-    'candyman',
-    'canice',
-    'canol',
-    'cantade',
-    'cantaloupe',
-    'cantilena',
-    'canus',
-    'caol',
-    'capco',
-    'capensis',
-    'capitulates',
-    'caplans',
     'caprotti',
-    'car-ferry',
-    'car-maker',
-    'car-racing',
-    'car-sharing',
-    'carabosse',
-    'caract&egrave;re',
-    'caradog',
-    'caravel',
-    'carburetted',
-    'cardamoms',
-    'cardiacs',
-    'cardonald',
-    'cardozo',
-    'care-giver',
-    'carentan',
     'cark',
-    'carnbeg',
-    'carolean',
-    'carpet-making',
-    'carpet-slipper',
-    'carthew',
-    'caso',
-    'caspe',
-    'cassocked',
-    'castenada',
-    'castling',
-    'cat\'s-cradle',
-    'catalinas',
-    'cataloging',
-    'catchpenny',
-    'cathected',
     'catherine-wheel',
-    'catherston',
-    'catnap',
-    'catnic',
-    'catterson',
-    'cattle-raiding',
-    'cattle-rearing',
-    'caucasia',
-    'cauld',
-    'causevics',
-    'cays',
-    'caythorpe',
-    'ceili',
-    'celibates',
-    'cenju-3',
-    'census-based',
     'centel',
-    'centrally-located',
-    'centre-spread',
-    'centrefolds',
-    'centrom&iacute;n',
-    'cepacs',
-    'ceram',
-    'ceramique',
-    'cerium',
-    'certaine',
-    'cestui',
-    'cetera',
-    'cfc-11',
-    'cge',
-    'chabot',
-    'chaffer',
     'chagga',
-    'chain-gang',
-    'chair-making',
-    'chalkie',
-    'chamberlen',
-    'change-ringing',
-    'changeth',
-    'changin\'',
-    'chanticleer',
-    'chantier',
-    'chanty',
-    'chara',
-    'charcoal-burning',
-    'charnel-house',
-    'chatelleret',
-    'chaus',
     'chave',
-    'chazan',
-    'cheap-jack',
-    'cheap-rate',
-    'checkmated',
-    'cheep-cheep',
-    'cheese-paring',
-    'cherbonnier',
-    'chernousenko',
-    'chevaux',
-    'cheveux',
-    'chhish',
-    'chian',
-    'chiappucci',
-    'chieftaincy',
-    'chifing',
     'chiklis',
-    'chimaera',
-    'chinese-speaking',
-    'chipenda',
-    'chitawan',
-    'chlor',
-    'chloric',
-    'chocolate-covered',
-    'choix',
-    'cholylglycine',
-    'chondaehyop',
-    'chondrules',
-    'chongo',
-    'chonku',
-    'chopwell',
-    'chorus-master',
     'chq',
-    'chretien',
-    'christadelphian',
-    'chromatographs',
-    'chtaura',
-    'churchend',
-    'churching',
-    'ciblings',
-    'cibse',
-    'cigarette-smoke',
-    'cimon',
-    'cine-film',
-    'cinoa',
-    'cips',
-    'circotherm',
-    'circularise',
     'circumambient',
-    'citie',
-    'citrac',
-    'citreon',
-    'cits',
-    'citta',
-    'citymax',
-    'cityside',
-    'civil-war',
-    'civile',
-    'civilianising',
-    'civilisatrice',
-    'clabburn',
-    'clachaig',
-    'class-',
-    'class-action',
     'classicising',
-    'classis',
-    'clayey-silt',
-    'clcc',
-    'clean-burn',
-    'clean-off-zone',
-    'cleane',
-    'clearflow',
-    'clich',
-    'client-server-based',
-    'cliffhanging',
-    'clipfix',
-    'clodronate',
-    'clootie',
-    'closeups',
-    'closing-down',
     'clothkits',
-    'cloyed',
-    'club-foot',
-    'cnidarian',
-    'cns-1600',
-    'co-financing',
-    'co-localized',
-    'co-operative-server',
-    'co-produce',
-    'coal-bearing',
-    'coatis',
-    'cocci',
-    'coco-de-mer',
-    'codlings',
-    'codot',
-    'cogley',
     'cohered',
-    'cohering',
-    'coiffeured',
-    'cold-shouldering',
-    'collio',
-    'colour-printing',
-    'colourfast',
-    'colprosumah',
-    'com-',
-    'comair',
-    'comanches',
-    'combermere',
-    'comedie',
-    'comedy-drama',
-    'comigrating',
-    'comisi&oacute;n',
     'commingle',
-    'commingling',
-    'commission-free',
-    'commodified',
-    'commonly-accepted',
-    'competition-policy',
-    'compost-making',
-    'compression-ignition',
-    'computer-held',
-    'computer-user',
-    'comroe',
-    'comtrad',
-    'con-sec',
-    'conceeded',
-    'concretized',
-    'condensates',
     'condit',
-    'condo',
-    'condoled',
-    'condottiere',
-    'conduced',
-    'conduire',
-    'confab',
-    'confederated',
-    'confessio',
-    'confuted',
-    'congregates',
-    'coniunctio',
-    'conlig',
-    'connaissance',
-    'consensus-based',
-    'conservador',
     'constantino',
-    'contemporaine',
-    'continuous-flow',
-    'contractures',
-    'convalesced',
-    'cooch',
-    'copam',
-    'coparcenary',
-    'coppelia',
-    'coppernob',
-    'coppi',
-    'copy-book',
-    'copydate',
-    'corbeille',
-    'corda',
-    'cordier',
     'coreopsis',
-    'coriatachan',
-    'coriolan',
-    'cornejo',
-    'cornucopian',
-    'corrine',
-    'corseting',
-    'corum',
-    'corundum',
-    'corviniana',
-    'corynebacterium',
-    'cossetting',
-    'cost-cutter',
-    'cost-ranking',
-    'costar',
-    'cottaging',
     'cotton-grass',
-    'coturnix',
-    'couleur',
-    'coulters',
-    'councilled',
-    'cound',
-    'counld',
-    'counter-thrust',
-    'counterpoised',
-    'coup-de-grace',
-    'coupe-coupe',
-    'courteen',
-    'courtneidge',
-    'cow\'s-milk',
-    'cow-bell',
-    'cow-byre',
     'cowart',
-    'coysevox',
-    'craark',
-    'crakes',
-    'cranstoun',
-    'creamy-yellow',
-    'crespin',
-    'creviced',
-    'cricetid',
-    'cricket-loving',
-    'crisanto',
-    'crisis-torn',
-    'crivelli',
-    'crnojevi&cacute',
-    'crocosmia',
-    'crory',
     'cros',
-    'cross-bench',
-    'cross-price',
-    'cross-school',
-    'cross-shore',
-    'crossbench',
-    'crossbreeds',
-    'crosslegged',
-    'crowd-pleaser',
-    'crowmarsh',
-    'croysant',
-    'crrec',
-    'cruddy',
-    'crumplin',
-    'csic',
-    'csos',
     'ctenophores',
-    'cua',
-    'cuando',
-    'cubatoa',
-    'cuckoo-clock',
-    'culture-clash',
-    'cumb',
-    'cup-bearer',
-    'curtain-call',
-    'curtain-making',
-    'cushla',
-    'custome',
-    'customer-supplier',
-    'cuttitta',
-    'cwd',
-    'cwh',
     'cwmyoy',
-    'cyclosporine',
-    'cyh',
-    'cyke',
-    'cynar',
-    'cynsige',
-    'cysteamine',
-    'cytocentrifuged',
-    'd&eacute;bourbage',
-    'd&eacute;mocrate',
-    'd&lsqb;u&rsqb',
-    'd&uuml;rres',
-    'd\'accord',
-    'd-aspartate',
-    'd-channel',
-    'd-influence',
     'd-ring',
-    'd-wing',
-    'd.b.',
-    'da\'',
-    'daein\'',
-    'dagg',
-    'daiquiri',
-    'dair',
-    'dairy-type',
-    'daladier',
-    'dalj',
-    'dallachy',
-    'dallmeyer',
-    'dalphinis',
-    'damage-limitation',
-    'dameron',
     'damps',
-    'daneway',
-    'dani&egrave;le',
-    'danker',
-    'dapsone',
-    'dark-looking',
-    'dark-matter',
-    'darussalam',
-    'data-collecting',
-    'data-ink',
-    'dative',
-    'dauber',
-    'davydd',
-    'day-room',
-    'day-shift',
-    'dbx',
     'dc&mdash;access',
-    'dce-compliant',
-    'dd-dr1',
-    'de-alcoholised',
-    'de-centring',
-    'de-emphasising',
-    'de-emphasize',
-    'de-gassing',
-    'de-mystify',
-    'de-rigged',
-    'de-selected',
-    'deaccessioned',
-    'deale',
-    'death\'',
-    'debbasch',
-    'debendox',
     'debis',
-    'debt-rescheduling',
-    'decend',
-    'deconjugated',
-    'decontaminated',
-    'decoratifs',
-    'decurved',
-    'dedni',
-    'deep-cut',
-    'deep-diving',
-    'deep-voiced',
-    'deepak',
-    'deependable',
-    'deer-stalking',
-    'defb',
-    'defi',
     'definity',
-    'defoliant',
-    'degaussing',
-    'deha',
-    'dehumanises',
-    'deify',
-    'deifying',
-    'deimos',
-    'dejean',
-    'delacour',
-    'delalande',
-    'delerium',
-    'dellorto',
-    'demdyke',
-    'demeanours',
-    'demi-god',
     'demi-tasse',
-    'demijohn',
-    'demythologise',
-    'demythologizing',
-    'dena',
-    'denationalized',
-    'denim-clad',
-    'denko',
-    'denselow',
-    'dentata',
-    'denver-based',
-    'deoxyguanosine',
-    'deparaffinised',
-    'depe',
-    'deputy-director',
-    'deracialized',
     'deracinated',
-    'derailleur',
-    'derange',
-    'deranging',
-    'deregistering',
-    'dergue',
-    'deseeded',
-    'desensitised',
-    'desert-living',
-    'design-led',
-    'deskbound',
-    'dessins',
-    'destructed',
-    'desvaux',
-    'dethroning',
-    'detoxed',
     'deuced',
-    'dever',
-    'devers',
-    'devoiced',
-    'devoicing',
-    'devro',
-    'deworming',
-    'dfcs',
-    'dhanabalan',
-    'dianna',
-    'diccan',
-    'dicroidium',
-    'didion',
-    'digswell',
-    'dijoud',
-    'diment',
     'dimplex',
-    'dimply',
-    'dimwitted',
-    'dinamation',
-    'dingles',
-    'dinkie',
-    'dipabase',
-    'diphthongized',
-    'diplococci',
-    'dipteb',
-    'directoire',
-    'dirkie',
-    'dirt-box',
-    'disarticulate',
-    'disco-dancing',
-    'discolours',
     'disempowered',
-    'dismasting',
-    'disque',
-    'dive-bomb',
-    'dive-bomber',
-    'divil',
-    'divisionalised',
-    'djoussouf',
-    'documenter',
-    'docworks',
-    'dode',
-    'dodoma',
-    'doelen',
-    'doeth',
-    'dois',
-    'dolgoch',
     'dolls-house',
-    'dolmio',
-    'dominans',
-    'dominant-tonic',
-    'dominis',
-    'domjan',
-    'donaghue',
-    'donowa',
-    'doom-mongering',
-    'doos',
-    'dorovskikh',
-    'dorrie',
-    'dorrits',
-    'double-a-2',
-    'double-bed',
-    'double-choral',
     'double-muscling',
-    'double-stop',
-    'double-transformer',
-    'doubly-degenerate',
-    'down\'',
-    'down-the-line',
-    'drage',
-    'drave',
-    'drawed',
-    'drawerful',
-    'drawin\'',
-    'dreher',
-    'dreiser',
-    'dress-making',
-    'dresse',
-    'drk',
     'drome',
-    'dror',
-    'drug-control',
-    'drumchork',
-    'drummondii',
-    'dry-as-dust',
-    'dry-season',
-    'dual-fuel',
-    'dual-launch',
-    'dubber',
-    'dubna',
-    'duck-egg',
-    'ducker',
-    'ductules',
-    'duette',
-    'dufoix',
     'dughet',
-    'dugongs',
-    'dulay',
-    'dumfries-based',
-    'dunciad',
-    'dunnottar',
-    'dunrobin',
-    'durlacher',
-    'dust-bowl',
-    'dust-press',
-    'duty-paid',
-    'dwelling-place',
-    'dybbukry',
-    'dye-works',
-    'dynamiting',
-    'dynasticism',
     'dysfunctioning',
-    'dysynni',
-    'eachuin',
-    'eadnoth',
-    'eadsige',
-    'eammon',
-    'eargh',
-    'early-\'70s',
-    'earlyish',
-    'east-enders',
-    'eating-house',
-    'eating-place',
-    'eau-de-cologne',
-    'eci',
-    'eckhardt',
-    'ecoglasnost',
     'ecolo',
-    'economic-reform',
-    'ecotopian',
-    'ecsp',
-    'ecw',
-    'editio',
-    'editore',
-    'editrice',
-    'effix',
-    'egg-bearing',
-    'eibenstein',
-    'eide',
-    'eiduk',
-    'eigh-teenth-century',
-    'eighteen-inch',
-    'eimear',
     'einar',
-    'einem',
-    'eircell',
-    'eiu',
-    'ejusdem',
-    'electraglide',
-    'electro-optics',
-    'electroanalytical',
-    'electron-beam',
-    'eleventh-',
-    'elgiva',
-    'ellerby',
-    'ellul',
-    'elola',
-    'elongates',
-    'elopes',
     'elsden',
-    'elsom',
-    'embarassing',
-    'emblow',
-    'emmelmann',
-    'emmylou',
-    'empereur',
-    'empty(x)',
-    'empurpled',
-    'empyrean',
-    'emw',
-    'end-of-century',
-    'endhi',
-    'enduro',
-    'energy\'',
-    'energy-requiring',
     'enervate',
-    'englischen',
-    'englyshe',
-    'engross',
-    'engstrom',
-    'enhanced-mode',
-    'ennead',
-    'ensheathed',
-    'ensis',
-    'ente',
-    'entra',
-    'ep(c)a',
-    'epatant',
-    'epicureans',
-    'epmd',
-    'eposs',
     'equatorward',
-    'equity-related',
-    'equivocate',
-    'equivocated',
-    'eram',
-    'eranio',
-    'eraserhead',
-    'erewhon',
-    'ergocalciferol',
-    'eringen',
-    'erks',
-    'errr',
-    'erst',
-    'eru',
-    'erw',
-    'escadrille',
     'eser',
-    'espiritu',
-    'eulogizing',
-    'europeanised',
-    'fecit',
-    'flanging',
-    'francophones',
-    'frogged',
-    'frusamide',
-    'fust',
-    'gambol',
-    'gaur',
-    'giasone',
-    'godling',
-    'grislewing',
-    'guying',
     'gwar',
-    'hadd',
-    'hcset',
-    'hedge-cutting',
-    'herodes',
-    'hocked',
-    'hwange',
-    'hye',
-    'hyperventilated',
-    'iapc',
-    'ibm-pc',
-    'icef',
-    'identix',
-    'imsl',
-    'invaginated',
-    'iow',
     'jassim',
-    'joli',
-    'kenning',
-    'kneecapping',
-    'laddy',
-    'lifewatch',
-    'live-fire',
-    'lma',
-    'lookit',
-    'lopex',
-    'lrsb',
-    'ludlam',
-    'management\'',
-    'microsft',
-    'mini-tower',
-    'miscalculate',
     'mone',
-    'mouli',
-    'multistrand',
-    'naddle',
-    'nescot',
-    'nieporent',
-    'nisus',
-    'object\'',
-    'oeuf',
-    'oeufs',
-    'olm&uuml;tz',
-    'on\'y',
-    'over-75',
-    'over-lapping',
-    'overcomplicated',
-    'overindebted',
     'overinflated',
-    'p&ndash;38',
-    'p\'ij',
-    'p-prd',
-    'pareto-efficiency',
-    'petalling',
-    'piscean',
-    'pixy',
-    'podged',
-    'pondkeeping',
-    'powercore',
-    'precoated',
-    'priem',
-    'professionalizing',
-    'psychologized',
-    'quieting',
     'ravager',
-    're-filling',
-    're-photographed',
-    're-seeding',
-    're-timed',
-    'reacquainted',
-    'rebasing',
-    'reproofing',
-    'resampling',
-    'reskilling',
-    'rheinland',
-    'rheme-theme',
-    'rhetor.',
-    'rhetorex',
-    'rhiconich',
-    'rhine-ruhr',
     'rhino-like',
-    'rhinogs',
-    'rhydyfelin',
-    'rhythm.',
-    'rianna',
-    'riau',
-    'rib-like',
-    'ribes',
-    'ribicic',
-    'riblets',
-    'rice&amp;things',
-    'rice-growing',
-    'rice/gloucestershire',
-    'rich-poor',
-    'richill',
-    'richmond-upon-thames',
     'richter-bernburg',
-    'rickover',
-    'rickwood',
-    'riddarholm',
-    'riddel',
-    'riddims',
-    'ridel',
-    'riedl',
-    'rieger',
-    'riegert',
-    'riels',
-    'rifampicin',
-    'rifka',
-    'rifle-pits',
-    'right-hand-drive',
-    'right-ho',
     'right-y-o',
-    'right-y-oh',
-    'righty-ho',
-    'rigidified',
-    'rigorousness',
-    'rigsbee',
-    'rigsby',
-    'riia',
-    'rilka',
-    'rinaldi',
-    'rinding',
-    'ring-leaders',
-    'ring-necked',
-    'ringfence',
-    'ringland',
-    'rintelna',
     'rio-tinto',
-    'ripuarian',
-    'risbygate',
-    'riscos',
-    'risibly',
-    'risk-neutrality',
-    'risk/benefit',
-    'risk/reward',
-    'rith',
-    'ritornello',
-    'ritz-carlton',
-    'rivadeneira',
-    'rivale',
-    'rivaux',
-    'rived',
-    'rivermouth',
     'riversdale',
-    'rivett',
-    'rivulatus',
-    'riyadh1',
-    'riz&eacute',
-    'riziq',
-    'rl02',
-    'rlc',
-    'rldb',
-    'rlp',
-    'rlys.',
-    'rm-values',
-    'rm400',
-    'rmf',
-    'rnav',
-    'roadbridge',
     'roadbuilding',
-    'roader',
-    'roadmen',
-    'roadsigns',
-    'roamin\'',
-    'roarer',
-    'roarings',
-    'roast-beef',
-    'roasters',
-    'robards',
-    'robertas',
-    'roberts/thames',
-    'robiarivuny',
-    'robin-years',
-    'rocamadour',
-    'rocester',
     'roche-guyon',
-    'roche-lobe',
-    'rock\'n\'roller',
-    'rock-lined',
-    'rock-throwing',
-    'rockclimbers',
-    'rockett',
-    'rockfish',
-    'rockhampton',
-    'rockhoppers',
-    'rockland',
-    'rocklike',
-    'rockpooling',
-    'rockview',
-    'rockware',
-    'rocombe',
     'rocos',
-    'rod-rests',
-    'rodeos',
-    'roder',
-    'roderiguez',
-    'rodime',
-    'rodinson',
-    'rodofinikin',
-    'rodric',
-    'rodriques',
-    'rodriquez',
-    'rodzinski',
-    'roethlisberger',
-    'roffman',
-    'rognoni',
-    'roguishness',
     'rohl',
-    'roil',
-    'roistered',
-    'role-slots',
-    'role-taking',
-    'roll-all',
-    'roll-forward',
-    'rollback',
-    'rollickin\'',
-    'rollocking',
-    'rolltop',
-    'rolodex',
-    'roly-polies',
-    'rom/gypsies',
-    'romains',
-    'romaneasca',
     'romano-christian',
-    'romanshorn',
-    'romanticist',
-    'romanticists',
-    'rome-centred',
-    'romenda',
-    'romeril',
-    'romeward',
-    'rompres',
-    'romualdas',
-    'romulan',
-    'romulans',
-    'roncesvalles',
-    'rond&oacute;n',
-    'rond-point',
-    'rondar',
     'rondetto',
-    'roof-lines',
-    'roof-mounted',
-    'roof-slopes',
-    'rookyard',
-    'room-finding',
-    'roomettes',
-    'roomheater',
-    'roosens',
-    'root-like',
-    'rootlets',
-    'rootstein',
-    'rope-like',
-    'rope-twist',
-    'roped-off',
-    'ropemakers',
     'rosaefolia',
-    'rosalynde',
-    'rosaniline',
-    'rose-gardens',
-    'rose-growers',
-    'rose-patterned',
-    'rose-petals',
-    'rosebeds',
-    'rosebury',
-    'rosebushes',
-    'rosemoor',
-    'roseville',
-    'roshka',
-    'rosi&egrave;res',
-    'rosiest',
-    'rosiness',
     'roslyn',
-    'rosmer',
-    'rossdale',
-    'rossville',
-    'rostrevor',
-    'rotators',
-    'rothkos',
-    'rotovator',
-    'rotproof',
-    'rotundas',
-    'roughish',
-    'roughy',
-    'rouland',
-    'round-necked',
-    'round-shaped',
-    'rounded-off',
     'rousseauan',
-    'rousseauian',
-    'routinisation',
-    'rover/ford',
-    'rovereto',
-    'rowat',
-    'rowboats',
-    'rowbottom/kidlington',
-    'rowetta',
-    'rowson',
-    'rowton',
-    'roxithromycin',
-    'royal-watcher',
-    'rozanova',
-    'rozsa',
-    'rozsika',
     'rp4182',
-    'rpcr',
-    'rpl-11',
-    'rr1',
-    'rrnas',
-    'rs.',
-    'rs/6000-based',
-    'rs200',
-    'rs250',
-    'rs423',
-    'rs6000',
-    'rs63,300',
-    'rsj',
-    'rsnt',
-    'rso1',
-    'rtve',
     'ru&iacute;z',
-    'rubber-based',
-    'rubber-handled',
-    'rubber-tipped',
-    'rubberized',
-    'rubbled',
-    'rubdown',
-    'rubell',
-    'rubem',
-    'rubenianum',
-    'rubescent',
-    'rubettes',
-    'rubicons',
-    'rubicunda',
-    'rubidium/strontium',
-    'rubiginosa',
     'rubina',
-    'ruch',
-    'ruching',
-    'ruchuphan',
-    'rudbeckias',
-    'rudies',
-    'rudists',
-    'ruediger',
-    'rufescens',
-    'ruffianly',
-    'ruffolo',
-    'rufforth',
-    'ruffwood',
-    'rufio',
-    'rufs',
-    'rugosity',
     'ruhengeri',
-    'ruler-straight',
-    'rum-flavoured',
-    'rump-yugoslavia',
-    'rumpelstiltskin',
-    'rumpler',
-    'rumsby',
-    'rumtopf',
-    'run+1rn',
-    'run-of-mine',
-    'run-throughs',
-    'run-times',
-    'runesmith',
-    'running-shoes',
-    'runoff-producing',
-    'ruocco',
     'rurka',
-    'rusbridger',
-    'rusey',
-    'rush-strewn',
-    'rushbrook',
-    'rushcome',
-    'rushers',
-    'rushfields',
-    'rushyford',
-    'rusper',
-    'russell-cairns',
-    'russelsheim',
-    'russia\'',
-    'russian-born',
-    'russian-jewish',
-    'rust-brown',
     'rustication',
-    'rusty-red',
-    'ruthenes',
-    'ruths',
-    'rutstein',
-    'ruwahu',
-    'ruysdael',
-    'rvd',
-    'rw382',
-    'rx6',
-    'rycott',
-    'rylstone',
-    'rythmic',
-    'ryuichi',
-    's&aacute;enz',
-    's&amp;c',
     's&amp;t',
-    's&uuml;dstadt',
-    's&uuml;leiman',
-    's\'no',
-    's-adh',
-    's-bends',
-    's-said',
-    's-sir',
-    's-word',
-    's.1(4a)',
-    's.1(5)',
-    's.1(7)',
-    's.107',
-    's.11(3)',
-    's.17',
-    's.26(1)',
     's.29(1)',
-    's.3(2)',
-    's.3(3)',
-    's.34',
-    's.39(1)',
-    's.64',
-    's.69',
-    's.7(1)',
-    's.95',
-    's.c.c.',
-    's.c.m.',
-    's.c.r.',
-    's.ct.',
-    's.d.m.',
-    's.day',
-    's.f.',
     's.f.a.',
-    's.h.o.',
-    's.harris',
-    's.m.e.',
-    's.s.d.f.',
-    's.w.23',
-    's.w.s.h.a.s.',
-    's/m',
-    's02',
-    's1*w1',
-    's10(2)',
-    's103',
-    's104',
-    's11(7)',
-    's122',
-    's131',
     's14(4)',
-    's159',
-    's1593',
-    's160(1)',
-    's166(3)',
-    's188',
-    's1a',
-    's20(4)',
-    's208',
-    's213',
-    's22',
-    's225',
-    's24a',
-    's267',
-    's29(3)',
-    's3(1)',
     's32',
-    's33(1)',
-    's33(2)',
-    's33(3)',
-    's339',
-    's346',
-    's349',
-    's35a',
-    's37(1)',
-    's38',
-    's3a',
-    's3x',
-    's416(2)',
-    's425',
-    's43',
-    's44(1)',
     's46(2)',
-    's47(1)',
-    's47(3)',
-    's48(3)',
-    's5/s6',
-    's51',
-    's62(2)',
-    's64',
-    's66(1)',
-    's66(3)',
-    's672',
-    's673(3)',
-    's677(10)',
-    's678',
-    's678(1)',
-    's7(4)',
     's73(2)',
-    's743(3)',
-    's744',
-    's768',
-    's79',
-    's80\'s',
-    's84',
-    's840',
-    's91(15)',
-    's91(17)',
-    's97',
-    's_',
-    'sa\'deddin',
-    'sa\'di',
-    'sa-80',
-    'sa40',
     'sa41',
-    'sa48',
-    'saarlouis',
-    'saban&eacute;s',
-    'sabellius',
-    'sabino',
-    'sabotages',
-    'sabry',
-    'saccharin-sweet',
-    'saccharine-sweet',
-    'sach',
-    'sachs-wolfe',
-    'sachsa',
-    'sachsen',
-    'sachsse',
-    'sacramentalism',
     'sacrificially',
-    'sacris',
-    'sacsayhuaman',
-    'sad&amacr;graha',
-    'sadbhavana',
-    'saddoes',
-    'sadgrove',
-    'sadomasochistic',
-    'saenz',
-    'saes',
-    'safavids',
-    'safe-conducts',
-    'safebreakers',
-    'safetynet',
-    'saffron-robed',
-    'safly',
     'sagaciously',
-    'sagadat',
-    'sagaing',
-    'sagalayev',
-    'sage-coloured',
-    'saginaw',
-    'sagramosos',
-    'sahana',
-    'saharans',
-    'sahay',
-    'sahlin',
-    'saignon',
-    'saikia',
-    'sail-like',
-    'sailbag',
-    'sailele',
     'sailers',
-    'sailing-boat',
-    'sailing-ships',
-    'saint-jacques',
-    'saint-jean-baptiste',
-    'saint-laurent',
-    'saint-mont',
-    'sainte-agathe',
-    'saisset',
-    'sajica',
-    'sajudis-backed',
-    'sakala',
-    'salady',
-    'salaj',
-    'salembere',
-    'sales-orientated',
     'salesbury',
-    'salesians',
-    'saleslady',
-    'sallingboe',
-    'sallowness',
-    'sallying',
-    'sallys',
-    'salmagundi',
-    'salmer&oacute;n',
-    'salmon-coloured',
-    'salmonellas',
-    'salonia',
-    'salopians',
-    'salps',
-    'salta',
-    'saltburn/marske',
     'saltend',
-    'saltergate',
-    'saltily',
-    'saltwood',
-    'saltzman',
-    'salubrity',
-    'salumi',
-    'salv&aacute;torsk&aacute',
-    'salvias',
-    'salzmann',
-    'samar',
-    'sambals',
-    'sambur',
-    'samite',
-    'samiti',
-    'samper',
     'samples.',
-    'sampson/prison',
-    'samsun',
-    'samuelsson',
-    'sanctimoniousness',
-    'sanctimony',
-    'sanctions-busters',
-    'sanctities',
-    'sanctorum',
-    'sanczau',
-    'sand-bars',
-    'sand-castles',
-    'sand-martins',
-    'sand-pit',
-    'sandalford',
-    'sandars',
     'sandbars',
-    'sanderstead',
-    'sandfly',
-    'sandiacre',
-    'sange',
-    'sanitizers',
-    'sanjin&eacute;s',
-    'sansculottes',
-    'santagata',
-    'santamaria',
-    'santayana',
-    'santeiro',
-    'santisima',
-    'saone',
-    'sapherian',
-    'sapindaceae',
     'sapir-whorf',
-    'sapotaceae',
-    'sapunziju',
-    'sapura',
-    'sarafali',
-    'sarainha',
-    'sarasola',
-    'sarayi',
-    'sarcoplasm',
-    'sardonyx',
-    'sarejevo',
-    'sarfas',
-    'sarim',
-    'sarkily',
-    'sarkisyan',
-    'saroj',
     'sartrouville',
-    'sas/eis',
-    'sasanuma',
-    'saser',
-    'sash-windows',
-    'sashaying',
-    'satanically',
-    'satarov',
-    'satin-finish',
-    'satin-lined',
-    'satirises',
-    'sativum',
-    'saturn-pluto',
-    'saturninus',
-    'sauber-mercedes',
-    'sauce-bottles',
     'saucebox',
-    'sauciness',
-    'saulet',
-    'saulo',
-    'saumarez',
-    'saunti',
-    'saura',
-    'saurischian',
-    'sausolito',
-    'sauveterre-de-b&eacute;arn',
-    'sauvignons',
-    'savage-civilized',
-    'savageness',
-    'save/camra',
-    'savelli',
-    'savin\'',
     'savings-related',
-    'savings.',
-    'savka',
-    'savonlinna',
-    'saw-edged',
-    'sawcuts',
-    'sawyer/vicar',
-    'sayyed',
-    'sazda',
-    'sbac',
-    'sbardella',
-    'sbb',
-    'sbcc',
-    'sbytov',
-    'scabiei',
-    'scac',
     'scallop-shaped',
-    'scalper',
-    'scalpers',
-    'scand.',
-    'scandal-tainted',
-    'scandia',
-    'scangraphic',
-    'scapegoated',
-    'scarbrough',
-    'scarers',
-    'scarfed-on',
-    'scarifier',
-    'scariness',
-    'scarisbrook',
-    'scarponis',
-    'scarr',
     'scatterbrain',
-    'scdm',
-    'sceadu',
-    'sceatta',
-    'scepticisms',
-    'sch&ouml;neberg',
-    'sch&ouml;nefeld',
-    'sch&ouml;nfeld',
-    'schallenberg',
-    'schandau',
-    'scharfstein',
-    'scharlieb',
-    'scharping',
-    'schatborn',
-    'schedule.',
-    'scheemakers',
     'scheff',
-    'scheirl',
-    'schema-consistent',
-    'schematism',
-    'schenectady',
-    'schenkerian',
-    'scherchen',
-    'scherzos',
-    'scheunemann',
-    'schickerts',
-    'schipa',
-    'schizophrenically',
-    'schizosaccharomyces',
-    'schlesser/baldi',
-    'schlichtegroll',
-    'schlosser',
     'schmenner',
-    'schnauzer',
-    'schneider-siemssen',
-    'schockemohle',
-    'schoeman',
-    'schoenbaum',
-    'schoenus',
-    'schonberg',
-    'school-ey',
-    'school-work',
-    'school/business',
-    'schoolday',
-    'schooler',
-    'schoolhouses',
-    'schoolmasters/union',
-    'schostak',
     'schrattenbach',
-    'schtoom',
-    'schtuck',
-    'schubertian',
-    'schuchardt',
-    'schuessler',
-    'schuett',
-    'schuh',
-    'schuldigkeit',
-    'schutt',
-    'schutzer',
-    'schuyler',
-    'schwanden',
-    'schwe',
-    'schwidurski',
-    'sciama',
     'scientistic',
-    'scientometric',
-    'scimitar-horned',
-    'scintillations',
-    'scipios',
-    'scisearch',
-    'sclc',
-    'sclerotin',
-    'scoffingly',
-    'scollins',
-    'sconser',
-    'scoop-necked',
-    'scooped-out',
-    'scooterist',
-    'scorchingly',
-    'scoreboxes',
     'scores.',
-    'scotchlite',
-    'scotec',
-    'scotfree',
-    'scott-moncrieff',
-    'scott-thomas',
-    'scott-young',
-    'scottish-bred',
-    'scottorum',
-    'scoular',
-    'scourer',
-    'scout-masterish',
-    'scra',
-    'scraggs',
-    'scraped-back',
-    'scrappier',
     'scratchmen',
-    'scremerston',
-    'screw-topped',
-    'screw-up',
-    'screw-worm',
-    'screwdriving',
-    'scribings',
-    'scripps',
-    'scroggs',
-    'scrotal',
-    'scruffies',
-    'scrum-five',
-    'scrumhalf',
-    'scrunch-dried',
-    'scrunchy',
-    'scsi-1',
     'scsi-based',
-    'scudimore',
-    'scufflings',
-    'scumford',
-    'scuppers',
-    'scurrility',
-    'scurrilously',
-    'scutter',
-    'scythe-like',
-    'sd620',
-    'sddr',
-    'sdr-denominated',
-    'sds-100',
-    'se10',
-    'se18',
-    'se21',
     'se3',
-    'se6',
-    'se8',
-    'se88',
-    'sea-anemones',
-    'sea-boots',
-    'sea-creatures',
-    'sea-fret',
-    'sea-grey',
-    'sea-liced',
-    'sea-lochs',
-    'sea-max',
-    'sea-mist',
-    'sea-plane',
-    'sea-winds',
-    'seabass',
     'seaboat',
-    'seacocks',
-    'seadogs',
-    'seagal',
-    'seagrape',
-    'seahouses',
-    'seal-stones',
-    'seale-hayne',
-    'sealife',
-    'sealings',
-    'seamans',
-    'seamark',
-    'search-and-destroy',
-    'searched-for',
-    'searchings',
-    'seat-y',
     'seatless',
-    'seaworld',
-    'sebastiani',
-    'seborrhoeic',
-    'sec-',
-    'secol',
-    'second&rehy;largest',
-    'second-fastest',
-    'second-from-bottom',
-    'second-grade',
-    'second-raters',
-    'second-season',
-    'secret-fix',
-    'secretary/receptionist',
-    'section-house',
-    'sector-specific',
     'sector.',
-    'secundum',
-    'securer',
-    'security***',
-    'security/multi-processing',
-    'sedilia',
-    'sedisi',
-    'seditionaries',
-    'sedney',
-    'sedoc',
-    'seeba',
-    'seediest',
-    'seedorf',
-    'seeme',
-    'seep.',
-    'seeple',
     'seeq',
-    'seetanah',
-    'segalman',
-    'segas',
-    'segmentally',
-    'seidenberg',
-    'seigneurie',
-    'seigneurs',
-    'seillan',
-    'seint',
-    'seisdon',
-    'sekacz',
-    'seker',
-    'sekhobe',
-    'sekiyu',
-    'sekretariat',
     'sekularac',
-    'selago',
-    'selected-issue&lsqb;issue',
-    'selectees',
-    'selectivist',
-    'selectorial',
-    'seleglise',
-    'seletar',
-    'seleucus',
-    'self&rehy;determination',
-    'self&rehy;indulgent',
-    'self-assessed',
-    'self-attraction',
-    'self-avowed',
-    'self-built',
-    'self-clean',
     'self-coloured',
-    'self-conceited',
-    'self-conceptions',
-    'self-constructed',
-    'self-contemplation',
-    'self-corrections',
-    'self-criticisms',
-    'self-cutter',
-    'self-cutters',
-    'self-defensive',
-    'self-destructed',
-    'self-diminishing',
-    'self-distrust',
-    'self-efficacy',
-    'self-excited',
-    'self-exiled',
     'self-existent',
-    'self-fashioning',
-    'self-forgiveness',
-    'self-hate',
-    'self-identified',
-    'self-inverts',
-    'self-irony',
-    'self-mockingly',
-    'self-negation',
-    'self-organised',
-    'self-perceptions',
-    'self-production',
-    'self-sabotage',
-    'self-sacrificial',
-    'self-starters',
-    'self-starvation',
     'self-sterile',
-    'self-supportive',
-    'self-testing',
-    'self-trained',
-    'self-vindication',
-    'selfesteem',
-    'selikoff',
-    'sell.',
-    'seller.',
-    'sellotaping',
-    'selmer/adams',
-    'semanteme',
-    'semantic-differential',
-    'semdinli',
-    'seme',
-    'semelparous',
     'semi-acoustics',
-    'semi-barbarous',
-    'semi-dark',
-    'semi-dome',
-    'semi-domes',
-    'semi-domesticated',
-    'semi-dormancy',
-    'semi-elliptical',
-    'semi-feudalism',
-    'semi-flexible',
-    'semi-hysterical',
-    'semi-legal',
-    'semi-matt',
-    'semi-mechanical',
-    'semi-moist',
-    'semi-nudity',
     'semi-obscurity',
-    'semi-organic',
-    'semi-permanents',
-    'semi-pornographic',
-    'semi-presidential',
-    'semi-professionals',
-    'semi-professions',
-    'semi-proletariat',
-    'semi-prone',
-    'semi-ruin',
-    'semi-starvation',
-    'semi-technical',
-    'semibreves',
-    'semidarkness',
-    'semin',
-    'seminario',
     'semiosis',
-    'semioticians',
-    'semiquantitatively',
-    'semiramide',
-    'semistructured',
-    'semisynthetic',
-    'semitectum',
-    'semliki',
-    'senalep',
-    'senega',
-    'senegalensis',
-    'senegambia',
-    'sengmany',
-    'senokot',
-    'sensas',
-    'sensation-hungry',
     'sensationalise',
-    'sense-based',
-    'sense-data',
-    'sense-impressions',
-    'sense-organs',
-    'sense.',
-    'senselessness',
-    'sensitisers',
-    'sentence-internal',
-    'sentence/paragraph',
-    'sentences.',
-    'sententiousness',
-    'sentry-e',
-    'seong',
-    'sep.',
-    'sept/oct',
     'septagon',
-    'septate',
-    'september-8',
-    'september/early',
-    'septennial',
-    'septrin',
-    'septuagenarians',
-    'sequence-type',
-    'sequentiality',
-    'seracs',
-    'serait',
-    'seraphin',
-    'serbian-based',
-    'serbian-controlled',
-    'sergeyevich',
-    'sergueev',
     'serial/parallel',
-    'sericite',
-    'series-current',
-    'series/1',
-    'series/parallel',
-    'serious.',
-    'serle',
-    'serlin',
-    'serlio',
-    'serologic',
-    'seronatus',
-    'serpente',
-    'serpentina',
-    'serpentinites',
-    'serpentis',
-    'serpulid',
     'serratosa',
-    'serum-deprived',
-    'serveries',
-    'servet',
-    'serveware',
-    'servia',
-    'servians',
-    'service-providing',
-    'service-wide',
-    'service.',
-    'service/hampshire',
-    'servicio',
-    'serving-wench',
-    'servingmen',
-    'servite',
-    'seskinore',
     'sesquialtera',
-    'sessionals',
-    'sethi',
-    'setosa',
-    'setsuya',
-    'setterington',
-    'setting-out',
-    'settlable',
-    'settle&ndash;carlisle',
-    'sevcon',
-    'seven-band',
-    'seven-birdie',
-    'seven-branched',
-    'seven-country',
-    'seven-fifty',
-    'seven-game',
     'seven-length',
-    'seven-party',
-    'seven-to',
-    'seventeens',
-    'seventeenth-and',
-    'seventh-minute',
-    'seventh-placed',
-    'seventy-fives',
-    'sever-1',
-    'severa',
-    'sevier',
-    'sewell/liberal',
-    'sewill',
-    'sewing-machines',
-    'sewing-up',
-    'sewn-in',
     'sewstern',
-    'sex-based',
-    'sex-lives',
-    'sexagenarian',
-    'sexologist',
-    'sexplosion',
-    'sexpot',
-    'sexton/thames',
-    'seyitgazi',
-    'seymour-jones',
-    'seyni',
-    'sfa/92',
-    'sforzas',
-    'sfs',
-    'sfumato',
-    'sfwp',
     'sgm',
-    'sh5',
-    'shadow-voices',
-    'shadowgraphs',
-    'shadowless',
-    'shadows.',
-    'shadrokh-cigari',
-    'shaef/12th',
-    'shagalyn',
-    'shahan',
-    'shahani',
-    'shahidi',
-    'shail',
-    'shak\'a',
-    'shaka\'ik',
-    'shakarchi',
     'shakehole',
-    'shaker-style',
-    'shakhar',
-    'shakudo',
-    'shakul-ur-rehman',
-    'shaldon',
-    'shallowed',
-    'shamdev',
-    'shanbally',
-    'shanice',
-    'shankend',
-    'shanks&amp;mcewan',
-    'shanna',
-    'shanshal',
-    'shape-specificity',
-    'shape.',
     'shapen',
-    'sharable',
-    'share-owners',
-    'share-pushers',
-    'share/worldwide',
-    'sharecropping',
-    'shareplex/ix',
-    'shares-for-favours',
-    'sharings',
-    'shark-fishing',
-    'sharmans',
-    'sharnbrook',
-    'sharod',
-    'sharp-cut',
-    'sharp-end',
-    'sharp-nosed',
     'sharp-shooting',
-    'sharp-sighted',
-    'sharplin',
-    'sharwoods',
-    'shashi',
-    'shaukat',
-    'shaumyan',
-    'shawii',
-    'shawlies',
-    'shayer',
-    'shaymiyev',
-    'shchadov',
-    'she/timotei',
-    'shead',
-    'sheela-na-gig',
-    'sheep-dotted',
     'sheep-pig',
-    'sheephaven',
-    'sheeplike',
-    'sheerest',
-    'sheet-covered',
-    'sheet-like',
-    'sheg',
-    'shelducks',
-    'shelf-packer',
-    'shell-fish',
-    'shell-suits',
-    'shell.bat',
-    'shellys',
-    'shelov-kovedyayev',
-    'shena',
-    'shepley',
     'sheppeards',
-    'sheppee',
-    'shepperdson',
-    'sherak',
-    'sherburn-in-elmet',
-    'sherburne',
-    'sheriffdoms',
-    'sheriffmuir',
-    'sherington',
-    'sherrell',
-    'sherrie',
-    'sheweth',
-    'shieldhall',
-    'shiftings',
-    'shigalov',
-    'shigeo',
     'shikampur',
-    'shillin',
-    'shilov',
-    'shimonoseki',
-    'shinar',
-    'shineth',
-    'shininess',
-    'shiningly',
-    'shinjuku',
-    'shinn',
-    'ship-builders',
-    'shipbroker',
-    'shiplake/oxfordshire',
-    'shipton-under-wychwood',
-    'shir',
-    'shithead',
     'shithole',
-    'shivraj',
-    'shkoder',
-    'shlaer-mellor',
-    'shloer',
-    'shoans',
-    'shock-absorbers',
-    'shock-corded',
-    'shock-haired',
-    'shock/horror',
-    'shockers',
-    'shoe-parcel',
-    'shoestrings',
-    'shographics',
-    'sholde',
-    'shoo-in',
     'shoos',
-    'shop-bell',
-    'shop-owners',
-    'shopaholics',
-    'shopful',
-    'shoreworks',
-    'short-covering',
-    'short-pile',
-    'short-selling',
-    'short-side',
-    'short-wavelength',
-    'shortener',
-    'shorteners',
-    'shortgrass',
-    'shorties',
-    'shortwaves',
     'shot-stopper',
-    'shot-stopping',
-    'shouk',
-    'shoulder-holster',
-    'shoulder-padded',
-    'shouldest',
-    'shouter',
-    'shouty',
-    'shovel-shaped',
-    'shovelers',
-    'show-ring',
-    'showbar',
-    'showcard',
-    'showing-off',
-    'showpage',
-    'showreel',
     'shrager',
-    'shrew-like',
-    'shrievalty',
-    'shrikes',
-    'shrimp-like',
-    'shrubb',
-    'shtrikman',
-    'shufflings',
-    'shula',
-    'shulver',
-    'shumov',
-    'shunt-current',
-    'shura-e',
-    'shurikens',
-    'shusaku',
-    'shutter-release',
     'shuttlecocks',
-    'shyama',
-    'shyest',
-    'sibbett',
-    'sibford',
-    'sibir',
-    'sibo',
-    'sibs',
-    'sibyls',
-    'sicarius',
-    'sicherheitsdienst',
-    'sicking',
-    'sickpay',
-    'sicky',
-    'siddon',
-    'side-dots',
     'side-handled',
-    'side-mounted',
-    'side-shows',
-    'side-tables',
-    'sideband',
-    'sidebands',
-    'sidehole',
-    'sideholes',
-    'sidelit',
-    'sidemen',
-    'siderites',
-    'sideway',
-    'sidneian',
-    'sidpa',
-    'sidya',
-    'sigeheard',
     'sigerson',
-    'sight-seers',
-    'sighters',
-    'sigiburg',
-    'sign-on',
-    'signal-boxes',
-    'signficant',
-    'signifi&eacute',
-    'signing-off',
-    'sigston',
-    'sij',
-    'sijaona',
-    'sila-on',
-    'silica-rich',
-    'silicified',
-    'silicium',
     'siliconised',
-    'siliconized',
-    'silisili',
-    'silk-like',
-    'silkmoth',
-    'silman',
-    'silo&eacute',
-    'siloxane',
-    'silurian/devonian',
-    'silver-helmed',
-    'silver-mines',
-    'silver-painted',
-    'silverton',
-    'silvertones',
-    'silvervision',
-    'silyn',
     'sim.',
-    'simak',
-    'simbarashe',
-    'simeone',
-    'simey',
-    'similia',
-    'similie',
-    'simionescu',
-    'simmonds/laser',
-    'simoes',
-    'simonov',
-    'simonton',
-    'simpson/rspca',
-    'simularities',
-    'simuliid',
-    'sind-based',
     'sindall',
-    'sinderford',
-    'sing-alongs',
-    'singapore-based',
-    'singi',
-    'singingly',
-    'single-barrelled',
-    'single-bedroom',
-    'single-bladed',
-    'single-case',
-    'single-coils',
-    'single-cylinder',
-    'single-file',
-    'single-honours',
-    'single-image',
-    'single-length',
     'single-level',
-    'single-page',
-    'single-peaked',
-    'single-period',
-    'single-stemmed',
-    'single-storied',
-    'sinissipi',
-    'sinnatt',
-    'sino-american',
-    'sinope',
-    'sinrich',
-    'sintering',
-    'siochana',
-    'sipek',
-    'sipho',
-    'siphuncle',
     'siphunculata',
-    'siquieros',
-    'sirica',
-    'sirina',
-    'sirisena',
-    'sirkka',
-    'sirns',
-    'sirree',
-    'sirrs',
-    'sisinni',
-    'sison',
-    'sisyrinchium',
-    'sit-and-wait',
-    'sitasjaure',
-    'site-investigation',
-    'site-wide',
     'siteworks',
-    'siviglia',
-    'six-five',
-    'six-foot-four',
-    'six-foot-high',
-    'six-foot-wide',
-    'six-game',
-    'six-legged',
-    'six-mile-long',
-    'six-over-par',
-    'six-packs',
-    'six-slot',
-    'six-string',
-    'six-to-one',
-    'sixtieths',
-    'sixty-six-year-old',
     'size-strength',
-    'sizewell-b',
-    'sja',
-    'sjarifuddin',
-    'sjns',
-    'sk8',
-    'skaergaard',
-    'skag',
-    'skaros',
-    'skateboarder',
-    'skateraw',
-    'skd',
-    'skeels',
-    'skeete',
-    'skeggy',
-    'skeletomuscular',
     'skelm',
-    'skempton',
-    'skerrols',
-    'sketch-club',
-    'skewes',
-    'ski-hats',
-    'ski-jumper',
-    'ski-lifts',
-    'ski-mask',
-    'ski-poles',
-    'ski-tows',
-    'skidby',
-    'skidoo',
-    'skiiers',
-    'skillen',
-    'skillion',
     'skimpiest',
-    'skin-prick',
-    'skinlid',
-    'skinnerian',
-    'skipping-ropes',
-    'skipwith',
-    'skittishness',
-    'skl',
-    'skorupka',
-    'skottowe',
-    'skoupidia',
-    'skp-y',
-    'skrabalo',
-    'skrag',
-    'skull-caps',
-    'skyfame',
     'skyrocket',
-    'skyships',
-    'skysport',
-    'skywagon',
-    'slab-like',
-    'slack-mouthed',
-    'slackest',
-    'slag-heaps',
-    'slaidburn',
-    'slanderer',
-    'slapewath',
-    'slapp',
-    'slappy',
-    'slashings',
-    'slatey',
-    'slatting',
     'slave-ships',
-    'slave-traders',
-    'slavkov',
-    'slavomir',
-    'slctd',
-    'sldp',
-    'sleator',
-    'sleazier',
-    'sleaziest',
-    'sleeking',
-    'sleeping-cars',
-    'sleeplessly',
-    'slender-heeled',
-    'slezak',
-    'slick-looking',
-    'slimier',
     'sliming',
-    'sling-back',
-    'slinn',
-    'slip-resistant',
-    'slix',
-    'sll',
-    'sloan-kettering',
-    'sloat',
-    'sloganising',
-    'slopes.',
-    'slot-like',
-    'slovene-speaking',
-    'slow-cooking',
-    'slow-flapping',
-    'slow-onset',
-    'slow-turning',
     'slowdowns',
-    'slower-growing',
-    'sloyan',
-    'slubbed',
-    'sluggan',
-    'sluglett',
-    'slumbrous',
-    'slurpy',
-    'slype',
-    'sm&oslash;rrebr&oslash;d',
-    'sm&ouml;rg&aring;sbord',
-    'sm5',
-    'smailholm',
-    'small-batch',
-    'small-breasted',
-    'small-crested',
     'small-holdings',
-    'small-number',
-    'smaller-framed',
-    'smaller-sized',
-    'smallridge',
-    'smalltime',
-    'smart-aleck',
-    'smart-suited',
-    'smartdrv.exe',
-    'smartdrv.sys',
-    'smartens',
-    'smartmath',
-    'smarttools',
-    'smaws',
-    'smellier',
-    'smend',
     'smet',
-    'smidth',
-    'smith-bryant',
-    'smith-nkomo',
-    'smith/gloucestershire',
-    'smither',
-    'smoke-logged',
-    'smokers.',
-    'smokie',
-    'smokily',
-    'smokiness',
-    'smoky-blue',
-    'smolensky',
-    'smooth-coated',
-    'smooth-fronted',
-    'smooth-haired',
     'smooth-running',
-    'smp1',
-    'smp2',
-    'sn*wn',
-    'sn1',
-    'sna-3270',
-    'sna/sdlc',
-    'snaefell',
-    'snaefellsness',
-    'snagge',
-    'snailham',
-    'snake-pit',
-    'snapped-up',
-    'snappiest',
-    'snarky',
-    'snarl-ups',
     'snbts',
-    'snguon',
-    'sniderman',
-    'snifters',
-    'snogogram',
-    'snooks',
-    'snootiness',
-    'snow-',
-    'snowbird',
-    'snowboarding',
-    'snowboards',
-    'snowcem',
-    'snowed-in',
-    'snowscape',
-    'snsc',
-    'snuffly',
     'snugged',
-    'snugpak',
-    'so.',
-    'so.l',
-    'so23',
-    'so9',
-    'so929',
-    'so_so_that',
-    'sobriquets',
-    'soci&eacute;t&eacute;s',
-    'sociably',
-    'social-christian',
-    'social-cultural',
-    'social-revolutionary',
-    'social/',
-    'social/economic',
     'socialisms',
-    'socialist-feminists',
-    'socialist-oriented',
-    'society-centred',
-    'socio-ecology',
-    'socio-economically',
-    'socio-linguistic',
-    'socioeconomically',
-    'sociologies',
-    'socolofi',
-    'socon',
-    'sodi',
-    'sodic',
-    'sodomised',
-    'soeurs',
-    'sofa-beds',
     'sofar',
-    'soffici',
-    'soft-eyed',
-    'soft-leaved',
-    'soft-pedal',
-    'soft-soaped',
-    'softcopy',
-    'softened.',
-    'softwoods',
-    'sohy',
-    'soie',
-    'soil-dwelling',
-    'soil-gas',
-    'soil-types',
-    'soil/compost',
-    'solaas',
     'solanaceae',
-    'solare',
-    'soldier-poet',
-    'soldridge',
-    'solenopsis',
-    'solfataricus',
-    'solicitors.',
-    'solidus',
-    'solin',
-    'solitonic',
-    'solkan',
-    'solla',
-    'sollie',
-    'solo-voice',
-    'soloistic',
-    'solubilities',
     'solumological',
-    'solution-0.5%',
-    'solutional',
-    'solvent-accessible',
-    'solvent-flattened',
-    'solving/minimisation',
-    'some-times',
-    'somedody',
-    'somerleyton',
-    'someth',
-    'something-',
-    'somethink',
-    'someway',
-    'somewheres',
-    'sommerfrische',
-    'somnambulant',
     'somnambulistic',
-    'somnambulistically',
-    'sonam',
-    'sonars',
-    'sondheimer',
-    'song-cycles',
-    'song-titles',
-    'songbooks',
-    'songwriter/artist',
-    'sono',
-    'sonora',
-    'soom',
-    'soon-to-be-privatised',
-    'soooo',
-    'sophie-libert&eacute',
-    'sophisticated-looking',
     'sophoclean',
-    'sophonisba',
-    'sople',
-    'soragna',
-    'sorenson',
-    'sorgues',
-    'soriano',
-    'soroptomists',
-    'sorrels',
-    'sorriest',
-    'sorry&mdash',
-    'sort-of',
-    'sortwell',
-    'sosostris',
-    'soss',
-    'soteriou',
     'sothic',
-    'sou\'westers',
-    'soubirous',
-    'souci',
-    'soulboys',
-    'soulis',
-    'sound-based',
-    'sound/appearance/sensation',
-    'soundback',
-    'soundchecking',
-    'soundlessness',
-    'souped',
-    'sour-sweet',
-    'source(s)',
-    'source-based',
-    'source-material',
     'soursop',
-    'sous-chefs',
-    'sousatzka',
-    'souterliedekens',
-    'souterraine',
-    'south-american',
-    'south-southeast-trending',
-    'southeastwards',
-    'southern-atlantic',
-    'southmoor/oxfordshire',
-    'soverign',
-    'soviet-communist',
-    'soviet-german',
-    'soviet-romanian',
-    'soviet-type',
-    'soviet-united',
     'soya-based',
-    'soyo',
-    'sp/lp',
-    'sp6',
-    'space-occupant',
-    'space-related',
-    'space-station',
-    'spacewalks',
-    'spaceway',
-    'spade-like',
-    'spade-work',
-    'spadeful',
-    'spago',
-    'spalling',
-    'spanish/english',
-    'spantax',
     'spantik',
-    'sparbrook',
-    'sparkhill',
-    'sparkit',
-    'sparkit-40/mbus',
-    'sparsely-furnished',
-    'sparsest',
-    'sparsit',
-    'spartacists',
-    'spasming',
-    'spathiphyllum',
-    'spatiality',
-    'spatio-visual',
-    'spautz',
-    'spavined',
-    'spay',
     'spd-green',
-    'speakeasies',
-    'speaker-initiated',
-    'speaker-referent',
-    'speaker/writer',
-    'speakin',
-    'spear-shaped',
-    'special-care',
-    'special-train',
-    'specially-constructed',
-    'specially-shaped',
-    'species-richness',
-    'specs.',
-    'spectabile',
-    'spective',
-    'spectra-tek',
     'spectrin',
-    'spectrographic',
-    'spectrometric',
-    'spectroscopist',
-    'speech-dominant',
-    'speechwork',
-    'speed-dependent',
-    'speed-sensitive',
-    'speedometers',
-    'speedsail',
-    'speedy-go',
-    'speilberg',
-    'speleologists',
-    'spenceley',
-    'spencely',
-    'spencer-phillips',
     'spencerian',
-    'spenco',
-    'speransky',
-    'spercheios',
-    'spermatic',
-    'spermatocyte',
-    'spezza',
-    'spf15',
-    'spherules',
-    'sphincterotome',
-    'sphincterotomies',
-    'sphinx-like',
-    'sphinxlike',
-    'sphoeroides',
-    'spider-monkeys',
-    'spiderbrouter',
     'spiels',
-    'spierer',
-    'spiggies',
-    'spiliada',
-    'spinasternum',
-    'spinelessness',
-    'spinnerets',
-    'spinning-jenny',
-    'spinning-wheel',
-    'spinnler',
-    'spinny',
-    'spinosissima',
-    'spiracular',
-    'spiritedness',
-    'spirituale',
-    'spiritualising',
     'spitballs',
-    'spivey',
-    'splashbacks',
-    'splashguard',
-    'splenoportography',
-    'split-channel',
-    'split-seconds',
-    'splodgy',
-    'splotches',
-    'spoken-word',
-    'spokeswomen',
-    'spoliaric',
-    'spongeware',
-    'spontex',
-    'spookily',
-    'sportsboat',
     'spot-lamps',
-    'spoto',
-    'spott',
-    'sprawler',
-    'spraygunned',
-    'spriegel',
-    'sprigits',
-    'spring-board',
-    'spring-fed',
-    'spring-tined',
-    'spring/',
-    'spring/windows',
-    'springalls',
-    'springlike',
-    'springwater',
-    'spritzers',
     'sproati',
-    'sproughton',
-    'sprucefield',
-    'sprues',
-    'sprung-edge',
-    'spud-u-like',
-    'spuming',
-    'sq_kilometres',
-    'sqd',
-    'sql/m',
-    'sql3',
-    'sql89',
-    'squalors',
-    'square-go',
-    'square-law',
-    'square-neck',
     'square-necks',
-    'square-sectioned',
-    'square-topped',
-    'squareds',
-    'squarial',
-    'squarials',
-    'squarrosus',
-    'squashed-up',
-    'squeakies',
-    'squealer',
-    'squeamishly',
-    'squid-like',
-    'squill',
-    'squinch',
-    'squirearchal',
-    'squirrel-proof',
     'squonk',
-    'sr.n6',
-    'sr/y',
-    'sr25,000',
-    'srg',
-    'srimaung',
-    'srinigar',
-    'srm',
-    'srp50',
-    'srps',
-    'ss-1',
-    'ss-5',
-    'ss-5s',
-    'ss.24',
-    'ss13a',
-    'ss20',
     'ss663',
-    'ss7',
-    'ssdna',
-    'sssssh',
-    'ssti',
-    'st-bertin',
-    'st-wandrille',
-    'st.a',
-    'st.andrews',
-    'st.tr.',
-    'st506',
-    'stabex',
-    'stability.',
-    'stable-boy',
-    'stackable',
-    'stacker-crane',
     'stackers',
-    'stadel',
-    'stadhuis',
-    'staehle',
-    'staff-side',
-    'staffin',
-    'stage-coaches',
-    'stage-hands',
-    'stahag',
-    'staiano',
-    'stainable',
-    'stainford',
-    'stainings',
-    'stainsby',
-    'stair-carpet',
-    'stair-rods',
     'stair-well',
-    'stake-holes',
-    'stale-mate',
-    'stalkless',
-    'stambouloff',
-    'stamen',
-    'stamfords',
-    'stamitz',
-    'stamos',
-    'stamp-sized',
-    'stamsund',
-    'stanbridge',
-    'stancliffe',
-    'stand-alones',
-    'stand-to\'',
-    'stand-ups',
     'standeth',
-    'standout',
-    'standup',
-    'stape',
-    'stapelia',
-    'staph',
-    'staphylococcusorius',
-    'stapleton/hospital',
-    'star-clouds',
-    'starion',
-    'stark-naked',
-    'starkey/oxford',
-    'starks',
-    'starlike',
-    'starling-like',
-    'starnes',
     'starobelsk',
-    'starovoitova',
-    'stars-and-stripes',
-    'starsearch',
-    'starsuits',
-    'start-stop',
-    'startforth',
-    'starting/stopping',
-    'startings',
-    'starvelings',
-    'staser',
-    'state-capitalist',
-    'state-centric',
-    'state-dependent',
-    'state-imposed',
-    'state-operated',
     'state-paid',
-    'state-rooms',
-    'state-system',
-    'stategy',
-    'statement(s)',
-    'states-based',
-    'states-style',
-    'statesman-like',
-    'statue-like',
-    'staw',
-    'stay-wet',
-    'stayner',
-    'steady.state',
-    'steam-heated',
-    'steam-rollered',
-    'steamclean',
     'steamday',
-    'steamily',
-    'stearsby',
-    'steatosis',
-    'steblianko',
-    'steel-bodied',
-    'steel-shafted',
-    'steele-perkins',
-    'steelies',
-    'steep-sloping',
-    'steepsided',
-    'stefanopoulos',
-    'stefek',
-    'steffan',
-    'stegosaur',
-    'steinar',
     'stellato/persistant',
-    'stembridge',
-    'stemless',
-    'stemware',
-    'stenhammar',
-    'stenorhyncus',
-    'step-ladders',
-    'step-over',
-    'stepanova',
-    'stepboards',
-    'steper',
-    'stepfathers',
-    'stepparents',
-    'steppers',
-    'stepping-up',
-    'steppy',
     'stepsisters',
-    'ster',
-    'stereotaxic',
-    'stereotypic',
-    'stereotypy',
-    'sterling-based',
-    'sterling-denominated',
-    'sterlings',
-    'stern-looking',
-    'sternbach',
-    'sternburg',
-    'sternellum',
-    'stethoscopes',
-    'stettner',
-    'stevensons',
-    'stevick',
     'stevin',
-    'stewart\'s/melville',
-    'stewart-moore',
-    'stewartfield',
-    'stewarton',
-    'steyne',
-    'sthenic',
-    'sticil',
-    'stick-and-ball',
-    'sticking-out',
-    'stickman',
-    'stiff-stemmed',
-    'stigmatizes',
-    'still-damp',
-    'still-running',
-    'stilt-like',
     'stimulus-no',
-    'stimulus.',
-    'stimulus/response',
-    'stinging-cells',
-    'stipital',
-    'stitchery',
-    'stj',
-    'stoakes',
-    'stoakesly',
-    'stobs',
-    'stock-markets',
-    'stock/inventory',
-    'stockades',
-    'stockholdings',
-    'stocking-filler',
-    'stocking-fillers',
     'stockrooms',
-    'stodginess',
-    'stogie',
-    'stogumber',
-    'stoke/clayton',
-    'stolons',
-    'stolp',
-    'stolze',
-    'stolzenburg',
-    'stomachic',
-    'stone(s)',
-    'stone-ground',
-    'stone-laying',
-    'stone-masons',
-    'stone-mines',
-    'stone-tiled',
     'stonefield',
-    'stonehouse/gloucestershire',
-    'stoneleigh/warwickshire',
-    'stonesdale',
-    'stoniness',
-    'stonker',
-    'stonyditch',
-    'stop-cocks',
-    'stop-watch.',
-    'stopping-place',
-    'stopping-places',
-    'stoppings',
-    'storace',
-    'store-based',
-    'storemen',
-    'stormbound',
     'stormcloud',
-    'stormers',
-    'stormflap',
-    'stormhill',
-    'stormier',
-    'stormiest',
-    'stormproof',
-    'stormswept',
-    'stormtex',
-    'storozhevoy',
-    'story-books',
-    'story-making',
-    'storys',
-    'stotts',
-    'stove-enamelled',
-    'stovin',
     'stowe-nine-churches',
-    'str&auml;ngn&auml;s',
-    'str&oslash;get',
-    'stra.',
-    'strach.gif',
-    'stradella',
-    'stragg',
-    'straight-flight',
-    'strandness',
-    'strandtown',
-    'strapline',
-    'straplocks',
-    'strapwork',
-    'stratal',
-    'straten',
-    'stratification-a',
     'stratmann',
-    'straven',
-    'straw-hat',
-    'straw-hatted',
-    'streakily',
-    'streatfield',
-    'streather',
-    'street-sellers',
-    'street-signs',
-    'street-sweepers',
-    'street-walker',
-    'street-walkers',
-    'streetwalker',
-    'streetworks',
-    'streletz',
-    'stretchable',
     'stretched-out',
-    'stretchley',
-    'striae',
-    'striatum',
-    'strike-torn',
-    'striplight',
-    'strippogram',
-    'stro',
-    'strohm',
-    'stronde',
-    'strong-arming',
-    'strong-featured',
-    'strong-growing',
-    'strongly-held',
-    'strongmen',
-    'strongrooms',
     'strongyloid',
-    'stroppiness',
-    'strouthos',
-    'stroyev',
-    'structure/activity',
-    'struggler',
-    'struldbrug',
-    'strung-up',
-    'strutton',
-    'strutts',
-    'stryker',
-    'stuarda',
-    'stubbier',
-    'student-related',
-    'student-student',
-    'student/staff',
     'students/teachers',
-    'studia',
-    'studio-bound',
-    'studious-looking',
-    'studiousness',
-    'study/set',
-    'stuffiest',
-    'stultifyingly',
-    'stumblingly',
-    'stumblings',
-    'stummvoll',
-    'stunties',
-    'stuntpersons',
-    'stupidness',
-    'sturgeons',
-    'sturmthal',
     'stutterers',
-    'styczynski',
-    'stylesheets',
-    'stylianos',
-    'stylistician',
-    'suardal',
-    'sub&ndash;mailing',
-    'sub-&dollar;10,000',
-    'sub-activities',
-    'sub-agents',
-    'sub-alpine',
-    'sub-area',
-    'sub-basins',
-    'sub-boreal',
-    'sub-clans',
-    'sub-classification',
     'sub-dean',
-    'sub-deltas',
-    'sub-departments',
-    'sub-divides',
-    'sub-domain',
-    'sub-domains',
-    'sub-elements',
-    'sub-faculties',
-    'sub-genres',
-    'sub-global',
-    'sub-harmonic',
-    'sub-head',
-    'sub-kings',
-    'sub-licenses',
-    'sub-limits',
-    'sub-nuclear',
     'sub-objects',
-    'sub-organisations',
-    'sub-organization',
-    'sub-parcel',
-    'sub-parts',
-    'sub-period',
-    'sub-postmistress',
-    'sub-projects',
-    'sub-pubic',
-    'sub-s.',
-    'sub-sea',
-    'sub-society',
-    'sub-soils',
-    'sub-stations',
-    'sub-stratum',
-    'sub-structure',
     'sub-structures',
-    'sub-system(s)',
-    'sub-underwrite',
-    'subconsciousness',
-    'subcosta',
-    'subdivides',
-    'subdivisional',
-    'subfertile',
-    'subfile',
-    'subformation',
-    'subgalea',
-    'subgenus',
-    'subgovernments',
-    'subhi',
-    'subject-',
-    'subject-before-predicate',
     'sublessees',
-    'submentum',
-    'submenu',
-    'subnarial',
-    'subnational',
-    'subnotebook',
-    'subodh',
-    'subparts',
-    'subproblem',
-    'subprocess',
-    'subsection.',
-    'subsids',
-    'subsidy-free',
-    'subsocieties',
-    'subsolar',
-    'substantial-looking',
     'substitutionary',
-    'substitutive',
-    'substrate-specific',
-    'subterraneous',
-    'subtopics',
-    'subtyping',
-    'subverter',
-    'subzones',
-    'successfuly',
-    'successor.',
-    'succoth',
-    'succuba',
-    'sucker-like',
-    'sudhakarrao',
-    'sueno',
-    'sueves',
     'suficient',
-    'sugar-acid',
-    'sugar-bowl',
-    'sugarblast',
-    'sugargliders',
-    'sugarless',
-    'sugarman',
-    'sugawara',
-    'suggestors',
-    'suggett',
-    'suhr',
-    'suir',
-    'suker',
-    'sukhdev',
-    'sukkariya',
-    'suleiman.',
     'suleri',
-    'sulfide',
-    'sulhamstead',
-    'sulhamstead/berkshire',
-    'sulphadiazine',
-    'sulphamethoxazole',
-    'sulphamic',
-    'sulphonation',
-    'sulphur-laden',
-    'sulphuric-acid',
-    'sulphuris',
-    'sulzmann',
-    'sum\'yaa',
-    'sumaila',
-    'sumarlin',
-    'sumatras',
     'sumhin',
-    'summatively',
-    'summed-up',
-    'summerfields',
-    'summerland',
-    'summerleigh',
-    'summerstage',
-    'sun-browned',
-    'sun-clock',
-    'sun-damaged',
-    'sun-deck',
-    'sun-facing',
-    'sun-oil',
-    'sun-pluto',
-    'sun-rays',
-    'sun-ripened',
     'sun-scorched',
-    'sun-sensitive',
-    'sun-set',
-    'sun/texas',
-    'sunbleached',
-    'sundarbans',
-    'sunderland-attenders',
-    'sundour',
-    'sundrive',
-    'sunfang',
-    'sungei',
-    'sunjeev',
-    'sunkel',
-    'sunnah',
-    'sunni-dominated',
-    'sunno',
     'sunroom',
-    'sunward',
-    'sunwest',
-    'super-abundance',
-    'super-bantamweight',
-    'super-computer',
-    'super-directional',
-    'super-family',
-    'super-ferry',
-    'super-group',
-    'super-jug',
-    'super-normal',
-    'super-quarries',
-    'super-saver',
-    'super-smooth',
-    'super-state',
     'super-structure',
-    'superbeings',
-    'supercenter',
-    'superciliously',
-    'supercontinents',
-    'superfetation',
-    'superheroes',
-    'superlight',
-    'supernaturalism',
-    'superplant',
-    'superreal',
-    'supers',
-    'supersaurus',
-    'supersleuth',
-    'supertintas',
-    'supertonic',
     'superusers',
-    'superviews',
-    'superville',
-    'supervisory/management',
-    'suppiah',
-    'suppliers.',
-    'supply-constrained',
-    'supra-orbital',
-    'suprachiasmatic',
-    'supraorbital',
-    'supremacists',
-    'suranyi',
-    'suras',
-    'sures',
-    'surface-active',
-    'surinamensis',
     'surplices',
-    'surpressing',
-    'surreally',
-    'surveillance-detected',
-    'surveillances',
-    'surveyors.',
-    'susa-no-wo',
-    'susceptance',
-    'sussenguth',
-    'sustainment',
-    'susurrus',
-    'sutlers',
-    'suunto',
-    'suvero',
-    'suzhou',
-    'svendsen',
     'svensk',
-    'sveti',
-    'svolinsk&yacute',
-    'svp/udc',
-    'svr4.3',
-    'svrv/386',
-    'svs',
-    'sw13',
-    'sw17',
-    'sw213eb',
-    'swabian',
-    'swaefred',
-    'swahili-speaking',
-    'swallow-like',
-    'swally',
-    'swanepoel',
     'swanhilda',
-    'swansea-cork',
-    'swap-hook',
-    'swaths',
-    'sweat-dampened',
-    'sweat-shirts',
-    'sweat-sodden',
-    'swedish-born',
-    'swedish-swiss',
-    'sweepback',
-    'sweet-voiced',
-    'swelly',
-    'swidden',
-    'swimbladders',
-    'swinbanks',
-    'swindale',
     'swindell',
-    'swindons',
-    'swing-boats',
-    'swollen-bellied',
-    'swope',
-    'sword-handle',
-    'swound',
-    'swsg',
-    'sx-3r',
-    'sxbr',
-    'sybyl/3db',
-    'sycophantically',
-    'sykeside',
-    'syllable-timed',
-    'sylos',
-    'sylvana',
     'symbionese',
-    'symbol-manipulating',
-    'symbolical',
-    'symbology',
-    'symes/wiltshire',
-    'symmetrigon',
-    'symmetry-adapted',
-    'symmonds',
-    'symptoms.',
-    'synapsis',
-    'synchronicities',
-    'syncromesh',
-    'syncytium',
-    'synopsys',
-    'syphilitics',
-    'syrene',
     'syrian-egyptian',
-    'sys&dollar;login',
-    'sys&dollar;manager:lifespan&mdash;startup.com',
-    'sysmin',
-    'system(s)',
-    'systems-based',
-    'szintai',
-    'szreter',
-    'szymon',
-    't&aacute;bora',
-    't&amp;n',
-    't&eacute;r',
-    't&ndash;28',
-    't\'awd',
-    't\'bloody',
-    't\'moor',
     't\'road',
-    't\'say',
-    't\'stables',
-    't\'village',
-    't+10',
-    't-bars',
-    't-connectors',
-    't-maze',
-    't-score',
-    't-suidhe',
-    't-tailed',
-    't-tube',
-    't-units',
-    't.11',
-    't.b',
-    't.gdp',
     't.iii',
-    't.n.',
-    't/a',
-    't/ha/p.a.',
-    't/v',
-    't1/2',
-    't16s',
-    't2n1',
-    't33',
-    't3d',
-    't805-based',
-    't8pc9',
-    't=0',
-    't_',
-    'ta\'kwakomena',
-    'ta\'kwakomenae',
     'tabards',
-    'tabas',
-    'table-free',
-    'tableful',
-    'tabloid-style',
-    'tabulator',
-    'tachographs',
-    'tachycardiomyopathy',
-    'tachyon',
-    'tacksman',
-    'tacna',
-    'tadashi',
-    'tadecki',
-    'tae-woo',
-    'taff-ely',
-    'tag-questions',
     'tagine',
-    'tagliacozzo',
-    'taharat',
-    'tahitians',
-    'tail-pieces',
-    'tail-tip',
-    'taillefers',
-    'tailpipe',
-    'tailstock',
-    'taing',
-    'tainter',
-    'taintless',
-    'taiwan-born',
-    'tajfel',
-    'takagaki',
-    'taken-off',
     'takeout',
-    'takeshi',
-    'takeshiba-o',
-    'takiff',
-    'takrit',
-    'takshaka',
-    'takuo',
-    'tal-y-mignedd',
-    'talamini',
-    'talaq',
-    'talbott',
-    'talia',
-    'taligent-compliant',
-    'talkativeness',
-    'tallin',
-    'tamasese',
     'tamayo-reyes',
-    'tambier',
-    'tamil-dominated',
-    'tammames',
-    'tamper-proof',
-    'tamworths',
-    'tanabe-sugano',
-    'tanakeke',
-    'tancarville',
-    'tancock',
-    'tandemly',
-    'tanforan',
-    'tangibles',
-    'tanhouse',
-    'tank-led',
-    'tank-mates',
     'tank-top',
-    'tanked',
-    'tannochbrae',
-    'tannoys',
-    'tanz',
-    'tanzaniensis',
-    'tapeover',
-    'tapescripts',
-    'tapetum',
-    'tapp',
-    'tappersdorf',
-    'tapster',
-    'taq-polymerase',
-    'taraba',
-    'taranis',
-    'tarara',
     'tardieu',
-    'tardree',
-    'targe',
-    'targed',
-    'target-oriented',
-    'tariff-cutting',
-    'tarlatan',
-    'tarsh',
-    'tartaricum',
-    'tarted-up',
-    'taryba',
-    'tarzans',
-    'tasamma',
-    'tasks/job',
-    'taslik',
-    'taste-makers',
     'tastefulness',
-    'tastelessly',
-    'tataurangi',
-    'tatlow/labour',
-    'tattler',
-    'tau-taus',
-    'taughmonagh',
-    'taunton-bridgwater',
-    'taupes',
-    'tauride',
-    'tauter',
-    'tautologically',
-    'tavanagh',
-    'tavgi',
-    'tavira',
-    'tawfiq',
     'tawnies',
-    'tax-sparing',
-    'tax/benefit',
-    'taxability',
-    'taxational',
-    'taxations',
-    'taxi-jams',
-    'taxi-vans',
-    'taxies',
-    'taxingly',
-    'taxiways',
-    'taylor-robinson',
-    'taylor/conservative',
-    'taylor/scotland',
-    'tayloristic',
-    'tayport',
     'taysiders',
-    'tbms',
-    'tchaa-kozah',
-    'tchad',
-    'tchalim',
-    'tchiaka',
-    'tchin-tabaradene',
-    'td27',
-    'tdx',
-    'tea-service',
-    'teacher(s)',
-    'teacher-friendly',
-    'teacher-governors',
-    'teacher-initiated',
-    'teacher-produced',
-    'teacher-researcher',
     'teacher-time',
-    'teacloth',
-    'team-made',
-    'team-members',
-    'teardrop-shaped',
-    'tearless',
-    'tears.',
-    'teaset',
-    'teatle',
-    'technerd',
-    'technetium-labelled',
-    'technicoloured',
-    'techno-economic',
-    'techno-fear',
-    'technology-intensive',
-    'technotronic',
     'teddy-boys',
-    'tedris',
-    'teeline',
-    'teen-age',
-    'teen-only',
-    'teeny-weeny',
-    'tegeryn',
-    'tegulae',
-    'teichoic',
-    'teide',
-    'tel-aviv',
-    'teland',
-    'telangana',
-    'tele2',
-    'teleclub',
-    'telegenic',
     'telegraaf',
-    'teleologically',
-    'teleologies',
-    'telepherique',
-    'teleplay',
-    'teleportation',
-    'telescreens',
-    'televangelism',
-    'televangelist',
-    'televisualisation',
-    'telfords',
-    'tellership',
-    'telluric',
-    'telser',
-    'teltschik',
-    'telve',
     'tema',
-    'temba',
-    'templebrough',
-    'tempora',
-    'temporal-directed',
-    'ten-foot-long',
-    'ten-length',
-    'ten-millionth',
-    'ten-record',
-    'ten-thousandth',
-    'tenancy-in-common',
-    'tenants-at-will',
-    'tenbel',
-    'tenda',
-    'tenggara',
-    'tenosynovitis',
     'tenrecs',
-    'tent-like',
-    'tentacular',
-    'tentmakers',
-    'tenuicollis',
-    'tenuispina',
-    'teol&oacute;gicos',
-    'tep\'92',
-    'teph',
-    'tephrachronology',
-    'tequilas',
-    'terebellids',
-    'terell',
-    'terminalia',
-    'terpstra',
-    'terr',
     'terracotta-tiled',
-    'terrenoire',
-    'terrier-like',
-    'terries',
-    'terrigenous',
-    'terror-dream',
-    'terrorizes',
-    'terry-thomas',
-    'tery',
-    'terza',
-    'tesdale',
-    'teshub',
-    'teson',
-    'tessi',
-    'test-beds',
-    'test-kits',
     'tetchiness',
-    'tete-a-tete',
-    'tetford',
-    'tetlock',
-    'tetrachlorobenzene',
-    'tetrachloromethane',
-    'tetrapeptide/cyp',
-    'tetrapods',
-    'tettron',
-    'tetua',
-    'teucrium',
-    'teudisca',
-    'teulings',
-    'teutonicus',
-    'tewson',
-    'texnik',
     'text-as-product',
-    'textile-workers',
-    'teynham',
-    'tg77',
-    'tgf&bgr',
-    'th&eacute;rouanne',
-    'th\'going',
-    'th\'had',
-    'th\'money',
-    'th\'see',
-    'th2',
-    'th2-like',
-    'thackley',
-    'thai-cambodian',
-    'thaids',
-    'thamesside',
     'thangsing',
-    'thank-offerings',
-    'tharm',
-    'tharp',
-    'that-s',
-    'thaumaturge',
-    'them-and-us',
-    'thematization',
-    'theme(s)',
-    'themeless',
-    'thenardite',
-    'theo-ben',
-    'theodoracopulos',
-    'theologist',
-    'theopropoi',
-    'theoretically-based',
     'thera-vada',
-    'therapy/social',
-    'theratest',
-    'thermite',
-    'thermo-dynamics',
-    'thermoacidophilic',
-    'thermogenesis',
-    'thermographic',
-    'thermoline',
-    'thermosets',
-    'thermostatically-controlled',
-    'thiefmaster',
-    'thin-bladed',
-    'thingeys',
-    'thingummies',
-    'thingys',
     'think-i',
-    'thinly-populated',
-    'thiobarbituric',
-    'thiols',
-    'third-parties',
-    'third-years',
-    'thirty-eighth',
-    'thirty-feet',
-    'thirty-fold',
-    'thirty-four-year-old',
-    'thirty-fourth',
-    'thirty-ninth',
-    'thirty-seventh',
-    'thirty-strong',
-    'this.',
-    'thistleton',
     'tholeiitic',
-    'thomas-ferrand',
-    'thome',
-    'thompson/oxford',
-    'thomsett',
-    'thorbrandsson',
-    'thore',
-    'thorey',
-    'thorngarth',
-    'thornton-norris/contestant',
-    'thorssen',
-    'thought-disordered',
-    'thought-modalities',
-    'thouless',
-    'thousand-franc',
-    'thousand-headed',
     'thousand-year-old',
-    'thoza',
-    'thr37',
-    'thrants',
-    'thready',
-    'threat.',
-    'threatfulness',
-    'thredbo',
-    'three&ndash;car',
-    'three&rehy;month',
-    'three-arched',
-    'three-ball',
-    'three-bar',
-    'three-blade',
-    'three-category',
-    'three-chambered',
     'three-character',
-    'three-class',
-    'three-coin',
-    'three-d',
-    'three-digit',
-    'three-eighths',
-    'three-hourly',
-    'three-judge',
-    'three-lamp',
-    'three-mile-square',
-    'three-million',
-    'three-month-long',
-    'three-pointers',
-    'three-putts',
-    'three-quartered',
-    'three-set',
     'three-syllable',
-    'three-three',
-    'three-three-two',
-    'three-try',
-    'three-under-par',
-    'three-years',
-    'three.dimensional',
-    'threshthwaite',
-    'thrice-married',
-    'thrie',
-    'thriftlessness',
-    'throated',
-    'throbbingly',
-    'throne-like',
-    'through-way',
-    'throughs',
     'throup',
-    'throw-off',
-    'throwline',
-    'thrunet',
-    'thulani',
-    'thumersbach',
-    'thunderings',
-    'thunks',
-    'thurgoland',
-    'thurible',
-    'thymidylate',
-    'tianamen',
-    'tibbet',
-    'tickencote',
-    'tickety',
-    'ticklers',
     'tid',
-    'tiday',
-    'tiddly-om-pom-pom',
-    'tiddly-winks',
-    'tidi',
-    'tie-off',
-    'tie-rods',
-    'tie-wearing',
-    'tietze',
-    'tiggles',
-    'tiggy',
-    'tight-arsed',
-    'tightly-fitting',
-    'tijn',
-    'tikaram',
-    'tikrit',
     'tildarg',
-    'tillites',
-    'tillsley',
-    'timberwolf',
-    'time-bombs',
-    'time-capsules',
-    'time-charts',
-    'time-inconsistent',
-    'time-keepers',
-    'time-lags',
-    'time-of-flight',
-    'time-path',
-    'time-scheme',
-    'time-sensitive',
-    'time-signatures',
-    'time-traveller',
     'time-wasters',
-    'time.',
-    'time/lan',
-    'time=0',
-    'timeous',
-    'timewatch',
-    'timson',
-    'tin-lurky',
-    'tinakilly',
-    'tindery',
-    'tinhead',
-    'tinidazole',
-    'tinily',
-    'tinkerer',
-    'tinkerers',
-    'tinkerings',
     'tinks',
-    'tinner',
-    'tinnily',
-    'tinterow',
-    'tinwell',
-    'tio&amp;sub2',
-    'tipped-in',
-    'tippets',
-    'tippi',
-    'tirailleurs',
-    'tiram',
-    'tisbury',
-    'tischler',
-    'tisdale',
-    'titfer',
-    'titherington',
     'tithings',
-    'titillates',
-    'titivating',
-    'titkin',
-    'title/',
-    'titoist',
-    'titoists',
-    'tiu',
-    'tivoli/courier',
-    'tivoli/sentry',
-    'tizwin',
-    'tjaereborg',
-    'tjiriange',
-    'tlf',
-    'tltp',
-    'tmjillo',
     'tmpmbx',
-    'tn2',
-    'to-be-cs',
-    'toalipi',
-    'toast-racks',
-    'tobernalt',
-    'tocantins',
-    'tocarno',
-    'tocketts',
-    'tocknell/gloucestershire',
-    'todas',
-    'today/icr/29.6.93',
-    'todd-reeve',
-    'todorovic',
-    'todt',
-    'todtheim',
     'toepfer',
-    'tofa',
-    'toge',
-    'toilet-paper',
-    'toilet-seat',
-    'toisechs',
-    'toj&iacute;n',
-    'token-ring',
-    'told\'em',
-    'tolen',
-    'tolkin',
-    'tollesby',
-    'tolming',
-    'tolstoy/historian',
-    'tolworth',
-    'tom-tom',
     'tomashevsky',
-    'tomatin',
-    'tombolos',
-    'tomentosa',
-    'tomic',
-    'tommasinianus',
-    'tomorra',
-    'tomsett',
-    'tomsky',
-    'tonalite',
-    'tone-colours',
-    'tongue-twisting',
-    'tongued-and-grooved',
-    'tongueless',
-    'tonha',
-    'tonicity',
     'tonino',
-    'tonneau',
-    'tonneaux',
-    'tonnies',
-    'tonofibrillae',
-    'tonography',
-    'tonsillar',
-    'tonus',
-    'too-bright',
-    'too-easy',
-    'too-heavy',
-    'too-much',
-    'too-rapid',
-    'too-ready',
-    'too-short',
-    'tools.',
     'toon/masters',
-    'tooth-like',
-    'top-boots',
-    'top-five',
-    'top-knots',
-    'top-most',
-    'top-of-the',
-    'top-score',
-    'topcoats',
-    'topic-neutral',
-    'topic-shifts',
-    'topic/comment',
-    'toplessness',
-    'toppesfield',
-    'torchbearers',
-    'torching',
     'tore-andre',
-    'torgau',
-    'torksey',
-    'tormenter',
-    'torn-out',
-    'toroni',
-    'torque/',
-    'torque/speed/switching',
-    'torricelli',
-    'torro',
-    'tortworth',
-    'toru',
-    'torun',
-    'torvizcon',
-    'tory-free',
-    'tory-voting',
     'tory/liberal',
-    'tosteson',
-    'totius',
-    'totu',
-    'touch-paper',
-    'touch_with',
-    'touchin\'',
-    'toughter',
-    'toumba',
-    'toup&eacute;e',
-    'tour.',
-    'tourist/visitor',
-    'tourneys',
-    'towbar',
-    'towerham',
-    'townee',
     'townfolk',
-    'toyama',
-    'toybox',
-    'tozama',
-    'tpc-c',
-    'tps-a',
-    'tr.',
-    'tr14',
-    'tr15',
-    'tr16',
-    'trabboch',
-    'trablos',
-    'traceability',
-    'traceries',
-    'tracheation',
-    'trachinians',
     'track-suits',
-    'trades-union',
-    'tradgedy',
-    'tradi',
-    'trading-off',
-    'tradition-modernity',
-    'traditional-looking',
-    'traditionally-minded',
-    'traf',
-    'traffic-calmed',
-    'traffic-orientated',
-    'trainable',
-    'training-school',
-    'traligill',
-    'tralles',
-    'tramstop',
     'tran1',
-    'tranexamic',
-    'tranquillo',
-    'trans-cultural',
-    'trans-manche',
-    'trans-mediterranean',
-    'trans-saharan',
-    'trans-tasman',
-    'trans1a',
-    'transaction(s)',
-    'transactions.',
-    'transactivator',
-    'transaxial',
-    'transcatheter',
-    'transcranial',
-    'transcriber',
     'transcytosis',
-    'transdermal',
-    'transects',
-    'transfer-in',
-    'transferences',
-    'transfixion',
-    'transformant',
-    'transformational-generative',
-    'transgeneic',
-    'transgressively',
-    'transitionally',
-    'transjordanian',
-    'transmigrasi',
-    'transmutationism',
-    'transmutationist',
-    'transomed',
     'transoxide',
-    'transphasing',
-    'transposable',
-    'transposon',
-    'transscript',
-    'transvik',
-    'trapani',
-    'trapattoni',
-    'trattorie',
-    'traube',
-    'traubert',
-    'traumata',
-    'traveler',
-    'travem&uuml;nde',
-    'travois',
-    'traxcavator',
     'treacherousness',
-    'treasure-chest',
-    'treasure-seekers',
-    'treatin\'',
-    'treatment-resistant',
-    'tree-creepers',
-    'tree-dwellers',
-    'tree-farmers',
-    'tree-rings',
-    'treece',
-    'treeman',
-    'treetrunks',
-    'trefeglwys',
-    'tregear',
-    'trekky',
-    'trelliswork',
     'trematode',
-    'trembler',
-    'tremula',
-    'tren',
-    'trenchancy',
-    'trend&lt;0.001',
-    'treorchy',
-    'trepke',
-    'trepper',
-    'trespassory',
-    'trewavas',
-    'trezise',
-    'tri-motor',
-    'tri-national',
-    'tri-state',
-    'trial-run',
     'triallists',
-    'triathlete',
-    'triathlons',
-    'tribrachidium',
-    'tributers',
-    'tributyl',
-    'tricarboxylic',
-    'trichlorophenol',
-    'trichostrongyloidea',
-    'trichostrongylosis',
-    'trichothecenes',
-    'trichrome',
-    'tricksiness',
-    'tridiagonal',
-    'triet',
-    'triethanolamine',
     'trifasciatus',
-    'trifolii',
-    'trifurcata',
-    'triglyceride-rich',
-    'trilobozoans',
-    'trim-tabs',
-    'trimeter',
-    'trimnasium',
-    'trinidadians',
-    'trinit&eacute',
-    'trinite',
-    'trinucleid',
-    'trinucleotide',
-    'trio-kenwood',
-    'tripes',
-    'triple-b-minus',
     'triple-b-plus',
-    'triple-glazed',
-    'tripolitania',
-    'trippe',
-    'tris.hcl',
-    'trist&atilde;o',
-    'tritocerebrum',
-    'triumphally',
-    'trivalent',
-    'trivets',
-    'trms',
-    'trna-structure',
-    'troake',
-    'trocaire',
-    'troctolites',
-    'troglodyte',
     'troi',
-    'trojamowicz',
-    'tromans',
-    'tromp',
-    'trondhjemites',
-    'troosers',
-    'troph&icirc;me',
-    'trophectodermal',
-    'tropically',
-    'troppo',
-    'troscheli',
-    'trost',
-    'troublespots',
-    'trounce',
-    'trouser-legs',
-    'trouserlegs',
     'trouserless',
-    'trousseaux',
-    'trout-fishing',
-    'troutless',
-    'troverent',
-    'trowbridge/wiltshire',
-    'trubridge',
-    'truck-drivers',
-    'truck-mounted',
-    'truckles',
-    'truda',
-    'trudernish',
-    'trudgenell',
-    'trueba',
-    'truffer',
-    'trumpet-shaped',
     'trunkal',
-    'trunkful',
-    'truran',
-    'trustee.',
-    'trusteeships',
-    'truster',
-    'trustram',
-    'truth\'',
-    'truth-conditionally',
-    'truth-functional',
-    'trysil',
-    'tryweryn',
-    'ts5',
-    'tsarskoye',
-    'tsbs',
-    'tshabalala',
     'tsien',
-    'tsikata',
-    'tsimshian',
-    'tsoubelis',
-    'tsr.2',
-    'tsr2',
-    'tssis',
-    'tst-1',
-    'tstststs',
-    'tsunoda',
-    'tsvetaeva',
-    'tt300',
-    'ttbs',
-    'tth',
-    'ttl-compatible',
-    'tu\'ipelehake',
     'tu\'ma',
-    'tu-134',
-    'tu-144',
-    'tu/vous',
-    'tuairisc',
-    'tuavao',
-    'tubaeforme',
-    'tubas',
-    'tubbing',
-    'tube-wells',
-    'tubercule',
-    'tubergen',
-    'tuberosum',
-    'tuccs',
-    'tuck-brown',
-    'tucked-in',
     'tuddingfield',
-    'tue&ndash;fri',
-    'tuebingen',
-    'tughan',
-    'tugwell',
-    'tuilaepa',
-    'tuinal',
-    'tujetschtal',
-    'tulkarm',
-    'tullus',
-    'tuman',
-    'tumans',
-    'tumba',
-    'tumblerful',
-    'tumefaciens',
-    'tumors',
     'tumourigenic',
-    'tump-line',
-    'tunability',
-    'tune-in',
-    'tuneable',
-    'tunga',
-    'tunnel-like',
-    'tunnelers',
-    'tuonela',
-    'tupua',
-    'turbett',
-    'turbo-alternators',
-    'turbo-chargers',
-    'turboprops',
-    'turbots',
-    'turbulences',
     'turco-persian',
-    'turkish-cypriots',
-    'turkish-soviet',
-    'turn-final',
-    'turnbacks',
-    'turnberg',
-    'turned-in',
-    'turned-off',
-    'turner/tribute',
-    'turnerie',
-    'turnovsky',
-    'turske',
-    'turtle-dove',
-    'turtledove',
-    'tussie-mussies',
-    'tutton',
     'tuttston',
-    'tutworker',
-    'tuxen',
-    'tuxis',
-    'tuxtla',
-    'tuxtlas',
-    'tuz',
-    'tv/com',
-    'tv/video',
-    'tvt1',
-    'tvtimes',
-    'tw18',
-    'tw5',
-    'tw68',
-    'tw9',
-    'tweedale',
     'tweede',
-    'tweedsdale',
-    'tween-20',
-    'tweeters',
-    'twelve-bores',
-    'twelve-strong',
-    'twenty-fifth-century',
-    'twenty-first-century',
-    'twenty-nine-year-old',
-    'twentyfold',
-    'twicer',
-    'twin-elliptic',
-    'twines',
-    'twinwoods',
-    'twisters',
-    'twistings',
     'twitbread',
-    'twitted',
-    'two-adult',
-    'two-aisled',
-    'two-and',
-    'two-axle',
-    'two-chain',
-    'two-character',
-    'two-column',
-    'two-day-old',
-    'two-eighty',
-    'two-for-nine',
-    'two-horned',
-    'two-hundred-year-old',
-    'two-layered',
-    'two-million',
     'two-phase-on',
-    'two-place',
-    'two-plus-one',
-    'two-position',
-    'two-screen',
-    'two-steps',
-    'two-two-six',
-    'two-wheelers',
-    'two-wicket',
-    'twoness',
-    'twopart',
-    'twopennorth',
-    'twyble',
-    'tx10i',
-    'tyana',
-    'tybion',
     'tyiven',
-    'tylney',
-    'tympany',
-    'tyncastle',
-    'tynte',
-    'type(s)',
-    'type-approved',
-    'type-b',
-    'typhina',
-    'tyrannise',
-    'tyrannize',
-    'tyre-marks',
-    'tyrians',
-    'tyrosinase-positive',
-    'tytherley',
-    'tywi',
     'tzeng',
-    'u*',
-    'u-bahn',
-    'u-test',
-    'u.852',
-    'u.d',
-    'u.g.c.',
-    'u.s.&dollar;2m.',
-    'u/kg',
-    'u/kg/h',
-    'u/s',
-    'u/vs',
-    'u15',
-    'u17',
-    'u19s',
-    'u5',
     'u6-gene',
-    'u6000/75',
-    'uachtar&aacute;n',
-    'uaine',
-    'ubahni',
-    'ubiquinones',
-    'ubs-phillips',
-    'ubud',
-    'ucca/pcas',
-    'uckington/gloucestershire',
-    'udca',
-    'uderzo-goscinny',
-    'udimore',
-    'udjuu',
-    'uds',
-    'uerdingen',
     'uff/uvf',
-    'ug/m&amp;sup3',
-    'ug7',
-    'uglification',
-    'uha',
-    'uitf9',
-    'ujiji',
-    'ujjain',
-    'uk-',
-    'uk-listed',
-    'uk-originated',
-    'ulba',
-    'ulcerate',
-    'ulex',
-    'ullmann-harris',
-    'ulnae',
     'ulrik',
-    'ultan',
-    'ultimates',
-    'ultra-competitive',
-    'ultra-drawn',
-    'ultra-fine',
-    'ultra-leftism',
-    'ultra-refined',
-    'ultra-scan',
-    'ultra-soft',
-    'ultrablock',
-    'ultracentrifugation',
-    'ultraclear',
-    'ultraconservative',
-    'ultrafiltration',
-    'ultraman',
     'ultrasensitive',
-    'ultrasonically',
-    'ultrasonicator',
-    'ululations',
-    'ulus',
-    'umalatova',
-    'umbelliferous',
-    'umbra',
-    'umbrageous',
-    'umf1009t',
-    'ummed',
-    'umwelten',
-    'un-italian',
-    'un-natural',
-    'un-naturally',
-    'un-organized',
     'unacademic',
-    'unaccomplished',
-    'unaffected.',
-    'unafflicted',
-    'unalienated',
-    'unanaesthetised',
-    'unanchored',
-    'unassumingly',
-    'unattenuated',
-    'unattested',
-    'unbacked',
-    'unbelted',
-    'unberogen',
-    'unberogens',
-    'unbiasedness',
-    'unblended',
     'unblinkered',
-    'unblocks',
-    'unblushingly',
-    'unbodied',
-    'unbonded',
-    'unbooked',
-    'unboxed',
-    'unbreathable',
-    'unbuffered',
-    'unbundler',
-    'unburdens',
-    'uncan',
-    'uncas',
-    'unchangeability',
-    'uncharismatic',
-    'unchilled',
     'unchosen',
-    'uncitedness',
-    'unclassed',
-    'uncleanliness',
-    'uncleaved',
-    'uncoded',
-    'uncoils',
-    'uncomfortable-looking',
-    'uncompounded',
-    'uncomprehended',
-    'unconfused',
-    'unconstructive',
-    'uncontacted',
-    'uncontained',
-    'uncontrolledly',
-    'unconventionally',
     'uncooperativeness',
-    'uncredited',
-    'uncriticized',
-    'uncrushed',
-    'unctuousness',
-    'uncurious',
-    'uncurls',
-    'uncustomed',
-    'undatable',
-    'undecapeptide',
-    'undecipherable',
-    'undefeatable',
-    'under-10s',
-    'under-17s',
-    'under-achieved',
-    'under-bidder',
     'under-capitalisation',
-    'under-car',
-    'under-determines',
-    'under-estimating',
-    'under-five',
-    'under-frames',
-    'under-lessee',
-    'under-provision',
-    'under-recognised',
-    'under-sevens',
-    'under-spendings',
-    'under-using',
-    'under-value',
-    'underachieved',
-    'underachievers',
-    'underaged',
     'underascertainment',
-    'undercliffe',
-    'underconsumptionist',
-    'underdale',
-    'underdense',
-    'underdrawers',
-    'underdressed',
-    'undergird',
-    'undergirded',
-    'underinsured',
-    'underlexicalised',
-    'underrepresentation',
-    'underserved',
-    'undershorts',
-    'underspendings',
-    'understandability',
     'understocked',
-    'undertows',
-    'undertrial',
-    'underutilized',
-    'undervoice',
-    'underwings',
-    'undesigned',
-    'undetectably',
-    'undipped',
-    'undistinguishable',
-    'undiversified',
-    'undogged',
-    'undrilled',
-    'unedic',
-    'uneducative',
-    'unef',
     'unembellished',
-    'unendurably',
-    'unevaluated',
-    'unexpecting',
-    'unextracted',
-    'unfeelingly',
-    'unfishable',
-    'unflappability',
-    'unflushed',
-    'unforecastable',
-    'unforested',
-    'unforgivingly',
-    'unforgivingness',
-    'unforseeable',
-    'unfossiliferous',
-    'unfragmented',
     'unfrequently',
-    'unfroze',
-    'unfussed',
-    'ungainliness',
-    'ungallantly',
-    'ungendered',
-    'ungenerated',
-    'ungently',
-    'ungigged',
-    'ungoed-thomas',
-    'ungraceful',
-    'ungulate',
-    'unhandled',
-    'unharnessed',
-    'unheaded',
-    'unhelped',
     'unhelpfulness',
-    'unhidden',
-    'unhit',
-    'unholstered',
-    'unhonoured',
-    'unhoused',
-    'uni-dimensional',
-    'unia',
-    'uniculture',
-    'unicycling',
-    'unidimensionality',
-    'uniformitarians',
-    'unimposing',
-    'unimpressively',
-    'unintimidated',
-    'uninventive',
     'union-sponsored',
-    'union-united',
-    'uniplus+',
-    'unisql/x',
-    'unit-type',
-    'uniteds',
-    'unitisation',
-    'units/h',
-    'units/kg',
-    'unity.',
-    'univ.',
-    'univair',
-    'universalisable',
-    'universitet',
-    'university-controlled',
-    'university-validated',
     'university/edinburgh',
-    'unix\'',
-    'unix-compatible',
-    'unixworld',
-    'unjointed',
-    'unknowability',
-    'unlashed',
-    'unlatching',
-    'unlawed',
-    'unleached',
-    'unleased',
-    'unlevel',
-    'unlifted',
-    'unlikeness',
-    'unmaintained',
-    'unmannered',
     'unmechanised',
-    'unmechanized',
-    'unmended',
-    'unmetamorphosed',
-    'unmilitary',
-    'unmonitored',
-    'unmoveable',
-    'unnacceptable',
-    'unneccessary',
-    'unnerves',
-    'unnoticing',
-    'unopenable',
-    'unorthodoxies',
-    'unos',
-    'unpatented',
-    'unperceptive',
     'unpigeonhole-able',
-    'unpigmented',
-    'unplaited',
-    'unpleasantnesses',
-    'unpleased',
-    'unploughed',
-    'unplumbed',
-    'unpoliced',
-    'unprecedently',
-    'unpredicatable',
-    'unpressured',
-    'unpressurised',
-    'unprofitably',
-    'unprogrammatic',
-    'unpubl.',
-    'unpulsed',
     'unquarantined',
-    'unr&aelig;d',
-    'unrated',
-    'unrationed',
-    'unravaged',
-    'unreasoanble',
-    'unreasonable.',
-    'unrecognizably',
-    'unrecordable',
-    'unrecovered',
-    'unredeemable',
-    'unreferenced',
-    'unrefuelled',
-    'unreliably',
-    'unremarkably',
-    'unrested',
     'unreviewed',
-    'unrideable',
-    'unrigorous',
-    'unrobed',
-    'unroofed',
-    'unsalaried',
-    'unsated',
-    'unsatisfactoriness',
-    'unsatisfiable',
-    'unsavouriness',
-    'unsayable',
-    'unscented',
-    'unscholarly',
-    'unscored',
-    'unseparated',
-    'unserious',
     'unsevered',
-    'unsharp',
-    'unsheltered',
-    'unshowy',
-    'unsightliness',
-    'unsignalled',
-    'unsituated',
-    'unslaked',
-    'unslinging',
-    'unsolvable',
-    'unspecial',
-    'unspecifiable',
-    'unspecifically',
-    'unspinnable',
-    'unspirited',
-    'unsponsored',
     'unsquashed',
-    'unstack',
-    'unsterilised',
-    'unsterilized',
-    'unstreamlined',
-    'unstressful',
-    'unsuspicious',
-    'unsustainably',
-    'unswayed',
-    'unt',
-    'untameable',
-    'untanned',
-    'untaped',
-    'untechnical',
-    'untempered',
-    'untheorised',
     'unthink',
-    'unthought-out',
-    'untipped',
-    'untiringly',
-    'untrammeled',
-    'untrampled',
-    'untrapped',
-    'untripped',
-    'unu',
-    'unutilised',
-    'unwalled',
-    'unware',
-    'unwarned',
-    'unwatchable',
-    'unwaxed',
-    'unwearable',
     'unwieldly',
-    'unworldliness',
-    'uof',
-    'up-stretched',
-    'up-turn',
-    'up/left',
-    'up_,_up_until',
-    'upbraids',
-    'upia',
-    'uplandicum',
-    'uplight',
-    'upnor',
-    'upper-management',
-    'upper-tier',
-    'uppon',
-    'uprighted',
     'ups-and-downs',
-    'upstand',
-    'upturning',
-    'upware',
-    'uraga',
-    'urban-land',
-    'urban-orientated',
-    'urban-oriented',
-    'urban/industrial',
-    'urbana',
-    'urbanec',
-    'urea-formaldehyde',
-    'urey',
-    'urg',
-    'urgently-needed',
-    'uriel',
     'uring',
-    'urodynamic',
-    'uroflow',
-    'urogram',
-    'uromastix',
-    'urrah',
-    'urrutikoetxea',
-    'ursinum',
-    'ury',
-    'us&dollar;0.5m',
-    'us&dollar;1,040',
-    'us&dollar;1,080',
-    'us&dollar;1,300,000',
-    'us&dollar;1,500,000',
-    'us&dollar;1,800,000',
-    'us&dollar;1.00=101.54',
     'us&dollar;1.00=nz&dollar;1.7612',
-    'us&dollar;11,000,000',
-    'us&dollar;110,000',
-    'us&dollar;115,000',
-    'us&dollar;12,400',
-    'us&dollar;12,500',
-    'us&dollar;120',
-    'us&dollar;145,000,000',
-    'us&dollar;16',
-    'us&dollar;16,500',
-    'us&dollar;160,000,000',
-    'us&dollar;17,000',
-    'us&dollar;2,700',
-    'us&dollar;2,900',
-    'us&dollar;200,000',
-    'us&dollar;203',
     'us&dollar;205',
-    'us&dollar;21,000',
-    'us&dollar;210,000,000',
-    'us&dollar;220',
-    'us&dollar;25',
-    'us&dollar;27',
-    'us&dollar;270,000,000',
-    'us&dollar;28,000,000',
-    'us&dollar;280',
-    'us&dollar;29,000,000',
-    'us&dollar;290',
-    'us&dollar;3,600',
-    'us&dollar;3,700',
-    'us&dollar;320,000,000',
-    'us&dollar;330,000,000',
-    'us&dollar;35',
     'us&dollar;350,000,000',
-    'us&dollar;370,000,000',
-    'us&dollar;39,000,000',
-    'us&dollar;4,400',
-    'us&dollar;4,800',
-    'us&dollar;41,000,000',
-    'us&dollar;440',
-    'us&dollar;47,000,000',
-    'us&dollar;480',
-    'us&dollar;5,300',
-    'us&dollar;500,000',
-    'us&dollar;52,000',
-    'us&dollar;55,000,000',
-    'us&dollar;580',
-    'us&dollar;6,500,000',
-    'us&dollar;6,700',
     'us&dollar;61,000',
-    'us&dollar;630',
-    'us&dollar;65',
-    'us&dollar;650',
-    'us&dollar;7,200',
-    'us&dollar;71,000,000',
-    'us&dollar;748,000,000',
-    'us&dollar;75,000',
-    'us&dollar;750,000,000',
-    'us&dollar;8,000,000',
-    'us&dollar;8,500',
-    'us&dollar;87',
-    'us&dollar;9,000,000',
-    'us&dollar;99,000',
-    'us-british-french',
-    'us-canada',
     'us-financed',
-    'us-pakistan',
-    'us-palestinian',
-    'us-south',
-    'us-them',
-    'us-turkish',
-    'us/canadian',
-    'us/them',
-    'use-specific',
-    'useless.',
-    'user&ndash;friendly',
-    'user-accessible',
-    'user-orientated',
-    'useraccesslogical',
-    'usery',
-    'usinor-sacilor',
     'uskudar',
-    'usman',
-    'usufruct',
-    'usworth',
-    'utnapishtim',
-    'utraquists',
-    'utrophin',
-    'utterword',
-    'uuj',
-    'uv-cross',
-    'uveitis',
-    'uway',
-    'uws',
-    'uzcategui',
-    'v&aacute;zquez',
-    'v&eacute;n&eacute;on',
     'v-p',
-    'v-tool',
-    'v.2',
-    'v.3',
-    'v.4-compatible',
-    'v.diff',
-    'v.h.',
-    'v.ii',
-    'v.l.r.',
-    'v/4',
-    'v/c',
-    'v1.0',
-    'v1.2',
-    'v2.0',
-    'v386mx',
-    'v4.0',
     'v4.2',
-    'v6.0',
-    'v6028',
-    'v7',
-    'v7116',
-    'v7771',
-    'v8\'s',
-    'va\'aiga',
-    'vachek',
-    'vachey',
-    'vacillates',
-    'vacuo',
-    'vae',
-    'vaesken',
-    'vaginatum',
-    'vaguely-worded',
     'vainest',
-    'vais',
-    'vaithilingam',
-    'valcarlos',
-    'valdas',
-    'valedictions',
-    'valenta',
-    'valet-butler',
-    'valga',
-    'valias',
-    'validate.mod',
-    'valka',
-    'vallees',
-    'vallier',
-    'vallins',
-    'vallis-nay-ria',
     'valmontone',
-    'valses-caprices',
-    'valuably',
-    'valuation.',
-    'value\'',
-    'value-creating',
-    'value/bank',
-    'vambacs',
-    'vampirism',
-    'vancouver-based',
-    'vandell&ograve;s',
-    'vanderville',
-    'vaned',
-    'vanharity',
-    'vantool',
-    'vanuanu',
     'vaporeuse',
-    'vapors',
-    'vapourise',
-    'vapoury',
-    'varapaev',
-    'variable.reluctance',
-    'variables.',
-    'varicella',
-    'varicella-zoster',
-    'varicosed',
-    'variometer',
-    'varlets',
-    'varren',
-    'varsities',
-    'vase-paintings',
-    'vasomotor',
     'vasorum',
-    'vassalli',
-    'vassily',
-    'vastest',
-    'vastly-improved',
-    'vaubel',
-    'vaughan-williams',
-    'vavasor',
-    'vaxcluster',
-    'vbac',
-    'vc141l',
-    'vcl.',
-    'vcq',
-    'vdm',
-    've&ccaron;er',
-    've-hickles',
     'veals',
-    'vecchia',
-    'vectorisation',
-    'vedettes',
-    'vee-shaped',
-    'veerendra',
-    'vegarshei',
-    'vegetable-growing',
-    'vegetation.',
-    'vehicle.',
-    'vei',
-    'veissid',
-    'vekic',
-    'vel&aacute;squez',
-    'velay',
-    'velichko',
     'velikovskian',
-    'velo-kodak',
-    'velocity-depth',
-    'velum',
-    'velvet-like',
-    'vendobionta',
-    'vendor-specific',
-    'venerable-looking',
-    'venery',
-    'venets',
-    'venkat',
-    'venloer',
-    'venta',
-    'ventham',
-    'ventriculography',
-    'venture-capital',
     'venu',
-    'verandaed',
-    'verb-forms',
-    'verbalizing',
-    'vercelli',
-    'vercingetorix',
-    'verdaguer',
-    'verdala',
-    'verdelho',
-    'verdes',
-    'verdians',
-    'verduga',
-    'verfassungsschutz',
-    'veridical',
-    'veridicality',
-    'veriest',
     'verist',
-    'verlaten',
-    'vermicious',
-    'vermin-proof',
-    'vernus',
-    'versailles-based',
-    'versifiers',
-    'versify',
-    'versine',
-    'versos',
-    'verstehende',
-    'vesco',
-    'vesna',
-    'vesnaver',
-    'vesperae',
-    'vestas',
     'vestryman',
-    'vetterling-braggin',
-    'vfb',
-    'vhs-36',
-    'vhw',
-    'viande',
-    'viands',
-    'vibing',
-    'vibrios',
-    'vibrola',
-    'vibromassage',
-    'viburnums',
-    'vic-wells',
-    'vice-capt',
-    'vice-captaincy',
-    'vice-lord-lieutenant',
     'vice-ministers',
-    'vice-pres.',
-    'vice-provost',
-    'vice-secretary',
-    'vicecomitum',
-    'vicelike',
-    'vich',
-    'vicissitude',
-    'vicomt&eacute;s',
-    'victimising',
-    'victims.',
-    'victoriei',
-    'vidanes',
-    'video-nasties',
-    'video/kate',
-    'videoconference',
     'videovga',
-    'vielle',
-    'vierny',
-    'vierra',
-    'viewboxes',
-    'viewership',
-    'viewley',
-    'viewpark',
-    'viewscreens',
-    'vigd&iacute;s',
-    'vigee-lebrun',
-    'vigia',
-    'vignaket',
-    'vignola',
-    'vilain',
-    'vilaine',
     'vilas',
-    'vilfredo',
-    'villainously',
-    'villancicos',
-    'villanella',
-    'villasana',
-    'villeinage',
-    'villeneuve-renneville',
-    'villers-marmery',
-    'villians',
-    'villosa',
-    'vin&aacute;rna',
-    'vin_de_table',
-    'vinaigre',
-    'vinclozolin',
-    'vindaloos',
     'vindict',
-    'vinebohm',
-    'vinifera',
-    'vinne',
-    'vinopal',
-    'vinosity',
-    'violence.',
-    'violet-scented',
-    'violino',
-    'vipont',
-    'viragos',
-    'virgenes',
-    'virginians',
-    'virginis',
-    'virtualy',
-    'virus-encoded',
     'virustop',
-    'viscose/40%',
-    'viscum',
-    'visitors.',
-    'vissarionovich',
-    'vistors',
-    'visualizations',
-    'vitalistic',
-    'vitamin/mineral',
-    'vitax',
-    'vithoulkas',
-    'vitrify',
-    'vitrinites',
-    'vitriolically',
-    'vitruvian',
-    'vitry',
     'vitulorum',
-    'vivaciously',
-    'viviana',
-    'viviente',
-    'vladilen',
-    'vladimirovich',
-    'vladivar',
-    'vlakplaas',
-    'vlccs',
-    'vldl-triglyceride',
-    'vlnas',
-    'vlor&euml',
-    'vlp',
-    'vlr',
-    'vmmt',
-    'vmps',
     'vocalion',
-    'voda',
-    'voder',
-    'voest-alpine',
-    'voevoda',
-    'vogelweide',
-    'voican-voiculescu',
-    'voidability',
-    'voidness',
-    'vol_au_vent',
-    'volatilities',
-    'volcanic-arc',
-    'volcanically',
-    'volitions',
-    'voljc',
-    'volodimir',
     'voltage-clamped',
-    'voltage-current',
-    'voltage-dependent',
-    'voltairean',
-    'volubility',
-    'volume-composition',
-    'volumetrically',
-    'volunt',
-    'volvulus',
-    'vomitings',
-    'vont',
-    'vorpal',
-    'vorticism',
-    'vostell',
-    'voter-registration',
-    'votives',
     'vou',
-    'vouchsafes',
-    'voulez-vous',
-    'voulu',
-    'vowel-height',
-    'voyeuristically',
-    'vpd',
-    'vpix',
-    'vran&ccaron;i&cacute',
-    'vratas',
-    'vriens',
-    'vrtba',
-    'vs(mynewpos)',
-    'vse/esa',
-    'vt320',
-    'vt5',
     'vuelta',
-    'vught',
-    'vulfranni',
-    'vulgarians',
-    'vulgarized',
-    'vvl',
-    'vxd',
-    'vy&scaron;ehrad',
-    'w&amp;n',
-    'w&divide;2',
-    'w\'i',
-    'w(b)',
-    'w+',
-    'w-sn',
-    'w.1',
-    'w.a.s.p.',
     'w0',
-    'w1h',
-    'wa-a-a-a',
-    'waaaaaark',
-    'waalhaven',
-    'waaqfs',
-    'wabe',
-    'wabster',
-    'wacaday',
-    'wacc-africa',
-    'wacher',
-    'wackett',
-    'wackford',
-    'wackiness',
-    'wadders',
-    'waddya',
     'wade-martins',
-    'waffenschmidt',
-    'wafflers',
-    'wafiq',
-    'wage-cuts',
-    'wage-packets',
-    'wage-paid',
-    'waggishly',
-    'wagglers',
-    'wagon-loads',
-    'wahine',
-    'wahono',
-    'waindell',
-    'waistcoated',
-    'waitings',
-    'waitz',
     'waivable',
-    'wajir',
-    'wakebourne',
-    'wala',
-    'walberg',
-    'waldachquelle',
-    'waldringfield',
-    'walerand',
-    'walk(x)',
-    'walk-around',
-    'walkato',
-    'walking/running',
-    'walkthroughs',
-    'wall-brackets',
-    'wall-lights',
-    'wall-rock',
     'wallace-whitfield',
-    'wallace/deane',
-    'wallacean',
-    'wallachians',
-    'wallensteins',
-    'wallerian',
-    'wallers',
-    'wallower',
-    'wallsbury',
-    'wallwashers',
-    'wallyford',
-    'walna',
-    'walney',
-    'walnut-sized',
-    'walpurgis',
-    'walz',
     'wanborough/wiltshire',
-    'wanding',
-    'waney-edged',
-    'wangtek',
-    'wanjigi',
-    'wankel',
-    'wanklyn',
-    'wanky',
-    'wanlockhead',
-    'wannabee',
-    'wannae',
-    'wanni',
-    'want\'',
-    'wantage/oxfordshire',
-    'wanter',
-    'wantons',
     'war-dance',
-    'war-leaders',
-    'war-stricken',
-    'war-winning',
-    'warbrick',
-    'ward/department',
-    'wardak',
-    'wardie',
-    'wardrop',
-    'wargame',
-    'warke',
-    'warm-coloured',
-    'warm-down',
-    'warm-smelling',
-    'warmness',
-    'warmup',
     'warned-off',
-    'warp-vanes',
-    'warpspace',
-    'warrantor',
-    'warrell',
-    'warrior-ascetics',
-    'was_a',
-    'was_in',
-    'wash/wipe',
-    'washdown',
-    'washer-up',
-    'washer-upper',
-    'washouts',
-    'waslala',
-    'wasn\'t.',
-    'wasnae',
     'wason',
-    'wassell',
-    'wasserflut',
-    'wassyng',
-    'wasta',
-    'watanuki',
-    'watch-keepers',
-    'watengo',
-    'water-birds',
-    'water-bottles',
-    'water-rats',
-    'water-sellers',
-    'water-skier',
-    'water-snails',
-    'water-spirits',
-    'water-stained',
     'water-supplies',
-    'water-taxis',
-    'water-vascular',
-    'water/gloucestershire',
-    'water/oxfordshire',
-    'waterbath',
-    'waterbottle',
-    'waterford/ireland',
-    'waterings',
-    'watermeadows',
-    'watermouth',
-    'waterproofers',
-    'waterskier',
-    'waterskiers',
-    'watersmeet',
-    'watersoluble',
     'wathey',
-    'watmough',
-    'wavepackets',
-    'wawen',
-    'wax-ground',
-    'waxholme',
-    'wayman',
-    'waymouth',
-    'wc1r',
-    'wc94',
-    'wd3',
-    'wdr',
-    'we/us/our',
-    'we32-25',
-    'wealdhere',
-    'wealdlake',
     'weall',
-    'wealth-creators',
-    'wealth-producers',
-    'wealth.',
-    'wearsider',
-    'weasel-eyed',
-    'weather-proof',
-    'weather-tight',
-    'weatherboard',
-    'weatherproofing',
-    'weatherproofs',
-    'weatherworn',
-    'weaverbirds',
-    'web-footed',
-    'webbers',
-    'webbo',
     'webers',
-    'weblin',
-    'wedding-bells',
-    'wedell',
-    'wedghog',
-    'wednesfield',
-    'weedless',
-    'week-out',
-    'weekly/monthly',
-    'weenies',
-    'weeper',
-    'weepings',
-    'weerakoon',
-    'wegeler-deinhard',
-    'wehi',
-    'wehman',
     'weigert-vowinkel',
-    'weighill',
-    'weight-conscious',
-    'weihrich',
-    'weinfelden',
-    'weisbloom',
-    'weismuller',
-    'weissenbach',
-    'weissmuller',
-    'weizenbier',
-    'weizman',
-    'welbourne',
-    'weleminsky',
-    'welfare-orientated',
-    'welfare-tax',
-    'well-administered',
     'well-aerated',
-    'well-aged',
-    'well-authenticated',
-    'well-aware',
-    'well-banked',
-    'well-cared-for',
-    'well-catered',
-    'well-characterized',
-    'well-choreographed',
-    'well-clad',
-    'well-clothed',
-    'well-creased',
-    'well-cultivated',
-    'well-damped',
-    'well-formulated',
-    'well-governed',
     'well-handled',
-    'well-ironed',
-    'well-marshalled',
-    'well-mounted',
-    'well-programmed',
-    'well-pronounced',
-    'well-provisioned',
-    'well-resourced',
-    'well-ripened',
-    'well-risen',
-    'well-satisfied',
-    'well-swept',
-    'well-thought',
-    'well-unionized',
-    'well-washed',
-    'well-women',
     'wellco',
-    'welle',
-    'wellek',
-    'wellestream',
-    'wellow',
-    'wells-next-the-sea',
-    'wellsprings',
-    'welsh-medium',
-    'welshing',
-    'wendland',
-    'wendorf',
-    'wene',
-    'wenner-gren',
-    'were_no',
-    'werefrogs',
-    'werf',
     'werking',
-    'werndl',
-    'werre',
-    'wesel',
-    'wesleys',
-    'wesnes',
-    'wesselman',
-    'wessons',
-    'west-bound',
-    'west/east',
-    'westboro',
-    'westerlands',
-    'westerley',
-    'westerton',
-    'westminster/london',
-    'westoby',
     'westonbirt/gloucestershire',
-    'westphal',
-    'westsandwick',
-    'wet-dock',
-    'wet-dreams',
-    'wet-in-wet',
-    'wetering',
-    'wetheral',
-    'wetheringsett',
-    'wettable',
-    'wetware',
-    'wewelsburg',
-    'weybridgeley',
-    'weyman',
-    'weymarn',
-    'wf/09',
     'wf/20/25/0014',
-    'wfc',
-    'wfd',
-    'wha-',
-    'whaaa',
-    'whalemeat',
-    'whalley-kilmer',
-    'what-ifs',
-    'what-is-it',
-    'what/how',
-    'whatmore',
-    'wheat-fields',
-    'wheel-ruts',
-    'wheeler-dealers',
-    'wheels-up',
-    'wheels.',
     'whelehan',
-    'whereever',
-    'wherewith',
-    'whichcote',
-    'whickens',
-    'whigham',
-    'whip-hand',
-    'whip-wielding',
-    'whipper',
-    'whisperers',
-    'whistle.',
-    'whitby-smith',
-    'white-beam',
-    'white-nosed',
-    'white-sailed',
-    'white-shirted',
     'white-speckled',
-    'white-spot',
-    'white-suited',
-    'white/black',
-    'white/director/oxfordshire',
-    'white/pink',
-    'whiteboards',
-    'whitebrook',
-    'whiteflies',
-    'whiteford',
-    'whitehead/oxfam',
-    'whitehouse/nvala',
-    'whiteland',
-    'whitelands',
-    'whitesmiths',
-    'whithersoever',
     'whitstone',
-    'whitsum',
-    'whitt',
-    'whittal',
-    'whittall',
-    'whittlesea',
-    'whole-coloured',
-    'wholescale',
-    'whooo-ooo',
-    'whorish',
-    'wht',
-    'whump',
-    'wichmann',
-    'wicka',
-    'wickeder',
-    'wickeri',
     'wickremaratne',
-    'widdale',
-    'widdershins',
-    'wide-range',
-    'widecombe',
-    'widely-based',
-    'widely-publicised',
-    'widely-separated',
-    'widenings',
-    'widget-making',
-    'widgie',
-    'widish',
-    'wiederaufbau',
-    'wielders',
-    'wielkopolska',
-    'wienevski',
     'wiens',
-    'wifehood',
-    'wigglers',
-    'wighton',
-    'wightwick',
-    'wigoder',
-    'wigstone',
-    'wikeley',
-    'wiktor',
-    'wilckens',
-    'wilcoxes',
-    'wild-cards',
-    'wild-cat',
-    'wild-collected',
-    'wild-fire',
-    'wildbad',
     'wildeblood',
-    'wildenrath',
-    'wildfell',
-    'wildhagen',
-    'wildridge',
-    'wilfish',
-    'wilfredo',
-    'wilkinsons',
-    'will-o\'-the-wisps',
-    'willendorf',
-    'willfully',
-    'willhelm',
-    'williams-landel-ferry',
-    'williams-trained',
-    'williams/martin',
-    'williams/national',
     'williamstown',
-    'willibald',
-    'willock',
-    'wilmots',
-    'wimbourne',
-    'wimereux',
-    'wimpishly',
-    'wimpishness',
-    'wimples',
-    'win/lose',
-    'winchendon',
-    'wind-bent',
-    'wind-chimes',
-    'wind-dispersal',
-    'wind-induced',
-    'wind-powered',
     'wind-resistant',
-    'wind-shadow',
-    'wind-sucking',
-    'windass',
-    'windchill',
-    'windie',
-    'windir',
-    'windisch',
-    'window-catch',
-    'window-seats',
-    'windowe',
-    'windram',
-    'windsfield',
-    'windspeed',
-    'windtunnel',
-    'windust',
     'wine-bars',
-    'wine-bibbing',
-    'wine-growers',
-    'wineglassful',
-    'winers',
-    'wing-patches',
-    'winglebury',
-    'winglets',
-    'wingmen',
-    'wingroot',
-    'wingwalk',
-    'winklepickers',
-    'winlaton',
-    'winmaster',
-    'winneke',
-    'winner-take-all',
     'winnow',
-    'winogrand',
-    'winscombe',
-    'winter-sports',
-    'wirtshaus',
-    'wisby',
-    'wisconsin-based',
-    'wisecracked',
-    'wishin\'',
-    'wiske',
-    'wisnae',
-    'wisping',
-    'wissenschaftsrat',
-    'wistanstow',
-    'wistaston',
-    'wit-e-wee',
     'witch-burning',
-    'witchell',
-    'with\'',
-    'with-a',
-    'witheld',
-    'withern',
-    'within-class',
-    'within-stimulus',
-    'withold',
-    'withouten',
-    'witlessly',
-    'witterings',
-    'wittfogel',
-    'wittier',
-    'witzmann',
-    'wizansky',
     'wizzing',
-    'wjc',
-    'wksh',
-    'wmg',
-    'wnker',
-    'wodak',
-    'wodie',
-    'woei',
-    'woffling',
-    'woldham',
-    'woldland',
-    'wolf-tools',
-    'wolff-dietrich',
-    'wolffe',
-    'wolfgangsee',
-    'wolong',
     'wolton',
-    'wolveridge',
-    'wolvesey',
-    'woman-centered',
-    'woman-church',
-    'woman-sized',
-    'womanist',
-    'womblike',
-    'wond\'rous',
-    'wonderboy',
-    'wonderwoman',
-    'wonkyness',
-    'wonton',
-    'wood-harper',
-    'wood-lined',
-    'wood-remains',
     'wood-shavings',
-    'wood-working',
-    'woodard',
-    'wooden-bodied',
-    'woodentops',
-    'woodfords',
-    'woodlarks',
-    'woodroofe',
-    'woodstain',
-    'woodstock/oxfordshire',
-    'woodworks',
-    'wookie',
-    'wool/nylon',
-    'woolacott',
-    'woolco',
-    'woolcombers',
     'woolen',
-    'woolfe',
-    'woolfs',
-    'woollier',
-    'woolrich',
-    'woomera',
-    'woonerf-type',
-    'word-association',
-    'word-boundary',
-    'word-detector',
-    'word-finally',
-    'word-lookup',
-    'word-pairing',
-    'word-picture',
-    'wordbook',
-    'wordley',
     'wordprocess',
-    'wordswoth',
-    'work\'ouse',
-    'work-a-day',
-    'work-forces',
-    'work-heads',
-    'work-horse',
-    'work-in',
-    'work-in-school',
-    'work-ins',
-    'work-loads',
-    'work-refusing',
-    'work-sheet',
-    'work-up',
-    'worker-controlled',
-    'worker-directors',
     'worketh',
-    'workface',
-    'workin',
-    'worklessness',
-    'workpieces',
-    'workrates',
-    'workwise',
-    'world-order',
-    'worldscript',
-    'worldviews',
-    'worm-cakes',
-    'wormhole',
-    'wormlike',
-    'wormsley',
-    'worn-in',
-    'worseley',
     'worst-run',
-    'worths',
-    'worts',
-    'wossen',
-    'wotai',
-    'woudhuysen',
-    'woulda',
-    'woulfe',
-    'woundingly',
-    'wozniak',
-    'wp-o',
-    'wq',
-    'wraithwisps',
-    'wranklin',
-    'wratten',
-    'wrcc-26',
     'wren-boys',
-    'wrenbury',
-    'wreocensaete',
-    'wretham',
-    'wright-manley',
-    'wright/the',
-    'writing-off',
-    'writing-pad',
-    'written-up',
-    'wrong\'n',
-    'wrong\'un',
-    'wrotten',
-    'wrottesley',
-    'wrung-out',
-    'wswrrl',
-    'wulf-mathies',
     'wulfnoth',
-    'wulwick',
-    'wummin',
-    'wunderkinder',
-    'wundke',
-    'wurtemberg',
-    'wurts',
-    'wuxi',
-    'ww/april',
-    'wwf-malaysia',
-    'wwf/uk',
-    'wyatville',
-    'wyboston',
-    'wycherley',
-    'wycombe/buckinghamshire',
-    'wye/herefordshire',
     'wyes',
-    'wymanised',
-    'wynand',
-    'wyncote',
-    'wynne-freer',
-    'wyon',
-    'wythall',
-    'wyvill',
-    'wzb',
-    'x(t)',
-    'x-3',
-    'x-neurons',
-    'x-pensive',
-    'x-vote',
-    'x11/news',
-    'x70',
     'xa2000',
-    'xa3',
-    'xanthan',
-    'xantia',
-    'xarites',
-    'xb1',
-    'xb8',
-    'xc2',
-    'xc7',
-    'xciv',
-    'xcix',
-    'xcvii',
-    'xd1',
-    'xe6+',
-    'xenios',
-    'xenolith',
     'xerographic',
-    'xeroxes',
-    'xers',
-    'xf1',
-    'xf2',
-    'xf7+',
-    'xf8',
-    'xfm',
-    'xg6+',
-    'xg7+',
-    'xg8',
-    'xh6+',
-    'xiaokang',
-    'xin',
-    'xingwen',
-    'xiphoid',
     'xizang',
-    'xj220s',
-    'xmin',
-    'xmp-api',
-    'xoftware/32',
-    'xp/s',
-    'xp330',
-    'xpg5',
-    'xrays',
-    'xrt/graph',
-    'xt/at',
-    'xt2500',
-    'xtc/xtp',
-    'xti',
-    'xtp',
-    'xun',
     'xviii.',
-    'xvth',
-    'xwh(n)',
-    'y&amp;r',
-    'y&lsqb;ou&rsqb;r',
-    'y-chromosome',
-    'y-e-s',
-    'y3,800',
-    'y58,000',
-    'y=',
-    'y=0',
-    'yablonsky',
-    'yachties',
-    'yachtswoman',
-    'yack',
-    'yackle',
     'yael',
-    'yagil',
-    'yagninim',
-    'yahama',
-    'yahhh',
-    'yakub',
-    'yakubu',
-    'yala',
-    'yalbury',
-    'yallahs',
-    'yalob',
-    'yamacraw',
-    'yamaha-kemble',
-    'yamal',
-    'yamuna',
-    'yan\'an',
     'yangtse',
-    'yanquis',
-    'yaqoub',
-    'yaqui',
-    'yarab',
-    'yarmulkah',
-    'yarnton/oxfordshire',
-    'yatar',
-    'yatt',
-    'yavas',
-    'yazd',
-    'year\'s',
-    'year(s)',
-    'year-',
-    'year-out',
-    'year.',
     'year/house',
-    'yearningly',
-    'yearwood',
-    'yeast-like',
-    'yellow-and-black',
-    'yellow-and-green',
-    'yellow-back',
-    'yellow-brick',
-    'yellow-eyed',
-    'yellow-flowered',
-    'yellow-grey',
-    'yellow-jacketed',
-    'yellow-tinged',
-    'yellow-tipped',
-    'yellow/orange',
-    'yellowish-white',
     'yeow',
-    'yer\'',
-    'yerofeev',
-    'yers',
-    'yershon',
-    'yest',
-    'yet-to-be',
-    'yewdall',
-    'yick',
-    'yiddishy',
-    'yielder',
-    'yilu',
-    'yingchao',
-    'yitsak',
-    'yitzak',
-    'yo-yos',
     'yobbish',
-    'yoda',
-    'yoder',
-    'yoker',
-    'yoking',
-    'yombo',
-    'yongchang',
-    'yonne',
-    'yonsei',
-    'yoram',
-    'york/lyons',
-    'yorkshires',
-    'yorky',
-    'yoshioka',
-    'you.',
-    'you2',
     'young-avestan',
-    'young/thames',
-    'youngstock',
-    'yourinitials',
-    'yourinitials17',
-    'yourinitials21',
-    'yps',
-    'yr_',
-    'yrieix',
-    'yrl',
-    'yu-chee',
-    'yuills',
-    'yum-yum',
-    'yuma',
-    'yuppified',
-    'yusopov',
     'z&ouml;e',
-    'z&uacute&ntilde;iga',
-    'z(t)',
-    'z-neuron',
-    'z-note',
-    'z02',
-    'z242l',
-    'z42',
-    'z6',
-    'z7',
-    'z=',
-    'z=0',
-    'za&iuml;s',
-    'zaaloff',
-    'zabala',
-    'zabanias',
     'zaccheus',
-    'zacharopoulos',
-    'zaddikim',
-    'zafera',
-    'zaidel',
-    'zaidi',
-    'zairian',
-    'zakharova',
-    'zaks',
-    'zaloshnja',
-    'zama',
-    'zammo',
-    'zanjan',
-    'zaphiriou',
-    'zaremba',
-    'zari',
     'zarlino',
-    'zars',
-    'zawarsin',
-    'zccm',
-    'zebbie',
-    'zebrano',
-    'zech',
-    'zeckhauser',
-    'zei',
-    'zeisel',
-    'zejnulahu',
-    'zekan',
-    'zelenograd',
-    'zelinsky',
-    'zellermayer',
-    'zemindars',
     'zenesa',
-    'zeni',
-    'zens',
-    'zephaniah',
-    'zernik',
-    'zerograv',
-    'zester',
-    'zeuss',
-    'zeyal',
-    'zfx',
-    'zhabotinsky',
-    'zhawa',
-    'zhurid',
-    'ziach',
-    'ziehl-neelsen',
-    'zielinski',
     'zii',
-    'zilberstein',
-    'zilk',
-    'zillis',
-    'zimbabwe-born',
-    'zimmi',
-    'zind',
-    'zinn',
-    'zintec',
-    'ziober',
-    'zn-sod',
-    'zno',
-    'zoa',
-    'zoecke',
-    'zois',
-    'zolder',
     'zongo',
-    'zonked',
-    'zorc',
-    'zorin',
-    'zorio',
-    'zouher',
-    'zoysa',
-    'zubatov',
-    'zubir',
-    'zuccaro',
-    'zuckermann',
-    'zuheir',
-    'zuiderzee',
-    'zuolin',
-    'zupanovic',
-    'zwanenburg',
     'zweckrational',
-    'zwolferhorn',
-    'zygodactyl',
-    'zygoma',
-    'zylpha',
-    'zyuganov',
+)
+
+blocks_29 = (
+    '\'-thelm&aelig;r!(bull;the!0eacute;conomique)$ueil(%tudes!,frac12;-year!2mdash;really&mdash\')something(#uch\'#yes!\'ndash;5\'!6\'!e!-thorn;ingeyri #\'59',
+    '"!8!"80!#are!$gain!\'nothing!"p\'!&twould "-h!#ism!!n"/itro-l-arginine!#tun .1&ndash&frac12!#.6p!%0-ton',
+    '")am-4.30pm"&base-2!91&ndash;7&ndash;8&ndash;4"&-times$$rack!$230s"&5-mile#"mm!(5-degree"&0-seat!%7-day#%match"#.1p""in!)8-country',
+    '!,919&ndash;25 \'2&mdash!%-dg6p",hydroxyethyl!(.0-litre"\'9-litre!\'0-valve""0s!&2-goal!(3-nation!&4-page!&5-hour!.cg342&ndash;02 &3-axis!$.25p',
+    '#$plus!(5-member!&6-page"%5-day \'4&ndash!$-asa"%metre!&0-watt!\'30-seat!(5-member \'50-seat"\'0-metre!(2-member!#9in 061&ndash;3&ndash',
+    '!%.62mm!"0-"&0-mile!$50ml $80mm \'90-foot!%5-day!"jp )a-begging##uzz"+forty-eight"!l"$plus!%aaaah"!d',
+    '""hh""ng""se!%bdala"&egglen#&rffraw",ingdon-based"#off!$card#"us"%esita"$hmed""ia#)d-etching%%house',
+    '"#stt""t\'#&ioning$!v")upressure!%dages"&diston#!o""ge"&journs#$udge"\'lestrop",omn&aacute;n"#ria"$zing',
+    '"#rad"$shna!\'fforest#\'righted"%ghani""ms"(ricander")ter-theme%%world!%gathe"$ecat"%hajan$%zadeh#&redien"$nate',
+    '!,ids-defining"(ginetans""me"\'rikkala""tc!\'kanthos#&rnania"#ela!\'l-ahmar#&habobi#"ko#$said#%umari"#arp"&busate',
+    '""de$%rwood"$enia"$ices#"sa$\'jahbana")kmeonidai"+l&eacute;es#*-aluminium$%dayer$)providing$#sky#$aire#$erce#&iance\'',
+    '#$ured#\'weather"\'mirante"#pin"#ric"#soe"%tovar"(uminised"&verton!%mante"&broise#&uscade"%hurst"$igas#*nophylline',
+    '%!x"-sterdam-based!)na&iuml;s#%basis#"la"(chorlite##ien$&lliary"$dalo%"uz#%orran"+encephalics"$gara##ier#(licising',
+    '"#hui""ia#)mal-lover#$ther"%jouan"*n&eacute;e#$alen$!s#"um#"wn"&ounced"$soff#,truther-gray"&tartex&#ica',
+    '#&i-arab%,collectivist%\'elitist%&female%%phase%)radiation%&stress%%toxin%\'utopian%$wabi&&elfare$\'biasing$"ng$&tumour"!u',
+    '"$pelt##iah!"qc")uamassage$\'planing!$rabe#)chidonate#*g&oacute;n#$pesh##uca"(bitrates#$utus"%cevia#)hilochean$&priest',
+    '#%chaga#)opagitica#"pp"%genta#"hh")istoxenus"!j"(m-length#%alyte#"ee$.nti&egrave;res#$illa#&orican$(ur-glass#\'y-issue',
+    '"0ri&egrave;re-ban#&ogates".slani&aacute;n")t-history#&evelde#%watch""va!#sam"\'cendent#$roft"&erbine#!t"%hgill#%mount")ian-owned',
+    '""om"&pected$$rges"#rog""sa#"ez#%itant"(tro-turf"#ync!&t-home""bc"\'lantean#"ee"\'omising"%pases',
+    '"$trib#%water!%ucuba"&diotex#"ry")sterfield$%rales\'(ia-based"/thentic-looking#\'o-da-fe#*umn-winter!$vait"%eline#$roff#!s',
+    '""md"#net!%whirl"!m!#xaf""ps!\'ylesham""me"$oreo"*untamiento!!z""em $b-29"!d#"na',
+    '!\'abanaft#"ba$$idge"#cau##hem#"k-%%alley%)to-school$$flow$)grounding$%rests$)scattered#(tericide")dmouthing"%erman',
+    '#\'atelles#"no"$iler$#lon"\'jamunde"\'khtiari#$lava"#lbi#%green##int#&l-gown%(handling%&winner$$etts$"sy',
+    '\'#ley#$sams")mboozling"\'nchieri#&dicoot$&stands#\'k-clerk##son",r-restaurant#%agumu#"ba%$rina##der#$geld#\'onetage',
+    '$$owed#\'tolinis"%shley#(ket-case\'$work$"in#"sy"#tac#%eleur#$oned#(tle-line#$wing""zz!#cig!(eanfield',
+    '#$rdie#$tin\'"$chet#(kertools$(onsfield#&querel"&d-rock$&wetter#$dows#*side-table%%tting""ed#!g#&nstock#%slack',
+    '#&vbilde$#ers"$gin\'#\'rudging"$hera#$olds#"ra")labouring#)fast-born#\'isarius##kin#&lacasa%$nger#%mondo%#unt',
+    '#%toise"#man"$naco$"im#&dcrete#\'edicite#!j#$sted&!r#(zamidine$&edrine"!p"%rbick#%engar%!t',
+    '#%kheya#\'nardout#"re#(talanffy$%olini"%siged"\'ttacare$&erball"&vanite"\'wilders"(zymianny!(i-amping")enenstock#"re"(g-busted',
+    '#&headed")ha&cacute"\'kenibeu"&lbeque#,li&egrave;re%(ard-room%"es$%maier"$mbim"*nding-site"\'ohybrid#)mechanics$)onitoring#%pharm"\'rdwatch',
+    '"-t-on-the-side!$jork!(lack-box%(berryin\'%#den%&market&\'ountain%(smithing#$gged#(ncmanges##res#$sius$#son")eachfield#&nching',
+    '#$pped#%tzing"$ockx#)odyminded#"te#$used"(ue-faced&\'lowered%#sky$!d$#ing$&stones$#tts$\'y-green"%ysmus',
+    '!#oag"%broff"(ccherini"$ehme"%ggart#%hurst#$shed"$hill"$igny#-ssi&egrave;re"$lden#$lman#)ton-based"%nacci#(compagni',
+    '##ger#"in#"ks"%ogied#*k-printing$$chin$%watch#&m-bust#$rsch#"sh#%t-boy$+h-capturing#)zebusters"#rda%"ri',
+    '##oro#!y"$sque#$sert"&tanick#"ia#)tle-glass"&udjema#"et#$kary#$lmer$%tings#+ndary-layer#$rque#/tonni&egrave;re',
+    '"%zidar!"pu!+rackenburys\'%ridge%)ish-water%"sy#$dawl#%mcote$$leys#\'nflakes#(ss-faced%&ington#$ttle#!u#\'veworld',
+    '#"ye"*ead-basket%&making$\'sbrough$\'th-test#$bant#(cbennoch##hon")ickmaking#\'ercrest$!s#%nkman$#ley#$seno#(zlincote',
+    '#&nowski#%wgill$+n-and-white&#red%$down"%ubeck#"ff#%nello%!t$%stane$!y!(sc(hons)$\'socsci)""so!%ubber',
+    '"%ildin"!l##gin"%m-bag"$nbeg#1despr&auml;sident&\'verband#"jy#!t$#ers"&rbedge$#les#"ck#$dick#(gtheater',
+    '#$naby##sal"&s-ride$$tech#%copan#"er#+iness-based(#age(!s")tkevicius#\'tertubs&$wood("rt&\'y-hatch!$yram',
+    '!%\'mere!$-141"!2"&drawer"&pillar!#014!"15!$3800"!s!$a-db#$whoo"%banas#$ezon#$rita"$deau',
+    '#"pr"*ke-cutting"(lderpark$%wells#\'endered##gon##kin#%l-net$"ot%$vian$$path"\'mbozola#$elia$#rat#*p-follower',
+    '#,cer-inducing#!d$)le-holder$$yman##ice#"ol#$tade%%loupe$%ilena#"us""ol"#pco#%ensis#(itulates#$lans',
+    '"\'r-ferry$%maker$&racing$\'sharing#&abosse$,ct&egrave;re$#dog$#vel#(buretted#&damoms$$iacs$%onald%"zo#\'e-giver$$ntan',
+    '#$nbeg#%olean#*pet-making\'\'slipper#$thew""so#"pe#&socked#&tenada$$ling"*t\'s-cradle#&alinas%%oging#\'chpenny#&hected',
+    '&$ston##nap$"ic#&terson$*le-raiding(&earing"&ucasia#"ld#&sevics""ys#&thorpe!$eili"\'libates"%nju-3#)sus-based',
+    '$-rally-located%(e-spread&%folds%+om&iacute;n"$pacs"#ram%$ique##ium#%taine"$stui"$tera!%fc-11!"ge!%habot#$ffer',
+    '#\'in-gang$(r-making#$lkie#\'mberlen#+nge-ringing&"th%#in\'$\'ticleer&"er%!y#"ra$,coal-burning$)nel-house#(telleret#"us',
+    '##zan"(eap-jack&$rate#\'ckmated#(ep-cheep$)se-paring#(rbonnier$(nousenko#$vaux$#eux"$hish"#ian$&ppucci#(eftaincy#$fing',
+    '#%maera#-nese-speaking#%penda#%tawan"#lor%"ic"/ocolate-covered#"ix#*lylglycine#(ndaehyop%%rules$"go$"ku#%pwell#*rus-master',
+    '"&retien#,istadelphian#+omatographs"%taura"\'urchend&#ing!\'iblings#"se"-garette-smoke"#mon"\'ne-film#"oa""ps"(rcotherm$\'ularise',
+    '"#tie##rac$#eon#!s#"ta#$ymax$$side"\'vil-war%!e%(ianising&\'satrice!\'labburn#%chaig##ss-&&action',
+    '&!s#(yey-silt""cc"(ean-burn&(off-zone%!e$%rflow"#ich#0ent-server-based#)ffhanging#$pfix"(odronate#$otie#%seups$(ing-down',
+    '##yed"\'ub-foot!(nidarian"&s-1600!+o-financing#)localized#0operative-server#\'produce"*al-bearing##tis"#cci#(o-de-mer"&dlings#"ot"$gley',
+    '%#ing"(iffeured".ld-shouldering##lio#,our-printing&$fast#(prosumah""m-##air$%nches#\'bermere#$edie%\'y-drama#(igrating$+si&oacute;n',
+    '(#ing%*ssion-free$\'odified%,nly-accepted#/petition-policy$*ost-making$0ression-ignition$)uter-held)$user##roe#$trad"%n-sec#&ceeded$\'retized#(densates',
+    '$!o%#led%&ttiere$$uced%#ire##fab$(ederated%$ssio$$uted#(gregates#\'iunctio##lig#)naissance#,sensus-based%&rvador',
+    '#*temporaine$+inuous-flow$(ractures#(valesced"#och"#pam$\'rcenary#%pelia%$rnob$!i#&y-book$$date"\'rbeille#"da$#ier',
+    '#(iatachan$$olan#$nejo$\'ucopian#$rine#&seting#"um$$ndum#\'viniana#,ynebacterium"(ssetting#(t-cutter%\'ranking$"ar"\'ttaging',
+    '#%urnix"%uleur$$ters#\'ncilled$!d$"ld$*ter-thrust\'&poised#*p-de-grace$\'e-coupe#%rteen%&neidge"(w\'s-milk#%-bell%#yre',
+    '"&ysevox!%raark##kes#&nstoun"+eamy-yellow#$spin#%viced"&icetid$*ket-loving#%santo$\'is-torn#%velli"-nojevi&cacute"\'ocosmia#"ry',
+    '$\'s-bench&%price&&school\'$hore%%bench&%reeds%&legged#*wd-pleaser$%marsh#%ysant"#rec"$uddy#%mplin!#sic""os',
+    '!"ua##ndo"%batoa"*ckoo-clock"+lture-clash""mb"(p-bearer"*rtain-call(&making"$shla#$tome\'*r-supplier"&ttitta!"wd"!h',
+    '!+yclosporine"!h""ke"#nar#$sige"(steamine"-tocentrifuged 1d&eacute;bourbage)\'mocrate"+lsqb;u&rsqb")uuml;rres!\'\'accord!*-aspartate"\'channel")influence',
+    '"$wing!#.b.!"a\'"$ein\'""gg"&iquiri#!r$&y-type"&ladier#!j#%lachy$%meyer#&phinis"/mage-limitation#$eron',
+    '"%neway#+i&egrave;le##ker"%psone"*rk-looking%&matter#\'ussalam"-ta-collecting%#ink##ive"$uber"$vydd"&y-room$%shift!"bx',
+    '"+e-compliant!%d-dr1!-e-alcoholised#(centring#+emphasising*"ze#\'gassing#\'mystify#&rigged#(selected"+accessioned#"le##th\'"&bbasch#%endox',
+    '#.t-rescheduling"$cend#)onjugated%)taminated$&ratifs#%urved"#dni"&ep-cut%&diving%&voiced$"ak$\'endable#*r-stalking""fb#!i',
+    '#&oliant"(gaussing""ha#(umanises"#ify%#ing##mos"$jean"&lacour$%lande#%erium#%lorto"%mdyke#\'eanours#%i-god',
+    '$$john#*ythologise+$zing""na$*tionalized#\'im-clad#"ko#%selow#$tata#)ver-based",oxyguanosine",paraffinised#!e#,uty-director"*racialized',
+    '$&illeur$#nge&#ing#*egistering##gue"&seeded$(nsitised$)rt-living#\'ign-led#&kbound#$sins#\'tructed#$vaux"(throning#$oxed',
+    '"#ver%!s#%oiced&#ing#"ro"\'worming!#fcs!)hanabalan!%ianna"$ccan#\'roidium"$dion"&gswell"$joud"$ment',
+    '%!y#&witted"(namation#$gles##kie"&pabase#*hthongized#\'lococci##teb"(rectoire##kie#%t-box"+sarticulate#*co-dancing%%lours',
+    '#\'masting##que"\'ve-bomb)"er#"il$*sionalised!(joussouf!)ocumenter#%works""de##oma"$elen#"th""is"%lgoch',
+    '##mio"&minans\'\'t-tonic%"is##jan"&naghue##owa",om-mongering#!s"(rovskikh##rie%"ts"(uble-a-2\'#bed\'&choral',
+    '\'$stop\'+transformer%,y-degenerate"#wn\'$)-the-line!$rage#"ve##wed%$rful$#in\'"$eher#$iser#)ss-making%!e"!k',
+    '#!r"*ug-control#&mchork$&mondii")y-as-dust$&season!(ual-fuel%&launch"$bber#"na"&ck-egg$"er#%tules"$ette"$foix',
+    '#$ongs"#lay",mfries-based"%nciad#&nottar#%robin"\'rlacher"\'st-bowl%%press"\'ty-paid!-welling-place!\'ybbukry"\'e-works"(namiting$\'sticism',
+    '#$ynni \'eachuin"%dnoth#$sige"$mmon"#rgh#\'ly-\'70s%#ish")st-enders"*ting-house\'%place",u-de-cologne!"ci"&khardt")oglasnost',
+    '#,nomic-reform#&topian""sp"!w!%ditio$#ore$$rice!$ffix!*gg-bearing!)ibenstein""de#"uk"1gh-teenth-century$)teen-inch"$mear',
+    '#"em"%rcell"!u!&jusdem!+lectraglide&(o-optics\'*analytical\'&n-beam#&venth-"$giva"%lerby#"ul"#ola#&ngates##pes',
+    '#"om!*mbarassing##low"\'melmann#$ylou"&pereur#%ty(x)#&urpled#%yrean"!w!-nd-of-century#"hi##uro"%ergy\'&*-requiring',
+    '"(glischen$$yshe#$ross#%strom"+hanced-mode"$nead"(sheathed#"is""te#"ra!%p(c)a"%atant"(icureans""md"#oss',
+    '#+ity-related$&vocate*!d!#ram##nio#\'serhead"%ewhon",gocalciferol"%ingen""ks""rr""st"!u"!w!)scadrille',
+    '"&piritu!)ulogizing"*ropeanised %fecit!\'langing!+rancophones"%ogged"\'usamide!#ust &gambol""ur!&iasone!&odling!)rislewing!%uying',
+    ' $hadd!$cset!,edge-cutting"%rodes!%ocked!%wange!"ye"-perventilated $iapc!%bm-pc!#cef!&dentix!#msl!*nvaginated!"ow',
+    '!#oli \'kenning!*neecapping %laddy!(ifewatch"\'ve-fire!"ma!%ookit"#pex!#rsb!%udlam +management\'!\'icrosft"(ni-tower"*scalculate',
+    '"#uli!*ultistrand &naddle!%escot!(ieporent"#sus \'object\'!#euf$!s!*lm&uuml;tz!#n\'y!&ver-75%\'lapping$+complicated$(indebted',
+    ' *p&ndash;38!#\'ij!$-prd!0areto-efficiency!(etalling!&iscean""xy!%odged")ndkeeping"\'wercore!(recoated"#iem"/ofessionalizing!,sychologized (quieting',
+    '!)e-filling#,photographed#\'seeding#%timed"*acquainted"&basing"(proofing"(sampling#\'killing!(heinland#(me-theme#$tor.&"ex"\'iconich#\'ne-ruhr',
+    '%"gs"(ydyfelin#$thm.!%ianna#!u"&b-like#"es#$icic#$lets"-ce&amp;things$(-growing$0/gloucestershire#&h-poor$#ill$0mond-upon-thames',
+    '#%kover$$wood"(ddarholm$"el$#ims#"el"#edl##ger&!t#"ls"(fampicin#"ka#\'le-pits".ght-hand-drive\'!o',
+    ')!h%$y-ho#\'idified#)orousness#$sbee%!y""ia"#lka"%naldi#$ding#)g-leaders%&necked$%fence$$land#%telna',
+    '"\'puarian"\'sbygate##cos#$ibly#,k-neutrality$(/benefit%&reward""th#\'ornello#)z-carlton")vadeneira$"le$"ux#"ed$&rmouth',
+    '$"tt#&ulatus"%yadh1"(z&eacute#"iq!#l02"!c""db"!p"#ys.!(m-values"#400"!f!#nav!)oadbridge',
+    '$"er$#men$%signs#$min\'##rer$$ings#\'st-beef%#ers"%bards#%ertas&(s/thames#(iarivuny$\'n-years"(camadour#%ester',
+    '&$lobe#*k\'n\'roller$&-lined%(throwing$(climbers$#ett$$fish$\'hampton%&oppers$$land%#ike$\'pooling$$view$$ware#$ombe',
+    '"\'d-rests##eos$!r%%iguez##ime$$nson#(ofinikin##ric%$ques(!z#&zinski",ethlisberger"%ffman"%gnoni#(uishness',
+    '""il#&stered"(le-slots%&taking#%l-all%\'forward$$back$&ickin\'$&ocking$#top#$odex#(y-polies")m/gypsies#$ains$&neasca',
+    '%%shorn%&ticist+!s#)e-centred$#nda$#ril$$ward#$pres#&ualdas$#lan\'!s"*ncesvalles#*d&oacute;n$&-point$"ar',
+    '"(of-lines%\'mounted%&slopes#%kyard#)m-finding$%ettes$&heater#$sens#&t-like$$lets$%stein"\'pe-like%%twist$%d-off$&makers',
+    '$%lynde$&niline#)e-gardens&&rowers%)patterned&%etals$$beds%#ury&$shes$$moor$%ville##hka#,i&egrave;res$#est$$ness',
+    '##mer#%sdale$%ville#&trevor"&tators#$hkos#&ovator#%proof#%undas"&ughish%!y#$land#)nd-necked&&shaped%&ed-off',
+    '(#ian#*tinisation"(ver/ford%#eto"#wat#%boats%/ttom/kidlington#$etta##son##ton"+xithromycin"+yal-watcher"&zanova#"sa$#ika',
+    '""cr"$l-11!"r1"#nas!"s."+/6000-based"#200#"50"#423"$6000#%3,300"!j""nt""o1!#tve',
+    '"*bber-based\'\'handled\'&tipped&$ized$#led#$down##ell$!m$&nianum$%scent$$ttes#%icons%$unda$.dium/strontium$&ginosa',
+    '""ch$#ing$%uphan"(dbeckias##ies$#sts"&ediger"\'fescens#&fianly$#olo%#rth$$wood#"io#!s"&gosity',
+    '",ler-straight"+m-flavoured#,p-yugoslavia$+elstiltskin$#ler##sby#$topf"%n+1rn#(-of-mine$(throughs%$imes#&esmith#*ning-shoes#-off-producing"$occo',
+    '"(sbridger#"ey#(h-strewn$%brook$$come$#ers$&fields$%yford##per#+sell-cairns&%sheim$#ia\'&&n-born(&jewish#\'t-brown',
+    '$%y-red"&thenes$!s#%stein"$wahu"&ysdael!"vd!$w382!"x6!%ycott"&lstone"%thmic"%uichi ,s&aacute;enz#$mp;c',
+    '"+uuml;dstadt\'&leiman!#\'no!$-adh"%bends"$said#"ir"$word!&.1(4a)$"5)$"7)#"07#$1(3)#!7"%26(1)',
+    '"$3(2)$"3)#!4#$9(1)""64#!9"$7(1)""95"$c.c.$"m.$"r.#"t."$d.m.#"ay""f.',
+    '"$h.o.#%arris"$m.e."&s.d.f."$w.23$(s.h.a.s.!"/m!"02!$1*w1"$0(2)#!3#!4"$1(7)""22""31',
+    '""59$!3"%60(1)#$6(3)""88"!a!%20(4)#!8""13"!2#!5""4a""67"$9(3)!$3(1)',
+    '"$3(1)$"2)$"3)#!9""46#!9""5a"$7(1)"!8"!a"!x!&416(2)""25"!3"$4(1)',
+    '"$7(1)$"3)"$8(3)!$5/s6"!1!%62(2)"!4"$6(1)$"3)""72#$3(3)#%7(10)#!8$#(1)!$7(4)',
+    '"%43(3)#!4""68"!9!$80\'s"!4#!0!&91(15)%"7)"!7!!_!(a\'deddin$!i"#-80""40',
+    '#!8"\'arlouis",ban&eacute;s#&ellius##ino#&otages#"ry"-ccharin-sweet)\'e-sweet#!h$\'s-wolfe%!a%"en%"se#+ramentalism',
+    '%!s#)sayhuaman"-d&amacr;graha#\'bhavana#$does#%grove#,omasochistic"#enz#!s"&favids#*e-conducts$(breakers$%tynet#*fron-robed#"ly',
+    '$#dat$#ing$%layev#*e-coloured#$inaw#\'ramosos"$hana$$rans$!y##lin"%ignon##kia#&l-like$#bag$#ele',
+    '$(ing-boat(%ships#*nt-jacques\',ean-baptiste&\'laurent&$mont%(e-agathe#$sset"$jica#+udis-backed"$kala"$lady$!j#&embere$,s-orientated',
+    '%$ians%$lady#\'lingboe$&owness$$ying%!s#\'magundi$+er&oacute;n$+on-coloured&%ellas#$onia$%pians#"ps#"ta$+burn/marske',
+    '%%rgate$#ily$$wood$$zman#&ubrity$"mi#5v&aacute;torsk&aacute$#ias#%zmann"#mar#$bals$"ur##ite%!i##per',
+    '$*son/prison##sun#\'uelsson"/nctimoniousness)!y&+ons-busters&$ties%$orum$#zau#&d-bars%\'castles%\'martins%#pit$&alford%"rs',
+    '$\'erstead$#fly$%iacre#"ge#\'itizers#,jin&eacute;s#)sculottes#&tagata%%maria%$yana$$eiro$%isima"#one"\'pherian#(indaceae',
+    '#\'otaceae#&unziju$"ra"&rafali$$inha$$sola$"yi#\'coplasm#%donyx#%ejevo##fas#"im#$kily%$syan#"oj',
+    '"%s/eis#%anuma#"er#)h-windows$%aying")tanically$#rov#)in-finish&%lined$%rises$#vum#)urn-pluto&$inus"-uber-mercedes#*ce-bottles',
+    '$%iness##let$!o#%marez##nti#"ra$\'ischian#&solito#7veterre-de-b&eacute;arn$&ignons".vage-civilized&$ness#\'e/camra$#lli##in\'',
+    '\'!.#"ka#\'onlinna"\'w-edged#$cuts#)yer/vicar"$yyed"#zda!#bac#&rdella"!b""cc"$ytov!&cabiei#!c',
+    '$#per\'!s##nd.%*al-tainted%"ia$\'graphic#(pegoated#\'rbrough$#ers$&fed-on$%ifier%$ness%&sbrook$%ponis$!r',
+    '""dm"$eadu$#tta#(pticisms"-h&ouml;neberg+$feld*$feld#)allenberg$$ndau$\'rfstein%$lieb%$ping$%tborn#&edule.$\'emakers',
+    '$#irl$-ma-consistent&$tism$\'nectady%&kerian$%rchen%#zos$\'unemann#\'ickerts$"pa$-zophrenically&-saccharomyces#,lesser/baldi$*ichtegroll$%osser',
+    '#&nauzer$.eider-siemssen#)ockemohle$$eman%%nbaum&"us$%nberg$%ol-ey\'$work&)/business&#day&"er&&houses&-masters/union$$stak',
+    '#$toom$#uck#(ubertian$&chardt$&essler%"tt$!h$(ldigkeit$"tt%#zer$$yler#&wanden$!e$\'idurski"$iama',
+    '&\'ometric#,mitar-horned#+ntillations#$pios#&search""lc#&erotin"(offingly#%llins#$nser#)op-necked%&ed-out$&terist#(rchingly$&eboxes',
+    '#\'tchlite$"ec$$free$+t-moncrieff&&thomas&%young%(ish-bred%$orum#$ular$#rer$+t-masterish""ra$#ggs$(ped-back%$pier',
+    '#(emerston$(w-topped&"up&$worm%\'driving#&ibings$#pps#$oggs$#tal#&uffies$&m-five%$half$)nch-dried\'!y"$si-1',
+    '"\'udimore#\'fflings#%mford#%ppers#\'rrility\'%ously#$tter")ythe-like!$d620""dr"-r-denominated"%s-100!#e10#!8""21',
+    '"!6"!8#!8"*a-anemones$%boots$)creatures$$fret$$grey$%liced%$ochs$#max%#ist$%plane$%winds#$bass',
+    '#%cocks#$dogs##gal$$rape#&houses#(l-stones$\'e-hayne$#ife%#ngs#$mans%"rk#/rch-and-destroy&&ed-for&$ings##t-y',
+    '#%world"(bastiani#(orrhoeic""c-#"ol$/nd&rehy;largest&(-fastest(*rom-bottom\'%grade\'&raters\'&season#\'ret-fix&0ary/receptionist#*tion-house$+or-specific',
+    '#%undum$#rer%&ity***(1/multi-processing"%dilia$"si$)tionaries##ney#"oc"#eba#%diest$#orf#"me#"p.$"le',
+    '#%tanah"&galman$!s#(mentally"(idenberg#\'gneurie(!s#$llan#"nt#$sdon"$kacz#"er#$hobe##iyu#(retariat',
+    '"$lago#6ected-issue&lsqb;issue\'"es&%ivist&%orial$%glise$#tar$$ucus#4f&rehy;determination*)indulgent$)-assessed&)ttraction&%vowed%%built%%clean',
+    '\'\'nceited*&ptions((structed(*templation\')rrections&)riticisms&%utter+!s%)defensive\'(structed&*iminishing\'&strust%(efficacy&&xcited\'$iled',
+    '%*fashioning&*orgiveness%$hate%*identified&&nverts&$rony%)mockingly%(negation%)organised%+perceptions&)roduction%(sabotage\')crificial&\'tarters)&vation',
+    '&)upportive%\'testing&&rained%+vindication$&esteem#%ikoff#"l.$#er.$\'otaping#)mer/adams"\'manteme&/ic-differential#%dinli#!e$\'lparous',
+    '%)barbarous%$dark&#ome)!s*\'ticated\'&rmancy%*elliptical%)feudalism&\'lexible%*hysterical%%legal%$matt&)echanical&$oist%&nudity',
+    '&&rganic%*permanents&+ornographic&+residential\'+ofessionals/!s((letariat("ne%$ruin%*starvation%)technical$&breves$(darkness$!n%$ario',
+    '%\'ticians$.quantitatively$&ramide$*structured%(ynthetic$&tectum#$liki"%nalep##ega&&lensis&$mbia#%gmany#$okot##sas%+tion-hungry',
+    '$\'e-based&$data&+impressions&&organs%!.%(lessness$\'itisers#.tence-internal(*/paragraph("s.&)tiousness$$ry-e"#ong""p.#%t/oct',
+    '%"te$\'ember-8)&/early%%nnial$#rin$+uagenarians"+quence-type&\'tiality"$racs$"it$$phin#*bian-based(*controlled#(geyevich$$ueev',
+    '$$cite$*es-current&"/1\'(parallel$$ous.#"le$"in%!o#&ologic$%natus#%pente\'#ina)$ites(!s$$ulid',
+    '#+um-deprived#&veries%!t%$ware$"ia&"ns%,ce-providing($wide\'!.\'*/hampshire&"io%(ng-wench\'#men%"te"\'skinore',
+    '#\'sionals"#thi##osa#$suya#)terington$\'ing-out$%lable%0e&ndash;carlisle"$vcon#\'en-band\'%irdie\'\'ranched&\'country&%fifty&$game',
+    '&%party&"to%%teens)&th-and&(h-minute(&placed&\'y-fives$#r-1%!a##ier",well/liberal##ill$+ng-machines\'"up#$n-in',
+    '"\'x-based$%lives#)agenarian#\'ologist#\'plosion$"ot#*ton/thames"\'yitgazi#*mour-jones#"ni!%fa/92"%orzas"!s"%umato""wp',
+    '!"h5"+adow-voices&&graphs&$less&"s.$+rokh-cigari#\'ef/12th#%galyn##han&!i$#idi#"il##k\'a$$a\'ik%$rchi',
+    '%\'r-style$#har$#udo%+l-ur-rehman#$ldon$%lowed#$mdev#&nbally$#ice$$kend%,s&amp;mcewan$"na$$shal#.pe-specificity%!.',
+    '#%rable$(e-owners&\'pushers%*/worldwide%(cropping%\'plex/ix%-s-for-favours$$ings$)k-fishing$$mans$&nbrook$"od$%p-cut&#end&%nosed',
+    '\'&ighted%#lin$%woods##shi#$ukat$$myan##wii$$lies##yer$%miyev"&chadov")e/timotei#"ad#*ela-na-gig$(p-dotted',
+    '%%haven%$like$$rest$)t-covered&$like#!g#&lducks$(f-packer$&l-fish&%suits%$.bat%"ys$-ov-kovedyayev#"na#$pley',
+    '&!e&%rdson##rak$-burn-in-elmet(!e$\'iffdoms\'$muir%%ngton$$rell%"ie#$weth"(ieldhall#&ftings#%galov$"eo',
+    '#$llin$"ov#(monoseki##nar$#eth$%iness&#gly$$juku$!n#*p-builders$&broker$0lake/oxfordshire$2ton-under-wychwood#!r#%thead',
+    '#$vraj"%koder"+laer-mellor##oer"$oans#,ck-absorbers&&corded&&haired%\'/horror%#ers#(e-parcel$\'strings#(graphics##lde#$o-in',
+    '#&p-bell%&owners$\'aholics$#ful#\'reworks$*t-covering&$pile&\'selling\'#ide&*wavelength%$ener)!s%%grass%#ies%%waves',
+    '*#ing#"uk$,lder-holster)&padded\'"st$#ter%!y#*vel-shaped&#ers#&w-ring$#bar$$card$\'ing-off$$page$$reel',
+    '#\'ew-like#\'ievalty$#kes$\'mp-like##ubb"\'trikman"(ufflings#"la$#ver##mov#*nt-current#$ra-e$%ikens#$saku#,tter-release',
+    '"$yama##est!&ibbett#$ford#"ir#!o#!s##yls"&carius#.herheitsdienst#$king$#pay$!y"$ddon#&e-dots',
+    '%\'mounted%%shows%&tables$$band(!s$$hole(!s$#lit$#men$%rites$#way#%neian#"pa#"ya"\'geheard',
+    '#(ht-seers%#ers#%iburg#$n-on$(al-boxes$&ficant$*ifi&eacute%&ng-off#$ston"!j#$aona"%la-on#(ica-rich%%ified&"um',
+    '(#zed$$sili#&k-like$$moth##man#(o&eacute$$xane#.urian/devonian#*ver-helmed\'%mines\'\'painted&#ton)"es&&vision#"yn',
+    '#"ak#\'barashe#$eone$!y#$ilia&!e$&onescu#+monds/laser##oes$#nov%#ton#*pson/rspca#)ularities%#iid"(nd-based',
+    '$&erford#(g-alongs$+apore-based$!i%$ngly$,le-barrelled(&edroom(%laded\'$case($oils(\'ylinder\'$file\'\'honours\'%image\'&length',
+    '\'$page(%eaked)$riod\'\'stemmed)%oried#&issipi#$natt#*o-american$"pe#$rich#&tering"&ochana"#pek#"ho$%uncle',
+    '"\'quieros"$rica$"na$$sena##kka#"ns##ree$!s"%sinni#"on#)yrinchium"*t-and-wait#\'asjaure#/e-investigation%$wide',
+    '"&viglia"&x-five%(oot-four)$high)$wide$$game$&legged$)mile-long$(over-par$%packs$$slot%%tring$&to-one#&tieths$.y-six-year-old',
+    '$&well-b!"ja#(rifuddin""ns!"k8"(aergaard#!g##ros#)teboarder%#raw"!d"$eels$"te##ggy#,letomuscular',
+    '#%mpton#%rrols#(tch-club##wes"&i-hats$&jumper$%lifts$$mask$%poles$$tows##dby$"oo#$iers#$llen%#ion',
+    '#\'n-prick$#lid$&nerian#+pping-ropes$$with#)ttishness"!l"&orupka#%ttowe#&upidia"#p-y"&rabalo$!g"(ull-caps"%yfame',
+    '#%ships$$port#%wagon!(lab-like#*ck-mouthed%#est#\'g-heaps#&idburn#&nderer#&pewath$!p%!y#&shings##tey$$ting',
+    '&\'traders$#kov$$omir"#ctd""dp"%eator$$zier\'"st#%eking$)ping-cars%&lessly#+nder-heeled##zak"+ick-looking#$mier',
+    '#\'ng-back$!n#+p-resistant#!x"!l"-oan-kettering$!t#(ganising#$pes.#&t-like#-vene-speaking#)w-cooking%(flapping%%onset%\'turning',
+    '$*er-growing##yan"%ubbed#$ggan$$lett#&mbrous##rpy"#ype!7m&oslash;rrebr&oslash;d$2uml;rg&aring;sbord"!5"\'ailholm#(ll-batch\'\'reasted&\'crested',
+    '&&number%)er-framed(%sized%%ridge%$time#(rt-aleck&&suited%\'drv.exe)#sys%#ens%$math%%tools#"ws"&ellier#"nd',
+    '"$idth#)th-bryant&%nkomo%0/gloucestershire%"er"*oke-logged%#rs.$"ie%"ly%$ness$&y-blue#&lensky#*oth-coated\'\'fronted\'&haired',
+    '""p1#!2!$n*wn"!1"&a-3270#%/sdlc#%efell(%sness##gge#%ilham#&ke-pit#\'pped-up%$iest##rky$%l-ups',
+    '"$guon"\'iderman#%fters"\'ogogram##oks$&tiness#"w-$$bird%\'oarding)!s$#cem$%ed-in$%scape""sc"%uffly',
+    '$#pak!"o.#!l""23"!9#"29"(_so_that"(briquets"4ci&eacute;t&eacute;s$$ably%+l-christian(\'ultural\'-revolutionary&!/\'(economic',
+    '(+t-feminists*(oriented$+ety-centred$)o-ecology))nomically&*linguistic%,economically%&logies#%olofi$!n""di$!c#&omised"$eurs"\'fa-beds',
+    '#$fici#&t-eyed%&leaved%%pedal%&soaped$$copy$%ened.$%woods""hy""ie#*l-dwelling%#gas%%types$(/compost"$laas',
+    '$"re#)dier-poet$%ridge#\'enopsis#)fataricus#(icitors.$#dus$!n$%tonic##kan#"la$"ie#\'o-voice$%istic#)ubilities',
+    '$)tion-0.5%("al#/vent-accessible()flattened$0ing/minimisation"(me-times$$dody$\'rleyton$"th&$ing-(!k$#way%%heres#*merfrische#)nambulant',
+    '.$ally"#nam$"rs#\'dheimer#(g-cycles%&titles$%books$-writer/artist#!o$"ra""om#2n-to-be-privatised#"oo"2phie-libert&eacute%0sticated-looking',
+    '%%nisba#"le"%ragna#%enson#$gues#$iano#)optomists#$rels$$iest$\'y&mdash#$t-of$$well"\'sostris#!s"&teriou',
+    '")u\'westers#&birous#"ci#%lboys$"is#(nd-based%5/appearance/sensation%$back%(checking%(lessness##ped#\'r-sweet$%ce(s)&&-based\'(material',
+    '#\'s-chefs$%atzka#,terliedekens&%raine$*h-american&2southeast-trending%)eastwards&+rn-atlantic%0moor/oxfordshire"&verign#-iet-communist\'&german\'(romanian\'$type\'&united',
+    '#!o!$p/lp"!6",ace-occupant&\'related&\'station%%walks\'!y#\'de-like&$work%#ful#"go#%lling#,nish/english$#tax',
+    '#&rbrook$%khill%"it\'(-40/mbus$.sely-furnished&"st%"it$\'tacists#%sming#*thiphyllum$&iality%(o-visual##utz#%vined#!y',
+    '")eakeasies&+r-initiated((referent\'\'/writer%"in$(r-shaped#)cial-care(%train\'.ly-constructed*&shaped%+es-richness$"s.$&tabile%#ive%&ra-tek',
+    '&(ographic\'&metric\'\'scopist#,ech-dominant&$work$+d-dependent&)sensitive%\'ometers%$sail%$y-go#&ilberg#*leologists#&nceley\'!y&*r-phillips',
+    '%!o#&ransky$&cheios$%matic\'%ocyte##zza"#f15"\'herules#+incterotome-#ies%&x-like&$like#(oeroides",ider-monkeys&\'brouter',
+    '$#rer#%ggies#%liada#)nasternum$)elessness$&nerets%)ing-jenny)%wheel%#ler%!y$(osissima#\'racular$(itedness&$uale)%ising',
+    '##vey")lashbacks&%guard#.enoportography#*it-channel&\'seconds#$odgy$%tches")oken-word%&swomen#&liaric#\'ngeware$#tex#%okily#\'rtsboat',
+    '$!o$!t"&rawler$\'ygunned#%iegel$$gits$(ng-board\'#fed\'%tined&!/\'\'windows&$alls&$like&%water$%tzers',
+    '$&ughton#(ucefield$"es$\'ng-edge")ud-u-like#$ming!,q_kilometres"!d"#l/m#!3#"89"&ualors$%re-go\'#law\'$neck',
+    '\')sectioned\'&topped&"ds%#ial(!s%%rosus$\'shed-up#&eakies%#ler%&mishly#\'id-like$"ll$#nch$(rearchal%)rel-proof',
+    '!$r.n6""/y"&25,000"!g"&imaung#%nigar"!m"#p50#!s!#s-1#!5$!s"#.24"#13a""20',
+    '"!7"#dna"$sssh""ti!(t-bertin#)wandrille"".a$&ndrews##tr."#506"$abex$&ility.$&le-boy#&ckable%(er-crane',
+    '##del$$huis#$ehle#\'ff-side%"in#*ge-coaches&%hands##hag#$iano$%nable%$ford%$ings%#sby$(r-carpet&$rods',
+    '#(ke-holes#\'le-mate$%kless#(mbouloff$"en$%fords$#itz$"os$\'p-sized$$sund#\'nbridge$&cliffe$(d-alones&#to\'&#ups',
+    '%#out%"up#"pe%#lia$!h%.ylococcusorius$.leton/hospital#(r-clouds$#ion$\'k-naked%)ey/oxford%!s$$like&\'ng-like$#nes',
+    '%\'voitova$-s-and-stripes%%earch%$uits$&t-stop%%forth%,ing/stopping(!s$\'velings##ser#-te-capitalist\'&entric&)dependent&\'imposed&(operated',
+    '&%rooms&&system%"gy%\'ment(s)%\'s-based\'%style&(man-like$\'ue-like#!w#%y-wet$#ner"*eady.state$(m-heated&(rollered%%clean',
+    '%#ily$$rsby$%tosis#\'blianko#)el-bodied&\'shafted%)e-perkins%#ies$)p-sloping%%sided#*fanopoulos$"ek$#fan#&gosaur#$inar',
+    '#\'mbridge$$less$$ware#\'nhammar$(orhyncus#)p-ladders%$over$%anova$&boards$"er$\'fathers$\'parents%#ers%&ing-up%!y',
+    '#!r$\'eotaxic\'$ypic)!y$*ling-based)+denominated(!s$)n-looking%$bach&#urg%%ellum#)thoscopes$$tner#\'vensons$#ick',
+    '#/wart\'s/melville\'&-moore\'%field\'"on##yne"%henic"$icil$*k-and-ball%\'ing-out%#man#*ff-stemmed#(gmatizes#\'ll-damp&\'running$&t-like',
+    '(!.()/response#+nging-cells#%pital#&tchery"!j"%oakes\'"ly#"bs#*ck-markets%*/inventory%$ades%(holdings%*ing-filler/!s',
+    '#\'dginess##gie$%umber#*ke/clayton#$lons$!p$"ze&%nburg#&machic#%ne(s)%\'-ground&&laying&&masons\'$ines&%tiled',
+    '%5house/gloucestershire%2leigh/warwickshire%%sdale$%iness$#ker$&yditch#\'p-cocks%&watch.$*ping-place.!s(!s#$race$\'e-based%#men$&mbound',
+    '%#ers%$flap%$hill%#ier\'"st%%proof%%swept%#tex$\'ozhevoy$\'y-books&&making%!s##tts#,ve-enamelled$"in',
+    '"1r&auml;ngn&auml;s$*oslash;get#"a.$&ch.gif$%della$"gg$+ight-flight$&ndness&$town$%pline&$ocks%$work$#tal%"en%+ification-a',
+    '$#ven$%w-hat)#ted#&eakily%&tfield&#her$*et-sellers($igns(\'weepers\'&walker-!s&&walker\'$orks$$letz$\'tchable',
+    '\'#ley##iae%#tum$\'ke-torn$&plight%&pogram#!o$"hm$#nde%(g-arming\'(featured\'\'growing&\'ly-held&#men&%rooms',
+    '$\'ppiness$%uthos$#yev#/ucture/activity$%ggler$&ldbrug$%ng-up$$tton&!s#$yker"%uarda#%bbier#,dent-related(\'student\'&/staff',
+    '$"ia%\'o-bound&*us-looking($ness$%y/set#&ffiest#*ltifyingly#(mblingly)!s$%mvoll#%nties%\'persons#\'pidness#&rgeons$%mthal',
+    '"(yczynski#(lesheets$%ianos%\'stician!&uardal"/b&ndash;mailing#/-&dollar;10,000$*activities%%gents%%lpine%#rea$&basins%%oreal$%clans\'+ssification',
+    '&$ltas&)partments%&ivides%%omain*!s$(elements$)faculties$&genres%%lobal$(harmonic%#ead$%kings$(licenses&$mits$\'nuclear',
+    '%,rganisations*&zation$&parcel\'"ts%%eriod%+ostmistress%\'rojects%$ubic$"s.%"ea%&ociety&#ils%\'tations&%ratum\'&ucture',
+    '%(ystem(s)$*underwrite#-consciousness%#sta#\'divides\'&sional#\'fertile$#ile$(ormation#%galea$$enus$*overnments#"hi#%ject-(0before-predicate',
+    '#&mentum&!u#&narial%&tional$\'otebook##odh#%parts$&roblem&$cess#(section.$#ids&&y-free$(ocieties%#lar$/tantial-looking',
+    '*"ve%-rate-specific#*terraneous$%opics$%yping#&verter#%zones")ccessfuly\'#or.$#oth$#uba#(ker-like")dhakarrao"#eno##ves',
+    '"(gar-acid&$bowl%%blast%\'gliders%$less%#man$$wara#\'gestors%"tt""hr""ir"#ker#$hdev#&kariya"\'leiman.',
+    '#$fide#(hamstead+*/berkshire#*phadiazine&+methoxazole\'"ic%\'onation%(ur-laden\'\'ic-acid(!s#%zmann"%m\'yaa#$aila$$rlin$$tras',
+    '#(matively$%ed-up%\'rfields&$land\'$eigh&%stage")n-browned$%clock$\'damaged%#eck$&facing$#oil$%pluto$$rays%&ipened',
+    '%(ensitive&!t#&/texas#(bleached#\'darbans$0erland-attenders$#our$$rive#$fang##gei#$jeev##kel##nah$+i-dominated$!o',
+    '#$ward$#est"-per-abundance&,bantamweight&(computer&+directional&&family\'$erry&%group&#jug&&normal&(quarries&%saver\'%mooth\'$tate',
+    '%&beings%&center&(iliously&)ontinents%(fetation%&heroes%%light%*naturalism%%plant%$real%!s&%aurus&%leuth%&tintas&$onic',
+    '%%views\'#lle\'/sory/management#$piah$&liers.%-y-constrained#*ra-orbital%*chiasmatic%\'orbital$(emacists"%ranyi$!s#"es#+face-active#)inamensis',
+    '$\'ressing#&really#2veillance-detected,!s%%yors."(sa-no-wo#(ceptance#\'senguth#(tainment#%urrus"%tlers"$unto"$vero"$zhou!\'vendsen',
+    '#"ti"-olinsk&yacute"%p/udc"$r4.3#%v/386"!s!#w13#!7"%213eb"%abian#%efred#-hili-speaking#)llow-like%!y#&nepoel',
+    '$(sea-cork#&p-hook##ths",eat-dampened&&shirts\'%odden#)dish-born(%swiss#&epback$(t-voiced##lly"%idden#)mbladders#&nbanks$$dale',
+    '%#ons$\'g-boats"-ollen-bellied#"pe#)rd-handle##und""sg!$x-3r""br!(ybyl/3db"-cophantically"&keside",llable-timed#"os#$vana',
+    '$/ol-manipulating&$ical&#ogy#,es/wiltshire#(metrigon\')y-adapted$$onds#&ptoms."&napsis#,chronicities$&romesh$%ytium#%opsys")philitics"$rene',
+    '".s&dollar;login+Bmanager:lifespan&mdash;startup.com##min#&tem(s)&\'s-based!&zintai"%reter"$ymon -t&aacute;bora#$mp;n"(eacute;r"(ndash;28!$\'awd"&bloody"$moor',
+    '"#say#&tables"\'village!#+10!%-bars"*connectors"$maze"%score#%uidhe"&tailed##ube"%units!#.11"!b"#gdp',
+    '""n.!"/a"\'ha/p.a."!v!#1/2""6s!#2n1!"33"!d!)805-based"#pc9!"=0!!_!+a\'kwakomena,!e',
+    '$!s#\'le-free%#ful$)oid-style#&ulator")chographs$/ycardiomyopathy%"on#%ksman#"na"%dashi#$ecki"%e-woo"&ff-ely"+g-questions',
+    '#(liacozzo"%harat#&itians")il-pieces%#tip$&lefers$$pipe$%stock#"ng$#ter%$less#(wan-born"$jfel"&kagaki#&en-off',
+    '$#shi\'$ba-o##iff##rit#%shaka#"uo"+l-y-mignedd#%amini$!q#$bott#"ia$.gent-compliant#*kativeness##lin"&masese',
+    '#$bier#,il-dominated#%mames#)per-proof#&worths"+nabe-sugano$$keke#(carville$#ock#%demly#%foran#&gibles#%house#%k-led%%mates',
+    '$"ed#(nochbrae%"ys#!z$(aniensis"&peover$\'scripts$#tum#!p$\'ersdorf#$ster",q-polymerase"$raba$#nis$"ra',
+    '$#ree#"ge%!d%*t-oriented#+iff-cutting#%latan#"sh#\'taricum$%ed-up##yba#$zans"%samma#&ks/job##lik#)te-makers',
+    '%&lessly"(taurangi#*low/labour#$tler"&u-taus#(ghmonagh#/nton-bridgwater##pes#$ride##ter$*ologically"&vanagh#"gi##ira"$wfiq',
+    '")x-sparing#(/benefit#\'ability$&tional(!s#&i-jams%$vans$"es$$ngly$$ways"-ylor-robinson&-/conservative\'(scotland&%istic#$port',
+    '!#bms!*chaa-kozah$!d$#lim#$iaka$,n-tabaradene!#d27"!x!*ea-service#\'cher(s)\')-friendly()governors()initiated((produced(*researcher',
+    '$$loth#&m-made&&embers#,rdrop-shaped$$less$"s.##set##tle"&chnerd&-tium-labelled%)icoloured%*o-economic\'$fear&.logy-intensive&&tronic',
+    '##ris"%eline#%n-age%$only$\'y-weeny"%geryn#$ulae"&ichoic#"de"&l-aviv##and%$gana#"e2$$club$%genic',
+    '$*ologically)"es$(pherique%#lay%(ortation$\'screens$)vangelism,!t%,isualisation#%fords#\'lership$$uric##ser#&tschik#"ve',
+    '#"ba#)plebrough$#ora\'*l-directed"+n-foot-long$&length$)millionth$&record$*thousandth#.ancy-in-common%*ts-at-will##bel#"da#%ggara#*osynovitis',
+    '#&t-like$&acular$&makers#(uicollis%%spina"/ol&oacute;gicos"$p\'92#!h$,rachronology"&quilas")rebellids$"ll#\'minalia#%pstra#!r',
+    '$&enoire$(ier-like&!s%&genous$(or-dream&$izes$(y-thomas#!y#"za"%sdale##hub#"on#"si#&t-beds%$kits',
+    '#(e-a-tete#$ford#$lock#/rachlorobenzene+\'methane%+peptide/cyp&#ods#$tron#"ua"&ucrium#%disca#%lings#\'tonicus"$wson"$xnik',
+    '$+ile-workers"%ynham!#g77"%f&bgr!0h&eacute;rouanne"&\'going##had#%money##see"!2#%-like"&ackley#+i-cambodian$"ds#\'messide',
+    '$+k-offerings#"rm$!p##t-s#(umaturge")em-and-us$)atization$$e(s)%$less#\'nardite#%o-ben$+doracopulos$&logist$&propoi$/retically-based',
+    '%)py/social%$test$$mite%*o-dynamics&+acidophilic&\'genesis\'&raphic&$line&$sets\'4tatically-controlled")iefmaster#(n-bladed$$geys%&ummies%"ys',
+    '$,ly-populated#+obarbituric$"ls#*rd-parties&%years$)ty-eighth\'$feet(#old)+ur-year-old+"th\'%ninth\'\'seventh(%trong#"s.$&tleton',
+    '#+mas-ferrand$!e$+pson/oxford$$sett#*rbrandsson$!e%!y$&ngarth%5ton-norris/contestant$$ssen#/ught-disordered(*modalities$$less$*sand-franc)&headed',
+    '#"za"#r37#$ants#$eady%"t.&\'fulness$#dbo$+e&ndash;car&*rehy;month%\'-arched&$ball(!r\'$lade&(category\'(hambered',
+    '\'$lass\'#oin&!d\'$igit&\'eighths&&hourly&%judge&$lamp&+mile-square)$lion\')onth-long&(pointers\'$utts&)quartered&#set',
+    '&%three+$-two\'"ry&)under-par&%years%,.dimensional$)shthwaite#+ice-married$!e$*ftlessness#%oated$\'bbingly$\'ne-like$\'ugh-way\'!s',
+    '$%w-off%$line#$unet"%ulani#(mersbach#(nderings$"ks#\'rgoland$$ible")ymidylate!\'ianamen"$bbet"(ckencote%"ty$$lers',
+    '#"ay#.dly-om-pom-pom\'%winks#!i"%e-off$$rods$\'wearing##tze"%ggles$!y#(ht-arsed%*ly-fitting""jn"%karam##rit',
+    '#%lites$$sley"(mberwolf#\'e-bombs%(capsules&%harts%,inconsistent%\'keepers%$lags%)of-flight%$path%&scheme&(ensitive&)ignatures%)traveller',
+    '$!.$$/lan$"=0$#ous$%watch##son"\'n-lurky#&akilly#$dery#$head#\'idazole$"ly#%kerer(!s&$ings',
+    '##ner$#ily#%terow#$well"*o&amp;sub2"\'pped-in%"ts$!i")railleurs$!m"%sbury#%chler#$dale"$tfer#)herington',
+    '#\'illates$&vating##kin##le/#$oist\'!s"!u",voli/courier\'&sentry"$zwin!)jaereborg"\'iriange!"lf""tp!&mjillo',
+    '!"n2!\'o-be-cs"%alipi#(st-racks"\'bernalt"\'cantins$#rno#%ketts$4nell/gloucestershire"#das$-y/icr/29.6.93#\'d-reeve#&orovic#!t$$heim',
+    '""fa""ge"*ilet-paper\'$seat#%sechs"*j&iacute;n"(ken-ring"%ld\'em#"en##kin#%lesby#$ming#.stoy/historian#%worth"%m-tom',
+    '$#tin#%bolos#&entosa#"ic#*masinianus#$orra#$sett$"ky"&nalite#)e-colours#,gue-twisting&-d-and-grooved&$less#"ha#%icity',
+    '#$neau\'!x$#ies#*ofibrillae$&graphy#&sillar#"us"(o-bright$$easy$%heavy$$much$%rapid%$eady$%short##ls.',
+    '#\'th-like"\'p-boots$$five$%knots$$most$&of-the$%score#%coats#*ic-neutral&&shifts%(/comment#(lessness#(pesfield"*rchbearers%#ing',
+    '##gau#$ksey#&menter#%n-out##oni#$que/\'/speed/switching#\'ricelli$!o#&tworth#!u$!n#&vizcon#&y-free%&voting',
+    '"&steson"$tius#!u")uch-paper%%_with%#in\'#%ghter##mba#*p&eacute;e#"r.$+ist/visitor$$neys"$wbar#%erham##nee',
+    '"$yama##box"$zama!$pc-c"#s-a!"r.""14#!5#!6"&abboch$#los#)ceability%$ries$\'heation%&inians',
+    '#)des-union$$gedy$!i%&ng-off%.tion-modernity)*al-looking+)ly-minded#!f$*fic-calmed(*orientated#&inable%*ing-school#&ligill$#les#%mstop',
+    '$&examic$&quillo$*s-cultural&&manche\',editerranean&\'saharan&&tasman%"1a%)action(s)+"s.)%vator&$xial%(catheter&&ranial\'$iber',
+    '%&dermal%$ects%&fer-in(%ences&%ixion&&ormant*1tional-generative%&geneic&)ressively%)itionally%)jordanian%\'migrasi&*utationism/!t%$omed',
+    '%\'phasing&&osable("on%&script%#vik#$pani%%ttoni#&ttorie##ube&"rt$$mata#%veler%*m&uuml;nde$#ois#(xcavator',
+    '$*sure-chest)\'seekers$$tin\'%.ment-resistant#*e-creepers%(dwellers%\'farmers%%rings$"ce$#man$&trunks#\'feglwys#$gear##kky#(lliswork',
+    '$$bler$#ula#!n$&chancy$*d&lt;0.001#%orchy##pke$#per#(spassory#%wavas#$zise"\'i-motor$(national$%state#&al-run',
+    '$&thlete\'#ons#*brachidium$%uters&"yl#*carboxylic$+hlorophenol%.ostrongyloidea/#sis&(thecenes%$rome$\'ksiness#(diagonal#"et%*hanolamine',
+    '$$olii$&urcata#.glyceride-rich#)lobozoans#&m-tabs$$eter$&nasium#)nidadians%(t&eacute&!e$&ucleid(%otide#)o-kenwood##pes$*le-b-minus',
+    '\'&glazed$(olitania$"pe#%s.hcl$*t&atilde;o#*tocerebrum#(umphally#&valent$#ets""ms",na-structure"$oake#%caire$\'tolites#\'glodyte',
+    '#(jamowicz#$mans$!p#*ndhjemites#%osers#+ph&icirc;me%*ectodermal$&ically$"po#&scheli$!t#)ublespots$#nce$(ser-legs\'$legs',
+    '%%seaux$)t-fishing%$less#&verent#1wbridge/wiltshire"\'ubridge#*ck-drivers&\'mounted%#les#"da$&ernish$&genell##eba#$ffer#+mpet-shaped',
+    '%#ful##ran#%stee.\'%ships&!r%#ram##th\'%.-conditionally&*functional"$ysil#%weryn!"s5"\'arskoye""bs"(habalala',
+    '#$kata#&mshian"\'oubelis"#r.2#!2"#sis"#t-1#%ststs"%unoda"\'vetaeva!$t300""bs"!h",l-compatible!+u\'ipelehake',
+    '"$-134$"44"%/vous"&airisc##vao"(baeforme$!s#$bing#\'e-wells$%rcule%#gen%$osum"#ccs#\'k-brown$%ed-in',
+    '"+e&ndash;fri#&bingen"$ghan#$well"&ilaepa##nal")jetschtal"%lkarm##lus"#man%!s#"ba$&lerful#(efaciens##ors',
+    '#&p-line"(nability#$e-in$$able#"ga#(nel-like&#ers"%onela"#pua"%rbett$-o-alternators&(chargers%%props%"ts$\'ulences',
+    '#-kish-cypriots(&soviet#\'n-final$%backs%#erg$%ed-in\'#off%)r/tribute&"ie$%ovsky##ske#(tle-dove&$dove",ssie-mussies"$tton',
+    '#&worker"#xen#"is##tla&!s"!z!%v/com#%video""t1#$imes!#w18"!5""68"!9"&eedale',
+    '%%sdale$$n-20$$ters#)lve-bores\'&strong#1nty-fifth-century)+rst-century\'-nine-year-old&$fold"$icer#*n-elliptic$"es$%woods#%sters%$ings',
+    '$#ted"\'o-adult%%isled%"nd%#xle$%chain\'&racter%%olumn$\'day-old$&eighty$(for-nine$&horned%/undred-year-old$\'layered$\'million',
+    '%$lace&&us-one%\'osition$&screen%$teps$\'two-six$(wheelers%%icket#$ness#$part$\'ennorth"$yble!$x10i!$yana"$bion',
+    '"$lney"%mpany"\'ncastle#"te"%pe(s)$)-approved%!b#$hina"\'rannise\'"ze#\'e-marks#$ians#0osinase-positive"\'therley""wi',
+    ' "u*!%-bahn"$test!$.852"!d"$g.c."-s.&dollar;2m.!#/kg$"/h"!s""vs!"15"!7""9s!!5',
+    '"&000/75!/achtar&aacute;n"#ine!%bahni")iquinones"*s-phillips""ud!(cca/pcas"7kington/gloucestershire!#dca"-erzo-goscinny"%imore"#juu"!s!(erdingen',
+    '!,g/m&amp;sup3"!7"*lification!"ha!$itf9!$jiji"$jain!"k-#&listed#*originated!#lba"&cerate""ex",lmann-harris"#nae',
+    '"#tan#&imates#.ra-competitive&%drawn&$fine&\'leftism&\'refined&$scan\'#oft%%block%.centrifugation&$lear&+onservative%*filtration%#man',
+    '&(onically+#tor"(ulations#!s!(malatova"+belliferous#"ra%%geous"&f1009t"#med"&welten!)n-italian#\'natural*"ly#)organized',
+    '$*complished#(ffected.%&licted#(lienated#,naesthetised$&chored#)ssumingly#)ttenuated&$sted"&backed#%elted$%rogen)!s#)iasedness#&lended',
+    '$$ocks$(ushingly#%odied$$nded$$oked$#xed#)reathable#\'uffered$%ndler$%rdens"#can$!s#,hangeability%(rismatic$%illed',
+    '#(itedness#&lassed$)eanliness&#ved#$oded$#ils$1mfortable-looking%\'pounded&(rehended$&nfused%)structive%&tacted\'$ined&(rolledly%+ventionally',
+    '#\'redited$(iticized$%ushed#)tuousness#&urious%"ls$&stomed"\'datable#*ecapeptide%)ipherable$(featable$%r-10s\'"7s&(achieved&&bidder',
+    '(!r&*determines&*estimating&$five\'%rames&&lessee&)provision&*recognised&&sevens\'(pendings&%using&%value%(achieved,"rs&#ged',
+    '%&cliffe&-onsumptionist%$dale&$ense&&rawers\'%essed%$gird)"ed%\'insured%+lexicalised%.representation%&served&%horts&(pendings&+tandability',
+    '%$tows&$rial%(utilized%%voice%%wings$&signed$(tectably#%ipped$-stinguishable$)versified#%ogged#&rilled"$edic$\'ucative#!f',
+    '#(ndurably#(valuated#(xpecting$\'tracted")feelingly#\'ishable#+lappability$%ushed#+orecastable&$sted%(givingly+$ness%\'seeable$+ssiliferous#)ragmented',
+    '$#oze#%ussed"*gainliness$\'llantly#\'endered%&erated%#tly#%igged#*oed-thomas#\'raceful#%ulate"\'handled$\'rnessed#%eaded$$lped',
+    '#%idden$!t#(olstered$&noured$$used"-i-dimensional#!a#\'culture$&ycling#.dimensionality#,formitarians#\'mposing%)ressively#*ntimidated$\'ventive',
+    '&&united#%plus+#%sql/x#&t-type$#eds$\'isation$#s/h&"kg$"y.#"v.$#air$+ersalisable\'$itet),y-controlled+)validated',
+    '#"x\'$+-compatible$%world"\'jointed"+knowability"&lashed$&tching$#wed#&eached%#sed$#vel#%ifted$&keness"*maintained$&nnered',
+    ')#zed$$nded$+tamorphosed#\'ilitary#(onitored$&veable"+nacceptable#)eccessary$$rves#\'oticing"(openable#*rthodoxies#!s"(patented#)erceptive',
+    '%&mented#&laited$,easantnesses\'"ed$&oughed$%umbed#&oliced#*recedently%)dicatable%&ssured)$ised$(ofitably%)grammatic#$ubl.$$lsed',
+    '")r&aelig;d#$ated%%ioned$%vaged#)easoanble\'&nable.$*cognizably&&rdable&%vered$(deemable$(ferenced%&uelled$&liably$(markably$$sted',
+    '#\'ideable$&gorous#$obed$$ofed"(salaried$#ted%-isfactoriness(%iable$)vouriness$%yable#&cented$\'holarly$$ored#(eparated$%rious',
+    '#$harp$\'eltered$#owy#*ightliness%&nalled$&tuated#%laked$&inging#\'olvable#&pecial\'&fiable)%cally$\'innable%%rited$\'onsored',
+    '#$tack$(erilised)#zed$)reamlined&%ssful#)uspicious%(tainably#%wayed"!t#\'ameable$$nned$#ped#(echnical$&mpered#(heorised',
+    '$)ought-out#%ipped$&ringly#(rammeled&$pled%$pped$%ipped"!u#\'tilised"&walled$"re%#ned$\'tchable$#xed#\'earable',
+    '#*orldliness!"of!+p-stretched#$turn"%/left"+_,_up_until"&braids""ia"(landicum#$ight"#nor".per-management&$tier#"on"\'righted',
+    '#$tand"\'turning"$ware!$raga"(ban-land&*orientated,"ed%+/industrial%!a%"ec"/ea-formaldehyde#!y"!g#,ently-needed"#iel',
+    '"(odynamic#$flow#$gram#&mastix"#rah#*utikoetxea"%sinum"!y!-s&dollar;0.5m*%1,040-"80,\'300,000,\'500,000,\'800,000+*.00=101.54',
+    '+)1,000,000,%0,000,%5,000+%2,400-#500,!0+*45,000,000+!6,$,500,)0,000,000+%7,000*%2,700,#900+&00,000,!3',
+    '+%1,000,)0,000,000+"20+!5+!7,)0,000,000+)8,000,000,!0+)9,000,000,!0*%3,600,#700+*20,000,000+*30,000,000+!5',
+    '+*70,000,000+)9,000,000*%4,400,#800+)1,000,000+"40+)7,000,000+"80*%5,300+&00,000+%2,000+)5,000,000+"80*)6,500,000,#700',
+    '+"30+!5,!0*%7,200+)1,000,000+*48,000,000+%5,000,)0,000,000*)8,000,000,#500+!7*)9,000,000+%9,000"/-british-french#&canada',
+    '#(pakistan%)lestinian#%south#$them$&urkish")/canadian#$them"*e-specific#%less.#0r&ndash;friendly$+-accessible%*orientated$-accesslogical$!y",inor-sacilor',
+    '"#man"&ufruct"%worth!*tnapishtim"(raquists#%ophin"\'terword!"uj!\'v-cross"%eitis!#way"!s!(zcategui .v&aacute;zquez"2eacute;n&eacute;on',
+    '"$tool!".2"!3",4-compatible"$diff""h.""ii"$l.r.!"/4"!c!#1.0#!2!#2.0!%386mx!#4.0',
+    '!#6.0"#028!!7"#116"#771!#8\'s!&a\'aiga"$chek%!y#\'illates#"uo"!e#$sken"\'ginatum#+uely-worded',
+    '#!s#)thilingam"\'lcarlos##das#)edictions$#nta$(t-butler#"ga##ias$(date.mod#"ka#$lees$#ier%"ns%)s-nay-ria',
+    '#,ses-caprices#%uably%%tion.$"e\'%)-creating%%/bank"%mbacs#&pirism"-ncouver-based#-dell&ograve;s%&rville#"ed#&harity#$tool#$uanu',
+    '%!s$%urise&!y"&rapaev#0iable.reluctance("s.$%cella)\'-zoster%$osed$&ometer#$lets##ren#&sities",se-paintings#&omotor',
+    '#%salli$#ily#$test$+ly-improved"$ubel#-ghan-williams"%vasor"(xcluster!#bac!%c141l""l."!q!"dm!+e&ccaron;er"(-hickles',
+    '"%cchia#*torisation"&dettes"(e-shaped#&rendra"\'garshei#.etable-growing&%tion."&hicle."!i#$ssid"#kic".l&aacute;squez#"ay#%ichko',
+    '#\'o-kodak$*city-depth#"um#(vet-like")ndobionta%*r-specific#.erable-looking%!y$"ts##kat#$loer#"ta$#ham$,riculography$+ure-capital',
+    '"\'randaed#\'b-forms$\'alizing#%celli$)ingetorix#&daguer%"la$$elho%!s$$ians$#uga#.fassungsschutz#&idical)#ity$#est',
+    '#%laten#\'micious%\'n-proof##nus#-sailles-based$&ifiers&!y%"ne$"os$\'tehende"#sco#"na%#ver#%perae##tas',
+    '"0tterling-braggin!"fb!%hs-36"!w!%iande%!s"$bing#$rios$#ola%\'massage#&urnums"\'c-wells#&e-capt)%aincy%/lord-lieutenant',
+    '%%pres.\'%ovost%)secretary$\'comitum$$like#!h#(issitude#,omt&eacute;s#(timising&"s.$%oriei"%danes#*eo-nasties%%/kate%*conference',
+    '"$elle##rny$"ra#&wboxes$&ership$#ley$$park$\'screens"+gd&iacute;s#)ee-lebrun#"ia#%naket$#ola"$lain&!e',
+    '#%fredo#)lainously%&ncicos&$ella%$sana$&einage%0neuve-renneville%*rs-marmery$$ians$#osa",n&aacute;rna#)_de_table#%aigre#(clozolin#&daloos',
+    '#%ebohm#%ifera#"ne#$opal$$sity"\'olence.%)t-scented$#ino"$pont"%ragos#%genes$&inians\'!s#%tualy#*us-encoded',
+    '")scose/40%$"um#&itors.#+sarionovich#$tors#+ualizations"(talistic$+min/mineral$!x#\'houlkas#$rify%%nites%(olically$%uvian$!y',
+    '")vaciously#$iana$$ente!\'ladilen%(mirovich%#var#&kplaas"#ccs"/dl-triglyceride"#nas"\'or&euml"!p"!r!#mmt""ps',
+    '""da#"er"*est-alpine#$voda"(gelweide"/ican-voiculescu#(dability$$ness")l_au_vent#)atilities#)canic-arc($ally#&itions#"jc#&odimir',
+    ')&urrent()dependent%%irean#\'ubility$.me-composition&(trically$"nt#%vulus"\'mitings""nt"$rpal#&ticism"%stell"0ter-registration#$ives',
+    '#\'chsafes#(lez-vous$!u"*wel-height"-yeuristically!"pd""ix!3ran&ccaron;i&cacute##tas"$iens"#tba!+s(mynewpos)"%e/esa!$t320"!5',
+    '"#ght"\'lfranni#\'garians\'#zed!"vl!"xd!.y&scaron;ehrad \'w&amp;n"(divide;2!"\'i!#(b)!!+!#-sn!".1"&a.s.p.',
+    '!"1h!\'a-a-a-a"\'aaaaark#&lhaven##qfs""be#$ster"%caday#(c-africa##her#$kett$$ford$%iness"%dders$"ya',
+    '"+ffenschmidt$$lers#"iq"\'ge-cuts%\'packets\'"id#&gishly$$lers#(on-loads"$hine##ono"&indell#(stcoated#%tings$!z',
+    '"#jir"(kebourne""la#$berg#*dachquelle$)ringfield#%erand#$k(x)$\'-around$#ato$+ing/running$(throughs#*l-brackets%&lights%$rock',
+    '\'&/deane\'"an&%hians$(ensteins%$rian&!s$$ower$%sbury$\'washers$%yford#"na$"ey$(ut-sized#&purgis#!z',
+    '#$ding#(ey-edged#$gtek#$jigi##kel$#lyn$!y#(lockhead#%nabee%!e$!i#"t\'$/age/oxfordshire$"er$#ons',
+    '$\'leaders$(stricken$\'winning#%brick#,d/department$"ak$"ie$#rop#$game#"ke#*m-coloured%$down%(smelling$$ness$"up',
+    '#\'p-vanes$%space#&rantor$#ell$,ior-ascetics"#s_a$"in#&h/wipe$$down$%er-up)#per$$outs#$lala#$n\'t.$"ae',
+    '#$sell%%rflut$#yng#"ta"&tanuki#*ch-keepers#$engo$\'r-birds\'&ottles&$rats&\'sellers\'$kier\'%nails\'&pirits\'&tained',
+    '&%taxis&(vascular%0/gloucestershire&+oxfordshire%$bath&%ottle%,ford/ireland%$ings%\'meadows&$outh%(proofers%%skier*!s&$meet&&oluble',
+    '#%mough")vepackets"#wen"(x-ground#%holme"$yman$$outh!#c1r""94!"d3"!r!(e/us/our"%32-25"\'aldhere%$lake',
+    '$+th-creators\')producers&!.#&rsider#(sel-eyed#*ther-proof(%tight\'%board\'(proofing,!s\'$worn#(verbirds"(b-footed#$bers$!o',
+    '##lin"+dding-bells##ell#$ghog#(nesfield"&edless#%k-out$*ly/monthly#$nies##per$$ings#&rakoon".geler-deinhard""hi##man',
+    '$$hill%+t-conscious#%hrich#\'nfelden#&sbloom$&muller$\'senbach%&muller#\'zenbier$#man"\'lbourne#\'eminsky#/fare-orientated(#tax#.l-administered',
+    '&#ged&,uthenticated&$ware%&banked%)cared-for\'%tered&,haracterized\'+oreographed&#lad\'%othed&&reased&)ultivated%&damped%*formulated%(governed',
+    '%&ironed%*marshalled&&ounted%*programmed(\'nounced((visioned%)resourced&&ipened\'#sen%)satisfied&$wept%\'thought%)unionized%&washed&$omen',
+    '$!e%!k%&stream$"ow$.s-next-the-sea%&prings#)sh-medium%#ing"&ndland$#orf#!e#(ner-gren"%re_no$%frogs#!f',
+    '##ndl#"re"#sel#$leys##nes#&selman$#ons#\'t-bound$%/east$$boro$\'erlands\'"ey&#ton$.minster/london$#oby',
+    '$$phal$(sandwick"&t-dock%%reams$&in-wet#%ering#%heral&\'ingsett#%table#$ware"(welsburg"*ybridgeley##man%"rn!$f/09',
+    '"!c"!d!#ha-#"aa#&lemeat$*ley-kilmer#%t-ifs&$s-it$$/how$$more"*eat-fields#\'el-ruts%*er-dealers%$s-up&!.',
+    '#&reever%$with"\'ichcote$$kens#$gham#&p-hand%(wielding$#per#\'sperers$$tle.#)tby-smith$&e-beam&%nosed&&sailed\'&hirted',
+    '("ot\'%uited%&/black&4director/oxfordshire&$pink%&boards&$rook%%flies&#ord%*head/oxfam&*ouse/nvala%$land)!s%&smiths$)hersoever',
+    '%"um$!t%"al\'!l%%lesea",ole-coloured%%scale#&oo-ooo#$rish"!t"#ump!\'ichmann#"ka$$eder%"ri',
+    '"%ddale$\'ershins#\'e-range$%combe$(ly-based\'*publicised\')separated$%nings#*get-making$"ie##ish"*ederaufbau#%lders$(kopolska#&nevski',
+    '"&fehood"&gglers#$hton%$wick#$oder#%stone"%keley##tor"&lckens$$oxes#\'d-cards\'!t&(ollected%$fire$#bad',
+    '%%nrath$$fell$%hagen$%ridge#$fish$$redo#\'kinsons#.l-o\'-the-wisps$&endorf$%fully$$helm$1iams-landel-ferry)\'trained(\'/martin)(national',
+    '%$bald$#ock#$mots"\'mbourne#%ereux#&pishly\'$ness$#les"&n/lose#\'chendon#&d-bent%&chimes%)dispersal%\'induced%\'powered',
+    '%&shadow&&ucking$#ass$%chill$"ie%!r%#sch$(ow-catch\'%seats&!e$#ram$&sfield%$peed$&tunnel$#ust',
+    '&&ibbing%\'growers$(glassful$"rs#)g-patches$&lebury&"ts$#men$$root$$walk#*klepickers#%laton#&master#$neke%*r-take-all',
+    '#&ogrand#&scombe#*ter-sports"\'rtshaus"#sby#,consin-based#(ecracked#$hin\'#"ke##nae#$ping#-senschaftsrat#\'tanstow%$ston"\'t-e-wee',
+    '%#ell#"h\'$"-a$#eld%"rn$(in-class\'(stimulus$#old%$uten#&lessly#\'terings$%fogel$#ier#%zmann"&zansky',
+    '!"jc!#ksh!"mg!$nker!$odak#"ie""ei"&ffling"%ldham$$land#\'f-tools$*f-dietrich%!e$\'gangsee##ong',
+    '#\'veridge%#sey",man-centered\'%hurch&%sized%#ist#%blike"\'nd\'rous$%erboy&%woman#&kyness##ton")od-harper%%lined%\'remains',
+    '%\'working$#ard$)en-bodied&$tops$%fords$%larks$%roofe$%stain&/ock/oxfordshire$%works##kie#\'l/nylon$%acott$"co&%mbers',
+    '$"fe%!s$$lier$$rich#$mera#)nerf-type".rd-association%(boundary%(detector%\'finally%&lookup%\'pairing&&icture$$book$#ley',
+    '$%swoth#&k\'ouse$&-a-day%&forces%%heads&$orse%"in\'\'-school\'!s%%loads%(refusing%%sheet%"up$-er-controlled\')directors',
+    '$$face$"in$(lessness$&pieces$%rates$$wise#(ld-order%&script%%views#\'m-cakes$$hole$$like$$sley#$n-in#%seley',
+    '##ths$!s"$ssen"#tai"(udhuysen##lda$"fe#\'ndingly"%zniak!#p-o!!q!*raithwisps#%nklin#$tten"%cc-26',
+    '$$bury#)ocensaete#$tham"+ight-manley&$/the#(ting-off(#pad$&ten-up"%ong\'n&"un#$tten&$sley"\'ung-out!%swrrl!+ulf-mathies',
+    '#$wick"$mmin"*nderkinder$"ke"(rtemberg$!s""xi!\'w/april"*f-malaysia##/uk!(yatville"&boston"\'cherley#4ombe/buckinghamshire"/e/herefordshire',
+    '"\'manised"$nand#$cote#(ne-freer""on"%thall"$vill!"zb $x(t)!"-3"\'neurons"\'pensive"$vote!\'11/news!"70',
+    '"!3"%nthan$"ia"%rites!"b1"!8!"c2"!7""iv#!x"#vii!"d1!#e6+"$nios#%olith',
+    '$#xes#!s!"f1"!2""7+"!8"!m!#g6+""7+"!8!#h6+!\'iaokang"!n#$gwen"%phoid',
+    '!%j220s!#min"%p-api!*oftware/32!#p/s"#330""g5!$rays"\'t/graph!$t/at"$2500"%c/xtp"!i"!p!"un',
+    '""th!%wh(n) \'y&amp;r".lsqb;ou&rsqb;r!+-chromosome"#e-s!%3,800!&58,000!!="!0!(ablonsky"&chties%&swoman#!k$"le',
+    '"#gil#%ninim"$hama#"hh"#kub%!u""la#$bury#$lahs#"ob"&macraw$)ha-kemble$!l##una"$n\'an',
+    '#$quis"$qoub#"ui"#rab#&mulkah#0nton/oxfordshire"#tar#!t"#vas""zd!%ear\'s$#(s)$!-%#out$!.',
+    '$&ningly$$wood#\'st-like".llow-and-black+%green\'$back($rick\'$eyed\'(flowered\'$grey\'(jacketed\'&tinged)$pped&\'/orange&)ish-white',
+    '""r\'#%ofeev#!s$#hon""st"\'t-to-be"%wdall!#ick"&ddishy"%elder""lu"&ngchao"$tsak##zak!%o-yos',
+    '""da#"er"#ker##ing"#mbo"\'ngchang#"ne##sei"#ram#\'k/lyons$&shires$!y"&shioka""u.#!2',
+    '%\'/thames%%stock#)rinitials,"17,"21!"ps!"r_"$ieix"!l!&u-chee"$ills"%m-yum#!a"\'ppified"%sopov',
+    '"1uacute&ntilde;iga!#(t)!\'-neuron##ote!"02!$242l!"42!!6!!7!!="!0!(a&iuml;s"%aloff"$bala$$nias',
+    '#*haropoulos"&ddikim"$fera"$idel$!i#$rian"\'kharova#!s"\'loshnja""ma#"mo"$njan"\'phiriou"%remba#!i',
+    '#!s"&warsin!#ccm!%ebbie#$rano""ch#\'khauser"!i##sel"\'jnulahu"#kan"(lenograd#%insky#(lermayer"\'mindars',
+    '#!i#!s"\'phaniah"$rnik#%ograv"$ster"#uss"#yal!"fx!*habotinsky#"wa"$urid!$iach"+ehl-neelsen#&linski',
+    '")lberstein#!k##lis"+mbabwe-born#"mi""nd#!n##tec"$ober!%n-sod"!o!"oa"$ecke""is"$lder',
+    '##ked""rc#"in$!o"$uher"#ysa!&ubatov#"ir"%ccaro#\'kermann"$heir"\'iderzee"$olin"\'panovic!)wanenburg',
+    '")olferhorn!)ygodactyl$"ma"$lpha"&uganov',
 )
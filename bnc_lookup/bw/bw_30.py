@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_30 = (
+count_30 = 6694
+
+heads_30 = (
     'ilbo',
-    'ileach',
-    'ilett',
-    'iley',
-    'ill-balanced',
-    'ill-humouredly',
-    'ill-rewarded',
-    'ill-wishing',
-    'ill.',
-    'ill/st.g',
-    'illchester',
-    'illegally-parked',
-    'illing',
-    'illingsworth',
-    'illness.',
-    'illness/injury',
     'illustration/diagram',
-    'illyas',
-    'ilmen',
-    'image/likeness',
-    'imageability',
-    'imagers',
-    'images.',
-    'imaginal',
-    'imaginaria',
-    'imandi',
-    'imbecilic',
-    'imbibers',
-    'imes',
-    'imiadze',
-    'imine',
-    'imitable',
     'imlil',
-    'immanently',
-    'immediate-early',
-    'immediatism',
-    'immobilism',
-    'immoralist',
-    'immortalises',
-    'imms',
-    'immunizations',
-    'immunodepression',
-    'immunogenic',
-    'immunologic',
-    'immunomagnetic',
-    'immunomodulation',
-    'immunomodulatory',
-    'immunomorphological',
     'immunophenotypic',
-    'immunostimulatory',
-    'immunosuppressants',
-    'immunosurgery',
-    'immunoturbidimetry',
-    'immutably',
-    'impartible',
-    'impassibility',
-    'imperatival',
-    'imperfectionist',
-    'imperia',
-    'imperviously',
-    'impiously',
-    'implacability',
-    'implemented.',
-    'impluvium',
     'impolicy',
-    'imports/',
-    'importune',
-    'importunities',
-    'imposts',
-    'impregnability',
-    'imprescriptible',
-    'impressment',
-    'improve/worsen',
-    'improvisatore',
-    'impugnable',
-    'impulsions',
-    'imr-90',
-    'imru',
-    'imtarfa',
-    'in&eacute;s',
     'in&egrave;s',
-    'in-dwelling',
-    'in-mast',
-    'in-migrant',
-    'in-off',
-    'in-utero',
-    'in.the',
-    'in/',
-    'in_,_in_general',
-    'in_a',
-    'in_flagrante_delicto',
-    'ina103',
-    'inaccesible',
-    'inaccessibly',
-    'inactivators',
-    'inadvertencies',
     'inadvisedly',
-    'inalienability',
-    'inanition',
-    'inao',
-    'inari',
-    'inarticulately',
-    'inattentively',
-    'inaugurations',
-    'incarcerating',
-    'incarnata',
-    'incarnating',
-    'incendiarism',
-    'incenses',
-    'incestuously',
-    'inch-by-inch',
-    'inchon',
     'inchyra',
-    'incisa',
-    'inciter',
-    'inclinable',
-    'includin\'',
-    'inclusus',
-    'incombustible',
-    'income-elastic',
-    'incomes.',
-    'incommodious',
-    'incompressibility',
-    'incontro',
-    'incorrupt',
-    'incorruption',
-    'incpen',
-    'increase/decrease',
     'incrementation',
-    'incuvat',
-    'indaal',
-    'indecorum',
-    'indep.',
-    'independencia',
-    'independente',
-    'indeterministic',
-    'indeterminists',
-    'index-link',
-    'indiano',
-    'indicts',
-    'indie/dance',
-    'indigenously',
-    'indigo2',
-    'indings',
     'indirectly-elected',
-    'indiscrimination',
-    'indispositions',
-    'individ',
-    'individual-oriented',
-    'indo-us',
-    'indochine',
-    'inducibility',
-    'indulgency',
-    'indus-tsangpo',
-    'industrial-relations',
-    'industrial-strength',
-    'indwell',
-    'inebriates',
-    'inebriation',
-    'ineffectualness',
     'inescapability',
-    'inexplicability',
-    'infallibilist',
-    'infantile-like',
-    'infas',
-    'infaunal',
-    'inferrable',
-    'infield/',
-    'infierno',
-    'inflation-linked',
-    'inflexional',
-    'inflorescence',
-    'inflorescences',
-    'influenceable',
-    'influentially',
-    'infoldings',
     'information-rich',
-    'informe',
-    'infotainment',
-    'ingoldstadt',
-    'ingushi',
-    'inhabitable',
-    'inhibitive',
-    'inhibitor-2',
-    'inhospitality',
-    'inimically',
-    'inimitably',
-    'inishbofin',
-    'inishowen',
-    'initialising',
-    'injuncted',
-    'injuriously',
     'injury-ravaged',
-    'injury/illness',
-    'ink-pad',
-    'inkeroinen',
-    'inkey&dollar',
-    'inlier',
-    'inn-door',
-    'inne',
-    'innervation-dependent',
-    'innervation-independent',
-    'innes-loo',
-    'innoculation',
-    'inoussa',
-    'input-outputs',
-    'input-specific',
-    'ins-and-outs',
     'insatiate',
-    'insect-resistant',
-    'inseminators',
-    'insider/ethnographer',
-    'insidiousness',
-    'insight-oriented',
-    'insistences',
-    'insoles',
-    'insolvently',
-    'inspectoral',
-    'inspiration.',
-    'installable',
-    'installed/deinstalled',
-    'instantaneousness',
-    'instantiations',
-    'institucional',
     'instrumental/expressive',
-    'insu',
-    'insulations',
-    'insurance-backed',
-    'insurgence',
-    'inswinger',
-    'inte',
-    'integrable',
-    'integrands',
-    'integration.',
-    'integrationists',
-    'integrifolia',
-    'integrum',
-    'intelibots',
-    'intellectualization',
-    'intelligent-looking',
     'intelmet',
-    'intenser',
-    'intention.',
-    'inter-atomic',
-    'inter-changeable',
-    'inter-cultural',
-    'inter-disciplinarity',
-    'inter-divisional',
-    'inter-electronic',
-    'inter-family',
-    'inter-government',
-    'inter-palestinian',
-    'inter-pros',
-    'inter-regnum',
-    'inter-subjectively',
-    'inter-zonal',
     'interapplication',
-    'interbuild',
-    'intercar',
-    'intercoms',
-    'interconnectors',
-    'interconversion',
-    'interconvertible',
-    'interdiffusion',
-    'interelectrode',
-    'interest-groups',
-    'interferometric',
-    'interfertile',
-    'intergenic',
-    'interictal',
-    'interlaboratory',
-    'interlacements',
     'interlinear',
-    'intermissions',
-    'intermixture',
-    'interna',
-    'internodal',
-    'interparticle',
-    'interpellations',
-    'interplane',
-    'interpositive',
-    'interpress',
-    'interproton',
-    'interquad',
-    'intersubjectivity',
-    'interveners',
-    'intestates',
-    'intiative',
     'intolerability',
-    'intonationally',
-    'intra-class',
-    'intra-european',
-    'intra-hemispheric',
-    'intra-racial',
-    'intra-system',
-    'intrabacterial',
-    'intracrystalline',
-    'intraglomerular',
-    'intrajejunal',
-    'intrajejunally',
-    'intralobular',
-    'intraluminally',
-    'intranasal',
-    'intransigently',
     'intransigents',
-    'intraoperatively',
-    'intrapersonal',
-    'intrapsychic',
-    'intrathecal',
-    'intrepidly',
-    'intriguers',
-    'introd',
-    'introspected',
-    'intrum',
-    'intubations',
-    'intv.',
-    'inuentio',
-    'invagination',
-    'invalidenstrasse',
-    'inverarity',
     'inverdale',
-    'invidiousness',
-    'invigilation',
-    'involuntariness',
-    'iodate',
-    'iodophors',
-    'ionomer',
-    'iontophoresis',
-    'ipxs',
-    'ir&pound;1',
-    'ir&pound;2',
-    'ir&pound;5m',
-    'ir&pound;7.7',
-    'ir&uacute;n',
-    'ir-active',
-    'iraqi-inspired',
     'irish-speaking',
-    'irlib',
-    'irok',
-    'iron-bearing',
-    'iron-founding',
-    'iron-tipped',
-    'ironclad',
-    'ironer',
-    'ironwood',
-    'irreconcilably',
-    'irreproachably',
-    'irresistable',
-    'irrigable',
-    'irrigator',
-    'irrupt',
-    'irruptive',
     'irthlingborough',
-    'isabelita',
-    'isarn',
-    'isayev',
-    'isbisters',
-    'isblank',
-    'isdx',
-    'isfield',
-    'isflt',
-    'ishaya',
-    'ishmal',
-    'isikveren',
-    'iska',
-    'iskender',
-    'iskenderun',
-    'islamicization',
     'island-continent',
-    'island-wide',
-    'isleifr',
-    'isleta',
-    'ismaila',
-    'isobelle',
-    'isochrons',
-    'isoelastic',
-    'isoelectronic',
-    'isoetes',
-    'isofax',
-    'isogenic',
-    'isometries',
-    'isooctane',
-    'isopata',
-    'isopathy',
     'isopentane',
-    'isoprenyl',
-    'isoroku',
-    'isozyme-selective',
-    'isozymes',
-    'isozymogens',
-    'israeli-lebanese',
-    'israeli-plo',
-    'israeli-soviet',
-    'issac',
-    'isself',
-    'issoudun',
-    'istoriato',
-    'it-a',
-    'it-in',
-    'it-the',
     'it.was',
-    'ita/iba',
-    'italiano-destra',
-    'italicization',
-    'itb',
-    'itchiness',
-    'itek',
-    'itemisation',
-    'itemises',
-    'itinerance',
-    'itwas',
-    'ity',
-    'iurii',
-    'iustice',
-    'iuta',
-    'iv&aacute;n',
     'iv&plusmn',
-    'ivanovich',
-    'ivanovo',
-    'ivdc',
-    'ivory-inlaid',
-    'ivy-leaves',
-    'iwas',
-    'iwasaki',
-    'ix.1',
-    'ixia',
-    'ixibatabian',
-    'ixmarites',
-    'ixworth',
-    'izaguirre',
-    'j&eacute;r&ocirc;me',
-    'j&lsqb;ack&rsqb',
     'j-1',
-    'j-200',
-    'j-k',
-    'j.donnelly',
-    'j.i.',
-    'j.m.w.',
-    'j.p.m.millar',
-    'j/35',
-    'j1',
-    'ja-ack',
-    'jabez',
-    'jacarandas',
-    'jacio',
-    'jack-booted',
-    'jacket-baked',
-    'jackhammer',
     'jackling',
-    'jacquemart-andre',
-    'jad',
-    'jadambaa',
-    'jadis',
-    'jaep',
-    'jaffee',
-    'jafferji',
-    'jaggeresque',
-    'jah-bul-on',
-    'jahafil',
-    'jains',
-    'jairmany',
-    'jalaluddin',
-    'jalape&ntilde;o',
-    'jalapeno',
     'jamaat-e-islami',
-    'jamaat-i',
-    'jamahariyah',
-    'jamhoori',
-    'jamiat-i',
-    'jamjar',
-    'jamkhed',
-    'jammiest',
-    'jampacked',
-    'jamrah',
-    'jamyangiyn',
-    'jan-ove',
-    'janeshwar',
-    'janetschek',
-    'jangpura',
-    'jansenist',
     'janssen-jurreit',
-    'janssens',
-    'january-14',
-    'january-20',
-    'january-27',
-    'january-april',
-    'janus-faced',
-    'japanisation',
-    'japenese',
-    'japhet',
-    'jardini&egrave;re',
-    'jargonistic',
-    'jargons',
-    'jarlsberg',
-    'jarmo',
-    'jarosh',
     'jarre',
-    'jarreau',
-    'jarrell',
-    'jarv',
-    'jassy',
-    'jayewardene',
-    'jayston',
-    'jazz-',
-    'jcm800',
-    'jd(s)',
-    'jean-d\'angely',
-    'jean-noel',
-    'jean-yves',
-    'jeanne-marie',
-    'jedda',
-    'jeffs',
     'jegede',
-    'jelbart',
-    'jelbert',
-    'jelena',
-    'jelkes',
-    'jelly-baby',
-    'jelly-fish',
-    'jellyby',
-    'jenin',
-    'jenkins/dentist',
-    'jennet',
-    'jennys',
-    'jephthah',
-    'jeppesen',
-    'jerison',
-    'jermaine',
     'jeroen',
-    'jerrycans',
-    'jesenska',
-    'jessye',
-    'jeste',
-    'jet-age',
-    'jet-setters',
-    'jewel-box',
-    'jewsbury',
-    'jg54',
-    'jgb',
-    'jhabvala',
-    'ji&rcaron&iacute',
-    'jiabao',
-    'jianying',
-    'jibs',
     'jiggles',
-    'jimmi',
-    'jj1',
-    'jmm',
-    'jmp-1\'s',
-    'jn.',
-    'jnf',
-    'jo-anne',
-    'job-for-life',
-    'job-placement',
-    'job-sheet',
-    'jocund',
-    'jodan',
-    'joff&eacute',
-    'johnson-smith',
-    'johnstone1',
     'johnstons',
-    'join/form',
-    'jointness',
-    'jokester',
-    'jokiness',
-    'jollie',
-    'jollop',
-    'joma',
-    'jonathans',
-    'jones-mullins',
-    'jones/nuffield',
-    'jones/oxfordshire',
-    'jones/team',
-    'jonothan',
-    'jordana',
-    'jordanstone',
     'jorre',
-    'jose-luis',
-    'josefata',
-    'josephites',
-    'josy',
-    'jouncing',
-    'jourdelay',
-    'journalistically',
-    'jouvin',
-    'jovanovich',
-    'joveworth',
-    'joy-rides',
-    'jp.',
-    'jpt',
-    'jr2',
-    'jst',
     'jtm45',
-    'jts',
-    'juans',
-    'juantorena',
-    'juara',
-    'juballa',
-    'jubb',
-    'judaeo-christianity',
-    'judge-proof',
-    'jugful',
-    'juglans',
-    'jugo',
-    'jugum',
-    'juicer',
-    'jul&ndash;31',
-    'julie-ann',
     'july-29',
-    'july-3',
-    'jumaine',
-    'jummie',
-    'jumping-jacks',
-    'jumpsuits',
-    'jun&ndash;24',
-    'jun&ndash;28',
-    'jun/fos',
-    'junagadh',
-    'junaid',
-    'june&ndash;29',
-    'june&ndash;3',
-    'june&ndash;july',
-    'june-1',
-    'june-september',
     'junee',
-    'junkshop',
-    'jur.',
-    'jurgens',
-    'juridica',
-    'jurinac',
-    'jurua',
-    'jusei',
-    'jusepe',
-    'just_sort',
-    'justes',
-    'justifica&rehy;tion',
-    'justifier',
-    'jusu-sheriff',
-    'juv',
-    'juve',
     'juventud',
-    'jyotsna',
-    'k&aacute;sos',
-    'k&ogr',
-    'k&uuml;rbs-h&uuml;tte',
-    'k\'va',
-    'k-1',
-    'k-iii',
-    'k-mart',
-    'k-nine',
-    'k.184/161a',
-    'k.246',
-    'k.456',
-    'k.491',
-    'k.p.h',
-    'k/t',
     'k12',
-    'k16',
-    'k18',
-    'k1s',
-    'k3580',
-    'k467',
-    'ka-bom-ba',
-    'ka26',
-    'kaare',
-    'kabanos',
-    'kabat',
-    'kabbalistic',
-    'kabel',
-    'kabui',
-    'kachamila',
-    'kaci',
     'kadour',
-    'kaesong',
-    'kafra',
-    'kaga',
-    'kagona',
-    'kagono',
-    'kahlil',
-    'kahn-freund',
-    'kaiguo',
-    'kaineus',
-    'kaisary',
-    'kaiserslauten',
-    'kaji',
-    'kakapo',
-    'kakata',
-    'kaleidoscopically',
     'kalina',
-    'kallista',
-    'kalmyki',
-    'kalopetra',
-    'kalshoven',
-    'kamakura',
-    'kamaljit',
-    'kambarov',
-    'kamenogorsk',
-    'kamin',
-    'kaminsky',
-    'kamov',
-    'kanagawa-ken',
-    'kanly',
-    'kanodereka',
-    'kansal',
     'kantorowicz',
-    'kanyi',
-    'kapoeta',
-    'kapsel',
-    'kapustin',
-    'kaputnik',
-    'karabiners',
-    'karachai',
-    'karafistan',
-    'karakitsos',
-    'karamanid',
-    'karamjit',
-    'karategi',
-    'karenni',
-    'karl-franz',
-    'karlin',
     'karlstadt',
-    'karstification',
-    'kasaye',
-    'kasei',
-    'kassar',
-    'kassim',
-    'kasthanaia',
-    'kasturi',
-    'kataev',
-    'katahn',
-    'katangese',
-    'katha',
-    'kathak',
-    'kattomeat',
-    'katushev',
-    'kaupanger',
     'kaurin',
-    'kawneer',
-    'kayes',
-    'kayla',
-    'kayts',
-    'kazaskerliks',
-    'kcal/day',
-    'keanie',
-    'kearns-sayre',
-    'kebin',
-    'kebler',
-    'kecskemet',
-    'kedge',
-    'keegans',
-    'keenans',
-    'kehoe/northampton',
     'keil/scottish',
-    'keiwa',
-    'kelantanese',
-    'keldholme',
-    'kelich',
-    'kelloe',
-    'kelpies',
-    'kelsterton',
-    'kem',
-    'kemble/gloucestershire',
-    'kendell',
-    'kenith',
-    'kenley',
-    'kennelled',
-    'kennelmaid',
-    'kenora',
     'kentridge',
-    'kents',
-    'kenzie',
-    'keoboualapha',
-    'keown/landlord',
-    'kepa',
-    'kepe',
-    'kepi',
-    'kepte',
-    'keramane',
-    'kerby',
-    'kerises',
-    'kerith',
-    'kerle',
-    'kernan',
-    'kerrington',
     'kerseys',
-    'kerstan',
-    'kert&eacute;sz',
-    'kerzers',
-    'kesey',
-    'kester',
-    'keting',
-    'ketotifen',
-    'ketton-cremer',
-    'keturah',
-    'keune',
-    'keverne',
-    'kevins',
-    'key(s)',
-    'key-changes',
-    'key-fold',
     'key-schemes',
-    'key-shaped',
-    'keyboard-based',
-    'keyboard-free',
-    'keyed-up',
-    'keyname',
-    'keynsian',
-    'keypads',
-    'keypresses',
-    'keys.',
-    'kg1',
-    'kgotsi',
-    'kgs.',
-    'kh-11s',
-    'kh585',
-    'khalde',
     'khalsa',
-    'khamed',
-    'khania',
-    'khara',
-    'kharchev',
-    'khatoon',
-    'khedivial',
-    'kheng',
-    'khoei',
-    'khojas',
-    'khola',
-    'khon',
-    'khonje',
-    'khora',
-    'khristos',
-    'khrushchevian',
     'khuzistan',
-    'kick-ass',
-    'kick-back',
-    'kick-out',
-    'kick-point',
-    'kick-starts',
-    'kickabout',
-    'kico',
-    'kidminster',
-    'kids.',
-    'kidston',
-    'kiely',
-    'kiewit',
-    'kighoma',
-    'kilbirnie',
-    'kilcock',
     'killiney',
-    'killowen',
-    'kilmastulla',
-    'kilmaurs',
-    'kilnwick',
-    'kilonewtons',
-    'kilworth',
-    'kimiko',
-    'kincraig',
-    'kinde',
-    'kindly-looking',
-    'kindom',
-    'kinetically',
-    'kinetoplastid',
-    'king-cups',
-    'king/queen',
     'kingcups',
-    'kingfisheries',
-    'kingley',
-    'kingships',
-    'kingshouse',
-    'kingsteignton',
-    'kingsthorpe',
-    'kingstone',
-    'kinlochshiel',
-    'kinnie',
-    'kinnockian',
-    'kinnoull',
-    'kinshasa-gombe',
-    'kinvara',
-    'kinza',
-    'kiran',
     'kirchen',
-    'kirchhosbach',
-    'kirillo-methodian',
-    'kirilovas',
-    'kirkella',
-    'kirkgate',
-    'kirkmichael',
-    'kirschner',
-    'kiryat',
-    'kisen',
-    'kishen',
-    'kishinyov',
-    'kisor',
-    'kisr',
-    'kiss-curls',
-    'kiss-me-quick',
     'kiss-off',
-    'kiss.',
-    'kissebah',
-    'kit-e-kat',
-    'kite-fliers',
-    'kittenhood',
-    'kittykins',
-    'kitur',
-    'kitzler',
-    'kiveton',
-    'kivilev',
-    'kiyoshi',
-    'kjoules',
-    'klang',
-    'klebeck',
-    'kleist',
     'klementiev',
-    'kletke',
-    'klett',
-    'klewenalp',
-    'klg',
-    'klingman',
-    'kloppenberg',
-    'kloska',
-    'klownz',
-    'klucker',
-    'klyun',
-    'km/s',
-    'km2',
-    'knaw',
-    'knee-boots',
-    'knee-breeches',
     'kneecappings',
-    'kneehole',
-    'knet',
-    'knettishall',
-    'knids',
-    'knife-and-fork',
-    'knife-related',
-    'knightswood',
-    'knit/knit',
-    'knockdene',
-    'knocker-up',
-    'knocking-shops',
-    'knothole',
-    'knout',
-    'knowbury',
-    'knowd',
     'knowledge-base',
-    'knowledge-intensive',
-    'knuckle-bones',
-    'kobbekaduwa',
-    'kobena',
-    'kobets',
-    'kobke',
-    'kocab',
-    'kocu',
-    'kod&aacute;ly',
-    'koei',
-    'koenigia',
-    'koerber',
-    'kohan',
-    'kohima',
-    'kohli',
     'kohut',
-    'kojima',
-    'kolbitar',
-    'kolchak',
-    'kolestral',
-    'kolimba',
-    'kolinsky',
-    'kolipe',
-    'kolisko',
-    'kolko',
-    'kollo',
-    'kolonos',
-    'kommunistische',
-    'komplektov',
-    'komrat',
-    'kono',
     'konon',
-    'konstantinov',
-    'kontagora',
-    'kooijmans',
-    'kookaburra',
-    'kool-tee',
-    'koonkie',
-    'koonses',
-    'koopas',
-    'kopietz/friend',
-    'kopper',
-    'korbeci',
-    'korean-united',
-    'koren',
-    'kormakiti',
-    'kormas',
     'koryo',
-    'koshiro',
-    'kostchei',
-    'kostelanetz',
-    'kostis',
-    'kostrama',
-    'kot&ecaron;ra',
-    'koumoue',
-    'kouprey',
-    'kouvola',
-    'kowalsky',
-    'kowtowing',
-    'kox31-related',
-    'koye',
-    'kozelek',
-    'kozi',
     'kozlovsky',
-    'kr&oacute;na',
-    'kr&uuml;mmell',
-    'kraals',
-    'krab',
-    'krai',
-    'krankies',
-    'krasnaya',
-    'krasnik',
-    'krasnopevstev',
-    'kreditanstalt',
-    'kreidler',
-    'kreishaus',
-    'kretzmer',
-    'kretzschmar',
-    'krevelen',
     'krigbaum',
-    'kringle',
-    'kristel',
-    'kristiansand',
-    'kroodsma',
-    'krotho',
-    'krs-1',
-    'krs-one',
-    'krupa',
-    'kruschev',
-    'kruskall-wallis',
-    'ks100e',
-    'ksb',
-    'ktm',
-    'ktpi',
-    'kubler',
     'kucera',
-    'kucerak',
-    'kuching',
-    'kudus',
-    'kuisel',
-    'kukri',
-    'kuldip',
-    'kullberg',
-    'kullmann',
-    'kulta',
-    'kunaev',
-    'kunitz',
-    'kunste',
-    'kuntze',
-    'kunzel',
-    'kuperman',
     'kupfermann',
-    'kuptsov',
-    'kurdi',
-    'kurdish-populated',
-    'kure',
-    'kurhotel',
-    'kuriltai',
-    'kuspit',
-    'kustari',
-    'kuta',
-    'kutas',
-    'kutn&aacute',
-    'kutusov',
-    'kuusamo',
-    'kuznets',
-    'kwandebele',
     'kwh/year',
-    'kwik-save',
-    'kwoon',
-    'kyalo',
-    'kyoto-based',
-    'l&aacute;zar',
-    'l&amp;b',
-    'l&amp;h',
-    'l&eacute;vi-straussian',
-    'l&oacute;pez-cobos',
-    'l&ouml;wen',
-    'l&ouml;wenstein',
-    'l&ouml;wy',
-    'l&uacute;cio',
-    'l&uuml;pertz',
-    'l\'&eacute;cluse',
     'l\'a',
-    'l\'aimais',
-    'l\'aisne',
-    'l\'alpe-d\'huez',
-    'l\'amant',
-    'l\'anguille',
-    'l\'apr&egrave;s-midi',
-    'l\'association',
-    'l\'atelier',
-    'l\'elisir',
-    'l\'environnement',
-    'l\'epee',
-    'l\'etang',
-    'l\'etranger',
-    'l\'express',
-    'l\'h&ocirc;pital-saint-blaise',
     'l\'ile',
-    'l\'industrie',
-    'l\'italie',
-    'l\'orfeo',
-    'l\'universit&eacute',
-    'l\'universite',
-    'l(x)',
-    'l-na',
-    'l-s-d',
-    'l-test',
-    'l.a.s',
-    'l.f.',
-    'l.g.o.c.',
-    'l.m.s',
-    'l.o.r.',
-    'l.t.a.',
     'l.t.c.',
-    'l.u.t.',
-    'l/d',
-    'l1r1',
-    'l36',
-    'l40&ndash;60',
-    'l4508',
-    'l970s',
-    'l980',
-    'l983',
-    'l986',
-    'l_',
-    'la-de-da',
-    'la/yb',
-    'la1',
-    'la301',
     'la5',
-    'laage',
-    'laatsch',
-    'laax',
-    'lab&egrave;que',
-    'labastide-clairence',
-    'label-switcher',
-    'labeques',
-    'labials',
-    'labiodental',
-    'labiosa',
-    'laborers',
-    'labour-snp',
-    'labour-voting',
-    'laboute',
-    'labsales',
     'labuschagne',
-    'labvision',
-    'lace-curtained',
-    'lacedaemonians',
-    'lacemaker',
-    'lacewings',
-    'lacey/northamptonshire',
-    'laceys',
-    'lachrimae',
-    'laciniae',
-    'laconicum',
-    'lacots',
-    'lacotte',
-    'lacrimal',
-    'lactoperoxidase',
-    'lacustris',
     'lacy-thompson',
-    'ladder-like',
-    'laddering',
-    'laddio',
-    'laddishness',
-    'ladenburg',
-    'ladybank',
-    'ladyday',
-    'ladykiller',
-    'ladykillers',
-    'ladymount',
-    'lafferty/kings',
-    'lafferty/stroud',
-    'laganas',
-    'lagenorhynchus',
-    'lager-swilling',
     'lagrangean',
-    'lagting',
-    'lahad',
-    'laila',
-    'lailee',
-    'laings',
-    'laira',
-    'laite',
-    'laith',
-    'lajes',
-    'lajoinie',
-    'lakedaimon',
-    'lakehurst',
-    'lakes.',
-    'lali',
-    'lamberton',
     'lambing-shed',
-    'lambird',
-    'lambrettas',
-    'lambshead',
-    'lambskin',
-    'lamentarion',
-    'lami',
-    'lammers',
-    'lammert',
-    'lamont-gregory',
-    'lampholders',
-    'lamproites',
-    'lampson',
-    'lanata',
-    'lancake',
-    'lancaster-oslo-bergen',
     'lancelyn',
-    'land-bound',
-    'land-grants',
-    'land-management',
-    'land-trains',
-    'landauer',
-    'landfilled',
-    'landguard',
-    'landhaus',
-    'landholder',
-    'landing-ground',
-    'landing-grounds',
-    'landsberg',
-    'landwards',
-    'lanegan',
-    'laneway',
     'langans',
-    'langar',
-    'langdales',
-    'langlands',
-    'langlois-ch&acirc;teau',
-    'langmere',
-    'langouste',
-    'langthorpe',
-    'langtons',
-    'language-like',
-    'language-users',
-    'languageless',
-    'langwith',
-    'lanovoi',
-    'lanrean',
-    'lansen',
     'lant',
-    'lantern-jawed',
-    'lanuginosum',
-    'lao-thai',
-    'lapachol',
-    'lapel-badge',
-    'lapham/aylesbury',
-    'lapinha',
-    'laplacian',
-    'lapuna',
-    'laquia',
-    'larcenies',
-    'larcher',
-    'lardy',
-    'large-brained',
-    'large-headed',
     'larger-than-average',
-    'largey',
-    'larios',
-    'larne-1',
-    'larrikin',
-    'lasa',
-    'lascombes',
-    'laserballs',
-    'lasgun',
-    'lasguns',
-    'laska',
-    'lassen',
-    'lasseter',
-    'last-chance',
-    'last-ever',
-    'latcham',
     'latchkey',
-    'late-\'60s',
-    'late-18th',
-    'late-comers',
-    'late-georgian',
-    'late-second',
-    'late-sixties',
-    'lateen',
-    'later-stuart',
-    'later.',
-    'latifah',
-    'latinist',
-    'latst',
-    'lattanzio',
-    'lattice-patterned',
-    'lattice-site',
     'lattisware',
-    'laudians',
-    'lauer',
-    'laugh-lines',
-    'laugher',
-    'launch-control',
-    'launer',
-    'lauper',
-    'laurenzenvorstadt',
-    'lavarium',
-    'laverov',
-    'lavrenti',
-    'lavrov',
-    'law-court',
-    'law-men',
-    'law/fact',
     'lawclub',
-    'lawks',
-    'lawrence/gloucestershire',
-    'lawrences',
-    'lawrencia',
-    'lawry',
-    'laxly',
-    'lay-abbacies',
-    'lay-na',
-    'laya',
-    'layerthorpe',
-    'layin\'',
-    'laying-on',
-    'laying-up',
-    'laynie',
-    'laywomen',
     'lazarette',
-    'lazarettos',
-    'lazartigue',
-    'lazy-beds',
-    'lbgc',
-    'ldls',
-    'le-neveu',
-    'le11',
-    'leachinsky',
-    'lead-off',
-    'lead-only',
-    'leadbank',
-    'leader/wiltshire',
-    'leading-rein',
-    'leaf-blades',
-    'leaf-roll',
     'leagros',
-    'leak-proof',
-    'leamings',
-    'lean-hipped',
-    'learne',
-    'learner-readers',
-    'lease/licence',
-    'leather-booted',
-    'leather-trimmed',
-    'leatherback',
-    'leatherwear',
-    'lecht',
-    'leciester',
-    'leckhampton/gloucestershire',
-    'lectoure',
-    'lectromed',
     'lecturership',
-    'ledecky',
-    'lediakhov',
-    'ledington',
-    'lednor',
-    'ledovskaya',
-    'ledsham',
-    'lee/trainer',
-    'leech-wilkinson',
-    'leeching',
-    'leeds/bradford',
-    'leefe',
-    'leenders',
-    'lees/victim',
-    'left-brained',
-    'left-hand-drive',
     'leftley',
-    'leg-before',
-    'legal-rational',
-    'legalese',
-    'legalistically',
-    'legar',
-    'legbreak',
-    'legers',
-    'legerton',
-    'leghorns',
-    'legiones',
-    'legislation**',
-    'legitimations',
-    'legnica',
-    'legros',
-    'legwarmers',
     'lehn',
-    'leics.',
-    'leighninger',
-    'leighton/hibernian',
-    'leisure-related',
-    'leiva',
-    'lekhal',
-    'lemann',
-    'lembarek',
-    'leminsky',
-    'lemon-coloured',
-    'lenadoon',
-    'lendakari',
-    'lenghaus',
-    'lenity',
-    'lennards',
     'lennep',
-    'lennon-weinberg',
-    'lenoir',
-    'lenox',
-    'lensbury',
-    'lensmen',
-    'lenworth',
-    'lenya',
-    'lenzie',
-    'leominster/herefordshire',
-    'leonardi',
-    'leone-based',
-    'leonetto',
-    'leonte',
-    'leontius',
-    'leopardess',
     'lepidodendron',
-    'lepinsky',
-    'lepomis',
-    'lepton',
-    'leptospicularis',
-    'leptospirosis',
-    'lerby',
-    'lerdahl',
-    'lernaea',
-    'lerskys',
-    'lesath',
-    'leskov',
-    'lesothans',
-    'lespinasse',
-    'less-able',
-    'less-frequent',
     'less-than-brilliant',
-    'lesse',
-    'leste',
-    'lesters',
-    'lesy',
-    'let-offs',
-    'letter-detector',
-    'letter-headed',
-    'letter-perfect',
-    'letter-rack',
-    'letter-sound',
-    'letter-strings',
-    'letter/s',
-    'letterform',
-    'leu2',
-    'leucopterin',
     'leukocytosis',
-    'leuktra',
-    'leur',
-    'leutnant',
-    'lev&eacute;e',
-    'level-headedness',
-    'level/cse',
-    'levelling-off',
-    'levels/gcse',
-    'leventhal',
-    'leverburgh',
-    'leversuch',
-    'leverton',
-    'levie',
-    'levitz',
-    'levski',
     'lewandowsky',
-    'lewisach',
-    'lewison',
-    'lex-11',
-    'lexia',
-    'lexicological',
-    'lexicology',
-    'leyne',
-    'lezama',
-    'lf-controlled',
-    'lfnc',
-    'lhcima',
-    'liabilities/total',
-    'liah',
-    'liao',
-    'liaowang',
     'lib/dem',
-    'libeller',
-    'liberal-democrat',
-    'liberale',
-    'liberashon',
-    'libertines',
-    'liberty-print',
-    'libr&aelig',
-    'libraries.',
-    'libration',
-    'libregts',
-    'libres',
-    'licence-enabled',
-    'licensable',
-    'lichd',
-    'lichen-crusted',
     'licketty',
-    'lickle',
-    'lickspittle',
-    'liebfraumilch',
-    'lieut-col',
-    'lieutenancies',
-    'life-assurance',
-    'life-extension',
-    'life-guards',
-    'life-president',
-    'life-skills',
-    'lifeboys',
-    'lifecourse',
-    'lifestyle.',
-    'lifted-off',
-    'liggins',
     'light-armed',
-    'light-bearers',
-    'light-beige',
-    'light-fittings',
-    'light-greens',
-    'light-headedly',
-    'light-like',
-    'light-proof',
-    'light-rays',
-    'light-tight',
-    'lightboxes',
-    'lightener',
-    'lightish',
-    'lightning-quick',
-    'lightranger',
-    'lightsome',
     'lightswitch',
-    'lightwell',
-    'ligurians',
-    'liii',
-    'likableness',
-    'like_a',
-    'likeability',
-    'likings',
-    'likley',
-    'likud-labour',
-    'lil-lets',
-    'lilac-coloured',
-    'lillerton',
-    'lillford',
-    'lillis',
-    'lim&oacute;n',
     'limann',
-    'limb-like',
-    'limberg',
-    'lime-coloured',
-    'limfjord',
-    'limitedness',
-    'limno-fila',
-    'limnologists',
-    'lincei',
-    'lindahl',
-    'lindfield',
-    'lindsay/strathclyde',
-    'line-astern',
-    'lineback',
-    'linebaugh',
-    'lined-out',
     'linell',
-    'linesiders',
-    'linguisticians',
-    'lining-up',
-    'link&ouml;ping',
-    'linkway',
-    'linleys',
-    'linolenic',
-    'linslade',
-    'linstead',
-    'lintas',
-    'lionello',
-    'lionne',
-    'lionom',
-    'lions.',
-    'liotard',
     'lipbrush',
-    'lipolysis',
-    'lipophilic',
-    'lippes',
-    'lippincote',
-    'lippincott.',
-    'lipread',
-    'liquid-fuelled',
-    'listerhills',
-    'listo',
-    'lists.',
-    'litel',
-    'literalization',
-    'lithesome',
-    'lithogenicity',
-    'lithothamnion',
     'lithotripter',
-    'litigation-conscious',
-    'litigations',
-    'lits',
-    'litt.d.',
-    'litter-ridden',
-    'litterature',
-    'litterbug',
-    'littleblack',
-    'littlehales',
-    'littlewoods/reebok',
-    'litvinova',
-    'litzenberger',
-    'livable',
-    'liveable-with',
-    'liveboard',
     'liver-kidney',
-    'liver-spotted',
-    'liverfluke',
-    'liverishness',
-    'liveweight',
-    'livius',
-    'livox',
-    'ljadc',
-    'ljungmani',
-    'll&ycirc;n',
-    'llandarcy',
-    'llanddeiniolen',
-    'llandegai',
-    'llandinabo',
-    'llandogger',
-    'llanfwrog',
     'llangibby',
-    'llanrumney',
-    'lleshy',
-    'llew',
-    'lll',
-    'lloc',
-    'lloyd-greame',
-    'lluis',
-    'lm10',
-    'lmp2',
-    'lmx',
-    'lnap',
-    'lnhs',
-    'lnw',
-    'loadmaster',
-    'loan/current',
     'loaner',
-    'lobachevsky',
-    'lobe-like',
-    'lobectomy',
-    'lobito',
-    'lobkowicz',
-    'lobley',
-    'lobstein',
-    'lobules',
-    'local-election',
-    'local-for-local',
-    'local/central',
-    'locality.',
-    'locally-trained',
-    'localsh',
-    'locations.',
     'locators',
-    'lochailort',
-    'locheil',
-    'locher',
-    'lochgoilhead',
-    'lochnager',
-    'lochner',
-    'lock-ins',
-    'lock-off',
-    'lockboard',
-    'lockitt',
-    'lockoford',
-    'locoregional',
-    'locri',
-    'loddon',
-    'lodged.',
     'lodon',
-    'lodongiyn',
-    'loegting',
-    'log-books',
-    'log-cabin',
-    'log-derived',
-    'log-it',
-    'loganberries',
-    'logik',
-    'login.com',
-    'logins',
-    'logit',
-    'logologofolau',
-    'logro&ntilde;o',
-    'logsdail',
-    'lohja',
     'lohmann',
-    'loiterers',
-    'lokrians',
-    'lolordo',
-    'loman',
-    'lombardoi',
-    'lomondside',
-    'lomonosov',
-    'london&ndash;delhi',
-    'london-glasgow',
-    'london-leeds',
-    'london-lund',
-    'london-new',
-    'london-tilbury',
-    'londoniarum',
-    'londres',
     'long&rehy;lasting',
-    'long-continuing',
-    'long-duration',
-    'long-extinct',
-    'long-suppressed',
-    'long-termism',
-    'longa',
-    'longacting',
-    'longcot',
-    'longer-established',
-    'longest-established',
-    'longest-playing',
-    'longhair',
-    'longhands',
-    'longiflorum',
-    'longines',
     'longivex',
-    'longliners',
-    'longly',
-    'longman/lancaster',
-    'longtown',
-    'longwe',
-    'longyearbyen',
-    'loog',
-    'looker-on',
-    'lookers',
-    'lookers-on',
-    'loor',
-    'loosely-coupled',
-    'loosely-defined',
-    'loosley',
-    'looter',
     'lopukhin',
-    'lordliness',
-    'loreans',
-    'lorgnette',
-    'lorises',
-    'loss-on-ignition',
-    'lote',
-    'lothlorien',
-    'loudwater',
-    'loueckhote',
-    'loughins',
-    'loughlins',
-    'louis-based',
-    'louis-le-grand',
-    'lounge/dining/kitchen',
-    'louse-borne',
     'loutraki',
-    'love-play',
-    'love-poetry',
-    'lovedale',
-    'lovedolls',
-    'lovel',
-    'loveluck',
-    'lovingbird',
-    'low-browed',
-    'low-bulk',
-    'low-caloried',
-    'low-current',
-    'low-flow',
-    'low-mg',
-    'low-security',
-    'low-skill',
     'lower-attaining',
-    'lower-crustal',
-    'lower-margin',
-    'lower-powered',
-    'lower-than-average',
-    'lowick',
-    'lowlight',
-    'lownes',
-    'lowthers',
-    'loxley',
-    'loyn',
-    'loyton',
-    'lp12',
-    'lps-specific',
-    'lpt1',
-    'lpt1.dos',
     'lpw3-1.1',
-    'lranian',
-    'lrd',
-    'lrps',
-    'ls&dollar;disk',
-    'ls0001',
-    'ls326',
-    'ls9',
-    'lsb',
-    'lspan',
-    'lssp',
-    'lt-col.',
-    'lt.-cdr',
-    'lt/cdr',
-    'ltd-compliant',
-    'ltd.v',
     'ltd/emi',
-    'ltdh',
-    'ltp-like',
-    'lttle',
-    'lubert',
-    'lubes',
-    'lubricator',
-    'luccini',
-    'lucency',
-    'luciana',
-    'lucianne',
-    'luckwell',
-    'lucullan',
-    'lucyless',
-    'ludwig-institut',
-    'ludworth',
     'lueger',
-    'lugardian',
-    'lugton',
-    'luhnenschloss',
-    'luibeilt',
-    'luk&aacute;csian',
-    'lullian',
-    'lumad',
-    'lumbermen',
-    'lumiance',
-    'luminiferous',
-    'lunas',
-    'lundholt',
-    'lundon',
-    'luni-solar',
-    'lunzer',
     'luoma',
-    'lupulus',
-    'lurgashall',
-    'lurigancho',
-    'lusa',
-    'luskentyre',
-    'lustier',
-    'lustley',
-    'lutkowski',
-    'luvsangombyn',
-    'luxembourg-ville',
-    'luxembourgers',
-    'lvta',
-    'lwd',
-    'lwi',
-    'lx-400',
     'lxiii',
-    'lxs',
-    'lxxii',
-    'lxxiii',
-    'lxxxi',
-    'lybia',
-    'lyc&eacute;es',
-    'lycium',
-    'lydan',
-    'lydford',
-    'lydney/gloucestershire',
-    'lydos',
-    'lymphangitis',
-    'lymphatic-vascular',
-    'lympho-epithelial',
-    'lymphoreticular',
     'lynas',
-    'lynchings',
-    'lynchmere',
-    'lynchpins',
-    'lyndale',
-    'lyndon-james',
-    'lyngdoh',
-    'lyngen',
-    'lyonel',
-    'lyppard',
-    'lyrabus',
-    'lys22',
-    'lys430',
-    'lys69',
-    'lysergic',
-    'lyske',
     'lystria',
-    'm&aacute;eld&uacute;in',
-    'm&aacute;ty&aacute;s',
-    'm&aacute;ximo',
-    'm&acirc;ch&eacute',
-    'm&acirc;connais',
-    'm&acirc;itre',
-    'm&amp;b',
-    'm&amp;d',
-    'm&eacute;rim&eacute;e',
-    'm&middot',
-    'm&oacute;rr',
-    'm&uuml;nchengr&auml;tz',
-    'm&uuml;nder',
-    'm\'sieu',
-    'm(n)',
     'm*a*s*h*',
-    'm-40',
-    'm-ps',
-    'm-video',
-    'm.3',
-    'm.a.k.',
-    'm.a.s.h.',
-    'm.b.c.',
-    'm.b.e.',
-    'm.e',
-    'm.i.9',
-    'm.l.',
-    'm.l.a.',
-    'm.l.r.',
-    'm.polymorpha',
-    'm/a-com',
     'm/day',
-    'm/l',
-    'm/litre',
-    'm/n',
-    'm/r',
-    'm/sv',
-    'm1-vac',
-    'm103',
-    'm28',
-    'm33',
-    'm37',
-    'm38',
-    'm47',
-    'm48',
-    'm621',
-    'm67',
     'm700',
-    'm79',
-    'm81',
-    'm87',
-    'ma-qui',
-    'maadi',
-    'maapics/db',
-    'maatschappij',
-    'mac-to-powerpc',
-    'macaca',
-    'macadoo',
-    'macarthys',
-    'macaukin',
-    'macauthor',
-    'macbeths',
-    'maccabeans',
     'maccaig',
-    'maccallum',
-    'macchiaioli',
-    'maccool',
-    'macdougal',
-    'maceachern',
-    'macellum',
-    'macfaddin',
-    'macferlan',
-    'macfhloinn',
-    'macgregors',
-    'machan',
-    'machault',
-    'macherey',
-    'machete-wielding',
-    'machicolation',
     'machine-minders',
-    'machineries',
-    'machista',
-    'machonachie',
-    'maciej',
-    'mackays',
-    'mackem',
-    'macken',
-    'mackerels',
-    'mackerron',
-    'mackeson-sandbach',
-    'maclellan',
-    'macomb',
-    'macpeake',
-    'macphearson',
-    'macphersons',
     'macquillans',
-    'macquoid',
-    'macrae/walker',
-    'macro-cannon',
-    'macro-control',
-    'macro-political',
-    'macro-sociological',
-    'macro-systems',
-    'macrobe',
-    'macrocephala',
-    'macrocosmic',
-    'macroevolution',
-    'macrolide',
-    'macroporous',
-    'macroscopical',
-    'macrotek',
     'macrows',
-    'maculopapular',
-    'maculopathy',
-    'macvector',
-    'macvicar',
-    'macworld',
-    'madang',
-    'madders',
-    'maddington',
-    'maddrell',
-    'made-from',
-    'made-wine',
-    'madeirenses',
-    'madelon',
-    'madelung',
-    'madera',
     'madero',
-    'madey',
-    'madhav',
-    'madine',
-    'madogs',
-    'madonia',
-    'madonna/whore',
-    'madougou',
-    'madrigale',
-    'madun',
-    'mae-britt',
-    'maecha',
-    'maecianus',
-    'maest&agrave',
-    'maestri',
-    'maex',
     'mag.',
-    'magallanes',
-    'magdalensberg',
-    'magers',
-    'maggoty',
-    'maggy',
-    'magid',
-    'magistracies',
-    'magleby',
-    'magne',
-    'magnesium-rich',
-    'magnetisation',
-    'magneto-optic',
-    'magnetotelluric',
-    'magnificient',
-    'magnum/mayall/nelson',
     'magpie-like',
-    'magruder',
-    'magtape',
-    'magwe',
-    'mahamad',
-    'mahaut',
-    'mahdjuri',
-    'mahoganies',
-    'mahogany-coloured',
-    'maib',
-    'maid-servant',
-    'maid-servants',
-    'maidwell',
-    'mail-bags',
-    'mail-enabled',
-    'maillard',
     'mailroom',
-    'maintained.',
-    'maintance',
-    'maitlands',
-    'maitre_d\'h&ocirc;tel',
-    'maizi&euml;re',
-    'majali',
-    'majelis',
-    'majesta',
-    'majestyes',
-    'major-ball',
-    'major/minor',
-    'majorly',
-    'makers.',
-    'maket',
-    'makhno',
     'makinson',
-    'makki',
-    'makololo',
-    'malamud',
-    'malanje',
-    'malarious',
-    'malatie',
-    'malatya',
-    'maldoror',
-    'maldwyn',
-    'male/',
-    'maleas',
-    'maledor',
-    'maleficarum',
-    'maleficent',
-    'malerei',
     'males/females',
-    'malesherbes',
-    'malesian',
-    'maleuda',
-    'malevski',
-    'malfeasance',
-    'malibou',
-    'malignants',
-    'malignity',
-    'malikov',
-    'malimba',
-    'malinga',
-    'malinger',
-    'malingerer',
-    'malise',
-    'malka',
     'malotira',
-    'malt-house',
-    'maluje',
-    'malvezzi',
-    'mama-sans',
-    'mamete',
-    'mamhilad',
-    'mammaries',
-    'man&eacute;s',
-    'man-',
-    'man-induced',
-    'man-land',
-    'man-size',
-    'man-years',
-    'manabozho',
-    'manag',
     'manager/owner',
-    'manco',
-    'mandorla',
-    'mandred',
-    'maneaba',
-    'manelli',
-    'manetta',
-    'manfast',
-    'manful',
-    'mangal',
-    'mangerton',
-    'mangetouts',
-    'manic-depressives',
-    'manihot',
-    'manjusri',
-    'mank',
     'manlifts',
-    'mannekins',
-    'mannerists',
-    'mannes',
-    'mannesman-tally',
-    'mannini',
-    'mannyng',
-    'manoeuverings',
-    'manoevres',
-    'manqu&eacute;e',
-    'manslaughters',
-    'mansped',
-    'mantenuta',
-    'mantes-la-jolie',
-    'mantineia',
-    'mantle-derived',
     'manualism',
-    'manufacturable',
-    'manufacturers.',
-    'manutius',
-    'manvers',
-    'manwarings',
-    'many-gabled',
-    'many-jointed',
-    'many-many',
-    'many-roomed',
-    'many-windowed',
-    'manzarek',
-    'map/illustration',
-    'mapless',
-    'mapmakers',
-    'maquiladora',
     'maracaibo',
-    'maracay',
-    'maramure&scedil',
-    'marangon',
-    'marat/sade',
-    'maratsos',
-    'marbach',
-    'marble-hearted',
-    'marble-sized',
-    'marblehead',
-    'marboeuf',
-    'marcall',
-    'marcasite',
-    'marcelyn',
-    'march-17',
-    'march-phillips',
     'marchington',
-    'marco-pierre',
-    'mardin',
-    'mare-based',
-    'marella',
-    'margarida',
-    'margison',
-    'margox',
-    'margrave/burglary',
-    'mari&eacute;e',
-    'marianismo',
-    'marie-ann',
-    'marie-helene',
-    'marignano',
-    'marilies',
-    'marini&egrave;re',
     'marinos',
-    'mariopteris',
-    'mariscos',
-    'maritimum',
-    'mark-anthony',
-    'mark-down',
-    'mark-lawson',
-    'markenfield',
-    'market-distorting',
-    'market-minded',
-    'marketing/sales',
-    'marketisation',
-    'marktgasse',
-    'marriageability',
-    'marrow-derived',
-    'marshfield',
     'marshside',
-    'marsilio',
-    'marsipal',
-    'martin\'s-in-the-fields',
-    'martindale-hubbell',
-    'martingales',
-    'martinsville',
-    'martlets',
-    'martorana',
-    'martuba',
-    'martunashen',
-    'martynov',
-    'martyrology',
-    'marxist-inspired',
-    'marxist-leninists',
-    'marxman',
     'mary-catherine',
-    'mary-le-bow',
-    'marychurch',
-    'marylebone-manchester',
-    'marypen',
-    'masahiro',
-    'masanori',
-    'mascarenhas',
-    'mascon',
-    'mascons',
-    'mascord',
-    'masharqa',
-    'masheke',
-    'mashie',
-    'masih',
-    'maskrey',
     'mason-dixon',
-    'mass-storage',
-    'massagers',
-    'massera',
-    'massiah',
-    'mastacembelus',
-    'master/mistress',
-    'master/servant',
-    'masterclips',
-    'mastertronic',
-    'masterworkshops',
-    'mastodons',
-    'masturbators',
-    'masulis',
-    'matale',
-    'matawa',
     'match-guising',
-    'match-race',
-    'match-winners',
-    'matchbooks',
-    'matchbox-making',
-    'matchlocks',
-    'matelots',
-    'maternal-fetal',
-    'maters',
-    'mates.',
-    'mathes',
-    'matias',
-    'matija',
-    'matiness',
-    'matooq',
-    'matras',
     'matricarioides',
-    'matriculate',
-    'matrilineally',
-    'matrioshka',
-    'mattei',
-    'matterface',
-    'matterson',
-    'matthaus',
-    'mattheus',
-    'matti',
-    'mattsson',
-    'matveev',
-    'maukinhill',
-    'maulana',
-    'maulers',
-    'maunoury',
     'maur',
-    'mauretanicus',
-    'maurienne',
-    'maurois',
-    'mausolea',
-    'mauzac',
-    'mavers',
-    'maxell',
-    'maximalism',
-    'maximisable',
-    'maximum-security',
-    'maxstone',
-    'maxwell-owned',
-    'maxwell-smith',
-    'may&ndash;23',
-    'may&ndash;26',
     'may-11',
-    'may-12',
-    'may-15',
-    'may-3',
-    'may/thames',
-    'mayagila',
-    'mayanja',
-    'mayanja-nkangi',
-    'mayans',
-    'maychantane',
-    'mayled',
-    'mayon-white/oxford',
-    'mayorship',
-    'mazdak',
-    'mazeikiai',
-    'mazunov',
     'mazza',
-    'mb-1',
-    'mba/diploma',
-    'mbangura',
-    'mbchb',
-    'mboreha',
-    'mbp',
-    'mbuji-mayi',
-    'mc/10',
-    'mcaliskey',
-    'mcaloon',
-    'mcalorum',
-    'mcaninly',
-    'mcanulty',
-    'mcardles',
-    'mcarty',
     'mcauliffe',
-    'mcbeath',
-    'mccallister',
-    'mccapra',
-    'mccarrell',
-    'mccartie',
-    'mccave',
-    'mcclements',
-    'mccloughlin',
-    'mcclusky',
-    'mccmahon',
-    'mccoffey',
-    'mcconahay',
-    'mcconnell/lexie',
-    'mccooey',
-    'mccullers',
     'mccumber',
-    'mccurrie',
-    'mcdonnel',
-    'mcdormand',
-    'mcdowall',
-    'mceleneys',
-    'mcelnea',
-    'mcevilley',
-    'mcevilly',
-    'mcfact',
-    'mcgairy',
-    'mcgarvey',
-    'mcgeehan',
-    'mcgeeney',
-    'mcgeer',
-    'mcgeoghan',
     'mcgiffert',
-    'mcginnigle',
-    'mcgoran',
-    'mcgrandles',
-    'mcgreavey',
-    'mcgrillen',
-    'mcgroddy',
-    'mcguffin',
-    'mcguirk',
-    'mcgurnaghan',
-    'mchamish',
-    'mchema',
-    'mcilvaine',
-    'mckagan',
-    'mckana',
-    'mckeague',
     'mckeeman',
-    'mckeen',
-    'mckeigue',
-    'mckemsley',
-    'mckenny',
-    'mckerrell',
-    'mckew',
-    'mckewan',
-    'mckimm',
-    'mclarnin',
-    'mclennen',
-    'mcloone',
-    'mcluskie',
-    'mcmenamin',
-    'mcmillan-scott',
-    'mcmillans',
     'mcmordie',
-    'mcnaghten',
-    'mcnaught-mandli',
-    'mcnaughtan',
-    'mcneice',
-    'mcneillstown',
-    'mcnerlin',
-    'mcnicholas',
-    'mcod',
-    'mcoscar',
-    'mcready',
-    'mcsimons',
-    'mcsorley',
-    'mcswiggs',
-    'mctigue',
-    'mcveighty',
     'mcwaters',
-    'mdash',
-    'mdn',
-    'me-',
-    'me-ness',
-    'me-too',
-    'me/',
-    'me1li',
-    'meadway',
-    'mealham',
-    'mealstream',
-    'mealworm',
-    'mean-faced',
-    'meaney',
-    'means-related',
-    'means/end',
     'measham',
-    'measor',
-    'measure&mdash',
-    'meat/meet',
-    'meat/poultry',
-    'mebbee',
-    'mebmt',
-    'mec&aacute;nica',
-    'mecham',
-    'mechanical/electrical',
-    'mechanically-operated',
-    'mechanism(s)',
-    'meconopsis',
-    'medauring',
-    'medeans',
-    'medeghino',
     'medgenix',
-    'media-induced',
-    'mediastation',
-    'medicis',
-    'medieval/religious',
-    'medievale',
-    'medisers',
-    'medium-and',
-    'medium-calibre',
-    'medium-dry',
-    'medium-fast',
-    'medium-level',
-    'medium-paced',
-    'medium-to-small',
-    'medkit',
-    'medlicott',
     'medusa-like',
-    'medwin',
-    'meechan',
-    'meerbeke',
-    'meerschaum',
-    'meerut',
-    'meeson',
-    'mega-deals',
-    'mega-fuckstruck',
-    'mega-mergers',
-    'megalith',
-    'megaparsecs',
-    'megapodes',
-    'megilla',
-    'mehret',
-    'mehringer',
     'meighan',
-    'meiktila',
-    'melaenas',
-    'melalophos',
-    'melamine-faced',
-    'melancholics',
-    'melangeur',
-    'melanic',
-    'melanio',
-    'melanoxylon',
-    'melasse',
-    'melcaster',
-    'meldreth',
-    'meldrews',
-    'melismas',
-    'melissico',
     'melius',
-    'mella',
-    'mellieha',
-    'mellifluously',
-    'mellowness',
-    'melodist',
-    'melville/oxford',
-    'melvins',
-    'memani',
-    'member-get-member',
-    'member/director',
-    'membrane-like',
-    'membranes.',
-    'memhs',
-    'memoirists',
-    'menage_a_trois',
     'menander',
-    'mendelians',
-    'mendieta',
-    'menfriends',
-    'mengelberg',
-    'menheniot',
-    'meningitidis',
-    'meningoencephalitis',
-    'menippus',
-    'menlungtse',
-    'menongue',
-    'menq',
-    'mensah-wood',
-    'mensink',
-    'mental/manual',
-    'mental/physical',
     'mentally-retarded',
-    'mentals',
-    'mentionable',
-    'mentions-in-despatches',
-    'menuet',
-    'mepham',
-    'merarites',
-    'mercaptan',
-    'mercurially',
-    'mercurochrome',
-    'merger.',
-    'mergui',
-    'mericlean',
-    'merito',
-    'merops',
-    'merovings',
     'merridale',
-    'merrows',
-    'merry-go-rounds',
-    'merryhell',
-    'merrymakers',
-    'mersham',
-    'merteuil',
-    'mertz',
-    'meruit',
-    'mesial',
-    'mesolectal',
-    'mesotrons',
-    'messerschmidt',
-    'messerschmit',
-    'messidor',
-    'messroom',
     'mestiri',
-    'mesurier',
-    'met.',
-    'meta-scientific',
-    'metabolizes',
-    'metacentrics',
-    'metacharacters',
-    'metafiles',
-    'metal-capped',
-    'metallicity',
-    'metals.',
-    'metamerism',
-    'metastrongyles',
-    'metatarsals',
-    'metathoracic',
-    'meteoriticists',
     'meteorologica',
-    'meteorologically',
-    'methodologist',
-    'methylate',
-    'metical',
-    'metonic',
-    'metre-high',
-    'metricality',
-    'metronomes',
-    'metsa-serla',
-    'metzenbaum',
-    'meuthen',
-    'meval-11',
-    'mevasseret',
-    'mezuzah',
-    'mezza',
     'mezzotints',
-    'mfc',
-    'mfp',
-    'mg.kg',
-    'mg/g',
-    'mg/mmol',
-    'mget01',
-    'mgo',
-    'mhc-linked',
-    'mi-',
-    'mi-guel-ito',
-    'micawberism',
-    'micelle',
-    'michael-in-the-moor',
-    'mickey-taking',
-    'micro-biological',
     'micro-celebrity',
-    'micro-computing',
-    'micro-cracks',
-    'micro-crystalline',
-    'micro-economics',
-    'micro-environment',
-    'micro-film',
-    'micro-reductive',
-    'micro-sociology',
-    'micro-wave',
-    'microbalance',
-    'microbiota',
-    'microbytes',
-    'microcircuitry',
-    'micrococcal',
-    'microcomputers.',
     'microcystin',
-    'microelectronic-based',
-    'microenvironmental',
-    'microfilariae',
-    'microfloppy',
-    'microglobulin',
-    'micrography',
-    'microlitres',
-    'micrometeorites',
-    'micromoles',
-    'micropeltes',
-    'microphthalmos',
-    'microscopists',
-    'microsimulation',
-    'microsocieties',
-    'microsporidia',
     'microstates',
-    'microsurgical',
-    'microswitches',
-    'microtines',
-    'microvillus',
-    'microwells',
-    'mid-1630s',
-    'mid-1690s',
-    'mid-1800s',
-    'mid-18c',
-    'mid-1941',
-    'mid-1959',
-    'mid-1968',
-    'mid-650s',
-    'mid-670s',
-    'mid-780s',
     'mid-cornwall',
-    'mid-course',
-    'mid-crustal',
-    'mid-fielders',
-    'mid-first',
-    'mid-kiss',
-    'mid-layer',
-    'mid-mounted',
-    'mid-north',
-    'mid-part',
-    'mid-position',
-    'mid-river',
-    'mid-sections',
-    'mid-sept',
-    'mid-sixth',
-    'mid-tempo',
     'mid-westerner',
-    'mid-worcestershire',
-    'midafternoon',
-    'middle-managers',
-    'middle-men',
-    'middlegate',
-    'middlestead',
-    'middleton-on-the-wolds',
-    'middleweek',
-    'middley',
-    'middridge',
-    'middx.',
-    'midelney',
-    'midfields',
-    'midika',
-    'midnights',
     'midoesophageal',
-    'midpoints',
-    'midprice',
-    'midsection',
-    'midship',
-    'midterm',
-    'miel',
-    'migenes',
-    'mights',
-    'miglio',
-    'miglior',
-    'migrators',
-    'miguelist',
-    'miinne',
-    'mikhailovich',
-    'mikkelborg',
     'mikkelson',
-    'mikuli&cacute',
-    'mikulski',
-    'mikvas',
-    'milanda',
-    'milas',
-    'milczanowski',
-    'mildewy',
-    'mile-and-a-half',
-    'miles-per-hour',
-    'milfield',
-    'milhe',
-    'milhem',
-    'military-dominated',
-    'milivoje',
-    'milk-churns',
     'milkily',
-    'milkings',
-    'mill-stones',
-    'mill-stream',
-    'mill-worker',
-    'millerandage',
-    'milliards',
-    'millimolar',
-    'millisle',
-    'millowner',
-    'milner-gibson',
-    'milords',
-    'milosz',
-    'milvian',
-    'mimsy',
-    'mind-',
     'mind-dependent',
-    'mind/body',
-    'mindcraft',
-    'mindfuck',
-    'mindlessness',
-    'mineo',
-    'mineralogist',
-    'minerals.',
-    'minety',
-    'mingbo',
-    'mingo',
-    'mini-club',
-    'mini-roundabouts',
-    'minichromosomes',
-    'miniclub',
-    'minicomputer-based',
     'minimag',
-    'minimums',
-    'minimus',
-    'minister-adviser',
-    'minivans',
-    'minizyme',
-    'minnah',
-    'minnigaff',
-    'minniwick',
-    'minor-key',
-    'minor-league',
-    'minores',
-    'minsterworth',
-    'mintimer',
-    'minuet-like',
-    'minuteness',
     'minworth',
-    'minxes',
-    'miodowicz-wolf',
-    'mip',
-    'mips-rated',
-    'mips/ace',
-    'mirabel',
-    'mirabell',
-    'miracle-stories',
-    'miracle.',
-    'mirella',
-    'miremont',
-    'miros',
-    'mirthfully',
-    'mirvic',
-    'mirzoyev',
     'mis-quotation',
-    'mis-recognition',
-    'mis-recognitions',
-    'mis-using',
-    'misano',
-    'misasi',
-    'miscelles',
-    'mischances',
-    'misconstruing',
-    'miscounted',
-    'misdemeanor',
-    'misdescribes',
-    'miserliness',
-    'misetic',
-    'misfield',
-    'mishapen',
     'mishooking',
-    'miskelly',
-    'miskeyings',
-    'misnomers',
-    'misperceived',
-    'misquotation',
-    'misreads',
-    'missenden/buckinghamshire',
-    'missoula',
-    'mist\'',
-    'mist:wartime',
-    'misti',
-    'misys',
-    'mitchell-gears',
-    'mitchell/british',
-    'mitchenson',
     'mitogenesis',
-    'mitoplasts',
-    'mittelrheinisches',
-    'mitzvahs',
-    'mixdown',
-    'mixed-gender',
-    'mixer/spray',
-    'mk2a',
-    'mk4',
-    'mkwayi',
-    'ml/2',
-    'ml/minute/100',
-    'mln',
-    'mlui',
-    'mm106',
-    'mmsm',
     'mnlpr',
-    'mnpp',
-    'mobile-telephone',
-    'mobilizers',
-    'mocatta',
-    'mochica',
-    'mock-serious',
-    'mod&egrave;le',
-    'mod-cons',
-    'modalism',
-    'modas',
-    'modelli',
-    'moderate.',
-    'modestus',
-    'modula-2',
-    'module-name',
     'module-relations',
-    'modules/',
-    'moei',
-    'moeketsie',
-    'moelwyns',
-    'moerdiono',
-    'mofert',
-    'mogas',
-    'mogilev',
-    'mohg',
-    'mohyeddin',
-    'moissac',
-    'moitra',
-    'mokler',
-    'moktadir',
-    'molal',
     'mole-fraction',
-    'molemonths',
-    'moliant',
-    'molinero',
-    'mollasi',
-    'molok',
-    'mom-in-law',
-    'momberg',
-    'momegiture',
-    'momentariness',
-    'momentoes',
-    'momentousness',
-    'mompati',
-    'monaco-ville',
-    'monastically',
-    'monaural',
     'monday-saturday',
-    'mondeos',
-    'money-bag',
-    'money-capital',
-    'money-earner',
-    'money-earners',
-    'money-gdp',
-    'money-grabbers',
-    'money-mad',
-    'money-men',
-    'moneybelt',
-    'moneymakers',
-    'moneypenny',
-    'mongie',
-    'monkeyshines',
-    'monkgate',
     'monksome',
-    'monnica',
-    'mono-cultural',
-    'monocles',
-    'monocline',
-    'monoclonan',
-    'monocots',
-    'monocotyledon',
-    'monocratic',
-    'monocyte',
-    'monodist',
-    'monodists',
-    'monogyna',
-    'monomaniacal',
-    'monooxygenase',
-    'monopolises',
     'monosialoganglioside',
-    'monoski',
-    'monosynaptic',
-    'monson',
-    'monstrousness',
-    'montalembert',
-    'montbretia',
-    'montecristo',
-    'montegos',
-    'montelimar',
-    'montenapoleone',
-    'montgomeries',
-    'montpensier',
-    'montri',
-    'monts',
-    'monumentalisation',
     'monumentum',
-    'monymusk',
-    'monzon-montes',
-    'moodier',
-    'moon-face',
-    'moon-silvered',
-    'mooneys',
-    'moorbrock',
-    'moorhen-like',
-    'moorsholm',
-    'moorsom',
-    'moqqatam',
-    'moraleja',
-    'moralization',
-    'morand',
-    'moratuva',
     'moravcik',
-    'mordon',
-    'more-',
-    'more/less',
-    'morea',
-    'morelion',
-    'morelle',
-    'moretonhampstead',
-    'morillas',
-    'morlaix',
-    'morley-hewitt',
-    'morleys',
-    'mornin',
-    'morning\'',
-    'morobe',
-    'moroto',
     'morphine-like',
-    'morphoclimatic',
-    'morr',
-    'morrants',
-    'morriss',
-    'morristown',
-    'mortgage-related',
-    'mortices',
-    'morticians',
-    'mortifications',
-    'morton-on-swale',
-    'morton-williams',
-    'mosaero',
-    'mosanat',
-    'mosasaurs',
-    'moscatel',
     'mosch',
-    'moschos',
-    'moseyed',
-    'moskovskaya',
-    'mosleyites',
-    'moss-infested',
-    'mossburn',
-    'mossgreen',
-    'mossies',
-    'mossmorran',
-    'mosto',
-    'motahar',
-    'mother-and-baby',
-    'mother-as-breast',
-    'mother-baby',
-    'mother-in-',
     'mother-in-laws',
-    'mother-of-seven',
-    'motherwells',
-    'motif-on-sun',
-    'motor-cyclists',
-    'motorcyle',
-    'motoric',
-    'motormen',
-    'motwani',
-    'moudjahid',
-    'moulson',
-    'mountaintop',
-    'mountrath',
-    'mourad',
-    'moureaux',
-    'mourir',
     'mournful-looking',
-    'mournfulness',
-    'mousse-like',
-    'mousy-haired',
-    'mouthecombe',
-    'mouthless',
-    'mouton-rothschild',
-    'mouvance',
-    'movement-national',
-    'movement-sensitive',
-    'movie-houses',
-    'moviemakers',
-    'moville',
-    'moxham',
-    'moxico',
-    'moyale',
     'moyce',
-    'moydart',
-    'moyenne',
-    'moyglare',
-    'mozelle',
-    'mozzies',
-    'mp/housing',
-    'mp/junior',
-    'mp/minister',
-    'mp/prisons',
-    'mp/trade',
-    'mp/transport',
-    'mp4/7a',
-    'mp4/7as',
-    'mpfl',
-    'mph/kts',
     'mpnp',
-    'mqseries',
-    'mrc-ncs',
-    'mrib',
-    'mrk',
-    'mrn',
-    'mroueh',
-    'ms-dos-',
-    'ms-dos-under-unix',
-    'ms2000',
-    'msdp',
-    'msp1',
-    'msv/year',
-    'mtafu',
-    'mtdnas',
-    'mtef-1',
     'mton',
-    'mtrans',
-    'mtrna',
-    'mu/mmol',
-    'mu5',
-    'much-appreciated',
-    'much-ballyhooed',
-    'much-beloved',
-    'much-cherished',
-    'much-derided',
-    'much-emulated',
-    'much-enlarged',
-    'much-lauded',
-    'much-postponed',
-    'much-revered',
-    'much-thumbed',
     'much-troubled',
-    'much-valued',
-    'much-visited',
-    'much-welcomed',
-    'muchas',
-    'muchelney',
-    'muchkund',
-    'mucius',
-    'muco-purulent',
-    'mucus-like',
-    'mud-encrusted',
-    'muddy-brown',
-    'mudyi',
-    'mufas',
-    'muffing',
-    'muhlfeit',
     'muhyi',
-    'muilleoir',
-    'muirlins',
-    'mujahedin-e-khalq',
-    'mujama\'a',
-    'mujer/fempress',
-    'mukhtars',
-    'mulayem',
-    'mulayen',
-    'mulfords',
-    'mulgan',
-    'muli',
-    'mulishly',
-    'mulligans',
-    'mulsum',
-    'multan',
     'multi-active',
-    'multi-activities',
-    'multi-billion-dollar',
-    'multi-candidate',
-    'multi-chambered',
-    'multi-check',
-    'multi-concept',
-    'multi-course',
-    'multi-handicapped',
-    'multi-institutional',
-    'multi-millions',
-    'multi-occupancy',
-    'multi-oppression',
-    'multi-print',
-    'multi-pronged',
-    'multi-ringed',
     'multi-sectoral',
-    'multi-session',
-    'multi-species',
-    'multi-thousand',
-    'multi-tracking',
-    'multicolor',
-    'multifilaments',
-    'multigym',
-    'multilaterally',
-    'multilists',
-    'multimillionaires',
-    'multiplan',
-    'multiplanar',
-    'multiplayer',
-    'multiplexors',
-    'multiprocessing-capable',
     'multiprogramming',
-    'multivitamin/mineral',
-    'multiwavelength',
-    'mulvany',
-    'mulvenna',
-    'mulverins',
-    'mulvihill',
-    'munangagwa',
-    'muncey',
-    'munchausen-by-proxy',
-    'munchkin',
-    'mundanities',
-    'munford',
-    'munhall',
-    'municipalization',
-    'muniment',
     'munro-baggers',
-    'murdiono',
-    'murids',
-    'murkier',
-    'murkiest',
-    'murkily',
-    'murmurous',
-    'murphys',
-    'murr',
-    'murrelet',
-    'murres',
-    'murum',
-    'murville',
-    'musae',
-    'musajev',
-    'musayev',
     'musbah',
-    'muscle-wise',
-    'musclemen',
-    'musei',
-    'musems',
-    'musetti',
-    'museum-like',
-    'museum-quality',
-    'mushkin',
-    'mushroom-coloured',
-    'music-lover',
-    'muskiness',
-    'muskrats',
-    'muslih',
-    'musocal',
-    'mustaqi',
     'musterings',
-    'musty-smelling',
-    'mutahm',
-    'mutatio',
-    'muteness',
-    'muthiah',
-    'mutlaq',
-    'mutualism',
-    'mutually-dependent',
-    'mutually-owned',
-    'muwaffaq',
-    'muybridge',
-    'mv293',
-    'mvs/esa',
-    'mvx',
-    'mwakikunga',
     'mwb',
-    'mweenish',
-    'mwendamseke',
-    'myc-max',
-    'mycielska',
-    'mycoe',
-    'myelomas',
-    'myelomonocytic',
-    'mykland',
-    'myland',
-    'mylonitic',
-    'mynn',
-    'myocytes',
-    'myoelectric',
-    'myrmecology',
-    'myrmica',
     'mys',
-    'mysticus',
-    'mystifier',
-    'mythographer',
-    'n&auml;ive',
-    'n&eacute;stor',
-    'n&gt',
-    'n\'jie',
-    'n\'sele',
-    'n-1',
-    'n-acetylated',
-    'n-glycan',
-    'n-next',
-    'n-nitro-l-arginine',
-    'n-not',
-    'n-phase',
     'n.21',
-    'n.a.c.',
-    'n.a.f.d.',
-    'n.b',
-    'n.c.t.d.',
-    'n.crassa',
-    'n.f.b.',
-    'n.o.',
-    'n.r.r.',
-    'n.s.c.a.',
-    'n.w.2d',
-    'n.y.s.',
-    'n/2',
-    'n/hotteterre',
-    'n10',
-    'n1207v',
     'n14',
-    'n151u',
-    'n235',
-    'n620l',
-    'n7001u',
-    'n84',
-    'n888ar',
-    'n=28',
-    'n=31',
-    'n=33',
-    'n=47',
-    'n=52',
-    'n=61',
-    'n=65',
-    'na+',
-    'naaqs',
     'nab/pcfc',
-    'nabbi',
-    'nabbing',
-    'nabru',
-    'nacelle',
-    'nacre',
-    'nadh',
-    'nagae',
-    'nagals',
-    'nahijes',
-    'nahnah',
-    'nailmaking',
-    'nailsworth/gloucestershire',
-    'nairac',
-    'nairnshire',
-    'naismith',
     'naji',
-    'nakkuda',
-    'nako',
-    'nakodas',
-    'nakuru',
-    'nalchik',
-    'nambiquara',
-    'namboodiripad',
-    'name-dropper',
-    'name-space',
-    'name-tag',
-    'name/s',
-    'namer',
-    'namque',
-    'nanana',
-    'nanograms',
     'nanokernel',
-    'nansie',
-    'nanteuil',
-    'nany',
-    'napier-bell',
-    'napley',
-    'naproxen',
-    'napthalenic',
-    'narakobi',
-    'narbett',
-    'narcissistically',
-    'narghil',
-    'naris',
-    'narodnyi',
-    'narrational',
-    'narrator/protagonist',
     'narrow-fronted',
-    'narrow-shouldered',
-    'narrowly-based',
-    'nashonal',
-    'naso-temporal',
-    'nasrullah',
-    'natassa',
-    'nateq',
-    'nates',
-    'nathans',
-    'nationalisations',
-    'nationalist-dominated',
-    'nations.',
-    'nativistic',
-    'nativists',
-    'nattereri',
     'natural-language',
-    'naturally.',
-    'nature-based',
-    'naturopathic',
-    'natwar',
-    'naughties',
-    'nauseum',
-    'nauwach',
-    'navathe',
-    'naviera',
-    'navjuvanov',
-    'nawton',
-    'naxxar',
-    'naysayers',
-    'nazari',
-    'nbc-tv',
     'nbp',
-    'nbps',
-    'nbrf',
-    'nc100',
-    'nc6',
-    'ncgia',
-    'ncmtt',
-    'ncp7:cdna',
-    'ncps',
-    'nd4l',
-    'ndjam&eacute;na',
-    'ndpbs',
-    'nds',
-    'ne2000',
-    'ne6',
-    'neads',
     'nealey',
-    'neamy',
-    'neanderthalers',
-    'near-boiling',
-    'near-capacity',
-    'near-complete',
-    'near-desert',
-    'near-deserted',
-    'near-doubling',
-    'near-drowning',
-    'near-freezing',
-    'near-uv',
-    'neatishead',
-    'nebulously',
-    'neccr',
-    'neck-amphora',
     'neck-high',
-    'neckache',
-    'neckerchiefs',
-    'necklets',
-    'necropsies',
-    'nectan',
-    'nectariferous',
-    'necturus',
-    'needle.',
-    'needlecord',
-    'needletime',
-    'needleworkers',
-    'neepsend',
-    'negative-feedback',
-    'neglig&eacute;es',
-    'negligence.',
     'negodin',
-    'negotations',
-    'negotiations.',
-    'negretti',
-    'negulesco',
-    'neighborhoods',
-    'neighbourhoodism',
-    'neighbours.',
-    'neil/weather',
-    'neira',
-    'nelia',
-    'nelson/strathclyde',
-    'nelsons',
-    'nem._con.',
-    'nemadzivhanani',
-    'nemanja',
     'nemanji&cacute',
-    'nemec',
-    'nems',
-    'neo-avant-garde',
-    'neo-conceptual',
-    'neo-expressionism',
-    'neo-freudians',
-    'neo-marxism',
-    'neo-populists',
-    'neomorphism',
-    'neophone',
-    'neosquamocolumnar',
-    'neotenous',
-    'nephelometry',
-    'nephew-in-law',
-    'nephrology',
     'nephrotic',
-    'nepotist',
-    'neputa',
-    'nercwys',
-    'nerra',
-    'nerva',
-    'nesses',
-    'nest-hole',
-    'nest-owners',
-    'nestboxes',
-    'nestings',
-    'net-like',
-    'netcon',
-    'nethan',
-    'netherwoods',
-    'netta',
     'network-management',
-    'neubrandenburg',
-    'neue-caledonia',
-    'neurasthenia',
-    'neuritis',
-    'neuroendocrinology',
-    'neurogenesis',
-    'neuroglial',
-    'neurohormonal',
-    'neuron-specific',
-    'neuropsychologists',
-    'neurospora',
-    'neurotensin',
-    'neurotoxicity',
-    'neustrians',
-    'neutralists',
     'neutrinors',
-    'neuville',
-    'never-had-it-so-good',
-    'new-boy',
-    'new-old',
-    'newarks',
-    'newbigging',
-    'newchurch',
-    'newels',
-    'newfoundlanders',
-    'newhailes',
-    'newly-available',
-    'newly-bought',
-    'newly-commissioned',
-    'newly-conquered',
-    'newly-constituted',
     'newly-electrified',
-    'newly-generated',
-    'newly-imposed',
-    'newly-laid',
-    'newly-qualifieds',
-    'newman/organiser',
-    'newnham-davis',
-    'news-books',
-    'news-cuttings',
-    'news-readers',
-    'newsbreaks',
-    'newspaper/magazine',
-    'newspapers.',
-    'newspeople',
-    'newtech',
-    'newthorpe',
     'newton-raphson',
-    'newty',
-    'nexis',
-    'nextstep-on-intel',
-    'nezer',
-    'nf-il6&bgr',
-    'nf4',
-    'nfff',
-    'nfnt',
-    'ngarikutuke',
-    'ngc6342',
-    'nghe-an',
-    'nghe-tinh',
-    'ni205',
-    'ni212',
-    'ni9',
     'nibbler',
-    'nibblers',
-    'nibblings',
-    'nibley',
-    'nica',
-    'nicads',
-    'nice-pak',
-    'nicholl/thames',
-    'nicholson/the',
-    'nidification',
-    'niederbuhl',
-    'niedzwiedz',
-    'niefer',
-    'nields',
-    'niele',
-    'nielsons',
     'nierlich',
-    'niesen',
-    'niet',
-    'niether',
-    'niftily',
-    'nig-nogs',
-    'night-black',
-    'night-rate',
-    'night-scented',
-    'night-walkers',
-    'nightbirds',
-    'nighted',
-    'nightime',
-    'nightmarishly',
-    'nights.',
-    'nightschool',
     'nightstand',
-    'nightwalker',
-    'nigo',
-    'nigriventris',
-    'niholt',
-    'nikkie',
-    'niklas',
-    'nikolayev',
-    'niland',
-    'niloticus',
-    'nimbys',
-    'nims',
-    'nine\'s',
-    'nine-days',
-    'nine-digit',
-    'nine-fold',
     'nine-forty',
-    'nine-pound',
-    'nineteen-forty',
-    'nineteen-forty-four',
-    'nineteen-seventy',
-    'nineteen-twenty',
-    'nineteenth&rehy;century',
-    'nineteenth-and',
-    'nineteenthcentury',
-    'ninety-odd',
-    'ninety-second',
-    'ninety-seventh',
-    'niniane',
-    'ninn-hansen',
-    'ninnies',
-    'ninth-',
     'niort',
-    'nipped-in',
-    'nipsa',
-    'nirj',
-    'nisanci',
-    'nisar',
-    'nishida',
-    'nit-pickers',
-    'nita',
-    'nitpick',
-    'nitrate-free',
-    'nitrobenzene',
-    'nitwits',
-    'nitya',
-    'nix/foster',
-    'nixon-kissinger',
     'nixons',
-    'nixt',
-    'nizam',
-    'nizhnii',
-    'njoroge',
-    'nkomati',
-    'nl/cm/min',
-    'nlps',
-    'nlq',
-    'nmol/mg',
-    'nmr-derived',
-    'nmsp',
-    'nn.nna',
-    'nn2',
-    'nn6',
-    'nnnn',
     'no-oo',
-    'no-redundancy',
-    'no-strings',
-    'no-talent',
-    'no-till',
-    'no-venta',
-    'no.20',
-    'no.30',
-    'no/24',
-    'no14',
-    'no7',
-    'no_no_one',
-    'noad',
-    'noahs',
-    'nobels',
-    'nobex',
     'nobleness',
-    'nobski',
-    'nocon',
-    'nocsa',
-    'nodosum',
-    'nodosus',
-    'noe-derived',
-    'noiseniks',
-    'noite',
-    'nokes',
-    'nollaig',
-    'nomarch',
-    'nominators',
-    'noms',
-    'non&rehy;committal',
-    'non&rehy;payment',
     'non-a-non-b',
-    'non-accountable',
-    'non-administrative',
-    'non-adult',
-    'non-alienated',
-    'non-anaemic',
-    'non-anglicans',
-    'non-animal',
-    'non-appendicular',
-    'non-aristocratic',
-    'non-artistic',
-    'non-automatic',
-    'non-bibliographic',
-    'non-blocking',
-    'non-calendrical',
-    'non-callable',
     'non-career',
-    'non-case',
-    'non-central',
-    'non-cervical',
-    'non-chinese',
-    'non-cichlids',
-    'non-coding',
-    'non-cognitive',
-    'non-competitors',
-    'non-conducting',
-    'non-conductors',
-    'non-conserved',
-    'non-contested',
-    'non-corrosive',
-    'non-councillors',
-    'non-cultural',
     'non-daily',
-    'non-delegated',
-    'non-delinquents',
-    'non-derogation',
-    'non-descriptors',
-    'non-distressed',
-    'non-doctrinal',
-    'non-durable',
-    'non-educationists',
-    'non-electrical',
-    'non-electronic',
-    'non-emotional',
-    'non-empirical',
-    'non-enzymatic',
-    'non-evangelical',
-    'non-events',
     'non-excused',
-    'non-exercisers',
-    'non-exploitative',
-    'non-fluoridated',
-    'non-fundamental',
-    'non-gay',
-    'non-germans',
-    'non-golfers',
-    'non-greeks',
-    'non-haemorrhagical',
-    'non-hepatic',
-    'non-hereditary',
-    'non-hierarchically',
-    'non-hispanic',
-    'non-historic',
-    'non-hydrogen',
     'non-immunised',
-    'non-independent',
-    'non-indians',
-    'non-indictable',
-    'non-infective',
-    'non-information',
-    'non-injurious',
-    'non-institutionalized',
-    'non-international',
-    'non-iron',
-    'non-juror',
-    'non-kpmg',
-    'non-kurdish',
-    'non-leaguers',
-    'non-legislative',
-    'non-limbic',
     'non-linearly',
-    'non-linguists',
-    'non-live',
-    'non-london',
-    'non-lubricated',
-    'non-macho',
-    'non-matrimonial',
-    'non-metro',
-    'non-mimetic',
-    'non-modern',
-    'non-moslems',
-    'non-motorised',
-    'non-mydriatic',
-    'non-negotiables',
-    'non-network',
-    'non-neurotic',
     'non-normalised',
-    'non-normative',
-    'non-odorous',
-    'non-ordinalized',
-    'non-pancreatic',
-    'non-parasitic',
-    'non-periodic',
-    'non-philosophical',
-    'non-phonological',
-    'non-planning',
-    'non-plussed',
-    'non-politicians',
-    'non-proportional',
-    'non-proportionality',
-    'non-q',
-    'non-qualifiers',
     'non-quantifiable',
-    'non-quota',
-    'non-radial',
-    'non-reactive',
-    'non-realistic',
-    'non-reality',
-    'non-recyclable',
-    'non-red',
-    'non-redeemable',
-    'non-reduced',
-    'non-referential',
-    'non-reminiscers',
-    'non-removable',
-    'non-reserved',
-    'non-residual',
-    'non-retractile',
     'non-returners',
-    'non-rewarded',
-    'non-runners',
-    'non-scots',
-    'non-scottish',
-    'non-secure',
-    'non-security',
-    'non-selected',
-    'non-seu',
-    'non-signatories',
-    'non-small-cell',
-    'non-solicitor',
-    'non-solicitors',
-    'non-speech',
-    'non-staff',
-    'non-sterile',
     'non-stimulated',
-    'non-stochastic',
-    'non-structured',
-    'non-synchronous',
-    'non-systems',
-    'non-telecom',
-    'non-teleological',
-    'non-terminated',
-    'non-theistic',
-    'non-thoracotomy',
-    'non-thought',
-    'non-tradable',
-    'non-transfected',
-    'non-traumatic',
-    'non-triers',
-    'non-turkish',
     'non-typists',
-    'non-ukrainian',
-    'non-unionists',
-    'non-unique',
-    'non-visitors',
-    'non-volunteers',
-    'non-voters',
-    'non-writers',
-    'non-writing',
-    'non-x',
-    'nonagon',
-    'noncommissioned',
-    'noncompetitive',
-    'nondeterministically',
-    'none-too-gentle',
-    'nonfeminist',
     'nonmembers',
-    'nonny-no',
-    'nonparty',
-    'nonquantum',
-    'nonrandomly',
-    'nonreactive',
-    'nonsingular',
-    'nontrivial',
-    'nonviolence',
-    'noo-far',
-    'nookey',
-    'noon&ndash;1.00',
-    'noontime',
-    'noordwijkerhout',
-    'noormahomed',
-    'nopenin\'',
     'noreiga',
-    'norfrost',
-    'norie',
-    'norites',
-    'normal/abnormal',
-    'normandale',
-    'normannenstrasse',
-    'normative-explanatory',
-    'normlessness',
-    'normochlorhydric',
-    'norreys',
-    'nortest',
-    'north-about',
-    'north-american',
-    'north-easterlies',
-    'north-eastward',
     'north-westerners',
-    'northampshire',
-    'northeasterly',
-    'northgalis',
-    'northwestwards',
-    'norwegian-owned',
-    'nosbridge',
-    'nose-cone',
-    'nose-rings',
-    'nose-rubbing',
-    'nosin\'',
-    'nostalgias',
-    'not-being',
-    'not-flaubert',
-    'not-guilty',
-    'not-in-my-backyard',
     'not-ok',
-    'not-very-good',
-    'not_at',
-    'notebook-sized',
-    'notestein',
-    'nothi',
-    'notholt',
-    'noti',
-    'noticably',
-    'noticias',
-    'notocord',
-    'notre-dame-la-grande',
-    'notus',
-    'nouveaux-riches',
-    'nov-jan',
-    'novadyne',
     'novelisation',
-    'novellas',
-    'november-2',
-    'november-23',
-    'november/early',
-    'novembers',
-    'novias',
-    'novikov',
-    'novios',
-    'novissimo',
-    'novocherkassk',
-    'now-dead',
-    'now-disbanded',
-    'now-retired',
-    'now.',
-    'nowheresville',
     'nowozielski',
-    'nowruz',
-    'noyan',
-    'np9',
-    'npfl-held',
-    'npi',
-    'nr2101',
-    'nru',
-    'ns.21a',
-    'nscn',
-    'nsf-22',
-    'nsms',
-    'nsomo',
-    'nsr250',
-    'nsrs',
-    'nssp',
     'ntashamaje',
-    'nteziryayo',
-    'ntfs',
-    'nua',
-    'nubiles',
-    'nuchal',
-    'nuclear-family',
-    'nucleophilic',
-    'nuclepore',
-    'nudum',
-    'nuisance.',
-    'number-theoretic',
-    'numbered/lettered',
-    'numberplates',
-    'numbskulls',
-    'numerative',
     'numerator-denominator',
-    'numerus',
-    'numidian',
-    'numismatists',
-    'nummy',
-    'nunataks',
-    'nuncupatio',
-    'nuon',
-    'nura',
-    'nurbhai',
-    'nuristan',
-    'nursery-maids',
-    'nursery/playgroup',
-    'nurserymaid',
-    'nursey',
-    'nurturers',
     'nuryev',
-    'nut-cases',
-    'nut-trees',
-    'nuthatch-like',
-    'nuts-and-bolts',
-    'nutterworth',
-    'nuvara',
-    'nuwcm',
-    'nval',
-    'nve',
-    'nvono',
-    'nw11',
-    'nw7',
-    'nwh',
-    'nwp',
-    'nws',
     'nxg5',
-    'nxp1000',
-    'nxr&gt',
-    'nyack',
-    'nymphaefolius',
-    'nympton',
-    'nynehead',
-    'nyum-nyum',
-    'nzi',
-    'nziengui',
-    'nzwani',
-    'o&pound',
-    'o\'blisco',
-    'o\'donnells',
-    'o\'gara-hess',
-    'o\'hennessy',
     'o\'muilleoir',
-    'o\'regan',
-    'o\'ross',
-    'o(n2)',
-    'o-five-hundred',
-    'o-h',
-    'o-oh',
-    'o.b.',
-    'o.c.',
-    'o.n.o',
-    'o/45',
-    'o/gcse',
-    'o/s',
-    'o6',
-    'oae',
-    'oak-trees',
     'oakenson',
-    'oakeshottians',
-    'oakesway',
-    'oakmere',
-    'oasaka',
-    'ob-irtysh',
-    'obafemi',
-    'obconica',
-    'obdurateness',
-    'oberle',
-    'oberleutnant',
-    'oberlin',
-    'obetsibi',
-    'obfuscations',
-    'obituarists',
-    'object-glasses',
     'object-orientated',
-    'obliqueness',
-    'obliquities',
-    'obliquus',
-    'obnoxiousness',
-    'observations.',
-    'observer/harris',
-    'occasionally.',
-    'occasionals',
-    'occassion',
-    'occludens',
-    'occupationally-acquired',
-    'occupationally-specific',
-    'ocean-atmosphere',
-    'octameric',
-    'octandra',
     'october-14',
-    'october-21',
-    'octofoil',
-    'octopartite',
-    'oculis',
-    'oculists',
-    'oculomotor',
-    'oda-funded',
-    'odc',
-    'odoff',
-    'oecd/ceri',
-    'oehlen',
-    'oenothera',
-    'oesteonecrosis',
-    'oesterhelt',
-    'of-the',
     'off&rehy;width',
-    'off-comers',
-    'off-specular',
-    'off-the',
-    'offender(s)',
-    'offendors',
-    'offer/',
-    'offerers',
-    'offguard',
-    'offhandedness',
-    'offic',
-    'office-bearer',
-    'office-sponsored',
-    'office-workers',
-    'officeholders',
-    'officer/higher',
     'officina',
-    'officiousness',
-    'offie',
-    'offord',
-    'offspinners',
-    'offworlders',
-    'oft-told',
-    'ogarev',
-    'ogborn',
-    'ogdentown',
-    'ogly',
-    'oh-so-ordinary',
-    'oh-three-one',
-    'ohlson',
-    'oieo',
-    'oignies',
     'oikos',
-    'oil-',
-    'oil-can',
-    'oil-drums',
-    'oil-polluted',
-    'oiler',
-    'oilrig',
-    'oinophyta',
-    'ojemann',
-    'okey-',
-    'olafur',
-    'old-looking',
-    'oldsters',
-    'oleaginous',
-    'olechea',
-    'olecranon',
     'olefinic',
-    'olfaction',
-    'oligarchical',
-    'oligochaetes',
-    'oligopeptides',
-    'oligosaccharide',
-    'olistostromes',
-    'olivaer',
-    'olive-toned',
-    'olivet',
-    'oloo',
-    'olsburgh',
-    'olusegun',
-    'olympios',
-    'ombres',
-    'omegamon',
     'ommatidium',
-    'ommeyad',
-    'ommochromes',
-    'omne',
-    'omnicompetence',
-    'omnitel',
-    'omophagea',
-    'omori',
-    'omvs',
-    'on-and-off',
-    'on-job',
-    'on-licences',
-    'on-lookers',
-    'on-singular',
-    'on-the',
-    'on-the-fly',
     'on-the-water',
-    'on-time',
-    'on-u',
-    'onanistic',
-    'onc/ond',
-    'once-familiar',
-    'once-grand',
-    'once-in-a-while',
-    'once-popular',
-    'once-promising',
-    'once-royal',
-    'once-white',
-    'oncogenesis',
-    'ondes',
-    'one&rehy;off',
-    'one-celled',
     'one-club',
-    'one-day-old',
-    'one-days',
-    'one-designs',
-    'one-directional',
-    'one-electron',
-    'one-fifteen',
-    'one-fifty',
-    'one-horned',
-    'one-hundred-per-cent',
-    'one-in-a-bar',
-    'one-in-a-million',
-    'one-man-one-vote',
-    'one-nighter',
-    'one-nighters',
-    'one-second',
     'one-x-nine-two-four',
-    'oneliners',
-    'onest',
-    'onfield',
-    'ongkili',
-    'onlie',
-    'onoufrios',
-    'onslow-fane',
-    'ontogenetically',
-    'onx',
-    'onyango',
-    'oo-ee',
-    'oo91',
-    'oolites',
-    'oors',
-    'oos',
     'oosterhuis',
-    'oozings',
-    'op.1',
-    'op.18',
-    'opaques',
-    'open-systems',
-    'open-toppers',
-    'open-winning',
-    'open/save',
-    'openable',
-    'openair',
-    'openest',
-    'opening-time',
-    'openmail',
-    'openmodel',
-    'opera-ballets',
     'opera-going',
-    'operationalism',
-    'ophiernus',
-    'ophioleucinae',
-    'ophiophiura',
-    'ophiophrixus',
-    'ophioripa',
-    'ophiothauma',
-    'ophiuridae',
-    'ophthalmia',
-    'ophthalmological',
-    'opies',
-    'opitz',
-    'oposici&oacute;n',
-    'opp.',
-    'oppitz',
     'oppoes',
-    'opponent-process',
-    'opportunties',
-    'opposers',
-    'opposition-dominated',
-    'oppositionists',
-    'ops.',
-    'opticks',
-    'optimizers',
-    'options.',
-    'optivision',
-    'optix',
-    'optomistic',
-    'oral-aural',
-    'orangeism',
-    'oratorium',
     'orch.',
-    'ordaz',
-    'ordinates',
-    'orebodies',
-    'organ-speech',
-    'organizaciones',
-    'organophosphorous',
-    'oribi',
-    'oriental-sounding',
-    'originative',
-    'oris',
-    'orius',
-    'ornamentalism',
-    'ornovitza',
-    'oro-pharyngeal',
-    'orolowetsky',
     'oropesa',
-    'orozco',
-    'orthodontist',
-    'orthogenetic',
-    'orthographical',
-    'orthophosphate',
-    'ortis',
-    'ortleb',
-    'orzo',
-    'os.',
-    'os/eye*node',
-    'osberk',
-    'oscillograph',
-    'osei',
-    'osfrt',
-    'osgifu',
     'osi/tp',
-    'osian',
-    'osipyan',
-    'osirian',
-    'osmany',
-    'ossicles',
-    'ossip',
-    'ost-marks',
-    'ostashkov',
-    'ostashvili',
-    'ostem',
-    'ostems',
-    'osteoblasts',
-    'osteoglossum',
-    'osteomalacia',
-    'osteomyelitis',
     'osteospermums',
-    'oster',
-    'osterud',
-    'ostiole',
-    'ostman',
-    'ostracization',
-    'ostrich-like',
-    'ostrogi',
-    'ostrogorski',
-    'ostrova',
-    'ostrovsky',
-    'oswego',
-    'otellini',
-    'otherwordly',
-    'otobi',
-    'otoscopically',
     'ottawa-based',
-    'ottmann',
-    'ottowa',
-    'ouargla',
-    'oud-poelgeest',
-    'oudry',
-    'ouimet',
-    'ouistreham',
-    'out-do',
-    'out-of-condition',
-    'out-of-service',
-    'out-of-the-body',
-    'out-of-wedlock',
-    'out-performs',
-    'out-placement',
-    'out-think',
     'outdatedness',
-    'outer-london',
-    'outfields',
-    'outgrabe',
-    'outhgill',
-    'outlawries',
-    'outmost',
-    'outports',
-    'outranking',
-    'outre',
-    'outshoot',
-    'outsi',
-    'outside-halves',
-    'outstare',
-    'outswing',
-    'outward-facing',
     'ovadia',
-    'ovalbumin',
-    'ovate',
-    'oven-baked',
-    'over-achievers',
-    'over-affectionate',
-    'over-assessment',
-    'over-busy',
-    'over-candid',
-    'over-cautiousness',
-    'over-centralisation',
-    'over-compensating',
-    'over-conscientious',
-    'over-conscious',
-    'over-delicate',
-    'over-doing',
     'over-drive',
-    'over-estimates',
-    'over-exert',
-    'over-extension',
-    'over-friendly',
-    'over-full',
-    'over-generalisation',
-    'over-grand',
-    'over-identification',
-    'over-indulging',
-    'over-lavish',
-    'over-length',
-    'over-looking',
-    'over-modest',
-    'over-obvious',
-    'over-polite',
     'over-producers',
-    'over-ratin\'',
-    'over-ready',
-    'over-recorded',
-    'over-represent',
-    'over-restrictive',
-    'over-rides',
-    'over-seas',
-    'over-serious',
-    'over-simplifications',
-    'over-sixty-year-olds',
-    'over-size',
-    'over-solicitous',
-    'over-specialised',
-    'over-subscription',
-    'over-talkative',
     'over-taxing',
-    'over-thin',
-    'over-urbanisation',
-    'over-whelming',
-    'over-working',
-    'overabundance',
-    'overbearingly',
-    'overcautious',
-    'overcentralised',
-    'overcometh',
-    'overcommitting',
-    'overconsumption',
-    'overeaten',
-    'overemotional',
-    'overemphasize',
-    'overhearers',
     'overindulgent',
-    'overman',
-    'overprotectiveness',
-    'overprovision',
-    'overrepresentation',
-    'overround',
-    'oversailing',
-    'overseas-owned',
-    'oversensitivity',
-    'overskirt',
-    'overstability',
-    'overstaying',
-    'overstone',
-    'overtaxation',
-    'overtire',
-    'owel',
     'owen/itn',
-    'owlet',
-    'own\'',
-    'own-price',
-    'owner(s)',
-    'owner-drivers',
-    'owner-farmers',
-    'owner-like',
-    'owner/occupied',
-    'owthorne',
-    'ox-carts',
-    'ox-like',
-    'ox3',
-    'oxalic',
-    'oxborrow',
-    'oxenford',
     'oxfendazole',
-    'oxford-educated',
-    'oxforshire',
-    'oxmus',
-    'oxonian',
-    'oxycarbonyl',
-    'oxymoronic',
-    'oxytocic',
-    'oxyura',
-    'oy.',
-    'oya',
-    'oz/&amp',
-    'oz/&frac14',
-    'oz/1',
-    'ozires',
-    'ozokerite',
     'ozols',
-    'ozone-depleters',
-    'p&aacute;draic',
-    'p&amp:o',
-    'p&amp;h',
-    'p&amp;o/orient',
-    'p&eacute;ter',
-    'p&lt;0.01&ndash;0.001',
-    'p&lt;10',
-    'p&ndash;38s',
-    'p&ndash;51',
-    'p\'a',
-    'p(1)',
-    'p(3)',
-    'p(g)',
-    'p*',
     'p-cadherins',
-    'p-g',
-    'p-waves',
-    'p-word',
-    'p.-w.',
-    'p.103',
-    'p.117',
-    'p.122',
-    'p.124',
-    'p.125',
-    'p.127',
-    'p.128',
-    'p.152',
-    'p.158',
-    'p.180',
-    'p.221',
     'p.238',
-    'p.255',
-    'p.288',
-    'p.2d',
-    'p.36',
-    'p.39',
-    'p.407',
-    'p.43',
-    'p.432',
-    'p.55',
-    'p.63',
-    'p.67&ndash;68',
-    'p.74',
-    'p.77',
-    'p.85',
-    'p.95',
     'p.99',
-    'p.anserina',
-    'p.i',
-    'p.l.a.',
-    'p.n.',
-    'p.p.b.v.',
-    'p.p.e.',
-    'p.r.o',
-    'p.w.o.',
-    'p/19/112',
-    'p/bk',
-    'p/es',
-    'p/ex',
-    'p/n',
-    'p/r',
-    'p0.0001',
     'p1.iv',
-    'p1/lp2',
-    'p1/t6',
-    'p100m',
-    'p109l',
-    'p113i',
-    'p114',
-    'p114c',
-    'p115',
-    'p1154',
-    'p134',
-    'p1344',
-    'p220',
-    'p3/ns1/1-ag4.1',
-    'p33',
-    'p3u1',
     'p4/t1.2',
-    'p4/t4',
-    'p41',
-    'p43',
-    'p57/',
-    'p596',
-    'p62',
-    'p66/p51',
-    'p70',
-    'p78',
-    'p94',
-    'p=0.0002',
-    'p=0.019',
-    'p=0.023',
-    'p=0.027',
-    'p=0.044',
     'p=0.068',
-    'p=0.12',
-    'p=0.15',
-    'p=0.16',
-    'p=0.20',
-    'p=0.21',
-    'p=0.22',
-    'p=0.27',
-    'p=0.34',
-    'p=0.5',
-    'p=0.7',
-    'p=0.75',
-    'p=0.79',
-    'pa&rcaron;i&zcaron;sk&aacute',
-    'pa01i',
-    'pachomius',
     'pachytenes',
-    'pacificus',
-    'pacifistic',
-    'pack-animals',
-    'packs.',
-    'packstone',
-    'paclc',
-    'pacuw3',
-    'padauk',
-    'padda',
-    'paddle-like',
-    'paddle-wheels',
-    'padiham',
-    'padma',
-    'padog',
-    'padovano',
     'paf-acether',
-    'pages-per-minute',
-    'pagets',
-    'pagex2t',
-    'pagnol',
-    'pagoda-like',
-    'paid-in',
-    'paid-out',
-    'pailthorpe',
-    'paint-spattered',
-    'paintable',
-    'paintings.',
-    'paintings/drawings',
-    'pair-bonding',
-    'pair-breaking',
-    'paired-associate',
     'paired-pulse',
-    'pairs.',
-    'paisely',
-    'pajonal',
-    'paka',
-    'pakamacs',
-    'paktar',
-    'pal&aacute;cio',
-    'palaeo-environmental',
-    'palaeobotany',
-    'palaeoclimatic',
-    'palaeographer',
-    'palawan',
-    'pale-breasted',
-    'palembang',
-    'palestinian-controlled',
     'palestro',
-    'palio',
-    'pallan',
-    'pallis',
-    'palm-lined',
-    'palmer/ashbury',
-    'palmists',
-    'palomas',
-    'palpifer',
-    'palucci',
-    'paluel',
-    'palustre',
-    'pameton',
-    'pamments',
-    'pamphylia',
-    'pampisford',
     'pan-and-tilt',
-    'pan-asian',
-    'pan-global',
-    'pan-islamic',
-    'pan-pipes',
-    'panamensis',
-    'panayotis',
-    'pancasila',
-    'panchen',
-    'panchromatic',
-    'pancreaticoduodenal',
-    'pancreatobiliary',
-    'pandaemonium',
-    'pandava',
-    'pandavas',
-    'pandya',
     'panegyrical',
-    'panel-mounted',
-    'panellinion',
-    'panfil',
-    'panglong',
-    'panicale',
-    'panigrahi',
-    'panizzi',
-    'panner',
-    'panopticism',
-    'panproctocolectomy',
-    'pantaenius',
-    'pantechnicons',
-    'pantisocrats',
-    'pantropical',
-    'pantun',
     'pap&aacute',
-    'papadopoulos',
-    'paper(s)',
-    'paper-bound',
-    'paper-chains',
-    'paper-white',
-    'paperback.',
-    'paperbackers',
-    'papergirl',
-    'papermaker',
-    'papersave',
-    'papineau',
-    'papplewick',
-    'papya',
-    'par-fives',
-    'para-aortic',
     'para-gliding',
-    'paraboloids',
-    'paracellular',
-    'paracentesis',
-    'parachor',
-    'paradisaical',
-    'paradisiacal',
-    'paraldehyde',
-    'paralegal',
-    'parallactic',
-    'parallel-inserted',
-    'parallel-sided',
-    'paralogical',
-    'paramagnetism',
-    'parameterized',
-    'parametrisation',
     'paramilitarism',
-    'paramoecium',
-    'paramours',
-    'paran&aacute',
-    'paranoids',
-    'paranota',
-    'paraoesophageal',
-    'paraphyletic',
-    'parapraxis',
-    'parapsychologist',
-    'parasitologist',
-    'parataxis',
-    'paravent',
-    'paraxial',
-    'pardoners',
-    'pardus',
     'parens',
-    'parent-adolescent',
-    'parent/',
-    'parent/guardian',
-    'parent/subsidiary',
-    'parentless',
-    'parfumier',
-    'parikrama',
-    'parings',
-    'parini',
-    'paris-roubaix',
-    'paris-sud',
-    'parish-based',
-    'parishoners',
-    'parites',
-    'park-keepers',
     'park/gloucestershire',
-    'parkdale',
-    'parkinsonism',
-    'parkinsons',
-    'parkstone',
-    'parkyn',
-    'parlasca',
-    'parliamentry',
-    'parly',
-    'parm',
-    'parme',
-    'parnaka',
-    'parorchis',
-    'parquet-floored',
-    'parsecs',
-    'parshall',
     'parsloe',
-    'part-bred',
-    'part-description',
-    'part-gargoyles',
-    'part-packs',
-    'part-paid',
-    'part-written',
-    'partage',
-    'partakers',
-    'parthenium',
-    'parthenogenesis/',
-    'partials',
-    'partic\'lar',
-    'participant/observer',
-    'particuarly',
-    'particularisms',
     'particulars.',
-    'partita',
-    'partitioned-off',
-    'partlington',
-    'partly-built',
-    'partner/manager',
-    'parttime',
-    'party-based',
-    'party-christian',
-    'party-to-party',
-    'party0',
-    'parvifolia',
-    'parwood',
-    'pasdun',
-    'pashtu',
-    'pasionaria',
     'pasok-left',
-    'pass-through',
-    'passamaquoddy',
-    'passbooks',
-    'passenger-miles',
-    'passionel',
-    'passive/active',
-    'passkey',
-    'passport-holders',
-    'past-tense',
-    'paste-ups',
-    'pastel-shaded',
-    'paster',
-    'pastille',
-    'pastness',
-    'pastorales',
     'pastry-making',
-    'pat&eacute;s',
-    'patchworks',
-    'paternas',
-    'path-breaking',
-    'pathologise',
-    'patients.the',
-    'patin',
-    'patkin',
-    'patriae',
-    'patriarchally',
-    'patrilocal',
-    'patriotically',
-    'patronesses',
-    'patronizes',
-    'patronne',
     'pattack',
-    'pattea',
-    'pattern-notes',
-    'patterns.',
-    'paukert',
-    'paul-yves',
-    'paused.',
-    'pavanes',
-    'pavans',
-    'pawky',
-    'pay-days',
-    'pay-for-play',
-    'pay-slips',
-    'payable.',
-    'paycock',
-    'payees',
     'paying-off',
-    'payne/thames',
-    'paysannat',
-    'pazar',
-    'pazos',
-    'pb-zn-ba',
-    'pbf',
-    'pbq',
-    'pbvispcr2',
-    'pc-at',
-    'pc-software',
-    'pc10',
-    'pc3386sx',
-    'pc60',
-    'pcb-contaminated',
-    'pcl5',
     'pcr-based',
-    'pcr-fragment',
-    'pcrip',
-    'pdcb',
-    'pdi',
-    'pdsc',
-    'pe4',
-    'pea-brained',
-    'pea-like',
-    'pea-soupers',
-    'peacockery',
-    'peake/gloucestershire',
-    'pean',
-    'pearl-white',
-    'pearly-white',
-    'peasantisation',
     'peascod',
-    'peashooter',
-    'peashooters',
-    'peasmarsh',
-    'peasnell',
-    'peat-brown',
-    'peat-like',
-    'pebley',
-    'peccadillos',
-    'peccator',
-    'peci',
-    'peck-order',
-    'peckable',
-    'peckover',
-    'pedal&eacute',
-    'pedal-powered',
     'pederasty',
-    'pedestrian/cycle',
-    'pedestrianization',
-    'pedicab',
-    'pediculus',
-    'pedicures',
-    'pedogenesis',
-    'pedogenic',
-    'pee-',
-    'peeblesshire',
-    'peeg',
-    'peelites',
-    'peepholes',
-    'peepy',
-    'peer-reviewed',
-    'peg-like',
     'pegaso',
-    'peggs',
-    'pegswood',
-    'peichl',
-    'peisistratids',
-    'pelada',
-    'peldon',
-    'peleo',
-    'pelites',
-    'pelkmans',
-    'pellestrina',
-    'pellings',
-    'pelorus',
-    'pelta',
-    'pelvicachromis',
-    'pen-enabled',
     'pen-friends',
-    'pen-pushers',
-    'pencil-fuses',
-    'peneios',
-    'penelopes',
-    'penev',
-    'pengally',
-    'pengam',
-    'pengelly',
-    'penitentials',
-    'penkett',
-    'penkridge',
-    'penniston',
-    'penny-farthings',
-    'pensant',
-    'pensiveness',
     'penstock',
-    'penston',
-    'pensylvanicum',
-    'pentads',
-    'pentameral',
-    'pentameters',
-    'pentathlete',
-    'penthesilea',
-    'pentices',
-    'pentium-class',
-    'pentium-compatible',
-    'pentobarbital',
-    'pentremites',
-    'penwindows',
-    'peoli',
-    'peon',
     'people-based',
-    'people-clubcall',
-    'people-watching',
-    'peoplehood',
-    'pepes',
-    'pepito',
-    'peploides',
-    'pepper-and-salt',
-    'peppermoor',
-    'pepperpot',
-    'per-neb',
-    'peracchi',
-    'perbene',
-    'percenters',
-    'perceptor',
-    'percipients',
     'percolators',
-    'percoll',
-    'percussiveness',
-    'percys',
-    'peregrinatio',
-    'peregrinella',
-    'perenial',
-    'perfectability',
-    'perfecter',
-    'perfectly-timed',
-    'perfidia',
-    'performer(s)',
-    'peribronchial',
-    'pericardial',
-    'perifoveal',
-    'perineurium',
     'periosteum',
-    'periostracum',
-    'periplus',
-    'perishingly',
-    'perithecia',
-    'periventricular',
-    'perkes',
-    'perlatum',
-    'perlita',
-    'permers',
-    'permethrin',
-    'permo-carboniferous',
-    'permo-trias',
-    'permusyawaratan',
-    'permutable',
-    'permuting',
     'perniciously',
-    'pernis',
-    'peroperative',
-    'perratt',
-    'perrier-jouet',
-    'perrons',
-    'perrott',
-    'persabus',
-    'perseverence',
-    'persian-speaking',
-    'person-oriented',
-    'persuit',
-    'pertinax',
-    'pertuis',
-    'perumal',
-    'perusals',
     'pervasion',
-    'pervious',
-    'perwakilan',
-    'peryt_et',
-    'pesage',
-    'pesaka',
-    'pescaru',
-    'pesek',
-    'peste',
-    'pesticide-free',
-    'pesticide-resistant',
-    'pestilent',
-    'pet15b',
-    'petal-shaped',
-    'petards',
-    'peterboro',
     'petersburgh',
-    'petheridge',
-    'petioles',
-    'petitio',
-    'petits_bourgeois',
-    'petkovic',
-    'petr&oacute;leos',
-    'petrasovits',
-    'petrifies',
-    'petro-canada',
-    'petrobr&aacute;s',
-    'petrol&iacute;feros',
-    'petrol-blue',
-    'petrol-soaked',
-    'petrol-sodden',
-    'petroleos',
     'petroliferous',
-    'petrologist',
-    'petrologists',
-    'petrovic',
-    'petrovietnam',
-    'petrovna',
-    'petrovs',
-    'petsopoulos',
-    'petters',
-    'pettersen',
-    'pettier',
-    'pettijohn',
-    'pettipher',
-    'peugeot/citroen',
-    'peverell',
-    'pewterer',
     'pf1',
-    'pf1/4',
-    'pf3',
-    'pfaffikon',
-    'pfennings',
-    'pfv1600',
-    'pg/mgw',
-    'pge2',
-    'pgex',
-    'pgex-kg',
-    'pgi',
-    'pgm',
-    'ph-sensitive',
-    'ph7.0',
-    'ph7.8',
-    'ph7.9',
     'phagemids',
-    'phalacrocorax',
-    'phalaropus',
-    'phallic-oedipal',
-    'phallus-shaped',
-    'phant',
-    'phantasmal',
-    'pharly',
-    'pharm',
-    'pharmacologic',
-    'phases.',
-    'phasianus',
-    'phasmid',
-    'phd/mphil',
-    'pheasant-like',
-    'phenacetin',
     'phenobarbitone',
-    'phenocryst',
-    'phenol/chloroform',
-    'phenology',
-    'phenomenalists',
-    'phenomenologist',
-    'phenotypical',
-    'phenylene',
-    'pheochromocytoma',
-    'pherai',
-    'phibes',
-    'phibro',
-    'phidias',
-    'philadelphia/ormandy',
-    'philanthus',
-    'philbert',
     'philodendrons',
-    'philtre',
-    'phinal',
-    'phippard',
-    'phivcg4',
-    'phivcg8.6',
-    'phlebotomists',
-    'phlebotomy',
-    'phlips',
-    'phoblacht',
-    'phocaea',
-    'phon',
-    'phone-booths',
-    'phoniest',
-    'phono-lexical',
-    'phosgenation',
     'phosphatase-conjugated',
-    'phosphoenolpyruvate',
-    'phospholipases',
-    'phosphorescently',
-    'phosphoryl',
-    'photo-albums',
-    'photo-based',
-    'photo-calls',
-    'photo-chemical',
-    'photo-ops',
-    'photo-story',
-    'photo-works',
-    'photocalls',
-    'photoelectrochemical',
-    'photoemission',
-    'photojournalist',
     'photojournalists',
-    'photomatic',
-    'photomicrographic',
-    'photoreceptor',
-    'photorecovery',
-    'photorefractive',
-    'php',
-    'phrasebook',
-    'phrasings',
-    'phs',
-    'phthisis',
-    'phycoerythrin',
-    'phyletic',
-    'phylloxera-resistant',
-    'phylon',
-    'physicalistic',
     'physiography',
-    'physiologic',
-    'physiotheraphy',
-    'phytochemical',
-    'phytogeographical',
-    'phytologist',
-    'pi&mdash;view&mdash;dc&mdash;assessment',
-    'pi&ntilde;ata',
-    'pi&ntilde;eres',
-    'piachaud',
-    'piata',
-    'pibroch',
-    'picasse',
-    'picena',
-    'piceno',
-    'pick-',
     'pick-axes',
-    'pick-pockets',
-    'pick-under-unix',
-    'picked-up',
-    'pickney',
-    'picos',
-    'picosso',
-    'picquets',
-    'picrotoxin',
-    'pictographic',
-    'picture-box',
-    'picture-strip',
-    'picture:martin',
-    'pictures/erika',
-    'pidginisation',
-    'piecer',
     'pied-billed',
-    'piering',
-    'pierotti',
-    'pierre-amanieu',
-    'pieterse',
-    'piezolith',
-    'pig-in-the-middle',
-    'pig-like',
-    'pig-sty',
-    'pig-swill',
-    'piggy-banks',
-    'pigi',
-    'piglike',
-    'pigling',
-    'pigmies',
-    'pigstye',
     'pilafi',
-    'pilbara',
-    'pilferer',
-    'pill-popping',
-    'pillans',
-    'pillar-boxes',
-    'pillarbox',
-    'pilleth',
-    'pilleus',
-    'pillocks',
-    'pillow-case',
-    'pillow-cases',
-    'pillow.',
-    'pimkin',
-    'pin-compatible',
-    'pin-headed',
     'pin-sharp',
-    'pinballs',
-    'pincenez',
-    'pinchas',
-    'pinchers',
-    'pinderfield',
-    'pine-cones',
-    'pine-scented',
-    'pinhoe',
-    'pinholes',
-    'pink-coloured',
-    'pink-tinged',
-    'pink-tongued',
-    'pinkish-grey',
-    'pinnata',
-    'pinneys',
     'pinnington',
-    'pinocheques',
-    'pip&eacute;rade',
-    'pipe-work',
-    'piperita',
-    'piques',
-    'pirinski',
-    'piros',
-    'pirton',
-    'piscoscophy',
-    'pisistratids',
-    'pissed-up',
-    'pistol-like',
-    'pistol-shaped',
-    'pistoned',
-    'pistyll',
     'pit-falls',
-    'pit-pony',
-    'pit-shafts',
-    'pitblado',
-    'pitch-covers',
-    'pitchforth',
-    'pitchley',
-    'pitelka',
-    'pitsaw',
-    'pituitaries',
-    'pizano',
-    'pizey',
-    'pizza-faced',
-    'pizzaro',
-    'pl.34',
-    'pl480',
     'place-specific',
-    'placei',
-    'placeless',
-    'placepot',
-    'placerville',
-    'placito',
-    'placket',
-    'placoderm',
-    'plagiarisms',
-    'plain-spoken',
-    'plain-weave',
-    'plaiters',
-    'plake',
-    'plane-load',
-    'planetesimals',
-    'plangency',
     'planina',
-    'planless',
-    'plannable',
-    'plant-derived',
-    'plant-filled',
-    'plantable',
-    'plantation-style',
-    'planthouses',
-    'plas-y-dre',
-    'plaskitt',
-    'plasmic',
-    'plasmodia',
-    'plasmolysis',
-    'plasson',
-    'plastic-topped',
-    'plastically',
     'plastique',
-    'plastiskin',
-    'plastrons',
-    'plasty',
-    'plate-tectonic',
-    'platelocks',
-    'plateresque',
-    'platform-independent',
-    'platformer',
-    'platinum-cobalt',
-    'platinums',
-    'platyrhynchos',
-    'plausibilities',
-    'play-caller',
-    'play-ground',
-    'play-writing',
     'playbill',
-    'playbooks',
-    'player-of-the-year',
-    'player/coach',
-    'players&mdash;lasky',
-    'playlets',
-    'playrooms',
-    'playschemes',
-    'playspace',
-    'playworkers',
-    'pleasants',
-    'pleasurableness',
-    'pleavin',
-    'plebescite',
-    'plenteously',
-    'plessington',
     'plethoric',
-    'pletnev',
-    'pleumeur-bodou',
-    'plimpton',
-    'plio-pleistocene',
-    'pll',
-    'plongeur',
-    'plott',
-    'plotted_as',
-    'plough-witches',
-    'ploughlands',
-    'plover-like',
-    'plug-and-play',
-    'plum-pudding',
-    'pluralisation',
-    'plushly',
     'plusses',
-    'plutocratic',
-    'pm(79)3',
-    'pmb',
-    'pmc5edcm',
-    'pmey4.3',
-    'pmld',
-    'pmrc',
-    'pnd',
-    'pneumonias',
-    'pneumonitis',
-    'pngwim',
-    'po&egrave;te',
-    'poat',
-    'pobres',
-    'pocaterra',
     'pochvennost',
-    'poderosos',
-    'podhajsky',
-    'podiatry',
-    'podolian',
-    'podolsky',
-    'podshivalov',
-    'podsnaps',
-    'podsolisation',
-    'poecilia',
-    'poerwowidagdo',
-    'poesie',
-    'poet-critics',
-    'poet/painter',
-    'poggenpohl',
-    'poggio',
     'pogon',
-    'poh',
-    'poho&rcaron;elec',
-    'pohutukawa',
-    'poikilotopic',
-    'poilu',
-    'point-counting',
-    'point-like',
-    'pointedness',
-    'pointings',
-    'poison-arrow',
-    'poison-tipped',
-    'poison-tongued',
-    'poisoner/king',
-    'pokorn&yacute',
-    'polakoff',
     'polapan',
-    'pole-axes',
-    'poleis',
-    'polias',
-    'police-public',
-    'police-run',
-    'police/community',
-    'policeman-like',
-    'policework',
-    'polignac',
-    'polina',
-    'polish-jewish',
-    'polish-owned',
-    'polish-soviet',
-    'polit.',
-    'political-cultural',
     'politically-oriented',
-    'politico-literary',
-    'politik',
-    'politz',
-    'poljica',
-    'polka-dotted',
-    'poll-rigging',
-    'pollaiuolo',
-    'pollard/thames',
-    'pollen-bearing',
-    'pollinia',
-    'pollitzers',
-    'pollokshields',
-    'polluter-pays',
-    'pollution.',
-    'poltroons',
     'poly-a',
-    'poly-unsaturated',
-    'polyacrylate',
-    'polyadenylated',
-    'polyarchy',
-    'polyblocks',
-    'polybox',
-    'polycystic',
-    'polyester-based',
-    'polyester/',
-    'polygamists',
-    'polygen',
-    'polyhema',
-    'polyhymnia',
-    'polyisoprene',
-    'polymethyl',
     'polymorph',
-    'polymorphously',
-    'polymyxin',
-    'polynuclear',
-    'polynucleotides',
-    'polyploid',
-    'polysulphide',
-    'polytechnical',
-    'polythene-covered',
-    'polyvinylpyrrolidone',
-    'pomades',
-    'pomelos',
-    'pomeranz',
-    'pompeiian',
-    'pomum',
-    'ponca',
     'poncet',
-    'pondful',
-    'pondsfield',
-    'ponens',
-    'poniard',
-    'pontian',
-    'pontians',
-    'pontica',
-    'ponticus',
-    'pontiffs',
-    'pontllanfraith',
-    'pony-tails',
-    'poo-scared',
-    'poofters',
-    'pooler',
-    'pooles',
     'poor-man',
-    'poorer-quality',
-    'pop-holes',
-    'pop-star',
-    'pop/rock',
-    'popgun',
-    'poppets',
-    'poppyfield',
-    'popster',
-    'popularizers',
-    'por-gilli',
-    'porbably',
-    'pore&cacute',
-    'porkadder',
-    'porodomal',
-    'porolithon',
     'porphyrins',
-    'porphyritic',
-    'porridge-like',
-    'portacaval',
-    'portalet',
-    'portamento',
-    'portamentos',
-    'portaskaig',
-    'portel',
-    'portends',
-    'portgual',
-    'porthford',
-    'portishead',
-    'portmahomack',
-    'portmann',
-    'portmore',
     'portoghesi',
-    'portreath',
-    'portvale',
-    'portwich/von',
-    'portwood',
-    'posad',
-    'posible',
-    'posidonian',
-    'posillipo',
-    'position(s)',
-    'position-dependent',
-    'positionally',
-    'positionings',
-    'positiv',
-    'positive-images',
-    'positive/negative',
     'posix.4',
-    'poskitt',
-    'possiblity',
-    'post-1960s',
-    'post-1974',
-    'post-captain',
-    'post-chaises',
-    'post-coal',
-    'post-coitum',
-    'post-constantinian',
-    'post-elementary',
-    'post-employment',
-    'post-enlightenment',
-    'post-gig',
-    'post-heysel',
-    'post-historical',
     'post-infarct',
-    'post-innovation',
-    'post-munich',
-    'post-new',
-    'post-occupation',
-    'post-petition',
-    'post-resurrection',
-    'post-saussurean',
-    'post-sixteen',
-    'post-sputnik',
-    'post-tectonic',
-    'post-tests',
-    'post-tetanic',
-    'post-thatcherism',
-    'post-therapeutic',
-    'post-translationally',
     'post-velar',
-    'post-victorian',
-    'post-void',
-    'postauratic',
-    'postdates',
-    'posten',
-    'postgastroscopy',
-    'postgatei',
-    'postglacial',
-    'postgraduate/post-experience',
-    'postholders',
-    'posthole',
-    'postion',
-    'postlude',
-    'postnatally',
-    'postneonatal',
     'postscript-compatible',
-    'postsport',
-    'postumius',
-    'poszgay',
-    'pot-painters',
-    'pot-plants',
-    'potassium-rich',
-    'potbelly',
-    'potboiler',
-    'potch',
-    'potentially-lethal',
-    'potholer',
-    'potholers',
-    'pothouse',
-    'poti',
-    'potpourris',
     'potsworth',
-    'potten',
-    'pottoks',
-    'potts/head',
-    'pouching',
-    'poulette',
-    'poulsen',
-    'poulton-le-fylde',
-    'pouter',
-    'pow\'r',
-    'powder-coated',
-    'powderham',
-    'powderkeg',
-    'powderless',
-    'powell&mdash;pressburger\'s',
-    'powell-cotton',
     'powell/high',
-    'powell/rspca',
-    'power-coercive',
-    'power-holders',
-    'power-houses',
-    'power-lines',
-    'power-steering',
-    'power/',
-    'power/gloucestershire',
-    'power/oxford',
-    'poweranimator',
-    'powerdrive',
-    'powerexec',
-    'powerpop',
-    'powerwise',
-    'powles',
     'poxvirus',
-    'poynting-robertson',
-    'poyntzpass',
-    'poznam',
-    'pp-3',
-    'pp.1',
-    'pp.44',
-    'ppd-ta',
-    'ppg1',
-    'pprc5',
-    'pr80',
-    'prabhu',
-    'prachuab',
-    'practice\'',
-    'practico-inert',
-    'praemium',
     'praepostor',
-    'praestans',
-    'pragmademic',
-    'pragmaticist',
-    'praise-tongue',
-    'prancer',
-    'pras&amacr;d',
-    'pratfall',
-    'prattlers',
-    'prattley',
-    'prawer',
-    'prayer-books',
-    'prayerbooks',
-    'pre-1625',
-    'pre-1985',
-    'pre-adaptations',
     'pre-alps',
-    'pre-and',
-    'pre-april',
-    'pre-assembled',
-    'pre-ban',
-    'pre-big',
-    'pre-bourgeois',
-    'pre-carboniferous',
-    'pre-collision',
-    'pre-conceptions',
-    'pre-conscious',
-    'pre-consonantal',
-    'pre-coordinate',
-    'pre-designated',
-    'pre-done',
-    'pre-enquiry',
     'pre-equilibrated',
-    'pre-factory',
-    'pre-fixed',
-    'pre-games',
-    'pre-gorbachev',
-    'pre-june',
-    'pre-logical',
-    'pre-modernist',
-    'pre-nuptial',
-    'pre-orogenic',
-    'pre-payments',
-    'pre-phylloxera',
-    'pre-positioned',
-    'pre-processed',
-    'pre-pubescents',
-    'pre-sales',
     'pre-sell',
-    'pre-sensitised',
-    'pre-shift',
-    'pre-siberian',
-    'pre-soaked',
-    'pre-social',
-    'pre-stated',
-    'pre-statutory',
-    'pre-symbolic',
-    'pre-take',
-    'pre-trnas',
-    'pre-warned',
-    'pre-women',
-    'preamp/processor',
-    'precampaign',
-    'precaria',
     'precativa',
-    'precatively',
-    'precedency',
-    'prechallenge',
-    'preciado',
-    'precinctual',
-    'preciosity',
-    'precipitancy',
-    'preclassic/early',
-    'precognitions',
-    'precolectomy',
-    'predatorial',
-    'predestinarians',
-    'prediabetic',
-    'predicable',
-    'predications',
     'preferability',
-    'preferments',
-    'prefs',
-    'preheadfold',
-    'prehispanic',
-    'preimplantation',
-    'prein',
-    'prej',
-    'prejudgment',
-    'premachandra',
-    'premarin',
-    'premaxillae',
-    'premenstrually',
-    'premiated',
-    'prendre',
-    'prentices',
     'prenzlau',
-    'prepaying',
-    'prepossession',
-    'preprotachykinin',
-    'prepubertal',
-    'prescriptively',
-    'prescriptiveness',
-    'prescriptivists',
-    'presence/absence',
-    'presentation.',
-    'presentist',
-    'presidio',
-    'presidiums',
-    'presque',
-    'press-on',
-    'presshouses',
     'pressies',
-    'pressingly',
-    'presslie',
-    'pressplan',
-    'prestidigitation',
-    'presumptuousness',
-    'pretibial',
-    'pretorius',
-    'pretranslational',
-    'prettied',
-    'pretties',
-    'pretzel',
-    'preu&szlig;ischer',
-    'prev.',
-    'preventers',
-    'previewers',
     'prfrd',
-    'price-based',
-    'price-output',
-    'price-range',
-    'price-tags',
-    'price-taker',
-    'price-takers',
-    'price-taking',
-    'price/yield',
-    'pricewell\'s',
-    'prickliness',
-    'priday',
-    'prideful',
-    'priding',
-    'priest-like',
-    'primary-coloured',
     'primaticcio',
-    'prime-2',
-    'primordially',
-    'prince-bishops',
-    'princedom',
-    'principalis',
-    'principals/directors',
-    'priscillianist',
-    'prison-made',
-    'prison/oxfordshire',
-    'prisoner-of-conscience',
-    'prisoners-of-conscience',
-    'prittwitz',
-    'privacies',
-    'privately-financed',
-    'privatism',
     'priyayi',
-    'prize-fights',
-    'prize-givings',
-    'prizemen',
-    'prntr.cli',
-    'pro-cpsu',
-    'pro-egyptian',
-    'pro-establishment',
-    'pro-europe',
-    'pro-europeanism',
-    'pro-federation',
-    'pro-go',
-    'pro-jordanian',
-    'pro-market',
-    'pro-mprp',
-    'pro-pakistani',
     'pro-people',
-    'pro-performance',
-    'pro-rafsanjani',
-    'pro-serb',
-    'pro-slave',
-    'pro-turkish',
-    'pro-walesa',
-    'proactivity',
-    'proairetic',
-    'proarrhythmic',
-    'probates',
-    'probl&egrave;me',
-    'problem-focused',
-    'problem/suggestion',
-    'problematisation',
-    'problematising',
     'proc&oacute;pio',
-    'procaryotic',
-    'procedings',
-    'proceedure',
-    'proceedures',
-    'process-type',
-    'prochazka',
-    'procon-ten',
-    'procopius',
-    'proctosigmoiditis',
-    'procuration',
-    'proddie',
-    'prodi',
-    'produc',
-    'producer/director',
-    'product/benefit',
     'production-derived',
-    'productiveness',
-    'professional-quality',
-    'professional/managerial',
-    'profex',
-    'profit-generating',
-    'profit-maximize',
-    'profit-motive',
-    'profit/loss',
-    'profuseness',
-    'progastricsin',
-    'proggie',
-    'prognathous',
-    'progr',
-    'program(s)',
-    'program-accessible',
     'progress/400',
-    'progressional',
-    'prohibitionists',
-    'prohibitory',
-    'proietti',
-    'proinsias',
-    'proje',
-    'project/dissertation',
-    'prokina',
-    'prokopchuk',
-    'proleptic',
-    'prominents',
-    'promised.',
-    'promoter/enhancer',
-    'pronominalization',
-    'pronounced.',
     'pronouncedly',
-    'pronuclei',
-    'pronunciamientos',
-    'proofer',
-    'propane/butane',
-    'propanol',
-    'propellors',
-    'property-holding',
-    'prophetical',
-    'proportioner',
-    'proportioners',
-    'propper',
-    'proprietorships',
-    'propyl',
-    'propylaia',
-    'propylon',
     'proscriptive',
-    'prosimians',
-    'prosodists',
-    'prosopopoeia',
-    'prospection',
-    'prosperities',
-    'prosthetists',
-    'prostrations',
-    'protdist',
-    'proteg&eacute;e',
-    'proteg&eacute;s',
-    'protein(s)',
-    'protein-making',
-    'protein/h',
-    'protestantization',
-    'protistan',
     'proto-industrial',
-    'proto-scientific',
-    'protocol/internet',
-    'protorankers',
-    'prototyped',
-    'protraction',
-    'prouv&eacute',
-    'provenal',
-    'proxima',
-    'proximal-distal',
-    'proxmire',
-    'proxy/postal',
-    'prpc',
-    'prs-licensed',
-    'prtsc',
-    'pruning-hooks',
     'prussian-blue',
-    'prussik',
-    'prw',
-    'prys',
-    'prytaneis',
-    'ps&mdash;socialist',
-    'ps/1s',
-    'ps/55',
-    'ps/valuepoint',
-    'psaila',
-    'psap',
-    'psarias',
-    'pseudo-classical',
-    'pseudo-homophones',
-    'pseudo-individualization',
-    'pseudo-individualized',
     'pseudo-metric',
-    'pseudo-philosophical',
-    'pseudo-questions',
-    'pseudo-religion',
-    'pseudo-romanesque',
-    'pseudo-sciences',
-    'pseudogenes',
-    'pseudolymphomas',
-    'pseudoplatanus',
-    'pseudopyloric',
-    'pseudotachylite',
-    'pseudotropheus',
-    'psittacosis',
-    'psp64',
-    'pspl1',
-    'psr1957+20',
     'psycannon',
-    'psycho-anthropology',
-    'psycho-cultural',
-    'psychocandy',
-    'psychopathia',
-    'psychopathological',
-    'psychosemantic',
-    'psychotically',
-    'psychs',
-    'psycurium',
-    'pt&lcub;110&rcub',
-    'pt1500',
-    'pt2',
-    'pteridine',
-    'ptions',
-    'ptolemic',
     'ptos',
-    'ptr&num;fnum',
-    'pts15',
-    'ptx/clusters',
-    'pub-crawl',
-    'pub-goers',
-    'public-affairs',
-    'public-law',
-    'publications.',
-    'publicises',
-    'publicly-available',
-    'publicly-financed',
-    'publicus',
-    'pugilists',
-    'puis',
-    'pukea',
     'pukwana',
-    'pull-apart',
-    'pull-off',
-    'pull-out-and-keep',
-    'pull-over',
-    'pullar',
-    'pulo',
-    'pulps',
-    'pultrusion',
-    'pumiceous',
-    'pump-fed',
-    'pump/powerhead',
-    'punctilios',
-    'punctuationist',
-    'punctum',
-    'pund',
     'punditry',
-    'puniness',
-    'punishment.',
-    'punjab-based',
-    'punnets',
-    'puntsagiyn',
-    'puppet-masters',
-    'purchase.',
-    'purees',
-    'purfleet',
-    'purgatives',
-    'purge-tasks',
-    'purifications',
-    'purina',
-    'puritanically',
-    'purity-on-tap',
     'puromycin-resistant',
-    'purple-flowered',
-    'purposelessly',
-    'purposing',
-    'purrer',
-    'purse-lipped',
-    'purse-seiners',
-    'pursey',
-    'purtzer',
-    'push-buttons',
-    'push-rods',
-    'pushov',
-    'pushtun',
-    'pusu',
-    'putna',
-    'putsches',
     'putsham',
-    'putterill',
-    'puture',
-    'puxley',
-    'puy-st-front',
-    'pvc-coated',
-    'pvcu',
-    'pves',
-    'pvp',
-    'pvsj',
-    'px/swap',
-    'pyamas',
-    'pyglings',
-    'pygmaeus',
-    'pynz22',
-    'pynzenyk',
     'pyogenic',
-    'pyramint',
-    'pyrethrums',
-    'pyroxenites',
-    'pyrrhotite',
-    'pyrton',
-    'pyruvic',
-    'python-hunters',
-    'pz092',
-    'q-quit',
-    'q-sport',
-    'q.p.',
-    'q.r.c.',
-    'q11',
-    'q14',
-    'q15',
     'q16',
-    'q1693',
-    'qais',
-    'qatimoutperiod',
-    'qb8',
-    'qe1',
-    'qeii',
-    'qh4',
-    'qh5',
-    'qm&amp;sup-3',
-    'qods',
-    'qq',
-    'qrih',
-    'qu&eacute;b&eacute;cois',
-    'qu&eacute;rcia',
-    'qu\'elle',
     'qu\'est',
-    'quad-line',
-    'quadrant-shaped',
-    'quadrispinulatum',
-    'quadrivium',
-    'quadrupedalism',
-    'quadruples',
-    'quaeso',
-    'quaglio',
-    'quaid-e-azam',
-    'quaife',
-    'quais',
-    'qualitites',
-    'quality-conscious',
-    'quandry',
-    'quantifiably',
     'quantity-constrained',
-    'quantoxhead',
-    'quarantines',
-    'quarshigah',
-    'quarter-round',
-    'quartermaster-general',
-    'quarto-sized',
-    'quarton',
-    'quartz-halogen',
-    'quartzose',
-    'quasi-biennial',
-    'quasi-biological',
-    'quasi-contractual',
-    'quasi-evolutionary',
-    'quasi-family',
-    'quasi-federal',
     'quasi-legislative',
-    'quasi-loans',
-    'quasi-marital',
-    'quasi-marxist',
-    'quasi-monastic',
-    'quasi-monopoly',
-    'quasi-national',
-    'quasi-parlando',
-    'quasi-random',
-    'quasi-state',
-    'quasi-symbolic',
-    'quasi-syntactic',
-    'quay-side',
-    'queasier',
-    'quebecker',
-    'queen-empress',
     'queenes',
-    'queenly',
-    'queensboro',
-    'queenship',
-    'queerer',
-    'quelque',
-    'quenchers',
-    'quennell',
-    'question-marks',
-    'queuers',
-    'quey',
-    'queynte',
-    'quibbled',
-    'quick-change',
-    'quick-setting',
-    'quick-start',
     'quick-to-prepare',
-    'quickish',
-    'quicksnap',
-    'quincentennial',
-    'quincunx',
-    'quinoa',
-    'quintals',
-    'quintins',
-    'quirkiest',
-    'quiros',
-    'quittance',
-    'quiverings',
-    'quizmasters',
-    'quos',
-    'qutab',
-    'qxe6',
     'r&amp;dd',
-    'r&amp;z',
-    'r&dollar',
-    'r&eacute;formateur',
-    'r&eacute;unies',
-    'r&eacute;volutionnaire',
-    'r&ecirc;ve',
-    'r&oslash;st',
-    'r&ouml;le',
-    'r\'member',
-    'r(58)=0.32',
-    'r-s-p-c-a',
-    'r.a.a.f.',
-    'r.c.i.a.',
-    'r.d.s.',
-    'r.e.',
     'r.h.s.',
-    'r.m.s',
-    'r/000/23/1142',
-    'r/000/23/1220',
-    'r/d',
-    'r/r',
-    'r11(2)',
-    'r11(3)',
-    'r12(1)',
-    'r14',
-    'r190(sd)',
-    'r1a',
-    'r23(1)',
-    'r4.23(1)',
-    'r40',
-    'r4000smp',
     'r46dfiod',
-    'r5868\'s',
-    'r59',
-    'r645/56',
-    'r645/57',
-    'r645/58',
-    'r645/60',
-    'r645/61',
-    'r7(2)',
-    'r8(1)',
-    'r8(3)',
-    'r961',
-    'r=0.45',
-    'r=0.60',
-    'r=0.77',
-    'r=0.81',
     'raba&ccedil;al',
-    'rabaq',
-    'rabbit-proof',
-    'rabbit-warren',
-    'rabbitting',
-    'rabbity',
-    'rabinowitz',
-    'raccoons',
-    'race-meetings',
-    'race-related',
-    'racey',
-    'racily',
-    'rackages',
-    'rackmil',
-    'raclette',
-    'radetzky',
     'radian&lowbar;angle',
-    'radicalise',
-    'radio-collared',
-    'radio-nuclides',
-    'radio-station',
-    'radio/stereo',
-    'radioactivities',
-    'radiobiology',
-    'radiodiffusion-television',
-    'radiolarians',
-    'radiophysics',
-    'radiotherapists',
-    'radley/oxfordshire',
-    'radon-rich',
-    'radstadt',
-    'radyr',
     'raeder',
-    'raeisi',
-    'raffertys',
-    'raffishness',
-    'raffling',
-    'rafidah',
-    'raggie',
-    'raghip',
-    'ragin',
-    'ragne',
-    'rago&ucirc;t',
-    'rail-mounted',
-    'railbus',
-    'railbuses',
-    'railed-off',
-    'railmen',
     'rain-swollen',
-    'rain-wet',
-    'rainbow-tie',
-    'rainer-thomas',
-    'rainsuits',
-    'raisey',
-    'raitz',
-    'rajaobelina',
-    'rajk',
-    'rakers',
-    'rakha',
-    'raksha',
-    'rallentando',
-    'rallings',
-    'ram-',
-    'ram-air',
     'ram.',
-    'ramadier',
-    'ramahatra',
-    'ramblas',
-    'ramkhamhaeng',
-    'rammer',
-    'ramond',
-    'ramsgill',
-    'ramsin',
-    'randfontein',
-    'randiest',
-    'randiness',
-    'random-walk',
-    'randomly-generated',
-    'rane',
-    'ranford',
     'range-doppler',
-    'range-rover',
-    'rangeland',
-    'rangerdisk3',
-    'ranil',
-    'ranney',
-    'rannie',
-    'ransome-wallis',
-    'rapscallion',
-    'rarely-seen',
-    'rarin\'',
-    'rasay',
-    'rasheed',
-    'raskelf',
-    'rasnake',
-    'rasp-like',
     'raspberrying',
-    'raspers',
-    'raspingly',
-    'rasser',
-    'rastokhez',
-    'rastrellamento',
-    'rate-financed',
-    'rate-of-climb',
-    'rateau',
-    'ratheby',
-    'rathmines',
-    'ratiocinative',
-    'rationalizers',
-    'ratnapura',
-    'rato',
-    'ratten',
     'rattlesden',
-    'rattlings',
-    'raumann',
-    'raunchiness',
-    'ravagers',
-    'rave-up',
-    'raveningham',
-    'ravennate',
-    'ravenshead',
-    'ravning',
-    'rawboned',
-    'rawdan',
-    'raydale',
-    'raym.',
-    'raymond-berengar',
-    'raymont',
     'rayonnance',
-    'razorfish',
-    'rbg&mdash;1',
-    'rbm',
-    'rbp',
-    'rc-coupled',
-    'rcpr',
-    'rdbi.log',
-    'rdun',
-    'rdw',
-    're-acquaint',
-    're-affirmation',
-    're-aligning',
-    're-analyse',
-    're-analysing',
-    're-appointing',
     're-assembling',
-    're-broadcast',
-    're-channelled',
-    're-climbed',
-    're-coalification',
-    're-coated',
-    're-compas',
-    're-connect',
-    're-creative',
-    're-dedication',
-    're-deployment',
-    're-derivation',
-    're-dialled',
-    're-did',
-    're-direction',
-    're-discovering',
     're-echoing',
-    're-emphasis',
-    're-emphasising',
-    're-engine',
-    're-expression',
-    're-fill',
-    're-format',
-    're-granted',
-    're-hear',
-    're-industrialization',
-    're-injection',
-    're-input',
-    're-inspection',
-    're-insurance',
-    're-integrated',
-    're-investigate',
     're-ionization',
-    're-launching',
-    're-litigate',
-    're-lives',
-    're-locating',
-    're-looking',
-    're-mix',
-    're-nationalisation',
-    're-occupation',
-    're-occupy',
-    're-occur',
-    're-offended',
-    're-organizing',
-    're-os',
-    're-painting',
-    're-planted',
     're-poll',
-    're-ran',
-    're-regulate',
-    're-rehearsing',
-    're-schedule',
-    're-sealable',
-    're-secure',
-    're-secured',
-    're-sits',
-    're-taking',
-    're-tells',
-    're-tender',
-    're-tied',
-    're-trained',
-    're-tune',
-    're-unions',
     're-unite',
-    're-writable',
-    're-writes',
-    're/os',
-    're1',
-    're6',
-    're:at',
-    'reabsorb',
-    'reachings',
-    'reacquaint',
-    'reader/viewer',
-    'readers/listeners',
-    'reading-rooms',
-    'reading-wise',
-    'reading/writing',
-    'readme.doc',
     'readmittance',
-    'readoption',
-    'ready-fitted',
-    'ready-pasted',
-    'ready-rubbed',
-    'readymades',
-    'reagan-era',
-    'reaggregation',
-    'real-live',
-    'realia',
-    'realistic-looking',
-    'reality.',
-    'reamsbottom',
-    'reanimation',
-    'reap-hook',
-    'reapplication',
     'reappointing',
-    'reapportionment',
-    'rear-mounted',
-    'rear-wheel',
-    'rearers',
-    'rearguards',
-    'rearick',
-    'rearrest',
-    'reasoners',
-    'reavell',
-    'rebirther',
-    'rebo',
-    'rebuildings',
-    'recabarren',
-    'recapitalisations',
-    'recapped',
     'recce.',
-    'reccommend',
-    'receiv',
-    'recension',
-    'recently-elected',
-    'recently-introduced',
-    'reception/lounge',
-    'recession-strapped',
-    'recession-stricken',
-    'recessivity',
-    'reciprocities',
-    'recits',
-    'reckord',
-    'reclad',
-    'reclaimers',
-    'reclasped',
     'reclassifications',
-    'recognises/does',
-    'recommission',
-    'recompas',
-    'reconception',
-    'recondition',
-    'reconfigurable',
-    'reconsiderations',
-    'recontras',
-    'reconvert',
-    'record/playback',
-    'recriminatory',
-    'recrystallisation',
-    'rectorial',
-    'rectosigmoidal',
-    'red-and-black',
     'red-and-yellow',
-    'red-card',
-    'red-coat',
-    'red-coats',
-    'red-herring',
-    'red-herrings',
-    'red-leaved',
-    'red-lettered',
-    'red-pink',
-    'red-robed',
-    'red-rose',
-    'red-rumped',
-    'red-sensitive',
-    'red-spotted',
-    'red-wattled',
-    'red/brown',
     'reddick',
-    'reddington',
-    'redescribe',
-    'redescription',
-    'redesignation',
-    'redgrave/olympic',
-    'redingote',
-    'redirects',
-    'rediscounted',
-    'redkinia',
-    'redman/greene',
-    'redmore',
-    'redonians',
-    'redshift/distance',
-    'reduplication',
-    'reeces',
     'reed-pipe',
-    'reegan',
-    'reely',
-    'reeman',
-    'reemphasizing',
-    'reenacting',
-    'reenactment',
-    'reerected',
-    'rees-davies',
-    'reestablishment',
-    'reexamination',
-    'ref.1',
-    'ref.17',
-    'ref.34',
-    'refasten',
-    'references.',
     'refighting',
-    'refinancings',
-    'reflectography',
-    'reflexa',
-    'reflexly',
-    'refna',
-    'refold',
-    'refractile',
-    'refueller',
-    'refugee-determination',
-    'refusniks',
-    'regimentally',
-    'regional-scale',
-    'regional/occupational',
-    'regionarii',
-    'regionarius',
     'regnant',
-    'regnart',
-    'regrade',
-    'regrette',
-    'regroupment',
-    'regular-reserve',
-    'regularising',
-    'regulations.',
-    'rehabiliation',
-    'rehder',
-    'reichensteiner',
-    'reimers',
-    'reinecke',
-    'reined-in',
-    'reinfect',
-    'reinfestation',
     'reinfusion',
-    'reinga',
-    'reinjection',
-    'reinscriptions',
-    'reinsel',
-    'reinstalling',
-    'reinstitution',
-    'reinvoke',
-    'reionization',
-    'reissen',
-    'reizen',
-    'rej',
-    'rejuvenators',
-    'relationist',
-    'relativization',
-    'released.',
     'relegalization',
-    'relief.',
-    'reliever',
-    'religious-based',
-    'religiousness',
-    'relyon',
-    'rembrandthuis',
-    'rembrandtplein',
-    'remeasurement',
-    'reminiscers',
-    'remise',
-    'remises',
-    'remorsefully',
-    'remotes',
-    'remotors',
-    'renamings',
     'rene\'',
-    'renford',
-    'renfrew-paisley',
-    'rengo-no-kai',
-    'rennae',
-    'renninson',
-    'renos',
-    'rent-a-gob',
-    'rent-a-van',
-    'renta',
-    'renuka',
-    'renzan-kai',
-    'reoffended',
-    'reorganisation.',
-    'rep&ecirc;chages',
-    'repairmen',
     'reparable',
-    'repeat-flowering',
-    'repechage',
-    'replacers',
-    'representee',
-    'reprieving',
-    'reprobed',
-    'reproductives',
-    'reproofs',
-    'reptilons',
-    'republican-socialist',
-    'republishes',
-    'repugnancy',
-    'repurcussions',
-    'reputably',
-    'reputation.',
     'requiredness',
-    'requires-access-to&lsqb;module',
-    'reroof',
-    'rerunning',
-    'rescaled',
-    'research-intensive',
-    'resedimentation',
-    'resettlements',
-    'resevoir',
-    'reshapes',
-    'resid',
-    'residenza',
-    'residualization',
-    'resiliently',
-    'resistivities',
-    'resko',
     'resnick',
-    'resole',
-    'resolvers',
-    'resonable',
-    'resource-base',
-    'resource-seeking',
-    'resourceless',
-    'respecify',
-    'respect_to',
-    'responsabilit&eacute',
-    'responses.',
-    'responsibilites',
-    'respose',
-    'resposibility',
-    'resposne',
-    'ressort',
     'rest-houses',
-    'restrainer',
-    'resturant',
-    'retablo',
-    'retentiveness',
-    'retirers',
-    'retranslation',
-    'retransmission',
-    'retreatment',
-    'retrenching',
-    'retrenchments',
-    'retribalization',
-    'retrievability',
-    'retrieval-failure',
-    'retroactivity',
-    'retrolental',
     'retrospiralis',
-    'rev-counter',
-    'rev.john',
-    'revealer',
-    'revealled',
-    'reversers',
-    'reversioners',
-    'reviewability',
-    'revilement',
-    'revisable',
-    'revisional',
-    'revista',
-    'revivification',
-    'revolucionarias',
-    'revolutionary-democratic',
-    'reward/penalty',
     'rewashered',
-    'rewi',
-    'rewley',
-    'rexy',
-    'reyce',
-    'reye',
-    'reykjav&iacute;k',
-    'reynes',
-    'rezek',
-    'rezso',
-    'rf1',
-    'rg540',
-    'rggf',
-    'rgs',
-    'rh1',
-    'rh19',
     'rh4',
-    'rh6',
-    'rhabditis',
-    'rhabdom',
-    'rhabdomyosarcoma',
-    'rhamnous',
-    'rheindalen',
+)
+
+blocks_30 = (
+    '"$each#"tt#!y"*l-balanced$*humouredly$(rewarded$\'wishing#!.#%/st.g#\'chester#-egally-parked##ing&&sworth#%ness.\'\'/injury',
+    '##yas"#men!-mage/likeness%\'ability%"rs%"s.$$inal\'#ria##ndi"\'becilic#%ibers""es"%iadze#"ne#%table',
+    '"(manently#,ediate-early(#ism#\'obilism$&ralist%\'talises#!s#*unizations%+odepression&%genic&%logic&(magnetic\')odulation-#ory(+rphological',
+    '&+stimulatory\'+uppressants(%rgery&,turbidimetry$%tably"(partible$)ssibility#(eratival%*fectionist%"ia%\'viously#&iously#*lacability$(emented.$%uvium',
+    '$$rts/&#une(%ities$#sts#+regnability%*scriptible&%sment$*ove/worsen&\'isatore#\'ugnable$&lsions"$r-90#!u"%tarfa!*n&eacute;s',
+    '")-dwelling#$mast$&igrant##off#%utero"$.the"!/"-_,_in_general#!a#1flagrante_delicto"$a103#(ccesible\'%sibly$(tivators#+dvertencies',
+    '#+lienability#&nition#!o#"ri$*ticulately#*ttentively#*ugurations"+carcerating%$nata(#ing#)endiarism%#ses$(stuously#)h-by-inch$"on',
+    '##isa$#ter#\'linable$%udin\'%#sus#*ombustible%)e-elastic&"s.%\'modious%,pressibility$$ntro$%rrupt)#ion##pen#.rease/decrease',
+    '#$uvat"$daal#&ecorum$"p.%(endencia*"te$+terministic-!s$&x-link#$iano$#cts$\'e/dance$(genously%"o2$#ngs',
+    '$,scrimination%)positions$#vid\',ual-oriented#$o-us$%chine#)ucibility$&lgency$)s-tsangpo%/trial-relations+(strength#$well"(ebriates(#ion#,ffectualness',
+    '#,xplicability"+fallibilist$*ntile-like$!s$$unal#\'errable#%ield/%#rno#-lation-linked$\'exional$)orescence-!s$)uenceable\'&tially#\'oldings',
+    '&!e$(tainment")goldstadt#$ushi")habitable#\'ibitive\'$or-2#*ospitality"(imically%%tably#\'shbofin%$owen#)tialising"\'juncted$\'riously',
+    '&(/illness"%k-pad#\'eroinen$(y&dollar"$lier"&n-door#!e$1rvation-dependent,+independent$%s-loo#)oculation"%oussa"+put-outputs&(specific"*s-and-outs',
+    '#-ect-resistant$(minators#1ider/ethnographer%(iousness$,ght-oriented$\'stences#$oles%&vently#(pectoral$(iration.#(tallable\'.ed/deinstalled%,ntaneousness\'\'iations$)itucional',
+    '#!u$\'lations$,rance-backed%%gence#&winger""te$&grable\'#nds\'%tion.+$ists&&ifolia&"um$&libots%.lectualization&-igent-looking',
+    '$$nser%%tion.$(r-atomic&*changeable\'\'ultural&.disciplinarity((visional&*electronic&&family&*government&+palestinian\'#ros&&regnum&,subjectively&%zonal',
+    '%%build%#car&#oms\'(nnectors(\'version+%tible%)diffusion%)electrode&)st-groups%*ferometric($tile%%genic%%ictal%*laboratory\'\'cements',
+    '%(missions\'%xture%"na&$odal%(particle&)ellations&$lane&\'ositive&$ress\'$oton%$quad%,subjectivity%&veners$&states#&iative',
+    '$*nationally#(ra-class&(european&+hemispheric&&racial&&system%)bacterial%+crystalline%*glomerular%\'jejunal,"ly%\'lobular&(uminally%%nasal&(sigently',
+    '%+operatively%(personal&&sychic%&thecal$&epidly$&iguers$"od%\'spected$"um#(ubations#"v."&uentio"*vagination$,lidenstrasse#\'erarity',
+    '#*idiousness$(gilation#,oluntariness!%odate#&ophors"%nomer#*tophoresis!#pxs!)r&pound;1)!2)"5m)#7.7#(uacute;n"\'-active",aqi-inspired',
+    '"#lib""ok#)n-bearing%(founding%&tipped$$clad$"er$$wood",reconcilably$*proachably$(sistable#&igable&#tor##upt&#ive',
+    '!(sabelita#"rn##yev"\'bisters#$lank""dx"%field#"lt"$haya##mal"\'ikveren""ka#%ender("un",lamicization',
+    '\'$wide#$eifr$"ta"%maila"&obelle#&chrons#\'elastic%(ectronic$#tes##fax#%genic#\'metries#&octane#$pata&"hy',
+    '$%renyl#$roku#.zyme-selective\'!s&%ogens".raeli-lebanese(#plo(&soviet"#sac##elf#%oudun"\'toriato!#t-a#"in##the',
+    '"%a/iba#,liano-destra%(cization"!b"\'chiness""ek#(misation&"es"(inerance"#was"!y!$urii"%stice""ta!*v&aacute;n',
+    '"\'anovich&!o""dc"*ory-inlaid"(y-leaves!#was$#aki!#x.1""ia#(batabian"\'marites"%worth!(zaguirre 3j&eacute;r&ocirc;me"-lsqb;ack&rsqb',
+    '"#200"!k!).donnelly""i."$m.w."*p.m.millar!#/35!!1!%a-ack"#bez"(carandas#"io#(k-booted$(et-baked$&hammer',
+    '#-quemart-andre"!d#%ambaa#"is""ep"$ffee%#rji")ggeresque"(h-bul-on#$afil"#ins#%rmany"(laluddin$+pe&ntilde;o&"no',
+    '\'!i$\'hariyah#%hoori#%iat-i##jar#$khed#%miest#&packed##rah#\'yangiyn"%n-ove#&eshwar$&tschek#%gpura#&senist',
+    '\'!s#\'uary-14("20)!7(%april$\'s-faced"*panisation#%enese##het"/rdini&egrave;re#(gonistic&!s#&lsberg#"mo##osh',
+    '%"au%"ll#!v"#ssy")yewardene#$ston"#zz-!%cm800!$d(s)!,ean-d\'angely%$noel%$yves$(ne-marie"#dda"#ffs',
+    '"%lbart$#ert##ena##kes#\'ly-baby&$fish%"by"#nin#,kins/dentist##net$"ys"&phthah#%pesen"%rison#%maine',
+    '#&rycans"&senska##sye#"te"%t-age$\'setters"\'wel-box#%sbury!#g54"!b!\'habvala!/i&rcaron&iacute"$abao#%nying""bs',
+    '"#mmi!"j1!"mm"%p-1\'s!"n."!f!&o-anne"*b-for-life$)placement$%sheet"$cund"#dan")ff&eacute"+hnson-smith%%tone1',
+    '"\'in/form$%tness"&kester#%iness"$llie$"op""ma"\'nathans#*es-mullins%)/nuffield&+oxfordshire&$team#%othan"%rdana&%stone',
+    '"\'se-luis$$fata$&phites#!y"&uncing#&rdelay$,nalistically##vin"(vanovich#&eworth"\'y-rides!"p."!t!"r2!"st',
+    '"!s!$uans$&torena#"ra"%balla#!b"1daeo-christianity#(ge-proof"$gful#$lans#!o#"um"$icer"*l&ndash;31#&ie-ann',
+    '%!3"%maine##mie#*ping-jacks$%suits"*n&ndash;24+!8#$/fos#%agadh$"id#*e&ndash;29+!3+$july$"-1%)september',
+    '#%kshop""r.#$gens#%idica$#nac#"ua"#sei$"pe#&t_sort$"es$/ifica&rehy;tion\'"er#)u-sheriff"!v#!e',
+    '!&yotsna ,k&aacute;sos"#ogr"3uuml;rbs-h&uuml;tte!#\'va!"-1"#iii"$mart"$nine!).184/161a"#246"#456#"91"#p.h!"/t',
+    '"!6"!8"!s!$3580!#467!(a-bom-ba""26"#are"%banos$!t#(balistic#"el#"ui"\'chamila#!i',
+    '"%esong"#fra""ga##ona%!o"$hlil#(n-freund"$iguo#$neus#$sary$)erslauten""ji"$kapo$"ta"/leidoscopically',
+    '#%lista#$myki#&opetra#&shoven"&makura$$ljit#%barov#(enogorsk#"in%#sky#"ov"*nagawa-ken#"ly#\'odereka##sal',
+    '#"yi"%poeta##sel#%ustin$$tnik"(rabiners$$chai$&fistan$&kitsos$%manid%#jit$$tegi#$enni#\'l-franz$"in',
+    '#+stification"$saye#"ei##sar$"im#\'thanaia$#uri"$taev$"hn$%ngese#"ha%!k#&tomeat#%ushev"\'upanger',
+    '"%wneer"#yes#"la#"ts"*zaskerliks!\'cal/day!%eanie#)rns-sayre"#bin##ler"\'cskemet"#dge"%egans#$nans"/hoe/northampton',
+    '#"wa")lantanese#&dholme##ich##loe#$pies#\'sterton"!m#3ble/gloucestershire"%ndell##ith##ley#&nelled&$maid##ora',
+    '$!s##zie"*oboualapha#+wn/landlord""pa#!e#!i#"te"&ramane#"by#$ises$"th#"le##nan#\'rington',
+    '$#tan#+t&eacute;sz#$zers"#sey##ter"$ting#&otifen#*ton-cremer#$urah"#une"%verne##ins"$y(s)#(-changes$$fold',
+    '%%haped#+board-based)$free#%ed-up#$name$$sian#$pads$&resses#"s.!"g1"$otsi""s.!%h-11s"#585"$alde',
+    '##med##nia#"ra$$chev#$toon"\'edivial#"ng"#oei##jas#"la#!n$"je#"ra"&ristos#*ushchevian',
+    '!\'ick-ass%$back%#out%%point%&starts$%about#!o"(dminster#"s.$#ton"#ely##wit"%ghoma"\'lbirnie#$cock',
+    '$$owen#(mastulla%#urs#%nwick#(onewtons#%worth"$miko"&ncraig#"de$*ly-looking$"om#(etically%(oplastid#&g-cups$&/queen',
+    '$)fisheries$#ley$%ships&$ouse%(teignton&%horpe&#one#)lochshiel##nie$&ockian%#ull#+shasa-gombe#$vara#"za"#ran',
+    '%\'hosbach#.illo-methodian%$ovas#%kella$$gate$\'michael#&schner##yat"#sen##hen$%inyov#"or#!r#\'s-curls%(me-quick',
+    '$!.$$ebah"\'t-e-kat#(e-fliers#\'tenhood$%ykins#"ur#$zler"%veton#$ilev"%yoshi!&joules!$lang"%ebeck##ist',
+    '##tke$!t#&wenalp"!g"&ingman")oppenberg##ska##wnz"%ucker"#yun!#m/s"!2!#naw"(ee-boots&\'reeches',
+    '$$hole#!t$\'tishall"#ids#+fe-and-fork&\'related#(ghtswood#&t/knit"\'ockdene%%er-up%)ing-shops#%thole#"ut#%wbury$!d',
+    '*)intensive"+uckle-bones!*obbekaduwa##ena$"ts#"ke"#cab#!u"+d&aacute;ly""ei#%nigia#$rber"#han##ima#"li',
+    '"$jima"&lbitar#$chak#&estral#$imba$$nsky$"pe$#sko#"ko#"lo#$onos",mmunistische#\'plektov##rat""no',
+    '#)stantinov#&tagora"\'oijmans#\'kaburra#%l-tee#$nkie$#ses##pas",pietz/friend##per"%rbeci#*ean-united$!n#&makiti%!s',
+    '"%shiro#%tchei$\'elanetz$"is$$rama"+t&ecaron;ra"%umoue#$prey#$vola"&walsky#&towing"+x31-related""ye"%zelek#!i',
+    '!+r&oacute;na#*uuml;mmell"$aals#!b#!i#%nkies#%snaya%"ik%(opevstev"+editanstalt#%idler$%shaus#%tzmer%&schmar#%velen',
+    '#$ngle#$stel%\'iansand"&oodsma##tho"#s-1$#one"#upa#%schev$+kall-wallis!%s100e"!b!"tm""pi!%ubler',
+    '&!k#$hing"#dus"$isel"#kri"$ldip#%lberg$$mann#"ta"$naev##itz##ste##tze##zel"&perman',
+    '#$tsov"#rdi%,sh-populated#!e#%hotel#%iltai"$spit#$tari""ta$!s#(n&aacute#$usov"%usamo"%znets!)wandebele',
+    '"\'ik-save"#oon!$yalo")oto-based ,l&aacute;zar#$mp;b&!h"4eacute;vi-straussian"0oacute;pez-cobos#\'uml;wen*%stein(!y"*uacute;cio#)uml;pertz!.\'&eacute;cluse',
+    '#%imais$#sne#*lpe-d\'huez#$mant#\'nguille#0pr&egrave;s-midi#*ssociation#&telier"&elisir#,nvironnement##pee#$tang$&ranger#&xpress":h&ocirc;pital-saint-blaise',
+    '#(ndustrie#%talie"%orfeo"0universit&eacute+!e!#(x)!#-na"#s-d"$test!$.a.s""f."&g.o.c."#m.s"$o.r."$t.a.',
+    '"$u.t.!"/d!#1r1!"36!+40&ndash;60"#508!$970s""80#!3#!6!!_!\'a-de-da"#/yb"!1"#301',
+    '"#age#$tsch#!x",b&egrave;que#0astide-clairence#+el-switcher$$ques#$ials$\'odental%"sa#%orers$&ur-snp\'&voting%"te#%sales',
+    '#&vision",ce-curtained$*daemonians$%maker$%wings$2y/northamptonshire%!s#&hrimae#%iniae#&onicum$"ts%"te#%rimal#,toperoxidase#&ustris',
+    '")dder-like&#ing$"io%&shness#&enburg#%ybank$#day$&killer*!s$%mount",fferty/kings)&stroud"%ganas#+enorhynchus$*r-swilling',
+    '#$ting"#had"#ila$"ee##ngs#"ra#"te$!h"#jes#%oinie"(kedaimon$%hurst$"s.""li"\'mberton',
+    '%"rd$&rettas$%shead%#kin#(entarion#!i#$mers&!t#+ont-gregory#(pholders$&roites$#son"$nata#$cake%0ster-oslo-bergen',
+    '#\'d-bound%&grants%*management%&trains$$auer$&filled$%guard$$haus%%older$*ing-ground.!s$%sberg$%wards#$egan$#way',
+    '%!r$%dales$%lands%1ois-ch&acirc;teau$$mere$%ouste$&thorpe%#ons$)uage-like)%users($less$$with#$ovoi#$rean##sen',
+    '$)ern-jawed#(uginosum"&o-thai"&pachol#(el-badge#-ham/aylesbury#$inha#&lacian##una"$quia"\'rcenies$#her#"dy#*ge-brained&&headed',
+    '%!y##ios#$ne-1#%rikin""sa#&combes#\'erballs##gun&!s#"ka##sen%#ter#(t-chance%$ever"%tcham',
+    '#&e-\'60s%$18th%&comers%(georgian%&second&&ixties$"en$(r-stuart%!.#$ifah$$nist#"st#&tanzio$-ice-patterned($site',
+    '"&udians#"er#(gh-lines%"er#+nch-control$"er##per#.renzenvorstadt"&varium#$erov#%renti$"ov"\'w-court$#men#%/fact',
+    '#"ks#5rence/gloucestershire(!s\'"ia$!y"#xly"*y-abbacies$"na#!a#(erthorpe##in\'%$g-on\'"up##nie#%women',
+    '("os%%tigue#&y-beds!#bgc!#dls!\'e-neveu""11"(achinsky#%d-off&#nly$$bank$,er/wiltshire$(ing-rein#(f-blades%$roll',
+    '#\'k-proof#%mings#(n-hipped##rne&)r-readers#*se/licence#+ther-booted(\'trimmed\'$back\'$wear"#cht#&iester#8khampton/gloucestershire#%toure$%romed',
+    '"%decky#&iakhov$%ngton##nor#\'ovskaya#$sham")e/trainer#,ch-wilkinson%#ing#+ds/bradford#"fe#%nders#(s/victim"*ft-brained%*hand-drive',
+    '"(g-before#+al-rational%#ese%)istically$!r#%break##ers%#ton#%horns#%iones$)slation**$)timations#$nica##ros#\'warmers',
+    '"$ics.#(ghninger%-ton/hibernian#,sure-related#"va"$khal"$mann#%barek#%insky#+on-coloured"&nadoon#&dakari#%ghaus##ity#%nards',
+    '$+on-weinberg##oir$!x#%sbury$#men#%worth#"ya##zie"6ominster/herefordshire#%nardi$\'e-based%#tto$"te%#ius#\'pardess',
+    '$$nsky#$omis##ton%*spicularis(%rosis"#rby#$dahl#$naea#$skys"$sath##kov#&othans#\'pinasse#&s-able%(frequent',
+    '$!e#"te%"rs#!y"&t-offs#,ter-detector\'&headed\'\'perfect\'$rack\'%sound(&trings&"/s&$form""u2#(copterin',
+    '$#tra#!r#%tnant"*v&eacute;e#-el-headedness%$/cse%(ling-off%&s/gcse$%nthal$&rburgh%$such%#ton#"ie$"tz##ski',
+    '#%isach%"on"$x-11#"ia$)cological)!y"#yne"$zama!,f-controlled""nc!%hcima!0iabilities/total#!h#!o$$wang',
+    '#%eller$,ral-democrat\'!e&$shon%%tines&\'y-print#\'r&aelig$&aries.%$tion$$egts%!s"-cence-enabled%%sable#"hd$*en-crusted',
+    '$"le$\'spittle"+ebfraumilch#&ut-col%(enancies",fe-assurance%)extension%&guards%)president%&skills$$boys$&course$&style.#\'ted-off"%ggins',
+    '&\'bearers(#ige&(fittings&&greens&(headedly&$like&%proof&$rays&%tight%%boxes%$ener%#ish%*ning-quick%&ranger%$some',
+    '%$well#&urians""ii")kableness##e_a$\'ability#$ings##ley#)ud-labour"&l-lets#+ac-coloured#&lerton$$ford$"is"*m&oacute;n',
+    '#&b-like$#erg#*e-coloured#%fjord#(itedness#\'no-fila%\'logists"$ncei#$dahl$%field$/say/strathclyde#(e-astern$$back&#ugh$%d-out',
+    '$&siders#+guisticians#&ing-up#+k&ouml;ping$#way#$leys#&olenic#%slade$$tead##tas"&onello$"ne$"om$"s.#$tard',
+    '#&olysis$&philic##pes$&incote)"t.#$read",quid-fuelled")sterhills$!o$"s."#tel$*ralization#&hesome$)ogenicity%(thamnion',
+    '#1igation-conscious*!s#!s#$t.d.$)er-ridden&%ature&#bug$\'leblack&%hales&,woods/reebok#&vinova#)zenberger"%vable#*eable-with$%board',
+    '&\'spotted%%fluke%\'ishness$&weight##ius#"ox!$jadc"\'ungmani!)l&ycirc;n"\'andarcy%)deiniolen%$egai%%inabo%%ogger$%fwrog',
+    '$&rumney"$eshy#!w"!l""oc#)yd-greame"#uis!#m10""p2"!x!#nap""hs"!w!)oadmaster#)n/current',
+    '")bachevsky#&e-like$%ctomy##ito#&kowicz##ley#%stein#$ules",cal-election&)for-local%(/central%$ity.%*ly-trained%"sh$&tions.',
+    '#\'hailort$#eil%!r$(goilhead$%nager%"er#%k-ins%#off$%board$#itt$%oford#)oregional#"ri"$ddon#$ged.',
+    '%$giyn"&egting"\'g-books$%cabin$\'derived$"it#)anberries#"ik$%n.com%!s$!t#*ologofolau#+ro&ntilde;o#%sdail"#hja',
+    '"\'iterers"&krians"%lordo"#man#&bardoi#\'ondside%$osov"0ndon&ndash;delhi&(-glasgow\'%leeds(#und\'#new\'\'tilbury&%iarum$#res',
+    '$+-continuing%(duration%\'extinct%*suppressed%\'termism$!a%%cting$#cot$.er-established%.st-established(\'playing$$hair&#nds$\'iflorum%#nes',
+    '$&liners%!y$-man/lancaster$$town$"we$(yearbyen""og#&ker-on&!s\'#-on#!r#,sely-coupled(\'defined$#ley##ter',
+    '"(rdliness#$eans#&gnette#$ises".ss-on-ignition""te#\'hlorien"\'udwater#\'eckhote#%ghins%$lins#(is-based&(le-grand#2nge/dining/kitchen#(se-borne',
+    '"\'ve-play&%oetry$$dale%$olls$!l%#uck#\'ingbird"(w-browed%#ulk$(caloried%&urrent$$flow$"mg$(security%$kill',
+    '&\'crustal&&margin&\'powered&,than-average##ick#%light##nes#%thers"$xley""yn##ton!#p12"*s-specific""t1$$.dos',
+    '!&ranian"!d""ps!-s&dollar;disk"$0001"#326"!9"!b"#pan""sp!&t-col."%.-cdr"$/cdr"+d-compliant#".v',
+    '#!h"&p-like"#tle!%ubert$!s#\'ricator"%ccini#$ency#$iana&"ne#%kwell#%ullan#%yless"-dwig-institut$$orth',
+    '"\'gardian##ton"+hnenschloss"&ibeilt".k&aacute;csian"%llian"#mad#&bermen#%iance$(niferous"#nas#%dholt$"on#\'i-solar##zer',
+    '"%pulus"(rgashall#\'igancho""sa#\'kentyre#$tier$#ley"\'tkowski"*vsangombyn".xembourg-ville*#ers!#vta!"wd"!i!%x-400',
+    '"!s"#xii%!i#"xi!$ybia"+c&eacute;es##ium"#dan#$ford#3ney/gloucestershire#"os"*mphangitis&,tic-vascular%,o-epithelial&)reticular',
+    '#&chings%$mere%$pins#$dale$(on-james#$gdoh$"en"$onel"%ppard"%rabus"#s22##430#"69#%ergic#"ke',
+    ' 6m&aacute;eld&uacute;in)+ty&aacute;s)$ximo#.circ;ch&eacute)&onnais($itre#$mp;b&!d"3eacute;rim&eacute;e"&middot")oacute;rr"4uuml;nchengr&auml;tz(#der!%\'sieu!#(n)',
+    '!#-40""ps"%video!".3"$a.k.$$s.h."$b.c.$"e."!e"#i.9""l.$"a.$"r."*polymorpha!&/a-com',
+    '"!l#$itre"!n"!r""sv!%1-vac""03!"28!"33"!7"!8!"47"!8!#621"!7',
+    '"!9!"81"!7!%a-qui"#adi#\'pics/db#)tschappij",c-to-powerpc##aca$#doo$%rthys$$ukin%$thor#%beths#\'cabeans',
+    '%$llum$\'hiaioli$#ool#&dougal#\'eachern$$llum#&faddin$%erlan$&hloinn#\'gregors##han%#ult$$erey%+te-wielding$)icolation',
+    '\'$ries%#sta$\'onachie##iej#$kays$"em%!n%$rels&#ron%,son-sandbach#&lellan##omb#%peake$\'hearson&%rsons',
+    '%#oid#*rae/walker$(o-cannon\'&ontrol&)political&,sociological\'&ystems%"be%\'cephala&%osmic%)evolution%$lide%&porous%(scopical%#tek',
+    '#*ulopapular(#thy#&vector$$icar#%world"$dang#$ders$&ington$$rell#&e-from%$wine$\'irenses$#lon%#ung$"ra',
+    '$!y##hav##ine##ogs$#nia%(na/whore$$ugou#&rigale#"un"\'e-britt##cha$%ianus#)st&agrave%"ri#!x',
+    '#\'allanes#*dalensberg##ers#$goty$!y#"id$(stracies#$leby#"ne%)sium-rich%(tisation&\'o-optic\'(telluric$(ificient$0um/mayall/nelson',
+    '#%ruder#$tape#"we"%hamad$"ut#%djuri#\'oganies\'*y-coloured""ib#)d-servant,!s$$well#&l-bags%\'enabled$$lard',
+    '#(ntained.&#nce#&tlands$0re_d\'h&ocirc;tel#*zi&euml;re"$jali#$elis$#sta&#yes#\'or-ball%&/minor%"ly"%kers.$!t##hno',
+    '#"ki#%ololo"%lamud$#nje$%rious$#tie%"ya#%doror$#wyn#"e/$"as$#dor$\'ficarum\'#ent$#rei',
+    '%&herbes%#ian$#uda$$vski#(feasance#$ibou$&gnants&#ity$#kov$#mba$#nga&"er("er$"se#"ka',
+    '#\'t-house##uje#%vezzi"\'ma-sans##ete#%hilad#&maries"*n&eacute;s#!-$\'induced$$land$$size$%years#&abozho$!g',
+    '#"co#%dorla$#red#$eaba$#lli$#tta#$fast$"ul##gal$%erton%%touts#.ic-depressives$#hot#%jusri#!k',
+    '#&nekins%%rists%!s&)man-tally$#ini$#yng#*oeuverings%$vres#+qu&eacute;e#*slaughters$#ped#&tenuta%*s-la-jolie$%ineia$*le-derived',
+    '$*facturable*$ers.$$tius#$vers#\'warings#(y-gabled%\'jointed%$many%&roomed%(windowed#%zarek".p/illustration#$less#&makers")quiladora',
+    '&!y$+mure&scedil$$ngon$&t/sade%#sos#$bach$*le-hearted\'%sized&$head$$oeuf#$call%$site$$elyn$$h-17&(phillips',
+    '$(o-pierre##din#\'e-based$#lla#&garida$$ison$"ox$-rave/burglary#*i&eacute;e$&anismo$%e-ann&&helene$%gnano$$lies$,ni&egrave;re',
+    '$\'opteris$$scos$%timum#)k-anthony%$down%&lawson$\'enfield%,t-distorting\'&minded&)ing/sales\'&sation$&tgasse#,riageability$*ow-derived#\'shfield',
+    '$$ilio%#pal#3tin\'s-in-the-fields&,dale-hubbell&%gales&&sville$$lets$%orana$#uba%&nashen$$ynov%&rology#-xist-inspired()leninists$#man',
+    '%&le-bow$&church$1lebone-manchester$#pen"&sahiro$$nori#(carenhas$"on&!s%"rd#%harqa$#eke$"ie#"ih#$krey',
+    '#)s-storage$%agers$#era$#iah#*tacembelus$+er/mistress\'\'servant&%clips&&tronic&)workshops$%odons$(urbators#$ulis"$tale$"wa',
+    '&$race&\'winners%%books\'(x-making%%locks#%elots$*rnal-fetal%!s$"s.##hes##ias$"ja$$ness##ooq##ras',
+    '&%ulate%(lineally%%oshka##tei%%rface&#son$$haus%#eus$!i$$sson#$veev"(ukinhill#$lana$#ers#%noury',
+    '$(etanicus$%ienne$#ois#%solea##zac"$vers"$xell#\'imalism%&isable%+um-security#%stone#*well-owned(%smith"*y&ndash;23+!6',
+    '%!2%!5$!3#\'/thames#%agila$#nja\'\'-nkangi%!s#(chantane##led#/on-white/oxford$%rship"$zdak#&eikiai#$unov',
+    '!#b-1")a/diploma#%ngura"#chb"%oreha"!p"(uji-mayi!$c/10"\'aliskey$#oon%#rum#%ninly$$ulty#%rdles$"ty',
+    '"%beath")callister$#pra$%rrell%#tie$"ve#\'lements$\'oughlin$$usky#%mahon#%offey$%nahay%*nell/lexie$#oey#&ullers',
+    '$$rrie"&donnel$%rmand$$wall"\'eleneys$#nea#&villey\'!y"$fact"%gairy$$rvey#%eehan%#ney%!r$%oghan',
+    '$&nnigle#$oran#\'randles$%eavey$%illen$$oddy#%uffin$#irk$\'rnaghan"&hamish##ema"\'ilvaine"%kagan$"na#%eague',
+    '%!n$$igue$%msley$#nny$%rrell$!w%"an##imm"&larnin#%ennen#$oone#%uskie"\'menamin#+illan-scott(!s',
+    '"\'naghten$+ught-mandli("an#$eice%\'llstown$$rlin#\'icholas""od#$scar"%ready"&simons#%orley#%wiggs"%tigue"\'veighty',
+    '!$dash"!n!"e-#$ness##too"!/"#1li"%adway#$lham$&stream$$worm#\'n-faced$"ey$)s-related%$/end',
+    '$"or$)ure&mdash#&t/meet%\'poultry"$bbee#"mt"-c&aacute;nica##ham%0nical/electrical*+ly-operated\'%sm(s)#\'onopsis"\'dauring#$eans$%ghino',
+    '#*ia-induced%\'station$#cis$.eval/religious(!e$$sers$&um-and\'\'calibre\'#dry\'$fast\'%level\'%paced\'(to-small##kit#&licott',
+    '##win"%echan#%rbeke$&schaum$"ut##son"(ga-deals%*fuckstruck%\'mergers$$lith$\'parsecs%$odes#$illa"$hret$%inger',
+    '#%ktila"&laenas$&lophos$*mine-faced$(ncholics%$geur%"ic&!o%&oxylon$#sse#&caster#%dreth&"ws#%ismas%$sico',
+    '#"la$$ieha%(fluously$&owness#%odist#,ville/oxford%"ns"$mani#.ber-get-member&)/director$)rane-like("s.#"hs#\'oirists",nage_a_trois',
+    '#\'delians$$ieta#\'friends#\'gelberg#&heniot#)ingitidis&-oencephalitis$$ppus#\'lungtse#%ongue#!q#(sah-wood$#ink#*tal/manual\'(physical',
+    '&!s$\'ionable\'/s-in-despatches##uet"$pham"\'rarites#&captan$\'urially&\'ochrome#$ger.$"ui#&iclean$"to##ops$%vings',
+    '$#ows$+y-go-rounds%$hell%&makers#$sham#%teuil$!z##uit"$sial#\'olectal$%trons#*serschmidt+!t$$idor$$room',
+    '#%urier""t.#,a-scientific$\'bolizes$(centrics%)haracters$%files$(l-capped%&licity%"s.$&merism$*strongyles$\'tarsals%\'horacic#+eoriticists',
+    '-#lly#*hodologist$%ylate#$ical#$onic#\'re-high$\'icality$&onomes#(sa-serla#\'zenbaum"%uthen"&val-11$&sseret"%zuzah#"za',
+    '!"fc"!p!$g.kg""/g#$mmol"$et01"!o!)hc-linked!"i-#(guel-ito")cawberism#$elle#0hael-in-the-moor#*key-taking#-ro-biological',
+    '\'(omputing\'%racks()ystalline&)economics\'*nvironment&$film&)reductive&)sociology&$wave%\'balance&$iota&$ytes%)circuitry&%occal\'(mputers.',
+    '%0electronic-based&,nvironmental%(filariae&%loppy%(globulin&%raphy%&litres%*meteorites&$oles%&peltes&(hthalmos%(scopists&)imulation&(ocieties&\'poridia',
+    '&\'urgical&\'witches%%tines%&villus%%wells"\'d-1630s&#90s%$800s&!c%#941&"59&"68$$650s%#70s$$780s',
+    '&$urse%&rustal$(fielders&#rst$$kiss$%layer$\'mounted$%north$$part%\'osition$%river$(sections&"pt%$ixth$%tempo',
+    '%-orcestershire#)afternoon#,dle-managers("en&$gate&%stead&0ton-on-the-wolds&$week&!y$%ridge$"x.#%elney#&fields##ika#&nights',
+    '#&points$$rice#\'section$#hip#$term""el"%genes##hts##lio&!r#&rators#&uelist"$inne"*khailovich#\'kelborg',
+    '#*uli&cacute%#ski##vas"%landa$!s#)czanowski#$dewy#,e-and-a-half$*s-per-hour#%field#"he%!m#/itary-dominated$$voje#(k-churns',
+    '%#ngs#(l-stones\'$ream%&worker$(erandage$%iards%%molar%#sle$%owner#*ner-gibson#$ords$"sz#$vian"#msy"#nd-',
+    '$%/body$%craft$$fuck$(lessness#"eo$(ralogist\'"s.$"ty##gbo$!o#&i-club%+roundabouts$+chromosomes%#lub%-omputer-based',
+    '%#ums&!s$,ster-adviser$$vans$$zyme##nah$%igaff%$wick#&or-key&&league%"es#)sterworth#%timer#(uet-like$&teness',
+    '##xes",odowicz-wolf"!p#\'s-rated$$/ace"%rabel\'!l$+cle-stories\'!.#$ella$$mont#"os#\'thfully##vic#%zoyev',
+    '$+recognition/!s$%using##ano$"si#&celles$&hances$)onstruing%%unted#(demeanor%\'scribes#(erliness$#tic#%field#%hapen',
+    '#%kelly%%yings#&nomers#)perceived#)quotation#%reads#6senden/buckinghamshire$$oula#"t\'$(:wartime$!i#"ys",tchell-gears((/british&$nson',
+    '$&plasts#.telrheinisches#%zvahs"%xdown#)ed-gender$\'r/spray!#k2a"!4"$wayi!#l/2#*minute/100"!n""ui!$m106""sm',
+    '""pp!/obile-telephone%%izers"%catta#$hica#)k-serious"+d&egrave;le#%-cons#%alism$!s#$elli$%rate.$$stus#%ula-2%&e-name',
+    '&"s/""ei#&ketsie#%lwyns#&rdiono"$fert"#gas#$ilev""hg#&yeddin"%issac##tra"$kler#%tadir"#lal',
+    '$&months#$iant$$nero#$lasi#"ok"(m-in-law#$berg#\'egiture$)ntariness&#oes\'&usness#$pati"*naco-ville$(stically$$ural',
+    '$#eos#&ey-bag&\'capital&&earner,!s&#gdp\'\'rabbers&#mad\'"en%$belt%&makers%%penny##gie#)keyshines$$gate',
+    '#$nica#*o-cultural$$cles&#ine&$onan%#ots\'&yledon%%ratic%#yte$$dist(!s$$gyna$(maniacal$)oxygenase$\'polises',
+    '%"ki%\'ynaptic##son$)trousness#)talembert$&bretia$\'ecristo%#gos%%limar%)napoleone$(gomeries$\'pensier$"ri$!s#.umentalisation',
+    '#%ymusk#*zon-montes"%odier#&n-face%(silvered$#eys#&rbrock$(hen-like$%sholm%"om"&qqatam"&raleja%\'ization$"nd$$tuva',
+    '##don#"e-$%/less$!a$$lion%"le$,tonhampstead#%illas#$laix$)ey-hewitt&!s##nin&"g\'##obe$"to',
+    '%)oclimatic#!r$$ants$#iss&$town#-tgage-related$$ices&$ians%)fications$+on-on-swale\'(williams"%saero$#nat$%saurs#%catel',
+    '%"os#$eyed#(kovskaya#\'leyites#*s-infested$$burn$%green$#ies$&morran#"to"%tahar#,her-and-baby((s-breast\'$baby\'#in-',
+    '\'(of-seven&%wells#)if-on-sun#+or-cyclists%$cyle%"ic%#men#$wani"\'udjahid#$lson#(ntaintop%$rath##rad$$eaux$"ir',
+    '($ness#(sse-like$(y-haired#(thecombe%$less$-on-rothschild#%vance"/vement-national))sensitive#)ie-houses%&makers$#lle"$xham##ico"$yale',
+    '#$dart#$enne#%glare"%zelle#$zies!)p/housing#&junior#(minister#\'prisons#%trade&&nsport"$4/7a&!s""fl"%h/kts',
+    '!\'qseries!&rc-ncs""ib"!k"!n"$oueh!&s-dos-\'*under-unix"$2000""dp""p1"&v/year!$tafu"$dnas"$ef-1',
+    '"$rans#"na!&u/mmol"!5".ch-appreciated%*ballyhooed&&eloved%)cherished%\'derided%(emulated&\'nlarged%&lauded%)postponed%\'revered%\'thumbed',
+    '%&valued&&isited%(welcomed$"as$%elney$$kund##ius#*o-purulent#\'us-like"+d-encrusted#(dy-brown#"yi"#fas#$fing"&hlfeit',
+    '"\'illeoir#%rlins"/jahedin-e-khalq$$ma\'a#+er/fempress"&khtars"%layem&!n#%fords##gan#!i$$shly#&ligans##sum##tan',
+    '+%ities&.billion-dollar&)candidate\'(hambered(#eck\'&oncept($urse&+handicapped&-institutional&(millions&)occupancy\')ppression&%print(%onged&&ringed',
+    '(%ssion\'&pecies&(thousand\'\'racking%%color%)filaments%#gym%)laterally&$ists%,millionaires%$plan)"ar(#yer\'%exors&1rocessing-capable',
+    '%/vitamin/mineral%*wavelength#$vany$$enna%$rins$%ihill"(nangagwa##cey$/hausen-by-proxy%#kin#(danities#$ford#$hall#-icipalization$$ment',
+    '"&rdiono##ids#$kier&"st%"ly#&murous#$phys#!r$$elet%!s#"um#%ville"#sae$#jev$#yev',
+    '#(cle-wise&#men#"ei$"ms$#tti$\'um-like\'\'quality#$hkin$-room-coloured#(ic-lover#&kiness$$rats##lih#$ocal#$taqi',
+    '$*y-smelling"$tahm$#tio#%eness#$hiah##laq#&ualism&,ly-dependent)%owned"&waffaq"\'ybridge!$v293"%s/esa"!x!)wakikunga',
+    '"&eenish#(ndamseke!&yc-max#&ielska#"oe"&elomas&(onocytic"%kland"$land#&onitic""nn"&ocytes#(electric")rmecology$#ica',
+    '#%ticus%$fier"*thographer *n&auml;ive"+eacute;stor""gt!$\'jie"$sele!"-1"*acetylated"&glycan"$next#/itro-l-arginine#"ot"%phase',
+    '"$a.c.$$f.d."!b"&c.t.d.#%rassa"$f.b.""o."$r.r."&s.c.a."$w.2d"$y.s.!"/2"*hotteterre!"10"$207v',
+    '"#51u!#235!$620l!%7001u!"84"$88ar!#=28""31#!3""47""52""61#!5!"a+"#aqs',
+    '#"bi%"ng#"ru"%celle#"re""dh"#gae$"ls"%hijes##nah"(ilmaking$6sworth/gloucestershire##rac$&nshire#%smith',
+    '"%kkuda#!o$#das##uru"%lchik"(mbiquara$)oodiripad#)e-dropper%%space%#tag$"/s$!r##que"$nana#&ograms',
+    '##sie#%teuil#!y")pier-bell##ley#%roxen#(thalenic"&rakobi#$bett#-cissistically#$ghil#"is#%odnyi#(rational&.or/protagonist',
+    '\'*shouldered&(ly-based"&shonal#*o-temporal#&rullah"%tassa#"eq$!s#$hans#-ionalisations*+t-dominated&"s.$&vistic(!s#&tereri',
+    '\'#ly.%\'e-based%\'opathic##war"\'ughties#$seum#$wach"%vathe#$iera#\'juvanov"$wton"$xxar"\'ysayers"$zari!%bc-tv',
+    '#!s""rf!$c100"!6"#gia"#mtt"\'p7:cdna#!s!#d4l"-jam&eacute;na"#pbs"!s!%e2000"!6"#ads',
+    '#"my#+nderthalers#)r-boiling%(capacity&\'omplete%&desert+"ed&\'oubling&\'rowning%(freezing%"uv#\'tishead"(bulously"#ccr#)k-amphora',
+    '$$ache$(erchiefs$$lets#\'ropsies##tan%(riferous$$urus"%edle.&$cord&$time&\'workers#%psend"/gative-feedback#-lig&eacute;es&%ence.',
+    '$\'tations%(iations.#%retti#&ulesco"+ighborhoods\')urhoodism)"s.#)l/weather#"ra"#lia#/son/strathclyde&!s"\'m._con.#+adzivhanani$#nja',
+    '#"ec#!s"-o-avant-garde$*conceptual$-expressionism$)freudians$\'marxism$)populists#(morphism#%phone#.squamocolumnar#&tenous"*phelometry%(w-in-law$&rology',
+    '#%otist##uta"%rcwys#"ra#"va"$sses#&t-hole%&owners$%boxes$$ings"&t-like##con##han$\'erwoods#"ta',
+    '",ubrandenburg#+e-caledonia#)rasthenia$$itis$.oendocrinology%\'genesis&$lial%(hormonal%*n-specific%-psychologists%%spora%&tensin&\'oxicity#\'strians#(tralists',
+    '#%ville"2ver-had-it-so-good"%w-boy$#old#$arks#\'bigging#&church##els#,foundlanders#&hailes#,ly-available&&bought&,commissioned(\'nquered)(stituted',
+    '&)generated&\'imposed&$laid&*qualifieds#-man/organiser#*nham-davis#\'s-books%(cuttings%\'readers$&breaks$.paper/magazine)"s.%%eople#$tech$%horpe',
+    '$!y"#xis#.tstep-on-intel"#zer!)f-il6&bgr"!4""ff""nt!*garikutuke"%c6342"%he-an%$tinh!$i205#"12"!9',
+    '\'!s%$ings##ley""ca$"ds#%e-pak#+holl/thames&\'son/the"*dification"(ederbuhl$&zwiedz##fer##lds$!e$$sons',
+    '##sen#!t$#her"%ftily"&g-nogs#(ht-black&$rate&\'scented&\'walkers%%birds%"ed%#ime%(marishly%"s.&%chool',
+    '%&walker#!o#)riventris"$holt"$kkie##las#&olayev"$land#&oticus"$mbys#!s"$ne\'s$%-days&$igit%$fold',
+    '%%pound$*teen-forty.%-four)\'seventy)&twenty(/th&rehy;century*$-and*\'century%%y-odd\'&second)%venth#$iane#(n-hansen$#ies##th-',
+    '"\'pped-in#"sa""rj"%sanci$!r#$hida")t-pickers#!a#$pick#)rate-free$(obenzene#$wits#"ya"(x/foster#,on-kissinger',
+    '#!t"#zam#$hnii!&joroge!&komati!(l/cm/min""ps"!q!&mol/mg")r-derived""sp!%n.nna"!2"!6""nn',
+    '#*redundancy#\'strings#&talent$#ill#%venta"#.20#"30"#/24""14"!7"\'_no_one""ad#"hs"$bels$!x',
+    '##ski"#con#"sa"%dosum&!s")e-derived"\'iseniks#"te"#kes"%llaig"%march#\'inators#!s"0n&rehy;committal)\'payment',
+    '%*ccountable%-dministrative&#ult%(lienated%&naemic&\'glicans&$imal%+ppendicular%+ristocratic&&tistic%(utomatic$-bibliographic%\'locking$+calendrical\'%lable',
+    '&"se%&entral&&rvical%&hinese%\'ichlids%%oding&\'gnitive&)mpetitors&(nducting+#ors\'&served\'&tested&\'rrosive&)uncillors%\'ultural',
+    '%(elegated\'(inquents&(rogation&)scriptors%)istressed%(octrinal%&urable$-educationists%)lectrical*$onic%(motional&\'pirical%(nzymatic%*vangelical&$ents',
+    '&(ercisers&*ploitative$+fluoridated%*undamental$#gay%&ermans%&olfers%%reeks$.haemorrhagical%&epatic&(reditary%-ierarchically&&spanic\'%toric%\'ydrogen',
+    '%*ndependent\'$ians(&ctable&\'fective\'(ormation&\'jurious&/stitutionalized&+ternational%#ron$%juror$$kpmg%&urdish$(leaguers&)gislative%%imbic',
+    '\'&guists&"ve%%ondon%)ubricated$%macho&)trimonial%$etro%&imetic%%odern&%slems&\'torised%(ydriatic$+negotiables&%twork&&urotic',
+    ')$tive$\'odorous%*rdinalized$*pancreatic&\'rasitic%\'eriodic%,hilosophical&*onological%\'lanning&%ussed%*oliticians%+roportional0#ity$!q%)ualifiers',
+    '&#ota$&radial%\'eactive\'&listic)"ty&(cyclable&!d\'\'eemable\'$uced&)ferential&)miniscers\'&ovable&&served\'%idual&(tractile',
+    '&&warded%&unners$%scots($tish%%ecure)#ity&&lected&!u%*ignatories%)mall-cell%(olicitor-!s%%peech%$taff&%erile',
+    '&(ochastic&(ructured%*ynchronous&%stems$\'telecom((ological&(rminated%\'heistic&)oracotomy\'$ught%\'radable\'(nsfected\'&umatic&$iers%&urkish',
+    '$)ukrainian%(nionists\'#que$(visitors%)olunteers&$ters$\'writers(#ing$!x#$agon#,commissioned&(petitive#1deterministically#,e-too-gentle#(feminist',
+    '#%ny-no#%party#\'quantum#(randomly$\'eactive#(singular#\'trivial#(violence"%o-far##key#,n&ndash;1.00$$time#,rdwijkerhout$\'mahomed"&penin\'',
+    '#%frost#"ie$#tes#,mal/abnormal%%ndale&*nenstrasse%0tive-explanatory$(lessness$,ochlorhydric#$reys#$test$\'h-about\'\'merican&*easterlies*$ward',
+    '%(ampshire%(easterly%%galis%)westwards#,wegian-owned"\'sbridge#&e-cone%%rings&&ubbing##in\'#\'talgias"\'t-being$(flaubert$&guilty$.in-my-backyard',
+    '$)very-good##_at#+ebook-sized$%stein#"hi$#olt#!i$%cably%#ias#%ocord#1re-dame-la-grande#"us"-uveaux-riches"%v-jan#%adyne',
+    '%#las$&mber-2*!3(&/early(!s##ias$#kov$"os$%ssimo#*ocherkassk"&w-dead%(isbanded$\'retired#!.#*heresville',
+    '##ruz"#yan!"p9"\'fl-held"!i!%r2101"!u!%s.21a""cn"$f-22""ms"#omo"$r250#!s""sp',
+    '"(eziryayo""fs!"ua"%biles"$chal#+lear-family%\'ophilic%$pore"#dum"\'isance.".mber-theoretic&+ed/lettered&&plates$&skulls#\'erative',
+    '%"us#%idian$(smatists#"my"&nataks#\'cupatio""on""ra#$bhai#%istan#*sery-maids\'*/playgroup\'$maid%!y#&turers',
+    '"\'t-cases$%trees#*hatch-like#+s-and-bolts#(terworth"$vara"#wcm!#val"!e"#ono!#w11"!7"!h"!p"!s',
+    '"%p1000"$r&gt!$yack"+mphaefolius$#ton"&nehead"\'um-nyum!"zi#%engui"$wani \'o&pound!\'\'blisco"(donnells")gara-hess"(hennessy',
+    '"%regan##oss!$(n2)!--five-hundred"!h""oh!#.b.""c."#n.o!#/45"$gcse"!s!!6!"ae"\'k-trees',
+    '$)shottians%#way#$mere"$saka!(b-irtysh"%afemi"&conica"*durateness"$erle&&utnant%"in#%tsibi"*fuscations")ituarists",ject-glasses',
+    '")liqueness&%ities&"us"+noxiousness"+servations.&)er/harris!,ccasionally.*!s%$sion#&ludens#4upationally-acquired/(specific".ean-atmosphere"\'tameric$$ndra',
+    '("21$$foil$\'partite"$ulis&"ts$&omotor!)da-funded"!c"#off!(ecd/ceri"$hlen"\'nothera",steonecrosis%%rhelt!%f-the',
+    '#\'-comers$(specular$#the#(ender(s)&#ors$"r/%#ers#%guard#*handedness#"ic%(e-bearer\')sponsored\'\'workers&\'holders&(r/higher',
+    '&\'ousness$!e##ord#(spinners#(worlders"&t-told!%garev"$born"\'dentown""ly!-h-so-ordinary#)three-one"$lson!#ieo"%gnies',
+    '""l-$#can$%drums$(polluted#"er##rig"\'nophyta!&jemann!$key-!%lafur")d-looking#%sters"(eaginous#$chea$%ranon',
+    '"\'faction"*igarchical$(ochaetes%(peptides%*saccharide#*stostromes#$vaer$\'e-toned%!t""oo"&sburgh"&usegun"&ympios!%mbres"&egamon',
+    '#$eyad#(ochromes""ne#+icompetence$#tel"\'ophagea#"ri""vs!)n-and-off##job#(licences$&ookers#(singular##the&$-fly',
+    '$#ime#!u"\'anistic"%c/ond#*e-familiar%%grand%*in-a-while%\'popular&(romising%%royal%%white#(ogenesis"#des"*e&rehy;off#\'-celled',
+    '$\'day-old\'!s%&esigns%*irectional$(electron$\'fifteen(!y$&horned%/undred-per-cent$(in-a-bar)\'million$,man-one-vote$\'nighter+!s$&second',
+    '#&liners#"st"%field"%gkili"#lie"\'oufrios")slow-fane"-togenetically"!x"%yango!$o-ee""91"%lites""rs"!s',
+    '"%zings!#p.1$!8"%aques"*en-systems%\'toppers%\'winning$%/save$$able%"ir$#est$(ing-time$$mail%$odel#*ra-ballets',
+    '%)tionalism"\'hiernus$)oleucinae%&phiura\'%rixus%$ripa%&thauma$&uridae#\'thalmia((ological"#ies#"tz".osici&oacute;n""p.##itz',
+    '$,nent-process$(rtunties$$sers%/ition-dominated*$ists""s."%ticks$&mizers$$ons.$&vision$!x#\'omistic!)ral-aural#&ngeism#&torium',
+    '"#daz#&inates"\'ebodies"*gan-speech%)izaciones%,ophosphorous"#ibi#.ental-sounding#(ginative#!s#"us"+namentalism#&ovitza",o-pharyngeal#(lowetsky',
+    '##zco"*thodontist%\'genetic&(raphical%)phosphate#"is##leb""zo!"s.")/eye*node"$berk"*cillograph""ei"#frt"$gifu',
+    '#"an#$pyan#$rian"$many"&sicles$!p"\'t-marks#&ashkov&$vili#"em%!s$\'oblasts%\'glossum%\'malacia&\'yelitis',
+    '$!r%"ud#$iole##man#*racization$(ich-like$#ogi&%orski%"va&#sky"$wego!\'tellini")herwordly"#obi#*scopically',
+    '#$mann##owa!&uargla"+d-poelgeest#"ry"$imet#\'streham"$t-do$,of-condition\'\'service\'(the-body\'\'wedlock$(performs%(lacement$%think',
+    '#)er-london#&fields#%grabe#%hgill#\'lawries#$most#%ports#\'ranking$!e#%shoot$!i%)de-halves$$tare$$wing#+ward-facing',
+    '#&lbumin#"te"(en-baked#+r-achievers&+ffectionate&)ssessment%$busy%&candid\'*utiousness&-entralisation&+ompensating\'+nscientious+#ous%(delicate&$oing',
+    '%)estimates&$xert\'\'tension%(friendly&#ull%.generalisation&$rand%.identification&(ndulging%&lavish&%ength&&ooking%&modest%\'obvious%&polite',
+    '%&ratin\'&$eady\'&corded\'\'present\')strictive&$ides%$seas\'%rious&.implifications\'-xty-year-olds\'"ze&)olicitous&*pecialised&+ubscription%)talkative',
+    '&#hin%,urbanisation%(whelming&&orking$)abundance$)bearingly$(cautious%*entralised%%ometh\'\'mitting&)nsumption$%eaten%(motional&\'phasize$\'hearers',
+    '$#man$.protectiveness\'&vision$.representation%$ound$\'sailing%)eas-owned&)nsitivity%$kirt%(tability\'$ying&#one$(taxation%#ire!#wel',
+    '"#let""n\'#&-price#%er(s)%(-drivers&\'farmers&$like%)/occupied"&thorne!\'x-carts#$like"!3"$alic"&borrow"&enford',
+    '#,ord-educated%%shire"#mus"%onian")ycarbonyl#\'moronic#%tocic##ura!"y."!a!&z/&amp$&frac14#!1"$ires"\'okerite',
+    '#,ne-depleters .p&aacute;draic#$mp:o%";h&(o/orient"*eacute;ter"3lt;0.01&ndash;0.001%"10")ndash;38s("51!"\'a!#(1)""3)""g)!!*',
+    '"!g"%waves##ord!$.-w."#103#"17#"22$!4$!5$!7$!8#"52$!8#"80"#221',
+    '#"55#"88#!d""36#!9"#407#!3$!2""55""63#*7&ndash;68""74#!7""85""95',
+    '"(anserina"!i"$l.a.""n."&p.b.v.$"e."#r.o"$w.o.!\'/19/112""bk""es#!x"!n"!r!&0.0001',
+    '"$/lp2#"t6"#00m#"9l"#13i#!4$!c#!5$!4""34$!4!#220!-3/ns1/1-ag4.1"!3""u1',
+    '$!4"!1"!3!#57/""96!"62"%6/p51!"70"!8!"94!\'=0.0002%"19%"23&!7%"44',
+    '$"12%!5%!6$"20%!1%!2%!7$"34$!5$!7%!5%!9!;a&rcaron;i&zcaron;sk&aacute"#01i"\'chomius',
+    '#&ificus&$stic#)k-animals$"s.%$tone#"lc##uw3"$dauk#"da$\'le-like\'&wheels#$iham#"ma#"og$$vano',
+    '".ges-per-minute$"ts$#x2t##nol#(oda-like"%id-in%#out#\'lthorpe#,nt-spattered%$able%%ings.))/drawings#)r-bonding&\'reaking$,ed-associate',
+    '$"s.#$sely"%jonal""ka$$macs##tar",l&aacute;cio#1aeo-environmental&&botany&(climatic&\'grapher$#wan#*e-breasted$%mbang$2stinian-controlled',
+    '#"io##lan$"is#\'m-lined$*er/ashbury$$ists#$omas#%pifer#$ucci$"el$$stre"%meton#%ments#&phylia$&isford',
+    '%$sian$&global$\'islamic$%pipes#\'amensis$%yotis#&casila$#hen%\'romatic$/reaticoduodenal((obiliary#)daemonium%"va\'!s$"ya',
+    '$)l-mounted%&linion##fil#%glong#%icale$%grahi$#zzi##ner#(opticism#/proctocolectomy#\'taenius$)echnicons$(isocrats$\'ropical$"un',
+    '#)adopoulos#%er(s)%&-bound&&chains&%white%%back.)#ers%$girl%%maker%$save#%ineau#\'plewick#"ya"\'r-fives#(a-aortic',
+    '$\'boloids$(cellular&&ntesis%#hor$(disaical\'%iacal$\'ldehyde%$egal%&lactic&+el-inserted)%sided%&ogical$)magnetism%(eterized\'(risation',
+    '%&oecium&#urs$(n&aacute%$oids&"ta$+oesophageal$(phyletic%%raxis%+sychologist$*sitologist$%taxis$$vent$$xial#&doners$"us',
+    '%,t-adolescent&!/\'(guardian\'*subsidiary&$less#&fumier#&ikrama$#ngs%!i$)s-roubaix&#sud%\'h-based&%oners$#tes#)k-keepers',
+    '$$dale$(insonism)!s$%stone$"yn#%lasca$(iamentry$!y#!m$!e#$naka#&orchis#,quet-floored#$secs$$hall',
+    '#&t-bred%+description%)gargoyles%%packs\'"id%\'written$#age%$kers$&henium\')ogenesis/$$ials%%c\'lar&.ipant/observer&%uarly\'\'larisms',
+    '%"ta&)ioned-off$\'lington%\'y-built$+ner/manager$$time$\'y-based&)christian&(to-party%!0#\'vifolia#$wood"$sdun##htu#\'ionaria',
+    '#)s-through$)amaquoddy$%books$+enger-miles$%ionel%)ve/active$#key$,port-holders#\'t-tense$%e-ups%(l-shaded%!r$$ille$$ness$&orales',
+    '"*t&eacute;s#\'chworks#%ernas#*h-breaking$\'ologise#)ients.the$!n##kin#$riae&\'rchally%%local%(otically$\'onesses&$izes&"ne',
+    '$"ea%(rn-notes\'"s."%ukert#&l-yves#$sed."%vanes%!s"#wky"&y-days$(for-play$%slips#%able.#$cock##ees',
+    '#)ne/thames#&sannat"#zar#"os!\'b-zn-ba"!f"!q"\'vispcr2!$c-at#(software""10"&3386sx""60".b-contaminated""l5',
+    '$(fragment#"ip!#dcb"!i""sc!"e4")a-brained$$like$\'soupers#\'cockery#2ke/gloucestershire#!n#(rl-white%\'y-white#+santisation',
+    '$&hooter*!s$%marsh$$nell#\'t-brown%$like"$bley")ccadillos%#tor#!i#\'k-order$$able$$over"*dal&eacute%(-powered',
+    '$,strian/cycle*\'ization#$icab%$ulus&#res#(ogenesis\'"ic""e-#)blesshire#!g#%lites#&pholes$!y#*r-reviewed"&g-like',
+    '#"gs#%swood"$ichl#*sistratids"$lada##don#"eo#$ites#%kmans#(lestrina$$ings#$orus#"ta#+vicachromis")n-enabled',
+    '$\'pushers#)cil-fuses#$eios$%lopes$!v#%gally%!m$$elly#)itentials#$kett$%ridge#&niston$+y-farthings#$sant$\'iveness',
+    '&!n$)ylvanicum#$tads%%meral\'$ters%&thlete$\'hesilea$$ices%(um-class))ompatible$)obarbital$\'remites#\'windows"#oli#!n',
+    '\'(clubcall\'(watching&$hood"#pes##ito#&loides#,per-and-salt&$moor&#pot"%r-neb#%acchi#$bene#\'centers%$ptor$\'ipients',
+    '&!l$*ussiveness$"ys#)egrinatio($ella$$nial#+fectability\'"er\'(ly-timed$$idia$(ormer(s)#*ibronchial$\'cardial$&foveal$\'neurium',
+    '\'%racum$$plus$\'shingly$&thecia$+ventricular##kes#%latum$#ita#$mers%%thrin$/o-carboniferous&%trias$+usyawaratan%%table&#ing',
+    '%!s#)operative#$ratt$)ier-jouet$#ons%"tt#%sabus$(everence$,ian-speaking$+on-oriented$#uit#%tinax$#uis#$umal$$sals',
+    '$$ious#\'wakilan#%yt_et"$sage$"ka#$caru#"ek#"te$*icide-free*)resistant%$lent"$t15b#)al-shaped$#rds#&erboro',
+    '#\'heridge#%ioles$#tio%+s_bourgeois#%kovic#-r&oacute;leos$\'asovits$%ifies$(o-canada%+br&aacute;s%.l&iacute;feros&%-blue\'&soaked)$dden&#eos',
+    '&%ogist+!s%#vic\'%etnam&"na&!s#(sopoulos#$ters\'"en$#ier%$john%$pher"-ugeot/citroen"&verell"&wterer',
+    '#"/4"!3"\'affikon"\'ennings"%v1600!%g/mgw""e2#!x$#-kg"!i"!m!+h-sensitive"#7.0$!8$!9',
+    '#*lacrocorax%%ropus$+lic-oedipal%)us-shaped#"nt%%asmal##rly$!m%(acologic#$ses.$%ianus$#mid"\'d/mphil"+easant-like#\'nacetin',
+    '%%cryst%,l/chloroform&#ogy%)menalists(\'ologist%\'typical$%ylene#-ochromocytoma##rai"$ibes$"ro#$dias#1ladelphia/ormandy%%nthus$$bert',
+    '$#tre##nal#%ppard#$vcg4&#8.6"+lebotomists)!y##ips"\'oblacht#$caea#!n$(e-booths$$iest$)o-lexical#)sgenation',
+    '&-oenolpyruvate\'\'lipases\')rescently("yl#)to-albums&%based&%calls\'\'hemical&#ops&%story&%works%%calls%/electrochemical&\'mission%*journalist',
+    '%%matic&+icrographic%(receptor(%overy\'(fractive"!p"(rasebook%$ings"!s"&thisis"+ycoerythrin#%letic$0loxera-resistant$"on#*sicalistic',
+    '&%logic&(theraphy#*tochemical%,geographical%&logist!Fi&mdash;view&mdash;dc&mdash;assessment#*ntilde;ata*$eres"&achaud#"ta"%broch"%casse##ena%!o#"k-',
+    '%\'pockets%*under-unix$%ed-up$#ney#"os%"so#%quets#\'rotoxin#)tographic$\'ure-box(%strip\'\':martin\'\'s/erika"+dginisation"$ecer',
+    '#$ring$$otti$*re-amanieu#%terse#&zolith"/g-in-the-middle$$like$#sty%$will#(gy-banks#!i#$like%"ng#$mies#$stye',
+    '#$bara#%ferer#)l-popping$#ans%\'r-boxes&#box$#eth%"us$$ocks%&w-case+!s&!."$mkin",n-compatible$&headed',
+    '#%balls#%cenez$#has%#ers#(derfield#\'e-cones%\'scented##hoe%#les#*k-coloured%&tinged&&ongued$(ish-grey#$nata$#eys',
+    '#(ocheques"-p&eacute;rade#&e-work$$rita"$ques"&rinski#"os##ton")scoscophy#)istratids#&sed-up#(tol-like\'&shaped%#ned$#yll',
+    '$$pony$&shafts#%blado#)ch-covers%%forth%#ley#$elka##saw#(uitaries"$zano#"ey#(za-faced%"ro!$l.34"#480',
+    '%!i%$less%#pot%&rville$#ito$#ket$%oderm#(giarisms#)in-spoken&%weave$$ters#"ke#\'ne-load%(tesimals$%gency',
+    '$$less$%nable$)t-derived&&filled%$able&*tion-style%&houses#\'s-y-dre$$kitt$#mic%$odia&%lysis$#son$*tic-topped\'$ally',
+    '&$skin%$rons%!y#+te-tectonic%%locks%&resque$0form-independent("er$+inum-cobalt(!s$)yrhynchos#+usibilities#(y-caller%&ground%\'writing',
+    '%$ooks$.er-of-the-year&&/coach&-s&mdash;lasky$$lets$%rooms$\'schemes%$pace$\'workers"\'easants%*urableness$#vin#\'bescite#(nteously#(ssington',
+    '$#nev#+umeur-bodou"&impton#-o-pleistocene"!l"&ongeur#"tt%%ed_as#+ugh-witches&%lands#(ver-like"+ug-and-play#)m-pudding#*ralisation#$shly',
+    '#(tocratic!&m(79)3"!b"&c5edcm"%ey4.3""ld""rc!"nd"(eumonias(#tis"$gwim!+o&egrave;te""at"$bres"\'caterra',
+    '"\'derosos#&hajsky#%iatry#%olian%#sky#(shivalov$$naps$)olisation"&ecilia#*rwowidagdo##sie#)t-critics$(/painter"(ggenpohl$"io',
+    '"!h#-o&rcaron;elec#\'utukawa"*ikilotopic#"lu#+nt-counting&$like%&edness%$ings#)son-arrow\'&tipped(&ongued&\'er/king"+korn&yacute"&lakoff',
+    '#&e-axes$"is##ias$)ce-public\'#run&*/community&(man-like&$work$$gnac$"na$)sh-jewish\'%owned\'&soviet$"t.%-ical-cultural',
+    '\'*o-literary&!k%!z#$jica#)ka-dotted#)l-rigging$&aiuolo%)rd/thames$*en-bearing$$inia%%tzers$)okshields$)uter-pays&$ion.#&troons',
+    '%+unsaturated$(acrylate%)denylated%$rchy$&blocks%"ox$&cystic$+ester-based)!/$\'gamists%"en$$hema%%ymnia$(isoprene$&methyl',
+    ')%ously%$yxin$\'nuclear)&otides$%ploid$(sulphide$)technical%,hene-covered$0vinylpyrrolidone"%mades#$elos$$ranz#&peiian#"um"#nca',
+    '#$dful$&sfield##ens#$iard#$tian\'!s%"ca&"us%#ffs$*llanfraith#\'y-tails"(o-scared#%fters##ler%!s',
+    '$*er-quality"\'p-holes$$star#%/rock##gun#$pets$&yfield#$ster#)ularizers"\'r-gilli#%bably#(e&cacute#&kadder#&odomal$&lithon',
+    '(#tic#*ridge-like#\'tacaval%#let%%mento*!s%%skaig$"el%#nds$$gual$%hford$&ishead$(mahomack&"nn%#ore',
+    '$%reath$$vale$(wich/von%#ood"#sad#$ible$&donian$%llipo$\'tion(s)(*-dependent($ally($ings&!v\'(e-images()/negative',
+    '#$kitt#\'siblity#\'t-1960s\'"74%\'captain&&haises&#oal\'$itum\'+nstantinian%*elementary&)mployment&,nlightenment%#gig%&heysel&)istorical',
+    '\'(novation%&munich%#new%*occupation%(petition%,resurrection%*saussurean&&ixteen&&putnik%(tectonic\'#sts\'%tanic&*hatcherism\')erapeutic&.ranslationally',
+    '&(ictorian&#oid$\'auratic$%dates$"en$+gastroscopy&#tei%&lacial%7raduate/post-experience$\'holders\'!e$#ion$$lude$\'natally%\'eonatal',
+    '%$port$%umius#$zgay"*t-painters%%lants#+assium-rich#%belly$%oiler#"ch#/entially-lethal#%holer(!s%#use#!i#\'pourris',
+    '##ten$#oks$&s/head"&uching#%lette$#sen$,ton-le-fylde##ter"#w\'r#*der-coated&#ham&#keg&$less#7ell&mdash;pressburger\'s&\'-cotton',
+    '\'%rspca$*r-coercive&\'holders($uses&%lines&(steering%!/&/gloucestershire&&oxford%(animator%%drive%$exec%#pop%$wise##les',
+    '"0ynting-robertson%%zpass"$znam!#p-3"".1#"44"$d-ta""g1"#rc5!#r80"$abhu#%chuab$%tice\'\'\'o-inert#%emium',
+    '$%stans#(gmademic&&ticist#*ise-tongue#$ncer#)s&amacr;d#%tfall$%tlers\'!y##wer#)yer-books&%books"&e-1625%#985$+adaptations',
+    '%"nd%$pril%(ssembled$#ban%"ig%(ourgeois$-carboniferous%(ollision&)nceptions\'&scious(\'onantal&(ordinate$*designated%#one$\'enquiry',
+    '$\'factory%$ixed$%games%(orbachev$$june$\'logical$)modernist$\'nuptial$(orogenic$(payments%)hylloxera%)ositioned%(rocessed%)ubescents$%sales',
+    '&(nsitised%$hift%\'iberian%%oaked&$cial%%tated(%utory%\'ymbolic$$take%$rnas$&warned%$omen#-amp/processor#(campaign%#ria',
+    '(#ely$&edency$(hallenge$$iado%&nctual%%osity%\'pitancy$,lassic/early$)ognitions%\'lectomy#(datorial$+estinarians$\'iabetic%%cable\'%tions',
+    '&%ments$!s#(headfold$\'ispanic#,implantation$!n#!j$\'udgment#)machandra%#rin%&xillae$*enstrually$%iated#$ndre$%tices',
+    '#&paying$)ossession$,rotachykinin$\'ubertal#+scriptively,$ness+$ists$,ence/absence&\'tation.\'#ist$$idio\'#ums$#que$$s-on%&houses',
+    '&$ngly%#lie%$plan$,tidigitation$,umptuousness#&tibial$%orius$,ranslational$$tied\'!s$#zel#.u&szlig;ischer#"v.$&enters$&iewers',
+    '")ice-based&&output&%range&$tags(#ker+!s)#ing%&/yield%&well\'s$\'kliness##day$$eful$#ing#(est-like#-mary-coloured',
+    '$#e-2$(ordially#+nce-bishops&#dom%&ipalis)+s/directors#+scillianist$\'on-made&,/oxfordshire&0er-of-conscience(/s-of-conscience#&ttwitz#&vacies%-tely-financed&#ism',
+    '#)ze-fights&\'givings%#men"\'ntr.cli"&o-cpsu$(egyptian%,stablishment%%urope*%anism$*federation$"go$)jordanian$&market%#prp$)pakistani',
+    '&)rformance$*rafsanjani$$serb%$lave$\'turkish$&walesa#(activity$&iretic$)rrhythmic#%bates$+l&egrave;me%*em-focused\'+/suggestion\')atisation+#ing',
+    '$\'aryotic$&edings%%edure*!s%\'ss-type$%hazka$&on-ten%$pius$-tosigmoiditis$\'uration#$ddie$!i$"uc&+er/director&)t/benefit',
+    '(&veness#1fessional-quality,+/managerial%!x$-it-generating\'(maximize(%otive&%/loss$\'useness#*gastricsin$#gie$\'nathous$!r%%am(s)\'+-accessible',
+    '(%ional#,hibitionists(#ory#%ietti$%nsias#"je%/ct/dissertation#$kina$&opchuk#&leptic#\'minents%$sed.$-oter/enhancer#.nominalization%&unced.',
+    '$%uclei%+nciamientos#$ofer#+pane/butane&"ol$&ellors%+rty-holding$\'hetical$(ortioner,!s$#per$+rietorships$"yl&#aia&"on',
+    '$&imians$&odists%\'popoeia$\'pection&&rities$(thetists%\'rations#%tdist$+eg&eacute;e.!s%%in(s)\'\'-making\'"/h%,stantization$%istan',
+    '&*scientific%,col/internet%\'rankers%%typed$\'raction#)uv&eacute#%venal#$xima\'(l-distal$$mire$(y/postal""pc"*s-licensed"#tsc"+uning-hooks',
+    '&!k"!w""ys#&taneis!1s&mdash;socialist"#/1s#"55#*valuepoint"$aila#!p#$rias".eudo-classical\'*homophones\'1individualization3"ed',
+    '\'-philosophical\')questions\'(religion()omanesque\'(sciences&%genes&)lymphomas&(platanus\'&yloric&)tachylite\'\'ropheus")ittacosis"#p64#"l1"(r1957+20',
+    '$/ho-anthropology\'(cultural&%candy&&pathia*(ological&(semantic&\'tically%!s$%urium!/t&lcub;110&rcub"$1500"!2"\'eridine"$ions"&olemic',
+    '"*r&num;fnum"#s15"*x/clusters!(ub-crawl$%goers#+lic-affairs\'#law&\'ations.&$ises&,ly-available)(financed&"us"\'gilists""is"#kea',
+    '"(ll-apart%#off&+ut-and-keep&#ver$"ar#!o#"ps#\'trusion"\'miceous#%p-fed$*/powerhead"(nctilios%)uationist&!m#!d',
+    '#%iness$\'shment.#)jab-based#$nets#\'tsagiyn",ppet-masters"\'rchase.##ees#%fleet#\'gatives$\'e-tasks#*ifications$"na$)tanically%(y-on-tap',
+    '#,ple-flowered$)oselessly&#ing##rer#)se-lipped&\'seiners%!y#$tzer"*sh-buttons%$rods$"ov$#tun#!u"#tna#%sches',
+    '#&terill##ure"$xley"*y-st-front!)vc-coated#!u""es"!p""sj!&x/swap!%yamas"&glings#%maeus"$nz22$$enyk',
+    '"&ramint#\'ethrums#(oxenites#\'rhotite##ton#$uvic",thon-hunters!$z092 &q-quit"%sport!#.p."$r.c.!"11"!4"!5',
+    '#"93!#ais",timoutperiod!"b8!"e1""ii!"h4"!5!+m&amp;sup-3!#ods!!q!#rih!6u&eacute;b&eacute;cois*$rcia"%\'elle',
+    '"\'ad-line$+rant-shaped%+ispinulatum&$vium%)upedalism\'#les##eso#$glio#)id-e-azam$"fe$!s#\'litites&+y-conscious#$ndry$(tifiably',
+    '%&oxhead#(rantines$&shigah$)ter-round\'.master-general%\'o-sized&!n%)z-halogen&#ose#+si-biennial((ological&+contractual&,evolutionary&&family\'&ederal',
+    '\'$oans&\'marital)$xist\'\'onastic)%opoly&(national&(parlando&&random&%state\'\'ymbolic(\'ntactic#&y-side"&easier#&becker#*en-empress',
+    '%"ly%%sboro&#hip$#rer#$lque#&nchers$$nell#+stion-marks#$uers#!y$#nte"&ibbled#)ck-change&\'setting\'$tart',
+    '%#ish%$snap#+ncentennial%#unx$"oa$$tals%#ins#&rkiest$"os#&ttance#\'verings#(zmasters""os"#tab!#xe6',
+    '&!z"&dollar"0eacute;formateur)%unies)-volutionnaire#\'circ;ve")oslash;st#&uml;le!\'\'member!)(58)=0.32!(-s-p-c-a!\'.a.a.f."&c.i.a."$d.s.""e.',
+    '"#m.s!,/000/23/1142*#220"!d"!r!%11(2)$"3)"$2(1)"!4"&90(sd)"!a!%23(1)!\'4.23(1)"!0#%00smp',
+    '!&5868\'s"!9!&645/56&!7&!8%"60&!1!$7(2)!$8(1)#"3)!#961!%=0.45$"60$"77$"81',
+    '$!q#)bit-proof\'&warren&$ting&!y#\'inowitz"&ccoons#*e-meetings%\'related$!y##ily#%kages$#mil#%lette"&detzky',
+    '$&calise$*o-collared&(nuclides&\'station%\'/stereo%*activities%\'biology%4diffusion-television%\'larians%\'physics%*therapists#/ley/oxfordshire#\'on-rich#%stadt#"yr',
+    '##isi"\'ffertys$\'ishness$$ling#$idah"$ggie##hip#"in#"ne#)o&ucirc;t"*il-mounted$#bus\'"es$&ed-off$#men',
+    '%#wet$\'bow-tie$)er-thomas$%suits##sey#"tz")jaobelina#!k"$kers#"ha##sha")llentando$$ings""m-$#air',
+    '#%adier$%hatra#$blas#)khamhaeng##mer##ond#%sgill$"in")ndfontein$$iest%$ness$\'om-walk&,ly-generated#!e#$ford',
+    '&%rover%$land%&rdisk3#"il##ney$"ie#+some-wallis")pscallion")rely-seen##in\'"#say#$heed#$kelf#$nake#&p-like',
+    '$#ers$%ingly##ser#&tokhez$*rellamento"+te-financed%(of-climb$"au#$heby$%mines#*iocinative%(nalizers#&napura#!o##ten',
+    '%$ings"%umann#(nchiness"&vagers#$e-up$\'ningham%$nate%%shead#$ning"&wboned##dan"%ydale#"m.$,ond-berengar&!t',
+    '"\'zorfish!*bg&mdash;1"!m"!p!)c-coupled""pr!\'dbi.log""un"!w!*e-acquaint$*ffirmation$\'ligning$&nalyse)#ing$)ppointing',
+    '#)broadcast#*channelled$&limbed$,oalification&#ted%$mpas%%nnect$\'reative#*dedication%(ployment%(rivation$&ialled%!d%\'rection%)scovering',
+    '$\'mphasis+#ing$%ngine$)xpression#$fill$%ormat#\'granted#$hear#1industrialization%\'jection%#put%(spection&&urance%(tegrated%)vestigate',
+    '#)launching$\'itigate%#ves$\'ocating%%oking##mix#/nationalisation#*occupation(!y\'!r$\'ffended$)rganizing$!s#(painting$&lanted',
+    '##ran$\'egulate%(hearsing#(schedule$\'ealable%$cure)!d$#its#&taking$$ells%$nder$#ied$&rained$#une#&unions',
+    '#(writable\'"es"#/os"!1"!6"#:at"&absorb#&chings$&quaint#*der/viewer&+s/listeners$)ing-rooms($wise\'(/writing$&me.doc',
+    '$&option$(y-fitted&&pasted&&rubbed%%mades#\'gan-era$)gregation#&l-live$"ia%,stic-looking%#ty.#(msbottom#(nimation#&p-hook$)plication',
+    '&)rtionment#)r-mounted%%wheel$#ers$&guards$#ick$$rest#&soners#$vell"\'birther#!o#(uildings"(cabarren$-pitalisations%#ped',
+    '$&ommend##eiv$%nsion%+tly-elected)*introduced$,ption/lounge$.ssion-strapped-%icken\'$vity#*iprocities$"ts#$kord##lad%%imers%$sped',
+    '#,ognises/does$(mmission%#pas$(nception%&dition%)figurable%+siderations%$tras%$vert$+rd/playback#*riminatory$-ystallisation#&torial%)sigmoidal"+d-and-black',
+    '$$card%#oat(!s$\'herring+!s$&leaved&&ttered$$pink$%robed&"se%%umped$)sensitive%&potted$\'wattled#&/brown',
+    '%%ngton#\'escribe(%ption%(ignation#-grave/olympic#&ingote$%rects$(scounted#%kinia#*man/greene$#ore#&onians#.shift/distance#*uplication"$eces',
+    '##gan#"ly##man$)phasizing#\'nacting\'$ment#&rected#(s-davies$+tablishment#*xamination"#f.1%!7$"34#%asten#(erences.',
+    '$(nancings#+lectography%"xa&"ly#"na##old#\'ractile#&ueller$1gee-determination$%sniks"*gimentally$*onal-scale(-/occupational\'#rii)"us',
+    '%"rt#$rade$$ette$\'oupment#,ular-reserve\'%ising&&tions."+habiliation##der",ichensteiner#$mers#%necke%$d-in$$fect&\'station',
+    '$"ga$\'jection$*scriptions%"el%\'talling&\'itution$$voke#)onization#$ssen##zen"!j#)uvenators")lationist&(vization#&eased.',
+    '#$ief.%#ver$+gious-based)$ness##yon"+mbrandthuis)%plein#*easurement#(iniscers$"se&!s#)orsefully$#tes%#ors"\'namings',
+    '#$ford$+rew-paisley#)go-no-kai##nae$%inson#"os#\'t-a-gob\'#van$!a##uka#\'zan-kai"(offended#,rganisation.".p&ecirc;chages#&airmen',
+    '#-eat-flowering$%chage#&lacers#(resentee$&ieving$$obed%(ductives%#ofs#&tilons#1ublican-socialist\'$shes$&gnancy$)rcussions$%tably&%tion.',
+    '\'7s-access-to&lsqb;module"$roof#&unning"&scaled#/earch-intensive$+dimentation$)ttlements$$voir#%hapes#"id%$enza%*ualization$\'liently$)stivities#"ko',
+    '##ole%$vers$%nable$)urce-base)\'seeking($less#&pecify&$t_to$0onsabilit&eacute\'#es.\'(ibilites%"se&\'ibility&"ne#$sort',
+    '$&rainer$%urant"%tablo#*entiveness#%irers#*ranslation\'\'mission$\'eatment%&nching(%ments$+ibalization%)evability()l-failure$)oactivity%&lental',
+    '")v-counter#%.john#%ealer&#led$%rsers&&ioners#*iewability$&lement$%sable%%ional%"ta$*vification#,olucionarias&2tionary-democratic",ward/penalty',
+    '#!i##ley""xy"#yce#!e#-kjav&iacute;k##nes"#zek#"so!"f1!$g540""gf"!s!"h1#!9',
+    '"!6"\'abditis%"om\')yosarcoma#%mnous',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_31 = (
+count_31 = 6694
+
+heads_31 = (
     'belva',
-    'ben-peretz',
-    'bench-seats',
-    'bench-test',
-    'beneficia',
-    'beneficiarius',
-    'benefield',
-    'benefit&mdash;the',
-    'benefit-in-kind',
-    'benetton-ford',
-    'benezek',
-    'bengtsson',
-    'benign-looking',
-    'benigni',
-    'beniston',
-    'benitez',
     'benjamins',
-    'benkhelil',
-    'benner',
-    'bensington',
-    'bensley',
-    'bentonites',
-    'bentside',
-    'benzimidazole',
-    'beobachter',
-    'beorhtnoth',
-    'berard',
-    'bercy',
-    'berdyaev',
-    'beresforde',
-    'bergavenny',
-    'bergersen',
     'berghen',
-    'bergier',
-    'bergmann-borsig',
-    'bergmann-pohl',
-    'bergsgardens',
-    'beri-beri',
-    'berkmann',
-    'berlin-brandenburg',
-    'berlin-dahlem',
-    'berlin-sch&ouml;nefeld',
-    'berlyn',
-    'berm',
-    'bernards',
-    'bernicla',
-    'berridale',
-    'berrien',
     'bersama',
-    'berserker',
-    'berserkers',
-    'bertel',
-    'berthas',
-    'bertini',
-    'bertoni',
-    'berufsverbot',
-    'berwin',
-    'berzelius',
-    'besche',
-    'besharati',
-    'besic',
-    'besshi-style',
-    'best-backed',
-    'best-endowed',
     'best-fitting',
-    'best-informed',
-    'best-intentioned',
-    'best-quality',
-    'best-received',
-    'bestiarius',
-    'bestrides',
-    'bestriding',
-    'beta-adrenergic',
-    'beta-waves',
-    'betchworth',
-    'bete_noire',
-    'bethells',
-    'betrothals',
-    'better-equipped',
-    'better-kept',
     'bettws',
-    'between-subjects',
-    'bewicks',
-    'bewitchments',
-    'bewlay',
-    'bewley/national',
-    'beyrout',
-    'bezalel',
-    'bezani',
-    'bf110c',
-    'bgk009059',
-    'bgqs',
-    'bhargava',
-    'bhatiani',
-    'bhr&ouml;lchain',
-    'bi-grams',
     'bi-plane',
-    'bi-tronics',
-    'biathlon',
-    'biberwier',
-    'bibliomania',
-    'bibliophiles',
-    'biccies',
-    'bicho',
-    'bickham',
-    'bicyclist',
-    'biddock',
-    'bider',
-    'bidgely',
-    'bidmead',
-    'biella',
-    'bierman',
     'biesdorf',
-    'bifta',
-    'bifurcatory',
-    'big-bank',
-    'big-head',
-    'big-mouthed',
-    'big-scale',
-    'big-selling',
-    'big/small',
-    'biggy',
-    'bigley',
-    'bignall',
-    'bigtime',
-    'bijection',
-    'bijrani',
-    'bikesport',
     'bilak',
-    'bilbastro',
-    'bildenden',
-    'billiard-balls',
-    'billie-jean',
-    'billy-o',
-    'biltong',
-    'bimbashi',
-    'bimetallic',
-    'bimson',
-    'binary-accretion',
-    'binding-over',
-    'binge-eating/purging',
-    'binkworthys',
-    'binoculars-camera',
-    'binton',
     'binturong',
-    'binuclear',
-    'bio-energy',
-    'bio-filter',
-    'bio-improvements',
-    'bio-mechanical',
-    'bio-tech',
-    'biocompatible',
-    'biocult',
-    'bioelectric',
-    'biofluids',
-    'biogeographer',
-    'biogram',
-    'bioload',
-    'bioluminescent',
-    'biometrical',
     'biomineralization',
-    'bionumerik',
-    'biopool',
-    'bioreactors',
-    'bioregister',
-    'biosocial',
-    'biosphere/atmosphere',
-    'biospheric',
-    'biotas',
-    'biotechnologies',
-    'biotransformations',
-    'biotypes',
-    'bips-1',
-    'bird-',
-    'bird-droppings',
-    'bird-tables',
     'birefringent',
-    'birgitte',
-    'birkhead',
-    'birkhill',
-    'birney',
-    'birth-pangs',
-    'birth.',
-    'birthdates',
-    'biryukova',
-    'bis(azide)',
-    'bishan',
-    'bishop-elect',
-    'bishop/victim',
-    'bishopdale',
-    'bishopston',
-    'bismail',
     'bit-parts',
-    'bit-plane',
-    'bit-players',
-    'bithiazole',
-    'bitokotipou',
-    'bitor',
-    'bitterfeld',
-    'biweekly',
-    'bizjets',
-    'bjorcklund',
-    'bl370',
-    'blaa',
-    'black-and-blue',
-    'black-and-yellow',
-    'black-backs',
-    'black-banded',
     'black-bordered',
-    'black-cloaked',
-    'black-crowned',
-    'black-footed',
-    'black-garbed',
-    'black-lacquered',
-    'black-leaded',
-    'black-owned',
-    'black-ringed',
-    'black-shawled',
-    'black-suited',
-    'black-veined',
-    'black/red',
-    'blackbrook',
-    'blackburne',
-    'blackish-brown',
     'blackish-red',
-    'blacks-only',
-    'blackwoman',
-    'blackwoods',
-    'bladast',
-    'blahblah',
-    'blaik',
-    'blain-thomson',
-    'blairtum',
-    'blakemere',
-    'blancos',
-    'blandings',
-    'blank-filling',
-    'blanker',
-    'blanketeers',
-    'blann',
     'blasco',
-    'blasphemers',
-    'blasphemes',
-    'blasphemously',
-    'blast-off',
-    'blastopore',
-    'blatt',
-    'blaye',
-    'blcmp',
-    'bleakes',
-    'blechnum',
-    'bledsoe',
-    'bleeker',
-    'blendable',
-    'blende',
-    'bley',
     'bligh-bond',
-    'blimber',
-    'blind-man',
-    'blinkin\'',
-    'blishen',
-    'block-faulting',
-    'blockboard',
-    'blockcnt.smm',
-    'bloemaert',
-    'bloemspruit',
-    'blond-streaked',
-    'blondor',
-    'blood-',
-    'blood-chilling',
-    'blood-coloured',
-    'blood-drenched',
     'blood-loss',
-    'blood-lust',
-    'blood-relatives',
-    'bloodborne',
-    'bloodclot',
-    'bloodfeud',
-    'bloodiness',
-    'bloodlessly',
-    'bloods/crips',
-    'bloodsoaked',
-    'bloodsuckling',
-    'bloody-mouthed',
-    'bloomington',
-    'blow-torch',
-    'blowgun',
-    'blubbed',
     'bludenz',
-    'blue-jeaned',
-    'blue-sensitive',
-    'blue-stocking',
-    'blue-suited',
-    'blue-tailed',
-    'blue/white',
-    'blue/yellow',
-    'blueburst',
-    'bluecoats',
-    'bluejay',
-    'blum-helman',
-    'bluntest',
-    'blurton',
-    'blushingly',
-    'blusterers',
     'blusters',
-    'blyn',
-    'blythburgh',
-    'blythen',
-    'bm240',
-    'bm7',
-    'bmh',
-    'bmrb',
-    'bnr',
-    'bo\'',
-    'boarded-out',
-    'boaster',
-    'boat-like',
-    'boatbuilder',
-    'boatshed',
-    'bobbysox',
     'boccara',
-    'bochel',
-    'bocor',
-    'boda',
-    'bodacious',
-    'bodenmann',
-    'bodens',
-    'bodfari',
-    'bodison',
-    'bodrugan',
-    'body-builders',
-    'body-coloured',
-    'bodyless',
-    'boe/d',
-    'boersma',
-    'boesel',
     'boggle-eyed',
-    'boghall',
-    'bogor',
-    'bograte',
-    'bohinj',
-    'boilersuits',
-    'boiotarchs',
-    'boiron',
-    'boivin/hoyer',
-    'bokra',
-    'bolehyde',
-    'bolitho',
-    'bolkus',
-    'bollmann',
-    'bollore',
-    'bolona',
     'bolshiness',
-    'bolted-on',
-    'boltraffio',
-    'bomb-disposal',
-    'bomb-grade',
-    'bomb-hit',
-    'bomb-ketches',
-    'bombacaceae',
-    'bombed-up',
-    'bombesin',
-    'bon_app&eacute;tit',
-    'bonairiano',
-    'bond-length',
-    'bonde',
-    'bondmaids',
-    'bone-idle',
     'bonfils',
-    'bongu',
-    'bonhill',
-    'bonnell',
-    'bonnybridge',
-    'book-form',
-    'book-houses',
-    'book/gift',
-    'bookful',
-    'booking-hall',
-    'booking-in',
-    'bookkeepers',
-    'bookmen',
-    'bookstand',
-    'boomplaas',
-    'boorstin',
     'boot-and-brushing',
-    'boot-black',
-    'boot-scraper',
-    'booth-clibborn',
-    'bootleians',
-    'bootyman',
-    'boppy',
-    'borassic',
-    'border-opening',
-    'borderway',
-    'borea',
-    'borek',
-    'borg-warner',
-    'borghini',
-    'boringness',
-    'borjon',
     'borlinghaus',
-    'boroevich',
-    'borogoves',
-    'borrett',
-    'borri',
-    'borris',
-    'borrodale',
-    'bos/x',
-    'boscareccia',
-    'bose-einstein',
-    'bossable',
-    'bostick',
-    'bot-flies',
-    'botaurus',
-    'botch-up',
-    'botchwey',
     'bothams',
-    'bother.',
-    'bothmer',
-    'bottcher',
-    'botterman',
-    'bottin',
-    'bottle-washer',
-    'bottom-end',
-    'bottom-feeders',
-    'bottom-knots',
-    'bottoman',
-    'botwin',
-    'bouba',
-    'boubacar',
-    'bouchardeau',
-    'boucherett',
     'bouchers',
-    'boucle',
-    'bouffants',
-    'boufflers',
-    'bouilland',
-    'boullee',
-    'bouloigne',
-    'boults',
-    'boumphrey',
-    'bouncey',
-    'boundaries.',
-    'boundary-maintaining',
-    'boundlessly',
-    'boundstones',
-    'bourgeois-liberal',
-    'bourhill',
     'boutari',
-    'bouteville',
-    'bouveault',
-    'bovelander',
-    'bow-string',
-    'bow-tied',
-    'bow-ties',
-    'bowcase',
-    'bowd/east',
-    'bowd/enstone',
-    'bowd/high',
-    'bowd/milton',
-    'bowd/thame',
-    'bowd/winchester',
-    'bowkett',
-    'bowlfuls',
     'bowlly',
-    'bowron',
-    'box-files',
-    'boxes/parcels',
-    'boxted',
-    'boxworks',
-    'boydell',
-    'boyl',
-    'boyles',
-    'boymans-van',
-    'boysey',
-    'bpexploration',
-    'bpn',
-    'bpo/karajan',
-    'br108',
-    'brackenhole',
     'braco',
-    'bracteatum',
-    'bradmore',
-    'brady-plan',
-    'braggs',
-    'brail\'',
-    'braila',
-    'brain-injured',
-    'brain-teasers',
-    'brainsby',
-    'brainteaser',
-    'brake-van',
-    'brambilla',
-    'bramerton',
-    'brameur',
-    'bramingham',
     'bramson',
-    'branch-tusks',
-    'brandied',
-    'brandsby',
-    'brandstadl',
-    'branestawm',
-    'branfield',
-    'branislav',
-    'brankin',
-    'brannegans',
-    'bransfield',
-    'brantham',
-    'brasileiro',
-    'brassware',
-    'bratwurst',
-    'brauninger',
     'bravais',
-    'braxton',
-    'brayles',
-    'brca1',
-    'brdo',
-    'brdu-labelled',
-    'breadalby',
-    'breadbin',
-    'breadstick',
-    'breadsticks',
-    'breage',
-    'break-downs',
-    'break-fall',
-    'break-off',
-    'breakdancing',
-    'breakell',
     'breakfasters',
-    'brearey',
-    'breast-bone',
-    'breast-high',
-    'breathings',
-    'breckfield',
-    'breckinridge',
-    'brecons',
-    'breedlove',
-    'breeziness',
-    'brefet',
-    'breitkreutz',
-    'brekast',
-    'brenkley',
-    'brents',
-    'bressay',
     'bressey',
-    'bresson',
-    'bressummers',
-    'bretheren',
-    'brett-jones',
-    'bretylium',
-    'bretz',
-    'brewhouses',
-    'brgm',
-    'briac',
-    'brial',
-    'briar/oxfam',
-    'briavel',
-    'briavels/gloucestershire',
-    'brick-work',
-    'brickmakers',
     'bricolage',
-    'briddell',
-    'bridge-deck',
-    'bridgemaster',
-    'bridgestone',
-    'bridgettine',
-    'bridgework',
-    'brief-cases',
-    'brigadistas',
-    'brigandry',
-    'brigantia',
-    'brighstone',
-    'bright-hued',
-    'bright-toned',
-    'brighter-sounding',
-    'brightling',
     'brighty',
-    'brindsley',
-    'bringen',
-    'brinkibon',
-    'brinsworth',
-    'brioude',
-    'brisas',
-    'brislands',
-    'brissot',
-    'bristletails',
-    'britanniae',
-    'british-administered',
-    'british-american',
-    'british-dominated',
-    'british-educated',
-    'british-financed',
     'british-held',
-    'british-indian',
-    'british-soviet',
-    'britsh',
-    'brittanica',
-    'britten-pears',
-    'brittlestars',
-    'brizzolara',
-    'broad-scale',
-    'broadbacked',
-    'broadcrown',
-    'broader-winged',
-    'broadfield',
-    'broadmeadows',
-    'broadmindedness',
-    'broaster',
     'brockhampton/gloucestershire',
-    'broctune',
-    'brodgar',
-    'brodowitz',
-    'broe',
-    'brogans',
-    'brohn',
-    'brohome',
-    'broken-spined',
-    'broken-stripe',
-    'broken-wing',
-    'brokerage/advocacy',
-    'brombergs',
-    'bronchiolar',
-    'bronchopneumonia',
-    'bronchopulmonary',
     'bronislovas',
-    'bronze-coloured',
-    'bronzewings',
-    'bronzy',
-    'brosse',
-    'brothel-keeping',
-    'brother-in-laws',
-    'brotherilkeld',
-    'brotherston',
-    'brothertons',
-    'broubster',
-    'brovet',
-    'brow-beaten',
-    'brown-coloured',
-    'brown-painted',
-    'brown/black',
     'brown/mother',
-    'browning-ferris',
-    'brownness',
-    'brownsberger',
-    'brownsword',
-    'browses',
-    'bruce-mitford',
-    'bruegel',
-    'brueren',
-    'bruinvels',
-    'brujos',
-    'brulee',
-    'brunanburh',
-    'brunnet',
-    'brunswick-l&uuml;neburg',
-    'brush-like',
     'brushmarks',
-    'brushstroke',
-    'brutalise',
-    'brutalization',
-    'brutishly',
-    'bruxner',
-    'bryce-smith',
-    'brymer',
-    'bryn-julson',
-    'bryner',
-    'brynmawr',
-    'bryum',
-    'bs18',
-    'bsd4.3',
-    'bse-infected',
-    'bsja',
     'bslta',
-    'bt-3',
-    'bt6',
-    'bt62',
-    'bt7',
-    'bt9',
-    'buana',
-    'bubble-nesting',
-    'buchis',
-    'buchtel',
-    'bucket-shaped',
-    'buckley-jones',
-    'buckskins',
-    'bucky',
-    'budapest-based',
-    'budisa',
     'budragchaagiyn',
-    'bues',
-    'bueu',
-    'buff-coats',
-    'buffe',
-    'buffish',
-    'buffoonish',
-    'bugga',
-    'bugle-horn',
-    'bugno',
-    'buia',
-    'build.up',
-    'building(s)',
-    'building-materials',
-    'buis',
-    'buitenzorg',
     'buju',
-    'buksch',
-    'bulatov',
-    'bulghar',
-    'bulkily',
-    'bull-calf',
-    'bull-nosed',
-    'bull-terrier',
-    'bullet-ridden',
-    'bullet-shaped',
-    'bullman',
-    'bullwhip',
-    'bully/victim',
-    'bulmershe',
-    'bumblesnouts',
-    'bumhole',
     'bumiputras',
-    'bumpily',
-    'bumptiousness',
-    'bunarkaig',
-    'buncha',
-    'bungalow-style',
-    'bungler',
-    'bunkhouses',
-    'buonaparte',
-    'buoyantly',
-    'buoying',
-    'bura',
-    'burbach',
-    'burbanks',
-    'burdett-coutts',
-    'burgdorf',
     'burge/former',
-    'burghead',
-    'burgmans',
-    'burgonet',
-    'burhinidae',
-    'buriton',
-    'burka',
-    'burkhas',
-    'burland',
-    'burlingame',
-    'burlinson',
-    'burmarc',
-    'burmps',
-    'burnbrae',
-    'burnel',
-    'burnes',
     'burningham',
-    'burnmoor',
-    'burritos',
-    'burrow-mouth',
-    'bursali',
-    'bursky',
-    'bursledon',
-    'burson-marsteller',
-    'burthensome',
-    'burton-upon-trent',
-    'bus-conductor',
-    'bus-station',
-    'busboy',
-    'busch-petersen',
-    'bushes.',
-    'bushfires',
     'bushier',
-    'bushland',
-    'bushplane',
-    'busnes',
-    'busseto',
-    'bussola',
-    'bustillo',
-    'bustitution',
-    'bustline',
-    'busy-bodies',
-    'busy-busy',
-    'busy-ness',
-    'but-i',
-    'but_even',
-    'but_of',
-    'butile',
     'butler/featured',
-    'butler/nuffield',
-    'butoxy',
-    'buttermaking',
-    'buttes',
-    'button-holes',
-    'buttonless',
-    'butuan',
-    'butyrate/glutamine',
-    'buxfield',
-    'buxtons',
-    'buyed',
-    'buying/selling',
-    'buzzard-sized',
-    'buzzie',
-    'bverggg',
     'bvp',
-    'bwanali',
-    'bwd',
-    'by-stander',
-    'byard',
-    'bye-byes',
-    'byelorus',
-    'bylines',
-    'byname',
-    'byne',
-    'bynwerk',
-    'byplay',
-    'bythe',
-    'c%',
-    'c&aacute;diz',
-    'c&dgr;t',
     'c&dollar;1',
-    'c&dollar;2',
-    'c&eacute;spedes',
-    'c&gt',
-    'c&prime',
-    'c\'c',
-    'c+&commat',
-    'c+l+a',
-    'c-230.4',
-    'c-bands',
-    'c-chase',
-    'c-fdfc',
-    'c-labelled',
-    'c-o',
-    'c-ras',
-    'c-reg',
     'c-sat',
-    'c-wing',
-    'c.-in-',
-    'c.-in.',
-    'c.1053&mdash;4',
-    'c.1100',
-    'c.1200',
-    'c.1550',
-    'c.1760',
-    'c.300',
-    'c.460',
-    'c.b',
-    'c.c.r.',
-    'c.l.y.',
-    'c.n.t.',
-    'c.p.g.b.',
     'c.s',
-    'c.s.e.',
-    'c.v',
-    'c.w.s.',
-    'c/00/23/2220',
-    'c/axp',
-    'c/km',
-    'c/sgt',
-    'c172',
-    'c19',
-    'c230',
-    'c47',
-    'c57b1/6',
-    'c:figures',
-    'c_c\'s',
-    'ca-ret',
     'ca19.9',
-    'caase',
-    'cabala',
-    'cabalistic',
-    'cabanellas',
-    'cabe',
-    'cable&amp;wireless',
-    'cable-cutters',
-    'cableway',
-    'cablish',
-    'caccaba',
-    'cacgtg-cyc1-lacz',
-    'cachepot',
-    'caciquismo',
-    'cacklings',
-    'caco',
     'cadanet',
-    'cadbury-schweppes',
-    'caddish',
-    'cadmrs',
-    'caergeiliog',
-    'caergwrle',
-    'caf&eacute;-bar',
-    'cafeti&egrave;res',
-    'cafetiere',
-    'caffyn',
-    'cage-like',
-    'cagily',
-    'cahners',
-    'cahnty',
-    'caiaphas',
-    'cail',
     'caimgorm',
-    'caipira',
-    'cairnhill',
-    'caitriona',
-    'cajuns',
-    'calcifications',
-    'calcifying',
-    'calcination',
-    'calcium-',
-    'calcium-loving',
-    'calcretes',
-    'calcul',
-    'calendulas',
-    'calibanity',
-    'calibrator',
-    'call-girls',
     'callboy',
-    'calleshire',
-    'callie',
-    'calligraphed',
-    'calling-card',
-    'callis',
-    'callused',
-    'calmest',
-    'calmingly',
-    'calmodulin-dependent',
-    'calnan',
-    'calorie-laden',
-    'calorie-reduced',
-    'calow',
-    'calstock',
-    'calypsos',
     'calzada',
-    'cama',
-    'camapign',
-    'cambert',
-    'cambridgeshire-suffolk',
-    'cambuskenneth',
-    'camd',
-    'camel-benetton-ford',
-    'cameraderie',
-    'camerana',
-    'cameraship',
-    'cameron-hyde',
-    'camoens',
-    'camp-dependent',
-    'campanology',
-    'campbellii',
     'camping/accommodation',
-    'campions',
-    'can\'t.',
-    'can/should',
-    'canada/alaska',
-    'canalettos',
-    'canaliculus',
-    'cancan',
-    'cancer-stricken',
-    'cancrizans',
-    'candarlizade',
-    'candelada',
-    'candicans',
-    'candies',
-    'candle-ends',
-    'candle-flames',
     'candleholder',
-    'candless',
-    'candlestand',
-    'candletown',
-    'candy-coated',
-    'canf',
-    'cannara',
-    'canniness',
-    'cannonades',
-    'canonbie',
-    'canonize',
-    'canseco',
-    'cantacuzino',
-    'cantar',
-    'cantel',
-    'cantell',
     'cantle',
-    'cantoni',
-    'cantors',
-    'cantrails',
-    'canvin',
-    'cap-like',
-    'cap/dna',
-    'capable-looking',
-    'capacity-to-act-autonomously',
-    'capel-cure',
-    'caperby',
-    'caperton',
-    'capful',
-    'capital-hungry',
-    'capital-investment',
-    'capital-rich',
     'capital-spending',
-    'capitalist-style',
-    'capitalistically',
-    'capitalizes',
-    'capitis',
-    'capitulations',
-    'capocchiano',
-    'capolla',
-    'cappadocians',
-    'cappers',
-    'cappings',
-    'caprimulgidae',
-    'caprington',
-    'capstone',
-    'captains-regent',
-    'capture.richard',
     'car-components',
-    'car-deck',
-    'car-insurance',
-    'car-jackings',
-    'carabineros',
-    'caradocians',
-    'caramelle',
-    'carapintadas',
-    'caravanserais',
-    'caravelle',
-    'carbin',
-    'carbis',
-    'carbocations',
-    'carbodiimide',
-    'carbofuran',
-    'carbohydrate-rich',
     'carbon-rich',
-    'carbon-zinc',
-    'carbonate-bicarbonate',
-    'carbonica',
-    'carbonylation',
-    'carboxymethyl',
-    'carburton',
-    'carcinomatosis',
-    'card-holders',
-    'card-sharping',
-    'card-sized',
-    'cardiogram',
-    'cardiolipin',
-    'cardioselective',
-    'cardioverter',
-    'cardownie',
     'cardross',
-    'care-work',
-    'career-motivated',
-    'career-wise',
-    'carefull',
-    'carefully-monitored',
-    'caressa',
-    'caretakership',
-    'cargos',
-    'caricaturists',
-    'carinomas',
-    'carinthians',
-    'cariscot',
-    'carlowrie',
-    'carm&eacute',
-    'carmelitas',
     'carmilla',
-    'carnahan',
-    'carnan',
-    'carnera',
-    'carnet',
-    'carnfield',
-    'carnford',
-    'carnie',
-    'carnosaur',
-    'carny',
-    'carolana',
-    'carolgees',
-    'carollers',
-    'carolothon',
-    'carota',
-    'caroused',
     'carpathia',
-    'carpinteria',
-    'carpos',
-    'carriacou',
-    'carrick-anderson',
-    'carrier(s)',
-    'carrier-based',
-    'carriera',
-    'carrigaline',
-    'carrigan',
-    'carro',
-    'carrows',
-    'carry-all',
-    'carstens',
-    'cartels.',
-    'carthorse',
     'cartographical',
-    'cartoon-like',
-    'carttiss',
-    'cartwright-cageby',
-    'caruncle',
-    'carvaj&aacute;l',
-    'caryophyllus',
-    'casadesus',
-    'casares-roach',
-    'casarola',
-    'cascara',
-    'case-notes',
-    'case-reports',
-    'caseley-hayford',
-    'cases/1000',
-    'cash-card',
     'cash-in-hand',
-    'cash-raising',
-    'cash-till',
-    'cashflows',
-    'cashmere/wool',
-    'cashmeres',
-    'cassam',
-    'cassani',
-    'cassone',
-    'cassuto',
-    'casteley',
-    'castelfiorentino',
-    'castelgandolfo',
-    'castelino',
-    'castell&oacute;n',
-    'castle&dollar',
     'castlemead',
-    'castlemorton/worcestershire',
-    'castlerigg',
-    'castoret',
-    'castrati',
-    'casualism',
-    'casualities',
-    'casualty-list',
-    'cat-creature',
-    'cat-walk',
-    'catabolite',
-    'catagories',
-    'catalanists',
-    'catalepsy',
-    'catcall',
-    'catchable',
     'catchup',
-    'cateaton',
-    'catechin',
-    'catedral',
-    'categor',
-    'categories.',
-    'categoriser',
-    'catell',
-    'caterall',
-    'catham',
-    'cathood',
-    'catskill',
-    'cattle-trespass',
-    'catweazle',
-    'caudally',
-    'caulder',
     'caulderwood',
-    'caulkin',
-    'caunce',
-    'causam',
-    'causeless',
-    'caustics',
-    'cavalli-sforza',
-    'cave-like',
-    'cavorts',
-    'cawthorpe',
-    'caz',
-    'cb1',
-    'cbhp',
-    'cbn',
-    'cbsg',
-    'cbso/rattle',
     'cc\'s',
-    'cc1',
-    'ccah',
-    'ccgc(at)',
-    'ccgts',
-    'ccmlr',
-    'ccoa',
-    'ccvs',
-    'cd14',
-    'cd16+56',
-    'cd3-positive',
-    'cd54',
-    'cd59',
-    'cd8+',
-    'cdc2',
-    'cdh7',
     'cdm8fsp',
-    'cdsp',
-    'ceca',
-    'cecelia',
-    'cecere',
-    'cecomm',
-    'cedi',
-    'cedillo',
-    'cedistas',
-    'ceiba',
-    'ceirch',
-    'celebrations.',
-    'celebres',
-    'celetn&aacute',
-    'celina',
-    'cell-counts',
     'cell-free',
-    'celli',
-    'cellier',
-    'cells/&micro;l',
-    'cely',
-    'cement-like',
-    'cemin',
-    'cenac',
-    'cenarth',
-    'cendres-noires',
-    'cengiz',
-    'censuum',
-    'cent-gardes',
-    'cent-plus',
-    'centages',
-    'centavos',
     'centenarii',
-    'centigram',
-    'centimeter',
-    'central-european',
-    'central-peripheral',
-    'centrally-appointed',
-    'centrally-devised',
-    'centre-pieces',
-    'centreway',
-    'ceorge',
-    'cephalapsids',
-    'ceques',
-    'ceran',
-    'ceratites',
-    'cerdas',
-    'cerebroventricular',
     'cerements',
-    'cerenkov',
-    'cernunnos',
-    'cero',
-    'certaldo',
-    'certifiably',
-    'certificate(s)',
-    'certificate/diploma',
-    'certifiers',
-    'cervecera',
-    'cervelat',
-    'ceryle',
-    'cesaro',
-    'cesium',
-    'cespedes',
-    'cesr',
     'cetti',
-    'cf351',
-    'cfc-12',
-    'cftr-dependent',
-    'cg3',
-    'cgas',
-    'cgc',
-    'cgmp-dependent',
-    'cgtp',
-    'ch&acirc;teaubriand',
-    'ch&acirc;telaine',
-    'ch&atilde;o',
-    'ch\'kassians',
-    'ch.11',
-    'ch3',
-    'chabannes',
     'chaca',
-    'chacombe',
-    'chain-gangs',
-    'chain-like',
-    'chainlink',
-    'chair-arms',
-    'chair-back',
-    'chairbacks',
-    'chairmans',
-    'chaise-longues',
-    'chakraborty',
-    'chalet-bungalows',
-    'chalet-type',
-    'chalk-hill',
-    'chalkface',
-    'chalkidians',
     'chalkpit',
-    'challands',
-    'challans',
-    'challe',
-    'challenges.',
-    'chalons-sur-marne',
-    'chalus',
-    'chamberlins',
-    'chamberpot',
-    'chamorros',
-    'champany',
-    'champertous',
-    'champigny-sur-marne',
-    'champlev&eacute',
-    'chanciness',
-    'chanctonbury',
     'chandler/family',
-    'chandrasekhar-xanthopoulos',
-    'chang-wen',
-    'changan',
-    'changchun',
-    'changelessness',
-    'channels.',
-    'chanthu',
-    'chapelle-annexe',
-    'chaperones',
-    'chaplaincies',
-    'chaplinesque',
-    'chaps.',
-    'characias',
-    'characters/units',
-    'charbonnel',
     'charborough',
-    'charcoal-fired',
-    'charge-sheet',
-    'chargeability',
-    'chargeback',
-    'chargeman',
-    'chariot-teams',
-    'charismatically',
-    'charith',
-    'charladies',
-    'charleson',
-    'charlock',
-    'charoseth',
-    'charpoua',
-    'charpoys',
-    'chart-parsing',
     'chat-shows',
-    'chatrio',
-    'chatterers',
-    'chattergee',
-    'chattin',
-    'chattri',
-    'chausses',
-    'chauvency',
-    'chauvigny',
-    'chavalit',
-    'chavannes',
-    'chean-dearg',
-    'cheapens',
-    'cheapie',
-    'cheapjacks',
-    'checchi',
     'chechen-ingush',
-    'check-flights',
-    'check-lists',
-    'checkable',
-    'checked-in',
-    'checkin\'',
-    'checkweigher',
-    'chee-dynamics',
-    'cheer-leaders',
-    'cheese-makers',
-    'cheese.',
-    'chekov',
-    'chelford',
-    'chelmsford-liverpool',
-    'chelmslow',
-    'chelyshev',
     'chemicalization',
-    'chemin&eacute;e',
-    'chemo',
-    'cheni',
-    'cheow',
-    'cherating',
-    'cherbury',
-    'cherif',
-    'chernavin',
-    'chernozemski',
-    'cherry-eater',
-    'chervov',
-    'chesne',
-    'chessel',
-    'chesson',
-    'chest&mdash',
     'chest-beating',
-    'chest/bust',
-    'chetham',
-    'chetley',
-    'chetwode',
-    'chevauch&egrave;e',
-    'cheverel',
-    'chevrolets',
-    'chewings',
-    'chi-dynamics',
-    'chiajei',
-    'chiao',
-    'chiapas',
-    'chib',
-    'chibane',
-    'chicha',
     'chichana',
-    'chichon',
-    'chicky',
-    'chidleys',
-    'chiemsee',
-    'chiepe',
-    'chiff',
-    'chigny-les-roses',
-    'chigoes',
-    'chil',
-    'child-listening',
-    'child-resistant',
-    'child-size',
-    'chilgrove',
-    'chiliastic',
-    'chillingworth',
     'chim&oacute',
-    'chimeria',
-    'chimneypieces',
-    'chimp-like',
-    'china-canada',
-    'chinaglia',
-    'chinamania',
-    'chinley',
-    'chinoluiz',
-    'chintamani',
-    'chiome',
-    'chipata',
-    'chipchester',
-    'chippingfield',
-    'chironomids',
-    'chirurgical',
     'chisenhale',
-    'chisti',
-    'chita',
-    'chitunda',
-    'chkdsk',
-    'chlopas',
-    'chlorophenols',
-    'chlorophyte',
-    'chloropus',
-    'chlumsky',
-    'cho-liang',
-    'choccies',
-    'chocoholic',
-    'chocolatey',
-    'choicer',
-    'choirman',
     'cholangiocarcinomas',
-    'choleri',
-    'cholesteatoma',
-    'cholesterol-lowering',
-    'cholsey/oxfordshire',
-    'chomsmy',
-    'chomutov',
-    'chooz',
-    'choralis',
-    'choreographically',
-    'chorioallantoic',
-    'chorizos',
-    'chorographer',
-    'choucro&ucirc;te',
-    'chowen',
-    'choyjilsurengiyn',
     'christelijke',
-    'christiaan',
-    'christian-name',
-    'christianisation',
-    'christison',
-    'christley',
-    'christlich',
-    'christmas-week',
-    'christocentrism',
-    'chromatinic',
-    'chron.',
-    'chrono',
-    'chronogram',
-    'chronostratigraphical',
-    'chrysallis',
-    'chthamalus',
     'chubbily',
-    'chucker-out',
-    'chudley',
-    'chudnovsky',
-    'chuikov',
-    'chungara',
-    'chunkier',
-    'church-ales',
-    'church-owned',
-    'church/state',
-    'churchfield',
-    'churchfields',
-    'churchlands',
-    'churned-up',
-    'churners',
-    'churr',
     'churred',
-    'chyldes',
-    'chylomicra',
-    'chymistry',
-    'chyrurgion',
-    'cia-backed',
-    'cial',
-    'ciarrapico',
-    'cias',
-    'ciborium',
-    'ciboure',
-    'cibs',
-    'ciccu',
-    'ciceronian',
-    'ciderheads',
-    'cidermakers',
     'cigar-smoke',
-    'cigarette-cards',
-    'ciliata',
-    'ciliates',
-    'cilliers',
-    'cills',
-    'cind',
-    'cine-camera',
-    'cinerarias',
-    'cingulate',
-    'cinnamomea',
-    'cinnamon-scented',
-    'cinnamon.',
-    'cino',
-    'circle-in-the-square',
-    'circles.',
     'circo',
-    'circonscription',
-    'circulators',
-    'circumambulation',
-    'circumcise',
-    'circumnavigations',
-    'cirques',
-    'cisneros',
-    'citable',
-    'citalian',
-    'cited.text.id',
-    'citing.text.id',
-    'citizenships',
-    'city-owned',
-    'city0',
-    'civically',
     'civilianise',
-    'civilisational',
-    'cja',
-    'ck1',
-    'cl&egrave;ry-le-grand',
-    'claas',
-    'clacher',
-    'cladists',
-    'cladogram',
-    'clag',
-    'claggan',
-    'claim.',
-    'claimed.',
-    'claimers',
-    'clam-gallas',
-    'clamming',
     'clangorous',
-    'clanwilliam',
-    'clapdale',
-    'clappersgate',
-    'clarel',
-    'clarities',
-    'clark/reporting',
-    'class\'-party',
-    'class-cultural',
-    'class-names',
-    'class/es',
-    'classmark',
-    'classroom-focused',
-    'classroom.',
-    'clatting',
-    'claudy',
     'clausus',
-    'clavecin',
-    'clavicles',
-    'claw-marks',
-    'clawbacks',
-    'clay-saturated',
-    'clayborn',
-    'claylands',
-    'claystones',
-    'clayton/world',
-    'clayworth',
-    'clean-bowled',
-    'clean-limbed',
-    'cleanish',
-    'clear(x)',
-    'clear-felled',
     'clear-looking',
-    'clearbury',
-    'cleggs',
-    'clein',
-    'clement-jones',
-    'clemmence',
-    'clent',
-    'cleome',
-    'cleomenes',
-    'cleopa',
-    'clerically',
-    'clethrionomys',
-    'clevie',
-    'clickety-click',
-    'clickings',
-    'clientelistic',
     'clifden',
-    'cliff-bound',
-    'cliff-climbing',
-    'cliffing',
-    'cliffline',
-    'clifton-taylor',
-    'cligga',
-    'climbdowns',
-    'clingtight',
-    'clinoptilolite',
-    'clintonians',
-    'clip-joints',
-    'clipsham',
-    'cll.',
-    'cllr.',
-    'clock-towers',
     'clocked-up',
-    'clocksin',
-    'clogged-up',
-    'clohessey',
-    'clohossey',
-    'clomped',
-    'clonally',
-    'clorin',
-    'close-carpeted',
-    'close-fisted',
-    'close-fought',
-    'close-outs',
-    'close-quarters',
-    'close-shaved',
-    'close-textured',
-    'close-together',
     'close-trimmed',
-    'closed-up',
-    'closely-packed',
-    'closers',
-    'clotho',
-    'clotworthy',
-    'cloud-point',
-    'cloud-shadows',
-    'cloud-wreathed',
-    'cloudbank',
-    'cloudier',
-    'cloudscape',
-    'cloudsley-thompson',
-    'cloughmills',
-    'cloughton',
-    'clova',
     'cloven-hoofed',
-    'clover-leaf',
-    'clovio',
-    'clown-like',
-    'cloy',
-    'clsb',
-    'clu',
-    'club-head',
-    'clubfoot',
-    'clubheads',
-    'clubmoor',
-    'cluckings',
-    'cludgie',
-    'clued-up',
-    'clumsiest',
-    'cluniacs',
     'cluster-flowered',
-    'cluttons',
-    'cluytens',
-    'clyma',
-    'cm.918',
-    'cm/second',
-    'cmhns',
-    'cmi\'s',
-    'cmkrnl',
-    'cms7',
-    'cnbr-activated',
-    'cnemial',
-    'co&mdash;operation',
-    'co&ocirc;te',
-    'co&rehy;operation',
-    'co-axial',
     'co-chief',
-    'co-counsellor',
-    'co-editing',
-    'co-equal',
-    'co-expressed',
-    'co-heirs',
-    'co-incidental',
-    'co-inventor',
-    'co-ligated',
-    'co-op&eacute;rative',
-    'co-operativeness',
-    'co-operator',
-    'co-producing',
-    'co-product',
-    'co-tenants',
-    'co.rep.',
     'co1',
-    'coach/air',
-    'coachsmith',
-    'coact',
-    'coagh',
-    'coal-holes',
-    'coalition.',
-    'coalowners',
-    'coalyard',
-    'coan',
-    'coast-road',
-    'coastal.',
-    'coat-and-conduct',
-    'coats-of-arms',
-    'coatsworth',
-    'cobble-stoned',
     'cobbled-together',
-    'cobdenism',
-    'cobnut',
-    'cobol-to-unix',
-    'cobol/2',
-    'coca-growing',
-    'cocaine-sniffing',
-    'coccolith',
-    'cocha',
-    'cock-and-bull',
-    'cock-fight',
-    'cockbird',
-    'cockier',
-    'cockily',
-    'cockrell',
-    'cocksfoot',
     'cocksucker',
-    'cockton',
-    'cocl',
-    'cocotte',
-    'coddenham',
-    'code-compatible',
-    'code-names',
-    'code-sharing',
-    'codefam',
-    'codexes',
-    'cods',
-    'coeffficients',
-    'coelom',
-    'coercivity',
-    'coey',
-    'coffee-lounge',
     'coffin-shaped',
-    'coffman',
-    'cofounder',
-    'cogbill',
-    'cogefar-impresit',
-    'coggin',
-    'coggle',
-    'coggygria',
-    'cogidubnus',
-    'cognitive-instrumental',
-    'cognitivist',
-    'cognitivists',
-    'coherency',
-    'coherentism',
-    'coil-tap',
-    'coincidently',
     'coinfected',
-    'col&eacute;gio',
-    'col1a2',
-    'colbourne',
-    'colbys',
-    'colchicums',
-    'colclough/gloucestershire',
-    'cold-welding',
-    'coldstream-summerson',
-    'colegrave',
-    'colen',
-    'coleridgean',
-    'coleridges',
-    'coliforms',
-    'colimore',
-    'collarbones',
     'colleens',
-    'colligation',
-    'collinearity',
-    'collodion',
-    'collona',
-    'colloquies',
-    'collyweston',
-    'colmar',
-    'colognes',
-    'coloma',
-    'coloniae',
-    'colonies/&micro;g',
-    'colorimetrically',
-    'colour-coordinated',
-    'colour-washed',
-    'coloured-in',
     'colourtalk',
-    'columba\'s-by-the-castle',
-    'columbarium',
-    'columcille',
-    'colwick',
-    'colyer',
-    'com3',
-    'com4',
-    'comala',
-    'comandos',
-    'comborn',
-    'combretaceae',
-    'comdex/comexpo',
-    'comedy-ballets',
-    'comeliness',
-    'comenius',
     'comercio',
-    'comfortable.',
-    'comfortably-off',
-    'comitatus',
-    'comm-calls',
-    'comm-screen',
-    'commande',
-    'commemmorating',
-    'commentary-box',
-    'commerce-raiding',
-    'commerzbank',
-    'commissaire',
-    'commitee',
-    'commitment.',
-    'common-carrier',
-    'common-rooms',
     'commonbase',
-    'commonview',
-    'commset',
-    'communitarianism',
-    'community-minded',
-    'community-policing',
-    'comoediae',
-    'comorienne',
-    'comp&egrave;res',
-    'compa',
-    'compa&ntilde;eros',
-    'compa&ntilde;ia',
-    'compactor',
-    'compair',
-    'compan',
-    'companion-in-arms',
     'comparer',
-    'comparisons.',
-    'compartners',
-    'compasrose',
-    'compassionless',
-    'comper',
-    'competitive-strengths',
-    'complementizer',
-    'completa',
-    'complete2',
-    'completists',
-    'component(s)',
-    'compostable',
-    'comprende',
-    'comptables',
-    'compucom',
     'comput',
-    'computable',
-    'computer-compatible',
-    'computer-dependent',
-    'computer-graphics',
-    'computer-mediated',
-    'computer-services',
-    'computer-usable',
-    'computervertriebs',
-    'computing/physics',
-    'con-rods',
-    'con-tricks',
-    'con_brio',
-    'conatus',
-    'concarneau',
-    'concatenating',
     'concelebrate',
-    'concentrated.',
-    'concept-dependent',
-    'concertation',
-    'conciliatorily',
-    'concini',
-    'concitato',
-    'concordats',
-    'condole',
-    'conduces',
-    'conduciveness',
-    'condyles',
-    'cone-like',
-    'confabulation',
-    'confabulations',
-    'confed',
     'confesse',
-    'confidence-',
-    'configural',
-    'conflict-resolution',
-    'conformability',
-    'conformably',
-    'conformal',
-    'conforment',
-    'conformer',
-    'conformers',
-    'confounder',
-    'confused.',
-    'confusio',
-    'confutation',
-    'confutes',
-    'congas',
     'congeals',
-    'congenially',
-    'congolaise',
-    'conjointly',
-    'conjour',
-    'conjuanco',
-    'conjugals',
-    'conjugations',
-    'conking',
-    'connachan',
-    'connal',
-    'connectin',
-    'connel',
-    'connies',
-    'connotive',
-    'conradian',
     'conroys',
-    'consanguineous',
-    'conscienceless',
-    'consciousness.',
-    'consecrations',
-    'conseils',
-    'consensus-building',
-    'consequence.',
-    'consequences.',
-    'conservative/labour',
-    'conservative/speculative',
-    'conservatives.',
-    'consid',
-    'consigners',
-    'consistence',
-    'consociational',
     'consolidationist',
-    'constantinian',
-    'constit.',
-    'constitution-drafting',
-    'constitution.',
-    'constitutional-legal',
-    'construction-related',
-    'consumer-electronics',
-    'consumer/commercial',
-    'consumer/user',
-    'consumptives',
-    'contact_with',
-    'contagiosum',
-    'contains-binary-of&lsqb;module',
-    'contains-source-of&lsqb;module',
-    'contamine',
     'contemn',
-    'contemnors',
-    'contempt.',
-    'contemptibles',
-    'contentful',
-    'contestatory',
-    'context-specifications',
-    'contextless',
-    'contiguously',
-    'continentality',
-    'continuative',
-    'continuators',
-    'contrabass',
-    'contraceptors',
-    'contract-out',
-    'contract-vetting',
     'contractarian',
-    'contractorised',
-    'contractualist',
-    'contrarious',
-    'contrastively',
-    'contrivings',
-    'controlee',
-    'conus',
-    'convenios',
-    'convent-educated',
-    'conversa',
-    'conversation-stoppers',
-    'converses',
-    'convertors',
-    'convexities',
-    'conwell',
     'cony',
-    'coochy',
-    'cook-out',
-    'cook-pots',
-    'coomes',
-    'coommassie',
-    'cooperator',
-    'cooray',
-    'coordinately',
-    'cop8',
-    'coparceners',
-    'copernicanism',
-    'coplans',
-    'coplestone',
-    'coplin',
-    'copmanthorpe',
     'coppe',
-    'copper-clad',
-    'copper-oxide',
-    'copper-phenanthroline',
-    'copperware',
-    'copperwork',
-    'coprophagia',
-    'coprostanol',
-    'copy-paper',
-    'copying-fidelity',
-    'coquelles',
-    'coral-elite',
-    'corallian',
-    'coranka',
-    'corazza',
-    'corbisa',
     'corcus',
-    'cord/cordless',
-    'corderoy',
-    'cordials',
-    'cordion',
-    'cordwainers',
-    'cordy',
-    'core-constituting',
-    'corers',
-    'coricancha',
-    'corish',
-    'corkers',
-    'corkill',
-    'corkscrewed',
-    'corlu',
-    'cormallen',
     'cormican',
-    'corn-on-the-cob',
-    'cornakey',
-    'corner-stones',
-    'corniculatus',
-    'corniest',
-    'cornock',
-    'cornton',
-    'coroma',
-    'coronameter',
-    'coronatus',
-    'corp/apple',
-    'corpach',
-    'corralejo',
-    'correct-word',
-    'correctable',
     'correctitude',
-    'corrente',
-    'correspondence.',
-    'corsicus',
-    'corson',
-    'cortese',
-    'cortevecchio',
-    'cortically',
-    'coru&ncaron;a',
-    'coryell',
-    'cosmologically',
-    'cosquer',
-    'cossies',
-    'cost-increasing',
-    'cost-neutral',
-    'cost-recovery',
     'cost/value',
-    'costanzo',
-    'costigan',
-    'costlessly',
-    'cot&ecirc;tes',
-    'cotchester',
-    'cottar',
-    'cotton-top',
-    'cotton/5%',
-    'cotton/polyester',
-    'cottoney',
-    'cottoning',
-    'coucy',
-    'could_no',
-    'couldna\'',
-    'couldridge',
     'couloirs',
-    'council-approved',
-    'council-wide',
-    'councilman',
-    'count-back',
-    'countability',
-    'counter-adaptations',
-    'counter-attitudes',
-    'counter-bid',
-    'counter-blow',
-    'counter-charge',
-    'counter-coups',
-    'counter-currents',
-    'counter-diagonal',
-    'counter-evidence',
-    'counter-factual',
     'counter-hegemonic',
-    'counter-parallelisms',
-    'counter-parts',
-    'counter-sciences',
-    'counter-stance',
-    'counter-strategies',
-    'counter-subversion',
-    'counter-terrorist',
-    'counter-violence',
-    'counterchances',
-    'counterchange',
-    'countercyclical',
-    'counterpose',
-    'counterstain',
-    'counthrie',
-    'country-dwellers',
     'country-loving',
-    'coupe-coupes',
-    'couped',
-    'coupledom',
-    'courcheval',
-    'course(s)',
-    'course-related',
-    'courser',
-    'court-bouillon',
-    'court-nou&eacute',
-    'court-rooms',
-    'courten',
-    'courter',
-    'courtlands',
-    'cousin-in-law',
-    'couve',
     'coveley',
-    'cover-drives',
-    'coverley',
-    'cow-byres',
-    'cowboy-like',
-    'cowcatcher',
-    'cowdy',
-    'cowhand',
-    'cowherds',
-    'coworker',
-    'cowpeas',
-    'cox/vale',
-    'coxwold',
-    'coyle/reporting',
-    'coziness',
-    'cpac',
     'cpk',
-    'cpl/ir',
-    'cpm/ml',
-    'cpu-intensive',
-    'cpu-specific',
-    'cpu2',
-    'cr&eacute;ation',
-    'cr&ecirc;pey',
-    'cr/ct',
-    'cr42',
-    'cr42s',
-    'cr9',
-    'crabmeat',
-    'craftier',
-    'craftsmanly',
-    'cragsmen',
     'craigcrook',
-    'craigearn',
-    'craigowan',
-    'craigton',
-    'crambe',
-    'cranbourn',
-    'crane-boulder',
-    'craniofacial',
-    'crankshaw',
-    'crannogs',
-    'crash-helmets',
-    'crassest',
-    'crassidens',
-    'crater-saturated',
-    'cratur',
-    'crawforth',
     'crawlin\'',
-    'crawshaft',
-    'craxton',
-    'crcs',
-    'cream-washed',
-    'creaminess',
-    'creamy-coloured',
-    'creaton',
-    'creatureliness',
-    'credentialism',
-    'credit-raters',
-    'credit/charge',
-    'creditability',
-    'credos',
-    'creedon',
-    'cregan',
     'crell',
-    'crematoriums',
-    'creme_de_menthe',
-    'creole-influenced',
-    'creolised',
-    'cres.',
-    'crescendoed',
-    'cressets',
-    'cretaceous-early',
-    'creuse',
-    'crewneck',
-    'crh',
-    'criancas',
-    'cribbs',
-    'cribyn',
-    'cricket-writers',
     'crime-suppression',
-    'crimewave',
-    'crimsons',
-    'cringe-making',
-    'criolla',
-    'criquette',
-    'crisis-club',
-    'cristino',
-    'cristofani',
-    'criticizable',
-    'crn',
-    'crockets',
-    'crocs',
-    'crodh',
-    'croftman',
-    'croghan',
     'cromartie',
-    'cromerian',
-    'cromme',
-    'crook/howard',
-    'crookham',
-    'crop-headed',
-    'cropton',
-    'croquette',
-    'croslets',
-    'cross&rehy;community',
-    'cross-addictions',
-    'cross-area',
-    'cross-bencher',
-    'cross-benchers',
-    'cross-checks',
-    'cross-competition',
     'cross-county',
-    'cross-directorships',
-    'cross-eyes',
-    'cross-gender',
-    'cross-lighting',
-    'cross-linguistic',
-    'cross-phase',
-    'cross-pieces',
-    'cross-point',
-    'cross-pollinated',
-    'cross-racial',
-    'cross-refers',
-    'cross-sectionally',
-    'cross-voting',
-    'cross-walls',
-    'cross-ways',
     'cross/36',
-    'crossbelts',
-    'crossbenchers',
-    'crossbill',
-    'crossborder',
-    'crossbowman',
-    'crossgates',
-    'crosshairs',
-    'crossing-points',
-    'crossings-out',
-    'crossopterygii',
-    'crosspieces',
-    'crosstrees',
-    'crostyx',
-    'crosville',
-    'croswell',
     'crot',
-    'croteau',
-    'crotoy',
-    'crough',
-    'crown-in-parliament',
-    'crownhill',
-    'crownhold',
-    'croxley',
-    'crp-dna',
-    'crtra',
-    'crucians',
-    'cruck-framed',
-    'cruiser-racer',
-    'crume',
-    'crunchem',
-    'crunchers',
     'crupp',
-    'crust-like',
-    'crvenkovski',
-    'cryoscopic',
-    'cryptology',
-    'crystaleyes',
-    'crystallizable',
-    'csaws',
-    'csms',
-    'ct11',
-    'ct20',
-    'ct61',
-    'ctb',
-    'cto',
-    'ctools960',
-    'ctx',
     'cu.metres',
-    'cuadra',
-    'cubbin',
-    'cubbitts',
-    'cuckoo-pint',
-    'cuculus',
-    'cudbird',
-    'cuenca',
-    'cuffey',
-    'culdrose',
-    'culham/harwell',
-    'culligan',
-    'cullimore',
-    'cullompton',
-    'cult-statues',
-    'cultishness',
     'culturalism',
-    'culture\'',
-    'culture-dependent',
-    'culture-hungry',
-    'culture-shock',
-    'cultures.',
-    'cumberworth',
-    'cumbric',
-    'cumming-bruce',
-    'cundall',
-    'cundinamarca',
-    'cunninghams',
-    'cunnliffe',
-    'cup-painters',
-    'cupellation',
-    'cupfuls',
     'cuprazin',
-    'curbage',
-    'cure-alls',
-    'curiousity',
-    'curling-tongs',
-    'curly-toed',
-    'curtailments',
-    'curtain-raisers',
-    'curticei',
-    'curtis/wiltshire',
-    'curtiz',
-    'curtseyed',
-    'curve.',
-    'cusano',
-    'cushnahan',
-    'cusi',
     'cuspidata',
-    'cuspidatum',
-    'custance',
-    'custodier',
-    'custom-configured',
-    'custom-wound',
-    'customer-orientation',
-    'customizable',
-    'custumale',
-    'cut-sheet',
-    'cut-throats',
-    'cutforth',
-    'cutileiro',
-    'cutilheiro',
-    'cvd',
-    'cvl',
     'cwichelm',
-    'cwmbach',
-    'cwrt',
-    'cwts',
-    'cwts.',
-    'cxi',
-    'cxvi',
-    'cxxiv',
-    'cxxvii',
-    'cxxxviii',
-    'cyaneus',
-    'cyanogenesis',
-    'cybercart',
-    'cybercranker',
-    'cyberdelic',
-    'cyborged',
     'cycad-like',
-    'cycle-friendly',
-    'cycle-ways',
-    'cycles/minute',
-    'cyclodextrin',
-    'cyclodextrins',
-    'cyclopes',
-    'cyclothymia',
-    'cyclothymic',
-    'cyfarwyddwr',
-    'cymmrodorion',
-    'cynehelm',
-    'cynodonts',
-    'cyoeraeth',
-    'cyrien',
-    'cyrka',
     'cysteine-rich',
-    'cystometry',
-    'cysyllte',
-    'cytofluorometry',
-    'cytologist',
-    'cytophotometry',
-    'cytoplasmically',
-    'cytostatic',
-    'czarism',
-    'czeizel',
-    'd%',
-    'd&amp;sharp',
-    'd&auml;niken',
-    'd&eacute;b&acirc;cles',
-    'd&eacute;bacle',
-    'd&eacute;coupages',
     'd&eacute;fence',
-    'd&eacute;funte',
-    'd&eacute;j&agrave',
-    'd&eacute;lit',
-    'd&eacute;nouements',
-    'd&gt;0',
-    'd&mdash;1',
-    'd&prime',
-    'd&uacute;n',
-    'd\'&ecirc;tre',
-    'd\'abernon',
-    'd\'achille',
-    'd\'afrique',
-    'd\'albert',
-    'd\'alonzo',
-    'd\'angle',
     'd\'annuzio',
-    'd\'argent',
-    'd\'ars',
-    'd\'aspe',
-    'd\'aure',
-    'd\'aureville',
-    'd\'autres',
-    'd\'avize',
-    'd\'azun',
-    'd\'economie',
-    'd\'elia',
-    'd\'espana',
-    'd\'estime',
-    'd\'etude',
-    'd\'evercy',
-    'd\'harcourt',
     'd\'hazeville',
-    'd\'hulst',
-    'd\'informatique',
-    'd\'iraty',
-    'd\'is&egrave;re',
-    'd\'israeli',
-    'd\'occasion',
-    'd\'olier',
-    'd\'oliveria',
-    'd\'orange',
-    'd\'orliens',
-    'd\'oyley',
-    'd\'sa',
-    'd\'ulm',
-    'd-28',
-    'd-he',
     'd-latch',
-    'd-zine',
-    'd.323',
-    'd.f.m.',
-    'd.g.a.a.',
-    'd.k.',
-    'd.o.e.',
-    'd.s.o.',
-    'd.s.s.',
-    'd/bo',
-    'd1+',
-    'd28',
-    'd35',
-    'd5+',
-    'd6&ins',
-    'da-62',
     'da-na',
-    'daaah',
-    'dabba',
-    'dabcevic-kucar',
-    'dabson',
-    'dach',
-    'dachi',
-    'dacian',
-    'dacres',
-    'dadzie',
-    'daeing',
-    'daejan',
-    'daemonological',
-    'daffies',
-    'daftie',
-    'dagfields',
     'daggett',
-    'dagra',
-    'dahir',
-    'daijin',
-    'daijosai',
-    'dainties',
-    'daintiest',
-    'daises',
-    'dalang',
-    'dalblair',
-    'dalcross',
-    'daleus',
-    'dalgish',
-    'daliesque',
-    'dalits',
-    'dalkon',
     'dall-kirkham',
-    'dalle',
-    'dalles',
-    'dalli',
-    'dalliton',
-    'dalloway',
-    'dalmations',
-    'dalrachney',
-    'dam-making',
-    'damage/loss',
-    'damager',
-    'damari',
-    'damase',
-    'damerell',
-    'damesick',
-    'damit',
     'damman',
-    'dammed-up',
-    'damndest',
-    'damnfool',
-    'dampest',
-    'dan-yr-ogof',
-    'dancad',
-    'dance-forms',
-    'dance-in',
-    'dandeanee',
-    'dandipratt',
-    'danfordiae',
-    'dangaard',
-    'dangermen',
-    'dangerous.',
-    'danglers',
     'dangstein',
-    'danis',
-    'danjou',
-    'danna',
-    'dannatt',
-    'danter',
-    'dantesque',
-    'danthonia',
-    'danube-sava',
-    'daouda',
-    'daphnes',
-    'dapparungsi',
-    'dappy',
-    'dardis',
-    'darell',
-    'daria',
     'dark-bellied',
-    'dark-breasted',
-    'dark-furred',
-    'dark-hued',
-    'dark-pupilled',
-    'dark-shadowed',
-    'darkly-clad',
-    'darron',
-    'dartboards',
-    'darters',
-    'darthea',
-    'darthur',
-    'darvell',
-    'darwinian-style',
-    'dashboards',
-    'daskyleion',
     'dassac',
-    'dassel',
-    'data-processors',
-    'data-set',
-    'data-sets',
-    'data.types',
-    'data/procedure(s)/program(s)',
-    'dataentry',
-    'date-stamping',
-    'date/time',
-    'dats',
-    'dauberville',
-    'daucus',
-    'daud',
-    'daudi',
-    'davaagiyn',
     'davies/deputy',
-    'davies/former',
-    'davies/gloucestershire',
-    'davies/traveller',
-    'davila',
-    'davis/hunt',
-    'davisons',
-    'dawdon',
-    'dawisha',
-    'day&deg;c',
-    'day(s)',
-    'day-boy',
-    'day-boys',
-    'day-dreamed',
-    'day-in',
-    'day-surgery',
     'day/',
-    'day/most',
-    'dayaratne',
-    'daybrook',
-    'daywear',
-    'db-25',
-    'db7',
-    'dbc',
-    'dbf',
-    'dbm',
-    'dc&mdash;id/',
-    'dc8',
-    'dcp600',
-    'dcp624',
-    'dcp628',
-    'dd/lw',
     'dd2',
-    'dd3',
-    'ddin',
-    'de-activation',
-    'de-alignment',
-    'de-centralisation',
-    'de-creation',
-    'de-emphasis',
-    'de-emphasised',
-    'de-emphasizes',
-    'de-hospitalization',
-    'de-icer',
-    'de-merits',
-    'de-oxygenation',
-    'de-rig',
-    'de-stalinisation',
     'de-sulphurisation',
-    'de1',
-    'de200',
-    'de7',
-    'deactivates',
-    'dead-skin',
-    'dead-straight',
-    'deadbeats',
-    'deadlift',
-    'deadliness',
-    'deads',
-    'deafens',
-    'deal-makers',
-    'dealcoholised',
-    'dealer/collector',
-    'dealerboard',
     'dealers/retailers',
-    'dealul',
-    'deamii',
-    'deanplan',
-    'deanship',
-    'deario',
-    'death-genes',
-    'death-grip',
-    'death-traps',
-    'deaton',
-    'debars',
-    'debbo',
-    'debdale',
-    'debenture-holders',
-    'debilities',
-    'debit-card',
     'debouches',
-    'debriefings',
-    'debt-holders',
-    'debt-to-equity',
-    'debts.',
-    'debunks',
-    'decade-old',
-    'decadents',
-    'decasyllabic',
-    'decd.',
-    'decentre',
-    'dechub',
-    'decimator',
-    'decimetre',
-    'decipherment',
-    'decisionless',
     'decisionmakers',
-    'deckland',
-    'deckle-edged',
-    'declaims',
-    'declarers',
-    'decmcc',
-    'decongestants',
-    'deconstructions',
-    'decors',
-    'decreolisation',
-    'decriminalization',
-    'decriminalize',
-    'deed-poll',
-    'deedat',
-    'deedy',
-    'deep-seabed',
     'deep-toned',
-    'deepcut',
-    'deer-stealers',
-    'deerstalkers',
-    'deesside',
-    'defamiliarisation',
-    'defecit',
-    'defencelessness',
-    'defendant(s)',
-    'defendus',
-    'defer/do',
-    'deficiences',
-    'defilers',
-    'definably',
-    'definitiveness',
-    'deformability',
     'deformation-gradient',
-    'defterdar',
-    'deg/s',
-    'deglycosylated',
-    'degradability',
-    'degrease',
-    'degree&lowbar;angle',
-    'degree.',
-    'dehiscence',
-    'dehmelt',
-    'dehomosexualisation',
-    'dehydroxylation',
-    'deichsfischer',
-    'deichtorhallen',
-    'deistic',
-    'dejan',
     'delamore',
-    'deleted.',
-    'delgada',
-    'delicious-looking',
-    'delicto',
-    'delifresh',
-    'delimitis',
-    'delist',
-    'deliverability',
-    'dell\'accademia',
-    'delmarva',
-    'delocalisation',
-    'delphians',
-    'delphin',
-    'delray',
-    'deltastar',
     'delysia',
-    'demagnetization',
-    'demantius',
-    'demarch',
-    'demarkation',
-    'dementia.',
-    'demerit',
-    'demeulemeester',
-    'demidoff',
-    'demineralisation',
-    'demitting',
-    'democractic',
-    'democracy-labour',
-    'democrat-dominated',
-    'democratic-functional',
-    'democrazia',
     'demokratiko',
-    'demonopolisation',
-    'demonstrandum',
-    'demurral',
-    'denderah',
-    'denero',
-    'denhams',
-    'dening',
-    'deniro',
-    'dennes',
-    'dennington',
-    'dennisons',
-    'denniston',
-    'denominationalism',
-    'denouncement',
-    'density-dependent',
     'densmore',
-    'dentally',
-    'dentatum',
-    'deodhar',
-    'deogarh',
-    'deoxyribonucleotides',
-    'department/school',
-    'depasture',
-    'dependency.',
-    'depilatories',
-    'depletes',
-    'deposes',
-    'deposit-refund',
-    'deposit-takers',
-    'depressants',
-    'deputing',
     'deputize',
-    'deramore',
-    'derelict-land',
-    'derelictions',
-    'derestriction',
-    'deria',
-    'deritend',
-    'dermod',
-    'derr',
-    'derryall',
-    'derrygonnelly',
-    'derrylin',
-    'derryvolgie',
-    'dervaux',
-    'dervock',
-    'des.',
     'desanctification',
-    'descale',
-    'descants',
-    'descharreaux',
-    'deseado',
-    'desensitization',
-    'desert-like',
-    'desforges',
-    'desiccator',
-    'desiderio',
-    'design-society',
-    'desirable.',
-    'deskpro/i',
-    'desma',
-    'desnuda',
-    'despoilers',
     'despotopoulos',
-    'dessarry',
-    'dessication',
-    'destabilises',
-    'destatization',
-    'destayala',
-    'destructibility',
-    'desulfobulbus',
-    'detected.',
-    'detective-constables',
-    'determinand',
-    'deterrers',
-    'detriments',
-    'dettingen',
-    'detwyler',
-    'deuche',
     'deuterium-tritium',
-    'devastating-looking',
-    'devastations',
-    'developmentalism',
-    'deveraux',
-    'deviances',
-    'deviancies',
-    'devicehigh=c',
-    'devil-worshippers',
-    'devill',
-    'devin',
-    'devisers',
-    'dew-drops',
-    'dewpoint',
-    'dezallier-d\'argenville',
-    'dezincification',
     'df118',
-    'df=4',
-    'dfc.',
-    'dfl.3',
-    'dfmv',
-    'dg-x',
-    'dg1',
-    'dguo',
-    'dh5&agr',
-    'dhc-3',
-    'dhomhnaill',
-    'dhurries',
-    'di\'s',
-    'diabolexpo',
-    'diacritical',
-    'diad',
     'diadema',
-    'diagnostica',
-    'dialler',
-    'diamagnet',
-    'diamino',
-    'diamondwood',
-    'diamorph',
-    'diane-louise',
-    'diarra',
-    'diarrhoeic',
-    'diastase',
-    'diavolo',
-    'diaz-abaya',
-    'diaz-briquets',
-    'dibba',
-    'dibona',
     'diccon',
-    'dichotomously',
-    'dickel',
-    'dickell',
-    'dickson-clarke',
-    'dicots',
-    'dicotyledons',
-    'dictations',
-    'dictenophiura',
-    'diddiums',
-    'diddling',
-    'didone',
-    'die/i',
-    'died.we',
-    'dienes',
-    'dieside',
     'diet/exercise',
-    'diethylamide',
-    'diethylcarbamazine',
-    'dietotectalitis',
-    'differentia',
-    'difficuit',
-    'difficuities',
-    'diffidatio',
-    'diffusional',
-    'diffusionary',
-    'digestif',
-    'digitalk',
-    'digitel',
-    'digitize',
-    'digitizers',
-    'diglyceride',
     'digyna',
-    'diii-digested',
-    'dil',
-    'dilator',
-    'dildoes',
-    'dilly-dallying',
-    'dimensionally',
-    'dimer-dimer',
-    'dimerize',
-    'dimidiatus',
-    'dimsey',
-    'dindorf',
-    'dinero',
-    'dingoes',
-    'dining-',
-    'dining-area',
     'dinkelsb&uuml;hl',
-    'dinner-service',
-    'dinner/dance',
-    'dinnerstein',
-    'dinosaur-mania',
-    'dinting',
-    'dinucleotide-based',
-    'diog',
-    'dionys',
-    'dioptres',
-    'dioxazine',
-    'diplotene',
-    'dipslope',
-    'dipsomaniac',
-    'diptech',
-    'dipteran',
     'dipterocarp',
-    'dipterocarpaceae',
-    'direct-sales',
-    'directedness',
-    'directement',
-    'direction-finders',
-    'director(s)',
-    'director/oxford',
-    'director/producer',
-    'director/social',
-    'directory/directory',
-    'dirigibles',
-    'dirt-cheap',
-    'dirties',
-    'dirzo',
-    'disability/ageing',
     'disafforest',
-    'disapplications',
-    'disappointing.',
-    'disapprovals',
-    'disassembling',
-    'disbelievers',
-    'disciple-ship',
-    'disciplina',
-    'disco-bar',
-    'discobolus',
-    'discocam',
-    'discographical',
-    'discoidal',
-    'disconfirmable',
-    'disconformable',
-    'discordances',
     'discors',
-    'discourse.',
-    'discriminants',
-    'discriminately',
-    'discriminatingly',
-    'discussable',
-    'disease-carrying',
-    'disengages',
-    'disgustingness',
-    'dish(es)',
-    'dishonouring',
-    'disimpaction',
-    'disinheriting',
-    'disinvest',
-    'disjunctures',
-    'disk-interactive',
     'disloyally',
-    'disnae',
-    'disorderliness',
-    'disperso',
-    'displayer',
-    'displays.',
-    'disponer',
-    'dispositio',
-    'disproportions',
-    'disproven',
-    'disputant',
-    'disputative',
-    'disquietingly',
-    'dissoluble',
-    'distempers',
-    'distensible',
     'distich',
-    'distills',
-    'distractability',
-    'distrait',
-    'distribution-valued',
-    'disturber',
-    'ditherers',
-    'dithianitronium',
-    'dithiazoles',
-    'ditmar',
-    'divagations',
-    'divalent',
-    'divall',
-    'divergenceless',
-    'divergent-dialect',
-    'divergers',
     'diverseness',
-    'diverter',
-    'divests',
-    'diviners',
-    'division-based',
-    'divisional/section',
-    'divisionalization',
-    'divisionism',
-    'divorc&eacute;e',
-    'divulje',
-    'divus',
-    'diwan-i-am',
-    'dixmude',
-    'dixon/former',
-    'dizzier',
-    'djama',
     'djc',
-    'djerma',
-    'djiboutian',
-    'djinns',
-    'dk&ndash;2000',
-    'dl8',
-    'dll',
-    'dlrs',
-    'dm10',
-    'dm12,000',
-    'dm140,000',
-    'dm15',
-    'dm2,000',
-    'dm2.35',
-    'dm2.58',
-    'dm2.82',
     'dm2.9562',
-    'dm2.9737',
-    'dm200',
-    'dm250',
-    'dm250,000,000',
-    'dm3.98',
-    'dm33,000',
-    'dm4.08&ndash;4.12',
-    'dm50',
-    'dm500,000',
-    'dm58',
-    'dm6',
-    'dm65',
-    'dm68',
-    'dm78',
-    'dm800',
     'dm86',
-    'dmowski',
-    'dmv',
-    'dna/5',
-    'dna/rna',
-    'dna:protein',
-    'dnv',
-    'do-able',
-    'do-bama',
-    'do-you-think-he-saw-us',
-    'dobag',
-    'dobra',
-    'dobri',
-    'dobroslawa',
-    'dobrudja',
-    'dobslaff',
     'dockery',
-    'docudrama',
-    'documentary-makers',
-    'dodgier',
-    'dodginess',
-    'doe/dhss',
-    'doenitz',
-    'doesnae',
-    'dog-cart',
-    'dog-days',
-    'dog-rescue',
-    'dog-rose',
-    'dog-sized',
-    'dog-toothed',
-    'doggily',
-    'doghood',
     'dogmatists',
-    'dogmersfield',
-    'doje',
-    'dolcissimo',
-    'dolerites',
-    'dolichos',
-    'dollar-rich',
-    'dolled-up',
-    'dolomitization',
-    'dolour',
-    'dolphinton',
-    'dolton',
-    'domain-containing',
-    'domain.',
-    'doman',
-    'dome-like',
     'domenichino',
-    'dominicana',
-    'don/r',
-    'donaghmore',
-    'donatian',
-    'donets',
-    'doniford',
-    'donmall',
-    'donuel',
-    'doo-lally',
-    'dooleys',
-    'doomstones',
-    'door-mat',
-    'doorway.',
-    'dopants',
-    'doral',
     'dorcan',
-    'dorfmann',
-    'dorita',
-    'dorniers',
-    'dorset-based',
-    'dorsomedial',
-    'dos=high',
-    'dosbarth',
-    'dose-related',
-    'dosimeters',
-    'dostoevskian',
-    'dot-addressable',
-    'dot-blot',
-    'dot-density',
-    'dotingly',
-    'double-aisled',
     'double-bladed',
-    'double-bluff',
-    'double-doored',
-    'double-double',
-    'double-entendres',
-    'double-figures',
-    'double-fisted',
-    'double-flight',
-    'double-labelled',
-    'double-muscled',
-    'double-sovereign',
-    'double-spread',
-    'double-stitched',
-    'double-takes',
-    'double-tested',
-    'double-track',
     'double-tracked',
-    'doucettes',
-    'doughnut-shaped',
-    'doullens',
-    'dourda',
-    'dourness',
-    'douses',
-    'douze',
-    'dover&ndash;ostend',
-    'doveston',
-    'dowanhill',
-    'dowdiness',
-    'dowgate',
-    'dowle',
-    'down-draughts',
-    'down-grade',
     'down-hearted',
-    'down-hole',
-    'down-level',
-    'down-like',
-    'down-loaded',
-    'down-played',
-    'down-rated',
-    'down-size',
-    'down-stroke',
-    'downderry',
-    'downhillers',
-    'downhower',
-    'downplays',
-    'downsides',
-    'downswings',
-    'downthrown',
     'downtrend',
-    'downward-facing',
-    'downward-pointing',
-    'dowsborough',
-    'doyal',
-    'doyles',
-    'doz.',
-    'dpcr',
-    'dpx/2',
-    'dpx/20s',
-    'dr\'gasians',
-    'drabber',
-    'draconic',
-    'dragomans',
-    'dragon-flies',
-    'dragon-like',
     'dragon-riders',
-    'dragon-ships',
-    'dragseth',
-    'drain-pipes',
-    'drainvalve',
-    'drama.',
-    'dramaturgy',
-    'drapolene',
-    'drasty',
-    'draught-proofed',
-    'draughts-person',
-    'draughtsperson',
-    'draughtswoman',
-    'drawerline',
-    'drawing-up',
-    'drawings.',
     'drawn-back',
-    'dreamy-eyed',
-    'dredgings',
-    'drefach',
-    'dresden-based',
-    'dress-style',
-    'dressing-tent',
-    'dretske',
-    'dri/mcgraw-hill',
-    'dribblings',
-    'dried-on',
-    'drinkies',
-    'drinky',
-    'drivable',
-    'drive-inhibition',
-    'driver.',
     'droite',
-    'dromenon',
-    'droogs',
-    'droopy-leaved',
-    'drop-goals',
-    'drophead',
-    'dropniks',
-    'droppable',
-    'droppers',
-    'droppers-in',
-    'dropwise',
-    'drought-tolerant',
-    'druc',
-    'drug-traffickers',
-    'drugs.',
-    'drum-like',
     'drumbeg',
-    'drumclog',
-    'drumhead',
-    'drumm',
-    'drumnadrochit',
-    'drumquin',
-    'drunkeness',
-    'drusillas',
-    'dryfe',
-    'dryopithecin',
-    'dryopithecine',
-    'drys',
-    'ds1',
-    'dsf',
-    'dsos',
-    'dsp32c',
     'dtn',
-    'dtr',
-    'dual-ported',
-    'dual-subject',
-    'duannians',
-    'dubey',
-    'dubiety',
-    'dubito',
-    'duchesne',
-    'duck-like',
-    'duckbill',
-    'duckhams',
-    'duckhurst',
-    'duckies',
-    'ducks.',
-    'duclair',
     'duellists',
-    'dufflecoat',
-    'duffy/charity',
-    'dug-up',
-    'dugonijic',
-    'dulcimers',
-    'duleep',
-    'dulloo',
-    'dumani',
-    'dumb-struck',
-    'dumble',
-    'dumbos',
-    'dumigan',
-    'dumnonia',
-    'dumpton',
-    'dunalister',
     'dunc',
-    'duncannon',
-    'dundas-grant',
-    'dundee1',
-    'dunlossit',
-    'dunseverick',
-    'dunsforth',
-    'dunsilly',
-    'dunum',
-    'dunwell',
-    'dunyveg',
-    'dupli-carver',
-    'duplinet',
-    'duporte',
-    'duppa-miller',
-    'duquesne',
     'dur=0:00',
-    'durational',
-    'duravas',
-    'durbars',
-    'durbeyfields',
-    'durcan',
-    'duric',
-    'durotrigian',
-    'durris',
-    'durston',
-    'dusks',
-    'dust-clouds',
-    'dust-heaps',
-    'dust-sheets',
-    'dustjacket',
-    'dusty-looking',
     'dutch-speaking',
-    'dutchess',
-    'duty&rehy;free',
-    'duval-leroy',
-    'duvane',
-    'duwp',
-    'dweeb',
-    'dwek',
-    'dwelling-houses',
-    'dwiwedi',
-    'dxc5',
-    'dxcc',
-    'dxe5',
-    'dxs101',
-    'dy&eacute',
-    'dyal',
     'dyall',
-    'dyance',
-    'dye-houses',
-    'dye-stuffs',
-    'dyeings',
-    'dykins',
-    'dyle',
-    'dymuniadau',
-    'dynapad',
-    'dynjandi',
-    'dyno-rod',
-    'dynorphin',
-    'dysautonomia',
-    'dysdercus',
-    'dyskaryosis',
-    'dysmap',
     'dysmenorrhoea',
-    'dysoxylum',
-    'dystopia',
-    'dystopias',
-    'dyz1',
-    'dz642',
-    'dzhemilev',
-    'dzhurov',
-    'dzvm',
-    'e%',
-    'e&amp;t',
-    'e&mdash;2',
-    'e&prime',
-    'e&prime&prime',
-    'e-1',
-    'e-75&ndash;6',
     'e-c',
-    'e-cores',
-    'e-day',
-    'e-facts',
-    'e-w',
-    'e.15',
-    'e.7',
-    'e.g.the',
-    'e.gray',
-    'e.w.a.',
-    'e/3',
-    'e/c',
-    'e/l',
-    'e1+',
-    'e110',
-    'e15b',
     'e1a',
-    'e2+',
-    'e4+',
-    'e7.3',
-    'e8+',
-    'ea-16',
-    'eadbert',
-    'eades',
-    'eadfrith',
-    'eagling',
-    'ealdberht',
-    'ealey',
-    'eamer',
-    'eanwulf',
-    'ear-biting',
-    'ear-flaps',
     'ear-lobes',
-    'earhart',
-    'earlham',
-    'earliness',
-    'earlocks',
-    'earlsfield',
-    'early-',
-    'early-1960s',
-    'early-closing',
-    'early-hours',
-    'early-summer',
-    'early-to-mid',
-    'earlycare',
-    'earnable',
-    'ears.',
-    'earsham',
     'earsplitting',
-    'earth-people',
-    'earthlike',
-    'earthward',
-    'earwax',
-    'earwigging',
-    'easdale',
-    'easedale',
-    'easi',
-    'easky',
-    'east-bound',
-    'east-ender',
-    'eastbrook',
-    'easterby-smith',
-    'eastertime',
-    'eastertyre',
     'eastphalians',
-    'eastville',
-    'easy-listening',
-    'easy-to-remember',
-    'eaton-clark',
-    'eb3',
-    'ebbe',
-    'ebbingei',
-    'ebendeng',
-    'ebenhausen',
-    'ebersbach',
-    'eblis',
-    'ebonezer',
-    'ebrington',
-    'ebullioscopic',
-    'eburneum',
     'ec-approved',
-    'ec.',
-    'ec2n',
-    'ec2r',
-    'ec4v',
-    'eccles/chamber',
-    'ecclesbourne',
-    'ecdicius',
-    'echidnas',
-    'echinacea',
-    'echmarcach',
-    'echo-sounding',
-    'echolocate',
-    'ecker',
-    'eckersberg',
-    'eckhardt-gramatt&eacute',
     'eckington',
-    'eckland',
-    'eclac/fao',
-    'eclat',
-    'eco-freaks',
-    'ecoed',
-    'ecolabel',
-    'economic/political',
-    'economico',
-    'economy-minded',
-    'ecori-bamhi',
-    'ecori-digested',
-    'ecotech-approved',
-    'ecotools/oracle',
-    'ecoville',
-    'ectoplasmic',
     'ectotherm',
-    'ecu1,000',
-    'ecu150,000,000',
-    'ecu2,000,000',
-    'ecu500',
-    'ecuatoriana',
-    'ecus-worth',
-    'edaphic',
-    'eddrachillis',
-    'edek',
-    'edelsten',
-    'edenic',
-    'edens',
-    'edge-tool',
-    'edge-tools',
-    'edgier',
     'edholm',
-    'edication',
-    'edin/mid',
-    'edinburgh-london',
-    'edisford',
-    'edit-point',
-    'edit-points',
-    'editress',
-    'edlesborough',
-    'edmonstone',
-    'edoardo',
-    'eds/gfi',
-    'education/promotion',
-    'educe',
-    'edwards/great',
-    'edworthy',
     'eegs',
-    'eeptu',
-    'ef-tu',
-    'ef1&agr',
-    'effectively.',
-    'effectiveness.',
-    'effector-to-target',
-    'effenberg',
-    'effervesces',
-    'efflorescences',
-    'effulgence',
-    'egg-box',
-    'egg-sacs',
-    'egg-sized',
-    'eggbert',
-    'egglayers',
     'eggplants',
-    'eggs.',
-    'egidio',
-    'eglanteria',
-    'eglantyne',
-    'egnatia',
-    'ego-',
-    'ego-centred',
-    'ego-development',
-    'egregiously',
-    'eh16',
-    'eh25',
-    'ehsanul',
-    'eicc',
-    'eicon',
-    'eifion',
     'eight-album',
-    'eight-forty',
-    'eight-legged',
-    'eight-length',
-    'eight-node',
-    'eight-party',
-    'eight-to',
-    'eight-try',
-    'eight-twenty',
-    'eighteen-month-old',
-    'eighteenth/early',
-    'eighty-eighth',
-    'eighty-first',
-    'eighty-ninth',
-    'eiji',
-    'eiker',
     'eilledge',
-    'einsturzende',
-    'eisenhardt',
-    'eitzel',
-    'ejido',
-    'ekes',
-    'ekland-olson',
-    'ekra',
-    'ekrem',
-    'ekwall',
-    'el&iacute;as',
-    'el-arabi',
-    'el-bahri',
-    'el-brajneh',
-    'el-gama\'a',
-    'el-islamiya',
     'el.',
-    'elabe',
-    'elaborative',
-    'elastics',
-    'elbow-room',
-    'elderly-looking',
-    'eldership',
-    'eleanors',
-    'election-time',
-    'electric-powered',
-    'electricians/estate-agents',
-    'electro-classical',
-    'electro-plated',
-    'electro-static',
-    'electrocandle',
-    'electrocardiographs',
     'electrodynamic',
-    'electrolier',
-    'electromagnets',
-    'electronmicroscopic',
-    'electrophoretically',
-    'electrosynthesis',
-    'elegaic',
-    'elemer',
-    'eleniak',
-    'elephas',
-    'eleuthera',
-    'eleven-eleven',
-    'elf-locks',
-    'elfael',
-    'elfin-like',
-    'elfland',
     'elfreda',
-    'eliade',
-    'eliahu',
-    'eliecer',
-    'eliensis',
-    'eliminatory',
-    'eliotic',
-    'elisaveta',
-    'ellados',
-    'ellerslie',
-    'ellersly',
-    'ellipsometry',
-    'ellis-beto',
-    'ellis-evans',
-    'elloe',
-    'elmasri',
     'elmdon',
-    'elminius',
-    'elmridge',
-    'eloi',
-    'elpis',
-    'elroy',
-    'elsheikh',
-    'elstead',
-    'elswhere',
-    'eluant',
-    'eluned',
-    'elvanfoot',
-    'elwin',
-    'em7',
-    'emasculates',
-    'emba',
     'embalment',
-    'embalmment',
-    'embarras',
-    'embl3',
-    'embla',
-    'emblazon',
-    'emblements',
-    'embouchure',
-    'embroilment',
-    'embry-riddle',
-    'embury',
-    'emerton',
-    'emeth',
-    'emic',
-    'emiliani',
-    'emin',
     'emissions.',
-    'emmanuele',
-    'emoting',
-    'emotivists',
-    'emp-name',
-    'empathetically',
-    'empathically',
-    'empathising',
-    'empereurs',
-    'emphasys',
-    'empirical-rational',
-    'emplace',
-    'employee-controlled',
-    'emporiums',
-    'emptinesses',
-    'empty-handed.',
     'emsas',
-    'emulsifying',
-    'en-',
-    'enactor',
-    'enahoro',
-    'enamellers',
-    'enantiotropy',
-    'enard',
-    'enborne',
-    'encashing',
-    'encaustic',
-    'enchiladas',
-    'enchytraeid',
-    'encratic',
-    'end-cretaceous',
-    'end-february',
     'end-may',
-    'end-of-grant',
-    'end-of-june',
-    'end-of-tour',
-    'endemicity',
-    'endemics',
-    'endmembers',
-    'endocuticle',
-    'endometritis',
-    'endopleurites',
-    'endopterygote',
-    'endor',
-    'endorsees',
-    'endquote',
-    'eneme',
-    'enemies.',
     'energizes',
-    'energy-inefficient',
-    'energy-using',
-    'enevoldson',
-    'enfant-b&eacute;ate',
-    'enfantins',
-    'enggaard',
-    'engine-off',
-    'english-held',
-    'english-looking',
-    'english-qualified',
-    'english/german',
-    'english/scottish',
-    'engrossments',
-    'enim',
-    'enkianthus',
     'enlargers',
-    'enne',
-    'enolase',
-    'enoxious',
-    'enrag&eacute;s',
-    'enshrinement',
-    'enshrouds',
-    'enslaves',
-    'entamoeba',
-    'enterally',
-    'enteroglycagon',
-    'enterprise-specific',
-    'entity-hood',
-    'entomologically',
-    'entomopathogenic',
-    'entraining',
     'entralgo',
-    'entrelacements',
-    'entrepreneurially',
-    'entrez',
-    'entrist',
-    'entry-versions',
-    'entryway',
-    'enucleated',
-    'envigado',
-    'envir',
-    'enviromentally',
-    'environment-based',
-    'environmental-impact',
-    'envisions',
-    'enzymically',
-    'eof&num;-1',
     'eoligarry',
-    'eortc',
-    'ep5',
-    'epd',
-    'epicentres',
-    'epicranial',
-    'epidemiologically',
-    'epiphyte',
-    'episiotomy',
-    'epistates',
-    'epistaxis',
-    'epithalamium',
-    'epitomist',
-    'epochbackup',
-    'epoiesen',
-    'eppleworth',
     'epq',
-    'equalisers',
-    'equally-spaced',
-    'equational',
-    'equerries',
-    'equiangular',
-    'equidesa',
-    'equines',
-    'equisignificance',
-    'equivalencies',
-    'equivalent-sized',
-    'er_in',
-    'erastianism',
-    'ered',
-    'erembalds',
-    'eresburg',
     'ergosphere',
-    'erigena',
-    'eris',
-    'erivan',
-    'ermen',
-    'ermintrude',
-    'erna',
-    'erodible',
-    'erotism',
-    'erotogenic',
-    'errantry',
-    'erroll',
-    'ersten',
-    'eructations',
-    'ervin-tripp',
-    'erythroleukaemia',
     'erythroniums',
-    'es-335td',
-    'esbjerg',
-    'esbw',
-    'escapologists',
-    'escob',
-    'escola',
-    'escolmbe',
-    'escort-sized',
-    'escot',
-    'esdi',
-    'ese',
-    'eshelby',
-    'esmereldi',
-    'esmund',
-    'esperado',
     'esperanca',
-    'espiell',
-    'espir',
-    'esplugues',
-    'esrc/dti',
-    'esrc/sports',
-    'essaying',
-    'essays/projects',
-    'esseintes',
-    'essene/zadokite/nazarean',
-    'essentialisms',
-    'estar',
-    'esteb&aacute;n',
-    'estela',
-    'esteren&ccedil;uby',
-    'esterson',
     'estimates.',
-    'estrangements',
-    'estrecho',
-    'estuarial',
-    'estuaries.',
-    'estwicks',
-    'etc\'',
-    'etendard',
-    'etendards',
-    'ethereality',
-    'etherege',
-    'ethogenics',
-    'etre',
-    'ettinger',
-    'etymologist',
-    'etymon',
     'eucharists',
-    'eugeniusz',
-    'euglycaemia',
-    'euglycaemic',
-    'euler-bernoulli',
-    'eulogising',
-    'eurhetemec',
-    'euro-commercial',
-    'euro-diam',
-    'euro-enthusiasts',
-    'euro-pessimists',
-    'euro-sceptical',
-    'euro-swiss',
-    'euro-wide',
-    'euro/domestic',
-    'eurocommercial',
     'euroedi',
-    'euroexpress',
-    'euroissues',
-    'euromark',
-    'europ&eacute;ennes',
-    'europeanists',
-    'europeanization',
-    'eurosites',
-    'euryanthe',
-    'eurythmic',
-    'eusocial',
-    'eustachian',
-    'eusternum',
-    'eutherians',
-    'eutrophus',
-    'euy',
     'euzhan',
-    'evans-kerfoot',
-    'evaporation/solar-flares',
-    'evelyne',
-    'evenhandedness',
-    'evening-dress',
-    'evening/weekend',
-    'event/state',
-    'ever-alert',
-    'ever-cheerful',
-    'ever-curious',
-    'ever-recurring',
-    'ever-so',
-    'ever-wider',
-    'everard/forestry',
-    'everests',
     'everidge',
-    'every-needle',
-    'every-one',
-    'everyb',
-    'everymole',
-    'everywoman',
-    'evetts',
-    'eveything',
-    'evgenii',
-    'evil-minded',
-    'evo-seal',
-    'evostik',
-    'evreux',
-    'evuna',
-    'ewelme/oxfordshire',
-    'ewes/ha',
     'ewias',
-    'ex-all',
-    'ex-archons',
-    'ex-bauhaus',
-    'ex-big',
-    'ex-bishop',
-    'ex-boss',
-    'ex-boxers',
-    'ex-boyfriends',
-    'ex-cadets',
-    'ex-carers',
-    'ex-cell-o',
-    'ex-chelsea',
-    'ex-cigarette',
-    'ex-computer',
-    'ex-contras',
     'ex-corporation',
-    'ex-county',
-    'ex-dealer',
-    'ex-detainees',
-    'ex-digital',
-    'ex-directors',
-    'ex-enemies',
-    'ex-fun',
-    'ex-generals',
-    'ex-girlfriends',
-    'ex-goon',
-    'ex-gravesend',
-    'ex-growth',
-    'ex-hibernian',
-    'ex-home',
-    'ex-ibmer',
     'ex-indian',
-    'ex-internationals',
-    'ex-ira',
-    'ex-maharajah',
-    'ex-married',
-    'ex-matron',
-    'ex-northern',
-    'ex-norwich',
-    'ex-officer',
-    'ex-peasants',
-    'ex-railway',
-    'ex-residents',
-    'ex-resisters',
-    'ex-scottish',
-    'ex-skipper',
-    'ex-slaves',
     'ex-smiths',
-    'ex-special',
-    'ex-spouses',
-    'ex-stock',
-    'ex-sun',
-    'ex-teachers',
-    'ex-university',
-    'ex-ussr',
-    'ex-workmates',
-    'ex/ex',
-    'exalfa',
-    'examinee',
-    'excellences',
-    'exceptions.',
-    'excimer',
-    'exclave',
     'exclusionists',
-    'excoriate',
-    'excu',
-    'exculpated',
-    'exd6',
-    'exeats',
-    'execration',
-    'execrations',
-    'executive-class',
-    'executive-minded',
-    'exegetically',
-    'exequies',
-    'exercal',
-    'exercisers',
-    'exf5',
-    'exhaustiveness',
     'exhibitions/public',
-    'exhortatory',
-    'exhorters',
-    'exocytosis',
-    'exogeneity',
-    'exogeneous',
-    'exospheres',
-    'expatriation',
-    'expe',
-    'expecially',
-    'expectorating',
-    'expediter',
-    'expedito',
-    'expens',
-    'expert(s)',
-    'expertises',
     'experts.',
-    'explicates',
-    'expo\'92',
-    'expositors',
-    'expostulation',
-    'expostulations',
-    'expr',
-    'express-backed',
-    'expresso',
-    'expropriators',
-    'exservicemen',
-    'exsheathment',
-    'extensionist',
-    'extensors',
-    'externalise',
-    'externalizations',
     'externally-determined',
-    'externally-imposed',
-    'exton-smith',
-    'extra-basis',
-    'extra-community',
-    'extra-high',
-    'extra-infinitival',
-    'extra-mental',
-    'extra-parochial',
-    'extra-worldly',
-    'extracellularly',
-    'extracranial',
-    'extract.',
-    'extractable',
-    'extraditions',
-    'extranuclear',
     'extraocular',
-    'extrapyramidal',
-    'extrauterine',
-    'extrinsically',
-    'exulans',
-    'eye-bath',
-    'eye-lashes',
-    'eye-patches',
-    'eye-shadows',
-    'eye-teeth',
-    'eye-testing',
-    'eyebright',
-    'eyeholes',
-    'eyepads',
-    'eykyn',
-    'eynde',
     'eys',
-    'ezekwe',
-    'ezio',
-    'f&aacute;l',
-    'f&amp;d',
-    'f&amp;w',
-    'f&amp;ws',
-    'f&bsol;h',
-    'f&eacute;raud',
-    'f&euml;anor',
-    'f&mdash;ed-up',
-    'f&uuml;rstenburg',
-    'f\'1',
-    'f(a)',
-    'f******',
-    'f*ck',
     'f-j',
-    'f-map',
-    'f-one-eleven',
-    'f-pawn',
-    'f-words',
-    'f.1',
-    'f.2b',
-    'f.3',
-    'f.4',
-    'f.6',
-    'f.a.o.',
-    'f.b.i.h.q.',
-    'f.is',
-    'f.o.b.',
-    'f.o.r',
-    'f.p.',
     'f.s.t.',
-    'f.supp.',
-    'f.t.i.',
-    'f/00/23/2244',
-    'f/00/23/2257',
-    'f/24',
-    'f/29&deg;s',
-    'f/c',
-    'f/s',
-    'f1\'s',
-    'f1,000',
-    'f1-11s',
-    'f10,000',
-    'f100/turbo',
-    'f117a',
-    'f135',
     'f3,000',
-    'f5+',
-    'f5,000',
-    'f6+',
-    'f77',
-    'f=',
-    'f=3',
-    'f=4',
-    'fa-la',
-    'fa-las',
-    'faades',
-    'faassenii',
-    'fab-ms',
-    'fabae',
-    'fabbro',
-    'fabrick',
     'fabry-perot',
-    'fabulation',
-    'fabulous-looking',
-    'face-cream',
-    'faceful',
-    'facelessness',
-    'facer',
-    'facilit&eacute',
-    'facility.',
-    'fact-filled',
-    'fact/belief',
-    'factcard',
-    'factive',
-    'factor-1',
-    'factorials',
-    'factors/invoice',
     'factory-gate',
-    'factory-like',
-    'factory-owners',
-    'facts/symptoms',
-    'faculty/campus',
-    'faffa',
-    'fagus',
-    'fahad',
-    'failsworth',
-    'fainsod',
-    'faint-object',
-    'fair-spoken',
-    'fairbourne',
-    'fairford/gloucestershire',
-    'fairthorne',
-    'fairworld',
     'faite',
-    'fajgembaum',
-    'fakirs',
-    'falias',
-    'falkands',
-    'falkiner',
-    'falklands/malvinas',
-    'falkner',
-    'fallibilities',
-    'falling-off',
-    'falling.',
-    'fallings',
-    'fallswater',
-    'falltricks',
-    'faloon',
-    'false-positive',
     'falsely-run',
-    'falsies',
-    'falsities',
-    'falun',
-    'familiarises',
-    'family-like',
-    'family-size',
-    'fams',
-    'fan-tastic',
-    'fan-vaulted',
-    'fanfare-like',
-    'fang-like',
-    'fanhams',
-    'fans.',
-    'fantasists',
-    'faps',
     'far-infrared',
-    'faraday/industrial',
-    'farceur',
-    'fardis',
-    'farish',
-    'farishta',
-    'farker',
-    'farm-hands',
-    'farm-raised',
-    'farmlife',
-    'farmsteadings',
-    'farmwife',
-    'farnlucher',
-    'farnolls',
-    'farooqui',
-    'farouche',
     'fas107',
-    'fasiladas',
-    'fast-improving',
-    'fast-swimming',
-    'faster-than-light',
-    'fastest-ever',
-    'fastfood',
-    'fat-bellied',
-    'fat-cats',
-    'fatafehi',
-    'fateh',
-    'fatehpur',
-    'fatest',
-    'father\'s',
-    'father-confessor',
-    'father-in-common-law',
     'fathers-in-law',
-    'fathers-to-be',
-    'fathi',
-    'fatless',
-    'fatmir',
-    'fattie',
-    'fattys',
-    'fatuus',
-    'faubourg-st-honor&eacute',
-    'fault-finder',
-    'fault-response',
-    'fauroux',
-    'faussett',
-    'faux-pas',
-    'favola',
-    'favorably',
     'favourability',
-    'faw.2',
-    'fawdon',
-    'faws',
-    'faxmodem',
-    'fayoum',
-    'fazekas',
-    'fazeley',
-    'fb(n)',
-    'fbk',
-    'fc-60',
-    'fc6',
-    'fcd',
-    'fcei',
-    'fchd',
-    'fci',
     'fe*',
-    'fealey',
-    'fear-free',
-    'fear.',
-    'feastday',
-    'feature-film',
-    'feb&ndash;28',
-    'feb&ndash;4',
-    'february-17',
-    'fechner',
-    'fecklessly',
-    'fed-ex',
-    'fedbank',
-    'federates',
-    'fedoras',
-    'feedin\'',
     'feeding-stuffs',
-    'feeding-time',
-    'feeled',
-    'fehlmann',
-    'fehr',
-    'feis',
-    'fela',
-    'felcombe',
-    'feldgendarmen',
-    'feldt',
-    'fellahs',
-    'fellation',
-    'fellfields',
-    'fellow-councillors',
-    'fellow-curates',
-    'fellow-pupils',
     'fellowmen',
-    'fellwalkers',
-    'feloniously',
-    'feltz',
-    'female/male',
-    'femi',
-    'feminisms',
-    'femme-fatale',
-    'fence-mending',
-    'fencot',
-    'fender-like',
-    'fenerbahce',
-    'fenestra',
-    'fenitrothion',
-    'fenniwick',
-    'feo',
     'feraday',
-    'ferebant',
-    'ferentino',
-    'fergy',
-    'feringhees',
-    'fermanagh-south',
-    'fermata',
-    'fermeuse',
-    'fermoys',
-    'fern-rich',
-    'ferney',
-    'fernwood',
-    'ferrari-iba&ntilde;ez-bruni',
-    'ferret-like',
-    'ferri.',
-    'ferriera',
     'ferriers',
-    'ferro-magnetic',
-    'ferrum',
-    'ferrymead',
-    'fert&eacute;-bernard',
-    'fervency',
-    'fervor',
-    'ferzenaar',
-    'fess',
-    'festina',
-    'festiniog',
-    'festungsgraben',
-    'fetich',
-    'fetoscopy',
-    'feuerle',
-    'feuilles',
     'feulgen',
-    'fezziwig',
-    'ff1600',
-    'ff2',
-    'ffitch',
-    'ffps',
-    'ffr1.5',
-    'ffr1.8',
-    'ffr1.9',
-    'ffr11',
-    'ffr21',
-    'ffr24',
-    'ffr25',
-    'ffr50',
-    'ffr55',
-    'ffr60',
     'ffr68',
-    'ffransis',
-    'ffred',
-    'fgr.2',
-    'fiacre',
-    'fianc&eacute;s',
-    'fianc&egrave',
-    'fibre-counted',
-    'fibrillae',
-    'fibroplasia',
-    'fic',
-    'fict',
-    'ficta',
-    'field-pattern',
-    'field/core',
-    'fieldmouse',
     'fiercely-contested',
-    'fieriness',
-    'fifteen-foot-high',
-    'fifteen-second',
-    'fifth-former',
-    'fifth-rate',
-    'fifty-ninth',
-    'fifty-one-year-old',
-    'fifty-rupee',
-    'fifty-third',
-    'fig-leaves',
-    'fig.6',
-    'fig.8',
-    'fig.9.1',
-    'fig.l',
-    'figueras',
     'figure-conscious',
-    'figure-scenes',
-    'figwort',
-    'fijian-born',
-    'filan',
-    'filarial',
-    'file(s)',
-    'filestore',
-    'filet-o-fish',
-    'filiation',
-    'filibustered',
-    'filigrees',
-    'filla',
-    'filled-aperture',
-    'fillenbaum',
-    'fillinelle',
     'fillon',
-    'film-stars',
-    'film/video',
-    'filmland',
-    'filmon',
-    'filmwork',
-    'filoplumes',
-    'filter-feed',
-    'filthy-minded',
-    'filtrates',
-    'fin-de-siecle',
-    'finalit&eacute',
-    'finaly',
-    'financial-market',
-    'financially-stricken',
-    'finch/northamptonshire',
     'finchbacks',
-    'findias',
-    'fine-spun',
-    'finedon',
-    'finely-honed',
-    'finger&lt;s&gt',
-    'fingerpicker',
-    'fingerpickers',
-    'fingerwork',
-    'finishin\'',
-    'finitary',
-    'finkle',
-    'finlandia',
-    'finnart',
-    'finningham',
-    'finnish-soviet',
     'finnmark',
-    'fintastic',
-    'fintry',
-    'finvest',
-    'fir-cones',
-    'fire-and-forget',
-    'fire-back',
-    'fire-cults',
-    'fire-fight',
-    'fire-lighting',
-    'fire-retardant',
-    'firebacks',
-    'firedoors',
-    'firehouse',
-    'firelighter',
-    'firer',
     'firm-edge',
-    'firm-fleshed',
-    'firm-minded',
-    'first-fruits',
-    'first-magnitude',
-    'first-rank',
-    'first-run',
-    'first-strike',
-    'fisclands',
-    'fish-dispersed',
-    'fish-drying',
-    'fish-houses',
-    'fishburger',
-    'fisher/clark',
-    'fisherian',
-    'fishouse',
     'fishpen',
-    'fishtanks',
-    'fitch-rs',
-    'fitcher',
-    'fitted-out',
-    'fitter/armourer',
-    'fittings.',
-    'fitzbillies',
-    'fitzgibbons',
-    'fitzwarren',
-    'five-and-twenty',
-    'five-day-old',
-    'five-dimensional',
-    'five-foot-high',
-    'five-four',
-    'five-hundredth',
     'five-months',
-    'five-movement',
-    'five-phase',
-    'five-ten',
-    'fixtures.',
-    'fizzbang',
-    'fjord-like',
-    'fl&eacute;g&egrave;re',
-    'fl090',
-    'flabbiness',
-    'flacca',
-    'flackery',
-    'fladbury',
-    'flagellating',
-    'flagstaffs',
-    'flagstick',
     'flaine',
-    'flamb&eacute;es',
-    'flambard',
-    'flame-resistant',
-    'flamm',
-    'flammae',
-    'flammea',
-    'flandrian',
-    'flannagan',
-    'flannan',
-    'flaounes',
-    'flash-back',
-    'flash-floods',
-    'flashiest',
-    'flashily',
-    'flashiness',
     'flat-brimmed',
-    'flat-capped',
-    'flat-dwellers',
-    'flat-floored',
-    'flat-leaved',
-    'flat/f',
-    'flatblocks',
-    'flattie',
-    'flatwound',
-    'flavirostris',
-    'flecha',
-    'fleecy-lined',
-    'flehman',
-    'fleissig',
-    'flemish-speaking',
-    'flensburg',
     'flerr',
-    'fleshing-out',
-    'fleshy-fruited',
-    'fleurs-de-lys',
-    'flight-data',
-    'flightcases',
-    'flightdeck',
-    'flightpaths',
-    'flimsily',
-    'flint-bearing',
-    'flintlocks',
-    'flitches',
-    'floc',
-    'flocculent',
-    'flockton',
-    'flogs',
     'floodings',
-    'floogie',
-    'floosies',
-    'floozies',
-    'flop-eared',
-    'floppier',
-    'florabelle',
-    'florale',
-    'florestal',
-    'floret',
-    'florian&oacute;polis',
-    'floriano',
-    'florica',
-    'florimelia',
-    'florrenes',
-    'flotation.',
     'flour-yeast',
-    'flouring',
-    'flow-line',
-    'flower-printed',
-    'flower-scented',
-    'fls',
-    'fls.',
-    'flucytosine',
-    'fluffiness',
-    'fluid-inclusion',
-    'fluid-rock',
-    'fluorescently',
-    'fluorimetrically',
-    'fluorines',
-    'fluorocarbon',
-    'fluorochromes',
     'fluorography',
-    'fluoroscopically',
-    'flush-fitted',
-    'flusher',
-    'fly-cruises',
-    'fly-fronted',
-    'fly-papers',
-    'fly-shit',
-    'flyball',
-    'flyhalf',
-    'flying-boot',
-    'flying.',
-    'flytrap',
-    'fm118',
-    'fmaj7',
-    'fmr',
     'fnp',
-    'fo\'c\'s\'le',
-    'foam-rubber',
-    'focalization',
-    'foco',
-    'fodies',
-    'fog-shrouded',
-    'fogelberg',
-    'fogeyish',
-    'foinstone',
-    'foldable',
-    'foldboat',
-    'folded-up',
-    'foldie',
-    'foligno',
-    'folivores',
     'folk-singers',
-    'folkingham',
-    'folkloric',
-    'folkmoot',
-    'folkstone',
-    'folkstumyren',
-    'follow-my-leader',
-    'follow-up.',
-    'following-on',
-    'following-up',
-    'folsom',
-    'fonblanque',
-    'fondacion',
-    'fondler',
-    'font/da',
-    'fontasy',
     'fontburn',
-    'fontevivo',
-    'food-borne',
-    'food-for-sex',
-    'food-rich',
-    'food/drink',
-    'foodless',
-    'foot-',
-    'foot-army',
-    'foot-in-the-door',
-    'foot-operated',
-    'foot-passengers',
-    'foot-race',
-    'foot-sore',
-    'footbal',
-    'football-related',
     'football.',
-    'footgun',
-    'footpath/cycleway',
-    'footpoint',
-    'fopp',
-    'fopperies',
-    'foquismo',
-    'for&ccedil;as',
-    'forbury',
-    'force-fit',
-    'forced-landing',
-    'forcibles',
-    'forden',
-    'fordun',
-    'fore-limbs',
-    'fore-paws',
     'fore-runner',
-    'fore-wings',
-    'foreau',
-    'forecastle',
-    'forehead.',
-    'foreign-going',
-    'foreign-sounding',
-    'foremothers',
-    'forequarter',
-    'foreros',
-    'fores',
-    'forest-dwellers',
-    'forest-green',
-    'forest-management',
-    'forewarnings',
-    'forfaiter',
     'forgeot',
-    'forgery-proof',
-    'forgivingly',
-    'forgoes',
-    'foria',
-    'foristas',
-    'fork-tailed',
-    'forlarty',
-    'form-meaning',
-    'form.lst',
-    'form/first',
-    'formals',
-    'formational',
-    'formatively',
-    'formigny',
-    'formston',
     'forseb&auml;ck',
-    'forsee',
-    'forsees',
-    'forswearing',
-    'fortalice',
-    'fortereshaye',
-    'fortieths',
-    'fortriu',
-    'forty-one-year-old',
-    'forward/reverse',
-    'forwood',
-    'fossae',
-    'fossicking',
-    'fossil-hunters',
-    'fostin',
-    'fota',
     'fou-fou',
-    'foul-play',
-    'foul-tempered',
-    'foul-ups',
-    'foulrice',
-    'foulsham',
-    'fouly',
-    'fountains-abbott',
-    'four&rehy;fifths',
-    'four-and-twenty',
-    'four-cpu',
-    'four-day-old',
-    'four-fifteen',
-    'four-five',
-    'four-hand',
-    'four-hundred-year-old',
     'four-length',
-    'four-motor',
-    'four-nations',
-    'four-night',
-    'four-o-four',
-    'four-oared',
-    'four-seven-four-seven',
-    'four-time',
-    'four/five',
-    'four/m',
-    'fourteen-mile',
-    'fourteen-two',
-    'fourth-formers',
-    'fourth-ranked',
-    'fourth-term',
-    'foveolar',
     'fowle/oxford',
-    'fowley',
-    'fowlmere',
-    'fownhope',
-    'fox/parents',
-    'foxhole',
-    'foxtrotting',
-    'foys',
-    'fr&eacute;teval',
-    'fr1',
-    'fr72',
-    'fraca',
-    'fractions.',
-    'fractiously',
-    'fragmentarily',
-    'frailness',
     'fran&ccedil;ois-xavier',
-    'francard',
-    'francisation',
-    'franciso',
-    'franco-dutch',
-    'franco-flemish',
-    'franco-imperial',
-    'franco-japanese',
-    'franco-vietnamese',
-    'francophobia',
-    'frangible',
-    'frankenwald',
-    'fransella',
-    'franti&scaron;ku',
-    'frantzuzov',
-    'franzia',
     'fraternally',
-    'fratres',
-    'fraud-proof',
-    'frauenfeld',
-    'frazzle',
-    'frazzling',
-    'frcr',
-    'freak-out',
-    'freaksters',
-    'fredericksburg',
-    'frederiksburg',
-    'fredrikson',
-    'free-agency',
-    'free-basing',
-    'free-line',
-    'free-loaders',
     'free-oxygen',
-    'freeden',
-    'freemont',
-    'freewill',
-    'freewoman',
-    'freezable',
-    'freeze-up',
-    'freeze-ups',
-    'freezobalm',
-    'freightliner',
-    'freke',
-    'fremont-based',
-    'french-british',
-    'french/canadian',
-    'frenkel',
-    'fres/recruitment',
     'fresard',
-    'fresh-',
-    'fresh-tasting',
-    'freshford',
-    'freshly-hatched',
-    'fresnes',
-    'fress',
-    'fretsaw',
-    'fretton',
-    'fri&ndash;sat',
-    'friberg',
-    'friday&ndash;sunday',
-    'frideric',
-    'fridge/freezers',
-    'frieden',
-    'friedmaier',
     'friedmann-like',
-    'friends/relatives',
-    'friesz',
-    'friis-christensen',
-    'frisbees',
-    'fritton',
-    'frizzy-haired',
-    'fro-ings',
-    'frockcoated',
-    'frog-like',
-    'frogatt',
-    'frogmarch',
-    'frogmouth',
-    'froid',
-    'from/to',
-    'frond-like',
     'front-benches',
-    'front-style',
-    'frontboard',
-    'frontinus',
-    'frontoclypeal',
-    'frost-damaged',
-    'frosties',
-    'frostiness',
-    'frostrup',
-    'frowners',
-    'frowsy',
-    'frs1',
-    'fruit-bowl',
-    'fruit-trees',
-    'fruithill',
-    'frumpish',
     'fruticosa',
-    'frutos',
-    'frw',
-    'fry-ups',
-    'fs-77',
-    'fs3000',
-    'fsa-authorised',
-    'fsas',
-    'ft/day',
-    'ft2',
-    'ftb',
-    'ftw',
-    'fuck-me',
-    'fuck-ups',
-    'fuckhead',
-    'fuel-burning',
     'fuel-effect',
-    'fuglafjell',
-    'fuh',
-    'fujicolor',
-    'fujita',
-    'fuk',
-    'fulgencio',
-    'fulgida',
-    'full&rehy;length',
-    'full&rehy;scale',
-    'full-bosomed',
-    'full-bottomed',
-    'full-rigged',
-    'fully&rehy;fledged',
-    'fully-automated',
-    'fully-functional',
     'fully-furnished',
-    'fully-illustrated',
-    'fully-loaded',
-    'fully-restored',
-    'fulvous',
-    'fumblingly',
-    'fumec-al/c',
-    'fumitory',
-    'fun&eacute;railles',
-    'fun-fairs',
-    'fun-seekers',
-    'functional/notional',
-    'functionals',
-    'functus',
-    'funcup',
-    'fundamentality',
     'funkier',
-    'funkiness',
-    'funksters',
-    'funtime',
-    'fur-collared',
-    'fur-covered',
-    'furby/swindon',
-    'furca',
-    'furle',
-    'furnes-ambacht',
-    'furniture-manufacturing',
-    'furor',
-    'furriness',
-    'further-flung',
-    'further/higher',
-    'furusato',
     'fusee',
-    'fusitron',
-    'fusulines',
-    'futures-forward',
-    'futurology',
-    'fuzzily',
-    'fuzzy-wuzzies',
-    'fw14b',
-    'fwc',
-    'fwh',
-    'fx.',
-    'fx4',
-    'fx740',
-    'fy5',
-    'fyned',
-    'fyrs',
     'g&icirc;tes',
-    'g&ouml;ran',
-    'g+a',
-    'g-bjhs',
-    'g-sport',
-    'g-type',
-    'g.a.r.y',
-    'g.i.s',
-    'g.p.s',
-    'g.w.d.',
-    'g/2',
-    'g/cc',
-    'g/m',
-    'g/s/m&amp;sup2',
-    'g12',
-    'g1s',
     'g3+',
-    'g58',
-    'g5ec',
-    'g6pd',
-    'g7\'s',
-    'g7pt8',
-    'ga6000',
-    'gabe',
-    'gabou',
-    'gabrels',
-    'gadafy',
-    'gadbury',
-    'gadded',
-    'gaddi',
-    'gadzooks',
-    'gaederopus',
     'gaeilge',
-    'gael/labour',
-    'gaeldom',
-    'gaerwen',
-    'gafferty',
-    'gagauzia',
-    'gaggenau',
-    'gagliano',
-    'gagra',
-    'gaillardes',
-    'gainesville',
-    'gaini',
-    'gainsharing',
-    'gaisberg',
-    'gak',
-    'galabeah',
     'galactosaemia',
-    'galactoside',
-    'galapas',
-    'galati',
-    'galatian',
-    'galava',
-    'galazov',
-    'galenism',
-    'galettes',
-    'galico',
-    'galien',
-    'galil',
-    'galinski',
-    'galitsky',
-    'gall-stones',
-    'gallas',
     'galleybeggar',
-    'gallicano',
-    'gallicus',
-    'gallimore',
-    'gallinaceous',
-    'gallos',
-    'galoob',
-    'galvanises',
-    'galvanism',
-    'gamaliel',
-    'gambell',
-    'game-park',
-    'game-shows',
-    'gameheads',
-    'gamesplayer',
-    'gamesplayers',
     'gamesters',
-    'gamez',
-    'gamier',
-    'gamil',
-    'gamimune',
-    'gaming-houses',
-    'gamlestaden',
-    'gamma-amino',
-    'gamme',
-    'ganay',
-    'ganesha',
-    'gangbusters',
-    'gangcyclovir',
-    'gangsterish',
-    'ganzouri',
-    'gaositwe',
     'gaperon',
-    'garbage-can',
-    'garbure',
-    'gardener/handyman',
-    'garets',
-    'garizim',
-    'garmendia',
-    'garnitures',
-    'garnons-williams',
-    'garraway/london',
-    'garraway/milton',
-    'garriga',
-    'garrulity',
-    'garrulously',
-    'garrulousness',
-    'garscube',
     'garsia',
-    'garson',
-    'gartnait',
-    'gas-generating',
-    'gas-guzzlers',
-    'gas-rich',
-    'gas-tight',
-    'gasbags',
-    'gashing',
-    'gaskins/gloucestershire',
-    'gasmask',
-    'gasolene',
-    'gastons',
-    'gastrectomies',
-    'gastroenterological',
-    'gastronome',
     'gastroprotective',
-    'gastroschisis',
-    'gastrotomy',
-    'gata',
-    'gata-1',
-    'gate-crashed',
-    'gatecrasher',
-    'gatesheadwhickham',
-    'gatland',
-    'gatoff',
-    'gattrell',
-    'gaudete',
-    'gaulliste',
-    'gaulois',
-    'gault-millau',
-    'gauss/ampere',
     'gaussians',
-    'gavelkind',
-    'gavey',
-    'gawkily',
-    'gawkiness',
-    'gayest',
-    'gaywood',
-    'gaze.',
-    'gazebos',
-    'gazeley',
-    'gazers',
-    'gbenga',
-    'gc-rich',
-    'gc/ms',
-    'gcbs',
-    'gce/cse',
     'gcse&amp;sup1',
-    'gda&nacute;sk',
-    'gdp-liganded',
-    'ge7',
-    'geake',
-    'gear-down',
-    'gebots',
-    'gebreyesus',
-    'gecas',
-    'gedan',
-    'gee-gaws',
-    'geech',
-    'geeco',
-    'geering',
-    'gehrig',
-    'gel.',
     'gelu',
-    'geluch',
-    'gem-cutters',
-    'gem-like',
-    'gembase',
-    'geminorum',
-    'gen&egrave;ve',
-    'gen\'rous',
-    'gender-balanced',
-    'gender-blind',
-    'gender-coded',
-    'generalife',
-    'genes.',
-    'genesius',
-    'genetically-altered',
-    'genetically-mapped',
     'geni&egrave;vre',
-    'genic',
-    'genitality',
-    'genklene',
-    'genned',
-    'gennelmen',
-    'gennevilliers',
-    'genoas',
-    'genre-specific',
-    'gentamycin',
-    'gentle-natured',
-    'gently-spoken',
-    'genuflexion',
-    'genzyme',
-    'geo-demographic',
-    'geochemically',
     'geometrician',
-    'geostatic',
-    'geosynchronous',
-    'geotectonic',
-    'geourgo',
-    'geoworks',
-    'geranium-filled',
-    'geranium-red',
-    'geras',
-    'gerbrand',
-    'gergis',
-    'gering',
-    'german/french',
-    'gerontic',
-    'gerontocratic',
-    'gerousia',
     'gerra',
-    'gerrymander',
-    'gersau',
-    'gershonites',
-    'gesamtkunstwerk',
-    'gesetzt',
-    'gesophola',
-    'gestate',
-    'gesturally',
-    'gesture-based',
-    'get-away-from-it-all',
-    'get-in',
-    'gethyn',
-    'getter',
-    'getti',
-    'getting_fed',
     'geurt',
-    'geydar',
-    'geystliche',
-    'ggcc',
-    'ggfrp3',
-    'gh8',
-    'ghaffir',
-    'ghaill',
-    'ghiordes',
-    'ghiradelli',
-    'ghirei',
-    'ghk',
-    'ghosties',
-    'ghraib',
-    'ghru',
-    'giacalone',
     'gibbard',
-    'gibbiceps',
-    'gibbings',
-    'gibbosus',
-    'gibbs/auctioneer',
-    'gibbsite',
-    'gibco-brl',
-    'giblett',
-    'giblin',
-    'gidleigh',
-    'gidley',
-    'gift-horse',
-    'gigabits',
-    'gigahertz',
-    'gigantically',
-    'gigaswitch',
     'gigondas',
-    'gilberdyke',
-    'giles-in-the-fields',
-    'gilleece',
-    'gilley',
-    'gilliam-knight',
-    'gillotts',
-    'gillyflowers',
-    'gilmans',
-    'gilmor',
-    'gilt-buttoned',
-    'gim&eacute;nez',
-    'gimble',
-    'ginelli',
-    'ginetta',
-    'gingell',
     'ginglymus',
-    'gink',
-    'ginnel',
-    'giorgi',
-    'giorgios',
-    'giorgos',
-    'gioseffo',
-    'gipies',
-    'gipsy-like',
-    'gir&oacute;n',
-    'giraudi&egrave;re',
-    'girdered',
-    'girds',
-    'girl-child',
-    'girl-human',
-    'girl:boy',
     'girondin',
-    'giscours',
-    'gisenyi',
-    'give/take',
-    'giwa',
-    'gjyzari',
-    'gl2',
-    'glaad',
-    'glabella',
-    'glacial-interglacial',
-    'glad-handing',
-    'gladding/gloucestershire',
-    'gladis',
-    'gladkov',
-    'gland-like',
-    'glandula',
     'glandulosa',
-    'glano',
-    'glanrafon',
-    'glantz',
-    'glasby',
-    'glasnostalgia',
-    'glass-makers',
-    'glass-partitioned',
-    'glassmaker',
-    'glassworkers',
-    'glassworm',
-    'glavas',
-    'glaves-smith',
-    'glebelands',
-    'gleberune',
-    'glenboig',
     'glencloy',
-    'glencora',
-    'glendalough',
-    'glendermott',
-    'glengar',
-    'glenmoriston',
-    'glenridding',
-    'glenshiel',
-    'glentworth',
-    'gleyre',
-    'glinne',
-    'glioblastoma',
-    'gln51',
-    'global-scale',
-    'globuli',
-    'glojo',
     'glood',
-    'gloryland',
-    'glottis',
-    'glottochronology',
-    'glotz',
-    'gloucestershire/herefordshire',
-    'glowworms',
-    'glu-ser-gln-glu',
-    'glucksman',
-    'gluckstern',
-    'glucokinase',
-    'glued-in',
-    'glutamatergic',
-    'gluts',
-    'glycerius',
-    'glycerophosphates',
     'glycollic',
-    'glyph',
-    'gmv',
-    'gnaeus',
-    'gnashers',
-    'gnashes',
-    'gnomically',
-    'gnomonic',
-    'go-down',
-    'go-slows',
-    'go1',
-    'goaf',
-    'goal-kickers',
-    'goal-orientated',
-    'goalkicker',
-    'goalmouths',
     'goalpost',
-    'goat-keepers',
-    'goat-like',
-    'goatkeepers',
-    'gobstopper',
-    'gocha',
-    'god-bearer',
-    'god-knows-who',
-    'godchildren',
-    'goddis',
-    'godeau',
-    'goderich',
-    'godfred',
-    'godhood',
-    'godinho',
-    'godparental',
     'godsmark',
-    'godwin/julie',
-    'godwines',
-    'godwinian',
-    'godwinism',
-    'goeldiella',
-    'goeldner',
-    'gogarburn',
-    'goitre',
-    'goju',
-    'golant',
-    'golazo',
-    'golcar',
-    'gold-diggers',
-    'gold-framed',
-    'gold-fringed',
     'gold-painted',
-    'gold-prospectors',
-    'gold-topped',
-    'goldblat',
-    'golde',
-    'golden-white',
-    'golden-winged',
-    'goldenberg',
-    'goldenrail',
-    'goldens',
-    'goldpanners',
-    'goldstine',
-    'goldsworth',
-    'golf-bags',
-    'goliardic',
-    'gollan',
     'golliwogs',
-    'golo',
-    'goma-foutou',
-    'gon&ccedil;alo',
-    'gonad',
-    'gonapophyses',
-    'gongylidia',
-    'goniwe',
-    'gontcharova',
-    'gonz&aacute;les',
-    'gonzalez-casanova',
-    'gonzalez-foerster',
-    'goochie',
-    'good\'n',
-    'good-bad',
-    'good-class',
     'good-lookin\'',
-    'good-oh',
-    'goodstadt',
-    'goodstein',
-    'goodwin/oxford',
-    'goodwin/ross',
-    'goolie',
-    'gorau',
-    'gorbatchev',
-    'gordo',
-    'gordon-somers',
-    'gorie',
-    'gorier',
-    'gorizia',
-    'gormaz',
-    'gornei',
     'gorr',
-    'gorre',
-    'gorrin',
-    'gortex',
-    'goscript',
-    'gosden-trained',
-    'gossipers',
-    'goswami',
-    'gotthold',
-    'gottlob',
-    'gotts',
-    'gouffre',
-    'gough-calthorpe',
-    'goujons',
-    'goulane',
-    'goumba',
     'gourdes',
-    'gourette',
-    'gouri',
-    'gourmont',
-    'gouveneur-generaal',
-    'gov.',
-    'govenment',
-    'governessy',
-    'government-initiated',
-    'government-organized',
-    'government-provided',
-    'government-subsidized',
-    'government-supported',
-    'governor-elect',
-    'goyas',
-    'goyo',
     'gp70',
-    'gpb',
-    'gpiib/iiia',
-    'gr.3',
-    'grace-notes',
-    'grackle',
-    'gradable',
-    'gradacac',
-    'gradara',
-    'gradiometer',
-    'graft-',
-    'graftec',
-    'grafton/oxfordshire',
-    'graham-campbell',
-    'graham-douglas',
-    'graicunas',
     'grainer',
-    'graingers',
-    'gramm-latta',
-    'grammaire',
-    'gran\'pa',
-    'grand-parents',
-    'grand-scale',
-    'grandeurs',
-    'grandi',
-    'grandisquama',
-    'grandkids',
-    'grandmamma',
-    'grandon',
-    'granin',
-    'granite-like',
-    'granitoids',
     'granj',
-    'granolithic',
-    'granovskii',
-    'gransha',
-    'grant-giving',
-    'granuflex',
-    'graph-search',
-    'grapheme-phoneme',
-    'graphics-oriented',
-    'graphplotter',
-    'grasby',
-    'grass-blades',
-    'grass-green',
-    'grass-verge',
-    'grassbox',
-    'grassina',
     'grassmuck',
-    'graters',
-    'gratifies',
-    'gratingly',
-    'gray-nicolls',
-    'grayfields',
-    'grazer',
-    'gready',
-    'greame',
-    'great-great-great',
-    'great-nieces',
-    'great-sounding',
-    'great-tasting',
-    'grebenik',
-    'grechko',
-    'greediest',
     'greek-style',
-    'green-and-white-striped',
-    'green-backed',
-    'green-baize',
-    'green-lipped',
-    'green-topped',
-    'green/yellow',
-    'greenaways',
-    'greenish-blue',
-    'greenleighton',
-    'greenshanks',
-    'greensides',
-    'greensome',
-    'greenstick',
-    'greenstones',
-    'greeny-blue',
     'greeny-grey',
-    'greeter',
-    'gregs',
-    'greiff',
-    'greine',
-    'grelombe',
-    'grenmore',
-    'gretton-watson',
-    'grevillea',
-    'grey-clad',
-    'grey-coated',
-    'grey-headed',
-    'grey-level',
-    'grey/green',
-    'grey/white',
-    'greylaw',
     'greywack&eacute',
-    'gricer',
-    'gridwork',
-    'grievers',
-    'griffith-boscawen',
-    'griffith-jones',
-    'griffith-williams',
-    'grillework',
-    'grimbo',
-    'grimsey',
-    'grimstead',
-    'grimthorpe',
-    'grindley/gchq',
-    'grippers',
-    'grippingly',
-    'grisdale',
     'grisegonelle',
-    'grisliest',
-    'grissom',
-    'gristly',
-    'gritters',
-    'grittier',
-    'grittiness',
-    'gritton',
-    'grizzleys',
-    'gro-bags',
-    'groaner',
-    'grobbins',
-    'grogarry',
-    'grolla',
-    'gromwell',
-    'gronkiewicz-waltz',
     'groomer',
-    'groper',
-    'gross-paying',
-    'grosshans',
-    'grossmann',
-    'grotesquerie',
-    'grouchily',
-    'ground-car',
-    'ground-crew',
-    'ground-line',
-    'groundfloor',
-    'groundwards',
-    'groundwell',
-    'grouts',
-    'grove-stephensen',
-    'growbag',
     'grubworthy',
-    'grue',
-    'grumpier',
-    'grundfest',
-    'grundnorm',
-    'grunenthal',
-    'gruson',
-    'gruzzles',
-    'grylls',
-    'gsb',
-    'gsce',
-    'gsk3',
-    'gsn',
-    'gsrs',
-    'gssg',
-    'gst-dp-1',
     'gst-fusion',
-    'gt-50',
-    'gtg',
-    'gti-r',
-    'gu&icirc;nes',
-    'gu27',
-    'gu4',
-    'guaj&aacute',
-    'guamian',
-    'guanaco',
-    'guanacos',
-    'guangxi',
-    'guarana',
-    'guardianwednesday',
-    'guarura',
-    'gubernaculum',
     'guddling',
-    'gude',
-    'gudmundsson',
-    'guelphic',
-    'guernica\'',
-    'guessing-game',
-    'gugas',
-    'guggenheims',
-    'gugler',
-    'guguletu',
-    'guianensis',
-    'guide-line',
-    'guilbert',
-    'guilden',
-    'guildhalls',
-    'guildhouses',
     'guildmaster',
-    'guilty-looking',
-    'guisarmes',
-    'guisnes',
-    'guitar-pop',
-    'gula',
-    'gulets',
-    'gulielmus',
-    'gull-winged',
-    'gulval',
-    'gum-chewing',
-    'gumma',
-    'gummatous',
-    'gumshield',
-    'gun-carriages',
-    'gun-sloops',
     'guna',
-    'gunboy',
-    'gundog',
-    'gunne',
-    'gunports',
-    'guns.',
-    'gunshop',
-    'gunwhale',
-    'gunzberg',
-    'guofeng',
-    'gurenko',
-    'guretzky-cornitz',
-    'gurevitch',
-    'gurglings',
-    'gurmej',
-    'gurneys',
     'gurrey',
-    'guskind',
-    'gussman',
-    'gustatory',
-    'guttenbruk',
-    'gutterings',
-    'guttiferae',
-    'gutturals',
-    'guy\'s/st',
-    'guzzard',
-    'gwarzo',
-    'gwathmey',
-    'gwinner',
-    'gwom',
-    'gyaku-zuki',
-    'gyi',
     'gyllenhammar',
-    'gympie',
-    'gyn/ecology',
-    'gypsey',
-    'gyres',
-    'gyrostabiliser',
-    'h%',
-    'h&amp;w',
-    'h&auml;rke',
-    'h&eacute;rauts',
-    'h&eacute;ro&iuml;que',
-    'h&ohgr',
-    'h&ouml;tzendorff',
-    'h&uuml;gel',
-    'h-home',
-    'h-k',
     'h.7',
-    'h.8',
-    'h.k.t.c.',
-    'h.l.a.',
-    'h.m.s.o.',
-    'h/ne',
-    'h17',
-    'h197k',
-    'h2-antagonists',
-    'h2o(l)',
-    'h2o2',
-    'h_',
-    'ha\'pence',
-    'ha.',
-    'haaf',
-    'haagen-smit',
     'haagensen',
-    'haakmat',
-    'haarder',
-    'haastrup',
-    'haba',
-    'habel',
-    'habilis',
-    'habilitation',
-    'hablot',
-    'habte',
-    'habu',
-    'hacene',
-    'hachiro',
-    'hackettes',
-    'hacketts',
-    'hackham',
     'had-to',
-    'hadde',
-    'haddenham/buckinghamshire',
-    'hadersdorf',
-    'haeberle',
-    'haeddi',
-    'haeften',
-    'haemaelaeinen',
-    'haemagglutination',
-    'haematin',
-    'haemocoel',
-    'haemocytometer',
-    'haemofiltration',
-    'haemoglobins',
-    'haemoptysis',
-    'haffenecker',
     'hafting',
-    'hagerhai',
-    'haggie',
-    'hagiographer',
-    'hagiographies',
-    'hahl-koch',
-    'haigh-wood',
-    'hail&eacute',
-    'hail-fellow-well-met',
-    'hailama',
-    'haines/nra',
-    'hair-dos',
-    'hairbreadth',
-    'hairshirt',
-    'hairstylist',
-    'hairy-chested',
     'haisbro',
-    'haisch',
-    'hajduk',
-    'hajrich',
-    'hakurk',
-    'hala',
-    'halai',
-    'halawa',
-    'halder',
-    'half-a-hundred',
-    'half-a-minute',
-    'half-armed',
-    'half-barrels',
-    'half-bricks',
-    'half-burned',
-    'half-chances',
     'half-circles',
-    'half-courses',
-    'half-covering',
-    'half-derelict',
-    'half-domes',
-    'half-dragged',
-    'half-dream',
-    'half-dried',
-    'half-drunken',
-    'half-dry',
-    'half-eleven',
-    'half-figures',
-    'half-five',
-    'half-glasses',
-    'half-good',
-    'half-healed',
     'half-hitch',
-    'half-moons',
-    'half-nude',
-    'half-out',
-    'half-promised',
-    'half-sentences',
-    'half-six',
-    'half-smothered',
-    'half-steps',
-    'half-suffocated',
-    'half-tones',
-    'half-walked',
-    'half-wild',
-    'half-wits',
-    'half-words',
-    'half-years',
     'halhed',
-    'hallard',
-    'hallauer',
-    'hallelujahs',
-    'hallewell',
-    'hallsbury',
-    'hallucinatorily',
-    'halmai',
-    'halmonds',
-    'haloing',
-    'halsby',
-    'halter-necked',
-    'halved.',
-    'halwes',
-    'hamadani',
-    'hamawaki',
     'hamilton-renwick',
-    'hamishpachah',
-    'hammer-on',
-    'hammerfest',
-    'hammerklavier',
-    'hammill',
-    'hammocked',
-    'hammond-heath',
-    'hammoud',
-    'hamms',
-    'hamoud',
-    'hamouda',
-    'hamster-like',
-    'hanbo',
-    'hanbys',
-    'hance/atomic',
     'hand-axes',
-    'hand-blocked',
-    'hand-dug',
-    'hand-enamelled',
-    'hand-hewn',
-    'hand-lettered',
-    'hand-polished',
-    'hand-setters',
-    'hand-tailored',
-    'hand-thrown',
-    'hand-tied',
-    'hand-tinted',
-    'hand-warmer',
-    'handed-down',
-    'handelsblad',
-    'handfork',
     'handforth',
-    'handholding',
-    'handies',
-    'handley/cherwell',
-    'handprint',
-    'handsaws',
-    'hanekom',
-    'hanga',
-    'hangleton',
-    'hangliders',
-    'hanja',
-    'hankiss',
-    'hankow',
-    'hankypanky',
-    'hannam/oxford',
-    'hannam/reporting',
     'hannibalic',
-    'hannie',
-    'hans-olaf',
-    'hans-peter',
-    'hans-werner',
-    'hans-wolfgang',
-    'hanstrom',
-    'hapag',
-    'hapai',
-    'hapax',
-    'haplessly',
-    'haplochromine',
-    'happy-ever-after',
-    'happylands',
-    'haptoglobin',
-    'haqqani',
     'harakiri',
-    'haraoka',
-    'harassed-looking',
-    'harasser',
-    'harbourless',
-    'harbutt',
-    'harcourt-reilly',
-    'harcourt/oxfordshire',
-    'hard-',
-    'hard-ons',
-    'hardcase',
-    'harder-wearing',
-    'hardside',
-    'hardware-',
-    'hardware-based',
-    'hardware-intensive',
     'hardware-oriented',
-    'harelip',
-    'harem-masters',
-    'haric',
-    'harideo',
-    'harlatt/tree',
-    'harleyscreen',
-    'harlotry',
-    'harmfully',
-    'harmless-looking',
-    'harmonicas',
-    'harmonizations',
-    'harmonizer',
-    'harmorrhage',
-    'haro',
-    'harolds',
     'harper-wake',
-    'harpists',
-    'harras',
-    'harrier-like',
-    'harroway',
-    'harrowingly',
-    'harshad',
-    'harthover',
-    'hartlebury',
-    'hartlepools',
-    'hartling',
-    'hartlington',
-    'hartono',
-    'hartopp',
-    'hartsett',
-    'hartshead',
     'hartsholme',
-    'harvey-bailey',
-    'harwich-hook',
-    'hashidu',
-    'hassanali',
-    'hassane',
-    'hassani',
-    'hassard',
-    'hastily-assembled',
-    'hastiness',
-    'haszeldine',
-    'hat-boxes',
-    'hatchment',
-    'hate-free',
-    'hathi',
-    'hattee',
     'hattons',
-    'hattrick',
-    'hauptsturmf&uuml;hrer',
-    'haussmannization',
-    'haut-m&eacute;doc',
-    'havards',
-    'havelsk&aacute',
-    'haven\'t.',
-    'havergal',
-    'haversian',
-    'hawadie',
-    'hawaiian-based',
-    'hawarth',
-    'hawfinch',
-    'hawkley',
-    'hawkmoths',
     'hawling',
-    'haxey',
-    'hayama-machi',
-    'haycock/cambridge',
-    'haydon-baillie',
-    'hayil',
-    'haymeadows',
-    'haynets',
-    'hayreddin',
-    'hayri',
-    'hayricks',
-    'hayslope',
-    'haytor',
-    'hayward/thames',
-    'hazardously',
-    'hazardousness',
     'hazelfield',
-    'hazelhurst',
-    'hazely',
-    'hazlemere',
-    'hazop',
-    'hbsag/pre-s2',
-    'hcfc22',
-    'hd1',
-    'hdtest',
-    'he-dryads',
-    'he-he-he',
-    'he-she',
-    'he111s',
-    'head-and-shoulders',
-    'head-off',
-    'head-type',
     'head/shower',
-    'headbangers',
-    'headgroups',
-    'headguard',
-    'headington/oxford',
-    'headline-writers',
-    'headly',
-    'headmasterly',
-    'headmistressy',
-    'headrope',
-    'headward',
-    'heah',
-    'heanor',
-    'hearkening',
-    'heart-brain',
-    'heart-breakingly',
     'heart-stoppingly',
-    'heartsick',
-    'heartwoods',
-    'heat-and-power',
-    'heat-proof',
-    'heat-styling',
-    'heater/stats',
-    'heathbank',
-    'heatless',
-    'heavier-than-air',
-    'heavily-lidded',
-    'heavy-bottomed',
-    'heb.',
-    'hebs',
-    'hedd',
-    'hederacea',
     'hedge-banks',
-    'hedgecutter',
-    'hedren',
-    'heedful',
-    'heerden',
-    'hefcs',
-    'hefferman',
-    'hefin',
-    'heflin',
-    'heh-heh-hehed',
-    'hehehehe',
-    'hehl',
-    'hei-ho',
-    'heidelbergensis',
-    'heighway',
-    'heilbrun',
     'heilongjiang',
-    'heim&aelig;y',
-    'heinlein',
-    'heisig',
-    'heists',
-    'heiz',
-    'hekman',
-    'helbing',
-    'held-off',
-    'held-over',
-    'helder',
-    'hele',
-    'helenvale',
-    'helgafell',
-    'helianthemums',
-    'heliborne',
     'helicoptering',
-    'heliers',
-    'heliothis',
-    'hell-hounds',
-    'hellenios',
-    'hellenists',
-    'hellens',
-    'hellesdon',
-    'hellishly',
-    'hellriegel',
-    'helly',
-    'helmetless',
-    'helmond',
-    'helmores',
-    'helpee',
-    'helpless.',
     'helpman',
-    'helsingborg',
-    'helvetianus',
-    'hembury',
-    'hemo',
-    'hempleman-adams',
-    'hempleman-adams/arctic',
-    'hemson',
-    'hen-houses',
-    'henchard',
-    'henck',
-    'hendersonqc',
-    'henery',
-    'henestrosa',
-    'hengham',
-    'hengoed',
     'henin',
-    'henllys',
-    'henlys',
-    'hennaed',
-    'henni',
-    'hennock',
-    'henrick',
-    'hentoff',
-    'hentz',
-    'heparins',
-    'hepatotoxic',
-    'heraclea',
-    'herbertus',
-    'herbin',
-    'herdan',
-    'herdbooks',
     'here-found',
-    'hereinbefore',
-    'herenton',
-    'hereon',
-    'heresay',
-    'hereunto',
-    'hermitean',
-    'hermopolitan',
-    'herniorrhaphy',
-    'hernon',
-    'hero/heroine',
-    'heronians',
-    'heroquest',
-    'herpetological',
-    'herpomyces',
-    'herre',
     'herridge',
-    'herrod',
-    'herschensohn',
-    'hersheson',
-    'herte',
-    'heseltines',
-    'hesham',
-    'hesitated.',
-    'hesleden',
-    'hesp&egrave;rion',
-    'hesperus',
-    'hessayon',
-    'hesse-darmstadt',
-    'heterarchical',
-    'heterodimerization',
-    'heterogeneously',
     'heteroglossia',
-    'heteromeric',
-    'heterophilic',
-    'heterothermic',
-    'heterotic',
-    'heterotrophic',
-    'heuristically',
-    'heven',
-    'hewas',
-    'hewton',
-    'hexacarbonyl',
-    'hexachloride',
-    'hexadeoxynucleotide',
-    'hexagrams',
-    'hexamer',
-    'hexavalent',
     'heyhoe-flint',
-    'heylin',
-    'heyy',
-    'hezzlewood',
-    'hfc32',
-    'hg/',
-    'hgh',
-    'hgsc',
-    'hh2',
-    'hh3',
-    'hh5',
-    'hi-di-hi',
-    'hi8',
-    'hiatt-thompson',
-    'hiatts-thompson',
-    'hibberds',
     'hibernators',
-    'hidalgos',
-    'hidden/system',
-    'hiddenness',
-    'hidey-holes',
-    'hidouci',
-    'hiebel',
-    'hieracium',
-    'hierocratic',
-    'higashi',
-    'higenbottam',
-    'high&mdash;quality',
-    'high-achiever',
-    'high-achievers',
-    'high-angled',
-    'high-blood',
     'high-breasted',
-    'high-buttoned',
-    'high-cheekboned',
-    'high-context',
-    'high-crowned',
-    'high-falooting',
-    'high-guard',
-    'high-hearted',
-    'high-mass',
-    'high-points',
-    'high-prestige',
-    'high-profit',
-    'high-resistance',
-    'high-tin',
-    'high-trust',
-    'high-vacuum',
     'high-visibility',
-    'high-wing',
-    'high/low',
-    'highball',
-    'highburn',
-    'higher-',
-    'higher-powered',
-    'higher-ranking',
-    'higher-ups',
-    'highest-earning',
-    'highest-grossing',
-    'highest-profile',
-    'highest/lowest',
-    'highland-type',
-    'highly-active',
-    'highly-geared',
     'highly-gifted',
-    'highly-purified',
-    'highly-sensitive',
-    'highwood',
-    'highwoods',
-    'hikyu',
-    'hildas',
-    'hildesley',
-    'hilliest',
-    'hills-trained',
-    'hillsbrough',
-    'hillyer',
-    'hilperton',
-    'hilroy',
-    'hiltrud',
-    'hilum',
     'himbo',
-    'himmelfarb',
-    'himont',
-    'hind-legs',
-    'hinderance',
-    'hinderton',
-    'hindu-balinese',
-    'hingham',
-    'hinojosa',
-    'hinteles',
-    'hinterstoisser',
-    'hinxman',
-    'hip-hugging',
-    'hipbones',
-    'hippier',
-    'hipswell',
     'hipwood',
-    'hiro',
-    'hirwaun',
-    'his118',
-    'his126',
-    'hiscocks',
-    'hispano-suiza',
-    'hispanocentric',
-    'hispar',
-    'hissey',
-    'histomonas',
-    'histopathologically',
-    'historicise',
-    'historiska',
-    'histrionically',
-    'hit-rate',
     'hitchcockian',
-    'hitchhikers',
-    'hithertofore',
-    'hitler-stalin',
-    'hitotsubashi',
-    'hiv+',
-    'hiz',
-    'hizb',
-    'hjkl',
-    'hla-a2.1-positive',
-    'hla-disease',
-    'hll',
-    'hls',
-    'hmmh',
-    'hmms',
-    'hnc/ds',
     'hngh',
-    'hnnh',
-    'hoads',
-    'hob-nailed',
-    'hob-nobbing',
-    'hob1',
-    'hobbitic',
-    'hobblers',
-    'hoblyn',
-    'hoche',
-    'hochstetteri',
-    'hocklingen',
-    'hocl',
-    'hodden',
-    'hoddesden',
-    'hoddle/town',
     'hoddy',
-    'hodge-podge',
-    'hodson-smith',
-    'hoedown',
-    'hoeflehner',
-    'hoegh',
-    'hoeness',
-    'hoffman/girlfriend',
-    'hoffmann-la-roche',
-    'hog-like',
-    'hoggin',
-    'holan',
-    'holbach',
-    'holder(s)',
-    'holed-up',
-    'holers',
     'holford-walker',
-    'holiday-home',
-    'hollandia',
-    'holler-von',
-    'hollinger',
-    'hollist',
-    'hollofil',
-    'hollow-cheeked',
-    'hollow-faced',
-    'hollowell',
-    'holness/presenter',
-    'holocausts',
-    'holt-jensen',
-    'holtermann',
-    'holtons',
-    'holy-place-from-over-the-great-water',
     'holyoake',
-    'holzbauer',
-    'hom&oelig;opath',
-    'homa',
-    'homba',
-    'home&rehy;grown',
-    'home-ranges',
-    'home-run',
-    'home-shopping',
-    'home/host',
-    'homecomings',
-    'homegardens',
-    'homelier',
-    'homeopath',
-    'homeotic',
-    'homeshop',
     'homeworker',
-    'homine',
-    'hominines',
-    'homogenise',
-    'homogenizing',
-    'homopolymer',
-    'homopolymers',
-    'honchos',
-    'honduras-style',
-    'honey-brown',
-    'honey-eaters',
-    'honey/gloucestershire',
-    'honeycombing',
-    'honeyford',
-    'honeyghan',
-    'honeyguide',
     'hong-kong',
-    'honora',
-    'hoof-beats',
-    'hoofddorp',
-    'hoofing',
-    'hoofpick',
-    'hoofprints',
-    'hoogstraaten',
-    'hooha',
-    'hooj',
-    'hook-nosed',
-    'hooto',
-    'hoper',
-    'hopf',
-    'hopfields',
-    'hopkirk',
     'hoplias',
-    'hoplo',
-    'hoppit',
-    'hoppner',
-    'horder',
-    'hore-belisha',
-    'horham',
-    'horizontal-vertical',
-    'horka',
-    'horlock/thames',
-    'horn-player',
-    'horn-rim',
-    'hornaday',
-    'horndon',
-    'hornibrook',
-    'horniest',
     'hornos',
-    'hornrimmed',
-    'hornswogglers',
-    'horr',
-    'horri',
-    'horse-brasses',
-    'horse-collar',
-    'horse-droppings',
-    'horse-gear',
-    'horse-like',
-    'horse-lines',
-    'horse-mad',
-    'horse-shit',
-    'horsenden',
-    'horsler',
-    'hortensis',
     'horto',
-    'horton/manager',
-    'hortorum',
-    'hose-pipes',
-    'hoseasons',
-    'hosie',
-    'hospitalisations',
-    'host-independent',
-    'host/hostess',
-    'host:university',
-    'hostage-takers',
-    'hostia',
-    'hot-cross',
-    'hot-footing',
-    'hot-off-the-press',
-    'hot-rodding',
     'hot-rods',
-    'hot-shots',
-    'hotel-type',
-    'hotelschool',
-    'hotheadedness',
-    'hotted-up',
-    'hotters',
-    'hotwells',
-    'houldsworth',
-    'houmus',
-    'houngans',
-    'hounsell',
-    'hours&times;10',
-    'house-breaking',
-    'house-coat',
-    'house-dust-mite',
     'house-train',
-    'houseboy',
-    'housebreakers',
-    'housefly',
-    'housepaint',
-    'houseplace',
-    'housetops',
-    'housewiv',
-    'houseworker',
-    'housing-related',
-    'houston-tenneco',
-    'houtekens',
-    'houthakker',
-    'hovercar',
-    'how-do-you-do',
-    'howardian',
     'howfield',
-    'howlin',
-    'howroyd',
-    'hoxa',
-    'hoyles',
-    'hp.42',
-    'hp10',
-    'hp23',
-    'hp5',
-    'hp700/rx',
-    'hpn1',
-    'hpt',
-    'hptm',
-    'hpv16',
-    'hpv6',
-    'hpv6/11',
     'hr9',
-    'hrg',
-    'hri',
-    'hristova',
-    'hrududil',
-    'hrw',
-    'hsin',
-    'hsin-liang',
-    'hsp90',
-    'huacho',
-    'hualien',
-    'hubbelrath',
-    'hudspeth',
-    'huelva',
-    'huemmel',
-    'huggable',
     'hughenden',
-    'hughesman',
-    'hughton',
-    'huila',
-    'huitres',
-    'huizinga',
-    'hula-hoops',
-    'hulce',
-    'hulm',
-    'hum-drum',
-    'human-derived',
-    'human-size',
-    'humanitarian-aid',
-    'humanus',
-    'humason',
-    'humbs.',
     'humidistat',
-    'hummersknot',
-    'humous',
-    'humpless',
-    'humungous',
-    'hundr',
-    'hungarian-romanian',
-    'hungriest',
-    'hunker',
-    'hunslett',
-    'hunt/chess',
-    'huntero',
-    'huntswoman',
-    'huong',
-    'hurd/raf',
-    'hurdy-gurdies',
     'hurford',
-    'hurons',
-    'hurring',
-    'hurst/pershore',
-    'hurst/stonehouse',
-    'hurst/worcester',
-    'hurufi',
-    'husaini',
-    'husband/partner',
-    'husova',
-    'husson',
-    'huswil',
-    'huttons',
-    'huwaydi',
-    'huyghens',
-    'huyghes',
     'hverager&dstrok;3i',
-    'hvp',
-    'hvx',
-    'hydebank',
-    'hydro-carbons',
-    'hydro-protein',
-    'hydro-stop',
-    'hydrogen-potassium',
-    'hydrogen-powered',
-    'hydrogeologists',
-    'hydrolipidic',
-    'hydrolysates',
-    'hydromedusae',
-    'hydroplanes',
-    'hygeia',
-    'hymek',
     'hymettus',
-    'hymn-books',
-    'hymn-settings',
-    'hymne',
-    'hyndford',
-    'hyper-real',
-    'hyperaemia',
-    'hyperbilirubinaemia',
-    'hyperbolical',
-    'hypercellular',
-    'hyperdynamic',
-    'hyperinflations',
-    'hypernym',
-    'hypernyms',
-    'hyperplane',
-    'hyperproliferation',
     'hyperquery',
-    'hyperscope',
-    'hypersonic',
-    'hypervolume',
-    'hypes',
-    'hypochlorrhydria',
-    'hypocrisie',
-    'hypofunction',
-    'hypoglycaemics',
-    'hypomanic',
-    'hypopepsinogenaemia',
-    'hypopigmentation',
-    'hypoplasia',
-    'hypoplimnion',
-    'hypostasize',
-    'hypsometry',
     'hyrax',
-    'i&ndash;iv',
-    'i\'tibar',
-    'i(a)',
-    'i+/ii',
-    'i-c',
-    'i-control',
-    'i-digested',
-    'i-explore',
-    'i-f',
-    'i-zingari',
-    'i.3',
-    'i.6',
-    'i.a.m.',
-    'i.d.p.',
-    'i.f',
     'i.g.',
-    'i.l.i.',
-    'i.l.p.',
-    'i.l.pr.',
-    'i.p.s.p.',
-    'i.t.f.',
-    'i.w.l.s.',
-    'i/os',
-    'i972',
-    'i=3',
-    'iacc',
-    'iam',
-    'iara',
-    'ibas',
-    'ibbetsons',
-    'iberians',
     'ibert',
-    'ic1a',
-    'icd-o',
-    'ice-floes',
-    'ice-houses',
-    'ice-screws',
-    'icecreams',
-    'icelander',
-    'icepack',
-    'ichael',
-    'ichikawa',
-    'ichneumonid',
-    'ichthyologist',
-    'ichthyostegids',
-    'icier',
-    'icis',
     'ickenham',
-    'ickonga',
-    'icon-driven',
-    'iconological',
-    'id1',
-    'idea(s)',
-    'idea/expression',
-    'ideaal',
-    'identical.',
-    'identified.',
-    'idiomas',
-    'iditis',
-    'idol-worship',
-    'idrissa',
-    'ieds',
-    'if&ouml',
     'if-then',
-    'ifd',
-    'ifugao',
-    'igg4',
-    'igh',
-    'ignat',
-    'ignitions',
-    'ignorable',
-    'igraine',
-    'ihd',
-    'ii-negative',
-    'ii.ii.',
-    'ii/kg',
-    'ii/st.g',
-    'iii.ii.',
-    'iii.iii.',
     'iii/zg',
-    'iji',
-    'ikazobor',
-    'il-2r-negative',
-    'il-sung',
-    'ilam',
+)
+
+blocks_31 = (
+    '"(n-peretz#(ch-seats&$test#&eficia)$rius&#eld&+t&mdash;the\'(-in-kind$)tton-ford$#zek#&gtsson#+ign-looking&!i$$ston$#tez',
+    '#&khelil##ner#\'sington$#ley#\'tonites$$side#*zimidazole"(obachter#\'rhtnoth"$rard#"cy#%dyaev#\'esforde#\'gavenny$%ersen',
+    '$#ier$+mann-borsig)$pohl$(sgardens#&i-beri#%kmann#/lin-brandenburg\'&dahlem\'/sch&ouml;nefeld$"yn#!m#%nards$$icla#&ridale%"en',
+    '$%erker)!s##tel$#has$#ini$#oni#)ufsverbot##win#&zelius"$sche#&harati#"ic#)shi-style#(t-backed%\'endowed',
+    '%(informed\')tentioned%\'quality%(received$&iarius$%rides\'#ing"-ta-adrenergic%%waves#\'chworth#\'e_noire#%hells#\'rothals#,ter-equipped\'$kept',
+    '#-ween-subjects"%wicks$(tchments##lay$+ey/national"%yrout"%zalel$"ni!%f110c!(gk009059""qs!\'hargava#%tiani"-r&ouml;lchain!\'i-grams',
+    '#\'tronics"&athlon"\'berwier#(liomania&&philes"%ccies#"ho#$kham#&yclist"%ddock#"er#$gely#$mead"$ella#$rman',
+    '"#fta#(urcatory"&g-bank$$head$\'mouthed$%scale%&elling#&/small#"gy##ley#$nall#$time"\'jection#$rani"\'kesport',
+    '#&bastro#&denden#+liard-balls%&e-jean$#y-o#$tong"&mbashi#\'etallic##son".nary-accretion#)ding-over#1ge-eating/purging#(kworthys#.oculars-camera##ton',
+    '#&uclear"(o-energy$&filter$,improvements$*mechanical$$tech#*compatible$#ult#(electric#&fluids#*geographer$#ram#$load$*uminescent#(metrical',
+    '#\'numerik#$pool#(reactors%&gister#&social$0phere/atmosphere("ic##tas$+echnologies$.ransformations$$ypes"$ps-1"#rd-%)droppings%&tables',
+    '#%gitte#%khead%#ill##ney#(th-pangs%!.%%dates#&yukova"(s(azide)##han$(op-elect&\'/victim&$dale&$ston#$mail',
+    '%$lane\'$yers#\'hiazole#(okotipou$!r#\'terfeld"&weekly"%zjets!)jorcklund!$l370""aa#+ck-and-blue*&yellow&%backs($nded',
+    '&\'cloaked\'&rowned&&footed&&garbed&)lacquered\'%eaded&%owned&&ringed&\'shawled\'%uited&&veined%$/red%%brook&$urne%)ish-brown',
+    '%&s-only%%woman\'#ods#$dast#%hblah#"ik$)n-thomson$$rtum#&kemere#$ncos$%dings$)k-filling%"er&%teers$!n',
+    '$\'phemers)!s(%ously$%t-off%%opore#"tt#"ye"#cmp"%eakes#%chnum#$dsoe#$eker#&ndable%!e#!y',
+    '#$mber#&nd-man$$kin\'#$shen",ock-faulting%%board%\'cnt.smm#&emaert%&spruit#+nd-streaked%"or##od-&(chilling\'\'oloured&(drenched',
+    '\'#ust&)relatives%%borne%$clot%$feud%%iness%&lessly%\'s/crips&%oaked&\'uckling%)y-mouthed$\'mington#\'w-torch$#gun"%ubbed',
+    '#(e-jeaned%)sensitive&\'tocking&%uited%&tailed$&/white%&yellow$%burst$%coats$#jay#(m-helman#%ntest#$rton#\'shingly$&terers',
+    '""yn#\'thburgh%"en!$m240"!7"!h""rb!"nr!"o\'")arded-out#$ster#&t-like$\'builder$$shed"&bbysox',
+    '##hel#"or""da$%cious#&enmann%!s#$fari#$ison#%rugan#*y-builders%(coloured$$less"#e/d#$rsma##sel',
+    '#$hall#"or#$rate"$hinj")ilersuits#\'otarchs##ron#)vin/hoyer"#kra"&lehyde#$itho##kus#%lmann$#ore##ona',
+    '#&ted-on$&raffio"+mb-disposal%%grade%#hit%\'ketches$\'acaceae$%ed-up%#sin"0n_app&eacute;tit#\'airiano#(d-length$!e$%maids#&e-idle',
+    '#"gu#$hill#$nell$\'ybridge"\'ok-form%&houses$%/gift$#ful$(ing-hall("in$\'keepers$#men$%stand#&mplaas#%rstin',
+    '%%black%\'scraper$*h-clibborn$&leians$$yman"#ppy"&rassic#+der-opening&#way#"ea$!k#(g-warner$$hini#\'ingness##jon',
+    '#&oevich$%goves#$rett$!i%!s$%odale"#s/x#(careccia#*e-einstein#%sable#$tick"\'t-flies#%aurus#%ch-up%#wey',
+    '$#er.$#mer#%tcher$%erman$"in$)le-washer$&om-end\'\'feeders\'%knots&"an##win"#uba%#car#(chardeau%%erett',
+    '$"le#&ffants%$lers#&illand#$llee$%oigne$"ts#&mphrey#$ncey$\'daries.\'-y-maintaining%&lessly%&stones#.rgeois-liberal$$hill',
+    '$&eville#&veault"(velander"(w-string$$tied\'!s#$case#&d/east&&nstone%$high%&milton%%thame%*winchester#$kett#%lfuls',
+    '##ron"\'x-files#*es/parcels##ted#%works"%ydell#!l$"es#(mans-van##sey!,pexploration"!n")o/karajan!$r108")ackenhole',
+    '$&teatum#%dmore$&y-plan##ggs##il\'%!a$)n-injured&\'teasers%#sby%&teaser#&ke-van#&mbilla$%erton%"ur$&ingham',
+    '#)nch-tusks$$died%#sby&$tadl$&estawm$%field$%islav$#kin$&negans$&sfield$$tham#\'sileiro$%sware#&twurst#\'uninger',
+    '#$xton#$yles"#ca1""do#*u-labelled"\'eadalby%#bin%%stick*!s$"ge$\'k-downs&$fall&#off%\'dancing%#ell',
+    '$#rey$\'st-bone\'$high$&things#\'ckfield%\'inridge$#ons#&edlove$&ziness##fet#(itkreutz#$kast#%nkley$"ts#$ssay',
+    '%"on%&ummers#&theren$\'t-jones$%ylium$!z#\'whouses""gm"#iac$!l$\'r/oxfam$#vel\'1s/gloucestershire#\'ck-work%&makers',
+    '#%ddell$\'ge-deck&&master&%stone&%ttine&$work#(ef-cases#(gadistas%$ndry&#tia$&hstone%&t-hued\'%toned&+er-sounding&$ling',
+    '#&ndsley$#gen$%kibon$&sworth#$oude##sas$%lands$#sot$(tletails#\'tanniae$0ish-administered)\'merican()dominated((educated((financed',
+    '(&indian(&soviet$"sh$&tanica%(en-pears%\'lestars#\'zzolara")oad-scale%&backed%%crown%)er-winged%%field%\'meadows&)indedness$$ster',
+    '$$tune#$dgar$%owitz#!e#$gans#"hn$#ome#*ken-spined(%tripe\'$wing%-rage/advocacy#&mbergs#(nchiolar&*opneumonia((ulmonary',
+    '$+ze-coloured&%wings%!y##sse#,thel-keeping&)r-in-laws\'&ilkeld\'$ston\'$tons#&ubster##vet#(w-beaten$*n-coloured&\'painted%&/black',
+    '%*ing-ferris%$ness%\'sberger&$word$#ses"+uce-mitford#$egel$#ren#&invels##jos##lee#\'nanburh$#net$3swick-l&uuml;neburg#\'sh-like',
+    '%&stroke#&talise\'&zation$%ishly#$xner")yce-smith##mer#(n-julson$"er$$mawr#"um!#s18"$d4.3"*e-infected""ja',
+    '!#t-3"!6#!2"!7"!9!$uana",bble-nesting"$chis$#tel#*ket-shaped$)ley-jones$%skins$!y",dapest-based##isa',
+    '""es#!u"(ff-coats$!e$#ish$&oonish"#gga#\'le-horn#"no""ia#%ld.up%&ing(s)(*-materials#!s#\'tenzorg',
+    '"$ksch"%latov#$ghar#$kily#&l-calf%%nosed%\'terrier$)et-ridden\'&shaped$#man$$whip$(y/victim#&mershe"*mblesnouts#$hole',
+    '#$pily$)tiousness"\'narkaig##cha#+galow-style$#ler#\'khouses"(onaparte#&yantly$#ing""ra#$bach%#nks#+dett-coutts#%gdorf',
+    '$$head$$mans$$onet#\'hinidae#$iton#"ka$#has#$land$&ingame&#son#$marc$"ps#%nbrae$"el%!s',
+    '$$moor#%ritos$(ow-mouth#$sali$"ky$%ledon$-on-marsteller#(thensome$-on-upon-trent"+s-conductor$\'station##boy#+ch-petersen#$hes.$%fires',
+    '$$land$%plane##nes#$seto$#ola#%tillo%&tution$$line#(y-bodies&#usy%$ness"#t-i#%_even$"of##ile',
+    '\'(nuffield##oxy#)termaking%!s$(on-holes&$less##uan#/yrate/glutamine"&xfield#$tons"#yed#+ing/selling"+zzard-sized$"ie!&verggg',
+    '!&wanali"!d!)y-stander"#ard"&e-byes#%lorus"%lines"$name#!e#$werk"$play"#the "c%!+&aacute;diz"%dgr;t',
+    ')!2"-eacute;spedes""gt"%prime!"\'c!(+&commat"#l+a!&-230.4"%bands"%chase"$fdfc"(labelled"!o"#ras#"eg',
+    '"$wing!%.-in-%!.",1053&mdash;4##100##200##550##760"#300"#460"!b"$c.r."$l.y."$n.t."&p.g.b.',
+    '##.e."!v"$w.s.!+/00/23/2220"#axp""km"#sgt!#172"!9!#230!"47!&57b1/6!(:figures!$_c\'s!%a-ret',
+    '"#ase"$bala%%istic$&nellas#!e#/le&amp;wireless%(-cutters%#way$#ish"%ccaba#-gtg-cyc1-lacz#%hepot#\'iquismo#&klings#!o',
+    '#.bury-schweppes#$dish##mrs")ergeiliog%$wrle"-f&eacute;-bar#.eti&egrave;res&#ere##fyn"\'ge-like##ily"%hners$"ty"&iaphas#!l',
+    '#$pira#&rnhill#&triona"$juns",lcifications&$ying%&nation%#um-(&loving$%retes$"ul#\'endulas#\'ibanity%%rator#\'l-girls',
+    '$&eshire$"ie%\'graphed%\'ng-card%!s$$used#$mest$%ingly$0odulin-dependent##nan#*orie-laden(\'reduced$!w#%stock#%ypsos',
+    '""ma$$pign#$bert$2ridgeshire-suffolk$)uskenneth#!d#0el-benetton-ford$\'raderie&"na&$ship%\'on-hyde#$oens#+p-dependent$\'anology$&bellii',
+    '%#ons"$n\'t.#\'/should#*ada/alaska$&lettos%&iculus##can$+er-stricken$&rizans#)darlizade$%elada$%icans%"es$\'le-ends\'&flames',
+    '&"ss\'$tand&$town$(y-coated#!f#$nara$%iness$&onades#%onbie%#ize#$seco#(tacuzino%!r$"el&!l',
+    '$#oni%"rs$%rails##vin"&p-like#$/dna#,able-looking$8city-to-act-autonomously#\'el-cure$#rby%#ton##ful#+ital-hungry(*investment($rich',
+    '\')ist-style*&ically(#zes%"is%(ulations#(occhiano$#lla#)padocians$#ers$$ings#*rimulgidae%%ngton#%stone#,tains-regent$+ure.richard',
+    '$$deck$)insurance$(jackings#(abineros$\'docians$%melle$(pintadas$)vanserais%$elle##bin%!s$(ocations%\'diimide%%furan%,hydrate-rich',
+    '\'$zinc&/ate-bicarbonate&#ica&\'ylation%(xymethyl$%urton#+cinomatosis#)d-holders%(sharping&$ized$&iogram&%lipin&)selective&&verter$%ownie',
+    '#&e-work$,er-motivated\'$wise$$full(+y-monitored$#ssa$)takership##gos#*icaturists$%nomas%&thians$$scot#&lowrie#(m&eacute$&elitas',
+    '#%nahan%!n$#era%!t$%field%#ord$"ie$%osaur$!y#%olana%$gees%$lers%%othon$"ta$$used',
+    '$\'interia$"os#&riacou%+ck-anderson%%er(s)\'&-based\'!a%&galine\'!n$!o%"ws$%y-all#%stens#%tels.$%horse',
+    '%\'on-like$$tiss$-wright-cageby#%uncle#,vaj&aacute;l#)yophyllus"\'sadesus$)res-roach%#ola#$cara#\'e-notes%\'reports$+ley-hayford$&s/1000#&h-card',
+    '%\'raising%$till$%flows$)mere/wool(!s##sam%"ni$#one$#uto#%teley&*fiorentino&(gandolfo&#ino&*l&oacute;n$)le&dollar',
+    '\'4orton/worcestershire&$rigg$$oret$$rati#&ualism\'$ties&\'ty-list"*t-creature$$walk#\'abolite$&gories$\'lanists%$epsy#$call$%hable',
+    '#%eaton$$chin$$dral$#gor\'$ies.(#ser$"ll$$rall##ham$#ood#%skill#,tle-trespass#&weazle"&udally#$lder',
+    '$#kin##nce##sam$%eless$$tics",valli-sforza#&e-like#$orts"\'wthorpe"!z!"b1""hp"!n""sg#(o/rattle',
+    '"!1""ah"&gc(at)#"ts"#mlr""oa""vs!#d14#$6+56"*3-positive""54#!9""8+""c2""h7',
+    '""sp!#eca#$elia$"re##omm""di$#llo$$stas"#iba##rch"+lebrations.&"es$)tn&aacute##ina#(l-counts',
+    '$!i%"er$*s/&micro;l#!y")ment-like#"in"#nac$#rth#+dres-noires##giz#$suum#(t-gardes%$plus$$ages%#vos',
+    '$%igram%%meter$,ral-european(*peripheral\',ly-appointed*\'devised%(e-pieces&#way"$orge"*phalapsids"$ques"#ran$%tites##das#/ebroventricular',
+    '$$nkov#&nunnos#!o#%taldo$\'ifiably\'\'cate(s)+(/diploma\'#ers#&vecera%#lat##yle"$saro##ium#%pedes#!r',
+    '!$f351"$c-12",tr-dependent!"g3""as"!c",mp-dependent""tp!2h&acirc;teaubriand+%laine$\'tilde;o")\'kassians"#.11"!3"\'abannes',
+    '$$ombe#(in-gangs&$like%$link$&r-arms&$back%%backs%$mans$*se-longues#(kraborty#-let-bungalows\'$type$&k-hill%$face%&idians',
+    '$%lands\'!s%!e&%nges.$-ons-sur-marne$"us#(mberlins\'#pot$%orros$$pany%&ertous%.igny-sur-marne%*lev&eacute#\'nciness%\'tonbury',
+    '%5rasekhar-xanthopoulos$%g-wen%"an%$chun%)elessness$%nels.$#thu#,pelle-annexe%%rones$(laincies%\'inesque$"s.#&racias&*ters/units$&bonnel',
+    '$*coal-fired$(ge-sheet&\'ability&$back&#man$)iot-teams%*smatically%"th$&ladies%$eson%#ock$%oseth$$poua&"ys$)t-parsing',
+    '$#rio$&terers\'#gee%"in%"ri#%usses$%vency%$igny#%valit%$nnes")ean-dearg$$pens%"ie%%jacks#$cchi',
+    '$)k-flights&%lists%$able%%ed-in%#in\'%\'weigher#*e-dynamics$)r-leaders$)se-makers&!.##kov#%lford$0msford-liverpool&#low$%yshev',
+    '%*n&eacute;e$!o#"ni#"ow#&rating$$bury$"if$%navin%\'ozemski$(ry-eater$#vov##sne$#sel%"on$\'t&mdash',
+    '%%/bust#$tham$#ley$$wode#.vauch&egrave;e$$erel$&rolets#%wings"*i-dynamics#$ajei$!o$#pas#!b$#ane##cha',
+    '%"on$"ky#%dleys#%emsee$"pe#"ff#-gny-les-roses$#oes#!l$+d-listening&)resistant&$size$%grove$&iastic$)lingworth',
+    '$$eria$)neypieces$&p-like#)na-canada%$glia%%mania$#ley$%oluiz$&tamani##ome#$pata$\'chester$)pingfield#(ronomids$\'urgical',
+    '$"ti#"ta$$unda"$kdsk"%lopas$)rophenols(#yte\'"us#%umsky"\'o-liang#%ccies$&oholic%%latey#$icer$$rman',
+    '$#eri%(steatoma(,rol-lowering$/sey/oxfordshire#$msmy$$utov#"oz#%ralis$-eographically$+ioallantoic%#zos$(ographer#-ucro&ucirc;te##wen#-yjilsurengiyn',
+    '&$iaan(&n-name)\'isation\'#son&#ley\'#ich&(mas-week&)ocentrism#(omatinic$"n.%!o&$gram&/stratigraphical#\'ysallis"(thamalus',
+    '#(cker-out#$dley$&novsky#$ikov#%ngara$$kier#(rch-ales\'%owned&&/state&%field+!s&%lands$&ned-up&"rs$!r',
+    '"%yldes$&omicra#&mistry#\'rurgion!)ia-backed#!l#\'rrapico#!s"&borium$#ure#!s"#ccu#\'eronian"(derheads%&makers',
+    '%*ette-cards"%liata&"es#%liers$!s""nd#(e-camera$&rarias#&gulate#\'namomea\')n-scented(!.#!o"2rcle-in-the-square&"s.',
+    '%*nscription$\'ulators%+mambulation&$cise&+navigations#$ques"&sneros"%table$$lian#*ed.text.id#+ing.text.id$(zenships#\'y-owned$!0"\'vically',
+    '&(sational!"ja!"k1!4l&egrave;ry-le-grand"#aas#$cher#%dists$%ogram#!g$#gan##im.%#ed.&"rs#(m-gallas$$ming',
+    '$\'william#%pdale$(persgate##rel$%ities$+k/reporting#)ss\'-party%)-cultural&%names%#/es%$mark%,room-focused)!.#%tting##udy',
+    '#%vecin$%icles#\'w-marks$%backs#+y-saturated$$born$%lands$&stones$)ton/world$%worth"*ean-bowled&&limbed%#ish$$r(x)%\'-felled',
+    '%$bury##ggs#"in#*ment-jones$%mence#"nt##ome&#nes$"pa#\'rically#*thrionomys##vie",ickety-click%$ings#*entelistic',
+    '$\'f-bound&(climbing%#ing%$line$*ton-taylor##gga#\'mbdowns#\'ngtight$*optilolite$\'tonians#(p-joints$$sham""l.#"r."*ock-towers',
+    '%#sin#\'gged-up#&hessey$%ossey#$mped#%nally##rin#+se-carpeted&&fisted\'%ought&$outs&(quarters&&shaved&(textured\'\'ogether',
+    '%$d-up%)ly-packed%"rs##tho$&worthy#(ud-point&\'shadows&(wreathed%$bank%#ier%%scape&,ley-thompson$\'ghmills&#ton#"va',
+    '%&r-leaf$"io#\'wn-like#!y""sb"!u#&b-head$$foot$%heads$$moor#&ckings#$dgie#%ed-up#&msiest#%niacs',
+    '#%ttons#%ytens"#yma!%m.918"\'/second"#hns"#i\'s"$krnl""s7!-nbr-activated"%emial!1o&mdash;operation#(ocirc;te#.rehy;operation"&-axial',
+    '$)ounsellor#\'editing$$qual$(xpressed#%heirs#*incidental%&ventor#\'ligated#0op&eacute;rative%+erativeness)"or#)producing)!t#\'tenants"%.rep.',
+    '"\'ach/air%%smith$!t#"gh#\'l-holes$&ition.$&owners$$yard#!n#\'st-road%#al.#-t-and-conduct$)s-of-arms%%worth"+bble-stoned',
+    '#&denism##nut#*ol-to-unix%"/2"*ca-growing$,ine-sniffing#&colith#"ha#*k-and-bull%%fight$$bird$#ier%"ly$$rell$%sfoot',
+    '$#ton#!l#$otte"\'ddenham#,e-compatible%%names%\'sharing$#fam$#xes#!s"+effficients##lom#\'rcivity#!y"+ffee-lounge',
+    '$#man#&ounder"%gbill#-efar-impresit##gin$"le$%ygria#\'idubnus#3nitive-instrumental(#ist+!s"\'herency\'$tism"&il-tap#)ncidently',
+    '",l&eacute;gio##1a2#&bourne$"ys#\'chicums$5lough/gloucestershire#)d-welding$0stream-summerson#&egrave$!n$\'ridgean)!s#&iforms$$more#(larbones',
+    '$\'igation%\'nearity$%odion%"na%%quies$\'yweston##mar#%ognes$"ma$$niae&+es/&micro;g$,rimetrically$.ur-coordinated\'&washed&%ed-in',
+    '#4umba\'s-by-the-castle\'$rium%%cille#$wick##yer""m3#!4##ala$$ndos#$born$(retaceae#+dex/comexpo#+edy-ballets$&liness$$nius',
+    '#)fortable.*%y-off#&itatus#\'m-calls%&screen$$ande$*emmorating%)ntary-box%+rce-raiding&%zbank$\'issaire%#tee&%ment.$*on-carrier\'%rooms',
+    '&$view$#set$,unitarianism((y-minded*(policing#&oediae$&rienne#,p&egrave;res$!a%,&ntilde;eros-"ia%$ctor%"ir%!n&+ion-in-arms',
+    '&&isons.&%tners%%srose&(sionless$"er%0titive-strengths$*lementizer&"ta\'"e2\'$ists$(onent(s)%&stable$%rende$&tables$$ucom',
+    '&$able&-er-compatible))dependent)(graphics)(mediated)(services)&usable()vertriebs&+ing/physics"&n-rods$&tricks#%_brio#$atus#\'carneau%(tenating',
+    '%(ntrated.%,pt-dependent%\'rtation$*iliatorily%"ni%$tato$&ordats#$dole$$uces&\'iveness$$yles#&e-like#*fabulation-!s$"ed',
+    '$\'idence-%%gural$/lict-resolution$*ormability)"ly(!l\'#ent(!r)!s%%under$%used.&"io%&tation&"es##gas',
+    '%&nially$&olaise#\'jointly%"ur$%uanco%$gals\'%tions#$king#&nachan%!l$%ectin%!l$#ies$%otive#&radian',
+    '#+sanguineous$*cienceless&(ousness.$)ecrations%#ils%-nsus-building%\'quence.+"s.%.rvative/labour-+speculative,"s.$"id%%gners%&stence$*ociational',
+    '$)tantinian%#it.\'.ution-drafting,!.,(al-legal%/ruction-related$0umer-electronics(+/commercial)$user&&ptives#)tact_with%&giosum%9ins-binary-of&lsqb;module)5source-of&lsqb;module%$mine',
+    '\'#ors&#pt.(%ibles%%ntful%\'statory%1xt-specifications\'$less$(iguously%)nentality&&uative)#ors$&rabass&\'ceptors\'%t-out)\'vetting',
+    '(&orised(&ualist&%rious&\'stively%&ivings%$olee#"us#&venios&*t-educated%#rsa(-tion-stoppers\'"es&$tors%&xities#$well',
+    '"$ochy#%k-out%$pots##mes$&massie#\'perator##ray$(dinately""p8#(arceners#*ernicanism#$lans$&estone$"in#)manthorpe',
+    '%&r-clad\'%oxide\'.phenanthroline&$ware\'#ork#(rophagia%&stanol#\'y-paper$,ing-fidelity"\'quelles")ral-elite%$lian$#nka$#zza#$bisa',
+    '#*d/cordless$$eroy$$ials%"on$\'wainers$!y#.e-constituting$"rs#\'icancha$"sh#$kers$#ill$\'screwed#"lu#&mallen',
+    '#,n-on-the-cob$$akey$)er-stones$(iculatus%#est$#ock$#ton##oma$\'nameter&#tus#\'p/apple$#ach#&ralejo$(ect-word\'$able',
+    '%#nte%*spondence.#%sicus$"on#$tese%\'vecchio$&ically#*u&ncaron;a#$yell",smologically#$quer#$sies#,t-increasing%\'neutral%(recovery',
+    '$$anzo$$igan$&lessly"+t&ecirc;tes#\'chester##tar$&on-top&#/5%\')polyester&"ey&#ing"#ucy#%ld_no%#na\'%%ridge',
+    '#-ncil-approved($wide\'#man$&t-back%\'ability%.er-adaptations)(ttitudes(#bid)#low(&charge)$oups)\'urrents((diagonal((evidence(\'factual',
+    '(,parallelisms+"ts((sciences)%tance*(rategies))ubversion()terrorist((violence\'\'chances+"ge(\'yclical\'$pose\'%stain%$hrie%+ry-dwellers',
+    '#)pe-coupes%!d$%ledom#\'rcheval$%se(s)&(-related&!r$*t-bouillon&*nou&eacute&%rooms%"en&!r%%lands#*sin-in-law#"ve',
+    '$(r-drives%#ley"\'w-byres#(boy-like#\'catcher#"dy#$hand$$erds#%orker#$peas"&x/vale#$wold"-yle/reporting"&ziness!#pac',
+    '"$l/ir"$m/ml"+u-intensive$(specific#!2!.r&eacute;ation$(circ;pey"#/ct""42$!s"!9"&abmeat#%ftier%&smanly#%gsmen',
+    '%$earn%$owan%#ton##mbe#&nbourn$)e-boulder$(iofacial$%kshaw$$nogs#*sh-helmets$$sest%%idens#-ter-saturated$"ur#&wforth',
+    '$%shaft#$xton""cs"*eam-washed%%iness%*y-coloured$#ton%)ureliness#*dentialism$)it-raters&\'/charge&\'ability$"os#$edon##gan',
+    '#)matoriums$+e_de_menthe#.ole-influenced%$ised#"s.$\'cendoed$$sets#-taceous-early##use#%wneck"!h"&iancas##bbs$"yn#,cket-writers',
+    '%$wave$$sons#*nge-making#$olla#&quette#(sis-club$$tino%%ofani#)ticizable"!n"&ockets$!s#"dh#%ftman#$ghan',
+    '$%erian$"me#)ok/howard%#ham#(p-headed$#ton#&quette#%slets$0s&rehy;community%+-addictions\'#rea&\'bencher-!s&&checks\'*ompetition',
+    '&-directorships&$eyes&&gender&(lighting((nguistic&%phase\'%ieces\'$oint((llinated&&racial\'%efers&+sectionally&&voting&%walls("ys',
+    '%%belts\'&nchers&#ill&%order\'$wman%%gates%%hairs%*ing-points(%s-out%)opterygii%&pieces%%trees$#tyx$%ville$$well',
+    '$#eau$"oy##ugh#0wn-in-parliament%$hill&#old#$xley"%p-dna"#tra"&ucians$(k-framed#*iser-racer#"me#%nchem\'"rs',
+    '#\'st-like")venkovski"(yoscopic#\'ptology#(staleyes\'\'lizable!$saws""ms!#t11""20""61"!b"!o#&ols960"!x',
+    '"$adra"$bbin%#tts")ckoo-pint#$ulus"%dbird"$enca"$ffey"&ldrose#+ham/harwell#%ligan%$more$&ompton#)t-statues$\'ishness',
+    '&"e\'\'*-dependent(&hungry(%shock\'"s.")mberworth$#ric#*ming-bruce"%ndall$(inamarca#(ninghams$%liffe"*p-painters#(ellation#$fuls',
+    '"%rbage#&e-alls#\'iousity#*ling-tongs$&y-toed#)tailments&)n-raisers$$icei%+s/wiltshire%!z$%seyed##ve."$sano#&hnahan#!i',
+    '("um#%tance$%odier%,m-configured\'%wound&.er-orientation&&izable$%umale"\'t-sheet$\'throats#%forth#&ileiro%%heiro!"vd"!l',
+    '"%mbach""rt""ts$!.!"xi""vi"#xiv##vii#%xviii!&yaneus$(ogenesis"\'bercart&&ranker%%delic#%orged',
+    '#+le-friendly&$ways%(s/minute$(odextrin,!s%#pes%&thymia*!c")farwyddwr"*mmrodorion"&nehelm#&odonts"\'oeraeth"$rien#"ka',
+    '$&ometry#%yllte"-tofluorometry$&logist$*photometry%*lasmically$&static!&zarism"%eizel "d%!*&amp;sharp#)uml;niken"3eacute;b&acirc;cles*$acle)(coupages',
+    '*$unte)(j&agrave)#lit))nouements"$gt;0"\'mdash;1"%prime"(uacute;n!+\'&ecirc;tre"\'abernon#&chille#&frique#%lbert$$onzo#$ngle',
+    '#%rgent$!s##spe##ure&%ville$$tres#$vize##zun"(economie##lia#%spana$$time#$tude#%vercy"(harcourt',
+    '#$ulst",informatique#$raty#+s&egrave;re$%raeli"(occasion#$lier%%veria#%range$%liens#$yley""sa"#ulm!#-28""he',
+    '"$zine!$.323"$f.m."&g.a.a.""k."$o.e."$s.o.$"s.!#/bo!"1+!"28!"35!"5+!%6&ins!$a-62',
+    '"#aah"#bba#+cevic-kucar##son""ch$!i##ian##res"$dzie"$eing##jan#+monological"%ffies##tie"\'gfields',
+    '#"ra"#hir"$ijin$$osai#%nties(!t##ses"$lang#%blair#%cross##eus#$gish#&iesque$"ts##kon',
+    '$!e%!s$!i%#ton$$oway#\'mations#\'rachney"(m-making#(age/loss&!r$"ri$"se#%erell$$sick#"it',
+    '$%ed-up#%ndest$$fool#$pest")n-yr-ogof##cad$\'e-forms&"in#&deanee$&ipratt#\'fordiae#%gaard$%ermen&$ous.$$lers',
+    '#"is##jou#"na%"tt##ter%$sque$%honia#(ube-sava"$ouda"%phnes#(parungsi$!y"$rdis##ell#"ia',
+    '&\'reasted%&furred%$hued%(pupilled%(shadowed$\'ly-clad##ron#\'tboards$#ers$#hea%"ur#$vell#,winian-style"(shboards#\'kyleion',
+    '$"el"-ta-processors%#set(!s$&.types$8/procedure(s)/program(s)$%entry#*e-stamping$%/time#!s")uberville##cus#!d$!i"\'vaagiyn',
+    '\'&former\'/gloucestershire\')traveller$"la$&s/hunt%#ons"$wdon#$isha"\'y&deg;c##(s)#$-boy\'!s$\'dreamed$"in$\'surgery',
+    '$$most#&aratne#%brook#$wear!$b-25"!7"!c"!f"!m!+c&mdash;id/"!8"$p600$"24%!8!$d/lw',
+    '"!3""in!,e-activation$(lignment#.centralisation$\'reation#(emphasis+"ed*#zes#/hospitalization#$icer#&merits#+oxygenation##rig#-stalinisation',
+    '"!1"#200"!7")activates#&d-skin&\'traight$%beats$$lift&$ness$!s#$fens#(l-makers$)coholised$,er/collector&%board',
+    '$"ul##mii#%nplan$$ship##rio#(th-genes\'#rip&%traps$"on"$bars#"bo#$dale#.enture-holders#\'ilities$&t-card',
+    '#(riefings#)t-holders%)to-equity$"s.#$unks"(cade-old&#nts$(syllabic#"d.#%entre##hub#&imator%$etre$(pherment$(sionless',
+    '#%kland%\'e-edged#%laims%$rers##mcc#*ongestants%*structions$"rs#+reolisation$-iminalization,!e"\'ed-poll$"at$!y#(p-seabed',
+    '$#cut#*r-stealers$(stalkers#%sside"/familiarisation#$ecit$+ncelessness%\'dant(s)&"us$$r/do#(iciences$$lers$%nably%)itiveness#*ormability',
+    '#&terdar"#g/s#+lycosylated#*radability$$ease%.e&lowbar;angle&!."(hiscence#$melt#0omosexualisation#,ydroxylation"+ichsfischer%)torhallen#$stic"#jan',
+    '#%eted.#$gada#.icious-looking%"to$%fresh$%mitis$"st$*verability#+l\'accademia#%marva#+ocalisation#&phians&!n##ray#&tastar',
+    '"-magnetization$%ntius$#rch%&kation#&entia.$#rit$*ulemeester#%idoff$,neralisation$%tting#(ocractic((y-labour\'+t-dominated(-ic-functional\'#zia',
+    '$,nopolisation%(strandum#%urral"&nderah##ero#$hams##ing$"ro##nes$&ington%$sons&#ton#.ominationalism$(uncement#.sity-dependent',
+    '#%tally%#tum"%odhar#$garh#1xyribonucleotides"/partment/school$%sture#(endency.#)ilatories#%letes#$oses%)it-refund(&takers#(ressants#%uting',
+    '"&ramore#*elict-land($ions$)striction#"ia$$tend##mod#!r$$yall%(gonnelly%#lin%&volgie#$vaux$#ock""s.',
+    '#$cale%#nts$(harreaux#$eado$+nsitization$\'rt-like#&forges#\'iccator$%derio$*gn-society$&rable.#&kpro/i#"ma#$nuda#\'poilers',
+    '#%sarry$\'ication#)tabilises%(tization%$yala$+ructibility#*ulfobulbus"\'tected.&.ive-constables$\'rminand%$rers#\'riments#&tingen#%wyler"$uche',
+    '"1vastating-looking)#ons#-elopmentalism$$raux#&iances\'#ies$(cehigh=c$-l-worshippers%!l$!n$$sers"\'w-drops#%point"4zallier-d\'argenville#,incification',
+    '""=4""c."#l.3""mv!#g-x"!1""uo!&h5&agr"#c-3"(omhnaill"&urries!#i\'s"(abolexpo#(critical#!d',
+    '#(gnostica#$ller#&magnet$#ino$\'ondwood%#rph#)ne-louise##rra%%hoeic#%stase#$volo#\'z-abaya%(briquets"#bba##ona',
+    '#*hotomously##kel&!l$*son-clarke##ots%\'yledons#\'tations$)enophiura"&ddiums$$ling##one"#e/i#$d.we##nes#$side',
+    '$(hylamide\'+carbamazine$+otectalitis")fferentia$%icuit)#ies%%datio$\'usional*"ry"&gestif#%italk%"el%#ize("rs#(lyceride',
+    '"+ii-digested"!l#$ator#$does#+ly-dallying"+mensionally$\'r-dimer%#ize#\'idiatus##sey"%ndorf##ero#$goes#$ing-\'$area',
+    '#+ner-service&&/dance&%stein#+osaur-mania#$ting#/ucleotide-based""og##nys#%ptres#&xazine"\'plotene#%slope$\'omaniac#$tech%#ran',
+    '+%aceae"*rect-sales&&edness\'$ment&+ion-finders&%or(s)(\'/oxford)(producer)&social(+y/directory#\'igibles#\'t-cheap$#ies#"zo"/sability/ageing',
+    '$+pplications&(ointing.&&rovals$)ssembling#)believers#*ciple-ship\'#ina$%o-bar%%bolus%#cam%)graphical%$idal%)nfirmable\'\'ormable%\'rdances',
+    '%%urse.$)riminants*$tely+%ingly$\'ussable#-ease-carrying$&ngages#+gustingness#%h(es)$(onouring#)impaction$)nheriting%$vest#)junctures#-k-interactive',
+    '##nae#+orderliness#%perso$%layer\'"s.$$oner%%sitio$*roportions&#ven$%utant\'$tive#*quietingly#\'soluble#\'tempers%&nsible',
+    '%#lls$+ractability&"it%.ibution-valued$%urber"\'therers$+ianitronium&%zoles##mar")vagations$$lent%!l#+ergenceless()t-dialect\'"rs',
+    '%#ter$#sts#%iners$*sion-based(*al/section*\'ization(#ism#,orc&eacute;e#$ulje$!s"(wan-i-am"%xmude#)on/former"%zzier!$jama',
+    '"$erma"(iboutian##nns!,k&ndash;2000!"l8"!l""rs!#m10#%2,000#&40,000#!5"%2,000##.35$"58$"82',
+    '%#737#"00#"50%(,000,000"$3.98#%3,000"/4.08&ndash;4.12""50$%0,000#!8"!6#!5#!8""78"#800',
+    '"%owski"!v!$na/5$#rna#(:protein"!v!&o-able#$bama#3you-think-he-saw-us"#bag#"ra$!i$&oslawa$$udja#%slaff',
+    '#&udrama$.mentary-makers"%dgier%$ness"&e/dhss#$nitz#$snae"&g-cart$$days$&rescue%#ose$%sized$\'toothed#$gily#$hood',
+    '$(ersfield""je"(lcissimo#&erites#%ichos#(lar-rich$%ed-up#+omitization$"ur#\'phinton##ton"/main-containing&!.$!n#&e-like',
+    '#\'inicana"#n/r#\'aghmore$$tian##ets#%iford#$mall##uel"\'o-lally#$leys#\'mstones#%r-mat$$way."%pants"#ral',
+    '#%fmann##ita#%niers#)set-based$\'omedial"&s=high#%barth#)e-related#\'imeters#)toevskian"-t-addressable$$blot$\'density#%ingly"+uble-aisled',
+    ')#uff\'&doored)$uble\')entendres\'\'figures)$sted(%light\'(labelled\'\'muscled\')sovereign(%pread(\'titched\'%takes(%ested($rack',
+    '#&cettes#,ghnut-shaped#%llens##rda$$ness##ses#"ze"0ver&ndash;ostend$$ston"\'wanhill#&diness#$gate#"le#*n-draughts%%grade',
+    '&#ole%%level&#ike&%oaded%&played%%rated%$size&%troke$%derry$\'hillers%$ower$%plays$%sides%%wings$&thrown',
+    '$+ward-facing)(pointing#(sborough"#yal##les""z.!#pcr"#x/2%"0s!)r\'gasians"%abber#%conic#&gomans%\'n-flies\'$like',
+    '\'%ships$$seth#(in-pipes%%valve##ma.%%turgy#&polene##sty#,ught-proofed\'(s-person(&person(%woman#\'werline$&ing-up\'"s.',
+    '")eamy-eyed#&dgings#$fach#*sden-based$\'s-style%(ing-tent#$tske"-i/mcgraw-hill#\'bblings#%ed-on#%nkies%!y#%vable$,e-inhibition%"r.',
+    '#%menon##ogs$)py-leaved#\'p-goals$$head$$niks$%pable%#ers(#-in$$wise#-ught-tolerant""uc#-g-traffickers$"s.#&m-like',
+    '$$clog$$head$!m$)nadrochit$$quin#\'nkeness#&sillas"#yfe#)opithecin,!e#!s!"s1"!f""os"$p32c',
+    '"!r!*ual-ported%\'subject#&nnians"#bey#$iety$"to"&chesne#&k-like$$bill$$hams%$urst$#ies$"s.#$lair',
+    '"(fflecoat$)y/charity"$g-up#&onijic"\'lcimers##eep##loo"$mani#(b-struck$"le$"os#$igan#%nonia#$pton"(nalister',
+    '$%annon#)das-grant$#ee1#&lossit#(severick$%forth$$illy#"um#$well#$yveg"*pli-carver%#net#$orte#)pa-miller"&quesne',
+    '#\'ational$#vas#$bars$(eyfields##can#"ic#(otrigian##ris#$ston"#sks#(t-clouds%%heaps%&sheets$&jacket$)y-looking',
+    '%#ess#+y&rehy;free")val-leroy$"ne""wp!$weeb#!k#,lling-houses"%iwedi!#xc5#!c""e5"$s101!(y&eacute""al',
+    '##nce"(e-houses$&stuffs#$ings"$kins""le"(muniadau"%napad#%jandi#%o-rod$%rphin"*sautonomia#&dercus#(karyosis##map',
+    '#&oxylum#%topia(!s""z1!$z642"\'hemilev#$urov""vm "e%!&&amp;t"\'mdash;2"%prime\'&&prime!"-1"*75&ndash;6',
+    '#$ores"#day"%facts"!w!#.15"!7"%g.the##ray"$w.a.!"/3"!c"!l!"1+""10""5b',
+    '!"2+!"4+!#7.3!"8+!$a-16"%dbert#"es#%frith"%gling"\'ldberht#"ey"#mer"%nwulf"(r-biting$%flaps',
+    '#$hart#$lham$%iness$$ocks$&sfield$"y-&%1960s&\'closing&%hours&&summer&&to-mid%$care#%nable#"s.$#ham',
+    '#)th-people%$like%$ward##wax$&igging"%sdale#%edale#!i#"ky#\'t-bound%%ender$%brook$*erby-smith&$time\'#yre',
+    '$%ville#+y-listening%+to-remember")ton-clark!"b3""be#%ingei"&endeng$&hausen#&rsbach"#lis"&onezer"\'rington"+ullioscopic#%rneum',
+    '"!.""2n#!r""4v",cles/chamber&&bourne"&dicius"&hidnas$%nacea#\'marcach#*o-sounding$&locate"#ker%%sberg#4hardt-gramatt&eacute',
+    '#$land"\'lac/fao$!t"(o-freaks#"ed#%label#/nomic/political(!o&(y-minded#(ri-bamhi&(digested#-tech-approved$+ools/oracle#%ville")toplasmic',
+    '"&u1,000$*50,000,000#)2,000,000##500#(atoriana#\'s-worth!&daphic"*drachillis""ek#%lsten##nic$!s"\'ge-tool)!s##ier',
+    '"\'ication#%n/mid$,burgh-london#%sford#\'t-point*!s$$ress"*lesborough"(monstone"%oardo"%s/gfi"1ucation/promotion$!e"+wards/great#%orthy',
+    '"#ptu!$f-tu"%1&agr"*fectively.)%ness.&,or-to-target$%nberg$\'rvesces#+lorescences#\'ulgence!&gg-box$$sacs%$ized#$bert#&layers',
+    '#"s."$idio"(lanteria&#yne"%natia""o-$\'centred$+development")regiously!#h16""25"%sanul!#icc#"on"$fion',
+    '&%forty&&legged($ngth&$node&%party&"to\'"ry\'%wenty%-een-month-old((th/early%(y-eighth\'%first\'%ninth""ji"#ker',
+    '"*nsturzende"(senhardt"$tzel!$jido!#kes"*land-olson""ra#"em"$wall!+l&iacute;as"&-arabi#%bahri$&rajneh#&gama\'a#(islamiya',
+    '"#abe$\'orative#%stics"(bow-room"-derly-looking%$ship"&eanors#*ction-time%+ric-powered(2ians/estate-agents&+o-classical(&plated(&static\'&candle)*rdiographs',
+    '\'$lier\'\'magnets\',nmicroscopic\',phoretically\')synthesis#$gaic##mer#$niak#$phas#&uthera#*ven-eleven"\'f-locks##ael#\'in-like#$land',
+    '"$iade$"hu#$ecer$$nsis#(minatory#$otic#&saveta"%lados#&erslie\'!y#)ipsometry$&s-beto&%evans#"oe"%masri',
+    '#%inius#%ridge""oi"#pis"#roy"&sheikh#$tead#%where"$uant##ned"\'vanfoot"#win!"m7")asculates""ba',
+    '&$ment$$rras#"l3$!a%#zon$&ements#\'ouchure#(roilment$(y-riddle##ury"%erton#"th""ic#%liani#!n',
+    '"\'manuele"%oting%%vists"&p-name#+athetically&&ically\'$sing#&ereurs#%hasys#/irical-rational#$lace$/oyee-controlled#&oriums#(tinesses$)y-handed.',
+    '")ulsifying!"n-"%actor#$horo#\'mellers#)ntiotropy#"rd"%borne"\'cashing$%ustic#\'hiladas$\'ytraeid#%ratic",d-cretaceous$(february',
+    '$(of-grant\'$june\'$tour#\'emicity\'!s#\'members#(ocuticle$(metritis$)pleurites%(terygote$!r%$sees#%quote"#eme$$ies.',
+    '%-y-inefficient\'%using#\'voldson"1fant-b&eacute;ate&#ins"&ggaard#\'ine-off#)lish-held(\'looking()qualified\'\'/german((scottish#)rossments""im"(kianthus',
+    '""ne"%olase#%xious",rag&eacute;s"*shrinement%$ouds#%laves"\'tamoeba#&erally%)oglycagon%.prise-specific#(ity-hood#,omologically&*pathogenic#\'raining',
+    '$*elacements%,preneurially%!z$#ist$*y-versions%#way"(ucleated"&vigado$!r%)omentally&+nment-based+)al-impact$%sions")zymically!)of&num;-1',
+    '"#rtc!"p5"!d"(icentres$&ranial#.demiologically#%phyte#\'siotomy$%tates&#xis#)thalamium$%omist")ochbackup#%iesen"(pleworth',
+    '!)qualisers%)ly-spaced$&tional#&erries#(iangular$$desa$#nes$,significance$)valencies)\'t-sized!$r_in")astianism""ed#&mbalds#%sburg',
+    '"%igena#!s##van"#men#\'intrude""na"&odible#$tism$&ogenic"&rantry##oll"$sten")uctations")vin-tripp".ythroleukaemia',
+    '!\'s-335td"%bjerg#!w"+capologists#"ob$"la%#mbe$(rt-sized$!t""di"!e"%helby"\'mereldi##und"&perado',
+    '#$iell$!r#&lugues"&rc/dti%&sports"&saying%*s/projects#&eintes$4ne/zadokite/nazarean%(tialisms"#tar#+eb&aacute;n$"la$.ren&ccedil;uby%#son',
+    '#*rangements$$echo#&uarial\'#es.#%wicks!#tc\'"&endard(!s")hereality&"ge#\'ogenics""re"&tinger")ymologist%!n',
+    '"\'geniusz#(lycaemia*!c"-ler-bernoulli#\'ogising"(rhetemec#,o-commercial%$diam%+enthusiasts%*pessimists%)sceptical&$wiss%$wide$)/domestic$*commercial',
+    '%&xpress$&issues$$mark$.p&eacute;ennes%\'eanists)&zation$%sites#&yanthe$%thmic"&social#\'tachian$%ernum"(therians#&rophus"!y',
+    '!,vans-kerfoot#5poration/solar-flares"%elyne#+nhandedness$)ing-dress\'(/weekend$\'t/state#\'r-alert%(cheerful&&urious%)recurring%"so%%wider$,ard/forestry$$ests',
+    '$(y-needle&#one%!b%$mole%%woman##tts#&ything"%genii")il-minded"&o-seal#$stik"$reux"#una!1welme/oxfordshire#$s/ha',
+    '!%x-all$&rchons#\'bauhaus$"ig%$shop$#oss%$xers%(yfriends#&cadets%$rers$%ell-o$&helsea$(igarette$\'omputer%%ntras',
+    '%$unty#&dealer%\'tainees$&igital%\'rectors#\'enemies##fun#(generals$*irlfriends$#oon$(ravesend%$owth#)hibernian$#ome#%ibmer',
+    '%,ternationals$"ra#)maharajah%%rried%$tron#(northern&$wich#\'officer#(peasants#\'railway$(esidents\'%sters#(scottish$&kipper$%laves',
+    '$&pecial%%ouses$$tock$"un#(teachers#*university$#ssr#)workmates"#/ex"$alfa#%minee")cellences$\'ptions.#$imer#$lave',
+    '#&oriate#!u$&lpated""d6"$eats#\'cration*!s$+utive-class*&minded#)getically#%quies#$rcal%%isers""f5",haustiveness',
+    '#(ortatory&#ers"(ocytosis#\'geneity\'#ous#\'spheres"*patriation#!e$&cially%(torating$%diter\'!o$"ns$%rt(s)&$ises',
+    '#\'licates#$o\'92$&sitors%(tulation-!s#!r$*ess-backed\'!o$)opriators"*servicemen#)heathment"*tensionist&#ors$\'rnalise)\'zations',
+    '+\'imposed#(on-smith#(ra-basis&)community&$high&+infinitival&&mental&)parochial&\'worldly%*cellularly&&ranial&"t.\'$able%\'ditions%\'nuclear',
+    '%)pyramidal%\'uterine$)insically"%ulans!\'ye-bath$&lashes$\'patches$\'shadows$%teeth&%sting#&bright#%holes#$pads"#kyn"#nde',
+    '!%zekwe""io *f&aacute;l#$mp;d&!w\'!s"&bsol;h"+eacute;raud#(uml;anor"+mdash;ed-up".uuml;rstenburg!"\'1!#(a)!&******""ck',
+    '"#map"*one-eleven"$pawn"%words!".1""2b"!3"!4"!6"$a.o."(b.i.h.q.""is"$o.b.$!r""p.',
+    '#$upp."$t.i.!+/00/23/2244*"57""24#\'9&deg;s"!c"!s!#1\'s"$,000"$-11s"%0,000#\'0/turbo"#17a""35',
+    '!"5+"$,000!"6+!"77!!="!3"!4!$a-la%!s"$ades#&ssenii"$b-ms#"ae##bro#$rick',
+    '#\'ulation%+ous-looking"(ce-cream$#ful$(lessness$!r#+ilit&eacute\'"y.#(t-filled$\'/belief$$card$#ive$$or-1&$ials&)s/invoice',
+    '($like(&owners$*s/symptoms#+ulty/campus"#ffa"#gus"#had"(ilsworth#$nsod$(t-object#(r-spoken$&bourne$4ford/gloucestershire$&thorne$%world',
+    '"(jgembaum"$kirs"$lias#%kands$$iner$.lands/malvinas$#ner#*libilities%&ng-off\'!.\'!s$&swater$&tricks##oon#+se-positive',
+    '$#ies%$ties#"un"*miliarises%&y-like\'$size#!s"(n-tastic$\'vaulted#)fare-like#&g-like#$hams#"s.#\'tasists""ps',
+    '#/aday/industrial#$ceur##dis##ish&"ta##ker#\'m-hands%&raised$$life$)steadings$$wife#\'nlucher$$olls#%ooqui$$uche',
+    '#&iladas#+t-improving%(swimming$-er-than-light%\'st-ever$$food")t-bellied$$cats#%afehi#"eh%#pur$"st#%her\'s&*-confessor\'-in-common-law',
+    '(%to-be$!i#$less##mir##tie$"ys##uus"6ubourg-st-honor&eacute#)lt-finder&(response#$roux#%ssett#%x-pas"$vola$%rably',
+    '"#w.2##don#!s"&xmodem"$youm"%zekas$#ley!$b(n)"!k!$c-60"!6"!d""ei""hd"!i',
+    '"$aley#&r-free$!.#%stday#)ture-film"*b&ndash;28*!4#(ruary-17"%chner#\'klessly"$d-ex#$bank#&erates#$oras"%edin\'',
+    '($time##led"&hlmann#!r""is""la#%combe#*dgendarmen$!t#$lahs%$tion$&fields$.ow-councillors(&urates\'&pupils',
+    '$\'walkers#(oniously#"tz")male/male#!i$%nisms#)me-fatale"+nce-mending$"ot#(der-like#\'erbahce$$stra#)itrothion#&niwick"!o',
+    '#%ebant$%ntino#"gy#\'inghees#,managh-south%"ta$$euse$#oys#&n-rich$"ey$$wood#8rari-iba&ntilde;ez-bruni$\'et-like$"i.%#era',
+    '$*o-magnetic$"um$%ymead#1t&eacute;-bernard#%vency$"or#&zenaar""ss#$tina&#iog$*ungsgraben"$tich#&oscopy"%uerle#%illes',
+    '"&zziwig!%f1600"!2"$itch""ps"$r1.5%!8%!9$!1#"21$!4$!5#"50$!5#"60',
+    '#%ansis#"ed!$gr.2!%iacre#+nc&eacute;s\'%grave"+bre-counted$%illae$\'oplasia"!c#!t$!a"+eld-pattern%%/core%%mouse',
+    '$%iness"/fteen-foot-high(&second$(h-former&$rate$\'y-ninth&,one-year-old&%rupee&%third"(g-leaves#".6$!8$#9.1$!l#%ueras',
+    '\'&scenes#$wort")jian-born"#lan$$rial#$e(s)$%store$(t-o-fish#&iation$(bustered$%grees#"la$+ed-aperture%%nbaum$&inelle',
+    '#\'m-stars$&/video$$land$"on$$work#\'oplumes#(ter-feed$)hy-minded$%rates"+n-de-siecle#+alit&eacute%!y$,ncial-market)+ly-stricken#3ch/northamptonshire',
+    '#$dias#&e-spun$#don$(ly-honed#+ger&lt;s&gt&&picker,!s&$work#&ishin\'$$tary##kle#&landia#$nart$&ingham%)sh-soviet',
+    '#&tastic$"ry#$vest"\'r-cones#,e-and-forget%$back%%cults%%fight%(lighting%)retardant$%backs$%doors$%house$\'lighter$!r',
+    '%\'fleshed%&minded#)st-fruits&)magnitude&$rank\'"un&&strike"\'sclands#+h-dispersed&%rying%&houses$&burger$(er/clark&#ian$$ouse',
+    '$%tanks"&tch-rs%"er#\'ted-out%*r/armourer$%ings.#(zbillies$\'gibbons$&warren"-ve-and-twenty%\'day-old&*imensional%)foot-high\'"ur%)hundredth',
+    '\'&vement%%phase%#ten"\'xtures."&zzbang!)jord-like!4l&eacute;g&egrave;re"#090"(abbiness##cca$$kery#%dbury#)gellating$&staffs&#ick',
+    '#,mb&eacute;es%#ard$+e-resistant$!m%"ae%"ea#&ndrian$%nagan&!n#%ounes#\'sh-back&&floods%$iest&"ly&$ness',
+    '%&capped%(dwellers%\'floored%&leaved$"/f$&blocks$#tie$%wound#)virostris"$echa#)ecy-lined#$hman#%issig#-mish-speaking#&nsburg',
+    '#)shing-out%)y-fruited#*urs-de-lys")ight-data&%cases&$deck&%paths#%msily#*nt-bearing%%locks#%tches""oc$&culent$$kton#"gs',
+    '$#gie$$sies$$zies#\'p-eared$$pier#\'rabelle%"le$%estal%!t$0ian&oacute;polis\'!o%"ca%%melia$%renes#\'tation.',
+    '%#ing#&w-line$*er-printed\'\'scented"!s#!.")ucytosine#\'ffiness#,id-inclusion&$rock#*orescently%+imetrically&#nes%\'ocarbon\'&hromes',
+    '&*scopically#)sh-fitted%"er")y-cruises$\'fronted$&papers$$shit#$ball#$half#(ing-boot&!.#$trap!$m118"#aj7"!r',
+    '!(o\'c\'s\'le")am-rubber"*calization#!o"$dies"*g-shrouded#&elberg$$yish"\'instone"&ldable$$boat$%ed-up$"ie#$igno$%vores',
+    '$&ingham$%loric$$moot$%stone&&umyren#-low-my-leader\'#up.&&ing-on*"up##som"(nblanque#&dacion$#ler#$t/da$#asy',
+    '$%evivo"(od-borne%\'for-sex%$rich$&/drink$$less#"t-%$army%+in-the-door%(operated%*passengers%$race%$sore$#bal\')l-related',
+    '$#gun$-path/cycleway%$oint""pp$%eries"&quismo"+r&ccedil;as#$bury#&ce-fit%)d-landing$%ibles##den$"un#\'e-limbs%$paws',
+    '%%wings$"au$&castle$%head.$)ign-going((sounding$\'mothers$\'quarter$#ros$!s%*t-dwellers\'%green\'*management$(warnings#&faiter',
+    '%(ry-proof$\'ivingly$#oes#"ia$$stas#(k-tailed#%larty#)m-meaning$$.lst$&/first$#als%&tional\'$vely$$igny$$ston',
+    '%!e&!s$\'wearing#&talice$(ereshaye$%ieths$#riu$.y-one-year-old#,ward/reverse$#ood"$ssae$&icking%)l-hunters##tin""ta',
+    '#&l-play%(tempered%#ups$$rice$$sham$!y#-ntains-abbott#-r&rehy;fifths$+-and-twenty%#cpu%\'day-old%\'fifteen\'"ve%$hand&/undred-year-old',
+    '%%motor%\'nations&$ight%&o-four&$ared%0seven-four-seven%$time$%/five%!m$)teen-mile)#two%)h-formers\'&ranked\'$term"&veolar',
+    '%!y$$mere#%nhope")x/parents#$hole#(trotting""ys!.r&eacute;teval"!1""72"#aca$&tions.\'$usly#*gmentarily#&ilness',
+    '$$card%\'isation\'!o%\'o-dutch\'\'flemish\'(imperial\'(japanese\'*vietnamese&&phobia$%gible$\'kenwald$%sella$,ti&scaron;ku%%zuzov$#zia',
+    '$#res#(ud-proof$&enfeld#$zzle&#ing""cr"\'eak-out%%sters#+dericksburg\'&ksburg$&rikson#(e-agency%&basing%$line&&oaders',
+    '$#den$$mont$$will%$oman$%zable%$e-up)!s%%obalm#)ightliner#"ke#*mont-based#+nch-british&)/canadian$#kel#-s/recruitment',
+    '$"h-&\'tasting%$ford%*ly-hatched$#nes$!s#$tsaw$#ton"+i&ndash;sat#$berg#0day&ndash;sunday$$eric$+ge/freezers#$eden%%maier',
+    '$-nds/relatives$"sz#.is-christensen#%sbees#$tton#*zzy-haired"&o-ings#(ckcoated#&g-like$#att$%march%$outh#"id#$m/to#\'nd-like',
+    '&%style%%board%$inus%(oclypeal#*st-damaged%#ies&$ness%#rup#%wners$"sy""s1"(uit-bowl&%trees%$hill#%mpish',
+    '$"os"!w"%y-ups!$s-77"$3000",a-authorised#!s!%t/day"!2"!b"!w!&uck-me%#ups$$head"*el-burning',
+    '"(glafjell"!h"\'jicolor$"ta"!k"\'lgencio$#ida#-l&rehy;length*%scale$(-bosomed\'&ttomed%&rigged$.y&rehy;fledged%*-automated&*functional',
+    '&+illustrated&&loaded&(restored#$vous"(mblingly#\'ec-al/c#%itory"0n&eacute;railles#&-fairs$\'seekers#0ctional/notional*!s%"us$"up#+damentality',
+    '%$ness$%sters#$time"*r-collared&%vered#*by/swindon#"ca#"le#+nes-ambacht$3iture-manufacturing#"or#&riness#*ther-flung\'\'/higher#%usato',
+    '#%itron#&ulines"-tures-forward%%ology"%zzily$)y-wuzzies!$w14b"!c"!h!"x."!4"#740!"y5"#ned""rs',
+    '"(ouml;ran!"+a!%-bjhs"%sport"$type!&.a.r.y"#i.s"#p.s"$w.d.!"/2""cc"!m",s/m&amp;sup2!"12"!s',
+    '!"58""ec!#6pd!#7\'s"#pt8!%a6000""be#"ou#$rels"$dafy#$bury##ded$!i#%zooks"(ederopus',
+    '#(l/labour$#dom#$rwen"&fferty"&gauzia#%genau#%liano#"ra"(illardes#(nesville$!i$\'sharing#%sberg"!k"&labeah',
+    '(#ide$#pas$"ti&"an$"va$#zov#%enism$$ttes##ico$"en$!l$$nski$$tsky#(l-stones$"as',
+    '$%icano&"us%$more%\'naceous$"os##oob#\'vanises(!m"&maliel#$bell#&e-park%%shows$%heads$\'splayer+!s',
+    '$!z##ier$!l$$mune$)ng-houses#(lestaden#(ma-amino$!e"#nay#$esha#(gbusters$(cyclovir$\'sterish#%zouri"&ositwe',
+    '")rbage-can$#ure#.dener/handyman##ets#$izim#&mendia#\'nitures$,ons-williams#,raway/london)&milton$#iga$%ulity&%ously)$ness#%scube',
+    '$"on#%tnait",s-generating%\'uzzlers$$rich$%tight#$bags#$hing#4kins/gloucestershire#$mask#%olene#$tons$)rectomies%.oenterological&$nome',
+    '&\'schisis&$tomy""ta$"-1#)e-crashed$\'crasher$-sheadwhickham#$land##off#%trell"%udete#&lliste$#ois$(t-millau#)ss/ampere',
+    '"\'velkind$!y"%wkily%$ness"$yest#$wood"#ze.$#bos$#ley$"rs!%benga!&c-rich"#/ms""bs"%e/cse',
+    '!,da&nacute;sk"*p-liganded!"e7"#ake#&r-down"$bots#\'reyesus"#cas"#dan"&e-gaws#"ch$!o#$ring"$hrig""l.',
+    '$"ch")m-cutters$$like#$base#&inorum"+n&egrave;ve#%\'rous#,der-balanced($lind\'%coded#\'eralife$"s.%#ius$/tically-altered,&mapped',
+    '$!c$&tality#%klene##ned%$lmen%(villiers##oas#+re-specific#\'tamycin$*le-natured%(y-spoken#(uflexion#$zyme"-o-demographic#*chemically',
+    '#&static$*ynchronous#(tectonic#$urgo#%works"-ranium-filled)#red$!s#%brand##gis##ing#*man/french#%ontic&\'ocratic$$usia',
+    '$\'ymander##sau$\'honites"-samtkunstwerk#$etzt#&ophola#$tate$&urally&\'e-based"2t-away-from-it-all$"in##hyn##ter$!i%&ng_fed',
+    '"$ydar#\'stliche!#gcc"$frp3!"h8"%affir##ill"&iordes#\'radelli$"ei"!k"&osties"$raib#!u!(iacalone',
+    '$%iceps%#ngs$$osus$,s/auctioneer%#ite#&co-brl#$lett$"in"&dleigh%!y"(ft-horse"&gabits$%hertz$(ntically$&switch',
+    '"(lberdyke#0es-in-the-fields#%leece%!y$*iam-knight$$otts$(yflowers#$mans$"or#*t-buttoned",m&eacute;nez##ble"%nelli$#tta#$gell',
+    '#!k##nel"$orgi&"os%"os#%seffo"$pies#\'sy-like"*r&oacute;n#.audi&egrave;re#%dered$!s#\'l-child%%human$$:boy',
+    '"&scours#$enyi"\'ve/take""wa!&jyzari!"l2"#aad#%bella#1cial-interglacial#)d-handing$4ding/gloucestershire$"is$#kov#\'nd-like%#ula',
+    '$!o$%rafon$"tz##sby$)nostalgia$(s-makers&+partitioned%%maker%\'workers(!m##vas$(es-smith"(ebelands%$rune#%nboig',
+    '%#ora$\'dalough%&ermott$#gar$(moriston$\'ridding$%shiel$&tworth##yre"$inne#)oblastoma"#n51"*obal-scale$#uli#"jo',
+    '#&ryland#$ttis%+ochronology$!z#:ucestershire/herefordshire#&wworms"-u-ser-gln-glu#&cksman&$tern$\'okinase#%ed-in#*tamatergic$!s"\'ycerius&+ophosphates',
+    '#"ph!"mv!%naeus#%shers&!s"(omically$$onic!&o-down#%slows"!1""af#)l-kickers%*orientated$&kicker$&mouths',
+    '#)t-keepers%$like$\'keepers"(bstopper"#cha"(d-bearer$)knows-who#(children##dis##eau$$rich#$fred#$hood#$inho#(parental',
+    '#)win/julie&"es&#ian\'"sm"(eldiella%#ner"\'garburn"$itre""ju"$lant$"zo##car#)d-diggers%&framed\'%inged',
+    '&*rospectors%&topped$$blat$!e%\'n-white(%inged&$berg&$rail&!s$\'panners$%stine%%worth#&f-bags#&iardic##lan',
+    '#!o")ma-foutou",n&ccedil;alo#"ad$(pophyses#\'gylidia##iwe#(tcharova#,z&aacute;les$-alez-casanova)(foerster"%ochie##d\'n$$-bad%%class',
+    '%"oh$%stadt&#ein$*win/oxford($ross##lie"#rau#\'batchev#"do%(n-somers#"ie%!r$#zia##maz##nei',
+    '$!e$"in##tex"&script#+den-trained#&sipers#$wami"&tthold$#lob$!s"%uffre#,gh-calthorpe#$jons#$lane##mba',
+    '$$ette$!i$$mont#/veneur-generaal""v.#&enment$&rnessy&.ment-initiated+)organized+(provided+*subsidized-\'pported&(or-elect"#yas#!o',
+    '"!b"(iib/iiia!#r.3")ace-notes$#kle#%dable%#cac%"ra$\'iometer##ft-%"ec%.on/oxfordshire#,ham-campbell\'\'douglas#&icunas',
+    '%$gers#(mm-latta%$aire#$n\'pa$)d-parents&%scale%$eurs%!i&&squama%$kids%%mamma%"on$"in%\'te-like&$oids',
+    '$\'olithic%%vskii$#sha$(t-giving$%uflex#)ph-search%+eme-phoneme%,ics-oriented%\'plotter##sby$(s-blades&%green&%verge%#box%#ina',
+    '#$ters$%ifies%$ngly#)y-nicolls$&fields##zer"$eady$"me$-t-great-great&&nieces&(sounding&\'tasting#%benik#$chko#&ediest',
+    '$3n-and-white-striped&&backed(#ize&&lipped&&topped%\'/yellow%%aways%(ish-blue%(leighton%&shanks&$ides&#ome&$tick\'$ones%&y-blue',
+    '$#ter#"gs##iff$"ne#%lombe#%nmore#+tton-watson#&villea#&y-clad&%oated%&headed%%level$&/green%%white$#law',
+    '"$icer#%dwork#%evers#.ffith-boscawen)%jones)(williams#\'llework##mbo$#sey%$tead$&thorpe#*ndley/gchq#%ppers%%ingly#%sdale',
+    '$%liest$#som$#tly#%tters%#ier&$ness%"on#&zzleys"&o-bags#$aner#%bbins#%garry##lla#%mwell#.nkiewicz-waltz',
+    '##per#)ss-paying%$hans%$mann#)tesquerie#&uchily$&nd-car(#rew\'$line&%floor&%wards\'#ell$"ts#-ve-stephensen#$wbag',
+    '#!e#%mpier#&ndfest%$norm$&enthal##son#%zzles"$ylls!"sb""ce""k3"!n""rs""sg"&t-dp-1',
+    '!$t-50"!g"#i-r!+u&icirc;nes""27"!4")aj&aacute#$mian#$naco\'!s$#gxi#$rana$-dianwednesday$#ura"*bernaculum',
+    '#!e#(mundsson"&elphic#&rnica\'#*ssing-game"#gas#(genheims##ler#%uletu"(ianensis#\'de-line#%lbert$#den%%halls&%ouses',
+    '$*ty-looking#&sarmes$#nes#\'tar-pop""la##ets#&ielmus#(l-winged##val")m-chewing#"ma%$tous#&shield"+n-carriages$&sloops',
+    '##boy##dog#"ne#%ports#"s.$#hop#%whale#%zberg"%ofeng"%renko$,tzky-cornitz$%vitch#&glings##mej#$neys',
+    '"%skind#$sman#&tatory"(ttenbruk%%rings$&iferae$%urals"&y\'s/st"%zzard!%warzo#%thmey"%inner""om!)yaku-zuki"!i',
+    '"$mpie")n/ecology"$psey"#res#+ostabiliser "h%!&&amp;w#\'uml;rke",eacute;rauts**o&iuml;que"$ohgr#-uml;tzendorff"(uuml;gel!%-home"!k',
+    '"!8"&k.t.c."$l.a."&m.s.o.!#/ne!"17"#97k!-2-antagonists"$o(l)#!2!!_!\'a\'pence"!.""af#(gen-smit',
+    '#$kmat#$rder#%strup""ba#"el#$ilis&&tation##lot#"te#!u"$cene#$hiro#&kettes\'!s$#ham',
+    '#"de%4nham/buckinghamshire#\'ersdorf"&eberle##ddi#$ften#*maelaeinen%,gglutination%#tin$%ocoel&(ytometer%*filtration%\'globins%&ptysis")ffenecker',
+    '"&gerhai##gie#)iographer*#ies"\'hl-koch"(igh-wood#(l&eacute$0-fellow-well-met$#ama#\'nes/nra#%r-dos$\'breadth$%shirt%&tylist$)y-chested',
+    '$"ch"$jduk#$rich"$kurk""la$!i$"wa##der#+f-a-hundred\'&minute&$rmed%\'barrels&%ricks&%urned%\'chances',
+    '&&ourses\'&vering%(derelict&$omes&&ragged\'#eam\'#ied\'%unken\'!y%&eleven%\'figures\'"ve%\'glasses&#ood%&healed',
+    '%%moons%$nude%#out%(promised%)sentences&"ix&(mothered&$teps&)uffocated%%tones%&walked&#ild\'"ts&$ords%%years',
+    '#$lard%#uer$\'elujahs%$well$%sbury$+ucinatorily##mai$$onds#$oing##sby#*ter-necked#$ved.##wes"&madani$$waki',
+    '$(shpachah#&mer-on&$fest&\'klavier$#ill$%ocked%(nd-heath%"ud$!s##oud&!a#)ster-like"#nbo$"ys#)ce/atomic',
+    '%\'blocked%#dug%)enamelled%$hewn%(lettered%(polished%\'setters%(tailored&%hrown&#ied\'$nted%&warmer$\'ed-down%&lsblad$$fork',
+    '$\'holding$#ies$,ley/cherwell$%print$$saws#$ekom#"ga$%leton%%iders#"ja#$kiss$"ow$&ypanky#*nam/oxford\')reporting',
+    '%!e#&s-olaf%%peter%&werner&\'olfgang$$trom"#pag$!i$!x#&lessly$)ochromine#-py-ever-after%%lands#(toglobin"%qqani',
+    '$#oka$,ssed-looking\'!r#(bourless$#utt#,court-reilly(,/oxfordshire#"d-%#ons$$case$*er-wearing$$side$%ware-)%based))intensive',
+    '#$elip$)m-masters#"ic$#deo#)latt/tree$(eyscreen$$otry#&mfully$,less-looking$&onicas\'\'zations("er%&rrhage#!o$#lds',
+    '$$ists##ras$(ier-like$$oway&%ingly#$shad#&thover$&lebury&%pools%#ing(#ton$#ono%"pp$$sett%$head',
+    '#*vey-bailey#)wich-hook"%shidu#&sanali&!e&!i%"rd#.tily-assembled%$ness#\'zeldine"\'t-boxes#&chment#&e-free#"hi##tee',
+    '$$rick"3uptsturmf&uuml;hrer#-ssmannization#.t-m&eacute;doc"%vards#+elsk&aacute$$n\'t.$$rgal%$sian"%wadie$*iian-based$#rth#%finch#$kley$%moths',
+    '"#xey"*yama-machi#.cock/cambridge#+don-baillie#"il#\'meadows#$nets#&reddin$!i%#cks#%slope##tor#+ward/thames")zardously)$ness',
+    '%%hurst%!y#&lemere#"op!+bsag/pre-s2!%cfc22!"d1"$test!(e-dryads#%he-he##she"$111s"0ad-and-shoulders%#off%$type',
+    '$\'bangers$&groups%$uard$-ington/oxford$,line-writers%!y$(masterly%(istressy$$rope$$ward#!h##nor#\'rkening$\'t-brain((eakingly',
+    '%$sick%%woods#+t-and-power%%proof%\'styling$(er/stats$%hbank$$less#-vier-than-air%)ly-lidded$*y-bottomed""b.#!s""dd#&eracea',
+    '%&cutter##ren"%edful#$rden"#fcs#&ferman#"in##lin"+h-heh-hehed#%ehehe#!l"$i-ho#,delbergensis#%ghway#%lbrun',
+    '#)m&aelig;y#%nlein##sig$"ts#!z"$kman"%lbing#%d-off&#ver$"er#!e$%nvale#&gafell#*ianthemums$%borne',
+    '$#ers$%othis#(l-hounds$%enios\'#sts&!s%$sdon$%ishly$&riegel$!y#\'metless$#ond%#res##pee$%less.',
+    '#(singborg#(vetianus"%mbury#!o#,pleman-adams/\'/arctic##son"(n-houses#%chard$!k#(dersonqc##ery$&strosa#$gham$#oed',
+    '#$llys$"ys#$naed$!i$#ock#$rick#$toff$!z"&parins$\'totoxic"&raclea#&bertus$"in##dan$%books',
+    '$(inbefore$$nton$"on$#say$$unto#&mitean$(opolitan#*niorrhaphy$"on#)o/heroine$%nians$%quest#+petological$&omyces#"re',
+    '$"od#)schensohn$%heson#"te"(seltines##ham#\'itated.#%leden#-p&egrave;rion$$erus#%sayon$+e-darmstadt"+terarchical%-odimerization&)geneously',
+    '&%meric&&philic&\'thermic\'"ic\'&rophic"+uristically"#ven"#was##ton"*xacarbonyl%\'hloride$/deoxynucleotide$%grams$#mer$&valent',
+    '##lin#!y"(zzlewood!$fc32!"g/"!h""sc!"h2"!3"!5!\'i-di-hi"!8",att-thompson%*s-thompson"&bberds',
+    '"&dalgos#*den/system&$ness#(ey-holes#$ouci"$ebel#&racium$\'ocratic"%gashi#(enbottam#/h&mdash;quality$)-achiever-!s&%ngled%%blood',
+    '&\'uttoned%*cheekboned&&ontext&&rowned%)falooting%%guard%\'hearted%$mass%&points&\'restige\'$ofit%*resistance%#tin&$rust%&vacuum',
+    '%$wing$$/low$$ball%#urn$#er-\'\'powered\'\'ranking\'#ups%*st-earning((grossing(\'profile\'\'/lowest$)land-type%(y-active\'&geared',
+    '\'(purified\')sensitive$$wood(!s"#kyu"$ldas$%esley#%liest$)s-trained%&brough$#yer#&perton##roy#$trud#"um',
+    '#\'melfarb##ont"\'nd-legs$&erance&#ton$*u-balinese#$gham#%ojosa#%teles%)rstoisser#$xman")p-hugging#%bones#$pier#%swell',
+    '""ro#$waun"$s118$"26#%cocks#*pano-suiza\'\'centric%!r##sey#\'tomonas%.pathologically%&ricise\'#ska$*rionically"&t-rate',
+    '%&hikers#)hertofore#*ler-stalin#)otsubashi""v+"!z#!b!#jkl!0la-a2.1-positive$\'disease"!l"!s!#mmh#!s!%nc/ds',
+    '""nh!$oads"(b-nailed%&obbing#!1#%bitic$$lers##lyn"#che$(stetteri#\'klingen#!l"$dden%$sden$\'le/town',
+    '#(ge-podge#)son-smith"%edown#\'flehner#"gh#$ness"0ffman/girlfriend\'*n-la-roche"&g-like##gin"#lan#$bach#&der(s)#%ed-up$"rs',
+    '#)iday-home#&landia$&er-von$%inger%"st$$ofil%)w-cheeked\'%faced&#ell#.ness/presenter#\'ocausts#(t-jensen$&ermann$#ons#Ay-place-from-over-the-great-water',
+    '#&zbauer"-m&oelig;opath#!a#"ba#,e&rehy;grown$\'-ranges&"un%(shopping$%/host$\'comings$\'gardens$$lier$%opath%#tic$$shop',
+    '##ine%$ines#\'ogenise($zing$\'polymer+!s"%nchos#+duras-style#(ey-brown&&eaters%0/gloucestershire%\'combing%$ford%$ghan&$uide',
+    '##ora"(of-beats$%ddorp$#ing$$pick%%rints#)gstraaten#"ha#!j#\'k-nosed#"to"#per#!f$%ields#$kirk',
+    '$!o##pit$#ner"$rder#)e-belisha##ham#0izontal-vertical#"ka#+lock/thames#(n-player%#rim$$aday$#don$&ibrook%#est',
+    '$&rimmed$)swogglers#!r$!i#*se-brasses&&collar&)droppings&$gear&$like(#nes&#mad&$shit%$nden$#ler#&tensis',
+    '%)n/manager%#rum"(se-pipes$%asons#"ie#-pitalisations#-t-independent$(/hostess$+:university$*age-takers$"ia"\'t-cross$\'footing$-off-the-press$\'rodding',
+    '$%shots#\'el-type%&school#*headedness#&ted-up%"rs#%wells")uldsworth##mus#%ngans$$sell#+rs&times;10#+se-breaking&$coat&)dust-mite',
+    '%#boy&\'reakers%#fly%%paint&$lace%$tops%#wiv&%orker$+ing-related$+ton-tenneco#&tekens$&hakker"&vercar"+w-do-you-do#&ardian',
+    '##lin#$royd""xa"$yles!$p.42""10""23"!5"&700/rx""n1"!t#!m"#v16#!6$#/11',
+    '"!g"!i#%stova"&ududil"!w!#sin$&-liang"#p90!%uacho#$lien"(bbelrath"&dspeth"$elva#$mmel"&ggable',
+    '%$sman$#ton"#ila#$tres#%zinga"(la-hoops#"ce#!m"&m-drum#*an-derived&$size%+itarian-aid%"us$#son##bs.',
+    '#(mersknot##ous#%pless#&ungous"#ndr#/garian-romanian$%riest##ker#%slett#\'t/chess$#ero$&swoman"#ong"&rd/raf$)y-gurdies',
+    '##ons#$ring#+st/pershore&*stonehouse&)worcester##ufi"%saini#,band/partner##ova##son##wil"%ttons"%waydi"&yghens&!s',
+    '"!p"!x!\'ydebank#*ro-carbons&\'protein&$stop%-gen-potassium+%wered\'(ologists%\'lipidic&&ysates%\'medusae%&planes"$geia"#mek',
+    '#\'n-books%(settings$!e"&ndford"(per-real%%aemia%.bilirubinaemia&&olical%(cellular%\'dynamic%*inflations%#nym(!s%%plane&,roliferation',
+    '%%scope&$onic%&volume$!s#-ochlorrhydria%%risie$(function$*glycaemics$%manic$/pepsinogenaemia%+igmentation%%lasia&&imnion$\'stasize#\'sometry',
+    ' *i&ndash;iv!&\'tibar!#(a)!$+/ii!"-c#&ontrol"(digested"\'explore"!f"\'zingari!".3"!6"$a.m."$d.p."!f',
+    '"$l.i.$"p.%"r."&p.s.p."$t.f."&w.l.s.!#/os!#972!"=3!#acc"!m""ra!#bas"\'betsons"&erians',
+    '!#c1a"#d-o"\'e-floes$&houses$&screws#&creams#&lander#$pack"$hael#%ikawa#(neumonid#*thyologist\'\'stegids"#ier#!s',
+    '#$onga")on-driven$(ological!"d1"%ea(s)$+/expression$"al#\'ntical.&%fied."%iomas##tis"*ol-worship"%rissa!#eds!&f&ouml',
+    '"!d"$ugao!#gg4"!h"#nat#&itions#&orable"%raine!"hd!*i-negative"$.ii."#/kg#$st.g"%i.ii.&"i.',
+    '!"ji!\'kazobor!-l-2r-negative#$sung *rheindalen',
 )
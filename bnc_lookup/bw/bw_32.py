@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_32 = (
+count_32 = 6695
+
+heads_32 = (
     '&pound;250million',
-    '&pound;252',
-    '&pound;254',
-    '&pound;259,000',
-    '&pound;26.1m',
-    '&pound;26.20',
-    '&pound;26.5m',
-    '&pound;26.75',
-    '&pound;260.',
-    '&pound;261m',
-    '&pound;262,000',
-    '&pound;265,000',
-    '&pound;266',
-    '&pound;269.40',
-    '&pound;26million',
-    '&pound;27.1',
     '&pound;27.40',
-    '&pound;27.70',
-    '&pound;272,000',
-    '&pound;279m',
-    '&pound;28.75',
-    '&pound;280m',
-    '&pound;281',
-    '&pound;282',
-    '&pound;282m',
-    '&pound;287',
-    '&pound;287,000',
-    '&pound;29.6m',
-    '&pound;29.7m',
-    '&pound;2950',
-    '&pound;296',
-    '&pound;297m',
     '&pound;299.99',
-    '&pound;3&ndash;4',
-    '&pound;3,000-a-month',
-    '&pound;3,655',
-    '&pound;3.0m',
-    '&pound;3.13',
-    '&pound;3.16',
-    '&pound;3.1bn',
-    '&pound;3.3bn',
-    '&pound;3.3million',
-    '&pound;3.5billion',
-    '&pound;3.5million',
-    '&pound;3.77',
-    '&pound;3.7million',
-    '&pound;3.81',
-    '&pound;3.9m',
     '&pound;3/4',
-    '&pound;3/kg',
-    '&pound;30,000-worth',
-    '&pound;30.1',
-    '&pound;30.2',
-    '&pound;300&ndash;400,000',
-    '&pound;300,000&ndash;500,000',
-    '&pound;300-&pound;400',
-    '&pound;304million',
-    '&pound;305,000',
-    '&pound;306',
-    '&pound;30bn',
-    '&pound;31,500',
-    '&pound;31.20',
-    '&pound;31.5m',
-    '&pound;31.8m',
     '&pound;31.95',
-    '&pound;311,000',
-    '&pound;314',
-    '&pound;314m',
-    '&pound;316',
-    '&pound;32.5m',
-    '&pound;325m',
-    '&pound;33.1',
-    '&pound;33.99',
-    '&pound;331,700',
-    '&pound;338',
-    '&pound;339.22',
-    '&pound;34,500',
-    '&pound;34.5m',
-    '&pound;34.70',
-    '&pound;34.90',
     '&pound;3400',
-    '&pound;343',
-    '&pound;358',
-    '&pound;35bn',
-    '&pound;36.2m',
-    '&pound;364',
-    '&pound;367',
-    '&pound;369m',
-    '&pound;37,500',
-    '&pound;37.1m',
-    '&pound;37.2m',
-    '&pound;372',
-    '&pound;374',
-    '&pound;374,000',
-    '&pound;38,500',
-    '&pound;382m',
     '&pound;383m',
-    '&pound;385,000',
-    '&pound;3854.03',
-    '&pound;386',
-    '&pound;39,600',
-    '&pound;39.2m',
-    '&pound;39.8m',
-    '&pound;39.90',
-    '&pound;391m',
-    '&pound;399.99',
-    '&pound;3billion',
-    '&pound;4,000,000',
-    '&pound;4,180',
-    '&pound;4,509',
-    '&pound;4.35',
-    '&pound;4.40',
     '&pound;4.4million',
-    '&pound;4.59',
-    '&pound;4.5bn',
-    '&pound;4.69',
-    '&pound;4.72',
-    '&pound;4.79',
-    '&pound;40,000-&pound;60,000',
-    '&pound;40.1m',
-    '&pound;40.50',
-    '&pound;400,000,000',
-    '&pound;402',
-    '&pound;407',
-    '&pound;41,200',
-    '&pound;41,660',
-    '&pound;41,700',
-    '&pound;41.50',
     '&pound;413m',
-    '&pound;414,000',
-    '&pound;416',
-    '&pound;42.00',
-    '&pound;426',
-    '&pound;43,225',
-    '&pound;43.60',
-    '&pound;438',
-    '&pound;439',
-    '&pound;44.3m',
-    '&pound;442m',
-    '&pound;45.00',
-    '&pound;45.20',
-    '&pound;45.30',
-    '&pound;45.3m',
-    '&pound;451',
     '&pound;454',
-    '&pound;458m',
-    '&pound;45million',
-    '&pound;46,500',
-    '&pound;46.95',
-    '&pound;46.99',
-    '&pound;461,000',
-    '&pound;461million',
-    '&pound;462',
-    '&pound;465m',
-    '&pound;466,000&ndash;600,000',
-    '&pound;47,200',
-    '&pound;472',
-    '&pound;477',
-    '&pound;479,000',
-    '&pound;48.8',
     '&pound;485,000',
-    '&pound;486',
-    '&pound;487',
-    '&pound;4914.91',
-    '&pound;493,000',
-    '&pound;495,000',
-    '&pound;498',
-    '&pound;499.95',
-    '&pound;4m.',
-    '&pound;5&ndash;6',
-    '&pound;5.1',
-    '&pound;5.15',
-    '&pound;5.42',
-    '&pound;5.60',
-    '&pound;5.60/30ml',
-    '&pound;5.75m',
     '&pound;5.79',
-    '&pound;50,000-a-year',
-    '&pound;500,000&ndash;700,000',
-    '&pound;500.',
-    '&pound;506',
-    '&pound;513',
-    '&pound;516',
-    '&pound;52.00',
-    '&pound;522',
-    '&pound;523',
-    '&pound;524',
-    '&pound;528',
-    '&pound;53,500',
-    '&pound;530,000',
-    '&pound;539',
-    '&pound;54.90',
     '&pound;545m',
-    '&pound;55.00',
-    '&pound;551',
-    '&pound;560million',
-    '&pound;567',
-    '&pound;575,000',
-    '&pound;575m',
-    '&pound;57m',
-    '&pound;582',
-    '&pound;585',
-    '&pound;585,000',
-    '&pound;588',
-    '&pound;59,000',
-    '&pound;59,500',
-    '&pound;59,950',
-    '&pound;59.40',
     '&pound;59.50',
-    '&pound;599.95',
-    '&pound;5m.',
-    '&pound;6,000,000',
-    '&pound;6,100',
-    '&pound;6,200',
-    '&pound;6,900',
-    '&pound;6.10',
-    '&pound;6.39',
-    '&pound;6.58',
-    '&pound;6.85',
-    '&pound;60,000.',
-    '&pound;601,000',
-    '&pound;607m',
-    '&pound;60k',
-    '&pound;61,500',
     '&pound;616',
-    '&pound;616m',
-    '&pound;617',
-    '&pound;619',
-    '&pound;62.4m',
-    '&pound;62.85',
-    '&pound;627',
-    '&pound;629m',
-    '&pound;6300',
-    '&pound;636',
-    '&pound;63million',
-    '&pound;643,000',
-    '&pound;645',
-    '&pound;649.99',
-    '&pound;64m',
-    '&pound;65.3m',
     '&pound;66.',
-    '&pound;660m',
-    '&pound;672',
-    '&pound;673m',
-    '&pound;675,000',
-    '&pound;68.4m',
-    '&pound;68.50',
-    '&pound;682',
-    '&pound;683',
-    '&pound;685',
-    '&pound;685m',
-    '&pound;690',
-    '&pound;699.00',
-    '&pound;7,400',
-    '&pound;7,560',
-    '&pound;7,900',
     '&pound;7.',
-    '&pound;7.30',
-    '&pound;7.4',
-    '&pound;70,000&ndash;90,000',
-    '&pound;70million',
-    '&pound;71,400',
-    '&pound;71.6',
-    '&pound;715',
-    '&pound;72,637',
-    '&pound;72.50',
-    '&pound;72.5m',
-    '&pound;720,000',
-    '&pound;735',
-    '&pound;74,000',
-    '&pound;74,950',
-    '&pound;74.50',
     '&pound;74.99',
-    '&pound;745',
-    '&pound;749.00',
-    '&pound;763,000',
-    '&pound;764',
-    '&pound;768',
-    '&pound;770',
-    '&pound;770,000',
-    '&pound;78,500',
-    '&pound;780m',
-    '&pound;784',
-    '&pound;787',
-    '&pound;78million',
-    '&pound;790,000',
-    '&pound;792',
-    '&pound;79m',
     '&pound;8,200',
-    '&pound;8,300',
-    '&pound;8,400',
-    '&pound;8,600',
-    '&pound;8,700',
-    '&pound;8.1billion',
-    '&pound;8.20',
-    '&pound;8.2m',
-    '&pound;8.33',
-    '&pound;8.4',
-    '&pound;8.45',
-    '&pound;8.60',
-    '&pound;80,000&ndash;120,000',
-    '&pound;80million',
-    '&pound;81,000',
-    '&pound;816',
     '&pound;819',
-    '&pound;824',
-    '&pound;825',
-    '&pound;82m',
-    '&pound;830m',
-    '&pound;835',
-    '&pound;83m',
-    '&pound;84.99',
-    '&pound;842',
-    '&pound;85.6million',
-    '&pound;85million',
-    '&pound;86.70',
-    '&pound;861',
-    '&pound;870,000',
-    '&pound;87m',
-    '&pound;88.8m',
     '&pound;880,000',
-    '&pound;898',
-    '&pound;89m',
-    '&pound;9&frac12;m',
-    '&pound;9,350,000',
-    '&pound;9,700',
-    '&pound;9.',
-    '&pound;9.20',
-    '&pound;9.45',
-    '&pound;9.60',
-    '&pound;9.70',
-    '&pound;904,000',
-    '&pound;905',
-    '&pound;90million',
-    '&pound;91',
-    '&pound;92,000',
     '&pound;928',
-    '&pound;934',
-    '&pound;940,000',
-    '&pound;944',
-    '&pound;95.00',
-    '&pound;96.4m',
-    '&pound;969',
-    '&pound;976',
-    '&pound;97m',
-    '&pound;99+vat',
-    '&pound;pound1',
-    '&pound;pound11',
-    '&pound;pound6',
-    '&pound;yyy',
-    '&scaron;vabinsk&yacute',
-    '&sect',
     '&sect;278',
-    '&thgr;-row',
-    '&times;100',
-    '&times;13',
-    '&times;14',
-    '&times;375',
-    '&times;52',
-    '&times;6',
-    '&ugr',
-    '&uuml',
-    '&verbar;l&verbar',
-    '&yen;2',
-    '\'/',
-    '\'36',
-    '\'52',
-    '\'68/\'69',
     '\'70s/early',
-    '\'air',
-    '\'an\'',
-    '\'andle',
-    '\'arm',
-    '\'asda',
-    '\'avin',
-    '\'directory\'',
-    '\'eathens',
-    '\'eavy',
-    '\'eft-ight',
-    '\'let',
-    '\'nother',
-    '\'nuff',
-    '\'olding',
-    '\'oliday',
     '\'osses',
-    '\'our',
-    '\'please',
-    '\'public',
-    '\'security',
-    '\'special',
-    '\'tatoes',
-    '\'though',
-    '\'where',
-    '(i)',
-    '**********',
-    '*************',
-    '***altered',
-    '**a',
-    '**gen',
-    '**jack',
     '**joseph',
-    '**kim',
-    '**louis',
-    '**paul',
-    '**pierre',
-    '**promoted',
-    '*andrei',
-    '*atanas',
-    '*brig.',
-    '*carlos',
-    '*chu',
-    '*chung',
-    '*col.',
-    '*could*',
-    '*david',
-    '*exec',
     '*fernando',
-    '*figure',
-    '*filein',
-    '*free',
-    '*george',
-    '*hong',
-    '*how',
-    '*i*',
-    '*including',
-    '*ioan',
-    '*islamic',
-    '*ivan',
-    '*joseph',
-    '*lt',
-    '*mian',
-    '*mikhail',
     '*muhammad',
-    '*name',
-    '*national',
-    '*nicolae',
-    '*not',
-    '*saad',
-    '*to',
-    '*unchanged',
-    '*vice-adml',
-    '*w1',
-    '*w2',
-    '*you',
-    '+0.5',
-    '+331',
-    '+45',
-    '+498',
     '+5.5',
-    '+90&deg',
-    '+altered',
-    '+h',
-    '+l',
-    '+s',
-    '-/',
-    '-///////',
-    '-0.006',
-    '-0.02',
-    '-0.071',
-    '-0.6%',
-    '-0.8',
-    '-1.14',
-    '-1.3',
-    '-114',
     '-116',
-    '-12.5',
-    '-150',
-    '-17',
-    '-18&deg;c',
-    '-196&deg;c',
-    '-2.0',
-    '-22&deg;c',
-    '-27',
-    '-28',
-    '-283',
-    '-3%',
-    '-3&deg;c',
-    '-30-',
-    '-311',
-    '-32',
     '-33',
-    '-41',
-    '-47',
-    '-488',
-    '-87',
-    '-93',
-    '-about',
-    '-actin',
-    '-are',
-    '-ate',
-    '-atp',
-    '-did',
-    '-dominated',
-    '-esque',
-    '-est',
-    '-from',
     '-gliding',
-    '-group',
-    '-have',
-    '-host',
-    '-ide',
-    '-in-law',
-    '-ists',
-    '-k',
-    '-male',
-    '-mercaptoethanol',
-    '-microglobulin/creatinine',
-    '-or',
-    '-pa',
-    '-peg',
-    '-pi/2',
-    '-r',
     '-radiation',
-    '-some',
-    '-ta',
-    '-tee',
-    '-three',
-    '-tubulin',
-    '-two',
-    '-us&dollar;150',
-    '-v',
-    '-values',
-    '-we',
-    '-were',
-    '-y',
-    '-yeah',
-    '-you',
-    '.009',
     '.16',
-    '.1670',
-    '.18',
-    '.1820',
-    '.50',
-    '.87',
-    '/&egr',
-    '/120',
-    '/ai/',
-    '/circular',
-    '/creatinine',
-    '/div4',
-    '/ei/',
-    '/for',
-    '/g/',
-    '/gcse',
     '/gm',
-    '/hour',
-    '/how',
-    '/in',
-    '/keyword',
-    '/m/',
-    '/mg',
-    '/mg/h',
-    '/min',
-    '/o',
-    '/q',
-    '/r/-insertion',
-    '/renault',
-    '/rhythm',
-    '/s/',
-    '/so',
     '/treasury',
-    '/w/',
-    '/we',
-    '0&middot;25',
-    '0&ndash;01',
-    '0&ndash;02',
-    '0&ndash;100mph',
-    '0&ndash;16',
-    '0&ndash;18',
-    '0&ndash;21',
-    '0&ndash;4&ndash;2',
-    '0&ndash;40',
-    '0&ndash;6&ndash;2',
-    '0&ndash;75',
-    '0-0-0',
-    '0-4-2',
     '0-60mph',
-    '0.00005',
-    '0.0005',
-    '0.003',
-    '0.005%',
-    '0.007',
-    '0.008',
-    '0.013',
-    '0.016',
-    '0.047',
-    '0.06%',
-    '0.067',
-    '0.06gm',
-    '0.07%',
-    '0.076',
-    '0.1&ndash;1.0',
     '0.1&times;ssc',
-    '0.12%',
-    '0.14%',
-    '0.154',
-    '0.155',
-    '0.15m',
-    '0.172',
-    '0.18%',
-    '0.1pc',
-    '0.218',
-    '0.2i',
-    '0.2m',
-    '0.2p',
-    '0.2pc',
-    '0.303&ins',
-    '0.315',
     '0.374',
-    '0.375',
-    '0.3hz',
-    '0.3ml',
-    '0.410',
-    '0.45%',
-    '0.4bn',
-    '0.56',
-    '0.578',
-    '0.6&mgr;m',
-    '0.6c',
-    '0.719',
-    '0.73%',
-    '0.7p',
-    '0.83',
-    '0.866',
     '0.8pc',
-    '0.9m',
-    '00.00',
-    '000,000',
-    '000.',
-    '000/year',
-    '00001.',
-    '000s',
-    '0031',
-    '00359',
-    '005',
-    '0050',
-    '008',
-    '00:05',
-    '00:34',
-    '00:37',
     '00:42',
-    '00:46',
-    '01-493',
-    '01-691',
-    '01-748',
-    '01-930',
-    '0102',
-    '0105',
-    '016',
-    '0161',
-    '018',
-    '01:02',
-    '01:11',
-    '01:13',
-    '01:18',
-    '01:25',
     '01:28',
-    '01:50',
-    '01:52',
-    '01:54',
-    '01:economics',
-    '02/89/1301',
-    '0205',
-    '021&ndash',
-    '023',
-    '024',
-    '0246',
-    '0250',
-    '0254',
-    '027',
-    '0277',
-    '0296',
     '0298',
-    '02:24',
-    '02:26',
-    '02:55',
-    '0301',
-    '0305-262697',
-    '0306.2',
-    '031-557-3194',
-    '032',
-    '0325',
-    '0330',
-    '0351',
-    '0364',
-    '038',
-    '03:00',
-    '03:10',
     '03:11',
-    '0403.1',
-    '0405',
-    '0405.6',
-    '0407',
-    '042',
-    '042093programe',
-    '0435',
-    '0438',
-    '044',
-    '0440',
-    '0443-223880',
-    '0445',
-    '0449',
-    '0460',
-    '048',
     '0482',
-    '0492',
-    '04:49',
-    '04:56',
-    '050&deg',
-    '0502.43',
-    '0503.24',
-    '0503.25',
-    '0504.31',
-    '0565',
-    '058',
-    '0580',
-    '0594',
-    '05:01',
-    '05:04',
-    '05:05',
     '05:07',
-    '05:12',
-    '05:13',
-    '05:15',
-    '05:22',
-    '05:26',
-    '05:33',
-    '05:36',
-    '05:38',
-    '05:42',
-    '05:43',
-    '05:46',
-    '05:47',
-    '05:56',
-    '060&deg',
-    '0602.22',
     '0602.43',
-    '0605',
-    '0610.1',
-    '0612',
-    '0620',
-    '0625',
-    '0633',
-    '0645',
-    '0654',
-    '0671',
-    '0689',
-    '06944-268',
-    '06:06',
-    '06:17',
-    '06:28',
-    '06:29',
     '06:33',
-    '06:37',
-    '06:40',
-    '06:42',
-    '06:43',
-    '06:58',
-    '0704',
-    '071&ndash;240',
-    '071&ndash;248',
-    '071&ndash;281',
-    '071&ndash;354',
-    '071&ndash;382',
-    '071&ndash;388',
-    '071&ndash;403',
-    '071&ndash;407',
-    '071&ndash;493',
     '071&ndash;497',
-    '071&ndash;522',
-    '071&ndash;538',
-    '071&ndash;581',
-    '071&ndash;588',
-    '071&ndash;602',
-    '071&ndash;626',
-    '071&ndash;636',
-    '071&ndash;638',
-    '071&ndash;724',
-    '071&ndash;730',
-    '071&ndash;735',
-    '071&ndash;736',
-    '071&ndash;738',
-    '071&ndash;831',
-    '071&ndash;833',
     '071&ndash;873',
-    '071&ndash;938',
-    '071-235',
-    '071-236',
-    '071-327',
-    '071-580',
-    '071-638',
-    '071-734',
-    '071-931',
-    '072',
-    '0728',
-    '075',
-    '0750',
-    '0761',
-    '0773',
-    '0787',
     '0792',
-    '07:05',
-    '07:07',
-    '07:09',
-    '07:11',
-    '07:12',
-    '07:16',
-    '07:18',
-    '07:19',
-    '07:36',
-    '07:39',
-    '07:47',
-    '07:50',
-    '08.10',
-    '08.15',
-    '080',
     '0800&ndash;1000',
-    '08035',
-    '0805',
-    '081&ndash;200',
-    '081&ndash;688',
-    '081&ndash;940',
-    '081&ndash;943',
-    '081&ndash;994',
-    '081-785',
-    '0825',
-    '0829',
-    '083',
-    '0839&ndash;141414',
-    '084',
-    '0840',
-    '0843',
     '086',
-    '087',
-    '088',
-    '08:01',
-    '08:09',
-    '08:13',
-    '08:15',
-    '08:16',
-    '08:23',
-    '08:25',
-    '08:28',
-    '08:39',
-    '08:55',
-    '09.00&ndash;17.00',
-    '09.00-12.00',
-    '09.25',
     '09.30&ndash;17.00',
-    '09.40',
-    '090',
-    '0901',
-    '091&ndash;232',
-    '0922',
-    '0947',
-    '096',
-    '097',
-    '098',
-    '099',
-    '0990',
-    '09:09',
-    '09:22',
-    '09:24',
-    '0:0',
     '0:16',
-    '0:58',
-    '0db',
-    '0lx',
-    '0m',
-    '0pc',
-    '1&amp;l/2',
-    '1&amp;times1',
-    '1&aring',
-    '1&divide&phgr',
-    '1&frac18;in',
-    '1&half;inch',
-    '1&mdash;6',
-    '1&micro;f',
-    '1&middot;0',
-    '1&middot;5%',
     '1&ndash;1.5',
-    '1&ndash;1/2',
-    '1&ndash;1/2ft',
-    '1&ndash;3%',
-    '1&ndash;33',
-    '1&ndash;60',
-    '1&ndash;78',
-    '1&shilling;2d',
-    '1(4a)',
-    '1(8)',
-    '1,000%',
-    '1,000-km',
-    '1,000-member',
-    '1,000-processor',
-    '1,000kg',
-    '1,000km',
     '1,000mm',
-    '1,005',
-    '1,010',
-    '1,011',
-    '1,017',
-    '1,019',
-    '1,022',
-    '1,028',
-    '1,045',
-    '1,047',
-    '1,053',
-    '1,060',
-    '1,070',
-    '1,071',
-    '1,076',
-    '1,079',
     '1,080',
-    '1,090',
-    '1,110',
-    '1,118.07',
-    '1,126',
-    '1,128',
-    '1,132',
-    '1,151',
-    '1,158',
-    '1,165,000',
-    '1,174',
-    '1,176',
-    '1,180',
-    '1,184',
-    '1,190',
-    '1,195',
     '1,198',
-    '1,2-',
-    '1,204',
-    '1,205',
-    '1,207',
-    '1,217',
-    '1,225',
-    '1,241',
-    '1,248',
-    '1,250,000',
-    '1,278',
-    '1,290',
-    '1,295',
-    '1,3-dithiadiazoles',
-    '1,307',
-    '1,308',
     '1,335',
-    '1,337',
-    '1,341',
-    '1,350,000',
-    '1,367',
-    '1,387',
-    '1,395',
-    '1,397',
-    '1,400m',
-    '1,402',
-    '1,410',
-    '1,435',
-    '1,440',
-    '1,441',
-    '1,460',
-    '1,465',
     '1,467',
-    '1,470',
-    '1,482',
-    '1,5',
-    '1,500lb',
-    '1,500v',
-    '1,512',
-    '1,530',
-    '1,533',
-    '1,540',
-    '1,560',
-    '1,592hz',
-    '1,593',
-    '1,600m',
-    '1,647',
-    '1,648,000',
     '1,654',
-    '1,664',
-    '1,690',
-    '1,703',
-    '1,710',
-    '1,713',
-    '1,723',
-    '1,751',
-    '1,771',
-    '1,781',
-    '1,800m',
-    '1,850',
-    '1,878',
-    '1,887',
-    '1,888',
-    '1,905',
     '1,960',
-    '1,972',
-    '1,986',
-    '1,998',
-    '1-11',
-    '1-y',
-    '1.0-2.0',
-    '1.075',
-    '1.080',
-    '1.1.0',
-    '1.1.92',
-    '1.10.1',
-    '1.11.3',
-    '1.15.2',
-    '1.1c',
-    '1.2.',
     '1.2.3',
-    '1.2.5',
-    '1.20am',
-    '1.25kg/2&frac12;lb',
-    '1.25p',
-    '1.2:1',
-    '1.2bn',
-    '1.2cm',
-    '1.3.10',
-    '1.3.7',
-    '1.30&ndash;3.30pm',
-    '1.31',
-    '1.35m',
-    '1.37gb',
-    '1.3l',
-    '1.3w',
     '1.4.',
-    '1.4.6',
-    '1.45&ndash;3.45pm',
-    '1.4p',
-    '1.4pc',
-    '1.5&ndash;2.0',
-    '1.5&ndash;3.0',
-    '1.55p',
-    '1.5bn',
-    '1.5g',
-    '1.5km',
-    '1.5mbps',
-    '1.6.4',
-    '1.6.6',
-    '1.6i',
-    '1.6km/1ml',
     '1.750',
-    '1.79',
-    '1.7pc',
-    '1.85%',
-    '1.8gl',
-    '1.9.15',
-    '1.9.16',
-    '1.9.3',
-    '1.93',
-    '1.x',
-    '1/-',
-    '1/1',
-    '1/1000',
-    '1/100000',
-    '1/10th',
-    '1/16',
     '1/2&ins',
-    '1/2-year',
-    '1/6d',
-    '1/82',
-    '1/9',
-    '1/90',
-    '1/91',
-    '1/92',
-    '1/c',
-    '1/min',
-    '1/r2',
-    '10%-15%',
-    '10%-30%',
-    '10&amp;sup12',
-    '10&aring',
-    '10&frac12&ins',
     '10&ft;6&ins',
-    '10&ndash;12%',
-    '10&ndash;200',
-    '10&ndash;21',
-    '10(5)',
-    '10(c)',
-    '10,000th',
-    '10,11',
-    '10,122',
-    '10,800',
-    '10-15%',
-    '10-25',
-    '10-5',
-    '10-match',
-    '10-party',
-    '10-round',
     '10-year-olds',
-    '10.00&ndash;21.00',
-    '10.05pm',
-    '10.07',
-    '10.08',
-    '10.09',
-    '10.1.1',
-    '10.11(a)',
-    '10.11(b)',
-    '10.2p',
-    '10.3.1',
-    '10.32',
-    '10.34',
-    '10.35am',
-    '10.37',
-    '10.38',
     '10.39',
-    '10.3c',
-    '10.3p',
-    '10.4.2',
-    '10.49',
-    '10.56',
-    '10.59',
-    '10.5p',
-    '10.6(b)',
-    '10.63',
-    '10.68',
-    '10.6m',
-    '10.7.4',
-    '10.71',
-    '10.7m',
-    '10.81',
     '10.87',
-    '10.9(b)',
-    '10/',
-    '10/12',
-    '10/40',
-    '10/41',
-    '10/70',
-    '10/88',
-    '10/model',
-    '100&ft',
-    '100&mgr;gal',
-    '100&ndash;250',
-    '100&ndash;280',
-    '100&ndash;4',
-    '100+',
-    '100-150',
     '100-200',
-    '100.000',
-    '1000&ndash;2000',
-    '1000-fold',
-    '10000000',
-    '1000cc',
-    '1004.3',
-    '10070',
-    '100b',
-    '100cc',
-    '100gb',
-    '100hp',
-    '100kw',
-    '100ma',
-    '100ml/4fl',
-    '100u',
     '101&deg;f',
-    '101&ndash;2',
-    '101(3)',
-    '101,000',
-    '101,107',
-    '102%',
-    '102.0',
-    '102.10',
-    '10289',
-    '103-strong',
-    '1030s',
-    '1042c&ndash;d',
-    '104b',
-    '104p',
-    '106&deg;f',
-    '106m',
     '106p',
-    '107%',
-    '107bp',
-    '107p',
-    '107th',
-    '1080.00',
-    '108bhp',
-    '108p',
-    '109%',
-    '109,373',
-    '10:08',
-    '10:17',
-    '10:21',
-    '10:26',
-    '10:27',
-    '10:29',
     '10:38',
-    '10:44',
-    '10:45',
-    '10:46&ndash;52',
-    '10:52',
-    '10:59:59',
-    '10:7',
-    '10:9',
-    '10am-12noon',
-    '10base5',
-    '10ha',
-    '10kb',
-    '10mls',
-    '10pp',
-    '10q',
-    '10th-minute',
     '10x20cm',
-    '11&deg',
-    '11&mdash;12',
-    '11&plus',
-    '11(b)',
-    '11,400',
-    '11,900',
-    '11-10',
-    '11-18',
-    '11-4',
-    '11-8',
-    '11-strong',
-    '11.05pm',
-    '11.2(a)',
-    '11.2.2',
-    '11.2.3',
     '11.25p',
-    '11.27',
-    '11.3.2',
-    '11.37',
-    '11.38',
-    '11.4.2',
-    '11.44',
-    '11.45pm',
-    '11.50%',
-    '11.50pm',
-    '11.54',
-    '11.55am',
-    '11.64',
-    '11.8pc',
-    '11.92',
-    '11.98',
     '11/15',
-    '11/6',
-    '11/7/87',
-    '11/87',
-    '11/99/24799',
-    '11/ac/7022/06',
-    '110-year-old',
-    '1100&ndash;1300',
-    '1100cc',
-    '1101.1',
-    '1101.6',
-    '1101.8',
-    '1102.1',
-    '1102.2',
-    '1102.22',
-    '1102.3',
     '1102.5',
-    '1103.4',
-    '1104',
-    '1106.4',
-    '1109.1',
-    '1109.2',
-    '1109.3',
-    '110kg',
-    '111/92',
-    '1114f&ndash;g',
-    '112&ndash;13',
-    '112/74',
-    '112mm',
-    '112p',
-    '113%',
-    '113(2)',
     '1134',
-    '114&ndash;115',
-    '114&ndash;16',
-    '114362',
-    '115%',
-    '115&ndash;115',
-    '11500',
-    '115bhp',
-    '115mm',
-    '115th',
-    '116mph',
-    '116p',
-    '118&ndash;19',
-    '118.2',
-    '118b',
-    '118th',
     '119-page',
-    '119cm',
-    '11:12',
-    '11:14',
-    '11:17',
-    '11:18',
-    '11:19',
-    '11:2&ndash;3',
-    '11:3',
-    '11:35',
-    '11:4',
-    '11:58',
-    '11c8',
-    '11f',
-    '11i',
-    '11pt',
     '12&deg;c',
-    '12&ndash;15in',
-    '12&ndash;18in',
-    '12&ndash;22',
-    '12&ndash;26',
-    '12&ndash;43',
-    '12&ndash;64',
-    '12&shilling',
-    '12\'',
-    '12(4)',
-    '12(5)',
-    '12,000ft',
-    '12,15',
-    '12,200',
-    '12,475',
-    '12,700',
     '12-17',
-    '12-2',
-    '12-3',
-    '12-7',
-    '12-8',
-    '12-bed',
-    '12-fold',
-    '12-fret',
-    '12-part',
-    '12-race',
-    '12-stage',
-    '12-storey',
-    '12.0%',
-    '12.00&ndash;20.00',
-    '12.01',
-    '12.06',
     '12.1(a)',
-    '12.14',
-    '12.17',
-    '12.1p',
-    '12.2.1',
-    '12.2.2',
-    '12.26',
-    '12.29',
-    '12.2m',
-    '12.3.1',
-    '12.31',
-    '12.35pm',
-    '12.38',
-    '12.46',
-    '12.47',
-    '12.56',
     '12.59',
-    '12/1',
-    '12/11/74',
-    '12/12',
-    '12/13th',
-    '12/18',
-    '12/24',
-    '12/6',
-    '12/8',
-    '12/81',
-    '1200&ndash;1500',
-    '1200-ft',
-    '1200c',
-    '120g',
-    '120lb',
-    '120ml/4fl',
     '120pc',
-    '120v',
-    '121&ndash;5',
-    '121,000',
-    '121.5%',
-    '123(1)',
-    '123,000',
-    '124p',
-    '125&ndash;6',
-    '125.1',
-    '1258&ndash;9',
-    '1259&ndash;1340',
-    '125g/4oz/1',
-    '125ma',
-    '125mhz',
-    '1260&ndash;1321',
     '126mph',
-    '127&ndash;9',
-    '128&times;64',
-    '1280x1024',
-    '128kbps',
-    '128p',
-    '128th',
-    '1293&ndash;4',
-    '1294&ndash;1303',
-    '129th',
-    '12:00',
-    '12:31',
-    '12:4',
-    '12:44',
-    '12:50',
-    '12:8',
     '12d',
-    '12gb',
-    '12kg',
-    '12mins',
-    '12noon-3pm',
-    '13&ndash;5',
-    '13&ndash;9',
-    '13,700',
-    '13-1',
-    '13-20',
-    '13-acetate',
-    '13-under-par',
-    '13.00',
-    '13.00-16.00',
-    '13.02',
-    '13.05',
     '13.17',
-    '13.22',
-    '13.23',
-    '13.3.3',
-    '13.3.4',
-    '13.3.5',
-    '13.36',
-    '13.40',
-    '13.50',
-    '13.76',
-    '13.7p',
-    '13.8.2',
-    '13.8pc',
-    '13/4/93',
-    '13/91',
-    '1300&ndash;1',
     '1300-ft',
-    '1300cc',
-    '1307&ndash;22',
-    '130bhp',
-    '130ft',
-    '132&ndash;3',
-    '132&ndash;5',
-    '132nd',
-    '133mhz',
-    '133p',
-    '134%',
-    '134mph',
-    '134p',
-    '135bhp',
-    '135cm',
-    '136&ndash;9',
     '136.2',
-    '13601',
-    '137&ndash;8',
-    '1374&ndash;75',
-    '138(3)',
-    '138,000',
-    '1389&ndash;1402',
-    '138cm',
-    '139mph',
-    '139th',
-    '13:1',
-    '13:14',
-    '13:18',
-    '13:2',
-    '13:24&ndash;30',
-    '13:44',
     '13:47&ndash;50',
-    '13:49',
-    '13e.p.s.ps',
-    '13j',
-    '13k',
-    '14&ndash;14',
-    '14&ndash;18-year-olds',
-    '14&ndash;20',
-    '14(6)',
-    '14*',
-    '14,000-strong',
-    '14,15',
-    '14,533',
-    '14-10',
-    '14-12',
-    '14-2',
     '14-7',
-    '14-8',
-    '14-fold',
-    '14-plus',
-    '14-track',
-    '14.00&ndash;17.00',
-    '14.02',
-    '14.12',
-    '14.13',
-    '14.25',
-    '14.2p',
-    '14.3.3',
-    '14.3.4',
-    '14.3m',
-    '14.4.1',
-    '14.40',
     '14.47',
-    '14.5.3',
-    '14.51',
-    '14.6.4',
-    '14.6.89',
-    '14.7.1',
-    '14.7.7',
-    '14.72',
-    '14.9.2',
-    '14.99',
-    '14/20',
-    '14/84',
-    '14/85',
-    '140&ndash;160',
-    '1400&ndash;1300',
-    '140ft',
     '140ml',
-    '140pc',
-    '141&ndash;2',
-    '141&ndash;3',
-    '141,000',
-    '1414&ndash;43',
-    '142&ndash;4',
-    '142(2)',
-    '142.5',
-    '1424&ndash;25',
-    '143&sol;87',
-    '143.0p',
-    '144a',
-    '144mph',
-    '145%',
-    '1450&ndash;1400',
     '145th',
-    '146(2)',
-    '146,000',
-    '146-249',
-    '1469&ndash;70',
-    '1469&ndash;71',
-    '146th',
-    '148&ndash;6',
-    '148&ndash;9',
-    '148.5',
-    '148bhp',
-    '149.5',
-    '1490s',
-    '149p',
-    '14:01',
-    '14:1&ndash;6',
     '14:10&ndash;11',
-    '14:18',
-    '14:22',
-    '14:22&ndash;25',
-    '14:26',
-    '14:35',
-    '14:36',
-    '14:55',
-    '14bn',
-    '14km',
-    '14ozs',
-    '14secs',
-    '15&ndash;10',
-    '15&ndash;23',
-    '15&ndash;33',
-    '15&ndash;40%',
     '15,200',
-    '15,400',
-    '15,800',
-    '15,840',
-    '15-hydroxy-pg-dehydrogenase',
-    '15-page',
-    '15-stone',
-    '15.10.4',
-    '15.2.9',
-    '15.29',
-    '15.3.2',
-    '15.30',
-    '15.38',
-    '15.45',
-    '15.5.2',
-    '15.6.3',
     '15.7p',
-    '15.8m',
-    '15.8p',
-    '15.92',
-    '15.93',
-    '15.99',
-    '15/4/93',
-    '15/84',
-    '150&ndash;300',
-    '150,000,000',
-    '150-page',
-    '1500&ndash;1650',
-    '1500&ndash;1700',
-    '1500&ndash;2000',
-    '1500bc',
-    '150mb',
     '1524&ndash;5',
-    '152pp',
-    '1550-1750',
-    '155s',
-    '156&deg',
-    '156&ndash;157',
-    '1560\'s',
-    '1567&ndash;1643',
-    '156th',
-    '157&sol;85',
-    '1588&ndash;1679',
-    '15:08',
-    '15:1&ndash;32',
-    '15:13',
-    '15:17',
-    '15:39:00',
     '15:45',
-    '15:47:00',
-    '15:55',
-    '15bn',
-    '15d',
-    '15db',
-    '15hh',
-    '15kg',
-    '15khz',
-    '15mg',
-    '16&ndash;04',
-    '16&ndash;11',
-    '16&ndash;21',
-    '16&ndash;23',
-    '16&ndash;26',
-    '16&ndash;28',
     '16&ndash;30',
-    '16&ndash;64',
-    '16&percnt',
-    '16\'',
-    '16,251',
-    '16,400',
-    '16-12',
-    '16-15',
-    '16-3',
-    '16-30',
-    '16-5',
-    '16-9',
-    '16-fold',
-    '16-ton',
-    '16-user',
-    '16-years-old',
     '16.17',
-    '16.2hh',
-    '16.2p',
-    '16.34',
-    '16.35',
-    '16.43',
-    '16.52',
-    '16.95',
-    '16/84',
-    '160-year-old',
-    '160.5',
-    '1600-1850',
-    '160bhp',
-    '160bp',
-    '160hp',
-    '1633&ndash;1703',
     '1636&ndash;7',
-    '164,000',
-    '1640&ndash;1641',
-    '1640&ndash;1660',
-    '1646&ndash;1716',
-    '164p',
-    '165.5',
-    '1653&ndash;4',
-    '166&ndash;7',
-    '1660&ndash;70',
-    '1664&ndash;5',
-    '1666&ndash;7',
-    '166g',
-    '166th',
-    '1672&ndash;4',
-    '168(4)',
     '1687&mdash;8',
-    '1688&ndash;1744',
-    '1689&mdash;97',
-    '169&ndash;70',
-    '169&ndash;71',
-    '169,000',
-    '1694&ndash;1778',
-    '1698&ndash;1761',
-    '16:00',
-    '16:02',
-    '16:05',
-    '16:10',
-    '16hh',
-    '16kg',
-    '16mbps',
-    '16pts',
     '17&deg',
-    '17&ndash;14',
-    '17&ndash;16',
-    '17&ndash;17',
-    '17&ndash;23',
-    '17&ndash;5',
-    '17(4)',
-    '17(6)',
-    '17-11',
-    '17-15',
-    '17-22',
-    '17-3',
-    '17-hour',
-    '17-party',
-    '17.01',
-    '17.03',
     '17.12',
-    '17.13',
-    '17.2.2',
-    '17.20',
-    '17.24',
-    '17.31',
-    '17.41',
-    '17.42',
-    '17.43',
-    '17.44',
-    '17.5.91',
-    '17.61',
-    '17/20',
-    '17/27',
-    '170.3',
-    '170m',
     '1710&mdash;14',
-    '1711&ndash;13',
-    '1713&ndash;14',
-    '1714&ndash;27',
-    '1715&ndash;1754',
-    '1718&ndash;22',
-    '1719&ndash;20',
-    '172,000',
-    '172.5',
-    '173,000',
-    '17380',
-    '1739&ndash;40',
-    '173d&ndash;f',
-    '1745&ndash;6',
-    '1748&ndash;1832',
-    '174p',
     '175&ndash;7',
-    '1750-1900',
-    '1757&ndash;1827',
-    '175ml',
-    '175mph',
-    '175p',
-    '1760&ndash;1820',
-    '1763&ndash;64',
-    '1765&ndash;6',
-    '1767&ndash;1831',
-    '1769&ndash;1844',
-    '176p',
-    '176pp',
-    '177&ndash;80',
-    '1778&ndash;79',
-    '1779&ndash;80',
     '178&ndash;7',
-    '178&ndash;9',
-    '178,000',
-    '178.735',
-    '1783&ndash;84',
-    '1788&mdash;92',
-    '1789&ndash;92',
-    '178th',
-    '1791&ndash;2',
-    '1792&ndash;1871',
-    '1792&ndash;3',
-    '1794&mdash;6',
-    '1794&ndash;6',
-    '1795&ndash;1821',
-    '1797&ndash;1864',
-    '1799&ndash;1804',
     '179p',
-    '17:1',
-    '17:12',
-    '17:22',
-    '17:23',
-    '17:7',
-    '17p13',
-    '17th-',
-    '17th.',
-    '17th/18th',
-    '17thcentury',
-    '18&ndash;14',
-    '18&ndash;18',
-    '18&ndash;28',
-    '18&ndash;4',
-    '18&ndash;65',
     '18&ndash;8',
-    '18(4)',
-    '18(a)',
-    '18,000,000',
-    '18,200ft',
-    '18,376',
-    '18-28',
-    '18-30',
-    '18-handicap',
-    '18.11',
-    '18.12',
-    '18.15',
-    '18.22',
-    '18.28',
-    '18.37',
-    '18.3k',
     '18.45',
-    '18.75',
-    '18/8',
-    '180&ndash;1',
-    '180&ndash;200',
-    '1803&ndash;1805',
-    '1804&ndash;6',
-    '1804&ndash;92',
-    '1807&ndash;8',
-    '1808&ndash;9',
-    '1809&ndash;82',
-    '180c',
-    '180mb',
-    '1810s',
-    '1813&ndash;14',
-    '1813&ndash;1893',
     '1814&ndash;15',
-    '1814&ndash;1879',
-    '1816&mdash;19',
-    '1816&ndash;69',
-    '1819&ndash;1869',
-    '181p',
-    '182&ndash;5',
-    '1823&ndash;1913',
-    '1824&ndash;5',
-    '1825&ndash;7',
-    '1827&ndash;38',
-    '1828&ndash;9',
-    '183&ndash;4',
-    '183,000',
-    '1830&ndash;1930',
-    '1830&ndash;3',
     '1830&ndash;31',
-    '1832&ndash;1917',
-    '1834&ndash;1904',
-    '1835&ndash;7',
-    '1836&ndash;9',
-    '1837&ndash;9',
-    '1838&ndash;42',
-    '1838&ndash;9',
-    '1839&ndash;41',
-    '183p',
-    '1840&ndash;2',
-    '1842&ndash;3',
-    '1844&ndash;5',
-    '1844&ndash;6',
-    '1844&ndash;8',
-    '1845&ndash;1923',
     '1848&ndash;52',
-    '1849&ndash;1936',
-    '1849&ndash;51',
-    '1850&ndash;1930',
-    '1859&ndash;1906',
-    '1861&ndash;1951',
-    '1861&ndash;65',
-    '1862&ndash;3',
-    '1862&ndash;6',
-    '1862&ndash;73',
-    '1864&ndash;1927',
-    '1864&ndash;5',
-    '1866&ndash;71',
-    '1867&ndash;8',
-    '1869&ndash;71',
-    '1869&ndash;73',
     '187,000',
-    '1870&ndash;71',
-    '1870\'s',
-    '18704',
-    '1873&ndash;5',
-    '1874&ndash;5',
-    '188&ndash;92',
-    '1881&ndash;1955',
-    '1881&ndash;5',
-    '1884&ndash;1942',
-    '1884&ndash;9',
-    '1885&ndash;9',
-    '1886&ndash;8',
-    '1886&ndash;9',
-    '1888&ndash;89',
-    '1888&ndash;99',
     '1889&ndash;90',
-    '189.4',
-    '1890&ndash;1914',
-    '1890&ndash;1976',
-    '1890&ndash;1990',
-    '1891&ndash;92',
-    '1892&ndash;1992',
-    '1892&ndash;9',
-    '1892b',
-    '1893&ndash;5',
-    '1895&ndash;7',
-    '1896a',
-    '1897&ndash;9',
-    '1898&ndash;1900',
-    '1898&ndash;9',
-    '18:22',
     '18:25',
-    '18cms',
-    '18mhz',
-    '18oz',
-    '18th&ndash;19th',
-    '18thc',
-    '19&frac12;p',
-    '19&ndash;12',
-    '19&ndash;18',
-    '19&ndash;20th',
-    '19&ndash;30',
-    '19&ndash;75',
-    '19&ndash;mar',
-    '19(2)',
-    '19,000,000',
-    '19,20',
     '19-0',
-    '19-1',
-    '19-2',
-    '19-24',
-    '19-strong',
-    '19.10',
-    '19.13',
-    '19.14',
-    '19.15',
-    '19.18',
-    '19.2&ndash;73.1',
-    '19.27',
-    '19.99',
-    '1900&ndash;02',
-    '1900&ndash;1901',
-    '19000',
     '1901&ndash;4',
-    '1902&ndash;03',
-    '1904&ndash;17',
-    '1907&ndash;12',
-    '1907&ndash;24',
-    '1908&ndash;09',
-    '1908&ndash;10',
-    '190m',
-    '190s',
-    '1910&ndash;12',
-    '1910&ndash;20',
-    '1911&ndash;15',
-    '1912&ndash;15',
-    '1913&ndash;15',
-    '1914&ndash;19',
-    '1914&ndash;1945',
     '1915&ndash;32',
-    '1917&ndash;19',
-    '1917&ndash;21',
-    '1920&ndash;1925',
-    '1921&ndash;3',
-    '1924&ndash;32',
-    '1924&ndash;35',
-    '1925&ndash;26',
-    '1926&ndash;8',
-    '1926&ndash;9',
-    '1927&ndash;39',
-    '1929&ndash;35',
-    '1929.',
-    '1930&ndash;86',
-    '1933&ndash;34',
-    '1934&ndash;6',
     '1936&mdash;37',
-    '1936&ndash;40',
-    '1936&ndash;7',
-    '1937&ndash;9',
-    '1938&ndash;45',
-    '1938-39',
-    '1939&ndash;43',
-    '1940&mdash;44',
-    '1940&ndash;1945',
-    '1940&ndash;3',
-    '1940&ndash;45',
-    '1941&ndash;5',
-    '1941.',
-    '1943&ndash;62',
-    '1944&ndash;46',
-    '1944&ndash;5',
     '1944&ndash;6',
-    '1945&ndash;56',
-    '1945&ndash;8',
-    '1945-49',
-    '1945-51',
-    '1946&ndash;50',
-    '1946&ndash;86',
-    '1946&ndash;9',
-    '1947&ndash;49',
-    '1947-48',
-    '1948&mdash;49',
-    '1948/9',
-    '1949&ndash;52',
-    '194o',
-    '194p',
-    '195&ndash;200',
     '195/65',
-    '1950&ndash;60',
-    '1950&ndash;67',
-    '1950&ndash;70',
-    '1950b',
-    '1952&ndash;3',
-    '1952&ndash;5',
-    '1952&ndash;54',
-    '1952-53',
-    '1954&ndash;62',
-    '1955&ndash;60',
-    '1955-',
-    '1956&ndash;60',
-    '1956&ndash;70',
-    '1956/7',
-    '1957b',
     '1958&ndash;60',
-    '1958&ndash;62',
-    '1958&ndash;9',
-    '1959&ndash;1962',
-    '195b',
-    '195o',
-    '1960&ndash;1',
-    '1960&ndash;3',
-    '1960&ndash;65',
-    '1960&ndash;80',
-    '1960a',
-    '1961&ndash;3',
-    '1962&ndash;64',
-    '1962&ndash;71',
-    '1963&ndash;5',
-    '1963&ndash;77',
     '1963&ndash;8',
-    '1963.',
-    '1963/64',
-    '1963a',
-    '1964&ndash;1970',
-    '1964&ndash;66',
-    '1964&ndash;74',
-    '1964-70',
-    '1964.',
-    '1965&ndash;67',
-    '1966&mdash;67',
-    '1966&ndash;72',
-    '1966&ndash;76',
-    '1966/67',
-    '1966a',
-    '1967&ndash;1968',
     '1967&ndash;71',
-    '1967-68',
-    '1968&ndash;73',
-    '1968&ndash;77',
-    '1968-69',
-    '1968a',
-    '1968b',
-    '1969&ndash;90',
-    '1969-70',
-    '1970&ndash;1980',
-    '1970&ndash;2',
-    '1970&ndash;72',
-    '1970&ndash;75',
-    '1970&ndash;80',
-    '1970&ndash;83',
-    '1970&ndash;90',
     '1970-71',
-    '1970-73',
-    '1970-74',
-    '1970-75',
-    '1970/1',
-    '1970c',
-    '1971&ndash;76',
-    '1971:6',
-    '1972&ndash;76',
-    '1972&ndash;85',
-    '1972-73',
-    '1972-74',
-    '1973-1990',
-    '1973-74',
-    '1973c',
-    '1974&ndash;81',
     '1974&ndash;88',
-    '1974.8',
-    '1975&ndash;78',
-    '1975&ndash;80',
-    '1975&ndash;81',
-    '1976&ndash;1986',
-    '1976:204',
-    '1977-79',
-    '1977-80',
-    '1977.',
-    '1977:13',
-    '1978&ndash;82',
-    '1978&ndash;83',
-    '1978&ndash;86',
-    '1978-81',
-    '1979&ndash;84',
     '1979&ndash;90',
-    '1979&ndash;92',
-    '1979-1980',
-    '198&ndash;9',
-    '1980-82',
-    '1980-84',
-    '1981&ndash;86',
-    '1981&ndash;89',
-    '1981&sol;82',
-    '1981-2',
-    '1981-83',
-    '1981-91',
-    '1982&ndash;85',
-    '1982\'s',
-    '1982-85',
-    '1982-86',
     '1982.',
-    '1982:3',
-    '1983&ndash;6',
-    '1983&ndash;8',
-    '1983&ndash;87',
-    '1983,1984',
-    '1983-86',
-    '1983-88',
-    '1983c',
-    '1984&ndash;1992',
-    '1984-s',
-    '1984c',
-    '1985&ndash;8',
-    '1985-1990',
-    '1985-6',
-    '1986&ndash;91',
     '1986/88',
-    '1986d',
-    '1987&ndash;90',
-    '1987,1988',
-    '19873',
-    '1988&ndash;1989',
-    '1988&ndash;92',
-    '1988-1989',
-    '1989&ndash;1990',
-    '1989&ndash;92',
-    '1989&sol;90',
-    '1989-92',
-    '198l',
-    '199.9',
-    '199/82',
-    '1990-93',
     '1990:14',
-    '1991&ndash;95',
-    '1991-2',
-    '1991-96',
-    '1991/birdlip/gloucestershire',
-    '1991/gloucester',
-    '1991/oxford',
-    '1992&ndash;94',
-    '1992&ndash;95',
-    '1992-95',
-    '1992-96',
-    '1992/',
-    '1992/castlemorton',
-    '1992/erika',
-    '1992/lechlade/gloucestershire',
-    '1992/raf',
     '1992/swindon/wiltshire',
-    '1993&ndash;1994',
-    '1993&ndash;96',
-    '1993-95',
-    '1993/oxford',
-    '1993/tim',
-    '1995&ndash;6',
-    '1995cc',
-    '1997-98',
-    '199oa',
-    '199ob',
-    '19:18',
-    '19:9',
-    '19ft',
-    '19lb',
-    '19m',
     '19th-minute',
-    '19x5',
-    '19x6',
-    '1:00',
-    '1:1250',
-    '1:13',
-    '1:17',
-    '1:18',
-    '1:200',
-    '1:22',
-    '1:23',
-    '1:24',
-    '1:25000',
-    '1:28',
-    '1:30',
-    '1:300',
     '1:40&ndash;45',
-    '1:400',
-    '1:50000',
-    '1:58',
-    '1:7',
-    '1:75',
-    '1=',
-    '1and',
-    '1ar',
-    '1as',
-    '1at',
-    '1ay',
-    '1bh',
-    '1ew',
-    '1hh',
-    '1ht',
     '1hz',
-    '1ins',
-    '1lb/500g',
-    '1ms',
-    '1ng',
-    '1nu',
-    '1off',
-    '1p.p.b.v.',
-    '1pd',
-    '1pg',
-    '1px',
-    '1rb',
-    '1rq',
-    '1sq',
-    '1st-2nd',
-    '1st/2nd',
     '1sts',
-    '1tbspn',
-    '1ur',
-    '1xr',
-    '1xy',
-    '1yy',
-    '2%-3%',
-    '2&amp;l/2',
-    '2&frac12;ft',
-    '2&frac23',
-    '2&lcub;gth&rcub;1',
-    '2&mdash;3',
-    '2&mgr;g',
-    '2&middot;5cm/1inch',
-    '2&ndash;1/2in',
-    '2&ndash;2&ndash;0',
     '2&ndash;2.5',
-    '2&ndash;38',
-    '2&ndash;40',
-    '2&ndash;72',
-    '2&ngr',
-    '2&percnt',
-    '2&shilling;6',
-    '2&times;2',
-    '2\'-deoxy-3-deazaadenosine',
-    '2,000-odd',
-    '2,0001b',
-    '2,000km',
-    '2,015',
-    '2,017',
-    '2,018',
-    '2,019',
     '2,076',
-    '2,077',
-    '2,082',
-    '2,087',
-    '2,1',
-    '2,101',
-    '2,107',
-    '2,108',
-    '2,110',
-    '2,114',
-    '2,120',
-    '2,122',
-    '2,134',
-    '2,137',
-    '2,142',
-    '2,144',
     '2,146',
-    '2,160',
-    '2,161',
-    '2,162',
-    '2,176',
-    '2,2',
-    '2,200,000',
-    '2,200ft',
-    '2,210',
-    '2,230',
-    '2,240',
-    '2,247.0',
-    '2,273',
-    '2,311',
-    '2,312.1',
-    '2,378',
     '2,439',
-    '2,5',
-    '2,500-acre',
-    '2,500-year-old',
-    '2,530',
-    '2,553',
-    '2,560',
-    '2,561',
-    '2,586',
-    '2,588',
-    '2,598',
-    '2,640',
-    '2,666',
-    '2,680',
-    '2,750,000',
-    '2,770.00',
     '2,800,000',
-    '2,831',
-    '2,850',
-    '2,880',
-    '2,900,000',
-    '2-4-0',
-    '2-6-4',
-    '2-amino',
-    '2-bedroomed',
-    '2-cycles',
-    '2-pounder',
-    '2-style',
-    '2.0-on-sparc',
-    '2.000',
-    '2.07',
-    '2.1(a)',
     '2.1.7',
-    '2.116',
-    '2.15am',
-    '2.1gb',
-    '2.2&deg',
-    '2.2.1.4',
-    '2.2.2.1',
-    '2.2.6',
-    '2.25ms',
-    '2.3.2.1',
-    '2.3.6',
-    '2.35m',
-    '2.4.5',
-    '2.4.6',
-    '2.4:1',
-    '2.5&aring',
     '2.5a',
-    '2.5mb',
-    '2.5t/acre',
-    '2.6.3',
-    '2.6.3(ii)',
-    '2.62',
-    '2.64',
-    '2.7.4',
-    '2.7.5',
-    '2.7.6',
-    '2.7.7',
-    '2.77',
-    '2.78',
-    '2.7v',
-    '2.80',
-    '2.85p',
     '2.87',
-    '2.93',
-    '2.9m',
-    '2/11/92',
-    '2/16',
-    '2/30',
-    '2/6d',
-    '2/86',
-    '2/ufo',
-    '20&mdash;1',
-    '20&mdash;30',
-    '20&ndash;04',
-    '20&ndash;10',
-    '20&ndash;28',
-    '20&ndash;35',
-    '20&ndash;50%',
     '20&ndash;6',
-    '20&ndash;7',
-    '20&ndash;feb',
-    '20&ndash;mar',
-    '20&times;30&ins',
-    '20(8)',
-    '20,000&ndash;30,000',
-    '20,000-strong',
-    '20,004',
-    '20,21',
-    '20-14',
-    '20-16',
-    '20-17',
-    '20-50%',
-    '20-a-day',
-    '20-handicapper',
     '20-km',
-    '20.000',
-    '20.23',
-    '20.4%',
-    '20.5%',
-    '20.50',
-    '20.55',
-    '20.5cm',
-    '20.5p',
-    '20.96',
-    '20/6/87',
-    '20/mar',
-    '200&deg;c/',
-    '200&micro;m',
-    '200-hour',
-    '2000&ndash;3000',
     '2000/750',
-    '2000ft',
-    '20036',
-    '200k',
-    '200kyr',
-    '200ma',
-    '200ml/7fl',
-    '200ms',
-    '200pp',
-    '201&sol;85',
-    '201,000',
-    '2018',
-    '201p',
-    '202&sol;85',
-    '2024',
-    '203&ndash;7',
     '203388',
-    '204,000',
-    '20410',
-    '2044',
-    '205&sol;84',
-    '205,000',
-    '2057&sol;82',
-    '205p',
-    '2066',
-    '2068',
-    '206pp',
-    '2075',
-    '208,000',
-    '2088',
-    '208p',
-    '20:19',
     '20db',
-    '20ghz',
-    '20ma',
-    '20ng',
-    '20o',
-    '20pp',
-    '20s-40s',
-    '20sa',
-    '20sec',
-    '20th.',
-    '20w',
-    '21&ndash;26',
-    '21&ndash;27',
-    '21&ndash;5',
-    '21&ndash;76',
-    '21&ndash;jan',
     '21(6)',
-    '21,000,000',
-    '21,22',
-    '21,600',
-    '21,800',
-    '21-11',
-    '21-12',
-    '21-13',
-    '21-17',
-    '21-25',
-    '21.15',
-    '21.22',
-    '21.25',
-    '21.27',
-    '21.29',
-    '21.81',
     '21.88',
-    '21.8pc',
-    '21.9%',
-    '21/22',
-    '21/feb',
-    '2105',
-    '21066',
-    '210mm',
-    '210p',
-    '2113',
-    '211bc',
-    '211p',
-    '212,000',
-    '2120',
-    '2128',
-    '212mb',
     '2135',
-    '2144',
-    '214p',
-    '2151',
-    '2157',
-    '216gti',
-    '2170',
-    '2183',
-    '219,000',
-    '21lb',
-    '21nt',
-    '21pts',
-    '21secs',
-    '21year-old',
-    '22&frac12;p',
-    '22&mdash;4',
     '22&ndash;1',
-    '22&ndash;25&deg;c',
-    '22&ndash;27',
-    '22&ndash;30',
-    '22(1)',
-    '22,100',
-    '22,300,000',
-    '22-28',
-    '22-carat',
-    '22-metre',
-    '22-minute',
-    '22-month',
-    '22-page',
-    '22-strong',
-    '22.3&ndash;22.8',
-    '22/42',
     '22/83',
-    '220%',
-    '2203',
-    '220g',
-    '220lb',
-    '220mph',
-    '220w',
-    '221&sol;85',
-    '22175',
-    '221p',
-    '223&ndash;4',
-    '223p',
-    '224,000',
-    '225%',
-    '225bhp',
-    '226,000',
     '2269',
-    '227,000',
-    '2290',
-    '22:1',
-    '22:7',
-    '22b',
-    '22c',
-    '22cm',
-    '22comment',
-    '22ml',
-    '22pts',
-    '22s.',
-    '22v',
-    '23&ndash;5',
-    '23&ndash;nov',
-    '23,200',
     '23,700',
-    '23,900',
-    '23-28',
-    '23-29',
-    '23-30',
-    '23-dec',
-    '23-jan',
-    '23-strong',
-    '23.16',
-    '23.2%',
-    '23.2.1',
-    '23.2.1.2',
-    '23.2.1.3',
-    '23.2.1.4',
-    '23.27',
-    '23.28',
     '23.29',
-    '23.2p',
-    '23.3&ndash;65.5',
-    '23.39',
-    '23.7%',
-    '23/10/87',
-    '23/24',
-    '230%',
-    '230&deg',
-    '2304',
-    '23060',
-    '230bhp',
-    '230m',
-    '2314',
-    '231bhp',
-    '2320',
     '23220',
-    '2341',
-    '2342',
-    '235&ndash;6',
-    '2350',
-    '235lb',
-    '236p',
-    '2373',
-    '238&ndash;9',
-    '238(2)',
-    '2382.7',
-    '238p',
-    '2392',
-    '23:24',
-    '23:43',
-    '23:46',
     '23km',
-    '23w',
-    '24&ft',
-    '24&ndash;14',
-    '24&ndash;31',
-    '24&ndash;4',
-    '24&ndash;7',
-    '24&ndash;72',
-    '24(2)',
-    '24(4)',
-    '24(5)',
-    '24,500,000',
-    '24,700',
-    '24-',
-    '24-28',
-    '24-6',
     '24-aug',
-    '24-copy',
-    '24-nov',
-    '24.2(b)',
-    '24.31',
-    '24.74',
-    '24/oct',
-    '240ml',
-    '240pp',
-    '240th',
-    '2410',
-    '2423',
-    '2439',
-    '243p',
-    '244,000',
-    '244.5bn',
     '2440',
-    '245432',
-    '245b',
-    '247(8)',
-    '247,000',
-    '248(3)',
-    '24c',
-    '24hour',
-    '24kt',
-    '24lb',
-    '24oz',
-    '24pc',
-    '24pp',
-    '24secs',
-    '25&mdash;30p',
-    '25&ndash;13',
     '25&ndash;34',
-    '25&ndash;39',
-    '25&ndash;49',
-    '25(2)',
-    '25,000th',
-    '25,093',
-    '25,200',
-    '25-foot',
-    '25-pack',
-    '25-pdr',
-    '25-second',
-    '25.16p',
-    '25.3%',
-    '25.3.92',
-    '25.4p',
-    '25/50',
     '25/50mhz',
-    '250&mgr;v',
-    '250&ndash;350',
-    '250-seat',
-    '2508',
-    '250ft',
-    '250v',
-    '253p',
-    '254,000',
-    '2540',
-    '255,000',
-    '256&ndash;7',
-    '2572.6',
-    '258,000',
-    '259p',
-    '25:1',
     '25:23',
-    '25b',
-    '25k',
-    '25o',
-    '25s.',
-    '25w',
-    '26&ndash;14',
-    '26&ndash;31',
-    '26,500',
-    '26-letter',
-    '26-march',
-    '26-mm',
-    '26-place',
-    '26.2%',
-    '26.7.85',
-    '26.75p',
     '26/1000',
-    '260%',
-    '2612',
-    '2615',
-    '26197',
-    '262.5',
-    '262261',
-    '263723',
-    '2650',
-    '265621',
-    '26614-15',
-    '266p',
-    '26870',
-    '268p',
-    '26:14&ndash;16',
-    '26:26&ndash;29',
     '26ft',
-    '26lb',
-    '26pc',
-    '26s.',
-    '26sec',
-    '26secs',
-    '26th/27th',
-    '26year-old',
-    '27&middot;5cm',
-    '27&ndash;12',
-    '27&ndash;16',
-    '27&ndash;31',
-    '27&ndash;55',
-    '27&ndash;6',
-    '27&ndash;7',
-    '27(3)',
     '27,28',
-    '27-hole',
-    '27-march',
-    '27.1%',
-    '27.36',
-    '27.4%',
-    '27.8',
-    '270&deg;.',
-    '270&deg;c',
-    '270&sol;83',
-    '2707',
-    '2715',
-    '2720',
-    '2732.4',
-    '273p',
-    '2740',
     '274p',
-    '275&ndash;6',
-    '2755',
-    '27575-77',
-    '275ml',
-    '2769',
-    '278,000',
-    '27813-14',
-    '2785',
-    '279(3)',
-    '279679',
-    '27b',
-    '27kg',
-    '27km',
-    '27kms',
-    '27min',
     '27sec',
-    '28&deg',
-    '28&ndash;14',
-    '28&ndash;37',
-    '28(6)',
-    '28,000,000',
-    '28,29',
-    '28-0',
-    '28-9',
-    '28-october',
-    '28.18',
-    '28.2%',
-    '28/29',
-    '280&mgr;v',
-    '28000',
-    '2802',
     '280m',
-    '2810',
-    '2832.5',
-    '2849',
-    '2859',
-    '285p',
-    '2860.0',
-    '288(1)',
-    '28:18&ndash;20',
-    '28km',
-    '28m',
-    '28v',
-    '29&ndash;33',
-    '29(4)',
-    '29,000,000',
-    '29,000ft',
     '29-12',
-    '29-may',
-    '29.01',
-    '29.7%',
-    '290&deg;f.',
-    '2903',
-    '2904',
-    '29053-55',
-    '2907',
-    '2942',
-    '295&ndash;6',
-    '295,000',
-    '2957',
-    '2967',
-    '2984',
-    '2989',
     '299&ndash;300',
-    '2990',
-    '29913',
-    '29b',
-    '29ff',
-    '29ft',
-    '29s',
-    '29th.',
-    '2:13&ndash;14',
-    '2:16',
-    '2:1:1',
-    '2:22',
-    '2:3',
-    '2:30',
-    '2:30pm',
-    '2:6',
     '2:9',
-    '2ap',
-    '2ar',
-    '2as',
-    '2bt',
-    '2cvs',
-    '2db',
-    '2dg',
-    '2dw',
-    '2el',
-    '2es',
-    '2jd',
-    '2jf',
-    '2k',
-    '2lb.',
-    '2lp',
     '2lst',
-    '2nd&ndash;3rd',
-    '2nj',
-    '2nl',
-    '2oo',
-    '2oth',
-    '2ozs',
-    '2pz',
-    '2qb',
-    '2s.6d',
-    '2s.6d.',
-    '2sec',
-    '2st',
-    '2tbs',
-    '2th',
-    '2wd',
     '2x35l',
-    '3&frac12;-hour',
-    '3&frac23',
-    '3&ft;6&ins',
-    '3&mdash;4',
-    '3&ndash;18',
-    '3&ndash;2&ndash;0',
-    '3&ndash;21',
-    '3&ndash;300',
-    '3&ndash;32',
-    '3(f)',
-    '3,000&ndash;4,000',
-    '3,000-4,000',
-    '3,000-acre',
-    '3,000-mile',
-    '3,000-odd',
     '3,001',
-    '3,021',
-    '3,110',
-    '3,370',
-    '3,4,5',
-    '3,4-methylenedioxymethamphetamine',
-    '3,400,000',
-    '3,440',
-    '3,500ft',
-    '3,500rpm',
-    '3,550',
-    '3,6,9',
-    '3,7',
-    '3,993,000',
-    '3-10',
-    '3-goal',
     '3-in',
-    '3-part',
-    '3-point',
-    '3-south',
-    '3-step',
-    '3-tonner',
-    '3-tonners',
-    '3.00m',
-    '3.1+',
-    '3.1.',
-    '3.2.3.3',
-    '3.20m',
-    '3.22(a)',
-    '3.25(b)',
-    '3.2kg',
-    '3.35%',
     '3.35pm',
-    '3.36',
-    '3.3k',
-    '3.3kb',
-    '3.4&ins',
-    '3.43b',
-    '3.4ghz',
-    '3.4mm',
-    '3.50pm',
-    '3.51',
-    '3.53',
-    '3.54',
-    '3.57',
-    '3.5cm',
-    '3.5pc',
-    '3.62',
     '3.68',
-    '3.6pc',
-    '3.7.5',
-    '3.76',
-    '3.8&ndash;6.1',
-    '3.8.1',
-    '3.8.2',
-    '3.8.3',
-    '3.89',
-    '3.94',
-    '3.95%',
-    '3/15',
-    '3/160&deg;c/325&deg;f',
-    '3/30',
-    '3/5',
-    '3/87',
     '3/9',
-    '3/93',
-    '3/f',
-    '3/the',
-    '30&ndash;0',
-    '30&ndash;10',
-    '30&ndash;20',
-    '30&ndash;42',
-    '30&ndash;50mph',
-    '30,000ft',
-    '30,36',
-    '30-ft',
-    '30-nov.',
-    '30-oct.',
-    '30-year-olds',
-    '30.1%',
     '30.5%',
-    '30.5p',
-    '30.9',
-    '300-350',
-    '300-400',
-    '300-500',
-    '300-mile',
-    '300-ship',
-    '300000',
-    '3002',
-    '30053',
-    '30075',
-    '300bps',
-    '300gsm',
-    '300khz',
-    '300mb',
     '300mh',
-    '300yds',
-    '300zx',
-    '301.',
-    '302p',
-    '3030',
-    '3033',
-    '30335',
-    '303s',
-    '3045',
-    '3046',
-    '3049',
-    '305&sol;87',
-    '3053',
-    '3054',
-    '3056',
     '305u',
-    '3066',
-    '307,200',
-    '3081',
-    '3085',
-    '308ds',
-    '3096',
-    '309p',
-    '30db',
-    '30gb',
-    '30nm',
-    '30secs',
-    '30th.',
-    '30w',
-    '30x',
-    '31&frac12',
     '31&ndash;2',
-    '31&ndash;33',
-    '31&ndash;50',
-    '31\'s',
-    '31,700',
-    '31-june',
-    '31-nov.',
-    '31.3%',
-    '31.9%',
-    '310kjmol',
-    '3113',
-    '312/89',
-    '3122',
-    '312s',
-    '31304',
-    '313208',
     '3133',
-    '3140',
-    '3147',
-    '315,281',
-    '316sl',
-    '3179g',
-    '318p',
-    '319,000',
-    '3190',
-    '31ft',
-    '31km',
-    '31sec',
-    '32&deg',
-    '32&ins',
-    '32&ndash;35',
-    '32&ndash;4',
     '32&ndash;9',
-    '32(2)',
-    '32,300',
-    '32,500',
-    '32-',
-    '32-nation',
-    '32-strong',
-    '32-user',
-    '32.',
-    '32.2%',
-    '32.2(b)',
-    '32.36',
-    '32.8',
-    '32.8%',
-    '32/0.2',
-    '320&ndash;380nm',
     '3200/8e2',
-    '3202',
-    '32047',
-    '3207',
-    '320p',
-    '3218',
-    '3220',
-    '3224',
-    '3225',
-    '324496',
-    '324p',
-    '325&deg;f',
-    '325g/12oz',
-    '3270/x',
-    '32890',
-    '329&ndash;30',
     '3291',
-    '32997',
-    '32in.',
-    '32km/20mls',
-    '33&deg',
-    '33&frac12',
-    '33&ndash;34',
-    '33&ndash;38',
-    '33.14',
-    '33.2',
-    '33.6%',
-    '33.85',
-    '330mm',
-    '330p.p.m.v.',
-    '331,000',
-    '331.2:687.9',
     '33159',
-    '332/89',
-    '333,000',
-    '3342',
-    '337&ndash;8',
-    '3380',
-    '33977',
-    '33:20',
-    '33cm',
-    '33mb',
-    '34&frac12',
-    '34&ndash;37',
-    '34,400',
-    '34,500',
-    '34.1',
-    '34.1%',
     '34.7',
-    '34.75',
-    '34.9%',
-    '34/11',
-    '34008',
-    '340nm',
-    '340p',
-    '342,000',
-    '3422',
-    '344,000',
-    '3443',
-    '34460',
-    '34460-62',
-    '34536-38',
-    '34690-92',
-    '3476',
     '34770',
-    '34789',
-    '3480',
-    '34813',
-    '34825',
-    '349p',
-    '34c',
-    '34mbps',
-    '34mm',
-    '34s',
-    '35&deg',
-    '35&ndash;3',
-    '35&ndash;40%',
-    '35&ndash;43',
-    '35&shilling',
-    '35(1)',
     '35,000,000',
-    '35,750',
-    '35-minute',
-    '35-mm',
-    '35-strong',
-    '35.0',
-    '35.4%',
-    '35.50',
-    '35.9%',
-    '35/8',
-    '350-seat',
-    '35006',
-    '3500kg',
-    '35023',
-    '350bhp',
-    '350ft',
     '350gt',
-    '350p',
-    '35138',
-    '35180',
-    '351p',
-    '351st',
-    '3525',
-    '35326',
-    '3533',
-    '35417',
-    '35459',
-    '35560-61',
-    '355mm',
-    '3561',
-    '35697-98',
-    '35723',
     '35794',
-    '357p',
-    '35835-36',
-    '35851',
-    '35910',
-    '35914',
-    '35c',
-    '35k',
-    '35mph',
-    '35sec',
-    '36&deg',
-    '36&deg;c',
-    '36&ft',
-    '36&ndash;48',
-    '36,200',
-    '36-6',
     '36.',
-    '36.2%',
-    '36.36%',
-    '36.7%',
-    '36/',
-    '360/p',
-    '36008',
-    '36030',
-    '36046',
-    '36098',
-    '360a',
-    '360dpi',
-    '360f',
-    '360kg',
-    '36106',
-    '36107',
     '36154',
-    '361608',
-    '36203',
-    '3621',
-    '36217',
-    '36231',
-    '36245',
-    '36249',
-    '36256',
-    '36312',
-    '3632',
-    '36320',
-    '36343',
-    '36348-49',
-    '36357-58',
-    '36385',
     '36390',
-    '36393',
-    '36406',
-    '36410',
-    '36413',
-    '36426',
-    '36430',
-    '36433',
-    '36440',
-    '36448-50',
-    '36458',
-    '36460',
-    '36467',
-    '36475',
-    '36477',
-    '36482',
     '36492',
-    '36497',
-    '36498',
-    '365&frac14',
-    '365&ndash;374',
-    '36501',
-    '36503',
-    '36507',
-    '36514-15',
-    '36518',
-    '36524',
-    '36537',
-    '36548',
-    '36557',
-    '36591',
-    '36604',
     '36605-06',
-    '36613',
-    '36627-28',
-    '36642-44',
-    '36645',
-    '36650',
-    '36651',
-    '36651-52',
-    '36662',
-    '36665',
-    '36672',
-    '36681',
-    '366p',
-    '367,000',
-    '36720-21',
-    '36724-25',
     '36729',
-    '36731',
-    '36735',
-    '36738',
-    '36757',
-    '36763',
-    '36776',
-    '36779',
-    '36788-89',
-    '36792',
-    '36793',
-    '3680',
-    '36804',
-    '36805',
-    '36806',
-    '36817',
     '36820',
-    '36821',
-    '36830',
-    '36832-33',
-    '36835',
-    '36847',
-    '36849-50',
-    '36852',
-    '36857',
-    '36861',
-    '36870',
-    '36887',
-    '36889-90',
-    '36895',
-    '36902',
-    '36913',
     '36915',
-    '36917',
-    '36930',
-    '36939',
-    '36943',
-    '36947',
-    '36948',
-    '36950',
-    '36952',
-    '36961',
-    '36963',
-    '36963-64',
-    '36972-73',
-    '36975',
-    '36978',
-    '36983-84',
     '36984',
-    '36984-85',
-    '36985',
-    '36986-87',
-    '36993',
-    '36994',
-    '36999',
-    '36c',
-    '36e',
-    '37&deg',
-    '37&deg;c.',
-    '37&ndash;1',
-    '37&ndash;39',
-    '37&ndash;40',
-    '37&ndash;46',
-    '37,654.29',
     '37,858.11',
-    '37-page',
-    '37.',
-    '37.0',
-    '37.4%',
-    '37/4',
-    '37001',
-    '37007',
-    '37008',
-    '37009',
-    '37033-34',
-    '37038-39',
-    '37045',
-    '37047',
-    '37050-51',
-    '37052-53',
     '37058',
-    '37062',
-    '37067',
-    '37069',
-    '37081',
-    '37082',
-    '370p',
-    '37104',
-    '37106',
-    '37110-12',
-    '37111',
-    '37121',
-    '37131',
-    '37145',
-    '37159',
-    '3717',
     '37172-73',
-    '37179',
-    '37183',
-    '37184-85',
-    '37189',
-    '37193',
-    '37219',
-    '37222',
-    '37223',
-    '37225',
-    '37226',
-    '37227-29',
-    '37235',
-    '37240',
-    '37249',
-    '37257',
     '37261',
-    '37263-64',
-    '37264-65',
-    '37267-68',
-    '37296-97',
-    '37298',
-    '3730',
-    '37300',
-    '37306',
-    '37311-12',
-    '37318-19',
-    '37320-21',
-    '37321',
-    '37325',
-    '37327-28',
-    '37329',
     '37331-32',
-    '37356',
-    '37360-61',
-    '37360-62',
-    '37364',
-    '37365',
-    '37370-71',
-    '37383-84',
-    '37391-92',
-    '37408',
-    '37413',
-    '37418',
-    '37427',
-    '37430',
-    '37431',
-    '37432',
     '37435',
-    '37440',
-    '37440-41',
-    '37445-46',
-    '37450-51',
-    '37451-52',
-    '37452-53',
-    '37454-55',
-    '37462',
-    '37468-69',
-    '37469',
-    '37470',
-    '37487',
-    '37534',
-    '37535-36',
-    '37537',
     '37542',
-    '37542-43',
-    '37547-48',
-    '37550-51',
-    '37558',
-    '37582',
-    '37583',
-    '37587',
-    '37592',
-    '37598-99',
-    '37599-600',
-    '375g',
-    '375g/13oz',
-    '375ml/15fl',
-    '37609',
-    '37609-10',
     '37614-17',
-    '37619',
-    '37620-21',
-    '37628',
-    '37636-37',
-    '37651-52',
-    '37658',
-    '37659-61',
-    '37662',
-    '37663',
-    '37665',
-    '37666',
-    '37683',
-    '37689',
-    '37698',
-    '37702-03',
     '37704',
-    '37710-11',
-    '37722',
-    '37752',
-    '37760',
-    '37762-63',
-    '37767-68',
-    '37769',
-    '37771-72',
-    '37773-74',
-    '37787',
-    '37792',
-    '37808',
-    '37812',
-    '37820',
-    '37822',
     '37825',
-    '37826',
-    '37832',
-    '37832-33',
-    '37843',
-    '37843-44',
-    '37845',
-    '37849-50',
-    '37858',
-    '37862',
-    '37865',
-    '37877',
-    '37889',
-    '37890',
-    '37892',
-    '37897-98',
     '37902',
-    '37906-07',
-    '37914-15',
-    '37918',
-    '37924-25',
-    '37926-27',
-    '37928-29',
-    '37934-43',
-    '37939',
-    '37950',
-    '37951-52',
-    '37982-86',
-    '37982-90',
-    '37986',
-    '379a',
-    '37b',
     '37c',
-    '37pp',
-    '38&ndash;10',
-    '38-m',
-    '38.0',
-    '38.3%',
-    '38.7bn',
-    '38.8%',
-    '38.9%',
-    '38005',
-    '38006-07',
-    '38010-11',
-    '38013',
-    '38080-81',
-    '38085',
-    '38094',
     '38094-95',
-    '380s',
-    '38100',
-    '38105-06',
-    '38126-27',
-    '38127',
-    '38129-30',
-    '38130-31',
-    '38135-36',
-    '38138',
-    '38149',
-    '38174-75',
-    '38178',
-    '38183',
-    '38218',
-    '38229',
     '38237',
-    '3827',
-    '38295-97',
-    '382b',
-    '383,000',
-    '38305',
-    '38310',
-    '38315',
-    '38318-19',
-    '38338-39',
-    '38343',
-    '38352',
-    '38352-53',
-    '38359',
-    '38360',
-    '38366',
     '38368-73',
-    '3838',
-    '38380',
-    '38381',
-    '38383',
-    '38389',
-    '38397',
-    '38398',
-    '384&ndash;322',
-    '38400',
-    '38411',
-    '38419-20',
-    '38427',
-    '38429',
-    '38433',
-    '38440-41',
     '38441',
-    '38456',
-    '38457',
-    '38458-59',
-    '38469',
-    '384mb',
-    '384p',
-    '385/3/i',
-    '38508',
-    '38515-16',
-    '38523',
-    '38528',
-    '38541-42',
-    '38566',
-    '38571',
-    '38573',
     '38575',
-    '38576',
-    '38586',
-    '38594-95',
-    '386-33',
-    '38600-01',
-    '38601-02',
-    '38602',
-    '38654',
-    '38660',
-    '38663',
-    '38671',
-    '38674',
-    '38683-84',
-    '38687',
-    '38692-93',
     '38693',
-    '38694',
-    '38698',
-    '38698-99',
-    '386p',
-    '38703-04',
-    '38705',
-    '38715',
-    '38733',
-    '38736-37',
-    '38745',
-    '38751',
-    '38753',
-    '38765',
-    '38771',
-    '38781',
     '38788-89',
-    '38792',
-    '38792-93',
-    '388(4)',
-    '38803',
-    '38808',
-    '38813',
-    '38814',
-    '38815',
-    '38819',
-    '38820-21',
-    '38825-26',
-    '38826',
-    '38827-28',
-    '38830',
-    '38835',
     '38836',
-    '38837',
-    '38843',
-    '38850',
-    '38852',
-    '38854',
-    '38857',
-    '38858-59',
-    '38884',
-    '38891',
-    '38897',
-    '38898',
-    '38907',
-    '38909-10',
-    '38910',
-    '38918',
     '38936',
-    '38938',
-    '38942-43',
-    '38943',
-    '38944-45',
-    '38946',
-    '38947',
-    '38953',
-    '38959',
-    '38962-63',
-    '38969',
-    '38973',
-    '38977',
-    '38985',
-    '38993',
-    '38996',
     '38a',
-    '38b',
-    '38c',
-    '38ma',
-    '38pts',
-    '38s/3/i',
-    '38th-minute',
-    '39&ndash;42',
-    '39.2%',
-    '39.7%',
-    '39.72',
-    '39001',
-    '39003',
-    '39012',
-    '39016',
-    '39023',
     '39027',
-    '39030-31',
-    '39036',
-    '39043',
-    '39044',
-    '39048',
-    '39050',
-    '39059',
-    '39064',
-    '39079',
-    '39080',
-    '39084',
-    '39089',
-    '39090',
-    '390p',
-    '39109',
     '39117',
-    '39128',
-    '39130',
-    '39136',
-    '39138',
-    '39144',
-    '39146',
-    '39157',
-    '39161',
-    '39164',
-    '39178',
-    '39179',
-    '39200',
-    '39205',
-    '39206',
-    '39208',
     '39214',
-    '39215',
-    '39217',
-    '3930',
-    '3940',
-    '3945',
-    '397,000',
-    '3979',
-    '397g',
-    '398,000',
-    '39c',
-    '39f',
-    '39pts',
-    '3:00',
-    '3:1&ndash;6',
-    '3:18',
     '3:19',
-    '3:22&ndash;4:1',
-    '3:24',
-    '3:25',
-    '3b2',
-    '3c273',
-    '3ch134',
-    '3db',
-    '3ew',
-    '3f',
-    '3jj',
-    '3jy',
-    '3nq',
-    '3ozs',
-    '3pts',
-    '3rd.',
     '3rg',
-    '3rl',
-    '3ta',
-    '3tbspns',
-    '3yrs',
-    '4&commat;1/2-year',
-    '4&frac12;d.',
-    '4&frac12;p',
-    '4&frac34',
-    '4&mgr;m',
-    '4&micro;l',
-    '4&ndash;13',
-    '4&ndash;16',
-    '4&ndash;2&ndash;4',
-    '4&ndash;200',
-    '4&ndash;33',
     '4&ndash;34',
-    '4&ndash;45',
-    '4&ndash;48',
-    '4&ndash;5&deg;c',
-    '4&ndash;5cm',
-    '4&ohm',
-    '4&percnt',
-    '4&shilling',
-    '4&times;6',
-    '4(7)',
-    '4,000-5,000',
-    '4,001',
-    '4,045',
-    '4,250',
-    '4,3',
-    '4,5-bisphosphate',
     '4,650',
-    '4,685',
-    '4,950',
-    '4-14',
-    '4-bromo-a23187',
-    '4-c',
-    '4-mile',
-    '4-month',
-    '4-point',
-    '4-quarter',
-    '4.00am',
-    '4.04',
-    '4.1(c)',
-    '4.1.',
-    '4.11(a)',
-    '4.14(a)',
     '4.14(b)',
-    '4.15(b)',
-    '4.15am',
-    '4.1p',
-    '4.2.1.1',
-    '4.2.1.2',
-    '4.2.2.3',
-    '4.20pm',
-    '4.25pm',
-    '4.3(b)',
-    '4.31',
-    '4.38',
-    '4.3c',
-    '4.4(4)',
-    '4.4.4',
-    '4.4.6',
     '4.43',
-    '4.4fl',
-    '4.5&ndash;3.5',
-    '4.5.1.2',
-    '4.50pm',
-    '4.51',
-    '4.58',
-    '4.59',
-    '4.5mb',
-    '4.6(a)',
-    '4.6(b)',
-    '4.6.3',
-    '4.61',
-    '4.63',
-    '4.64',
-    '4.69',
     '4.7(a)',
-    '4.70',
-    '4.74',
-    '4.79',
-    '4.86',
-    '4.87',
-    '4.89',
-    '4.8m',
-    '4.9(b)',
-    '4.9.2',
-    '4.99%',
-    '4/2',
-    '4/3',
-    '4/73',
-    '4/74',
-    '4/8',
     '4/i',
-    '40&frac12',
-    '40&ins',
-    '40&mdash;50',
-    '40&ndash;41',
-    '40&ndash;53',
-    '40&ndash;54',
-    '40&ndash;69',
-    '40(2)',
-    '40,000-strong',
-    '40,500',
-    '40-60',
-    '40-fold',
-    '40-foot',
-    '40-metre',
-    '40.',
     '40.1%',
-    '40.2%',
-    '40.3%',
-    '40.6',
-    '40.7',
-    '40.7%',
-    '40.8',
-    '400&deg;f/gas',
-    '400&ndash;700',
-    '400,000,000',
-    '400-odd',
-    '400-ton',
-    '4000&ndash;5000',
-    '400kv',
-    '400lbs',
-    '400nm',
     '401p',
-    '4026',
-    '403&ndash;4',
-    '403p',
-    '404,000',
-    '406dpi',
-    '4081',
-    '4084',
-    '40a',
-    '40b',
-    '40db',
-    '40secs',
-    '40th-minute',
-    '41&deg;c',
-    '41&ndash;102',
-    '41.0',
     '41.2',
-    '41.6%',
-    '41.9%',
-    '415p',
-    '4167',
-    '416p',
-    '417-646',
-    '417m',
-    '418p',
-    '419p',
-    '41b',
-    '41secs',
-    '42&ndash;0',
-    '42&ndash;106929',
-    '42&ndash;108784',
-    '42&ndash;43',
     '42(4)',
-    '42(5)',
-    '42,000,000',
-    '42,500',
-    '42-seat',
-    '42.3%',
-    '42.4',
-    '42.4032',
-    '42.7%',
-    '42.8',
-    '42.8%',
-    '420%',
-    '42140',
-    '423,000',
-    '4230',
-    '4233',
     '424p',
-    '4259',
-    '426p',
-    '427p',
-    '428g',
-    '428p',
-    '42:1',
-    '42cm',
-    '42mm',
-    '42secs',
-    '42xx',
-    '43&deg;c',
-    '43&prime',
-    '43\'s',
-    '43-year',
-    '43.',
     '43.0',
-    '43.3%',
-    '43.5%',
-    '43.7%',
-    '430p',
-    '4320',
-    '4350',
-    '4380',
-    '43ft',
-    '43m',
-    '44&ndash;22633',
-    '44(3)',
-    '44/16',
-    '44/207',
-    '440k',
-    '441483',
     '4425',
-    '443241',
-    '4459',
-    '446,000',
-    '4477',
-    '447p',
-    '4480',
-    '448p',
-    '44932',
-    '4498',
-    '44bc',
-    '44mb',
-    '44pp',
-    '44secs',
-    '45&deg;s',
-    '45&ins',
     '45&ndash;59',
-    '45&ndash;6',
-    '45&ndash;65',
-    '45&ndash;7',
-    '45.0',
-    '45.1%',
-    '45.4%',
-    '45.6',
-    '45.8%',
-    '45.9',
-    '450&deg;c',
-    '4500rpm',
-    '450mb',
-    '450ml/',
-    '450ml/&frac34',
-    '45133',
     '4546',
-    '4550',
-    '456&ndash;7',
-    '45c',
-    '45k',
-    '45mbps',
-    '45sec',
-    '46&deg;c',
-    '46&ndash;47',
-    '46&ndash;53',
-    '46(2)',
-    '46.1%',
-    '46.4%',
-    '46.9',
-    '46000',
-    '460kg',
     '460p',
-    '463p',
-    '4664',
-    '469p',
-    '46k',
-    '46sec',
-    '47\'s',
-    '47-member',
-    '47.',
-    '47.2%',
-    '47.37',
-    '47.4',
-    '47.54',
-    '47.5p',
-    '471800',
-    '472p',
     '473p',
-    '474p',
-    '47b',
-    '47ft',
-    '48&aring',
-    '48&ndash;49',
-    '48&ndash;55',
-    '48&ndash;9',
-    '48,000,000',
-    '48-minute',
-    '48-seat',
-    '48.00',
-    '48.4%',
-    '48.7',
-    '480m',
-    '481p',
     '482&ndash;483',
-    '4822',
-    '486/m',
-    '4861',
-    '486sxs',
-    '4870(a)',
-    '48ft',
-    '48gb',
-    '48pp',
-    '48sec',
-    '49-50',
-    '49-ers',
-    '49.6',
-    '49.8',
-    '490p',
-    '4930',
     '4938',
-    '499p',
-    '4:21',
-    '4:26',
-    '4:8',
-    '4b4',
-    '4ba',
-    '4eu',
-    '4gl/gx',
-    '4h1',
-    '4ht',
-    '4inches',
-    '4jl',
-    '4lp',
-    '4ly',
-    '4mhz',
     '4nx',
-    '4ppm',
-    '4pu',
-    '4st',
-    '4u',
-    '4w',
-    '4x12&ins',
-    '4x12s',
-    '4yf',
-    '5&frac34&ins',
-    '5&ft;2&ins',
-    '5&mdash;7',
-    '5&micro;g/ml',
-    '5&ndash;150',
-    '5&ndash;19',
-    '5&ndash;26',
     '5&ndash;28',
-    '5&ndash;34',
-    '5&ndash;35',
-    '5&ndash;42',
-    '5&ndash;50',
-    '5&ndash;58',
-    '5&ndash;6&ins',
-    '5&ndash;6000',
-    '5&percnt',
-    '5\'11',
-    '5\'7',
-    '5\'ctagag3\'',
-    '5\'gggccc3\'',
-    '5(1a)',
-    '5(8)',
-    '5,000-6,000',
     '5,000-7,000',
-    '5,000-8,000',
-    '5,000-mile',
-    '5,000-odd',
-    '5,000kg',
-    '5,100',
-    '5,765',
-    '5-mile',
-    '5-stringers',
-    '5.01c',
-    '5.03p',
-    '5.05',
-    '5.08',
-    '5.1.0',
-    '5.10.1',
-    '5.10.3',
     '5.11(a)',
-    '5.11(b)',
-    '5.11(c)',
-    '5.11.1',
-    '5.11.2',
-    '5.11.3',
-    '5.11.4',
-    '5.12.2',
-    '5.13(2)',
-    '5.15am',
-    '5.15pm',
-    '5.16.3',
-    '5.16e',
-    '5.18d',
-    '5.1m',
-    '5.2(b)',
     '5.24b',
-    '5.27a',
-    '5.2p',
-    '5.3(b)',
-    '5.3.24',
-    '5.3.3.2',
-    '5.3.7',
-    '5.3.8',
-    '5.35pm',
-    '5.4.',
-    '5.4.8',
-    '5.40am',
-    '5.49',
-    '5.4a',
-    '5.52',
-    '5.53',
     '5.55',
-    '5.5in',
-    '5.6.5',
-    '5.7m',
-    '5.85',
-    '5.8pc',
-    '5.9.5',
-    '5.9pc',
-    '5/1',
-    '5/11',
-    '5/2/90',
-    '5/3',
-    '5/7',
-    '50&deg;s',
-    '50&deg;w',
-    '50&ft',
     '50&mgr;g',
-    '50&micro;l',
-    '50&ndash;1200',
-    '50&ndash;2',
-    '50&ndash;200',
-    '50&ndash;3',
-    '50&ndash;500',
-    '50&ndash;59',
-    '50&ndash;70mph',
-    '50-foot',
-    '50-metre',
-    '50-over',
-    '50-week',
-    '50.0',
-    '50.0%',
-    '50.3%',
     '50.4',
-    '50.5%',
-    '50.6',
-    '500&ndash;1000',
-    '500+',
-    '500,000-strong',
-    '500-600',
-    '500-fold',
-    '500-odd',
-    '500-year-old',
-    '500g/1&frac14;lb',
-    '500gb',
-    '500kb',
-    '500mev',
-    '500ml/1pt/2&amp',
-    '500ml/1pt/2&frac12',
     '500p',
-    '502p',
-    '504377',
-    '504k',
-    '50b',
-    '50c',
-    '50g/2oz/&frac14',
-    '50gb',
-    '50kw',
-    '50min',
-    '50mpg',
-    '50ms',
-    '50ppm',
-    '51&ndash;100',
-    '51&ndash;2',
-    '51&ndash;56',
     '51(3)',
-    '51(8)',
-    '51,600',
-    '51.',
-    '51.4%',
-    '510p',
-    '512-member',
-    '5138',
-    '518i',
-    '518p',
-    '51a',
-    '51p7',
-    '51st-minute',
-    '52&ft',
-    '52&ndash;3',
-    '52.1%',
     '52.5',
-    '52.8',
-    '520p',
-    '5224',
-    '525,000',
-    '5250rpm',
-    '5270',
-    '52nd-minute',
-    '52s',
-    '53&deg',
-    '53&ndash;6.72',
-    '53(3)',
-    '53-year',
-    '53.1',
-    '53.1%',
-    '53.2',
     '53.5%',
-    '53.6',
-    '53/4p',
-    '5303',
-    '530h',
-    '533333',
-    '533p',
-    '534p',
-    '538.7',
-    '53b',
-    '53s',
-    '54&deg;c',
-    '54-hole',
-    '54.',
-    '54.1',
-    '54.3%',
     '54.5',
-    '5407',
-    '540mb',
-    '540s',
-    '542.6',
-    '5430',
-    '544321',
-    '5459',
-    '5466',
-    '547.8',
-    '54ft',
-    '54m',
-    '54secs',
-    '55&ndash;70',
-    '55,500',
-    '55.',
     '55.4%',
-    '55.49',
-    '55.8%',
-    '55.9%',
-    '55020',
-    '550kg',
-    '5520',
-    '552p',
-    '553p',
-    '5555',
-    '5566',
-    '5573',
-    '5593',
-    '55bp',
-    '55c',
-    '55ft',
     '55mph',
-    '56&ndash;57',
-    '56(1)',
-    '56,940',
-    '56.',
-    '56.0',
-    '56.1',
-    '56.1%',
-    '561382',
-    '561539',
-    '5637',
-    '564p',
-    '565p',
-    '5670',
-    '56767',
-    '568373',
     '56pc',
-    '57&ndash;61',
-    '57(1)',
-    '57(2)',
-    '57(3)',
-    '57-cm',
-    '57-member',
-    '57.1%',
-    '57.48',
-    '57.57sec',
-    '57.5p',
-    '57.6%',
-    '57.7',
-    '57.7%',
-    '57.9',
-    '570p',
     '5750/iso',
-    '5799',
-    '57b',
-    '58&ndash;59',
-    '580s',
-    '587,000',
-    '5885',
-    '58m',
-    '59&deg;f',
-    '59&mdash;61',
-    '59.1',
-    '59.3',
-    '59.50',
-    '590,000',
-    '5931',
-    '593786',
     '5940',
-    '5950',
-    '598p',
-    '59k',
-    '59pc',
-    '5:13',
-    '5:19',
-    '5amp',
-    '5au',
-    '5br',
-    '5c/6a',
-    '5dr',
-    '5h',
-    '5he',
-    '5jw',
-    '5khz',
     '5m.',
-    '5mins',
-    '5mt',
-    '5nm',
-    '5ra',
-    '5st',
-    '5xh',
-    '6&frac12&ins',
-    '6&mgr;m',
-    '6&ndash;17',
-    '6&ndash;21',
-    '6&ndash;8.30pm',
-    '6&ndash;8in',
-    '6\'',
-    '6(c)',
-    '6(i)',
     '6,000-mile',
-    '6,000kg',
-    '6,330',
-    '6,760',
-    '6,800kg',
-    '6-in',
-    '6.0%',
-    '6.01',
-    '6.02',
-    '6.022',
-    '6.03',
-    '6.05pm',
-    '6.1.4',
-    '6.14(a)',
-    '6.1b',
-    '6.22a-f',
     '6.25pc',
-    '6.3&ndash;6.6',
-    '6.40am',
-    '6.44',
-    '6.45am',
-    '6.4m',
-    '6.5.0',
-    '6.5.4',
-    '6.53',
-    '6.54',
-    '6.55pm',
-    '6.5a',
-    '6.5b',
-    '6.5cm',
-    '6.5f',
-    '6.5kb',
     '6.5pc',
-    '6.5secs',
-    '6.6&ndash;7.4',
-    '6.6(a)',
-    '6.6(b)',
-    '6.6.1',
-    '6.6.3',
-    '6.6.5',
-    '6.63',
-    '6.66',
-    '6.6a',
-    '6.7.1',
-    '6.75p',
-    '6.7a',
-    '6.97',
-    '6/',
     '6/0',
-    '6/11/87',
-    '6/12',
-    '6/86',
-    '6/90',
-    '60%-40%',
-    '60&deg&ndash;70&deg;f',
-    '60&deg;n',
-    '60&ndash;56',
-    '60&ndash;65%',
-    '60&ndash;74',
-    '60&ndash;80%',
-    '60,000-strong',
-    '60-100',
-    '60-70%',
-    '60-bed',
     '60-fold',
-    '60-mm',
-    '60-plus',
-    '60-run',
-    '60.0',
-    '60.1',
-    '60.5',
-    '60/100',
-    '60/m',
-    '600%',
-    '600&ndash;900',
-    '600-700',
-    '600-inmate',
-    '600-strong',
-    '600-yard',
-    '6000/35',
     '600000',
-    '600bc',
-    '600j',
-    '600k',
-    '600kb',
-    '600lb',
-    '60163',
-    '602p',
-    '6058',
-    '606mhz',
-    '6070',
-    '6079',
-    '607p',
-    '60db',
-    '60gb',
-    '60kg',
     '60lb',
-    '61&ndash;70',
-    '61&ndash;xiv',
-    '61.7',
-    '61.7%',
-    '61.9%',
-    '61002',
-    '61094',
-    '6124',
-    '614p',
-    '615th',
-    '6165',
-    '619821',
-    '61a',
-    '62&ndash;63',
-    '62.8%',
     '62.9',
-    '6201',
-    '6203',
-    '6206',
-    '6220',
-    '622101',
-    '623gsi',
-    '625,000',
-    '6278',
-    '629201',
-    '629962',
-    '62a',
-    '62b',
-    '62ft',
-    '63.0%',
-    '63.4',
     '63.7',
-    '63.7%',
-    '63.9%',
-    '6300',
-    '6314',
-    '632&ndash;633',
-    '633/4',
-    '6382',
-    '6397',
-    '639g',
-    '639p',
-    '63rd-minute',
-    '64&deg;f',
-    '64&ndash;93',
-    '64-page',
-    '64.0',
     '64.2',
-    '64.3%',
-    '64.5',
-    '640kbytes',
-    '643657',
-    '6490',
-    '64cm',
-    '64km',
-    '64pp',
-    '65&deg;n',
-    '65&ndash;90',
-    '65-66',
-    '65-minute',
-    '65.4',
-    '65.6',
-    '65.8',
     '65000',
-    '656,000',
-    '657cc',
-    '65a',
-    '65km',
-    '65m',
-    '65mhz',
-    '66&ndash;7',
-    '66,500',
-    '66-minute',
-    '66-year',
-    '66.6',
-    '66/m',
-    '663p',
-    '6666',
-    '666p',
     '66th-minute',
-    '67.2',
-    '67.3',
-    '67.8%',
-    '67.9%',
-    '67290',
-    '677p',
-    '67ft',
-    '67m',
-    '67mhz',
-    '68&ndash;9',
-    '68.2',
-    '68.5',
-    '68.5%',
-    '68.6',
-    '68.6%',
     '68.9%',
-    '68040s',
-    '680s',
-    '685873',
-    '685p',
-    '6871',
-    '68en360',
-    '68mm',
-    '68p',
-    '69&ndash;79',
-    '69.1%',
-    '69.7',
-    '69.7%',
-    '69.9',
-    '69/647',
-    '690,000',
     '6911',
-    '695.74',
-    '6998',
-    '69pm',
-    '6:2&ndash;3',
-    '6:3',
-    '6:30am',
-    '6:30pm',
-    '6:4',
-    '6:5',
-    '6:6',
-    '6:6&ndash;11',
-    '6ab',
-    '6bs',
-    '6dz',
-    '6e7',
     '6ft-high',
-    '6he',
-    '6jj',
-    '6pts',
-    '6rd',
-    '6th.',
-    '6w',
-    '6x10',
-    '7&deg;c',
-    '7&frac12;in',
-    '7&frac34',
-    '7&ndash;04',
-    '7&ndash;05',
-    '7&ndash;15',
-    '7&ndash;17',
-    '7&ndash;22',
     '7&ndash;23',
-    '7&ndash;24',
-    '7&ndash;26',
-    '7&ndash;30',
-    '7&ndash;33\'',
-    '7&ndash;34',
-    '7(b)',
-    '7+',
-    '7,000&ndash;8,000',
-    '7-year-olds',
-    '7.0&ndash;8.0',
-    '7.01',
-    '7.1.3',
-    '7.1.4',
-    '7.2(b)',
-    '7.2.6',
     '7.25am',
-    '7.26',
-    '7.3(1)',
-    '7.3(9)',
-    '7.3.2.1',
-    '7.30&ndash;8pm',
-    '7.3b',
-    '7.3m',
-    '7.3secs',
-    '7.4(b)',
-    '7.40am',
-    '7.42',
-    '7.44',
-    '7.46',
-    '7.5(b)',
-    '7.5d.p.c.',
     '7.6.1.1',
-    '7.6.6',
-    '7.63',
-    '7.65',
-    '7.6p',
-    '7.7.9.2',
-    '7.79%',
-    '7.82',
-    '7.8m',
-    '7.8p',
-    '7.9.1',
-    '7.9.3',
-    '7.98',
-    '7/2',
-    '70&deg;s',
-    '70&ndash;1',
     '70&ndash;100',
-    '70&ndash;71',
-    '70&ndash;72',
-    '70&percnt',
-    '70-80%',
-    '70-strong',
-    '70-year-olds',
-    '70.2',
-    '70.3%',
-    '70.5%',
-    '70.9%',
-    '70/',
-    '70/min',
-    '700%',
-    '700-strong',
-    '7000m',
     '7001',
-    '700t',
-    '7030',
-    '705p',
-    '707/300&ndash;400',
-    '7080',
-    '70a',
-    '70km',
-    '70lb',
-    '71&ndash;2',
-    '71&ndash;75',
-    '71.2%',
-    '7105',
-    '710t',
-    '7112',
-    '714.00',
     '716p',
-    '717p',
-    '72.1%',
-    '72.5%',
-    '72.6',
-    '72.6%',
-    '72/161',
-    '720s',
-    '722851',
-    '7230',
-    '7242',
-    '725912',
-    '727s',
-    '72dpi',
-    '72h',
-    '73.5%',
     '73.68',
-    '73.8%',
-    '73.9%',
-    '730,000',
-    '7307',
-    '730s',
-    '7312087',
-    '7324',
-    '7350',
-    '7370',
-    '73pc',
-    '74.2',
-    '74.5',
-    '74.9',
-    '741481',
-    '743(2)',
     '7430',
-    '744500',
-    '745i',
-    '7472',
-    '747i',
-    '747p',
-    '74p',
-    '75&deg;c',
-    '75&deg;n',
-    '75&ndash;76',
-    '75&ndash;8',
-    '75&ndash;85%',
-    '75&ndash;90',
-    '75-minute',
-    '75.',
-    '75.5',
     '75/25',
-    '7509',
-    '75383',
-    '7550',
-    '75700',
-    '758243',
-    '75lb',
-    '75th-minute',
-    '76&deg;f',
-    '76&ndash;7',
-    '76(b)',
-    '76(c)',
-    '76-mm',
-    '76.2%',
-    '76.4',
-    '76.6',
     '762212',
-    '764&ndash;5',
-    '766/458',
-    '7690',
-    '77&ndash;79&deg;f',
-    '77.3',
-    '77.6%',
-    '77.7',
-    '77.9',
-    '77/187',
-    '770/1368&ndash;9',
-    '77177',
-    '7737',
-    '773p',
-    '7750',
-    '7752',
     '775p',
-    '77th-minute',
-    '78&deg;s',
-    '78.6',
-    '78.8',
-    '7800',
-    '78018',
-    '78022',
-    '780p',
-    '783/1381',
-    '7888',
-    '79&ndash;3',
-    '79.2',
-    '79th-minute',
-    '7:23',
-    '7:30',
     '7:36&ndash;50',
-    '7:47',
-    '7ae',
-    '7bp',
-    '7cms',
-    '7dz',
-    '7ey',
-    '7ez',
-    '7hn',
-    '7hour',
-    '7inch',
-    '7kw',
-    '7rt',
-    '7t',
-    '7ts',
-    '8&frac12;in',
     '8&frac34',
-    '8&mdash;10',
-    '8&mgr;m',
-    '8&ndash;20',
-    '8&ndash;29',
-    '8&ndash;38',
-    '8&ndash;46',
-    '8&ndash;50',
-    '8&ndash;8',
-    '8&percnt',
-    '8\'',
-    '8(d)',
-    '8,000-plus',
-    '8,000yrbp',
-    '8,125',
-    '8,847',
     '8,907',
-    '8,928.55',
-    '8-14',
-    '8-18',
-    '8-7',
-    '8-week',
-    '8.1(b)',
-    '8.15.8',
-    '8.17.7',
-    '8.2.',
-    '8.2.5',
-    '8.3.3',
-    '8.4(b)',
-    '8.45pm',
-    '8.46',
-    '8.483',
     '8.5.1',
-    '8.5.5',
-    '8.50pm',
-    '8.52',
-    '8.55am',
-    '8.56',
-    '8.5d.p.c.',
-    '8.5p',
-    '8.6.1',
-    '8.6.2',
-    '8.65',
-    '8.7(b)',
-    '8.73',
-    '8.7n',
-    '8.7pc',
-    '8.9m',
     '8/1',
-    '8/5/93',
-    '8/6d',
-    '8/8',
-    '8/8/93',
-    '8/87',
-    '8/91',
-    '80%-90%',
-    '80&deg;s',
-    '80&ft',
-    '80&percnt',
-    '80&sol;77',
-    '80,000-strong',
-    '80-hour',
-    '80-minute',
-    '80-seat',
     '80-yard',
-    '80.0',
-    '80.1%',
-    '800%',
-    '800-software',
-    '800-strong',
-    '800/1397',
-    '80080',
-    '800dpi',
-    '800ft',
-    '800k',
-    '800km',
-    '800mbps',
-    '80860s',
-    '80860xp',
-    '80bhp',
     '80hp',
-    '80kg',
-    '80m-bytes',
-    '80va',
-    '80year-old',
-    '81&ndash;82',
-    '81&sol;77',
-    '81.6%',
-    '81.7%',
-    '81.8',
-    '8105',
-    '8120',
-    '8160',
-    '81a',
-    '82&deg;f',
-    '82&ndash;4',
     '82-member',
-    '82.3%',
-    '82.7%',
-    '820,000',
-    '8212',
-    '822&ndash;4715',
-    '822631',
-    '8230',
-    '8233',
-    '8270',
-    '828/1424&ndash;5',
-    '82nd-minute',
-    '82p',
-    '83&ndash;6',
-    '83.1',
-    '83.5',
     '83.5%',
-    '8323',
-    '833&mdash;4',
-    '833241',
-    '836494',
-    '839/1435&ndash;6',
-    '83a',
-    '83ft',
-    '84&deg',
-    '84&deg;s',
-    '84&ndash;7',
-    '84(1)',
-    '84-166',
-    '84-249',
-    '84.2%',
-    '84.7',
     '840,000',
-    '840s',
-    '8431',
-    '843mhz',
-    '845,000',
-    '84a',
-    '84f',
-    '84h10',
-    '85&ndash;90%',
-    '85-86',
-    '85-type',
-    '85.11',
-    '85.4',
-    '85.6%',
-    '85.7%',
-    '85.8',
     '850000',
-    '8501',
-    '8504',
-    '850428',
-    '850f',
-    '850m',
-    '855/1451',
-    '85697',
-    '85732',
-    '85cm',
-    '86-hour',
-    '86.2',
-    '860s',
-    '8616',
-    '8670',
-    '86pc',
     '87&ndash;88',
-    '87.9',
-    '87/88',
-    '8700',
-    '870s',
-    '871/1466&ndash;7',
-    '873/1468',
-    '87pc',
-    '88&ndash;89',
-    '88.5',
-    '88.6',
-    '88.6%',
-    '88.9%',
-    '88/89',
-    '88110s',
-    '8812',
     '885/1480&ndash;1',
-    '88mb',
-    '89&ndash;90',
-    '89.3',
-    '89.5',
-    '89.5%',
-    '89/90',
-    '8916',
-    '8941',
-    '897s',
-    '8990',
-    '8:12',
-    '8:14',
-    '8:28',
-    '8:34',
-    '8:44',
     '8:9',
-    '8a+',
-    '8ab',
-    '8aj',
-    '8aq',
-    '8en',
-    '8ha',
-    '8hl',
-    '8jj',
-    '8km/5mls',
-    '8oz/225g',
-    '8ozs.',
-    '8pm.',
-    '8pp',
-    '8ps',
-    '8qb',
     '8w',
-    '9&deg',
-    '9&frac12;in',
-    '9&ndash;20',
-    '9&ndash;30',
-    '9&ndash;95',
-    '9&sol;87',
-    '9\'s',
-    '9(7)',
-    '9,491',
-    '9,800',
-    '9,800,000',
-    '9,900',
-    '9,999',
-    '9-13',
-    '9-month-olds',
     '9.0p',
-    '9.11(b)',
-    '9.11b',
-    '9.15.2',
-    '9.2.3',
-    '9.23',
-    '9.31',
-    '9.39',
-    '9.4.3',
-    '9.41',
-    '9.44',
-    '9.5.1',
-    '9.5bn',
-    '9.5p',
-    '9.5yd',
-    '9.6.1',
     '9.63',
-    '9.6kbps',
-    '9.74',
-    '9.8.2',
-    '9.86',
-    '9.89',
-    '9.92',
-    '9.93',
-    '9.96',
-    '9/2/87',
-    '9/90',
-    '90&deg;f',
-    '90&ndash;1',
-    '90&ndash;105',
-    '90&ndash;110',
-    '90,000,000',
     '90-line',
-    '90-odd',
-    '90.2%',
-    '90.4%',
-    '90.5%',
-    '90.9',
-    '90/91',
-    '900%',
-    '90000',
-    '900kg',
-    '900m',
-    '900mhz',
-    '900ml/1&frac12',
-    '901/1495&ndash;6',
-    '9058',
-    '9066',
     '9076',
-    '90g',
-    '90g/3&frac12;oz',
-    '90gb',
-    '90hp',
-    '90mins',
-    '90o',
-    '91.25',
-    '91.9%',
-    '911s',
-    '9121',
-    '914mm',
-    '92&ndash;3',
-    '92&ndash;4',
-    '92&ndash;93',
-    '92/59/eec',
     '92350',
-    '92354',
-    '92359',
-    '9252',
-    '93&micro;a',
-    '93&ndash;94',
-    '93.4',
-    '93.8%',
-    '93/94',
-    '93/tokyo',
-    '9333',
-    '936/1530',
-    '937.50',
-    '9392',
-    '93pc',
-    '94&ndash;7',
     '94.4',
-    '94.4%',
-    '94.5%',
-    '94.7%',
-    '95.0',
-    '95.2%',
-    '95.3%',
-    '950e',
-    '954/1547',
-    '9540',
-    '9570',
-    '959/1552',
-    '95mph',
-    '96-pin',
-    '96-year-old',
-    '96.2%',
     '96.3',
-    '96.5%',
-    '96.7',
-    '960,000',
-    '960mhz',
-    '97-year-old',
-    '97.4',
-    '97.5%',
-    '97.51',
-    '970/1562&ndash;3',
-    '970b',
-    '977/1569',
-    '98.1%',
-    '98.9',
-    '9850',
-    '9880',
     '99.4%',
-    '99.8%',
-    '9900',
-    '9960',
-    '9:11',
-    '9:15',
-    '9:35',
-    '9:6',
-    '9:7',
-    '9aa',
-    '9dz',
-    '9ez',
-    '9jz',
-    '9l',
-    '9min',
-    '9mph',
     '9nq',
-    '9pb',
-    '9pg',
-    '9rg',
-    '=&gt',
-    '=0.6',
-    '=2',
-    '=4',
-    '=5',
-    '=================================================================',
-    '=f',
-    '=ic',
-    '=m',
-    '=p',
-    'a&bsol;bc',
-    'a&dollar;1.2billion',
     'a&dollar;100m',
-    'a&dollar;1billion',
-    'a&dollar;2.5billion',
-    'a&eacute;reo',
-    'a&gt',
-    'a&icirc;n&eacute',
-    'a&ntilde;ez',
-    'a&rgr;b',
-    'a&times;b',
-    'a\'bhancair',
-    'a\'chait',
-    'a\'choire',
-    'a(1)',
-    'a+t',
-    'a-band',
-    'a-direction',
     'a-flutter',
-    'a-forty',
-    'a-list',
-    'a-shau',
-    'a-shoeing',
-    'a-sulphur',
-    'a-von',
-    'a-wing',
-    'a.-g.',
-    'a.16',
-    'a.837',
-    'a.896',
-    'a.c',
-    'a.d',
-    'a.o.b.',
-    'a.o.c.b.',
     'a.p.b.',
-    'a.r.r.u.',
-    'a.s.l.',
-    'a.t.c.o.',
-    'a.t.mays',
-    'a/',
-    'a/p',
-    'a1+',
-    'a100',
-    'a130',
-    'a183',
-    'a2+',
-    'a200',
-    'a256',
-    'a283',
-    'a320s',
     'a40/m40',
-    'a4095',
-    'a5000',
-    'a51',
-    'a5127',
-    'a52',
-    'a556',
-    'a559',
-    'a5i',
-    'a5pc6',
-    'a614',
-    'a66(m)',
-    'a6m2',
-    'a70',
-    'a850',
-    'a90',
     'a904',
-    'a=4',
-    'a_a_bit',
-    'a_a_few',
-    'aabeid',
-    'aadel',
-    'aaker',
-    'aal',
-    'abad',
-    'abakumov',
-    'abbagnale',
-    'abbeystead',
-    'abbil',
-    'abdel-jabbar',
-    'abdel-salem',
-    'abdelmalek',
     'abderrahmane',
-    'abdominis',
-    'abdourahmane',
-    'abdujaparov',
-    'abdul-rahman',
-    'abdulatipov',
-    'abdulfettah',
-    'abdurakhim',
-    'abelardo',
-    'abello',
-    'abeniaf',
-    'aberbach',
-    'abercorran',
-    'abercynon',
-    'aberdeen2',
-    'aberg',
     'abergwesyn',
-    'aberrantly',
-    'abettors',
-    'abida',
-    'ablative',
-    'able&mdash;report.log',
-    'abmt',
-    'abnegate',
-    'abortively',
-    'about-the',
-    'about-turns',
-    'above-inflation',
-    'aboyne',
-    'abramovitch',
-    'abridgements',
-    'abscisic',
     'abseiler',
-    'absentminded',
-    'absents',
-    'absorptiometry',
-    'absrption',
-    'abstainer',
-    'abstinences',
-    'abstruseness',
-    'abulfez',
-    'abustle',
-    'abyme',
-    'ac/1',
-    'acad',
-    'academic-industry',
-    'acanthis',
-    'acara',
     'acaulis',
-    'acbt-3/2/7/5',
-    'accelerometers',
-    'accend',
-    'accept/reject',
-    'accident\'lly',
-    'accolate',
-    'accommodation-only',
-    'accomplisht',
-    'accosts',
-    'accountemps',
-    'accumulatory',
-    'acerpac',
-    'acetazolamide',
-    'acetogenic',
-    'acetosella',
     'achaladair',
-    'acharacle',
-    'achene',
-    'achidi',
-    'achievment',
-    'achitophel',
-    'achnacloich',
-    'achromatic',
-    'acid&times;total',
-    'acid-tolerant',
-    'acid-tongued',
-    'acid-yellow',
-    'acid:deoxycholic',
-    'acidities',
-    'acidity.',
-    'acidocaldarius',
     'acitivity',
-    'acknowleged',
-    'acl/dci',
-    'acle',
-    'acned',
-    'acomodation',
-    'aconcagua',
-    'acoustiphonics',
-    'acquirements',
-    'acquittance',
-    'acra',
-    'acrefield',
-    'acridine-tethered',
-    'acrost',
-    'acrostics',
-    'act/88',
     'actec',
-    'actinomycetes',
-    'action-like',
-    'action-oriented',
-    'actionability',
-    'actionbooks',
-    'actions.',
-    'actius',
-    'active-region-like',
-    'actor(s)',
-    'actor-dancers',
-    'actor-managers',
-    'actressy',
-    'actualizer',
-    'actualy',
-    'actuation',
     'actuator',
-    'acylation',
-    'ad&amp;d',
-    'adaku',
-    'adamas',
-    'adams/station',
-    'adber',
-    'adc-10',
-    'addendums',
-    'addicott',
-    'addictively',
-    'additonal',
-    'addr',
-    'address(es)',
-    'addressee(s)',
-    'adds/ncr',
     'adductors',
-    'adecision',
-    'adelina',
-    'adeniji-ige',
-    'adequation',
-    'adhelm',
-    'adherens',
-    'adhibi',
-    'adhocracy',
-    'adipic',
-    'adj.',
-    'adjacently',
-    'adjectivally',
-    'adjustive',
-    'adjutants',
-    'adlington',
     'admirations',
-    'adodo',
-    'adopt-a-pet',
-    'ador',
-    'adoram',
-    'adoyta',
-    'adree',
-    'adrenaline-like',
-    'adrenals',
-    'adriaens',
-    'adrs',
-    'aduki',
-    'adult-adult',
-    'adult-onset',
-    'adult-oriented',
-    'adulterants',
     'aduncus',
-    'adv.',
-    'adva',
-    'adventism',
-    'adventurists',
-    'advertised.',
-    'advertisements.',
-    'advertisments',
-    'advertized',
-    'adviser.',
-    'advocate-general',
-    'adwick',
-    'adzharian',
-    'adzhubey',
-    'aea-wide',
-    'aeolus',
     'aerators',
-    'aerle',
-    'aeroclub',
-    'aerodynamicists',
-    'aeroliths',
-    'aeromarine',
-    'aerosolised',
-    'aerostar',
-    'aestivation',
-    'aeternum',
-    'aethelings',
-    'aetiopathogenesis',
-    'aewa',
-    'afa',
-    'afey',
-    'affectional',
     'affectless',
-    'afgf',
-    'afkac',
-    'afonwen',
-    'africa/middle',
-    'africanista',
-    'afro-',
-    'afro-centric',
-    'afropithecin',
-    'after-tea',
-    'afterdepolarisations',
-    'aftermaths',
-    'aftershock',
-    'aftertimes',
-    'afunctional',
-    'agades',
     'again.',
-    'agaist',
-    'agata',
-    'agbeyome',
-    'agboola',
-    'age-adjusted',
-    'age-limit',
-    'age-limits',
-    'age-well',
-    'agendum',
-    'agens',
-    'aggravatingly',
-    'agilbert',
-    'agios',
-    'agn&egrave;s',
-    'agns',
     'agogiati',
-    'agranulocytosis',
-    'agrarianism',
-    'agras',
-    'agrement',
-    'agrestis',
-    'agta',
-    'aguiar',
-    'agustin',
-    'ah-h-h',
-    'ah1/2',
-    'aharoni',
-    'ahipeaud',
-    'ahlden',
-    'ahmadiyya',
-    'ahomadegbe',
     'ai2',
-    'ai8',
-    'aichinger',
-    'aigues',
-    'aigulle',
-    'aikenhead',
-    'aikens',
-    'aikins',
-    'ailesbury',
-    'ailurophobia',
-    'aim&eacute;e',
-    'ainianes',
-    'air-bases',
-    'air-conditioners',
-    'air-flow',
-    'air-india',
     'air-routes',
-    'air-transported',
-    'airas',
-    'aircraftsmen',
-    'aires-1',
-    'airhorn',
-    'airmiss',
-    'airstreams',
-    'airstrike',
-    'aishling',
-    'aiskew',
-    'aissata',
-    'ajoy',
-    'ajuriaguerra',
-    'ak-47s',
-    'akbarsho',
     'akerlof',
-    'akhele',
-    'akhsharumov',
-    'akilisi',
-    'akilles',
-    'akmal',
-    'akobo',
-    'akropolis',
-    'akroterion',
-    'aksakov',
-    'akufo',
-    'al&aacute;n',
-    'al-ablak',
-    'al-ajami',
-    'al-anbar',
-    'al-angari',
     'al-arashi',
-    'al-badri',
-    'al-baghli',
-    'al-banna',
-    'al-haddad',
-    'al-hafiz',
-    'al-khalil',
-    'al-khiam',
-    'al-khoei',
-    'al-kuwait',
-    'al-maqdis',
-    'al-nahda',
-    'al-nakib',
-    'al-qods',
-    'al-qomesh',
-    'al-sahhaf',
     'al-sayrafi',
-    'al-shiraa',
-    'al-uzaizi',
-    'al-zawawi',
-    'al1-bl',
-    'ala16',
-    'alaap',
-    'alaleh',
-    'alamosa',
-    'alato',
-    'alave',
-    'albani',
-    'albanian-populated',
-    'albertas',
-    'alberts',
-    'albertsen',
     'albescent',
-    'albigensians',
-    'albrechsten',
-    'albright-knox',
-    'albrook',
-    'albumin/creatinine',
-    'alcatel/aeg',
-    'alceni',
-    'alcoholically',
-    'alcyone',
-    'aldair',
-    'alderfen',
-    'aldermanbury',
-    'aldh2*2',
-    'aldingbourne',
-    'aldorfer',
     'aldric',
-    'aldrich-blake',
-    'ale&scaron',
-    'ale-stake',
-    'aleatory',
-    'alegr&iacute;a',
-    'aleko',
-    'alem&atilde;o',
-    'alerters',
-    'alexandru',
-    'alexej',
-    'alfenus',
-    'alfetta',
-    'algebraists',
-    'algonquian',
-    'alha81005',
     'alhassane',
-    'alienist',
-    'alimadi',
-    'alioune',
-    'alkaisi',
-    'alkalines',
-    'alkalinise',
-    'alkamenes',
-    'alkanet',
-    'alkanoic',
-    'alkyl-acyl-glycerophosphocholine',
-    'alkyls',
-    'all&rehy;important',
-    'all&rehy;powerful',
-    'all-absorbing',
-    'all-african',
     'all-alloy',
-    'all-america',
-    'all-china',
-    'all-communist',
-    'all-composite',
-    'all-electronic',
-    'all-french',
-    'all-japan',
-    'all-knower',
-    'all-mighty',
-    'all-poland',
-    'all-sorts',
-    'all-too-common',
-    'all-too-often',
-    'all-tube',
-    'all-wales',
     'all.unit.id',
-    'allanah',
-    'allata',
-    'allemande',
-    'allerston',
-    'allocution',
-    'allomorph',
-    'allon-smith',
-    'allopatry',
-    'alloreactive',
-    'allotrope',
-    'allows/encourages',
-    'allright',
-    'allthorpe-guyton',
-    'allusiveness',
-    'almada',
     'almaden',
-    'almagest',
-    'almondbank',
-    'almondell',
-    'almonry',
-    'almost-black',
-    'almoustapha',
-    'almy',
-    'alocentrics',
-    'alofi',
-    'alojz',
-    'aloma',
-    'aloofly',
-    'alos',
-    'aloys',
-    'alpes-maritimes',
     'alpha-ready',
-    'alpha-waves',
-    'alphabatim',
-    'alphen',
-    'alpinists',
-    'alstone',
-    'alstroemerias',
-    'alt.',
-    'altaian',
-    'altaians',
-    'altdorfer',
-    'alterative',
-    'alternifolia',
-    'altertumswissenschaft',
-    'alto-based',
-    'altro',
     'altruist',
-    'alumino-silicates',
-    'alunan',
-    'aluor',
-    'aluph',
-    'aluvihare',
-    'alvanley',
-    'alwis',
-    'alys',
-    'alyth',
-    'alzamora',
-    'am&eacute;lia',
-    'am&ndash;5.00',
-    'am/pm',
-    'am2496f',
-    'amador',
     'amapa',
-    'amarant',
-    'amazin\'',
-    'amaznig',
-    'ambergris',
-    'amberol',
-    'amduat',
-    'ameche',
-    'amegi',
-    'amelio',
-    'amenorrhoeic',
-    'amentia',
-    'american-bred',
-    'american-influenced',
-    'american-inspired',
-    'american/british',
     'amerimex',
-    'amestris',
-    'amicability',
-    'amicitia',
-    'amidon',
-    'amigamanore',
-    'amika',
-    'amiloride-sensitive',
-    'amiriya',
-    'amirs',
-    'ammendment',
-    'ammonia/nitrite',
-    'ammunitions',
-    'amnass',
-    'amorebieta',
-    'amortise',
     'amou',
-    'amoy',
-    'amperes',
-    'amphi-atlantic',
-    'amphibium',
-    'amphoras',
-    'amplio',
-    'amputates',
-    'amritraj',
-    'amsterdam-pleyel',
-    'amstutz',
-    'amuni',
-    'amusant',
-    'amyload',
-    'amzad',
-    'ana-maria',
     'anabantoids',
-    'anachem',
-    'anacidity',
-    'anaesthesia.',
-    'anaesthesiologist',
-    'anality',
-    'analogization',
-    'analyzable',
-    'anancy',
-    'ananov',
-    'anarres',
-    'anatomie',
-    'ancash',
-    'ancestrally',
-    'ancestries',
-    'anchorites',
     'ancillae',
-    'ancrene',
-    'and-the',
-    'andaluc&iacute;an',
-    'anderson-hunt',
-    'ando',
-    'andonov',
-    'andred',
-    'andrej',
-    'andreoni',
-    'andrianopoulos',
-    'andris',
-    'androstenol',
-    'androsterone',
-    'anel',
-    'anergic',
     'anerio',
-    'aneuploidies',
-    'angel-face',
-    'angelov',
-    'anger.',
-    'angiographically',
-    'angiostrongylus',
-    'anglicisation',
-    'anglicization',
-    'anglo-americans',
-    'anglo-french-german',
-    'anglo-gascon',
-    'anglo-indians',
-    'angop',
-    'anguillan',
-    'anguisciola',
     'animae',
-    'animal-dispersed',
-    'animal-rights',
-    'animal-vegetal',
-    'animatronic',
-    'animists',
-    'animuccia',
-    'ankeret',
-    'ankle-height',
-    'ankle-high',
-    'annabell',
-    'annabelle/steven',
-    'annacone',
-    'annamalai',
-    'annaud',
-    'annbank-mauchline',
     'annellie',
-    'annent',
-    'annia',
-    'annibaldi',
-    'annison',
-    'annorexia',
-    'anodes',
-    'anophelines',
-    'anophthalmia',
-    'anovulatory',
-    'ansi-c',
-    'ansi/iso',
-    'ansorgei',
-    'ant-hills',
-    'ant-lions',
-    'antabruk',
     'antebellum',
-    'antedating',
-    'antenuptial',
-    'antepartum',
-    'anteriority',
-    'anthesis',
-    'anthoine',
-    'anthological',
-    'anthologist',
-    'anthranoids',
-    'anthuriums',
-    'anti-acetylated',
-    'anti-alkaline',
-    'anti-anc',
-    'anti-aristocratic',
-    'anti-armenian',
     'anti-authority',
-    'anti-baghdad',
-    'anti-bovine',
-    'anti-china',
-    'anti-climaxes',
-    'anti-coagulants',
-    'anti-coalitionists',
-    'anti-conspiratorial',
-    'anti-darwinians',
-    'anti-environmental',
-    'anti-fatigue',
-    'anti-federation',
-    'anti-flag-burning',
-    'anti-god',
-    'anti-heroic',
-    'anti-histamine',
     'anti-histamines',
-    'anti-hiv-1',
-    'anti-horseradish',
-    'anti-hoxha',
-    'anti-hrp',
-    'anti-imperial',
-    'anti-indian',
-    'anti-infarct',
-    'anti-infectives',
-    'anti-insurgency',
-    'anti-kantian',
-    'anti-lesbian',
-    'anti-life',
-    'anti-london',
-    'anti-malarials',
-    'anti-marketeer',
     'anti-microsoft',
-    'anti-nerve',
-    'anti-nonconformist',
-    'anti-nucleating',
-    'anti-parliamentary',
-    'anti-perfectionist',
-    'anti-permissive',
-    'anti-phlogistic',
-    'anti-platelet',
-    'anti-plo',
-    'anti-popery',
-    'anti-popular',
-    'anti-power-sharing',
-    'anti-progressive',
-    'anti-proteinase',
-    'anti-protestant',
     'anti-radical',
-    'anti-reflux',
-    'anti-reverse',
-    'anti-roads',
-    'anti-rock',
-    'anti-roh',
-    'anti-royal',
-    'anti-scientific',
-    'anti-scottish',
-    'anti-secretory',
-    'anti-serbian',
-    'anti-singh',
-    'anti-siphon',
-    'anti-smuggling',
-    'anti-socialists',
-    'anti-suffragists',
     'anti-sweating',
-    'anti-syrian',
-    'anti-thrombotic',
-    'anti-toxic',
-    'anti-traditional',
-    'anti-unionism',
-    'anti-vibration',
-    'anti-wilkoite',
-    'antibody-producing',
-    'anticlericals',
-    'anticommunist',
-    'anticonvulsants',
-    'antiemetic',
-    'antigonos',
-    'antimicrobials',
-    'antimonium',
     'antinomy',
-    'antinori',
-    'antiochenes',
-    'antipapal',
-    'antipasti',
-    'antipollution',
-    'antiseptics/antibacterials',
-    'antitoxins',
-    'antitumor',
-    'antius',
-    'antonines',
-    'antonios',
-    'antonovich',
-    'antropyloric',
-    'antsy',
-    'antulio',
     'anuchin',
-    'anumeration',
-    'anvils',
-    'anweiler',
-    'anwick',
-    'anxiousness',
-    'any-one',
-    'anybodies',
-    'anythi',
-    'anyw',
-    'anywea',
-    'aostalli',
-    'aotearoa(nz)',
-    'ap-1-binding',
-    'apapa',
-    'apck3src2',
     'ape-shit',
-    'aphaia',
-    'apheresis',
-    'aphrodisiacal',
-    'aphthous',
-    'apian',
-    'apikoros',
-    'apisai',
-    'apolipoprotein',
-    'apomixis',
-    'apon',
-    'apophthegm',
-    'apophyseal',
-    'apophyses',
-    'aporias',
-    'aposiopesis',
     'apostolical',
-    'apostrophized',
-    'appalling.richard',
-    'appeareth',
-    'appellant/respondent',
-    'apple/microsoft',
-    'applebys',
-    'applegate',
-    'appli',
-    'applicators',
-    'appointable',
-    'apport',
-    'apportions',
-    'appositeness',
-    'approaches.',
-    'approved.',
     'approximative',
-    'appurtenance',
-    'april-12',
-    'april-13',
-    'april-20',
-    'aprilias',
-    'aprisiones',
-    'aproditus',
-    'apso',
-    'aqu&aacute;tico',
-    'aquafoil',
-    'aquaticus',
-    'ar&aelig',
-    'ar&eacute;te',
-    'ar-rahim',
-    'ar.',
     'arab&ndash;israeli',
-    'arab-owned',
-    'arabists',
-    'arachadonic',
-    'arafura',
-    'aranzadi',
-    'arapas',
-    'arats',
-    'aratsio',
-    'araya',
-    'arbeau',
-    'arbeia',
-    'arbitrators.',
-    'arborescent',
-    'arbury',
-    'archaea',
     'archaebacterium',
-    'archaeomagnetic',
-    'archaic-looking',
-    'archaistic',
-    'archbishop-elect',
-    'archchaplain',
-    'archeologico',
-    'archidamian',
-    'archiepiscopate',
-    'archipelagoes',
-    'architecto',
-    'architectura',
-    'archivio',
-    'archonships',
-    'archpredator',
-    'arcus',
     'ardara',
-    'ardsley',
-    'are&mdash',
-    'are/were',
-    'are_a',
-    'area-development',
-    'area/regional',
-    'areata',
-    'ares-serono',
-    'arette-pierre-saint-martin',
-    'arev',
-    'arford',
-    'arg&uuml;elles',
-    'arg40',
-    'arg73',
-    'argel&eacute;s',
     'argentiferous',
-    'argumentatively',
-    'arica',
-    'aride',
-    'aridians',
-    'arietis',
-    'aristarchus',
-    'aristata',
-    'aristocats',
-    'arithmetick',
-    'arithmology',
-    'arke',
-    'arkell/farmer',
-    'arkless',
-    'arkoub',
-    'arle',
     'arlebrook',
-    'arlin',
-    'arm-rests',
-    'arm-twisted',
-    'armandii',
-    'armanis',
-    'armant',
-    'armeno',
-    'armitages',
-    'armorica',
-    'arms-making',
-    'arn&eacute;guy',
-    'arnaga',
-    'arnell',
-    'arni',
-    'arniston',
     'arnsat',
-    'aromatically',
-    'aronoff',
-    'aronstam',
-    'around-the-clock',
-    'arousals',
-    'arowana',
-    'arrangia',
-    'arranmore',
-    'arrens',
-    'arrestee',
-    'arrochar',
-    'arrol/ian',
-    'arround',
-    'arrow-like',
-    'arsene',
     'arsons',
-    'art-historians',
-    'art-science',
-    'art-work',
-    'art.',
-    'artanes',
-    'artemisias',
-    'arteriosclerotic',
-    'artforum',
-    'arth-goldau',
-    'arthralgia',
-    'arthray',
-    'arthrobacter',
-    'articulateness',
-    'articuli',
-    'artificialities',
     'artilleries',
-    'artisanate',
-    'artist-centred',
-    'artist-philosopher',
-    'artists-in-residence',
-    'artline',
-    'artocarpus',
-    'arton',
-    'artworld',
-    'arty-crafty',
-    'arunta',
-    'arutyunyan',
-    'arvense',
-    'arvicanthis',
-    'arwen',
-    'arye',
     'as-salim',
-    'as.5',
-    'as90',
-    'as_,_as_long_as',
-    'as_,_as_well',
-    'as_in',
-    'asab',
-    'asbrink',
-    'ascarids',
-    'ascensionist',
-    'ascham',
-    'asci',
-    'aseptically',
-    'ash-blue',
-    'ashchurch/gloucestershire',
-    'ashdon',
     'ashet',
-    'ashisuto',
-    'ashlea',
-    'ashleworth',
-    'ashmore/oxford',
-    'ashtead',
-    'ashville',
-    'ashwin',
-    'asiz',
-    'askett',
-    'aslonov',
-    'aslund',
-    'asn102',
-    'asn53',
-    'asp84',
-    'asparukhov',
     'aspex',
-    'aspinwalls',
-    'asps',
-    'aspull',
-    'asquithians',
-    'assatis',
-    'assembly/sub-assembly',
-    'assertoric',
-    'asset-strippers',
-    'asset/liability',
-    'assets/liabilities',
-    'assiette',
-    'assignfunc',
-    'assimilationism',
-    'assin',
-    'assisted-area',
     'assorts',
-    'assu',
-    'astaggering',
-    'astakos',
-    'astraspis',
-    'astringents',
-    'astrocaryum',
-    'astronomer-priests',
-    'astronotus',
-    'asturians',
-    'at&amp;t-free',
-    'at&amp;t/ncr',
-    'at-compatible',
-    'atasi',
-    'atcc33909',
-    'atch',
     'ates',
-    'athelstane',
-    'athelstaneford',
-    'athermal',
-    'athribis',
-    'atilla',
-    'ation',
-    'atkins/tenant',
-    'atley',
-    'atmosphereless',
-    'atomicity',
-    'atomizer',
-    'atp-dependent',
-    'atrorubens',
-    'attaboy',
-    'attacks.',
     'atten',
-    'attendance.',
-    'attenuable',
-    'attenuations',
-    'attitude/power',
-    'attitudinists',
-    'attorney-at-law',
-    'attritional',
-    'atttgcat',
-    'aturkish',
-    'aubel',
-    'aubers',
-    'auchenbowie',
-    'auchenoglanis',
-    'auctoritas',
-    'audio.visual',
     'audio/telecommunication',
-    'audiocassettes',
-    'audis',
-    'audlem',
-    'aufschwung',
-    'aug/sep',
-    'aughnacloy',
-    'augie',
-    'auguries',
-    'august-october',
-    'augustines',
-    'aum',
-    'aurichalcite',
-    'auschwitz-birkenau',
-    'auser',
-    'ausstellungshalle',
     'austers',
-    'austrailian',
-    'austrinus',
-    'auteurist',
-    'author&mdash;date',
-    'author-dominated',
-    'author/title',
-    'authorially',
-    'authorites',
-    'authoritive',
-    'authorless',
-    'auto-assessment',
-    'auto-defrost',
-    'auto-erotic',
-    'auto-helm',
-    'auto-infection',
     'autodigestion',
-    'autonomies',
-    'autonomists',
-    'autoradiograms',
-    'autoroutes',
-    'autosampler',
-    'autospade',
-    'autotransplantation',
-    'auxence',
-    'auxins',
-    'av4100',
-    'availablity',
-    'avascular',
-    'aveley',
-    'avenir',
-    'average-size',
     'averham',
-    'aviation-related',
-    'aviculare',
-    'avidin-fitc',
-    'avifauna',
-    'avoch',
-    'avoided.',
-    'avoiders',
-    'avoirdupois',
-    'avon-based',
-    'avunculate',
-    'awadi',
-    'away-days',
-    'aweigh',
-    'awell',
-    'axbridge',
     'axe-grinding',
-    'axehead',
-    'axemen',
-    'axilla',
-    'ayaydin',
-    'aygill',
-    'ayios',
-    'aylestone',
-    'ayllu',
-    'aymara-speaking',
-    'ayn',
-    'ayshford',
-    'aytmatov',
-    'azania',
-    'azat',
-    'azc&aacute;rraga',
     'azerbaydzhani',
-    'azevedo',
-    'azikwe',
-    'azimov',
-    'azo',
-    'azospirillum',
-    'azotobacter',
-    'azotus',
-    'azoxymethane',
-    'azulejos',
-    'azure-blue',
-    'azure-winged',
-    'azurophilic',
-    'b%',
-    'b&amacr;ra',
-    'b&amp;r',
     'b&eacute',
-    'b&eacute;b&eacute;s',
-    'b&eacute;nin',
-    'b&egrave;gles-bordeaux',
-    'b&iacute;lek',
-    'b&mdash;4',
-    'b&ndash;c',
-    'b&sharp',
-    'b&uuml;hne',
-    'b&uuml;rgerschaft',
-    'b*****d',
-    'b*st*rd',
-    'b+-tree',
-    'b-b',
-    'b-back',
-    'b-bad',
     'b-cups',
-    'b-f',
-    'b-fifty',
-    'b-lymphocytes',
-    'b-u-t-t-o-n',
-    'b.4',
-    'b.d.m.',
-    'b.e.m.u.',
-    'b.litt',
-    'b.litt.',
-    'b.o.a.c.',
-    'b.s.i.',
-    'b.w.',
-    'b/00/23/2053',
-    'b/00/23/2070',
-    'b/a&gt;1',
     'b/g',
-    'b1249',
-    'b205',
-    'b53',
-    'b5n2',
-    'b6255',
-    'b6259',
-    'b742',
-    'b747',
-    'ba&ntilde;os',
-    'ba-ba-bomp-ba-ba',
-    'ba1',
-    'ba3',
-    'ba71v',
-    'baader-meinhof',
-    'baathists',
     'babberley',
-    'babblings',
-    'babe-in-arms',
-    'babee',
-    'babies.',
-    'babiuc',
-    'baby/4xx',
-    'babygros',
-    'babylike',
-    'babyrussa',
-    'baca',
-    'bachad',
-    'baciccio',
-    'back-catalogue',
-    'back-drops',
-    'back-four',
     'back-grounds',
-    'back-handers',
-    'back-inlet',
-    'back-page',
-    'back-pain',
-    'back-passes',
-    'back:a',
-    'back:the',
-    'backburner',
-    'backford',
-    'backmarkers',
-    'backnut',
-    'backpayment',
-    'backpedal',
-    'backs-to-the-wall',
-    'backslidings',
     'backview',
-    'backward-pointing',
-    'bacteraemia',
-    'bacteriostatic',
-    'bactrians',
-    'bad-taste',
-    'badachro',
-    'badamhaamb',
-    'badbury',
-    'baddesley',
-    'baderic',
-    'badfinger',
-    'badmouth',
-    'bagabandi',
-    'baggage-room',
-    'baggott',
     'baghdad-basrah',
-    'baghetti',
-    'bagni',
-    'bagot',
-    'bagoush',
-    'bagshawism',
-    'bah&aacute\'u\'ll&aacute;h',
-    'bahoh',
-    'bailliary',
-    'bainbridges',
-    'bait-diggers',
-    'baitz',
-    'bajpai',
-    'bajwa',
-    'bakalov',
-    'bakwin',
     'balancers',
-    'balanovski',
-    'balasingham',
-    'balboni',
-    'baldersdalians',
-    'baldonnell',
-    'baldric',
-    'balefulness',
-    'baleshare',
-    'balin',
-    'balista',
-    'balkenhol',
-    'balkhash',
-    'ball-breaker',
-    'ball-nuts',
-    'ball-shaped',
     'ball-sized',
-    'ballad-singer',
-    'ballarat',
-    'ballentine',
-    'ballieston',
-    'ballindalloch',
-    'ballinger/senior',
-    'ballone',
-    'balloon-travel',
-    'balls-ups',
-    'ballybay',
-    'ballygomartin',
-    'ballyhackamore',
-    'ballymacadoyle',
-    'ballysillan',
-    'ballyward',
     'balmore',
-    'balsall',
-    'balsawood',
-    'balsdon',
-    'baltasound',
-    'balyana',
-    'bamh1',
-    'banana-shaped',
-    'bananas.',
-    'banarasi',
-    'banardos',
-    'bance',
-    'bancks',
-    'band-leader',
-    'bandannas',
-    'banderillas',
     'bandinelli',
-    'bandoliers',
-    'banes',
-    'bangoura',
-    'bank-backed',
-    'bank-owned',
-    'banka',
-    'bankburn',
-    'banked-down',
-    'banked-up',
-    'bankshead',
-    'banlieue',
-    'banna',
-    'banterle',
-    'banw',
-    'baobabs',
     'baqer',
-    'baquerizo',
-    'bar-charts',
-    'bar-codes',
-    'bar-coding',
-    'bar-lounge',
-    'bar-tabac',
-    'barabash',
-    'baragwanath',
-    'bararunyeretse',
-    'barbarically',
-    'barbarisms',
-    'barbarus',
-    'barbets',
-    'barcel&oacute',
-    'barcelo',
     'barcombe',
-    'bardister',
-    'bardolatry',
-    'bardots',
-    'bare-branched',
-    'bare-knuckled',
-    'barefeet',
-    'barescut',
-    'bargees',
-    'bargeman',
-    'bargoed',
-    'barilli',
-    'barish',
-    'barkes',
-    'barkway',
-    'barlaes',
     'barleythorpe',
-    'barma',
-    'barn.k.b.',
-    'barnacle-encrusted',
-    'barnados',
-    'barnea',
-    'barnes/banbury',
-    'barnes/kidlington',
-    'barnes/paris',
-    'barnes/woodstock',
-    'barnett/hay-on-wye',
-    'barnett/tewkesbury',
-    'barnsgate',
-    'barocca',
-    'baroreflex',
-    'barou',
     'barr/surgeon',
-    'barrack-like',
-    'barrandov',
-    'barringer',
-    'barrister-at-law',
-    'barritt',
-    'barrowden',
-    'bars.',
-    'barstaff',
-    'barthian',
-    'bartholin',
-    'bartol',
-    'barton-upon-humber',
-    'bartrip',
-    'baruntse',
-    'baryonic',
     'barzel',
-    'basco',
-    'base-camp',
-    'base-pairs',
-    'base-poor',
-    'baseboards',
-    'bashevis',
-    'basileus',
-    'basisternum',
-    'basket-cases',
-    'basket-makers',
-    'basket-weaving',
-    'basketry',
-    'baslow',
-    'bass-lines',
-    'basseterre',
     'bassinet',
-    'bassinger',
-    'bassleton',
-    'basso_profundo',
-    'bastu',
-    'bat-poo',
-    'bat-winged',
-    'batband',
-    'bath-houses',
-    'bath-time',
-    'bath-tubs',
-    'bathhouses',
-    'bathroom/',
-    'bathroom/wc',
-    'batiks',
-    'bating',
     'batna',
-    'battels',
-    'batteurs',
-    'battle-cruisers',
-    'battle-winning',
-    'battlecruiser',
-    'battlesden',
-    'battley',
-    'battlezone',
-    'battos',
-    'battrick-jones',
-    'batty-esque',
-    'batu',
-    'baudelairean',
-    'baunton',
-    'baus',
     'bautzen',
-    'bauz&aacute',
-    'bavaria-based',
-    'baxandall',
-    'bayford',
-    'baynards',
-    'bayous',
-    'bazas',
-    'bb.',
-    'bb4',
-    'bbc.',
-    'bbcs',
-    'bbg',
-    'bbh',
-    'bblingen',
-    'bc109c',
     'bcal',
-    'bch',
-    'bd3',
-    'be&ccaron;ov',
-    'be\'',
-    'be-all-and-end-all',
-    'be-ribboned',
-    'beachball',
-    'beachcroft',
-    'beachland',
-    'bead-like',
-    'beadleston',
-    'beadnell',
-    'beamy',
-    'bean-bags',
-    'bear-hugged',
     'beardies',
-    'beardo',
-    'beardsmore',
-    'bearhug',
-    'bearsted',
-    'beat-\'em-ups',
-    'beat-card',
-    'beat-to-beat',
-    'beati',
-    'beattock',
-    'beaudesert',
-    'beaugrande',
-    'beaumont-hamel',
-    'beaus',
-    'beauticians',
-    'beav',
     'beavan',
-    'bebb',
-    'bebc',
-    'because/although',
-    'bechstein',
-    'beckerley',
-    'becketts',
-    'beckindale',
-    'beckstadt',
-    'bective',
-    'bed-and-breakfasts',
-    'bed-bugs',
-    'bed-jacket',
-    'bed-mate',
-    'bed-wetters',
-    'bedd',
     'bedeutung',
-    'bedevilling',
-    'bedfont',
-    'bedhampton',
-    'bedheads',
-    'bedrail',
-    'bedwyn',
-    'bee-hives',
-    'bee-keepers',
-    'bee-like',
-    'beenbeg',
-    'beep=yes',
-    'beer-crates',
-    'beer-drinkers',
-    'beercan',
-    'beethovenian',
     'beetle-browed',
-    'befo',
-    'befrienders',
-    'befuddlement',
-    'begbroke/oxfordshire',
-    'begetters',
-    'beglin',
-    'behalf.',
-    'behaviourial',
-    'bejaysus',
-    'bek',
-    'beka\'a',
-    'bekir',
-    'bel&eacute;m',
-    'belanger',
-    'belayer',
     'belcher/thames',
-    'belcoo',
-    'beldames',
-    'belgic',
-    'belgrade-based',
-    'belgrove',
-    'beliaire',
-    'believability',
-    'believism',
-    'belizaire',
-    'belknap',
-    'bell-founders',
-    'bellamy/revis',
-    'belle-isle',
-    'bellersis',
-    'belletrist',
     'bellomont',
-    'bellpush',
-    'bellville',
-    'bellying',
-    'beloveds',
-    'belud',
+)
+
+blocks_32 = (
+    ')!2)!4)%9,000($6.1m*"20*"5m*"75)"0.)"1m)%2,000)%5,000)!6)$9.40)\'million(#7.1',
+    '*"70)%2,000)"9m($8.75)"0m)!1)!2*!m)!7*$,000($9.6m*"7m)"50)!6)"7m',
+    '\')3&ndash;4(,,000-a-month)#655(#.0m)"13*!6*"bn)#3bn*\'million)(5billion*\'million)"77*\'million)"81)"9m',
+    ')"kg(+0,000-worth)".1*!2)/0&ndash;400,000*2,000&ndash;500,000*+-&pound;400)(4million)%5,000)!6)"bn(%1,500)#.20*"5m*"8m',
+    ')%1,000)!4*!m)!6($2.5m)"5m(#3.1*"99)%1,700)!8)$9.22(%4,500)#.5m*"70*"90',
+    ')!3("58)"bn($6.2m)!4)!7)"9m(%7,500)#.1m*"2m)!2)!4*$,000(%8,500)"2m',
+    ')%5,000*$4.03)!6(%9,600)#.2m*"8m*"90)"1m)$9.99(\'billion\')4,000,000)#180)#509(#.35)"40',
+    ')"59*"bn)"69)"72*!9(30,000-&pound;60,000)#.1m*"50))0,000,000)!2)!7(%1,200*#660*#700)#.50',
+    ')%4,000)!6($2.00)!6(%3,225)#.60)!8)!9($4.3m)"2m($5.00*"20*"30+!m)!1',
+    ')"8m)\'million(%6,500)#.95+!9)%1,000*\'million)!2)"5m)36,000&ndash;600,000(%7,200)!2)!7)%9,000(#8.8',
+    ')!6)!7(&914.91)%3,000)%5,000)!8)$9.95("m.\')5&ndash;6(".1*!5)"42)"60+%/30ml)#75m',
+    '(,0,000-a-year)30,000&ndash;700,000*!.)!6("13)!6($2.00)!2)!3)!4)!8(%3,500)%0,000)!9($4.90',
+    '($5.00)!1()60million)!7(&75,000*!m)!m("82)!5*$,000)!8(%9,000*#500*#950)#.40',
+    ')$9.95("m.\')6,000,000)#100)#200)#900(#.10)"39)"58)"85(&0,000.)%1,000)"7m)!k(%1,500',
+    '*!m)!7)!9($2.4m*"85)!7)"9m(#300)!6)\'million(&43,000)!5)$9.99)!m($5.3m',
+    ')"0m("72)"3m)%5,000($8.4m*"50)!2)!3)!5*!m("90)$9.00\'%7,400)#560)#900',
+    ')"30)!4(20,000&ndash;90,000)\'million(%1,400)".6)!5(%2,637)#.50+!m)%0,000("35(%4,000*#950)#.50',
+    ')!5)$9.00(&63,000)!4)!8("70*$,000(%8,500)"0m)!4)!7)\'million(&90,000)!2)!m',
+    ')#300)#400)#600)#700().1billion)"20*!m)"33)!4*!5)"60(30,000&ndash;120,000)\'million(%1,000)!6',
+    '("24)!5)!m(#30m)!5)!m($4.99)!2(*5.6million)\'million($6.70)!1(&70,000)!m($8.8m',
+    '("98)!m\'*9&frac12;m((,350,000)#700(!.)"20)"45)"60)"70(&04,000)!5)\'million(!1(%2,000',
+    '("34(&40,000)!4($5.00($6.4m)!9("76)!m(%9+vat\'&pound1-!1,!6\'#yyy!5scaron;vabinsk&yacute"#ect',
+    '!)thgr;-row"(imes;100(!3(!4\'#375\'"52\'!6!#ugr"#uml!/verbar;l&verbar!%yen;2 "\'/!"36!"52!&68/\'69',
+    '!#air""n\'##dle""rm"#sda"#vin!*directory\'!\'eathens#"vy"\'ft-ight!#let!&nother"#uff!&olding#$iday',
+    '""ur!&please"%ublic!(security"&pecial!&tatoes"%hough!%where #(i) ************#***#\'altered"!a"#gen"$jack',
+    '"#kim"%louis"$paul#%ierre#\'romoted!&andrei"%tanas!%brig.!&carlos""hu$"ng"#ol.#$uld*!%david!$exec',
+    '"%igure#$lein"#ree!&george!$hong#!w!"i*"(ncluding"#oan"&slamic"#van!&joseph!"lt!$mian#%khail',
+    '!$name#&tional"&icolae""ot!$saad!"to!)unchanged!)vice-adml!"w1"!2!#you $+0.5!#331!"45""98',
+    '!&90&deg!\'altered!!h!!l!!s "-/"&//////!%0.006$!2$"71#"6%#!8!$1.14#!3""14',
+    '"#2.5""50"!7"\'8&deg;c"(96&deg;c!#2.0"\'2&deg;c"!7"!8#!3!"3%"&&deg;c""0-""11"!2',
+    '!"41"!7""88!"87!"93!%about"$ctin""re""te#!p!#did"(ominated!%esque#!t!$from',
+    '"$roup!$have"#ost!#ide"%n-law"#sts!!k!$male".ercaptoethanol"7icroglobulin/creatinine!"or!"pa""eg"#i/2!!r',
+    '!$some!"ta""ee"$hree"&ubulin""wo!-us&dollar;150!!v"%alues!"we#"re!!y"#eah""ou $.009',
+    '#"70"!8#"20!"50!"87 %/&egr!#120!#ai/!(circular")reatinine!$div4!#ei/!#for!"g/"#cse',
+    '!$hour#!w!"in!\'keyword!"m/"!g#"/h""in!!o!!q!,r/-insertion"&enault"%hythm!"s/"!o',
+    '!"w/"!e +0&middot;25"(ndash;01)!2(&100mph)!6)!8("21()4&ndash;2)!0()6&ndash;2("75!$-0-0"#4-2',
+    '!&.00005%!5$!3$"5%$!7$!8#"13$!6#"47#"6%$!7$"gm#"7%$!6"+1&ndash;1.0',
+    '#"2%#"4%#"54$!5$!m#"72#"8%#"pc"#218#!i#!m#!p$!c"\'303&ins#"15',
+    '$!5#"hz#"ml"#410#"5%#"bn""56#"78"\'6&mgr;m#!c"#719#"3%#!p""83#"66',
+    '""9m!$0.00"%0,000#!.#%/year##01.#!s""31#"59"!5#!0"!8"#:05#"34$!7',
+    '$!6!%1-493##691##748##930""02#!5"!6#!1"!8"#:02#"11$!3$!8#"25',
+    '#"50$!2$!4#)economics!)2/89/1301""05"\'1&ndash"!3"!4#!6""50#!4"!7#!7""96',
+    '"#:24$!6#"55!#301#(5-262697##6.2"*1-557-3194"!2#!5""30""51""64"!8"#:00#"10',
+    '!%403.1#!5$".6#!7"!2#+093programe""35#!8"!4#!0#(3-223880#!5#!9""60"!8',
+    '""92"#:49#"56!&50&deg#$2.43#$3.24&!5#$4.31""65"!8#!0""94"#:01$!4$!5',
+    '#"12$!3$!5#"22$!6#"33$!6$!8#"42$!3$!6$!7#"56!&60&deg#$2.22',
+    '#!5"$10.1#!2""20#!5""33""45""54""71""89"\'944-268"#:06#"17#"28$!9',
+    '$!7#"40$!2$!3#"58!#704"+1&ndash;240,!8+"81*#354+"82,!8*#403,!7+"93',
+    '*#522+"38+"81,!8*#602+"26+"36,!8*#724+"30,!5,!6,!8*#831,!3',
+    '*#938#$-235&!6$#327$#580$#638$#734$#931"!2#!8"!5#!0""61""73""87',
+    '"#:05$!7$!9#"11$!2$!6$!8$!9#"36$!9#"47#"50!$8.10$!5"!0',
+    '#"35#!5"+1&ndash;200*#688*#940,!3+"94#$-785""25#!9"!3#.9&ndash;141414"!4#!0#!3',
+    '"!7"!8"#:01$!9#"13$!5$!6#"23$!5$!8#"39#"55!09.00&ndash;17.00%&-12.00#"25',
+    '#"40"!0#!1"+1&ndash;232""22""47"!6"!7"!8"!9#!0"#:09#"22$!4!":0',
+    '""58!"db!"lx!!m!"pc )1&amp;l/2&&times1#$ring"+divide&phgr")frac18;in")half;inch"\'mdash;6#&icro;f$&ddot;0)"5%',
+    ')"/2+"ft("3%)!3("60("78"+shilling;2d!$(4a)""8)!%,000%%#-km&&member&)processor%"kg&!m',
+    '$!5#"10$!1$!7$!9#"22$!8#"45$!7#"53#"60#"70$!1$!6$!9',
+    '#"90"#110$$8.07#"26$!8#"32#"51$!8#&65,000#"74$!6#"80$!4#"90$!5',
+    '""2-#"04$!5$!7#"17#"25#"41$!8#&50,000#"78#"90$!5"03-dithiadiazoles#"07$!8',
+    '$!7#"41#&50,000#"67#"87#"95$!7"$400m$!2#"10#"35#"40$!1#"60$!5',
+    '#"70#"82"!5#$00lb%!v#"12#"30$!3#"40#"60#$92hz$!3"$600m#"47$%8,000',
+    '#"64#"90"#703#"10$!3#"23#"51#"71#"81"$800m#"50#"78#"87$!8"#905',
+    '#"72#"86#"98!#-11"!y!&.0-2.0#"75#"80"#1.0$"92##0.1##1.3##5.2#!c""2.',
+    '$!5##0am#/5kg/2&frac12;lb$!p#":1#"bn#"cm"$3.10$!7#.0&ndash;3.30pm#!1#"5m##7gb#!l#!w',
+    '$!6#.5&ndash;3.45pm#!p$!c"+5&ndash;2.0*#3.0#"5p#"bn#!g#"km#$mbps"#6.4$!6#!i#&km/1ml',
+    '#!9#"pc"#85%#"gl"$9.15%!6$!3#!3"!x!"/-"!1##000&"00$"th#!6',
+    '#%-year""6d""82"!9#!0#!1#!2"!c"#min""r2!&0%-15%$#30%"*&amp;sup12$$ring#*frac12&ins',
+    '#)ndash;12%)#200*!1"#(5)#"c)"&,000th#"11$"22##800"$-15%#"25#!5#%match#%party#%round',
+    '"/.00&ndash;21.00$#5pm$!7$!8$!9##1.1$$1(a)&"b)#"2p##3.1$!2$!4$#5am$!7$!8',
+    '$!c$!p##4.2$!9#"56$!9$!p#$6(b)$!3$!8$!m##7.4$!1$!m#"81',
+    '#$9(b)"!/#"12#"40$!1#"70#"88#%model"$0&ft$\'mgr;gal$)ndash;250+"80*!4#!+#$-150',
+    '#$.000#,0&ndash;2000$%-fold$$0000$"cc##4.3#"70#!b#"cc#"gb#"hp#"kw#"ma$%l/4fl#!u',
+    '$\'ndash;2##(3)#$,000$#107""2%#".0$"10#"89"(3-strong#"0s"+42c&ndash;d#!b#!p"\'6&deg;f#!m',
+    '""7%#"bp#!p#"th"%80.00##bhp#!p""9%#$,373"#:08#"17#"21$!6$!7$!9',
+    '#"44$!5$*6&ndash;52#"52$$9:59#!7#!9")am-12noon"%base5""ha""kb"#mls""pp"!q")th-minute',
+    '!%1&deg#(mdash;12#$plus"#(b)"$,400##900"#-10$!8#!4#!8#&strong"%.05pm#$2(a)$".2%!3',
+    '$!7##3.2$!7$!8##4.2$!4$#5pm##50%%"pm$!4$#5am#"64##8pc#"92$!8',
+    '#!6#$7/87#"87#(99/24799#*ac/7022/06"*0-year-old#,0&ndash;1300$"cc##1.1%!6%!8##2.1%!2&!2%!3',
+    '##3.4#!4##6.4##9.1%!2%!3#"kg"$1/92#*4f&ndash;g"*2&ndash;13##/74#"mm#!p""3%##(2)',
+    '"+4&ndash;115+!6##362""5%#*&ndash;115#"00##bhp#"mm#"th"$6mph#!p"*8&ndash;19#".2#!b#"th',
+    '#"cm"#:12$!4$!7$!8$!9#)2&ndash;3#!3$!5#!4#"58""c8"!f"!i""pt',
+    '#*ndash;15in*#8in)"22*!6)"43)"64#(shilling"!\'"#(4)#"5)"&,000ft#"15##200##475##700',
+    '#!2#!3#!7#!8##bed#$fold$#ret#$part#$race#%stage%$orey"#.0%$-0&ndash;20.00$!1$!6',
+    '$!4$!7$!p##2.1%!2$!6$!9$!m##3.1$!1$#5pm$!8#"46$!7#"56',
+    '""/1$$1/74$!2$#3th$!8#"24#!6#!8$!1"-00&ndash;1500$#-ft$!c#!g#"lb#&ml/4fl',
+    '#!v")1&ndash;5#$,000##.5%"$3(1)#$,000""4p")5&ndash;6#".1#)8&ndash;9#,9&ndash;1340#\'g/4oz/1#"ma$"hz"-60&ndash;1321',
+    '")7&ndash;9"*8&times;64#&0x1024#$kbps#!p#"th"*93&ndash;4#,4&ndash;1303#"th"#:00#"31#!4$!4#"50#!8',
+    '""gb""kg"$mins"(noon-3pm!)3&ndash;5)!9"$,700""-1#"20#\'acetate#)under-par"#.00%&-16.00$!2$!5',
+    '#"22$!3##3.3%!4%!5$!6#"40#"50#"76$!p##8.2$"pc"%/4/93#"91"*00&ndash;1',
+    '$"cc#*7&ndash;22##bhp#"ft")2&ndash;3*!5#"nd"$3mhz#!p""4%##mph#!p"$5bhp#"cm")6&ndash;9',
+    '#"01")7&ndash;8#*4&ndash;75"$8(3)#$,000#,9&ndash;1402#"cm"$9mph#"th"":1$!4$!8#!2$*4&ndash;30#"44',
+    '$!9"(e.p.s.ps"!j"!k!*4&ndash;14*+8-year-olds)"20"#(6)"!*"+,000-strong#"15##533"#-10$!2#!2',
+    '#!8#$fold#$plus#%track"/.00&ndash;17.00$!2#"12$!3#"25$!p##3.3%!4$!m##4.1$!0',
+    '##5.3$!1##6.4%"89##7.1%!7$!2##9.2$!9"#/20#"84$!5"+0&ndash;160#,0&ndash;1300#"ft',
+    '#"pc")1&ndash;2*!3#$,000#*4&ndash;43")2&ndash;4##(2)#".5#*4&ndash;25"(3&sol;87##.0p""4a##mph""5%#,0&ndash;1400',
+    '"$6(2)#$,000#$-249#*9&ndash;70,!1#"th")8&ndash;6*!9#".5##bhp"#9.5#"0s#!p"#:01#)1&ndash;6',
+    '$!8#"22%)&ndash;25$!6#"35$!6#"55""bn""km"#ozs"$secs!*5&ndash;10)"23)"33)#40%',
+    '##400##800$"40"9-hydroxy-pg-dehydrogenase#$page#%stone"%.10.4##2.9$!9##3.2$!0$!8#"45##5.2##6.3',
+    '#"8m$!p#"92$!3$!9"%/4/93#"84"+0&ndash;300#(,000,000#%-page#,0&ndash;1650,#700+$2000$"bc#"mb',
+    '#"pp"\'50-1750#!s"%6&deg$)ndash;157##0\'s#,7&ndash;1643#"th"(7&sol;85"-88&ndash;1679"#:08#*1&ndash;32$!3$!7#%39:00',
+    '$$7:00#"55""bn"!d#!b""hh""kg#"hz""mg!*6&ndash;04)"11)"21*!3*!6*!8',
+    ')"64#&percnt"!\'"$,251##400"#-12$!5#!3$!0#!5#!9#$fold##ton#$user#)years-old',
+    '##2hh$!p#"34$!5#"43#"52#"95"#/84"*0-year-old#".5#&0-1850##bhp$!p#"hp"-33&ndash;1703',
+    '"%4,000#,0&ndash;1641-"60#,6&ndash;1716#!p"#5.5#)3&ndash;4")6&ndash;7#*0&ndash;70#)4&ndash;5#)6&ndash;7#!g#"th"*72&ndash;4"$8(4)',
+    '#,8&ndash;1744#*9&mdash;97"*9&ndash;70+!1#$,000#,4&ndash;1778#,8&ndash;1761"#:00$!2$!5#"10""hh""kg"$mbps"#pts',
+    '#(ndash;14*!6*!7)"23)!5"#(4)#"6)"#-11$!5#"22#!3#$hour#%party"#.01$!3',
+    '$!3##2.2$!0$!4#"31#"41$!2$!3$!4#$5.91#"61"#/20$!7"#0.3#!m',
+    '#*1&ndash;13#*3&ndash;14#*4&ndash;27#,5&ndash;1754#*8&ndash;22#*9&ndash;20"%2,000#".5"%3,000#"80#*9&ndash;40#)d&ndash;f"*45&ndash;6#,8&ndash;1832#!p',
+    '#&0-1900#,7&ndash;1827#"ml$"ph#!p"-60&ndash;1820#*3&ndash;64#)5&ndash;6#,7&ndash;1831#,9&ndash;1844#!p$!p"*7&ndash;80#*8&ndash;79#*9&ndash;80',
+    '*!9#$,000#$.735#*3&ndash;84#*8&mdash;92#*9&ndash;92#"th"*91&ndash;2#,2&ndash;1871+!3#)4&mdash;6%\'ndash;6#,5&ndash;1821#,7&ndash;1864#,9&ndash;1804',
+    '"":1$!2#"22$!3#!7"#p13"#th-$!.$%/18th$\'century!*8&ndash;14*!8)"28)!4)"65',
+    '"#(4)#"a)"(,000,000#%200ft##376"#-28#"30#(handicap"#.11$!2$!5#"22$!8#"37$!k',
+    '#"75""/8")0&ndash;1*#200#,3&ndash;1805#)4&ndash;6+"92#)7&ndash;8#)8&ndash;9#*9&ndash;82#!c#"mb"#10s#*3&ndash;14,#893',
+    ',#879#*6&mdash;19%(ndash;69#,9&ndash;1869#!p")2&ndash;5#,3&ndash;1913#)4&ndash;5#)5&ndash;7#*7&ndash;38#)8&ndash;9")3&ndash;4#$,000#,0&ndash;1930+!3',
+    '#,2&ndash;1917#,4&ndash;1904#)5&ndash;7#)6&ndash;9#)7&ndash;9#*8&ndash;42+!9#*9&ndash;41#!p"*40&ndash;2#)2&ndash;3#)4&ndash;5+!6+!8#,5&ndash;1923',
+    '#,9&ndash;1936+"51"-50&ndash;1930#,9&ndash;1906"-61&ndash;1951+"65#)2&ndash;3+!6+"73#,4&ndash;1927+!5#*6&ndash;71#)7&ndash;8#*9&ndash;71,!3',
+    '#*0&ndash;71$"\'s$!4#)3&ndash;5#)4&ndash;5"*8&ndash;92#,1&ndash;1955+!5#,4&ndash;1942+!9#)5&ndash;9#)6&ndash;8+!9#*8&ndash;89+"99',
+    '"#9.4#,0&ndash;1914-"76-"90#*1&ndash;92#,2&ndash;1992+!9$!b#)3&ndash;5#)5&ndash;7#"6a#)7&ndash;9#,8&ndash;1900+!9"#:22',
+    '"#cms"#mhz""oz"-th&ndash;19th$!c!*9&frac12;p#(ndash;12*!8)$20th)"30)"75)#mar"#(2)"(,000,000#"20',
+    '#!1#!2$!4#&strong"#.10$!3$!4$!5$!8#,2&ndash;73.1$!7#"99"+00&ndash;02+$1901$!0',
+    '#*2&ndash;03#*4&ndash;17#*7&ndash;12+"24#*8&ndash;09+"10#!m#!s"+10&ndash;12+"20#*1&ndash;15#*2&ndash;15#*3&ndash;15#*4&ndash;19-"45',
+    '#*7&ndash;19+"21"-20&ndash;1925#)1&ndash;3#*4&ndash;32,!5#*5&ndash;26#)6&ndash;8+!9#*7&ndash;39#*9&ndash;35$!."+30&ndash;86#*3&ndash;34#)4&ndash;6',
+    '%(ndash;40+!7#)7&ndash;9#*8&ndash;45$#-39#*9&ndash;43"+40&mdash;44%*ndash;1945+!3+"45#)1&ndash;5$!.#*3&ndash;62#*4&ndash;46+!5',
+    '#*5&ndash;56+!8$#-49%"51#*6&ndash;50+"86+!9#*7&ndash;49$#-48#*8&mdash;49$"/9#*9&ndash;52#!o#!p"+5&ndash;200',
+    '#*0&ndash;60,!7+"70$!b#)2&ndash;3+!5,!4$#-53#*4&ndash;62#*5&ndash;60$!-#*6&ndash;60+"70$"/7#"7b',
+    ',!2+!9#,9&ndash;1962#!b#!o"*60&ndash;1+!3+"65+"80$!a#)1&ndash;3#*2&ndash;64+"71#)3&ndash;5+"77',
+    '$!.$#/64$!a#,4&ndash;1970+"66+"74$#-70$!.#*5&ndash;67#*6&mdash;67%(ndash;72,!6$#/67$!a#,7&ndash;1968',
+    '$#-68#*8&ndash;73,!7$#-69$!a$!b#*9&ndash;90$#-70"-70&ndash;1980+!2+"72,!5+"80,!3+"90',
+    '&!3&!4&!5$"/1$!c#*1&ndash;76$":6#*2&ndash;76+"85$#-73&!4#&3-1990%"74$!c#*4&ndash;81',
+    '$".8#*5&ndash;78+"80,!1#,6&ndash;1986$$:204#$7-79%"80$!.$#:13#*8&ndash;82,!3,!6$#-81#*9&ndash;84',
+    ',!2$%-1980")8&ndash;9#$0-82&!4#*1&ndash;86,!9%&sol;82$"-2%"83%"91#*2&ndash;85$"\'s$#-85&!6',
+    '$":3#)3&ndash;6+!8,!7$%,1984$#-86&!8$!c#,4&ndash;1992$"-s$!c#)5&ndash;8$%-1990%!6#*6&ndash;91',
+    '$!d#*7&ndash;90$%,1988$!3#,8&ndash;1989+"92$%-1989#,9&ndash;1990+"92%&sol;90$#-92#!l"#9.9##/82#$0-93',
+    '#*1&ndash;95$"-2%"96$8/birdlip/gloucestershire%*gloucester%&oxford#*2&ndash;94,!5$#-95&!6$!/%,castlemorton%%erika%8lechlade/gloucestershire%#raf',
+    '#,3&ndash;1994+"96$#-95$\'/oxford%#tim#)5&ndash;6$"cc#$7-98#"oa$!b"#:18#!9""ft""lb"!m',
+    '""x5#!6!#:00"$1250#!3#!7#!8"#200#!2#!3#!4#$5000#!8""30$!0',
+    '$!0"%50000#!8"!7#!5!!=!#and"!r"!s"!t"!y!"bh!"ew!"hh"!t',
+    '!#ins!\'lb/500g!"ms!"ng"!u!#off!(p.p.b.v."!d"!g"!x!"rb"!q!"sq"%t-2nd#$/2nd',
+    '!%tbspn!"ur!"xr"!y!"yy %2%-3%!(&amp;l/2")frac12;ft&"23"/lcub;gth&rcub;1"\'mdash;3#$gr;g#/iddot;5cm/1inch"+ndash;1/2in()2&ndash;0',
+    '("38("40("72#"gr"&percnt"*shilling;6"\'times;2!8\'-deoxy-3-deazaadenosine!(,000-odd%"1b%"km#"15$!7$!8$!9',
+    '$!7#"82$!7"!1#"01$!7$!8#"10$!4#"20$!2#"34$!7#"42$!4',
+    '#"60$!1$!2#"76"!2#&00,000%"ft#"10#"30#"40$#7.0#"73"#311$#2.1#"78',
+    '"!5#\'00-acre&(year-old#"30#"53#"60$!1#"86$!8#"98"#640#"66#"80"\'750,000#%70.00',
+    '#"31#"50#"80"\'900,000!$-4-0"#6-4"%amino")bedroomed"&cycles"\'pounder"%style!+.0-on-sparc#"00#!7"$1(a)',
+    '#"16##5am#"gb"%2&deg#$.1.4$#2.1$!6##5ms"%3.2.1$!6#"5m"#4.5$!6#":1"\'5&aring',
+    '#"mb#&t/acre"#6.3%$(ii)#!2#!4"#7.4$!5$!6$!7#!7#!8#!v""80#"5p',
+    '""93#!m!&/11/92#!6""30""6d""86"#ufo!)0&mdash;1)"30#(ndash;04)"10)"28)"35)#50%',
+    ')!7)#feb)#mar#,times;30&ins"#(8)"1,000&ndash;30,000&\'-strong%!4#"21"#-14$!6$!7##50%#%a-day#+handicapper',
+    '"$.000#"23#"4%#"5%$!0$!5$"cm$!p#"96"%/6/87##mar"(0&deg;c/$\'micro;m#%-hour#,0&ndash;3000',
+    '$"ft#"36#!k$"yr#"ma$%l/7fl$!s#"pp"(1&sol;85#$,000#!8#!p"(2&sol;85#!4")3&ndash;7',
+    '"%4,000#"10#!4"(5&sol;84#$,000#(7&sol;82#!p""66#!8#"pp""75"%8,000#!8#!p"#:19',
+    '"#ghz""ma""ng"!o""pp"%s-40s#!a#"ec"#th."!w!*1&ndash;26*!7)!5)"76)#jan',
+    '"(,000,000#"22##600##800"#-11$!2$!3$!7#"25"#.15#"22$!5$!7$!9#"81',
+    '$"pc#"9%"#/22##feb""05#"66#"mm#!p""13#"bc#!p"%2,000#!0#!8#"mb',
+    '""44#!p""51#!7"$6gti""70""83"%9,000""lb""nt"#pts"$secs"(year-old!*2&frac12;p#\'mdash;4',
+    ')(25&deg;c*!7)"30"#(1)"$,100#\'300,000"#-28#%carat#%metre$%inute$$onth#$page#&strong"-.3&ndash;22.8"#/42',
+    '""0%#!3#!g#"lb##mph#!w"(1&sol;85#"75#!p")3&ndash;4#!p"%4,000""5%##bhp"%6,000',
+    '"%7,000""90"":1#!7"!b"!c#!m#&omment""ml"#pts""s."!v!)3&ndash;5)#nov"$,200',
+    '##900"#-28$!9#"30##dec##jan#&strong"#.16#"2%$".1&".2\'!3\'!4$!7$!8',
+    '$!p#,3&ndash;65.5$!9#"7%"&/10/87#"24""0%#$&deg#!4#"60##bhp#!m""14##bhp""20',
+    '""41#!2")5&ndash;6#!0#"lb""6p""73")8&ndash;9##(2)##2.7#!p""92"#:24#"43$!6',
+    '"!w!$4&ft#(ndash;14)"31)!4)!7*!2"#(2)#"4)#"5)"(,500,000##700"!-#"28#!6',
+    '#$copy##nov"%.2(b)#"31#"74"$/oct"#0ml#"pp#"th""10""23""39#!p"%4,000#$.5bn',
+    '"$5432#!b"$7(8)#$,000"$8(3)"!c"$hour""kt""lb""oz""pc#!p"$secs!+5&mdash;30p#(ndash;13',
+    '*!9)"49"#(2)"&,000th$"93##200"%-foot#$pack$"dr#&second"$.16p#"3%$#.92#"4p"#/50',
+    '"\'0&mgr;v$)ndash;350#%-seat#!8#"ft#!v""3p"%4,000#!0"%5,000")6&ndash;7"$72.6"%8,000""9p"":1',
+    '"!b"!k"!o""s."!w!*6&ndash;14)"31"$,500"\'-letter#%march$!m#%place"#.2%#$7.85$"5p',
+    '""0%""12#!5#"97"#2.5##261"$3723""50##621"&614-15#!p"#870#!p",:14&ndash;16#+26&ndash;29',
+    '""lb""pc""s.#"ec%!s"\'th/27th"(year-old!,7&middot;5cm#(ndash;12*!6)"31)"55)!6)!7"#(3)',
+    '"%-hole#%march"#.1%#"36#"4%#!8"\'0&deg;.(!c$&sol;83#!7""15""20"$32.4#!p""40',
+    '")5&ndash;6#!5#%75-77#"ml""69"%8,000#%13-14#!5"$9(3)##679"!b""kg#!m$!s"#min',
+    '!%8&deg#(ndash;14)"37"#(6)"(,000,000#"29""-0#!9#\'october"#.18#"2%"#/29"\'0&mgr;v#"00#!2',
+    '""10"$32.5""49""59#!p"$60.0"$8(1)",:18&ndash;20""km"!m"!v!*9&ndash;33"#(4)"(,000,000&"ft',
+    '##may"#.01#"7%"(0&deg;f.#!3#!4#%53-55#!7""42")5&ndash;6#$,000#!7""67""84#!9',
+    '#!0#"13"!b""ff#!t"!s"#th.!,:13&ndash;14#!6#":1""22"!3#!0$"pm"!6',
+    '!"ap"!r"!s!"bt!#cvs!"db"!g"!w!"el"!s!"jd"!f!!k!#lb."!p',
+    '!,nd&ndash;3rd"!j"!l!"oo""th""zs!"pz!"qb!$s.6d%!.""ec"!t!#tbs"!h!"wd',
+    ' .3&frac12;-hour&"23#\'t;6&ins"\'mdash;4"(ndash;18()2&ndash;0)!1(#300)!2!#(f)!0,000&ndash;4,000%&-4,000&$acre&$mile&#odd',
+    '#"21"#110"#370"#4,5#>-methylenedioxymethamphetamine#&00,000#"40"%500ft%#rpm#"50"#6,9"!7"\'993,000!#-10"$goal',
+    '"$part#$oint"%south##tep"&tonner(!s!$.00m""1+#!."%2.3.3#"0m#$2(a)#$5(b)#"kg"#35%',
+    '#!6#!k$!b"%4&ins#"3b##ghz#"mm"$50pm#!1#!3#!4#!7#"cm#"pc""62',
+    '#"pc"#7.5#!6"+8&ndash;6.1#".1$!2$!3#!9""94#"5%!#/15#260&deg;c/325&deg;f""30"!5""87',
+    '#!3"!f"#the!)0&ndash;0)"10)"20)"42)%50mph"&,000ft#"36"#-ft#$nov.#$oct.#)year-olds"#.1%',
+    '$!p#!9"%0-350$#400$#500$$mile$$ship##000#!2#"53#"75##bps##gsm##khz#"mb',
+    '##yds#"zx""1.""2p""30#!3$!5#!s""45#!6#!9"(5&sol;87#!3#!4#!6',
+    '""66"%7,200""81#!5#"ds""96#!p""db""gb""nm"$secs"#th."!w"!x!(1&frac12',
+    ')"33)"50""\'s"$,700"%-june#$nov."#.3%#"9%"&0kjmol""13"$2/89#!2#!s"#304##208',
+    '""40#!7"%5,281"#6sl"#79g""8p"%9,000#!0""ft""km"#sec!%2&deg##ins#(ndash;35)!4',
+    '"#(2)"$,300##500"!-#&nation#&strong#$user"!.#"2%$#(b)#"36#!8$!%"$/0.2"-0&ndash;380nm',
+    '#!2#"47#!7#!p""18""20#!4#!5"$4496#!p"\'5&deg;f#&g/12oz"$70/x"#890"*9&ndash;30',
+    '#"97"#in."(km/20mls!%3&deg#&frac12#(ndash;34*!8"#.14#!2#"6%#"85"#0mm#(p.p.m.v."%1,000#(.2:687.9',
+    '"$2/89"%3,000""42")7&ndash;8""80"#977"#:20""cm""mb!(4&frac12#(ndash;37"$,400##500"".1$!%',
+    '$!5#"9%"#/11"#008#"nm#!p"%2,000#!2"%4,000#!3#"60%#-62"&536-38"&690-92""76',
+    '#"89""80#"13#"25""9p"!c"$mbps#!m"!s!%5&deg#\'ndash;3)#40%*!3#(shilling"#(1)',
+    '##750"\'-minute$!m#&strong"".0#"4%#"50#"9%""/8"&0-seat#"06$"kg#"23##bhp#"ft',
+    '#!p"#138#"80#!p#"st""25"#326#!3"#417#"59"&560-61#"mm""61#%97-98"#723',
+    '#!p"&835-36#"51"#910$!4"!c"!k"#mph"#sec!%6&deg&";c#"ft#(ndash;48"$,200""-6',
+    '#"2%##36%#"7%"!/"#0/p#"08#"30#"46#"98#!a##dpi#!f#"kg"#106$!7',
+    '##608"#203#!1$!7#"31#"45$!9#"56"#312#!2$!0#"43$$8-49#%57-58#"85',
+    '$!3"#406#"10$!3#"26#"30$!3#"40$$8-50#"58#"60$!7#"75$!7#"82',
+    '$!7$!8"(5&frac14$)ndash;374#"01$!3$!7#%14-15$!8#"24#"37#"48#"57#"91"#604',
+    '#"13#%27-28#%42-44$!5#"50$!1%#-52#"62$!5#"72#"81#!p"%7,000#%20-21$$4-25',
+    '#"31$!5$!8#"57#"63#"76$!9#%88-89#"92$!3""80$!4$!5$!6#"17',
+    '$!1#"30$$2-33$!5#"47$$9-50#"52$!7#"61#"70#"87$$9-90#"95"#902#"13',
+    '$!7#"30$!9#"43$!7$!8#"50$!2#"61$!3%#-64#%72-73$!5$!8#%83-84',
+    '%#-85$!5$$6-87#"93$!4$!9"!c"!e!%7&deg&#;c.#\'ndash;1)"39)"40*!6"\',654.29',
+    '"%-page"!.#!0#"4%""/4"#001$!7$!8$!9#%33-34$$8-39#"45$!7#%50-51$$2-53',
+    '#"62$!7$!9#"81$!2#!p"#104$!6#%10-12$!1#"21#"31#"45#"59#!7',
+    '$!9#"83$$4-85$!9#"93"#219#"22$!3$!5$!6$$7-29#"35#"40$!9#"57',
+    '$$3-64$$4-65$$7-68#%96-97$!8""30$!0$!6#%11-12$$8-19#%20-21$!1$!5$$7-28$!9',
+    '#"56#%60-61\'!2$!4$!5#%70-71#%83-84#%91-92"#408#"13$!8#"27#"30$!1$!2',
+    '#"40%#-41$$5-46#%50-51$$1-52$$2-53$$4-55#"62$$8-69$!9#"70#"87"#534$$5-36$!7',
+    '%#-43$$7-48#%50-51$!8#"82$!3$!7#"92$$8-99$%9-600#!g$%/13oz#\'ml/15fl"#609%#-10',
+    '$!9#%20-21$!8#%36-37#%51-52$!8$$9-61#"62$!3$!5$!6#"83$!9#"98"&702-03',
+    '#%10-11#"22#"52#"60$$2-63$$7-68$!9#%71-72$$3-74#"87#"92"#808#"12#"20$!2',
+    '$!6#"32%#-33#"43%#-44$!5$$9-50#"58#"62$!5#"77#"89#"90$!2$$7-98',
+    '$$6-07#%14-15$!8#%24-25$$6-27$$8-29#%34-43$!9#"50$$1-52#%82-86&"90$!6#!a"!b',
+    '""pp!*8&ndash;10""-m"".0#"3%##7bn#"8%#"9%"#005$$6-07#%10-11$!3#%80-81$!5#"94',
+    '#!s"#100$$5-06#%26-27$!7$$9-30#%30-31$$5-36$!8#"49#%74-75$!8#"83"#218#"29',
+    '#!7#%95-97#!b"%3,000#"05#"10$!5$$8-19#%38-39#"43#"52%#-53$!9#"60$!6',
+    '#!8$!0$!1$!3$!9#"97$!8"+4&ndash;322#"00#"11$$9-20#"27$!9#"33#%40-41',
+    '#"56$!7$$8-59#"69#"mb#!p"%5/3/i#"08#%15-16#"23$!8#%41-42#"66#"71$!3',
+    '$!6#"86#%94-95"$6-33#%00-01$$1-02$!2#"54#"60$!3#"71$!4#%83-84$!7#%92-93',
+    '$!4$!8%#-99#!p"&703-04$!5#"15#"33$$6-37#"45#"51$!3#"65#"71#"81',
+    '#"92%#-93"$8(4)#"03$!8#"13$!4$!5$!9#%20-21$$5-26$!6$$7-28#"30$!5',
+    '$!7#"43#"50$!2$!4$!7$$8-59#"84#"91$!7$!8"#907$$9-10#"10$!8',
+    '$!8#%42-43$!3$$4-45$!6$!7#"53$!9#%62-63$!9#"73$!7#"85#"93$!6',
+    '"!b"!c""ma"#pts"%s/3/i")th-minute!*9&ndash;42"#.2%#"7%$!2"#001$!3#"12$!6#"23',
+    '#%30-31$!6#"43$!4$!8#"50$!9#"64#"79#"80$!4$!9#"90#!p"#109',
+    '#"28#"30$!6$!8#"44$!6#"57#"61$!4#"78$!9"#200$!5$!6$!8',
+    '$!5$!7""30""40#!5"%7,000#!9#!g"%8,000"!c"!f"#pts!#:00")1&ndash;6#!8',
+    '",22&ndash;4:1#!4#!5!"b2!$c273"$h134!"db!"ew!!f!"jj"!y!"nq!#ozs!#pts!#rd.',
+    '"!l!"ta"%bspns!#yrs 14&commat;1/2-year")frac12;d.)!p&"34"%mgr;m#&icro;l"(ndash;13)!6()2&ndash;4)"00("33',
+    '("45)!8(\'5&deg;c)"cm"#ohm"&percnt"(shilling"\'times;6!#(7)!*,000-5,000$!1#"45"#250"!3".5-bisphosphate',
+    '#"85"#950!#-14",bromo-a23187"!c"$mile#$onth"%point"\'quarter!%.00am#!4"$1(c)#!.#$1(a)#$4(a)',
+    '#$5(b)$"am#!p"%2.1.1&!2$#2.3##0pm##5pm"$3(b)#!1#!8#!c"$4(4)#".4$!6',
+    '#"fl"+5&ndash;3.5#$.1.2##0pm#!1#!8#!9#"mb"$6(a)$"b)#".3#!1#!3#!4#!9',
+    '#!0#!4#!9""86#!7#!9#!m"$9(b)#".2#"9%!"/2"!3""73#!4"!8',
+    '!(0&frac12##ins#(mdash;50#(ndash;41)"53*!4)"69"#(2)"+,000-strong##500"#-60#$fold%"ot#%metre"!.',
+    '#"2%#"3%#!6#!7$!%#!8"+0&deg;f/gas$)ndash;700#(,000,000#$-odd$#ton#,0&ndash;5000#"kv##lbs#"nm',
+    '""26")3&ndash;4#!p"%4,000"$6dpi""81#!4"!a"!b""db"$secs")th-minute!\'1&deg;c#)ndash;102"".0',
+    '#"6%#"9%""5p""67#!p"%7-646#!m""8p""9p"!b"$secs!)2&ndash;0)&106929+$8784)"43',
+    '#"5)"(,000,000##500"%-seat"#.3%#!4$#032#"7%#!8$!%""0%"#140"%3,000#!0#!3',
+    '""59""6p""7p""8g#!p"":1""cm""mm"$secs""xx!\'3&deg;c#%prime""\'s"%-year"!.',
+    '#"3%#"5%#"7%""0p""20""50""80""ft"!m!-4&ndash;22633"#(3)"#/16##207""0k"$1483',
+    '"$3241""59"%6,000""77#!p""80#!p"#932#!8""bc""mb""pp"$secs!\'5&deg;s##ins',
+    ')!6*!5)!7"".0#"1%#"4%#!6#"8%#!9"\'0&deg;c#$0rpm#"mb$"l/&\'&frac34"#133',
+    '""50")6&ndash;7"!c"!k"$mbps"#sec!\'6&deg;c#(ndash;47)"53"#(2)"#.1%#"4%#!9"#000#"kg',
+    '""3p""64""9p"!k"#sec!#7\'s"\'-member"!.#"2%#"37#!4#"54$!p"$1800""2p',
+    '""4p"!b""ft!\'8&aring#(ndash;49)"55)!9"(,000,000"\'-minute#$seat"#.00#"4%#!7""0m""1p',
+    '#!2"#6/m#!1##sxs"%70(a)""ft""gb""pp"#sec!$9-50##ers"".6#!8""0p""30',
+    '""9p!#:21#!6"!8!"b4"!a!"eu!%gl/gx!"h1"!t!&inches!"jl!"lp"!y!#mhz',
+    '!#ppm"!u!"st!!u!!w!\'x12&ins$!s!"yf ,5&frac34&ins#\'t;2&ins"\'mdash;7#)icro;g/ml")ndash;150)!9("26',
+    '("34)!5("42("50)!8(%6&ins)#000"&percnt!#\'11"!7"(ctagag3\'"(gggccc3\'!$(1a)""8)!*,000-6,000',
+    '&%8,000&$mile&#odd%"kg"#100"#765!%-mile")stringers!$.01c#"3p#!5#!8"#1.0##0.1%!3',
+    '%"b)%"c)$".1%!2%!3%!4##2.2#$3(2)##5am$"pm##6.3$!e#"8d#!m"$2(b)',
+    '#"7a#!p"$3(b)##.24$#3.2$!7$!8##5pm""4.$!8##0am#!9#!a""52#!3',
+    '#"in"#6.5""7m""85#"pc"#9.5#"pc!"/1#!1"$2/90"!3"!7!\'0&deg;s\'!w#"ft',
+    '$&icro;l#*ndash;1200)!2*"00)!3)#500*!9)%70mph"%-foot#%metre#$over#$week"".0$!%#"3%',
+    '#"5%#!6",0&ndash;1000#!+#+,000-strong#$-600$$fold$#odd$(year-old#-g/1&frac14;lb$!b#"kb##mev$+l/1pt/2&amp,&frac12',
+    '""2p"$4377#!k"!b"!c"-g/2oz/&frac14#!b""kw"#min#"pg#!s"#ppm!+1&ndash;100)!2)"56',
+    '#"8)"$,600"!.#"4%""0p"(2-member""38""8i#!p"!a""p7")st-minute!$2&ft#\'ndash;3"#.1%',
+    '#!8""0p""24"%5,000#$0rpm""70")nd-minute"!s!%3&deg#*ndash;6.72"#(3)"%-year"".1$!%#!2',
+    '#!6"#/4p""03#!h"$3333#!p""4p"#8.7"!b"!s!\'4&deg;c"%-hole"!.#!1#"3%',
+    '""07#"mb#!s"#2.6""30"$4321""59""66"#7.8""ft"!m"$secs!*5&ndash;70"$,500"!.',
+    '$!9#"8%#"9%"#020#"kg""20#!p""3p""55""66""73""93""bp"!c""ft',
+    '!*6&ndash;57"#(1)"$,940"!.#!0#!1$!%"$1382##539""37""4p""5p""70#"67"$8373',
+    '!*7&ndash;61"#(1)#"2)#"3)"#-cm#&member"#.1%#"48#%57sec$!p#"6%#!7$!%#!9""0p',
+    '""99"!b!*8&ndash;59""0s"%7,000""85"!m!\'9&deg;f#(mdash;61"".1#!3#"50"%0,000""31##786',
+    '""50""8p"!k""pc!#:13#!9!#amp"!u!"br!$c/6a!"dr!!h"!e!"jw!#khz',
+    '"#ins"!t!"nm!"ra!"st!"xh ,6&frac12&ins"%mgr;m"(ndash;17("21(&8.30pm)"in!!\'!#(c)""i)',
+    '%"kg"#330"#760"%800kg!#-in!#.0%#!1#!2$!2#!3##5pm"#1.4#$4(a)#!b"%22a-f',
+    '"+3&ndash;6.6"$40am#!4##5am#!m"#5.0$!4#!3#!4##5pm#!a#!b#"cm#!f#"kb',
+    '#$secs"+6&ndash;7.4##(a)$"b)#".1$!3$!5#!3#!6#!a"#7.1#"5p#!a""97!!/',
+    '"%11/87#!2""86""90!&0%-40%"3&deg&ndash;70&deg;f&";n#(ndash;56)#65%)"74)#80%"+,000-strong"$-100##70%##bed',
+    '#"mm#$plus##run"".0#!1#!5"$/100#!m""0%#*&ndash;900#$-700$&inmate$&strong$$yard#$0/35',
+    '#"bc#!j#!k$!b#"lb"#163""2p""58"$6mhz""70#!9#!p""db""gb""kg',
+    '!*1&ndash;70)#xiv"".7$!%#"9%"#002#"94""24""4p"#5th""65"$9821"!a!*2&ndash;63"#.8%',
+    '""01#!3#!6""20##101"$3gsi"%5,000""78"$9201##962"!a"!b""ft!$3.0%#!4',
+    '$!%#"9%""00""14"+2&ndash;633"#3/4""82""97#!g#!p")rd-minute!\'4&deg;f#(ndash;93"%-page"".0',
+    '#"3%#!5"\'0kbytes"$3657""90""cm""km""pp!\'5&deg;n#(ndash;90"#-66#&minute"".4#!6#!8',
+    '"%6,000"#7cc"!a""km"!m#"hz!)6&ndash;7"$,500"\'-minute#$year"".6""/m""3p""66#!p',
+    '!#7.2#!3#"8%#"9%"#290""7p""ft"!m#"hz!)8&ndash;9"".2#!5$!%#!6$!%',
+    '"$040s#!s"$5873#!p""71"%en360""mm"!p!*9&ndash;79"#.1%#!7$!%#!9"$/647"%0,000',
+    '"$5.74""98""pm!*:2&ndash;3"!3##0am$"pm"!4"!5"!6#)&ndash;11!"ab!"bs!"dz!"e7',
+    '!"he!"jj!#pts!"rd!#th.!!w!#x10 \'7&deg;c")frac12;in&"34"(ndash;04)!5("15)!7("22',
+    ')!4)!6("30)"3\')!4!#(b)!!+!0,000&ndash;8,000!*-year-olds!,.0&ndash;8.0#!1"#1.3$!4"$2(b)#".6',
+    '#!6"$3(1)$"9)#$.2.1#+0&ndash;8pm#!b#!m#$secs"$4(b)##0am#!2#!4#!6"$5(b)#&d.p.c.',
+    '$!6#!3#!5#!p"%7.9.2#"9%""82#!m#!p"#9.1$!3#!8!"/2!\'0&deg;s#\'ndash;1',
+    ')"71*!2#&percnt"$-80%#&strong#)year-olds"".2#"3%#"5%#"9%"!/##min""0%#\'-strong#"0m',
+    '#!t""30""5p"/7/300&ndash;400""80"!a""km""lb!)1&ndash;2)"75"#.2%""05#!t""12"$4.00',
+    '""7p!$2.1%#"5%#!6$!%"$/161""0s"$2851""30""42"$5912""7s"#dpi"!h!$3.5%',
+    '#"8%#"9%"%0,000#!7#!s"%12087""24""50""70""pc!#4.2#!5#!9"$1481"$3(2)',
+    '"$4500""5i""72#!i#!p"!p!\'5&deg;c\'!n#(ndash;76)!8*"5%)"90"\'-minute"!.#!5',
+    '""09"#383""50"#700"$8243""lb")th-minute!\'6&deg;f#\'ndash;7"#(b)#"c)"#-mm"#.2%#!4#!6',
+    '")4&ndash;5"%6/458""90!07&ndash;79&deg;f"".3#"6%#!7#!9"$/187".0/1368&ndash;9"#177""37#!p""50#!2',
+    '")th-minute!\'8&deg;s"".6#!8""00#"18#"22#!p"&3/1381""88!)9&ndash;3"".2")th-minute!#:23""30',
+    '""47!"ae!"bp!#cms!"dz!"ey"!z!"hn"#our!$inch!"kw!"rt!!t"!s +8&frac12;in',
+    '"(mdash;10#$gr;m"(ndash;20)!9("38("46("50(!8"&percnt!!\'!#(d)!),000-plus%$yrbp"#125"#847',
+    '#%28.55!#-14#!8"!7"$week!%.1(b)##5.8##7.7""2.$!5"#3.3"$4(b)##5pm#!6#"83',
+    '$!5##0pm#!2##5am#!6#&d.p.c.#!p"#6.1$!2#!5"$7(b)#!3#!n#"pc""9m',
+    '"$5/93""6d"!8##/93#!7""91!&0%-90%"&&deg;s#"ft#&percnt#&sol;77"+,000-strong"%-hour#&minute#$seat',
+    '"".0#"1%""0%#)-software%%trong#%/1397#"80##dpi#"ft#!k$!m#$mbps"$860s%"xp"#bhp',
+    '""kg"\'m-bytes""va"(year-old!*1&ndash;82#&sol;77"#.6%#"7%#!8""05""20""60"!a!\'2&deg;f#\'ndash;4',
+    '"#.3%#"7%"%0,000""12",2&ndash;4715##631""30#!3""70".8/1424&ndash;5")nd-minute"!p!)3&ndash;6"".1#!5',
+    '""23")3&mdash;4##241"$6494".9/1435&ndash;6"!a""ft!%4&deg&";s#\'ndash;7"#(1)"$-166##249"#.2%#!7',
+    '#!s""31##mhz"%5,000"!a"!f"#h10!+5&ndash;90%"#-86#$type"#.11#!4#"6%#"7%#!8',
+    '#!1#!4$"28#!f#!m"&5/1451"#697"#732""cm!&6-hour"".2""0s""16""70""pc',
+    '"".9"#/88""00#!s".1/1466&ndash;7"&3/1468""pc!*8&ndash;89"".5#!6$!%#"9%"#/89"$110s#!2',
+    '""mb!*9&ndash;90"".3#!5$!%"#/90""16""41""7s""90!#:12#!4""28""34""44',
+    '!"a+"!b"!j"!q!"en!"ha"!l!"jj!\'km/5mls!\'oz/225g#"s.!#pm."!p"!s!"qb',
+    ' %9&deg")frac12;in"(ndash;20("30("95"&sol;87!"\'s!#(7)!$,491"#800%$,000"#900#"99!#-13"*month-olds',
+    '"%11(b)$!b##5.2"#2.3#!3""31#!9"#4.3#!1#!4"#5.1#"bn#!p#"yd"#6.1',
+    '#$kbps""74"#8.2#!6#!9""92#!3#!6!%/2/87""90!\'0&deg;f#\'ndash;1*"05*"10"(,000,000',
+    '##odd"#.2%#"4%#"5%#!9"#/91""0%#"00#"kg#!m$"hz$*l/1&frac12".1/1495&ndash;6""58""66',
+    '"!g#,/3&frac12;oz#!b""hp"$mins"!o!$1.25#"9%""1s""21"#4mm!)2&ndash;3)!4)"93"\'/59/eec',
+    '$!4$!9""52!)3&micro;a#(ndash;94"".4#"8%"#/94#%tokyo""33"&6/1530"$7.50""92""pc!)4&ndash;7',
+    '$!%#"5%#"7%!#5.0#"2%#"3%""0e"&4/1547#!0""70"&9/1552"#mph!%6-pin#(year-old"#.2%',
+    '#"5%#!7"%0,000##mhz!*7-year-old"".4#"5%$!1".0/1562&ndash;3#!b"&7/1569!$8.1%#!9""50""80',
+    '#"8%""00""60!#:11#!5""35"!6"!7!"aa!"dz!"ez!"jz!!l!#min""ph',
+    '!"pb"!g!"rg $=&gt!#0.6!!2!!4!!5!`================================================================!!f!"ic!!m!!p )a&bsol;bc"1dollar;1.2billion',
+    '*\'billion)*2.5billion"*eacute;reo""gt".icirc;n&eacute")ntilde;ez"%rgr;b"\'times;b!)\'bhancair"%chait$$oire!#(1)!"+t!%-band")direction',
+    '#$orty"$list"$shau$%oeing#&ulphur"#von"$wing!$.-g.""16"#837#"96"!c"!d"$o.b.$$c.b.',
+    '"&r.r.u."$s.l."&t.c.o.$$mays!!/"!p!"1+""00""30""83!"2+""00""56""83!$320s',
+    '#"95!$5000"!1#"27"!2""56#!9"!i"#pc6!#614"$6(m)""m2!"70!#850!"90',
+    '!"=4!&_a_bit$#few!%abeid"#del"#ker"!l!#bad#%kumov"\'bagnale#\'eystead#"il"*del-jabbar&%salem%%malek',
+    '#&ominis$(urahmane#(ujaparov$(l-rahman%&atipov%&fettah$&rakhim"&elardo$"lo#$niaf#%rbach$&corran%$ynon$%deen2$!g',
+    '$&rantly#%ttors"#ida"&lative#2e&mdash;report.log""mt"&negate"(ortively#&ut-the\'$urns#,ve-inflation##yne")ramovitch#)idgements"&scisic',
+    '$(ntminded&!s#+orptiometry#&rption#&tainer$\'inences$(ruseness"%ulfez#$stle"#yme!#c/1""ad$-emic-industry#%nthis#"ra',
+    '"*bt-3/2/7/5",celerometers$"nd$)pt/reject#)ident\'lly#%olate$.mmodation-only%&plisht$#sts$\'untemps#)umulatory"%erpac#*tazolamide$&ogenic%%sella',
+    '$%racle##ene##idi$&evment$&tophel#(nacloich#\'romatic".id&times;total$)-tolerant\'%ngued%&yellow$,:deoxycholic$%ities&"y.$*ocaldarius',
+    '")knowleged"%l/dci#!e"#ned")omodation#&ncagua#+ustiphonics"*quirements%&ttance""ra#&efield#.idine-tethered##ost&#ics"$t/88',
+    '#*inomycetes$\'on-like\'(oriented&\'ability&%books&"s.$"us$.ve-region-like#%or(s)%(-dancers&(managers#%ressy#\'ualizer&!y%$tion',
+    '"\'ylation!\'d&amp;d"#aku##mas$)s/station"#ber"$c-10"\'dendums#%icott%&tively$%tonal#!r$\'ess(es)\'%ee(s)#%s/ncr',
+    '"\'ecision#$lina#(niji-ige#\'quation"$helm$$rens##ibi#&ocracy"$ipic""j.#\'acently#)ectivally#&ustive$%tants"\'lington',
+    '"#odo#(pt-a-pet#!r$"am##yta"#ree$+naline-like\'!s#%iaens#!s"#uki#(lt-adult&%onset\'\'riented%&erants',
+    '""v.#!a#&entism&&urists$\'rtised.)&ments.(%ments\'#zed#%iser.#-ocate-general"$wick"\'zharian$$ubey!\'ea-wide"$olus',
+    '#"le#%oclub$+dynamicists$%liths$&marine$\'solised%#tar")stivation"&ternum#\'helings#.iopathogenesis""wa!"fa""ey")fectional',
+    '""gf"#kac"%onwen"+rica/middle&%nista#"o-%\'centric$(pithecin"\'ter-tea%/depolarisations%%maths%%shock%%times")unctional!%gades',
+    '$"st#"ta"&beyome#$oola"*e-adjusted$%limit)!s$$well#$ndum$!s"+gravatingly"&ilbert#"os"*n&egrave;s#!s',
+    '"-ranulocytosis$\'rianism$!s#%ement$$stis""ta"$uiar#$stin!%h-h-h"#1/2"%aroni"&ipeaud"$lden"\'madiyya"(omadegbe',
+    '"!8"\'chinger"$gues$#lle"\'kenhead%!s##ins"\'lesbury#)urophobia"*m&eacute;e"&nianes"\'r-bases$,conditioners$$flow$%india',
+    '$+transported#"as#)craftsmen#$es-1#$horn#$miss#\'streams&#ike"&shling##kew#$sata!#joy"*uriaguerra!%k-47s"&barsho',
+    '"$hele#(sharumov"%ilisi$#les"#mal"#obo"\'ropolis$&terion"%sakov"#ufo!*l&aacute;n"&-ablak$$jami$$nbar%$gari',
+    '#%badri%$ghli%#nna#&haddad%#fiz#&khalil%#iam%#oei$%uwait#&maqdis#%nahda%#kib#$qods%$mesh#&sahhaf',
+    '$%hiraa#&uzaizi#&zawawi"$1-bl"#a16#"ap##leh#$mosa#"to#"ve"$bani&,an-populated#%ertas&!s\'"en',
+    '#)igensians#(rechsten$)ight-knox$#ook#/umin/creatinine")catel/aeg##eni#*oholically#$yone"$dair#%erfen%\'manbury#$h2*2#)ingbourne#%orfer',
+    '&\'h-blake"(e&scaron#&-stake#%atory#+gr&iacute;a#"ko#*m&atilde;o#%rters#&xandru$"ej"%fenus$#tta")gebraists#\'onquian"\'ha81005',
+    '"&ienist#$madi#$oune"%kaisi$%lines\'#ise$%menes$#net%#oic#=yl-acyl-glycerophosphocholine%!s"0l&rehy;important)(powerful#*-absorbing%&frican',
+    '%&merica$%china%(ommunist\'&posite$*electronic$&french$%japan$&knower$&mighty$&poland$%sorts$*too-common(%often%#ube$%wales',
+    '#$anah$"ta#&emande$%rston#\'ocution$%morph$\'n-smith$%patry$(reactive$%trope$-ws/encourages#%right#-thorpe-guyton#)usiveness"$mada',
+    '$$gest#\'ondbank&#ell%"ry$(st-black$\'ustapha#!y")ocentrics#"fi#"jz#"ma#$ofly#!s#"ys"-pes-maritimes',
+    '&%waves%%batim$"en#&inists"%stone$)roemerias""t.#$aian\'!s#&dorfer#\'erative%\'nifolia%0tumswissenschaft#\'o-based#"ro',
+    '"/umino-silicates##nan#"or#"ph#&vihare"&vanley"#wis""ys#"th"&zamora!,m&eacute;lia#*ndash;5.00"#/pm"%2496f"$ador',
+    '#$rant#$zin\'$#nig"\'bergris%"ol"$duat"$eche#"gi##lio#)norrhoeic$#tia#*rican-bred)*influenced+&spired((/british',
+    '#%stris")icability$$itia##don#(gamanore#"ka#0loride-sensitive#$riya$!s"(mendment#,onia/nitrite#(unitions"$nass"(orebieta$$tise',
+    '#!y"%peres#+hi-atlantic%$bium$$oras##lio#&utates"&ritraj".sterdam-pleyel$#utz"#uni#$sant"%yload"#zad!(na-maria',
+    '#$chem$%idity#)esthesia.*\'ologist#$lity$)ogization$&yzable##ncy$"ov#$rres#%tomie"$cash#(estrally\'#ies#\'horites',
+    '#$rene"%d-the#.aluc&iacute;an#*erson-hunt#!o$#nov##red%!j%#oni$*ianopoulos%!s$\'ostenol($rone""el#$rgic',
+    '#)uploidies"(gel-face%"ov$"r.#-iographically%*strongylus#*licisation\'&zation$+o-americans&-french-german&&gascon&\'indians#"op#&uillan%&sciola',
+    '%+l-dispersed\'&rights\'\'vegetal%&tronic$$ists$%uccia"%keret#)le-height\'#igh"&nabell((e/steven$$cone$%malai$"ud#.bank-mauchline',
+    '$"nt#"ia$%baldi$#son#&orexia"$odes#(phelines%\'thalmia#(vulatory"$si-c$$/iso#%orgei"\'t-hills$%lions#%abruk',
+    '$&dating$\'nuptial$&partum$\'riority#%hesis$$oine%\'logical)"st$\'ranoids$&uriums#,i-acetylated&\'lkaline&"nc&+ristocratic\'&menian',
+    '%\'baghdad&%ovine%%china&\'limaxes&)oagulants(*litionists\',nspiratorial%*darwinians%-environmental%\'fatigue&)ederation&+lag-burning%#god%&heroic&(istamine',
+    '\'#v-1&*orseradish\'#xha&"rp%(imperial&%ndian\'%farct(\'ectives\'(surgency%\'kantian%\'lesbian&#ife&%ondon%)malarials\'\'rketeer',
+    '%%nerve&,onconformist&)ucleating%-parliamentary&,erfectionist(\'missive&)hlogistic&\'latelet\'!o&%opery($ular\'+wer-sharing&*rogressive(\'teinase*%stant',
+    '&%eflux\'%verse&$oads\'"ck\'!h\'#yal%*scientific\'&ottish&(ecretory\'%rbian&$ingh\'$phon&(muggling&)ocialists&*uffragists',
+    '&%yrian%*thrombotic&$oxic&*raditional%(unionism%)vibration%(wilkoite$.body-producing$)clericals%(ommunist&)nvulsants$&emetic$%gonos$*microbials%%onium',
+    '&"ri$\'ochenes$%papal&#sti%(ollution$6septics/antibacterials$&toxins%$umor$"us#&onines&"os%%ovich#)ropyloric#"sy#$ulio',
+    '#(meration"$vils"&weiler##ick")xiousness"%y-one#&bodies##thi#!w$"ea!\'ostalli"*tearoa(nz)!+p-1-binding"#apa"\'ck3src2',
+    '"$haia#&eresis#*rodisiacal#%thous"#ian#%koros##sai",olipoprotein#%mixis#!n#\'phthegm%%yseal(!s#$rias#(siopesis',
+    '%(rophized"/palling.richard#&eareth$0llant/respondent#,le/microsoft%#bys%$gate$!i%&cators#(ointable$"rt&$ions$(siteness#(roaches.%$ved.',
+    '#)urtenance"&ril-12\'!3&"20%#ias$&siones#&oditus""so!.qu&aacute;tico#%afoil$%ticus!\'r&aelig#)eacute;te"&-rahim"!.',
+    '$&-owned$$ists#(chadonic#$fura#%nzadi##pas#"ts%"io#"ya"$beau$"ia#)itrators.#(orescent##ury"%chaea',
+    '&)omagnetic%*ic-looking&$stic$,bishop-elect$(chaplain$(eologico$\'idamian%*episcopate%(pelagoes%%tecto)#ura%#vio$\'onships$(predator#"us',
+    '#$sley"\'e&mdash#%/were#"_a#-a-development$)/regional$"ta#(s-serono#7tte-pierre-saint-martin#!v"$ford",g&uuml;elles#"40#"73#+el&eacute;s',
+    '#,umentatively"#ica#"de$$ians#$etis#(starchus&"ta%%ocats#(thmetick&%ology""ke$)ll/farmer#$less##oub""le',
+    '#"in"\'m-rests$\'twisted#%andii%"is%!t##eno#&itages#%orica#(s-making",n&eacute;guy##aga##ell#!i$$ston',
+    '"*omatically#$noff$$stam#-und-the-clock$$sals#$wana"&rangia%$more##ens$$stee#%ochar$%l/ian$#und$&w-like"$sene',
+    '",t-historians$\'science$$work#!.#$anes#\'emisias$,riosclerotic#%forum#(h-goldau$&ralgia&!y%\'obacter#+iculateness\'!i$+ficialities',
+    '$&sanate%)t-centred\'+philosopher&.s-in-residence#$line#\'ocarpus$!n#%world#(y-crafty"$unta#\'tyunyan"%vense#(icanthis"#wen""ye',
+    '"".5""90"-_,_as_long_as($well#"in""ab"%brink"&carids#)ensionist##ham#!i")eptically"&h-blue#6church/gloucestershire##don',
+    '#%isuto##lea%%worth#+more/oxford#$tead#%ville##win""iz"$kett"%lonov##und"$n102#"53"#p84#\'arukhov',
+    '#\'inwalls#!s##ull")quithians"%satis#2embly/sub-assembly$&rtoric$+t-strippers%*/liability%-s/liabilities#%iette$&gnfunc$+milationism$!n$)sted-area',
+    '#!u")taggering$#kos#&raspis$\'ingents$\'ocaryum%-nomer-priests\'#tus#&urians!,t&amp;t-free($/ncr"+-compatible"#asi"\'cc33909#!h',
+    '"(helstane*$ford$$rmal#%ribis"$illa#"on"+kins/tenant"#ley",mosphereless"\'omicity%#zer"+p-dependent"(rorubens"%taboy$$cks.',
+    '%&dance.%%uable\'%tions#+itude/power\'&inists#,orney-at-law#(ritional#%tgcat"&urkish!$ubel$"rs")chenbowie&\'oglanis#\'toritas"*dio.visual',
+    '%)cassettes$!s##lem"(fschwung"%g/sep#\'hnacloy#"ie#%uries$*st-october&$ines"!m"*richalcite"0schwitz-birkenau#"er#.stellungshalle',
+    '$\'railian%$inus"\'teurist#.hor&mdash;date&*-dominated&&/title&%ially\'#tes(#ive&$less#,o-assessment%\'defrost%&erotic%$helm%)infection',
+    '$&nomies(#sts$*radiograms%%outes$\'sampler%$pade$/transplantation"%xence##ins!%v4100")ailablity#&scular"$eley##nir#)rage-size',
+    '".iation-related#&culare#(din-fitc#%fauna"#och#%ided.&"rs$\'rdupois#\'n-based"(unculate!$wadi#&y-days"$eigh#"ll!\'xbridge',
+    '#$head##men"$illa!&yaydin"$gill"#ios"\'lestone#"lu"-mara-speaking"!n"&shford"&tmatov!%zania#!t".c&aacute;rraga',
+    '#$vedo"$ikwe##mov"!o#)spirillum#(tobacter$"us#)xymethane"&ulejos#\'re-blue&&winged$\'ophilic "b%!)&amacr;ra$#p;r',
+    '(+;b&eacute;s)#nin#3grave;gles-bordeaux"*iacute;lek"\'mdash;4"\'ndash;c"%sharp"(uuml;hne\'*rgerschaft!&*****d"%st*rd!&+-tree!"-b##ack$!d',
+    '"!f#$ifty"+lymphocytes")u-t-t-o-n!".4"$d.m."&e.m.u."$litt&!."&o.a.c."$s.i.""w.!+/00/23/2053*"70"&a&gt;1',
+    '!$1249!#205!"53""n2!$6255$!9!#742#!7!+a&ntilde;os".-ba-bomp-ba-ba"!1"!3"#71v",ader-meinhof#&thists',
+    '$%lings#)e-in-arms$!e#$ies.$"uc#%y/4xx$$gros$$like$%russa""ca##had#%iccio#+k-catalogue%%drops%$four',
+    '%\'handers%%inlet%$page\'"in\'$sses$":a%#the$&burner$$ford$\'markers$#nut$\'payment%$edal$-s-to-the-wall%\'lidings',
+    '$-ward-pointing#(teraemia&(iostatic$%rians"\'d-taste#%achro$&mhaamb#$bury#&desley#$eric#&finger#%mouth"\'gabandi#)gage-room$#ott',
+    '$$etti#"ni#"ot$#ush#\'shawism"6h&aacute\'u\'ll&aacute;h#"oh"\'illiary#(nbridges#)t-diggers$!z"$jpai#"wa"%kalov##win',
+    '%%ovski$\'singham#$boni#+dersdalians$&onnell$#ric#(efulness$%share#"in$#sta#&kenhol$$hash#)l-breaker%$nuts%&shaped',
+    '$)ad-singer%#rat$&entine$&ieston%(ndalloch&*ger/senior$#one%)on-travel$%s-ups$$ybay%(gomartin%)hackamore%)macadoyle%&sillan%$ward',
+    '#$sall%$wood$#don#\'tasound#$yana"#mh1"+nana-shaped&"s.$$rasi%#dos#"ce$"ks#(d-leader$%annas$\'erillas',
+    '$&oliers#"es#%goura#(k-backed%%owned$!a$$burn$\'ed-down\'"up$%shead#%lieue#"na#%terle#!w"%obabs',
+    '#&uerizo"(r-charts%$odes\'#ing$&lounge$%tabac#%abash$\'gwanath$*runyeretse#)barically\'#sms&"us$#ets#*cel&oacute&!o',
+    '#&dister$&olatry%"ts#*e-branched%(knuckled$$feet$$scut#$gees%#man$#oed#$illi$"sh##kes$#way#$laes',
+    '#"ma#&n.k.b.$.acle-encrusted%#dos$"ea%)s/banbury\'*kidlington\'%paris\')woodstock%-tt/hay-on-wye(*tewkesbury$%sgate#$occa$&reflex$!u',
+    '$(ack-like%$ndov$%inger%+ster-at-law%"tt$%owden#"s.$$taff#%thian%$olin$"ol%-n-upon-humber$#rip#%untse#%yonic',
+    '"#sco#&e-camp%%pairs&#oor$&boards#%hevis#%ileus$\'sternum#)ket-cases\'&makers\'\'weaving&"ry##low#\'s-lines$&eterre',
+    '&#ger$%leton$*o_profundo#"tu"%t-poo$&winged#$band#(h-houses%$time&#ubs$&houses$%room/)"wc##iks$"ng',
+    '#$tels%#urs$+le-cruisers\'\'winning&\'cruiser&$sden&!y&$zone$"os$*rick-jones$\'y-esque#!u"*udelairean#$nton#!s',
+    '#(z&aacute"+varia-based"\'xandall"%yford#%nards##ous"#zas!"b."!4""c.#!s"!g"!h"&lingen!%c109c',
+    '"!h!"d3!+e&ccaron;ov"!\'"0-all-and-end-all#(ribboned"\'achball%%croft%$land#&d-like$&leston$$nell#"my#&n-bags#(r-hugged',
+    '%!o%%smore$#hug$$sted#)t-\'em-ups%$card%\'to-beat$!i$$tock#\'udesert$&grande$*mont-hamel$!s$\'ticians#!v',
+    '""bb#!c".cause/although#&hstein#&kerley%#tts$&indale$%stadt#$tive"0d-and-breakfasts$$bugs$&jacket$$mate$\'wetters#!d',
+    '$\'villing#$font#\'hampton$$eads#$rail##wyn"\'e-hives$\'keepers$$like#$nbeg#%p=yes#(r-crates%(drinkers$#can#)thovenian',
+    '""fo#(rienders#)uddlement"2gbroke/oxfordshire#&etters##lin"%half.$(viourial"&jaysus"!k##a\'a#"ir"*l&eacute;m#%anger$#yer',
+    '$"oo#%dames##gic$*rade-based%#ove#%iaire$)evability&#ism$%zaire#$knap#*l-founders$)amy/revis$&e-isle%$rsis%%trist',
+    '$$push$%ville$$ying#%oveds#"ud $ilam',
 )
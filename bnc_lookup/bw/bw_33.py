@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_33 = (
+count_33 = 6694
+
+heads_33 = (
     '%/day',
-    '&acirc;ge',
-    '&agr/&bgr',
-    '&agr;-c',
-    '&agr;-cd',
-    '&agr;-interferon',
-    '&agr;-peptide',
-    '&agr;-tocopherol:total',
-    '&agr;5&bgr;1',
-    '&amp&dollar;1',
-    '&amp;alpha',
-    '&amp;cement',
-    '&amp;chandon',
-    '&amp;coogan',
-    '&amp;formula',
-    '&amp;gamble',
     '&amp;kilkenny',
-    '&amp;l/2',
-    '&amp;read',
-    '&amp;son',
-    '&amp;sup2',
-    '&amp;young',
-    '&amp;yurewicz',
-    '&bgr&ggr;-',
-    '&bgr&gt&ggr',
-    '&bgr;-glucuronidase',
-    '&bgr;-haemolytic',
-    '&bgr;-relaxation',
-    '&bgr;2-microglobulin',
-    '&bgr;blockers',
-    '&bsol;dfss',
-    '&bsol;dos&bsol;emm386.exe',
     '&bsol;dos&bsol;himem.sys',
-    '&bull;pietro',
-    '&ccaron;ertovka',
-    '&commat;fv',
-    '&copy;1980',
-    '&dgr;1',
-    '&dgr;73',
-    '&dgr;d',
-    '&dgr;j',
-    '&dgr;n&sim',
-    '&dgr;v',
-    '&dgr_',
-    '&divide;2',
-    '&dollar;0.0001',
-    '&dollar;0.5',
-    '&dollar;0.56',
     '&dollar;0.59',
-    '&dollar;0.625',
-    '&dollar;0.65',
-    '&dollar;0.70',
-    '&dollar;0.7m',
-    '&dollar;0.85',
-    '&dollar;0.92',
-    '&dollar;1,231',
-    '&dollar;1,295',
-    '&dollar;1,995',
-    '&dollar;1.16',
-    '&dollar;1.2&ndash;1.6',
-    '&dollar;1.27',
-    '&dollar;1.30',
-    '&dollar;1.34',
-    '&dollar;1.38',
     '&dollar;1.3bn',
-    '&dollar;1.62',
-    '&dollar;1.65',
-    '&dollar;1.6bn',
-    '&dollar;1.89',
-    '&dollar;1.97',
-    '&dollar;10,200',
-    '&dollar;10,700',
-    '&dollar;10.4',
-    '&dollar;10.4m',
-    '&dollar;10.9m',
-    '&dollar;100.2m',
-    '&dollar;100bn',
-    '&dollar;103',
-    '&dollar;104.8m',
-    '&dollar;108',
     '&dollar;11.0m',
-    '&dollar;11.5',
-    '&dollar;112m',
-    '&dollar;114',
-    '&dollar;115,000',
-    '&dollar;116m',
-    '&dollar;12,000,000',
-    '&dollar;12,700',
-    '&dollar;12.1',
-    '&dollar;12.4m',
-    '&dollar;12.8',
-    '&dollar;12.8m',
-    '&dollar;12.95',
-    '&dollar;12.9m',
-    '&dollar;120,000&ndash;180,000',
-    '&dollar;120.2m',
     '&dollar;121,000',
-    '&dollar;122m',
-    '&dollar;125&ndash;160,000',
-    '&dollar;125&ndash;175,000',
-    '&dollar;125,000,000',
-    '&dollar;126.2m',
-    '&dollar;128,000',
-    '&dollar;12billion',
-    '&dollar;134,000',
-    '&dollar;135m',
-    '&dollar;136',
-    '&dollar;138',
-    '&dollar;139.2m',
-    '&dollar;140&ndash;210,000',
-    '&dollar;140,000,000',
-    '&dollar;142m',
     '&dollar;143,000',
-    '&dollar;143m',
-    '&dollar;144,000',
-    '&dollar;15&ndash;25,000',
-    '&dollar;15,000&ndash;20,000',
-    '&dollar;15,000m',
-    '&dollar;15,700',
-    '&dollar;15.2',
-    '&dollar;15.3',
-    '&dollar;15.4m',
-    '&dollar;15.7m',
-    '&dollar;150,000&ndash;250,000',
-    '&dollar;155m',
-    '&dollar;157',
-    '&dollar;158m',
-    '&dollar;16,300',
     '&dollar;16,700',
-    '&dollar;16.5',
-    '&dollar;166',
-    '&dollar;168',
-    '&dollar;168,000',
-    '&dollar;169m',
-    '&dollar;17,800',
-    '&dollar;17.9m',
-    '&dollar;172,000',
-    '&dollar;175&ndash;265,000',
-    '&dollar;18,000,000',
-    '&dollar;18.1m',
-    '&dollar;18.4m',
-    '&dollar;18.6m',
-    '&dollar;180m',
-    '&dollar;186,000',
     '&dollar;188m',
-    '&dollar;19.6m',
-    '&dollar;190',
-    '&dollar;190m',
-    '&dollar;191m',
-    '&dollar;196',
-    '&dollar;2,250',
-    '&dollar;2,350',
-    '&dollar;2,500,000',
-    '&dollar;2,600m',
-    '&dollar;2,800,000',
-    '&dollar;2.10',
-    '&dollar;2.25',
-    '&dollar;2.40',
-    '&dollar;2.97',
-    '&dollar;20,700',
     '&dollar;20.9m',
-    '&dollar;203,000,000',
-    '&dollar;206m',
-    '&dollar;207',
-    '&dollar;21.9m',
-    '&dollar;210m',
-    '&dollar;215m',
-    '&dollar;21m',
-    '&dollar;22.50',
-    '&dollar;22.5m',
-    '&dollar;229,000',
-    '&dollar;23,500',
-    '&dollar;23.1m',
-    '&dollar;23.4m',
-    '&dollar;23.5m',
-    '&dollar;23.6m',
     '&dollar;23.7m',
-    '&dollar;23.8m',
-    '&dollar;231',
-    '&dollar;233,000',
-    '&dollar;24.4m',
-    '&dollar;24.95',
-    '&dollar;240,000,000',
-    '&dollar;248,000',
-    '&dollar;25,000m',
-    '&dollar;25,500',
-    '&dollar;250&ndash;350,000',
-    '&dollar;250.',
-    '&dollar;256,000',
-    '&dollar;26,000,000',
-    '&dollar;268m',
-    '&dollar;27,000,000',
     '&dollar;27.3m',
-    '&dollar;27.4m',
-    '&dollar;27.5m',
-    '&dollar;27.7m',
-    '&dollar;275,000',
-    '&dollar;279m',
-    '&dollar;28.3m',
-    '&dollar;282.1m',
-    '&dollar;29.0m',
-    '&dollar;29.3m',
-    '&dollar;290',
-    '&dollar;290,000',
-    '&dollar;295m',
-    '&dollar;3,300m',
-    '&dollar;3,400m',
-    '&dollar;3,450',
     '&dollar;3,790',
-    '&dollar;3,900',
-    '&dollar;3,995',
-    '&dollar;3.00',
-    '&dollar;3.0m',
-    '&dollar;3.125',
-    '&dollar;3.25',
-    '&dollar;3.3',
-    '&dollar;3.30',
-    '&dollar;3.7',
-    '&dollar;30,000m',
-    '&dollar;30.2m',
-    '&dollar;30.5m',
-    '&dollar;30.6m',
-    '&dollar;300&ndash;500,000',
-    '&dollar;300,000&ndash;400,000',
     '&dollar;300,000&ndash;500,000',
-    '&dollar;31.9m',
-    '&dollar;310,000',
-    '&dollar;310,700',
-    '&dollar;325',
-    '&dollar;325,000',
-    '&dollar;327',
-    '&dollar;33.5m',
-    '&dollar;330m',
-    '&dollar;338,000',
-    '&dollar;34,000,000',
-    '&dollar;34.9m',
-    '&dollar;340',
-    '&dollar;35.5m',
-    '&dollar;350&ndash;450,000',
-    '&dollar;36.3m',
     '&dollar;36.8m',
-    '&dollar;360m',
-    '&dollar;367m',
-    '&dollar;37',
-    '&dollar;37,500',
-    '&dollar;37.3m',
-    '&dollar;37.5m',
-    '&dollar;37.8m',
-    '&dollar;370,000',
-    '&dollar;377m',
-    '&dollar;38,000,000',
-    '&dollar;38,500',
-    '&dollar;39,000',
-    '&dollar;39.1m',
-    '&dollar;4&ndash;6,000',
-    '&dollar;4,000,000',
     '&dollar;4,600',
-    '&dollar;4.50',
-    '&dollar;4.7',
-    '&dollar;406m',
-    '&dollar;41',
-    '&dollar;41,100',
-    '&dollar;41,400',
-    '&dollar;425m',
-    '&dollar;430,000',
-    '&dollar;430m',
-    '&dollar;434,000',
-    '&dollar;440,000',
-    '&dollar;45,000,000',
-    '&dollar;4500',
-    '&dollar;46.2m',
-    '&dollar;46.9m',
     '&dollar;47,500',
-    '&dollar;47.9m',
-    '&dollar;474,000',
-    '&dollar;47m',
-    '&dollar;48.6m',
-    '&dollar;485m',
-    '&dollar;49,500',
-    '&dollar;49.50',
-    '&dollar;5,400',
-    '&dollar;5,500,000',
-    '&dollar;5.00',
-    '&dollar;5.2',
-    '&dollar;5.6',
-    '&dollar;5.9',
-    '&dollar;500million',
-    '&dollar;51.1m',
     '&dollar;51.3m',
-    '&dollar;51.7m',
-    '&dollar;512,000',
-    '&dollar;52',
-    '&dollar;521m',
-    '&dollar;528,000',
-    '&dollar;53,000',
-    '&dollar;530&ndash;900,000',
-    '&dollar;54',
-    '&dollar;54.3m',
-    '&dollar;54.8m',
-    '&dollar;55,000,000',
-    '&dollar;55.7m',
-    '&dollar;550&ndash;900,000',
-    '&dollar;56,000',
-    '&dollar;56.1m',
     '&dollar;562m',
-    '&dollar;573,000',
-    '&dollar;58.0m',
-    '&dollar;595',
-    '&dollar;5billion',
-    '&dollar;5bn',
-    '&dollar;6,200',
-    '&dollar;6,500,000',
-    '&dollar;6,800',
-    '&dollar;6.7',
-    '&dollar;6.9m',
-    '&dollar;61.4m',
-    '&dollar;61.5m',
-    '&dollar;62,500',
-    '&dollar;625',
-    '&dollar;64.4m',
     '&dollar;65,000',
-    '&dollar;65,436',
-    '&dollar;65.2m',
-    '&dollar;68',
-    '&dollar;69,000',
-    '&dollar;69m',
-    '&dollar;7,000,000',
-    '&dollar;7,300',
-    '&dollar;7,800',
-    '&dollar;7.2',
-    '&dollar;7.8',
-    '&dollar;7.95',
-    '&dollar;70,000,000',
-    '&dollar;71',
-    '&dollar;713,000',
-    '&dollar;72',
     '&dollar;74',
-    '&dollar;74,000',
-    '&dollar;77',
-    '&dollar;780',
-    '&dollar;780m',
-    '&dollar;8,000,000',
-    '&dollar;8,400',
-    '&dollar;8,800',
-    '&dollar;8,900',
-    '&dollar;8.0m',
-    '&dollar;8.4m',
-    '&dollar;8.95',
-    '&dollar;80-million',
-    '&dollar;80.5m',
-    '&dollar;82.5',
-    '&dollar;825,000',
     '&dollar;84,000,000',
-    '&dollar;846,000',
-    '&dollar;85,000,000',
-    '&dollar;880,000',
-    '&dollar;88m',
-    '&dollar;89',
-    '&dollar;8bn',
-    '&dollar;9,540m',
-    '&dollar;9.95',
-    '&dollar;90&ndash;120,000',
-    '&dollar;90&ndash;125,000',
-    '&dollar;900,000&ndash;1.2',
-    '&dollar;91m',
-    '&dollar;950',
-    '&dollar;960,000',
-    '&dollar;b',
     '&dollar;us',
-    '&dollar;xxx',
-    '&eacute;clat',
-    '&eacute;crit',
-    '&eacute;douard',
-    '&eacute;t&eacute',
-    '&eacute;tude',
-    '&ecirc;tes',
-    '&formula&ins',
-    '&formula;s',
-    '&formula;ths',
-    '&formula;x',
-    '&frac12;mile',
-    '&frac14%',
-    '&frac14;oz',
-    '&frac14;tsp',
     '&frac58',
-    '&ggr;-rays',
-    '&gt&gt',
-    '&gt;0',
-    '&gt;10&deg;c',
-    '&gt;100',
-    '&gt;130%ibw',
-    '&gt;15',
-    '&gt;20',
-    '&gt;40',
-    '&gt;50',
-    '&gt;or=',
-    '&lt+-&gt',
-    '&lt;0.001',
-    '&lt;100',
-    '&lt;120',
     '&lt;15',
-    '&lt;2.4&ndash;25',
-    '&lt;2.4&ndash;52',
-    '&lt;20%',
-    '&lt;3%',
-    '&lt;6',
-    '&lt;8',
-    '&lt;filename&gt',
-    '&lt;he&gt',
-    '&lt;name',
-    '&lt;nine',
-    '&lt;shift&gt/&lt;escape&gt',
-    '&lt;sigh&gt',
-    '&lt;text&gt',
-    '&lt;the',
-    '&lt;var',
     '&mdash&mdash&mdash',
-    '&mdash;114',
-    '&mdash;238',
-    '&mdash;82',
-    '&mdash;after',
-    '&mdash;ed',
-    '&mdash;his',
-    '&mdash;ibid',
-    '&mdash;members',
-    '&mdash;mipmip.',
-    '&mdash;only',
-    '&mdash;some',
-    '&mdash;there',
-    '&mdash;they',
-    '&mdash;two',
-    '&mdash;where',
     '&micro;f',
-    '&micro;g/&micro;l',
-    '&micro;g/100',
-    '&micro;mol/30',
-    '&micro;mol/l/l',
-    '&ndash;5.30',
-    '&ndash;n&ndash',
-    '&ndash;or',
-    '&plus;0.144',
-    '&plusmn;5',
-    '&pound&frac14;m',
-    '&pound&frac34;m',
-    '&pound+34.99',
-    '&pound;0.12',
-    '&pound;0.5bn',
-    '&pound;0.9',
     '&pound;0.9m',
-    '&pound;000',
-    '&pound;1,010',
-    '&pound;1,011',
-    '&pound;1,035',
-    '&pound;1,060',
-    '&pound;1,090',
-    '&pound;1,115',
-    '&pound;1,120',
-    '&pound;1,180',
-    '&pound;1,200,000',
-    '&pound;1,220',
-    '&pound;1,240',
-    '&pound;1,250,000',
-    '&pound;1,318',
-    '&pound;1,331m',
     '&pound;1,360',
-    '&pound;1,378,892',
-    '&pound;1,406',
-    '&pound;1,420',
-    '&pound;1,425',
-    '&pound;1,459m',
-    '&pound;1,480',
-    '&pound;1,500-&pound;2,000',
-    '&pound;1,525',
-    '&pound;1,570',
-    '&pound;1,675',
-    '&pound;1,690',
-    '&pound;1,700,000',
-    '&pound;1,784',
-    '&pound;1,795',
-    '&pound;1,991',
     '&pound;1,995',
-    '&pound;1.03bn',
-    '&pound;1.08',
-    '&pound;1.13',
-    '&pound;1.14',
-    '&pound;1.17',
-    '&pound;1.17m',
-    '&pound;1.23m',
-    '&pound;1.24m',
-    '&pound;1.2million',
-    '&pound;1.34',
-    '&pound;1.43',
-    '&pound;1.46',
-    '&pound;1.5&ndash;2',
-    '&pound;1.5&ndash;2.5',
-    '&pound;1.72',
     '&pound;1.76',
-    '&pound;1.87',
-    '&pound;1.94',
-    '&pound;1.96',
-    '&pound;10&frac12;m',
-    '&pound;10,000&ndash;15,000',
-    '&pound;10-&pound;19',
-    '&pound;10.20',
-    '&pound;10.6m',
-    '&pound;10.7',
-    '&pound;10.73',
-    '&pound;10.80',
-    '&pound;10.8m',
-    '&pound;10.9m',
-    '&pound;100&ndash;200',
-    '&pound;100,000-rated',
     '&pound;100.7m',
-    '&pound;1000m',
-    '&pound;101.4m',
-    '&pound;101m',
-    '&pound;102.3m',
-    '&pound;102.5m',
-    '&pound;103,000',
-    '&pound;103m',
-    '&pound;105.2m',
-    '&pound;105.8',
-    '&pound;106.50',
-    '&pound;108,000',
-    '&pound;109.70',
-    '&pound;10k',
-    '&pound;10m.',
-    '&pound;11,040',
     '&pound;11,800',
-    '&pound;11,900',
-    '&pound;11.19',
-    '&pound;11.45',
-    '&pound;11.6',
-    '&pound;11.8m',
-    '&pound;11.9',
-    '&pound;111.2m',
-    '&pound;111m',
-    '&pound;112.4',
-    '&pound;112.55',
-    '&pound;112.7m',
-    '&pound;112m',
-    '&pound;113,000',
-    '&pound;114,957',
-    '&pound;115m',
     '&pound;116,000',
-    '&pound;12&ndash;18,000',
-    '&pound;12,000,000',
-    '&pound;12.1m',
-    '&pound;12.3',
-    '&pound;12.45',
-    '&pound;12.6m',
-    '&pound;12.9',
-    '&pound;120&ndash;150,000',
-    '&pound;120.00',
-    '&pound;120million',
-    '&pound;121m',
-    '&pound;122.4m',
-    '&pound;124,000',
-    '&pound;124.20',
-    '&pound;129.99',
     '&pound;1295',
-    '&pound;13,200',
-    '&pound;13,400',
-    '&pound;13.2',
-    '&pound;13.20',
-    '&pound;13.45',
-    '&pound;13.47',
-    '&pound;13.49',
-    '&pound;13.8',
-    '&pound;13.8m',
-    '&pound;132,000',
-    '&pound;132.6',
-    '&pound;132m',
-    '&pound;133m',
-    '&pound;134m',
-    '&pound;136,000',
     '&pound;13billion',
-    '&pound;14,99',
-    '&pound;14.2m',
-    '&pound;14.4m',
-    '&pound;14.7',
-    '&pound;14.75',
-    '&pound;14.7m',
-    '&pound;14.90',
-    '&pound;140.85',
-    '&pound;142,000',
-    '&pound;144,000',
-    '&pound;144m',
-    '&pound;1450',
-    '&pound;145m',
-    '&pound;148,000',
-    '&pound;148.62',
     '&pound;149.95',
-    '&pound;15,000&ndash;25,000',
-    '&pound;15,000-&pound;20,000',
-    '&pound;15.2',
-    '&pound;15.2m',
-    '&pound;15.4',
-    '&pound;15.54',
-    '&pound;15.6',
-    '&pound;15.6m',
-    '&pound;15.8',
-    '&pound;15.8m',
-    '&pound;15.9',
-    '&pound;150,000&ndash;250,000',
-    '&pound;150.',
-    '&pound;151',
-    '&pound;151m',
     '&pound;155m',
-    '&pound;156,000',
-    '&pound;156,780',
-    '&pound;156m',
-    '&pound;158,000',
-    '&pound;158m',
-    '&pound;159.99',
-    '&pound;16,192',
-    '&pound;16.1',
-    '&pound;16.35',
-    '&pound;16.4',
-    '&pound;16.75',
-    '&pound;16.8m',
-    '&pound;166,000&ndash;233,000',
-    '&pound;167,000',
-    '&pound;168m',
     '&pound;17,300',
-    '&pound;17,866',
-    '&pound;17,900',
-    '&pound;17.1',
-    '&pound;17.2',
-    '&pound;17.3m',
-    '&pound;17.60',
-    '&pound;17.8',
-    '&pound;171m',
-    '&pound;173',
-    '&pound;173,000',
-    '&pound;176.24',
-    '&pound;177m',
-    '&pound;178,500',
-    '&pound;18.6m',
-    '&pound;18.8',
     '&pound;18.80',
-    '&pound;180&ndash;250,000',
-    '&pound;1800',
-    '&pound;183m',
-    '&pound;185,000',
-    '&pound;187,500',
-    '&pound;189.5m',
-    '&pound;18million',
-    '&pound;19,200',
-    '&pound;19,500',
-    '&pound;19.4m',
-    '&pound;19.5',
-    '&pound;192m',
-    '&pound;195,000',
-    '&pound;199.5',
-    '&pound;1m-rated',
     '&pound;1o',
-    '&pound;2&frac12;m',
-    '&pound;2,000&ndash;3,000',
-    '&pound;2,265',
-    '&pound;2,280',
-    '&pound;2,465',
-    '&pound;2,500,000',
-    '&pound;2,505',
-    '&pound;2,785',
-    '&pound;2.16',
-    '&pound;2.1bn',
-    '&pound;2.27',
-    '&pound;2.2million',
-    '&pound;2.36',
-    '&pound;2.3bn',
-    '&pound;2.54',
     '&pound;2.66',
-    '&pound;2.71m',
-    '&pound;2.74',
-    '&pound;2.98',
-    '&pound;2.999m',
-    '&pound;20,000-worth',
-    '&pound;20,500',
-    '&pound;20.',
-    '&pound;20.1m',
-    '&pound;20.7m',
-    '&pound;200,000,000',
-    '&pound;20000',
-    '&pound;200bn',
-    '&pound;201',
-    '&pound;202',
-    '&pound;202.3m',
     '&pound;203',
-    '&pound;207,000',
-    '&pound;20billion',
-    '&pound;20k',
-    '&pound;21.2',
-    '&pound;21.4',
-    '&pound;213,000',
-    '&pound;217m',
-    '&pound;218,000',
-    '&pound;219m',
-    '&pound;221,000',
-    '&pound;222',
-    '&pound;23.5m',
-    '&pound;23.7m',
-    '&pound;230.8m',
-    '&pound;233',
     '&pound;234',
-    '&pound;238,000',
-    '&pound;239,000',
-    '&pound;24.42',
-    '&pound;24.5',
-    '&pound;241',
-    '&pound;243',
-    '&pound;244',
-    '&pound;245,000',
-    '&pound;246',
-    '&pound;247',
-    '&pound;249,000',
-    '&pound;249m',
-    '&pound;25&ndash;40,000',
-    '&pound;25.0',
-    '&pound;25.5',
     '&pound;250&ndash;350,000',
-    '&pound;250,000,000',
-    '&pound;250.',
-    'macro-scale',
-    'macrofossil',
-    'macronutrients',
-    'macrosomic',
-    'macve',
-    'madaba',
-    'madar',
-    'madec',
-    'madelaine',
-    'mader',
-    'maderia',
-    'madnes',
-    'madocks',
     'madras-based',
-    'maesdu',
-    'mafdal',
-    'mag-lev',
-    'magamar',
-    'magasin',
-    'magb',
-    'magen',
-    'magennis',
-    'maginess',
-    'magnetising',
-    'magnetizing',
-    'magnetometery',
-    'magnetostatics',
-    'mahomed',
-    'maiestie',
     'maillist',
-    'mailtool',
-    'main-sequence',
-    'main-stream',
-    'mainau',
-    'mainie',
-    'mainlander',
-    'mainspars',
-    'mainwheels',
-    'maislova',
-    'maitlin',
-    'maitri',
-    'maizl',
-    'majeurs',
-    'major-label',
-    'majority-rule',
     'majumber',
-    'makassarese',
-    'maken',
-    'makerere',
-    'makower',
-    'maksymiuk',
-    'mal.',
-    'malacanang',
-    'malai-land',
-    'malamocco',
-    'malaprop',
-    'malbon',
-    'maldoom',
-    'male-',
-    'male-associated',
-    'male-male',
     'male-to-male',
-    'malendoma',
-    'malika',
-    'malkekv&aelig;g',
-    'malouf',
-    'malpiero',
-    'malplaquet',
-    'malt&eacute;zsk&eacute',
-    'malteser',
-    'malvasia',
-    'maly',
-    'mamani',
-    'mamatoto',
-    'mameluk',
-    'mammi',
-    'mamyrin',
     'man-child',
-    'man-hour',
-    'man-hunt',
-    'man-killer',
-    'man-marking',
-    'man-on-the-spot',
-    'manacor',
-    'managing-director',
-    'mand&eacute',
-    'mandatio',
-    'mandl',
-    'mandoline',
-    'manessier',
-    'maneuvers',
-    'mangochi',
-    'mangotsfield',
     'mangu',
-    'manichaeanism',
-    'manichee',
-    'manlius',
-    'mannikins',
-    'mannino',
-    'manoeuvere',
-    'manoplax',
-    'manova',
-    'mansfeld',
-    'mansholt',
-    'mansis',
-    'mansoni',
-    'mansoor',
-    'mansus',
-    'mantero',
     'mantinea',
-    'mantrap',
-    'mantzouranis',
-    'manush',
-    'manwatching',
-    'manz&ugrave',
-    'manzur',
-    'maplewood',
-    'maqarin',
-    'marah',
-    'marani',
-    'maras',
-    'marasli',
-    'marauded',
-    'marauke',
-    'marbel',
     'marble-white',
-    'marbletex',
-    'march&eacute;s',
-    'march-3',
-    'marchfeld',
-    'marchin\'',
-    'marcian',
-    'marescalchi',
-    'marga',
-    'margerie',
-    'marguess',
-    'maricourt',
-    'mariel',
-    'mariko',
-    'marios',
-    'mariscotti',
     'marish',
-    'marjorams',
-    'marka',
-    'markab',
-    'markandey',
-    'marker-pen',
-    'market-house',
-    'market-sharing',
-    'market-style',
-    'markiz',
-    'marktplatz',
-    'marmeliuc',
-    'marnoch',
-    'marnock',
-    'maroveus',
-    'marriage-breaker',
     'marsdon',
-    'marsett',
-    'marshallian',
-    'martela',
-    'martika',
-    'martikainen',
-    'marut',
-    'marwell',
-    'marwnad',
-    'mas\'ud',
-    'masaharu',
-    'mascagni',
-    'maschler',
-    'mashaallah',
-    'mashona',
-    'mashonaland',
     'mashru',
-    'masinde',
-    'masker',
-    'masonite',
-    'mass-density',
-    'mass-marketing',
-    'mass-murder',
-    'mass-spectrometry',
-    'massah',
-    'massaro',
-    'masscomp',
-    'massenet',
-    'massimiliano',
-    'master-apprentice',
-    'master-manufacturer',
-    'master-tape',
     'mastercolour',
-    'masterline',
-    'masticate',
-    'masticating',
-    'mastrovin',
-    'matamoros',
-    'mataura',
-    'match-by-match',
-    'match-clinching',
-    'match-fitness',
-    'match-up',
-    'matete',
-    'matifsa',
-    'matsuo',
-    'matten',
-    'matter-of-factness',
     'mattessons',
-    'matthies',
-    'matthiola',
-    'mattole',
-    'matur',
-    'maturation-promoting',
-    'maucher',
-    'maudit',
-    'mauritanie',
-    'mauve-pink',
-    'mavala',
-    'maxat',
-    'maxoptix',
-    'maxxam',
-    'mayak',
-    'maybank',
     'maybellome',
-    'mayorazgos',
-    'mayoresses',
-    'maytals',
-    'mayumba',
-    'mazie',
-    'mbaye',
-    'mbeya',
-    'mbh',
-    'mck',
-    'mclennon',
-    'mcui',
-    'md-11',
-    'mdo',
-    'meac',
-    'meadow-grass',
     'meaghaidh',
-    'meant-nn',
-    'meanz',
-    'meatfork',
-    'mecoptera',
-    'medalark',
-    'medaus',
-    'medders',
-    'medgyessy',
-    'media-related',
-    'medical-school',
-    'medicalization',
-    'medicatrix',
-    'medieval-style',
-    'medii',
-    'medinet',
     'medios',
-    'medised',
-    'medium-length',
-    'medium-rise',
-    'mediwipe',
-    'medoune',
-    'medtner',
-    'mefs',
-    'mega-buck',
-    'mega-success',
-    'megadrives',
-    'meganisi',
-    'meggie',
-    'megs',
-    'mehtab',
-    'meibion',
     'meigen',
-    'meilhan',
-    'meilleur',
-    'meirwon',
-    'meisterstuck',
-    'melamed',
-    'melanins',
-    'melchet',
-    'meldy',
-    'melle',
-    'mellet',
-    'mellifica',
-    'melloy',
-    'mellte',
-    'melluish',
-    'melnik',
     'melodie',
-    'melodye',
-    'melwood',
-    'mely',
-    'memons',
-    'memory-chip',
-    'men-midwives',
-    'mendl',
-    'mendus',
-    'mene',
-    'mentored',
-    'menumaster',
-    'meo&ntilde;o',
-    'meprobamate',
-    'meraklon',
-    'mercadante',
     'mercury-free',
-    'merita',
-    'merk',
-    'merlan',
-    'merlewood',
-    'merrylee',
-    'merseybeat',
-    'merseyside-based',
-    'meselson',
-    'meshiai',
-    'mesnil',
-    'message-passing',
-    'messerschmitt-bolkow-blohm',
-    'messor',
-    'messuages',
-    'meswa',
     'meta-ethics',
-    'metaflow',
-    'metal-binding',
-    'metal-metal',
-    'metal-using',
-    'metaliterary',
-    'metalizer',
-    'metanarrative',
-    'metaphysicals',
-    'metelli',
-    'meteo',
-    'meterological',
-    'methodolgy',
-    'methodplan',
-    'metn',
-    'metre-gauge',
     'metro&ndash;cammell',
-    'metrobus',
-    'metrotect',
-    'metson',
-    'mezzadri',
-    'mg-calcite',
-    'mhidas',
-    'mibenge',
-    'micha',
-    'michelene',
-    'michon',
-    'mickel',
-    'micro-kernel-based',
-    'micro-mosaic',
-    'micro-to-mainframe',
-    'microcadam',
     'microcircuits',
-    'microfiches',
-    'microfilament',
-    'micrographics',
-    'micronema',
-    'micronet',
-    'microref',
-    'microworlds',
-    'mid-1640s',
-    'mid-1862',
-    'mid-1945',
-    'mid-1977',
-    'mid-eighteenth-century',
-    'mid-fourteenth-century',
-    'mid-long',
-    'mid-plate',
     'mid-run',
-    'mid-tertiary',
-    'mid-transverse',
-    'mid-twelfth-century',
-    'middl',
-    'middle-classness',
-    'middle-european',
-    'middle-saxon',
-    'middle-to',
-    'middleground',
-    'middlesbro',
-    'middleston',
-    'midfielder-defender',
-    'midh',
-    'midiscan',
-    'midlesbrough',
     'midnight-black',
-    'midrash',
-    'miescher',
-    'mifegyne',
-    'mihailovic',
-    'mikaeloff',
-    'mikailli',
-    'mikardo',
-    'mikhoels',
-    'mikis',
-    'mikonos',
-    'milacron',
-    'milagres',
-    'milagro',
-    'mileposts',
-    'miling',
     'milirems',
-    'milit&auml;rgrenze',
-    'milk-shake',
-    'milk-sop',
-    'milkboy',
-    'milkminder',
-    'milkshakes',
-    'milles',
-    'milligauss',
-    'millikin',
-    'million-seller',
-    'millirems',
-    'millisievert',
-    'millivolt',
-    'millon',
-    'millones',
     'milupa',
-    'mimicke',
-    'mimmo',
-    'mimose',
-    'minc',
-    'mincher',
-    'minchin',
-    'mind-altering',
-    'mind-impulse',
-    'mind-spinning',
-    'mindcrime',
-    'mindel',
-    'mindmaps',
-    'mindsong',
-    'mindwiped',
-    'minett',
     'minho',
-    'mini&egrave;re',
-    'mini-14',
-    'mini-drama',
-    'mini-holidays',
-    'mini-revolution',
-    'miniato',
-    'minibranch',
-    'minilab',
-    'ministries-delegate',
-    'minitex',
-    'minkes',
-    'minnehaha',
-    'minnick',
-    'minoru',
-    'minskoff',
     'minutus',
-    'minyip',
-    'miodrag',
-    'mirabella',
-    'mirage-2000',
-    'miraj',
-    'miramalfi',
-    'miroirs',
-    'mirpur',
-    'mirvs',
-    'mis&egrave;re',
-    'mis-classified',
-    'misarden',
-    'miscarrying',
-    'miscellanea',
-    'misconducted',
     'misconstrues',
-    'miscount',
-    'misdated',
-    'mise-en-sc&egrave;ne',
-    'misees',
-    'misfitting',
-    'misformed',
-    'misgave',
-    'misgives',
-    'mishchifing',
-    'mishcon',
-    'misinform',
-    'misnaming',
-    'misoprostol',
-    'misplaces',
-    'misremembered',
     'missika',
-    'mist-covered',
-    'mista',
-    'mistiming',
-    'mistra',
-    'mistreats',
-    'mistyping',
-    'mithian',
-    'mitomycin-c',
-    'mitrovic',
-    'mittag',
-    'mittelstand',
-    'mivart',
-    'mivvis',
-    'mixed-media',
-    'mixmaster',
     'mizpah',
-    'mizumaki',
-    'mizzen-mast',
-    'mizzi',
-    'mjq',
-    'mlada',
-    'mmmmmm',
-    'mmmph',
-    'mncars',
-    'mnevis',
-    'mnod',
-    'moabitess',
-    'moars',
-    'mobilier',
-    'mobility-impaired',
-    'moche',
     'mock-epic',
-    'mock-stern',
-    'mockbeggar',
-    'mode-splitting',
-    'modecate',
-    'model-maker',
-    'model-turned-actress',
-    'moderno',
-    'modularizing',
-    'moers',
-    'moesia',
-    'mof',
-    'mog',
-    'mogamarat',
-    'moggridge',
-    'moghuls',
     'mohanty',
-    'mohinder',
-    'moion',
-    'moisturized',
-    'mojjo',
-    'mokhehle',
-    'molasse',
-    'moldan',
-    'molde',
-    'molds',
-    'molegrips',
-    'molfetta',
-    'mollinees',
-    'molls',
-    'molluscum',
-    'molody',
     'molonglo',
-    'molscript',
-    'molybdate',
-    'momi',
-    'momigliano',
-    'momis',
-    'momo',
-    'momotara',
-    'mon-oxygenase',
-    'monadology',
-    'monami',
-    'monastero',
-    'monbiot',
-    'monday-morning',
-    'mondes',
-    'mondesir',
     'mondiale',
-    'monetarized',
-    'money-grubber',
-    'money-loser',
-    'moneyglass',
-    'moneymaker',
-    'monimbo',
-    'monisha',
-    'monix',
-    'monofibre',
-    'monophony',
-    'monoplacophora',
-    'monory',
-    'monotonicity',
-    'monpetit',
-    'montagus',
     'montanism',
-    'montbr&eacute',
-    'montcalm',
-    'montecatini',
-    'montelovesco',
-    'montenvers',
-    'monteoliveto',
-    'montepeque',
-    'montero',
-    'montesinos',
-    'montferrand',
-    'monticelli',
-    'montigny',
-    'montmorency',
-    'monto',
-    'montreaux',
     'montroses',
-    'mony',
-    'moocow',
-    'moodswings',
-    'moomin',
-    'moon-faced',
-    'moonfleet',
-    'moonflowers',
-    'moonlighters',
-    'moonwalk',
-    'moorat',
-    'moorclose',
-    'mopani',
-    'moppets',
-    'moralised',
-    'morava',
     'morayhill',
-    'morbis',
-    'morbus',
-    'mordova',
-    'moreens',
-    'moreso',
-    'morgantina',
-    'morkar',
-    'mormonism',
-    'morning-sickness',
-    'morphitis',
-    'morphologie',
-    'morri',
-    'morvah',
-    'morvin',
-    'moshe-rabaan',
     'moskva',
-    'mosman',
-    'mosport',
-    'mosquitia',
-    'moss-grown',
-    'mosskiller',
-    'mostain',
-    'mostow',
-    'motha',
-    'mothe',
-    'mother-ship',
-    'motherfucking',
-    'mothersole',
-    'motor-cycling',
-    'motor-scooter',
-    'motorbiking',
     'motorcoach',
-    'motum',
-    'mougrabi',
-    'mould-board',
-    'mould-breaker',
-    'moulted',
-    'mountain-climbing',
-    'mountainbike',
-    'mountainsport',
-    'mountpax',
-    'moussavou',
-    'moutet',
-    'mouth-blown',
-    'mouth-to-anus',
-    'mouth-to-caecum',
-    'movitex',
     'mowl',
-    'mowry',
-    'mows',
-    'moylan',
-    'moyse',
-    'mozaic',
-    'moziruddin',
-    'mppp',
-    'mqa',
-    'mrsc',
-    'msc-funded',
-    'msd-sms',
-    'mssrs',
-    'mtn',
-    'muayyad',
-    'much-married',
     'mud-built',
-    'muddie',
-    'mudflows',
-    'mugica',
-    'muhajirs',
-    'muhamad',
-    'muhammadiyah',
-    'muhoho',
-    'muire',
-    'mukherjee',
-    'mulazim',
-    'mulcted',
-    'mulhammer',
-    'mulheren',
-    'mulkay',
-    'mullu',
     'mullwharchar',
-    'multi-bank',
-    'multi-business',
-    'multi-clause',
-    'multi-culture',
-    'multi-environment',
-    'multi-grade',
-    'multi-millionairess',
-    'multi-pack',
-    'multi-programming',
-    'multi-roomed',
-    'multi-task',
-    'multi-tenant',
-    'multi-unit',
-    'multigravida',
-    'multilevelled',
     'multiloaded',
-    'multiloads',
-    'multimax',
-    'multipage',
-    'multiple-dig',
-    'multiple-length',
-    'multiple-unit',
-    'multiplexor',
-    'multisectoral',
-    'multivalued',
-    'mummie',
-    'mummifying',
-    'munassar',
-    'muncher',
-    'munchhausen',
-    'mundanity',
     'mundella',
-    'mundemba',
-    'munfichet',
-    'municipio',
-    'munim',
-    'munshi',
-    'munty',
-    'muove',
-    'mura-muras',
-    'muralidaran',
-    'muralist',
-    'murjan',
-    'murnau',
-    'muroc',
-    'murrisk',
-    'muscina',
     'muscle-power',
-    'museen',
-    'musengezi',
-    'music-based',
-    'music-filled',
-    'music-related',
-    'musicall',
-    'musicke',
-    'musmanno',
-    'musorgsky',
-    'mussulman',
-    'musta',
-    'mustonen',
-    'mutang',
-    'mutex',
-    'mutual-fund',
     'mutuall',
-    'muvvers',
-    'muzictech',
-    'mwali',
-    'mwatex',
-    'myceneans',
-    'myln',
-    'myne',
-    'myotis',
-    'myriapods',
-    'myriarchs',
-    'myself\'',
-    'mysis',
-    'mysteron',
-    'mystici',
-    'myung',
     'myurium',
-    'myxobacteria',
-    'n\'pan',
-    'n-3',
-    'n-hexane',
-    'n-tuple',
-    'n.i',
-    'n.n.',
-    'n67',
-    'naaucl',
-    'nabis',
-    'naca',
-    'nachips',
-    'nacionales',
-    'nador',
-    'nadur',
     'nafe',
-    'nafels',
-    'naffi',
-    'nagpur',
-    'naham&aacute;n',
-    'nahapiet',
-    'nahariya',
-    'nail-varnish',
-    'naila',
-    'naile',
-    'naimski',
-    'naini',
-    'naissus',
-    'nakoporon',
-    'nala',
-    'nalc',
     'namatode',
-    'namche',
-    'namco',
-    'name-day',
-    'namenz',
-    'namiki',
-    'namutamba',
-    'nane',
-    'nankeen',
-    'nannini',
-    'nanoamps',
-    'nantgaredig',
-    'nantgarw',
-    'narai',
-    'narana',
-    'naranjo',
     'narcissa',
-    'narco-terrorist',
-    'narcondam',
-    'narendranathan',
-    'narking',
-    'narkomzem',
-    'narrow-chested',
-    'narrow-hipped',
-    'narrowback',
-    'narrowcast',
-    'nasalised',
-    'nasiriya',
-    'nassauer',
-    'nassauers',
-    'nassirou',
-    'natal-based',
     'national-conservative',
-    'national-level',
-    'nationalist-minded',
-    'nationalmuseet',
-    'natufian',
-    'natural-gas',
-    'naturales',
-    'naturall',
-    'naturally-aspirated',
-    'nature-goddess',
-    'naturelle',
-    'nauta',
-    'nautica',
-    'navajos',
-    'navico',
-    'navid',
     'nayas',
-    'nayc',
-    'nazie',
-    'nbips',
-    'ncito',
-    'ncl',
-    'nd4-nd4l',
-    'ndd',
-    'ndebugre',
-    'ndeti',
-    'ndricim',
-    'nea-sponsored',
-    'near-bankruptcy',
-    'near-fore',
-    'near-gale',
-    'nearchos',
     'nearshore',
-    'nebbeling',
-    'nebulan',
-    'nebulosa',
-    'neccessary',
-    'neck-tie',
-    'nectar-feeding',
-    'neda',
-    'nedlloyd',
-    'need-based',
-    'needlers',
-    'needlewomen',
-    'neeta',
-    'neftis',
-    'negativland',
-    'negritude',
     'nehmad',
-    'neico',
-    'neigbouring',
-    'neighboured',
-    'neilman',
-    'nellies',
-    'nemathelminthes',
-    'nenthead',
-    'neo-elitism',
-    'neo-imperialism',
-    'neo-impressionist',
-    'neo-lamarckian',
-    'neo-lamarckism',
-    'neo-pluralist',
-    'neo-romanticism',
-    'neo-romantics',
     'neo-victorian',
-    'neoptolemos',
-    'neotronics',
-    'nequam',
-    'nervewracking',
-    'nespelem',
-    'nessegutten',
-    'nestmates',
-    'netcomm',
-    'netmbx',
-    'netservers',
-    'netzer',
-    'neumarkt',
-    'neuro-science',
-    'neuro-surgeon',
-    'neuroanatomy',
     'neurofibrillary',
-    'neurosphere',
-    'nevah',
-    'nevton',
-    'new\'',
-    'new-formation',
-    'new-issue',
-    'new-type',
-    'newboulds',
-    'newcastleton',
-    'newes',
-    'newfield',
-    'newhart',
-    'newhaven&ndash;dieppe',
-    'newholme',
-    'newly-defined',
     'newly-issued',
-    'newly-unified',
-    'newmill-l',
-    'newpoint',
-    'news-blackout',
-    'newsize',
-    'newss',
-    'nfcc',
-    'nffc',
-    'nfsnet',
-    'nganasans',
-    'ngom',
-    'nhi',
-    'nhis',
-    'niace',
-    'niaid',
     'niaux',
-    'nibelungen',
-    'niblock',
-    'nicandro',
-    'nicarag&uacute;ense',
-    'niccolao',
-    'nicf',
-    'nichts',
-    'nicoban',
-    'nicocheck',
-    'nicollette',
-    'nicolli',
-    'niddry',
-    'nieddu',
-    'nifs',
-    'nig-nog',
     'nigerian-born',
-    'night-beat',
-    'night-bird',
-    'night-clubbing',
-    'night-porter',
-    'night-sky',
-    'nightcaps',
-    'nighthawks',
-    'nignogs',
-    'nihat',
-    'nihonga',
-    'nijgh',
-    'nilon',
-    'nimble-footed',
-    'nimbus-7',
-    'nimco',
     'nimrods',
-    'nimue',
-    'nine-panelled',
-    'nine-piece',
-    'nine-to-fiver',
-    'nine-volume',
-    'ninety-day',
-    'ninety-foot',
-    'ninety-mile',
-    'ninety-two-year-old',
-    'ninjaman',
-    'nintendos',
-    'nirvanas',
-    'nissho',
-    'nitration',
-    'nitrex',
     'nitromorse',
-    'nitrosamines',
-    'niva',
-    'nixa',
-    'nizar',
-    'njiru',
-    'nlba',
-    'nmji',
-    'nnn',
-    'no-choice',
-    'no-compromise',
-    'no-entry',
-    'no-growth',
-    'no-home',
-    'no-mans-land',
-    'no-trumps',
     'no_more',
-    'noassessments',
-    'nobay',
-    'noctorum',
-    'nodar',
-    'noddings',
-    'node-pair',
-    'nodule-mining',
-    'noirieux',
-    'nok',
-    'nollekens',
-    'nomade',
-    'nomail',
-    'nomaphila',
-    'nomekind',
-    'nomis',
     'non&rehy;specialist',
-    'non-abta',
-    'non-achievement',
-    'non-aesthetic',
-    'non-affected',
-    'non-art',
-    'non-asbestos',
-    'non-associated',
-    'non-banking',
-    'non-belief',
-    'non-belligerent',
-    'non-cartesian',
-    'non-celibate',
-    'non-commitment',
-    'non-consenting',
-    'non-constituency',
     'non-constitutional',
-    'non-consultant',
-    'non-copper',
-    'non-copyright',
-    'non-customer',
-    'non-decreasing',
-    'non-defence',
-    'non-dementing',
-    'non-determination',
-    'non-egalitarian',
-    'non-employment',
-    'non-established',
-    'non-expressing',
-    'non-fee-paying',
-    'non-graphic',
-    'non-health',
     'non-hegemon',
-    'non-heir',
-    'non-household',
-    'non-humanitarian',
-    'non-icl',
-    'non-identification',
-    'non-interventionism',
-    'non-language',
-    'non-liability',
-    'non-liquid',
-    'non-mastery',
-    'non-musician',
-    'non-narrative',
-    'non-nato',
-    'non-net',
-    'non-nursing',
     'non-occupier',
-    'non-peasant',
-    'non-penetrant',
-    'non-peptide',
-    'non-pilot',
-    'non-practice',
-    'non-producing',
-    'non-project',
-    'non-reader',
-    'non-realization',
-    'non-redundancy',
-    'non-reflex',
-    'non-rem',
-    'non-restriction',
-    'non-revenue',
-    'non-rusting',
     'non-salary',
-    'non-satisfaction',
-    'non-segregation',
-    'non-sequitur',
-    'non-shrink',
-    'non-slav',
-    'non-sna',
-    'non-sovereign',
-    'non-space',
-    'non-sparc',
-    'non-standardization',
-    'non-statemented',
-    'non-stoichiometry',
-    'non-stranger',
-    'non-submission',
-    'non-tobacco',
     'non-treatment',
-    'non-work-related',
-    'non-worker',
-    'nonconformance',
-    'nonlimiting',
-    'nono',
-    'nonreporting',
-    'nonspecialist',
-    'noon-day',
-    'noon-tide',
-    'noon-time',
-    'nordboe',
-    'nordique',
-    'norm-control',
-    'normidtec',
-    'north\'',
     'north-side',
-    'northing',
-    'northmen',
-    'northmoor',
-    'northton',
-    'northward-dipping',
-    'northwest-southeast',
-    'norvex',
-    'norw',
-    'nose-dot',
-    'nose-job',
-    'nose-leaf',
-    'nose-picking',
-    'nose-to-tail',
-    'nosebridge',
-    'nosey-parker',
     'nostoc',
-    'notarbartolo',
-    'note-paper',
-    'note-taker',
-    'nother',
-    'notw',
-    'noumea',
-    'novac',
-    'novagen',
-    'novelli',
-    'novem',
-    'novenas',
-    'novodvorskaya',
-    'novoye',
-    'nowise',
-    'npcs',
     'nri',
-    'nrova',
-    'nuages',
-    'nuclear-related',
-    'nuffing',
-    'nukri',
-    'num-lock',
-    'numeri',
-    'nummer',
-    'nummus',
-    'nundy',
-    'nungesser',
-    'nursery-rhyme',
-    'nusselt',
-    'nutbourne',
-    'nutkin',
     'nutrifactor',
-    'nuttin\'',
-    'nvh',
-    'nvr',
-    'nwo',
-    'nwrac',
-    'nyah',
-    'nyet',
-    'nylabone',
-    'nyup',
-    'nzoungou',
-    'o\'lantern',
-    'o\'pray',
-    'o.e.',
-    'o.s',
-    'oakenhill',
     'oakleigh',
-    'oakman',
-    'oakmoor',
-    'oares',
-    'oasthouse',
-    'obasanjo',
-    'obeche',
-    'obenreizer',
-    'obie',
-    'obin',
-    'object-related',
-    'objectbench',
-    'objectware',
-    'obl',
-    'oblasts',
-    'obol',
     'obrera',
-    'observation-based',
-    'occu',
-    'oce',
-    'oceanicity',
-    'ocky',
-    'oct-4',
-    'octav',
-    'october&ndash;november',
-    'octopods',
-    'octopush',
-    'odb',
-    'odd-bod',
-    'oddly-named',
-    'oddo',
-    'odour-free',
     'oehlers',
-    'oeob',
-    'oes',
-    'oesophagogram',
-    'of&ndash',
-    'of-',
-    'ofek',
-    'ofer',
-    'off-budget',
-    'off-chip',
-    'off-drive',
-    'off-kilter',
-    'off-take',
-    'off-trade',
-    'offence-based',
-    'offi',
     'official-sounding',
-    'officiates',
-    'officiers',
-    'officinalium',
-    'offington',
-    'oggi',
-    'oggie',
-    'ogi-compliant',
-    'ogier',
-    'ognissanti',
-    'ogonek',
-    'ogs',
-    'ohmeda',
-    'oics',
-    'oiec',
-    'oil-importing',
     'ois',
-    'oiseau',
-    'oistrakh',
-    'okland',
-    'okrug',
-    'okullu',
-    'okuma',
-    'okwanyo',
-    'old-master',
-    'olesker',
-    'olgas',
-    'olicom',
-    'oligo(dt)',
-    'olinka',
-    'olivary',
-    'olivero',
     'olivines',
-    'olla',
-    'ollantaytambo',
-    'ollies',
-    'olmer',
-    'oltre',
-    'omenoni',
-    'omrahs',
-    'omv',
-    'on-form',
-    'on-hand',
-    'on-pass',
-    'on-phase',
-    'on-song',
-    'on-target',
-    'on-the-ground',
     'on-the-move',
-    'on-trade',
-    'on-ward',
-    'on.',
-    'onb',
-    'oncovin',
-    'ondansetron',
-    'one-acre',
-    'one-colour',
-    'one-dayer',
-    'one-family',
-    'one-in-10',
-    'one-ish',
-    'one-kilometre',
-    'one-lap',
-    'one-note',
     'one-pitch',
-    'one-pot',
-    'one-test',
-    'one-world',
-    'oneida',
-    'onlap',
-    'onlyapproved',
-    'onn',
-    'onuora',
-    'onyeanusi',
-    'ooking',
-    'oolerinnen',
-    'ooligans',
-    'oon',
-    'ooooooh',
-    'ooops-a-daisy',
     'opana',
-    'opdo',
-    'open-bridging',
-    'open-cut',
-    'open-file',
-    'open-heartedness',
-    'open-reel',
-    'open-sea',
-    'open-topper',
-    'open-weave',
-    'openmindedness',
-    'ophiocamax',
-    'ophiopogon',
-    'ophiosparte',
-    'opium-growing',
-    'opium-taking',
     'oppos',
-    'oppositon',
-    'opssat',
-    'opt-',
-    'opthalmologist',
-    'optionholders',
-    'optus',
-    'or&mdash',
-    'oral-anal-phallic',
-    'orange-brown',
-    'orangeman',
-    'orangy',
-    'orbitel',
-    'order-maintenance',
-    'order-of-magnitude',
-    'ordinatio',
     'oren',
-    'orendel',
-    'orficer',
-    'orga',
-    'organism-environment',
-    'organo-chlorine',
-    'orgaz',
-    'orjonikidze',
-    'orl',
-    'ormes',
-    'oronel',
-    'orotund',
-    'orta',
-    'orthapedic',
-    'orthopantograms',
-    'orthopedic',
     'os-9',
-    'os-9000',
-    'osb',
-    'oscar-berman',
-    'osculation',
-    'oseri',
-    'osmotical',
-    'osmund',
-    'osney',
-    'osr',
-    'osteoclasts',
-    'ostra',
-    'ostrowski',
-    'osvobozhdenie',
-    'oswel',
-    'otahuhu',
     'otani',
-    'otash',
-    'otec',
-    'otep',
-    'otini',
-    'otsuka',
-    'ottoman-occupied',
-    'ottone',
-    'oudom',
-    'ouds',
-    'ouest',
-    'oulsnam',
-    'ouragon',
-    'ouseburn',
-    'out&mdash',
-    'out-and-back',
     'out-classed',
-    'out-come',
-    'out-competed',
-    'out-feed',
-    'out-of-character',
-    'out-of-context',
-    'out-of-hand',
-    'out-of-house',
-    'out-of-london',
-    'out-of-step',
-    'out-of-time',
-    'out-pointed',
-    'out-pouring',
-    'out-run',
-    'out-thought',
-    'out-thrust',
     'outages',
-    'outbowled',
-    'outer-space',
-    'outfoxed',
-    'outlands',
-    'outreaches',
-    'outweighted',
-    'ouvrier',
-    'over-35',
-    'over-50',
-    'over-analysed',
-    'over-balancing',
-    'over-charged',
-    'over-come',
-    'over-consuming',
-    'over-control',
     'over-determined',
-    'over-done',
-    'over-drinking',
-    'over-dubbed',
-    'over-estimating',
-    'over-expanded',
-    'over-extending',
-    'over-funding',
-    'over-geared',
-    'over-identified',
-    'over-looked',
-    'over-paid',
-    'over-pitch',
-    'over-polarized',
-    'over-possessive',
-    'over-produced',
     'over-protect',
-    'over-provide',
-    'over-recruited',
-    'over-selling',
-    'over-stimulated',
-    'over-straining',
-    'over-stress',
-    'over-throw',
-    'over-watering',
-    'overabundant',
-    'overachieving',
-    'overbuilt',
-    'overcommit',
-    'overcontrolling',
-    'overemphasises',
-    'overexpressing',
     'overfalls',
-    'overflew',
-    'overgrowing',
-    'overmastering',
-    'overpay',
-    'overpaying',
-    'overpraised',
-    'overpronate',
-    'overrate',
-    'overrating',
-    'oversell',
-    'overselling',
-    'oversimple',
-    'overson',
-    'overspeeding',
-    'overstrung',
     'oversweet',
-    'overtipped',
-    'overtopped',
-    'overtrain',
-    'overtura',
-    'overvalues',
-    'overvaluing',
-    'overweights',
-    'overwinters',
-    'owlerton',
-    'own.',
-    'oxcar',
-    'oxer',
-    'oxstat',
-    'oxy-bottle',
-    'oxyria',
     'oyo',
-    'ozep',
-    'p&aacute;l',
-    'p&aacute;ll',
-    'p&eacute;ronne',
-    'p&eacute;triat',
-    'p&egrave;tain',
-    'p&ndash;59a',
-    'p&rcaron&iacute;kop&ecaron',
-    'p\'i',
-    'p-51s',
-    'p-hpr',
-    'p-k4',
-    'p.c.s',
-    'p.p.s',
-    'p.v.',
     'p174',
-    'p175',
-    'p52',
-    'p91',
-    'pa-kua',
-    'paa',
-    'pachyderms',
-    'paci',
-    'pacioli',
-    'pack-flat',
-    'pack-train',
-    'packie',
-    'packing-case',
-    'padarn',
-    'padgham',
-    'padrona',
     'pagliacci',
-    'pahang',
-    'pain-related',
-    'paint-box',
-    'paint-peeling',
-    'paktia',
-    'palache',
-    'palaeodictyoptera',
-    'palaestra',
-    'palestinian-jordanian',
-    'paliwoda',
-    'palm-leaf',
-    'palmtops',
-    'palop',
-    'palplus',
-    'pamphilia',
     'panagius',
-    'panaleiro',
-    'panayiotis',
-    'pancreatin',
-    'pandim',
-    'pandove',
-    'paned',
-    'panel-beating',
-    'panelbook',
-    'pangaion',
-    'panic-struck',
-    'panizo',
-    'panjsher',
-    'panjwin',
-    'pankey',
-    'pantaleon',
     'pantasaph',
-    'pantling',
-    'pantomimed',
-    'panzano',
-    'paoli',
-    'paotao',
-    'papain',
-    'papalist',
-    'paperbag',
-    'papermill',
-    'papias',
-    'papier-mache',
-    'papillote',
-    'papio',
-    'paquet',
-    'parafil',
     'paraline',
-    'paraliturgies',
-    'parallel-derived',
-    'parapeted',
-    'paraschiv',
-    'parasite-host',
-    'parasitize',
-    'paraskeva',
-    'paratones',
-    'paravion',
-    'parce',
-    'parcel-gilt',
-    'parceline',
-    'pardue',
-    'paresis',
-    'parga',
     'paricipate',
-    'parish-pump',
-    'park-based',
-    'paroles',
-    'parrs',
-    'parsees',
-    'parsi',
-    'part-financed',
-    'partc',
-    'parthia',
-    'partia',
-    'participation.',
-    'particular-identification',
-    'partire',
-    'partly-filled',
-    'partly-owned',
     'partner-in-residence',
-    'parto',
-    'partry',
-    'party-controlled',
-    'party-pooping',
-    'pasinetti',
-    'paspalj',
-    'pasquali',
-    'pasque',
-    'passarowitz',
-    'pastorates',
-    'pastrana',
-    'pastre',
-    'patala',
-    'paterno',
-    'pathet',
     'pathologizing',
-    'patourel',
-    'patriotico',
-    'patronella',
-    'patsi',
-    'pattern-forming',
-    'pattis',
-    'pattisson',
-    'patwardhan',
-    'paulino',
-    'pavillion',
-    'pavle',
-    'pavlovsk',
-    'pavoni',
-    'paw-print',
-    'pawlowski',
     'pawpaws',
-    'pay\'',
-    'pay-as-you-play',
-    'paycocke',
-    'paykhull',
-    'paylins',
-    'payment-by-results',
-    'pba',
-    'pc-style',
-    'pcms',
-    'pd.',
-    'pdki',
-    'pea-picking',
-    'pea-soup',
-    'peach-faced',
-    'peanut-butter',
     'pearle',
-    'peccati',
-    'pechenegs',
-    'pedernales',
-    'pedestrianism',
-    'pedestrianizing',
-    'pedicels',
-    'pedwardine',
-    'pee-bottle',
-    'peele',
-    'peepo',
-    'peepshows',
-    'peerybingle',
-    'peete',
-    'peewits',
-    'pehunan',
     'peierls',
-    'pekoe',
-    'pel',
-    'pelagian',
-    'pellequer',
-    'pelteobagrus',
-    'pemba',
-    'pembrey',
-    'pen-down',
-    'pen-plotter',
-    'pen-pusher',
-    'penates',
-    'penberi',
-    'pendletons',
-    'pendock',
-    'penikos',
     'penina',
-    'peniston',
-    'penley',
-    'penmaenpool',
-    'pennebaker',
-    'penni',
-    'pennsylvanians',
-    'penny-in-the-slot',
-    'pennyways',
-    'pennywort',
-    'penpad',
-    'pensa',
-    'pensionary',
-    'pensoso',
-    'pentagon-road',
-    'pentandra',
     'pentangle',
-    'pentas',
-    'peple',
-    'pepperers',
-    'per-',
-    'perachora',
-    'peral',
-    'perambulate',
-    'perc&eacute;e',
-    'perceivers',
-    'percentage-point',
-    'percodan',
-    'perdomo',
-    'perdono',
-    'perec',
-    'peret',
     'performance\'',
-    'pergnier',
-    'periandros',
-    'peridotitic',
-    'peridots',
-    'perilla',
-    'perindopril',
-    'period-style',
-    'periodisation',
-    'perisher',
-    'peristrephic',
-    'perker',
-    'perl',
-    'permanent-way',
-    'permanente',
-    'permeabilized',
     'pern&aring',
-    'pernell',
-    'pernia',
-    'peroxide-bleaching',
-    'perp',
-    'perplexes',
-    'perris',
-    'perruno',
-    'persecutes',
-    'person-in-role',
-    'personalism',
-    'perspired',
-    'perteguhan',
-    'perton',
-    'perwich',
-    'pescadores',
     'peschisllibo',
-    'pesnel',
-    'pet-food',
-    'petersfinger',
-    'petershill',
-    'petey',
-    'pethick-lawrences',
-    'petise',
-    'petrofisi',
-    'petrol-engine',
-    'petrol-pump',
-    'petron',
-    'petswood',
-    'pettibon',
-    'pettifor',
-    'peuvent',
     'pf-zapu',
-    'ph&oelig;nix',
-    'phaedo',
-    'phase-diagram',
-    'phase-in',
-    'phase-locked-loop',
-    'phelioff',
-    'phemus',
-    'phenanthroline',
-    'phenothiazine',
-    'philippics',
-    'philippinos',
-    'philistus',
-    'phillipon',
-    'philobiblon',
-    'philodendron',
     'philomene',
-    'philosophe',
-    'philosophique',
-    'philosophorum',
-    'philosphy',
-    'phocine',
-    'phoeba',
-    'phone-number',
-    'phoneline',
-    'phoo',
-    'phorr',
-    'phosphide',
-    'photius',
-    'photo-',
-    'photo-diode',
-    'photobooth',
     'photodiodes',
-    'photoflo',
-    'photoflood',
-    'photographie',
-    'photomagic',
-    'photosensitivity',
-    'photostats',
-    'photosynthate',
-    'photoworks',
-    'phyrologist',
-    'physicalism',
-    'phytosanitary',
-    'pi&mdash;activate&mdash;dcs',
-    'pi&mdash;assess&mdash;dc',
-    'pi&mdash;create&mdash;dc',
-    'pi&mdash;create&mdash;pack&mdash;or&mdash;prod',
     'pi&mdash;reserve&mdash;srce&mdash;fgn&mdash;and&mdash;pmodel',
-    'pi&mdash;submit&mdash;dc',
-    'pi&mdash;update&mdash;dc',
-    'pi&mdash;view&mdash;dc',
-    'pi&mdash;view&mdash;dc&mdash;assessors',
-    'pian',
-    'piani',
-    'pianola',
-    'piast',
-    'piave',
-    'pibor',
-    'pibrochs',
-    'picam-3',
-    'pichon',
-    'pick&mdash;up2',
-    'pick-and-mix',
     'pickaxes',
-    'pickersgill',
-    'pickhill',
-    'pictet',
-    'picturegoer',
-    'pid',
-    'piddled',
-    'pidgely',
-    'piece-part',
-    'pied-piper',
-    'pieng',
-    'pienkowski',
-    'pierpoint',
-    'pierrefeu',
-    'pieters',
-    'pietersen',
     'pig-ignorant',
-    'pigeon-holing',
-    'pigheadedness',
-    'pigmeat',
-    'piket',
-    'pilaff',
-    'pilastered',
-    'pile-driving',
-    'pillager',
-    'pilsen',
-    'pin-head',
-    'pin-hole',
-    'pin-tailed',
-    'pincered',
-    'pincio',
-    'pine-covered',
     'pine-forest',
-    'pinelli',
-    'pinkau',
-    'pinked',
-    'pinkish-brown',
-    'pinky-purple',
-    'pinturicchio',
-    'pinzgauer',
-    'piozzi',
-    'pipe-fitter',
-    'pipe-opener',
-    'pipe-playing',
-    'pipe-smoker',
-    'pipe-stem',
-    'pipefitters',
-    'piratin',
     'pisani',
-    'piss-taking',
-    'pisspot',
-    'pistia',
-    'pistol-grip',
-    'pistoning',
-    'pite',
-    'pitfield',
-    'pithecanthropus',
-    'pither',
-    'pitstop',
-    'pittards',
-    'pittencrief',
-    'pittock',
-    'pitty',
-    'pivotilt',
     'piws',
-    'pl&aacute;cido',
-    'plab',
-    'placard-waving',
-    'plages',
-    'plain-faced',
-    'plancius',
-    'plann',
-    'plantade',
-    'plantworld',
-    'plashed',
-    'plass',
-    'plaster-dust',
-    'plaster-work',
-    'plataea',
-    'platanus',
     'plate-district',
-    'platek',
-    'platelet-activating',
-    'platelet-aggregation',
-    'platelet-platelet',
-    'plateros',
-    'plattner',
-    'play-reading',
-    'play-text',
-    'player-king',
-    'playgoer',
-    'playmobil',
-    'playsets',
-    'playskool',
-    'pleaders',
-    'pleasanton',
     'pleass',
-    'plebian',
-    'plecoptera',
-    'plenderwald',
-    'pleno',
-    'plexipave',
-    'ploce',
-    'plock',
-    'plotter-drawn',
-    'plourde',
-    'plra',
-    'plt',
-    'plummetted',
-    'plusher',
-    'plymouth-based',
-    'pmug',
     'pnml',
-    'po&egrave;me',
-    'po-face',
-    'po-po',
-    'poche',
-    'podensac',
-    'podest&agrave',
-    'podington',
-    'podocarpus',
-    'poeta',
-    'pogacnik',
-    'poggi',
-    'point-of-use',
-    'poising',
-    'poissons',
-    'poissy',
     'poittevin',
-    'polack',
-    'pole-mounted',
-    'poletown',
-    'poletti',
-    'police-car',
-    'police-type',
-    'policraticus',
-    'policy\'',
-    'policy-changing',
-    'policy-formation',
-    'polish-built',
-    'polish-language',
-    'polish-speaking',
-    'polit',
-    'politicals',
     'politicks',
-    'politis',
-    'politricks',
-    'poll-topping',
-    'pollaidh',
-    'polland',
-    'pollett',
-    'pollo',
-    'polonnaruwa',
-    'polskie',
-    'polstead',
-    'poltalloch',
-    'poly-',
-    'polychaete',
-    'polychoral',
-    'polyconfidence',
     'polyester-filled',
-    'polykleitos',
-    'polyols',
-    'polypads',
-    'polypodiaceae',
-    'polysperma',
-    'polyzoa',
-    'pombo',
-    'pomelo',
-    'pomicino',
-    'pomodoro',
-    'pompe',
-    'pomponianus',
-    'pongo',
-    'pongpanich',
-    'pontarddulais',
     'pontic',
-    'pontikes',
-    'ponts',
-    'ponzo',
-    'poohsticks',
-    'pool-liner',
-    'pool-playing',
-    'pooleys',
-    'poons',
-    'pooping',
-    'poptastic',
-    'porc',
-    'porcaro',
-    'porche',
-    'porec',
-    'porphyrios',
     'port-hole',
-    'port-of-call',
-    'porte-coch&egrave;re',
-    'porter-style',
-    'porthmeor',
-    'porticus',
-    'portiere',
-    'portisch',
-    'portuense',
-    'portus',
-    'porybny',
-    'posen',
-    'posidon',
-    'possibilty',
-    'possible-world',
-    'post-1933',
     'post-1950',
-    'post-1956',
-    'post-1968',
-    'post-1970',
-    'post-1975',
-    'post-1988',
-    'post-assessment',
-    'post-breeding',
-    'post-built',
-    'post-conference',
-    'post-course',
-    'post-dinner',
-    'post-flight',
-    'post-formation',
-    'post-hole',
-    'post-larval',
     'post-liberal',
-    'post-newtonian',
-    'post-ottoman',
-    'post-settlement',
-    'post-thatcherite',
-    'post-unification',
-    'post-vaccination',
-    'post-winter',
-    'postage-stamp',
-    'postfactum',
-    'posthorn',
-    'postnikova',
-    'postposed',
-    'postprocedural',
-    'pot-boiler',
-    'pot-boy',
     'potala',
-    'potbellied',
-    'potential-difference',
-    'potential-divider',
-    'potestatem',
-    'potful',
-    'potheen',
-    'potoy',
-    'potticary',
-    'pouchy',
-    'poundstretchers',
-    'povah',
-    'powder-room',
-    'power-boat',
-    'power-knowledge',
-    'power-loom',
     'power-seeker',
-    'power-vacuum',
-    'power-zoom',
-    'powerglo',
-    'powersave',
-    'poxviral',
-    'poynting',
-    'pozidriv',
-    'ppias',
-    'ppn',
-    'pr&aelig;sepe',
-    'pr&eacute;v&ocirc;t',
-    'pr&uuml;m',
-    'pradier',
-    'praefectus',
-    'praep',
     'praja',
-    'praktica',
-    'prasong',
-    'praxeis',
-    'pre-1937',
-    'pre-adamite',
-    'pre-adjunct',
-    'pre-adolescence',
-    'pre-annealed',
-    'pre-announced',
-    'pre-assessment',
-    'pre-built',
-    'pre-compilation',
-    'pre-conversion',
-    'pre-cooled',
-    'pre-crash',
     'pre-crisis',
-    'pre-cursor',
-    'pre-destined',
-    'pre-disposition',
-    'pre-emptiveness',
-    'pre-erythrocytic-stage',
-    'pre-european',
-    'pre-exist',
-    'pre-flood',
-    'pre-grouping',
-    'pre-hospital',
-    'pre-incubated',
-    'pre-marriage',
-    'pre-medication',
-    'pre-mix',
-    'pre-monsoon',
     'pre-nomination',
-    'pre-notification',
-    'pre-op',
-    'pre-prep',
-    'pre-privatisation',
-    'pre-renaissance',
-    'pre-soaking',
-    'pre-suppose',
-    'pre-supposed',
-    'pre-take-off',
-    'pre-theory',
-    'pre-university',
-    'pre-wrapped',
-    'precious-metal',
-    'precooked',
-    'predetermines',
     'prees',
-    'preference-belief',
-    'prejudice-begotten',
-    'premierentage',
-    'premixed',
-    'premodern',
-    'premultiplying',
-    'prentky',
-    'preomnor',
-    'prepped',
-    'prepping',
-    'preps',
-    'preschoolers',
-    'present-giving',
-    'present-tense',
-    'pressdram',
     'pressganged',
-    'pressurization',
-    'pretendin\'',
-    'preto',
-    'pretraining',
-    'preussenelektra',
-    'prev',
-    'previewer',
-    'prez',
-    'pri&scaron;tina',
-    'priapulid',
-    'price-level',
-    'price-recovery',
-    'price-rigging',
-    'prickly-pear',
-    'prime-minister',
     'primeurs',
-    'primitivist',
-    'principal-agent',
-    'principall',
-    'prinking',
-    'printronics',
-    'prions',
-    'priorwood',
-    'priss',
-    'priv&eacute',
-    'privately-built',
-    'privett',
-    'prize-fight',
-    'prize-fighting',
-    'pro-activeness',
-    'pro-feminist',
     'pro-gaullist',
-    'pro-level',
-    'pro-nationalist',
-    'pro-rail',
-    'pro-unification',
-    'pro-unity',
-    'pro-vitamin',
-    'proalcool',
-    'problem-ridden',
-    'problematises',
-    'prochaska',
-    'procrustes',
-    'proctoscopy',
-    'proculian',
-    'proddy',
-    'producer-director',
     'product-belief',
-    'product-design',
-    'product-led',
-    'product-liability',
-    'product-market',
-    'product-mix',
-    'product-range',
-    'production-sharing',
-    'productivity-enhancing',
-    'proetta',
-    'profaning',
-    'profesional',
-    'profesor',
-    'professeur',
-    'professionalize',
-    'professionally-based',
     'professionally-made',
-    'profet',
-    'profit-centre',
-    'profit-earning',
-    'profitt',
-    'prog-rock',
-    'progess',
-    'programing',
-    'progreso',
-    'proguanil',
-    'prokop',
-    'pronasol',
-    'proofreader',
-    'propagandising',
-    'propagandizing',
-    'property-owner',
     'proprietory',
-    'prosauropods',
-    'prosdocimus',
-    'prosecco',
-    'prosector',
-    'protea',
-    'protein-a',
-    'proteo',
-    'proto-',
-    'protract',
-    'provenanced',
-    'provencale',
-    'provera',
-    'providentialist',
-    'provincetown',
-    'provisoire',
     'prussianism',
-    'pryers',
-    'psalmen',
-    'psammetichus',
-    'pseudo-dionysius',
-    'pseudo-euclidean',
-    'pseudo-feminist',
-    'pseudo-improvement',
-    'pseudo-membrane',
-    'pseudo-renaissance',
-    'pseudocrenilabrus',
-    'psilocyn',
-    'psycho-',
-    'psycho-biography',
-    'psycho-drama',
-    'psychologize',
     'psychophysics',
-    'ptca',
-    'pteropods',
-    'ptosis',
-    'puablo',
-    'puangchon',
-    'pub-going',
-    'pubgoers',
-    'public-expenditure',
-    'public-health',
-    'publico',
-    'publicum',
-    'puces',
-    'puche',
-    'puerorum',
-    'pufferfish',
     'puffin\'',
-    'pui',
-    'pujehun',
-    'pujol',
-    'pull-up',
-    'pulsair',
-    'pulsifer',
-    'pultney',
-    'pulvis',
-    'pummels',
-    'pumpin\'',
-    'punch-bag',
-    'punch.',
-    'punition',
-    'punk-rock',
-    'pupating',
     'pupil-created',
-    'puppet-master',
-    'puppy-fat',
-    'purbeckian',
-    'purefoys',
-    'purpley',
-    'purplish-black',
-    'purplish-red',
-    'purpresture',
-    'pursuitte',
-    'purugganan',
-    'pury',
-    'puryear',
-    'pusillus',
-    'put-out',
-    'put-u-up',
     'putatoes',
-    'putteridge',
-    'putteth',
-    'putting-green',
-    'puttonen',
-    'puxty',
-    'pwas',
-    'pycroft',
-    'pyjama-clad',
-    'pyrddin',
-    'pyrola',
-    'pyrrhonism',
-    'pyrrolidone',
-    'pyrus',
-    'pytchley',
-    'pytheas',
     'pzt',
-    'qaddur',
-    'qasem',
-    'qbench',
-    'qf',
-    'qia',
-    'qila',
-    'qisas',
-    'qlfs',
-    'qses',
-    'quadratics',
-    'quadri',
-    'quadrophenia',
-    'qualification-based',
-    'quality-of-working-life',
-    'quareca',
     'quarr',
-    'quarrelsomeness',
-    'quartan',
-    'quasim',
-    'quast',
-    'queenshithe',
-    'queer-bashing',
-    'quelques',
-    'quester',
-    'question(s)',
-    'questmaker',
-    'quickcuff',
-    'quieta',
-    'quietish',
-    'quijano',
-    'quinone',
     'quislings',
-    'quisqualate',
-    'quoad',
-    'quot',
-    'qwaqwa',
-    'r&eacute;unis',
-    'r&ndash',
-    'r&ndash;1340',
-    'r&ouml;hm',
-    'r&uacute;a',
-    'r-zacopride',
-    'r.f.c.',
-    'r.f.h.',
-    'r.g.',
-    'r.h',
-    'r.v.',
     'r342a4-b15',
-    'r70',
-    'r74(1&ndash;356)',
-    'r74(1&ndash;73)',
-    'r74(73&ndash;517)',
-    'r85',
-    'ra-ra',
-    'rabbit\'',
-    'rabbit-punch',
-    'rabeh',
-    'rabkin',
-    'racal-decca',
-    'race-card',
-    'racenate',
-    'racial-imperialist',
-    'racketed',
     'rade',
-    'raden',
-    'radfoot',
-    'radgy',
-    'radi',
-    'radin',
-    'radio-activity',
-    'radio-isotope',
-    'radio-set',
-    'radiofrequency',
-    'radiolaria',
-    'radix',
-    'radmila',
-    'radoman',
-    'raeper',
-    'rafale',
     'rafalos',
-    'rag-covered',
-    'raghavan',
-    'rahier',
-    'rahmat',
-    'rahul',
-    'railway-station',
-    'raimo',
-    'rain-interrupted',
-    'raindance',
-    'raineth',
-    'rainmaking',
-    'rainsplash',
-    'rajahs',
-    'rajneesh',
-    'rakehell',
     'rakic',
-    'ralley',
-    'ralli',
-    'ralliement',
-    'rallus',
-    'ramaema',
-    'ramalina',
-    'ramayana',
-    'ramazan',
-    'ramb&oslash;ll',
-    'ramraid',
-    'ramrodded',
-    'ramtha',
-    'ranchi',
-    'randolf',
-    'randomn',
     'randon',
-    'range-finder',
-    'rangitoto',
-    'rangwapithecus',
-    'rania',
-    'raniganj',
-    'rank-ordering',
-    'ranthambhore',
-    'rapair',
-    'raphanus',
-    'raptores',
-    'rarde',
-    'rasht',
-    'rasool',
-    'rat-a-tat-tat',
-    'rat-arsed',
     'rat-run',
-    'rate-of-change',
-    'rate-of-return',
-    'rathbones',
-    'rathmore',
-    'ratisbon',
-    'ratking',
-    'ratnayeke',
-    'ratp',
-    'ratskag',
-    'raughley',
-    'rauhensteingasse',
-    'rauluni',
-    'raunchier',
-    'ravag',
-    'ravelston',
     'ravender',
-    'ravensbruck',
-    'ravenscourt',
-    'ravenswood',
-    'ravhele',
-    'ravignan',
-    'raygada',
-    'raym',
-    'rayment',
-    'rayonnant',
-    'razin',
-    'rbc',
-    'rcas',
-    'rcia',
-    're-absorbed',
-    're-affirming',
     're-bait',
-    're-captured',
-    're-casting',
-    're-centre',
-    're-charged',
-    're-claim',
-    're-classifying',
-    're-developed',
-    're-dial',
-    're-districting',
-    're-emit',
-    're-encounters',
-    're-energize',
-    're-estimating',
-    're-evolved',
-    're-expressing',
     're-financed',
-    're-focused',
-    're-freeze',
-    're-fret',
-    're-hang',
-    're-harakhty',
-    're-hashing',
-    're-hired',
-    're-housing',
-    're-impose',
-    're-inject',
-    're-insert',
-    're-inserted',
-    're-instate',
-    're-instating',
-    're-integrate',
     're-interred',
-    're-keying',
-    're-laid',
-    're-learnt',
-    're-line',
-    're-lit',
-    're-look',
-    're-numbering',
-    're-offer',
-    're-orientated',
-    're-package',
-    're-planned',
-    're-planning',
-    're-pointing',
-    're-possessed',
-    're-processing',
     're-program',
-    're-releasing',
-    're-retrieve',
-    're-scaled',
-    're-signing',
-    're-sized',
-    're-sizing',
-    're-supply',
-    're-tightened',
-    're-trace',
-    're-transmit',
-    're-wound',
-    'reaccumulated',
-    'reachin\'',
-    'reactivin',
-    'reactor-grade',
     'read&mdash;module',
-    'read-rite',
-    'reading-list',
-    'reales',
-    'reality-based',
-    'realityengine',
-    'reaping-machine',
-    'reapportioning',
-    'reapproved',
-    'reasearch',
-    'reassumed',
-    'rebbecca',
-    'rebel-controlled',
-    'reboarded',
-    'rebooting',
-    'rebuilder',
     'recanting',
-    'recapitalise',
-    'recently-announced',
-    'recently-completed',
-    'receptive-field',
-    'recession-busting',
-    'receveur',
-    'rechallenged',
-    'rechargeables',
-    'rechsstaat',
-    'reckweilerhof',
-    'reclassed',
-    'recoating',
-    'recommencing',
-    'recon',
-    'reconceptualize',
     'reconstitutes',
-    'recopying',
-    'rectella',
-    'recuperates',
-    'red-alert',
-    'red-line',
-    'red-stone',
-    'redast',
-    'redburnus',
-    'redclyffe',
-    'reddler',
-    'redelivery',
-    'redfarn',
-    'redhall',
-    'redivivus',
-    'redmarley',
     'redmarshall',
-    'redoubles',
-    'redoutensaal',
-    'reduced-calorie',
-    'reduced-fat',
-    'reecastle',
-    'reedholme',
-    'reeducate',
-    'reefed',
-    'reenter',
-    'refloated',
-    'refocuses',
-    'reform-oriented',
-    'reformulates',
-    'refreezing',
-    'refuels',
     'refus',
-    'regals',
-    'regalvanised',
-    'regiae',
-    'reglazing',
-    'regnat',
-    'regnault',
-    'regrows',
-    'rehk&auml;mper',
-    'reifying',
-    'reilley',
-    'reimar',
-    'reinach',
-    'reinsert',
-    'reinstitute',
-    'reinsure',
     'reinsured',
-    'reinterviewed',
-    'reisner',
-    'reitzigi',
-    'rejeuvenation',
-    'reka',
-    'rekindles',
-    'relabel',
-    'relicts',
-    'relief-line',
-    'reloads',
-    'remarketing',
-    'remayne',
-    'remba',
-    'rememberance',
-    'remixer',
     'reml',
-    'remotivate',
-    'remotivated',
-    'remunerating',
-    'remustered',
-    'renatel',
-    'renderman',
-    'rendzinas',
-    'renet',
-    'renewer',
-    'renshaws',
-    'rent-a-colonel',
-    'rent-a-crowd',
-    'rent-collector',
-    'rentaminster',
-    'renzan',
     'rep&uacute;blica',
-    'repaginate',
-    'repaving',
-    'repeated-note',
-    'repellant',
-    'repine',
-    'repining',
-    'repor',
-    'report\'',
-    'reposes',
-    'repotted',
-    'reproval',
-    'republican-controlled',
-    'republik',
-    'reregistered',
-    'rereleases',
     'resewn',
-    'residualist',
-    'resignalled',
-    'resile',
-    'resiled',
-    'resize',
-    'reslated',
-    'resnais',
-    'resourcefully',
-    'responsibility-sharing',
-    'respraying',
-    'ressg',
-    'resta',
-    'restaged',
-    'restout',
-    'restructurant',
     'resupplied',
-    'resurgens',
-    'retables',
-    'retallick',
-    'retchakhan',
-    'retirement-age',
-    'retro-fit',
-    'retroscend',
-    'return-to-work',
-    'returnee',
-    'revalidated',
-    'revenant',
-    'revenger',
-    'revengers',
-    'revenue-generating',
-    'rever',
     'reverse-polarity',
-    'reviens',
-    'reviseurs',
-    'revivifying',
-    'revoking-feeling',
-    'revoluci&oacute;n',
-    'revson',
-    'rewoven',
-    'rexshun',
-    'rexxon',
-    'reynald',
-    'reynoldstown',
-    'reznikoff',
-    'rfh',
-    'rheid',
-    'rheinallt',
     'rheingold',
-    'rheinhessen',
-    'rhinehart',
-    'rhinocerous',
-    'rhizobia',
-    'rhodos',
-    'rhubarbrhubarbrhubarb',
-    'rhumb',
-    'rhumba',
-    'rib-knit',
-    'ribbon-grass',
-    'ribe',
-    'riboprobe',
-    'ricercare',
-    'rich-bitch',
-    'richeaume',
     'richmond-based',
-    'rickinghall',
-    'ricoeur',
-    'ricoll',
-    'riddle-me-ree',
-    'ridge-and-furrow',
-    'ridgeways',
-    'riding-school',
-    'ridker',
-    'rieber',
-    'rieff',
-    'riens',
-    'riesener',
-    'riesman',
-    'rigaku',
-    'rigeon',
     'right-brained',
-    'right-leaning',
-    'right-to-use',
-    'rigid-body',
-    'rigidify',
-    'rilindja',
-    'rimi',
-    'rinded',
-    'rindler',
-    'rines',
-    'ring-fencing',
-    'ring-pull',
-    'ring-shaped',
-    'ringcraft',
-    'ringsend',
-    'riojas',
     'riordon',
-    'riot-control',
-    'riot-trained',
-    'ripert',
-    'ripsley',
-    'risbridger',
-    'rishel',
-    'risk-benefit',
-    'risk-loving',
-    'risom',
-    'risquet',
-    'ritornellos',
-    'ritzen',
-    'rivage',
-    'rivenhall',
-    'river-water',
     'rivieras',
-    'rivka',
-    'rivron',
-    'riyals',
-    'rizal',
-    'rj-11',
-    'rje',
-    'rmn',
-    'rmon',
-    'rna-pcr',
-    'road-',
-    'road-led',
-    'road-tax',
-    'roadbuilders',
-    'roadhead',
-    'roadmenders',
     'roaf',
-    'roanne',
-    'roanoke',
-    'robber-baron',
-    'robbin',
-    'robocranker',
-    'robotised',
-    'rochat',
-    'roche-limit',
-    'rock-face',
-    'rock-fall',
-    'rocketeer',
-    'rocksavage',
-    'rockside',
-    'rockwatch',
-    'rod-bending',
     'rodan',
-    'rodenticides',
-    'rodolph',
-    'rodriguais',
-    'roecliffe',
-    'roessler',
-    'rogatica',
-    'rogozhin',
-    'rohit',
-    'rohita',
-    'rohlfs',
-    'rohnson',
-    'rohwer',
-    'roiled',
-    'roitelet',
-    'rokkan',
     'rol',
-    'role-identification',
-    'role-related',
-    'rolfing',
-    'roll-in',
-    'rolled-over',
-    'rolleiflex',
-    'rollerskating',
-    'rollies',
-    'rollmops',
-    'rollof',
-    'romagnoli',
-    'romanist',
-    'romano-saxon',
-    'romanticises',
-    'roncaglia',
     'ronceray',
-    'rond',
-    'rondal',
-    'rondas',
-    'rondavel',
-    'rondement',
-    'rood-screen',
-    'roods',
-    'roof-line',
-    'rooflines',
-    'rooftec',
-    'rooftiles',
-    'room\'',
-    'room-service',
-    'root-balled',
-    'rootes',
     'rootsy',
-    'rope-ladder',
-    'rorc',
-    'rosamunda',
-    'roscarrocks',
-    'rose-bed',
-    'rose-price',
-    'roseanna',
-    'rosehips',
-    'rosenau',
-    'roseraie',
-    'rosings',
-    'roskear',
-    'rosla',
-    'rosselli',
-    'rossio',
     'rossmann',
-    'rosswess',
-    'rot-proof',
-    'rotala',
-    'rotavirus',
-    'rothchild',
-    'rotliegendes',
-    'rotoscoping',
-    'rottwinkle',
-    'rotulorum',
-    'roughwood',
-    'roun',
-    'round-about',
-    'round-arm',
-    'roundwood',
-    'rouser',
     'rousseli&egrave;re',
-    'routemaster',
-    'routered',
-    'roverpoint',
-    'rovver\'ithe',
-    'rowenta',
-    'rowlatt',
-    'royalty-free',
-    'rozen',
-    'rozi&egrave;re',
-    'rt.',
-    'rtl',
-    'ruanda',
-    'rubber-banded',
-    'rubberlegs',
-    'rubbishes',
     'rubble-stone',
-    'ruber',
-    'rubis',
-    'ruddiman',
-    'rudyerd',
-    'rudzinski',
-    'ruete',
-    'ruffin',
-    'ruhe',
-    'ruhlmann',
-    'rummenigge',
-    'rumpers',
-    'rumpus-room',
-    'run-about',
-    'run-dmc',
-    'run-maker',
     'rundfunk',
-    'rungis',
-    'runun',
-    'ruowang',
-    'rupinder',
-    'rupkachorn',
-    'rurangaranga',
-    'rushen',
-    'ruspoli',
-    'rusque',
-    'russian-language',
-    'rustici',
-    'rusticus',
-    'ruthvens',
-    'ruutel',
-    'rvc',
     'ryazan',
-    'rybak',
-    'ryco',
-    'ryehill',
-    'ryes',
-    'rymans',
-    's&eacute;curit&eacute',
-    's&lstrok;upsk',
-    's\'en',
-    's\'gonnacostyaguvna',
-    's-3',
-    's-l',
-    's.&agrave;.r.l.',
-    's.29',
-    's.k.',
-    's70',
     'saadoun',
-    'saarinen',
-    'saba',
-    'sabah-based',
-    'sabalat',
-    'sabaragamuva',
-    'sabato',
-    'sabesp',
-    'sabl&eacute',
-    'sacrac',
-    'sacroiliac',
-    'saddlebow',
-    'sadeian',
-    'sado',
-    'sado-masochist',
-    'sadok',
     'sadourny',
-    'sadwu',
-    'saeb',
-    'saeeda',
-    'safavid',
-    'safe-guard',
-    'safetip',
-    'safety-line',
-    'safety-tab',
-    'safir',
-    'safon',
-    'sagale',
-    'sage-green',
-    'sagiv',
-    'said&mdash',
-    'said-',
     'saidpur',
-    'saids',
-    'sail-locker',
-    'sailmaking',
-    'sakurai',
-    'sal-vee-niya',
-    'salameh',
-    'salaquin',
-    'salaryman',
-    'sale-room',
-    'sales-area',
-    'salesgirls',
-    'saliki',
-    'salish',
-    'sallow-faced',
-    'sallow-skinned',
     'salmo',
-    'salmonella-free',
-    'salmonellosis',
-    'salopian',
-    'saltfleet',
-    'salthorp',
-    'salto',
-    'saltworks',
-    'salzburgerhof',
-    'samford',
-    'sammar',
-    'sammartini',
-    'sammons',
-    'samovars',
-    'sampanena',
-    'sanaigmore',
     'sanatoria',
-    'sancie',
-    'sanctions-breaking',
-    'sanctis',
-    'sand-castle',
-    'sand-glass',
-    'sand-hill',
-    'sandbagging',
-    'sandblasted',
-    'sandbourne',
-    'sandeep',
-    'sandhurst-trained',
-    'sandkings',
-    'sandlings',
-    'sandmoor',
-    'sandokes',
     'sandplate',
-    'sandsend',
-    'sandycove',
-    'saneline',
-    'sangh',
-    'sangi',
-    'sanke',
-    'sankichi',
-    'sanoh',
-    'santaland',
-    'santeria',
-    'santesson',
-    'sanur',
-    'sanusis',
-    'sanya',
-    'sanyasa',
     'sap-sucking',
-    'saph',
-    'sapo&aacute',
-    'saprophytic',
-    'sapte',
-    'saracini',
-    'sarajevans',
-    'saranne',
-    'sardanapalus',
-    'sardauna',
-    'sardo',
-    'sards',
-    'sareks',
-    'sarich',
-    'sarn',
-    'sarouk',
     'sarti',
-    'sas-2',
-    'sashays',
-    'sasol',
-    'sassen',
-    'sassin',
-    'satb',
-    'satellite-television',
-    'satellite-tv',
-    'satiates',
-    'satin-finished',
-    'satori',
-    'satro',
-    'satu',
-    'savedvalues',
-    'savidge',
     'saw-fly',
-    'sawd',
-    'sawicki',
-    'sawtell',
-    'sayf',
-    'sayit',
-    'saynor',
-    'sbaa',
-    'sbc-sp',
-    'sbrinz',
-    'scabbed',
-    'scalare',
-    'scale-invariant',
-    'scanachrome',
-    'scandalizing',
-    'scanet',
     'scanro',
-    'scar-faced',
-    'scaramanga',
-    'scardeoni',
-    'scarlet-cheeked',
-    'scathed',
-    'scavenges',
-    'scawby',
-    'scbu',
-    'scenedesmus',
-    'scent-mark',
-    'sces',
-    'sch&uuml;bler',
-    'sch.',
-    'schaar',
-    'schabort',
     'schaden',
-    'schanefelt',
-    'schaub',
-    'schedl',
-    'scheele',
-    'scheibe',
-    'scheifler',
-    'schiefer',
-    'schiess',
-    'schillebeeckx',
-    'schizo',
-    'schladming',
-    'schleifer',
-    'schlemmer',
-    'schlitzberger',
-    'schmeichal',
     'schmoozed',
-    'schnitzler',
-    'schock',
-    'scholar-critic',
-    'scholefield',
-    'schonbrau',
-    'school-board',
-    'school-dinner',
-    'school-hole',
-    'school-term',
-    'schoop',
-    'schopf',
-    'schramme',
-    'schreck',
-    'schriften',
-    'schulhof',
     'schussler',
-    'schuur',
-    'schwanengesang',
-    'schweber',
-    'schweiz',
-    'scienza',
-    'scire',
-    'scleral',
-    'scmc',
-    'scoffers',
-    'scollen',
-    'sconvols',
-    'scoobie',
-    'scoop-neck',
-    'scop',
-    'scopolamine',
     'scorcese',
-    'score-card',
-    'score-reading',
-    'score.',
-    'scots-english',
-    'scotson',
-    'scoutmasters',
-    'scrabbles',
-    'scrap-yard',
-    'scrapman',
-    'scratting',
-    'screech-owl',
-    'screehaugh',
-    'screen-printing',
-    'screw-driven',
-    'screw-driver',
     'scrophulariaceae',
-    'scroungerphobia',
-    'scrubb',
-    'scrunches',
-    'scuole',
-    'scurvey-grass',
-    'sdece',
-    'sdirect',
-    'sea-dumping',
-    'sea-gate',
-    'sea-girt',
-    'sea-horse',
-    'sea-serpent',
-    'sea-sickness',
-    'sea-spray',
-    'sea-squirt',
     'sea-tower',
-    'seabray',
-    'seacourt',
-    'seaforde',
-    'seakale',
-    'sealing-wax',
-    'seapark',
-    'seaquarium',
-    'season-by-season',
-    'seatown',
-    'seavision',
-    'seaweed-based',
-    'secada',
-    'seceders',
-    'seckendorff-gudent',
-    'seconal',
     'second-line',
-    'second-preference',
-    'second-rower',
-    'second-seeded',
-    'second-source',
-    'second-strike',
-    'second-wicket',
-    'secours',
-    'secretary-treasurer',
-    'sectored',
-    'security-related',
-    'sedco',
-    'seed-fern',
-    'seemann',
-    'seeth',
-    'seeya',
     'sefa-dedeh',
-    'segui',
-    'sehnsucht',
-    'seidler',
-    'seita',
-    'seka',
-    'sekigahara',
-    'sekt',
-    'selenide',
-    'self-accelerating',
-    'self-affirmation',
-    'self-annihilation',
-    'self-completed',
-    'self-creating',
-    'self-deceit',
-    'self-designed',
     'self-destructiveness',
-    'self-diagnosis',
-    'self-directing',
-    'self-exploitation',
-    'self-inductance',
-    'self-insurance',
-    'self-introduction',
-    'self-liquidating',
-    'self-perpetuation',
-    'self-programming',
-    'self-propagation',
-    'self-publication',
-    'self-purification',
-    'self-recruitment',
-    'self-responsibility',
-    'self-screen',
     'self-searching',
-    'self-set',
-    'self-standing',
-    'self-starter',
-    'self-teach',
-    'self-weight',
-    'selfconfidence',
-    'selfing',
-    'selfstyled',
-    'selig',
-    'selincourt',
-    'sell-in',
-    'sellasie',
-    'seller-client',
-    'selvagem',
-    'selvon',
     'semana',
-    'semi-blocked',
-    'semi-custom',
-    'semi-dried',
-    'semi-fascist',
-    'semi-fast',
-    'semi-mounted',
-    'semi-submerged',
-    'semi-trailing',
-    'semibreve',
-    'semirecumbent',
-    'semler',
-    'senator-minister',
-    'sendai',
-    'senequier',
-    'senko',
     'senn',
-    'seno',
-    'sense-content',
-    'sense-qualifier',
-    'senser',
-    'senso',
-    'sensurround',
-    'sentence-as-object',
-    'sentence-initial',
-    'sentimentalise',
-    'senza',
-    'sephardim',
-    'sepik',
-    'ser-243',
-    'serac',
-    'serampore',
     'serape',
-    'serapeum',
-    'serban',
-    'serez',
-    'serf-based',
-    'serialist',
-    'serir',
-    'serjeants-at-law',
-    'sermaria',
-    'sermonize',
-    'sermonized',
-    'serreau',
-    'service-orientation',
-    'sesha',
-    'sessionette',
-    'sesterces',
     'sestertii',
-    'sestina',
-    'set-top',
-    'setsuko',
-    'sette',
-    'setting-day',
-    'sevaks',
-    'sevell',
-    'seven-course',
-    'seven-days-a-week',
-    'seven-layer',
-    'seven-letter',
-    'seven-track',
-    'seventeen-year',
-    'seventies-style',
-    'seventy-year',
     'severne',
-    'sewage-treatment',
-    'sewanee',
-    'sewing-room',
-    'sex-abuse',
-    'sex-equality',
-    'sex-stereotyped',
-    'sex-typed',
-    'sexkylie',
-    'sextets',
-    'sexualized',
-    'seyhulislams',
-    'seymer',
-    'seyum',
-    'sfdes',
-    'sgorr',
     'sgur',
-    'shabbir',
-    'shackerstone',
-    'shaddup',
-    'shadeed',
-    'shadomaster',
-    'shadow-filled',
-    'shadowland',
-    'shafik',
-    'shafir',
-    'shahbaz',
-    'shainess',
-    'shake-outs',
-    'shaked',
-    'shakuhachi',
-    'shalamcheh',
     'shalary',
-    'shallowing',
-    'shally',
-    'shamash',
-    'shambellie',
-    'shamim',
-    'shammas',
-    'shanab',
-    'shanan',
-    'shandling',
-    'shangaan',
-    'shanken',
-    'shanley',
-    'shanmugam',
-    'shaoqi',
-    'shaplands',
     'sharaf',
-    'sharda',
-    'share-price',
-    'share-trading',
-    'sharevision',
-    'shari',
-    'shariah',
-    'sharief',
-    'sharir',
-    'sharky',
-    'sharmi',
-    'sharp-witted',
-    'sharrocks',
-    'shaston',
-    'shatin',
-    'shawm',
     'she-ass',
-    'she-bear',
-    'she-ghost',
-    'she-goat',
-    'sheail',
-    'shear-lag',
-    'shearings',
-    'sheathbills',
-    'sheathe',
-    'shebib',
-    'shedd',
-    'shedden',
-    'sheehey',
-    'sheens',
-    'sheep-breeding',
-    'sheep-dip',
     'sheep-stealing',
-    'sheep-worrying',
-    'sheepbridge',
-    'sheepdip',
-    'sheer-sided',
-    'sheet-music',
-    'sheffield-born',
-    'sheher',
-    'sheikhas',
-    'shelhi',
-    'shell-toes',
-    'shenavall',
-    'shene',
-    'shenkin',
-    'sheppy',
-    'sheratons',
     'sheriff-substitute',
-    'sherrick',
-    'sherrif',
-    'shevchenko',
-    'shhhhh',
-    'shiah',
-    'shielfield',
-    'shiism',
-    'shiitake',
-    'shildon-born',
-    'shiller',
-    'shillin\'',
-    'shilly',
-    'shilts',
-    'shindand',
-    'shindigs',
     'shipbourne',
-    'shiro',
-    'shirone',
-    'shirt-button',
-    'shirt-cuff',
-    'shirtsleeved',
-    'shish',
-    'shochaiku',
-    'shockin\'',
-    'shoe-horned',
-    'shoe-polish',
-    'shoemender',
-    'shopping-basket',
-    'short-break',
-    'short-change',
-    'short-day',
     'short-leeting',
-    'short-nosed',
-    'short-service',
-    'short-sharp-shock',
-    'short-stemmed',
-    'short-termist',
-    'short-title',
-    'short-track',
-    'shortchanged',
-    'shoshone',
-    'shostakovitch',
-    'shot-change',
-    'shot-hole',
-    'shot-maker',
-    'shot-making',
-    'shot-silk',
     'shotokai',
-    'shoul',
-    'shoulder-charged',
-    'shouting-match',
-    'show-stealer',
-    'shree',
-    'shreeve',
-    'shrinkwrap',
-    'shrubland',
-    'shuff',
-    'shul',
-    'shumiatski',
-    'shurll',
-    'shurman',
-    'shuster',
-    'shusui',
     'sialyl',
-    'siat',
-    'sibble',
-    'siberut',
-    'sicelo',
-    'sicheus',
-    'sick-nurse',
-    'sickbag',
-    'sickie',
-    'siddown',
-    'side\'',
-    'side-entrance',
-    'side-glance',
-    'side-hung',
-    'side-letter',
-    'side-passage',
     'side-swipe',
-    'side-tracking',
-    'side-trip',
-    'side-window',
-    'sidhe',
-    'sieger',
-    'sigatoka',
-    'sight-reading',
-    'sigillaria',
-    'sigillo',
-    'sign-for-word',
-    'sign-language',
-    'signal-box',
-    'signaling',
-    'signalized',
-    'signifiant',
     'signing-up',
-    'sikandra',
-    'silat',
-    'silec',
-    'silencio',
-    'siliwangsi',
-    'silk-clad',
-    'silk-covered',
-    'silk-weaving',
-    'silkbeard',
-    'silktones',
-    'sillari',
-    'silotank',
-    'silures',
-    'silver\'',
-    'silver-stained',
     'silver-staining',
-    'simiastone',
-    'simien',
-    'simitar',
-    'simlastone',
-    'simlawood',
-    'simonenko',
-    'simpl',
-    'simple-to-use',
-    'simrad',
-    'simtek',
-    'simulcasting',
-    'sin&eacute;ad',
-    'sin-zan',
-    'sinaia',
-    'sinclaire',
     'sinewed',
-    'sing-sing',
-    'singel',
-    'single-day',
-    'single-factor',
-    'single-interest',
-    'single-key',
-    'single-note',
-    'single-parenthood',
-    'single-peakedness',
-    'single-piece',
-    'single-precision',
-    'single-processor',
-    'single-site',
-    'single-source',
-    'single-status',
     'single-wicket',
-    'singlebreasted',
-    'singlewood',
-    'sinhalese-buddhist',
-    'sinisalo',
-    'sino-portuguese',
-    'sinqe',
-    'sinularia',
-    'siphonaptera',
-    'sirenuse',
-    'sisak',
-    'sissay',
-    'sista',
-    'sit-up',
-    'site-based',
-    'site-owner',
     'siti',
-    'sitt',
-    'sitte',
-    'sivilize',
-    'six-course',
-    'six-digit',
-    'six-gun',
-    'six-iron',
-    'six-note',
-    'six-row',
-    'six-seat',
-    'six-volume',
-    'sixe',
-    'sixmilewater',
-    'sixteen-inch',
-    'sixteen-month',
     'sixth-wicket',
-    'sixth-year',
-    'sixty-mile',
-    'sizar',
-    'skank',
-    'skeilth',
-    'skelligs',
-    'skerratt',
-    'sketch-book',
-    'sketchers',
-    'skid-pan',
-    'skiddy',
-    'skiied',
-    'skilastic',
-    'skinfold',
-    'skirled',
     'skirrow',
-    'skoal',
-    'skof',
-    'skroelings',
-    'sks',
-    'skull-staff',
-    'skundric',
-    'sky-diving',
-    'sky-light',
-    'sky-scraping',
-    'skydivers',
-    'skyrms',
-    'skyship',
-    'skyview',
-    'sl-bit',
-    'sl-gms',
     'slachman',
-    'slangerup',
-    'slap-dash',
-    'slather',
-    'slaughden',
-    'slave-labour',
-    'slave-owning',
-    'slawson',
-    'sleeked-back',
-    'sleeping-pill',
-    'slickline',
-    'slide-show',
-    'slimming-down',
-    'slipstreamed',
-    'slithy',
-    'slivovitz',
     'slobby',
-    'slobodenko',
-    'slogger',
-    'slogs',
-    'slot-machine',
-    'slothfulness',
-    'slow-burn',
-    'slowdive',
-    'sluagh',
-    'slubbered',
-    'sludging',
-    'slum-dweller',
-    'slump-busting',
-    'slurps',
-    'slushing',
-    'smackheads',
     'small-boat',
-    'small-bore',
-    'small-degree',
-    'small-holder',
-    'smallprint',
-    'smarmed',
-    'smart-looking',
-    'smartass',
-    'smashiton',
-    'smeeton',
-    'smersh',
-    'smith-god',
-    'smlas',
-    'smog-mask',
-    'smoke-stack',
-    'smoldering',
     'smooched',
-    'smooth-faced',
-    'smooth-shaven',
-    'smurfs',
-    'snakeshead',
-    'snap-frozen',
-    'snap-ix',
-    'snappish',
-    'snco',
-    'snd',
-    'sneakapenny',
-    'sng',
-    'snicking',
-    'sniffin\'',
-    'snivel',
-    'snook-cocking',
     'snotties',
-    'snow-cover',
-    'snow-filled',
-    'snow-flake',
-    'snuff-bottle',
-    'snugfit',
-    'so-and-sos',
-    'soakage',
-    'soap-free',
-    'soccer-style',
-    'sochaux',
-    'sociadad',
-    'socialist\'',
-    'socio-moral',
-    'sockeye',
-    'socking',
     'socorridos',
-    'socs',
-    'sod-all',
-    'sodality',
-    'sofala',
-    'sofitel',
-    'soft-edged',
-    'soft-pedalled',
-    'softlite',
-    'softset',
-    'sogea',
-    'sogna',
-    'sognfjord',
-    'sohag',
-    'soil-ball',
-    'soin',
     'sojourned',
-    'sojourning',
-    'sokoloff',
-    'sol&eacute',
-    'sol-gel',
-    'solas',
-    'solcia',
-    'soldats',
-    'solenhofen',
-    'solid-fuel',
-    'solid-waste',
-    'solidarnosc',
-    'solifluction',
-    'solignac',
-    'soloheadbeg',
-    'solum',
     'solvite',
-    'somerset-based',
-    'something-or-other',
-    'somewhen',
-    'sommeliers',
-    'somocistas',
-    'song-cycle',
-    'songkran',
-    'songster',
-    'sonicator',
-    'sonicfinder',
-    'sonics',
-    'sonnex',
-    'sonnier',
-    'sonsonate',
-    'soons',
     'sooster',
-    'sopped',
-    'soppitt',
-    'sor&oslash',
-    'sorata',
-    'sorbitol',
-    'sorbs',
-    'sorby',
-    'sorelle',
-    'sorenstam',
-    'sorhaindo',
-    'sospiri',
-    'soufriere',
-    'soul-binding',
-    'soul-searing',
-    'souleiman',
     'soun',
-    'sound-insulating',
-    'sound-letter',
-    'sound-picture',
-    'sound-world',
-    'soundchecks',
-    'soundwise',
-    'source-code',
-    'sous-chef',
-    'soustelle',
-    'south-south-east',
-    'southcom',
-    'southcote',
-    'southdata',
-    'southmoorhenge',
-    'southscan',
     'southward-flowing',
-    'southwells',
-    'souyave',
-    'sovicille',
-    'soviet-controlled',
-    'soviet-era',
-    'soviet-vietnamese',
-    'sovietologists',
-    'sowetan',
-    'sownen',
-    'spab',
-    'space\'',
-    'space-gods',
-    'space-shuttle',
-    'spacewalk',
-    'spad',
     'spading',
-    'spalletti',
-    'spang',
-    'spanish-based',
-    'spanks',
-    'spanos',
-    'sparcdirect',
-    'sparcettes',
-    'sparcset',
-    'spark-ignition',
-    'sparkman',
-    'sparless',
-    'sparry',
-    'spartathlon',
-    'spartitura',
-    'spatialization',
     'spatialized',
-    'spca',
-    'spdl',
-    'speaker-hearer',
-    'spear-point',
-    'spear-tip',
-    'special-case',
-    'specialling',
-    'specially-tailored',
-    'speciated',
-    'specijalci',
-    'specrate',
-    'specrate&mdash;fp92',
-    'spectate',
-    'spectrograms',
-    'spectromagic',
     'speddy',
-    'speech-act',
-    'speechifying',
-    'speechwriters',
-    'speeton',
-    'spellcasting',
-    'spellman',
-    'spense',
-    'spesh',
-    'spex',
-    'sphalerite',
-    'sphecotheres',
-    'spiegelhalter',
-    'spiegl',
-    'spigots',
-    'spik',
     'spillikins',
-    'spinach-green',
-    'spinetti',
-    'spionage',
-    'spired',
-    'spirit-based',
-    'spiritualizing',
-    'spirometer',
-    'spittalburn',
-    'splay-footed',
-    'splinter-proof',
-    'split-up',
-    'splodged',
-    'spls',
-    'spooners',
-    'spoonie',
     'sports-fishing',
-    'sports-related',
-    'sportsline',
-    'sposi',
-    'spotila',
-    'spotlamp',
-    'spraddled',
-    'spratlys',
-    'spread-sheet',
-    'sprengel',
-    'spriggina',
-    'spring-heeled',
-    'spring-line',
-    'springman',
-    'sproule',
-    'sprysoft',
     'spssx',
-    'spy-ring',
-    'spyder',
-    'spyway',
-    'squanderbug',
-    'square-root',
-    'square-section',
-    'squattish',
-    'squatts',
-    'squaws',
-    'squired',
-    'squitting',
-    'sr-gamma',
-    'sr-isotope',
-    'sricams',
-    'sry-',
     'ss-11',
-    'ss-12',
-    'ss425&mdash;427',
-    'sshhh',
-    'ssrf',
-    'st&aacute;dn&iacute;k',
-    'st&auml;del',
-    'st&ndash;18',
-    'st.james',
-    'staatsbibliothek',
-    'staatskapelle',
-    'stabbers',
-    'stable-block',
-    'stable-hand',
-    'stableair',
-    'staden',
     'stadtmuseum',
-    'stadtpark',
-    'staelens',
-    'staffon',
-    'stag-night',
-    'stage-fright',
-    'stage-manage',
-    'stagecoaches',
-    'stagemanaged',
-    'staini',
-    'stainmaster',
-    'stait',
-    'staithe',
-    'staits',
-    'stales',
-    'staling',
     'standbridge',
-    'standeasy',
-    'standing-wave',
-    'stanestreet',
-    'stans',
-    'stansgate',
-    'stanze',
-    'star-map',
-    'starballs',
-    'starey',
-    'stari',
-    'starin\'',
-    'starlifter',
-    'starom&ecaron;stsk&eacute',
-    'start-point',
-    'starttheengine',
     'starzewski',
-    'stash-for-cash',
-    'state-by-state',
-    'state-enterprise',
-    'state-firm',
-    'statice',
-    'statistically-based',
-    'status-based',
-    'statute-backed',
-    'stavro',
-    'staxigoe',
-    'steads',
-    'steam-raising',
-    'steamhammer',
-    'steamport',
-    'steamrollering',
     'steerables',
-    'stefansdom',
-    'steinhilper',
-    'steinmann',
-    'stelfox',
-    'stenmark',
-    'step-dad',
-    'step-sisters',
-    'stephensons',
-    'steppa',
-    'steppenwolf',
-    'steradian',
-    'stereom',
-    'stereopsis',
-    'stern-on',
-    'stern-to',
     'sterol',
-    'stevenses',
-    'stew-pot',
-    'stewer',
-    'stiff-jointed',
-    'stigand',
-    'stigwood',
-    'still-functioning',
-    'still-growing',
-    'still-working',
-    'stillorgan',
-    'stinkhorn',
-    'stinkschiefer',
-    'stir-',
-    'stirks',
-    'stirlander',
     'stivvies',
-    'stockbrokerage',
-    'stockholm-based',
-    'stockport-based',
-    'stolli',
-    'stomached',
-    'stone-dust',
-    'stonecross',
-    'stoneface',
-    'stoneflies',
-    'stonewash',
-    'stonking',
-    'stopgaps',
-    'stopvalve',
-    'storebrand',
-    'storecupboard',
     'storm-force',
-    'stormant',
-    'story-time',
-    'stoss',
-    'stouffer',
-    'stoutstroke',
-    'stoway',
-    'stowupland',
-    'stracathro',
-    'straddle-legged',
-    'strahinja',
-    'straight-billed',
-    'straight-in',
-    'straight-talking',
-    'straightener',
-    'strangulating',
     'strap-hanging',
-    'strathalmond',
-    'strathcona',
-    'strathpeffer',
-    'stratores',
-    'stratos',
-    'straubenzee',
-    'straughan',
-    'strawalde',
-    'strawbs',
-    'strayhorn',
-    'streak-free',
-    'stream-lining',
-    'streeck',
-    'streeten',
-    'streetlink',
     'strepsiptera',
-    'stress-reduction',
-    'stretcher-bearer',
-    'stretchmarks',
-    'streuer',
-    'strews',
-    'strictured',
-    'strine',
-    'strip-club',
-    'strip-mining',
-    'strip-searched',
-    'stripped-pine',
-    'strnadova',
-    'stroan',
-    'stroitel',
-    'stroller',
     'strondonald',
-    'strongyloidiasis',
-    'stroumillo',
-    'strozzi',
-    'strubig',
-    'structure-based',
-    'strums',
-    'stubai',
-    'stubbles',
-    'student-',
-    'student-based',
-    'studenty',
-    'stuffmann',
-    'stumpf',
-    'stuporose',
-    'sturch',
     'stylophone',
-    'styptic',
-    'styrenics',
-    'sub-band',
-    'sub-genus',
-    'sub-licensed',
-    'sub-notebook',
-    'sub-office',
-    'sub-offices',
-    'sub-pattern',
-    'sub-personality',
-    'sub-problem',
-    'sub-roman',
-    'sub-shell',
-    'sub-string',
-    'sub-tropics',
     'sub-woofer',
-    'subarnarekha',
-    'subbutteo',
-    'subgames',
-    'subgoals',
-    'subito',
-    'subject-prominent',
-    'sublanguages',
-    'subleased',
-    'sublunary',
-    'submachine-gun',
-    'submaxillary',
-    'submersibles',
-    'submessages',
-    'subono',
-    'subpackage',
     'subparallel',
-    'subplots',
-    'subsaharan',
-    'subsamples',
-    'subsistence-level',
-    'subsource',
-    'substituant',
-    'subtherapeutic',
-    'subthreshold',
-    'suburbanised',
-    'subword-level',
-    'suceava',
-    'suck-suck',
-    'suess',
-    'suety',
-    'suffragi',
     'sugar-baker',
-    'sugimoto',
-    'suisses',
-    'suit-case',
-    'suitedome',
-    'suivez',
-    'suiyuan',
-    'sulphite',
-    'sulphomucin',
-    'sulyagin',
-    'sumiswald',
-    'summerhayes',
-    'summerill',
-    'sumsion',
-    'sun-bathed',
-    'sun-belt',
     'sun-gold',
-    'sun-hat',
-    'sun-lit',
-    'sun-roof',
-    'sun-screen',
-    'sun-streaked',
-    'sun-worshipper',
-    'sun-worshipping',
-    'sunaccounts',
-    'suncare',
-    'sunday-trading',
-    'sundgot',
-    'sundowners',
-    'sungard',
-    'sunhill',
-    'sunlamp',
     'sunnyvista',
-    'sunrises',
-    'sunseekers',
-    'sunservice',
-    'suntanning',
-    'super-10',
-    'super-feather',
-    'super-lightweight',
-    'superannuate',
-    'superbreak',
-    'supercard',
-    'superego-degradation',
-    'supergirl',
-    'superministry',
-    'superoo',
-    'superphenix',
     'superposing',
-    'superspy',
-    'supertax',
-    'supertex',
-    'supertwist',
-    'superuser',
-    'suppine',
-    'suppport',
-    'supressed',
-    'surakarta',
-    'surface-based',
-    'surin',
-    'surrey-born',
-    'survivorship',
-    'sushumna',
-    'sustainers',
     'sut',
-    'sutherfield',
-    'suthren',
-    'sutlej',
-    'sutro',
-    'suwelo',
-    'suze',
-    'suzman',
-    'svd',
-    'sven-goran',
-    'svennsen',
-    'sverre',
-    'sveticic',
-    'svi',
-    'swaggers',
-    'swahili-land',
     'swainmotes',
-    'swallower',
-    'swallowers',
-    'swannee',
-    'swanshurst',
-    'swanwic',
-    'swarfega',
-    'swarkstone',
-    'swatf',
-    'swats',
-    'swear-word',
-    'swedish-style',
-    'sweep-up',
-    'sweet\'eart',
-    'sweetlea',
-    'swerford',
     'swet',
-    'swiftpack',
-    'swimmin\'',
-    'swimmy',
-    'swimsafe',
-    'swing-bridge',
-    'swinnergill',
-    'swiss-german',
-    'swiss-made',
-    'swiss-owned',
-    'swissprot',
-    'switch-changing',
-    'swithen',
-    'swo',
-    'sword-stick',
-    'swordplay',
     'sybilla',
-    'syllabification',
-    'syllabifying',
-    'syllable-structure',
-    'symbioses',
-    'symbole',
-    'symmachus',
-    'synapsid',
-    'syncaset',
-    'synch-pulse',
-    'synchro-edit',
-    'synchrofax',
-    'syndrum',
-    'synners',
-    'synonymized',
-    'syr',
     'syseca',
-    'system-building',
-    'system-built',
-    'system-level',
-    'systemics',
-    'sytems',
-    'szent-gy&ouml;rgyi',
-    'szewczyk',
-    'sztuki',
-    'szymanowski',
-    't&ndash;33',
-    't\'front',
-    't\'stock',
-    't\'zun-tu',
-    't-42',
-    't-shirted',
     't-system',
-    't.p.',
-    't25',
-    't4-sb',
-    'tabacco',
-    'tabacum',
-    'tabes',
-    'table-leg',
-    'table-turning',
-    'tablelinen',
-    'tabulatur',
-    'tachism',
-    'tachiste',
-    'tachymetabolism',
-    'tacograph',
-    'tacq',
     'tadjiks',
-    'taggle',
-    'taguchi',
-    'tahr',
-    'tail-coat',
-    'tail-fin',
-    'tailor-making',
-    'taipa',
-    'taish&oacute',
-    'takagi',
-    'takahanada',
-    'takemitsu',
-    'takfir',
-    'talintyre',
-    'tallant',
-    'tamako',
     'tamames',
-    'tambiah',
-    'tambora',
-    'tamen',
-    'tamez',
-    'tami',
-    'tammany',
-    'tamo',
-    'tampicos',
-    'tamtec',
-    'tanabu',
-    'tanalised',
-    'tangen',
-    'tanka',
-    'tannhauser',
-    'tantrum-throwing',
     'tanzen',
-    'tapang',
-    'tape-grass',
-    'tape-running',
-    'tapinoma',
-    'tappet',
-    'tapponnier',
-    'taproot',
-    'tarama',
-    'tarazets',
-    'tarento',
-    'tariff-laden',
-    'tarom',
-    'tarquinian',
-    'tarra',
-    'tarski',
     'tartessus',
-    'tartini',
-    'tarum',
-    'taruskin',
-    'task-',
-    'taskrep',
-    'tassilo',
-    'tassotti',
-    'tast',
-    'tataria',
-    'tati',
-    'tatjana',
-    'tatlers',
-    'tattling',
-    'taub',
-    'tauchen',
     'taunus',
-    'tausug',
-    'tav',
-    'tavarnelle',
-    'tavole',
-    'tax-avoiding',
-    'tax-gatherer',
-    'tax-gathering',
-    'tax-haven',
-    'tayga',
-    'tayloe',
-    'taylor-made',
-    'tchadienne',
-    'tchah',
-    'tchoungui',
-    'tdk',
     'tdpi',
-    'tea-',
-    'tea-bagging',
-    'tea-set',
-    'tea-strainer',
-    'teabreak',
-    'teache',
-    'teacher-as-researcher',
-    'teacher-parent',
-    'teacher-student',
-    'teagarden',
-    'team-owner',
-    'team-up',
-    'teamlinks',
-    'teares',
-    'tearjerker',
     'teary',
-    'teasmade',
-    'tebbitt',
-    'technalysis',
-    'technicl',
-    'technologically-based',
-    'technology-led',
-    'technology-sharing',
-    'tecnologia',
-    'teco',
-    'tect',
-    'tee-hee',
-    'tee-time',
-    'tee-total',
-    'teijin',
-    'teilreiche',
     'tejwani',
-    'teknowledge',
-    'telamon',
-    'telcon',
-    'telecel',
-    'telecommuting',
-    'telecoms-equipment',
-    'telekia',
-    'telekinesis',
-    'telemessages',
-    'teleosts',
-    'telephone-banking',
-    'telescript',
-    'teleservices',
-    'teletypes',
-    'teleview',
     'tellsplatte',
-    'tellt',
-    'tellurium-132',
-    'telroc',
-    'temmincki',
-    'templehof',
-    'templetwist',
-    'ten-a-side',
-    'ten-event',
-    'ten-speaker',
-    'ten-yard',
-    'tenant-in-chief',
-    'tenderise',
-    'tenebrae',
-    'tennis-ball',
-    'tenoned',
     'tenorlied',
-    'tent-peg',
-    'teodorescu',
-    'terbutaline',
-    'tercom',
-    'terebratula',
-    'terek',
-    'terminb&ouml;rse',
-    'terner',
-    'terpsichorean',
-    'terrain\'',
-    'terranova',
-    'terras',
-    'terrestre',
-    'terrestrials',
-    'terrex',
     'terror-filled',
-    'teschen',
-    'testin\'',
-    'tetrafluoride',
-    'teu',
-    'teuber',
-    'teubner',
-    'texaz',
-    'texier',
-    'textcall',
-    'tfta',
-    'tftr',
-    'th&eacute;venin',
-    'th\'could',
-    'th\'knows',
-    'th\'would',
     'thair',
-    'thaller',
-    'thank-yous',
-    'thant',
-    'thass',
-    'thatta',
-    'thd',
-    'theaetetus',
-    'theat',
-    'theatre-land',
-    'thematized',
-    'theme-based',
-    'themsleves',
-    'theodosiou',
-    'theorie',
-    'theory-building',
     'theory-formation',
-    'theory-loading',
-    'thereza',
-    'thermie',
-    'thermochemistry',
-    'thermoelasticity',
-    'thesp',
-    'thespis',
-    'theusidies',
-    'they\'d',
-    'they\'se',
-    'thicknessing',
-    'thigh-hugging',
-    'thiller',
-    'thingamajigs',
-    'thingmy',
     'thingol',
-    'thingumajig',
-    'think-',
-    'thinwire',
-    'thirasawat',
-    'third-division',
-    'third-level',
-    'third-reading',
-    'third-wave',
-    'thirst-quenching',
-    'thirty-page',
-    'thokoza',
-    'thorganby',
-    'thornely',
-    'thornett',
-    'thorofon',
     'thoroughgood',
-    'thorsvedt',
-    'thorsvoe',
-    'thorwaldsen',
-    'thoudippos',
-    'thr-239',
-    'threave',
-    'three-banded',
-    'three-bed',
-    'three-boat',
-    'three-button',
-    'three-colour',
-    'three-day-event',
-    'three-decker',
-    'three-floor',
-    'three-furlong',
     'three-handed',
-    'three-hole',
-    'three-pointed',
-    'three-processor',
-    'three-ring',
-    'three-run',
-    'three-shift',
-    'three-timer',
-    'three-variable',
-    'three-vehicle',
-    'three-vote',
-    'thrombosed',
-    'throned',
-    'through-flow',
-    'through-road',
-    'throwen',
     'throwouts',
-    'thuan',
-    'thuggy',
-    'thumbsucking',
-    'thunbergii',
-    'thunder-cloud',
-    'thunder-storm',
-    'thunderscan',
-    'thurkettle',
-    'thurmond',
-    'thursdee',
-    'thurstone',
-    'thwacked',
-    'thymidilate',
-    'thymidines',
-    'thymy',
     'thyroxin',
-    'thysia',
-    'ti-in',
-    'tiamat',
-    'tiano',
-    'tichy',
-    'tick-borne',
-    'ticketlink',
-    'ticketting',
-    'tickety-boo',
-    'tidburys',
-    'tidey',
-    'tidgy',
-    'tidmarsh',
-    'tidy-minded',
-    'tiebreak',
     'tierce',
-    'tiernan',
-    'tiger-stripe',
-    'tight-waisted',
-    'tightly-controlled',
-    'tigreans',
-    'tigresses',
-    'tikhii',
-    'till-covered',
-    'tillysburn',
-    'timanfaya',
-    'timarchides',
-    'timber-exporting',
-    'timberlands',
-    'timbrels',
-    'time-clock',
     'time-cnn',
-    'time-filling',
-    'time-off',
-    'time-ownership',
-    'time-pieces',
-    'time-shock',
-    'time-signature',
-    'time-to-time',
-    'time-waster',
-    'timebase',
-    'timelords',
-    'timemachine',
-    'timeout',
-    'timesense',
-    'timesharing',
-    'timewasting',
     'timidness',
-    'timoney',
-    'tindemans',
-    'tinniswood',
-    'tinos',
-    'tinware',
-    'tip-and-run',
-    'tipaza',
-    'tipoff',
-    'tipp',
-    'tipsheet',
-    'tiptoft',
-    'tirajana',
-    'tirebuck',
-    'tirfor',
-    'tirsi',
     'titi',
-    'titmice',
-    'titolo',
-    'titrating',
-    'tiutiunnyk',
-    'tivoli-based',
-    'tiziano',
-    'tka',
-    'tli',
-    'tmas',
-    'tni',
-    'to-move(o)',
-    'toamasina',
-    'tobacco-growing',
-    'tobacco-smoke',
-    'tobiah',
     'toch',
-    'toe-curling',
-    'toe-job',
-    'toe-to-toe',
-    'toerags',
-    'tofani',
-    'toffee-apple',
-    'togai',
-    'toibin',
-    'toilet-roll',
-    'told-you-so',
-    'toleman',
-    'tolex',
-    'tollet',
-    'tombalbaye',
-    'tombaugh',
     'tomita',
-    'tommorow',
-    'tommyrot',
-    'tondu',
-    'tone-group',
-    'tone-poem',
-    'too-clever-by-half',
-    'tool-bag',
-    'toolroom',
-    'tooth-and-claw',
-    'tooth-plate',
-    'toothglass',
-    'toowoomba',
-    'top-earning',
-    'top-edged',
-    'top-link',
     'top-lit',
-    'top-mounted',
-    'top-shelf',
-    'top-to-bottom',
-    'topclass',
-    'topic-related',
-    'toping',
-    'toplab',
-    'toppin',
-    'torc',
-    'torch&egrave;re',
-    'torch-lit',
-    'tordesillas',
-    'torihada',
-    'torin',
-    'torme',
     'torpichen',
-    'torre&atilde;o',
-    'torrej&oacute;n',
-    'torta',
-    'torughu',
-    'torumtay',
-    'tory-dominated',
-    'tosa',
-    'toscanelli',
-    'tosi',
-    'tossy',
-    'tostada',
-    'totah',
-    'tote-bag',
-    'totentanz',
-    'touch-legering',
     'touch-screen',
-    'touch-type',
-    'tough-nut',
-    'toul',
-    'tourist-orientated',
-    'tousling',
-    'toves',
-    'towel-dry',
-    'towler',
-    'town-expansion',
-    'towngate',
-    'townroe',
-    'towsie',
-    'toxicara',
-    'tpo',
-    'tr&eacute;l&egrave;champ',
     'trabalhadores',
-    'trace-horse',
-    'trachytic',
-    'tradanet',
-    'tradecraft',
-    'tradewinds',
-    'trading-in',
-    'traffens',
-    'trai',
-    'trailfinders',
-    'trailing-link',
-    'trak',
-    'trammel',
-    'tramontana',
-    'tranchant',
-    'tranio',
     'tranquillised',
-    'trans-europe',
-    'trans-shipping',
-    'transantarctic',
-    'transcash',
-    'transcendentalist',
-    'transconjugant',
-    'transdniestr',
-    'transfixes',
-    'transformer-rectifier',
-    'transistorized',
-    'translink',
-    'translocates',
-    'transmission-style',
-    'transmogrifying',
-    'transpac',
     'transparence',
-    'transport-related',
-    'transvalued',
-    'transversal',
-    'trassey',
-    'trast&acirc;mara',
-    'trat',
-    'travelog',
-    'travestying',
-    'treadway',
-    'treasure-house',
-    'treasure-hunt',
-    'treaty-based',
-    'tree-cover',
-    'tree-living',
-    'tree-nesting',
     'treecreeper',
-    'treescape',
-    'tregarron',
-    'tregaskis',
-    'tregwynt',
-    'trehearne',
-    'trehub',
-    'treloggen',
-    'tremblay',
-    'trembucker',
-    'tremeloes',
-    'tremiti',
-    'tremolux',
-    'trenaman',
-    'trenched',
-    'treptower',
     'tresseno',
-    'trevose',
-    'tri-cast',
-    'triallist',
-    'triangulate',
-    'tribbles',
-    'tribick',
-    'tribromoethanol',
-    'tricep',
-    'trichloroethane',
-    'trichlorophon',
-    'trichoanalysis',
-    'triclinic',
-    'tridvid',
-    'triglochin',
-    'trigon',
     'trikini',
-    'trilateralism',
-    'trilobal',
-    'trimotor',
-    'trinitarianism',
-    'trinitron',
-    'tripodding',
-    'tripodoro',
-    'triss',
-    'tristars',
-    'tritones',
-    'trm',
-    'trna-modification',
-    'trofim',
-    'troggs',
-    'trolley-bus',
     'trollhatten',
-    'trombe',
-    'tromboncino',
-    'trommelbass',
-    'trong',
-    'trongate',
-    'trophy-room',
-    'troubetzkoy',
-    'trouble-spot',
-    'trous',
-    'trouve',
-    'trub',
-    'trubschachen',
-    'truck-load',
-    'true-to-life',
-    'trueblood',
     'trueheart',
-    'truespace',
-    'trueswell',
-    'trumble',
-    'trumping-feeling',
-    'trustspan',
-    'truthspiel',
-    'tryin',
-    'tryplase',
-    'tsavo',
-    'tsch',
-    'tseef',
-    'tsereteli',
-    'tsi',
-    'tsimshatsui',
-    'tswana',
     'tswit',
-    'tta',
-    'tto',
-    'tu&ndash;144',
-    'tu-whit-tu-whoo',
-    'tuamotus',
-    'tube-station',
-    'tucan&aelig',
-    'tucc',
-    'tucci',
-    'tuchman',
-    'tuckingmill',
-    'tudorbethan',
-    'tueart',
-    'tues-sat',
-    'tuite',
     'tulipifera',
-    'tultulan',
-    'tumble-down',
-    'tumble-dryer',
-    'tumoural',
-    'tungsten-carbide',
-    'tunnel-mouth',
-    'tuo',
-    'tuor',
-    'tupamaros',
-    'tupling',
-    'tupouto\'a',
-    'turbo-charger',
-    'turbobat',
-    'turbofan',
-    'turbulator',
     'turl',
-    'turn-a-round',
-    'turnball',
-    'turnery',
-    'turnpiking',
-    'turnups',
-    'tuten',
-    'tuthmosis',
-    'tutsis',
-    'tuuta',
-    'twelve-string',
-    'twelve-week',
-    'twelve-wheel',
-    'twentieth-',
-    'twenty-eight-day',
-    'twenty-metre',
     'twerps',
-    'twice-married',
-    'twin-headed',
-    'twin-tube',
-    'twinkly-eyed',
-    'twistor',
-    'twistwood',
-    'two-and-a-bit',
-    'two-and-a-half-mile',
-    'two-and-a-half-year',
-    'two-bedded',
-    'two-blade',
-    'two-cd',
-    'two-chip',
-    'two-cpu',
-    'two-dollar',
     'two-eyed',
-    'two-finger',
-    'two-floor',
-    'two-language',
-    'two-length',
-    'two-section',
-    'two-sector',
-    'two-shoes',
-    'two-story',
-    'two-teacher',
-    'two-wheel-drive',
-    'two-wheeler',
-    'two-woman',
-    'twoish',
-    'twyning',
-    'tyack',
     'tydings',
-    'tyldesley',
-    'tyle',
-    'tympan',
-    'type-',
-    'type-2',
-    'typing-pool',
-    'typos',
-    'tyree',
-    'tyroglyphus',
-    'tyrosinase',
-    'tyrothricin',
-    'tyrrel',
-    'tyto',
-    'tzampa',
-    'tzatziki',
     'tzevaim',
-    'u-16',
-    'u-a',
-    'u1-a72',
-    'u12',
-    'u20',
-    'ubik',
-    'uc&ndash;64a',
-    'uca',
-    'ucar',
-    'ucatt',
-    'ucip',
-    'udag',
-    'udbina',
-    'udcf',
-    'udet',
     'udf-rpr',
-    'udl',
-    'udry',
-    'ufw',
-    'uginox',
-    'uglies',
-    'ugm',
-    'ugolino',
-    'ugtm',
-    'uhh',
-    'uk-designed',
-    'ukic',
-    'ukraina',
-    'ulanhu',
-    'ulster-american',
-    'ultra-cool',
     'ultra-fast',
-    'ultra-right-wing',
-    'ultra-tight',
-    'ultrafast',
-    'ultramark',
-    'ultranet',
-    'ultraworld',
-    'ulvesund',
-    'umca',
-    'umgababa',
-    'umopar',
-    'un-japanese',
-    'un-patrolled',
-    'un-protected',
-    'unauthentic',
-    'unbeing',
     'unchastity',
-    'unchic',
-    'unco-operativeness',
-    'undc',
-    'undcp',
-    'undealt',
-    'under-10',
-    'under-appreciated',
-    'under-estimates',
-    'under-manned',
-    'under-read',
-    'under-rehearsed',
-    'under-supplied',
-    'underbonnet',
-    'undereating',
-    'underfire',
     'underlaid',
-    'underlight',
-    'underperform',
-    'underreporting',
-    'underselling',
-    'understeers',
-    'undertype',
-    'underwiring',
-    'undulant',
-    'undulose',
-    'unflamboyant',
-    'unfortunatly',
-    'unfp',
-    'unfreedom',
-    'unfrightening',
-    'ungelt',
     'ungud',
-    'unic',
-    'unicultural',
-    'unicum',
-    'unilab',
-    'unilinx',
-    'uninvolving',
-    'unit-trust',
-    'unitaria',
-    'unity\'',
-    'unity-ratio',
-    'universitaires',
-    'university-level',
-    'univesity',
-    'univision',
-    'unix-on-mac',
     'unman',
-    'unmarry',
-    'unpartisan',
-    'unpegged',
-    'unresonant',
-    'unsewn',
-    'unslept',
-    'unstalls',
-    'unsticking',
-    'unsubtly',
-    'unsymmetrical',
-    'untether',
-    'unton',
-    'unwrought',
-    'up-and-under',
-    'up-channel',
     'up-down',
-    'up-draught',
-    'up-ending',
-    'up-field',
-    'up-link',
-    'up-turned',
-    'upb',
-    'upcurved',
-    'upehull',
-    'upex',
-    'uphauling',
-    'upholster',
-    'uplighter',
-    'upper-mantle',
-    'upper-state',
-    'upstretched',
     'urab&aacute',
-    'uranium-series',
-    'urbain',
-    'urban-fringe',
-    'urbanizing',
-    'urbco',
-    'urbina',
-    'ureche',
-    'urepel',
-    'urf',
-    'urnersee',
-    'urras',
-    'urs\'la',
-    'urt',
-    'urtnasan',
-    'urug',
     'urvills',
-    'us-controlled',
-    'us-installed',
-    'usafe',
-    'user-controlled',
-    'user-education',
-    'user-package',
-    'usg',
-    'usines',
-    'usnea',
-    'usquebaugh',
-    'ustica',
-    'usulut&aacute;n',
-    'uteri',
-    'uti',
-    'utility-based',
     'uuencode',
-    'uwusa',
-    'uzes',
-    'uzielli',
-    'v&auml;nern',
-    'v&auml;yrynen',
-    'v-8',
-    'v-bomber',
-    'v-i',
-    'vaca',
-    'vacant-eyed',
-    'vaccaro',
-    'vacuum&ndash;braked',
-    'vacuum-formed',
-    'vad',
-    'vadstena',
     'vaga',
-    'vagg',
-    'vaila',
-    'vaillancourt',
-    'vaine',
-    'vaino',
-    'vaisman',
-    'vaison',
-    'vaitsos',
-    'valcourt',
-    'valent',
-    'valeo',
-    'valere',
-    'valette',
-    'vall',
-    'vallauris',
     'valldemosa',
-    'valorclean',
-    'vamoose',
-    'vamping',
-    'van-driver',
-    'vanaprastha',
-    'vaneigem',
-    'vangelis',
-    'vanitas',
-    'vanwall',
-    'vaporetti',
-    'vaporising',
-    'vapourchip',
-    'varanus',
-    'varec',
-    'variates',
     'variorum',
-    'varios',
-    'vark',
-    'varotsos',
-    'varus',
-    'vasilikis',
-    'vat.',
-    'vatn',
-    'vattimo',
-    'vaucouleurs',
-    'vaudevillian',
-    'vaudey',
-    'vaughany',
-    'vaunt',
-    'vaya',
-    'vca',
     'vecchiotti',
-    'vectorette',
-    'veda',
-    'vegeculture',
-    'vegemite',
-    'vegetable-based',
-    'vein-streaked',
-    'veliger',
-    'veliko',
-    'velleman',
-    'velocipedes',
-    'vema',
-    'vence',
-    'vendange',
-    'vengs&ouml;ya',
-    'vennamo',
     'venters',
-    'ventress',
-    'venturcom',
-    'venture-backed',
-    'venules',
-    'verb-form',
-    'verbish',
-    'vercors',
-    'verdiger',
-    'verdine',
-    'vergina',
-    'verifiability',
-    'verine',
-    'verjuice',
-    'verlinden',
-    'verloren',
     'vermstroy',
-    'vernaccia',
-    'vernaudon',
-    'vernay',
-    'vernazza',
-    'vernikos',
-    'verse\'',
-    'versilia',
-    'versloot',
-    'versuch',
-    'vertical-horizontal',
-    'vertical-market',
-    'veryan',
-    'vescy',
-    'veselin',
-    'vesicularia',
     'vespucci',
-    'vestibuled',
-    'vestris',
-    'vetchling',
-    'vezirs',
-    'vfas',
-    'vgps',
-    'viaggio',
-    'viator',
-    'vibey',
-    'vicari',
-    'vicary',
-    'vicinty',
-    'victoires',
-    'victorinox',
-    'video-disc',
     'video-link',
-    'videodisk',
-    'videolines',
-    'vidler',
-    'vidovdan',
-    'viehweger',
-    'viel',
-    'vien',
-    'viennetta',
-    'vietnamese-americans',
-    'view\'',
-    'view-graph',
-    'viewpoint-shifting',
-    'vigee',
-    'vigne',
-    'vihear',
     'viiib',
-    'viith',
-    'vijayaraghavan',
-    'vijayatunga',
-    'viking-style',
-    'vilcabamba',
-    'vili',
-    'village\'',
-    'village-level',
-    'villani',
-    'villequier',
-    'viloft',
-    'vincit',
-    'vine-clad',
-    'vine-covered',
-    'vinnen',
     'vinta',
-    'viognier',
-    'vire',
-    'virgen',
-    'virginica',
-    'virus-containing',
-    'vis-a',
-    'visages',
-    'vischer',
-    'viscid',
-    'viscosa',
-    'vison',
-    'visuel',
-    'viswanath',
-    'vitaes',
-    'vitalize',
     'vitamin-deficiency',
-    'viton',
-    'vivifying',
-    'vla&ccedil;ek',
-    'vla-3',
-    'vla-4',
-    'vla-5',
-    'vlah',
-    'vlasi',
-    'vmap',
-    'vmmu',
-    'vmsclusters',
-    'vne',
-    'vocalis',
-    'vocalizing',
-    'vocaltec',
     'vodnik',
-    'vogtlander',
-    'voinovitchs',
-    'voith',
-    'volclosing',
-    'volid',
-    'volkermarkt',
-    'volksgartenstrasse',
-    'volkspolizei',
-    'volley-ball',
-    'volontaires',
-    'volpedo',
-    'voltigeurs',
-    'volturno',
-    'voluted',
-    'vons',
     'vorry',
-    'vorse',
-    'vorw&auml;rts',
-    'vostok',
-    'vote-losing',
-    'vote-seeking',
-    'vova',
-    'vowden',
-    'voyce',
-    'vrba',
-    'vuka&scaron;in',
-    'vulgarizing',
-    'vullings',
-    'vult',
-    'vun',
-    'vws',
     'vymura',
-    'vz',
-    'w-',
-    'w-3',
-    'waafery',
-    'wacc-pac',
-    'waccontacta',
-    'wadhwani',
-    'wage-fixing',
-    'wage-regulating',
-    'wagener',
-    'wagenseil',
-    'wagon-lits',
-    'wahagnies',
-    'wahida',
-    'wainright',
     'wains',
-    'wair',
-    'waist-line',
-    'waistbelt',
-    'wait-time',
-    'waitressed',
-    'wakefield-based',
-    'walberdeen',
-    'waldersee',
-    'waldhof',
-    'waldsee',
-    'wales-based',
-    'walgrave',
-    'walhein',
-    'walk-way',
-    'walking-wounded',
     'walklate',
-    'walkmen',
-    'wall-building',
-    'wall-lamp',
-    'wallachian',
-    'wallbanger',
-    'wallie',
-    'wallplates',
-    'walser',
-    'walu',
-    'walzer',
-    'wambaugh',
-    'wana',
-    'wanaka',
-    'wance',
-    'wandesford',
     'wandor',
-    'wanks',
-    'wanley',
-    'wansdyke',
-    'wanswell',
-    'war-battered',
-    'war-cry',
-    'war-lord',
-    'war-painted',
-    'war-shirt',
-    'war-wounded',
-    'warbey',
-    'warbley',
-    'wargear',
-    'warioba',
-    'warong',
     'warp-eye',
-    'warples',
-    'warsett',
-    'wart-biter',
-    'warum',
-    'warzone',
-    'wash-day',
-    'wash-room',
-    'wash-up',
-    'wasik',
-    'wasn\'t',
-    'wassira',
-    'watchnight',
-    'water-carrying',
-    'water-depth',
-    'water-gazing',
     'water-glass',
-    'water-heater',
-    'water-sharing',
-    'water-tower',
-    'water-treading',
-    'waterbase',
-    'waterbird',
-    'waterbratz',
-    'watering-hole',
-    'watermanship',
-    'waterperry',
-    'waterpipe',
-    'waterpolo',
-    'waterpump',
-    'watersnake',
-    'watertown',
     'waterwings',
-    'wathelet',
-    'watkiss',
-    'watkuweis',
-    'watsonia',
-    'wattages',
-    'waulking',
-    'wave-motion',
-    'wavery',
-    'waxbills',
-    'waylon',
-    'we-group',
-    'weah',
-    'wealth-',
-    'wealth-creation',
-    'weaners',
     'wearhead',
-    'wearunders',
-    'weasel-faced',
-    'weaselly',
-    'weatherbound',
-    'weathercall',
-    'weatherspoon',
-    'wedekind',
-    'weed-ridden',
-    'weeders',
-    'weegee',
-    'weekending',
-    'weembledon',
-    'weenor',
-    'weensy',
-    'wefts',
     'wei-kuo',
-    'weigela',
-    'weighing-in',
-    'weight-bearing',
-    'weight-gain',
-    'weight-shift',
-    'weightwatcher',
-    'weinreich',
-    'welburn',
-    'welcombe',
-    'welega',
-    'welfaria',
-    'well&rehy;defined',
-    'well&rehy;informed',
-    'well-arranged',
-    'well-brought',
     'well-described',
-    'well-displayed',
-    'well-hung',
-    'well-led',
-    'well-observed',
-    'well-pit',
-    'well-recognized',
-    'well-rewarded',
-    'well-sculptured',
-    'well-selected',
-    'well-set',
-    'well-spring',
-    'well-supplied',
-    'well-told',
-    'well-treated',
-    'well-turned-out',
     'well-weathered',
-    'well-wishing',
-    'well-worked-out',
-    'wellappointed',
-    'wellerd',
-    'wellwotdouthink',
-    'welsh-based',
-    'welshpool-llanfair',
-    'weltanschuung',
-    'welted',
-    'weltering',
-    'weltschmerz',
-    'wemberham',
-    'wepwawet',
-    'were-wolf',
-    'wern',
     'westcote',
-    'westerling',
-    'western-backed',
-    'western-led',
-    'western-type',
-    'westfields',
-    'westham',
-    'westhay',
-    'westlea',
-    'westleigh',
-    'westmill',
-    'wet-looking',
-    'wet-shave',
-    'wet-suit',
-    'wevelgem',
-    'wf',
     'wge',
-    'wgs',
-    'whacko',
-    'whale-backed',
-    'whalebones',
-    'wham-bam',
-    'whammo',
-    'wharfage',
-    'whatevers',
-    'whatling',
-    'whatshisname',
-    'whdh-tv',
-    'wheatfeed',
-    'wheel-arch',
-    'wheel-clamp',
-    'whelford',
     'whern',
-    'whimster',
-    'whipsawing',
-    'whirlpooled',
-    'whisky-sodden',
-    'whistleblowers',
-    'whitbeck',
-    'white-and-black',
-    'white-and-blue',
-    'white-blonde',
-    'white-fringed',
-    'white-ground',
-    'white-heat',
-    'white-outs',
-    'white-ringed',
-    'white-ruled',
     'white-tufted',
-    'whitecroft',
-    'whiteface',
-    'whitefriary',
-    'whitepark',
-    'whitewashes',
-    'whiteway',
-    'whiteworm',
-    'whiteworms',
-    'whitmarsh',
-    'whitrope',
-    'whitten-brown',
-    'whittome',
-    'whizz-bang',
-    'whole-rock',
-    'whoops-a-daisy',
     'whosis',
-    'whup',
-    'whydu',
-    'whyteleafe',
-    'wickremasingh',
-    'wicksy',
-    'wics',
-    'wide-body',
-    'wide-collared',
-    'wide-tooth',
-    'widely-reported',
-    'widely-scattered',
-    'widener',
-    'widmann',
-    'widzew',
-    'wied',
     'wieghorst',
-    'wiend',
-    'wier',
-    'wiesner',
-    'wife-battering',
-    'wigfall',
-    'wiggie',
-    'wijk',
-    'wikana',
-    'wilamowitz',
-    'wilcoxin',
-    'wild&rehy;caught',
-    'wild-fowl',
-    'wild-oats',
-    'wildean',
-    'wildmoos',
     'wilhelmplatz',
-    'wilja',
-    'wilken',
-    'will-of-the-wisp',
-    'willasey',
-    'williamite',
-    'willibrord',
-    'willings',
-    'willl',
-    'willowcroft',
-    'wilm',
-    'wilsthorpe',
-    'wiltham',
-    'wiltwood',
-    'wimhurst',
-    'wimille',
     'winbolt',
-    'wincy',
-    'wind-noise',
-    'wind-power',
-    'wind-speed',
-    'wind-torn',
-    'windata',
-    'windblowers',
-    'windflowers',
-    'windhover',
-    'winding-house',
-    'windo',
-    'windowledge',
-    'windows-',
-    'windschuttle',
-    'windshields',
     'windshift',
-    'windup',
-    'windwards',
-    'wine-glass',
-    'winfrid',
-    'wingfields',
-    'winick',
-    'wining-and-dining',
-    'wink-wink',
-    'winker',
-    'winkling',
-    'winmail',
-    'winned',
-    'winslades',
-    'wintams',
-    'winter-crack',
     'wintercure',
-    'wintergreen',
-    'wintersgill',
-    'wipo',
-    'wirbel',
-    'wire-cutter',
-    'wire-frame',
-    'wire-wool',
-    'wireworks',
-    'wireworms',
-    'wirgman',
-    'wish-fulfilling',
-    'wisher',
-    'wising',
-    'wisse',
-    'witch-ball',
     'witchfinder',
-    'witeczek',
-    'with-',
-    'within-board',
-    'within-child',
-    'withoot',
-    'withycombe',
-    'witnesseth',
-    'wittamer',
-    'wittiness',
-    'wittkower',
-    'wiu',
-    'wiwaxia',
-    'wixsom',
-    'wizzy',
-    'wladek',
     'wlodarczyk',
-    'wndx',
-    'wobblies',
-    'wobbly-voiced',
-    'woebker',
-    'woevre',
-    'woffle',
-    'wohlfarth',
-    'wojoik',
-    'wolfscastle',
-    'wolfshead',
-    'wolhuter',
-    'wollies',
-    'wolly',
-    'wolstencroft',
-    'wolter',
     'woman-hater',
-    'woman-to-woman',
-    'won\'t',
-    'wonder-gazing',
-    'wonder-rabbi',
-    'wood-ash',
-    'wood-carving',
-    'wood-engraving',
-    'wood-panelling',
-    'wood-pulp',
-    'wood-work',
-    'woodbinder',
-    'woodboy',
-    'woodcroft',
-    'woodfall',
-    'woodfarm',
     'woodhatch',
-    'woodmansterne',
-    'woodworms',
-    'woollen-draper',
-    'woollett',
-    'woolloomooloo',
-    'woolly-minded',
-    'word-board',
-    'word-count',
-    'worden',
-    'wordmaster',
-    'work-disincentive',
-    'work-line',
-    'work-people',
-    'work-surface',
-    'workcharts',
     'working-party',
-    'workingman',
-    'world-champion',
-    'world-leading',
-    'world-renouncing',
-    'worlders',
-    'worldscale',
-    'wormers',
-    'worpole',
-    'worse\'n',
-    'worse-looking',
-    'worst-paid',
-    'woughton',
-    'would\'t',
-    'wouldny',
-    'woundwort',
     'wrabness',
-    'wrayburn',
-    'write-protect',
-    'writeback',
-    'writing-desk',
-    'writing-masters',
-    'wset',
-    'wtf',
-    'wufi',
-    'wulfred',
-    'wumman',
-    'wunis',
-    'wurst',
-    'wyddfa',
-    'wyde',
-    'wyer',
     'wynstay',
-    'wyrdwriteras',
-    'wyseplant',
-    'x-factor',
-    'x-neuron',
-    'xanthopterin',
-    'xapa',
-    'xatmi',
-    'xavante',
-    'xbus',
-    'xdbus',
-    'xeasy',
-    'xedit',
-    'xephon',
-    'xerophytes',
-    'xhosas',
     'xianju',
-    'xiaotong',
-    'xicales',
-    'xilinx',
-    'xinet',
-    'xizhe',
-    'xlrs',
-    'xmax',
-    'xoo',
-    'xtnd',
-    'xvideo',
-    'xviiith',
-    'xvith',
-    'xvs',
-    'xyvision',
-    'y\'hear',
     'y\'kin',
-    'y\'knaa',
-    'y-borne',
-    'y-direction',
-    'ya\'nina',
-    'yabba',
-    'yahsi',
-    'yak&ndash;18t',
-    'yak&ndash;3',
-    'yak-3',
-    'yammeaka',
-    'yammering',
-    'yanine',
-    'yantras',
-    'yaps',
-    'yardangs',
     'yarded',
-    'yardmaster',
-    'yarg',
-    'yarrows',
-    'yartek',
-    'yatama',
-    'yayuk',
-    'yb',
-    'yc-6',
-    'yeandle',
-    'year-group',
-    'year-spirit',
-    'year-to-date',
-    'years-',
-    'yeast-free',
-    'yeees',
     'yeelen',
-    'yella',
-    'yeller',
-    'yellow-billed',
-    'yellowy-brown',
-    'yen-bay',
-    'yerba',
-    'yeroen',
-    'yersel',
-    'yesterknits',
-    'yeth',
-    'yeugh',
-    'yf-23',
-    'yfs',
-    'yiddishe',
-    'yigletu',
     'yim',
-    'ymir',
-    'yo-yoing',
-    'yobots',
-    'yodelled',
-    'yodemane',
-    'yokefleet',
-    'yokosuka',
-    'yondo',
-    'yonnondio',
-    'yoshinori',
-    'you&mdash;but',
-    'you-wen',
-    'youd',
-    'youngii',
-    'youssou',
     'yowls',
-    'yp&ndash;59a',
-    'ypn',
-    'yrtle',
-    'yss',
-    'ystradfellte',
-    'yucat&aacute;n',
-    'yudenich',
-    'yugos',
-    'yumurtalik',
-    'yuppification',
-    'yuricich',
-    'yussef',
-    'yuste',
-    'yve',
-    'yvraine',
     'yx',
-    'z-lite',
-    'z-parameter',
-    'zachaire',
-    'zaharoff',
-    'zalm',
-    'zamalek',
-    'zamaron',
-    'zambrano',
-    'zammit',
-    'zampieri',
-    'zanaki',
-    'zanen',
-    'zanskari',
-    'zarst&oslash',
-    'zay',
     'zdenka',
-    'zebra-crossing',
-    'zecchi',
-    'zechstein\'',
-    'zehetmair',
-    'zehrer',
-    'zeiten',
-    'zekel',
-    'zemlinsky',
-    'zenica',
-    'zenko',
-    'zeon',
-    'zephyrus',
-    'zeppo',
-    'zeqo',
-    'zero-address',
     'zero-g',
-    'zero-growth',
-    'zest&oacute',
-    'zeuner',
-    'zezeeee',
-    'zfy',
-    'zhejiang',
-    'zhong',
-    'zhongnanhai',
-    'zhuang',
-    'zhuhai',
-    'zi',
-    'ziba',
-    'zinc-brass',
-    'zinsou',
-    'zipfel',
     'zivota',
-    'zoehrer',
-    'zoeller',
-    'zoetermeer',
-    'zofran',
-    'zogoth',
-    'zollinger',
-    'zollner',
-    'zoom-lens',
-    'zoonomia',
-    'zoptic',
-    'zoyd',
-    'zs-ekk',
-    'zukunftsmusik',
-    'zuni',
-    'zuno',
     'zurcher',
-    'zurichsee',
-    'zurp',
-    'zweite',
-    'zwide',
-    'zwolle',
+)
+
+blocks_33 = (
+    ' )&acirc;ge"\'gr/&bgr$#;-c\'!d&*interferon&\'peptide&0tocopherol:total%\'5&bgr;1"+mp&dollar;1$&;alpha%&cement&&handon&%oogan%\'formula%&gamble',
+    '%#l/2%$read%#son&#up2%%young&\'urewicz!)bgr&ggr;-&%t&ggr$/;-glucuronidase&*haemolytic&*relaxation%/2-microglobulin%(blockers"(sol;dfss\'2os&bsol;emm386.exe',
+    '"*ull;pietro!.ccaron;ertovka"(ommat;fv#\'py;1980!%dgr;1%"73%!d%!j%%n&sim%!v$!_"\'ivide;2",ollar;0.0001*!5+!6',
+    '*#625+!5*"70+!m*"85*"92(%1,231+"95*#995)#.16*+2&ndash;1.6+!7*"30+!4+!8',
+    '*"62+!5+"bn*"89*"97)%0,200+#700*".4,!m+"9m*$0.2m+"bn*!3*$4.8m*!8',
+    '+!5*"2m*!4*%5,000*"6m))2,000,000+#700*".1+"4m+!8,!m+"95,!m*30,000&ndash;180,000+#.2m',
+    '*"2m*/5&ndash;160,0003&75,000+(,000,000*$6.2m*%8,000*\'billion)&34,000*"5m*!6*!8*$9.2m)040&ndash;210,000+(,000,000*"2m',
+    '+!m*%4,000).5&ndash;25,000*1,000&ndash;20,000.!m+#700*".2+!3+"4m+"7m*30,000&ndash;250,000*"5m*!7*"8m)%6,300',
+    '*".5*!6*!8+$,000*"9m)%7,800*#.9m*%2,000*/5&ndash;265,000))8,000,000*#.1m+"4m+"6m*"0m*%6,000',
+    ')$9.6m*!0+!m*"1m*!6(%2,250*#350*\'500,000*$600m*\'800,000)#.10*"25*"40*"97)%0,700',
+    '*)3,000,000*"6m*!7)$1.9m*"0m*"5m*!m)$2.50,!m*%9,000)%3,500*#.1m+"4m+"5m+"6m',
+    '+"8m*!1*%3,000)$4.4m+"95*)0,000,000*%8,000)&5,000m+#500*/0&ndash;350,000+!.*%6,000))6,000,000*"8m))7,000,000',
+    '+"4m+"5m+"7m*%5,000*"9m)$8.3m*$2.1m)$9.0m+"3m*!0+$,000*"5m(&3,300m*$400m+"50',
+    '*#900+"95)#.00+!m*#125*"25*!3+!0*!7)&0,000m*#.2m+"5m+"6m*/0&ndash;500,000+2,000&ndash;400,000',
+    ')$1.9m*%0,000,#700)"25+$,000*!7)$3.5m*"0m*%8,000))4,000,000*#.9m*!0)$5.5m*/0&ndash;450,000)$6.3m',
+    '*"0m*"7m)!7*$,500*#.3m+"5m+"8m*%0,000*"7m))8,000,000+#500)%9,000*#.1m(-4&ndash;6,000)(,000,000',
+    ')#.50*!7)#06m)!1*$,100+#400)#25m)&30,000+!m*%4,000)&40,000))5,000,000*"00)$6.2m+"9m',
+    '*#.9m*%4,000*!m)$8.6m*"5m)%9,500*#.50(%5,400*\'500,000)#.00*!2*!6*!9))00million)$1.1m',
+    '+"7m*%2,000)!2*"1m*%8,000)%3,000*/0&ndash;900,000)!4*#.3m+"8m))5,000,000*#.7m*/0&ndash;900,000)%6,000*#.1m',
+    ')&73,000)$8.0m)"95)\'billion*!n(%6,200*\'500,000*#800)".7*"9m)$1.4m+"5m)%2,500*!5)$4.4m',
+    '+#436*#.2m)!8)%9,000*!m()7,000,000*#300*#800)".2*!8*"95))0,000,000)!1*%3,000)!2',
+    '*$,000)!7)"80+!m()8,000,000*#400*#800*#900)#.0m*"4m*"95))0-million*#.5m)#2.5*%5,000',
+    '*%6,000))5,000,000)&80,000*!m)!9)"bn(&9,540m)#.95)/0&ndash;120,0003%5,000*/0,000&ndash;1.2)"1m)"50)&60,000(!b',
+    '(#xxx!+eacute;clat)#rit(&douard((t&eacute)#ude"(circ;tes!+formula&ins(";s)#ths)!x"*rac12;mile&"4%\'#;oz(#tsp',
+    '!)ggr;-rays"$t&gt#";0$(10&deg;c&!0%&30%ibw%!5$"20$"40$"50$#or=!\'lt+-&gt#&;0.001$#100%"20',
+    '$,2.4&ndash;25."52%"0%$"3%$!6$!8$+filename&gt$%he&gt$$name%#ine$6shift&gt/&lt;escape&gt%&igh&gt$\'text&gt%"he$#var',
+    '&$;114\'#238\'"82\'%after\'"ed\'#his\'$ibid\'\'members(&ipmip.\'$only\'$some\'%there*!y("wo\'%where',
+    '\'*g/&micro;l)#100\'&mol/30+#l/l!*ndash;5.30\'\'n&ndash\'"or!*plus;0.144%$mn;5"-ound&frac14;m+$34;m&&+34.99&%;0.12)#5bn)!9',
+    '("00\'%1,010+!1*"35*"60*"90)#115*"20*"80)\'200,000*"20*"40*&50,000)#318*#31m',
+    '*&78,892)#406*"20+!5*#59m*"80)0500-&pound;2,000*"25*"70)#675*"90)\'700,000*"84*"95)#991',
+    '(%.03bn*!8)"13*!4*!7+!m)#23m*"4m*\'million)"34)"43*!6))5&ndash;22".5)"72',
+    ')"87)"94*!6(*0&frac12;m)1,000&ndash;15,000)*-&pound;19)#.20*"6m*!7+!3*"80+!m*"9m)+0&ndash;200**,000-rated',
+    '*"0m)$1.4m*!m)$2.3m+"5m)%3,000*!m)$5.2m+!8)$6.50)%8,000)$9.70)!k)"m.(%1,040',
+    '*#900)#.19*"45*!6*"8m*!9)$1.2m*!m)#2.4+"55+"7m*!m)%3,000)%4,957)"5m',
+    '(.2&ndash;18,000)(,000,000)#.1m*!3*"45*"6m*!9)/0&ndash;150,000*#.00*\'million)"1m)$2.4m)%4,000*#.20)$9.99',
+    '(%3,200*#400)".2+!0*"45+!7+!9*!8+!m)%2,000*".6*!m)"3m)"4m)%6,000',
+    '($4,99)#.2m*"4m*!7+!5+!m*"90)$0.85)%2,000)%4,000*!m)"50*!m)%8,000*#.62',
+    '(25,000&ndash;25,000-.-&pound;20,000)".2+!m*!4*"54*!6+!m*!8+!m*!9)30,000&ndash;250,000*!.)!1*!m',
+    ')%6,000+#780*!m)%8,000*!m)$9.99(%6,192)".1*"35*!4*"75*"8m)36,000&ndash;233,000)%7,000)"8m',
+    '*#866*#900)".1*!2*"3m*"60*!8)"1m)!3*$,000)$6.24)"7m)%8,500($8.6m*!8',
+    ')/0&ndash;250,000*!0)"3m)%5,000)%7,500)$9.5m)\'million(%9,200*#500)#.4m*!5)"2m)%5,000)#9.5(\'m-rated',
+    '\'*2&frac12;m(0,000&ndash;3,000)#265*"80)#465)\'500,000+!5)#785(#.16*"bn)"27*\'million)"36*"bn)"54',
+    ')#71m*!4)"98*#99m(+0,000-worth*#500)!.*"1m*"7m))0,000,000*"00*"bn)!1)!2*#.3m',
+    ')%7,000)\'billion)!k(#1.2*!4)%3,000)"7m)%8,000)"9m(&21,000)!2($3.5m*"7m)$0.8m)!3',
+    ')%8,000)%9,000($4.42*!5)!1)!3)!4)%5,000)!6)!7)%9,000*!m(.5&ndash;40,000)".0*!5',
+    '*(,000,000*!. +macro-scale%&fossil%)nutrients%%somic#"ve"$daba$!r#"ec$%laine$!r%"ia##nes#$ocks',
+    '"$esdu"$fdal"%g-lev#$amar$#sin#!b#"en%#nis#%iness#(netising\'$zing&\'ometery\'\'statics"%homed"&iestie',
+    '$$tool#*n-sequence&%tream$"au$"ie$&lander$%spars$&wheels#%slova#$tlin$"ri#"zl"%jeurs#(or-label%(ity-rule',
+    '")kassarese#"en$$rere#$ower#&symiuk""l.#\'acanang$&i-land$%mocco$$prop##bon#$doom#"e-%*associated%$male',
+    '$%ndoma##ika#,kekv&aelig;g##ouf#%piero$&laquet#3t&eacute;zsk&eacute$$eser#%vasia#!y"$mani$$toto#$eluk#"mi#$yrin',
+    '$$hour%#unt$&killer$\'marking$+on-the-spot#$acor$-ging-director#(d&eacute$$atio$!l$%oline#&essier$%uvers#%gochi%\'tsfield',
+    '#*ichaeanism&"ee#$lius#&nikins%"no#\'oeuvere$$plax$"va#%sfeld$$holt$"is$#oni%"or$"us#$tero',
+    '$#rap$(zouranis##ush#(watching#(z&ugrave$"ur"\'plewood"%qarin"#rah$"ni$!s%"li$$uded%"ke##bel',
+    '&#tex#+ch&eacute;s%"-3%$feld%#in\'$#ian#(escalchi#"ga$$erie$$uess#&icourt$"el$"ko$"os$&scotti',
+    '#&jorams#"ka%!b%$ndey$&er-pen%\'t-house\'\'sharing($tyle$"iz$&tplatz#&meliuc#$noch&!k#%oveus#-riage-breaker',
+    '$#ett$\'hallian#$tela$#ika\'$inen#"ut#$well$#nad"$s\'ud#%aharu#%cagni$$hler#\'haallah$#ona\'$land',
+    '#$inde##ker#%onite#)s-density%)marketing&%urder%,spectrometry$"ah%"ro$$comp$$enet$(imiliano#.ter-apprentice\',manufacturer\'$tape',
+    '&$line$%icate(#ing$%rovin"\'tamoros$#ura#+ch-by-match&)clinching&\'fitness&"up##ete#$ifsa##suo##ten%-r-of-factness',
+    '$$hies&#ola$#ole#"ur%/ation-promoting"%ucher##dit#\'ritanie#\'ve-pink"$vala"#xat#%optix##xam"#yak#$bank',
+    '#\'orazgos%%esses#$tals#$umba"#zie!$baye"#eya"!h!"ck"&lennon""ui!$d-11"!o!#eac#)dow-grass',
+    '#%nt-nn$!z#%tfork"\'coptera"&dalark$"us#$ders#&gyessy#*ia-related$*cal-school\'\'ization&$trix$*eval-style$!i$#net',
+    '$#sed$)um-length\'$rise$$wipe#$oune#$tner""fs"\'ga-buck%\'success$&drives$$nisi##gie#!s"$htab"%ibion',
+    '#$lhan$$leur#$rwon#)sterstuck"%lamed$$nins#$chet#"dy#"le%!t$%ifica$"oy$"te$$uish##nik',
+    '%"ye#$wood#!y"$mons$\'ry-chip"*n-midwives#"dl$"us#!e#%tored#\'umaster"*o&ntilde;o")probamate"&raklon#\'cadante',
+    '##ita#!k##lan$%ewood#%rylee#\'seybeat&*side-based"&selson#$hiai##nil#,sage-passing$6erschmitt-bolkow-blohm$"or$%uages#"wa',
+    '$$flow$)l-binding&%metal&%using%\'iterary&#zer$)narrative$)physicals#$elli$!o$)rological#\'hodolgy&$plan#!n#(re-gauge',
+    '%#bus%$tect##son"&zzadri!)g-calcite!%hidas!&ibenge"#cha$%elene$"on##kel#/ro-kernel-based&&mosaic&,to-mainframe%%cadam',
+    '%&fiches\'&lament%(graphics%$nema\'!t%#ref%&worlds"\'d-1640s%#862%#945&"77$2eighteenth-century$2fourteenth-century$$long$%plate',
+    '$(tertiary%)ransverse%.welfth-century#"dl%+e-classness\'(european\'%saxon\'"to&&ground&$sbro\'#ton#0fielder-defender#!h#%iscan#)lesbrough',
+    '#$rash"&escher"&fegyne"(hailovic"\'kaeloff$$illi$#rdo#%hoels#"is#$onos"&lacron$$gres&!o#&eposts##ing',
+    '$.t&auml;rgrenze#\'k-shake&"op$#boy$&minder$&shakes##les$&igauss%#kin%)on-seller%$rems%\'sievert%$volt$"on&"es',
+    '"%micke#"mo##ose""nc$#her%"in#*d-altering%\'impulse%(spinning$%crime$"el$$maps$$song$%wiped##ett',
+    '#+i&egrave;re$#-14%%drama%(holidays%*revolution$#ato$&branch$#lab$/stries-delegate$#tex##kes#&nehaha$#ick##oru#%skoff',
+    '##yip"%odrag"\'rabella$\'ge-2000$!j$%malfi#$oirs##pur#"vs"+s&egrave;re#+-classified#%arden#(carrying$\'ellanea$(onducted',
+    '%#unt#%dated#1e-en-sc&egrave;ne$"es#\'fitting$%ormed#$gave$$ives#(hchifing%"on#&inform#&naming#(oprostol#&places#*remembered',
+    '#)t-covered$!a$%iming$"ra%$eats$%yping"%thian#(omycin-c#%rovic##tag$\'elstand"$vart##vis")xed-media#&master',
+    '#%umaki#(zen-mast$!i!"jq!$lada!%mmmmm#"ph!%ncars"$evis""od!(oabitess#"rs"&bilier&+ty-impaired"#che',
+    '%%stern$&beggar",de-splitting$$cate$\'l-maker&.turned-actress$#rno#)ularizing"#ers##sia"!f"!g#&amarat#&gridge#$huls',
+    '#%inder"#ion#(sturized"#jjo"&khehle"%lasse##dan$!e$!s#&egrips#%fetta#&linees$!s$%uscum##ody',
+    '#&script#&ybdate""mi$&gliano$!s#!o$$tara"+n-oxygenase#\'adology$"mi$%stero#$biot#+day-morning$"es&"ir',
+    '#(etarized$)y-grubber&%loser%%glass%%maker#$imbo$#sha$!x#&ofibre$%phony%)lacophora$"ry$(tonicity#%petit#%tagus',
+    '$)br&eacute$$calm$\'ecatini%\'lovesco%%nvers%\'oliveto%%peque%"ro%%sinos$\'ferrand$&icelli%#gny$\'morency$!o$%reaux',
+    '#!y"$ocow#\'dswings##min#\'n-faced$%fleet&%owers$(lighters$$walk##rat$%close"$pani#$pets"\'ralised$"va',
+    '##bis$"us#$dova#$eens$"so#\'gantina##kar#&monism#-ning-sickness#&phitis%&ologie#"ri##vah$"in"*she-rabaan',
+    '##man#$port#&quitia#\'s-grown$&killer#$tain$"ow"#tha$!e%&r-ship&\'fucking&$sole#*or-cycling&\'scooter%&biking',
+    '#"um"&ugrabi#(ld-board\'&reaker$#ted#.ntain-climbing($bike(%sport%#pax#&ssavou##tet$\'h-blown&\'to-anus)&caecum"%vitex',
+    '#"ry#!s"$ylan#"se"$zaic#\'iruddin!#ppp!"qa!#rsc!)sc-funded"%d-sms"#srs!"tn!&uayyad"*ch-married',
+    '##die#%flows"$gica"&hajirs$#mad%\'madiyah##oho"#ire"\'kherjee"%lazim#$cted#&hammer$$eren##kay#"lu',
+    '#\'ti-bank\'\'usiness&&clause\'&ulture&+environment&%grade&-millionairess&$pack\'*rogramming&&roomed&$task\'%enant&$unit%\'gravida%(levelled',
+    ')!s%#max%$page&&le-dig)&length)$unit(#xor%(sectoral%&valued"$mmie%%fying"&nassar#$cher%&hausen#&danity',
+    '%#mba#&fichet#&icipio$!m##shi#"ty"#ove"(ra-muras$\'lidaran&"st##jan##nau#"oc#$risk"%scina',
+    '##een$%ngezi#(ic-based&&filled&\'related%#all%"ke#%manno#&orgsky#&sulman#"ta$$onen"$tang#"ex#(ual-fund',
+    '"%vvers"\'zictech!$wali##tex!(yceneans""ln""ne"$otis"\'riapods%$rchs"%self\'#"is#%teron$#ici"#ung',
+    '"*xobacteria %n\'pan!"-3"&hexane"%tuple!".i""n.!"67!%aaucl"#bis""ca#$hips#\'ionales"#dor#"ur',
+    '$"ls#"fi"$gpur",ham&aacute;n$$piet$$riya"*il-varnish$!a$!e#$mski#"ni#$ssus"\'koporon""la#!c',
+    '##che$!o#%e-day$"nz##iki#&utamba""ne#$keen#$nini#%oamps#(tgaredig\'!w"#rai$"na%"jo',
+    '$+o-terrorist%$ndam#+endranathan#$king$%omzem#+row-chested\'&hipped&$back&$cast"\'salised#%iriya#%sauer(!s$$irou")tal-based',
+    ')%level(*ist-minded(&museet#%ufian$\'ral-gas\'"es\'!l(+y-aspirated%)e-goddess&#lle"#uta$#ica"%vajos##ico$!d',
+    '#!c"#zie!$bips!$cito"!l!\'d4-nd4l"!d"&ebugre#"ti"%ricim!,ea-sponsored#,r-bankruptcy%$fore%$gale$$chos',
+    '"\'bbeling#$ulan%#osa"(ccessary#%k-tie#+tar-feeding""da#%lloyd"(ed-based$$lers&%women#"ta"$ftis")gativland#&ritude',
+    '"#ico#(gbouring$\'hboured#$lman"%llies"-mathelminthes"&nthead")o-elitism$+imperialism\'*ressionist$*lamarckian,"sm$)pluralist$+romanticism,!s',
+    '#(ptolemos#\'tronics"$quam"+rvewracking"&spelem#(segutten#&tmates"%tcomm##mbx#\'servers##zer"&umarkt#*ro-science\'&urgeon%\'anatomy',
+    '%&sphere"#vah##ton""w\'#*-formation$%issue$$type#&boulds#)castleton#"es#%field#$hart%0ven&ndash;dieppe$$olme#*ly-defined',
+    '&\'unified#&mill-l#%point#*s-blackout$#ize$!s!#fcc""fc"$snet!(ganasans""om!"hi#!s!$iace#"id',
+    '"(belungen#$lock"&candro$/rag&uacute;ense#%colao#!f##hts#$oban$%check$&llette&!i"$ddry"$eddu""fs"%g-nog',
+    '#\'ht-beat\'#ird&(clubbing&&porter&#sky%$caps%%hawks#$nogs"#hat#$onga"#jgh"#lon"+mble-footed$$us-7#"co',
+    '#"ue"+ne-panelled&$iece%(to-fiver%&volume$&ty-day\'$foot\'$mile\',two-year-old#%jaman#&tendos"&rvanas"$ssho"\'tration$"ex',
+    '%\'samines""va""xa"#zar!$jiru!#lba!#mji!"nn!(o-choice$)ompromise#%entry#&growth#$home#)mans-land#&trumps',
+    '"+assessments"#bay"&ctorum"#dar#%dings#&e-pair#*ule-mining"&irieux"!k"\'llekens"$made$"il$%phila#%ekind#"is',
+    '#%-abta%*chievement%(esthetic%\'ffected%"rt%\'sbestos&(sociated$\'banking%%elief\'(ligerent$)cartesian%\'elibate%)ommitment&(nsenting((tituency',
+    '(&ultant&$pper\'&yright%\'ustomer$*decreasing&%fence&\'menting&+termination$+egalitarian%)mployment%*stablished%)xpressing$*fee-paying$\'graphic$&health',
+    '&"ir%(ousehold%+umanitarian$#icl%-dentification%.nterventionism$(language%(iability&$quid$\'mastery%\'usician$)narrative&"to%"et%&ursing',
+    '$\'peasant&\'netrant&%ptide%$ilot%\'ractice&\'oducing\'$ject$&reader\'(lization&(dundancy&$flex&!m&)striction&%venue%&usting',
+    '&*tisfaction%*egregation&&quitur%%hrink%#lav%"na%(overeign%$pace\'"rc%.tandardization\'(temented&+oichiometry&&ranger%)ubmission$\'tobacco',
+    '$,work-related("er#+conformance#(limiting#!o#)reporting#*specialist"&on-day%$tide\'"me"%rdboe$$ique#)m-control$%idtec##th\'',
+    '%#ing%#men&#oor%#ton%,ward-dipping&-est-southeast##vex#!w"&se-dot%#job%$leaf%\'picking%\'to-tail$&bridge$(y-parker',
+    '"*tarbartolo#\'e-paper%%taker##her#!w"$umea"#vac$#gen#$elli$!m$#nas#*odvorskaya$"ye"$wise!#pcs',
+    '"#ova!%uages"-clear-related"%ffing"#kri"&m-lock##eri##mer$"us"#ndy#&gesser"+rsery-rhyme"%sselt"\'tbourne##kin',
+    '#$tin\'!"vh"!r!"wo"#rac!#yah""et"&labone""up!\'zoungou )o\'lantern"$pray!#.e."!s!(akenhill',
+    '##man$#oor"#res"\'sthouse!\'basanjo"$eche#\'nreizer""ie#!n",ject-related&%bench&$ware"!l#$asts""ol',
+    '"/servation-based!#ccu"!e#\'anicity""ky"#t-4#"av#3ober&ndash;november$$pods%#ush!"db"%d-bod#(ly-named#!o"(our-free',
+    '""ob"!s#*ophagogram!\'f&ndash"!-""ek#!r"(f-budget$$chip$%drive$&kilter$$take%$rade#*ence-based#!i',
+    '\'#tes&#ers&&nalium$%ngton!#ggi$!e"+i-compliant#"er"(nissanti"$onek"!s!%hmeda!#ics""ec"+l-importing',
+    '##eau#%trakh!%kland"#rug"$ullu#"ma"%wanyo!)ld-master"%esker"#gas"$icom#&go(dt)##nka#$vary$#ero',
+    '""la$)ntaytambo##ies"#mer"#tre!&menoni"$rahs"!v!&n-form#$hand#$pass$$hase#$song#&target$)he-ground',
+    '$$rade#$ward"!."!b"%covin")dansetron"&e-acre$&colour$%dayer$&family$%in-10%"sh$)kilometre$#lap$$note',
+    '%"ot$$test$%world##ida"#lap#)yapproved"!n"$uora"\'yeanusi!%oking"(lerinnen#%igans"!n"%ooooh#*ps-a-daisy',
+    '""do"+en-bridging%#cut%$file%+heartedness%$reel%#sea%&topper%%weave$*mindedness"(hiocamax%%pogon%&sparte"+ium-growing&&taking',
+    '%$iton"$ssat""t-#+halmologist#*ionholders#"us!\'r&mdash"/al-anal-phallic#)nge-brown&#man%!y"%bitel"/der-maintenance&,of-magnitude#&inatio',
+    '$#del"%ficer""ga$0nism-environment%*o-chlorine$!z")jonikidze"!l"#mes"$onel#$tund""ta#\'hapedic$+opantograms&$edic',
+    '$#000"!b"*car-berman#\'ulation"#eri"\'motical##und"#ney"!r")teoclasts#"ra$%owski"+vobozhdenie"#wel!&tahuhu',
+    '#"sh""ec#!p"#ini"$suka".toman-occupied$"ne!$udom#!s"#est"%lsnam"%ragon"&seburn"\'t&mdash#)-and-back',
+    '%#ome\'%peted$$feed$,of-character(&ontext\'$hand($ouse\'&london\'$step\'$time$\'pointed&%uring$#run$\'thought&$rust',
+    '#&bowled#(er-space#%foxed#%lands#\'reaches#(weighted"%vrier!&ver-35%"50%(analysed%)balancing%\'charged&#ome\'\'nsuming($trol',
+    '&#one&\'rinking&%ubbed%*estimating&\'xpanded\'\'tending%\'funding%&geared%*identified%&looked%$paid&$itch&(olarized\'(ssessive&\'roduced',
+    '($vide%)recruited%\'selling&)timulated\'\'raining(#ess%%throw%(watering$(abundant%(chieving$%built$&commit&)ntrolling$*emphasises%)xpressing',
+    '%#lew$\'growing$)mastering$#pay\'#ing%&raised&%onate$$rate\'#ing$$sell(#ing%%imple%"on%\'peeding%%trung',
+    '$&tipped%%opped%$rain%#ura$&values(#ing$\'weights%&inters!\'wlerton""n.!$xcar""er"$stat"(y-bottle##ria',
+    '!#zep *p&aacute;l*!l",eacute;ronne)%triat#*grave;tain")ndash;59a"8rcaron&iacute;kop&ecaron!"\'i!$-51s"#hpr""k4!$.c.s"#p.s""v.',
+    '#!5!"52!"91!%a-kua"!a"(chyderms#!i$#oli#&k-flat%%train$"ie%\'ng-case"$darn#$gham#$rona',
+    '"$hang"*in-related$%t-box&\'peeling"$ktia"%lache$-eodictyoptera%$stra#2estinian-jordanian#%iwoda#&m-leaf$$tops#"op#$plus"\'mphilia',
+    '$%leiro$&yiotis#\'creatin##dim$#ove#"ed$)l-beating%$book#%gaion#)ic-struck$"zo#%jsher$#win##key#&taleon',
+    '$$ling$&omimed#$zano"#oli##tao"$pain$$list#%erbag%$mill##ias$(er-mache$%llote$!o"$quet"%rafil',
+    '&\'turgies%+lel-derived$%peted$%schiv%(ite-host\'#ize%$keva$%tones$$vion#"ce%&l-gilt&#ine##due#$esis#"ga',
+    '$\'sh-pump#\'k-based#$oles#"rs#$sees$!i#*t-financed$!c$#hia$"ia%)cipation.&3ular-identification%"re$)ly-filled\'%owned',
+    '$!o$"ry$,y-controlled&\'pooping"\'sinetti#$palj#%quali%!e#(sarowitz#\'torates$$rana%!e"$tala#$erno##het',
+    '#%ourel#\'riotico$&onella#"si#,tern-forming$"is&#son#\'wardhan"%ulino"\'villion#"le$$ovsk##oni"\'w-print#&lowski',
+    '""y\'#,-as-you-play#%cocke#%khull#$lins#/ment-by-results!"ba!\'c-style""ms!"d.""ki!*ea-picking$$soup#(ch-faced#*nut-butter',
+    '"%ccati#&henegs"(dernales$)strianism+$zing#%icels#\'wardine"(e-bottle#"le#"po$%shows#(rybingle#"te#$wits"%hunan',
+    '"#koe"!l#%agian#&lequer#)teobagrus"#mba$#rey"&n-down$\'plotter%%usher#$ates#$beri#\'dletons$#ock#$ikos',
+    '$$ston##ley#(maenpool#\'nebaker$!i$*sylvanians$-y-in-the-slot%$ways&#ort##pad#"sa$&ionary$#oso#*tagon-road%$ndra',
+    '%!s"#ple#&perers""r-#&achora$!l$\'mbulate#*c&eacute;e$&eivers%+ntage-point$$odan#$domo%"no#"ec$!t',
+    '#%gnier#\'iandros$\'dotitic\'!s$#lla$\'ndopril$(od-style&\'isation$$sher%\'trephic##ker#!l#*manent-way)!e$)eabilized',
+    '$#ell$"ia#/oxide-bleaching#!p$%lexes##ris$#uno#\'secutes$*on-in-role&%alism$%pired#\'teguhan$"on#$wich"(scadores',
+    '##nel"&t-food#)ersfinger&$hill$!y#.hick-lawrences##ise#&rofisi%(l-engine\'$pump%!n#%swood#%tibon%#for"%uvent',
+    '!+h&oelig;nix"$aedo#*se-diagram&"in&+locked-loop"&elioff##mus#+nanthroline$)othiazine"(ilippics(#nos%$stus$%lipon$\'obiblon%\'dendron',
+    '%%sophe)$ique)$orum&#phy"%ocine##eba#)ne-number%$line#!o#"rr#&sphide#$tius$"o-&%diode%%booth',
+    '%#flo("od%\'graphie%%magic%+sensitivity&$tats&\'ynthate%%works")yrologist#(sicalism#*tosanitary!:i&mdash;activate&mdash;dcs*.ssess&mdash;dc)/create&mdash;dc68pack&mdash;or&mdash;prod',
+    ')/submit&mdash;dc)/update&mdash;dc)-view&mdash;dc60&mdash;assessors""an$!i$#ola#"st#"ve"#bor#%rochs"%cam-3##hon#+k&mdash;up2$(-and-mix',
+    '$\'ersgill$$hill##tet$\'uregoer"!d#$dled#$gely"(ece-part#\'d-piper#"ng$&kowski#&rpoint$%refeu#$ters\'"en',
+    '#*eon-holing#*headedness#$meat"#ket"$laff$&stered#)e-driving#%lager##sen"&n-head%#ole$&tailed#%cered$"io#)e-covered',
+    '$#lli##kau$"ed$)ish-brown$(y-purple#)turicchio#&zgauer"$ozzi")pe-fitter%&opener%\'playing%&smoker&#tem$\'fitters"%ratin',
+    '#(s-taking$#pot##tia$\'ol-grip%$ning""te#%field#,hecanthropus%!r#$stop#%tards$\'encrief$#ock$!y"&votilt',
+    '!-l&aacute;cido""ab#+card-waving##ges#(in-faced#%ncius$!n$$tade%%world#$shed$!s$(ter-dust($work#$taea%#nus',
+    '%!k%.let-activating**ggregation)(platelet%#ros$$tner#)y-reading%$text$\'er-king$$goer$%mobil$$sets%$kool"&eaders$&santon',
+    '#$bian#\'coptera#(nderwald$!o#&xipave"#oce$!k#*tter-drawn#$urde""ra"!t"(ummetted#$sher",ymouth-based!#mug',
+    '!+o&egrave;me"%-face#"po"#che"&densac$)st&agrave#&ington#\'ocarpus"#eta"&gacnik#"gi"*int-of-use#$sing$$sons%!y',
+    '"$lack#)e-mounted$$town%"ti#\'ice-car\'$type%\'raticus%"y\'&)-changing\')formation$(sh-built\'(language\'(speaking$!t%%icals',
+    '&!s%%ricks#)l-topping$$aidh%"nd$#ett$!o#(onnaruwa#$skie$$tead#\'talloch#"y-$&chaete&$oral%)onfidence',
+    '$\'kleitos$#ols$$pads%(odiaceae$&sperma$#zoa"#mbo##elo#%icino#%odoro#"pe$\'onianus"#ngo$&panich#*tarddulais',
+    '%#kes$!s#"zo"(ohsticks#\'l-liner%\'playing$#eys#"ns#$ping"\'ptastic""rc$#aro$"he#"ec#\'phyrios',
+    '%\'of-call$0e-coch&egrave;re%\'r-style$%hmeor$$icus%#ere%#sch$%uense%!s#$ybny"#sen#$idon#\'sibilty&(le-world#&t-1933',
+    '(!6\'"68\'"70(!5\'"88%*assessment%(breeding&$uilt%*conference\'$urse%&dinner%&flight&(ormation%$hole%&larval',
+    '%)newtonian%\'ottoman%*settlement%+thatcherite%+unification%+vaccination%&winter$)age-stamp$&factum$$horn$&nikova$%posed%)rocedural"(t-boiler&!y',
+    '#\'bellied#1ential-difference,%vider$&statem##ful#$heen#"oy#&ticary"$uchy#,ndstretchers"#vah")wder-room#\'er-boat&)knowledge&$loom',
+    '&&vacuum&$zoom%#glo%$save"&xviral"&ynting"&zidriv!$pias"!n!,r&aelig;sepe#0eacute;v&ocirc;t#&uuml;m"%adier#\'efectus$!p',
+    '#%ktica#$song#$xeis"&e-1937$\'adamite&%junct&)olescence%\'nnealed\'&ounced%)ssessment$%built$+compilation&(nversion&$oled%$rash',
+    '%%ursor$(destined%*isposition$+emptiveness%1rythrocytic-stage%\'uropean%$xist$%flood$(grouping$(hospital$)incubated$(marriage%)edication%"ix%&onsoon',
+    '&*tification$"op$$prep&+ivatisation$+renaissance$\'soaking%&uppose+!d$(take-off%%heory$*university$\'wrapped#+cious-metal$%ooked#*determines',
+    '#.ference-belief#/judice-begotten#*mierentage%#xed$%odern$*ultiplying#$ntky#%omnor#$pped%#ing$!s#)schoolers$*ent-giving(%tense$%sdram',
+    '%)urization#\'tendin\'$!o$\'raining#,ussenelektra#!v$%iewer#!z"-i&scaron;tina#&apulid#(ce-level&(recovery\'&igging$(kly-pear#+me-minister',
+    '$\'itivist#,ncipal-agent)!l$$king$\'tronics##ons$%rwood#"ss#(v&eacute$+ately-built$#ett#(ze-fight+#ing",o-activeness$(feminist',
+    '$%level$+nationalist$$rail$+unification\'"ty$\'vitamin#&alcool#+blem-ridden\'&atises#&chaska$&rustes$\'toscopy$%ulian##ddy$-ucer-director',
+    '(&design(#led)(iability(&market)"ix(%range\'+ion-sharing(.vity-enhancing#$etta#&faning$\'esional&"or&$seur\'(ionalize,(ly-based',
+    '%!t$)it-centre\'\'earning&!t#&g-rock$#ess$&raming%#eso$%uanil##kop#%nasol#(ofreader#+pagandising*$zing$*erty-owner',
+    '#)sauropods$\'docimus$$ecco&#tor##tea%$in-a%!o$"o-$$ract#(venanced&$cale%"ra$+identialist%\'ncetown%%soire',
+    '"$yers!&salmen#)mmetichus".eudo-dionysius\')euclidean\'(feminist\'+improvement\'(membrane\'+renaissance&+crenilabrus"&ilocyn"%ycho-\')biography\'%drama&&logize',
+    '!#tca"\'eropods"$osis!%uablo#&ngchon"\'b-going#%goers#/lic-expenditure\'&health&!o&"um"#ces#"he"&erorum"(fferfish',
+    '"!i"%jehun#"ol"%ll-up#$sair$$ifer#$tney##vis"%mmels#$pin\'"\'nch-bag%!.#%ition#&k-rock"&pating',
+    '#*pet-master$%y-fat"(rbeckian#%efoys#$pley%)ish-black)#red$\'resture#&suitte#\'ugganan#!y$#ear"&sillus"%t-out$$u-up',
+    '#\'teridge%"th$)ing-green$$onen"#xty!#was!&ycroft")jama-clad"%rddin##ola#\'rhonism$\'olidone#"us"&tchley#$heas',
+    ' &qaddur"#sem!%bench!!f!"ia""la"#sas!#lfs!#ses!)uadratics%!i%\'ophenia#0lification-based%2ty-of-working-life#$reca',
+    '%*elsomeness$#tan##sim$!t")eenshithe$)r-bashing#%lques#$ster%&ion(s)%%maker"\'ickcuff##eta%#ish#$jano#$none',
+    '$\'qualate"#oad#!t!%waqwa -r&eacute;unis"%ndash\'%;1340"\'ouml;hm"(uacute;a!*-zacopride!%.f.c.$"h.""g."!h""v.',
+    '!"70".4(1&ndash;356),#73)$-73&ndash;517)!"85!$a-ra"%bbit\'&&-punch#"eh##kin")cal-decca#&e-card$$nate#/ial-imperialist#%keted',
+    '$!n#$foot#"gy#!i$!n$*o-activity&\'isotope&#set%)frequency%%laria$!x#$mila#$oman"$eper"$fale',
+    '")g-covered#%havan"$hier##mat#"ul"-ilway-station#"mo#-n-interrupted$%dance$#eth$&making$&splash"$jahs#%neesh"&kehell',
+    '"$lley$!i%%ement$"us"%maema$$lina$$yana$#zan#+b&oslash;ll#$raid$%odded##tha"$nchi#$dolf%"mn',
+    '#)ge-finder$%itoto$*wapithecus#"ia$$ganj#*k-ordering#)thambhore"$pair#%hanus#%tores"#rde"#sht##ool"+t-a-tat-tat%$rsed',
+    '#+e-of-change(&return#&hbones$$more#%isbon#$king#&nayeke#!p#$skag"&ughley#-hensteingasse#$luni#&nchier"#vag#&elston',
+    '%&sbruck&%court&$wood#$hele#%ignan"%ygada#!m$#ent#&onnant"#zin!"bc!#cas""ia!*e-absorbed$(ffirming',
+    '#(captured%%sting$%entre$&harged$$laim&(ssifying#)developed$#ial%)stricting#$emit$)ncounters%&ergize$)stimating$&volved$)xpressing',
+    '$&ocused$%reeze&!t#$hang%&rakhty%%shing$$ired$&ousing#&impose$%nject%$sert)"ed&$tate)#ing%\'tegrate',
+    '#&keying#$laid$%earnt$#ine%!t$#ook#)numbering#%offer$)rientated#\'package$&lanned(#ing$\'ointing%\'ssessed$)rocessing',
+    '#)releasing%&trieve#&scaled$&igning%#zed&#ing$%upply#)tightened$$race&%nsmit#%wound"+accumulated$$hin\'$%tivin%(or-grade',
+    '$%-rite$(ing-list##les$)ity-based\'&engine#,ping-machine$*portioning%%roved#&search$%sumed"&bbecca#-el-controlled#&oarded$%oting#&uilder',
+    '$(pitalise#/ently-announced))completed$+ptive-field$-ssion-busting$$veur#)hallenged%(rgeables$&sstaat#*kweilerhof#&lassed#&oating$(mmencing$!n%*ceptualize',
+    '$%pying#%tella#(uperates"\'d-alert$$line$%stone##ast#&burnus#&clyffe#$dler#\'elivery#$farn#$hall#&ivivus#&marley',
+    '#&oubles%\'tensaal#,uced-calorie(#fat"\'ecastle#&dholme$%ucate##fed#$nter"\'floated#&ocuses$+rm-oriented&&ulates#\'reezing#$uels',
+    '"$gals%\'vanised##iae#&lazing##nat%#ult#$rows",hk&auml;mper"&ifying#$lley##mar#$nach$$sert%&titute%#ure',
+    '$)terviewed#$sner#%tzigi"+jeuvenation""ka#&indles"%label#$icts$\'ef-line#$oads")marketing$#yne#"ba#)emberance#$ixer',
+    '#\'otivate*!d#)unerating$&stered"%natel#&derman$%zinas#"et$#wer#%shaws#+t-a-colonel($rowd%)collector$(aminster##zan',
+    '#\'aginate$$ving#*eated-note$%llant##ine%#ing#"or%"t\'$#ses$$tted#%roval#2ublican-controlled\'!k"*registered$&leases',
+    '#(idualist$\'gnalled$"le&!d$"ze#%lated#$nais#*ourcefully#3ponsibility-sharing$&raying#"sg#"ta%#ged$#out$)ructurant',
+    '$%rgens"&tables$%llick#\'chakhan#+irement-age#&ro-fit%%scend#+urn-to-work&"ee")validated#%enant%#ger(!s%-ue-generating$!r',
+    '#$iens$%seurs$\'vifying#-oking-feeling$-luci&oacute;n##son"%woven"%xshun##xon"%ynald$(oldstown"\'znikoff!"fh!$heid$%nallt',
+    '%&hessen"\'inehart$\'ocerous#%zobia"$odos"3ubarbrhubarbrhubarb#"mb%!a!\'ib-knit#)bon-grass#!e#&oprobe"\'cercare#\'h-bitch$%eaume',
+    '#(kinghall#$oeur$"ll"+ddle-me-ree#-ge-and-furrow%$ways#*ing-school##ker"$eber#"ff#"ns#%sener$#man"$gaku##eon',
+    '&\'leaning&&to-use#\'id-body%#ify"&lindja""mi"$nded$#ler#"es#)g-fencing%$pull%&shaped$%craft$$send"$ojas',
+    '#)t-control%\'trained"$pert#$sley"(sbridger##hel#)k-benefit%&loving#"om#$quet")tornellos##zen"$vage#&enhall$\'r-water',
+    '#"ka##ron"$yals"#zal!$j-11"!e!"mn""on!&na-pcr!$oad-%#led%#tax$(builders$$head$\'menders',
+    '##nne$#oke"*bber-baron$"in#(ocranker$%tised"$chat$\'e-limit#&k-face\'"ll$%eteer$&savage%#ide$%watch")d-bending',
+    '#)enticides#$olph#\'riguais"\'ecliffe#%ssler"&gatica#%ozhin"#hit%!a##lfs#$nson##wer"$iled#%telet"$kkan',
+    '#0e-identification%\'related#$fing#$l-in$\'ed-over%%iflex%(rskating$#ies$$mops$"of"\'magnoli$$nist%\'o-saxon%\'ticises"\'ncaglia',
+    '#!d$"al%!s%#vel$%ement")od-screen$!s#&f-line$%lines$#tec%$iles#"m\'$(-service#(t-balled$"es',
+    '")pe-ladder""rc"\'samunda#(carrocks#%e-bed%%price$$anna$$hips$#nau$$raie#$ings#$kear#"la#%selli$"io',
+    '$$wess"\'t-proof##ala$%virus#&hchild#)liegendes#(oscoping#\'twinkle#&ulorum"\'ughwood#!n$\'d-about\'"rm%$wood##ser',
+    '#(temaster%#red"(verpoint#(ver\'ithe"%wenta#$latt"*yalty-free"#zen#+i&egrave;re!"t."!l!%uanda"+bber-banded&$legs$%ishes',
+    '#"er#"is"&ddiman#$yerd#&zinski"#ete"$ffin""he#%lmann"(mmenigge#$pers$\'us-room"\'n-about$#dmc$%maker',
+    '##gis#"un"%owang"&pinder#\'kachorn"*rangaranga"$shen#$poli##que#-sian-language#$tici&"us"&thvens"$utel!"vc',
+    '"#bak""co"%ehill#!s"$mans 5s&eacute;curit&eacute"+lstrok;upsk!#\'en"0gonnacostyaguvna!"-3"!l!..&agrave;.r.l.""29""k.!"70',
+    '#%rinen""ba$\'h-based$#lat$(ragamuva$"to##esp#(l&eacute"$crac$&oiliac"\'ddlebow#$eian#!o$*-masochist$!k',
+    '#"wu""eb##eda"%favid#\'e-guard$#tip%&y-line\'#tab#"ir#"on"$gale#\'e-green#"iv"(id&mdash$!-',
+    '$!s#(l-locker$&making"%kurai"*l-vee-niya#$ameh$$quin$%ryman#&e-room$&s-area%%girls##iki$"sh#)low-faced\'\'skinned',
+    '%*nella-free)$osis#%opian#&tfleet$$horp$!o$%works#*zburgerhof"%mford##mar&$tini$#ons#%ovars#&panena"(naigmore',
+    '##cie$.tions-breaking&!s#(d-castle%%glass%$hill$\'bagging%&lasted%%ourne$#eep$-hurst-trained$%kings$%lings$$moor$$okes',
+    '$$send$%ycove#%eline#"gh$!i#"ke$$ichi#"oh#&taland$$eria%$sson#"ur$#sis#"ya%"sa',
+    '#!h#(o&aacute#(rophytic#"te"&racini$&jevans$#nne#)danapalus%#una$!o$!s##eks##ich#!n##ouk',
+    '"#s-2#$hays#"ol##sen$"in""tb#1ellite-television+!v#%iates$*n-finished##ori#"ro#!u")vedvalues#$idge',
+    '#!d#$icki#$tell""yf#"it##nor!#baa"$c-sp"$rinz!&cabbed#$lare$+e-invariant#(nachrome$(dalizing$"et',
+    '#\'r-faced$&amanga$%deoni$+let-cheeked#$thed#&venges##wby""bu")enedesmus$&t-mark#!s"+h&uuml;bler#!.##aar$$bort',
+    '$&nefelt$"ub##edl$#ele$#ibe%$fler#%iefer%"ss$)llebeeckx$"zo#\'ladming$%eifer%$mmer$)itzberger#\'meichal',
+    '#\'nitzler##ock$*lar-critic%&efield$%nbrau$(ol-board\'&dinner\'$hole\'$term%!p$"pf#%ramme$#eck$%iften#%ulhof',
+    '$"ur#+wanengesang$$eber%"iz"%ienza#"re"%leral""mc"&offers#$llen#%nvols#$obie$&p-neck#!p$\'olamine',
+    '$&e-card&\'reading%!.#*ts-english%"on#)utmasters"\'rabbles$&p-yard%#man$%tting#(eech-owl%%haugh%*n-printing$(w-driven+!r',
+    '$+ungerphobia##ubb$%nches"$uole#*rvey-grass!$dece"%irect!*ea-dumping$$gate%#irt$%horse$\'serpent%\'ickness%$pray%%quirt',
+    '#$bray#%court#%forde#$kale#(ling-wax#$park#\'quarium#-son-by-season#$town#&vision#*weed-based"$cada#%eders#/kendorff-gudent#$onal',
+    '\'*preference\'%rower\'&seeded(%ource(%trike\'&wicket$#urs#0retary-treasurer#%tored#-urity-related"#dco"\'ed-fern#$mann#"th#"ya',
+    '"#gui"\'hnsucht"%idler#"ta""ka#\'igahara#!t"&lenide#.f-accelerating&*ffirmation&+nnihilation%)completed&\'reating%&deceit\'&signed',
+    '&(iagnosis\'\'recting%,exploitation%*inductance\'\'surance\'*troduction%+liquidating%,perpetuation&*rogramming((pagation&*ublication\'*rification%+recruitment\',sponsibility%&screen',
+    '\'!t&\'tanding($rter%%teach%&weight$*confidence$#ing$&styled#"ig$&ncourt#$l-in$$asie$)er-client#%vagem$"on',
+    '#)i-blocked%&custom%%dried%\'fascist(!t%\'mounted%)submerged%(trailing$%breve$)recumbent##ler".nator-minister##dai#&equier#"ko',
+    '#!o#*se-content&)qualifier%!r$!o$\'urround#/tence-as-object)\'initial$*imentalise#"za"\'phardim#"ik"%r-243#"ac$%mpore',
+    '&"um##ban#"ez#\'f-based#&ialist$!r#-jeants-at-law#%maria$%onize)!d#$reau#0vice-orientation"#sha#(sionette#&terces',
+    '$#ina"%t-top#$suko#"te$\'ing-day"$vaks##ell$(n-course&+days-a-week&%layer\'%etter&%track%)teen-year&)ies-style&&y-year',
+    '".wage-treatment$#nee#(ing-room"\'x-abuse$(equality$+stereotyped$%typed#%kylie#$tets#\'ualized"*yhulislams##mer#"um!$fdes!$gorr',
+    '!&habbir#)ckerstone#$ddup$#eed$\'omaster%(w-filled&$land##fik%!r#$hbaz#%iness#\'ke-outs%!d$&uhachi#\'lamcheh',
+    '$&lowing%!y#$mash$&bellie$"im$#mas##nab%!n$%dling$$gaan$#ken$#ley$%mugam##oqi#&plands',
+    '$"da$\'e-price&\'trading%&vision$!i%"ah%"ef%!r$"ky$"mi$(p-witted$%rocks#$ston##tin#"wm',
+    '$$bear$%ghost%#oat##ail$%r-lag%$ings$\'thbills&!e##bib#"dd%"en#$ehey$"ns$*p-breeding&#dip',
+    '&(worrying%&bridge%#dip$\'r-sided$\'t-music#+ffield-born##her#%ikhas##lhi$&l-toes#&navall$!e$#kin##ppy#&ratons',
+    '$$rick&!f#\'vchenko"$hhhh"#iah#\'elfield##ism$$take#)ldon-born$#ler%#in\'%!y$"ts#%ndand%#igs',
+    '#"ro%"ne$(t-button&$cuff%\'sleeved#"sh"\'ochaiku$$kin\'#(e-horned%&polish$&mender#,pping-basket#(rt-break&&change&#day',
+    '&%nosed&\'service\'*harp-shock\'&temmed&\'termist\'$itle\'$rack%\'changed#%shone$)takovitch#(t-change%$hole%%maker(#ing%$silk',
+    '#"ul%+der-charged$*ting-match#)w-stealer"#ree%"ve#\'inkwrap#&ubland"#uff#!l#\'miatski##rll$#man#$ster$"ui',
+    '#!t"$bble#$erut"$celo#$heus#\'k-nurse$#bag$"ie"%ddown#"e\'$)-entrance%&glance%$hung%&letter%\'passage',
+    '%(tracking\'"ip%&window#"he"$eger"&gatoka#*ht-reading#\'illaria&!o#*n-for-word%(language$&al-box&#ing\'#zed$&ifiant',
+    '"&kandra"#lat#"ec$$ncio#\'iwangsi#&k-clad&&overed%\'weaving$%beard$%tones#$lari#%otank#$ures#$ver\'&(-stained',
+    '"(miastone$"en$#tar#\'lastone%$wood#&onenko#"pl%(e-to-use##rad##tek#)ulcasting"+n&eacute;ad#$-zan##aia#&claire',
+    '#&g-sing$"el$&le-day\'&factor\'(interest\'#key\'$note\'*parenthood()eakedness($iece((recision)\'ocessor\'$site(%ource(%tatus',
+    '&(breasted&$wood#/halese-buddhist#%isalo#,o-portuguese#"qe#&ularia"*phonaptera"&renuse"#sak##say#"ta"$t-up#\'e-based%%owner',
+    '#!t$!e"&vilize"(x-course$%digit$#gun$$iron$$note$#row$$seat$&volume#!e#)milewater#)teen-inch(%month',
+    '&$year$&y-mile"#zar!$kank"%eilth#%lligs#%rratt#(tch-book&#ers"&id-pan$"dy##ied#&lastic#%nfold#$rled',
+    '"#oal#!f"(roelings"!s")ull-staff#%ndric"(y-diving$%light$(scraping#&divers##rms#$ship#$view!%l-bit##gms',
+    '#&ngerup#&p-dash#$ther#&ughden#)ve-labour&&owning#$wson"*eeked-back$)ping-pill"\'ickline#\'de-show#*mming-down#)pstreamed##thy#&vovitz',
+    '$&odenko#$gger$!s#)t-machine$(hfulness#&w-burn$$dive"$uagh#&bbered#%dging#)m-dweller$)p-busting##rps#%shing!)mackheads',
+    '("re&&degree&&holder%%print#$rmed$)t-looking%#ass#&shiton"%eeton##rsh"\'ith-god"#las"\'og-mask#(ke-stack#\'ldering',
+    '$(th-faced\'&shaven"$urfs!)nakeshead#(p-frozen%"ix$$pish""co"!d")eakapenny"!g"&icking#%ffin\'##vel"+ook-cocking',
+    '#\'w-cover%&filled&$lake"*uff-bottle#$gfit!)o-and-sos"%akage#&p-free"*ccer-style#$haux#%iadad%%list\'$\'o-moral#$keye$#ing',
+    '#!s"%d-all#%ality"$fala#$itel#\'t-edged%(pedalled$$lite$#set"#gea#"na$%fjord"#hag"\'il-ball#!n',
+    '\'#ing"&koloff"(l&eacute#$-gel#"as##cia#$dats#\'enhofen#\'id-fuel&%waste%&arnosc$(fluction$$gnac#(oheadbeg#"um',
+    '",merset-based$.thing-or-other$$when#\'meliers#\'ocistas"(ng-cycle$$kran$$ster#&icator%&finder%!s##nex$#ier#&sonate"#ons',
+    '"$pped$#itt"(r&oslash##ata#%bitol$!s$!y#$elle$%nstam#&haindo"%spiri"\'ufriere#)l-binding%\'searing$%eiman',
+    '$,d-insulating&&letter&\'picture&%world%&checks%$wise#(rce-code#&s-chef$%telle#-th-south-east%#com\'"te%$data%)moorhenge%$scan',
+    '&$ells#$yave"\'vicille$-et-controlled\'#era\'*vietnamese&(ologists"%wetan##nen!#pab##ce\'%%-gods&\'shuttle%$walk#!d',
+    '#&lletti#"ng$)ish-based$"ks$"os#(rcdirect%%ettes%#set$*k-ignition%#man$$less$"ry$\'tathlon%%itura#+tialization',
+    '""ca""dl",eaker-hearer$\'r-point&#tip#)cial-case\'$ling(*y-tailored&#ted%%jalci$$rate(+&mdash;fp92$$tate%\'rograms\'%magic',
+    '#\'ech-act&&ifying&\'writers$#ton#)llcasting%#man##nse#"sh#!x"(halerite#)ecotheres"+iegelhalter%!l#$gots#!k',
+    '#*nach-green$$etti#%onage##red$(it-based&(ualizing$&ometer#(ttalburn"*lay-footed#+inter-proof$$t-up#%odged#!s"&ooners%"ie',
+    '\'\'related&$line#"si#$tila$$lamp"\'raddled$$tlys#)ead-sheet$$ngel#&iggina$)ng-heeled\'$line&#man#$oule#%ysoft',
+    '"&y-ring##der##way!*quanderbug$\'re-root\'\'section$%ttish&!s$"ws#$ired$%tting!\'r-gamma#\'isotope"%icams""y-',
+    '$!2"-425&mdash;427"#hhh""rf!4t&aacute;dn&iacute;k$\'uml;del#(ndash;18"&.james".aatsbibliothek&\'kapelle#%bbers$(le-block\'$hand&#air##den',
+    '%$park#%elens#$ffon#\'g-night$(e-fright&&manage%\'coaches%\'managed##ini%&master$!t%"he%!s##les$#ing',
+    '%$easy%(ing-wave$\'estreet$!s%$gate$"ze#%r-map$%balls$"ey$!i%"n\'$&lifter$5om&ecaron;stsk&eacute$\'t-point%)theengine',
+    '#+sh-for-cash#+te-by-state&*enterprise&$firm$#ice%.stically-based$(us-based%)te-backed##vro#%xigoe"$eads$)m-raising%&hammer%$port%)rollering',
+    '#\'fansdom#(inhilper%$mann#$lfox#%nmark#%p-dad%\'sisters$\'hensons$"pa%&enwolf#&radian$#eom&$psis$$n-on&"to',
+    '#&venses#%w-pot$"er"+iff-jointed#$gand$$wood#.ll-functioning&\'growing&\'working%%organ#&nkhorn%(schiefer#"r-$"ks$&lander',
+    '",ockbrokerage%*holm-based%*port-based##lli#&mached#\'ne-dust%%cross%$face&$lies%$wash$$king#%pgaps$%valve#\'rebrand%(cupboard',
+    '%#ant$&y-time#"ss#%uffer$\'tstroke##way$&upland"(racathro$+ddle-legged$%hinja$+ight-billed)"in)\'talking($ener$)ngulating',
+    '$(thalmond&$cona&&peffer%$ores&!s$\'ubenzee%$ghan$%walde%"bs$%yhorn#(eak-free%(m-lining$#eck%#ten&$link',
+    '$,ss-reduction$,tcher-bearer\'%marks$#uer$"ws#\'ictured$"ne$&p-club&&mining&(searched%(ped-pine#&nadova##oan$$itel$$ller',
+    '%+gyloidiasis$&umillo$#zzi#$ubig$+cture-based$"ms"$ubai$$bles#%dent-(%based\'!y#&ffmann##mpf#&porose##rch',
+    '#$ptic#&renics!\'ub-band$%genus$(licensed$(notebook$&office*!s$\'pattern%*ersonality%&roblem$%roman$%shell%%tring$\'tropics',
+    '#)arnarekha#&butteo#%games$$oals##ito#.ject-prominent#)languages$%eased$%unary#+machine-gun%\'xillary$(ersibles%&ssages##ono#\'package',
+    '$$lots#\'saharan%%mples$-istence-level$%ource$\'tituant#+therapeutic%\'reshold#)urbanised#*word-level"%ceava#&k-suck"#ess#"ty"&ffragi',
+    '#%imoto"%isses#&t-case$%edome##vez#$yuan"&lphite%&omucin#%yagin"\'miswald#(merhayes&#ill#$sion"(n-bathed%#elt',
+    '$#hat$#lit$$roof$&screen%\'treaked$*worshipper,#ing#(accounts#$care#+day-trading$#got$&owners#$gard#$hill#$lamp',
+    '#%rises#\'seekers%%rvice#\'tanning"&per-10&\'feather&+lightweight%\'annuate%%break%$card%/ego-degradation%$girl%(ministry%"oo%&phenix',
+    '%#spy%#tax&"ex&$wist%$user#$pine$$port#&ressed"\'rakarta#*face-based#"in#(rey-born#)vivorship"&shumna#\'tainers',
+    '#(herfield$#ren##lej#"ro"$welo""ze##man!"vd"(en-goran$$nsen##rre#%ticic"!i!\'waggers#)hili-land',
+    '#&llower)!s#$nnee$&shurst$#wic#%rfega$&kstone#"tf$!s"(ear-word#*dish-style#%ep-up$&t\'eart%#lea#%rford',
+    '"\'iftpack#%mmin\'%!y$$safe#)ng-bridge$\'nergill#)ss-german&$made&%owned%$prot#,tch-changing$#hen"!o#(rd-stick%$play',
+    '"-llabification($ying&,le-structure"\'mbioses$#ole#&machus"&napsid#%caset$\'h-pulse%\'ro-edit\'#fax#$drum#$ners#(onymized"!r',
+    '#,tem-building+!t\'%level&#ics"$tems!1zent-gy&ouml;rgyi#%wczyk"$tuki")ymanowski *t&ndash;33!&\'front"%stock"&zun-tu!#-42"\'shirted',
+    '!#.p.!"25!$4-sb!&abacco%"um#"es#&le-leg&\'turning%%linen#&ulatur"%chism&"te$+ymetabolism#&ograph#!q',
+    '"$ggle#$uchi""hr"\'il-coat%#fin$)or-making#"pa#)sh&oacute"$kagi$&hanada#&emitsu##fir"\'lintyre#$lant"$mako',
+    '#$biah$#ora#"en$!z#!i#$many#!o#%picos##tec"$nabu$%lised##gen#"ka#\'nhauser#-trum-throwing',
+    '"$pang#\'e-grass%\'running#%inoma##pet$&onnier#$root"$rama$$zets#$ento#)iff-laden#"om#\'quinian#"ra##ski',
+    '$#ini#"um$$skin"#sk-$#rep#$silo$$otti#!t"%taria#!i#$jana#$lers#%tling""ub#$chen',
+    '##sug"!v#\'arnelle##ole"*x-avoiding$(gatherer*#ing$%haven"#yga##loe%&r-made!)chadienne$!h#&oungui!"dk',
+    '!#ea-$\'bagging$#set%\'trainer#%break##che&/r-as-researcher(&parent(\'student#&garden#\'m-owner%"up$%links##res$&jerker',
+    '#%smade"%bbitt")chnalysis%#icl%0ologically-based)%y-led+\'sharing#\'nologia#!o#!t"%e-hee$$time%$otal"$ijin#\'lreiche',
+    '")knowledge"%lamon##con#$ecel%(ommuting\'+s-equipment$#kia&%nesis$(messages$$osts$-phone-banking$&script%\'ervices$%types$$view',
+    '$!t$)urium-132##roc"\'mmincki#&plehof&%twist"(n-a-side$%event$\'speaker$$yard#,ant-in-chief#&derise#%ebrae#(nis-ball#$oned',
+    '#%t-peg"(odorescu")rbutaline##com#(ebratula$!k#-minb&ouml;rse##ner#*psichorean#%rain\'%$nova%!s$%estre($ials%!x',
+    '"%schen#$tin\'"+trafluoride"!u##ber$#ner"#xaz##ier#%tcall!#fta#!r!.h&eacute;venin"&\'could#%knows#%would',
+    '#$ller#\'nk-yous$!t#"ss##tta"!d"(eaetetus$!t%\'re-land#\'matized$\'e-based$&sleves#\'odosiou$#rie%*y-building',
+    '\'\'loading#$reza$#mie%*ochemistry&*elasticity#"sp%"is#\'usidies##y\'d%"se"*icknessing#*gh-hugging#$ller#)ngamajigs%"my',
+    '%&umajig$"k-$$wire#\'rasawat$*d-division&%level&\'reading&$wave$,st-quenching$\'ty-page"%okoza#&rganby$$nely&"tt$$ofon',
+    '$%svedt&"oe$\'waldsen#\'udippos"%r-239#$eave$(e-banded\'"ed\'#oat\'%utton&&colour&)day-event\'%ecker&%floor\'&urlong',
+    '\'#ole&\'pointed\'(rocessor&$ring\'"un&%shift&%timer&(variable\'&ehicle\'#ote#\'ombosed$#ned$(ugh-flow($road$#wen',
+    '"#uan##ggy#)mbsucking#\'nbergii$)der-cloud(%storm\'$scan#\'rkettle$$mond$$sdee%$tone"&wacked")ymidilate\'#nes$!y',
+    '##sia!$i-in"$amat#"no"#chy#\'k-borne$&etlink&$ting&%y-boo"&dburys#"ey#"gy#%marsh#(y-minded"&ebreak',
+    '$#nan"*ger-stripe#*ht-waisted%-ly-controlled#%reans%$sses"$khii"*ll-covered$&ysburn"\'manfaya$\'rchides#-ber-exporting&%lands$$rels#\'e-clock',
+    '%\'filling%#off&(wnership%&pieces%%shock&(ignature%\'to-time%&waster$$base$%lords$\'machine$#out$%sense%&haring$\'wasting',
+    '#$oney"\'ndemans#\'niswood#"os#$ware")p-and-run##aza##off#!p#%sheet#$toft"&rajana#%ebuck##for#"si',
+    '#$mice##olo#&rating"(utiunnyk"*voli-based"%ziano!"ka!"li!#mas!"ni!)o-move(o)"\'amasina"-bacco-growing(%smoke##iah',
+    '")e-curling$#job$&to-toe#$rags"$fani#)fee-apple"#gai"$ibin#(let-roll")ld-you-so#$eman$!x##let"(mbalbaye%#ugh',
+    '#%morow$$yrot"#ndu#\'e-group%$poem"0o-clever-by-half#%l-bag$$room#+th-and-claw&%plate%%glass#&woomba")p-earning%$dged$$link',
+    '$\'mounted$%shelf$)to-bottom#%class#*ic-related$"ng##lab##pin""rc$+h&egrave;re%$-lit#(desillas#%ihada$!n#"me',
+    '#+re&atilde;o%*j&oacute;n#"ta#$ughu$$mtay#+y-dominated""sa#\'canelli#!i#"sy#$tada"#tah#%e-bag$%ntanz",uch-legering',
+    '&$type#&gh-nut#!l#/rist-orientated#%sling"#ves"\'wel-dry##ler#+n-expansion$$gate$#roe##sie"&xicara!"po!7r&eacute;l&egrave;champ',
+    '#(ce-horse$%hytic#%danet$&ecraft%%winds$&ing-in#%ffens#!i$(lfinders%(ing-link#!k#$mmel$&ontana#&nchant$"io',
+    '$(s-europe&(shipping%)antarctic%$cash&+endentalist&(onjugant%\'dniestr%%fixes&/ormer-rectifier%)istorized%$link&&ocates%-mission-style&)ogrifying%#pac',
+    '&+ort-related%&valued&%ersal#$ssey$,t&acirc;mara#!t#%velog%&stying"&eadway$*sure-house*#unt$(ty-based#\'e-cover%&living%\'nesting',
+    '$%scape#&garron%$skis$$wynt#&hearne$"ub#&loggen#%mblay%%ucker$%eloes$#iti$$olux#%naman$$ched#&ptower',
+    '#$vose"&i-cast#&allist$\'ngulate#%bbles$#ick$+romoethanol##cep$+hloroethane)$phon%)oanalysis$%linic#$dvid#\'glochin$"on',
+    '#*lateralism$$obal#%motor#+nitarianism&#ron#\'podding&#oro#"ss$$tars#%tones"!m"/na-modification"$ofim##ggs#(lley-bus',
+    '##mbe%&oncino$\'melbass#"ng%#ate#(phy-room#(ubetzkoy%\'le-spot$!s$"ve""ub$(schachen#\'ck-load#)e-to-life$%blood',
+    '$%space%$well#$mble$,ping-feeling#&stspan#\'thspiel"#yin#%plase!$savo""ch"#eef#&reteli"!i#(mshatsui"$wana',
+    '!"ta"!o!+u&ndash;144"--whit-tu-whoo"&amotus"*be-station")can&aelig#!c$!i#$hman#(kingmill")dorbethan"$eart#%s-sat"#ite',
+    '#%tulan")mble-down($ryer#%oural".ngsten-carbide#)nel-mouth"!o#!r"\'pamaros#$ling#&outo\'a"+rbo-charger%#bat%#fan$&ulator',
+    '#)n-a-round$$ball$#ery$&piking$#ups"#ten#&hmosis##sis"#uta!,welve-string\'$week($heel#\'ntieth-%+y-eight-day\'%metre',
+    '"+ice-married#(n-headed%$tube$(kly-eyed#$stor%$wood"+o-and-a-bit*)half-mile/$year$&bedded%$lade$"cd%#hip%"pu$&dollar',
+    '$&finger%$loor$(language%%ength$\'section("or%$hoes%$tory$\'teacher$+wheel-drive)"er%$oman##ish"%yning!$yack',
+    '"\'ldesley#!e"$mpan"#pe-%!2#(ing-pool#"os"#ree#(oglyphus$&sinase$\'thricin##rel""to!%zampa#%tziki',
+    ' $u-16"!a!%1-a72"!2!"20!#bik!+c&ndash;64a"!a#!r#"tt""ip!#dag"$bina""cf""et',
+    '"!l""ry!"fw!%ginox"$lies"!m"%olino""tm!"hh!*k-designed""ic"%raina!%lanhu"-ster-american"(tra-cool',
+    '&*right-wing&%tight%$fast%$mark%#net%%world"&vesund!#mca"&gababa"$opar!*n-japanese#)patrolled$(rotected")authentic"%being',
+    '$"ic#/o-operativeness""dc$!p#$ealt$$r-10&+appreciated&)estimates&&manned&$read(\'hearsed&(supplied%&bonnet%&eating%$fire',
+    '&$ight%\'perform%)reporting%\'selling&%teers%$type%&wiring#%ulant%#ose"*flamboyant#)ortunatly#!p#&reedom$)ightening"$gelt',
+    '""ic$\'ultural%!m##lab$#inx#(nvolving#\'t-trust$$aria$"y\'%&-ratio#+versitaires)\'y-level%$sity$%ision#(x-on-mac',
+    '$#rry"(partisan#%egged"(resonant"$sewn#$lept#%talls$&icking#%ubtly#*ymmetrical"&tether#"on"\'wrought!+p-and-under#\'channel',
+    '$&raught#&ending#%field#$link#&turned"!b"&curved"%ehull#!x"\'hauling#&olster"\'lighter"*per-mantle&%state")stretched',
+    '#+nium-series"$bain$(n-fringe%%izing#"co##ina"$eche##pel"!f"&nersee"#ras"$s\'la"!t#%nasan""ug',
+    '!,s-controlled#)installed"#afe"-er-controlled%)education%\'package"!g"$ines"#nea"(quebaugh"$tica"-ulut&aacute;n!$teri"!i#*lity-based',
+    '!$wusa!#zes"%ielli +v&auml;nern\'&yrynen!"-8"&bomber"!i!#aca$\'nt-eyed#$caro#0uum&ndash;braked&\'-formed"!d#%stena',
+    '#!g"#ila$(lancourt#"ne$!o#$sman$"on#$tsos"&lcourt##ent$!o$"re$#tte#!l$%auris',
+    '#\'orclean"%moose#$ping"(n-driver#(aprastha#%eigem#%gelis#$itas#$wall"\'poretti%%ising$&urchip"%ranus#"ec#%iates',
+    '%!s#!k#%otsos#"us"\'silikis""t.#!n#$timo")ucouleurs#)devillian%!y#%ghany#"nt""ya!"ca',
+    '#\'torette""da")geculture$$mite$+table-based"+in-streaked"%liger$"ko#%leman#(ocipedes""ma"#nce#%dange#*gs&ouml;ya#$namo',
+    '$$ress$%urcom&(e-backed#$ules"\'rb-form$#ish#$cors#%diger%"ne#$gina#*ifiability$"ne#%juice#&linden$$oren',
+    '#&naccia%$udon%!y%#zza$$ikos##se\'$$ilia$$loot$#uch#0tical-horizontal)&market##yan"#scy#$elin#(icularia',
+    '#\'tibuled$#ris"\'tchling"$zirs!#fas!#gps!&iaggio##tor"#bey"$cari%!y#$inty#&toires%%rinox"(deo-disc',
+    '%$disk%%lines##ler#%ovdan"\'ehweger#!l#!n$%netta#1tnamese-americans#"w\'$&-graph$.point-shifting"#gee#"ne"$hear',
+    '#"th",jayaraghavan&%tunga"*king-style"(lcabamba#!i#%lage\'\'&-level%"ni$&equier##oft"$ncit#&e-clad&&overed##nen',
+    '"&ognier""re##gen$%inica#-us-containing"#s-a#$ages#$cher$"id$#osa#"on##uel#&wanath"$taes$$lize',
+    '#"on"\'vifying!,la&ccedil;ek#"-3$!4$!5#!h#"si!#map""mu")sclusters!"ne!&ocalis&$zing%#tec',
+    '"(gtlander")inovitchs#"th"(lclosing#"id#(kermarkt$.sgartenstrasse%\'polizei#(ley-ball#(ontaires#$pedo#\'tigeurs$$urno#$uted""ns',
+    '#"se#*w&auml;rts"$stok")te-losing%\'seeking""va"$wden"#yce!#rba!-uka&scaron;in")lgarizing#%lings#!t"!n!"ws',
+    '!!z "w-"!3!&aafery"&cc-pac$\'ontacta"&dhwani")ge-fixing%*regulating$#ner%$seil#\'on-lits"\'hagnies##ida"\'inright',
+    '#!r#\'st-line%$belt#&t-time$&ressed"-kefield-based"(lberdeen#&dersee$#hof$#see#(es-based#%grave#$hein#%k-way$+ing-wounded',
+    '$#men#*l-building%$lamp$&achian$&banger$"ie$&plates##ser#!u##zer"&mbaugh""na$"ka#"ce#\'desford',
+    '#"ks##ley#%sdyke$$well"*r-battered$#cry$$lord$\'painted$%shirt$\'wounded##bey$#ley#$gear#$ioba##ong',
+    '$#les#$sett#\'t-biter#"um#$zone"&sh-day%$room%"up#"ik##n\'t#$sira"(tchnight#+er-carrying&%depth&&gazing',
+    '&&heater&\'sharing&%tower\'\'reading%$base&#ird&$ratz%(ing-hole%\'manship%%perry&#ipe&#olo&#ump%%snake%$town',
+    '#%helet#$kiss$%uweis#%sonia#%tages"&ulking")ve-motion$"ry"&xbills"$ylon!\'e-group""ah#$lth-\'(creation#$ners',
+    '$&unders#)sel-faced&"ly#)therbound\'$call\'%spoon"&dekind")ed-ridden$#ers##gee#\'kending#\'mbledon##nor$"sy"#fts',
+    '#$gela$\'hing-in%)t-bearing\'$gain\'%shift&\'watcher#&nreich"%lburn#%combe##ega#%faria#.l&rehy;defined*(informed$)-arranged%\'brought',
+    '&(isplayed%$hung%#led%(observed%#pit%*recognized\'&warded%*sculptured&\'elected\'!t&%pring&\'upplied%$told&&reated&)urned-out',
+    '&&ishing&)orked-out$)appointed$#erd$+wotdouthink#(sh-based%-pool-llanfair#*tanschuung$"ed%$ring$\'schmerz"\'mberham"&pwawet"\'re-wolf#!n',
+    '$&erling&(n-backed(#led($type$&fields$#ham&!y$#lea&#igh$$mill")t-looking$%shave%#uit"&velgem!!f',
+    '"!s!%hacko#)le-backed%%bones#%m-bam$"mo#%rfage#&tevers$$ling$(shisname"%dh-tv"\'eatfeed#\'el-arch&%clamp#%lford',
+    '"&imster#\'psawing#(rlpooled#*sky-sodden$*tleblowers#%tbeck$+e-and-black,"ue&&blonde&\'fringed&&ground&$heat&$outs&&ringed\'$uled',
+    '%%croft%$face&%riary%$park%&washes\'!y&#orm)!s$%marsh$$rope$)ten-brown%#ome#\'zz-bang"(ole-rock#+ops-a-daisy',
+    '""up"#ydu#\'teleafe!,ickremasingh$"sy#!s"\'de-body%(collared%%tooth$+ly-reported\')scattered$#ner#$mann##zew""ed',
+    '#"nd#!r#$sner",fe-battering"%gfall##gie""jk"$kana"(lamowitz#%coxin#-d&rehy;caught$%-fowl%$oats$#ean$$moos',
+    '#"ja##ken#-l-of-the-wisp$$asey$&iamite%%brord%#ngs$!l$\'owcroft#!m#\'sthorpe#$tham$$wood"&mhurst#$ille',
+    '#"cy#\'d-noise%%power%%speed%$torn$#ata$\'blowers$\'flowers$%hover$)ing-house$!o%&wledge&"s-$(schuttle%&hields',
+    '$"up$%wards#\'e-glass#$frid#\'gfields##ick$-ng-and-dining#&k-wink$"er$$ling#$mail##ned#&slades#$tams$(er-crack',
+    '&%green&%sgill""po"$rbel#(e-cutter%%frame%$wool$%works\'"ms#$gman"-sh-fulfilling$"er##ing#"se"(tch-ball',
+    '#%eczek#"h-$(in-board\'%child$#oot$&ycombe#\'nesseth#%tamer$%iness$%kower"!u"%waxia"$xsom"#zzy!%ladek',
+    '!#ndx!\'obblies%(y-voiced"%ebker##vre"$ffle"\'hlfarth"$joik")lfscastle%$head#%huter#$lies$!y#)stencroft##ter',
+    '&(to-woman"#n\'t#*der-gazing\'%rabbi"&od-ash%\'carving%)engraving%)panelling&#ulp%$work$&binder%"oy$%croft$$fall&"rm',
+    '$)mansterne$%worms#+llen-draper&"tt%(oomooloo%(y-minded"(rd-board%%count$"en$&master#.k-disincentive%$line%&people%\'surface$&charts',
+    '\'#man#+ld-champion&\'leading&*renouncing%#ers%%scale#$mers#$pole#$se\'n%(-looking$&t-paid"&ughton#$ld\'t%"ny#&ndwort',
+    '#%yburn"+ite-protect%$back$(ing-desk(\'masters!#set!"tf!#ufi"%lfred"$mman"#nis"#rst!%yddfa#!e""er',
+    '"*rdwriteras"\'seplant (x-factor"&neuron!+anthopterin""pa"#tmi"%vante!#bus!$dbus!$easy"#dit"$phon"(rophytes!%hosas',
+    '#%otong"%cales"$linx"#net"#zhe!#lrs!#max!"oo!#tnd!%video#$iith#"th"!s!\'yvision &y\'hear',
+    '##naa!&-borne")direction!&a\'nina"#bba"#hsi"+k&ndash;18t*!3#"-3"&mmeaka%$ring"$nine#$tras""ps"&rdangs',
+    '$&master#!g#$rows##tek"$tama"#yuk!!b!#c-6!&eandle#\'r-group%&spirit%\'to-date$"s-#\'st-free"#ees',
+    '"#lla$"er$)ow-billed&\'y-brown"%n-bay"#rba##oen##sel")sterknits""th"#ugh!$f-23"!s!\'iddishe"%gletu',
+    '!#mir!\'o-yoing"$bots"&delled$$mane"\'kefleet#%osuka"#ndo#&nondio"\'shinori"+u&mdash;but#$-wen#!d#$ngii#$ssou',
+    '!+p&ndash;59a"!n!$rtle!"ss"*tradfellte!-ucat&aacute;n"&denich"#gos"(murtalik"+ppification"&ricich"$ssef#"te!"ve"%raine',
+    ' &z-lite")parameter!\'achaire"&haroff""lm"%malek$#ron#%brano##mit#%pieri"$naki#"en#%skari"*rst&oslash"!y',
+    '!-ebra-crossing"$cchi#\'hstein\'"\'hetmair##rer"$iten"#kel"\'mlinsky"$nica#"ko""on"&phyrus#"po""qo"*ro-address',
+    '&%rowth")st&oacute"$uner"%zeeee!"fy!\'hejiang"#ong%&nanhai"$uang##hai!!i""ba"(nc-brass##sou"$pfel',
+    '!&oehrer#$ller#\'termeer"$fran"$goth"\'llinger$#ner"\'om-lens#%nomia"$ptic""yd!%s-ekk!,ukunftsmusik""ni#!o',
+    '#&ichsee#!p!%weite"#ide"$olle',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_34 = (
+count_34 = 6694
+
+heads_34 = (
     '&aacute_la_carte',
-    '&aelig;thelthryth',
-    '&eacute;criture',
-    '&eacute;tr&eacute;chy',
-    '&eacute;volu&eacute',
-    '&lsqb;i&rsqb;f',
-    '&lsqb;o&rsqb;ur',
-    '&lsqb;t&rsqb;here',
-    '&lsqb;w&rsqb;e',
-    '&mdash;hartlepool',
-    '&mdash;then',
-    '&mdash;together',
-    '&mdash;very&mdash',
-    '&mdash;we',
-    '&mdash;well',
-    '&mdash;would',
     '&ndash;0',
-    '&ndash;15',
-    '&ndash;20',
-    '&ndash;hat',
-    '&oslash;vre',
-    '&ouml;fner',
-    '&scaron;ipnija',
-    '&yen;100',
-    '&yen;200',
-    '&yen;50',
-    '\'44',
-    '\'45',
-    '\'48',
-    '\'50',
-    '\'about',
-    '\'chute',
     '\'did',
-    '\'eld',
-    '\'everything',
-    '\'f',
-    '\'from',
-    '\'god',
-    '\'great',
-    '\'h\'',
-    '\'have',
-    '\'here',
-    '\'hot',
-    '\'just',
-    '\'kitty',
-    '\'o',
-    '\'op',
-    '\'r\'',
     '\'service',
-    '\'sorry',
-    '\'those',
-    '\'ungry',
-    '\'will',
-    '+pi/2',
-    '-20db',
-    '-5\'-endlabelled',
-    '-6db',
-    '-70mv',
-    '-backed',
-    '-barrel',
-    '-both',
-    '-calcium',
-    '-century',
-    '-class',
     '-consciousness',
-    '-conservative',
-    '-day',
-    '-hand',
-    '-ic',
-    '-in-c.',
-    '-l',
-    '-level',
-    '-making',
-    '-methyl-',
-    '-tu',
-    '-vis',
-    '-when',
-    '-will',
-    '0-',
-    '0.3p',
     '0.k.',
-    '071&ndash;379',
-    '071&ndash;485',
-    '1&ndash&half',
-    '1-bit',
-    '1-cell',
-    '1-octanol',
-    '1.2mm',
-    '1.45p',
-    '1.6kg',
-    '1.6mm',
-    '1.95p',
-    '10--',
-    '10-kilometre',
-    '10-part',
-    '100-franc',
     '100-user',
-    '102mm',
-    '109-member',
-    '11-acre',
-    '11-piece',
-    '11.4p',
-    '110-member',
-    '12-acre',
-    '12-seater',
-    '12-tone',
-    '12.3p',
-    '120-mile',
-    '120s',
-    '121-year-old',
-    '1220mm',
-    '128-member',
     '12secs',
-    '13,000ft',
-    '13-man',
-    '13-mer',
-    '13.5p',
-    '13in',
-    '15&ndash;23cm',
-    '15-foot',
-    '15-handicap',
-    '15-match',
-    '15-metre',
-    '15-point',
-    '16&ndash;24-year-old',
-    '16-foot',
-    '16-way',
-    '17.9p',
     '170-page',
-    '18-nation',
-    '18-pin',
-    '180-seat',
-    '1881&ndash;3',
-    '18d',
-    '19&ndash;10',
-    '1931&ndash;5',
-    '1937&ndash;40',
-    '1940&ndash;1941',
-    '1942&ndash;4',
-    '1971&ndash;80',
-    '1979&ndash;1983',
-    '1980&ndash;1990',
-    '1986-',
-    '1988-',
     '1hp',
-    '2&ndash;3hr',
-    '2-door',
-    '2-foot',
-    '2-month',
-    '2.15p',
-    '2.2-litre',
-    '2.35p',
-    '2.4-litre',
-    '2.5-fold',
-    '2.6p',
-    '2.8p',
-    '2.93p',
-    '20&ndash;30lb',
-    '20-footer',
-    '20-inch',
     '20-yarder',
-    '20.3p',
-    '2000ad',
-    '205-member',
-    '205s',
-    '21-apr',
-    '21-hour',
-    '21-point',
-    '21mm',
-    '22&ndash;june',
-    '22-hour',
-    '22-tonne',
-    '23mm',
-    '24-point',
-    '240ft',
-    '25-point',
     '25-seat',
-    '25-user',
-    '26-mile',
-    '26-oct-1993',
-    '26in',
-    '27-mile',
-    '27-page',
-    '28-man',
-    '28-mer',
-    '286-based',
-    '28no',
-    '29d',
-    '2ft.',
-    '2ls',
-    '2tb',
-    '3&ndash;4ft',
     '3-band',
-    '3-cabin',
-    '3-direction',
-    '3-door',
-    '3-layer',
-    '3-methyl',
-    '3-metre',
-    '3-ton',
-    '30-cm',
-    '300-metre',
-    '32-cell',
-    '32-man',
-    '325-acre',
-    '32in',
-    '33-member',
-    '35-acre',
     '36-mile',
-    '38-ton',
-    '380mm',
-    '3amp',
-    '4-foot',
-    '4-litre',
-    '4-speed',
-    '4.3-kb',
-    '4.4p',
-    '40-knot',
-    '40-nation',
-    '40-page',
-    '40-piece',
-    '400-foot',
-    '400-metre',
-    '400-year',
     '400s',
-    '40lbs',
-    '420se',
-    '44-member',
-    '4500&ndash;50m',
-    '46-member',
-    '47mm',
-    '48-foot',
-    '48-tonne',
-    '480s',
-    '5\'-endlabelled',
-    '5-bromo-2-deoxyuridine',
-    '5-fluoro-2\'-deoxycytidine',
-    '5.1p',
-    '5.6p',
-    '500-plus',
     '500-year',
-    '512-node',
-    '53&ndash;54',
-    '54-member',
-    '54in',
-    '57mm',
-    '5pe',
-    '5tbsp',
-    '6&ndash;30pm',
-    '6&ndash;8pm',
-    '6&ndash;9pm',
-    '6-foot',
-    '6-series',
-    '6.6p',
-    '60-piece',
-    '60lbs',
     '65-plus',
-    '68000-based',
-    '6lp',
-    '7-mile',
-    '7-under-par',
-    '70-metre',
-    '70-mile',
-    '70-piece',
-    '70-seat',
-    '700-page',
-    '700-plus',
-    '700-series',
-    '71-acre',
-    '74-mile',
-    '74-run',
-    '7kg',
     '8-metre',
-    '8.2p',
-    '8.8p',
-    '80-column',
-    '80-plus',
-    '800-page',
-    '800-word',
-    '800s',
-    '80486-',
-    '80cm',
-    '80in',
-    '81mm',
-    '83-member',
-    '85mm',
-    '87-year',
-    '88s',
     '9-day',
-    '9-holer',
-    '9.30am-12.30pm',
-    '9.30am-5pm',
-    '9.6p',
-    '90-hole',
-    '90-member',
-    '90-metre',
-    '900-pupil',
-    '91-',
-    '99-member',
-    'a&ndash;20',
-    'a\'bhuachaille',
-    'a-300',
-    'a-310',
-    'a-4',
     'a-dancing',
-    'a-doing',
-    'a-hunting',
-    'a-listed',
-    'a-negative',
-    'a-ta-na',
-    'a120',
-    'a406',
-    'a438',
-    'a465',
-    'a_,_a_little',
-    'a_,_a_lot',
-    'aaaa',
-    'aaaaaargh',
-    'aaaargh',
-    'aahing',
     'aalge',
-    'aapa',
-    'aardvarks',
-    'abachi',
-    'abakar',
-    'abang',
-    'abas',
-    'abattant',
-    'abbaba',
-    'abbeyhill',
-    'abbiss',
-    'abctg',
-    'abdennour',
-    'abdoulay&eacute',
-    'abdy',
-    'aberconway',
     'aberdyfi',
-    'aberffrwd',
-    'aberknowe',
-    'abersychan',
-    'abh',
-    'abideth',
-    'abingon',
-    'abiodun',
-    'abiola',
-    'abish',
-    'ablebodied',
-    'ablex',
-    'abominate',
-    'aboubakar',
-    'aboukir',
-    'about\'',
     'abramovic',
-    'abridgment',
-    'abuela',
-    'abugally',
-    'abulafia',
-    'ac-130',
-    'ac-type',
-    'acanta',
-    'acanthaster',
-    'acaras',
-    'accardo',
-    'acceptable\'',
-    'accessworks',
-    'accidie',
-    'accipitridae',
-    'acclimatizing',
     'accordant',
-    'account-holder',
-    'accounting-based',
-    'acct',
-    'acculturated',
-    'accutronics',
-    'aced',
-    'acetylcholinesterase',
-    'acevedo',
-    'ache-ad',
-    'acheampong',
-    'achim',
-    'achintee',
-    'achmore',
-    'achsenzeit',
-    'achu',
     'acidophilus',
-    'acidulated',
-    'ackoff',
-    'acog',
-    'acom',
-    'aconley',
-    'acquaints',
-    'acquisitor',
-    'acrilan',
-    'acrorst',
-    'acros',
-    'acth',
-    'acting-up',
-    'actinodiscus',
-    'action-man',
-    'active-centre',
     'actrapid',
-    'acuerdo',
-    'acura',
-    'acute-phase',
-    'acuview',
-    'acylating',
-    'ad&eacute;lie',
-    'adac',
-    'adalgar',
-    'addab',
-    'adde',
-    'adeang',
-    'adedayo',
-    'adelaida',
-    'adelheid',
-    'adeniyi',
     'adhesive-backed',
-    'adia',
-    'adivasis',
-    'adjudging',
-    'adjustamatic',
-    'adjustors',
-    'adland',
-    'adlertag',
-    'adlgasser',
-    'admail',
-    'admarc',
-    'administrative-command',
-    'adminius',
-    'admonitio',
-    'adriani',
-    'adsorbs',
     'adstock',
-    'adult-orientated',
-    'aduna',
-    'advi',
-    'adygey',
-    'aear',
-    'aegyptii',
-    'aerates',
-    'aere',
-    'aeroncas',
-    'aesculus',
-    'aetatis',
-    'aethelstan',
-    'aethiopicus',
-    'aevi',
-    'af-sp',
     'afcor',
-    'affix-stripping',
-    'affronting',
-    'afredo',
-    'africains',
-    'african&mdash;american',
-    'afrikanerdom',
-    'afro-americans',
-    'afront',
-    'afsat',
-    'after-',
-    'after-rain',
-    'after-shock',
-    'after-taste',
-    'after-the-event',
-    'afterburner',
     'afterimages',
-    'aftershaves',
-    'afzal',
-    'agagianian',
-    'againsts',
-    'agamospermy',
-    'agassizi',
-    'agathist',
-    'agathon',
-    'agazzari',
-    'age-associated',
-    'age-gap',
-    'age-regressed',
-    'age-structure',
-    'agenor',
-    'aggiss',
     'aggraded',
-    'aggressivity',
-    'aggrieve',
-    'agli',
-    'ago&mdash',
-    'agonises',
-    'agosti',
-    'agr&eacute;ment',
-    'agramonte',
-    'agran',
-    'agricuiture',
-    'agro-pastoral',
-    'agropyron',
-    'agryl',
-    'agshar',
-    'ahaggar',
     'ahaha',
-    'aher',
-    'ahint',
-    'ahlers',
-    'ahlswede',
-    'ahmanson',
-    'ahmedou',
-    'ahrtag',
-    'ahst',
-    'ai\'sha',
-    'aif',
-    'aij',
-    'ailred',
-    'aimable',
-    'ainur',
-    'air&ndash;conditioned',
     'air-brush',
-    'air-bubble',
-    'air-fare',
-    'air-feed',
-    'air-freshener',
-    'air-jet',
-    'air-pressure',
-    'air-to-ground',
-    'airdrieonians',
-    'airesearch',
-    'airfare',
-    'airikyan',
-    'airin',
-    'airmens',
-    'airpasses',
-    'airsprung',
     'akau\'ola',
-    'akawi',
-    'akeroyd',
-    'akhbar',
-    'akhdar',
-    'akiyama',
-    'akko',
-    'akkuyu',
-    'aksoy',
-    'aksumite',
-    'akyab',
-    'al&auml;ia',
-    'al-allaf',
-    'al-aqsa',
-    'al-arabi',
-    'al-attar',
     'al-azhar',
-    'al-basit',
-    'al-hamid',
-    'al-hinshiri',
-    'al-jabir',
-    'al-kadir',
-    'al-latif',
-    'al-marhoom',
-    'al-nasir',
-    'al-oued',
-    'al-rasheed',
-    'al-ruweishid',
-    'al-shaikh',
-    'al-shamikh',
-    'al-sharifi',
-    'al-subul',
     'alaina',
-    'alaiou',
-    'alaphilippe',
-    'alara',
-    'alaw',
-    'albendazole',
-    'alboin',
-    'albritton',
-    'albrow',
-    'albufeira',
-    'alby',
-    'alca',
-    'alcantara',
-    'alceste',
-    'alcestis',
-    'alchian',
     'alcina',
-    'alcohol-containing',
-    'alcyon',
-    'aldam',
-    'aldercare',
-    'aldicarb',
-    'aldin',
-    'aldon',
-    'alejo',
-    'alem&aacute;n',
-    'alentejo',
-    'aleph',
-    'alewife',
-    'alfasud',
-    'alfonzo',
-    'alfrey',
     'algeri',
-    'algi',
-    'alginate',
-    'alic',
-    'alifabs',
-    'aligarh',
-    'alis',
-    'alkyds',
-    'alkylated',
-    'all-but',
-    'all-court',
-    'all-green',
-    'all-industry',
-    'all-moving',
-    'all-plastic',
-    'all-play-all',
     'all-safe',
-    'all-the-way',
-    'all-too-human',
-    'all-volunteer',
-    'all-west',
-    'all-wool',
-    'allahu',
-    'allanson',
-    'allazonia',
-    'allectus',
-    'alley-cat',
-    'allied-signal',
-    'alliot',
-    'allsports',
-    'almeyda',
-    'almo',
     'almost-forgotten',
-    'alms-houses',
-    'aloisia',
-    'alpenrose',
-    'alpenruhe',
-    'alpert',
-    'alph',
-    'alphand',
-    'alphard',
-    'alpharetta',
-    'alpher',
-    'alphonsine',
-    'alpinist',
-    'alptemocin',
-    'alsopp',
-    'alster',
     'altai-sayan',
-    'altar-piece',
-    'alternatim',
-    'altium',
-    'altschul',
-    'alvarez\'',
-    'alvington',
-    'amacrine',
-    'amalthea',
-    'amana',
-    'amande',
-    'amant',
-    'amantadine',
-    'amantis',
-    'amarjit',
-    'amas',
     'amasha',
-    'amaz',
-    'ambassadeurs',
-    'amblyseius',
-    'amboseli',
-    'amca',
-    'amedee',
-    'amenemhat',
-    'american-sponsored',
-    'amerikay',
-    'ameriyah',
-    'ametra',
-    'amgot',
-    'amitriptyline',
-    'ammar',
-    'ammi',
     'amount(s)',
-    'amour-propre',
-    'amparo',
-    'amphiaraus',
-    'amphiboles',
-    'amplatz',
-    'amputating',
-    'amron',
-    'amsa',
-    'amsl',
-    'amsteg',
-    'amver',
-    'amylobarbitone',
-    'amyzon',
-    'an&ndash;2',
-    'anabantoid',
     'anadiplosis',
-    'anadyomene',
-    'anaesthesiology',
-    'anan',
-    'ananta',
-    'anatomised',
-    'anax',
-    'anchoresses',
-    'ancient-astronaut',
-    'ancora',
-    'ancus',
-    'and&uacute;ril',
-    'anden',
-    'andere',
-    'andersontown',
-    'andro',
     'aneroid',
-    'angel-faced',
-    'angeline',
-    'angerholme',
-    'angle-iron',
-    'anglicana',
-    'anglicanum',
-    'anglo-amalgamated',
-    'anglo-argentine',
-    'angulo',
-    'anhalt',
-    'anhalter',
-    'anholt',
-    'anichini',
-    'animal-plant',
-    'aniracetam',
     'aniridia',
-    'aniseed-flavoured',
-    'anisogamy',
-    'anjer',
-    'ankerite',
-    'ankle-bone',
-    'ankrah',
-    'annamarie',
-    'annates',
-    'annos',
-    'annsley',
-    'anodized',
-    'anokhin',
-    'anomia',
-    'anona',
-    'anor',
     'anoraked',
-    'anquetil',
-    'ansaf',
-    'anse',
-    'answere',
-    'ant-heap',
-    'antabuse',
-    'anteating',
-    'antel',
-    'anthropomorphise',
-    'anti-angling',
-    'anti-asthma',
-    'anti-authoritarianism',
-    'anti-bat',
-    'anti-bloodsports',
-    'anti-bolt',
     'anti-competition',
-    'anti-democracy',
-    'anti-development',
-    'anti-europeanism',
-    'anti-gang',
-    'anti-garotte',
-    'anti-industrialism',
-    'anti-inhibitor',
-    'anti-liberalism',
-    'anti-macassar',
-    'anti-papalism',
-    'anti-papist',
-    'anti-parliament',
-    'anti-planning',
-    'anti-predator',
-    'anti-rabies',
     'anti-rap74',
-    'anti-recession',
-    'anti-reformers',
-    'anti-road',
-    'anti-school',
-    'anti-separatist',
-    'anti-snag',
-    'anti-structural',
-    'anti-takeover',
-    'anti-vandalism',
-    'anti-woman',
-    'anti-zionism',
-    'antichi',
-    'anticonvulsant',
-    'antigen-antibody',
-    'antikyra',
     'antilock',
-    'antiparachute',
-    'antipater',
-    'antipodeans',
-    'antique-style',
-    'antiquing',
-    'antirabbit',
-    'antirat',
-    'antra',
-    'antracyt',
-    'antrum-corpus',
-    'antun',
-    'antwerpers',
-    'anuflood',
-    'anxiety-making',
-    'anxiolytic',
     'anyona',
-    'aounist',
-    'apar',
-    'aparthotel',
-    'aperient',
-    'apertural',
-    'apfel',
-    'api-biom&eacute;rieux',
-    'apiron',
-    'apling',
-    'apn',
-    'apocalypses',
-    'apocrine',
-    'apollyon',
-    'aponte',
-    'apostoli',
     'appalls',
-    'apparelled',
-    'appealled',
-    'apple-picking',
-    'applebroog',
-    'applemac',
-    'appollonius',
-    'apr&egrave;s-ski',
-    'apricaria',
-    'apritz',
-    'aptaker',
-    'aptamil',
-    'apthorp',
-    'aquamanile',
-    'aquarelle',
-    'aquataine',
     'aquatinting',
-    'aqui',
-    'ar-rabbuh',
-    'ar-rahman',
-    'arabidopsis',
-    'arachis',
-    'arachnida',
-    'aramoana',
-    'arango',
-    'arantzazu',
-    'arashi',
-    'arata',
-    'aratos',
-    'arbalests',
-    'arbitrarily-lettered',
-    'arbrex',
     'arc-lamp',
-    'arca',
-    'arcand',
-    'arcangelo',
-    'arch-shaped',
-    'archdruid',
-    'archermos',
-    'archeus',
-    'archi-&eacute;criture',
-    'archies',
-    'architraved',
-    'arcton',
-    'ardener',
-    'ardor',
-    'ardura',
-    'areca',
     'argentinean',
-    'arghhh',
-    'argu',
-    'arguin\'',
-    'argute',
-    'ariberto',
-    'ariette',
-    'arifin',
-    'arigna',
-    'aringhieri',
-    'aristodikos',
-    'arkensaw',
-    'arkoses',
-    'arkurua',
-    'arlequino',
-    'arlie',
     'arma',
-    'armadillidium',
-    'armah',
-    'armide',
-    'armie',
-    'armijo',
-    'arminda',
-    'army-style',
-    'arnald',
-    'arnaut',
-    'arney',
-    'aro',
-    'arpaillange',
-    'arpeggiated',
-    'arquebus',
-    'arra',
     'arrad',
-    'arris',
-    'arrobo',
-    'arrow-poison',
-    'arrowanas',
-    'arry',
-    'arse-kissing',
-    'arsenicals',
-    'arts-based',
-    'artscribble',
-    'arty-farty',
-    'arubano',
-    'arundinaria',
-    'arwald',
-    'asangono',
-    'asat',
     'ascanio',
-    'ascarid',
-    'asclepius',
-    'ascospores',
-    'asdas',
-    'aserinsky',
-    'asf',
-    'ash-tray',
-    'ashar',
-    'ashes-winning',
-    'ashpoles',
-    'asiasat',
-    'asinorum',
-    'asioz',
-    'askeans',
-    'askhabad',
     'askins',
-    'aslet',
-    'asmall',
-    'asmat',
-    'asna',
-    'asociacion',
-    'asoma',
-    'asotin',
-    'asparagine',
-    'aspersion',
-    'assai',
-    'asse',
-    'assimularum',
-    'assiniboin',
-    'asso',
-    'associated-rediffusion',
     'association\'',
-    'associes',
-    'assoluta',
-    'assur',
-    'asterisked',
-    'asterite',
-    'asteronyx',
-    'astill',
-    'astr&eacute;e',
-    'astragalus',
-    'astrodia',
-    'astronomicon',
-    'asuka',
-    'aswad',
-    'asylum-seeking',
-    'at&ndash;6',
     'at-ease',
-    'at-one-ment',
-    'atahuallpa',
-    'atbs',
-    'atemporal',
-    'atene',
-    'athay',
-    'atienza',
-    'ativan',
-    'atlan',
-    'atrex',
-    'atriplex',
-    'attaque',
-    'attavan',
-    'attendez',
-    'attornies',
     'attribute(s)',
-    'atubo',
-    'atwal',
-    'audax',
-    'audience-chamber',
-    'audiencias',
-    'audio-recording',
-    'audio-video',
-    'aue',
-    'auff',
-    'augustulus',
-    'aul&eacute',
-    'aumale',
-    'aureliano',
-    'aureomarginata',
-    'australia-japan',
     'austro-marxist',
-    'austronesian',
-    'aut&eacute;ntico',
-    'autair',
-    'autem',
-    'authentics',
-    'author\'',
-    'authority-based',
-    'authority-figure',
-    'auto-icon',
-    'autobanking',
-    'autobloc',
-    'autocatalytic',
-    'autochanger',
-    'autoclaves',
-    'autoglide',
     'autographa',
-    'autokraft',
-    'autolycus',
-    'autoplan',
-    'autotest',
-    'autoworld',
-    'auv',
-    'auvergnat',
-    'avalanching',
-    'avantage',
-    'avante',
-    'aveda',
-    'aversa',
-    'avesco',
-    'aveyron',
-    'avianca',
     'aving',
-    'avl',
-    'avner',
-    'avocourt',
-    'avoriaz',
-    'avostar',
-    'avow',
-    'avra',
-    'avus',
-    'awad',
-    'award-giving',
-    'away\'',
-    'awayday',
-    'awiel',
-    'awk',
-    'awlgrip',
     'awolowo',
-    'axeing',
-    'axs',
-    'aya',
-    'ayee',
-    'ayermine',
-    'aylburton',
-    'aylesmore',
-    'aysha',
-    'ayyash',
-    'azazel',
-    'azems',
-    'azerbaydzhan',
-    'azizi',
-    'aztech',
-    'azurophil',
     'b&eacute;art',
-    'b&ndash;17g',
-    'b&uuml;hler',
-    'b&uuml;rgerliches',
-    'b-17f',
-    'b-17g',
-    'b-25',
-    'b-b-b-brothel',
-    'b-isdn',
-    'b-p',
-    'b.a',
-    'b.y',
-    'b27',
-    'b69',
-    'baa-ing',
-    'babacar',
     'babars',
-    'babas',
-    'babba-baa',
-    'babbacombe',
-    'baby-',
-    'baby-face',
-    'baby-talk',
-    'babyface',
-    'babykins',
-    'babywear',
-    'bacchanalia',
-    'bachelor-girl',
-    'bachet',
-    'bachilor',
-    'bacie',
-    'back-bearing',
     'back-bonding',
-    'back-chat',
-    'back-country',
-    'back-court',
-    'back-lighting',
-    'back-of-an-envelope',
-    'back-of-beyond',
-    'back-pressure',
-    'back-stroke',
-    'back-substitution',
-    'back-to-wall',
-    'backcrosses',
-    'backheels',
-    'backlashes',
-    'bacl',
-    'bacteria-free',
     'bad-mouthing',
-    'badd',
-    'badger-watching',
-    'badly-designed',
-    'badly-paid',
-    'badock',
-    'badshot',
-    'bae-thomson',
-    'baedekers',
-    'bagborough',
-    'bagca',
-    'bagdikian',
-    'bagguley',
-    'bagnor',
-    'bagsik',
-    'bahaeddin',
     'baic',
-    'baies',
-    'bailhache',
-    'baillargeon',
-    'bailleul',
-    'bailli',
-    'baillis',
-    'baindu',
-    'bairdii',
-    'baister',
-    'bajocian',
-    'bakero',
-    'bakongo',
-    'bakow',
-    'balaban',
-    'baland',
     'balansae',
-    'balas',
-    'balbo',
-    'balconied',
-    'baldassaran',
-    'baldhead',
-    'baldoyle',
-    'baldrics',
-    'bale-out',
-    'balen',
-    'ball&eacute;n',
-    'ball-boy',
-    'ball-gouging',
-    'ballasarly',
-    'ballinaby',
-    'ballochmyle',
     'balloonland',
-    'ballotine',
-    'ballotted',
-    'ballybrit',
-    'ballyholme',
-    'balmerino',
-    'balms',
-    'balranald',
-    'balsa-wood',
-    'bambaataa',
-    'banausus',
-    'banchini',
-    'banctec',
-    'bandbox',
-    'bandcall',
-    'bandsawn',
     'bandura',
-    'banefelde',
-    'bang-bang',
-    'bangla',
-    'bangour',
-    'bank-book',
-    'bankfield',
-    'banko',
-    'bankowski',
-    'bannach',
-    'banner-waving',
-    'bannered',
-    'baquero',
-    'bar&eacute;tous',
-    'bar-b-q',
-    'baragiola',
     'barakat',
-    'barbarella',
-    'barbarito',
-    'barbedette',
-    'barbeito',
-    'barbering',
-    'barclaya',
-    'bardeen',
-    'bardely',
-    'barga',
-    'barge-pole',
-    'bargello',
-    'bargemaster',
-    'barka',
-    'barke',
-    'barlen',
     'barletta',
-    'barn-drying',
-    'barn-stormed',
-    'barnicoat',
-    'barnier',
-    'barralets',
-    'barranquilla',
-    'barrau',
-    'barsac',
-    'barters',
-    'bartholomaeus',
-    'bartiamaus',
-    'bartington',
-    'bartleby',
-    'barty',
-    'basan',
     'basavaiah',
-    'baseej',
-    'baseflow',
-    'basehead',
-    'basenji',
-    'basepairs',
-    'bashkortostan',
-    'bashmet',
-    'basiliensis',
-    'basilisks',
-    'basingstoke-based',
-    'baskan',
-    'basons',
-    'basotho',
-    'basqueness',
-    'bassa',
     'bassus',
-    'bastet',
-    'bastien',
-    'batallion',
-    'bath-towel',
-    'batrec',
-    'battiston',
-    'battle-readiness',
-    'battle-sub',
-    'battlecry',
-    'baulch',
-    'baulking',
-    'bavents',
-    'bavin',
-    'baw',
-    'bawsinch',
     'bayan',
-    'bayazid',
-    'bayerischer',
-    'baylor',
-    'bcgm',
-    'bcl-2-',
-    'bcms',
-    'bdp',
-    'bdtc',
-    'beagleworks',
-    'beane',
-    'beanlands',
-    'beanz',
-    'bear-baiting',
-    'beardshall',
-    'bearley',
     'beat-\'em-up',
-    'beat-beat',
-    'beath',
-    'beauce',
-    'beauclerk',
-    'beauj\'',
-    'beauts',
-    'beavises',
-    'bebel',
-    'bechar',
-    'bechteler',
-    'beckside',
-    'becomming',
-    'becos',
-    'bed-',
-    'bed-use',
     'bedbug',
-    'beddoe',
-    'bedposts',
-    'bedspace',
-    'bedwas',
-    'bee-hive',
-    'beebop',
-    'beech-wood',
-    'beeman',
-    'beene',
-    'beerhouse',
-    'beeswood',
-    'beetroot-red',
-    'beezley',
-    'befana',
-    'beginneth',
     'begorrah',
-    'behalves',
-    'behind-hand',
-    'behnke',
-    'beier',
-    'beigey',
-    'beinum',
-    'beja',
-    'bejel',
-    'bekaert',
-    'bekko',
-    'belaboured',
-    'belaid',
-    'belfitt',
-    'belge',
-    'belhelvie',
     'belin',
-    'belinskii',
-    'bellenden',
-    'bellerophen',
-    'bellhouse',
-    'bellings',
-    'bellise',
-    'belloucif',
-    'bellsdyke',
-    'belly-ache',
-    'belmonte',
-    'belmullet',
-    'beloe',
-    'belous',
-    'below-surface',
-    'belters',
     'belvings',
-    'belye',
-    'bema',
-    'bemac',
-    'bems',
-    'bemuse',
-    'ben-ami',
-    'benazzi',
-    'benbolio',
-    'bendigo',
-    'bendrofluazide',
-    'benefit-to-risk',
-    'beneke',
-    'benhabyles',
-    'benignus',
-    'beninese',
     'benlate',
-    'bennetton',
-    'benney',
-    'benni',
-    'benoist',
-    'benozzo',
-    'bens',
-    'benzalkonium',
-    'benzol',
-    'beorhtwold',
-    'beran',
-    'bereiter',
-    'berenzoid',
-    'beresfords',
-    'bergader',
-    'berggren',
     'bergonzi',
-    'bergot',
-    'berht',
-    'berkman',
-    'berline',
-    'bernabo',
-    'bernadine',
-    'bernadotte',
-    'bernard-ezi',
-    'bernerd',
-    'berriman',
-    'berstein',
-    'bertil',
-    'besmirching',
-    'besoms',
-    'besottedness',
     'bessey',
-    'best-equipped',
-    'best-prepared',
-    'besty',
-    'beta-blocking',
-    'bethpage',
-    'betnovates',
-    'betong',
-    'betony',
-    'betroth',
-    'better-balanced',
-    'better-designed',
-    'betz',
-    'beventini',
-    'beween',
-    'bezdna',
     'beze',
-    'bezels',
-    'bhagat',
-    'bhaji',
-    'bhakti',
-    'bhangra',
-    'bharati',
-    'bhat',
-    'bhatnagar',
-    'bhe',
-    'bhf',
-    'bhishma',
-    'bhubaneswar',
-    'bhuna',
-    'bi-cameral',
-    'bialystok',
     'bibble',
-    'bible-believing',
-    'bicchiere',
-    'bickenhall',
-    'bickerstaff',
-    'bicknor',
-    'bicourt',
-    'bicuculline',
-    'biddles',
-    'bidouze',
-    'biedermeier',
-    'bielle',
-    'bierton',
-    'biffing',
-    'bifid',
-    'bifrons',
     'bifteck',
-    'big-wig',
-    'bigarrade',
-    'bigham',
-    'bigmouth',
-    'bijl',
-    'bilbie',
-    'bilbow',
-    'bileka',
-    'biliterate',
-    'billam',
-    'billets-doux',
-    'billican',
-    'billingham-based',
-    'bilmarsh',
-    'biltmore',
     'bimec',
-    'bindview',
-    'bines',
-    'binging',
-    'binmore',
-    'binos',
-    'biocides',
-    'biogs',
-    'biol',
-    'biologicals',
-    'biologique',
-    'bionauts',
-    'bioplast',
-    'bioprobe',
-    'bioprocessing',
-    'biotron',
     'birch-broom',
-    'bird\'s-nest',
-    'bird-eating',
-    'bird-filled',
-    'birdworld',
-    'birth-',
-    'biscopea',
-    'bit-map',
-    'bita',
-    'bitoo',
-    'bixby',
-    'bj-10e',
-    'blache',
-    'black-board',
-    'black-eye',
-    'black-green',
     'black-hooded',
-    'black-leading',
-    'black-marketeering',
-    'black-rimmed',
-    'blackall',
-    'blackburn-based',
-    'blackhawks',
-    'blackjacks',
-    'blackland',
-    'blacklow',
-    'blackmen',
-    'blacksided',
-    'blagrove',
-    'blakenhurst',
-    'blakeslee',
-    'blakeway',
     'blalock',
-    'blanchisserie',
-    'blanchot',
-    'blancoed',
-    'blanes',
-    'blanquefort',
-    'blashie',
-    'blatnik',
-    'blb',
-    'bleedin',
-    'blencathra',
-    'blether',
-    'blettes',
-    'blidah',
-    'blind-eyed',
-    'blitzkreig',
     'blizard',
-    'bloc-based',
-    'block-booking',
-    'block-release',
-    'bloo',
-    'blood-alcohol',
-    'blood-bath',
-    'blood-feud',
-    'blood-money',
-    'blood-sharing',
-    'blood-sport',
-    'blood-sucker',
-    'blood-supply',
-    'blood-tested',
-    'blood-typing',
-    'blood-vessel',
     'bloodstone',
-    'bloodying',
-    'bloom-bearing',
-    'blow-drier',
-    'blow-outs',
-    'bloweth',
-    'blu-tak',
-    'blue-car',
-    'blue-eyes',
-    'bluetower',
-    'blything',
-    'board-sailing',
-    'boardhouse',
-    'boat-builder',
-    'boat-race',
-    'boat-rocking',
     'bobet',
-    'bobolini',
-    'bobrow',
-    'bobsled',
-    'boches',
-    'bodice-ripper',
-    'bodice-ripping',
-    'bodman',
-    'body-count',
-    'body-shell',
-    'bodybag',
-    'bodymap',
-    'boerestaat',
-    'boesch',
-    'boffs',
-    'bogadjimbri',
     'bohuslav',
-    'bokek',
-    'bol&eacute;ro',
-    'bol&iacute;n',
-    'boleat',
-    'boley',
-    'bolin',
-    'boliviana',
-    'bolling',
-    'bollocked',
-    'bollom',
-    'bollox',
-    'boltho',
-    'bolyai',
-    'bombadier',
-    'bombax',
     'bomby',
-    'bombyx',
-    'bomford',
-    'bonaly',
-    'bondevik',
-    'bonefishing',
-    'bongwater',
-    'bonino',
-    'bonked',
-    'bonser',
-    'boo-hoo',
-    'boobrie',
-    'bood',
-    'boogy',
-    'book-banning',
-    'book-burning',
     'book-cover',
-    'book-filled',
-    'bookclub',
-    'bookfair',
-    'bookworks',
-    'booly',
-    'boomeranged',
-    'bootblacks',
-    'boothe',
-    'bootstrapping',
-    'booy',
-    'bopp',
-    'borch',
-    'borchgrave',
-    'borin\'',
-    'borno',
     'borrehus',
-    'borreraig',
-    'borsholder',
-    'bortzmeyer',
-    'boru',
-    'borzov',
-    'boschwitz',
-    'bosnian-held',
-    'boss-man',
-    'bosschaert',
-    'botflies',
-    'botherin\'',
-    'bottery',
-    'bottled-water',
-    'bottom-hole',
-    'bottom-of-the-league',
     'bouley',
-    'boumaraaf',
-    'boundary-line',
-    'boursault',
-    'boussac',
-    'bovines',
-    'bowerbank',
-    'box-file',
-    'boxfresh',
-    'boxout',
-    'boy-girl',
-    'boy-meets-girl',
-    'boy-wonder',
-    'boyb',
-    'boyks',
-    'boysie',
     'bozovic',
-    'bphil',
-    'bpms',
-    'br&uuml;nnhildes',
-    'braceleted',
-    'bracken-covered',
-    'brackensgill',
-    'bracklesham',
-    'bracque',
-    'braddick',
-    'brads',
-    'brainshare',
-    'brak',
-    'brame',
-    'bramford',
-    'bramont',
     'branchinecta',
-    'brancker',
-    'brand-building',
-    'brandstetter',
-    'branshaw',
-    'brantridge',
-    'braose',
-    'brasidas',
-    'brasiliense',
-    'brass-founding',
-    'brass-work',
-    'bratpack',
-    'braunstone',
-    'brazed',
-    'bread-line',
-    'breading',
     'breakfast-bar',
-    'breakfront',
-    'breast-plate',
-    'breast-screening',
-    'breastsummer',
-    'breath-holding',
-    'breath-testing',
-    'breathalyse',
-    'breathin\'',
-    'brecsu',
-    'breeched',
-    'brek',
-    'brennus',
-    'bresdin',
-    'bresler',
-    'bressington',
     'breteuil',
-    'bretwalda',
-    'brevets',
-    'brewis',
-    'brezhnevite',
-    'briarcliff',
-    'bribe-taking',
-    'bric',
-    'bridalwear',
-    'bridegroom-to-be',
-    'bridge-router',
-    'bridgeview',
-    'brierly',
-    'bright-pink',
-    'brighton-built',
-    'brignais',
     'brillig',
-    'brim-full',
-    'brindex',
-    'brineshrimps',
-    'brisingamen',
-    'brisset',
-    'bristows',
-    'britford',
-    'british-designed',
-    'broad-gauge',
-    'broad-mindedness',
-    'broad-winged',
-    'broadcasted',
-    'broccolli',
-    'broderbund',
-    'brolo',
     'bromate',
-    'bromides',
-    'bronagh',
-    'bronglais',
-    'bronwydd',
-    'bronzer',
-    'broodseinde',
-    'broomielaw',
-    'broomloan',
-    'broomstreet',
-    'broseley',
-    'brot',
-    'brouilly',
-    'broussonet',
-    'brow-beating',
-    'browbeating',
     'brown-faced',
-    'brown-headed',
-    'browney',
-    'brownmiller',
-    'brownswerd',
-    'brrrming',
-    'bruche',
-    'brueckner',
-    'bruern',
-    'brugui&egrave;re',
-    'bruguier',
-    'brul&eacute',
-    'brunau',
-    'brunsden',
-    'brush-type',
-    'brusie',
     'bruskin',
-    'bruson',
-    'bryceson',
-    'bryher',
-    'bryman',
-    'bsc(nursing)',
-    'bseisou',
-    'bsf',
-    'bsk',
-    'btf',
-    'btis',
-    'btp',
-    'bu&ntilde;uel',
-    'bubba',
-    'buchler',
-    'buchsbaum',
     'bucin',
-    'buckerown',
-    'buckshee',
-    'bud-break',
-    'budde',
-    'buddhistic',
-    'buddles',
-    'budget-output',
-    'budin',
-    'budo',
-    'budswap',
-    'buend&iacute;a',
-    'buff-brown',
-    'buffalo-hunting',
-    'bufman',
-    'bugaboo',
     'builtin',
-    'buiter',
-    'bukoshi',
-    'bulb-shaped',
-    'bulbed',
-    'bulbourne',
-    'bulgers',
-    'bull-ring',
-    'bull-shit',
-    'bullate',
-    'bulleted',
-    'bullheads',
-    'bullworker',
-    'bully-beef',
-    'bulpin',
-    'bulteel',
     'bum-boy',
-    'bumetanide',
-    'bunchy',
-    'bundesrepublik',
-    'bungy-jumping',
-    'bunnie',
-    'bunning',
-    'buoncamino',
-    'buraimi',
-    'burcham',
-    'burchard',
-    'burchette',
-    'bureaucratic-administrative',
-    'bureauspace',
-    'burgenland',
-    'burgies',
     'burgoa',
-    'burham',
-    'burhan',
-    'burl',
-    'burnets',
-    'burnetti',
-    'burntollet',
-    'burrage',
-    'burred',
-    'burs',
-    'bursley',
-    'bus-hopped',
-    'bush-covered',
-    'bushpig',
-    'bushveld',
-    'business-men',
     'businesswise',
-    'busing',
-    'busiris',
-    'busselton',
-    'buste',
-    'bustin\'',
-    'butner',
-    'butskellite',
-    'buttaud',
-    'butter-making',
-    'butterbur',
-    'buttering-up',
-    'buyer-client',
-    'buying-out',
-    'buzby',
-    'bva',
     'bwta',
-    'bykers',
-    'byrde',
-    'byrness',
-    'byzantinist',
-    'bzns-e',
-    'c&aelig;lum',
-    'c-45',
-    'c-spanner',
-    'c.b.s.',
-    'c.c.c.',
-    'c.p.c.',
-    'c.p.d.',
-    'c17',
-    'c18',
-    'c20',
     'ca-clipper',
-    'ca-cricket',
-    'caald',
-    'cab-stand',
-    'caba',
-    'cabalist',
-    'cabanaconda',
-    'cabeza',
-    'cable-operated',
-    'cabobpur',
-    'cabrillo',
-    'cabus',
-    'cac-40',
-    'caccia',
-    'cacerta',
-    'cachin',
     'cad&eacute;ac',
-    'cadair',
-    'cadastral',
-    'cadcentre',
-    'cadwa',
-    'cae-link',
-    'caenozoic',
-    'caig',
-    'caiman',
-    'cairness',
-    'cairnmore',
-    'cairnpapple',
-    'cairolo',
-    'cais',
-    'cake-maker',
-    'cakestand',
     'cal&eacute;donie',
-    'calafat',
-    'calapaez',
-    'calaveras',
-    'calcarea',
-    'cald&eacute;ron',
-    'caldecote',
-    'calendering',
-    'calf-bearer',
-    'calgarth',
-    'calheta',
-    'caliber',
-    'calisto',
-    'calix',
-    'calixte',
-    'call-level',
     'callam',
-    'callay',
-    'callen',
-    'callery',
-    'callink',
-    'callisto',
-    'calloo',
-    'callout',
-    'calment',
-    'calorie-consuming',
-    'calveley',
-    'calydon',
-    'camanachd',
-    'camaro',
-    'camblet',
-    'cameco',
     'camel-lepard',
-    'camerone',
-    'camet',
-    'camilion',
-    'camillagate',
-    'cammack',
-    'camogie',
-    'camp-site',
-    'campi',
-    'campidoglio',
-    'campine',
-    'campriello',
-    'campylopus',
-    'canaday',
-    'canadian-based',
-    'canali',
     'canalizing',
-    'canandaigua',
-    'candi',
-    'candle-grease',
-    'canino',
-    'canizales',
-    'cankered',
-    'canna\'',
-    'cannibalizing',
-    'cannop',
-    'canolfan',
-    'canonises',
-    'canonistics',
-    'canopic',
-    'cansulex',
-    'cantaleupe',
     'cantate',
-    'cantilevers',
-    'cantina',
-    'cantini',
-    'cantlow',
-    'canty',
-    'canudo',
-    'canvas-covered',
-    'capesize',
-    'capilla',
-    'capnut',
-    'cappello',
-    'caprarola',
-    'caprichos',
-    'caption-',
-    'capture-recapture',
     'capuccino',
-    'caputi',
-    'caputo',
-    'car-borne',
-    'car-driving',
-    'car-pooling',
-    'car-ringing',
-    'carabi&ntilde;eros',
-    'caracara',
-    'caracaras',
-    'caramelized',
-    'carandente',
-    'caransa',
-    'caraque',
-    'caratis',
-    'carbon-13',
     'carbon-carbon',
-    'carbon-chemistry',
-    'carbon-dated',
-    'carbonicum',
-    'carcrime',
-    'card-based',
-    'cardamine',
-    'cardinale',
-    'cardioid',
-    'care-free',
-    'care-worn',
-    'careen',
-    'carefully-laid',
-    'carefully-planned',
-    'caresse',
-    'cargo-carrying',
     'cargo-handling',
-    'carian',
-    'carinated',
-    'cariplo',
-    'carisma',
-    'carjacked',
-    'carminati',
-    'carmined',
-    'carmo',
-    'carnaudmetalbox',
-    'carnigill',
-    'carnsore',
-    'carolinian',
-    'carpet-beater',
-    'carpet-covered',
-    'carps',
     'carrard',
-    'carrasco',
-    'carri-all',
-    'carrion-eating',
-    'carrot-coloured',
-    'carry-case',
-    'carston',
-    'cart-wheel',
-    'cartelised',
-    'cartesianism',
-    'cartiera',
-    'cartlidge',
-    'cartmill',
-    'cartooning',
-    'cartouches',
-    'casals',
     'casb',
-    'case-fatality',
-    'case-file',
-    'caseness',
-    'cash-cropping',
-    'cash-generating',
-    'cashback',
-    'cashu',
-    'casina',
-    'cassandring',
-    'casse',
-    'casseroled',
-    'cassin',
-    'cast-list',
-    'caste-based',
-    'castellon',
     'castlevania',
-    'castrum',
-    'cat-gut',
-    'catalogo',
-    'catalyzes',
-    'catastrophies',
-    'catch-crop',
-    'catcleugh',
-    'catechizing',
-    'catenation',
-    'caterling',
-    'catflap',
-    'catgacgtcatg',
-    'cath\'lic',
-    'cathiodermie',
-    'cathkin',
     'cathleen',
-    'catnach',
-    'catrake',
-    'catrine',
-    'catroux',
-    'catsmeat',
-    'cattermole',
-    'cattle-grid',
-    'cattle-market',
-    'catullo',
-    'cauda',
-    'caudrons',
-    'caues',
-    'cauley',
-    'caulophyllum',
-    'cavaliere',
     'cavedone',
-    'cavi',
-    'cavilling',
-    'cavity-wall',
-    'cavok',
-    'cavor',
-    'caya',
-    'cbto',
-    'cc-m',
-    'cccp',
-    'ccp-ml',
-    'cdma',
-    'cdpa',
-    'cdsc',
-    'ceao',
-    'cebiche',
     'ceder',
-    'ceiling-to-floor',
-    'celentano',
-    'celestions',
-    'celgene',
-    'cellaro',
-    'cellophane-wrapped',
-    'cellulosics',
-    'cemrel',
-    'cenaioli',
-    'cenerente',
-    'cenote',
-    'cent-owned',
-    'centifolias',
-    'centrally-controlled',
-    'centre-',
     'centre-surround',
-    'centrovincial',
-    'centrust',
-    'cepacia-negative',
-    'cephalochordates',
-    'cepsa',
-    'ceramides',
-    'ceratopteris',
-    'cercaria',
-    'cermet',
-    'cerrato',
-    'cerrejon',
-    'certo',
-    'certosa',
-    'cervl',
-    'cerys',
     'cessnock',
-    'cest',
-    'cetacea',
-    'cetane',
-    'ceuse',
-    'ceux',
-    'cexspex',
-    'cezannes',
-    'ch\'io',
-    'ch-',
-    'chaabane',
-    'chabrier',
-    'chace',
-    'chafes',
-    'chafford',
-    'chait',
     'chakrabarty',
-    'chaldon',
-    'chale',
-    'chalk-pit',
-    'chalkdust',
-    'chall',
-    'chamanji',
-    'chamot',
-    'champa',
-    'champex',
-    'chandravati',
-    'chandrika',
-    'change-orientation',
-    'change-round',
-    'chantecler',
-    'chanteur',
     'chapieux',
-    'chapmangate',
-    'chapone',
-    'chaque',
-    'character-',
-    'chare',
-    'chargecard',
-    'charlemont',
-    'charlottes',
-    'charmes',
-    'charnels',
-    'charoen',
-    'charri&egrave;re',
-    'charrier',
-    'chartham',
-    'chartwork',
     'chassie',
-    'chat-line',
-    'chatauqua',
-    'chataway',
-    'chateauneuf',
-    'chattier',
-    'chaudhary',
-    'chaudry',
-    'chauhan',
-    'chauntry',
-    'chauveau',
-    'chavasse',
-    'chawner',
-    'cheatin\'',
-    'check&mdash;module',
-    'checkfree',
     'checking-out',
-    'checkweighing',
-    'cheddars',
-    'cheeped',
-    'cheeps',
-    'cheere',
-    'cheese-and-wine',
-    'cheesewire',
-    'chef-proprietor',
-    'cheiro',
-    'cheju-do',
-    'chekhovian',
-    'chelalo',
-    'chelates',
-    'cheltzie',
-    'chelveston',
     'chemical-',
-    'chemlab',
-    'chemtech',
-    'chenier',
-    'cheniere',
-    'chep',
-    'chep&eacute;n',
-    'chequer-board',
-    'chernin',
-    'chesfield',
-    'chess-player',
-    'chevroned',
-    'chezery',
-    'chhun',
-    'chhunlim',
-    'chi-yang',
     'chiappini',
-    'chiaravalle',
-    'chiari',
-    'chicago-born',
-    'chicagoans',
-    'chickenley',
-    'chicles',
-    'chicocki',
-    'chidham',
-    'chie',
-    'chien-shien',
-    'chiese',
-    'chiew',
-    'chigi',
-    'chikweche',
-    'chilcote',
     'child-bride',
-    'child-sacrifice',
-    'children\'',
-    'childrenswear',
-    'chillin\'',
-    'chimney-sweeper',
-    'chin-strap',
-    'chinagraph',
-    'chinantec',
-    'chinee',
-    'chines',
-    'chingachgook',
-    'chingada',
-    'chinmen',
-    'chinnock',
-    'chiocciole',
     'chip-chip-chip',
-    'chiquita',
-    'chirripo',
-    'chisocheton',
-    'chiti',
-    'chiweshe',
-    'chlorhexidine',
-    'chlorine-based',
-    'chlorine-containing',
-    'chlorodyne',
-    'chobe',
-    'chockful',
-    'chogm',
-    'choleski',
-    'cholmondley',
-    'chongqing',
     'choon',
-    'choons',
-    'chooph',
-    'chopping-board',
-    'choppington',
-    'choreograph',
-    'chorikon',
-    'choucroute',
-    'choul',
-    'chrimbo',
-    'christ-schr&ouml;der',
-    'christed',
-    'christliche',
-    'christmas-card',
-    'christmas-tree',
-    'christon',
     'chrodegang',
-    'chryselephantine',
-    'chrysolophus',
-    'chuang',
-    'chuckwagon',
-    'chug-chug',
-    'chui',
-    'chuk',
-    'chunuk',
-    'chuvashia',
-    'chwit',
-    'chymist',
-    'cibc',
-    'cibd',
-    'cidg',
-    'cidhal',
     'cif',
-    'cifad',
-    'ciga',
-    'cigale',
-    'cigar-chomping',
-    'cigna',
-    'cin&eacute;ma',
-    'cinchoneros',
-    'cinefex',
-    'cini',
-    'circle-dance',
-    'cirino',
-    'cisa',
-    'ciss',
-    'cisse',
-    'cissoko',
     'citer',
-    'citified',
-    'citilend',
-    'citt',
-    'city-born',
-    'city-slicker',
-    'civvie',
-    'claim(s)',
-    'claim-form',
-    'clairmonte',
-    'claisse',
-    'clammer',
-    'clane',
-    'clanness',
-    'clari',
-    'clarke-glass',
     'clarkias',
-    'clarkin',
-    'clarts',
-    'clarty',
-    'class-distinction',
-    'class-war',
-    'classicizing',
-    'claustral',
-    'clavers',
-    'clayden',
-    'clean-lined',
-    'clean-looking',
-    'cleanout',
-    'cleanshaven',
-    'clear-thinking',
-    'clearaid',
     'clearasil',
-    'clearspring',
-    'cleavon',
-    'clendon',
-    'clercs',
-    'clere',
-    'clerici',
-    'clerking',
-    'clewer',
-    'clg',
-    'cliche-ridden',
-    'clickart',
-    'cliffy',
-    'climbin\'',
-    'clinicare',
-    'cloak-room',
     'clock-face',
-    'clocke',
-    'clogg',
-    'cloncore',
-    'clonking',
-    'clonks',
-    'clori',
-    'close-mesh',
-    'close-shaven',
-    'closed-down',
-    'cloth-cap',
-    'cloth-manufacturing',
-    'clothes-washing',
-    'cloud-burst',
-    'cloud-cuckoo-land',
-    'cloudbursts',
     'clt',
-    'clubbe',
-    'clubshaft',
-    'clubturf',
-    'clutterbug',
-    'clyfford',
-    'cmcs',
-    'cmt',
-    'cncl',
-    'cndo',
-    'cnhc',
-    'cnl',
-    'cnpf',
-    'cnpp-psd',
-    'co-directed',
-    'co-edited',
     'co-extruded',
-    'co-habit',
-    'co-headlining',
-    'co-present',
-    'coach-built',
-    'coakley',
-    'coal-cutter',
-    'coal-exporting',
-    'coalies',
-    'coalition-building',
-    'coastland',
-    'coat-collar',
-    'coat-rack',
-    'coaters',
-    'coati',
-    'cobalt-60',
     'cobbley',
-    'coblenz',
-    'coblynau',
-    'coccolithophores',
-    'cockett',
-    'cockram',
-    'cocksedge',
-    'cocktail-party',
-    'coconut-fibre',
-    'cod-piece',
-    'codding',
-    'codds',
-    'codorniu',
-    'coehorn',
-    'coes',
-    'coffee-cream',
     'coffee-grinder',
-    'coffee-spoonful',
-    'coffee-time',
-    'cog-wheel',
-    'cogitate',
-    'cogitated',
-    'coiii',
-    'coinshooting',
-    'cojones',
-    'colaba',
-    'colebourn',
-    'colgrass',
-    'colics',
-    'coligated',
-    'collectivizing',
-    'colles',
     'collimating',
-    'colline',
-    'colms',
-    'cologne-based',
-    'coloniale',
-    'colonne',
-    'colorada',
-    'colorimetry',
-    'coloring',
-    'colour-difference',
-    'colpeper',
-    'colucci',
-    'colum',
-    'columban',
-    'comare',
-    'combellga',
     'combinable',
-    'combine-harvester',
-    'comed',
-    'comestibles',
-    'comic-opera',
-    'comice',
-    'commando-style',
-    'commen',
-    'commercial-radio',
-    'commercialising',
-    'commercially-grown',
-    'commissaires-priseurs',
-    'commissariats',
-    'commissionnaires',
-    'commissures',
-    'commiting',
     'committee-member',
-    'committee-room',
-    'commius',
-    'commmunity',
-    'common-mode',
-    'commoning',
-    'communale',
-    'communist-backed',
-    'community-led',
-    'community-level',
-    'comoro',
-    'comoving',
-    'compaor',
-    'compartmentalize',
-    'compendex',
-    'complainin\'',
     'comple',
-    'comporting',
-    'compotes',
-    'compte',
-    'comptonia',
-    'computaprint',
-    'computer-designed',
-    'computer-enhanced',
-    'computer-produced',
-    'computereasy',
-    'comtech',
-    'con-rod',
-    'conaghan',
-    'conaie',
-    'conall',
-    'conarls',
     'conboy',
-    'conce',
-    'concent',
-    'concentus',
-    'concertone',
-    'concretionary',
-    'concurrents',
-    'conestoga',
-    'confait',
-    'confiteor',
-    'confiture',
-    'conflict-set',
-    'conham',
-    'coni',
-    'coning',
-    'conjoin',
     'conjugally-based',
-    'connate',
-    'conneau',
-    'connectathon',
-    'connu',
-    'cononley',
-    'conover',
-    'consaquay',
-    'conservateur',
-    'conservativism',
-    'conservatorio',
-    'considerateness',
-    'consonant-vowel-consonant',
-    'constantinos',
-    'constantinou',
-    'constipating',
     'construcciones',
-    'consulta',
-    'conta',
-    'contemplacion',
-    'contemporanea',
-    'contemporaneo',
-    'contextualize',
-    'contigent',
-    'continental-type',
-    'contini',
-    'contrapunctus',
-    'contrarian',
-    'contrastiveness',
-    'control-centred',
-    'controversey',
-    'convairs',
     'convected',
-    'convergers',
-    'convers',
-    'convoying',
-    'cook-in',
-    'cookworthy',
-    'cooky',
-    'cool-bag',
-    'cool-looking',
-    'coore',
-    'copan',
-    'copiousness',
-    'copper-red',
-    'coppergate',
-    'coppery-red',
-    'coprophilia',
     'coproxamol',
-    'copy-writer',
-    'coquettes',
-    'coquilles',
-    'coralline',
-    'corbies',
-    'corcrain',
-    'cordner',
-    'core-containing',
-    'corfiot',
-    'corina',
-    'corinium',
-    'corinthia',
-    'cork-board',
-    'corn-drying',
-    'corn-grinding',
     'coronium',
-    'corporate-tax',
-    'corpy',
-    'corregidor',
-    'corrieshalloch',
-    'corsetted',
-    'cortonwood',
-    'corvid',
-    'corvinus',
-    'corydalia',
-    'cosans',
-    'coshes',
-    'cosmiques',
-    'cossington',
-    'cost-driver',
-    'cost-justification',
     'cost-per-copy',
-    'costaining',
-    'cotten',
-    'coucil',
-    'coulbourn',
-    'couldst',
-    'coulibali',
-    'coulon',
-    'coumbassa',
-    'council-sponsored',
-    'counter-argued',
-    'counter-pastoral',
-    'counter-plots',
-    'counter-reform',
-    'counterbid',
-    'counterclaiming',
     'counterespionage',
-    'counterfeited',
-    'counterpacks',
-    'countervalue',
-    'countesses',
-    'countrie',
-    'country-based',
-    'countrys',
-    'coupled-cavity',
-    'courant',
-    'courland',
-    'courreges',
-    'courri&egrave;res',
-    'course&mdash',
-    'court-house',
-    'courtin\'',
     'couse',
-    'cousinage',
-    'coussey',
-    'couturi&egrave;re',
-    'cova',
-    'covaried',
-    'covering-up',
-    'cow-keeping',
-    'cowboy-style',
-    'cowichans',
-    'cowing',
-    'cowthorpe',
-    'coxiella',
-    'coxswains',
-    'cozen',
-    'cozier',
     'cpvpv',
-    'cr&eacute;a',
-    'cr&ecirc;perie',
-    'crablouse',
-    'crackside',
-    'craftarts',
-    'cragged',
-    'craiova',
-    'cramphorn',
-    'craneflies',
-    'crapauds',
-    'crape',
-    'cratch',
-    'cratchet',
-    'creamware',
-    'creaser',
     'creative-writing',
-    'credta',
-    'crema',
-    'crescendi',
-    'crescent-pattern',
-    'cresyl',
-    'cretonne-covered',
-    'crewcuts',
-    'cribier',
-    'crichtan',
-    'crichtons',
-    'cricket-lover',
-    'cricket-writer',
-    'cricks',
-    'crie',
-    'crillon',
     'crimebusting',
-    'crimmen',
-    'crimson-faced',
-    'criseyde',
-    'crisis-management',
-    'cristales',
-    'cristleton',
-    'cristophe',
-    'criterion-',
-    'critica',
-    'critiquing',
-    'crix',
-    'croat-serb',
-    'croda',
-    'crohns',
-    'crooke',
     'crookshank',
-    'crop-sharing',
-    'cropspray',
-    'croskery',
-    'cross-bedded',
-    'cross-classification',
-    'cross-development',
-    'cross-field',
-    'cross-hybridisation',
-    'cross-matching',
-    'cross-rail',
-    'cross-refer',
-    'cross-road',
-    'cross-sex',
-    'cross-shareholding',
-    'cross-slab',
     'cross-slide',
-    'cross-track',
-    'crossbeams',
-    'crosscom',
-    'crosscut',
-    'crossed-over',
-    'crossin\'',
-    'crossscript',
-    'crossthwaite',
-    'crouchman',
-    'crouse',
-    'croyden',
-    'croz',
-    'cruciferae',
-    'cruft',
-    'cruice',
     'crumpsall',
-    'cruttwell',
-    'cruzate',
-    'crx-24z',
-    'cryl',
-    'cryo-preservation',
-    'crystal-ball',
-    'cs-2',
-    'csfb',
-    'ctab',
-    'cubango',
-    'cubbon',
-    'cucc',
-    'cuckolding',
-    'cucu',
-    'cuemasters',
     'cuervo',
-    'cufflink',
-    'cughtagh',
-    'cugliani',
-    'cuiken',
-    'cukcs',
-    'culliford',
-    'cullingford',
-    'cullum',
-    'cumulates',
-    'cumulating',
-    'cunarder',
-    'cuneo',
-    'cup-winner',
-    'cupido',
-    'curant',
     'curate-in-charge',
-    'curbelo',
-    'curina',
-    'curlewis',
-    'curmudgeons',
-    'current-awareness',
-    'curriculum-employment',
-    'curtain-wall',
-    'curtisii',
-    'curva',
-    'cuschieri',
-    'cuscuta',
-    'cuspate',
-    'cussack',
-    'custodemus',
-    'custodiet',
     'customs-cleared',
-    'custos',
-    'cut-and-burnt',
-    'cuticura',
-    'cuties',
-    'cutting-room',
-    'cuzick',
-    'cvessel',
-    'cwenthryth',
-    'cwmavon',
-    'cybex',
-    'cybill',
-    'cycler',
-    'cyd',
-    'cygerly',
-    'cynos',
     'cytisus',
-    'cytokinin',
-    'czech-made',
-    'czecho-slovak',
-    'czernin',
-    'd&eacute;cam&eacute;ron',
-    'd&eacute;tournement',
-    'd&euml;kuji',
-    'd&oslash;le',
-    'd\'affaires',
-    'd\'assurances',
-    'd\'o&ugrave',
-    'd\'oeuvres',
-    'd\'orientation',
-    'd-e',
-    'd-ream',
     'd-v',
-    'd.a.',
-    'd.n.',
-    'd.t.',
-    'd0',
-    'da-60',
-    'daad',
-    'daan',
-    'dabell',
-    'dablam',
-    'dabrs',
-    'daca',
-    'daceasy',
-    'dacoit',
-    'dacom',
-    'dacorum',
     'dafalla',
-    'dagnish',
-    'dags',
-    'dahlink',
-    'daimon',
-    'daintier',
-    'dairy-farming',
-    'daishowa',
-    'dalan',
-    'dalibard',
-    'daling',
-    'dalmatinac',
-    'dalseattie',
-    'dalwood',
-    'damaras',
-    'damd',
     'damerau',
-    'damge',
-    'damn-fool',
-    'damophilus',
-    'dampierre',
-    'danang',
-    'dandr&eacute',
-    'danio',
-    'dannz',
-    'danon',
-    'dantzig',
-    'danubegate',
-    'daphni',
-    'darara',
-    'darbys',
-    'dard',
     'dark-',
-    'dark-age',
-    'dark-browed',
-    'dark-leaved',
-    'darklands',
-    'darlene',
-    'daryaganj',
-    'dash-and-hide',
-    'data-analysis',
-    'data-based',
-    'data-sharing',
-    'dataglove',
-    'dataguild',
-    'dataplace',
-    'datasystems',
-    'datcha',
     'date-stamp',
-    'daughter\'',
-    'dauphinois',
-    'day\'',
-    'day-and-night',
-    'day-patient',
-    'day-rate',
-    'daynurse',
-    'dayrover',
-    'dazomet',
-    'dbi',
-    'dc&mdash;assessors',
-    'dc&ndash;3',
-    'dc-6bf',
-    'ddrc',
-    'ddwli',
     'ddysgl',
-    'de&ccaron;ane',
-    'de-activate',
-    'de-ashing',
-    'de-beaking',
-    'de-brief',
-    'de-centralised',
-    'de-gassed',
-    'de-iced',
-    'de-ionised',
-    'de-recognised',
-    'de-registered',
-    'dead-faced',
-    'deadbaits',
-    'deadbolt',
-    'deadeye',
     'deadfall',
-    'deadheading',
-    'deae-dextran',
-    'deanside',
-    'dearmer',
-    'dearne',
-    'death-blow',
-    'death-haunted',
-    'deathtraps',
-    'deathwish',
-    'debt-collecting',
-    'deby',
-    'decamps',
-    'decembrist',
-    'decinspect',
-    'decision-taker',
     'declarant',
-    'decontextualized',
-    'decorex',
-    'decrucq',
-    'decrypt',
-    'decrypted',
-    'decserver',
-    'decus',
-    'decyphering',
-    'dedalus',
-    'dedans',
-    'deejay',
-    'deejays',
-    'deep-focus',
-    'deeply-held',
-    'defectiveness',
     'defence-procurement',
-    'deficit-financing',
-    'definitionalist',
-    'defocused',
-    'defoliate',
-    'defrosts',
-    'defunctioned',
-    'dehorned',
-    'deid',
-    'dejong',
-    'dekel',
-    'deks',
-    'delahoussaye',
-    'delaitre',
-    'delapidated',
-    'delavayi',
     'delaware-based',
-    'delay-start',
-    'delcroix',
-    'delfina',
-    'delftware',
-    'delila',
-    'delimustafic',
-    'delorme',
-    'delphian',
-    'delphis',
-    'deluging',
-    'delvaux',
-    'demaine',
-    'demand-pull',
-    'demand-related',
-    'demange',
     'demarcates',
-    'dematerialises',
-    'demdike',
-    'demerging',
-    'demetrious',
-    'demi-sec',
-    'demir',
-    'demisemiquaver',
-    'demobilizing',
-    'demokedes',
-    'demokratie',
-    'demon-lover',
-    'demotivate',
-    'demus',
-    'denationalised',
-    'dend',
     'dendrobium',
-    'dendron',
-    'denholme',
-    'denia',
-    'denikin',
-    'denmead',
-    'dennay',
-    'denshi',
-    'denso',
-    'denude',
-    'deo-perspirant',
-    'deoxycytidine',
-    'deoxynucleoside',
-    'deoxypyrolidine',
-    'depero',
-    'depersonalize',
     'depopulating',
-    'deppa',
-    'depression-era',
-    'deprez',
-    'deprival',
-    'deprofessionalised',
-    'dept-num',
-    'deputes',
-    'derartu',
-    'deray',
-    'derbend',
-    'derber',
-    'dermaptera',
-    'derry-born',
-    'derwyn',
-    'desastres',
     'descry',
-    'desert-dwelling',
-    'desertified',
-    'desfourneaux',
-    'designado',
-    'deskford',
-    'desmonds',
-    'desmopressin',
-    'desparate',
-    'desparation',
-    'desperandum',
-    'desqview',
-    'dessertspoonful',
-    'destino',
-    'destructor',
-    'deterrant',
     'detrained',
-    'detta',
-    'dette',
-    'deuil',
-    'deutscheland',
-    'devas',
-    'develope',
-    'devestating',
-    'devillers',
-    'devlins',
-    'devonald',
-    'devonians',
-    'devoutness',
-    'devushkin',
-    'dewa',
-    'dfuf',
     'dgb',
-    'dhaenens',
-    'dhamma-pada',
-    'dhang',
-    'dharamsala',
-    'dhat',
-    'dhc&ndash;2',
-    'dhc-4',
-    'dhekelia',
-    'dhofar',
-    'dhung',
-    'di-',
-    'diacolor',
-    'diaconis',
-    'dialogism',
-    'dialogue-based',
     'diarmuid',
-    'diary-keeping',
-    'dibbs',
-    'diccionario',
-    'dicerorhinus',
-    'dichgans',
-    'dichloride',
-    'dickless',
-    'dictaphones',
-    'dictatus',
-    'dictyonema',
-    'dictyoptera',
-    'dideoxynucleotide',
-    'didn\'t-',
-    'didna\'',
-    'dieing',
     'diepkloof',
-    'diffcult',
-    'differred',
-    'diflam',
-    'dift',
-    'dig-file',
-    'diggin',
-    'digicipher',
-    'digitalised',
-    'dihydroxy',
-    'dikhil',
-    'dim-lit',
-    'dimblebys',
-    'ding-a-ling',
-    'dinging',
-    'dining-chair',
     'dinkum',
-    'dinna\'',
-    'dinorwig',
-    'dinted',
-    'diodon',
-    'dionysia',
-    'diosgenin',
-    'dipso',
-    'dipteryx',
-    'dirck',
-    'direct-action',
-    'direct-dialled',
-    'dirven',
-    'dis-invent',
-    'disapplies',
-    'disaster\'',
     'disaturated',
-    'disbound',
-    'disc-loading',
-    'discarnate',
-    'dische',
-    'discoid',
-    'disconfirming',
-    'discoth&eacute;que',
-    'discus-shaped',
-    'discussant',
-    'disempower',
-    'disfavouring',
-    'disgraces',
-    'dish-washer',
-    'dishley',
-    'disinhibiting',
     'disk-drive',
-    'diskinfo',
-    'disport',
-    'dissapear',
-    'dissatisified',
-    'dissymmetry',
-    'distill',
-    'ditter',
-    'diuma',
-    'diversi',
-    'diving-board',
-    'divitiacus',
-    'divs',
-    'dixevit',
-    'dixieland',
-    'diz',
     'dizzen',
-    'djanogly',
-    'djordje',
-    'djoser',
-    'dkk',
-    'dlco',
-    'dly',
-    'dmsp-f10',
-    'dna-bind',
-    'do\'',
-    'do\'t',
-    'dobroslav',
-    'dockhead',
-    'docklow',
-    'doctorat',
-    'document-retrieval',
     'docxform',
-    'dodona',
-    'dog-end',
-    'dog-fouling',
-    'dog-in-the-manger',
-    'dog-legged',
-    'dog-meat',
-    'dog-owner',
-    'dog-walking',
-    'dogeared',
-    'dogfighting',
-    'doggart',
-    'dogle',
-    'dolares',
-    'dolbadarn',
-    'dolgans',
     'dolgikh',
-    'dolling',
-    'dolo',
-    'dolor',
-    'doltish',
-    'domagk',
-    'dome-headed',
-    'domecq',
-    'domestic-type',
-    'dominicano',
-    'domovoi',
-    'donaldsons',
-    'donar',
-    'dondo',
-    'donnay',
-    'dooberry',
     'doocot',
-    'dooge',
-    'dook',
-    'dooming',
-    'door-opener',
-    'door-post',
-    'doorebriff',
-    'doormouse',
-    'dooryard',
-    'dorad&ucirc;s',
-    'doren',
-    'dorgan',
-    'dorin',
-    'doriot',
-    'dormobile',
-    'dornaway',
     'dornaways',
-    'dorries',
-    'dorris',
-    'dorsolateral',
-    'dosedel',
-    'doss-house',
-    'dothaidh',
-    'douanes',
-    'double-action',
-    'double-bogeyed',
-    'double-handling',
-    'double-labelling',
-    'double-parked',
-    'double-star',
-    'double-whammy',
-    'doubling-up',
     'douc',
-    'doughboys',
-    'douin',
-    'doulce',
-    'dounans',
-    'dour-faced',
-    'douvrin',
-    'dover&ndash;boulogne',
-    'dowbiggin',
-    'down-beat',
-    'down-load',
-    'down-under',
-    'downloads',
-    'dp-sm',
-    'dpn-100',
-    'dprk',
     'dr&ocirc;me',
-    'draba',
-    'drac',
-    'drachen',
-    'draggers',
-    'dragomir',
-    'dragutin',
-    'drakelow',
-    'drammen',
-    'drap',
-    'draught-strip',
-    'dravis',
-    'drawgear',
-    'dray-horse',
-    'dream-book',
-    'dream-machine',
     'dream-state',
-    'dreamachine',
-    'dreamwalker',
-    'dreamward',
-    'drepung',
-    'dress-run',
-    'dressing-bell',
-    'drewy',
-    'driech',
-    'drill/driver',
-    'drink-sodden',
-    'drinks-dispensing',
-    'drive-away',
-    'drizzled',
-    'drowes',
-    'drps',
     'drug-',
-    'drug-dealer',
-    'drug-injecting',
-    'drug-producing',
-    'druggets',
-    'drum-beating',
-    'drumbreck',
-    'drummossie',
-    'drumroll',
-    'drumsheugh',
-    'dry-rot',
-    'drybulb',
-    'dsch',
-    'dtx-2',
-    'du&egrave;se',
-    'du&ndash;a',
     'dual-in-line',
-    'dubal',
-    'dubon',
-    'dubunni',
-    'duccio',
-    'ducis',
-    'duckbills',
-    'dudbridge',
-    'duelled',
-    'duetted',
-    'dujardin',
-    'dukw',
-    'dumbing',
-    'dumbleton',
-    'dummying',
-    'dumsday',
     'dumuzi',
-    'dunbell',
-    'duncrue',
-    'dunecht',
-    'dung-heap',
-    'dungloe',
-    'dunks',
-    'dunloe',
-    'dunlopillo',
-    'dunsmuir',
-    'duppies',
-    'dupre',
-    'durava',
-    'durazzo',
-    'durieux',
-    'durran',
     'durst',
-    'dursun',
-    'dusking',
-    'dust-stained',
-    'dutronc',
-    'duty-based',
-    'duty-bearer',
-    'duty-room',
-    'duyet',
-    'dvnp',
-    'dvortsovaya',
-    'dwam',
-    'dwarven',
-    'dweebs',
-    'dwelleth',
-    'dyarchy',
     'dybbuks',
-    'dynamized',
-    'dynarama',
-    'dynast',
-    'dyremose',
-    'dys',
-    'dystopian',
-    'dytiscus',
-    'e&ndash;h',
-    'e(k)',
-    'e-412',
-    'e-selectin',
-    'e/2',
-    'eadwald',
-    'eagle-knowsley',
-    'eagly',
     'eallabus',
-    'eanberht',
-    'ear-drum',
-    'earlex',
-    'early-retired',
-    'earth-coloured',
-    'earth-orbiting',
-    'earthmen',
-    'earthmovers',
-    'easo',
-    'easy-fit',
-    'easy-money',
-    'easy-on-the-eye',
-    'easy-to-wear',
-    'eating-out',
-    'eatwell',
     'eau-de-nil',
-    'ebcdic',
-    'eberhardts',
-    'ecb',
-    'eccellenza',
-    'ecclesiastici',
-    'ech',
-    'echo-locating',
-    'echocardiograph',
-    'eckmire',
-    'ecla',
-    'ecn',
-    'ecorv',
-    'ecotourism',
-    'ecotypes',
-    'ectopics',
     'edge-binding',
-    'edge-glue',
-    'edgebound',
-    'edin',
-    'editman',
-    'editori',
-    'editorialise',
-    'edma',
-    'edmiston',
-    'edwardiana',
-    'edyvean',
-    'eelavar',
-    'eeny',
-    'eeprom',
-    'eerste',
-    'eeva',
     'eezs',
-    'ef-111',
-    'effacing',
-    'effet',
-    'effets',
-    'efficiency-seeking',
-    'effused',
-    'efik',
-    'efk',
-    'efls',
-    'egcs',
-    'egg-and-spoon',
-    'egg-throwing',
-    'egglayer',
-    'eggplant',
-    'eggsciting',
     'eggstra',
-    'eglwyseg',
-    'ego-organization',
-    'eh-ph',
-    'ehlen',
-    'ehman',
-    'ehrenberger',
-    'eidoli',
-    'eifel',
-    'eigenstates',
-    'eight-figure',
-    'eight-kilometre',
-    'eight-storey',
-    'eight-volume',
-    'eighteenthand',
-    'eighth-wicket',
     'eightholds',
-    'eighties-style',
-    'eightsome',
-    'eighty-',
-    'eighty-foot',
-    'eighty-seventh',
-    'eighty-unit',
-    'eimer',
-    'eisenbarth',
-    'eitb',
-    'eiusdem',
-    'ejes',
-    'ekert',
-    'ekklesia',
-    'ekofisk',
-    'ekow',
     'ekubia',
-    'el&eacute;onore',
-    'el-gebel',
-    'elandre',
-    'elbaum',
-    'eld',
-    'eldc',
-    'eldene',
-    'eldercar',
-    'election-day',
-    'election-result',
-    'electric-shock',
-    'electricty',
-    'electro-physiology',
-    'electroblotted',
-    'electrocautery',
     'electroencephalograph',
-    'electron-transport',
-    'electronically-based',
-    'elektron',
-    'elektronika',
-    'elephant-headed',
-    'eleven-hour',
-    'elfast',
-    'elga',
-    'elger',
-    'eliasian',
-    'eliding',
-    'elint',
-    'eliseg',
-    'eliseu',
-    'elizabethan-style',
     'elkerton',
-    'elkstone',
-    'ellenthorpe',
-    'elletson',
-    'elliman',
-    'elmariel',
-    'elmchurch',
-    'elmelunde',
-    'elmhirsts',
-    'elmy',
-    'elna',
-    'elopuro',
-    'else\'s',
-    'elspet',
-    'elymus',
-    'emalangeni',
     'emancia',
-    'embarr',
-    'embarrasing',
-    'embleer',
-    'emblen',
-    'emd',
-    'emec',
-    'emission-line',
-    'emler',
-    'emotion-filled',
-    'emp-num',
-    'empanelled',
-    'empathises',
-    'empedokles',
-    'empiricus',
-    'employee-centred',
     'employee-led',
-    'employer-based',
-    'emt',
-    'encapsidate',
-    'encina-based',
-    'encino',
-    'enclos',
-    'encoffining',
-    'encoun&rehy;tered',
-    'encrypting',
-    'encumbering',
-    'encyst',
-    'end\'',
-    'end-focus',
-    'end-of',
-    'end-of-day',
     'end-of-level',
-    'end-of-the-century',
-    'end-organ',
-    'endevor',
-    'endjob',
-    'endles',
-    'endopeptidase',
-    'endoscoped',
-    'endureth',
-    'energance',
-    'energen',
-    'energy-related',
-    'energy-sapping',
-    'enfeebling',
-    'eng.',
-    'engdiv',
     'engelman',
-    'engelmann',
-    'engineer-in-chief',
-    'enginering',
-    'engineroom',
-    'englandism',
-    'engler',
-    'english-sounding',
-    'englishes',
-    'eniwetok',
-    'enor',
-    'enou',
-    'enslow',
-    'entelechy',
-    'entendu',
-    'enthalpy-entropy',
     'entonox',
-    'entr\'acte',
-    'entring',
-    'entryism',
-    'environment-',
-    'environnement',
-    'eny',
-    'enzyme-conjugated',
-    'epact',
-    'epigraphs',
-    'epilim',
-    'epiphyseal',
-    'epipleural',
-    'epizootic',
-    'eprg',
-    'equal-length',
     'equalises',
-    'equipe',
-    'equiproportionate',
-    'equiticorp',
-    'equulei',
-    'er&mdash',
-    'erard',
-    'erbani',
-    'erbe',
-    'ercalyps',
-    'erez',
-    'ergodynamics',
-    'ergolite',
-    'eribon',
-    'ericaceae',
-    'erinaceus',
     'erka',
-    'erland',
-    'erlk&ouml;nig',
-    'ermines',
-    'ermitage',
-    'ernir',
-    'eroticise',
-    'erteco',
-    'erv',
-    'eryholme',
-    'erythropus',
-    'erzincan',
-    'esac',
-    'escadron',
-    'escalope',
-    'escapology',
     'esclusham',
-    'escobedo',
-    'esi',
-    'esis',
-    'eskside',
-    'esm&eacute',
-    'esono',
-    'espe',
-    'espew',
-    'essemmay',
-    'esss',
-    'estate-agency',
-    'esterified',
-    'estorick',
-    'estrella',
-    'etat',
     'etec',
-    'eteq',
-    'etesian',
-    'ethna',
-    'ethne',
-    'ethno-archaeology',
-    'ethylenediamine',
-    'etonic',
-    'etter',
-    'ettl',
-    'eucatastrophe',
-    'euch',
-    'eucomis',
-    'eudora',
-    'euesperides',
-    'eufrasius',
     'eui',
-    'eulogized',
-    'eunus',
-    'eupolis',
-    'euro-drive',
-    'euro-soup',
-    'euro-style',
-    'euro-summit',
-    'eurobeef',
-    'eurocurrencies',
-    'euronews',
-    'euronote',
-    'euronotes',
-    'europaeum',
-    'europe&rehy;wide',
-    'europe-machine',
     'europe-oriented',
-    'europeanized',
-    'euroshell',
-    'eurowoman',
-    'euthydikos',
-    'ev-5',
-    'evaginated',
-    'evandron',
-    'evang&eacute;lique',
-    'evangel',
-    'evangelized',
-    'evanses',
-    'eve-of-election',
-    'evel',
-    'evenhanded',
-    'evenlode',
     'event-by-event',
-    'eventum',
-    'ever&rehy;changing',
-    'ever-',
-    'ever-dwindling',
-    'ever-worsening',
-    'everbody',
-    'everday',
-    'everingham',
-    'everlor',
-    'everts',
-    'evicts',
-    'evidence-in-chief',
-    'evil-eye',
-    'eviscerate',
-    'ewhurst',
     'ex-accountant',
-    'ex-carer',
-    'ex-celtic',
-    'ex-chauffeur',
-    'ex-emperor',
-    'ex-factory',
-    'ex-fianc&eacute;e',
-    'ex-german',
-    'ex-girl',
-    'ex-hostage',
-    'ex-l.u.t.',
-    'ex-metropolitan',
-    'ex-mrs',
-    'ex-north',
-    'ex-peasant',
-    'ex-postman',
     'ex-rental',
-    'ex-scumnik',
-    'ex-singer',
-    'ex-spouse',
-    'ex-st',
-    'ex_tempore',
-    'exagerated',
-    'exasperates',
-    'excess-of-loss',
-    'excommunicates',
-    'executive-level',
-    'executive-style',
-    'exemine',
-    'exist\'',
-    'exon-amplification',
-    'exotic-looking',
     'exotic-sounding',
-    'expensing',
-    'expocentre',
-    'export-processing',
-    'expreso',
-    'expresspost',
-    'expurgate',
-    'extemporary',
-    'extention',
-    'extraclausal',
-    'extraposition',
-    'extravasated',
-    'extremely-high-velocity',
-    'extruding',
-    'eye-colour',
-    'eye-mask',
     'eye-movement',
-    'eye-piece',
-    'eye-sight',
-    'eye-tracking',
-    'eyeties',
-    'eythrope',
-    'ezana',
-    'f&eacute;licie',
-    'f&uuml;nen',
-    'f\'rinstance',
-    'f-15e',
-    'f-27',
-    'f-5',
-    'f-86',
-    'f-a',
-    'f-head',
     'f-ing',
-    'f.d.',
-    'f0',
-    'f16',
-    'f3f&ndash;3',
-    'fa-mass',
-    'faba',
-    'fabliaus',
-    'fabre-trained',
-    'fabricant',
-    'face-powder',
-    'face-pulling',
-    'fachan',
-    'fachhochschule',
-    'facho',
-    'facility&mdash;avail',
     'facsimilist',
-    'fact-file',
-    'faction-ridden',
-    'factory-owner',
-    'faderman',
-    'faed',
-    'faees',
-    'faettenfjord',
-    'faf',
-    'faggionato',
-    'fahr',
-    'faim',
-    'faiq',
-    'fair-dealing',
-    'fair-ground',
-    'fair-play',
     'fairline',
-    'fairman',
-    'fairstar',
-    'faith-healing',
-    'fake-fur',
-    'fakhar',
-    'faky',
-    'falcinellus',
-    'falkplan',
-    'fallowlees',
-    'falsgrave',
-    'falster',
-    'falt',
-    'family-style',
-    'fan-mail',
-    'fangsword',
     'fanica',
-    'fannich',
-    'fannin',
-    'fanshawes',
-    'fantails',
-    'fante',
-    'fanus',
-    'faramund',
-    'farash',
-    'fargesii',
-    'fargher',
-    'farinaceous',
-    'farkas',
-    'farkhar',
-    'farm-labourer',
-    'farm-level',
     'farmkey',
-    'farron',
-    'farthin\'',
-    'farty',
-    'fasht',
-    'fast-fit',
-    'fast-growth',
-    'fast-sailing',
-    'fast-shifting',
-    'fast-tag',
-    'fat-',
-    'fat-laden',
-    'father-',
-    'fatigue-producing',
-    'fatstock',
-    'faubourgs',
     'fault-tree',
-    'faurie',
-    'fausses',
-    'fava',
-    'favoring',
-    'favors',
-    'favretto',
-    'faysal',
-    'fayum',
-    'fazl',
-    'fccset',
-    'fcis',
-    'fclo',
-    'fcu',
-    'fe(iii)-reducing',
-    'feature-for-feature',
     'february&ndash;march',
-    'fecking',
-    'fecode',
-    'federalized',
-    'federating',
-    'fedin',
-    'feeing',
-    'feelies',
-    'feetenby',
-    'feets',
-    'felcn',
-    'feldene',
-    'feldsher',
-    'feliho',
-    'felim',
-    'felinoid',
     'fellow-masons',
-    'fellow-passenger',
-    'fellow-sufferer',
-    'felt-covered',
-    'fem-grunge',
-    'femail',
-    'femfresh',
-    'femina',
-    'femininity\'',
-    'fence-sitting',
-    'fencehouses',
-    'fenelon',
-    'feneral',
-    'fenman',
-    'ferahan',
-    'ferdowsi',
     'fereby',
-    'fergies',
-    'ferm&iacute;n',
-    'fermette',
-    'fern-covered',
-    'feroze',
-    'ferranti-thomson',
-    'ferro-concrete',
-    'ferrofluid',
-    'ferruginea',
-    'fertig',
-    'fertiliser-based',
-    'fertility-building',
-    'fetchin\'',
-    'fetherstone',
-    'fethiye',
     'fever-reducing',
-    'fflax',
-    'ffly',
-    'ffrench',
-    'fgrhist',
-    'fiachna',
-    'fiaich',
-    'fiammiferi',
-    'fibbers',
-    'fibre-based',
-    'fibresand',
-    'fibrinopeptides',
-    'fibrogenesis',
-    'fibropower',
-    'ficoll-hypaque',
-    'fiction-writer',
     'ficulle',
-    'fid&egrave;le',
-    'fidar',
-    'fideique',
-    'fidem',
-    'fidh',
-    'fidic',
-    'field-effect',
-    'fieldnote',
-    'fifteen-',
-    'fifties-style',
-    'fifty-eight-year-old',
-    'fifty-quid',
-    'fifty-two-year-old',
-    'fig-tree',
-    'figala',
     'fih',
-    'fileout',
-    'filinto',
-    'filioque',
-    'filipo',
-    'filon',
-    'filter-binding',
-    'finagling',
-    'final-set',
-    'finance-led',
-    'finarte',
-    'findphone',
-    'finely-crafted',
-    'fineman',
-    'fineoak',
-    'finger-picking',
     'finger-print',
-    'fingerbones',
-    'fingerspelled',
-    'finnbogad&oacute;ttir',
-    'finstock',
-    'fiordland',
-    'fiorucci',
-    'fire-guard',
-    'fire-light',
-    'fire-proofed',
-    'fire-setting',
-    'fire-side',
-    'fire-wood',
-    'firecrews',
-    'firedogs',
-    'firemouth',
     'fireproofing',
-    'firin\'',
-    'firmly-held',
-    'first&ndash;class',
-    'first-come-first-served',
-    'first-fix',
-    'first-instance',
-    'first-phase',
-    'first-row',
-    'first-step',
-    'first-test',
-    'firthmoor',
-    'fischbacher',
-    'fischetti',
-    'fish-curing',
-    'fish-farming',
     'fish-house',
-    'fish-oil',
-    'fish-pond',
-    'fish-pox',
-    'fish-shop',
-    'fishbones',
-    'fishface',
-    'fishko',
-    'fishwanda',
-    'fit-up',
-    'fithyan',
-    'fiume',
-    'five-card',
-    'five-choice',
-    'five-length',
-    'five-letter',
     'five-litre',
-    'five-night',
-    'five-position',
-    'five-spice',
-    'fiveyear',
-    'fixed-date',
-    'flabby-faced',
-    'flac',
-    'flag-captain',
-    'flagler',
-    'flakstad',
-    'flame-orange',
-    'flame-throwing',
-    'flash-flood',
-    'flat-back',
-    'flat-cart',
     'flat-earthers',
-    'flat-fronted',
-    'flat-headed',
-    'flat-sounding',
-    'flatiron',
-    'flatpicking',
-    'flatweaves',
-    'flaubear',
-    'flavonoid',
-    'flaxborough',
-    'fleance',
-    'fleay',
-    'flecker',
-    'fleishman',
-    'fletchergate',
-    'flexi-day',
     'flexi-disc',
-    'flexpack',
-    'fli',
-    'fliegende',
-    'flight-deck',
-    'flightline',
-    'flim',
-    'flimnap',
-    'flip-flopped',
-    'flip-over',
-    'flippin',
-    'flitter',
-    'flocculating',
-    'floor-to-floor',
-    'florentina',
-    'florid-faced',
     'florienborque',
-    'florman',
-    'flow\'r',
-    'floway',
-    'flower-girl',
-    'flowergirl',
-    'fluanisone',
-    'fludde',
-    'fluide',
-    'fluidic',
-    'fluidised',
-    'flunkies',
-    'fluoresced',
-    'fluorinated',
-    'flurazepam',
-    'flush-faced',
     'flute-player',
-    'fluviolacustrine',
-    'fly-blown',
-    'fly-catching',
-    'fly-over',
-    'flyash',
-    'flyda',
-    'flying-bomb',
-    'flyman',
-    'flypasts',
-    'fob-watch',
-    'focus-puller',
-    'fodors',
-    'foerster',
-    'fogdoe',
-    'foggini',
     'foggitt',
-    'foghel',
-    'folding-door',
-    'folia',
-    'foliose',
-    'folk-dancing',
-    'folk-singer',
-    'folkpartiet',
-    'folksinger',
-    'folley',
-    'follow-the-leader',
-    'fone',
-    'fons',
-    'fontainbleau',
-    'fontana-silvestri',
-    'fonz',
     'fonzi',
-    'foobar',
-    'food-store',
-    'foodcourt',
-    'foodie-ism',
-    'foodmarket',
-    'foodstore',
-    'foom',
-    'foot-bridge',
-    'footbrake',
-    'footstrap',
-    'foraminiferan',
-    'force-landing',
-    'forced-choice',
-    'forcemeats',
-    'ford-asili',
     'fordwich',
-    'fore-arm',
-    'fore-paw',
-    'foreign-ness',
-    'foremanii',
-    'foremans',
-    'foremarke',
-    'forest-living',
-    'forewarns',
-    'forgettin\'',
-    'forker',
-    'forli',
-    'form-of-fur',
-    'formosans',
-    'formvar',
-    'forner',
     'forshay',
-    'forsman',
-    'forthriver',
-    'fortran-77',
-    'forty-page',
-    'forty-three-year-old',
-    'forty-watt',
-    'fossegrim',
-    'fosset',
-    'fossil-bearing',
-    'fossil-fuelled',
-    'fougasse',
-    'fould',
-    'foules',
-    'foundationers',
-    'four-generation',
     'four-leaf',
-    'four-port',
-    'four-span',
-    'four-term',
-    'four-wave',
-    'four-word',
-    'fourt',
-    'fourteen-foot',
-    'fourth-wicket',
-    'fourtrak',
-    'fowl-house',
-    'foxcote',
-    'foxman',
-    'fozzie',
-    'fpg',
-    'fr&eacute;d&eacute;rique',
     'fr&ouml;lich',
-    'fractionates',
-    'frails',
-    'frame-by-frame',
-    'framery',
-    'frameviewer',
-    'frams',
-    'franais',
-    'franaise',
-    'francolin',
-    'francolinus',
-    'franlow',
-    'fraser-darling',
-    'fratia',
-    'frauenliebe',
-    'frean',
     'frechet',
-    'freddies',
-    'frediano',
-    'free-',
-    'free-born',
-    'free-tailed',
-    'free-trader',
-    'free-up',
-    'freeflow',
-    'freelined',
-    'freestylers',
-    'freewheelers',
-    'freezeframe',
-    'frehley',
-    'freiheitliche',
-    'frenchie',
     'freney',
-    'freni',
-    'frequens',
-    'frequent-flier',
-    'freshly-baked',
-    'freycinetia',
-    'friedl',
-    'friedrichshain',
-    'friendly-fire',
-    'friendly-looking',
-    'frigg',
-    'frightener',
-    'frisee',
-    'frisks',
-    'frithrah',
-    'fritto',
     'friture',
-    'frocked',
-    'froelich',
-    'frog-hopper',
-    'from\'',
-    'fromia',
-    'fronalpstock',
-    'front-',
-    'front-foot',
-    'front-loaded',
-    'front-pointing',
-    'frostick',
-    'frotteur',
-    'frownies',
-    'fruit-picking',
-    'fruitshop',
     'fso',
-    'fst',
-    'ftii',
-    'fuddle',
-    'fudgana',
-    'fudges',
-    'fuero',
-    'fugaku',
-    'fuggles',
-    'fuinary',
-    'fujimoto',
-    'full-cream',
-    'full-function',
-    'full-span',
-    'full-toss',
-    'full-word',
     'fulled',
-    'fully-',
-    'fully-extended',
-    'fumy',
-    'funada',
-    'funafuti',
-    'fundacion',
-    'funday',
-    'fundis',
-    'funnygirl',
-    'fur-trader',
-    'furbelows',
-    'furloughs',
-    'furnace-fire',
-    'furora',
-    'furuya',
     'fusako',
-    'fuseholder',
-    'fz&ndash;3000',
-    'g&ndash;haul',
-    'g&uuml;m&uuml;sl&uuml;k',
-    'g(t)',
-    'g-60xl',
-    'g-fuga',
-    'g-o-a-a-a-l',
-    'g-series',
-    'g-wax',
-    'g.c.h.q.',
-    'g.c.r.',
-    'g1-c72',
-    'gabarone',
-    'gabarrou',
     'gabathuler',
-    'gaberlungi',
-    'gack',
-    'gadansk',
-    'gadda',
-    'gadolinium',
-    'gaelstrom',
-    'gaffar',
-    'gagong',
-    'gah',
-    'gahagan',
-    'gahan',
-    'gai',
-    'gaillardia',
-    'gain-up',
-    'gairn',
     'gairns',
-    'galaxis',
-    'galego',
-    'galera',
-    'galerius',
-    'galford',
-    'galicians',
-    'galk',
-    'galler',
-    'gallerie',
-    'galleywood',
-    'galliani',
-    'galliards',
-    'gallico',
-    'gallifreyan',
-    'galliher',
     'gallinula',
-    'gallistel',
-    'gallwey',
-    'gama\'a',
-    'gamaat',
-    'gamarra',
-    'gambols',
-    'gamecocks',
-    'gameshow',
-    'gamin',
-    'gamond',
-    'ganders',
-    'gangtok',
-    'gangwayed',
-    'gannochy',
-    'ganong',
     'gappo',
-    'garben',
-    'garble',
-    'garcon',
-    'garden-variety',
-    'gargantua',
-    'garlic-crusher',
-    'garlicky',
-    'garmouth',
-    'garn-wen',
-    'garnedd',
-    'garnishee',
-    'garnsey',
-    'garrington',
-    'garryduff',
-    'gars',
     'gartocher',
-    'gas-fuelled',
-    'gas-lid',
-    'gas-main',
-    'gascgoine',
-    'gascogne',
-    'gasherbrum',
-    'gaspari',
-    'gast',
-    'gaster',
-    'gastronomique',
-    'gatesey',
-    'gathercole',
-    'gators',
-    'gatso',
-    'gatun',
     'gaudet',
-    'gaug',
-    'gaunt-faced',
-    'gayane',
-    'gazprom',
-    'gazzard',
-    'gbi',
-    'gearanach',
-    'gec-alsthom',
-    'gedo',
-    'geen',
-    'gefr',
-    'gefreiter',
-    'gegenwart',
-    'geilgud',
-    'geir',
     'geismar',
-    'gekht',
-    'gelb',
-    'gelbaugh',
-    'gelded',
-    'geldermann',
-    'gemeinderat',
-    'geminga',
-    'gemu',
-    'gendamerie',
-    'gender-role',
-    'genealogia',
-    'generalhuman',
-    'generous-minded',
-    'genex',
-    'gengshen',
     'gennis',
-    'gente',
-    'genuflecting',
-    'geoarchaeology',
-    'gepetto',
-    'geraistos',
-    'gerbier',
-    'gerenuk',
-    'gergely',
-    'germ-killing',
-    'german-sounding',
-    'german-style',
-    'germander',
-    'germano',
-    'gerraway',
-    'gerrymandered',
     'gerth',
-    'gertz',
-    'geryon',
-    'gescan',
-    'geschke',
-    'geta',
-    'geva',
-    'gformat',
-    'gha',
-    'ghafur',
-    'ghanim',
-    'ghaus',
-    'ghengis',
-    'gheorghiu-dej',
-    'ghibelline',
-    'ghislain',
     'ghm',
-    'ght',
-    'ghurburrun',
-    'ghylls',
-    'giacinto',
-    'giacobbi',
-    'giambono',
-    'gianola',
-    'gidlow',
-    'giers',
-    'gifhorn',
-    'giftbox',
-    'giftwrapped',
-    'gigabyte',
-    'gigaflops',
-    'gigawatt',
     'giken',
-    'gilan',
-    'gilbertine',
-    'gilcomston',
-    'gilders',
-    'gillaroo',
-    'gillyflower',
-    'gilsenan',
-    'gilzean',
-    'gimcracks',
-    'gimped',
-    'ginger-beer',
-    'gingering',
-    'gingold',
-    'ginman',
-    'ginty',
     'gintzler',
-    'giovannoni',
-    'gippo',
-    'girder-pattern',
-    'girlie-girlie',
-    'girocheques',
-    'gisele',
-    'gismos',
-    'gittels',
-    'giureconsulti',
-    'givan',
-    'givaudon',
-    'give-way',
-    'glaciomarine',
-    'glacis',
-    'gladding',
     'glamaig',
-    'glamorizing',
-    'glamourising',
-    'glareola',
-    'glass-backed',
-    'glass-plate',
-    'glasscock',
-    'glasspole',
-    'glassworms',
-    'glatt',
-    'glayva',
-    'glazers',
-    'glebeland',
-    'gleem',
-    'gleichschaltung',
-    'glengetti',
     'glenis',
-    'glenleighan',
-    'glenman',
-    'glenna',
-    'gleyed',
-    'glezer',
-    'glistener',
-    'glistrup',
-    'globesupport',
-    'glomeruli',
-    'gloriosus',
-    'glossiness',
-    'glottalling',
-    'glu-248',
-    'gluconate',
-    'glucosinolates',
     'glue-pot',
-    'glumness',
-    'glycols',
-    'glyder',
-    'glynch',
-    'glynneath',
-    'gm-eds',
-    'gmelin',
-    'gnaggle',
-    'gnr',
-    'go-carting',
-    'go-round',
-    'go_up',
-    'goal-driven',
-    'goal-mouth',
-    'goal-post',
     'goal-related',
-    'goal-shy',
-    'gobbi',
-    'god-',
-    'god-centred',
-    'god-sent',
-    'godbold',
-    'godflesh',
-    'godgifu',
-    'godnose',
-    'godsons',
-    'goed',
-    'goetschy',
-    'gof',
-    'goffee',
-    'goffredo',
     'goggle-box',
-    'going-home',
-    'gojko',
-    'goju-kai',
-    'golarsa',
-    'gold-',
-    'gold-covered',
-    'gold-digging',
-    'gold-green',
-    'gold-ground',
-    'gold-medal',
-    'gold-pan',
-    'gold-top',
-    'gold-trimmed',
-    'goldberger',
-    'goldenhurst',
     'goldgather',
-    'goldings',
-    'goldiwil',
-    'goldplated',
-    'goldsmid',
-    'golfa',
-    'golfo',
-    'golfwear',
-    'golla',
-    'gollop',
-    'gones',
-    'goniopora',
-    'gonks',
-    'good-humour',
-    'good-practice',
-    'goodenday',
     'goodin',
-    'goodlass',
-    'goodramgate',
-    'goody-two-shoes',
-    'goodys',
-    'goose-grass',
-    'goose-grazing',
-    'gooser',
-    'gopul',
-    'gorda',
-    'gorey',
-    'gorf',
-    'gorfelen',
-    'gorgoneion',
-    'gorgonocephalus',
-    'gorriar&aacute;n',
     'gorstone',
-    'gorsuch',
-    'gostick',
-    'gottes',
-    'gotteschalk',
-    'government-',
-    'government-created',
-    'government-licensed',
-    'governor-generalship',
-    'govind',
-    'govinda',
-    'gowon',
-    'gowran',
-    'gowrings',
-    'goxhill',
-    'gozem',
     'gptv',
-    'gr&auml;tzel',
-    'gr&uuml;ndlichen',
-    'gr-ax7',
-    'grabouw',
-    'grabow',
-    'gracile',
-    'graduateship',
-    'graffiti-covered',
-    'grafic',
-    'grafitty',
-    'grain-producing',
-    'grainey',
-    'grainge',
-    'gramma',
-    'grammas',
     'grammer',
-    'granat',
-    'grandata',
-    'grandpapa',
-    'grandprix',
-    'grandy',
-    'grangers',
-    'granz',
-    'graph-searching',
-    'grapy',
-    'grass-eating',
-    'grass-letting',
-    'grass-root',
-    'grassa',
-    'grassbur',
-    'grasscourt',
     'graunchy',
-    'grauniad',
-    'grave-faced',
-    'grave-vase',
-    'gravlax',
-    'grdc',
-    'grease-paint',
-    'grease-smeared',
-    'great-grandparent',
-    'great-great-grandmother',
-    'greavesie',
-    'greca',
-    'greed-free',
-    'greeds',
-    'greef',
-    'green-',
     'green-belt',
-    'green-ness',
-    'green-tinged',
-    'green-yellow',
-    'greenbridge',
-    'greeneland',
-    'greeners',
-    'greenfingered',
-    'greenhough',
-    'greenhouse-gas',
-    'greenie',
-    'greenrigg',
-    'greenshields',
-    'greensight',
-    'greenvale',
-    'greenwoods',
     'greeny-brown',
-    'greger',
-    'greppi',
-    'gresini',
-    'grey-scale',
-    'grey-stone',
-    'greyi',
-    'grf',
-    'grg',
-    'grid-iron',
-    'grifo',
-    'grignard',
-    'grimbsy',
-    'grimfang',
-    'grissell',
-    'grock',
     'groethuysen',
-    'gromril',
-    'groocock',
-    'grotbags',
-    'groudle',
-    'ground-',
-    'ground-dwelling',
-    'ground-work',
-    'groundhog',
-    'groundhopping',
-    'groupware-enabling',
-    'groux',
-    'grownup',
-    'growth-promoting',
-    'growtray',
-    'grt',
     'grugeon',
-    'grumio',
-    'gruyere',
-    'gryglewski',
-    'gse',
-    'guaiacum',
-    'guami',
-    'guanacastle',
-    'guardrail',
-    'guarea',
-    'guatemela',
-    'guattari',
-    'guber',
-    'gubisch',
-    'gudrun',
-    'guennady',
     'guerrilla-style',
-    'guichard',
-    'guidlines',
-    'guigo',
-    'guildswomen',
-    'guillemin',
-    'guillimont',
-    'guin&eacute',
-    'guineafowl',
-    'guinnesses',
-    'guitarest',
-    'guitaring',
-    'gulati',
-    'gullfaks',
-    'gulli',
-    'gumboil',
     'gump',
-    'gund',
-    'gunduli&cacute',
-    'guney',
-    'gunten',
-    'gunters',
-    'guntiarius',
-    'gunzenhauser',
-    'gurdjieff',
-    'gurn',
-    'gusseted',
-    'gutta-percha',
-    'guwahati',
-    'guyed',
-    'guyett',
-    'gwerinwyr',
     'gwyllion',
-    'gwynffynydd',
-    'gwynfor',
-    'gwynoro',
-    'gyenes',
-    'gymnop&eacute;dies',
-    'gyrase',
-    'h&eacute;brard',
-    'h&uuml;bner',
-    'h-bone',
-    'h-have',
-    'h-infinity',
-    'h.n.',
-    'h.w.',
-    'h10',
-    'haaa',
     'habari',
-    'habbaniyah',
-    'habituates',
-    'hachim',
-    'hachshara',
-    'hack-work',
-    'hackl',
-    'hackney-coach',
-    'hacs',
-    'hadnt',
-    'haefely',
-    'haeg',
-    'haemmerlin',
-    'haemorrhoid',
-    'hafeez',
-    'hafter',
     'hagenauer',
-    'haggerston',
-    'haggs',
-    'hagino',
-    'hahaha',
-    'haifeng',
-    'hainaut',
-    'hair-brush',
-    'hair-line',
-    'hair-of-the-dog',
-    'hair-oil',
-    'haircutting',
-    'hairslides',
-    'hairstyling',
-    'hairwashing',
-    'hal&eacute;vy',
     'halabjah',
-    'halberstadt',
-    'haldan',
-    'haldeman',
-    'halevy',
-    'half-a-metre',
-    'half-bar',
-    'half-bow',
-    'half-carrying',
-    'half-defined',
-    'half-disc',
-    'half-expect',
-    'half-facet',
-    'half-frightened',
-    'half-groat',
-    'half-horse',
     'half-in',
-    'half-informed',
-    'half-line',
-    'half-listened',
-    'half-lying',
-    'half-pace',
-    'half-packed',
-    'half-painted',
-    'half-pissed',
-    'half-promise',
-    'half-pulled',
-    'half-rate',
-    'half-right',
-    'half-sheep',
-    'half-sheet',
-    'half-site',
     'half-swing',
-    'halfbeaks',
-    'halfmast',
-    'halgren',
-    'haliaeetus',
-    'haliday',
-    'halkieriid',
-    'hall-marked',
-    'hall-stand',
-    'halld&oacute;r',
-    'hallel',
-    'hallsands',
-    'hallucinogenics',
-    'hallum',
-    'halobacterium',
-    'halogenated',
     'haltered',
-    'hamadou',
-    'hamar',
-    'hambley',
-    'hammon',
-    'hamoaze',
-    'hamutenya',
-    'hamwih',
-    'hancox',
-    'hand-bell',
-    'hand-clap',
-    'hand-gliding',
-    'hand-rail',
-    'hand-spun',
-    'hand-wound',
-    'handclaps',
     'handcream',
-    'handelgesellschaft',
-    'handelsgesellschaft',
-    'handiman',
-    'handlooms',
-    'handpainting',
-    'handwash',
-    'hanekon',
-    'hangared',
-    'hanging-drop',
-    'hanglider',
-    'haniff',
-    'hannafore',
-    'hanniah',
-    'hansaring',
-    'hanslope',
     'hanwood',
-    'hanxiong',
-    'happer',
-    'harberger',
-    'harberton',
-    'harbourfront',
-    'hard-back',
-    'hard-covered',
-    'hard-edge',
-    'hard-headedness',
-    'hard-heartedness',
-    'hard-nut',
-    'hard-surfaced',
-    'hardbitten',
-    'hardbound',
-    'hardenhuish',
     'hardfaced',
-    'hardi',
-    'hardingstone',
-    'hardness-free',
-    'hardnosed',
-    'hardrock',
-    'hare-coursing',
-    'hare-lip',
-    'harijans',
-    'haringay',
-    'harlen',
-    'harling',
-    'harlins',
-    'harmand',
-    'harp-playing',
-    'harr',
     'harrowden',
-    'harrumphed',
-    'hart-leap',
-    'hartas',
-    'hartleap',
-    'hartleian',
-    'hartop',
-    'hartree',
-    'hartstock',
-    'hary',
-    'hasidim',
-    'haslingden',
-    'haslip',
-    'hasseinen',
-    'hassidic',
-    'hassiny',
     'hastreiter',
-    'hatherleigh',
-    'hathersage',
-    'hathurusinghe',
-    'hatrick',
-    'hatry',
-    'hattatt',
-    'hatti',
-    'haulteterre',
-    'haupt',
-    'hauptzollamt',
-    'haut-brion',
-    'havernick',
-    'hawar',
-    'hawarde',
-    'hawdon',
     'hawk-nosed',
-    'hawk-priestess',
-    'hawkfish',
-    'hawkswood',
-    'hawkwell',
-    'hay-rick',
-    'hayt',
-    'hazard-free',
-    'hazel-eyed',
-    'hazeldine',
-    'hazelrigg',
-    'hazzard',
-    'hcb',
-    'hda',
-    'he(ii)',
-    'head-building',
     'head-collar',
-    'head-drum',
-    'head-shaking',
-    'head-spinning',
-    'head-to',
-    'headjogs',
-    'headline-hitting',
-    'headline-making',
-    'headnotes',
-    'headster-time',
-    'healabhal',
-    'health-based',
-    'health-insurance',
-    'hearmon',
-    'heart-',
-    'heart-lifting',
     'hearthstone',
-    'heartthrob',
-    'heasman',
-    'heat-insulating',
-    'heavy-browed',
-    'heavy-handedness',
-    'heavy-lift',
-    'heavyhanded',
-    'hebb-type',
-    'hebditch',
-    'heberden',
-    'hebes',
-    'hec',
-    'heckroth',
-    'heddon',
-    'hedgelaying',
     'hedrick',
-    'heger',
-    'heguy',
-    'heidt',
-    'heilige',
-    'heimo',
-    'heinkels',
-    'heise',
-    'hekataios',
-    'heldenhammer',
-    'heldentenor',
-    'helfrich',
-    'helgard',
-    'helical-scan',
-    'helideck',
-    'helix-loop-helix',
     'hell-broth',
-    'helleborine',
-    'hellene',
-    'hellespontine',
-    'hellings',
-    'hellmans',
-    'helmer',
-    'help-desk',
-    'hemerocallis',
-    'hemi',
-    'hemichordata',
-    'hemidesmosomes',
-    'heminge',
-    'hemingford',
-    'hen-run',
-    'hendrickse',
     'henequen',
-    'henl&eacute',
-    'hepple',
-    'heptadecapeptide',
-    'heptameron',
-    'her-i',
-    'heraclides',
-    'herball',
-    'herburger',
-    'here-',
-    'heretors',
-    'heriots',
-    'herling',
-    'hermitages',
-    'heroin-using',
-    'herrenvolk',
     'herskovitz',
-    'herstatt',
-    'hertogenbosch',
-    'hertsmere',
-    'hesperidean',
-    'hestercombe',
-    'heteranthera',
-    'heterotactic',
-    'hetta',
-    'hetzler',
-    'heureuse',
-    'heuss',
-    'hexacyanoferrate',
-    'hezbalar',
-    'hha',
-    'hhurrnh',
     'hi-flight',
-    'hi-res',
-    'hi-ya',
-    'hiarc',
-    'hib-e',
-    'hibernator',
-    'hickham',
-    'hicksville',
-    'hiddink',
-    'hide-covered',
-    'hideway',
-    'hierarchised',
-    'hieron',
-    'hieronymous',
-    'high&rehy;speed',
-    'high-amplitude',
     'high-bridged',
-    'high-carbohydrate',
-    'high-field',
-    'high-lighting',
-    'high-modernist',
-    'high-priest',
-    'high-production',
-    'high-return',
-    'high-specification',
-    'high-stress',
-    'high-tea',
-    'high-top',
-    'highdown',
-    'higher-cost',
-    'higher-density',
-    'higher-margin',
     'higher-preference',
-    'higher-value',
-    'highest-other-word',
-    'highish',
-    'highly-sexed',
-    'highnesse',
-    'hijuelos',
-    'hildamay',
-    'hildegarde',
-    'hildenborough',
-    'hilker',
-    'hill\'',
-    'hill-and-dale',
-    'hill-grazing',
-    'hill-walker',
-    'hillery',
     'hillgoers',
-    'hilling',
-    'hime',
-    'hims',
-    'hind-leg',
-    'hindgut',
-    'hindson',
-    'hinge-line',
-    'hinterh&ouml;fe',
-    'hintersteinersee',
-    'hip-bone',
-    'hipe',
-    'hippogriff',
-    'hippuroides',
-    'hippys',
-    'hirayama',
     'hirel',
-    'hirlap',
-    'hirobo',
-    'hiron',
-    'hirschhorn',
-    'hirschowitz',
-    'hirsel',
-    'hiseman',
-    'histidines',
-    'historicized',
-    'historische',
-    'hitchhiked',
-    'hitchmough',
-    'hitrail',
-    'hivol',
-    'hjorth',
     'hla-b27',
-    'hla-dra',
-    'hli',
-    'hlpa',
-    'hoaglin',
-    'hoarders',
-    'hoarse-voiced',
-    'hobarton',
-    'hobbema',
-    'hoenselaers',
-    'hofstadter',
-    'hogger',
-    'hoglands',
-    'hogman',
-    'hogsnorton',
-    'hohenstaufer',
     'hokay',
-    'hokianga',
-    'hold-down',
-    'holdene',
-    'hole-maker',
-    'holesaw',
-    'holl',
-    'holldobler',
-    'hollerin\'',
-    'hollinghurst',
-    'hollow-cast',
-    'hollyday',
-    'hollywood-based',
-    'holmann',
-    'holmstrom',
-    'holn',
     'home-baking',
-    'home-buying',
-    'home-care',
-    'home-movie',
-    'home-start',
-    'homebased',
-    'homecraft',
-    'homequity',
-    'homesteaders',
-    'homestyle',
-    'homo-',
-    'homoiothermy',
-    'homotaurocholic',
-    'honble',
-    'honey-dew',
-    'honeymooned',
     'honeys',
-    'honkies',
-    'honks',
-    'honky-tonk',
-    'honley',
-    'honored',
-    'honourables',
-    'hoodwinking',
-    'hookway',
-    'hop-growing',
-    'hopalong',
-    'hopko',
-    'horbling',
-    'hores',
-    'horfitz',
-    'horkan',
     'horla',
-    'horning',
-    'hornli',
-    'horridness',
-    'horse-breeder',
-    'horse-hair',
-    'horse-lover',
-    'horse-whipping',
-    'hosp&iacute;cio',
-    'hosptial',
-    'host-plant',
-    'hostessing',
-    'hostium',
-    'hot-water-bottle',
-    'hot-weather',
-    'hotdogs',
     'hotel-style',
-    'hotelschools',
-    'hotton',
-    'houck',
-    'houes',
-    'hounsfield',
-    'hour-a-day',
-    'hour-length',
-    'house-owner',
-    'house-sitter',
-    'house-work',
-    'houseby',
-    'housechair',
-    'houseflies',
-    'houshold',
-    'hovertram',
     'howa',
-    'howay',
-    'howbeit',
-    'howcroft',
-    'howdendykers',
-    'howel',
-    'hower',
-    'howtown',
-    'howya',
-    'hoyerswerda',
-    'hr-el',
-    'hrbmoa',
-    'hru',
-    'hrvatska',
-    'hsob',
-    'hsp-65',
     'huaihe',
-    'huaorani',
-    'hubertus',
-    'huckle',
-    'hudleston',
-    'hudlin',
-    'huffman',
-    'hugh-jones',
-    'hugheses',
-    'hugin',
-    'hugolinus',
-    'huli',
-    'hulsker',
-    'human-machine',
-    'humanising',
-    'humbaba',
     'hump-back',
-    'humpin\'',
-    'humpty-dumpty',
-    'humulus',
-    'hungarian-language',
-    'hungate',
-    'hunosa',
-    'hunting-horn',
-    'hunza',
-    'hurgill',
-    'hurtwood',
-    'husbandly',
-    'hushabye',
-    'husishusis',
-    'huszti',
-    'huudu',
     'huxford',
-    'hyacinthoides',
-    'hydes',
-    'hydro-carbon',
-    'hydrobloc',
-    'hydrolysing',
-    'hydropower',
-    'hyer',
-    'hyflo',
-    'hygena',
-    'hypaque',
-    'hyperboreus',
-    'hyperpluralist',
-    'hyperpolarized',
-    'hypersaline',
-    'hypersomnia',
     'hypertext-based',
-    'hyphenate',
-    'hypnorm',
-    'hypo-',
-    'hypostasis',
-    'hypostasized',
-    'hypotactic',
-    'hypothesis-driven',
-    'hytek',
-    'hyuck',
-    'i\'th',
-    'i-case',
-    'i-egf',
-    'i-spy',
-    'i.s',
-    'i6',
     'iacovou',
-    'iassw',
-    'iatefl',
-    'iavolenus',
-    'ibcs',
-    'ibec',
-    'ibertex',
-    'ibnu',
-    'ibr',
-    'ibrahimi',
-    'ibrams',
-    'ibusz',
-    'ibycus',
-    'ic-a20',
-    'icairr',
-    'icdf',
     'ice-laden',
-    'ice-queen',
-    'ice-scoured',
-    'icemaker',
-    'ichi',
-    'icns',
-    'icot',
-    'icstis',
-    'ictalurus',
-    'icterina',
-    'ideal-standard',
-    'idemnite',
-    'idgie',
-    'idolaters',
-    'idolize',
-    'idrisu',
     'idso',
-    'idun',
-    'iebpc',
-    'iehmarc',
-    'ifaw',
-    'ifdo',
-    'ifma',
-    'ifp',
-    'ifpa',
-    'ig-',
-    'igi',
-    'ignis',
-    'iha',
-    'ihab',
-    'ihesu',
-    'ihonvbere',
     'iid-affi',
-    'iiip',
-    'iiird',
-    'iiisi',
-    'iir',
-    'iiss',
-    'iita',
-    'ikle',
-    'ikonize',
-    'ikonworks',
-    'iktinos',
-    'ilan',
-    'ilh&eacute;u',
-    'ilija',
-    'ilj',
-    'ill-armed',
     'ill-directed',
-    'ill-discipline',
-    'ill-qualified',
-    'ill-understood',
-    'illawarra',
-    'illegit',
-    'illizi',
-    'illusochamber',
-    'ilsington',
-    'image-analysis',
-    'imb&eacute;cile',
-    'imbabah',
-    'immortalising',
-    'immunizing',
-    'immunochemicals',
-    'immutables',
     'impecuniosity',
-    'imperata',
-    'imrs',
-    'in-bound',
-    'in-ground',
-    'in-growing',
-    'in-head',
-    'in-lamb',
-    'in-marriage',
-    'in-to-out',
-    'in-use',
-    'in-water',
-    'in-wintered',
-    'in-work',
-    'inaki',
-    'inaptly',
     'inarching',
-    'inc-developed',
-    'incapacitates',
-    'incense-bearing',
-    'incident-filled',
-    'incise',
-    'income-consumption',
-    'income-earner',
-    'incurables',
-    'ind&iacute;genas',
-    'indalo',
-    'indianness',
-    'indic',
-    'indicat',
-    'indicus',
-    'indigenized',
     'indigoes',
-    'inding',
-    'indo-aryan',
-    'indo-australian',
-    'indo-pakistani',
-    'indosinia',
-    'industry-related',
-    'inecto',
-    'inerrant',
-    'infall',
-    'infantilising',
-    'infernos',
-    'inflation-rate',
-    'infobox',
-    'infogrames',
-    'infolding',
     'infomart',
-    'infopack',
-    'information-theory',
-    'ingathered',
-    'ingemar',
-    'ingeniator',
-    'ingests',
-    'ingilby',
-    'ingleses',
-    'ingolf',
-    'inhered',
-    'inholmes',
-    'injun',
-    'inlaying',
-    'inna',
-    'inner-german',
     'innerd',
-    'innervate',
-    'innocent-seeming',
-    'innocent-sounding',
-    'inntravel',
-    'innu',
-    'inscrit',
-    'inshallah',
-    'instaplan',
-    'instat',
-    'instated',
-    'instigates',
-    'institutionals',
-    'inswinging',
-    'inteco',
-    'integral-25',
     'intellectualized',
-    'intelpost',
-    'intensive-care',
-    'inter-connection',
-    'inter-european',
-    'inter-hospital',
-    'inter-house',
-    'inter-individual',
-    'inter-lending',
-    'inter-locking',
-    'inter-market',
-    'inter-nationalization',
-    'inter-sectoral',
-    'interadio',
-    'interbrand',
-    'interclass',
     'interdicted',
-    'interferon-gamma',
-    'interior-ministry',
-    'interior-sprung',
-    'interlarded',
-    'intermesh',
-    'intermeshing',
-    'intermetrics',
-    'internationally-important',
-    'internode',
-    'interparty',
-    'interpassing',
-    'interphase',
-    'interpro',
-    'intersports',
-    'interstella',
     'interstore',
-    'interstream',
-    'interunion',
-    'intervocalic',
-    'interzone',
-    'intil',
-    'intra-asean',
-    'intra-company',
-    'intra-firm',
-    'intra-infinitival',
-    'intra-tetrad',
-    'intracardiac',
-    'intrex',
-    'intrinsicate',
-    'introject',
-    'intuiting',
     'intuitionism',
-    'inveigling',
-    'invercauld',
-    'inversus',
-    'investment-banking',
-    'invigorates',
-    'iodine-125',
-    'iofcs',
-    'iolu',
-    'ipea',
-    'iproniazid',
-    'iqr',
-    'iraqi-controlled',
-    'ireson',
-    'iridomyrex',
-    'iroko',
     'iron-',
-    'irq',
-    'irri',
-    'irridek',
-    'is&mdash',
-    'isbister',
-    'ish-kay-nay',
-    'ishbel',
-    'isoflex',
-    'isolutrol',
-    'isonzo',
-    'isopon',
-    'isopropanol',
-    'isoproturon',
-    'isoquant',
-    'isozaki',
     'isql',
-    'issacs',
-    'issigonis',
-    'issue-',
-    'isted',
-    'isti',
-    'it\'a',
-    'it\'d',
-    'itaipu',
-    'ital',
-    'italian-looking',
-    'italiatour',
-    'italicizing',
-    'italien',
-    'ithusheng',
-    'itinerate',
     'itll',
-    'itw',
-    'itzhaky',
-    'iulia',
-    'ium',
-    'iuml',
-    'ivanauskas',
-    'ivelet',
-    'ivf-et',
-    'ivimey',
-    'ivoroid',
-    'ivory-handled',
-    'ixl',
-    'iyengar',
-    'izmailovo',
-    'j\'aime',
     'j-reg',
-    'j.havelock',
-    'jaafar',
-    'jac-card',
-    'jack-the-lad',
-    'jack-up',
-    'jackendoff',
-    'jacketing',
-    'jackknifed',
-    'jackplugs',
-    'jacobeans',
-    'jacobian',
-    'jacobinical',
-    'jacquelin',
-    'jacus',
-    'jagdgeschwader',
     'jager',
-    'jahanpanah',
-    'jail-bait',
-    'jaimie',
-    'jair',
-    'jaj',
-    'jali',
-    'jallud',
-    'jam-maker',
-    'jamaicensis',
-    'jamarella',
-    'jamiat',
-    'jamiroqua',
-    'jamsa',
-    'jamshid',
-    'janaury',
     'jangles',
-    'janny',
-    'jansa',
-    'januszczak',
-    'japan-based',
-    'japans',
-    'jarboe',
-    'jargon-ridden',
-    'jarnjak',
-    'jaromir',
-    'jarrat',
-    'jarratt',
-    'jarvi',
-    'jarvik',
-    'jask',
-    'jasmin',
     'jasminoides',
-    'jaspar',
-    'jauja',
-    'jaur&egrave;s',
-    'javaid',
-    'jaw-length',
-    'jawhar',
-    'jawing',
-    'jaworski',
-    'jayakumar',
-    'jazira',
-    'jazz-rap',
-    'jc-120',
-    'jcm-800',
-    'jean-',
-    'jeea',
     'jeep-borne',
-    'jeepers',
-    'jelled',
-    'jellicle',
-    'jenette',
-    'jenkinsons',
-    'jenney',
-    'jenolite',
-    'jenuary',
-    'jeong',
-    'jeptha',
-    'jerman',
-    'jeronimidis',
-    'jervolino',
-    'jeryl',
-    'jessell',
     'jessner',
-    'jet-ski',
-    'jetsons',
-    'jevington',
-    'jewel-case',
-    'jewel-coloured',
-    'jeyasingh',
-    'jiddou',
-    'jillie',
-    'jimbob',
-    'jis',
-    'jlundon',
-    'jnana',
-    'jo&zcaron;e',
-    'joanou',
-    'job-cutting',
     'job-offer',
-    'job-seeker',
-    'job-training',
-    'jobfinding',
-    'jobhunting',
-    'jobst',
-    'jochum',
-    'jocked',
-    'jodeluk',
-    'joerg',
-    'jog-trot',
-    'jog-trotting',
-    'johor',
-    'join\'',
-    'jointly-developed',
-    'joke-capping',
     'jona',
-    'jonathan-kinging',
-    'jones-style',
-    'jono',
-    'jooss',
-    'jordanes',
-    'jorgen',
-    'jorm',
-    'jost',
-    'jpg',
-    'jtec',
-    'juarez',
-    'jubal',
-    'jugendstil',
-    'jugnet',
-    'juifs',
     'juillard',
-    'jujuy',
-    'juken',
-    'juleff',
-    'julekha',
-    'julii',
-    'jullien',
-    'julunggul',
-    'jumla',
-    'jumo',
-    'jump-seat',
-    'junckers',
-    'junction-box',
-    'junk-filled',
-    'junk-heap',
-    'juppe',
     'jurassic-cretaceous',
-    'jurats',
-    'jurkat',
-    'just-mentioned',
-    'justicia',
-    'justina',
-    'justsleep',
-    'juxon',
-    'k&ouml;chel',
-    'k(n)ite',
-    'k-registration',
-    'k458',
-    'k9',
-    'kaak',
-    'kablan',
-    'kabul-based',
     'kaden',
-    'kader',
-    'kadmon',
-    'kaech',
-    'kaen',
-    'kafue',
-    'kagarlitsky',
-    'kagouls',
-    'kah',
-    'kahhale',
-    'kail-yard',
-    'kain',
-    'kaisa',
-    'kaiseraugst',
-    'kaiserswerth',
-    'kaitseliit',
     'kaizen',
-    'kajima',
-    'kakovatos',
-    'kalahuewehe',
-    'kalamis',
-    'kalashnikov-toting',
-    'kalaw',
-    'kalends',
-    'kalkwasser',
-    'kallimachos',
-    'kalmias',
-    'kalmu',
-    'kalpin',
-    'kaluga',
-    'kamchorn',
-    'kamilari',
     'kammer',
-    'kamran',
-    'kanakaria',
-    'kanazawa',
-    'kaneko',
-    'kanemoto',
-    'kangai',
-    'kantineservice',
-    'kanwal',
-    'kaoma',
-    'kapp',
-    'karam',
-    'karanavan',
-    'karlskrona',
-    'karmann',
-    'karpf',
     'karrier',
-    'karriers',
-    'karstified',
-    'karttunen',
-    'karume',
-    'kasai',
-    'kasavubu',
-    'kasey',
-    'kasozi',
-    'kassab',
-    'kastriot',
-    'kateson',
-    'kathakali',
-    'katina',
-    'katoh',
-    'katsura',
     'kattegat',
-    'kaunitz',
-    'kavio',
-    'kayser',
-    'kazakstan',
-    'kebich',
-    'kedos',
-    'keeking',
-    'keillers',
-    'keillor',
-    'keiun',
-    'keizersgracht',
-    'kek',
-    'kekule',
-    'keler',
-    'keltic',
     'kelvinbridge',
-    'kemmis',
-    'kempf',
-    'kenar',
-    'kenbu',
-    'kendon',
-    'kenfig',
-    'kentwell',
-    'kerak',
-    'keris',
-    'kerna',
-    'kernahan',
-    'kerri',
-    'kerryman',
-    'kerswell',
-    'kerzaz',
     'kesa',
-    'keto-acidosis',
-    'ketton',
-    'kewlany',
-    'key-word',
-    'keydata',
-    'keyholder',
-    'kfc',
-    'kh&aacute;ine',
-    'khadafi',
-    'khadre',
-    'khaemhet',
-    'khail',
-    'khalkha',
-    'kharga',
-    'khayr',
     'khayreh',
-    'khayy&aacute;m',
-    'khidr',
-    'khitai',
-    'khons',
-    'khorassan',
-    'khumbu',
-    'kiat',
-    'kickboxer',
-    'kidbrooke',
-    'kido',
-    'kieve',
-    'kift',
-    'kilkelly',
-    'killa',
-    'killerby',
     'killie',
-    'killmoulis',
-    'killy',
-    'killyman',
-    'kilneave',
-    'kilojoules',
-    'kilpin',
-    'kimmel',
-    'kin-based',
-    'kinbolton',
-    'kind-looking',
-    'kindertotenlieder',
-    'kinesix',
-    'king-list',
-    'kingsessing',
-    'kingshill',
     'kingstanding',
-    'kinison',
-    'kinney',
-    'kino',
-    'kinsham',
-    'kinson',
-    'kiplings',
-    'kippax',
-    'kippenberger',
-    'kippin',
-    'kipps',
-    'kirakosyan',
-    'kiral',
-    'kirin',
-    'kirn',
-    'kiruna',
     'kiss-of-life',
-    'kit-built',
-    'kitalya',
-    'kitchen-diner',
-    'kitchen/living',
-    'kitemarked',
-    'kitplanes',
-    'kitri',
-    'kitsuka',
-    'kitzbuehel',
-    'kiwi-fruit',
-    'klaeber',
-    'klansmen',
-    'kleonai',
-    'klepsch',
-    'kleptomania',
     'klockars',
-    'klondyker',
-    'klopp',
-    'klose',
-    'klusons',
-    'knacks',
-    'knapweed',
-    'knievel',
-    'knife-fight',
-    'knightbridge',
-    'knob-end',
-    'knobby',
-    'knock-back',
-    'knock-for-knock',
-    'knock-up',
-    'knockbracken',
     'knockbreda',
-    'knokke',
-    'knot-tying',
-    'knottier',
-    'know&mdash',
-    'know-nothing',
-    'know-that',
-    'knowes',
-    'knowyng',
-    'knoxes',
-    'koala-pad',
-    'kochba',
-    'kochedwice',
-    'kodaly',
-    'koebang',
-    'koel',
     'kohl-mitterrand',
-    'kohoutek',
-    'koinonia',
-    'kokhba',
-    'kolakowski',
-    'kolelas',
-    'kolossi',
-    'koltai',
-    'kolymba',
-    'komiks',
-    'komitet',
-    'kommandatura',
-    'kommersant',
-    'kommissariat',
-    'komsomols',
-    'konigsallee',
     'konigstein',
-    'konnicke',
-    'koole',
-    'kopecks',
-    'korac',
-    'korem',
-    'korin',
-    'korobeit',
-    'korova',
-    'kors',
-    'korshin',
-    'korsmo',
-    'kortlandt',
-    'kosal',
-    'kosh',
-    'kostya',
     'kouame',
-    'kourieh',
-    'koussevitsky',
-    'koval',
-    'kowalczyk',
-    'koyaanisqatsi',
-    'kozakiewicz',
-    'kpelle',
-    'kr&iacute;suv&iacute;k',
-    'kracker',
-    'krall',
-    'krallerhof',
-    'kratos',
-    'kraushaar',
-    'krejci',
-    'kremlin\'',
     'krenzer',
-    'krevo',
-    'krip',
-    'krizner',
-    'krka',
-    'kromeriz',
-    'krull',
-    'kubel&iacute;k',
-    'kuchum',
-    'kuck',
-    'kufa',
-    'kufah',
-    'kujau',
-    'kukulkan',
-    'kulitsch',
-    'kulm',
     'kulp',
-    'kunashiri',
-    'kunitachi',
-    'kuno',
-    'kunstavisen',
-    'kunstkammer',
-    'kuper',
-    'kupffer',
-    'kurankyi',
-    'kurashvili',
-    'kuris',
-    'kurnool',
-    'kuro',
-    'kuroda',
-    'kurspahic',
-    'kurten',
     'kusum',
-    'kute',
-    'kuyl',
-    'kwak',
-    'kwakiutl',
-    'kwelagobe',
-    'kwon-do',
-    'kwoth',
-    'kyak',
-    'kym',
-    'kyriacou',
-    'l&uuml;bke',
-    'l\'&eacute;cole',
-    'l\'&eacute;tranger',
-    'l\'&egrave;re',
-    'l\'affiche',
     'l\'am&eacute;ricaine',
-    'l\'anglaise',
-    'l\'appel',
-    'l\'artiste',
-    'l\'audiovisuel',
-    'l\'hay',
-    'l\'heure',
-    'l\'ultima',
-    'l\'usage',
-    'l-leucine',
-    'l.h.',
-    'l936',
-    'lab-coat',
-    'labanowski',
-    'labe',
-    'labelle',
     'lables',
-    'labor-management',
-    'laborare',
-    'labour-',
-    'labovitch',
-    'labyrinthodonts',
-    'lacerta',
-    'lachine',
-    'lacidar',
-    'laclos',
-    'ladder-stile',
-    'ladybower',
-    'ladyshave',
-    'ladywell',
-    'laeken',
-    'laffitte',
     'lafleur',
-    'laframboise',
-    'lagado',
-    'lahu',
-    'lakatani',
-    'lake-water',
-    'lakehead',
-    'lalita',
-    'lalitpur',
-    'lallemand',
-    'lamberth',
-    'lamboll',
-    'lambresco',
-    'lambruschini',
-    'lameducked',
-    'lamer',
     'lammergeier',
-    'lamoureux',
-    'lamptey',
-    'lanai',
-    'lancair',
-    'land-surface',
-    'land-tenure',
-    'landesk',
-    'landgrebe',
-    'landgren',
-    'landplanes',
-    'landrat',
-    'landriani',
-    'lanercost',
-    'langellier',
-    'langlow',
     'langmaid',
-    'langsdorfii',
-    'langstrath',
-    'language-change',
-    'lanna',
-    'lansbergen',
-    'lanseria',
-    'lanskoy',
-    'lantana',
-    'lantic',
-    'lanzorote',
-    'lao-tse',
-    'laoigh',
-    'lapasset',
-    'lapotaire',
-    'lappeenranta',
     'lapper',
-    'larbey',
-    'larch-lap',
-    'lardo',
-    'large-enough',
-    'larger-than-expected',
-    'largess',
-    'lariat',
-    'larini',
-    'lariot',
-    'lark-song',
-    'larkspurs',
-    'larrea',
-    'laser-dance',
-    'laser-scanning',
-    'lasius',
     'lasserre',
-    'lastin\'',
-    'late-hit',
-    'late-morning',
-    'late-roman',
-    'late-romantic',
-    'latest-issue-in-file',
-    'lathing',
-    'latifolium',
-    'latitudinarianism',
-    'latkes',
-    'latoya',
-    'lauberhorn',
-    'lauched',
-    'lauengram',
-    'laundryman',
     'laurelvale',
-    'laurits',
-    'lautoka',
-    'lavalin',
-    'lavamund',
-    'laved',
-    'lavelled',
-    'lavey',
-    'lavoix',
-    'lavvus',
-    'lawdy',
-    'lawe',
-    'lawerence',
-    'lawing',
-    'lawman',
-    'lawn-mowing',
     'lay-up',
-    'layamon',
-    'lazzard',
-    'lazzarini',
-    'lbws',
-    'lcts',
-    'ld-50',
-    'ldi',
-    'ldpe',
-    'le-eyo',
-    'lead-isotope',
-    'leadburn',
-    'leaf-surface',
-    'leagrave',
-    'leaguer',
-    'lean-faced',
     'leandra',
-    'leandre',
-    'learmonth',
-    'leasametric',
-    'lease-lend',
-    'leathem',
-    'leather-and-chrome',
-    'leather-backed',
-    'leatherbarrow',
-    'leatherware',
-    'leav',
-    'leave-of-absence',
-    'lebec',
-    'leber',
-    'leblois',
-    'lecturer-name',
     'ledo',
-    'leeborough',
-    'leeds-born',
-    'leeds-fan',
-    'leeswood',
-    'leewood',
-    'lefort',
-    'left-eye',
-    'leftwingers',
-    'leg-of-mutton',
-    'leg-spin',
-    'leg-stretch',
-    'legatt',
-    'leilani',
-    'leiper',
-    'leisurebus',
     'leitmeritz',
-    'leitner',
-    'leivi',
-    'lelievre',
-    'lemay',
-    'lemsip',
-    'lemures',
-    'lemuria',
-    'lenagan',
-    'lenbachhaus',
-    'leney',
-    'lenka',
-    'lents',
-    'leofwine',
-    'leonhardsen',
-    'leontini',
     'leporinus',
-    'lepping',
-    'ler',
-    'lercaro',
-    'lesage',
-    'less-eligibility',
-    'lethal-looking',
-    'lethe',
-    'lethem',
-    'letrapage',
-    'letter-string',
-    'letzeburgish',
-    'leucism',
-    'leucocephala',
-    'leutgeb',
-    'levisham',
     'lewis-faning',
-    'lewiston',
-    'lewry',
-    'lexden',
-    'leyser',
-    'lhd',
-    'lhx',
-    'liall',
-    'lian',
-    'liana',
-    'liat',
-    'libft',
-    'librans',
-    'library-collegians',
-    'liche',
-    'lickin\'',
     'licor',
-    'liddon',
-    'lidia',
-    'lidstone',
-    'lieber',
-    'liebfrauenkirche',
-    'liebherr',
-    'liedlein',
-    'lierse',
-    'lieut-general',
-    'lievre',
-    'liewer',
-    'life-ban',
-    'life-generating',
-    'life-supporting',
-    'life-terminating',
     'life-work',
-    'lifecare',
-    'lifekeeper',
-    'liff',
-    'lifland',
-    'liggard',
-    'light\'',
-    'light-as-a-feather',
-    'light-scattering',
-    'light-source',
-    'lighterage',
-    'lightly-armed',
-    'lightmoor',
-    'lightyears',
-    'ligs',
-    'liistro',
     'likin\'',
-    'liknes',
-    'lil\'',
-    'lillies',
-    'lilts',
-    'lilwall',
-    'limba',
-    'limbering-up',
-    'lime-burning',
-    'lime-kiln',
-    'limewater',
-    'limit-down',
-    'limit-up',
-    'limited\'',
-    'linac',
-    'linatex',
     'lindinis',
-    'linearization',
-    'linebacked',
-    'linekers',
-    'linenfold',
-    'linenhall',
-    'liney',
-    'lingcove',
-    'linguini',
-    'linking-up',
-    'linscheid',
-    'linsey',
-    'linsingen',
-    'lion-tamer',
-    'lipcolour',
-    'lipidex',
     'lipizzaner',
-    'lipopolysaccharides',
-    'liposuction',
-    'lippizaner',
-    'liq',
-    'liquid-liquid',
-    'liriodendron',
-    'lisney',
-    'list\'ning',
-    'list-system',
-    'listeth',
-    'litag',
-    'literalized',
-    'lithium-6',
-    'litt&eacute;rature',
-    'little-endian',
     'little-un',
-    'little-understood',
-    'little_bit',
-    'littlechap',
-    'littlemill',
-    'littlethorpe',
-    'littman',
-    'littorina',
-    'litvinoff',
-    'live-bearer',
-    'liverish',
-    'liversidge',
-    'livett',
-    'livulezi',
-    'liyf',
-    'ljubisa',
     'lkg',
-    'llandwrog',
-    'llwyfan',
-    'llynfi',
-    'llys',
-    'llysfasi',
-    'load-carrying',
-    'loada',
-    'loading-bay',
-    'loan-back',
-    'lobate',
-    'locally-grown',
-    'lochleven',
-    'lock-forward',
-    'locker-top',
-    'lockpick',
     'loeki',
-    'loess-covered',
-    'loge',
-    'loggerhead',
-    'logierait',
-    'logique',
-    'logis',
-    'loik',
-    'loisach',
-    'loisy',
-    'loius',
-    'lokri',
-    'lomb',
-    'london&ndash;paris',
-    'londonbased',
-    'londubh',
     'long-desired',
-    'long-hair',
-    'long-proposed',
-    'long-tail',
-    'long-throw',
-    'long.',
-    'longe',
-    'longer-standing',
-    'longer-tailed',
-    'longfellows',
-    'longitude-velocity',
-    'longmoor',
-    'longmore',
-    'longsight',
-    'longstay',
-    'longstocking',
     'longtrack',
-    'longview',
-    'longwell',
-    'looby',
-    'looking-back',
-    'loopers',
-    'loorthusamy',
-    'loose-lipped',
-    'loosening-up',
-    'loral',
-    'loranthaceae',
-    'lorazepam',
-    'lord-of-the-manor',
-    'lordling',
-    'lorenza',
-    'losalt',
     'losehill',
-    'lossmaking',
-    'lothagam',
-    'lotus-eating',
-    'lotus-land',
-    'loud-voiced',
-    'loughguile',
-    'loughrigg',
-    'love\'',
-    'love-bite',
-    'love-lee',
-    'love-match',
-    'lovebomb',
-    'lovech',
-    'lovechild',
-    'lovetot',
     'low-back',
-    'low-band',
-    'low-brow',
-    'low-circulation',
-    'low-earning',
-    'low-emission',
-    'low-fi',
-    'low-front',
-    'low-return',
-    'low-velocity',
-    'lower-deck',
-    'lower-working',
-    'lowest-common-denominator',
-    'loweswater',
-    'lowlander',
-    'lowrey',
     'lowri',
-    'lowtown',
-    'lozowski',
-    'lpac',
-    'lr-73',
-    'lrcc',
-    'lrda',
-    'lsconfigurationfile',
-    'lscs',
-    'ltl',
-    'luapula',
-    'lubar',
-    'lucetta',
-    'lucianus',
-    'luciferian',
-    'lucilius',
     'luckin',
-    'luganda',
-    'lugers',
-    'luhti',
-    'luigieans',
-    'luk',
-    'lukac',
-    'lukin',
-    'lukman',
-    'lumby',
-    'lunaire',
-    'lunch-box',
-    'lundhags',
-    'lung-bursting',
-    'lung-cancer',
-    'lunga',
     'lunghi',
-    'lungwort',
-    'lunniss',
-    'lupino',
-    'lurv',
-    'lussier',
-    'lusso',
-    'lustig',
-    'lustred',
-    'luthiers',
-    'lutine',
-    'lutomer',
-    'lutoslawski',
-    'lutte',
-    'luxembourgeoises',
-    'luxor&ndash;london',
     'luxuriates',
-    'lwf',
-    'lych-gate',
-    'lycklama',
-    'lycoperdon',
-    'lycopersicum',
-    'lying-in-state',
-    'lymphatics',
-    'lyretail',
-    'lysenkoism',
-    'lysophosphatidylcholine',
-    'lyttel',
-    'm&acirc;le',
-    'm&aelig;lb&aelig;th',
-    'm&eacute;daille',
-    'm&eacute;tis',
     'm&uuml;sellim',
-    'm\'appelle',
-    'm-2',
-    'm-csf',
-    'm-people',
-    'm-scan',
-    'm.r.c.',
-    'm19',
-    'm69',
-    'ma\'luf',
-    'ma-ay-jor',
-    'ma.',
-    'maap',
-    'maar',
-    'mabinogion',
-    'macaroon',
     'mace-bearer',
-    'machi',
-    'machiavel',
-    'machine-knitted',
-    'machine-produced',
-    'macks',
-    'macmanus',
-    'tremolando',
-    'tretower',
-    'trichlorethylene',
-    'trocken',
-    'troughing',
-    'trum',
-    'truss-rod',
-    'trust-building',
-    'truth-teller',
     'tuberculinum',
-    'tubigrip',
-    'tukuse',
-    'tumbletots',
-    'turbo-prop',
-    'turbocash',
-    'turkistan',
-    'turntec',
-    'twangs',
-    'twentyfive',
-    'twentythree',
-    'twinax',
-    'twinix',
-    'twittens',
-    'two-compartment',
-    'two-hand',
     'two-pitch',
-    'udd',
-    'uhv',
-    'uk-born',
-    'umbellifers',
-    'un-manned',
-    'unblinding',
-    'unbolting',
-    'undercharging',
-    'underload',
-    'undershooting',
-    'undug',
-    'unformat',
-    'uni-jet',
-    'unk',
-    'unremembering',
     'unstack(x)',
-    'unstb',
-    'uomo',
-    'up\'',
-    'upbraid',
-    'upheaving',
-    'upr',
-    'uptilted',
-    'urumchi',
-    'usafm',
-    'uvr',
-    'v&aacute;theia',
-    'vai-rna',
-    'vala',
-    'vedute',
-    'venatici',
     'vernis',
-    'versatran',
-    'viars',
-    'vice-questore',
-    'videocube',
-    'vignon',
-    'villanellen',
-    'villified',
-    'vinblastine',
-    'viren',
-    'virilis',
-    'volkart',
-    'vowel-length',
-    'vulgarised',
-    'vy',
-    'vyse',
     'w\'',
-    'wadd',
-    'wakatipu',
-    'waldmann',
-    'wansbrough',
-    'warted',
-    'wastin\'',
-    'watchd',
-    'watchmaking',
-    'watcom',
-    'water-resistance',
-    'wavephore',
-    'wcfba',
-    'weekfield',
-    'wefa',
-    'well-experienced',
     'wellgate',
-    'wellied',
-    'wenching',
-    'wens',
-    'west-south-west',
-    'westertoun',
-    'wh-',
-    'whap',
-    'what&mdash',
-    'wheatflour',
-    'wheatly',
-    'wheel-to-wheel',
-    'whelming',
-    'whipcrack',
-    'whitethorn',
-    'whitethroats',
     'whitewall',
-    'whizzquid',
-    'widda',
-    'wide-running',
-    'wife-mother',
-    'wihtland',
-    'will&mdash',
-    'willcox',
-    'willen',
-    'wimble',
-    'windbound',
-    'windross',
-    'wing-beat',
-    'wintersun',
-    'wise-ass',
-    'wkt',
     'women\'',
-    'wooly',
-    'word-for-sign',
-    'wose',
-    'wpe',
-    'wrides',
-    'writing\'',
-    'wurzel',
-    'wynnster',
-    'xdisp',
-    'xpg3-compliant',
-    'xtrac',
-    'xueyan',
-    'xxy',
-    'y-pcr',
-    'yapp',
     'yaroslav',
-    'yasmeen',
-    'ybc',
-    'yed',
-    'yellow-root',
-    'yersel\'',
-    'yess',
-    'yhwh',
-    'ylang',
-    'yound',
-    'yoursel',
-    'youthscan',
-    'ypsilanti',
-    'yrm',
-    'zasulich',
-    'zeinlach',
     'zero-offset',
-    'zfm',
-    'ziel',
-    'zop',
-    'zs-bxf',
-    'zs-kex',
+)
+
+blocks_34 = (
+    '"/elig;thelthryth!.eacute;criture(-tr&eacute;chy(+volu&eacute!-lsqb;i&rsqb;f&)o&rsqb;ur&+t&rsqb;here&(w&rsqb;e!0mdash;hartlepool\'$then(\'ogether\'*very&mdash\'"we)"ll($ould',
+    '\'"15\'"20\'#hat!*oslash;vre"(uml;fner!-scaron;ipnija!\'yen;100%#200%"50 #\'44"!5"!8!"50!%about!%chute',
+    '!#eld")verything!!f"#rom!#god"$reat!"h\'"#ave"#ere""ot!$just!%kitty!!o"!p!"r\'',
+    '"$orry!%those!%ungry!$will %+pi/2 %-20db!.5\'-endlabelled!#6db!$70mv!&backed#$rrel"#oth!\'calcium"&entury"$lass',
+    '%(ervative!#day!$hand!"ic"$n-c.!!l"$evel!&making"&ethyl-!"tu!#vis!$when"#ill "0-!#.3p',
+    '!,71&ndash;379*#485 ,1&ndash&half!$-bit"$cell"\'octanol!$.2mm"#45p"#6kg#"mm"#95p!#0--#)kilometre#$part"\'0-franc',
+    '"#2mm"(9-member!&1-acre#%piece"#.4p"(0-member!&2-acre#&seater#$tone"#.3p"&0-mile#!s"*1-year-old"$20mm"(8-member',
+    '!\'3,000ft"$-man$"er"#.5p""in!,5&ndash;23cm"%-foot#(handicap#%match$$etre#%point!36&ndash;24-year-old"%-foot##way!$7.9p',
+    '!(8-nation##pin"&0-seat"*81&ndash;3"!d!*9&ndash;10"*31&ndash;5#*7&ndash;40"-40&ndash;1941#)2&ndash;4"+71&ndash;80#,9&ndash;1983"-80&ndash;1990#"6-#"8-',
+    ' +2&ndash;3hr!%-door"$foot"%month!$.15p"\'2-litre"#35p"\'4-litre"&5-fold""6p""8p"#93p!,0&ndash;30lb"\'-footer#$inch',
+    '"#.3p"$00ad"(5-member#!s!%1-apr#$hour#%point""mm!,2&ndash;june"%-hour#%tonne!#3mm!\'4-point"#0ft!\'5-point',
+    '#$user!&6-mile#(oct-1993""in!&7-mile#$page!%8-man$"er"\'6-based""no!"9d!#ft.!"ls!"tb +3&ndash;4ft',
+    '"%cabin")direction##oor"%layer"&methyl%"re"#ton!$0-cm"\'0-metre!&2-cell##man"&5-acre""in!(3-member!&5-acre',
+    '!%8-ton"#0mm!#amp &4-foot"%litre"%speed!%.3-kb""4p!&0-knot#&nation#$page$$iece"&0-foot$%metre$$year',
+    '"#lbs!$20se!(4-member!-500&ndash;50m!(6-member!#7mm!&8-foot#%tonne""0s .5\'-endlabelled!5-bromo-2-deoxyuridine"7fluoro-2\'-deoxycytidine!#.1p""6p!\'00-plus',
+    '!\'12-node!*3&ndash;54!(4-member""in!#7mm!"pe!$tbsp ,6&ndash;30pm(#8pm(#9pm!%-foot"&series!#.6p!\'0-piece"#lbs',
+    '!*8000-based!"lp &7-mile")under-par!\'0-metre$#ile#%piece#$seat"&0-page%#lus$&series!&1-acre!&4-mile##run!"kg',
+    '!#.2p""8p!(0-column#$plus"&0-page$$word#!s"$486-""cm""in!#1mm!(3-member!#5mm!&7-year!"8s',
+    '"%holer!-.30am-12.30pm\'#5pm""6p!&0-hole#&member%#tre"\'0-pupil!"1-!(9-member *a&ndash;20!,\'bhuachaille!$-300#"10"!4',
+    '#$oing"\'hunting"&listed"(negative"%ta-na!#120!#406""38""65!+_,_a_little\'"ot!#aaa$%aargh$#rgh"$hing',
+    '""pa"\'rdvarks!%bachi##kar#"ng#!s#%ttant"$baba#&eyhill##iss"#ctg"\'dennour#,oulay&eacute#!y"(erconway',
+    '$%ffrwd$%knowe$&sychan"!h"%ideth#$ngon#$odun$"la#"sh"(lebodied$!x"\'ominate#&ubakar$#kir$"t\'',
+    '#\'idgment"$uela#%gally#%lafia!%c-130#$type"$anta%&haster##ras"%cardo#(eptable\'$\'ssworks#$idie$(pitridae#*limatizing',
+    '$*unt-holder\')ing-based#!t#)ulturated$\'tronics""ed#1tylcholinesterase#$vedo"%he-ad$&ampong#"im$$ntee#$more#\'senzeit#!u',
+    '$&ulated"$koff""og#!m#$nley"\'quaints$&isitor"%rilan#$orst$!s""th#&ing-up%\'odiscus$&on-man$)ve-centre',
+    '"%uerdo#"ra#(te-phase#$view"\'ylating!,d&eacute;lie""ac#$lgar"#dab#!e"$eang#$dayo#%laida$$heid#$niyi',
+    '""ia#%vasis"\'judging$(stamatic&#ors"$land#%ertag#&gasser"$mail$"rc#3inistrative-command&"us#&onitio"%riani"%sorbs',
+    '".ult-orientated#"na""vi"$ygey!#ear"&gyptii"%rates#!e#%oncas"&sculus"%tatis#\'helstan$\'iopicus""vi!$f-sp',
+    '"-fix-stripping#\'ronting"$redo#&icains&0n&mdash;american$(kanerdom#+o-americans$"nt"#sat"$ter-&$rain&%shock&%taste\'(he-event%&burner',
+    '%&shaves"#zal!)gagianian#%insts#(mospermy#%ssizi#%thist%"on#%zzari",e-associated$#gap$)regressed$)structure##nor"$giss',
+    '$(essivity$$ieve""li"\'o&mdash#%nises##sti"-r&eacute;ment#&amonte$!n#(icuiture#*o-pastoral$%pyron#"yl"$shar!&haggar',
+    '""er"#int"$lers#%swede"&manson#$edou"$rtag""st!%i\'sha"!f"!j"$lred"%mable"#nur"3r&ndash;conditioned',
+    '%%ubble$$fare%#eed%(reshener$#jet$(pressure$)to-ground#*drieonians#\'esearch#$fare#%ikyan$!n#$mens#&passes#&sprung',
+    '#"wi"%eroyd"$hbar##dar"%iyama""ko##uyu"#soy#%umite"#yab!)l&auml;ia"&-allaf$#qsa$$rabi$$ttar',
+    '#%basit#%hamid$\'inshiri#%jabir#%kadir#%latif#\'marhoom#%nasir#$oued#\'rasheed$(uweishid#&shaikh&$mikh&$rifi$$ubul',
+    '$"ou#(philippe#"ra#!w")bendazole##oin#&ritton$"ow#&ufeira#!y""ca$%ntara#$este&"is#$hian',
+    '#/ohol-containing##yon"#dam#&ercare#%icarb$!n#"on"#ejo#*m&aacute;n#%ntejo#"ph#$wife"%fasud#$onzo##rey',
+    '#!i$$nate""ic#$fabs#$garh#!s"$kyds$%lated"%l-but$%court$%green$(industry$&moving$\'plastic\'%y-all',
+    '$\'the-way%(oo-human$)volunteer$$west%#ool##ahu$$nson$%zonia#%ectus$%y-cat#*ied-signal$"ot#&sports"%meyda#!o',
+    '#(s-houses"%oisia"\'penrose&#uhe$"rt#!h$#and%"rd&$etta$"er$&onsine#%inist#\'temocin"$sopp##ter',
+    '$\'r-piece#\'ernatim##ium#%schul"&varez\'#&ington!\'macrine#%lthea#"na$"de$!t%%adine%"is#$rjit#!s',
+    '#!z"*bassadeurs#\'lyseius#%oseli""ca"$edee#&nemhat#/rican-sponsored%#kay%#yah##tra"#got"+itriptyline"#mar#!i',
+    '$(r-propre"$paro#\'hiaraus%%boles#$latz#\'utating"#ron""sa#!l##teg"#ver",ylobarbitone##zon!)n&ndash;2"(abantoid',
+    '$&yomene#,esthesiology#!n$"ta#\'tomised#!x")choresses#.ient-astronaut##ora#"us",d&uacute;ril#"en$"re%\'sontown#"ro',
+    '")gel-faced%#ine$&rholme#\'le-iron$%icana("um$-o-amalgamated\'(rgentine##ulo"$halt&"er##olt"&ichini#)mal-plant#\'racetam',
+    '#.seed-flavoured$%ogamy"#jer"&kerite#\'le-bone##rah"\'namarie$#tes#"os#$sley"&odized#$khin##mia#"na#!r',
+    '"&quetil"#saf#!e#$were"&t-heap#%abuse#&eating$!l#-hropomorphise#)i-angling&%sthma&/uthoritarianism%#bat&*loodsports&#olt',
+    '%)democracy\')velopment%+europeanism%$gang\'%rotte%-industrialism\'\'hibitor%*liberalism%(macassar%(papalism(#ist\'(rliament&\'lanning&\'redator%&rabies',
+    '&(ecession\'\'formers&#oad%&school&)eparatist&#nag&)tructural%(takeover%)vandalism%%woman%\'zionism$#chi%)onvulsant$,gen-antibody$$kyra',
+    '$)parachute&#ter%&odeans$)que-style&#ing$&rabbit&!t#"ra%#cyt$)um-corpus#"un#\'werpers"&uflood",xiety-making$&olytic',
+    '!&ounist!#par$&thotel"&erient$%tural"#fel"3i-biom&eacute;rieux##ron"$ling"!n")ocalypses$$rine#%llyon##nte#%stoli',
+    '$&relled#&ealled#*le-picking%%broog%#mac#(ollonius".r&egrave;s-ski#&icaria$"tz"%taker$#mil#$horp!)quamanile$%relle$%taine',
+    '#!i!(r-rabbuh%$hman")abidopsis#$chis%$nida#%moana##ngo$%tzazu##shi#"ta$"os"\'balests#1itrarily-lettered##rex',
+    '#!a$"nd%$gelo#(h-shaped$%druid$%ermos%"us$1i-&eacute;criture%"es%&traved##ton"%dener#"or##ura"#eca',
+    '##hhh#!u$#in\'$"te"&iberto#$ette##fin##gna#\'nghieri#(stodikos"&kensaw#$oses#$urua"\'lequino#"ie',
+    '$)dillidium$!h##ide$!e$"jo$#nda#\'y-style"$nald$"ut#"ey"!o")paillange#(eggiated"&quebus""ra',
+    '#"is##obo$(w-poison%$anas#!y"*se-kissing$&nicals"(ts-based$\'cribble#\'y-farty"%ubano#(ndinaria"$wald!\'sangono#!t',
+    '$#rid#&lepius#\'ospores"#das"\'erinsky"!f"&h-tray#"ar#*es-winning#%poles"%iasat#%norum#"oz"%keans#%habad',
+    '"#let"$mall$!t""na"(ociacion#"ma##tin"(paragine#&ersion"#sai#!e#(imularum$&niboin#!o$2ciated-rediffusion',
+    '&"es$$luta#"ur"(terisked&"te%$onyx##ill#*r&eacute;e$&agalus$$odia%\'nomicon"#uka"#wad",ylum-seeking!)t&ndash;6',
+    '#(one-ment"(ahuallpa""bs"\'emporal#"ne"#hay"%ienza##van"#lan"#rex#%iplex"%taque$#van#%endez#&ornies',
+    '"#ubo"#wal!$udax#-ience-chamber\'#ias$+o-recording&%video"!e""ff"(gustulus"(l&eacute"$male"\'reliano$*omarginata"-stralia-japan',
+    '&&nesian".t&eacute;ntico##air#"em#\'hentics$#or\'&)ity-based*&figure#&o-icon$\'banking%#loc$)catalytic%&hanger%%laves$%glide',
+    '$%kraft$%lycus$$plan$$test$%world"!v#&ergnat!*valanching#%ntage%!e"#eda##rsa##sco#$yron"%ianca',
+    '"!l"#ner"&ocourt#$riaz#$star#!w""ra""us!#wad#)rd-giving#"y\'$#day"#iel"!k"%lgrip',
+    '!%xeing"!s!"ya""ee#%rmine"\'lburton#&esmore"#sha"$yash!%zazel"#ems#)rbaydzhan"#izi"$tech"\'urophil',
+    '")ndash;17g")uuml;hler\'*rgerliches!$-17f$!g""25"+b-b-brothel"$isdn"!p!".a"!y!"27!"69!&aa-ing"%bacar',
+    '$!s#&ba-baa%%combe#"y-%$face%$talk$$face$$kins$$wear")cchanalia#*helor-girl%!t$$ilor#"ie#)k-bearing',
+    '%$chat&&ountry("rt%(lighting%.of-an-envelope(&beyond%(pressure%&stroke&+ubstitution%\'to-wall$\'crosses$%heels$&lashes#!l#*teria-free',
+    '#!d#,ger-watching#+ly-designed&$paid##ock#$shot")e-thomson#&dekers"(gborough#"ca#&dikian#%guley##nor##sik"\'haeddin',
+    '#"es#&lhache$\'largeon%#eul%!i&!s##ndu#$rdii#$ster"&jocian"$kero#$ongo$!w"%laban$"nd',
+    '$!s#"bo#&conied#(dassaran$$head$$oyle$$rics#%e-out$!n#*l&eacute;n$$-boy%\'gouging$&asarly$%inaby$\'ochmyle',
+    '%$tine&#ted$%ybrit%%holme#&merino$!s#&ranald#\'sa-wood"\'mbaataa"&nausus#%chini$#tec#$dbox$$call$$sawn',
+    '#&efelde#&g-bang$"la$#our#&k-book$%field$!o%$wski#$nach$)er-waving&"ed"%quero"-r&eacute;tous#$-b-q#&agiola',
+    '#\'barella&#ito$&edette%#ito%$ring#%claya#$deen%"ly#"ga$&e-pole%#llo%&master#"ka$!e##len',
+    '#(n-drying%\'stormed$%icoat%"er#&ralets%\'nquilla%!u##sac#$ters$)holomaeus$&iamaus%%ngton$$leby$!y"#san',
+    '##eej$$flow$$head$#nji$%pairs#*hkortostan$#met#(iliensis&#sks$-ngstoke-based##kan##ons$#tho#\'queness#"sa',
+    '##tet$#ien"\'tallion#\'h-towel##rec#&tiston$,le-readiness\'#sub&#cry"$ulch$$king"%vents#"in"!w#%sinch',
+    '$#zid#(erischer##lor!#cgm"$l-2-""ms!"dp""tc!*eagleworks#"ne$%lands$!z#)r-baiting$&dshall$#ley',
+    '%$beat$!h##uce%$lerk$"j\'$"ts#%vises"#bel"$char$%teler#%kside#&omming$!s""d-$#use',
+    '##doe#%posts#%space##was"&e-hive##bop#\'ch-wood##man#"ne#&rhouse#%swood#)troot-red#$zley"$fana"\'ginneth',
+    '"&halves#(ind-hand##nke"#ier##gey##num""ja#"el"%kaert#"ko"(laboured$"id#$fitt#"ge#&helvie',
+    '%$skii#&lenden%&rophen$%house$$ings%"se$%oucif$%sdyke$&y-ache#%monte$%ullet#"oe$"us$)w-surface#$ters',
+    '#"ye""ma$!c#!s##use"%n-ami#$azzi#%bolio#$digo$*rofluazide#,efit-to-risk$"ke#\'habyles#%ignus$$nese',
+    '#&netton%!y$!i#$oist$#zzo#!s#)zalkonium$"ol"(orhtwold"#ran#%eiter$%nzoid$&sfords#%gader$$gren',
+    '%!t#"ht#$kman#$line#$nabo%$dine&$otte%&rd-ezi$#erd#%riman#%stein##til")smirching##oms$(ttedness',
+    '#*t-equipped%(prepared$!y"+ta-blocking#%hpage#\'novates##ong%!y#$roth#,ter-balanced\'(designed#!z"\'ventini"$ween"$zdna',
+    '$"ls!%hagat#"ji##kti#$ngra#$rati#!t$%nagar"!e"!f"%ishma")ubaneswar#"na!)i-cameral"\'alystok',
+    '#,le-believing"\'cchiere#\'kenhall%&rstaff$#nor#$ourt#(uculline"%ddles#$ouze")edermeier##lle#$rton"%ffing#"id#$rons',
+    '"%g-wig#&arrade##ham#%mouth""jl"$lbie$"ow##eka#\'iterate##lam$(ets-doux$$ican%+ngham-based#%marsh#%tmore',
+    '"&ndview#"es#$ging#$more#"os"&ocides#"gs#!l$\'ogicals\'#que#%nauts#%plast$$robe&\'cessing#$tron',
+    '#(d\'s-nest$\'-eating%&filled$%world##th-"&scopea"%t-map#!a#"oo"#xby!%j-10e!%lache$\'k-board&#eye&%green',
+    '&\'leading&,marketeering&&rimmed%#all%*burn-based%%hawks%%jacks%$land&"ow%#men%%sided#%grove#(kenhurst%$slee%#way',
+    '#*nchisserie&"ot%#oed$"es$\'quefort#$shie#$tnik"!b"%eedin#\'ncathra#$ther$#tes"$idah#\'nd-eyed#\'tzkreig',
+    '"(oc-based$)k-booking&\'release#!o$)d-alcohol&$bath&$feud&%money&\'sharing\'$port\'%ucker($pply&&tested\'%yping&&vessel',
+    '%$ying$)m-bearing#\'w-drier%$outs$#eth"%u-tak#%e-car%$eyes$%tower"&ything!,oard-sailing%%house#)t-builder%$race&&ocking',
+    '#%olini##row#$sled"$ches"+dice-ripper+#ing##man#\'y-count%%shell$#bag$#map"(erestaat##sch"#ffs")gadjimbri',
+    '"#kek"+l&eacute;ro$(iacute;n##eat$!y#"in$%viana#$ling$%ocked%!m%!x##tho##yai"\'mbadier%!x',
+    '%!x#$ford"$naly#%devik#(efishing#&gwater##ino##ked##ser"%o-hoo#$brie#!d#"gy#)k-banning&&urning',
+    '%&filled$$club$$fair$%works#"ly#(meranged#\'tblacks$"he$)strapping#!y""pp"#rch%%grave##in\'#"no',
+    '%$raig#\'sholder#\'tzmeyer#!u##zov"\'schwitz#)nian-held#%s-man$&chaert"&tflies#&herin\'#$tery$)led-water$\'om-hole\'-of-the-league',
+    '#&maraaf#*ndary-line#&rsault#$ssac"%vines"\'werbank"&x-file#%fresh##out"&y-girl$*meets-girl$&wonder#!b#"ks##sie',
+    '!$phil""ms!/r&uuml;nnhildes"(aceleted$+ken-covered\'%sgill%&lesham$#que#%ddick$!s#\'inshare#!k#"me$$ford$#ont',
+    '%#ker$*d-building%\'stetter$$shaw$&tridge##ose#%sidas%&liense$*s-founding&$work#%tpack#\'unstone##zed"(ead-line%#ing',
+    '&$ront$(st-plate\')screening&&summer$*th-holding\'\'testing&%alyse&#in\'##csu#%eched#!k#$nnus#$sdin$#ler$\'sington',
+    '$%walda#$vets##wis#(zhnevite"(iarcliff#)be-taking#!c#\'dalwear$,egroom-to-be$)ge-router&$view#$erly#(ght-pink&(on-built$$nais',
+    '#&m-full#$ndex$(eshrimps#(singamen$#set$$tows#%tford$,ish-designed")oad-gauge&*mindedness&&winged%&casted#&ccolli#\'derbund#"lo',
+    '$$ides#$nagh$%glais$$wydd$#zer#(odseinde$&mielaw%$loan%&street#%seley#!t#%uilly$&ssonet#)w-beating$\'beating',
+    '&&headed%"ey%&miller%%swerd"&rrming"$uche#&eckner$"rn#-gui&egrave;re&"er#(l&eacute##nau$$sden#\'sh-type$"ie',
+    '$"on"&yceson##her##man!+sc(nursing)"%eisou"!f"!k!"tf""is"!p!,u&ntilde;uel"#bba"%chler$%sbaum',
+    '#&kerown$$shee"\'d-break#"de$&histic$#les#*get-output#"in#!o#$swap",end&iacute;a"(ff-brown$+alo-hunting##man"%gaboo',
+    '##ter"%koshi")lb-shaped$"ed$%ourne#$gers#&l-ring%$shit$#ate$$eted$%heads$&worker$&y-beef##pin#$teel',
+    '#\'etanide"$nchy#+desrepublik#*gy-jumping##nie%"ng"(oncamino"%raimi#$cham&"rd%$ette#8eaucratic-administrative&%space#\'genland$#ies',
+    '##ham%!n#!l#$nets&"ti$&tollet#$rage$"ed#!s$#ley"(s-hopped#)h-covered$#pig$$veld#)iness-men',
+    '%!g$#ris#&selton#"te$#in\'"$tner#(skellite#$taud$)er-making&#bur&&ing-up"*yer-client#\'ing-out"#zby!"va',
+    '!%ykers"#rde#$ness")zantinist!%zns-e +c&aelig;lum!#-45"\'spanner!%.b.s."$c.c."$p.c.$"d.!"17"!8!"20',
+    '$&ricket"#ald"\'b-stand#!a$$list$\'naconda##eza#+le-operated#%obpur#%rillo#"us"$c-40##cia#$erta##hin',
+    '##air$%stral#&centre#"wa"&e-link#&nozoic""ig##man#%rness%$more%&papple$#olo#!s"(ke-maker$%stand',
+    '#$afat$$paez$%veras#%carea#,d&eacute;ron$%ecote#(endering#(f-bearer#%garth#$heta#$iber$#sto$!x%"te#\'l-level',
+    '%!y$"en%"ry$#ink%#sto$"oo%"ut#$ment#.orie-consuming#%veley#$ydon"\'manachd$"ro#$blet##eco',
+    '$$rone$!t#%ilion%&lagate#$mack#$ogie#&p-site$!i%&doglio%"ne$&riello$&ylopus"%naday%)ian-based$"li',
+    '$\'ndaigua#"di$)le-grease##ino$%zales#%kered##na\'$)ibalizing$"op#%olfan$%nises\'$tics$#pic#%sulex#\'taleupe',
+    '$\'ilevers%"na&!i$#low$!y##udo#+vas-covered"&pesize#$illa##nut#%pello#&rarola$%ichos#%tion-$-ure-recapture',
+    '$"ti%!o"\'r-borne$\'driving$\'pooling$\'ringing#/abi&ntilde;eros$$cara(!s$\'melized$&ndente%"sa$#que$#tis#&bon-13',
+    '((hemistry\'%dated&$icum#%crime#\'d-based$%amine$%inale%#oid#&e-free%$worn$"en$*fully-laid*\'planned$#sse#+go-carrying',
+    '##ian$%nated$#plo$#sma#&jacked#&minati&"ed$!o#,naudmetalbox$%igill$$sore#\'olinian#*pet-beater\'\'covered$!s',
+    '%#sco$%i-all%)on-eating$+ot-coloured$&y-case#$ston#\'t-wheel$&elised%\'sianism$$iera$%lidge$$mill$&ooning%%uches"$sals',
+    '#*e-fatality&#ile$$ness#*h-cropping%*generating$$back$!u##ina#(sandring$!e%%roled$"in#&t-list$\'e-based%$llon',
+    '$#rum"%t-gut#%alogo%$yzes$)strophies#\'ch-crop$%leugh#(echizing$&nation$%rling#$flap#)gacgtcatg#%h\'lic$(iodermie$#kin',
+    '#$nach#$rake$#ine$#oux#%smeat#\'termole$\'le-grid\'&market#$ullo"#uda$$rons#"es##ley$(ophyllum"\'valiere',
+    '#!i$%lling$\'ty-wall#"ok$!r""ya!#bto!#c-m""cp"$p-ml!#dma""pa""sc!#eao"%biche',
+    '".iling-to-floor"\'lentano$&stions#$gene#$laro$.ophane-wrapped$\'ulosics"$mrel"&naioli#&erente##ote#\'t-owned$\'ifolias$0rally-controlled%"e-',
+    '%(ovincial%#ust".pacia-negative#-halochordates#"sa"\'ramides$(topteris#%caria##met#$rato$$ejon#"to%"sa#"vl#"ys',
+    '#!t"%tacea$"ne"#use#!x"%xspex"&zannes!$h\'io"!-"&aabane#%brier#"ce##fes$$ford#"it',
+    '#$ldon$!e$%k-pit%$dust$!l#%manji$"ot$"pa%"ex#(ndravati&#ika$.ge-orientation\'%round$&tecler&"ur',
+    '$\'mangate$#one##que#\'racter-$!e$&gecard$&lemont%%ottes$#mes$$nels$#oen$,ri&egrave;re&"er$$tham%$work',
+    '#&t-line$%auqua%#way$\'eauneuf$$tier#&udhary%"ry$#han$$ntry$$veau#%vasse#$wner"&eatin\'#/ck&mdash;module%$free',
+    '%(weighing#%ddars#$eped%!s$"re$+se-and-wine&$wire#,f-proprietor##iro#%ju-do#\'khovian#$lalo%#tes$$tzie$&veston',
+    '$#lab$$tech#$nier\'!e#!p$)&eacute;n#*quer-board#$rnin#&sfield$(s-player#&vroned#$zery"#hun%#lim"&i-yang',
+    '$\'ravalle%!i#)cago-born\'#ans$&kenley$#les$$ocki#$dham#!e$\'n-shien$"se$!w#"gi#&kweche#%lcote',
+    '&)sacrifice%$ren\'(%swear$$lin\'#,mney-sweeper#\'n-strap$&agraph%$ntec$"ee%!s$(gachgook&"da$#men$$nock#\'occiole',
+    '#%quita#%rripo#(socheton#"ti#%weshe"+lorhexidine%)ine-based)*containing%%odyne"#obe#%ckful#"gm#%leski$\'mondley#&ngqing',
+    '%!s$"ph#+pping-board(#ton#(reograph$$ikon#\'ucroute$!l"%rimbo$0st-schr&ouml;der&"ed&%liche&(mas-card*$tree&"on',
+    '#-yselephantine%\'olophus"$uang#\'ckwagon#&g-chug#!i#!k##nuk#&vashia"#wit"%ymist!#ibc#!d""dg##hal',
+    '#"ad""ga$"le$*r-chomping#"na"+n&eacute;ma#(choneros#$efex#!i"*rcle-dance##ino""sa#!s$!e$#oko',
+    '#%ified$$lend#!t#&y-born%\'slicker"$vvie!\'laim(s)%%-form$&rmonte$#sse#$mmer#"ne$$ness#"ri$(ke-glass',
+    '&!n$"ts%!y#.ss-distinction&#war%\'icizing#&ustral#$vers#$yden")ean-lined\'&ooking%#out%&shaven$*r-thinking%#aid',
+    '%&spring$#von#$ndon##rcs$!e$#ici$$king##wer"!g"+iche-ridden$$kart##ffy#%mbin\'#&nicare"(oak-room',
+    '%!e#"gg#%ncore$$king%!s#"ri#\'se-mesh&&shaven%&d-down#&th-cap&-manufacturing%*es-washing#(ud-burst&+cuckoo-land%&bursts',
+    '"$ubbe$%shaft$$turf#\'tterbug"&yfford!#mcs"!t!#ncl""do""hc"!l""pf#%p-psd!*o-directed#&edited',
+    '#%habit$)eadlining#\'present")ach-built#$kley#(l-cutter%)exporting$#ies%-tion-building#&stland#(t-collar%$rack$#ers$!i"\'balt-60',
+    '#$lenz$$ynau".ccolithophores#$kett$#ram$%sedge$*tail-party#*onut-fibre"\'d-piece#$ding$!s#%orniu"%ehorn#!s"*ffee-cream',
+    '\'(spoonful\'$time"\'g-wheel#%itate(!d"#iii#)nshooting"%jones"$laba#&ebourn#%grass##ics$%gated#+lectivizing%!s',
+    '%"ne#"ms#*ogne-based$%niale%"ne$$rada%&imetry&"ng$-ur-difference#%peper#$ucci$!m%#ban"$mare#&bellga',
+    '&+e-harvester#"ed$\'stibles#(ic-opera%!e#+mando-style$"en%+rcial-radio*%ising*(ly-grown$1issaires-priseurs(%riats\')ionnaires\'$ures%$ting',
+    '*$room%"us$&munity$\'on-mode&#ing$%unale&*ist-backed\'&ty-led,#vel##oro$$ving#$paor%+rtmentalize$%endex$\'lainin\'',
+    '$&orting%#tes$"te%$onia$(utaprint&+er-designed)(enhanced)(produced($easy#$tech"%n-rod#%aghan$"ie$"ll$#rls',
+    '#"ce%"nt\'"us%%rtone$)retionary$\'urrents#&estoga#$fait$%iteor&#ure$(lict-set##ham#!i$"ng#$join',
+    '#$nate$#eau%\'ctathon$!u#%onley$#ver#&saquay$(ervateur)%ivism)$orio$+iderateness$5onant-vowel-consonant$(tantinos+!u%\'ipating',
+    '$$ulta#"ta$)emplacion\'&oranea,!o%(xtualize$%igent%+nental-type&!i$)rapunctus&$rian&)stiveness%*ol-centred&&versey#%vairs',
+    '%%rgers&!s$%oying"%ok-in$&worthy$!y#%l-bag%\'looking#"re"#pan#(iousness#\'per-red&$gate&%y-red#(rophilia',
+    '#(y-writer"\'quettes$%illes"\'ralline#$bies#%crain#$dner#,e-containing#$fiot##ina%#ium%$thia#\'k-board#(n-drying%(grinding',
+    '#*porate-tax$!y#\'regidor$*ieshalloch#&setted#\'tonwood##vid%#nus#&ydalia"$sans##hes#&miques#\'sington#(t-driver%-justification',
+    '$&aining"$tten"$ucil#&lbourn$#dst$%ibali$"on#&mbassa#.ncil-sponsored$*ter-argued((pastoral)$lots(&reform\'#bid\'(claiming',
+    '\'&feited\'%packs\'%value&$sses%#rie&\'y-based\'!s#+pled-cavity#$rant$$land$%reges%,i&egrave;res$(se&mdash$\'t-house%#in\'',
+    '$%inage$#sey#.turi&egrave;re""va$$ried#(ering-up")w-keeping#)boy-style#&ichans$"ng#&thorpe"&xiella#&swains"#zen##ier',
+    '!*r&eacute;a$*circ;perie"\'ablouse#&ckside#&ftarts#$gged#$iova#&mphorn#\'neflies#%pauds$!e##tch&"et"\'eamware$#ser',
+    '##dta#"ma#&scendi\')t-pattern$"yl#-tonne-covered#%wcuts"%ibier#%chtan&#ons$)ket-lover(&writer%!s#!e#$llon',
+    '$#men$)son-faced#%seyde$-is-management$%tales%%leton%$ophe#\'terion-$#ica%%quing#!x"(oat-serb#"da##hns##oke',
+    '#)p-sharing$%spray#%skery$(s-bedded&.classification&+development&%field&-hybridisation&(matching&$rail\'$efer\'#oad&#sex\'+hareholding\'#lab',
+    '&%track%%beams%#com&"ut%\'ed-over%#in\'%&script%\'thwaite#&uchman$"se#$yden#!z"(uciferae#"ft##ice',
+    '#&ttwell#$zate"%x-24z""yl#.o-preservation#)stal-ball!#s-2""fb!#tab!&ubango##bon""cc#\'kolding#!u"(emasters',
+    '"&fflink"&ghtagh#%liani"$iken"#kcs"\'lliford%&ngford$"um"\'mulates\'#ing"&narder#"eo"(p-winner##ido"$rant',
+    '#$belo##ina#%lewis#(mudgeons#.rent-awareness$1iculum-employment#)tain-wall$$isii#"va"\'schieri$#uta#$pate#$sack#\'todemus&#iet',
+    '%!s"+t-and-burnt#%icura$"es#)ting-room"$zick!&vessel!)wenthryth"%mavon!$ybex##ill"$cler"!d"%gerly"#nos',
+    '#&okinin!)zech-made%(o-slovak#$rnin 7d&eacute;cam&eacute;ron)*tournement#(uml;kuji")oslash;le!)\'affaires#)ssurances"(o&ugrave#&euvres#*rientation!"-e"$ream',
+    '!#.a.""n.""t.!!0!$a-60""ad#!n"$bell##lam#"rs""ca#$easy##oit$!m$#rum',
+    '"%gnish#!s"%hlink"$imon#%ntier#*ry-farming#%showa"#lan#%ibard$"ng#\'matinac#\'seattie#$wood"%maras#!d',
+    '#"ge#&n-fool#\'ophilus#&pierre"$nang#)dr&eacute#"io#"nz#"on#$tzig#\'ubegate"$phni"$rara##bys#!d',
+    '%#age%&browed%&leaved$%lands#$lene#&yaganj"+sh-and-hide"+ta-analysis%%based%\'sharing$%glove%$uild$%place$\'systems##cha',
+    '"\'ughter\'#\'phinois""y\'#*-and-night$\'patient$$rate#%nurse#%rover"%zomet!"bi!1c&mdash;assessors#\'ndash;3"$-6bf!#drc"#wli',
+    '!,e&ccaron;ane")-activate$%shing#\'beaking$$rief#+centralised#&gassed#$iced$&onised#*recognised%(gistered"(ad-faced$%baits%#olt$#eye',
+    '$\'heading#)e-dextran#%nside#$rmer$"ne#\'th-blow&\'haunted%%traps%$wish"-bt-collecting#!y"%camps#\'embrist#\'inspect$*sion-taker',
+    '#-ontextualized$#rex#$rucq$#ypt\'"ed#&server#"us#(yphering"%dalus$"ns"$ejay&!s#\'p-focus$\'ly-held"+fectiveness',
+    '#.icit-financing$+nitionalist#&ocused$%liate#%rosts#)unctioned"&horned""id"$jong"#kel#!s"*lahoussaye$$itre$\'pidated$$vayi',
+    '$\'y-start#%croix#$fina$%tware##ila$(mustafic#$orme#%phian&!s#%uging#$vaux"%maine$\'nd-pull\'\'related%"ge',
+    '$*terialises#$dike#&erging$&trious#%i-sec$!r$*semiquaver#)obilizing$%kedes%%ratie$\'n-lover$&tivate#"us",nationalised#!d',
+    '&!n#%holme#"ia$#kin#$mead##nay##shi$!o##ude",o-perspirant#*xycytidine%*nucleoside%*pyrolidine"$pero%(sonalize',
+    '#"pa#+ression-era%!z$$ival$.ofessionalised#%t-num#$utes"%rartu$!y#$bend%!r#\'maptera#\'ry-born##wyn"\'sastres',
+    '#,ert-dwelling&%ified#)fourneaux#&ignado#%kford#%monds%\'pressin#&parate(#ion$\'erandum#%qview#,sertspoonful#$tino$&ructor"\'terrant',
+    '#"ta$!e"#uil#)tscheland"#vas#%elope$\'stating#&illers#$lins#%onald%$ians$&utness#&ushkin""wa!#fuf',
+    '!\'haenens#(mma-pada#"ng#\'ramsala#!t")c&ndash;2#"-4"&ekelia"$ofar"#ung!"i-"&acolor%#nis#&logism&(ue-based',
+    '$)y-keeping"#bbs")ccionario#)erorhinus#%hgans$&loride#%kless#(taphones%#tus$&yonema&%ptera"/deoxynucleotide#$n\'t-$"a\'"$eing',
+    '"&ffcult$%erred##lam#!t"&g-file##gin#\'icipher$\'talised"\'hydroxy"$khil"%m-lit#&blebys")ng-a-ling$#ing#)ing-chair',
+    '##na\'#%orwig##ted"$odon#%nysia#&sgenin"#pso#%teryx"#rck#*ect-action\'\'dialled##ven"(s-invent#\'applies$%ster\'',
+    '#%bound#)c-loading$&arnate$"he$#oid%(nfirming%-th&eacute;que$)us-shaped&$sant#\'empower#)favouring#&graces#(h-washer$#ley#*inhibiting',
+    '$$info#$port#&sapear%(tisified$\'ymmetry#$till"$tter"#uma"%versi#)ing-board$&tiacus#!s"%xevit#&ieland"!z',
+    '!\'janogly"%ordje##ser!"kk!#lco"!y!\'msp-f10!\'na-bind!"o\'#!t"\'broslav"&ckhead$#low#%torat#/ument-retrieval',
+    '"$dona"%g-end$\'fouling$-in-the-manger$&legged$$meat$%owner$\'walking#%eared#(fighting#$gart#"le"%lares#&badarn#$gans',
+    '#$ling#!o$!r#$tish"$magk#(e-headed$"cq$)stic-type#\'inicano#$ovoi"(naldsons$!r#"do##nay"&oberry',
+    '#"ge#!k#$ming#(r-opener%$post$&ebriff$%mouse$$yard"+rad&ucirc;s#"en##gan#"in$"ot#&mobile#%naway',
+    '#$ries%!s#)solateral"%sedel#\'s-house"&thaidh"%uanes#*ble-action\'\'bogeyed\'(handling\')labelling\'&parked\'$star\'&whammy%&ing-up',
+    '#&ghboys#"in##lce#$nans#\'r-faced#$vrin"2ver&ndash;boulogne"\'wbiggin#&n-beat%$load%%under$%loads!$p-sm"%n-100""rk',
+    '"#aba#!c$#hen#%ggers$$omir$$utin#%kelow#$mmen#!p#*ught-strip##vis#%wgear#\'y-horse"(eam-book&\'machine',
+    '%&achine%&walker\'"rd#$pung#&ss-run%(ing-bell#"wy"$iech#)ll/driver#)nk-sodden%,s-dispensing#\'ve-away#%zzled"$owes""ps',
+    '%&dealer%)injecting%)producing$$gets#)m-beating$%breck$&mossie$$roll$&sheugh"%y-rot#$bulb!#sch!$tx-2!+u&egrave;se#\'ndash;a',
+    '"#bal#"on#$unni"$ccio#"is#&kbills"\'dbridge"%elled#$tted"&jardin""kw"%mbing$%leton#%mying#$sday',
+    '"%nbell#$crue#$echt#&g-heap$#loe#"ks##loe%%pillo#%smuir"%ppies#"re"$rava$#zzo#$ieux##ran',
+    '$"un"%sking#)t-stained"%tronc#\'y-based&%earer%$room"#yet!#vnp")ortsovaya!#wam#$rven"$eebs#%lleth!&yarchy',
+    '"\'namized$$rama$"st"&remose"!s#&topian"&tiscus )e&ndash;h!#(k)!$-412"(selectin!"/2!&adwald",gle-knowsley$!y',
+    '"&nberht"&r-drum##lex$)y-retired#+th-coloured&(orbiting%#men&%overs""so#%y-fit%%money%*on-the-eye%\'to-wear"(ting-out#$well',
+    '!%bcdic"(erhardts!"cb"(cellenza#*lesiastici"!h#*o-locating$+cardiograph"%kmire""la"!n"#orv#\'tourism$$ypes"&topics',
+    '%$glue$%bound""in#$tman$#ori\'%alise""ma#%iston"(wardiana"%yvean!&elavar""ny"$prom"$rste""va',
+    '!%f-111"&facing#"et%!s#/iciency-seeking#$used""ik"!k""ls!#gcs"+g-and-spoon$(throwing#%layer#%plant#\'sciting',
+    '"&lwyseg".o-organization!$h-ph"#len"#man")renberger!%idoli"#fel")genstates#)ht-figure&)kilometre&&storey&&volume%(eenthand%(h-wicket',
+    '%)ies-style%$some%"y-\'$foot\'\'seventh\'$unit"#mer"(senbarth""tb"%usdem!#jes!$kert"&klesia"%ofisk#!w',
+    '!.l&eacute;onore"&-gebel"%andre"$baum"!d#!c##ene$$rcar"*ection-day)&result%)ric-shock("ty&,o-physiology\'\'blotted\'\'cautery',
+    '\'+n-transport(,ically-based#%ktron(#ika#,phant-headed#(ven-hour"$fast""ga#"er"&iasian#$ding#"nt##seg%!u#.zabethan-style',
+    '#%stone")lenthorpe$$tson#$iman"&mariel#&church#&elunde#&hirsts#!y""na"%opuro"$se\'s##pet"$ymus!)malangeni',
+    '"$barr&%asing#$leer%!n"!d""ec"+ission-line"#ler",otion-filled"%p-num#\'anelled$&thises#\'edokles#&iricus#-loyee-centred',
+    '\'\'r-based"!t!*ncapsidate#)ina-based%!o##los#(offining$-un&rehy;tered#\'rypting#(umbering##yst""d\'#&-focus$"of&$-day',
+    '\'+the-century%$rgan#$evor##job##les#*opeptidase$&scoped#%ureth"\'ergance%"en%)y-related\'\'sapping"(feebling""g.##div',
+    '(!n#.ineer-in-chief&$ring\'#oom#\'landism$"er$,ish-sounding\'"es"&iwetok""or#!u"$slow"\'telechy$#ndu#-halpy-entropy',
+    '#&r\'acte$#ing$$yism"*vironment-\'&nement"!y"/zyme-conjugated!$pact"\'igraphs##lim#\'physeal$&leural#&zootic""rg!+qual-length',
+    '##ipe%,roportionate$&ticorp#$ulei!\'r&mdash"#ard"$bani#!e"&calyps""ez"*godynamics$$lite"$ibon#&caceae#&naceus',
+    '"$land#*k&ouml;nig"%mines$$tage"#nir"\'oticise"$teco"!v"&yholme#\'thropus"&zincan!#sac"&cadron$$lope$&pology',
+    '#%obedo"!i#!s"%kside"(m&eacute"#ono""pe$!w"&semmay#!s"+tate-agency#\'erified#%orick#%rella!#tat',
+    '#!q#$sian"#hna$!e$-o-archaeology#,ylenediamine"$onic"#ter#!l!,ucatastrophe#!h#$omis"$dora")esperides"\'frasius',
+    '"\'logized"#nus"%polis"(ro-drive%$soup&$tyle&%ummit$$beef$*currencies$$news%#ote(!s$%paeum%+e&rehy;wide&(-machine',
+    '&&anized$%shell$%woman"(thydikos!#v-5"(aginated#%ndron$.g&eacute;lique%"el\'$ized$#ses"-e-of-election#!l#\'nhanded$$lode',
+    '%"um#/r&rehy;changing$!-%)dwindling%)worsening$$body$#day$&ingham$#lor$"ts"$icts#.dence-in-chief#%l-eye#\'scerate!&whurst',
+    '#%carer$%eltic$(hauffeur#\'emperor#\'factory$-ianc&eacute;e#&german$#irl#\'hostage#&l.u.t.#,metropolitan$"rs#%north#\'peasant$&ostman',
+    '#\'scumnik$%inger$%pouse$!t"(_tempore"(agerated#(sperates",cess-of-loss#+ommunicates"-ecutive-level*%style#$mine"$ist\'"0on-amplification#+tic-looking',
+    '"\'pensing#\'ocentre$-rt-processing#$reso&%spost#&urgate")temporary$%ntion#)raclausal%(position%\'vasated$3emely-high-velocity$%uding!)ye-colour$$mask',
+    '$%piece$%sight$(tracking#$ties"&thrope!$zana .f&eacute;licie"(uuml;nen!*\'rinstance!$-15e""27"!5""86"!a"$head',
+    '!#.d.!!0!"16!*3f&ndash;3!&a-mass""ba#%liaus#*re-trained$%icant")ce-powder&&ulling##han$*hochschule$!o#1ility&mdash;avail',
+    '#&t-file$*ion-ridden$)ory-owner"&derman""ed#"es#)ttenfjord"!f"(ggionato""hr""im#!q#)r-dealing%&ground%$play',
+    '$#man$$star#*th-healing"&ke-fur##har#!y")lcinellus#%kplan#\'lowlees#&sgrave$#ter#!t"*mily-style"&n-mail#&gsword',
+    '#$nich%!n#&shawes#%tails$!e#"us"&ramund$"sh#%gesii$#her#(inaceous##kas$#har#*m-labourer&$evel',
+    '##ron#%thin\'$!y"#sht#%t-fit%&growth%\'sailing&\'hifting%#tag""t-$%laden#$her-#.igue-producing#%stock"\'ubourgs',
+    '##rie#$sses""va#%oring%!s#%retto"$ysal#"um""zl!%ccset""is""lo"!u!/e(iii)-reducing"1ature-for-feature',
+    '"%cking##ode")deralized&$ting#"in"$eing#$lies#%tenby$!s"#lcn#$dene$$sher##iho$!m$$noid',
+    '\')passenger\'(sufferer#)t-covered"(m-grunge##ail#%fresh##ina%&inity\'"+nce-sitting%&houses#$elon$#ral##man"%rahan#%dowsi',
+    '#$gies#*m&iacute;n$$ette#)n-covered##oze#-ranti-thomson$*o-concrete%%fluid$&uginea##tig%+liser-based\'+ty-building"&tchin\'#(herstone$#iye',
+    '!$flax#!y"%rench!&grhist!&iachna##ich#\'mmiferi"%bbers#(re-based%$sand$+inopeptides$(ogenesis%%power",coll-hypaque#+tion-writer',
+    '"+d&egrave;le#"ar#%eique$!m#!h#"ic"*eld-effect%$note"&fteen-$)ies-style$0y-eight-year-old&$quid&,two-year-old"&g-tree##ala',
+    '"%leout#$into$$oque$"po#"on#+ter-binding"\'nagling$%l-set$\'nce-led$#rte#&dphone#+ely-crafted$#man$#oak#+ger-picking',
+    '&%bones&\'spelled#2nbogad&oacute;ttir#%stock"\'ordland$$ucci"(re-guard%%light%\'proofed%\'setting&#ide%$wood$%crews$$dogs$%mouth',
+    '##in\'#(mly-held#.st&ndash;class%2-come-first-served&#fix&(instance&%phase&#row&$step&$test#&thmoor")schbacher%$etti#(h-curing%\'farming',
+    '%#oil%$pond\'!x%$shop$%bones$$face$"ko$%wanda"$t-up#$hyan"#ume"\'ve-card&%hoice%&length\'$tter',
+    '%%night%(position%%spice$$year"(xed-date!+labby-faced#!c#)g-captain$#ler#%kstad#)me-orange&(throwing#(sh-flood#&t-back%$cart',
+    '%\'fronted%&headed%(sounding$$iron$\'picking$&weaves#%ubear#&vonoid#(xborough"%eance$!y#$cker#&ishman#)tchergate#&xi-day',
+    '$$pack"!i#&egende#(ght-deck&$line#!m$#nap#)p-flopped%$over$#pin#$tter"*occulating#+or-to-floor#\'rentina$(id-faced',
+    '$#man##w\'r$"ay$\'er-girl&$girl"(uanisone##dde##ide%"ic&#sed#%nkies#\'oresced%&inated#\'razepam#(sh-faced',
+    '#-violacustrine"\'y-blown$(catching$$over##ash#"da#(ing-bomb##man#%pasts!(ob-watch"*cus-puller"$dors"&erster"$gdoe#$gini',
+    '##hel"*lding-door#"ia$#ose#)k-dancing%&singer$\'partiet$&singer##ley$-ow-the-leader""ne#!s#)tainbleau%,na-silvestri#!z',
+    '"$obar#\'d-store$%court$&ie-ism$&market$%store#!m#(t-bridge$%brake$%strap"+raminiferan#*ce-landing%(d-choice%%meats#\'d-asili',
+    '#%e-arm%#paw$(ign-ness$%manii\'!s&#rke$)st-living$%warns#\'gettin\'##ker#"li#(m-of-fur$%osans$#var##ner',
+    '$#man#\'thriver$&ran-77$&y-page&.three-year-old&$watt"\'ssegrim%!t$*il-bearing\'\'fuelled"&ugasse#"ld$"es#*ndationers#,r-generation',
+    '%$port%$span%$term%$wave&#ord$!t%(een-foot%(h-wicket%#rak"(wl-house"%xcote##man"$zzie!"pg!7r&eacute;d&eacute;rique',
+    '"*actionates##ils#+me-by-frame%"ry%&viewer$!s#$nais\'!e$%colin)"us$#low#+ser-darling##tia#(uenliebe"#ean',
+    '#%ddies$$iano#"e-%$born%&tailed&%rader%"up$$flow$%lined$\'stylers$(wheelers$\'zeframe#$hley#*iheitliche#%nchie',
+    '$!i#%quens\'\'t-flier#*shly-baked#(ycinetia"$iedl%)richshain$)ndly-fire)\'looking#"gg$&htener##see$"ks#%thrah$"to',
+    '"%ocked#%elich#(g-hopper#"m\'$"ia#)nalpstock$"t-&$foot&&loaded&(pointing#%stick#%tteur#%wnies"+uit-picking%$shop',
+    '"!t!#tii!%uddle#$gana$"es"#ero"$gaku#$gles"%inary"&jimoto"(ll-cream%(function%$span%$toss%$word',
+    '$"y-&(extended""my"$nada$$futi#&dacion%!y$"is#&nygirl"(r-trader#&belows#&loughs#)nace-fire##ora##uya',
+    '#\'eholder!,z&ndash;3000 ,g&ndash;haul"5uuml;m&uuml;sl&uuml;k!#(t)!%-60xl"$fuga")o-a-a-a-l"&series"#wax!\'.c.h.q.$"r.!%1-c72!\'abarone%#rou',
+    '#\'erlungi""ck"%dansk#"da#\'olinium"\'elstrom"$ffar"$gong"!h#$agan$!n"!i#\'llardia#$n-up#"rn',
+    '"%laxis##ego$"ra%#ius#$ford#&icians#!k##ler&"ie%%ywood$$iani&#rds%"co%&freyan%#her',
+    '%$stel$#wey"$ma\'a$"at$#rra#$bols#&ecocks$$show#"in##ond"%nders#$gtok$%wayed#%nochy##ong',
+    '"$rben$"le##con#+den-variety#&gantua#+lic-crusher&"ky#%mouth#%n-wen$#edd$%ishee$#sey#\'rington$%yduff#!s',
+    '")s-fuelled$#lid$$main#&cgoine$$ogne#\'herbrum#$pari#!t$"er$)ronomique"%tesey#\'hercole##ors#"so#"un',
+    '#!g#(nt-faced"$yane"%zprom#$zard!"bi!(earanach")c-alsthom""do""en""fr$%eiter"\'genwart"%ilgud#!r',
+    '"#kht""lb$$augh##ded%%rmann")meinderat#$inga#!u"(ndamerie$\'er-role#\'ealogia$(ralhuman%*ous-minded$!x#%gshen',
+    '#"te#)uflecting",oarchaeology"%petto"\'raistos#$bier#$enuk#$gely#)m-killing$+an-sounding($tyle&#der&!o#%raway$)ymandered',
+    '$!z##yon"$scan$#hke""ta""va!&format!"ha##fur##nim#"us"%engis#*orghiu-dej"(ibelline#%slain',
+    '"!t"(urburrun"$ylls!\'iacinto$$obbi#%mbono#$nola"$dlow"#ers"%fhorn#$tbox$\'wrapped"&gabyte$%flops$$watt',
+    '"#lan#\'bertine#\'comston#$ders#%laroo$\'yflower#%senan#$zean"\'mcracks##ped")nger-beer&#ing$#old##man#"ty',
+    '"(ovannoni"#ppo",rder-pattern#*lie-girlie#(ocheques"$sele##mos"%ttels"+ureconsulti"#van$$udon#%e-way!+laciomarine%!s#%dding',
+    '$\'orizing%\'urising#%reola#)ss-backed&%plate%$cock%$pole%%worms#"tt##yva#$zers"\'ebeland#"em#,ichschaltung#&ngetti',
+    '$\'leighan$#man$"na##yed##zer"\'istener%#rup"*obesupport#&meruli#&riosus#\'ssiness#(ttalling"%u-248#&conate%)sinolates',
+    '#%mness"%ycols##der##nch$%neath!%m-eds"$elin!&naggle"!r!)o-carting#%round"#_up")al-driven%%mouth%$post',
+    '%#shy"#bbi""d-$\'centred$$sent#$bold#%flesh#$gifu#$nose#$sons""ed#%tschy"!f##fee$$redo',
+    '"(ing-home"#jko#%u-kai"%larsa#"d-%\'covered%\'digging%%green\'$ound%%medal%#pan%#top&&rimmed$&berger$\'enhurst',
+    '$$ings%#wil$&plated$$smid#"fa$!o$$wear#"la$"op"#nes#&iopora#"ks")od-humour%(practice$%enday',
+    '$$lass$\'ramgate$+y-two-shoes%!s#(se-grass)$zing%!r"#pul"#rda#"ey#!f$$elen#\'goneion&)ocephalus#-riar&aacute;n',
+    '$#uch"%stick"$ttes&%chalk")vernment-+\'created+(licensed&.or-generalship##ind&!a"#won##ran$$ings"%xhill"#zem',
+    '!+r&auml;tzel#-uuml;ndlichen"$-ax7"%abouw%!w#$cile#)duateship#-ffiti-covered$"ic%#tty#,in-producing%"ey%"ge##mma&!s',
+    '##nat$$data%$papa&#rix%!y$$gers$!z#,ph-searching$!y#)ss-eating&\'letting&$root%!a%#bur%%court',
+    '%#iad#(ve-faced&$vase$#lax""dc"*ease-paint\'\'smeared$-t-grandparent(/eat-grandmother$%vesie#"ca#\'ed-free%!s$!f$"n-',
+    '&$ness&&tinged&&yellow%&bridge%%eland&"rs%(fingered%%hough(&se-gas%"ie%$rigg%\'shields&$ight%$vale%%woods',
+    '##ger##ppi#$sini#\'y-scale&$tone$!i"!f"!g"\'id-iron#"fo#%gnard#$mbsy$$fang#%ssell"#ock',
+    '#$mril#%ocock#%tbags#$udle$#nd-\'(dwelling\'$work&#hog(%pping$.pware-enabling$!x#$wnup$,th-promoting%#ray"!t',
+    '##mio#$yere"(yglewski!"se!\'uaiacum#"mi#(nacastle#&rdrail$"ea#&temela$$tari"#ber#$isch"$drun"&ennady',
+    '"&ichard#&dlines#"go#(ldswomen$%lemin%%imont#(n&eacute$&eafowl$&nesses#&tarest&#ing"$lati#%lfaks$!i"%mboil',
+    '""nd$*uli&cacute#"ey##ten%"rs$&iarius#)zenhauser"\'rdjieff#!n"&sseted"*tta-percha"&wahati"#yed$"tt!(werinwyr',
+    '#(nffynydd%"or$#oro!%yenes"0mnop&eacute;dies"$rase .h&eacute;brard")uuml;bner!%-bone"$have"(infinity!#.n.""w.!"10!#aaa',
+    '#\'baniyah#\'ituates"$chim$%shara#&k-work$!l$)ney-coach#!s"#dnt"%efely#!g#\'mmerlin$\'orrhoid"$feez##ter',
+    '#\'gerston$!s##ino"$haha"%ifeng#$naut#\'r-brush%$line%*of-the-dog&"il$\'cutting$&slides%&tyling$\'washing"+l&eacute;vy',
+    '#(berstadt##dan$$eman##evy#)f-a-metre%#bar&"ow%(carrying%\'defined&#isc%&expect%%facet&)rightened%%groat%%horse',
+    '\'&formed%$line\'&stened&$ying%$pace(#ked\'%inted&%issed&&romise&%ulled%$rate&$ight%%sheep)!t&#ite',
+    '$%beaks$$mast#$gren#\'iaeetus$#day#\'kieriid#(l-marked%%stand$*d&oacute;r$"el$%sands$+ucinogenics%!m#*obacterium$\'genated',
+    '"%madou$!r#$bley##mon#$oaze#&utenya##wih"$ncox#&d-bell%$clap%\'gliding%$rail%$spun%%wound$%claps',
+    '$.elgesellschaft&-sgesellschaft$$iman$%looms$(painting$$wash#$ekon#%gared$(ing-drop$%lider##iff#&nafore$#iah#&saring$$lope',
+    '#%xiong"$pper"\'rberger&#ton$(ourfront#&d-back%\'covered%$edge%*headedness((rtedness%#nut%(surfaced$&bitten%$ound$\'enhuish',
+    '$!i%\'ngstone$)ness-free%$osed$$rock#*e-coursing%#lip#%ijans$$ngay##len$#ing&!s#$mand#)p-playing#!r',
+    '$&umphed#&t-leap$"as$$leap&#ian$"op$#ree$%stock#!y"%sidim#\'lingden%!p#&seinen$$idic%"ny',
+    '")therleigh&$sage$)urusinghe#$rick$!y#$tatt$!i")ulteterre#"pt%\'zollamt#\'t-brion"\'vernick"#war%"de##don',
+    '%)priestess$$fish$%swood$$well"&y-rick#!t")zard-free#\'el-eyed%$dine%$rigg#$zard!"cb!"da!%e(ii)"+ad-building',
+    '%$drum%\'shaking&\'pinning%"to$$jogs$,line-hitting)&making$%notes$)ster-time#&labhal$(th-based\')insurance#$rmon$"t-&\'lifting',
+    '%%throb#$sman#,t-insulating#)vy-browed&*handedness&$lift%&handed"\'bb-type#%ditch#%erden$!s"!c#%kroth"$ddon#(gelaying',
+    '"#ger#"uy"#idt#$lige#"mo#%nkels#"se"\'kataios"*ldenhammer&%tenor#%frich#$gard#)ical-scan$$deck$,x-loop-helix',
+    '$\'eborine%"ne%(spontine$$ings$$mans##mer#&p-desk"*merocallis#!i$(chordata$*desmosomes$#nge&$ford"%n-run#\'drickse',
+    '#(l&eacute"$pple#-tadecapeptide%%meron"#r-i#\'aclides#$ball$%urger#"e-$$tors#$iots#$ling#\'mitages#)oin-using#\'renvolk',
+    '$$tatt#*togenbosch$%smere")speridean#(tercombe"*teranthera%\'otactic#"ta#$zler"&ureuse#"ss".xacyanoferrate"&zbalar!"ha"%urrnh',
+    '##res#"ya"#arc"#b-e#\'ernator"%ckham$&sville"%ddink#)e-covered$#way"*erarchised$"on&%ymous"-gh&rehy;speed$*-amplitude',
+    '%,carbohydrate%%field%(lighting%)modernist%&priest\'(oduction%&return%-specification&%tress%#tea&"op$$down$\'er-cost\'\'density\'&margin',
+    '\'%value%-st-other-word$#ish$(ly-sexed$%nesse"&juelos"&ldamay$&egarde%(nborough##ker#"l\'$)-and-dale%\'grazing%&walker$#ery',
+    '$#ing""me#!s"&nd-leg$#gut$#son#\'ge-line#,terh&ouml;fe&*steinersee"&p-bone#!e#\'pogriff$\'uroides$"ys"&rayama',
+    '##lap##obo$!n#\'schhorn&%owitz$"el"%seman#\'tidines$(oricized\'$sche"(tchhiked%%mough#$rail"#vol!%jorth',
+    '$#dra"!i""pa!&oaglin#%rders$)se-voiced"&barton#$bema")enselaers"(fstadter"$gger#%lands##man#\'snorton"*henstaufer',
+    '#%ianga"\'ld-down$#ene#\'e-maker$#saw#!l$&dobler$%erin\'$(inghurst$\'ow-cast$$yday%*wood-based#$mann$%strom#!n',
+    '&%uying%$care%%movie%%start$%based$%craft$%quity$(steaders&#yle#"o-$(iothermy$+taurocholic"$nble#&ey-dew%&mooned',
+    '#$kies$!s$&y-tonk##ley#$ored$\'urables")odwinking#$kway")p-growing#%along#"ko"&rbling#"es#$fitz##kan',
+    '#$ning$"li#\'ridness#*se-breeder&$hair&%lover&(whipping"-sp&iacute;cio$$tial#\'t-plant$&essing$#ium".t-water-bottle%&eather#$dogs',
+    '%\'schools##ton"#uck#"es#\'nsfield#\'r-a-day%&length#(se-owner&&sitter&$work%"by%%chair%%flies$$hold"\'vertram',
+    '$!y#$beit#%croft#)dendykers#"el$!r#$town#"ya")yerswerda!$r-el"$bmoa"!u"&vatska!#sob"$p-65',
+    '#%orani"&bertus"$ckle"\'dleston$"in"%ffman"(gh-jones$$eses#"in#&olinus""li#$sker"+man-machine%%ising#$baba',
+    '$#in\'$)ty-dumpty#$ulus"0ngarian-language%"te##osa#)ting-horn#"za"%rgill#%twood"\'sbandly#%habye#\'ishusis##zti"#udu',
+    '!,yacinthoides"#des#)ro-carbon%$bloc%&lysing%%power""er"#flo"$gena"%paque#(erboreus%)pluralist&(olarized%&saline&%omnia',
+    '#&henate#$norm#"o-$&stasis)#zed$&tactic%,hesis-driven"#tek"#uck $i\'th!%-case"#egf"#spy!".s!!6',
+    '"#ssw"$tefl"\'volenus!#bcs""ec#$rtex""nu"!r#%ahimi$"ms"#usz"$ycus!%c-a20"$airr""df',
+    '$%queen$\'scoured#%maker""hi""ns""ot"$stis"\'talurus#%erina!-deal-standard#%mnite"#gie"\'olaters$#ize"$risu',
+    '""un!$ebpc"%hmarc!#faw""do""ma"!p#!a!"g-"!i"#nis!"ha#!b"#esu"\'onvbere',
+    '""ip#"rd#"si"!r""ss""ta!#kle"%onize$%works"%tinos!#lan"*h&eacute;u"#ija"!j"\'l-armed',
+    '&(scipline$)qualified$*understood#&awarra#$egit##izi#*usochamber"\'sington!-mage-analysis"-b&eacute;cile#$abah"+mortalising#\'unizing%*ochemicals$&tables',
+    '$$rata""rs!\'n-bound#&ground&$wing#$head#$lamb#(marriage#&to-out##use#%water$\'intered$#ork"#aki#$ptly',
+    '"+c-developed#*apacitates#,ense-bearing#,ident-filled$"se#/ome-consumption\'&earner#\'urables".d&iacute;genas##alo#\'ianness$!c%"at%"us$\'genized',
+    '$"ng#\'o-aryan&)ustralian%)pakistani$%sinia#-ustry-related"$ecto#%rrant"$fall$)ntilising#%ernos#+lation-rate#$obox$&grames$%lding',
+    '$$pack$.rmation-theory"(gathered#$emar$&niator$#sts#$ilby#%leses##olf"%hered#%olmes"#jun"&laying""na#)er-german',
+    '%$vate#-ocent-seeming*\'ounding#&travel#!u"%scrit#&hallah#&taplan%!t&"ed$&igates%)tutionals#\'winging"$teco$\'gral-25',
+    '%$post$*nsive-care$,r-connection&(european&(hospital(#use&*individual&\'lending\'&ocking&&market&/nationalization&(sectoral%$adio%%brand%%class',
+    '%+feron-gamma%,ior-ministry)&sprung%&larded%$mesh)#ing\'%trics%4nationally-important&#ode%%party\'%ssing&$hase&"ro%&sports&%tella',
+    '\'$ream%%union%\'vocalic%$zone#"il#(ra-asean&\'company&$firm&+infinitival&&tetrad%\'cardiac$"ex$(insicate$%oject#&uiting',
+    '"(veigling$&rcauld%#sus$.stment-banking#(igorates!)odine-125"#fcs""lu!#pea"(roniazid!"qr!/raqi-controlled"$eson"(idomyrex"#oko',
+    '"!q""ri$#dek!\'s&mdash"&bister")h-kay-nay##bel"%oflex#&lutrol##nzo##pon$\'ropanol&%turon#%quant#$zaki',
+    '"$sacs#&igonis##ue-"#ted#!i!#t\'a#!d"$aipu#!l$+ian-looking&$tour%&cizing%"en"\'husheng"\'inerate',
+    '"!w"%zhaky!$ulia"!m#!l!)vanauskas"$elet"$f-et"$imey"%oroid$)y-handled!"xl!&yengar!(zmailovo &j\'aime',
+    '!).havelock!%aafar"&c-card#)k-the-lad%"up$&endoff%$ting$&knifed$%plugs#&obeans%#ian&%nical#&quelin#"us",gdgeschwader',
+    '"(hanpanah"\'il-bait##mie#!r"!j""li##lud"\'m-maker#(aicensis$%rella##iat$%roqua#"sa$#hid"%naury',
+    '#"ny#"sa#\'uszczak")pan-based%!s"$rboe#*gon-ridden#$njak#$omir##rat&!t#"vi%!k""sk##min',
+    '##par"#uja#*r&egrave;s"$vaid"(w-length##har##ing#%orski"\'yakumar"$zira#%z-rap!%c-120"%m-800!$ean-""ea',
+    '$#ers"$lled$$icle"%nette#\'kinsons##ney#%olite#$uary"#ong"$ptha"$rman#(onimidis#&volino#"yl"%ssell',
+    '"%t-ski#$sons"\'vington"(wel-case\'\'oloured"\'yasingh!%iddou"$llie"$mbob"!s!&lundon!$nana!*o&zcaron;e"$anou")b-cutting',
+    '$&seeker$(training#\'finding#\'hunting#"st"$chum##ked"%deluk"#erg"&g-trot($ting"#hor"#in\'$-tly-developed"*ke-capping',
+    '$,than-kinging#(es-style#!o"#oss"&rdanes##gen#!m""st!"pg!#tec!%uarez"#bal"(gendstil##net"#ifs',
+    '"#juy"#ken"$leff$#kha#"ii#$lien#&unggul"#mla#!o#&p-seat"&nckers$(tion-box#(k-filled%$heap"#ppe',
+    '$"ts##kat",st-mentioned$$icia%"na$%sleep"#xon +k&ouml;chel!&(n)ite!--registration!#458!!9!#aak"$blan#(ul-based',
+    '$!r##mon"#ech#!n"#fue")garlitsky#$ouls"!h#$hale"\'il-yard#!n#"sa$\'eraugst&&swerth#\'tseliit',
+    '"$jima"\'kovatos")lahuewehe$#mis$.shnikov-toting$!w#$ends#\'kwasser#(limachos#$mias$!u##pin##uga"&mchorn#%ilari',
+    '##ran"\'nakaria$$zawa##eko$$moto##gai#+tineservice##wal"#oma""pp"#ram$%navan#\'lskrona#$mann#"pf',
+    '\'!s#\'stified#&ttunen##ume"#sai$$vubu#"ey##ozi##sab#%triot"%teson#&hakali##ina#"oh#$sura',
+    '"%unitz"#vio"$yser"\'zakstan!%ebich"#dos"%eking"&illers%"or#"un#*zersgracht"!k##ule"#ler##tic',
+    '"$mmis#"pf"#nar#"bu##don##fig#%twell"#rak#"is#"na%#han#"ri$$yman#%swell##zaz',
+    '"+to-acidosis##ton"%wlany"&y-word#$data#&holder!"fc!,h&aacute;ine"%adafi$"re#%emhet#"il#$lkha##rga#"yr',
+    '$*y&aacute;m"#idr##tai"#ons#&rassan"$umbu!#iat"\'ckboxer"\'dbrooke#!o"#eve""ft"&lkelly#"la$$erby',
+    '$&moulis$!y%#man#%neave#\'ojoules##pin"$mmel"\'n-based#&bolton#)d-looking$-ertotenlieder#$esix#&g-list$\'sessing%$hill',
+    '#$ison##ney#!o#$sham$"on"&plings##pax$(enberger$"in$!s"(rakosyan$!l#"in#!n##una',
+    '"\'t-built#$alya#*chen-diner\'\'/living#\'emarked#&planes#"ri#$suka#\'zbuehel"(wi-fruit!&laeber#%nsmen"%eonai#$psch$\'tomania',
+    '#&ndyker#"pp#"se"%usons!%nacks#%pweed"%ievel#(fe-fight#)ghtbridge"&ob-end$"by#\'ck-back&)for-knock&"up%\'bracken',
+    '##kke#\'t-tying$$tier#\'w&mdash$(-nothing%$that$"es$#yng##xes!(oala-pad"$chba$&edwice"$daly"%ebang#!l',
+    '#%outek"&inonia"$khba"(lakowski#$elas#$ossi##tai#$ymba"$miks$#tet#)mandatura$&ersant$(issariat#&somols")nigsallee',
+    '#%nicke"#ole"%pecks"#rac#"em#"in#%obeit$"va#!s$#hin$"mo#&tlandt"#sal#!h##tya',
+    '#$rieh#)ssevitsky"#val"\'walczyk"+yaanisqatsi")zakiewicz!%pelle!5r&iacute;suv&iacute;k"%acker#"ll%%erhof##tos#&ushaar"$ejci#%mlin\'',
+    '#"vo""ip#$zner""ka"&omeriz"#ull!-ubel&iacute;k"$chum#!k""fa$!h"#jau"&kulkan"&litsch#!m',
+    '"\'nashiri#&itachi#!o#(stavisen%&kammer"#per#$ffer"&rankyi$&shvili#"is#$nool#!o$"da#&spahic##ten',
+    '""te""yl!#wak$$iutl"\'elagobe"%on-do#"th!#yak"!m"&riacou *l&uuml;bke!-\'&eacute;cole*\'tranger$(grave;re"\'affiche',
+    '#\'nglaise#$ppel#&rtiste#*udiovisuel"#hay#$eure"&ultima#$sage!(-leucine!#.h.!#936!\'ab-coat#\'anowski#!e$#lle',
+    '#-or-management%#are$#ur-$%vitch#,yrinthodonts"%certa#$hine#$idar##los"*dder-stile#&ybower$%shave$$well"$eken"&ffitte',
+    '#(ramboise"$gado""hu"&katani#\'e-water$$head"$lita%#pur#&lemand"&mberth$#oll$%resco%\'uschini#\'educked$!r',
+    '#&oureux#$ptey"#nai#$cair#)d-surface%&tenure$#esk$%grebe\'!n$&planes$#rat%$iani#&ercost#\'gellier$#low',
+    '$\'sdorfii%%trath$+uage-change#"na#\'sbergen$$eria$#koy#$tana$"ic#&zorote"%o-tse##igh"&passet#&otaire#)peenranta',
+    '"$rbey#&ch-lap#"do#)ge-enough%/r-than-expected%"ss##iat$"ni$"ot#&k-song$%spurs##rea")ser-dance&(scanning##ius',
+    '#$tin\'"&te-hit%\'morning%%roman*#tic$0st-issue-in-file#$hing#\'ifolium$-tudinarianism##kes##oya"(uberhorn#$ched#&engram#\'ndryman',
+    '$#its#$toka"%valin$$mund#"ed$$lled$!y##oix##vus"#wdy#!e$%rence##ing##man#(n-mowing',
+    '#$amon"%zzard&#ini!#bws!#cts!$d-50"!i""pe!%e-eyo"*ad-isotope$$burn#)f-surface#%grave$#uer#\'n-faced',
+    '&!e#&rmonth#(sametric$&e-lend#$them&,r-and-chrome(&backed\'&barrow\'$ware#!v$,e-of-absence"#bec$!r#$lois"+cturer-name',
+    '"(eborough#\'ds-born&#fan#%swood#$wood"$fort#%t-eye$\'wingers"+g-of-mutton$$spin%&tretch##att"%ilani##per#\'surebus',
+    '$#ner#"vi"&lievre"#may##sip#$ures%"ia"%nagan#(bachhaus#"ey#"ka#"ts"&ofwine#(nhardsen$$tini',
+    '#$ping"!r#$caro"$sage#-s-eligibility",thal-looking$!e%!m#&rapage#*ter-string#)zeburgish"%ucism$(ocephala#$tgeb"&visham',
+    '%#ton#"ry"$xden"$yser!"hd"!x!$iall#!n$!a#!t"#bft#$rans%-ry-collegians"#che#$kin\'',
+    '"$ddon#"ia#%stone"$eber$,frauenkirche$$herr#%dlein##rse#*ut-general##vre##wer"&fe-ban%*generating%*supporting%+terminating',
+    '$$care$&keeper#!f#$land"%ggard##ht\'%--as-a-feather&*scattering\'%ource%%erage%(ly-armed%$moor%%years#!s"%istro',
+    '##nes""l\'#$lies#"ts#$wall"#mba$(ering-up#)e-burning%$kiln$%water#\'it-down&"up%#ed\'"#nac$#tex',
+    '#*earization$&backed$$kers$%nfold%$hall$!y#%gcove$$uini#\'king-up#&scheid$"ey$%ingen"(on-tamer"\'pcolour#$idex',
+    '#0opolysaccharides$\'suction#\'pizaner"!q#*uid-liquid"*riodendron"$sney#&t\'ning$\'-system$#eth"#tag#(eralized#&hium-6#/t&eacute;rature$)le-endian',
+    ')(derstood&$_bit&$chap&$mill&&thorpe$#man$%orina#&vinoff")ve-bearer$$rish%%sidge$"tt#%ulezi""yf!&jubisa',
+    '!(landwrog"%wyfan"$ynfi#!s$$fasi!,oad-carrying$!a$\'ing-bay#&n-back"$bate"+cally-grown#&hleven#)k-forward$&er-top$$pick',
+    '#*ss-covered""ge#\'gerhead#&ierait$#que$!s""ik#$sach$!y#"us"#kri""mb"0ndon&ndash;paris&%based$#ubh',
+    '%$hair%(proposed%$tail&$hrow$!.$!e%*r-standing\'&tailed$\'fellows$.itude-velocity$$moor&"re$%sight%#tay&&ocking',
+    '$$view$$well"#oby#)king-back#$pers#(rthusamy#)se-lipped%\'ning-up"#ral$(nthaceae$%zepam#.d-of-the-manor$$ling#$enza"$salt',
+    '#\'smaking"&thagam#)us-eating&$land")ud-voiced#\'ghguile%$rigg"#ve\'$%-bite%#lee%%match$$bomb$"ch&#ild$#tot',
+    '&"nd%#row$+circulation$\'earning%\'mission$"fi%$ront$&return$(velocity#\'er-deck&\'working$5st-common-denominator%%water#&lander##rey',
+    '#$town"&zowski!#pac!$r-73""cc""da!2sconfigurationfile#!s!"tl!&uapula"#bar"%cetta#%ianus$&ferian$$lius',
+    '"%ganda##ers"#hti"\'igieans"!k#"ac#"in##man"#mby"%naire#&ch-box#%dhags#*g-bursting%&cancer$!a',
+    '$$wort#$niss"$pino""rv"%ssier$!o##tig$#red"&thiers##ine#$omer$\'slawski#"te".xembourgeoises#/or&ndash;london',
+    '!"wf!(ych-gate#%klama#\'operdon\'%sicum",ing-in-state"(mphatics"&retail"(senkoism#4ophosphatidylcholine"$ttel *m&acirc;le#0elig;lb&aelig;th"-eacute;daille)#tis',
+    '!(\'appelle!"-2"#csf"&people"$scan!%.r.c.!"19!"69!%a\'luf"\'-ay-jor"!.""ap#!r"(binogion"&caroon',
+    '#"hi%$avel%*ne-knitted((produced#"ks#%manus *tremolando#%tower".ichlorethylene"%ocken#&ughing""um#&ss-rod$*t-building#)th-teller',
+    '#%igrip"$kuse"(mbletots"(rbo-prop%$cash#&kistan#$ntec!%wangs"(entyfive&%three"$inax$"ix#%ttens"-o-compartment$$hand',
+    ' #udd!"hv!&k-born!*mbellifers!(n-manned"(blinding#&olting"+dercharging%$load%(shooting#"ug"&format"%i-jet"!k"+remembering',
+    '$!b!#omo!"p\'"%braid"\'heaving"!r"&tilted!&rumchi!$safm!"vr .v&aacute;theia!&ai-rna""la!%edute"&natici',
+    '#&satran!$iars"+ce-questore"\'deocube"$gnon")llanellen$%ified")nblastine"#ren#$ilis!&olkart"*wel-length!)ulgarised!!y""se',
+    '!#add"&katipu"&ldmann"(nsbrough"$rted"%stin\'"$tchd%&making$"om#-er-resistance"\'vephore!$cfba!(eekfield""fa".ll-experienced',
+    '$#ied"&nching#!s"-st-south-west$&ertoun!"h-""ap#\'t&mdash"(eatflour%"ly#+el-to-wheel#%lming"\'ipcrack#\'tethorn\'%roats',
+    '#&zzquid!$idda#)e-running")fe-mother"&htland"(ll&mdash$#cox$"en"$mble"\'ndbound$$ross#&g-beat#&tersun"&se-ass!"kt',
+    '"#oly"+rd-for-sign""se!"pe!%rides#%ting\'!%urzel!\'ynnster %xdisp!-pg3-compliant!$trac!%ueyan!"xy %y-pcr!#app',
+    '"%smeen!"bc!"ed")llow-root"%rsel\'""ss!#hwh!$lang!$ound#$rsel#&thscan!(psilanti!"rm (zasulich!\'einlach',
+    '!"fm!#iel!"op!%s-bxf##kex',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_35 = (
+count_35 = 6694
+
+heads_35 = (
     '&mdash;although',
-    '&mdash;are',
-    '&mdash;she',
-    '&mdash;though',
-    '&ndash;8',
-    '&ndash;the',
-    '\'ent',
-    '\'mr',
-    ',',
-    '-ance',
-    '-butyl',
-    '-sponsored',
-    '1-2-3-bungee',
-    '100&ndash;7',
-    '100&ndash;8',
-    '102-key',
     '19-',
-    '1945&ndash;79',
-    '1992-style',
-    '2-deoxyglucose',
-    '2.7-litre',
-    '20&ndash;30cm',
-    '250-acre',
-    '4&ndash;5m',
-    '4-meta',
-    '4500&ndash;50e',
-    '5.3-litre',
-    '9&ndash;12(b)',
-    '90-mile',
-    'a&mdash',
-    'a&ndash',
-    'a-building',
     'a-coming',
-    'a-go-go',
-    'aaaagh',
-    'aaf',
-    'abab',
-    'abashidze',
-    'abfd',
-    'abled',
-    'accessorize',
-    'accm',
-    'acgm',
-    'achaean',
-    'achaian',
-    'actinidia',
-    'adath',
-    'adef',
     'administrates',
-    'administration\'',
-    'advertsing',
-    'advocat',
-    'aecl',
-    'aert',
-    'afd',
-    'air&mdash',
-    'air-land',
-    'ajd',
-    'akimoto',
-    'al-qasem',
-    'al-thair',
-    'alannah',
-    'albsu',
-    'alexandrinus',
     'alfrink',
-    'aliasing',
-    'aliquoted',
-    'all-breed',
-    'allegorized',
-    'allsort',
-    'alstroemeria',
-    'ambrit',
-    'americanise',
-    'amshold',
-    'amuesha',
-    'anaesthetizing',
-    'ances',
-    'androgynes',
-    'anges',
-    'angleterre',
     'anglicize',
-    'anglo-chinese',
-    'anglo-united',
-    'angulated',
-    'annick',
-    'anspaugh',
-    'ante-',
-    'anthropophagy',
-    'anti-air',
-    'anti-cytokeratin',
-    'anti-incumbency',
-    'anti-skid',
-    'anti-vice',
-    'antifascist',
-    'aoh',
-    'apartment-house',
     'apchin',
-    'apics',
-    'apionem',
-    'apotheosized',
-    'appadurai',
-    'apuleius',
-    'aquascaping',
-    'arc-info',
-    'archdiocesan',
-    'ardnaveigh',
-    'arkanoid',
-    'army\'',
-    'arsames',
-    'art-dealer',
-    'artexed',
-    'arthog',
     'artslink',
-    'arve',
-    'ary',
-    'astles',
-    'astrodome',
-    'astynax',
-    'atpc',
-    'attacca',
-    'aucun',
-    'aun',
-    'auto-reverse',
-    'auxil',
-    'avare',
-    'avg',
-    'avma',
-    'aylish',
     'azza',
-    'b&ndash;29',
-    'b-26',
-    'b-film',
-    'babaian',
-    'babet',
-    'backease',
-    'backpedalled',
-    'baffetti',
-    'balfourier',
-    'ball-changing',
-    'ballincollig',
-    'bar-stool',
-    'barber-shop',
-    'barn-owl',
-    'barovier',
     'bass-line',
-    'bastardized',
-    'batoning',
-    'bausch',
-    'bavelaw',
-    'bb\'',
-    'becht',
-    'bedwear',
-    'beecom',
-    'beekeeping',
-    'belfast-style',
-    'bendelow',
-    'bengough',
-    'benvenuti',
-    'bevvied',
-    'bezu',
     'bharu',
-    'bibio',
-    'bierwurst',
-    'birding',
-    'birthed',
-    'birzeit',
-    'bish',
-    'bismillah',
-    'bisphosphonate',
-    'bistrot',
-    'bitburger',
-    'bitted',
-    'bivalvia',
-    'bks',
-    'black\'uns',
-    'blesmag',
     'bleue',
-    'blobbed',
-    'blockcnt',
-    'blooop',
-    'boardsailing',
-    'bobbety',
-    'bocht',
-    'bodychecking',
-    'bodytalk',
-    'boetti',
-    'bogey-beast',
-    'boiler-suit',
-    'bollaert',
-    'bonair',
-    'bookin\'',
-    'borsumato',
     'bourgeoises',
-    'bouygues',
-    'bpa',
-    'bragger',
-    'brailled',
-    'branchplan',
-    'brandling',
-    'branscomb',
-    'braw',
-    'bredero',
-    'breechclouts',
-    'bretschneider',
-    'brilliantined',
-    'bringed',
-    'brixen',
-    'bronzewing',
     'brookbanks',
-    'brookite',
-    'brotherswater',
-    'brr-brr',
-    'brunches',
-    'brunnhilde',
-    'bucer',
-    'budget-making',
-    'bup',
-    'burd',
-    'burghul',
-    'bustamente',
-    'busti',
-    'butter-wouldn\'t-melt',
-    'bvm',
-    'bwcp',
     'by-the-book',
-    'c&ocirc;t&eacute',
-    'c-17',
-    'caffer',
-    'cairan',
-    'calcined',
-    'calendaring',
-    'calf-skin',
-    'caliburn',
-    'callister',
-    'cambstec',
-    'camry',
-    'can\'',
-    'cannabidiol',
-    'cantaloop',
-    'canu',
     'canuck',
-    'capernwray',
-    'cardpac',
-    'carlisle-based',
-    'carmaking',
-    'carol-singing',
-    'casati',
-    'casemates',
-    'castella',
-    'casualty-faking',
-    'cat-food',
-    'catalac',
-    'catburglar',
-    'catechising',
-    'catrain',
-    'catspaw',
     'cattle-breeding',
-    'caus',
-    'cavaye',
-    'cazzo',
-    'cctu',
-    'ccuf',
-    'centurian',
-    'cfront',
-    'ch&acirc;teauneuf',
-    'challen',
-    'champollion',
-    'chapatti',
-    'chapot',
-    'chauvet',
-    'chekasin',
-    'chelate',
     'chelsfield',
-    'chernow',
-    'chevvy',
-    'chheng',
-    'child-prodigy',
-    'childspacing',
-    'childsplay',
-    'chinked',
-    'chionodoxa',
-    'chirm',
-    'chittered',
-    'chloroguanide',
-    'chudet',
-    'churring',
-    'chust',
-    'chut',
     'cidip',
-    'cigarette-lighter',
-    'cigoli',
-    'cinemagoing',
-    'cittern',
-    'civitate',
-    'claonaig',
-    'clearheaded',
-    'cleere',
-    'cleri',
-    'climatress',
-    'climent',
-    'clothmaking',
-    'clotilde',
-    'cloud-cover',
-    'cloud-mist',
     'clw',
-    'co-occurring',
-    'coal-house',
-    'cobbed',
-    'cobbing',
-    'cobenzl',
-    'cock-a-leekie',
-    'cocopeat',
-    'codenames',
-    'coirm',
-    'colchicum',
-    'colliders',
-    'colom',
-    'coloni',
-    'comedy-thriller',
-    'commandery',
     'commissioner-general',
-    'community\'',
-    'comprend',
-    'computakit',
-    'computer-style',
-    'comtek',
-    'condover',
-    'confort',
-    'conquerer',
-    'constitutionel',
-    'contextualising',
-    'contrariant',
-    'convertagear',
-    'coomber',
-    'coppered',
-    'coptered',
     'cordilleran',
-    'corncockle',
-    'cornicing',
-    'corpuscularian',
-    'correction-praise',
-    'corrieyairack',
-    'costuming',
-    'counter-counter-themes',
-    'country-',
-    'court\'',
-    'coutumes',
-    'cowle',
-    'cowplain',
-    'coypel',
-    'crago',
-    'crain',
     'cravant',
-    'crii-rad',
-    'crimper',
-    'cronk',
-    'cross-pollinate',
-    'crosshaven',
-    'crowd-pleasing',
-    'crusaded',
-    'cryptanalysts',
-    'crystalised',
-    'cuff-link',
-    'cumann',
-    'cunnan',
-    'cupper',
-    'curdy',
-    'current-limiting',
     'cutting-in',
-    'cuu',
-    'cyanosed',
-    'cybernex',
-    'czarnikow',
-    'd\'amor',
-    'daggered',
-    'daglish',
-    'daintyfit',
-    'daish',
-    'dalien',
-    'dalnasnecht',
-    'damage-control',
-    'damejanet',
-    'dandle',
-    'danegeld',
     'danni',
-    'darry',
-    'datamatics',
-    'dataserver',
-    'davises',
-    'davit',
-    'dawnay',
-    'day-nursery',
-    'dazer',
-    'dbits',
-    'dcda',
-    'de-commissioning',
-    'de-humanising',
-    'de-industrialized',
-    'de-layering',
-    'de-pressed',
     'de-spooling',
-    'death-bearing',
-    'debarking',
-    'debiasing',
-    'debout',
-    'decision-process',
-    'decolonised',
-    'dedombal',
-    'deerhound',
-    'defuelling',
-    'defunctioning',
-    'deiniolen',
-    'dell\'annunziazione',
-    'demersal',
-    'democrates',
-    'denimed',
     'denn',
-    'denominate',
-    'depoliticized',
-    'derating',
-    'deschooling',
-    'desir',
-    'desire\'',
-    'desoutter',
-    'dessau',
-    'destin',
-    'deutch',
-    'devitalized',
-    'deyan',
-    'dgdgbd',
-    'didya',
-    'dienst',
     'dieppoise',
-    'dilemma\'',
-    'diomedea',
-    'diplex',
-    'diplow',
-    'disafforesting',
-    'discus-thrower',
-    'districting',
-    'ditra',
-    'dme-compliant',
-    'dogberry',
-    'doggy-paddling',
-    'dogrose',
-    'dolaucothi',
-    'doldrum',
-    'dollar-earning',
     'dolley',
-    'domain\'',
-    'donh',
-    'donkey-cart',
-    'donkey-jacket',
-    'donut',
-    'doo-dah',
-    'door-stepping',
-    'dorfwirt',
-    'dorli',
-    'doro',
-    'downdale',
-    'doxycycline',
-    'draughted',
-    'dreich',
-    'drillstring',
     'drive-thru',
-    'drive-time',
-    'droaned',
-    'drooly',
-    'dsa',
-    'dumb-ass',
-    'dumbreck',
-    'dunged',
-    'dunglass',
-    'dunters',
-    'dural',
-    'duty-',
-    'duvivier',
-    'dypp',
-    'dzagnidze',
-    'e(t)',
     'eacc',
-    'eadbang',
-    'east-side',
-    'ebles',
-    'echinodermata',
-    'ecsoft',
-    'edx',
-    'eed',
-    'eek',
-    'effect\'',
-    'egh',
-    'eivver',
-    'ekarro',
-    'el-bireh',
-    'elagabalus',
-    'electroplate',
     'elfman',
-    'eliger',
-    'elsan',
-    'emb',
-    'embroiders',
-    'emergo',
-    'emparked',
-    'empathized',
-    'empoli',
-    'emshoff',
-    'encaenia',
-    'enchant&eacute',
-    'enchased',
-    'endcaps',
-    'energises',
-    'energy-field',
     'english-speaker',
-    'eniac',
-    'enshrouding',
-    'envenomed',
-    'enwrapped',
-    'epidermidis',
-    'episcopalianism',
-    'epo-tek',
-    'eq\'ing',
-    'equivocating',
-    'erian',
-    'eroticized',
-    'esda',
-    'eshun',
-    'esportazione',
-    'essa',
     'essentialized',
-    'estranging',
-    'etiam',
-    'eumetsat',
-    'euro-parliament',
-    'eutherian',
-    'everting',
-    'ewald',
-    'ewarts',
-    'ex-diplomat',
-    'ex-formula',
-    'ex-jockey',
-    'execution-style',
-    'extern',
-    'eye-stripe',
-    'ezs',
     'fabi',
-    'fact-gathering',
-    'fagot',
-    'failure\'',
-    'fastrax',
-    'fatih',
-    'fauvist',
-    'favorit',
-    'febuary',
-    'fee-earner',
-    'fembots',
-    'feminised',
-    'fenestrated',
-    'fermilab',
-    'ferrochrome',
-    'festin',
     'fettis',
-    'fiddle-faddle',
-    'field-mouse',
-    'finian',
-    'finishing-school',
-    'finnair',
-    'firehose',
-    'firetrap',
-    'fische',
-    'fish-processing',
-    'fissioning',
-    'fist-fighting',
-    'five-string',
-    'fixcalibstrip',
-    'flatpack',
-    'flea-pit',
     'flexilink',
-    'fliss',
-    'flodwig',
-    'florjancic',
-    'fluck',
-    'fluminense',
-    'flybynight',
-    'fns',
-    'fonny',
-    'foodstores',
-    'foot-patrol',
-    'forelock-tugging',
-    'formated',
-    'formularised',
-    'formule',
-    'four-city',
     'fouracre',
-    'foureyes',
-    'fowers',
-    'fraternit&eacute',
-    'free-flow',
-    'fretwell-downing',
-    'frid',
-    'froben',
-    'frogslegs',
-    'frombat',
-    'fueled',
-    'full-force',
-    'full-throttle',
-    'function-oriented',
-    'funks',
-    'fuor',
     'fuori',
-    'furioso',
-    'g&ndash;aitf',
-    'g(r)',
-    'gaine',
-    'gainst',
-    'galactix',
-    'galbani',
-    'gallicized',
-    'gambier',
-    'gartered',
-    'gate-leg',
-    'gauffered',
-    'gayner',
-    'gcm',
-    'gebe',
     'gebr',
-    'geeing',
-    'geimhreadh',
-    'gence',
-    'gensym',
-    'geog',
-    'gerroff',
-    'gery',
-    'gestion',
-    'getta',
-    'gewehrkammer',
-    'ghilander',
-    'gift-shop',
-    'ginevra',
-    'gistutor',
-    'glass-rubber',
     'glassdrummond',
-    'glebes',
-    'glistering',
-    'globalizing',
-    'glogovac',
-    'glu-251',
-    'go-getter',
-    'god\'',
-    'goffered',
-    'gold-engraver',
-    'good-un',
-    'goodhearted',
-    'goodie-bag',
-    'goodstyle',
-    'gop',
-    'gorrit',
     'gotong-royong',
-    'goughs',
-    'gracchi',
-    'grandiflorus',
-    'grant-aiding',
-    'granulating',
-    'graunt',
-    'grave-digging',
-    'greigii',
-    'grid-pattern',
-    'grises',
-    'groining',
-    'grudger',
-    'grund',
-    'grundbuch',
-    'gua',
     'guanidine-hcl',
-    'guess-work',
-    'guin',
-    'gumboot',
-    'gunnhild',
-    'gurt',
-    'gwaun',
-    'gws',
-    'haast',
-    'half-convinced',
-    'half-dome',
-    'half-sat',
-    'haman',
-    'hand-craft',
-    'hand-waving',
-    'harakhty',
     'hardheaded',
-    'harijan',
-    'haron',
-    'harrumphing',
-    'hawkweed',
-    'haxhiu',
-    'hay-',
-    'haymon',
-    'hazen',
-    'hctranstab',
-    'hedge-trimmer',
-    'heeps',
-    'heidrun',
-    'heiss',
-    'heliconia',
-    'helium-neon',
     'hemery',
-    'hennig',
-    'hethel',
-    'hickinbottom',
-    'hidin\'',
-    'high-heel',
-    'highjacked',
-    'hillcroft',
-    'him&mdash',
-    'hjelm',
-    'hki',
-    'hmy-b53',
-    'hnh',
-    'ho-hum',
-    'hobnob',
-    'hogget',
     'hollister',
-    'homiletics',
-    'hopgrove',
-    'horak',
-    'hot-blast',
-    'hothersall',
-    'hould',
-    'house-surgeon',
-    'housetrained',
-    'huan',
-    'hucke',
-    'hudsoning',
-    'hughli',
-    'hundred-year',
-    'hunting-field',
-    'husat',
     'huter',
-    'huu',
-    'hydrates',
-    'hymnary',
-    'hypercolour',
-    'iccat',
-    'ice-maiden',
-    'icmesa',
-    'icona',
-    'icsu',
-    'idelphonse',
-    'ier',
-    'igrf',
-    'iiim',
-    'ikey',
-    'ilinden',
     'ill&rehy;equipped',
-    'imagesetting',
-    'immolated',
-    'immunoadsorbent',
-    'immunodot',
-    'impar',
-    'imsak',
-    'in&mdash',
-    'in-box',
-    'incesticide',
-    'indispensables',
-    'indurated',
-    'infiniti',
-    'infonow',
-    'informix-4gl',
-    'ingen',
     'inscru',
-    'instr',
-    'interdistrict',
-    'interleave',
-    'interloping',
-    'intermixing',
-    'inva',
-    'invigilated',
-    'iols',
-    'ipsden',
-    'iron-nickel',
-    'islamicist',
-    'isocor',
-    'istc',
-    'it&ndash;s',
-    'ithanguni',
     'itran',
-    'itri',
-    'itty-bitty',
-    'iucd',
-    'jacy',
-    'jahrbuch',
-    'jailbait',
-    'jantzen',
-    'jazz-house',
-    'jessamine',
-    'jettied',
-    'jibbing',
-    'jiminy',
-    'jingle-jangle',
-    'jinn',
-    'jitterbugging',
     'jives',
-    'jli',
-    'job-loss',
-    'jopanini',
-    'joyn',
-    'jugle',
-    'juni',
-    'jurisoft',
-    'k2-8',
-    'kalmyk',
-    'kalven',
-    'kaori',
-    'kapo',
-    'kavalek',
-    'kepier',
-    'keraistani',
     'kernel-level',
-    'khali',
-    'khwaja',
-    'kieselguhr',
-    'kiew',
-    'kilian',
-    'kilrush',
-    'kinased',
-    'kingfish',
-    'kipped',
-    'kipsigy',
-    'kiti',
-    'klaff',
-    'klinik',
-    'klop',
-    'knla',
     'know\'',
-    'knowin\'',
-    'kocher',
-    'koetser',
-    'komix',
-    'konzerne',
-    'krait',
-    'kralj',
-    'kreinin',
-    'kreis',
-    'kuban',
-    'kukuli',
-    'kuna',
-    'kurk',
-    'kyokushinkai',
-    'l\'&acirc;ge',
     'l\'arbre',
-    'l\'heureux',
-    'labang',
-    'label-switching',
-    'labeo',
-    'labetalol',
-    'labit',
-    'labored',
-    'labour\'',
-    'laciniata',
-    'laffs',
-    'lahti',
-    'lamentabili',
-    'land-ocean',
-    'land-train',
-    'landshut',
     'language-using',
-    'lapilli',
-    'lathering',
-    'laudate',
-    'laverstock',
-    'law-office',
-    'laybourn',
-    'leasam',
-    'leashing',
-    'leboff',
-    'leco',
-    'leder',
-    'ledged',
-    'lefthanded',
-    'lemus',
-    'lennoxlove',
     'lerne',
-    'lesher',
-    'lff',
-    'liberal-',
-    'libere',
-    'libertador',
-    'lidba',
-    'liden',
-    'lieserl',
-    'liffeyside',
-    'liftoff',
-    'limbered',
-    'limekiln',
-    'limnanthes',
-    'lindqvist',
-    'linguistique',
     'linkwatch',
-    'lionized',
-    'lip-cup',
-    'lipsius',
-    'liquored',
-    'littl\'un',
-    'litvak',
-    'load-shedding',
-    'locrian',
-    'logout',
-    'long&rehy;suffering',
-    'longlegged',
-    'loop-the-loop',
-    'loprofile',
-    'loquat',
-    'lorieux',
     'lowballing',
-    'lsa',
-    'lsl',
-    'luffa',
-    'luguvalium',
-    'luma',
-    'luthien',
-    'lutin',
-    'lydien',
-    'lyr',
-    'm-mlv',
-    'madhavan',
-    'madurai',
-    'magistra',
-    'magnifying-glass',
-    'magritta',
     'maharani',
-    'mahwah',
-    'main\'',
-    'major-key',
-    'majuro',
-    'mamboundou',
-    'manana',
-    'manchild',
-    'manesty',
-    'mangels',
-    'manucchi',
-    'manximum',
-    'mapreading',
-    'mar&oacute;thy',
-    'marionhain',
-    'marken',
     'market\'',
-    'market(s)',
-    'markoff',
-    'marlen',
-    'marquetery',
-    'maryed',
-    'mascaraed',
-    'maskirovka',
-    'mass-murderer',
-    'matamp',
-    'match-guise',
-    'matchboarded',
-    'matchpoint',
-    'mathmatics',
-    'matilde',
-    'mattelart',
     'mayweed',
-    'mazed',
-    'mcw',
-    'meatball',
-    'meates',
-    'medresse',
-    'mees',
-    'megga',
-    'melick',
-    'member-state',
-    'memex',
-    'mentalix',
-    'mentawi',
-    'mercenaria',
-    'merlini',
-    'mesol',
     'mesto',
-    'mestret',
-    'metanoia',
-    'metrocast',
-    'metronomized',
-    'metropolitain',
-    'microbilt',
-    'micropolis',
-    'microspreading',
-    'mid-1947',
-    'mid-level',
-    'mid-tape',
-    'migralift',
-    'mikoyan',
-    'milfoil',
-    'milkwort',
     'milps',
-    'minato',
-    'minema',
-    'mini-pill',
-    'minocycline',
-    'minori',
-    'minotaurs',
-    'miramax',
-    'mirror-sponsored',
-    'mis-',
-    'mis-used',
-    'miskeyed',
-    'mistranslated',
-    'mittened',
-    'mix\'n\'match',
-    'mkrtchyan',
     'mmr',
-    'mnla',
-    'model-girl',
-    'monger',
-    'monologuing',
-    'montanaro',
-    'montelado',
-    'moonwort',
-    'moorpark',
-    'mopes',
-    'moret',
-    'mosflm',
-    'mosrite',
-    'mouphty',
-    'movie-maker',
-    'mpis',
     'muddletonian',
-    'mudslinging',
-    'muleteers',
-    'multi-element',
-    'multi-zoning',
-    'multimate',
-    'multiport',
-    'mump',
-    'munroist',
-    'mursi',
-    'musar',
-    'mutis',
-    'mwezi',
-    'mythologised',
-    'mythologized',
-    'nagini',
     'nakaz',
-    'narratori',
-    'narrowcasting',
-    'nasd',
-    'naturellement',
-    'nbdc',
-    'ncnc',
-    'ncsa',
-    'near-famine',
-    'nebes',
-    'neo-classicist',
-    'neo-paganism',
-    'neophane',
-    'nerc-funded',
-    'nerone',
-    'nettlerash',
     'neuer',
-    'newpaper',
-    'news-making',
-    'next-to-nothing',
-    'nha',
-    'niceic',
-    'niched',
-    'nicolosi',
-    'nightrider',
-    'nine-panel',
-    'nitride',
-    'no&mdash',
-    'no-score',
-    'no-theme',
-    'noerc',
-    'noisey',
     'non-accounting',
-    'non-controlled',
-    'nonresident',
-    'nonrotating',
-    'noosed',
-    'nopwc',
-    'norbu',
-    'nordwand',
-    'nose-pulling',
-    'notam',
-    'nu-grip',
-    'nuked',
-    'nyu',
-    'o-ring',
-    'oak-aged',
-    'obd',
     'obsessionals',
-    'ocean-floor',
-    'ocelots',
-    'ochred',
-    'octubre',
-    'oded',
-    'offen',
-    'ogburn',
-    'oim',
-    'omdh',
-    'omnipotentem',
-    'on-trial',
-    'one-man-band',
-    'onesided',
-    'oni',
-    'onimode',
     'only\'',
-    'oodle',
-    'oppian',
-    'ordinated',
-    'orient-express',
-    'ormo',
-    'ornithosuchus',
-    'osmone',
-    'otterness',
-    'ottilia',
-    'out-gunned',
-    'outfitted',
-    'outgasses',
-    'outlet-pipe',
-    'over-40',
-    'over-commercialised',
     'over-funded',
-    'over-hit',
-    'over-powered',
-    'over-staffed',
-    'over-stuffed',
-    'over-tightened',
-    'overbreeding',
-    'overcompensated',
-    'overdressing',
-    'overgeneralized',
-    'overproducing',
-    'oversleep',
-    'overstaffing',
-    'owner-breeder',
-    'oxalis',
-    'p\'ing',
     'p-51b',
-    'pacha',
-    'pachelbel',
-    'pack-ice',
-    'paduan',
-    'paedophiliac',
-    'page-turning',
-    'paiakan',
-    'paintin\'',
-    'palam',
-    'palantype',
-    'palletized',
-    'palliated',
-    'panerai',
-    'pange',
-    'pannini',
     'papes',
-    'papows',
-    'parajournalist',
-    'paramat',
-    'paramax',
-    'parentheticals',
-    'parkwater',
-    'parmer',
-    'particularising',
-    'partindo',
-    'party-pooper',
-    'passepartout',
-    'paternostered',
-    'patris',
-    'patulin',
-    'paxus',
     'pebbledash',
-    'peeress',
-    'penetrant',
-    'penken',
-    'pension-age',
-    'penthurst',
-    'pergolese',
-    'perisic',
-    'periwigs',
-    'permifique',
-    'permutated',
-    'pet-owner',
-    'petie',
-    'petillant',
-    'petrocon',
-    'petzl',
     'peugot',
-    'peut-etre',
-    'philiphaugh',
-    'philomen',
-    'photo-retouching',
-    'photosetting',
-    'phreespirit',
-    'pi&mdash;approve&mdash;a&mdash;package',
-    'pi&mdash;prepare&mdash;a&mdash;package',
-    'pi&mdash;update&mdash;module&mdash;details',
-    'pi&mdash;view&mdash;module&mdash;details',
-    'piched',
-    'picken',
-    'pickin\'',
-    'piggy-backing',
-    'pignose',
     'pile-driver',
-    'pipedreams',
-    'pire',
-    'pisac',
-    'planxty',
-    'plateaued',
-    'plotprog',
-    'plowed',
-    'pma',
-    'pna',
-    'poco',
-    'poker-playing',
-    'poldauf',
-    'polytech',
-    'poncin\'',
-    'ponding',
     'pont-aven',
-    'pooka',
-    'pop-gun',
-    'popay',
-    'pork-barrel',
-    'porpoising',
-    'portencross',
-    'portunus',
-    'post-eq',
-    'potentiating',
-    'potter\'',
-    'poules',
-    'pousada',
-    'powerscreen',
-    'pram-pushing',
-    'pre-adaptation',
     'pre-meal',
-    'pre-plan',
-    'pre-science',
-    'precess',
-    'precoded',
-    'predrag',
-    'preplanning',
-    'pret',
-    'procura',
-    'progams',
-    'prosit',
-    'protein-a-column',
-    'prowl-car',
-    'prsi',
-    'psilocybe',
-    'pthreads',
     'ptpases',
-    'pudemo',
-    'pullwound',
-    'pulvinar',
-    'pundir',
-    'purslow',
-    'putloe',
-    'q-shed',
-    'quasi-non-governmental',
-    'queen-mother',
-    'quicksoup',
-    'qulis',
-    'r&eacute;serve',
-    'r-type',
-    'rabobank',
-    'ragnachar',
     'rahong',
-    'raisin\'',
-    'rak',
-    'randomising',
-    'ranke',
-    'ranlodden',
-    'raschid',
-    'rat-hole',
-    'rationals',
-    'rbst',
-    're-animated',
-    're-arming',
-    're-baited',
-    're-circulated',
-    're-constituted',
-    're-cutting',
     're-directing',
-    're-evoked',
-    're-incorporated',
-    're-invigorated',
-    're-met',
-    're-modelled',
-    're-oxygenated',
-    're-play',
-    're-pot',
-    're-promoted',
-    're-skilling',
-    're-titled',
-    're-tooling',
-    're-tyring',
-    're-zoned',
-    'ready-to-run',
     'reafforested',
-    'reaggregated',
-    'rear-guard',
-    'reattach',
-    'rebodied',
-    'rebranded',
-    'recalibrated',
-    'recd',
-    'rechannelled',
-    'rechunking',
-    'recollapsed',
-    'reconquests',
-    'recorde',
-    'recordkeeping',
-    'redmate',
-    'redounded',
     'redout&eacute',
-    'refaced',
-    'refronted',
-    'regall',
-    'regulares',
-    'rehashed',
-    'reiff',
-    'reknitted',
-    'relining',
-    'remapping',
-    'replotting',
-    'repossessin\'',
-    'reseda',
-    'reselect',
-    'resoled',
-    'resoling',
     'restaging',
-    'restalrig',
-    'restudy',
-    'retrenched',
-    'revol',
-    'rich-kid',
-    'richardi',
-    'rigali',
-    'righ',
-    'right-to-work',
-    'rit',
-    'river-side',
-    'rivetting',
-    'robinia',
-    'rodgersia',
-    'roelofs',
     'rollcall',
-    'rollerfurling',
-    'romy',
-    'rosalinde',
-    'rostadalen',
-    'rothay',
-    'rotp',
-    'rott',
-    'roughcast',
-    'rousseauist',
-    'route-sharing',
-    'rovertrail',
-    'royall',
-    'rsh',
-    'ruin\'',
-    'rumblefish',
     'rumkowski',
-    'rummer',
-    'rumple',
-    'runabouts',
-    'rvfa',
-    'sabat',
-    'saef',
-    'saer',
-    'sahibs',
-    'sakhiet',
-    'salimbeni',
-    'salvadoran',
-    'salyut-7',
-    'sanay',
-    'sandarac',
-    'sanitizing',
     'sapience',
-    'saponified',
-    'satisfice',
-    'satzenbrau',
-    'saut&eacute;d',
-    'sauvant',
-    'savor',
-    'sayin',
-    'scabiosa',
-    'scand',
-    'scheves',
-    'schlattli',
-    'schloendorff',
-    'schwimmer',
-    'scottis',
-    'scouter',
     'scrash',
-    'screeding',
-    'scriblerus',
-    'scrolly',
-    'scruffing',
-    'sea-grape',
-    'seasider',
-    'seaven',
-    'sebestyen',
-    'second-favourite',
-    'secre',
-    'seeck',
-    'seinduin',
-    'self-administering',
-    'self-portraiture',
-    'self-rating',
     'selve',
-    'semi-fossilised',
-    'semi-paralysed',
-    'senatus',
-    'sensationalized',
-    'serai',
-    'serg',
-    'sermonising',
-    'servicecare',
-    'servowarm',
-    'setted',
-    'severall',
-    'sgx',
-    'shamji',
-    'shape-changing',
-    'shape-shifting',
     'sharapour',
-    'shillong',
-    'shogunate',
-    'shola',
-    'shomron',
-    'shopsoiled',
-    'shopwatch',
-    'shoulder-strap',
-    'shroff',
-    'shtib',
-    'side-plate',
-    'sidelining',
-    'sigillata',
-    'silburn',
-    'silf',
-    'simpers',
     'sino-tibetan',
-    'sioli',
-    'siregar',
-    'siri',
-    'sixtysomething',
-    'skillbuilding',
-    'skywriting',
-    'sloaney',
-    'sloganised',
-    'sloosh',
-    'slow&rehy;moving',
-    'small-mesh',
-    'smokery',
-    'smooth-edged',
-    'smoothe',
-    'snaffles',
     'snaggled',
-    'snowshooting',
-    'sobek',
-    'soce',
-    'socialis',
-    'socialist-realist',
-    'sociologique',
-    'softeam',
-    'softhearted',
-    'solan',
-    'solanine',
-    'solartron',
-    'somak',
-    'somehting',
-    'sometin\'',
-    'sonix',
     'sophonpanich',
-    'souffles',
-    'soundcraft',
-    'soundwave',
-    'sounness',
-    'southcoast',
-    'sovam',
-    'sove',
-    'sp&eacute;ciale',
-    'spaceglazing',
-    'spatchcocked',
-    'speaker-',
-    'spellbinders',
-    'spinifex',
-    'spiritualised',
-    'spittin\'',
     'splinted',
-    'sportsfighting',
-    'sportslink',
-    'sportsworld',
-    'sprouches',
-    'spumed',
-    'stable-lad',
-    'stage-prop',
-    'stagging',
-    'stanzani',
-    'starching',
-    'stargate',
-    'steam-roller',
-    'steeg',
-    'steel-mill',
-    'steelworking',
     'stepp',
-    'steymann',
-    'stickit',
-    'stiff-armed',
-    'stilligarry',
-    'stiped',
-    'stone-chip',
-    'storcomp',
-    'street-by-street',
-    'strepsils',
-    'strobed',
-    'strong-box',
-    'strowan',
-    'stud-farm',
-    'stunning-looking',
-    'sub-basement',
     'sub-librarian',
-    'subgoalconds',
-    'suborning',
-    'succuss',
-    'suf',
-    'sulindac',
-    'summated',
-    'summink',
-    'sun-power',
-    'sun-worship',
-    'sunleigh',
-    'sunsplash',
-    'supercop',
-    'superfan',
-    'superglued',
-    'supernote-voice',
     'superspeed',
-    'surcharging',
-    'surfin\'',
-    'surtout',
-    'sutkus',
-    'swanne',
-    'swati',
-    'sweetwater',
-    'swingin\'',
-    'swoons',
-    'swotty',
-    'swyving',
-    'szot',
-    't-block',
-    't-piece',
-    't-unit',
     'tafer',
-    'tail-waving',
-    'taissy',
-    'takko',
-    'tallgrass',
-    'tam-tam',
-    'tangram',
-    'tap-dance',
-    'taring',
-    'tashi',
-    'tauris',
-    'tauziat',
-    'teamsport',
-    'teaze',
-    'technophone',
-    'tedding',
     'teddybears',
-    'telecanvassing',
-    'telecomunicazioni',
-    'telerecording',
-    'tellenorean',
-    'temple-mosque',
-    'tems',
-    'tendance',
-    'tenderised',
-    'tenoning',
-    'ternate',
-    'terne',
-    'tesam',
-    'test-driving',
-    'test-flight',
-    'tethyan',
     'tetrahydrofolate',
-    'text-type',
-    'texturising',
-    'th\'say',
-    'thackwell',
-    'thanew',
-    'that&mdash',
-    'theogony',
-    'thesauruses',
-    'thicknesse',
-    'thingamabob',
-    'thingi',
-    'thinke',
-    'tholoi',
-    'threated',
-    'threshergate',
     'throughswing',
-    'tifosi',
-    'tightlipped',
-    'time-inconsistency',
-    'time-recording',
-    'time-sequence',
-    'timesaver',
-    'tiptop',
-    'titmarsh',
-    'to\'t',
-    'to-date',
-    'todbringer',
-    'tollis',
-    'tonio',
-    'toothbrushing',
-    'tootin\'',
     'topstitch',
-    'torsen',
-    'tou',
-    'townhall',
-    'traiano',
-    'trainin\'',
-    'trainspotting',
-    'transair',
-    'transformists',
-    'transg&egrave;ne',
-    'transgressor',
-    'transiency',
-    'transinstitutionalization',
-    'transistor/diode',
-    'transit-type',
-    'transition-management',
     'transition-values',
-    'transition.',
-    'translantic',
-    'translation-related',
-    'transliterations',
-    'translocating',
-    'transluminal',
-    'transmediair',
-    'transmigrants',
-    'transminase',
-    'transmissive',
-    'transmittivity',
-    'transmodal',
-    'transnationalist',
-    'transnationality',
-    'transneuronal',
     'transpaseal',
-    'transpersonalized',
-    'transpirational',
-    'transplacentally',
-    'transplantations',
-    'transportion',
-    'transpression',
-    'transpyloric',
-    'transrapid',
-    'transtainers',
-    'transtec',
-    'transtensile',
-    'transubstantiated',
-    'transuranic',
-    'transverse-traceless',
-    'trap.',
     'trapezing',
-    'trappeur',
-    'trappiste',
-    'trappit',
-    'trapsetter',
-    'trashes',
-    'trassard',
-    'trastamara',
-    'tratment',
-    'trauffler',
-    'traumatise',
-    'trausnitz',
-    'travel-book',
-    'travel-sickness',
-    'travel-writer',
-    'travelator',
     'travelcards',
-    'travellin\'',
-    'travesano',
-    'travis.',
-    'traviss',
-    'traygo',
-    'treadgold',
-    'treadwheels',
-    'treasure-hunters',
-    'treasurer-general',
-    'treasurie',
-    'treasury-led',
-    'treasury-owned',
-    'treatability',
-    'treatment-as-usual',
-    'treaty-initialled',
     'trebilco',
-    'trebilcock',
-    'tredgold',
-    'tredington',
-    'tredway',
-    'tree-and-branch',
-    'tree-based',
-    'tree-blood',
-    'tree-branches',
-    'tree-dwelling',
-    'tree-filled',
-    'tree-growing',
-    'tree-growth',
-    'tree-holes',
-    'tree-lights',
-    'tree-shaped',
     'tree-shrouded',
-    'tree-strewn',
-    'treebridge',
-    'treelike',
-    'trees-r-us',
-    'treestump',
-    'trefil',
-    'tregarrick',
-    'tregian',
-    'tregoe',
-    'tregole',
-    'tregoz',
-    'trehalose',
-    'treherbert',
-    'treib-haus',
-    'trelawnyd',
     'trell',
-    'trellis-work',
-    'tremaston',
-    'trematon',
-    'tremblant',
-    'tremblingly',
-    'tremedous',
-    'tremoille',
-    'trench-systems',
-    'trenchcoats',
-    'trenchermen',
-    'trenchtown',
-    'trend-setter',
-    'trendelenburg',
-    'trentino-alto',
-    'trentmen',
     'treorky',
-    'tresch',
-    'tresillian',
-    'treskin',
-    'tresp',
-    'trespa',
-    'tret',
-    'tretocephalus',
-    'treuddyn',
-    'treve',
-    'trevelez',
-    'trevisa',
-    'trevors',
-    'trewick',
-    'trewsbury',
-    'trey',
     'treyens',
-    'treyer',
-    'tri-atomic',
-    'tri-axial',
-    'tri-cameral',
-    'tri-continental',
-    'tri-county',
-    'tri-glossic',
-    'tri-lingual',
-    'tri-personal',
-    'tri-x',
-    'trialed',
-    'triangled',
-    'triangularity',
-    'triangulating',
-    'triangulations',
     'triaxial',
-    'triazines',
-    'triazophos',
-    'tribadism',
-    'tribalistic',
-    'tribalists',
-    'triboluminescent',
-    'tribunale',
-    'tribute-bearers',
-    'trice-rolph',
-    'trichinae',
-    'trichologists',
-    'trichomes',
-    'tricity',
-    'trickey',
-    'trickily',
     'trickle-through',
-    'tricklings',
-    'trickly',
-    'tricksily',
-    'tricolors',
-    'tricontinental',
-    'tridactyla',
-    'tridom',
-    'tried.tested.trusted',
-    'triennes',
-    'triennially',
-    'trierarchy',
-    'triesman',
-    'trifasciata',
-    'trift',
-    'trigemini',
     'trigger&rehy;happy',
-    'triglav',
-    'trigonid',
-    'trigoniid',
-    'trik',
-    'trikonis',
-    'tril',
-    'trilby-hatted',
-    'trilcot',
-    'trilineata',
-    'trill.',
-    'trillion-worth',
-    'trilobatum',
-    'trimaculatum',
-    'trimarans',
-    'trimer',
     'trimethylamine',
-    'trinacria',
-    'trinitate',
-    'trinitrobenzene',
-    'trinitrobenzenesulphonic',
-    'trinketry',
-    'trinuclear',
-    'trip-hammers',
-    'tripartitum',
-    'tripehound',
-    'triphasic',
-    'triplaris',
-    'triple-combed',
-    'triple-fronted',
-    'tripod-cauldron',
-    'tripod-cauldrons',
     'tripodi',
-    'tripped-out',
-    'trippery',
-    'trippily',
-    'trirex',
-    'tris-edta',
-    'triscombe',
-    'trishaw',
-    'trist&acirc;o',
-    'tritan',
-    'tritantaikhmes',
-    'tritc',
-    'tritec',
-    'triterpenoids',
-    'tritest',
-    'triticales',
     'tritium/deuterium',
-    'trittyes',
-    'triumphalistic',
-    'triumphus',
-    'triunfal',
-    'triunity',
-    'trivialis',
-    'trk',
-    'trna-substrates',
-    'trnovski',
-    'trobriands',
-    'trobridge',
-    'trochaic',
-    'trochee',
-    'trochlea',
-    'trochlear',
     'trodding',
-    'trogen',
-    'troglio',
-    'troisgros',
-    'troitsky',
-    'troja',
-    'troll-like',
-    'trollac',
-    'trollish',
-    'trollopian',
-    'trolly',
-    'trondhjemitic',
-    'tronto',
-    'troolls',
-    'troop-carrier',
-    'troop-carrying',
     'troopie',
-    'troops-out',
-    'tropers',
-    'trophallaxis',
-    'trophozoites',
-    'tropicos',
-    'tropismes',
-    'tropistic',
-    'tropolone',
-    'tropsch',
-    'trotternish',
-    'trouble-and-strife',
-    'trouble-shooters',
-    'trouble-stirring',
-    'trouble-strewn',
-    'troueil',
     'trouncings',
-    'trouncy',
-    'trouser-pockets',
-    'trouser-slashing',
-    'trousershock',
-    'troutdale',
-    'trouts',
-    'trouvailles',
-    'trouvant',
-    'trouvoada',
-    'trowelful',
-    'trowse',
-    'trpe',
-    'trs.',
-    'truanted',
-    'truath',
     'trubetzkoy',
-    'trucently',
-    'truck-loads',
-    'truckful',
-    'truckmaker',
-    'trude',
-    'trudeau',
-    'trudgett',
-    'trudovik',
-    'true/',
-    'trueimage',
-    'truesteel',
-    'trukachevsky',
-    'trumbach',
-    'trumeau',
-    'trumka',
     'trumont',
-    'trumpet-blowing',
-    'trumpet-call',
-    'trumpet-like',
-    'trumpet-player',
-    'trumpety',
-    'truncates',
-    'trundleys',
-    'trunkfuls',
-    'trunnion',
-    'trusbut',
-    'trussed-up',
-    'trust-control',
-    'trust-me',
-    'trust-property',
-    'trustfulness',
     'trusthorpe',
-    'trustiest',
-    'trutch',
-    'truth&rehy;conditional',
-    'truth-predicates',
-    'truth/occurrence',
-    'truvoice',
-    'trwsgl',
-    'try-outs',
-    'try-scorers',
-    'trygg',
-    'tryouts',
-    'trypho',
-    'trypsin/edta',
-    'trypsinization',
-    'ts&eacute',
     'ts\'in',
-    'ts26',
-    'tsa250',
-    'tsadihim',
-    'tsangaris',
-    'tsangpo',
-    'tsatskeleh',
-    'tsavliris',
-    'tscc',
-    'tschaikowsky',
-    'tsd-1',
-    'tse-hsu',
-    'tselane',
-    'tsentralny',
-    'tserengiyn',
-    'tsetsen',
     'tsheehama',
-    'tshering',
-    'tshikalanga',
-    'tshombe',
-    'tsim',
-    'tsmchange',
-    'tsn',
-    'tsoungui',
-    'tsovolas',
-    'tsuneo',
-    'tsvangirai',
-    'tsy',
-    'tt&dollar;5,484',
-    'tt&dollar;794,200,000',
-    'tta6',
-    'ttl',
     'ttm',
-    'ttns',
-    'ttx-treated',
-    'tu\'i',
-    'tu-bong',
-    'tuamotu',
-    'tub-like',
-    'tub-shaped',
-    'tubb',
-    'tube-making',
-    'tubeless',
-    'tubeman',
-    'tuberoses&mdash;five',
-    'tuberosities',
-    'tubeworkers',
-    'tubingen',
     'tubogram',
-    'tuborg',
-    'tubridy',
-    'tubuais',
-    'tubulovesicles',
-    'tuc/labour',
-    'tuchler',
-    'tuchyna',
-    'tuck-in',
-    'tucked-away',
-    'tuckered',
-    'tuckshop',
-    'tuckswood',
-    'tucsan',
-    'tucupita',
-    'tudor-gothic',
     'tudor-walters',
-    'tudwick',
-    'tue&ndash;thurs',
-    'tues-thur',
-    'tues.',
-    'tuesd',
-    'tuesday/wednesday',
-    'tuffaceous',
-    'tuffnel',
-    'tuffnels',
-    'tufnel',
-    'tufo',
-    'tugboats',
-    'tuggings',
-    'tuggs',
-    'tuggses',
     'tuguegarao',
-    'tulas',
-    'tulbah',
-    'tulipwood',
-    'tulk',
-    'tullah',
-    'tullett',
-    'tullibody',
-    'tulp',
-    'tumbledryer',
-    'tummle',
-    'tummon',
-    'tumour-induced',
-    'tumourler',
-    'tumps',
-    'tumtum',
     'tumultous',
-    'tumultuously',
-    'tunaboat',
-    'tunafish',
-    'tunas',
-    'tuncer',
-    'tundish',
-    'tuned-in',
-    'tungstens',
-    'tunguska-like',
-    'tunneller',
-    'tunnicliffe-wilson',
-    'tunstall-pedoe',
-    'tunzelmann',
-    'tuplin',
-    'tuppence-coloured',
     'tuppence-worth',
-    'turabi',
-    'turangal&icirc;la-symphonie',
-    'turbas',
-    'turbidometric',
-    'turbo-frodo',
-    'turbo-generators',
-    'turboimage',
-    'turboloft',
-    'turbulently',
-    'turbull',
-    'turcomans',
-    'turdakun',
-    'turer',
-    'turf-roofed',
-    'turf.',
     'turina',
-    'turions',
-    'turista',
-    'turk-is',
-    'turkeee',
-    'turker',
-    'turkewitz',
-    'turkey-flavoured',
-    'turkey-iraq',
-    'turkeying',
-    'turkish-controlled',
-    'turkish-held',
-    'turkish-speakers',
-    'turkish-style',
-    'turkle',
-    'turleys',
     'turn-and-slip',
-    'turn-rounds',
-    'turn-tables',
-    'turnabouts',
-    'turndown',
-    'turner/stress',
-    'turnfurlong',
-    'turnhout',
-    'turnip-like',
-    'turnley',
-    'turns-of-phrase',
-    'turonian',
-    'turrel',
-    'turrialba',
-    'turrill',
-    'turrr',
     'tuscon',
-    'tusker',
-    'tuskless',
-    'tutenkhamen',
-    'tutor-student',
-    'tutor/student',
-    'tutorship',
-    'tutsi-dominated',
-    'tutsoane',
-    'tutti-frutti',
-    'tutty-bye',
-    'tutweiller',
-    'tutworkers',
-    'tuwaitha',
-    'tuxedo-clad',
-    'tuymans',
     'tv&mdash;radio',
-    'tv-less',
-    'tv-scanned',
-    'tv-screen',
-    'tv.',
-    'tv/radio',
-    'tvoeu',
-    'tvrdohlavi',
-    'tw-9000',
-    'tweed-covered',
-    'tweedly-deedly',
-    'tweedmouth',
-    'tweel',
-    'tweetie',
-    'twelve\'s',
-    'twelve-and-six',
     'twelve-cylinder',
-    'twelve-gauge',
-    'twelve-line',
-    'twelve-month-old',
-    'twelve-step',
-    'twelve-ten',
-    'twelve-tone',
-    'twemlow',
-    'twente',
-    'twenties.',
-    'twentieth&rehy;century',
-    'twentieth-centuries',
-    'twentieths',
-    'twenty-acre',
-    'twenty-country',
-    'twenty-five-minute',
     'twenty-fives',
-    'twenty-fold',
-    'twenty-four-hour-a-day',
-    'twenty-four-page',
-    'twenty-kilogram',
-    'twenty-one-gun',
-    'twenty-one-year-olds',
-    'twenty-room',
-    'twenty-six-year',
-    'twenty-storey',
-    'twenty-strong',
-    'twenty-twenty',
-    'twenty-twenty-five',
-    'twenty-two-year',
-    'twenty-yard',
-    'twenty-year-olds',
     'twentyish',
-    'twentytwo',
-    'twice-a-year',
-    'twice-monthly',
-    'twice-nightly',
-    'twice-postponed',
-    'twiggys',
-    'twin-cars',
-    'twin-cylinder',
-    'twin-pack',
-    'twin-sided',
-    'twin-town',
-    'twin-turbo',
-    'twiname',
-    'twinfix',
-    'twistles',
     'twistleton',
-    'twitchen',
-    'twitterings',
-    'twitting',
-    'twll',
-    'two&mdash;year',
-    'two&rehy;and-a-half',
-    'two&rehy;tone',
-    'two-and-a-half-miles',
-    'two-and-a-half-year-old',
-    'two-and-nine',
-    'two-and-two',
-    'two-arched',
-    'two-at-a-time',
-    'two-backed',
-    'two-banded',
     'two-bathroom',
-    'two-bed',
-    'two-berth',
-    'two-board',
-    'two-bob',
-    'two-can',
-    'two-career',
-    'two-carriage',
-    'two-choice',
-    'two-coloured',
-    'two-consonant',
-    'two-cornered',
-    'two-division',
-    'two-electrode',
-    'two-field',
-    'two-fifteen',
     'two-five',
-    'two-for-five',
-    'two-for-the-price-of-one',
-    'two-form',
-    'two-four',
-    'two-hole',
-    'two-hundred-and-fifty-pound',
-    'two-hundred-yard',
-    'two-inch-thick',
-    'two-judge',
-    'two-link',
-    'two-love',
-    'two-marks',
-    'two-on-one-off',
-    'two-over-two',
-    'two-period',
     'two-pieces',
-    'two-pin',
-    'two-player-only',
-    'two-press',
-    'two-record',
-    'two-say',
-    'two-score',
-    'two-season',
-    'two-slot',
-    'two-stack',
-    'two-stone',
-    'two-subject',
-    'two-third',
-    'two-thousandths',
-    'two-timer',
-    'two-to-three',
     'two-towered',
-    'two-trades',
-    'two-trolley',
-    'two-twenty-five',
-    'two-up-two-down',
-    'two-valued',
-    'two-worlds',
-    'two.way',
-    'twohig',
-    'twoplayer',
-    'twoth',
-    'twothirds',
-    'twr-y-felin',
-    'twynholm',
-    'tx.1',
-    'tx.10',
     'txb2',
-    'txii',
-    'txiki',
-    'tydd',
-    'tyes',
-    'tyla',
-    'tyndalls',
-    'tynebridge',
-    'tyo',
-    'typaldos',
-    'type&mdash;module.log',
-    'type-cases',
-    'type-founders',
-    'type-written',
-    'type/pos',
-    'type/token',
     'typestar',
-    'typetalk',
-    'typha',
-    'typica',
-    'typin\'',
-    'typologically',
-    'tyr416',
-    'tyr527',
-    'tyr53',
-    'tyr551',
-    'tyrannidae',
-    'tyrannos',
-    'tyrconnell',
-    'tyre-fuelled',
-    'tyred',
-    'tyreless',
     'tyrells',
-    'tyrosines',
-    'tysilio',
-    'tystie',
-    'tythrop',
-    'tz',
-    'tzaban',
-    'tzand',
-    'tzanibey',
-    'tzomet',
-    'tzuke',
-    'tzur',
-    'u&bsol;1',
-    'u&ccedil;agiz',
-    'u\'-shaped',
-    'u-12',
     'u-25',
-    'u-day',
-    'u-dominated',
-    'u-ni-ted',
-    'u-rich',
-    'u-rod',
-    'u-u',
-    'u.47',
-    'u.8s',
-    'u.b.c.',
-    'u.e.c.',
-    'u.f.c.',
-    'u.p',
-    'u.s.g.a.',
-    'u.s.m.',
-    'u.v.i.',
     'u/10',
-    'u/12',
-    'u/15',
-    'u1*',
-    'u144',
-    'u18\'s',
-    'u180',
-    'u18s',
-    'u19',
-    'u2ish',
-    'u48',
-    'u6000/65',
-    'u6000/85',
-    'u63',
-    'u8',
-    'u=',
     'uai',
-    'uamha',
-    'uan',
-    'uanc',
-    'ub3',
-    'ub4',
-    'ubatuba',
-    'ubhal',
-    'ubhejane',
-    'ubinig',
-    'ubiquitin',
-    'ubriaco',
-    'ucdc',
-    'uced&eacute',
-    'uch/middlesex',
-    'ucky',
     'uclap',
-    'ucx',
-    'udairn',
-    'udden-wentworth',
-    'ude',
-    'udeac',
-    'udey',
-    'udg-supported',
-    'udlaidh',
-    'udn',
-    'uematsu',
-    'uetliberg',
-    'uexk&uuml;ll',
-    'uezd-level',
-    'ufegeat',
-    'ufend',
     'uffenbach',
-    'ufland',
-    'ufp',
-    'ugb',
-    'ugc/ufc',
-    'ugi',
-    'ugni',
-    'ugoleto',
-    'uh&ndash;1b',
-    'uh-uh-uh-uh-uh',
-    'uhf-1',
-    'uhland',
-    'uhlans',
-    'uht',
-    'ui-gyun',
-    'uilleann',
     'uim',
-    'uk-appointed',
-    'uk-built',
-    'uk-ireland',
-    'uk-italian',
-    'uk-registered',
-    'uk-us',
-    'uk/ec',
-    'uk/ireland',
-    'uk/us',
-    'uk201',
-    'uka/l',
-    'ukcccr',
-    'ukcmg',
-    'ukky',
-    'ukrainian-born',
     'ukrainski',
-    'uks',
-    'ulcerogenic',
-    'ulcerous',
-    'ulcha',
-    'ulci',
-    'ulema-i-islam',
-    'ulfberht',
-    'ulick',
-    'uliginosum',
-    'ulis',
-    'ulke',
-    'ulles',
-    'ullsten',
-    'uloruaha',
-    'ulp',
     'ulpan',
-    'ulrico',
-    'uls',
-    'ulster-scots',
-    'ulti',
-    'ultra-belligerent',
-    'ultra-careful',
-    'ultra-compact',
-    'ultra-curly',
-    'ultra-effective',
-    'ultra-feminine',
-    'ultra-high-vacuum',
-    'ultra-large',
-    'ultra-liberal',
-    'ultra-nationalistic',
-    'ultra-nationalists',
     'ultra-patriotism',
-    'ultra-powerful',
-    'ultra-precise',
-    'ultra-prestigious',
-    'ultra-reliable',
-    'ultra-religious',
-    'ultra-runner',
-    'ultra-short',
-    'ultra-silence',
-    'ultra-slim',
-    'ultra-vivid',
-    'ultramafic',
-    'ultramarines',
-    'ultramarinos',
-    'ultrasonication',
-    'ultrastructurally',
     'ultraviolet-coloured',
-    'ultus',
-    'ululate',
-    'ulundi',
-    'ulusow',
-    'ulvaceus',
-    'ulvaeus',
-    'ulwazi',
-    'ulyanovsk',
-    'ulzana',
-    'um673a',
-    'um673b',
-    'umayr',
-    'umayyah',
-    'umberg',
-    'umbilically',
     'umbretti',
-    'umd',
-    'umeed',
-    'umetaliyev',
-    'umkulunkulu',
-    'umm-ing',
-    'ummayads',
-    'ummm',
-    'umol/kg/24',
-    'umpirage',
-    'umptieth',
-    'umslopagaas',
-    'un+1rn',
-    'un-adapted',
-    'un-being',
-    'un-chartered',
     'un-divert',
-    'un-funded',
-    'un-group',
-    'un-harmful',
-    'un-man',
-    'un-mandated',
-    'un-organisation',
-    'un-policed',
-    'un-proofed',
-    'un-registered',
-    'un-right-on',
-    'un-roman',
-    'un-style',
-    'un-understood',
-    'un-united',
-    'un-used',
     'un/edifact',
-    'unabbreviated',
-    'unacceptable.',
-    'unactivated',
-    'unade',
-    'unadvisable',
-    'unaffectionately',
-    'unaggressively',
-    'unaimed',
-    'unaired',
-    'unalloted',
-    'unalluring',
-    'unambitiously',
-    'unambivalent',
-    'unamendable',
-    'unamiability',
     'unanaesthetized',
-    'unappealable',
-    'unapprehended',
-    'unapproachability',
-    'unappropriated',
-    'unaroused',
-    'unartistic',
-    'unascribed',
-    'unassailability',
-    'unassembled',
-    'unassuaged',
-    'unathletic',
-    'unattempted',
-    'unawakened',
-    'unbadged',
-    'unbaptized',
     'unbarring',
-    'unbathed',
-    'unbearded',
-    'unbeatably',
-    'unbeautiful',
-    'unbenched',
-    'unbiddable',
-    'unbilled',
-    'unbinding',
-    'unbirdlike',
-    'unblooded',
-    'unbloody',
-    'unblown',
-    'unboiled',
-    'unbokeled',
-    'unbombed',
     'unboundedly',
-    'unboundedness',
-    'unbraced',
-    'unbudgeable',
-    'unbudgeably',
-    'unbudgeted',
-    'unburdensome',
-    'unbureaucratic',
-    'unbuttons',
-    'uncalculating',
-    'uncaringly',
-    'uncased',
-    'uncategorised',
-    'uncatered-for',
-    'uncd',
-    'unce',
     'unceremonial',
-    'unchancy',
-    'unchanged.',
-    'unchangingly',
-    'unchangingness',
-    'unchartable',
-    'unchronological',
-    'unchurch',
-    'uncinematic',
-    'unckel',
-    'uncleanable',
-    'uncleannesses',
-    'uncleansed',
-    'unclear-the',
-    'unclear.',
-    'unclog',
     'unclosed',
-    'unclubbable',
-    'unclustered',
-    'uncoerced',
-    'uncollimated',
-    'uncolonized',
-    'uncombined',
-    'uncomic',
-    'uncompanionable',
-    'uncompassionate',
-    'uncomplicatedly',
-    'uncompress',
-    'unconceived',
-    'unconcentrated',
-    'unconcluded',
-    'unconditional.',
     'unconfessed',
-    'unconfidently',
-    'unconflicted',
-    'unconfronted',
-    'unconscionability',
-    'unconsulted',
-    'uncontactable',
-    'uncontentiously',
-    'uncontracted',
-    'unconvertible',
-    'uncooled',
-    'uncopyrightable',
-    'uncorseted',
-    'uncountably',
-    'uncovenanted',
-    'uncrewed',
     'uncrumpled',
-    'uncrushable',
-    'uncurbed',
-    'uncynical',
-    'undazzled',
-    'undecodable',
-    'undented',
-    'undeployed',
-    'under&rehy;estimated',
-    'under&rehy;lined',
-    'under-&dollar;5,000',
-    'under-13\'s',
-    'under-211',
-    'under-22',
-    'under-24',
-    'under-65s',
     'under-7s',
-    'under-absorbed',
-    'under-assessment',
-    'under-bailiffs',
-    'under-count',
-    'under-cover',
-    'under-cutting',
-    'under-declaration',
-    'under-determination',
-    'under-doctored',
-    'under-dog',
-    'under-eating',
-    'under-eighteens',
-    'under-enumeration',
-    'under-housemaids',
-    'under-informed',
     'under-invested',
-    'under-let',
-    'under-lying',
-    'under-managers',
-    'under-mechanisation',
-    'under-mined',
-    'under-occupation',
-    'under-officer',
-    'under-officers',
-    'under-paid',
-    'under-rate',
-    'under-reports',
-    'under-seventeen',
-    'under-siege',
-    'under-skilled',
-    'under-steward',
     'under-tenants',
-    'under-tens',
-    'under-the-table',
-    'under-utilization',
-    'under-water',
-    'under-way',
-    'under-write',
-    'underactive',
-    'undercapacity',
-    'undercharged',
-    'underclasses',
-    'undercloth',
-    'undercoated',
-    'underdetermination',
-    'underdiagnosed',
-    'underdrainage',
     'underdrawings',
-    'undereducated',
-    'underemphasised',
-    'underequipped',
-    'underexploited',
-    'underexplored',
-    'underexposed',
-    'underfilled',
-    'underflesh',
-    'underfurnished',
-    'undergirds',
-    'undergolfed',
-    'undergown',
-    'undergrowths',
-    'underheated',
-    'underlandlord',
     'underlayer',
-    'underlayers',
-    'underlays',
-    'underlessee',
-    'underlessees',
-    'underley',
-    'underlinings',
-    'undermaintained',
-    'underparts.',
-    'underplated',
-    'underprivilege',
-    'underprovided',
-    'undersexed',
-    'undershoots',
-    'underskilled',
-    'underskirts',
     'underskull',
-    'understatedly',
-    'understimulating',
-    'understimulation',
-    'understretched',
-    'undersupplied',
-    'undersupported',
-    'underswell',
-    'undertaste',
-    'underthings',
-    'undervest',
-    'underwound',
-    'undesirous',
-    'undestroyed',
-    'undetailed',
-    'undirectional',
     'undisbursed',
-    'undiscounted',
-    'undiscouraged',
-    'undiscussability',
-    'undisguisedly',
-    'undisposed',
-    'undisputedly',
-    'undistinguished-looking',
-    'undistressed',
-    'undoctored',
-    'undoers',
-    'undong',
-    'undrainable',
-    'undramatically',
-    'undried',
-    'undrivable',
     'undriveable',
-    'undrunk',
-    'undulata',
-    'undulators',
-    'undutiful',
-    'unecessarily',
-    'uneclipsed',
-    'unedifyingly',
-    'unegoistic',
-    'unelaborated',
-    'unembarrassedly',
-    'unemploye-ed',
-    'unenamoured',
-    'unencroached',
-    'unenforceability',
-    'unenfranchised',
     'unenhanced',
-    'unenriched',
-    'unenvious',
-    'uner',
-    'unerotic',
-    'unessential',
-    'unesterified',
-    'unevangelised',
-    'unevennesses',
-    'unexacting',
-    'unexcelled',
-    'unexhibited',
-    'unfaced',
-    'unfairest',
-    'unfashionability',
-    'unfastidious',
     'unfatherly',
-    'unfathom',
-    'unfavorable',
-    'unfertile',
-    'unfigured',
-    'unfillable',
-    'unfilleted',
-    'unfilmable',
-    'unfindable',
-    'unfinishable',
-    'unfish',
-    'unfitt',
-    'unflaggingly',
-    'unflappably',
-    'unflexed',
-    'unformalised',
     'unfreezes',
-    'unfrivolous',
-    'unfrocked',
-    'unfucked',
-    'unfunding',
-    'unfunniest',
-    'unfussily',
-    'ungallantry',
-    'ungarnished',
-    'ungaro.',
-    'ungentle',
-    'ungerade',
-    'ungirt',
-    'unglamourous',
-    'ungraciousness',
-    'ungraded',
     'ungraph',
-    'ungratified',
-    'ungreenly',
-    'ungridded',
-    'unguent',
-    'unguitractor',
-    'unhallowed',
-    'unhandily',
-    'unhandsome',
-    'unharassed',
-    'unhealthful',
-    'unhealthiness',
-    'unhealthy-looking',
-    'unhistoric',
-    'unhitching',
-    'unhooded',
     'unhopeful',
-    'unhumorous',
-    'unhygienically',
-    'uni-variant',
-    'uniced',
-    'unicyclists',
-    'unid',
-    'unidas',
-    'unidentical',
-    'unidirectionally',
-    'unie-mrg',
-    'uniflora',
-    'uniformally',
-    'uniformities',
-    'uniglumis',
-    'unilink',
     'unillustrated',
-    'unimprovable',
-    'unimpugnable',
-    'uninspiringly',
-    'uninstructed',
-    'unintellectual',
-    'unintroduced',
-    'uninvented',
-    'union*',
-    'union-african',
-    'union-based',
-    'union-bashing',
-    'union-busting',
-    'union-czechoslovak',
-    'union-dominated',
-    'union-independent',
     'union/christian',
-    'union/labour',
-    'unione',
-    'unions.',
-    'unioplus',
-    'uniplus',
-    'unirradiated',
-    'unish',
-    'unisist',
-    'unisoculous',
-    'unisql/4ge',
-    'unistar',
-    'unit&agrave',
-    'unit-of-work',
-    'unit/credit',
-    'unitar',
     'unitarist',
-    'united/15th',
-    'united3',
-    'units/',
-    'units/hectare',
-    'units/mg',
-    'universal-banking',
-    'universale',
-    'universalisation',
-    'universalises',
-    'universalizable',
-    'universitario',
-    'universiteit',
-    'universiti',
-    'university/',
-    'university/polytechnic',
     'uniworks',
-    'unix-related',
-    'unix-with-everything',
-    'unix/386',
-    'unix/xenix',
-    'unixalike',
-    'unixpress',
-    'unjam',
-    'unjapanese',
-    'unjustness',
-    'unkn',
-    'unknot',
-    'unknowledgeable',
-    'unkovskii',
-    'unlandable',
-    'unlashing',
     'unlaunched',
-    'unld',
-    'unlent',
-    'unlesse',
-    'unlevelled',
-    'unliberated',
-    'unliked',
-    'unlinkable',
-    'unlipsticked',
-    'unlittered',
-    'unlivable',
-    'unloosened',
-    'unmagical',
-    'unmalted',
-    'unmanageably',
-    'unmanoeuvrable',
     'unmarkedness',
-    'unmarketable',
-    'unmasker',
-    'unmatching',
-    'unmaternal',
-    'unmatured',
-    'unmenacing',
-    'unmineralised',
-    'unminuted',
-    'unmixable',
-    'unmodulated',
-    'unmoral',
-    'unmoulded',
-    'unmovable',
-    'unmutated',
-    'unmyelinated',
     'unneccesary',
-    'unnerstan',
-    'unnest',
-    'unnested',
-    'unnikrishnan',
-    'unnoticeably',
-    'unobjective',
-    'unobliging',
-    'unoffered',
-    'unordained',
-    'unornamented',
-    'unoxygenated',
-    'unpacified',
-    'unpadlocked',
-    'unpalatably',
-    'unparodiable',
     'unpasted',
-    'unpayable',
-    'unpeaceful',
-    'unplaceable',
-    'unplastered',
-    'unplated',
-    'unpleasant-looking',
-    'unpleasantries',
-    'unpleated',
-    'unpledged',
-    'unpolish',
-    'unpolluting',
-    'unpompous',
-    'unpossessiveness',
-    'unpredict&rehy;able',
-    'unprofound',
     'unpromisingly',
-    'unpromoted',
-    'unpropped',
-    'unprotectable',
-    'unprotection',
-    'unprotestingly',
-    'unpubl',
-    'unpunctured',
-    'unpurged',
-    'unpursued',
-    'unquenchably',
-    'unradiogenic',
-    'unranked',
-    'unratified',
-    'unraveller',
-    'unravished',
     'unreadability',
-    'unreadably',
-    'unrealted',
-    'unrearranged',
-    'unreasonably.',
-    'unrebellious',
-    'unrebuilt',
-    'unreciprocated',
-    'unrecognition',
-    'unrecompiled',
-    'unreconcilable',
-    'unredressed',
-    'unrefereed',
-    'unreflectingly',
-    'unrefurbished',
-    'unreluctant',
     'unremedied',
-    'unremovable',
-    'unrepairable',
-    'unreplaced',
-    'unresented',
-    'unresourceful',
-    'unrestful',
-    'unrests',
-    'unretarded',
-    'unrevisable',
-    'unrewardingly',
-    'unrg',
-    'unrhymed',
-    'unridden',
-    'unrippled',
-    'unroasted',
     'unruled',
-    'unrumpled',
-    'unrunnable',
-    'unruptured',
-    'unrushed',
-    'unsafely',
-    'unsaveable',
-    'unscenic',
-    'unsclerotized',
-    'unscr',
-    'unscratched',
-    'unscrupulousness',
-    'unsearched',
-    'unseductively',
-    'unsegmented',
-    'unself-consciously',
     'unselfconfident',
-    'unserviceability',
-    'unshapely',
-    'unsheath',
-    'unshriven',
-    'unsignalized',
-    'unsignposted',
-    'unsilenced',
-    'unsipped',
-    'unsized',
-    'unsleeping',
-    'unsnapped',
-    'unsoaked',
-    'unsocialised',
-    'unsoiled',
-    'unspilt',
     'unspiritual',
-    'unspooling',
-    'unstably',
-    'unstallable',
-    'unstalled',
-    'unstarted',
-    'unstatable',
-    'unstatemented',
-    'unstead-joss',
-    'unstemmed',
-    'unstepped',
-    'unstick',
-    'unstocked',
-    'unstoppability',
-    'unstopped',
-    'unstriped',
     'unstylish',
-    'unsual',
-    'unsubjugated',
-    'unsubmitted',
-    'unsubscribed',
-    'unsupplied',
-    'unsureness',
-    'unsurveyed',
-    'unsustained',
-    'unswitched',
-    'unsynchronized',
-    'untamable',
-    'untarnishable',
-    'untaxable',
-    'untectonised',
-    'untell',
     'untender',
-    'untenured',
-    'unterhaltung',
-    'unterminated',
-    'unteroffizier',
-    'unterwasser',
-    'untestability',
-    'unthanked',
-    'unthought-of',
-    'unthreshed',
-    'unthrifty',
-    'unti1',
-    'untidier',
-    'untidiest',
-    'until13',
-    'untimeliness',
     'untired',
-    'untouristy',
-    'untracked',
-    'untrendy',
-    'untrodden',
-    'untung',
-    'ununited',
-    'unuttered',
-    'unvaryingly',
-    'unvegetated',
-    'unvestibuled',
-    'unvetted',
-    'unwarlike',
-    'unwarrantably',
-    'unwarrantedly',
-    'unwearied',
     'unwedded',
-    'unwesternised',
-    'unwfp',
-    'unwholesomely',
-    'unwin/cotswold',
-    'unworkable.',
-    'unworthwhile',
-    'unyieldingly',
-    'uogl',
-    'uovo',
-    'up-gradable',
-    'up-i',
-    'up-lighters',
-    'up-pipe',
-    'up-rated',
-    'up-scale',
     'up-scroller',
-    'up-time',
-    'up-to-dateness',
-    'up-to-the',
-    'up.there',
-    'up/h',
-    'up4800/605',
-    'up4800/625',
-    'up4800/630',
-    'up4800/635',
-    'up_at',
-    'upadaya',
-    'upadhaya',
-    'upadhya',
-    'upang',
-    'updates/supplements',
     'updraughts',
-    'upgraders',
-    'upharsin',
-    'uphoff',
-    'upholsters',
-    'upington',
-    'uplanders',
-    'upper&rehy;middle-class',
-    'upper-caste',
-    'upper-classes',
-    'upper-cuts',
-    'upper-deck',
-    'upper-school',
-    'upper-spire',
-    'upperclass',
-    'upperside',
     'upperworks',
-    'upregulating',
-    'ups-on-a-card',
-    'upsala',
-    'upsale',
-    'upshifts',
-    'upsize',
-    'upstream-downstream',
-    'upthorpe',
-    'upthrown',
-    'upthrusting',
-    'upupidae',
-    'upvaluations',
-    'upward-facing',
-    'upward-flow',
-    'upward-moving',
     'upward-towards',
-    'upwarped',
-    'upx',
-    'uraguay',
-    'uralium',
-    'uranium-enriching',
-    'urata',
-    'urb',
-    'urbanizer',
-    'urd-pct',
-    'urea-polyacrylamide',
-    'urea/page',
-    'uredale',
-    'urethanes',
-    'urey-miller',
-    'uriarte',
     'urinas',
-    'urine-scented',
-    'urk',
-    'urnasch',
-    'urnes',
-    'uro&scaron',
-    'uro-genital',
-    'urocyanylcholine',
-    'urodynamics',
-    'urola',
-    'urophasianus',
-    'urp',
-    'ursio',
-    'urticae',
-    'urticarial',
-    'urueu-wau-wau',
     'urus',
-    'us&dollar/month',
-    'us&dollar;1,010',
-    'us&dollar;1,020',
-    'us&dollar;1,030',
-    'us&dollar;1,140',
-    'us&dollar;1,150',
-    'us&dollar;1,190',
-    'us&dollar;1,200,000',
-    'us&dollar;1,360',
-    'us&dollar;1,370',
-    'us&dollar;1,410',
-    'us&dollar;1,460',
-    'us&dollar;1,540',
-    'us&dollar;1,650',
-    'us&dollar;1,850',
     'us&dollar;1,940',
-    'us&dollar;1.00=12',
-    'us&dollar;1.00=13,217',
-    'us&dollar;1.00=14,199.4',
-    'us&dollar;1.00=2.6638',
-    'us&dollar;1.00=35',
-    'us&dollar;1.00=4.7367',
-    'us&dollar;1.00=5.00',
-    'us&dollar;1.00=5.2819',
-    'us&dollar;1.00=5.3241',
-    'us&dollar;1.00=799.087',
-    'us&dollar;1.00=91.0709',
-    'us&dollar;1.00=a&dollar;1.2866',
-    'us&dollar;1.00=a&dollar;1.3067',
-    'us&dollar;1.00=b&dollar;1.00',
-    'us&dollar;1.00=can.',
     'us&dollar;1.00=f5.9645',
-    'us&dollar;1.00=f6.1702',
-    'us&dollar;1.00=l1,225.3012',
-    'us&dollar;1.00=md7.8638',
-    'us&dollar;1.00=nz&dollar;1.6339',
-    'us&dollar;1.00=r2.5459',
-    'us&dollar;1.00=r2.6638',
-    'us&dollar;1.00=sfr1.4176',
-    'us&dollar;1.00=sfr1.565',
-    'us&dollar;1.5',
-    'us&dollar;10,500',
-    'us&dollar;105',
-    'us&dollar;107,000,000',
-    'us&dollar;11',
-    'us&dollar;11,600',
-    'us&dollar;11,700',
     'us&dollar;113,000,000',
-    'us&dollar;119',
-    'us&dollar;12',
-    'us&dollar;12,800',
-    'us&dollar;120,900,000',
-    'us&dollar;125',
-    'us&dollar;126,000,000',
-    'us&dollar;13',
-    'us&dollar;13,000,000',
-    'us&dollar;136,000,000',
-    'us&dollar;14',
-    'us&dollar;14,750,000',
-    'us&dollar;140',
-    'us&dollar;142,000,000',
-    'us&dollar;15.8',
-    'us&dollar;153,000,000',
     'us&dollar;16,000,000',
-    'us&dollar;164,000,000',
-    'us&dollar;167',
-    'us&dollar;17',
-    'us&dollar;17,200',
-    'us&dollar;17,600',
-    'us&dollar;170,000,000',
-    'us&dollar;178,000,000',
-    'us&dollar;18,000',
-    'us&dollar;19',
-    'us&dollar;19,900',
-    'us&dollar;19.5',
-    'us&dollar;199',
-    'us&dollar;1=5,000',
-    'us&dollar;2,006',
-    'us&dollar;2,150',
     'us&dollar;2,200,000',
-    'us&dollar;2,240',
-    'us&dollar;2,400,000',
-    'us&dollar;2,540',
-    'us&dollar;2,650',
-    'us&dollar;2,750',
-    'us&dollar;2,800,000',
-    'us&dollar;2,948',
-    'us&dollar;2,980',
-    'us&dollar;20,600',
-    'us&dollar;21,000,000',
-    'us&dollar;210',
-    'us&dollar;212',
-    'us&dollar;214,000,000',
-    'us&dollar;215',
-    'us&dollar;220,000,000',
     'us&dollar;23',
-    'us&dollar;23,000',
-    'us&dollar;23,300,000',
-    'us&dollar;235',
-    'us&dollar;24',
-    'us&dollar;24,500',
-    'us&dollar;243',
-    'us&dollar;245',
-    'us&dollar;245,000,000',
-    'us&dollar;259,000,000',
-    'us&dollar;260,000,000',
-    'us&dollar;264,000,000',
-    'us&dollar;270',
-    'us&dollar;282,000,000',
-    'us&dollar;295',
-    'us&dollar;299',
     'us&dollar;3,100',
-    'us&dollar;3,200,000',
-    'us&dollar;3,240',
-    'us&dollar;3,350',
-    'us&dollar;3,360',
-    'us&dollar;3,400',
-    'us&dollar;3,520',
-    'us&dollar;3.8',
-    'us&dollar;31,000',
-    'us&dollar;310',
-    'us&dollar;315',
-    'us&dollar;32',
-    'us&dollar;33,000,000',
-    'us&dollar;330',
-    'us&dollar;330,000',
-    'us&dollar;34,000,000',
     'us&dollar;345,000,000',
-    'us&dollar;35,900,000',
-    'us&dollar;36,000',
-    'us&dollar;37,900,000',
-    'us&dollar;370',
-    'us&dollar;373,000,000',
-    'us&dollar;377,000,000',
-    'us&dollar;38',
-    'us&dollar;38,000,000',
-    'us&dollar;380',
-    'us&dollar;39,000',
-    'us&dollar;390',
-    'us&dollar;395,000,000',
-    'us&dollar;399',
-    'us&dollar;4,500,000',
-    'us&dollar;4,600',
     'us&dollar;4,640',
-    'us&dollar;4,700',
-    'us&dollar;4,980',
-    'us&dollar;41,000',
-    'us&dollar;410',
-    'us&dollar;42,000',
-    'us&dollar;42,000,000',
-    'us&dollar;42,500,000',
-    'us&dollar;43,500,000',
-    'us&dollar;436,000,000',
-    'us&dollar;45',
-    'us&dollar;464,000,000',
-    'us&dollar;470,000,000',
-    'us&dollar;49',
-    'us&dollar;5,200',
-    'us&dollar;5,300,000',
     'us&dollar;5,400',
-    'us&dollar;5,600',
-    'us&dollar;5,700',
-    'us&dollar;520',
-    'us&dollar;540,000,000',
-    'us&dollar;58,000,000',
-    'us&dollar;583,000,000',
-    'us&dollar;6',
-    'us&dollar;6,300',
-    'us&dollar;6,300,000',
-    'us&dollar;6,900',
-    'us&dollar;600,000,000',
-    'us&dollar;610',
-    'us&dollar;62,000',
-    'us&dollar;621,000,000',
-    'us&dollar;625',
     'us&dollar;63',
-    'us&dollar;64,000,000',
-    'us&dollar;65,000',
-    'us&dollar;65,000,000',
-    'us&dollar;650,000,000',
-    'us&dollar;670',
-    'us&dollar;670,000,000',
-    'us&dollar;68,000',
-    'us&dollar;69',
-    'us&dollar;7',
-    'us&dollar;7,400',
-    'us&dollar;7,500',
-    'us&dollar;7,800',
-    'us&dollar;7,900,000',
-    'us&dollar;730',
-    'us&dollar;74,000,000',
     'us&dollar;740,000,000',
-    'us&dollar;750',
-    'us&dollar;77,000',
-    'us&dollar;8,300',
-    'us&dollar;8,500,000',
-    'us&dollar;8,700',
-    'us&dollar;800,000',
-    'us&dollar;800,000,000',
-    'us&dollar;81,000,000',
-    'us&dollar;810',
-    'us&dollar;825',
-    'us&dollar;840,000,000',
-    'us&dollar;85,900',
-    'us&dollar;86,000',
-    'us&dollar;86,500',
-    'us&dollar;87,000,000',
     'us&dollar;9,300',
-    'us&dollar;9,500,000',
-    'us&dollar;910',
-    'us&dollar;915,000,000',
-    'us&dollar;94',
-    'us&dollar;950',
-    'us&dollar;97,000,000',
-    'us&dollar;98',
-    'us-and-them',
-    'us-australian',
-    'us-bound',
-    'us-bred',
-    'us-brokered',
-    'us-cuban',
-    'us-latin',
-    'us-listed',
     'us-occupied',
-    'us-rda',
-    'us/nato',
-    'us/new',
-    'us/vietnam',
-    'us75melanie',
-    'us_in',
-    'usa-94',
-    'usa-based',
-    'usa-soviet',
-    'usch',
-    'usci',
-    'usdoe',
-    'usdor',
-    'use/abuse',
-    'use/environment',
     'user&dollar;disk',
-    'user&mdash;input',
-    'user-',
-    'user-confidence',
-    'user-driven',
-    'user-groups',
-    'user-managed',
-    'user-only',
-    'user-programmable',
-    'user-ready',
-    'user-related',
-    'user-unfriendly',
-    'user.id',
-    'user/community',
-    'user1',
-    'users.',
     'usertl',
-    'usfws',
-    'ushida',
-    'usiminas',
-    'uspd',
-    'uspensky',
-    'uss.',
-    'ussed',
-    'ussf',
-    'usti',
-    'usu.',
-    'usuall',
-    'usubaliyev',
-    'usurians',
-    'ususally',
-    'utans',
     'utd1',
-    'utea-1',
-    'utensilibus',
-    'uteral',
-    'uterotubal',
-    'uteruses',
-    'utes',
-    'uthany',
-    'utica-rome',
-    'utile',
-    'utonai',
-    'utsly-gtsly',
-    'utterance.',
-    'utterback',
-    'utterings',
-    'uulaan',
     'uv-cross-linking',
-    'uv-lamp',
-    'uv-visible',
-    'uv7',
-    'uva-ursi',
-    'uvula',
-    'uwilingiyimana',
-    'ux-120',
-    'ux/v',
-    'uxorial',
-    'uxoriousness',
-    'uxoris',
-    'v&agr;j&agr',
-    'v&amp;rwc',
-    'v&eacute;cu',
-    'v&eacute;lo',
     'v&eacute;nitiennes',
-    'v&eacute;nus',
-    'v&eacute;ran',
-    'v&eacute;rtessz&ouml;ll&ouml;s',
-    'v&eacute;zina',
-    'v&plusmn',
-    'v(d)j',
-    'v*opss',
-    'v-1s',
-    'v-8i',
-    'v-baffle',
-    'v-compliant',
-    'v-like',
-    'v-q',
-    'v-shapes',
-    'v-tailed',
     'v-tol',
-    'v-very',
-    'v.14',
-    'v.15',
-    'v.22',
-    'v.24',
-    'v.3.1',
-    'v.3.2.4',
-    'v.4.0',
-    'v.4.1',
-    'v.4/386',
-    'v.5',
-    'v.6',
-    'v.7',
-    'v.b.',
-    'v.c.s',
     'v.d.',
-    'v.i-iii',
-    'v.iv',
-    'v.v.',
-    'v/f',
-    'v/stol',
-    'v0',
-    'v1.1',
-    'v10-powered',
-    'v17',
-    'v20',
-    'v23',
-    'v3.11',
-    'v3d',
-    'v4.1',
-    'v486m',
     'v50',
-    'v6-engined',
-    'v7101',
-    'v7102',
-    'v7484',
-    'v7672',
-    'v7799',
-    'v8-powered',
-    'v8i',
-    'v8s',
-    'va\'ai',
-    'vaagso',
-    'vaasen',
-    'vabra',
-    'vacaflor',
-    'vacas',
     'vaccary',
-    'vaccinators',
-    'vacs',
-    'vacualisation',
-    'vacuousness',
-    'vacuum-cleaners',
-    'vada',
-    'vadinimia',
-    'vaega',
-    'vaelaes',
-    'vagabundus',
-    'vagally',
-    'vagary',
-    'vaginismus',
-    'vagotomies',
-    'vahaji',
     'vahumpura',
-    'vai-transcription',
-    'vaillant-couturier',
-    'vails',
-    'vaincus',
-    'vainer',
-    'vainqueur',
-    'vajdova',
-    'vakif',
-    'val-pro-asp-pro-arg',
-    'valbonne',
-    'vald&eacute;s-salda&ntilde;a',
-    'vald&scaron;tejnsk&aacute',
-    'vald&scaron;tejnsk&eacute',
-    'valdeir',
-    'valentinos',
     'valer',
-    'valga-valka',
-    'valify.crc',
-    'valkanov',
-    'valkenbourg',
-    'vall&eacute;es',
-    'valla',
-    'vallay',
-    'valle/1e',
-    'vallenilla',
-    'valleyhead',
-    'valleyside',
-    'valliappa',
-    'vallincola',
-    'vallinicola',
-    'vallone',
     'valmay',
-    'valmet',
-    'valores',
-    'valpara&iacute;so',
-    'valponi',
-    'valsabbia',
-    'valses',
-    'valtre',
-    'valuble',
-    'value-',
-    'value-conscious',
-    'value-freedom',
-    'value-judgment',
-    'value-judgments',
-    'value-life',
-    'value-neutral',
     'value-orientations',
-    'value-oriented',
-    'value-subtraction',
-    'value-subtractors',
-    'value-theory',
-    'valuestation',
-    'valvasor',
-    'valve-like',
-    'valve-powered',
-    'valvegear',
-    'vammoussa',
-    'vamoosed',
-    'vampiros',
-    'vampishly',
-    'vampy',
-    'van-load',
     'van-loads',
-    'vanadate',
-    'vanbrughian',
-    'vanbutchel',
-    'vancouver&ndash;london',
-    'vandellas',
-    'vanderbilts',
-    'vandermeer',
-    'vanderwolf',
-    'vandi',
-    'vandjina',
-    'vanenburg',
-    'vanezis',
-    'vanguardia',
-    'vania',
-    'vanianova',
     'vanick',
-    'vanilla-coloured',
-    'vanillin',
-    'vanishes.',
-    'vanitory',
-    'vanlose',
-    'vanov',
-    'vanua',
-    'vanua\'aku',
-    'vanuaaka',
-    'vanvitelli',
-    'vanzetti',
-    'vapidly',
-    'vapor',
-    'vaporizer',
-    'vapour-check',
     'vapourish',
-    'var&formula',
-    'varangian',
-    'varasdin',
-    'varatharaja',
-    'varcoe-cocks',
-    'vardo',
-    'varengeville',
-    'vareyoc',
-    'vareys',
-    'vargas/oxfam',
-    'vargo',
-    'vari-coloured',
-    'variable-duration',
-    'variable-pressure',
-    'variation-sensitive',
     'variational',
-    'variationists',
-    'variative',
-    'varidase',
-    'variety-specific',
-    'varina',
-    'variola',
-    'variolinum',
-    'variscides',
-    'varities',
-    'varix',
-    'varlet',
-    'varmint',
-    'varsha',
-    'varta/bosch',
-    'vartaq',
     'vartosk',
-    'vary:r',
-    'varzea',
-    'vascars',
-    'vase-shaped',
-    'vase/faces',
-    'vasenko',
-    'vasilev',
-    'vasoactivity',
-    'vasoconstrictors',
-    'vasodepressor',
-    'vasoulla',
-    'vasp',
-    'vassaldom',
-    'vassalic',
-    'vassallo',
     'vassus',
-    'vaste',
-    'vastly-experienced',
-    'vastnesses',
-    'vasudeva',
-    'vasyuchenko',
-    'vate',
-    'vatenfall',
-    'vaterl&auml;ndische',
-    'vates',
-    'vathi',
-    'vatic',
-    'vato',
-    'vatson',
-    'vatthana',
-    'vattr',
     'vauciennes',
-    'vaudoyer',
-    'vaulx-en-velin',
-    'vauntingly',
-    'vauxhall/opel',
-    'vava\'u',
-    'vavasour',
-    'vavrousek',
-    'vax-11/780',
-    'vax-to-alpha',
-    'vaxjo',
-    'vay',
-    'vays',
-    'vazquez',
-    'vbs',
-    'vcps',
     'vdb(correctnewpos)',
-    'vdc',
-    'vdd',
-    'vdj',
-    'vds',
-    'vds/vcgl',
-    've25',
-    'vear',
-    'veasey',
-    'veau',
-    'vechten',
-    'vectorially',
-    'vectris',
-    'ved',
-    'vedado',
-    'vedel',
     'vedernikov',
-    'vedic/aryan',
-    'vedrenne',
-    'veerman',
-    'vegetables.',
-    'vegge',
-    'vegies',
-    'vegs',
-    'vegtables',
-    'vehicle/pedestrian',
-    'veidt',
-    'veii',
-    'veinlets',
-    'veinous',
-    'veitchii',
-    'vel&eacute;z',
     'velarde',
-    'velarium',
-    'velbe',
-    'veles',
-    'velez',
-    'velina',
-    'velleity',
-    'vellucent',
-    'vellupillai',
-    'velocimetry',
-    'velours',
-    'velu',
-    'velvet-clad',
-    'velvet-collared',
-    'velvet-dark',
-    'velvet-upholstered',
     'velvet-wrapped',
-    'velveteens',
-    'velvia',
-    'venable',
-    'venatores',
-    'venavae',
-    'venditio',
-    'venditor',
-    'vendor(s)',
-    'vendor-independent',
-    'vendredi',
-    'vendrely',
-    'vendroux',
-    'venegas',
-    'venerabilem',
-    'venerates',
     'venereal-disease',
-    'venereologist',
-    'veneryous',
-    'vengefulness',
-    'vengence',
-    'venica',
-    'venir',
-    'venkateswara',
-    'venos',
-    'venosa',
-    'ventalin',
-    'ventham/hotel',
-    'ventile',
-    'ventimiglia',
-    'ventora',
-    'ventromedial',
     'ventrue',
-    'venturas',
-    'venturis',
-    'venus-like',
-    'venusians',
-    'verard',
-    'verb-object',
-    'verbalized',
-    'verbosely',
-    'verdenal',
-    'verdict.',
-    'verdite',
-    'vereenigde',
-    'vereinigung',
-    'vergara',
-    'vergence',
     'vergniol',
-    'verhaeren',
-    'verhencamp',
-    'verie',
-    'verisimilitudinous',
-    'verivakis',
-    'verjee/gp',
-    'verluyten',
-    'vermeulen',
-    'vermicular',
-    'vermin-ridden',
-    'vern.',
-    'vernadsky',
-    'verne-smith-duchini',
-    'vernede',
-    'verniciflua',
     'verrio',
-    'verrucas',
-    'verrucosus',
-    'vers&uuml;cherin',
-    'versaliusstraat',
-    'verse-line',
-    'verse-lines',
-    'verse-speaker',
-    'versh',
-    'versicles',
-    'versicolor',
-    'versifier',
-    'versteeg',
-    'versteegii',
-    'verstehe',
-    'verster',
     'vertebrata',
-    'vertebrobasilar',
-    'vertec',
-    'verteegh',
-    'vertical-boilered',
-    'vertically-integrated',
-    'verticillaris',
-    'vertiginously',
-    'vertuous',
-    'verveer',
-    'verwaltung',
-    'verwaltungspolitik',
-    'very-high-impedance',
-    'very-large-scale',
-    'vesci',
-    'vesito',
     'vespan',
-    'vespas',
-    'vespertinus',
-    'vespidae',
-    'vestigially',
-    'vestland',
-    'vestram',
-    'vesture',
-    'veth',
-    'vette',
-    'vettius',
-    'vettriano',
-    'vetus',
-    'veut',
-    'vevey',
-    'vew',
     'vexatiously',
-    'vexillarius',
-    'vezirlik',
-    'vezirliks',
-    'vezirov',
-    'vezzosi',
-    'vf-7',
-    'vfs',
-    'vh&ndash;uth',
-    'vhaf',
-    'vhf/uhf',
-    'vi-2',
-    'vi-sport',
-    'viae',
-    'viala',
-    'vias',
     'viasoft',
-    'vibert',
-    'vibetti',
-    'viborg',
-    'vibration-rotation',
-    'vibratos',
-    'vibro-blade',
-    'vibro-tactile',
-    'vibroblade',
-    'vibrocoring',
-    'vibropercussive',
-    'vic-de-bigorre',
-    'vic.',
-    'vicar-apostolic',
-    'vicars-choral',
-    'vice-chairmanships',
     'vice-chairwoman',
-    'vice-director',
-    'vice-gerent',
-    'vice-president-elect',
-    'vicentes',
-    'vicharn',
-    'vicia',
-    'vicinage',
-    'vickers/northamptonshire',
-    'vickerstaff',
-    'vickie',
-    'vicks',
-    'vicq',
-    'victim-complaints',
-    'victim-support',
-    'victimizations',
     'victimology',
-    'victor/victoria',
-    'victorian-built',
-    'victorian-gothic',
-    'victorianisation',
-    'victorin',
-    'victory-odes',
-    'vidale',
-    'videazimut',
-    'videl',
-    'videnov',
-    'video-clip',
-    'video-editing',
-    'video-game',
-    'video-games',
-    'video-graphics',
     'video-monitors',
-    'video-out',
-    'video-pirates',
-    'video-screens',
-    'video.',
-    'video/',
-    'video/audio',
-    'video/long',
-    'video/raf',
-    'video/simon',
-    'video/stratfield',
-    'video/wendlebury/oxfordshire',
-    'video/worcester',
-    'videographics',
-    'videolink',
-    'vidich',
     'vidicon',
-    'vidin',
-    'vidphone',
-    'vidphones',
-    'viega',
-    'vieilles',
-    'vieler-porter',
-    'viennese-born',
-    'viet-nam',
-    'vietas',
-    'vietnam/cambodia',
-    'vietnamese-soviet',
-    'vieux-mareuil',
-    'view-based',
-    'view-panel',
-    'view-record',
     'view.',
-    'view_of',
-    'viewcase',
-    'viewplan',
-    'viewports',
-    'viewstation',
-    'vig&eacute;e-lebrun',
-    'vigdis',
-    'vigna-wilberg',
-    'vigneau',
-    'vigneronne',
-    'vigny',
-    'vigorous-looking',
-    'vigorousness',
-    'vii.8',
-    'vii/viii',
     'viii&ndash;ix',
-    'viiia',
-    'viinanen',
-    'viis',
-    'vijayan',
-    'vikas',
-    'viking/penguin',
-    'vil&eacute;m',
-    'vilau',
-    'vilayets',
-    'vildrac',
-    'vile-smelling',
-    'viler',
-    'viliami',
-    'villa-lobo',
-    'villach',
     'villae',
-    'villages.',
-    'villagey',
-    'villagization',
-    'villancico',
-    'villanies',
-    'villelme',
-    'villenauxe-la-grande',
-    'villeri',
-    'villers-allerand',
-    'villino',
-    'vilstrup',
-    'vilyui',
-    'vilyuisk',
-    'vinaigrettes',
-    'vincenot',
     'vincentia',
-    'vinceremos',
-    'vinces',
-    'vincett',
-    'vindica',
-    'vindications',
-    'vine-dressers',
-    'vine-like',
-    'vine-shaded',
-    'vinegar.',
-    'vineholts',
-    'viner/thames',
-    'vinestocks',
-    'vineyards.',
-    'vingt-et-un',
-    'vinicius',
     'vinit',
-    'vinko',
-    'vinland',
-    'vinous',
-    'vinyl-based',
-    'violacea',
-    'violes',
-    'violet-patterned',
-    'viperidae',
-    'virabhadra',
-    'viral-hepatitis',
-    'virgaurea',
-    'virghina',
-    'virginianus',
-    'virginio',
-    'virginitatis',
     'viridescent',
-    'virihaure',
-    'virlist.txt',
-    'viroconium',
-    'virola',
-    'virologists',
-    'virtual-memory',
-    'virum',
-    'virus-carrying',
-    'virus-infected',
-    'virus-specific',
-    'virus.',
-    'viruscan',
-    'vis-&rgr;a-vis',
-    'vis-d-vis',
-    'vis/tp',
     'visagie',
-    'viscerum',
-    'viscometers',
-    'viscose/linen',
-    'viscountcy',
-    'viscously',
-    'visi',
-    'visians',
-    'visible-light',
-    'visine',
-    'visionarium',
-    'visitazione',
-    'visite',
-    'visitings',
-    'visitng',
-    'viso',
     'visted',
-    'vistupi',
-    'visual-motor',
-    'visually-based',
-    'visuomotor',
-    'viswanathan',
-    'vitalba',
-    'vitalie',
-    'vitally-needed',
-    'vitamin-a-rich',
-    'vitamin-c',
-    'vitamin-packed',
-    'vitani',
-    'vitapoint',
-    'vitek',
-    'vitellius',
     'vithal',
-    'vitiation',
-    'vitnery',
-    'vitrearum',
-    'vitrex',
-    'vitrine',
-    'vitrinitic',
-    'vittles',
-    'vittore',
-    'vituperating',
-    'vituperations',
-    'vitznau',
-    'viura',
-    'vivant',
-    'vivantes',
-    'vivaria',
     'vivary',
-    'vivement',
-    'vivid-green',
-    'viviparity',
-    'vivisectionist',
-    'vizard',
-    'vizinhos',
-    'vizzavona',
-    'vkp(b)',
-    'vl348',
-    'vla-1',
-    'vla-2',
-    'vla.',
-    'vladikavkazskaia',
-    'vladim&iacute;r',
-    'vladimiro',
     'vlady',
-    'vlaho',
-    'vlasta',
-    'vlc',
-    'vleesidence',
-    'vll',
-    'vlllb',
-    'vlns',
-    'vm/370',
-    'vma',
-    'vme-64',
-    'vms300',
-    'vnseable',
-    'vnutrennikh',
-    'vobla',
-    'vocabulary.',
     'vocal-auditory',
-    'vocalises',
-    'vocationally-oriented',
-    'vocem',
-    'vocibus',
-    'vociferation',
-    'vociferus',
-    'vockins',
-    'vocoder',
-    'vocouma',
-    'vocum',
-    'vod',
-    'vodicka',
-    'vogelh&auml;ndler',
-    'vogon',
-    'voguish',
     'voice-parts',
-    'voice/volunteer',
-    'voidance',
-    'voidoids',
-    'voire',
-    'vois',
-    'voisin',
-    'vojanovy',
-    'vojt&ecaron;ch',
-    'vojta',
-    'vojtech',
-    'vol\'sky',
-    'vol.16',
-    'vol.2',
-    'vol.iii',
-    'vol/',
     'volador',
-    'volatilises',
-    'volcanological',
-    'volke',
-    'volkenstein',
-    'volkish',
-    'volkogonov',
-    'volkovs',
-    'volkspares',
-    'volkswagen/turner',
-    'volkswagenwerk',
-    'vollenhoven',
-    'vollrath',
-    'volly',
-    'volmer',
-    'volodymir',
     'volontaire',
-    'volstad',
-    'voltage-derived',
-    'voltage-gated',
-    'voltaic',
-    'volte-faces',
-    'voltmeters',
-    'voluminously',
-    'voluntary-sector',
-    'volunteerism',
-    'volute-krater',
-    'volvox-1/ctr-900',
-    'volvox-1/sf-900',
-    'volvox-1/v-900',
-    'volvox-ts',
-    'volvox-tw-9000',
     'volynsk',
-    'vomitorium',
-    'vomitoxin',
-    'vonnas',
-    'voorthuis',
-    'vooruitgang',
-    'voov',
-    'vor/dme',
-    'voraciousness',
-    'vorlich',
-    'vorobiev',
-    'vorobyov',
-    'voronov',
-    'voroshilov',
-    'vorota',
-    'vorrsa',
     'vortexed',
-    'vortical',
-    'vosloorus',
-    'vote**',
-    'vote-catcher',
-    'voter-friendly',
-    'voto',
-    'voulez',
-    'vox-pop',
-    'vox.a',
-    'vox_populi',
-    'vp-21',
-    'vp-planner',
-    'vp/ix',
-    'vpgpr',
-    'vpo/kleiber',
     'vq',
-    'vqs',
-    'vr-series',
-    'vr4000',
-    'vr4000/vr4400',
-    'vr4000pc',
-    'vr4000sc',
-    'vr4400pc',
-    'vr4400sc',
-    'vraimont',
-    'vrais',
-    'vranco',
-    'vranitsky',
-    'vri',
-    'vrt',
-    'vrtxsa',
     'vsafe',
-    'vsc',
-    'vss',
-    'vt1',
-    'vt11',
-    'vt4',
-    'vt52-vt320',
-    'vt7',
-    'vts',
-    'vtsoft',
-    'vtx',
-    'vuela',
-    'vuer',
-    'vug',
-    'vuillermoz',
-    'vuk&scaron;i&cacute',
     'vukmanovich',
-    'vulcanization',
-    'vulci',
-    'vulg',
-    'vulpinus',
-    'vulvitis',
-    'vuono',
-    'vup',
-    'vuren',
-    'vv.',
-    'vx147',
-    'vx653',
-    'vxvmi',
-    'vyas',
-    'vyezzhye',
-    'vyon',
     'vyse/francis',
-    'vyshnegradsky',
-    'vystar',
-    'vz303',
-    'w&amp;d',
-    'w&divide;p',
-    'w&ndash;s',
-    'w&uuml;rstie',
-    'w(x)',
-    'w-c',
-    'w-d',
-    'w-d-l',
-    'w-h',
-    'w-registered',
-    'w-shaped',
-    'w.a.a.f.',
     'w.a.r',
-    'w.c.w.',
-    'w.e.a.',
-    'w.e.b',
-    'w.e.d',
-    'w.g.e.',
-    'w.g.grace',
-    'w.h.m.',
-    'w.h.o.',
-    'w.h.smith',
-    'w.h.spence',
-    'w.j.r.',
-    'w.k.',
-    'w.l.r',
-    'w.n.b.',
-    'w.o.',
     'w.p.g.',
-    'w.p.m',
-    'w.r.n.s.',
-    'w.r.t',
-    'w.r.u.',
-    'w.s.3',
-    'w.s.r',
-    'w.t',
-    'w.w.r.',
-    'w/100/25/1001',
-    'w/100/26/1002-1',
-    'w/100/26/1008',
-    'w/100/26/1008-1',
-    'w/100/26/1008-2',
-    'w/100/26/1010',
-    'w/100/26/1013',
     'w/100/26/1015',
-    'w/100/26/1020',
-    'w/100/26/1023',
-    'w/100/26/1024',
-    'w/100/26/1025',
-    'w/100/26/1030',
-    'w/100/26/1032',
-    'w/100/26/1033',
-    'w/100/26/1034',
-    'w/100/26/1045',
-    'w/100/32/1003',
-    'w/100/32/1006',
-    'w/102/24/1001',
-    'w/102/25/1002',
-    'w/102/25/1008',
-    'w/102/25/1009',
     'w/102/25/1010',
-    'w/102/25/1013',
-    'w/102/25/1014',
-    'w/103/25/1001',
-    'w/103/25/1005',
-    'w/103/25/1006',
-    'w/103/25/1007',
-    'w/103/25/1009',
-    'w/103/34/1001',
-    'w/104/25/1003',
-    'w/104/25/1007',
-    'w/105/25/1001',
-    'w/105/25/1002',
-    'w/105/25/1003',
-    'w/105/25/1005',
-    'w/105/25/1007',
     'w/105/25/1009',
-    'w/105/25/1010',
-    'w/105/25/1013',
-    'w/105/25/1014',
-    'w/108/25/1004',
-    'w/108/25/1006',
-    'w/108/25/1007',
-    'w/108/25/1014',
-    'w/108/25/1015',
-    'w/108/25/1017',
-    'w/110/25/1001',
-    'w/110/25/1004',
-    'w/110/25/1005',
-    'w/110/25/1006',
-    'w/113/25/1001',
-    'w/113/25/1007',
     'w/113/25/1018',
-    'w/113/25/1022',
-    'w/113/25/1025',
-    'w/115/25/1001',
-    'w/115/34/1001',
-    'w/116/25/1002',
-    'w/116/25/1003',
-    'w/116/25/1011',
-    'w/2',
-    'w/300',
-    'w/435/28/1001',
-    'w/nr',
-    'w/op',
-    'w124',
-    'w20',
-    'w45',
     'w5a030',
-    'w:v',
-    'wa14',
-    'wa802',
-    'wa984',
-    'waa',
-    'waaah',
-    'waage',
-    'waana',
-    'waanders',
-    'waata',
-    'wabag',
-    'wacc-related',
-    'wacc/la-c',
-    'wachsmuth',
-    'wachters',
     'wachtler',
-    'wadal',
-    'waddells',
-    'wade/consultant',
-    'wadenhoe',
-    'wader-like',
-    'waders.',
-    'wady',
-    'waerebeek',
-    'wagadon',
-    'wagagai',
-    'wage-goods',
-    'wage-labourer',
-    'wage-led',
-    'wage-related',
-    'wage-setting',
     'wage-slaves',
-    'wagenburg',
-    'wages/salaries',
-    'wagga',
-    'waggiest',
-    'waggoned',
-    'waggott',
-    'wagoners',
-    'wagontrain',
-    'wagstaff/national',
-    'wagstaff/thames',
-    'wagtail-like',
-    'wahaya',
-    'wahba',
-    'wahdat-i-islami',
-    'wahhh',
     'wahidul',
-    'wahlgren',
-    'wahn',
-    'wailes',
-    'wainers',
-    'wainstones',
-    'waipu',
-    'waist-lines',
-    'waistbag',
-    'waited-we',
-    'waiter/waitress',
-    'waitering',
-    'waiting-period',
-    'wajcman',
-    'wajiba',
-    'wak',
     'waka',
-    'wakahara',
-    'wake-forest',
-    'wake-walker',
-    'wakefield-harrey',
-    'wakely/coach',
-    'wakering',
-    'waku',
-    'walawe',
-    'walborough',
-    'waldbrol',
-    'waldegrade',
-    'waldendale',
-    'waldens',
-    'waldensians',
-    'waldoes',
     'waldorf-astoria',
-    'waldric',
-    'waldschmidt',
-    'waldst&auml;dten',
-    'waldszenen',
-    'waled',
-    'walens',
-    'walewska',
-    'walewski',
-    'waleys',
-    'walfart',
-    'waligorski',
-    'walk-about',
-    'walk-ins',
-    'walk/jog',
-    'walker/cheltenham',
     'walker/oxford',
-    'walker/polio',
-    'walkertronic',
-    'walking-song',
-    'walking/climbing',
-    'walkouts',
-    'walkstation',
-    'walkway/cycleway',
-    'wall-bars',
-    'wall-coverings',
-    'wall-enclosed',
-    'wall-length',
-    'wall-like',
-    'wall-plaques',
-    'wall-powered',
-    'wall-rocks',
     'wall-screen',
-    'wall-top',
-    'wall-track',
-    'wall-type',
-    'wallaba',
-    'wallace/weatherall',
-    'wallasea',
-    'wallbars',
-    'wallce',
-    'walled-off',
-    'walled-up',
-    'walles',
-    'wallframe',
-    'wallnook',
-    'wallowings',
-    'wallplanner',
     'wallscreen',
-    'wallshire',
-    'wallstent',
-    'wallstile',
-    'wallwin',
-    'wallwitz',
-    'walmore',
-    'walpoles',
-    'walscott',
-    'walsgrave',
-    'walsgrove',
-    'walsh/bishop',
-    'walshes',
-    'waltz-caprices',
-    'waltz-length',
-    'waltzer',
     'wan%',
-    'wan-chen',
-    'wand-slim',
-    'wandas',
-    'wandesworth',
-    'wando',
-    'wandring',
-    'wangaratta',
-    'wangari',
-    'wangel',
-    'wankdorf',
-    'wankhede',
-    'wannian',
-    'wannstedt',
-    'wanostrocht',
-    'wanserver',
     'wanstall',
-    'want-',
-    'wanta-',
-    'wapc',
-    'wapentakes',
-    'wapi',
-    'waplington',
-    'wappett',
-    'war-affected',
-    'war-bonnet',
-    'war-bonnets',
-    'war-chest',
-    'war-club',
-    'war-crazy',
-    'war-games',
-    'war-gaming',
     'war-heads',
-    'war-news',
-    'war-scarred',
-    'war-shattered',
-    'war-talk',
-    'war-whoops',
-    'war-widows',
-    'war.in',
-    'warblings',
-    'warbosses',
-    'warburton/grant',
-    'warburtons',
-    'warc-92',
-    'warcry',
-    'ward-based',
-    'ward-jackson',
     'ward/chairman',
-    'ward/hospital',
-    'wardhaugh',
-    'wardlow',
-    'wardoyo',
-    'wardress',
-    'wardrobe-woman',
-    'ware&rehy;houses',
-    'ware/long-sighted',
-    'warehouse-type',
-    'warehouseman/sales',
-    'warennes',
-    'warewashers',
-    'warford',
-    'wargasm',
-    'warington',
     'warland',
-    'warleader',
-    'warley/raf',
-    'warlingham',
-    'warm-air',
-    'warmia',
-    'warmingham',
-    'warmley',
-    'warmly-received',
-    'warmoth',
-    'warmth-demanding',
-    'warna',
-    'warncke',
-    'warner-chappell',
-    'warner-us',
-    'warning/do',
     'warninghurst',
-    'warper',
-    'warpscreen',
-    'warra',
-    'warrantee',
-    'warranties/indemnities',
-    'warrior-followings',
-    'warrior-queen',
-    'warrnambool',
-    'warsame',
-    'warsaw-based',
-    'warsop',
-    'warspite',
-    'warter',
-    'warters',
-    'wartnaby',
     'wartorn',
-    'waruru',
-    'warwick-based',
-    'warwickshire-based',
-    'warwood',
-    'waryn',
-    'was/were',
-    'was_no',
-    'wasabi',
-    'wasatch',
-    'wascher',
-    'wase',
-    'wash-bag',
-    'wash-handbasin',
-    'wash-leathers',
-    'wash-wipe',
     'wash.',
-    'washbasket',
-    'washdays',
-    'washed-silk',
-    'washer/drier',
-    'washer/dryer',
-    'washer/dryers',
-    'washeries',
-    'washers-up',
-    'washhouses',
-    'washing-powder',
-    'washlands',
-    'washleather',
-    'washstands',
-    'washtubs',
-    'wasmuth',
     'wasp-infested',
-    'waspe',
-    'waspfish',
-    'wasquehal',
-    'wassailers',
-    'wassalke',
-    'wasser',
-    'wasserburg',
-    'wasserfallen',
-    'wassily',
-    'waste-basket',
-    'waste-lands',
-    'waste-pipe',
-    'waste-products',
-    'wastegate',
-    'wastepipe',
     'wastie',
-    'wastnage',
-    'wasylenki',
-    'watamu',
-    'watch-strap',
-    'watch-word',
-    'watchfire',
-    'watchmender',
-    'watchmoor',
-    'watcyn',
-    'water-buses',
-    'water-butts',
-    'water-chutes',
-    'water-cistern',
-    'water-cleansing',
-    'water-cooling',
     'water-cuts',
-    'water-dispensing',
-    'water-dispersed',
-    'water-driven',
-    'water-eroded',
-    'water-filter',
-    'water-filters',
-    'water-garden',
-    'water-gardening',
-    'water-gazers',
-    'water-holding',
-    'water-holes',
-    'water-jugs',
-    'water-keeper',
-    'water-levels',
-    'water-loving',
     'water-mark',
-    'water-nymph',
-    'water-pistol',
-    'water-points',
-    'water-proofed',
-    'water-purification',
-    'water-purifying',
-    'water-races',
-    'water-retaining',
-    'water-shed',
-    'water-skis',
-    'water-soaked',
-    'water-spout',
-    'water-sprite',
-    'water-tables',
-    'water-tanks',
     'water-theme',
-    'water-violet',
-    'water-workers',
-    'waterbike',
-    'waterbirds',
-    'watercooler',
-    'watercroft',
-    'waterdance',
-    'waterdrops',
-    'waterglade',
-    'waterlooplein',
-    'watermead',
-    'watermelon-pink',
-    'waternish',
-    'waterpipes',
-    'waterpower',
     'waterpumps',
-    'watersporting',
-    'waterstair',
-    'watertap',
-    'watery-eyed',
-    'watir',
-    'watkins/mother',
-    'watley',
-    'wats',
-    'watsham',
-    'watson-watt',
-    'watsonjones',
-    'wattanapongsiri',
-    'wattlebridge',
-    'watts/a420',
-    'wausau',
     'wauthier',
-    'wave-lashed',
-    'wave-producing',
-    'wave-worn',
-    'waveguides',
-    'wavesports',
-    'wavetops',
-    'wavier',
-    'wavin\'',
-    'wavy-bladed',
-    'wax-coated',
-    'wax-filled',
-    'wax-like',
-    'waxings',
-    'waxwings',
-    'way(s)',
     'way-of-seeing',
-    'way-point',
-    'way.',
-    'wayang',
-    'waygood',
-    'waylander',
-    'waylays',
-    'wayleaves',
-    'waymarker',
-    'wayner',
-    'waynes',
-    'wayuu',
-    'waywardly',
-    'waz',
-    'wazoua',
-    'wazzock',
     'wbt',
-    'wc1.',
-    'wc1v',
-    'wcl',
-    'wd.',
-    'wd2',
-    'wdf',
-    'wdm',
-    'we\'v',
-    'we177',
-    'weaith',
-    'weak-chinned',
-    'weak-eyed',
-    'weak-link',
-    'weak-looking',
-    'weakenesses',
     'weakish',
-    'wealth\'',
-    'weanling',
-    'weapons-oriented',
-    'wearability',
-    'weariest',
-    'wearwithal',
-    'weas',
-    'weasel-like',
-    'weather-boarded',
-    'weather-god',
-    'weather-gods',
-    'weather-lore',
-    'weather-proofed',
-    'weathercote',
-    'weatherhill',
     'weaverhurst',
-    'weavver',
-    'web-builders',
-    'webb/cellmark',
-    'weberbauer',
-    'webless',
-    'webre',
-    'webster/site',
-    'weckmann',
-    'wecsel',
-    'weddin',
-    'wedding-carriages',
-    'weddle',
-    'weddoes',
-    'wedemeyer',
-    'wedge-heeled',
     'wedge-like',
-    'wedge-shape',
-    'wedge-tailed',
-    'wedgewood-oppenheim',
-    'wedgwood-benn',
-    'wedgwoods',
-    'wedn',
-    'wedons',
-    'weed-filled',
-    'weed-infested',
-    'weed-killers',
-    'weed-like',
-    'weed-strewn',
-    'weedbeds',
-    'weede',
-    'weedier',
     'weediest',
-    'weedol',
-    'weedons',
-    'weeed',
-    'weegram',
-    'weeitch',
-    'week-days',
-    'week.the',
-    'weekends.',
-    'weeks-old',
-    'weems',
-    'weeniest',
-    'weepiness',
-    'weeramantry',
-    'wefted',
-    'weghe',
     'wegs',
-    'wehr',
-    'weichselian',
-    'weider',
-    'weidhaas',
-    'weigh-ins',
-    'weighing-scales',
-    'weight-blood',
-    'weight-control',
-    'weight-lifter',
-    'weight-losing',
-    'weight-trainers',
-    'weight/',
-    'weight/body',
-    'weight/volume',
-    'weihs',
     'weihsien',
-    'wein',
-    'weinbach',
-    'weinbaum',
-    'weinbergs',
-    'weinglass',
-    'weinreich-haste',
-    'weirdies',
-    'weirdy',
-    'weiske',
-    'weissbach',
-    'weissberger',
-    'weissenberg',
-    'weissensee',
-    'weisser',
-    'weiter',
     'weksler',
-    'welberry',
-    'welbourn',
-    'welbury',
-    'welch/phillips',
-    'welcome-home',
-    'welcomer',
-    'welcum',
-    'wele',
-    'welfram',
-    'well&rehy;chosen',
-    'well&rehy;made',
-    'well-accepted',
-    'well-baked',
-    'well-barred',
-    'well-buttered',
     'well-calculated',
-    'well-contested',
-    'well-darned',
-    'well-dated',
-    'well-definedness',
-    'well-delivered',
-    'well-detailed',
-    'well-devised',
-    'well-distributed',
-    'well-engineered',
-    'well-enough',
-    'well-expanded',
-    'well-exposed',
-    'well-fancied',
-    'well-fingered',
-    'well-fired',
     'well-focused',
-    'well-frequented',
-    'well-functioning',
-    'well-grilled',
-    'well-grouped',
-    'well-heads',
-    'well-heated',
-    'well-hosed',
-    'well-justified',
-    'well-lagged',
-    'well-learned',
-    'well-manned',
-    'well-manured',
-    'well-marbled',
-    'well-matured',
-    'well-mixed',
     'well-modelled',
-    'well-paced',
-    'well-person',
-    'well-phrased',
-    'well-plotted',
-    'well-pruned',
-    'well-recommended',
-    'well-related',
-    'well-remunerated',
-    'well-rubbed',
-    'well-sealed',
-    'well-situated',
-    'well-soaped',
-    'well-sounding',
-    'well-springs',
-    'well-spun',
     'well-staged',
-    'well-styled',
-    'well-sustained',
-    'well-targeted',
-    'well-tied',
-    'well-toned',
-    'well-tuned',
-    'well-tutored',
-    'wellbeck',
-    'welldeck',
-    'wellent',
-    'wellerhorn',
-    'wellesleys',
-    'wellfair',
-    'welling-up',
-    'wellnigh',
     'wellsted',
-    'wellwood',
-    'wellworths',
-    'welmsley',
-    'welsh-speakers',
-    'welstead',
-    'welthorpe',
-    'weltklasse',
-    'welwick',
-    'wemicke',
-    'wenban',
-    'wendle',
-    'wendlebury/oxfordshire',
-    'wendlinger',
-    'wendon',
-    'wendtii',
     'wendys',
-    'wennberg',
-    'wensbergh',
-    'wentz',
-    'werbner',
-    'werdel',
-    'werden',
-    'were/are',
-    'werefound',
-    'werff',
-    'wergeld',
-    'werkstatte',
-    'werleigh',
-    'werne',
-    'wersig',
-    'wertenheimer',
     'werthenstein',
-    'wesadlib',
-    'weschke',
-    'weshtam',
-    'weslicks',
-    'west-based',
-    'west-burnham',
-    'west-central',
-    'westbury-on-severn',
-    'westbury-on-severn/gloucestershire',
-    'westbury-on-trym',
-    'westen',
-    'westerheimer',
-    'westerhope',
-    'western-dominated',
-    'western-influenced',
     'western-orientated',
-    'western-oriented',
-    'westf&auml;lisches',
-    'westfries',
-    'westhill',
-    'westmeads',
-    'westmede',
-    'westner',
-    'weston-baker',
-    'westoning',
-    'westron',
-    'westy',
-    'wet-bulb',
-    'wet-haired',
-    'wet-nurses',
-    'wet-suits',
     'wetfly',
-    'wetherall/newsome',
-    'wetherdale',
-    'wethersfield',
-    'wetnurse',
-    'wetzlar',
-    'wew',
-    'wexner',
-    'weybourne',
-    'weydon',
-    'weyland',
-    'weymss',
-    'wezaar',
-    'wf-495',
-    'wf138',
-    'wf562',
     'wfsp',
-    'wgic',
-    'wgn',
-    'wh-where',
-    'wh.',
-    'wha%',
-    'whaam',
-    'whackiness',
-    'whaka',
-    'whale-hunting',
-    'whale-like',
-    'wharehouse',
-    'wharfdale',
-    'wharfed',
-    'wharfing',
-    'wharfingers',
     'wharfside',
-    'whashton',
-    'whassa',
-    'whassamatter',
-    'whassat',
-    'what\'s-in-it-for-me',
-    'what-all',
-    'what-d\'you-call-\'ems',
-    'what-ever',
-    'what-for',
-    'what-happens-next',
-    'what-might-have-been',
-    'what-the-butler-saw',
-    'what-you-see',
-    'wheat-',
-    'wheat-free',
     'wheat-ricks',
-    'whec',
-    'wheel-tracks',
-    'wheelchairbound',
-    'wheelcover',
-    'wheeler/tenant',
-    'wheeler/thames',
-    'wheelhouse/surrey',
-    'wheelings',
-    'wheelis',
-    'wheely-bins',
-    'wheesh',
-    'wheldrake',
-    'whelmed',
-    'whelton',
-    'where-ever',
     'whereunto',
-    'wherof',
-    'wherryman',
-    'wherwell',
-    'wheteley',
-    'whettam',
-    'wheyey',
-    'whgo',
-    'whieh',
-    'whiffed',
-    'whiffin',
-    'whiggie',
-    'while_in',
-    'whiley',
-    'whillians',
-    'whimbrel-like',
     'whimper.',
-    'whimperings',
-    'whimsies',
-    'whinbush',
-    'whinforth',
-    'whinhill',
-    'whinnies',
-    'whinston',
-    'whip-cracking',
-    'whip-tendrils',
-    'whiplike',
-    'whipper-snappers',
-    'whippier',
-    'whipround',
-    'whipstroke',
-    'whipt',
     'whiptails',
-    'whirli',
-    'whirlo',
-    'whirlow',
-    'whisper-quiet',
-    'whitbourne',
-    'whitby-registered',
-    'whitcomb',
-    'whitcross',
-    'white-and-gold',
-    'white-aproned',
-    'white-blond',
-    'white-blossomed',
-    'white-bodied',
-    'white-breasted',
-    'white-chinned',
     'white-collared',
-    'white-crowned',
-    'white-domed',
-    'white-fleshed',
-    'white-garbed',
-    'white-gowned',
-    'white-grey',
-    'white-harled',
-    'white-helmeted',
-    'white-napped',
-    'white-sheeted',
-    'white-striped',
-    'white-stucco',
-    'white-uniformed',
-    'white-washer',
-    'white-wine',
     'white/125',
-    'white/commuters',
-    'white/director',
-    'white/director/oxon',
-    'white/social',
-    'white/swindon',
-    'whiteacre',
-    'whitear',
-    'whitecroft-scovill',
-    'whitehouse/susan',
-    'whiteinch',
-    'whiteley/ashmolean',
-    'whitelow',
-    'whitenburgh',
-    'whiteoak',
-    'whiteparish',
     'whites.',
-    'whithead',
-    'whiting-out',
-    'whitish-grey',
-    'whitmanesque',
-    'whitney-long',
-    'whitsand',
-    'whitsbury',
-    'whittemore',
-    'whittering',
-    'whitwham',
-    'whitwick',
-    'whitwood',
-    'whizz-bangs',
-    'whizz-kidz',
-    'whizz/small',
     'whizzbangs',
-    'whma',
-    'who\'s-who',
-    'who(m)',
-    'who-done-it',
-    'whoah',
-    'whole&rehy;heartedly',
-    'whole-head',
-    'whole-life',
-    'whole-staff',
-    'wholely',
-    'wholesale/retail',
-    'wholetime',
-    'whooosh',
-    'whoopers',
-    'whoopsie',
     'whoozh',
-    'whorehouses',
-    'whorf-sapir',
-    'whorfian',
-    'whoriskey',
-    'whortleberry',
-    'whsmith',
-    'whuff',
-    'why/why',
-    'whyld',
-    'whyman',
-    'whynham',
-    'whyte-melville',
-    'wi&euml;se',
-    'wi\'oot',
-    'wibbly-wobbly',
     'wiberg',
-    'wible',
-    'wiccans',
-    'wichit',
-    'wichuraiana',
-    'wick/thurso',
-    'wickednesses',
-    'wicker-backed',
-    'wicker-work',
-    'wicket-keeper/batsman',
-    'wickman',
-    'wicquefort',
-    'widdell',
-    'widdow',
-    'wide-belted',
-    'wide-coverage',
     'wide-cut',
-    'wide-lapelled',
-    'wide-legged',
-    'wide-lipped',
-    'wide-mouth',
-    'wide-opening',
-    'wide-rimmed',
-    'wide-sleeved',
-    'widedyne',
-    'widely-distributed',
-    'widely-perceived',
-    'widely-previewed',
-    'widely-spaced',
-    'wider/narrower',
-    'widmore',
-    'widow-lady',
     'widow-woman',
-    'widow/widower',
-    'wiechers',
-    'wieck',
-    'wiedig',
-    'wiegenlied',
-    'wiegman',
-    'wieladek',
-    'wiele',
-    'wieners',
-    'wiertz',
-    'wieska',
-    'wiessner',
-    'wife-beaters',
-    'wife-takers',
-    'wife/partner',
     'wifeless',
-    'wig-maker',
-    'wigan-born',
-    'wigeon-like',
-    'wigits',
-    'wigwams',
-    'wihtraed',
-    'wijnaendts',
-    'wiksell',
-    'wilches',
-    'wilcocks',
-    'wilczek',
-    'wild-flowers',
-    'wild-fowlers',
-    'wild-haired',
-    'wild-west',
     'wildasin',
-    'wildebeeste',
-    'wilderhope',
-    'wilders',
-    'wilderspin',
-    'wildes',
-    'wildlife-friendly',
-    'wildlife-oriented',
-    'wildlife-rich',
-    'wildmen',
-    'wildmoor',
-    'wildon',
-    'wilecki',
-    'wiley-interscience',
-    'wilfer',
-    'wilfridian',
     'wilger',
-    'wilhelm-lehmbruck',
-    'wilhemina',
-    'wilia',
-    'wiliest',
-    'wililiam',
-    'wilke',
-    'wilkens',
-    'wilkey',
-    'wilko\'',
-    'wilky',
-    'will-they',
-    'willamette',
-    'willbourne',
-    'willehalm',
-    'willem-karel',
     'willemstad',
-    'willer',
-    'willersey',
-    'william-mallaig',
-    'williamfield',
-    'williams-bred',
-    'williams/auctioneer',
-    'williams/coach',
-    'williams/hereford',
-    'williams/oxfordshire',
-    'williams/victim',
-    'williams/williams',
-    'williamsonian',
-    'willingness/attitude',
-    'willis/british',
-    'willisau',
     'willises',
-    'willium',
-    'willm',
-    'willmann',
-    'willmots',
-    'willow-man',
-    'willow-tree',
-    'willowgarth',
-    'willsey',
-    'wilms',
-    'wilshier',
-    'wilsill',
-    'wilsinho',
-    'wilson-callaghan',
-    'wilson-patterson',
-    'wilson/gipsy',
     'wilsonian-leninist',
-    'wiltcher',
-    'wimalaratne',
-    'wimberley',
-    'wimon',
-    'wimpey-gilbert',
-    'wimpie',
-    'win(o)',
-    'win-a-football',
-    'win-os/2',
-    'win-track',
-    'winc',
-    'wincentraldirect',
-    'winchcombe/gloucestershire',
-    'winchess',
-    'winchester/hampshire',
     'winchesters',
-    'winchfield',
-    'wind-direction',
-    'wind-harp',
-    'wind-pipe',
-    'wind-rippled',
-    'wind-rose',
-    'wind-sound',
-    'wind-stunted',
-    'wind-surfer',
-    'wind-thrown',
-    'wind-tunnels',
-    'windfall-profits',
-    'windiest',
-    'windiness',
-    'windloadings',
     'windos',
-    'window-breaking',
-    'window-dresser',
-    'window-like',
-    'window-motif-based',
-    'window-shoppers',
-    'window-table',
-    'windowheads',
-    'windows-compatible',
-    'windows-specific',
-    'windowseat',
-    'windproofs',
-    'windpumps',
-    'windrose',
-    'windrows',
-    'winds.',
     'windscale/sellafield',
-    'windscoops',
-    'windsocks',
-    'windyhill',
-    'wine-cooler',
-    'wine-flagons',
-    'wine-importing',
-    'wine-merchant',
-    'wine-shipper',
-    'wine-shops',
-    'wine-soaked',
-    'wine-tinged',
-    'wine-waiter',
-    'wine/beer',
-    'wine/water',
-    'wine/whisky/champagne',
     'wineberg',
-    'winefride',
-    'wineguard',
-    'winegum',
-    'wineskins',
-    'winestead',
-    'winey',
-    'wing-backed',
-    'wing-bar.',
-    'wing-collar',
-    'wing-coupling',
-    'wing-cum-fullback',
-    'wing-down',
-    'wing-flashes',
-    'wing-margin',
-    'wing-mirrors',
     'wing-mounted',
-    'wing-pads',
-    'wing-pattern',
-    'wing-play',
-    'wing-veins',
-    'wing-walker',
-    'wing-winnowing',
-    'wing.membrane',
-    'winger/',
-    'wingerson',
-    'wingerworth',
-    'wingspans',
-    'wingwalker',
-    'wingwalkers',
-    'wingy',
-    'winiata',
     'winklebrain',
-    'winky',
-    'winmills',
-    'winnat',
-    'winnats',
-    'winner-takes-all',
-    'winner-the',
-    'winner.',
-    'winnower',
-    'winox',
-    'winsby',
-    'winslow/buckinghamshire',
-    'winsomeness',
-    'winspit',
-    'winstable',
-    'winstan',
     'winston-salem',
-    'winterscales',
-    'winterschladen',
-    'wintersteen',
-    'winterstoke',
-    'wintery',
-    'wintney',
-    'winy',
-    'wipeable',
-    'wipeouts',
-    'wiping-out',
-    'wipm',
-    'wire-braced',
-    'wire-tap',
-    'wire-taps',
-    'wireless-operator',
     'wirenetting',
-    'wirily',
-    'wirin',
-    'wirld',
-    'wirs2',
-    'wirtschaft',
-    'wirtschaftsprufer',
-    'wisbey',
-    'wischmeier',
-    'wisdens',
-    'wise/asthma',
-    'wisewoman',
-    'wish-images',
-    'wish-impulses',
-    'wisha',
-    'wishaw-based',
     'wished-for',
-    'wispishly',
-    'witch-doctors',
-    'witch-hunters',
-    'witchlike',
-    'witco',
-    'witdoeke',
-    'with_one',
-    'with_regard_er_to',
-    'withdrawable',
-    'withdrawing-room',
-    'witherite',
-    'witherslack',
-    'withholden',
-    'within-out',
-    'within-species',
     'withnall',
-    'withou',
-    'withybridge',
-    'withypool',
-    'witkop',
-    'witland',
-    'witnesses.',
-    'witney-based',
-    'witrik',
-    'wittek',
-    'wittelsbach',
-    'witten',
-    'wittenbergplatz',
-    'wittenoom',
-    'wittingdale',
-    'wittingness',
     'wittman',
-    'wittoo',
-    'witzum',
-    'wiwa',
-    'wixey',
-    'wixon',
-    'wiyogo',
-    'wizdom-based',
-    'wl679',
-    'wl747',
-    'wl757',
-    'wle',
-    'wlhb',
-    'wlo',
-    'wlodzimierz',
-    'wm750',
     'wmi',
-    'wo&amp;sub3',
-    'wo-men',
-    'wobbliness',
-    'woch',
-    'woct',
-    'wodgers',
-    'wodiczko',
-    'woffard',
-    'woggles',
-    'wojado',
-    'wojnarowicz',
-    'wolborough',
-    'wolch',
-    'wolf-cub',
-    'wolf-ferrari',
     'wolf-phillips',
-    'wolfenburg',
-    'wolfenbuttel',
-    'wolfeson',
-    'wolfeyes',
-    'wolff-parkinson-white',
-    'wolfs',
-    'wolfseed',
-    'wolin',
-    'wolio',
-    'wollmuth',
-    'wolska',
-    'wolsley',
-    'wolvercote/oxfordshire',
-    'wolvertons',
-    'woman-in-peril',
     'woman-only',
-    'woman-thing',
-    'woman.',
-    'woman/man',
-    'womanisers',
-    'womanless',
-    'wombourne',
-    'womenwealth',
-    'womersley',
-    'womphrey',
-    'wond\'ring',
-    'wonder-kid',
-    'wonderous',
-    'wonderously',
-    'wonderworker',
-    'wonga',
     'wongwanich',
-    'wonned',
-    'wontkins',
-    'wood-built',
-    'wood-carver',
-    'wood-chopping',
-    'wood-cutters',
-    'wood-cutting',
-    'wood-engraved',
-    'wood-gush',
-    'wood-handled',
-    'wood-o-cork',
-    'wood-screws',
-    'wood-shed',
-    'woodacre',
-    'woodbastwick',
     'woodbourne',
-    'woodchopping',
-    'woodcocks',
-    'woodcott',
-    'woodcrafts',
-    'woodcrest',
-    'woodcuttings',
-    'woodeaton',
-    'wooden-seated',
-    'woodes',
-    'woodfern',
-    'woodfree',
-    'woodham-smith',
-    'woodheads',
-    'woodhole',
-    'woodhull',
     'woodier',
-    'woodiness',
-    'woodkirk',
-    'woodmancote',
-    'woodnotes',
-    'woodring',
-    'woodstains',
-    'woodstopping',
-    'woodstore',
-    'woodstorks',
-    'woodville\'',
-    'woodville-dominated',
-    'woodwalton',
-    'woodyard',
-    'wool-lined',
-    'wool-producing',
     'wool-rich',
-    'wool-suckers',
-    'woolaston',
-    'woolf-murray',
-    'woolf-tumim',
-    'woollams',
-    'woolly-haired',
-    'woolly-headedness',
-    'woolner',
-    'woolshop',
-    'wooltack',
-    'woolverstone',
-    'woolvine',
-    'woonerf-style',
-    'wooo',
-    'woosey',
     'wootey',
-    'wooteys',
-    'wop/ag',
-    'wopfner',
-    'woprried',
-    'wor\'-oss',
-    'worb',
-    'worc',
-    'word&gt',
-    'word-blindness',
-    'word-boundaries',
-    'word-building',
-    'word-classes',
-    'word-decoding',
-    'word-endings',
-    'word-form',
     'word-length',
-    'word-like',
-    'word-painting',
-    'word-path',
-    'wordcnt',
-    'wordcnt.ssm',
-    'wordgames',
-    'words/turn',
-    'wordsworth\'',
-    'work&rehy;sheets',
-    'work-arounds',
-    'work-attitudes',
-    'work-basket',
-    'work-benches',
-    'work-centred',
-    'work-houses',
     'work-induced',
-    'work-orientated',
-    'work-parties',
-    'work-roughened',
-    'work-sheets',
-    'work-spaces',
-    'work/a',
-    'workbase',
-    'workbox',
-    'workdays',
-    'worked-over',
-    'worker-directed',
-    'worker-led',
-    'worker-manager',
-    'workforce.',
-    'workgroup-based',
     'workhorse.',
-    'working-classes',
-    'working-groups',
-    'working-people',
-    'worklife',
-    'workmap',
-    'workmens',
-    'works-council',
-    'works_up',
-    'workship',
-    'workshop.',
-    'workshop/seminar',
-    'worksites',
-    'worktables',
-    'worktime',
-    'workwomen',
     'workworn',
-    'world&rehy;renowned',
-    'world-',
-    'world-apart',
-    'world-cup',
-    'world-economy',
-    'world-first',
-    'world-historical',
-    'world-power',
-    'world-rejecting',
-    'world.',
-    'world.richard',
-    'world.the',
-    'worldcare',
-    'worldham',
-    'worldling',
     'worldport',
-    'wormful',
-    'wormingford',
-    'wormley',
-    'worn-looking',
-    'worrr',
-    'worry-beads',
-    'worry-lines',
-    'worryiong',
-    'worshipfully',
-    'worshipps',
-    'worst-dressed',
-    'worst-kept',
-    'worst-performing',
-    'wortham',
-    'worthlessly',
     'worthwhileness',
-    'worton',
-    'wotcher',
-    'wotsyername',
-    'wott',
-    'wottya',
-    'would/would',
-    'wouldn\'a',
-    'wouldn\'t.',
-    'wouldna',
-    'woundedness',
-    'wouter',
-    'wovens',
-    'wows',
-    'wowwwowowow',
-    'woyzeck',
     'wp3&ndash;7',
-    'wpcl',
-    'wr963',
-    'wr967',
-    'wraithlike',
-    'wrangel',
-    'wrap-up',
-    'wraths',
-    'wratting',
-    'wraxall',
-    'wreathe',
-    'wreckage.',
-    'wrecklessly',
-    'wrekenton',
-    'wrenaissance',
-    'wrentham',
     'wrenton',
-    'wrestlin\'',
-    'wrestlings',
-    'wrigglers',
-    'wright-patterson',
-    'wrigleys',
-    'wrin',
-    'wringers',
-    'wrinkle-free',
-    'wrinkle-skinned',
-    'wrinklebottom',
-    'wrist-slapping',
-    'wristlets',
-    'write-a-thons',
-    'write-through',
-    'writelines',
     'writer-dependent',
-    'writing-in-role',
-    'writing-office',
-    'written-in',
-    'written-out',
-    'written/read',
-    'wrocht',
-    'wrong-doings',
-    'wrongfulness',
-    'wronging',
-    'wroxton',
-    'ws286',
-    'wsgn',
-    'wst',
-    'wt%',
-    'wt1',
     'wt6',
-    'wt80',
-    'wtbs',
-    'wuchereria',
-    'wudu',
-    'wuer',
-    'wulff',
-    'wulfheah',
-    'wulfric',
-    'wulstans',
-    'wunner',
-    'wurtemburg',
-    'wv1',
-    'ww/june',
-    'ww346',
-    'wwent',
     'wwere',
-    'wwf/acclaim',
-    'www',
-    'wx',
-    'wyckham',
-    'wyf',
-    'wyfes',
-    'wyfold',
-    'wyhl',
-    'wyl',
-    'wylies',
-    'wyllies',
-    'wyllis',
-    'wyllyott',
-    'wyngaarden',
-    'wyngate',
     'wynn-jones',
-    'wynyates',
-    'wyrwoll',
-    'wys',
-    'wysing',
-    'wysner',
-    'wysoy',
-    'wyspia&nacute;ski',
-    'wythman',
-    'wz966',
-    'wz967',
-    'x&formula',
-    'x&horbar',
-    'x&rarr;y&rarr;z',
-    'x&times',
-    'x+',
     'x+y',
-    'x-/y-cell',
-    'x-372',
-    'x-a',
-    'x-autosomal',
-    'x-b',
-    'x-chromosomal',
-    'x-cs',
-    'x-fold',
-    'x-gal',
-    'x-i',
-    'x-if/alt',
-    'x-inefficient',
-    'x-ing',
-    'x-input',
-    'x-pattern',
     'x-reg',
-    'x-terms',
-    'x-us',
-    'x-windows/motif',
-    'x-word',
-    'x-xi',
-    'x-yachts',
-    'x.400-based',
-    'x/200/26/200288',
-    'x/200/26/2008',
-    'x/201/26/2002',
-    'x/201/31/2002',
-    'x/202/25/2003-1',
-    'x/202/25/2004',
-    'x/202/25/2006',
-    'x/202/26/2001',
     'x/203/25/2001',
-    'x/203/25/2014',
-    'x/204/25/2002',
-    'x/204/25/2003',
-    'x/204/25/2005',
-    'x/205/26/2001',
-    'x/206/25/2005',
-    'x/206/25/2006',
-    'x/208/25/2003',
-    'x/208/25/2008',
-    'x/208/25/2009',
-    'x/a',
-    'x/open-compliant',
-    'x11.4',
-    'x11049',
-    'x11r5-based',
     'x129/rl-',
-    'x200',
-    'x25-based',
-    'x29',
-    'x33',
-    'x435',
-    'x87',
-    'x=1',
-    'xa(e)',
-    'xa4',
-    'xa6',
-    'xa8',
-    'xaghra',
-    'xamdu',
-    'xanthina',
-    'xanthopsis',
     'xanthoria',
-    'xaw',
-    'xb6',
-    'xbai',
-    'xbr',
-    'xbred',
-    'xc5',
-    'xci',
-    'xcls',
-    'xcvi',
-    'xd2+',
-    'xd434',
-    'xd5+',
-    'xd7',
-    'xd8',
-    'xdcs',
     'xdos',
-    'xe4+',
-    'xe5',
-    'xebra',
-    'xef',
-    'xeg',
-    'xeltec',
-    'xenias',
-    'xenonym',
-    'xenophobics',
-    'xerium',
-    'xerography',
-    'xerxian',
-    'xeta',
-    'xf2+',
-    'xf3+',
     'xf8+',
-    'xg5+',
-    'xh3',
-    'xh671',
-    'xh7+',
-    'xheka',
-    'xhemal',
-    'xhoi-bglii',
-    'xhosa-speaking',
-    'xhulali',
-    'xhx',
-    'xiamen',
-    'xianguang',
-    'xiaobo',
-    'xic',
-    'xiith',
     'ximenes',
-    'ximing',
-    'xixb',
-    'xjr-s',
-    'xk695',
-    'xkl',
-    'xl/datacomp',
-    'xl5',
-    'xl8',
-    'xlendi',
-    'xlib-based',
-    'xm463',
-    'xmai',
-    'xmas/new',
-    'xmn',
-    'xmu',
     'xn685',
-    'xokonoshetl',
-    'xonia',
-    'xoox',
-    'xp&ndash;59',
-    'xp-1',
-    'xp10t',
-    'xp11',
-    'xp831',
-    'xpds',
-    'xpelair',
-    'xperiment',
-    'xpg/3',
-    'xpg4-compliance',
-    'xr4i',
-    'xraid',
     'xsight',
-    'xstacy',
-    'xstart',
-    'xstone',
-    'xt-class',
-    'xt-compatible',
-    'xt/',
-    'xts',
-    'xv.',
-    'xvideo-24svc',
-    'xx%',
-    'xxxp',
-    'xywrite',
-    'y&aacute;2wshu',
-    'y&prime',
-    'y\'could',
     'y\'fip',
-    'y\'fipre',
-    'y\'iggthradgipile',
-    'y\'nah',
-    'y\'r',
-    'y\'rrah',
-    'y-bol',
-    'y-directions',
-    'y-intercept',
-    'y-linked',
-    'y-mps',
-    'y-rays',
-    'y-specific',
-    'y-stake',
-    'y-x',
-    'y.a.j.',
     'y.m.c.a.',
-    'y/300/26/3002',
-    'y/300/26/3008',
-    'y/300/26/3009',
-    'y/300/26/3011',
-    'y/301/26/3002',
-    'y/301/26/3003',
-    'y/301/26/3004',
-    'y/301/26/3008',
-    'y/304/25/3002',
-    'y/304/25/3003',
-    'y/304/25/3004',
-    'y/304/25/3008',
-    'y/304/25/3010',
-    'y/304/26/3001',
-    'y/305/25/3002',
     'y/305/25/3003',
-    'y/306/25/3002',
-    'y/306/25/3003',
-    'y/306/25/3004',
-    'y/307/25/3002',
-    'y/307/25/3003',
-    'y/307/25/3004',
-    'y/307/25/3005',
-    'y/307/25/3006',
-    'y/308/26/3001',
-    'y/309/25/3001',
-    'y/309/25/3002',
-    'y/309/25/3007',
-    'y/309/25/3009',
-    'y/309/25/3018',
-    'y/309/25/3023',
     'y/309/25/3027',
-    'y/309/25/3036',
-    'y/309/26/3002',
-    'y/309/26/3003',
-    'y/309/26/3006',
-    'y/310/26/3003',
-    'y/316/26/3001',
-    'y/318/26/3003',
-    'y/318/26/3004',
-    'y/320/25/2001',
-    'y/320/25/3002',
-    'y/320/25/3010',
-    'y/320/25/3012',
-    'y/320/25/3020',
-    'y/320/25/3023',
-    'y/320/25/3030',
     'y/320/25/3036',
-    'y/320/25/3039',
-    'y/320/25/3041',
-    'y/418/25/4001',
-    'y12,000',
-    'y3,883',
-    'y6,800',
-    'y8',
-    'y8,800',
-    'ya\'',
-    'yaa',
-    'yaba',
-    'yachts.',
-    'yadin',
-    'yadm',
-    'yaffe',
     'yaffle',
-    'yagi',
-    'yagya',
-    'yahad',
-    'yai',
-    'yak&ndash;15',
-    'yakulov',
-    'yalgaar',
-    'yamadori',
-    'yamagiwa',
-    'yamasaki',
-    'yamashita',
-    'yamshchikov',
-    'yanbu\'',
-    'yandell',
-    'yang-mills',
     'yanice',
-    'yankilevsky',
-    'yanku',
-    'yanoush',
-    'yaou',
-    'yaping',
-    'yard-high',
-    'yardbrush',
-    'yarder',
-    'yardlands',
-    'yarin',
-    'yaroo',
-    'yarr',
-    'yarrg',
-    'yarsley',
-    'yaser',
     'yassen',
-    'yassou',
-    'yasunsgat',
-    'yater',
-    'yatuz',
-    'yavuz',
-    'yawls',
-    'yazar',
-    'yazdani',
-    'yb-70',
-    'ycfc',
-    'ydo',
-    'ye\'',
-    'ye/04/25/0000',
-    'ye/05/25/0000',
-    'ye/09/25/0000',
     'ye/11/25/0000',
-    'yea-and-nay',
-    'yeah-yeah',
-    'yeah/',
-    'yeal',
-    'yeald',
-    'year*',
-    'year-dating',
-    'year-ends',
-    'yeards',
-    'yearlong',
-    'years.l',
-    'yearsand',
-    'yeast-containing',
-    'yeaxley',
-    'yediler',
     'yedingham',
-    'yedra',
-    'yefimov',
-    'yei',
-    'yeiw&eacute;n&eacute',
-    'yeldall',
-    'yeliz',
-    'yelland',
-    'yelled.',
-    'yellin\'',
-    'yellow-black',
-    'yellow-card',
-    'yellow-centred',
-    'yellow-faced',
-    'yellow-leaved',
-    'yellow-nosed',
     'yellow-stained',
-    'yellow-suited',
-    'yellow-throated',
-    'yellow-tinted',
-    'yellow-variegated',
-    'yellow/brown',
-    'yellow/red',
-    'yellow/white',
-    'yellowfish',
-    'yellowmead',
-    'yelstin',
-    'yeltsins',
-    'yemery',
-    'yendell',
-    'yeng',
-    'yerbury',
     'yerik',
-    'yerxa',
-    'yes-and-no',
-    'yes-sir',
-    'yes-yes',
-    'yes.',
-    'yesayan',
-    'yeshivah',
-    'yesilova',
-    'yester-evening',
-    'yesterday.but',
-    'yet-another',
-    'yet-to-be-announced',
-    'yeuking',
-    'yfcu',
-    'yffi',
     'yg/00/29/0002',
-    'ygvx06',
-    'yi-po',
-    'yiddish-speaking',
-    'yielders',
-    'yifter',
-    'yigal',
-    'yikes',
-    'yimenu',
-    'yin-yang',
-    'yinger',
-    'yip-i-addy',
-    'yith',
-    'yl',
-    'ymage',
-    'ymi',
     'yn-mes',
-    'ynysybwl',
-    'yo\'',
-    'yo3',
-    'yo6',
-    'yobboes',
-    'yock',
-    'yohko',
-    'yokota',
-    'yolk-sac',
-    'yolk-yellow',
-    'yongbo',
-    'yoohoo',
-    'yootha',
-    'yordanov',
-    'york-style',
     'yorkes',
-    'yorkley',
-    'yorkley/gloucestershire',
-    'yorkville',
-    'yos',
-    'yoseph',
-    'yoshiaki',
-    'yoshihiro',
-    'yoshihisa',
-    'yoshikawa',
-    'yossarian',
-    'yossers',
-    'you&mdash;it',
-    'you-dual',
-    'you-find',
-    'you-the',
     'you/your',
-    'you_out',
-    'youde',
-    'youern',
-    'young\'',
-    'young-cho',
-    'young-ish',
-    'young/',
-    'young/browning',
-    'young/oxfordshire',
-    'younger-ross',
-    'youngness',
-    'younoussi',
-    'your-self',
-    'yourinitials5',
-    'yourself-',
     'youself',
-    'youth-preserving',
-    'yovanka',
-    'yowing',
-    'yozo',
-    'ypaeitlyw',
-    'ypres-menin',
-    'yrd',
-    'yrds',
-    'yrs.',
-    'ysd',
-    'ystad',
-    'ystwyth',
-    'yuan*',
-    'yuan-tzu',
-    'yucay',
     'yuch',
-    'yudah',
-    'yudha',
-    'yuel',
-    'yugoslav-born',
-    'yugoslavians',
-    'yugotours',
-    'yui',
-    'yujiro',
-    'yukata',
-    'yukhnovsky',
-    'yukons',
-    'yulo',
-    'yungas',
-    'yunxia',
-    'yusof',
     'yusshy',
-    'yutaka',
-    'yuval-davis',
-    'yves-alain',
-    'ywet',
-    'ywtu',
-    'yzr500',
-    'z&auml;hringen',
-    'z&dollar;100',
-    'z&euml;ri',
-    'z&iacute;tek',
-    'z&uuml;hlke',
-    'z(3)',
-    'z-80',
-    'z-buffer',
-    'z-component',
     'z-day',
-    'z-disk',
-    'z-disks',
-    'z-series',
-    'z-shaped',
-    'z-stations',
-    'z/l',
-    'z1000',
-    'z11',
-    'z11933',
-    'z12',
-    'z1826',
-    'z1828',
-    'z1835',
-    'z2904',
-    'z3032',
     'z3057',
-    'z7486',
-    'z8',
-    'z86017',
-    'za&iuml;re*',
-    'zaabal',
-    'zaanse',
-    'zablah',
-    'zacapa',
-    'zacarias',
-    'zachariasen',
-    'zacharie',
-    'zachmann',
-    'zachrisson',
-    'zacks',
-    'zacopride',
     'zadruga',
-    'zaehner',
-    'zaentz',
-    'zagalo',
-    'zagni',
-    'zagorski',
-    'zagreus',
-    'zahi',
-    'zahl',
-    'zahnle',
-    'zahra',
-    'zai',
-    'zaichnevskii',
-    'zaikov',
-    'zairi',
-    'zaishuo',
     'zakharov',
-    'zakhele',
-    'zakhidov',
-    'zakinthos',
-    'zakob',
-    'zakrevskii',
-    'zakuti',
-    'zalten',
-    'zamberland',
-    'zambia-based',
-    'zamecnik',
-    'zameenzad',
-    'zamiatnin',
-    'zamorna',
-    'zan',
-    'zandamela',
     'zanderij',
-    'zanjani',
-    'zanskaris',
-    'zantedeschia',
-    'zantzinger',
-    'zapas',
-    'zapateado',
-    'zaps',
-    'zarate',
-    'zare',
-    'zariba',
-    'zartmann',
-    'zarza',
-    'zarzuelas',
-    'zashiki-warashi',
-    'zaumseil',
     'zavarov',
-    'zawadski',
-    'zayniyya',
-    'zbys',
-    'zccf',
-    'zd',
-    'zdenko',
-    'zdruj',
-    'ze\'ev',
-    'zebaot',
-    'zebbi',
-    'zebrasoma',
-    'zebrik',
-    'zec',
-    'zecar',
-    'zedek',
     'zedekia',
-    'zeena',
-    'zeesen',
-    'zefiro',
-    'zegarra',
-    'zeiger',
-    'zeila',
-    'zeitalter',
-    'zeitgeber',
-    'zekai',
-    'zel',
-    'zelditch',
-    'zelen',
-    'zeleni',
-    'zelenock',
-    'zelensky',
     'zeljko',
-    'zelor',
-    'zemeldica',
-    'zenale',
-    'zenatec',
-    'zeners',
-    'zenkevitch',
-    'zenz',
-    'zeotropic',
-    'zepher',
-    'zeppelinheim',
-    'zero-dimensional',
-    'zero-length',
-    'zero-modified',
-    'zero-modifying',
-    'zero-pressure-gradient',
     'zero-rates',
-    'zero/null',
-    'zeroville',
-    'zetek',
-    'zetter',
-    'zev',
-    'zewolde',
-    'zey',
-    'zeya',
-    'zeylanicum',
-    'zeylanicus',
-    'zghorta',
-    'zh',
-    'zhai',
-    'zhamaitis',
-    'zhangyi',
     'zhengcai',
-    'zhidkov',
-    'zhikarev',
-    'zhitomir',
-    'zhorik',
-    'zhufbar',
-    'zia-ul-haq',
-    'ziboh',
-    'zidan',
-    'zidovudine-resistant',
-    'ziehl',
-    'zieleniec',
-    'ziem',
-    'ziggurats',
-    'zigmond',
-    'ziguinchor',
     'zihl',
-    'zihlman',
-    'zikri',
-    'zillertalbahn',
-    'zillions',
-    'zillmann',
-    'zimbabwe-rhodesia',
-    'zinal',
-    'zinc-lined',
-    'zinder',
-    'zing-zing',
-    'zinged',
-    'zingers',
-    'zingiber',
-    'zinjanthropus',
-    'zinkel',
     'zinnias',
-    'zip-fastened',
-    'zip-off',
-    'zip-out',
-    'zipf',
-    'zipped-up',
-    'ziranek',
-    'zirkzee',
-    'zissimos',
-    'zissler',
-    'zizzo',
-    'zj',
-    'zlabek',
-    'zlobin',
-    'zlota-lipa',
-    'zn-finger',
     'zn-pb',
-    'znanieki',
-    'znf22',
-    'znojmo',
-    'zoanthid',
-    'zoditch',
-    'zoellick',
-    'zogby',
-    'zohar',
-    'zolden',
-    'zolotkov',
-    'zombified',
-    'zombifying',
-    'zombodze',
-    'zonals',
-    'zonatus',
     'zonke',
-    'zonnebeke',
-    'zoo-keeper',
-    'zoographical',
-    'zooid',
-    'zoomed-in',
-    'zoomorphic',
-    'zoonotic',
-    'zork',
-    'zorlac',
-    'zosimo',
-    'zossenheim',
-    'zoster',
-    'zosterops',
-    'zouaves',
-    'zounds',
     'zoyland',
-    'zp320',
-    'zp321',
-    'zpe',
-    'zs-bxi',
-    'zsgs',
-    'zsmz',
-    'zsuzsi',
-    'zuberi',
-    'zucchi',
-    'zuccolillo',
-    'zuev',
-    'zuffa',
-    'zuhair',
-    'zuider',
-    'zukertort',
     'zulu-oriented',
-    'zulueta',
-    'zura',
-    'zurada',
-    'zurbaran',
-    'zurbrugg',
-    'zurvanite',
-    'zusanli',
-    'zusya',
-    'zuta',
-    'zvane',
-    'zvenigorod',
-    'zvobgo',
-    'zwack',
-    'zwartbont',
-    'zwelithini',
     'zwick',
-    'zwickau',
-    'zwitterionic',
-    'zyglo&reg',
-    'zzone',
-    'zzuperstore',
+)
+
+blocks_35 = (
+    '("re\'#she\'&though!\'ndash;8\'#the $\'ent!"mr !, %-ance!%butyl!)sponsored ,1-2-3-bungee!*00&ndash;7*!8"%2-key',
+    '"+45&ndash;79"(92-style .2-deoxyglucose!(.7-litre!,0&ndash;30cm!\'50-acre *4&ndash;5m!%-meta!-500&ndash;50e )5.3-litre -9&ndash;12(b)!&0-mile \'a&mdash"%ndash!)-building',
+    '"%go-go!%aaagh"!f!#bab#&shidze""fd"#led!*ccessorize#!m""gm"%haean$#ian"\'tinidia!$dath""ef',
+    '+$ion\'"(vertsing#$ocat!#ecl""rt!"fd!(ir&mdash#%-land!"jd!&kimoto!\'l-qasem#%thair"%annah"#bsu"*exandrinus',
+    '"&iasing#&quoted"\'l-breed#(egorized#$sort"*stroemeria!%mbrit")ericanise"%shold"%uesha!-naesthetizing"#ces"(drogynes"#ges#\'leterre',
+    '$)o-chinese&&united#&ulated"$nick"&spaugh"#te-#*hropophagy#%i-air%+cytokeratin%*incumbency%$skid%$vice$\'fascist!"oh!.partment-house',
+    '"#ics#$onem"*otheosized"\'padurai"&uleius!*quascaping!\'rc-info#)hdiocesan"(dnaveigh"&kanoid"#my\'"%sames"(t-dealer#$exed##hog',
+    '""ve"!y!%stles#&rodome#$ynax!#tpc"%tacca!$ucun"!n"*to-reverse"#xil!$vare"!g""ma!%ylish',
+    ' *b&ndash;29!#-26"$film!&abaian#"et"&ckease$(pedalled"&ffetti"(lfourier#*l-changing$(incollig"\'r-stool#(ber-shop#%n-owl#%ovier',
+    '#(tardized"&toning"$usch"%velaw!"b\'!$echt"%dwear"$ecom#\'keeping"+lfast-style"&ndelow#%gough#&venuti"%vvied""zu',
+    '!$ibio"\'erwurst"%rding#$thed#$zeit""sh#&millah#+phosphonate#$trot"\'tburger##ted"&valvia!"ks!(lack\'uns"%esmag',
+    '"%obbed#%ckcnt##oop!+oardsailing"%bbety"#cht"*dychecking$$talk"$etti")gey-beast")iler-suit"&llaert"$nair"%okin\'"\'rsumato',
+    '#%ygues!"pa!&ragger#%illed#\'nchplan$%dling$%scomb#!w"%edero#)echclouts#*tschneider"+illiantined#$nged##xen"(onzewing',
+    '%#ite#*therswater"%r-brr"&unches$&nhilde!$ucer"+dget-making"!p""rd#$ghul"(stamente$!i"2tter-wouldn\'t-melt!"vm!#wcp',
+    ' 0c&ocirc;t&eacute!#-17!%affer"$iran"&lcined#(endaring#&f-skin#%iburn#&lister"&mbstec#"ry""n\'#(nabidiol#&taloop#!u',
+    '"(pernwray"%rdpac#+lisle-based#&making#*ol-singing"$sati#&emates#%tella#,ualty-faking"&t-food#$alac#\'burglar#(echising#$rain#$spaw',
+    '""us"$vaye"#zzo!#ctu""uf!(enturian!%front!0h&acirc;teauneuf"%allen#(mpollion#%patti$"ot#$uvet"&ekasin#$late',
+    '#$rnow##vvy"$heng"+ild-prodigy%\'spacing\'#lay#$nked#\'onodoxa#"rm#&ttered"+loroguanide"$udet#%rring#"st#!t',
+    '"/garette-lighter##oli")nemagoing"%ttern"&vitate!\'laonaig")earheaded##ere#"ri"(imatress$#ent")othmaking$$ilde#(ud-cover&$mist',
+    '!+o-occurring"(al-house"$bbed$#ing#$enzl"+ck-a-leekie#%opeat"\'denames"#irm"\'lchicum#&liders#"om$"ni"-medy-thriller#\'mandery',
+    '$&unity\'#%prend$&utakit&(er-style##tek"&ndover#$fort#&querer#+stitutionel#,textualising$\'rariant#)vertagear"%omber"&ppered#%tered',
+    '#\'ncockle$%icing#+puscularian#.rection-praise$)ieyairack"\'stuming"4unter-counter-themes%#ry-##rt\'#%tumes"#wle#%plain"$ypel!$rago#"in',
+    '"&ii-rad#$mper"#onk#,ss-pollinate%%haven#+wd-pleasing"&usaded"+yptanalysts#(stalised!(uff-link"$mann"$nnan"$pper"#rdy#-rent-limiting',
+    '"!u!\'yanosed"&bernex!(zarnikow &d\'amor!\'aggered#$lish"\'intyfit#"sh"$lien#(nasnecht",mage-control#&ejanet"$ndle#%egeld',
+    '"#rry"(tamatics$&server"%vises$!t"$wnay")y-nursery"#zer!$bits!#cda!/e-commissioning#*humanising#.industrialized#(layering#\'pressed',
+    '"+ath-bearing"\'barking#&iasing##out".cision-process#(olonised"&dombal"\'erhound"(fuelling$)nctioning"\'iniolen"0ll\'annunziazione"&mersal#\'ocrates"%nimed',
+    '#\'ominate"+politicized"&rating")schooling#"ir%"e\'#&outter##sau##tin"$utch")vitalized"#yan!%gdgbd!$idya"$enst',
+    '"&lemma\'"&omedea"$plex$"ow",safforesting#+cus-thrower#(tricting"#tra!,me-compliant!\'ogberry#+gy-paddling#$rose"(laucothi#$drum#+lar-earning',
+    '"%main\'""nh#(key-cart\'&jacket#"ut"%o-dah#*r-stepping"&rfwirt#"li#!o"&wndale")xycycline!(raughted"$eich")illstring',
+    '\'#ime"%oaned##oly!"sa!\'umb-ass$$reck"$nged$$lass#$ters"#ral"#ty-"&vivier!#ypp!(zagnidze $e(t)',
+    '"%dbang"\'st-side!$bles!,chinodermata"$soft!"dx!"ed"!k!&ffect\'!"gh!%ivver!%karro!\'l-bireh"(agabalus"*ectroplate',
+    '"$iger"#san!"mb#\'roiders"$ergo"&parked$&thized##oli"%shoff!\'ncaenia#+hant&eacute%#sed"%dcaps"\'ergises%\'y-field',
+    '"#iac")shrouding"\'venomed"\'wrapped!*pidermidis#,scopalianism"%o-tek!%q\'ing"*uivocating!$rian"(oticized!#sda"#hun"*portazione""sa',
+    '"(tranging!$tiam!\'umetsat"-ro-parliament"\'therian!\'verting!$wald##rts!*x-diplomat#\'formula#&jockey"-ecution-style"$tern!)ye-stripe!"zs',
+    '",ct-gathering"#got"&ilure\'"%strax"#tih"%uvist"%vorit!&ebuary"(e-earner"%mbots#&inised")nestrated"&rmilab#(rochrome"$stin',
+    '!,iddle-faddle")eld-mouse"$nian$,shing-school#$nair"&rehose$$trap"$sche#,h-processing#\'sioning#*t-fighting")ve-string"+xcalibstrip!\'latpack"&ea-pit',
+    '"#iss"%odwig#\'rjancic"#uck#\'minense"(ybynight!"ns!$onny"(odstores#(t-patrol".relock-tugging#%mated$(ularised&!e"\'ur-city',
+    '$$eyes"$wers!/raternit&eacute"\'ee-flow#-twell-downing""id"$oben#&gslegs#$mbat!%ueled"(ll-force%(throttle"/nction-oriented#"ks""or',
+    '"%rioso ,g&ndash;aitf!#(r)!$aine$"st"&lactix#$bani#\'licized"%mbier"&rtered"&te-leg"\'uffered"$yner!"cm!#ebe',
+    '"$eing"(imhreadh"#nce##sym""og"%rroff#!y"%stion"#tta"*wehrkammer!(hilander!(ift-shop"%nevra"&stutor!+lass-rubber',
+    '"$ebes"(istering")obalizing#%govac"%u-251!(o-getter""d\'"&ffered"+ld-engraver"%od-un$\'hearted$&ie-bag$%style"!p"$rrit',
+    '"$ughs!&racchi#)ndiflorus$(t-aiding$\'ulating##unt#*ve-digging"%eigii"*id-pattern##ses"&oining"%udger#"nd%$buch!"ua',
+    '"(ess-work""in"%mboot"&nnhild""rt!$waun"!s %haast",lf-convinced%$dome%#sat"#man"(nd-craft%&waving"&rakhty',
+    '#$ijan#"on#(rumphing"&wkweed"$xhiu""y-##mon"#zen!)ctranstab!,edge-trimmer"#eps"%idrun#"ss"\'liconia$\'um-neon',
+    '"$nnig"$thel!+ickinbottom"$din\'"\'gh-heel$&jacked"\'llcroft"\'m&mdash!$jelm!"ki!&my-b53!"nh!%o-hum"$bnob"$gget',
+    '"(miletics"&pgrove"#rak"\'t-blast#\'hersall"#uld#*se-surgeon%\'trained!#uan"#cke"\'dsoning"$ghli"*ndred-year#*ting-field"#sat',
+    '"!u!\'ydrates"%mnary")percolour %iccat"(e-maiden"$mesa"#ona""su!)delphonse!"er!#grf!#iim!#key!&linden',
+    '!+magesetting"\'molated#,unoadsorbent&#dot"#par"#sak!\'n&mdash"$-box")cesticide",dispensables#&urated"&finiti#$onow$(rmix-4gl"#gen',
+    '#"tr"+terdistrict%%leave&%oping%&mixing""va#(igilated!#ols!%psden!*ron-nickel!)slamicist"$ocor""tc!)t&ndash;s"\'hanguni',
+    '#!i"(ty-bitty!#ucd $jacy"&hrbuch"&ilbait"%ntzen"(zz-house!(essamine"%ttied!&ibbing"$miny"+ngle-jangle#!n"+tterbugging',
+    '!"li!\'ob-loss"&panini""yn!$ugle""ni"&risoft $k2-8!%almyk##ven"#ori""po"%valek!%epier"(raistani',
+    '!$hali"$waja!)ieselguhr#!w"$lian#$rush"%nased#%gfish"$pped#$sigy""ti!$laff"$inik""op!#nla',
+    '$#in\'!%ocher"%etser"#mix"&nzerne!$rait#"lj"%einin$!s!$uban"$kuli""na""rk!+yokushinkai +l\'&acirc;ge',
+    '"\'heureux!%abang#,el-switching$!o$%talol#"it#$ored$#ur\'"\'ciniata"#ffs"#hti")mentabili"(nd-ocean%%train$$shut',
+    '"%pilli"\'thering"%udate"(verstock"(w-office"&ybourn!%easam$$hing"$boff""co"#der##ged"(fthanded"#mus"(nnoxlove',
+    '"$sher!"ff!\'iberal-%!e%%tador"#dba#"en"%eserl"(ffeyside#$toff"&mbered#%ekiln#\'nanthes"\'ndqvist#)guistique',
+    '"&onized"%p-cup#$sius"&quored"&ttl\'un##vak!,oad-shedding"%crian"$gout"1ng&rehy;suffering$&legged"+op-the-loop"\'profile"$quat"%rieux',
+    '!"sa"!l!$uffa"(guvalium""ma"%thien#"in!%ydien"!r %m-mlv!\'adhavan#$urai"&gistra#-nifying-glass#%ritta',
+    '##wah"#in\'"\'jor-key##uro"(mboundou"$nana#%child#$esty#$gels#%ucchi#%ximum"(preading",r&oacute;thy#\'ionhain##ken',
+    '&#(s)$#off##len#\'quetery##yed"\'scaraed#\'kirovka#*s-murderer"$tamp#(ch-guise%\'boarded%%point#\'hmatics#$ilde#&telart',
+    '"#zed!"cw!\'eatball$"es"&dresse""es"#gga"$lick"*mber-state#"ex"&ntalix%"wi"(rcenaria#$lini"#sol',
+    '$#ret"&tanoia#&rocast%\'nomized%(politain!(icrobilt%%polis%)spreading"&d-1947$%level$$tape"\'gralift"%koyan"%lfoil#%kwort',
+    '"$nato##ema#&i-pill#(ocycline$"ri$%taurs"%ramax#-ror-sponsored""s-$$used#%keyed#*translated"&ttened")x\'n\'match!(krtchyan',
+    '!#nla!)odel-girl"$nger#(ologuing#&tanaro$%elado"&onwort#%rpark"#pes"#ret"$sflm#$rite"%uphty")vie-maker!#pis',
+    '#(slinging"\'leteers#*ti-element&&zoning%$mate%$port""mp"&nroist"#rsi"#sar"#tis!$wezi!+ythologised)#zed &nagini',
+    '"\'rratori$)owcasting""sd"+turellement!#bdc!#cnc""sa!*ear-famine"#bes",o-classicist$(paganism#%phane")rc-funded##one"(ttlerash',
+    '"&wpaper#(s-making"-xt-to-nothing!"ha!%iceic##hed#%olosi"(ghtrider"(ne-panel"%tride!\'o&mdash"&-score#%theme"#erc"$isey',
+    '$*controlled#(resident$\'otating"$osed"#pwc"#rbu#%dwand"*se-pulling"#tam!&u-grip"#ked!"yu &o-ring!\'ak-aged!"bd',
+    '!*cean-floor#$lots"$hred"%tubre!#ded!$ffen!%gburn!"im!#mdh"*nipotentem!\'n-trial"*e-man-band#%sided"!i#$mode',
+    '!$odle!%ppian!(rdinated",ient-express""mo"+nithosuchus!%smone!(tterness#$ilia!)ut-gunned#&fitted#&gasses#(let-pipe!&ver-40%.commercialised',
+    '%#hit%\'powered%\'staffed\'%uffed%)tightened$(breeding$+compensated$(dressing$+generalized$)producing$%sleep%\'taffing!,wner-breeder!%xalis %p\'ing',
+    '!$acha$%elbel#%k-ice"$duan"*edophiliac"*ge-turning"%iakan#%ntin\'"#lam$%ntype#\'letized$%iated"%nerai#"ge#$nini',
+    '##ows",rajournalist$#mat&!x#+entheticals#&kwater##mer#,ticularising%#ndo$(y-pooper"*ssepartout"+ternostered##ris#$ulin"#xus',
+    '"%eress"\'netrant##ken#(sion-age#&thurst"\'rgolese#$isic$$wigs#\'mifique$&utated"\'t-owner#"ie$%llant#%rocon#"zl',
+    '#&t-etre!*hiliphaugh$$omen".oto-retouching%\'setting")reespirit!Ei&mdash;approve&mdash;a&mdash;package)=prepare&mdash;a&mdash;package)Aupdate&mdash;module&mdash;details)?view&mdash;module&mdash;details"$ched##ken$#in\'"+ggy-backing#$nose',
+    '"(pedreams""re"#sac!&lanxty#&teaued"&otprog##wed!"ma!"na!#oco"+ker-playing"%ldauf#%ytech"%ncin\'#$ding',
+    '"#oka"%p-gun#"ay")rk-barrel#\'poising#(tencross$$unus"%st-eq"*tentiating#$ter\'"$ules#$sada")werscreen!+ram-pushing",e-adaptation',
+    '$$plan$\'science#$cess$$oded#$drag#(planning#!t"%ocura#$gams##sit#-tein-a-column#&wl-car""si!(silocybe!\'threads',
+    '!%udemo"\'llwound#%vinar"$ndir"%rslow"$tloe &q-shed!5uasi-non-governmental"*een-mother"\'icksoup"#lis .r&eacute;serve!%-type!\'abobank"\'gnachar',
+    '"%isin\'"!k")ndomising#"ke#&lodden"%schid"&t-hole#&ionals!#bst!*e-animated$%rming#&baited#*circulated$*onstituted$&utting',
+    '#&evoked#,incorporated%)vigorated##met$\'odelled#*oxygenated#$play$"ot$\'romoted#(skilling#&titled$&ooling$%yring#%zoned"*ady-to-run',
+    '#)ggregated#\'r-guard#%ttach"&bodied#&randed"*calibrated#!d#)hannelled$&unking#(ollapsed$\'nquests$#rde&\'keeping"%dmate#&ounded',
+    '"%faced#&ronted"$gall#&ulares"&hashed"#iff"\'knitted"&lining"\'mapping"(plotting#)ossessin\'"$seda$$lect#$oled%#ing',
+    '%$lrig$#udy"(trenched"#vol!\'ich-kid$$ardi"$gali#!h$)t-to-work"!t"(ver-side$%tting!&obinia"\'dgersia"%elofs',
+    '$)erfurling""my"\'salinde#\'tadalen"$thay#!p#!t"\'ughcast#(sseauist#*te-sharing"(vertrail"$yall!"sh!$uin\'"(mblefish',
+    '##mer##ple"\'nabouts!#vfa %sabat""ef#!r"$hibs"%khiet"\'limbeni#\'vadoran#%yut-7"#nay#%darac#\'itizing',
+    '#\'onified"\'tisfice#\'zenbrau"+ut&eacute;d#$vant"#vor"#yin!\'cabiosa#"nd"%heves#&lattli$(oendorff#&wimmer"%ottis#$uter',
+    '#&eeding#\'iblerus#$olly#&uffing!(ea-grape#%sider##ven"\'bestyen".cond-favourite#"re"#eck"&induin"0lf-administering%+portraiture%&rating',
+    '"-mi-fossilised%)paralysed"%natus#,sationalized"#rai#!g#(monising#(vicecare$%owarm"$tted"&verall!"gx!%hamji#+pe-changing&(shifting',
+    '"&illong"\'ogunate#"la#$mron#\'psoiled$%watch#+ulder-strap"$roff"#tib!)ide-plate$&lining"\'gillata"%lburn#!f"%mpers',
+    '"#oli"%regar#!i",xtysomething!,killbuilding"(ywriting!&loaney#\'ganised##osh#-w&rehy;moving!)mall-mesh"%okery#)oth-edged&!e!\'naffles',
+    '"*owshooting!$obek""ce#%ialis()t-realist$(ologique"%fteam$\'hearted"#lan%#ine$%rtron"#mak#&ehting$$tin\'"#nix',
+    '"&uffles#\'ndcraft%$wave$$ness#\'thcoast"#vam#!e!.p&eacute;ciale"*aceglazing#)tchcocked"&eaker-#)llbinders"&inifex#*ritualised#%ttin\'',
+    '",ortsfighting&$link&%world"\'rouches"$umed!)table-lad#\'ge-prop$$ging#%nzani#&rching$$gate"*eam-roller#"eg$&l-mill%\'working',
+    '#%ymann"%ickit#(ff-armed#(lligarry##ped"(one-chip#%rcomp".reet-by-street$%psils#$obed$&ng-box$#wan"\'ud-farm#-nning-looking!+ub-basement',
+    '#)goalconds#&orning"%ccuss"!f"&lindac"&mmated$#ink"\'n-power$\'worship#%leigh#&splash"&percop%#fan%%glued%*note-voice',
+    '")rcharging#$fin\'#$tout"$tkus!%wanne#"ti"(eetwater"&ingin\'"$oons##tty"%yving!#zot \'t-block"%piece"$unit',
+    '")il-waving##ssy"#kko"\'llgrass"%m-tam"%ngram"\'p-dance"$ring"#shi"$uris#$ziat!(eamsport#"ze")chnophone"%dding',
+    '",lecanvassing%,omunicazioni$)recording#(lenorean"+mple-mosque#!s"&ndance$&erised#%oning"%rnate$!e"#sam#)t-driving%&flight"%thyan',
+    '"\'xt-type$\'urising!%h\'say"\'ackwell##new#\'t&mdash"&eogony#(sauruses"(icknesse#(ngamabob%!i$"ke"$oloi"&reated$(shergate',
+    '!%ifosi")ghtlipped"0me-inconsistency%)recording%(sequence$%saver"$ptop"&tmarsh!#o\'t"%-date"(dbringer"$llis"#nio"+othbrushing$#in\'',
+    '"$rsen"!u"&wnhall!&raiano$$nin\'%(spotting#%nsair%(formists%+g&egrave;ne&&ressor%%iency&3nstitutionalization&*stor/diode&&t-type\'.ion-management',
+    '*!.%&lantic\',tion-related&*iterations&\'ocating&&uminal%\'mediair&\'igrants\'$nase\'%ssive\'\'ttivity&$odal%+nationalist."ty&\'euronal',
+    '&+ersonalized&)irational&*lacentally((ntations&&ortion&\'ression&&yloric%%rapid%\'tainers&"ec\'%nsile%,ubstantiated&%ranic%/verse-traceless#"p.',
+    '$$peur%$iste&!t$&setter#$shes$$sard$&tamara#%tment#&uffler$&matise$%snitz#(vel-book\'(sickness\'&writer&$ator',
+    '&$lin\'%$sano$#is.&!s##ygo"\'eadgold%&wheels$,sure-hunters()r-general\'"ie\'%y-led)%owned$(tability%-ment-as-usual%,y-initialled',
+    '("ck#%dgold$&ington$#way#,e-and-branch%%based&$lood&\'ranches%(dwelling%&filled%\'growing)"th%%holes%&lights%&shaped',
+    '&%trewn$&bridge$$like$&s-r-us%$tump##fil#\'garrick$#ian$"oe%"le%!z#&halose$&erbert#\'ib-haus#&lawnyd',
+    '%\'is-work#&maston%#ton$%blant&%ingly$%edous$%oille#+nch-systems&%coats&%ermen&$town$(d-setter%(elenburg$)tino-alto%#men',
+    '##sch$&illian$#kin$!p%!a#!t$)ocephalus#%uddyn#"ve%#lez$#isa$#ors#$wick$%sbury#!y',
+    '%!r"(i-atomic%$xial$\'cameral%*ontinental&$unty$\'glossic$\'lingual$(personal$!x#$aled$%ngled&\'ularity)$ting+#ons',
+    '$%zines%%ophos#&badism%&listic)!s$,oluminescent$%unale%*te-bearers#(ce-rolph$%hinae%(ologists&#mes$#ity$#key%#ily',
+    '&$ings&!y%$sily$%olors%)ntinental#\'dactyla$"om#1ed.tested.trusted$$nnes&%ially$&rarchy$$sman#(fasciata$!t#&gemini',
+    '$#lav$$onid\'"id#!k$$onis#!l$)by-hatted$#cot$&ineata$"l.%)ion-worth$&obatum#)maculatum%$rans$"er',
+    '#&nacria$%itate&)robenzene/)sulphonic$%ketry$&uclear#)p-hammers$\'artitum$&ehound$%hasic$%laris%(e-combed\'\'fronted$+od-cauldron/!s',
+    '$\'ped-out&"ry%#ily##rex#&s-edta$%combe$#haw$)t&acirc;o##tan&(taikhmes$!c$"ec%(rpenoids%"st$&icales',
+    '$$tyes#+umphalistic\'"us$$nfal%#ity#&vialis"!k"-na-substrates#%ovski"(obriands&#dge#%chaic%"ee%#lea(!r',
+    '##gen$#lio#&isgros$$tsky#"ja#\'ll-like%"ac%#ish%%opian%!y#*ndhjemitic$"to#$olls$)p-carrier*$ying',
+    '%%s-out#$pers$(hallaxis%\'ozoites$$icos%$smes&#tic$%olone$#sch#(tternish#/uble-and-strife((shooters)\'tirring*$rewn$#eil',
+    '&!y$+ser-pockets((slashing\'%shock$%tdale%!s$\'vailles&"nt%$oada#&welful$"se""pe""s."&uanted$"th',
+    '#&cently$\'k-loads%#ful%%maker#"de%"au$$gett$$ovik#"e/$%image$%steel#)kachevsky#%mbach$#eau$"ka',
+    '$+pet-blowing($call($like(&player\'!y#&ncates$%dleys$%kfuls$$nion#$sbut$&sed-up$)t-control&"me&(property%\'fulness',
+    '%$iest##tch$2h&rehy;conditional%+-predicates%+/occurrence#%voice"$wsgl"&y-outs$\'scorers#"gg#$outs##pho$(sin/edta\'\'ization!(s&eacute',
+    '""26"$a250#%dihim#&ngaris%"po#\'tskeleh#&vliris""cc#)haikowsky"#d-1"%e-hsu#$lane#\'ntralny#\'rengiyn#$tsen',
+    '$$ring#(ikalanga#$ombe""im"\'mchange"!n"&oungui#%volas"$uneo"(vangirai"!y!.t&dollar;5,484*+794,200,000""a6"!l',
+    '""ns")x-treated!#u\'i"%-bong"%amotu"&b-like$&shaped#!b#(e-making$$less$#man$0roses&mdash;five\'%ities$\'workers#%ingen',
+    '$"rg#$ridy#$uais$*lovesicles"(c/labour#$hler$#yna#$k-in$\'ed-away%#red$$shop%$wood##san#%upita"*dor-gothic',
+    '#$wick"-e&ndash;thurs#&s-thur$!.$!d%,ay/wednesday"(ffaceous$#nel\'!s##nel#!o"&gboats#%gings$!s%"es',
+    '"#las##bah#&ipwood#!k##lah$#ett$%ibody#!p")mbledryer##mle$"on#+our-induced&#ler#"ps##tum',
+    '&&uously"&naboat$$fish$!s##cer#$dish#%ed-in#&gstens$)uska-like#&neller$.icliffe-wilson#+stall-pedoe#\'zelmann"$plin#.pence-coloured',
+    '"$rabi$7ngal&icirc;la-symphonie##bas$)idometric$\'o-frodo&*generators%%image%$loft$\'ulently&!l#&comans#%dakun#"er#(f-roofed$!.',
+    '$#ons$#sta#$k-is$#eee%!r%$witz%+y-flavoured\'$iraq&#ing$.ish-controlled($held((speakers)$tyle$"le#$leys',
+    '%&rounds%&tables$&abouts$$down$)er/stress$\'furlong$$hout$\'ip-like$#ley$+s-of-phrase#%onian##rel$%ialba%"ll$!r',
+    '##ker$$less")tenkhamen#*or-student%(/student%$ship#,si-dominated$$oane#)ti-frutti$%y-bye#\'weiller$&orkers"&waitha")xedo-clad"%ymans',
+    '"%-less#\'scanned%$reen"!."&/radio"#oeu"(rdohlavi!&w-9000"+eed-covered%)ly-deedly%%mouth$!l$#tie#%lve\'s&(-and-six',
+    '\'%gauge\'$line\')month-old\'$step\'#ten(#one#$mlow##nte%$ies.\'/th&rehy;century)*-centuries)!s%&y-acre\'\'country\'+five-minute',
+    '(#old)-ur-hour-a-day,$page\'(kilogram\'\'one-gun+)year-olds\'$room\'(six-year(%torey)$rong\'&twenty-%-five)&o-year\'$yard((ear-olds',
+    '&#two"*ice-a-year&\'monthly&\'nightly&)postponed#$ggys#&n-cars&\'ylinder%$pack%%sided%$town&$urbo$#ame$#fix#%stles',
+    '#%tchen$\'terings%#ing""ll",o&mdash;year$/rehy;and-a-half)$tone#1-and-a-half-miles/(year-old($nine(#two%%rched%(t-a-time$&backed&$nded',
+    '%"ed&#rth%$oard&!b$#can&$reer\'%riage%%hoice%\'oloured&\'nsonant&&rnered$(division$)electrode$%field&%fteen',
+    '%\'or-five(0the-price-of-one\'!m&"ur$$hole%6undred-and-fifty-pound,$yard$*inch-thick$%judge$$link%#ove$%marks$*on-one-off%\'ver-two$&period',
+    '&!n%*layer-only%$ress$&record$#say%$core%%eason%#lot%$tack&#one%&ubject$%third&)ousandths%$imer%\'o-three',
+    '%%rades&%olley%*wenty-five$+up-two-down$&valued$&worlds#$.way##hig#&player#"th%$irds")r-y-felin"&ynholm!#x.1$!0',
+    '""ii#"ki!#ydd""es""la"&ndalls#\'ebridge"!o"&paldos#2e&mdash;module.log$&-cases%(founders%\'written$$/pos%%token',
+    '$$talk#"ha##ica$"n\'#*ologically"$r416##527$!3$"51#\'annidae&"os#\'connell#)e-fuelled$!d$$less',
+    '#&osines"%silio##tie"%throp!!z"$aban#"nd$$ibey"$omet"#uke#!r (u&bsol;1"+ccedil;agiz!(\'-shaped!#-12',
+    '"#day#(ominated"&ni-ted"$rich#"od"!u!#.47""8s"$b.c."$e.c."$f.c."!p"&s.g.a.$"m."$v.i.',
+    '#!2#!5!"1*""44"#8\'s#!0#!s"!9!$2ish!"48!\'6000/65&"85"!3!!8!!=',
+    '"#mha"!n#!c!"b3"!4"%atuba"#hal#%ejane"$inig#&quitin"%riaco!#cdc")ed&eacute"+h/middlesex""ky',
+    '"!x!%dairn"-den-wentworth"!e#"ac#!y"+g-supported"%laidh"!n!&ematsu"\'tliberg"*xk&uuml;ll"(zd-level!&fegeat#"nd',
+    '"$land"!p!"gb"%c/ufc"!i""ni"%oleto!*h&ndash;1b",-uh-uh-uh-uh"#f-1"$land%!s"!t!&i-gyun"&lleann',
+    '!+k-appointed#%built#\'ireland$&talian#*registered#"us"#/ec#\'ireland#"us"#201"#a/l"$cccr#"mg""ky",rainian-born',
+    '"!s!*lcerogenic&"us#"ha#!i"+ema-i-islam"&fberht"#ick#\'ginosum#!s""ke"#les#$sten"&oruaha"!p',
+    '"$rico"!s#)ter-scots""ti#.ra-belligerent&\'careful\'&ompact\'$urly&)effective&(feminine&+high-vacuum&%large\'&iberal&-nationalistic1!s',
+    '\'\'owerful\'&recise)(stigious&(reliable*%gious\'%unner&%short\'&ilence\'#lim&%vivid%%mafic\'%rines*"os%*sonication&+tructurally',
+    '#"us"%ulate##ndi##sow"&vaceus$#eus"$wazi"\'yanovsk"$zana!%m673a%!b"#ayr$#yah"$berg#(ilically',
+    '"!d"#eed#\'taliyev")kulunkulu"%m-ing#%ayads#!m"(ol/kg/24"&pirage#%tieth")slopagaas!%n+1rn"(-adapted#%being#)chartered',
+    '#&funded#%group#\'harmful##man&%dated#,organisation#\'policed$&roofed#*registered$\'ight-on$$oman#%style#*understood%$ited$#sed',
+    '"+abbreviated#*cceptable.$\'tivated#"de$\'visable#-ffectionately#+ggressively#$imed$#red#&lloted%%uring#*mbitiously&&valent$\'endable$(iability',
+    '#)ppealable%(rehended&+oachability\'\'priated#&roused$&tistic#\'scribed$+sailability%&embled%%uaged#\'thletic$\'tempted#\'wakened"&badged$&ptized',
+    '$$thed#&earded%%tably%&utiful$%nched#\'iddable$$lled$%nding$&rdlike#&looded\'!y%"wn#%oiled$%keled$$mbed',
+    ')$ness#%raced#(udgeable*!y\'#ted$(rdensome%)eaucratic$%ttons"+calculating$&ringly$#sed$)tegorised&\'red-for#!d#!e',
+    '#%hancy&$ged.\'%ingly*$ness%&rtable$+ronological$$urch#(inematic##kel#(leanable\'&nesses\'#sed&%r-the\'!.$"og',
+    '$\'ubbable%&stered#&oerced$(llimated%&onized$&mbined%"ic%*panionable\'(ssionate&)licatedly&$ress$\'nceived\'\'ntrated&%luded%)ditional.',
+    '&\'idently&&licted&&ronted%,scionability&%ulted%(tactable&)entiously&&racted%(vertible$$oled$+pyrightable$&rseted$\'untably$(venanted#%rewed',
+    '%&shable#%urbed#&ynical"\'dazzled#(ecodable$$nted$&ployed$0r&rehy;estimated+%lined%.-&dollar;5,000&$13\'s&#211\'!2\'!4&#65s',
+    '&(absorbed\')ssessment&(bailiffs&%count(#ver\'&utting&+declaration(+termination\'\'octored(!g&&eating\'(ighteens\'*numeration&*housemaids&(informed',
+    '&#let\'$ying&(managers\',echanisation\'$ined&*occupation\'&fficer-!s&$paid&$rate\'&eports&)seventeen\'$iege\'&killed\'&teward',
+    ')!s\'(he-table&+utilization&%water(!y\'$rite%&active%(capacity&&harged&&lasses\'#oth&%oated%-determination&(iagnosed&\'rainage',
+    '%(educated&)mphasised&\'quipped&(xploited*#red($osed%&filled&$lesh&(urnished%%girds&%olfed\'"wn&&rowths%&heated%(landlord',
+    '*!s(!s&%essee+!s\'!y&&inings%*maintained%&parts.&%lated&(rivilege\'&ovided%%sexed&%hoots&&killed(#rts',
+    '&\'tatedly\')imulating."on\'\'retched&\'upplied)%orted&$well%%taste&%hings%$vest%%wound$&sirous%&troyed$&tailed#*irectional',
+    '%\'counted(%raged&*ussability%(guisedly%%posed&&utedly%2tinguished-looking&&ressed#\'octored$#ers$"ng#(rainable%)matically$#ied%%vable',
+    '$#unk#%ulata\'#ors$%tiful"*ecessarily$&lipsed#)difyingly#\'goistic#)laborated#,mbarrassedly$(ploye-ed#(namoured$(croached$,forceability%)ranchised',
+    '$&riched$%vious#!r$$otic#(ssential$(terified#*vangelised$(ennesses#\'xacting$&celled$\'hibited"%faced$%irest$,shionability%\'tidious',
+    '&"om$\'vorable#&ertile#&igured$&llable&$eted%%mable$&ndable%\'ishable$"sh$"tt#)laggingly%&ppably$$exed#)ormalised',
+    '$\'ivolous$%ocked#%ucked$%nding%%niest$%ssily")gallantry$\'rnished%"o.#%entle$$rade##irt#)lamourous#+raciousness%#ded',
+    '%&tified$%eenly$%idded#$uent$(itractor"(hallowed$%ndily&$some$&rassed#(ealthful(%iness()y-looking#\'istoric$&tching#%ooded',
+    '#\'umorous#+ygienically")i-variant##ced$\'yclists#!d$"as$\'entical$,irectionally#%e-mrg#%flora$\'ormally\'%ities#&glumis#$link',
+    '#)mprovable%\'ugnable#*nspiringly%\'tructed$*tellectual%\'roduced$&vented##on*%(-african&%based)$hing\'&usting&,czechoslovak&)dominated&+independent',
+    '&&labour%!e%"s.$$plus#$plus#)rradiated#"sh$#ist$\'oculous$&ql/4ge$#tar#(t&agrave$(-of-work$\'/credit$"ar',
+    '$\'ed/15th&!3$"s/&\'hectare&"mg#.versal-banking)!e)\'isation+"es*%zable\'&itario)#eit)!i)"y/++polytechnic',
+    '#)x-related%/with-everything$$/386%%xenix$%alike$%press"#jam$&panese#\'ustness""kn$"ot%*wledgeable#&ovskii"(landable$%shing',
+    '#!d##ent$#sse$&velled#(iberated$#ked$&nkable$(psticked$&ttered$%vable#\'oosened"\'magical$$lted$(nageably%)oeuvrable',
+    '\'%table$$sker$&tching%%ernal%$ured#\'enacing#*ineralised%$uted$%xable#(odulated$#ral$%ulded$%vable#&utated#)yelinated',
+    '$%rstan$"st&"ed#)ikrishnan#)oticeably")objective$&liging#&ffered#\'rdained$(namented#)xygenated"(pacified$\'dlocked$\'latably$(rodiable',
+    '$%yable#\'eaceful#(laceable%&stered%#ted$.easant-looking*$ries&#ted%$dged#%olish%&luting$%mpous$,ssessiveness#0redict&rehy;able$&ofound',
+    '&$oted%$pped%(tectable)#ion\'\'stingly##ubl$\'nctured$$rged%$sued"*quenchably"*radiogenic$$nked$&tified$&veller%%ished',
+    '("ly%$lted%\'rranged%(sonably.$(bellious%$uilt$*ciprocated%(ognition&&mpiled&(ncilable$\'dressed$&fereed%)lectingly%(urbished$\'luctant',
+    '%&ovable$(pairable%%laced$&sented%(ourceful%$tful&!s$&tarded$\'visable$)wardingly#!g#%hymed#%idden$%ppled#&oasted',
+    '$%mpled$&nnable$&ptured$$shed"&safely$&veable#%cenic$)lerotized$!r%&atched%+upulousness#\'earched$)ductively$\'gmented$.lf-consciously',
+    '$,rviceability#&hapely$$eath$%riven#)ignalized&&posted$&lenced$$pped$#zed#\'leeping#&napped#%oaked$(cialised$$iled#$pilt',
+    '$&ooling#%tably%&llable\'"ed%$rted%%table&\'emented$(ead-joss%$mmed%$pped$#ick$%ocked%)ppability\'"ed$%riped',
+    '##ual$(bjugated%&mitted%\'scribed$&pplied$&reness%%veyed$\'stained#\'witched#+ynchronized"\'tamable$)rnishable$%xable#)ectonised$"ll',
+    '%$ured$(rhaltung%\'minated%(offizier%&wasser$)stability#&hanked$(ought-of$&reshed%$ifty#"i1$$dier\'"st$#l13$(meliness',
+    '#\'ouristy#&racked$$endy$%odden##ung"&united#&ttered")varyingly#(egetated$(stibuled$$tted"\'warlike%(rantably)$edly#&earied',
+    '$)sternised#"fp#*holesomely#+in/cotswold#(orkable.%\'thwhile"*yieldingly!#ogl""vo!*p-gradable#!i#(lighters#$pipe#%rated#%scale',
+    '#$time$*o-dateness&#the"&.there""/h"(4800/605("25("30)!5"#_at"%adaya$$haya%"ya#"ng"1dates/supplements',
+    '"\'graders"&harsin##off$&lsters"&ington"\'landers"5per&rehy;middle-class%&-caste\'&lasses\'#uts&$deck&&school\'$pire%%class%$side',
+    '"*regulating"+s-on-a-card##ala%!e#%hifts##ize#0tream-downstream"&thorpe$$rown%&usting"&upidae"*valuations"+ward-facing(#low\'&moving',
+    '%#ped"!x!&raguay#$lium#.nium-enriching#"ta"!b#&anizer"%d-pct"1ea-polyacrylamide$%/page#$dale#&thanes#(y-miller"%iarte',
+    '$)e-scented"!k"%nasch#"es"(o&scaron#(-genital#-cyanylcholine#(dynamics#"la#)phasianus"!p"#sio"%ticae&$rial"+ueu-wau-wau',
+    '!.s&dollar/month)&;1,010-"20-"30,#140-"50-"90,\'200,000,#360-"70,#410-"60,#540,#650,#850',
+    '+&.00=120%3,2170\'4,199.4/&2.6638/"35/&4.7367/$5.001$28191$3241/\'799.087/\'91.0709//a&dollar;1.2866:$3067/-b&dollar;1.00/$can.',
+    '0&6.1702/+l1,225.3012/(md7.8638/0nz&dollar;1.6339/\'r2.54592$6638/)sfr1.41764#565,!5+%0,500,!5,)7,000,000+!1,$,600-#700',
+    ',!9+!2,$,800,)0,900,000,!5,)6,000,000+!3,(,000,000,)6,000,000+!4,(,750,000,!0,)2,000,000+#5.8,)3,000,000',
+    ',)4,000,000,!7+!7,$,200-#600,)0,000,000,)8,000,000+%8,000+!9,$,900,".5,!9+&=5,000*%2,006,#150',
+    '-"40,\'400,000,#540,#650,#750,\'800,000,#948-"80+%0,600+)1,000,000,!0,!2,)4,000,000,!5+*20,000,000',
+    ',$,000-\'300,000,!5+!4,$,500,!3,!5-(,000,000+*59,000,000+*60,000,000,)4,000,000+"70+*82,000,000+"95,!9',
+    ',\'200,000-"40,#350-"60,#400,#520+".8+%1,000,!0,!5+!2+)3,000,000,!0-$,000+)4,000,000',
+    '+)5,900,000+%6,000+)7,900,000,!0,)3,000,000,)7,000,000+!8,(,000,000,!0+%9,000,!0,)5,000,000,!9*)4,500,000,#600',
+    ',#700,#980+%1,000,!0+%2,0000$,000-\'500,000+)3,500,000,)6,000,000+!5+*64,000,000+*70,000,000+!9*%5,200,\'300,000',
+    ',#600,#700+"20+*40,000,000+)8,000,000,)3,000,000*!6+$,300/$,000,#900+*00,000,000+"10+%2,000,)1,000,000,!5',
+    '+)4,000,000+%5,0000$,000,)0,000,000+"70-(,000,000+%8,000+!9*!7+$,400,#500,#800,\'900,000+"30+)4,000,000',
+    '+"50+%7,000*%8,300,\'500,000,#700+&00,0001$,000+)1,000,000,!0+"25+*40,000,000+%5,900+%6,000-#500+)7,000,000',
+    ',\'500,000+"10,)5,000,000+!4+"50+)7,000,000+!8")-and-them$)ustralian#%bound$#red%&okered#%cuban#%latin$%isted',
+    '##rda"%/nato$"ew#\'vietnam")75melanie"#_in"$a-94$%based$&soviet""ch#!i"#doe$!r"\'e/abuse$+environment',
+    '%+mdash;input$!-%*confidence%&driven%&groups%\'managed%$only%,programmable%%ready\'%lated%*unfriendly$#.id$*/community$!1$"s.',
+    '"#fws"$hida"&iminas""pd#%ensky""s.#"ed#!f""ti""u.##all#\'baliyev#%rians#%sally!$tans',
+    '"$ea-1#(nsilibus##ral$&otubal$$uses#!s"$hany"(ica-rome#"le"$onai")sly-gtsly"(terance.%$back%$ings!%ulaan',
+    '#$lamp#\'visible"!7"&a-ursi"#ula!-wilingiyimana!%x-120""/v"%orial%\'ousness%!s +v&agr;j&agr#&mp;rwc")eacute;cu)"lo',
+    '*"us)#ran*4tessz&ouml;ll&ouml;s)$zina"&plusmn!$(d)j!%*opss!#-1s""8i"&baffle")compliant"$like"!q"&shapes"&tailed',
+    '"$very!#.14#!5""22#!4"#3.1$#2.4"#4.0$!1#$/386"!5"!6"!7""b."#c.s',
+    '"%i-iii#!v""v.!"/f"$stol!!0!#1.1")0-powered"!7!"20"!3!$3.11"!d!#4.1"#86m',
+    '!)6-engined!$7101$!2"#484"#672"#799!)8-powered"!i"!s!$a\'ai"$agso##sen"#bra"&caflor$!s',
+    '$\'inators#!s#*ualisation$\'ousness$+um-cleaners""da#&inimia"#ega#$laes"(gabundus$#lly$"ry#\'inismus#\'otomies"$haji',
+    '"/i-transcription#/llant-couturier$!s#$ncus$"er$%queur"%jdova"#kif"1l-pro-asp-pro-arg#%bonne#9d&eacute;s-salda&ntilde;a%4scaron;tejnsk&aacute3&eacute$#eir#\'entinos',
+    '#(ga-valka#\'ify.crc#%kanov$\'enbourg#+l&eacute;es$!a%!y$$e/1e%%nilla%%yhead&$side$%iappa%%ncola&%icola$#one',
+    '$"et#$ores#.para&iacute;so$#oni#&sabbia$"es##tre#$uble$"e-&)conscious&\'freedom&(judgment.!s&$life&\'neutral',
+    ',"ed&+subtraction.#ors&&theory%\'station#%vasor$&e-like&\'powered%$gear"\'mmoussa#%oosed#%piros%$shly$!y"&n-load',
+    '#%adate#(brughian$&utchel#3couver&ndash;london#&dellas%&rbilts&$meer&$wolf$!i$$jina#&enburg$#zis#\'guardia#"ia%$nova',
+    '$,lla-coloured&"in$%shes.$$tory#$lose#"ov#"ua%$\'aku%#aka#\'vitelli#%zetti"%pidly#"or%$izer$(ur-check',
+    '")r&formula#&angian$$sdin$\'tharaja#)coe-cocks#"do#)engeville$#yoc%!s#)gas/oxfam$!o#*i-coloured$-able-duration)(pressure%.tion-sensitive',
+    ')$ists\'"ve$$dase$,ety-specific$"na$#ola&$inum$&scides$$ties$!x##let#$mint##sha#(ta/bosch%!q',
+    '##y:r##zea"%scars#(e-shaped$&/faces$#nko#$ilev#)oactivity$,constrictors$)depressor$$ulla#!p#&saldom&"ic&"lo',
+    '#"te$.ly-experienced$&nesses#%udeva#(yuchenko""te$%nfall$/rl&auml;ndische$!s#"hi#"ic#!o##son#%thana$!r',
+    '#%doyer#+lx-en-velin#\'ntingly#*xhall/opel"$va\'u$$sour#&rousek"(x-11/780$(to-alpha#"jo"!y#!s"%zquez!"bs!#cps',
+    '"!c"!d"!j"!s#%/vcgl!#e25""ar##sey#!u"%chten#(torially$#ris"!d##ado#"el',
+    '#(ic/aryan#%renne"%erman")getables.#"ge##ies#!s#&tables"0hicle/pedestrian"#idt#!i#%nlets$#ous#%tchii"*l&eacute;z',
+    '%#ium#"be#"es$!z##ina#%leity$%ucent%&pillai#(ocimetry$#urs#!u#(vet-clad(\'ollared\'$dark\'+upholstered',
+    '&$eens$"ia"%nable$%tores$#vae#%ditio&"or$%or(s)&,-independent$$redi&"ly%#oux#$egas$\'rabilem&#tes',
+    '&\'ologist%$yous#)gefulness%#nce##ica$!r#)kateswara#"os%!a#%talin$)ham/hotel$#ile%&miglia$#ora$(romedial',
+    '$$uras&"is#\'us-like%$ians"$rard#(b-object$&alized$%osely#%denal$$ict.%"te#\'eenigde$\'inigung#$gara$$ence',
+    '#&haeren$&encamp#"ie$.similitudinous$%vakis#&jee/gp#&luyten#&meulen$&icular%(n-ridden#"n.$%adsky$/e-smith-duchini%"de$\'iciflua',
+    '$$ucas&$osus#-s&uuml;cherin$+aliusstraat$&e-line*!s&\'speaker$!h$%icles&$olor%$fier$$teeg("ii&"he&!r',
+    '\'(obasilar%!c%#egh$-ical-boilered(-ly-integrated&\'illaris%(ginously$$uous#$veer#\'waltung*(spolitik#0y-high-impedance%+large-scale"#sci##ito',
+    '%!s$\'ertinus$$idae#(tigially$$land$#ram$#ure""th#"te$#ius$%riano#"us""ut"#vey"!w',
+    '#(illarius"&zirlik(!s%"ov#$zosi!#f-7"!s!+h&ndash;uth""af"%f/uhf!#i-2#%sport""ae#"la#!s',
+    '"$bert$#tti##org#/ration-rotation&"os$\'o-blade&\'tactile%%blade%&coring%*percussive",c-de-bigorre#!.#,ar-apostolic%(s-choral#/e-chairmanships',
+    '%(director%&gerent%/president-elect$$ntes#$harn#"ia$$nage#5kers/northamptonshire\'$taff$"ie$!s#!q#.tim-complaints\'\'support&(izations',
+    '$+or/victoria&)ian-built*&gothic)\'isation\'!n&&y-odes"$dale#\'eazimut$!l$#nov$&o-clip&\'editing&$game*!s\'\'raphics',
+    '&#out&\'pirates&\'screens%!.%!/&%audio&$long&#raf&%simon\')tratfield&6wendlebury/oxfordshire\'(orcester%(graphics%$link##ich',
+    '$!n#%phone(!s"#ega#%illes#*ler-porter#*nnese-born#%t-nam$"as$,nam/cambodia\'*ese-soviet#*ux-mareuil#\'w-based%%panel%&record',
+    '$#_of$$case$$plan%$orts$\'station"1g&eacute;e-lebrun##dis#*na-wilberg$#eau%%ronne$!y#-orous-looking($ness"#i.8#%/viii',
+    '$!a#%nanen#!s"%jayan"#kas#+ing/penguin"*l&eacute;m#"au$$yets#$drac#*e-smelling$!r#$iami#\'la-lobo%"ch',
+    '%$ges.\'!y&\'ization%%ncico&#ies$$elme%/nauxe-la-grande%"ri&*s-allerand$#ino#%strup##yui&"sk"*naigrettes#%cenot',
+    '%%remos%!s%"tt#$dica\'%tions#*e-dressers%$like%&shaded$$gar.$%holts$(r/thames$&stocks$&yards.#(gt-et-un#%icius',
+    '#"ko#$land##ous#(yl-based"&olacea$"es%+t-patterned"\'peridae"(rabhadra$+l-hepatitis#&gaurea$$hina$\'inianus\'!o\'%tatis',
+    '$%haure#(list.txt#\'oconium$"la%&ogists#+tual-memory#"um$*s-carrying&(infected&(specific%!.%#can",s-&rgr;a-vis$%d-vis##/tp',
+    '#%cerum$\'ometers%(se/linen%%untcy&#sly#!i$#ans$)ble-light$"ne$\'onarium$\'tazione%!e%$ings%"ng#!o',
+    '$#upi#)ual-motor&(ly-based$&omotor#(wanathan"%talba%"ie%)ly-needed$*min-a-rich(!c(&packed$"ni$%point#"ek$%llius',
+    '#&iation#$nery#&rearum%!x$#ine&$itic#$tles$#ore#)uperating*#ons#$znau"#ura"$vant&"es$#ria',
+    '#%ement#(id-green$&parity$*sectionist"$zard#%inhos#&zavona!%kp(b)!$l348"#a-1$!2#!.#-dikavkazskaia%*m&iacute;r&#iro',
+    '#"ho##sta"!c")eesidence"!l#"lb""ns!%m/370"!a"$e-64"$s300!\'nseable")utrennikh!$obla")cabulary.',
+    '%$ises$1tionally-oriented#"em#$ibus$(feration\'"us#$kins#$oder$#uma#"um"!d#$icka"/gelh&auml;ndler#"on#$uish',
+    '%*/volunteer#%dance$$oids#"re#!s$"in"&janovy#+t&ecaron;ch$!a$#ech"%l\'sky##.16$!2$#iii#!/',
+    '$\'tilises#+canological#"ke%&nstein$#ish$&ogonov%"vs$&spares%,wagen/turner*$werk#(lenhoven$$rath$!y##mer#&odymir',
+    '#$stad#,tage-derived(%gated%"ic$\'e-faces$&meters#)uminously$,ntary-sector&&eerism$)te-krater#-vox-1/ctr-900)&sf-900)%v-900\'"ts(&w-9000',
+    '"(mitorium&#xin"$nnas"\'orthuis$\'uitgang#!v"%r/dme#*aciousness#$lich#%obiev%#yov$#nov$&shilov$"ta##rsa',
+    '$$ical"\'sloorus"$te**$(-catcher$*r-friendly#!o"$ulez"%x-pop#".a#\'_populi!$p-21#\'planner"#/ix"#gpr")o/kleiber',
+    '"!s!(r-series"$4000&\'/vr4400&"pc&"sc#%400pc&"sc"&aimont$!s##nco$%itsky"!i"!t##xsa',
+    '"!c"!s!"t1#!1"!4"(52-vt320"!7"!s##oft"!x!$uela#!r"!g"(illermoz"1k&scaron;i&cacute',
+    '"+lcanization$!i#!g#%pinus#%vitis"#ono"!p"#ren!"v.!$x147"#653"#vmi!#yas"&ezzhye""on',
+    '#*hnegradsky##tar!$z303 \'w&amp;d"(divide;p"\'ndash;s"*uuml;rstie!#(x)!"-c"!d#"-l"!h"*registered"&shaped!\'.a.a.f.',
+    '"$c.w."$e.a.$!b$!d"$g.e.$%grace"$h.m.$"o.$%smith%%pence"$j.r.""k."#l.r"$n.b.""o.',
+    '$!m"&r.n.s.$!t$"u."#s.3$!r"!t"$w.r.!,/100/25/1001\'(6/1002-1,!8-"-1.!2+"10,!3',
+    '+"20,!3,!4,!5+"30,!2,!3,!4+"45&\'32/1003,!6$)2/24/1001\'&5/1002,!8,!9',
+    ',!3,!4$)3/25/1001,!5,!6,!7,!9&\'34/1001$)4/25/1003,!7$)5/25/1001,!2,!3,!5,!7',
+    '+"10,!3,!4$)8/25/1004,!6,!7+"14,!5,!7#*10/25/1001,!4,!5,!6$)3/25/1001,!7',
+    '+"22,!5$)5/25/1001&\'34/1001$)6/25/1002,!3+"11"!2"#300"+435/28/1001""nr""op!#124!"20!"45',
+    '!":v!#a14"#802"#984"!a#"ah#"ge#"na$$ders#"ta"#bag"*cc-related$%/la-c#&hsmuth$$ters',
+    '"#dal#%dells#,e/consultant$$nhoe$&r-like%"s.#!y"\'erebeek"%gadon$#gai#\'e-goods%(labourer&"ed%\'related%\'setting',
+    '$%nburg$*s/salaries#"ga$$iest$$oned%"tt#%oners%%train#.staff/national)&thames#)tail-like"$haya#"ba#,dat-i-islami#"hh',
+    '#%lgren#!n"$iles#$ners$&stones#"pu#(st-lines%#bag#&ted-we%*r/waitress&#ing$*ing-period"%jcman##iba"!k',
+    '$$hara#(e-forest%&walker$,field-harrey$(ly/coach$$ring#!u"$lawe#\'borough#%dbrol$&egrade%%ndale&!s\'$ians$#oes',
+    '$#ric$\'schmidt%+t&auml;dten%%zenen#"ed$"ns$$wska\'!i$"ys#$fart#\'igorski#\'k-about%#ins$$/jog$-er/cheltenham',
+    '\'%polio&&tronic$(ing-song\')/climbing$$outs$\'station$,way/cycleway#&l-bars%)coverings%(enclosed%&length&#ike%\'plaques&&owered%%rocks',
+    '%#top&$rack&#ype$#aba%-ce/weatherall%#sea$$bars$"ce$&ed-off\'"up%!s$%frame$$nook$&owings$\'planner',
+    '%$hire%$tent&#ile$#win&"tz#$more#%poles#%scott$%grave&#ove$(h/bishop%"es#+tz-caprices&&length%"er',
+    '#%-chen#&d-slim$"as$\'esworth$!o$$ring#\'garatta&!i$"el#%kdorf$$hede#$nian$%stedt#(ostrocht#&server',
+    '#"t-$"a-""pc#\'entakes#!i#\'lington#$pett"*r-affected$&bonnet*!s$%chest%#lub%$razy$%games\'#ing',
+    '$$news$\'scarred%(hattered$$talk$&whoops%%idows##.in#&blings$%osses$+urton/grant)!s#$c-92$"ry#\'d-based%\'jackson',
+    '%(hospital$%haugh$#low$#oyo$$ress%)obe-woman#-e&rehy;houses$-/long-sighted$*house-type))man/sales$$nnes$\'washers#$ford#$gasm#&ington',
+    '$%eader%%y/raf$&ingham#%m-air$"ia%%ngham$#ley%*y-received$#oth$,th-demanding#"na$#cke$+er-chappell\'"us$&ing/do',
+    '##per$&screen#"ra%$ntee\'/ies/indemnities$.ior-followings(%queen$\'nambool#$same%\'w-based$"op$$pite##ter&!s$$naby',
+    '##uru#*wick-based\'+shire-based$#ood#"yn"&s/were##_no##abi$#tch#$cher#!e#%h-bag%)handbasin%(leathers%$wipe',
+    '$&basket$$days$\'ed-silk%\'r/drier)#yer,!s&#ies&$s-up$&houses$*ing-powder$%lands%&eather$&stands$$tubs#$muth',
+    '$!e$$fish#&quehal#\'sailers%#lke$"er&$burg&&fallen$#ily#)te-basket&%lands&$pipe\'\'roducts%$gate%$pipe',
+    '$$nage#&ylenki"$tamu#(ch-strap&$word%$fire%&mender&#oor$"yn#(er-buses(#tts&&chutes\'&istern\'(leansing\'&ooling',
+    '&*dispensing+$rsed\'%riven&&eroded&&filter,!s&&garden,#ing($zers&\'holding)"es&$jugs&&keeper&&levels\'%oving',
+    '&%nymph&&pistol\'%oints\'&roofed\'+urification+$ying&%races\'(etaining&$shed\'#kis\'%oaked\'$pout($rite&&tables(#nks',
+    '&&violet&\'workers%$bike\'#rds%&cooler&$roft%%dance&$rops%%glade%(looplein%$mead\'(lon-pink%$nish%%pipes&$ower',
+    '%(sporting&$tair%#tap%&y-eyed#"ir#+kins/mother##ley#!s$#ham$\'on-watt&%jones#,tanapongsiri$(lebridge$&s/a420"$usau',
+    '")ve-lashed%)producing%$worn$&guides$&sports$$tops##ier$"n\'#(y-bladed"(x-coated$&filled$$like#$ings#%wings"$y(s)',
+    '$%point#!.##ang#$good#&lander%"ys$%eaves#&marker##ner%!s#"uu#&wardly"!z##oua#$zock',
+    '!#c1.#!v"!l!"d."!2"!f"!m!#e\'v"#177"$aith#)k-chinned%$eyed%$link&&ooking$\'enesses',
+    '#$lth\'#%nling#-pons-oriented#(rability$$iest$&withal#!s$\'el-like#,ther-boarded(#god+!s($lore(\'proofed\'$cote\'$hill',
+    '$#ver"*b-builders#*b/cellmark#\'erbauer#$less#"re#)ster/site"&ckmann##sel"$ddin&+g-carriages$"le$#oes#&emeyer#)ge-heeled',
+    '&%shape&&tailed%.wood-oppenheim$)wood-benn(!s#!n##ons")ed-filled%(infested%\'killers%$like%&strewn$$beds$!e$#ier',
+    '$"ol%"ns#"ed#$gram#$itch#&k-days$$.the$%ends.$%s-old#"ms#%niest#&piness#(ramantry"$fted"#ghe',
+    '""hr")ichselian##der$$haas#&gh-ins%*ing-scales%\'t-blood\'\'control\'&lifter(%osing\'(trainers&!/\'$body\'&volume#"hs',
+    '#!n$$bach&"um%$ergs$%glass$+reich-haste#%rdies%!y##ske$%sbach&%erger%&enberg\'#see&!r##ter',
+    '"&lberry$$ourn$#ury#+ch/phillips$(ome-home\'!r$"um#!e#$fram#-l&rehy;chosen*$made$)-accepted%%baked\'$rred&\'uttered',
+    '&(ontested%&darned\'#ted&*efinedness\'\'livered\'&tailed\'%vised&*istributed%*engineered\'$ough&\'xpanded($osed%\'fancied&\'ingered\'#red',
+    '&)requented&*unctioning%\'grilled\'%ouped%%heads(#ted&$osed%)justified%&lagged&&earned%&manned($ured\'%rbled\'%tured&$ixed',
+    '%%paced&%erson&&hrased&&lotted&%runed%+recommended\'%lated\')munerated&%ubbed%&sealed&\'ituated&%oaped\'&unding&&prings\'"un',
+    '\'$yled&(ustained%(targeted&#ied&$oned&$uned\'%tored$$beck$$deck$#ent%%rhorn%%sleys$$fair$&ing-up$$nigh',
+    '$$wood&$rths#%msley#+sh-speakers$$tead#&thorpe$&klasse#$wick"%micke"$nban##dle&0bury/oxfordshire%%inger$"on$#tii',
+    '#%nberg#&sbergh#"tz"%rbner##del%!n#%e/are$%found#"ff#$geld#\'kstatte#%leigh#"ne##sig#)tenheimer',
+    '"&sadlib#$chke#$htam#%licks#\'t-based&&urnham%\'central$.bury-on-severn20/gloucestershire,$trym$"en%\'rheimer\'#ope&+n-dominated(*influenced',
+    '."ed$.f&auml;lisches%$ries$$hill$%meads&"de$#ner$(on-baker&#ing$#ron$!y"&t-bulb$&haired$&nurses$%suits',
+    '#.herall/newsome&$dale&&sfield#%nurse#$zlar"!w"$xner"\'ybourne##don#$land##mss"$zaar!%f-495"#138"#562',
+    '!#gic"!n!\'h-where"!.""a%#"am#\'ckiness#"ka#*le-hunting&$like#\'rehouse$%fdale%"ed%#ing(#ers',
+    '#%shton$"sa&&matter&!t#0t\'s-in-it-for-me$$-all%/d\'you-call-\'ems%$ever%#for%,happens-next%/might-have-been%.the-butler-saw%\'you-see"$eat-&$free',
+    '#!c#)el-tracks%*chairbound&$over%)er/tenant)%hames%,house/surrey%$ings&!s%&y-bins$"sh#&ldrake$#med$#ton#\'re-ever',
+    '$"of$%ryman$$well#%teley$#tam##yey""go"#ieh#$ffed%"in#$ggie#%le_in%!y$%lians#*mbrel-like',
+    '\'$ings$$sies#%nbush$%forth$$hill$$nies$$ston#*p-cracking%(tendrils$$like$,per-snappers%#ier$%round$&stroke$!t',
+    '##rli%!o&!w#*sper-quiet#\'tbourne%,y-registered$$comb%$ross$*e-and-gold\'&proned&%blond)&ssomed\'%odied\'\'reasted&\'chinned',
+    '\'&rowned&%domed&\'fleshed&&garbed\'%owned\'#rey&&harled\'\'elmeted&&napped&\'sheeted\'&triped($ucco&)uniformed&&washer\'#ine',
+    '&)commuters&(director.%/oxon&&social\'&windon%$acre&!r%-croft-scovill%+house/susan%$inch%-ley/ashmolean&"ow%&nburgh%#oak%&parish',
+    '$$head$\'ing-out%\'sh-grey$(manesque$(ney-long$$sand%$bury$&temore&$ring$$wham%#ick%#ood#(zz-bangs&$kidz%&/small',
+    '""ma"\'o\'s-who##(m)#(-done-it#"ah#1le&rehy;heartedly%%-head&$life&%staff%"ly%+sale/retail%$time#$oosh$$pers%#sie',
+    '#(rehouses$\'f-sapir%#ian$%iskey$(tleberry"%smith"#uff"%y/why#"ld##man#$nham#+te-melville!)i&euml;se"$\'oot"+bbly-wobbly',
+    '#"le"%ccans##hit$\'uraiana#(k/thurso$(ednesses%(r-backed\'$work%0t-keeper/batsman$#man#\'quefort"%ddell$"ow#(e-belted%(coverage',
+    '%(lapelled&%egged&%ipped%%mouth%\'opening%&rimmed%\'sleeved$$dyne$.ly-distributed\')perceived((reviewed\'&spaced$*r/narrower#$more#\'ow-lady',
+    '%(/widower"&echers$!k##dig#\'genlied$#man#%ladek$!e#$ners##rtz##ska$$sner"*fe-beaters%&takers$(/partner',
+    '"\'g-maker#\'an-born#(eon-like##its#$wams"&htraed"(jnaendts"%ksell"%lches$$ocks$#zek#)d-flowers&&owlers%&haired%$west',
+    '$\'ebeeste%%rhope&!s\'#pin%!s$-life-friendly)(oriented)$rich$#men%#oor$"on#$ecki$.y-interscience##fer$&ridian',
+    '#.helm-lehmbruck%$mina#"ia$#est$$liam#"ke%"ns%!y$"o\'$!y#&l-they$&amette$&bourne$%ehalm%\'m-karel',
+    '%!r&#sey$+iam-mallaig\'%field\'&s-bred(+/auctioneer)%coach)(hereford)+oxfordshire)&victim)(williams(%onian%/ngness/attitude%)s/british&"au',
+    '%"um$!m%#ann%#ots$&ow-man\'$tree&%garth$#sey#"ms#%shier$#ill%#nho$,on-callaghan\')patterson&&/gipsy',
+    '#%tcher")malaratne#&berley#"on#+pey-gilbert$"ie"$n(o)#+-a-football$$os/2$%track#!c$,entraldirect$6hcombe/gloucestershire%#ess\'-ter/hampshire',
+    '%%field#+d-direction%$harp%$pipe%\'rippled&#ose%%sound&&tunted&%urfer%&thrown&&unnels$,fall-profits$$iest%$ness$(loadings',
+    '%*w-breaking\'\'dresser\'$like\'+motif-based\'(shoppers\'%table&%heads&,s-compatible((specific\'#eat$&proofs%$umps$$rose&"ws$"s.',
+    '&$oops%$ocks$%yhill#(e-cooler%\'flagons%)importing%(merchant%\'shipper\'#ops&%oaked%&tinged%&waiter$%/beer%%water&/hisky/champagne',
+    '$%fride$%guard&!m$%skins%$tead$!y#(g-backed\'"r.%&collar\'&upling&+um-fullback%$down%\'flashes%&margin&&irrors',
+    '%$pads\'%ttern&#lay%%veins%&walker&(innowing$).membrane$#er/&#son&%worth$%spans$&walker*!s$!y#$iata',
+    '$!y#%mills##nat&!s$,er-takes-all("he&!.$$ower#"ox##sby$3low/buckinghamshire$\'omeness$#pit$%table&!n',
+    '#)terscales(&hladen\'$teen(#oke&!y$#ney#!y"&peable$$outs#\'ing-out#!m")re-braced%#tap(!s$-less-operator',
+    '##ily$!n#"ld#"s2#\'tschaft*\'sprufer"$sbey#\'chmeier#$dens#(e/asthma$%woman#(h-images\'&pulses$!a%\'w-based',
+    '#&pishly"+tch-doctors&\'hunters%$like$!o#%doeke#%h_one%,regard_er_to$(drawable((ing-room$%erite&%slack$&holden$&in-out\'\'species',
+    '$"ou$\'ybridge%$pool##kop#$land#\'nesses.%\'y-based##rik##tek%&lsbach%!n&)bergplatz&#oom$\'ingdale\'$ness',
+    '$"oo##zum""wa"#xey#"on"$yogo"*zdom-based!$l679"#747#"57"!e""hb"!o#(dzimierz!$m750',
+    '!*o&amp;sub3"$-men"(bbliness""ch#!t"%dgers#%iczko"%ffard"%ggles"$jado#(narowicz"(lborough#"ch#%f-cub%\'ferrari',
+    '$&enburg($ttel%#son%#yes$1f-parkinson-white$!s%#eed#"in$!o#%lmuth##ska$#ley#3vercote/oxfordshire&$tons",man-in-peril',
+    '&%thing%!.%$/man%%isers%$less#&bourne#(enwealth$%rsley#%phrey"\'nd\'ring$&er-kid&#ous)"ly&&worker#"ga',
+    '##ned#%tkins"(od-built%&carver&\'hopping&&utters)#ing%(engraved%$gush%\'handled%&o-cork%&screws&#hed$$acre$(bastwick',
+    '$(chopping%$ocks&"tt%%rafts&#est%\'uttings$%eaton%(n-seated%!s$$fern%#ree$)ham-smith%$eads%#ole%#ull',
+    '%$ness$$kirk$\'mancote$%notes$$ring$&stains&&opping\'"re("ks$&ville\')*-dominated$&walton$$yard#\'l-lined%)producing',
+    '%\'suckers$%aston$(f-murray&%tumim$$lams%(y-haired()eadedness$#ner$$shop$$tack$(verstone%#ine#*nerf-style#!o##sey',
+    '&!s"$p/ag#$fner#%rried"&r\'-oss#!b#!c#$d&gt$*-blindness&)oundaries&\'uilding%\'classes%(decoding%\'endings%$form',
+    '&#ike%(painting\'"th$#cnt\'$.ssm$%games$&s/turn%&worth\'#-k&rehy;sheets$(-arounds&(ttitudes%&basket&&enches%\'centred%&houses',
+    '%*orientated%\'parties%)roughened%&sheets&%paces$"/a$$base%"ox$$days$\'ed-over%*r-directed\'#led\'\'manager$&force.$+group-based',
+    '$+ing-classes(&groups(&people$$life$#map%#ens$)s-council%#_up%#hip&#op.((/seminar%$ites$&tables%#ime$%women',
+    '#0ld&rehy;renowned%!-&%apart&#cup&\'economy&%first&*historical&%power&)rejecting%!.&\'richard&#the%$care%#ham%$ling',
+    '#$mful$\'ingford$#ley#)n-looking#"rr$\'y-beads&%lines%$iong#)shipfully\'"ps$)t-dressed&$kept&*performing#$tham%&lessly',
+    '$"on"%tcher#(syername#!t$"ya")uld/would%#n\'a\'"t.&!a#(ndedness##ter"$vens""ws#(wwowowow"%yzeck',
+    '""cl!$r963$!7"(aithlike#$ngel#$p-up##ths$$ting#$xall"%eathe#&ckage.%&lessly#&kenton#)naissance$$tham',
+    '#&stlin\'("gs"\'igglers$,ht-patterson$$leys#!n$$gers$(kle-free(\'skinned\'&bottom#+st-slapping%$lets#*te-a-thons&\'through%%lines',
+    '$+ing-in-role(&office$&ten-in(#out\'%/read"$ocht#)ng-doings%\'fulness%#ing#$xton!$s286""gn"!t!"t%"!1',
+    '""80""bs!)uchereria""du""er"#lff$$heah$#ric#%stans"$nner"(rtemburg!"v1!&w/june"#346"#ent',
+    '")f/acclaim"!w!!x!&yckham"!f#"es##old""hl"!l##ies#$lies%!s$$yott"(ngaarden%"te',
+    '#%yates"%rwoll"!s##ing##ner#"oy#.pia&nacute;ski"%thman!$z966$!7 )x&formula"&horbar"-rarr;y&rarr;z"%times!!+',
+    '!(-/y-cell"#372"!a#(utosomal"!b"+chromosomal#!s"$fold"#gal"!i#%f/alt#*nefficient$!g$#put"\'pattern',
+    '"%terms""us"-windows/motif##ord""xi"&yachts!*.400-based!./200/26/200288,!8$)1/26/2002&\'31/2002$+2/25/2003-1,!4,!6\'&6/2001',
+    '+"14$)4/25/2002,!3,!5$)5/26/2001$)6/25/2005,!6$)8/25/2003,!8,!9"!a".open-compliant!$11.4##049#(r5-based',
+    '!#200"\'5-based"!9!"33!#435!"87!"=1!$a(e)"!4"!6"!8"$ghra"#mdu"&nthina%%opsis',
+    '"!w!"b6""ai"!r#"ed!"c5"!i""ls""vi!#d2+"#434""5+"!7"!8""cs',
+    '!#e4+"!5"#bra"!f"!g"$ltec"$nias#$onym$\'phobics"$rium#\'ography#$xian""ta!#f2+""3+',
+    '!#g5+!"h3"#671""7+"#eka##mal"(oi-bglii#+sa-speaking"%ulali"!x!%iamen#&nguang##obo"!c"#ith',
+    '##ing""xb!$jr-s!$k695"!l!*l/datacomp"!5"!8"$endi"(ib-based!$m463""ai#%s/new"!n"!u',
+    '!*okonoshetl"#nia""ox!*p&ndash;59""-1"#10t#!1"#831""ds"%elair#&riment"#g/3#,4-compliance!#r4i"#aid',
+    '"$tacy$"rt##one!\'t-class$)ompatible"!/"!s!"v."*ideo-24svc!"x%""xp!&ywrite .y&aacute;2wshu"%prime!&\'could',
+    '%"re".iggthradgipile"#nah"!r##rah!$-bol"*directions")intercept"&linked"#mps"$rays"(specific#$take"!x!%.a.j.',
+    '!,/300/26/3002,!8,!9+"11$)1/26/3002,!3,!4,!8$)4/25/3002,!3,!4,!8+"10\'&6/3001$)5/25/3002',
+    '$)6/25/3002,!3,!4$)7/25/3002,!3,!4,!5,!6$)8/26/3001$)9/25/3001,!2,!7,!9+"18+"23',
+    '+"36\'&6/3002,!3,!6#*10/26/3003$)6/26/3001$)8/26/3003,!4#*20/25/2001)$3002+"10,!2+"20,!3+"30',
+    ',!9+"41"+418/25/4001!&12,000!%3,883!%6,800!!8"$,800!"a\'"!a""ba"%chts."#din#!m"#ffe',
+    '""gi#"ya"#had"!i"*k&ndash;15#$ulov"%lgaar"&madori$$giwa$$saki%$hita#(shchikov"$nbu\'#$dell#\'g-mills',
+    '#(kilevsky$!u#$oush""ou"$ping"\'rd-high$%brush$"er$%lands#"in#"oo#!r$!g#$sley"#ser',
+    '$"ou#&unsgat"#ter#"uz"#vuz"#wls"#zar#$dani!$b-70!#cfc!"do!"e\'"+/04/25/0000$)5/25/0000$)9/25/0000',
+    '")a-and-nay#&h-yeah$!/#!l$!d#"r*$\'-dating%$ends$"ds$$long$#s.l%#and#-st-containing#$xley"%diler',
+    '#"ra"%fimov"!i#1w&eacute;n&eacute"%ldall#"iz#$land$#ed.$#in\'$(ow-black\'$card(&entred\'%faced\'&leaved\'%nosed',
+    '(%uited\'(throated(%inted\'*variegated&&/brown\'#red\'%white&$fish&$mead#$stin#%tsins"$mery"%ndell#!g"%rbury',
+    '#"xa"(s-and-no$#sir$#yes#!.#$ayan#%hivah#%ilova#+ter-evening&\'day.but")t-another$/to-be-announced"%uking!#fcu""fi',
+    '"$vx06!$i-po".ddish-speaking"&elders"$fter"#gal"#kes"$menu"&n-yang##ger"(p-i-addy""th!!l!$mage"!i',
+    '"&ysybwl!"o\'"!3"!6"%bboes""ck"#hko"$kota"&lk-sac%&yellow"$ngbo"$ohoo##tha"&rdanov#\'k-style',
+    '$#ley\'0/gloucestershire$%ville"!s##eph#%hiaki%$hiro\'"sa%$kawa#&sarian$#ers"*u&mdash;it#%-dual$$find$#the',
+    '#$_out#"de##ern##ng\'%$-cho&#ish%!/&(browning&+oxfordshire%\'er-ross%$ness$%oussi#&r-self$)initials5$%self-',
+    '#-th-preserving"%vanka"$wing""zo!(paeitlyw")res-menin!"rd#!s""s.!"sd"#tad#$wyth!$uan*$$-tzu"#cay',
+    '"#dah#"ha""el"+goslav-born($ians$%tours"!i"$jiro"$kata#\'hnovsky##ons""lo"$ngas##xia"#sof',
+    '"$taka")val-davis!)ves-alain!#wet""tu!%zr500 .z&auml;hringen"*dollar;100"\'euml;ri"*iacute;tek")uuml;hlke!#(3)!#-80"&buffer")component',
+    '##isk&!s"&series#%haped#\'tations!"/l!$1000"!1##933"!2"#826$!8#"35!$2904!$3032',
+    '!$7486!!8"$6017!*a&iuml;re*"$abal##nse"$blah"$capa$$rias#(hariasen\'!e$$mann$&risson#"ks#&opride',
+    '"%ehner##ntz"$galo#"ni#%orski#$reus""hi#!l##nle#"ra"!i#)chnevskii##kov#"ri#$shuo',
+    '$#ele$$idov#&inthos#"ob#\'revskii##uti"$lten"(mberland$(ia-based#%ecnik$%enzad#&iatnin#$orna"!n#&damela',
+    '#$jani#&skaris#)tedeschia$&zinger"#pas$%teado#!s"$rate#!e##iba#%tmann#"za$%uelas"-shiki-warashi"&umseil',
+    '"&wadski"&yniyya!#bys!#ccf!!d"$enko"#ruj!$e\'ev"$baot#"bi#&rasoma$"ik"!c#"ar"#dek',
+    '"#ena##sen"$firo"%garra"$iger#"la#&talter$%geber"#kai"!l#%ditch#"en%!i%#ock%#sky',
+    '#"or"\'meldica"$nale$#tec##ers#\'kevitch#!z"\'otropic"$pher#)pelinheim".ro-dimensional%&length%(modified*$ying%1pressure-gradient',
+    '$%/null$%ville"#tek##ter"!v"%wolde"!y#!a#\'lanicum)!s!&ghorta!!h""ai#&maitis#$ngyi',
+    '"%idkov#%karev#%tomir"$orik"%ufbar!)ia-ul-haq"#boh"#dan#1ovudine-resistant"#ehl#&leniec#!m"\'ggurats#$mond#\'uinchor',
+    '$#man"#kri"+llertalbahn$$ions$$mann"/mbabwe-rhodesia"#nal#\'c-lined##der#&g-zing$"ed%"rs$$iber#*janthropus##kel',
+    '"*p-fastened$#off%"ut#!f#&ped-up"%ranek#$kzee"&ssimos$#ler"#zzo!!j!%labek"$obin#\'ta-lipa!(n-finger',
+    '"&anieki"#f22"$ojmo!\'oanthid"%ditch"&ellick"#gby"#har"$lden#%otkov"\'mbified&$ying$$odze"$nals$#tus',
+    '#&nebeke"(o-keeper#)graphical#"id#&med-in$&orphic#%notic""rk##lac"$simo#\'senheim##ter&#ops"%uaves##nds',
+    '!$p320$!1"!e!%s-bxi""gs""mz"$uzsi!%uberi"$cchi$&olillo""ev"#ffa"$hair"$ider"\'kertort',
+    '$#eta""ra$"da#%baran$$rugg#&vanite"%sanli#"ya""ta!$vane"(enigorod"$obgo!$wack#&rtbont"(elithini',
+    '%"au#)tterionic!(yglo&reg!$zone")uperstore',
 )
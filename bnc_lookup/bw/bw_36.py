@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_36 = (
+count_36 = 6694
+
+heads_36 = (
     'sbms',
-    'sbus/system',
-    'sc(hl)',
-    'sc.6',
-    'sc2',
-    'sc24',
-    'sc4',
-    'sc800',
-    'sc900',
-    'scad',
-    'scades',
-    'scaffoldings',
-    'scaglia',
-    'scalamandr&eacute',
-    'scaldingly',
-    'scaldini',
     'scale-dependent',
-    'scale-wise',
-    'scale/key',
-    'scaleable',
-    'scaleless',
-    'scaler',
-    'scalford',
-    'scaling-up',
-    'scalp.',
-    'scalvini',
-    'scammel',
-    'scampston',
-    'scan.exe',
-    'scanavacca',
-    'scandal-mongers',
-    'scandal-ridden',
     'scandal.',
-    'scandalises',
-    'scandalousness',
-    'scandanavians',
-    'scanet/remotepc',
-    'scanning-tunnelling',
-    'scantily-dressed',
-    'scantiness',
-    'scantlebury',
-    'scantlings',
-    'scape-goat',
-    'scapular',
-    'scar-tissue',
-    'scara',
-    'scarab-headed',
-    'scaraben',
     'scarbo',
-    'scarbus',
-    'scarcement',
-    'scaredy-cat',
-    'scarifications',
-    'scarlet&rehy;painted',
-    'scarlet-coated',
-    'scarlet-nailed',
-    'scarlet-tipped',
-    'scarpers',
-    'scarpitta',
-    'scarpland',
-    'scarsten',
-    'scase',
-    'scatology',
-    'scatter-gun',
     'scatterers',
-    'scattergood',
-    'scattering-factor',
-    'scatterings',
-    'scaups',
-    'scavvies',
-    'scavvy',
-    'scawfell',
-    'sce/gce',
-    'sceilig',
-    'sceli',
-    'scene-stealing',
-    'scent-marking',
-    'scg10',
-    'scgb',
-    'sch&ouml;n',
     'sch&ouml;nbohm',
-    'sch&ouml;nherr',
-    'sch&ouml;nlein',
-    'sch&ouml;ttle',
-    'sch.1',
-    'schacher',
-    'schafberg',
-    'schafbergbahn',
-    'schaick',
-    'schalke',
-    'schans',
-    'scharfenstein',
-    'scharli',
-    'schaumayer',
-    'schchusev',
-    'scheat',
     'scheds',
-    'scheds.',
-    'schedule+',
-    'schee',
-    'scheelite',
-    'scheffman',
-    'scheinberg',
-    'schele',
-    'schelenberg',
-    'schematisation',
-    'schematise',
-    'schemings',
-    'schenkenberg',
-    'schenley',
-    'scherk',
-    'scherr',
     'schetky',
-    'scheunenviertel',
-    'schh.ii',
-    'schiach',
-    'schibsbye',
-    'schicchi',
-    'schichau',
-    'schiedmayer',
-    'schiefler',
-    'schindewolf',
-    'schipek',
-    'schizophrenias',
-    'schizotypy',
-    'schkelda',
-    'schlanger',
-    'schlegels',
     'schleier',
-    'schlepped',
-    'schlogl',
-    'schlomo',
-    'schloomp',
-    'schlosspark',
-    'schmall',
-    'schmelke',
-    'schmerhom',
-    'schmidbauer',
-    'schmidt-nielsen',
-    'schmittenhohe',
-    'schmitthoff',
-    'schmutter',
-    'schnitke',
-    'schnitzel',
     'schochet',
-    'schoen',
-    'schoenwetter',
-    'schokel',
-    'schol',
-    'scholander',
-    'scholar-critics',
-    'scholar-king',
-    'scholastically',
-    'scholehouse',
-    'scholemaster',
-    'scholia',
-    'schomaker',
-    'school(s)',
-    'school-attached',
-    'school-boys',
     'school-building',
-    'school-centred',
-    'school-child',
-    'school-college',
-    'school-desegregation',
-    'school-designed',
-    'school-fellows',
-    'school-financing',
-    'school-girls',
-    'school-going',
-    'school-kid',
-    'school-like',
-    'school-meals',
-    'school-pupils',
-    'school-rules',
-    'school-site',
     'school-teachers',
-    'school-type',
-    'school/',
-    'school/my',
-    'schoolbags',
-    'schoole',
-    'schoolemaster',
-    'schoolfellow',
-    'schoolly',
-    'schoolma\'am',
-    'schoolman',
-    'schoolmarmish',
-    'schoolmarms',
-    'schoolmarmy',
-    'schoolmasterish',
-    'schoolmasterly',
     'schoolmistresses',
-    'schools.and',
-    'schoolyards',
-    'schoonbeek',
-    'schoonebeek-447',
-    'schottenheimer',
-    'schottky',
-    'schr&ouml;tter',
-    'schrank',
-    'schroder-sonnenstern',
-    'schtraks',
-    'schuberts',
-    'schubring',
-    'schucks',
-    'schulberg',
-    'schulez',
     'schumer',
-    'schundler',
-    'schusterstrasse',
-    'schuttdorf',
-    'schwabb',
-    'schwagalp',
-    'schwantes',
-    'schware',
-    'schweigen',
-    'schweik',
-    'schwendinger',
-    'sciagraphy',
-    'sciarra',
-    'scicluna',
-    'scicon',
-    'scid-mice',
     'scie',
-    'science*',
-    'science-gossip',
-    'science-room',
-    'science-write',
-    'science-writer',
-    'science/arts',
-    'science/engineering',
-    'science/non-science',
-    'science/technology',
-    'sciences.',
-    'sciennes',
-    'scientific-sounding',
-    'scientific-technical',
-    'scientific-technological',
-    'scientific/industrial',
     'scientific/technical',
-    'scientific/technological',
-    'scientist.',
-    'scientization',
-    'scilt',
-    'scimitar-shaped',
-    'scimone',
-    'scimp',
-    'scintigraphically',
-    'scintillas',
-    'scintillators',
-    'scissett',
-    'scissile',
-    'scissor-chopped',
-    'scitovsky',
-    'scivyer',
     'sclavonia',
-    'scleritome',
-    'scleritomes',
-    'sclosa',
-    'scoat',
-    'scobell',
-    'scocozza',
-    'scoffer',
-    'scoggins',
-    'scoging',
-    'scoil',
-    'scola',
-    'scoldings',
-    'scoots',
-    'scoraig',
-    'scorborough',
     'scorchmark',
-    'scordi',
-    'score-draw',
-    'score=0',
-    'score=5',
-    'scorebook',
-    'scorebooks',
-    'scorekeeper',
-    'scorelines',
-    'scorelist',
-    'scornice&scedil;ti',
-    'scorodonia',
-    'scorsese&times;4',
-    'scory',
-    'scorzonera',
-    'scotale',
     'scotam',
-    'scotbec',
-    'scotchgard',
-    'scotchmen',
-    'scothorne',
-    'scothorum',
-    'scotian',
-    'scotica',
-    'scoticus',
-    'scotland-based',
-    'scotland.',
-    'scotos',
-    'scotston',
-    'scott-gibson',
-    'scott-russell',
-    'scott-sawyer',
     'scott-stokes',
-    'scotter',
-    'scottes',
-    'scottish-style',
-    'scottish/ulster',
-    'scoulding',
-    'scouller',
-    'scourings',
-    'scouseland',
-    'scout-ranger',
-    'scow',
-    'scozzese',
-    'scpe',
-    'scrabster',
-    'scrag-end',
-    'scragging',
     'scraggle',
-    'scramasax',
-    'scramblings',
-    'scrap-heaps',
-    'scrapie-infected',
-    'scrapmetal',
-    'scrappily',
-    'scraptof',
-    'scratch-marks',
-    'scratchcard',
-    'scratchpad',
-    'scratchstocks',
-    'scratters',
-    'screamin',
-    'screaming-point',
-    'screechings',
     'screen-writer',
-    'screendumps',
-    'screened-off',
-    'screeners',
-    'screenprinters',
-    'screw-capped',
-    'screw-gate',
-    'screw-like',
-    'screwin\'',
-    'screwthreads',
-    'scriber',
-    'scribers',
-    'scriblerian',
-    'scribona',
-    'scrimmage',
-    'scrivermi',
     'scrofa',
-    'scroggins',
-    'scrooby',
-    'scrounges',
-    'scrub.',
-    'scrubbier',
-    'scrubbing-board',
-    'scrummage.',
-    'scrummagers',
-    'scrummed',
-    'scrupled',
-    'scrutinization',
-    'scud-c',
-    'scud-cs',
-    'scuderi',
-    'scullerymaid',
     'sculpins',
-    'sculptor-in-ordinary',
-    'sculpts',
-    'sculpturally',
-    'sculthorpe',
-    'scumite',
-    'scumlingo',
-    'scurfield',
-    'scurlogue',
-    'scuttering',
-    'scuttlebutt',
-    'scutts',
-    'scuza',
-    'scw',
-    'scyphozoans',
-    'scythemakers',
     'scythopolis',
-    'sd.',
-    'sd/ds',
-    'sdl',
-    'sdlp-sister-party',
-    'sdp-liberal',
-    'sdr1,250.8',
-    'sdr18,600,000',
-    'sdr2,876',
-    'sdr20,510,000',
-    'sdr33,600,000',
-    'sdr45,350,000',
-    'sdr60,600,000',
-    'sdsm',
-    'sdt',
-    'se&ntilde;oritas',
     'se15',
-    'se162',
-    'se17',
-    'se22',
-    'se24',
-    'se25',
-    'se26',
-    'se50',
-    'se5s',
-    'sea-adventure',
-    'sea-adventures',
-    'sea-anglers',
-    'sea-angling',
-    'sea-cabin',
-    'sea-changes',
-    'sea-crossings',
     'sea-cucumbers',
-    'sea-dogs',
-    'sea-eagle',
-    'sea-farers',
-    'sea-fights',
-    'sea-grass',
-    'sea-horse-on-toast',
-    'sea-ice',
-    'sea-kayaks',
-    'sea-keeping',
-    'sea-like',
-    'sea-monsters',
-    'sea-nymphs',
-    'sea-otter',
-    'sea-people',
-    'sea-pool',
     'sea-pools',
-    'sea-ports',
-    'sea-scented',
-    'sea-scoured',
-    'sea-shanties',
-    'sea-shanty',
-    'sea-slugs',
-    'sea-snakes',
-    'sea-squirts',
-    'sea-stack',
-    'sea-stones',
-    'sea-swell',
-    'sea-town',
-    'sea-waves',
-    'sea-weeds',
-    'sea-wind',
     'sea-worthy',
-    'sea/air',
-    'sea4gl',
-    'seabeast',
-    'seabury',
-    'seacoal',
-    'seafish',
-    'seafly',
-    'seagirt',
-    'seagreen',
-    'seakeeping',
-    'seakindly',
-    'seakings',
-    'sealable',
-    'sealandings',
-    'sealed-in',
     'sealed-up',
-    'seales',
-    'seals.',
-    'sealynx',
-    'seam-free',
-    'seamlessness',
-    'seamon',
-    'seams.',
-    'seanad',
-    'seapen',
-    'search_of',
-    'searched.',
-    'seashores.',
-    'seasides',
-    'season.gloucester',
-    'seasonally-flooded',
     'seasonals',
-    'seassons',
-    'seat(s)',
-    'seatette',
-    'seatings',
-    'seaty',
-    'seaveed',
-    'seawall',
-    'seaways',
-    'seaweedy',
-    'seaxwulf',
-    'sebasteion',
-    'sebasti&atilde;o',
-    'sebatier',
-    'sebcs',
-    'sebrand',
     'sebregondi',
-    'sebt',
-    'sec160s',
-    'seca',
-    'secale',
-    'secalt',
-    'seccombe',
-    'secedes',
-    'seckler',
-    'seclusions',
-    'second-chance',
-    'second-draw',
-    'second-ever',
-    'second-greatest',
-    'second-homes',
-    'second-league',
     'second-pass',
-    'second-period',
-    'second-place',
-    'second-rater',
-    'second-set',
-    'second-term',
-    'second-to-none',
-    'second-years',
-    'second-youngest',
-    'secondary-use',
-    'secondrate',
-    'secosterol',
-    'secoya',
-    'secr&eacute;taires',
-    'secret-agent',
-    'secreta',
     'secretaria',
-    'secretaries-general',
-    'secretarium',
-    'secretary-director',
-    'secretary-elect',
-    'secretary-generals',
-    'secretary/',
-    'secreterial',
-    'secs0.18',
-    'sect.',
-    'sectaries',
-    'sectile',
-    'section(s)',
-    'sectionally',
-    'sectioned-off',
-    'sector-based',
     'sectoring',
-    'secundi',
-    'securitising',
-    'securitized',
-    'sedans',
-    'sedateness',
-    'sedates',
-    'sedding',
-    'seddons',
-    'sedes',
-    'sedgewicks',
-    'sedgy',
-    'sediment-filled',
-    'sediment-hosted',
-    'sediq',
-    'sedov',
     'seductresses',
-    'see-see',
-    'see/hear',
-    'seeable',
-    'seeau',
-    'seed-borne',
-    'seed-boxes',
-    'seed-head',
-    'seed-plants',
-    'seed-pods',
-    'seedlike',
-    'seedy-looking',
-    'seehof',
-    'seeing-to',
-    'seeings',
-    'seek-a',
     'seeked',
-    'seelewig',
-    'seels',
-    'seem/seam',
-    'seemed.to',
-    'seemore',
-    'seese',
-    'seester',
-    'seet',
-    'seewonauth',
-    'segar',
-    'segba',
-    'segger',
-    'segment-specific',
-    'segontium',
-    'segregative',
     'segreto',
-    'segs',
-    'seguran&ccedil;a',
-    'seguro',
-    'seibu',
-    'seidemann',
-    'seido',
-    'seif-like',
-    'seigen',
-    'seigniorage',
-    'seigniorial',
-    'seignory',
-    'seilacher',
-    'seiler-albring',
-    'seine-net',
-    'seine-nets',
     'seiroku',
-    'seismographical',
-    'seit',
-    'seite',
-    'seive',
-    'sekera',
-    'sekonda',
-    'seks',
-    'sekula',
-    'sekwalor',
-    'selaby',
-    'selander',
-    'seldome',
-    'selectability',
-    'selectae',
-    'selectionism',
     'selectively-bred',
-    'selectness',
-    'selector\'',
-    'selectoral',
-    'selemani',
-    'selesians',
-    'self&rehy;presentation',
-    'self&rehy;seeking',
-    'self&rehy;styled',
-    'self&rehy;sufficient',
-    'self-abasing',
-    'self-accusation',
-    'self-acquaintance',
-    'self-adhesives',
-    'self-analytical',
-    'self-appraisals',
     'self-assemble',
-    'self-assessments',
-    'self-assigned',
-    'self-attitudes',
-    'self-binder',
-    'self-blaming',
-    'self-cleansing',
-    'self-colour',
-    'self-complacency',
-    'self-condemnation',
-    'self-confessional',
-    'self-confirming',
-    'self-confrontation',
-    'self-content',
-    'self-controls',
-    'self-correction',
     'self-dedication',
-    'self-degradation',
-    'self-deluded',
-    'self-delusions',
-    'self-delusory',
-    'self-denigrating',
-    'self-destructively',
-    'self-diagnostic',
-    'self-disparagement',
-    'self-divided',
-    'self-dual',
-    'self-effacingly',
-    'self-efficacies',
-    'self-enforced',
-    'self-enforcement',
-    'self-erected',
     'self-estrangement',
-    'self-evaluating',
-    'self-evaluations',
-    'self-experience',
-    'self-exposure',
-    'self-expressive',
-    'self-extinction',
-    'self-feed',
-    'self-forgetfulness',
-    'self-funded',
-    'self-government\'',
-    'self-hating',
-    'self-heal',
-    'self-humiliation',
-    'self-hypnotised',
-    'self-impact',
     'self-improvers',
-    'self-incompatible',
-    'self-indulgences',
-    'self-integration',
-    'self-interactions',
-    'self-interrogation',
-    'self-invested',
-    'self-involved',
-    'self-justifications',
-    'self-knowing',
-    'self-legitimating',
-    'self-lubricating',
-    'self-marketing',
-    'self-masturbation',
-    'self-monitor',
-    'self-motivating',
     'self-obsession',
-    'self-opening',
-    'self-opinion',
-    'self-pityingly',
-    'self-placement',
-    'self-powered',
-    'self-predicating',
-    'self-preoccupied',
-    'self-productive',
-    'self-promotional',
-    'self-propulsion',
-    'self-publishers',
-    'self-punitive',
-    'self-purchase',
-    'self-rebuke',
-    'self-recruited',
     'self-redemption',
-    'self-referring',
-    'self-reflexively',
-    'self-reforming',
-    'self-regulator',
-    'self-repetitions',
-    'self-reproachful',
-    'self-scrubbing',
-    'self-sealed',
-    'self-seeded',
-    'self-seeders',
-    'self-similar',
-    'self-squandering',
-    'self-stultifying',
-    'self-tutoring',
-    'self-unemployed',
     'self-view',
-    'self-working',
-    'self-world',
-    'self-written',
-    'self=',
-    'selfconfessed',
-    'selfdefence',
-    'selfsameness',
-    'selfseeking',
-    'selfsufficiency',
-    'selgovae',
-    'seliger',
-    'selinda',
-    'selinous',
-    'selinunte',
-    'selissa',
     'selkup',
-    'sell-',
-    'sell-by-date',
-    'sellack',
-    'sellberg',
-    'sellen',
-    'seller-husband',
-    'selleries',
-    'sellery',
-    'selling-off',
-    'sellinger/oxford',
-    'selloum',
-    'selnes',
-    'selon',
-    'selsfield',
-    'selsit',
     'selsun',
-    'seluka',
-    'selvick',
-    'semantical',
-    'semantically-based',
-    'sematic',
-    'semb-johansson',
-    'semblances',
-    'semenova',
-    'semenovich',
-    'semenyuk',
-    'semeonoff',
-    'semerc',
-    'semi&rehy;circle',
-    'semi&rehy;conductor',
-    'semi-alcoholic',
     'semi-and',
-    'semi-asleep',
-    'semi-audible',
-    'semi-automatically',
-    'semi-barbarian',
-    'semi-beggar',
-    'semi-clandestine',
-    'semi-coma',
-    'semi-concealed',
-    'semi-consciousness',
-    'semi-custodial',
-    'semi-darkened',
-    'semi-democratic',
-    'semi-disposable',
-    'semi-documentary',
-    'semi-drugged',
     'semi-educational',
-    'semi-elasticated',
-    'semi-exclusive',
-    'semi-fasts',
-    'semi-fictional',
-    'semi-fictitious',
-    'semi-fluid',
-    'semi-gloss',
-    'semi-government',
-    'semi-hereditary',
-    'semi-hollow',
-    'semi-humorous',
-    'semi-independence',
-    'semi-layback',
-    'semi-manufactures',
-    'semi-mystic',
     'semi-negatives',
-    'semi-obligatory',
-    'semi-octagonal',
-    'semi-opaques',
-    'semi-peripheral',
-    'semi-popish',
-    'semi-processed',
-    'semi-quaver',
-    'semi-rational',
-    'semi-recumbent',
-    'semi-residential',
-    'semi-rest',
-    'semi-retail',
-    'semi-ruinous',
-    'semi-shrug',
-    'semi-specialist',
     'semi-stagnant',
-    'semi-state-owned',
-    'semi-stranger',
-    'semi-submersible',
-    'semi-tender',
-    'semi-thin',
-    'semi-token',
-    'semi-trailer',
-    'semi-trance',
-    'semi-underground',
-    'semi-vowel',
-    'semi-works',
-    'semi/terraced/town',
-    'semi/town',
-    'semiautomated',
-    'semic',
     'semiliquid',
-    'seminarist',
-    'seminars/workshops',
-    'semiotically',
-    'semiotician',
-    'semiperiphery',
-    'semipermeable',
-    'semiprofessional',
-    'semirigid',
-    'semitism',
-    'semmel',
-    'semmelweis',
-    'semogerere',
-    'semper_fidelis',
-    'semperflorens',
-    'semplar',
     'sempre',
-    'sempronia',
-    'semy',
-    'sen-sihanouk',
-    'senafi',
-    'senat',
-    'senatore',
-    'senclere',
-    'sencourt',
-    'sendal',
-    'sended',
-    'sending-offs',
-    'senecan',
-    'seneferu',
-    'senegalais',
-    'senegalo-guinean',
     'senesce',
-    'seneschalship',
-    'seneviratne',
-    'sengstock',
-    'senior-level',
-    'senkaku',
-    'senlin',
-    'senmao',
-    'sennachie',
-    'senors',
-    'sensation-seekers',
-    'sensationalize',
-    'sense\'',
-    'sense-units',
-    'sense8',
-    'sensible.',
     'sensitises',
-    'sensitive-skinned',
-    'sensitivity.',
-    'sensitometry',
-    'sensorite',
-    'sensorium',
-    'senstive',
-    'sensuous-emotional',
-    'sentelle',
-    'sentence\'',
-    'sentence-final',
-    'sentence-grammarians',
-    'sentence-like',
-    'sentence-tokens',
-    'senterpartiet',
-    'senticosus',
     'sentimentalism',
-    'sentinum',
-    'sentir',
-    'sentry-duty',
-    'sep&ndash;31',
-    'sep/oct',
-    'separately.',
-    'separovic',
-    'sepeia',
-    'seperately',
-    'seperation',
-    'sephton',
-    'sepia-coloured',
-    'sepia-toned',
-    'seppak',
-    'sept-nov',
     'sept-oct',
-    'september*',
-    'september-22',
-    'september-december',
-    'september-november',
-    'september/hereford',
-    'septizonium',
-    'sequens',
-    'sequestrate',
-    'ser-vices',
-    'serafin\'',
-    'serajevo',
-    'serapia',
-    'serb-controlled',
-    'serb-led',
-    'serbian-led',
     'serbo-croats',
-    'sercambi',
-    'serei',
-    'serenader',
-    'serenos',
-    'serevent',
-    'serg.magg',
-    'sergeant-at-mace',
-    'sergeevich',
-    'sergent',
-    'sergeyevitch',
-    'sergo',
-    'sergoi',
-    'serhal',
-    'serial-port',
-    'serialising',
     'serialists',
-    'sericea',
-    'seriche',
-    'series-connected',
-    'serine/threonine-rich',
-    'seringapatam',
-    'serious-money',
-    'serious-sounding',
-    'serious/non-serious',
-    'seriously-minded',
-    'sernf',
-    'serocold',
-    'serosurvey',
-    'serote',
-    'serotonergic',
-    'serow-like',
     'serpentaria',
-    'serpiginous',
-    'serpyllum',
-    'serrailier',
-    'serraillier',
-    'serrations',
-    'serrator',
-    'serre',
-    'serrell',
-    'serrette',
-    'sert&atilde;o',
-    'sertanejos',
-    'sertori',
-    'serum-response',
-    'servadei',
-    'servantless',
     'servatives',
-    'servaton',
-    'servatons',
-    'servent',
-    'servequip',
-    'servery/pantry',
-    'serveuses',
-    'service-books',
-    'service-class',
-    'service-music',
-    'service-provider',
-    'service-related',
-    'service/standby',
-    'services/hospitals',
-    'servicetills',
-    'servier',
     'servies',
-    'serviles',
-    'serving-hatch',
-    'servisales',
-    'serviscene',
-    'servo-driven',
-    'servo-hydraulic',
-    'servois',
-    'sese-seko',
-    'sesquicarbonate',
-    'sesquioxides',
-    'sestertius',
-    'sestri-voltaggio',
-    'sestron',
-    'set-building',
-    'set-faced',
     'set-squares',
-    'setec',
-    'setenvironment',
-    'seth-smith',
-    'sethy',
-    'setila',
-    'setswana',
-    'settignano',
-    'setting-off',
-    'setting.up',
-    'settlement.',
-    'settlin\'',
-    'settling-down',
-    'settlor-interested',
-    'settrington',
-    'setubal',
     'seturday',
-    'seufert',
-    'seul',
-    'seur',
-    'seuss',
-    'sevak',
-    'sevare',
-    'seveld',
-    'seven-bedroomed',
-    'seven-eight',
-    'seven-foot-long',
-    'seven-footer',
-    'seven-hooded',
-    'seven-lever',
-    'seven-metre',
-    'seven-nights',
     'seven-note',
-    'seven-person',
-    'seven-seater',
-    'seven-series',
-    'seven-three-eight',
-    'seven-ton',
-    'seven-twenty',
-    'seven-up',
-    'seven-word',
-    'seven-years-old',
-    'seven/eight',
-    'sevent',
-    'seventeen-hand',
-    'seventeenth&rehy;century',
-    'seventh-biggest',
-    'seventh-largest',
     'seventy-eight-year-old',
-    'seventy-nine-year-old',
-    'seventy-one-year-old',
-    'seventy-six-year-old',
-    'seventy-three-year-old',
-    'severability',
-    'several-fold',
-    'severe=3',
-    'severely-handicapped',
-    'severence',
-    'severly',
-    'severn/gloucestershire',
-    'severnhampton',
-    'sevillana',
-    'sevre',
-    'sewardby',
     'sewell/lib',
-    'sewing-box',
-    'sewing-kit',
-    'sex\'',
-    'sex-crazed',
-    'sex-dance',
-    'sex-determining',
-    'sex-exclusive',
-    'sex-fair',
-    'sex-negative',
-    'sex-predetermination',
-    'sex-segregated',
-    'sex-slave',
-    'sex-stereotyping',
-    'sex/gender',
-    'sexagesimal',
     'sexclone',
-    'sexists',
-    'sexlife',
-    'sexological/psychoanalytic',
-    'sexploits',
-    'sexual/romantic',
-    'sexualisation',
-    'sexus',
-    'sexwar',
-    'sexy-looking',
-    'seyburn',
-    'seymour-johns',
-    'seymouriamorphs',
-    'seyrig',
-    'seznec',
-    'sf9',
     'sfii',
-    'sfogava',
-    'sforzesco',
-    'sfr20',
-    'sfr20,000',
-    'sfr35m',
-    'sg108',
-    'sg12',
-    'sg19',
-    'sg6',
-    'sg8',
-    'sgambati',
-    'sgic',
-    'sgml-aware',
-    'sgns',
-    'sgraffito',
     'sgulaird',
-    'sgwd',
-    'sgwd-yr-eira',
-    'sgwyd',
-    'sh*t',
-    'sh-h-h',
-    'sh-sh',
-    'sh10',
-    'shaab',
-    'shaadi',
-    'shabbetai',
-    'shabbiest',
-    'shabby-looking',
-    'shabib',
-    'shabir',
-    'shabira',
     'shabra',
-    'shachar',
-    'shadbolt',
-    'shaddai',
-    'shade-lovers',
-    'shade-seeking',
-    'shaded-relief',
-    'shadeline',
-    'shader',
-    'shaders',
-    'shadoo',
-    'shadow-box',
-    'shadow-like',
-    'shadow-line',
-    'shadow-puppets',
-    'shadower',
     'shadowers',
-    'shadowier',
-    'shaf',
-    'shaffi',
-    'shafrazi',
-    'shaftel',
-    'shaftwood',
-    'shagpile',
-    'shague',
-    'shahabad',
-    'shahabuddin',
-    'shaharyar',
-    'shahban',
-    'shahida',
-    'shakar',
-    'shakedowns',
     'shakespeare/bucks',
-    'shakin',
-    'shakleton',
-    'shakleton/explorer',
-    'shaky-looking',
-    'shalimov',
-    'shallop',
-    'shallott',
-    'shallow-changing',
-    'shallow-enough',
-    'shalstone',
-    'shalwar',
-    'sham-historical',
-    'shamateur',
-    'shamateurism',
-    'shamateurs',
     'shamela',
-    'shamiana',
-    'shampoo/conditioner',
-    'shampoo/conditioners',
-    'shamsudin',
-    'shamwana',
-    'shanariah',
-    'shand-kydd',
-    'shanes',
-    'shangai',
-    'shange',
-    'shanghaied',
-    'shangri-las',
-    'shankaranand',
-    'shann',
-    'shanners',
     'shannish',
-    'shannonside',
-    'shantu',
-    'shaozu',
-    'shape-selective',
-    'shape-up',
-    'shapeofbeak',
-    'shapi',
-    'shapka',
-    'shapkas',
-    'shapter',
-    'shar&pound',
-    'sharafbandi',
-    'sharaku',
-    'sharapov',
-    'share(%)',
     'share-convertible',
-    'share-croppers',
-    'share-holdings',
-    'share-option',
-    'share-pusher',
-    'share-support',
-    'share/debenture',
-    'share/position',
-    'sharecropper',
-    'sharedwhiteboard',
-    'sharedx',
-    'shareout',
-    'shareprint/ux',
-    'sharescale',
-    'sharif-emami',
-    'sharing.',
     'shark-fin',
-    'shark-free',
-    'shark-shaped',
-    'sharkboy',
-    'sharkish',
-    'sharland',
-    'sharlene',
-    'sharlott/widow',
-    'sharnanah',
-    'sharne',
-    'sharons',
-    'sharp-boned',
-    'sharp-cornered',
-    'sharp-fanged',
-    'sharp-shooter',
-    'sharp-suited',
     'sharpenings',
-    'sharpie',
-    'sharpik',
-    'sharply-etched',
-    'sharply-pointed',
-    'sharwood-smith',
-    'shatt-al',
-    'shatter-proof',
-    'shatterer',
-    'shatwan',
-    'shaughraun',
-    'shaul',
-    'shaula',
-    'shauna',
-    'shavanteland',
-    'shaviana',
     'shaving-brush',
-    'shaw-mohler',
-    'shaw/trader',
-    'shawarib',
-    'shawcroft',
-    'shawe',
-    'shawqi',
-    'shaxson',
-    'shchepkin',
-    'shd.',
-    'she-and-particularly-he',
-    'she-cat',
-    'she-male',
-    'she-mule',
-    'sheared-off',
-    'sheat-fish',
     'shebarshin',
-    'shebbak',
-    'shebeens',
-    'shed-like',
-    'sheedy-pup',
-    'sheeeet',
-    'sheeffry',
-    'sheep-farmers',
-    'sheep-grey',
-    'sheepbells',
-    'sheepish-looking',
-    'sheerer',
-    'sheetfloods',
-    'sheetwash',
-    'shefc',
-    'shefi',
     'shehee',
-    'sheikdom',
-    'sheikhly',
-    'sheilas',
-    'sheka',
-    'shelborn',
-    'shelf-edge',
-    'shelf-like',
-    'shelflife',
-    'shell-likes',
-    'shell-owned',
-    'shell-shattered',
-    'shell-torn',
-    'shell-type',
-    'shell/esso',
-    'shellard',
     'shellback',
-    'shellbursts',
-    'sheller',
-    'shelli',
-    'shelov-kovedyaev',
-    'shelten',
-    'sheltered-shore',
-    'shen-sei',
-    'shennington',
-    'shepcourt',
-    'shepheard-walwyn',
-    'shepkey',
-    'sheppenhall',
-    'shepstone',
-    'shepway',
-    'sherdley',
     'sherefettin',
-    'sheremtyevo',
-    'sheridon',
-    'sheriff-principal',
-    'sheriton',
-    'sherley',
-    'sherringham',
-    'sherry-sipping',
-    'sherston',
-    'shervington',
-    'sherwen',
-    'shetima',
-    'shevek',
-    'sheverdnaze',
-    'shevers',
-    'shewa',
     'shewanella',
-    'sheward',
-    'shewell',
-    'shhh/peaceful/very',
-    'shibata',
-    'shibusawa',
-    'shidlovsky',
-    'shie-on-lit',
-    'shieber',
-    'shields*',
-    'shields.',
-    'shier',
-    'shifa',
-    'shiffins',
-    'shiffman',
-    'shifrin',
     'shift\'',
-    'shift+f10',
-    'shiftiness',
-    'shifty-looking',
-    'shiga',
-    'shigekazu',
-    'shigeki',
-    'shijie',
-    'shikari',
-    'shiki',
-    'shillibeer',
-    'shillinglee',
-    'shiluk',
-    'shimazaki',
-    'shimelis',
-    'shiminas',
     'shimmeringly',
-    'shimmies',
-    'shimmin',
-    'shimoda',
-    'shimomura',
-    'shimono',
-    'shimply',
-    'shimshek',
-    'shinbone',
-    'shine-free',
-    'shineberg',
-    'shinfield',
-    'shingle/boulder',
-    'shinichiro',
-    'shiniest',
-    'shinily',
     'shinohara',
-    'shintillo',
-    'shiny-eyed',
-    'shiny-faced',
-    'shinya',
-    'shionogi',
-    'ship-builder',
-    'ship-chandlers',
-    'ship-wreck',
-    'ship-wrecks',
-    'shipko',
-    'shippenhall',
-    'shipston-on-stour',
-    'shipton-on-cherwell',
-    'shipworkers',
-    'shiraho',
     'shiraz/cabernet',
-    'shirazeh',
-    'shireh',
-    'shirehorse',
-    'shirinskii-shikhmatov',
-    'shirish',
-    'shirks',
-    'shirley/father',
-    'shirley/mother',
-    'shirlow',
-    'shirov',
-    'shirt-clad',
-    'shirt-maker',
-    'shirtmaker',
-    'shirtmakers',
-    'shishapangma',
     'shit-bin',
-    'shit-brown',
-    'shit-faced',
-    'shit-heap',
-    'shitheads',
-    'shito',
-    'shitsby',
-    'shitter',
-    'shitteries',
-    'shittiest',
-    'shivas',
-    'shizo',
-    'shizuoka',
-    'shkabardnya',
-    'shmonov',
-    'shoaragad',
     'shock-absorbent',
-    'shock-associated',
-    'shock-induced',
-    'shock-proof',
-    'shocking-pink',
-    'shodan',
-    'shodden',
-    'shodmon',
-    'shoe-bag',
-    'shoe-care',
-    'shoe-leather',
-    'shoe-shiners',
-    'shoe-shining',
-    'shoe-shops',
-    'shoeboxes',
-    'shoecare',
     'shoeshines',
-    'shoichiro',
-    'shongwe',
-    'shool',
-    'shoot-down',
-    'shootable',
-    'shooting-party',
-    'shooting-up',
-    'shop-assistant',
-    'shop-assistants',
-    'shop-steward',
-    'shop.',
-    'shop/post',
-    'shops/boutiques',
-    'shopwindow',
-    'shore-dwelling',
     'shore-leave',
-    'shore-lines',
-    'shorebreak',
-    'shorehaven',
-    'shoresea',
-    'shorney',
-    'short&rehy;comings',
-    'short&rehy;term',
-    'short-armed',
-    'short-back-and-sides',
-    'short-bodied',
-    'short-coated',
-    'short-corner',
-    'short-cutting',
-    'short-ended',
-    'short-falls',
     'short-fused',
-    'short-limbed',
-    'short-scale',
-    'short-season',
-    'short-sleeve',
-    'short-snorter',
-    'short-stroke',
-    'short-term/long-term',
-    'short-to-medium',
-    'short-trousered',
-    'short-winded',
-    'short-workings',
-    'short.delay',
-    'shortages.',
-    'shortenings',
-    'shorter-legged',
     'shorter-lived',
-    'shorter-necked',
-    'shorter-winged',
-    'shortest-ever',
-    'shortforms',
-    'shortreed',
-    'shortsightedly',
-    'shortswings',
-    'shos',
-    'shoshana',
-    'shoso-in',
-    'shostari',
-    'shot-about',
-    'shot-blasted',
-    'shot-putter',
-    'shot-shy',
     'shot-up',
-    'shotmaker',
-    'shotmaking',
-    'shots.',
-    'shotted',
-    'shotwell',
-    'shouders',
-    'shoulder-line',
-    'shoulder-mounted',
-    'shoulder-pad',
-    'shoulder-widths',
-    'shouldny',
-    'shourjabi',
-    'shouters',
-    'shove-it',
-    'shovehalfpennies',
     'shovehalfpenny',
-    'shovelfuls',
-    'shovlin',
-    'show-bizzy',
-    'show.the',
-    'showbiz-style',
-    'showbizzy',
-    'showboating',
-    'showdowns',
-    'shower-head',
-    'shower-rooms',
-    'shower/bath/wc',
-    'showerhead',
-    'showerheads',
-    'showguide',
-    'showhome',
     'showjumps',
-    'showns',
-    'showpony',
-    'showstopper',
-    'showstopping',
-    'shrawley',
-    'shrewishly',
-    'shrewsbury-carmarthen',
-    'shrimpton/local',
-    'shrine-like',
-    'shring',
-    'shrinkages',
-    'shrive',
-    'shrivenham/oxfordshire',
-    'shrooms',
-    'shrouded-head',
     'shrub-like',
-    'shrunk-on',
-    'shrybman',
-    'shtick',
-    'shtum',
-    'shuang',
-    'shuar',
-    'shubber',
-    'shubunkin',
-    'shucard',
-    'shuckburgh',
-    'shudderings',
-    'shuddybunkin',
-    'shue',
-    'shufflers',
-    'shuffly',
     'shufty',
-    'shuhai',
-    'shukir',
-    'shukr',
-    'shunamite',
-    'shung',
-    'shunt-inserted',
-    'shurdington/gloucestershire',
-    'shurin',
-    'shurston',
-    'shushex',
-    'shut-downs',
-    'shut-upa-your-face',
-    'shwartzman',
-    'shylockish',
-    'shymansky',
     'shys',
-    'shytalk',
-    'shyti',
-    'si*sj',
-    'si.1',
-    'si.2',
-    'siah',
-    'siale',
-    'sialylated',
-    'siaurusevicius',
-    'sibbaldia',
-    'sibbick',
-    'siberica',
-    'sibilants',
-    'sibirskii',
-    'sibship',
     'sibson',
-    'sibun',
-    'sibylla',
-    'sicambria',
-    'siccar',
-    'sick-bags',
-    'sick-list',
-    'sickle-shaped',
-    'sickliest',
-    'sickly-looking',
-    'sickly-sweet',
-    'sicks',
-    'sicula',
-    'siculum',
-    'siculus',
-    'sicut',
     'sicyonian',
-    'sidamo',
-    'sidati',
-    'side-bets',
-    'side-booths',
-    'side-branches',
-    'side-burns',
-    'side-curtains',
-    'side-gate',
-    'side-hooked',
-    'side-ladder',
-    'side-lateral',
-    'side-long',
-    'side-ponds',
-    'side-rest',
-    'side-screens',
     'side-seams',
-    'side-wind',
-    'side-windows',
-    'sidearm',
-    'sidebars',
-    'sidechain',
-    'sidechains',
-    'sidedoor',
-    'sidef',
-    'sidefooted',
-    'sidehandled',
-    'sidelength',
-    'sidenote',
-    'siderbras',
-    'sideroblastic',
-    'sideroliths',
     'sidescreen',
-    'sidesmen',
-    'sidetracking',
-    'sidetracks',
-    'sideways-scrolling',
-    'sidewind',
-    'sidia',
-    'sidibe',
-    'sidibi',
-    'sidlaw',
-    'sidlow',
-    'sidonian',
-    'sidway',
-    'sidwell',
-    'sieb',
-    'siebengebirge',
     'sieclen',
-    'siegecraft',
-    'siegen',
-    'siemaszko',
-    'siematic',
-    'siemen',
-    'siemsens',
-    'sies',
-    'sifei',
-    'siffre',
-    'sifh',
-    'sifter',
-    'sifuentes',
-    'sigall',
-    'sighingly',
-    'sighings',
     'sightline',
-    'sigiswald',
-    'sigle',
-    'sign-flags',
-    'sign-writers',
-    'signature-model',
-    'signee',
-    'signetics',
-    'signiatures',
-    'signorita',
-    'signwriters',
-    'signwriting',
-    'sigurdsson',
-    'sihanoukiste',
-    'siho',
-    'sikdarpara',
     'sikkens',
-    'sikorski',
-    'silberschmelze',
-    'silberzahn',
-    'silbey',
-    'silcox',
-    'silegions',
-    'silent-film',
-    'silent-wheel',
-    'silentio',
-    'silents',
-    'silex',
-    'silfield',
-    'silicaplast',
-    'silicas',
-    'silicon-germanium',
     'silicon-oxygen',
-    'silif',
-    'silk-screen',
-    'silk-screens',
-    'silk-shaded',
-    'silk-stockinged',
-    'silkcounters',
-    'silky-soft',
-    'sillet',
-    'silly-billy',
-    'silom',
-    'silsden',
-    'silt-clay',
-    'silva/warwickshire',
-    'silvaire',
-    'silvas',
     'silvassa',
-    'silver-blond',
-    'silver-buckled',
-    'silver-covered',
-    'silver-gilded',
-    'silver-inlaid',
-    'silver-medal',
-    'silver-rich',
-    'silver-rimmed',
-    'silver-screen',
-    'silver-sprayed',
-    'silver-washed',
-    'silveriness',
-    'silverlands',
-    'silverlight',
-    'silverskin',
     'silvery-blond',
-    'silvery-fair',
-    'silvie',
-    'silvije',
-    'silvis',
-    'silylating',
-    'sim&eacute;on',
-    'simalakama',
-    'simaung',
-    'simberloff',
-    'simca',
-    'simcoe',
-    'simeen',
-    'simernitskaya',
-    'simic',
-    'similar-aged',
     'similar-minded',
-    'similar-sounding',
-    'similarities/differences',
-    'similarly-rated',
-    'similiter',
-    'simiya',
-    'simm-lewis',
-    'simmons/abingdon',
-    'simonites',
-    'simonson',
-    'simonswood',
-    'simperingly',
-    'simple-majority',
-    'simple/complex',
-    'simpleness',
-    'simpless',
     'simplicium',
-    'simplifier',
-    'simpson\'s-in-the-strand',
-    'simpson-lawrence',
-    'simpson.',
-    'simulium',
-    'simulknit',
-    'simun',
-    'simy',
-    'sin\'',
-    'sinaiko',
-    'sinaneddin',
-    'sinatras',
-    'sincil',
-    'sindebele',
-    'sindhis',
     'sindicut',
-    'sindobod',
-    'sinfin',
-    'sinfoniettas',
-    'singapores',
-    'singelgracht',
-    'singen',
-    'singers/musicians',
-    'singham',
-    'single&rehy;handed',
-    'single-atom',
-    'single-author',
-    'single-centre',
-    'single-chain-urokinase-type',
-    'single-channel',
-    'single-code',
     'single-deficit',
-    'single-earner',
-    'single-end',
-    'single-execution',
-    'single-eyed',
-    'single-finger',
-    'single-hander',
-    'single-hulled',
-    'single-lens',
-    'single-occupancy',
-    'single-parents',
-    'single-particle',
-    'single-phase',
-    'single-platform',
-    'single-practice',
-    'single-school',
     'single-seeded',
-    'single-sentence',
-    'single-shelled',
-    'single-speed',
-    'single-story',
-    'single-stream',
-    'single-tailed',
-    'single-ticket',
-    'single-transformer',
-    'single-vendor',
-    'single-volume',
-    'single-wire',
-    'single-year',
-    'single/mixed-sex',
-    'singmaster',
-    'singular/plural',
     'singularis',
-    'singularisation',
-    'singulative',
-    'sinj',
-    'sinkage',
-    'sinkov',
-    'sinkt',
-    'sinna',
-    'sino-mongolian',
-    'sino-nepalese',
-    'sinological',
-    'sinologist',
-    'sins.',
-    'sintong',
-    'sioniae',
-    'siotis',
     'sip&ouml;tz',
-    'siphnos',
-    'sippers',
-    'sir.',
-    'siren-like',
-    'sirloins',
-    'siroca',
-    'sisa',
-    'sisenand',
-    'sismey',
-    'sissoko',
-    'sissonnes',
-    'sister-exchange',
-    'sister-in-laws',
-    'sister/charge',
-    'sisters.',
     'sisterson',
-    'sistova',
-    'siswati',
-    'sit_next',
-    'sitarem',
-    'sitarist',
-    'sitbon',
-    'sitcom.',
-    'site-finding',
-    'sithee',
-    'sitkins',
-    'sito',
-    'sitraterco',
-    'sittard',
-    'sittelle',
-    'sitters-in',
     'sitting-down',
-    'situative',
-    'siu-ming',
-    'sivapithecus-',
-    'sivarasan',
-    'siwicki',
-    'six&rehy;week',
-    'six\'n',
-    'six\'s',
-    'six-and-six',
-    'six-burner',
-    'six-country',
-    'six-day-old',
-    'six-deep',
-    'six-dimensional',
-    'six-egg-boxes',
     'six-eight',
-    'six-event',
-    'six-feet',
-    'six-foot-two',
-    'six-hourly',
-    'six-litre',
-    'six-membered',
-    'six-million',
-    'six-million-dollar',
-    'six-month-long',
-    'six-ninety',
-    'six-pointer',
-    'six-power',
-    'six-race',
-    'six-rear-olds',
-    'six-shot',
     'six-ten',
-    'six-try',
-    'six-two',
-    'six-weekly',
-    'six-years-old',
-    'sixma',
-    'sixmilecross',
-    'sixteen\'',
-    'sixteen-and-a-half',
-    'sixteen-plus',
-    'sixteen-stone',
-    'sixteen-to',
-    'sixteene',
-    'sixteens',
-    'sixth-biggest',
-    'sixth-minute',
     'sixth-order',
-    'sixth-seeded',
-    'sixthform',
-    'sixty-eighth',
-    'sixty-five-year-old',
-    'sixty-four-year-old',
-    'sixty-fourth',
-    'sixty-hour',
-    'sixty-million-year-old',
-    'sixty-minute',
-    'sixty-nine-year-old',
-    'sixty-pound',
-    'sixty-sixth',
-    'sixty-something',
-    'sixty-three-year-old',
-    'sixty-year-olds',
     'siyane',
-    'size-classes',
-    'size-wise',
-    'size=0.5',
-    'sizgori&cacute',
-    'sj&ouml;d&eacute;n',
-    'sj-10',
-    'sj30',
-    'sjak',
-    'sjie',
-    'sjl',
-    'sjobergs',
-    'sk10',
-    'sk11',
-    'sk830',
-    'sk840',
     'sk860',
-    'sk9',
-    'skab',
-    'skaer',
-    'skaftar',
-    'skagway',
-    'skalicky',
-    'skaling',
-    'skamandros',
-    'skan',
-    'skandal',
-    'skandalkonzert',
-    'skansen',
-    'skarthi',
-    'skatalites',
-    'skate-boarding',
     'skateable',
-    'skateboarder/artist',
-    'skatenigs',
-    'skauge',
-    'skavronsky',
-    'skaw',
-    'skeaping',
-    'skeletally',
-    'skelly',
-    'skelton/brother',
-    'skeoch',
-    'skerneside',
-    'skerrington',
-    'sketch-like',
-    'sketched-in',
-    'sketches.',
     'sketching/drawing',
-    'sketty',
-    'skeuomorphs',
-    'skfa',
-    'ski-bums',
-    'ski-clothes',
-    'ski-ers',
-    'ski-gear',
-    'ski-sticks',
-    'ski-trousers',
-    'skidders',
-    'skidmarks',
-    'skiier',
-    'skill-building',
-    'skill-sharing',
-    'skill-training',
     'skillicorn/hercules',
-    'skillington',
-    'skills-oriented',
-    'skills/abilities',
-    'skimmington',
-    'skin-clad',
-    'skin-cloak',
-    'skin-colour',
-    'skin-divers',
-    'skin-like',
-    'skin-types',
-    'skinnies',
-    'skione',
-    'skipful',
-    'skipnish',
-    'skirmished',
     'skirwith',
-    'skitch',
-    'skithered',
-    'skitswish',
-    'skitten',
-    'skitters',
-    'skiver',
-    'skoglund',
-    'skorich',
-    'skotino',
-    'skouriotissa',
-    'skoyles',
-    'skr',
-    'skrela',
-    'skrid',
-    'skrue',
     'skua.',
-    'skull-and-crossbones',
-    'skull-face',
-    'skull.',
-    'skullcapped',
-    'skullplates',
-    'skunktail',
-    'skuzi',
-    'skvorecky',
-    'skweyiya',
-    'sky-claw',
-    'sky-god',
-    'sky-rocketing',
-    'sky/',
-    'skyclad',
-    'skying',
     'skylit',
-    'skyllaion',
-    'skynyrd',
-    'skypark',
-    'skyrme',
-    'skyrocketing',
-    'skysports',
-    'skywalker',
-    'sl-90',
-    'sl-xps900',
-    'sl.',
-    'sl542',
-    'sl9',
-    'slaaneshi',
-    'slacked',
-    'sladek',
     'slangy',
-    'slansky',
-    'slant-wise',
-    'slap-slap-slap',
-    'slapshot',
-    'slash-back',
-    'slate-floored',
-    'slatt',
-    'slavata',
-    'slave-girls',
-    'slave-holding',
-    'slave-masters',
-    'slaveholder',
-    'slaveships',
-    'slavey',
-    'slavophilism',
     'slavophils',
-    'slaytor',
-    'slbms',
-    'slch',
-    'sledge-hammers',
-    'sledger',
-    'sledgwick',
-    'sleech',
-    'sleeks',
-    'sleep-cell',
-    'sleep-drugged',
-    'sleep-starved',
-    'sleepeezee',
-    'sleepibye',
-    'sleeping-pills',
-    'sleeptalker',
     'sleepwalkers',
-    'sleepy-looking',
-    'sleepyhead',
-    'sleeve-fasteners',
-    'sleeve-like',
-    'slekys',
-    'slemish',
-    'slent',
-    'slevogt',
-    'sliced.',
-    'slide-talk',
-    'sliderobes',
-    'slieman',
-    'slightly-injured',
-    'slightness',
-    'slim-bodied',
     'slim-waisted',
-    'slimane',
-    'slimeballs',
-    'slimer',
-    'slimhole',
-    'slimily',
-    'slimly-built',
-    'slimmie',
-    'slimp',
-    'slinfold',
-    'sling-backs',
-    'sling-bombs',
-    'sling/gloucestershire',
-    'slingo',
-    'slingos',
-    'slinkier',
     'slinkiness',
-    'slip-link',
-    'slip-roads',
-    'slip-sliding',
-    'slip-ways',
-    'slipcases',
-    'slipcovers',
-    'slipperclub',
-    'slippier',
-    'slisz',
-    'slit-eyes',
-    'slits.',
-    'slive',
-    'slivovi&cacute',
-    'slmc',
-    'slo-cookers',
     'slobbers',
-    'sloch',
-    'sloe-eyed',
-    'sloe-hatching',
-    'sloganistic',
-    'sloggett',
-    'slokar',
-    'slonta',
-    'sloopy',
-    'slopers',
-    'sloppier',
-    'slorach',
-    'slouchy',
-    'slovakia-2',
-    'slovakians',
-    'slovenije',
     'slow-cooked',
-    'slow-flying',
-    'slow-handclapped',
-    'slow-mo',
-    'slow-paced',
-    'slow-scan',
-    'slow-worms',
-    'slower-drying',
-    'slower-migrating',
-    'slower-paced',
-    'slrs',
-    'slubbing',
-    'sludge-coloured',
-    'sludge-grey',
-    'sluff',
-    'slugfest',
     'sluggardly',
-    'sluggards',
-    'slugworm',
-    'slum-cleared',
-    'slum-owners',
-    'slumdwellers',
-    'slummocky',
-    'slupsk',
-    'slurried',
-    'slush-fund',
-    'slushers',
-    'sluttishness',
-    'slymbred',
-    'sm-1',
-    'sm58',
-    'smackhead',
     'smacksynth',
-    'smai/ecori',
-    'small(er)',
-    'small-animals',
-    'small-area',
-    'small-businessmen',
-    'small-circulation',
-    'small-clawed',
-    'small-craft',
-    'small-enough',
-    'small-eyed',
-    'small-framed',
-    'small-fry',
-    'small-leafed',
-    'small-like',
-    'small-order',
     'small-parts',
-    'small-patterned',
-    'small-pox',
-    'small-size',
-    'small-windowed',
-    'smallmindedness',
-    'smalltalk-like',
-    'smallware',
-    'smallwoods',
-    'smar',
-    'smartarses',
-    'smartgl',
-    'smartt',
-    'smash-up',
-    'smashem',
-    'smashers',
     'smashy',
-    'smattered',
-    'smba',
-    'smeal',
-    'smedes',
-    'smedleys',
-    'smedt',
-    'smeerenburg',
-    'smeeth',
-    'smeg',
-    'smellin\'-salts',
-    'smelling-bottle',
-    'smelling-salts',
-    'smerdomenes',
-    'smidgin',
-    'smigel',
     'smilers',
-    'smilesian',
-    'smilies',
-    'smiljkovi&cacute',
-    'smirch',
-    'smirnov-ostashvili',
-    'smirren',
-    'smith\'',
-    'smith-owned',
-    'smith-ryland/master',
-    'smith/child',
-    'smith/labour',
-    'smith/manager',
-    'smithdom',
-    'smithdown',
-    'smithesby',
     'smithie',
-    'smithkins',
-    'smmap',
-    'smoak',
-    'smoke-box',
-    'smoke-brown',
-    'smoke-grey',
-    'smoke-houses',
-    'smoke-laden',
-    'smoke-shrouded',
-    'smoke-signal',
-    'smoke-yellowed',
-    'smokeable',
-    'smokebuster',
-    'smoked-salmon',
-    'smokelessly',
     'smokier',
-    'smokin',
-    'smoking-induced',
-    'smoky-breath',
-    'smoky-looking',
-    'smoltsov',
-    'smoobillow',
-    'smoochier',
-    'smoogro',
-    'smoot',
-    'smoot-hawley',
-    'smooth-barked',
-    'smooth-flowing',
-    'smooth-looking',
-    'smooth-passing',
-    'smooth-shelled',
     'smooth-walled',
-    'smoothest-running',
-    'smr=137',
-    'smr=357',
-    'sms201&ndash;995',
-    'smutting',
-    'smyrl',
-    'smyrnium',
-    'smyth/doherty',
-    'smythe-watson',
-    'smythis',
-    'sn10',
-    'sn9300',
-    'sn9400',
-    'sn9500',
-    'sn9700',
     'sn9800',
-    'sna-lu6.2',
-    'snackette',
-    'snaffle-bit',
-    'snaggle',
-    'snaggy',
-    'snail-paced',
-    'snake-bark',
-    'snake-charmers',
-    'snake-heads',
-    'snakebark',
-    'snakecharmer',
-    'snakes-and-ladders',
-    'snakesborough',
-    'snakewood',
-    'snap-appn',
     'snap-kick',
-    'snapper-up',
-    'snappishly',
-    'snarler',
-    'snatch-squads',
-    'snatchings',
-    'snatchy',
-    'snazana',
-    'snazzier',
-    'snazziest',
-    'snb',
-    'sncc',
-    'sncs',
-    'sneakier',
-    'sneakin\'',
-    'sneed',
     'sneerers',
-    'snelly',
-    'snemovna',
-    'sneynton',
-    'snezhana',
-    'snickelways',
-    'snideness',
-    'sniffed.',
-    'sniffermaster',
-    'sniggery',
-    'sniperscope',
-    'snipings',
-    'snitching',
-    'sno-plough',
-    'snogger',
-    'snorkers',
     'snorscombe',
-    'snorted.',
-    'snortings',
-    'snory',
-    'snouty',
-    'snow&rehy;slope',
-    'snow-drift',
-    'snow-field',
-    'snow-flecked',
-    'snow-light',
-    'snow-packed',
-    'snow-soaked',
-    'snow-swept',
-    'snow-wreaths',
-    'snowball/wiltshire',
-    'snowblind',
     'snowbridges',
-    'snowdown',
-    'snowguns',
-    'snowmobiles',
-    'snowscapes',
-    'snozzwanglers',
-    'snr.',
-    'snsf',
-    'snufflings',
-    'snugborough',
-    'snuggly',
-    'snugs',
-    'snugville',
-    'snupps',
-    'snythales',
-    'so&commat;2',
     'so&mdash;see',
-    'so-serious',
-    'so-what',
-    'so/ozawa',
-    'so/sew',
-    'so5',
-    'so51',
-    'soak-away',
-    'soakell',
-    'soakers',
-    'soaltee',
-    'soan',
-    'soand-so',
-    'soanes',
-    'soap-filled',
-    'soapy-looking',
     'soaringly',
-    'soavita',
-    'soays',
-    'sobalvarro',
-    'sobbings',
-    'sober-looking',
-    'soberanis',
-    'soberer',
-    'soberness',
-    'sobieska',
-    'sobieski',
-    'sobradinho',
-    'sobs.',
-    'sobsovich',
-    'soccer-kit',
-    'soccio',
     'sociaal-economische',
-    'social-affairs',
-    'social-cognitive',
-    'social-critical',
-    'social-deictic',
-    'social-economic',
-    'social-historical',
-    'social-liberal',
-    'social-problem',
-    'social-property',
-    'social-realist',
-    'social.',
-    'socialdemokratiska',
-    'socialism\'',
-    'socialismo',
-    'socialist-dominated',
     'socialist-feminism',
-    'socialist/communist',
-    'socializes',
-    'socially-based',
-    'socially-conscious',
-    'society.',
-    'society/serc',
-    'socinians',
-    'socio-environmental',
-    'socio-ethical',
-    'socio-geographical',
-    'socio-professional',
-    'socio-religious',
-    'socio-technological',
-    'socio-temporal',
-    'sociobiologist',
     'sociodemography',
-    'sociogram',
-    'sociohistorical',
-    'sociologically-minded',
-    'sociologize',
-    'sockbridge',
-    'socorro',
-    'sodai',
-    'sodalities',
-    'soderbergh',
-    'sodgers',
-    'sodhail',
-    'sodium.',
-    'sodium/potassium',
-    'sodovyn',
-    'sodruzhestvo',
     'soeharto',
-    'soemita',
-    'soemthing',
-    'soesterberg',
-    'soete',
-    'soever',
-    'sofi',
-    'sofian',
-    'sofienbusch',
-    'sofronitski',
-    'soft-blue',
-    'soft-coloured',
-    'soft-face',
-    'soft-hard',
-    'soft-lipped',
-    'soft-pressed',
     'soft-sided',
-    'soft-soaping',
-    'soft-tops',
-    'softenings',
-    'softflex',
-    'softlinks',
-    'softly.',
-    'softners',
-    'softone',
-    'softool',
-    'softpc-based',
-    'software&mdash;library.pmr',
-    'software-',
-    'software.intensive',
-    'sofya',
-    'soggily',
     'sohei',
-    'sohxlet',
-    'soigneur',
-    'soil-borne',
-    'soil-less',
-    'soire\'e',
-    'sojourners',
-    'sokambi',
-    'sokolik',
-    'sokolnikoff',
-    'sokolovskiy',
-    'solamente',
-    'solar-flare',
-    'solar-generated',
-    'solara',
-    'solaris-compatible',
     'solaris-for-intel',
-    'solaris-on-iapx-86',
-    'solarise',
-    'solarised',
-    'solarising',
-    'solarspeed',
-    'solatium',
-    'solbes',
-    'soldier-folk',
-    'soldier-like',
-    'solemnised',
-    'solemnization',
-    'soleus',
-    'solferino',
-    'solgolf',
-    'solicitor-executor',
     'solicitor/client',
-    'solicitorial',
-    'solicitors/counsel',
-    'solid-body',
-    'solid-phase',
-    'solid-sounding',
-    'solidities',
-    'solidly-built',
-    'solifluxion',
-    'solimena',
-    'solite',
-    'sollicitudo',
-    'sollis',
-    'sollys',
-    'solnik',
-    'solognats',
     'solomin',
-    'solovyov',
-    'soltane',
-    'solubilization',
-    'solutions.',
-    'solvating',
-    'solvation',
-    'solved.',
-    'solvetiov',
-    'somafer',
-    'somarone',
-    'somatically',
-    'somatisation',
-    'somatotropin',
-    'somebod',
-    'somebody-or-other',
     'somemole',
-    'someo',
-    'somerby',
-    'somercotes',
-    'somerdale',
-    'somerscales',
-    'somervilles',
-    'somethi',
-    'something-for-nothing',
-    'something_a',
-    'somethingelse',
-    'someti',
-    'sometyme',
-    'somewhere_in',
-    'somhairle',
-    'somlak',
     'sommerfeld',
-    'somnambulance',
-    'somnambulism',
-    'somoza-era',
-    'somtyme',
-    'sonata-form',
-    'sonatine',
-    'sonchus',
-    'sondegaard',
-    'sonepur',
-    'sonets',
-    'song-book',
-    'song-books',
-    'song-type',
-    'song-types',
-    'song-writers',
     'songe',
-    'songful',
-    'songhor',
-    'sonians',
-    'soninke',
-    'sonnenschein',
-    'sonnie',
-    'sonograms',
-    'sonographic',
-    'sonor',
-    'sonorants',
-    'sonore',
-    'sons-of-bitches',
-    'sonum',
-    'sonz',
-    'soo-hyun',
     'soochow',
-    'sookey',
-    'sookies',
-    'soomro',
-    'soon-come',
-    'soon-to-be-famous',
-    'soon-to-be-released',
-    'soong-jong',
-    'soonish',
-    'soooooo',
-    'soos',
-    'soot-encrusted',
-    'soot-stained',
-    'soot-streaked',
-    'sooted',
-    'soothers',
     'soothill',
-    'sopa',
-    'sophie-carmen',
-    'sophisters',
-    'sophistical',
-    'sophisticat',
-    'sophists',
-    'sophusson',
-    'sopron',
-    'sops-in-wine',
-    'sorceresses',
-    'sorjus',
-    'soroban',
-    'sororities',
-    'sorous',
-    'sorp2',
     'sorps2',
-    'sorries',
-    'sorrowless',
-    'sorry-looking',
-    'sort_sort_of',
-    'sortil&egrave;ges',
-    'sortland',
-    'sorvall',
-    'soryu',
-    'soseaua',
-    'sosgeul',
-    'sosialidemokraattinen',
-    'sosnovka',
-    'sosnovy',
-    'sosnovy-bor',
-    'sostenuto',
     'sot-weed',
-    'sotheby\'s/london',
-    'sotion',
-    'sotirios',
-    'sotiroff',
-    'sotons',
-    'soubriquets',
-    'souda',
-    'soudainement',
-    'soul-cialism',
-    'soul/funk',
-    'soul/jazz',
-    'soulangeana',
-    'soulbury',
-    'soules',
-    'soullessness',
     'soumana',
-    'soume',
-    'sound(s)',
-    'sound-bites',
-    'sound-gate',
-    'sound-insulated',
-    'sound-play',
-    'sound-pulse',
-    'sound-range',
-    'sound-source',
-    'sound/symbol',
-    'soundholes',
-    'soundmaster',
-    'soup-to-nuts',
-    'souping',
-    'source-compatible',
     'source-coupled',
-    'source-free',
-    'source-study',
-    'source-text',
-    'source/',
-    'source/destination',
-    'sourceless',
-    'sourest',
-    'sourton',
-    'sousiana',
-    'sousing',
-    'sousliks',
-    'soussou',
-    'souster',
-    'soutanes',
-    'south&rehy;westerly',
     'south-african',
-    'south-easterners',
-    'south-flowing',
-    'south-german',
-    'south-lancashire',
-    'south-of-the-river',
-    'southampton&ndash;cherbourg',
-    'southband',
-    'southbend',
-    'southbrae',
-    'southcott',
-    'southendians',
-    'southern-fried',
-    'southerns',
-    'southill',
-    'southumbria',
     'souvenir-hunters',
-    'souvla',
-    'souwester',
-    'sovetskaya',
-    'sovetskiy',
-    'sovgeo',
-    'soviet&mdash;american',
-    'soviet-aligned',
-    'soviet-crewed',
-    'soviet-egyptian',
-    'soviet-hungarian',
-    'soviet-imposed',
-    'soviet-indian',
-    'soviet-iraqi',
-    'soviet-japanese',
-    'soviet-latin',
     'soviet-mujaheddin',
-    'soviet-occupied',
-    'soviet-orientated',
-    'soviet-turkish',
-    'soviet-uk',
-    'soviet/east',
-    'sovs.',
-    'sovyet',
-    'sowaidi',
-    'sowar',
-    'sowdens',
-    'sowle',
-    'sowonola',
-    'sowton',
-    'soxon',
-    'soyamilk',
     'soyibo',
-    'soyinka',
-    'soziale',
-    'sozialstaat',
-    'sp&eacute;culaire',
-    'sp7',
-    'spa-francorchamps',
-    'spa-goers',
-    'spaan',
-    'space&mdash;filled',
-    'space(s)',
-    'space-bar',
-    'space-cadet',
-    'space-covering',
-    'space-craft',
-    'space-dub',
     'space-fillers',
-    'space-fleet',
-    'space-heated',
-    'space-occupants',
-    'space-probe',
-    'space-satellite',
-    'space-suits',
-    'space-travel',
-    'spaceflight',
-    'spacenapping',
-    'spaces.',
-    'spackerman',
-    'spacks',
-    'spadefish',
-    'spadina',
-    'spafford',
     'spaghettini',
-    'spagnol',
-    'spal',
-    'spalbeck',
-    'spaldington',
-    'spall',
-    'spalted',
-    'spanboard',
-    'spancelled',
-    'spanged',
-    'spanish-dominated',
-    'spanishness',
-    'spankings',
-    'spanky',
-    'spanne',
-    'spanner.',
     'spano',
-    'spara',
-    'sparc-builder',
-    'sparccentre',
-    'sparcells',
-    'sparclxe',
-    'sparctstation',
-    'spare-part',
-    'spare-parts',
-    'sparely',
-    'spares.',
-    'spark-plug',
-    'spark-plugs',
-    'sparker',
-    'sparkes/unipart',
-    'sparkier',
     'sparnacian',
-    'sparrer',
-    'sparrow-like',
-    'spartali',
-    'spartanly',
-    'spasskaya',
-    'spatahori',
-    'spatchcock',
-    'spathes',
-    'spathiger',
-    'spathula',
-    'spatially-referenced',
-    'spatio-temporally',
-    'spatiotemporally',
-    'spatters',
-    'spauchle',
     'spaven',
-    'spavin',
-    'spaxworth',
-    'spazzle',
-    'speach',
-    'speak\'n\'',
-    'speaker\'s/writer',
-    'speaker-dependent',
-    'speaker-groups',
-    'speaker-independent',
-    'speaker-knowledge',
-    'speaker-meaning',
-    'speaker-presuppositions',
-    'speaking/preaching',
-    'spear-carriers',
-    'spear-headed',
     'spear-heads',
-    'spear-light',
-    'speargun',
-    'spearsman',
-    'spearsmen',
-    'speartip',
-    'spec92',
-    'specfp(92)',
-    'spech',
-    'specialia',
-    'specialissimus',
-    'specialist-generic',
-    'specialist/soil',
-    'specially-devised',
-    'specially-equipped',
-    'specially-established',
     'specially-formulated',
-    'specially-inscribed',
-    'specially-planned',
-    'specially-priced',
-    'specifiably',
-    'specin92',
-    'specint(92)',
-    'specint89',
-    'speciosum',
-    'speckledfaced',
-    'speckly',
-    'specky',
-    'specmark-to-500',
-    'specnfs',
-    'spectacularised',
-    'spectal',
     'spectator-friendly',
-    'spectator-highland',
-    'specthruput89',
-    'spectroscopically',
-    'spedeworth',
-    'speech-interactive',
-    'speech-like',
-    'speech-reading',
-    'speech-wise',
-    'speech-writers',
-    'speech/writing',
-    'speechly',
-    'speechmakers',
-    'speed-doubled',
-    'speed-freak',
-    'speed-restricted',
     'speed/macca',
-    'speedfreak',
-    'speedpex',
-    'speedstrip',
-    'speel',
-    'speen/buckinghamshire',
-    'speights',
-    'speld',
-    'speleology',
-    'spell-checked',
-    'spell-walls',
-    'spellacy',
-    'spelling-to-sound',
-    'spelman/planning',
-    'spelta',
-    'spem',
     'spenco*',
-    'spending.',
-    'sperm-bank',
-    'spermatogonial',
-    'sperrings',
-    'sperrins',
-    'speshnev',
-    'spetters',
-    'spettigue',
-    'spezzano',
-    'spf/pc',
-    'spfs',
-    'sphaericus',
-    'spheeris',
-    'sphere.',
-    'spheroids',
     'spherulitic',
-    'sphi',
-    'sphyg',
-    'spianato',
-    'spicata',
-    'spiceball',
-    'spicker',
-    'spicy-fried',
-    'spiddal',
-    'spider\'s-web',
-    'spider-webs',
-    'spidergob',
-    'spidertop',
-    'spiderweb',
-    'spiderwebs',
-    'spielberg/time',
     'spiffed',
-    'spiffingly',
-    'spikier',
-    'spikily',
-    'spiky-haired',
-    'spiles',
-    'spilites',
-    'spin-1/2',
-    'spin-2',
-    'spin-dryer',
-    'spin-i',
-    'spin-up',
-    'spina-bifida',
-    'spinal-injury',
-    'spinalis',
-    'spinally',
     'spindle-trees',
-    'spinel',
-    'spinelessly',
-    'spinis',
-    'spinmasters',
-    'spinnadisk',
-    'spinnet',
-    'spinning-mills',
-    'spinning-top',
-    'spinoletta',
-    'spinosella',
-    'spinothalamic',
-    'spinout',
-    'spinto',
-    'spiracle',
-    'spiral-like',
     'spiraling',
-    'spire-like',
-    'spirelets',
-    'spiriferid',
-    'spirit-inspired',
-    'spirit-soaked',
-    'spirituous',
-    'spirochaete',
-    'spironolactone',
-    'spit-roasted',
-    'spitball',
-    'spiteri',
-    'spitless',
-    'spitoon',
-    'spittle-bug',
-    'spitzka',
     'spivakov',
-    'splane',
-    'splash-in',
-    'splash/stroke',
-    'splayed-out',
-    'splendidly-named',
-    'splicer',
-    'splinter-group',
-    'splinter-groups',
-    'split-crotch',
-    'split-man',
-    'split-shot',
-    'splittism',
-    'splittists',
-    'splitz',
-    'sploshed',
     'sploshing',
-    'splotched',
-    'splurged',
-    'spods',
-    'spoggies',
-    'spoil-sports',
-    'spoilin\'',
-    'spokemen',
-    'spondon-based',
-    'spondylosis',
-    'spongey',
-    'sponish',
-    'sponsor-protege',
-    'sponsorship/charities',
-    'spoofer',
-    'spookish',
     'spookola',
-    'spoon-fashion',
-    'spoonerisms',
-    'spoornet',
-    'sporades',
-    'sporangium',
-    'sporborg',
-    'spore-forming',
-    'sporophore',
-    'sporrans',
-    'sporting-goods',
-    'sporto',
-    'sportopaedic',
-    'sportpalast',
-    'sports-car-driver',
-    'sports-clothes',
     'sports-mad',
-    'sports-playing',
-    'sports-prototype',
-    'sports/hobby',
-    'sportscars',
-    'sportshall',
-    'sportspages',
-    'sportswork',
-    'sposa',
-    'sposed',
-    'spot-light',
-    'spot-lit',
-    'spot-nosed',
-    'spot-prone',
-    'spotlisted',
-    'spotty-faced',
     'spouse/partner',
-    'spouses/families',
-    'spqr',
-    'spr/highest',
-    'spratling',
-    'spratts',
-    'spray-bar',
-    'spray-dried',
-    'spray-in-highlights',
-    'spraybar',
-    'sprayday',
-    'sprayson',
-    'spreadin\'',
-    'sprenger',
-    'sprengeri',
-    'sprezzatura',
     'sprich',
-    'spricht',
-    'sprigge',
-    'sprimont',
-    'spring-clip',
-    'spring-driven',
-    'spring-roller',
-    'spring/early',
-    'springette',
-    'springetts',
-    'springford',
-    'springier',
-    'springiest',
-    'sprinkleys',
-    'sprinklings',
-    'sprint-bulgaria',
     'sprinta',
-    'sprovieri',
-    'sprs/ssrs',
-    'spruce-trees',
-    'sprugg',
-    'spryly',
-    'spumes',
-    'spun-gold',
-    'spun-out',
-    'spungen',
-    'spurless',
-    'spurrier',
-    'spv',
-    'spx/ipx',
-    'spy-holes',
-    'spycatchers',
     'spycoal',
-    'spyplane',
-    'sq-2550',
-    'sq._feet',
-    'sq.cm',
-    'sq_km.',
-    'sq_units',
-    'sqeeze',
-    'sql-92',
-    'sql-like',
-    'sql/connect',
-    'sql2',
-    'sqq',
-    'squabblings',
-    'squadron.',
-    'squalidus',
     'squamish',
-    'squamocolumnar',
-    'squarciapino',
-    'square-edged',
-    'square-eyed',
-    'square-necked',
-    'square-riggers',
-    'square-tailed',
-    'square-tipped',
-    'square-toed',
-    'squarehouse',
-    'squariel',
-    'squash-courts',
-    'squashable',
-    'squashed-looking',
-    'squatly',
     'squawky',
-    'squawl',
-    'squawrk',
-    'squeak-core',
-    'squeaker',
-    'squeakily',
-    'squeaky-voiced',
-    'squeezebox',
-    'squeezed.',
-    'squinnying',
-    'squirearchical',
-    'squireens',
-    'squirreled',
-    'squirter',
-    'squirters',
-    'sr-3',
     'sr1',
-    'sr1,282',
-    'sr143,000',
-    'sr16',
-    'sr2',
-    'srampickal',
-    'sranang',
-    'srdt',
-    'sre-cyc1-lacz',
-    'sreberny-mohammadi',
-    'sree',
-    'sremska',
-    'srf412',
-    'srhe/leverhulme',
-    'sricam-1',
-    'sricam-2',
     'srinivasan',
-    'sriperumbudur',
-    'srmuc18',
-    'srnecek',
-    'srodes',
-    'ss-4s',
-    'ss.15&mdash;16',
-    'ss.2',
-    'ss148',
-    'ss160',
-    'ss2+',
-    'ss20(4)',
-    'ss219',
-    'ss3',
-    'ss31',
-    'ss34',
     'ss4(7)',
-    'ss5(1)',
-    'ss77',
-    'ss8',
-    'ss9',
-    'ssab',
-    'ssad',
-    'ssap2',
-    'ssap20',
-    'ssc-0.1%',
-    'ssci',
-    'ssds/swds',
-    'ssemegorere',
-    'ssfa',
-    'ssmh',
-    'ssnm',
     'ssp1(l)',
-    'ssp2',
-    'sspc',
-    'sspv',
-    'ssrps',
-    'ssso',
-    'ssssag-ram-ossso',
-    'ssti-xhoi',
-    'ssu',
-    'st&auml;delsches',
-    'st&iacute;of&aacute;in',
-    'st&ndash;paul',
-    'st&ouml;cker',
-    'st-1',
-    'st-3',
-    'st-aubin',
     'st-germain-des-pr&eacute;s',
-    'st-jean-de-losne',
-    'st-jean-du-gard',
-    'st-laurent',
-    'st-quentin',
-    'st-savinien',
-    'st-t',
-    'st-vaast',
-    'st-victor',
-    'st.mary',
-    'st.nicholas',
-    'st.pancras',
-    'st.petersburg',
-    'st15',
-    'st200',
-    'st36',
     'sta-prests',
-    'staatlich',
-    'stab-in-the-back',
-    'stabb',
-    'stabiae',
-    'stabilator',
-    'stabiles',
-    'stabilised.',
-    'stability-oriented',
-    'stable-hands',
-    'stable-lads',
-    'stable-mates',
-    'staccato-like',
-    'stachura',
-    'stack-oriented',
-    'stack-pipes',
     'stackpoole',
-    'stacpole/british',
-    'stacwq',
-    'stadium-building',
-    'stadium-sized',
-    'stadlen',
-    'staer',
-    'staff-child',
-    'staff-inmate',
-    'staff-parent',
-    'staff-pupil',
-    'staff/management',
-    'staffie',
-    'staffman',
-    'stafford-hayden',
-    'stafford-wellington',
     'staffords',
-    'stag\'s-horn',
-    'stag-like',
-    'stage-directions',
-    'stage-dived',
-    'stage-divers',
-    'stage-left',
-    'stage-one',
-    'stage-right',
-    'stage-struck',
-    'stage-whispers',
-    'stagebound',
-    'stageman',
-    'stageplays',
-    'staggerwings',
-    'staging-posts',
     'stagnalis',
-    'stagnationist',
-    'stai-x1',
-    'staidness',
-    'stain-removal',
-    'stainforths',
-    'stainley',
-    'stainshield',
-    'stainton-kelly/pig',
-    'stair-case',
-    'stair-post',
-    'stairs.',
-    'stakesby',
-    'stalefish',
-    'staleybridge',
-    'stalin-trotsky',
     'stalinesque',
-    'stalkier',
-    'stalwartly',
-    'stamboek',
-    'stamboli&cacute',
-    'stamboul',
-    'staminodal',
-    'stamm',
-    'stamp-collecting',
-    'stamp-linked',
-    'stamped-addressed',
-    'stampedes',
-    'stampfle',
-    'stamps.',
-    'stanback',
-    'stance.',
     'stancing',
-    'stand-bys',
-    'stand-downs',
-    'stand-pipes',
-    'stand-still',
-    'stand.alone',
-    'stand/',
-    'standard-cell',
-    'standard-compliant',
-    'standard-mode',
-    'standardises',
-    'standardness',
-    'standards-hot',
-    'standerline',
-    'standest',
-    'standhill',
     'standin',
-    'standing-stones',
-    'standli',
-    'standly',
-    'standoffs',
-    'standring',
-    'standstills',
-    'standun',
-    'staneydale',
-    'stanford-in-the-vale',
-    'stanhill',
-    'stanhope-murray',
-    'staniforth',
-    'staniland',
-    'stanislao',
-    'stannard/oxford',
     'stannary',
-    'stanningley',
-    'stansbury',
-    'stansby',
-    'stapeley',
-    'staplefield',
-    'stapleton/john',
-    'star-burst',
-    'star-clusters',
-    'star-flowers',
-    'star-gaze',
-    'star-sign',
-    'star-spotting',
-    'star-tek',
-    'star/2',
-    'star/3',
     'starb',
-    'starbound',
-    'starbright',
-    'starburn',
-    'starchily',
-    'stard',
-    'stardent/avs',
-    'starfucker',
-    'starkadders',
-    'starmaker',
-    'starmakers',
-    'starobinsky',
-    'starpro',
-    'starrer',
-    'starret',
-    'starriest',
     'stars\'n\'stripes',
-    'starsfield',
-    'starspangled',
-    'starstream',
-    'start&lowbar;posn',
-    'start-',
-    'start-holes',
-    'start-mark',
-    'start/',
-    'start/maintenance',
-    'start2',
-    'starting/',
-    'startlement',
-    'stasiak',
-    'stat.',
-    'statajack',
     'state-',
-    'state-appointed',
-    'state-approved',
-    'state-artists',
-    'state-economy',
-    'state-making',
-    'state-peasant',
-    'state-set',
-    'state-space',
-    'state/civil',
-    'statecentric',
-    'stategies',
-    'statehouse',
-    'statelier',
-    'stately-home',
-    'staten-generaal',
     'states-mediated',
-    'states-supported',
-    'states-system',
-    'statesboro',
-    'station-hotel',
-    'station-house',
-    'station-keeper',
-    'stationarii',
-    'statoblest',
-    'statton',
-    'status&lsqb;untested&rsqb',
-    'status-bound',
-    'statute-laws',
-    'statute.',
-    'staurady',
-    'staurt',
     'stavers',
-    'stay-put',
-    'staybrite',
-    'staying-power',
-    'staysail',
-    'stayte/milkman',
-    'stazione',
-    'stc-icl',
-    'ste.',
-    'steady-as-you-go',
-    'steafel',
-    'steak-frites',
-    'steak-with-everything',
-    'stealthier',
-    'stealthiness',
-    'steam-bath',
     'steam-cleaned',
-    'steam-cleaning',
-    'steam-clouded',
-    'steam-generator',
-    'steam-hammer',
-    'steam-hammers',
-    'steam-operated',
-    'steam-roll',
-    'steam-tight',
-    'steam-turbine',
-    'steamier',
-    'steamrollers',
-    'steamrolling',
-    'steamroom',
-    'stearoyl',
-    'steatorrhoea',
     'steckborn',
-    'stede',
-    'stee',
-    'steel-castings',
-    'steel-fanged',
-    'steel-hard',
-    'steel-jawed',
-    'steel-nibbed',
-    'steel-nickel',
-    'steel-reinforced',
-    'steel-strong',
-    'steel-strung',
-    'steel-tape',
-    'steel-wire',
-    'steele-bodger',
-    'steelfounders',
     'steelholder',
-    'steelie',
-    'steelmaster',
-    'steenk',
-    'steenkirk',
-    'steens',
-    'steep-faced',
-    'steep-incline',
-    'steepish',
-    'steeply-dipping',
-    'steerbear',
-    'steereo',
-    'steerer',
-    'steet',
-    'stefana',
-    'stefanoni',
     'stefansplatz',
-    'steffell',
-    'steffisburg',
-    'stegman',
-    'stegosaurs',
-    'steib',
-    'steiermark',
-    'steinam-rhein',
-    'steinbrunner',
-    'steinburg',
-    'steinegger',
-    'steinfeld',
-    'steinhausen',
-    'steinhoff',
-    'stelios',
-    'stell',
     'stellarators',
-    'stellaris',
-    'stelle',
-    'stelmaszuk',
-    'stemmle',
-    'stenching',
-    'stenka',
-    'stennett/former',
-    'stenophylla',
-    'stenor',
-    'stenotic',
-    'stenotography',
-    'steny',
-    'step-by&rehy;step',
-    'step-grandchildren',
-    'step-like',
     'step-mothers',
-    'step-overs',
-    'step-relatives',
-    'stepdown',
-    'stepgrandchildren',
-    'stephani',
-    'stephens/gloucester',
-    'steppin\'-stones',
-    'steppingley',
-    'steppler',
-    'ster.',
-    'sterbae',
-    'sterbeurkunden',
-    'stercoralis',
-    'sterculiaceae',
-    'stereo-specific',
     'stereo.',
-    'stereometric',
-    'stereomicroscope',
-    'stereoregular',
-    'sterilisations',
-    'steristrip',
-    'sterlets',
-    'sterling/dollar',
-    'sternata',
-    'sterndale',
-    'sternopleural',
-    'sterpa',
-    'sterrebeek',
-    'stert',
-    'stet-hellas',
-    'stethoscope-like',
     'steuben',
-    'steve/the',
-    'steven/annabelle',
-    'steven/managing',
-    'steveney',
-    'stevenson.',
-    'stevenson/thames',
-    'stevensonian',
-    'steventon/oxfordshire',
-    'stevey-boy',
-    'stewardson',
-    'stewart-davis',
-    'stewart-richardson',
-    'stewart-smith',
-    'stewart/former',
-    'stewart/ranson',
     'stewed-up',
-    'stiched',
-    'stick-a-bum',
-    'stick-pin',
-    'stick-thin',
-    'sticky-back',
-    'sticky-looking',
-    'sticky-sweet',
-    'stieglitz-generated',
-    'stiff-bristled',
-    'stiff-limbed',
-    'stiff-winged',
-    'stiff-wristed',
-    'stiffeners',
-    'stiffnesses',
-    'stigmatises',
     'stiklestad',
-    'still-air',
-    'still-beautiful',
-    'still-continuing',
-    'still-frame',
-    'still-frozen',
-    'still-green',
-    'still-hot',
-    'still-lamented',
-    'still-open',
-    'still-operational',
-    'still-powerful',
-    'still-present',
-    'still-sealed',
-    'still-silent',
-    'still-standing',
     'still-surviving',
-    'still-unidentified',
-    'still-white',
-    'stillest',
-    'stillmans',
-    'stillnesses',
-    'stillstand',
-    'stillstands',
-    'stiltons',
-    'stimerol',
-    'stimpy',
-    'stims',
-    'stimu-nodes',
-    'stimulated&rehy;emission',
-    'stimulation.',
-    'stimuli/apparatus',
     'stimulus&mdash;reaction',
-    'stimulus-induced',
-    'stingo',
-    'stipples',
-    'stipules',
-    'stirbei',
-    'stiris',
-    'stirling/inverness',
-    'stirrat',
-    'stirton',
-    'stitch-cutter',
-    'stitches.',
-    'stjernsward',
-    'stkr',
-    'stlg',
-    'stll',
     'stobbie',
-    'stochastically',
-    'stock-brokers',
-    'stock-jobbers',
-    'stock-keepers',
-    'stock-levels',
-    'stock-raiding',
-    'stockhorn',
-    'stocking-masked',
-    'stocking-masks',
-    'stockinger',
-    'stockingers',
-    'stockmann',
-    'stockmaster',
-    'stocktaker',
-    'stockyaryd',
     'stodart',
-    'stodham',
-    'stohrer',
-    'stoicorum',
-    'stoilov',
-    'stojanov',
-    'stoke-ash',
-    'stoke-by-clare',
-    'stokeld',
-    'stokeley',
-    'stokes-smith/protestor',
-    'stoleru',
-    'stollhans',
-    'stolow',
-    'stoltz',
-    'stomach.',
     'stomas',
-    'stone-breaker',
-    'stone-carved',
-    'stone-carvers',
-    'stone-cutters',
-    'stone-gathering',
-    'stone-hard',
-    'stone-hearted',
-    'stone-packed',
-    'stone-picking',
-    'stone/cashier',
-    'stonebanks',
-    'stonebreaker',
-    'stonecrops',
-    'stonecutters',
-    'stonedale',
     'stonegrave',
-    'stonehill',
-    'stonelaw',
-    'stoneless',
-    'stonewalls',
-    'stoneyard',
-    'stoneygate',
-    'stoneywood',
-    'stonk',
-    'stonkingly',
-    'stonks',
-    'stonnell',
-    'stonygate',
-    'stoolie',
-    'stoop-back',
-    'stooperdale',
     'stop-gaps',
-    'stop-light',
-    'stop-punch',
-    'stop-spot',
-    'stop-the-war',
-    'stopgate',
-    'stoppenbach',
-    'stopping-out',
-    'stopsley',
-    'storable',
-    'store-for-store',
-    'store-house',
-    'store-jar',
-    'storebaelt',
-    'stored-program',
-    'storeplace',
     'stores.',
-    'storm-beaten',
-    'storm-swept',
-    'storm/dba',
-    'storma',
-    'stormbreaker',
-    'stormtrooper',
-    'stornaway',
-    'storper',
-    'storton',
-    'storybooks',
-    'storyville',
-    'stossen',
-    'stosstruppen',
-    'stott/event',
-    'stott/national',
     'stottor',
-    'stourford',
-    'stourport-on-severn',
-    'stove-top',
-    'stovies',
-    'stow-on-the-wold/gloucestershire',
-    'stowford',
-    'stoyanovich',
-    'stp/im',
-    'stpd',
-    'str-',
-    'stra&szlig;e',
-    'stracey',
-    'strach-zimmerman',
-    'strach.gif.uu',
-    'stradishall',
     'stradlings',
-    'straight-batted',
-    'straight-bladed',
-    'straight-games',
-    'straight-grained',
-    'straight-hit',
-    'straigth',
-    'strait-jacketed',
-    'strait-jacketing',
-    'strake',
-    'strakhov',
-    'stramash',
-    'stramonium',
-    'stranalysedesc',
-    'strange-attractor',
-    'strange-shaped',
     'strange/pure',
-    'stranger-looking',
-    'stranka',
-    'stranraers',
-    'stransky',
-    'strap-hangers',
-    'strap-like',
-    'strap-watch',
-    'strapper',
-    'strasshofer',
-    'strassmann',
-    'stratech',
-    'strategeion',
-    'strategem',
-    'strategic-issue',
-    'strategies.',
     'strategy-making',
-    'stratford/chamber',
-    'stratford/swindon',
-    'stratham',
-    'stratheden',
-    'strathford',
-    'stratificationalist',
-    'stratigrapher',
-    'stratoliner',
-    'stratospheric-flying',
-    'stratotanker',
-    'strausberg',
-    'stravaiging',
-    'straw-',
-    'straw-boatered',
-    'straw-necked',
     'straw-stack',
-    'strawberry-coloured',
-    'strawlike',
-    'strawn',
-    'strawweight',
-    'stre',
-    'stream-lined',
-    'stream-sediment',
-    'streamer-shaped',
-    'streames',
-    'streams-based',
-    'streatley-on-thames',
-    'stree',
-    'street-battles',
-    'street-cambridge',
-    'street-dwellers',
     'street-girls',
-    'street-inspired',
-    'street-kirkbride',
-    'street-markets',
-    'street-noise',
-    'street-presence',
-    'street-sussed',
-    'street-sweeping',
-    'street-the',
-    'street-traders',
-    'street-wisdom',
-    'street-women',
-    'street/centre',
-    'streeterville',
-    'streetley',
-    'streetlife',
     'streetmap',
-    'streeton',
-    'streetshome',
-    'streetwear',
-    'streitgenossenschaft',
-    'strelitz',
-    'strelsy',
-    'strenewe',
-    'strength-in-depth',
-    'strength-sapping',
-    'strengths/weaknesses',
-    'stress-carrying',
-    'stress-cracking',
-    'stress-management',
-    'stressballs',
-    'stretch-limousines',
     'stretchability',
-    'strettel',
-    'stretto',
-    'striata',
-    'striatus',
-    'strickers',
-    'stricto',
-    'stricturoplasty',
-    'stricutres',
-    'strike-hit',
-    'strike-proneness',
-    'strike/lock-out',
-    'string-puller',
-    'stringings',
-    'stringline',
-    'strip-down',
     'strip-show',
-    'strip-wash',
-    'strip.',
-    'stripeless',
-    'striper',
-    'stripes.',
-    'stripnumber',
-    'stripogram',
-    'strippings',
-    'stript',
-    'stritter',
-    'strobe-like',
-    'strodder',
-    'stroke-makers',
-    'strokeplayer',
-    'stroker',
     'strollathon',
-    'stromatolite',
-    'stromatoporoid',
-    'strombus',
-    'stromeferry',
-    'stromefirry-nofirry',
-    'stromelysin',
-    'stromeyer',
-    'strong\'',
-    'strong-amplitude',
-    'strong-bodied',
-    'strong-coloured',
-    'strong-finishing',
-    'strong-motion',
-    'strong-room',
-    'strong-weak',
     'strongish',
-    'strongly-marked',
-    'stropped',
-    'stross',
-    'stroud-based',
-    'strouds',
-    'stroulger',
-    'stroviol',
-    'strow',
-    'strube',
-    'structurale',
-    'structure-action',
-    'structure-strategy',
-    'structure/',
-    'structure/security',
-    'structures.',
     'strunk',
-    'struther',
-    'strutter',
-    'stuart-buttle',
-    'stubbington',
-    'stubborness',
-    'stubby-fingered',
-    'stuben',
-    'stuberls',
-    'stubig',
-    'stuccoes',
-    'stuccoists',
-    'stuck-on',
-    'stud-pattern',
-    'studeley',
-    'student-initiated',
     'student-teachers',
-    'student-trainers',
-    'student-union',
-    'student/candidate',
-    'student/tutor',
-    'studios.',
-    'studium',
-    'studlar',
-    'study**',
-    'study-bedrooms',
-    'study-time',
-    'study/project',
-    'stuffed-shirt',
-    'stuffers',
-    'stuffily',
-    'stui',
     'stukely',
-    'stulberg',
-    'stulz',
-    'stumbling-blocks',
-    'stumbrys',
-    'stummes',
-    'stump-legged',
-    'stumpies',
-    'stunt-man',
-    'stuntwoman',
-    'stunty',
-    'stupid/insensitive',
-    'stupples',
-    'sturdy-looking',
-    'sturiale',
-    'sturing',
     'sturmberg',
-    'sturmers',
-    'sturmey',
-    'sturrocks',
-    'sturtevant',
-    'sturzvage',
-    'stushie',
-    'stuttard',
-    'stuttery',
-    'stuttgarter',
-    'stuwart',
-    'styches',
-    'stylet',
-    'stylet-like',
-    'stylianou',
-    'stylina',
     'stylisticians',
-    'stylistlc',
-    'stylocumulates',
-    'stylolitization',
-    'styne',
-    'styrenic',
-    'su-kyong',
-    'suabian',
-    'suam',
-    'suard',
-    'suaveolens',
-    'sub&rehy;normal',
-    'sub-&dollar;4,000',
-    'sub-&pound;200',
-    'sub-80',
-    'sub-abilities',
     'sub-accounts',
-    'sub-aerial',
-    'sub-aerially',
-    'sub-aqueous',
-    'sub-businesses',
-    'sub-centre',
-    'sub-chunks',
-    'sub-clan',
-    'sub-clinically',
-    'sub-commissions',
-    'sub-consciousness',
-    'sub-continental',
-    'sub-contractors.',
-    'sub-councils',
-    'sub-crustal',
-    'sub-delegated',
     'sub-delta',
-    'sub-dimensions',
-    'sub-districts',
-    'sub-edited',
-    'sub-endocardial',
-    'sub-families',
-    'sub-forms',
-    'sub-function',
-    'sub-funds',
-    'sub-government',
-    'sub-governor',
-    'sub-grades',
-    'sub-gricean',
-    'sub-gun',
-    'sub-humans',
-    'sub-inspector',
     'sub-jmcs',
-    'sub-kingdoms',
-    'sub-language',
-    'sub-leasing',
-    'sub-licencing',
-    'sub-literature',
-    'sub-localities',
-    'sub-mandibular',
-    'sub-mariners',
-    'sub-men',
-    'sub-milankovitch',
-    'sub-moral',
-    'sub-nietzschian',
-    'sub-objectives',
-    'sub-optimality',
-    'sub-optimally',
     'sub-package',
-    'sub-panel',
-    'sub-parcels',
-    'sub-personal',
-    'sub-personalities',
-    'sub-plans',
-    'sub-prioress',
-    'sub-proletariat',
-    'sub-questions',
-    'sub-record',
-    'sub-rectangular',
-    'sub-routine',
-    'sub-scales',
-    'sub-scores',
-    'sub-sets',
-    'sub-strata',
     'sub-studies',
-    'sub-sub-branches',
-    'sub-sub-delegation',
-    'sub-tenancies',
-    'sub-tenancy',
-    'sub-terms',
-    'sub-tertiary',
-    'sub-underlease',
-    'sub-utility',
-    'sub-world',
-    'sub-xxxx',
-    'sub.',
-    'sub_poena',
-    'subadditive',
-    'subambient',
-    'subapical',
     'subcategorization',
-    'subcommunities',
-    'subcompact',
-    'subcoxa',
-    'subcoxal',
-    'subcrystals',
-    'subdermal',
-    'subeditor',
-    'subendocardial',
-    'subendothelium',
-    'subentry',
-    'subepidermal',
-    'subero',
-    'subformations',
-    'subfreights',
-    'subgeneric',
     'subglacial',
-    'subhas',
-    'subhilar',
-    'subintegra',
-    'subirana',
-    'subject-class',
-    'subject-department',
-    'subject-headings',
-    'subject-matters',
-    'subject-paced',
-    'subject-specialist',
-    'subject-verb',
-    'subject/type',
-    'subject/verb',
-    'subjectionis',
-    'subjective-objective',
     'subjective/objective',
-    'subjectiveness',
-    'subjectmatter',
-    'subjects&mdash',
-    'sublethal',
-    'sublets',
-    'sublettings',
-    'sublimations',
-    'sublimest',
-    'subline',
-    'sublingual',
-    'submarcom',
-    'submembrane',
-    'submit-job',
-    'submitted.',
-    'submucous',
     'subnetworks',
-    'subordinacy',
-    'subordinance',
-    'subparagraph',
-    'subperitoneally',
-    'subpool',
-    'subregion',
-    'subse',
-    'subsecond',
-    'subsegments',
-    'subsequences',
-    'subserosal',
-    'subserviency',
-    'subshells',
-    'subsistence-pattern',
-    'subsistent',
     'subskill',
-    'subsp.',
-    'subspecialist',
-    'substainable',
-    'substitutionally',
-    'subsymbolic',
-    'subtask',
-    'subtense',
-    'subterm',
-    'subterminal',
-    'subtile',
-    'subtility',
-    'subtours',
-    'subtree',
-    'suburbans',
-    'subversity',
     'subvolcanic',
-    'subwoofer',
-    'succesive',
-    'success-glutted',
-    'success-seeking',
-    'successes.',
-    'successfulness',
-    'succoureth',
-    'succus',
-    'sucessfully',
-    'such-and-such-a-thing',
-    'sucjects',
-    'sucklings',
-    'sud-ouest',
-    'sud-tribune',
-    'suddards',
     'suddenly-abandoned',
-    'suddick',
-    'sudomo',
-    'sue-anna',
-    'sueb',
-    'suedeheads',
-    'suella',
-    'sueo',
-    'suessmuth',
-    'suetin',
-    'sufficient.',
-    'suffragio',
-    'suffusions',
-    'suficiently',
-    'suframa',
-    'sugar-containing',
     'sugar-loaded',
-    'sugar-mouse',
-    'sugar-related',
-    'sugar-rich',
-    'sugge',
-    'suggestion.',
-    'sugiarto',
-    'suiheisha',
-    'suit\'',
-    'suitbrain',
-    'suitings',
-    'suivie',
-    'suka',
-    'sukas',
-    'sukatschev',
-    'suke',
     'sukkur',
-    'sukmak',
-    'sukowa',
-    'sukristovas',
-    'sulcis',
-    'sulejman',
-    'suleymenov',
-    'suliard',
-    'sulings',
-    'sulitjelma',
-    'sulkin',
-    'sullen-looking',
-    'sulley',
-    'sulome',
-    'sulphonate',
-    'sulphur-bearing',
     'sulphydryl',
-    'sum&gt;0',
-    'sumba',
-    'sumbanese',
-    'sumber',
-    'sumbu',
-    'sumfink',
-    'sumgait',
-    'sumida',
-    'sumie',
-    'sumlin',
-    'summ/ix',
-    'summae',
-    'summarisation',
-    'summarisers',
-    'summarizer',
     'summating',
-    'summer-blue',
-    'summer-fruiting',
-    'summer-houses',
-    'summer-like',
-    'summerchilds',
-    'summers/gloucestershire',
-    'summerscales',
-    'summings-up',
-    'summit-level',
-    'summons/initial',
-    'sumpin\'',
-    'sumyaa',
-    'sun&rehy;drenched',
-    'sun-4',
-    'sun-and-planet',
     'sun-bed',
-    'sun-blistered',
-    'sun-catching',
-    'sun-centered',
-    'sun-centred',
-    'sun-dazed',
-    'sun-developed',
-    'sun-gilded',
-    'sun-hats',
-    'sun-lenses',
-    'sun-light',
-    'sun-like',
-    'sun-lovers',
-    'sun-reddened',
-    'sun-reflecting',
-    'sun-saturn',
     'sun-shade',
-    'sun-shaped',
-    'sun-softened',
-    'sun-struck',
-    'sun-tanning',
-    'sun-tropical',
-    'sun-washed',
-    'sun-wind',
-    'sun/3',
-    'sun386i',
-    'sunair',
-    'sunblasted',
-    'sunblinds',
-    'sunblocks',
-    'sunbonnet',
-    'sunbright',
     'sunburst-finished',
-    'sunbury-on-thames',
-    'sundaram',
-    'sundaresan',
-    'sunday-go-to-meetings',
-    'sunderlandwick',
-    'sundin',
-    'sundrige',
-    'sundstein',
-    'sunfilter',
-    'sungate',
-    'sunghir',
-    'sunglo',
-    'sungod',
-    'sunium',
-    'sunken-floored',
     'sunlabs',
-    'sunmed',
-    'sunn',
-    'sunnies',
-    'sunniside',
-    'sunny-hearted',
-    'sunnybrow',
-    'sunpic',
-    'sunshine-yellow',
-    'sunsoaked',
-    'sunview-to-open',
-    'sunwarmed',
-    'suomalainen',
-    'suominen',
-    'suore',
-    'supadriv',
     'supalla',
-    'supasnaps',
-    'supatra',
-    'supension',
-    'super-agency',
-    'super-box',
-    'super-cinemas',
-    'super-confident',
-    'super-constituency',
-    'super-cool',
-    'super-cop',
-    'super-formats',
-    'super-hyped',
-    'super-imposition',
-    'super-levy',
-    'super-macho',
     'super-ministries',
-    'super-model',
-    'super-nintendo',
-    'super-order',
-    'super-parliament',
-    'super-party',
-    'super-refined',
-    'super-regulator',
-    'super-saturation',
-    'super-secret',
-    'super-seriously',
-    'super-size',
-    'super-slick',
-    'super-sprinters',
-    'super-stadium',
-    'super-stardom',
     'super-streamlined',
-    'super-sweet',
-    'super-thin',
-    'super-track',
-    'super-union',
-    'super-vhs',
-    'super-woolly',
-    'super/subscript',
-    'superannuable',
-    'superbanks',
-    'superbly-judged',
-    'supercalafragalisticexpialidotious',
-    'supercargo',
-    'supercede',
-    'superceding',
-    'superchamp',
     'superconductive',
-    'superconscious',
-    'superelevation',
-    'superfecundity',
-    'superflow',
-    'superfluousness',
-    'superflux',
-    'superfusate',
-    'superfusion',
-    'supergrip',
-    'superheating',
-    'superimpositions',
-    'superintendency',
-    'superiority/inferiority',
-    'superking',
-    'superleague',
     'superloft',
-    'superloos',
-    'superlunary',
-    'supermarionation',
-    'supermec',
-    'supermercado',
-    'supermother',
-    'supermouse',
-    'superneutrality',
-    'supernovas',
-    'supernumeraries',
-    'superobese',
-    'superorganism',
-    'superpage',
-    'superparamagnetic',
-    'superpiss',
     'superproject',
-    'superpruf',
-    'supersad',
-    'superscaler',
-    'superse',
-    'supersedeas',
-    'superseiners',
-    'supersensitivity',
-    'supersparc-compatible',
-    'superstardom',
-    'superstates',
-    'superteen',
-    'supertitles',
-    'supertop',
-    'supertough',
-    'supervenient',
     'supervision.',
-    'supervisions',
-    'supervize',
-    'supicious',
-    'supinely',
-    'suport',
-    'supp&eacute',
-    'supp.',
-    'supper-party',
-    'supper-summit',
-    'supper-things',
-    'suppl&eacute;ment',
-    'suppl.',
-    'supplanter',
-    'supplementarity',
-    'suppletive',
     'supplex',
-    'supplicatory',
-    'supplier-customer',
-    'supplier.',
-    'supplier/course',
-    'supply-and-fit',
-    'supply-base',
-    'supply-only',
-    'supply.hunslet',
-    'supply/demand',
-    'support-c',
-    'support-services',
-    'support/400',
-    'support/executive',
-    'support_of',
-    'supports.',
     'suppository',
-    'suppressible',
-    'suppurative',
-    'supr&ecirc;me',
-    'supra-normal',
-    'supra-personal',
-    'suprabasal',
-    'supradiaphragmatic',
-    'supraglacial',
-    'suprapubic',
-    'supraregional',
-    'suprising',
-    'surangular',
-    'surb',
-    'surdam',
-    'sure-handed',
     'surepath',
-    'suretyships',
-    'surface-',
-    'surface-connected',
-    'surface-iodinated',
-    'surface-ripened',
-    'surface/air',
-    'surfactancy',
-    'surfboarders',
-    'surfeits',
-    'surfmasters',
-    'surgeon-captain',
-    'surgings',
-    'surguladzo',
-    'surju',
-    'surlier',
     'surlily',
-    'surmountable',
-    'surnabada',
-    'surplusage',
-    'surpri',
-    'surprise-free',
-    'surrejoinder',
-    'surrenden',
-    'surveillence',
-    'survey*',
-    'survey-based',
-    'surveyers',
-    'survivalism',
-    'survivorships',
-    'sus2',
-    'susan-jane',
     'suse',
-    'susiana',
-    'susic',
-    'suspe',
-    'suspected.',
-    'suspectid',
-    'suspensive',
-    'suspicion.',
-    'suspicious-minded',
-    'suspicious.',
-    'susuga',
-    'susumu',
-    'susurrant',
-    'sute',
-    'suthee',
-    'sutherland-dodd',
     'sutherlandshire',
-    'sutorina',
-    'suttie',
-    'sutton-pryce',
-    'suttonian',
-    'suvarovs',
-    'suvretta',
-    'suwaya',
-    'suxamethonium',
-    'suys',
-    'suzana',
-    'suzdal',
-    'sv&ecaron;t',
-    'sv-1',
-    'svalocin',
-    'svc',
     'svc-ra',
-    'svedberg',
-    'svelte-looking',
-    'svengali-like',
-    'sverige',
-    'sveriges',
-    'sviatopolk-mirsky',
-    'svid3',
-    'svidaniya',
-    'svidrigailov-like',
-    'svinfylkja',
-    'svoja',
-    'svold',
-    'svr3.2',
-    'svr3.95',
-    'svr4-for-intel',
     'svr4-on-alpha',
-    'svr4-osf/1',
-    'svr4.0mp',
-    'svr4.2-based',
-    'svr4.2-on-intel',
-    'svr4/mips',
-    'sw&aacute',
-    'sw.',
-    'sw.fr.',
-    'sw12',
-    'swaby',
-    'swaffer',
-    'swage',
-    'swagman',
-    'swagmen',
-    'swailes',
     'swaine',
-    'swalcap',
-    'swaledales',
-    'swaley',
-    'swamis',
-    'swamp-like',
-    'swan-necked',
-    'swan-shot',
-    'swanbourne',
-    'swank-words',
-    'swankiest',
-    'swans.',
-    'swanscombe',
-    'swanwich',
-    'swap-out',
-    'swap/px',
     'swapo-d',
-    'swaraj',
-    'swarthy-skinned',
-    'swasthya',
-    'swatchways',
-    'swayambhunath',
-    'swearers',
-    'swearword',
-    'swearwords',
-    'sweat-beaded',
-    'sweat-drenched',
-    'sweater-dress',
-    'sweatier',
-    'sweaty-palmed',
-    'swed',
-    'swedish-based',
     'swedish-registered',
-    'swee',
-    'sween',
-    'sweep.',
-    'sweet-corn',
-    'sweet-pea',
-    'sweet-peas',
-    'sweet-sounding',
-    'sweet-talks',
-    'sweetie-pie',
-    'sweetie-pops',
-    'sweetshops',
-    'sweetworthy',
-    'sweezey',
-    'sweif',
-    'swelteringly',
     'swensen',
-    'swenson',
-    'swep',
-    'swepe',
-    'swept-up',
-    'swerford/oxfordshire',
-    'sweyn',
-    'swh',
-    'swiddens',
-    'swif',
-    'swift-tuttle',
-    'swiftcall',
-    'swiftkick',
-    'swimfeeder-fed',
-    'swimmies',
-    'swimming-baths',
     'swinbank',
-    'swinegate',
-    'swinfen',
-    'swing-door',
-    'swingbin',
-    'swingingly',
-    'swings-and-roundabouts',
-    'swingy',
-    'swinney',
-    'swinscoe',
-    'swinton-thomas',
-    'swiss-style',
-    'swissors',
-    'switchers',
-    'switching.',
-    'switchless',
     'switchover',
-    'switchterm',
-    'swithinly',
-    'swithins',
-    'switz',
-    'swivel-chair',
-    'swivel-seat',
-    'swivelhead',
-    'swiveller',
-    'swizz',
-    'swollen-headed',
-    'swoofle',
-    'swoopy',
-    'sword-and-sorcery',
-    'sword-arm',
-    'sword-play',
     'sword-point',
-    'swordstick',
-    'swot-card',
-    'swraj',
-    'swrc',
-    'swt',
-    'swynnerton',
-    'sy\'n',
-    'sy23',
-    'sy8',
-    'sy99',
-    'sybarites',
-    'sybase-held',
-    'sybota',
-    'sybron',
-    'sycosis',
     'sydmonton',
-    'sydney-hobart',
-    'syedain',
-    'syg',
-    'syha',
-    'sykaj',
-    'sykes-picot',
-    'sykes/bbont',
-    'sykes/institute',
-    'syledis',
-    'syleyma',
-    'syllable(s)',
-    'sylogin.com',
-    'sylphlike',
-    'sylvania',
-    'sylvaticum',
     'sylvaticus',
-    'sylve',
-    'sylvest',
-    'sylvette',
-    'symbiont',
-    'symbolic-technological',
-    'symbotics',
-    'symmetrys',
-    'symonds/llandinabo',
-    'sympathetically.',
-    'sympathies.',
-    'symphoniques',
-    'symphonist',
-    'sympson',
-    'sympto-thermal',
-    'symptoms/conditions',
     'symtoms',
-    'syn-diagenetic',
-    'synapomorphy',
-    'synapsing',
-    'synaptically',
-    'synaptonemal',
-    'syncographic',
-    'syncretization',
-    'synecdochally',
-    'synergen',
-    'synergise',
-    'synon',
-    'synonymity',
-    'synoptical',
-    'synoptically',
-    'synprolam',
     'syntax-free',
-    'syntax/semantics',
-    'synthamin',
-    'synthetised',
-    'syntometrine',
-    'syphons',
-    'syre',
-    'syria.',
-    'syriac-speaking',
-    'syriacus',
-    'syringe.',
-    'syro-phoenician',
-    'syrrhaptes',
-    'sys&dollar;lifespan:scan',
-    'sys&dollar;manager:lifespan&mdash;login.com',
-    'sys&dollar;output',
     'syshutdwn.com',
-    'sysinfo',
-    'sysops',
-    'system-centred',
-    'system-managed',
-    'system/component',
-    'system/equipment',
-    'systematical',
-    'systempros',
-    'systems-constraints',
-    'systems-manager',
-    'systems-oriented',
-    'systemswise',
-    'systime',
-    'systole',
-    'systolic/diastolic',
     'systran',
-    'szajkowski',
-    'szczesnowicz',
-    'szekler',
-    'szelenyi',
-    'szendrey',
-    'szgetti',
-    'szh',
-    'szifris',
-    'szilagy',
-    'szirtes',
-    'szita',
-    'szuca',
-    'szuluc',
-    'szwajkowski',
-    'szymonowski',
     'szyszczak',
-    't&amp;ea',
-    't&amp;r',
-    't&dollar;sub1/2',
-    't&egrave;ne',
-    't&euml',
-    't&iacute;dwald',
-    't&ocirc;d',
-    't&ouml;lgyessy',
-    't&ouml;nnies',
-    't&ucirc;101',
-    't&ucirc;109',
-    't&uuml;bke',
-    't\'farm',
-    't\'field',
-    't\'go',
     't\'hooft',
-    't\'hospital',
-    't\'market',
-    't\'men',
-    't\'owd',
-    't\'poultry',
-    't\'truth',
-    't\'war',
-    't\'were',
-    't\'yungunz',
-    't(&phgr)',
-    't(0)',
-    't+&dollar',
-    't+5',
-    't-&dollar',
-    't-33a',
     't-55s',
-    't-ach',
-    't-bands',
-    't-bird',
-    't-cell-deficient',
-    't-cell-mediated',
-    't-cll',
-    't-factor',
-    't-group',
-    't-jetty',
-    't-line',
-    't-lymphocytopenia',
-    't-n',
-    't-network',
-    't-sections',
-    't-sneachda',
     't-squares',
-    't-tails',
-    't-to',
-    't-try',
-    't.1s',
-    't.3a',
-    't.5',
-    't.7s',
-    't.8m',
-    't.annectens',
-    't.buttikoferi',
-    't.i.e',
-    't.k.',
-    't.n',
-    't.n.t',
-    't.s.w.',
     't.shapes',
-    't/005/26/0007',
-    't/005/26/1025',
-    't/005/26/1026',
-    't/007/40/1002',
-    't/007/40/1004',
-    't/007/40/1005',
-    't/007/40/1006',
-    't/007/40/1007',
-    't/l',
-    't/sgt',
-    't/t',
-    't0',
-    't0n0m0',
-    't0n1',
-    't1\'',
     't1/e1',
-    't100x',
-    't110',
-    't2&ndash;t4',
-    't2-b53',
-    't2-weighted',
-    't2816',
-    't2891',
-    't50',
-    't613',
-    't70',
-    't8',
-    't9000\'s',
-    't:0494',
-    't:071&ndash;242',
-    'ta&iacute;rov',
     'ta\'en',
-    'ta\'ovala',
-    'ta\'wiz',
-    'ta100r',
-    'taagepera',
-    'tab-ends',
-    'tabarly',
-    'tabarri',
-    'tabboo',
-    'tabito',
-    'table-lamps',
-    'table-sharers',
-    'table/free',
-    'table1',
-    'tablespoonfuls',
-    'tablets.',
     'tabloiding',
-    'taborda',
-    'tabori',
-    'tabrizi',
-    'tabubil',
-    'taceddin',
-    'tacendo',
-    'tachistoscopes',
-    'tachycardias',
-    'tachycardic',
-    'tack-heads',
-    'tacket',
-    'tackily',
-    'tackroom',
-    'tackrooms',
-    'tacographs',
     'tactfulness',
-    'tactieren',
-    'tada',
-    'tadaaki',
-    'tadesse',
-    'tadgell',
-    'tadham',
-    'tadpole-like',
-    'taenia',
-    'taffetas',
-    'taffner',
-    'taffs',
-    'tafia',
-    'tag/',
-    'tag/porsche',
-    'taggers',
     'taginrog',
-    'tahat',
-    'tahiliani',
-    'tahki',
-    'tahoe/california',
-    'tahoeraa',
-    'tahome',
-    'taiga.',
-    'taigs',
-    'taikoo',
-    'tail-back',
-    'tail-down',
-    'tail-ender',
-    'tail-first',
-    'tail-lift',
-    'tail-male',
     'tail-piece',
-    'tail-race',
-    'tail-signals',
-    'tail-skids',
-    'tail-spin',
-    'tail-steady',
-    'tail-wheels',
-    'tailby',
-    'tailchasing',
-    'tailles',
-    'tailleur',
-    'tailor-makes',
-    'tailside',
-    'taimour',
-    'tainsh',
-    'tainted-blood',
     'taitz',
-    'taiwan-based',
-    'taiwao',
-    'taji',
-    'tajjal',
-    'takahiro',
-    'takai',
-    'takaka',
-    'takamoto',
-    'takata',
-    'take-all',
-    'take-note',
-    'takenaka',
-    'takeup',
-    'taki-taki',
-    'takoever',
     'takum',
-    'takuya',
-    'tal-y-llyn',
-    'talagaad',
-    'talalay',
-    'talalayev',
-    'talboys',
-    'tale-bearing',
-    'talegalla',
-    'talei',
-    'talen',
-    'talent-spotters',
-    'talfan',
-    'tali-os/2',
-    'talica',
-    'talip',
     'talis',
-    'talk-back',
-    'talk/slide',
-    'talkdown',
-    'talking-points',
-    'tall-chimneyed',
-    'tall-herbs',
-    'tall-masted',
-    'talleres',
-    'talmadge',
-    'talmon',
-    'talmont',
-    'talthybios',
-    'tam-o\'shanter',
-    'tamamum',
-    'tamashiwara',
     'tamaulipas',
-    'tambimuttu',
-    'tamblyn',
-    'tamgrams',
-    'tamlyn',
-    'tammi',
-    'tamplin/kennel',
-    'tampopo',
-    'tamsins',
-    'tamuli',
-    'tan-yard',
-    'tanaiste',
-    'tancr&egrave;de',
-    'tandoor',
-    'tandy/victor',
-    'taneja',
     'tange',
-    'tangencies',
-    'tangled-up',
-    'tanh',
-    'tanika',
-    'tanistry',
-    'tanita',
-    'tank-tops',
-    'tank.',
-    'tankbuster',
-    'tanker-mounted',
-    'tankered',
-    'tankship',
-    'tannaghmore',
-    'tanner/tetraplegic',
-    'tannett',
     'tannu-tuva',
-    'tansu',
-    'tanswell/manager',
-    'tantalizes',
-    'tantallon',
-    'tantobie',
-    'tanton',
-    'tanumafili',
-    'tanworth',
-    'tanyard',
-    'tanyel',
-    'tanzi',
-    'taomati',
-    'tap-dancers',
-    'tap-loaded',
-    'tap-shoes',
     'tap-threads',
-    'tap1(181)',
-    'tape(s)',
-    'tape-counter',
-    'tape-editing',
-    'tape-loop',
-    'tape-measures',
-    'tape-memory',
-    'tape-outs',
-    'tape-to-tape',
-    'taped-out',
-    'taped-up',
-    'tapings',
-    'tappets',
-    'tar-like',
-    'tarace',
     'taradalsky',
-    'taramosalata',
-    'tarango',
-    'tarapac&aacute',
-    'tarawera',
-    'tarbatness',
-    'tardes',
-    'target-towing',
-    'targett',
-    'targett-v-tarfean',
-    'targhee',
-    'tariff-reform',
-    'tariffication',
-    'tarigo',
-    'tarija',
-    'tarmacing',
     'tarnishes',
-    'tarnus',
-    'taroczy',
-    'taroko',
-    'taros',
-    'tarrington',
-    'tartan-dressed',
-    'tartan-socked',
-    'tartaria',
-    'tartes',
-    'tartikoff',
-    'tartine',
-    'tartiness',
-    'tartlet',
-    'tartus',
-    'tarzi',
     'tasar',
-    'taseer',
-    'tashan',
-    'task-automation',
-    'task-driven',
-    'task-focused',
-    'task-specific',
-    'task7yourinitials.doc',
-    'tasker-poland',
-    'taskforces',
-    'taskmistress',
-    'tasks.',
-    'tasmowski',
-    'tassigny',
-    'tassis',
-    'tassles',
     'taste-free',
-    'taszar',
-    'tat-like',
-    'tata-binding',
-    'tata-mailau',
-    'tatarinov',
-    'tate/labianca',
-    'tatemae',
-    'tater',
-    'tathi',
-    'tati-loutard',
-    'tatter',
-    'tattering',
-    'tattersfield',
-    'tattiness',
-    'tattoo&lt;s&gt',
     'tattooes',
-    'tatu',
-    'taukei',
-    'taurino',
-    'taurocheodeoxycholic',
-    'taurocholic',
-    'tauromaquia',
-    'tausinga',
-    'tautomeric',
-    'tautonym',
-    'tavannes',
-    'tavern-keepers',
-    'tavernor',
-    'tavistock/routledge',
-    'tavoy',
-    'tavr',
     'tavras',
-    'tavrov',
-    'tavua',
-    'tawara',
-    'tawau',
-    'tawera',
-    'tawere',
-    'tawes',
-    'tawfikia',
-    'tawi',
-    'tawneys',
-    'tax-base',
-    'tax-credit',
-    'tax-cutters',
-    'tax-dodgers',
-    'tax-effective',
     'tax-favoured',
-    'tax-financed',
-    'tax-havens',
-    'tax-rates',
-    'tax-resistance',
-    'tax-resisters',
-    'tax-saving',
-    'tax-take',
-    'tax-wise',
-    'tax.huntsmen',
-    'tax/community',
-    'taxal',
-    'taxers',
-    'taxfree',
-    'taxi-cabs',
-    'taxidermists',
     'taxifolia',
-    'taxila',
-    'taximan',
-    'taxis-like',
-    'taxonym',
-    'tayboo',
-    'tayib',
-    'taylor/community',
-    'taylor/driver',
-    'taylour/wiltshire',
-    'taynton',
-    'taynuilt',
-    'tayvallich',
-    'tazir',
-    'tazmamart',
-    'tazze',
     'tb1',
-    'tb10',
-    'tbd',
-    'tbdf',
-    'tbm-3e',
-    'tbst',
-    'tca-precipitable',
-    'tcd',
-    'tchaikowsky',
-    'tchambuli',
-    'tcherina',
-    'tchibinda',
-    'tcht',
-    'tcoff',
-    'tcr-mediated',
-    'tcr-negative',
     'tcrms',
-    'td248',
-    'tdc3000',
-    'tdex',
-    'tdg',
-    'tds.1',
-    'te566/g&ndash;blck',
-    'tea-breaks',
-    'tea-cakes',
-    'tea-cloth',
-    'tea-cloths',
-    'tea-coloured',
-    'tea-cosies',
-    'tea-maker',
-    'tea-sipping',
-    'tea-spoons',
     'tea-stained',
-    'tea-trolley',
-    'teach-yourself',
-    'teacher-',
-    'teacher-based',
-    'teacher-guide',
-    'teacher-in-training',
-    'teacher-made',
-    'teacher/',
-    'teacher/lecturer',
-    'teacher/student',
-    'teachers-in-training',
-    'teaching\'',
-    'teaching/exhibition',
-    'teaching/practice',
-    'teachta',
     'teacupful',
-    'teague/moseley',
-    'tealby',
-    'tealeaves',
-    'teals',
-    'team-sheets',
-    'team-strengthening',
-    'teamaker',
-    'teamer',
-    'tean',
-    'teans',
-    'tear-drenched',
-    'tear-ducts',
-    'tear-glazed',
-    'tear-reddened',
-    'teare',
     'tearproof',
-    'tearstains',
-    'teased-out',
-    'teatre',
-    'tec/btec',
-    'techgnosis',
-    'technical-economic',
-    'technically-oriented',
-    'technicans',
-    'techniques.whop',
-    'technograph',
-    'technolgies',
-    'technologic',
-    'technologized',
-    'technology-inspired',
-    'technology/computerization',
     'technophiles',
-    'technophilic',
-    'technorama',
-    'techoueyres',
-    'tecklenborg',
-    'tecmagik',
-    'tecnifibre',
-    'tecnologica',
-    'tectan',
-    'tectonism',
-    'tectonophysics',
-    'tectonostratigraphical',
-    'tectonothermal',
-    'tectorius',
-    'teddington/gloucestershire',
-    'tedis',
     'tedjakasume',
-    'tedworth',
-    'tee-shots',
-    'tee-totaller',
-    'teef',
-    'teeger',
-    'teeling',
-    'teen-ager',
-    'teencool',
-    'teenotchy',
-    'teeny-bop',
-    'teenypop',
-    'teeshirt',
-    'teeshirts',
-    'teesside-born',
-    'teeth\'n',
     'teeth-baring',
-    'teeth-cleaning',
-    'teethes',
-    'teethies',
-    'teevee',
-    'teflon-like',
-    'tefnut',
-    'tegwyn',
-    'tei&gt',
-    'teillac',
-    'teiman',
-    'teio',
-    'teir',
-    'teith',
-    'teiwaki',
-    'tej',
     'tejada',
-    'tejero',
-    'tekam',
-    'tekkin\'',
-    'tekmar',
-    'teknik',
-    'tekola',
-    'tekserv',
-    'tektite-like',
-    'tel.081',
-    'tel.821908',
-    'tel.guis',
-    'tel.m\'bro',
-    'tel.stockton',
-    'tele-conference',
-    'tele-rings',
     'tele-service',
-    'teleanou',
-    'telecabin',
-    'telecentres',
-    'telecom-i',
-    'telecom-provided',
-    'teleconomy',
-    'teledirectory',
-    'telef&oacute;nica',
-    'telefarm',
-    'telefaxed',
-    'telefunken-made',
-    'telegen2',
-    'telegraph-poles',
-    'telegraph/times',
-    'telemines',
     'telencephalon',
-    'teleost',
-    'telepointless',
-    'teleprocessing',
-    'telesaling',
-    'telesikrates',
-    'teleuse',
-    'televideo',
-    'televisi&oacute;n',
-    'television\'',
-    'television.',
-    'televisioniste',
-    'televisually',
-    'televized',
-    'teleway',
-    'telework',
     'telex-type',
-    'telios',
-    'telltales',
-    'telly-watching',
-    'telmatochromis',
-    'telocollinite',
-    'telok',
-    'telomerase',
-    'telon',
-    'temagami',
-    'temne',
-    'temo',
-    'tempelbezirk',
-    'temperatire',
-    'tempest-tossed',
-    'tempesta',
     'temple-builders',
-    'temple-complex',
-    'temple-decoration',
-    'temple-worship',
-    'templebury',
-    'templewood',
-    'temporate',
-    'temporately',
-    'temporum',
-    'temprature',
-    'tempura',
-    'temuraz',
-    'ten-band',
-    'ten-foot-high',
-    'ten-match',
-    'ten-round',
     'ten-thirty-five',
-    'ten-thousand',
-    'ten-try',
-    'ten-volume',
-    'ten-week-old',
-    'ten-year&rehy;old',
-    'ten-years',
-    'ten.col',
-    'tenability',
-    'tenancy.',
-    'tenant-farmer',
-    'tenant-like',
-    'tenants-in&rehy;chief',
-    'tenbrae',
-    'tendale',
-    'tendo',
     'tendoned',
-    'tendria',
-    'tenellus',
-    'tenemented',
-    'tenent',
-    'tener&eacute',
-    'teneriffe',
-    'tengri',
-    'tenira',
-    'tenko',
-    'tenma',
-    'tenmaya',
-    'tennis-star',
-    'tense-looking',
-    'tensed-up',
-    'tension-packed',
     'tent-flap',
-    'tent-pole',
-    'tent-poles',
-    'tent-shaped',
-    'tentacle-like',
-    'tentara',
-    'tente',
-    'tenth-hand',
-    'tenth-largest',
-    'tenth/sixteenth',
-    'tenting',
-    'tentions',
-    'tenuirostris',
-    'tenurially',
-    'teolog&iacute;a',
-    'teomi',
     'teoranta',
-    'teosinte',
-    'tepco',
-    'tephrochronology',
-    'tepidly',
-    'teplyystan',
-    'teratment',
-    'teratology',
-    'teratoma',
-    'terazzo',
-    'terbinefeine',
-    'tercel',
-    'terenzio',
-    'tergals',
-    'tergites',
-    'tergiversated',
     'tergocoxal',
-    'tergopleural',
-    'tergosternals',
-    'terisio',
-    'terlecki',
-    'term&mdash',
-    'term\'',
-    'termessos',
-    'terminial',
-    'termite-proof',
-    'termorra',
-    'tern.',
-    'ternaes',
-    'ternera',
-    'terneuzen',
-    'ternight',
     'ternispinus',
-    'terracings',
-    'terraggi',
-    'terraine',
-    'terrance',
-    'terrawatts',
-    'terrce',
-    'terreira',
-    'terrestial',
-    'terrestris',
-    'terrible-looking',
-    'terrible.',
-    'terrick',
-    'terrifico',
-    'terrill',
-    'territoriales',
     'territory-wide',
-    'terror-mask',
-    'terror-masks',
-    'terrorum',
-    'tersa',
-    'terser',
-    'tert',
-    'tertia',
-    'tertiarization',
-    'tertiary/residual',
-    'tertje',
-    'tervuren',
-    'tesler',
-    'tessa-holders',
-    'tesselata',
-    'test-class',
     'test-drilling',
-    'test-driven',
-    'test-fired',
-    'test-firing',
-    'test-pieces',
-    'test/reset',
-    'test30root',
-    'testability',
-    'testbit',
-    'testcard',
-    'testerton',
-    'testiness',
-    'testpieces',
-    'testrunner',
-    'tetani',
-    'tetbury/gloucestershire',
     'tetchier',
-    'teterboro',
-    'teterous',
-    'tethra',
-    'teti',
-    'tetovo',
-    'tetraacetic',
-    'tetraceratops',
-    'tetracyclic',
-    'tetraethylammonium',
-    'tetrahedrally',
-    'tetrahydro-cannabinol',
-    'tetrahydrocannabinol',
-    'tetrahydrochloride',
-    'tetramin',
-    'tetraneedle',
     'tetraogallus',
-    'tetrapeptide/cyclophilin',
-    'tetrasodium',
-    'tetrastyle',
-    'tetricus',
-    'tetsworth/oxfordshire',
-    'tettenhall',
-    'tetu&aacute;n',
-    'tewarie',
-    'tewfik',
-    'texas-red-coupled',
-    'texasville',
-    'texcoco',
-    'texel-sired',
-    'texette',
-    'text-retrieval',
     'text-sentences',
-    'text-types',
-    'text.id',
-    'textbase',
-    'textflow',
-    'textiles/fashion',
-    'textless',
-    'textmachine',
-    'textualization',
-    'textureless',
-    'tf1',
-    'tfariti',
-    'tfasta',
-    'tff',
-    'tg2',
-    'tgb',
     'tgraf-x',
-    'th&aacute;sos',
-    'th&eacute;nard',
-    'th&eacute;o',
-    'th&eacute;ologie',
-    'th&eacute;orique',
-    'th&lsqb;e&rsqb',
-    'th&oacute;rr',
-    'th\'been',
-    'th\'come',
-    'th\'did',
-    'th\'expence',
-    'th\'firm',
-    'th\'hands',
-    'th\'likes',
-    'th\'name',
     'th\'think',
-    'th\'took',
-    'th\'way',
-    'th\'words',
-    'th\'work',
-    'th-thank',
-    'thaabe',
-    'thacher',
-    'thackrays',
-    'thai-chinese',
-    'thai-myanma',
-    'thaith',
-    'thaksin',
-    'thalassiosira',
-    'thalers',
-    'thaliana',
     'thalmann',
-    'thamos',
-    'thandar',
-    'thanh-nien',
-    'thanks-for-putting-up-with-them-and-that-wasn\'t-too-bad-was-it',
-    'tharrid',
-    'thasian',
-    'that-clauses',
-    'thatch-eaves',
-    'thatcher-reagan',
-    'thatcher-style',
-    'thatcherian',
-    'thawpit',
-    'the-first',
-    'the-line',
-    'the-more',
     'the/1oden',
-    'the/heart',
-    'the_less',
-    'the_papier',
-    'theatines',
-    'theatre-bar',
-    'theatric',
-    'theayter',
-    'thebaid',
-    'thebe',
-    'thecia',
-    'theeng',
-    'thefaculty',
-    'theix',
-    'thek',
-    'them-selves',
     'them-the',
-    'them_out',
-    'thematizes',
-    'theme/keyword',
-    'themuns',
-    'then&mdash',
-    'then-enemy',
-    'then-i',
-    'then-prime',
-    'then-record',
-    'thenar',
-    'theocentric',
-    'theodilus',
-    'theodolinda',
-    'theol',
-    'theologiae',
     'theologica',
-    'theolonius',
-    'theonly',
-    'theophany',
-    'theorbo',
-    'theorbos',
-    'theorises',
-    'theorizations',
-    'theorizes',
-    'theory-based',
-    'theory-of-finance',
-    'theory-of-mind',
-    'theory-specific',
-    'ther-to',
-    'there-fore',
-    'there.',
     'there_as',
-    'there_in',
-    'thereness',
-    'therese&mdash',
-    'theret',
-    'theretofore',
-    'thereunto',
-    'therfore',
-    'thermistors',
-    'thermit',
-    'thermocline',
-    'thermodry',
-    'thermodynamical',
-    'thermoelastic',
-    'thermoforming',
-    'thermolabile',
     'thermoluminescent',
-    'thermophilus',
-    'thermopsis',
-    'thermoregulated',
-    'thermovelours',
-    'therms',
-    'thermus',
-    'theropoda',
-    'theses87',
-    'thetes',
-    'thetted',
-    'theys',
-    'thge',
-    'thick-framed',
-    'thick-leaved',
-    'thick-lipped',
     'thick-rimmed',
-    'thick-skulled',
-    'thicker-than-usual',
-    'thickly-populated',
-    'thicknet',
-    'thickos',
-    'thicks',
-    'thiebaud',
-    'thienchai',
-    'thierree',
-    'thiers',
-    'thighs.',
-    'thim',
-    'thiman',
-    'thimble-sized',
-    'thimon',
     'thin&ndash',
-    'thin-bodied',
-    'thin-layer',
-    'thin-looking',
-    'thin-rimmed',
-    'thin-sectioning',
-    'thin-sliced',
-    'thinford',
-    'thing-in-itself',
-    'thing-like',
-    'thingummybobs',
-    'thingymabob',
-    'think-tankers',
-    'thinked',
-    'thinkings',
-    'thinly-bedded',
     'thio-uric',
-    'thioglycollic',
-    'thionyl',
-    'thiosulphate',
-    'thiounn',
-    'third-inning',
-    'third-last',
-    'third-minute',
-    'third-rail',
-    'third-raters',
-    'third-set',
-    'third-strongest',
-    'third-time',
-    'third-world-debt',
-    'third/fourth',
-    'thirdd',
     'thirkettle',
-    'thirlwell',
-    'thirteen-foot',
-    'thirteen-hour',
-    'thirteens',
-    'thirteenth-',
-    'thirteenth-twentieth',
-    'thirty-acre',
-    'thirty-centimetre',
-    'thirty-foot-long',
-    'thirty-nine-year-old',
-    'thirty-oh-one',
-    'thirty-seconds',
-    'thirty-seven-year-old',
-    'thirty-three-year-old',
-    'thirty-ton',
     'thirty.some',
-    'this-and-that',
-    'thiselton-dyer',
-    'thixendale',
-    'thm',
-    'thnowing',
-    'thoahlane',
-    'thoght',
-    'thoirs',
-    'tholekt',
-    'tholoids',
-    'tholthorpe',
-    'thoma',
-    'thomas/attack',
-    'thomas/bereavement',
-    'thomas/resident',
     'thomas/sister',
-    'thomisidae',
-    'thomists',
-    'thommo',
-    'thompsett',
-    'thompson/british',
-    'thompson/lab',
-    'thompson/swindon',
-    'thonged',
-    'thongsing',
-    'thoosand',
-    'thoracatum',
-    'thoracoplasty',
-    'thord',
-    'thorgill',
-    'thorleif',
     'thornaby-on-tees',
-    'thornborough/buckinghamshire',
-    'thornbridge',
-    'thornbush',
-    'thorne/non-fundholding',
-    'thorngate',
-    'thornton-le-dale',
-    'thornton-le-street',
-    'thornton-norris/david',
-    'thornton-pickard',
-    'thorntonloch',
-    'thorogobius',
-    'thorogood/northamptonshire',
-    'thorogood/northants',
-    'thorpe-by-newark',
-    'thorpe-le-soken',
     'thorplands',
-    'thorps',
-    'thorugh',
-    'thou-shalt-nots',
-    'thought&rehy;processes',
-    'thought-a',
-    'thought-contents',
-    'thought-control',
-    'thought-experiments',
-    'thought-forms',
-    'thought-police',
-    'thought-stopping',
-    'thought-through',
-    'thought-waves',
-    'thousa',
-    'thousand-millionths',
     'thousand-plus',
-    'thra1',
-    'thrant',
-    'threadless',
-    'threadlike',
-    'threadwork',
-    'threatenin\'',
-    'three&rehy;dimensional',
-    'three&rehy;tier',
-    'three-all',
-    'three-bodied',
-    'three-branched',
-    'three-breasted',
-    'three-by-five',
-    'three-card',
-    'three-dimension',
     'three-egg',
-    'three-eight',
-    'three-electrode',
-    'three-five',
-    'three-foot-long',
-    'three-foot-thick',
-    'three-game',
-    'three-handicapper',
-    'three-helical',
-    'three-helix',
-    'three-hundred-year-old',
-    'three-lengths',
-    'three-light',
-    'three-metal',
-    'three-mode',
-    'three-nation',
     'three-or',
-    'three-over-par',
-    'three-panel',
-    'three-panelled',
-    'three-phrase',
-    'three-picture',
-    'three-position',
-    'three-pound-fifty',
-    'three-quarter-inch',
-    'three-quarters-of-a',
-    'three-rail',
-    'three-round',
-    'three-season',
-    'three-sixty',
-    'three-spot',
-    'three-square',
     'three-stranded',
-    'three-stride',
-    'three-system',
-    'three-tenths',
-    'three-times-a-week',
-    'three-to-two',
-    'three-up',
-    'three-walled',
-    'three-weekly',
-    'three-wicket',
-    'three-wild',
-    'three-world',
-    'three-yearly',
-    'three/four-day',
-    'threecliff',
-    'threeday',
     'threedimensional',
-    'threeness',
-    'threfall',
-    'threfore',
-    'threonines',
-    'thriftily',
-    'thriller-writer',
-    'thrislington',
-    'thrity',
-    'throat-gripping',
-    'throatier',
-    'throatiness',
-    'throcket-shuttle',
-    'throe',
-    'thrombie',
-    'thrombocythaemia',
     'thromboplastin',
-    'thrombospondin',
-    'throttle/pitch',
-    'through-draught',
-    'through-fastening',
-    'through-out',
-    'through-roads',
-    'through-space',
-    'throughfall',
-    'throughn',
-    'throughway',
-    'throw-ins',
-    'throwin\'',
-    'throwing-knife',
-    'throwing-spears',
-    'thrown-away',
     'throwout',
-    'throwsters',
-    'thru-body',
-    'thrunton',
-    'thrupenny',
-    'thrust-fault',
-    'thrybergh',
-    'thuc',
-    'thud-thud-thud',
-    'thuddy',
-    'thue',
-    'thuel',
-    'thugging',
-    'thulean',
-    'thum',
-    'thumbless',
     'thumby',
-    'thump-thump',
-    'thunderbay',
-    'thunderheart',
-    'thundersley',
-    'thunked',
-    'thunovsk&aacute',
-    'thurian',
-    'thuribles',
-    'thurleigh',
-    'thurlestone',
-    'thurs.',
-    'thursday-to-sunday',
-    'thursdays.',
-    'thurstaston',
-    'thurstin',
     'thusly',
-    'thwacks',
-    'thwaitesii',
-    'thyer',
-    'thyestes',
-    'thymelaeaceae',
-    'thymidine/',
-    'thymopoiesis',
-    'thynge',
-    'thyrde',
-    'thyre',
-    'thyroidectomy',
-    'thyropentone',
-    'thyrsus',
-    'thyrus',
-    'thysiachromis',
     'ti-iddle-ey',
-    'tiamzon',
-    'tianawa',
-    'tiaret',
-    'tib.',
-    'tiba',
-    'tibb',
-    'tibbers',
-    'tibbets',
-    'tibby',
-    'tiberi',
-    'tiberian',
-    'tibidabo',
-    'tiborium',
-    'tiburcio',
-    'ticehurst',
     'tick-a',
-    'tick-h',
-    'tickatape',
-    'tickerty',
-    'ticket-broker',
-    'ticket-collectors',
-    'ticketholder',
-    'ticketmaster',
-    'ticketone',
-    'tickets.',
-    'ticketty',
-    'ticknor',
-    'tidally',
-    'tidarren',
-    'tide-free',
-    'tide-mark',
     'tide-table',
-    'tide-washed',
-    'tidende',
-    'tidenham',
-    'tidesmen',
-    'tidied-up',
-    'tidy-up',
-    'tidybig',
-    'tie-knot',
-    'tie-line',
-    'tie-molecules',
-    'tie-offs',
-    'tiedje',
-    'tief',
-    'tiegs',
-    'tieing',
     'tiemens',
-    'tienan',
-    'tiendrebeogo',
-    'tienie',
-    'tientos',
-    'tiepins',
-    'tierceron',
-    'tietjens',
-    'tiger-striped',
-    'tigerlily',
-    'tigernach',
-    'tigernuts',
-    'tigglywinkles',
-    'tiggy-winkle',
-    'tighetning',
-    'tight-jawed',
     'tight-money',
-    'tight-mouthed',
-    'tight-ropes',
-    'tightknit',
-    'tightly-shuttered',
-    'tigranes',
-    'tigrean-led',
-    'tigwell',
-    'tijani',
-    'tikhomirov',
-    'tilak',
-    'tilbeurgh',
-    'tilde',
-    'tile-works',
-    'tileans',
-    'tilen',
     'tillable',
-    'tillerized',
-    'tillicoultry',
-    'tillingdon',
-    'tillion',
-    'tillmanns',
-    'tillyorn',
-    'tilt-hammers',
-    'tilty',
-    'timavo',
-    'timbales',
-    'timber-cutting',
-    'timber-faced',
-    'timber-lorry',
-    'timber-scented',
-    'timber-trees',
     'timber-workers',
-    'timbers/student',
-    'timbertop',
-    'timbuctu',
-    'time&lcub',
-    'time(s)',
-    'time-1',
-    'time-activity',
-    'time-and-a-half',
-    'time-and-distance',
-    'time-ball',
-    'time-budget',
-    'time-coding',
-    'time-constrained',
-    'time-deictic',
-    'time-dimension',
     'time-epe',
-    'time-fuse',
-    'time-gaps',
-    'time-horizons',
-    'time-intervals',
-    'time-killing',
-    'time-measuring',
-    'time-proportional',
-    'time-proven',
-    'time-removed',
-    'time-reversed',
-    'time-specific',
-    'time-stamped',
-    'time-stamping',
-    'time-steps',
-    'time-symmetric',
     'time-time',
-    'time-trended',
-    'time-trouble',
-    'time-value',
-    'time-values',
-    'time-variation',
-    'time-wise',
-    'time.it',
-    'time/space',
-    'time_but',
-    'time_to_time',
-    'timecode',
-    'timekept',
-    'timelines',
-    'timepoints',
-    'times/cbs',
     'times/sunday',
-    'timesaving',
-    'timeslot',
-    'timespans',
-    'timet',
-    'timetabler',
-    'timi&scedil;oara',
-    'timis',
-    'timlyn',
-    'timm',
-    'timmis',
-    'timms/thames',
-    'timorousness',
-    'timothy&mdash',
-    'timoti',
-    'timoudi',
     'timour',
-    'timpanist',
-    'timsbury',
-    'tin&uacute;viel',
-    'tin-based',
-    'tin-bearing',
-    'tin-hatted',
-    'tin-miner',
-    'tin-miners',
-    'tin-tin',
-    'tin-topped',
-    'tinc',
-    'tinchebrai',
-    'tincupping',
-    'tindill',
-    'tinelli',
     'ting-a-ling',
-    'ting-kok',
-    'tingeing',
-    'tingey',
-    'tingible',
-    'tingley',
-    'tinking',
-    'tinklings',
-    'tinky',
-    'tinman',
-    'tinneas',
-    'tinney',
-    'tinsashe',
-    'tinson',
-    'tintinnabulation',
-    'tinton',
     'tints.',
-    'tinus',
-    'tinyterm',
-    'tions',
-    'tip-cat',
-    'tipcat',
-    'tiplady',
-    'tipner',
-    'tippermuir',
-    'tippler',
-    'tirane',
-    'tirbutt',
-    'tirionfa',
-    'tirkane',
-    'tirley',
-    'tiron',
     'tirrani',
-    'tirric',
-    'tirry',
-    'tiruneh',
-    'tirupati',
-    'tishri',
-    'tissanes',
-    'tisseran',
-    'tisserant',
-    'tissu',
-    'tissue-tek',
-    'tissue-thin',
-    'tissues.',
-    'titan-4',
-    'titano',
-    'titar',
     'titcomb/mother',
-    'tithonius',
-    'titien',
-    'title-',
-    'title-like',
-    'titma',
-    'titmouse',
-    'titrant',
-    'titratable',
-    'titrate',
-    'titrimetric',
-    'titted',
-    'titterings',
-    'titularly',
-    'titup',
-    'tityo',
     'tiviot',
-    'tivoli/fsm',
-    'tixall',
-    'tizona',
-    'tjaebourg',
-    'tjerssens',
-    'tjibaou',
-    'tju',
-    'tk1',
-    'tkatchenko',
-    'tkr',
-    'tks',
-    'tlali',
-    'tlaxcala',
-    'tle',
-    'tlemcen',
     'tm1',
-    'tm34020',
-    'tm502',
-    'tmb',
-    'tmpf',
-    'tmrtc-conjugated',
-    'tms320c3x',
-    'tmx',
-    'tn10',
-    'tn24',
-    'tn34',
-    'tn4',
-    'tn6',
-    'tn9',
-    'tna0',
-    'tnf-',
     'to-fro',
-    'to-his',
-    'to-move(c)',
-    'to-this',
-    'to.be',
-    'to13',
-    'to:the',
-    'to_each',
-    'to_say',
-    'to_time',
-    'toacks',
-    'toader',
-    'toadie',
-    'toadied',
-    'toadlet',
-    'toalibi',
     'toasting-fork',
-    'tobacco-farming',
-    'tobgyal',
-    'tobiads',
-    'toblerone',
-    'tobok',
-    'tobramycin',
-    'tobs',
-    'tobutt',
-    'tocas',
-    'tochas',
-    'tocikiston',
-    'tock-h',
-    'tockmal',
-    'tocra',
-    'today-sponsored',
     'today.',
-    'today/yesterday',
-    'toddelling',
-    'toddies',
-    'toddlerhood',
-    'todds',
-    'toe-nail',
-    'toennies',
-    'toffee-apples',
-    'tofi',
-    'tofield',
-    'tofranil',
-    'toga-like',
-    'togeth',
-    'tognoni',
-    'togoi',
     'togoland',
-    'togos',
-    'tohill',
-    'toho',
-    'tohoku',
-    'toilings',
-    'toimi',
-    'toings',
-    'toity',
-    'tokay-pinot',
-    'token-reflexive',
-    'token-reflexives',
-    'tokenist',
-    'toki',
-    'toklas',
-    'toko',
     'tokyu',
-    'tolai',
-    'tolbert',
-    'toledo-based',
-    'tolhurst',
-    'tolkachov',
-    'tolkein',
-    'toll-booth',
-    'toll-bridges',
-    'toll-houses',
-    'tollbooth',
-    'tollesbury',
-    'tollhouse',
-    'tolliday',
-    'tollie',
-    'tollmien-schlichting',
     'tollymore',
-    'tololo',
-    'tolstoy/daughter',
-    'tolu',
-    'tom&aacute&scaron',
-    'tom&aacute&scaron;sk&aacute',
-    'tom-all-alone',
-    'tomahtoes',
-    'tomaso',
-    'tomason',
-    'tomato-shaped',
-    'tomaytoes',
-    'tomb-like',
-    'tomb-painting',
-    'tomb-robbers',
-    'tombolo',
     'tombouctu',
-    'tomboys',
-    'tombstone-memorial',
-    'tomi',
-    'tomimatsu-sato',
-    'tominey',
-    'tomio',
-    'tomkiss',
-    'tomkyn',
-    'tomm',
-    'tommo',
-    'tommotiids',
-    'tomms',
-    'tomomi',
-    'tomonaga',
-    'tomorow',
     'tomoscan',
-    'tomov',
-    'tompaw',
-    'tompot',
-    'tonbridge-hastings',
-    'tondal',
-    'tone-poems',
-    'tone-shaping',
-    'tonecall',
-    'tonegawa',
-    'tonfa',
-    'tongans',
-    'tongariro',
-    'tongatapu',
-    'tonges',
-    'tongking',
     'tongue-in-chic',
-    'tongue-like',
-    'tongue-shaped',
-    'tongue-twister',
-    'tonically',
-    'tonle',
-    'tonmlinson',
-    'tonna',
-    'tonners',
-    'tonno',
-    'tonyu',
-    'too-frequent',
-    'too-hasty',
-    'too-i',
-    'too-narrow',
-    'too-vivid',
     'too.',
-    'toodle',
-    'toodle-oo',
-    'toodles',
-    'tool-shed',
-    'toolboxes',
-    'toolcase',
-    'toolkit/2',
-    'tools.h++',
-    'tootell',
-    'tooth-ache',
-    'tooth-and-nail',
-    'tooth-brushes',
-    'tooth-rotting',
-    'tooth-sucking',
-    'toothmarks',
     'toothpicked',
-    'tootled',
-    'tootles',
-    'tooty',
-    'toovey',
-    'top-20',
-    'top-deck',
-    'top-dogs',
-    'top-eight',
-    'top-flite',
-    'top-four',
-    'top-full',
-    'top-half',
-    'top-hole',
-    'top-knotted',
-    'top-ropers',
     'top-sliced',
-    'top-slicing',
-    'top-spec',
-    'top-storey',
-    'top-winning',
-    'top/bottom',
-    'topazes',
-    'topcats',
-    'topers',
-    'topheavy',
-    'topic-',
-    'topicalization',
-    'topics-based',
-    'topinski',
-    'topographics',
-    'topoisomer',
     'topolino',
-    'toponymical',
-    'topsell',
-    'topsey',
-    'topspinner',
-    'topstation',
-    'topsy-like',
-    'topview',
-    'toques',
-    'toqueville',
-    'tor\'',
-    'torbane',
-    'torbjorn',
-    'torch-like',
-    'torchy',
-    'tordoff',
     'toreador',
-    'toren',
-    'torga',
-    'toribio',
-    'tormarton',
-    'tornabuoni',
-    'tornewton',
-    'torney',
-    'tornrak',
-    'tornsk',
-    'torous',
-    'torpedo-boats',
-    'torpedo-bombers',
-    'torpidly',
-    'torquey',
-    'torran',
     'torrentially',
-    'torrentor',
-    'torrini',
-    'torrizone',
-    'torrs',
-    'torsionally',
-    'torsney',
-    'tort.',
-    'torticollis',
-    'tortiously',
-    'tortoal',
-    'tortoiselike',
-    'tortoiseshell-style',
-    'tortuosity',
-    'torver',
-    'torwood',
     'torx',
-    'tory-supporting',
-    'toscano',
-    'tosea',
-    'toshiba-ibm',
-    'toshitada',
-    'tosk',
-    'tossa',
-    'tostes',
-    'totaig',
-    'totale',
-    'totalistic',
-    'totalitarians',
-    'totalizable',
-    'totalizes',
-    'totally-symmetric',
     'totem-animal',
-    'totem-pole',
-    'totipotency',
-    'totland',
-    'totley',
-    'tottenham2',
-    'totterdown',
-    'totteridges',
-    'tottery',
-    'totts',
-    'touch-dry',
-    'touch-leger',
-    'touch-me-not',
-    'touch-up',
-    'touchboard',
-    'toumanoff',
     'toungui',
-    'tourain',
-    'tourettes',
-    'tourettisms',
-    'tourisme',
-    'touristes',
-    'tourniquets',
-    'tournois',
-    'tourtour',
-    'tousled-haired',
-    'toustounes',
-    'tout&eacute;e',
-    'tout_de_suite',
-    'tovil',
-    'tow-away',
-    'tow-level',
     'towaway',
-    'towednack',
-    'towel-dried',
-    'towelette',
-    'towell',
-    'tower-tops',
-    'towerblocks',
-    'towermill',
-    'towhee',
-    'town-and-country',
-    'town-by-town',
-    'town-planners',
-    'towndrow',
-    'towndwellers',
-    'townes',
-    'townley/stroud',
     'townsend/prefab',
-    'townsend/watchmaker',
-    'townsendii',
-    'townslist',
-    'towser',
-    'towson',
-    'toxi',
-    'toxicant',
-    'toxophily',
-    'toy-making',
-    'toy-sized',
-    'toya',
-    'toyi',
-    'toyohiko',
-    'toyology',
-    'toys-r-us',
     'tozeur',
-    'tpc-d',
-    'tph',
-    'tpmc',
-    'tq',
-    'tq2',
-    'tr&auml;ume',
-    'tr&eacute;s',
-    'tr&eacute;sor',
-    'tr&eacute;sors',
-    'tr20',
-    'tr6s',
-    'tr794',
-    'trabaldo',
-    'trabalhista',
-    'trabalho',
     'trabert',
-    'trabzonspor',
-    'trac',
-    'tracey-elaine',
-    'trachinian',
-    'trachyte-basalt',
-    'tracing-house',
-    'track-gangs',
-    'trackballs',
-    'tractor-',
-    'tractor-handling',
-    'tractor-path',
-    'tracys',
-    'trade-a-plane',
-    'trade-distorting',
-    'trade-names',
     'trade-orientated',
-    'trade-routes',
-    'trade-track',
-    'traded-off',
-    'traded-options',
-    'trademarking',
-    'tradewind',
-    'tradin\'',
-    'trading-post',
-    'traditionally-styled',
-    'traebecular',
-    'traffic-choked',
-    'traffic-clogged',
-    'traffic-generating',
-    'traffic-safety',
-    'traffic-stopping',
     'tragopan',
-    'trail-bike',
-    'trail.label',
-    'trail.num',
-    'trailer-cover',
-    'trailer-load',
-    'trailering',
-    'train-builder',
-    'train-builders',
-    'train-drivers',
-    'train-load',
-    'trainer-training',
-    'training/education',
-    'trainings',
-    'trait&eacute;-loi',
-    'traiteur',
     'traj',
-    'tralee/mullingar',
-    'tram-driver',
-    'trambone',
-    'tramen-exhalation',
-    'tramens',
-    'tramp.',
-    'trampish',
-    'tramwaymen',
-    'trannies',
-    'tranquillise',
-    'trans&ndash;pennine',
-    'trans-amazon',
-    'trans-cameroon',
-    'trans-caucasus',
-    'trans-jordan',
     'trans-sahara',
-    'trans-seasonal',
-    'trans-sexuals',
-    'trans-sport',
-    'trans-wales',
-    'transabdominal',
-    'transaction-processing',
-    'transaction-specific',
-    'transactions-plus-precautionary',
-    'transactivates',
-    'transavantgarde',
-    'transbaikal',
-    'transcendentalists',
-    'transcendentally',
-    'transco',
-    'transcribers',
     'transcriptases',
-    'transductive',
-    'transferred.',
-    'transfigures',
-    'transfluent',
-    'transformants/&micro;g',
-    'transformational-change',
+)
+
+blocks_36 = (
+    '")us/system!%c(hl)"".6"!2#!4"!4"#800"#900""ad$"es#)ffoldings#$glia#.lamandr&eacute$&dingly\'!i',
+    '&$wise%$/key%$able%$less%!r$$ford$&ing-up$"p.$$vini#$mmel$%pston#%n.exe$&avacca$+dal-mongers(&ridden',
+    '\'$ises\'\'ousness&\'navians$+et/remotepc$/ning-tunnelling$,tily-dressed&$ness%&lebury&$ings#\'pe-goat$$ular#(r-tissue$!a%(b-headed&"en',
+    '%"us$&cement$\'edy-cat$*ifications$0let&rehy;painted\'\'-coated(&nailed(&tipped$$pers%$itta%$land$$sten#"se#&tology$\'ter-gun',
+    '\'$good\'*ing-factor*!s##ups#%vvies%!y#%wfell"%e/gce#$ilig#"li#+ne-stealing$)t-marking"#g10#!b"(h&ouml;n',
+    '*$herr*$lein)$ttle#".1#%acher$%fberg)$bahn$#ick$#lke$"ns$)rfenstein%"li$&umayer#&chusev##eat',
+    '&!.%$ule+$!e%$lite$%ffman$&inberg$"le&%nberg$*matisation)!e%$ings$(nkenberg%#ley$"rk%!r',
+    '$+unenviertel#$h.ii#$iach$%bsbye$$cchi%#hau$\'edmayer%$fler$\'ndewolf$#pek$*zophrenias&$typy#%kelda#&langer$%egels',
+    '%$pped$#ogl%"mo%#omp%&sspark#$mall$$elke%$rhom$\'idbauer&)t-nielsen%(ttenhohe\'$hoff$%utter#%nitke&#zel',
+    '$"en&&wetter$#kel$!l%%ander&)r-critics($king&(stically%&ehouse&&master%"ia$%maker$%ol(s)&)-attached\'$boys',
+    '\'\'centred($hild(&ollege\'-desegregation*%igned\'\'fellows((inancing\'%girls($oing\'#kid\'$like\'%meals\'&pupils\'%rules\'$site',
+    '(#ype&!/\'"my&$bags&!e\'&master&&fellow&"ly&%ma\'am(!n(%rmish*!s*!y(\'sterish,"ly',
+    '&%s.and&%yards%%nbeek&)ebeek-447$*ttenheimer&"ky#+r&ouml;tter$#ank$0oder-sonnenstern#%traks#&uberts%$ring$#cks$%lberg%"ez',
+    '$%ndler$+sterstrasse$&ttdorf#$wabb%$galp%$ntes%"re$%eigen&!k%\'ndinger"(iagraphy$#rra#%cluna$"on#&d-mice',
+    '$$nce*\'\'-gossip($room(%write-!r\'%/arts(+engineering(+non-science(*technology\'"s.%#nes%.tific-sounding+)technical0(ological*+/industrial',
+    '0(ological\'#st.\'&zation#"lt#,mitar-shaped$#one$!p#.ntigraphically&$llas)$tors#%ssett%#ile%*or-chopped#&tovsky#$vyer',
+    '#\'eritome*!s##osa"#oat#$bell#%cozza#$ffer#%ggins$#ing#"il#"la$%dings##ots#$raig$\'borough',
+    '$"di$&e-draw%"=0&!5%$book)!s%&keeper%%lines\'"st$.nice&scedil;ti$&odonia$,sese&times;4$!y$&zonera#$tale',
+    '$#bec$&chgard&#men$%horne\'"um$#ian%"ca&"us$*land-based(!.$"os$$ston$(t-gibson&\'russell&&sawyer',
+    '%"er&!s%)ish-style(\'/ulster#&ulding%#ler$%rings$&seland$(t-ranger#!w#%zzese""pe"\'rabster$%g-end%$ging',
+    '$%masax%&blings$\'p-heaps%+ie-infected%%metal%$pily%#tof$)tch-marks\'$card\'#pad\'&stocks%$ters#%eamin(\'g-point$\'echings',
+    '&%dumps&&ed-off\'"rs&(printers$(w-capped&$gate&$like%#in\'%\'threads#$iber\'!s%&lerian%#ona$%mmage$%vermi',
+    '$%ggins$#oby$%unges##ub.%$bier\'(ng-board$&mmage.)"rs&"ed$$pled$*tinization"$ud-c&!s$#eri#)llerymaid',
+    '%/tor-in-ordinary&!s&&urally$&thorpe#$mite$%lingo#&rfield$%logue#\'ttering%&lebutt%!s#"za"!w")yphozoans#)themakers',
+    '!"d."#/ds"!l#.p-sister-party")p-liberal"(r1,250.8$)8,600,000#%2,876$)0,510,000#*33,600,000#*45,350,000#*60,600,000""sm"!t!/e&ntilde;oritas',
+    '#"62#!7""22#!4#!5#!6""50#!s"+a-adventure-!s%&nglers(#ing$%cabin%&hanges%(rossings',
+    '$$dogs$%eagle$&farers%%ights$%grass$.horse-on-toast$#ice$&kayaks%&eeping$$like$(monsters$&nymphs$%otter$&people%#ool',
+    '&#rts$\'scented&%oured%\'hanties)!y%$lugs%%nakes%&quirts%$tack&$ones%$well$$town$%waves%$eeds%#ind',
+    '#$/air##4gl#%beast$#ury#$coal#$fish$"ly#$girt$$reen#\'keeping$%indly&"gs#%lable%&ndings$%ed-in',
+    '%!s$"s.$#ynx#&m-free$(lessness$"on$"s.##nad##pen#&rch_of&#ed.#\'shores.$$ides$-on.gloucester&,ally-flooded',
+    '$$sons#$t(s)$$ette$$ings$!y#$veed#$wall%"ys$$eedy#%xwulf"(basteion&*i&atilde;o$$tier#"cs#$rand',
+    '#!t"%c160s#!a$"le%!t#%combe#$edes#$kler#\'lusions#*ond-chance\'$draw\'$ever\'(greatest\'%homes\'&league',
+    '(%eriod($lace\'%rater\'#set\'$term(&o-none\'%years(\'oungest&\'ary-use&$rate$&sterol$"ya#/r&eacute;taires$(et-agent&!a',
+    ')*es-general)"um(*y-director*%elect*(generals)!/&%erial#%s0.18#"t.$%aries$#ile%%on(s)\'$ally\'&ed-off$(or-based',
+    '#$undi$(ritising(#zed"$dans$&teness&!s#$ding$#ons#"es#\'gewicks$!y#,iment-filled)&hosted$!q#"ov',
+    '"%e-see#%/hear#$able$!u#\'d-borne\'#xes%$head%&plants&#ods$$like$)y-looking##hof#&ing-to&!s##k-a',
+    '#%lewig$!s#&m/seam$%ed.to$#ore#"se$#ter#!t#\'wonauth"#gar#"ba##ger#-ment-specific#&ontium#(regative',
+    '#!s#-uran&ccedil;a%!o"#ibu#&demann$!o#&f-like##gen$\'niorage(#ial%#ory#&lacher$*er-albring#&ne-net)!s',
+    '#,smographical#!t$!e#"ve"$kera#$onda#!s##ula#%walor"$laby$$nder#$dome#*ectability\'!e&&ionism',
+    '&$ness&#or\'("al$$mani$%sians#3f&rehy;presentation*\'seeking+%tyled+)ufficient$(-abasing&)ccusation\'*quaintance&(dhesives&)nalytical&)ppraisals',
+    ')\'ssments(%igned&(ttitudes%&binder&&laming%)cleansing&%olour\')mplacency\'*ndemnation()fessional)&irming))rontation($tent)$rols\'(rrection',
+    '\')gradation\'%luded)%sions*#ory\')nigrating\'+structively&)iagnostic\'+sparagement\'%vided&#ual%*effacingly(\'icacies&\'nforced,$ment&&rected',
+    '&)valuating-#ons&)xperience(%osure(\'ressive\'(tinction%$feed&,orgetfulness&%unded%+government\'%&hating&#eal&*umiliation&)ypnotised%&impact',
+    '&+ncompatible\')dulgences\')tegration)(ractions*(rogation\'&vested(%olved%.justifications%\'knowing%,legitimating&*ubricating%)marketing\'*sturbation&&onitor\'(tivating',
+    '&&pening\'%inion%)pityingly&(lacement&&owered&*redicating((occupied\'(oductive((motional(\'pulsion&)ublishers\'&nitive\'&rchase%&rebuke\'\'cruited',
+    '\'\'ferring((lexively(&orming\'\'gulator\')petitions((roachful%)scrubbing&%ealed\'$eded*"rs&&imilar&*quandering&*tultifying%(tutoring%*unemployed',
+    '%\'working("ld&&ritten$!=$)confessed$\'defence$(sameness%&eeking%*ufficiency#%govae#$iger$#nda%#ous%$unte$#ssa',
+    '#"l-%\'by-date$#ack$$berg$"en%)r-husband&#ies&!y$\'ing-off\')er/oxford$#oum##nes#"on#&sfield$"it',
+    '##uka#$vick"(mantical*(ly-based$#tic#+b-johansson$&lances#%enova\'#ich%#yuk$%onoff$"rc#-i&rehy;circle+(onductor$*-alcoholic',
+    '&%sleep&&udible\'+tomatically%)barbarian&%eggar%+clandestine&#oma\'\'ncealed(*sciousness&(ustodial%(darkened&)emocratic&)isposable&*ocumentary&&rugged',
+    '&*lasticated&(xclusive%%fasts&(ictional*%tious&$luid%%gloss&)overnment%*hereditary&%ollow&\'umorous%,independence%\'layback%,manufactures&%ystic',
+    '%*obligatory&(ctagonal&&paques%*peripheral&%opish&(rocessed%&quaver%(rational&(ecumbent\')sidential(!t\'$tail&&uinous%%shrug&)pecialist',
+    '((te-owned\'&ranger&*ubmersible%&tender&#hin&$oken&&railer(#nce%+underground%%vowel%%works$./terraced/town&#own$)automated$!c',
+    '$&narist\'+s/workshops$(otically(#ian$)periphery\'&meable%+rofessional$%rigid$$tism##mel&$weis#\'ogerere#+per_fidelis&\'florens$#lar',
+    '%$onia#!y"*n-sihanouk##afi$!t%#ore#%clere$$ourt##dal$"ed$(ing-offs#$ecan$$feru$&galais\')o-guinean',
+    '&\'halship$\'viratne#&gstock#)ior-level#$kaku##lin##mao#&nachie##ors#.sation-seekers)%alize$"e\'%&-units%!8$%ible.',
+    '\'*ve-skinned($ity.&&ometry$%orite\'"um$$tive$.uous-emotional#%telle%$nce\'(&-final)+grammarians)$like)&tokens%(rpartiet$&icosus',
+    '%#num%!r$\'ry-duty"*p&ndash;31#$/oct#(arately.%$ovic##eia$&rately\'#ion#$hton#+ia-coloured&%toned##pak#%t-nov',
+    '$&ember*)#-22*(december*(november))/hereford$\'izonium"%quens%&strate"\'r-vices#%afin\'$$jevo$#pia#,b-controlled%#led$\'ian-led',
+    '#%cambi#"ei$%nader%"os$$vent#&g.magg$,eant-at-mace%%evich%"nt%\'yevitch$!o%!i##hal#(ial-port&%ising',
+    '$#cea%"he$,es-connected$1ne/threonine-rich%\'gapatam$)ous-money((sounding\',/non-serious\')ly-minded#"nf#%ocold$&survey$"te%\'onergic$&w-like',
+    '$\'iginous$%yllum#\'railier\'$lier%%tions&"or$!e%"ll%#tte#*t&atilde;o$&anejos$#ori#+um-response#%vadei%&ntless',
+    '&"on(!s$#ent%$quip%)ry/pantry%$uses$)ice-books(%class(%music((provider(\'related\'(/standby\'+s/hospitals\'%tills%"er',
+    '%#les%(ng-hatch%%sales&$cene$(o-driven&)hydraulic%"is"\'se-seko#,quicarbonate&&oxides#\'tertius$,ri-voltaggio%"on"*t-building$%faced',
+    '#"ec$*nvironment#\'h-smith$!y##ila#%swana#\'tignano%&ng-off\'#.up$\'lement.%#in\'\'&g-down%-or-interested$\'rington#$ubal',
+    '"%ufert#!l#!r#"ss"#vak$"re##eld$+n-bedroomed&%eight&)foot-long*"er&&hooded&%lever&%metre&&nights',
+    '&&person&&seater($ries&+three-eight\'"on\'%wenty&"up&$word&)years-old%&/eight%!t&(een-hand)/th&rehy;century&)h-biggest(\'largest',
+    '(-nine-year-old(,one-year-old(,six-year-old(.three-year-old$(rability&&l-fold%#e=3&.ly-handicapped&#nce%"ly%1n/gloucestershire&\'hampton#&illana#"re"&wardby',
+    '#\'ing-box\'#kit""x\'#\'-crazed$%dance%*etermining$)exclusive$$fair$(negative$0predetermination$*segregated%$lave%+tereotyping#\'/gender#(agesimal',
+    '#$ists#$life#7ological/psychoanalytic#&ploits#,ual/romantic&\'isation$!s##war#)y-looking"%yburn#*mour-johns\'(iamorphs##rig"$znec!"f9',
+    '"%ogava#&rzesco"#r20%$,000##35m!$g108#!2#!9"!6"!8"&ambati""ic"(ml-aware""ns"\'raffito',
+    '""wd$(-yr-eira#"yd!#h*t"$-h-h#"sh""10"#aab$"di#&bbetai%$iest%)y-looking$"ib%!r&!a',
+    '#$char#%dbolt$#dai$(e-lovers&\'seeking%(d-relief%$line%!r&!s$"oo%%w-box\'$like)"ne\'\'puppets&"er',
+    '&#ier#!f$"fi$$razi$#tel%$wood#%gpile$"ue#%habad&%uddin%$ryar$#ban$#ida##kar$&edowns',
+    '$"in$%leton))/explorer$)y-looking#%limov$#lop&"tt&*w-changing(&enough$%stone$#war#,m-historical$%ateur)#ism)!s',
+    '$$iana$/poo/conditioner3!s$%sudin$$wana#&nariah$&d-kydd$"es$#gai%!e%%haied%&ri-las$(karanand$!n%#ers',
+    '%&onside$"tu##ozu#,pe-selective&"up%&ofbeak$!i$"ka&!s$#ter#\'r&pound$\'afbandi%"ku%#pov$$e(%)',
+    '\'\'roppers&(holdings&&option&&pusher&\'support%*/debenture&(position%\'cropper%+dwhiteboard&!x%#out%(print/ux%%scale$(if-emami%#ng.',
+    '\'#ree&&shaped%#boy%#ish$$land%#ene%)ott/widow$%nanah%!e$#ons$\'p-boned&(cornered&&fanged&\'shooter\'%uited',
+    '%"ie&!k%)ly-etched(\'pointed$*wood-smith#%tt-al%(er-proof\'"er$#wan#\'ughraun$!l%!a$"na#)vanteland$$iana',
+    '#(w-mohler$\'/trader$$arib$%croft$!e$"qi#$xson"\'chepkin""d."5e-and-particularly-he$#cat$$male%#ule#(ared-off$&t-fish',
+    '$#bak$$eens#&d-like#\'edy-pup$#eet$$ffry$)p-farmers&$grey%%bells%+ish-looking$#rer$\'tfloods%$wash#"fc$!i',
+    '#%ikdom%#hly$#las#"ka#%lborn$&f-edge&$like%$life$\'l-likes&%owned&)shattered&$torn\'#ype%%/esso%#ard',
+    '&%ursts%"er%!i$,ov-kovedyaev$#ten&)red-shore#%n-sei$\'nington#&pcourt$,heard-walwyn$#key$\'penhall$%stone$#way#%rdley',
+    '%&mtyevo$$idon%,ff-principal%#ton$#ley$\'ringham%)y-sipping$$ston$\'vington$#wen#$tima##vek%&rdnaze&!s#"wa',
+    '%"rd$#ell"0hh/peaceful/very"%ibata$%usawa#\'dlovsky#(e-on-lit$#ber$$lds*\'!.$!r#"fa$$fins%#man$#rin',
+    '%$+f10%%iness%)y-looking#"ga$%ekazu&!i##jie#$kari$!i#\'llibeer&%nglee$"uk#&mazaki$$elis$$inas',
+    '%#ies&!n$#oda%$mura%"no$#ply$$shek#%nbone$&e-free%$berg$%field$+gle/boulder$&ichiro%#est%"ly',
+    '$%tillo$&y-eyed&%faced%!a#%onogi#)p-builder%)chandlers%%wreck*!s$"ko$\'penhall$-ston-on-stour$/ton-on-cherwell$\'workers#$raho',
+    '&"eh$"eh&$orse$1inskii-shikhmatov%"sh$"ks$*ley/father(&mother%"ow$"ov$&t-clad&%maker%%maker*!s#)shapangma',
+    '&$rown%%faced%$heap$%heads$!o$#sby$#ter\'#ies%$iest##vas#"zo$$uoka")kabardnya"%monov"\'oaragad',
+    '\')ssociated&\'induced&%proof%(ing-pink##dan$#den$#mon#%e-bag%$care%\'leather%\'shiners)#ing\'#ops$%boxes$$care',
+    '#&ichiro#$ngwe#"ol$&t-down%$able%)ing-party)"up#+p-assistant.!s%\'steward$!.$%/post$+s/boutiques$&window#+re-dwelling',
+    '\'$ines%%break%%haven%#sea$#ney$.t&rehy;comings+$term%&-armed&.back-and-sides\'%odied&&coated($rner\'&utting&%ended&%falls',
+    '&&limbed&%scale\'%eason\'%leeve\'&norter\'%troke&.term/long-term\'(o-medium\'(rousered&&winded\'\'orkings%&.delay%%ages.%&enings&(r-legged',
+    '(&necked(&winged&\'st-ever%%forms%$reed%)sightedly&%wings#!s$$hana$$o-in$$tari#\'t-about%\'blasted%&putter%#shy',
+    '$%maker\'#ing$"s.$#ted$$well#%uders$)lder-line)\'mounted)#pad)&widths&"ny$%rjabi$$ters#%ve-it%+halfpennies',
+    '%%lfuls$#lin#\'w-bizzy$$.the$)biz-style\'"zy%&oating$%downs$\'er-head\'%rooms&(/bath/wc&$head*!s$%guide$$home',
+    '$"ns$$pony$\'stopper)#ing"&rawley#\'ewishly%0sbury-carmarthen#,impton/local$\'ne-like%!g%%kages$"ve&0nham/oxfordshire#$ooms$)uded-head',
+    '$%nk-on#%ybman"$tick#"um"$uang$!r#$bber$%unkin#$card$&kburgh#(dderings%\'ybunkin#!e#&fflers&!y',
+    '##hai##kir$!r#&namite$!g$*t-inserted#8rdington/gloucestershire$"in$$ston#$shex#\'t-downs%-upa-your-face"(wartzman"(ylockish#&mansky',
+    '#$talk$!i!$i*sj"".1#!2""ah#"le$&ylated#+urusevicius"\'bbaldia$#ick#%erica#&ilants$%rskii#$ship',
+    '#"un#$ylla"\'cambria##car#&k-bags%$list$)le-shaped%$iest%)y-looking\'%sweet$!s##ula%"um&!s$!t',
+    '"$damo$"ti#&e-bets&%ooths&\'ranches&$urns%(curtains%$gate%&hooked%&ladder\'%teral&#ong%%ponds%$rest%\'screens',
+    '%$wind)#ows$#arm$$bars$%chain)!s$$door$!f%%ooted$\'handled$&length$$note$%rbras%(oblastic&%liths',
+    '%#men$(tracking)!s$.ways-scrolling%#ind#"ia$"be%!i##law$"ow#%onian##way$#ell""eb$)engebirge',
+    '#\'gecraft%!n#&maszko%#tic$"en$$sens#!s"#fei##fre#!h##ter#&uentes"$gall#&hingly\'!s',
+    '#&iswald#"le#\'n-flags%\'writers$+ature-model$"ee%$tics$\'iatures$%orita$\'writers(#ing#\'urdsson"*hanoukiste#!o"(kdarpara',
+    '#%orski",lberschmelze&$zahn%!y##cox#&egions$\'nt-film\'%wheel&"io&!s$!x#%field#(icaplast&!s%,on-germanium',
+    '$!f#(k-screen+!s&%haded&)tockinged$(counters$&y-soft##let$\'y-billy#"om#$sden#&t-clay#/va/warwickshire%#ire%!s',
+    '$(er-blond(&uckled\'\'covered\'&gilded\'&inlaid\'%medal\'$rich)$mmed\'&screen(&prayed\'&washed&%iness&%lands\'$ight&$skin',
+    '($fair$"ie%"je%!s#\'ylating"+m&eacute;on#\'alakama$#ung#\'berloff#"ca$"oe##een$)rnitskaya#"ic$(lar-aged',
+    '((sounding\'1ities/differences\'(ly-rated%$iter$"ya#\'m-lewis$,ons/abingdon#&onites%#son&$wood#(peringly$+le-majority&(/complex&$ness&"ss',
+    '&$fier$3son\'s-in-the-strand\')-lawrence\'!.#%ulium%$knit$!n#!y""n\'#$aiko$&neddin$$tras##cil#&debele$#his',
+    '$$obod##fin$(oniettas#\'gapores$(elgracht%!n%,rs/musicians$#ham$.le&rehy;handed&%-atom(%uthor\'&centre(3hain-urokinase-type*$nnel(#ode',
+    '\'&earner("nd((xecution(#yed\'&finger\'&hander(%ulled\'$lens\')occupancy\'\'parents*%ticle($hase(\'latform(\'ractice\'&school',
+    ')&ntence(&helled($peed($tory)$ream\'&tailed(%icket(*ransformer\'&vendor(%olume\'$wire\'$year&*/mixed-sex$&master$+ular/plural',
+    '*%ation\'$tive#!j#$kage$"ov$!t#"na#+o-mongolian%(nepalese$\'logical("st#"s.#$tong"%oniae##tis',
+    '#$hnos#$pers""r.#\'en-like#%loins##oca""sa#%enand##mey#$soko%$nnes#,ter-exchange\'\'in-laws&\'/charge&"s.',
+    '$#ova#$wati"&t_next#$arem%#ist##bon#$com.#)e-finding##hee#$kins#!o#\'raterco#$tard$$elle%%rs-in',
+    '#&uative"&u-ming"+vapithecus-$%rasan"%wicki"+x&rehy;week#"\'n$!s#(-and-six$&burner$\'country$\'day-old%#eep%*imensional$)egg-boxes',
+    '%$vent$$feet%\'oot-two$&hourly$%litre$(membered%&illion+\'-dollar%)onth-long$&ninety$\'pointer&#wer$$race%(ear-olds$$shot',
+    '%"ry%"wo$&weekly$)years-old#"ma$(ilecross#%teen\'\'+-and-a-half($plus(%stone("to\'!e\'!s$)h-biggest&&minute',
+    '&&seeded%$form$(y-eighth&-five-year-old\',our-year-old*"th&$hour&0million-year-old($nute&-nine-year-old&%pound&%sixth\'(omething&.three-year-old&)year-olds',
+    '"*ze-classes%$wise$$=0.5#+gori&cacute!1j&ouml;d&eacute;n"#-10""30""ak""ie"!l"&obergs!#k10#!1"#830#"40',
+    '"!9""ab#"er#$ftar#$gway#%licky%"ng#\'mandros#!n$#dal\'\'konzert$#sen#$rthi#\'talites$*e-boarding',
+    '%.boarder/artist%$nigs##uge#\'vronsky#!w"&eaping#\'letally$"ly$+ton/brother##och#\'rneside$\'rington#(tch-like&%ed-in\'"s.',
+    '$"ty#(uomorphs""fa"&i-bums$\'clothes$#ers$$gear$&sticks$(trousers#%dders$%marks##ier#+ll-building&\'sharing&(training',
+    '&%ngton%*s-oriented&*/abilities#(mmington#&n-clad\'#oak&%olour%&divers%$like%%types$$nies##one#$pful$$nish#\'rmished',
+    '##tch$%hered$%swish$#ten&"rs##ver"&oglund#$rich#$tino#)uriotissa#$yles"!r##ela#"id#"ue',
+    '#1ll-and-crossbones&$face%!.%&capped%&plates#&nktail#"zi"\'vorecky"&weyiya"&y-claw$#god$)rocketing#!/#$clad##ing',
+    '$%laion#$nyrd#$park##rme$(ocketing#&sports#&walker!$l-90#&xps900"!."#542"!9"\'aaneshi#$cked##dek',
+    '$#sky$&t-wise#+p-slap-slap$$shot#\'sh-back#*te-floored$!t#$vata$\'e-girls&\'holding&\'masters%&holder%%ships%!y$(ophilism',
+    '#$ytor"#bms""ch",edge-hammers&!r%$wick##ech$"ks$&p-cell&\'drugged&\'starved%%eezee%$ibye&(ng-pills%&talker',
+    '%)y-looking&$head$,ve-fasteners\'$like##kys#$mish#"nt#$vogt"%iced.#\'de-talk%%robes#$eman#-ghtly-injured&$ness#(m-bodied',
+    '$#ane$&eballs%!r$$hole$#ily$(ly-built$#mie$!p#%nfold$\'g-backs\'$ombs%0/gloucestershire%!o&!s$$kier',
+    '#&p-link%%roads%\'sliding%$ways$%cases%%overs$\'perclub%#ier#"sz#&t-eyes$"s.#"ve$*ovi&cacute""mc")o-cookers',
+    '#"ch#&e-eyed%(hatching#(ganistic$$gett##kar##nta##opy#$pers$$pier#$rach#$uchy#\'vakia-2("ns$%enije',
+    '%&flying%+handclapped%"mo%%paced%$scan%%worms$)er-drying\')migrating\'%paced""rs"&ubbing#,dge-coloured\'$grey#"ff#%gfest',
+    '(!s$$worm#)m-cleared%&owners$(dwellers$%mocky##psk#%rried#\'sh-fund%#ers#)ttishness"&ymbred!#m-1""58"\'ackhead',
+    '#\'i/ecori#&ll(er)%(-animals\'#rea&+businessmen&+circulation\'%lawed\'$raft&&enough\'#yed&&framed(!y&&leafed\'#ike&%order',
+    '(\'tterned\'"ox&$size&(windowed%*mindedness%)talk-like%$ware&$oods#!r$&tarses%"gl%!t#%sh-up%"em&"rs',
+    '#&ttered""ba"#eal##des$$leys$!t#(erenburg$"th#!g#+llin\'-salts\'(g-bottle)%salts#(rdomenes"%idgin##gel',
+    '%$sian$#ies$,jkovi&cacute##rch$.nov-ostashvili$#ren##th\'%&-owned&-ryland/master%&/child&&labour&\'manager%#dom\'"wn%$esby',
+    '%$kins"#map"#oak#&ke-box\'$rown&$grey&&houses&%laden&(shrouded\'%ignal&(yellowed%$able%&buster%(d-salmon%&lessly',
+    '%!n&)g-induced$(y-breath&\'looking#%ltsov#\'obillow$%chier$#gro$!t%\'-hawley%(h-barked\'\'flowing\'\'looking\'\'passing\'\'shelled',
+    '&+est-running"%r=137$#357".s201&ndash;995"&utting"#yrl$$nium#*th/doherty%(e-watson%"is!#n10"$9300##400##500##700',
+    '"\'a-lu6.2#&ckette#(ffle-bit#$ggle%!y#(il-paced#\'ke-bark&(charmers&%heads%$bark%\'charmer%-s-and-ladders&\'borough%$wood#&p-appn',
+    '$&per-up%%ishly#$rler#*tch-squads&$ings&!y#$zana$$zier\'"st"!b""cc#!s"&eakier&"n\'#"ed',
+    '##lly#%movna#%ynton#%zhana")ickelways#&deness#%ffed.&\'rmaster#%ggery#(perscope$$ings#&tching"(o-plough#$gger#%rkers',
+    '$$ted.%$ings$!y##uty#,w&rehy;slope$&-drift%%field&&lecked%%light%&packed%&soaked&$wept%\'wreaths$.ball/wiltshire%$lind',
+    '$$down$$guns$\'mobiles$&scapes#*zzwanglers""r.""sf"(ufflings#(gborough$#gly$!s$%ville##pps"\'ythales!*o&commat;2',
+    '"(-serious#$what"&/ozawa##sew"!5#!1"\'ak-away$#ell%"rs#$ltee#!n$$d-so$"es#(p-filled$)y-looking',
+    '#$vita#"ys"(balvarro#%bings#*er-looking%$anis%"er%$ness#%ieska\'!i#\'radinho#"s.$%ovich"(ccer-kit$"io',
+    '%)l-affairs\')cognitive(\'ritical\'\'deictic\'(economic\'*historical\'\'liberal\'\'problem*%perty\'\'realist&!.&,demokratiska&$ism\')!o(+t-dominated',
+    ')*/communist\'#zes&(ly-based))conscious$$ety.\'%/serc$%nians$/o-environmental\'&thical&,geographical&,professional&)religious&-technological(&mporal%)biologist',
+    '%$gram%*historical%0logically-minded)"ze#\'kbridge#$orro"#dai$&lities#\'erbergh#$gers#$hail#$ium.&*/potassium#$ovyn#)ruzhestvo',
+    '#$mita$%thing#(sterberg#"te##ver""fi$"an$\'enbusch#(ronitski#&t-blue%(coloured%$face%$hard%&lipped%\'pressed',
+    '&&oaping%$tops$&enings$$flex$%links%"y.$$ners$#one%"ol$(pc-based$6ware&mdash;library.pmr(!-(*.intensive#"ya"%ggily',
+    '#$xlet"&igneur#\'l-borne%$less#$re\'e"(journers"%kambi#$olik%&nikoff%&ovskiy"\'lamente$\'r-flare&)generated%!a%-is-compatible',
+    '(*on-iapx-86\'!e(!d\'#ing%%speed$$tium##bes#)dier-folk($like#\'emnised\'&zation$"us#&ferino#$golf#/icitor-executor',
+    ')#ial))s/counsel$&d-body&%phase&(sounding%%ities%(ly-built$\'fluxion$$mena$"te#(licitudo%!s$"ys##nik#&ognats',
+    '$$vyov#$tane#+ubilization$&tions.#&vating\'"on$#ed.%$tiov"%mafer$$rone$\'tically&&sation%\'otropin#$ebod\'*y-or-other',
+    '$!o$#rby%%cotes%$dale%&scales%&villes$#thi\'.ng-for-nothing)"_a)$else%!i%#yme$(where_in#&hairle##lak',
+    '#*nambulance)#ism#\'oza-era#$tyme")nata-form%#ine#$chus#\'degaard#$epur$"ts#&g-book)!s%$type)!s%\'writers',
+    '$#ful$#hor#$ians$#nke#)nenschein$"ie#&ograms\'$phic$!r%$ants%!e#,s-of-bitches#"um#!z"&o-hyun',
+    '##key$#ies##mro#&n-come%,to-be-famous+(released$&g-jong$#ish#$oooo#!s#+t-encrusted%\'stained\'&reaked$"ed$$hers',
+    '""pa#*hie-carmen%%sters\'$ical*!t\'!s$%usson##ron#)s-in-wine")rceresses##jus#$oban$&rities$"us#"p2',
+    '#$ries$&owless$)y-looking#)t_sort_of$-il&egrave;ges$$land#$vall#"yu"%seaua#$geul#2ialidemokraattinen#%novka&!y\'$-bor#&tenuto',
+    '#-heby\'s/london##ion$$rios%#off##ons")ubriquets#"da%\'inement#)l-cialism$%/funk%$jazz$\'angeana$$bury$"es$(lessness',
+    '$!e#%nd(s)%&-bites&$gate&)insulated&$play\'$ulse&%range&&source%\'/symbol%%holes%&master#)p-to-nuts$#ing#.rce-compatible',
+    '\'$free\'%study\'$text&!/\'+destination&$less$#est$#ton#%siana%"ng$$liks$#sou$#ter#%tanes$/h&rehy;westerly',
+    '&*easterners&\'flowing&&german&*lancashire&,of-the-river%6ampton&ndash;cherbourg%$band&#end&#rae%$cott%\'endians&(rn-fried(!s%#ill%&umbria',
+    '$"la#&wester"(vetskaya\'"iy##geo#2iet&mdash;american&(-aligned\'&crewed\'(egyptian\')hungarian\'\'imposed(%ndian($raqi\'(japanese\'%latin',
+    '\'(occupied()rientated\'\'turkish\'"uk&%/east#"s.##yet"%waidi$!r#$dens#"le#%onola##ton"#xon"&yamilk',
+    '$#nka"%ziale&%staat!0p&eacute;culaire"!7"/a-francorchamps$%goers#"an#/ce&mdash;filled%#(s)%$-bar&%cadet\'\'overing\'$raft&#dub',
+    '\'$leet&&heated&)occupants&%probe&)satellite\'$uits&&travel%&flight%\'napping%"s.$&kerman%!s#&defish$#ina#%fford',
+    '$#nol#!l$$beck$\'dington$!l$#ted#&nboard$&celled$#ged$-ish-dominated\'$ness$%kings%!y$"ne&"r.',
+    '#"ra$)c-builder%&centre%$ells%#lxe%(tstation$&e-part*!s%"ly%"s.$&k-plug*!s%"er&)s/unipart%#ier',
+    '$#rer%\'ow-like$$tali&#nly#&sskaya#&tahori$&chcock$#hes%$iger%#ula$0ially-referenced%,o-temporally&*temporally$$ters#%uchle',
+    '$"in#&xworth#$zzle"$each$$k\'n\'%+er\'s/writer\'*-dependent(&groups(+independent()knowledge(\'meaning(/presuppositions%-ing/preaching$*r-carriers&&headed',
+    '&%light%#gun%$sman\'"en%#tip##c92$&fp(92)$!h$%ialia(&ssimus))t-generic*%/soil\'*ly-devised*(equipped+*stablished',
+    '*)inscribed*\'planned+%riced%&fiably%#n92&%t(92)\'"89%$osum$)kledfaced&!y%!y$+mark-to-500$#nfs$+tacularised&!l',
+    '*(highland%(hruput89%,roscopically#\'deworth#/ech-interactive\'$like\'\'reading\'$wise(&riters&(/writing&"ly&&makers$)d-doubled&%freak&*restricted',
+    '%%freak%#pex%%strip$!l$1n/buckinghamshire#%ights#"ld$&eology$)l-checked&%walls%#acy%,ing-to-sound$,man/planning$"ta#!m',
+    '$%ding.#\'rm-bank%)atogonial$%rings\'!s#%shnev#%tters%$igue#%zzano"$f/pc#!s"(haericus#%eeris$#re.%$oids',
+    '#!i#"yg"&ianato#$cata$%eball$#ker$\'y-fried#$ddal$(er\'s-web&%-webs&#gob&#top&#web)!s#+elberg/time',
+    '%%ingly#$kier%"ly$(y-haired##les$$ites#%n-1/2%!2%%dryer%!i%"up$(a-bifida%(l-injury&"is&"ly',
+    '$"el&%essly$"is$\'masters$&nadisk%"et%)ing-mills)#top$&oletta%%sella%(thalamic%"ut$"to#%racle%&l-like',
+    '$&e-like%$lets$&iferid%*t-inspired\'&soaked&$uous$\'ochaete%)nolactone#)t-roasted$$ball$#eri$$less$#oon$\'tle-bug$#zka',
+    '"$lane$%sh-in&\'/stroke$\'yed-out#-endidly-named#$icer$*nter-group.!s$(t-crotch&#man&$shot%$tism("ts%!z#%oshed',
+    '$%tched#%urged"#ods#%ggies#)il-sports%#in\'#%kemen#*ndon-based%&ylosis$#gey$#ish$+sor-protege\'.ship/charities#$ofer$$kish',
+    '$)n-fashion%&erisms$$rnet#%rades%%ngium$$borg$)e-forming$&ophore$$rans$*ting-goods%!o&&paedic%&palast%,s-car-driver(&lothes',
+    '\'\'playing((rototype&&/hobby&$cars&$hall&%pages&$work#"sa$"ed#\'t-light\'!t%%nosed%%prone$&listed$(ty-faced',
+    '&*s/families""qr")r/highest#&atling%"ts$%y-bar&%dried&-in-highlights%#bar%#day%#son#&eadin\'$$nger(!i$\'zzatura',
+    '&!t$#gge$$mont$\'ng-clip\'&driven\'&roller&&/early&$ette)!s&$ford&#ier("st%%kleys\'$ings%*t-bulgaria',
+    '#&ovieri#&s/ssrs#)uce-trees$"gg##yly"$umes#&n-gold%#out$#gen#%rless$$rier"!v"%x/ipx"\'y-holes#(catchers',
+    '#%plane!&q-2550"&._feet#"cm"$_km.#%units"$eeze"$l-92$$like#(/connect#!2"!q")uabblings$%dron.$%lidus',
+    '%)ocolumnar$(rciapino%\'e-edged(#yed\'&necked\'\'riggers\'&tailed(%ipped(#oed&%house%#iel$)sh-courts&$able&*ed-looking$#tly',
+    '%!l%"rk#(eak-core&"er&#ily&(y-voiced$&ezebox\'"d.#\'innying$*rearchical&#ens%%reled%#ter(!s!#r-3',
+    '#$,282#&43,000#!6"!2"(ampickal#$nang""dt"+e-cyc1-lacz#/berny-mohammadi#!e#$mska"$f412"-he/leverhulme"&icam-1\'!2',
+    '#*perumbudur"%muc18"%necek"$odes!$s-4s",.15&mdash;16#!2"#148#"60""2+#$0(4)#"19"!3#!1#!4',
+    '"$5(1)""77"!8"!9""ab#!d#"p2%!0"&c-0.1%#!i"\'ds/swds")emegorere""fa""mh""nm',
+    '#!2#!c#!v"#rps""so#-sag-ram-ossso"\'ti-xhoi"!u!/t&auml;delsches#3iacute;of&aacute;in#*ndash;paul#)ouml;cker""-1#!3#%aubin',
+    '#-jean-de-losne)&u-gard#\'laurent#\'quentin#(savinien#!t#%vaast$%ictor"%.mary#(nicholas#\'pancras$)etersburg""15"#200""36',
+    '#&atlich#-b-in-the-back$!b$#iae%%lator&"es&%ised.\'+ty-oriented$(le-hands\'$lads\'%mates#*ccato-like$$hura$*k-oriented&%pipes',
+    '$,pole/british$"wq#-dium-building(%sized$#len#"er#(ff-child&&inmate&&parent\'$upil%+/management%"ie%#man%*ord-hayden)*wellington',
+    '#(g\'s-horn$%-like$,e-directions(#ved*"rs&$left&#one&%right&&struck&(whispers%%bound%#man%%plays$(gerwings$)ing-posts',
+    '&\'tionist#$i-x1$%dness$)n-removal%&forths%#ley%&shield%-ton-kelly/pig$&r-case&$post%"s.#%kesby#&lefish%\'ybridge$*in-trotsky',
+    '$$kier$&wartly#%mboek&)li&cacute&"ul$&inodal$!m$,p-collecting&&linked%,ed-addressed\'"es%#fle%"s.#%nback$#ce.',
+    '$%d-bys&%downs&%pipes&%still%&.alone%!/%(ard-cell*(ompliant)$mode($ises($ness(%s-hot%&erline&"st%$hill',
+    '\'(g-stones%"li&!y%$offs%$ring%&stills%"un$&eydale$0ford-in-the-vale$$hill%*ope-murray$&iforth%$land%$slao$+nard/oxford',
+    '%&ingley$%sbury&!y#%peley$\'lefield&(ton/john#\'r-burst%(clusters%\'flowers%$gaze%$sign&\'potting%#tek$"/2%!3',
+    '%$ound%%right%#urn$%chily$!d%\'ent/avs$&fucker$\'kadders$%maker)!s$\'obinsky$#pro$#rer&!t%$iest',
+    '%%field%\'pangled%%tream$-t&lowbar;posn%!-&%holes&$mark%!/&+maintenance%!2%$ing/%&lement#$siak#"t.$%ajack',
+    '&)appointed)%roved\'&rtists&\'economy&&making&\'peasant&#set\'$pace%&/civil%\'centric%$gies%%house%$lier&&y-home%*n-generaal',
+    '\')supported(%ystem&$boro$)ion-hotel*#use(&keeper\'$arii$&oblest$#ton$5us&lsqb;untested&rsqb&&-bound%\'te-laws\'!.#%urady%!t',
+    '#%y-put$%brite$)ing-power$$sail$*te/milkman#%zione"%c-icl""e.#-ady-as-you-go$#fel$(k-frites&/with-everything$&lthier($ness$&m-bath',
+    '+#ing(%ouded&)generator&&hammer,!s&(operated&$roll&%tight\'&urbine%#ier%\'rollers)#ing\'"om$$royl$(torrhoea',
+    '#"de#!e$*l-castings&&fanged&$hard&%jawed&&nibbed($ckel&*reinforced&&strong)#ung&$tape&$wire%(e-bodger%(founders',
+    '%"ie%&master$"nk&#irk%!s$\'p-faced&\'incline%#ish%*ly-dipping$%rbear%"eo&!r$!t#$fana&#oni',
+    '$$fell%&isburg#$gman$&osaurs#"ib$&ermark$)nam-rhein%\'brunner&#urg%%egger%$feld%&hausen&#off#$lios$!l',
+    '\'"is%!e$&maszuk#$mmle#&nching$"ka$+nett/former$\'ophylla%!r%#tic&\'ography$!y#.p-by&rehy;step%-grandchildren%$like',
+    '%%overs%)relatives$$down$-grandchildren$$hani%.ens/gloucester$+pin\'-stones\'$gley%#ler#"r.$#bae%)eurkunden$\'coralis%(uliaceae$+eo-specific',
+    '&&metric\')icroscope&\'regular$*ilisations%%strip$$lets%*ing/dollar$$nata%$dale%(opleural$"pa$&rebeek$!t#(t-hellas$,hoscope-like',
+    '#&ve/the%+n/annabelle\'(managing&"ey&$son.)\'/thames)#ian&/ton/oxfordshire%%y-boy#\'wardson&\'t-davis(*richardson(%smith\'\'/former(&ranson',
+    '"%iched$\'k-a-bum&#pin&$thin%&y-back\'\'looking\'%sweet#0eglitz-generated#+ff-bristled&&limbed&&winged\'&risted%%eners%&nesses#(gmatises',
+    '#&ll-air&)beautiful&*continuing&%frame($ozen&%green&#hot&(lamented&$open)(rational&(powerful\'&resent&&sealed\'%ilent\'\'tanding',
+    '&,unidentified&%white%#est%$mans%&nesses%%stand*!s$$tons#%merol$"py$!s$\'u-nodes%3lated&rehy;emission($ion.&+i/apparatus',
+    '((-induced##ngo#%pples$$ules#$rbei$"is$.ling/inverness$#rat$#ton#*tch-cutter&#es.")jernsward""kr""lg#!l',
+    '#+chastically$)k-brokers&\'jobbers&\'keepers&&levels&\'raiding%$horn%*ing-masked-!s("er*!s%$mann\'$ster%%taker%%yaryd',
+    '$#ham#$hrer#&icorum$#lov#%janov#&ke-ash&(by-clare%"ld&"ey%1s-smith/protestor#$leru$%lhans$"ow$"tz#%mach.',
+    '#*ne-breaker&&carved+"rs\'&utters&)gathering&$hard\'&earted&&packed\'&icking%(/cashier%%banks&&reaker%%crops&&utters%$dale',
+    '%$hill%#law&#ess%%walls%$yard&$gate&$wood$!k%%ingly%!s$$nell$%ygate#$olie$&p-back%&erdale',
+    '%%light%%punch%$spot%\'the-war$$gate$\'penbach%\'ing-out$$sley#%rable$+e-for-store&%house&#jar%%baelt%)d-program%%place',
+    '$(m-beaten&%swept%$/dba%!a%\'breaker%\'trooper$%naway$#per$#ton$&ybooks%%ville#$ssen%\'truppen#(tt/event&(national',
+    '#&urford%.port-on-severn#&ve-top$#ies#=w-on-the-wold/gloucestershire$$ford#(yanovich"$p/im#!d""r-#)a&szlig;e$#cey%+h-zimmerman&\'.gif.uu$\'dishall',
+    '$+ight-batted*%laded)%games*&rained)#hit&"th%*t-jacketed-#ing$"ke%#hov$$mash%%onium$*nalysedesc%,ge-attractor(&shaped',
+    '\')r-looking%"ka%%raers%#sky$)p-hangers&$like&%watch%#per$\'sshofer&$mann$$tech&%geion(!m\'(ic-issue(#es.',
+    '%,ford/chamber*\'swindon%#ham&$eden&$ford%.ificationalist&\'grapher%&oliner&.spheric-flying&&tanker$&usberg$\'vaiging$"w-&(boatered&&necked',
+    '%.berry-coloured%$like%!n%&weight#!e$(am-lined\'(sediment&)er-shaped\'!s&\'s-based%.tley-on-thames$!e%)t-battles\')cambridge\'(dwellers',
+    '\'(inspired\')kirkbride\'\'markets\'%noise\'(presence\'&sussed(\'weeping\'#the(&raders\'&wisdom($omen&\'/centre&\'erville&#ley\'#ife',
+    '&"on&%shome&$wear$0itgenossenschaft$$litz%"sy$$newe%,gth-in-depth)\'sapping(,s/weaknesses$+ss-carrying(\'racking\'*management&%balls$.tch-limousines',
+    '%#tel&!o#$iata&"us$%ckers%"to&)uroplasty%%utres$&ke-hit\')proneness&)/lock-out$)ng-puller&$ings&$line$&p-down',
+    '&$wash%!.%%eless&!r&"s.%&number%%ogram%%pings%!t$$tter#(obe-like$$dder$)ke-makers&&player&!r',
+    '$(matolite(&poroid%#bus%&eferry\',irry-nofirry&%lysin&#yer$#ng\'&*-amplitude\'&bodied\'(coloured\')finishing\'&motion\'$room\'$weak',
+    '&)ly-marked$$pped$"ss$(ud-based&!s%$lger$$viol$!w##ube$\'cturale((e-action*(strategy)!/*(security)"s.',
+    '$$ther%#ter"+uart-buttle#(bbington%&orness%*y-fingered$"en%#rls$"ig#%ccoes&$ists$$k-on#)d-pattern$$eley%,nt-initiated',
+    ')\'rainers(%union\'*/candidate(%tutor$$ios.%"um$#lar$#y**%)-bedrooms&$time%(/project#*ffed-shirt&"rs%#ily#!i',
+    '#%lberg$!z#-mbling-blocks%#rys$#mes$(p-legged%#ies#&nt-man%%woman%!y#/pid/insensitive$$ples#+rdy-looking$$iale%"ng',
+    '%#ers&!y$%rocks$&tevant$%zvage#$shie#%ttard%#ery%&garter#$wart"%yches##let&%-like$%ianou%"na',
+    '\'"lc$*ocumulates%*litization#"ne#%renic!\'u-kyong"%abian#!m#"rd#\'veolens"-b&rehy;normal#.-&dollar;4,000%)pound;200$"80$)abilities',
+    '%%erial*"ly%&queous$*businesses$&centre%%hunks%#lan&(inically%*ommissions&+nsciousness\'(tinental((ractors.&&uncils%&rustal$)delegated',
+    '%)imensions&\'stricts$&edited%*ndocardial$(families%$orms%\'unction\'"ds$*government*"or%%rades&%icean%"un$&humans$)inspector',
+    '$(kingdoms$(language%&easing%(icencing&(terature%)ocalities$*mandibular&&riners%"en%+ilankovitch%$oral$+nietzschian$*objectives%)ptimality+"ly',
+    '&#nel&%rcels%\'ersonal,%ities%$lans%\'rioress&)oletariat$)questions$&record\'(tangular%&outine$&scales&$ores%#ets%%trata',
+    '%+ub-branches(*delegation$)tenancies*!y&#rms\'%tiary$*underlease%&tility$%world$$xxxx#!.#&_poena#(additive$&mbient$%pical',
+    '$*ommunities&$pact%"xa\'!l$\'rystals#&dermal#&editor$*ndocardial\'\'thelium%#try$(pidermal$"ro#*formations$\'reights#\'generic',
+    '##has$$ilar#\'integra$$rana#*ject-class(*department((headings(\'matters(%paced(*specialist($verb\'%/type($verb\'%ionis(,ve-objective',
+    '*$ness\'&matter\'\'s&mdash#&lethal&!s&%tings$(imations&#est%"ne&$gual#&marcom$\'embrane$&it-job&$ted.$%ucous',
+    '#(ordinacy)#nce#)paragraph$+eritoneally$#ool#&region#"se%$cond%&gments%\'quences%%rosal&&viency$%hells$/istence-pattern)!t',
+    '$"p.%(ecialist$(tainable%+itutionally$\'ymbolic#$task$$ense%"rm\'$inal$#ile&#ity$$ours$#ree#&urbans#\'versity',
+    '#&woofer"\'ccesive&)s-glutted(\'seeking\'#es.\'\'fulness$&oureth$"us#(essfully#2h-and-such-a-thing#%jects#&klings"\'d-ouest$\'tribune#%dards',
+    '$#ick##omo"&e-anna#!b#\'deheads##lla#!o#&ssmuth##tin")fficient.$%ragio$&usions#(iciently#$rama".gar-containing',
+    '&%mouse&\'related\'#ich#"ge%&stion.#%iarto"\'iheisha#"t\'$%brain$$ings##vie""ka$!s$&tschev#!e',
+    '##mak##owa#(ristovas"$lcis#%ejman$&ymenov#$iard$#ngs$&tjelma##kin#+len-looking%!y##ome#\'phonate%*ur-bearing',
+    '"&m&gt;0#"ba%$nese$"er$!u#$fink#$gait##ida$!e##lin#$m/ix$"ae%(risation(#ers\'#zer',
+    '$\'er-blue\'(fruiting\'&houses\'$like&&childs&1s/gloucestershire\'%cales$\'ings-up%\'t-level$+ons/initial#$pin\'##yaa"/n&rehy;drenched#"-4$*and-planet',
+    '%(listered$(catching%\'entered(#red$%dazed%(eveloped$&gilded$$hats$&lenses%$ight&"ke%%overs$(reddened&(flecting$&saturn',
+    '\'#ped%\'oftened%%truck$\'tanning%\'ropical$&washed%#ind#"/3#$386i##air#\'blasted%$inds%$ocks$%onnet$%right',
+    '&+y-on-thames#%daram&$esan%0y-go-to-meetings$*erlandwick$"in$$rige$%stein#&filter#$gate$#hir$"lo$"od##ium#+ken-floored',
+    '##med#!n$#ies%$side$)y-hearted%$brow##pic#,shine-yellow$%oaked#,view-to-open#&warmed")omalainen$$inen#"re"&padriv',
+    '$%snaps$#tra#&ension$(r-agency&#box&\'cinemas\'(onfident))stituency("ol(!p&\'formats&%hyped&*imposition&$levy&%macho',
+    '\'$odel&(nintendo&%order&*parliament)"ty&\'refined(\'gulator&*saturation\'%ecret(\'riously\'#ize\'$lick\'(printers\'&tadium)$rdom',
+    '\'$weet&$thin\'$rack&%union&#vhs&&woolly%*/subscript%(annuable%%banks&)ly-judged%=calafragalisticexpialidotious\'#rgo&#ede(#ing&$hamp',
+    '(&scious%)elevation%)fecundity&#low\'(uousness(!x&%usate(#ion%$grip%\'heating%+impositions&)ntendency&1ority/inferiority%$king%&league',
+    '\'"os&%unary%+marionation&"ec\'%rcado&%other\'#use%*neutrality&$ovas&)umeraries%%obese&\'rganism%$page\'*ramagnetic&#iss',
+    '\'"uf%#sad&%caler&!e\'$deas\'%iners\')nsitivity&/parc-compatible&&tardom(#tes%$teen&%itles&"op\'#ugh%\'venient',
+    '+!s\'"ze#&icious$$nely##ort#(p&eacute$!.$(er-party\'&summit\'&things$-l&eacute;ment%!.%%anter%*ementarity&$tive',
+    '%\'icatory&+er-customer(!.(\'/course%)y-and-fit\'$base\'$only&(.hunslet&\'/demand$%ort-c((services\'$/400()executive\'#_of\'"s.',
+    '$(ressible$\'urative#*r&ecirc;me$(a-normal&(personal%%basal%-diaphragmatic%\'glacial%%pubic%(regional$%ising"(rangular#!b##dam#(e-handed',
+    '$\'tyships#%face-()connected()iodinated(\'ripened\'$/air&%tancy$(boarders$$eits$\'masters#,geon-captain$$ings$&uladzo#"ju#$lier',
+    '#)mountable#&nabada#\'plusage$"ri&\'se-free#)rejoinder%$nden#)veillence%"y*&&-based&#ers$\'ivalism&\'orships""s2#\'an-jane',
+    '#$iana$!c#"pe%%cted.\'"id%%nsive$&icion.()us-minded*!.##uga$"mu$%rrant""te##hee%*rland-dodd',
+    '#%orina##tie$(on-pryce&#ian"&varovs#%retta"$waya"+xamethonium""ys"$zana##dal!*v&ecaron;t""-1"&alocin"!c',
+    '"&edberg#+lte-looking#*ngali-like#$rige\'!s"/iatopolk-mirsky#"d3$%aniya$-rigailov-like#\'nfylkja"#oja#"ld"$r3.2%"95#+4-for-intel',
+    '&$sf/1$$.0mp%\'2-based\'(on-intel$%/mips!(w&aacute"!.##fr.""12"#aby#$ffer#"ge$#man%"en#$iles',
+    '#$lcap$&edales%!y##mis$&p-like#(n-necked%$shot$&bourne$\'k-words%$iest$"s.%%combe$$wich#%p-out$#/px',
+    '##raj$+thy-skinned#%sthya#\'tchways#*yambhunath"&earers%$word)!s$(t-beaded&(drenched%(er-dress%#ier%(y-palmed#!d$)ish-based',
+    '#!e$!n$"p.$&t-corn&#pea)!s&(sounding&%talks%&ie-pie)#ops%%shops%&worthy$#zey#"if#)lteringly',
+    '%"on#!p$!e$$t-up#1rford/oxfordshire#"yn"!h"&iddens#!f$(t-tuttle%$call%$kick#+mfeeder-fed$$mies&(ng-baths',
+    '$%egate$#fen$&g-door%#bin%%ingly%1s-and-roundabouts%!y$#ney$$scoe$*ton-thomas#(ss-style%#ors#&tchers&$ing.&$less',
+    '&$term$%hinly\'!s$!z#)vel-chair\'$seat&$head&#ler#"zz",ollen-headed#$ofle$"py#.rd-and-sorcery\'"rm&$play',
+    '%%stick#&t-card"#raj#!c"!t"(ynnerton!#y\'n""23"!8""99"\'barites$\'se-held##ota##ron"%cosis',
+    '#*ney-hobart"%edain"!g""ha"#kaj#(es-picot%&/bbont&)institute"%ledis$#yma#(lable(s)#(ogin.com#&phlike#%vania%%ticum',
+    '$!e%"st%#tte"&mbiont$2olic-technological%$tics#&metrys#/onds/llandinabo#-pathetically.\'$ies.$(honiques("st$#son$*to-thermal&-ms/conditions',
+    '",n-diagenetic#)apomorphy%$sing%\'tically&&onemal#)cographic$*retization#*ecdochally$$rgen&#ise#"on%%ymity$&ptical*"ly#&prolam',
+    '&*/semantics$%hamin%&etised$(ometrine"%phons""re##ia.%*c-speaking&"us$$nge.#,o-phoenician#\'rhaptes"6s&dollar;lifespan:scan+@manager:lifespan&mdash;login.com+&output',
+    '#$info##ops#+tem-centred\'\'managed&*/component\')equipment&&atical&$pros&-s-constraints(\'manager((oriented\'$wise$#ime$#ole&,ic/diastolic',
+    '!)zajkowski"*czesnowicz"%ekler#%lenyi#%ndrey"%getti"!h"%ifris#$lagy#$rtes#"ta"#uca##luc")wajkowski")ymonowski',
+    ' (t&amp;ea&!r"-dollar;sub1/2")egrave;ne##uml",iacute;dwald"\'ocirc;d#+uml;lgyessy\'%nnies")ucirc;101*!9#\'uml;bke!%\'farm#$ield""go',
+    '$&spital"&market#"en"#owd"\'poultry"%truth"#war##ere"\'yungunz!\'(&phgr)""0)!(+&dollar"!5!(-&dollar"#33a',
+    '"#ach"%bands##ird".cell-deficient\'(mediated#"ll"&factor"%group"%jetty"$line#.ymphocytopenia"!n#&etwork"(sections#\'neachda',
+    '"%tails#!o#"ry!#.1s""3a"!5""7s""8m")annectens"+buttikoferi"#i.e""k."!n#".t"$s.w.',
+    '!,/005/26/0007)$1025,!6$)7/40/1002,!4,!5,!6,!7"!l"#sgt"!t!!0"$n0m0#!1!"1\'',
+    '"#00x""10!*2&ndash;t4"$-b53#(weighted"#816#"91!"50!#613!"70!!8!&9000\'s!%:0494#,71&ndash;242!,a&iacute;rov',
+    '#%ovala##wiz"$100r"\'agepera"&b-ends#$arly%"ri##boo##ito#(le-lamps&\'sharers%%/free%!1%)spoonfuls%#ts.',
+    '#$orda%!i#$rizi#$ubil"&ceddin$#ndo#+histoscopes$(ycardias*!c#\'k-heads$"et$#ily$$room(!s#\'ographs',
+    '$%ieren""da$#aki#$esse#$gell##ham#)pole-like"$enia"&ffetas$#ner$!s#"ia""g/$\'porsche#$gers',
+    '"#hat#&iliani#"ki#-oe/california%#raa$"me"$iga.$!s##koo#&l-back%$down%%ender%%first%$lift%$male',
+    '%$race%\'signals&$kids&#pin&%teady%&wheels$"by$\'chasing$#les&"ur$(or-makes$$side#$mour##nsh$)ted-blood',
+    '#)wan-based%!o""ji##jal"&kahiro$!i$"ka$$moto$"ta#%e-all%$note$$naka$"up#&i-taki#%oever',
+    '$"ya"(l-y-llyn#%agaad$#lay\'"ev#$boys#)e-bearing$%galla$!i$!n%*t-spotters##fan#&i-os/2$"ca$!p',
+    '#&k-back$&/slide$$down$*ing-points#+l-chimneyed%%herbs%&masted$$eres#%madge$"on&!t#\'thybios"+m-o\'shanter#$amum$\'shiwara',
+    '#\'bimuttu$#lyn#%grams##lyn#"mi#+plin/kennel$#opo#$sins##uli"&n-yard#%aiste#,cr&egrave;de#$door$(y/victor##eja',
+    '%%ncies$&led-up#!h##ika$$stry$"ta#&k-tops$!.$&buster$*er-mounted&"ed$$ship#(naghmore$.er/tetraplegic%"tt',
+    '#"su$,well/manager#\'talizes&#lon$$obie%!n#\'umafili#%worth#$yard$"el#"zi"%omati")p-dancers$&loaded$%shoes',
+    '#&1(181)#$e(s)$(-counter%\'editing%$loop%(measures\'$mory%$outs%\'to-tape$%d-out&"up#$ings#$pets"&r-like##ace',
+    '$(mosalata$#ngo$*pac&aacute$$wera#\'batness##des#*get-towing&!t\'*-v-tarfean$#hee#*iff-reform&\'ication$"go$"ja#&macing',
+    '$"us#$oczy$"ko$!s#\'rington#+tan-dressed\'&socked%#ria$"es$%ikoff%"ne\'"ss$#let$"us#"zi',
+    '##eer##han#,k-automation%&driven%\'focused%(specific$17yourinitials.doc$)er-poland$&forces$(mistress$"s.#&mowski#%signy%!s$#les',
+    '##zar"&t-like#)a-binding%&mailau$%rinov#*e/labianca$#mae$!r#"hi#)i-loutard##ter&#ing&&sfield$%iness$*oo&lt;s&gt',
+    '#!u"$ukei#$rino$0ocheodeoxycholic\'$olic%&maquia#%singa#\'tomeric%#nym"&vannes#+ern-keepers&"or#0istock/routledge#"oy#!r',
+    '$"ov#"ua"$wara$!u##era%!e$!s#%fikia#!i#$neys"&x-base$&credit%&utters$\'dodgers$)effective',
+    '%\'inanced$&havens$%rates%)esistance*#ers$&saving$$take$$wise#).huntsmen#*/community#"al##ers#$free#&i-cabs$(dermists',
+    '$"la$#man$&s-like#$onym"$yboo#"ib#-lor/community\'&driver%,ur/wiltshire#$nton$$uilt#\'vallich"#zir#&mamart#"ze',
+    '#!0"!d#!f"$m-3e""st!/ca-precipitable"!d")haikowsky$%mbuli#%erina#&ibinda#!t"#off"*r-mediated$(negative',
+    '!$d248"%c3000""ex"!g"#s.1!1e566/g&ndash;blck"(a-breaks$%cakes%$loth)!s%\'oloured&$sies$%maker$\'sipping%%poons',
+    '$\'trolley#+ch-yourself%#er-(%based(%guide(+in-training($made\'!/((lecturer(\'student\'-s-in-training%$ing\'(+/exhibition)(practice%"ta',
+    '#+gue/moseley##lby$%eaves$!s#(m-sheets&,trengthening$$aker$"er#!n$!s#*r-drenched&$ucts%&glazed%(reddened$!e',
+    '$&stains#\'sed-out##tre"&c/btec#\'hgnosis$.nical-economic)+ly-oriented("ns&)ques.whop%&ograph&%lgies\'$ogic*#zed)*y-inspired*0/computerization',
+    '*"ic&$rama$\'oueyres#(klenborg#%magik#\'nifibre$\'ologica##tan$%onism&(ophysics\'/stratigraphical\'\'thermal%$rius"8ddington/gloucestershire#"is',
+    '#%worth"\'e-shots$(totaller#!f##ger#$ling#&n-ager$$cool$%otchy$%y-bop%#pop#%shirt(!s$)side-born#$th\'n',
+    '&(cleaning%"es%#ies##vee")flon-like##nut"$gwyn"$i&gt#$llac##man#!o#!r#"th#$waki"!j',
+    '##ero"#kam#$kin\'##mar##nik##ola#$serv#)tite-like"%l.081$&821908$$guis$%m\'bro$(stockton#,e-conference%%rings',
+    '$$anou$%cabin%&entres%$om-i((provided&$nomy$)directory$-f&oacute;nica%#arm&#xed%*unken-made$$gen2%*raph-poles)&/times$%mines',
+    '$#ost$)pointless%)rocessing$&saling%\'ikrates$#use$%video&+si&oacute;n(#on\'*!.*$iste\'%ually&#zed$#way%#ork',
+    '##ios#&ltales$*y-watching#+matochromis#*ocollinite$!k$&merase$!n"&magami#"ne#!o#)pelbezirk%&ratire%)st-tossed\'!a',
+    '\'\'complex\'*decoration\'\'worship&$bury&$wood$%orate)"ly&"um$&rature$#ura#$uraz"&n-band$)foot-high$%match$%round',
+    '&&ousand%"ry$&volume$(week-old$-year&rehy;old(!s#$.col#\'ability$$ncy.%(t-farmer\'$like&/s-in&rehy;chief#$brae#$dale$!o',
+    '$#ria#%ellus$&mented$"nt$(r&eacute%$iffe##gri##ira#"ko#"ma%"ya#(nis-star#*se-looking%$d-up$*ion-packed',
+    '%$pole)!s%&shaped$)acle-like%"ra$!e$&h-hand&\'largest%*/sixteenth$#ing%#ons#)uirostris$&rially"-olog&iacute;a#"mi',
+    '#%sinte"#pco#-hrochronology#$idly#\'lyystan"\'ratment%%ology&"ma$#zzo#)binefeine##cel#%enzio#$gals$$ites%(versated',
+    '%\'pleural%(sternals#$isio#%lecki#\'m&mdash$!\'$%essos$%inial%(te-proof$$orra#"n.$#aes$#era%$uzen$$ight',
+    '#\'racings%#ggi%#ine%#nce%%watts$"ce$$eira%%stial\'#ris$,ible-looking(!.%"ck%$fico%"ll%(toriales',
+    '$\'or-mask+!s&"um#"sa$"er#!t$"ia&(rization\'*y/residual$"je#%vuren"$sler#*sa-holders$%elata#\'t-class',
+    '(#ven%%fired(#ing%&pieces$&/reset$&30root$\'ability$#bit$$card$%erton$%iness$&pieces$&runner"$tani#4bury/gloucestershire',
+    '#&erboro%#ous##hra#!i##ovo#(raacetic%(ceratops&%yclic%-ethylammonium%(hedrally&/ydro-cannabinol**cannabinol+\'hloride%#min%&needle',
+    '%3peptide/cyclophilin%&sodium&$tyle$$icus#2sworth/oxfordshire#\'tenhall#*u&aacute;n"%warie##fik"/xas-red-coupled%%ville#$coco#(el-sired$#tte#+t-retrieval',
+    '%%types$#.id$$base$$flow$,iles/fashion$$less$\'machine$*ualization%&reless!"f1"%ariti##sta"!f!"g2"!b',
+    '!,h&aacute;sos#+eacute;nard*!o+%logie+%rique#+lsqb;e&rsqb#)oacute;rr"%\'been#$come##did#\'expence#$firm#%hands#%likes#$name',
+    '$#ook##way$$ords&!k"&-thank"$aabe#$cher$%krays#)i-chinese%&myanma$"th#$ksin#*lassiosira$#ers$$iana',
+    '##mos#$ndar$&h-nien$Zks-for-putting-up-with-them-and-that-wasn\'t-too-bad-was-it#$rrid#$sian#)t-clauses$(ch-eaves&)er-reagan)%style(#ian#$wpit"\'e-first$$line$$more',
+    '$%heart#%_less$&papier#&atines%&re-bar&"ic$$yter#$baid$!e##cia##eng#\'faculty#"ix#!k#(m-selves',
+    '$$_out$&atizes$)e/keyword$#uns#\'n&mdash$&-enemy%!i%%prime%&record$"ar#(ocentric$%dilus%&olinda$!l%%ogiae',
+    '&$nius$#nly$%phany$#rbo\'!s%$ises&\'zations\'"es%\'y-based\'*of-finance*$mind\'(specific#$r-to$&e-fore%!.',
+    '&"in%$ness%(se&mdash%!t&%ofore%$unto$$fore$\'mistors&!t%&ocline&#dry\'(ynamical&\'elastic&\'forming&&labile',
+    '&&philus\'#sis&)regulated&\'velours%!s%"us$%opoda#%ses87##tes$#ted#"ys""ge"*ick-framed&&leaved\'%ipped',
+    '&\'skulled%-er-than-usual%,ly-populated%#net%"os%!s#%ebaud$%nchai$$rree%!s#$ghs.#!m$"an$)ble-sized$"on',
+    '$\'-bodied%%layer&&ooking%&rimmed%*sectioning&%liced$$ford$+g-in-itself&$like%(ummybobs%&ymabob$)k-tankers%"ed%$ings$)ly-bedded',
+    '$)glycollic$#nyl$(sulphate$#unn#)rd-inning&$last&&minute&$rail($ters&#set\'(trongest&$time&*world-debt%\'/fourth%!d',
+    '$%lwell$)teen-foot)$hour(!s(#th-+)twentieth%&y-acre\'*centimetre\')foot-long\'-nine-year-old\'&oh-one\'\'seconds),ven-year-old\'.three-year-old("on',
+    '#*s-and-that$*elton-dyer#\'xendale"!m"&nowing"\'oahlane##ght##irs#$lekt$$oids$&thorpe#"ma%(s/attack\'+bereavement\'(resident',
+    '$&isidae&"ts$"mo$%psett&*on/british)#lab)\'swindon#$nged%$sing#%osand#\'racatum&\'oplasty$!d$$gill$$leif',
+    '%7borough/buckinghamshire&%ridge&#ush%1e/non-fundholding%$gate%+ton-le-dale,&street),norris/david)\'pickard($loch$\'ogobius\'3od/northamptonshire0#nts$,pe-by-newark\'(le-soken',
+    '%!s$#ugh#,u-shalt-nots$2ght&rehy;processes\'"-a((contents,#rol(+experiments(%forms(&police((stopping(\'through(%waves$"sa&-nd-millionths',
+    '"#ra1$"nt#\'eadless\'#ike&$work%&tenin\'$2e&rehy;dimensional+$tier%$-all&&bodied\'\'ranched(&easted\'&y-five&$card&)dimension',
+    '\'$ight\'(lectrode&$five\'(oot-long+%thick&$game&+handicapper\'&elical*!x\'/undred-year-old&\'lengths\'$ight&%metal\'#ode&&nation',
+    '\'\'ver-par&%panel+#led\'%hrase\'&icture\'\'osition()und-fifty&,quarter-inch-&s-of-a&$rail\'$ound&&season\'$ixty\'#pot\'%quare',
+    ')#ide\'%ystem&&tenths\'+imes-a-week\'%o-two&"up&&walled\'%eekly\'%icket("ld\'$orld&&yearly%)/four-day%%cliff%#day',
+    '%$ness$$fall%#ore$&onines#&iftily$+ller-writer$(slington$"ty#,oat-gripping&#ier\'$ness$,cket-shuttle$!e$$mbie&*ocythaemia',
+    '\'\'spondin$*ttle/pitch$+ugh-draught()fastening(#out(%roads(%space\'$fall\'!n\'#way$%w-ins%#in\'\'\'g-knife)&spears%&n-away',
+    '%%sters#&u-body$$nton$%penny$(st-fault#&ybergh""uc#+d-thud-thud$"dy#!e$!l#%gging#$lean#!m$%bless',
+    '$\'p-thump#\'nderbay\'%heart\'$sley$#ked$+ovsk&aacute#$rian%$bles$%leigh&%stone$"s.%-day-to-sunday("s.%&taston&"in',
+    '"%wacks$&itesii"#yer$$stes#*melaeaceae$&idine/$(opoiesis##nge##rde$!e$)oidectomy%\'pentone$#sus$"us#*siachromis',
+    '"%amzon#$nawa##ret""b.#!a#!b$#ers%"ts$!y##eri&"an#%idabo#%orium#%urcio"\'cehurst',
+    '%!h$%atape$$erty%(t-broker\'*collectors&&holder&&master&#one&"s.&"ty$#nor"%dally$$rren#&e-free%$mark',
+    '%&washed$#nde%#ham$$smen#&ied-up#$y-up$#big"&e-knot$$line$)molecules$$offs##dje#!f#"gs##ing',
+    '##nan$(drebeogo$"ie$#tos#$pins#&rceron#%tjens"+ger-striped%$lily%$nach&#uts#*glywinkles$(y-winkle#\'hetning$\'t-jawed',
+    '(%uthed&%ropes%$knit%,ly-shuttered#%ranes$\'ean-led#$well"$jani"(khomirov"#lak#&beurgh#"de#\'e-works$#ans$!n',
+    '$&erized$(icoultry%%ngdon%"on$%manns$$yorn#)t-hammers$!y"$mavo#%bales$*er-cutting\'%faced\'%lorry\'\'scented\'%trees',
+    '&)s/student&#top$$uctu#&e&lcub$#(s)$"-1%(activity&)nd-a-half)(distance%$ball&%udget%&coding\')nstrained%\'deictic&(imension',
+    '%$fuse%$gaps%(horizons%)intervals%\'killing%)measuring%,proportional(#ven%\'removed\'&versed%(specific&&tamped*#ing\'#eps&(ymmetric',
+    '&&rended\'%ouble%%value*!s\'\'riation%$wise$#.it$&/space$$_but%\'to_time$$code$$kept$%lines$&points$%s/cbs',
+    '%%aving%#lot%$pans$!t%%abler#-i&scedil;oara$!s##lyn#!m$"is$(s/thames#)orousness$)thy&mdash%!i$#udi',
+    '#&panist#%sbury"-n&uacute;viel#&-based%&earing$&hatted$%miner)!s$#tin%%opped#!c$&hebrai$&upping#$dill#$elli',
+    '%#kok$$eing%!y$$ible$#ley#$king$%lings$!y##man#$neas%!y#%sashe$"on#-tinnabulation$"on',
+    '#"us#%yterm"#ons"%p-cat##cat#$lady##ner#\'permuir$#ler"$rane#$butt#%ionfa#$kane##ley#"on',
+    '$"ic$!y#$uneh$$pati"$shri#%sanes$$eran(!t$!u%%e-tek(#hin&"s."%tan-4%!o$!r',
+    '#&honius##ien##le-&$like#"ma$$ouse#$rant%%table&!e$\'imetric##ted%%rings#&ularly$!p#"yo',
+    '#\'oli/fsm"$xall"$zona!(jaebourg"\'erssens"%ibaou"!u!"k1"(atchenko"!r"!s!$lali#%xcala"!e#$mcen',
+    '"%34020"#502"!b""pf".rtc-conjugated"\'s320c3x"!x!#n10""24""34"!4"!6"!9""a0""f-',
+    '##his#\'move(c)#$this"#.be""13"$:the"%_each##say#$time"$acks##der$"ie&!d$#let#$libi',
+    '"-bacco-farming#$gyal#$iads#&lerone#"ok#\'ramycin#!s##utt"#cas##has#\'ikiston##k-h$#mal#"ra"-day-sponsored',
+    '%*/yesterday#\'delling$#ies$\'lerhood$!s"&e-nail#%nnies"+ffee-apples#!i$#eld#%ranil"\'ga-like##eth#$noni#"oi',
+    '$!s"$hill#!o$"ku"&ilings#"mi##ngs#"ty")kay-pinot#,en-reflexive/!s%#ist#!i##las#!o',
+    '"#lai#$bert#)edo-based#%hurst#&kachov$#ein#\'l-booth&&ridges%&houses$%booth$&esbury$%house$$iday%!e$0mien-schlichting',
+    '##olo#-stoy/daughter#!u"/m&aacute&scaron1*;sk&aacute#*-all-alone#&ahtoes$"so&!n$)to-shaped$%ytoes#&b-like%(painting%\'robbers$#olo',
+    '%"ys$.stone-memorial#!i$*matsu-sato$#ney$!o#$kiss$"yn#!m$!o%%tiids$!s##omi$$naga$#row',
+    '$!v##paw$"ot"0nbridge-hastings##dal#\'e-poems%\'shaping$$call$$gawa#"fa#$gans%$riro%$tapu$"es$$king',
+    '\'$like\'&shaped\'\'twister#&ically#"le#\'mlinson#"na$#ers$!o#"yu"*o-frequent$%hasty$!i$&narrow$%vivid',
+    '##dle&#-oo&!s#&l-shed$%boxes$$case$%kit/2$%s.h++#$tell$&h-ache\'\'nd-nail&\'brushes&\'rotting&\'sucking%%marks',
+    '$#led&!s$!y##vey"$p-20$$deck%#ogs$%eight$%flite%#our%#ull$$half%#ole$\'knotted$&ropers',
+    '(#ing%#pec%%torey$\'winning#\'/bottom#$azes#$cats##ers#%heavy##ic-%)alization%\'s-based$$nski#)ographics$&isomer',
+    '$\'nymical#$sell%!y$&pinner$&tation$&y-like#$view"$ques%%ville""r\'#$bane$$jorn#\'ch-like%!y#$doff',
+    '$!n#"ga#$ibio#&marton#\'nabuoni$%ewton%!y$#rak$"sk##ous#*pedo-boats*%mbers$$idly#$quey##ran',
+    '\'"or$#ini%$zone$!s#(sionally$#ney#"t.$\'icollis%%ously$#oal%\'iselike(+shell-style$&uosity##ver#$wood',
+    '#,y-supporting"%scano#"ea#(hiba-ibm%$tada#!k#"sa##tes"$taig$"le%%istic&\'tarians&%zable\'"es%,ly-symmetric',
+    '&$pole#(ipotency#$land$"ey#\'tenham2%%rdown&%idges&!y$!s"\'uch-dry&%leger&&me-not&"up%%board#&manoff',
+    '#$rain$%ettes\'$isms$$isme&#tes$\'niquets%#ois$$tour#+sled-haired$&tounes#*t&eacute;e$)_de_suite"#vil"&w-away$%level',
+    '#&ednack$\'l-dried%$ette%!l$&r-tops%&blocks%$mill##hee#-n-and-country%\'by-town%(planners$$drow%\'wellers$"es$*ley/stroud',
+    ')*watchmaker("ii%$list##ser$"on""xi$$cant#&ophily"(y-making$%sized#!a#!i#%ohiko$$logy#&s-r-us',
+    '!$pc-d"!h""mc!!q"!2!*r&auml;ume#(eacute;s+"or-!s""20""6s"#794"&abaldo&%hista\'!o',
+    '$\'zonspor#!c$)ey-elaine$&hinian%*yte-basalt$)ing-house$\'k-gangs%%balls$$tor-((handling($path$"ys#*de-a-plane&*distorting&%names',
+    '&&routes&%track%%d-off(&ptions%\'marking%$wind$#in\'&&g-post%/tionally-styled#(ebecular#+ffic-choked)&logged(*generating(&safety)\'topping',
+    '#\'il-bike%&.label&#num%(er-cover($load\'#ing$)n-builder-!s&\'drivers&$load%+er-training%-ing/education(!s$-t&eacute;-loi%#eur',
+    '#-lee/mullingar#(m-driver$$bone$-en-exhalation&!s$"p.%#ish$&waymen#%nnies$(quillise$/s&ndash;pennine%\'-amazon&(cameroon(&ucasus&&jordan',
+    '\'\'easonal(%xuals\'$port&%wales%)abdominal&0ction-processing,(specific+4s-plus-precautionary)%vates&)vantgarde%&baikal%-cendentalists."ly&!o&&ribers',
+    '%\'ductive%\'ferred.&&igures&%luent&0ormants/&micro;g',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_37 = (
+count_37 = 6694
+
+heads_37 = (
     'paunches',
-    'paunchiness',
-    'pauntley',
-    'pauperes',
-    'pauperisation',
-    'pauperized',
-    'paus.',
-    'pav&eacute',
-    'pava',
-    'pavannes',
-    'pavelka/gots',
-    'pavennes',
-    'paviland',
-    'pavior',
-    'pavlick',
-    'pavlovich',
     'pavol',
-    'pavonia',
-    'pavshtiks',
-    'paw-paws',
-    'paw-prints',
-    'pawlett',
-    'pawlicki',
-    'pax-1',
-    'pax-3',
-    'pay-and-display',
-    'pay-as-you-learn',
-    'pay-cheque',
-    'pay-cuts',
-    'pay-masters',
-    'pay-rates',
-    'pay-rise',
     'pay-rolls',
-    'paybook',
-    'paydesk',
-    'payford',
-    'paygir',
-    'paying.',
-    'payment(s)',
-    'paynote',
-    'payscales',
-    'paytine',
-    'pazour',
-    'pazzaglia',
-    'pazzazz',
-    'pazzo',
-    'pb800',
-    'pbb',
     'pbg3',
-    'pblcat3',
-    'pbn',
-    'pbr',
-    'pbs-0.05%',
-    'pbs/10%',
-    'pby-6a',
-    'pc(a)',
-    'pc-420x',
-    'pc-5',
-    'pc-5s',
-    'pc-cai',
-    'pc-hornet',
-    'pc-lan',
-    'pc-tvs',
-    'pc-users',
     'pc-xremote',
-    'pc-xt',
-    'pc.2',
-    'pc/2e',
-    'pc/ms',
-    'pc1',
-    'pc110',
-    'pc1512',
-    'pc2',
-    'pcc4',
-    'pcexpress',
-    'pch',
-    'pchd',
-    'pci-based',
-    'pckeg',
-    'pcr-amplified',
     'pcr-generated',
-    'pcr/slidewriter',
-    'pcr252',
-    'pcr400',
-    'pcsr',
-    'pcte-based',
-    'pcvs',
-    'pcw8256',
-    'pcws',
-    'pczf20',
-    'pd3',
-    'pd5',
-    'pd780',
-    'pdch',
-    'pdcs',
-    'pde1',
     'pde2',
-    'pdgf-induced',
-    'pdls',
-    'pds-10',
-    'pdsl',
-    'pe&ntilde;aranda',
-    'pea-flowers',
-    'pea-shooters',
-    'peace-makers',
-    'peace-offerings',
-    'peace-scotland',
-    'peace-seeking',
-    'peace-treaties',
-    'peaceniks',
-    'peach-toned',
-    'peacham',
     'peachnut',
-    'peacock-coloured',
-    'peacock-feathered',
-    'peacocke',
-    'peak-capped',
-    'peak-hours',
-    'peakedness',
-    'peakiness',
-    'peaklets',
-    'peaple',
-    'pearcey',
-    'pearl-divers',
-    'pearl-handled',
-    'pearl-inlaid',
-    'pearlyman',
-    'pearmain',
     'pearmains',
-    'pearnel',
-    'pearper',
-    'pearson-jones',
-    'peas.',
-    'peasanty',
-    'peat-bogs',
-    'peat-coloured',
-    'peat-stacks',
-    'peat-swamp',
-    'peaudouce',
-    'pece',
-    'pecho',
-    'peckers',
-    'peckoltias',
-    'peckwater',
     'peco',
-    'pecorari',
-    'peculiar-looking',
-    'pederick',
-    'pediatricians',
-    'pedipalp',
-    'pedipalps',
-    'pedlow',
-    'pedologic',
-    'pedology',
-    'pedon',
-    'pedralbes',
-    'pedras',
-    'pedrena',
-    'pedunculated',
-    'pee\'erheed',
     'peech',
-    'peee-yoo',
-    'peel-tower',
-    'peela',
-    'peeled-off',
-    'peelin\'',
-    'peep-holes',
-    'peepbo',
-    'peepers',
-    'peepul',
-    'peerson',
-    'peevishness',
-    'peganina',
-    'pegger',
-    'peggetz',
-    'peghead',
     'pehn',
-    'peine',
-    'peintures',
-    'peisistratidai',
-    'pejoratives',
-    'pekineses',
-    'pekingese',
-    'pekingeses',
-    'pekings',
-    'pekkarinen',
-    'pelagia',
-    'pelagicus',
-    'pelargic',
-    'pelenna',
-    'pelennor',
-    'peles',
     'pelesh',
-    'peleus',
-    'pelgrin',
-    'pelham-holles',
-    'pelike',
-    'pelizzoni',
-    'pelkey',
-    'pelkosenniemi',
-    'pelletiser',
-    'pelligrino',
-    'pellow',
-    'pellucidly',
-    'peloponese',
-    'pelseneer',
-    'pemble',
-    'pembrooke',
     'pemmican',
-    'pemphigoid',
-    'pemphigus',
-    'pen-drivers',
-    'pen-knife',
-    'pen-portrait',
-    'pen-up',
-    'pen-y-dyffryn',
-    'penale',
-    'penalisation',
-    'penalities',
-    'penally',
-    'penaltriusm',
-    'penalty.',
-    'pencil-slim',
-    'pencoed',
     'pencombe',
-    'pencreatic',
-    'pencz',
-    'pendency',
-    'pendens',
-    'pendley',
-    'pendolino',
-    'pends',
-    'pendulum-regulated',
-    'pendulum-type',
-    'penecontemporaneous',
-    'peneda',
-    'peneplanation',
-    'penestai',
-    'penetrator',
-    'pengold',
     'penguin.txt',
-    'penha',
-    'penhow',
-    'penine-hart',
-    'penis-envy',
-    'penitently',
-    'penlington',
-    'penllyn',
-    'pennanians',
-    'pennanted',
-    'pennard',
-    'penned-in',
-    'pennino',
-    'pennon',
-    'pennydaryn',
-    'pennyfarthing',
     'pennyfeather',
-    'pennymead',
-    'pennymuir',
-    'pennyworths',
-    'penologist',
-    'penparcau',
-    'penpushers',
-    'penrhyndeudraeth',
-    'penroses',
-    'pens&eacute;e',
-    'penser',
-    'pensiamo',
-    'penstemons',
-    'penta-acetate',
-    'penta-acetic',
-    'pentacles',
     'pentad',
-    'pentadactyl',
-    'pentafluoride',
-    'pentameric',
-    'pentapolis',
-    'pentekonters',
-    'pentelicus',
-    'penteon',
-    'penter',
-    'penti',
-    'pentium-',
-    'pentium-upgradable',
-    'pentothal',
-    'penty',
-    'penuelas',
-    'penvbam/cla',
     'penybont',
-    'penycae',
-    'penydarren',
-    'penygraig',
-    'penza',
-    'penzler',
-    'peopeo',
-    'people-friendly',
-    'people-management',
-    'people-power',
-    'people-situations',
-    'peopler',
-    'pepper-mill',
-    'pepperberg',
-    'pepsi-colas',
-    'peptic-tryptic',
     'peptidoleukotrienes',
-    'per&scaron;t&yacute;n&ecaron',
-    'per-period',
-    'per-share',
-    'per/tri',
-    'perahia',
-    'perak',
-    'perampam',
-    'percents',
-    'perception.',
-    'perch&egrave',
-    'perchanced',
-    'percheries',
-    'perchery',
-    'percivale',
-    'percomex',
     'percula',
-    'perde',
-    'perdido',
-    'perdreau',
-    'perdus',
-    'perea',
-    'pereda',
-    'pereires',
-    'perenially',
-    'peretz',
-    'perez-diaz',
-    'perfectionistic',
-    'perfectors',
-    'perfilyev',
-    'perfitt',
-    'perfomance',
     'perforate',
-    'perforator',
-    'performable',
-    'performamce',
-    'performance-bound',
-    'performance-enhanced',
-    'performance-friendly',
-    'performance-intensive',
-    'performance.',
-    'performer-composers',
-    'pergammon',
-    'perh',
-    'pericellular',
-    'periclimenes',
-    'pericopes',
-    'peridot',
     'perie',
-    'periera',
-    'perigastric',
-    'perihelia',
-    'perikli',
-    'perinatally',
-    'period\'',
-    'periosd',
-    'periwinkle-blue',
-    'perjurers',
-    'perkal',
-    'perlin',
-    'perlocution',
-    'permafax',
-    'permanent/temporary',
-    'permas',
     'permed/chemically',
-    'permesso',
-    'permet',
-    'permfax',
-    'permian/triassic',
-    'permis',
-    'permissibility',
-    'permission-seeking',
-    'permitabs',
-    'pernem',
-    'pernilla',
-    'peroctylated',
-    'peronista',
-    'peroperatively',
-    'peroral',
-    'peroxidase-labelled',
     'perp&eacute;tue',
-    'perpaduan',
-    'perpetuals',
-    'perpetuo',
-    'perplexingly',
-    'perreira',
-    'perrera',
-    'perro',
-    'perronet',
-    'perry/oxfordshire',
-    'perryn',
-    'perrys',
-    'persecutio',
-    'perserverance',
-    'pershore/worcestershire',
-    'persian-held',
     'persicae',
-    'persico',
-    'person-hours',
-    'person-power',
-    'person.',
-    'person/neighbour',
-    'personal-impersonal',
-    'personal-investment',
-    'personal/group',
-    'personalistic',
-    'personality-based',
-    'personality.',
-    'personally.',
-    'personations',
-    'personell',
-    'personne',
     'personnel-carriers',
-    'personnel/staff',
-    'perspective\'',
-    'perspicaciously',
-    'perspicillata',
-    'perstorp',
-    'persuing',
-    'persulphates',
-    'pertechnetate',
-    'pertemps',
-    'perth-born',
-    'perth/borders',
-    'pertinaciously',
-    'pertness',
-    'pertsey',
-    'pertunda',
     'pertussin',
-    'perucho',
-    'pervaiz',
-    'perverseness',
-    'perviest',
-    'pery',
-    'pesatori',
-    'pesch',
-    'pescheor',
-    'peschiere',
-    'peskett',
-    'pessagno',
-    'pessoal',
-    'pest-controllers',
-    'pest-free',
-    'pest-resistant',
     'pestalozzian',
-    'pestano',
-    'pestell',
-    'pet&eacute;n',
-    'pet-names',
-    'pet-shops',
-    'petal-like',
-    'petcare',
-    'peterburg',
-    'peterchurch',
-    'peterchurch/herefordshire',
-    'peteris',
-    'petersbourg',
-    'petersfield-liphook',
-    'petersmeyer',
-    'petilius',
     'petits-fours',
-    'petko',
-    'petley',
-    'petlyura',
-    'petone',
-    'petosku',
-    'petraea',
-    'petrarcha',
-    'petrauskas',
-    'petree',
-    'petriana',
-    'petric',
-    'petrick',
-    'petrid&egrave;s',
-    'petrides',
-    'petrik',
     'petrikirche',
-    'petrinja',
-    'petrock\'s-on-sea',
-    'petrofabric',
-    'petrofsky',
-    'petroglycan',
-    'petrol-guzzling',
-    'petrol-like',
-    'petrol-station',
-    'petrologically',
-    'petromyzontiformes',
-    'petronas',
-    'petrone',
-    'petrova/interpreter',
-    'petrovi&cacute',
-    'petrovichi',
     'pets.',
-    'petshops',
-    'petten',
-    'pettiford',
-    'petto',
-    'pettulian',
-    'petty-fitzmaurice',
-    'peucker',
-    'peukestas',
-    'peulh',
-    'peural',
-    'pevnost',
-    'pevrf0',
-    'pevrolensky',
-    'pew-like',
-    'pew/careers',
     'pewterish',
-    'peysner',
-    'peyto',
-    'pezzo',
-    'pf1/5',
-    'pf1/delete',
-    'pf1/down',
-    'pf1/pf3',
-    'pf1/up',
-    'pf4',
-    'pf400',
-    'pfarrer',
-    'pfffttt',
-    'pfleiderer',
-    'pforzheimer',
-    'pfrs',
     'pfs16',
-    'pfs:first',
-    'pfz',
-    'pg-380',
-    'pg/100',
-    'pg/hr',
-    'pgem-7zf(+)',
-    'pgem3',
-    'pgem7',
-    'pgex-3xgal4',
-    'pgex-atf1',
-    'pgf2',
-    'pggos',
-    'pgt',
-    'ph&oelig;nicis',
-    'ph/',
     'ph5.0',
-    'ph6',
-    'ph6.0',
-    'ph7.1',
-    'ph7.5',
-    'phacochoerus',
-    'phad',
-    'phaeon',
-    'phaeopus',
-    'phaestos',
-    'phaetons',
-    'phagocytosed',
-    'phailes',
-    'phalangeal',
-    'phalese',
-    'phalli',
     'phallocentrically',
-    'phanariot',
-    'pharisaical',
-    'pharmaceuti&rehy;cally',
-    'pharmacie',
-    'pharmacien',
-    'pharmingen',
-    'pharnakes',
-    'phase-modulated',
-    'phase-one',
-    'phase.locked.loop',
-    'phasenko',
-    'pheby',
-    'phelips',
-    'phen&eacute',
-    'phenom',
     'phenotype.',
-    'phenylbutazone',
-    'phenylmethylsulphonyl',
-    'pheobe',
-    'pheromone-based',
-    'pheromone-releasing',
-    'phewa',
-    'phi-scores',
-    'phigs+',
-    'philadelpheia',
-    'philadelphians',
-    'phildrew',
-    'philhellenism',
-    'philibeg',
-    'philibert',
-    'philip-augustus',
     'philippic',
-    'philippines-us',
-    'philipsharon',
-    'phillipines',
-    'phillippines',
-    'phillips-lipsey',
-    'phillips/local',
-    'philochorus',
-    'philoi',
-    'philomachus',
-    'philopator',
-    'philosophare',
-    'philosopher-king',
-    'philosopher-scientists',
-    'philosophically.',
-    'philosophised',
     'philosophres',
-    'philosophy\'',
-    'philosophy.',
-    'philosphical',
-    'philpin',
-    'philpstoun',
-    'philthy',
-    'philypsus',
-    'phinsley',
-    'phipps/managing',
-    'phl',
-    'phlebography',
-    'phlegm/lightning',
-    'phlogopites',
-    'phlomis',
-    'phlx',
     'phm',
-    'phobian',
-    'phocoenidae',
-    'phokaians',
-    'phokylides',
-    'phone-based',
-    'phonebooks',
-    'phonetic/phonological',
-    'phonograms',
-    'phonological-to-orthographic',
-    'phonologies',
-    'phonotactic',
-    'phormidium',
-    'phormos',
-    'phosferine',
-    'phosopholipid',
     'phospho-enzyme',
-    'phosphocarrier',
-    'phosphoinositides',
-    'phospholipis',
-    'phosphoprotein',
-    'phosphoproteins',
-    'phosphor-coated',
-    'phosphoramidite',
-    'phosphotungstic',
-    'phospray',
-    'photo-booth',
-    'photo-cds',
-    'photo-cells',
-    'photo-feature',
-    'photo-finishes',
-    'photo-mural',
     'photo-passes',
-    'photo-posters',
-    'photo-realistic',
-    'photo-reduce',
-    'photo-stories',
-    'photo-typesetters',
-    'photocatalytic',
-    'photocurable',
-    'photodetector',
-    'photoexcitation',
-    'photogeological',
-    'photograms',
-    'photoioniser',
-    'photokina',
-    'photolytic',
-    'photomechanical',
     'photometrically',
-    'photomicroscope',
-    'photon-correlation',
-    'photoperiodism',
-    'photopia',
-    'photopieces',
-    'photoresponse',
-    'photosensitisation',
-    'photoset',
-    'photosphere',
-    'photosynthesizers',
-    'photosynthetically',
-    'phrase-structure',
-    'phraseologies',
-    'phrenic',
-    'phries',
     'phsophate',
-    'phthalate',
-    'phulchung',
-    'phung',
-    'phurba',
-    'phworr',
-    'phyletically',
-    'phyliss',
-    'phyll',
-    'phyllo',
-    'phyllograptus',
-    'physalia',
-    'physarum',
-    'physical-human',
-    'physicalists',
-    'physically-associated',
     'physically.',
-    'physics/chemistry',
-    'physiochemical',
-    'physiognomical',
-    'physiognomies',
-    'physiognomists',
-    'physiographical',
-    'physog',
-    'phyto-oestrogens',
-    'phytochrome',
-    'phytophagous',
-    'phytophagy',
-    'phytoseiulus',
-    'phywe',
-    'pi&mdash;test.exe',
-    'pi&ntilde;er&uacute;a',
     'pi-mesons',
-    'pi3\'',
-    'piangete',
-    'piano-accordion',
-    'pianovka',
-    'pianto',
-    'pianure',
-    'piasten',
-    'piastre',
-    'picam-1',
-    'picarda',
-    'picassoesque',
-    'picayune',
-    'piccie',
-    'piccolos',
-    'pich',
     'pichard',
-    'pichi',
-    'pick\'em',
-    'pick\'n\'mix',
-    'pick-a-back',
-    'pick-up-point',
-    'pick-up2',
-    'pickenham',
-    'pickerel',
-    'pickeridge',
-    'pickguard',
-    'picking/association',
-    'pickoff',
-    'picky-picky',
-    'picoplankton',
-    'picornell',
     'picosecond',
-    'picric',
-    'picter',
-    'picters',
-    'pictish-northumbrian',
-    'pictogen',
-    'picton/thames',
-    'picturability',
-    'picturable',
-    'picture-based',
-    'picture-story',
-    'picture-strips',
-    'pictures/abi',
-    'pictures/gloucester',
-    'pictures/northampton',
-    'pictures/oxford',
     'pictures/simon',
-    'pictures/swindon/wiltshire',
-    'picturings',
-    'picus',
-    'piddinghoe',
-    'piddles',
-    'piddly',
-    'piddock',
-    'pidgins',
-    'pie-noir',
-    'piece-goods',
-    'piece-walker',
-    'pieck',
-    'pied_&agrave_terre',
-    'pied_a_terre',
-    'pienaaar',
     'pierburg',
-    'piercarlo',
-    'piercea',
-    'piercefield',
-    'pierheads',
-    'pieri',
-    'pieroni',
-    'pierre-aux-monts',
-    'pierre-charles',
-    'pierre-clavier',
-    'pierre-damien',
-    'pierre-gilles',
-    'pierre-montan',
-    'pierrefonds',
-    'pierrehumbert',
-    'pierrots',
     'pietatis',
-    'pietersburg',
-    'pietie',
-    'pietraszek',
-    'pietrovskiy',
-    'piffaro',
-    'pig-in-a-poke',
-    'pig-killings',
-    'pig-pens',
-    'pig-sticker',
-    'pig.',
-    'pig/human',
-    'pigeons.',
-    'piggledy',
-    'piggybacking',
-    'pigman',
     'pigment-to-binder',
-    'pigmenti',
-    'pignataro',
-    'pignatti',
-    'pigott-smith',
-    'pigs.',
-    'piguet',
-    'pihigia',
-    'pika',
-    'pike/glenda',
-    'piks',
-    'pilaus',
-    'pilckem',
-    'pilgrim-tellers',
-    'pili',
-    'pilibossian',
     'pilkou',
-    'pill-takers',
-    'pill/oxfordshire',
-    'pilley',
-    'pilling/director',
-    'pillions',
-    'pillitteri',
-    'pillowy',
-    'pilo-erection',
-    'pilocarpine',
-    'pilot-induced',
-    'pilot-study',
-    'pilotless',
-    'pilotta',
-    'pilsden',
-    'pilsey',
     'pilsworth',
-    'piltocks',
-    'pimelodid',
-    'piment',
-    'pimhill',
-    'pimpernels',
-    'pimpinellifolia',
-    'pin-14',
-    'pin-curled',
-    'pin-cushions',
-    'pin-high',
-    'pin-jointed',
-    'pin-outs',
-    'pin-tucks',
-    'pina_colada',
-    'pinafore-clad',
     'pinan',
-    'pinaster',
-    'pincanheale',
-    'pinch-waisted',
-    'pinchable',
-    'pincham',
-    'pinchgut',
-    'pinck',
-    'pincock',
-    'pincurls',
-    'pindaric',
-    'pindos',
-    'pine-fringed',
-    'pine-panelled',
-    'pine-shaded',
-    'pine-trees',
     'pine-trunks',
-    'pingala',
-    'pingos',
-    'pingu',
-    'pinguli',
-    'pingy',
-    'pink-and-grey',
-    'pink-backed',
-    'pink-clothed',
-    'pink-muslin',
-    'pink-skinned',
-    'pink-toned',
-    'pink/green',
-    'pink/purple',
-    'pinkas',
-    'pinkertons',
     'pinkish-green',
-    'pinkish-white',
-    'pinless',
-    'pinmei',
-    'pinnace',
-    'pinnacle-1',
-    'pinnatum',
-    'pinned-up',
-    'pinsky',
-    'pint/300ml',
-    'pintade',
-    'pinto-duschinsky',
-    'pintos',
-    'pioche',
-    'pioggia',
-    'pions',
     'pipe-cleaners',
-    'pipe-like',
-    'pipe-lines',
-    'pipebridge',
-    'piperaceae',
-    'pipette.',
-    'pipeyard',
-    'pipings',
-    'pippert',
-    'pira-pirana',
-    'pirgos',
-    'pirin',
-    'piriou',
-    'pirnie',
-    'piro',
-    'pirogov',
     'pirogue',
-    'piron',
-    'pirotte',
-    'pirozollo',
-    'pirro',
-    'pisa.',
-    'pisanosaurus',
-    'piscataway',
-    'piscium',
-    'pish',
-    'pisky-mazed',
-    'piss-artist',
-    'piss-heads',
-    'piss-holes',
-    'piss-up',
-    'piss-ups',
     'pissoir',
-    'pistol-whipped',
-    'pistolet',
-    'pistolier',
-    'piston-like',
-    'piston-stroke',
-    'pistoxenos',
-    'pisum',
-    'pit-like',
-    'pit-owners',
-    'pit-pat',
-    'pita',
-    'pitaka',
-    'pitchback',
-    'pitching-wedge',
-    'pitchmen',
     'pitchshifter',
-    'pite&scirc;ti',
-    'pitha',
-    'pitman/formerly',
-    'pitoeff',
-    'pitra',
-    'pits.',
-    'pitsa',
-    'pitsford',
-    'pitt/prison',
-    'pittam',
-    'pittances',
-    'pittanga',
-    'pittermann',
-    'pitteville',
-    'pittore',
     'pittoresque',
-    'pittori',
-    'pitts-buggers',
-    'pittses',
-    'pitville',
-    'pivetta',
-    'pixel-by-pixel',
-    'pixelvision',
-    'pixie-faced',
-    'pixie-like',
-    'pixieish',
-    'pixofoto',
-    'pixote',
-    'pixton',
-    'pizza-style',
-    'pizzarello',
     'pj-the',
-    'pjc-1',
-    'pkp',
-    'pl&eacute;iade',
-    'pl.26',
-    'pl1',
-    'placarded',
-    'place-holder',
-    'place-kicks',
-    'place-mats',
-    'place-setting',
-    'placeman',
-    'placemats',
-    'placement-related',
-    'plackett',
-    'placozoans',
     'plagiary',
-    'plaguy',
-    'plaidy',
-    'plain-vanilla',
-    'plaines',
-    'plaisant',
-    'plamenatz',
-    'plan&eacute;tarium',
-    'planarlipid',
-    'planchart',
-    'plane-makers',
-    'plane-symmetric',
-    'planet-forming',
-    'planet-sized',
-    'planetesimal',
-    'planetfall',
     'planetful',
-    'planetology',
-    'plangently',
-    'planiscapus',
-    'planisphere',
-    'plannin\'',
-    'planning/scheduling',
-    'planpincieux',
-    'plant-animal',
-    'plant-by-plant',
-    'plant-like',
-    'plant-man',
-    'plant-pots',
-    'plant-soil',
-    'plant-specific',
-    'plantin\'',
     'plantless',
-    'plantships',
-    'plantsmen',
-    'plantswoman',
-    'plantulae',
-    'plaque-free',
-    'plasma-derived',
-    'plasmalemmal',
-    'plasmid-borne',
-    'plasmodesmata',
-    'plaster-covered',
-    'plastic-lined',
-    'plastic-wrapped',
-    'plasticizer',
-    'plasticizers',
-    'plastiface',
     'plastiform',
-    'plastigraft',
-    'plastimo',
-    'plastochron',
-    'plastron',
-    'platanoides',
-    'plate-layers',
-    'plateau-ish',
-    'plateauing',
-    'plated-through-hole',
-    'plateless',
-    'platelet-surface',
-    'platense',
-    'platform-soled',
-    'platforms.',
-    'platinated',
     'platinum-based',
-    'platinum-blond',
-    'platinum-coated',
-    'platinum-free',
-    'platinum-rich',
-    'plattitudes',
-    'platyhelminths',
-    'platypodium',
-    'platys',
-    'plausences',
-    'plavis',
-    'plaxton',
-    'play&ndash;groups',
-    'play-',
-    'play-acted',
-    'play-anywhere',
     'play-money',
-    'play-readings',
-    'play-room',
-    'play-scripts',
-    'play-throughs',
-    'playboard',
-    'playbook',
-    'playbuses',
-    'played-out',
-    'players.',
-    'playfellow',
-    'playin',
-    'playings',
-    'playparks',
-    'playpens',
-    'playscripts.',
     'plaza-toro',
-    'pleasant-tasting',
-    'pleasingness',
-    'pleasure-craft',
-    'pleasureboat',
-    'pleasurewood',
-    'pleb',
-    'plecos',
-    'pleeese',
-    'plees',
-    'pleione',
-    'pleiotropism',
-    'plen',
-    'plenary-style',
-    'pleni',
-    'plensa',
     'plerogyra',
-    'plestin-les-greves',
-    'plethysmographic',
-    'pleuritic',
-    'pleuro-pneumonia',
-    'pleurosternals',
-    'pleurote',
-    'pleurotes',
-    'plex',
-    'plexiform',
-    'pleyel',
-    'pliability',
-    'pliancy',
-    'plicata',
-    'plimmer',
-    'plimmies',
     'plitvice',
-    'plo-syrian',
-    'plo-us',
-    'ploddingly',
-    'plodging',
-    'ploegsteert',
-    'plompton',
-    'plon-plon',
-    'plonney',
-    'ploonk',
-    'plornishes',
-    'plotline',
-    'plotlines',
-    'plotparm',
-    'plough-tip',
-    'ploughed-back',
     'ploughed-out',
-    'ploughings',
-    'plouviez',
-    'plowd.',
-    'plowing',
-    'ployer',
-    'pluars',
-    'pluckily',
-    'plug-fouling',
-    'plug-ins',
-    'plumbings',
-    'plume-lithosphere',
-    'plume-related',
-    'plumley',
-    'plummeted.',
-    'plump-faced',
     'plumpest',
-    'pluna',
-    'plunderings',
-    'pluralize',
-    'plus-point',
-    'plus-points',
-    'plus-twos',
-    'plusbus',
-    'pluserix',
-    'plusky',
-    'plutarco',
-    'plutonimum',
-    'plutus',
-    'plyboard',
-    'plympton',
-    'plyometrics',
     'plyss',
-    'plywoods',
-    'plz',
-    'pm&ndash;4.15',
-    'pma5edcms',
-    'pmd',
-    'pmest',
-    'pmh',
-    'pmlc2at',
-    'pmmlib.gimmsdigfile1',
-    'pmmlib.gimmsjob1',
-    'pmmlib.gimmspoly1',
-    'pmmlib.gimmstatdat',
-    'pmn',
-    'pmol/l/',
-    'pmol/mg',
     'pmos',
-    'pmt2-transfected',
-    'pnda',
-    'pneumatically',
-    'pneumococcus',
-    'pneumocystic',
-    'pneumohydraulic',
-    'pneumoperitoneum',
-    'pneumothoraces',
-    'pnnt',
-    'pnqs',
-    'pns',
-    'po-ti-ni-ja',
-    'po19',
-    'po2',
-    'po20',
     'poaches',
-    'poage',
-    'poari',
-    'pobeda',
-    'pocahontas',
-    'pocahontas-kentucky',
-    'pochade',
-    'pock-marks',
-    'pocket-books',
-    'pocket-breaches',
-    'pocket-handkerchief',
-    'pocket-knife',
-    'pocketbond',
-    'pocketfuls',
-    'pocketmoney',
-    'pockett',
     'podding',
-    'poddington',
-    'podia',
-    'podiatrist',
-    'podimore',
-    'podiums',
-    'podolski',
-    'podophylline',
-    'podsols',
-    'poeck',
-    'poel',
-    'poemes',
-    'poet-composer',
-    'poet-writer',
-    'poetesses',
-    'poetica',
     'poeticization',
-    'poeticizing',
-    'poetick',
-    'poetry.',
-    'pogace',
-    'pogliaghi',
-    'pogo-stick',
-    'pogonophorans',
-    'pogradec',
-    'pogram',
-    'pohamba',
-    'pohang',
-    'pohjola',
-    'poignance',
-    'poins',
-    'point-and-shoot',
     'point-to-pointer',
-    'point-to-pointing',
-    'pointed-top',
-    'pointered',
-    'pointilliste',
-    'pointman',
-    'pointner',
-    'poir&eacute;e',
-    'poison-spurs',
-    'poisonous-looking',
-    'poite',
-    'poked-out',
-    'poker-like',
-    'pokka',
-    'poland-germany',
-    'poland-soviet',
     'polarizer',
-    'polarizers',
-    'polaron',
-    'polarquest',
-    'polcinello',
-    'poldark',
-    'poldi',
-    'pole-pieces',
-    'poleidoblocs',
-    'polemarch',
-    'polemicize',
-    'polemos',
-    'polenov',
-    'polesden',
-    'polhemus',
-    'poliakov',
     'police-force',
-    'police-gangs',
-    'police-speak',
-    'police-style',
-    'police/army',
-    'police/public',
-    'policemnen',
-    'policmen',
-    'policy-determining',
-    'policy-watchers',
-    'policy/planning/social',
-    'policymaker',
-    'polioviruses',
-    'polish-american',
-    'polish-americans',
-    'polish-french',
     'polish-lithuanian',
-    'polish-populated',
-    'polish-speakers',
-    'politeia',
-    'political&mdash;military',
-    'political/',
-    'political/social',
-    'politically-',
-    'politically-aware',
-    'politically-controversial',
-    'politically-minded',
-    'politically-orientated',
-    'politically.',
-    'politicial',
-    'politician\'',
-    'politician-official',
     'politico-administrative',
-    'politico-cultural',
-    'politicus',
-    'politische',
-    'polizzi',
-    'poll-taxes',
-    'pollaiolo',
-    'pollard/secretary',
-    'polldubh',
-    'pollen-laden',
-    'pollenaters',
-    'pollert',
-    'pollet',
-    'pollio',
-    'pollitt/college',
-    'pollmair',
     'pollmann',
-    'polltax',
-    'pollution-sensitive',
-    'polney',
-    'polo-shirt',
-    'pols',
-    'poltergeist-like',
-    'polunin',
-    'polution',
-    'polvo',
-    'poly-carbonate',
-    'polyacrylamide/8m',
-    'polyakov',
-    'polyarchic',
-    'polybutadiene',
-    'polycarpe',
     'polycentricity',
-    'polychaetes',
-    'polychromasia',
-    'polydoras',
-    'polyelectrolyte',
-    'polyester/35%',
-    'polyethers',
-    'polyethlene',
-    'polygas',
-    'polygen/molecular',
-    'polygeny',
-    'polyglossia',
-    'polygonaceae',
-    'polygonifolius',
-    'polyhedra',
-    'polyhedron',
     'polyhedrosis',
-    'polyl:c',
-    'polymer-coated',
-    'polymerise',
-    'polymerizes',
-    'polymide',
-    'polymin',
-    'polymodal',
-    'polyneuropathy',
-    'polyoxyethylene',
-    'polypeptide(s)',
-    'polyphagous',
-    'polypharmacy',
-    'polyphonist',
-    'polypodium',
-    'polyputheketlon',
     'polyrhythmic',
-    'polyrhythms',
-    'polysacrulite',
-    'polysciences',
-    'polysided',
-    'polysynaptic',
-    'polythene-wrapped',
-    'polytone',
-    'polytropa',
-    'polyversities',
-    'polyzalos',
-    'pomagne',
-    'pomerius',
-    'pomerol',
-    'pomes',
-    'pomeshchik',
     'pomifera',
-    'pomp-rock',
-    'pompa',
-    'pompano',
-    'pomposities',
-    'pompousness',
-    'pondmates',
-    'pong-pong',
-    'ponge',
-    'poniatowska',
-    'ponns',
-    'ponsardin',
-    'pont-nedd-fechan',
-    'pont-sur-seine',
-    'pontcanna',
-    'pontchartrain',
     'pontecorvo',
-    'pontederia',
-    'pontederiaceae',
-    'ponten',
-    'ponterwyd',
-    'pontesbury',
-    'pontianak',
-    'ponticum',
-    'pontificum',
-    'pontlarge',
-    'pontprenshitw',
-    'pontrilas',
-    'pontrobert',
-    'poodorbox',
-    'pooftah',
-    'pooit',
     'pool-owners',
-    'pool-table',
-    'poolable',
-    'poole&ndash;cherbourg',
-    'pooling-of-interests',
-    'poonds',
-    'pooney',
-    'poop-poop',
-    'poop-scoop',
-    'poopathy',
-    'poopet',
-    'poor\'',
-    'poor-looking',
-    'poor-sighted',
-    'poorest-quality',
-    'poorly-drained',
     'poorly-managed',
-    'poors',
-    'poorwill',
-    'pooters',
-    'pop-group',
-    'pop-ins',
-    'pop-ons',
-    'pop-pop',
-    'pop-singer',
-    'pop-ups',
-    'popalub',
-    'popcore',
-    'popholes',
-    'poplar-lined',
-    'poplington',
-    'popoloff',
     'poppadam',
-    'poppe',
-    'poppiest',
-    'popplewells',
-    'poppy-seller',
-    'poppyseed',
-    'poprischin',
-    'popsicles',
-    'popton',
-    'popular-cultural',
-    'popular-democratic',
-    'popularisations',
-    'popularizes',
-    'populatin',
-    'population\'',
-    'populations.',
     'popullit',
-    'populnea',
-    'populorum',
-    'populum',
-    'poqetpad',
-    'porac',
-    'porblem',
-    'porcelain-mounted',
-    'porcini',
-    'pore-canals',
-    'poret',
-    'porfirio',
-    'poritt',
-    'porker',
-    'porkie',
-    'porking',
     'porkpie',
-    'porlier',
-    'porphyrogenitus',
-    'porphyrula',
-    'porpoise-like',
-    'porpus',
-    'porridgy',
-    'porringers',
-    'porsch-e',
-    'porstmouth',
-    'port-based',
-    'port-royal',
-    'port-side',
-    'porta-cabin',
-    'portacabins',
-    'portada',
     'portago',
-    'portagram',
-    'portanova',
-    'portaskog',
-    'portballintrae',
-    'portbury',
-    'portcullises',
-    'portership',
-    'porteurs',
-    'portfire',
-    'portgate',
-    'portim&atilde;o',
-    'portinscale',
-    'portio',
-    'portis',
-    'portlandite',
     'portliness',
-    'porto-novo',
-    'portora',
-    'portos',
-    'portoverde',
-    'portrait.',
-    'portsoken',
-    'portswood',
-    'portugals',
-    'portuguese-based',
-    'portuguese-influenced',
-    'portwrinkle',
-    'pos&eacute',
-    'pos&eacute;es',
-    'pos/homonym',
-    'posal',
     'posavina',
-    'posh-rat',
-    'posh-sounding',
-    'posh-talking',
-    'poshoes',
-    'posis',
-    'positive-going',
-    'positive-negative',
-    'positve',
-    'posl',
-    'possess.',
-    'possession.',
-    'possession/separation',
-    'possets',
-    'possib',
-    'possibilties',
     'possibily',
-    'possible/dial',
-    'possing',
-    'post(s)',
-    'post-16s',
-    'post-18',
-    'post-1940s',
-    'post-1977',
-    'post-1982',
-    'post-1985',
-    'post-abc',
-    'post-audited',
-    'post-beat',
-    'post-bomb',
-    'post-buses',
-    'post-college',
     'post-conviction',
-    'post-cubist',
-    'post-culloden',
-    'post-darwin',
-    'post-designation',
-    'post-development',
-    'post-disraelian',
-    'post-distributions',
-    'post-einsteinian',
-    'post-electoral',
-    'post-embryonic',
-    'post-extraordinary',
-    'post-fernando',
-    'post-fixed',
-    'post-flood',
-    'post-franks',
     'post-gatt',
-    'post-glasnost',
-    'post-harvest',
-    'post-heroic',
-    'post-horn',
-    'post-horses',
-    'post-hospital',
-    'post-houses',
-    'post-ibm',
-    'post-imf',
-    'post-imperialism',
-    'post-implementation',
-    'post-interpretive',
-    'post-its',
-    'post-kantian',
-    'post-lambing',
     'post-lexical',
-    'post-life',
-    'post-mao',
-    'post-market',
-    'post-military',
-    'post-mills',
-    'post-mounted',
-    'post-napoleonic',
-    'post-neolithic',
-    'post-nuptial',
-    'post-october',
-    'post-olympic',
-    'post-op',
-    'post-operational',
-    'post-pacific',
-    'post-pearl',
     'post-plague',
-    'post-pliocene',
-    'post-plowden',
-    'post-processor',
-    'post-processors',
-    'post-proficiency',
-    'post-psychedelic',
-    'post-recessionary',
-    'post-recombination',
-    'post-relational',
-    'post-riot',
-    'post-sale',
-    'post-show',
-    'post-structural',
-    'post-sunset',
-    'post-temple',
     'post-tour',
-    'post-tournament',
-    'post-transcriptionally',
-    'post-trauma',
-    'post-triassic',
-    'post-vatican',
-    'post-wagnerian',
-    'post-watergate',
-    'post-wfp',
-    'post-whatever',
-    'post-white',
-    'post/modernism',
-    'post/modernist',
-    'posta',
-    'postage-free',
-    'postage-paid',
     'postals',
-    'postbiblical',
-    'postcranial/cranial',
-    'postdissolution',
-    'posted.',
-    'postembryonic',
-    'poster(s)',
-    'posterdesigned',
-    'postfach',
-    'postfundoplication',
-    'postgastrectomy',
-    'postgate/british',
-    'postgenae',
-    'postgrad',
-    'posthouse',
-    'posthumus',
     'postictal',
-    'postilion',
-    'postillions',
-    'postition',
-    'postlethwaites',
-    'postlethwayt',
-    'postlip',
-    'postmodifiers',
-    'postmorten',
-    'postmultiplier',
-    'postnasal',
-    'postnik',
-    'postreceptor',
-    'postrelational',
-    'posts.',
-    'posttranslational',
     'postulants',
-    'postvagotomy',
-    'pot-bellies',
-    'pot-clay',
-    'pot-holders',
-    'pot-hunters',
-    'pot-lids',
-    'pot-luck',
-    'pot-shape',
-    'pot-shot',
-    'pot-smoker',
-    'potahtoes',
-    'potamochoerus',
-    'potamogetons',
-    'potations',
-    'potato-picking',
     'potato-sized',
-    'potatopot',
-    'potaytoes',
-    'potentially-dangerous',
-    'potentially-disastrous',
-    'potentially-harmful',
-    'potentiam',
-    'potentisation',
-    'potestate',
-    'potesti',
-    'potgietersrus',
-    'potgietersrust',
-    'pothooks',
-    'potlands',
-    'potley',
-    'potok',
     'pots-and-pans',
-    'potsdam-sanssouci',
-    'pottepei',
-    'potter-mo-get-on',
-    'potterer',
-    'pottier',
-    'pottleton',
-    'potyf',
-    'pou-homeodomain',
-    'pou-homeodomains',
-    'poubellien',
-    'pouch-seats',
-    'pouchful',
-    'poudreries',
-    'poui',
-    'poulet',
     'poulterers',
-    'poultrymeat',
-    'pouncer',
-    'pound-keepers',
-    'pound/dollar',
-    'poundian',
-    'pounds\'-worth',
-    'poupee',
-    'pour-flush',
-    'pourchet',
-    'poure',
-    'pourpe',
-    'pourris',
-    'pourriture',
-    'poverty-line',
-    'povlsen',
     'pow\'rful',
-    'pow/mia',
-    'powaqqatsi',
-    'powder-stained',
-    'powderhorn',
-    'powdermill',
-    'powe',
-    'powell/devizes',
-    'powell/glen',
-    'powell/milton',
-    'powell/pressburger',
-    'powell/raf',
-    'powell/shrivenham',
-    'powell/stroud',
-    'powell/university',
-    'powell/winchester',
     'powell/wootton',
-    'powell/wroughton',
-    'power\'',
-    'power-&eacute;lites',
-    'power-based',
-    'power-down',
-    'power-drive',
-    'power-gen',
-    'power-limiting',
-    'power-off',
-    'power-on-reset',
-    'power-players',
-    'power-plays',
-    'power-seekers',
-    'power-sharers',
-    'power-stations',
     'power-structures',
-    'power-unit',
-    'power-weaving',
-    'power.he',
-    'power/battery',
-    'power/weight',
-    'poweramp',
-    'powerbop',
-    'powerbroker',
-    'powerbrokers',
-    'powercard',
-    'powerchord',
-    'powercut',
-    'powered-up',
-    'powerfilter',
-    'powerjets',
     'powermasters',
-    'powermiser',
-    'powers-that-were',
-    'poxon',
-    'poyais',
-    'poyle',
-    'poynt',
-    'pozdyshev',
-    'pozi&egrave;res',
-    'pozn&aacute;n',
-    'pozna&nacute',
-    'poznania',
-    'pozzallo',
-    'pp.1&ndash;2',
-    'pp.101&ndash;2',
-    'pp.113&ndash;19',
     'pp.161&ndash;5',
-    'pp.164&ndash;5',
-    'pp.17&ndash;18',
-    'pp.19&ndash;23',
-    'pp.26&ndash;9',
-    'pp.261',
-    'pp.288&ndash;9',
-    'pp.42&ndash;3',
-    'pp.43&ndash;7',
-    'pp.47&ndash;8',
-    'pp.5&ndash;6',
-    'pp.6&ndash;7',
-    'pp.75&ndash;6',
-    'pp.79',
-    'pp.81&ndash;2',
-    'pp.86&ndash;7',
     'pp.9',
-    'pp.96&ndash;7',
-    'pp.go',
-    'pp4',
-    'ppg3',
-    'ppiase',
-    'ppmv',
-    'ppon',
-    'ppps',
-    'pps-rd',
-    'ppsf',
-    'ppvt',
-    'ppyac4',
-    'pr&eacute;fecture',
-    'pr&eacute;gardien',
-    'pr&eacute;sages',
     'pr&eacute;vost',
-    'pr&ecirc;t-&agrave;-porter',
-    'pr&ecirc;te-moi',
-    'pr&egrave;s',
-    'pr&iacute;nc&iacute;pe',
-    'pr.xi',
-    'pr4',
-    'pr5',
-    'pr536',
-    'praca',
-    'practi',
-    'practically-oriented',
-    'practice-based',
-    'practising.',
-    'pradakshina',
-    'prade',
     'prader-willi',
-    'praeambula',
-    'praeceptio',
-    'praeiecti',
-    'praetexta',
-    'praetors',
-    'prafance',
-    'prag',
-    'pragmaticists',
-    'pragmatics/semantics',
-    'pragnell',
-    'prairie-like',
-    'pralaya',
-    'pralelsliv&iacute',
-    'prampolini',
-    'pranatan',
     'prancings',
-    'prangenberg',
-    'prankish',
-    'prasith',
-    'pratica',
-    'pratincoles',
-    'pratting',
-    'praxeas',
-    'praxes',
-    'praxiteles',
-    'prayer-desk',
-    'prayer/',
-    'prayers.',
-    'praziquantel',
-    'prazosin',
-    'prck',
     'pre&rehy;decessor',
-    'pre&rehy;requisite',
-    'pre-1918',
-    'pre-1919',
-    'pre-1950',
-    'pre-1968',
-    'pre-1975',
-    'pre-1978',
-    'pre-1980',
-    'pre-1988',
-    'pre-1990',
-    'pre-1st',
-    'pre-act',
-    'pre-action',
-    'pre-affluent',
-    'pre-alpha',
     'pre-announcements',
-    'pre-arc',
-    'pre-arrange',
-    'pre-assigned',
-    'pre-august',
-    'pre-bait',
-    'pre-baked',
-    'pre-battle',
-    'pre-biotic',
-    'pre-book',
-    'pre-breeding',
-    'pre-centcom',
-    'pre-chernobyl',
-    'pre-civilisation',
-    'pre-clean',
-    'pre-consonantally',
     'pre-constitutional',
-    'pre-created',
-    'pre-delivery',
-    'pre-demographic',
-    'pre-development',
-    'pre-digested',
-    'pre-discursive',
-    'pre-dominantly',
-    'pre-donegal',
-    'pre-echoes',
-    'pre-ediacaran',
-    'pre-eighty',
-    'pre-equilibrate',
-    'pre-exchange',
-    'pre-exilic',
-    'pre-falklands',
     'pre-fernando',
-    'pre-filtered',
-    'pre-five',
-    'pre-flashed',
-    'pre-flavian',
-    'pre-formatted',
-    'pre-formulated',
-    'pre-forum',
-    'pre-foundation',
-    'pre-genital',
-    'pre-glasnost',
-    'pre-glazed',
-    'pre-greek',
-    'pre-heads',
-    'pre-hellenistic',
-    'pre-incubation',
     'pre-inflation',
-    'pre-installs',
-    'pre-judgements',
-    'pre-landing',
-    'pre-language',
-    'pre-let',
-    'pre-london',
-    'pre-marketed',
-    'pre-master',
-    'pre-meetings',
-    'pre-menopausal',
-    'pre-mesozoic',
-    'pre-morbidly',
-    'pre-mortem',
-    'pre-national',
-    'pre-nationalization',
     'pre-nursery',
-    'pre-oil',
-    'pre-onset',
-    'pre-ottoman',
-    'pre-patterned',
-    'pre-peak',
-    'pre-piloted',
-    'pre-play',
-    'pre-policy',
-    'pre-prison',
-    'pre-publicity',
-    'pre-qualification',
-    'pre-railway',
-    'pre-register',
-    'pre-registered',
-    'pre-republican',
     'pre-schooling',
-    'pre-september',
-    'pre-sequences',
-    'pre-setting',
-    'pre-shaped',
-    'pre-sliced',
-    'pre-soviet',
-    'pre-stimulus',
-    'pre-stored',
-    'pre-stunning',
-    'pre-swing',
-    'pre-symptomatic',
-    'pre-text',
-    'pre-thatcherite',
-    'pre-theft',
-    'pre-twentieth',
     'pre-vatican',
-    'pre-version',
-    'pre-voiceless',
-    'pre-vxkvk',
-    'pre-warmed',
-    'pre-washed',
-    'pre-zoroastrian',
-    'preadaptation',
-    'preadaptations',
-    'preambular',
-    'preamplifiers',
-    'prearrangement',
-    'preattentively',
-    'prebaited',
-    'prebendaries',
-    'precambrian-cambrian',
     'precariae',
-    'precatorius',
-    'precedences',
-    'precedential',
-    'precepta',
-    'preceptress',
-    'precessing',
-    'precious-metals',
-    'precipitantly',
-    'precirrhotic',
-    'precision-engineered',
-    'precleared',
-    'precolonial',
-    'precommitment',
-    'precompiler',
-    'preconvictions',
     'precordial',
-    'precoxal',
-    'precurrent',
-    'precursory',
-    'precut',
-    'pred',
-    'predacious',
-    'predator-specific',
-    'predawn',
-    'predella-like',
-    'predesignated',
-    'predetermination',
-    'predicators',
-    'predictions.',
-    'predictively',
-    'predissociation',
     'prednisilone',
-    'predominancy',
-    'predominantely',
-    'predominantly-hindu',
-    'predominency',
-    'preedy',
-    'preemption',
-    'preempts',
-    'preens',
-    'prefactor',
-    'prefectorate',
-    'preferences.',
-    'prefering',
-    'prefiguration',
-    'prefigurative',
-    'pregancy',
     'pregitzer',
-    'prehaustorial',
-    'prehybridized',
-    'preintegration',
-    'prejudgments',
-    'prejudice\'',
-    'prelacy',
-    'prelogical',
-    'preludial',
-    'prema',
-    'premaritally',
-    'premchaud',
-    'premeal',
-    'premerstein',
-    'premi&eacute;res',
-    'premising',
     'premium-bonus',
-    'premium-gift',
-    'premiums/investments',
-    'premodifiers',
-    'prempak',
-    'prendergast/thames',
-    'prendiville',
-    'prenominals',
-    'prentiss',
-    'prenuptial',
-    'prep-schools',
-    'prepack(s)',
-    'prepackage',
-    'prepatterns',
-    'prepcoms',
-    'prepeliczay',
     'prepositionally',
-    'prepost\'rous',
-    'preposterousness',
-    'preppie',
-    'prepreg',
-    'preprints',
-    'preproet-1',
-    'prepubescent',
-    'prepuces',
-    'prerun',
-    'presacral',
-    'presant',
-    'presb.',
-    'presbyterium',
-    'prescan',
-    'prescod',
     'prescriptive.',
-    'prescriptivist',
-    'prescriptivity',
-    'preselection',
-    'present-',
-    'present-giver',
-    'present-perfect',
-    'presentees',
-    'presentement',
-    'preservice',
-    'preshaped',
-    'president-in-waiting',
-    'president-national',
-    'presidentelect',
-    'presinusoidal',
-    'presos',
     'prespa',
-    'press-studs',
-    'press/john',
-    'pressed-steel',
-    'pressmarks',
-    'pressmaster',
-    'pressnell',
-    'pressure-composition',
-    'pressure-groups',
-    'pressure-inferior',
-    'pressure-temperature',
-    'pressurises',
-    'prestenotic',
-    'prestnov',
-    'prestrud',
-    'prestt',
     'presum&rehy;ably',
-    'presuma',
-    'presumptious',
-    'presure',
-    'pretas',
-    'pretenses',
-    'pretheoretical',
-    'prethrombotic',
-    'pretiosum',
-    'prettifying',
-    'prettinesses',
-    'preuilly',
-    'preussag',
-    'preussen',
-    'prevail.',
-    'prevatte',
     'preventation',
-    'preventions',
-    'preventively',
-    'previewz',
-    'previous-best',
-    'previously-agreed',
-    'previtali',
-    'prew-smith',
-    'prewett',
-    'prewitt',
-    'pribilov',
-    'price-competitiveness',
-    'price-cost',
-    'price-jones',
-    'price-keeping',
-    'price-sensitivity',
     'price/thames',
-    'pricers',
-    'prickings',
-    'pricktease',
-    'pridham',
-    'priess',
-    'priest/harwell',
-    'priest/spiritual',
-    'priestmans',
-    'prigioniero',
-    'prigorodny',
-    'prijedor',
-    'prikazsky',
-    'priko',
-    'prim-looking',
-    'primarche',
     'primary-to-secondary',
-    'primary/developmental',
-    'primas',
-    'primative',
-    'prime-1',
-    'prime-lending',
-    'primed/continuous',
-    'primigenius',
-    'primity',
-    'primordia',
-    'primordium',
-    'primores',
-    'primrose-yellow',
-    'prince-archbishop',
-    'princedoms',
-    'princess-line',
     'principal/',
-    'principal/agent',
-    'principii',
-    'princl',
-    'prinias',
-    'prinked',
-    'prinknash',
-    'print-head',
-    'print-makers',
-    'print-runs',
-    'print.form',
-    'printer/plotter',
-    'printgine',
-    'printing-houses',
-    'printing-offices',
-    'printing-presses',
     'printronix',
-    'prinzenstrasse',
-    'priok',
-    'prior-provincial',
-    'priorelli',
-    'priorit&eacute',
-    'prismed',
-    'prison-issue',
-    'prison-stockade',
-    'prison.the',
-    'prison/buckinghamshire',
-    'prisoners.',
-    'prisse',
-    'prissick',
-    'prissily',
-    'pritchard/romany',
     'pritchards',
-    'prittie',
-    'priut',
-    'privado',
-    'privalov',
-    'privata',
-    'private-public',
-    'private-use',
-    'private/domestic',
-    'private/voluntary',
-    'privately-sponsored',
-    'privateness',
-    'privatizer',
-    'privilegiati',
-    'privvies',
-    'prizemonies',
     'prmd=nexor',
-    'pro-adhesive',
-    'pro-african',
-    'pro-aggregatory',
-    'pro-ally',
-    'pro-aoun',
-    'pro-appeasement',
-    'pro-aquaguard',
-    'pro-audio',
-    'pro-aydid',
-    'pro-baby',
-    'pro-beijing',
-    'pro-boers',
-    'pro-carcinogens',
-    'pro-choicers',
-    'pro-classical',
     'pro-congress',
-    'pro-criminal',
-    'pro-cuban',
-    'pro-cycling',
-    'pro-death',
-    'pro-democracia',
-    'pro-eec',
-    'pro-environment',
-    'pro-euthanasia',
-    'pro-falangist',
-    'pro-fit',
-    'pro-gen',
-    'pro-growth',
-    'pro-hanging',
-    'pro-hanoverian',
-    'pro-hekmatyar',
     'pro-hitler',
-    'pro-hunt',
-    'pro-hunters',
-    'pro-imperial',
-    'pro-industry',
-    'pro-inkatha',
-    'pro-ipkf',
-    'pro-ira',
-    'pro-italian',
-    'pro-jewish',
-    'pro-khomeini',
-    'pro-libyan',
-    'pro-maastricht',
-    'pro-manchester',
-    'pro-minded',
-    'pro-mobutu',
     'pro-music',
-    'pro-neville',
-    'pro-north',
-    'pro-note',
-    'pro-nsf',
-    'pro-nuncio',
-    'pro-o\'neill',
-    'pro-ossetian',
-    'pro-pri',
-    'pro-psi/psdi',
-    'pro-rights',
-    'pro-roman',
-    'pro-sandinista',
-    'pro-saving',
-    'pro-serbian',
-    'pro-shah',
     'pro-sinn',
-    'pro-slavery',
-    'pro-south',
-    'pro-standard',
-    'pro-state',
-    'pro-stuart',
-    'pro-sybil',
-    'pro-thatcher',
-    'pro-tour',
-    'pro-tunnel',
-    'pro-type',
-    'pro-woman',
-    'pro-women',
-    'proamniotic',
-    'probations',
-    'probe-tagged',
     'probem',
-    'problem-related',
-    'problem-solutions',
-    'problem.solver',
-    'problem/solution',
-    'problem_in_terms',
-    'problema',
-    'problematizes',
-    'problemo',
-    'probyns',
-    'proc1',
-    'proc3',
-    'proc4',
-    'procarbazine',
-    'procaryote',
-    'procedure(s)',
     'process(es)',
-    'process-focused',
-    'process-server',
-    'process-servers',
-    'processe',
-    'processers',
-    'processor-based',
-    'processor-taligent',
-    'proche',
-    'prockter',
-    'proclamatory',
-    'procon',
-    'procor',
-    'procrastinations',
-    'procrastinators',
-    'procris',
     'proctocolectomies',
-    'proctorial',
-    'proctoscope',
-    'proctosigmoidectomy',
-    'proculus',
-    'procurable',
-    'procurations',
-    'procurators-fiscal',
-    'procuticular',
-    'prod.',
-    'prodev',
-    'prodigally',
-    'prodip',
-    'prodnalog',
-    'producci&oacute;n',
-    'producer/engineer',
     'producer/singer',
-    'producers.',
-    'producers/suppliers',
-    'product&gt',
-    'product(s)',
-    'product-by-product',
-    'product-development',
-    'product-focused',
-    'product-testing',
-    'product/value',
-    'production-centred',
-    'production-consumption',
-    'production-led',
-    'production-oriented',
-    'production-ready',
-    'production/methods',
     'productionist',
-    'productiv',
-    'products/services',
-    'produits',
-    'profanely',
-    'professional/',
-    'professional/paraprofessional',
-    'professional/technical',
-    'professional/vocational',
-    'professionally-handled',
-    'professionelle',
-    'professor/senior',
-    'professoriate',
-    'profiaircurl',
-    'profil',
-    'profintern',
     'profit&rehy;maximizers',
-    'profit-conscious',
-    'profit-decision',
-    'profit-driven',
-    'profit-earners',
-    'profit-linked',
-    'profit-minded',
-    'profit-takers',
-    'profit/non-profit',
-    'profits-inspired',
-    'profits/losses',
-    'profligates',
-    'profoundness',
-    'proglems',
-    'progra',
-    'programe',
     'programmatically',
-    'programme(s)',
-    'programme-dominated',
-    'programmer-level',
-    'programmmes',
-    'progress-based',
-    'progress/production/traffic',
-    'progressing.',
-    'progressionist',
-    'progressive&rehy;action',
-    'prohaska',
-    'prohibita',
-    'prohibitum',
-    'proie',
-    'project&ndash;specific',
-    'project-inspired',
     'projenor',
-    'prokes',
-    'prokoviev',
-    'prolate',
-    'proletaires',
-    'proliferator',
-    'prolink',
-    'prolongations',
-    'promecologia',
-    'promicroceras',
-    'promotion/communication',
-    'promulgates',
-    'promyshlenniki',
-    'pronk',
-    'pronominalisation',
-    'pronounced_as',
     'prontoprint',
-    'pronunciamentos',
-    'proofness',
-    'proove',
-    'propaganda-based',
-    'propaganda-line',
-    'propagations',
-    'propane-rich',
-    'proper\'',
-    'proper-named',
-    'properest',
-    'properness',
-    'property-buying',
-    'property-class',
-    'property-sets',
-    'property/premises',
     'prophesyings',
-    'prophetes',
-    'propionibacterial',
-    'prople',
-    'propogate',
-    'proportionable',
-    'proportionalities',
-    'proposition-based',
-    'propositions.',
-    'propounders',
-    'propped-up',
-    'propri&eacute;t&eacute',
-    'proprioception',
-    'proprioceptor',
-    'props/costumes',
-    'pros/pros',
     'prosamo',
-    'proscuted',
-    'prose-poem',
-    'prose-scene',
-    'prosection',
-    'prosecutable',
-    'proselytiser',
-    'proselytisers',
-    'proselytizer',
-    'proselytizers',
-    'prosimian',
-    'prosopographical',
-    'prospectives',
-    'prospectivity',
-    'prosperity.',
-    'prostatectomies',
     'prosternum',
-    'prostetnic',
-    'protasia',
-    'proteaceae',
-    'protected.',
-    'protein-1',
-    'protein-binding',
-    'protein-calorie',
-    'protein-enriched',
-    'protein/dna',
-    'proteolytically',
-    'protestant/catholic',
-    'protestantes',
-    'protested.',
-    'prothrombotic',
-    'protists',
     'proto-atlantic',
-    'proto-bourgeoisie',
-    'proto-fascism',
-    'proto-industrialisation',
-    'proto-language',
-    'proto-records',
-    'proto-urban',
-    'protocol(smtp)',
-    'protocone',
-    'protohistoric',
-    'proton-proton',
-    'protonorms',
-    'protoplanetary',
-    'protoplast',
-    'protoranker',
-    'protostar',
     'protostars',
-    'protozoic',
-    'protrusible',
-    'prov.',
-    'provably',
-    'provand',
-    'provendor',
-    'prover',
-    'proverbios',
-    'provid',
-    'providee',
-    'provider.',
-    'provider/purchaser',
-    'provinces.',
-    'provinical',
-    'provisors',
     'provocable',
-    'provodnitsy',
-    'provokingly',
-    'provolone',
-    'prowar',
-    'prowlings',
-    'proworks',
-    'proximately',
-    'prsd',
-    'prtch',
-    'prudentially',
-    'prune-like',
-    'pruneaux',
-    'prunelike',
-    'prunifolia',
-    'prunty',
     'prusiked',
-    'prusse',
-    'prussia-germany',
-    'prussian-german',
-    'prutzman',
-    'pruzine',
-    'pryer',
-    'pryseg',
-    'prytany',
-    'prytherch',
-    'pryvetee',
-    'ps-',
-    'ps.5',
-    'ps/30',
-    'ps/e',
-    'ps/hrms',
     'ps5520',
-    'psacharopoulos',
-    'psam',
-    'psammetichos',
-    'psammites',
-    'psammitic',
-    'psarouda-benaki',
-    'psaumis',
-    'pscn',
-    'psd&mdash;social',
-    'psd.06a',
-    'psd.08',
-    'psds',
-    'psettias',
-    'pseude',
-    'pseudo&rehy;documentary',
     'pseudo-autobiographical',
-    'pseudo-crystalline',
-    'pseudo-generic',
-    'pseudo-injury',
-    'pseudo-knowledge',
-    'pseudo-medical',
-    'pseudo-nationalist',
-    'pseudo-parents',
-    'pseudo-rational',
-    'pseudo-reality',
-    'pseudo-riemann',
-    'pseudo-scots',
-    'pseudo-synonymy',
-    'pseudo-tudor',
-    'pseudo-twin',
-    'pseudo-ulpian',
     'pseudoallergic',
-    'pseudoboekella',
-    'pseudocanthicus',
-    'pseudocode',
-    'pseudofrenulum',
-    'pseudointellectualism',
-    'pseudonymously',
-    'pseudosounds',
-    'pseuds',
-    'psfi/notenv',
-    'pshe',
-    'pslg',
-    'psocoptera',
-    'psora',
-    'psoriatic',
-    'psos+',
     'psr1744&ndash;24a',
-    'pss.',
-    'psti-pvuii',
-    'psv-2',
-    'psv2x5',
-    'psych-',
-    'psyched-up',
-    'psychedelic-tinged',
-    'psychiatrics',
-    'psycho-acoustic',
-    'psycho-active',
-    'psycho-analytical',
-    'psycho-dynamic',
-    'psycho-linguistic',
-    'psycho-physiological',
-    'psycho-sheep',
     'psycho-shock',
-    'psycho-statistical',
-    'psycho-technology',
-    'psycho-therapeutic',
-    'psychol',
-    'psycholinguist',
-    'psychologization',
-    'psychometrician',
-    'psychometricians',
-    'psychoneurological',
-    'psychopathically',
-    'psychopathy',
-    'psychopharmacological',
-    'psychophysiologist',
-    'psychotherapies',
-    'psychotic-like',
     'psychoticism',
-    'psychotropics',
-    'psychro',
-    'psykik',
-    'pt-gliadin-sepharose',
-    'pt-sys5000',
-    'pt3500',
-    'pt6a',
-    'pta300',
-    'pta35',
-    'ptak',
-    'ptarmiflorum',
-    'ptbt',
-    'pteridophytes',
-    'pteronarcys',
-    'pterygoplichthys',
     'ptew',
-    'pthalocyanine',
-    'ptholomeus',
-    'ptnm',
-    'ptr2',
-    'ptr3',
-    'ptrs',
-    'ptw',
-    'pu-coated',
-    'puapua',
-    'pube',
-    'public-good',
-    'public-opinion',
-    'public-speaking',
-    'public-trust',
-    'publication-quality',
     'publicity-minded',
-    'publicity-seeking',
-    'publicity.',
-    'publicization',
-    'publicizes',
-    'publicly-donated',
-    'publicness',
-    'publilius',
-    'publishing&amp;print',
-    'pubol',
-    'pubwatching',
-    'puc18',
-    'puch',
-    'puck-like',
-    'puckishly',
-    'pucklechurch',
     'puddephatt/liberty',
-    'puddicombe',
-    'puddington',
-    'pufas',
-    'puffett',
-    'puffier',
-    'pugh/father',
-    'pugh/murray',
-    'pugilism',
-    'pugnax',
-    'puh5s',
-    'puhakka',
-    'puiatti',
-    'puig-aubert',
-    'puja',
-    'pukekohe',
     'pukey',
-    'pulchrum',
-    'pulido',
-    'pull-downs',
-    'pull-rod',
-    'pull-shifting',
-    'pullback',
-    'pulled-out',
-    'pulling-back',
-    'pullowes',
-    'pulltrouser',
-    'pully',
-    'pully/lausanne',
-    'pulmonale',
-    'pulqui',
-    'pulsebeat',
     'pulverises',
-    'pulverulenta',
-    'pulvilli',
-    'pulvini',
-    'pumila',
-    'pump-down',
-    'pump-primed',
-    'pump.',
-    'pumpherston',
-    'pumphrey',
-    'pumpkinseeds',
-    'pumps/powerheads',
-    'pumu6',
-    'pun-test',
-    'punal',
-    'punc',
     'punchbags',
-    'punchily',
-    'punching-bag',
-    'punguin',
-    'punguon',
-    'puni',
-    'punicea',
-    'punier',
-    'punishably',
-    'punjabi-speaking',
-    'punk-folk',
-    'punk-pop',
-    'punkah',
-    'punkish',
-    'punningly',
-    'punny',
     'punster',
-    'punsters',
-    'puntarenas',
-    'puntato',
-    'punto',
-    'punton',
-    'punyettas',
-    'puok',
-    'puolanne',
-    'pup-pup',
-    'pupation',
-    'pupil-master',
-    'pupil-teachers',
-    'pupilmaster',
-    'pupils/students',
-    'pupitres',
     'puppet-like',
-    'puppet-show',
-    'puppywatch',
-    'pur&eacute;eing',
-    'purbeck-portland',
-    'purchase/no',
-    'purchassing',
-    'pure-black',
-    'pure-hearted',
-    'purebreds',
-    'purestrains',
-    'purex',
-    'purgers',
-    'purificaci&oacute;n',
-    'purificators',
-    'purificatory',
     'purim',
-    'puristically',
-    'puritania',
-    'purity.',
-    'purko',
-    'purlieu',
-    'purnell/gloucestershire',
-    'purner',
-    'purple-grey',
-    'purple-tinged',
-    'purplish-green',
-    'purply-blue',
-    'purply-pink',
-    'purpose\'',
-    'purpose-independent',
-    'purposive-rational',
     'purpurae',
-    'purpureum',
-    'purse-bar',
-    'purse-net',
-    'purse-seining',
-    'purslow/west',
-    'pursuade',
-    'pursuivants',
-    'purton/gloucestershire',
-    'purver',
-    'pus-cells',
-    'pusat',
-    'push-along',
-    'push-bikes',
-    'push-in',
-    'push-push',
     'push-started',
-    'push-turn',
-    'pushca',
-    'pushcart',
-    'pushful',
-    'pushiness',
-    'pushkarov',
-    'pusse',
-    'pussy-cats',
-    'pustular',
-    'put-and-take',
-    'put-at-par',
-    'put-ins',
-    'puteaux',
-    'puthoff',
-    'putley',
     'putnumber',
-    'putrescence',
-    'putrescent',
-    'putrescible',
-    'putrifying',
-    'puttable',
-    'puttana',
-    'puttaparti',
-    'putte',
-    'puttis',
-    'putty-coloured',
-    'puura',
-    'puy-de-d&ocirc;me',
-    'puyloubier',
-    'pvc-covered',
-    'pvg',
     'pvg.r19',
-    'pvisor',
-    'pvm11',
-    'pvq',
-    'pwani',
-    'pwooor',
-    'pwsw',
-    'pwv',
-    'pwy',
-    'px-xware',
-    'py-polyester',
-    'pyac4',
-    'pyacrc',
-    'pyankov',
-    'pyb',
-    'pybt',
     'pycnidia',
-    'pycnocline',
-    'pyd',
-    'pye-smith',
-    'pyecroft',
-    'pygargus',
-    'pygidium',
-    'pygmaea',
-    'pygmalion-like',
-    'pygoscelis',
-    'pygot',
-    'pyinmana',
-    'pyjama-ed',
-    'pyjama-jacket',
-    'pyknotic',
-    'pyms',
     'pyneford',
-    'pynsent',
-    'pyocyanea',
-    'pyometra',
-    'pyr&eacute;n&eacute;es-orientales',
-    'pyr-pur',
-    'pyraniki',
-    'pyrethroid',
-    'pyrexic',
-    'pyrgic',
-    'pyridinoline:deoxypyrolidine',
-    'pyridostigmine',
-    'pyritous',
-    'pyrobitumen',
-    'pyrogen-free',
-    'pyrogenic',
     'pyrole',
-    'pyrolytic',
-    'pyromania',
-    'pyrotechnical',
-    'pyrozines',
-    'pyrrhonian',
-    'pyrrolizidine',
-    'pyschiatric',
-    'pyschological',
-    'pyschologist',
-    'pyth',
-    'pytharchos',
-    'pythium',
-    'pyxidis',
-    'pzex20',
-    'q&amp;as',
     'q&gt;0',
-    'q(n)',
-    'q+e',
-    'q-branches',
-    'q-ships',
-    'q.1',
-    'q.3',
-    'q.a.l.y.',
-    'q.e.',
-    'q.p.r.',
-    'q.t.s',
-    'q/m',
-    'q100',
-    'q19',
-    'q2\'s',
-    'q27',
     'q50',
-    'q96',
-    'qa&mdash;user.log',
-    'qa-approved',
-    'qa1',
-    'qad',
-    'qadi',
-    'qaim',
-    'qal',
-    'qandil',
-    'qaruh',
-    'qassem',
-    'qawar',
-    'qayum',
-    'qb3+',
-    'qc4',
     'qc7',
-    'qcr',
-    'qd1+',
-    'qd5',
-    'qd5+',
-    'qdm/qdr',
-    'qdos',
-    'qdp',
-    'qe/00/00/0000',
-    'qe3',
-    'qe7',
-    'qemal',
-    'qemm386',
-    'qestion',
-    'qeysar',
-    'qftd.exe',
     'qg3',
-    'qg4',
-    'qgm',
-    'qgo',
-    'qh',
-    'qianlong',
-    'qiblatain',
-    'qibya',
-    'qinghai',
-    'qinghua',
-    'qinshan',
-    'qkn',
-    'qknd',
-    'ql',
-    'qlp',
-    'qmw',
     'qnx',
-    'qpr1',
-    'qrm',
-    'qrs.',
-    'qterm',
-    'qu&eacute;bec',
-    'quadfasel',
-    'quadrans',
-    'quadriga',
-    'quadring',
-    'quadrisyllabic',
-    'quadruple-bogey',
-    'quadruplets',
-    'quadrupod',
-    'quaerens',
-    'quaint-sounding',
     'quainter',
-    'qualia',
-    'qualie',
-    'qualif',
-    'qualifications.',
-    'qualifications/learning',
-    'qualitie',
-    'quality-related',
-    'quality-wise',
-    'qualityteam',
-    'quango-like',
-    'quangoes',
-    'quangoid',
-    'quanity',
-    'quantastic',
-    'quantifications',
     'quantitating',
-    'quantity-ordered',
-    'quantity.',
-    'quantrill',
-    'quantum-optical',
-    'quantum.',
-    'quantz',
-    'quanyou',
-    'quar',
-    'quarley',
-    'quarriers',
-    'quarry-by-quarry',
-    'quarter-building',
-    'quarter-lights.',
-    'quarter-measures',
-    'quarter-of-a',
     'quarter-pound',
-    'quarter-pounder',
-    'quarter-sawn',
-    'quarter-sheets',
-    'quarter-sized',
-    'quarterfinals',
-    'quarters-in',
-    'quartetto',
-    'quartiers',
-    'quartz-magnetite',
-    'quartzo-feldspathic',
-    'quaser',
-    'quashigah',
-    'quasi-biblical',
-    'quasi-classical',
-    'quasi-diplomatic',
     'quasi-familial',
-    'quasi-fixed',
-    'quasi-formal',
-    'quasi-improvisatory',
-    'quasi-laboratory',
-    'quasi-liberal',
-    'quasi-lorenz',
-    'quasi-managerial',
-    'quasi-medical',
-    'quasi-metaphorical',
-    'quasi-modern',
-    'quasi-monopolistic',
-    'quasi-operatic',
-    'quasi-periodicity',
-    'quasi-public-good',
-    'quasi-regal',
     'quasi-rents',
-    'quasi-research',
-    'quasi-sacerdotal',
-    'quasi-sociological',
-    'quasi-static',
-    'quasi-steady',
-    'quasi-stellar',
-    'quasi-superordinate',
-    'quasi-totalitarian',
-    'quasi-transcendental',
-    'quasi-treaty',
-    'quasi-triangular',
-    'quasiparticles',
-    'quass',
-    'quatar',
-    'quatek',
     'quatris',
-    'quattros',
-    'quaveringly',
-    'qudis',
-    'quechuas',
-    'quedgeley/gloucestershire',
-    'queen\'s',
-    'queen-in-parliament',
-    'queenhithe',
-    'queening',
-    'queensgate',
-    'queensryche',
-    'queensway/mfi',
-    'queiroz',
-    'quellada',
-    'quendale',
     'querquedula',
-    'queryingly',
-    'questfest',
-    'questier',
-    'question&rehy;ing',
-    'question-tags',
-    'questioning.',
-    'questionmark',
-    'questionnaire.',
-    'quichua',
-    'quick-buck',
-    'quick-draws',
-    'quick-maturing',
-    'quick-reaction',
-    'quick-sands',
-    'quick-selling',
     'quick-wittedness',
-    'quickedge',
-    'quickjoy',
-    'quickprint',
-    'quickshot',
-    'quicksons',
-    'quickstart',
-    'quickwittedness',
-    'quicky',
-    'quiddities',
-    'quiero',
-    'quiffy',
-    'quigrungio',
-    'quila',
-    'quilley',
-    'quilliam',
     'quimperl&ecirc',
-    'quinacridone',
-    'quinan',
-    'quinctius',
-    'quindly',
-    'quindry',
-    'quinidine-induced',
-    'quinn.',
-    'quinn/parish',
-    'quinquefasciatus',
-    'quintans',
-    'quintuplet',
-    'quintuplicate',
-    'quinuclidine',
-    'quipping',
-    'quirico',
     'quirkier',
-    'quisumbing',
-    'quit-rent',
-    'quitensis',
-    'quites',
-    'quittenton',
-    'quiver-tip',
-    'quixotically',
-    'quixotry',
-    'quizapu',
-    'quizshow',
-    'quodraturn',
-    'quoniam',
-    'quorshi',
-    'quota-equivalent',
-    'quotability',
     'quote-driven',
-    'quotidie',
-    'quotidien',
-    'quotidienne',
-    'qwt',
-    'qxb6',
-    'r&amacr;n&amacr;m&amacr;che',
-    'r&amp;d-intensive',
-    'r&eacute;ard',
-    'r&eacute;coltant-manipulant',
-    'r&eacute;f&eacute;rences',
-    'r&eacute;forme',
-    'r&eacute;gicide',
-    'r&eacute;giments',
-    'r&eacute;gulateur',
-    'r&eacute;jane',
     'r&eacute;musat',
-    'r&eacute;ole',
-    'r&eacute;p&eacute;ta',
-    'r&eacute;tro',
-    'r&eacute;troversion',
-    'r&eacute;trovis&eacute;e',
-    'r&ecirc;veries',
-    'r&iacute;mid',
-    'r&oacute;mulo',
-    'r&ocirc;ti',
-    'r&oslash;dt',
-    'r&ouml;ling',
-    'r&prime',
-    'r&uuml;gen',
-    'r&uuml;hrgas',
-    'r(22)=0.83',
     'r(46)=0.15',
-    'r(46)=0.24',
-    'r(46)=0.47',
-    'r(58)=0.45',
-    'r(d)svs',
-    'r(s)',
-    'r-2800',
-    'r-5',
-    'r-less',
-    'r-robert',
-    'r-series-based',
-    'r-series-to-alpha',
-    'r-york',
-    'r.&amp',
-    'r.101',
-    'r.15',
     'r.2',
-    'r.24(2)',
-    'r.3',
-    'r.4',
-    'r.7',
-    'r.a',
-    'r.a.c.',
-    'r.a.h.',
-    'r.a.s.c.',
-    'r.aasland',
-    'r.baldwin',
-    'r.c.a.f.',
-    'r.c.e.',
-    'r.c.m.',
-    'r.d.h.',
-    'r.e.d',
     'r.evans',
-    'r.p.s.i',
-    'r.q',
-    'r.q.',
-    'r.r.r.',
-    'r.t./ambient',
-    'r.wilson',
-    'r/000/22/1005',
-    'r/000/22/1008',
-    'r/000/22/1014',
-    'r/000/22/1015',
-    'r/000/22/1039',
-    'r/000/22/1042',
-    'r/000/22/1045',
-    'r/000/22/1049',
-    'r/000/22/1063',
     'r/000/22/1067',
-    'r/000/22/1073',
-    'r/000/22/1074',
-    'r/000/22/1079',
-    'r/000/22/1085',
-    'r/000/22/1088',
-    'r/000/22/1089',
-    'r/000/22/1092',
-    'r/000/22/1136',
-    'r/000/23/1018',
-    'r/000/23/1019',
-    'r/000/23/1020',
-    'r/000/23/1021',
-    'r/000/23/1022',
-    'r/000/23/1027',
-    'r/000/23/1037',
     'r/000/23/1045',
-    'r/000/23/1058',
-    'r/000/23/1060',
-    'r/000/23/1079',
-    'r/000/23/1082',
-    'r/000/23/1091',
-    'r/000/23/1099',
-    'r/000/23/1101',
-    'r/000/23/1104',
-    'r/000/23/1107',
-    'r/000/23/1113',
-    'r/000/23/1115',
-    'r/000/23/1127',
-    'r/000/23/1130',
-    'r/000/23/1132',
-    'r/000/23/1134',
     'r/000/23/1151',
-    'r/000/23/1158',
-    'r/000/23/1161',
-    'r/000/23/1162',
-    'r/000/23/1168',
-    'r/000/23/1181',
-    'r/000/23/1183',
-    'r/000/23/1184',
-    'r/000/23/1190',
-    'r/000/23/1192',
-    'r/000/23/1193',
-    'r/000/23/1196',
-    'r/000/23/1202',
-    'r/000/23/1205',
-    'r/000/23/1208',
-    'r/000/23/1209',
     'r/000/23/1210',
-    'r/000/23/1216',
-    'r/000/23/1230',
-    'r/000/23/1235',
-    'r/000/23/1236',
-    'r/000/23/1240',
-    'r/000/23/1241',
-    'r/000/23/1243',
-    'r/000/23/1245',
-    'r/000/23/1266',
-    'r/000/23/1279',
-    'r/000/23/1280',
-    'r/000/23/1286',
-    'r/000/23/1292',
-    'r/000/23/1328',
-    'r/000/23/1346',
     'r/000/23/1347',
-    'r/000/23/1348',
-    'r/000/23/1349',
-    'r/000/23/1358',
-    'r/000/23/1361',
-    'r/000/23/1362',
-    'r/000/23/1368',
-    'r/000/23/1374',
-    'r/000/23/1376',
-    'r/000/23/1381',
-    'r/000/23/1383',
-    'r/000/23/1387',
-    'r/000/23/1390',
-    'r/000/23/1393',
-    'r/000/23/1394',
-    'r/000/23/1395',
     'r/000/23/1401',
-    'r/000/23/1402',
-    'r/000/23/1404',
-    'r/000/23/1420',
-    'r/000/23/1427',
-    'r/000/23/1436',
-    'r/000/23/1438',
-    'r/000/23/1439',
-    'r/000/23/1441',
-    'r/000/23/1444',
-    'r/000/23/1463',
-    'r/000/23/1475',
-    'r/000/23/1476',
-    'r/000/23/1479',
-    'r/000/23/1484',
-    'r/000/23/1485',
     'r/000/23/1488',
-    'r/000/23/1492',
-    'r/000/23/1505',
-    'r/000/23/1506',
-    'r/000/23/1510',
-    'r/000/23/1512',
-    'r/000/23/1513',
-    'r/000/23/1514',
-    'r/000/23/1515',
-    'r/000/23/1521',
-    'r/000/23/1522',
-    'r/000/23/1533',
-    'r/000/23/1545',
-    'r/000/23/1577',
-    'r/000/23/1578',
-    'r/000/23/1589',
     'r/000/23/1593',
-    'r/000/23/1596',
-    'r/000/23/1598',
-    'r/000/23/1599',
-    'r/000/23/1602',
-    'r/000/23/1611',
-    'r/000/23/1619',
-    'r/000/23/1632',
-    'r/000/23/1635',
-    'r/000/23/1639',
-    'r/000/23/1648',
-    'r/000/23/1651',
-    'r/000/23/1714',
-    'r/000/23/1718',
-    'r/000/23/1721',
-    'r/000/23/1725',
     'r/000/23/1731',
-    'r/000/23/1736',
-    'r/000/23/1746',
-    'r/000/23/1748',
-    'r/000/23/1749',
-    'r/000/23/1757',
-    'r/000/23/1769',
-    'r/000/23/1776',
-    'r/000/23/1779',
-    'r/000/23/1782',
-    'r/000/23/1785',
-    'r/000/23/1789',
-    'r/000/23/1798',
-    'r/000/23/1799',
-    'r/000/23/1801',
-    'r/000/23/1808',
     'r/000/23/1829',
-    'r/000/23/1840',
-    'r/000/23/1860',
-    'r/000/23/1868',
-    'r/000/23/1874',
-    'r/000/23/1875',
-    'r/000/23/1899',
-    'r/000/23/1903',
-    'r/000/23/1919',
-    'r/000/23/1922',
-    'r/000/23/1931',
-    'r/000/23/1932',
-    'r/000/23/1953',
-    'r/000/23/1955',
-    'r/000/23/1959',
-    'r/000/23/1960',
     'r/000/23/1966',
-    'r/000/23/1971',
-    'r/000/23/1975',
-    'r/000/23/1979',
-    'r/000/23/1981',
-    'r/000/23/1985',
-    'r/000/23/1988',
-    'r/000/23/1991',
-    'r/000/23/2002',
-    'r/000/23/2014',
-    'r/000/23/2019',
-    'r/000/23/2027',
-    'r/000/23/2031',
-    'r/000/23/2034',
-    'r/000/23/2035',
-    'r/000/23/2040',
     'r/000/23/2041',
-    'r/000/23/2045',
-    'r/000/23/2048',
-    'r/000/23/2049',
-    'r/000/23/2051',
-    'r/000/23/2060',
-    'r/000/23/2069',
-    'r/000/23/2077',
-    'r/000/23/2114',
-    'r/000/23/2122',
-    'r/000/23/2124',
-    'r/000/23/2132',
-    'r/000/23/2155',
-    'r/000/23/2157',
-    'r/000/23/2159',
-    'r/000/23/2160',
     'r/000/23/2161',
-    'r/000/23/2164',
-    'r/000/23/2168',
-    'r/000/23/2169',
-    'r/000/23/2171',
-    'r/000/23/2176',
-    'r/000/23/2182',
-    'r/000/23/2186',
-    'r/000/23/2192',
-    'r/000/23/2194',
-    'r/000/23/2196',
-    'r/000/23/2212',
-    'r/000/23/2220',
-    'r/000/23/2223',
-    'r/000/23/2234',
-    'r/000/23/2238',
     'r/000/23/2243',
-    'r/000/23/2249',
-    'r/000/23/2250',
-    'r/000/23/2253',
-    'r/000/23/2256',
-    'r/000/23/2257',
-    'r/000/23/2261',
-    'r/000/23/2269',
-    'r/000/23/2270',
-    'r/000/23/2272',
-    'r/000/23/2277',
-    'r/000/23/2282',
-    'r/000/23/2286',
-    'r/000/23/2291',
-    'r/000/23/2296',
-    'r/000/23/2297',
     'r/000/23/2302',
-    'r/000/23/2308',
-    'r/000/23/2327',
-    'r/000/23/2329',
-    'r/000/23/2330',
-    'r/000/23/2337',
-    'r/000/23/2351',
-    'r/000/23/2363',
-    'r/000/23/2376',
-    'r/000/23/2380',
-    'r/000/23/2381',
-    'r/000/23/2390',
-    'r/000/23/2391',
-    'r/000/23/2397',
-    'r/000/23/2406',
-    'r/000/23/2411',
     'r/000/23/2412',
-    'r/000/23/2414',
-    'r/000/23/2415',
-    'r/000/23/2418',
-    'r/000/23/2420',
-    'r/000/23/2421',
-    'r/000/23/2423',
-    'r/000/23/2425',
-    'r/000/23/2426',
-    'r/000/23/2428',
-    'r/000/23/2432',
-    'r/000/23/2439',
-    'r/000/23/2442',
-    'r/000/23/2447',
-    'r/000/23/2448',
-    'r/000/23/2456',
     'r/000/23/2457',
-    'r/000/23/2461',
-    'r/000/23/2464',
-    'r/000/23/2472',
-    'r/000/23/2480',
-    'r/000/23/2486',
-    'r/000/23/2489',
-    'r/000/23/2491',
-    'r/000/23/2495',
-    'r/000/23/2504',
-    'r/000/23/2507',
-    'r/000/23/2513',
-    'r/000/23/2514',
-    'r/000/23/2515',
-    'r/000/23/2516',
-    'r/000/23/2520',
     'r/000/23/2521',
-    'r/000/23/2522',
-    'r/000/23/2526',
-    'r/000/23/2527',
-    'r/000/23/2529',
-    'r/000/23/2531',
-    'r/000/23/2537',
-    'r/000/23/2543',
-    'r/000/23/2547',
-    'r/000/23/2548',
-    'r/000/23/2558',
-    'r/000/23/2568',
-    'r/000/23/2571',
-    'r/000/23/2576',
-    'r/000/23/2579',
-    'r/000/23/2585',
     'r/000/23/2590',
-    'r/000/23/2599',
-    'r/000/23/2601',
-    'r/000/23/2616',
-    'r/000/23/2624',
-    'r/000/23/2627',
-    'r/000/23/2635',
-    'r/000/23/2636',
-    'r/000/23/2637',
-    'r/000/23/2639',
-    'r/000/23/2642',
-    'r/000/23/2645',
-    'r/000/23/2646',
-    'r/000/23/2647',
-    'r/000/23/2650',
-    'r/000/23/2655',
     'r/000/23/2661',
-    'r/000/23/2663',
-    'r/000/23/2681',
-    'r/000/23/2682',
-    'r/000/23/2684',
-    'r/000/23/2685',
-    'r/000/23/2693',
-    'r/000/23/2699',
-    'r/000/23/2702',
-    'r/000/23/2706',
-    'r/000/23/2710',
-    'r/000/23/2713',
-    'r/000/23/2716',
-    'r/000/23/2721',
-    'r/000/23/2723',
-    'r/000/23/2726',
     'r/000/23/2731',
-    'r/000/23/2736',
-    'r/000/23/2737',
-    'r/000/23/2741',
-    'r/000/23/2746',
-    'r/000/23/2750',
-    'r/000/23/2756',
-    'r/000/23/2760',
-    'r/000/23/2764',
-    'r/000/23/2765',
-    'r/000/23/2772',
-    'r/000/23/2775',
-    'r/000/23/2777',
-    'r/000/23/2782',
-    'r/000/23/2783',
-    'r/000/23/2795',
     'r/000/23/2797',
-    'r/000/23/2803',
-    'r/000/23/2810',
-    'r/000/23/2815',
-    'r/000/23/2816',
-    'r/000/23/2817',
-    'r/000/23/2841',
-    'r/000/23/2856',
-    'r/000/23/2865',
-    'r/000/23/2873',
-    'r/000/23/2880',
-    'r/000/23/2883',
-    'r/000/23/2886',
-    'r/000/23/2890',
-    'r/000/23/2896',
-    'r/000/23/2898',
     'r/000/23/2901',
-    'r/000/23/2910',
-    'r/000/23/2925',
-    'r/000/23/2937',
-    'r/000/23/2943',
-    'r/000/23/2967',
-    'r/000/23/2976',
-    'r/000/23/3009',
-    'r/000/23/3011',
-    'r/000/23/3025',
-    'r/000/23/3043',
-    'r/000/23/3054',
-    'r/000/23/3055',
-    'r/000/23/3058',
-    'r/000/23/3062',
-    'r/000/23/3064',
     'r/000/23/3076',
-    'r/000/23/3088',
-    'r/000/23/3100',
-    'r/000/23/3111',
-    'r/000/23/3113',
-    'r/000/23/3125',
-    'r/000/23/3126',
-    'r/000/23/3129',
-    'r/000/23/3138',
-    'r/000/23/3150',
-    'r/000/23/3154',
-    'r/000/23/3162',
-    'r/000/23/3172',
-    'r/000/23/3191',
-    'r/000/23/3194',
-    'r/000/23/3200',
     'r/000/23/3201',
-    'r/000/23/3208',
-    'r/000/23/3222',
-    'r/000/23/3227',
-    'r/000/23/3240',
-    'r/000/23/3255',
-    'r/000/23/3263',
-    'r/000/23/3278',
-    'r/000/23/3301',
-    'r/000/23/3311',
-    'r/000/23/3313',
-    'r/000/23/3324',
-    'r/000/23/3334',
-    'r/000/23/3366',
-    'r/000/23/3372',
-    'r/000/23/3382',
     'r/000/23/3383',
-    'r/000/23/3441',
-    'r/000/23/3469',
-    'r/000/23/3478',
-    'r/000/23/3525',
-    'r/000/23/3527',
-    'r/000/23/3530',
-    'r/000/23/3537',
-    'r/000/23/3543',
-    'r/000/23/3553',
-    'r/000/23/3565',
-    'r/000/23/3610',
-    'r/000/23/3647',
-    'r/000/23/3649',
-    'r/000/23/3661',
-    'r/000/23/3710',
     'r/000/23/3726',
-    'r/000/23/3728',
-    'r/000/23/3773',
-    'r/000/23/3782',
-    'r/000/23/3815',
-    'r/000/23/3829',
-    'r/000/23/3831',
-    'r/000/23/3875',
-    'r/000/23/4102',
-    'r/000/23/4379',
-    'r/000/23/4395',
-    'r/000/23/4465',
-    'r/000/23/4470',
-    'r/000/23/4513',
-    'r/000/23/4578',
-    'r/000/23/4631',
     'r/000/23/4642',
-    'r/000/23/4656',
-    'r/000/23/4671',
-    'r/000/23/4672',
-    'r/000/23/4697',
-    'r/000/23/4749',
-    'r/000/23/4762',
-    'r/000/23/4790',
-    'r/000/23/4793',
-    'r/000/23/4797',
-    'r/000/23/4807',
-    'r/000/23/4847',
-    'r/a',
-    'r/h',
-    'r/n',
-    'r1(5)',
     'r1(8)',
-    'r1,500',
-    'r100,000,000',
-    'r10x',
-    'r110',
-    'r16(2)',
-    'r16(3)',
-    'r18(1)',
-    'r2(1)',
-    'r2+3',
-    'r2,000',
-    'r2.',
-    'r2.59(4)',
-    'r23',
-    'r24/31',
-    'r25\'s',
     'r25,000',
-    'r250',
-    'r26',
-    'r29',
-    'r290(1)',
-    'r2d2',
-    'r2y1',
-    'r3(1)',
-    'r3000a-based',
-    'r3000s',
-    'r3050',
-    'r342a4',
-    'r4.11(9)',
-    'r4.16(2)',
-    'r4.16(3)',
-    'r4.17',
     'r4.18(1)',
-    'r4.21(1)',
-    'r4.22',
-    'r4.7(2)',
-    'r4.7(5)',
-    'r4000/4400',
-    'r44',
-    'r5s',
-    'r65,000',
-    'r6644',
-    'r7(5)',
-    'r72,900',
-    'r74(1&ndash;205)',
-    'r74(1&ndash;256)',
-    'r76',
-    'r7fr60lb',
     'r8(4)',
-    'r95',
-    'r=-0.02',
-    'r=-0.36',
-    'r=-0.58',
-    'r=-0.61',
-    'r=-0.63',
-    'r=0.1',
-    'r=0.27',
-    'r=0.28',
-    'r=0.38',
-    'r=0.41',
-    'r=0.43',
-    'r=0.44',
-    'r=0.47',
-    'r=0.49',
     'r=0.50',
-    'r=0.56',
-    'r=0.57',
-    'r=0.64',
-    'r=0.69',
-    'r=0.74',
-    'r=0.76',
-    'r=0.91',
-    'r=0.939',
-    'ra&formula;d',
-    'ra\'ayat',
-    'ra-treated',
-    'raan',
-    'raargh',
-    'raba',
-    'rabalais',
     'rabaud',
-    'rabb',
-    'rabbah',
-    'rabbit-fur',
-    'rabbit-infested',
-    'rabbit-nibbled',
-    'rabbit-sized',
-    'rabbitohs',
-    'rabbitry',
-    'rabelasian',
-    'rabenstein',
-    'rabi-flopping',
-    'rabiana',
-    'rabie',
-    'rabinovitz',
-    'rabinowicz',
     'rabinowitch',
-    'rabiou',
-    'rabochii',
-    'raboutou',
-    'rabson',
-    'racal-redac',
-    'race-awareness',
-    'race-based',
-    'race-driving',
-    'race-linked',
-    'race-relations',
-    'race-winning',
-    'racecard',
-    'racemes',
-    'racemosa',
-    'racereaders',
     'rachlin',
-    'racialised',
-    'racially-motivated',
-    'racisme',
-    'rack-supported',
-    'rackemann',
-    'raconteurs',
-    'racquel',
-    'racy-looking',
-    'rad.',
-    'radagunda',
-    'radah',
-    'radanielson',
-    'radar-dark',
-    'radar-evading',
-    'radar-guided',
     'radar-like',
-    'radda',
-    'radhakrishna',
-    'radhakrishnan',
-    'radhost',
-    'radiata',
-    'radiation-related',
-    'radic',
-    'radical-democratic',
-    'radical-socialist',
-    'radicalesbians',
-    'radicalize',
-    'radicalness',
-    'radichio',
-    'radiesthesic',
-    'radikale',
     'radio-assisted',
-    'radio-based',
-    'radio-chemical',
-    'radio-isotopes',
-    'radio-mike',
-    'radio-projected',
-    'radio-sources',
-    'radio-telephone',
-    'radio-television',
-    'radio-waves',
-    'radio/tv',
-    'radio/tv/newspaper',
-    'radioactive-waste',
-    'radioassay',
-    'radioastronomers',
-    'radiobiological',
     'radiocarbon-dating',
-    'radiocative',
-    'radiochemistry',
-    'radiof&oacute;nica',
-    'radiograms',
-    'radiographically',
-    'radioiodine',
-    'radiolabeled',
-    'radiolabelling',
-    'radiologic',
-    'radiometry',
-    'radiopharmaceutical',
-    'radiophone',
-    'radiotelemetry',
-    'radiotelescope',
-    'radiotelescopes',
     'radishchev',
-    'radnaaragchaa',
-    'radoje',
-    'radome',
-    'radomsky',
-    'radon-proof',
-    'radzinsky',
-    'radzivil',
-    'raech',
-    'rael',
-    'raeto-romansch',
-    'raf-manned',
-    'rafeill',
-    'rafflesia',
-    'raftsman',
-    'rag-1x',
     'rag-glad',
-    'rag-pickers',
-    'ragg',
-    'ragged-arsed',
-    'raggle',
-    'raghbir',
-    'raghib',
-    'ragini',
-    'ragnallson',
-    'ragnhild',
-    'ragpicker',
-    'rags-to&rehy;riches',
-    'ragus',
-    'ragworms',
-    'ragworth',
-    'rahaga',
     'rahamane',
-    'rahdy',
-    'rahewin',
-    'rahmani',
-    'rahn',
-    'rahnd',
-    'rahsaan',
-    'raibeirt',
-    'raich',
-    'raid-1',
-    'raife',
-    'raiffa',
-    'rail-mx',
-    'rail-roads',
-    'rail/bus',
-    'railaco',
     'railgun',
-    'railnews',
-    'railway-builders',
-    'railway-trucks',
-    'railwayed',
-    'rain-bearing',
-    'rain-drops',
-    'rain-maker',
-    'rain-smeared',
-    'raincheck',
-    'rained-off',
-    'rained-on',
-    'rainfed',
-    'raingeese',
-    'rainhood',
-    'rainiest',
     'rainin\'',
-    'rainow',
-    'rainsoaked',
-    'rainton',
-    'raised-sides',
-    'raisian',
-    'raisings',
-    'raisley',
-    'raison_d\'&euml;tre',
-    'raisonnes',
-    'rajastan',
-    'rajat',
-    'rakim',
-    'rakisons',
-    'rakotoarison',
-    'rakotoniaina',
     'raku',
-    'rakusen',
-    'raleigh-banana',
-    'raleighs',
-    'rallentandos',
-    'rallier',
-    'rallo',
-    'rallying-point',
-    'ram-raids',
-    'ramalho',
-    'raman-active',
-    'raman-shifted',
-    'ramanna',
-    'ramasut',
-    'ramat-gan',
-    'ramazanoglu',
     'ramazzini',
-    'ramba',
-    'rambeau',
-    'ramblin\'',
-    'rambunctious',
-    'rambutan',
-    'ramgarhia',
-    'ramification',
-    'ramjee',
-    'ramjuttun',
-    'ramlakhan',
-    'rammell',
-    'rammelsberg',
-    'rammingen',
-    'ramo',
-    'ramolino',
     'ramp-ups',
-    'rampton/swann',
-    'rampway',
-    'ramsammy',
-    'ramsays',
-    'ramsdens',
-    'ramsey-optional',
-    'ramsfield',
-    'ramsgate&ndash;dunkirk',
-    'ramsland',
-    'ramtallie',
-    'ramuz',
-    'ran-out',
-    'ranaldo',
-    'ranch-type',
-    'randalli',
     'randily',
-    'randlay',
-    'randomer',
-    'randung',
-    'ranetta',
-    'rangeley',
-    'rangers-celtic',
-    'rangers-leeds',
-    'rangeworthy',
-    'rangstr&ouml;m',
-    'rank-aldis',
-    'rank-frequency',
-    'rank-size',
-    'rankin/leicestershire',
-    'rankness',
-    'rankovi&cacute',
     'rannou',
-    'ransacks',
-    'rantona',
-    'ranwell',
-    'ranworth',
-    'raob',
-    'raoc/efi',
-    'raouche',
-    'rap30/74',
-    'rap74s',
-    'rapaciousness',
-    'rapd',
-    'rape.',
-    'raphaels',
-    'raphe',
-    'rapid-strike',
     'rapid-transit',
-    'rapidly.',
-    'rapier-like',
-    'rapinet',
-    'rapley',
-    'rappin\'',
-    'rappresentata',
-    'rappresentativo',
-    'rapsodie',
-    'raqabah',
-    'rarden',
-    'rare-air',
-    'rare-binding',
-    'rare.and',
-    'rarefication',
-    'rari',
     'rarick',
-    'rariorum',
-    'rasalhague',
-    'rasc',
-    'rascasse',
-    'rasgrf',
-    'rasha',
-    'rashaf',
-    'raskovic',
-    'rasmus',
-    'rasoul',
-    'raspberry-coloured',
-    'rass',
-    'rassells',
-    'rassy',
-    'rastadt',
     'rasterisation',
-    'rastislav',
-    'rastrellamenti',
-    'rat-holes',
-    'ratangrian',
-    'ratchet-and-pawl',
-    'ratchet-like',
-    'ratcliffes',
-    'rate-books',
-    'rate-calls',
-    'rate-free',
-    'rate-paying',
-    'rate-slowing',
-    'rate-the',
-    'rateably',
-    'ratemahatmayas',
     'rathdowney',
-    'rathgael',
-    'rathlesholm',
-    'ratifiable',
-    'ratio\'',
-    'ration-book',
-    'ration-books',
-    'rational/economic',
-    'rational/legal',
-    'rationalities',
-    'rationalizes',
-    'rations.',
-    'ratjada',
-    'ratky',
-    'rattail',
-    'rattakul',
     'rattanakoses',
-    'ratte',
-    'rattle-free',
-    'ratty-looking',
-    'raucana',
-    'raulini',
-    'ravaged-looking',
-    'ravanelli',
-    'ravar',
-    'ravasio',
-    'ravell/a-level',
-    'raveloson-mahasampo',
-    'ravenshad',
-    'ravenstones',
-    'raviv',
-    'raw/thames',
     'rawlbolts',
-    'rawle/organiser',
-    'rawlinsons',
-    'rawlplugs',
-    'rawstron',
-    'rawyards',
-    'ray-florets',
-    'ray-guns',
-    'ray-tracing',
-    'ray-vibrations',
-    'ray/father',
-    'ray/mother',
-    'rayburns',
-    'raychaudhuri',
-    'rayden',
-    'raye',
     'rayful',
-    'raykat',
-    'rayle',
-    'rayles',
-    'raylton',
-    'rayman',
-    'raymond-guillaume',
-    'raymundo',
-    'rayney',
-    'rayosan',
-    'raystar',
-    'raywell',
-    'razaq',
-    'razgrad',
-    'raznjatovic',
-    'razno',
     'razor-like',
-    'razvan',
-    'razzell',
-    'rb\'c',
-    'rb-sr',
-    'rb.211',
-    'rba',
-    'rbas',
-    'rbg&mdash;2',
-    'rbg-copyright',
-    'rbmk-1000',
-    'rbmk-type',
-    'rbos',
-    'rbs140,000',
-    'rbs250,000',
-    'rbs26,000',
     'rbs40,000',
-    'rbs500',
-    'rc1',
-    'rc15k',
-    'rc30',
-    'rc6',
-    'rc7+',
-    'rca/col',
-    'rcds',
-    'rck',
-    'rcr',
-    'rcs5',
-    'rd54',
-    'rdbaccess',
-    'rdbi.dat',
-    'rdbiconfiguration',
     'rdcs',
-    'rdg',
-    'rdms',
-    'rdr',
-    'rds-eon',
-    'rdsv',
-    're&ccedil;it',
-    're&rehy;tightening',
-    're-acquisition',
-    're-active',
-    're-address',
-    're-admitting',
-    're-afforest',
-    're-align',
-    're-appearing',
-    're-approval',
     're-architecting',
-    're-arrangements',
-    're-asserting',
-    're-asserts',
-    're-assigning',
-    're-assignment',
-    're-assume',
-    're-assure',
-    're-attach',
-    're-authorisation',
-    're-awakens',
-    're-baiting',
-    're-calculate',
-    're-christen',
-    're-circulate',
-    're-claimed',
     're-classification',
-    're-coded',
-    're-combination',
-    're-compilation',
-    're-composition',
-    're-configuration',
-    're-connection',
-    're-conquest',
-    're-convene',
-    're-cook',
-    're-cross',
-    're-dedicate',
-    're-defines',
-    're-divided',
-    're-don',
-    're-electable',
     're-eligible',
-    're-embark',
-    're-emission',
-    're-emphasize',
-    're-employing',
-    're-encode',
-    're-endorsement',
-    're-endowed',
-    're-enforcing',
-    're-evangelisation',
-    're-evolution',
-    're-examines',
-    're-experiencing',
-    're-express',
-    're-fighting',
-    're-fits',
     're-fix',
-    're-folded',
-    're-forestation',
-    're-formulate',
-    're-fought',
-    're-generating',
-    're-growth',
-    're-hash',
-    're-hire',
-    're-imburse',
-    're-imbursed',
-    're-implant',
-    're-implementation',
-    're-incarnation',
-    're-incorporation',
-    're-infection',
     're-inforce',
-    're-inforcements',
-    're-initialises',
-    're-insertion',
-    're-installing',
-    're-interview',
-    're-interviewing',
-    're-investing',
-    're-invigorate',
-    're-iterates',
-    're-kindle',
-    're-label',
-    're-lent',
-    're-light',
-    're-locations',
-    're-making',
     're-mark',
-    're-melting',
-    're-mixes',
-    're-modularised',
-    're-moulding',
-    're-mystification',
-    're-name',
-    're-numbered',
-    're-nutriv',
-    're-occurrence',
-    're-occurs',
-    're-orchestrations',
-    're-orderings',
-    're-organizations',
-    're-oxygenate',
-    're-polishing',
     're-posing',
-    're-positions',
-    're-prioritisation',
-    're-proofing',
-    're-raffled',
-    're-readable',
-    're-reads',
-    're-regression',
-    're-regulatory',
-    're-releases',
-    're-replicated',
-    're-sat',
-    're-seed',
-    're-settlement',
-    're-sheathed',
-    're-specified',
     're-specifying',
-    're-spray',
-    're-staged',
-    're-stand',
-    're-starts',
-    're-stocked',
-    're-synthesis',
-    're-taken',
-    're-tie',
-    're-title',
-    're-took',
-    're-traced',
-    're-transmission',
-    're-try',
-    're-tuning.',
-    're-tying',
     're-tyred',
-    're-unified',
-    're-unites',
-    're-uses',
-    're-visits',
-    're-vitalise',
-    're-workings',
-    're-wrapped',
-    're-zoning',
-    're:606',
-    're:sterland',
-    're:vision',
-    'reach-me-downs',
-    'reacquaintance',
-    'reactions.',
-    'read&num',
     'read-and-react',
-    'read-me',
-    'read.me',
-    'reade/tree',
-    'reader-friendly',
-    'reader-printer',
-    'reader.',
-    'reader/listener',
-    'readily-identifiable',
-    'readmitting',
-    'ready-compressed',
-    'ready-flavoured',
-    'ready-money',
-    'ready-set-go',
-    'ready-to-bake',
-    'ready-to-drink',
     'ready-to-hand',
-    'ready-to-roll',
-    'readymoney',
-    'reaf',
-    'reag',
-    'reagan-like',
-    'reagan-thatcher',
-    'reagan/bush',
-    'reagentless',
-    'real/nominal',
-    'real/star',
-    'realigns',
-    'realis',
-    'realisms',
-    'realistes',
-    'realistic.',
     'reality\'',
-    'realityengine2',
-    'reallocates',
-    'reals.',
-    'realtimex',
-    'reames',
-    'reanimate',
-    'reanimating',
-    'reannealed',
-    'reapproval',
-    'rearer',
-    'rearfoot.',
-    'rearticulation',
-    'reascend',
-    'reaseheath',
-    'reason-able',
     'reason/result',
-    'reassesses',
-    'reassumes',
-    'reattachment',
-    'reattributions',
-    'reauthorised',
-    'reavill',
-    'reawoken',
-    'reba',
-    'rebadging',
-    'rebalanced',
-    'rebeldes',
-    'rebend',
-    'rebidding',
-    'rebids',
-    'rebind',
     'reboil',
-    'rebonio',
-    'reboredo',
-    'rebuffing',
-    'rebutt',
-    'recalculating',
-    'recalde',
-    'recalibrating',
-    'recapitalize',
-    'recbc',
-    'rece',
-    'receipting',
-    'receiver(s)',
-    'receiveth',
-    'receiving-station',
-    'recensions',
     'recent-looking',
-    'recently-built',
-    'recently-created',
-    'recently-discovered',
-    'recently-launched',
-    'recently-passed',
-    'recently-purchased',
-    'recently-released',
-    'recentralised',
-    'recentralization',
-    'reception/waiting',
-    'receptionist/telephonist',
-    'receptively',
-    'receptor-orientated',
-    'recession-battered',
-    'recession-blighted',
     'recession-ravaged',
-    'recession-resistant',
-    'recession-weary',
-    'recessives',
-    'rechange',
-    'rechannel',
-    'rechannelling',
-    'recht',
-    'recidivant',
-    'recidivists',
-    'recipient(s)',
-    'reciprocal-non-reciprocal',
-    'reciprocations',
-    'recircularization',
-    'recitativo',
-    'recived',
     'reckermann',
-    'reckman',
-    'reckoner',
-    'reckoners',
-    'reclin',
-    'reclusiveness',
-    'reco',
-    'recoalification',
-    'recognicionesjeodorum',
-    'recognisance',
-    'recollective',
-    'recolleters',
-    'recolonization',
-    'recolonize',
-    'recolonizing',
-    'recomendations',
     'recomended',
-    'recommen',
-    'recommendation.',
-    'recommendatory',
-    'recommitment',
-    'recomposing',
-    'reconceptualise',
-    'reconcilers',
-    'reconciliatory',
-    'reconfigurations',
-    'reconquering',
-    'reconstitutable',
-    'reconstru&ccedil;ao',
-    'reconstrue',
-    'recontamination',
-    'recontextualization',
     'recontextualize',
-    'record(s)',
-    'record-beating',
-    'record-books',
-    'record-collectors',
-    'record-mode',
-    'record-of-achievement',
-    'record-playback',
-    'recordbreaking',
-    'recordists',
-    'recordites',
-    'records-of-achievement',
-    'records/client',
-    'recoups',
-    'recovered.',
-    'recriminalisation',
     'recruit-tainted',
-    'rectangularisation',
-    'recte',
-    'rectitudines',
-    'rectitudo',
-    'rectovaginal',
-    'rectums',
-    'reculer',
-    'recumbant',
-    'recumbents',
-    'recuperability',
-    'recurled',
-    'recurvifolium',
-    'recurvirostra',
-    'red&rehy;covered',
-    'red&rehy;pointing',
     'red-and-blue',
-    'red-and-green',
-    'red-barked',
-    'red-based',
-    'red-beds',
-    'red-browns',
-    'red-carded',
-    'red-cell',
-    'red-chalk',
-    'red-checked',
-    'red-claw',
-    'red-deer',
-    'red-fox',
-    'red-hooded',
-    'red-lacquered',
-    'red-lipped',
     'red-neck',
-    'red-necks',
-    'red-petticoat',
-    'red-sashed',
-    'red-shifts',
-    'red-skinned',
-    'red-stemmed',
-    'red-tinted',
-    'red-topped',
-    'red-violet',
-    'red-white-and-blue',
-    'red-wine',
-    'red-wings',
-    'red-yellow',
-    'red/white',
-    'redbreasts',
     'redcastle',
-    'reddcliff/raf',
-    'reddendum',
-    'reddi',
-    'redding/thames',
-    'reddish-black',
-    'reddish-blond',
-    'reddish-fair',
-    'reddish-gold',
-    'reddish-green',
-    'reddish-grey',
-    'reddish-purple',
-    'reddish-yellow',
-    'rededicating',
-    'redemocratisation',
-    'redemption.',
     'redeposition',
-    'redetermining',
-    'redfields',
-    'redgate',
-    'redgrove',
-    'redha',
-    'redheugh',
-    'redheughs',
-    'redhills',
-    'redhouse',
-    'redi-hot',
-    'rediscountable',
-    'redknap',
-    'redlaw',
-    'redlegs',
-    'redlynch',
     'redmonds',
-    'rednose',
-    'redonda',
-    'redpoint',
-    'redring',
-    'redrive',
-    'redsell',
-    'reduced-memory',
-    'reduct',
-    'reduction.',
-    'reductionists',
-    'reduictes',
-    'redundance',
-    'reduplicate',
-    'reduplicates',
-    'reduty',
     'redvers-jones',
-    'redwald',
-    'redwall',
-    'redwick',
-    'redworms',
-    'reebok/running',
-    'reedier',
-    'reediness',
-    'reeding',
-    'reef-like',
-    'reekers',
-    'reema',
-    'reemphasise',
-    'reemphasised',
-    'reena',
-    'reentry',
     'reep',
-    'reeper',
-    'reevesiana',
-    'reevley',
-    'reexamining',
-    'ref.19',
-    'ref.20',
-    'ref.25',
-    'ref.id',
-    'refandweights',
-    'refandwgt',
-    'referee(s)',
-    'referendary',
-    'referrable',
-    'refik',
-    'refine/c',
     'refirm',
-    'reflection-to-go',
-    'reflectives',
-    'reflexiveness',
-    'refounding',
-    'refractive-index',
-    'refratition',
-    'refreshment-trolley',
-    'refridgeration',
-    'refurnish',
-    'refuse-derived',
-    'refuse-fired',
-    'regaird',
-    'regala',
-    'regalis',
-    'regd',
     'regenerations',
-    'regenerator',
-    'regenerators',
-    'reges',
-    'regevanu',
-    'reggiani',
-    'regicidal',
-    'regild',
-    'regilding',
-    'regim&eacute',
-    'regiomontanus',
-    'region\'',
-    'region(s)',
-    'regional/class',
-    'regional/national',
-    'regione',
     'regions/countries',
-    'regions/nations',
-    'register.com',
-    'registratiod',
-    'registration/booking',
-    'regmi',
-    'regnavit',
-    'regneville',
-    'regradings',
-    'regressor',
-    'regressors',
-    'regroups',
-    'regular-interval',
-    'regular/block',
-    'regularly-occupied',
-    'regularly-updated',
     'regurge',
-    'regusse',
-    'rehabilitations',
-    'rehabilitators',
-    'rehana',
-    'reheard',
-    'rehearser',
-    'rehiring',
-    'rehybridized',
-    'reich-prussia',
-    'reichek',
-    'reichman',
-    'reichskristallnacht',
-    'reichsmusikkammer',
-    'reid/school',
-    'reidel',
     'reidle',
-    'reign-years',
-    'reigneth',
-    'reillys',
-    'reimplanted',
-    'reimprisonment',
-    'reinaugurated',
-    'reinberg',
-    'reindeerland',
-    'reineckii',
-    'reinette',
-    'reinfarctions',
-    'reinjected',
-    'reinke',
-    'reinstadler',
-    'reintjes',
     'reinvents',
-    'reinvestigating',
-    'reinvestments',
-    'reisin',
-    'reit',
-    'reithian',
-    'reitsma',
-    'reivich',
-    'rejected.',
-    'rejectionists',
-    'reksten',
-    'rektum',
-    'rel.',
-    'relaparotomy',
-    'relarn',
-    'relation-ship',
     'relation-ships',
-    'relational-to-object',
-    'relatively-small',
-    'relatives.',
-    'relatum',
-    'relaxedly',
-    'relaxman',
-    'releaser',
-    'releasers',
-    'relegation-fighting',
-    'relekto',
-    'relev&eacute;s',
-    'relevancies',
-    'relevations',
-    'reliab',
-    'reliabilities',
     'relicense',
-    'relicta',
-    'relictum',
-    'relief-',
-    'relievers',
-    'religio',
-    'religion/stance',
-    'religious-intellectual',
-    'religious-like',
-    'reliques',
-    'rellies',
-    'remagen',
-    'remain&lsqb;ed&rsqb',
-    'remainder.',
-    'remane',
-    'remarkables',
     'remarketed',
-    'remarque',
-    'remeber',
-    'remediate',
-    'rememberable',
-    'rememberings',
-    'remembrancers',
-    'remengesau',
-    'remerciments',
-    'remexio',
-    'remilitarisation',
-    'remindin\'',
-    'remington/daily',
-    'remis',
-    'remittable',
-    'remittent',
     'remobilised',
-    'remon',
-    'remonstration',
-    'remorselessness',
-    'remotely-piloted',
-    'removeable',
-    'rempel',
-    'remtox',
-    'remuera',
-    'renacena',
-    'renaldo',
-    'rename&gt',
-    'renaturation',
-    'renaudat',
-    'renault-volvo',
-    'renbourne',
     'renderer',
-    'rendjambe',
-    'rene/',
-    'reneberg',
-    'renegotiates',
-    'reneiski/zuravski',
-    'renger',
-    'rengo',
-    'renilson',
-    'renin-angiotensin-aldosterone',
-    'renk',
-    'rennes-le-ch&acirc;teau',
-    'rennes-le-chateaux',
-    'renominate',
-    'renooij',
-    'renory',
     'renouard',
-    'renovador',
-    'renovates',
-    'renovatio',
-    'renqiong',
-    'rent-a-mob',
-    'rent-collectors',
-    'rent-seekers',
-    'rentas',
-    'rentbook',
-    'renter',
-    'rents-to-mortgage',
-    'reobstruction',
-    'reoffends',
-    'rep&ecirc;chage',
-    'repackages',
     'repaird',
-    'repatination',
-    'repeats.',
-    'repelita',
-    'repellants',
-    'repenter',
-    'repetetive',
-    'repetitio',
-    'repetitiously',
-    'rephidim',
-    'rephrases',
-    'repillared',
-    'repl',
-    'replacment',
-    'replaster',
-    'replayable',
     'repletes',
-    'replys',
-    'repolarization',
-    'repolarizing',
-    'report-style',
-    'report-writing',
-    'reported.',
-    'reposeful',
-    'repository-based',
-    'repr',
-    'repr.',
-    'reprehend',
-    'reprehensibly',
-    'representable',
-    'representative-number',
-    'repressible',
     'reprice',
-    'reprintings',
-    'reprising',
-    'reprivatized',
-    'reproductory',
-    'reproposed',
-    'reptile/amphibian',
-    'repubblicano',
-    'republic-wide',
-    'republicain',
-    'republican-held',
-    'republican-liberal',
-    'repudiations',
-    'reputation-commitment',
-    'requ',
-    'requalify',
     'requires-access-to',
-    'requiris',
-    'requitement',
-    'rerio',
-    'rerr',
-    'resalable',
-    'resampa',
-    'rescripts',
-    'rescusitation',
-    'research-minded',
-    'reseed',
-    'resemblant',
-    'resemblence',
-    'resentencing',
-    'reserch',
-    'resettle&rehy;ment',
     'resharpened',
-    'reshot',
-    'resident-general',
-    'residential/studio',
-    'residents.',
-    'residenz',
-    'residua',
-    'residualism',
-    'residues.',
-    'resign.',
-    'resignal',
-    'resilin',
-    'resin-based',
-    'resin-impregnated',
-    'resinated',
-    'resis',
     'resist&ecirc;ncia',
-    'resistent',
-    'resisto',
-    'resistor/diode',
-    'resol',
-    'resolder',
-    'resolutions.',
-    'resolv',
-    'resorative',
-    'resource-assisted',
-    'resource-consuming',
-    'resource-dependent',
-    'resource-starved',
-    'resource-weighted',
-    'respecification',
-    'respectables',
     'respectfulness',
-    'respects.',
-    'respirable',
-    'resplendant',
-    'respon',
-    'respondents.',
-    'response_to',
-    'responses_rather',
-    'responsib',
-    'responsibl',
-    'responsory',
-    'resposible',
-    'respun',
-    'ressler',
-    'restabilize',
-    'restacked',
     'restacking',
-    'restaffing',
-    'restarick',
-    'restaurant-car',
-    'restaurant-owner',
-    'restaurant/bar',
-    'restaurant/naafi',
-    'restauratrices',
-    'resteamed',
-    'restitching',
-    'restitutions',
-    'restr',
-    'restricted.',
-    'restriction-modification',
-    'restrictionist',
-    'resuited',
     'resultatively',
-    'results.txt',
-    'resum\'e',
-    'resummoned',
-    'resurrecci&oacute;n',
-    'resuscitations',
-    'resynthesis',
-    'ret01',
-    'retaliations',
-    'retardancy',
-    'retarder',
-    'retentionist',
-    'retentionists',
-    'reti',
-    'reticently',
-    'reticules',
     'reties',
-    'retighten',
-    'retinex',
-    'retinotopically',
-    'retinyl',
-    'retir&eacute;s',
-    'retireable',
-    'retired.',
-    'retirement.',
-    'retoucher',
-    'retractor',
-    'retranslate',
-    'retransmissions',
-    'retrials',
-    'retroarc',
-    'retroconversion',
     'retroflexed',
-    'retrorsum',
-    'retrovirus-mediated',
-    'retrying',
-    'return_for',
-    'retusa',
-    'retzius',
-    'reuenue',
-    'reuschel',
-    'reuses',
-    'reutlingen',
-    'reuven',
-    'revalorisation',
-    'revelationum',
-    'revellings',
-    'revelous',
     'revenants',
-    'revendication',
-    'revenge-seeking',
-    'revenko',
-    'revenue-approved',
-    'revenue-earner',
-    'revenue-earners',
-    'revenue-neutral',
-    'revenue-sharing',
-    'reverbatory',
-    'reverse-',
-    'reverse-biased',
-    'reverse-punch',
-    'reverse-punching',
-    'reversed.',
-    'revertants',
     'revesz',
-    'review-articles',
-    'revis',
-    'revisal',
-    'revitalises',
-    'revocability',
-    'revolosiona',
-    'revolutionariness',
-    'revolutionary-liberation',
-    'revolutionises',
-    'revs.',
-    'rewardingly',
-    'rewashed',
-    'rewelding',
-    'rewirable',
-    'rewires',
     'reword',
-    'rewordings',
-    'rexa',
-    'rexhep',
-    'rexive',
-    'rey/stunt',
-    'reyjavik',
-    'reyners',
-    'reyney',
-    'reynolds/farmer',
-    'reynsford',
-    'rezwanul',
-    'rezzori',
-    'rf141',
-    'rf6',
-    'rf8',
     'rfas',
-    'rfd1',
-    'rfd7',
-    'rfms',
-    'rg/00/22/2005',
-    'rg11',
-    'rg550',
-    'rg9',
-    'rgc',
-    'rgr',
-    'rgt',
-    'rh&ocirc;-poulenc',
-    'rh(co)',
-    'rh10',
-    'rh13',
-    'rhabditiform',
     'rhabdoms',
-    'rhabdomyolysis',
-    'rhapsodising',
-    'rhapsodized',
-    'rhb',
-    'rhc',
-    'rheade',
-    'rheidity',
-    'rheineisen',
-    'rheingau',
-    'rheinlaender',
-    'rhemes',
-    'rheologists',
-    'rheometer',
-    'rheophyte',
-    'rheostat',
     'rhesus-negative',
-    'rhetor',
-    'rhetoricus',
-    'rheumaticky',
-    'rheumatologists',
-    'rhggf-ii',
-    'rhine-main',
-    'rhinelander',
-    'rhinog',
-    'rhinologically',
-    'rhinoviruses',
-    'rhipidistias',
-    'rhizobial',
-    'rhizosolenia',
-    'rhodesian-born',
-    'rhodies',
     'rhodnius',
-    'rhodopsin-like',
-    'rhodopsins',
-    'rhoeas',
-    'rhos-',
-    'rhosddu',
-    'rhoson-sea',
-    'rhu',
-    'rhuad',
-    'rhydderch',
-    'rhydyronen',
-    'rhyme-royal',
-    'rhynns',
-    'rhyns',
-    'rhytons',
-    'ri-digested',
     'riacs',
-    'riad',
-    'riane',
-    'riazan',
-    'riazan\'',
-    'ribbonmen',
-    'ribemont-sur-ancre',
-    'ribli',
-    'ribnica',
-    'ribnitz',
-    'ribonucleotides',
-    'ribot',
-    'ribotriphosphates',
-    'ribozyme',
-    'ribozymes',
-    'ribstein',
     'ricchar',
-    'ricciarda',
-    'ricciarelli',
-    'rice-field',
-    'rice-flail',
-    'rice-paper',
-    'ricefield',
-    'ricefields',
-    'rich-coloured',
-    'rich-quick',
-    'richard\'',
-    'richards-style',
-    'richardson/community',
-    'richardson/julie',
-    'richardsonian',
-    'richardus',
     'richelda',
-    'richenda',
-    'richest-ever',
-    'richly-dressed',
-    'richon',
-    'ricinus',
-    'rickert',
-    'ricketty',
-    'rickling',
-    'rickmondsworth',
-    'ricondall',
-    'ridders',
-    'riddington',
-    'riddlesworth',
-    'riddrie',
-    'ride/handling',
     'rideau',
-    'rided',
-    'ridell',
-    'ridge-filler',
-    'ridge-like',
-    'ridgeons',
-    'ridgewood',
-    'ridgeworth',
-    'ridgy',
-    'ridin\'',
-    'riding-boots',
-    'riding-breeches',
-    'riding-habit',
-    'riding-stable',
-    'ridleys',
-    'ridpath',
     'rieder',
-    'riefenstahl',
-    'riehl',
-    'rieken',
-    'riemersma',
-    'riemmelth',
-    'riera',
-    'riessa',
-    'rieux',
-    'rifeness',
-    'riffraff',
-    'rififi',
-    'rig-veda',
-    'rig.',
-    'rigge',
-    'riggin\'',
     'right&dollar',
-    'right&mdash;the',
-    'right-arm',
-    'right-context',
-    'right-facing',
-    'right-left',
-    'right-most',
-    'right-o',
-    'right-to-die',
-    'right-to-know',
-    'right-to-lifers',
-    'right-wingery',
-    'right.hand',
-    'rightest',
-    'rightie',
-    'rights-holders',
     'rigidifolius',
-    'rigidness',
-    'riglos',
-    'rignomer',
-    'rigoristic',
-    'rijp',
-    'rijper',
-    'rikei',
-    'rikke',
-    'rilwanu',
-    'rim-suardal',
-    'rimac',
-    'rimatron',
-    'rimfall',
-    'rimlinger',
-    'rimo',
     'rimsky-korsakoff',
-    'rimwards',
-    'rinderpest',
-    'rindless',
-    'ring-a-ding-ding',
-    'ring-a-ring-o\'-roses',
-    'ring-bedecked',
-    'ring-doughnut',
-    'ring-doves',
-    'ring-handles',
-    'ring-rusty',
-    'ring-side',
-    'ring-tails',
-    'ring/open-ended',
-    'ringen',
-    'ringford',
     'ringi-ko',
-    'ringing.',
-    'ringlow',
-    'ringness',
-    'ringsider',
-    'ringsted',
-    'ringtons',
-    'rinkfels',
-    'rinn',
-    'rinnal',
-    'rinnin',
-    'rinse-aid',
-    'rinse-and-hold',
-    'rinse-off',
-    'rinseability',
-    'rinsed-out',
     'rinv',
-    'riolo',
-    'riomaggiore',
-    'riothamus',
-    'riotsville',
-    'riphagen',
-    'ripman',
-    'ripoff',
-    'ripoll',
-    'riquewihr',
-    'risamburgh',
-    'risby',
-    'risc-centred',
-    'risc/6000',
-    'risc/unix',
-    'risca',
     'riscada',
-    'riscada/sparc',
-    'riscada/sparcx68k',
-    'rise-fall-rise',
-    'riseborough',
-    'riseholme',
-    'riseley',
-    'risin',
-    'risio',
-    'risk-decisions',
-    'risk-graded',
-    'risk-led',
-    'risk-management',
-    'risk-spreading',
-    'risk.',
-    'risk=0.13',
     'risk=0.33',
-    'riskfree',
-    'riso',
-    'risol',
-    'ritas',
-    'ritchie/wrg',
-    'rithauddeen',
-    'ritho',
-    'ritjemjokk',
-    'ritorno',
-    'ritterkreuz',
-    'ritts',
-    'ritual-constraints',
-    'ritualisation',
-    'ritualise',
-    'ritvo',
     'rivalage',
-    'rivaling',
-    'rivellese',
-    'river-banks',
-    'river-basin',
-    'river-borne',
-    'river-like',
-    'river-mouth',
-    'river-related',
-    'river-users',
-    'riverboats',
-    'rivergate',
-    'riverina',
-    'rives',
-    'rivetingly',
-    'rivetts',
     'riviello',
-    'rivierra',
-    'riviniana',
-    'riyanto',
-    'rizq',
-    'rja',
-    'rjp',
-    'rk-33r',
-    'rla1',
-    'rle',
-    'rlogin',
-    'rm6',
-    'rm=',
-    'rmbk',
-    'rml',
-    'rmmbr',
     'rms-to-dc',
-    'rn19',
-    'rnase-free',
-    'rnb',
-    'rnt',
-    'ro-',
-    'ro-24-7429',
-    'ro-31-8959',
-    'roachford',
-    'road-builder',
-    'road-makers',
-    'road-maps',
-    'road-menders',
-    'road-mending',
-    'road-network',
-    'road-walking',
     'road/',
-    'road/railway',
-    'roaders',
-    'roadhouses',
-    'roadmaker',
-    'roadmaking',
-    'roadname',
-    'roadnight',
-    'roadpeace',
-    'roadracing',
-    'roadstead',
-    'roadsters',
-    'roamers',
-    'roat&aacute;n',
-    'roatta',
-    'robat',
     'robbe',
-    'robbies',
-    'robbins/college',
-    'robeddow',
-    'robertianum',
-    'roberts/national',
-    'robertsen',
-    'robertsfield',
-    'robertson-macleod',
-    'robertsonian',
-    'robic',
-    'robinses',
-    'robinson-humphrey',
-    'robot-like',
-    'robotisation',
-    'robson/heart',
     'robu',
-    'robustum',
-    'rocca-saporiti',
-    'rochambeau',
-    'rochau',
-    'rock-boots',
-    'rock-controlled',
-    'rock-dance',
-    'rock-dwellers',
-    'rock-hopping',
-    'rock-pop',
-    'rock-shag',
-    'rock-still',
-    'rock/classical',
-    'rock/dance',
-    'rock/heavy',
     'rock/metal',
-    'rockafellas',
-    'rockclimbs',
-    'rockdwellers',
-    'rockefellers',
-    'rockendorfs',
-    'rockenschaub',
-    'rockerfellas',
-    'rocket-launcher',
-    'rocket-shaped',
-    'rockette',
-    'rockey',
-    'rockgear',
-    'rockhead',
-    'rocko',
-    'rocks.',
     'rockslide',
-    'rockspeak',
-    'rockswell',
-    'rocktastic',
-    'rocky/strach',
-    'rocky/wilko',
-    'rocstone',
-    'rod-butt',
-    'rodbard',
-    'rodbourne',
-    'roddlesworth',
-    'rodets',
-    'rodford',
-    'rodga',
-    'rodgers/cinema',
-    'rodins',
     'rodion',
-    'rodmore',
-    'rodnina',
-    'rodota',
-    'rodrick',
-    'roedowns',
-    'roesdahl',
-    'roeshus',
-    'roethke',
-    'roettiers',
-    'rog&eacute',
-    'rogart',
-    'rogerio',
-    'rogers/thames',
-    'rogervik',
-    'roghani',
     'rohatyn',
-    'rohrborn',
-    'rohrman',
-    'roine',
-    'roisterers',
-    'rokison',
-    'rokit',
-    'rokoko',
-    'rolandic',
-    'roldosist',
-    'roldosista',
-    'role-bearers',
-    'role-mappings',
-    'role-oriented',
-    'role-plays',
-    'role-relationships',
     'role-reversals',
-    'role-set',
-    'role-to-name',
-    'roles.',
-    'rolfy',
-    'roll-',
-    'roll-a-joint',
-    'roll-crushers',
-    'roll-necked',
-    'roll-on/roll-off',
-    'roll-royce',
-    'rollason',
-    'rolled-in',
-    'rolled-top',
-    'roller-coastered',
-    'roller-cutter',
     'roller-reefed',
-    'rollercoasters',
-    'rollerskated',
-    'rollersnakes',
-    'rollick',
-    'rollinson',
-    'rolliver',
-    'rolls-bentley',
-    'roly-polys',
-    'rom-aid',
-    'roman-8',
-    'roman/sanchez',
-    'romand',
-    'romanian-hungarian',
-    'romano-ward',
-    'romanova',
     'romansch',
-    'romanticizes',
-    'romantick',
-    'rombo',
-    'rombouts',
-    'romerholz',
-    'romesbeoch',
-    'romeyn',
-    'romni',
-    'romolo',
-    'romosinuano',
-    'romseys',
-    'romusha',
-    'ronalds',
-    'ronas',
-    'ronbar',
     'rondieaoux',
-    'ronga',
-    'rongo',
-    'roni',
-    'roniti',
-    'ronneby',
-    'roobish',
-    'roocroft',
-    'roof-bolt',
-    'roof-lights',
-    'roof-spaces',
-    'roof-trees',
-    'roofings',
-    'rooflessness',
-    'rooflights',
-    'roofracks',
     'roofspace',
-    'roofwork',
-    'rooky',
-    'room-height',
-    'room-only',
-    'room-sharing',
-    'room-size',
-    'room-sized',
-    'room/dining',
-    'room/kitchen',
-    'room/study',
-    'roomf',
-    'roomiest',
-    'roominess',
-    'rootball',
-    'rooth',
     'rootlet',
-    'rootling',
-    'rope-biting',
-    'rope-burned',
-    'rope-knot',
-    'rope-makers',
-    'rope-soled',
-    'roped-in',
-    'ropemen',
-    'ropivia',
-    'rorbu',
-    'roriz',
-    'rorty',
-    'ros&eacute;s',
-    'rosaceae',
-    'rosadini',
     'rosandra',
-    'rosanilines',
-    'rosarium',
-    'rosbif',
-    'rosbifs',
-    'roscor',
-    'rose\'',
-    'rose-bay',
-    'rose-edged',
-    'rose-filled',
-    'rose-hip',
-    'rose-hips',
-    'rose-hued',
-    'rose-purple',
-    'rose-shaded',
-    'rose-smith',
     'rose-tree',
-    'rose-trimmed',
-    'rose/',
-    'rose/auction',
-    'rose/milliner',
-    'rosebed',
-    'rosel',
-    'roselawn',
-    'roseline',
-    'roselyn',
-    'rosemarkie',
-    'rosemberg',
-    'rosenbergs',
-    'rosenburger',
-    'rosencranz',
-    'rosenheim',
     'rosenman',
-    'rosenoir-kernaghan',
-    'rosentiel',
-    'roser',
-    'roses-round-the-door',
-    'roseus',
-    'rosevale',
-    'rosewall',
-    'roseworth',
-    'rosie-posie',
-    'rosignano',
-    'roslea',
-    'rosmamund',
-    'rosmarinus',
-    'rosove',
-    'ross-milbanks',
     'rossa-1',
-    'rossalls',
-    'rosscarberry',
-    'rosshead',
-    'rossi/nightclub',
-    'rossie',
-    'rossiiskaya',
-    'rossillion',
-    'rossitters',
-    'rossminster',
-    'rostislav',
-    'rostovtzeff',
-    'rostra',
-    'roswitha',
-    'rot-weiss',
-    'rotanev',
     'rotavator',
-    'rotberg',
-    'rotenturmstrasse',
-    'rotherheath',
-    'rothery',
-    'rothes',
-    'rothiemurchus',
-    'roto',
-    'rotofac',
-    'rotteck',
-    'rottenest',
-    'rotterdam&mdash;antwerp',
-    'rotundifolium',
-    'rotundly',
-    'rotweiler',
-    'rouah',
     'rouan',
-    'rouard-snowman',
-    'roubik',
-    'roud-up',
-    'roudette',
-    'roue',
-    'roues',
-    'rouge-controlled',
-    'rougerie',
-    'rough-barked',
-    'rough-chopped',
-    'rough-scented',
-    'rough-skinned',
-    'rough-trade',
-    'roughead',
-    'roughed-up',
     'roughing-up',
-    'rouillan',
-    'roul',
-    'roulettes',
-    'roullier',
-    'roumain',
-    'roumanians',
-    'roumeliotis',
-    'round-bellied',
-    'round-cornered',
-    'round-leaved',
-    'round-necks',
-    'round-off',
-    'round-out',
-    'round-wound',
-    'roundarm',
     'roundest',
-    'roundjan.',
-    'roundneck',
-    'roundsmen',
-    'roundups',
-    'roundwound',
-    'rouse/postman',
-    'rousers',
-    'rousingly',
-    'rousseauesque',
-    'roustabouts',
-    'route-following',
-    'routemap',
-    'router-based',
-    'routerman',
-    'routineness',
     'routing/load',
-    'routley',
-    'routly',
-    'rouundabouts',
-    'rovatti',
-    'row-boat',
-    'row-column',
-    'row/oxfordshire',
-    'rowan-webb',
-    'rowbottom/chipping',
-    'rowbottom/didcot',
-    'rowbottom/haddenham',
-    'rowbottom/luton',
-    'rowbottom/stanton',
-    'rowdily',
-    'rowelled',
     'rowf',
-    'rowland/agricultural',
-    'rowlandsons',
-    'rowling',
-    'rowy',
-    'roxboro',
-    'roxton',
-    'roxwell',
-    'royal-iced',
-    'royal-oak',
-    'royales',
-    'royalty-based',
-    'royen',
-    'royer',
-    'roygar',
-    'royle/director',
     'royne',
-    'royst',
-    'rozenberg',
-    'rp-1',
-    'rpc-based',
-    'rpcp',
-    'rpdc',
-    'rpecvd',
-    'rpf9',
-    'rpg400',
-    'rpk',
-    'rpms',
-    'rpo30',
-    'rpsl',
-    'rq',
-    'rqq',
     'rr.',
-    'rr299/g-askh',
-    'rr3',
-    'rr=0.84',
-    'rr=1.28',
-    'rr=1.99',
-    'rr=2.86',
-    'rrrrp',
-    'rrrrrp',
-    'rs-232-c',
-    'rs-4',
-    'rs/6000np',
-    'rs2',
-    'rs23,000',
-    'rs232c',
-    'rs25,000',
     'rsas',
-    'rscs',
-    'rsnh',
-    'rspp',
-    'rsr',
-    'rsua',
-    'rsv-nf21',
-    'rsv-nf4',
-    'rt1',
-    'rtitb',
-    'rtnet-osi',
-    'ru&eacute;e',
-    'ruaidhri',
-    'ruangpanit',
-    'ruark',
-    'ruas',
     'rub&aacute;iy&aacute;t',
-    'rubashon',
-    'rubber-clad',
-    'rubber-lined',
-    'rubber-neck',
-    'rubber-neckers',
-    'rubber-wheeled',
-    'rubberwear',
-    'rubberwood',
-    'rubels',
-    'rubenesque',
-    'rubidium-strontium',
-    'rubricator',
-    'rubrifolia',
-    'rubripinnis',
-    'rucaj',
     'ruchupan',
-    'ruckled',
-    'ruction',
-    'ruda',
-    'rudall',
-    'rudby-based',
-    'ruddell',
-    'ruddier',
-    'rude-looking',
-    'rudford',
-    'rudge-whitworth',
-    'rudheath',
-    'rudier',
-    'rudiment',
-    'ruding',
-    'rudini',
     'rudnicki',
-    'rudnik',
-    'rudp',
-    'rudugaira',
-    'rudyayev',
-    'ruedas',
-    'ruelle-takens',
-    'ruffe',
-    'rufiyaa',
-    'rufo',
-    'rufous-buff',
-    'rufous-sided',
-    'rufous.',
-    'rug-rethinks',
-    'rug-strewn',
-    'rugby-related',
     'rugger-buggers',
-    'ruhrgas',
-    'ruins.',
-    'rule-breaker',
-    'rule-enforcers',
-    'rule-followers',
-    'rule-makers',
-    'rule-the',
-    'rules-of-origin',
-    'rules-of-thumb',
-    'ruleth',
-    'rullier',
-    'rum-550',
-    'rum-soaked',
-    'ruman',
-    'rumcol',
     'rumenal',
-    'rumjums',
-    'rummells',
-    'rumyantsev',
-    'run-chase',
-    'run-of-week',
-    'run-pasts',
-    'runcho',
-    'runcom',
-    'rundvee',
-    'runesword',
-    'rungwe',
-    'runnable',
-    'runners\'-up',
-    'running-back',
-    'running-boards',
     'running-costs',
-    'running-shorts',
-    'running-track',
-    'runs=0:02',
-    'runs=0:04',
-    'runs=0:40est',
-    'runs=1:00est',
-    'runscar',
-    'runtimes',
-    'runway-busting',
-    'runways.',
-    'runyan',
-    'rupal',
-    'ruperts',
-    'ruppersberg',
-    'ruppia',
     'rupripes',
-    'rupture-discs',
-    'rurale',
-    'ruralists',
-    'rusher',
-    'rushforth',
-    'rushing-about',
-    'rushman',
-    'rusjaev',
-    'ruskies',
-    'ruskington',
-    'ruskis',
-    'rusli',
-    'ruspidge',
-    'russel-jones',
-    'russet-coloured',
     'russev',
-    'russia-',
-    'russian-dominated',
-    'russian-german',
-    'russian-looking',
-    'russian-ukrainian',
-    'russkii',
-    'russo-persian',
-    'russophobia',
-    'rust-belt',
-    'rustichello',
-    'rusticolus',
-    'rustily',
-    'rustler',
-    'rustless',
-    'rutaceae',
     'ruth-w',
-    'ruthenians',
-    'ruthful',
-    'rutilius',
-    'ruus',
-    'ruymbeke',
-    'ruyter',
-    'rv-4',
-    'rv20',
-    'rva',
-    'rvb',
-    'rvlc',
-    'rwanda-uganda',
-    'rwe',
-    'rwg',
-    'rx-20',
     'ry&uacute;ky&uacute',
-    'ry&uacute;ky&uacute;an',
-    'ry&uacute;ky&uacute;s',
-    'ry\'',
-    'ry30',
-    'ryall',
-    'ryan/consultant',
-    'ryanne',
-    'ryanodine-sensitive',
-    'rybczynski',
-    'rycant',
-    'rydale',
-    'rydon',
-    'ryerson',
-    'rykov',
-    'ryleev',
     'ryley/milton',
-    'rynd',
-    'ryoei',
-    'ryr2',
-    'rythim',
-    'rythm',
-    'rythym',
-    'ryton-on-dunsmore',
-    'ryton-on-tyne',
-    'ryukyus',
-    'ryun',
-    's&aacute;bato',
-    's&amp;d',
-    's&amp;sup-1',
-    's&auml;ulen',
-    's&eacute;n&eacute;chauss&eacute;e',
     's&emacr;pias',
-    's&iacute;och&aacute;na',
-    's&icirc;an',
-    's&khgr',
-    's&oslash;gaard-andersen',
-    's&oslash;r-fugl&oslash;ya',
-    's&oslash;rv&aacute;gur',
-    's&ouml;dra',
-    's&rarr;a',
-    's&ucirc;r',
-    's&uuml;dkirchen',
-    's\'a',
-    's\'agit',
-    's\'posin\'',
-    's\'ppose',
-    's\'zltan',
     's(1)',
-    's(k+1)',
-    's*',
-    's**t',
-    's+',
-    's-b',
-    's-methionine',
-    's-methionine-labelled',
-    's-says',
-    's-sb3',
-    's-seem',
-    's-t-r-e-t-c-h',
-    's-traps',
-    's-turn',
-    's-turns',
-    's-wave',
     's-xl',
-    's.10(1)',
-    's.101',
-    's.108',
-    's.108(2)',
-    's.110',
-    's.117',
-    's.12(1)',
-    's.137(2)',
-    's.139(i)',
-    's.14(2)',
-    's.146',
-    's.151',
-    's.179',
-    's.19',
-    's.2(6)',
     's.21',
-    's.21(1)',
-    's.21(2)',
-    's.22(1)',
-    's.23(5)',
-    's.24(2)',
-    's.27(1)',
-    's.3(4)',
-    's.30',
-    's.31',
-    's.34(1)',
-    's.37(1)',
-    's.39(2)',
-    's.4(4)',
-    's.43',
-    's.47(1)',
     's.47(2)',
-    's.5(6)',
-    's.51',
-    's.52(2)',
-    's.60',
-    's.63',
-    's.65(8)',
-    's.687(2)',
-    's.6b',
-    's.72',
-    's.78',
-    's.8(1)',
-    's.81',
-    's.82',
-    's.91',
-    's.africa',
     's.aureus',
-    's.c.o.',
-    's.d.r.r.s.',
-    's.e',
-    's.g',
-    's.i.t',
-    's.jackson',
-    's.margherita',
-    's.marino',
-    's.n.',
-    's.o.b.',
-    's.p.a.',
-    's.p.f.',
-    's.p.m.',
-    's.p.r.e.d.',
-    's.p.u.c.',
     's.r.p.s.',
-    's.s',
-    's.s.s.i.s',
-    's.t.g.',
-    's.w.i.f.t',
-    's.w.i.f.t.',
-    's.w.t.',
-    's/',
-    's/36',
-    's/powder',
-    's/t183028/10med',
-    's/today',
-    's0*w0',
-    's1&ndash;s6',
-    's1-nuclease',
-    's1/s2',
     's10(5)',
-    's10(9)',
-    's103(4)',
-    's105(2)',
-    's105(3)',
-    's108',
-    's11(3)',
-    's11(5)',
-    's113',
-    's12(3)',
-    's124',
-    's127',
-    's13(1)',
-    's13(2)',
-    's13(3)',
-    's139',
     's14(1)',
-    's145',
-    's15(1)',
-    's152',
-    's153(3)',
-    's155',
-    's15a(1)',
-    's16(1)',
-    's16(3)',
-    's16(5)',
-    's160',
-    's169',
-    's17(11)',
-    's170(1)',
-    's176(1)',
-    's178/179',
     's18(3)',
-    's189(1)',
-    's196(5)',
-    's1ws',
-    's2(4)',
-    's2(5)',
-    's2*w2',
-    's20(2)',
-    's20(3)',
-    's20(5)',
-    's201',
-    's209(2)',
-    's209(4)',
-    's212',
-    's216',
-    's222(5)',
     's23(6)',
-    's230',
-    's231(1)',
-    's238',
-    's239',
-    's24(3)',
-    's242',
-    's247',
-    's25(1)',
-    's26(4)',
-    's27(2)',
-    's28(1)',
-    's3(3)',
-    's3/s4',
-    's30(1)',
-    's3000',
     's303',
-    's31(1)',
-    's31(10)',
-    's312',
-    's314',
-    's317',
-    's318',
-    's31a',
-    's32(2)',
-    's32a',
-    's33(6)',
-    's33(7)',
-    's34(2)',
-    's343(4)',
-    's349(3)',
-    's36(2)',
     's360',
-    's362',
-    's37(2)',
-    's37(5)',
-    's38(1)',
-    's38(4)',
-    's39(1)',
-    's395',
-    's402',
-    's403',
-    's41(6)',
-    's42(2)',
-    's421',
-    's425(3)',
-    's426',
-    's44',
     's454(3)',
-    's47(6)',
-    's47(7)',
-    's48(1)',
-    's48(9)',
-    's5(2)',
-    's5(3)',
-    's5+',
-    's50',
-    's53(2)',
-    's54',
-    's56(2)',
-    's58',
-    's6(3)',
-    's62l',
-    's65(5)',
     's660(3)',
-    's663(5)',
-    's67(b)',
-    's677(1)',
-    's677(2)',
-    's677(3)',
-    's677(4)',
-    's677(9)',
-    's678(4)',
-    's68',
-    's68(a)',
-    's681',
-    's681(4)',
-    's686(1a)',
-    's71(2)',
-    's72(4)',
     's739(3)',
-    's742(1)',
-    's743',
-    's743(2)',
-    's77(1)',
-    's78',
-    's8(1)',
-    's81',
-    's839',
-    's88',
-    's9(1)',
-    's9(3)',
-    's9(5)',
-    's94(1)',
-    's94(2)',
-    's941',
     's95(4)',
-    's97(2)',
-    's97(3)',
-    's97(4)',
-    's97(7)',
-    's=thomson',
-    'sa1',
-    'sa4',
-    'sa7000',
-    'sa80',
-    'saab-scania',
-    'saada',
-    'saadeddine',
-    'saalach',
-    'saar-ferngas',
-    'saarland-museum',
     'saarstahl',
-    'sabachthani',
-    'sabajo',
-    'sabanovic',
-    'sabar',
-    'sabayon',
-    'sabbats',
-    'sabbo',
-    'sabean',
-    'sabeth',
-    'sabia',
-    'sabit',
-    'sable-dark',
-    'sabo',
-    'saboo',
-    'sabortini',
     'sabou',
-    'sabrehill',
-    'sabretache',
-    'sabur',
-    'sabz',
-    'sacasa',
-    'saccad&eacute',
-    'saccharata',
-    'saccharum',
-    'sacculations',
-    'sacerdos',
-    'sacerdotium',
-    'sacher-masoch',
-    'sacheverellite',
-    'sacheville',
-    'sachitids',
     'sacked.',
-    'sackload',
-    'sacktor',
-    'sackvilles',
-    'sacramentally',
-    'sacrati',
-    'sacremento',
-    'sacrilegiously',
-    'sadaba',
-    'sadam',
-    'sadamu',
-    'sadan',
-    'sadats',
-    'saddiqui',
-    'sadeqi',
-    'sadgill',
     'sadhus',
-    'sadi',
-    'sadler/spencer',
-    'sadness.',
-    'sado-masochists',
-    'sady',
-    'saeger',
-    'saemisch',
-    'saens',
-    'safc',
-    'safdar',
-    'safe-looking',
-    'safecracker',
-    'safeness',
-    'safetips',
-    'safety-bar',
     'safety-lamp',
-    'safeworld',
-    'saffroned',
-    'safran',
-    'safri',
-    'safternoon',
-    'sagasco',
-    'sagax',
-    'saggar-maker',
-    'sagittary',
-    'sagrado',
-    'saguaro',
-    'sahabi',
-    'sahabzada',
-    'sahagian',
-    'sahagun',
     'saheb',
-    'sahel-saharan',
-    'sahiwal',
-    'said.mr',
-    'saif',
-    'saigh',
-    'sail-past',
-    'sailja',
-    'saine',
-    'saineresse',
-    'sainfoin',
-    'sainham',
-    'saint-&eacute;tienne-de-ba&iuml;gorry',
-    'saint-antoine',
-    'saint-exupery',
-    'saint-girons',
     'saint-hilaire',
-    'saint-hubert',
-    'saint-ignace',
-    'saint-jude',
-    'saint-lary-soulan',
-    'saint-like',
-    'saint-ouen',
-    'saint-r&eacute;my',
-    'saint-vanne',
-    'saint-vulbas',
-    'sainte-marie-de-campan',
-    'sainte-victoire',
-    'saintfield&mdash;ballynahinch',
-    'saintlike',
-    'saiqa',
-    'saisangkhi',
     'saisir',
-    'saitoh',
-    'saivism',
-    'sajadah',
-    'sajjad',
-    'sakaguchi',
-    'sakir',
-    'saklatvala',
-    'sakya',
-    'saladbowl',
-    'salanio',
-    'salarino',
-    'salary-earning',
-    'salary/wage',
-    'salathe',
-    'saldykov',
     'sale-like',
-    'sale-rooms',
-    'sale/in',
-    'sale/redemption',
-    'saleeby',
-    'salef',
-    'salek',
-    'salekh',
-    'saler-rowney',
-    'sales-force',
-    'sales-forces',
-    'sales/marketing',
-    'salesrooms',
-    'salewheel',
-    'salford-born',
-    'salg&aacute;0do',
     'salguerio',
-    'salicifolia',
-    'salihu',
-    'salinae',
-    'saline/normal',
-    'salingar',
-    'salinization',
-    'salinson',
-    'salitthilat',
-    'salla',
-    'salleh',
-    'salleron',
-    'salm-reifferscheidt-dyck',
-    'salmacis',
-    'salmes',
-    'salmonella-infected',
     'salmonid',
-    'salmonids',
-    'salomonic',
-    'salonitana',
-    'salote',
-    'salpeter',
-    'salt-bleached',
-    'salt-sensitive',
-    'salt-wedge',
-    'salt/pepper',
-    'saltatorial',
-    'saltburn-based',
-    'saltburn-darlington',
-    'salter/moredon',
-    'saltern',
-    'saltero',
     'saltfish',
-    'saltfleetby',
-    'salticidae',
-    'saltmarket',
-    'saltofix',
-    'saltonstall',
-    'saltpond',
-    'saltwells',
-    'saltykov',
-    'salum&auml;e',
-    'salupeto',
-    'salusbury',
-    'salutant',
-    'saluti',
-    'salvanius',
-    'salvat',
     'salvati',
-    'salvelinus',
-    'salvors',
-    'salza',
-    'salzton',
-    'sam-7s',
-    'samad',
-    'saman&aacute',
-    'samarium-neodymium',
-    'samarra',
-    'samco',
-    'samdoria',
-    'same-different',
-    'same-race',
-    'same-shaped',
-    'same-store',
     'samen',
-    'sames',
-    'samgram',
-    'samira',
-    'samloff',
-    'sammels',
-    'samnites',
-    'samoed',
-    'samorat',
-    'samothrace',
-    'samoyed',
-    'samplings',
-    'samsova',
-    'samuda',
-    'samuelites',
-    'sanagare',
     'sanam',
-    'sanasilva',
-    'sanath',
-    'sanatoriums',
-    'sanaya',
-    'sanchita',
-    'sancito',
-    'sancte',
-    'sanctifies',
-    'sanctury',
-    'sand&oslash;ya',
-    'sand-bagged',
-    'sand-banks',
-    'sand-barrier',
-    'sand-blasted',
-    'sand-bottomed',
     'sand-clocks',
-    'sand-flats',
-    'sand-frosted',
-    'sand-martin',
-    'sand-strewn',
-    'sand-washed',
-    'sand/cement',
-    'sanda',
-    'sandaig',
-    'sandall',
-    'sandburg',
-    'sandeels',
-    'sandel',
-    'sanders/hancocks',
-    'sandersons',
-    'sandford/joint-custodian',
     'sandgrains',
-    'sandhill',
-    'sandhu',
-    'sandiga',
-    'sandilands',
-    'sandinista-controlled',
-    'sandner',
-    'sando',
-    'sando-k',
-    'sando/award',
-    'sandouville',
-    'sandstone-lined',
-    'sandusky',
-    'sandwich-board',
-    'sandwich-boards',
-    'sandwich-boxes',
     'sandwich-making',
-    'sandy-brown',
-    'sanei',
-    'sangars',
-    'sangeeta',
-    'sangerhausen',
-    'sanghines',
-    'sangorski',
-    'sangrado',
-    'sangram',
-    'sangstons',
-    'sanguin',
-    'sanguinaria',
-    'sanguisorba',
-    'sanha',
-    'saniman',
     'sanitize',
-    'sanjek',
-    'sanjukta',
-    'sankey-st',
-    'sannemann',
-    'sannikov',
-    'sanon',
-    'sanquest',
-    'sans-culottes',
-    'sansculotte',
-    'sansevieria',
-    'sansodar',
-    'sansoni',
-    'sansons',
-    'sant\'ambrogio',
-    'sant\'elmo',
     'santall',
-    'santamarina',
-    'santarem',
-    'santley',
-    'santolinas',
-    'santores',
-    'santosh',
-    'santuary',
-    'santus',
-    'saor',
-    'sapele',
-    'sapi',
-    'sapientiale',
-    'sapiently',
-    'sapientum',
-    'sapinta',
     'sapodillas',
-    'saponaria',
-    'sapozhkov',
-    'sapphira',
-    'saprophyticus',
-    'saraga',
-    'saragosso',
-    'saraiva',
-    'sarajane',
-    'sarajevan',
-    'sarakatsani',
-    'saranac',
-    'sararimen',
-    'saratogas',
-    'sarcomeres',
-    'sarehole',
     'saren',
-    'sargan',
-    'sargens',
-    'sargents',
-    'sargodha',
-    'sarid',
-    'sarina',
-    'sarkandas',
-    'sarkar',
-    'sarking',
-    'sarmatian',
-    'sarnath',
-    'sarns',
-    'sarojini',
-    'sarova',
-    'saroyan',
     'sarpong',
-    'sarr',
-    'sarrah',
-    'sarraut',
-    'sarsby',
-    'sarstedt',
-    'sarton',
-    'sarungi',
-    'sas-style',
-    'sasana',
-    'sashed',
-    'sasi',
-    'sasoma',
-    'sasperella',
-    'sassanta',
-    'sassay',
     'sat.nav',
-    'sat/set',
-    'satcoms',
-    'satelite',
-    'satin-softness',
-    'satirize',
-    'satisfaction/dissatisfaction',
-    'satisfactoriness',
-    'satisfie',
-    'satisfied.',
-    'satoshi',
-    'satpal',
-    'sattaur',
-    'sattel',
-    'saturable',
-    'saturday/sunday',
     'saturn-day',
-    'saturnalia',
-    'satversme',
-    'satyr-chorus',
-    'satyrical',
-    'sauce-making',
-    'saucer-like',
-    'saucer-wide',
-    'saudargas',
-    'saudi-arabian',
-    'saudi-based',
-    'saudi-iraq',
-    'saula',
-    'saunders-roe',
-    'saunders/trial',
-    'saurians',
     'sausage-makers',
-    'sausage-shape',
-    'saussurea',
-    'saut&eacute;ing',
-    'sautee',
-    'sautoy',
-    'sauv&eacute',
-    'sauveolens',
-    'sauveur',
-    'sauwirtschaft',
-    'savac',
-    'savage-rumbaugh',
-    'savanayana',
-    'savarin',
-    'savchenko',
-    'save-a-connie',
     'saved-up',
-    'saverstrip',
-    'savio',
-    'saviotti',
-    'saviour\'s',
-    'savitskaya',
-    'savourly',
-    'savoy-piedmont',
-    'savoye',
-    'savoys',
-    'saw-bed',
-    'saw-cut',
-    'saw-mill',
-    'saw-mills',
-    'saw-teeth',
-    'sawamatsu',
     'sawbridge',
-    'sawcut',
-    'sawdon',
-    'sawed-off',
-    'sawt',
-    'saxe-blue',
-    'saxe-meningen',
-    'saxeway',
-    'saxilby',
-    'saxophone-playing',
-    'saxtead',
-    'saxted',
-    'saxton/weightlifter',
-    'saybrook',
-    'sayest',
-    'sayi',
     'says.the',
-    'says_in',
-    'saywell',
-    'sazhi',
-    'sb405',
-    'sbcb',
+)
+
+blocks_37 = (
+    '&%iness$$tley#%peres&\'isation\'#zed#"s."(v&eacute#!a$$nnes#)elka/gots$$nnes#%iland$"or#$lick$%ovich',
+    '$#nia#&shtiks"&w-paws%%rints#$lett$$icki"#x-1$!3"-y-and-display%+s-you-learn$&cheque%#uts$\'masters$%rates%#ise',
+    '#$book#$desk#$ford##gir#$ing.#\'ment(s)#$note#&scales#$tine"$zour#&zaglia%"zz$!o!$b800"!b',
+    '"%lcat3"!n"!r"\'s-0.05%#$/10%"$y-6a!$c(a)"%-420x#!5$!s##cai#&hornet##lan##tvs#%users',
+    '$!t"".2"#/2e#"ms"!1#"10##512"!2""c4"\'express"!h#!d"\'i-based"#keg"+r-amplified',
+    '#,/slidewriter##252##400""sr"(te-based""vs"%w8256#!s"$zf20!"d3"!5"#780""ch#!s""e1',
+    '"*gf-induced""ls"$s-10#!l!/e&ntilde;aranda")a-flowers$(shooters#)ce-makers&)offerings&(scotland\'&eeking&(treaties%$niks$\'h-toned%"am',
+    '$,ock-coloured()feathered\'!e#(k-capped%%hours$&edness$%iness$$lets##ple#$rcey$(l-divers&\'handled&&inlaid%$yman$$main',
+    '$#nel$#per$)son-jones#"s.$$anty#&t-bogs%(coloured%&stacks&$wamp#&udouce""ce#"ho#$kers$&oltias$%water',
+    '$$rari#-uliar-looking"&derick#*iatricians$$palp(!s##low#&ologic\'!y$!n#&ralbes%!s$#ena#)unculated"(e\'erheed',
+    '#%e-yoo#\'l-tower$!a$&ed-off$#in\'#\'p-holes$"bo$#ers$"ul#$rson#(vishness"&ganina##ger%"tz#$head',
+    '"#ine$%tures#+sistratidai")joratives"\'kineses%$gese)!s&!s#\'karinen"%lagia&#cus$$rgic#$enna&"or$!s',
+    '$"us#$grin#*ham-holles##ike$%zzoni##key$)osenniemi#\'letiser$&igrino$"ow$&ucidly#\'oponese#&seneer"$mble$%rooke',
+    '#\'phigoid\'"us")n-drivers$%knife$(portrait$"up$)y-dyffryn##ale%\'isation&$ties%"ly%&triusm&"y.#(cil-slim$#oed',
+    '$&reatic$!z#%dency&!s$#ley$%olino$!s$.ulum-regulated)$type#0econtemporaneous$"da$)planation$$stai$&trator#$gold',
+    '#"ha$"ow#(ine-hart$&s-envy$&tently#\'lington$#lyn#\'nanians&#ted%"rd$%ed-in$#ino$"on$&ydaryn%(farthing',
+    '%$mead&#uir%&worths#\'ologist#&parcau$&ushers#-rhyndeudraeth$$oses#*s&eacute;e$"er$$iamo$&temons#*ta-acetate*"ic%$cles',
+    '&%actyl%(fluoride%%meric%%polis$(ekonters%%licus%"on%!r$!i%#um-(*upgradable$%othal$!y#%uelas#(vbam/cla',
+    '$#cae$&darren$%graig#"za$#ler"$opeo$+le-friendly\'*management\'%power\'*situations&!r")pper-mill&$berg#(si-colas#+tic-tryptic',
+    '":r&scaron;t&yacute;n&ecaron#\'-period$%share#$/tri#$ahia$!k$$mpam#%cents%&ption.$(h&egrave%%anced%%eries\'!y$%ivale$$omex',
+    '#"de$#ido$$reau$"us#"ea$"da$$ires$&nially$"tz$&z-diaz#,fectionistic\'#ors$%ilyev%"tt$&omance',
+    '("or&%mable(#mce()nce-bound,(enhanced,(friendly,)intensive+!.\',er-composers#&gammon#!h#)icellular%\'limenes%$opes$#dot',
+    '%"ra$\'gastric$%helia$#kli$\'natally$#od\'%"sd$+winkle-blue#&jurers##kal##lin$\'ocution#%mafax%.nent/temporary%!s',
+    '%#sso%!t$#fax$,ian/triassic%!s&(sibility(*on-seeking%$tabs##nem$$illa#)octylated$%nista$*peratively$#ral$/xidase-labelled',
+    '$%aduan$&etuals\'!o$(lexingly#%reira%"ra$!o%#net$-y/oxfordshire%!n%!s#\'secutio%(rverance$3hore/worcestershire$(ian-held',
+    '&!o$(on-hours\'%power&!.&*/neighbour&-al-impersonal*)nvestment(&/group(%istic)(ty-based+!.(#ly.\'%tions&#ell&"ne',
+    ')&/staff$(pective\'%*icaciously\'&illata$$torp$$uing%\'lphates#*technetate%#mps$&h-born%(/borders$*inaciously$$ness$#sey$$unda',
+    '#$ucho#$vaiz$(erseness$$iest#!y"&satori#"ch%#eor%$iere#$kett#%sagno$#oal#-t-controllers%$free%)resistant',
+    '%"no$#ell"*t&eacute;n#&-names$%shops#\'al-like#$care#&erburg%&church+./herefordshire%"is%&sbourg&-field-liphook&%meyer#%ilius',
+    '#"ko##ley$$yura##one$#sku#$raea%$rcha%%uskas$"ee$$iana%!c&!k%*d&egrave;s&"es%!k',
+    '%#nja$,ock\'s-on-sea%&fabric&#sky%&glycan%*l-guzzling\'$like\'\'station&(ogically%-myzontiformes%#nas&!e%.va/interpreter&(i&cacute\'#chi',
+    '$$hops##ten$%iford$!o$%ulian$-y-fitzmaurice"%ucker#&kestas#"lh##ral"%vnost##rf0$\'olensky"&w-like#(/careers',
+    '"%ysner#"to"#zzo!$f1/5$&delete%#own$#pf3$"up"!4#"00"%arrer"%ffttt"(leiderer")orzheimer""rs',
+    '#&:first"!z!%g-380"$/100#"hr")em-7zf(+)$!3$!7#(x-3xgal4%$atf1""f2"#gos"!t!-h&oelig;nicis"!/',
+    '"!6#".0"#7.1$!5"*acochoerus#!d##eon%#pus$$stos$$tons#)gocytosed#$iles#\'langeal$#ese$"li',
+    '#&nariot#(risaical$2maceuti&rehy;cally\'"ie)!n%%ingen$%nakes#,se-modulated&#one%,.locked.loop%#nko"#eby#$lips#(n&eacute$"om',
+    '$*ylbutazone&/methylsulphonyl##obe#,romone-based*)releasing#"wa"(i-scores##gs+#*ladelpheia*$ians$$drew$)hellenism$$ibeg\'"rt%*p-augustus',
+    '(&nes-us&&sharon$\'lipines\'%pines\'(s-lipsey(&/local$\'ochorus%!i%&machus%%pator%\'sophare)\'er-king,*scientists)\'ically.*#sed',
+    ')"y\'*!.&&phical$#pin%%stoun$#thy$%ypsus#%nsley#,pps/managing"!l#)ebography$,gm/lightning#(ogopites$#mis#!x',
+    '"%obian#(coenidae#&kaians$&ylides#(ne-based%%books%0tic/phonological$&ograms%7logical-to-orthographic)"es%&tactic#\'rmidium%"os#\'sferine$)opholipid',
+    '\'\'carrier\'*inositides\'%lipis\'\'protein.!s\'(r-coated(\'amidite\'(tungstic%#ray#(to-booth&#cds\'$ells&\'feature\'\'inishes&%mural',
+    '\'&osters&)realistic($duce&\'stories&+typesetters%)catalytic&&urable%(detector%*excitation%*geological&$rams%\'ioniser%$kina%%lytic%*mechanical',
+    '&)icroscope%-n-correlation%)periodism&"ia\'$eces%(response%-sensitisation\'!t&%phere&+ynthesizers+\'tically".rase-structure&\'ologies#$enic##ies',
+    '"\'thalate"\'ulchung#"ng##rba"$worr"*yletically$#iss$!l%!o&\'graptus#%salia%#rum$*ical-human($ists(-ly-associated',
+    '&+s/chemistry%)ochemical&(gnomical+"es+#sts\'(raphical$"og#-to-oestrogens%&chrome%\'phagous)!y%\'seiulus#"we!0i&mdash;test.exe#2ntilde;er&uacute;a',
+    '""3\'"&angete$+o-accordion%#vka$"to$#ure#$sten%"re"%cam-1$#rda$(ssoesque$$yune##cie$$olos#!h',
+    '$!i#$k\'em%%n\'mix$\'-a-back%(up-point\'!2$%enham%#rel&$idge$%guard$/ing/association$#off$\'y-picky#)oplankton$%rnell',
+    '##ric##ter&!s$0ish-northumbrian$$ogen%(n/thames$)urability("le&\'e-based(%story*$rips\'%s/abi)*gloucester)+northampton)&oxford',
+    '*0windon/wiltshire&$ings#"us"(ddinghoe$#les%!y$#ock#$gins"&e-noir#(ce-goods&&walker$!k#/d_&agrave_terre%\'a_terre#%naaar',
+    '$%carlo%"ea&%field$%heads$!i$#oni$,re-aux-monts\'\'charles(&lavier\'&damien\'&gilles\'&montan&%fonds&\'humbert%#ots',
+    '$\'ersburg$"ie$&raszek%&ovskiy"%ffaro"+g-in-a-poke$(killings$$pens$\'sticker#!.#&/human#%eons.#%gledy$(ybacking##man',
+    '\'!i#&nataro&"ti#)ott-smith#"s.##uet"%higia""ka#(e/glenda#!s"$laus#$ckem#,grim-tellers#!i$\'bossian',
+    '#(l-takers$,/oxfordshire$"ey$,ing/director%#ons%%tteri$#owy#*o-erection$\'carpine$)t-induced&%study%$less%"ta#$sden$"ey',
+    '#%tocks"\'melodid$"nt#$hill#\'pernels$+inellifolia"$n-14$&curled&&shions$$high$\'jointed$$outs$%tucks#(a_colada$)fore-clad',
+    '$$ster#(canheale$)h-waisted%$able&!m%#gut$!k$#ock$$urls#%daric$"os#)e-fringed%(panelled%&shaded%%trees',
+    '#$gala$"os$!u%"li$!y#*k-and-grey%&backed%\'clothed%&muslin%\'skinned%%toned$&/green%&purple$"as$&ertons',
+    '(%white#$less##mei#$nace&$le-1%#tum$%ed-up##sky#\'t/300ml$#ade$,o-duschinsky%!s"$oche#$ggia#"ns',
+    '%$like\'#nes$&bridge$&raceae$$tte.$$yard#$ings#$pert")ra-pirana##gos#"in$"ou##nie#!o$#gov',
+    '$!n$#tte$%zollo#"ro"#sa.$(nosaurus#\'cataway$#ium#!h#(ky-mazed#(s-artist%%heads&$oles%"up\'!s',
+    '#+tol-whipped&"et&#ier%&n-like\'&stroke%%xenos#"um"&t-like$&owners$#pat#!a$"ka#&chback%)ing-wedge%#men',
+    '#*e&scirc;ti#"ha#,man/formerly#$oeff#"ra#"s.$!a$$ford#(t/prison$"am%$nces&"ga$&ermann%%ville$#ore',
+    '&!i$)s-buggers%"es#%ville"%vetta",xel-by-pixel%&vision#(ie-faced&$like%#ish#%ofoto$"te##ton")zza-style%%rello',
+    '"#c-1!"kp!-l&eacute;iade"#.26"!1"\'acarded$(e-holder&%kicks&$mats&\'setting%#man\'"ts&+ent-related$$kett$&ozoans',
+    '$"uy##idy$)n-vanilla%"es$$sant#&menatz#/n&eacute;tarium$\'arlipid$%chart$(e-makers&)symmetric%)t-forming\'%sized&&esimal&$fall',
+    '&%ology$&gently$\'iscapus&%phere$$nin\'\',g/scheduling$(pincieux$(t-animal&(by-plant&$like&#man&$pots&$soil\'\'pecific%#in\'',
+    '%%ships&#men&%woman%$ulae#(que-free#+sma-derived&&lemmal%(id-borne%(odesmata$+ter-covered%(ic-lined(\'wrapped\'$izer+!s&$face',
+    '&%graft&"mo%&ochron%#ron#(tanoides$(e-layers%&au-ish\'#ing%.d-through-hole%$less\')t-surface%#nse$*form-soled("s.$&inated',
+    '*$lond)&coated)$free)$rich$\'titudes$*yhelminths%&podium%!s#\'usences##vis#$xton#.y&ndash;groups$!-%%acted&\'nywhere',
+    '%(readings&#oom%\'scripts%(throughs$%board&"ok%$uses$&ed-out%#rs.$&fellow$"in&"gs$%parks%#ens$(scripts.',
+    '".easant-tasting%\'ingness%)ure-craft($boat($wood#!b##cos#$eese$!s#$ione%\'tropism#!n$)ary-style$!i$"sa',
+    '#/stin-les-greves#-thysmographic#&uritic%+o-pneumonia&(sternals&"te(!s#!x$%iform##yel"(iability$#ncy#$cata#$mmer%#ies',
+    '"(o-syrian$"us#\'ddingly$$ging#(egsteert#%mpton#&n-plon$#ney##onk#\'rnishes#%tline(!s$$parm#\'ugh-tip&\'ed-back',
+    '&$ings$$viez##wd.$#ing##yer"$uars#%ckily#)g-fouling%#ins#&mbings$-e-lithosphere&\'related$#ley$&meted.$\'p-faced',
+    '#"na$\'derings#&ralize#\'s-point*!s%$twos$#bus$$erix$"ky#%tarco$&onimum$"us"&yboard#%mpton#(ometrics',
+    '#%woods"!z!,m&ndash;4.15"\'a5edcms"!d"#est"!h"%lc2at"2mlib.gimmsdigfile1,$job1,%poly1,&tatdat"!n"%ol/l/%"mg',
+    '".t2-transfected!#nda"+eumatically%\'ococcus\'%ystic&)hydraulic&*peritoneum&(thoraces""nt""qs"!s!*o-ti-ni-ja""19"!2#!0',
+    '#"ge#"ri"$beda"(cahontas*)-kentucky#$hade#\'k-marks$(et-books(\'reaches\',handkerchief\'%knife&$bond&$fuls&%money&!t',
+    '\'#ton#"ia%%trist$$more$#ums#%olski$(phylline#$sols"#eck#!l##mes#*t-composer%&writer$%esses$#ica',
+    '(#ing&!k$#ry."$gace#&liaghi#\'o-stick$)nophorans#%radec%!m"%hamba$"ng#$jola"\'ignance#"ns$+t-and-shoot',
+    '.#ing%&ed-top&#red%\'illiste%#man%#ner#*r&eacute;e#)son-spurs&+ous-looking#"te"\'ked-out$&r-like#"ka",land-germany\'&soviet',
+    ')!s%"on%%quest#\'cinello#$dark$!i#(e-pieces$(idoblocs$%march%%icize%"os$#nov$$sden#%hemus#%iakov',
+    '\'%gangs\'%speak($tyle&%/army\'&public&$mnen%#men%-y-determining\'(watchers&0/planning/social&%maker$(oviruses$+sh-american/!s\'&french',
+    '\')populated\'(speakers$$teia%3ical&mdash;military)!/*&social)#ly-,%aware,-controversial,&minded,*orientated+!.\'#ial)"n\'*)-official',
+    ')(cultural\'"us&$sche$#zzi#\'l-taxes$%aiolo%,rd/secretary$$dubh$(en-laden&%aters%"rt%!t$"io%*tt/college$$mair',
+    '$#tax$/ution-sensitive##ney#\'o-shirt#!s#-tergeist-like#$unin$$tion#"vo#+y-carbonate$-acrylamide/8m%#kov%%rchic$)butadiene$%carpe',
+    '%&haetes&\'romasia$%doras$+electrolyte%(ster/35%%%thers\'$lene$#gas%,en/molecular\'!y%&lossia%\'onaceae\'\'ifolius$%hedra("on',
+    '$#l:c$*mer-coated\'#ise(#zes%#ide&!n%$odal$*neuropathy$+oxyethylene$*peptide(s)%&hagous\'%rmacy&%onist%%odium%*utheketlon',
+    '*!s$)sacrulite%\'ciences%$ided%\'ynaptic$-thene-wrapped%#one%$ropa$)versities$%zalos"%magne#%erius%"ol$!s%%hchik',
+    '#&p-rock$!a%"no$\'osities%&usness"\'ndmates#&g-pong$!e#(iatowska#"ns#&sardin#-t-nedd-fechan%)sur-seine$%canna%(hartrain',
+    '%%deria*$ceae%!n%$rwyd%%sbury$%ianak%#cum%%ficum$%large$)prenshitw$%rilas%%obert"\'odorbox#$ftah#"it',
+    '%%table$$able$1e&ndash;cherbourg$0ing-of-interests##nds$"ey#&p-poop%%scoop$$athy$"et#"r\'$(-looking%\'sighted$+est-quality$*ly-drained',
+    '$!s$$will#$ters"\'p-group$#ins$#ons$#pop$&singer$#ups#$alub#$core#%holes#)lar-lined$&ington#%oloff',
+    '$!e$$iest$\'lewells$(y-seller%$seed#\'rischin#&sicles##ton#-ular-cultural(*democratic\'(isations(#zes&#tin(#on\'*"s.',
+    '%#nea%$orum%"um"&qetpad"#rac#$blem#.celain-mounted$#ini#(e-canals$!t#%firio##itt##ker$"ie%"ng',
+    '#$lier#,phyrogenitus\'#ula$)oise-like$"us#%ridgy%%ngers#%sch-e$&tmouth#\'t-based%%royal%$side$\'a-cabin%&cabins%"da',
+    '&#ram%$nova%$skog$*ballintrae%#ury$(cullises$&ership%#urs$$fire$$gate$+im&atilde;o%&nscale%!o%!s$\'landite',
+    '$&o-novo%"ra%!s%%verde$%rait.$%soken%$wood$%ugals&*uese-based+*influenced$\'wrinkle"(s&eacute*#;es#(/homonym#"al',
+    '#%h-rat%(sounding%\'talking$#oes#"is$*tive-going)(negative%"ve#!l#%sess.\'$ion.*+/separation%"ts$"ib&&ilties',
+    '&\'le/dial%"ng#$t(s)$$-16s&!8&$940s\'"77\'"82(!5%#abc&&udited%$beat&#omb&$uses%\'college',
+    '&%ubist\'&lloden%&darwin&*esignation\')velopment&)israelian(*tributions%+einsteinian&(lectoral&(mbryonic&,xtraordinary%(fernando&$ixed&$lood&%ranks',
+    '&\'lasnost%\'harvest&%eroic&#orn(#ses\'&spital\'$uses%#ibm&"mf\')perialism(+lementation&+nterpretive&"ts%\'kantian%\'lambing',
+    '&#ife%#mao\'$rket&\'ilitary("ls&&ounted%*napoleonic&(eolithic&&uptial%\'october&&lympic&!p\')erational%\'pacific&$earl',
+    '\'&iocene\'%owden&(rocessor.!s((ficiency&*sychedelic%,recessionary(*ombination\'(lational&#iot%$sale&#how&)tructural&%unset%&temple',
+    ')&nament&0ranscriptionally(#uma\'&iassic%\'vatican%)wagnerian\'\'tergate&"fp&\'hatever\'#ite$*/modernism-!t$!a%\'ge-free($paid',
+    '$(biblical$/cranial/cranial$+dissolution$#ed.%(mbryonic%$r(s)&(designed$$fach%-undoplication$+gastrectomy&*te/british%$enae%#rad$%house%$umus',
+    '%$lion&%lions%$tion$*lethwaites*"yt%"ip$)modifiers&$rten%)ultiplier$%nasal%"ik$(receptor&(lational$"s.$-translational',
+    '$(vagotomy")t-bellies$$clay$\'holders%&unters$$lids%#uck$%shape&"ot%%moker#&ahtoes$)mochoerus&&getons$%tions%)o-picking',
+    '&#pot$%ytoes#2entially-dangerous-)isastrous,\'harmful(!m\'&sation$%state&!i#*gietersrus-!t#%hooks#%lands$"ey#"ok',
+    '$-dam-sanssouci#%tepei%+r-mo-get-on&"er$#ier$%leton#"yf"-u-homeodomain/!s#\'bellien#(ch-seats%#ful#\'dreries#!i##let',
+    '%&rymeat#$ncer$)d-keepers%\'/dollar%#ian%(s\'-worth##pee#\'r-flush$$chet$!e$"pe$#ris&$ture"*verty-line#$lsen',
+    '#$/mia#\'aqqatsi#+der-stained&$horn&$mill#!e$*ll/devizes\'$glen\'&milton\'+pressburger\'#raf\'*shrivenham(%troud\'*university\'*winchester',
+    '((roughton$"r\'%.-&eacute;lites&%based&$down\'$rive&#gen&(limiting&#off\'\'n-reset&\'players*!s&\'seekers\'&harers\'\'tations',
+    '&$unit&\'weaving%#.he%(/battery&&weight%#amp%#bop&%roker+!s%$card&$hord&"ut%%ed-up%&filter%$jets',
+    '&$iser%+s-that-were"#xon"$yais#"le#"nt"\'zdyshev#,i&egrave;res#*n&aacute;n$(a&nacute%#nia#%zallo!+p.1&ndash;2$*01&ndash;2$+13&ndash;19',
+    '%)4&ndash;5$*7&ndash;18$*9&ndash;23#*26&ndash;9%!1$*88&ndash;9#*42&ndash;3$)3&ndash;7$)7&ndash;8#)5&ndash;6#)6&ndash;7#*75&ndash;6$!9#*81&ndash;2$)6&ndash;7',
+    '$)6&ndash;7#"go"!4""g3"$iase""mv""on""ps"$s-rd#!f""vt"$yac4!0r&eacute;fecture*\'gardien*%sages',
+    '$6circ;t-&agrave;-porter*%e-moi$\'grave;s#3iacute;nc&iacute;pe"#.xi"!4"!5#"36"#aca$"ti&.cally-oriented\'\'e-based&%sing.#(dakshina$!e',
+    '#\'eambula$&ceptio$%iecti$%texta%#ors#%fance#!g$)maticists)+s/semantics$$nell#)irie-like#$laya$-elsliv&iacute#\'mpolini#%natan',
+    '$\'genberg$$kish#$sith#$tica%&ncoles$$ting#$xeas%!s$&iteles#(yer-desk&!/&"s.#)ziquantel$$osin""ck',
+    '))requisite#%-1918\'!9&"50&"68&"75\'!8&"80\'!8&"90%"st$#act\'#ion%\'ffluent%$lpha',
+    '%"rc&%range%\'ssigned%%ugust$$bait&#ked&$ttle%%iotic%#ook%\'reeding$\'centcom%(hernobyl%+ivilisation%$lean%,onsonantally',
+    '%&reated$(delivery&)mographic&)velopment%\'igested&(scursive%)ominantly&%negal$&echoes%(diacaran%%ighty%*quilibrate%\'xchange&$ilic$)falklands',
+    '%\'iltered&"ve%&lashed\'$vian%(ormatted(&ulated\'"um&(undation$\'genital%\'lasnost\'#zed%$reek$%heads&)llenistic$*incubation',
+    '&&stalls$*judgements$\'landing\'%guage%"et%%ondon$(marketed&$ster%\'eetings&(nopausal&&sozoic%\'orbidly\'#tem$(national,\'ization',
+    '$#oil%$nset%&ttoman$)patterned%#eak%&iloted%#lay%%olicy%%rison%(ublicity$-qualification$\'railway%\'egister,"ed&(publican',
+    '%(eptember&\'quences&%tting%%haped%%liced%%oviet%\'timulus&$ored&&unning%$wing%*ymptomatic$$text%*hatcherite&#eft%(wentieth',
+    '%&ersion%(oiceless%$xkvk$&warmed&$shed$+zoroastrian#*adaptation-!s$&mbular%(plifiers$*rrangement$*ttentively#&baited$(endaries#1cambrian-cambrian',
+    '%&torius$\'edences($tial%#pta\'$ress%%ssing$+ious-metals%(pitantly%\'rrhotic%/sion-engineered$&leared$\'olonial%(mmitment&%piler%)nvictions',
+    '%#xal$&urrent&$sory%!t#!d$&acious%,tor-specific%"wn$)ella-like%(signated%+termination$\'icators&&tions.($vely%*ssociation',
+    '$(ominancy*$tely+(ly-hindu($ency##edy$&mption\'!s$"ns#&factor$(ectorate%\'rences.&#ing$)iguration+"ve#%gancy',
+    '#*haustorial$)ybridized#+integration#)judgments&$ice\'#$lacy$&ogical$%udial#"ma%\'ritally$%chaud$#eal%&rstein$,i&eacute;res%$sing',
+    '($gift\'-s/investments$(odifiers$#pak#/ndergast/thames%&iville$\'ominals$$tiss$&uptial#)p-schools$&ack(s)\'#age%&tterns$$coms$\'eliczay',
+    '&&t\'rous\')erousness$#pie$#reg%$ints%%oet-1$(ubescent%#ces##run#&sacral%"nt$"b.%\'yterium$#can%"od',
+    '+#ist,"ty$(election%#nt-(%giver(\'perfect\'#ees($ment%%rvice$%haped$0ident-in-waiting*(national)%elect%(nusoidal$"os',
+    '$\'s-studs%%/john%(ed-steel%%marks\'$ster%$nell%/ure-composition)&groups)(inferior)+temperature\'$ises$\'tenotic%#nov%#rud%!t',
+    '&!a&&ptious%"re##tas$%enses$*heoretical%(rombotic$%iosum$\'tifying&&nesses#%uilly$$ssag&"en#%vail.%#tte',
+    '\'$ions($vely$$iewz%(ous-best()ly-agreed%$tali#\'w-smith$#ett$#itt"&ibilov#2ce-competitiveness("st&%jones&\'keeping&+sensitivity',
+    '%"rs$%kings%%tease#$dham##ess%)t/harwell\')spiritual&$mans#(gioniero$&orodny#%jedor#&kazsky$!o#)m-looking$%arche',
+    '\'./developmental%!s%$tive$#e-1&\'lending%,d/continuous$\'igenius%"ty$%ordia("um&"es$+rose-yellow#.nce-archbishop&$doms&\'ss-line',
+    '*%agent\'"ii%!l$#ias$#ked%$nash$&t-head&&makers&$runs%%.form%*er/plotter%$gine%*ing-houses)\'offices)\'presses',
+    '$*zenstrasse#"ok$,r-provincial%$elli%)it&eacute#$smed$(on-issue\'(stockade&$.the&0/buckinghamshire&$ers.$"se%#ick&"ly#-tchard/romany',
+    '$#tie#"ut#$vado%#lov%"ta&(e-public(#use\')/domestic()voluntary\',ly-sponsored\'$ness&$izer$(ilegiati$$vies#(zemonies',
+    '"*o-adhesive%&frican%*ggregatory%#lly%#oun%*ppeasement%(quaguard%$udio%$ydid$$baby%&eijing%$oers$+carcinogens%\'hoicers%(lassical',
+    '%\'riminal%$uban%&ycling$%death&(mocracia$#eec%*nvironment%)uthanasia$)falangist%"it$#gen%%rowth$\'hanging\'\'overian%(ekmatyar',
+    '%#unt(#ers$(imperial%\'ndustry&%katha%#pkf%"ra%&talian$&jewish$(khomeini$&libyan$*maastricht&(nchester%%inded%%obutu',
+    '$\'neville%$orth&"te%"sf%%uncio$\'o\'neill%\'ssetian$#pri%\'si/psdi$&rights%$oman$*sandinista&$ving%&erbian%#hah',
+    '%&lavery%$outh%\'tandard\'"te&$uart%$ybil$(thatcher%#our%%unnel%#ype$%woman\'"en#(amniotic#\'bations$(e-tagged',
+    '$+lem-related()solutions\'\'.solver\')/solution\')_in_terms\'!a(%tizes\'!o$#yns#"c1$!3$!4$(arbazine&$yote$(edure(s)',
+    '\'(-focused(&server.!s\'!e("rs\'(or-based*(taligent$"he$$kter$(lamatory$"on%!r$,rastinations,#ors%"is',
+    '&$rial&%scope\',igmoidectomy$$ulus%%rable\'%tions(*ors-fiscal%\'ticular#"d.$"ev$&igally%!p$%nalog$-ucci&oacute;n&+er/engineer',
+    '("s.)*/suppliers&$t&gt\'#(s)\'+-by-product(+development(\'focused(\'testing\'&/value\'+ion-centred,*onsumption+#led+(oriented+%ready*(/methods',
+    '(!v\'*s/services%#its#&fanely$)essional/-0paraprofessional-)technical-*vocational,*ly-handled*$elle\')or/senior)$iate$(iaircurl%!l%%ntern',
+    '&*-conscious\'(decision(%riven\'\'earners\'&linked\'&minded\'&takers&+/non-profit&*s-inspired\'\'/losses$\'ligates$(oundness#%glems$"ra&"me',
+    '($e(s))*-dominated)\'r-level(#mes%)ess-based(3/production/traffic($ing.)%onist).ve&rehy;action#%haska$%ibita("um#"ie#3ject&ndash;specific\')-inspired',
+    '##kes$%oviev#$late$\'etaires$(iferator%"nk$)ongations#)mecologia$)icroceras$3otion/communication$\'ulgates$*yshlenniki#"nk$-ominalisation%(unced_as',
+    '$+unciamentos#&ofness$"ve#-paganda-based+$line\'%tions%\'ne-rich$#er\'&&-named&#est&$ness&)ty-buying)%class)$sets()/premises',
+    '&#tes$-ionibacterial$"le$%ogate%)rtionable+&lities%,sition-based+"s.%&unders$&ped-up$2ri&eacute;t&eacute&(oception+"or$*s/costumes#&s/pros',
+    '$%cuted$&e-poem&%scene%%ction&&utable%\'lytiser,!s)#zer,!s$%imian$,opographical$(pectives*#ity&%rity.$+tatectomies',
+    '&$tnic#%tasia$&eaceae%%cted.%$in-1(\'binding(\'calorie((enriched\'$/dna%*olytically%.stant/catholic*"es\'#ed.$)hrombotic$$ists',
+    '&+bourgeoisie&\'fascism&1industrialisation&(language&\'records&%urban%)col(smtp)\'"ne%(historic%(n-proton&$orms%)planetary("st%&ranker%$star',
+    '%$zoic$\'rusible#"v.$$ably%"nd$%endor%!r&$bios$"id&"ee\'"r.(*/purchaser%%nces.&$ical%$sors',
+    '%&dnitsy%&kingly%$lone##war$%lings$$orks#(ximately""sd"#tch"*udentially#\'ne-like%#aux%$like$&ifolia$"ty',
+    '$"se%*ia-germany\'(n-german#%tzman#$zine"#yer##seg#$tany$%herch#%vetee!"s-"".5"#/30#!e#$hrms',
+    '",acharopoulos#!m$(metichos%$ites\'"ic#,rouda-benaki#$umis""cn".d&mdash;social#$.06a%!8#!s"&ettias##ude%2o&rehy;documentary',
+    '\'+crystalline\'\'generic\'&injury\')knowledge\'\'medical\'+nationalist\'\'parents\'(rational(&eality(&iemann\'%scots(\'ynonymy\'%tudor(#win\'&ulpian',
+    '&(boekella&)canthicus\'#ode&(frenulum&/intellectualism&(nymously&&sounds%!s")fi/notenv""he""lg"(ocoptera#"ra$%iatic#"s+',
+    '""s."(ti-pvuii"#v-2##2x5"$ych-%%ed-up\'+elic-tinged%\'iatrics%*o-acoustic)$tive()nalytical\'\'dynamic\'*linguistic\'-physiological\'%sheep',
+    '(*tatistical\'*technology(*herapeutic&!l\'\'inguist\')ogization&)metrician/!s&,neurological&*pathically*!y\'.harmacological(*ysiologist&)therapies\'\'ic-like',
+    '\'&ropics%"ro##kik!3t-gliadin-sepharose#\'sys5000"$3500""6a"$a300$!5#!k#)rmiflorum""bt"+eridophytes$\'onarcys$,ygoplichthys',
+    '"+halocyanine#\'olomeus""nm""r2#!3#!s"!w!(u-coated"$apua""be#(lic-good\'\'opinion\'(speaking\'%trust&-ation-quality',
+    '*\'seeking)!.\'&zation("es&*ly-donated&$ness%$lius%/shing&amp;print#"ol#(watching"#c18#!h#&k-like$%ishly$(lechurch',
+    '$&icombe%%ngton"#fas#$fett$#ier")gh/father%&murray#%ilism##nax"#h5s#$akka"%iatti#(g-aubert""ja"&kekohe',
+    '"&lchrum##ido#\'l-downs%#rod%(shifting$$back$&ed-out$(ing-back$$owes$\'trouser$!y%)/lausanne#&monale##qui#&sebeat',
+    '&&ulenta$$illi%"ni"$mila#&p-down%&primed$!.$\'herston%#rey$(kinseeds$,s/powerheads#"u6"&n-test#"al#!c',
+    '%#ily&&ng-bag#$guin%"on#!i$#cea$"er$&shably#-jabi-speaking#&k-folk%#pop$"ah$#ish#&ningly$!y',
+    '\'!s#\'tarenas%"to$!o%!n#&yettas""ok#%lanne"%p-pup#%ation#)il-master&(teachers%&master%*s/students$$tres',
+    '\'$show$&ywatch"-r&eacute;eing#-beck-portland#(chase/no\'$sing#\'e-black%\'hearted$%breds$\'strains$!x#$gers#0ificaci&oacute;n($tors+!y',
+    '$(stically$%tania%"y.#"ko#$lieu#4nell/gloucestershire%!r#(ple-grey\'&tinged%)ish-green%&y-blue\'$pink$$ose\'\',-independent&,ive-rational',
+    '&#eum#&se-bar&#net&\'seining$(low/west$$uade%&ivants#3ton/gloucestershire##ver"\'s-cells#"at#\'h-along%%bikes%"in%$push',
+    '%$turn$"ca&"rt$#ful$%iness$%karov#"se$&y-cats#%tular"*t-and-take%%t-par$#ins#$eaux#$hoff##ley',
+    '#(rescence)!t\'$ible$&ifying#%table%"na%%parti$!e$"is$*y-coloured"#ura"/y-de-d&ocirc;me#\'loubier!*vc-covered"!g',
+    '"$isor"#m11"!q!$wani"$ooor""sw"!v"!y!\'x-xware!+y-polyester"#ac4$"rc#$nkov"!b#!t',
+    '$&ocline"!d"\'e-smith#%croft"&gargus#%idium#$maea%)lion-like#\'oscelis$!t"&inmana"\'jama-ed\'&jacket"&knotic""ms',
+    '#$sent"\'ocyanea#%metra"?r&eacute;n&eacute;es-orientales#$-pur#%aniki#\'ethroid$#xic##gic#9idinoline:deoxypyrolidine%)ostigmine$$tous#(obitumen$(gen-free\'"ic',
+    '%$ytic$%mania$)technical$%zines#\'rhonian$)olizidine")schiatric%(ological*"st""th$&archos$#ium"%xidis!%zex20 (q&amp;as',
+    '!#(n)!"+e!)-branches"%ships!".1"!3"&a.l.y.""e."$p.r."#t.s!"/m!#100"!9!#2\'s"!7',
+    '!"96!0a&mdash;user.log")-approved"!1"!d#!i""im"!l"$ndil"#ruh"$ssem"#war"#yum!#b3+!"c4',
+    '"!r!#d1+"!5#!+"%m/qdr""os"!p!,e/00/00/0000"!3"!7"#mal#$m386"%stion"$ysar!\'ftd.exe',
+    '"!4"!m"!o!!h!\'ianlong"\'blatain#"ya"%nghai%"ua#$shan!"kn#!d!!l"!p!"mw',
+    '!#pr1!"rm""s.!$term!,u&eacute;bec"\'adfasel$$rans%#iga&"ng&(syllabic%*uple-bogey)"ts\'"od#%erens#,int-sounding',
+    '##lia%!e%!f&)ications..)/learning%#tie&)y-related($wise\'$team#(ngo-like&"es&"id$#ity$&tastic%*ifications',
+    '\')y-ordered(!.%$rill%*um-optical\'!.%!z$#you#!r$#ley$%riers%+y-by-quarry$,ter-building(\'lights.((measures($of-a',
+    '-"er($sawn)%heets)$ized\'&finals\'$s-in&#tto%$iers%+z-magnetite&-o-feldspathic##ser$%higah$*i-biblical&)classical&*diplomatic',
+    '\'$ixed\'%ormal&-improvisatory&*laboratory\'&iberal\'%orenz&*managerial\'&edical(*taphorical\'%odern(*nopolistic&(operatic&+periodicity\'*ublic-good&%regal',
+    '(&search&*sacerdotal\'+ociological\'%tatic($eady)$llar\',uperordinate&,totalitarian\'-ranscendental($eaty((iangular%)particles$!s##tar$"ek',
+    '$$tros#(veringly"#dis"&echuas#6dgeley/gloucestershire#$en\'s%.-in-parliament%%hithe%#ing%%sgate&%ryche&\'way/mfi#$iroz#%llada#%ndale',
+    '$&yingly#&stfest%#ier&+on&rehy;ing(%-tags($ing.($mark(&naire."%ichua$&k-buck&%draws&(maturing&(reaction&%sands\'&elling',
+    '%$edge%#joy%%print%$shot&#ons&$tart%*wittedness%!y#\'ddities##ero##ffy#\'grungio#"la$#ley%#iam',
+    '#)nacridone%!n$%ctius$#dly%"ry$-idine-induced$"n.%\'/parish$,quefasciatus$$tans%%uplet(%icate$(uclidine#%pping#$rico',
+    '#\'sumbing#&t-rent$%ensis%!s$&tenton#\'ver-tip#)xotically&"ry#$zapu$$show"(odraturn#$niam#$rshi#-ta-equivalent%&bility',
+    '$$idie(!n)"ne!"wt!#xb6 ;r&amacr;n&amacr;m&amacr;che$-p;d-intensive"*eacute;ard)2coltant-manipulant)/f&eacute;rences*$orme)&gicide+%ments*\'ulateur)$jane',
+    ')#ole)+p&eacute;ta)#tro,\'version-+is&eacute;e#+circ;veries"*iacute;mid"+oacute;mulo#\'circ;ti#(slash;dt#(uml;ling"%prime"(uuml;gen\'%hrgas!)(22)=0.83',
+    '("24("47"(58)=0.45"%d)svs""s)!%-2800"!5"$less"&robert",series-based)(to-alpha"$york!%.&amp"#101#!5',
+    '#$4(2)"!3"!4"!7"!a##.c.$"h.$$s.c.#&asland"\'baldwin"&c.a.f.$"e.$"m."$d.h."#e.d',
+    '"%p.s.i"!q#!."$r.r."*t./ambient"&wilson!,/000/22/1005,!8+"14,!5+"39+"42,!5,!9+"63',
+    '+"73,!4,!9+"85,!8,!9+"92*#136\'&3/1018,!9+"20,!1,!2,!7+"37',
+    '+"58+"60+"79+"82+"91,!9*#101,!4,!7+"13,!5+"27+"30,!2,!4',
+    ',!8+"61,!2,!8+"81,!3,!4+"90,!2,!3,!6*#202,!5,!8,!9',
+    ',!6+"30,!5,!6+"40,!1,!3,!5+"66+"79+"80,!6+"92*#328+"46',
+    ',!8,!9+"58+"61,!2,!8+"74,!6+"81,!3,!7+"90,!3,!4,!5',
+    ',!2,!4+"20,!7+"36,!8,!9+"41,!4+"63+"75,!6,!9+"84,!5',
+    '+"92*#505,!6+"10,!2,!3,!4,!5+"21,!2+"33+"45+"77,!8+"89',
+    ',!6,!8,!9*#602+"11,!9+"32,!5,!9+"48+"51*#714,!8+"21,!5',
+    ',!6+"46,!8,!9+"57+"69+"76,!9+"82,!5,!9+"98,!9*#801,!8',
+    '+"40+"60,!8+"74,!5+"99*#903+"19+"22+"31,!2+"53,!5,!9+"60',
+    '+"71,!5,!9+"81,!5,!8+"91)$2002+"14,!9+"27+"31,!4,!5+"40',
+    ',!5,!8,!9+"51+"60,!9+"77*#114+"22,!4+"32+"55,!7,!9+"60',
+    ',!4,!8,!9+"71,!6+"82,!6+"92,!4,!6*#212+"20,!3+"34,!8',
+    ',!9+"50,!3,!6,!7+"61,!9+"70,!2,!7+"82,!6+"91,!6,!7',
+    ',!8+"27,!9+"30,!7+"51+"63+"76+"80,!1+"90,!1,!7*#406+"11',
+    ',!4,!5,!8+"20,!1,!3,!5,!6,!8+"32,!9+"42,!7,!8+"56',
+    '+"61,!4+"72+"80,!6,!9+"91,!5*#504,!7+"13,!4,!5,!6+"20',
+    ',!2,!6,!7,!9+"31,!7+"43,!7,!8+"58+"68+"71,!6,!9+"85',
+    ',!9*#601+"16+"24,!7+"35,!6,!7,!9+"42,!5,!6,!7+"50,!5',
+    ',!3+"81,!2,!4,!5+"93,!9*#702,!6+"10,!3,!6+"21,!3,!6',
+    ',!6,!7+"41,!6+"50,!6+"60,!4,!5+"72,!5,!7+"82,!3+"95',
+    '*#803+"10,!5,!6,!7+"41+"56+"65+"73+"80,!3,!6+"90,!6,!8',
+    '+"10+"25+"37+"43+"67+"76)$3009+"11+"25+"43+"54,!5,!8+"62,!4',
+    '+"88*#100+"11,!3+"25,!6,!9+"38+"50,!4+"62+"72+"91,!4*#200',
+    ',!8+"22,!7+"40+"55+"63+"78*#301+"11,!3+"24+"34+"66+"72+"82',
+    '*#441+"69+"78*#525,!7+"30,!7+"43+"53+"65*#610+"47,!9+"61*#710',
+    ',!8+"73+"82*#815+"29+"31+"75)$4102*#379+"95*#465+"70*#513+"78*#631',
+    '+"56+"71,!2+"97*#749+"62+"90,!3,!7*#807+"47"!a"!h"!n!$1(5)',
+    '"$,500"*00,000,000#!x""10"$6(2)$"3)"$8(1)!$2(1)""+3"$,000"!.#%59(4)"!3"$4/31"#5\'s',
+    '#!0"!6"!9#$0(1)""d2""y1!$3(1)"*000a-based%!s#"50"$42a4!\'4.11(9)$$6(2)&"3)$!7',
+    '#%21(1)$!2#$7(2)%"5)"(000/4400"!4!"5s!&65,000"#644!$7(5)"%2,900".4(1&ndash;205)-#56)"!6"&fr60lb',
+    '!"95!&=-0.02%"36%"58%"61&!3"#0.1$"27%!8$"38$"41%!3%!4%!7%!9',
+    '%!6%!7$"64%!9$"74%!6$"91%"39!+a&formula;d"%\'ayat"(-treated""an##rgh""ba$$lais',
+    '#!b$"ah$&it-fur\'(infested\'\'nibbled\'%sized&#ohs&"ry#\'elasian$&nstein#*i-flopping$#ana$!e$&novitz&$wicz',
+    '$"ou#%ochii$$utou##son")cal-redac#+e-awareness%%based%\'driving%&linked%)relations%\'winning$$card$#mes%#osa$\'readers',
+    '#\'ialised&,ly-motivated$#sme#+k-supported$%emann#\'onteurs#$quel#)y-looking""d.#&agunda$!h$\'nielson$&r-dark&\'evading&&guided',
+    '#"da#)hakrishna,!n$#ost#$iata&+ion-related$!c%-al-democratic()socialist\'\'esbians\'#ize\'$ness%#hio$(esthesic$$kale',
+    '&%based&(chemical&(isotopes&$mike&)projected&\'sources&)telephone*&vision&%waves%#/tv(*/newspaper%,active-waste&$ssay\')tronomers%*biological',
+    '\'$tive&(hemistry%-f&oacute;nica%%grams((phically%&iodine%\'labeled*$ling&$ogic%%metry%.pharmaceutical\'#one%)telemetry)%scope.!s',
+    '#*naaragchaa##oje$"me%#sky$\'n-proof#&zinsky%#vil"#ech#!l#+to-romansch"(f-manned#$eill#&flesia#%tsman"$g-1x',
+    '$\'pickers#!g$(ed-arsed$"le#$hbir$"ib##ini#\'nallson$$hild#&picker#0s-to&rehy;riches#"us#%worms&"th"$haga',
+    '#"dy#$ewin#$mani#!n$!d#$saan"&ibeirt#"ch##d-1#"fe$"fa#$l-mx%%roads$$/bus$#aco',
+    '$$news$,way-builders(&trucks\'"ed#)n-bearing%%drops%%maker%\'smeared$%check$&ed-off(!n$#fed$%geese$$hood$$iest',
+    '$"ow$&soaked$#ton#)sed-sides$#ian%#ngs$#ley$.on_d\'&euml;tre&#nes"&jastan$!t"#kim$$sons#)otoarison&&niaina',
+    '$#sen",leigh-banana\'!s#)lentandos$#ier$!o$*ying-point"\'m-raids#$alho$(n-active&\'shifted%"na$#sut$%t-gan$\'zanoglu',
+    '#"ba$#eau$$lin\'$(unctious%#tan#&garhia#)ification##jee$%uttun#&lakhan#$mell&%sberg$%ingen#!o$$lino',
+    '$)ton/swann$#way#%sammy%"ys$$dens$+ey-optional$%field$2gate&ndash;dunkirk$$land#&tallie#"uz"%n-out#$aldo#\'ch-type#%dalli',
+    '$#lay$$omer$#ung#$etta#%geley%)rs-celtic(%leeds%&worthy$*str&ouml;m#\'k-aldis%)frequency%$size$1in/leicestershire$$ness$*ovi&cacute',
+    '#%sacks#$tona#$well$$orth""ob#%c/efi#$uche"&p30/74##74s#*aciousness#!d#"e.#%haels$!e#)id-strike',
+    '%#ly.$\'er-like$#net##ley#$pin\'$)resentata,#ivo#%sodie"%qabah"$rden#%e-air%\'binding$$.and$(fication#!i',
+    '$$orum"(salhague#!c$$asse##grf#"ha%!f#%kovic##mus##oul#/pberry-coloured#!s$$ells$!y#$tadt',
+    '$%islav$*rellamenti"\'t-holes#\'angrian#-chet-and-pawl($like$&liffes#\'e-books%%calls%$free%&paying%\'slowing%#the$$ably$*mahatmayas',
+    '$$gael$\'lesholm#\'ifiable$"o\'%&n-book+!s&+al/economic)%legal(%ities)#zes&"s.#$jada#"ky#$tail%#kul',
+    '$!e$\'le-free$)y-looking"%ucana#$lini"-vaged-looking$%nelli$!r$#sio#+ell/a-level%.oson-mahasampo$%nshad&%tones#"iv"(w/thames',
+    '$+e/organiser$&insons$%plugs#%stron#%yards")y-florets$$guns$\'tracing$*vibrations#\'/father$&mother#%burns#)chaudhuri##den#!e',
+    '##kat#"le%!s$#ton##man$-ond-guillaume$$undo##ney#$osan#$star#$well"#zaq#$grad#(njatovic$!o',
+    '##van#$zell!#b\'c"#-sr"$.211"!a#!s")g&mdash;2#*-copyright"\'mk-1000%$type""os"(s140,000#\'250,000$%6,000',
+    '##500!"c1#"5k""30"!6""7+"%a/col""ds"!k"!r""s5!#d54"\'baccess#%i.dat$-configuration',
+    '"!g""ms"!r"%s-eon#!v!+e&ccedil;it#/rehy;tightening",-acquisition%$tive$&ddress%\'mitting$\'fforest$$lign$(ppearing&%roval',
+    '%*rangements$(sserting)!s&&igning)$ment&#ume\'"re$%ttach$,uthorisation$&wakens#\'baiting#)calculate$\'hristen$(irculate$&laimed',
+    '$$oded%)mbination&(pilation\'\'osition%+nfiguration&\'nection&%quest&$vene%"ok$$ross#(dedicate%%fines$&ivided$"on#)electable',
+    '$%mbark%&ission%\'phasize&&loying$%ncode%)dorsement\'#wed%\'forcing$-vangelisation%\'olution$\'xamines%*periencing&$ress#(fighting%"ts',
+    '$%olded%)restation&&mulate%$ught#*generating$%rowth#$hash$#ire#\'imburse*!d%%plant\'*ementation$*ncarnation&*orporation%\'fection',
+    '*%ments%)itialises%\'sertion&\'talling%\'terview,#ing%\'vesting&\'igorate$\'terates#&kindle#%label$#ent$$ight$(ocations#&making',
+    '$&elting$$ixes$*odularised%&ulding$,ystification#$name$\'umbered%$triv#*occurrence(!s$-rchestrations%\'derings%+ganizations$(xygenate#)polishing',
+    '\'%tions$-rioritisation%&oofing#\'raffled$\'eadable\'!s%(gression&\'ulatory%&leases%(plicated##sat$#eed%(ttlement$\'heathed$(pecified',
+    '%#ray$%taged&"nd&#rts%%ocked$(ynthesis#%taken$"ie%#tle$#ook$%raced&)nsmission%!y$&uning.$$ying',
+    '#\'unified&#tes$#ses#&visits%&talise#(workings$&rapped#&zoning"$:606#(sterland#&vision",ach-me-downs$*quaintance$&tions.#%d&num',
+    '%"me$#.me$&e/tree%*r-friendly\'\'printer&!.&)/listener$0ily-identifiable$\'mitting$,y-compressed&)flavoured&%money&&set-go&\'to-bake)%drink',
+    ')$roll%%money#!f#!g$\'an-like\'(thatcher&%/bush$\'entless#)l/nominal%$star$$igns%!s&"ms&#tes\'#ic.',
+    '\'\'engine2$\'locates$"s.$%timex##mes#&nimate(#ing$&nealed#\'pproval##rer$%foot.$*ticulation#%scend$&eheath$\'on-able',
+    '$&sesses%$umes#)ttachment%)ributions#)uthorised#$vill#%woken""ba$%dging$&lanced#%eldes$"nd#&idding%!s$"nd',
+    '$#nio$$redo#&uffing$"tt"+calculating%"de%(ibrating$(pitalize#"bc#!e$&ipting%&ver(s)\'"th&+ing-station$&nsions',
+    '&(ly-built)\'created)*discovered)(launched)&passed*(urchased)(released&\'ralised*&zation$-ption/waiting)/ist/telephonist\'$vely&-or-orientated$.ssion-battered+\'lighted',
+    '+(esistant*%weary\'#ves#%hange&#nel)$ling$!t#\'idivant\'$ists$(pient(s)%4rocal-non-reciprocal)%tions$-rcularization$&tativo$#ved',
+    '$#man$$oner(!s##lin$)usiveness#!o$+alification$1gnicionesjeodorum\'%sance$(llective\'$ters%)onization)!e)#ing$*mendations',
+    '%#men(\'dation.+#ory&&itment%&posing$+nceptualise&%ilers(&iatory%+figurations%\'quering%*stitutable\',ru&ccedil;ao)!e%*tamination&-extualization',
+    '$%rd(s)&(-beating($ooks\'*collectors\'$mode\'.of-achievement\'(playback&(breaking&$ists\'#tes&0s-of-achievement\'\'/client$#ups$&vered.#.riminalisation',
+    '#/tangularisation$!e$(itudines(!o$(ovaginal$#ums#$uler$%mbant&$ents$*perability$$rled%(vifolium\'&rostra".d&rehy;covered)(pointing',
+    '(%green$&barked&#sed%#eds%%rowns$&carded%#ell%$halk&%ecked%#law$$deer$#fox$&hooded$)lacquered%%ipped',
+    '(!s$)petticoat$&sashed%%hifts%&kinned%&temmed$&tinted%%opped$&violet$.white-and-blue%#ine\'"gs$&yellow#&/white#\'breasts',
+    '#*dcliff/raf$%endum$!i%)ng/thames%(sh-black*#ond($fair($gold)$reen+!y(&purple(&yellow#)edicating$-mocratisation%&ption.',
+    '$)termining#&fields#$gate$$rove#"ha$$eugh(!s$$ills$$ouse#%i-hot$*scountable#$knap##law$#egs$$ynch',
+    '#$nose#$onda#%point#$ring%"ve#$sell#+uced-memory%!t&$ion.)$ists$%ictes$&ndance$\'plicate+!s$"ty',
+    '#$wald&!l$#ick$$orms",ebok/running#$dier%$ness&!g#&f-like#$kers#"ma$\'phasise+!d#"na$#try',
+    '$"er#\'vesiana$#ley#(xamining"$f.19$"20%!5$"id#*andweights\'"gt#\'eree(s)&%ndary%%rable#"ik$$ne/c',
+    '#-lection-to-go(#ves%(xiveness#\'ounding#-ractive-index%&tition$/eshment-trolley$*idgeration#&urnish$*se-derived\'%fired"%gaird$"la%"is#!d',
+    ')"or+!s$!s$$vanu#%giani#&icidal$"ld&#ing$(m&eacute$)omontanus%"n\'&#(s)&(al/class)(national&!e',
+    '(\'nations$(ster.com&&ratiod+)n/booking#"mi#%navit$&eville#\'radings$%essor)!s$$oups#-ular-interval\'&/block\'+ly-occupied*\'updated',
+    '$#sse"-habilitations+#ors$"na#$eard&#ser#%iring#)ybridized"+ich-prussia%"ek%#man%.skristallnacht&+musikkammer#(d/school$"el',
+    '#(gn-years%#eth#$llys#(mplanted%)risonment#*naugurated$$berg$(deerland$%eckii%#tte$)farctions$&jected$"ke$\'stadler$$tjes',
+    '&)stigating(%ments##sin#!t$$hian$#sma#$vich"\'jected.&\'ionists"%ksten##tum""l.#)aparotomy$"rn$)tion-ship',
+    '(,al-to-object&*vely-small("s.%"um$%xedly%#man#%easer(!s$/gation-fighting$#kto$*v&eacute;s%&ancies&%tions##iab&\'ilities',
+    '%"ta&"um$#ef-%$vers$#gio\'(n/stance\'/us-intellectual*$like$$ques#$lies"%magen$/in&lsqb;ed&rsqb&$der.$"ne$\'rkables',
+    '%#que#$eber$%diate$(mberable($ings&\'rancers$&ngesau$(rciments$#xio#-ilitarisation$%ndin\'%*gton/daily$!s$&ttable&#ent',
+    '$!n%(stration$+rselessness$,tely-piloted$&veable##pel##tox#$uera"&nacena$#ldo$%me&gt$(turation$$udat%(lt-volvo#&bourne',
+    '$%jambe#"e/$$berg$(gotiates$-iski/zuravski##ger$!o#%ilson$9n-angiotensin-aldosterone#!k#4nes-le-ch&acirc;teau,&ateaux#\'ominate$#oij$"ry',
+    '$%vador&#tes\'"io#%qiong#\'t-a-mob%*collectors%\'seekers$"as$$book$"er$-s-to-mortgage"+obstruction#&ffends"-p&ecirc;chage#\'ackages',
+    '$(tination#%eats.$$lita%%lants$$nter$&tetive%$itio)$usly#%hidim$%rases#\'illared#!l$&acment%$ster%%yable',
+    '$"ys#+olarization)#ing$(rt-style\'\'writing&#ed.$%seful%+itory-based#!r$!.$%ehend(%sibly%(sentable*+tive-number&%sible',
+    '%&ntings%$sing%\'vatized$(oductory%%posed#.tile/amphibian#)ubblicano%(lic-wide(#ain)&n-held+\'liberal$(diations$1tation-commitment""qu$%alify',
+    '&"is%&tement"#rio#!r"\'salable$#mpa#&cripts$)usitation#,earch-minded$"ed$&mblant\'$ence$(ntencing$#rch$.ttle&rehy;ment',
+    '$"ot#-ident-general(*ial/studio("s.\'!z%"ua\'$lism&#es.$#gn.&"al$#lin$\'n-based&+impregnated%$ated$!s',
+    '&#ent&!o\'\'r/diode#"ol%#der%\'utions.%!v$&rative$-urce-assisted))consuming))dependent)\'starved)(weighted#,pecification&&tables',
+    '\'"s.$&irable$\'lendant$"on&&dents.&%se_to((s_rather\'"ib)!l\'#ory%%sible$"un#$sler#(tabilize%$cked',
+    '%%ffing%$rick%)urant-car+%owner*$/bar+%naafi(&trices$%eamed$\'itching&&utions$!r%&icted.(0ion-modification+#ist#%uited',
+    '&%s.txt$#m\'e%%moned$/rrecci&oacute;n$*scitations#(ynthesis"#t01#)aliations$&rdancy&"er#)entionist,!s#!i$&cently%$ules',
+    '$%ghten$#nex%*otopically%"yl$*r&eacute;s%%eable&"d.&%ment.#&oucher#&ractor%&nslate\'(missions$$ials$$oarc%*conversion',
+    '%$rsum%.virus-mediated$$ying#\'urn_for$"sa#$zius"%uenue#%schel$"es#\'tlingen##ven",valorisation#)elationum%%lings%#ous',
+    '%(dication%*ge-seeking%"ko%+ue-approved(&earner.!s(\'neutral(\'sharing$\'rbatory%#se-(&biased(%punch-#ing\'"d.%%tants',
+    '#,iew-articles$!s%"al$\'talises#)ocability$\'losiona%,utionariness,,y-liberation*$ises#"s.")wardingly$$shed#&elding#&irable%"es',
+    '&$ings""xa##hep##ive"\'y/stunt#%javik#$ners%!y$+olds/farmer$%sford"&zwanul#$zori!$f141"!6"!8',
+    '""d1#!7""ms!,g/00/22/2005""11"#550"!9"!c"!r"!t!0h&ocirc;-poulenc"$(co)""10#!3"*abditiform',
+    '\'\'yolysis#)psodising(#zed"!b"!c"$eade#%idity$&neisen%#gau%\'laender##mes#(ologists$%meter$%phyte$$stat',
+    '##tor&$icus#(umaticky\'(ologists"&ggf-ii"(ine-main%&lander$"og%)logically%\'viruses#)pidistias#&zobial%\'solenia",odesian-born$#ies',
+    '$*opsin-like)!s##eas#"s-$#ddu$&on-sea"!u#"ad"\'ydderch$&yronen#(me-royal##nns$!s#$tons!*i-digested',
+    '#!d#"ne##zan&!\'"\'bbonmen#/emont-sur-ancre#"li#$nica%"tz#,onucleotides$!t%,riphosphates$$zyme(!s#%stein',
+    '$%iarda\'$elli#\'e-field&$lail%%paper$%field)!s#*h-coloured%%quick$$ard\'\'\'s-style(,on/community+%julie*#ian\'"us',
+    '%#nda%\'st-ever$*ly-dressed$"on#$inus#$kert%#tty$$ling$*mondsworth#&ondall"%dders$&ington$(lesworth$#rie#*e/handling',
+    '$!d$"ll#)ge-filler&$like%#ons%$wood\'#rth$!y##in\'%\'g-boots(\'reeches\'%habit\'&stable#$leys#$path',
+    '#(fenstahl#"hl##ken#&mersma$%melth#"ra##ssa#"ux"&feness#%fraff##ifi"&g-veda#!.#"ge$#in\'',
+    '&)mdash;the%$-arm&\'context&&facing&$left&$most&!o&&to-die)$know)&lifers&\'wingery%%.hand%#est%"ie%)s-holders',
+    '%$ness##los#%nomer#\'oristic""jp$"er"#kei#"ke"%lwanu")m-suardal#"ac$$tron#$fall#&linger#!o',
+    '#%wards"(nderpest$$less#-g-a-ding-ding\'-ring-o\'-roses%(bedecked%(doughnut\'#ves%\'handles%%rusty%$side%%tails$+/open-ended$"en$$ford',
+    '%#ng.$#low$$ness$%sider%#ted$$tons#%kfels#!n$"al$"in#&se-aid\'\'nd-hold&#off%\'ability%%d-out',
+    '"#olo#(maggiore#&thamus$&sville"&phagen##man##off$"ll"\'quewihr"(samburgh#"by#)c-centred$%/6000%$unix$!a',
+    '\'&/sparc-$x68k#+e-fall-rise$\'borough$%holme$#ley#"in$!o#+k-decisions%&graded%#led%*management%)spreading$!.$%=0.13',
+    '$$free#!o$!l"#tas#(chie/wrg#(hauddeen$!o#\'jemjokk#$orno#(terkreuz$!s#/ual-constraints&\'isation(!e#"vo',
+    '%#ing#&ellese$\'r-banks(#sin\'$orne&$like&%mouth&\'related&%users%%boats%$gate%#ina$!s$&tingly%"ts',
+    '%#rra$%niana"%yanto""zq!"ja"!p!%k-33r!#la1"!e"$ogin!"m6"!=""bk"!l"#mbr',
+    '!#n19"(ase-free"!b"!t!"o-#\'24-7429#\'31-8959"\'achford#)d-builder%&makers\'"ps&&enders)#ing%\'network%\'walking',
+    '%\'railway$#ers$&houses$%maker\'#ing$$name%$ight$%peace$&racing$%stead\'"rs#$mers#*t&aacute;n$"ta"#bat',
+    '$#ies%*ns/college#%eddow$\'rtianum&*s/national\'"en\'%field\'*on-macleod)#ian#"ic$$nses&+on-humphrey#\'ot-like%\'isation#)son/heart',
+    '$$stum",cca-saporiti#\'hambeau%!u#\'k-boots%*controlled%%dance&\'wellers%\'hopping%#pop%$shag&$till$*/classical%%dance%%heavy',
+    '$\'afellas$&climbs$(dwellers$(efellers%&ndorfs&&schaub%\'rfellas%*t-launcher\'&shaped&"te%!y$$gear$$head$!o$"s.',
+    '%$peak%$well$&tastic$(y/strach&%wilko#%stone"&d-butt#$bard$%ourne#)dlesworth##ets#$ford#"ga$*ers/cinema##ins',
+    '#$more#$nina##ota#$rick"&edowns#%sdahl$#hus#$thke$%tiers"(g&eacute##art#$erio%(s/thames%#vik#$hani',
+    '#%rborn$#man"#ine#\'sterers"%kison$!t##oko"&landic#&dosist)!a#)e-bearers%(mappings%(oriented%%plays%-relationships',
+    '%#set%\'to-name$"s.#"fy#"l-%\'a-joint%(crushers%&necked%+on/roll-off%%royce$$ason$%ed-in\'#top%+r-coastered(%utter',
+    '&(coasters&&skated\'%nakes$#ick%$nson%#ver$)s-bentley#\'y-polys"%m-aid#$an-8%(/sanchez%!d%-ian-hungarian%&o-ward&"va',
+    '%\'ticizes(!k#"bo%#uts#&erholz$&sbeoch$"yn#"ni##olo$\'sinuano#$seys#$usha"%nalds$!s##bar',
+    '#"ga$!o#!i$"ti#$neby"%obish#%croft#&f-bolt%&lights%&spaces%%trees$$ings$(lessness%%ights$%racks',
+    '$$work#"ky#(m-height%$only%\'sharing&#ize)!d$\'/dining%\'kitchen%%study$!f$$iest%$ness#%tball$!h',
+    '%#ing")pe-biting&%urned%$knot%&makers%%soled$$d-in$#men#$ivia"#rbu#"iz#"ty"*s&eacute;s#%aceae$$dini',
+    '%&ilines$$rium##bif&!s##cor#"e\'$$-bay%%edged%&filled%#hip(!s&#ued%&purple%&shaded&$mith',
+    '\'%immed$!/%\'auction%(milliner$#bed$!l%#awn%#ine%"yn$&markie%$berg$&nbergs&%urger%%cranz%$heim',
+    '%-oir-kernaghan%$tiel$!r$0s-round-the-door$"us$$vale$$wall%$orth#(ie-posie$%gnano##lea#&mamund%%rinus##ove#*s-milbanks',
+    '%#lls$(carberry$$head$+i/nightclub%!e%&iskaya%%llion%%tters$\'minster#&tislav$\'ovtzeff$"ra#%witha"\'t-weiss#$anev',
+    '#$berg#-enturmstrasse#(herheath&!y%!s$)iemurchus#!o$#fac#$teck%$nest%2rdam&mdash;antwerp#*undifolium&"ly#&weiler"#uah',
+    '$*rd-snowman##bik#$d-up$$ette#!e$!s#-ge-controlled%#rie$(h-barked&\'chopped&\'scented\'&kinned&%trade%#ead&$d-up',
+    '#%illan#!l$%ettes$$lier#$main%%nians$\'eliotis#*nd-bellied&(cornered&&leaved&%necks&#off\'"ut&%wound%#arm',
+    '%$jan.%$neck%$smen%#ups%%wound#*se/postman%"rs$%ingly$)seauesque$\'tabouts#,te-following%#map%\'r-based&#man$\'ineness',
+    '$#ley%!y#)undabouts"%vatti"&w-boat$&column#,/oxfordshire#\'an-webb#/bottom/chipping*&didcot*)haddenham*%luton*\'stanton#$dily#%elled',
+    '#1land/agricultural\'$sons$#ing#!y"%xboro##ton#$well"(yal-iced&#oak%"es%(ty-based#"en$!r##gar#+le/director',
+    '#"st"\'zenberg!#p-1"\'c-based#!p""dc"$ecvd""f9"$g400"!k""ms"#o30""sl!!q"!q',
+    '"*299/g-askh"!3"%=0.84#$1.28%"99#$2.86"#rrp$"rp!\'s-232-c#!4"\'/6000np"!2#%3,000$"2c#%5,000',
+    '""cs""nh""pp"!r""ua"&v-nf21&!4!"t1"#itb"\'net-osi!*u&eacute;e"&aidhri#\'ngpanit#"rk#!s',
+    '#%ashon#(ber-clad\'%lined\'$neck+#ers\'\'wheeled&$wear\'#ood##els$&nesque#/idium-strontium#\'ricator%%folia%&pinnis"#caj',
+    '#$kled#$tion""da$"ll#(by-based#$dell$#ier#)e-looking#$ford#,ge-whitworth#%heath##ier$$ment$"ng%!i',
+    '%!k#!p#&ugaira#%yayev"$edas#*lle-takens"#ffe#$iyaa#!o$\'us-buff\'%sided&!."*g-rethinks$&strewn#*by-related',
+    '"%hrgas"$ins."*le-breaker%)enforcers%)followers%&makers%#the$+s-of-origin)%thumb$"th#$lier"%m-550$&soaked#"an##col',
+    '#$jums#%mells#\'yantsev"\'n-chase$\'of-week$%pasts##cho$"om#$dvee#&esword##gwe#%nable$\'ers\'-up$(ing-back)%oards',
+    '(&shorts(%track#&s=0:02(!4\'%40est%\'1:00est$#car#%times#+way-busting&"s.##yan"#pal#$erts#(persberg$"ia',
+    '#*ture-discs"$rale%$ists"$sher$%forth$)ing-about$#man#$jaev#$kies%%ngton%!s#"li#%pidge#)sel-jones%*t-coloured',
+    '$#ia-&+n-dominated(&german(\'looking()ukrainian$#kii$)o-persian%&phobia#&t-belt$\'ichello&$olus%"ly$#ler&"ss"&taceae',
+    '$&enians$#ful#%ilius""us"&ymbeke##ter!#v-4""20"!a"!b""lc!,wanda-uganda"!e"!g!$x-20',
+    '3#;an4!s"!\'""30"#all#,n/consultant$"ne$/odine-sensitive"(bczynski"$cant"$dale#"on"%erson"#kov"$leev',
+    '""nd"#oei""r2"$thim$!m$"ym#.on-on-dunsmore)$tyne"%ukyus#!n -s&aacute;bato#$mp;d&%sup-1#(uml;ulen"?eacute;n&eacute;chauss&eacute;e',
+    '"4iacute;och&aacute;na#\'circ;an"$khgr"5oslash;gaard-andersen)0r-fugl&oslash;ya*,v&aacute;gur#\'uml;dra"&rarr;a"\'ucirc;r#,uml;dkirchen!"\'a##git"&posin\'#$pose"%zltan',
+    '"$k+1)!!*""*t!!+!"-b"*methionine,)-labelled"$says#"b3##eem"+t-r-e-t-c-h#$raps##urn&!s"$wave',
+    '!&.10(1)$!1$!8%#(2)#"10$!7#$2(1)#%37(2)$$9(i)#$4(2)$!6#"51#"79#!9"$2(6)',
+    '$#(1)%"2)#$2(1)#$3(5)#$4(2)#$7(1)"$3(4)#!0#!1#$4(1)#$7(1)#$9(2)"$4(4)#!3#$7(1)',
+    '"$5(6)#!1#$2(2)""60#!3#$5(8)#%87(2)#!b""72#!8"$8(1)#!1#!2""91"&africa',
+    '"$c.o."(d.r.r.s."!e"!g"#i.t"\'jackson"*margherita%#ino""n."$o.b."$p.a.$"f.$"m.$&r.e.d.$$u.c.',
+    '"!s#&.s.i.s"$t.g."\'w.i.f.t)!.$"t.!!/""36"&powder"-t183028/10med#$oday!$0*w0!*1&ndash;s6")-nuclease"#/s2',
+    '$"9)#$3(4)#$5(2)%"3)#!8"$1(3)$"5)#!3"$2(3)#!4#!7"$3(1)$"2)$"3)#!9',
+    '#!5"$5(1)#!2#$3(3)#!5#$a(1)"$6(1)$"3)$"5)#!0#!9"%7(11)#$0(1)#$6(1)#%8/179',
+    '#$9(1)"%96(5)""ws!$2(4)#"5)"#*w2"$0(2)$"3)$"5)#!1#$9(2)%"4)""12#!6"%22(5)',
+    '#!0#$1(1)#!8#!9"$4(3)#!2#!7"$5(1)"$6(4)"$7(2)"$8(1)!$3(3)"#/s4"$0(1)#"00',
+    '"$1(1)%"0)#!2#!4#!7#!8#!a"$2(2)#!a"$3(6)$"7)"$4(2)#$3(4)#$9(3)"$6(2)',
+    '#!2"$7(2)$"5)"$8(1)$"4)"$9(1)#!5!#402#!3"$1(6)"$2(2)#!1#$5(3)#!6"!4',
+    '"$7(6)$"7)"$8(1)$"9)!$5(2)#"3)"!+"!0"$3(2)"!4"$6(2)"!8!$6(3)""2l"$5(5)',
+    '#$3(5)"$7(b)#$7(1)%"2)%"3)%"4)%"9)#$8(4)"!8##(a)#!1$#(4)#%6(1a)!%71(2)"$2(4)',
+    '"%42(1)#!3$#(2)"$7(1)"!8!$8(1)"!1""39"!8!$9(1)#"3)#"5)"$4(1)$"2)#!1',
+    '"$7(2)$"3)$"4)$"7)!(=thomson!"a1"!4"$7000""80")ab-scania#"da$&eddine#$lach#)r-ferngas$+land-museum',
+    '")bachthani$"jo$%novic$!r$#yon#$bats$!o##ean$"th#"ia$!t#\'le-dark#!o$!o$%rtini',
+    '#&rehill%%tache#"ur#!z"$casa#*cad&eacute$&harata\'"um$(ulations#%erdos\'$tium#*her-masoch%)verellite&$ille$%itids',
+    '$$load$#tor$&villes#*ramentally%"ti$&emento$*ilegiously"$daba$!m%!u$!n$"ts#%diqui##eqi#$gill',
+    '#!i#+ler/spencer#%ness.#,o-masochists#!y"$eger#%misch#"ns""fc##dar#)e-looking$\'cracker$$ness$$tips%%y-bar',
+    '$%world#&froned##ran$!i#\'ternoon"%gasco$!x#)gar-maker#&ittary#$rado#$uaro"$habi%$zada$$gian%"un',
+    '$)l-saharan#$iwal"%id.mr#!f#"gh#&l-past$"ja#"ne%%resse$$foin$#ham$At-&eacute;tienne-de-ba&iuml;gorry&\'antoine&\'exupery&&girons',
+    '\'%ubert&&ignace&$jude&+lary-soulan\'#ike&$ouen&+r&eacute;my&%vanne\'%ulbas%1e-marie-de-campan\'(victoire%8field&mdash;ballynahinch%$like#"qa#\'sangkhi',
+    '##toh#$vism"%jadah##jad"\'kaguchi#"ir#\'latvala#"ya"\'ladbowl$#nio$$rino%)y-earning&%/wage$#the#%dykov',
+    '%%rooms$#/in%*redemption$#eby$!f$!k%!h$(r-rowney$\'s-force+!s%*/marketing%%rooms$%wheel#)ford-born#,g&aacute;0do',
+    '#(icifolia$"hu$#nae%(e/normal%#gar%\'ization%#son$\'tthilat#"la$"eh%#ron#5m-reifferscheidt-dyck$$acis$"es$/onella-infected',
+    '(!s#&omonic$&nitana$"te#%peter#*t-bleached%)sensitive%%wedge$\'/pepper$\'atorial$*burn-based)*darlington$*er/moredon&!n&!o',
+    '%&leetby$&icidae$&market$$ofix%&nstall$$pond$%wells$$ykov#)um&auml;e$$peto$%sbury$$tant%!i#&vanius%!t',
+    '$&elinus$#ors#"za$#ton"$m-7s#"ad$(n&aacute$.rium-neodymium%"ra#"co#%doria#+e-different%$race%&shaped&$tore',
+    '$!s#$gram##ira#$loff#$mels#%nites##oed$#rat$&thrace$#yed#&plings#$sova##uda$&elites"&nagare',
+    '$%silva$"th%&oriums$"ya#%chita$#ito$"te%%ifies%#ury#+d&oslash;ya$\'-bagged\'#nks\'%rrier&&lasted&\'ottomed',
+    '%%flats&&rosted%&martin%&strewn%&washed$\'/cement$!a%"ig%"ll$$burg$$eels%!l%+rs/hancocks\'#ons$4ford/joint-custodian',
+    '$$hill%!u$#iga%%lands%0nista-controlled$#ner$!o%"-k%&/award%&uville$+stone-lined$$usky$*wich-board.!s+#xes',
+    '$\'y-brown#"ei#$gars$$eeta%\'rhausen$%hines$%orski$$rado&!m$%stons$#uin\'$aria&%sorba#"ha#$iman',
+    '##jek$$ukta#&key-st#&nemann$$ikov#"on#%quest#*s-culottes$\'culotte$\'evieria$$odar%"ni&!s#*t\'ambrogio%$elmo',
+    '%&marina%#rem$#ley$&olinas%#res%"sh$$uary%!s""or"$pele#!i$\'entiale\'"ly\'"um$#nta',
+    '$%naria$%zhkov#%phira#*rophyticus"$raga%$osso$#iva$$jane%$evan$\'katsani$#nac$%rimen$%togas#\'comeres#%ehole',
+    '##gan$#ens&"ts$$odha#"id$"na#&kandas%!r$#ing#&matian#$nath$!s#%ojini$"va$#yan',
+    '#!r$"ah%"ut##sby$$tedt##ton#$ungi"\'s-style##ana##hed#!i##oma#\'perella#%santa%!y',
+    '#$/set#$coms#%elite#+in-softness$$rize$8sfaction/dissatisfaction)\'oriness&"ie("d.#$oshi##pal#$taur$"el#&urable%*day/sunday',
+    '&$alia#&versme#)yr-chorus%$ical"*uce-making%&r-like\'$wide#&dargas$)i-arabian&%based&$iraq#"la#)nders-roe(&/trial#%rians',
+    '(%shape$%surea#,t&eacute;ing$"ee$"oy#(v&eacute$&eolens%"ur#*wirtschaft"#vac$+ge-rumbaugh$&nayana$#rin#&chenko#*e-a-connie',
+    '$&rstrip#"io%#tti%$ur\'s$&tskaya#%ourly$*y-piedmont%!e%!s"%w-bed$#cut$$mill(!s$%teeth#&amatsu',
+    '##cut##don#&ed-off#!t"\'xe-blue%(meningen$#way#$ilby#.ophone-playing#$tead%!d$/on/weightlifter"&ybrook##est#!i',
+    '$#_in#$well"#zhi!$b405 7transformational-change',
 )
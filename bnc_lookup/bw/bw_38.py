@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_38 = (
+count_38 = 6695
+
+heads_38 = (
     'mary-at-hill',
-    'mary-in-the-castle',
-    'mary/sister',
-    'marybank',
-    'maryfield',
-    'maryinski',
-    'marzia',
-    'marzipan-covered',
-    'marzo',
-    'masa',
-    'masahisa',
-    'masako',
-    'masami',
-    'masan',
-    'masayoshi',
-    'masayuki',
     'masborough',
-    'mascherin',
-    'maschotrometer',
-    'masculines',
-    'masculinising',
-    'masculinism',
-    'masculinization',
-    'masculist',
-    'masefieldian',
-    'masek',
-    'masekela',
-    'masemola',
-    'mashair',
-    'mashar',
-    'mashelle',
-    'masheter',
     'mashey',
-    'mashtaq',
-    'masinga',
-    'maskell/swindon',
-    'maskers',
-    'masking-tape',
-    'masklike',
-    'maslanka',
-    'maslarova',
-    'masonary',
-    'masquer',
-    'mass&eacute;na',
-    'mass-based',
-    'mass-inclusionary',
-    'mass-membership',
-    'mass-movements',
     'mass-murderers',
-    'mass-spectrometric',
-    'mass860',
-    'massalas',
-    'massarella',
-    'massification',
-    'massim',
-    'massino',
-    'massively-parallel',
-    'masstormind',
-    'mast-high',
-    'mast-like',
-    'mast/furling',
-    'masta',
-    'master-bowman',
-    'master-builder',
     'master-class',
-    'master-key',
-    'master-level',
-    'mastercore',
-    'masterplans',
-    'masters-swiss',
-    'masterstrokes',
-    'masterweaver',
-    'mastiles',
-    'mastrick',
-    'mastroantonio',
-    'mat\'',
-    'mata&ccaron;i&cacute',
-    'matabolism',
-    'matagorda',
-    'matanzas',
     'matanzimas',
-    'matarazzo',
-    'matari',
-    'mataro',
-    'matarrese',
-    'match-boarding',
-    'match-fit',
-    'matchboarding',
-    'matched-dependent',
-    'matches.',
-    'matchfinder',
-    'matching-up',
-    'matchlessly',
-    'matchpots',
-    'mate-guarding',
-    'mateev',
     'matei',
-    'mateine',
-    'mateless',
-    'matere',
-    'materna',
-    'maternities',
-    'matey.',
-    'mathematization',
-    'mathison',
-    'mathuru',
-    'matica',
-    'matily',
-    'matina',
-    'matlack',
-    'matooke',
-    'matra-marconi',
     'matrazenlager',
-    'matrigel',
-    'matrimonie',
-    'matrix-derived',
-    'matrix-isolation',
-    'matrix-type',
-    'matrona',
-    'matshushita',
-    'matson/cpre',
-    'matsuyo',
-    'matt-black',
-    'matt-finished',
-    'matter_what',
-    'matth&auml;us',
-    'mattheuer',
-    'matthews/uncle',
     'matthews_et',
-    'mattias',
-    'mattinson',
-    'mattiya',
-    'matto',
-    'mattress.',
-    'mattus',
-    'matunta',
-    'mature/stable',
-    'maturity-volume',
-    'matusadona',
-    'mauberges',
-    'maubeuge',
-    'mauchlen',
-    'mauds',
-    'maufrais',
     'mauir',
-    'mauldon',
-    'maules',
-    'maundered',
-    'maungdaw',
-    'maunoir',
-    'maupertuis',
-    'maurine',
-    'mauroy-jospin',
-    'mausner',
-    'mauvaise',
-    'mauve-blue',
-    'mauve-white',
-    'mauvey',
-    'mauvish',
-    'mauz&egrave;re',
     'mavens',
-    'mavesyn',
-    'mavisbank',
-    'mavrud',
-    'mavua',
-    'mawer',
-    'max-dna',
-    'max-max',
-    'max-neef',
-    'max-planck',
-    'max-terminal',
-    'maxconcurrentusers',
-    'maxi-dowment',
-    'maxicrop',
-    'maximand',
-    'maximisers',
     'maximos',
-    'maxmara',
-    'maxmilian',
-    'maxwell-style',
-    'maxwell.',
-    'may&mdash;see',
-    'may&ndash;13',
-    'may&ndash;20',
-    'may&ndash;24',
-    'may&ndash;27',
-    'may&ndash;30',
-    'may\'92',
-    'may-19',
-    'may-2',
-    'may-20',
-    'may-31',
     'may-4',
-    'may-5',
-    'may-august',
-    'may-september',
-    'may/july',
-    'maybelline',
-    'maycomb',
-    'maydan',
-    'maydays',
-    'mayekiso',
-    'mayer/thamesdown',
-    'mayest',
-    'mayewski',
-    'maylam',
-    'maylands',
-    'mayman',
     'mayo-chandler',
-    'mayock',
-    'mayorazgo',
-    'mayores',
-    'mayr-harting',
-    'mayston',
-    'maz',
-    'mazagon',
-    'mazar-e-sharif',
-    'mazawattee',
-    'mazeltov',
-    'mazeno',
-    'mazet',
-    'mazo',
-    'mazoh',
-    'mazon',
     'mazraa',
-    'mazrui',
-    'mazumdar',
-    'mazzolla',
-    'mazzoni',
-    'mb86931',
-    'mb86933',
-    'mbaga',
-    'mbandla',
-    'mbcs',
-    'mbdc',
-    'mbela',
-    'mbeni',
-    'mber',
-    'mbfr',
-    'mbikusita-lewanika',
     'mbm',
-    'mbombo',
-    'mboui',
-    'mbt80',
-    'mbus-to-vmebus',
-    'mbyte/second',
-    'mc2',
-    'mcadorey',
-    'mcaffee',
-    'mcaffer',
-    'mcafferty',
-    'mcallen',
-    'mcalonen',
-    'mcalpine/objector',
-    'mcaneney/school',
-    'mcaslan',
     'mcatamney',
-    'mcaughtrie',
-    'mcaughtry',
-    'mcbaine',
-    'mcblaid',
-    'mcbrearty',
-    'mcbrides',
-    'mcbridge',
-    'mccabe/consultant',
-    'mccaghy',
-    'mccahill',
-    'mccaldin',
-    'mccalliog',
-    'mccammon',
-    'mccardie',
-    'mccardle',
     'mccarn',
-    'mccarrigan',
-    'mccarthys',
-    'mccathie',
-    'mccaughrean',
-    'mccaulay',
-    'mccgwire',
-    'mcclanachan',
-    'mcclane',
-    'mcclarens',
-    'mccleery',
-    'mcclenon',
-    'mcclory',
-    'mccombie',
-    'mccombs',
-    'mccomish',
     'mcconachie',
-    'mcconnell-ginet',
-    'mcconnell/father',
-    'mcconnell/mother',
-    'mcconnon',
-    'mcconomy',
-    'mccorkell',
-    'mccormac',
-    'mccoubrey',
-    'mccraw',
-    'mccreary',
-    'mccredie',
-    'mccreedy',
-    'mccreesh',
-    'mccreight',
-    'mccrie',
     'mccririck',
-    'mccrirrick',
-    'mccrudden',
-    'mccrugan',
-    'mccuaigs',
-    'mccullan',
-    'mccullock',
-    'mccullogh',
-    'mcculloh',
-    'mccullum',
-    'mccully',
-    'mccumiskey',
-    'mccurbin',
-    'mccure',
-    'mcdermotts',
-    'mcdonell',
     'mcduffy',
-    'mceachern',
-    'mcelhinney',
-    'mcenery',
-    'mcenroes',
-    'mcewin',
-    'mcfague',
-    'mcfalls',
-    'mcfarlane/gloucestershire',
-    'mcfee',
-    'mcfeeley',
-    'mcfettridge',
-    'mcfie',
-    'mcgarrett',
-    'mcgear',
-    'mcgeough/managing',
     'mcgeown',
-    'mcgillis',
-    'mcgiver',
-    'mcglashen',
-    'mcglaughlin',
-    'mcglew',
-    'mcglory',
-    'mcgoay',
-    'mcgoldricks',
-    'mcgonagles',
-    'mcgrail',
-    'mcgrane',
-    'mcgrann',
-    'mcgrattan',
-    'mcgreavy',
-    'mcgregors',
     'mcgreil',
-    'mcgrindles',
-    'mcguckians',
-    'mcguile',
-    'mcguinnis',
-    'mcguire.',
-    'mcgurran',
-    'mch53',
-    'mchattie',
-    'mchenry',
-    'mchoy',
-    'mcilchenich',
-    'mciniff',
-    'mcisaac',
-    'mcjobs',
-    'mckeith',
     'mckeller',
-    'mckenna/glasgow',
-    'mckennon',
-    'mckeon',
-    'mckinley/osteoarcheologist',
-    'mckinseys',
-    'mckitterick',
-    'mclaglen',
-    'mclardy-smith',
-    'mclaren-ford',
-    'mclarnon',
-    'mclauchlane',
-    'mcleay',
-    'mcleman',
-    'mcln',
-    'mclugash',
     'mclukie',
-    'mcmahons',
-    'mcmain',
-    'mcmannus',
-    'mcmeekan',
-    'mcminnville',
-    'mcmorran',
-    'mcmorris',
-    'mcmurtie',
-    'mcnamara/anti-hunting',
-    'mcnarney',
-    'mcnay',
-    'mcneal',
-    'mcneese',
-    'mcnemar',
-    'mcnicoll',
     'mcniven',
-    'mcnought',
-    'mcnully',
-    'mcp-01',
-    'mcparland',
-    'mcphee/traveller',
-    'mcquoid',
-    'mcrae/british',
-    'mcrandal',
-    'mcreddie',
-    'mcredmond',
-    'mcrobert',
-    'mcrowen',
-    'mcseveny',
-    'mcshannon',
-    'mcsherry',
     'mcsmythurs',
-    'mcsporran',
-    'mcswiggans',
-    'mct-dp/mct-adr',
-    'mctavitty',
-    'mcteer',
-    'mcternan',
-    'mcu',
-    'mcvea',
-    'mcvittie',
-    'mcvs',
-    'mcwhinnie',
-    'mcwhirr',
-    'mcz',
-    'md-87',
-    'md100',
     'md7a',
-    'md83',
-    'mdesk',
-    'mdet',
-    'mdp-mdu',
-    'me-firstism',
-    'me-generation',
-    'me110',
-    'me12',
-    'me14',
-    'me15',
-    'me5',
-    'me6',
-    'mead/director',
-    'meadowcroft',
-    'meadowgate',
     'meadowvale',
-    'meadowy',
-    'meae',
-    'mealie',
-    'mealybugs',
-    'mean-eyed',
-    'mean-hearted',
-    'meanes',
-    'meanest-looking',
-    'meaning(s)',
-    'meaning-effect',
-    'meaning-makers',
-    'meaning-relations',
-    'means/ends',
-    'meanwile',
-    'meaple',
     'meard',
-    'measley',
-    'measur',
-    'measurex',
-    'measuring.',
-    'measuringly',
-    'meat-and-draught',
-    'meat-based',
-    'meat-free',
-    'meat-hook',
-    'meat-hooks',
-    'meatpackers',
-    'meazza',
-    'mebmt-1',
-    'mebson',
-    'mech-tool',
     'mech-tronics',
-    'mechanicsburg',
-    'mechanist',
-    'mechanistic-mystical',
-    'mechanists',
-    'mechili',
-    'mechrolab',
-    'mecistocirrus',
-    'mecke',
-    'mecklenburg-schwerin',
-    'med.l.r.',
-    'meda',
-    'medailles',
-    'medak',
-    'medal-winner',
-    'medavoy',
     'medaware',
-    'medcalfe',
-    'medcial',
-    'meddles',
-    'medee',
-    'medeled',
-    'medeousa',
-    'meder',
-    'medesano',
-    'medex',
-    'medgar',
-    'medhi',
-    'medhurst/coal',
-    'media&amp;values',
-    'media-assisted',
-    'media-dominated',
     'media-friendly',
-    'media-worthy',
-    'media/manula',
-    'mediacrats',
-    'mediaevalists',
-    'mediath&egrave;que',
-    'mediatore',
-    'mediavision',
-    'medical-research',
-    'medical/gastroenterology',
-    'medicin',
-    'medicinals',
-    'medicine-man',
-    'mediciner',
-    'medinacelli',
-    'medinah',
     'medininkai',
-    'medism',
-    'meditacions',
-    'medium-brown',
-    'medium-dark-grey',
-    'medium-duty',
-    'medium-grey',
-    'medium-hot',
-    'medium-price',
-    'medium-quality',
-    'medium-rare',
-    'medium-secure',
-    'medium-security',
-    'medium.sized',
-    'mediumism',
-    'mediwipes',
     'medjhouda',
-    'medland',
-    'medleys',
-    'medlicot',
-    'medlow',
-    'medula',
-    'medwyn',
-    'medzamor',
-    'meechie',
-    'meehl',
-    'meek-looking',
-    'meeker',
-    'meekle',
-    'meen/weather',
-    'meeney',
-    'meeny',
     'meenymore',
-    'meerburg',
-    'meerza',
-    'meet-the-people',
-    'meet-up',
-    'meet/meat',
-    'meeting-room',
-    'meeting-rooms',
-    'meeting/contact',
-    'meetings.',
-    'meg-voice',
-    'mega-',
-    'mega-bid',
-    'mega-big',
-    'mega-cd',
-    'mega-drive',
     'mega-expensive',
-    'mega-models',
-    'mega-projects',
-    'mega-stars',
-    'megabases',
-    'megabazos',
-    'megacities',
-    'megadeath',
-    'megakaryocyte',
-    'megakaryocytes',
-    'megalanium',
-    'megalith-builders',
-    'megalopolitan',
-    'megamergers',
-    'megarity',
-    'megavitamins',
     'megera',
-    'megohms',
-    'megolithic',
-    'megrims',
-    'meguire',
-    'meharensin',
-    'mehmedov',
-    'mehrauli',
-    'mehrdad',
-    'meien',
-    'meier-graefe',
-    'meifod',
-    'meigle',
-    'meijs',
-    'meinam',
-    'meindert',
     'meiner',
-    'meirion-jones',
-    'meiriona',
-    'meirionydd',
-    'meirokusha',
-    'meisl',
-    'meissonier',
-    'meisterwork',
-    'meixner',
-    'mekes',
-    'melab',
-    'melamid',
-    'melampus',
-    'melanau',
-    'melcher',
-    'melchisedek',
     'melcombe',
-    'meldrick',
-    'melees',
-    'meleu',
-    'melgarejo',
-    'melgueil',
-    'meliorist',
-    'meliponid',
-    'melissas',
-    'mellitic',
-    'mellomossens',
-    'mells',
-    'melmotte',
-    'melnibon&eacute',
-    'melodiousness',
-    'melody-and-bass',
     'melody-writers',
-    'melon-like',
-    'melon-sized',
-    'melonoma',
-    'melrosegate',
-    'melt&eacute;m',
-    'melt-spun',
-    'melter',
-    'melting-pots',
-    'melvich',
-    'melville-hill',
-    'melville-ross',
-    'memax',
-    'member-governments',
-    'membrane-covered',
-    'membrane/',
     'membray',
-    'meme-complexes',
-    'memebers',
-    'memic',
-    'memmo',
-    'memofile',
-    'memoir-novel',
-    'memorable.',
-    'memorandum.',
-    'memorialist',
-    'memorialize',
-    'memoriam',
-    'memorises',
-    'memorizes',
-    'memory-hungry',
-    'memory-intensive',
     'memory-joggers',
-    'memory-lapse',
-    'memphis-style',
-    'memphite',
-    'men&eacute;ndez',
-    'men\'s/junior',
-    'men-friends',
-    'men/women',
-    'menabilly',
-    'menabrea',
-    'menadione',
-    'menaquinones',
-    'mend&egrave;s',
-    'mendelien',
-    'mendine',
-    'mendocino',
     'meneguelli',
-    'menemismo',
-    'menemist',
-    'menlungste',
-    'menni',
-    'menolascina',
-    'menschen',
-    'mensi',
-    'menson',
-    'menstrie',
-    'menstruates',
-    'menstruum',
-    'mensuration',
-    'mental-emotional',
-    'mentale',
-    'mentawai',
     'menthe',
-    'mentorship',
-    'mentre',
-    'mentum',
-    'menu-based',
-    'menura',
-    'menuras',
-    'menut',
-    'meouw',
-    'mepps',
-    'mepstead',
-    'merafhe',
-    'meranti',
-    'merbury',
-    'merc.',
-    'mercantilists',
     'mercaptopurine',
-    'mercats',
-    'mercatus',
-    'merce',
-    'mercer/chairman',
-    'mercerized',
-    'merchandised',
-    'merchant-ivory',
-    'merchanters',
-    'merchaunte',
-    'mercht.',
-    'mercifulness',
-    'mercurey',
-    'mercurio',
-    'mercury-',
-    'mercury-transit',
     'mercury-vapour',
-    'meredeen',
-    'meredith-hardy',
-    'meredith/lorry',
-    'meredith/thames',
-    'merete',
-    'meretriciousness',
-    'merga',
-    'mergas',
-    'mergenthaler',
-    'merialdo',
-    'meringue-like',
-    'merinos',
-    'meristem',
-    'meritocrat',
-    'merits.',
     'merket',
-    'merkister',
-    'merkmal',
-    'merkulov',
-    'merlay',
-    'merli',
-    'mermen',
-    'meroe',
-    'meron',
-    'meroni',
-    'meronym',
-    'merrel-lynch',
-    'merrets',
-    'merrett/rspca',
-    'merrey',
-    'merriam-webster',
     'merrick/ron',
-    'merridew',
-    'merridown',
-    'merrithew',
-    'merriweather',
-    'merry-making',
-    'merrychef',
-    'mers',
-    'merseys',
-    'merseyview',
-    'mersha',
-    'mersin',
-    'merstone',
-    'merttens',
-    'merula',
-    'merulite',
     'merveille',
-    'mervy',
-    'merzario',
-    'mesa/boogie',
-    'mesatoshi',
-    'mesclun',
-    'mesdemoiselles',
-    'mesfet',
-    'meshuggeneh',
-    'meslanges',
-    'mesmerisingly',
-    'mesmerize',
-    'mesmerizes',
-    'mesocarp',
-    'mesolimbic',
-    'mesomorphic',
     'mesonauta',
-    'mesothermal',
-    'mesotron',
-    'mesquita',
-    'mess-mate',
-    'messageroutines',
-    'messali',
-    'messaoria',
-    'messaoud',
-    'messed-up',
-    'messenger/hemp',
-    'messenians',
-    'messerschmitt-boelkow-blohm',
-    'messianism',
-    'messkirch',
-    'messori',
     'mestensev',
-    'mester',
-    'mesters',
-    'mestnichestvo',
-    'mesur&eacute',
-    'met51',
-    'meta-anthracite',
-    'meta-sources',
-    'meta-theoretical',
-    'metabasalts',
-    'metabolical',
-    'metabolisms',
-    'metacontextual',
-    'metacriticism',
-    'metae',
-    'metafiction',
     'metafictionality',
-    'metal-clad',
-    'metal-frame',
-    'metal-lined',
-    'metal-plated',
-    'metal-rich',
-    'metal-sheathed',
-    'metalepses',
-    'metallic-blue',
-    'metallic-coloured',
-    'metallised',
-    'metalwares',
-    'metalworks',
-    'metanarratives',
-    'metapan',
-    'metaponto',
     'metaprogram',
-    'metapsychological',
-    'metareum',
-    'metarhizium',
-    'metastasised',
-    'metatarsal',
-    'metathesis',
-    'metavolcanic',
-    'metella',
-    'meteora',
-    'meth.',
-    'methacholine',
-    'methanolic',
-    'metheringham',
-    'methlan',
-    'method-acting',
     'methodique',
-    'methodologists',
-    'methot',
-    'methuen-campbell',
-    'methyl-d-aspartate',
-    'methylates',
-    'methylations',
-    'methylbenzene',
-    'methylphenidate',
-    'methylprednisolone',
-    'methylxanthines',
-    'metland',
-    'metodije',
-    'metoikoi',
-    'metoikos',
-    'metope-sculpture',
     'metre-deep',
-    'metre-wide',
-    'metreage',
-    'metres/minute',
-    'metric-imperial',
-    'metrocomm',
-    'metroliner',
-    'metrologia',
-    'metrological',
-    'metronomically',
-    'metropoles',
-    'metropolitanization',
-    'metropolitical',
-    'metsieh',
-    'meuland',
-    'meulbroek',
     'meung',
-    'meurtre',
-    'meux',
-    'meval11(co)',
-    'mewe',
-    'mewett',
-    'mews/rspca',
-    'mewsford',
-    'mewslade',
-    'mexicali',
-    'mexican-style',
-    'mexicanness',
-    'mexicanum',
-    'mexicanus',
-    'mexico-us',
-    'mexted',
     'meyer-wolden',
-    'meyric',
-    'meyrowitz',
-    'meze',
-    'mezereum',
-    'meziriac',
-    'mezlocillin',
-    'mezz\'arie',
-    'mezzetti',
-    'mfanasibili',
-    'mfds',
-    'mfm/rll',
-    'mfunjo',
-    'mfv',
-    'mg%',
-    'mg&times;3',
     'mg-63',
-    'mg/1',
-    'mg/d',
-    'mg/kg+indomethacin',
-    'mg/kg/24',
-    'mg/l.',
-    'mg/nil',
-    'mg104',
-    'mgbs',
-    'mgcl2',
-    'mgms',
-    'mgrv8',
-    'mgy',
-    'mh1',
-    'mh24',
-    'mh27',
     'mh4',
-    'mhaighdean',
-    'mhc-a',
-    'mhc-b',
-    'mheadhonach',
-    'mhl4s',
-    'mhm23',
-    'mhra',
-    'mhuaih',
-    'mi-rio-fil-loom',
-    'mi486',
-    'mi9',
-    'mib2',
-    'mibbs',
-    'mibs',
-    'micafil',
     'micdadei',
-    'mice-children',
-    'mich&eacute;al',
-    'mich&egrave;e',
-    'michaelides',
-    'michail',
-    'micheletti',
-    'michelgrove',
-    'michelmersh',
-    'michelsberg',
-    'michetti',
-    'michihiko',
-    'mickle',
-    'mickleburgh',
-    'micklin',
-    'micras',
     'micro-based',
-    'micro-chips',
-    'micro-circulation',
-    'micro-climates',
-    'micro-contexts',
-    'micro-crystals',
-    'micro-ecology',
-    'micro-emulsion',
-    'micro-fiche',
-    'micro-history',
-    'micro-investment',
-    'micro-management',
-    'micro-nutrients',
-    'micro-organic',
-    'micro-process',
-    'micro-processors',
     'micro-recorder',
-    'micro-revolution',
-    'micro-robotics',
-    'micro-seconds',
-    'micro-social',
-    'micro-teaching',
-    'micro-world',
-    'microadenomata',
-    'microaerophilic',
-    'microalgae',
-    'microaspiration',
-    'microassay',
-    'microbe-associated',
-    'microbist',
-    'microbombardment',
-    'microbreweries',
     'microbubbles',
-    'microcalorimeter',
-    'microcassette',
-    'microcellular',
-    'microclimates',
-    'microclimatic',
-    'micrococcus',
-    'microcrystal',
-    'microcrystals',
-    'microcytosis',
-    'microdeletions',
-    'microdissection',
-    'microdoc',
-    'microdon',
-    'microdrop',
-    'microequivalents',
     'microexstat',
-    'microfibrils',
-    'microfield',
-    'microfilaria',
-    'microfine',
-    'microfloppies',
-    'microfloras',
-    'micrograms/cu.m',
-    'micrographic',
-    'microhenry',
-    'microhierarchy',
-    'microinject',
-    'microinjection',
-    'microlighting',
-    'microlouvre',
-    'micromachine',
     'micromanipulator',
-    'micrometeorological',
-    'micromodel',
-    'micromodeller',
-    'micromosaics',
-    'micronesians',
-    'microneutralisation',
-    'micronised',
-    'micropalaeontological',
-    'microparticulated',
-    'microphysics',
-    'microphysiology',
-    'micropore',
-    'microprobes',
-    'microprocesses',
-    'microproof',
     'microrim',
-    'microroute',
-    'microseismicity',
-    'microsentinel/ux',
-    'microsieverts',
-    'microsoft-backed',
-    'microsoft-compatible',
-    'microsomes',
-    'microsorium',
-    'microsparc-iii',
-    'microspectrophotometer',
-    'microspectrophotometric',
-    'microsporidian',
-    'microsporidiosis',
-    'microstimulation',
-    'microstructural',
     'microtek',
-    'microtel',
-    'microtest',
-    'microtonality',
-    'microtrichia',
-    'microtube',
-    'microvalue',
-    'microvessel',
-    'microvessels',
-    'microviscosity',
-    'microwavable',
-    'microwave-proof',
-    'microwave-safe',
-    'microwear',
-    'mid&dollar',
-    'mid&rehy;1970s',
     'mid&rehy;nineteenth',
-    'mid-1330s',
-    'mid-1570s',
-    'mid-1620s',
-    'mid-1670s',
-    'mid-1760s',
-    'mid-1790s',
-    'mid-1861',
-    'mid-1900s',
-    'mid-1930',
-    'mid-1939',
-    'mid-1943',
-    'mid-1946',
-    'mid-1950',
-    'mid-1952',
-    'mid-1961',
     'mid-1965',
-    'mid-21st',
-    'mid-430s',
-    'mid-60',
-    'mid-630s',
-    'mid-660s',
-    'mid-730s',
-    'mid-90s',
-    'mid-action',
-    'mid-africa',
-    'mid-america',
-    'mid-back',
-    'mid-bedfordshire',
-    'mid-campaign',
-    'mid-centre',
-    'mid-childhood',
     'mid-continent',
-    'mid-country',
-    'mid-court',
-    'mid-craven',
-    'mid-dive',
-    'mid-down',
-    'mid-face',
-    'mid-flat',
-    'mid-game',
-    'mid-georgian',
-    'mid-grade',
-    'mid-heaven',
-    'mid-infrared',
-    'mid-iron',
-    'mid-layers',
-    'mid-leap',
     'mid-lothian',
-    'mid-meiji',
-    'mid-night',
-    'mid-nineteen',
-    'mid-oesophageal',
-    'mid-pitch',
-    'mid-points',
-    'mid-rabi',
-    'mid-recession',
-    'mid-scotland',
-    'mid-set',
-    'mid-shade',
-    'mid-shawwal',
-    'mid-song',
-    'mid-span',
-    'mid-storey',
     'mid-sweep',
-    'mid-swing',
-    'mid-teen',
-    'mid-tel',
-    'mid-tenth',
-    'mid-terraced',
-    'mid-thirteenth-century',
-    'mid-toned',
-    'mid-trial',
-    'mid-triassic',
-    'mid-tyrone',
-    'mid-wives',
-    'mid-years',
-    'midan',
-    'midband',
-    'midbody',
     'middi',
-    'middle-fifties',
-    'middle-horns',
-    'middle-late',
-    'middle-minded',
-    'middle-of-the-night',
-    'middle-of-the-roaders',
-    'middle-period',
-    'middle-rank',
-    'middle-ranked',
-    'middle-weight',
-    'middle/upper',
-    'middlebay',
-    'middleburg',
-    'middlefell',
-    'middlemanship',
     'middlepath',
-    'middlesbrough.',
-    'middlesbroughbased',
-    'middlesbrpugh',
-    'middleton-on-sea',
-    'middletonin-teesdale',
-    'middletons',
-    'middlewick',
-    'middleyard',
-    'middly',
-    'midfield/',
-    'midfieldman',
-    'midfoot',
-    'midgame',
-    'midgely',
-    'midgetmen',
     'midground',
-    'midha',
-    'midhope',
-    'midi-dress',
-    'midland/east',
-    'midmarket',
-    'midnapore',
-    'midportion',
-    'midradial',
-    'midshaft',
-    'midsomer',
-    'midtable',
-    'midtones',
-    'midtown-payson',
-    'midyear',
-    'miedz',
     'miegel',
-    'miere',
-    'mieres',
-    'mierle',
-    'miettinen',
-    'mif',
-    'mifsud-bonnici',
-    'mig-29s',
-    'migh',
-    'mighte',
-    'migombo',
-    'migrationary',
-    'migrolifs',
-    'miguels',
-    'miguez',
-    'mihail',
     'mihajlovic',
-    'mihara',
-    'mihnea',
-    'miho',
-    'mihr',
-    'miike',
-    'mikailichenko',
-    'mikhailov',
-    'mikhailovsky',
-    'mikkey',
-    'mikki',
-    'mikkola',
-    'mikkyphone',
-    'mikol&aacute&scaron',
-    'mikveh',
-    'milab',
     'milanov',
-    'milarepa',
-    'milbrun',
-    'milburn/freefall',
-    'milburngate',
-    'milchester',
-    'mild=1',
-    'mildew-resistant',
-    'mildews',
-    'milentijevic',
-    'miles/oxford',
-    'mileski',
-    'milewski',
-    'miley',
-    'milford/co-founder',
-    'milion',
     'militaires',
-    'militance',
-    'militaries',
-    'military-controlled',
-    'military-grade',
-    'military-inspired',
-    'military-looking',
-    'military-minded',
-    'military-related',
-    'military-strategic',
-    'milk-crates',
-    'milk-house',
-    'milk-producing',
-    'milk-yields',
-    'milk/newspapers',
-    'milkfloat',
     'milkin\'',
-    'milkiness',
-    'milksi',
-    'milksop',
-    'milksopping',
-    'milkstone',
-    'mill&aacute;n',
-    'mill-type',
-    'mill-yuns',
-    'millaires',
-    'millamant',
-    'millar/scottish',
-    'millardet',
-    'millares',
-    'millbourn',
-    'millburngate',
     'millefeuille',
-    'millenarial',
-    'millennia-old',
-    'millergate',
-    'millevoye',
-    'milliardi',
-    'millibar',
-    'millidh',
-    'milligals',
-    'millimetre-perfect',
-    'millimetric',
-    'milliner/dressmaker',
-    'million-odd',
-    'million-year-old',
-    'millner',
-    'millo',
     'millrace',
-    'millson',
-    'millway',
-    'milly-molly-mandy',
-    'milmanda',
-    'milne-redhead',
-    'milnerian',
-    'milnrow',
-    'milonas',
-    'milor',
-    'milosrdn&yacute;ch',
-    'milpitas-based',
-    'milsome',
-    'milson',
-    'milstead',
-    'milton/oxfordshire',
     'miltonism',
-    'miltope',
-    'miluji',
-    'mimagree',
-    'mimimum',
-    'mimining',
-    'mimosas',
-    'mimpriss',
-    'mimtec',
-    'min&ndash;exhibitions',
-    'min/100',
-    'min/maj7',
-    'mina-khani',
-    'minahan',
-    'minaya',
-    'mince-beef',
     'mincepies',
-    'mincu',
-    'mind-blowingly',
-    'mind-blown',
-    'mind-independent',
-    'mind-readers',
-    'mind-shattering',
-    'mind-wiped',
-    'mindedly',
-    'minderheitskirchen',
-    'mindin\'',
-    'mindless/senseless',
-    'mindolo',
-    'mindpower',
-    'mindstorm',
-    'mindszenty',
     'mindy',
-    'mine-clearing',
-    'mine-owners',
-    'mine-sweeper',
-    'mineolas',
-    'mineral-',
-    'mineral-melt',
-    'mineralia',
-    'minerve',
-    'minervino',
-    'mineworking',
-    'mineworkings',
-    'mingary',
-    'mingfu',
-    'mingione',
-    'mingrelians',
     'minguzzi',
-    'mini&egrave;res',
-    'mini-bars',
-    'mini-battles',
-    'mini-breakdown',
-    'mini-ceptor',
-    'mini-charters',
-    'mini-cinema',
-    'mini-cruise',
-    'mini-finding',
-    'mini-frac',
-    'mini-gym',
-    'mini-hollywood',
-    'mini-jmcs',
-    'mini-lab',
-    'mini-lectures',
     'mini-mad',
-    'mini-marathon',
-    'mini-meadows',
-    'mini-mental',
-    'mini-mill',
-    'mini-printer',
-    'mini-production',
-    'mini-projects',
-    'mini-retrospective',
-    'mini-riots',
-    'mini-statement',
-    'mini-switch',
-    'mini-townships',
-    'mini-udcs',
-    'mini-weapons',
-    'mini-world',
     'minicar',
-    'minicartridge',
-    'minicassette',
-    'minidress',
-    'minieres',
-    'minifie',
-    'minifreighters',
-    'minifundium',
-    'minimaker',
-    'minimalise',
-    'minimum-code',
-    'minio-paluello',
-    'minis-type',
-    'miniseries',
-    'ministepping',
-    'minister-director',
     'minister-head',
-    'minister-to-be',
-    'ministerships',
-    'ministres',
-    'ministro',
-    'minisupers',
-    'minit',
-    'minita',
-    'minium',
-    'minjung',
-    'mink-trimmed',
-    'minnelied',
-    'minnetonka',
-    'minnett',
-    'minnih',
-    'minnow-like',
     'minogues',
-    'minomartani',
-    'minor-e',
-    'minor-party',
-    'minor/major',
-    'minorcan',
-    'minorites',
-    'minority-interest',
-    'minot',
-    'minotiere',
-    'minotto',
-    'minshall',
-    'mint-like',
-    'mint-new',
-    'mint-scented',
-    'mintex',
     'minton-beddoes',
-    'minuscules',
-    'minute-long',
-    'minute.',
-    'minutes-left',
-    'minutier',
-    'minyanim',
-    'miocencia',
-    'miou',
-    'mir&oacute;s',
-    'mirabile',
-    'miracle-madness',
-    'miracle-workers',
-    'miraglia',
-    'miraglio',
-    'mirahmad',
     'miramamolin',
-    'mirani',
-    'mirdha',
-    'miret',
-    'mirghani',
-    'mirian',
-    'miricle',
-    'mirka',
-    'mirna',
-    'miroslow',
-    'mirov',
-    'mirra',
-    'mirror-smooth',
-    'mirror/manx',
-    'mirrors.',
-    'mirs',
     'mirsky',
-    'mirus',
-    'mirv',
-    'mirzapur',
-    'mirzayanov',
-    'mis&ndash;perceptions',
-    'mis-adaptation',
-    'mis-classifies',
-    'mis-diagnosis',
-    'mis-information',
-    'mis-kick',
-    'mis-matches',
-    'mis-representation',
-    'mis-statements',
-    'misael',
-    'misaligning',
     'misallocate',
-    'misanthrope',
-    'misanthropes',
-    'misapplying',
-    'misappreciated',
-    'misarticulated',
-    'misattribution',
-    'misbehavin\'',
-    'miscalculating',
-    'mischief-makers',
-    'mischievious',
-    'miscibilities',
-    'misclassifications',
-    'miscommunications',
-    'miscopied',
-    'misdeclarations',
     'misdemeanors',
-    'misdirections',
-    'misell',
-    'miserabilism',
-    'miserable-looking',
-    'miserablism',
-    'miserden',
-    'miserden/gloucestershire',
-    'misguidedness',
-    'mishandle',
-    'mishev',
-    'mishigdorj',
-    'mishnaic',
-    'mishnish',
-    'mishut',
-    'misidentify',
     'misja',
-    'mislocate',
-    'misplacing',
-    'misprision',
-    'mispronouncing',
-    'misr',
-    'misrepresentation.',
-    'miss-ing',
-    'missile-jamming',
-    'missile-throwing',
-    'missin',
-    'mission-orientated',
-    'misspecification',
-    'mistake.',
-    'mistaken.',
-    'mistier',
     'mistime',
-    'mistletoes',
-    'mistold',
-    'mistranslations',
-    'mistras',
-    'mistura',
-    'mit-originated',
-    'mitalk',
-    'mitcheldean/gloucestershire',
-    'mitchell-innes',
-    'mitchell/raf',
-    'mitchelstown',
-    'mithramycin',
-    'mitochondrion',
-    'mitrovica',
-    'mitsuhiro',
     'mitsuo',
-    'mittal',
-    'mittel',
-    'mittel-europa',
-    'miu/ml',
-    'mixed-experience',
-    'mixed-manned',
-    'mixed-motive',
-    'mixed-sequence',
-    'mixed-signal',
-    'mixed-traffic',
-    'miyajima',
-    'miyashita',
-    'miyeh',
-    'miyoshi',
-    'mizell',
     'mizieb',
-    'mizler',
-    'miznah',
-    'mizrahi.',
-    'mizyan',
-    'mj&oslash;s',
-    'mjc',
-    'mji',
-    'mjy',
-    'mk-801',
-    'mk18',
-    'mk3a',
-    'mk8',
-    'mk886',
-    'mka',
-    'ml&amp;sup/minus1',
     'ml.min',
-    'ml/24',
-    'ml/90',
-    'ml/kg.min',
-    'mla144',
-    'mlikh',
-    'mlinaric',
-    'mls+',
-    'mlstp-psd',
-    'mm-wide',
-    'mm.40',
-    'mm/',
-    'mm/100',
-    'mm/l',
-    'mm111',
-    'mm3',
     'mml',
-    'mmlv',
-    'mmol/l.',
-    'mmol/litre',
-    'mmoo',
-    'mmt8',
-    'mmwg',
-    'mn/fe',
-    'mn3011',
-    'mnage',
-    'mncl',
-    'mnda',
-    'mndo',
-    'mnng',
-    'mnrs',
-    'mnt',
     'mnu',
-    'mo&iuml;se',
-    'mo-jo',
-    'mo2',
-    'moabias',
-    'moabites',
-    'moah',
-    'moai',
-    'moalrish',
-    'moanings',
-    'moanna',
-    'moar',
-    'moascar',
-    'moazzam',
-    'mobbers',
-    'mobidip',
     'mobiliare',
-    'mobiliers',
-    'mobilisations',
-    'mobilizations',
-    'mocassins',
-    'moccas',
-    'mochrie',
-    'mock-cockney',
-    'mock-disdain',
-    'mock-documentary',
-    'mock-leather',
-    'mock-seriousness',
-    'mock-surrender',
-    'mock-tragic',
-    'mockeries',
-    'mocking-bird',
     'mocking-birds',
-    'mod/con',
-    'modai',
-    'modally',
-    'modding',
-    'model-determined',
-    'model-like',
-    'modelmaker',
-    'modelmakers',
-    'moderate/severe',
-    'moderately-priced',
-    'moderately-sized',
-    'modere',
-    'modern-language',
-    'modernism.',
-    'modernism/postmodernism',
     'modernizer',
-    'modestini',
-    'modestinus',
-    'modestly-priced',
-    'modigliani-miller',
-    'modise',
-    'modishly',
-    'mods-and-rockers',
-    'modugno',
-    'module-details',
-    'module/end',
-    'modules&mdash;on&mdash;line',
-    'modules&mdash;on&mdash;line/',
-    'modulus-to-density',
-    'modupe',
-    'moelln',
     'moenchengladbach',
-    'moffat/thamesdown',
-    'mogadonic',
-    'moghalsarai',
-    'mogwe',
-    'mogyo',
-    'moh&eacute;lien',
-    'moh&eacute;n',
-    'mohajerani',
-    'mohammedians',
-    'mohammeds',
-    'mohammud',
-    'mohana',
-    'mohandas',
-    'moheli',
-    'mohiaaine',
     'mohiaddine',
-    'mohin',
-    'mohl',
-    'moholy-nagy',
-    'mohorovicic',
-    'mohram',
-    'moidore',
-    'moille',
-    'moing',
-    'moinian',
-    'moiseenko',
-    'moiseev',
-    'moissenko',
-    'moist-palmed',
-    'moistr',
-    'moisture-loving',
     'moisturizers',
-    'moisty',
-    'mojahadin-e',
-    'mojaheddin',
-    'mojar',
-    'mojkom',
-    'mojkovac',
-    'mojos',
-    'mojzer',
-    'mokhiber',
-    'mokpo',
-    'mokuleia',
-    'molarity',
-    'moldau',
-    'molday',
-    'moleyns',
     'moli',
-    'moline',
-    'molirena',
-    'moll&eacute',
-    'mollandia',
-    'mollicone',
-    'mollifiers',
-    'molloy/east',
-    'molomo',
-    'molook',
-    'molt',
-    'molteno',
-    'molwyn',
-    'molyneux-cribb',
-    'mombasa&ndash;london',
-    'momegliture',
     'mommessin',
-    'mommie',
-    'momone',
-    'momtazuddin',
-    'mon&eacute;gasque',
-    'mon/thurs/frid',
-    'monagh',
-    'monans',
-    'monarchos',
-    'monaru',
-    'monash',
-    'monastics',
-    'monbiot/protest',
-    'monchegorsk',
-    'monchensey',
-    'moncloa',
     'moncrieffe',
-    'moncy',
-    'monday-thursday',
-    'monday-to-friday',
-    'monday-to-thursday',
-    'mondee',
-    'mondials',
-    'monetae',
-    'monetarily',
-    'moneth',
-    'monetising',
-    'monetization',
-    'monetized',
-    'money-bags',
-    'money-broker',
-    'money-brokers',
     'money-fiefs',
-    'money-form',
-    'money-losing',
-    'money-management',
-    'money-minded',
-    'money-orientated',
-    'money-winners',
-    'money.but',
-    'moneyman',
-    'moneyslane',
-    'mongey',
-    'mongol-soviet',
-    'mongolian-soviet',
-    'mongoloids',
-    'mongon',
-    'monifieth',
     'moniteur',
-    'monitoring/review',
-    'monitorings',
-    'monja',
-    'monju',
-    'monkchester',
-    'monkey-eating',
-    'monkey-house',
-    'monkey-nuts',
-    'monkey/shakespeare',
-    'monkseaton',
-    'monkwood',
-    'monnier',
-    'monniot',
-    'mono-poly',
-    'mono/stereo',
     'monochloramine',
-    'monocotyledonous',
-    'monocytic',
-    'monodialectal',
-    'monoecious',
-    'monoenoic',
-    'monogamist',
-    'monogamously',
-    'monohan',
-    'monojit',
-    'monolithically',
-    'monologion',
-    'monomorphemic',
-    'monophasic',
-    'monophthong',
-    'monoplacophorans',
     'monopoly-money',
-    'monopsony',
-    'monoskis',
-    'monostylistic',
-    'monotropy',
-    'monotypists',
-    'monservate',
-    'monsignore',
-    'monster-meh\'lindi',
-    'monsterous',
-    'monsuy',
-    'mont&eacute',
-    'mont-mercure',
-    'mont-roig',
-    'mont-saint-michel',
-    'montagnola',
     'montague-smith',
-    'montagui',
-    'montalv&aacute;n',
-    'montelius',
-    'montenero',
-    'montenotte',
-    'monterchi',
-    'montereau',
-    'monteros',
-    'montfoort',
-    'monthe',
-    'monthly-payment',
-    'months&ndash;4',
-    'months-3',
-    'months.but',
-    'monticello',
     'montis',
-    'montjuich',
-    'montlu&ccedil;on',
-    'montlucon',
-    'montonero',
-    'montr&eacute;al',
-    'montre',
-    'montreal-based',
-    'monts&eacute;gur',
-    'monumentalising',
-    'monzaemon',
-    'moocher',
-    'mooi',
-    'mooks',
-    'moominmamma',
-    'moon-bleached',
     'moon-daisies',
-    'moondance',
-    'moondog',
-    'moonduster',
-    'moonee',
-    'mooney-rivlin',
-    'moonface',
-    'moonlets',
-    'moonset',
-    'moonshadow',
-    'moonshoes',
-    'moonshots',
-    'moonwailer',
-    'moore-brabazon',
-    'moore-gwyn',
-    'moore-harness',
     'moorechurch',
-    'moorend',
-    'moorey',
-    'moorford',
-    'moorhurst',
-    'mooring-rope',
-    'moos',
-    'moostafa',
-    'mootland',
-    'mopc',
-    'mophead',
-    'moppet',
-    'moptops',
-    'moraine-dammed',
-    'morake',
-    'morali',
     'moralis&eacute;s',
-    'moralisations',
-    'moraliser',
-    'morane',
-    'morane-saulnier',
-    'moranis',
-    'morannon',
-    'morarji',
-    'morat',
-    'moratalla',
-    'morazanista',
-    'morb-like',
-    'morbey',
-    'morbific',
-    'morbillinum',
-    'morbillivirus',
     'morceau',
-    'mordants',
-    'mordex',
-    'mordovian',
-    'more-balanced',
-    'more-ish',
-    'more-than',
-    'more.',
-    'more/fewer',
-    'morecombe',
-    'moredton',
-    'morehead',
-    'moreland',
-    'morelia',
-    'morellian',
-    'morfe',
     'morgan.',
-    'morgenlandfahrer',
-    'morgenthaler',
-    'morgex',
-    'morglum',
-    'morgon',
-    'morgor',
-    'morgues',
-    'morinellus',
-    'morishita',
-    'morituri',
-    'morkel',
-    'morken',
-    'morlay',
-    'morle',
-    'morley-fletcher',
     'morli&egrave;re',
-    'mormyrids',
-    'morning-break',
-    'morning-o',
-    'morningsiders',
-    'morningthorpe',
-    'morolli',
-    'morondava',
-    'morote-gari',
-    'moroz',
-    'morpeth-newcastle',
-    'morph',
-    'morphine-3-glucuronide',
-    'morpho-syntactic',
-    'morphogens',
-    'morphometrically',
     'morphoton',
-    'morphotype',
-    'morphou',
-    'morporkean',
-    'morris-dance',
-    'morris/crisis',
-    'morris/gulf',
-    'morris/trauma',
-    'morrisey',
-    'morriss/bottle',
-    'morrisseys',
-    'morsitans',
-    'morson',
-    'morston',
-    'mortalism',
-    'mortallious',
     'mortar-board',
-    'mortarium',
-    'mortcloths',
-    'mortenson',
-    'morteum',
-    'mortgage.',
-    'mortgage/legal',
-    'mortgagee.',
-    'mortifies',
-    'mortimer/wiltshire',
-    'mortiser',
-    'mortley',
-    'mortonhall',
-    'mortons',
-    'mortum',
-    'morville',
     'morzin',
-    'morzine',
-    'mosala',
-    'mosby',
-    'moscarda',
-    'moschion',
-    'moscova',
-    'moscow-born',
-    'moscow-dominated',
-    'moscow-oriented',
-    'moscow-trained',
-    'mose',
-    'moselle-saar-ruwer',
-    'mosgiel',
-    'moshahid',
-    'moshal',
     'moshers',
-    'moskenes',
-    'moskovsky',
-    'mosnal',
-    'mosney',
-    'mosoeunyane',
-    'mosquito-ridden',
-    'moss-like',
-    'moss-side',
-    'moss-troopers',
-    'moss/navy',
-    'mossa',
-    'mosson',
-    'most-quoted',
-    'most-talked-about',
-    'most/least',
     'mosta',
-    'mosteck&aacute',
-    'mostest',
-    'mostin',
-    'mostovoi',
-    'motaki',
-    'motaung',
-    'moted',
-    'moth-er',
-    'moth-hung',
-    'moth-infested',
-    'motheaten',
-    'mother&rehy;hood',
-    'mother\'s',
-    'mother-',
-    'mother-board',
     'mother-city',
-    'mother-in',
-    'mother-life',
-    'mother-tongues',
-    'mother/artist/housewife',
-    'mother/calf',
-    'mother/child',
-    'mother/father',
-    'mother/grandmother',
-    'motherlands',
-    'motherliness',
-    'motherly-looking',
-    'mothership',
-    'mothwings',
-    'mothy',
-    'moti-rib',
     'motif-compliant',
-    'motionlessness',
-    'motler',
-    'motobility',
-    'motor-control',
-    'motor-launches',
-    'motor-mower',
-    'motor-scooters',
-    'motor-vehicle',
-    'motorable',
-    'motorbicycle',
-    'motorbooks',
-    'motorcross',
-    'motoren',
-    'motorenwerk',
-    'motorenwerke',
     'motorola-based',
-    'motorsickle',
-    'motorway-induced',
-    'motru',
-    'mottard',
-    'motuhake',
-    'motz',
-    'mou-mou',
-    'mouamba',
-    'moubray',
-    'moudiki',
-    'moufflon',
-    'moug',
-    'mougeot',
-    'mougins',
-    'mouhtare',
     'mould-blown',
-    'mould.',
-    'mouldboards',
-    'mouldiwarps',
-    'moulins',
-    'moulmein',
-    'moulsham',
-    'moultons',
-    'moulvi',
-    'mouly',
-    'moumouni',
-    'mounboy',
-    'mountable',
-    'mountaga',
-    'mountain-ringed',
-    'mountainland',
     'mountainously',
-    'mountainy',
-    'mountants',
-    'mountbattens',
-    'mountcliff',
-    'mountfords',
-    'mountgain',
-    'mountsandel',
-    'mountwich',
-    'mountwood',
-    'mouphtys',
-    'mourin',
-    'mouscron',
-    'mouse-brown',
-    'mouse-eared',
-    'mouse-pounce',
     'mouse.sys',
-    'mouseholes',
-    'mouselike',
-    'mouseloft',
-    'mousley',
-    'moussakas',
-    'moussey',
-    'moustafa',
-    'mousterian',
-    'mousy-brown',
-    'mousy-looking',
-    'mouth-parts',
-    'mouthguard',
-    'mouvements',
-    'move-for-move',
-    'movemente',
     'movie-stars',
-    'moviestars',
-    'moving-on',
-    'movshon',
-    'mowforth',
-    'mowings',
-    'mowra',
-    'mowthorpe',
-    'moxen',
-    'moxhay',
-    'moxibustion',
-    'moxon-browne',
-    'moyalla',
-    'moyallon',
-    'moynes',
-    'moyobamba',
     'moyon',
-    'mozambiki',
-    'mozambiquan',
-    'mozarabic',
-    'mozley',
-    'mozos',
-    'mozote',
-    'mp/agriculture',
-    'mp/armed',
-    'mp/deputy',
-    'mp/employment',
-    'mp/enviroment',
-    'mp/oxford',
-    'mp/social',
-    'mp19',
-    'mp3000',
     'mp42',
-    'mp44',
-    'mp5k',
-    'mpds',
-    'mpheta',
-    'mphil/phd',
-    'mplc',
-    'mpmr',
-    'mpongo',
-    'mpta',
-    'mpu',
-    'mpus',
-    'mr-40',
-    'mr.j.',
-    'mr.x',
-    'mrc/esrc',
     'mrem',
-    'mrema',
-    'mrlp',
-    'mrps',
-    'mrs.ruth',
-    'ms-works',
-    'ms/ww',
-    'ms32',
-    'msc.',
-    'msgr',
-    'msp-based',
-    'mst',
-    'mt-1',
-    'mt-2',
-    'mt86',
-    'mtara',
     'mtmtn',
-    'mtp1',
-    'mtp2',
-    'mtr',
-    'mtrnas',
-    'mts.',
-    'mtsensk',
-    'mu-us',
-    'mu/mg',
-    'muafangejo',
-    'muana',
-    'muangdaw',
-    'much&mdash;it',
-    'much-awaited',
-    'much-cited',
-    'much-criticized',
     'much-damaged',
-    'much-decorated',
-    'much-deserved',
-    'much-despised',
-    'much-discredited',
-    'much-emphasized',
-    'much-envied',
-    'much-fabled',
-    'much-handled',
-    'much-imitated',
-    'much-mended',
-    'much-photographed',
-    'much-put-upon',
-    'much-repeated',
-    'much-studied',
-    'much-talked-about',
     'much-wanted',
-    'much-worn',
-    'muchalls',
-    'muchinsky',
-    'muchope',
-    'mucilaginous',
-    'muck-up',
-    'muckers',
-    'muckier',
-    'muckin\'',
-    'mucklow',
-    'muckraking',
-    'muckspreader',
-    'mucocutaneous',
-    'mucoprotein',
-    'mucosa-associated',
     'mucrotic',
-    'mucus-covered',
-    'mud-lined',
-    'mud-packs',
-    'mud-plastered',
-    'mud-rich',
-    'mud-smeared',
-    'mudbricks',
-    'mudclouds',
-    'mudda',
-    'mudded',
-    'muddiest',
-    'muddiness',
-    'muddle-headed',
-    'muddle-headedness',
-    'muddleheadedness',
     'muderris/muftilik',
-    'muderris/muftis',
-    'mudholes',
-    'mudima',
-    'mudriczki',
-    'mudstained',
-    'muehl',
-    'mueller-stahl',
-    'muenzenberg',
-    'mufamadi',
-    'mufulira',
-    'muger',
-    'mugful',
-    'muggletonians',
-    'mugshots',
-    'muham&rehy;madiyah',
     'muhammads',
-    'muhbubh',
-    'muhittin',
-    'muhlberg',
-    'muhren',
-    'muiden',
-    'muidzade',
-    'muirland',
-    'muirlands',
-    'mujahaddin',
-    'mujahidine',
-    'mujibur',
-    'mukando',
-    'mukiibi',
-    'mukurasi',
-    'mulatta',
     'mulattoes',
-    'mulayam',
-    'mulcaster/west',
-    'mulchelney',
-    'mulhooley',
-    'mullegg',
-    'mullinavat',
-    'mullinger',
-    'mullion-paned',
-    'mulloy',
-    'mulluscs',
-    'mulready',
-    'mulso',
-    'multa',
-    'multatta',
-    'multhrops',
     'multi-agent',
-    'multi-bedroom',
-    'multi-billion-pound',
-    'multi-bladed',
-    'multi-branched',
-    'multi-breed',
-    'multi-car',
-    'multi-chapter',
-    'multi-copy',
-    'multi-culturism',
-    'multi-departmental',
-    'multi-disk',
-    'multi-domain',
-    'multi-effect',
-    'multi-events',
-    'multi-faction',
     'multi-factor',
-    'multi-factorial',
-    'multi-family',
-    'multi-fx',
-    'multi-gabled',
-    'multi-image',
-    'multi-instrumental',
-    'multi-instrumentalist',
-    'multi-interest',
-    'multi-layering',
-    'multi-legged',
-    'multi-levelled',
-    'multi-lingualism',
-    'multi-link',
-    'multi-locus',
-    'multi-machines',
     'multi-million-',
-    'multi-millionaires',
-    'multi-partyism',
-    'multi-pass',
-    'multi-patterned',
-    'multi-peaked',
-    'multi-person',
-    'multi-plane',
-    'multi-position',
-    'multi-primitive',
-    'multi-processing/6000',
-    'multi-record',
-    'multi-sensory',
-    'multi-size',
-    'multi-speaker',
-    'multi-sports',
     'multi-standard',
-    'multi-statement',
-    'multi-store',
-    'multi-temporal',
-    'multi-tentacled',
-    'multi-turn',
-    'multi-union',
-    'multi-vibrator',
-    'multi-vocal',
-    'multi-well',
-    'multi-windowed',
-    'multi-windows',
-    'multi.media',
-    'multibarrelled',
-    'multibillion',
-    'multibit',
     'multiboard',
-    'multibus',
-    'multicellularity',
-    'multieffects',
-    'multifaith',
-    'multifield',
-    'multiheater',
-    'multihulls',
-    'multijunction',
-    'multikwik',
-    'multilines',
-    'multilink',
-    'multimegabit',
-    'multimember',
-    'multimillion-dollar',
-    'multimillion-pound',
     'multinet',
-    'multipacks',
-    'multiparametric',
-    'multipart',
-    'multiplatform',
-    'multiple-data',
-    'multiple-employer',
-    'multiplet',
-    'multiplicational',
-    'multiply-accumulates',
-    'multiply-and-add',
-    'multipoles',
-    'multipotent',
-    'multiringed',
-    'multis',
-    'multiservice',
     'multisite',
-    'multivariable',
-    'multiversity',
-    'multiwell',
-    'multum',
-    'mulugeta',
-    'mulugetta',
-    'mulvagh',
-    'mum-',
-    'mum-and-toddler',
-    'mumba',
-    'mumblers',
-    'mumford/team',
-    'mummeries',
-    'mummerset',
-    'mummifies',
     'mummiform',
-    'mumphkin',
-    'munakumabu',
-    'munasar',
-    'munchener',
-    'munchengratz',
-    'munchers',
-    'munchkins',
-    'munchpot',
-    'mundaneness',
-    'munden',
-    'mundt',
-    'mundum',
-    'munera',
-    'mungai',
-    'mungra',
     'mungul',
-    'mungy',
-    'municipalism',
-    'municipals',
-    'munificently',
-    'munsey',
-    'munsterplatz',
-    'muntingia',
-    'munyanesa',
-    'munyazesa',
-    'muon-',
-    'mupangare',
-    'mupp',
-    'mur.',
-    'muradov',
-    'muranese',
     'muraqqa',
-    'muraqqa\'-e-dehli',
-    'murate',
-    'murats',
-    'muravsky',
-    'murchisoni',
-    'murdac',
-    'murderball',
-    'murdered-armstrong',
-    'murderesses',
-    'murdock/gloucestershire',
-    'mure',
-    'muriate',
-    'murillos',
-    'murkill',
-    'murkowski',
     'murky-looking',
-    'murley',
-    'murmured.',
-    'muroroa',
-    'muros',
-    'murphy/adjudicator',
-    'murphy/martin',
-    'murra',
-    'murree',
-    'mursa',
-    'murtha',
-    'murthly',
-    'murugesan',
-    'muryanama',
-    'musavi',
-    'muscatels',
     'muscial',
-    'muscipula',
-    'muscle-like',
-    'muscle-tearing',
-    'muscularly',
-    'museet',
-    'museology',
-    'museum-building',
-    'museum-keepers',
-    'museumgoers',
-    'museumsquare',
-    'museumstrasse',
-    'musgraves',
-    'musgroves',
-    'mushikarati',
-    'mushobekwa',
     'mushroom-like',
-    'music-business',
-    'music-oriented',
-    'music-stand',
-    'music-teacher',
-    'musically-gifted',
-    'musician/composer',
-    'musico-technological',
-    'musicologically',
-    'musicologiques',
-    'musicon',
-    'musidisc',
-    'musk-scented',
-    'musket-ball',
-    'muskham',
-    'muskoka',
     'muslim-populated',
-    'muslimin',
-    'muslin-covered',
-    'muslin-lined',
-    'muslyumovo',
-    'musman',
-    'musoke',
-    'muspratts',
-    'musquetry',
-    'mussa',
-    'mussel-free',
-    'mussel-rich',
-    'musselburgh.',
-    'mussies',
-    'mussulmen',
-    'must-have',
     'must-match',
-    'mustachios',
-    'mustafayev',
-    'mustanger',
-    'mustansir',
-    'mustard-brown',
-    'mustardseed',
-    'mustnt',
-    'muston/stroud',
-    'mustum',
-    'musty-looking',
-    'mutabaruka',
-    'mutagenicity',
-    'mutahhar',
-    'mutalov',
-    'mutambay',
     'muthafucka',
-    'muthana',
-    'muthill',
-    'mutil&eacute;s',
-    'mutoko',
-    'mutsuki',
-    'muttley',
-    'muttram',
-    'mutual-admiration',
-    'mutualities',
-    'mutually-assisting',
-    'mutually-rewarding',
-    'muuu',
-    'muyunda',
-    'muz',
-    'muzaffer',
     'muzairib',
-    'muzhik',
-    'muzhiks',
-    'muztagh',
-    'mv370',
-    'mv4000',
-    'mvc',
-    'mvic',
-    'mvillvoil',
-    'mvj',
-    'mwaanga',
-    'mwakenya',
-    'mwamba',
-    'mwanawasa',
-    'mwanza',
-    'mwave',
     'mx3',
-    'mx500',
-    'myaing',
-    'myanma-bangladesh',
-    'myant',
-    'myasishchev',
-    'myasnikovich',
-    'myawadi',
-    'myboto',
-    'myc+max85',
-    'mycerinus',
-    'mycoparasitism',
-    'mycoprotein',
-    'mycorrhiza',
-    'mycorrhizal',
-    'mydrim',
     'myers-briggs',
-    'myers-scotton',
-    'myers/headmistress',
-    'myerson',
-    'myght',
-    'myghty',
-    'myham',
-    'mykhailo',
-    'mylk',
-    'mylnikov',
-    'mylonite',
-    'mylonitization',
-    'mylor',
-    'mylossoma',
-    'mynahs',
-    'mynheer',
     'myocarditis',
-    'myofascial',
-    'myofilament',
-    'myopics',
-    'myotomes',
-    'myrene',
-    'myrinian',
-    'myristate',
-    'myristicaceae',
-    'myrmecophaga',
-    'myrmecophytes',
-    'myrmidia',
-    'myrmidons',
-    'myronides',
-    'myrsinites',
-    'myrtaceae',
     'myselfe',
-    'mysen',
-    'myslbek',
-    'mystagogue',
-    'mysteriousness',
-    'mystery-cults',
-    'mystery-religions',
-    'mysticete',
-    'mystiko',
-    'mystiques',
-    'myth-maker',
-    'myth.',
-    'mythe',
-    'mythically',
-    'mythico-religious',
-    'mythmakers',
     'mythologize',
-    'myung-whun',
-    'myxine',
-    'myxiniformes',
-    'myxobolus',
-    'myzus',
-    'mz-2',
-    'mzzz',
-    'n&aacute;prstkova',
-    'n&bsol;a',
-    'n&eacute',
-    'n&eacute;cessaire',
-    'n&eacute;glig&eacute;e',
-    'n&eacute;roly',
-    'n&eacute;v&eacute',
-    'n&oacute;0honshugi',
     'n&ouml;el',
-    'n&uacute;menor',
-    'n\'&eacute;tait',
-    'n\'a',
-    'n\'ai',
-    'n\'hesitez',
-    'n\'kari',
-    'n\'singa',
-    'n(e)',
-    'n*',
-    'n+max',
-    'n-acetyl-&bgr;-d-glucosaminidase',
-    'n-acetylneuraminic',
-    'n-butane',
-    'n-c\'',
-    'n-dust',
     'n-formylated',
-    'n-glycosylation',
-    'n-k',
-    'n-monomethyl-d-arginine',
-    'n-n-no',
-    'n-oct3',
-    'n-p-n',
-    'n-period',
-    'n-terminally',
-    'n-tuples',
-    'n.15',
-    'n.5',
-    'n.a.t.o',
-    'n.c.c.',
-    'n.d.t.',
-    'n.f.p.a',
     'n.g.r.',
-    'n.harris',
-    'n.lapillus',
-    'n.m',
-    'n.m.h.c.',
-    'n.m.r',
-    'n.n.e.',
-    'n.r.',
-    'n.s.p.c.c.',
-    'n.s.w.l.r.',
-    'n.t.a.',
-    'n.theobroma',
-    'n.u.r.',
-    'n.w.-s.e.',
-    'n.w.1',
-    'n/b',
     'n/r',
-    'n/s',
-    'n112',
-    'n117gb',
-    'n201',
-    'n202',
-    'n203',
-    'n206',
-    'n27',
-    'n36',
-    'n3n',
-    'n45',
-    'n45tg',
-    'n494tw',
-    'n501sh',
-    'n51',
     'n67977',
-    'n78',
-    'n8389h',
-    'n901k',
-    'n90379',
-    'n96bf',
-    'n:n',
-    'n=106',
-    'n=114',
-    'n=123',
-    'n=150',
-    'n=154',
-    'n=218',
-    'n=30',
-    'n=37',
-    'n=41',
     'n=42',
-    'n=50',
-    'n=56',
-    'n=58',
-    'n=6.25',
-    'n=74',
-    'n=85',
-    'n=four',
-    'na&ccedil;ional',
-    'na&icirc;ve',
-    'na&iuml;m',
-    'na\'lu',
-    'na-64',
-    'na-acetate',
-    'na-o',
-    'na/h',
     'na/nur',
-    'na1',
-    'na2co3',
-    'naali',
-    'naama',
-    'nab/lab',
-    'naberezhnaya',
-    'nabta',
-    'nabulsi',
-    'nac1',
-    'nacarena',
-    'naccache',
-    'nacho',
-    'nachrichten',
-    'nachtdorf',
-    'nack',
     'nacky',
-    'nacoss',
-    'nacreous',
-    'nacton',
-    'nadar',
-    'nadene',
-    'nadezda',
-    'nadfas',
-    'nadima',
-    'nadmi',
-    'nadra&zcaron;i',
-    'naeem',
-    'naffest',
-    'nag/creatinine',
-    'nagai',
-    'nagast',
     'nagato',
-    'nagden',
-    'naggarond',
-    'nagisa',
-    'nagorno-karabakh.',
-    'nagymaros-gabcikovo',
-    'nahal',
-    'nahanni',
-    'nahar',
-    'nahas',
-    'nahason',
-    'nahco3',
-    'nahh',
-    'nai-keung',
-    'naib',
-    'nail-biter',
     'nail-scissors',
-    'nail-studded',
-    'nailbrush',
-    'nailcare',
-    'nailchapmen',
-    'nailhac',
-    'nailmakers',
-    'nailsish',
-    'naimat',
-    'naisali',
-    'naivasha',
-    'najafi',
-    'najas',
-    'najdoski',
-    'najera',
-    'nakao',
     'nalepka',
-    'nalle',
-    'name&gt&verbar',
-    'name-animal',
-    'name-badge',
-    'name-tapes',
-    'name/address',
-    'namgyal',
-    'namgyel',
-    'namibie',
-    'naming-words',
-    'namir',
-    'namzha',
-    'namzi',
-    'nanai',
-    'nancekuke',
     'nancys',
-    'nangarhar',
-    'nanine',
-    'nannacaras',
-    'nanni',
-    'nanny-state',
-    'nanocrystals',
-    'nanoscope',
-    'nanoteslas',
-    'nanotube',
-    'napalms',
-    'napata',
-    'naphthol',
-    'napisah',
-    'napleton',
-    'napoensis',
     'napole&oacute;n',
-    'napoletano',
-    'nappies/diapers',
-    'napsbury',
-    'naqib',
-    'naqshbandi',
-    'narahashi',
-    'naramsin',
-    'naranjos',
-    'narbekovas',
-    'narberkovas',
-    'narcoleptic',
-    'nard',
-    'narducci',
-    'narepool',
-    'naresh',
     'narial',
-    'narigenin',
-    'narkiewicz',
-    'narodna',
-    'narodnost',
-    'narratologists',
-    'narrow-banded',
-    'narrow-beam',
-    'narrow-boats',
-    'narrow-brimmed',
-    'narrow-faced',
-    'narrow-necked',
-    'narrowly-conceived',
-    'narsarssuaq',
-    'narvaez',
-    'narzalina',
     'nasa-backed',
-    'naseef',
-    'naseiro',
-    'nash/gloucestershire',
-    'nasirdin',
-    'naslediye',
-    'naso-gastric',
-    'nasoalveolar',
-    'nasobiliary',
-    'nasser-inspired',
-    'nasserist',
-    'nassers',
-    'nassir',
-    'nasta',
-    'nasty-tasting',
-    'nastya',
     'nasuh',
-    'natali',
-    'natalis',
-    'natality',
-    'natani',
-    'natapei',
-    'natas',
-    'natchet',
-    'nateby',
-    'nateq-nouri',
-    'nathanson/scottish',
-    'natio',
-    'nation-in-arms',
-    'nation-statehood',
-    'national-democratic',
-    'national-insurance',
     'national-liberation',
-    'national-popular',
-    'national-scale',
-    'national-socialist',
-    'national/regional',
-    'nationaldemokratische',
-    'nationalistically',
-    'nationality/residence',
-    'nationally-based',
-    'nationally-funded',
-    'nationally-important',
-    'nationally-negotiated',
-    'nationally-recognised',
-    'nations-appointed',
-    'nations-designated',
-    'nations-sponsored',
     'nations-supervised',
-    'nationsbank',
-    'native-american',
-    'native-mode',
-    'native-speakers',
-    'nativism',
-    'nativit&eacute',
-    'nato/warsaw',
-    'natoire',
-    'natps',
-    'natriuresis',
-    'nattress',
-    'natu',
-    'natuc',
-    'natural&rehy;looking',
-    'natural-narrative',
     'natural/supernatural',
-    'naturalis',
-    'nature-loving',
-    'nature-printing',
-    'naturedly',
-    'naturotech',
-    'natwest/bp',
-    'natwick',
-    'naufrages',
-    'nauruans',
-    'navarradonda',
-    'navarrans',
-    'navarrenx',
-    'navega&ccedil&atilde;o',
-    'naveiro',
-    'navet',
     'navicular',
-    'navigability',
-    'navigare',
-    'navigationally',
-    'navigator/radio',
-    'navimore',
-    'navrongo',
-    'navvabi',
-    'navy/white',
-    'naworth',
-    'nawthen',
-    'naylorsfield',
-    'nayral',
-    'naysmyth',
-    'nazaran',
-    'nazarenes',
     'nazelle',
-    'nazerbayev',
-    'nazi-like',
-    'nazih',
-    'nbfls',
-    'nbhs',
-    'nc3',
-    'ncabhrionid',
-    'nccc',
-    'ncced',
-    'ncdwm',
-    'nce',
-    'ncgub',
-    'nchama',
-    'nciv',
-    'nckalman',
     'ncldo',
-    'nclo',
-    'ncni',
-    'ncp10',
-    'ncp15',
-    'ncpm',
-    'nctc',
-    'ncwp',
-    'ncwp-born',
-    'nd&mdash;new',
-    'nd6',
-    'nd7',
-    'nd:yag',
-    'ndcs',
-    'ndg',
-    'ndhs',
     'ndinga',
-    'ndioro',
-    'ndobe',
-    'ndoffene',
-    'ndong',
-    'ndongo',
-    'ndorrobo',
-    'ndpc',
-    'ndpg',
-    'ndpl',
-    'ne&ccaron;as',
-    'ne&eacute',
-    'ne&ndash;20',
-    'ne\'erday',
-    'ne4',
-    'ne5',
     'ne99',
-    'neaga',
-    'neal-schuman',
-    'neaoutyine',
-    'neapolis',
-    'neapolitanum',
-    'near-2,000',
-    'near-absolute',
-    'near-abstract',
-    'near-admissible',
-    'near-bald',
-    'near-camera-ready',
-    'near-chaotic',
-    'near-collision',
-    'near-collisions',
-    'near-coma',
     'near-continual',
-    'near-dark',
-    'near-disastrous',
-    'near-disbelief',
-    'near-duties',
-    'near-equal',
-    'near-faultless',
-    'near-flat',
-    'near-future',
-    'near-homophony',
-    'near-hopeless',
-    'near-illegible',
-    'near-impossibility',
-    'near-infra-red',
-    'near-insolvency',
-    'near-ir',
     'near-market',
-    'near-merger',
-    'near-miracle',
-    'near-money',
-    'near-moribund',
-    'near-mystical',
-    'near-natural',
-    'near-photographic',
-    'near-polar',
-    'near-religious',
-    'near-riot',
-    'near-silence',
-    'near-spent',
-    'near-starvation',
-    'near-strangers',
-    'near-vacuum',
     'near-verbatim',
-    'near-violent',
-    'nearly-blonde',
-    'nearly-man',
-    'nearly-men',
-    'nearnet',
-    'neat\'s-foot',
-    'neat-looking',
-    'neatished',
-    'neatly-rounded',
-    'neatnick',
-    'nebbish',
-    'nebi',
-    'nebiu',
-    'nebraska-based',
-    'nebs',
     'nebulans',
-    'nebulium',
-    'necatrix',
-    'nece',
-    'neces',
-    'necess',
-    'nechtan',
-    'neck-bite',
-    'neck-block',
-    'neck-rests',
-    'necklace.',
-    'neckplates',
-    'necksnapper',
-    'neckwear',
-    'necmettin',
-    'neco',
     'necrepolis',
-    'necromantic',
-    'necropolises',
-    'nectar-less',
-    'nectar-producing',
-    'nectarivorous',
-    'nedem',
-    'nederlandsche',
-    'nedic',
-    'nedwell',
-    'neebee',
-    'needed-by',
-    'needell',
-    'needfull',
-    'needle-points',
-    'needlecases',
     'needlesticks',
-    'needs-orientated',
-    'needs/demand',
-    'needs/wants',
-    'needy-contingent',
-    'neefjes',
-    'neelsen',
-    'neen',
-    'neeraum',
-    'neether',
-    'neffati',
-    'neffortiti',
-    'nefma',
-    'nefolovhodwe',
-    'nefyn',
-    'nega',
     'negage',
-    'negambo',
-    'negativa',
-    'negilgence',
-    'negley',
-    'negligees',
-    'negligible.',
-    'neglinnaya',
-    'negotia',
-    'negotiation.',
-    'negresco',
-    'negritos',
-    'negusa',
-    'neidenburg',
-    'neighbourhood/home',
-    'neigwl',
     'neikrug',
-    'neilans',
-    'neill/unipart',
-    'neillands',
-    'neils',
-    'neiman-marcus',
-    'neiss',
-    'nekrasov',
-    'nekrolog',
-    'nelhams',
-    'nelidov',
-    'nelkin',
-    'nell\'et&agrave',
-    'nellcor',
-    'nelson-jones',
-    'nelson/communications',
     'neman',
-    'nemestrina',
-    'nemi',
-    'nenadovi&cacute',
-    'nenashev',
-    'neniae',
-    'neo-american',
-    'neo-austrian',
-    'neo-babylonian',
-    'neo-classic',
-    'neo-classical/conservative',
-    'neo-conceptualism',
-    'neo-elitist',
-    'neo-elitists',
-    'neo-hookean',
-    'neo-keynesian',
     'neo-lamarckians',
-    'neo-latin',
-    'neo-malthusian',
-    'neo-marxisms',
-    'neo-mercantilist',
-    'neo-mercantilists',
-    'neo-natologist',
-    'neo-oesophagus',
-    'neo-orthodoxy',
-    'neo-pagans',
-    'neo-palladian',
-    'neo-prohibitionists',
-    'neo-rococo',
-    'neo-tory',
-    'neo-tudor',
-    'neoclassicists',
     'neocolonial',
-    'neocolonialism',
-    'neoexpression',
-    'neoformans',
-    'neogothic',
-    'neointimal',
-    'neomycin-resistance',
-    'neopallium',
-    'neoplasias',
-    'neoplatonic',
-    'neoplatonist',
-    'nepalese-dominated',
-    'nepali-speaking',
-    'nepean',
-    'nephelinite',
-    'nephelinites',
     'nephelinitic',
-    'nephelium',
-    'nephrolithotomy',
-    'nephrologist',
-    'nephrologists',
-    'nephrosclerosis',
-    'nephrosis',
-    'nepotic',
-    'neptali',
-    'neptun',
-    'neptunium',
-    'nereaux-weber',
-    'nerio',
-    'neritan',
-    'nerl',
-    'neronian',
     'nerquis',
-    'nerv',
-    'nerve&rehy;wracking',
-    'nerve-poisons',
-    'nerve-ridden',
-    'nerve-tingling',
-    'nervily',
-    'nervisque',
-    'nervosus',
-    'nesb',
-    'nescience',
-    'neslo',
-    'nesmith',
-    'nesseby',
-    'nest-like',
-    'nest-making',
     'nest/',
-    'nestar',
-    'nester',
-    'net-effective',
-    'net-of-transfer',
-    'netback',
-    'netbase',
-    'netcom',
-    'netfly',
-    'netframes',
-    'netherthorpe',
-    'neti',
-    'netlabs/manager',
-    'netmaker',
-    'netmanager',
-    'neto-kiambata',
     'netserv',
-    'nettle-cells',
-    'nettlesworth',
-    'netton',
-    'nettwerk',
-    'netware-compatible',
-    'network(s)',
-    'network-extensible',
-    'network-independent',
-    'network-wide',
-    'networks.',
-    'networth',
-    'netwrk',
-    'neuber',
-    'neuburger',
-    'neudorf',
     'neue-helvetica',
-    'neuen',
-    'neuendorf',
-    'neueste',
-    'neufch&acirc;tel',
-    'neufville',
-    'neugarten',
-    'neuhausen',
-    'neuhoff',
-    'neukirchen',
-    'neum',
-    'neum&uuml;nster',
-    'neurectomy',
-    'neuregulins',
-    'neurites',
-    'neuro-electric',
     'neuro-pattern',
-    'neuro-pharmacology',
-    'neuro-surgeons',
-    'neuro-surgery',
-    'neuroanatomical',
-    'neurobehavioural',
-    'neurochemistry',
-    'neurochemists',
-    'neurodata',
-    'neuroectoderm',
-    'neuroepithelium',
-    'neurofilament',
-    'neurogenetics',
-    'neurokinin',
-    'neuromedical',
-    'neuromeres',
     'neuromotor',
-    'neuroplasticity',
-    'neuroscientific',
-    'neuroscientist',
-    'neurotechnology',
-    'neurotropic',
-    'neurtophil',
-    'neusel',
-    'neusserstrasse',
-    'neutral/alkaline',
-    'neutralisations',
-    'neutralizer',
-    'neutrionors',
-    'neutrophil-associated',
-    'neutrophilia',
-    'neveau',
     'nevells',
-    'nevelson',
-    'never-before-released',
-    'never-empty',
-    'never-forgotten',
-    'never-resting',
-    'never-used',
-    'neverbe',
-    'neverton',
-    'neville-rolfe',
-    'neville/bee',
-    'nevillii',
-    'nevski',
-    'new-',
-    'new-comers',
-    'new-critical',
     'new-found-land',
-    'new-model',
-    'new-start',
-    'new-zealander',
-    'new/different',
-    'new/old',
-    'newbattle',
-    'newbiggin-on-lune',
-    'newbrook',
-    'newcas',
-    'newcassle',
-    'newcastle-gateshead',
-    'newco-repton',
-    'newcomes',
-    'newcrest',
-    'newell/prison',
     'newenham',
-    'newfie',
-    'newfoundlander',
-    'newhnam-on-severn',
-    'newling',
-    'newly-adopted',
-    'newly-awakened',
-    'newly-composed',
-    'newly-declared',
-    'newly-divorced',
-    'newly-dug',
-    'newly-enfranchised',
-    'newly-finished',
-    'newly-freed',
-    'newly-furnished',
-    'newly-merged',
     'newly-minted',
-    'newly-modernised',
-    'newly-prosperous',
-    'newly-published',
-    'newly-turned',
-    'newly-washed',
-    'newmachar',
-    'newman-jones',
-    'newman-kuels',
-    'newmarket-based',
-    'newmill',
-    'newnes',
-    'newport-born',
-    'newport/pontfaen',
-    'news-book',
-    'news-flashes',
     'news-paper',
-    'news-writer',
-    'news/',
-    'newsbook',
-    'newsdesks',
-    'newsmagazine',
-    'newsome/wetherall',
-    'newson-smith',
-    'newspaper-headline',
-    'newspaper-reader',
-    'newsprinter',
-    'newsquest',
-    'newssheets',
-    'newstalk',
-    'newstrade',
-    'newsum',
     'newsvendor',
-    'newsws11',
-    'newsws8',
-    'newton/volunteer',
-    'newtownhamilton',
-    'nexhmedin',
-    'next-to-useless',
-    'nexts',
-    'nextstation',
-    'nexus-6',
-    'neyland',
-    'neyra',
-    'nezzer',
-    'nf-&khgr;b',
-    'nf8',
-    'nfcg',
     'nfms',
-    'ng/kg/min',
-    'ng17',
-    'ngakosso',
-    'ngapoi',
-    'ngare',
-    'ngauruhoe',
-    'ngayama',
-    'nghi',
-    'ngiau',
-    'ngibuini',
-    'ngls',
-    'ngolo',
-    'nguessan',
-    'ngui/volunteer',
-    'ngumu',
     'ngwenyama',
-    'nh749',
-    'nhas',
-    'nhb',
-    'nhg',
-    'nhim',
-    'nhm',
-    'nho',
-    'nhp',
-    'ni&eacute;pce',
-    'ni&egrave;vre',
-    'ni&ntilde;a',
-    'ni49',
-    'niagara-like',
-    'niat-njifenjou',
-    'nibari',
     'nibbs',
-    'nicaf',
-    'niccolin',
-    'nice-but-dim',
-    'nice-sized',
-    'nicholas/p',
-    'nicholevich',
-    'nicholson/bulletin',
-    'nichrome',
-    'nick-nacks',
-    'nickelodeon',
-    'nickless',
-    'nicknacky',
-    'nicolaas',
-    'nicolet',
-    'nicomedia',
     'nicorene',
-    'nicot',
-    'nicotinate',
-    'nicotine-yellowed',
-    'nidahas',
-    'nidaros',
-    'nidda',
-    'nidr',
-    'niederwald',
-    'niederzell',
-    'nielebock',
-    'niemann',
-    'nietzche',
-    'nieuwe',
-    'nieuwenhuysen',
-    'nif-dominated',
     'niftiest',
-    'nigde',
-    'niger-congo',
-    'nigerian-dominated',
-    'nigh-on',
-    'night-bar',
-    'night-blooming',
-    'night-call',
-    'night-cream',
-    'night-fighting',
-    'night-people',
-    'night-shirts',
-    'night-stick',
-    'night-thoughts',
-    'night/early',
-    'night/friday',
     'nightblooms',
-    'nightfang',
-    'nightfighters',
-    'nightride',
-    'nightriders',
-    'nightsticks',
-    'nightsweats',
-    'nightwood',
-    'nightwoods',
-    'nigms',
-    'nigrofasciatum',
-    'nih/3t3',
-    'nijdam',
-    'nikiforoff',
-    'nikitina',
-    'nikiya',
     'nikkor',
-    'nikkors',
-    'nikole',
-    'nikolic',
-    'nikolskaya',
-    'niktron',
-    'nilamani',
-    'nim-foi-days',
-    'nim6000m',
-    'nimaga',
-    'nimblest',
-    'nimbus-designed',
-    'nime',
-    'nimrod-t',
-    'nine-acre',
-    'nine-bob',
     'nine-coach',
-    'nine-feet',
-    'nine-horse',
-    'nine-nation',
-    'nine-pounder',
-    'nine-race',
-    'nine-shot',
-    'nine-sixteenths',
-    'nine-thousand',
-    'nine-times',
-    'nine-try',
-    'nine-unit',
-    'nine-years-old',
-    'nineeteen',
-    'nineish',
-    'ninepennies',
     'nineteen-eighty',
-    'nineteen-hundred',
-    'nineteen-hundreds',
-    'nineteen-seventies',
-    'nineteen-ten',
-    'nineteen-to-the-dozen',
-    'nineteen-twelve',
-    'nineties.',
-    'ninety-degree',
-    'ninety-ninth',
-    'ninety-one-day',
-    'ninety-third',
-    'ninetyish',
-    'ninetythree',
-    'ninevites',
-    'ninfanian',
     'ninfanians',
-    'ning-hsia',
-    'ning/xu',
-    'ninhydrin',
-    'nini',
-    'ninio',
-    'ninjutsu',
-    'ninoy',
-    'ninski',
-    'ninth-round',
-    'niortaise',
-    'nip&middot;bsa',
-    'nipmap',
-    'nipple-like',
-    'nipponites',
-    'nippur',
     'nirmala',
-    'nirvana/pearl',
-    'nisaia',
-    'nishen',
-    'nistri',
-    'nit-picked',
-    'nitch',
-    'niteries',
-    'nitijela',
-    'nitrate/phosphate',
-    'nitro-glycerine',
-    'nitrogen-based',
-    'nitroglycerin',
-    'nitrosomonas',
-    'nitrotoluene',
-    'nitty-',
     'nitty-gritties',
-    'nitze',
-    'niuafo\'ou',
-    'niuas',
-    'niuatoputapu',
-    'niuean',
-    'nivaldo',
-    'niveau',
-    'niveaux',
-    'nivkh',
-    'niwa',
-    'niwba',
-    'niyaz',
-    'nizamuddin',
-    'nizan-pluvinage',
-    'njala',
     'njb',
-    'njcc',
-    'njonjo',
-    'njorthr',
-    'njoya',
-    'njuba',
-    'nkazamyampi',
-    'nkhata',
-    'nkrf/kidney',
-    'nkrumahist',
-    'nm/l',
-    'nmjs',
-    'nmol/kg',
-    'nmol/l/240',
-    'nn15',
-    'nn8',
     'nnamdi',
-    'nncc',
-    'nne',
-    'nnr',
-    'nnw',
-    'no&amp;sub3',
-    'no-attack',
-    'no-bail-out',
-    'no-balling',
-    'no-comments',
-    'no-contest',
-    'no-cook',
-    'no-distortion',
-    'no-eyes',
-    'no-fixed-abode',
-    'no-harm',
     'no-heparin',
-    'no-i',
-    'no-obligation',
-    'no-oo-oo',
-    'no-operation',
-    'no-osf/1',
-    'no-scoring',
-    'no-shelfware',
-    'no-us',
-    'no.198',
-    'no.21',
-    'no.25',
-    'no.2857',
-    'no.33',
-    'no.37',
-    'no.43',
     'no.5619',
-    'no.98',
-    'no0',
-    'no13',
-    'no53',
-    'no_,_no_doubt',
-    'no_,_no_one',
-    'no_matter_whose',
-    'no_of',
-    'noaa-7',
-    'nobb',
-    'nobilities',
-    'noble-lie',
-    'noble-minded',
-    'nobod',
-    'noburo',
     'nociceptor',
-    'noctes',
-    'noctilucent',
-    'nocturnals',
-    'noda',
-    'nodcock',
-    'noddfa',
-    'node-to-node',
-    'nodes1to10',
-    'nodes41to50',
-    'nodulation',
-    'nodus',
-    'noele',
-    'noella',
-    'noeth',
-    'noether',
     'noevo',
-    'nogaret',
-    'nogent-sur-seine',
-    'nogging',
-    'nogoodnik',
-    'nogykanizsa',
-    'nohra',
-    'noir-rouge',
-    'noiselessness',
-    'noize',
-    'nolo',
-    'nologo',
-    'noltie',
-    'nomen',
-    'nomenclatural',
-    'nomenclaturally',
     'nomenclaturi',
-    'nomicity',
-    'nominacion',
-    'nominalisation',
-    'nominality',
-    'nominalizations',
-    'nominals',
-    'nomineeship',
-    'nomogram',
-    'nomograms',
-    'nomograph',
-    'nomological',
-    'non&ndash;enrollers',
-    'non&rehy;nuclear',
-    'non&rehy;proliferation',
-    'non&rehy;specific',
     'non&rehy;violence',
-    'non&rehy;violent',
-    'non-abelian',
-    'non-absorbing',
-    'non-abstract',
-    'non-abundant',
-    'non-access',
-    'non-accountability',
-    'non-acid',
-    'non-activists',
-    'non-activity',
-    'non-addicted',
-    'non-adherence',
-    'non-adjudicative',
-    'non-adjustable',
-    'non-aids',
     'non-allocated',
-    'non-alphabetic',
-    'non-altruists',
-    'non-alveolar',
-    'non-analytic',
-    'non-analytical',
-    'non-anomalous',
-    'non-antagonistic',
-    'non-anti-social',
-    'non-antigen',
-    'non-aphasic',
-    'non-applied',
-    'non-arbitrariness',
-    'non-architect',
-    'non-arrestable',
-    'non-arterial',
     'non-artist',
-    'non-ascii',
-    'non-assignability',
-    'non-asthmatic',
-    'non-attended',
-    'non-attributable',
-    'non-auditory',
-    'non-award-bearing',
-    'non-axonometric',
-    'non-bactericidal',
-    'non-bfpo',
-    'non-biased',
-    'non-bloody',
-    'non-bonded',
-    'non-bourgeois',
-    'non-breeders',
     'non-brit',
-    'non-budget',
-    'non-bulk',
-    'non-capital',
-    'non-carbonate',
-    'non-cardiovascular',
-    'non-caring',
-    'non-catering',
-    'non-cfa',
-    'non-chaotic',
-    'non-chargeable',
-    'non-charismatic',
-    'non-chaucerian',
-    'non-chromatographic',
-    'non-chronicle',
-    'non-churchgoers',
     'non-city',
-    'non-civil',
-    'non-classified',
-    'non-clearing',
-    'non-clerical',
-    'non-climatic',
-    'non-closed',
-    'non-club',
-    'non-coeliac',
-    'non-colitics',
-    'non-commitally',
-    'non-common',
-    'non-communicative',
-    'non-comparable',
-    'non-competition/canvassing',
-    'non-compliers',
     'non-comprehensive',
-    'non-computer-assisted',
-    'non-concessional',
-    'non-consecutive',
-    'non-consensually',
-    'non-conservatives',
-    'non-constitutive',
-    'non-consummation',
-    'non-contracepting',
-    'non-contraceptive',
-    'non-contracted',
-    'non-contracting',
-    'non-convex',
-    'non-coral',
-    'non-corpuscular',
-    'non-correspondence',
     'non-council',
-    'non-covalently',
-    'non-creative',
-    'non-cyclical',
-    'non-darwinian',
-    'non-data',
-    'non-database',
-    'non-dec',
-    'non-decrease',
-    'non-defining',
-    'non-degradable',
-    'non-deictically',
-    'non-demanding',
-    'non-deposition',
-    'non-descript',
-    'non-descriptive',
     'non-designated',
-    'non-determinism',
-    'non-deterministic',
-    'non-developmental',
-    'non-deviating',
-    'non-diagnostic',
-    'non-dialectical',
-    'non-diamond',
-    'non-diet',
-    'non-digestible',
-    'non-diploid',
-    'non-directly',
-    'non-disclosed',
-    'non-dispersive',
-    'non-distorted',
-    'non-distributable',
     'non-diversifiable',
-    'non-divorcing',
-    'non-doctrinaire',
-    'non-documentary',
-    'non-draining',
-    'non-drama',
-    'non-driver',
-    'non-drivers',
-    'non-duplicated',
-    'non-durables',
-    'non-dutch',
-    'non-edible',
-    'non-egocentric',
-    'non-elastic',
-    'non-electrolytic',
-    'non-emotionally',
     'non-employees',
-    'non-engineering',
-    'non-enzymically',
-    'non-estonian',
-    'non-ethical',
-    'non-ethnic',
-    'non-evangelicals',
-    'non-evolutionist',
-    'non-exec',
-    'non-exempt',
-    'non-existents',
-    'non-experiences',
-    'non-explanatory',
-    'non-explosive',
-    'non-factive',
-    'non-factual',
     'non-famous',
-    'non-farmers',
-    'non-feminists',
-    'non-fetal',
-    'non-feudal',
-    'non-fighting',
-    'non-finance',
-    'non-fishkeepers',
-    'non-fluent',
-    'non-fluorocarbon',
-    'non-free',
-    'non-fullerene',
-    'non-fundamentalist',
-    'non-fungible',
-    'non-gardeners',
-    'non-gene',
     'non-genotoxic',
-    'non-goyigama',
-    'non-guaranteed',
-    'non-guests',
-    'non-gulf',
-    'non-gypsy',
-    'non-haemophiliacs',
-    'non-harmful',
-    'non-heterosexual',
-    'non-hmso',
-    'non-homologous',
-    'non-householder',
-    'non-hungarians',
-    'non-hydrostatic',
-    'non-hypnotic',
-    'non-ici',
     'non-idiomatic',
-    'non-illusory',
-    'non-imitative',
-    'non-income',
-    'non-incorporated',
-    'non-indexed',
-    'non-infringing',
-    'non-instrumentally',
-    'non-intact',
-    'non-integral',
-    'non-integrated',
-    'non-interacting',
-    'non-interactive',
-    'non-interviewing',
-    'non-introspectible',
-    'non-islamic',
     'non-isolated',
-    'non-issues',
-    'non-it',
-    'non-jewishness',
-    'non-kinship',
-    'non-knowledge',
-    'non-labelled',
-    'non-laser',
-    'non-law',
-    'non-lebanese',
-    'non-legally',
-    'non-leguminous',
-    'non-leninist',
-    'non-limiters',
-    'non-literacy',
-    'non-liturgical',
     'non-load',
-    'non-loadbearing',
-    'non-low',
-    'non-luminescence',
-    'non-luminescent',
-    'non-lymphoid',
-    'non-malicious',
-    'non-managed',
-    'non-managers',
-    'non-manipulative',
-    'non-marking',
-    'non-master',
-    'non-means',
-    'non-mendelian',
-    'non-metastatic',
-    'non-microkernel',
     'non-migrant',
-    'non-mineral',
-    'non-monetised',
-    'non-monogamous',
-    'non-monotonic',
-    'non-moral',
-    'non-mothers',
-    'non-motorized',
-    'non-mystical',
-    'non-ncr',
-    'non-ne',
-    'non-neg.',
-    'non-neoplastic',
-    'non-networked',
-    'non-nobles',
-    'non-nominal',
     'non-northerners',
-    'non-nuclear-powered',
-    'non-null',
-    'non-nutritious',
-    'non-obedient',
-    'non-obtrusive',
-    'non-occurrences',
-    'non-oecd',
-    'non-olympic',
-    'non-oppressive',
-    'non-paired',
-    'non-parasitised',
-    'non-parent',
-    'non-parents',
-    'non-participatory',
-    'non-partner',
     'non-partners',
-    'non-payments',
-    'non-peaceful',
-    'non-pensionable',
-    'non-pensioners',
-    'non-performers',
-    'non-perfumed',
-    'non-philosopher',
-    'non-phobic',
-    'non-photosynthetic',
-    'non-planar',
-    'non-player',
-    'non-police',
-    'non-pongine',
-    'non-postscript',
-    'non-precious',
     'non-predatory',
-    'non-prescribed',
-    'non-preventive',
-    'non-prime',
-    'non-prison',
-    'non-programmed',
-    'non-promotional',
-    'non-propositional',
-    'non-propulsive',
-    'non-proven',
-    'non-provided',
-    'non-psychic',
-    'non-psychotic',
-    'non-publicly',
-    'non-purpose',
-    'non-pvc',
     'non-quality',
-    'non-quoted',
-    'non-radicals',
-    'non-rationality',
-    'non-receptor-type',
-    'non-recipients',
-    'non-record',
-    'non-recurrence',
-    'non-reducible',
-    'non-reductively',
-    'non-redundant',
-    'non-referenced',
-    'non-refillable',
-    'non-regulated',
-    'non-renal',
-    'non-repeatability',
     'non-replicating',
-    'non-replies',
-    'non-reproductives',
-    'non-resistant',
-    'non-resonant',
-    'non-responses',
-    'non-responsive',
-    'non-retail',
-    'non-reversible',
-    'non-riders',
-    'non-ruling',
-    'non-ruminant',
-    'non-ruminants',
-    'non-s&amp;p500',
-    'non-sailor',
-    'non-scandinavian',
     'non-schizophrenic',
-    'non-scoring',
-    'non-scriptus',
-    'non-seasonally',
-    'non-secret',
-    'non-segmental',
-    'non-selectively',
-    'non-self-governing',
-    'non-seminoma',
-    'non-sense',
-    'non-sensory',
-    'non-sentences',
-    'non-serb',
-    'non-serial',
-    'non-sf',
-    'non-shared',
     'non-shavian',
-    'non-shetlanders',
-    'non-signatory',
-    'non-signing',
-    'non-silk',
-    'non-singing',
-    'non-skeptical',
-    'non-ski',
-    'non-slavs',
-    'non-soap',
-    'non-softening',
-    'non-solutions',
-    'non-somervillian',
-    'non-spaniards',
-    'non-specialized',
-    'non-spending',
     'non-sporting',
-    'non-sql',
-    'non-staffing',
-    'non-staffordshire',
-    'non-stalinist',
-    'non-standardized',
-    'non-stationary',
-    'non-status',
-    'non-stereotyped',
-    'non-stock',
-    'non-stout',
-    'non-strategy',
-    'non-students',
-    'non-subsequence',
-    'non-succession',
-    'non-sugar',
     'non-superannuable',
-    'non-superimposable',
-    'non-supervisory',
-    'non-surgically',
-    'non-surviveable',
-    'non-swimmers',
-    'non-sybase',
-    'non-symmetric',
-    'non-system',
-    'non-tax-payers',
-    'non-teachers',
-    'non-team',
-    'non-technically',
-    'non-terrestrial',
-    'non-territorial',
-    'non-textual',
     'non-theoretical',
-    'non-thermal',
-    'non-thermonuclear',
-    'non-ticket',
-    'non-timorese',
-    'non-tonic',
-    'non-traffic',
-    'non-transformed',
-    'non-transparent',
-    'non-tropical',
-    'non-truth-conditional',
-    'non-tumorigenic',
-    'non-ulcerated',
-    'non-uniformed',
-    'non-variable',
-    'non-venomous',
     'non-vertical',
-    'non-vested',
-    'non-vinyl',
-    'non-virgins',
-    'non-volcanic',
-    'non-voluntary',
-    'non-waged',
-    'non-washable',
-    'non-waterproof',
-    'non-weapons',
-    'non-westerners',
-    'non-wicking',
-    'non-windsurfing',
-    'non-working-class',
-    'non-writer',
-    'non-wysiwyg',
     'nonaesthetic',
-    'nonancourt',
-    'noncircular',
-    'nonclinical',
-    'noncontroversial',
-    'noncrystallographic',
-    'nondenominational',
-    'nondescripts',
-    'nondisclosure',
-    'nondiscriminatory',
-    'none-too-clean',
-    'none-too-distant',
-    'none-too-prosperous',
-    'none=0',
-    'noneconomic',
-    'nonenzymatic',
     'nonfarmale',
-    'nonformal',
-    'nongravitational',
-    'noninclusion',
-    'nonindustrial',
-    'noninstrumental',
-    'noninteractive',
-    'noninvertible',
-    'nonionic',
-    'nonjudgemental',
-    'nonlocal',
-    'nonmoney',
-    'nonobjective',
-    'nonperishable',
-    'nonperspectival',
-    'nonproductive',
     'nonrealistic',
-    'nonreciprocal',
-    'nonscientists',
-    'nonsensically',
-    'nonsequential',
-    'nonslip',
-    'nonspherical',
-    'nonstop-ux',
-    'nonstrategic',
-    'nonsuit',
-    'nonuniform',
-    'nonveridical',
-    'noo-ooo-oo',
-    'noodlings',
-    'noon-3pm',
-    'noordeinde',
     'noot',
-    'nootkatensis',
-    'noratlas',
-    'norbay',
-    'norbet',
-    'norbit',
-    'norburn',
-    'nord-sud',
-    'nord/lb',
-    'nordalbingian',
-    'nordalbingians',
-    'nordanstad',
-    'nordaustlandet',
-    'nordenstreng',
-    'nordeoxycholic',
-    'nordgau',
     'nordhorn',
-    'nordine',
-    'nordon',
-    'nordrhein',
-    'noreena',
-    'norell',
-    'norepro',
-    'norf.',
-    'norfloxacin',
-    'norfolk/suffolk',
-    'norgate',
-    'norimin',
-    'normal-speed',
-    'normal/combination',
-    'normalec',
-    'normally-aspirated',
     'normannorum',
-    'normenforcement',
-    'normington',
-    'norminton',
-    'normoalbuminuric',
-    'normocalcaemia',
-    'normochlorhydria',
-    'normochromic',
-    'normolipaemic',
-    'norms.',
-    'normung',
-    'noronha',
-    'norpa',
-    'norren',
-    'norrie-walker',
-    'norsca',
     'norsea',
-    'norsemania',
-    'norstedts',
-    'north-easterner',
-    'north-midlands',
-    'north-north&rehy;east',
-    'north-north&rehy;west',
-    'northampton-market',
-    'northangerland',
-    'northavon',
-    'northeasterners',
-    'northenden',
-    'northeners',
-    'northern8',
-    'northey',
-    'northfield/manager',
     'northlight',
-    'northridge',
-    'northsea',
-    'northward-flowing',
-    'northwind',
-    'norton-logoed',
-    'norton/gloucestershire',
-    'norvm',
-    'norwegain',
-    'norwitz',
-    'nosaka',
-    'nose-bag',
-    'nose-end',
-    'nose-holes',
-    'nose-mounted',
-    'nose-tip',
     'noseck&yacute',
-    'nosei',
-    'nosheen',
-    'noshing',
-    'nosings',
-    'nosology',
-    'nossiter',
-    'nostras',
-    'nosworthy',
-    'not-bloody-likely',
-    'not-food',
-    'not-inconsiderable',
-    'not-invented-here',
-    'not-nice',
-    'not-proven',
-    'not-quite',
     'not-s',
-    'not-serious',
-    'not-so-clever',
-    'not-so-hot',
-    'not-so-new',
-    'not-so-old',
-    'not-so-rich',
-    'not-so-subtle',
-    'not-so-youthful',
-    'not-to-be-missed',
-    'not-to-be-remembered',
-    'not-very-bright',
-    'not-x',
-    'not-yet-dead',
-    'not_more',
-    'not_sort',
     'notabilities',
-    'notability',
-    'notarised',
-    'notator',
-    'note-orders',
-    'noteable',
-    'notedly',
-    'noteless',
-    'noten',
-    'notephone',
-    'noter-up',
-    'notes-programme',
-    'nothing.',
-    'notitia',
-    'notke',
-    'notrajnsko',
     'nott-bower',
-    'notting-hamshire',
-    'nottingham-sheffield',
-    'noubir',
-    'noun-noun',
-    'nourbakhsh',
-    'nouveau-style',
-    'nov&yacute',
-    'nov\'',
-    'nov-dec',
-    'nov.10',
-    'nov.29',
-    'nov/dec',
-    'novablast',
-    'novaks',
-    'novara',
     'novate',
-    'novelettish',
-    'novell-unix',
-    'novell/unix',
-    'novels.',
-    'november&ndash;march',
-    'november-17',
-    'november-march',
-    'november/january',
-    'noviciate',
-    'novinpoor',
-    'noviny',
-    'novix',
-    'novoa',
-    'novokuznetsk',
-    'novon',
     'novosibirskiye',
-    'now-',
-    'now-abandoned',
-    'now-and-then',
-    'now-common',
-    'now-customary',
-    'now-demolished',
-    'now-discredited',
-    'now-empty',
-    'now-estranged',
-    'now-faded',
-    'now-it-is',
-    'now-lost',
-    'nowa',
-    'nowad',
-    'nowina-konopka',
     'noxzema',
-    'noyelle',
-    'noyer',
-    'noyse',
-    'np-40',
-    'npf',
-    'npfa',
-    'nplf',
-    'nqv',
-    'nr1',
-    'nr77v',
-    'nras',
-    'nrb',
-    'nrc2119',
-    'ns.20a',
-    'ns.47a(1)',
     'ns.62a(1)',
-    'ns32000',
-    'nsai',
-    'nsb',
-    'nsl',
-    'nsra',
-    'nsss',
-    'nsub',
-    'nt-capable',
-    'nt-certified',
-    'nt-exclusive',
-    'nt-on-multiprocessors',
-    'nt-related',
-    'nt/3m',
-    'ntaba',
-    'ntagerura',
     'ntgb',
-    'ntigulirwa',
-    'ntiwane',
-    'ntn',
-    'ntozake',
-    'ntsu',
-    'ntui',
-    'ntwf',
-    'nu&amp;sup2',
-    'nu&ntilde;ez',
-    'nu-pak',
-    'nuang',
-    'nubbin',
-    'nubbles',
-    'nubern',
-    'nubuk',
     'nuclear-',
-    'nuclear-arms',
-    'nuclear-based',
-    'nucleators',
-    'nucleides',
-    'nuclein',
-    'nucleins',
-    'nucleoprotein',
-    'nudleman',
-    'nuesch',
-    'nuffield-based',
-    'nuggety',
-    'nugud',
-    'nugw',
-    'nuisance-value',
-    'nuits-st-georges',
     'nuking',
-    'nukite',
-    'nulla',
-    'nulling',
-    'num&eacute;raire',
-    'number-wise',
-    'number/entry',
-    'number/history',
-    'number/lemma',
-    'number/lemmatised',
-    'number/target',
-    'number/version',
-    'numberplate',
-    'numberroutines',
-    'numbfish',
-    'numeric-intensive',
     'numeric/character',
-    'numerik',
-    'numeris',
-    'numerously',
-    'nummularia',
-    'numnah',
-    'nun-like',
-    'nunaa',
-    'nunberg',
-    'nuncios',
-    'nunclon',
-    'nuncupative',
-    'nuneaton-bedworth',
-    'nunge',
-    'nunlike',
-    'nunnenkamp',
     'nunnerley',
-    'nuntiandi',
-    'nunzio',
-    'nuoro',
-    'nup&prime',
-    'nupkinses',
-    'nuptse',
-    'nuragus',
-    'nurdish',
-    'nureddin',
-    'nureg-0558',
-    'nurmagambetov',
-    'nurnberg',
-    'nurse-in-charge',
-    'nurse-maids',
-    'nursemaiding',
     'nurserymaids',
-    'nurses.',
-    'nursing-homes',
-    'nuruddin',
-    'nuruosmaniye',
-    'nusfjord',
-    'nut-house',
-    'nuthin',
-    'nutrafin',
-    'nutrene',
-    'nutties',
-    'nuul',
-    'nuvacron',
-    'nuvista+',
-    'nw9',
-    'nwaha',
     'nwapa',
-    'nwd',
-    'nyae',
-    'nyamdavaa',
-    'nyamlagira',
-    'nyamyn',
-    'nyandwi',
-    'nyantekyi',
-    'nyasa',
-    'nyassae',
-    'nyberg',
-    'nye/council',
-    'nyiragongo',
-    'nyirankusi-munyaneza',
-    'nyko&oslash;bing',
-    'nylon-6,6',
     'nymph&eacute;as',
-    'nymphae',
-    'nympheas',
-    'nymphenburg',
-    'nymphette',
-    'nymphomaniacs',
-    'nyp',
-    'nypso',
-    'nyree',
-    'nyren',
-    'nyta',
-    'nytns',
-    'nyuk',
-    'nyum',
-    'nz&dollar;10,000',
-    'nz&dollar;5,000',
     'nz&dollar;5.149bn',
-    'nzabonimana',
-    'nzeng',
-    'nzima',
-    'o&amp;sub3',
-    'o&amp;sup2',
-    'o&iuml;r',
-    'o&uacute',
-    'o\'bannion',
-    'o\'barullion',
-    'o\'beirne',
-    'o\'bloody',
-    'o\'braonain',
-    'o\'bree',
-    'o\'butty',
-    'o\'cionnaith',
     'o\'clockish',
-    'o\'connor/gypsy',
-    'o\'crilly',
-    'o\'crookrise',
-    'o\'dom',
-    'o\'donaghue',
-    'o\'driscolls',
-    'o\'ergiven',
-    'o\'fail',
-    'o\'fiaich',
-    'o\'finn',
-    'o\'fun',
-    'o\'gaunt',
-    'o\'haire',
-    'o\'hea',
-    'o\'hooligan',
     'o\'hora',
-    'o\'loan',
-    'o\'loughlin',
-    'o\'maonlai',
-    'o\'morain',
-    'o\'my',
-    'o\'nell',
-    'o\'nion',
-    'o\'nions',
-    'o\'nolan',
-    'o\'reilly/reporting',
-    'o\'riley',
-    'o\'them',
-    'o(n/2)',
-    'o-0',
-    'o-positive',
     'o.1',
-    'o.3',
-    'o.59',
-    'o.8',
-    'o.a.p',
-    'o.c.t.u.',
-    'o.connell',
-    'o.g.s.',
-    'o.p',
-    'o.p.d.',
-    'o.p.p.',
-    'o/60',
-    'o/d',
-    'o/ml',
-    'o2+',
-    'o2c',
     'o2sql',
-    'o50',
-    'o71',
-    'o=nexor',
-    'oabs',
-    'oadp',
-    'oak-apples',
-    'oak-floored',
-    'oak-leaf',
-    'oak-timbered',
-    'oak-veneered',
-    'oakamoor',
-    'oakbank',
-    'oakdale',
-    'oakenson/social',
-    'oakheart',
     'oakhurst',
-    'oakle',
-    'oakleaves',
-    'oakly',
-    'oakville',
-    'oancea',
-    'oarlock',
-    'oarsmanship',
-    'oast-houses',
-    'oat-cakes',
-    'oatmeal-coloured',
-    'oatrigg',
-    'oaty',
-    'oba-apounou',
-    'obame',
-    'obart',
     'obduction',
-    'oberalppass',
-    'oberdrauberg',
-    'oberheim',
-    'oberm&uuml;hle',
-    'oberpr&auml;sident',
-    'obersalzberg',
-    'oberstein',
-    'obertauern',
-    'obeyance',
-    'obfuscatory',
-    'obicularis',
-    'obituarist',
-    'obje',
-    'object-cathexis',
-    'object-choice',
     'object-naming',
-    'object-relationships',
-    'objectional',
-    'objective(s)',
-    'objective-row',
-    'objective-setting',
-    'objectiveness',
-    'objectivists',
-    'objectless',
-    'objectmaker',
-    'objectworld',
-    'obligating',
-    'obligatoire',
-    'obligatorily',
-    'obligee',
-    'obligor',
     'obliques',
-    'oblong-shaped',
-    'oboists',
-    'oborknezovi',
-    'obrenovi&cacute',
-    'obreroi',
-    'obscurantisme',
-    'obscurer',
-    'obscurus',
-    'observa&rehy;tion',
-    'observability',
-    'observation.',
-    'obsoleted',
-    'obsorption',
-    'obtruding',
-    'obtusifolia',
     'obtusifolius',
-    'obukw',
-    'obvi',
-    'obvious-looking',
-    'oby',
-    'oca&ntilde;a',
-    'occam-based',
-    'occasionaly',
-    'occidentales',
-    'occipito',
-    'occultis',
-    'occupatio',
-    'occupational/regional',
-    'occupationally-induced',
-    'occupiable',
-    'occurences',
     'occurs.',
-    'ocean-racing',
-    'oceaneering',
-    'ocellar',
-    'ocellus',
-    'ochi',
-    'ochlospecies',
-    'ochses',
-    'ochwanyi',
-    'ocis',
-    'ocisan',
-    'ockert',
-    'ocli',
-    'ocotea',
-    'ocr-processed',
-    'oct-',
     'oct-dec',
-    'oct/nov',
-    'octamer-like',
-    'octamer/nfi',
-    'octamers',
-    'octave-combinations',
-    'october&ndash;june',
-    'october-10',
-    'october-15',
-    'october-20',
-    'october-31',
-    'octobers',
-    'octofad',
-    'octofasciatum',
-    'octopus-like',
-    'octovuillin',
     'oculatus',
-    'od(sa)',
-    'od1/od2',
-    'odalric',
-    'odbc/dal',
-    'odd-jobbing',
-    'oddar',
-    'oddbods',
-    'oddington',
-    'oddrun',
-    'odeh',
-    'oder-neise',
-    'odg',
-    'odi-compliant',
-    'odie-ali',
-    'odier',
     'odiferous',
-    'odle',
-    'odney',
-    'odonatist',
-    'odontologist',
-    'odor-o-no',
-    'odour-binding',
-    'odourous',
-    'odourprufe',
-    'odria',
-    'odyessy',
-    'odys.',
-    'odz',
-    'oecd-recommended',
-    'oecology',
-    'oeconomy',
     'oellermann',
-    'oem-only',
-    'oenanthe',
-    'oenocytes',
-    'oeppen',
-    'oerlikon',
-    'oesophagoscopy',
-    'oesphageal',
-    'oess',
-    'oesteoporosis',
-    'oestringen',
-    'oestrogen-mimics',
-    'oestrogen-type',
-    'oews',
-    'oeyangen',
-    'of-a',
     'of-fact',
-    'of-i',
-    'of-ing',
-    'of-the-art',
-    'of-war',
-    'of-what',
-    'of/central',
-    'of/from',
-    'of_',
-    'of_course.',
-    'of_each',
-    'ofen',
-    'off-base',
-    'off-for',
-    'off-foreleg',
-    'off-gases',
     'off-green',
-    'off-hind',
-    'off-lead',
-    'off-loads',
-    'off-phase',
-    'off-pitch',
-    'off-prints',
-    'off-put',
-    'off-puttingly',
-    'off-ration',
-    'off-sides',
-    'off-the-beaten-track',
-    'off-the-croft',
-    'off-the-top-of-the-head',
-    'off.the',
-    'off/on',
     'offence(s)',
-    'offences.',
-    'offendedly',
-    'offender-based',
-    'offically',
-    'office-approved',
-    'office-cosla',
-    'office-funded',
-    'office-hours',
-    'office-keepers',
-    'office-party',
-    'office/firmlet',
-    'officer(s)',
-    'officer-in-command',
-    'officially-approved',
-    'officialsthat',
     'officianalis',
-    'officinae',
-    'offizier',
-    'offley',
-    'offner',
-    'offrs',
-    'offsides',
-    'offsite',
-    'offsites',
-    'ofhis',
-    'ofhr',
-    'oflag',
-    'ofori-boateng',
-    'ofra',
-    'oft-expressed',
-    'often-cited',
     'often-heard',
-    'often-mordantly',
-    'ogarevo',
-    'ogilvie-grant',
-    'ognovenko',
-    'ogork',
-    'ogreish',
-    'ogress',
-    'ogus',
-    'oh-',
-    'oh-five-hundred',
-    'oh-h',
-    'oh-so',
-    'oh-so-clever',
-    'oh_of',
-    'ohad',
     'ohara',
-    'ohi',
-    'ohime',
-    'ohlinger',
-    'ohnemus',
-    'oie',
-    'oif',
-    'oiga',
-    'oignons',
-    'oil-change',
-    'oil-drillers',
-    'oil-engined',
-    'oil-fuelled',
-    'oil-hungry',
-    'oil-induced',
-    'oil-rigs',
     'oil-sanctions',
-    'oil/resin',
-    'oil/water',
-    'oilcloth-covered',
-    'oilp',
-    'oilrelated',
-    'oilstone',
-    'oilwell',
-    'oily/combination',
-    'oinghua',
-    'oitaians',
-    'oje',
-    'okello',
-    'okinowa',
-    'okistation',
-    'oklahoma-based',
     'okoli',
-    'okra-filled',
-    'okrugs',
-    'oktay',
-    'okucani',
-    'ol10',
-    'ol400',
-    'ol6',
-    'olac',
-    'oladehinde',
-    'olapade',
-    'olathaval',
-    'olaussen',
-    'olaves',
-    'olawale',
-    'olbrechts-tyteca',
     'olby',
-    'old-maid',
-    'old-stagers',
-    'old-tyme',
-    'old-type',
-    'old-woman-who-sang-to-the-river',
-    'oldacre',
-    'oldbrook',
-    'olden-day',
-    'oldenshaw',
-    'oldfields',
-    'oldham-based',
-    'oldhams',
-    'oldtime',
-    'ole-like',
-    'oleksandr',
     'olen',
-    'oleo',
-    'olesiak',
-    'olestra',
-    'oleum',
-    'olex',
-    'olginskaya',
-    'oliday',
-    'oligodeoxyribonucleotides',
-    'oligodt',
-    'oligomenorrhoea',
-    'oligonucleotide/bead',
-    'olim',
-    'olimpia',
-    'olit',
-    'olive-brown',
     'olivewood',
-    'olje',
-    'ollenhauer',
-    'oller',
-    'olliemania',
-    'ollulanus',
-    'olmstead',
-    'olmsted',
-    'olmympic',
-    'oloa',
-    'oloman-ellis',
-    'olonga',
-    'olor',
-    'oloron-sainte-marie',
-    'olp',
-    'oltenia',
     'oltos',
-    'olympiakos',
-    'olynthus',
-    'omand',
-    'omani-owned',
-    'ombra',
-    'omda',
-    'omegna',
-    'omerod',
-    'omi&scaron',
-    'omicron&amp;sup1',
-    'ominous-looking',
-    'omk',
-    'omleco',
-    'ommatins',
-    'ommm',
     'ommmmm',
-    'omni-directional',
-    'omniday',
-    'omnipage',
-    'omnipoints',
-    'omnisciently',
-    'omodei',
-    'omoua',
-    'omphalomesenteric',
-    'omua',
-    'on&lsqb;24-feb-1990&rsqb',
-    'on-duty',
-    'on-lending',
-    'on-market',
-    'on-one',
-    'on-peak',
     'on-rushing',
-    'on-task',
-    'on-the-field',
-    'on-to',
-    'on-zone',
-    'on.a',
-    'on.over',
-    'on.the',
-    'on9',
-    'on_er_to',
-    'onaug.',
-    'once-a-day',
-    'once-active',
-    'once-cherished',
-    'once-common',
-    'once-famous',
     'once-fashionable',
-    'once-magnificent',
-    'once-raced',
-    'once-safe',
-    'once-staid',
-    'once-strong',
-    'once-successful',
-    'once-wealthy',
-    'onchan',
-    'oncins',
-    'oncofetal',
-    'oncs',
-    'ondruska',
-    'onds',
-    'one-10th',
-    'one-12th',
     'one-and-a-bit',
-    'one-and-a-half-hour',
-    'one-and-a-quarter',
-    'one-and-one',
-    'one-another',
-    'one-bar',
-    'one-byte',
-    'one-down',
-    'one-episode',
-    'one-finger',
-    'one-for-five',
-    'one-for-seven',
-    'one-for-six',
-    'one-fortieth',
-    'one-forty',
-    'one-four-one',
     'one-gallon',
-    'one-game',
-    'one-half-integer',
-    'one-in-five',
-    'one-in-two',
-    'one-key',
-    'one-love',
-    'one-male',
-    'one-o-one',
-    'one-or',
-    'one-over',
-    'one-parameter',
-    'one-pit',
-    'one-plus',
-    'one-round',
-    'one-sector',
     'one-shouldered',
-    'one-sixteenth',
-    'one-size',
-    'one-stop-shops',
-    'one-stringed',
-    'one-tailed',
-    'one-three-seven',
-    'one-twenty',
-    'one-yard',
-    'one-year-long',
-    'one-year-only',
-    'one/two',
-    'oneaxis',
-    'oneko',
-    'onera',
-    'onerousness',
     'ones_as',
-    'oneworld',
-    'ongoiba',
-    'ongratulations',
-    'ongwakebei',
-    'onies',
-    'onion-shaped',
-    'oniony',
-    'onjune',
-    'onlaf',
-    'only_as_good',
-    'ono.',
-    'onomastics',
-    'onomatopaeic',
-    'onoto',
-    'onself',
     'ontario-based',
-    'onthe',
-    'ontologic',
-    'onuc',
-    'onumoz',
-    'onychophorans',
-    'onyszkiewicz',
-    'onythin',
-    'oocch',
-    'oodinium',
-    'ooever',
-    'oogenesis',
-    'oogypip',
-    'ooh-er',
-    'oohh',
-    'ooids',
     'ook',
-    'ooshi',
-    'oosterwijk',
-    'ootside',
-    'oozelum',
-    'op&eacute;ra-bastille',
-    'op\'ning',
-    'op.20',
-    'op.95',
-    'op.cit.',
-    'op.i',
-    'op.ii',
-    'op.iii',
-    'op_cit.',
-    'opcodes',
-    'opel-badged',
     'open&rehy;necked',
-    'open-circuited',
-    'open-coil',
-    'open-crotch',
-    'open-forum',
-    'open-legged',
-    'open-ness',
-    'open-ocean',
-    'open-reading',
-    'open-spaces',
-    'open-to-the-elements',
-    'open-water',
-    'open/close',
-    'open/office',
-    'opendays',
-    'opened-up',
     'openframe',
-    'openin\'',
-    'opening-day',
-    'openlook',
-    'openrender',
-    'openv*opss',
-    'openvme',
-    'opera-glass',
-    'opera-glasses',
-    'operatically',
-    'operating-cost',
-    'operator-initiated',
-    'operons',
-    'ophey',
-    'ophiacanthids',
-    'ophiochiton',
     'ophiochitonidae',
-    'ophiocreas',
-    'ophiodaces',
-    'ophiodelos',
-    'ophiodermatidae',
-    'ophiohelinae',
-    'ophiomelina',
-    'ophiopogan',
-    'opiate-like',
-    'opic',
-    'opinio',
-    'opinion-',
-    'opinion-former',
-    'opium-addicted',
-    'oporia-ekwaro',
-    'oportunities',
     'opositora',
-    'oppdal',
-    'oppenheim-barnes',
-    'oppens',
-    'oppertunities',
-    'oppertunity',
-    'oppido',
-    'opponents.',
-    'opportun',
-    'opportunities/human',
-    'opportunity.',
-    'opposability',
-    'opposite-leaved',
-    'opposite-sex',
-    'opposition-backed',
-    'opposition-sponsored',
     'opprobium',
-    'opprobrious',
-    'oppurtunity',
-    'opry',
-    'optare',
-    'optech',
-    'optibus',
-    'optical-disk',
-    'optical-link',
-    'optical/electronic',
-    'optilas',
-    'optime',
-    'optimisers',
-    'optimumvalue',
-    'optionality',
-    'opto-electronic',
     'optocoupler',
-    'optokinetic',
-    'or-as',
-    'or:f',
-    'or_not',
-    'orache',
-    'oracle-experts',
-    'oral-genital',
-    'oral-maternal',
-    'oral-oral',
-    'orang-utangs',
-    'orange-',
-    'orange-bibbed',
-    'orange-nassau',
-    'orange-rimmed',
-    'orange-tinged',
     'orange/red',
-    'oranjestad',
-    'orated',
-    'orb*view',
-    'orbiters',
-    'orchestrational',
-    'orchestrators',
-    'orchestrion',
-    'orchidaceae',
-    'orchidaceous',
-    'orchises',
-    'orchs.',
-    'orcish',
-    'order&pound;5',
-    'order\'',
-    'order-book',
     'order-books',
-    'order-takers',
-    'orderd',
-    'ordesa',
-    'ordina',
-    'ordinally',
-    'ordinary-language',
-    'ordinem',
-    'ording',
-    'ordnung',
-    'ordulf',
-    'ore-bearing',
-    'orebody',
-    'orebro',
-    'oreichalcum',
-    'oreichalkos',
     'oreithyia',
-    'orejuela',
-    'orelia',
-    'orengo',
-    'orense',
-    'oreos',
-    'oreshoots',
-    'oresund',
-    'oreval',
-    'orgainse',
-    'organ-builders',
-    'organiastions',
-    'organically-grown',
-    'organisation(s)',
-    'organisations/individuals',
-    'organising/publicity',
     'organism-centred',
-    'organisors',
-    'organistion',
-    'organization-democratic',
-    'organization-plo',
-    'organizations.',
-    'organizationshaikh',
-    'organo',
-    'organo-halogens',
-    'organo-phosphates',
-    'organofluorine',
-    'organosulphur',
-    'orgasmed',
-    'orgill',
-    'orgitunnel',
-    'orgiva',
     'orgulloso',
-    'orians',
-    'orichalcum',
-    'orientales',
-    'orientalists',
-    'orientation.',
-    'orienteers',
-    'orig',
-    'origin.',
-    'originale',
-    'originalities',
-    'originations',
-    'originel',
-    'origional',
-    'orkar',
-    'orkneyisms',
     'orl&eacute;anists',
-    'orlac',
-    'orleans-style',
-    'orlovsky',
-    'orm',
-    'ormon',
-    'ormosia',
-    'ormshaw',
-    'ormstein',
-    'orn&eacute',
-    'orn&eacute;e',
-    'orn&eacute;es',
-    'ornately-carved',
-    'ornateness',
-    'ornatipinnis',
-    'ornette',
     'ornithopter',
-    'ornithostrongylus',
-    'orogastric',
-    'orogastrically',
-    'orographic',
-    'orongo',
-    'oropendolas',
-    'oropharyngeal',
-    'oropharynx',
-    'oropus',
-    'orph&eacute;e',
-    'orpheum',
-    'orphists',
-    'orphy',
-    'orplid',
-    'orrego',
     'orrell12',
-    'orsabrin',
-    'orsanic',
-    'orse',
-    'orsova',
-    'ortho-chiron',
-    'ortho-cilag',
-    'orthochromatic',
-    'orthoclase',
-    'orthoepic',
-    'orthoepists',
-    'orthogonally',
-    'orthographic-to-phonological',
-    'orthographies',
-    'orthonormal',
-    'orthopedagogics',
     'orthoplan',
-    'orthostatic',
-    'orthotectonic',
-    'ortolano',
-    'orton-green',
-    'orton-halliwell',
-    'orton/short-sighted',
-    'ortovox',
-    'ortrud',
-    'orts',
-    'orumiyeh',
-    'orun',
-    'oruro',
-    'orwig',
-    'oryctes',
-    'os/2.',
     'os/9',
-    'oscan',
-    'oscar-winners',
-    'osce',
-    'oscillatoria',
-    'oscura',
-    'oscure',
-    'oseberg',
-    'oseophagus',
-    'oser',
-    'osf/dce',
-    'osf/dce/dme',
-    'osf/motif-based',
-    'osfrith',
-    'oshchenko',
-    'osireion',
     'ositel/400',
-    'osleri',
-    'oslobodenje',
-    'osmarino',
-    'osmiro',
-    'osmoregulation',
-    'osnaburgh',
-    'oso4',
-    'ospina',
-    'ospital',
-    'ospovat',
-    'ospringe',
-    'osra',
-    'ossebi',
-    'osservatore',
-    'ossetians',
     'ossianic',
-    'ossies',
-    'ossington',
-    'ossman',
-    'ossmane',
-    'ossobleh',
-    'ossorio',
-    'ost-elbian',
-    'ostabat',
-    'ostanisczkowski',
-    'osteitis',
-    'ostension',
-    'ostensive-inferential',
-    'ostensively',
-    'osteo-arthritis',
-    'osteoarthritic',
     'osteogenesis',
-    'osteolytic',
-    'osteoma',
-    'osteostraci',
-    'osterberg',
-    'osterman',
-    'osterwald',
-    'ostfront',
-    'ostial',
-    'ostmarkenverein',
-    'ostracizing',
-    'ostracode-rich',
-    'ostracoderms',
-    'ostrakismos',
-    'ostranenie',
-    'ostrers',
     'ostresov',
-    'ostrov',
-    'ostwald',
-    'osu',
-    'oswyn',
-    'otamy',
-    'otavipithecus',
-    'otawa',
-    'otel',
-    'otelo',
-    'otema',
-    'oteng',
-    'otes',
-    'othen',
-    'other*',
-    'others*',
     'otherways',
-    'othrys',
-    'otididae',
-    'otmar',
-    'otoniel',
-    'otosclerosis',
-    'otoscopist',
-    'otreus',
-    'otten',
-    'otterden',
-    'otterington',
-    'ottermus',
-    'otterton',
-    'ottewill',
-    'otto-hermann',
-    'ottoman-held',
     'ottonianum',
-    'ouata',
-    'oubli&eacute;es',
-    'oubliettes',
-    'ouches',
-    'oude',
-    'ouerzzazate',
-    'ouest-africaine',
-    'ouida',
-    'oultram',
-    'ounce-for-ounce',
-    'oupo',
-    'ousedale',
-    'ousman',
-    'out-breath',
-    'out-classing',
     'out-comes',
-    'out-done',
-    'out-drive',
-    'out-fly',
-    'out-galloped',
-    'out-gay',
-    'out-grumped',
-    'out-of-fashion',
-    'out-of-the-ordinary',
-    'out-of-this-world',
-    'out-of-wind',
-    'out-of-work-hours',
-    'out-performance',
-    'out-produce',
-    'out-range',
-    'out-scored',
     'out-scrummaged',
-    'out-standing',
-    'out-thinking',
-    'out-worker',
-    'out_er_of',
-    'out_in',
-    'out_out_of',
-    'outbreed',
-    'outcalt',
-    'outcastes',
-    'outcoming',
-    'outcompeting',
-    'outdoorsman',
-    'outdrew',
-    'outer-frame',
-    'outer-suburban',
     'outerhead',
-    'outfacing',
-    'outfish',
-    'outfront',
-    'outgate',
-    'outillage',
-    'outinen',
-    'outlandishly',
-    'outlandishness',
-    'outliners',
-    'outmanoeuvring',
-    'outokumpu',
-    'outplaying',
-    'outpolled',
-    'outproduce',
-    'output-weighted',
     'output/head',
-    'output/input',
-    'outrake',
-    'outres-mer',
-    'outrides',
-    'outselves',
-    'outshopped',
-    'outside-world',
-    'outsole.',
-    'outspan',
-    'outthink',
-    'outturns',
-    'outvote',
-    'outvoters',
-    'outwait',
-    'ovariotomy',
     'ovenware',
-    'over&mdash;production',
-    'over&rehy;crowded',
-    'over-30s',
-    'over-45s',
-    'over-55',
-    'over-65',
-    'over-80',
-    'over-80s',
-    'over-8s',
-    'over-academic',
-    'over-achievement',
-    'over-activity',
-    'over-ambitiously',
-    'over-amorous',
-    'over-amplification',
     'over-application',
-    'over-bedding',
-    'over-blown',
-    'over-brightly',
-    'over-compensated',
-    'over-cooking',
-    'over-costly',
-    'over-cropping',
-    'over-cultivation',
-    'over-dense',
-    'over-detailed',
-    'over-do',
-    'over-dominant',
-    'over-dramatising',
-    'over-dresses',
-    'over-emphasises',
     'over-employment',
-    'over-enrichment',
-    'over-exaggeration',
-    'over-excitable',
-    'over-expensive',
-    'over-exposing',
-    'over-extraction',
-    'over-exuberance',
-    'over-florid',
-    'over-furnished',
-    'over-fussy',
-    'over-generalised',
-    'over-generosity',
-    'over-gilding',
-    'over-grassed',
-    'over-handing',
     'over-hauling',
-    'over-identifying',
-    'over-individualistic',
-    'over-insulation',
-    'over-insured',
-    'over-investing',
-    'over-keen',
-    'over-layers',
-    'over-manned',
-    'over-manning',
-    'over-mature',
-    'over-meticulous',
-    'over-noisy',
-    'over-occupancy',
-    'over-officious',
-    'over-optimistically',
     'over-particular',
-    'over-payment',
-    'over-personalised',
-    'over-play',
-    'over-precise',
-    'over-prediction',
-    'over-prescription',
-    'over-prescriptive',
-    'over-productive',
-    'over-promoted',
-    'over-promotion',
-    'over-protectiveness',
-    'over-rates',
-    'over-regard',
-    'over-regularizations',
-    'over-reliant',
     'over-report',
-    'over-reported',
-    'over-restriction',
-    'over-rigorous',
-    'over-robust',
-    'over-secretion',
-    'over-seen',
-    'over-selfish',
-    'over-sensitivity',
-    'over-simplifies',
-    'over-skirt',
-    'over-sleepiness',
-    'over-specific',
-    'over-spenders',
-    'over-spent',
-    'over-stating',
     'over-stimulates',
-    'over-strong',
-    'over-subtle',
-    'over-suspicious',
-    'over-sweet',
-    'over-take',
-    'over-the',
-    'over-the-knee',
-    'over-thirties',
-    'over-tighten',
-    'over-tightening',
-    'over-tolerant',
-    'over-trousers',
-    'over-tunics',
-    'over-turned',
-    'over-using',
     'over-vigorous',
-    'over-voltage',
-    'over-water',
-    'over-written',
-    'over-wrought',
-    'over/gloucestershire',
-    'overbalances',
-    'overbite',
-    'overbooks',
-    'overbore',
-    'overbridges',
-    'overbrooke',
-    'overbrowning',
-    'overcasting',
-    'overcentralisation',
-    'overcharges',
     'overcloths',
-    'overcompensation',
-    'overconcentration',
-    'overcropping',
-    'overdevelop',
-    'overdispersion',
-    'overdoor',
-    'overdoors',
-    'overdramatized',
-    'overdues',
-    'overeager',
-    'overeater',
-    'overelaborate',
-    'overemphasise',
-    'overemphasising',
-    'overemphasizes',
     'overexploited',
-    'overfield',
-    'overfiltration',
-    'overfold',
-    'overgeneralizations',
-    'overgirth',
-    'overgraze',
-    'overgrow',
-    'overhasty',
-    'overhearer',
-    'overhill',
-    'overinclusion',
-    'overinvestigation',
-    'overlayable',
-    'overlearning',
-    'overlength',
     'overlit',
-    'overlock',
-    'overlocked',
-    'overlookable',
-    'overloon',
-    'overlordships',
-    'overoptimistic',
-    'overpessimistic',
-    'overpredict',
-    'overprescription',
-    'overpressured',
-    'overpressuring',
-    'overpricings',
-    'overrein',
-    'overreliance',
-    'overriders',
     'overridingly',
-    'overs.',
-    'oversensitiveness',
-    'oversheet',
-    'oversheeting',
-    'overshirt',
-    'overshirts',
-    'oversman',
-    'overspeed',
-    'overspender',
-    'overspreading',
-    'overstanding',
-    'overstatements',
-    'oversteps',
-    'overstood',
-    'overstrand',
     'overstrikes',
-    'oversubcription',
-    'overthrowal',
-    'overtness',
-    'overtolls',
-    'overtopping',
-    'overtown',
-    'overusing',
-    'overwhip',
-    'overworld',
-    'ovigerous',
-    'ovina/vivipara',
-    'oviparous',
-    'ovitz',
-    'ovn',
-    'ovocn&yacute',
     'ovs',
-    'ovulations',
-    'owen-jones',
-    'owen/home',
-    'owens/upton',
-    'owl-shaped',
-    'own-',
-    'own-branded',
-    'own-branders',
-    'own-brands',
-    'own-some',
-    'own/filmit',
-    'owner-controlled',
-    'owner-ship',
-    'owner-spectator',
-    'owner-tenant',
     'owner/managers',
-    'owner/not',
-    'owner/occupiers',
-    'owner/trade',
-    'ownsome',
-    'owo',
-    'owston',
-    'owt\'a',
-    'owww',
-    'owyeen',
-    'ox-eyed',
-    'ox-hide',
-    'ox10',
-    'ox11',
-    'ox141sa',
-    'ox16',
     'ox4',
-    'oxaal',
-    'oxaid',
-    'oxaids',
-    'oxalate',
-    'oxals',
-    'oxbox',
-    'oxelosund',
-    'oxenbury',
-    'oxendale',
-    'oxes',
-    'oxford\'',
-    'oxford/results',
-    'oxfordhsire',
-    'oxfordshiree',
-    'oxidatively',
     'oxide-coated',
-    'oxide-copper',
-    'oxidizable',
-    'oxidoreductase',
-    'oxime',
-    'oxleys',
-    'oxlips',
-    'oxman/volunteer',
-    'oxoacids',
-    'oxoanions',
-    'oxolinic',
-    'oxonanions',
-    'oxpens',
-    'oxters',
-    'oxx',
-    'oxyanion',
     'oxyanions',
-    'oxydol',
-    'oxygen-depleted',
-    'oxygen-derived',
-    'oxygen-isotope',
-    'oxygen-poor',
-    'oxygen.',
-    'oxyharmoglobin',
-    'oxyhydroxides',
-    'oxytocin-ergometrine',
-    'oxyuroids',
-    'oy_',
-    'oye-eboe',
-    'oyl',
-    'oyseaux',
-    'oz/&frac12',
     'oz/&frac34',
-    'oz/180ml',
-    'oz/300ml',
-    'oz/500ml',
-    'ozalas',
-    'ozen',
-    'ozone-depletion',
-    'ozro',
-    'p&acirc;t&eacute;-en-cro&ucirc;te',
-    'p&acirc;te',
-    'p&acirc;tissiers',
-    'p&amp;cr',
-    'p&amp;r',
-    'p&auml;cht',
-    'p&auml;t&eacute',
-    'p&bsol;a',
     'p&eacute;ages',
-    'p&eacute;c',
-    'p&eacute;clet',
-    'p&eacute;cs',
-    'p&eacute;rez-l&oacute;pez',
-    'p&eacute;ri',
-    'p&gt;0.5',
-    'p&lcub;0.05)',
-    'p&le;0.05',
-    'p&lt;0.0000001',
-    'p&lt;0.0004',
-    'p&lt;0.007',
-    'p&lt;0.1',
-    'p&ndash;51d',
-    'p&pound;1',
-    'p&pound;12',
     'p&pound;200',
-    'p&pound;25',
-    'p&prime',
-    'p&rcaron&iacute;dol&iacute',
-    'p&rcaron;emyslid',
-    'p\'dayta-pie',
-    'p\'i-p\'i',
-    'p\'s&amp;q',
-    'p(5)',
-    'p(6)',
-    'p(7)',
-    'p(9)',
-    'p(b)',
-    'p-&lsqb;atp&rsqb',
-    'p-1',
-    'p-38s',
     'p-80',
-    'p-90s',
-    'p-anca/gs-ana',
-    'p-cas',
-    'p-dna',
-    'p-endlabelled',
-    'p-funky',
-    'p-gel',
-    'p-m',
-    'p-place',
-    'p-traps',
-    'p-type',
-    'p.106',
-    'p.114',
-    'p.119',
-    'p.121',
     'p.130',
-    'p.134',
-    'p.136',
-    'p.137',
-    'p.138',
-    'p.139',
-    'p.143',
-    'p.144',
-    'p.145',
-    'p.156',
-    'p.166',
-    'p.170',
-    'p.172',
-    'p.173',
-    'p.174',
-    'p.175',
     'p.181',
-    'p.184',
-    'p.185',
-    'p.186',
-    'p.187',
-    'p.189',
-    'p.192',
-    'p.193',
-    'p.194',
-    'p.195',
-    'p.198',
-    'p.203',
-    'p.205',
-    'p.207',
-    'p.213',
-    'p.214',
     'p.217',
-    'p.234',
-    'p.240',
-    'p.241',
-    'p.245',
-    'p.252',
-    'p.270',
-    'p.272',
-    'p.275',
-    'p.282',
-    'p.309',
-    'p.312',
-    'p.313',
-    'p.340',
-    'p.367',
-    'p.370',
     'p.37165',
-    'p.372',
-    'p.37220',
-    'p.387',
-    'p.389',
-    'p.427',
-    'p.48',
-    'p.480',
-    'p.545',
-    'p.727',
-    'p.75',
-    'p.76',
-    'p.78',
-    'p.84',
-    'p.90',
-    'p.97',
     'p.a.l.s.',
-    'p.b.h.',
-    'p.c.c.',
-    'p.c.van',
-    'p.e.m.',
-    'p.l.o.',
-    'p.p.m.v.',
-    'p.p.t.v.',
-    'p.r',
-    'p.s.i',
-    'p.t.a.',
-    'p.t.s.',
-    'p.w',
-    'p.wms.',
-    'p/35/',
-    'p/37/',
     'p/k',
-    'p/r/d',
-    'p/t',
-    'p005c',
-    'p1(&formula)',
-    'p1*/lp3',
-    'p1/lp1',
-    'p1/t1&ndash;t4',
-    'p1/t5',
-    'p100/creb',
-    'p1003.1',
-    'p1003.4a',
-    'p100s',
-    'p102b',
-    'p102c',
-    'p102l',
     'p109',
-    'p113',
-    'p117b',
-    'p120',
-    'p145',
-    'p153',
-    'p17/',
-    'p188',
-    'p1s',
-    'p2\'s',
-    'p2/lp1',
-    'p2/t7',
-    'p2/t8',
-    'p202',
-    'p249',
-    'p24c',
     'p261',
-    'p264',
-    'p29/',
-    'p2p',
-    'p32/',
-    'p3731',
-    'p3978',
-    'p3a/p4',
-    'p4/p5',
-    'p4/t1.1',
-    'p4/t2.1',
-    'p4/t2.2',
-    'p418',
-    'p460',
-    'p49',
-    'p5-based',
     'p50/',
-    'p58.1',
-    'p585.4',
-    'p59',
-    'p5s',
-    'p6&ndash;7',
-    'p625',
-    'p65',
-    'p66',
-    'p7.1',
-    'p73',
-    'p753',
-    'p77/',
-    'p775',
-    'p785',
-    'p84',
     'p85/',
-    'p86',
-    'p9/',
-    'p92',
-    'p93',
-    'p944',
-    'p98',
-    'p=0',
-    'p=0.0003',
-    'p=0.0148',
-    'p=0.021',
-    'p=0.022',
-    'p=0.024',
-    'p=0.026',
-    'p=0.028',
-    'p=0.029',
     'p=0.035',
-    'p=0.0436',
-    'p=0.048',
-    'p=0.075',
-    'p=0.106',
-    'p=0.17',
-    'p=0.18',
-    'p=0.38',
-    'p=0.5263',
-    'p=0.6',
-    'p=0.76',
-    'p=0.78',
-    'p=0.8',
-    'p=0.8524',
-    'p=0.9',
-    'p=1.00',
     'p_',
-    'pa&deg',
-    'pa&ndash;18',
-    'pa&rcaron&iacute&zcaron;sk&aacute',
-    'pa\'il',
-    'pa-28s',
-    'pa-oct-2',
-    'pa01l',
-    'pa05s',
-    'pa103',
-    'pa15',
-    'pa34',
-    'pac-a-pet',
-    'pac2',
-    'pac8',
-    'pacas',
     'pace.',
-    'pace/macgill',
-    'pacey/chief',
-    'pacey/gloucestershire',
-    'pacific-based',
-    'pacific-rim',
-    'pacific/western',
-    'pacificas',
-    'pack-horsed',
-    'pack-hunting',
-    'pack-mules',
-    'pack/peck',
-    'packagable',
-    'package-dyeing',
-    'packages/products',
-    'packaging-film',
     'packdrill',
-    'packed-out',
-    'packet-switch',
-    'packies',
-    'packquet',
-    'pacotilles',
-    'pacque',
-    'pacus',
-    'pacuvius',
-    'pacy-sur-eure',
-    'pacym1',
-    'padana',
-    'padc',
-    'paddan-aram',
-    'paddison',
-    'paddlesworth',
     'paderanga',
-    'padina',
-    'padmanabha',
-    'paduasoy',
-    'paduca',
-    'paduka',
-    'paeca',
-    'paedomorphosis',
-    'paeonia',
-    'paffard',
-    'pag',
-    'pagan-dominated',
-    'page&lsqb;s&rsqb',
-    'page(s)',
-    'page-one',
-    'page-ready',
     'page-turners',
-    'pagean',
-    'pageboys',
-    'pagei',
-    'pageperfect',
-    'pagerie',
-    'pages.',
-    'pages/year',
-    'paget-gorman',
-    'pagewood',
-    'pagham/selsey',
-    'pagnall',
-    'pagoda-style',
-    'pags',
-    'pahrmacist',
-    'pai-1',
     'paid-off',
-    'paigns',
-    'pain-',
-    'pain-maddened',
-    'pain-racked',
-    'pain-wracked',
-    'painful-sounding',
-    'paint-brushes',
-    'paint-flecked',
-    'paint-stiffened',
-    'paint-streaked',
-    'paint.',
-    'painted-on',
-    'painter-stainer',
-    'paintin',
-    'painting/daughter',
     'painting/installation',
-    'paintpot',
-    'paintpots',
-    'paintshop',
-    'paintsticks',
-    'pairing-up',
-    'paisley-pattern',
-    'paisley-patterned',
-    'pajaczkowska',
-    'pajamas',
-    'pajtim',
-    'pakes',
-    'pakistan-controlled',
-    'pakistani-controlled',
-    'pakistani/bangladeshi',
-    'pakkie',
     'pakora',
-    'paks',
-    'pakshaya',
-    'pakula',
-    'palace1',
-    'palaeo-anthropology',
-    'palaeobotanist',
-    'palaeocarpilius',
-    'palaeochannels',
-    'palaeoclimatology',
-    'palaeogeographic',
-    'palaeographers',
-    'palaeoscolecidans',
-    'palaeotology',
-    'palaeozic',
-    'palaiokrassas',
     'palanca',
-    'palas',
-    'palastplatz',
-    'palatably',
-    'palatals',
-    'palatization',
-    'palauan',
-    'palauskas',
-    'palazzola',
-    'palce',
-    'pale-fawn',
-    'paleatus',
-    'palecio',
-    'paleface',
-    'palencia',
-    'palenque',
     'paleo-christian',
-    'paleocene',
-    'palernian',
-    'palestinans',
-    'palfalvi',
-    'palffy',
-    'palframan',
-    'palheiro',
-    'palilalia',
-    'palindromes',
-    'palisaded',
-    'palizs/szabo',
-    'palladino',
-    'pallants',
-    'pallasades',
-    'pallasii',
     'palle',
-    'paller',
-    'palletwood',
-    'pallia',
-    'pallidly',
-    'pallingham',
-    'pallisade',
-    'pallyster',
-    'palm-dotted',
-    'palm-leaves',
-    'palm-studded',
-    'palmata',
-    'palmaz',
-    'palmdale',
-    'palmer-tomkinson',
-    'palmero',
     'palmettos',
-    'palmgrease',
-    'palmiers',
-    'palmoti&cacute',
-    'palmtrees',
-    'palmyrene',
-    'palolo',
-    'palombe',
-    'palpability',
-    'palpates',
-    'palpitation',
-    'palsgrave',
-    'paltriness',
-    'palu',
-    'palud',
-    'pamala',
     'pamela.',
-    'pamidronate.',
-    'pamington',
-    'pammakaristos',
-    'pammie',
-    'pamphagus',
-    'pamphili',
-    'pamphill',
-    'pamsons',
-    'pan-',
-    'pan-authority',
-    'pan-cultural',
-    'pan-eastern',
-    'pan-germanic',
-    'pan-handle',
-    'pan-london',
     'pan-scottish',
-    'pan-stick',
-    'panacom',
-    'panadols',
-    'panagiotis',
-    'panaji',
-    'panakton',
-    'panam&aacute',
-    'panamericana',
-    'panatta',
-    'pancrease',
-    'pancreaticotrophical',
-    'pancreatogram',
-    'pancreatotoxicity',
-    'pand',
-    'pandanaceae',
     'pandean',
-    'pandelani',
-    'pandov',
-    'paneled',
-    'panelist',
-    'panellings',
-    'panels.',
-    'panemone',
-    'panessar',
-    'panfida',
-    'panful',
-    'pangalangan',
-    'pangamic',
-    'panganic',
-    'pangasius',
-    'pangea',
     'pangenetic',
-    'panhandler',
-    'pani&cacute',
-    'panic-',
-    'panicum',
-    'panisher',
-    'panjandrums',
-    'panlobular',
-    'pannekoek',
-    'pannett',
-    'panningridge',
-    'panpipes',
-    'panpra',
-    'pansa',
-    'panslav',
-    'pantagruel',
     'pantaleone',
-    'pantanassa',
-    'panter',
-    'pantheons',
-    'panther-like',
-    'pantherion',
-    'panthrax',
-    'panting.',
-    'pantings',
-    'pantites',
-    'pantoland',
-    'pantomine',
-    'pantydwr',
-    'pantzer',
-    'panyukov',
-    'panzetta',
     'paoletti',
-    'papalists',
-    'paparizov',
-    'papaveretum',
-    'papay',
-    'papayas',
-    'papegaaij',
-    'paper-boy',
-    'paper-cutter',
-    'paper-dry',
-    'paper-games',
-    'paper-the',
-    'paper-wrapped',
-    'papers/year',
-    'paphiopedilum',
-    'papiere',
     'papiers',
-    'papiliochromis',
-    'papillae.',
-    'papillas',
-    'papillomas',
-    'papillons',
-    'papon',
-    'papooses',
-    'pappajohn',
-    'papps',
-    'paprott&eacute',
-    'papua-a',
-    'papua-b',
-    'papua-new',
-    'papwoth',
-    'papyras',
     'papyrifera',
-    'para&gt',
-    'para-clinical',
-    'para-legal',
-    'para-normal',
-    'para-professionals',
-    'para-relations',
-    'para.3.3',
-    'para.4.24',
-    'para.professional',
-    'parable-like',
-    'parablennius',
-    'parachute-trained',
-    'paraclinical',
-    'paradisaea',
-    'paradise.',
     'paradisiac',
-    'paradisiaca',
-    'paradoxides',
-    'paradoxus',
-    'paraesthesiae',
-    'parafauna',
-    'paraglossae',
-    'paraguayans',
-    'parajournalism',
-    'parajournalistic',
-    'parakou',
-    'paralegals',
-    'parallel-cousin',
-    'parallel-enabled',
-    'parallel-processor',
-    'parallelized',
     'paralysingly',
-    'paralytico',
-    'paralyze',
-    'paramixa',
-    'paramyxovirus',
-    'paranoiacs',
-    'paranotal',
-    'paraphenalia',
-    'paraphimosis',
-    'paraplast',
-    'paraplegia',
-    'parasagittal',
-    'parasailing',
-    'parasiticus',
-    'parasitodiplogaster',
-    'parasitophorous',
     'parataxonomists',
-    'parathas',
-    'parati',
-    'parauchenoglanis',
-    'paravariceal',
-    'paraven',
-    'paraxylene',
-    'parboiling',
-    'parcelization',
-    'parchamo',
-    'parchment-coloured',
-    'parchment-shaded',
-    'pardah',
-    'pardners',
-    'pardubice',
-    'parek',
     'parent-link',
-    'parent-type',
-    'parent/daughter',
-    'parents/guardians',
-    'parera',
-    'paresce',
-    'pareto-inefficient',
-    'pareto-relevant',
-    'pareto-superior',
-    'parfumerie',
-    'pargesa',
-    'pargeting',
-    'pariage',
-    'parick',
-    'paring-down',
-    'paris-bonn',
     'paris-club',
-    'paris-lyons',
-    'paris-madrid',
-    'parisio',
-    'park9',
-    'parke-davis',
-    'parkend/gloucestershire',
-    'parkent',
-    'parkerknoll',
-    'parking-tokens',
-    'parkses',
-    'parkville',
-    'parkways',
-    'parkwern',
-    'parl',
-    'parl&eacute',
     'parlagi',
-    'parlane-moore',
-    'parlato',
-    'parliament\'',
-    'parliamentarily',
-    'parlimen',
-    'parlo',
-    'parlty.',
-    'parochiality',
-    'parodia',
-    'parodically',
-    'parodistic',
-    'paronymic',
-    'parotids',
-    'parp',
-    'parracombe',
     'parral',
-    'parrenin',
-    'parrhesia',
-    'parricides',
-    'parring',
-    'parrino',
-    'parrishes',
-    'parrotia',
-    'parshin',
-    'part-books',
-    'part-ex',
-    'part-live',
-    'part-music',
-    'part-numbers',
-    'part-objects',
-    'part-own',
     'part-owners',
-    'part-ownership',
-    'part_of',
-    'partcularly',
-    'partd',
-    'partenkirchen',
-    'partenrship',
-    'partership',
-    'parthenay',
-    'parthenogenesis/incompatibility',
-    'partial2',
-    'partialise',
-    'partially-clothed',
-    'partially-hearing',
-    'particle-antiparticle',
-    'particle-beam',
     'particle-like',
-    'particoloured',
-    'particpants',
-    'particually',
-    'particula',
-    'particularisation',
-    'particularise',
-    'particularize',
-    'partidos',
-    'partija',
-    'partir',
-    'partis',
-    'partisanship.',
-    'partitive',
-    'partlett',
-    'partly-exempt',
     'partner-less',
-    'partnership-based',
-    'partridge.',
-    'parts-makers',
-    'parts-per-million',
-    'partwork',
-    'party-appointed',
-    'party-approved',
-    'party-association',
-    'party-democratic',
-    'party-giver',
-    'party-line',
-    'party-members',
-    'party-trick',
-    'party.the',
-    'party/tuc',
     'party1',
-    'partys',
-    'parviz',
-    'parvum',
-    'parysatis',
-    'pas-',
-    'pasachoff',
-    'pasajes',
-    'pasanen',
-    'pasason',
-    'pascalsource',
-    'paschalides',
-    'paschendale',
-    'pashes',
-    'pasiano',
-    'pasik',
     'paskar',
-    'paskins',
-    'pasoc',
-    'pass&egrave',
-    'pass-door',
-    'passage(s)',
-    'passage-grave',
-    'passaged',
-    'passarotti',
-    'passementerie',
-    'passenger-kilometres',
-    'passenger.',
-    'passengers.',
-    'passingly',
-    'passion-flower',
-    'passion-killers',
     'passionate-feeling',
-    'passionlessness',
-    'password(s)',
-    'password/verification',
-    'past-masters',
-    'pasta/bean',
-    'pastellists',
-    'pasteur-lille',
-    'pasticheur',
-    'pastie',
-    'pastings',
-    'pastorali',
-    'pastored',
-    'pastry-cooks',
-    'pastry.',
-    'pastrycook',
     'paszti',
-    'pata',
-    'pataca',
-    'patan&eacute',
-    'patar',
-    'patarenes',
-    'patarescu',
-    'patarini',
-    'patashoqua',
-    'patch-clamp',
-    'patch-over',
-    'patchen',
-    'patel/live',
-    'patel/oxford',
-    'patens',
-    'paternalists',
     'patha',
-    'pathak',
-    'pathana',
-    'pathetic.',
-    'pathetical',
-    'pathographic',
-    'pathotyping',
-    'pathy',
-    'patiashvili',
-    'patient/doctor',
-    'patient/nurse',
-    'patientswith',
-    'patietal',
-    'patima',
-    'patio.',
-    'patley',
     'patois.',
-    'patong',
-    'patons',
-    'patou/british',
-    'patriarca',
-    'patriarchial',
-    'patricide',
-    'patriciu',
-    'patrick/chief',
-    'patricroft',
-    'patrimonies',
-    'patrimonio',
-    'patriote',
-    'patriots-social',
-    'patristics',
-    'patron-in-chief',
     'patronisation',
-    'patronym',
-    'patscentre',
-    'patt',
-    'pattar',
-    'patten/dunn',
-    'patten/lawley',
-    'pattenmakers',
-    'patterings',
-    'pattern-recognizing',
-    'pattern-searching',
-    'pattishall',
-    'pattrick',
-    'patzak',
-    'patzschke',
-    'paul\'s',
     'paul\'s-without-the-walls',
-    'pauldrons',
-    'paulet',
-    'paulhan',
-    'paulista',
-    'pauncefoot',
+)
+
+blocks_38 = (
+    '%-in-the-castle$\'/sister$$bank$%field$%inski##zia%+pan-covered$!o""sa$$hisa$"ko$"mi$!n$%yoshi%#uki',
+    '#&cherin%)otrometer$&ulines(%ising*!m)&zation\'"st#)efieldian$!k%#ela$$mola#$hair%!r$$elle%#ter',
+    '$#taq#$inga#,kell/swindon%"rs$(ing-tape$$like#%lanka%$rova#%onary#$quer#+s&eacute;na$&-based%,inclusionary%*membership&(ovements',
+    '%-spectrometric$#860$$alas%%rella$)ification%!m%"no%-vely-parallel$\'tormind#&t-high%$like$(/furling$!a$)er-bowman(&uilder',
+    '\'#key\'%level&$core&%plans&\'s-swiss\'&trokes&&weaver$$iles$$rick%(oantonio""t\'#1a&ccaron;i&cacute$&bolism$%gorda$$nzas',
+    '$%razzo%!i%!o%$rese#+ch-boarding&#fit%(boarding%,ed-dependent&"s.%&finder%&ing-up%&lessly%$pots#*e-guarding$"ev',
+    '%"ne$$less$"re%"na&%ities$"y.#,hematization$$ison$#uru##ica$"ly$"na#$lack#$ooke#*ra-marconi',
+    '$$igel%%monie%)x-derived\')isolation\'$type$#ona#(shushita$\'on/cpre$#uyo#\'t-black%(finished$\'er_what$)h&auml;us%$euer&(ws/uncle',
+    '$#ias%$nson%"ya$!o$%ress.$"us#$unta$)re/stable%*ity-volume$&sadona"\'uberges%#uge#%chlen#"ds#%frais',
+    '#$ldon$"es#&ndered$$gdaw$#oir#\'pertuis#$rine$)oy-jospin#$sner#%vaise$&e-blue&%white%!y$#ish#+z&egrave;re',
+    '$#syn#&isbank##rud#"ua"#wer"%x-dna$#max$$neef$&planck$(terminal#/concurrentusers#)i-dowment$$crop$$mand%%isers',
+    '#$mara$%ilian#*well-style\'!."+y&mdash;see$(ndash;13*"20+!4+!7*"30##\'92##-19$!2%!0$"31',
+    '$!5$&august$)september#%/july#\'belline#$comb##dan%"ys#%ekiso$,r/thamesdown$"st$$wski##lam%#nds##man',
+    '$"ck$%razgo%"es#)r-harting#$ston"!z#$agon$*r-e-sharif$&wattee#%eltov$"no$!t#!o$!h$!n',
+    '$"ui#%umdar#%zolla%"ni!&b86931&!3"#aga#$ndla""cs""dc"#ela#"ni#!r""fr"0ikusita-lewanika',
+    '"$ombo#"ui"#t80",us-to-vmebus"*yte/second!"c2"&adorey#$ffee&!r\'"ty#$llen$$onen$-pine/objector#,neney/school#$slan',
+    '#\'ughtrie(!y"%baine#$laid#&rearty$$ides&"ge"/cabe/consultant$#ghy$$hill$$ldin%$liog$$mmon$$rdie&"le',
+    '%%rigan%$thys$$thie$\'ughrean%#lay#%gwire#(lanachan&!e%$rens$$eery%#non$#ory#%ombie&!s%#ish',
+    '%*nell-ginet)\'/father*&mother&"on%#omy$%rkell%#mac$%ubrey##raw$$eary%#die%#edy&"sh%$ight$"ie',
+    '&$rick$%udden%#gan#%uaigs$$llan&#ock\'"gh\'!h&"um&!y$&miskey$$rbin%!e"(dermotts#%onell',
+    '"\'eachern#\'lhinney#$nery$$roes##win"%fague$#lls$5rlane/gloucestershire#"ee%#ley$\'ttridge#"ie"\'garrett##ear$-ough/managing',
+    '#%illis$#ver#&lashen%&ughlin$"ew$#ory##oay$\'ldricks$&nagles#$rail%"ne&!n%$ttan$$eavy%$gors',
+    '$&indles#\'uckians$#ile%$nnis%#re.$$rran"#h53#%attie#$enry#"oy")ilchenich#$niff#$saac"$jobs"%keith',
+    '$+nna/glasgow&"on$"on#7inley/osteoarcheologist%$seys$\'tterick"&laglen$)rdy-smith%\'en-ford%#non$\'uchlane##eay$#man#!n#%ugash',
+    '"&mahons$"in$$nnus#%eekan#(innville#%orran&"is#%urtie"3namara/anti-hunting$$rney$!y##eal$#ese$#mar#%icoll',
+    '#%ought#$ully"$p-01#&arland#-hee/traveller"%quoid"+rae/british$$ndal#%eddie%$mond#%obert$#wen"&seveny#&hannon$$erry',
+    '#&porran#\'wiggans",t-dp/mct-adr#&avitty##eer$$rnan"!u"#vea#%ittie#!s"\'whinnie%"rr"!z!$d-87"#100',
+    '""83"#esk#!t"%p-mdu!*e-firstism#*generation"#110#!2#!4#!5"!5"!6"+ad/director$\'owcroft&$gate',
+    '&!y#!e##lie$%ybugs#&n-eyed%\'hearted$"es&)t-looking$&ing(s)\'\'-effect(&makers()relations$&s/ends$$wile##ple',
+    '#$sley$"ur&"ex&$ing.)"ly#-t-and-draught%%based%$free%$hook)!s$\'packers##zza"%bmt-1##son"\'ch-tool',
+    '$)anicsburg\'"st)+ic-mystical)!s$#ili$%rolab#*istocirrus#"ke$0lenburg-schwerin"&d.l.r.#!a$%illes$!k$(l-winner$#voy',
+    '#%calfe$#ial#$dles#"ee$#led$$ousa$!r$$sano$!x##gar#"hi$)urst/coal#-ia&amp;values%)-assisted&)dominated',
+    '&&worthy%\'/manula%%crats%(evalists%-th&egrave;que&#ore%&vision$,cal-research\'1/gastroenterology%"in\'#als\'%e-man(!r$\'nacelli&!h',
+    '$"sm$\'tacions$(um-brown\')dark-grey(#uty\'$grey\'#hot\'%price\'\'quality\'$rare\'&secure,#ity&&.sized&#ism$%wipes',
+    '#$land$#eys$$icot$"ow##ula##wyn#%zamor"%echie#"hl#)k-looking$"er$"le#)n/weather$"ey$!y',
+    '#%rburg$"za#,t-the-people%"up$%/meat$(ing-room,!s\'(/contact\'"s."\'g-voice#"a-%#bid\'!g%"cd%%drive',
+    '%&models%(projects%%stars$%bases&#zos$&cities$%death$)karyocyte-!s$&lanium%,ith-builders%(opolitan$\'mergers$$rity$(vitamins',
+    '#$ohms$&lithic#$rims#$uire"(harensin#%medov#%rauli$#dad"#ien$(r-graefe##fod##gle#"js##nam$$dert',
+    '#*rion-jones\'!a\'#ydd$&okusha#"sl$&sonier$\'terwork#$xner"#kes"#lab$#mid%#pus$#nau#$cher%&isedek',
+    '#%drick##ees$!u#&garejo$$ueil#&iorist$%ponid$$ssas#%litic$(omossens$!s#%motte#,nibon&eacute#*odiousness%*y-and-bass',
+    '$&n-like&%sized%#oma#(rosegate#*t&eacute;m$%-spun$"er$(ing-pots#$vich%(lle-hill)$ross"#max#/ber-governments$,rane-covered(!/',
+    '#+e-complexes$$bers#"ic#"mo#%ofile$(ir-novel$&rable.&%ndum.%&ialist)"ze\'!m&#ses&#zes%(y-hungry\')intensive',
+    '\'%lapse#*phis-style&"te"-n&eacute;ndez#)\'s/junior#(-friends#&/women#&abilly%#rea$%dione$(quinones#*d&egrave;s$%elien$#ine$%ocino',
+    '$%mismo\'!t#\'lungste#"ni#(olascina#%schen$!i$"on$$trie&%uates\'"um$\'uration#-tal-emotional&!e%#wai',
+    '$&orship$"re$"um#\'u-based$"ra&!s$!t"#ouw"#pps#%stead"%rafhe$#nti#$bury#"c.$)antilists',
+    '%"ts&"us$!e%*r/chairman&$ized$(handised\'\'t-ivory(#ers&$unte%"t.$(ifulness$$urey&"io&"y-(\'transit',
+    '#%edeen%)ith-hardy(&/lorry)&thames$"te%+riciousness#"ga%!s$(enthaler#%ialdo$)ngue-like%"os$$stem$&tocrat%"s.',
+    '$%ister$#mal$$ulov##lay$!i##men#"oe$!n%!i%"ym#)rel-lynch%"ts&\'t/rspca%!y$+iam-webster',
+    '%#dew&#own%$thew%\'weather$(y-making%$chef#!s$#eys&$view$"ha$"in$$tone#%ttens##ula%#ite',
+    '$!y#%zario")sa/boogie$%toshi#$clun#+demoiselles##fet#(huggeneh#&langes#*merisingly\'"ze)!s#%ocarp$&limbic$\'morphic',
+    '$\'thermal%#ron#%quita#&s-mate$+ageroutines%"li%$oria&"ud$%ed-up%)nger/hemp&$ians%6rschmitt-boelkow-blohm$&ianism$%kirch$#ori',
+    '%!r&!s$)nichestvo#)ur&eacute"#t51#,a-anthracite%\'sources%+theoretical$\'basalts%&olical(#sms$*contextual%(riticism$!e$\'fiction',
+    '$&l-clad&%frame&%lined&&plated&$rich&(sheathed%%epses%(lic-blue)(coloured\'#sed%%wares&$orks$*narratives$#pan%$onto',
+    '%,sychological$$reum%&hizium$(stasised$&tarsal%%hesis$(volcanic#$ella$#ora#"h.$(acholine%%nolic$(eringham$#lan$)od-acting',
+    '&(ologists%!t$,uen-campbell$.yl-d-aspartate&$ates($ions&\'benzene&)phenidate\'+rednisolone&)xanthines#$land#%odije$$ikoi\'!s$,pe-sculpture',
+    '&$wide%#age%(s/minute$+ic-imperial$%ocomm%%liner&$ogia)#cal%)nomically%%poles(+itanization*$ical#$sieh"%uland$%broek',
+    '#$rtre#!x")val11(co)""we$"tt#\'s/rspca$$ford$$lade"&xicali&\'n-style\'$ness\'"um(!s%$o-us##ted',
+    '##ric$%owitz""ze$$reum#%iriac#(locillin#&z\'arie$$etti!*fanasibili""ds"%m/rll"$unjo"!v!"g%"(&times;3',
+    '""/1#!d#/kg+indomethacin%#/24#"l.##nil"#104""bs"#cl2""ms"#rv8"!y!"h1""24#!7',
+    '"(aighdean"#c-a$!b")eadhonach"#l4s"#m23""ra"$uaih!.i-rio-fil-loom"#486"!9""b2#"bs#!s"%cafil',
+    '#*e-children#+h&eacute;al&\'grave;e$\'aelides%"il$&eletti&%grove&%mersh&%sberg%#tti$%ihiko##kle&%burgh%"in##ras',
+    '&%chips\'*irculation\'\'limates\'\'ontexts\'\'rystals&\'ecology\'\'mulsion&%fiche&\'history&*investment&*management&)nutrients&\'organic&\'process-#ors',
+    '((volution\'\'obotics&\'seconds\'%ocial&(teaching&%world%)adenomata&)erophilic&$lgae&)spiration\'#say%-be-associated&#ist&*ombardment&(reweries',
+    '%+calorimeter\'&ssette&\'ellular&\'limates+"ic&%occus&&rystal,!s&&ytosis%)deletions&)issection&"oc\'!n&#rop%+equivalents',
+    '%\'fibrils\'#eld\'%laria\'"ne&\'loppies(#ras%*grams/cu.m($phic%%henry&(ierarchy%&inject+#ion%(lighting&%ouvre%\'machine',
+    '&-eteorological&$odel*#ler\'%saics%\'nesians\',utralisation&$ised%0palaeontological\'*rticulated&&hysics*%ology&#ore&%robes(&cesses("of',
+    '&$oute%*seismicity\')ntinel/ux&\'ieverts&*oft-backed**compatible\'#mes\'$rium&(parc-iii\'/ectrophotometer4#ric\'\'oridian,$osis&*timulation\'(ructural',
+    '\'!l\'"st&\'onality&&richia&#ube%%value&%essel+!s&(iscosity%\'wavable(\'e-proof*$safe&#ear"(d&dollar$*rehy;1970s',
+    '#&-1330s%$570s%$620s&#70s%$760s&#90s%#861%$900s&"30\'!9&"43\'!6&"50\'!2&"61',
+    '$$21st$$430s$"60%#30s%#60s$$730s$#90s$&action%%frica%&merica$$back%+edfordshire$(campaign%%entre%(hildhood',
+    '&%untry\'"rt%%raven$$dive%#own$$face%#lat$$game%\'eorgian%$rade$&heaven$(infrared%#ron$&layers%#eap',
+    '$%meiji$%night&&neteen$+oesophageal$%pitch%%oints$$rabi%(ecession$(scotland%"et%$hade\'$wwal%#ong%#pan%%torey',
+    '&#ing$$teen&!l&#nth&&rraced%1hirteenth-century%$oned%$rial($ssic%%yrone$%wives$%years#"an#$band$#ody',
+    '$*le-fifties\'%horns\'$late\'&minded\',of-the-night.\'roaders\'&period\'$rank+"ed\'&weight&&/upper&#bay\'#urg&$fell&\'manship',
+    '&(sbrough.-%based)$pugh&*ton-on-sea)+in-teesdale)!s&$wick&$yard%!y#&field/(#man$#oot#$game$#ely%$tmen',
+    '#"ha$#ope#\'i-dress#)land/east#&market#&napore#\'portion#&radial#%shaft$$omer#%table$$ones%)wn-payson#$year"#edz',
+    '#"re%!s$"le#&ttinen"!f#+sud-bonnici"%g-29s#!h$"te#$ombo#)rationary$%olifs#$uels%!z"$hail',
+    '$"ra##nea#!o#!r"#ike"+kailichenko#&hailov)#sky##key$!i$#ola$&yphone#0ol&aacute&scaron##veh"#lab',
+    '$$repa#$brun$,urn/freefall\'$gate#\'chester##d=1$,ew-resistant&!s#)entijevic$(s/oxford%"ki$$wski$!y#/ford/co-founder##ion',
+    '&#nce&$ries\',y-controlled)%grade)(inspired)\'looking)&minded)\'related))strategic#(k-crates%%house%)producing%&yields$+/newspapers$%float',
+    '&#ess$"si%"op\'$ping%$tone#*l&aacute;n$%-type%$yuns$%aires%$mant%*r/scottish&#det&"es$%bourn%\'urngate',
+    '%&narial&\'nia-old%%rgate%$voye$%iardi%#bar%"dh%$gals%-metre-perfect)"ic%.ner/dressmaker%&on-odd((year-old$#ner$!o',
+    '$#son$#way$-y-molly-mandy#%manda#*ne-redhead%$rian$#row#$onas$!r$.srdn&yacute;ch#+pitas-based#$some%!n$$tead#/ton/oxfordshire',
+    '%"pe##uji"&magree#$imum$$ning#$osas#%priss##tec"3n&ndash;exhibitions#$/100$$maj7#\'a-khani$#han$"ya#\'ce-beef',
+    '$!u#+d-blowingly)!n%+independent%\'readers%*shattering%%wiped$$edly%-rheitskirchen$#in\'$.less/senseless$#olo$%power$%storm%%zenty',
+    '#*e-clearing%&owners%\'sweeper$$olas$$ral-($melt\'"ia%"ve&#ino$\'working+!s#$gary$"fu$$ione$\'relians',
+    '#,i&egrave;res$%-bars\'%ttles&(reakdown%&ceptor&\'harters&%inema&%ruise%\'finding&#rac%#gym%)hollywood%$jmcs%#lab&\'ectures',
+    '\'&rathon&&eadows\'$ntal&#ill%\'printer\'(oduction(%jects%-retrospective&$iots%)statement&%witch%)townships%$udcs%\'weapons&$orld',
+    '\'&tridge&&ssette$%dress$$eres$#fie%)reighters%&undium$%maker&$lise%\'um-code$*o-paluello$&s-type%%eries%\'tepping\'*r-director',
+    ')%to-be(%ships&#res\'!o%%upers$!t%!a$"um#$jung#)k-trimmed#&nelied%%tonka&!t$"ih$\'ow-like',
+    '$\'martani$#r-e&%party%&/major%#can%$ites\'*y-interest$!t%$iere%"to#%shall#&t-like%#new%\'scented$"ex',
+    '#\'uscules$\'te-long&!.&&s-left%#ier#%yanim"\'ocencia#!u"*r&oacute;s#%abile$+cle-madness(\'workers$$glia\'!o$$hmad',
+    '$"ni##dha#"et#%ghani##ian$#cle#"ka#"na#%oslow$!v#"ra$)or-smooth&%/manx&"s.#!s',
+    '#"us#!v#%zapur%%yanov"3s&ndash;perceptions#+-adaptation$*classifies$)diagnosis$+information$$kick$\'matches$.representation$*statements##ael$\'ligning',
+    '$\'nthrope+!s$\'pplying&(reciated$*rticulated$*ttribution#(behavin\'#+calculating$+hief-makers\'%vious$)ibilities$.lassifications$-ommunications%$pied#,declarations',
+    '$)irections##ell$(rabilism\'*le-looking(#ism%#den(0/gloucestershire#*guidedness#&handle$"ev$&igdorj$$naic%#ish$"ut#(identify',
+    '#&locate#\'placing$&rision%)onouncing#!r$.epresentation.#%s-ing$+ile-jamming((throwing%!n%-on-orientated$,pecification#%take.\'"n.$#ier',
+    '$&letoes$#old$+ranslations&!s$#ura",t-originated##alk#8cheldean/gloucestershire\'\'l-innes($/raf\'%stown#(hramycin#*ochondrion#&rovica#&suhiro',
+    '##tal$"el&\'-europa"$u/ml".xed-experience&&manned\'%otive&(sequence\'%ignal&\'traffic"&yajima$%shita#"eh#$oshi"$zell',
+    '##ler##nah#%rahi.##yan!*j&oslash;s"!c"!i"!y!%k-801""18""3a"!8#"86"!a!0l&amp;sup/minus1',
+    '"#/24#"90#&kg.min"$a144"#ikh#%naric""s+#&tp-psd!&m-wide"#.40"!/##100#!l"#111"!3',
+    '#!v"%ol/l.&$itre#!o""t8""wg!$n/fe"$3011"#age""cl""da#!o""ng""rs"!t',
+    '!)o&iuml;se"#-jo"!2"%abias%#tes#!h#!i#%lrish#%nings$"na#!r#$scar#$zzam"%bbers#$idip',
+    '&#ers&\'sations&\'zations"\'cassins##cas#$hrie#)k-cockney%\'disdain&*ocumentary%\'leather%+seriousness&(urrender%&tragic$%eries$(ing-bird',
+    '"%d/con#"ai$#lly#$ding#-el-determined&$like%%maker*!s$+rate/severe()ly-priced+%sized%!e%*n-language&$ism.)./postmodernism',
+    '$%stini("us&)ly-priced#.igliani-miller$"se%#hly#-s-and-rockers#$ugno$*le-details&$/end&5s&mdash;on&mdash;line;!/%-us-to-density$"pe"$elln',
+    '"/ffat/thamesdown"\'gadonic#(halsarai#"we#"yo"-h&eacute;lien+!n#\'ajerani$(mmedians(!s&"ud$"na%#das##eli#&iaaine',
+    '$!n#!l#(oly-nagy$\'rovicic##ram"%idore##lle#"ng$#ian#&seenko&!v$%senko$(t-palmed%!r%*ure-loving',
+    '%!y")jahadin-e%%eddin$!r##kom%#vac#"os##zer"&khiber#"po#%uleia"&larity##dau%!y#$eyns',
+    '$"ne$$rena#(l&eacute$%andia$%icone%%fiers$\'oy/east##omo$"ok#!t$#eno##wyn#+yneux-cribb"2mbasa&ndash;london#(egliture',
+    '$"ie##one#(tazuddin"/n&eacute;gasque#+/thurs/frid##agh$"ns$%rchos%!u$"sh%$tics#,biot/protest#(chegorsk&$nsey$#loa',
+    '$!y#,day-thursday((o-friday*(thursday$"ee$$ials#$etae&$rily%!h%%ising&&zation\'"ed$&y-bags\'%roker,!s',
+    '\'#orm&&losing&*management\'%inded&*orientated&\'winners%$.but%#man%%slane##gey$)ol-soviet&*ian-soviet&$oids%!n#&ifieth',
+    '%,oring/review*!s#"ja$!u#(kchester$)ey-eating\'%house\'$nuts&,/shakespeare$&seaton$$wood#$nier%"ot#&o-poly$\'/stereo',
+    '%+otyledonous%$ytic$)dialectal$&ecious%$noic$&gamist\'%ously$#han$#jit$*lithically%%ogion$)morphemic$&phasic&%thong%+lacophorans',
+    '%$sony$$skis%(tylistic$%tropy%&ypists#\'servate$&ignore$-ter-meh\'lindi\'#ous$"uy#(t&eacute$(-mercure%$roig%,saint-michel$&agnola',
+    '\'!i%+lv&aacute;n$%elius%$nero&$otte%$rchi&#eau&"os$%foort$"he%*ly-payment%)s&ndash;4&"-3&$.but$&icello',
+    '$%juich$,lu&ccedil;on&#con$%onero$+r&eacute;al%!e&(al-based$,s&eacute;gur#,umentalising#&zaemon"%ocher#!i#"ks#(minmamma#*n-bleached',
+    '$%dance%"og%%uster$"ee%(y-rivlin$$face$$lets$#set%%hadow&#oes\'"ts$&wailer#+re-brabazon&$gwyn&\'harness',
+    '%"nd%!y$$ford$%hurst$(ing-rope#!s$$tafa#%tland""pc#$head##pet#$tops",raine-dammed$"ke$"li',
+    '\'&ations\'"er$"ne&)-saulnier%"is%#non$#rji$!t%$alla$\'zanista#&b-like$"ey$$ific%&llinum(%virus',
+    '#%dants$"ex$%ovian#*e-balanced%#ish%$than$!.$&/fewer$%combe$$dton$$head$$land%"ia%$lian#"fe',
+    '$,enlandfahrer&&thaler%!x$#lum$"on%!r$#ues#\'inellus$%shita$$turi##kel%!n##lay$!e%*y-fletcher',
+    '#&myrids#*ning-break(!o\'&siders\'&thorpe#$olli$%ndava$\'te-gari$!z#.peth-newcastle$!h%1ine-3-glucuronide%+o-syntactic&$gens&*metrically',
+    '\'#ype&!u$&orkean#)ris-dance&\'/crisis\'$gulf\'&trauma&"ey&(s/bottle\'#eys#&sitans$"on$#ton#&talism&%lious',
+    '&#ium$&cloths$%enson%"um$%gage.(&/legal("e.$%ifies%-mer/wiltshire%#ser$#ley$&onhall&!s$"um#%ville',
+    '&!e"$sala#"by#%carda$$hion$#ova%&w-born\')dominated\'(oriented\'\'trained#!e$.lle-saar-ruwer#$giel#%hahid%!l',
+    '#%kenes$%ovsky##nal$"ey#(oeunyane#,quito-ridden#&s-like%$side%(troopers$%/navy$!a$"on#(t-quoted%,talked-about$&/least',
+    '$*eck&aacute%"st$"in$$ovoi"$taki$#ung#"ed#$h-er%$hung%(infested$%eaten%+r&rehy;hood&"\'s&!-\'%board',
+    '\'"in\'$life\'\'tongues&1/artist/housewife\'$calf($hild\'&father\'+grandmother&%lands\'%iness\')y-looking&$ship$%wings$!y#%i-rib',
+    '$*onlessness##ler#\'obility$)r-control&(launches&%mower&(scooters&\'vehicle%$able%\'bicycle&$ooks%%cross%"en\'$werk+!e',
+    '%&sickle%+way-induced#"ru#$tard#%uhake#!z"%u-mou#$amba#$bray#$diki#%fflon#!g$#eot$#ins#%htare',
+    '%!.%&boards%&iwarps$#ins$$mein$$sham$$tons$"vi$!y#%mouni#$nboy$%table&"ga&)in-ringed($land',
+    '(!y&#nts%\'battens%%cliff%%fords%$gain%&sandel%$wich&#ood#%phtys##rin#%scron$\'e-brown&%eared&&pounce',
+    '%%holes%$like&#oft$#ley$%sakas%"ey$$tafa%%erian$\'y-brown&\'looking#(th-parts%%guard#\'vements"+ve-for-move$%mente',
+    '%%stars$%ng-on#$shon"&wforth#$ings#"ra#&thorpe"#xen##hay#(ibustion#)on-browne"%yalla&"on##nes#&obamba',
+    '"\'zambiki\'$quan$%rabic##ley#"os$"te!-p/agriculture$$rmed#&deputy#*employment$)nviroment#&oxford#&social""19"$3000',
+    '#!4""5k""ds"$heta#&il/phd""lc""mr"$ongo""ta"!u#!s!$r-40"#.j.#!x"&c/esrc',
+    '$!a""lp""ps"&s.ruth!\'s-works"#/ww""32""c.""gr"\'p-based"!t!#t-1#!2""86"#ara',
+    '""p1#!2"!r##nas""s.#$ensk!$u-us"#/mg"(afangejo#"na$$gdaw"+ch&mdash;it$(-awaited%%cited&)riticized',
+    '&(ecorated\'&served(%pised&*iscredited%*emphasized&%nvied%&fabled%\'handled%(imitated%&mended%,photographed&\'ut-upon%(repeated%\'studied%,talked-about',
+    '&#orn$$alls$%insky$#ope#)ilaginous#$k-up$#ers$#ier%"n\'$#low$&raking$(spreader#*ocutaneous$\'protein$-sa-associated',
+    '#*us-covered"\'d-lined$%packs%(lastered$$rich$\'smeared#&bricks#&clouds#"da$"ed$$iest%$ness$)le-headed-$ness&*headedness',
+    '.!s#%holes##ima#&riczki#\'stained"#ehl#*ller-stahl#(nzenberg"&famadi#%ulira"#ger##ful#*gletonians#%shots"0ham&rehy;madiyah',
+    '#$bubh#%ittin#%lberg##ren"$iden$$zade#%rland(!s"(jahaddin%%idine#$ibur"%kando#$iibi#%urasi"%latta',
+    '$#yam#+caster/west$&helney#&hooley#$legg$&inavat&#ger%(on-paned$"oy$$uscs#%ready#"so#"ta%#tta$%hrops',
+    '&\'bedroom\',illion-pound\'%laded\'\'ranched(#eed&#car\'&hapter\'#opy\'(ulturism&,departmental\'#isk\'%omain&&effect\'%vents&\'faction',
+    ',#ial($mily\'!x&&gabled&%image\'+nstrumental2#ist(&terest&(layering\'%egged(&velled\')ingualism)!k\'$ocus&(machines',
+    '-%aires&(partyism("ss(\'tterned\'%eaked($rson\'$lane\'\'osition\'(rimitive(-ocessing/6000&&record&\'sensory\'#ize\'&peaker($orts',
+    ')&tement(#ore&(temporal(\'ntacled\'#urn&%union&(vibrator\'$ocal&$well\'\'indowed,!s%&.media%)barrelled&&illion\'!t',
+    '&"us%+cellularity%\'effects%%faith&$ield%&heater&$ulls%(junction%$kwik%%lines(!k%\'megabit\'$mber&-illion-dollar-%pound',
+    '%%packs\'(rametric(!t&\'latform\'&e-data)(employer(!t\')icational\'-y-accumulates*&nd-add&$oles\'$tent%&ringed%!s&&ervice',
+    '%(variable&&ersity%$well$"um#%ugeta\'"ta#$vagh""m-$+and-toddler#"ba$$lers#)ford/team#&meries&#set$%ifies',
+    '#%phkin"(nakumabu$#sar#&chener\'%gratz&"rs%$kins%#pot#(daneness$"en$!t$"um##era##gai$"ra',
+    '$!y#)icipalism)!s$(ficently##sey$(terplatz#&tingia#&yanesa%$zesa"#on-"\'pangare#!p""r.#$adov$$nese',
+    '\')\'-e-dehli$"te%!s$$vsky#\'chisoni##dac$&erball&,ed-armstrong\'$sses$3ock/gloucestershire#!e#$iate$$llos#$kill$%owski',
+    '##ley#&mured.#$oroa$!s#/phy/adjudicator\'&martin#"ra$"ee#"sa##tha%"ly#&ugesan#&yanama"$savi#&catels',
+    '%$pula$\'le-like\'\'tearing$&ularly##eet$%ology$+um-building\'\'keepers&%goers&&square\'&trasse#&graves%$oves#(hikarati$&obekwa',
+    '#+ic-business&(oriented&%stand&\'teacher%+ally-gifted%,ian/composer%/o-technological&)logically*$ques&!n$$disc#)k-scented$\'et-ball$#ham$#oka',
+    '&"in%)n-covered\'%lined$&yumovo##man##oke#&pratts#&quetry#"sa$\'el-free\'$rich&&burgh.$#ies$%ulmen#&t-have',
+    '$&achios%%fayev%$nger&#sir%(rd-brown\'$seed$"nt$)on/stroud$"um$)y-looking"(tabaruka$(genicity$$hhar$#lov$$mbay',
+    '%"na$#ill#+il&eacute;s##oko#$suki#$tley$#ram#.ual-admiration&%ities&,ly-assisting))rewarding""uu"%yunda"!z#%affer',
+    '##hik&!s#$tagh!$v370"$4000"!c""ic#&llvoil"!j!&waanga#%kenya##mba#&nawasa$"za#"ve',
+    '"#500!%yaing#.nma-bangladesh$!t#(sishchev$(nikovich#$wadi"$boto"\'c+max85#&erinus#+oparasitism%&rotein$&rrhiza*!l"$drim',
+    '&\'scotton%-/headmistress%"on"#ght%!y"#ham"&khailo""lk#%nikov#%onite\'\'ization$!r$%ssoma"$nahs#$heer',
+    '#\'fascial$\'ilament#$pics#%tomes"$rene#%inian$%state&\'icaceae#)mecophaga)$ytes$$idia&#ons#&onides#\'sinites#&taceae',
+    '$!n#$lbek#\'tagogue$*eriousness&\'y-cults()religions$%icete%"ko%$ques"(th-maker$!.$!e$&ically&+o-religious$&makers',
+    '"(ung-whun"$xine%\'iformes#&obolus"#zus!#z-2""zz 1n&aacute;prstkova"&bsol;a"&eacute();cessaire)-glig&eacute;e)$roly)(v&eacute"0oacute;0honshugi',
+    '",uacute;menor!-\'&eacute;tait"!a#!i"\'hesitez"$kari"%singa!#(e)!!*!$+max!?-acetyl-&bgr;-d-glucosaminidase(*neuraminic"&butane""c\'"$dust',
+    '"-glycosylation"!k"5monomethyl-d-arginine"$n-no"$oct3"#p-n#%eriod"*terminally#%uples!#.15"!5"%a.t.o"$c.c."$d.t."%f.p.a',
+    '"&harris"(lapillus"!m#%.h.c.$!r"$n.e.""r."(s.p.c.c.$&w.l.r."$t.a.#(heobroma"$u.r."\'w.-s.e.$!1!"/b',
+    '"!s!#112##7gb!#201#!2#!3#!6"!7!"36"!n!"45#"tg"$94tw!%501sh"!1',
+    '!"78!%8389h!$901k##379"#6bf!":n!$=106#"14#"23#"50$!4"#218""30#!7""41',
+    '""50#!6#!8"$6.25""74""85"$four!.a&ccedil;ional#(icirc;ve$%uml;m"#\'lu"#-64#\'acetate#!o""/h',
+    '"!1"$2co3"#ali#"ma"%b/lab#)erezhnaya#"ta#$ulsi""c1#%arena#%cache#"ho$\'richten$%tdorf#!k',
+    '##oss#%reous##ton"#dar##ene$#zda##fas##ima#"mi#+ra&zcaron;i"#eem"%ffest",g/creatinine#"ai$"st',
+    '##den#&garond##isa#.orno-karabakh.#0ymaros-gabcikovo"#hal$#nni$!r$!s%"on##co3#!h"\'i-keung#!b#\'l-biter',
+    '&&tudded$%brush$$care%&hapmen$#hac$&makers$$sish##mat#$sali#%vasha"$jafi$!s#%doski##era"#kao',
+    '#"le",me&gt&verbar$\'-animal%%badge%%tapes$(/address#$gyal%"el#$ibie$(ng-words$!r##zha$!i"#nai#&cekuke',
+    '#&garhar##ine#\'nacaras$!i$\'y-state#)ocrystals$%scope$&teslas%#ube"%palms$"ta#%hthol#$isah#%leton#&oensis',
+    '&$tano#,pies/diapers#%sbury"#qib#\'shbandi"\'rahashi$$msin$$njos#\'bekovas%&rkovas#(coleptic#!d$$ucci#%epool$"sh',
+    '$%genin#\'kiewicz#$odna&#ost#+ratologists$)ow-banded(#eam($oats(&rimmed\'%faced\'&necked&,ly-conceived#(sarssuaq#$vaez#&zalina',
+    '##eef$#iro#1h/gloucestershire#%irdin#&lediye#)o-gastric$(alveolar$\'biliary#,ser-inspired&#ist&!s$"ir#"ta$)y-tasting%!a',
+    '"$tali&!s&"ty$"ni$#pei$!s#$chet##eby$\'q-nouri#/hanson/scottish#"io%)n-in-arms\')statehood&-al-democratic))insurance',
+    ')\'popular)%scale*(ocialist()/regional(-demokratische()istically),ty/residence((ly-based+&funded+)important+*negotiated+*recognised&+s-appointed(*designated()sponsored',
+    '\'$bank$+ve-american\'$mode\'(speakers%#ism&(t&eacute#(o/warsaw$#ire#"ps#(riuresis#%tress#!u$!c$0ral&rehy;looking\'*-narrative',
+    '\'"is%(e-loving\'(printing&#dly%%otech#\'west/bp$#ick"\'ufrages#%ruans"*varradonda\'"ns&#enx#3ega&ccedil&atilde;o$#iro$!t',
+    '$(gability&"re&(tionally\'(or/radio$$more#%rongo#$vabi#\'y/white"%worth#$then"*ylorsfield##ral#%smyth"%zaran%$enes',
+    '$&rbayev#&i-like$!h!$bfls""hs!"c3")abhrionid""cc#"ed"#dwm"!e"#gub"$hama""iv"&kalman',
+    '#!o""ni"#p10$!5#!m""tc""wp$%-born!+d&mdash;new"!6"!7"$:yag""cs"!g""hs',
+    '##oro"#obe#%ffene#"ng%!o#%rrobo""pc#!g#!l!+e&ccaron;as#&eacute#(ndash;20"&\'erday"!4"!5',
+    '"#aga#)l-schuman#\'outyine#%polis\'%tanum#\'r-2,000%(absolute(%tract&)dmissible%$bald%,camera-ready&&haotic&(ollision.!s\'"ma',
+    '%$dark&)isastrous(&belief&%uties%%equal%)faultless&#lat&%uture%)homophony\'&peless%)illegible&,mpossibility&(nfra-red\'(solvency&!r',
+    '&%erger&&iracle&$oney\'&ribund&\'ystical%\'natural%,photographic&$olar%)religious&#iot%\'silence&$pent&)tarvation\'\'rangers%&vacuum',
+    '&&iolent$)ly-blonde\'#man("en$#net#(t\'s-foot$(-looking$%ished$*ly-rounded$$nick"%bbish#!i$!u#+raska-based#!s',
+    '%#ium"&catrix#!e$!s%!s#$htan#&k-bite&$lock%%rests$%lace.$&plates$\'snapper$$wear#&mettin#!o',
+    '$\'omantic%\'polises#(tar-less\')producing&\'ivorous"#dem$)rlandsche#"ic#$well"$ebee#&ded-by%"ll$$full$)le-points&%cases',
+    '$,s-orientated%\'/demand&%wants$,y-contingent#$fjes#$lsen#!n#$raum#$ther"%ffati$&ortiti#"ma#)olovhodwe#"yn""ga',
+    '$#mbo$$tiva#\'ilgence##ley$%igees&%ible.%%nnaya#$otia\'%tion.#%resco$$itos##usa"(idenburg#/ghbourhood/home$"wl',
+    '#$lans$)l/unipart%$ands$!s#*man-marcus#"ss"&krasov$$olog"%lhams#$idov##kin#+l\'et&agrave$#cor#)son-jones&//communications',
+    '#\'estrina#!i"-nadovi&cacute$$shev##iae"*o-american%\'ustrian$*babylonian$\'classic+/al/conservative%,onceptualism$\'elitist+!s$\'hookean$)keynesian',
+    '&#tin$*malthusian&&rxisms%+ercantilist0!s$*natologist$*oesophagus%(rthodoxy$&pagans&\'lladian%.rohibitionists$&rococo$$tory%$udor#+classicists',
+    '+#ism#*expression#\'formans#&gothic#\'intimal#0mycin-resistance#\'pallium$&lasias&%tonic*"st"0palese-dominated%*i-speaking##ean#(helinite+!s',
+    '\'"um$+rolithotomy\'%ogist,!s&)sclerosis\'"is#$otic#$tali$"un&#ium"+reaux-weber#"io$#tan#!l#%onian',
+    '#!v$/e&rehy;wracking%(-poisons&&ridden&(tingling$#ily%$sque$$osus""sb#&cience#"lo#$mith#$seby#&t-like%&making',
+    '$"ar$"er"+t-effective$+of-transfer#$back%"se##com##fly$%rames#)herthorpe#!i#,labs/manager#%maker%%nager#*o-kiambata',
+    '#)tle-cells&&sworth$"on$$werk#/ware-compatible$&ork(s)\'+-extensible(+independent($wide\'"s.&"th$"rk"$uber$%urger#$dorf',
+    '$!n%$dorf$#ste#-fch&acirc;tel$%ville#&garten#&hausen$#off#\'kirchen#!m$+&uuml;nster#\'rectomy%&gulins$$ites$*o-electric',
+    '\'+harmacology&(surgeons+"ry%*anatomical%+behavioural%)chemistry,!s%$data%(ectoderm&)pithelium%(filament%(genetics%%kinin%\'medical\'#res',
+    '%*plasticity%*scientific,"st%*technology&%ropic$&tophil##sel$*serstrasse#-tral/alkaline\'(isations(#zer%&ionors%0ophil-associated*"ia"$veau',
+    '%#son$1r-before-released&%empty&)forgotten&\'resting&$used%"be%#ton#*ille-rolfe\'$/bee&"ii##ski""w-$&comers%\'ritical',
+    '$%model$%start$)zealander#*/different$#old#&battle$-iggin-on-lune$$rook##cas&#sle&-tle-gateshead$(o-repton%#mes$$rest#*ell/prison',
+    '##fie$*oundlander#.hnam-on-severn#$ling$)y-adopted\'\'wakened&(composed&(declared\'\'ivorced\'"ug&,enfranchised&(finished\'$reed\'(urnished&&merged',
+    '\')odernised&*prosperous\'(ublished&&turned&&washed#&machar%\'n-jones\'%kuels%*rket-based$#ill##nes#)port-born\')/pontfaen#&s-book%\'flashes',
+    '%&writer$!/$$book$%desks$(magazine$-ome/wetherall%\'n-smith$.paper-headline*&reader%&rinter$%quest$&sheets$$talk%$rade$"um',
+    '$$ws11&!8#-ton/volunteer%*wnhamilton"\'xhmedin#,t-to-useless$!s%&tation#$us-6"%yland#"ra"$zzer!)f-&khgr;b"!8""cg',
+    '!(g/kg/min""17"&akosso##poi#"re#&uruhoe#$yama""hi"#iau#%buini""ls"#olo"&uessan#+i/volunteer#"mu',
+    '!$h749""as"!b"!g""im"!m"!o"!p!,i&eacute;pce$)grave;vre#(ntilde;a""49"*agara-like#+t-njifenjou"$bari',
+    '"#caf#%colin#)e-but-dim%%sized#\'holas/p&%evich&,son/bulletin$$rome#\'k-nacks$\'elodeon$$less$%nacky#%olaas%"et$%media',
+    '$!t%%inate\'*e-yellowed"%dahas$#ros#"da#!r"(ederwald&$zell#&lebock#$mann#%tzche##uwe&\'nhuysen"+f-dominated',
+    '"#gde#(er-congo%-ian-dominated#$h-on$%t-bar\'\'looming&$call\'$ream&(fighting&&people&&shirts\'$tick&(thoughts%&/early&&friday',
+    '%$fang&\'ighters%$ride)"rs%&sticks&%weats%$wood)!s#"ms#+rofasciatum"%h/3t3"$jdam"(kiforoff$$tina$"ya',
+    '&!s##ole%"ic%%skaya#$tron"&lamani"*m-foi-days#%6000m##aga#%blest$+us-designed#!e#%rod-t"\'ne-acre%#bob',
+    '%$feet%%horse%&nation%\'pounder%$race%$shot&)ixteenths%(thousand&$imes&"ry%$unit%)years-old$%eteen$#ish$\'pennies',
+    ')\'hundred0!s))seventies)#ten*+o-the-dozen*%welve%$ies.%(y-degree\'%ninth\'\'one-day\'%third&#ish&%three$%vites#&fanian',
+    '#&g-hsia$#/xu#&hydrin#!i$!o#%jutsu#"oy##ski#(th-round"\'ortaise",p&middot;bsa##map#(ple-like$&onites$"ur',
+    '#*vana/pearl"$saia##hen##tri"(t-picked#"ch#%eries#%ijela#.rate/phosphate$+o-glycerine%)gen-based&\'lycerin%\'somonas%\'toluene##ty-',
+    '#"ze"\'uafo\'ou$!s$(toputapu##ean"%valdo##eau&!x#"kh""wa#"ba"#yaz"(zamuddin$+n-pluvinage!$jala',
+    '""cc"$onjo#$rthr#"ya"#uba!*kazamyampi"$hata")rf/kidney#\'umahist!#m/l""js"%ol/kg%%l/240!#n15"!8',
+    '""cc"!e"!r"!w!*o&amp;sub3"\'-attack#(bail-out%%lling#(comments%%ntest%"ok#*distortion#$eyes#+fixed-abode#$harm',
+    '#!i#*obligation$$o-oo$(peration$$sf/1#\'scoring$(helfware#"us"$.198#"21$!5$#857#"33$!7#"43',
+    '#"98"!0""13""53"+_,_no_doubt(#one#,matter_whose#"of"$aa-7""bb#\'ilities#&le-lie&&minded#"od##uro',
+    '##tes$\'ilucent$&urnals""da#$cock##dfa#)e-to-node$&s1to10%&41to50#\'ulation$!s"#ele$"la#"th%"er',
+    '"%garet#-ent-sur-seine#$ging#&oodnik#(ykanizsa"#hra"(ir-rouge#*selessness#"ze""lo$"go##tie"#men%(clatural-"ly',
+    '#%icity$&nacion&(lisation("ty(\'zations\'!s%&eeship#%ogram(!s\'"ph$\'logical"1n&ndash;enrollers$,rehy;nuclear)-proliferation)(specific',
+    '/!t#(-abelian&\'sorbing\'%tract&&undant%%ccess\'+ountability&"id&\'tivists*"ty%\'ddicted&\'herence&*judicative(&stable%#ids',
+    '&(phabetic&\'truists&&veolar%\'nalytic,"al&\'omalous&*tagonistic\'(i-social(#gen%&phasic&%plied%,rbitrariness&\'chitect&(restable&&terial',
+    '%$scii&+signability&\'thmatic%\'ttended\')ributable%\'uditory%,ward-bearing%*xonometric$,bactericidal%#fpo%%iased%%loody%%onded&\'urgeois%\'reeders',
+    '%%udget&"lk$\'capital&\'rbonate\'+diovascular\'#ing&&tering%"fa%&haotic\'\'rgeable(\'ismatic\'\'ucerian&-romatographic(%nicle&)urchgoers',
+    '&#vil%)lassified&&earing\'%rical&&imatic&$osed&"ub%&oeliac&&litics&(mmitally("on()unicative\'\'parable(2etition/canvassing(%liers',
+    '(-uter-assisted&*ncessional\'(secutive)\'nsually)(rvatives((titutive((ummation\'*tracepting/"ve+#ted,#ing\'#vex&#ral\'(puscular\'+respondence',
+    '&(valently%\'reative%\'yclical$)darwinian&"ta($base%"ec\'%rease&&fining&(gradable&)ictically&\'manding&(position&&script,#ive',
+    '&)terminism.#tic&+velopmental\'&iating%)iagnostic\'(lectical\'$mond&"et&(gestible&%ploid&&rectly&\'sclosed\'\'persive\'&torted()ributable',
+    '\'&orcing%*octrinaire\'(umentary%\'raining\'"ma&$iver*!s%)uplicated&&rables&#tch$&edible%)gocentric%&lastic&*ectrolytic%*motionally',
+    '%*ngineering&)zymically%\'stonian%&thical\'#nic%+vangelicals&*olutionist%#xec\'#mpt&\'istents&)periences\'(lanatory(%osive$\'factive(#ual',
+    '&%rmers%(eminists&#tal&$udal%\'ighting&%nance&)shkeepers%%luent\')orocarbon%#ree%(ullerene&,ndamentalist\'%gible$)gardeners%#ene',
+    '%\'oyigama%)uaranteed&$ests&"lf%$ypsy$-haemophiliacs&%rmful%+eterosexual%#mso%)omologous&)useholder%)ungarians%*ydrostatic&&pnotic$#ici',
+    '%\'llusory%(mitative%%ncome((rporated&%dexed&(fringing&,strumentally&$tact\'%egral+#ted(\'racting-"ve)\'viewing\'+rospectible%&slamic',
+    '&$sues%!t$*jewishness$\'kinship%(nowledge$(labelled&#ser&!w%\'ebanese&%gally\'\'uminous&&ninist%\'imiters&&teracy\'\'urgical',
+    '(\'bearing&!w%+uminescence.!t%\'ymphoid$)malicious&%naged*"rs\')ipulative&%rking&$ster%$eans&\'ndelian&(tastatic%*icrokernel',
+    '&%neral%(onetised\'\'ogamous(%tonic&#ral&%thers\'&orized%\'ystical$#ncr%!e&"g.&(oplastic&\'tworked%%obles&%minal',
+    '%.uclear-powered&"ll&(tritious$(obedient&\'trusive%*ccurrences%#ecd%&lympic%)ppressive$&paired&)rasitised\'#ent*!s\'*ticipatory(#ner',
+    '&&yments%\'eaceful&)nsionable+#ers&(rformers($umed%*hilosopher&$obic\'+tosynthetic%%lanar\'#yer%%olice&%ngine&(stscript%\'recious',
+    '\'\'scribed\'\'ventive&#ime\'#son&(ogrammed\'(motional\'*positional(&ulsive\'#ven($ided%&sychic)$otic%\'ublicly&%rpose%"vc',
+    '&$oted$(radicals&)tionality%,eceptor-type\'\'ipients\'#ord\'\'urrence&\'ducible)&tively(%ndant&(ferenced\'\'illable&\'gulated&#nal&+peatability',
+    ')"es\'*roductives&\'sistant\'%onant\'&ponses+#ive&$tail&(versible%%iders%%uling&&minant,!s$*s&amp;p500%%ailor%+candinavian',
+    '&%oring&&riptus%)easonally&$cret&\'gmental&)lectively\'+f-governing&&minoma&#nse(#ory\'&tences&"rb\'#ial%!f%%hared',
+    '&)etlanders%(ignatory(#ing&"lk&%nging%(keptical&!i%$lavs%#oap&\'ftening&\'lutions&*mervillian%(paniards&)ecialized\'%nding',
+    '%"ql%\'taffing)(ordshire\'&linist\')ndardized\'\'tionary("us&)ereotyped&#ock\'"ut&&rategy&&udents%*ubsequence&(ccession&#gar',
+    '))imposable)&visory&(rgically\'(viveable%\'wimmers%%ybase&\'mmetric&$stem$*tax-payers%\'eachers\'!m&)chnically&)rrestrial(\'itorial&%xtual',
+    '\'$rmal)(onuclear%%icket&&morese%$onic%&raffic\'(nsformed)&parent&&opical&/uth-conditional%*umorigenic$)ulcerated%(niformed$(variable%\'enomous',
+    '&$sted%$inyl&%rgins%\'olcanic\'&untary$%waged&&shable&(terproof%&eapons&(sterners%&icking&)ndsurfing%,orking-class%%riter%&ysiwyg',
+    '$&ncourt#(circular$\'linical$,ontroversial$/rystallographic#.denominational%\'scripts$)isclosure\'*riminatory#+e-too-clean)\'distant)*prosperous$"=0$\'conomic$(nzymatic',
+    '$%ormal#-gravitational#)inclusion%(dustrial%*strumental%)teractive%(vertible$$onic#+judgemental#%local#%money#)objective#*perishable&)spectival$)roductive',
+    '%(ciprocal#*scientists$)ensically%(quential$#lip$(pherical$&top-ux%\'rategic$#uit#\'uniform#)veridical"(o-ooo-oo#&dlings#%n-3pm#\'rdeinde',
+    '$(katensis"&ratlas##bay$"et$"it$#urn#%d-sud$#/lb$)albingian-!s%%nstad%)ustlandet$(enstreng%)oxycholic$#gau',
+    '$#ine$"on$%rhein#$eena$"ll$#pro#"f.$\'loxacin$+olk/suffolk#$gate#$imin#)mal-speed&,/combination&"ec&,ly-aspirated',
+    '$+enforcement$&ington&#ton$,oalbuminuric%)calcaemia&*hlorhydria\'%romic%(lipaemic$"s.$#ung#$onha#"pa##ren$)ie-walker##sca',
+    '%%mania$%tedts#,th-easterner&(midlands&/north&rehy;east1$west%-ampton-market&(ngerland&#von%*easterners&$nden\'#ers&#rn8&!y%-field/manager',
+    '%%ridge%#sea%,ward-flowing&#ind$)on-logoed&0/gloucestershire#"vm#&wegain$#itz"$saka#%e-bag%#end%%holes%\'mounted%#tip',
+    '$!i#$heen$#ing#$ings#%ology#%siter#$tras#&worthy"/t-bloody-likely$$food$.inconsiderable&+vented-here$$nice$&proven$%quite',
+    '%&erious%(o-clever\'#hot\'#new\'#old\'$rich\'&subtle\'(youthful$,to-be-missed**remembered$+very-bright$!x$(yet-dead#%_more$$sort',
+    ')!y$%rised$#tor#(e-orders$$able$#dly$$less$!n$%phone$$r-up$+s-programme#%hing.#$itia#"ke#\'rajnsko',
+    '$,ing-hamshire\'-ham-sheffield"$ubir#&n-noun#\'rbakhsh#*veau-style"(v&yacute#!\'#$-dec##.10$"29#$/dec#&ablast$"ks$"ra',
+    '#(elettish%&l-unix&%/unix%"s.$0mber&ndash;march(#-17)%march((/january#&iciate$%npoor%!y$!x#"oa$(kuznetsk$!n',
+    '""w-$)abandoned%\'nd-then$&common%(ustomary$*demolished%*iscredited$%empty%(stranged$%faded$%it-is$$lost#!a$!d#+ina-konopka',
+    '"%yelle$!r#"se!$p-40"!f#!a""lf!"qv!"r1"#77v""as"!b"%c2119!%s.20a#&47a(1)',
+    '"%32000""ai"!b"!l""ra""ss""ub!)t-capable$(ertified#)exclusive#2on-multiprocessors#\'related"#/3m"#aba#&gerura',
+    '"(igulirwa#$wane"!n"%ozake""su""ui""wf!*u&amp;sup2#)ntilde;ez"$-pak"#ang"$bbin$#les##ern#"uk',
+    '($arms(%based&$tors%$ides&!n\'!s%(oprotein"&dleman"$esch",ffield-based"%ggety#"ud#!w",isance-value#-ts-st-georges',
+    '$"te"#lla$#ing".m&eacute;raire#(ber-wise&&/entry\'\'history\'%lemma,%tised\'&target\'\'version&%plate&(routines$$fish#.eric-intensive',
+    '&!k&!s%%ously#\'mularia##nah"&n-like#"aa#$berg#$cios$#lon$\'upative#.eaton-bedworth#"ge#$like#\'nenkamp',
+    '#&tiandi##zio"#oro"\'p&prime#&kinses##tse"%ragus#$dish#%eddin$&g-0558#*magambetov#%nberg#,se-in-charge&%maids%\'maiding',
+    '%"s.$)ing-homes#%uddin$(osmaniye"&sfjord"\'t-house##hin#%rafin$#ene#$ties""ul"&vacron#%ista+!"w9"#aha',
+    '"!d!#yae#&mdavaa$&lagira$"yn#$ndwi$%tekyi#"sa$#sae"$berg")e/council"(iragongo%/nkusi-munyaneza".ko&oslash;bing"\'lon-6,6',
+    '%"ae%#eas&%nburg&#tte%(omaniacs"!p#"so"#ree$!n""ta#"ns""uk#!m!/z&dollar;10,000*%5,000',
+    '")abonimana"#eng"#ima *o&amp;sub3("p2"&iuml;r"&uacute!(\'bannion$\'rullion#%eirne#%loody#\'raonain$"ee#$utty")cionnaith',
+    '#+onnor/gypsy#%rilly$\'ookrise"#dom$&naghue#(riscolls"\'ergiven"$fail#%iaich$"nn#"un"%gaunt"%haire#"ea#\'ooligan',
+    '"$loan$&ughlin"\'maonlai#%orain#!y"$nell##ion&!s#$olan"0reilly/reporting#$iley"$them!%(n/2)!"-0"(positive',
+    '"!3""59"!8"#a.p"&c.t.u.#&onnell"$g.s."!p##.d.$"p.!#/60"!d""ml!"2+"!c',
+    '!"50!"71!&=nexor!#abs""dp"(k-apples$\'floored$$leaf$(timbered$(veneered#%amoor#$bank#$dale#,enson/social#%heart',
+    '#"le%$aves$!y#%ville"$ncea"%rlock#(smanship")st-houses"\'t-cakes#-meal-coloured#$rigg#!y!*ba-apounou#"me#"rt',
+    '")eralppass$(drauberg$$heim$*m&uuml;hle$.pr&auml;sident$(salzberg%$tein$&tauern#%yance")fuscatory"(icularis#\'tuarist""je$+ct-cathexis(%hoice',
+    '\'-relationships&%ional\'%ve(s))$-row*\'setting)$ness($ists&$less&%maker&%world"(ligating\'$oire($rily%"ee%"or',
+    '#*ong-shaped"%oists#(rknezovi"-renovi&cacute$#roi"+scurantisme&"er&"us#.erva&rehy;tion\'&bility\'%tion.#&oleted$&rption"\'truding#(usifolia',
+    '"#ukw""vi$+ous-looking"!y!+ca&ntilde;a")cam-based$\'sionaly#)identales$$pito#%ultis$%patio),nal/regional,*ly-induced%%iable$&rences',
+    '"*ean-racing%&eering#$llar%"us""hi#)lospecies##ses#%wanyi""is$"an"$kert""li"$otea"+r-processed""t-',
+    '#$/nov#)amer-like\'$/nfi\'!s$/ve-combinations#/ober&ndash;june\'#-10)!5("20("31\'!s$#fad&\'sciatum$(pus-like$\'vuillin',
+    '!%d(sa)"%1/od2"%alric"&bc/dal")d-jobbing#"ar#$bods#&ington##run""eh#\'r-neise"!g"+i-compliant#%e-ali$!r',
+    '""le"#ney"\'onatist$(tologist#&r-o-no#*ur-binding%#ous%%prufe"#ria"%yessy#"s."!z!/ecd-recommended#%ology$$nomy',
+    '"&m-only"&nanthe#&ocytes"$ppen"&rlikon",sophagoscopy#\'phageal#!s#*teoporosis$&ringen%+ogen-mimics*$type""ws"&yangen!#f-a',
+    '#!i$"ng#\'the-art##war$#hat"(/central#$from"!_#\'course.#$each""en"&f-base$#for\'$eleg$%gases',
+    '$$hind$$lead%$oads$%phase%$itch%%rints%"ut\'&tingly$&ration$%sides$0the-beaten-track(%croft(/top-of-the-head#$.the##/on',
+    '\'"s.%%dedly\'\'r-based#&ically%*e-approved\'%cosla\'&funded\'%hours\'\'keepers\'%party&(/firmlet&$r(s)\'+-in-command%.ially-approved(%sthat',
+    '&#nae$$zier##ley##ner#"rs#%sides%"te\'!s"#his#!r"#lag"+ori-boateng""ra"+t-expressed#(en-cited',
+    '&)mordantly!&garevo"+ilvie-grant"\'novenko"#ork"%reish$"ss""us!"h-#,five-hundred#!h#"so%\'-clever"#_of""ad',
+    '"!i#"me"&linger"%nemus!"ie"!f""ga#$nons"(l-change$(drillers$\'engined$\'fuelled$&hungry$\'induced$$rigs',
+    '#&/resin$%water#-cloth-covered#!p#\'related#%stone#$well#-y/combination"%nghua"&taians!"je!%kello"%inowa#\'station",lahoma-based',
+    '")ra-filled##ugs"#tay"%ucani!#l10"#400"!6""ac#\'dehinde#$pade#&thaval#%ussen##ves#$wale".brechts-tyteca',
+    '"&d-maid$\'stagers$$tyme&"pe$;woman-who-sang-to-the-river#$acre#%brook#&en-day%$shaw#&fields#)ham-based&!s#$time"&e-like#&ksandr',
+    '#!o#$siak$#tra#"um#!x"(ginskaya"$iday#6godeoxyribonucleotides&!t%*menorrhoea%/nucleotide/bead#!m$#pia#!t#(ve-brown',
+    '""je"(lenhauer$!r#\'iemania#&ulanus"&mstead&!d#%ympic""oa#)man-ellis##nga#!r$/on-sainte-marie"!p"%tenia',
+    '"(ympiakos#%nthus!$mand$\'i-owned"#bra""da"$egna##rod"(i&scaron#-cron&amp;sup1#,nous-looking"!k"$leco"&matins#!m',
+    '".ni-directional$#day$$page%%oints$(sciently"$odei#"ua"/phalomesenteric""ua!7n&lsqb;24-feb-1990&rsqb"%-duty#\'lending#&market##one#$peak',
+    '#$task$(he-field$!o#$zone"".a#$over##the"!9"&_er_to"$aug."(ce-a-day&%ctive%)cherished&%ommon%&famous',
+    '%+magnificent%%raced%$safe&$taid\'$rong&)uccessful%\'wealthy##han##ins#&ofetal#!s"&druska#!s"&e-10th%#2th',
+    '*)half-hour*\'quarter(#one&%other$#bar%#yte$$down$\'episode$&finger%\'or-five(%seven)"ix\'%tieth(!y&&ur-one',
+    '&"me$,half-integer$\'in-five\'#two$#key$$love$$male$%o-one%!r%#ver$)parameter%"it%#lus$%round$&sector',
+    '%(ixteenth&"ze%)top-shops&&ringed$&tailed%*hree-seven%%wenty$$yard%(ear-long)$only#$/two#$axis#"ko#"ra$\'ousness',
+    '#%world"%goiba#+ratulations#\'wakebei"#ies#)on-shaped%!y"$june"#laf#)y_as_good""o.#\'mastics%\'topaeic#"to"$self',
+    '#"he#&ologic""uc##moz"+ychophorans#)szkiewicz#$thin!$occh"&dinium"$ever"\'genesis#$ypip"$h-er#!h"#ids',
+    '"#shi#\'terwijk"%tside"%zelum!4p&eacute;ra-bastille"%\'ning"#.20#"95#$cit.#!i$!i%!i"%_cit."%codes")el-badged',
+    '$*-circuited&#oil&%rotch%%forum%&legged%$ness%%ocean%\'reading%&spaces%/to-the-elements%%water$&/close%&office$$days$%ed-up',
+    '$#in\'&%g-day$$look$&render$&v*opss%"me#(ra-glass+"es%\'tically\'\'ng-cost&,or-initiated$#ons"#hey#*iacanthids$\'ochiton',
+    '&$reas%%daces&$elos\'(rmatidae%\'helinae%&melina%%pogan")iate-like#!c##nio&"n-(&former#+um-addicted"+oria-ekwaro$(tunities',
+    '"$pdal#-enheim-barnes%!s$)rtunities*!y##ido#\'onents.$$rtun(+ities/human*"y.$(sability%*ite-leaved)#sex\'*ion-backed+)sponsored',
+    '&%rious#(urtunity""ry"$tare##ech#$ibus$(cal-disk($link\'+/electronic$#las$"me%%isers%\'umvalue$\'onality#,o-electronic',
+    '$\'kinetic!$r-as"":f"$_not"$ache$*le-experts#)l-genital%(maternal%$oral#)ng-utangs%"e-\'&bibbed\'&nassau\'&rimmed\'&tinged',
+    '$&jestad##ted"&b*view#%iters"-chestrational*#ors(#ion$\'idaceae)#ous%#ses$"s.##ish"+der&pound;5%!\'%%-book',
+    '&&takers%!d$"sa##ina&#lly&+ry-language%"em%!g#$nung##ulf")e-bearing#$body$"ro#(ichalcum(#kos',
+    '#%juela##lia##ngo$"se#"os#&shoots$#und##val"&gainse$*n-builders%(iastions&+cally-grown&)sation(s),-s/individuals\'-ing/publicity',
+    '\'#ors\'$tion&1zation-democratic-#plo,"s.-%haikh%!o&)-halogens\'*phosphates&(fluorine&\'sulphur$$smed##ill$&tunnel$"va',
+    '"$ians#\'chalcum#\'entales($ists\'%tion.&$eers#!g$#in.&#ale(%ities\'%tions&"el%$onal"#kar#\'neyisms',
+    '#"ac#*eans-style#%ovsky"!m#"on$#sia#$shaw$$tein"(n&eacute*";e,!s#,ately-carved&$ness%\'ipinnis#$ette',
+    '\'*strongylus"(ogastric*$ally$&raphic##ngo#(pendolas$)haryngeal)!x$"us"+ph&eacute;e$#eum$$ists$!y##lid"$rego',
+    '"&sabrin$#nic#!e##ova"*tho-chiron\'$ilag%)chromatic&$lase%$epic(#sts%\'gonally&6raphic-to-phonological+"es%&normal%*pedagogics',
+    '%&static%(tectonic#%olano$\'n-green&)halliwell%./short-sighted$#vox##rud#!s"&umiyeh#!n#"ro"#wig"%yctes!$s/2.',
+    '"#can$)r-winners#!e#)illatoria##ura%!e"%eberg#\'ophagus#!r"%f/dce\'$/dme$+motif-based#$rith"\'hchenko"&ireion',
+    '"$leri#(obodenje"&marino##iro#+oregulation"\'naburgh""o4"$pina$#tal#$ovat#%ringe""ra"$sebi$\'rvatore$%tians',
+    '$"es$%ngton##man&!e#%obleh$#rio"(t-elbian#$abat$+nisczkowski#%eitis$%nsion\'.ve-inferential)"ly$+o-arthritis%)arthritic',
+    '%%lytic%"ma%&straci$%rberg%#man%$wald#%front##ial#,markenverein#(racizing&(ode-rich)#rms%&kismos%%nenie$#ers',
+    '$"ov#$wald"!u"#wyn!$tamy#*vipithecus#"wa""el$!o#"ma#"ng#!s"#hen$"r*%"s*',
+    '##rys"&ididae"#mar"%oniel#)sclerosis%%opist"$reus"#ten$$rden%&ington%#mus%#ton$$will#)o-hermann$(man-held',
+    '!$uata"-bli&eacute;es%%ettes"$ches""de")erzzazate#,st-africaine"#ida"%ltram"-nce-for-ounce""po"&sedale##man"(t-breath$(classing',
+    '$$done%$rive$#fly$(galloped&!y%&rumped$*of-fashion\',the-ordinary)(is-world\'$wind()ork-hours$+performance%&roduce$%range$&scored',
+    '%\'tanding$(thinking$&worker#&_er_of$"in$&out_of#%breed#$calt%$stes$%oming&&peting#(doorsman$#rew#(er-frame&(suburban',
+    '#&facing$#ish$$ront#$gate#&illage$#nen#)landishly*$ness$%iners#+manoeuvring#&okumpu#\'playing$%olled$&roduce$+ut-weighted',
+    '\'%input#$rake$&es-mer$$ides#&selves$&hopped$)ide-world$$ole.$#pan#%think$$urns#$vote\'"rs#$wait!)variotomy',
+    '#2r&mdash;production%,rehy;crowded$$-30s%#45s%"55%"65%"80\'!s&!s%(academic\')hievement\'&tivity&*mbitiously\'%orous\'+plification',
+    '%\'bedding&$lown&\'rightly%+compensated\'%oking\'$stly&\'ropping&*ultivation%%dense\'&tailed&!o\'&minant&*ramatising\'%esses%*emphasises',
+    '&)nrichment&+xaggeration\'\'citable\'\'pensive(%osing\'(traction\'(uberance%&florid&(urnished\'#ssy%+generalised*%osity&&ilding&&rassed%\'handing',
+    '%+identifying&.ndividualistic\'(sulation)#red\'\'vesting%$keen%&layers%&manned)#ing\'$ture&)eticulous%%noisy%)occupancy&(fficious&-ptimistically',
+    '\'%yment&+ersonalised&#lay&&recise(\'diction()scription/"ve\'(oductive(%moted+#ion(+tectiveness%%rates&%egard(,ularizations\'%liant',
+    '+"ed\')striction&\'igorous&%obust%)secretion\'"en\'%lfish\')nsitivity&)implifies&$kirt&)leepiness&\'pecific(%nders)!t&&tating',
+    '\'$rong&%ubtle\'(spicious&$weet%$take&"he(%-knee\'&irties&&ighten,#ing&\'olerant&\'rousers&%unics\'$rned%%using',
+    '&&oltage%%water&&ritten\'%ought$0/gloucestershire$(balances%#ite%$ooks&"re%&ridges&$ooke\'%wning$\'casting%-entralisation%&harges',
+    '%+ompensation&+ncentration%\'ropping$\'develop%)ispersion%#oor(!s%)ramatized%#ues$%eager&#ter%(laborate%(mphasise,#ing+#zes',
+    '$%field&(ltration%#old$/generalizations%$irth%$raze&"ow$%hasty%%earer%#ill$)inclusion&+vestigation$\'layable%\'earning&$ngth',
+    '%#ock("ed&&okable\'!n&\'rdships$*optimistic$+pessimistic%&redict\')scription(%sured+#ing&&icings$$rein&&liance%%iders',
+    '$"s.%,ensitiveness%$heet)#ing&#irt)!s%#man%$peed\'$nder&\'reading%\'tanding\'\'tements&#eps&#ood&$rand',
+    '%*ubcription$\'throwal%$ness%$olls&%pping&"wn$%using$$whip%$orld"\'igerous#+na/vivipara#&parous#"tz"!n"*ocn&yacute',
+    '"(ulations!)wen-jones$%/home$\'s/upton"(l-shaped""n-$\'branded*"rs)!s$$some#\'/filmit#-er-controlled&$ship\'(pectator&&tenant',
+    '&#not&)occupiers&%trade#$some"!o"$ston"#t\'a""ww"$yeen!&x-eyed#$hide""10#!1#$41sa#!6',
+    '"#aal#"id%!s#$late$!s"#box"\'elosund#%nbury$$dale#!s"%ford\'&(/results&%hsire&&shiree")idatively',
+    '($pper$&izable$*oreductase#"me"$leys##ips"-man/volunteer"&oacids$%nions#%linic#\'nanions"$pens"$ters"!x"&yanion',
+    '##dol#,gen-depleted)%rived\'\'isotope\'$poor&!.#+harmoglobin$)ydroxides#1tocin-ergometrine#&uroids!"y_"&e-eboe"!l"%seaux!)z/&frac12',
+    '#%180ml#%300ml#%500ml"$alas""en"-one-depletion""ro Ap&acirc;t&eacute;-en-cro&ucirc;te)!e)\'issiers#%mp;cr&!r#\'uml;cht\'(t&eacute"&bsol;a',
+    ')!c*#let*!s)0rez-l&oacute;pez*!i"&gt;0.5"*lcub;0.05)#&e;0.05#+t;0.0000001*!4)!7\'!1")ndash;51d"\'pound;1)!2',
+    ')!5#$rime"8rcaron&iacute;dol&iacute((;emyslid!*\'dayta-pie"%i-p\'i"\'s&amp;q!#(5)""6)""7)""9)""b)!/-&lsqb;atp&rsqb"!1"#38s',
+    '"#90s"+anca/gs-ana"#cas"#dna"+endlabelled"%funky"#gel"!m"%place"%traps##ype!$.106#"14$!9#"21',
+    '$!4$!6$!7$!8$!9#"43$!4$!5#"56#"66#"70$!2$!3$!4$!5',
+    '$!4$!5$!6$!7$!9#"92$!3$!4$!5$!8"#203$!5$!7#"13$!4',
+    '#"34#"40$!1$!5#"52#"70$!2$!5#"82"#309#"12$!3#"40#"67#"70',
+    '$!2%"20#"87$!9"#427#!8$!0"#545"#727#!5#!6#!8""84""90#!7',
+    '"$b.h."$c.c.$#van"$e.m."$l.o."&p.m.v.$$t.v."!r"#s.i"$t.a.$"s."!w##ms.!$/35/#"7/',
+    '"#r/d"!t!$005c!+1(&formula)"%*/lp3"$/lp1#+t1&ndash;t4$!5"\'00/creb$#3.1&"4a$!s#"2b$!c$!l',
+    '""13#"7b""20""45""53""7/""88"!s!#2\'s"$/lp1#"t7$!8""02""49#!c',
+    '#!4""9/"!p!#32/"#731"#978"$a/p4!$4/p5#$t1.1$#2.1&!2""18""60"!9!\'5-based',
+    '"#8.1##5.4"!9"!s!)6&ndash;7""25"!5"!6!#7.1"!3""53""7/#!5""85!"84',
+    '"!6!"9/"!2"!3""44"!8!"=0#%.0003%#148%"21&!2&!4&!6&!8&!9',
+    '%#436&!8%"75$#106%!7%!8$"38$$5263$!6$"76%!8$!8%#524$!9"$1.00',
+    '!%a&deg#(ndash;18#>rcaron&iacute&zcaron;sk&aacute"#\'il"$-28s#%oct-2"#01l#"5s"#103#!5""34"\'c-a-pet#!2#!8#"as',
+    '$(/macgill$\'y/chief&/gloucestershire#*ific-based(#rim\'(/western\'"as#(k-horsed&&unting%%mules$%/peck$&agable&(e-dyeing\'*s/products&(ing-film',
+    '$&ed-out%(t-switch$#ies$$quet#\'otilles##que#"us$$vius#*y-sur-eure$"m1"$dana#!c#(dan-aram$$ison$(lesworth',
+    '##ina#\'manabha#%uasoy$"ca$"ka"#eca#+domorphosis#$onia"%ffard"!g#,an-dominated#-e&lsqb;s&rsqb$#(s)$$-one%%ready',
+    '$"an$$boys$!i$\'perfect$#rie$"s.%%/year$(t-gorman$$wood#*ham/selsey#$nall#)oda-style#!s"(hrmacist"#i-1',
+    '##gns#"n-%(maddened%&racked%\'wracked$,ful-sounding$)t-brushes&\'flecked&)stiffened(&reaked%!.%%ed-on&)r-stainer%"in\'*g/daughter',
+    '%#pot(!s%$shop&%ticks#\'ring-up#,sley-pattern/"ed"*jaczkowska$#mas##tim"#kes#0istan-controlled(,i-controlled),/bangladeshi##kie',
+    '#!s$$haya##ula"%lace1$/eo-anthropology&(botanist&)carpilius\'\'hannels\'*limatology&*geographic\'\'raphers&+scolecidans&&tology&#zic$)iokrassas',
+    '$!s%&tplatz$%tably&"ls%\'ization$#uan%$skas$%zzola#"ce#&e-fawn$$atus$#cio$$face$$ncia%#que',
+    '%$cene$%rnian$\'stinans#%falvi$"fy$%raman#%heiro#&ilalia$\'ndromes$%saded$(zs/szabo#&ladino%#nts%%sades&"ii',
+    '%!r%%twood$"ia%#dly%%ngham%$sade$%yster#(m-dotted%&leaves%\'studded$#ata%!z$$dale$,er-tomkinson&!o',
+    '$&grease$$iers$*oti&cacute$%trees$%yrene##olo$#mbe#(pability%#tes$\'itation#&sgrave#\'triness#!u$!d"$mala',
+    '#)idronate.$%ngton#*makaristos$"ie#&phagus%#ili\'!l#$sons""n-$)authority$(cultural$\'eastern$(germanic$&handle$&london',
+    '%$tick#$acom$$dols$&giotis$"ji$$kton$(m&aacute%\'ericana$#tta#&crease\'-ticotrophical(%ogram)(toxicity#!d$\'anaceae',
+    '%$lani$"ov#$eled%#ist%%lings%"s.$$mone$$ssar#$fida$"ul#(galangan%#mic%#nic%$sius$"ea',
+    '#\'handler#(i&cacute$"c-%"um$$sher#(jandrums#\'lobular#&nekoek%"tt$(ingridge#%pipes$"ra#"sa$#lav#\'tagruel',
+    '%%nassa$"er$%heons&&r-like\'#ion%#rax$$ing.\'!s%#tes$%oland%$mine$$ydwr$#zer#%yukov#%zetta',
+    '"\'palists$%rizov$\'veretum$!y%"as#&egaaij$%r-boy&&cutter&#dry&%games&#the&\'wrapped%&s/year#*hiopedilum#$iere',
+    '$*liochromis%$lae.\'!s&$omas\'"ns#"on$$oses#&pajohn$!s#+rott&eacute#$ua-a&!b&#new#$woth#$yras',
+    '"%ra&gt$)-clinical%%legal%&normal%-professionals%)relations$$.3.3%$4.24%,professional$(ble-like\'%nnius$-chute-trained%\'linical$&disaea\'"e.',
+    '*!a%&oxides\'"us$)esthesiae$%fauna$\'glossae%&uayans$*journalism-#tic$#kou$&legals%*lel-cousin)\'enabled))processor($ized',
+    '&$tico&"ze$$mixa%(yxovirus$&noiacs&#tal$(phenalia&&imosis%$last&$egia$(sagittal&%iling%&iticus\',odiplogaster(\'phorous',
+    '%#has%!i$,uchenoglanis$(variceal%"en$&xylene#\'boiling#*celization$$hamo%-ment-coloured*&shaded##dah$$ners$%ubice#"ek',
+    '\'$type&)/daughter&+s/guardians$"ra$#sce$.to-inefficient\'(relevant\'(superior#\'fumerie#$gesa%$ting#$iage$"ck$\'ng-down$&s-bonn',
+    '&%lyons&&madrid%"io#"k9$\'e-davis%2nd/gloucestershire&!t%&rknoll$*ing-tokens$#ses$%ville$$ways%#ern#!l$\'&eacute',
+    '%(ne-moore%"to$\'iament\'*%arily%#men$!o$#ty.#)ochiality$#dia&%cally&$stic$%nymic$$tids#!p#\'racombe',
+    '$$enin$%hesia$&icides%"ng&!o%$shes$$otia#$shin#\'t-books%"ex%$live%%music%\'numbers%\'objects&"wn',
+    '+#hip$#_of$\'cularly$!d$)enkirchen&%rship%%rship$%henay\'8ogenesis/incompatibility$$ial2\'#ise\'*ly-clothed*\'hearing%0cle-antiparticle)$beam',
+    '&\'oloured&%pants&%ually\'"la)(risation,!e+"ze%#dos%"ja%!r%!s&\'anship.%$tive$$lett%(y-exempt',
+    '\'*ship-based$&ridge.$(s-makers&+per-million$$work$+y-appointed)%roved\'*ssociation&*democratic&%giver&$line&\'members&%trick%$.the%$/tuc',
+    '%!s##viz$"um#&ysatis""s-#&achoff$#jes$#nen$#son#)calsource$\'halides%&endale##hes#$iano$!k',
+    '$#ins#"oc#(s&egrave$%-door$&age(s)\'&-grave\'!d%%rotti$)ementerie%/nger-kilometres)!.)"s.$%ingly%)on-flower(\'killers',
+    '\'(lessness$\'word(s)(-/verification#)t-masters$&a/bean$\'ellists%(ur-lille$&icheur%!e%#ngs$%orali&"ed$(ry-cooks&!.&$cook',
+    '""ta$"ca$(n&eacute$!r%$enes&#scu%#ini$&shoqua#(ch-clamp&$over%"en#\'el/live&&oxford$"ns$(rnalists',
+    '%!k%"na$%etic.("al$(ographic%&typing$!y#(iashvili$*ent/doctor(%nurse\'%swith%#tal$"ma$"o.##ley',
+    '$"ng%!s$)u/british#&riarca($hial%$cide\'!u&\'k/chief&$roft%&monies)!o%#ote\'(s-social%%stics$+on-in-chief',
+    '&"ym#\'scentre#!t$"ar$\'en/dunn\'&lawley&&makers%%rings&-n-recognizing()searching$&ishall$$rick##zak$%schke"$ul\'s',
+    '$%drons$"et$#han$$ista#\'ncefoot $sbcb',
 )
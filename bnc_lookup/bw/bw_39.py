@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_39 = (
+count_39 = 6694
+
+heads_39 = (
     'homo-oligomers',
-    'homo/sexuality',
-    'homoacetogenesis',
-    'homodimer-dna',
-    'homodimeric',
-    'homoeroticism',
-    'homogamy',
-    'homogenize',
-    'homogenizes',
-    'homoiotherms',
-    'homolgies',
-    'homomonument',
-    'homonculus',
-    'homophoric',
-    'homosynaptic',
-    'hondes',
     'honduras-ei',
-    'honess',
-    'honestest',
-    'honey-comb',
-    'honey-roast',
-    'honey-scented',
-    'honey-toned',
-    'honey/county',
-    'honeycomb-like',
-    'honeycomb-shaped',
-    'honeymouth',
-    'honington',
-    'honkenya',
-    'honker',
-    'honne',
-    'honnigsbaum',
     'honoratus',
-    'honoret',
-    'honorial',
-    'hons/ord',
-    'hoo-rah',
-    'hood/gloucestershire',
-    'hoogstraten',
-    'hook-nose',
-    'hook/gliders',
-    'hookahs',
-    'hooken',
-    'hooklines',
-    'hookup',
-    'hooper/thames',
-    'hoopoe-like',
-    'hoor',
     'hootings',
-    'hop-like',
-    'hoped&rehy;for',
-    'hopefull',
-    'hopemoor',
-    'hopfinger',
-    'hopkin/asthma',
-    'hoplogenys',
-    'hoplosternum',
-    'hopman/saddlebrook',
-    'hopped-up',
-    'hopperesque',
-    'hoppringle',
-    'hopton/country',
-    'hopwas',
-    'hordeum',
     'horenstein',
-    'horizon.',
-    'horizontally-structured',
-    'hormaechea',
-    'hormon',
-    'horn-',
-    'horn.',
-    'hornett',
-    'horningsham',
-    'hornsby&ndash;akroyd',
-    'horologist',
-    'horologists',
-    'horrell',
-    'horribleness',
-    'horriblest',
-    'horrifed',
     'horrigan',
-    'horrily',
-    'horringer',
-    'hors_d\'&oelig;uvres',
-    'horsburgh',
-    'horse-',
-    'horse-boys',
-    'horse-brass',
-    'horse-car',
-    'horse-chestnuts',
-    'horse-doctors',
-    'horse-hoeing',
-    'horse-ownership',
-    'horse-races',
-    'horse-shoes',
-    'horse-trappings',
     'horsebreaker',
-    'horsecarts',
-    'horsehage',
-    'horsehoe',
-    'horseperson',
-    'horsepool',
-    'horses-for-courses',
-    'horsewell',
-    'horsewomen',
-    'horsley/gloucestershire',
-    'hortag',
-    'horton-cum-studley',
-    'horton-in-ribblesdale',
-    'hortons',
-    'hory',
-    'hosannas',
     'hosing-down',
-    'hosokawa',
-    'hospital-bed',
-    'hospital-bound',
-    'hospital/clinic',
-    'hospital/unit',
-    'hospitalizations',
-    'hospodar',
-    'hossbach',
-    'host-guest',
-    'host-parasite',
-    'host-specific',
-    'host/target',
-    'host:universities',
-    'hostelisation',
-    'hostellers',
     'hostessly',
-    'hostological',
-    'hot-boxes',
-    'hot-hatch',
-    'hot-head',
-    'hot-heads',
-    'hot-houses',
-    'hot-lines',
-    'hot-melt',
-    'hot-pants',
-    'hot-plate',
-    'hot-pressed',
-    'hot-rodded',
-    'hot-rodders',
-    'hot-to-trotsky',
-    'hot-wired',
     'hotchpot',
-    'hotel-keeping',
-    'hotel/casino',
-    'hotel/guest',
-    'hotel/motel',
-    'hotelkeeping',
-    'hotelship',
-    'hotelympia',
-    'hotfooting',
-    'hothamton',
-    'hotly-contested',
-    'hotly-tipped',
-    'hotol',
-    'hotseat',
-    'hottel',
-    'hottentot',
     'hottie',
-    'hotz',
-    'hotzendorff',
-    'houas',
-    'houasse',
-    'houchen',
-    'houda',
-    'hougharry',
-    'hougoumont',
-    'houmous',
-    'hounces',
-    'houndmills',
-    'hounfort',
-    'hountondji',
-    'hour-a-week',
-    'hour-glasses',
     'hourhand',
-    'hourigan',
-    'housan',
-    'house&rehy;holders',
-    'house&rehy;keeper',
-    'house-boats',
-    'house-breaker',
-    'house-cleaning',
-    'house-holds',
-    'house-hunt',
-    'house-hunters',
-    'house-keepers',
-    'house-not',
-    'house-officer',
-    'house-parties',
-    'house-person',
     'house-plants',
-    'house-senate',
-    'house.the',
-    'houseboys',
-    'housebuyers',
-    'housecall',
-    'housecoats',
-    'housefronts',
-    'houseload',
-    'housemasters',
-    'housemoving',
-    'houseparents',
-    'housewif',
-    'housmans',
-    'housten',
-    'houti',
     'houyhnhnms',
-    'hova',
-    'hove-to',
-    'hovell',
-    'hover-fly',
-    'hovey',
-    'how-',
-    'how-dun-it',
-    'how/why',
-    'howard/first',
-    'howard/michelle',
-    'howard/plaintiff',
-    'howardites',
-    'howbeg',
-    'howell/british',
-    'howerton',
     'howgate',
-    'howkins',
-    'howlings',
-    'howman',
-    'howorth',
-    'howsam',
-    'howtowdie',
-    'howwood',
-    'hox-b',
-    'hoxie',
-    'hoyed',
-    'hoyer',
-    'hoyningen-heune',
-    'hoyos',
-    'hoz',
-    'hp-gl',
     'hp-kf',
-    'hp/works',
-    'hp100lx',
-    'hp13',
-    'hp19',
-    'hp9000s',
-    'hperplasia',
-    'hplc-fluorescence',
-    'hplc-ria',
-    'hpv16/18',
-    'hpz',
-    'hqs',
-    'hr4',
-    'hr6',
-    'hrad&ccaron;ansk&eacute',
-    'hraka',
     'hraun',
-    'hrazdira',
-    'hrcnz',
-    'hreben',
-    'hrota',
-    'hroznov&aacute',
-    'hru&scaron;ica',
-    'hs4',
-    'hs5',
-    'hs649',
-    'hsein-hsu',
-    'hseu',
-    'hsp70',
-    'hsup+',
-    'ht29',
-    'ht4',
     'htbp',
-    'htel',
-    'htfiiia',
-    'htlv3',
-    'hu-go',
-    'huacas',
-    'huamachuco',
-    'huancavelica',
-    'huayna',
-    'huba',
-    'hubacher',
-    'hubbe',
-    'hubbers',
-    'hubbert',
-    'hubbi',
-    'hubbies',
     'hubin',
-    'huchin',
-    'hucker',
-    'huckle-bones',
-    'hucklow',
-    'hude',
-    'hudibras',
-    'hudis',
-    'hudsoned',
-    'hudswell',
-    'hueber',
-    'huene',
-    'huevos',
-    'hugel',
-    'hugest',
-    'huggetts',
     'hughes-hallet',
-    'hughes/daughter',
-    'hughes/nigel',
-    'hughroy',
-    'hughsfield',
-    'hughsie',
-    'hugoline',
-    'huguccio',
-    'huiraatira',
-    'hukanovic',
-    'hukou',
-    'hula-hula',
-    'hull-born',
-    'hull-down',
-    'hullaballoo',
-    'hulsdonck',
     'hulst',
-    'human-beings',
-    'human-centred',
-    'human-created',
-    'human-designed',
-    'human-enhanced',
-    'human-headed',
-    'human-occupied',
-    'human-oriented',
-    'human-pet',
-    'human-readable',
-    'humaneness',
-    'humanlike',
-    'humberside-based',
-    'humbleness',
-    'humbracht',
     'humbrians',
-    'humbs',
-    'hume-adams',
-    'hume-rothery',
-    'humectants',
-    'humidifying',
-    'humilation',
-    'humile',
-    'humint',
-    'hummingbird-pollinated',
-    'humms',
-    'humored',
-    'humoresque',
-    'humorless',
-    'humourists',
-    'humphery',
     'humphery-smith',
-    'humphreys/west',
-    'humphris',
-    'hun-lovers',
-    'hunc',
-    'hunderstand',
-    'hunderthwaite',
-    'hundre',
-    'hundred-and-odd',
-    'hundred-day',
-    'hundred-eyed',
-    'hundred-fold',
-    'hundred-mile',
-    'hundred-per-cent',
-    'hundred-proof',
-    'hundredmen',
     'hundskopf',
-    'hungaria',
-    'hungarian-soviet',
-    'hungarian-style',
-    'hunger-striking',
-    'hungerbuhl',
-    'hungerfords',
-    'hungness',
-    'hungry-looking',
-    'hunguana',
-    'hunke',
-    'hunkiest',
-    'hunlet',
-    'hunley',
-    'hunston',
-    'hunt-ball',
     'hunt-class',
-    'hunt/ben',
-    'hunt/victim',
-    'huntbach',
-    'hunter/warrior',
-    'hunting-gathering',
-    'hunting-whips',
-    'hunting/shooting',
-    'huntrod',
-    'hunts.',
-    'hupehensis',
-    'hupped',
-    'hupper',
-    'hupsos',
-    'huq',
-    'hurak',
     'hurar',
-    'hurcomb',
-    'hurd-major',
-    'hurdle.',
-    'hurds',
-    'hurieh',
-    'hurlement',
-    'hurlstone',
-    'hurman',
-    'hurrahs',
-    'hurrey',
-    'hurseys',
-    'hurst/cam',
-    'hurst/dursley',
-    'hurst/sharpness',
-    'hurst/swindon',
     'hurstfield',
-    'hursthouse',
-    'hurstly',
-    'hursts',
-    'hurtarte',
-    'hurtfulness',
-    'hurtley',
-    'husaby',
-    'husamettin',
-    'husayns',
-    'husba',
-    'husband-dominated',
-    'husband-hunting',
-    'husbands/partners',
-    'huse',
-    'husein',
     'hush-money',
-    'husin',
-    'huskie',
-    'husman',
-    'huson',
-    'husthwaite',
-    'hustu',
-    'hutchesson',
-    'hutchin',
-    'hutchinsiae',
-    'huttenlocher',
-    'huttl',
-    'hutton-mills',
-    'hutton-squire',
-    'hutts',
-    'hutz-medau',
     'huwayj',
-    'huxelrebe',
-    'huyssen',
-    'huysum',
-    'huzzas',
-    'hveravellir',
-    'hwang-ho',
-    'hwarang-do',
-    'hwit',
-    'hws-s310',
-    'hwylfa',
-    'hyaluronic',
-    'hyannis',
-    'hybert',
-    'hybond-n',
-    'hydantoin',
     'hydractive',
-    'hydragas',
-    'hydravion',
-    'hydria',
-    'hydridisation',
-    'hydriodic',
-    'hydro-dynamic',
-    'hydro-massage',
-    'hydro-proteine',
-    'hydrocarbon-generating',
-    'hydrocarbon-producing',
-    'hydrocele',
-    'hydroencephalus',
-    'hydrogas',
-    'hydrogen-filled',
-    'hydrographers',
     'hydrologically',
-    'hydrolysable',
-    'hydrolyses',
-    'hydrolytic',
-    'hydrometers',
-    'hydronium',
-    'hydropathic',
-    'hydroperoxides',
-    'hydrophobia',
-    'hydroponic',
-    'hydroprogne',
-    'hydrops',
-    'hydros',
-    'hydrosulphide',
-    'hydrosulphite',
-    'hydroureter',
     'hydroxide.',
-    'hydroxyethyl',
-    'hydroxyproline',
-    'hydroxypropylmethyl',
-    'hygford',
-    'hyggelig',
-    'hygiena',
-    'hygiene-conscious',
-    'hygienism',
-    'hygromycin',
-    'hygroscopicity',
-    'hylemorphic',
-    'hylemorphism',
-    'hylobatids',
-    'hymans',
-    'hymeneal',
     'hymenopteran',
-    'hymerians',
-    'hymietown',
-    'hymn-like',
-    'hymn-tune',
-    'hymopholus',
-    'hynam',
-    'hyne',
-    'hynek',
-    'hyogo',
-    'hyok',
-    'hypatia',
-    'hype-merchants',
-    'hyper-crisis',
-    'hyper-critical',
-    'hyper-efficient',
     'hyper-media',
-    'hyper-sensitivity',
-    'hyper.',
-    'hyperacuity',
-    'hyperammonaemia',
-    'hyperbolas',
-    'hyperbolically',
-    'hypercatabolic',
-    'hypercium',
-    'hyperconformity',
-    'hyperconscious',
-    'hyperconsciousness',
-    'hypercubes',
-    'hyperendemic',
-    'hyperexcitability',
-    'hyperextensions',
     'hyperglobulinaemia',
-    'hyperglucaemia',
-    'hyperintelligent',
-    'hyperkinesia',
-    'hyperkinesis',
-    'hyperlexic',
-    'hyperlipidaemias',
-    'hyperlipoproteinaemic',
-    'hypermanagement',
-    'hypermanic',
-    'hypernumbers',
-    'hyperosmotic',
-    'hyperparasitising',
-    'hyperpath',
-    'hyperpigmentation',
-    'hyperpluralism',
     'hyperpolarisation',
-    'hyperpolarization',
-    'hyperproliferative',
-    'hyperresponsiveness',
-    'hypersexuality',
-    'hypershow',
-    'hypersimulation',
-    'hyperspatial',
-    'hyperstrophic',
-    'hypertensely',
-    'hypertext-to-text',
-    'hypertexts',
-    'hyperthyroidism',
-    'hyperties',
-    'hypertriglyceridaemic',
-    'hyperventilators',
     'hypervolaemia',
-    'hypno-grooves',
-    'hypnogogic',
-    'hypnopaedia',
-    'hypnovel',
-    'hypo-kulturstiftung',
-    'hypo-osmotic',
-    'hypoacidity',
-    'hypoaesthesia',
-    'hypochlorhydric',
-    'hypocholesterolaemiac',
-    'hypocracy',
-    'hypodermis',
-    'hypogammaglobulinaemia',
-    'hypogea',
-    'hypoglycemia',
     'hypokrites',
-    'hypolipidaemic',
-    'hypomyelination',
-    'hyponatraemia',
-    'hyponymously',
-    'hypophysial',
-    'hypopituitarism',
-    'hypoplastic',
-    'hypoproteinaemia',
-    'hypothecs',
-    'hypothes',
-    'hypothyroid',
-    'hypovolaemic',
-    'hypsographic',
-    'hyrcanus',
-    'hyred',
     'hys',
-    'hystaspes',
-    'hysterization',
-    'hyuseyinov',
-    'i&ndash;v',
-    'i&ntilde;aki',
-    'i&ntilde;ez',
-    'i\'il',
-    'i(2)',
-    'i(b)',
-    'i-&khgr;b',
-    'i-binding',
-    'i-din',
-    'i-i-i',
-    'i-kiribati',
-    'i-linie',
     'i-pou',
-    'i-r-a',
-    'i-restricted',
-    'i-scream',
-    'i-was',
-    'i.4',
-    'i.67',
-    'i.67.2',
-    'i.a.t.a.',
-    'i.b.o.a.',
-    'i.c.b.',
-    'i.c.j.',
-    'i.c.l.q.',
-    'i.c.s',
-    'i.c.s.',
-    'i.d.i.',
     'i.ii.',
-    'i.iii.',
-    'i.l.',
-    'i.l.j.',
-    'i.o.f.',
-    'i.r.a',
-    'i.t.d.',
-    'i.y.',
-    'i/00/26/0035',
-    'i/00/26/0042',
-    'i/00/26/0047',
-    'i/01/23/0002',
-    'i/01/23/0003',
-    'i/01/23/0004',
-    'i/01/23/0005',
-    'i/01/23/0013',
     'i/01/23/0016',
-    'i/01/23/0017',
-    'i/01/23/0018',
-    'i/01/23/0019',
-    'i/01/23/0022',
-    'i/01/23/0023',
-    'i/01/23/0025',
-    'i/01/23/0027',
-    'i/02/26/0072',
-    'i/02/26/0073',
-    'i/02/26/0074',
-    'i/02/26/0077',
-    'i/02/26/0082',
-    'i/03/30/0012-2',
-    'i/03/30/0012-3',
-    'i/03/30/0012-9',
     'i/04/26/0035',
-    'i/04/26/0076',
-    'i/05/26',
-    'i/05/26/0045',
-    'i/05/26/0047',
-    'i/05/26/4',
-    'i/05/26/7',
-    'i/08/25/0001',
-    'i/ad',
-    'i/sal',
-    'i/v',
-    'i586',
-    'i8',
-    'i860s',
-    'i8n',
-    'i933',
     'i960s',
-    'i967',
-    'i970s',
-    'i980',
-    'i982',
-    'iaba',
-    'iai',
-    'iamblichus',
-    'ians',
-    'ianson',
-    'ianthine',
-    'iaran',
-    'iassos',
-    'iatrogenesis',
-    'ib&aacute;rruri',
-    'ibadi',
     'ibaraki',
-    'ibbenb&uuml;ren',
-    'ibbett',
-    'ibd',
-    'iberdrola',
-    'iberica',
-    'ibid.:13',
-    'ibm-hewlett-packard',
-    'ibm-like',
-    'ibm/apple/motorola',
-    'ibm/atp',
-    'ibmulators',
-    'ibne',
-    'iboa/bank',
-    'ibuka',
-    'ic&ocirc;ne',
     'icabalceta',
-    'icam-3/lfa-1',
-    'icare',
-    'ice&rehy;covered',
-    'ice-axes',
-    'ice-bright',
-    'ice-buckets',
-    'ice-capped',
-    'ice-cliffs',
-    'ice-climb',
-    'ice-encrusted',
-    'ice-fields',
-    'ice-hung',
-    'ice-lined',
-    'ice-packs',
-    'ice-pitch',
     'ice-shelf',
-    'ice-worn',
-    'iceboxes',
-    'icecap',
-    'iceton',
-    'ichimonji',
-    'ichneumonidae',
-    'ichneumonids',
-    'ichthyobodo',
-    'ichthyosis',
-    'ichthyostega',
-    'ici/enichem',
-    'icicals',
-    'icilio',
-    'icilma',
-    'ickes',
     'icksworth',
-    'icky',
-    'icm/justitia',
-    'icn/who',
-    'icon-do-it',
-    'iconium',
-    'iconographically',
-    'icp0',
-    'icseaf',
-    'ictal',
-    'ictc',
-    'icteric',
-    'icthus',
-    'id/ego',
-    'id24,400',
-    'id7,200',
     'idaho-based',
-    'idamante',
-    'idar',
-    'iddle',
-    'idea-o-graph',
-    'idealisms',
-    'idealization/abhorrence',
-    'idealogical',
-    'ideators',
-    'ideford',
-    'identi',
-    'identifiability',
-    'identifier(s)',
-    'identifiers/titles',
-    'identifyingly',
-    'ideo',
     'ideographs',
-    'ideoligical',
-    'ideologically-inspired',
-    'ideologie',
-    'idex',
-    'idina',
-    'idiolectal',
-    'idiom.',
-    'idiomaticity',
-    'idioventricular',
-    'idol-worshippers',
-    'idolators',
-    'idolatory',
-    'idomen&eacute;e',
-    'idries',
-    'idrocarburi',
     'idrography',
-    'idti',
-    'ie.e',
-    'ieaun',
-    'ielts',
-    'ien',
-    'iesus',
-    'ievers',
-    'if&formula',
-    'if/ones',
-    'if015331',
-    'if8',
-    'ifang',
-    'ifar',
-    'ifn-&agr',
-    'ifor/ls',
     'ifracombe',
-    'igae',
-    'igapo',
-    'igf-1',
-    'igg2a',
-    'ight',
-    'ign',
-    'ignatenko',
-    'ignatz',
-    'ignorers',
-    'igoe',
-    'iguazu',
-    'ihich',
-    'ihn',
-    'ihs',
-    'ii-based',
     'ii.22',
-    'ii.31',
-    'ii.68',
-    'iiag',
-    'iig',
-    'iii.62',
-    'iii.7',
-    'iii.i.',
-    'iii/iv',
-    'iii/jg27',
-    'iii/jg7',
-    'iii88',
-    'iiics',
-    'iiii',
-    'iijima',
-    'iils',
     'iim',
-    'iims',
-    'iinstitution',
-    'iiro',
-    'iivi',
-    'iivx',
-    'ijlp',
-    'ikast',
-    'ikos',
-    'il&ndash;116',
-    'il-',
-    'il-1&agr',
-    'il-10',
-    'il-6-dependent',
-    'ilbs',
-    'ildana',
     'ildis',
-    'ile-de-la-cit&eacute',
-    'ileachs',
-    'ileocolonoscopy',
-    'ilfis',
-    'ilir',
-    'ilissos',
-    'iliupersis',
-    'ill-articulated',
-    'ill-distributed',
-    'ill-executed',
-    'ill-guarded',
-    'ill-maintained',
-    'ill-matching',
-    'ill-natured',
-    'ill-played',
     'ill-researched',
-    'ill-spelt',
-    'ill-targeted',
-    'ill-temperered',
-    'ill-wishers',
-    'ill-wrapped',
-    'illegitimates',
-    'illesley',
-    'illett',
-    'illgner',
-    'illiberalism',
-    'illimani',
-    'illogan',
-    'illuminatio',
-    'illus.12',
-    'illus.13,14',
     'illus.5',
-    'illusionistically',
-    'illusive',
-    'illustrata',
-    'illustratively',
-    'illustre/1',
-    'illyricum',
-    'ilmi',
-    'iloco',
-    'ilosvay',
-    'ilp.',
-    'ilubabor',
-    'ilyumzhinov',
-    'image-analysed',
-    'image-wise',
-    'imagemaster',
     'imagen',
-    'imagesetters',
-    'imagetool',
-    'imageview',
-    'imagevision',
-    'imaginativeness',
-    'imagizer',
-    'imamali',
-    'imbokodvo',
-    'imbrications',
-    'imbrikia',
-    'imf-endorsed',
-    'imf-imposed',
-    'imf-world',
-    'img.',
-    'imidazole',
     'imine-terminated',
-    'imitrex',
-    'imlay',
-    'imlil-toubkal',
-    'immaturely',
-    'imme',
-    'immersive',
-    'immix',
-    'immobilizes',
-    'immortalizing',
-    'immortelles',
-    'immovability',
-    'immovables',
-    'immunis',
-    'immuno-globulin-like',
-    'immunoaffinity-purified',
     'immunobiological',
-    'immunodeficiencies',
-    'immunodiagnostics',
-    'immunogen',
-    'immunogenetic',
-    'immunogens',
-    'immunohistology',
-    'immunolocalisation',
-    'immunomagnetically',
-    'immunoplate',
-    'immunoprophylaxis',
-    'immunoregulation',
-    'immunostains',
-    'immunotherapeutic',
-    'immure',
-    'imobolin',
     'imp-like',
-    'impact-absorbing',
-    'impallomeni',
-    'impartment',
-    'impassiveness',
-    'impecuniousness',
-    'impecunity',
-    'imperat',
-    'imperatoris',
-    'imperceptive',
-    'imperfecta',
-    'imperfectum',
-    'imperialism\'',
-    'imperils',
-    'impersonalism',
-    'impertinences',
     'impex',
-    'implausibilities',
-    'imple',
-    'implemental',
-    'implicity',
-    'implied.',
-    'implosive',
-    'imploy',
-    'impolitely',
-    'impoliteness',
-    'imponderants',
-    'impor',
-    'importance.',
-    'importantly.',
-    'imposable',
-    'imposed.',
     'impossibile',
-    'imprecisions',
-    'impregnably',
-    'impressive-sounding',
-    'imprisonment.',
-    'impropriate',
-    'impropriations',
-    'improved.',
-    'imprudens',
-    'impruneta',
-    'impudently',
-    'impugns',
-    'impulsivity',
-    'imrik',
-    'imry',
-    'ims/esa',
     'imsa',
-    'imtimidation',
-    'in&eacute;gales',
-    'in&ndash;service',
-    'in-bleeper',
-    'in-bye',
-    'in-cell',
-    'in-chol',
-    'in-deed',
-    'in-earnest',
-    'in-existence',
-    'in-field',
-    'in-fights',
-    'in-foal',
-    'in-focus',
-    'in-hours',
     'in-offs',
-    'in-pace',
-    'in-plane',
-    'in-point',
-    'in-print',
-    'in-roads',
-    'in-surance',
-    'in-the-foot',
-    'in-to',
-    'in.american',
-    'in/lack',
-    'in0',
-    'in1984',
-    'in1988',
-    'in_er_general',
-    'in_in_conjunction_with',
     'in_in_general',
-    'in_in_relation_to',
-    'in_in_response_to',
-    'in_propria_persona',
-    'inabata',
-    'inada',
-    'inaddo',
-    'inadmissable',
-    'inalcik',
-    'inapparent',
-    'inappropiate',
-    'inarguable',
-    'inarticulates',
-    'inavailability',
-    'inbreed',
-    'inc-apple',
     'inc-based',
-    'inc-inspired',
-    'inc/motorola',
-    'incamination',
-    'incana',
-    'incandescently',
-    'incantato',
-    'incarcerational',
-    'incendium',
-    'incense-burner',
-    'incentive/disincentive',
-    'incept',
-    'inceptions',
-    'incertus',
-    'inchbald',
-    'inchoative',
     'inchrya',
-    'incisura',
-    'incisure',
-    'inciters',
-    'incivilities',
-    'includ',
-    'inclusion-free',
-    'incoherences',
-    'incoherency',
-    'incola',
-    'income-leisure',
-    'income-less',
-    'income-maintenance',
-    'income/expenditure',
-    'income/poverty',
-    'incomer/shetlander',
     'incommoded',
-    'incompetences',
-    'incompletion',
-    'incon',
-    'incongruency',
-    'inconsequently',
-    'inconsistences',
-    'inconspicuousness',
-    'incontinency',
-    'incontinentia',
-    'incontri',
-    'inconveniencies',
-    'incorrectness',
-    'incorruptibles',
-    'increase.',
-    'increased/decreased',
     'increaser',
-    'incred',
-    'incredibility',
-    'increment/decrement',
-    'incrementalist',
-    'incriminates',
-    'incriminatingly',
-    'incriminatory',
-    'incrustation',
-    'incrustations',
-    'incstar',
-    'incubatory',
-    'incubi',
-    'inculpate',
-    'inculturation',
-    'incut',
     'ind&eacute;pendance',
-    'indamiro',
-    'indar',
-    'indecisions',
-    'indefensibly',
-    'indefinability',
-    'indemnified.',
-    'indemnifiers',
-    'indemnity.',
-    'indenters',
-    'indentification',
-    'indentify',
-    'independence-oriented',
-    'independents3',
-    'indespension',
-    'indeterminately',
     'index-finger',
-    'indexicality',
-    'indge',
-    'indian-administered',
-    'indian-ness',
-    'indian-owned',
-    'indicies',
-    'indie-pop',
-    'indie-rock',
-    'indigenes',
-    'indigo-dyed',
-    'indigos',
-    'indispensably',
-    'indisputedly',
-    'individual&mdash;is',
-    'individual(s)',
     'individual-based',
-    'individual-characteristic',
-    'individual/',
-    'individual/group',
-    'individualities',
-    'individuals-do',
-    'individuative',
-    'indo-',
-    'indo-african-america',
-    'indo-anglian',
-    'indo-nepalese',
-    'indo-russian',
-    'indo-sri',
-    'indomalesian',
-    'indomitably',
-    'indonesian-sponsored',
     'indoor/outdoor',
-    'indooroopilly',
-    'indow',
-    'indrani',
-    'induced-polarisation',
-    'inductance/resistance',
-    'indult',
-    'induppe',
-    'induration',
-    'industrial-economics',
-    'industrial-scale',
-    'industrial-urban',
-    'industrialises',
-    'industrializes',
-    'industrially-oriented',
-    'industrially-relevant',
     'industry-funded',
-    'industry-leading',
-    'industry-watchers',
-    'industry/commerce',
-    'industry/market',
-    'indy-500',
-    'indyk',
-    'ine&rehy;qualities',
-    'ineffability',
-    'ineffectuality',
-    'inefficient.',
-    'inegalitarianism',
-    'inelastically',
-    'inermis',
-    'inerting',
-    'inertly',
     'ineson',
-    'inestimably',
-    'inestrillas',
-    'inevitabilities',
-    'inevitabl',
-    'inexactitude',
-    'inexhaustibly',
-    'inexpensiveness',
-    'inexpertise',
-    'inexpressively',
-    'infallibilism',
-    'infant-care',
-    'infant-formula',
-    'infantil',
-    'infantilisation',
-    'infantilization',
     'infantum',
-    'infarct-related',
-    'infarcted',
-    'infecton',
-    'infedels',
-    'inference-procedures',
-    'inferiorization',
-    'infernale',
-    'infiltrations',
-    'infini',
-    'infinit',
-    'infinite-dimensional',
-    'infinitely-lived',
-    'infinitely-thin',
-    'infinitum',
-    'inflamation',
     'inflamatory',
-    'inflation.',
-    'inflator',
-    'inflecting',
-    'influenzi',
-    'infoboxes',
-    'infomix',
-    'infopro',
-    'informatik',
-    'information-flows',
-    'information-giver',
-    'information-independent',
-    'information-intensive',
-    'information-only',
-    'information/data',
-    'information/enquiry',
     'information/orientation',
-    'informationsdienst',
-    'informationssyteme',
-    'informativeness',
-    'informin\'',
-    'informix-sql',
-    'informtion',
-    'infractors',
-    'infrahuman',
-    'infrarenal',
-    'infront',
-    'infu',
-    'infusate',
-    'ing&eacute;nu',
-    'ing&oacute;lfsh&ouml;f&dstrok;3i',
-    'ingathering',
     'inger',
-    'ingermalls',
-    'inggit',
-    'inghilterra',
-    'ingil',
-    'ingl&eacute;sa',
-    'inglaterra',
-    'ingle-neuk',
-    'ingle-nook',
-    'inglesant',
-    'ingo',
-    'ingrao',
-    'ingrates',
-    'ingratiates',
-    'ingres/windows4gl',
-    'ingression',
     'inhelder',
-    'inherit-upto-state',
-    'inhibitable',
-    'inhumanism',
-    'inion',
-    'injection-moulding',
-    'injournalism',
-    'injuctions',
-    'injuries.',
-    'injury-dogged',
-    'injury-troubled',
-    'ink-wells',
-    'ink.',
-    'inka',
-    'inkahta',
-    'inkberrow',
     'inkeles',
-    'inkinc',
-    'inliers',
-    'inline',
-    'inmaculada',
-    'inmigrants',
-    'inn-keepers',
-    'inner-outer',
-    'inner-suburban',
-    'innerwick',
-    'innfront',
-    'innins',
-    'innocence/ignorance',
-    'innocency',
-    'innoculated',
-    'innoculations',
     'innovaci&oacute;n',
-    'innsbruck/patsch',
-    'inntreprenuer',
-    'innuit',
-    'innumerous',
-    'innvest',
-    'inoccupation',
-    'inoculants',
-    'inovatic',
-    'inputroutines',
-    'inquilivi',
-    'inquisitorially',
-    'inravision',
-    'insanities',
-    'insect-eaters',
-    'insect-repelling',
     'insect-ridden',
-    'insects.',
-    'inseparabel',
-    'insertless',
-    'insh',
-    'insi',
-    'insident',
-    'insider/anthropologist',
-    'insiderism',
-    'insight-promoting',
-    'insightfully',
-    'insigne',
-    'insignificant-looking',
-    'insilco',
-    'insipidity',
-    'insipidness',
     'inslaw',
-    'insobriety',
-    'insolvents',
-    'insome',
-    'inspe',
-    'inspir',
-    'inspirationally',
-    'installation/deinstallation',
-    'installation/performance',
-    'installationists',
-    'instance&ndash',
-    'instant-access',
-    'instauration',
-    'instigations',
-    'instillations',
-    'instills',
     'instinctually',
-    'institu-tions',
-    'institute/riba',
-    'institutes/colleges',
-    'institution-based',
-    'institution/company',
-    'institutionalises',
-    'institutionalist',
-    'instituut',
-    'instructively',
-    'instructor/supervisors',
-    'instrument.',
-    'instrumentations',
-    'instrumento',
-    'instruzione',
-    'insufflations',
     'insulation.',
-    'insulin-like',
-    'insulinomas',
-    'insur',
-    'insurance-beating',
-    'insurance-related',
-    'insured.',
-    'insurgencies',
-    'insurrectionist',
-    'insusceptible',
-    'inswingers',
-    'int&eacute;rieure',
-    'intangibly',
-    'integer-spin',
-    'integral-order',
-    'integration/segregation',
     'integrational',
-    'integratory',
-    'integro-differential',
-    'integumentary',
-    'intek',
-    'intel-compatible',
-    'intel-configured',
-    'intel-to-alpha',
-    'intel-unix',
-    'intellectualise',
-    'intellectum',
-    'intelligence.',
-    'intelligencer',
-    'intelligentsias',
-    'intellisphere',
-    'intemerata',
     'intendency',
-    'intensest',
-    'intensity-correlated',
-    'intensives',
-    'intent.',
-    'inter&rehy;dependence',
-    'inter-adult',
-    'inter-alia',
-    'inter-block',
-    'inter-board',
-    'inter-branch',
-    'inter-campus',
-    'inter-class',
-    'inter-digital',
-    'inter-glacial',
-    'inter-granular',
     'inter-imperialist',
-    'inter-institute',
-    'inter-married',
-    'inter-media',
-    'inter-milan',
-    'inter-nationality',
-    'inter-observer',
-    'inter-oceanic',
-    'inter-operable',
-    'inter-operate',
-    'inter-operating',
-    'inter-organisational',
-    'inter-planetary',
-    'inter-policy',
-    'inter-pregnancy',
-    'inter-probe',
     'inter-pub',
-    'inter-record',
-    'inter-senior',
-    'inter-sessional',
-    'inter-strain',
-    'inter-subjectivity',
-    'inter-uterine',
-    'inter-visibility',
-    'inter-word',
-    'interactionally',
-    'interapp',
-    'interation',
-    'interational',
-    'interbook',
-    'interbrew',
-    'interbrollies',
     'intercalators',
-    'intercessionary',
-    'intercolonial',
-    'intercorrelation',
-    'intercurricular',
-    'interdab',
-    'interdependences',
-    'interdictions',
-    'interdicts',
-    'interdigitation',
-    'interdivisional',
-    'interdomain',
-    'intere',
-    'interest-based',
-    'interest-rates',
-    'interest/dividend',
     'interexec',
-    'interface-oriented',
-    'interfacetest3',
-    'interfauna',
-    'interference.',
-    'interferior',
-    'interferograms',
-    'interfields',
-    'interfiled',
-    'interflash',
-    'interfollicular',
-    'interfront',
-    'intergenerationally',
-    'intergrowths',
-    'interinstitutional',
-    'interlectual',
     'interlinks',
-    'interlobular',
-    'intermadiate',
-    'intermanageability',
-    'intermarch&eacute',
-    'intermarket',
-    'intermediate-',
-    'intermediatory',
-    'intermedio',
-    'intermedium',
-    'intermenstrual',
-    'intermitotic',
-    'intermittence',
-    'internalises',
-    'internally-assessed',
-    'internationalistic',
     'internationalize',
-    'internationally-agreed',
-    'internationally-famous',
-    'internationally-funded',
-    'internationally-known',
-    'internationally-renowned',
-    'interneuronal',
-    'internodes',
-    'internos',
-    'internuncio',
-    'interocean',
-    'interoceanic',
-    'interocular',
-    'interopen/posix',
-    'interopercular',
-    'interositor',
     'interpellate',
-    'interpellates',
-    'interpenetrations',
-    'interpersonally',
-    'interplak',
-    'interplayce',
-    'interplus',
-    'interpolator',
-    'interpr&egrave;tes',
-    'interpractice',
-    'interpres',
-    'interpretatio',
-    'interprete',
-    'interpretively',
-    'interprocedural',
-    'interrelates',
     'interrompue',
-    'interruptedly',
-    'interruptor',
-    'intersegmentalia',
-    'interserv',
-    'intersexual',
-    'intersheet',
-    'intersleeve',
-    'intersocietal',
-    'interspaces',
-    'intersphincteric',
-    'interst',
-    'interstitially',
-    'intersubjectively',
-    'intertech',
-    'intertribal',
     'intertropical',
-    'interv',
-    'intervals.',
-    'intervener',
-    'interview/powermib',
-    'intervoo',
-    'interweavings',
-    'interwest',
-    'intial',
-    'intihuatana',
-    'intimes',
-    'intimidations',
-    'intire',
-    'intirely',
-    'intisari',
-    'intitially',
     'intolerable.',
-    'intolerantly',
-    'intonazioni',
-    'intra-afghan',
-    'intra-asian',
-    'intra-cellular',
-    'intra-comecon',
-    'intra-departmental',
-    'intra-ems',
-    'intra-familial',
-    'intra-generationally',
-    'intra-governmental',
-    'intra-hepatic',
-    'intra-marginal',
-    'intra-medium',
-    'intra-oesophageal',
     'intra-personal',
-    'intra-professional',
-    'intra-rural',
-    'intra-shia',
-    'intra-skeletal',
-    'intra-team',
-    'intra_vires',
-    'intraarterial',
-    'intracellulare',
-    'intrachain',
-    'intracoronary',
-    'intracorporeal',
-    'intractably',
-    'intracutaneous',
-    'intrafirm',
-    'intrahippocampal',
     'intraileal',
-    'intraindividual',
-    'intramuscularly',
-    'intranasally',
-    'intraneuronal',
-    'intranucleotide',
-    'intrapancreatic',
-    'intrapatient',
-    'intravariceal',
-    'intraveneously',
-    'intre',
-    'intrepidness',
-    'intric',
-    'intro/verse',
-    'introducers',
-    'introjecting',
     'introversion/extraversion',
-    'introvert/extrovert',
-    'intrumental',
-    'intubate',
-    'intussusception',
-    'intvs',
-    'inundates',
-    'inure',
-    'inutile',
-    'invariability',
-    'invenio',
-    'inverchapel',
-    'inverliever',
-    'invesco-mim',
-    'investable',
-    'investee',
     'investigatively',
-    'investigator-in-charge',
-    'investment-services',
-    'investor-relations',
-    'investronica',
-    'invi',
-    'inviable',
-    'inviduals',
-    'inview',
-    'invigamise-who-was-born',
-    'invigoratingly',
-    'invincibles',
-    'inviolably',
-    'inviscid',
-    'invitin\'',
-    'involatile',
     'involucrata',
-    'involv',
-    'inward-',
-    'inward-facing',
-    'inwardlooking',
-    'iob',
-    'iodination',
-    'iodophor',
-    'ioka',
-    'iolaos',
-    'iolo',
-    'ion-dipole',
-    'ion-image',
-    'ion-leachable',
-    'ion/glucose',
-    'ionatana',
     'ionically',
-    'ionides',
-    'ionizations',
-    'ionotropic',
-    'iontana',
-    'iota&amp;sup1',
-    'iotas',
-    'iour',
-    'ip2',
-    'ip24',
-    'ip28',
-    'ip4',
-    'iparaquirre',
-    'ipmpa',
-    'ippen',
-    'ippons',
     'ipsc/860',
-    'ipseco',
-    'ipsius',
-    'iqsoft',
-    'ir&pound',
-    'ir&pound;0.5',
-    'ir&pound;1.2',
-    'ir&pound;200',
-    'ir&pound;400',
-    'ir&pound;76.3',
-    'ir&pound;8.6',
-    'ir&pound;9.1',
-    'ir/r',
-    'iraj',
-    'iraklion',
-    'iran-united',
     'iran/contra',
-    'iranian-brokered',
-    'iranian-us',
-    'iraq-based',
-    'iraqi-kurdish',
-    'iraqi-turkish',
-    'irascaris',
-    'irascibly',
-    'irately',
-    'iraty',
-    'iredale',
-    'irek',
-    'irelands',
-    'irenes',
-    'irfanullah',
-    'irial',
     'irias',
-    'iridologist',
-    'irims',
-    'irish-bred',
-    'iritis',
-    'iriyagolle',
-    'irm',
-    'irmela',
-    'irokawa',
-    'iron-banded',
-    'iron-bar',
-    'iron-barred',
-    'iron-deficiency',
-    'iron-filings',
-    'iron-founders',
-    'iron-toothed',
     'iron-willed',
-    'ironclaws',
-    'ironed-out',
-    'ironers',
-    'ironhand',
-    'ironie',
-    'ironist',
-    'ironsides',
-    'irredentists',
-    'irrefragable',
-    'irregardless',
-    'irregularly-shaped',
-    'irrelevent',
-    'irreplaceability',
-    'irreplaceably',
-    'irresistibility',
     'irresoluble',
-    'irresolutions',
-    'irrespectively',
-    'irrevocability',
-    'irridescent',
-    'irrigates',
-    'irritators',
-    'irs16',
-    'irscade',
-    'irshidat',
-    'irsp',
-    'irt',
-    'irvington',
-    'iryt',
-    'is**',
-    'is-like',
     'is/2',
-    'is2.4077',
-    'is231a',
-    'is_due',
-    'is_no',
-    'is_subject',
-    'isak',
-    'isakson',
-    'isanov',
-    'isard',
-    'ischemia-reperfusion',
-    'ischemic',
-    'ischial',
-    'ischium',
-    'iscor',
-    'isdd',
     'isee/accell',
-    'ishams',
-    'ishigaki',
-    'ishikawajima-harima',
-    'ishiko',
-    'ishimure',
-    'isitt',
-    'iskandar',
-    'islamia',
-    'islamiah',
-    'island-dotted',
-    'island-hopped',
-    'island-like',
-    'islands.',
-    'islas',
-    'islesman',
     'isleten',
-    'ismailiya',
-    'ismar',
-    'iso-',
-    'iso-based',
-    'iso9000',
-    'isobutane',
-    'isochron',
-    'isocratic',
-    'isocyanic',
-    'isodry',
-    'isoenet',
-    'isoflurane',
-    'isoform-specific',
-    'isogas',
-    'isolatable',
     'isolation-reared',
-    'isolda',
-    'isomerisations',
-    'isomerisms',
-    'isomerization',
-    'isomorphically',
-    'isonitrogenous',
-    'isopleths',
-    'isopropyl',
-    'isopycnal',
-    'isotatic',
-    'isotelus',
-    'isotopically-enriched',
-    'isovolumetric',
-    'ispaghul',
-    'ispartof',
     'ispf/pdf',
-    'isr',
-    'israel-based',
-    'israel-plo',
-    'israel-syria',
-    'israelensis',
-    'israeli-sponsored',
-    'israeli-type',
-    'israelson',
-    'isrotel',
-    'isrs',
-    'iss-prealc',
-    'issaacs',
-    'issaka',
-    'issenmann',
-    'issu',
     'issue-areas',
-    'ist&uacute;riz',
-    'istan',
-    'istar',
-    'isthmian',
-    'istiklal',
-    'istory',
-    'ists',
-    'isus',
-    'isy',
-    'it\'sa',
-    'it\'ud',
-    'it-but',
-    'it-i',
-    'it-if',
-    'it-is',
     'it-structure',
-    'it.a',
-    'it.i',
-    'it/',
-    'it/them',
-    'it52',
-    'it_a',
-    'it_at',
-    'ital-reding',
-    'italcable',
-    'italian-funded',
-    'italian-sounding',
-    'italianism',
-    'italico',
-    'italicum',
-    'italiens',
     'itanagar',
-    'itchela-ka',
-    'itchenor',
-    'itchicoo',
-    'itchily',
-    'itching-powder',
-    'itchy-fingered',
-    'itea',
-    'item.found.in',
-    'item/input',
-    'itfadel',
-    'ithamar',
-    'ithyphallic',
-    'itinerated',
-    'itm',
-    'itmf',
     'itoe',
-    'itpc',
-    'itraconazole',
-    'its/88',
-    'itsa/organisation',
-    'itself\'',
-    'itten',
-    'itteville',
-    'itty',
-    'ituc',
-    'ituri',
-    'itzehoe',
-    'iu&times;10/h',
-    'iu/g',
-    'iu/mg',
-    'iubhair',
     'iudicati',
-    'iuir',
-    'iun',
-    'iurminburg',
-    'iurminburh',
-    'iussus',
-    'iuzhamtorg',
-    'ivaldi',
-    'ivananusko',
-    'ivens',
-    'ivernia',
-    'ivery',
-    'ivica',
-    'ivied',
-    'ivin',
-    'ivings/farmer',
     'ivoirian',
-    'ivone',
-    'ivory-ban',
-    'ivory-topped',
-    'ivory-tower',
-    'ivp',
-    'ivverybody',
-    'ivy-leaf',
-    'ivyester',
-    'iw',
-    'iwad',
-    'iwanami',
-    'iwata',
-    'iwerne',
-    'iwth',
-    'ixer',
     'ixoras',
-    'ization',
-    'izatt',
-    'izmery',
-    'izzy-jack',
-    'j&amp;p',
-    'j&auml;ger',
-    'j&auml;gr',
-    'j&dollar;7,049',
-    'j&ntilde&amacr;na',
-    'j&oacute;zsef',
-    'j&oslash;rgenson',
-    'j&uuml;ntgen',
-    'j\'y',
-    'j+a1',
-    'j-direction',
     'j-johnnie',
-    'j-p',
-    'j-stars',
-    'j.-a',
-    'j.a.g.',
-    'j.b.butcher',
-    'j.d.b.',
-    'j.e.l.',
-    'j.f',
-    'j.f.c.',
-    'j.f.s.',
-    'j.g.a.',
-    'j.g.v.a.',
-    'j.j.c.',
-    'j.m.barrie',
-    'j.n.l.',
     'j.n.u.',
-    'j.o',
-    'j.p.j.',
-    'j.s.mill',
-    'j.w.b.',
-    'j.w.h.t.',
-    'j/5f',
-    'j/month',
-    'j1&ndash;80',
-    'j11',
-    'j13',
-    'j2',
-    'j28',
-    'j3c&ndash;65',
-    'j7w1',
-    'j89',
     'j9',
-    'j94',
-    'j=9',
-    'jaaez',
-    'jaak',
-    'jaan',
-    'jabil',
-    'jabr',
-    'jabri',
-    'jabrut',
-    'jaccard',
-    'jacje',
-    'jack-arch',
-    'jack-knifes',
-    'jack-roller',
-    'jackal-like',
     'jacked-up',
-    'jacketless',
-    'jackfield',
-    'jacklet',
-    'jacknifed',
-    'jackplug',
-    'jackrabbit',
-    'jackrock',
-    'jacks-in-office',
-    'jacob/son',
-    'jacobaea',
-    'jacobea',
-    'jacobello',
-    'jacobi/fair',
-    'jacobsonian',
-    'jacomb',
     'jaconet',
-    'jacopone',
-    'jacpacs',
-    'jacqueries',
-    'jacques-emile',
-    'jacques-louis',
-    'jacques-nicolas',
-    'jacques-roger',
-    'jacques-yves',
-    'jacquet',
-    'jacquier',
-    'jade-like',
-    'jadwiga',
-    'jae',
-    'jael',
-    'jaenbert',
     'jaeschke',
-    'jagannath',
-    'jaggard-lai',
-    'jagged-edge',
-    'jagged-edged',
-    'jaggernath',
-    'jaggery',
-    'jaggi',
-    'jaggies',
-    'jagiellonian',
-    'jaguar-driving',
-    'jaguaribe',
-    'jahnhorst',
-    'jahnke-emde-losch',
-    'jahra',
-    'jahre',
     'jahreszeiten',
-    'jahweh',
-    'jaichandra',
-    'jailbreak',
-    'jailor',
-    'jaipal',
-    'jaipur&ndash;agra',
-    'jaki',
-    'jakobovits',
-    'jakub',
-    'jakubsk&aacute',
-    'jalbert',
-    'jaldar',
-    'jalfrezi',
-    'jalihal',
-    'jalopies',
     'jam-filled',
-    'jama\'ah',
-    'jamai',
-    'jambaldorj',
-    'jambe',
-    'jamei',
-    'james/herefordshire',
-    'jamesie',
-    'jametz',
-    'jamiat-e-islami',
-    'jampel',
-    'jampot',
-    'jamshedpur',
-    'jan&aacute&ccirc;ek',
-    'jan-apr',
-    'janabi',
     'jandi',
-    'jandl',
-    'janeen',
-    'janek',
-    'janets',
-    'janetta',
-    'jangel',
-    'janissary',
-    'jank\'o',
-    'jankers',
-    'jankovic',
-    'jankovski',
-    'jankowitsch',
-    'janni',
-    'jannings',
-    'janospira',
     'janov',
-    'janovitz',
-    'jans',
-    'jansenists',
-    'janta',
-    'januar',
-    'januarius',
-    'january&ndash;thu',
-    'january-november',
-    'january-september',
-    'jany',
-    'japan-us',
-    'japan/germany',
-    'japanese-',
-    'japanese-based',
-    'japanese-dominated',
     'japanese-inspired',
-    'japanese-led',
-    'japanese-occupied',
-    'japanese-soviet',
-    'japaneseness',
-    'japery',
-    'japp',
-    'jappy',
-    'jaralla',
-    'jarba',
-    'jard',
-    'jarden',
-    'jardine/scotland',
-    'jardini&egrave;res',
-    'jargonelle',
-    'jarju',
     'jarl',
-    'jarman/oxfordshire',
-    'jarmans',
-    'jarmen',
-    'jaron',
-    'jaroslavsky',
-    'jarov',
-    'jarram',
-    'jarringly',
-    'jarros',
-    'jarudi',
-    'jarvis/disabled',
-    'jascha',
-    'jasenovac',
-    'jaslovske',
-    'jasmina',
     'jasmine-scented',
-    'jasny',
-    'jasomirgott',
-    'jasoorah',
-    'jass',
-    'jastrzebie',
-    'jates',
-    'jati',
-    'jauch',
-    'javogue',
-    'jaw-bones',
-    'jaw-breaking',
-    'jaw-like',
-    'jawar',
-    'jawg',
-    'jay/car',
     'jayawardene',
-    'jaynie',
-    'jazairy',
-    'jazbinsek',
-    'jazz-classical',
-    'jazz-soul',
-    'jazz-style',
-    'jazz/blues',
-    'jazz/fusion',
-    'jazz/soul',
-    'jazzdom',
-    'jazzer',
-    'jazzier',
-    'jb4',
-    'jbase',
-    'jc001',
     'jce',
-    'jcr2l',
-    'jcwi',
-    'jd-g',
-    'jdaayel',
-    'jdm',
-    'jean-de-luz',
-    'jean-l&eacute;onard',
-    'jean-lois',
-    'jean-loup',
-    'jean-rene',
-    'jean-robert',
-    'jeanine',
-    'jeanna',
-    'jeanneney',
-    'jebha-i-nejat-i-melli',
     'jedhe',
-    'jedidiah',
-    'jeepneys',
-    'jeeringly',
-    'jeewoolall',
-    'jeffcoate',
-    'jeffereys',
-    'jeffersonian',
-    'jeffrie',
-    'jefri',
-    'jeg3',
-    'jegsy',
-    'jehangir',
-    'jehanne',
-    'jehova',
-    'jellybabies',
     'jellycrusts',
-    'jellylike',
-    'jemma-jane',
-    'jemmat',
-    'jemmel',
-    'jen&ouml',
-    'jenifer',
-    'jenisch',
-    'jennetts',
-    'jeopardies',
-    'jephtha',
-    'jer&oacute;nimo',
-    'jerash',
-    'jerbah',
-    'jere',
-    'jereminy',
     'jeronimo',
-    'jerre',
-    'jerusha',
-    'jervell-lange-nielsen',
-    'jerviston',
-    'jescomea',
-    'jesperson',
-    'jessies',
-    'jessore',
-    'jestetten',
-    'jesuitical',
-    'jeszensky',
-    'jet&eacute;e',
-    'jet-pipes',
-    'jetadmin',
-    'jetliners',
     'jetpack',
-    'jetsetter',
-    'jetskiers',
-    'jettisons',
-    'jew-baiting',
-    'jewel-studded',
-    'jewellery.',
-    'jewett',
-    'jewish-american',
-    'jewish/zionist',
-    'jezzin',
-    'jezzine',
-    'jhally',
-    'jharokha',
-    'jhfenner',
-    'jiangxing',
     'jianxin',
-    'jianxing',
-    'jiaxing',
-    'jidda',
-    'jiefangjun',
-    'jig-saws',
-    'jigawa',
-    'jiggler',
-    'jigjidyn',
-    'jigoro',
-    'jigsaw-puzzle',
-    'jih',
-    'jihlava',
-    'jijun',
-    'jillings',
-    'jims',
     'jinglin\'',
-    'jingoes',
-    'jingzhi',
-    'jiniwin',
-    'jink-back',
-    'jiricna',
-    'jittering',
-    'jkap',
-    'jm101',
-    'jmc',
-    'jmob',
-    'jmp50',
-    'jnp',
-    'jo&sacute',
-    'jo-okes',
-    'joacquin',
     'joanmount',
-    'joans',
-    'job-costing',
-    'job-displacing',
-    'job-hungry',
-    'job-killer',
-    'job-lots',
-    'job-security',
-    'job-shop',
-    'job-specific',
-    'job/',
-    'job/interview',
-    'jobbies',
-    'jobbys',
-    'jobey',
-    'jobs-cuts',
     'jobson/',
-    'jobsons',
-    'jobsworths',
-    'joby',
-    'jock-strap',
-    'jocoem',
-    'jodal',
-    'jodels',
-    'jodhi',
-    'jodhpur-like',
-    'jodhs',
-    'jodicus',
-    'jodl',
-    'jofless',
-    'jog/shuttle',
-    'jogo',
     'jogsuit',
-    'jogvan',
-    'johal',
-    'johannesburg-soweto',
-    'johannson',
-    'john-go-to-bed-at-noon',
-    'john1',
-    'johna',
-    'johnathon',
-    'johnsey',
-    'johnson-acsadi',
-    'johnson-merck',
-    'johnson/northamptonshire',
-    'johnsonians',
-    'johnston-trained',
-    'joho',
     'join-side',
-    'joinson',
-    'joint-honours',
-    'joint-managers',
-    'joint-owned',
-    'joint-owner',
-    'joint-ventures',
-    'jointly-authored',
-    'joio',
-    'joist-hangers',
-    'joka',
-    'joke-books',
-    'jolas',
-    'joliot-curie',
-    'jolles',
-    'jolliness',
     'jolsen',
-    'jolypha',
-    'jomeo',
-    'jonahs',
-    'jones-designed',
-    'jones-gotman',
-    'jones/associate',
-    'jones/chief',
-    'jones/deputy',
-    'jones/director',
-    'jones/district',
-    'jones/honda',
-    'jonge',
-    'jonke',
-    'jonn',
-    'jonners',
     'jonnsen',
-    'joop',
-    'joost',
-    'jope',
-    'jopek',
-    'joplings',
-    'jopp',
-    'jordache',
-    'jordan-volpe',
-    'jordanaires',
-    'jordanella',
-    'jordanian-iraqi',
-    'jordanian/palestinian',
-    'jorde',
-    'jores',
-    'joschka',
     'joseanne',
-    'josenhans',
-    'joseph-marie',
-    'joseph-robinson',
-    'josephat',
-    'josephina',
-    'josephinism',
-    'josette',
-    'joslyn',
-    'josphat',
-    'josser',
-    'jossey',
-    'josslyn',
-    'jotunheim',
-    'journal-constitution',
-    'journalist.',
     'journees',
-    'journeys.',
-    'journeywomen',
-    'jousters',
-    'jouvert',
-    'jouvet',
-    'jovel',
-    'jovinianus',
-    'jovis',
-    'jowters',
-    'joxer',
-    'joycie',
-    'joye',
-    'joypad',
-    'joyspike',
-    'joystretch',
     'jpdup',
-    'jpmmillar',
-    'jpn',
-    'jsc',
-    'jsl',
-    'jsm',
-    'jtag',
-    'jtm',
-    'jtmp',
-    'jto',
-    'ju&aacute;rez',
-    'ju52/3ms',
-    'ju87r',
-    'judaisers',
-    'judelson',
-    'juden',
     'judge/hereford',
-    'judice',
-    'judicialization',
-    'judkins',
-    'juelich',
-    'jug-eared',
-    'jugendhilfegesetz',
-    'jugglery',
-    'jugulars',
-    'juhantalo',
-    'jui',
-    'juice.',
-    'juiciness',
-    'juive',
-    'jujitsu',
-    'jujube',
     'jukti',
-    'julenisse',
-    'juleps',
-    'juliae',
-    'julias',
-    'julier',
-    'julliard',
-    'jullundur',
-    'julsrud',
-    'julu',
-    'july&mdash;see',
-    'july&ndash;28',
-    'july-7',
-    'july-8',
-    'july-december',
-    'july-october',
     'july-sept.',
-    'jum',
-    'juma',
-    'jumaa',
-    'jumbled-up',
-    'jumblespeech',
-    'jumbo-sized',
-    'jumieges',
-    'jumpin',
-    'jumpiness',
-    'jumpman',
-    'jumpmaster',
-    'jun&iacute;n',
-    'junack',
-    'junceiforme',
-    'juncker',
     'junctional/cardiac',
-    'june&ndash;31',
-    'june-17',
-    'june-22',
-    'june-25',
-    'june-31',
-    'june-6',
-    'june-7',
-    'june-9',
-    'june-august',
-    'june-december',
-    'jungle-like',
-    'jungle-wise',
-    'jungwon',
-    'junichiro',
-    'junior-school',
     'junior/middle',
-    'junipery',
-    'junk-grade',
-    'junkanoo',
-    'junkheap',
-    'jup',
-    'juraga',
-    'jural',
-    'jurasek',
-    'jurassic/cretaceous',
-    'juridiciales',
-    'jurisdiction.',
-    'jurisprudentially',
-    'jurrassic',
-    'jurue',
-    'juryman',
     'juryroom',
-    'jusqu\'au',
-    'just-a-handful',
-    'just-completed',
-    'just-perceptible',
-    'just_,_just_about',
-    'just_a',
-    'just_as',
-    'justa',
-    'justesen',
-    'justices.',
-    'justiciarship',
-    'justie',
-    'justitiae',
-    'justum',
-    'juvarra',
     'juvenilian',
-    'juventin',
-    'juvenus',
-    'juxtaglomerular',
-    'jw',
-    'jwg',
-    'jx',
-    'k&aacute;0tz',
-    'k&aacute;roly',
-    'k&aacute;rolyi',
-    'k&amacr;rtik',
-    'k&amp;m',
-    'k&auml;se',
-    'k&ouml;ckerik',
-    'k&ouml;hler',
-    'k&ouml;lnisches',
     'k&ouml;nigsallee',
-    'k&ouml;nigsberger',
-    'k&ouml;rmen',
-    'k&ouml;rner',
-    'k&ouml;stritz',
-    'k&prime',
-    'k&uuml;lpe',
-    'k(d)',
-    'k(s)',
-    'k*w2',
-    'k*w3',
-    'k+1',
-    'k-c',
-    'k-d',
-    'k-registered',
-    'k.1',
     'k.10&ndash;15',
-    'k.112',
-    'k.173',
-    'k.175',
-    'k.183/173db',
-    'k.1a-d',
-    'k.201/186a',
-    'k.300',
-    'k.358/186c',
-    'k.415',
-    'k.425',
-    'k.449',
-    'k.466',
-    'k.467',
-    'k.488',
-    'k.503',
     'k.537',
-    'k.550',
-    'k.9',
-    'k.clarke',
-    'k.e.',
-    'k.g.b',
-    'k.l.',
-    'k.m.',
-    'k.o.y.l.i.',
-    'k.thompson',
-    'k.w.',
-    'k21rev',
-    'k254',
-    'k298',
-    'k332',
-    'k357',
     'k3581',
-    'k381/123',
-    'k401',
-    'k4011',
-    'k442',
-    'k448/375',
-    'k497',
-    'k501',
-    'k521',
-    'k594',
-    'k608',
-    'k622',
-    'k625',
-    'k84',
-    'k965',
-    'ka-thud',
     'ka71',
-    'kaama',
-    'kaarle',
-    'kaarna',
-    'kabardian',
-    'kabeer',
-    'kabiye',
-    'kaboodle',
-    'kadannikov',
-    'kadiri',
-    'kadmeia',
-    'kadoyi',
-    'kadri',
-    'kadungure',
-    'kadzamira',
-    'kafarova',
     'kafko',
-    'kafr',
-    'kagamiwari',
-    'kagge',
-    'kagiso',
-    'kaguitt',
-    'kahiye',
-    'kahlouche',
-    'kahramanmaras',
-    'kai-n-tiku-aba',
-    'kaibab',
-    'kaijuka',
-    'kailash',
-    'kailua-kona',
-    'kailzie',
-    'kaimon',
     'kaimsthorn',
-    'kainardji',
-    'kainic',
-    'kaiser-josephstrasse',
-    'kaiser-wilhelm',
-    'kaiserpfalz',
-    'kaishek',
-    'kaixi',
-    'kajagoogoo',
-    'kajo',
-    'kajsa',
-    'kakania',
-    'kaker',
-    'kakouris',
-    'kakuei',
-    'kal-007',
     'kal-am-oos',
-    'kalaikunda',
-    'kalamaki',
-    'kalamos',
-    'kalantzakos',
-    'kalcev',
-    'kald',
-    'kaldair',
-    'kaleidoscoped',
-    'kalemba',
-    'kalemli',
-    'kalenjin',
-    'kaleopa',
-    'kalgoorkatta',
-    'kalid',
-    'kalidas',
     'kalimba',
-    'kalinga-apayao',
-    'kalinsky',
-    'kalisher',
-    'kalka',
-    'kalkadoons',
-    'kalkanis',
-    'kall-kwik',
-    'kalmoy',
-    'kalmring',
-    'kalmuck',
-    'kalmucks',
-    'kaloghlian',
-    'kalpin-tu',
-    'kalung',
-    'kaluts',
     'kalvoda',
-    'kambas',
-    'kambawe',
-    'kamberi',
-    'kambos',
-    'kambovski',
-    'kameni',
-    'kamentsev',
-    'kamichika',
-    'kamieniolomy',
-    'kamlanie',
-    'kamloops',
-    'kammergericht',
-    'kammermusicus',
-    'kamougue',
-    'kamoze',
     'kampur',
-    'kana-kanji',
-    'kanaird',
-    'kanal',
-    'kananaios',
-    'kanbans',
-    'kandil',
-    'kandora',
-    'kanec',
-    'kaneda',
-    'kaneo',
-    'kanes',
-    'kanete',
-    'kanfer',
-    'kangaroo-type',
-    'kangas',
     'kangombe',
-    'kangwon',
-    'kanis',
-    'kankaanniemi',
-    'kannada',
-    'kannapiran',
-    'kannenberg',
-    'kannst',
-    'kanon',
-    'kansallinen',
-    'kansk',
-    'kanska',
-    'kansu',
-    'kantaoui',
-    'kanthan',
-    'kanto',
     'kantorov',
-    'kanwar',
-    'kapelle',
-    'kaplin',
-    'kapnikarea',
-    'kapu',
-    'kar&amacr;ti',
-    'karabayev',
-    'karachai-cherkessia',
-    'karachai-circassia',
-    'karagi',
-    'karakaci',
-    'karakozov',
-    'karanja',
-    'karasek',
-    'karasos',
     'karavaev',
-    'karazoglou',
-    'kardar',
-    'kardas',
-    'kardmend',
-    'karfi',
-    'kariithi',
-    'karik',
-    'karkarashvili',
-    'karkeek',
-    'karloffian',
-    'karlova',
-    'karlovac',
-    'karls',
-    'karlstad',
-    'karo',
     'karpasha',
-    'karpeles',
-    'karpnale',
-    'karrimats',
-    'karshan',
-    'kartasasmita',
-    'kartuzov',
-    'kartuzy',
-    'karyn',
-    'kas&aacute;ren',
-    'kasba',
-    'kashrut',
-    'kasimir',
-    'kasl',
-    'kaspi',
-    'kaspszyk',
     'kasrills',
-    'kasrils',
-    'kasseb&ouml;hmer',
-    'kassena-nankana',
-    'kastle',
-    'kastus',
-    'kasyanova',
-    'katalyn',
-    'kataoka',
-    'katcher',
-    'katesbridge',
-    'katharina',
-    'katharyn',
-    'katin',
-    'katisha',
-    'katiza',
     'katje',
-    'katjia',
-    'katjiuongua',
-    'katola',
-    'katona',
-    'katriane',
-    'katrien',
-    'katsunobu',
-    'katt',
-    'katutura',
-    'kauffold',
-    'kaufhaus',
-    'kauko',
-    'kauls',
-    'kauona',
-    'kaushal',
     'kavaratti',
-    'kavtalashvilli',
-    'kawmoora',
-    'kayane',
-    'kaye/0500',
-    'kayenta',
-    'kayewe',
-    'kayijama',
-    'kazachi',
-    'kazahkstan',
-    'kazakh-brokered',
-    'kazakhastan',
-    'kazandjian',
-    'kazem',
-    'kazimierz',
-    'kazis',
     'kazmer',
-    'kazrik',
-    'kazuhiro',
-    'kazumi',
-    'kbl',
-    'kbq/kg',
-    'kbr',
-    'kc-10',
-    'kc-derived',
-    'kc-dorking',
-    'kc11',
-    'kc60',
-    'kcal/kg',
-    'kcal/mol/rad',
-    'kcs',
-    'kd4,000',
     'kd5',
-    'kdh',
-    'kdnp',
-    'ke-wick',
-    'ke2400',
-    'keal',
-    'keane/manchester',
-    'keann-outh',
-    'kearney/milton',
-    'kease',
-    'keatsian',
-    'kebbi',
-    'kebe',
-    'kebell',
-    'kebnekaise',
-    'kebret',
     'kee-wee',
-    'kee-wik',
-    'keefe/prisoner',
-    'keefer',
-    'keelboats',
-    'keelson',
-    'keelung',
-    'keen-sighted',
-    'keeneland',
-    'keens',
-    'keeoo',
-    'keep\'em',
-    'keep-off',
-    'keep_in_touch',
-    'keepd',
-    'keepe',
     'keeper-bar',
-    'keepnets',
-    'keest',
-    'keevil',
-    'kefallinia',
-    'keggin',
-    'keiichi',
-    'keilani',
-    'keiller',
-    'keily',
-    'keio',
-    'keizner',
-    'kekedo',
-    'kekewich',
-    'kekkonen',
-    'keksz',
     'kele',
-    'kelim-covered',
-    'kellegi',
-    'kellingley',
-    'kellogg-briand',
-    'keltec',
-    'kelton',
-    'kelts',
-    'kelulau',
-    'kelvindale',
-    'kemp/chairman',
-    'kemp/timbmet',
-    'kempers',
-    'kempner',
-    'kemsleys',
-    'kenas',
     'kendrew',
-    'kenedi',
-    'keneman',
-    'kenford',
-    'kenji',
-    'kenjiro',
-    'kenmuir',
-    'kennedyesque',
-    'kennelling',
-    'kennelly',
-    'kennelman',
-    'kenneths',
-    'kennilworth',
-    'kensey-nash',
-    'kentian',
-    'kentigerns',
     'kentucky-based',
-    'kentwood',
-    'kenwick',
-    'keny',
-    'keough',
-    'kepner',
-    'kepwick',
-    'ker-seymer',
-    'kerameikos',
-    'keran',
-    'keratotomy',
-    'kerb-crawled',
-    'kerbala',
-    'kercoz',
-    'keresztes',
-    'kerf',
     'kerkenah',
-    'kerkopes',
-    'kerkyra',
-    'kerll',
-    'kermanshah',
-    'kernoghan',
-    'kernsary',
-    'kerogen',
-    'kerosine',
-    'kerpen',
-    'kerrec',
-    'kerrod',
-    'kershner',
-    'kersil',
-    'kertes',
-    'kerukanan',
     'kerusgal',
-    'kesri',
-    'keston',
-    'keszeg',
-    'keszthelyi',
-    'ketalar',
-    'kethang',
-    'ketoacidotic',
-    'ketone-etone-methyl-tri-di-meta-post-oxy-chlorane',
-    'ketoprofen',
-    'ketosis',
-    'ketterick',
-    'kettledrum',
-    'kettleholder',
-    'kettlepan',
-    'ketumile',
     'kety',
-    'keui',
-    'keuris',
-    'kevenmour',
-    'keville',
-    'key-by-key',
-    'key-cutting',
-    'key-fob',
-    'key-in',
-    'key-recall',
-    'key-sequenced',
-    'key-signatures',
-    'key-strokes',
-    'key/scale',
-    'keyboarder',
-    'keychain',
     'keyfronts',
-    'keylights',
-    'keymers',
-    'keyne',
-    'keynes.',
-    'keynoting',
-    'keypress',
-    'keypuncher',
-    'keytime',
-    'keytones',
-    'keyways',
-    'keywell',
-    'kf8',
-    'kfir',
-    'kg/day',
-    'kg/s/ha',
     'kg/sq.m',
-    'kg26',
-    'kg62',
-    'kg8',
-    'kgase',
-    'kgl',
-    'kgm',
-    'kh2',
-    'khachornprasart',
-    'khad',
-    'khader',
-    'khaimah',
-    'khajuraho',
-    'khaki-drill',
-    'khalilollah',
-    'khalky',
     'khalqis',
-    'khami',
-    'khamis',
-    'khamisiya',
-    'khamoun',
-    'khanlar',
-    'khardzhiev',
-    'kharine',
-    'kharon',
-    'khatatba',
-    'khatib',
-    'khatti-gna',
-    'khau',
-    'khawak',
-    'khayeyev',
-    'khazin',
     'khellef',
-    'khemlata',
-    'khera',
-    'kheydius',
-    'khikhikhi',
-    'khmail',
-    'khodzhent',
-    'khomeni',
-    'khosa',
-    'khoto',
-    'khouriah',
-    'khovansky',
-    'khrennikov',
-    'khudayberdiyev',
-    'khutzeymateen',
-    'kiambu',
     'kibataro',
-    'kibbett',
-    'kibbo',
-    'kibe',
-    'kibler',
-    'kibworth',
-    'kick-ahead',
-    'kick-backs',
-    'kick-the-can',
-    'kicked-off',
-    'kicking-off',
-    'kickoffs',
-    'kidane',
-    'kiddiwinks',
-    'kiddos',
-    'kidnappin\'',
     'kidnies',
-    'kidstuff',
-    'kidul',
-    'kiedis',
-    'kieffer',
-    'kiehl',
-    'kielderhead',
-    'kielly',
-    'kiels',
-    'kieman',
-    'kienzle',
-    'kiep',
-    'kierans',
-    'kierkegaardian',
-    'kiesler',
-    'kiessling',
     'kievans',
-    'kifak',
-    'kiff/live',
-    'kifisia',
-    'kiggell',
-    'kightly',
-    'kiiza',
-    'kikhil',
-    'kikongo',
-    'kilchoan',
-    'kildans',
-    'kildingy',
-    'kildress',
-    'kile',
-    'kilim',
-    'kilkerran',
     'kilkline',
-    'kill-fever',
-    'killarow.',
-    'killdaltan',
-    'killdaltane',
-    'killead',
-    'killearow',
-    'killer-car',
-    'killeth',
-    'killinger',
-    'killogrammes',
-    'killruddery',
-    'killw.',
-    'killylea',
-    'kilnachtane',
-    'kilnaughton',
     'kilometre-long',
-    'kilometre-thick',
-    'kiloparsecs',
-    'kilostream',
-    'kilpont',
-    'kilravock',
-    'kiltarlity',
-    'kimba',
-    'kimbara',
-    'kimberlin',
-    'kimberlitic',
-    'kimble/protestor',
-    'kimbrey',
-    'kimbundu',
-    'kimonian',
-    'kimpton',
     'kin-grouped',
-    'kinabalu',
-    'kinaesthesia',
-    'kinbrace',
-    'kincora',
-    'kindel',
-    'kinder-',
-    'kindersely',
-    'kinematograph',
-    'kinesics',
-    'king-like',
-    'king-maker',
-    'king/suspended',
-    'king/thames',
-    'kingfisher-blue',
-    'kingham/oxfordshire',
     'kinghsolm',
-    'kingibe',
-    'kingmakers',
-    'kingmoor',
-    'kingscourt',
-    'kingsey',
-    'kingsford-smith',
-    'kingsholme',
-    'kingslake',
-    'kingslangley',
-    'kingsworthy',
-    'kiniver',
-    'kink-free',
-    'kinkajous',
-    'kinkier',
-    'kinlochrannoch',
     'kinlock',
-    'kinmount',
-    'kinn',
-    'kinneary',
-    'kinner',
-    'kinniburgh',
-    'kinniel',
-    'kinnockabout',
-    'kinnockism',
-    'kinoforms',
-    'kinsala',
-    'kinsela',
-    'kinsky',
-    'kinyarwanda',
-    'kinzie',
-    'kippen',
     'kir-',
-    'kirchwey',
-    'kirghiz-kazakh',
-    'kirichenko',
-    'kiril',
-    'kirishima',
-    'kirk-greene',
-    'kirk/managing',
-    'kirkaldy',
-    'kirkapol',
-    'kirkbie-kendall',
-    'kirkbright',
-    'kirkburn',
-    'kirkby-in-ashfield',
-    'kirkcowan',
-    'kirkefjorden',
     'kirkegaard',
-    'kirkendall',
-    'kirkenes',
-    'kirkfell',
-    'kirkmen',
-    'kirkness',
-    'kirkoswald',
-    'kirman',
-    'kirnon',
-    'kirruc',
-    'kirshaws',
-    'kirtipur',
-    'kirtling',
-    'kirundi',
-    'kisangi',
-    'kiseleff',
     'kishinyev',
-    'kishtainy',
-    'kisiliov',
-    'kiss-in',
-    'kist',
-    'kiszczak',
-    'kit-cat',
-    'kitamura',
-    'kitazin',
-    'kitchen-day',
-    'kitchen-like',
-    'kitchenalia',
-    'kitchingham',
-    'kite-like',
-    'kite-making',
-    'kitefliers',
     'kitelines',
-    'kitgum',
-    'kitson/flood',
-    'kitten-heeled',
-    'kittlemann',
-    'kitumbeine',
-    'kivell',
-    'kiwifruit',
-    'kjaersgaard',
-    'kjell-olof',
-    'kjus',
-    'klaasen',
-    'klama',
-    'klangers',
-    'klao',
-    'klaus-meciar',
     'klavizimbel',
-    'klc',
-    'kleanthi',
-    'klebb',
-    'kleinburg',
-    'kleindeutsch',
-    'kleins',
-    'kleinsmith',
-    'klemm',
-    'kleombrotos',
-    'klerman',
-    'klias',
-    'klibreck',
-    'klinghoffer',
-    'klinkhamer',
-    'klinkowitz',
     'klinorhynchous',
-    'klinsky',
-    'klint',
-    'klippan',
-    'klitzing',
-    'kloak',
-    'klono',
-    'klopping',
-    'klopsch',
-    'klotz',
-    'klotzer',
-    'kloutse',
-    'klovstad',
-    'kluckhohn',
-    'klutz',
-    'km-long',
     'km/',
-    'kmd',
-    'kmsq',
-    'knackwurst',
-    'knaggs',
-    'knapdale',
-    'knapp.',
-    'knarlton',
-    'knau',
-    'knauss',
-    'knave-proof',
-    'kne&zcaron;ina',
-    'knee-bagging',
-    'knee-joint',
-    'knee-level',
-    'knee-socks',
     'knee-trembler',
-    'kneebend',
-    'knees.',
-    'kneeton',
-    'kneller',
-    'kneussl',
-    'knevitt',
-    'kni',
-    'knibbs',
-    'knicks',
-    'knidus',
-    'knife-blades',
-    'knife-carriers',
-    'knife-edges',
-    'knife-work',
-    'knifings',
     'knight/graphical',
-    'knights.',
-    'knilton',
-    'kniphofia',
-    'knit-club',
-    'knitteds',
-    'knmi',
-    'knobblier',
-    'knobstick',
-    'knobtwat',
-    'knock-downs',
-    'knock-knees',
-    'knock-off',
-    'knockans',
-    'knockdrin',
-    'knocking-off',
     'knockings',
-    'knocknamuckley',
-    'knoclearach',
-    'knodel',
-    'knoh',
-    'knorth',
-    'knossians',
-    'knot-to-knot',
-    'knotto',
-    'knotweed',
-    'know\'st',
-    'know-it-alls',
-    'knowledge-constitutive',
-    'knowledge-of',
-    'knowledge-without-experience',
-    'knowlege',
     'known\'',
-    'known-unknown',
-    'knows-how-many',
-    'knowth',
-    'knoxian',
-    'knpp',
-    'knrg',
-    'knucklebones',
-    'knytlinga',
-    'ko&ccaron;a',
-    'kobia',
-    'kobuk',
-    'kocarnik',
-    'kocel',
-    'koch-weser',
-    'koci',
     'kodaks',
-    'kodock',
-    'koen',
-    'koether',
-    'koffka',
-    'kogut',
-    'kohathites',
-    'kohde-kilsch',
-    'kohl-severa',
-    'kohlangaz',
-    'kohlapur',
-    'kohlbergian',
-    'kohnstamm-negative',
-    'kohout',
-    'koi-related',
-    'koigi',
     'koike',
-    'kokang',
-    'kokeritz',
-    'kokkavil',
-    'kokkonen',
-    'kokoshin',
-    'kokoshka',
-    'kolar',
-    'kolbeinsson',
-    'kolben',
-    'kolberg',
-    'kolding',
-    'koljevic',
-    'kolkhozes',
-    'kolkhozy',
-    'kollari',
     'kolo',
-    'kolombangara',
-    'kolomenskoe',
-    'kolomna',
-    'kolophon',
-    'kolowrats',
-    'kolvin',
-    'kom43',
-    'kombedy',
-    'kombolcha',
-    'komei',
-    'komissarov',
-    'komitehs',
-    'kommos',
-    'kommunistiko',
-    'kommunistikon',
     'kommunistinen',
-    'komotini',
-    'komsomolets',
-    'komuniecki',
-    'komunista',
-    'konakom',
-    'konchalovsky',
-    'konders',
-    'kondese',
-    'kondile',
-    'kondoma',
-    'kondoyannopoulous',
-    'konev',
-    'konghua',
-    'kongor',
-    'kongs',
     'kongsvinger',
-    'konings',
-    'konkowski',
-    'konnichi',
-    'konopka',
-    'konorski',
-    'konovalenko',
-    'konservative',
-    'konserven',
-    'konstaninidis',
-    'konstanty',
-    'kontchou',
-    'konzerthaus',
-    'koojimaans',
-    'koolkool',
-    'koonen',
     'koopmans',
-    'koornstra',
-    'kopeck',
-    'kopjes',
-    'koprivnice',
-    'kopsch',
-    'korad',
-    'koraes',
-    'korans',
-    'korb',
-    'korce',
-    'kordell',
-    'korean-us',
-    'korelev',
-    'kores',
-    'korky',
     'kormann',
-    'kormendi',
-    'kornberg',
-    'kornhaus',
-    'koroliov',
-    'korowi',
-    'korpus',
-    'korsah',
-    'kort',
-    'koscielisko',
-    'kosecki',
-    'koshani',
-    'koskas',
-    'koskenniemi',
-    'koskull',
-    'kosky',
     'kosovo-metohija',
-    'kossack',
-    'kostajnica',
-    'kostandin',
-    'kostas',
-    'kosti',
-    'kotani',
-    'kotc',
-    'kotov',
-    'kotronis',
-    'kotter',
-    'kouangou',
-    'kouassi',
-    'kouba',
-    'koudelka',
-    'koudonazarov',
     'kountch&eacute',
-    'kountouri',
-    'kourabi&egrave',
-    'kovacevich',
-    'kovalyov',
-    'kovda',
-    'kovess',
-    'kox15',
-    'kox21-related',
-    'kozakcioglu',
-    'kozhin',
-    'kozin',
-    'kozlov',
-    'kpl',
-    'kppm',
-    'kpu',
     'kq',
-    'kr&ouml;ner',
-    'kr7',
-    'kr850',
-    'kracow',
-    'kraepelin',
-    'krafcik',
-    'krafstein',
-    'krahn',
-    'kraisak',
-    'kral',
-    'kranja',
-    'krankengymnastik',
-    'krankenhaus',
-    'krasnovodsk',
-    'krassowski',
     'krastins',
-    'kratie',
-    'krauskopf',
-    'kravonia',
-    'krawec',
-    'krbavsko',
-    'krc',
-    'kreek',
-    'kreisleiter',
-    'krell',
-    'kremegne',
-    'kremlin-directed',
-    'kremmen',
-    'krempe',
-    'kreshchatik',
-    'krf&mdash;christian',
     'kriedte',
-    'krikova',
-    'krill-feeding',
-    'kringle-like',
-    'krips',
-    'kris-poos',
-    'krish',
-    'krishnas',
-    'krispie',
-    'kristafor',
-    'kristal',
-    'kristelig',
-    'kristova',
-    'krizovy',
-    'krog',
-    'krogius',
     'kroller-muller',
-    'kronen',
-    'kropacek',
-    'krosch',
-    'krouk',
-    'kroutil',
-    'krrrrrrrrrr-oo',
-    'krrs',
-    'krs',
-    'krsko',
-    'kru',
-    'krugh',
-    'kruk',
-    'krups',
-    'krupskaya',
-    'kruseva&cacute',
     'kruskal-szekeres',
-    'krustev',
-    'krutick',
-    'kruttschnitt',
-    'kruuk',
-    'kryanghe',
-    'krymskaya',
-    'krysia',
-    'ks1',
-    'ksabi',
-    'kshatriyas',
-    'ksli',
-    'ksr/1',
-    'kt1',
-    'kt13',
-    'kt14',
     'ktonnes',
-    'ku-klux-klan',
-    'kuaybah',
-    'kuba',
-    'kublai',
-    'kuc',
-    'kucharski',
-    'kuczynski',
-    'kudryavtsev',
-    'kuemann',
-    'kuenssberg',
-    'kuepper',
-    'kugelbaum',
-    'kuibyshev',
-    'kuka',
-    'kukanjac',
     'kulish',
-    'kumalo',
-    'kumara',
-    'kumaranatunge',
-    'kumars',
-    'kumbaya',
-    'kumbbakoman',
-    'kumbh',
-    'kumbirai',
-    'kun-hui',
-    'kunar',
-    'kunceviciene',
-    'kunduz',
-    'kunick',
-    'kuniwo',
-    'kunos',
     'kunstinstitut',
-    'kunstmesse',
-    'kunsttage',
-    'kuntzel',
-    'kuo-yu',
-    'kuparuk',
-    'kupeck&yacute',
-    'kupferstichkabinett',
-    'kuppel',
-    'kuptsi',
-    'kurdish-inhabited',
-    'kurdish-speaking',
-    'kurfurstendamm',
-    'kurland',
-    'kurlos',
-    'kurt&eacute;n',
     'kurtcebe',
-    'kurup',
-    'kuryluk',
-    'kurzman',
-    'kuschel',
-    'kuserk',
-    'kushooth',
-    'kussnachter',
-    'kusuma',
-    'kusy',
-    'kutchinsky',
-    'kuttuc',
-    'kutxa',
-    'kuuskoski',
-    'kuwait-saudi',
-    'kuwait/british',
     'kuwaiti-saudi',
-    'kuwall',
-    'kuybyshev',
-    'kuzbas',
-    'kuzio',
-    'kva',
-    'kvallposten',
-    'kvalvik',
-    'kvetch',
-    'kvetnova',
-    'kvinne',
-    'kw/hr',
-    'kw14.7',
-    'kwabena',
-    'kwade',
-    'kwajalein',
     'kwamena',
-    'kwara',
-    'kwazulu-natal',
-    'kwetu',
-    'kwikmas',
-    'kwong',
-    'kx99',
-    'kxf7',
-    'kyat',
-    'kyberd/thames',
-    'kybird/thames',
-    'kyburgs',
-    'kye',
-    'kylon',
-    'kympton',
-    'kyne',
     'kynges',
-    'kynock',
-    'kyo',
-    'kyoei',
-    'kyongju',
-    'kyoruki',
-    'kyrgyz',
-    'kyrios',
-    'kyrkos',
-    'kytes',
-    'kythnos',
-    'kyu-sik',
-    'kyuranov',
-    'kyvik',
-    'l&amp;qa',
-    'l&amp;swr',
     'l&aring;ddej&aring;kk&aring;stugan',
-    'l&eacute;giste',
-    'l&eacute;man',
-    'l&eacute;oville-lascases',
-    'l&eacute;rinian',
-    'l&egrave;se',
-    'l&frac12;ins',
-    'l&uuml;bars',
-    'l&uuml;st',
-    'l&uuml;tzowplatz',
-    'l\'&eacute;nonciation',
-    'l\'actualisation',
-    'l\'ai',
-    'l\'allegro',
-    'l\'amen',
-    'l\'an',
     'l\'anel',
-    'l\'annonce',
-    'l\'antiquit&eacute',
-    'l\'arche',
-    'l\'assiette',
-    'l\'atalaya',
-    'l\'atlantique',
-    'l\'audace',
-    'l\'chaim',
-    'l\'e',
-    'l\'ecosse',
-    'l\'emploi',
-    'l\'enseignement',
-    'l\'ensemble',
-    'l\'espace',
-    'l\'estoire',
     'l\'estrac',
-    'l\'eveque',
-    'l\'expansion',
-    'l\'gat',
-    'l\'h&ocirc;tel',
-    'l\'horloge',
-    'l\'imp&eacute;ratrice',
-    'l\'impressionisme',
-    'l\'improviste',
-    'l\'inconscient',
-    'l\'instauration',
-    'l\'italiana',
-    'l\'oiseau-lyre',
-    'l\'op&egrave;ra',
-    'l\'or',
-    'l\'orange',
     'l\'orchestre',
-    'l\'ordinario',
-    'l\'outrance',
-    'l\'ouverture',
-    'l(b)',
-    'l(c)',
-    'l(l)',
-    'l-1',
-    'l-citrulline',
-    'l-driver',
-    'l-itn',
-    'l-league',
-    'l-nmma',
-    'l-plan',
-    'l-sat',
-    'l-u-v',
     'l.14',
-    'l.2',
-    'l.3',
-    'l.a.b.',
-    'l.a.c.',
-    'l.b.a.',
-    'l.c.c',
-    'l.c.j.',
-    'l.e.a',
-    'l.e.a.s',
-    'l.j',
-    'l.j.bank.',
-    'l.j.ex.',
-    'l.k.',
-    'l.n.',
-    'l.p.r.s.',
     'l.sayers',
-    'l.time',
-    'l/209/25/2025',
-    'l/309/25/3047',
-    'l/320/25/3045',
-    'l/320/27/3065',
-    'l/80th',
-    'l/all',
-    'l/c',
-    'l/day',
-    'l/mpg',
-    'l/t',
-    'l00',
-    'l100',
-    'l13',
-    'l132,000,000',
     'l133,000,000',
-    'l14',
-    'l150,000,000',
-    'l190/1',
-    'l2,200',
-    'l200,000',
-    'l243',
-    'l25mph',
-    'l3.8',
-    'l30',
-    'l30,000,000',
-    'l4.5',
-    'l40',
-    'l450',
-    'l48',
-    'l53',
     'l5807',
-    'l5mm',
-    'l5th',
-    'l60,000',
-    'l6m',
-    'l700',
-    'l703774',
-    'l705081',
-    'l705084',
-    'l706164',
-    'l7572',
-    'l950',
-    'l952',
-    'l975',
-    'l976',
-    'l981',
     'l982',
-    'l985',
-    'l9x2',
-    'la\'eq',
-    'la-hu',
-    'la22',
-    'laamers',
-    'lab-our',
-    'lab-tested',
-    'labatts',
-    'labellings',
-    'labflow',
-    'labissiere',
-    'labor-intensive',
-    'laboratory-made',
-    'laboratorys',
     'laborer',
-    'laboring',
-    'labors',
-    'labouchere',
-    'labour-capital',
-    'labour-conservative',
-    'labour-inclined',
-    'labour-intensiveness',
-    'labour-likud',
-    'labour-minded',
-    'labour-time',
-    'labour/liberal',
-    'labour/s',
-    'labourite',
-    'labradoodle',
-    'labrador-quebec',
     'labrador-sized',
-    'labradores',
-    'labrandeus',
-    'labs-developed',
-    'labs/novell',
-    'labstation',
-    'labvision&trade',
-    'laccase',
-    'laccolith',
-    'lace-leaf',
-    'lacemakers',
-    'lacert&aelig',
-    'lach.',
-    'lachennes',
-    'lachmann',
-    'lachmon',
     'lachnerstrasse',
-    'lachrymosity',
-    'lackin\'',
-    'lacombe',
-    'laconian',
-    'laconicism',
-    'lactam',
-    'lactase-deficient',
-    'lactiflora',
-    'lacto-',
-    'lactobacilli',
-    'lactones',
-    'lactulose/rhamnose',
-    'lacws',
-    'ladanifer',
-    'ladderbacks',
     'ladengalerie',
-    'laderman',
-    'laders',
-    'ladie',
-    'ladies/junior',
-    'ladin',
-    'ladinos',
-    'ladislau',
-    'ladizesky',
-    'ladle-full',
-    'ladon',
-    'lads.',
-    'ladsandads',
-    'lady/old',
-    'ladykirk',
-    'ladyland',
     'ladyman',
-    'lae',
-    'lael',
-    'laem',
-    'laerdal',
-    'laetitia-matilda',
-    'lafc',
-    'lafer',
-    'laferrte',
-    'lafeu',
-    'laffan',
-    'laffed',
-    'lafferty/eastington',
-    'lafferty/pamington',
-    'lafferty/reporting',
-    'lafferty/ross-on-wye',
     'lafferty/staverton',
-    'lafferty/whitminster',
-    'lafon',
-    'lafons',
-    'lafortune',
-    'laforza',
-    'lafs',
-    'lag.',
-    'lager-brewing',
-    'lagoa',
-    'lagomorph',
-    'lagoon-blue',
-    'lagosta',
-    'lagunas',
-    'lagune',
-    'lagwilline',
     'lahej',
-    'lahiya',
-    'laic',
-    'laigle',
-    'laikipia',
-    'lainya',
-    'laird-built',
-    'laisamis',
-    'laister',
-    'lakatosian',
-    'lake-beds',
-    'lake-head',
-    'lakerville',
-    'lakey',
-    'lakhdaria',
-    'laking',
     'lakitani',
-    'lakwena',
-    'lalanne',
-    'lalibela',
-    'lalljee',
-    'lalquila',
-    'lalthanhawla',
-    'lalumiere',
-    'lamagan',
-    'lamai',
-    'lamaism',
-    'lamastre',
-    'lamb-like',
-    'lamberto',
-    'lamberts',
-    'lambings',
     'lambley',
-    'lamborghinis',
-    'lambourn/berkshire',
-    'lambson',
-    'lambtons',
-    'lamech',
-    'lameduck',
-    'lamellipodium',
-    'lamest',
-    'lamey',
-    'lamez',
-    'laminator',
-    'laming/foster',
-    'lamma',
-    'lammergeyer',
-    'lammle',
     'lammles',
-    'lamorbey',
-    'lamouri',
-    'lamp-shade',
-    'lamp-shades',
-    'lamp-stand',
-    'lampart',
-    'lampedusa',
-    'lampert',
-    'lampl',
-    'lamproite',
-    'lampton',
-    'lamrani',
-    'lamuts',
-    'lan-elec',
-    'lancashire-based',
     'lancashire-born',
-    'lance-armed',
-    'lance-like',
-    'lancey',
-    'lanchi',
-    'lancucki',
-    'land-agent',
-    'land-base',
-    'land-clearance',
-    'land-cruiser',
-    'land-drain',
-    'land-girls',
-    'land-lock',
-    'land-masses',
-    'land-mines',
-    'land-ownership',
     'land-plus-marine',
-    'land-scarce',
-    'land-speed',
-    'land-user',
-    'land-value',
-    'land/',
-    'landbanks',
-    'landbuyer',
-    'landesman',
-    'landeta',
-    'landgate',
-    'landgirl',
-    'landing-net',
-    'landing-stages',
-    'landing-strip',
-    'landlo',
     'landmannalaugar',
-    'landolfo',
-    'landolphe',
-    'landsat-3',
-    'landsbury',
-    'landscape.',
-    'landscapist',
-    'landside',
-    'landskips',
-    'landsstyre',
-    'landsstyret',
-    'landsurfing',
-    'landulph',
-    'landwehrkanal',
-    'landworkers',
-    'laner',
     'langage',
-    'langdon-down',
-    'langelaan',
-    'langemarck',
-    'langenhagen',
-    'langenthal',
-    'langfield',
-    'langhammer',
-    'langhirano',
-    'langlay',
-    'langmuir-blodgett',
-    'langnauer',
-    'langos',
-    'langour',
-    'langourous',
-    'langrake',
     'langsamer',
-    'langsman/victim',
-    'langson',
-    'langthorne',
-    'langtree',
-    'language-behaviour',
-    'language-centred',
-    'language-independent',
-    'language-maintenance',
-    'language-wise',
-    'language/',
-    'langwidge',
-    'langworth',
-    'laniakea',
-    'lanighan/victim',
-    'lanistes',
     'lankawi',
-    'lankiness',
-    'lankly',
-    'lannegan',
-    'lanois',
-    'lansersee',
-    'lansiquot',
-    'lanston',
-    'lantain',
-    'lante',
-    'lanterne',
-    'lanton',
-    'lanus',
-    'lanzenberg',
-    'lanzendorfer',
-    'lao-chinese',
     'lao-da',
-    'laolith',
-    'laotians',
-    'lap-steels',
-    'lapada',
-    'lapaich',
-    'laparoscope',
-    'laparoscopically',
-    'lapdogs',
-    'lapetus',
-    'lapham',
-    'lappaceum',
-    'lappe',
-    'lappets',
-    'lapponica',
-    'lapponicus',
     'lapsi',
-    'lapslie',
-    'laptc',
-    'lapthorn',
-    'laramie',
-    'lardner-burke',
-    'lare',
-    'large-batch',
-    'large-billed',
-    'large-boned',
-    'large-denomination',
-    'large-featured',
-    'large-numbers',
-    'large-patterned',
-    'large-practice',
-    'large-sample',
     'large-set',
-    'large-shape',
-    'large-signal',
-    'large-systems',
-    'large-vessel',
-    'largefeuille',
-    'larger-engined',
-    'larger/smaller',
-    'largest-circulation',
-    'largest-selling',
-    'lari',
-    'larifla',
-    'larink',
-    'larisans',
-    'lark\'',
-    'larkfield',
     'larkton',
-    'larmore',
-    'larmuth',
-    'larn',
-    'larnaxes',
-    'larraman',
-    'larramen',
-    'larrigan',
-    'lars-borje',
-    'lars-eric',
-    'lartigue',
-    'larusa',
-    'larvae.',
-    'larvicide',
-    'laryngoscopy',
-    'larynxes',
     'lasagnes',
-    'lasch',
-    'lasche',
-    'lasenby',
-    'laser-axles',
-    'laser-based',
-    'laser-grooved',
-    'laser-operated',
-    'laser-optic',
-    'laser-printed',
-    'laser-prism',
-    'laser-tracking',
-    'lasercomp',
-    'laserflo',
-    'lasering',
-    'laserprinters',
     'lashford',
-    'lashing-out',
-    'lashless',
-    'lashner',
-    'lasi',
-    'lasing',
-    'lask',
-    'lasker-sch&uuml;ler',
-    'laskey',
-    'laslzo',
-    'lasocki',
-    'lasry',
-    'lass.',
-    'lassally',
-    'lassi',
-    'lassiters',
     'lassoes',
-    'lassoos',
-    'lassos',
-    'lasswells',
-    'last-but-one',
-    'last-heard',
-    'last-heat',
-    'last-hole',
-    'last-in-first-out',
-    'last-quarter',
-    'last-round',
-    'last/',
-    'laster',
-    'lastman',
-    'lastra',
-    'laswell',
     'lat/long',
-    'latapy',
-    'latasa',
-    'latch-string',
-    'latchless',
-    'late&rehy;night',
-    'late-\'50s',
-    'late-\'80s',
-    'late-1991',
-    'late-come',
-    'late-edwardian',
-    'late-evening',
-    'late-fourth',
-    'late-gothic',
-    'late-maturing',
-    'late-onset',
     'late-opening',
-    'late-period',
-    'late-saxon',
-    'late-sixteenth',
-    'late-sixth-century',
-    'late-spring',
-    'late-stage',
-    'late-thirties',
-    'late/post-roman',
-    'lately.',
-    'later-acting',
-    'later-flowering',
-    'laterite',
-    'laterites',
-    'laternser',
-    'latfi',
     'lathed',
-    'lathenham',
-    'latifundium',
-    'latinamericano',
-    'latine',
-    'latinism',
-    'latinists',
-    'latio',
-    'latitude.',
-    'latitudinarians',
-    'latki',
-    'latmos',
-    'latourelle',
-    'lats',
-    'latta',
-    'lattany',
     'lattanzi',
-    'latten',
-    'lattice-like',
-    'lattimer',
-    'latuheru',
-    'lauchlan',
-    'laudan',
-    'laudarios',
-    'lauder-frost',
-    'lauenburg',
-    'lauermann',
-    'laugerie-basse',
-    'laugh-a-minute',
-    'laugh-in',
-    'laughing.',
-    'laughs.',
     'laughter-lines',
-    'laughter.',
-    'laughterton',
-    'laula',
-    'laumann',
-    'launay',
-    'launch-to-edit',
-    'launchbury',
-    'launderer',
-    'launderess',
-    'laundrettes',
-    'laundromats',
-    'laundry-fresh',
-    'laundry-room',
-    'laundry-workers',
-    'laundrymen',
     'laundrywomen',
-    'laureateship',
-    'laurel-crowned',
-    'lauretta',
-    'laurieston',
-    'lauritz',
-    'laurus',
-    'lauschenberg',
-    'laut',
-    'lavallei',
-    'lavardin',
-    'lavateras',
-    'lavatories.',
-    'lavell',
-    'laventure',
-    'laverie',
     'laverley',
-    'lavers',
-    'lavertry',
-    'lavety',
-    'lavigne',
-    'laving',
-    'lavishes',
-    'lavra',
-    'lavvys',
-    'lavyrle',
-    'law-agent',
-    'law-enforcers',
-    'law-giver',
-    'law-givers',
-    'law-maker',
-    'law/economics',
     'law/shopkeeper',
-    'law/wiltshire',
-    'lawbook',
-    'lawer/victim',
-    'lawlers',
-    'lawleys',
-    'lawn-tennis',
-    'lawndale',
-    'lawro',
-    'lawson-',
-    'lawyer-free',
-    'lawyers.',
-    'laxed',
-    'laxfield',
-    'lay-clerk',
-    'lay-clerks',
     'lay/northamptonshire',
-    'laybacked',
-    'laybacks',
-    'laybak',
-    'laycar',
-    'layd',
-    'layer-pudding',
-    'layfolk',
-    'laying-down',
-    'laying-off',
-    'laymon',
-    'layn',
-    'layng',
-    'layseca',
-    'layton-henry',
-    'laytoners',
     'lazano',
-    'lazareto',
-    'lazarillo',
-    'lazarowicz',
-    'lazative',
-    'lazin\'',
-    'lazy-bones',
-    'lazybeds',
-    'lazybones',
-    'lazyjacks',
-    'lbms',
-    'lc-',
-    'lc-my',
-    'lc/tlc',
-    'lcpl',
-    'lcps',
     'lcrs',
-    'lcsh',
-    'ld.raym.',
-    'ldma',
-    'ldmt',
-    'ldps',
-    'ldts',
-    'ldu',
-    'ldu/adi',
-    'le&oacute;n-g&oacute;mez',
-    'le-havre',
-    'le5',
-    'lea-wide',
-    'leabua',
-    'leac',
-    'lead&rehy;times',
     'lead-paned',
-    'lead-smelting',
-    'lead-weighted',
-    'lead/acid',
-    'lead/zinc',
-    'leader-figure',
-    'leader-information',
-    'leader-managers',
-    'leader-member',
-    'leader-placed/second',
-    'leader-writers',
-    'leader/glos',
-    'leaderboards',
-    'leadfree',
-    'leading-notes',
-    'leadings',
     'leadsmen',
-    'leadwork',
-    'leaf-bud',
-    'leaf-buds',
-    'leaf-covered',
-    'leaf-eaters',
-    'leaf-edges',
-    'leaf-monkey',
-    'leafcutters',
-    'leafworm',
-    'leagas',
-    'leagues.',
-    'leahurst',
-    'leak-detection',
-    'leak-free',
-    'leak-prone',
     'leak/male',
-    'leakance',
-    'leake/professional',
-    'leakes',
-    'leakiest',
-    'leakiness',
-    'lean-limbed',
-    'leanan-sidhe',
-    'leane',
-    'leanly',
-    'leaptime',
-    'learmount',
-    'learnability',
-    'learning-by-doing',
-    'lease.',
-    'leasib',
     'leaside',
-    'leasing-type',
-    'least-charted',
-    'least-contacted',
-    'least-developed',
-    'least-favoured',
-    'least-promising',
-    'least-successful',
-    'least-used',
-    'leathan',
-    'leather-aproned',
-    'leather-gloved',
-    'leather-lined',
-    'leather-padded',
-    'leather-studded',
-    'leather-upholstered',
     'leather-working',
-    'leatherdale',
-    'leatherjacket',
-    'leatherman',
-    'leatherwood',
-    'leatherworker',
-    'leathes',
-    'leavers&ndash',
-    'leavesden',
-    'leavey',
-    'lebanonisation',
-    'lebedeva',
-    'lebel',
-    'lebensztejn',
-    'lebon',
-    'lec-subj',
     'lecanii',
-    'lechaion',
-    'leching',
-    'lechitski',
-    'leclezio',
-    'lecomte',
-    'lecourt',
-    'lect.',
-    'lecter-style',
-    'lectors',
-    'lecture-rooms',
-    'lecture/dem',
-    'lecturers/teachers',
-    'lecturerships',
-    'ledbury/herefordshire',
-    'lederman',
     'ledes',
-    'ledesma',
-    'ledezma',
-    'ledges.',
-    'ledingham-smith',
-    'ledley',
-    'ledson',
-    'ledyard',
-    'lee-enfield',
-    'lee-trained',
-    'lee-wright',
-    'leeann',
-    'leeas',
-    'leeched',
-    'leechian',
-    'leechlike',
     'leeden',
-    'leedham',
-    'leeds-york',
-    'leeky',
-    'leela',
-    'leelo',
-    'leen',
-    'leenane',
-    'leeper',
-    'lees/assault',
-    'leets',
-    'leeuwenhoek',
-    'leewenhoek',
-    'lefbvre',
-    'lefebure',
-    'lefkandi',
     'left&dollar',
-    'left-armers',
-    'left-behind',
-    'left-dominated',
-    'left-handedly',
-    'left-labour',
-    'left-republican',
-    'left-republicanism',
-    'left-republicans',
-    'left-to',
-    'left.right',
-    'left/alternative',
-    'leftarmer',
-    'leftback',
-    'leftsided',
-    'leftwinger',
     'leg-muscle',
-    'leg-muscles',
-    'leg-propelled',
-    'legal-constitutionalism',
-    'legal/constitutional',
-    'legalists',
-    'legally-aided',
-    'legally-held',
-    'legard',
-    'legatarius',
-    'legati',
-    'legato.ini',
-    'legavit',
-    'legcuffs',
-    'legem',
-    'legendarily',
     'leges',
-    'leggat',
-    'legge-bourke',
-    'legge/farmer',
-    'leggio',
-    'legiti&rehy;mate',
-    'legitimator',
-    'legitimatory',
-    'legnano',
-    'legomena',
-    'legos',
-    'legrenzi',
-    'legwell',
-    'lehr',
-    'lehrl',
-    'lehtinen',
     'lei-ces-ter',
-    'leibenstein',
-    'leibovitz',
-    'leibowitz',
-    'leicestershire-based',
-    'leiermann',
-    'leigh-mallory',
-    'leigh-smith',
-    'leija',
-    'leinin',
-    'leiningen',
-    'leippe',
-    'leisha',
-    'leisler',
-    'leist',
-    'leisten',
     'leisure-wear',
-    'leisure/holidays',
-    'leisure/resources',
-    'leisuredly',
-    'leisurerama',
-    'leitao',
-    'leith-based',
-    'leithia',
-    'leka',
-    'lekhnitskii',
-    'lekota',
-    'lekszton',
-    'lelean',
-    'lemaitre',
-    'lemgo',
-    'lemminka&iuml;nen',
     'lemminkainen',
-    'lemna',
-    'lemoine',
-    'lemon-flavoured',
-    'lemon.',
-    'lemonhead',
-    'lenart',
-    'lenarth',
-    'lenas',
-    'lendoiro',
-    'leneman',
-    'lengelo',
-    'lengnick-hall',
-    'length-and-a-half',
-    'length-of-beak',
-    'length-of-feathers',
     'length/diameter',
-    'length/width',
-    'length=360/np',
-    'lengthened.',
-    'lengtheners',
-    'lengthiest',
-    'lengthiness',
-    'lengthofbeak',
-    'leninabad',
-    'leninsk',
-    'leninsky',
-    'lenkoran',
-    'lenna',
-    'lennan',
-    'lennons',
-    'leno',
     'lenor',
-    'lens-grinding',
-    'lens-shaped',
-    'lensfield',
-    'lente',
-    'lenticular',
-    'lentons',
-    'lenus-mars',
-    'lenwade',
-    'leofnoth',
-    'leoline',
-    'leolino',
-    'leoma',
-    'leonardos',
-    'leoncico',
-    'leoneans',
     'leonese',
-    'leonhardt',
-    'leonidov',
-    'leonson',
-    'leontjev',
-    'leopard-like',
-    'leopard-skins',
-    'leopardcover',
-    'leopardette',
-    'leopoldstadt',
-    'leorin',
-    'leothaid',
-    'lepcis',
-    'lepe',
-    'lepidus',
-    'leporis',
     'leps',
-    'leptodontium',
-    'leptomeningeal',
-    'lerche',
-    'lerfreiheit',
-    'leroghi',
-    'leroi-gourhan',
-    'lerrick',
-    'lersky',
-    'lesabre',
-    'lesbian-only',
-    'lesbian/gay',
-    'lesbo',
-    'lesiure',
-    'lesli',
-    'lesnoy',
     'lesole',
-    'lesparre',
-    'less-affluent',
-    'less-cited',
-    'less-contrived',
-    'less-damaging',
-    'less-direct',
-    'less-expensive',
-    'less-involved',
-    'less-popular',
-    'less-privileged',
-    'less-strenuous',
-    'lessore',
-    'leston',
-    'lestrange',
-    'lestrygonians',
     'let\'s-get-on-with-it',
-    'letching',
-    'letensk&aacute',
-    'leterne',
-    'lethality',
-    'lethals',
-    'lethargica',
-    'lethargus',
-    'lethbridge-stewart',
-    'letherhead',
-    'letizia',
-    'letojanni',
-    'letter-',
-    'letter-collections',
-    'letter-knife',
-    'letter-racks',
     'letter-sized',
-    'letter/number',
-    'letterbomb',
-    'letterfrack',
-    'lettermore',
-    'lettersws18',
-    'letting-off',
-    'lettish',
-    'lettonie',
-    'lettrists',
-    'letts/widow',
-    'letzkus',
-    'leubner',
-    'leucaena',
-    'leucanthemella',
-    'leucippus',
     'leucopsis',
-    'leukaemogenic',
-    'leukoplakia',
-    'leurs',
-    'leutheusser-schnarrenberger',
-    'leuween',
-    'lev&eacute;es',
-    'levacic',
-    'levators',
-    'leve',
-    'levelness',
-    'levendale',
-    'levende',
-    'levenish',
-    'leventon',
-    'leveridge',
     'leverosatory',
-    'leveson-gower',
-    'levet',
-    'levina',
-    'leving',
-    'levins',
-    'levinthal',
-    'levittown',
-    'levkovich',
-    'levreau',
-    'levys',
-    'lewarne',
-    'lewed',
-    'lewins',
-    'lewis-bruno',
-    'lewis-ruddock',
     'lewis-x',
-    'lewis/landlord',
-    'lewis/oxford',
-    'lewis/vet',
-    'lewisachs',
-    'leworthy',
-    'lewthwaite',
-    'lexically-driven',
-    'lexico-grammatical',
-    'lexies',
-    'lexigrams',
-    'ley-hunting',
-    'leyburne',
-    'leyla',
-    'leyland-daff',
-    'leyland/bedford',
     'leyson',
-    'leyva',
-    'lezak',
-    'lezard',
-    'lezay-marn&eacute;sia',
-    'lfds',
-    'lgdf',
-    'lgmb',
-    'lheureux',
-    'lhrh',
-    'lhuys',
-    'li&egrave;vre',
-    'li&scaron;ka',
-    'li-lo',
-    'liadriel',
-    'liaquat',
     'liardice',
-    'libai',
-    'libbert',
-    'libbing',
-    'libcrypt',
-    'libel-prone',
-    'libelous',
-    'liberal-controlled',
-    'liberal-reformist',
-    'liberal/alliance',
-    'liberal/national',
-    'liberal/social',
-    'liberalisations',
-    'liberalism\'',
-    'liberatingly',
-    'liberation.',
     'liberi',
-    'liberian-registered',
-    'libert&eacute;s',
-    'libertey',
-    'liberum',
-    'libian',
-    'libidinally',
-    'liboff',
-    'librarians/information',
-    'library/ian',
-    'library/resources',
-    'lic2',
-    'licata',
-    'licence-holders',
-    'licentia',
-    'liceo',
     'lichenification',
-    'lichenologists',
-    'lichenous',
-    'lichts',
-    'lichty',
-    'licia',
-    'lidae',
-    'liddiment',
-    'lidiard',
-    'lidice',
-    'lidney',
-    'lidove',
-    'lidsmannaflokkr',
-    'lidya',
-    'liebenberg',
-    'liebenfels',
     'lieberknecht',
-    'liebes',
-    'liebich',
-    'liebrand',
-    'liebst',
-    'liedholm',
-    'liedtke',
-    'liefmans',
-    'lieing',
-    'liesching',
-    'liest',
-    'lieut-colonel',
-    'lieutenant-generals',
-    'lieutenant-governorship',
-    'life-change',
-    'life-choices',
     'life-event',
-    'life-events',
-    'life-giver',
-    'life-partner',
-    'life-positions',
-    'life-preserver',
-    'life-principle',
-    'life-processes',
-    'life-related',
-    'life-room',
-    'life-satisfaction',
-    'life-sciences',
-    'life-sentence',
-    'life-shaping',
-    'life-systems',
-    'life.',
     'life.i',
-    'life/dinner',
-    'lifechance',
-    'lifeskills',
-    'lifespan&mdash;shutdown.com',
-    'lifespan-manual-pack',
-    'lifespan-pi',
-    'lifespancache',
-    'lifespanprocess',
-    'lifestylers',
-    'lifeworlds',
-    'liffe/ltom',
-    'lift-equipped',
-    'lift-out',
-    'lift-right-leg(x)',
-    'lift-shafts',
     'liftin',
-    'liftpumps',
-    'liftsystem',
-    'liga',
-    'ligand-ligand',
-    'ligand-to-metal',
-    'ligating',
-    'liggafjellet',
-    'light&rehy;weight',
-    'light-activated',
-    'light-aircraft',
-    'light-alloy',
-    'light-as-air',
-    'light-bearing',
-    'light-blues',
-    'light-boxes',
     'light-bringer',
-    'light-days',
-    'light-framed',
-    'light-induced',
-    'light-meter',
-    'light-reflective',
-    'light-to-medium',
-    'light_of',
-    'lightheavyweight',
-    'lighthouse-keeper',
-    'lightly-grained',
-    'lightly-loaded',
-    'lightly-taxed',
-    'lightning-rod',
-    'lightshade',
-    'lightships',
     'lightspeed',
-    'lightstick',
-    'lightwood',
-    'ligier-renault',
-    'ligits',
-    'ligula',
-    'ligule',
-    'ligure',
-    'ligustrum',
-    'lihsane',
-    'lijbregts',
-    'like-a',
-    'like/please',
-    'likeliness',
-    'likhoda',
-    'likoma',
     'lilaeth',
-    'lilangeni',
-    'lileath',
-    'lilicana',
-    'lilja',
-    'liljeros',
-    'lilley/berkshire',
-    'lillicrap',
-    'lilling',
-    'lilypond',
-    'lim&atilde;o-cravo',
-    'lim.',
-    'limberger',
-    'limbosperma',
-    'lime\'ouse',
-    'lime-flavoured',
     'lime-haters',
-    'limeking',
-    'limetree',
-    'limicola',
-    'limit&eacute;e',
-    'limit-pricing',
-    'limited-plan',
-    'limites',
-    'limitlessness',
-    'limits.',
-    'limmatquai',
-    'limnanthemum',
-    'limner',
-    'limnodromus',
-    'limnology',
-    'limon',
     'limonia',
-    'limosine',
-    'limpidly',
-    'limpy',
-    'linate',
-    'linburn',
-    'lindale',
-    'lindars',
-    'lindauer',
-    'lindholm',
-    'lindka',
-    'lindoy',
-    'linds',
-    'lindsays',
-    'lindstrome',
-    'lindup',
     'line-drawings',
-    'line-element',
-    'line-ending',
-    'line-endings',
-    'line-kicking',
-    'line-marking',
-    'line-printers',
-    'lineament',
-    'linearis',
-    'linearisation',
-    'linebackers',
-    'linebacks',
-    'lineco',
-    'lineham',
-    'linen-covered',
-    'linen-cupboard',
     'lineolatus',
-    'linescanner',
-    'linet',
-    'lingala',
-    'linguistic/cultural',
-    'lingulella',
-    'linie',
-    'linigan',
-    'linium',
-    'link-stakes',
-    'link.status',
-    'link/ms-dos',
-    'link/s700',
-    'linkings',
-    'linkon',
-    'linkwork',
     'linlithglow',
-    'linnell',
-    'linney',
-    'linnine',
-    'linskog',
-    'linsky',
-    'lintern',
-    'linthaugh',
-    'linton-on-ouse',
-    'lintorn-orman',
-    'lintrathen',
-    'lintseed',
-    'linum',
-    'linyphiidae',
-    'linzell',
-    'liobians',
     'lion-',
-    'lion-coloured',
-    'lion-hunting',
-    'lion-like',
-    'lion-tamers',
-    'liontamer',
-    'lioy',
-    'lip-patterns',
-    'lip-reads',
-    'lip-salve',
-    'lip-to-lip',
-    'lipaemic',
-    'lipica',
-    'lipid-laden',
-    'lipietz',
-    'lipogram',
     'lipograms',
-    'lipper',
-    'lippers',
-    'lipsticky',
-    'lipsy',
-    'liptovsk&yacute;-mikul&aacute&scaron',
-    'lipuma',
-    'liquers',
-    'liquid-filled',
-    'liquid-nitrogen',
-    'liquid-phase',
-    'liquid.',
-    'liquidationism',
-    'liquidisers',
-    'liquifies',
-    'liqun',
     'liquor.',
-    'liquorsave',
-    'liquour',
-    'liripipe',
-    'lisansky',
-    'lisbet',
-    'lisheen',
-    'lisiard',
-    'lisk',
-    'lison-tolosana',
-    'lissenden',
-    'lissovsky',
-    'list\'',
-    'listener.',
-    'listener/reader',
-    'listenings',
     'lisu',
-    'lit&ndash;de',
-    'literacy.',
-    'literary-journalistic',
-    'literate/non-literate',
-    'literature/feed',
-    'lithgo',
-    'lithospere',
-    'lithotriptor',
-    'litigation.',
-    'litnanski',
-    'litomerice',
-    'litoverti',
-    'litovsk',
-    'litre/3&frac12;pint',
-    'litres/',
     'litres/1',
-    'litres/ha',
-    'litres/t',
-    'litt&eacute;rateur',
-    'litt-world',
-    'litter-busters',
-    'little-altered',
-    'little-and-large',
-    'little-changed',
-    'little-educated',
-    'little-noticed',
-    'little-visited',
-    'littlebrook',
-    'littlefield',
-    'littlejohns',
-    'littlemoor',
     'littlke',
-    'littondale',
-    'littoralis',
-    'littorea',
-    'littorella',
-    'litva',
-    'litzi',
-    'liuxuesheng',
-    'livarot',
-    'livatino',
-    'live-bearing',
-    'liveaboard',
-    'livebirth',
-    'livebirths',
-    'livefood',
-    'livehpewl',
     'liver-coloured',
-    'liverbus',
-    'liverp',
-    'liverpool-dublin',
-    'liverpool-sounding',
-    'liverpool-sunderland',
-    'liverpool/birkenhead',
-    'livest',
-    'livi',
-    'living-quarters',
-    'livingness',
-    'livliehoods',
-    'livonian',
-    'lizabeth',
-    'lizano',
-    'ljadi',
     'ljubljansko',
-    'ljubomir',
-    'ljupco',
-    'ljv',
-    'ljw',
-    'll.b.',
-    'll.m',
-    'll0323',
-    'llacen',
-    'llanbers',
-    'llanbradach',
-    'llandderfel',
-    'llanddewi',
-    'llandow',
-    'llandradach',
-    'llandre',
     'llandrillo',
-    'llandundo',
-    'llandyfriog',
-    'llanegryn',
-    'llanelian',
-    'llanelli22',
-    'llanelli27',
-    'llanfaes',
-    'llanfihangel',
-    'llanfihangel-y-pennant',
-    'llanfyrnach',
-    'llangwm',
-    'llangynidr',
-    'llani',
-    'llanrug',
-    'llanwenarth',
     'llanybyther',
-    'llanystumdwy',
-    'llc1',
-    'lledr',
-    'llegada',
-    'lleva',
-    'lliw',
-    'llobregat',
-    'llorente',
-    'llorona',
-    'lloyd\'s',
-    'lloyd-bostock',
-    'lloyd-davies',
-    'lloyd-evans',
-    'lloyd-langston',
-    'lloyd-smith',
     'lloydell',
-    'llya',
-    'lm324',
-    'lm44',
-    'lmg',
-    'lmo',
-    'lmr',
-    'lmxbs',
-    'lner-design',
-    'lnj',
-    'lns',
-    'loadened',
-    'loades',
-    'loadin\'',
-    'loading-up',
-    'loaf-tin',
     'loam-free',
-    'loan-loss',
-    'loan-words',
-    'loan/credit',
-    'loan/deposit',
-    'loanwords',
-    'loas',
-    'loathesome',
-    'loaths',
-    'loathsomest',
-    'lob-lie-by-the-fire',
-    'lobamba',
-    'lobban',
-    'lobbersdown',
-    'lobbes',
-    'lobefins',
     'lobeless',
-    'lobenegula',
-    'lobenstein',
-    'lobola',
-    'lobula',
-    'lobulatum',
-    'lobule',
-    'local-based',
-    'local-born',
-    'local-council',
-    'local-exchange',
-    'local-scale',
-    'localisations',
-    'localities.',
-    'localizes',
-    'locally-hired',
     'locally-recruited',
-    'locally-used',
-    'locascio',
-    'locatable',
-    'lochaline',
-    'lochar',
-    'lochbaum',
-    'lochindaal',
-    'lochindale',
-    'lochrie',
-    'lochshot',
-    'lock&gt',
-    'lock-jawed',
-    'lock-out/strike',
-    'lock-picker',
-    'lock-set',
     'lock-turned-flanker',
-    'lockdown',
-    'locke-king',
-    'locked-off',
-    'locked-on',
-    'lockeian',
-    'lockes',
-    'lockhart-mummery',
-    'lockin',
-    'lockkeepers',
-    'lockleigh',
-    'lockmakers',
-    'lockman',
-    'locko',
-    'lockpicking',
-    'locksides',
     'locomotive-drawn',
-    'locospotting',
-    'locs',
-    'locton',
-    'locusts.',
-    'lodge-keeper',
-    'lodgemore',
-    'lodigiani',
-    'loen',
-    'loewenstein',
-    'loewi',
-    'lofft',
-    'lofland',
-    'loflei&dstrok;3ir',
-    'log-effect',
-    'log-linear',
     'log-on',
-    'logagun',
-    'logarithmical',
-    'logetorp',
-    'loggioni',
-    'logic-oriented',
-    'logical-sequential',
-    'logical/pre-logical',
-    'logico-philosophicus',
-    'logoed',
-    'logotype',
-    'logsdon',
-    'loing',
-    'loir-et-cher',
-    'loiseleuria',
-    'loiselle',
     'loit',
-    'loiterer',
-    'loker',
-    'lokonga',
-    'lokroi',
-    'lokubandara',
-    'loleatta',
-    'lolita-ish',
-    'lolitas',
-    'lollie',
-    'lomanidze',
-    'lombarda',
-    'lombardini',
-    'lombe',
-    'lomberg',
-    'lomo',
     'lomvia',
-    'londe',
-    'londo&ntilde;o',
-    'london&ndash;los',
-    'london&ndash;mombasa&ndash;nairobi',
-    'london-brussels',
-    'london-delhi',
-    'london-edinburgh',
-    'london-made',
-    'london-manchester',
-    'london-paris',
-    'london-registered',
-    'london-sydney',
-    'london/essex',
-    'london/new',
-    'london/regional',
     'londonderry-based',
-    'londsdale',
-    'lonelinesses',
-    'long&rehy;awaited',
-    'long&rehy;term',
-    'long-absent',
-    'long-admired',
-    'long-coated',
-    'long-debated',
-    'long-demolished',
-    'long-deserted',
-    'long-distant',
-    'long-familiar',
-    'long-fibred',
-    'long-headed',
-    'long-healed',
     'long-hitting',
-    'long-hops',
-    'long-horns',
-    'long-inhabited',
-    'long-interrupted',
-    'long-keeping',
-    'long-known',
-    'long-leg',
-    'long-nailed',
-    'long-off',
-    'long-player',
-    'long-practised',
-    'long-predicted',
-    'long-preserved',
-    'long-short',
-    'long-silent',
     'long-stepping',
-    'long-striding',
-    'long-stroke',
-    'long-sufferingly',
-    'long-tongued',
-    'long-travel',
-    'long-waisted',
-    'long-wait',
-    'long-waves',
-    'longbowman',
-    'longburton',
-    'longcot/oxfordshire',
-    'longdistance',
-    'longer-acting',
-    'longeron',
-    'longerons',
     'longest-priced',
-    'longeval',
-    'longhurst/association',
-    'longicauda',
-    'longicaudus',
-    'longing.',
-    'longinoda',
-    'longistylis',
-    'longitude-confined',
-    'longitudinals',
-    'longline',
-    'longlines',
-    'longmires',
-    'longnewton',
-    'longney/gloucestershire',
-    'longobards',
     'longsleddale',
-    'longspurs',
-    'longstop',
-    'longsuffering',
-    'loni',
-    'lonigan',
-    'lonik',
-    'lonithermie',
-    'lono',
-    'lonquich',
-    'lonsdaleite',
-    'lonsdales',
-    'loo-la',
-    'lood-wee-gia',
-    'look\'t',
-    'look-a-like',
     'look-and-say',
-    'look-based',
-    'look-ups',
-    'looked-after',
-    'looked-for',
-    'looki',
-    'lookout.',
-    'looksee',
-    'loomweights',
-    'loony-bin',
-    'loop-based',
-    'loopiness',
-    'loose-based',
-    'loose-footed',
-    'loose-hanging',
-    'loose-living',
     'loose-skinned',
-    'loose-tight',
-    'loosely-knit',
-    'loosely-structured',
-    'loosener',
-    'loosnin\'',
-    'looy',
-    'lop&eacute;z',
-    'lop&rehy;sided',
-    'lop-sidedly',
-    'lopata',
-    'lophura',
-    'lopsidedness',
-    'loquaciousness',
-    'loqui',
-    'lorberbaum',
     'lord-justice',
-    'lord/theatre',
-    'lordinges',
-    'lordlings',
-    'lordship(s)',
-    'loredano',
-    'lorenc',
-    'lorente',
-    'loria',
-    'loriart',
-    'lories',
-    'loriot',
-    'lorpa',
-    'losan',
-    'losco-bradley',
-    'losinskii',
     'losses/gains',
-    'lost-in-cloud',
-    'lost-in-the-crowd',
-    'lost-luggage',
-    'lot/make',
-    'lota',
-    'lothian-wide',
-    'lotho',
-    'lotts',
-    'lottum',
-    'lotus.',
-    'loubens',
-    'loubon',
-    'louca',
-    'louch',
-    'loudmouths',
     'louekoski',
-    'louey',
-    'loughbeg',
-    'loughgilly',
-    'loughshannagh',
-    'loughshore',
-    'louis-leopold',
-    'louis-phillippe',
-    'louis-quinze',
-    'louisbourg',
-    'louisiana-based',
-    'loulou&mdash',
-    'lound',
-    'lounslow',
-    'lourie',
-    'lourmarin',
     'lousepedoodle',
-    'lousing-time',
-    'loutishness',
-    'louverture',
-    'louwaizeh',
-    'lovably',
-    'love-duet',
-    'love-games',
-    'love-in-a-mists',
-    'love-lives',
-    'love-poem',
-    'love-poems',
-    'love-songs',
-    'love-split',
-    'loveblobs',
-    'loved-one',
     'loveden',
-    'lovell/fitzhugh',
-    'lovell/oxfordshire',
-    'lovell/project',
-    'loveni',
-    'loverage',
-    'loveshow',
-    'lovest',
-    'loveys',
-    'lovyng',
-    'low-al',
-    'low-angled',
-    'low-built',
-    'low-calcium',
-    'low-charge',
-    'low-chlorine',
     'low-cholesterol',
-    'low-crowned',
-    'low-emissivity',
-    'low-fidelity',
-    'low-humidity',
-    'low-intelligence',
-    'low-latitude',
-    'low-loaders',
-    'low-magnitude',
-    'low-mileage',
-    'low-nitrate',
-    'low-performing',
-    'low-polluting',
-    'low-prestige',
-    'low-probability',
-    'low-rated',
     'low-register',
-    'low-season',
-    'low-stringency',
-    'low-ticket',
-    'low-time',
-    'low-to-medium',
-    'low-walled',
-    'low-winged',
-    'low-yield',
-    'low/mixed',
-    'lowcross',
-    'lowde',
-    'lowe&ndash;vansittart',
-    'lowen/thames',
-    'lowenbrau',
-    'lower-caste',
     'lower-density',
-    'lower-intensity',
-    'lower-mid',
-    'lower-placed',
-    'lower-plate',
-    'lower-quality',
-    'lower-skilled',
-    'lower-sulphur',
-    'lower-temperature',
-    'lower-wage',
-    'lower/',
-    'lowerings',
-    'lowerson',
-    'lowest-lying',
-    'lowest-ranked',
-    'lowgate',
     'lowke',
-    'lowwood',
-    'loxham',
-    'loxodonta',
-    'loyala',
-    'lozells',
-    'lp.',
-    'lp1',
-    'lp4',
-    'lp7',
-    'lp8',
-    'lpl',
-    'lpo/tennstedt',
-    'lpp',
-    'lps/pls',
-    'lq',
     'lq-1170',
-    'lr33000',
-    'lr33050',
-    'lrsc',
-    'lrts',
-    'ls-series',
-    'ls0002',
-    'ls15',
-    'lslive&mdash;qa',
-    'lslive.qa',
-    'lspan.lstrain.p',
-    'lspan.qa.lslive',
-    'lsstrt.com',
-    'lt-colonel',
-    'lt-gaas',
-    'lt5',
     'ltannnn',
-    'ltd-sourced',
-    'ltf',
-    'ltis',
-    'ltk',
-    'ltm',
-    'ltp1',
-    'ltp2',
-    'ltp3',
-    'lts.',
-    'lu-fan',
-    'lu0',
-    'luangwa',
-    'lubachivsky',
-    'lubbard',
-    'lubbeek',
     'luberon',
-    'lubinska',
-    'lubosh',
-    'lubovitch',
-    'lubuva',
-    'lucas/pilot',
-    'lucaya',
-    'lucens',
-    'lucent',
-    'lucians',
-    'lucidities',
-    'lucidum',
-    'luckett',
-    'luckhardt',
-    'luckton',
-    'luckwald',
     'lucky.',
-    'lucrezi',
-    'luctian',
-    'ludbrook',
-    'lude',
-    'ludermir',
-    'ludism',
-    'ludlington',
-    'ludlow/hereford',
-    'ludv&iacute;k',
-    'ludwic',
-    'ludwig-stiftung',
-    'ludwigshafen',
-    'lufar',
-    'lugela',
-    'luggable',
     'luggnuggian',
-    'lughole',
-    'lugwardine',
-    'luhring',
-    'lui-m&ecirc;me',
-    'luisi',
-    'luk&agrave;cs',
-    'lukal',
-    'lukewarmly',
-    'lukowiak',
-    'lumberjack-style',
-    'lumbi',
-    'lumbricus',
-    'lumino',
-    'luminy',
-    'lummox',
     'lumpier',
-    'lumsden/scotland',
-    'lunacharsky',
-    'lunacies',
-    'lunar-like',
-    'lunar-wide',
-    'lunarci',
-    'lunaria',
-    'lunch-hours',
-    'lunch/dinner',
-    'lunchboxes',
-    'lundie',
-    'lunds',
-    'lunes',
-    'lung-power',
-    'lungbuster',
     'lungis',
-    'lunns',
-    'lunulae',
-    'luoi',
-    'lup',
-    'lupdine',
-    'lurchingly',
-    'lurgantarry',
-    'lurgi',
-    'lurgy',
-    'lurky',
-    'lurvely',
-    'lus/hectare',
-    'lushchikov',
-    'lushev',
-    'lushington',
     'lusitanica',
-    'luson',
-    'luss',
-    'lusterfjord',
-    'lustiness',
-    'lustres',
-    'lustrously',
-    'lutchman',
-    'lute-composers',
-    'luteal',
-    'lutenists',
-    'lutey',
-    'lutherische',
-    'lutley',
-    'lutreola',
-    'lutterell',
     'lutteur',
-    'lutts',
-    'lutyens-designed',
-    'lutzelfluh',
-    'luving',
-    'luvly',
-    'luvsanbaldangiyn',
-    'luw',
-    'luwanga',
-    'luwero',
-    'luxembourger',
-    'luxeuil',
-    'luxeuil-les-bains',
-    'luxuriousness',
-    'luxury-loving',
-    'luzardi',
     'luzio',
-    'lvfs',
-    'lvi',
-    'lviii',
-    'lvrd',
-    'lvs',
-    'lxviii',
-    'lxxiv',
-    'lxxv',
-    'lxxvii',
-    'lyase',
-    'lyatonga',
-    'lyc',
-    'lyc.',
-    'lycanthropic',
-    'lycopersicon',
     'lycophron',
-    'lycropolysacrulite',
-    'lycurgus',
-    'lydall',
-    'lydbury',
-    'lyddite',
-    'lyfe',
-    'lyford',
-    'lyin',
-    'lying\'',
-    'lykewake',
-    'lymenner',
-    'lymphangiogram',
-    'lymphocytopenia',
-    'lymphoedema',
-    'lymphoplasmacytoid',
     'lymphoprep',
-    'lymphosarcoma',
-    'lympne',
-    'lyndford',
-    'lynott',
-    'lynyrd',
-    'lypiatt',
-    'lyrata',
-    'lyre-birds',
-    'lyric-writing',
-    'lyrurus',
-    'lys17',
-    'lys295',
-    'lys40',
-    'lys85',
-    'lysochine',
     'lytham-st',
-    'lyton',
-    'lyttyll',
-    'lyuben',
-    'lyubov',
-    'lyudi',
-    'lyudmila',
-    'lyvyng',
-    'lz.127',
-    'm&amp;eta',
-    'm&auml;nnern',
-    'm&dollar;20,000',
-    'm&eacute;dias',
-    'm&eacute;tayer',
-    'm&ecirc;le&eacute',
-    'm&euml;sto',
     'm&icirc;di',
-    'm&oslash;ns',
-    'm&oslash;r',
-    'm&ouml;rike',
-    'm&rgr;ere',
-    'm&uacute;gika',
-    'm&uacute;jica',
-    'm&uuml;ller-claudius',
-    'm&uuml;llerian',
-    'm&uuml;llerin',
-    'm&uuml;nchberg',
-    'm&uuml;nchner',
-    'm\'ars',
-    'm\'cormick',
-    'm\'en',
-    'm\'kata',
     'm\'leish',
-    'm\'man',
-    'm\'self',
-    'm(40)',
-    'm*a*s*h',
-    'm-36',
-    'm-8',
-    'm-80',
-    'm-city',
-    'm-cl',
-    'm-m-m',
-    'm-m-mummy',
-    'm-made',
-    'm-me',
-    'm-nineteen',
-    'm-present',
     'm-sixty-two',
-    'm-to',
-    'm.1',
-    'm.1.',
-    'm.b.a.',
-    'm.c.a.',
-    'm.d.l.',
-    'm.e.r.',
-    'm.h.s.',
-    'm.k.',
-    'm.litt',
-    'm.n.',
-    'm.p.d.',
-    'm.p.g.',
-    'm.p.k.',
-    'm.t.a.',
     'm.wt.',
-    'm.yonge',
-    'm/a/r/r/s',
-    'm/c',
-    'm/f',
-    'm/m',
-    'm/r/i',
-    'm/z',
-    'm1-specific',
-    'm1-vac-infected',
-    'm1/northamptonshire',
-    'm101',
-    'm134',
-    'm13mp19',
-    'm16s',
-    'm2000',
     'm236',
-    'm28f101',
-    'm300',
-    'm3096g',
-    'm36',
-    'm41',
-    'm46',
-    'm4c',
-    'm5/02',
-    'm5/114.15.2',
-    'm51',
-    'm52',
-    'm54',
-    'm6-420',
-    'm606',
-    'm61',
     'm63',
-    'm7&pound;5',
-    'm71',
-    'm7b5',
-    'm80',
-    'm85',
-    'm876',
-    'm93',
-    'm95',
-    'm96',
-    'm98',
-    'm:n',
-    'm=1',
-    'm=mm',
-    'ma\'ariv',
-    'ma\'moiselle',
     'ma(architecture)',
-    'ma-',
-    'ma/bd',
-    'maada',
-    'maaleht',
-    'maalox',
-    'maarssen',
-    'maaseudun',
-    'maasgau',
-    'maaster',
-    'maathai',
-    'mabbeley',
-    'mabinogi',
-    'mable',
-    'mablecross',
-    'mably',
     'mac-on-intel',
-    'mac-t9000',
-    'mac-to-unix',
-    'mac-under-unix',
-    'mac750',
-    'macabeo',
-    'macanaz',
-    'macandrew',
-    'macanese',
-    'macarena',
-    'macari/stoke',
-    'macbain',
-    'macc',
-    'maccaferri',
-    'maccah',
-    'maccanico',
     'maccari',
-    'maccarthyism',
-    'maccas',
-    'maccaughey',
-    'macchallenge',
-    'maccheroni',
-    'macchia',
-    'macchicken',
-    'macclancy',
-    'macconnal-mason',
-    'maccorquodale',
-    'macdermot',
-    'macdonald-bravo',
-    'macdonald-hall',
-    'macdonald/gloucester',
-    'macdonald/scotland',
     'macdonnell',
-    'macdougalls',
-    'macduffie',
-    'macdui',
-    'macedonicus',
-    'maceeter',
-    'macehiter',
-    'macek',
-    'macerator',
-    'macfarlanes',
-    'macfarlene/radcliffe',
-    'macfish',
-    'macflecknoe',
-    'macgibbon',
-    'macgillivrays',
-    'macgiolla',
     'macgovern',
-    'macgrath',
-    'macgraw',
-    'macguire',
-    'mach-counter',
-    'mach/ten',
-    'mach3',
-    'machain',
-    'machaire',
-    'machavellio',
-    'machell',
-    'machiavellianism',
-    'machilis',
-    'machinated',
-    'machine-age',
-    'machine-driven',
     'machine-embroidered',
-    'machine-gunners',
-    'macho&ncaron',
-    'machrihanish',
-    'maci&agrave',
-    'macian',
-    'macibini',
-    'maciel',
-    'macilwraith',
-    'macintosh-based',
-    'macintosh-style',
-    'mackavey',
-    'mackechnie',
-    'mackendree',
-    'mackerell',
-    'mackerness',
     'mackerracher',
-    'mackesons',
-    'mackiewicz',
-    'mackintyre',
-    'macklow',
-    'macklow-smith',
-    'macklowe',
-    'mackreth',
-    'maclaren-ross',
-    'maclaren/cheltenham',
-    'maclaren/newton',
-    'maclaren/swindon',
-    'maclaren/wroughton',
-    'maclay',
-    'macnally',
-    'macnalty',
     'macnas',
-    'macnaught',
-    'macnee',
-    'macneil',
-    'macneilage',
-    'macniven',
-    'macnow',
-    'macoumba',
-    'macoun',
-    'macphie',
-    'macpuke',
-    'macquairie',
-    'macquaries',
-    'macque',
-    'macracantha',
-    'macrantha',
     'macrianus',
-    'macro-economists',
-    'macro-economy',
-    'macro-molecular',
-    'macro-policy',
-    'macro-processes',
-    'macro-structure',
-    'macroadenomas',
-    'macrobiotics',
-    'macrocytosis',
-    'macroelements',
-    'macrohierarchy',
-    'macromind',
-    'macrosociological',
-    'macua',
-    'macura',
     'macwhirter',
-    'mad-eyed',
-    'mad-houses',
-    'mad/mxil',
-    'madagascariensis',
-    'madaki',
-    'madames',
-    'maddens',
-    'made-for-the-job',
-    'madeira.',
-    'maden-is',
-    'madhat',
-    'madhyamaka',
-    'madingley',
-    'madisons',
-    'madlsq',
     'madopar',
-    'madrasa',
-    'madrigales',
-    'madumabisa',
-    'maduro',
-    'madwomen',
-    'maeldoid',
-    'maelienydd',
-    'maenz',
-    'maeotic',
-    'maer',
-    'maev',
-    'maevia',
-    'maf',
-    'maff-doe',
-    'maffei',
     'mafikeng',
-    'magadi-natron',
-    'magaliesberg',
-    'magasins',
-    'magaya',
-    'magazine-cover',
-    'magazine-type',
-    'magazine/',
-    'magazine/nike',
-    'magazines.',
-    'magdallen',
-    'magdelen',
-    'magdelena',
-    'magdy',
-    'magentas',
-    'maggie.',
     'maggot-eaten',
-    'maggses',
-    'magheraberry',
-    'magheramason',
-    'maghrabi',
-    'magian',
-    'magians',
-    'magic-saturated',
-    'magilligan',
-    'magirus',
-    'magisters',
-    'magistrala',
-    'magistrature',
-    'magnac',
-    'magnaga',
-    'magnani',
     'magnatron',
-    'magnatum',
-    'magnesium-free',
-    'magneto-electric',
-    'magnetometers',
-    'magnetosheath-like',
-    'magnificent-looking',
-    'magnificently-illustrated',
-    'magnigrip',
-    'magnol',
-    'magnox-type',
-    'magnoxes',
-    'magnuson',
-    'magny',
-    'magny-cours',
-    'magrath/oxfam',
     'magson',
-    'magugu',
-    'maguiness',
-    'maguni',
-    'magyar-speaking',
-    'mah&eacute',
-    'mahabharat',
-    'mahajana',
-    'mahajetsu',
-    'mahammama',
-    'mahan',
-    'maharastra',
-    'mahavira',
-    'mahi',
-    'mahi-bahi',
-    'mahimann',
     'mahipal',
-    'mahjoubi',
-    'mahmod',
-    'mahogany-dark',
-    'mahon/usaf',
-    'mahorn',
-    'mahy',
-    'maiben',
-    'maidana',
-    'maidanek',
-    'maidbridge',
-    'maigari',
-    'maigrets',
-    'maijers',
-    'maikop',
-    'mail-bag',
     'maildrop',
-    'mailey',
-    'maillotin',
-    'main-coast',
-    'main-road',
-    'mainbrace',
-    'mainframe-centric',
-    'mainframe-level',
-    'mainframe-sized',
-    'mainframe.',
-    'mainframer',
-    'mainframers',
-    'mainly-american',
-    'mains-kirton',
-    'mains-operated',
-    'mains-pressure',
     'mains-signalling',
-    'mains/rechargeable',
-    'mainsoft',
-    'mainspar',
-    'mainstreams',
-    'mainsty',
-    'maintainence',
-    'maintainer',
-    'maintenance-oriented',
-    'maintenancefree',
-    'maintown',
-    'maintree',
-    'mainyu',
-    'maiorium',
-    'mairies',
-    'maise',
     'maisl',
-    'maisonneuve',
-    'maist',
-    'maisug',
-    'maitatsine',
-    'maithir',
-    'maitland-magill-crichton',
-    'maitlis',
-    'maiyu',
-    'maize-fed',
-    'maizey',
-    'majedul',
-    'majerus',
-    'majest&eacute\'',
-    'majesty&gt',
-    'majeur',
     'majiblond',
-    'majilis',
-    'majno',
-    'major-domos',
-    'majorcans',
-    'majorelle',
-    'majorites',
-    'majus',
-    'makalle',
-    'makapansgat',
-    'make-a-date',
-    'make-do-and-mend',
-    'make-weights',
-    'makeham',
-    'makeing',
-    'makeovers',
     'makepiece',
-    'makeshifts',
-    'makgill',
-    'makhan',
-    'makhtar',
-    'makkin',
-    'makonde',
-    'maksic',
-    'makweta',
-    'mal-e-mir',
-    'mal_de_mer',
-    'malabsorbtion',
-    'maladjustments',
-    'maladroitness',
-    'malagan',
-    'malagasy/avantgarde',
     'malaika',
-    'malakand',
-    'malange',
-    'malaria-immune',
-    'malariae',
-    'malarias',
-    'malariologists',
-    'malasia',
-    'malatesta.',
-    'malaviya',
-    'malayo-polynesian',
-    'malcomson',
-    'malcutt',
-    'male-bonding',
-    'male-centred',
-    'male-sterile',
     'male-to-female',
-    'malecandra',
-    'malefic',
-    'malemort',
-    'males.',
-    'males:1',
-    'malespeak',
-    'malev',
-    'malevitch',
-    'malevolent-looking',
-    'malfunction.',
-    'malfunctional',
-    'malgache',
-    'malhi',
-    'maliciousness',
-    'malielegaoi',
     'malien',
-    'malienne',
-    'malietoa',
-    'malim',
-    'malingreau',
-    'malinke',
-    'malinovsky',
-    'maliphant',
-    'malizia',
-    'malja',
-    'mallah',
-    'mallarme',
-    'mallawi',
-    'mallei',
-    'mallenders',
-    'malleny',
     'malleray',
-    'mallinder',
-    'mallius',
-    'mallophaga',
-    'mallory-weiss',
-    'mallotus',
-    'mallusk',
-    'mally',
-    'malmsbury',
-    'malmsmede',
-    'malo-lactic',
-    'malofeyev',
-    'malpensata',
-    'malpighiaceae',
-    'malpresentation',
-    'malreward',
     'malrotation',
-    'malte',
-    'maltfield',
-    'malthusianism',
-    'maltside',
-    'malu',
-    'malversation',
-    'malyn',
-    'malyon',
-    'malyverer',
-    'malzeard',
-    'mama-to-be',
-    'mamertus',
-    'mamina',
-    'maminst',
-    'mamiya',
     'mamm&iacute',
-    'mammalian-like',
-    'mammiferous',
-    'mamouna',
-    'mamta',
-    'mamuk',
-    'man-animal',
-    'man-day',
-    'man-hunter',
-    'man-hunting',
-    'man-in-society',
-    'man-influenced',
-    'man-killers',
-    'man-mad',
-    'man-mark',
-    'man-modified',
     'man-months',
-    'man-mountains',
-    'man-of-the-people',
-    'man-or-woman',
-    'man-servant',
-    'man-shape',
-    'man-track',
-    'man.',
-    'man/',
-    'man/machine',
-    'man/men',
-    'manadatory',
-    'manaen',
-    'managatany',
-    'management-labour',
-    'management-led',
     'management-staff',
-    'management-type',
-    'management-wise',
-    'management.ps',
-    'management/labour',
-    'management/supervisory',
-    'manager-employee',
-    'manager-of-the-month',
-    'manager-of-the-year',
-    'manager/2',
-    'manager/employee',
-    'manager/proprietor',
-    'managers/archivists',
-    'managers/directors',
-    'manah',
-    'manarola',
     'manaton',
-    'manbane',
-    'mancelle',
-    'mancheser',
-    'manchester-hadfield',
-    'manchester-marylebone',
-    'manchester/liverpool',
-    'manchineel',
-    'manchurians',
-    'mancia',
-    'manciples',
-    'mancur',
-    'mandali',
-    'mandan',
-    'mandarin\'',
-    'mandatorily',
     'manderfield',
-    'mandevilles',
-    'mandibulate',
-    'mandira',
-    'mandleson',
-    'mandoa',
-    'mandocello',
-    'mandolone',
-    'mandos',
-    'mandylor',
-    'maneater',
-    'maned',
-    'manfron&eacute',
-    'manganic',
-    'mangar-kunjer-kunja',
-    'mangat',
     'mange-touts',
-    'mangey',
-    'mangham',
-    'mangin',
-    'mangkalarat',
-    'manglai',
-    'mangosteen',
-    'mangue',
-    'mangunwijaya',
-    'maniacs/lunatics',
-    'manian',
-    'manicurists',
-    'maniema',
-    'manifesto.',
-    'manipulatively',
-    'manito',
     'manitowoc',
-    'mankee/master',
-    'mankiw',
-    'manliest',
-    'manlio',
-    'mannakee',
-    'manneristic',
-    'mannerly',
-    'mannesmann-led',
-    'manni',
-    'mannington',
-    'mannis',
-    'mannor',
-    'manoeuvres-idle',
-    'manolic',
-    'manorani',
     'manouvre',
-    'manshiet-nasser',
-    'mansin',
-    'mansized',
-    'mansuetae',
-    'mansuriyah',
-    'mantalini',
-    'manteau',
-    'mantel-cox',
-    'mantelet',
-    'mantelpiece.',
-    'mantic',
-    'mantillas',
-    'mantion',
-    'mantle-wedge-derived',
-    'mantley',
     'mantric',
-    'mantronix',
-    'manual.exe',
-    'manual/non-manual',
-    'manubrium',
-    'manufa',
-    'manufacturing-oriented',
-    'manuschehr',
-    'manw&euml',
-    'manwaring-white',
-    'many-acred',
-    'many-armed',
-    'many-paned',
-    'many-parted',
-    'many-spotted',
-    'many-storeyed',
     'many-talented',
-    'many-to-one',
-    'manyness',
-    'manzatu',
-    'manzie',
-    'manzo',
-    'manzoor',
-    'mao-b',
-    'maope',
-    'map-like',
-    'map-reader',
-    'map-related',
-    'map-to-see',
-    'map.',
-    'map/homonym',
-    'map/lemma',
     'mapes',
-    'mapmaker',
-    'mapped-out',
-    'mappers',
-    'mapscreen',
-    'mapu',
-    'mapwork',
-    'maquio',
-    'mar&ndash;10',
-    'mar&ndash;17',
-    'mar&ndash;4',
-    'mar&ndash;9',
-    'mar-see-lay-a',
-    'mar/april',
-    'marab',
-    'marabout',
     'maradonna',
-    'maraffi',
-    'marangoni',
-    'marash',
-    'marasmus',
-    'marat-sade',
-    'marathi',
-    'marathon-based',
-    'maratta',
-    'maraven',
-    'maraz',
-    'marble-like',
-    'marble-stucco',
-    'marble-tiled',
-    'marblers',
-    'marbre',
     'marby',
-    'marc&iacute;lio',
-    'marc.',
-    'marcelli',
-    'marcels',
-    'marcescent',
-    'march-13',
-    'march-20',
-    'march-31',
-    'march-6',
-    'march-july',
-    'march-june',
-    'march-october',
-    'marchal',
-    'marchauntes',
-    'marchebanks',
     'marchena',
-    'marchionni',
-    'marchmain',
-    'marchweil',
-    'marcilio',
-    'marcillac',
-    'marcio',
-    'marclay',
-    'marcolino',
-    'marcombe',
-    'marcusian',
-    'mardale',
-    'mardall',
-    'mardersteig',
-    'mardeuil',
-    'mare\'s-tail',
     'maread',
-    'marechal',
-    'mareda',
-    'marehan',
-    'maremma',
-    'marengi',
-    'marez',
-    'marfaing',
-    'marford',
-    'margarette',
-    'margaretting',
-    'margaritas',
-    'margaritescu',
-    'margesson',
-    'margetson',
-    'margharita',
     'margheritas',
-    'margiani',
-    'marginale',
-    'margolin',
-    'margolyes',
-    'margraff',
-    'margret',
-    'margu&eacute;rite',
-    'mari-el',
-    'maria-hilf-strasse',
-    'mariama',
-    'maribai',
-    'marie-ande',
-    'marie-blanque',
-    'marie-claude',
-    'marie-jones',
     'marie-jos&eacute;e',
-    'marie-joseph',
-    'marie-michele',
-    'marieke',
-    'mariemont',
-    'marienborg',
-    'marienkirche',
-    'marihuana',
-    'marijuana-smoking',
-    'marilee',
-    'marilou',
-    'marilyne',
-    'marinati',
-    'marinere',
-    'marinescu',
-    'mariniers',
     'marinist',
-    'marinka',
-    'maripa',
-    'mariscus',
-    'mariss',
-    'maritains',
-    'maritiem',
-    'marittima',
-    'marivan',
-    'marix',
-    'marjanov',
-    'marjayoun',
-    'mark-downs',
-    'mark-making',
-    'mark-to-space',
-    'markal',
     'marked-out',
-    'market-conscious',
-    'market-days',
-    'market-entry',
-    'market-garden',
-    'market-index',
-    'market-industrialised',
-    'market-like',
-    'market-orientation',
-    'market-quoted',
-    'market-researched',
-    'market-responsive',
-    'market-share',
-    'market-testing',
-    'market-value/book-value',
-    'market-watchers',
     'market/commercial',
-    'marketing-orientated',
-    'marketing-oriented',
-    'marketing-related',
-    'marketmaker',
-    'markfield',
-    'markidou',
-    'markill',
-    'markington',
-    'markkaa',
-    'marks&amp',
-    'marks&amp;spencer',
-    'marksheets',
-    'markswoman',
-    'marlais',
-    'marlborough-based',
     'marlboroughs',
-    'marliac',
-    'marlierli',
-    'marlina',
-    'marlow/buckinghamshire',
-    'marlowesque',
-    'marlstone',
-    'marlyn',
-    'marmalada',
-    'marmaris',
-    'marmin',
-    'marmont',
-    'marmoreal',
-    'marmoreally',
-    'marmousets',
-    'maroc',
     'maroon-coloured',
-    'marot-b&egrave;ze',
-    'marot-de',
-    'marqu&eacute;s',
-    'marquee-like',
-    'marquessate',
-    'marquez\'',
-    'marquin',
-    'marrable',
-    'marrano',
-    'marranos',
-    'marren',
-    'marriage-gifts',
-    'married/living',
-    'marriots',
-    'marriott/coach',
     'marrison',
-    'marsalforn',
-    'marsanne',
-    'marsden/lorry',
-    'marshall/archeologist',
-    'marshalli',
-    'marshell',
-    'marshwife',
-    'marshwood',
-    'marsnet',
-    'martagons',
-    'martec',
-    'martella',
-    'martic',
-    'martin\'s-in-the-field',
-    'martin\'s-le-grand',
     'martin-esque',
-    'martin/homeless',
-    'martin/tewkesbury',
-    'martinair',
-    'martiniquais',
-    'martinotti',
-    'martins-in-the-fields',
-    'martinsburg',
-    'martinshaw',
-    'martinsyde',
-    'martus',
-    'martyr-like',
-    'martyrium',
-    'marudi',
-    'marulanda',
-    'marutis',
     'marven',
-    'marvic',
-    'marx-engels',
-    'marxist-hegelian',
-    'marxist-oriented',
-    'marxiste',
+)
+
+blocks_39 = (
+    '$*/sexuality$,acetogenesis$)dimer-dna)"ic$)eroticism$$gamy%%enize*!s$(iotherms$%lgies$(monument$&nculus$&phoric$(synaptic"$ndes',
+    '##ess%$test$&y-comb&%roast&\'scented&%toned%\'/county%)comb-like*&shaped%%mouth#&ington#%kenya%!r#"ne$\'igsbaum',
+    '%"et%#ial#%s/ord"%o-rah#1d/gloucestershire#(gstraten#&k-nose$(/gliders$#ahs$"en$%lines$"up#*per/thames$\'oe-like#!r',
+    '"&p-like#+ed&rehy;for$$full$$moor#&finger#*kin/asthma#\'logenys%\'sternum#/man/saddlebrook#&ped-up%&resque$&ringle#+ton/country##was"%rdeum',
+    '#%izon.\'0tally-structured#\'maechea$"on#"n-$!.$#ett$\'ingsham$0sby&ndash;akroyd#\'ologist*!s#$rell$(ibleness("st%#fed',
+    '%"ly%$nger#0s_d\'&oelig;uvres$%burgh$"e-&$boys\'$rass&#car\'(hestnuts&\'doctors&&hoeing&)ownership&%races&%shoes&)trappings',
+    '%%carts%$hage&"oe%&person&#ool%-s-for-courses%$well&$omen$3ley/gloucestershire##tag$.on-cum-studley\'.in-ribblesdale&!s#!y"&sannas',
+    '#%okawa#)pital-bed*$ound(\'/clinic)$unit((izations$$odar#%sbach#\'t-guest%(parasite%(specific$\'/target$-:universities$)elisation&$lers',
+    '$(ological"\'t-boxes$%hatch%#ead(!s%%ouses$%lines$$melt$%pants%$late%&ressed$&rodded)"rs$*to-trotsky$%wired',
+    '#*el-keeping%\'/casino&%guest&%motel%\'keeping%$ship%%ympia#\'footing#&hamton#,ly-contested&&tipped#"ol#$seat##tel%$ntot',
+    '#!z$\'endorff"#uas%"se#$chen#"da#&gharry$&oumont#$mous#$nces$&dmills$$fort$&tondji#(r-a-week%\'glasses',
+    '$$igan##san$.e&rehy;holders+&keeper%&-boats\'&reaker&(cleaning&%holds\'#unt*#ers&\'keepers&#not&\'officer&\'parties\'%erson',
+    '&&senate%$.the%$boys&%uyers%$call&$oats%&fronts%$load%\'masters&%oving%\'parents%#wif$$mans$#ten#"ti',
+    '""va#$e-to$"ll$%r-fly$!y""w-$&dun-it#$/why#)ard/first\'(michelle\')plaintiff&$ites##beg#+ell/british$$rton',
+    '#$kins#%lings##man#$orth##sam#&towdie#$wood"#x-b#"ie"#yed$!r#,ningen-heune#"os"!z!$p-gl',
+    '"&/works"%100lx#!3#!9"%9000s"(erplasia"/lc-fluorescence%#ria"&v16/18"!z!"qs!"r4"!6"5ad&ccaron;ansk&eacute#"ka',
+    '#%zdira"#cnz"$eben"#ota#+znov&aacute",u&scaron;ica!"s4"!5"#649"\'ein-hsu#!u"#p70"#up+!#t29"!4',
+    '""el"%fiiia"#lv3!$u-go"$acas#\'machuco#)ncavelica##yna""ba$$cher#"be%"rs&!t$!i%"es',
+    '"$chin##ker$(le-bones%"ow""de#%ibras$!s#%soned$$well"$eber#"ne##vos"#gel$"st#%getts',
+    '&)/daughter\'%nigel$#roy$&sfield%"ie#%oline#%uccio"(iraatira"\'kanovic#"ou"\'la-hula#&l-born%$down$\'aballoo#&sdonck',
+    '"*man-beings&\'centred\'&reated&(designed&(enhanced&&headed&(occupied\'\'riented&#pet&(readable%%eness%$like#-berside-based$&leness$%racht',
+    '$!s#\'e-adams%\'rothery$&ctants#(idifying$&lation%!e$"nt#3mingbird-pollinated$!s#$ored&$sque%$less$&urists#%phery',
+    '%)reys/west&"is"(n-lovers#!c#(derstand&\'thwaite$"re&)d-and-odd(#day($eyed($fold($mile((per-cent)$roof\'#men',
+    '#%garia((n-soviet+$tyle$+er-striking&$buhl&%fords$$ness$*ry-looking$$uana#"ke$$iest##let%!y#$ston#&t-ball',
+    '$$/ben%&victim$$bach$*er/warrior$-ing-gathering(%whips\')/shooting$#rod$"s."(pehensis##ped%!r##sos"!q"#rak',
+    '#$comb#\'d-major$#le.$!s##ieh#&lement$%stone##man#$rahs$"ey#$seys$%t/cam&\'dursley&)sharpness\'&windon',
+    '%%house%"ly%!s#%tarte$\'fulness$#ley"$saby$&mettin$#yns#"ba%,nd-dominated(\'hunting\'*s/partners#!e$"in',
+    '#"in##kie##man#"on#\'thwaite$!u"(tchesson%"in\'$siae#)tenlocher$!l$(on-mills\'&squire$!s#\'z-medau',
+    '"\'xelrebe"%yssen$"um"$zzas!*veravellir!\'wang-ho#\'rang-do""it"&s-s310"$ylfa!)yaluronic#$nnis"$bert#%ond-n"\'dantoin',
+    '%#gas%$vion$"ia%(disation%$odic$)o-dynamic&\'massage&(proteine%1carbon-generating,)producing&#ele%*encephalus%#gas&)en-filled&\'raphers',
+    '&&ysable("es\'#tic%&meters%$nium%&pathic&(eroxides&%hobia&$onic&%rogne&!s%!s&\'ulphide+"te%&ureter',
+    '&&yethyl\'\'proline*)pylmethyl"%gford#%gelig#$iena&+e-conscious&#ism#\'romycin%)scopicity")lemorphic*"sm#\'obatids"$mans#%eneal',
+    '$%rians#&ietown#&n-like%$tune#\'opholus"#nam#!e$!k"#ogo#!k"%patia#+e-merchants$(r-crisis)%tical&)efficient',
+    '&+sensitivity%!.%&acuity&)mmonaemia%%bolas(&ically%)catabolic&#ium&)onformity(&scious.$ness&$ubes%\'endemic&+xcitability\'(tensions',
+    '\'\'ucaemia%+intelligent%\'kinesia+!s%%lexic&*ipidaemias(-oproteinaemic%*management("ic%\'numbers%\'osmotic%,parasitising\'"th&+igmentation&(luralism',
+    '+&zation&,roliferative%.responsiveness%)sexuality&#how&)imulation&&patial&\'trophic%\'tensely\'*xt-to-text)!s&)hyroidism&#ies&/riglyceridaemic%+ventilators',
+    '#*no-grooves%%gogic%&paedia%#vel#0o-kulturstiftung%\'osmotic$\'acidity%(esthesia$+chlorhydric&/olesterolaemiac%$racy$&dermis$2gammaglobulinaemia%"ea%\'lycemia',
+    '$*lipidaemic$+myelination$)natraemia%\'ymously$\'physial%*ituitarism%&lastic%+roteinaemia$%thecs\'!s&%yroid$(volaemic#)sographic"&rcanus#"ed',
+    '#&taspes$)erization"(useyinov )i&ndash;v#)tilde;aki)"ez!#\'il!#(2)""b)!(-&khgr;b"\'binding"#din"#i-i"(kiribati"%linie',
+    '"#r-a#)estricted"&scream"#was!".4""67$".2"&a.t.a."&b.o.a."$c.b.$"j.$$l.q.$!s%!."$d.i.',
+    '$"i.""l.$"j."$o.f."#r.a"$t.d.""y.!+/00/26/0035*"42+!7#)1/23/0002+!3+!4+!5*"13',
+    '+!7+!8+!9*"22+!3+!5+!7#)2/26/0072+!3+!4+!7*"82#+3/30/0012-2-!3-!9',
+    '*"76#$5/26\'%/0045+!7(!4(!7#)8/25/0001""ad"#sal"!v!#586!!8"#60s"!n!#933',
+    '#!7"#70s""80#!2!#aba"!i"(mblichus""ns$"on#%thine"#ran"$ssos"*trogenesis!.b&aacute;rruri"#adi',
+    '"-benb&uuml;ren$"tt"!d"\'erdrola$#ica"&id.:13"1m-hewlett-packard$$like#//apple/motorola%"tp#\'ulators""ne"\'oa/bank"#uka!*c&ocirc;ne',
+    '#)m-3/lfa-1#"re".e&rehy;covered#%-axes$&bright%&uckets$&capped%%liffs\'"mb$)encrusted$&fields$$hung$%lined$%packs%$itch',
+    '$$worn#%boxes##cap##ton"\'himonji#*neumonidae+!s#(thyobodo\'#sis($tega")i/enichem#$cals##lio$"ma"#kes',
+    '#!y"*m/justitia"%n/who"(on-do-it$#ium$,ographically""p0"$seaf"#tal#!c#$eric##hus!%d/ego"&24,400"%7,200',
+    '#%mante#!r"#dle"*ea-o-graph$%lisms&1zation/abhorrence%&ogical$$tors#$ford##nti&)fiability(%er(s)*(s/titles\'&yingly#!o',
+    '$\'ligical%1ogically-inspired(!e#!x"#ina#\'olectal$"m.%\'aticity$+ventricular".ol-worshippers$%ators(!y#,men&eacute;e"$ries#(ocarburi',
+    '""ti!#e.e"#aun"#lts"!n"#sus"$vers!)f&formula"%/ones"&015331"!8"#ang#!r"&n-&agr"%or/ls',
+    '!#gae#"po"#f-1"#g2a""ht"!n#&atenko%!z#%orers""oe"$uazu!$hich"!n"!s!\'i-based',
+    '#"31#"68""ag"!g"$i.62$!7$"i.##/iv$$jg27&!7#"88#"cs#!i"$jima""ls',
+    '#!s"*nstitution""ro""vi#!x!#jlp!$kast""os!+l&ndash;116"!-#%1&agr$!0#+6-dependent""bs"$dana',
+    '"2e-de-la-cit&eacute#$achs#,ocolonoscopy"#fis""ir#$ssos#\'upersis"-l-articulated$+distributed$(executed$\'guarded$*maintained&&tching$\'natured$&played',
+    '$%spelt$(targeted%)emperered$\'wishers%&rapped#*egitimates$$sley$"tt#$gner#)iberalism$$mani#$ogan#(uminatio$$s.12\'$3,14',
+    '%,ionistically&"ve%%trata)%ively\'#e/1#&yricum""mi"#oco#$svay""p."&ubabor")yumzhinov!-mage-analysed&$wise%&master',
+    '%\'setters%$tool%$view\'$sion$+inativeness%#zer#$mali"\'bokodvo#)rications%#kia"*f-endorsed$\'imposed$%world""g."\'idazole',
+    '#$trex"#lay#*il-toubkal"(maturely#!e$%rsive#"ix#(obilizes$)rtalizing&%elles$(vability\'#les#$unis%/o-globulin-like&1affinity-purified',
+    '&,deficiencies\'*iagnostics&#gen)$etic)!s&)histology&,localisation&,magnetically&%plate\'*rophylaxis&*regulation&&stains&+therapeutic$"re"&obolin',
+    '#-act-absorbing$\'llomeni$&rtment$)ssiveness#,ecuniousness("ty$#rat\'$oris%\'ceptive%%fecta)"um%\'ialism\'&"ls%(sonalism%(tinences',
+    '#-lausibilities$!e%&mental$%icity%#ed.$%osive%!y#\'olitely($ness$(nderants$!r%&tance.($tly.$%sable%#ed.',
+    '#)recisions%&gnably%.ssive-sounding$)isonment.$\'opriate*$ions%$ved.$%udens%$neta#\'udently$#gns$\'lsivity"#rik#!y"%s/esa',
+    '"*timidation!.n&eacute;gales#-ndash;service"(-bleeper$"ye#$cell$#hol#$deed#\'earnest$(xistence#%field%$ghts$#oal%#cus#%hours',
+    '#$pace$$lane$$oint$$rint#%roads#\'surance#(the-foot$!o").american"%/lack"!0"$1984%!8"+_er_general#3in_conjunction_with',
+    '&+relation_to()sponse_to#/propria_persona"%abata#"da$"do$(missable#$lcik#\'pparent%\'ropiate#\'rguable$)ticulates#+vailability"%breed"\'c-apple',
+    '$(inspired#)/motorola#)amination$"na%)descently%$tato$+rcerational#&endium%)se-burner%1tive/disincentive$"pt&$ions$$rtus#%hbald$&oative',
+    '#%isura\'!e$$ters$(vilities##lud%)sion-free#)oherences*!y$"la$*me-leisure)"ss\'+maintenance&,/expenditure\'\'poverty&,r/shetlander',
+    '%(petences&&letion$!n%\'gruency%)sequently&(istences&+picuousness%\'tinency*#tia&"ri%*veniencies$)rrectness&(uptibles#&rease.(+d/decreased',
+    '%!d&\'ibility%.ment/decrement)%alist$(iminates*%ingly*#ory$(ustation,!s#$star#\'ubatory%!i$%lpate%(turation$!t',
+    '#%amiro$!r#(ecisions$(fensibly%)inability$(mnified.*"rs\'#ty.$%nters&)ification(!y$1pendence-oriented*#ts3$(spension$+terminately',
+    '%\'icality#"ge#0ian-administered\'$ness\'%owned$$cies$%e-pop&$rock$%genes%&o-dyed&!s$)spensably&&utedly$/vidual&mdash;is*#(s)',
+    '+.characteristic*!/+%group*%ities*$s-do)$tive#"o-%/african-america&&nglian%(nepalese%\'russian%#sri$(malesian%&itably$0nesian-sponsored',
+    '&\'oopilly$!w#$rani#1uced-polarisation%0tance/resistance$"lt$#ppe$&ration$0strial-economics+%scale+%urban*$ises+#zes*+ly-oriented-(relevant',
+    ')\'leading)(watchers()/commerce)&market#%y-500$!k"0e&rehy;qualities#)ffability%)ectuality%\'icient.#-galitarianism#*lastically#$rmis$$ting%"ly',
+    '$\'timably%&rillas#,vitabilities(!l#)xactitude$)haustibly$+pensiveness&%rtise%)ressively"+fallibilism$\'nt-care\'\'formula&"il(\'isation)&zation',
+    '$+rct-related\'"ed#%ecton$$dels$0rence-procedures%*iorization%$nale#*iltrations$"ni&!t\'-e-dimensional((ly-lived+$thin\'"um#(lamation',
+    '%%tion.&"or$&ecting$%uenzi#&oboxes$#mix$#pro$&rmatik)(on-flows,%giver,+independent.\'tensive,$only+%/data,\'enquiry',
+    '+\'sdienst,&syteme)&veness&#in\'\'%x-sql&$tion#\'ractors%%human%%renal$#ont#!u$$sate"+g&eacute;nu$<oacute;lfsh&ouml;f&dstrok;3i#(athering',
+    '%%malls##git#(hilterra#"il#+l&eacute;sa$&aterra$&e-neuk\'#ook%$sant#!o##rao%#tes&%iates$-es/windows4gl&$sion',
+    '$.rit-upto-state#(ibitable#\'umanism"#ion"0jection-moulding#)ournalism#\'uctions$%ries.%(y-dogged\'(troubled"\'k-wells#!.#!a$#hta#&berrow',
+    '##inc"%liers$"ne"(maculada#\'igrants")n-keepers#(er-outer&(suburban%$wick#%front##ins#0ocence/ignorance(!y%&ulated)$ions',
+    '#-sbruck/patsch#*treprenuer##uit$&merous#$vest"*occupation$&ulants#%vatic"+putroutines"\'quilivi%*sitorially"(ravision"(sanities#*ect-eaters\')repelling',
+    '&"s.$\'parabel$&rtless#!h#!i$$dent&0r/anthropologist\'#ism$-ght-promoting\'%fully%"ne&/ificant-looking$#lco$&pidity\'$ness',
+    '#\'obriety$&lvents$"me#"pe$"ir&)ationally#8tallation/deinstallation-+performance,$ists%)nce&ndash&(t-access%\'uration$(igations%(llations\'!s',
+    '%(tu-tions\'\'te/riba)*s/colleges()ion-based+(/company+&alises/!t\'"ut$)ructively(.or/supervisors&%ment.*&ations*!o&%zione#*ufflations',
+    '%\'in-like\'$omas$!r%,ance-beating*\'related%#ed.%\'gencies%*rectionist$)sceptible#\'wingers"/t&eacute;rieure#\'angibly#)eger-spin%)ral-order\'0tion/segregation',
+    '(#ory&.o-differential%(umentary$!k$,l-compatible((nfigured&(to-alpha&$unix%*lectualise*!m&\'igence.,!r*%tsias\'&sphere$&merata',
+    '%$sest&.ity-correlated\'#ves%"t.$1r&rehy;dependence%&-adult\'#lia&%block\'$oard\'%ranch&&campus\'$lass&\'digital&\'glacial\'\'ranular',
+    '\'(nstitute&\'married\'$edia\'$ilan&+nationality&(observer\'&ceanic\'\'perable+"te,#ing\'-rganisational&)planetary\'%olicy\'(regnancy(#obe',
+    '&&record&&senior(\'ssional\'%train\'+ubjectivity&\'uterine&*visibility&$word%*actionally&"pp&$tion*"al%$book&#rew\'&ollies',
+    '&)essionary&\'olonial\')rrelation&)urricular%#dab&*ependences&\'ictions)!s\'(gitation\'(visional&%omain%!e&(st-based)%rates()/dividend',
+    '%-face-oriented)%test3\'#una&\'erence.(#ior(&ograms&%ields\'#led&$lash&)ollicular&$ront%.generationally&&rowths%-institutional%\'lectual',
+    '&&obular%\'madiate\'+nageability\'*rch&eacute(#ket&\'ediate-+#ory)!o)"um\'\'nstrual&&itotic(%tence%\'nalises(+ly-assessed\'+tionalistic',
+    '-)ly-agreed0&famous1%unded0%known0(renowned&\'euronal&$odes\'!s&%uncio%%ocean*"ic\'$ular&)pen/posix(&rcular&%sitor',
+    ',!s\'*netrations\'(rsonally&#lak(#yce\'"us&&olator&,r&egrave;tes\'&actice\'"es(%tatio)!e)%ively\'(ocedural%\'relates',
+    '&\'uptedly)"or%+segmentalia\'"rv\'$xual&$heet&%leeve&\'ocietal&%paces\')hincteric&!t\'\'itially&+ubjectively%$tech&%ribal',
+    '%!v&$als.&$ener&,iew/powermib&"oo%(weavings\'"st##ial$\'huatana$#mes%(idations$"re&"ly$$sari$&tially',
+    '($ntly$\'nazioni#)ra-afghan\'$sian&(cellular\'&omecon&,departmental&#ems&(familial&.generationally\'+overnmental&\'hepatic&(marginal\'%edium&+oesophageal',
+    '\'+rofessional&%rural&$shia\'\'keletal&$team%&_vires%(arterial%)cellulare&$hain&\'oronary(&poreal&%tably&(utaneous%$firm%+hippocampal',
+    '&)ndividual%*muscularly%\'nasally&\'euronal&)ucleotide%*pancreatic\'%tient%(variceal&(eneously$!e%\'pidness$"ic$\'o/verse%&ducers%\'jecting',
+    '(+t/extrovert$\'umental#%ubate$+ssusception#"vs"\'undates#"re#$tile"+variability#$enio$\'rchapel%&liever$\'sco-mim%%table&"ee',
+    '*,or-in-charge&-ment-services&,or-relations&&ronica#!i$$able$%duals$"ew$3gamise-who-was-born%)oratingly$\'ncibles$&olably$$scid$$tin\'#\'olatile',
+    '%!v"%ward-\'&facing&\'looking!"ob"(dination#%ophor""ka"$laos#!o"(n-dipole$%image$)leachable#(/glucose#%atana',
+    '$#des$\'zations#\'otropic#$tana"+ta&amp;sup1$!s""ur!"p2#!4#!8"!4")araquirre"#mpa"#pen##ons',
+    '##eco##ius!%qsoft!\'r&pound($;0.5)#1.2)#200)#400)$76.3)#8.6)#9.1""/r""aj#%klion#(n-united',
+    '$,ian-brokered("us#\'q-based$)i-kurdish&\'turkish#&scaris%$ibly#$tely$!y"%edale#!k#%lands##nes"(fanullah"#ial',
+    '#(dologist#"ms#\'sh-bred##tis#\'yagolle"!m##ela"%okawa#(n-banded\'!r(#red%*deficiency%\'filings&\'ounders%\'toothed',
+    '$%claws$&ed-out%"rs$$hand$"ie%"st$%sides"*redentists$(fragable$(gardless%-ularly-shaped$&levent$,placeability+"ly$+sistibility',
+    '(%tions%)pectively$*vocability#(idescent$%gates$&tators"#s16#$cade#%hidat#!p"!t"\'vington""yt!#s**"%-like',
+    '"&2.4077##31a"$_due#"no#\'subject""ak$#son##nov#"rd"2chemia-reperfusion\'!c$#ial%"um#"or""dd',
+    '"$hams#%igaki$/kawajima-harima%!o$$mure"#itt"&kandar"%lamia\'!h$)nd-dotted\'&hopped\'$like&"s.$!s#%esman',
+    '"\'mailiya$!r""o-$%based#$9000#&butane#%chron$%ratic$%yanic##dry#$enet#\'flurane$,orm-specific##gas#\'latable',
+    '$"da#+merisations("ms\'&zation$*orphically#+nitrogenous#&pleths$%ropyl$%ycnal#%tatic$$elus$1opically-enriched#*volumetric"&paghul$$rtof',
+    '"!r#)ael-based\'#plo\'%syria&%ensis&+i-sponsored($type&#son#$otel#!s"(s-prealc#$aacs$"ka#&enmann#!u',
+    '",t&uacute;riz#"an$!r#%hmian#%iklal##ory#!s""us"!y!$t\'sa#"ud"$-but#!i$!f$!s',
+    '"".a#!i"!/#$them""52""_a$!t")al-reding$%cable$*ian-funded((sounding\'#ism%"co&"um%#ens',
+    '"(chela-ka%#nor$$icoo%"ly%)ng-powder$*y-fingered""ea#*m.found.in$&/input"%fadel"%hamar#(yphallic"(inerated"!m#!f',
+    '""pc"*raconazole"$s/88#.a/organisation#$elf\'"#ten$%ville#!y""uc#"ri"%zehoe!,u&times;10/h""/g#"mg"%bhair',
+    '""ir"!n"(rminburg)!h"$ssus"(zhamtorg!%valdi#\'nanusko"#ens#$rnia$!y"#ica#"ed#!n$)gs/farmer',
+    '#"ne#&ry-ban&&topped(#wer"!p"(verybody"&y-leaf#%ester!!w""ad#$nami#"ta"$erne""th!#xer',
+    '!&zation$!t"$mery"\'zy-jack \'j&amp;p#\'uml;ger(!r",dollar;7,049"/ntilde&amacr;na"+oacute;zsef#-slash;rgenson"*uuml;ntgen!"\'y!#+a1!*-direction',
+    '"!p"%stars!#.-a"$a.g.")b.butcher"$d.b."$e.l."!f##.c.$"s."$g.a.$$v.a."$j.c."(m.barrie"$n.l.',
+    '"!o"$p.j."&s.mill"$w.b.$$h.t.!#/5f"%month!*1&ndash;80"!1"!3!!2"!8!+3c&ndash;65!#7w1!"89',
+    '"!4!"=9!$aaez#!k#!n"#bil#!r$!i$"ut"%ccard#"je#&k-arch%&knifes%&roller$\'al-like',
+    '%%tless$%field$#let$%nifed$$plug$&rabbit%#ock$+s-in-office#&ob/son%#aea%"ea&#llo%&i/fair%&sonian$"mb',
+    '$$pone#$pacs#\'queries&\'s-emile(%louis(\'nicolas(%roger($yves&!t%#ier"\'de-like#$wiga"!e#!l#%nbert',
+    '"\'gannath#(gard-lai$\'ed-edge+!d%%rnath&!y$!i%"es#)iellonian#+uar-driving&#ibe"\'hnhorst$-ke-emde-losch#"ra$!e',
+    '##weh"(ichandra#&lbreak$"or##pal$-ur&ndash;agra""ki#\'obovits#"ub%)sk&aacute"%lbert##dar#%frezi#$ihal#%opies',
+    '#$a\'ah$!i#\'baldorj$!e#"ei$/s/herefordshire%"ie$"tz#,iat-e-islami##pel$"ot#\'shedpur"1n&aacute&ccirc;ek#$-apr##abi',
+    '$!l##een$!k$"ts%"ta##gel#&issary##k\'o$#ers$$ovic&#ski%&witsch#"ni%#ngs#&ospira',
+    '%#itz#!s$&enists#"ta##uar&#ius&+y&ndash;thu\')-november()september#!y"&pan-us%(/germany%$ese-)%based))dominated',
+    ')#led)(occupied)&soviet($ness##ery#!p$!y"%ralla#"ba#!d$"en$,ine/scotland&,i&egrave;res#\'gonelle#"ju',
+    '#/man/oxfordshire&!s$"en#"on$\'slavsky$!v##ram$%ingly$"os##udi#,vis/disabled"$scha#&enovac#&lovske#$mina',
+    '#"ny#(omirgott$$orah#!s#\'trzebie"#tes#!i"#uch"%vogue"\'w-bones%\'reaking$$like#"ar#!g"%y/car',
+    '##nie"%zairy#&binsek#+z-classical%$soul&$tyle$&/blues%&fusion%$soul$#dom$"er$#ier!"b4"#ase!$c001',
+    '"#r2l""wi!#d-g"%aayel"!m!*ean-de-luz%.l&eacute;onard&#ois\'"up%$rene&%obert$#ine$"na%$eney"3bha-i-nejat-i-melli',
+    '#%idiah"&epneys#&ringly#\'woolall"\'ffcoate$%ereys&&sonian$#rie#"ri""g3#"sy"&hangir%"ne##ova")llybabies',
+    '%$like"(mma-jane%!t$"el"&n&ouml#$ifer$#sch#%netts"(opardies"%phtha"-r&oacute;nimo##ash##bah#!e$$miny',
+    '#"re#$usha#2vell-lange-nielsen$%iston"&scomea#&person#$sies$#ore#&tetten#\'uitical#&zensky"*t&eacute;e#&-pipes#%admin#&liners',
+    '#&setter$%kiers#&tisons")w-baiting#*el-studded%%lery.$"tt#,ish-american&(/zionist"$zzin&!e!%hally#%rokha"&fenner!(iangxing',
+    '\'!g#$xing"#dda"(efangjun"&g-saws##awa#$gler#%jidyn##oro#*saw-puzzle"!h#$lava"#jun"&llings""ms',
+    '$#oes$#zhi#$iwin#&k-back"%ricna"\'ttering!#kap!$m101"!c""ob"#p50!"np!(o&sacute"%-okes"&acquin',
+    '$!s")b-costing$*displacing$&hungry$&killer$$lots$(security%#hop%\'pecific#!/$)interview#$bies$"ys#"ey#&s-cuts',
+    '&!s$&worths#!y"(ck-strap##oem"#dal##els#"hi$(pur-like$!s#$icus#!l"%fless")g/shuttle#!o',
+    '##van"#hal$/nnesburg-soweto&#son#3n-go-to-bed-at-noon$!1$!a%$thon$#sey%)on-acsadi(%merck\'1/northamptonshire\'$ians%+ton-trained#!o',
+    '$#son$)t-honours&(managers&%owned*!r&(ventures%+ly-authored#!o#*st-hangers""ka#\'e-books"#las#)iot-curie##les$%iness',
+    '#$ypha"#meo"$nahs#+es-designed&&gotman%*/associate&%chief&&deputy\'\'irector(&strict&%honda#"ge#"ke#!n$#ers',
+    '""op#"st""pe$!k#%lings#!p"&rdache%\'n-volpe&%aires&$ella&)ian-iraqi),/palestinian$!e#"es"%schka',
+    '$%nhans$(ph-marie\'(robinson&"at&#ina(#ism$#tte##lyn#$phat##ser%!y$#lyn"\'tunheim"2urnal-constitution\'$ist.',
+    '&#ys.\'%women#%sters#$vert%!t"#vel#\'inianus$!s"%wters"#xer"$ycie#!e##pad#%spike$&tretch',
+    '"\'mmillar"!n!"sc"!l"!m!#tag"!m#!p"!o!,u&aacute;rez"&52/3ms"#87r"\'daisers#%elson$!n',
+    '##ice%*ialization#$kins"%elich"\'g-eared#.endhilfegesetz#%glery#%ulars"\'hantalo"!i##ce.$%iness#"ve"%jitsu##ube',
+    '"\'lenisse$"ps##iae%!s$"er#%liard$%undur#$srud#!u#+y&mdash;see%(ndash;28$"-7%!8%(december%\'october',
+    '"!m#!a$!a#\'bled-up&&speech$\'o-sized#%ieges##pin&#ess$#man&$ster"*n&iacute;n##ack#(ceiforme$#ker',
+    '#*e&ndash;31$#-17%"22&!5%"31%!6%!7%!9%&august%(december#(gle-like\'$wise$#won#&ichiro$)or-school',
+    '$$pery#\'k-grade$$anoo$$heap"!p"$raga$!l$#sek%.sic/cretaceous#)idiciales$)sdiction.%,prudentially#&rassic#"ue#$yman',
+    '"&squ\'au#+t-a-handful%)completed%+perceptible$-_,_just_about%!a&!s$!a$$esen$%ices.&\'iarship%!e%$tiae$"um"%varra',
+    '%#tin%"us"-xtaglomerular!!w"!g!!x ,k&aacute;0tz)$roly-!i#)macr;rtik$#p;m#&uml;se"+ouml;ckerik\'$hler\'(lnisches',
+    '+&berger\'$rmen(#ner\'&stritz"%prime"(uuml;lpe!#(d)""s)!#*w2#!3!"+1!"-c"!d"*registered!".1',
+    '#"12#"73$!5#(83/173db##a-d"(201/186a"#300#\'58/186c"#415#"25#"49#"66$!7#"88"#503',
+    '#"50"!9"&clarke""e."#g.b""l.""m."(o.y.l.i."(thompson""w.!%21rev""54""98!#332""57',
+    '"&81/123!#401$!1""42#%8/375""97!#501""21""94!#608""22#!5!"84!#965!&a-thud',
+    '"#ama##rle$"na"\'bardian##eer##iye#%oodle"(dannikov##iri#$meia##oyi#"ri#&ungure#&zamira"&farova',
+    '#!r"(gamiwari#"ge##iso#$uitt"$hiye#&louche#*ramanmaras",i-n-tiku-aba##bab#$juka#$lash$\'ua-kona$#zie##mon',
+    '#&nardji$"ic#1ser-josephstrasse\'\'wilhelm&%pfalz$#hek#"xi"(jagoogoo#!o#"sa"%kania#"er#%ouris##uei"%l-007',
+    '#\'aikunda$$maki%"os$\'ntzakos##cev#!d$#air#*eidoscoped$#mba%"li$$njin$#opa#)goorkatta#"id%"as',
+    '$*nga-apayao%#sky$$sher#"ka%%doons%#nis#&l-kwik##moy$$ring$#uck\'!s#\'oghlian#&pin-tu##ung$"ts',
+    '"$mbas%"we$#eri$"os%$vski##eni%$tsev#&ichika$(eniolomy#%lanie$$oops#*mergericht&\'musicus#%ougue$"ze',
+    '"(na-kanji$#ird$!l$%naios#$bans##dil$#ora#"ec$"da$!o$!s$"te##fer#*garoo-type%!s',
+    '$#won#"is#)kaanniemi#$nada%%piran$&enberg$"st#"on#(sallinen$!k%!a$!u#%taoui$#han$!o',
+    '##war"%pelle##lin#\'nikarea#!u"*r&amacr;ti#&abayev$/chai-cherkessia*(ircassia$"gi$$kaci%$ozov$#nja$#sek%"os',
+    '$&zoglou##dar%!s$$mend#"fi#%iithi$!k#*karashvili$#eek#\'loffian%"va\'!c$!s%#tad#!o',
+    '$$eles$$nale#&rimats#$shan#)tasasmita$$uzov&!y#"yn",s&aacute;ren#"ba#$hrut#$imir#!l#"pi$$szyk',
+    '&!s#-seb&ouml;hmer%*na-nankana##tle$"us#&yanova"%talyn$#oka#$cher#(esbridge#&harina&"yn#"in$#sha$"za',
+    '$"ia%&uongua##ola$"na#%riane%"en#&sunobu#!t#%utura"&uffold$$haus#"ko#"ls##ona#$shal',
+    '#+talashvilli"&wmoora"$yane#&e/0500$#nta$"we#%ijama"%zachi$&hkstan$+kh-brokered&%astan$&ndjian#"em#&imierz$!s',
+    '##rik#%uhiro$"mi!"bl"$q/kg"!r!$c-10#\'derived$&orking""11""60"%al/kg%\'mol/rad"!s!&d4,000',
+    '"!h""np!&e-wick"$2400""al#-ne/manchester$&n-outh#+rney/milton#"se#%tsian"#bbi#!e$"ll#\'nekaise##ret',
+    '%"ik#+fe/prisoner%!r#&lboats$#son$#ung#)n-sighted$%eland$!s#"oo#$p\'em$$-off$)_in_touch$!d$!e',
+    '$$nets#"st##vil"(fallinia"$ggin"%iichi#$lani$#ler$!y#!o#$zner"$kedo$$wich#%konen#"sz',
+    '#*im-covered#$legi$&ingley$*ogg-briand##tec$"on$!s#$ulau#\'vindale"+mp/chairman%\'timbmet$#ers$#ner#%sleys"#nas',
+    '##edi$#man#$ford#"ji%"ro#$muir#)nedyesque%%lling\'!y&#man%#ths$\'ilworth#(sey-nash#$tian%%gerns',
+    '$$wood#$wick#!y"$ough"$pner#$wick"(r-seymer#\'ameikos$!n$&totomy#)b-crawled$#ala##coz#&esztes#!f',
+    '$$opes$#yra#"ll#\'manshah#&noghan$$sary#$ogen$$sine##pen##rec$"od#%shner$"il##tes#&ukanan',
+    '"#sri##ton##zeg$&thelyi"%talar#$hang#)oacidotic$Mne-etone-methyl-tri-di-meta-post-oxy-chlorane$&profen$#sis#&terick$&ledrum&&holder&#pan#%umile',
+    '""ui##ris"\'venmour#$ille"(y-by-key$\'cutting$#fob$"in$&recall$)sequenced%)ignatures%&trokes#&/scale#\'boarder#%chain',
+    '#&lights#$mers#"ne%"s.$%oting#%press$&uncher#$time$$ones#$ways$#ell!"f8""ir!%g/day#$s/ha',
+    '""26""62"!8"#ase"!l"!m!"h2"-achornprasart#!d$"er#$imah#&juraho#(ki-drill#(lilollah$"ky',
+    '#"mi%!s&#iya$#oun#$nlar#\'rdzhiev$#ine$"on#%tatba$"ib$&ti-gna#!u##wak#%yeyev##zin',
+    '#%mlata#"ra#%ydius"\'ikhikhi"$mail"\'odzhent#$meni#"sa#"to#%uriah#&vansky"(rennikov",udayberdiyev#*tzeymateen!%iambu',
+    '#$bett$!o#!e##ler#%worth"(ck-ahead%%backs%\'the-can$&ed-off$\'ing-off$$offs"$dane#\'diwinks$"os#\'nappin\'',
+    '#%stuff#"ul"$edis#$ffer#"hl#(lderhead$"ly$!s##man#$nzle#!p#$rans$*kegaardian#$sler$%sling',
+    '"#fak#&f/live#$isia"%ggell#$htly"#iza"$khil#$ongo"&lchoan#$dans$$ingy$$ress#!e#"im#&kerran',
+    '#\'l-fever$%arow.$&daltan*!e$#ead&#row%%r-car%"th$%inger$(ogrammes$\'ruddery$"w.$$ylea#(nachtane%&ughton',
+    '*%thick$\'parsecs$&stream#$pont#&ravock#\'tarlity"#mba%"ra$%erlin(#tic$,le/protestor$#rey$$undu#%onian#$pton',
+    '#%abalu$(esthesia#%brace#$cora##del%"r-&$sely#*ematograph$$sics#&g-like%%maker$*/suspended%&thames$+fisher-blue$/ham/oxfordshire',
+    '$#ibe$&makers%#oor$&scourt%"ey%*ford-smith%%holme%$lake\'%ngley%&worthy#$iver#&k-free$%ajous$#ier#+lochrannoch',
+    '#%mount#!n$$eary%!r$&iburgh%"el$(ockabout\'#ism#&oforms#$sala$#ela$"ky#(yarwanda##zie"$ppen',
+    '#%chwey#+ghiz-kazakh#\'ichenko$!l$%shima#(k-greene$)/managing$$aldy%#pol$+bie-kendall%%right%#urn%-y-in-ashfield$%cowan$(efjorden',
+    '%%ndall&"es$$fell$#men$$ness$&oswald##man##non##ruc#%shaws#%tipur$$ling#$undi"%sangi#%eleff',
+    '$%tainy#%iliov#$s-in#!t#%zczak"%t-cat#%amura$#zin#(chen-day($like\'$alia%&ingham#&e-like%&making$&fliers',
+    '##gum#)son/flood#*ten-heeled$&lemann#\'umbeine"$vell"\'wifruit!*jaersgaard"(ell-olof""us!&laasen#"ma#%ngers#!o#)us-meciar',
+    '"!c"&eanthi#"bb#&inburg%\'deutsch%!s&$mith#"mm#(ombrotos#$rman"#ias#%breck#(nghoffer$&khamer%%owitz',
+    '$#sky$!t#$ppan#%tzing"#oak#"no#%pping$#sch#"tz%"er#$utse#%vstad"\'uckhohn#"tz!&m-long',
+    '"!d""sq!)nackwurst##ggs#%pdale$"p.#%rlton#!u$"ss#(ve-proof",e&zcaron;ina#)e-bagging%%joint%%level%%socks',
+    '$$bend$"s.$#ton#$ller#$ussl#$vitt"!i##bbs##cks##dus#)fe-blades&(carriers&%edges&$work$$ings',
+    '&"s.#$lton#&phofia#&t-club$$teds""mi"\'obblier$%stick$$twat#(ck-downs&%knees&#off%#ans%$drin%\'ing-off',
+    '%)namuckley$\'learach##del#!h##rth#&ssians#)t-to-knot$"to$$weed#$w\'st$(-it-alls$2ledge-constitutive*"of*2without-experience&"ge',
+    '%(-unknown$*s-how-many$"th#$xian""pp""rg"*ucklebones"\'ytlinga!*o&ccaron;a"#bia#"uk"&carnik#"el#\'h-weser#!i',
+    '##ock""en#$ther"$ffka"#gut"(hathites#)de-kilsch#(l-severa$%angaz%#pur$\'bergian#/nstamm-negative##out")i-related#"gi',
+    '"$kang#%eritz#%kavil$$onen#%oshin&"ka"#lar#(beinsson%!n%"rg#$ding#%jevic#&khozes\'!y#$lari',
+    '$(mbangara%&enskoe%"na$$phon$%wrats##vin"#m43#$bedy$%olcha#"ei#\'issarov$$tehs##mos$(unistiko,!n',
+    '#%otini#(somolets#\'uniecki&#sta"%nakom#)chalovsky#$ders%"se$#ile$#oma%,yannopoulous#"ev#$ghua$"or$!s',
+    '#$ings#&kowski#%nichi#$opka$$rski$\'valenko#)servative\'"en$)taninidis\'"ty#%tchou#(zerthaus"(ojimaans#%lkool##nen',
+    '#&rnstra"$peck##jes#\'rivnice##sch"#rad$"es$"ns#!b#"ce#$dell#&ean-us$#lev$!s#"ky',
+    '$$endi#%nberg$$haus#%oliov$"wi##pus##sah#!t")scielisko#$ecki#$hani##kas$\'enniemi$#ull$!y',
+    '#$sack#\'tajnica%$ndin%!s$!i"$tani#!c#"ov#%ronis##ter"&uangou$#ssi#"ba#%delka$(onazarov',
+    '%$ouri#+rabi&egrave"(vacevich$$lyov#"da##ess"#x15#*21-related")zakcioglu##hin#"in##lov!"pl""pm"!u',
+    '!*r&ouml;ner"!7"#850"$acow#&epelin#$fcik$%stein#"hn#$isak#!l##nja$,kengymnastik\'$haus#(snovodsk$&sowski',
+    '##tie#&uskopf#%vonia##wec"&bavsko"!c"#eek#(isleiter#"ll#%megne$,lin-directed$#men$"pe#(shchatik"1f&mdash;christian',
+    '#$kova#*ll-feeding#)ngle-like#"ps#&s-poos$!h%#nas$#pie$%tafor&!l%$elig%#ova#$zovy""og$#ius',
+    '##nen#%pacek##sch#"uk$#til",rrrrrrrrr-oo#!s"!s#"ko"!u#"gh#!k#"ps%$kaya#+seva&cacute',
+    '$#tev#$tick$(tschnitt#"uk"&yanghe#&mskaya##sia!"s1"#abi"(hatriyas""li"#r/1!"t1#!3#!4',
+    '!+u-klux-klan"%aybah""ba##lai"!c#&harski#&zynski")dryavtsev"%emann#\'nssberg#$pper"\'gelbaum"\'ibyshev""ka$$njac',
+    '"$malo$"ra&\'natunge%!s#$baya$\'bakoman$!h$$irai"%n-hui#"ar#)ceviciene##duz##ick$"wo#"os',
+    '%%messe%$tage#$tzel"$o-yu"%paruk#*eck&yacute#0ferstichkabinett##pel##tsi"/rdish-inhabited((speaking#+furstendamm#$land$"os#*t&eacute;n',
+    '#"up#$yluk#$zman"%schel##erk#%hooth#(snachter##uma#!y"(tchinsky##tuc#"xa"\'uskoski"*wait-saudi&(/british',
+    '$"ll"\'ybyshev"$zbas#"io!"va#(llposten$#vik"$etch$$nova"$inne!$w/hr"$14.7"%abena#"de#&jalein',
+    '#"ra#*zulu-natal"#etu"%ikmas"#ong!#x99""f7!#yat"+berd/thames#*ird/thames#$urgs"!e"#lon"%mpton""ne',
+    '##ock"!o#"ei#$ngju#$ruki"$rgyz##ios##kos"#tes#$hnos"%u-sik#%ranov"#vik (l&amp;qa&#swr',
+    '",eacute;giste)#man)/oville-lascases)&rinian#(grave;se"*frac12;ins")uuml;bars\'"st\')tzowplatz!3\'&eacute;nonciation"-actualisation#!i#&llegro##men#!n',
+    '$%nonce$-tiquit&eacute#$rche#\'ssiette#&talaya$(lantique#%udace"%chaim"!e#%cosse#%mploi#+nseignement&$mble#%space$%toire',
+    '#%veque#(xpansion"#gat"+h&ocirc;tel#&orloge"2imp&eacute;ratrice%+ressionisme&&oviste#*nconscient$*stauration#\'taliana"+oiseau-lyre#+p&egrave;ra#!r$$ange',
+    '$\'dinario#\'utrance$\'verture!#(b)""c)""l)!"-1"*citrulline"&driver"#itn"&league"$nmma"$plan"#sat"#u-v',
+    '"!2"!3"$a.b.$"c."$b.a."#c.c$"j."#e.a%".s"!j#&.bank.$#ex.""k.""n."&p.r.s.',
+    '"$time!,/209/25/2025"+309/25/3047#*20/25/3045\'&7/3065"$80th"#all"!c"#day"#mpg"!t!"00!#100"!3#)2,000,000',
+    '"!4"*50,000,000"$90/1!%2,200"&00,000""43"$5mph!#3.8"!0#(,000,000!#4.5"!0""50"!8!"53',
+    '""mm""th!&60,000"!m!#700#$3774#$5081&!4#$6164"#572!#950#!2""75#!6""81',
+    '#!5""x2!$a\'eq"#-hu""22"%amers"%b-our$&tested#$atts#\'ellings#$flow#\'issiere#,or-intensive%*atory-made*!s',
+    '%#ing%!s$&uchere%)r-capital(+onservative\'(inclined)+tensiveness\'%likud\'&minded\'$time&(/liberal\'!s&#ite#(radoodle\'(r-quebec',
+    '("es%%ndeus#+s-developed$\'/novell$&tation#,vision&trade"%ccase$%olith#&e-leaf$&makers$(rt&aelig#"h.$%ennes$$mann%"on',
+    '$(rymosity#$kin\'#$ombe$$nian&$cism##tam%,se-deficient$&iflora$"o-%\'bacilli%#nes$.ulose/rhamnose#"ws"\'danifer#(derbacks',
+    '$$rman%!s#"ie%(s/junior$!n%"os$$slau$%zesky#\'le-full#"on#"s.$&andads#%y/old$$kirk$$land',
+    '"!e#!l#!m#$rdal#-titia-matilda""fc#"er%#rte$!u##fan$"ed%.rty/eastington))pamington))reporting**oss-on-wye',
+    ')+whitminster#"on%!s$%rtune%"za#!s""g.#*er-brewing#"oa$%morph$\'on-blue$#sta#$unas%!e#\'willine',
+    '##iya""ic##gle#%kipia##nya#(rd-built#%samis$#ter"(katosian#&e-beds%$head$&rville$!y#&hdaria##ing',
+    '#$wena"%lanne#%ibela#$ljee#%quila#)thanhawla#&umiere"%magan$!i%"sm$$stre#&b-like$$erto\'!s$$ings',
+    '$(orghinis%-urn/berkshire$#son$$tons##ech$$duck$)llipodium$"st$!y$!z#&inator%(g/foster#"ma$\'ergeyer$"le',
+    '#%orbey$#uri#\'p-shade*!s&$tand$#art$%edusa%"rt$!l$%roite$#ton#$rani##uts"&n-elec#-cashire-based',
+    '$\'e-armed&$like%!y$"hi$$ucki#\'d-agent%$base%)clearance&&ruiser%%drain%%girls%$lock%&masses&$ines%)ownership',
+    '%&scarce&$peed%$user%%value$!/$%banks%$uyer$%esman%"ta$$gate%#irl$\'ing-net(&stages*#rip$"lo',
+    '$$olfo&#phe$%sat-3%$bury%%cape.(#ist%#ide%$kips%%styre*!t%&urfing$$ulph$)wehrkanal%&orkers#"er',
+    '$(don-down$%elaan%%marck%&nhagen&$thal$%field$&hammer%%irano$#lay$-muir-blodgett$%nauer$"os%"ur\'#ous$$rake',
+    '%*man/victim%"on$&thorne%#ree$.uage-behaviour)\'centred)+independent)+maintenance)$wise(!/$%widge%$orth#%iakea$+ghan/victim$$stes',
+    '$%iness$"ly#%negan##ois#&sersee$%iquot$#ton#$tain$!e%#rne$"on#"us#\'zenberg&&dorfer")o-chinese',
+    '#$lith#%tians"(p-steels##ada$#ich$\'roscope*&ically#$dogs#$etus##ham#&paceum$!e%"ts$%onica("us',
+    '$#lie#"tc$$horn"%ramie#*dner-burke#!e#(ge-batch\'%illed\'$oned&,denomination&(featured&\'numbers&)patterned\'\'ractice&&sample',
+    '\'$hape\'%ignal\'&ystems&&vessel%\'feuille%)r-engined&(/smaller%.st-circulation(\'selling#!i$#fla$"nk$$sans#"k\'$%field',
+    '#$more$#uth#!n$$axes#%raman&"en$$igan#\'s-borje%$eric#%tigue##usa#$vae.$%icide#)yngoscopy%#xes',
+    '#"ch%!e#$enby$\'r-axles&%based&\'grooved&(operated(#tic&\'printed)"sm&(tracking%$comp%#flo%#ing%(printers',
+    '$\'ing-out$$less$#ner#!i$"ng#!k$/er-sch&uuml;ler%!y##lzo#$ocki#"ry#"s.$$ally$!i%$ters',
+    '%"os%!s$%wells#)t-but-one%%heard(!t&#ole%,in-first-out%\'quarter%%round$!/$"er$#man$"ra#$well',
+    '##apy$"sa#)ch-string%$less#,e&rehy;night$%-\'50s&#80s%$1991%$come%)edwardian&&vening%&fourth%&gothic%(maturing%%onset',
+    '%&period%%saxon&(ixteenth))h-century&%pring&$tage%(thirties$+/post-roman$#ly.$(r-acting&)flowering%#ite(!s%$nser#"fi',
+    '%$nham#(ifundium$*namericano%!e%#ism\'"ts$!o$%tude.\'(inarians#"ki##mos#\'ourelle#!s#"ta%"ny',
+    '$"en$(ice-like%#mer#%uheru"&uchlan##dan%$rios$(er-frost#&enburg$%rmann#+gerie-basse$*h-a-minute&"in%$ing.%"s.',
+    '(!.(#ton#"la#$mann##nay$*ch-to-edit&$bury$%derer("ss%&rettes&%omats&\'y-fresh($room(\'workers\'#men',
+    '#)reateship%)l-crowned%#tta$&ieston%"tz$"us#)schenberg#!t"&vallei$$rdin$%teras%&ories.##ell$%nture$#rie',
+    '%!s%#try$"ty#$igne$"ng$$shes#"ra##vys#$yrle"\'w-agent$)enforcers$%giver)!s$%maker#*/economics',
+    '$)wiltshire#$book#)er/victim#$lers%"ys#(n-tennis$$dale#"ro#$son-#(yer-free&"s."#xed#%field"\'y-clerk)!s',
+    '#&backed\'!s%!k##car#!d#*er-pudding#$folk#(ing-down\'#off##mon#!n$!g#$seca#)ton-henry&#ers',
+    '$$reto%$illo%%owicz$$tive##in\'#\'y-bones$$beds%$ones$%jacks!#bms!"c-#"my"$/tlc""pl#!s',
+    '""sh!\'d.raym.""ma#!t""ps""ts"!u#$/adi!7e&oacute;n-g&oacute;mez"&-havre"!5"&a-wide##bua#!c#,d&rehy;times',
+    '%(smelting%(weighted$%/acid%$zinc$)er-figure\'+information\'(managers(%ember\'-placed/second\'\'writers&%/glos&&boards$$free$)ing-notes\'!s',
+    '$$work#%f-bud(!s%\'covered%&eaters&$dges%&monkey$\'cutters$$worm##gas$$ues.#%hurst#+k-detection%$free%%prone',
+    '$$ance$.e/professional%!s$$iest%$ness#(n-limbed$(an-sidhe$!e$"ly#%ptime#&rmount$(nability%,ing-by-doing##se.$"ib',
+    '%\'ng-type$)t-charted\'(ontacted&)developed&(favoured&)promising&*successful&$used#$than%*er-aproned(&gloved(%lined(&padded(\'studded(+upholstered',
+    '\'$dale\'&jacket\'#man\'$wood)$rker&!s#*vers&ndash%$sden%!y",banonisation#%edeva$!l$\'nsztejn#"on"&c-subj',
+    '#%haion$#ing%$tski#%lezio#$omte$#urt#"t.$(er-style$#ors$)ure-rooms\'$/dem\'+rs/teachers)$hips"3dbury/herefordshire#%erman',
+    '%"ma$#zma#$ges.#,ingham-smith##ley##son#$yard")e-enfield$\'trained$&wright##ann$!s#$ched%#ian%$like',
+    '$#ham$&s-york#"ky#"la$!o#!n$#ane##per#)s/assault#"ts#(uwenhoek#\'wenhoek"%fbvre#%ebure#%kandi',
+    '$\'-armers%&behind%)dominated%(handedly%&labour%*republican/#ism/!s%"to$&.right$,/alternative$%armer$$back$%sided$&winger',
+    '*!s$)propelled#4al-constitutionalism%//constitutional%$ists%(ly-aided($held$"rd$&tarius%!i%%o.ini$#vit#%cuffs#"em$\'ndarily',
+    '##gat$(e-bourke%\'/farmer$"io#-iti&rehy;mate&%mator+!y#$nano#%omena$!s#%renzi#$well""hr$!l#%tinen',
+    '#(benstein$%ovitz%$witz#1cestershire-based#&ermann#*gh-mallory&%smith#"ja##nin&#gen##ppe##sha$#ler$!t%"en',
+    '\')/holidays()resources\'#dly\'$rama##tao$\'h-based%"ia""ka#(hnitskii##ota#%szton"$lean"&maitre#"go#.minka&iuml;nen',
+    '#"na#$oine$+n-flavoured%!.%$head"$nart&!h$!s#%doiro#$eman#$gelo$)nick-hall$-th-and-a-half\'\'of-beak*(feathers',
+    '\'%width&\'=360/np&%ened.)"rs&$iest\'$ness&&ofbeak#&inabad%"sk\'!y#%koran#"na%!n$#ons#!o',
+    '#*s-grinding%&shaped$%field#"te$&icular$#ons#\'us-mars#$wade"&ofnoth#$line&!o#"ma#&nardos$$cico$$eans',
+    '$%hardt$$idov$#son$$tjev#)pard-like(%skins\'%cover\'$ette$(oldstadt##rin#%thaid"$pcis#!e#$idus#$oris',
+    '#)todontium%)meningeal"$rche#(freiheit#$oghi$)i-gourhan#$rick##sky"%sabre#)bian-only\'$/gay$!o#$iure#"li##noy',
+    '#%parre#*s-affluent%%cited&(ontrived%(damaging&%irect%)expensive%(involved%\'popular&)rivileged%)strenuous$#ore##ton$%range%(ygonians',
+    '#%ching#+ensk&aacute$#rne#&hality&!s%%rgica\'"us$.bridge-stewart$&erhead#$izia#&ojanni#$ter-\'+collections\'%knife\'%racks',
+    '&\'/number&$bomb&%frack&$more&%sws18$\'ing-off%"sh$$onie$%rists$\'s/widow#$zkus"%ubner#%caena%)nthemella$%ippus',
+    '#*kaemogenic$\'oplakia#"rs#8theusser-schnarrenberger#$ween"+v&eacute;es#$acic$$tors#!e$%lness$%ndale&!e%#ish%#ton$%ridge',
+    '$)son-gower$!t##ina%!g%!s%$thal$%ttown#&kovich#$reau#"ys"%warne#"ed##ins$\'s-bruno&\'ruddock',
+    '%)/landlord&&oxford&#vet%$achs#%orthy#\'thwaite".xically-driven%-o-grammatical$"es$%grams")y-hunting#%burne#"la%\'nd-daff\'(/bedford',
+    '#"va"#zak$"rd$1y-marn&eacute;sia!#fds!#gdf""mb!\'heureux""rh"#uys!,i&egrave;vre#)scaron;ka"#-lo"&adriel#$quat',
+    '"#bai#$bert$#ing#%crypt#(el-prone%#ous$.ral-controlled()reformist\')/alliance((national(&social\'(isations)"m\'&&tingly(#on.',
+    '&-an-registered%*t&eacute;s&"ey%"um##ian$\'dinally##off#3rarians/information&%y/ian()resources""c2##ata#,ence-holders%#tia$!o',
+    '&(ologists\'"us$"ts%!y#"ia"#dae#&diment#$iard$"ce##ney##ove#,smannaflokkr#"ya"(ebenberg&$fels',
+    '%!s$#ich$$rand$"st#%dholm$#tke#%fmans##ing#&sching$!t#*ut-colonel%.enant-generals,+overnorship")fe-change\'%oices',
+    '*!s%%giver%\'partner&(ositions&(reserver\'\'inciple\'\'ocesses%\'related&#oom%,satisfaction&\'ciences&\'entence&&haping&&ystems$!.',
+    '$\'/dinner$&chance$&skills%6pan&mdash;shutdown.com(,-manual-pack)"pi(%cache(\'process%&tylers$&worlds#\'fe/ltom#*t-equipped%#out%,right-leg(x)%&shafts',
+    '$%pumps$&system""ga$)nd-ligand\'(to-metal$$ting#)gafjellet#.ht&rehy;weight%*-activated\'\'ircraft\'$lloy\'%s-air&\'bearing\'$lues\'$oxes',
+    '&$days&&framed&\'induced&%meter&*reflective&)to-medium%#_of%+heavyweight&+ouse-keeper%*ly-grained(&loaded(%taxed%(ning-rod%%shade\'#ips',
+    '&$tick%$wood#+ier-renault$"ts##ula%!e$"re$%strum"%hsane"\'jbregts"$ke-a$\'/please$&liness#$hoda##oma',
+    '$%ngeni#$eath#%icana#"ja$$eros#-ley/berkshire$%icrap%"ng#%ypond"0m&atilde;o-cravo#!.#&berger$\'osperma#&e\'ouse$*-flavoured',
+    '$$king$$tree#%icola$*t&eacute;e%(-pricing%\'ed-plan&!s%(lessness%"s.#\'matquai#)nanthemum$"er$\'odromus%$logy#"on',
+    '$$sine#%pidly$!y"$nate#$burn#$dale%"rs%#uer$$holm$"ka$"oy$!s%#ays%%trome$"up',
+    '%\'element&%nding+!s%\'kicking%\'marking%(printers$%ament%#ris(%ation$\'backers(!s$"co$#ham$)n-covered\'\'upboard',
+    '$\'scanner$!t#$gala$/uistic/cultural%%lella#"ie$#gan$"um#(k-stakes$\'.status$\'/ms-dos%$s700$$ings$"on$$work',
+    '#$nell%!y$#ine#$skog%!y#$tern$%haugh$*on-on-ouse%(rn-orman$&rathen$$seed#"um#(yphiidae#$zell"&obians',
+    '%(coloured%\'hunting%$like%&tamers$%tamer#!y"*p-patterns$%reads$%salve$&to-lip#%aemic##ica$\'d-laden$#etz#%ogram',
+    '##per&!s#&sticky$!y#Atovsk&yacute;-mikul&aacute&scaron##uma"%quers$)id-filled\'(nitrogen\'%phase&!.&(ationism&%isers%$fies$!n',
+    '&$save%"ur"&ripipe"&sansky##bet#$heen#$iard#!k#+on-tolosana#&senden$%ovsky#"t\'$%ener.(\'/reader&$ings',
+    '"*t&ndash;de#&eracy.&/ry-journalistic&/te/non-literate\'(ure/feed##hgo$&ospere%\'triptor#(igation.#&nanski#\'omerice$%verti%"sk#0re/3&frac12;pint%"s/',
+    '\'"ha\'!t#/t&eacute;rateur$&-world$*er-busters$*le-altered((nd-large\'\'changed\'(educated\'\'noticed\'\'visited&%brook&%field&%johns&$moor',
+    '$&ondale%%ralis&"ea\'#lla#"va#"zi")uxuesheng"%varot$$tino#)e-bearing$&aboard$%birth)!s$$food$%hpewl',
+    '%#bus%!p&*ool-dublin*(sounding+)underland)+/birkenhead$"st#!i$+ng-quarters&$ness#(liehoods#%onian"&zabeth$"no!$jadi',
+    '$$omir##pco"!v"!w!$l.b.#!m"$0323"$acen#%nbers%&radach$\'dderfel\'"wi%"ow%&radach&!e',
+    '%$undo%&yfriog$%egryn%$lian&$li22)!7$$faes%\'ihangel,*-y-pennant%&yrnach$#gwm%%ynidr$!i$#rug$\'wenarth',
+    '%\'stumdwy""c1"#edr#$gada#"va""iw"\'obregat#%rente$#ona#$yd\'s%(-bostock&&davies&%evans&(langston&%smith',
+    '""ya!$m324""44"!g"!o"!r"#xbs!*ner-design"!j"!s!\'oadened%!s$#in\'&$g-up#%f-tin',
+    '#&n-loss%%words$\'/credit%\'deposit$%words#!s#\'thesome%!s&%omest"1b-lie-by-the-fire#$amba##ban$\'ersdown%!s#%efins',
+    '$&negula%%stein##ola##ula&#tum%!e")cal-based\'#orn&\'council&(exchange&%scale%(isations&%ties.&#zes%(ly-hired',
+    '($used$$scio$%table#&haline%!r$$baum$&indaal("le$#rie$$shot#$k&gt$&-jawed%*out/strike%&picker%#set',
+    '$$down$&e-king%%d-off(!n%#ian%!s$,hart-mummery$"in$\'keepers$%leigh$&makers&!n$!o$\'picking$%sides',
+    '$(spotting#!s##ton#%usts."*dge-keeper%$more#&igiani""en#(wenstein$!i"#fft#$land$-ei&dstrok;3ir"(g-effect$&linear',
+    '#$agun$)rithmical#%etorp#%gioni#+ic-oriented%-al-sequential\',/pre-logical%/o-philosophicus##oed$$type#$sdon"#ing#)r-et-cher#(seleuria&"le',
+    '$$erer"#ker#$onga##roi#(ubandara"&leatta#\'ita-ish&!s##lie"\'manidze#%barda\'#ini$!e%"rg#!o',
+    '"#nde$*o&ntilde;o%+n&ndash;los-5mombasa&ndash;nairobi&)-brussels\'%delhi\')edinburgh\'$made)(nchester\'%paris\'*registered\'&sydney&&/essex\'#new\'(regional',
+    '$%sdale#)elinesses#.g&rehy;awaited*$term$\'-absent&&dmired%&coated%\'debated\'(molished\'&serted&&istant%(familiar&%ibred%&headed(#led',
+    '&#ops\'#rns%)inhabited\')terrupted%\'keeping&$nown%#leg%&nailed%#off%&player&(ractised\'\'edicted(&served%%short&%ilent',
+    '\'&riding(#oke&*ufferingly%\'tongued&%ravel%\'waisted(!t\'#ves$&bowman%%urton$/cot/oxfordshire$(distance$)er-acting&"on(!s',
+    '%#val$1hurst/association$&icauda)"us%#ng.&#oda%&stylis%-tude-confined(%inals$$line(!s$%mires$&newton&1y/gloucestershire$&obards',
+    '%$purs%#top%(uffering#!i$#gan$!k$\'thermie#!o#%quich#(sdaleite(!s"$o-la#)d-wee-gia##k\'t$\'-a-like',
+    '%%based%#ups$(ed-after\'#for$!i$$out.$#see#(mweights#&ny-bin#\'p-based$%iness#(se-based&&footed&\'hanging&&living',
+    '&%tight%\'ly-knit(*structured%#ner$$nin\'#!y"*p&eacute;z$*rehy;sided#(-sidedly##ata#$hura#)sidedness",quaciousness$!i"(rberbaum',
+    '$(/theatre$%inges$%lings$\'ship(s)#%edano$"nc%"te#"ia%"rt$"es$"ot#"pa"#san#*co-bradley#&inskii',
+    '#*t-in-cloud()the-crowd%\'luggage"&t/make#!a#)hian-wide$!o#"ts$"um##us."%ubens$"on#"ca$!h#\'dmouths',
+    '$!y#%ghbeg%%gilly%(shannagh\'#ore#*is-leopold&)phillippe&&quinze%%bourg%*iana-based#)lou&mdash#"nd$$slow##rie$%marin',
+    '$(ing-time#(tishness#\'verture#&waizeh"%vably#&e-duet%%games%*in-a-mists%%lives%$poem)!s%%songs&$plit$%blobs$%d-one',
+    '$+ll/fitzhugh\'+oxfordshire\'\'project$"ni$$rage$$show%!t$"ys##yng"$w-al%%ngled$%built$\'calcium%%harge&&lorine',
+    '%&rowned$*emissivity$(fidelity$(humidity$,intelligence$(latitude%&oaders$)magnitude%&ileage$\'nitrate$*performing%(olluting%\'restige&)obability$%rated',
+    '$&season%)tringency$&ticket&"me%(o-medium$&walled%%inged$%yield#&/mixed#%cross#"de#2e&ndash;vansittart$(n/thames%$brau$\'r-caste',
+    '&)intensity&#mid&&placed)"te&\'quality&\'skilled\'&ulphur&+temperature&$wage%!/%$ings%#son$(st-lying\'&ranked#$gate',
+    '#$wood"$xham#&odonta"$yala"%zells!"p."!1"!4"!7"!8"!l"+o/tennstedt"!p"%s/pls!!q',
+    '!&r33000%"50""sc""ts!(s-series"$0002""15"-live&mdash;qa&#.qa"-pan.lstrain.p&)qa.lslive"(strt.com!)t-colonel#$gaas"!5',
+    '")d-sourced"!f""is"!k"!m""p1#!2#!3""s.!%u-fan"!0"%angwa")bachivsky#$bard$#eek',
+    '#%inska##osh$%vitch##uva")cas/pilot$"ya##ens%!t#$ians$&dities%"um#$kett$%hardt$#ton$$wald',
+    '#$rezi#$tian"&dbrook#!e$$rmir##ism#\'lington$+ow/hereford#*v&iacute;k##wic%*g-stiftung&&shafen"#far"$gela#%gable',
+    '#$hole#\'wardine"%hring",i-m&ecirc;me#"si"+k&agrave;cs#"al#\'ewarmly#%owiak".mberjack-style$!i$%ricus##ino%!y##mox',
+    '#-sden/scotland")nacharsky%#ies$&r-like&$wide%"ci%"ia#(ch-hours%\'/dinner%%boxes##die$!s#"es#\'g-power$&buster',
+    '#"ns#$ulae""oi"!p#$dine"(rchingly#(gantarry$!i$!y#"ky#$vely")s/hectare#\'hchikov$"ev$&ington',
+    '#"on#!s#(terfjord$%iness$#res%%ously"&tchman#+e-composers$"al$%nists$!y#(herische##ley#%reola#&terell',
+    '$!s#-yens-designed#\'zelfluh"$ving#"ly#-sanbaldangiyn"!w#$anga##ero"*xembourger$#uil\'*-les-bains#*uriousness%(y-loving"%zardi',
+    '!#vfs"!i#"ii""rd"!s!%xviii"#xiv#!v$"ii!$yase#%tonga"!c#!.#)anthropic#)opersicon',
+    '#/ropolysacrulite#%urgus"$dall#$bury#$dite""fe##ord""in$"g\'"&kewake"&menner#+phangiogram%*ocytopenia&%edema&,plasmacytoid',
+    '&\'sarcoma$"ne"&ndford##ott##yrd"%piatt"$rata#\'e-birds#*ic-writing#$urus"#s17##295#"40#"85#&ochine',
+    '#"on#$tyll"$uben$"ov#"di$$mila"$vyng!%z.127 )m&amp;eta#)uml;nnern"-dollar;20,000"+eacute;dias)%tayer#.circ;le&eacute#\'uml;sto',
+    '")oslash;ns)!r#(uml;rike"\'rgr;ere"+uacute;gika)$jica#1uml;ller-claudius+#ian,!n\'\'nchberg*#ner!$\'ars"\'cormick""en"$kata',
+    '"#man"$self!$(40)!&*a*s*h!#-36"!8#!0"$city#!l"#m-m%$ummy##ade#!e"(nineteen"\'present',
+    '""to!".1#!."$b.a."$c.a."$d.l."$e.r."$h.s.""k."$litt""n."$p.d.$"g.$"k."$t.a.',
+    '"%yonge!(/a/r/r/s"!c"!f"!m"#r/i"!z!*1-specific#,vac-infected"1/northamptonshire""01""34#$mp19""6s!$2000',
+    '"%8f101!#300##96g"!6!"41"!6"!c!$5/02#(114.15.2"!1"!2"!4!%6-420""06"!1',
+    '!)7&pound;5"!1""b5!"80"!5""76!"93"!5"!6"!8!":n!"=1""mm!&a\'ariv#(moiselle',
+    '"!-"#/bd"#ada#$leht$"ox#%rssen#&seudun$#gau$#ter#$thai"&bbeley#%inogi#"le%%cross$!y',
+    '$%t9000%&o-unix$*under-unix##750#$abeo$#naz%$drew%#ese$$rena%\'i/stoke#$bain#!c$&aferri%!h%$nico',
+    '&&thyism%!s%%ughey$(hallenge%%eroni%"ia&$cken$%lancy$+onnal-mason%(rquodale#&dermot$+onald-bravo*$hall)+/gloucester*(scotland',
+    '%&ugalls$%uffie%!i#(edonicus$$eter$%hiter$!k$%rator#(farlanes\'-ene/radcliffe$#ish$\'lecknoe#&gibbon%(llivrays%$olla',
+    '$$rath&!w$$uire#)h-counter$$/ten$!3$#ain&"re%&vellio$#ell$,iavellianism%#lis%%nated&%e-age(&driven',
+    '(\'gunners$(o&ncaron$(rihanish#(i&agrave$"an$$bini$"el$\'lwraith$+ntosh-based*%style#%kavey$&echnie%%ndree%$rell&$ness',
+    '%$sons$&iewicz%%ntyre$#low\'&-smith\'!e$$reth#*laren-ross(+/cheltenham)&newton)\'swindon))wroughton%!y#%nally&"ty',
+    '%$ught$"ee%"il\'#age$$iven$"ow#%oumba%!n#$phie$#uke#\'quairie&$ries%!e#(racantha%$ntha',
+    '$,o-economists,!y&)molecular&&policy\'(rocesses&)structure%(adenomas%\'biotics%\'cytosis%(elements%)hierarchy%$mind%,sociological#"ua$"ra',
+    '"&d-eyed$&houses#%/mxil#-agascariensis$"ki$#mes#$dens#-e-for-the-job$$ira.$$n-is##hat$&yamaka#&ingley$$sons##lsq',
+    '#$rasa$&igales#\'umabisa$"ro#%women"&eldoid$&ienydd#"nz#$otic#!r#!v$"ia"!f#%f-doe$"ei',
+    '"+gadi-natron$(liesberg$$sins$"ya$*zine-cover)$type(!/)$nike("s.#&dallen$$elen(!a$!y#%entas#$gie.',
+    '$#ses#)heraberry\'%mason$$rabi##ian&!s$+c-saturated$&lligan$#rus$%sters&$rala($ture##nac%"ga%"ni',
+    '&"um$*esium-free%+to-electric\'&meters\'+sheath-like$/ificent-looking+.ly-illustrated%$grip$"ol%&x-type&"es$$uson$!y%&-cours#*rath/oxfam',
+    '##ugu$%iness$"ni#,yar-speaking"(h&eacute#\'abharat$$jana%$etsu$%mmama$!n$&rastra$$vira#!i$%-bahi$$mann',
+    '#%joubi##mod#*ogany-dark$&n/usaf$"rn#!y"$iben#$dana&"ek$&bridge#$gari$$rets#$jers##kop#%l-bag',
+    '$"ey$%lotin#\'n-coast%$road$%brace$-frame-centric*%level*%sized)!.)!r*!s$+ly-american$(s-kirton&(operated&(pressure',
+    '%-/rechargeable%#oft%#par%&treams&!y$(tainence)!r%/enance-oriented+$free%#own%#ree$"yu#%orium#$ries#"se',
+    '$\'onneuve$!t$"ug#\'tatsine$#hir$4land-magill-crichton%"is#"yu#&ze-fed%!y"%jedul$#rus$*st&eacute\'&$y&gt$"ur',
+    '$#lis#"no#(or-domos%$cans%$elle%$ites#"us"%kalle$\'pansgat#(e-a-date%+do-and-mend%\'weights$#ham$#ing$%overs',
+    '$&shifts#$gill##han$#tar##kin#$onde##sic#$weta"\'l-e-mir#\'_de_mer#*absorbtion$*djustments%(roitness$#gan&-sy/avantgarde',
+    '$$kand$#nge$*ria-immune\'!e\'!s&(ologists$#sia$&testa.$$viya$-yo-polynesian#&comson$#utt#)e-bonding%\'centred%\'sterile',
+    '$&candra$#fic$$mort$"s.%":1%$peak$!v%$itch%-olent-looking#)function.+"al#%gache#"hi#*iciousness$\'elegaoi',
+    '&"ne%#toa$!m$&ngreau%"ke%%ovsky$%phant$#zia#"ja##lah%#rme%"wi$"ei%%nders&!y',
+    '$%inder%"us$&ophaga%(ry-weiss%#tus$#usk$!y#&msbury%$mede#(o-lactic$%feyev#\'pensata$)ighiaceae$+resentation#&reward',
+    '#"te$%field$)husianism$$side#!u#)versation#"yn$"on$%verer#%zeard"(ma-to-be#%ertus##ina%"st$"ya',
+    '$*alian-like$\'iferous#$ouna#"ta#"uk"(n-animal$#day$&hunter(#ing$*in-society&(fluenced$\'killers$#mad&"rk%\'odified',
+    '&\'untains$-of-the-people%\'r-woman$\'servant%$hape$%track#!.#!/$\'machine%"en#\'adatory$"en$&gatany%,ement-labour,"ed',
+    '+$type+$wise*#.ps*\'/labour++supervisory&*r-employee(,of-the-month/$year\'"/2((employee(*proprietor\',s/archivists))directors$!h$$rola',
+    '#$bane#%celle$%heser\',ter-hadfield+*marylebone**/liverpool%%ineel%&urians$"ia%$ples$"ur#$dali%!n%$rin\'%&torily',
+    '%&villes$\'ibulate%"ra$%leson$"oa%%cello%$lone%!s$$ylor#%eater$!d#+fron&eacute#%ganic%.r-kunjer-kunja%!t',
+    '%!y$#ham$"in$\'kalarat$#lai$&osteen$"ue%\'nwijaya#-iacs/lunatics%!n$\'curists$#ema$&festo.$*pulatively$"to',
+    '#*kee/master$"iw#%liest%!o#%nakee$\'eristic&"ly%)smann-led$!i%%ngton%!s$"or#,oeuvres-idle$#lic$$rani',
+    '#,shiet-nasser$"in%#zed$%uetae%%riyah#&talini$#eau%%l-cox&"et&&piece.$"ic%$llas%"on$0le-wedge-derived&!y',
+    '%$onix#\'ual.exe&+/non-manual$%brium$"fa&0cturing-oriented$&schehr#&w&euml$+aring-white#\'y-acred&$rmed%%paned\'$rted%\'spotted&\'toreyed',
+    '&%o-one$$ness#$zatu$"ie$!o%"or"#o-b#"pe"&p-like$&reader&%lated$&to-see#!.#(/homonym$%lemma',
+    '#%maker#\'ped-out%"rs#&screen#!u#$work"$quio"*r&ndash;10+!7*!4*!9#*-see-lay-a#&/april#"ab%#out',
+    '$#ffi$%ngoni$"sh%#mus$&t-sade%"hi&(on-based%"ta$#ven$!z#(ble-like\'&stucco\'%tiled&"rs$"re',
+    '#,c&iacute;lio$!.$$elli&!s%%scent$$h-13&"20&"31&!6&$july("ne&\'october%"al&%untes%&ebanks',
+    '%%ionni%$main%$weil$$ilio&#lac%!o$#lay$%olino%#mbe$%usian#$dale&!l$\'ersteig%#uil#(e\'s-tail',
+    '$$chal$"da$#han$#mma$#ngi$!z#%faing$#ord#\'garette)#ing&$itas($escu$%esson%$tson$&harita',
+    '$$iani%$nale$$olin&#yes$$raff%"et$-u&eacute;rite#$i-el$.a-hilf-strasse%"ma$#bai$&e-ande&\'blanque&&claude&%jones',
+    ')#eph&\'michele%"ke%$mont%%nborg&&kirche$%huana$-juana-smoking$#lee%"ou%#yne$$nati%#ere&#scu%$iers',
+    '%"ka$"pa$$scus%!s$%tains%#iem%$tima$#van$!x#%janov%$youn#\'k-downs%&making%(to-space$"al',
+    '%+t-conscious\'$days\'%entry\'&garden\'%index*+ustrialised\'$like\'+orientation\'&quoted\'*researched*\'ponsive\'%share\'\'testing\'0value/book-value\'(watchers',
+    '&.ing-orientated0"ed*\'related&%maker$%field$$idou%"ll%%ngton$#kaa$%s&amp)(;spencer%%heets%%woman#$lais$-borough-based',
+    '$#iac%$erli%"na$2ow/buckinghamshire&%esque$%stone$"yn#&malada%#ris$"in$#ont%$real)"ly%%usets#"oc',
+    '$-t-b&egrave;ze&"de#+qu&eacute;s%\'ee-like&%ssate&"z\'%"in#%rable%"no\'!s$"en$*iage-gifts%)ed/living%#ots\'\'t/coach',
+    '#\'salforn%#nne$)den/lorry$1hall/archeologist(!i%#ell%$wife&#ood$#net#&tagons$"ec%#lla$"ic%0n\'s-in-the-field)(le-grand',
+    '&)/homeless\'*tewkesbury&#air&&iquais&$otti&/s-in-the-fields\'$burg\'#haw\'#yde$"us$\'yr-like&#ium##udi$%landa$#tis',
+    '$"ic#(x-engels$,ist-hegelian((oriented\'!e',
 )
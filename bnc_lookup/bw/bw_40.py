@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_40 = (
+count_40 = 6694
+
+heads_40 = (
     'epilithic',
-    'epilogues',
-    'epinal',
-    'epiphenomenal',
-    'episcleritis',
-    'episodes/day',
-    'epistemologic',
-    'epistolatory',
-    'epitaxy',
-    'epitedeumata',
-    'epithelial-cell',
-    'epithelial/mesenchymal',
-    'epithelialisation',
-    'epitheliotropic',
-    'epitomes',
-    'eplp',
     'epls',
-    'epns',
-    'epoch-2',
-    'epochmigration',
-    'eponge',
-    'eponymously-titled',
-    'epoxy-resin',
-    'eppell',
-    'eppy',
-    'eprdm',
-    'epsilon-toxin',
-    'epsomite',
-    'epsrc',
-    'epthymios',
-    'epton',
-    'equ',
     'equal-opportunity',
-    'equal-pay',
-    'equalizes',
-    'equatable',
-    'eques',
-    'equestre',
-    'equestrians',
-    'equi-energetic',
-    'equidistantly',
-    'equilibrial',
-    'equipotentiality',
-    'equisignificant',
-    'equitation',
-    'equivalant',
-    'equivalence/distinctiveness',
-    'equivalent/ml',
     'equivocally',
-    'equivocalness',
-    'er2',
-    'erace',
-    'erada',
-    'eradicable',
-    'eral',
-    'eraseable',
-    'erasrgcp',
-    'erchester',
-    'ercoles',
-    'ercoupe/aircoupe',
-    'ercps',
-    'erdem',
-    'erding',
-    'erdmute',
     'erdut',
-    'erective',
-    'erectness',
-    'eremitical',
-    'eremophila',
-    'eren',
-    'erendis',
-    'eretrian',
-    'erfoud',
-    'ergative',
-    'ergatoudis',
-    'ergo-pro',
-    'ergoline',
-    'ergometric',
-    'erindale',
-    'erinnyes',
     'erinsborough',
-    'eriophyes',
-    'eriswell',
-    'erkan',
-    'erlembald',
-    'erme',
-    'ermengard',
-    'ermyntrude',
-    'erni',
-    'ernshaw',
-    'erostarbe',
-    'eroticising',
-    'eroticize',
-    'errans',
-    'erraticism',
-    'errep',
     'errh',
-    'erria',
-    'error&mdash;filename',
-    'error&mdash;return&mdash;detail/',
-    'error-checking',
-    'errors-and-omissions',
-    'errwood',
-    'ersari',
-    'ersoy',
-    'erwina',
-    'erwitt',
-    'erxadieis',
-    'erythemis',
-    'erythraea',
-    'erythrocyte-rich',
-    'erythrocytosis',
     'erythroid',
-    'erythropoiesis',
-    'erythropterin',
-    'erythrotaenia',
-    'erythroxytes',
-    'erzberger',
-    'es/9000&ndash;820',
-    'es/ns',
-    'es/o',
-    'escal&oacute;n',
-    'escaladun',
-    'escale',
-    'escalids',
-    'escallop',
-    'escalona',
-    'escapements',
     'escapists',
-    'eschewal',
-    'escholzmatt',
-    'eschweilera',
-    'escocia',
-    'escondido',
-    'escort-class',
-    'esdaille',
-    'esfa',
-    'eshaq',
-    'eshelly',
-    'eskaton',
-    'eskernazi',
-    'eskers',
-    'eskisehir',
-    'esland',
     'esm&eacute;e',
-    'esmeraldas',
-    'esmondes',
-    'esophogram',
-    'esoterically',
-    'esotericism',
-    'esp-link',
-    'espa',
-    'espania',
-    'espei',
-    'espenshade',
-    'espero',
-    'espert',
-    'espinal',
-    'espiners',
-    'esping-andersen',
     'esplan',
-    'espoir',
-    'espoo',
-    'esrc-',
-    'esrc-financed',
-    'esrc-sponsored',
-    'esrc/hsfr',
-    'esrc/nerc',
-    'esrom',
-    'essence.',
-    'essentialists',
-    'essie',
-    'estabillo',
-    'establisher',
-    'establishmentarian',
-    'estabs',
     'estaites',
-    'estalian',
-    'estampes',
-    'estaque',
-    'estate-car-driver',
-    'estaugh',
-    'estefania',
-    'estel&iacute',
-    'estell',
-    'estenssoro',
-    'estephe',
-    'esterfied',
-    'esterification',
-    'esteris',
-    'esterley',
-    'esteve-coll',
     'esthiomene',
-    'estienne',
-    'estigarribia',
-    'estonian-russian',
-    'estorbos',
-    'ests.',
-    'estuar',
-    'estufa',
-    'estufas',
-    'estula',
-    'esus4',
-    'et-1-like',
-    'et-6',
-    'et.',
-    'et4000/w32',
-    'etats',
     'etceteras',
-    'etchege',
-    'ete',
-    'etelin',
-    'eternia',
-    'ethambutol',
-    'ethanl',
-    'ethanol/water',
-    'ethanol:acetic',
-    'ethelbert',
-    'ethelberta',
-    'ethelson',
-    'ethelwynn',
-    'etherial',
-    'etherow',
-    'ethical/green',
     'ethiopic',
-    'ethnic-russian',
-    'ethnic-turkish',
-    'ethnic/linguistic',
-    'ethno',
-    'ethno-cultural',
-    'ethnocide',
-    'ethnomethodologist',
-    'ethnomusicology',
-    'ethogram',
-    'ethoxyethane',
-    'ethylbenzene',
-    'ethylenediaminetetra',
-    'ethylenediaminetetra-acetic',
-    'ethyleneglycol-bis',
-    'etienne-louis',
     'etiquettes',
-    'etlprky',
-    'etnea',
-    'eton-cropped',
-    'etoposide/vp16',
-    'etrich',
-    'etsi',
-    'ettingshausen',
-    'etu',
-    'etu07',
-    'etymologists',
-    'eubanks',
-    'eubie',
-    'euboians',
-    'eucalypts',
-    'eucaryotic',
     'eucharist-centred',
-    'euclides',
-    'euclidian',
-    'eucryphias',
-    'eudocio',
-    'eudromias',
-    'euery',
-    'eug&egrave;nie',
-    'eugeni',
-    'eugenol',
-    'eugh',
-    'euless',
-    'eulogist',
-    'eulogize',
-    'eum',
-    'eumelanosomes',
     'eumolpus',
-    'eunoto',
-    'euparkeria',
-    'euphausia',
-    'euphoniously',
-    'euphotic',
-    'euphrates-tigris',
-    'euphrosyne',
-    'eupolemus',
-    'euram',
-    'eurico',
-    'euro-asia',
-    'euro-barometer',
-    'euro-bond',
-    'euro-bonds',
-    'euro-broadcasters',
     'euro-centric',
-    'euro-constituency',
-    'euro-deposits',
-    'euro-disco',
-    'euro-fanatics',
-    'euro-federalism',
-    'euro-federalists',
-    'euro-fever',
-    'euro-issues',
-    'euro-lunacies',
-    'euro-lunacy',
-    'euro-nationalism',
-    'euro-nationlism',
-    'euro-research',
-    'euro-scares',
-    'euro-speak',
     'euro-us',
-    'eurobudget',
-    'eurocash',
-    'eurocds',
-    'eurochemic',
-    'eurofest',
-    'eurofile',
-    'eurofoto',
-    'eurojet',
-    'eurolines',
-    'eurolist',
-    'euromessage',
-    'euromet',
-    'euronet',
-    'euroniche',
-    'europ&auml;ische',
     'europal',
-    'europas',
-    'europe-based',
-    'european-built',
-    'european-led',
-    'european-minded',
-    'eurosceptics',
-    'euroshuttle',
-    'euroteachers',
-    'eurotra',
-    'eurus',
-    'eurwen',
-    'euryl',
-    'eurymachos',
-    'euryn',
-    'eurypterid',
     'eusebe',
-    'eustasy',
-    'euston-glasgow',
-    'euston-northampton',
-    'euthuna',
-    'euwe',
-    'eux',
-    'ev-1',
-    'ev.',
-    'ev1',
-    'ev5',
-    'ev56',
-    'ev6',
-    'evacuues',
-    'evaluation.',
-    'evang.',
     'evangalista',
-    'evangelica',
-    'evangelical-state',
-    'evangelii',
-    'evangelos',
-    'evans/aeeu',
-    'evans/farmer',
-    'evans/oxford',
-    'even-featured',
-    'even-grained',
-    'even-toned',
-    'even_,_even_if',
-    'even_,_even_though',
-    'evenly-balanced',
-    'evenly-matched',
-    'eventless',
     'events/',
-    'eventuates',
-    'ever&rehy;popular',
-    'ever-active',
-    'ever-amiable',
-    'ever-attractive',
-    'ever-brightening',
-    'ever-broadening',
-    'ever-busy',
-    'ever-capable',
-    'ever-cautious',
-    'ever-continuing',
-    'ever-controversial',
-    'ever-courteous',
-    'ever-extending',
-    'ever-faithful',
     'ever-fertile',
-    'ever-finer',
-    'ever-flowing',
-    'ever-generous',
-    'ever-green',
-    'ever-handy',
-    'ever-helpful',
-    'ever-hopeful',
-    'ever-longer',
-    'ever-lovely',
-    'ever-loving',
-    'ever-nearer',
-    'ever-new',
-    'ever-resourceful',
-    'ever-sharpening',
-    'ever-sharper',
     'ever-steady',
-    'ever-strengthening',
-    'ever-tighter',
-    'ever-visible',
-    'ever-youthful',
-    'evergreen-layered',
-    'evergrey',
-    'everlastingness',
-    'evernden',
-    'everpeak',
-    'everpresent',
-    'eversham',
-    'eversion',
-    'every-thing',
-    'every-which-way',
-    'everyf*&dollar&pound;ingwhere',
     'everyo',
-    'everything-but-the-kitchen-sink',
-    'evidence/investigation',
-    'evil-natured',
-    'evil/of',
-    'evkaf',
-    'evolute',
-    'evolutional',
-    'evolutive',
-    'evp/pev',
-    'evremondes',
-    'evrenos',
-    'evry',
-    'evvah',
-    'evvy',
-    'evx-1',
     'ewanrigg',
-    'ewart-biggs',
-    'ewin',
-    'ewins',
-    'ews4800/110lt',
-    'ews4800/130lt',
-    'ews4800/215',
-    'ews4800/310',
-    'ews4800/350',
-    'ex-250',
-    'ex-ad/cycle',
-    'ex-addict',
-    'ex-admiral',
-    'ex-alcoholic',
-    'ex-alcoholics',
-    'ex-apple',
     'ex-apprentice',
-    'ex-art',
-    'ex-aston',
-    'ex-at&amp;t',
-    'ex-baa',
-    'ex-banker',
-    'ex-belgian',
-    'ex-bell',
-    'ex-blue',
-    'ex-boro',
-    'ex-bosses',
-    'ex-brides',
-    'ex-cadbury',
-    'ex-cathedra',
-    'ex-catholic',
-    'ex-cats',
     'ex-champ',
-    'ex-champions',
-    'ex-chorus',
-    'ex-christie',
-    'ex-church',
-    'ex-cia',
-    'ex-city',
-    'ex-coalitionists',
-    'ex-collaborator',
-    'ex-colonials',
-    'ex-combatants',
-    'ex-cons',
-    'ex-convicts',
-    'ex-crown',
-    'ex-data',
-    'ex-demonstration',
     'ex-detenus',
-    'ex-display',
-    'ex-dokken',
-    'ex-dragon',
-    'ex-eastender',
-    'ex-etonian',
-    'ex-euston',
-    'ex-everton',
-    'ex-fakintil',
-    'ex-farm',
-    'ex-fashion',
-    'ex-fiancee',
-    'ex-footballer',
-    'ex-friend',
-    'ex-glasgow',
-    'ex-grammar',
     'ex-guerrillas',
-    'ex-hairdresser',
-    'ex-halton',
-    'ex-hippie',
-    'ex-immigration',
-    'ex-inmates',
-    'ex-japan',
-    'ex-lancaster',
-    'ex-lifeboat',
-    'ex-llanelli',
-    'ex-lms',
-    'ex-m.n.',
-    'ex-managing',
-    'ex-manchester',
-    'ex-manorians',
-    'ex-marxists',
     'ex-middlesbrough',
-    'ex-mineworkers',
-    'ex-mirage',
-    'ex-monastic',
-    'ex-multiflow',
-    'ex-municipal',
-    'ex-music',
-    'ex-nanny',
-    'ex-national',
-    'ex-nato',
-    'ex-newcastle',
-    'ex-nun',
-    'ex-office',
-    'ex-officials',
-    'ex-parliamentary',
-    'ex-party',
     'ex-petty',
-    'ex-pow',
-    'ex-professionals',
-    'ex-programmer',
-    'ex-pros',
-    'ex-psychiatric',
-    'ex-r.a.f.',
-    'ex-rangers',
-    'ex-regular',
-    'ex-rugby',
-    'ex-ruling',
-    'ex-saxophonist',
-    'ex-schoolteacher',
-    'ex-smith',
-    'ex-social',
-    'ex-south',
     'ex-specials',
-    'ex-staff',
-    'ex-star',
-    'ex-steel',
-    'ex-stoddard',
-    'ex-sunderland',
-    'ex-superintendent',
-    'ex-supporters',
-    'ex-tate',
-    'ex-tillers',
-    'ex-transport',
-    'ex-unknown',
-    'ex-urban',
-    'ex-urbanite',
-    'ex-urbanites',
-    'ex-users',
     'ex-wales',
-    'ex-walker',
-    'ex-war',
-    'ex-warrington',
-    'ex-wtn',
-    'ex.2g',
-    'ex.3',
-    'ex.3c',
-    'ex.6',
-    'ex.7',
-    'ex2',
-    'ex4',
-    'exactitudes',
-    'exaequata',
-    'exag',
-    'exagmination',
     'exaltata',
-    'examination/coursework',
-    'examinations.',
-    'examinaton',
-    'example.dat',
-    'exarch',
-    'excavations.',
-    'exceed3/w-eur',
-    'exceedances',
-    'excellent-sounding',
-    'excellentissima',
-    'excellently-named',
-    'excepting_for',
-    'exceptio',
-    'exceptionality',
-    'excess-32',
     'excesses.',
-    'excessive.',
-    'excessiveness',
-    'exchange/member',
-    'exchanged.',
-    'excitably',
-    'excitation-contraction',
-    'excitment',
-    'excludability',
-    'excommunicato',
-    'excoriates',
-    'excrementory',
-    'excretes',
-    'excruciation',
-    'excursuses',
-    'excusez-moi',
     'executive-designate',
-    'executive-legislative',
-    'executive-ncr',
-    'executive/',
-    'executive/secretary',
-    'executively',
-    'executor(s)',
-    'executorships',
-    'exegeses',
-    'exemple',
-    'exemplorary',
-    'exercise-to-music',
-    'exercises.',
-    'exf6',
-    'exf7+',
-    'exhalent',
     'exhaust-pipes',
-    'exhauster',
-    'exhaustible',
-    'exhibit.',
-    'exhilarate',
-    'exhumations',
-    'exhumes',
-    'exigo',
-    'exigua',
-    'exilis',
-    'exis',
-    'existant',
-    'existing-use',
-    'exists.',
-    'exit-doors',
-    'exit/entrance',
     'exitance',
-    'exloo-2',
-    'exmansworthy',
-    'exocoelom',
-    'exodos',
-    'exogenetic',
-    'exogenic',
-    'exon(s)',
-    'exon/intron',
-    'exonym',
-    'exophora',
-    'exorbitance',
-    'exordia',
-    'exoskeletal',
-    'exosurf',
-    'exot',
     'exoticness',
-    'exp&eacute;rience',
-    'exp&formula;t',
-    'expand.exe',
-    'expanders',
-    'expanding/contracting',
-    'expansivity',
-    'expectedly',
-    'expectorants',
-    'expediencies',
-    'expediently',
-    'expeditiously.',
-    'expendability',
-    'expensis',
-    'expensive.',
-    'expensively-assembled',
     'experience-without-knowledge',
-    'experiental',
-    'expert/manager',
-    'expertext',
-    'expiatory',
-    'expla',
-    'explain&mdash',
-    'explainability',
-    'explanations.',
-    'explanatorily',
-    'explant',
-    'explicans',
-    'explicata',
-    'exploitability',
-    'exploitation.',
-    'exploratie',
     'exploratorium',
-    'explore.',
-    'explosimeter',
-    'explosion-proof',
-    'expo2000',
-    'expofil',
-    'exponentials',
-    'export-based',
-    'expostulates',
-    'expostulating',
-    'expostulatory',
-    'expounder',
-    'expresse',
-    'expropriates',
-    'expropriatory',
-    'expulsive',
     'expurgation',
-    'exr',
-    'extasea',
-    'extensibility',
-    'extensively.',
-    'extenuation',
-    'exterior.',
-    'exteriority',
-    'exterminations',
-    'external/co-operative',
-    'extinct.',
-    'extinct.chris',
-    'extortioners',
-    'extra-academic',
-    'extra-ec',
-    'extra-extra',
     'extra-field',
-    'extra-floral',
-    'extra-heavy',
-    'extra-illustration',
-    'extra-intestinal',
-    'extra-judicially',
-    'extra-literary',
-    'extra-loud',
-    'extra-mundane',
-    'extra-nuptial',
-    'extra-regional',
-    'extra-resident',
-    'extra-sentential',
-    'extra-tall',
-    'extra-terrestrials',
-    'extra-territoriality',
     'extra-testamentary',
-    'extra-textual',
-    'extra-tropical',
-    'extraclausals',
-    'extraembryonic',
-    'extrafine',
-    'extragenital',
-    'extralinguistically',
-    'extraordianry',
-    'extraordinary-looking',
-    'extrapsychological',
-    'extrasystole',
-    'extration',
-    'extravagancies',
-    'extravagence',
-    'extraversion',
     'extraverted',
-    'extricates',
-    'extruders',
-    'extubation',
-    'exudation',
-    'exultations',
-    'exuma',
-    'exx.2a',
-    'eycott',
-    'eydon',
-    'eye-aching',
-    'eye-balls',
-    'eye-catchiness',
-    'eye-drop',
-    'eye-glass',
-    'eye-lash',
     'eye-muscles',
-    'eye-rolling',
-    'eye-shades',
-    'eye-sighted',
-    'eye-view',
-    'eye-wateringly',
-    'eye2',
-    'eyeblack',
-    'eyelid-blue',
-    'eyeliners',
-    'eyes-on',
-    'eyeshade',
-    'eyeteeth',
-    'eyi',
-    'eynsford-hill',
-    'eyob',
     'eyrefield',
-    'eyres-monsell',
-    'eytan',
-    'eytle',
-    'eyzies',
-    'ezan',
-    'ezard',
-    'ezbekia',
-    'ezeer',
-    'ezel',
-    'ezequiel',
-    'f&aacute;tima',
-    'f&amp;ci',
-    'f&amp;j',
-    'f&amp;sub2&agr',
-    'f&bsol;gh',
     'f&dollar;2',
-    'f&dollar;28,000,000',
-    'f&eacute;ile',
-    'f&eacute;vrier',
-    'f&eacute;zensac',
-    'f&mdash;off',
-    'f&ndash;s',
-    'f&ouml;hn',
-    'f&ouml;rlag',
-    'f&uuml;hlen',
-    'f&uuml;rstenwalde',
-    'f&uuml;rsts',
-    'f\'3',
-    'f\'4',
-    'f(0)',
-    'f(3)',
     'f*',
-    'f*****\'',
-    'f***ed',
-    'f**cking',
-    'f-14d',
-    'f-601',
-    'f-801s',
-    'f-84f',
-    'f-forgot',
-    'f-h',
-    'f-i',
-    'f-ratio',
-    'f-reg',
-    'f-registered',
-    'f.1a',
-    'f.2',
     'f.4s',
-    'f.51',
-    'f.a',
-    'f.a.i.t.',
-    'f.c.r.',
-    'f.d.r.',
-    'f.gr.h.',
-    'f.l',
-    'f.o.',
-    'f.o.c.',
-    'f.r.m.s',
-    'f.s.r.',
-    'f/00/23/0006',
-    'f/00/23/0013',
-    'f/00/23/0015',
-    'f/00/23/0044',
     'f/00/23/0057',
-    'f/00/23/0062',
-    'f/00/23/0070',
-    'f/00/23/0080',
-    'f/00/23/0098',
-    'f/00/23/0100',
-    'f/00/23/0102',
-    'f/00/23/2008',
-    'f/00/23/2020',
-    'f/00/23/2025',
-    'f/00/23/2036',
-    'f/00/23/2037',
-    'f/00/23/2039',
-    'f/00/23/2052',
-    'f/00/23/2053',
-    'f/00/23/2068',
     'f/00/23/2070',
-    'f/00/23/2078',
-    'f/00/23/2079',
-    'f/00/23/2112',
-    'f/00/23/2118',
-    'f/00/23/2141',
-    'f/00/23/2144',
-    'f/00/23/2147',
-    'f/00/23/2160',
-    'f/00/23/2161',
-    'f/00/23/2169',
-    'f/00/23/2173',
-    'f/00/23/2179',
-    'f/00/23/2181',
-    'f/00/23/2187',
-    'f/00/23/2189',
     'f/00/23/2192',
-    'f/00/23/2203',
-    'f/00/23/2204',
-    'f/00/23/2206',
-    'f/00/23/2207',
-    'f/00/23/2209',
-    'f/00/23/2212',
-    'f/00/23/2213',
-    'f/00/23/2214',
-    'f/00/23/2215',
-    'f/00/23/2219',
-    'f/00/23/2222',
-    'f/00/23/2224',
-    'f/00/23/2225',
-    'f/00/23/2233',
-    'f/00/23/2239',
     'f/00/23/2240',
-    'f/00/23/2243',
-    'f/00/23/2245',
-    'f/00/23/2256',
-    'f/00/23/2259',
-    'f/00/23/2261',
-    'f/00/23/2262',
-    'f/00/23/2268',
-    'f/00/23/2275',
-    'f/00/23/2276',
-    'f/00/23/2280',
-    'f/00/23/2293',
-    'f/00/24/2005',
-    'f/00/24/2008',
-    'f/00/24/2010',
-    'f/00/24/2013',
     'f/00/25/0002',
-    'f/00/26/0003-2',
-    'f/01/25/2001',
-    'f/01/25/2016',
-    'f/02/40/0002',
-    'f/04/25/0001',
-    'f/04/25/0003',
-    'f/05/25/0012',
-    'f/05/25/0013',
-    'f/05/25/0014',
-    'f/05/25/0015',
-    'f/05/25/0017',
-    'f/07/25/0003',
-    'f/09/25/0005',
-    'f/09/25/0016',
-    'f/09/25/0019',
     'f/09/25/0022',
-    'f/09/25/0023',
-    'f/09/25/0025',
-    'f/09/25/0027',
-    'f/09/25/0029',
-    'f/09/25/0030',
-    'f/09/25/0032',
-    'f/09/25/0033',
-    'f/09/25/0034',
-    'f/09/25/0035',
-    'f/09/25/0036',
-    'f/09/25/0037',
-    'f/09/25/0038',
-    'f/09/25/0039',
-    'f/09/25/0041',
-    'f/09/25/0043',
     'f/09/25/0044',
-    'f/09/25/0045',
-    'f/09/25/0046',
-    'f/09/25/0047',
-    'f/09/25/0048',
-    'f/09/25/0050',
-    'f/09/25/0052',
-    'f/09/25/0053',
-    'f/09/25/0054',
-    'f/09/25/0055',
-    'f/09/25/0056',
-    'f/09/25/0057',
-    'f/09/25/0058',
-    'f/09/25/0059',
-    'f/09/25/0060',
-    'f/09/25/0064',
     'f/09/25/0067',
-    'f/09/25/0068',
-    'f/09/25/0069',
-    'f/09/25/0070',
-    'f/09/25/0071',
-    'f/09/25/0072',
-    'f/09/25/0073',
-    'f/09/25/0074',
-    'f/09/25/0075',
-    'f/09/25/0077',
-    'f/09/25/0078',
-    'f/09/25/0079',
-    'f/09/25/0081',
-    'f/09/25/0083',
-    'f/09/25/0088',
-    'f/09/25/0092',
     'f/09/25/0094',
-    'f/09/25/0096',
-    'f/09/25/0103',
-    'f/12/28/0001',
-    'f/20/25/0008',
-    'f/20/25/0009',
-    'f/20/25/0010',
-    'f/20/25/0012',
-    'f/24/25/0007',
-    'f/24/25/0008',
-    'f/24/25/0027',
-    'f/a',
-    'f/e',
-    'f/x-01&ndash;74482',
-    'f0/f1-type',
-    'f1,21',
     'f1,300',
-    'f1,400',
-    'f1,500',
-    'f10,200',
-    'f100,000',
-    'f10214+4724',
-    'f111',
-    'f111s',
-    'f12',
-    'f13,000,000',
-    'f17,000',
-    'f18',
-    'f19',
-    'f2.8',
-    'f20',
-    'f200',
     'f25,000,000',
-    'f26',
-    'f27',
-    'f2z10',
-    'f3+',
-    'f333',
-    'f4+',
-    'f4,000',
-    'f4,500',
-    'f45',
-    'f5.6',
-    'f5m',
-    'f61',
-    'f61\'s',
-    'f6a',
-    'f6b+',
     'f6c/7a',
-    'f7,000',
-    'f7c&plusmn',
-    'f7c/8a',
-    'f8,000',
-    'f8b&plusmn',
-    'f8f-2',
-    'f92a',
-    'fa&ccedil;adism',
-    'fa(s)t-frank',
-    'fabbrica',
-    'fabrex',
-    'fabris-petrides',
-    'fabsil',
-    'fabulate',
-    'facadism',
     'facchiano',
-    'faccini',
-    'face-lifted',
-    'face-lifts',
-    'face-like',
-    'face-off',
-    'face-sheet',
-    'face-to-back',
-    'face/nose',
-    'faceache',
-    'facelet',
-    'facepack',
-    'faceplates',
-    'facilitites',
-    'facine',
-    'facstar',
     'fact-find',
-    'fact-oriented',
-    'fact-sheet',
-    'fact/value',
-    'facteur',
-    'factification',
-    'faction-fights',
-    'facto&ndash',
-    'factoids',
-    'factor/invoice',
-    'factor=average',
-    'factoran',
-    'factories.',
-    'factorising',
-    'factory-farm',
-    'factory-farmed',
     'factory-floor',
-    'factory-hands',
-    'factory-homes',
-    'factory-installed',
-    'factory-production',
-    'factory-wide',
-    'facultatibus',
-    'faculties.',
-    'faculty-',
-    'faculty/my',
-    'faddists',
-    'faddle',
-    'fade-in',
-    'fade-resistant',
-    'fadeev',
-    'fadgey',
     'fadh',
-    'fadi',
-    'fadilj',
-    'fadmoor',
-    'fae/mus&eacute;e',
-    'faee',
-    'faerber',
-    'faeroe-shetland',
-    'fagaceae',
-    'fagerberg',
-    'faggiotto',
-    'faggot-stitch',
-    'faggy',
-    'fagurh&oacute;lsm&yacute;ri',
-    'fahey/oxfordshire',
-    'fahrettin',
     'faider',
-    'fail-safes',
-    'fail/success',
-    'failford',
-    'failsafes',
-    'faimalo',
-    'fainstein',
-    'faintings',
-    'fair-days',
-    'fairbank-nideffer',
-    'fairboy',
-    'fairey-youngman',
-    'fairfax-lucy',
-    'fairhead',
-    'fairhill',
-    'fairleys',
     'fairmilehead',
-    'fairmindedness',
-    'fairmont',
-    'fairs/festivals',
-    'fairtrade',
-    'fairwell',
-    'fairy-and-goblin',
-    'fairy-queen',
-    'fairycycle',
-    'fairydell',
-    'faith-community',
-    'fajardo',
-    'faked-up',
-    'faketown',
-    'fakhr',
-    'fakhri',
     'fakhuri',
-    'faks',
-    'falad',
-    'falafels',
-    'falah',
-    'falangism',
-    'falchion',
-    'falconer-atlee',
-    'falconhurst',
-    'falconidae',
-    'faleiro',
-    'falkes',
-    'falkirk-born',
-    'falkirk0',
-    'fall-rise-fall',
-    'fallaciousness',
     'fallahiyan',
-    'falleth',
-    'fallguy',
-    'fallingbostel',
-    'fallis',
-    'fallouja',
-    'fallside',
-    'false-positives',
-    'false/',
-    'false=0',
-    'falser',
-    'faluting',
-    'falway/oxfordshire',
-    'falwell',
-    'famers',
-    'familiae',
     'familias',
-    'families/crisis',
-    'families/friends',
-    'family-controlled',
-    'family-minded',
-    'family-trees',
-    'family.27',
-    'family/hearth',
-    'familyes',
-    'famine-relief',
-    'famliy',
-    'famuli',
-    'fan-belt',
-    'fan-leaf',
-    'fan-letter',
-    'fan-like',
     'fan-wise',
-    'fanbase',
-    'fance',
-    'fancott',
-    'fancy-pants',
-    'fandom',
-    'fanefjord',
-    'fangayufan',
-    'fanjet',
-    'fanjul',
-    'fanshaw',
-    'fantastic-looking',
-    'fantin-latour',
-    'fantoft',
-    'fanwise',
-    'fao/unep',
     'far&rehy;flung',
-    'far-',
-    'far-eastern',
-    'far-side',
-    'far-spreading',
-    'far.',
-    'farakos',
-    'faral',
-    'farallon',
-    'faramarz',
-    'farangs',
-    'farberman',
-    'farci',
-    'farcis',
-    'farctus',
-    'fardross',
     'faremo',
-    'farer',
-    'farewel',
-    'farfallino',
-    'fargelanda',
-    'farghaly',
-    'faringdon/oxfordshire',
-    'farjon',
-    'farm-animal',
-    'farm-boy',
-    'farm-type',
-    'farmans',
-    'farmboy',
-    'farmer/contractor',
-    'farmer/crofter',
-    'farmery/swindon',
     'farming-related',
-    'farmore',
-    'farms.',
-    'farnan',
-    'farnes',
-    'farney',
-    'farnie',
-    'farnsby',
-    'farragoes',
-    'farrans',
-    'farrar-hockley/military',
-    'farsightedness',
-    'farther-reaching',
-    'farthest-reaching',
-    'farthingales',
-    'fartpants',
     'faruk',
-    'farukh',
-    'fasciculation',
-    'fascinatedly',
-    'fascioliasis',
-    'fashion-related',
-    'fashionables',
-    'fassade',
-    'fassou',
-    'fast-answer',
-    'fast-beating',
-    'fast-bowler',
-    'fast-cutting',
-    'fast-firing',
-    'fast-forwarding',
-    'fast-recycling',
     'fast-response',
-    'fast-tracking',
-    'faster-acting',
-    'fastigiate',
-    'fastings',
-    'fastline',
-    'fastnets',
-    'fastrak',
-    'fasware',
-    'fat-body',
-    'fat-containing',
-    'fat-headed',
-    'fat-rich',
-    'fat-soluble',
-    'fat-tailed',
-    'fat/',
     'fatah-hamas',
-    'fataliste',
-    'fatback',
-    'fate-tempting',
-    'fatefully',
-    'fateh-ul-mulk',
-    'faternity',
-    'fatfield',
-    'father-figures',
-    'father-like',
-    'father-of-seven',
-    'father/husband',
-    'father/mother',
-    'fathoming',
-    'fatiguable',
-    'fatte',
     'fattening-up',
-    'fattiest',
-    'fattish',
-    'fattist',
-    'fattorini',
-    'fatwas',
-    'faubus',
-    'faucenbois',
-    'fauces',
-    'faucigny',
-    'faud',
-    'faulkes',
-    'faulknerian',
-    'faulknerites',
-    'faull',
-    'fault-',
     'fault-controlled',
-    'fault-if',
-    'fault-lines',
-    'fault-resistant',
-    'faunistic',
-    'faustin',
-    'faustyna',
-    'favelados',
-    'favier',
-    'favour\'',
-    'favour.',
-    'favour_of',
-    'favoured.',
-    'favourer',
-    'favourite/least',
-    'favouritist',
     'fawnlike',
-    'fawthrop',
-    'fawzan',
-    'fax-ux',
-    'faxable',
-    'faxstation',
-    'faycal',
-    'faygate',
-    'fb.6',
-    'fb.vi',
-    'fc4',
-    'fc5',
-    'fce',
-    'fcgs',
-    'fch6',
-    'fcit',
     'fdf',
-    'fdisk',
-    'fdld',
-    'fdlj',
-    'fdped',
-    'feadship',
-    'feak',
-    'feakins',
-    'fealy',
-    'fear-chill',
-    'fear-inducing',
-    'fear-provoking',
-    'feasability',
-    'feaster',
-    'feasters',
-    'feather-brained',
     'feather-headed',
-    'feather-trimmed',
-    'featherless',
-    'featherman',
-    'feathers.',
-    'feature-value',
-    'feature-writing',
-    'featurelessness',
-    'feb.1993',
-    'february-14',
-    'february-16',
-    'february-20',
-    'february-21',
-    'february-4',
-    'febvre',
-    'feca',
     'fecal',
-    'fecamp',
-    'feckin\'',
-    'feculent',
-    'fecundation',
-    'feddans',
-    'federaci&oacute;n',
-    'federal-funds',
-    'federal-unitary',
-    'federalisation',
-    'federalised',
-    'federalization',
-    'federally-financed',
-    'federator',
-    'federchimica',
-    'federigo',
     'fedka',
-    'fedoseyev',
-    'fedotov',
-    'fee-farms',
-    'fee-income',
-    'feed-forward',
-    'feedbins',
-    'feedwater',
-    'feeling-level',
-    'feenstra',
-    'feest',
-    'fefcs',
-    'feiea',
-    'feigelson',
-    'feigl',
-    'feil',
     'fein\'',
-    'feistier',
-    'fekete',
-    'fekkes',
-    'feld',
-    'feldberg',
-    'feldgrill-zankel',
-    'feldkirchen',
-    'feldspathic',
-    'fele',
-    'felic',
-    'felicit&agrave\'',
-    'felicitys',
-    'felixstowe&ndash;zeebrugge',
-    'felkin',
-    'fell-land',
     'fell-runners',
-    'fell-walkers',
-    'feller-me-lad',
-    'fellfield',
-    'fellice',
-    'fellow-',
-    'fellow-christians',
-    'fellow-commoner',
-    'fellow-conspirator',
-    'fellow-conspirators',
-    'fellow-creatures',
-    'fellow-enthusiasts',
-    'fellow-fighters',
-    'fellow-guests',
-    'fellow-heirs',
-    'fellow-historian',
     'fellow-irishman',
-    'fellow-jockey',
-    'fellow-londoners',
-    'fellow-mason',
-    'fellow-musicians',
-    'fellow-poets',
-    'fellow-scientists',
-    'fellow-teachers',
-    'fellow-victims',
-    'felltop',
-    'felmersham',
-    'felmores',
-    'felo',
-    'felony.',
-    'felsbrockenberg',
-    'felstedians',
     'felt-like',
-    'felthouse',
-    'feltwell',
-    'felwort',
-    'female-as',
-    'female-specific',
-    'femidoms',
-    'feminiad',
-    'feminity',
-    'fempress',
-    'fems',
-    'femulen',
-    'fen-edge',
-    'fenarizade',
-    'fence-posts',
-    'fenced-in',
     'fenceposts',
-    'fences.',
-    'fencings',
-    'fendi',
-    'fenestrae',
-    'fenestrals',
-    'fenfield',
-    'feng-shiu',
-    'feni&egrave;re',
-    'fenichel',
-    'fennah',
-    'fennel-flavoured',
-    'fennell/visitor',
-    'fennes',
-    'fenniks',
-    'fennings',
     'fennite',
-    'fennolora',
-    'fenoterol',
-    'fentanyl-fluanisone',
-    'feoffor',
-    'feoga',
-    'ferally',
-    'feraud',
-    'fercometal',
-    'ferejohn',
-    'ferelman',
-    'ferencvaros',
-    'ferland',
-    'fermanagh-born',
-    'fernald',
-    'fernandina',
     'fernau',
-    'fernex',
-    'ferneyhough',
-    'fernland',
-    'fernlee',
-    'fernsehfunk',
-    'fernyough',
-    'ferrard',
-    'ferrasse-fabre',
-    'ferraz',
-    'ferrea',
-    'ferreolus',
-    'ferreter',
-    'ferrey',
-    'ferro-alloys',
-    'ferro-electric',
     'ferrocarriles',
-    'ferrocement',
-    'ferrofluids',
-    'ferromagnetism',
-    'ferrooxidans',
-    'ferrovia',
-    'ferrovie',
-    'ferryquay',
-    'fers',
-    'fert&eacute',
-    'fertilisations',
-    'fertilization-induced',
-    'fesemeyer',
-    'feshaie',
-    'fesik',
-    'fessey',
     'festbier',
-    'festes',
-    'festively',
-    'festlieder',
-    'festooning',
-    'festspielhaus',
-    'festum',
-    'fetherston',
-    'fetishisation',
-    'fetomaternal',
-    'fetor',
-    'feudalists',
-    'feuge',
-    'feuillade',
-    'feverishness',
-    'fevin',
     'fevr.',
-    'few-branched',
-    'fewers',
-    'fezzes',
-    'fezziwigs',
-    'ff1',
-    'ff8,000',
-    'ffank',
-    'ffarqhuard',
-    'ffit',
-    'ffordd',
-    'ffotogallery',
-    'ffr1.3',
-    'ffr1.4',
-    'ffr1.5&ndash;2',
-    'ffr120',
     'ffr13',
-    'ffr15&ndash;20',
-    'ffr150',
-    'ffr150&ndash;200,000',
-    'ffr150,000',
-    'ffr18',
-    'ffr1m',
-    'ffr2&ndash;3m',
-    'ffr200',
-    'ffr200,000',
-    'ffr200,000&ndash;300,000',
-    'ffr23',
-    'ffr25,000',
-    'ffr250,000',
-    'ffr29,000',
-    'ffr3',
     'ffr3&ndash;5m',
-    'ffr3.1',
-    'ffr30,000',
-    'ffr300,000',
-    'ffr380,000',
-    'ffr4&ndash;5',
-    'ffr400',
-    'ffr40m',
-    'ffr480',
-    'ffr50&ndash;80',
-    'ffr50,000',
-    'ffr550,000',
-    'ffr600,000&ndash;800,000',
-    'ffr650,000',
-    'ffr7.5',
-    'ffr8',
     'ffr80',
-    'ffr800,000',
-    'ffr800,000&ndash;1.2m',
-    'ffr900,000',
-    'ffr990',
-    'ffrangcon-davies',
-    'ffree',
-    'ffrench-farce',
-    'ffruit',
-    'fft',
-    'ffurnish',
-    'ffynnon',
-    'fgf-1',
-    'fgf-4-treated',
-    'fgf-5',
-    'fgfs',
     'fgh',
-    'fhds',
-    'fhg',
-    'fhithich',
-    'fiame',
-    'fiance/1e',
-    'fiat-rate',
-    'fiberchannel',
-    'fibi',
-    'fibre**',
-    'fibre-tipped',
-    'fibreburger',
-    'fibreform',
-    'fibroblastic',
-    'fibrosarcoma',
-    'fibrous-rooted',
     'fice',
-    'ficelle',
-    'ficer',
-    'ficers',
-    'fichera',
-    'fiches',
-    'fiction-writers',
-    'fiddle-player',
-    'fiddle-prone',
-    'fiddlecase',
-    'fiddlin\'',
-    'fideicommissis',
-    'fidelia',
-    'fidelistas',
-    'fidelius',
-    'fidgeon',
     'fidrikas',
-    'fiee',
-    'fief-holders',
-    'field-mapping',
-    'field-paths',
-    'field-specific',
-    'field-trip',
-    'field-upgraded',
-    'fieldgun',
-    'fieldhead',
-    'fields/viewpoint',
-    'fiendishness',
-    'fierce-eyed',
-    'fiercely-competitive',
-    'fieriest',
-    'fiesty',
     'fifes',
-    'fifte',
-    'fifteen-a-side',
-    'fifteen-barrelled',
-    'fifteen-hour',
-    'fifteen-hundred',
-    'fifteen-man',
-    'fifteen-month-old',
-    'fifth-largest',
-    'fifth-minute',
-    'fifth-order',
-    'fifty-fold',
-    'fifty-minute',
-    'fifty-pence',
-    'fifty-something',
-    'fifty-yard',
     'fig-trees',
-    'fig-wasps',
-    'fig.1.3(b)',
-    'fig.10',
-    'fig.11',
-    'fig.15',
-    'fig.16',
-    'fig.20',
-    'fig.23',
-    'fig.24',
-    'fig.3.1',
-    'fig.31',
-    'fig.34',
-    'fig.39',
-    'fig.4.1',
-    'fig.5.6',
     'fig.7.2',
-    'fig.8.1',
-    'fig.8.4',
-    'fig.9.2',
-    'figges',
-    'fight-or-flight',
-    'fightbacks',
-    'fighters.',
-    'fighting-towers',
-    'figueira',
-    'figueredo',
-    'figurality',
-    'figurally',
-    'figure-eight',
-    'figurekiting',
-    'figures-of-eight',
     'figurework',
-    'fikey',
-    'filabeg',
-    'filament-wound',
-    'filamentosa',
-    'filarioids',
-    'filarmonica',
-    'file-o-fax',
-    'file/device',
-    'filefish',
-    'filemaker',
-    'files.',
-    'files=30',
-    'fileshare',
-    'filets',
-    'filia',
     'filibe',
-    'filibusters',
-    'filicollis',
-    'filion',
-    'filippino',
-    'filkins',
-    'fill-flash',
-    'fill-ups',
-    'filled-out',
-    'fillimonov',
-    'filling-out',
-    'filling-stations',
-    'filling.',
-    'fillon-payoux',
-    'film-like',
-    'film-scripts',
     'film/artwork',
-    'film/slide',
-    'filmo',
-    'filmography',
-    'filmz',
-    'fils-aime',
-    'filter-fed',
-    'filterbank',
-    'filth-encrusted',
-    'filtrated',
-    'filtration/aeration',
-    'filtre',
-    'fin-like',
-    'fin-rays',
-    'fin.',
-    'fin22',
     'final-stressed',
-    'final/1972',
-    'finally_in',
-    'finals.',
-    'finance-related',
-    'financeable',
-    'financial/',
-    'financieele',
-    'finaserve',
-    'finbow',
-    'fincas',
-    'fincastle',
-    'finch-like',
-    'finch/flood',
-    'find\'',
-    'findable',
     'finde',
-    'findest',
-    'findfield',
-    'findings.',
-    'findspots',
-    'findvirus',
-    'fine&rehy;tooth',
-    'fine-pointed',
-    'fine-quality',
-    'fine-sounding',
-    'fine-tuners',
-    'finely-chopped',
-    'finely-cut',
-    'finely-tooled',
-    'finely-worked',
-    'finely-woven',
     'fineries',
-    'finespun',
-    'finestra',
-    'finger(s)',
-    'finger-fish',
-    'finger-four',
-    'finger-in-the-ear',
-    'finger-prints',
-    'finger-wrestling',
-    'fingerful',
-    'fingerlings',
-    'fingerplate',
-    'fingerplates',
-    'fingerspelt',
-    'fingertip-sized',
-    'finglas',
     'finire',
-    'finished-goods',
-    'finite-difference',
-    'finites',
-    'finke',
-    'finlas',
-    'finlay-jones',
-    'finn-kelsey',
-    'finnida',
-    'finnieston',
-    'finnist',
-    'fintona',
-    'fionnuala',
-    'fioravanti',
-    'fiorela',
-    'fiorini',
     'fiorito',
-    'fiortoft',
-    'fir-boughs',
-    'fir-trees',
-    'fire-arms',
-    'fire-blackened',
-    'fire-blasted',
-    'fire-bombs',
-    'fire-buckets',
-    'fire-charred',
-    'fire-festivals',
-    'fire-gilding',
-    'fire-grate',
-    'fire-gutted',
-    'fire-lighters',
-    'fire-missiles',
     'fire-places',
-    'fire-protection',
-    'fire-red',
-    'fire-seat',
-    'fire-sensitive',
-    'fire-training',
-    'fire-watchers',
-    'firebasket',
-    'firebell',
-    'firebirds',
-    'firebombings',
-    'firebote',
-    'fireboxes',
-    'firebreaks',
-    'firebrick',
-    'firebrigade',
     'firebugs',
-    'firebutton',
-    'firefinch',
-    'firefront',
-    'firegrates',
-    'firehoses',
-    'fireless',
-    'firenzuola',
-    'fireproofed',
-    'firers',
-    'fireservice',
-    'firestones',
-    'firetto',
-    'fireweed',
-    'firing-step',
-    'firkins',
     'firm\'',
-    'firm(s)',
-    'firm-hewn',
-    'firm-level',
-    'firm-sale',
-    'firm-type',
-    'firm-wide',
-    'firmans',
-    'firmi',
-    'firoz',
-    'first&mdash',
-    'first&rehy;floor',
-    'first-draft',
-    'first-handedness',
-    'first-hog',
-    'first-nighters',
     'first-quality',
-    'first-school',
-    'first-season',
-    'first-series',
-    'first-wicket',
-    'firstlings',
-    'firwood',
-    'firyal',
-    'firyubin',
-    'fiscals',
-    'fischer-dieskau',
-    'fish-and-chips',
-    'fish-boy',
-    'fish-coloured',
-    'fish-eaters',
-    'fish-eggs',
     'fish-filled',
-    'fish-guts',
-    'fish-knives',
-    'fish-net',
-    'fish-scales',
-    'fish-tailed',
-    'fish-tails',
-    'fish/surface',
-    'fishamble',
-    'fishboxes',
-    'fisher/breastfeeding',
-    'fisher/head',
-    'fisherpeople',
-    'fisherton-de-la-mare',
-    'fisherwoman',
-    'fishgarths',
     'fishheads',
-    'fishiness',
-    'fishing-nets',
-    'fiskars',
-    'fiskvik',
-    'fismes',
-    'fister',
-    'fistfights',
-    'fistulous',
-    'fit-to-be-dusted',
-    'fitba\'',
-    'fitc-',
-    'fitc-conjugated',
-    'fitc-labelled',
-    'fite',
-    'fittall',
     'fitte',
-    'fitting-up',
-    'fitzalan-howard',
-    'fitzduff',
-    'fitzgeralds',
-    'fitzmyer',
-    'fitzrichard',
-    'fitzwarin',
-    'fitzwilton',
-    'fiuza',
-    'fiv',
-    'five&rehy;day',
-    'five-and-a-half-year-old',
-    'five-aside',
-    'five-atom',
-    'five-bob',
     'five-colour',
-    'five-dice',
-    'five-disc',
-    'five-feet',
-    'five-for-four',
-    'five-forty',
-    'five-forty-five',
-    'five-frame',
-    'five-hundred-buck',
-    'five-lane',
-    'five-layer',
-    'five-legged',
-    'five-minutes',
-    'five-nation',
-    'five-one',
-    'five-pack',
     'five-peppered',
-    'five-pin',
-    'five-pointer',
-    'five-rayed',
-    'five-ship',
-    'five-step',
-    'five-subject',
-    'five-thousandth',
-    'five-tiered',
-    'five-to-one',
-    'five-tone',
-    'five-try',
-    'five-under',
-    'five-user',
-    'five-volume',
-    'fix-price',
     'fixable',
-    'fixates',
-    'fixators',
-    'fixby',
-    'fixed-',
-    'fixed-dose',
-    'fixed-penalty',
-    'fixed-period',
-    'fixities',
-    'fizkin',
-    'fizzers',
-    'fizziness',
-    'fizzog',
-    'fj',
-    'fk-506',
-    'fl080',
     'fl180',
-    'flaccidity',
-    'flackware',
-    'flag-burners',
-    'flag-carrier',
-    'flag-like',
-    'flag-poles',
-    'flag-raising',
-    'flag-wearers',
-    'flag.',
-    'flagellata',
-    'flagellatory',
-    'flagfish',
-    'flahaut',
-    'flailin',
-    'flakebridge',
     'flamazine',
-    'flambeaus',
-    'flamboyancy',
-    'flame-like',
-    'flame-of-the-forest',
-    'flame-patterned',
-    'flame-proofed',
-    'flame-pulled',
-    'flame-top',
-    'flamme',
-    'flammula',
-    'flange-plates',
-    'flank.',
-    'flanks.',
-    'flannelboard',
-    'flannelfoot',
     'flannigan',
-    'flap-pockets',
-    'flap-shaped',
-    'flapless',
-    'flappy',
-    'flared-leg',
-    'flash-backs',
-    'flash-bulb',
-    'flash-bulbs',
-    'flash-gun',
-    'flashbios',
-    'flashees',
-    'flashin\'',
-    'flat-12',
-    'flat-bottom',
-    'flat-foot',
     'flat-mates',
-    'flat-muscled',
-    'flat-packed',
-    'flat-panel',
-    'flat-screen',
-    'flat-six',
-    'flat-tops',
-    'flat-warming',
-    'flat-work',
-    'flatfooted',
-    'flatheads',
-    'flatland',
-    'flats.',
-    'flatshop',
-    'flatteners',
-    'flattening-out',
     'flatwork',
-    'flatworm-like',
-    'flavors',
-    'flax-workers',
-    'flays',
-    'flcopy',
-    'fle',
-    'flea-bag',
-    'fleabag',
-    'fleahopper',
-    'flecainide',
-    'flecknoe',
-    'fleeming',
-    'fleetness',
-    'fleetwood-smith',
-    'fleetwoods',
     'fleg',
-    'fleminger',
-    'flensberg',
-    'flensed',
-    'flesh-eater',
-    'flesh-eaters',
-    'flesh-like',
-    'fleshier',
-    'fleshiness',
-    'flesseille',
-    'fleuri',
-    'flewett',
-    'flexibility.',
-    'flexions',
-    'flexis',
-    'flexors',
     'flexos',
-    'flg.offs',
-    'flic/sefic',
-    'flicked-on',
-    'flickeringly',
-    'fliegerkorps',
-    'fliends',
-    'flies.',
-    'flight-bag',
-    'flight-plans',
-    'flight-sergeant',
-    'flight-test',
-    'flighting',
-    'flights.',
-    'flims',
-    'flimsies',
     'flinder',
-    'flingers',
-    'flingette',
-    'flins',
-    'flint-faced',
-    'flintily',
-    'flintwork',
-    'flip-chart',
-    'flipcharts',
-    'flipflop',
-    'flipflops',
-    'flipper-like',
-    'flittermus',
-    'flitters',
-    'flix',
-    'flmn',
     'float-equipped',
-    'floatations',
-    'flodeugerdd',
-    'flood-lands',
-    'flood-level',
-    'flood-prone',
-    'floodable',
-    'floodlamp',
-    'floodlamps',
-    'flooring-grade',
-    'floorwalkers',
-    'floorward',
-    'floorway',
-    'floorwork',
-    'floosie',
-    'flop-houses',
     'floppy-fringed',
-    'floppy-headed',
-    'floral-patterned',
-    'floreat',
-    'florencecourt',
-    'florennes',
-    'florenz',
-    'florescent',
-    'flori',
-    'floricultural',
-    'floriferous',
-    'florjanic',
-    'floryan',
-    'flotec',
-    'flotes',
-    'flour-like',
     'flourescent',
-    'flourmill',
-    'flow-front',
-    'flow-patterns',
-    'flow/total',
-    'flowage',
-    'flower-bright',
-    'flower-lined',
-    'flower-painting',
-    'flower-pieces',
-    'flower-plots',
-    'flower-shop',
-    'flowerdale',
-    'floweriness',
-    'flowerpot-shaped',
-    'flowrate',
     'flowres',
-    'flr1',
-    'flr2',
-    'flrb',
-    'flu-u-u-te',
-    'fluebrush',
-    'fluffiest',
-    'flugga',
-    'fluid-flow',
-    'fluid-intake',
-    'fluid-like',
-    'fluitans',
-    'flukily',
-    'fluo-3',
-    'fluorescein-coated',
-    'fluorescein-coupled',
     'fluorescopy',
-    'fluorimeter',
-    'fluorimetric',
-    'fluoritic',
-    'fluoro',
-    'fluorodeoxyuridine',
-    'fluoroimmunoassay',
-    'fluorometric',
-    'fluoroquinolone',
-    'flush-mounted',
-    'fluters',
-    'flutie',
-    'flutings',
-    'flutist',
-    'flutter-tonguing',
-    'fluvially',
     'fly-blow',
-    'fly-infested',
-    'fly-like',
-    'fly-posters',
-    'fly-sheet',
-    'fly-specked',
-    'fly-traps',
-    'fly/drive',
-    'flyboats',
-    'flybridge',
-    'flykillers',
-    'flys',
-    'flyways',
-    'fm-towns',
-    'fm104.9',
-    'fmlh',
     'fmoles',
-    'fmps',
-    'fnac-belgium',
-    'fnb',
-    'fnd',
-    'fntmms',
-    'fo\'castle',
-    'fo.',
-    'foam-breathing',
-    'foamstorms',
-    'focke-wulf',
-    'fockler',
-    'focos',
-    'focus/view',
-    'foders',
-    'fody',
     'foe-',
-    'foeke',
-    'foetidissima',
-    'fog-horns',
-    'fogadabadogulous',
-    'fogerific',
-    'fogeyness',
-    'fogge',
-    'fogginess',
-    'foglights',
-    'fogous',
-    'fogtabulous',
-    'foil-embossed',
-    'foil-lined',
-    'foins',
-    'foire',
     'fokkema',
-    'folates',
-    'folbot',
-    'folcard',
-    'folcini',
-    'folco',
-    'fold-over',
-    'fold-thrust',
-    'folene',
-    'foleys',
-    'foliage.',
-    'folk-dances',
-    'folk-devils',
-    'folk-music',
-    'folk-pop',
-    'folk-punk',
     'folk-wisdom',
-    'folk/rock',
-    'folkery',
-    'folkestone-based',
-    'folkiness',
-    'folksiness',
-    'folkwang',
-    'foller',
-    'follets',
-    'folliard/head',
-    'follicle-flowing',
-    'followin\'',
-    'fologo',
-    'folowed',
-    'fome',
-    'fomison',
     'fomorians',
-    'fomors',
-    'foncie',
-    'fonction',
-    'fonctionnaires',
-    'fondants',
-    'fondeurs',
-    'fondlers',
-    'fondu',
-    'fondutis',
-    'font-name',
-    'fontainebleu',
-    'fontana/grafton',
-    'fontane',
-    'fontellen',
-    'fonten',
     'fontenelle',
-    'fontes',
-    'fontgalland',
-    'foo.bar',
-    'foo2',
-    'food-begging',
-    'food-collecting',
-    'food-finder',
-    'food-grade',
-    'food-plant',
-    'food-reinforced',
-    'food-web',
-    'foodbase',
-    'foodmarkets',
-    'foodplant',
-    'foodsafe',
     'foodwise',
-    'foofoo',
-    'fook',
-    'foolchester',
-    'foolish-looking',
-    'foolscap-size',
-    'foot-assisted',
-    'foot-care',
-    'foot-passenger',
-    'foot-prints',
-    'foot-rests',
-    'foot-shaped',
-    'foot-sized',
-    'foot-stomping',
-    'foot-thick',
-    'foot-traveller',
     'foot-up',
-    'foot-weary',
-    'foot-wide',
-    'footage.',
-    'football-pools',
-    'footbath',
-    'footboards',
-    'footcontroller',
-    'footmark',
-    'footscray',
-    'footsoldier',
-    'footstools',
-    'footsweep',
-    'footswitchable',
-    'for\'t',
-    'for.the',
     'for_at',
-    'for_instance.',
-    'forbes-read',
-    'forbes/vet',
-    'forbidding-looking',
-    'forbister',
-    'forbo-nairn',
-    'forcasters',
-    'force-backed',
-    'force-eight',
-    'force-loyalist',
-    'force-marched',
-    'forcedly',
-    'forcemeat',
-    'forces&mdash;see',
-    'forcett',
     'ford-hunt',
-    'ford/fruit',
-    'fordable',
-    'fordafourie',
-    'fordell',
-    'fordson',
-    'fore-',
-    'fore-edges',
-    'fore-front',
-    'fore-intending',
-    'fore-ordained',
-    'foreboded',
-    'forecast.',
-    'forecastable',
-    'forecasting.',
-    'forechest',
     'foredown',
-    'forefield',
-    'foregarden',
-    'foregathering',
-    'foreguards',
-    'foreign\'',
-    'foreign-born',
-    'foreign-investment',
-    'foreknows',
-    'forensically',
-    'foreparts',
-    'forer',
-    'foresaid',
-    'foreseeable.',
-    'foreset',
-    'foreshadowings',
     'foreshorten',
-    'foresisters',
-    'forest-clad',
-    'forest-dappled',
-    'forest0',
-    'foresta',
-    'forestalls',
-    'foresteria',
-    'foresti&egrave;re',
-    'forestry.',
-    'foresuffered',
-    'foreswearing',
-    'foret',
-    'foretich',
-    'foretriangle',
-    'forevermore',
     'forewomen',
-    'forework',
-    'forgill',
-    'forgiveable',
-    'forklifts',
-    'forlane',
-    'forlorn-looking',
-    'forlornness',
-    'form-factor',
-    'form/last',
-    'form/letter',
-    'formaggio',
-    'formally-stated',
-    'formant',
-    'format(s)',
-    'formation.',
     'formbook',
-    'formfeeds',
-    'formidable-looking',
-    'formidible',
-    'forms-based',
-    'forms/c.v.s',
-    'formstons',
-    'formula-one',
-    'formulable',
-    'formulative',
-    'formvariation',
-    'formyl',
-    'fornethy',
-    'fornovo',
-    'forrest-thomson',
-    'forret',
     'forsc',
-    'forshey',
-    'forskolin-sensitive',
-    'forss',
-    'forstal',
-    'forstereshegh',
-    'forsteri',
-    'forteen',
-    'fortereshey',
-    'forteshegh',
-    'forthey',
-    'forthlin',
-    'forthnight',
-    'fortifies',
-    'fortin',
-    'fortner',
     'fortney',
-    'fortronic',
-    'fortschrittliche',
-    'fortuitum',
-    'forty-fives',
-    'forty-hour',
-    'forty-ish',
-    'forty-nines',
-    'forty-ninth',
-    'forty-something',
-    'forty-strong',
-    'fortye',
-    'forum/pav',
-    'foruzesh',
-    'forward-',
-    'forward-biased',
     'forward-engineer',
-    'forward-firing',
-    'forward-mounted',
-    'forward-moving',
-    'forward-pointing',
-    'forward/forward',
-    'forwardly',
-    'fosberg',
-    'fosca',
-    'fossat',
-    'fosse/gloucestershire',
-    'fossen',
-    'fossgate',
-    'fossie',
-    'fossilise',
-    'foster-',
     'foster-mum',
-    'foth',
-    'fotograf&iacute;a',
-    'fotografie',
-    'foucarde',
-    'fougabatics',
-    'fouilles',
-    'foukes',
-    'foul-looking',
-    'foulder',
-    'foulds/neighbour',
-    'fouleshurst',
-    'foulkes-arnold',
-    'foulney',
-    'foun',
-    'foundement',
     'founder-president',
-    'fountain-pens',
-    'fountaining',
-    'four&ndash;hour',
-    'four-a-side',
-    'four-act',
-    'four-and-a',
-    'four-and-three-quarter',
-    'four-arrow',
-    'four-bay',
-    'four-bead',
-    'four-berth',
-    'four-centred',
-    'four-coach',
-    'four-consonant',
-    'four-country',
     'four-deep',
-    'four-engine',
-    'four-event',
-    'four-eyes',
-    'four-feet',
-    'four-finger',
-    'four-floor',
-    'four-foot-long',
-    'four-footer',
-    'four-forty',
-    'four-four',
-    'four-handicapper',
-    'four-hundred',
-    'four-hundred-and-forty',
-    'four-hundredth',
-    'four-in-hand',
     'four-lamp',
-    'four-laned',
-    'four-light',
-    'four-movement',
-    'four-nation',
-    'four-oh-four',
-    'four-over',
-    'four-pages-to-view',
-    'four-pence',
-    'four-phases-on',
-    'four-pinters',
-    'four-place',
-    'four-plus',
-    'four-posters',
-    'four-roomed',
-    'four-second',
     'four-ten',
-    'four-under',
-    'four-vehicle',
-    'four-wheelers',
-    'four-wire',
-    'four-years-old',
-    'fourah',
-    'fourdrinier',
-    'fouriers',
-    'fournet',
-    'fourpiece',
-    'fourrages',
-    'fourseasons',
-    'fourteen-carat',
-    'fourteenfold',
-    'fourth-gear',
     'fourth-rank',
-    'fourth-wall',
-    'fourth-years',
-    'fourways',
-    'foveae',
-    'foward',
-    'foweraker',
-    'fowlds',
-    'fowle/aylesbury',
-    'fowle/swindon',
-    'fowler/tenant',
-    'fox\'',
-    'fox-',
-    'fox-fur',
-    'fox-headed',
-    'fox-hunters',
     'fox-like',
-    'fox-north',
-    'fox-style',
-    'foxbar',
-    'foxbro',
-    'foxhalls',
-    'foxhunts',
-    'foxlett',
-    'foxvideo',
-    'foz',
-    'fozzy',
-    'fp-fibre',
-    'fp10s',
-    'fp3',
-    'fp4',
-    'fpis',
     'fpps',
-    'fr&aacute;gner',
-    'fr.4',
-    'fr.i',
-    'fr.xiv',
-    'fr3',
-    'fr571',
-    'fraassen',
-    'frabjous',
-    'fracanzani',
-    'fractionalised',
-    'fraczek',
-    'fraggles',
-    'fragmentisation',
-    'fragner',
-    'fragonards',
     'fragrant-smelling',
-    'frailly',
-    'fraises',
-    'frak/freed',
-    'frama',
-    'framatone',
-    'framboises',
-    'frame-accurate',
-    'frame-grabber',
-    'frame-maker',
-    'frame/harp',
-    'framed.',
-    'frames.',
-    'framesmiths',
-    'framestore',
-    'framework-knitting',
     'frams&oacute;knarflokkurinn',
-    'framwells',
-    'fran&ccedil;ois-andr&eacute',
-    'fran&ccedil;ois-poncet',
-    'franc-dollar',
-    'franc-tireurs',
-    'france*',
-    'france-africa',
-    'france-inter',
-    'france-wide',
-    'france/1986/cert',
-    'franchina',
-    'franchise-holders',
-    'franchisers',
-    'francis/buckinghamshire',
-    'franciszek',
     'franco-castilian',
-    'franco-iranian',
-    'franco-lebanese',
-    'franco-polish',
-    'francogallia',
-    'francolins',
-    'francophobic',
-    'francouzska',
-    'francy',
-    'frangula',
-    'franjiehs',
-    'frankenstein\'s-daughter',
-    'frankfurt-am-main',
-    'franks/schafer',
-    'frankum',
-    'frantzia',
     'franz-josef',
-    'franziska',
-    'fras',
-    'frasassi',
-    'fraser-pinter',
-    'fraterna',
-    'fraternite',
-    'fraud-related',
-    'fraud-ridden',
-    'fraudbuster',
-    'fraudcast',
-    'fraudful',
-    'fraumunster',
-    'frauts',
-    'fray/aylesbury',
-    'frazer/dean',
     'frazer/dean/new',
-    'frd',
-    'freaked-out',
-    'freakishness',
-    'frecce',
-    'freckleton',
-    'freckling',
-    'fred4',
-    'fredellen',
-    'frederich',
-    'frederiksen',
-    'frederikshavn',
-    'fredheim',
-    'free&rehy;market',
-    'free&rehy;standing',
-    'free(p)',
     'free-air',
-    'free-associates',
-    'free-association',
-    'free-dinner',
-    'free-fire',
-    'free-flying',
-    'free-hanging',
-    'free-lined',
-    'free-marketeering',
-    'free-paying',
-    'free-produce',
-    'free-revving',
-    'free-riding',
-    'free-school',
-    'free-sheet',
-    'free-style',
     'free-taking',
-    'free-thinkers',
-    'free-throws',
-    'free-wheeled',
-    'free-willed',
-    'free/rest',
-    'freebairn',
-    'freebee',
-    'freedburg',
-    'freelax',
-    'freeload',
-    'freeloader',
-    'freeman-atwood',
-    'freemarket',
-    'freeminers',
-    'freer-flowing',
     'freer-smith',
-    'freeson',
-    'freestyler',
-    'freetime',
-    'freeze-branded',
-    'freeze-dry',
-    'freeze-framed',
-    'freeze-frames',
-    'freezer-van',
-    'freezin\'',
-    'freezing-out',
-    'freezingly',
-    'freiberg',
-    'freight&ndash;only',
-    'freight-forwarding',
-    'freightcar',
     'freightyards',
-    'freij',
-    'freind',
-    'freivalds',
-    'frejjis',
-    'fremblii',
-    'french-administered',
-    'french-appointed',
-    'french-canadians',
-    'french-derived',
-    'french-generated',
-    'french-german',
-    'french-polished',
-    'french-tasting',
-    'french/british',
-    'french/english',
     'frenches',
-    'frencis',
-    'frenular',
-    'frenulum',
-    'freq',
-    'frequenters',
-    'freschville',
-    'fresco/popperfoto',
-    'fresh-ground',
-    'freshfayre',
-    'freshly-ground',
-    'freshly-picked',
-    'freshly-prepared',
-    'freshly-turned',
-    'fresshe',
-    'fret-ends',
     'fretil&iacute;n',
-    'freudenau',
-    'freudenberg',
-    'freudenfels',
-    'freville',
-    'freygood',
-    'frf&prime;r',
-    'friant',
-    'friarfold',
-    'friargate',
-    'fricass&eacute;e',
-    'fricassees',
-    'friday/saturday',
-    'fridaythorpe',
-    'fridliefsson',
-    'fridrik',
     'fridrikas',
-    'fried-egg',
-    'friedenberg',
-    'friedenstein',
-    'friederich',
-    'friedgut',
-    'friedmans',
-    'friedrich-wilhelm',
-    'friedson',
-    'friend/foe',
-    'friend/the',
-    'friendloverplane',
-    'friends-not',
-    'fries-hollands',
-    'frieseke',
-    'friga',
     'frigaard',
-    'frightened-looking',
-    'frigi-thalgo',
-    'frigida',
-    'frigidaires',
-    'frigorix',
-    'frijoles',
-    'fringe.',
-    'fringers',
-    'frith/moll',
-    'frito-lay',
-    'fritz-denneville',
-    'friuli-venezia',
-    'friulian',
-    'friv',
-    'frizell',
     'frizzies',
-    'frizziness',
-    'frob',
-    'frobishers',
-    'frock-coated',
-    'frog-hoppers',
-    'frog-marching',
-    'froggatt/eastham',
-    'froghall',
-    'froglike',
-    'froideur',
-    'froilan',
-    'frolicsome',
-    'frolicsomeness',
-    'from.',
-    'fromageries',
     'froment-meurice',
-    'froment-putman',
-    'fromkin',
-    'fromus',
-    'front&ocirc;n',
-    'front-facing',
-    'front-left',
-    'front-of-curtain',
-    'front-office',
-    'front-opening',
-    'front-projection',
-    'front-vowel',
-    'front-zimbabwe',
-    'fronten',
-    'frontier-free',
-    'frontiers.',
     'frontmen',
-    'fronzo',
-    'froody',
-    'frost-blackened',
-    'frost-rimed',
-    'frost-sensitive',
-    'frostbelt',
-    'frostier',
-    'froswick',
-    'frothingham',
-    'frothings',
-    'frought',
-    'fround',
-    'froward',
-    'frown-lines',
-    'frozen-in',
     'frozenly',
-    'frozenness',
-    'frp',
-    'frpl',
-    'frps',
-    'frsa',
-    'frss',
-    'fruchter',
-    'fructicose',
-    'fructification',
-    'frudd',
-    'frug',
-    'fruhbeck',
-    'fruit-and-nut',
-    'fruit-bearing',
-    'fruit-flavoured',
     'fruit-flies',
-    'fruit-fly',
-    'fruit-gum',
-    'fruit-gums',
-    'fruit-like',
-    'fruit-shop',
-    'fruit-stone',
-    'fruitarian',
-    'fruitbowl',
-    'fruitiest',
-    'fruitily',
-    'fruitlessness',
-    'frumentius',
-    'frumious',
-    'frunction',
-    'frustration-aggression',
     'fryatt',
-    'fryday',
-    'frydman',
-    'fs-1',
-    'fsb',
-    'fsg',
-    'fsp/uk',
-    'fsw',
-    'ft-all',
-    'ft-long',
-    'ftam',
-    'ftlr',
-    'fu2',
-    'fuck-ing',
-    'fuckable',
-    'fuckings',
     'fucosyltransferase',
-    'fuday',
-    'fudgeable',
-    'fuegans',
-    'fuel-clad',
-    'fuel-consumption',
-    'fuel-dumps',
-    'fuel-laden',
-    'fuel-life',
-    'fuel-store',
-    'fuel-tanker',
-    'fuel-tanks',
-    'fuelhouse',
-    'fuente',
-    'fuenzalida',
-    'fuggle',
     'fuggy',
-    'fuiss&eacute',
-    'fuite',
-    'fujairah',
-    'fujichrome',
-    'fujitsu-amd',
-    'fujtisu',
-    'fuks',
-    'fukushima',
-    'fula',
-    'fulami',
-    'fulfillable',
-    'fulfillinmg',
-    'fulfilments',
-    'fulford/neighbour',
-    'fulga',
     'fuliginosus',
-    'fuliginous',
-    'full(ish)',
-    'full-blow',
-    'full-cover',
-    'full-fed',
-    'full-frontally',
-    'full-houses',
-    'full-paying',
-    'full-pitch',
-    'full-plan',
-    'full-score',
-    'full-steps',
-    'full-swing',
-    'fulla',
-    'fullblooded',
     'fullelove',
-    'fuller-style',
-    'fullerian',
-    'fullscale',
-    'fulltimers',
-    'fully-blown',
-    'fully-exposed',
-    'fully-funded',
-    'fully-licensed',
-    'fully-pumped',
-    'fully-qualified',
-    'fully-rigged',
-    'fully-scaled',
-    'fullyfledged',
-    'fulmen',
-    'fulmination',
     'fum',
-    'fumbler',
-    'fumigations',
-    'fumigator',
-    'fun-in-the-parks',
-    'fun-lovers',
-    'fun-to-be-with',
-    'funcoplication',
-    'function(s)',
-    'functionalist-based',
-    'functionalities',
-    'functions/procedures',
-    'fundable',
-    'fundamentalisms',
-    'fundamentalists.',
-    'fundhold',
     'funding.',
-    'fundoscopic',
-    'funduscopy',
-    'fungizone',
-    'fungy',
-    'funicle',
-    'funiculars',
-    'funk/mc',
-    'funkateer',
-    'funkiest',
-    'funna',
-    'funnium',
-    'funsters',
-    'fur-clad',
-    'fur-cloaked',
-    'fur-edged',
     'fur-traders',
-    'fur-trappers',
-    'fur-wrapped',
-    'fura',
-    'fura-2',
-    'furam',
-    'furby/aylesbury',
-    'furby/bicester',
-    'furby/gloucester',
-    'furby/st',
-    'furby/stoke',
-    'furby/winchester',
-    'furby/witney',
-    'furby/wootton',
-    'furgol',
-    'furibonde',
     'furlan',
-    'furler',
-    'furless',
-    'furnacemen',
-    'furnas',
-    'furneaux',
-    'furniture.he',
-    'furnivall',
-    'furphy',
-    'furriners',
-    'furry-leaved',
-    'furstenberg',
-    'furstenfeld',
-    'further-education',
-    'furthest-flung',
-    'fusagasug&aacute',
     'fusca',
-    'fuschia',
-    'fuscus',
-    'fuser',
-    'fuseways',
-    'fussier',
-    'fussies',
-    'futilities',
-    'futter',
-    'future-proof',
-    'futurista',
-    'futurologist',
-    'fuzziest',
-    'fvrd',
-    'fw14',
-    'fwg',
     'fwiday',
-    'fx-500',
-    'fx4s',
-    'fx561',
-    'fxe4',
-    'fyfe/lawyer',
-    'fyffes',
-    'fyndone',
-    'fyrkat',
-    'fytiaras',
-    'g%',
-    'g&eacute;ant',
-    'g&eacute;dre',
-    'g&eacute;ologiques',
-    'g&eacute;raud',
-    'g&egrave;dre',
     'g&ndash;aaca',
-    'g&ndash;aexf',
-    'g&ndash;fire',
-    'g&ocirc;teborg',
-    'g&ouml;es',
-    'g&ouml;mb&ouml;s',
-    'g&ouml;yrgi',
-    'g&pound',
-    'g(x)',
-    'g-6-pd',
-    'g-a-a',
-    'g-atjm',
-    'g-b',
-    'g-bands',
-    'g-dhcb',
-    'g-g-g-girl',
     'g-good',
-    'g-imino',
-    'g-iv',
-    'g-l',
-    'g-lader',
-    'g-o-s',
-    'g-ustv',
-    'g-wagen',
-    'g.1',
-    'g.c',
-    'g.c.h.o.',
-    'g.e.r.',
-    'g.n',
-    'g.p.t.',
-    'g.r.m.',
-    'g.s.a.',
     'g.t.',
-    'g.v.',
-    'g/00/22/0001',
-    'g/00/23/0006',
-    'g/00/23/0011',
-    'g/00/23/0015',
-    'g/00/23/0048',
-    'g/00/23/0062',
-    'g/00/23/0077',
-    'g/00/23/0079',
-    'g/00/23/0082',
-    'g/00/23/0087',
-    'g/00/23/0092',
-    'g/00/23/0093',
-    'g/00/23/0095',
-    'g/00/23/0100',
     'g/00/23/0103',
-    'g/00/23/0108',
-    'g/00/23/0109',
-    'g/00/23/0114',
-    'g/00/23/2013',
-    'g/00/23/2014',
-    'g/00/23/2019',
-    'g/00/23/2021',
-    'g/00/23/2025',
-    'g/00/23/2029',
-    'g/00/23/2038',
-    'g/00/23/2041',
-    'g/00/23/2042',
-    'g/00/23/2047',
-    'g/00/23/2051',
-    'g/00/23/2067',
     'g/00/23/2074',
-    'g/00/23/2079',
-    'g/00/23/2082',
-    'g/00/23/2088',
-    'g/00/23/2090',
-    'g/00/23/2093',
-    'g/00/23/2095',
-    'g/00/23/2114',
-    'g/00/23/2127',
-    'g/00/23/2132',
-    'g/00/23/2133',
-    'g/00/23/2140',
-    'g/00/23/2154',
-    'g/00/23/2155',
-    'g/00/23/2168',
-    'g/00/23/2169',
     'g/00/23/2171',
-    'g/00/23/2173',
-    'g/00/23/2176',
-    'g/00/23/2183',
-    'g/00/23/2189',
-    'g/00/23/2191',
-    'g/00/23/2201',
-    'g/00/23/2223',
-    'g/00/23/2224',
-    'g/00/23/2226',
-    'g/00/23/2235',
-    'g/00/23/2236',
-    'g/00/23/2237',
-    'g/00/23/2238',
-    'g/00/23/2241',
-    'g/00/23/2244',
     'g/00/23/2261',
-    'g/00/23/2266',
-    'g/00/23/2268',
-    'g/00/23/2274',
-    'g/00/23/2278',
-    'g/00/23/2281',
-    'g/00/23/2283',
-    'g/00/23/2284',
-    'g/00/23/2285',
-    'g/00/23/2287',
-    'g/00/23/2298',
-    'g/00/23/2318',
-    'g/00/23/2319',
-    'g/00/24/2014',
-    'g/00/24/2016',
-    'g/00/24/2019',
     'g/00/24/2023',
-    'g/00/24/2027',
-    'g/00/24/2032',
-    'g/00/24/2033',
-    'g/00/24/2036',
-    'g/00/25/0024',
-    'g/00/25/0026',
-    'g/00/26/0057',
-    'g/00/29/0002',
-    'g/01/25/0003',
-    'g/01/25/0005',
-    'g/01/25/0006',
-    'g/01/25/0007',
-    'g/01/25/0013',
-    'g/05/25/0004',
-    'g/05/25/0005',
     'g/05/25/0006',
-    'g/05/25/0007',
-    'g/13/25/0019',
-    'g/24/25/0002',
-    'g/d',
-    'g/gal',
-    'g0',
-    'g00d',
-    'g10n1',
-    'g11fo',
-    'g15',
-    'g17:g34',
-    'g2+',
-    'g200',
-    'g3s',
-    'g40\'s',
     'g4pa5',
-    'g5+',
-    'g650',
-    'g8+',
-    'g9z10',
-    'g=adrian',
-    'ga&euml;tan',
-    'ga-ry',
-    'ga5000',
-    'gaal',
-    'gaard',
-    'gaba-mediated',
-    'gabardan',
-    'gabb',
-    'gabbicci',
-    'gabbles',
     'gabbroic',
-    'gabbros',
-    'gabcikovo-nagym&aacute;ros',
-    'gabcikovo-nagymaros',
-    'gaberdines',
-    'gabhadh',
-    'gabiro',
-    'gaborit',
-    'gabricus',
-    'gabriel/spider',
-    'gaburri',
-    'gace',
-    'gaddum',
-    'gade',
-    'gadea',
-    'gadhafi',
     'gads',
-    'gaelic\'',
-    'gaelic-irish',
-    'gaelic-related',
-    'gaer',
-    'gaertner',
-    'gaesti',
-    'gaetan',
-    'gafah',
-    'gaganov',
-    'gagasan',
-    'gagauz-populated',
-    'gage/glos',
-    'gaggia',
-    'gaggings',
-    'gahrton',
     'gaidhealach',
-    'gaigeria',
-    'gaile',
-    'gaily-painted',
-    'gained.',
-    'gainsays',
-    'gaitered',
-    'gaitskellite',
-    'gaitskellites',
-    'gaj',
-    'gajah',
-    'gajic',
-    'gakki',
-    'gal&aacute;n',
-    'gal&aacute;pagos',
-    'gal&eacute;es',
     'gal&egrave;re',
-    'gal/min',
-    'gal4/atf1',
-    'galal',
-    'galambos',
-    'galantines',
-    'galashan',
-    'galatasary/20th',
-    'galathus',
-    'galatic',
-    'galaticca',
-    'galaxia',
-    'galbert',
-    'gale/neighbour',
-    'galeaspid',
-    'galeaspida',
     'galega',
-    'galehouse',
-    'galenson',
-    'galerida',
-    'galiaras',
-    'galiev',
-    'galingale',
-    'galland/gloucestershire',
-    'gallantries',
-    'gallery-graves',
-    'galles',
-    'gallet',
-    'galliano.',
-    'gallicanism',
-    'gallien-krueger',
-    'galligu',
     'gallinger',
-    'gallingly',
-    'gallo-belgic',
-    'gallocia',
-    'gallorum',
-    'gallovadians',
-    'gallovie',
-    'gallowhill',
-    'gallows-tree',
-    'galman',
-    'galp1',
-    'galper',
-    'galszecsy',
-    'galvani',
-    'galver',
-    'galwally',
     'galwegians',
-    'galy-dejean',
-    'gamahuche',
-    'gamalliyya',
-    'gamariel',
-    'gamatangium',
-    'gambaccini',
-    'gambas',
-    'gambeson',
-    'gambians',
-    'gamboa',
-    'game-based',
-    'game-birds',
-    'game-boy',
-    'game-crazy',
-    'game-fishing',
     'game-theoretic',
-    'game-viewing',
-    'game/ticket',
-    'gamekeeper-turned-poacher',
-    'gamel',
-    'gamelans',
-    'gameness',
-    'gameplayer',
-    'gamer',
-    'gamera',
-    'games-based',
-    'gamesplay',
-    'gamest',
-    'gametogenesis',
-    'gamma-aminobutyric',
-    'gamma-bhc',
     'gamma-linolenic',
-    'gamma/delta',
-    'gamma/ma',
-    'gammacounter',
-    'gammage',
-    'gammage/sacked',
-    'gammell',
-    'gammond',
-    'gamoroi',
-    'gamsabhavas',
-    'gancyclovir',
-    'gandale',
-    'gandavyuha',
-    'ganden',
-    'gander/national',
-    'gandhinagar',
     'gandia',
-    'gang-planks',
-    'gang-violence',
-    'gangbuddy',
-    'gangetic',
-    'gangplanks',
-    'gangraena',
-    'gani',
-    'ganic',
-    'ganley',
-    'gant',
-    'ganymed',
-    'gaoling',
-    'gap43',
-    'gapon',
-    'gara',
     'garamond',
-    'garay',
-    'garbling',
-    'garboldisham',
-    'garca',
-    'garching',
-    'garcia-villas',
-    'gardelli',
-    'garden-like',
-    'garden-wide',
-    'gardener-handyman',
-    'gardenias',
-    'gardenstore',
-    'gardes',
-    'gardezi',
-    'gardner/grower',
     'garf',
-    'garfi',
-    'garfish',
-    'garfoot',
-    'garga',
-    'garget/rspca',
-    'gargles',
-    'garhwal',
-    'garifuna',
-    'garimel',
-    'garishness',
-    'garisugan',
-    'garivald',
-    'garlicked',
-    'garlies',
-    'garmon',
     'garmston',
-    'garnant',
-    'garnard',
-    'garnes',
-    'garngad',
-    'garnon',
-    'garouste',
-    'garp',
-    'garraun',
-    'garraway/cirencester',
-    'garraway/newent',
-    'garraway/swindon',
-    'garraway/upper',
-    'garrett/berkeley',
-    'garrett/cheltenham',
-    'garrett/grendon',
     'garrett/minster',
-    'garrett/raf',
-    'garrett/thame',
-    'garrett/worcester',
-    'garridge',
-    'garrie',
-    'garrigan/environmental',
-    'garrot',
-    'garroway',
-    'garter/lace',
-    'garthamlock',
-    'garthdee',
-    'gartloch',
-    'garw',
-    'garz&oacute;n',
-    'garzon',
     'gas-',
-    'gas-condensing',
-    'gas-cooker',
-    'gas-fitter',
-    'gas-free',
-    'gas-oil',
-    'gas-poor',
-    'gas-related',
-    'gas-rings',
-    'gas-solid',
-    'gas/riba',
-    'gasana',
-    'gaseosa',
-    'gasfields',
-    'gasgoyne',
-    'gasified',
     'gasil',
-    'gaskell/orchid',
-    'gaslamp',
-    'gaslights',
-    'gaspare',
-    'gasparri',
-    'gaspers',
-    'gaspings',
-    'gasson/farmer',
-    'gastank',
-    'gastrintestinal',
-    'gastroenterostomy',
-    'gastroesophageal',
-    'gastropod-like',
-    'gastrospirillum',
-    'gastrotheca',
     'gaswarm',
-    'gate-array',
-    'gate-crash',
-    'gate-lodge',
-    'gate-money',
-    'gate-post',
-    'gate-posts',
-    'gatehouse/oxford',
-    'gateless',
-    'gateshead-whickham',
-    'gateside',
-    'gatey',
-    'gathas',
-    'gathurst',
-    'gatie',
-    'gatting-shakoor',
     'gattorugine',
-    'gauchely',
-    'gaucheries',
-    'gaucin',
-    'gaudies',
-    'gaufrage',
-    'gauge.',
-    'gaugers',
-    'gaujos',
-    'gaunt-looking',
-    'gausennae',
-    'gautrey',
-    'gavaghan',
-    'gavan',
-    'gavels',
-    'gavers',
     'gavine',
-    'gavins',
-    'gavle',
-    'gawayn',
-    'gawkers',
-    'gay-orientated',
-    'gay-rights',
-    'gayfere',
-    'gayfryd',
-    'gazana',
-    'gazanias',
-    'gazco',
-    'gazere',
-    'gazeteer',
-    'gazzara',
-    'gbassay',
     'gbegnon',
-    'gbr',
-    'gbytes',
-    'gc&ndash;1b',
-    'gc(gt)',
-    'gcgc',
-    'gcns-2000',
-    'gdcf',
-    'gdru',
-    'ge-',
-    'ge-7',
-    'ge-h',
-    'ge-rca',
-    'gearchanges',
-    'gearlever',
-    'geaves',
     'geb&auml;ude',
-    'gebhardt',
-    'gebr&uuml;der',
-    'gebre-kidan',
-    'gebze',
-    'gec/alsthom',
-    'gec/siemens',
-    'geckoes',
-    'gedges',
-    'gedney',
-    'gee-gees',
-    'gee-herter',
-    'gee-whizzers',
-    'geebro',
-    'geeky',
-    'geeley',
     'geff',
-    'geffrey',
-    'gefillte',
-    'gegam',
-    'gehlbach',
-    'gehler',
-    'gei',
-    'geilenkirchen',
-    'geilo',
-    'geishas',
-    'geistlicher',
-    'geistzone',
-    'geitonogamy',
-    'gekannt',
-    'gelantine',
-    'gelasius',
     'gelatinase',
-    'gelatinized',
-    'gelation',
-    'gelato',
-    'gelbfisz',
-    'geldzahler',
-    'gelee',
-    'gelestathis',
-    'gelfand',
-    'gelfer',
-    'gelineau',
-    'gelleman',
-    'gelles',
-    'gelnhausen',
-    'gelo',
-    'gem-encrusted',
     'gem-studded',
-    'gemeinen',
-    'gemeinn&uuml;tz',
-    'gemeinschaftswerk',
-    'gemert',
-    'gemo',
-    'gems/grid',
-    'genant',
-    'genci',
-    'gencod',
-    'gender-aware',
-    'gender-fair',
-    'gender-positioning',
-    'gender-relative',
-    'gendzhe',
-    'gene-altered',
     'gene-rich',
-    'gene/extended',
-    'geneamp',
-    'general-use',
-    'general/prison',
-    'generali',
-    'generalization-decrement',
-    'generall',
-    'generally-used',
-    'generals-at-sea',
-    'generatability',
-    'generations.',
-    'generelle',
-    'generous-mouthed',
-    'generous-sized',
-    'generous-spirited',
     'generously-sized',
-    'genesco',
-    'genet/carpentras',
-    'genetival',
-    'genetrix',
-    'genevish',
-    'genevive',
-    'genghiz',
-    'genia',
-    'genigraphics',
-    'genitalium',
-    'genitors',
-    'geniune',
-    'genlock',
-    'genning',
-    'genotype-phenotype',
     'genotypically',
-    'genro',
-    'genteelism',
-    'gentl',
-    'gently-bred',
-    'genug',
-    'geo-thermal',
-    'geobacter',
-    'geobotanical',
-    'geochronological',
-    'geochronometric',
-    'geodemographic/financial',
-    'geodesist',
-    'geodha',
-    'geoenvironmental',
-    'geofile',
     'geog.',
-    'geol',
-    'geologiques',
-    'geologisches',
-    'geometricians',
-    'geometry/simulated',
-    'geomicrobiology',
-    'geomorphologic',
-    'geopathic',
-    'geophagia',
-    'george&commat;uunet.uu.net',
-    'george-philip',
-    'georgemas',
-    'georges-michel',
-    'georgia-pacific',
-    'georgias',
     'georgievski',
-    'georgius',
-    'geosyncline',
-    'geosystem',
-    'geosystems',
-    'geothermally',
-    'geothermometry',
-    'geping',
-    'gerade',
-    'gerardine',
-    'gerbeaud',
-    'gerbini',
-    'gerbovics',
-    'gerdi',
-    'gereffi',
-    'gericht',
     'gerlinky',
-    'germ-free',
-    'germ-plasm',
-    'germ-ridden',
-    'german-british',
-    'german-czechoslovak',
-    'german-dominated',
-    'german-swiss',
-    'germaniae',
-    'germanica',
-    'germanicus',
-    'germanisches',
-    'germicide',
-    'germplasm',
-    'gernet',
-    'gerni',
     'gernon',
-    'gerolymates',
-    'geronticide',
-    'gerontologist',
-    'gerr',
-    'gershenberg',
-    'gershun',
-    'gertsch',
-    'gervis',
-    'geschichtlich',
-    'gesetz',
-    'gess',
-    'gessate',
-    'gessen',
-    'gestapu',
-    'gesticulatory',
     'gestis',
-    'get-overable',
-    'get-tough',
-    'get_in',
-    'getashen',
-    'getaways',
-    'getboundaries',
-    'gete',
-    'gething',
-    'gethwyn',
-    'getreidegasse',
-    'getsure',
-    'getting_a',
-    'geuntchev',
-    'geus',
-    'gewissian',
     'gewrgzrpbctpgqmckhfdbgw',
-    'geyer-ryan',
-    'geyikdagi',
-    'geysered',
-    'geysirs',
-    'gfa',
-    'gfp',
-    'gfs105',
-    'gfx',
-    'gg(at)',
-    'gg/cc',
-    'ggantija',
-    'ggfbg1',
-    'ggfbpp4',
-    'ggg',
-    'ghaith',
     'ghal',
-    'gharah',
-    'gharaib',
-    'gharazi',
-    'ghastliness',
-    'ghawar',
-    'ghayas',
-    'ghayoit',
-    'ghazi-ud-din',
-    'gheel',
-    'gheg',
-    'ghelle',
-    'gheorge',
-    'gherkin-eating',
-    'ghetto-like',
-    'ghettoblasters',
     'ghettogeddon',
-    'gheyn',
-    'ghillies',
-    'ghislanzoni',
-    'ghn-45',
-    'ghobhlach',
-    'ghofran',
-    'ghosheh',
-    'ghost-muster',
-    'ghost-writing',
-    'ghostlight',
-    'ghostwriter',
-    'ghotbzadeh',
-    'ghoulies',
-    'ghradhich',
-    'ghrib',
     'gi-normous',
-    'giacomettis',
-    'giacommetti',
-    'giamberti',
-    'gianakos',
-    'giancana',
-    'giangrande',
-    'giant-size',
-    'gianvittorio',
-    'gibbers',
-    'gibbs-di',
-    'gibby',
-    'giberellic',
-    'gibralter',
-    'gibreel',
-    'gibson-style',
     'gibsonesque',
-    'gideons',
-    'giegerich',
-    'giersberg',
-    'gierschik',
-    'gieskanne',
-    'gifford/oxfordshire',
-    'gifts.',
-    'giftshop',
-    'gig-cart',
-    'gig-goer',
-    'gig-goers',
-    'giganteum',
-    'gigantocypris',
-    'gigglingly',
-    'giggs/kelly',
     'gilad',
-    'gilbard',
-    'gilbart',
-    'gilberte',
-    'gilbertian',
-    'gilbrook',
-    'gildersleve',
-    'gildon',
-    'gilesgate',
-    'gilf',
-    'gilfachgoch',
-    'gilfellan',
-    'gilgal',
-    'gill-bearing',
-    'gill-netter',
-    'gillanders',
     'gillens',
-    'gillhaus',
-    'gilliane',
-    'gillied',
-    'gillying',
-    'gilnockie',
-    'gilonis',
-    'gilot',
-    'gilt-brass',
-    'gilt-copper',
-    'gilt-headed',
-    'gilvear',
-    'gimbal',
-    'gimbals',
-    'gimlett',
-    'gimma',
     'gimmsfile',
-    'gimo',
-    'gimsons',
-    'gin-and-tonics',
-    'gin-sodden',
-    'gin-traps',
-    'ginandjar',
-    'ginda',
-    'ginera',
-    'ginger-coloured',
-    'gingernuts',
-    'ginghams',
-    'gingival',
-    'gingko',
-    'ginguen&eacute',
-    'ginsburgh',
     'ginzberg',
-    'giocoso',
-    'giorante',
-    'giovinetta',
-    'gipsi',
-    'girandoles',
-    'girardi',
-    'giraudists',
-    'girbaud',
-    'girdlers',
-    'girl/boy',
-    'girlings',
-    'girny',
-    'girola',
-    'girona',
-    'girovend',
     'girven/chief',
-    'gispy',
-    'gissi',
-    'gite',
-    'gites',
-    'gitobu',
-    'gitson',
-    'gittell',
-    'gittes',
-    'gittinses',
-    'giubilo',
-    'giugiaro-designed',
-    'giugliano',
-    'giuliana',
-    'give-nothing-away',
-    'given-plus-new',
     'givest',
-    'gizehensis',
-    'gizenga',
-    'gizza',
-    'gizzard-stone',
-    'gizzard-stones',
-    'gjesteby',
-    'gjetost',
-    'gk2',
-    'gkm',
-    'gko',
-    'gl&amp;se',
-    'gl&oacute;in',
-    'gl&uuml;ck',
-    'gl&uuml;ckes',
-    'gl&uuml;cklichen',
     'gl1',
-    'gl5',
-    'glabbeeck',
-    'glac',
-    'glachan',
-    'glacio-eustatic',
-    'glaciofluvial',
-    'gladbach',
-    'gladius',
-    'gladman',
-    'gladsome',
-    'gladstonians',
-    'glagow',
-    'glammier',
-    'glamorizes',
-    'glamorous-looking',
     'glandarius',
-    'glangedden',
-    'glanmor',
-    'glanum',
-    'glanzel',
-    'glareanus',
-    'glareolus',
-    'glasbrook',
-    'glasbury',
-    'glasdale',
-    'glasfabrieken',
-    'glasgoing',
-    'glasgows',
-    'glasier/head',
-    'glasmeier',
-    'glass-blower',
     'glass-bottom',
-    'glass-cased',
-    'glass-encased',
-    'glass-forming',
-    'glass-framed',
-    'glass-headed',
-    'glass-houses',
-    'glass-shaded',
-    'glass-to-rubber',
-    'glasses.',
-    'glassiness',
-    'glassmann',
-    'glasson',
-    'glassrock',
-    'glasstown',
-    'glasswork',
     'glatton',
-    'glatzer',
-    'glaubenberg',
-    'glauce',
-    'glaukos',
-    'glava&scaron',
-    'glaven',
-    'glavisky',
-    'glavpu',
-    'glaydon',
-    'glayhome/labour',
-    'glayzer',
-    'glazounov',
-    'glb',
-    'glc-funded',
-    'gleamingly',
     'glegg',
-    'glenalina',
-    'glenbervie',
-    'glenborrodale',
-    'glenburvie',
-    'glencloud',
-    'glencombe',
-    'glencorse',
-    'glencot',
-    'glencoul',
-    'glencrown',
-    'glendee',
-    'glendoven',
-    'glenfarg',
-    'gleniffer',
-    'glenlyon',
     'glenne',
-    'glenochil',
-    'glenwherry',
-    'gli',
-    'gli3',
-    'gliadins',
-    'glickstein',
-    'glidden',
-    'glider-like',
-    'glider-producing',
-    'gliff',
-    'glims',
-    'gliomas',
-    'gliosis',
-    'glisters',
-    'glitterama',
     'glitziest',
-    'gloatingly',
-    'global-warming',
-    'globalism',
-    'globally-organised',
-    'globals',
-    'globe-shaped',
-    'globe.',
-    'globus',
-    'glockenspiels',
-    'glod',
-    'glogwog',
-    'glomerata',
-    'gloning',
-    'glonoin',
-    'gloo',
     'gloom-merchants',
-    'gloomsters',
-    'gloriae',
-    'gloriam',
-    'gloriosum',
-    'glosas',
-    'glossa',
-    'glossary/index',
-    'glossators',
-    'glostershire',
-    'gloucester/woodville',
-    'gloucestershire.',
-    'gloukhov',
-    'glounthane',
-    'glove-like',
-    'glove-making',
     'gloves-off',
-    'glow-globes',
-    'glu115',
-    'glu94',
-    'glucagon-29',
-    'glucksteins',
-    'gluconeogenesis',
-    'glucose-1-phosphate',
-    'glucoside',
-    'gluecks',
-    'glued-on',
-    'glugged',
-    'glugs',
-    'glum-looking',
-    'glummer',
-    'glurk',
     'glushko',
-    'glutamate-gated',
-    'glutamate-induced',
-    'glutamyl',
-    'glutaryl',
-    'gluteal',
-    'glutinosa',
-    'glycans',
-    'glycerides',
-    'glycerined',
-    'glycerophosphate',
-    'glyceryl',
-    'glyco',
-    'glycoalkaloids',
-    'glycocholic',
-    'glycolipid',
     'glycosaminoglycans',
-    'glycoside',
-    'glycyrrhetinic',
-    'glyde',
-    'glyn-jones',
-    'glyrm',
-    'gm&uuml;nd',
-    'gm.',
-    'gm4ta',
-    'gmaj7',
-    'gmg',
-    'gmrb',
-    'gnaa',
-    'gnadige',
-    'gnashrak',
-    'gnassingb&eacute',
     'gnathal',
-    'gnf',
-    'gnikomson',
-    'gnila-lipa',
-    'gnininvi',
-    'gnlf',
-    'gnma',
-    'gnolls',
-    'gnomon',
-    'gnosall',
-    'gnotobiotic',
-    'gnvq',
-    'go&rehy;fearing',
-    'go&ucirc;t',
-    'go-away',
-    'go-for',
     'go-getters',
-    'go-shopping(x)',
-    'go4',
-    'goal(s)',
-    'goal-achieving',
-    'goal-centred',
-    'goal-keeper',
-    'goal-maker',
-    'goal-mouths',
-    'goal-scorers',
-    'goal-starved',
-    'goal/subgoalconds',
-    'goalen',
-    'goaless',
-    'goallessly',
-    'goaround',
     'goat\'s-hair',
-    'goatish',
-    'goatsmilk',
-    'goatsucker',
-    'goaty',
-    'gobak',
-    'gobbledy-gook',
-    'gobbler',
-    'gobbly',
-    'gobelin',
-    'gobie',
-    'gobind',
-    'gobiodon',
-    'goblin-like',
-    'gobstoppers',
-    'gocar',
     'god-eyed',
-    'god-governed',
-    'god-inspired',
-    'god-is-with-us',
-    'god-killing',
-    'god-knows-what',
-    'god-manhood',
-    'god-parenthood',
-    'god-speed',
-    'godafoss',
-    'godah',
-    'godal',
-    'godby',
-    'godheads',
-    'godinot',
-    'godmen',
     'godoffe',
-    'godowsky',
-    'godrevy',
-    'godrey',
-    'godsell',
-    'godsent',
-    'godshill',
-    'godstar',
-    'godts',
-    'godwin/taxi',
-    'goedeke',
-    'goedendag',
-    'goesgen',
-    'goethe-institut',
-    'goethem',
-    'goettingen',
     'goff/ipms',
-    'goffe',
-    'gogolian',
-    'goh3',
-    'gohla',
-    'gohr',
-    'goi&aacute;s',
-    'goiesti',
-    'going\'',
-    'going-out',
-    'going-straight-up',
-    'goit',
-    'goitrous',
-    'gojam',
-    'gokbilgin',
-    'gokstad',
     'golac',
-    'golbourne',
-    'gold-blonde',
-    'gold-encrusted',
-    'gold-eyed',
-    'gold-hooped',
-    'gold-lined',
-    'gold-miners',
-    'gold-rich',
-    'gold-run',
-    'gold-sprayed',
-    'gold-tasselled',
-    'gold-wrapped',
-    'gold:will',
-    'goldbloom',
-    'golden-coloured',
     'golden-eyed',
-    'golden-limbed',
-    'golden-toned',
-    'goldenen',
-    'goldenhill',
-    'goldfarb',
-    'goldingham',
-    'goldman-eisler',
-    'goldmire',
-    'goldsithney',
-    'goldweiser',
-    'goldwin',
-    'goldwyns',
-    'golfech',
-    'golfed',
-    'golias',
     'golillas',
-    'golitsyn',
-    'gollies',
-    'golod',
-    'golson',
-    'golu',
-    'gom&aacute',
-    'gomakwe',
-    'gomango',
-    'gombeen',
-    'gombojav',
-    'gomina-pampali',
-    'gommes',
-    'gompertz-makeham',
-    'gonaditis',
-    'gonangulum',
     'gondolin',
-    'gondorian',
-    'gondorians',
-    'gone-tomorrow',
-    'gone/',
-    'gone_by',
-    'gonella',
-    'gonen',
-    'gong-zuo',
-    'gongless',
-    'gongola',
-    'gongsters',
-    'gongue',
-    'goni',
-    'goniatite',
-    'gonifei',
     'goniometers',
-    'gonk',
-    'gonopod',
-    'gonopods',
-    'gonzago',
-    'gonzoid',
-    'goober',
-    'goobey',
-    'gooch-atherton',
-    'gooches',
-    'goochs',
-    'good&rehy;natured',
-    'good-afternoon',
-    'good-evening',
-    'good-heartedness',
-    'good-tasting',
     'good-weather',
-    'good/evil',
-    'good/mother',
-    'good_as',
-    'good_deal',
-    'gooday',
-    'goodhart-rendel',
-    'goodharts',
-    'goodheart',
-    'goodhumouredly',
-    'goodies.sam',
-    'goodley',
-    'goodmanham',
-    'goodnaturedly',
-    'goodo',
-    'goodrich/herefordshire',
     'goodsell',
-    'goodshot',
-    'goodwin/bourton',
-    'goodwin/coleford',
-    'goodwin/dursley',
-    'goodwin/live',
-    'goodwin/malvern',
-    'goodwin/nailsworth',
-    'goodwin/sevenhampton',
-    'goodwin/staverton',
-    'goodwin/stroud',
-    'goodwyn',
-    'goofily',
-    'google-eyed',
-    'gooners',
-    'goos',
     'goose-flesh',
-    'goose-pimply',
-    'goosedown',
-    'goossen',
-    'gooth',
-    'goping',
-    'gor-asthma',
-    'goramy',
-    'gorbach',
-    'gorbi',
-    'gorbutt',
-    'gorbymania',
-    'gorchov',
-    'gordano',
-    'gordon-smith',
-    'gorffwysfa',
     'gorgeous-looking',
-    'gorgie-dalry',
-    'gorgoni',
-    'gorica',
-    'goriness',
-    'gorlais',
-    'gorley',
-    'gorman/manager',
-    'gormann',
-    'gormans',
-    'gormec',
-    'gornall/nuclear',
-    'gornyi',
-    'gorriti',
-    'gorse-bush',
-    'gorseinon',
     'gorsky',
-    'gortdrum',
-    'gortin',
-    'gosbecks',
-    'gosev',
-    'goshtasby',
-    'gosizdat',
-    'gosling/swindon',
-    'goss-custard',
-    'gosselin',
-    'gossip-column',
-    'gossip-columnist',
-    'gossip.',
-    'gossipmongers',
-    'gossippy',
-    'gossman',
     'gostner',
-    'gosub/goto',
-    'gosville',
-    'goswick',
-    'got_in',
-    'gotein',
-    'gothberg',
-    'gothdom',
-    'gothic-ness',
-    'gotoda',
-    'gotohs',
-    'gotsmanov',
-    'gottberg',
-    'gotter',
-    'gotthelf',
-    'gottonam',
     'gotzis',
-    'gouch',
-    'gouchos',
-    'goude',
-    'goudhurst',
-    'gouesnou',
-    'gouffres',
-    'gouk',
-    'gould-jacobs',
-    'goulstonian',
-    'goumeziane',
-    'gour&eacute',
-    'gourad',
-    'gouta',
-    'goutama',
-    'goutier',
     'govenor',
-    'governale',
-    'government&gt',
-    'government-assisted',
-    'government-endorsed',
-    'government-induced',
-    'government-mediated',
-    'government-organised',
-    'government-paid',
-    'government-recognised',
-    'government-set',
-    'government-subsidised',
-    'government-unita',
-    'government/building',
-    'government/industry',
-    'government/private',
     'governor-training',
-    'governors.',
-    'gowell',
-    'gowhari',
-    'gowla',
-    'gowland',
-    'goyave',
-    'gozani',
-    'gozd',
-    'gozzer',
-    'gp.capt',
-    'gp16',
-    'gp41',
-    'gpmu',
-    'gps/pes',
-    'gptelecom',
     'gqoza',
-    'gr&auml;fin',
-    'gr&eacute;ng',
-    'gr&egrave;ve',
-    'gr&iacute;msson',
-    'gr&lsqb;ace&rsqb',
-    'gr&ouml;na',
-    'gr&ouml;nsund',
-    'gr&ouml;ting',
-    'gr&uuml;n',
-    'gr-1\'s',
-    'gr1',
-    'gr700',
-    'gra&ccaron;anica',
-    'gra&ccedil;ay',
-    'grab-rail',
     'grabauskas',
-    'grabbable',
-    'grabens',
-    'grabke',
-    'graca',
-    'gracchan',
-    'grace.',
-    'gracecourt',
-    'gracelands',
-    'gracemount',
-    'gracieusement',
-    'graddon',
-    'grade&amp;sup4',
-    'grade-one',
-    'grade/certificate',
-    'grade/higher',
     'graded-test',
-    'graded-up',
-    'grades-only',
-    'grades.',
-    'gradiska',
-    'graduand',
-    'graf/seles',
-    'graffenreid',
-    'graffin',
-    'graffunder',
-    'grafiche',
-    'graft-coated',
-    'graft-hammond',
-    'grafters',
-    'graftings',
-    'graha',
     'graham-scott/reporting',
-    'grahams/',
-    'grahamston',
-    'grahl',
-    'graigueconna',
-    'grailly',
-    'grain-boundaries',
-    'grain-collecting',
-    'grain-like',
-    'grain-short',
-    'grain-to-grain',
-    'grais',
-    'gralam',
-    'gramajo',
-    'gramercy',
-    'gramm.',
     'grammar-schools',
-    'grammar-secondary',
-    'grammatical/ungrammatical',
-    'grammaticalize',
-    'grampuses',
-    'granapathy',
-    'granatensis',
-    'granchester',
-    'grancourt',
-    'grand&rehy;children',
-    'grand-dad',
-    'grand-looking',
-    'grandbabies',
-    'grandfathering',
-    'grandfatherly',
-    'grandisson',
     'grandlady',
-    'grandmotherhood',
-    'grandways',
-    'granet',
-    'grania',
-    'granic',
-    'granikos',
-    'granite-greenstone',
-    'granite-hard',
-    'granite-related',
-    'granleese',
-    'granpa.',
-    'grant-funded',
-    'grant/cancel',
-    'grantisek',
-    'grantown-on-spey',
     'granulator',
-    'granulosis',
-    'grape-picking',
-    'grape-pip',
-    'grapeyness',
-    'graphical-based',
-    'graphically-based',
-    'graphologists',
-    'grapplers',
-    'grass-blade',
-    'grass-box',
-    'grass-stained',
-    'grass-stems',
-    'grass-tempered',
-    'grasscutter',
-    'grassland/moor',
     'grassley',
-    'grateful.',
-    'gratefulness',
-    'gratzler',
-    'graub&uuml;nden',
-    'graubner',
-    'grauen',
-    'grauer',
-    'grave\'',
-    'grave-stones',
-    'gravegoods',
-    'gravel-strewn',
-    'graveolens',
-    'gravers',
-    'graveson',
-    'gravia',
     'gravicembalo',
-    'gravity-the',
-    'gravograph',
-    'gray-green',
-    'gray-scale',
-    'graydons',
-    'grayrigg',
-    'grazioso',
-    'grazza',
-    'grbac',
-    'grd',
-    'grease-proof',
-    'grease-resistant',
-    'greaseless',
-    'greasepaints',
-    'greasy-haired',
     'greasy-looking',
-    'great-britain',
-    'great-great-grandfather\'s',
-    'great/bow',
-    'great_deal',
-    'greatfully',
-    'greatley',
-    'greboes',
-    'grebos',
-    'grece',
-    'grecians',
-    'greco-macedonians',
-    'greed-is-good',
-    'greek-american',
-    'greek-born',
-    'greek-flag',
     'greek-registered',
-    'greek-yugoslav',
-    'green-and-blue',
-    'green-and-yellow',
-    'green-banded',
-    'green-blazered',
-    'green-coloured',
-    'green-flecked',
-    'green-form',
-    'green-grocer',
-    'green-haired',
-    'green-leafed',
-    'green-leaved',
-    'green-minded',
-    'green-ruled',
-    'green-shaded',
     'green-stained',
-    'green-thinking',
-    'green-winged',
-    'green/animal',
-    'green/brown',
-    'green/gloucester',
-    'green/white',
-    'greenacres',
-    'greenbury',
-    'greencliffe',
-    'greenery-yallery',
-    'greeness',
-    'greenflies',
-    'greengates',
-    'greenglass',
-    'greenhills',
     'greenhouse-plus-solar',
-    'greenish-black',
-    'greenish-grey',
-    'greenish-white',
-    'greenjackets',
-    'greenlake',
-    'greens/alliance',
-    'greens/new',
-    'greensands',
-    'greenset',
-    'greenshank-like',
-    'greenshires',
-    'greensman',
-    'greensmith',
-    'greenson',
-    'greenstiles',
     'greenswards',
-    'greensword',
-    'greenteeth',
-    'greenweld',
-    'greenwode',
-    'greeny-white',
-    'greer/rhoades',
-    'gregorevitch',
-    'gregory-smith',
-    'gregsbury',
-    'greig/',
-    'greig/commanding',
-    'greigg',
-    'greigh',
-    'greimassian',
-    'greisen',
     'greiter',
-    'greivances',
-    'grell',
-    'grenadan',
-    'grenade-throwing',
-    'grenadian',
-    'grendon-type',
-    'grene',
-    'grenelle',
-    'grenzen',
-    'gretzer',
-    'grevillius',
-    'grey&rehy;haired',
-    'grey-and-white',
-    'grey-blues',
-    'grey-flecked',
     'grey-leaved',
-    'grey-levels',
-    'grey-quilted',
-    'grey-scaling',
-    'grey-speckled',
-    'grey-stoned',
-    'grey-suits',
-    'grey-tone',
-    'grey-violet',
-    'grey/black',
-    'grey/blue',
-    'greyabbey',
-    'greyhen',
-    'greyish-buff',
-    'greyish-yellow',
-    'greymouth',
     'greyseed',
-    'grgur',
-    'grh',
-    'gribba',
-    'griegson',
-    'grien',
-    'griesheim',
-    'grievingly',
-    'grievious',
-    'griew',
-    'griffing',
-    'griffith-edwards',
-    'griffith-joyner',
-    'griffoun',
-    'griga',
-    'grigg-skjellerup',
     'grigoriu',
-    'grikitis',
-    'grim-visaged',
-    'grimestone',
-    'grimily',
-    'griminish',
-    'grimond/who',
-    'grimpeur',
-    'grimsbury',
-    'grimsdell',
-    'grimsel',
-    'grimstad',
-    'grimy-faced',
-    'grinch',
-    'grindale',
-    'grindle',
     'gringaud',
-    'grinned.',
-    'grinnets',
-    'grinrod',
-    'grinten',
-    'griots',
-    'griphopithecus',
-    'grippy',
-    'grisby',
-    'grisenthwaite',
-    'grisettes',
-    'griseum',
-    'grisha',
-    'grishenko',
-    'gritstones',
-    'grittar',
     'gritten',
-    'griz',
-    'grizzle-chinned',
-    'groanings',
-    'groch&oacute;w',
-    'groeling',
-    'groeneweg',
-    'grollman',
-    'gromphing',
-    'gronet',
-    'groningen/holland',
-    'groody',
-    'groom-to-be',
-    'groove-billed',
-    'grooviest',
-    'grosbeak',
     'grosche',
-    'groser',
-    'groses',
-    'grospierre',
-    'grossed-up',
-    'grosskurth',
-    'grosvenor-myer',
-    'grotewohlstrasse',
-    'grouches',
-    'ground-base',
-    'ground-bass',
-    'ground-control',
-    'ground-covering',
-    'ground-elder',
-    'ground-in',
-    'ground-loop',
     'ground-nests',
-    'ground-nut',
-    'ground-run',
-    'ground-skim',
-    'ground-storey',
-    'ground-strokes',
-    'ground-swell',
-    'ground-to-ground',
-    'groundcover',
-    'groundfall',
-    'groundlings',
-    'groundsperson',
-    'groundstar',
-    'group-administered',
-    'group-frequency',
-    'group-mean',
     'group-specific',
-    'group-think',
-    'group-work',
-    'group/average',
-    'groupuscule',
-    'groupwide',
-    'groveley',
-    'grovels',
-    'grovely',
-    'growarm',
-    'growcott',
-    'growin\'',
-    'growing-pains',
-    'grown-on',
-    'growth-regulatory',
-    'growth-seeking',
     'grrrrrrr',
-    'grubby-looking',
-    'gruberova',
-    'grudgingness',
-    'gruer/drugs',
-    'gruesomeness',
-    'gruffest',
-    'grumbar',
-    'grumbla',
-    'grumblingly',
-    'grumbly',
-    'grummidge',
-    'grumpies',
-    'grumping',
-    'grunau',
-    'grundgesetz',
     'grunewaldt',
-    'grunge-pop',
-    'grunion',
-    'grunox',
-    'grunpeter',
-    'grunstedt',
-    'gruntes',
-    'gruntings',
-    'grunwell',
-    'grupes',
-    'grurgh',
-    'gruter',
-    'grwp',
-    'grwyne',
-    'grylle',
-    'gryphites',
     'grzimek',
-    'gs(r)',
-    'gs-1',
-    'gsc',
-    'gsd',
-    'gsfg',
-    'gstrein',
-    'gt-four',
-    'gt10',
-    'gt1008',
-    'gt120',
-    'gt3',
-    'gt4e',
-    'gtpase-activating',
-    'gu&eacute;rini&egrave;re',
-    'gu17',
     'gu26',
-    'gu31',
-    'gu32',
-    'gu6',
-    'guaiac',
-    'guajajara',
-    'guala',
-    'guaran',
-    'guaran&iacute;s',
-    'guard-chain',
-    'guard-dogs',
-    'guard-ring',
-    'guard-rooms',
-    'guardianws21',
-    'guardin\'',
-    'guardini',
     'guardpost',
-    'guardships',
-    'guare',
-    'guarentee',
-    'guarneri',
-    'guatiza',
-    'guaviare',
-    'guayas',
-    'gubaidulina',
-    'guca',
-    'guckenheimer',
-    'gudbartsson',
-    'gudham',
-    'gudmundur',
-    'gue&iuml',
-    'guedalla',
     'gueho',
-    'guei',
-    'guelders',
-    'guelff',
-    'guenever',
-    'guepaje-1',
-    'guerande',
-    'guerard',
-    'gueridon',
-    'guerilleros',
-    'guerrilla-type',
-    'guesser',
-    'guesstimated',
-    'guest-rooms',
-    'guestimated',
-    'guestrooms',
     'guet',
-    'guetaria',
-    'guggisberg',
-    'guh',
-    'guicciardini',
-    'guiccioli',
-    'guidence',
-    'guilandina',
-    'guild-houses',
-    'guildhouse',
-    'guildon',
-    'guilherme',
-    'guillermoprieto',
-    'guillim',
-    'guilloux',
-    'guilmant',
     'guilt-complex',
-    'guilt-feeling',
-    'guilt-stained',
-    'guiltier',
-    'guiltlessly',
-    'guimard',
-    'guin&eacute;en',
-    'guinea-worm',
-    'guinnessness',
-    'guirlande',
-    'guisasola',
-    'guise/milton',
-    'guised',
-    'guiseppi',
-    'guisers',
-    'guitar-band',
     'guitar-buying',
-    'guitar-maker',
-    'guitar-slashing',
-    'guitar-strummers',
-    'guitar-to-midi',
-    'guitar/bass/drums',
-    'guizers',
-    'gujeratis',
-    'gujranwala',
-    'gular',
-    'guldescu',
-    'guldgubber',
-    'guled',
-    'gulfstreams',
-    'gullan',
-    'gullibly',
     'gulliford',
-    'gulph',
-    'gultekin',
-    'gum-boots',
-    'guman',
-    'gummata',
-    'gummed-up',
-    'gummett',
-    'gumnuts',
-    'gumph',
-    'gumshields',
-    'gun-dogs',
-    'gun-free',
-    'gun-happy',
-    'gun-like',
-    'gun-loops',
     'gun-slinging',
-    'gun-towers',
-    'gun-wielding',
-    'gunar',
-    'gunas',
-    'gunbattle',
-    'gundana',
-    'gundappa',
-    'gunder',
-    'gunderson',
-    'gundioc',
-    'gunging',
-    'gungrog',
-    'gunless',
-    'gunnislake',
-    'gunnlaug',
     'gunplay',
-    'gunport',
-    'gunsels',
-    'gunshops',
-    'gunston',
-    'gunstones',
-    'gunville',
-    'gunwhales',
-    'gurevich',
-    'gurls',
-    'gurnam',
-    'gursky',
-    'gurtnellen',
-    'gurtner',
-    'gurungs',
-    'gurupadasamy',
     'gussage',
-    'gussied',
-    'gustavia',
-    'gustavson',
-    'gustiness',
-    'gut-men',
-    'gutch',
-    'gutenburg',
-    'guthries',
-    'gutman',
-    'guto',
-    'gutshot',
-    'gutsiness',
-    'gutsunaev',
-    'gutterpress',
-    'guttierrez',
     'guy-ropes',
-    'guye',
-    'guyer',
-    'guyser',
-    'guyton',
-    'guzzardi',
-    'gventsadze',
-    'gvm',
-    'gvp',
-    'gwartheg',
-    'gwasg',
-    'gweebarra',
-    'gwenlais',
-    'gwentoys',
-    'gweras',
-    'gweru',
     'gwinear',
-    'gwinnell',
-    'gwm/mar/cmg',
-    'gwyndaf',
-    'gwynned',
-    'gxf5',
-    'gxh6',
-    'gxplus',
-    'gy&ouml;rivanyi',
-    'gyaain',
-    'gylmin',
-    'gym-instructress',
-    'gym-shoe',
-    'gym-slip',
-    'gymcrak',
-    'gymi',
     'gyminsky',
-    'gymnastik',
-    'gymnastiorka',
-    'gymnogeophagus',
-    'gymslips',
-    'gynaecophobic',
-    'gynlecology',
-    'gyor',
-    'gyori',
-    'gypoc',
-    'gyps',
-    'gyro-jet',
-    'gyrodactylus',
-    'gyrovap',
-    'gyttja',
-    'gyulai',
     'gzira',
-    'h&aacute;0m',
-    'h&amp;i',
-    'h&amp;s',
-    'h&auml;nsel',
-    'h&auml;uer',
-    'h&eacute;0rakleitos',
-    'h&eacute;b&eacute',
-    'h&eacute;l&eacute;ne',
-    'h&eacute;ra',
-    'h&infin',
-    'h&oacute;0ken',
-    'h&oslash;lmur',
-    'h&ouml;ckelmann',
-    'h&ouml;dicke',
-    'h&uuml;ber',
     'h&uuml;ppi',
-    'h&uuml;sn&uuml',
-    'h-7',
-    'h-nf-l',
-    'h-test',
-    'h.1',
-    'h.3',
-    'h.320',
-    'h.50',
-    'h.bl.',
-    'h.c.l.',
-    'h.l',
-    'h.o.claims',
-    'h.s.o.',
-    'h.w.r.',
-    'h/',
     'h/00/23/2059',
-    'h/02/28/0001-1',
-    'h/04/25/0001',
-    'h/08/26/0001',
-    'h/08/26/0003',
-    'h/504/28/5004',
-    'h/504/28/5006',
-    'h/505/25/5015',
-    'h/505/25/5016',
-    'h/519/25/5002',
-    'h/519/25/5006',
-    'h/519/25/5016',
-    'h/ez',
-    'h03',
-    'h12',
-    'h146',
     'h197f',
-    'h197s',
-    'h197y',
-    'h1t',
-    'h2\'',
-    'h2-receptors',
-    'h26',
-    'h2i',
-    'h2x',
-    'h3\'s',
-    'h3+',
-    'h375',
-    'h3g',
-    'h4+',
-    'h5+',
-    'h50',
     'h710',
-    'h9',
-    'ha&iuml;tians',
-    'ha&ndash;e',
-    'ha&scaron;talsk&aacute',
-    'ha\'p',
-    'ha-2-specific',
-    'ha-alt',
-    'ha/cow',
-    'ha/lam',
-    'ha1',
-    'haakonshalle',
-    'haaretz',
-    'habar',
-    'habendum',
-    'habermas-like',
     'habeshaw',
-    'habitats.',
-    'habitu&eacute;e',
-    'habituating',
-    'habituation-dishabituation',
-    'habitudes',
-    'habron',
-    'habs',
-    'haccent',
-    'hackbut',
-    'hackel',
-    'hackerhood',
-    'hackford',
-    'hacksawing',
-    'hacksters',
-    'had-had',
     'hadert',
-    'hadingham',
-    'hadithah',
-    'hadjipapas',
-    'hadlington',
-    'hadri',
-    'hadrien',
-    'hadspen',
-    'hadwick',
-    'hadzic',
-    'hadzimuratovic',
-    'haegen',
-    'haemastamen',
-    'haematologic',
-    'haematologists',
-    'haematomas',
     'haemochromatosis',
-    'haemocyanin',
-    'haemocytes',
-    'haemoglobin/urea',
-    'haemoglobinopathies',
-    'haemoperfusion',
-    'haemoperitoneum',
-    'haemorrage',
-    'haemorrhagica',
-    'haerne',
-    'hafi',
-    'hafsa',
-    'haftanin',
-    'hafts',
-    'hag-like',
-    'hagaman',
     'hagedoorn',
-    'hagiology',
-    'haglelgam',
-    'hagwitch',
-    'hahahaha',
-    'hahs',
-    'hahtalekin',
-    'haig-simons',
-    'haigus',
-    'hailers',
-    'hailes/baberton',
-    'hailey/oxfordshire',
-    'haileywood',
-    'haina',
-    'hainaulter',
-    'hainaulters',
     'hainer',
-    'haino',
-    'hainsworth',
-    'hair-brained',
-    'hair-cuts',
-    'hair-dryers',
-    'hair-pins',
-    'hair-pulling',
-    'hair-raisingly',
-    'hair-ribbons',
-    'hair-sprays',
-    'haira',
-    'haircurlers',
-    'haircutter',
-    'hairgrass',
-    'hairiest',
     'hairily',
-    'hairshafts',
-    'haixing',
-    'hajdari',
-    'hajnal',
-    'hajo',
-    'hakas',
-    'hakim-dowek',
-    'hakin',
-    'hakodate',
-    'hakucho',
-    'hakwai',
-    'halabi',
-    'halation',
-    'haldenne',
-    'haldir',
     'hales/organizer',
-    'half\'n\'half',
-    'half-a-pint',
-    'half-acceptance',
-    'half-and-halfs',
-    'half-angry',
-    'half-anhour',
-    'half-animal',
-    'half-annoyed',
-    'half-apprehended',
-    'half-arab',
-    'half-arsed',
-    'half-asphyxiated',
-    'half-bald',
-    'half-bats',
-    'half-beasts',
     'half-believing',
-    'half-bent',
-    'half-blocked',
-    'half-breeds',
-    'half-calf',
-    'half-canopy',
-    'half-canton',
-    'half-chance',
-    'half-civilian',
-    'half-classes',
-    'half-clothed',
-    'half-collars',
-    'half-constructed',
-    'half-consumed',
-    'half-converted',
-    'half-crawled',
     'half-curtsey',
-    'half-dazed',
-    'half-decade',
-    'half-destroyed',
-    'half-divine',
-    'half-done',
-    'half-doors',
-    'half-down',
-    'half-enmeshed',
-    'half-equations',
-    'half-erect',
-    'half-exposed',
-    'half-falling',
-    'half-fat',
-    'half-fearful',
-    'half-fed',
     'half-fields',
-    'half-flooded',
-    'half-flowers',
-    'half-foot',
-    'half-forward',
-    'half-gipsy',
-    'half-gnawed',
-    'half-grin',
-    'half-halts',
-    'half-hanged',
-    'half-holidays',
-    'half-hooded',
-    'half-hoped',
-    'half-humans',
-    'half-intermitted',
-    'half-ish',
     'half-jewish',
-    'half-knowledge',
-    'half-learned',
-    'half-lies',
-    'half-lights',
-    'half-listen',
-    'half-lost',
-    'half-military',
-    'half-obliterated',
-    'half-panelled',
-    'half-peace',
-    'half-pig',
-    'half-portuguese',
-    'half-post',
-    'half-ran',
-    'half-rations',
     'half-reading',
-    'half-repeat',
-    'half-ripe',
-    'half-scandalized',
-    'half-scared',
-    'half-shadows',
-    'half-shameful',
-    'half-sings',
-    'half-slopes',
-    'half-smiles',
-    'half-split',
-    'half-standards',
-    'half-stewed',
-    'half-stifled',
-    'half-stunned',
-    'half-tamed',
     'half-termly',
-    'half-terrified',
-    'half-through',
-    'half-tide',
-    'half-to-death',
-    'half-tracks',
-    'half-truthfully',
-    'half-uncle',
-    'half-veiled',
-    'half-volleys',
-    'half-watching',
-    'half-woke',
-    'half-world',
-    'half-yardland',
-    'half-yardlanders',
-    'halfboard',
     'halfbred',
-    'halfbreed',
-    'halfen',
-    'halflight',
-    'halfmoon',
-    'halfpicvals',
-    'halftimbered',
-    'halimi',
-    'halites',
-    'hall-craggs',
-    'hall-like',
-    'hall-way',
-    'hall/neighbour',
-    'hall/prison',
-    'hall/supporter',
-    'halla',
     'hallaj',
-    'halland',
-    'halldane',
-    'hallen',
-    'haller',
-    'hallerton',
-    'hallet',
-    'hallez',
-    'halliburton',
-    'hallie',
-    'hallonquist',
-    'halloos',
-    'halloun',
-    'hallowe',
-    'hallowing',
-    'hallsteads',
     'halmore',
-    'halocarbons',
-    'halogenation',
-    'halon-free',
-    'halophilic',
-    'halophytes',
-    'halorella',
-    'halprin',
-    'halsam',
-    'halsnead',
-    'halsynge',
-    'halvard/scandinavian',
-    'halys',
-    'ham-like',
-    'ham-sized',
-    'hamadans',
     'hamadjoda',
-    'hamadrayas',
-    'hamalainen',
-    'hamanaka',
-    'hambledown',
-    'hambrook',
-    'hamburg-amerika',
-    'hamburg-bremen',
-    'hamburgh',
-    'hameln',
-    'hamen',
-    'hameni',
-    'hamerow',
-    'hamers',
-    'hamiraya',
-    'hamito-semitic',
     'hamlet/mobile',
-    'hamma',
-    'hammamet',
-    'hammer-beamed',
-    'hammer-beams',
-    'hammer-wielding',
-    'hammered-glass',
-    'hammerers',
-    'hammershus',
-    'hammersmith-born',
-    'hammes',
-    'hammons',
-    'hamn&ouml;y',
-    'hamningberg',
-    'hamour',
-    'hampreston',
     'hamsell',
-    'hamsher',
-    'hamsteels',
-    'hamula.',
-    'hamworth',
-    'hanafi',
-    'hanah',
-    'hanck',
-    'hand\'',
-    'hand\'s-breadth',
-    'hand-antiqued',
-    'hand-baked',
-    'hand-beaded',
-    'hand-bells',
-    'hand-brush',
-    'hand-chiselled',
     'hand-claps',
-    'hand-compositors',
-    'hand-crank',
-    'hand-cranked',
-    'hand-crocheted',
-    'hand-decorated',
-    'hand-dyed',
-    'hand-fashioned',
-    'hand-fed',
-    'hand-finished',
-    'hand-forged',
-    'hand-gilded',
-    'hand-ground',
-    'hand-hot',
-    'hand-in',
-    'hand-knitting',
     'hand-maiden',
-    'hand-netting',
-    'hand-pick',
-    'hand-pleated',
-    'hand-pollinated',
-    'hand-prepared',
-    'hand-pulled',
-    'hand-pumped',
-    'hand-pumps',
-    'hand-rails',
-    'hand-riven',
-    'hand-scrawled',
-    'hand-transcribed',
-    'hand-tuned',
-    'hand-waxed',
-    'handbagging',
     'handberg',
-    'handbuch',
-    'handcuffing',
-    'handels-',
-    'handelsbanken',
-    'handelsh&oslash;yskolen',
-    'handersho/jkolen',
-    'handicraftsmen',
-    'handing-over',
-    'handjam',
-    'handlable',
-    'handled.',
-    'handley/rush',
-    'handlings',
-    'handpieces',
-    'handprinting',
     'handran',
-    'hands-free',
-    'hands-heart',
-    'handsome-looking',
-    'handsprings',
-    'handwaving',
-    'handweapon',
-    'handweavers',
-    'handwritings',
-    'handy-sized',
-    'handywork',
-    'handzeichnungen',
-    'hanena',
-    'hang-overs',
-    'hang_ups',
-    'hangchow',
     'hangl',
-    'hanglands',
-    'hangup',
-    'hangups',
-    'hangwoman',
-    'haniffa',
-    'haniffah',
-    'hanike',
-    'hank-from-texas',
-    'hanniford',
-    'hannon-trained',
-    'hannovers',
-    'hans-dieter',
-    'hans-georg',
-    'hans-heinrich',
-    'hans-j&uuml;rgen',
     'hans-jurgen',
-    'hanseatic-goethe',
-    'hansen-tangen',
-    'hansford/british',
-    'hanslickian',
-    'hansmann',
-    'hansoms',
-    'hantan',
-    'hanthorpe',
-    'hanumanthacharya',
-    'haole',
-    'haotian',
-    'hapil',
-    'haplodiploid',
-    'hapned',
-    'happa',
     'happens.',
-    'happenstances',
-    'happenstiel-imhausen',
-    'happiness.',
-    'happinesses',
-    'happy-birthday',
-    'happy-family',
-    'happyland',
-    'hapunda',
-    'haraldschultzi',
-    'haramaya',
-    'harbat/department',
-    'harberd',
-    'harbey',
-    'harbour-front',
-    'harbour-master',
     'harchand',
-    'harcum',
-    'hard\'un',
-    'hard-arsed',
-    'hard-as-nails',
-    'hard-assed',
-    'hard-baked',
-    'hard-class',
-    'hard-fruit',
-    'hard-held',
-    'hard-learned',
-    'hard-men',
-    'hard-put',
-    'hard-right',
-    'hard-rocking',
-    'hard-shelled',
     'hard-skin',
-    'hard-soft',
-    'hard-standing',
-    'hard-to',
-    'hard-to-build',
-    'hard-to-define',
-    'hard-to-employ',
-    'hard-to-heat',
-    'hard-to-place',
-    'hard-ware',
-    'hard-water',
-    'hard-wire',
-    'hard-worker',
-    'hard/porous',
-    'hardan',
-    'harde',
     'hardelot',
-    'harder-edged',
-    'hardgill',
-    'hardgills',
-    'hardhats',
-    'hardhill',
-    'harding-jones',
-    'hardingham',
-    'hardman/chairman',
-    'hardstaff',
-    'hardware-accelerated',
-    'hardware-image',
-    'hardware-software-services',
-    'hardwari',
-    'hardwick/gloucestershire',
-    'hardy-weinberg',
     'hardyck',
-    'hardyesque',
-    'haredale',
-    'harefields',
-    'hareing',
-    'hareless',
-    'harem-forming',
-    'harewood-benn',
-    'hargie',
-    'hargrove',
-    'haribo',
-    'haridi',
-    'hariram',
-    'harkens',
-    'harkins',
-    'harkishan',
     'harknett',
-    'harlands',
-    'harleing',
-    'harlemations',
-    'harlequinade',
-    'harlescott',
-    'harlestone',
-    'harlev',
-    'harley/supersight',
-    'harlingen',
-    'harlley',
-    'harlotrye',
-    'harlston',
-    'harm-to-others',
-    'harmfulness',
-    'harmonograph',
     'harmostatic',
-    'harmsen',
-    'harnad',
-    'harnal',
-    'harnett',
-    'harnik',
-    'harold/herefordshire',
-    'harome',
-    'haroon',
-    'harperrig',
-    'harpley',
-    'harpo/',
-    'harpsichordists',
-    'harpy-bat',
-    'harrachov',
-    'harran',
     'harrap-columbus',
-    'harrass',
-    'harrassment.',
-    'harrell-bond',
-    'harri-augstein',
-    'harriets',
-    'harrington/bomber',
-    'harringworth',
-    'harriott',
-    'harrison-hall',
-    'harrison-towns',
-    'harristown',
-    'harron',
-    'harronson',
-    'harrowside',
-    'harryhorse',
     'harrys',
-    'harscheisen',
-    'harsh-sounding',
-    'harshman',
-    'hart\'s-tongue',
-    'harta',
-    'hartebeeste',
-    'hartforth',
-    'hartig',
-    'hartkes',
-    'hartley-harrington',
-    'hartnellisms',
-    'hartshorn/buckinghamshire',
-    'hartshorne/cellmark',
-    'hartson',
-    'hartt',
     'hartvell',
-    'hartwith',
-    'hartwood',
-    'harun',
-    'harv',
-    'harvard-educated',
-    'harveian',
-    'harvey-beaumont',
-    'harvey/telus',
-    'harvie-watt',
-    'harvin',
-    'harwich-zeebrugge',
-    'has.7',
-    'hasanov',
-    'hasbrouck',
-    'hashan',
     'hasher',
-    'hashi',
-    'hashishi',
-    'hashishoni',
-    'hask',
-    'haslegrave',
-    'haslop',
-    'hassanein',
-    'hassaniya',
-    'hassaniyeh',
-    'hasse',
-    'hassleholm',
-    'hastata',
-    'hastings/woodville',
-    'hasve',
-    'hat\'',
     'hat-and-coat',
-    'hat-band',
-    'hat-makers',
-    'hatch-door',
-    'hatchetman',
-    'hatecke',
-    'hatecore',
-    'hatef',
-    'hatfields',
-    'hathaways',
-    'hatherell',
-    'hathorne',
-    'hatibzade',
-    'hatice',
-    'hatoyama',
-    'hatstands',
     'hatstop',
-    'hattum',
-    'hatu-lia',
-    'hauck',
-    'haud&eacute',
-    'haudromont',
-    'haugensund',
-    'haughley',
-    'haughtiest',
-    'haulling',
-    'haumont',
-    'haunter',
-    'hausclau',
-    'hausiku',
-    'haustorial',
-    'haut-rhin',
     'hautboy',
-    'hautboys',
-    'hauteville',
-    'hauton',
-    'hava',
-    'have-been',
-    'have-not',
-    'have_at',
-    'havelis',
-    'havelock-allan',
-    'havelock-allen',
-    'haveman',
-    'havemann',
-    'havenots',
-    'havercroft',
-    'havern',
     'haveron',
-    'haveron/thames',
-    'haversfield',
-    'havill',
-    'havillands',
-    'having-to',
-    'havna',
-    'hawass',
-    'haway',
-    'hawden',
-    'hawiye-dominated',
-    'hawk-face',
-    'hawkes/headteacher',
-    'hawkey',
-    'hawkfield',
-    'hawkmoth',
     'hawksby',
-    'hawold',
-    'hawstead',
-    'hawthorn-tree',
-    'hawton/consultant',
-    'haxby-wigginton',
-    'haxell',
-    'haxhia',
-    'hay\'at-e',
-    'hay-filled',
-    'hay-iron',
-    'hay-nets',
-    'hay.',
-    'hay/police',
-    'haybarn',
-    'haybox',
     'haydnish',
-    'hayez',
-    'hayford',
-    'hayletts',
-    'hayleys',
-    'haymer',
-    'haysom',
-    'haytham',
-    'haytons',
-    'hayward/victim',
-    'haywoods',
-    'haza',
-    'hazaras',
-    'hazeen',
-    'hazel/prisoner',
-    'hazelhoff-roelfzema',
     'hazledine',
-    'hazlenuts',
-    'hazmiyeh',
-    'hb/&pound;8.99',
-    'hb31',
-    'hb5',
-    'hcar',
-    'hcc',
-    'hcfc',
-    'hcfiles',
-    'hch',
-    'hchs',
-    'hcima/cgli',
-    'hcl-exceed',
-    'hclocate.fil',
-    'hcx5000',
     'hd-130',
-    'hdl/total',
-    'he&ndash',
-    'he\'d',
-    'he(ia)',
-    'he-could',
-    'he-men',
-    'he-ne',
-    'he-said',
-    'he1',
-    'he111h',
-    'he143',
-    'he_sort',
-    'head&lt;s&gt',
-    'head-counts',
-    'head-dairyman',
     'head-lamps',
-    'head-lice',
-    'head-like',
-    'head-mistressy',
-    'head-mounted',
-    'head-plumes',
-    'head-rot',
-    'head-shape',
-    'head-size',
-    'head-tax',
-    'head-turning',
-    'head-waters',
-    'head-wraps',
-    'headach',
-    'headache.',
-    'headaches.',
     'headbury',
-    'headcoatees',
-    'headcoats',
-    'headcounts',
-    'headers/footers',
-    'headers/shots',
-    'headey/horse',
-    'headford',
-    'headfuls',
-    'headlam-morley',
-    'headphrases',
-    'headpieces',
-    'headplates',
-    'headshake',
-    'headshot',
-    'headsmen',
     'headstand',
-    'headwaiter',
-    'headways',
-    'healey-hercules',
-    'healing.',
-    'heall',
-    'heallingas',
-    'health-authority',
-    'health-damaging',
-    'health-keeping',
-    'health-safety-environmental',
-    'health-wise',
-    'health/health',
-    'health/social',
-    'healthcrafts',
-    'healthier-looking',
     'healthmail',
-    'healthy-eating',
-    'healthy.',
-    'healys',
-    'heaped-up',
-    'hearer\'s/reader',
-    'hearer/reader',
-    'hearing-bilinguals',
-    'hearing-organs',
-    'hearnes',
-    'heart-care',
-    'heart-failure',
-    'heart-in-mouth',
-    'heart-searchings',
-    'heart/',
-    'heartbroke',
     'heartedness',
-    'hearteningly',
-    'heartrate',
-    'heartsore',
-    'heartstopping',
-    'heasley',
-    'heat-aggregated',
-    'heat-denatured',
-    'heat-formed',
-    'heat-generating',
-    'heat-producing',
-    'heat-retaining',
-    'heat-sealed',
-    'heat-sealing',
-    'heat-seekers',
-    'heat-sensing',
     'heat-soaked',
-    'heat-transfer',
-    'heat-zoned',
-    'heater.',
-    'heatflo',
-    'heathenish',
-    'heather-coloured',
-    'heatherston',
-    'heatherwood',
-    'heaths.',
-    'heathy',
-    'heating/cooling',
-    'heav',
-    'heav\'nly',
-    'heave-to',
-    'heavenite',
     'heavier-than-expected',
-    'heavier/lighter',
-    'heavilly',
-    'heavily-armoured',
-    'heavily-planted',
-    'heavily-smoking',
-    'heavily-subsidised',
-    'heavily-trafficked',
-    'heavy-busted',
-    'heavy-featured',
-    'heavy-fisted',
-    'heavy-going',
-    'heavy-headed',
-    'heavy-hearted',
-    'heavy-hitting',
-    'heavy-industrial',
     'heavy-jowled',
-    'heavy-legged',
-    'heavy-mineral',
-    'heavy-wheeled',
-    'heavyish',
-    'hebberd',
-    'hebble',
-    'hebdidge',
-    'hebecker',
-    'hebraist',
-    'heby',
-    'hecker',
-    'heckman',
-    'heckmondwike',
-    'hecla',
-    'hecticker',
     'hecuba',
-    'hedegaard',
-    'hedemann',
-    'hederaceus',
-    'hedge-hopping',
-    'hedgebanks',
-    'hedgeless',
-    'hedgerley',
-    'hedgethorne',
-    'hedgetrimmers',
-    'hedjaz',
-    'heeeeere',
-    'heeks/artist',
-    'heeling-in',
-    'heeltips',
-    'heepish',
     'heerd',
-    'heeringen',
-    'heesen',
-    'heez',
-    'heftily',
-    'hefty-looking',
-    'hegemonism',
-    'hegemonized',
-    'heginbotham',
-    'heginbottom',
-    'hegu',
-    'hegumen',
-    'heicklin',
-    'heidari',
-    'heidelberger',
-    'height-adjustable',
     'height-to-weight',
-    'height/weight',
-    'heignanseness',
-    'heikal',
-    'heiko',
-    'heiman',
-    'heims',
-    'heindorff',
-    'heiney',
-    'heinicke',
-    'heinricy',
-    'heinsius',
-    'heir-presumptive',
-    'heirarchy',
-    'heireann',
-    'heironymus',
     'heivilin',
-    'heka-ib',
-    'hekmat',
-    'held-up',
-    'helden',
-    'heldon',
-    'heldover',
-    'helgerson',
-    'heli-skiing',
-    'heliophyllum',
-    'heliostatic',
-    'heliostation',
-    'heliotropic',
-    'hell-xenotron',
-    'hellcats',
-    'helle',
     'hellem',
-    'hellenisation',
-    'hellesponter',
-    'hellholes',
-    'hellishness',
-    'hellmann',
-    'helloooo',
-    'hellstr&ouml;m',
-    'hellyessen',
-    'hellzapoppin',
-    'helmed',
-    'helmet-mounted',
-    'helmington',
-    'helmsboy',
-    'helmsmanship',
-    'help-lines',
     'helpable',
-    'helpe',
-    'helperby',
-    'helshing',
-    'helsing&oslash;r',
-    'helstone',
-    'helter-skelters',
-    'helthy',
-    'helv&eacute;tius',
-    'helveg',
-    'helvetian',
-    'helvetii',
-    'helvetius',
-    'helwan',
-    'helwey',
-    'helwith',
     'helynsar',
-    'hem.',
-    'hemans',
-    'hematocrit',
-    'hemi-epiphytic',
-    'hemifields',
-    'hemisegment',
-    'hemisphere-wide',
-    'hemispherectomized',
-    'hemithorax',
-    'hemmel',
-    'hemorrhagic',
-    'hempleman',
-    'hempsons',
-    'hempstead-based',
-    'hempsted',
     'hempsted/gloucestershire',
-    'hempton',
-    'hemsby',
-    'hemse',
-    'hemworth',
-    'hen-food',
-    'hen-party',
-    'henbit',
-    'hencher',
-    'hencher/award',
-    'hende',
-    'henderson/objector',
-    'hendes',
-    'hendrickson-konnert',
-    'henerty',
-    'hengelo',
     'hengrave',
-    'heninger',
-    'henke',
-    'henle',
-    'henley/brunel',
-    'henna-dyed',
-    'henna-red',
-    'hennegan',
-    'hennesey',
-    'henney/patient',
-    'henniker&mdash;heaton',
-    'henningsv&aelig;r',
-    'henrey',
-    'henri-georges',
-    'henri-patrick',
-    'henrici',
     'henries',
-    'henriot',
-    'henriss',
-    'hensa',
-    'hensel',
-    'henseleit',
-    'henson/cotswold',
-    'henstocks',
-    'hentie',
-    'hentzner',
-    'hepatic-tracheal',
-    'hepatica',
-    'hepatopathy/cirrhosis',
-    'hepatotoxins',
-    'hepg2',
-    'hepled',
     'heppel',
-    'hepste',
-    'heptagon',
-    'heptamer',
-    'heptathlon',
-    'heptonstalls',
-    'hepwoods',
-    'her/',
-    'her_in_front',
-    'heracleopolis',
-    'heracleum',
-    'heraghty',
-    'herakleia',
-    'heraklith',
-    'herant',
-    'heraud',
     'herb-dominated',
-    'herbauge',
-    'herbed',
-    'herbert/british',
-    'herbicide-resistant',
-    'herbison',
-    'herc',
-    'herckerrath',
-    'herdia',
-    'here-today',
-    'here.',
-    'hereditarily',
-    'hereford/pro-hunting',
-    'herefrith',
-    'herekes',
-    'hereros',
     'heritor',
-    'herky',
-    'hermaness',
-    'hermanfred',
-    'hermannsburg',
-    'hermansky-pudlak',
-    'hermaphroditus',
-    'hermelin',
-    'hermes-based',
-    'hermetically-sealed',
-    'hermine',
-    'herminia',
-    'hermit-like',
-    'hermsdorfer',
-    'hermyte',
-    'hernandez-peon',
     'hernes',
-    'hero-9',
-    'hero-god',
-    'hero-in-waiting',
-    'hero-narrator',
-    'herodotean',
-    'heroical',
-    'heroin-free',
-    'heroin-user',
-    'heronries',
-    'herpes-en-charente',
-    'herred',
-    'herrema',
-    'herringfleet',
-    'herringshaw/asp',
-    'herscu',
     'herself/himself',
-    'hersov',
-    'hertingfordbury',
-    'hertlingtons',
-    'hertzler',
-    'hervormings',
-    'herwick',
-    'herzliya',
-    'hesel',
-    'heselteenies',
-    'hesitance',
-    'heskin',
-    'hesperia',
-    'hessay',
-    'hessell',
-    'hessett',
     'hessians',
-    'hesslow',
-    'hest',
-    'hestenes',
-    'hesters',
-    'heswallbased',
-    'heter-un-thay-ra',
-    'heterarchy',
-    'hetero/homosexual',
-    'hetero/sexual',
-    'heterodimerise',
-    'heterodisperse',
-    'heterodont',
-    'heterodoxies',
-    'heterogeneities',
-    'heteromer',
     'heteromorpha',
-    'heteronymous',
-    'heteros',
-    'heterostraci',
-    'heterosynaptic',
-    'heterotrimeric',
-    'hethe',
-    'hetjens',
-    'hetjens-museum',
-    'hettner',
-    'heuberger',
-    'heuriger',
-    'heurism',
-    'heusch',
-    'heusen',
-    'heusenstamm',
     'hevelius',
-    'heveninghams',
-    'hewes',
-    'hewgill',
-    'hewins',
-    'hewinson',
-    'hewis',
-    'hewkin',
-    'hewland',
-    'hewley',
-    'hewshott',
-    'hexachlorophene',
-    'hexadecyltrimethylammonium',
-    'hexagonals',
-    'hexamethyl',
-    'hexams',
     'hexapeptide',
-    'hexastyle',
-    'hexokinase',
-    'hexose',
-    'hexose-dominated',
-    'hexoses',
-    'hexuronic',
-    'heye',
-    'heyford.',
-    'heylyn',
-    'heymann',
-    'heynes',
-    'heyside',
-    'hezb-i-jihad',
-    'hezekiel',
-    'hezzy',
     'hf&amp;e',
-    'hf2',
-    'hg1',
-    'hgc',
-    'hgf',
-    'hgvs',
-    'hh1',
-    'hh4',
-    'hh:mm:ss.cc',
-    'hhh',
-    'hhl',
-    'hi-dum-do',
-    'hi-elvaloy',
-    'hi-rez',
-    'hi-speed',
-    'hi-technology',
     'hibernation/aestivation',
-    'hibernian/14th',
-    'hibernian/9th',
-    'hiberno-british',
-    'hichens',
-    'hickman/chief',
-    'hicks-beach',
-    'hicks-kaldor',
-    'hide-away',
-    'hideo',
-    'hiders',
-    'hidey',
-    'hielan\'',
-    'hieraeetus',
-    'hierarchal',
-    'hierbas',
     'hierosolyma',
-    'hifikepunje',
-    'higaonna',
-    'higatt',
-    'higerty',
-    'higgins/christie',
-    'high&ndash;speed',
-    'high&rehy;income',
-    'high+',
-    'high-and-mighty',
-    'high-aspect-ratio',
-    'high-concept',
-    'high-crested',
-    'high-current',
-    'high-degree',
-    'high-enough',
     'high-fives',
-    'high-gabled',
-    'high-gear',
-    'high-ground',
-    'high-handicap',
-    'high-handicapper',
-    'high-handicappers',
-    'high-hedged',
-    'high-input',
-    'high-kicks',
-    'high-layers',
-    'high-magnitude',
-    'high-mileage',
-    'high-performant',
-    'high-polish',
-    'high-protection',
     'high-rises',
-    'high-salaried',
-    'high-score',
-    'high-shouldered',
-    'high-spirits',
-    'high-strain',
-    'high-summer',
-    'high-tail',
-    'high-tailed',
-    'high-toned',
-    'high-ups',
-    'high-use',
-    'high-valued',
-    'high-wasted',
-    'high-winged',
-    'high-xxxx',
     'highballs',
-    'highclear',
-    'highdene',
-    'higher-paying',
-    'higher-profile',
-    'higher-tech',
-    'higher-than-normal',
-    'higher-up',
-    'higher-voltage',
-    'higher/lower',
-    'highers/a-level',
-    'highest-energy',
-    'highest-taxed',
-    'highfalutin\'',
-    'highgrade',
-    'highjack',
     'highleadon',
-    'highlever',
-    'highly-cited',
-    'highly-decorated',
-    'highly-disciplined',
-    'highly-excited',
-    'highly-fragmented',
-    'highly-integrated',
-    'highly-leveraged',
-    'highly-motivated',
-    'highly-praised',
-    'highly-prized',
-    'highly-professional',
-    'highly-profitable',
-    'highly-sophisticated',
-    'highly-successful',
     'highly-viscous',
-    'highmoor',
-    'highpowered',
-    'highside',
-    'highstreet',
-    'hightown-northern',
-    'hightownnorthern',
-    'highwaywoman',
-    'higlett',
-    'higon',
-    'hikehams',
-    'hilborn',
-    'hilbre',
-    'hildeburgh',
-    'hildi',
-    'hildorf',
     'hilgay',
-    'hilgendorf',
-    'hill-farmers',
-    'hill-smith',
-    'hill-stone',
-    'hill-town',
-    'hill-tribes',
-    'hill/author',
-    'hill/caretaker',
-    'hill/chairman',
-    'hill/oxford',
-    'hill/sharon',
-    'hillas',
-    'hillenbrand',
-    'hillsford',
-    'hilltrampers',
     'hilltribes',
-    'hillwalks',
-    'hilsted',
-    'hiltone',
-    'hilyer',
-    'him&mdash;he',
-    'him-or',
-    'him_as',
-    'him_at',
-    'himal',
-    'himalyas',
-    'himem.sys',
-    'himse',
-    'himsel\'',
-    'himu',
-    'hinches',
     'hinchingbrooke',
-    'hincu',
-    'hindi-speaking',
-    'hindmoor',
-    'hindon',
-    'hinds/leader',
-    'hindscarth',
-    'hindsight-ometer',
-    'hindu-dominated',
-    'hinf',
-    'hinfi',
-    'hinings',
-    'hinnells',
-    'hinners',
-    'hintings',
-    'hintock',
     'hinton/former',
-    'hintz',
-    'hip-bones',
-    'hip-high',
-    'hip-twist',
-    'hipbone',
-    'hiphop',
-    'hipless',
-    'hiplocks',
-    'hipp',
-    'hippenstiel-imhausen',
-    'hippoes',
-    'hippolyta',
-    'hippolytos',
-    'hippy-dippy',
-    'hira',
     'hiraeth',
-    'hiratan',
-    'hirdin',
-    'hire-a-heap',
-    'hire-car',
-    'hire.',
-    'hire/kings',
-    'hired-in',
-    'hiroshige',
-    'hirschhom',
-    'hirschmeier',
-    'hirschsprung',
-    'hirsuteness',
-    'hirt',
-    'hirtas',
-    'hirth',
     'hirundine',
-    'his-tag',
-    'his25',
-    'his57',
-    'his62',
-    'his90',
-    'hisanori',
-    'hisen',
-    'hish',
-    'hishida',
-    'hispano-americano',
-    'hispano-french',
-    'hissan',
-    'hissein',
-    'hissene',
-    'histaminum',
     'histidine-containing',
-    'histiocytic',
-    'histologist',
-    'histolytica',
-    'histomorphometry',
-    'histopathologist',
-    'historiations',
-    'historical-mindedness',
-    'historical/sociological',
-    'historically-specific',
-    'historico',
-    'historiographers',
-    'historiographic',
-    'history-books',
-    'history/',
-    'histrionicus',
     'histyle',
-    'hit-making',
-    'hitesh',
-    'hiteshwar',
-    'hitokapu',
-    'hiv-1-specific',
-    'hiv-contaminated',
-    'hiv-tainted',
-    'hivac',
-    'hizb-e-islami',
-    'hjas',
-    'hjelmslev',
-    'hk&dollar;13',
-    'hk&dollar;9,300',
-    'hl(e)',
-    'hl60',
     'hla-a2.1-restricted',
-    'hla-b53-positive',
-    'hla-b5301',
-    'hla-bw4',
-    'hla-g',
-    'hlatlolanang',
-    'hllapi',
-    'hlng',
-    'hlnm',
-    'hlodver',
-    'hlp',
-    'hm-2',
-    'hmd',
-    'hmg1',
-    'hmi.',
-    'hmmnn',
     'hnc/hnds',
-    'hncip',
-    'hnpcc',
-    'hns.',
-    'ho2',
-    'hoader',
-    'hoadly',
-    'hoage',
-    'hoagland',
-    'hoare-laval',
-    'hoariest',
-    'hob.',
-    'hob2',
-    'hobbit-names',
-    'hobbit-poems',
-    'hobelars',
     'hobkirk',
-    'hobyahs',
-    'hochschild',
-    'hockenhull',
-    'hockey-players',
-    'hockey-sticks',
-    'hod-carrier',
-    'hodads',
-    'hodder-williams',
-    'hodder/frances',
-    'hodders',
-    'hodding',
-    'hoddur',
-    'hodgetts',
-    'hodnet',
-    'hodson/wiltshire',
     'hodza',
-    'hoebury',
-    'hoehme',
-    'hoerr',
-    'hoescht',
-    'hofdemel',
-    'hoffbin',
-    'hoffman-bustamente',
-    'hoffman/burns/terminal',
-    'hofmans',
-    'hofoaek',
-    'hofsaess',
-    'hofschen',
-    'hoftun',
-    'hog-tied',
-    'hog-wash',
     'hoggetts',
-    'hohe',
-    'hohenemser',
-    'hohensalzburg',
-    'hohensemer',
-    'hohenstaufens',
-    'hohfeldian',
-    'hohhot',
-    'hohnfeldt',
-    'hohns',
-    'hoisin',
-    'hoj',
-    'holarctic',
-    'hold-back',
-    'hold-ers',
-    'hold-warm',
     'holderlin',
-    'holders.but',
-    'holdful',
-    'holdiay',
-    'holding-back',
-    'holding-company',
-    'holdrich',
-    'holdroyd',
-    'holdtite',
-    'hole&rehy;dwellers',
-    'hole-in-wall',
-    'holes.',
-    'holiday-selection',
-    'holidays.bak',
-    'holidays.doc',
-    'holinshed',
     'holl&auml;nder',
-    'holland/herefordshire',
-    'hollesley',
-    'hollick-kenyon',
-    'hollingdale',
-    'hollow-casting',
-    'hollowing-out',
-    'hollownesse',
-    'holly-sprigged',
-    'hollyoake',
-    'holman/thames',
-    'holmbury',
-    'holmqvist',
-    'holnicote',
-    'holoenzyme',
-    'holofernes',
     'hologramic',
-    'hologrammic',
-    'holonym',
-    'holophonic',
-    'holoway',
-    'holroyd-smith',
-    'holst-christensen',
-    'holwick',
-    'holytown',
-    'holzinger',
-    'hom&oelig;opathically',
-    'hom&oelig;opathicity',
-    'hom&oelig;otherapy',
-    'homarus',
-    'home&rehy;based',
-    'home&rehy;made',
     'home-affairs',
-    'home-and',
-    'home-and-family-loving',
-    'home-bound',
-    'home-builders',
-    'home-centredness',
-    'home-computer',
-    'home-delivery',
-    'home-interview',
-    'home-knitted',
-    'home-makers',
-    'home-moving',
-    'home-regulated',
-    'home-style',
-    'home-use',
-    'home/all',
     'home/storey',
-    'homecheck',
-    'homecroft',
-    'homegreen',
-    'homeguard',
-    'homeguardian',
-    'homelife',
-    'homeloans',
-    'homenaje',
-    'homeopathist',
-    'homeopaths',
-    'homesdale',
-    'homesearch',
-    'homesites',
-    'homesmith',
-    'homestar',
     'homestart',
-    'hometime',
-    'homewatch',
-    'homicidally',
-    'hominas',
-    'homo-erotic',
+)
+
+blocks_40 = (
+    '$%ogues##nal#*phenomenal#)scleritis$(odes/day$)temologic%\'olatory#$taxy$(edeumata$+helial-cell*,/mesenchymal*\'isation(\'otropic$$omes""lp',
+    '""ns"%och-2%)migration##nge$.ymously-titled#(xy-resin"$pell#!y"#rdm"+silon-toxin#%omite#"rc"\'thymios#"on!"qu',
+    '&#pay%$izes$%table#"es%#tre\'$ians#+i-energetic$)distantly$\'librial$,potentiality$+significant$&tation$&valant\'4ence/distinctiveness)$t/ml',
+    ')$ness!"r2"#ace#"da$&icable#!l#&seable$$rgcp"\'chester#$oles$,upe/aircoupe#"ps"#dem##ing#$mute',
+    '"&ective%$ness#\'mitical$&ophila#!n$#dis#%trian"$foud"&gative%%oudis#%o-pro$$line$&metric"&indale$$nyes',
+    '#&ophyes#%swell"#kan"\'lembald""me$%ngard#\'yntrude""ni#$shaw"\'ostarbe#(ticising\'"ze"$rans$&ticism#"ep',
+    '#"ia#1or&mdash;filename,4return&mdash;detail/%)-checking%/s-and-omissions#$wood"$sari#"oy"$wina$"tt"\'xadieis"\'ythemis%$raea&*ocyte-rich*$osis',
+    '\'\'poiesis(%terin\'&taenia\'%xytes"\'zberger!0s/9000&ndash;820#"ns#!o",cal&oacute;n%$adun%!e%#ids%#lop%#ona$\'pements',
+    '#%hewal$\'olzmatt$\'weilera#$ocia$%ndido$(rt-class"&daille""fa"#haq#$elly"%katon#&ernazi%!s#&isehir"$land',
+    '#\'eraldas#%ondes"(ophogram#)terically(#ism"&p-link#!a$#nia#"ei$&nshade$"ro%!t#$inal%#ers%*g-andersen',
+    '##oir$!o"#rc-%(financed%)sponsored$%/hsfr%$nerc#"om"&sence.%(tialists#"ie"\'tabillo%&lisher))mentarian%!s',
+    '$$lian$$mpes$#que$-te-car-driver$#ugh#&efania$(l&iacute%!l$&nssoro$#phe$%rfied%)ification&!s%#ley$\'ve-coll',
+    '#%ienne$(garribia#-onian-russian$$rbos#"s.##uar$"fa&!s$"la"#us4!(t-1-like#!6"!."(4000/w32"#ats',
+    '#$hege"!e##lin#$rnia"(hambutol$"nl%(ol/water\'\':acetic#&elbert)!a%#son%$wynn$$rial%"ow#*ical/green',
+    '#+nic-russian\'\'turkish&+/linguistic$!o%)-cultural%$cide%-methodologist&)usicology#%ogram$(xyethane#)ylbenzene%/enediaminetetra4\'-acetic(*glycol-bis"+ienne-louis',
+    '"%lprky"#nea"*on-cropped#+poside/vp16"$rich""si"+tingshausen"!u#"07"*ymologists!&ubanks#"ie#%oians"\'calypts$&ryotic',
+    '#%lides&#ian#\'ryphias"%docio#&romias"#ery",g&egrave;nie##eni%"ol#!h"$less#%ogist&"ze"!m#*elanosomes',
+    '"$noto"(parkeria#&hausia$(oniously%#tic$,rates-tigris%%osyne#&olemus"#ram##ico#&o-asia%)barometer&#ond)!s&+roadcasters',
+    '&+onstituency%(deposits&$isco%(fanatics&)ederalism."ts\'#ver%&issues%(lunacies*!y%+nationalism+$lism%(research%&scares&$peak',
+    '$&budget$$cash%"ds%%hemic$$fest%#ile%#oto$#jet$%lines&"st$\'message&!t$#net%$iche$,p&auml;ische',
+    '&!s%\'e-based&(an-built)#led)&minded$(sceptics%&huttle$(teachers%"ra#"us##wen#"yl$&machos$!n$&pterid',
+    '#$tasy$*on-glasgow\'+northampton"%thuna""we"!x!#v-1"!."!1"!5#!6"!6"&acuues#(luation.##ng.',
+    '%%elica*\'l-state(!i\'"os$&s/aeeu&&farmer&&oxford"+en-featured%\'grained%%toned$*_,_even_if,&though$+ly-balanced\'\'matched$%tless',
+    '%%uates#.r&rehy;popular$\'-active&&miable&)ttractive%+brightening\'(oadening&#usy%\'capable\'&utious&)ontinuing))roversial\'\'urteous%)extending%(faithful',
+    '&$iner&&lowing%(generous&$reen%%handy&&elpful&&opeful%&longer\'$vely(#ing%&nearer\'!w%+resourceful%*sharpening+!r',
+    '\'+rengthening%\'tighter%\'visible%(youthful$-green-layered\'!y$+lastingness$$nden$$peak%&resent$$sham%#ion$\'y-thing&)which-way%8f*&dollar&pound;ingwhere',
+    '%:thing-but-the-kitchen-sink"4idence/investigation#)l-natured$#/of"#kaf"%olute&%ional\'"ve"%p/pev"(remondes$#nos#!y"#vah#!y"#x-1',
+    '#(rt-biggs""in$!s"+s4800/110lt)$30lt(#215(#310)"50!%x-250#(ad/cycle%$dict%%miral$(lcoholic,!s$$pple',
+    '$"rt$$ston$\'t&amp;t##baa%$nker$&elgian&!l$#lue$#oro%$sses$%rides#\'cadbury%&thedra\'$olic&!s',
+    '($ions%$orus%&ristie%$urch$"ia%"ty$,oalitionists%*llaborator&&onials%(mbatants%"ns&%victs$$rown#$data$,emonstration',
+    '$&isplay$%okken$%ragon#)eastender$&tonian$%uston$&verton#(fakintil%"rm%%shion$&iancee$)ootballer$%riend#\'glasgow$&rammar',
+    '#+hairdresser%$lton$%ippie#+immigration$&nmates#%japan#)lancaster$\'ifeboat$\'lanelli$"ms#$m.n.$\'anaging&\'chester&&orians%&rxists',
+    '%)neworkers%$rage$\'onastic$(ultiflow%\'nicipal%#sic#%nanny%&tional&!o$(ewcastle$"un#&office($ials#-parliamentary&"ty',
+    '$"ow$,rofessionals&\'grammer&!s$*sychiatric#&r.a.f.$&angers$&egular$$ugby%$ling#+saxophonist$,choolteacher$$mith$%ocial%#uth',
+    '$$taff&!r%#eel%&oddard$)underland%,perintendent&\'porters#$tate$&illers$(ransport#\'unknown$$rban(#ite+!s$$sers',
+    '&#ker%!r&\'rington$"tn"#.2g#!3$!c#!6#!7"!2"!4")actitudes#&equata#!g$(mination',
+    '#3mination/coursework+"s.("on$\'ple.dat##rch"*cavations.#*eed3/w-eur&%ances$.llent-sounding)&issima)(ly-named$)pting_for\'!o(&nality$%ss-32',
+    '&$ive.)$ness#,hange/member("d.#&itably&0tion-contraction%$ment#*ludability#*ommunicato$&riates#)rementory%#tes$(uciation#\'ursuses$\'sez-moi',
+    '*+legislative*#ncr)!/*)secretary)"ly&%or(s)(%ships#%geses#$mple&%orary#.rcise-to-music("s.""f6#"7+"&halent',
+    '\'"er\'$ible#%ibit.$&larate#(umations%"es"#igo$"ua##lis#!s$$tant%\'ing-use%"s.#\'t-doors$)/entrance',
+    '"%loo-2"*mansworthy"\'ocoelom##dos#\'genetic&"ic#$n(s)$\'/intron$"ym#%phora#(rbitance$#dia#(skeletal$#urf#!t',
+    '"/p&eacute;rience$)formula;t#\'and.exe&#ers&/ing/contracting%&sivity#\'ectedly&&orants$(diencies(#tly&(tiously.$)ndability%#sis\'#ve.),ly-assembled',
+    '(#tal%)t/manager&#ext#&iatory#"la%(in&mdash\'\'ability%(nations.(%orily&!t$%icans\'"ta$*oitability(%tion.%%ratie',
+    '&"e.%\'simeter\'(on-proof#%o2000$#fil$(nentials$(rt-based$(stulates*#ing*#ory$%under#%resse$(opriates*#ory#&ulsive',
+    '"!r"%tasea#*ensibility\'%vely.%&uation$%rior.(#ity%)minations%0nal/co-operative#%inct.(%chris#)ortioners#+ra-academic&"ec\'$xtra',
+    '\'%loral&%heavy&,illustration\')ntestinal&*judicially&(literary\'#oud&\'mundane&\'nuptial&(regional(&sident&*sentential&$tall\'+errestrials**itoriality',
+    '(%xtual\'\'ropical%(clausals%)embryonic%$fine%\'genital%.linguistically%(ordianry),nary-looking%-psychological%\'systole%$tion%)vagancies($ence&&ersion',
+    '$&icates$%uders#\'ubation"\'udation#(ltations#"ma"$x.2a!%ycott"#don"(e-aching$%balls$*catchiness$$drop$%glass$$lash',
+    '$\'rolling$&shades%&ighted$$view$*wateringly#!2#%black#(lid-blue%$ners#$s-on$$hade#%teeth"!i"+nsford-hill""ob',
+    '$)s-monsell"#tan#"le"$zies!#zan#"rd"%bekia"#eer#!l#%quiel -f&aacute;tima#%mp;ci&!j&(sub2&agr"\'bsol;gh',
+    '*)8,000,000"*eacute;ile)%vrier)&zensac")mdash;off"\'ndash;s"\'ouml;hn\'$rlag")uuml;hlen\'*rstenwalde*!s!"\'3"!4!#(0)""3)',
+    '"%****\'$"ed#%cking!$-14d"#601"$801s#"4f"&forgot"!h"!i"%ratio#"eg%\'istered!#.1a"!2',
+    '""51"!a#%.i.t."$c.r."$d.r."%gr.h."!l""o.$"c."%r.m.s"$s.r.!+/00/23/0006*"13+!5*"44',
+    '*"62*"70*"80*"98)#100+!2($2008*"20+!5*"36+!7+!9*"52+!3*"68',
+    '+!8+!9)#112+!8*"41+!4+!7*"60+!1+!9*"73+!9*"81+!7+!9',
+    ')#203+!4+!6+!7+!9*"12+!3+!4+!5+!9*"22+!4+!5*"33+!9',
+    '+!3+!5*"56+!9*"61+!2+!8*"75+!6*"80*"93&&4/2005+!8*"10+!3',
+    '&(6/0003-2#)1/25/2001*"16#)2/40/0002#)4/25/0001+!3#)5/25/0012+!3+!4+!5+!7#)7/25/0003#)9/25/0005*"16+!9',
+    '+!3+!5+!7+!9*"30+!2+!3+!4+!5+!6+!7+!8+!9*"41+!3',
+    '+!5+!6+!7+!8*"50+!2+!3+!4+!5+!6+!7+!8+!9*"60+!4',
+    '+!8+!9*"70+!1+!2+!3+!4+!5+!7+!8+!9*"81+!3+!8*"92',
+    '+!6)#103"*12/28/0001"*20/25/0008+!9*"10+!2#)4/25/0007+!8*"27"!a"!e"0x-01&ndash;74482!)0/f1-type!$1,21',
+    '##400##500"%0,200#%0,000#(214+4724""11$!s"!2")3,000,000"%7,000"!8"!9!#2.8"!0#!0',
+    '"!6"!7"#z10!"3+""33!"4+"$,000##500"!5!#5.6"!m!"61#"\'s"!a""b+',
+    '!%7,000"(c&plusmn##/8a!%8,000"(b&plusmn"#f-2!#92a!.a&ccedil;adism"*(s)t-frank"&bbrica##rex$+is-petrides##sil#%ulate"&cadism',
+    '$#ini#(e-lifted)!s\'"ke%#off%%sheet%\'to-back$%/nose$$ache$#let$$pack%%lates#(ilitites$"ne#$star',
+    '%(oriented%%sheet$&/value$#eur$)ification%)on-fights$\'o&ndash%#ids%)r/invoice&(=average&"an&$ies.\'$sing&&y-farm,"ed',
+    '(%hands)$omes()installed(*production($wide#)ultatibus&$ies.&"y-\'#/my"&ddists$"le#$e-in%)resistant$"ev##gey',
+    '#!i$"lj#$moor".e/mus&eacute;e#!e#$rber$+oe-shetland"&gaceae#&erberg#&giotto$)ot-stitch$!y#8urh&oacute;lsm&yacute;ri"/hey/oxfordshire#&rettin',
+    '#\'l-safes$(/success$$ford$%safes#$malo#&nstein$%tings#&r-days$-bank-nideffer%"oy$+ey-youngman$(fax-lucy$$head%#ill$$leys',
+    '&(ndedness%#ont$+s/festivals$%trade$$well$,y-and-goblin&%queen%%cycle%$dell#,th-community"%jardo"&ked-up$$town#"hr%!i',
+    '#!s"#lad$$fels$!h$%ngism#%chion$*oner-atlee&%hurst&$idae#$eiro##kes$(irk-born\'!0#+l-rise-fall$*aciousness',
+    '$#eth$#guy$)ingbostel%!s$$ouja$$side#,se-positives%!/%"=0%!r#%uting#/way/oxfordshire$#ell"$mers#%iliae',
+    '&)es/crisis)\'friends%,y-controlled\'&minded\'%trees&#.27&\'/hearth&"es$)ne-relief##liy##uli"&n-belt$$leaf&$tter%#ike',
+    '#$base#"ce$#ott$\'y-pants##dom#&efjord#\'gayufan##jet$"ul#$shaw#.tastic-looking$)in-latour$#oft#$wise"&o/unep',
+    '#!-$\'eastern$$side%(preading#!.#$akos$!l%#lon$$marz$#ngs#&berman#"ci%!s$#tus#%dross',
+    '$!r$#wel#\'fallino#\'gelanda$$haly#2ingdon/oxfordshire##jon#(m-animal%#boy%$type$#ans$#boy$-er/contractor(&rofter&)y/swindon',
+    '$#ore$"s.##nan$"es%!y$"ie$#sby#&ragoes%"ns%2r-hockley/military#+sightedness#-ther-reaching&+st-reaching%\'ingales$%pants',
+    '%!h"+sciculation%\'natedly%\'oliasis#,hion-related\'%ables#$sade$"ou#(t-answer%\'beating&%owler%\'cutting%&firing&)orwarding%)recycling',
+    '%(tracking$)er-acting$&igiate%#ngs$$line$$nets$#rak#$ware"&t-body$*containing$&headed$$rich$\'soluble$&tailed#!/',
+    '$%liste#$back#*e-tempting$%fully$)h-ul-mulk$%rnity#%field#+her-figures\'$like\'(of-seven&(/husband\'&mother$%oming#\'iguable#"te',
+    '$$iest%"sh&!t$%orini##was"$ubus#\'cenbois%!s$$igny#!d#$lkes%&nerian)#tes$!l$"t-',
+    '&"if&%lines&)resistant#&nistic#$stin%#yna"\'velados##ier#$our\'&!.&#_of&#ed.\'!r&)ite/least(#ist',
+    '#%throp##zan"$x-ux#$able#\'station"$ycal#$gate!#b.6#"vi!"c4"!5"!e""gs""h6""it',
+    '"#isk""ld#!j"#ped!\'eadship#!k$#ins#"ly#\'r-chill%(inducing%)provoking#(sability$#ter\'!s#,ther-brained',
+    '(\'trimmed\'$less\'#man\'"s.$)ure-value(\'writing\'(lessness"&b.1993#(ruary-14*!6)"20*!1)!4##vre""ca',
+    '$"mp#$kin\'#%ulent$\'ndation"%ddans#.eraci&oacute;n&\'l-funds(\'unitary\'\'isation)"ed(&zation\'+ly-financed&#tor%\'chimica%#igo',
+    '#&oseyev$#tov"\'e-farms$&income#)d-forward$$bins$%water#*ling-level#%nstra#"st"#fcs"#iea#&gelson$!l#!l',
+    '#%stier"$kete##kes""ld$$berg$,grill-zankel$\'kirchen$\'spathic#!e#"ic%*it&agrave\'\'"ys$6xstowe&ndash;zeebrugge##kin#&l-land',
+    '%\'walkers$)er-me-lad$%field$#ice$#ow-\'*christians(\'ommoner))nspirator2!s((reatures\'+enthusiasts\'(fighters\'&guests\'%heirs((istorian',
+    '\'&jockey\')londoners\'%mason((usicians\'%poets\'*scientists\'(teachers\'\'victims$#top#\'mersham$$ores#!o$#ny.#,sbrockenberg$\'tedians',
+    '$%house$$well#$wort"\'male-as\'(specific#%idoms$$niad&"ty#%press#!s#$ulen"&n-edge#\'arizade#(ce-posts%$d-in',
+    '%"s.$$ings#"di#&estrae("ls#%field#&g-shiu#+i&egrave;re$$chel##nah$,el-flavoured&)l/visitor%!s$#iks%#ngs',
+    '$%olora#&oterol#0tanyl-fluanisone"%offor#"ga"%rally$"ud#\'cometal#%ejohn$$lman$\'ncvaros#$land#+managh-born#$nald%%ndina',
+    '$"ex%&yhough$$land%"ee$\'sehfunk$%yough#$rard%)sse-fabre%!z$"ea%$olus%#ter%!y$(o-alloys&(electric',
+    '&%ement%&fluids%)magnetism%\'oxidans%#via\'!e$%yquay#!s#(t&eacute$*ilisations\'.zation-induced"\'semeyer#$haie#"ik##sey',
+    '$"es$%ively$&lieder$&ooning$)spielhaus$"um"(therston#*ishisation#)omaternal$!r"(udalists#"ge#&illade"*verishness#"in',
+    '"*w-branched##ers"$zzes$%iwigs!"f1"%8,000"#ank#\'rqhuard""it"$ordd#)togallery"$r1.3%!4%)5&ndash;2$"20',
+    '$*5&ndash;20%!0&.&ndash;200,000&$,000$!8$!m#*2&ndash;3m$"00&$,000*.&ndash;300,000$!3$%5,000%%0,000$%9,000#!3',
+    '$".1$%0,000%%0,000$&80,000#)4&ndash;5$"00%!m$"80#+50&ndash;80%$,000$&50,000#5600,000&ndash;800,000$&50,000##7.5#!8',
+    '%%0,000*+&ndash;1.2m#\'900,000$"90#-angcon-davies#"ee$)nch-farce##uit"!t"&urnish"%ynnon!$gf-1$)4-treated$!5#!s',
+    '!#hds"!g"&ithich!$iame#&nce/1e#&t-rate"*berchannel#!i#$re**%\'-tipped%&burger%$form$(oblastic%\'sarcoma%)us-rooted',
+    '$#lle$!r%!s#$hera%!s#,tion-writers"+ddle-player($rone&$case%#in\'#+eicommissis$#lia&$stas&"us#$geon',
+    '""ee#)f-holders#*ld-mapping&%paths&(specific&$trip&(upgraded%#gun%$head%+s/viewpoint#)ndishness#(rce-eyed&.ly-competitive$$iest##sty',
+    '#"te%)en-a-side()barrelled($hour)&undred(#man)(onth-old$)h-largest&&minute&%order$&y-fold&&minute&%pence&)something&$yard',
+    '$%wasps#\'.1.3(b)%!0%!1%!5%!6$"20%!3%!4$#3.1%!1%!4%!9$#4.1$#5.6',
+    '$#8.1&!4$#9.2##ges#,ht-or-flight%%backs%$ers.%*ing-towers#%ueira%$redo$&rality\'"ly%\'e-eight&&kiting&*s-of-eight',
+    '"#key"%labeg$*ment-wound(#osa$&rioids%&monica#\'e-o-fax$\'/device$$fish$%maker$"s.%#=30%$hare$"ts#"ia',
+    '%&usters$&collis$"on$%ppino#$kins#\'l-flash%#ups$&ed-out$&imonov%&ng-out((stations\'!.$)on-payoux#&m-like%\'scripts',
+    '%%slide$!o%&graphy$!z#&s-aime#\'ter-fed&$bank$+h-encrusted$%rated\',ion/aeration%!e"&n-like$$rays#!.#"22',
+    '%%/1972%%ly_in%"s.$+nce-related\'$able&$ial/\'$eele$%serve##bow##cas&#tle$&h-like%&/flood#"d\'$$able',
+    '%"st$%field$%ings.$%spots$%virus#,e&rehy;tooth$(-pointed%\'quality%(sounding%&tuners$*ly-chopped("ut\'&tooled\'&worked)#ven',
+    '$$spun%#tra#&ger(s)&%-fish(#our\'*in-the-ear\'&prints\')wrestling&#ful&%lings&%plate+!s&%spelt&)tip-sized$#las',
+    '$*shed-goods$-te-difference&!s#"ke##las%\'y-jones#(n-kelsey$#ida%%eston%"st#$tona"\'onnuala#\'ravanti$#ela$#ini',
+    '$$toft"(r-boughs$%trees#&e-arms%)blackened($sted&$ombs&&uckets%\'charred%)festivals%\'gilding&$rate&%utted%(lighters%(missiles',
+    '&)rotection%#red%$seat\'\'nsitive%(training%(watchers$&basket%#ell%$irds%\'ombings&"te&#xes%%reaks&#ick\'$gade',
+    '&$tton$%finch%$ront$&grates$%hoses$$less$&nzuola$\'proofed$"rs$\'service%%tones$#tto$$weed#(ing-step#$kins',
+    '$#(s)$%-hewn%%level%$sale%$type%$wide$#ans$!i#"oz#(st&mdash&*rehy;floor%&-draft&*handedness\'"og&(nighters',
+    '&&school\'%eason($ries&&wicket%%lings#$wood##yal$$ubin"%scals$+her-dieskau#+h-and-chips%#boy%(coloured%&eaters&#ggs',
+    '%$guts%&knives%#net%&scales%&tailed)!s$(/surface$%amble$%boxes$0er/breastfeeding\'$head&&people&.ton-de-la-mare&%woman$&garths',
+    '$%iness&&g-nets#$kars$#vik##mes##ter$&fights$%ulous".t-to-be-dusted##ba\'#"c-%*conjugated%(labelled#!e#$tall',
+    '$&ing-up#,zalan-howard$$duff$\'geralds$$myer$\'richard$%warin%%ilton"#uza"!v#*e&rehy;day$4-and-a-half-year-old&$side&#tom%#bob',
+    '%$dice\'"sc%$feet&\'or-four("ty*%-five&$rame%,hundred-buck%$lane\'#yer&%egged%\'minutes%&nation%#one%$pack',
+    '&"in&&ointer%%rayed%$ship&#tep&&ubject%*thousandth&%iered&%o-one\'"ne&"ry%%under&#ser%&volume"\'x-price',
+    '$#tes%#ors#"by##ed-&$dose&\'penalty($riod#%ities"$zkin#$zers$%iness$"og!!j!%k-506!$l080',
+    '"(accidity$%kware#)g-burners%\'carrier%$like%%poles%\'raising%\'wearers$!.$&ellata)#ory$$fish#$haut#$ilin#(kebridge',
+    '$%beaus%&oyancy$&e-like&-of-the-forest&)patterned\'&roofed\'%ulled&#top$"me%#ula#*nge-plates$"k.%"s.$(nelboard\'$foot',
+    '#)p-pockets%&shaped$$less$"py#\'red-leg#(sh-backs\'#ulb*!s&#gun%$bios%#ees%#in\'#$t-12%&bottom%$foot',
+    '&&uscled%&packed\'#nel%&screen&"ix%$tops%\'warming&#ork$&footed$%heads$$land$"s.%#hop$&teners\'\'ing-out',
+    '\'&m-like#$vors#)x-workers#"ys"$copy"!e#%a-bag$#bag$&hopper#\'cainide$$knoe#%eming$%tness%*wood-smith)!s',
+    '#&minger#&nsberg%"ed#(sh-eater+!s&$like%#ier&$ness$&seille##uri#$wett#)xibility.%#ons%!s$#ors',
+    '"&g.offs"(ic/sefic$&ked-on&&ringly#)egerkorps$#nds$"s.#\'ght-bag\'%plans\'(sergeant\'$test&#ing&"s.#"ms%#ies',
+    '$$gers&#tte$!s$\'t-faced%#ily%$work#\'p-chart$&charts$$flop(!s$(per-like#\'ttermus\'!s#!x""mn',
+    '%&ations#(deugerdd#(od-lands\'$evel&%prone%$able%$lamp)!s$*ring-grade%\'walkers\'"rd\'!y&#ork$#sie#(p-houses',
+    '\'&headed#-ral-patterned$#eat%(ncecourt&#nes&!z%%scent$!i%(cultural%&ferous$%janic$#yan##tec%!s#\'ur-like',
+    '%$mill#\'w-front%(patterns$&/total$#age$)er-bright\'%lined\'(painting(%ieces($lots\'$shop&$dale&%iness&*pot-shaped$$rate',
+    '""r1#!2#!b"(u-u-u-te#&ebrush#&ffiest##gga#\'id-flow&&intake&$like$$tans#$kily##o-3$.rescein-coated.%upled',
+    '%&imeter)#ric&#tic%!o&,deoxyuridine&+immunoassay&&metric&)quinolone#*sh-mounted#$ters$"ie%#ngs%"st$,ter-tonguing#&vially',
+    '$(infested$$like$\'posters$%sheet%&pecked$%traps#&/drive#%boats$%ridge#\'killers#!s#$ways!\'m-towns"%104.9""lh',
+    '""ps!+nac-belgium"!b"!d"$tmms!(o\'castle"!.",am-breathing$&storms"(cke-wulf$#ler#"os#\'us/view"$ders#!y',
+    '#"ke#)tidissima"\'g-horns#-adabadogulous#&erific$%yness#"ge$%iness#&lights##ous#(tabulous"+il-embossed%%lined#"ns#"re',
+    '"%lates##bot#$card$#ini$!o#&d-over%&thrust##ene$"ys#%iage.#(k-dances&%evils%%music%#pop&#unk',
+    '$%/rock$#ery%+stone-based$%iness$&siness$$wang##ler%"ts$)iard/head%+cle-flowing$%owin\'##ogo$#wed""me#$ison',
+    '%!s"$ncie$$tion(&naires#%dants$$eurs$$lers$!u%#tis#&t-name$(ainebleu%*na/grafton&!e$%ellen%!n',
+    '%!s$\'galland"%o.bar#!2#)d-begging%*collecting%&finder%%grade%%plant%*reinforced%#web$$base$\'markets$%plant$$safe',
+    '##foo#!k#(lchester$+ish-looking$)scap-size#*t-assisted%$care%)passenger&%rints%%rests%&shaped&$ized&\'tomping%%thick&(raveller',
+    '%%weary&#ide$$age.$*ball-pools&"th%%oards$*controller$$mark$%scray%&oldier%%tools%$weep&(itchable"#r\'t#$.the',
+    '$)instance.#(bes-read&$/vet$.idding-looking%$ster$\'o-nairn#\'casters$(e-backed&%eight&(loyalist&\'marched%#dly%$meat%+s&mdash;see%"tt',
+    '$&/fruit$$able%&fourie$#ell$#son#"e-%%edges%%front%)intending%(ordained$%boded$%cast.($able($ing.%$hest',
+    '$%field$&garden&\'thering%%uards$$ign\'\'%-born(*investment$%knows$(nsically$%parts$!r$$said%\'eeable.&!t%)hadowings',
+    '%&isters%&t-clad\'\'dappled&!0&!a\'#lls&$eria&+i&egrave;re&#ry.%\'uffered%\'wearing$!t%#ich%\'riangle$\'vermore',
+    '&"rk#$gill%&veable#&klifts#$lane$+orn-looking\'$ness#(m-factor$%/last&%etter$%aggio%*lly-stated%"nt%$t(s)&$ion.',
+    '$%feeds$.idable-looking&$ible$\'s-based%&/c.v.s%$tons$\'ula-one\'#ble\'$tive$)variation$"yl#%nethy$#ovo#,rest-thomson%!t',
+    '$#hey$/kolin-sensitive$!s$#tal%(ereshegh\'!i#$teen%&reshey%%shegh$#hey%#lin%%night$%ifies%!n$#ner',
+    '$%ronic$,schrittliche$%uitum$\'y-fives&$hour&#ish&%nines)"th&)something\'%trong%!e#&um/pav$$zesh#%ward-(&biased',
+    '(&firing(\'mounted*$ving((pointing\'(/forward\'"ly"%sberg#"ca##sat$1e/gloucestershire%!n$$gate$"ie%$lise#$ter-',
+    '""th#.ograf&iacute;a("ie"&ucarde#(gabatics#%illes##kes#)l-looking$#der%+s/neighbour$\'eshurst$*kes-arnold$#ney#!n$&dement',
+    '$)tain-pens(#ing#,r&ndash;hour$\'-a-side&"ct&$nd-a)-three-quarter&$rrow%#bay&#ead\'#rth%\'centred&$oach\'\'nsonant\'%untry',
+    '%&engine&$vent&#yes%$feet&%inger&$loor&(oot-long)"er\'#rty\'"ur%+handicapper&&undred,*-and-forty,"th%\'in-hand',
+    '\'#ned&$ight%(movement%&nation%\'oh-four&#ver%-pages-to-view&$ence&(hases-on&&inters&$lace\'"us&&osters%&roomed%&second',
+    '%%under%\'vehicle%(wheelers&#ire%)years-old$"ah$\'drinier$$iers$#net$%piece$%rages$\'seasons$*teen-carat($fold%&h-gear',
+    '\'$wall\'%years$$ways"$veae"$ward#&eraker##lds$+e/aylesbury&\'swindon%(r/tenant""x\'#!-$#fur$&headed%&unters',
+    '$%north$%style##bar$"ro#%halls$$unts#$lett#%video"!z#"zy!\'p-fibre"#10s"!3"!4""is',
+    '!-r&aacute;gner"".4#!i##xiv"!3"#571"&aassen#%bjous#\'canzani$*tionalised$#zek#%ggles$+mentisation$#ner$&onards',
+    '#$illy$#ses#\'k/freed#"ma%$tone$&boises$*e-accurate&\'grabber&%maker%%/harp%"d.%"s.&%miths&$tore%-work-knitting',
+    '$%wells#8n&ccedil;ois-andr&eacute0&poncet$(c-dollar&\'tireurs%"e*&\'-africa\'%inter\'$wide&*/1986/cert%$hina\'*se-holders)"rs%2is/buckinghamshire\'#zek',
+    '\'\'iranian\'(lebanese\'&polish&&gallia&$lins&&phobic&%uzska%!y$$gula$%jiehs$3kenstein\'s-daughter%,furt-am-main%)s/schafer%"um$$tzia',
+    '%$iska#!s$$assi$)er-pinter#%terna\'#ite#*ud-related\'%idden%&buster%$cast%#ful$\'munster$"ts#+y/aylesbury#(zer/dean',
+    '"!d")eaked-out%\'ishness##cce$&kleton&#ing#"d4$%ellen%$rich\'$ksen)$havn$$heim#-e&rehy;market*(standing$#(p)',
+    '&)ssociates-#ion%&dinner%$fire&%lying%\'hanging%%lined%,marketeering%&paying&&roduce%\'revving&%iding%&school&$heet&$tyle',
+    '&\'hinkers\'$rows%\'wheeled&%illed$%/rest$%bairn%"ee$%dburg$#lax%#oad("er$*man-atwood&$rket%%iners$)r-flowing',
+    '$#son%%tyler$$time$*ze-branded\'#dry\'&framed,!s&%r-van%#in\'\'%g-out("ly#%iberg$.ght&ndash;only\'+-forwarding\'#car',
+    '$!j$"nd$%valds#$jjis#%mblii#0nch-administered((ppointed\')canadians\'\'derived\')generated)$rman\'(polished\'\'tasting&(/british\'\'english',
+    '%"is$$ular&"um#!q$\'uenters#(schville%,o/popperfoto$(h-ground%%fayre%)ly-ground(&picked)\'repared(&turned$#she#&t-ends',
+    '#&udenau\'$berg\'$fels#%ville#%ygood")f&prime;r"$iant$%rfold%$gate#-cass&eacute;e\'#ees#,day/saturday&&thorpe$(liefsson$#rik',
+    '#&ed-egg%&enberg\'%stein&$rich%#gut%$mans%,rich-wilhelm%#son$&nd/foe\'#the&*loverplane&%s-not$*s-hollands%#eke#"ga',
+    '$.htened-looking$(i-thalgo%"da\'$ires$$orix#%joles#$nge.&"rs#\'th/moll$%o-lay$,z-denneville#+uli-venezia&"an#!v#$zell',
+    '&$ness""ob$&ishers#)ck-coated#)g-hoppers%(marching$,gatt/eastham$$hall$$like#%ideur$#lan#\'licsome*$ness#"m.$\'ageries',
+    '(&putman$#kin$"us#*nt&ocirc;n%\'-facing&$left&*of-curtain($fice\'&pening&*projection&%vowel&(zimbabwe%"en%(ier-free("s.',
+    '$"zo##ody#,st-blackened&%rimed&)sensitive%$belt%#ier$$wick#(thingham(!s#$ught$"nd#$ward$\'n-lines#&zen-in',
+    '&$ness"!p#!l#!s""sa#!s"&uchter$&ticose&(fication#"dd#!g#%hbeck#*it-and-nut&\'bearing&)flavoured',
+    '(!y&#gum)!s&$like&$shop\'$tone%%arian%$bowl%$iest&"ly%(lessness#\'mentius$$ious#&nction#3stration-aggression',
+    '##day$#man!#s-1"!b"!g"$p/uk"!w!%t-all#$long""am""lr!"u2"&ck-ing$$able$$ings',
+    '"#day#&geable"%egans#&l-clad&*onsumption%%dumps%%laden&#ife%%store%&tanker)!s$%house##nte$&zalida"$ggle',
+    '"*iss&eacute#"te"&jairah#\'ichrome$\'tsu-amd#$tisu""ks#&ushima""la$"mi#(fillable\'$inmg&%ments$-ord/neighbour#"ga',
+    '("us#&l(ish)$%-blow%%cover%#fed&(rontally%&houses%&paying&$itch&#lan%%score&$teps&$wing$!a$\'blooded',
+    '%\'r-style&#ian$%scale$&timers$\'y-blown&\'exposed&&funded&(licensed&&pumped&)qualified&&rigged&&scaled%\'fledged##men$\'ination',
+    '#$bler#(igations\'"or".n-in-the-parks$&lovers$*to-be-with#+coplication$\'tion(s)(+alist-based+$ties(,s/procedures#%dable%*mentalisms-#ts.$$hold',
+    '$\'oscopic$&uscopy#&gizone$!y#$icle%%ulars#$k/mc$%ateer$$iest#"na$#ium#%sters"&r-clad&%oaked$%edged',
+    '\'%ppers$\'wrapped#!a$"-2$!m#,by/aylesbury&(bicester&*gloucester&"st(#oke&*winchester($tney\'&ootton##gol#&ibonde',
+    '$"er%"ss#\'nacemen%!s$$eaux$(iture.he%$vall##phy#&riners$(y-leaved#(stenberg\'$feld#.ther-education&(st-flung".sagasug&aacute',
+    '$#hia$"us#"er$$ways#$sier&!s"(tilities##ter#)ure-proof%$ista%\'ologist"&zziest!#vrd!#w14"!g',
+    '!%x-500""4s"#561""e4!*yfe/lawyer##fes"%ndone"$rkat"&tiaras "g%!+&eacute;ant)#dre))ologiques)$raud#)grave;dre',
+    ')#exf($fire",ocirc;teborg#&uml;es\')mb&ouml;s\'$yrgi"%pound!#(x)!%-6-pd"#a-a##tjm"!b#$ands"$dhcb"(g-g-girl',
+    '"%imino#!v"!l#$ader"#o-s"$ustv"%wagen!".1"!c#%.h.o."$e.r."!n"$p.t."$r.m."$s.a.',
+    '""v.!+/00/22/0001&&3/0006*"11+!5*"48*"62*"77+!9*"82+!7*"92+!3+!5)#100',
+    '+!8+!9*"14($2013+!4+!9*"21+!5+!9*"38*"41+!2+!7*"51*"67',
+    '+!9*"82+!8*"90+!3+!5)#114*"27*"32+!3*"40*"54+!5*"68+!9',
+    '+!3+!6*"83+!9*"91)#201*"23+!4+!6*"35+!6+!7+!8*"41+!4',
+    '+!6+!8*"74+!8*"81+!3+!4+!5+!7*"98)#318+!9&&4/2014+!6+!9',
+    '+!7*"32+!3+!6&&5/0024+!6&&6/0057&&9/0002#)1/25/0003+!5+!6+!7*"13#)5/25/0004+!5',
+    '+!7"*13/25/0019"*24/25/0002"!d"#gal!!0""0d!$10n1"#1fo"!5"%7:g34!"2+""00!"3s!$40\'s',
+    '!"5+!#650!"8+!$9z10!\'=adrian!*a&euml;tan"#-ry"$5000""al#"rd"+ba-mediated$$rdan#!b$$icci$#les',
+    '&!s#7cikovo-nagym&aacute;ros/$aros#\'erdines#$hadh##iro#$orit#%ricus%)el/spider#$urri""ce"$ddum#!e$!a#$hafi',
+    '"%elic\'&&-irish\'\'related#!r$$tner##sti##tan"#fah"%ganov$#san$,uz-populated#&e/glos##gia%#ngs"%hrton',
+    '#%geria#"le$)y-painted#$ned.$$says#%tered$(skellite,!s"!j#"ah#"ic"#kki"*l&aacute;n+%pagos$)eacute;es',
+    '#$/min#&4/atf1#"al$$mbos$&ntines$$shan$+tasary/20th%#hus%"ic\'"ca$#xia#$bert#+e/neighbour$%aspid)!a',
+    '$%house$$nson$$rida#%iaras$"ev$%ngale#4land/gloucestershire&%tries$*ery-graves%!s%!t$%iano.%&canism%*en-krueger%"gu',
+    '\'"ly$(o-belgic%#cia%#rum%\'vadians&"ie%%whill&&s-tree##man#"p1$"er#&szecsy#$vani$"er#%wally',
+    '#(y-dejean"\'mahuche$&lliyya$$riel$\'tangium#\'baccini%!s$$eson$$ians$"oa#\'e-based&$irds&"oy%%crazy%\'fishing',
+    '%\'viewing$\'/ticket$5keeper-turned-poacher$!l%#ans$$ness$&player$!r%!a$\'s-based%$play%!t$)togenesis#/ma-aminobutyric&#bhc',
+    '%&/delta&"ma%\'counter%"ge\'\'/sacked$#ell$#ond#$oroi#(sabhavas")ncyclovir#$dale%%vyuha$"en%*r/national$\'hinagar',
+    '#(g-planks%(violence$%buddy$$etic$&planks$%raena#!i$!c##ley#!t#$ymed"%oling"#p43#"on""ra',
+    '$!y#%bling$(oldisham#"ca$$hing$)ia-villas#%delli%&n-like\'$wide&+er-handyman&#ias&%store%!s%"zi$*ner/grower',
+    '$!i%"sh$#oot#"ga$(et/rspca$#les#$hwal#%ifuna$#mel$&shness%$ugan$$vald#&licked%"es##mon',
+    '#$nant%"rd$"es$#gad$"on#%ouste#!p#$raun%/way/cirencester)&newent)\'swindon)%upper$,ett/berkeley(*cheltenham(\'grendon',
+    '(#raf(%thame()worcester$$idge%!e%1gan/environmental$"ot%#way#(ter/lace$\'hamlock%#dee$$loch#!w#*z&oacute;n$"on',
+    '$*condensing&$oker$&fitter%#ree$#oil$$poor$\'related%$ings$%solid#%/riba##ana#$eosa#&fields#%goyne#%ified',
+    '#+kell/orchid#$lamp$%ights#$pare&"ri$#ers$$ings#*son/farmer#$tank$+rintestinal%,oenterostomy\')sophageal&(pod-like&)spirillum&%theca',
+    '"(te-array%%crash%%lodge%%money%$post)!s$,house/oxford$$less$.shead-whickham%#ide$!y##has$$urst#"ie#,ting-shakoor',
+    '"&uchely&$ries$"in#$dies#%frage##ge.%"rs##jos#*nt-looking#&sennae#$trey"&vaghan$!n##els$"rs',
+    '%!s#"le"$wayn#$kers",y-orientated$&rights#$fere$#ryd"$zana%#ias#"co##ere$$teer#$zara!&bassay',
+    '"!r"$ytes!*c&ndash;1b"$(gt)""gc"\'ns-2000!#dcf""ru!"e-#!7#!h##rca")archanges$%lever##ves',
+    '#%hardt#*r&uuml;der$\'e-kidan#"ze")c/alsthom$\'siemens#$koes"$dges##ney"&e-gees$&herter$(whizzers##bro#"ky##ley',
+    '$#rey#%illte"#gam"&hlbach$"er"!i#*lenkirchen$!o#$shas$\'tlicher%$zone#(tonogamy"%kannt"\'lantine$$sius',
+    '\'$ized&"on%!o#%bfisz#\'dzahler#"ee$\'stathis#$fand$"er#%ineau#%leman%!s#\'nhausen#!o"+m-encrusted',
+    '#%einen&)n&uuml;tz&+schaftswerk$"rt#!o#&s/grid"$nant#"ci$"od#)der-aware\'$fair\'+positioning\'(relative$#zhe#)e-altered',
+    '$)/extended$#amp$\'ral-use\'\'/prison\'!i(0zation-decrement\'!l(&y-used\'(s-at-sea&(tability\'%ions.%$elle%+ous-mouthed)%sized*\'pirited',
+    '$#sco$,t/carpentras%$ival%#rix$$vish&"ve#$ghiz#"ia$(graphics$&talium%#ors$#une#$lock#$ning#/otype-phenotype',
+    '#"ro#\'teelism$!l%&y-bred#"ug")o-thermal#&bacter$(otanical#-chronological)&metric#5demographic/financial%$sist$"ha#-environmental#$file',
+    '#!l$\'ogiques\'%sches#*metricians\'+y/simulated$+icrobiology$*orphologic#&pathic$%hagia#7rge&commat;uunet.uu.net&\'-philip&#mas&(s-michel%*ia-pacific\'!s',
+    '&"us#(syncline%$stem)!s#)thermally(&ometry"$ping"$rade$%rdine#%beaud$#ini$%ovics#"di#$effi#$icht',
+    '#&m-free%%plasm%&ridden$*an-british\',czechoslovak\')dominated\'%swiss&#iae\'"ca("us\'%sches$%icide$%plasm##net$!i',
+    '#(olymates$\'nticide&\'ologist#!r#(shenberg%"un#$tsch##vis"+schichtlich##etz#!s$#ate$"en#$tapu$)iculatory',
+    '"*t-overable$%tough##_in#%ashen$$ways#*boundaries#!e#$hing$#wyn#*reidegasse#$sure#&ting_a"\'untchev#!s"\'wissian',
+    '"(yer-ryan#&ikdagi#%sered$#irs!"fa"!p"$s105"!x!%g(at)"#/cc"&antija"$fbg1$#pp4"!g!%haith',
+    '##rah%"ib%"zi#(stliness##war##yas$#oit#)zi-ud-din"#eel#!g##lle#$orge#+rkin-eating#(tto-like&(blasters',
+    '#"yn"&illies#(slanzoni"$n-45"\'obhlach#$fran#$sheh$(t-muster&\'writing%%light%&writer#\'tbzadeh#%ulies"\'radhich#"ib',
+    '")acomettis&%metti#&mberti#%nakos$$cana$&grande$&t-size$(vittorio"%bbers$$s-di$!y#\'erellic#&ralter$#eel#)son-style',
+    '"%deons"\'egerich#&rsberg%$chik#&skanne"1fford/oxfordshire##ts.%#hop"&g-cart$$goer(!s#&anteum&\'ocypris#\'glingly$\'s/kelly',
+    '#$bard&!t$$erte\'#ian$$rook#(dersleve$"on#&esgate#!f$\'achgoch$%ellan##gal#)l-bearing%&netter$&anders',
+    '$$haus$$iane%"ed$$ying#&nockie#$onis$!t#\'t-brass%&copper%&headed#$vear"$mbal&!s#$lett#"ma',
+    '#!o#$sons",n-and-tonics$&sodden$%traps#&andjar#"da##era#,ger-coloured&$nuts$$hams$$ival$"ko$*uen&eacute#&sburgh',
+    '"%ocoso#%rante#\'vinetta"#psi"(randoles$#rdi$&udists#$baud#%dlers#%l/boy$$ings#"ny##ola$"na$$vend',
+    '"#spy#"si""te$!s##obu##son#$tell%!s$%inses"%ubilo#.giaro-designed$%liano#%liana"/ve-nothing-away$*n-plus-new',
+    '"(zehensis$#nga#"za%(rd-stone-!s!\'jesteby#$tost!"k2"!m"!o!(l&amp;se#)oacute;in#\'uuml;ck*"es*&lichen',
+    '"!5"\'abbeeck#!c$#han$+io-eustatic&\'fluvial#%dbach$#ius$#man$$some%\'tonians##gow#%mmier$&orizes&+ous-looking',
+    '$&gedden$#mor$"um$#zel#&reanus%$olus#&sbrook%#ury$$dale$)fabrieken$%going&"ws$(ier/head$%meier$(s-blower',
+    '&%cased&\'encased&\'forming\'%ramed&&headed\'%ouses&&shaded&)to-rubber%#es.%%iness%$mann%"on%$rock%$town%$work',
+    '$#zer#(ubenberg$"ce$#kos#)va&scaron$"en$$isky$"pu#$ydon$+home/labour$#zer#&zounov"!b"(c-funded"(eamingly',
+    '#&nalina$&bervie%(orrodale%%urvie$%cloud%$ombe&#rse&!t&"ul%$rown$#dee%$oven$$farg$%iffer$$lyon',
+    '$%ochil$&wherry"!i#!3#%adins#\'ckstein#$dden$\'er-like\')producing#"ff#"ms#$omas$#sis#%sters#\'tterama',
+    '"(oatingly#+bal-warming&#ism&,ly-organised&!s$(e-shaped%!.$"us#*ckenspiels#!d#$gwog#&merata#$ning$#oin#!o',
+    '%%sters#$riae&!m%$osum##sas$"sa&(ry/index&$tors$(tershire#1ucester/woodville*&shire.$$khov$&nthane#\'ve-like&&making',
+    '#(w-globes"$u115#"94#(cagon-29$\'ksteins$+oneogenesis%.se-1-phosphate&#ide#$ecks$$d-on#$gged$!s#)m-looking$#mer#"rk',
+    '#,tamate-gated*\'induced&"yl%#ryl$#eal$%inosa"%ycans$&erides\'#ned&*ophosphate&"yl$!o%)alkaloids%&cholic%%lipid',
+    '&#ide$*yrrhetinic#"de#\'n-jones#"rm!)m&uuml;nd"!."#4ta"#aj7"!g""rb!#naa#$dige#%shrak$,singb&eacute',
+    '"!f"\'ikomson#\'la-lipa#%ninvi""lf""ma"$olls##mon#$sall#(tobiotic""vq!.o&rehy;fearing#\'ucirc;t"%-away##for',
+    '#+shopping(x)"!4"%al(s)$*-achieving%\'centred%&keeper%%maker&%ouths%\'scorers&&tarved$-/subgoalconds$"en%"ss$&lessly#%round',
+    '$#ish$%smilk%%ucker$!y"#bak#*bledy-gook&!r%!y#$elin#"ie$"nd$$odon#(lin-like#(stoppers"#car',
+    '$(governed$(inspired%)s-with-us$\'killing%)nows-what$\'manhood$*parenthood$%speed#%afoss$!h$!l#"by#%heads#$inot##men',
+    '$$wsky#$revy%!y#$sell%"nt$$hill$#tar#"ts#(win/taxi"%edeke%$ndag#$sgen#,the-institut&!m$&tingen',
+    '$!e"&golian""h3#"la#!r"*i&aacute;s#$esti##ng\'%$-out&+straight-up#!t$$rous"#jam"\'kbilgin#$stad',
+    '#&bourne#(d-blonde%)encrusted&#yed%&hooped%%lined%&miners%$rich&"un%\'sprayed%)tasselled%\'wrapped$%:will$%bloom$+en-coloured',
+    '\'&limbed\'%toned&"en&$hill$$farb$&ingham$*man-eisler%#ire$\'sithney$&weiser%"in%#yns#$fech%!d##ias',
+    '$$tsyn#$lies#"od##son#!u"(m&aacute#$akwe$#ngo#$been$$ojav#+ina-pampali##mes#-pertz-makeham"\'naditis$&ngulum',
+    '%$rian)!s#*e-tomorrow$!/$#_by$#lla$!n#%g-zuo$$less$#ola$%sters$"ue#!i$%atite$#fei',
+    '#!k#$opod\'!s#$zago$#oid"$ober%!y#+ch-atherton%"es%!s#.d&rehy;natured$*-afternoon%\'evening%+heartedness%\'tasting',
+    '$%/evil%&mother$#_as%$deal$"ay$+hart-rendel(!s%$eart%)umouredly$\'ies.sam$#ley$&manham$)naturedly$!o$2rich/herefordshire',
+    '%#hot$+win/bourton((coleford(\'dursley($live(\'malvern(*nailsworth(,sevenhampton)(taverton*$roud%"yn#$fily#(gle-eyed#$ners#!s',
+    '&&pimply%$down$#sen#"th"$ping"(r-asthma##amy#$bach$!i$#utt$&ymania#$chov#$dano$(on-smith#\'ffwysfa',
+    '$(ie-dalry$#oni##ica$$ness#$lais$"ey#+man/manager&!n&!s$"ec#,nall/nuclear$"yi#$riti#\'se-bush%$inon',
+    '#%tdrum$"in"&sbecks#"ev#&htasby#%izdat#,ling/swindon#)s-custard$$elin$)ip-column-#ist&!.&\'mongers&"py$#man',
+    '#\'ub/goto#%ville#$wick"$t_in##ein#%hberg$#dom$\'ic-ness##oda$"hs#&smanov#%tberg$"er$$helf$$onam',
+    '"#uch%"os#"de$%hurst#%esnou#%ffres#!k#)ld-jacobs$\'stonian#\'meziane#(r&eacute$"ad#"ta%"ma$#ier',
+    '$%rnale&\'ment&gt*)-assisted+(endorsed+\'induced+(mediated+)organised+$paid+*recognised+#set,)ubsidised+%unita*)/building+(industry+\'private',
+    '("s."$well#$hari#"la%"nd"$yave"$zani#!d##zer!&p.capt""16""41""mu"%s/pes"\'telecom',
+    '!*r&auml;fin#)eacute;ng$(grave;ve#,iacute;msson#-lsqb;ace&rsqb#\'ouml;na)$sund($ting#&uuml;n"$-1\'s"!1"#700".a&ccaron;anica&\'edil;ay#&b-rail',
+    '$%bable$#ens$"ke#"ca$$chan$"e.%%court%%lands%%mount$)ieusement#$ddon$*e&amp;sup4%$-one%,/certificate&&higher',
+    '\'"up%&s-only&!.$$iska$$uand#\'f/seles$\'fenreid%"in%%under$$iche$(t-coated&\'hammond%#ers%$ings#"ha',
+    '&"s/\'#ton$!l#)igueconna$#lly$,n-boundaries&*collecting&$like&%short&(to-grain$!s##lam#$majo$$ercy$"m.',
+    ')(econdary&3tical/ungrammatical+#ize$%puses#\'napathy%&tensis$\'chester%$ourt$/d&rehy;children%$-dad&\'looking%&babies%)fathering+"ly%%isson',
+    '%*motherhood%$ways$"et$"ia%!c%#kos%-te-greenstone($hard(\'related$%leese$#pa.$(t-funded%\'/cancel%$isek%+own-on-spey',
+    '&$osis#*pe-picking(!p%%yness$+hical-based)(ly-based%(ologists$%plers#(ss-blade\'"ox&\'stained(#ems&(tempered%&cutter%)land/moor',
+    '#&teful.($ness$$zler#,ub&uuml;nden%#ner$"en%!r##ve\'%\'-stones%%goods%(l-strewn%%olens%"rs%#son$"ia',
+    '%&ty-the$&ograph#\'y-green%%scale$$dons$$rigg#%zioso$"za"#bac"!d"*ease-proof\')resistant&$less&&paints%(y-haired',
+    '$)t-britain&3great-grandfather\'s%$/bow%%_deal%%fully%#ley#$boes%!s#"ce$$ians$-o-macedonians#*ed-is-good$*k-american&$born&$flag',
+    '&(yugoslav$*n-and-blue*&yellow&&banded\'\'lazered&(coloured&\'flecked\'#orm&&grocer&&haired&&leafed)#ved&&minded&%ruled&&shaded',
+    '&(thinking&&winged%\'/animal&%brown&*gloucester&%white%%acres%$bury%&cliffe%+ery-yallery&"ss%%flies%%gates&$lass%%hills',
+    '%)ish-black)$grey)%white%\'jackets%$lake%*s/alliance\'#new&$ands&"et&)hank-like\'$ires&#man\'#ith&"on&%tiles',
+    '\'#ord%%teeth%$weld&#ode%\'y-white$)r/rhoades#)gorevitch&\'y-smith$%sbury##ig/&*commanding%!g%!h$\'massian$#sen',
+    '$&vances#"ll#%nadan&*e-throwing&#ian$(don-type$!e%#lle$#zen#$tzer#\'villius#-y&rehy;haired$*-and-white%%blues%\'flecked',
+    '\'$vels%\'quilted%\'scaling&\'peckled&%toned&$uits%$tone%&violet$&/black\'"ue$%abbey$#hen$(ish-buff(&yellow$%mouth',
+    '"#gur"!h"$ibba#%egson$!n$%sheim$&vingly&#ous$!w#%ffing&*th-edwards)&joyner%#oun#"ga$,g-skjellerup',
+    '#%kitis#)m-visaged$&estone$#ily%$nish$\'ond/who$$peur$%sbury%$dell%"el%#tad$\'y-faced##nch$$dale%"le',
+    '$$ned.&"ts$#rod$#ten##ots#+phopithecus$"py##sby$)enthwaite%$ttes%"um$"ha%$enko#\'tstones$#tar',
+    '#!z$+zle-chinned"\'oanings#+ch&oacute;w#%eling$%neweg#%llman#&mphing##net$-ingen/holland##ody$\'m-to-be$)ve-billed%$iest#%sbeak',
+    '$"er%!s$&pierre$&sed-up%%kurth$*venor-myer#-tewohlstrasse#%uches$\'nd-base*!s\'\'control)&vering\'%elder\'"in\'$loop',
+    '("ut\'#run\'$skim(%torey)%rokes($well\')to-ground&%cover&$fall&%lings&\'sperson\'#tar$.p-administered&)frequency&$mean',
+    '&%think&$work%(/average%&uscule%$wide#%veley&!s&!y#$warm$$cott$#in\'&\'g-pains$$n-on$-th-regulatory\'\'seeking',
+    '",ubby-looking$%erova#)dgingness#(er/drugs$(someness#%ffest#$mbar%"la&%ingly&!y$%midge$$pies&"ng##nau$\'dgesetz',
+    '$&ge-pop$#ion$"ox$%peter$%stedt$#tes%$ings$$well##pes##rgh##ter""wp##yne"$ylle#&phites',
+    '!$s(r)""-1"!c"!d""fg"%trein!&t-four""10$"08#"20"!3""4e"/pase-activating!7u&eacute;rini&egrave;re""17',
+    '""31#!2"!6"$aiac#&jajara#"la##ran&)&iacute;s$\'d-chain&$dogs&$ring\'$ooms%\'ianws21&"n\'\'!i',
+    '%%ships$!e%$ntee$$neri#$tiza#%viare##yas")baidulina""ca#)kenheimer")dbartsson##ham#&mundur"&e&iuml#%dalla',
+    '#!i#%lders$"ff#%never#&paje-1#%rande%"rd$$idon%&lleros$*rilla-type#$sser%\'timated$\'t-rooms%&imated%%rooms',
+    '$$aria"(ggisberg"!h"*icciardini&#oli#%dence#\'landina$(d-houses%%house%"on$%herme$+lermoprieto%"im%#oux$$mant',
+    '&\'feeling&\'stained%#ier%&lessly#$mard#+n&eacute;en$\'ea-worm$(nessness#&rlande#&sasola$(e/milton%!d%#ppi%"rs#(tar-band',
+    '\'%maker\'(slashing((trummers\'\'to-midi&+/bass/drums#$zers"\'jeratis#\'ranwala"#lar#%descu$&gubber#"ed#(fstreams##lan$$ibly',
+    '#"ph#%tekin"\'m-boots#"an#$mata$%ed-up%"tt#$nuts#"ph#\'shields"&n-dogs$$free$%happy$$like%$oops',
+    '$&towers$(wielding#"ar$!s#&battle#$dana%#ppa$"er&#son$#ioc#$ging$#rog#$less#\'nislake$$laug',
+    '$#ort#$sels$$hops$#ton\'"es#%ville#&whales"&revich#"ls##nam##sky#\'tnellen&!r#$ungs$(padasamy',
+    '$#ied#%tavia&#son$%iness"%t-men#"ch#&enburg#%hries##man#!o#$shot$%iness$%unaev#(terpress$&ierrez',
+    '#!e$!r##ser##ton"&zzardi!)ventsadze"!m"!p!\'wartheg#"sg"\'eebarra#%nlais$$toys##ras$!u',
+    '$$nell")m/mar/cmg"%yndaf$#ned!#xf5""h6"$plus!.y&ouml;rivanyi"$aain"$lmin".m-instructress$$shoe%#lip#$crak#!i',
+    '#&nastik($orka$*ogeophagus#%slips"+naecophobic#(lecology""or$!i"#poc#!s"&ro-jet$(dactylus$#vap"$ttja"$ulai',
+    ' +h&aacute;0m#$mp;i&!s#(uml;nsel\'#uer"1eacute;0rakleitos)(b&eacute)+l&eacute;ne)"ra"%infin"+oacute;0ken#*slash;lmur#,uml;ckelmann\'%dicke"(uuml;ber',
+    '\'\'sn&uuml!"-7"$nf-l"$test!".1"!3#"20""50"#bl."$c.l."!l"(o.claims"$s.o."$w.r.!!/',
+    '#+2/28/0001-1#)4/25/0001#)8/26/0001+!3"+504/28/5004,!6$)5/25/5015,!6#*19/25/5002,!6+"16""ez!"03!"12""46',
+    '$!s$!y"!t!"2\'"*-receptors"!6"!i"!x!#3\'s"!+""75"!g!"4+!"5+"!0',
+    '!!9!,a&iuml;tians#\'ndash;e#3scaron;talsk&aacute""\'p"+-2-specific##alt"$/cow##lam"!1"*akonshalle#$retz"#bar#%endum$)rmas-like',
+    '#&itats.%*u&eacute;e&%ating)1on-dishabituation&#des##ron#!s"%ccent#$kbut$"el%%rhood$$ford$&sawing%$ters"%d-had',
+    '#&ingham$$thah#\'jipapas#\'lington#"ri%"en#$spen#$wick##zic%)muratovic"$egen#(mastamen%\'tologic+#sts\'#mas',
+    '&%yanin\'#tes%+globin/urea+(opathies%)perfusion(\'itoneum%%rrage\'&hagica##rne""fi#"sa#%tanin$!s"&g-like#$aman',
+    '#&iology#&lelgam#%witch"&hahaha#!s#\'talekin")ig-simons$"us#$lers%*s/baberton%-y/oxfordshire&$wood#"na%%ulter*!s',
+    '$!o$&sworth#)r-brained%$cuts%&dryers%$pins&&ulling%)raisingly&&ibbons%&sprays$!a$\'curlers&$tter$%grass$$iest',
+    '$&shafts#$xing"%jdari##nal#!o"#kas#(im-dowek$!n#%odate#$ucho##wai"$labi$$tion#%denne$"ir',
+    '#(f\'n\'half$\'-a-pint&)cceptance&(nd-halfs\'#gry\'$hour\'$imal\'%noyed&*pprehended&#rab\'#sed&*sphyxiated%$bald\'"ts&%easts',
+    '\'"nt&&locked&%reeds%$calf\'$nopy(#ton&%hance&\'ivilian&&lasses\'%othed&&ollars\')nstructed)$umed(&verted&&rawled',
+    '%%dazed&%ecade\'\'stroyed&%ivine&#one\'#ors\'"wn%(enmeshed&(quations&$rect&&xposed%\'falling\'!t&&earful\'!d',
+    '&&looded($wers&#oot\'%rward%%gipsy&%nawed&#rin%%halts\'$nged&\'olidays\'$oded\'#ped&%umans%+intermitted&"sh',
+    '%)knowledge%\'learned&#ies\'$ghts\'$sten&#ost%(military%+obliterated%(panelled&$eace&"ig&)ortuguese\'"st%#ran\'%tions',
+    '\'$peat&#ipe%+scandalized(#red&&hadows(%meful&$ings&%lopes&%miles&$plit&(tandards\'$ewed\'%ifled\'%unned%%tamed',
+    '(&rified&&hrough&#ide&\'o-death&%racks\'(uthfully%%uncle%&veiled&&olleys%(watching&#oke\'#rld%(yardland-#ers$%board',
+    '\'"ed$"en$%light$$moon$\'picvals$(timbered##imi$#tes#(l-craggs%$like%#way$*/neighbour%&prison%)supporter$!a',
+    '%"nd$$dane$"en%!r&#ton%!t%!z$\'iburton%!e$\'onquist%"os%"un%"we&#ing$&steads',
+    '#(ocarbons$(genation$&n-free$&philic&$ytes$%rella#$prin##sam$$nead$$ynge#1vard/scandinavian#"ys"&m-like$%sized#%adans',
+    '%%rayas$&lainen$$naka#\'bledown$$rook$+urg-amerika(&bremen\'!h##eln$!n%!i$#row%!s#%iraya$*to-semitic',
+    '#"ma%#met$)er-beamed+!s\'(wielding&(ed-glass\'"rs&$shus\')mith-born%!s$#ons#(n&ouml;y$\'ingberg##our#\'preston',
+    '$#her$%teels#$ula.#%worth"$nafi$!h#"ck#"d\'%)s-breadth$)-antiqued%%baked&%eaded\'#lls&$rush%)chiselled',
+    '&*ompositors&$rank*"ed\'\'ocheted%)decorated&#yed%)fashioned&"ed&\'inished&%orged%&gilded&%round%#hot%"in%(knitting',
+    '%\'netting%$pick&&leated&)ollinated&\'repared&%ulled\'$mped)!s%%rails&$iven%(scrawled%+transcribed&$uned%%waxed$\'bagging',
+    '%#uch$\'cuffing$$els-\'&banken\'0h&oslash;yskolen%+rsho/jkolen$*icraftsmen%\'ng-over$#jam$%lable%#ed.&&y/rush%$ings$&pieces%\'rinting',
+    '$&s-free&%heart%+ome-looking%&prings$&waving%%eapon\'$vers%\'ritings$\'y-sized%$work$+zeichnungen##ena#\'g-overs$$_ups$$chow',
+    '%$ands$"up&!s$%woman#$iffa\'!h$"ke#,k-from-texas#&niford$*on-trained%$vers#(s-dieter%%georg%(heinrich%+j&uuml;rgen',
+    '$,eatic-goethe%(n-tangen$,ford/british$\'lickian$$mann$#oms##tan$%horpe#-umanthacharya"#ole#$tian"#pil#)lodiploid##ned#"pa',
+    '\'&tances(,iel-imhausen$&iness.)"es$*y-birthday&&family%$land#$unda",raldschultzi$$maya#.bat/department$#erd%!y$)our-front(&master',
+    '$"um#$d\'un$&-arsed&\'s-nails\'#sed%%baked%%class%%fruit%$held%\'learned%#men%#put%%right&&ocking%\'shelled',
+    '&#oft&\'tanding%"to\'&-build(&define(&employ($heat(%place%$ware\'#ter&#ire&%orker$\'/porous$"an$!e',
+    '%\'r-edged$$gill(!s$$hats%#ill$)ing-jones\'#ham$,man/chairman$%staff$0ware-accelerated)%image)1software-services\'!i%3ick/gloucestershire$*y-weinberg',
+    '%%esque#%edale$&fields$#ing$$less$)m-forming$)wood-benn##gie$$rove##ibo$"di$#ram#$kens$#ins%$shan',
+    '#%lands$$eing%\'mations%\'quinade%%scott&$tone%!v%,y/supersight$%ingen$#ley$%otrye$$ston#+m-to-others$\'fulness$(onograph',
+    '$#sen##nad%!l$#ett$"ik#1old/herefordshire$"me$"on#&perrig$#ley$"o/$+sichordists$%y-bat#&rachov%!n',
+    '%"ss\'%ment.$(ell-bond$*i-augstein%#ets%,ngton/bomber\'%worth%#ott%(son-hall)%towns&$town$"on&#son%%wside$&yhorse',
+    '#(scheisen$*h-sounding%#man#*t\'s-tongue$!a$\'ebeeste$%forth$"ig$#kes$.ley-harrington$(nellisms$5shorn/buckinghamshire)*e/cellmark%"on$!t',
+    '$$with%#ood#"un#!v$,ard-educated$$eian%*y-beaumont&&/telus$\'ie-watt%!n#.wich-zeebrugge"#s.7#$anov#&brouck##han',
+    '$!i%#shi\'#oni#!k#\'legrave$"op#&sanein&#iya("eh$!e$&leholm#$tata$.ings/woodville#"ve""t\'',
+    '$$band$&makers#\'ch-door%%etman#$ecke%#ore$!f#&fields#&haways$%erell$$orne#&ibzade$"ce#%oyama#&stands',
+    '##tum#%u-lia"#uck#(d&eacute$&romont#\'gensund$$hley%%tiest#%lling#$mont#$nter#%sclau$#iku$&torial#&t-rhin',
+    '\'!s$&eville$"on""va#&e-been%#not$#_at$#lis%)ock-allan,"en$#man\'!n$$nots$&rcroft%!n',
+    '\'\'/thames%&sfield##ill&$ands$%ng-to#"na"$wass$!y##den#-iye-dominated#&k-face$.es/headteacher%!y$%field$$moth',
+    '##old#%stead#*thorn-tree$-on/consultant"-xby-wigginton##ell##hia"&y\'at-e#\'-filled$$iron$$nets#!.#\'/police#$barn$"ox',
+    '#"ez#$ford#%letts%"ys##mer##som#$tham$#ons#+ward/victim$$oods""za$#ras##een$*l/prisoner%.hoff-roelfzema',
+    '%$nuts#%miyeh!-b/&pound;8.99""31"!5!#car"!c""fc#$iles"!h#!s"(ima/cgli"(l-exceed#)ocate.fil"%x5000',
+    '"\'l/total!\'e&ndash""\'d"$(ia)"&-could##men#"ne#$said"!1##11h#"43"%_sort"*ad&lt;s&gt$\'-counts%(dairyman',
+    '&#ice\'"ke%)mistressy&&ounted%&plumes%#rot%%shape&#ize%#tax&&urning%&waters&$raps$#ach\'"e.("s.',
+    '$\'coatees(!s&$unts$+ers/footers(%shots%\'y/horse$$ford%#uls$*lam-morley$\'phrases%%ieces%%lates$%shake&"ot%#men',
+    '$&waiter&"ys#,ley-hercules$$ing.$!l%%ingas$,th-authority\'(damaging\'\'keeping\'4safety-environmental\'$wise&\'/health\'&social&&crafts&+ier-looking',
+    '&(y-eating\'!.$"ys#&ped-up#,rer\'s/reader&\'/reader$.ing-bilinguals(&organs$#nes$&t-care&\'failure&(in-mouth&*searchings%!/%%broke',
+    '&&ningly%$rate%$sore&\'topping#$sley#,t-aggregated%)denatured%&formed%*generating%)producing%)retaining%&sealed)#ing\'%ekers\'%nsing',
+    '%(transfer%%zoned$#er.$#flo$&henish&*r-coloured\'$ston\'$wood%"s.%!y$+ing/cooling#!v$$\'nly$$e-to%$nite',
+    '\'(/lighter%#lly&*y-armoured(\'planted(\'smoking))ubsidised(*trafficked$(y-busted&(featured\'%isted&%going&&headed)$rted\'&itting&*industrial',
+    '&&legged&\'mineral&\'wheeled%#ish"%bberd$"le#%didge#%ecker#%raist#!y"$cker$#man%\'ondwike#"la#&ticker',
+    '"\'degaard$$mann$&raceus#*ge-hopping%%banks%$less%$rley%&thorne&\'rimmers##jaz"&eeeere#)ks/artist#\'ling-in$$tips#$pish',
+    '$%ingen##sen#!z"%ftily$)y-looking"(gemonism(#zed#(inbotham(#tom#!u$#men"&icklin#$dari$(elberger#.ght-adjustable',
+    '&\'/weight$)nanseness##kal$!o##man$!s#&ndorff$"ey$$icke$$ricy$$sius#-r-presumptive$%archy$$eann$&onymus',
+    '"%ka-ib##mat"%ld-up$"en$"on%#ver#&gerson#(i-skiing$(ophyllum%&static*"on%&tropic#*l-xenotron$$cats$!e',
+    '%(nisation%\'sponter$%holes$\'ishness$$mann$$oooo$*str&ouml;m$&yessen$(zapoppin##med%)t-mounted$&ington$$sboy%\'manship#\'p-lines',
+    '$!e%#rby#%shing$,ing&oslash;r$$tone#,ter-skelters$"hy#-v&eacute;tius$"eg%$tian\'!i\'"us##wan$"ey$#ith',
+    '""m.##ans$&tocrit#+i-epiphytic$&fields$\'segment%*phere-wide*(ctomized$&thorax##mel#(orrhagic#&pleman$$sons%*tead-based\'!d',
+    '$#ton##sby$!e#%worth"&n-food$%party##bit#$cher\'&/award#"de%-rson/objector%!s$/rickson-konnert#$erty#$gelo',
+    '#%inger#"ke#"le%(y/brunel#\'na-dyed&#red$$egan%#sey%)y/patient$1iker&mdash;heaton%,ngsv&aelig;r##rey$)i-georges&\'patrick%"ci',
+    '%"ot%"ss#"sa$"el&#eit$+on/cotswold$%tocks##tie$$zner".patic-tracheal\'!a%0opathy/cirrhosis&&toxins#"g2##led',
+    '##ste#%tagon%#mer%%thlon$(onstalls#%woods""r/#)_in_front#*acleopolis\'"um$$ghty$%kleia&#ith$"nt$"ud',
+    '$$auge$"ed%*rt/british$/icide-resistant%#son#!c$\'kerrath##dia#\'e-today$!.$(ditarily$0ford/pro-hunting%$rith$#kes$#ros',
+    '#"ky#&maness&$fred&&nsburg&*sky-pudlak%)phroditus$$elin%\'s-based%.tically-sealed$#ine&"ia%&t-like$\'sdorfer$#yte#+nandez-peon',
+    '##o-9%#god%*in-waiting%(narrator$&dotean$$ical%&n-free\'$user$%nries#/pes-en-charente##red%"ma$(ingfleet\'(shaw/asp##scu',
+    '$"ov#,tingfordbury$(lingtons$$zler#(vormings#$wick#%zliya"#sel%\'teenies#&itance##kin#%peria##say$#ell%"tt',
+    '$#low#!t$$enes%"rs#)wallbased".ter-un-thay-ra%%archy%,o/homosexual\'&sexual&(dimerise(&sperse\'#ont($xies&)geneities&#mer',
+    '&&nymous&!s\'%traci\'\'ynaptic&(trimeric#"he#$jens\'\'-museum#$tner"\'uberger#%riger%"sm##sch$"en&%stamm',
+    '$(ninghams"#wes#$gill##ins&"on$!s##kin#$land$"ey#%shott"-xachlorophene$6decyltrimethylammonium$&gonals$&methyl%!s',
+    '$%style#\'okinase$"se&*-dominated&!s#&uronic""ye#%ford.##lyn#$mann##nes#$side"*zb-i-jihad#%ekiel#"zy',
+    '"!2!"g1"!c"!f""vs!"h1"!4"):mm:ss.cc"!h"!l!(i-dum-do#\'elvaloy##rez#%speed#*technology',
+    '&(ian/14th*#9th&)o-british"%chens#*kman/chief$\'s-beach&&kaldor"\'de-away$!o$"rs$!y"%elan\'#\'raeetus%%rchal$#bas',
+    '")fikepunje"&gaonna$"tt#$erty#-gins/christie#-h&ndash;speed%+rehy;income$!+$+-and-mighty&+spect-ratio%\'concept&&rested&&urrent%&degree%&enough',
+    '%&gabled&#ear&%round%(handicap-#per0!s&%edged%%input%%kicks%&layers%)magnitude&&ileage%*performant&%olish&)rotection',
+    '%(salaried&$core&)houldered&&pirits&%train&%ummer%$tail)"ed&$oned%#ups&"se%&valued%&wasted&%inged%$xxxx',
+    '$%clear$$dene$)er-paying(&rofile\'$tech(*han-normal\'"up\'\'voltage&&/lower&)s/a-level%)st-energy(%taxed$(falutin\'$%grade$$jack',
+    '&#ver%\'y-cited\')decorated(*isciplined\'\'excited\'*fragmented\'*integrated\')leveraged\')motivated\'\'praised)$ized)*ofessional+&itable\'-sophisticated()uccessful',
+    '$$moor$\'powered$$side%%treet$-town-northern((northern$(waywoman#$lett#"on"&kehams"%lborn$"re#\'deburgh$!i$#orf',
+    '$&endorf#)l-farmers%%smith&$tone%$town&%ribes$\'/author%)caretaker&\'hairman%&oxford%&sharon$"as$\'enbrand$%sford$(trampers',
+    '$%walks#$sted#$tone##yer"*m&mdash;he##-or##_as%!t#"al%#yas#&em.sys#"se%"l\'#!u"%nches',
+    '$!u#+di-speaking$$moor$"on$(s/leader%%carth%+ight-ometer$+u-dominated#!f$!i#$ings#%nells%"rs#%tings$#ock',
+    '$!z"\'p-bones$$high$%twist#$bone##hop#$less$$ocks#!p$0enstiel-imhausen$#oes%$lyta("os$\'y-dippy""ra',
+    '$#tan##din#(e-a-heap%#car$!.$&/kings$$d-in#&oshige#&schhom&%meier&&sprung$\'uteness#!t$"as$!h',
+    '"%s-tag#"25#"57#"62#"90#%anori#"en#!h$#ida#.pano-americano(&french##san$#ein%"ne#\'taminum',
+    '%&ocytic$\'ologist&%ytica%+morphometry%+pathologist%(riations\'.cal-mindedness*-/sociological*+ly-specific(!o\')ographers-"ic&\'y-books\'!/$(rionicus',
+    '"(t-making##esh&#war#%okapu",v-1-specific$,contaminated$\'tainted#"ac"+zb-e-islami!#jas"\'elmslev!+k&dollar;13*%9,300!$l(e)""60',
+    '$,b53-positive\'"01%"w4$!g#)tlolanang"$lapi""ng#!m"%odver"!p!#m-2"!d""g1""i."#mnn',
+    '#"ip"#pcc""s.!"o2"$ader$"ly#"ge$$land#(re-laval$$iest""b.#!2#)bit-names\'%poems#%elars',
+    '#$yahs"(chschild#\'kenhull%)y-players\'&sticks")d-carrier##ads#,der-williams&(/frances&!s$#ing$"ur#%getts##net#-son/wiltshire',
+    '"%ebury##hme#"rr#$scht"&fdemel#$fbin$.man-bustamente\'//burns/terminal#$mans#$oaek#%saess$$chen##tun"&g-tied$$wash',
+    '""he$&nemser%(salzburg&$emer&\'taufens#\'feldian##hot#&nfeldt$!s"$isin"!j"\'larctic#&d-back%#ers%$warm',
+    '&%s.but$#ful$#iay%\'ng-back(\'company$$rich%#oyd$$tite#/e&rehy;dwellers$(-in-wall$"s.#.iday-selection\'%s.bak)#doc$%nshed',
+    '$1and/herefordshire$%esley$*ick-kenyon%&ngdale$*ow-casting&\'ing-out&%nesse$*y-sprigged%$oake#*man/thames$$bury$%qvist#&nicote#\'oenzyme$&fernes',
+    '(#mic$#nym$&phonic$#way#*royd-smith#.st-christensen#$wick#%ytown#&zinger"3m&oelig;opathically1#ity+\'therapy#$arus#,e&rehy;based*$made',
+    '&"nd(.-family-loving%%bound&\'uilders%+centredness&\'omputer%(delivery%)interview%\'knitted%&makers&%oving%)regulated%%style%#use$$/all',
+    '$%check%$roft$%green%$uard)#ian$$life%$oans$$naje$(opathist)!s$%sdale%%earch%$ites%$mith%#tar',
+    '$$time$%watch#(icidally$#nas#(o-erotic',
 )
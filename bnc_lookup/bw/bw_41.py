@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_41 = (
+count_41 = 6694
+
+heads_41 = (
     'cdx',
-    'cdx-1060',
-    'ce1',
-    'ce2',
-    'ceadel',
-    'ceannain',
-    'cease-and-desist',
-    'ceathreamhnan',
-    'cebekhulu',
-    'cebifrons',
-    'cebuano',
-    'ceccobelli',
-    'cecetto',
-    'cech',
-    'cecilian',
-    'cecilienhof',
     'cecille',
-    'cecilliot',
-    'cecum',
-    'cedar-brushes',
-    'cedar-wood',
-    'cedare',
-    'cedarn',
-    'cedella',
-    'cefal&ugrave',
-    'cefalu',
-    'ceilach',
-    'ceiling-high',
-    'ceiriog',
-    'ceka',
-    'celal',
-    'celalzade',
     'celebensis',
-    'celeborn',
-    'celebrology',
-    'celestite',
-    'celex',
-    'celf',
-    'celik',
-    'celiku',
-    'celiz',
-    'cell-based',
-    'cell-deaths',
-    'cell-derived',
-    'cell-mates',
-    'cellae',
-    'cellar-like',
-    'cellmates',
     'cellobiose',
-    'cells/g',
-    'cellular-subcellular',
-    'celly',
-    'celtiberians',
-    'celtic-bound',
-    'celtica',
-    'cement-floored',
-    'cement-mixer',
-    'cement/sand',
-    'cementarius',
-    'cementone',
-    'cemlyn',
-    'cempaka',
-    'cenaculum',
-    'cenis',
     'cenju-2',
-    'cennino',
-    'cenred',
-    'censor-ridden',
-    'censorable',
-    'censorial',
-    'censoriousness',
-    'cental',
-    'cente',
-    'centerboard',
-    'centerpiece',
-    'centi-seconds',
-    'centilitre',
-    'centilitres',
-    'centimetres.',
-    'centlivre',
     'central&ndash;local',
-    'central-banking',
-    'central-level',
-    'central-locking',
-    'central-system',
-    'centraliser',
-    'centralities',
-    'centrally-funded',
-    'centre-court',
-    'centre-fold',
-    'centre-lines',
-    'centre-notched',
-    'centre-page',
-    'centre-point',
-    'centreback',
-    'centreboards',
     'centreparc',
-    'centres.',
-    'centrespread',
-    'centreville',
-    'centrifugal-compressor',
-    'centrifugally',
-    'centrioles',
-    'centris-based',
-    'centrism',
-    'centrocercus',
-    'centrolobular',
-    'centum',
-    'centuri',
-    'centurians',
-    'centuriation',
-    'century-',
     'century-and-a-half',
-    'century.',
-    'centwine',
-    'ceolfrith',
-    'ceorls',
-    'cepa',
-    'cepaea',
-    'cepal',
-    'cephalaspid',
-    'cephalorhynchus',
-    'cephalosporins',
-    'cepphus',
-    'cepting',
-    'ceramica',
-    'ceramics.',
-    'cerano',
     'ceraplas',
-    'cerastoderma',
-    'ceratinly',
-    'ceratopsian',
-    'cerdan',
-    'cerdic',
-    'cereal-producing',
-    'cereales',
-    'cerebella',
-    'cerebration',
-    'cereceda',
-    'ceremonialism',
-    'ceremoniousness',
-    'cerialis',
-    'ceridwen',
-    'cerifera',
     'cerin',
-    'cerium-144',
-    'cerj',
-    'cermak',
-    'cernak',
-    'cernobil',
-    'cerrigydrudion',
-    'cert:12',
-    'certains',
-    'certian',
-    'certificado',
-    'certificates/diplomas',
-    'certus',
-    'cervicitis',
-    'cervixes',
-    'cervole',
     'cervus',
-    'cesareo',
-    'cescinsky',
-    'cesi',
-    'cessations',
-    'cestrian',
-    'cet.',
-    'cetraro',
-    'ceuto',
-    'cf&ndash;bsb',
-    'cf2',
-    'cf3',
-    'cfao',
-    'cfe-1a',
-    'cfg',
-    'cfka',
     'cfl',
-    'cfup/cclo',
-    'cgca/tgcg',
-    'cgis',
-    'ch&acirc;teau-gaillard',
-    'ch&acirc;teau-like',
-    'ch&acirc;teau-thierry',
-    'ch\'ban',
-    'ch\'eng',
-    'ch\'iang',
-    'ch\'kasians',
-    'ch\'ship.',
-    'ch-4502',
-    'ch.9',
-    'ch.d',
-    'cha-peau',
     'chaam',
-    'chabanais',
-    'chabang',
-    'chacarita',
-    'chachem',
-    'chacking',
-    'chad-niger',
-    'chadbourne',
-    'chaddesden',
-    'chaddesley',
-    'chadians',
-    'chadors',
-    'chadour',
-    'chadwyck-healey',
-    'chaetodonite',
-    'chaffee',
     'chaffoteaux',
-    'chagford',
-    'chain-links',
-    'chain-smoke',
-    'chain-smoker',
-    'chain-stores',
-    'chainarong',
-    'chainmakers',
-    'chainreaction',
-    'chainswords',
-    'chair-lifts',
-    'chair-makers',
-    'chaircovers',
-    'chairman-general',
-    'chairwomen',
-    'chais',
     'chaisiri',
-    'chaiyasan',
-    'chakhoti',
-    'chakma',
-    'chakravarthy',
-    'chakravorty',
-    'chalcedonies',
-    'chalcid',
-    'chaldees',
-    'chalgrove',
-    'chalier',
-    'chalk-bag',
-    'chalk-rich',
-    'chalkidic',
-    'chalkidike',
-    'chalky-white',
     'challenor',
-    'challum',
-    'chalte',
-    'chamber(s)',
-    'chamber-like',
-    'chamberiain',
-    'chambering',
-    'chamberlainite',
-    'chamberlinian',
-    'chambly',
-    'chambourcy',
-    'chameleon/nfs',
-    'chameleonnfs',
-    'chamery',
-    'chamounists',
-    'chamoux',
     'champ.',
-    'champagne-like',
-    'champagne-producing',
-    'champaran',
-    'champfleury',
-    'champion-ships',
-    'champions-elect',
-    'chamras',
-    'chamson',
-    'chamus',
-    'chance-met',
-    'chanceless',
-    'chancellor-democracy',
-    'chancelloriid',
-    'chancelloriids',
-    'chancho',
     'chancier',
-    'chanciest',
-    'chandeliered',
-    'chandler/brother-in-law',
-    'changchub',
-    'change-agent',
-    'change-manager',
-    'change-master',
-    'change-of-address',
-    'change-of-state',
-    'change-point',
-    'changeableness',
-    'changeful',
-    'changelessly',
-    'changements',
-    'changeout',
     'changerooms',
-    'changingly',
-    'channa',
-    'channel-attach',
-    'channelsource',
-    'channer',
-    'chantent',
-    'chanturia',
-    'chaoborus',
-    'chaorachain',
-    'chap.3',
-    'chape',
-    'chapel-building',
-    'chapelle-lnt&eacute;rieure',
-    'chapelle-triage',
-    'chapelries',
     'chapes',
-    'chaplin/chamber',
-    'chapman/whyte/kerslake/shutt(',
-    'chappaqua',
-    'chappens',
-    'chapple/station',
-    'chaproniere',
-    'chapt',
-    'chapters.',
-    'charabanc-load',
-    'character&dollar',
-    'character-witnesses',
-    'characteritured',
-    'chararic',
-    'charbonnages',
-    'charcas',
     'charcoal-brown',
-    'charcoal-burner',
-    'charcuteries',
-    'chardleigh',
-    'chardonnet',
-    'charentes',
-    'charfi',
-    'charge-coupled',
-    'charge-offs',
-    'charge/discharge',
-    'charge_of',
-    'chargecards',
-    'chargemen',
-    'chargepayer',
-    'charidy',
-    'chariie',
     'charikar',
-    'charity-fatigue',
-    'charity-run',
-    'charkham',
-    'charkiewicz',
-    'charlatanism',
-    'charle',
-    'charlestonians',
-    'charlier',
-    'charlotta',
-    'charlton-all-saints',
-    'charlton-on-otmoor',
-    'charminster',
-    'charmlessly',
-    'charmm',
-    'charny',
     'charoupa',
-    'charrada',
-    'charry',
-    'chart-maker',
-    'chart-making',
-    'chartbuster',
-    'chartbusting',
-    'charter\'',
-    'charterists',
-    'charterline',
-    'chartier-kastler',
-    'chartpaper',
-    'chartridge',
-    'charts.',
-    'chartwards',
-    'charwal',
     'charwell',
-    'chase.',
-    'chasidic',
-    'chasidim',
-    'chasin',
-    'chasings',
-    'chaskalson',
-    'chasmatosaurus',
-    'chasseguet-smirgel',
-    'chastelton/gloucestershire',
-    'chastens',
-    'chasubles',
-    'chat-ups',
-    'chateau-inspired',
-    'chathill',
-    'chatoor',
     'chatshow',
-    'chattan',
-    'chatterings',
-    'chatti',
-    'chaudhuri',
-    'chaudoir',
-    'chauk',
-    'chauliac',
-    'chauri',
-    'chausen',
-    'chauvinisms',
-    'chauvinistically',
-    'chavdar',
-    'chave-jones',
-    'chavenage',
-    'chaves',
     'chavis',
-    'chavrimootoo',
-    'chaykin',
-    'chaykovskovo',
-    'chayote',
-    'chazli',
-    'chchiness',
-    'che\'l',
-    'cheales',
-    'cheams',
-    'cheaney',
-    'cheape',
-    'chearfully',
-    'check-o-matic',
-    'check-points',
-    'checked/updated',
     'checkoff',
-    'checkout/replenishment',
-    'checksummer',
-    'cheddar-type',
-    'cheddi',
-    'cheddie',
-    'cheeeeee',
-    'cheeldren',
-    'cheema',
-    'cheer-leading',
-    'cheer-up',
-    'cheerin\'',
-    'cheery-faced',
-    'chees',
-    'cheese-maker',
-    'cheesecutter',
     'cheesiness',
-    'cheety',
-    'chef/patron',
-    'chelimo',
-    'chelles',
-    'chelm',
-    'chelmno',
-    'chelonei',
-    'chelsea0',
-    'chelsom',
-    'chelstons',
-    'chelyabinsk-65',
-    'chem-intell',
-    'chem.',
-    'chemcon',
-    'chemetrics',
     'chemfacts',
-    'chemi',
-    'chemical-resistant',
-    'chemical-waste',
-    'chemically-induced',
-    'chemicon',
-    'chemisorption',
-    'chemistry-related',
-    'chemo-',
-    'chemoattractant(s)',
-    'chenab',
-    'chenda',
-    'cheney/northamptonshire',
-    'chengde',
-    'chenies',
-    'chenil',
     'chennaa',
-    'chennault',
-    'chenodeoxycholate',
-    'cheong-sam',
-    'cheque(s)',
-    'cheque/money',
-    'cherangani',
-    'cheranganis',
-    'cherani',
-    'cherenkov',
-    'cherine',
-    'cheris',
-    'chernichenko',
-    'chernigov',
-    'chernobil',
-    'chernobyls',
     'cherns',
-    'cherrett',
-    'cherrill/asthma',
-    'cherrington',
-    'cherry-picking',
-    'cherry/basil',
-    'cherryh',
-    'cherton',
-    'cherzeel',
-    'ches.',
-    'chese',
-    'cheskevod',
-    'chesler',
-    'chess-game',
-    'chess-men',
-    'chessboards',
     'chessington-harris',
-    'chest-burster',
-    'chester&ndash;le&ndash;street',
-    'chestfield',
-    'chestiness',
-    'chesting',
-    'chestney',
-    'chestnut-haired',
-    'chestnut-trees',
-    'chetcombe',
-    'chevardi&egrave;re',
-    'chevely',
-    'chevin',
-    'chevington',
-    'chevis',
-    'chevron-shaped',
     'chewbacca',
-    'chewchocks',
-    'chewin\'',
-    'cheysson',
-    'chhnang',
-    'chiaje',
-    'chiaphua',
-    'chiaramonte',
-    'chiarello',
-    'chiastic',
-    'chibwe',
-    'chic-ly',
-    'chicago-style',
-    'chichewa',
-    'chicken-and-ham',
-    'chicken-egg',
     'chicken-sized',
-    'chicken-wired',
-    'chicksands',
-    'chicly',
-    'chicontepec',
-    'chicony',
-    'chicos',
-    'chidingly',
-    'chief-marshal',
-    'chiefdom',
-    'chiefdoms',
-    'chiefship',
-    'chieke',
-    'chienlit',
-    'chiff-chaffs',
-    'chiffre',
     'chiggoe',
-    'chilad',
-    'chilchutt',
-    'chilcotts',
-    'child\'s',
-    'child-killer',
-    'child-murderer',
-    'child-murdering',
-    'child-parent',
-    'child-rearers',
-    'child-socialization',
-    'child-training',
-    'child/',
-    'child/young',
-    'childcarer',
-    'childing',
     'childplan',
-    'children/young',
-    'childrenerformance',
-    'childress',
-    'childswickham/worcestershire',
-    'chilensis',
-    'chilham',
-    'chilis',
-    'chillinghams',
-    'chilmington',
-    'chiloensis',
-    'chiltonian',
-    'chiman',
-    'chimique',
-    'chimleys',
-    'chimney-pot',
     'chimneysweeps',
-    'chimsky',
-    'chin-chin',
-    'china*',
-    'chinery',
-    'chinese-controlled',
-    'chinese-green',
-    'chinese-language',
-    'chinese-made',
-    'chinese-soviet',
-    'chineses',
-    'chingis',
-    'chingiz',
-    'chinka',
-    'chinkuli',
-    'chionasaid',
     'chiottes',
-    'chiozza',
-    'chip-makers',
-    'chip-shot',
-    'chipimbi',
-    'chipko',
-    'chipolata',
-    'chipolatas',
-    'chipp',
-    'chippenham/wiltshire',
-    'chippers',
-    'chipstraw',
-    'chiranjibi',
-    'chirdon',
-    'chirgwin',
-    'chiricahua',
     'chirila',
-    'chirpiness',
-    'chirrups',
-    'chirrupy',
-    'chiseldon',
-    'chiselhurst',
-    'chisenhall',
-    'chishona',
-    'chisnall',
-    'chistie',
-    'chitepo',
-    'chitinozoa',
-    'chitral',
-    'chitter-chatter',
-    'chiyoda',
-    'chkili',
     'chlachair',
-    'chlamydiae',
-    'chlochilaich',
-    'chloracne',
-    'chloralose',
-    'chlorine-36',
-    'chlorine-bleached',
-    'chlorinity',
-    'chlorofibre',
-    'chlorofluorcarbons',
-    'chloroflurocarbons',
-    'chloroform/methanol',
-    'chlorogenic',
-    'chlorohydrin',
-    'chlorohydrocarbons',
-    'chloromelanite',
     'chloromethanes',
-    'chlorophytes',
-    'chmos',
-    'choccie',
-    'chocco',
-    'chockablock',
-    'chocker',
-    'chocking',
-    'choderlos',
-    'choedron',
-    'chogyam',
-    'chogyam-jones',
-    'choice(s)',
-    'choices.',
-    'choirgirl',
-    'choirmasters',
     'choirstalls',
-    'choiss',
-    'choisy-baches',
-    'chokee',
-    'chokwe',
-    'choky',
-    'cholangiojejunostomy',
-    'cholangioscopies',
-    'cholecystectographies',
-    'cholecystogram',
-    'choledochus',
-    'cholesterol-fed',
-    'cholesterol/',
-    'cholesterol/phospholipids',
-    'choline-cl',
-    'choline-containing',
     'cholinomimetic',
-    'cholm',
-    'cholo',
-    'cholos',
-    'chomba',
-    'chomksy',
-    'chomolungma',
-    'chomskians',
-    'chomunn',
-    'chondogyu',
-    'chondroitin',
-    'chongwu',
-    'choo-choo',
-    'choong',
-    'choosier',
-    'choosings',
     'choppin\'',
-    'choque',
-    'chording',
-    'chordwise',
-    'choreo',
-    'choreographers.',
-    'choreographs',
-    'chorley/bruton',
-    'chorlton-cum-hardy',
-    'choro',
-    'chory',
-    'chosing',
-    'chosisme',
-    'chosiste',
-    'chott',
-    'chowchavich',
     'chowgarh',
-    'chowood',
-    'chox',
-    'chree',
-    'chris.txt',
-    'chrisfilm',
-    'chrisman',
-    'chrismas',
-    'christ-image',
-    'christanssen',
-    'christian-dominated',
-    'christian-hebraic',
-    'christian-marxist',
-    'christian/muslim',
-    'christian:moslem',
-    'christiania',
     'christianizing',
-    'christie\'s',
-    'christlich-demokratische',
-    'christlich-soziale',
-    'christmas-party',
-    'christmas_and',
-    'christodoulos',
-    'christoffer',
-    'christoforou',
-    'christologically',
-    'chrith',
-    'chromaffin',
-    'chromates',
-    'chromatics',
-    'chromatographer',
-    'chrome&rehy;plated',
     'chromic',
-    'chromium-release',
-    'chromocentres',
-    'chromogen',
-    'chromogranin',
-    'chromolithographs',
-    'chromomeres',
-    'chromophores',
-    'chromoprotein',
-    'chromotography',
-    'chronical',
-    'chrono-log',
-    'chronologique',
-    'chronometric',
-    'chronometry',
-    'chronostratigraphic',
     'chronotopes',
-    'chryptosporidium',
-    'chrysanth&egrave;me',
-    'chryselius',
-    'chrysopilus',
-    'chthonic/',
-    'chubbiness',
-    'chuckable',
-    'chuckara',
-    'chuckery',
-    'chucklehead',
-    'chudan',
-    'chuddley',
-    'chudomir',
-    'chueng',
-    'chuk-yan',
     'chuka',
-    'chukotka',
-    'chukovsky',
-    'chukwuemeka',
-    'chule',
-    'chuma',
-    'chunchon',
-    'chung-kuo',
-    'chunilal',
-    'chunkety',
-    'chunki-crete',
-    'chunkiest',
-    'chunky.',
-    'chunni',
-    'chunsina',
-    'chunwang',
     'chunyun',
-    'chuquet',
-    'chuquisaca',
-    'church-aided',
-    'church-dues',
-    'church-slavonic',
-    'church-tower',
-    'churchified',
-    'churchwomen',
-    'chutter',
-    'chw',
-    'chyba',
-    'chymostatin',
-    'ci\'s',
-    'ci-3',
-    'ci/',
     'ciar&aacute;n',
-    'ciarlatano',
-    'ciaston',
-    'cibitoke',
-    'cibum',
-    'cichlidae',
-    'cicognani',
-    'cics/esa',
-    'cics/mvs',
-    'cidermaker',
-    'ciechanowiecki',
-    'cielos',
-    'ciencias',
-    'cienega',
-    'cifra',
-    'cigarette-packs',
     'cigarette-smoking',
-    'cigarette.',
-    'cigarillos',
-    'cigaro',
-    'cigenter',
-    'ciii',
-    'cij',
-    'cildo',
-    'cilewent',
-    'ciller',
-    'cimas',
-    'cimbalom',
-    'ciments',
-    'cimeti&egrave;re',
-    'cimoszewicz',
-    'cincars',
     'cinder-heap',
-    'cinefilm',
-    'cinema-goer',
-    'cinema-quality',
-    'cinema-viewing',
-    'cinematically',
-    'cinemicroscopic',
-    'cineradiography',
-    'cinnamomi',
-    'cinnamomum',
-    'cinnamon-coloured',
-    'cinnamon-red',
-    'cinsault',
-    'cintre',
-    'ciorascu',
-    'ciotat',
     'cippolini',
-    'circannual',
-    'circeo',
-    'circinalis',
-    'circuit-breakers',
-    'circuit-building',
-    'circulaire',
-    'circularisation',
-    'circularising',
-    'circum-antarctic',
-    'circumambulate',
-    'circumcising',
-    'circumferentially',
-    'circumspice',
-    'circumsporozoite',
-    'cirene',
     'cirkit',
-    'cirripedia',
-    'cis-hydroxyproline',
-    'cisi',
-    'ciskeian',
-    'cisplatin-dna',
-    'cisplatinum',
-    'cissokho',
-    'ciste',
-    'cisternazza',
-    'citadelle',
-    'citee',
-    'citium',
-    'citoyens',
-    'citrinus',
-    'citro',
     'citroen-peugeot',
-    'citt.',
-    'cittadella',
-    'city&rehy;dweller',
-    'city-',
-    'city-life',
-    'city-regions',
-    'city-republic',
-    'city/',
-    'city4',
-    'citybreaks',
-    'citybus',
-    'citzens',
-    'ciullo',
-    'civ',
-    'civ.',
     'civ/n',
-    'civica',
-    'civil/structural',
-    'civilianization',
-    'civillians',
-    'civilt&agrave',
-    'civita',
-    'cize',
-    'ck2',
-    'cl&eacute;menceau',
-    'cl-',
-    'cl-px0072',
-    'cl450',
-    'clachnagowan',
-    'clackety',
-    'cladium',
     'cladocerans',
-    'cladophora',
-    'claeys',
-    'claidheamh',
-    'claim-forms',
-    'clairement',
-    'clairin',
-    'clairvius',
-    'clamator',
-    'clamavi',
-    'clamp-type',
-    'clamp_down',
-    'clamped-free',
-    'clandestinity',
-    'clanfield/thames',
-    'clankings',
     'clanky',
-    'clannishness',
-    'clanny',
-    'clap-hands',
-    'clapis',
-    'claque',
-    'clara-based',
-    'claricia',
-    'clarides',
-    'clarifiant',
-    'clarithromycin',
-    'clark/driver',
-    'clark/father',
-    'clark/kray',
-    'clark/live',
-    'clark/manager',
     'clark/music',
-    'clarke/home',
-    'clarke/solicitor',
-    'clarke/thames',
-    'clarkeston',
-    'clarkie',
-    'clarksons',
-    'clarry',
-    'clars.',
-    'clart&eacute',
-    'clashnessie',
-    'class\'/',
-    'class-beating',
-    'class-bound',
-    'class-ii',
-    'class-struggles',
     'class-teacher',
-    'class/',
-    'class/politics',
-    'classic+',
-    'classica',
-    'classical-style',
-    'classicial',
-    'classificated',
-    'classification.',
-    'classiness',
-    'classteacher',
-    'classybawn',
-    'clattery',
-    'claudes',
-    'claurigh',
-    'clause&lsqb;s&rsqb',
     'clausen',
-    'claustrophobically',
-    'claverhams',
-    'clavicular',
-    'clavier&uuml;bung',
-    'clavinet',
-    'clavitis',
-    'claw-and-ball',
-    'claw-tipped',
-    'clawless',
-    'clawlike',
-    'clay-coloured',
-    'clay-kickers',
-    'clay-streaked',
-    'clay-tiled',
-    'claydons',
     'clayes-sous-bois',
-    'clayform',
-    'claygate',
-    'claystone',
-    'clayton-munroe',
-    'clayton-smith',
-    'cle-1\'s',
-    'clean-burning',
-    'clean-scrubbed',
-    'clean-shaved',
-    'clean/crunch',
-    'cleanaway',
-    'cleaners.',
-    'cleaning-lady',
-    'cleanings',
-    'cleanth',
     'clear(a)',
-    'clear-fell',
-    'clear-outs',
-    'clear-the-air',
-    'clearance.',
-    'clearence',
-    'clearface',
-    'clearfelling',
-    'clearing-bank',
-    'clearshield',
-    'clearstorey',
-    'clearways',
-    'cleating',
-    'cleddans',
-    'cleevedon',
-    'clematis-like',
     'clemmer',
-    'clenbuteriol',
-    'clendenin',
-    'cleon',
-    'clepsydrae',
-    'clergywomen',
-    'clerical/lay',
-    'clerical/secretarial',
-    'clerihews',
-    'clerk.',
-    'clerk/typist',
-    'clermont-nesle',
-    'cleruchies',
-    'clevely',
-    'cleverly-designed',
-    'cleyn',
     'clichy-sous-bois',
-    'click-and-drag',
-    'click-clacked',
-    'clicki',
-    'client(s)',
-    'client-based',
-    'client-lawyer',
-    'client-oriented',
-    'client-solicitor',
-    'clientage',
-    'cliff-nesting',
-    'clifford-turner',
-    'cliffs.',
-    'cliffsides',
-    'cliffwall',
-    'cliften',
     'clifton/transsexual',
-    'climacus',
-    'climate-change',
-    'climate-sensitive',
-    'climatic-geomorphological',
-    'climatic-morphologic',
-    'climatical',
-    'climb-me',
-    'climbed.',
-    'climber-placed',
-    'climber-upward',
-    'climofunction',
-    'climpson',
-    'clincial',
-    'clingers',
-    'clinginess',
     'clinographic',
-    'clinometer',
-    'clinton-inspired',
-    'clintonites',
-    'clinvest',
-    'clip.',
-    'clipbox',
-    'clipp',
-    'clipper-bowed',
-    'clippies',
-    'clipston',
-    'clitorectomy',
-    'clitoridis',
-    'clivia',
-    'clivilles',
-    'clj',
     'cloake',
-    'clocher',
-    'clochfoldich',
-    'clock-candle',
-    'clock-doubled',
-    'clock-like',
-    'clock-watching',
-    'clocking-in',
-    'clockwatchers',
-    'clodhoppers',
-    'clodomiro',
-    'cloisons',
-    'clokke',
-    'clomiphene',
-    'cloncurry',
-    'clonedetector',
     'clonemakers',
-    'clonic',
-    'clonmell',
-    'clonshaugh',
-    'clop-clop',
-    'clophill',
-    'clopped',
-    'cloris',
-    'clorox',
-    'close&num;0',
-    'close-air',
-    'close-boarded',
-    'close-circuit',
-    'close-fitted',
-    'close-packing',
-    'close-tie',
     'closeby',
-    'closed-belief',
-    'closed-doors',
-    'closed-end',
-    'closed-ended',
-    'closed-form',
-    'closed-minded',
-    'closed-off',
-    'closely-dated',
-    'closely-drawn',
-    'closely-held',
-    'closely-woven',
-    'closer-knit',
-    'closing-off',
-    'closings',
-    'cloth-backed',
     'cloth-ears',
-    'cloth-wrapped',
-    'cloth.',
-    'clothes-horses',
-    'clothes-lines',
-    'clothiars',
-    'clothworker',
-    'cloud-base',
-    'cloud-capped',
-    'cloud-free',
-    'cloud-moving',
-    'cloud-shapes',
-    'cloud-top',
-    'cloudbreak',
-    'cloudcover',
-    'clouden',
     'cloudhole',
-    'cloudlets',
-    'clouzot',
-    'clover-like',
-    'cloverfield',
-    'cloyne',
-    'cluaness',
-    'club-mosses',
-    'club-record',
-    'club-trendy',
-    'clubbability',
-    'clubbishness',
-    'clublike',
-    'clubmaker',
-    'clubmans',
-    'clubmoss',
     'clubrooms',
-    'clucas',
-    'clumpingly',
-    'clune',
-    'cluney',
-    'clungunford',
-    'clungwyn',
-    'clunton',
-    'clustan',
-    'clusterings',
-    'clusterland',
-    'clxvi',
-    'clyburn',
-    'clydagnathus',
-    'clydeport',
-    'clygarthy',
     'clypeata',
-    'cm&amp;m',
-    'cm&dollar;disk',
-    'cm-1.20',
-    'cm-api',
-    'cm.375',
-    'cm/y',
-    'cm9',
-    'cma200',
-    'cmms',
-    'cmod',
-    'cms.',
-    'cmyc',
-    'cneorum',
-    'cnup',
-    'co&ndash;operate',
     'co&ndash;ordinate',
-    'co&ndash;ordinator',
-    'co&ucirc;te',
-    'co-act',
-    'co-adventurers',
-    'co-belligerents',
-    'co-chairing',
-    'co-colonised',
-    'co-condensed',
-    'co-consultants',
-    'co-contractor',
-    'co-contractors',
-    'co-cos',
-    'co-covenantors',
-    'co-curator',
-    'co-curators',
     'co-descendants',
-    'co-designer',
-    'co-developer',
-    'co-discoverer',
-    'co-enzyme',
-    'co-expression',
-    'co-financed',
-    'co-habitations',
-    'co-habited',
-    'co-headliners',
-    'co-incide',
-    'co-infection',
-    'co-inherited',
-    'co-investigator',
-    'co-leaders',
-    'co-location',
     'co-member',
-    'co-ming',
-    'co-operations',
-    'co-operativity',
-    'co-optees',
-    'co-options',
-    'co-optive',
-    'co-opts',
-    'co-ordinations',
-    'co-ordinator.',
-    'co-organisers',
-    'co-own',
-    'co-paymaster',
-    'co-precipitation',
-    'co-presenters',
-    'co-presidents',
     'co-prince',
-    'co-princes',
-    'co-proctor',
-    'co-produces',
-    'co-promoted',
-    'co-refer',
-    'co-residents',
-    'co-signatory',
-    'co-therapist',
-    'co-therapy',
-    'co-treasurer',
-    'co-variates',
-    'co-variation',
-    'co-varies',
-    'co-venturers',
-    'co-wives',
     'co-xist',
-    'co.operation',
-    'co.operative',
-    'co/apollo',
-    'co3',
-    'co4',
-    'co7',
-    'coach-and-four',
-    'coach-horses',
-    'coach-houses',
-    'coach/',
-    'coaches.',
-    'coachliner',
-    'coadapted',
-    'coagulant',
-    'coak',
     'coal-heavers',
-    'coal-like',
-    'coal-rich',
-    'coal-tips',
-    'coalescent',
-    'coalesces',
-    'coaley',
-    'coalhouses',
-    'coalitional',
-    'coaliton',
-    'coalmen',
-    'coalridge',
-    'coarsens',
-    'coastway',
-    'coastwise',
-    'coat-of-paint',
     'coat-tail',
-    'coath',
-    'coats/jackets',
-    'coatsleeve',
-    'coatts',
-    'coatzacoalcos',
-    'cob-webbed',
-    'cobb/gloucestershire',
-    'cobble-stones',
-    'cobella',
-    'coblyns',
-    'cobol-to-c',
-    'cobweb-like',
-    'coca-dollars',
-    'coca-producing',
-    'cocaine-based',
     'cocaine-snorting',
-    'coccids',
-    'cocco',
-    'coccyzus',
-    'cochleae',
-    'cochlearia',
-    'cochliomyia',
-    'cock-a-doodle-do',
-    'cock-knee',
-    'cock-main',
-    'cock-of-the-walk',
-    'cockades',
-    'cockaigne',
-    'cockaleekie',
-    'cockatiel',
-    'cockayne',
     'cockbrave',
-    'cockchafer',
-    'cocked-up',
-    'cockell/expedition',
-    'cockiest',
-    'cockleford/gloucestershire',
-    'cockshaw',
-    'cockshy',
-    'cocksuckers',
-    'cocksureness',
-    'cockups',
-    'cocle',
-    'cocoa-cups',
-    'cocoa-drinking',
-    'cocoas',
-    'cocofibre',
     'cocrystal',
-    'codecall',
-    'codecs',
-    'codewatch',
-    'codewords',
-    'codfish',
-    'codicis',
-    'codifications',
-    'codifier',
-    'codonanthe',
-    'codwell',
-    'coed-y-cra',
-    'coed-ycra',
-    'coeditions',
-    'coefficional',
-    'coelebs',
     'coelestis',
-    'coelho',
-    'coelocanth',
-    'coeloptychium',
-    'coeluted',
-    'coester',
-    'coeurs',
-    'coevolve',
-    'coffee-beans',
-    'coffee-drinkers',
-    'coffee-houses',
-    'coffee-mugs',
-    'coffee-pots',
-    'coffee-stalls',
-    'coffie',
-    'coffin-manufacturers',
     'cofir',
-    'cofone',
-    'cogar',
-    'cogen',
-    'cogeneration',
-    'coggleshall',
-    'coghlin',
-    'cogitating',
-    'cogitation',
-    'cogitations',
-    'cognitist',
-    'cognitronics',
-    'cognizable',
-    'cognomen',
-    'cohesion-tension',
-    'cohorting',
     'coic',
-    'coiffeuse',
-    'coifs',
-    'coil-diode',
-    'coil-tapping',
-    'coiled-up',
-    'coilles',
-    'coin-clippers',
-    'coin-clipping',
-    'coin-like',
-    'coin-using',
-    'coinings',
-    'coins.',
-    'cointelpro',
-    'coir-based',
-    'coition',
     'cokar',
-    'cokin',
-    'colart',
-    'colbayns',
-    'colbourn',
-    'colbrook',
-    'cold-adapted',
-    'cold-hardy',
-    'cold-sensitive',
-    'cold-sores',
-    'coldash',
-    'coldheart',
-    'cole-parmer',
-    'colecci&oacute;n',
-    'colegios',
-    'coleopteran',
     'coleorton',
-    'colerton',
-    'colescott',
-    'colette-willy',
-    'coleville',
-    'colfosceril',
-    'colgate-palmolive',
-    'coline',
-    'colinvale',
-    'collaborator.',
-    'collagen-stimulated',
-    'collagenase/gelatinase',
-    'collagenases',
-    'collagues',
-    'collander',
-    'collar-and-tie',
     'collar-jahn',
-    'collar-stud',
-    'colleagueship',
-    'collec',
-    'collectedly',
-    'collectif',
-    'collective-variative',
-    'collectivised',
-    'collectivistic',
-    'collectivit&eacute;s',
-    'college/london',
-    'college/university',
-    'colleges.',
-    'colleges/institutes',
-    'collegially',
-    'collegiata',
     'collegio',
-    'colleoni',
-    'coller',
-    'colleville',
-    'colliar',
-    'collina',
-    'collindale',
-    'collingham',
-    'collingridges',
-    'collingsborough',
-    'collington',
-    'collins-style',
-    'collins.',
-    'collis/county',
-    'collium',
-    'collocationally',
     'collodi',
-    'collosal',
-    'colly',
-    'collywobbles',
-    'colm&aacute;n',
-    'colocynthis',
-    'cologny',
-    'colom&eacute',
-    'colomba',
-    'colombes',
-    'colonic-rectal',
-    'colonie',
-    'colonises',
-    'colonizations',
-    'colonos',
-    'colonscope',
     'colony-forming',
-    'colony.',
-    'colophony',
-    'colorant',
-    'colorgraphic',
-    'colorscript',
-    'colosseo',
-    'colossian',
-    'colossoma',
-    'colostomies',
-    'colotka',
-    'colour-fast',
-    'colour-field',
-    'colour-marking',
-    'colour-printed',
-    'colour-scheme',
     'colour-similar',
-    'colour-similarity',
-    'colour-wise',
-    'colour-words',
-    'colourable',
-    'colourer',
-    'colourfield',
-    'colourfulness',
-    'colourmasters',
-    'colourmotion',
-    'colpats',
-    'colrane',
-    'colt.45',
-    'coltbridge',
-    'colten',
-    'coltronics',
     'columbarius',
-    'columbars',
-    'columbia-based',
-    'columnarisation',
-    'columnated',
-    'colvilles',
-    'colyton',
-    'com&eacute;die-italienne',
-    'com&eacute;die-ltalienne',
-    'com&rehy;mence',
-    'com&rehy;mented',
-    'com&rehy;munities',
-    'com.o',
-    'comancina',
-    'comanecj',
-    'comans',
     'comark',
-    'comb-jellies',
-    'comba',
-    'combalia',
-    'combat-effective',
-    'combativity',
-    'comberbache',
-    'comblike',
-    'combustion.',
-    'come-all-ye',
-    'come-and-go',
-    'comecon-ec',
-    'comedia',
-    'comedies-ballets',
-    'comedogenic',
-    'comedy-thrillers',
     'comeing',
-    'comeliest',
-    'comelin',
-    'comen',
-    'comeragh',
-    'comet-like',
-    'cometabolite',
-    'comeuppances',
-    'comford',
-    'comforseg',
-    'comfort-loving',
-    'comfortablest',
-    'comibol',
-    'comic-books',
-    'comidas',
-    'coming-on',
     'comit&eacute;s',
-    'comittee',
-    'comly',
-    'comm-booth',
-    'comma-separated',
-    'comma-shaped',
-    'command-in-chief',
-    'commandantes',
-    'commandeth',
-    'commandist',
-    'commandite',
-    'commands.',
-    'commdlg.dll',
-    'commemmorate',
-    'commemmorates',
-    'commendeth',
     'comment&lsqb;user',
-    'commercial-paper',
-    'commercial-television',
-    'commercial/industrial',
-    'commercialize',
-    'commercially-available',
-    'commercially-bred',
-    'commercially-orientated',
-    'commey',
-    'commins',
-    'commiseratingly',
-    'commisioner',
-    'commissaries',
-    'commission-funded',
-    'commission-hungry',
-    'commissural',
     'commissurotomised',
-    'commissurotomy',
-    'committed.',
-    'committee-bound',
-    'committee-man',
-    'committee-rooms',
-    'committee-style',
-    'committeee',
-    'commodiousness',
-    'commodity-capitalist',
-    'commodity-money',
-    'common_with',
-    'commondale',
-    'commonland',
-    'commonly-available',
-    'commscreen',
     'communaut&eacute;s',
-    'communicability',
-    'communicatio',
-    'communication-handicapped',
-    'communist-orientated',
-    'communist-trained',
-    'communista',
-    'communists-movement',
-    'communities.',
-    'communities/',
-    'community*',
-    'community-orientated',
-    'community.in',
-    'communitybased',
-    'commuting/carrying',
-    'commynes',
     'comnenos',
-    'comoedia',
-    'comonomer',
-    'comore',
-    'comorian',
-    'comorien',
-    'comosus',
-    'comp-u-claim',
-    'compacter',
-    'companiable',
-    'company-centred',
-    'company-level',
-    'company-sponsored',
-    'company-type',
-    'comparing/ordering',
-    'comparis',
     'comparision',
-    'comparitive',
-    'comparitively',
-    'compartmentalizing',
-    'compassed',
-    'compassions',
-    'compatibilities',
-    'compatibly',
-    'compco',
-    'compearance',
-    'compensable',
-    'compensation.the',
-    'compering',
-    'competence-performance',
-    'competent-looking',
-    'competi&rehy;tive',
     'competition-winning',
-    'competition/exhibition',
-    'competitivity',
-    'competitors.',
-    'compi&eacute;gne',
-    'compiegne',
-    'compilationes',
-    'compl',
-    'complacement',
-    'complacence',
-    'complaint/injury',
-    'compleatest',
-    'complementiser',
-    'completable',
-    'complete1',
-    'completest',
     'completist',
-    'compliance-testing',
-    'compliantly',
-    'complicated-looking',
-    'complicities',
-    'complicitly',
-    'compluvium',
-    'componentry',
-    'componiert',
-    'comported',
-    'composer/arranger',
-    'composition.',
-    'compostool',
-    'compou',
-    'compound-radius',
-    'compound/phrase',
     'compradors',
-    'comprame',
-    'comprehendingly',
-    'comprehension.',
-    'compression/decompression',
-    'compressively',
-    'compressor/expander',
-    'compressor/limiter',
-    'compressus',
-    'comprizmt',
-    'compromisos',
-    'compstations',
-    'compston',
-    'compton-hall',
-    'compunctious',
-    'computational-intensive',
     'computationally-inclined',
-    'computer-coded',
-    'computer-control',
-    'computer-guided',
-    'computer-maker',
-    'computer-manipulated',
-    'computer-users',
-    'computer.',
-    'computerese',
-    'computerizing',
-    'computers/new',
-    'computervertriebsges',
-    'computilliterate',
-    'computing+',
-    'comstock-needham',
-    'comten',
     'comunitarios',
-    'comunity',
-    'comyng',
-    'con-a',
-    'con-merchants',
-    'con_moto',
-    'cona',
-    'conamara',
-    'conbay-greenwood',
-    'concacaf',
-    'concatenates',
-    'concatenations',
-    'concavely',
-    'concavo-convex',
-    'concedi',
-    'conceede',
     'concen',
-    'concentration-camp',
-    'concentrically',
-    'concep',
-    'concepts.',
-    'conceptualistic',
-    'conceptualizers',
-    'concernedly',
-    'concernment',
-    'concernus',
-    'concert-giving',
-    'concert-going',
-    'concertina-like',
-    'conchies',
-    'conchology',
-    'conchyolin',
     'conciencia',
-    'conciliarist',
-    'conciliatingly',
-    'concious',
-    'conciousness',
-    'concision',
-    'concluded.',
-    'conclusion&mdash',
-    'concomitance',
-    'concourse/caf&eacute',
-    'concr&egrave;te',
-    'concrete-mixers',
-    'condemnable',
-    'condemnationist',
-    'condemners',
-    'conden',
     'condensed-matter',
-    'condie',
-    'condita',
-    'conditio',
-    'condition.',
-    'conditionability',
-    'condor-2',
-    'conduct.',
-    'conducteurs',
-    'conductresses',
-    'conduisant',
-    'condylomas',
-    'conella',
-    'coneys',
-    'conf&eacute;d&eacute;ration',
-    'conference-drafting',
     'conference-goer',
-    'conference-goers',
-    'conference-table',
-    'conferences.',
-    'conferers',
-    'conferments',
-    'confessin\'',
-    'confession.',
-    'confessionalism',
-    'confidence-inspiring',
-    'confidential.',
-    'confidentiality.',
-    'configurability',
-    'configures',
-    'confirmative',
-    'confirmed.',
     'confits',
-    'conformances',
-    'conforme',
-    'confortable',
-    'confoundedly',
-    'confraternities',
-    'confu',
-    'confucian-buddhist',
-    'confundar',
-    'confused-looking',
-    'confusion.',
-    'congestion-free',
-    'congres',
-    'conidence',
-    'conistons',
-    'conit',
     'conj',
-    'conjecturally',
-    'conjoins',
-    'conjuction',
-    'conjugality',
-    'conjunto',
-    'conmey',
-    'conn.',
-    'connar',
-    'connebert',
-    'connecti',
-    'connections.',
-    'connectiveness',
-    'conners',
-    'connett',
-    'conomy',
     'conradi',
-    'conscience-racked',
-    'conscientisation',
-    'conscientization',
-    'conscripting',
-    'conscriptions',
-    'consell',
-    'consensuses',
-    'consentor',
-    'consequentialism',
-    'consequentiality',
-    'consequently.',
-    'consequents',
-    'conserationists',
-    'conservation-conscious',
-    'conservation-oriented',
     'conservation/transformation',
-    'conservationism',
-    'conservations',
-    'conservative-led',
-    'conservative-reformist',
-    'conservatoires',
-    'consey',
-    'considerable.',
-    'considerations.',
-    'consilio',
-    'consistant',
-    'consistent.',
-    'consistentwith',
-    'consistories',
-    'consociationalism',
-    'consociations',
     'consoler',
-    'consolute',
-    'consomm&eacute;s',
-    'consomme',
-    'consortium.',
-    'consortships',
-    'conspicuous.',
-    'constable/mcleans',
-    'constable/west',
-    'constan&ccedil;a',
-    'constand',
-    'constant-current',
-    'constant-density',
-    'constantian',
-    'constantina',
-    'constantine-cyril',
     'constinuency',
-    'constituci&oacute;n',
-    'constitut',
-    'constitutionalisation',
-    'constraints.',
-    'constraints.the',
-    'constructed.',
-    'consubstantiality',
-    'consulaire',
-    'consulation',
-    'consultant-led',
-    'consultation/liaison',
-    'consultors',
-    'consulum',
-    'consumer-banking',
-    'consumer-friendly',
     'consumerists',
-    'consumers.',
-    'consummatory',
-    'consumptions',
-    'contact-making',
-    'contact-tracers',
-    'contactor',
-    'contactors',
-    'contagiousness',
-    'containments',
-    'contaminative',
-    'contemned',
-    'contemporaines',
-    'contemporarily',
-    'contendings',
-    'content-focused',
     'content/context',
-    'contentedness',
-    'contentiousness',
-    'contents-pages',
-    'conterminous',
-    'contested.',
-    'context-cs',
-    'context-dependence/independence',
-    'context-effects',
-    'contextualization',
-    'contiguities',
-    'contine',
-    'contined',
-    'continentally',
-    'continously',
-    'continow',
     'continowd',
-    'continuel',
-    'continues.',
-    'continuous-speech',
-    'contiunes',
-    'contra-distinction',
-    'contra-rotating',
-    'contrabando',
-    'contrabassoon',
-    'contracted-in',
-    'contracters',
-    'contractions.',
-    'contractors.',
-    'contractualism',
-    'contrails',
-    'contraindications/special',
     'contraltos',
-    'contraposition',
-    'contrapositives',
-    'contrario',
-    'contrarium',
-    'contrary.',
-    'contravariant',
-    'contraveners',
-    'contre-coup',
-    'contributions.',
-    'contries',
-    'control&eacute;s',
-    'controllably',
-    'controller.',
-    'controller/data',
-    'controlment',
     'controversial.',
-    'controvert',
-    'contrubtion',
-    'contumacy',
-    'contumely',
-    'conturas',
-    'conulariids',
-    'conurbation-wide',
-    'conusance',
-    'convectional',
-    'conveen',
-    'conven',
-    'convenanted',
-    'convenantor',
-    'convenants',
-    'convenience-',
     'convenorship',
-    'convent-school',
-    'conventional-style',
-    'conventionalities',
-    'conversat',
-    'conversate',
-    'convexos',
-    'conveyed.',
-    'conveyers',
-    'convitto',
-    'convivially',
-    'convoke',
-    'cony-catchers',
-    'conyne',
-    'coochie',
-    'coode',
     'cooden',
-    'cooeee',
-    'cook-gordon',
-    'cook-off',
-    'cook.',
-    'cook/kitchen',
-    'cooker/stove',
-    'cookery-books',
-    'cookhouses',
-    'cooking-pots',
-    'cooklin',
-    'cool-warm',
-    'cooled-off',
-    'cooleyhighharmony',
-    'cooling-down',
-    'coolmore',
     'coolwater',
-    'coombs/new',
-    'coonhound',
-    'cooool',
-    'cooorwee',
-    'cooper-bristol',
-    'cooper-parry',
-    'cooper/award',
-    'cooperation.',
-    'cooperations',
-    'cooperstock',
-    'coopper',
-    'coordinadora',
-    'coordinate-invariant',
-    'coordinations',
-    'coordinative',
     'cootes',
-    'copco',
-    'copecks',
-    'copek',
-    'copgo',
-    'copians',
-    'copies/genome',
-    'copilia',
-    'copiosa',
-    'coplanar',
-    'coplands',
-    'copo',
-    'coppee',
-    'copper-colour',
-    'copper-covered',
-    'copper-engraved',
     'copper-haired',
-    'copper-lined',
-    'copper-plates',
-    'copper-sheathed',
-    'copper-sulphate',
-    'copper-zinc',
-    'copperas',
-    'copperheads',
-    'coppery/gingery',
-    'coprario',
-    'coprefa',
-    'coproductions',
-    'coprolalia',
-    'coprophagic',
-    'copsa',
-    'copthorn',
     'coptock',
-    'copulative',
-    'copulator',
-    'copulins',
-    'copy-',
-    'copy-holders',
-    'copy-typing',
-    'copyart',
-    'copybooks',
-    'copyin\'',
-    'copyings',
-    'copyright-cleared',
-    'copyright-protected',
-    'copyrightholder',
-    'copytaker',
-    'copywrite',
     'cor-pulmonale',
-    'coracias',
-    'coral-eclipse',
-    'coral-like',
-    'coral-pink',
-    'coral66',
-    'coran',
-    'corb',
-    'corbalis',
-    'corballis',
-    'corbally',
-    'corbelling',
-    'corbi&egrave;re',
-    'corboz',
-    'cord-like',
-    'cordaite',
     'cordatus',
-    'cordesman',
-    'cordon-bleu',
-    'cordon-trained',
-    'cordones',
-    'cordubensis',
-    'cordula',
-    'cordwell',
-    'core\'journals',
-    'core-funded',
-    'core-like',
-    'coreferential',
-    'coreless',
-    'corelscsi',
-    'cores.',
-    'coresellis',
     'corgarff',
-    'coriads',
-    'corillon',
-    'corinder',
-    'cork-like',
-    'cork-stopper',
-    'cork-stoppered',
-    'cork-stoppers',
-    'corma',
-    'corn-and-sheep',
-    'corn-field',
-    'corn-flakes',
-    'corn-mill',
-    'corn-stubble',
-    'cornball',
-    'cornborough',
     'cornelian',
-    'corneo-retinal',
-    'corner-kicks',
-    'cornerback',
-    'cornerlight',
-    'cornewall',
-    'cornfactors',
-    'cornland',
-    'cornstalks',
-    'corntonvale',
-    'cornubian',
-    'cornucopias',
-    'cornutes',
-    'cornutus',
-    'coronata',
-    'coronopus',
     'corotation',
-    'corots',
-    'corp-apple',
-    'corp-sears',
-    'corp/ross',
-    'corpectomy',
-    'corporaci&oacute;n',
-    'corporacy',
-    'corporate-governance',
-    'corporate-style',
-    'corporateness',
-    'corporatisation',
-    'corporative',
-    'corporazioni',
-    'corpse-candles',
-    'corpuscle',
     'corre',
-    'correctors',
-    'correlatively',
-    'correlatives',
-    'correos',
-    'corridoni',
-    'corrigenda',
-    'corringham',
-    'corrodale',
-    'corrosion-proof',
-    'corrosives',
-    'corrugate',
-    'corruptor',
-    'corryhully',
-    'corsaire',
-    'corselets',
     'corseti&egrave;re',
-    'corsicans',
-    'cortico',
-    'cortijos',
-    'corves',
-    'corville',
-    'cory-wright',
-    'coryate',
-    'corzo',
-    'coscoroba',
-    'cose-like',
-    'cosecretion',
-    'coseied-up',
-    'cosens',
-    'coser',
-    'cosied',
     'cosiglow',
-    'cosloy',
-    'cosmetology',
-    'cosmica',
-    'cosmical',
-    'cosmique',
-    'cosmogonic',
-    'cosmographie',
-    'cosntable',
-    'cossiers',
-    'cosson',
-    'cossons',
-    'cossor',
-    'cossutius',
-    'cost&rehy;effective',
-    'cost-centres',
     'cost-competitive',
-    'cost-ineffective',
-    'cost-justified',
-    'cost-justifying',
-    'cost-optimised',
-    'cost-performance',
-    'cost-savings',
-    'cost-wise',
-    'cost/',
-    'costanoan',
-    'costantinopoli',
-    'coste',
-    'costen',
-    'costentin',
-    'costia',
-    'costica',
     'costig',
-    'costin',
-    'costume-maker',
-    'cotely',
-    'coterminously',
-    'cotesbach',
-    'cotier',
-    'cotinga',
-    'cotmania',
-    'cotret',
-    'cotrimoxazole',
-    'cotswold-stone',
-    'cottage-loaf',
-    'cotter-pins',
-    'cotterrell',
-    'cottescombe',
     'cottey',
-    'cottington',
-    'cotton-growing',
-    'cotton-harvesting',
-    'cotton-rich',
-    'cotton-thread',
-    'cotton-wool-like',
-    'cotton-woolly',
-    'cottongrass',
-    'cottonmouth',
-    'cottonoid',
-    'cottonvale',
-    'cou-cou',
-    'coubert',
-    'coubrough',
-    'coucal',
     'couchettes',
-    'coud',
-    'couderc',
-    'couffignal',
-    'cougars',
-    'cougher',
-    'couild',
-    'could\'t',
-    'could/should',
-    'couling/rspca',
-    'coulouris',
-    'coulshed',
-    'coulston',
-    'coultard',
-    'coultas',
-    'coulthards',
     'coumarin',
-    'coumba',
-    'council-rented',
-    'councillor(s)',
-    'councillors.',
-    'councillorship',
-    'counihan',
-    'countably',
-    'counter&rehy;revolutionary',
-    'counter-action',
-    'counter-assertions',
-    'counter-attraction',
-    'counter-attractions',
-    'counter-block',
-    'counter-case',
-    'counter-change',
     'counter-cinema',
-    'counter-city',
-    'counter-claimed',
-    'counter-clerk',
-    'counter-course',
-    'counter-critique',
-    'counter-earth',
-    'counter-girl',
-    'counter-guerrilla',
-    'counter-interrogation',
-    'counter-intimidation',
-    'counter-intuitively',
-    'counter-marching',
-    'counter-melodies',
-    'counter-memory',
-    'counter-move',
     'counter-moves',
-    'counter-petition',
-    'counter-pressure',
-    'counter-processes',
-    'counter-promise',
-    'counter-propaganda',
-    'counter-reaction',
-    'counter-reference',
-    'counter-regulatory',
-    'counter-response',
-    'counter-revolutions',
-    'counter-rumour',
-    'counter-signed',
-    'counter-spell',
-    'counter-statements',
-    'counter-subjects',
     'counter-subversive',
-    'counter-sue',
-    'counter-tactic',
-    'counter-tendency',
-    'counter-terror',
-    'counter-theatre',
-    'counter-thoughts',
-    'counter-threat',
-    'countercheck',
-    'counterclockwise',
-    'countercurrent',
-    'counterimmunoelectrophoresis',
-    'counterline',
-    'countermove',
-    'counterparts.',
-    'counterpurchase',
     'counterregulation',
-    'countertenors',
-    'countertop',
-    'countertrading',
-    'counterweighted',
-    'countings',
-    'countlines',
-    'countree',
-    'country-bo',
-    'country-club',
-    'country-folk',
-    'country-lover',
-    'country-music',
-    'country-tinged',
-    'country=044',
-    'countryish',
     'countrypersons',
-    'countryside.it',
-    'countrystone',
-    'countryweek',
-    'countss',
-    'county-based',
-    'county-ground',
-    'county-level',
-    'county/district',
-    'county1',
-    'coup&eacute;s',
-    'coup-prone',
-    'coup_de_theatre',
-    'couraged',
-    'couratari',
-    'courbets',
     'coureur',
-    'courmonts',
-    'cournot-nash',
-    'course-grain',
-    'course-is',
-    'course/admission',
-    'courses/modules',
-    'courses/seminars',
-    'courses/units',
-    'courseulles',
-    'court-like',
-    'court/hampshire',
-    'court/tribunal',
-    'courteousness',
-    'courtesey',
-    'courthope',
     'courtisanes',
-    'courtois',
-    'courts-martial',
-    'courty',
-    'courus',
-    'courville',
-    'cousin\'',
-    'coustaussa',
-    'couthie',
-    'coutured',
-    'couven-museum',
-    'couvenable',
-    'couves',
-    'covatta',
-    'coventry-produced',
-    'coventry-solihull-warwickshire',
     'cover-all',
-    'cover-picture',
-    'coverboy',
-    'coverdell',
-    'covergirl',
-    'covering-space',
-    'coverting',
-    'coverwood',
-    'covings',
-    'cow-keepers',
-    'cow-sheds',
-    'cowardliness',
-    'cowbell',
-    'cowbirds',
-    'cowbreath',
-    'cowes-torquay',
     'cowick',
-    'cowieson',
-    'cowl-neck',
-    'cowlam',
-    'cowley/west',
-    'cowlick',
-    'cowpunk',
-    'cowtan',
-    'cox/thames',
-    'coxon',
-    'coy-yll',
-    'coyle/northampton',
-    'coyle/oxfordshire',
-    'coyle/stoke',
-    'coyle/winslow',
-    'coypus',
     'cozzi',
-    'cp29-pulsed',
-    'cpas',
-    'cpc-464',
-    'cpfjc',
-    'cpga',
-    'cph',
-    'cpi-m',
-    'cpls',
-    'cpm/&micro;l',
-    'cpu32',
-    'cpu32+',
-    'cqc',
-    'cqcs',
-    'cqr',
-    'cr&eacute;dito',
     'cr&eacute;dits',
-    'cr&eacute;merie',
-    'cr+lf',
-    'cr-red',
-    'cr-spinel',
-    'cr.c.',
-    'cra-',
-    'crab-cakes',
-    'crabber',
-    'crabeaters',
-    'crabtree/reporting',
-    'crack-crazed',
-    'crack-ups',
-    'crackerama',
-    'crackings',
-    'crackline.',
     'crackshot',
-    'craft-type',
-    'craft-work',
-    'craft-workers',
-    'craftiest',
-    'craftiness',
-    'craftman',
-    'craftpoint',
-    'craftsman/men',
-    'craftspersons',
-    'crag-u-like',
-    'craggier',
-    'crai',
-    'craig-martin',
-    'craig-y-don',
-    'craig/vicar',
     'craigellachie',
-    'craighead',
-    'craigiebuckler',
-    'craigievar',
-    'craiginches',
-    'craignure',
-    'craigside',
-    'craingeau',
-    'crak',
-    'cramwell',
-    'cranch',
-    'crandomna',
-    'crane-fly',
-    'crane-freuhauf',
-    'craniology',
-    'craniotomy',
     'craniums',
-    'crank-driven',
-    'cranked-up',
-    'crankish',
-    'crankonizers',
-    'cranmerian',
-    'crans',
-    'cranshaw',
-    'crantit',
-    'cranworth',
-    'craobh',
-    'crapness',
-    'crappiest',
-    'crapshooter',
-    'cras',
-    'crash-course',
     'crashed.',
-    'crashings',
-    'crassa',
-    'crasser',
-    'cratchitt',
-    'cratchley/sfv',
-    'crateload',
-    'crater-like',
-    'crater-production',
-    'crathorne',
-    'cravate',
-    'craven-walker',
-    'crawfurd',
-    'crawlaways',
-    'cray-3s',
-    'cray-compatible',
     'crayston',
-    'crazy-paved',
-    'crche',
-    'cre&ccedil;y',
-    'cre.',
-    'creakings',
-    'crealy',
-    'cream&rehy;coloured',
-    'cream-',
-    'cream-striped',
-    'cream.',
-    'cream/yellow',
-    'creamiest',
-    'creamy-faced',
-    'creanga',
-    'crease-downward',
     'creaseless',
-    'creaselines',
-    'creasser',
-    'create-a-critter',
-    'creatin\'',
-    'creatinin',
-    'creation.',
-    'crecca',
-    'credi',
-    'crediou',
-    'credit-betting',
-    'credit-giving',
-    'credit-ratings',
-    'credit-using',
-    'creditation',
-    'creditors.',
     'credobank',
-    'credulousness',
-    'creechurch',
-    'creedence',
-    'creelman',
-    'creepin\'',
-    'creepiness',
-    'crefdl.com',
-    'crefdl.log',
-    'crehan',
-    'creina',
-    'cremate',
-    'crenellation',
-    'crenilabrus',
-    'crenulation',
-    'creole-like',
     'creole/',
-    'creolisation',
-    'crepe-soled',
-    'crepey',
-    'crescentia',
-    'cressid',
-    'cressington',
-    'creswick',
-    'creutzfeldt-jacob',
-    'crew-cuts',
-    'crewel',
-    'crewelwork',
-    'crewmembers',
-    'creyke',
-    'cricket-playing',
-    'cricketer(&pound;2)',
     'crik',
-    'crim.',
-    'crime-beating',
-    'crime-fighters',
-    'crime-rate',
-    'crime.',
-    'crimes.',
-    'criminale',
-    'criminalises',
-    'criminous',
-    'crimson-cheeked',
-    'crimsoned',
-    'cringely',
-    'crinkley',
-    'crinoidal',
-    'criollo',
     'crippler',
-    'crisis/hardship',
-    'crispest',
-    'crispian',
-    'crispum',
-    'cristata',
-    'critchett',
-    'criterias',
-    'criterion.',
-    'critical-point',
-    'critically/chronically',
-    'criticalness',
-    'critisises',
-    'critisism',
-    'crito',
-    'croakers',
     'croal',
-    'croat-controlled',
-    'croat-owned',
-    'croat-populated',
-    'croatian-populated',
-    'crocata',
-    'croches',
-    'croci',
-    'crockard',
-    'crockenburg',
-    'crocodil',
-    'crocodiled',
-    'croesor',
-    'croft-cooke',
-    'croft-murray',
-    'crofthouses',
     'croiffet',
-    'crois&eacute',
-    'crolles',
-    'cromatici',
-    'cromb',
-    'crombach',
-    'crombet',
-    'cromdale',
-    'cromptons',
-    'cromwells',
-    'cronos',
-    'cronyn',
-    'crook/buckinghamshire',
-    'crookall',
-    'crookback',
-    'crookshanks',
     'croonian',
-    'croonings',
-    'croot',
-    'crop-haired',
-    'crop-sprayers',
-    'cropheads',
-    'croquet-ground',
-    'cross-addicted',
-    'cross-application',
-    'cross-arm',
-    'cross-arts',
-    'cross-atlantic',
-    'cross-bones',
-    'cross-bunkers',
-    'cross-cambered',
-    'cross-compatible',
     'cross-compiler',
-    'cross-correlated',
-    'cross-countries',
-    'cross-coupled',
-    'cross-coupling',
-    'cross-denominational',
-    'cross-discipline',
-    'cross-dress',
-    'cross-european',
-    'cross-faults',
-    'cross-fertilized',
-    'cross-group',
-    'cross-layering',
-    'cross-nationally',
-    'cross-product',
-    'cross-profile',
     'cross-profiles',
-    'cross-promotion',
-    'cross-rails',
-    'cross-rhythm',
-    'cross-rotation',
-    'cross-routing',
-    'cross-slabs',
-    'cross-stage',
-    'cross-stitched',
-    'cross-strait',
-    'cross-streets',
-    'cross-striated',
-    'cross-team',
-    'cross-trading',
-    'cross-undertakings',
-    'cross-winds',
     'cross-wing',
-    'cross-wire',
-    'cross-wise',
-    'cross.section',
-    'cross/crescent',
-    'crossbeam',
-    'crossbow-bolts',
-    'crosscheck',
-    'crosschecked',
-    'crosse&amp;blackwell',
-    'crossers',
-    'crosses/corners',
-    'crossflow',
-    'crossford',
-    'crossgate',
-    'crosshall',
     'crossheads',
-    'crossley-payne',
-    'crossly.',
-    'crossons',
-    'crosspeak',
-    'crossplank',
-    'crossraguel',
-    'crossreactive',
-    'crosswood',
-    'crosswordsws20',
-    'croups',
-    'crousel-robelin',
-    'crow-pecked',
-    'crow-size',
-    'crowberries',
-    'crowd-flow',
     'crowd-free',
-    'crowdedness',
-    'crowfoots',
-    'crowmer',
-    'crowsfoot',
-    'crowston',
-    'crowtree',
-    'croy',
-    'croyde',
-    'croydon/wallington',
-    'crp2',
-    'crp3',
-    'crubain',
-    'crubeen',
-    'cruchard',
-    'cruchley',
     'crucian',
-    'crucifer',
-    'crucifies',
-    'cruciform-plan',
-    'cruciforms',
-    'crudites',
-    'cruelest',
-    'crug',
-    'crugs',
-    'cruise-missile',
-    'cruisermart',
-    'cruj&iacute;a',
-    'crumby',
-    'crunchingly',
-    'crunchy-topped',
-    'crundall',
     'crupper',
-    'crural',
-    'crusell',
-    'crushy',
-    'crusoe-like',
-    'crust-mantle',
-    'crusty-looking',
-    'crutchley',
-    'cruz-diez',
-    'crynant',
-    'cryohydrate',
-    'cryoprotective',
-    'cryoscopy',
-    'cryosphere',
-    'cryotherapy',
-    'cryoturbation',
     'cryptics',
-    'crypto',
-    'cryptococcal',
-    'cryptograms',
-    'cryptographers',
-    'cryptologists',
-    'crystaljet',
-    'crystalloids',
-    'crystalware',
-    'crystau',
-    'cs-3',
-    'cs-evoked',
-    'cs-x',
-    'cs3',
-    'csa-cypa',
-    'csallokozi',
     'cscb',
-    'cscl',
-    'cspd',
-    'csr1',
-    'cssd',
-    'ct17',
-    'ct9',
-    'ctesiphon',
-    'ctrl-k-b',
-    'ctrl-k-m',
-    'ctta',
-    'ctup',
-    'ctxa',
-    'cu-nim',
-    'cu2',
-    'cuban-born',
     'cuban-soviet',
-    'cubby-holes',
-    'cubbyholes',
-    'cubelets',
-    'cuberow',
-    'cubiques',
-    'cubito-anal',
-    'cubr',
-    'cubry',
-    'cubura',
-    'cuci',
-    'cuck-oos',
-    'cuckooed',
-    'cucullatus',
-    'cuddlier',
-    'cudgel-wielding',
     'cudgelling',
-    'cudi',
-    'cuds',
-    'cue/review',
-    'cue2',
-    'cuenta',
-    'cuentas',
-    'cueta',
-    'cuidado',
-    'cuileann',
-    'cuirim',
-    'cuius',
-    'cukierman',
-    'cul-de-thatcher',
-    'culdaff',
-    'culicifacies',
     'cullen/foal',
-    'cullender',
-    'culleton',
-    'cullifords',
-    'cullin',
-    'culminatory',
-    'culotte-shorts',
-    'culs-de',
-    'culsalmond',
-    'cult-image',
-    'cult-like',
-    'cultism',
-    'cultivatable',
-    'cultural-historical',
-    'cultural-linguistic',
-    'cultural/ideological',
     'cultural/religious',
-    'culture-based',
-    'cululative',
-    'culza',
-    'cumani-trained',
-    'cumb.',
-    'cumberlin/richard',
-    'cumbersome.',
-    'cumbersomely',
-    'cumbersomeness',
-    'cumerih',
-    'cumi-cumi',
-    'cumiskey',
-    'cummerbunds',
-    'cumont',
-    'cumplido',
     'cumulo',
-    'cumulo-nimbus',
-    'cunhaval',
-    'cunningham-burley',
-    'cunningness',
-    'cunt\'anas',
-    'cunt-lips',
-    'cuntie',
-    'cupboardful',
-    'cuprous',
-    'cuprum',
-    'cups/mugs',
-    'cupsful',
-    'curandero',
-    'cure.',
-    'curel',
     'curettings',
-    'curfew-knoll',
-    'curiemuirend',
-    'curious-looking',
-    'curiously-named',
-    'curists',
-    'curkurca',
-    'curlew-like',
-    'curlicued',
-    'curliness',
-    'curly-whirly',
-    'curn',
-    'currant-eyed',
-    'currell',
-    'current-derived',
-    'current.unit',
     'currentnode',
-    'curriemuir',
-    'currock',
-    'curry/friend',
-    'cursham',
-    'cursitor',
-    'cursitors',
-    'curson',
-    'curtain-makers',
-    'curtain-up',
-    'curtain-walled',
-    'curteis',
-    'curtesy',
-    'curtlingside',
-    'curton',
-    'curundu',
     'curve-fitting',
-    'curviness',
-    'cuscatlan',
-    'cusforth',
-    'cush',
-    'cushinan',
-    'cushion-shaped',
-    'cushitic',
-    'cuspal',
-    'cussi',
-    'custard-pie',
-    'custis/john',
-    'customer(s)',
-    'customer-focused',
-    'customer-friendly',
-    'customer-led',
     'customer.',
-    'customer/supplier',
-    'customisible',
-    'custy',
-    'cusumano',
-    'cut-and-run',
-    'cut-and-suck',
-    'cut-ins',
-    'cut-keys',
-    'cut-leaved',
-    'cut-throughs',
-    'cut/boost',
-    'cutdown',
-    'cute\'',
-    'cuthburh',
-    'cuticulin',
     'cuttance',
-    'cutting-tables',
-    'cuttino',
-    'cuvee',
-    'cuxhaven',
-    'cuylenburg',
-    'cv21',
-    'cvi',
-    'cvii',
-    'cviic',
-    'cviii',
-    'cw5',
-    'cwgc',
-    'cwpr',
-    'cwutils',
-    'cx486',
     'cxix',
-    'cxli',
-    'cxxiii',
-    'cy-a',
-    'cyanoferrates',
-    'cyanol',
-    'cyanotypes',
-    'cyathostomes',
-    'cybermen',
-    'cybilia',
-    'cyc1',
-    'cyclable',
-    'cyclamineus',
-    'cyclax',
-    'cycle-clips',
-    'cycletracks',
     'cycleway/path',
-    'cyclic-amp-regulated',
-    'cyclisation',
-    'cyclist-friendly',
-    'cycloalkanes',
-    'cyclohexene',
-    'cycloidal',
-    'cycloids',
-    'cyclopropane',
-    'cyclorrhaphan',
-    'cyclosporin-a',
-    'cyclostome',
-    'cyclostomes',
-    'cyclothyris',
-    'cyf/snowdonia',
-    'cyfyngedig',
     'cylic',
-    'cylinder-by-cylinder',
-    'cylindracea',
-    'cylindrica',
-    'cylink',
-    'cylla',
-    'cymbalo',
-    'cymmer',
-    'cyn',
-    'cynddelw',
-    'cyndi',
-    'cyneburh',
-    'cynewise',
-    'cynghanedd',
-    'cynheidre',
-    'cynically-minded',
     'cynlas',
-    'cynrik',
-    'cynth',
-    'cyrix-designed',
-    'cys-x',
-    'cystectomy',
-    'cysticercosis',
-    'cysticus',
-    'cystis',
-    'cystoscopic',
-    'cystosoma',
-    'cytidine',
-    'cytofluorimetric',
-    'cytokeratin',
-    'cytokinins',
-    'cytomegalic',
     'cytoplasmatic',
-    'cytoproliferative',
-    'cytoxicity',
-    'cyuma',
-    'cyzicus',
-    'cz',
-    'czech-o',
-    'czecho',
-    'czechoslavkia',
-    'czerkas',
-    'czermak',
-    'czirjak',
-    'd&aacute;valos',
-    'd&amp;w',
-    'd&bsol;a',
-    'd&bsol;b',
     'd&eacute;boneret&eacute',
-    'd&eacute;bris',
-    'd&eacute;buts',
-    'd&eacute;gagement',
-    'd&eacute;gustation',
-    'd&eacute;l&eacute;gation',
-    'd&eacute;lits',
-    'd&eacute;mocrats',
-    'd&eacute;n&eacute;r&eacute;az',
-    'd&eacute;part',
-    'd&eacute;partment',
-    'd&eacute;rain',
-    'd&eacute;s',
-    'd&eacute;shabill&eacute',
-    'd&eacute;ville',
-    'd&lsqb;uke&rsqb',
     'd&mdash;2',
-    'd&mdash;3',
-    'd&ndash;2',
-    'd&phgr',
-    'd&sharp',
-    'd&tgr',
-    'd&thgr',
-    'd&uacute;nem',
-    'd&uuml;mlein',
-    'd&uuml;nki',
-    'd&wcirc;r',
-    'd\'&eacute;cole',
-    'd\'&eacute;lite',
-    'd\'&eacute;t&eacute',
-    'd\'a&yuml',
-    'd\'abeville',
     'd\'abord',
-    'd\'accordo',
-    'd\'adonis',
-    'd\'agde',
-    'd\'agen',
-    'd\'agoult',
-    'd\'agrate',
-    'd\'aix',
-    'd\'albertine',
-    'd\'albon',
-    'd\'alva',
-    'd\'am&eacute;rique',
-    'd\'amboise',
-    'd\'ambrumenil',
-    'd\'amenagement',
-    'd\'amicos',
     'd\'angely',
-    'd\'anglais',
-    'd\'angleterre',
-    'd\'anie',
-    'd\'anjou',
-    'd\'appel',
-    'd\'appui',
-    'd\'aran',
-    'd\'architecture',
-    'd\'argentiere',
-    'd\'armagnac',
-    'd\'armaniac',
-    'd\'arras',
-    'd\'artillerie',
-    'd\'assisi',
-    'd\'asti',
     'd\'aumar',
-    'd\'avila/thamesdown',
-    'd\'avoir',
-    'd\'egypte',
-    'd\'eiffel',
-    'd\'elsa',
-    'd\'energie',
-    'd\'entrecasteaux',
-    'd\'epinay',
-    'd\'escosse',
-    'd\'espagnat',
-    'd\'essling',
-    'd\'estampes',
-    'd\'estrades',
-    'd\'etablissement',
-    'd\'europe',
     'd\'eve',
-    'd\'eyville',
-    'd\'garcy',
-    'd\'h&ocirc;te',
-    'd\'herelle',
-    'd\'hermine',
-    'd\'heux',
-    'd\'iakov',
-    'd\'instruments',
-    'd\'invention',
-    'd\'investissement',
-    'd\'isere/tignes',
-    'd\'italie',
-    'd\'jaga',
-    'd\'lssaux',
-    'd\'ludinghausen',
     'd\'oeil',
-    'd\'oie',
-    'd\'oisans',
-    'd\'oleron',
-    'd\'olivera',
-    'd\'oloron',
-    'd\'opale',
-    'd\'organo',
-    'd\'ormale',
-    'd\'orph&eacute;e',
-    'd\'osquich',
-    'd\'outre',
-    'd\'oysel',
-    'd\'thee',
-    'd\'ulisse',
-    'd\'unit&eacute',
     'd\'urbino',
-    'd\'urf&eacute',
-    'd\'urfey',
-    'd\'y',
-    'd\'ya',
-    'd(t)',
-    'd+',
-    'd+1',
-    'd-11',
-    'd-16',
-    'd-40nt',
-    'd-9000',
-    'd-base',
-    'd-decent',
-    'd-end',
-    'd-files',
     'd-h',
-    'd-o-g',
-    'd-sign',
-    'd-to-as',
-    'd-train',
-    'd-vs',
-    'd-y',
-    'd.&amp',
-    'd.10',
-    'd.1591',
-    'd.1631',
-    'd.2.a.',
-    'd.a.n.',
-    'd.e.s.k',
-    'd.h.s.s.',
-    'd.l.',
     'd.l.c.',
-    'd.m.u.',
-    'd.p.p.',
-    'd.r.h.',
-    'd.s.v.',
-    'd.subobscura',
-    'd.t.i.',
-    'd.viis',
-    'd.w.c.',
-    'd/00/22/0002',
-    'd/00/23/0078',
-    'd/00/23/0085',
-    'd/00/23/2010',
-    'd/00/23/2018',
-    'd/00/23/2025',
-    'd/00/23/2027',
     'd/00/23/2041',
-    'd/00/23/2044',
-    'd/00/23/2049',
-    'd/00/23/2051',
-    'd/00/23/2052',
-    'd/00/23/2055',
-    'd/00/23/2070',
-    'd/00/23/2072',
-    'd/00/23/2077',
-    'd/00/23/2092',
-    'd/00/23/2093',
-    'd/00/23/2096',
-    'd/00/23/2100',
-    'd/00/23/2104',
-    'd/00/23/2106',
-    'd/00/23/2111',
     'd/00/23/2115',
-    'd/00/23/2122',
-    'd/00/23/2124',
-    'd/00/23/2126',
-    'd/00/23/2127',
-    'd/00/23/2136',
-    'd/00/23/2139',
-    'd/00/23/2147',
-    'd/00/23/2155',
-    'd/00/23/2175',
-    'd/00/23/2176',
-    'd/00/23/2203',
-    'd/00/23/2224',
-    'd/00/24/2003',
-    'd/00/24/2006',
-    'd/00/25/0009',
     'd/00/25/0011',
-    'd/00/25/0012',
-    'd/00/25/0014',
-    'd/01/23/0024',
-    'd/01/23/0029',
-    'd/01/23/0030',
-    'd/01/23/0033',
-    'd/01/23/0036',
-    'd/01/23/0037',
-    'd/02/25/0001',
-    'd/02/25/0002',
-    'd/02/25/0005',
-    'd/03/25/0015',
-    'd/03/25/0016',
-    'd/06/25/0005',
-    'd/06/25/0017',
     'd/06/27/0003',
-    'd/2',
-    'd/88/05',
-    'd/r',
-    'd1.1',
-    'd12\'s',
-    'd16',
-    'd1d2',
-    'd2000',
-    'd21',
-    'd234',
-    'd25',
-    'd3+1',
-    'd306',
-    'd3a1',
-    'd4+',
     'd4+1',
-    'd410',
-    'd5410',
-    'd6+1',
-    'd70',
-    'd7633',
-    'd9516',
-    'd9523',
-    'd9529',
-    'd:cohesion',
-    'd=0',
-    'd=0.5',
-    'daa',
-    'daawa',
-    'dabhk',
-    'dabrell',
     'dac1',
-    'dacent',
-    'dacey',
-    'dacite',
-    'dack',
-    'dactylorhiza',
-    'dad-in-law',
-    'dadadadada',
-    'dadar',
-    'dadas',
-    'daddy-o',
-    'dadf&amp;sharp',
-    'dados',
-    'dads-to-be',
-    'daedalian',
-    'daek',
     'dael',
-    'daele',
-    'daele/associate',
-    'dagestan',
-    'dagge',
-    'dagger-like',
-    'dagging',
-    'dagh',
-    'dagnall',
-    'dagoes',
-    'dagonet',
-    'dagwood',
-    'dahil',
-    'dahlberg',
-    'dahling',
-    'dahomean',
     'dahruj',
-    'dailiness',
-    'daily&times;number',
-    'daini',
-    'daintith',
-    'daion',
-    'daiquiris',
-    'dairy-cow',
-    'daisey',
-    'daisy-flowered',
-    'daisy-sprinkled',
-    'daisywheel',
-    'daitlers',
-    'dakkabug',
-    'dakleton',
-    'dakota-based',
     'daks-simpson',
-    'dakyns',
-    'dal-led',
-    'dala',
-    'dalangs',
-    'dalasi',
-    'dalavich',
-    'daldis',
-    'daldry',
-    'dalegarth',
-    'dalesmade',
-    'dalgas',
-    'dalgetty',
-    'daliba',
-    'dalin',
-    'dalkamoni',
     'dalkania',
-    'dallin',
-    'dalmally',
-    'dalmarnock',
-    'dalmas',
-    'dalness',
-    'dalo',
-    'dalou',
-    'dalswinton',
-    'daltonon-tees',
-    'dalyson',
-    'dam-busters',
-    'damaen',
-    'damag&rehy;ing',
-    'damara',
-    'damascenes',
     'damasus',
-    'damavand',
-    'dambenzet',
-    'dambuster',
-    'damery',
-    'damiba',
-    'damjanovski',
-    'damlamian',
-    'dammars',
-    'damn-near',
-    'damnations',
-    'damoiseaux',
-    'damp-proofed',
-    'damp-smelling',
-    'damp-stained',
-    'damyat',
     'damyl',
-    'dan-y-bont',
-    'dan-z',
-    'danann',
-    'dance-bands',
-    'danchem',
-    'dancing-girls',
-    'dandai',
-    'dandling',
-    'dandois',
-    'dandzangiyn',
-    'danek',
-    'dang\'rous',
-    'danger-spots',
-    'dangermond',
-    'danh',
     'danican',
-    'danida',
-    'daniel/millward',
-    'danielli',
-    'daniels/house',
-    'danies',
-    'danii',
-    'danilova',
-    'danischewsky',
-    'danish-based',
-    'danish-born',
-    'danish-owned',
-    'dankwerts',
-    'dannebrog',
-    'dannie',
-    'danniella',
     'danns',
-    'dano',
-    'danoy',
-    'dansant',
-    'danseco',
-    'dansproduktie',
-    'danthine',
-    'dantos-91',
-    'dantrolene',
-    'dantzic',
-    'daoists',
-    'daouad',
-    'daphn&eacute',
-    'dapperly',
-    'dapporto',
-    'dara\'iyyah',
     'darboven',
-    'darby/county',
-    'darcians',
-    'darcies',
-    'dardanelle',
-    'darden',
-    'dare-devils',
-    'daredevilry',
-    'dargaville',
-    'darics',
-    'darique',
-    'dark-dark-grey',
-    'dark-fringed',
-    'dark-greens',
-    'dark-headed',
-    'dark-robed',
     'dark-spotted',
-    'dark-tipped',
-    'dark-yellow',
-    'darkenin',
-    'darkfalls',
-    'darkinbad',
-    'darkly-stained',
-    'darknesses',
-    'darleston',
-    'darlingest',
-    'darlington/saltburn',
-    'darlingtonians',
-    'darlingtons',
-    'darmowiyoto',
-    'darnedest',
-    'darney',
     'darns',
-    'darnton',
-    'darra',
-    'darrah',
-    'darran',
-    'darrawish',
-    'darshan',
-    'darsi&egrave;res',
-    'dart-playing',
-    'darul',
-    'darvi',
-    'darvill',
-    'darwent',
-    'darwinii',
-    'darwins',
-    'dasaratha',
     'dasent',
-    'dash-mounted',
-    'dash-pot',
-    'dash-pots',
-    'dashed-off',
-    'dashiel',
-    'dashpots',
-    'dassault-breguet',
-    'dassert',
-    'data-cubes',
-    'data-like',
-    'data-manipulation',
-    'data-modelling',
-    'data-object',
-    'data-processor',
-    'data-warehousing',
     'data.processing',
-    'database-style',
-    'databases.',
-    'datacentres',
-    'datacommunications',
-    'datacorder',
-    'datadase',
-    'datahub',
-    'datalogger',
-    'datalogger/photoioniser',
-    'datalogics',
-    'datametrics',
-    'datareive',
-    'datasolve',
-    'datastar',
-    'datastrom',
     'datatrak',
-    'datatronix',
-    'datchworth',
-    'date/time/place',
-    'dated.',
-    'datemarks',
-    'dates.',
-    'datings',
-    'dation',
-    'datir',
-    'datost',
-    'daturas',
-    'daubert',
-    'daubings',
-    'dauda',
-    'daugh',
     'daughter-',
-    'daughter-cities',
-    'daughter-city',
-    'daughter-in-laws',
-    'daughterboard',
-    'dauney',
-    'daunorubicin',
-    'dauntlessness',
-    'dauphiness',
-    'daurah',
-    'dauto',
-    'daver',
-    'david-neel',
-    'davidson/quartermaster',
-    'davidstow',
-    'davies-gilbert',
     'davies/eyewitness',
-    'davies/thames',
-    'davies/west',
-    'davieses',
-    'davinia',
-    'daviot',
-    'davis/earlys',
-    'davis/nelson',
-    'davitt',
-    'davlat',
-    'davox',
-    'davson',
-    'davstone',
-    'davyum',
-    'dawamat',
-    'dawie',
     'dawn-to-dusk',
-    'dawnings',
-    'dawnlight',
-    'dawud',
-    'daxer',
-    'day&ndash;to&ndash;day',
-    'day&rehy;stages',
-    'day-and-a-half',
-    'day-centres',
-    'day-hunting',
-    'day-labourers',
-    'day-pack',
-    'day-rooms',
-    'day-schools',
-    'day-workers',
-    'day.it',
     'day/date',
-    'day/time',
-    'day/weekend',
-    'dayadhuam',
-    'daybeds',
-    'daybook',
-    'daylamis',
-    'dayly',
-    'daymer',
-    'days-at-sea',
-    'days/2',
-    'days/occasionally/rarely/never',
-    'dayschool',
-    'dayschools',
-    'dayson',
-    'daytripper',
     'dayworks',
-    'dazzle-painted',
-    'db-lib',
-    'db-library',
-    'db/octave',
-    'db15',
-    'db2/2',
-    'db2/600',
-    'db4',
-    'dbfast',
-    'dbg',
-    'dbmc',
-    'dbrw',
-    'dc-10-10',
-    'dc-2031',
-    'dc-600',
     'dc-6s',
-    'dc10',
-    'dc10s',
-    'dcdc',
-    'dcp614',
-    'dcs/',
-    'dd-unemployment',
-    'dd1',
-    'dd9-e7',
-    'ddafydd',
-    'ddcs/6000',
-    'dddddddddddddd',
-    'ddmmyy',
-    'ddoe',
-    'dds/patrol',
-    'de&rehy;industrialisation',
     'de-accessioned',
-    'de-caff',
-    'de-centralisers',
-    'de-centralising',
-    'de-communization',
-    'de-compress',
-    'de-controlled',
-    'de-democratization',
-    'de-hardening',
-    'de-hospitalized',
-    'de-ice',
-    'de-indoctrination',
-    'de-institutionalisation',
-    'de-ioniser',
-    'de-materialisation',
-    'de-mergers',
     'de-mister',
-    'de-motivate',
-    'de-natured',
-    'de-pollution',
-    'de-program',
-    'de-recognise',
-    'de-recognize',
-    'de-register',
-    'de-regulate',
-    'de-selections',
-    'de-stabilize',
-    'de-stocking',
-    'de-sulphurization',
-    'de-tan',
-    'de-tune',
-    'de-umpty',
     'de-worming',
-    'de/dr',
-    'de/dt',
-    'de3',
-    'de_deux',
-    'deaccessions',
-    'dead-meat',
-    'dead-on',
-    'dead-reckoned',
-    'deadball',
-    'deadful',
-    'deadmeat',
-    'deafferentation',
-    'deah',
-    'deal-maker',
-    'dealers.',
     'dealing-room',
-    'dealion',
-    'dealions',
-    'dealmaker',
-    'dealtry',
-    'deamer',
-    'dean-shaven',
-    'dean/scotland',
-    'deanfield',
-    'deanston',
-    'dear-achieved',
-    'dear-but',
-    'dearness',
-    'dearnley',
-    'deassign',
-    'deassigned',
     'deasy',
-    'death&mdash;the',
-    'death-camps',
-    'death-case',
-    'death-penalty',
-    'death-toll',
-    'death.the',
-    'death/',
-    'death/rode',
-    'deathbats',
-    'deathbeds',
-    'deathknell',
-    'debases',
-    'debated.so',
-    'debauches',
-    'debayle',
     'debdens',
-    'debenham/dna',
-    'debernardi',
-    'debilitative',
-    'debito',
-    'debmat',
-    'debonaire',
-    'debounced',
-    'debrided',
-    'debris-flows',
-    'debt-burden',
-    'debt-free',
-    'debt-interest',
-    'debt-payment',
-    'debt-to-gdp',
-    'debt4',
     'dec-microsoft',
-    'dec.1',
-    'dec/vms',
-    'decades-long',
-    'decades-old',
-    'decal',
-    'decals',
-    'decans',
-    'decapeptide',
-    'decapitans',
-    'decarteret',
-    'deccie',
-    'deceent',
-    'decelx',
-    'december-1',
-    'december-7',
     'december-january',
-    'decemlineata',
-    'decent-size',
-    'dechen',
-    'dechlorinator',
-    'deciles',
-    'decimally',
-    'decision-problem',
-    'decision.making',
-    'decisionis',
-    'decisionmedical',
-    'decisons',
-    'deck-shoes',
-    'decker-slaney',
-    'declaratives',
-    'declassify',
     'declensions',
-    'decline.',
-    'declined.',
-    'decodable',
-    'decolletage',
-    'decolourise',
-    'decomposers',
-    'decompressing',
-    'deconcini',
-    'decongestion',
-    'deconsecration',
-    'deconversion',
-    'decorrelation',
-    'decorus',
-    'decourtray',
-    'decoyed',
     'decrane',
-    'decreasings',
-    'decreets',
-    'decrementing',
-    'decribed',
-    'decrypts',
-    'decsion',
-    'decst',
-    'decsystems',
-    'decussated',
-    'decvoicebuilder',
-    'deddle',
-    'dede',
-    'dedicatedly',
-    'dedinje',
-    'dedit',
     'deditio',
-    'dedlocks',
-    'dedolomitisation',
-    'dee-dah',
-    'deebs',
-    'deedee',
-    'deen',
-    'deeney',
-    'deep&rehy;rooted',
-    'deep-conditioning',
-    'deep-crowned',
-    'deep-discount',
-    'deep-disposal',
-    'deep-going',
-    'deep-keeled',
-    'deep-laid',
     'deep-litter',
-    'deep-pocket',
-    'deep-red',
-    'deep-seal',
-    'deep-space',
-    'deep-yellow',
-    'deepa',
-    'deepend',
-    'deeper-level',
-    'deeper-seated',
-    'deepsea',
-    'deer-hunting',
-    'deer-stalkers',
-    'deerhounds',
-    'deerlike',
-    'deerne',
     'deese',
-    'deesiders',
-    'deetz',
-    'defaecating',
-    'defaecatory',
-    'defazio',
-    'defcon',
-    'defectively',
-    'defeet',
-    'defemination',
-    'defence-line',
-    'defence-splitting',
-    'defencism',
-    'defendant/respondent',
-    'defendants.',
-    'defenestrations',
     'defensibility',
-    'defensively-minded',
-    'deferrals',
-    'deficit.',
-    'defiler',
-    'defined-contribution',
-    'defines/explains',
-    'definiendum',
-    'definiens',
-    'deflations',
-    'deflective',
-    'defocusing',
-    'defreites',
-    'defter',
-    'deftest',
-    'deglycosylation',
     'degni',
-    'degolyer',
-    'degr&eacute',
-    'degress',
-    'degressive',
-    'deguerin',
-    'dehesas',
-    'dehistoricizes',
-    'dehlavi',
-    'dehler',
-    'dehloran',
-    'dehorn',
-    'dehors',
-    'dehumanizes',
-    'dehydrators',
-    'dehydrogenation',
     'dei_gratia',
-    'deiciency',
-    'deinde',
-    'deindustrialising',
-    'deinen',
-    'deinonychosaurs',
-    'deinstallations',
-    'deinstitutionalised',
-    'deioniser',
-    'dejected-looking',
-    'dejene',
-    'dejmal',
-    'dejong/ap',
-    'dekasegi',
-    'deklerk',
-    'delabere',
     'delafosse',
-    'delage',
-    'delagoa',
-    'delahunt/sports',
-    'delaminate',
-    'delancey',
-    'delancy',
-    'delap',
-    'delapage',
-    'delaphena',
-    'delarden',
-    'delated',
-    'delavaud',
-    'delbaere',
-    'delbanco',
-    'delbert',
     'delderfield',
-    'delegater',
-    'delestre',
-    'deletions.',
-    'deleza',
-    'delfin',
-    'delfs',
-    'delft-based',
-    'delhay',
-    'delhi&ndash;jaipur',
-    'delhi&ndash;london',
-    'deli-diner',
-    'deliciae',
-    'deliciosa',
-    'delicts',
-    'delighteth',
     'delightfulness',
-    'delima',
-    'delimitations',
-    'delineations',
-    'delinkage',
-    'delinquent-prone',
-    'delinquently',
-    'delion/hoddle',
-    'delipidation',
-    'deliquesce',
-    'dell\'abbate',
-    'dell\'ombrellino',
-    'dellow',
-    'delmenhorst',
-    'delmer',
-    'delore',
     'delores',
-    'delphicly',
-    'delphinidae',
-    'delphinids',
-    'delporto',
-    'delsol-innocenzi',
-    'delta-epsilon',
-    'deltrintem',
-    'deluca',
-    'deludes',
-    'deluise',
-    'delusionary',
-    'deluz',
-    'delvings',
-    'demachy',
-    'demand-aggregate',
     'demand-driven',
-    'demanning',
-    'dematerialization',
-    'dematurity',
-    'demeester-johnson',
-    'demek',
-    'demethylation',
-    'demetri',
-    'demi-heure',
-    'demi-mondaine',
-    'demi-pirouette',
-    'demi-sel',
-    'demidov',
-    'demijohns',
-    'demise.',
-    'demister',
     'demit',
-    'demitted',
-    'demixing',
-    'demobilisers',
-    'demobilizations',
-    'democracy-society',
-    'democrat-inclined',
-    'democrata',
-    'democratic-bourgeois',
-    'democratica',
-    'democrats&mdash;see',
-    'demodulation',
-    'demokraattinen',
-    'demokratia',
-    'demokratik',
-    'demokratika',
     'demokratska',
-    'demokratski',
-    'demokratyczna',
-    'demolished.',
-    'demon-king',
-    'demonax',
-    'demonisation',
-    'demonstrativeness',
-    'demonstratum',
-    'demoralizes',
-    'demotes',
-    'demotivation',
-    'demotivators',
-    'dempers',
-    'demsel',
-    'demszky',
     'denaby',
-    'denationalizing',
-    'denberies',
-    'denden',
-    'dendrochronological',
-    'dendrochronologist',
-    'dendrocoelum',
-    'dendroid',
-    'dendrologists',
-    'dene-metis',
-    'denegri',
-    'denenberg',
-    'deng-led',
-    'dengra',
-    'denitrify',
-    'denley',
     'denmac',
-    'denosovich',
-    'denotations',
-    'denouements',
-    'densely-packed',
-    'densen',
-    'densil',
-    'density-matrix',
-    'denstone',
-    'dent/aged',
-    'dent/oxfordshire',
-    'dental-records',
-    'dentalium',
-    'dente',
-    'dentelle',
-    'denticulata',
     'denudational',
-    'denunciationists',
-    'denwick',
-    'denzin',
-    'deodadus',
-    'deodatus',
-    'deontological',
-    'deoxynucleotide',
-    'depar',
-    'deparaffinisation',
-    'departmentalization',
-    'departmentalized',
-    'depassier',
-    'depen',
-    'depend.',
-    'dependance',
     'dependancy',
-    'dependence/addiction',
-    'depersonalise',
-    'depex',
-    'dephosphorization',
-    'depit',
-    'deplane',
-    'deploratio',
-    'depocentre',
-    'depolarizer',
-    'deports',
-    'deposit(s)',
-    'deposit-holders',
-    'deposits.',
-    'depotentiate',
-    'depower',
     'deppity',
-    'depravation',
-    'depravities',
-    'depredators',
-    'depression.',
-    'depressors',
-    'dept-name',
-    'depth-dependent',
-    'depth-related',
-    'depthless',
-    'depts.',
-    'depuis',
-    'depute-fiscal',
-    'deputies.',
-    'deputizes',
-    'deputy-chairman',
     'derains',
-    'derangements',
-    'deranges',
-    'derby-winning',
-    'derechos',
-    'deregister',
-    'deregulators',
-    'deresan',
-    'derimanoczy',
-    'derivationally',
-    'derkinderen',
-    'derl',
-    'derm&eacute;e',
-    'derma',
-    'dermato-venereology',
-    'dermatobia',
     'dernley/former',
-    'derogant',
-    'derogates',
-    'derogating',
-    'derogatorily',
-    'deroualt',
-    'derravarragh',
-    'dervaig',
-    'derwen',
-    'derwendeg',
-    'derwig',
-    'desamperados',
-    'desaturases',
-    'descaves',
-    'descendance',
-    'descendible',
     'descente',
-    'deschamp',
-    'descripton',
-    'desecrations',
-    'desegregated',
-    'desenfans',
-    'deserbais',
-    'desert-dwellers',
-    'deserted-looking',
-    'deserti',
-    'desertisation',
-    'deserts.',
-    'desexualisation',
-    'desferrioxamine',
-    'desford',
-    'desh',
     'deshayes',
-    'desiatin',
-    'desiccate',
-    'desideria',
-    'desierto',
-    'design-conscious',
-    'design-wise',
-    'design/build',
-    'design/computer-aided',
-    'design/implementation',
-    'design/layout',
-    'design/production',
-    'designer-dressed',
-    'designs.',
-    'designs/irregular',
-    'desinor',
     'desir&eacute;e',
-    'desireable',
-    'desk/',
-    'desklamp',
-    'deskscan/ux',
-    'desktop-centric',
-    'desktop-to-unix',
-    'desmid',
-    'desmids',
-    'desmoid',
-    'desp\'rate',
-    'desparately',
-    'desperados',
-    'despire',
-    'despoblados',
-    'despondence',
     'despotate',
-    'desserprit',
-    'desserte',
-    'destabilizations',
-    'destabilizer',
-    'destalinisation',
-    'deste',
-    'destinov&aacute',
-    'destour',
-    'destoyed',
-    'destriers',
-    'destroyed.',
-    'destructive\'',
-    'detachabead',
-    'detains',
-    'detangle',
     'detchant',
-    'detectioun',
-    'detective-work',
-    'detenamo',
-    'detention-camp',
-    'detergent-based',
-    'deteriorations',
-    'determinantal',
-    'determinator',
-    'determined-looking',
-    'determing',
-    'deterministically',
-    'deteroriate',
-    'detmold',
-    'detouring',
-    'detrain',
     'detroiters',
-    'detrunk',
-    'detterding',
-    'detton',
-    'detumescence',
-    'detumescent',
-    'deucedly',
-    'deuces',
-    'deudsche',
-    'deuocioun',
-    'deval',
-    'devanna',
-    'devarda',
-    'devasting',
-    'development-area',
-    'development-control',
     'development/equal',
-    'develped',
-    'devenishes',
-    'deverall',
-    'devergie',
-    'deverils',
-    'devesi',
-    'deviationists',
-    'device/full',
-    'device=ansi.sys',
-    'devicename',
-    'devicenzo',
-    'deving',
-    'devitalised',
-    'devitrified',
-    'devoe',
     'devolutionary',
-    'devolutionist',
-    'devonshires',
-    'devoran',
-    'devorando',
-    'devotionally',
-    'devoto',
-    'devstation',
-    'dew-claws',
-    'dew-drop',
-    'dew-fresh',
-    'dew-laden',
-    'dewell',
-    'dewerstone',
-    'dewick',
-    'dewing',
     'dewji',
-    'dewniors',
-    'dewry',
-    'dewsland',
-    'dexter/gloucestershire',
-    'dextris',
-    'dezi',
-    'df/sms',
-    'df118s',
-    'df=12',
-    'df=8',
-    'dfda',
-    'dfdp',
-    'dfdrs',
-    'dfl.12',
-    'dfl100,000&ndash;150,000',
     'dfss',
-    'dgc',
-    'dgs',
-    'dh.60',
-    'dh.88',
-    'dh7',
-    'dhaba',
-    'dhabas',
-    'dhahran2',
-    'dhair',
-    'dhanik',
-    'dhaniram',
-    'dharjee',
-    'dharman',
-    'dharmashala',
-    'dharmsala',
     'dhg',
-    'dhillon',
-    'dhivehi',
-    'dhotis',
-    'dhrogorati',
-    'dhrystones',
-    'dht',
-    'dhuqan',
-    'di\'',
-    'di-deoxy',
-    'di-methile',
-    'di/dt',
-    'diabelli',
-    'diabetologist',
-    'diabolos',
-    'diachroneity',
     'diacogiannis',
-    'diag(1,2,3)',
-    'diagnosis/malfunction',
-    'diagnosis/treatment',
-    'diagrams.',
-    'dialaphone',
-    'dialect-divergence',
-    'dialectally',
-    'dialectician',
-    'dialectologist',
-    'dialer',
-    'dialstone',
-    'dialup',
-    'dialy',
-    'diamantes',
-    'diameter(c)',
     'diamond-paned',
-    'diao',
-    'diaphot',
-    'diapirs',
-    'diarrhea',
-    'diasopan',
-    'diaster',
-    'diatomites',
-    'diazinon',
-    'dibal',
-    'diborane',
-    'dicebox',
-    'dicers',
-    'dices',
-    'dichograptus',
-    'dichterliebe',
     'dick-nixs',
-    'dickemann',
-    'dickers',
-    'dickie.bamber',
-    'dickinson/museum',
-    'dicop',
-    'dicranum',
-    'dictes',
-    'dictionarie',
-    'dictorial',
-    'dicunt',
-    'dicy',
-    'diczfalusy',
-    'did_a',
-    'diddledy',
-    'dids\'t',
     'die\'',
-    'die-linked',
-    'die-offs',
-    'diebstahl',
-    'diel',
-    'dielectrically',
-    'diemens',
-    'diems',
-    'dieng',
-    'dientzenhofers',
-    'diesel-driven',
-    'diesel-mechanical',
-    'diesel/petrol',
-    'dieser',
-    'diessenhofen',
-    'diestelkamp',
     'diet-based',
-    'diet-conscious',
-    'diet.',
-    'dieterich',
-    'diether',
-    'diethylhydroxylamine',
-    'diethylpyrocarbonate',
-    'dieudonne',
-    'diff\'rence',
-    'diff-lock',
-    'different-patterned',
-    'differenti',
-    'difficuity',
-    'difficult-to-let',
-    'diffident\'',
-    'diffil',
     'diffractometer',
-    'difft.',
-    'diffusa',
-    'diffuser/dryer',
-    'diffusion.',
-    'diffusionists',
-    'difluoride',
-    'difunctional',
-    'digance',
-    'digbeth',
-    'digestifs',
-    'digestively',
-    'digfar',
-    'digfer',
-    'digges',
-    'dighe',
     'dight',
-    'digistat',
-    'digital-video',
-    'digitals',
-    'digitaria',
-    'digitate',
-    'digitis',
-    'diglis',
-    'dignifies',
-    'dignit&eacute',
-    'dignitarian',
-    'dignitatum',
-    'dignitie',
-    'digo',
-    'diguanides',
-    'dihydrate',
     'dihydrogen',
-    'dihydropyridine',
-    'dijker',
-    'dik&eacute;0',
-    'dikfer',
-    'diktaian',
-    'dilations',
-    'dilettantes',
-    'dillan',
-    'dilli',
-    'dillington',
-    'dillon-lee',
-    'dim-eyed',
-    'dim-sum',
-    'dimercaprol',
-    'dimercurial',
     'dimethylformamide',
-    'dimethylsulfate',
-    'diminished-responsibility',
-    'diminutions',
-    'dimitru',
-    'dimitry',
-    'dimokratikis',
-    'dimona',
-    'dimov',
-    'dimson',
-    'dincerler',
-    'dincote',
-    'dineage',
-    'dinerstein',
-    'dinged',
-    'dinghys',
     'dingledine',
-    'dinkas',
-    'dinkeloo',
-    'dinki-doodi-den',
-    'dinkys',
-    'dinmont',
-    'dinner-dates',
-    'dinner-plates',
-    'dinnerware',
-    'dinnie',
-    'dinnington',
-    'dinobore',
-    'dinoff',
-    'dinoso',
-    'dints',
-    'diocesans',
     'dioclesian',
-    'diode-capacitor',
-    'dioecy',
-    'dioicus',
-    'diolch',
-    'dionysios',
-    'dioxin-laden',
-    'dioxin-like',
-    'dip-in',
-    'dip-shit',
-    'dip.h.e.',
-    'dip.he/bed.',
-    'dip.hes',
-    'diphenhydramine',
-    'diphenyl',
-    'diploblasts',
     'diplodocuses',
-    'diploidy',
-    'diploma/ma',
-    'diplomaticus',
-    'diplomonad',
-    'diplopia',
-    'dipnois',
-    'diprivan',
-    'dipslide',
-    'dipsticks',
-    'dipterous',
-    'dipthongisation',
-    'dipton',
-    'dir&mdash;integ&mdash;chk.log',
-    'diran',
-    'dirbe',
     'dirce',
-    'direct-labour',
-    'direct-memory',
-    'direct/indirect',
-    'direction-independent',
-    'directions.',
-    'director-elect',
-    'director-general-designate',
-    'director-generalship',
-    'director-secretary',
-    'director-shareholders',
-    'director/oxfam',
-    'directors/shareholders',
-    'directus',
-    'direr',
-    'diretissima',
     'dirhams',
-    'diriger',
-    'dirigieren',
-    'dirschau',
-    'dirt-smeared',
-    'dirt-streaked',
-    'diruta',
-    'dis-aster',
-    'dis-information',
-    'dis-obey',
-    'disabilities.',
-    'disability.',
-    'disabled*',
-    'disabled_because',
-    'disabusing',
-    'disaccharidases',
     'disaccharides',
-    'disaffinity',
-    'disanalogies',
-    'disappear.',
-    'disappeareds',
-    'disapplying',
-    'disappointed.',
-    'disarrangement',
-    'disarticulates',
-    'disassociates',
-    'disassociating',
-    'disaster-prone',
-    'disaster-relief',
-    'disbar',
-    'disbelieves',
-    'disburden',
     'disc-like',
-    'discernably',
-    'discharged.',
-    'discipline-specific',
-    'disclosable',
-    'disclosed.',
-    'disco-bats',
-    'disco-dancers',
-    'discods',
-    'discombobulated',
-    'disconcerts',
-    'disconnectedness',
-    'discontent\'',
-    'discontentedly',
-    'discontinues',
-    'discos.',
     'discourse-oriented',
-    'discoursive',
-    'discourteously',
-    'discoverd',
-    'discreetest',
-    'discretes',
-    'discretional',
-    'discriminably',
-    'discriminated-against',
-    'discu',
-    'discussion/homework',
-    'diseas',
-    'disease-of-the-month',
-    'disembarrass',
-    'disembowelment',
-    'disentailment',
     'disentitle',
-    'disentitling',
-    'diseuse',
-    'disfunction',
-    'disgorges',
-    'disgruntledly',
-    'disgussin',
-    'disgusto',
-    'dish-king',
-    'dish-washers',
-    'disharmonious',
-    'dishevelling',
-    'dishrack',
-    'dishtowel',
-    'dishwasher-safe',
-    'disick',
     'disimpact',
-    'disinflationary',
-    'disinfrancised',
-    'disinhibition',
-    'disintegrations',
-    'disinterring',
-    'disinvited',
-    'disjoins',
-    'disjointedness',
-    'disjunctively',
-    'disk-based',
-    'disk-resident',
-    'dismantlement',
-    'dismas',
-    'dismays',
-    'dismissal.',
     'dismissiveness',
-    'disny',
-    'disoblige',
-    'disopyramide',
-    'disorder.',
-    'disorientates',
-    'disorientation.',
-    'disorientations',
-    'dispargum',
-    'dispatchers',
-    'dispend',
-    'dispensaires',
-    'dispensible',
-    'dispersants',
-    'dispersement',
-    'disperser',
     'dispersion-shifted',
-    'displex',
-    'disponee',
-    'disponees',
-    'disponibilit&eacute',
-    'disported',
-    'disposition.',
-    'dispossessor',
-    'disproportionalities',
-    'dispur',
-    'dispute-settlements',
-    'disputes.',
-    'disqualified.',
-    'disquieteth',
-    'disregarded.',
-    'disrobe',
     'dissapearance',
-    'dissapointing',
-    'dissecans',
-    'dissembled',
-    'dissentients',
-    'dissention',
-    'dissertation/project',
-    'dissimulate',
-    'dissipatively',
-    'dissolvent',
-    'dissuader',
-    'distaffs',
-    'distanciation',
-    'distin',
-    'distinctiveness/equivalence',
-    'distinctives',
     'distington',
-    'distinguishably',
-    'distinguisher',
-    'distortionless',
-    'distractible',
-    'distraints',
-    'distraite',
-    'distri',
-    'distrib',
-    'distributism',
-    'distributor-level',
-    'district-nursing',
-    'distrito',
-    'distroy',
-    'distur',
-    'disunion',
     'disusting',
-    'disyllabic/polysyllabic',
-    'disyllable',
-    'ditchford',
-    'ditchwater',
-    'ditherer',
-    'dittborn',
-    'dittie',
-    'dittoed',
-    'ditz',
-    'diurnall',
-    'diuron',
-    'divadlo',
-    'dive-bombs',
-    'divergently',
-    'diversifiable',
     'diversifiers',
-    'diversion.',
-    'divertor',
-    'divertors',
-    'dividedness',
-    'divin',
-    'divinas',
-    'divinations',
-    'divinator',
-    'divinatory',
-    'divinitie',
-    'divinitive',
-    'divinsky',
-    'division-project',
-    'division/department',
-    'division/new',
     'divisional-hq',
-    'divisions.',
-    'divock',
-    'divoky',
-    'divorce.',
-    'divulgence',
-    'divvie',
-    'dix-huiti&egrave;me',
-    'dixey',
-    'dizdarevic',
-    'dizygous',
-    'dizzie',
-    'dizzy-making',
-    'djakarta',
-    'djamolidine',
-    'djassi',
     'djed',
-    'djemaa',
-    'djh',
-    'djiboutien',
-    'djumgalbek',
-    'djv',
-    'dkb',
-    'dl-101',
-    'dl2',
-    'dlc/llc',
-    'dlitt',
-    'dlm',
-    'dlugy',
-    'dm&lt;t',
-    'dm0.5',
-    'dm1.00=85',
     'dm1.8',
-    'dm100m',
-    'dm107,000,000',
-    'dm13',
-    'dm15,000',
-    'dm150',
-    'dm150&ndash;200,000',
-    'dm168',
-    'dm198',
-    'dm1m',
-    'dm2',
-    'dm2.25',
-    'dm2.5',
-    'dm2.70',
-    'dm2.8308',
-    'dm2.9537',
     'dm2.9595',
-    'dm2.96',
-    'dm200,000',
-    'dm21',
-    'dm221',
-    'dm298',
-    'dm3,500',
-    'dm3,600',
-    'dm3.20',
-    'dm3.3',
-    'dm3.93',
-    'dm300,000',
-    'dm35',
-    'dm35,000',
-    'dm38,000',
-    'dm380,000',
     'dm39',
-    'dm39,800',
-    'dm39.8m',
-    'dm4',
-    'dm4.02',
-    'dm40,000',
-    'dm40.8m',
-    'dm44,000',
-    'dm5',
-    'dm50,000',
-    'dm500',
-    'dm52,000',
-    'dm6,800',
-    'dm7',
-    'dm70',
-    'dm7b5',
     'dm80',
-    'dm9,000',
-    'dm900m',
-    'dm94',
-    'dmcl',
-    'dme-like',
-    'dmem/10%fcs',
-    'dmg',
-    'dmitrov',
-    'dmk-jd',
-    'dmna',
-    'dmstlb4281',
-    'dmvs',
-    'dmx',
-    'dmytryk',
-    'dmytryshyn',
     'dn15',
-    'dn6',
-    'dna-',
-    'dna-based',
-    'dna-containing',
-    'dna-copying',
-    'dna-dna',
-    'dna-drug',
-    'dna-independent',
-    'dna-strand',
-    'dnase-free',
-    'dnx',
-    'do\'l',
-    'do-be-do-be-do',
-    'do-do',
-    'do-goody',
     'do-hood',
-    'do/can',
-    'do17',
-    'do215s',
-    'do:nt',
-    'doaks',
-    'dobelle',
-    'dobler',
-    'dobozendi',
-    'dobras',
-    'dobres',
-    'dobroliubov',
-    'dobrovsk&yacute',
-    'dobrovsky',
-    'dobsons',
-    'dobu',
     'dobutamine',
-    'doccia',
-    'dock\'ead',
-    'dock-workers',
-    'dock-yard',
-    'dockendorff',
-    'dockray',
-    'docksides',
-    'dockworker',
-    'docton',
-    'doctor&mdash;patient',
-    'doctor-assisted',
-    'doctor/',
-    'doctor/healer',
-    'doctor/specialist',
-    'docu',
     'docu&rehy;mentary',
-    'document-driven',
-    'documentalists',
-    'documentation.',
-    'documents/envelopes',
-    'dodan',
-    'doddered',
-    'dodekathlos',
-    'dodgy.',
-    'does/did',
-    'doesn\'t',
-    'doesnt',
-    'doetsch',
-    'dog-ends',
-    'dog-fox',
-    'dog-handled',
     'dog-house',
-    'dog-lead',
-    'dog-lovers',
-    'dog-shit',
-    'dog-sitting',
-    'dog-teams',
-    'dog-track',
-    'dog-walkers',
-    'dog/',
-    'dog/cat/',
-    'dogbury',
-    'dogcollar',
-    'dogdom',
-    'dogdyke',
-    'dogets',
-    'doggerell',
     'doggert',
-    'doggy-dos',
-    'doghandler',
-    'dogmore',
-    'dogs-tooth',
-    'dogside',
-    'dogu',
-    'dogwoods',
-    'dohnal',
-    'dohrenwend',
-    'dohuk',
-    'doi-edwards',
-    'doing-it-yourself',
-    'doja',
-    'dojang',
-    'dokle',
     'dolan/northampton',
-    'dolbey',
-    'dolder',
-    'dolente',
-    'dolenz',
-    'doley',
-    'dolezal',
-    'dolgorukov',
-    'doli',
-    'dolichoderus',
-    'doll\'s-house',
-    'doll-mask',
-    'doll-sized',
-    'dollar-sensitive',
-    'dollfus',
-    'dolma',
     'dolorosi',
-    'dolphie',
-    'dolphin-like',
-    'dolpo',
-    'doltons',
-    'dom&iacute;nguez',
-    'domain-1',
-    'domain-based',
-    'domain-independent',
-    'domani',
-    'domanial',
-    'domberger',
-    'dombroski',
-    'domen',
-    'domengini',
-    'domenic',
     'domenicans',
-    'domestic-based',
-    'domestically-orientated',
-    'domhnall',
-    'domic',
-    'dominancy',
-    'dominatrixes',
-    'dominicanus',
-    'dominie',
-    'dominiques',
-    'dominorum',
-    'domkat',
-    'dommage',
-    'domme',
-    'dommoc',
-    'domodeovo',
     'don\'t-knows',
-    'don\'t-mess-with-me',
-    'don\'t/did',
-    'donald/kidlington',
-    'donald/stow',
-    'donat-cattin',
-    'donatism',
-    'donator',
-    'donau',
-    'donbas',
-    'donc',
-    'donck',
-    'done-by',
-    'doner',
-    'doners',
-    'donetz',
     'doney',
-    'dongbei',
-    'dongo',
-    'dongola',
-    'dongus',
-    'donhead',
-    'donja',
-    'donkey-rides',
-    'donkeyman',
-    'donlt',
-    'donnalyn',
-    'donnee',
-    'donnell',
-    'donnell/holiday',
-    'donno',
-    'dono',
     'donor-driven',
-    'donough',
-    'donyatt',
-    'donzac',
-    'doo-wop',
-    'doobie',
-    'doodle-bugs',
-    'doolly',
-    'doolough',
-    'dooly',
-    'doomily',
-    'doomsayers',
-    'doomstone',
-    'doona',
-    'dooo',
-    'doopsey',
     'door-bolt',
-    'door-lock',
-    'door-panels',
-    'door-posts',
-    'door-stop',
-    'door/door',
-    'door/lid',
-    'doorcase',
-    'doorcases',
-    'doordarshan',
-    'doorhandles',
-    'doorkey',
-    'doorknockers',
-    'doorlocks',
-    'doosan',
-    'dopa',
     'dope-addled',
-    'dope-dealing',
-    'doppler-shifts',
-    'dopra',
-    'dopyera',
-    'doradid',
-    'dorads',
-    'dorchester-on-the-thames',
-    'doreste',
-    'dorji',
-    'dorlonco',
-    'dormael',
-    'dormans',
-    'dormanside',
-    'dormir',
-    'dorothee',
     'dorrien',
-    'dorrity',
-    'dorsalis',
-    'dorsals',
-    'dorsata',
-    'dorsets',
-    'dorsetshire',
-    'dorsiger',
-    'dorsum',
-    'dortmanna',
-    'dorton',
-    'dortyol',
-    'dorus',
-    'dos5',
-    'dosanjh',
-    'dosanjh/vehicle',
     'dosaster',
-    'dose-effect',
-    'dose/100',
-    'dosey',
-    'dosi',
-    'dossal',
-    'dosseret',
-    'dossick',
-    'dostoevskii',
-    'dostoyevski',
-    'dot-graphics',
-    'dot/bar',
-    'dot/dash',
-    'dotan',
-    'dott',
-    'dotun',
     'douaniers',
-    'douarin',
-    'double&rehy;checked',
-    'double-a',
-    'double-acts',
-    'double-banked',
-    'double-barred',
-    'double-billing',
-    'double-bogeys',
-    'double-buckled',
-    'double-counted',
-    'double-cutaway',
-    'double-dip',
-    'double-domed',
-    'double-entries',
-    'double-faults',
     'double-hulled',
-    'double-hundred',
-    'double-insulated',
-    'double-manning',
-    'double-neck',
-    'double-ness',
-    'double-octave',
-    'double-polished',
-    'double-s',
-    'double-single',
-    'double-taxation',
-    'double-tests',
-    'double-thick',
-    'double-thickness',
-    'double-think',
-    'double-time',
     'double-voicing',
-    'double/twin',
-    'doubled-breasted',
-    'doubled-over',
-    'doubledecker',
-    'doubledick',
-    'doubs',
-    'doubt-free',
-    'doubtful.',
-    'doubtfulness',
-    'doubtingly',
-    'dough-faced',
-    'doughtiest',
-    'douglas-cowie',
-    'douglaston',
-    'doula',
     'doumbia',
-    'doumbouya',
-    'dounby',
-    'douniam',
-    'douros',
-    'dous',
-    'douwe',
-    'dov\'&egrave',
-    'dove-tail',
-    'doveish',
-    'dover-dunkerque',
-    'dovers',
-    'dowan',
-    'dowayo',
-    'dowdale',
-    'dowen',
     'dowlin',
-    'down&rehy;right',
-    'down-',
-    'down-and-dirty',
-    'down-draft',
-    'down-draught',
-    'down-escalators',
-    'down-lisburn',
-    'down-payments',
-    'down-penalties',
-    'down-penalty',
-    'down-regulated',
-    'down-shifted',
-    'down-sized',
-    'down-stairs',
-    'down-swing',
     'down-valued',
-    'down.the',
-    'downbeats',
-    'downclimbing',
-    'downflexed',
-    'downings',
-    'downlight',
-    'downlighter',
-    'downregulate',
-    'downs/player-coach',
-    'downsbrough',
-    'downsmen',
-    'downtowners',
-    'downward-curving',
-    'downwash',
-    'downwasting',
     'dowsable',
-    'doxepin',
-    'doxford',
-    'doxology',
-    'doxsie',
-    'doy',
-    'doyard',
-    'doyce',
-    'doyne',
-    'dozer',
-    'dozmary',
-    'dozn',
-    'dp872',
-    'dplr',
-    'dpm3',
-    'dpmi',
     'dr\'gasian',
-    'dr-ing',
-    'dr-shift',
-    'dr.eric',
-    'dr.i',
-    'dr400',
-    'dr7',
-    'drabbest',
-    'drachsler',
-    'draff',
-    'draffan',
-    'drafou&scaron',
-    'draft&pound;9',
-    'draft-quality',
-    'drag&eacute;es',
-    'drag-lifts',
     'drag-rake',
-    'drag-reducing',
-    'drag/lift',
-    'draga',
-    'dragnets',
-    'dragon-fly',
-    'dragon-slaying',
-    'dragonfolk',
-    'drah&aacute',
-    'drain-holes',
-    'drain-tiles',
-    'drainage-basins',
-    'draincocks',
-    'drained.',
-    'drainhole',
-    'drakensberg',
     'dramatic-looking',
-    'dramtic',
-    'drap-de-dames',
-    'draperie',
-    'draught-excluders',
-    'draughtboard',
-    'draughtflow',
-    'draughtless',
-    'draughtsmen&mdash;while',
-    'dravidian',
-    'draw-backs',
-    'draw-bar',
-    'draw-down',
-    'draw-off',
-    'drawbridge-end',
-    'drawcard',
     'drawdowns',
-    'drawin',
-    'drawing-boards',
-    'drawing-pinned',
-    'drawmops',
-    'draymen',
-    'drayson',
-    'drazen',
-    'drda-compliant',
-    'dream-girl',
-    'dream-image',
-    'dream-man',
-    'dreamgirl',
-    'dreamlands',
-    'dreamlessness',
-    'drearier',
     'dredful',
-    'dredgerman',
-    'drenkmann',
-    'drenth',
-    'drepanocladus',
-    'dresner',
-    'dress-up',
-    'dresses.',
-    'dressier',
-    'dressiness',
-    'dressing-robe',
-    'dressing-tables',
-    'dret',
-    'drever',
-    'drevin',
-    'drew/labour',
     'drewe',
-    'drewett',
-    'drews',
-    'drewton',
-    'dreys',
-    'dribblers',
-    'dribblethwaite',
-    'driblets',
-    'drift/',
-    'drill-stem',
-    'drillings',
-    'drimsynie',
-    'drink.',
-    'drink/',
-    'drinking-fountains',
-    'drinking-houses',
     'drinking-up',
-    'drinks-cans',
-    'drinks.',
-    'drinkwater/cheltenham',
-    'drinnon',
-    'drippingly',
-    'dritherm',
-    'driv',
-    'drive-by',
-    'drive-holes',
-    'drive-ins',
-    'drive-shafts',
-    'drive-stimuli',
-    'drive-way',
-    'drive-wheel',
-    'driver\'s-side',
     'driver/fitter',
-    'driver/technician',
-    'drivetime',
-    'driving-cape',
-    'driving-unrelated',
-    'drizzly-day',
-    'droites',
-    'drollery',
-    'drollet',
-    'dromedaries',
-    'dromi',
-    'drong',
-    'droobs',
-    'drop-downs',
-    'drop-front',
-    'drop-ins',
     'drop-shots',
-    'drop-zone',
-    'dropped-out',
-    'droppy',
-    'dropshaft',
-    'dropsical',
-    'droschke',
-    'drosten',
-    'drought&mdash',
-    'drought-prone',
-    'drought-ravaged',
-    'drought-resistant',
-    'drouyn',
-    'drove-roads',
-    'drtx',
-    'drucilla',
     'drudges',
-    'druesnes',
-    'drug-bust',
-    'drug-busting',
-    'drug-dna',
-    'drug-linked',
-    'drug-pushers',
-    'drug-store',
-    'drug-treatment',
-    'drug-user',
-    'drug/alcohol',
-    'drug/dna',
-    'drugrunners',
-    'drugs-trafficking',
-    'drum-beat',
-    'drum-shaped',
     'drumaldrace',
-    'drumballyroney',
-    'drumbo',
-    'drumbuie',
-    'drumcliff',
-    'drumdow',
-    'drumkeeragh',
-    'drumkit',
-    'drumkits',
-    'drummer.',
-    'drumnakilly',
-    'drumochter',
-    'drumrane',
-    'drumrunie',
-    'drums.',
-    'drumskin',
     'drupe',
-    'drupes',
-    'drusen',
-    'drws',
-    'dry-assembly',
-    'dry-cave',
-    'dry-cow',
-    'dry-goods',
-    'dry-looking',
-    'dry-suits',
-    'dryas',
-    'dryas/allerod',
-    'dryas/preboreal',
-    'drybridge',
-    'drybrook',
-    'drydens',
     'dryfesdale',
-    'drynoch',
-    'dryopithecinae',
-    'dryopithecins',
-    'drypoint',
-    'drypure',
-    'ds0',
-    'ds002',
-    'ds19',
-    'ds3',
-    'ds4c',
-    'dsagnidze',
-    'dsdp',
-    'dsk',
-    'dsp96002',
-    'dt2',
     'dt2534',
-    'dtds',
-    'dti/itd',
-    'dti/serc',
-    'dtjbkwirzrezlmqco',
-    'dttp',
-    'dtx-1',
-    'du&scaron;eks',
-    'du&scaron;n&iacute',
-    'duagh',
-    'dual-architecture',
-    'dual-carriage',
-    'dual-cassette',
-    'dual-chip',
-    'dual-edged',
-    'dual-element',
     'dual-function',
-    'dual-process',
-    'dual-role',
-    'dual-wavelength',
-    'duals',
-    'dub&aacute',
-    'dub-style',
-    'dubarry',
-    'dubbed-up',
-    'dubbings',
-    'dubedat',
-    'dubery',
-    'dubha',
-    'dubia',
-    'dubinin',
-    'dubitable',
     'dublin-belfast',
-    'dublin-liverpool',
-    'dubno',
-    'duboc',
-    'duboisi',
-    'dubreuil',
-    'dubrow',
-    'dubyana',
-    'ducasse',
-    'ducenius',
-    'duch&eacute;-pairie',
-    'duchac',
-    'duchen',
-    'duchin',
-    'duck-toed',
-    'duckers',
     'ducketts',
-    'ducking-stool',
-    'duckwich',
-    'duckwing',
-    'dudai',
-    'duden',
-    'dudh',
-    'dudleston',
-    'duemling',
-    'duerden',
-    'duerr',
-    'duesenberg',
-    'duettists',
-    'duffel-coated',
-    'duffey',
-    'duffie',
     'duffill',
-    'dugnani',
-    'dugny',
-    'duhig',
-    'duibhe',
-    'duignan',
-    'duikers',
-    'duirinish',
-    'duit',
-    'duketios',
-    'dulally',
-    'dulcetly',
-    'dulcia',
-    'dulcis',
-    'dulcote',
-    'duley',
     'dulgate',
-    'duli',
-    'dull-red',
-    'dulude',
-    'duluth',
-    'duly-made',
-    'dum-di-di',
-    'dum-do-be-do-dum-dum',
-    'duman',
-    'dumb-bell/barbell',
-    'dumb-blonde',
-    'dumb-waiter',
-    'dumbells',
-    'dumbest',
-    'dumbhead',
-    'dumbles',
     'dumitras',
-    'dumky',
-    'dumlao',
-    'dummie',
-    'dumollard',
-    'dumpsters',
-    'dumville',
-    'dun-aidh',
-    'dun-naomhaig',
-    'dunai',
-    'dunamis',
-    'dunbeath',
-    'duncah',
-    'duncan-sandys',
-    'duncan-smith',
-    'duncansby',
     'dunchurch',
-    'dundas-whatley',
-    'dunderhead',
-    'dunderheaded',
-    'dunderheads',
-    'dundonald-based',
-    'dundry',
-    'dune-buggy',
-    'duneland',
-    'dunem',
-    'duneside',
-    'dung-heaps',
-    'dung-hill',
-    'dung-hills',
-    'dungarth',
-    'dungate',
     'dungeon-like',
-    'dungeonous',
-    'dungey',
-    'dungworth',
-    'dunite',
-    'dunites',
-    'dunja',
-    'dunkerton',
-    'dunkeswell',
-    'dunkil',
-    'dunnage',
-    'dunned',
-    'dunnikier',
-    'dunnings',
-    'dunollie',
-    'dunolly',
     'dunpark',
-    'dunpeldyr',
-    'dunsby',
-    'dunsby/plum',
-    'dunseath',
-    'dunseith',
-    'dunsford',
-    'dunstans',
-    'dunstay',
-    'dunt',
-    'dunthorne',
-    'dunwoodie',
-    'duo-pitch',
-    'duodecagon',
-    'duodena',
-    'duodenogastrooesophageal',
     'duomagic',
-    'duopolistic',
-    'duosome',
-    'dupal',
-    'duperial',
-    'duphalac',
-    'dupions',
-    'duplantier',
-    'dupr&eacute',
-    'dupuis',
-    'durably',
-    'duralinium',
-    'duranti',
-    'durayappah',
-    'durdin-robertson',
-    'durdin-robertsons',
     'durgates',
-    'durgut',
-    'durgut/host',
-    'durhams',
-    'durium-laced',
-    'durji',
-    'durnovarian',
-    'durnstein',
-    'duror',
-    'durra',
-    'durrenmatt',
-    'durrewald',
-    'durupty',
-    'durutti',
-    'durward',
-    'duskiness',
     'dusseldorfer',
-    'dusshera',
-    'dust-bin',
-    'dust-cover',
-    'dust-devils',
-    'dust-dry',
-    'dust-jackets',
-    'dust-like',
-    'dust-proof',
-    'dust-wrapper',
-    'dustbags',
-    'dustbin-like',
-    'dustbinian',
-    'dustcover',
-    'dustily',
-    'duston',
     'dustpans',
-    'duststorm',
-    'duststorms',
-    'dustup',
-    'dutch-owned',
-    'dutifulness',
-    'dutilleux',
-    'duus',
-    'duval-smith',
-    'dv8',
-    'dvaitin',
-    'dvor',
-    'dvta',
-    'dwarf-growing',
-    'dwarkados',
-    'dwarvish',
     'dwb503',
-    'dweezil',
-    'dwiggins',
-    'dx7',
-    'dxc4',
-    'dxe4',
-    'dxi',
-    'dxpp',
-    'dxs442',
-    'dyanmic',
-    'dyason',
-    'dyba',
-    'dycetel',
-    'dycks',
-    'dyedeoxy',
-    'dyets',
     'dying.',
-    'dyker',
-    'dykey',
-    'dyllis',
-    'dymetrol',
-    'dymmoke',
-    'dymphna',
-    'dynafit',
-    'dynagraphx',
-    'dynamation',
-    'dynamite-packed',
-    'dynham',
-    'dynix/ptx',
-    'dyrham',
-    'dyslexias',
-    'dysphoria',
     'dysplasia/malignancy',
-    'dyspnoeic',
-    'dysrhythmias',
-    'dystrophic',
-    'dystrophin-related',
-    'dyter',
-    'dzardyhan',
-    'dzasokhov',
-    'dzerjhinsky',
-    'dzhelepov',
-    'dzhoni',
-    'dzhumagulov',
-    'dzhumgalbek',
-    'dzhungaria',
-    'dzongkha',
-    'e&agr/&bgr',
     'e&amp;oe',
-    'e&deg',
-    'e&mdash;1',
-    'e&ndash;3',
-    'e&ndash;e',
-    'e(e)prom',
-    'e(y)',
-    'e+',
-    'e-2570',
-    'e-boats',
-    'e-documents',
-    'e-grades',
-    'e-j',
-    'e-k',
-    'e-mail/tao',
-    'e-mails',
     'e-nfs',
-    'e-numbers',
-    'e-series',
-    'e-shaped',
-    'e-venix/386',
-    'e-word',
-    'e-wrap',
-    'e.17',
-    'e.2',
-    'e.8',
-    'e.9',
-    'e.a.f.',
-    'e.d.c.',
-    'e.d.t.a.',
-    'e.g.l.r.',
-    'e.h.e.',
     'e.l.s',
-    'e.m.i',
-    'e.o.',
-    'e.s.c.',
-    'e.s.p',
-    'e.s.r.c.',
-    'e.w.c.',
-    'e/00/22/0001',
-    'e/00/22/0003',
-    'e/00/23/0008',
-    'e/00/23/0019',
-    'e/00/23/0023',
-    'e/00/23/0024',
-    'e/00/23/0036',
-    'e/00/23/0037',
-    'e/00/23/0042',
     'e/00/23/0052',
-    'e/00/23/0056',
-    'e/00/23/0057',
-    'e/00/23/0058',
-    'e/00/23/2011',
-    'e/00/23/2018',
-    'e/00/23/2051',
-    'e/00/23/2055',
-    'e/00/23/2066',
-    'e/00/23/2075',
-    'e/00/23/2080',
-    'e/00/23/2089',
-    'e/00/23/2091',
-    'e/00/23/2098',
-    'e/00/23/2099',
-    'e/00/23/2104',
     'e/00/23/2106',
-    'e/00/23/2111',
-    'e/00/23/2113',
-    'e/00/23/2115',
-    'e/00/23/2117',
-    'e/00/23/2118',
-    'e/00/23/2120',
-    'e/00/23/2137',
-    'e/00/23/2139',
-    'e/00/23/2140',
-    'e/00/23/2141',
-    'e/00/23/2145',
-    'e/00/23/2169',
-    'e/00/23/2173',
-    'e/00/23/2203',
-    'e/00/24/2013',
     'e/00/24/2014',
-    'e/00/24/2019',
-    'e/00/24/2020',
-    'e/00/24/2021',
-    'e/00/24/2023',
-    'e/00/24/2024',
-    'e/00/24/2028',
-    'e/00/26/0033',
-    'e/01/26/0012',
-    'e/02/25/0001',
-    'e/03/25/0001',
-    'e/03/25/0002',
-    'e/04/25/0002',
-    'e/04/25/0004',
-    'e/04/25/0005',
-    'e/04/25/0006',
     'e/04/25/0009',
-    'e/04/25/0011',
-    'e/05/25/0002',
-    'e/05/25/0003',
-    'e/05/25/0004',
-    'e/05/25/0005',
-    'e/05/26/0005',
-    'e/06/25/0010',
-    'e/06/25/0025',
-    'e/06/25/0033',
-    'e/g',
-    'e/i',
-    'e1/2',
-    'e10.1',
-    'e10.2',
-    'e104',
     'e11.1',
-    'e12.1',
-    'e12.2',
-    'e12.3',
-    'e180',
-    'e2&sol;3',
-    'e2-e4',
-    'e2348/69',
-    'e26',
-    'e28/39',
-    'e3/4',
-    'e3/f-b1',
-    'e30',
-    'e35',
-    'e4&sol;5',
-    'e48',
     'e6\'s',
-    'e7+',
-    'e7.1',
-    'e7.2',
-    'e70',
-    'e8&ndash;e11',
-    'e8.1',
-    'e8s',
-    'e9.1',
-    'e9.2',
-    'e90',
-    'e96',
-    'e99',
-    'e=5',
-    'e_',
-    'eaba',
     'eaco-route',
-    'eadgar',
-    'eadmund',
-    'eagleblood',
-    'eaglesbush',
-    'eaglets',
-    'ealier',
-    'eanmund',
-    'ear-ache',
-    'ear-drums',
-    'ear-ringing',
-    'ear/visual',
-    'earbashing',
-    'earlier-than-usual',
-    'earlier/later',
-    'earlsferry',
     'earlsfort',
-    'earlsgate',
-    'earlstown',
-    'early-20th',
-    'early-eighteenth',
-    'early-flowering',
-    'early-formed',
-    'early-fourth',
-    'early-may',
-    'early-release',
-    'early-seventies',
-    'early-sixth-century',
-    'early-third',
-    'early-year',
-    'earman',
-    'earn-outs',
     'earnings-linked',
-    'earole',
-    'earoles',
-    'earp/course',
-    'earphoned',
-    'earrings.',
-    'eart',
-    'earth-',
-    'earth-and-animals',
-    'earth-centered',
-    'earth-fast',
-    'earth-mothers',
-    'earth-numb',
-    'earth-packed',
-    'earth-red',
-    'earth-science',
     'earth/shield',
-    'earthenburg',
-    'earthenwares',
-    'earthers',
-    'earthliness',
-    'earthmover',
-    'earthmoving',
-    'earthsense',
-    'earthshattering',
-    'earthside',
-    'earthwear',
-    'ease-of',
-    'easey',
-    'easily-defined',
-    'easily-obtained',
-    'easily-worked',
     'easings',
-    'easom',
-    'east/central',
-    'east/east',
-    'east/pacific',
-    'eastchurch',
-    'eastcombe/gloucestershire',
-    'eastdown',
-    'easter-bonnet',
-    'easterlies',
-    'eastern-style',
-    'eastham/worcestershire',
-    'easthaven',
-    'eastphalia',
-    'eastward-facing',
-    'eastway',
     'eastwood/chief',
-    'easy-carve',
-    'easy-drinking',
-    'easy-go',
-    'easy-knit',
-    'easy-to-carry',
-    'easy-to-fly',
-    'easy-to-learn',
-    'easy-to-maintain',
-    'easy-to-reach',
-    'easy-trieve',
-    'easy-wipe',
-    'eat-by',
-    'eatherley',
-    'eating-places',
-    'eating-speed',
     'eaton/accident',
-    'eatonville',
-    'eau-de-vie',
-    'eauze',
-    'eba',
-    'ebalgume',
-    'ebbings',
-    'eberulf',
-    'ebhs',
-    'ebling',
-    'ebmaj7th',
-    'ebonite',
-    'ebony-tressed',
-    'ebot',
-    'ebt',
-    'ebv',
     'ec&dollar;110,200,000',
-    'ec&dollar;118,500,000',
-    'ec&dollar;12,300,000',
-    'ec&dollar;152,500,000',
-    'ec&dollar;160,800,000',
-    'ec&dollar;236,700,000',
-    'ec&dollar;272,000,000',
-    'ec&dollar;70,800,000',
-    'ec-albanian',
-    'ec-based',
-    'ec-gcc',
-    'ec-supported',
-    'ec12',
-    'ec1a',
-    'ec2p',
-    'ec3m',
     'ec3v',
-    'ecacc',
-    'ecc83',
-    'eccho',
-    'ecclefechan',
-    'ecclesiam',
-    'ecclesiarch',
-    'ecclesiastica',
-    'ecclesiastically',
-    'ecclesville',
-    'ecd',
-    'ecdysis',
-    'echmatocrinus',
-    'echo-gnomics',
-    'echo-sounder',
-    'echo/natwest',
     'echo/pr',
-    'echocardiogram',
-    'echogenicity',
-    'echoplex',
-    'echrisen',
-    'echternach',
-    'eckhardt-gramatt&eacute\'s',
-    'eckman',
-    'eclr',
-    'eco-audits',
-    'eco-conscious',
-    'eco-jargon',
-    'eco-labels',
-    'eco-no-miser',
-    'eco-terrorists',
-    'eco-wars',
     'ecologic',
-    'ecologically-sound',
-    'ecologically-valuable',
-    'ecology-conscious',
-    'economatics',
-    'econometrician',
-    'economic/social',
-    'economically-depressed',
-    'economically-orientated',
-    'economizes',
-    'economy-sized',
-    'economy/foreign',
-    'ecori-bsteii',
-    'ecotec',
-    'ecotonal',
-    'ecotools',
     'ecotoxicologists',
-    'ecowash',
-    'ecowater',
-    'ectasy',
-    'ectatic',
-    'ectodomain',
-    'ectomorphs',
-    'ectomy',
-    'ectomycorrhizal',
-    'ectopically',
-    'ectoplasmically',
-    'ecu-denominated',
-    'ecu1,250',
-    'ecu10,000',
-    'ecu100,000,000',
-    'ecu13.1',
     'ecu1=us&dollar;1.37733',
-    'ecu250,000,000',
-    'ecu2bn',
-    'ecu3,000',
-    'ecu3.3bn',
-    'ecu32,500',
-    'ecu500,000',
-    'ecu5bn',
-    'ecu750,000,000',
-    'ecu=usdollars',
-    'ecuadorians',
-    'ecuanor',
-    'ecumenicals',
-    'ecumenicism',
-    'ecureuils',
-    'ed48',
     'ed611',
-    'ed65/66',
-    'ed888',
-    'edat',
-    'edburg',
-    'edde',
-    'eddey',
-    'eddo',
-    'edelen',
-    'edelmaier',
-    'edelmann',
-    'edelzwicker',
-    'edenside',
-    'edensor',
-    'eder-puestow',
-    'edetic',
     'edey',
-    'edgarstown',
-    'edge-bound',
-    'edge-of-the-seat',
-    'edge/gloucestershire',
-    'edgefield',
-    'edgemoor',
-    'edgewoods',
-    'edghill',
-    'edificio',
-    'edified',
-    'edimbourg',
-    'edinburgensis',
-    'edinburgh-bound',
-    'edinburgh-managed',
-    'edinr.',
     'edirisinha',
-    'edisbury',
-    'edison-bell',
-    'editeurs',
-    'ediths',
-    'editions.',
-    'editorialist',
-    'edleston',
-    'edlina',
-    'edlund',
-    'edminson',
-    'edmunds/suffolk',
-    'edmundson',
-    'edmundston',
-    'edns',
-    'edoh',
     'edouards',
-    'edsa-national',
-    'edson',
-    'edu',
-    'eduarte',
-    'educ.',
-    'educand',
-    'education/library',
-    'education/qualifications',
-    'educed',
-    'eduction',
-    'edw.',
-    'edwarde',
-    'edwardses',
-    'edwardson',
-    'edworth',
     'ee-aw',
-    'ee-aye-ee-aye-oh',
-    'ee173',
-    'ee794',
-    'ee795',
-    'ee796',
-    'eec-style',
-    'eedeelee',
-    'eel-fishermen',
-    'eela',
-    'eelde',
-    'eeling',
-    'eelis',
-    'eengleesh',
-    'ees-a',
-    'eesco',
     'eesti',
-    'eetzky',
-    'ef1&bgr&ggr&dgr',
-    'ef1&dgr',
-    'ef1-11s',
-    'efdalzade',
-    'efeo',
-    'effac&eacute',
-    'effaces',
-    'effect(s)',
-    'effect-the',
-    'effectives',
-    'effects-based',
-    'effectuate',
-    'effenterre',
-    'efficiency-equity',
     'efficiency-minded',
-    'efficiency.',
-    'effort-performance-reward',
-    'effy',
-    'efghcd',
-    'efimov',
-    'efraim',
-    'efta-ec',
-    'efthymios',
-    'eg/p',
-    'egalite',
-    'egberto',
-    'egdon',
-    'egg-associated',
-    'egg-eating',
-    'egg-infective',
     'egg-producers',
-    'eggison',
-    'eggolsheim',
-    'eggs/fry',
-    'egisto',
-    'egle',
-    'eglington',
-    'egnell',
-    'ego-based',
-    'ego-bound',
-    'ego-feeling',
-    'ego-gratifying',
-    'ego-structures',
-    'ego-trips',
-    'egocentricities',
-    'egocentrics',
     'egoff',
-    'egoismus',
-    'egomania',
-    'egotistically',
-    'egpgc',
-    'egptian',
-    'egrapsen',
-    'egu&iacute;a',
-    'egypt-israel',
-    'egyptair',
-    'egyptian-made',
-    'egyption',
-    'eh-eh',
-    'eh11',
-    'eh7',
-    'ehden',
     'ehle',
-    'ehrenberg',
-    'ehukai',
-    'ehyeh-asher-ehyeh',
-    'eic',
-    'eichhorn',
-    'eicken',
-    'eiderdowns',
-    'eidetically',
-    'eidetiker',
-    'eidetikers',
-    'eifionydd',
-    'eige',
-    'eigernordwand',
-    'eigerwand',
-    'eight\'s',
     'eight-branched',
-    'eight-chip',
-    'eight-feet',
-    'eight-fifty',
-    'eight-five',
-    'eight-frame',
-    'eight-game',
-    'eight-lane',
-    'eight-nine',
-    'eight-pound',
-    'eight-pounder',
-    'eight-roomed',
-    'eight-stranded',
-    'eight-string',
-    'eight-to-12-year-olds',
-    'eight-wheeled',
     'eighteen-',
-    'eighteen-fifties',
-    'eighteen-foot',
-    'eighteen-nineties',
-    'eighteen-ninety-eight',
-    'eighteen-sixties',
-    'eighteen-sixty',
-    'eighteenth-birthday',
-    'eightees',
-    'eighth-round',
-    'eighty-seven-year-old',
-    'eighty-thousand',
-    'eighty-three-year-old',
-    'eighty-year-olds',
-    'eiiia',
-    'eiiib',
     'eijck',
-    'eilles',
-    'eillis',
-    'eim',
-    'eines',
-    'einheitspartei',
-    'einstein-podolsky-rosen',
-    'einstien',
-    'eir&iacute;ksdr&aacute;pa',
-    'eirene',
-    'eirwen',
-    'eisa-emb',
-    'eiseley',
-    'eisenhuttenstadt',
-    'eiser',
-    'eisl',
     'eissendorf',
-    'eisteddfodau',
-    'eisziszki',
-    'ejaz',
-    'ejazi',
-    'ejidatarios',
-    'ejoyed',
-    'ek4',
-    'ekman',
-    'ekong',
-    'ekron',
-    'ekta',
-    'ekvall',
-    'el-amarna',
-    'el-bahari',
-    'el-bared',
     'el-batroukh',
-    'el-hagar',
-    'el-hejara',
-    'el-mahdi',
-    'el-medina',
-    'el-robee',
-    'el1055/108',
-    'el34s',
-    'elaborateness',
-    'elagen',
-    'elamites',
-    'elaphus',
-    'elapidae',
-    'elastoplasted',
-    'elatius',
-    'elavil',
     'elbasan',
-    'elbc',
-    'elbio',
-    'elbresidenz',
-    'elburz',
-    'elderley',
-    'eldfell',
-    'eldils',
-    'eldon-lee',
-    'eldonians',
-    'eldoniids',
-    'eldrid',
-    'elean:in',
-    'elect-ions',
-    'election-free',
-    'electric-bulb',
     'electric.',
-    'electrically-induced',
-    'electricas',
-    'electrici',
-    'electrifies',
-    'electro-active',
-    'electro-magnet',
-    'electro-materials',
-    'electro-metal',
-    'electro-physiological',
-    'electro-pneumatic',
-    'electro-pop',
-    'electro-vibratory',
-    'electroanalysis',
-    'electrocandles',
-    'electrocomponents',
     'electrogastrographic',
-    'electrograph',
-    'electrolumen',
-    'electrometer',
-    'electromyograms',
-    'electron-proton',
-    'electronegative',
-    'electronic-mail',
-    'electronically-excited',
-    'electronik',
-    'electronvolts',
-    'electropherogram',
-    'electroporated',
-    'electropositive',
-    'electroretinogram',
-    'electroscope',
     'electrosensitivity',
-    'electrostatically-charged',
-    'electrovoice',
-    'elegantissima',
-    'elekes',
-    'elektra-nonesuch',
-    'elektrik',
-    'elektro',
-    'eleph',
-    'elephant-jokes',
-    'elephant-sized',
-    'elephantipes',
-    'elethandian',
-    'eleutherios',
-    'elev',
-    'elevation-signalled',
     'eleven-and-a-half',
-    'eleven-bar',
-    'eleven-day',
-    'eleven-point',
-    'eleven-to-fourteen-year-olds',
-    'eleven-twenty',
-    'elf-shot',
-    'elfish',
-    'elfishly',
-    'elfrida',
-    'elfriede',
-    'elgarians',
-    'elicitations',
-    'elicitors',
-    'elida',
-    'eliments',
     'elioti',
-    'eliptical',
-    'elitiveness',
-    'eliz.',
-    'elizabeths',
-    'elkabbach',
-    'elkie',
-    'elkins',
-    'ellard',
-    'ellef',
-    'ellen.',
-    'ellerton-on-swale',
-    'ellett',
-    'elliptica',
-    'ellite',
-    'ellsberg',
     'ellut',
-    'ellyon',
-    'elmlea',
-    'elmstead',
-    'elner',
-    'elodes',
-    'elohe',
-    'elora',
-    'elric',
-    'elrose',
-    'elruge',
-    'elsag',
-    'elsanta',
-    'else-',
-    'elsecar',
-    'elsen',
     'elsener',
-    'elsheimer',
-    'elsmore',
-    'elst',
-    'elsterian',
-    'elth',
-    'eluent',
-    'elusion',
-    'elv',
-    'elvaco',
-    'elvyra',
-    'ely/milton',
-    'elyakin',
-    'elyn',
-    'elyr',
-    'em\'ly',
     'em.',
-    'embanking',
-    'embargos',
-    'embarrassment.',
-    'embarressment',
-    'emberg',
-    'embezzlements',
-    'embioptera',
-    'embl-heidelberg.de',
-    'embl/genbank',
-    'embl4',
-    'embling',
-    'embo',
-    'emboldens',
-    'embraceable',
-    'embrun',
     'embryo/foetus',
-    'embryophytes',
-    'embryos.',
-    'embusqu&eacute;s',
-    'emcer',
-    'emely',
-    'emerald-encrusted',
-    'emery-wallis',
-    'emili',
-    'emilian',
-    'eminox',
-    'emission-control',
-    'emissivity',
-    'emittance',
-    'emly',
-    'emma-hoo',
     'emmanuels',
-    'emmen',
-    'emmersons',
-    'emmerton',
-    'emmetts',
-    'emmissions',
-    'emmty',
-    'emona',
-    'emotional/psychological',
-    'emotionally-charged',
-    'emparkment',
-    'emperface',
-    'emphasis.',
-    'emphasised.',
-    'emphasiser',
-    'empire-commonwealth',
     'empire-wide',
-    'empiricals',
-    'empleados',
-    'emplins',
-    'emplo',
-    'employe',
-    'employee-details',
-    'employee-like',
-    'employee.',
-    'employer&mdash;employee',
-    'employer-financed',
-    'employers.',
-    'employers/managers',
-    'employment-creation',
-    'employment-led',
-    'employment/unemployment',
     'emporer',
-    'empresariales',
-    'empresarios',
-    'empressement',
-    'empresses',
-    'empty(y)',
-    'empty-eyed',
-    'empty-hand',
-    'empusae',
-    'empyemas',
-    'emsee-h',
-    'emslie/former',
-    'emstar',
-    'emtb',
-    'emva',
-    'en-tout-cas',
     'en/ants',
-    'en29001',
-    'enamel-dentine',
-    'enamines',
-    'enangan',
-    'enantiomers',
-    'enantiotropes',
-    'enarques',
-    'enata',
-    'enator',
-    'enberg',
-    'encapsidation',
-    'encarnaci&oacute;n',
-    'encashable',
-    'encashments',
-    'encephalitic',
     'encephalization',
-    'encephalopathic',
-    'enchanta',
-    'encinas',
-    'enclaves*',
-    'encloser',
-    'enclosure.',
-    'encomia',
-    'encomiastic',
-    'encorage',
-    'encounted',
-    'encourge',
-    'encrinus',
-    'encruster',
-    'encrustment',
-    'encryptor',
     'encrypts',
-    'encs',
-    'ency',
-    'encyclobanks',
-    'encysted',
-    'end-1994',
-    'end-1995',
-    'end-april',
-    'end-august',
-    'end-blocks',
-    'end-cannot',
-    'end-caps',
-    'end-effector',
-    'end-effectors',
-    'end-filling',
-    'end-game',
     'end-july',
-    'end-october',
-    'end-of-the',
-    'end-of-the-world',
-    'end-of-the-year',
-    'end-over-end',
-    'end-plates',
-    'end-stops',
-    'end-wall',
-    'end/herefordshire',
-    'endangered.',
-    'endarterectomy',
-    'endarteritis',
-    'endeaveours',
-    'enderby/ucca',
-    'enderwick',
     'endesha',
-    'endism',
-    'endites',
-    'endnotes',
-    'endocardium',
-    'endocarp',
-    'endocrinological',
-    'endocrinologists',
-    'endoglycosidase',
-    'endomembrane',
-    'endon',
-    'endonymous',
-    'endonymy',
-    'endoparasites',
-    'endophora',
-    'endorsee-buyer',
     'endotergites',
-    'endothelines',
-    'endowment-linked',
-    'endre',
-    'ends-and-means',
-    'endshe',
-    'endytinges',
-    'ene',
-    'eneas',
-    'enemaed',
-    'enemy-held',
-    'energy-',
-    'energy-dense',
-    'energy-dependent',
-    'energy-guzzling',
-    'energy-poor',
     'energy-releasing',
-    'energy/matter',
-    'eneurisis',
-    'enfance',
-    'enfiladed',
-    'enforcable',
-    'enfranchising',
-    'engager',
-    'engesa',
-    'engine-note',
-    'enginemen',
-    'engins',
-    'engl&auml;nder',
-    'englan',
-    'england-class',
-    'england-ireland',
     'england-pakistan',
-    'englehart',
-    'english-',
-    'english-dutch',
-    'english-electric',
-    'english-only',
-    'english-owned',
-    'english-texted',
-    'english-welsh',
-    'english/creole',
-    'english/spanish',
-    'english/welsh',
-    'englysh',
-    'engorgement',
-    'engorging',
-    'engraph',
     'engria',
-    'engrossers',
-    'enguerrand',
-    'engulfment',
-    'engulu',
-    'enhanced-potency',
-    'enharmonically',
-    'enhydrazines',
-    'enigmatical',
-    'enjambe',
-    'enjambement',
-    'enjoi',
-    'enjoyable.',
-    'enjoyment.',
-    'enketei',
-    'enlarg',
     'enloe(pandora)',
-    'enmeshment',
-    'enmired',
-    'enn-arno',
-    'ennalls',
-    'ennit',
-    'ennobles',
-    'enogat',
-    'enought',
-    'enq',
-    'enquir',
-    'enquiries.',
-    'enrages',
-    'enrapturing',
-    'enric',
-    'enrichen',
     'enrobing',
-    'enroth-cugell',
-    'enry',
-    'enschede',
-    'enserfed',
-    'enshadowed',
-    'ensheathment',
-    'enskilda',
-    'ensley',
-    'enstone/oxfordshire',
-    'enstrom',
-    'entad',
-    'entelnor',
-    'entendre',
-    'entensify',
-    'ententes',
     'enterocolitica',
-    'enteroenteric',
-    'enteropathies',
-    'enterprisals',
-    'enterprises.the',
-    'enthalpically',
-    'enthralls',
-    'enthusiasm.',
-    'enthymemes',
-    'entiere',
-    'entis',
-    'entitled&mdash',
-    'entity-identifiers',
-    'entlen',
-    'entman',
-    'entomophilous',
     'entoptic',
-    'entr&eacute',
-    'entracte',
-    'entrail',
-    'entrance-front',
-    'entrancement',
-    'entreats',
-    'entrenchments',
-    'entrim',
-    'entropion',
-    'entry-point',
-    'entry-year',
-    'entwines',
-    'enualios',
-    'enures',
-    'envelopment',
     'enville',
-    'enviromental',
-    'environmen',
-    'environment&lsqb;vax/vms&rsqb',
-    'environment-conscious',
-    'environment-like',
-    'environment-oriented',
-    'environment-sensitive',
-    'environment/welsh',
-    'environmental/conservation',
-    'enviroscope',
-    'envis',
-    'envseq7',
-    'envsfifor',
-    'enwrapping',
-    'enybpg',
     'enynex',
-    'enzi',
-    'enzymatix',
-    'enzyme-catalysed',
-    'enzymologist',
-    'enzymology',
-    'eoanthropus',
-    'eolian',
-    'eos-designed',
-    'eosinophilia',
-    'eov1',
-    'ep20',
-    'ep90',
-    'eparn',
-    'epaulets',
-    'epdd',
     'epdm-rubber',
-    'eperonniers',
-    'ephemerally',
-    'epheseus',
-    'ephippiatus',
-    'ephippium',
-    'epicanthic',
-    'epicercal',
-    'epicurism',
-    'epicuticular',
-    'epidamnos',
-    'epidemical',
-    'epidemiologic',
-    'epidermolysis',
-    'epididymitis',
-    'epidiorite',
     'epigamic',
-    'epigas',
-    'epigastrium',
-    'epihydrus',
-    'epilator',
-    'epilimnion',
+)
+
+blocks_41 = (
+    '#%-1060!"e1"!2"$adel#%nnain#-se-and-desist#*threamhnan"\'bekhulu#&ifrons#$uano"(ccobelli#$etto#!h#%ilian&%enhof',
+    '&#iot#"um"+dar-brushes&$wood%!e%!n#$ella"*fal&ugrave%!u"%ilach$(ing-high#$riog""ka"#lal%$zade',
+    '%#orn%&rology$%stite$!x#!f#"ik%!u$!z#\'l-based%&deaths\'%rived%%mates$"ae%&r-like$%mates',
+    '$#s/g$0ular-subcellular$!y#)tiberians%\'c-bound&!a",ment-floored\'%mixer&%/sand&%arius&#one##lyn#$paka"\'naculum#"is',
+    '#$nino##red#*sor-ridden&$able&#ial\'\'ousness##tal$!e%&rboard&%piece$)i-seconds%%litre*!s%\'metres.$%livre',
+    '\'(-banking(%level)&ocking(&system\'$iser($ties\')ly-funded%\'e-court\'$fold\'%lines\'\'notched\'$page($oint&$back\'%oards',
+    '&"s.\'%pread&%ville%1ifugal-compressor+"ly&$oles&\'s-based\'!m%\'ocercus&\'lobular$"um%"ri\'#ans($tion&"y-',
+    '\'!.$$wine"\'olfrith##rls""pa$"ea$!l#(halaspid&)orhynchus\'\'sporins#$phus#$ting"&ramica\'"s.$"no',
+    '$(stoderma$%tinly%&opsian##dan$"ic#-eal-producing&"es$%bella%&ration$$ceda$)monialism(\'ousness#%ialis$$dwen$$fera',
+    '$&um-144#!j##mak##nak$$obil#+rigydrudion#$t:12$$ains$#ian%&ficado),tes/diplomas$"us#\'vicitis%#xes$#ole',
+    '"%sareo#&cinsky#!i#\'sations#%trian""t.#$raro"#uto!+f&ndash;bsb"!2"!3""ao"$e-1a"!g""ka',
+    '"\'up/cclo!(gca/tgcg""is!5h&acirc;teau-gaillard.$like.\'thierry"$\'ban##eng#$iang#\'kasians#%ship."%-4502"".9#!d"&a-peau',
+    '#&banais&!g#&carita$#hem$$king#\'d-niger$&bourne$&desden\'#ley$$ians$#ors%"ur$+wyck-healey#)etodonite#$ffee',
+    '#%gford#(in-links&%smoke+!r\'%tores%%arong%&makers%(reaction%&swords$\'r-lifts&&makers%&covers%+man-general%%women$!s',
+    '$%yasan#%khoti$"ma$(ravarthy\'$orty#)lcedonies%"id$$dees$%grove$#ier$%k-bag&$rich%$idic("ke%\'y-white',
+    '%"um$"te#\'mber(s)\'%-like\'$iain("ng\'\'lainite(%inian%"ly%%ourcy$)eleon/nfs)#nfs%"ry$\'ounists&!x',
+    '%)agne-like*)producing&#ran%&fleury%)ion-ships(\'s-elect$#ras$#son$"us#\'nce-met&$less\'-lor-democracy*#iid-!s%"ho',
+    '\'"st$(deliered%2ler/brother-in-law$%gchub%\'e-agent\'\'manager)$ster\'*of-address*%state\'%point&(ableness&#ful&&lessly&%ments&#out',
+    '%%ingly$"na%)el-attach\'&source&!r$$tent%$uria#&oborus$\'rachain##p.3$!e%*l-building&4le-lnt&eacute;rieure)&triage&$ries',
+    '$+lin/chamber$9man/whyte/kerslake/shutt($%paqua%#ens%*le/station$\'roniere$!t%$ers.#+rabanc-load%+cter&dollar)*-witnesses)&itured%#ric$(bonnages$#cas',
+    '*%urner%\'uteries$&dleigh%%onnet$%entes$"fi$*ge-coupled\'$offs&*/discharge&#_of&%cards&#men&%payer$#idy%"ie',
+    '%*ty-fatigue(#run$$kham%&iewicz$(latanism%!e&(stonians%#ier%$otta%.ton-all-saints))on-otmoor$\'minster%&lessly%!m$"ny',
+    '$$rada%!y$\'t-maker)#ing%&buster)#ing%#er\'\'$ists\'$line%+ier-kastler%%paper%%ridge%"s.%%wards$#wal',
+    '##se.$$idic\'!m%!n&"gs$&kalson$*matosaurus$.seguet-smirgel$6telton/gloucestershire&"ns$%ubles#%t-ups$,eau-inspired$$hill$#oor',
+    '$#tan%&erings%!i#&udhuri%#oir$!k$$liac$"ri$#sen$\'vinisms)\'tically#$vdar$\'e-jones%$nage%!s',
+    '$(rimootoo#$ykin%\'ovskovo$#ote##zli"\'chiness"#e\'l#$ales$"ms$#ney$"pe$&rfully#*ck-o-matic&&points%*ed/updated',
+    '&0ut/replenishment%&summer#)ddar-type%!i&!e#%eeeee$%ldren$"ma$)r-leading&"up%#in\'%\'y-faced$!s%\'e-maker&&cutter',
+    '$"ty#(f/patron#$limo$#les$!m%"no$$onei$$sea0%"om%$tons$*yabinsk-65#(m-intell$!.$#con$&etrics',
+    '$!i%-cal-resistant)%waste(*ly-induced&"on%(sorption&+try-related$"o-%-attractant(s)##nab$"da$3ey/northamptonshire$#gde$#ies%!l',
+    '&#ult$-odeoxycholate#\'ong-sam#&que(s)&&/money#\'rangani*!s&!i$%enkov$#ine%!s$(nichenko&#gov%$obil\'#yls',
+    '$$rett%*ill/asthma&%ngton%)y-picking&&/basil&!h$#ton$$zeel#"s.$!e$%kevod$#ler$&s-game&#men%&boards',
+    '$)t-burster%8er&ndash;le&ndash;street%%field%%iness\'!g%#ney&)ut-haired)%trees#&tcombe#/vardi&egrave;re$#ely$"in&$gton%!s$*ron-shaped',
+    '$&chocks$#in\'#%ysson"%hnang"$iaje$$phua$\'ramonte%$ello$$stic##bwe#$c-ly$)ago-style$$hewa$+ken-and-ham(#egg',
+    '(%wired%%sands$"ly$\'ontepec&!y%!s#&dingly#*ef-marshal%#dom(!s%$ship$"ke$$nlit#)ff-chaffs%"re',
+    '##lad$%chutt%$otts$#d\'s%\'-killer&(murderer,#ing&&parent&\'rearers&-socialization&(training%!/&%young%%carer%#ing',
+    '%)ren/young(*erformance\'"ss%7swickham/worcestershire$%ensis$#ham$"is$(linghams$\'mington$&oensis$&tonian##man$$ique$$leys$\'ney-pot',
+    '$#sky#&n-chin$"a*$#ery%-se-controlled(%green((language($made(&soviet\'!s$#gis&!z$"ka%#uli#\'onasaid',
+    '$#zza#(p-makers%$shot$$imbi$"ko$%olata)!s$!p%/enham/wiltshire&"rs$%straw#\'ranjibi$#don$$gwin$&icahua',
+    '$&piness$$rups\'!y#&seldon&%hurst%%nhall$$hona$$nall$#tie#$tepo$&inozoa$#ral$+ter-chatter#$yoda"$kili',
+    '$&mydiae#)ochilaich$%racne&$lose%&ine-36)(bleached\'#ity%&ofibre\'+luorcarbons))rocarbons\',orm/methanol&%genic&&hydrin*(ocarbons&(melanite',
+    '&&phytes"#mos"%occie%!o$\'kablock%"er%#ing#&derlos#%edron#$gyam\'&-jones#&ice(s)&"s.$%rgirl%\'masters',
+    '$"ss%(y-baches##kee$"we$!y#1langiojejunostomy)\'scopies$1ecystectographies)%ogram%&dochus%*sterol-fed+!/,-phospholipids$&ine-cl))ontaining',
+    '$!m$!o%!s##mba$#ksy$\'olungma$&skians$#unn#&ndogyu%&roitin$#gwu#&o-choo$"ng$$sier&#ngs',
+    '##que#%rding%$wise$"eo&)graphers.+!s$*ley/bruton%-ton-cum-hardy$!o$!y#$sing%#sme&"te#"tt#(wchavich',
+    '$#ood#!x"#ree#&is.txt%$film%#man\'!s%\'t-image&&anssen&-ian-dominated*\'hebraic*\'marxist)\'/muslim)\':moslem)"ia',
+    '\'#e\'s&2lich-demokratische+\'soziale&)mas-party)$_and&\'odoulos\'$ffer($orou\')logically$"th#\'omaffin&#tes\'#ics\'(ographer%-e&rehy;plated',
+    '&*um-release%(ocentres&#gen\'%ranin&+lithographs&%meres&&phores\'&rotein&(tography$%nical%%o-log&\'logique&&metric*!y&-stratigraphic',
+    '#-yptosporidium$/santh&egrave;me%%elius%&opilus"\'thonic/"(ubbiness#&ckable&"ra%#ery%&lehead##dan$$dley$$omir##eng#%k-yan',
+    '$$otka%$vsky$\'wuemeka#"le#"ma#%nchon$%g-kuo$$ilal$$kety%\'i-crete&#est%"y.$"ni$$sina$$wang',
+    '#$quet%%isaca#)rch-aided\'$dues\'(slavonic\'%tower&%ified&%women#$tter"!w"#yba#(mostatin!#i\'s""-3"!/',
+    '$&latano#$ston"&bitoke#"um"\'chlidae#&ognani#%s/esa%#mvs"(dermaker",echanowiecki##los#%ncias$#ega"#fra"-garette-packs',
+    ')!.%%illos%!o#%enter""ii"!j"#ldo#%ewent##ler"#mas#%balom#$ents$,ti&egrave;re#(oszewicz"%ncars',
+    '#%efilm$\'ma-goer\'\'quality\'\'viewing&\'tically%*icroscopic$+radiography#&namomi("um\'*n-coloured)#red#%sault##tre"&orascu##tat',
+    '"(rcannual$"eo$&inalis$,uit-breakers)\'uilding%%laire\'(risation*#ing%+m-antarctic&(ambulate&&cising&+ferentially&%spice((orozoite##ene',
+    '#\'ripedia"0s-hydroxyproline#!i#%keian#*platin-dna)"um#%sokho#"te%&rnazza"\'tadelle#"ee##ium#%oyens#%rinus$!o',
+    '#"t.$&adella#.y&rehy;dweller$!-%$life%\'regions\'&public$!/$!4$&breaks%"us#$zens"$ullo"!v#!.',
+    '##ica$,l/structural%*ianization%%lians%(t&agrave$"ta""ze!"k2!0l&eacute;menceau"!-#&px0072"#450"*achnagowan$$kety#$dium',
+    '%%phora##eys#\'idheamh$\'m-forms$&rement%"in%$vius#%mator%"vi$&p-type%%_down%\'ed-free#*ndestinity$,field/thames$%kings',
+    '$(nishness%!y#\'p-hands$"is##que#(ra-based$$icia%#des%%fiant%)thromycin$(k/driver&&father&$kray&$live&\'manager',
+    '%&e/home\')solicitor\'&thames&$ston%"ie%$sons$"ry$"s.$(t&eacute#(shnessie$#s\'/%(-beating\'$ound&"ii&)struggles',
+    '%!/&(politics%#ic+\'!a(\'l-style\'#ial&\'ficated+$ion.&$ness%\'teacher%%ybawn#%ttery#$udes$$righ$.se&lsqb;s&rsqb',
+    '%-trophobically#\'verhams$&icular%,er&uuml;bung%#net%#tis#*w-and-ball%&tipped$$less%#ike#*y-coloured%\'kickers%(streaked%%tiled$$dons',
+    '$$form$$gate$%stone$*ton-munroe(%smith"%e-1\'s#*an-burning&(scrubbed\'%haved%\'/crunch%$away%$ers.%(ing-lady(!s%"th',
+    '%%-fell&$outs&\'the-air%%ance.%$ence%$face&&elling%(ing-bank%&shield&%torey%$ways$$ting#%ddans#&evedon#*matis-like',
+    '#)nbuteriol$%denin#"on#\'psydrae#(rgywomen$(ical/lay)+secretarial%$hews$"k.%\'/typist$*mont-nesle$&uchies#$vely%,rly-designed#"yn',
+    '$*k-and-drag&\'clacked%!i#&ent(s)&&-based\'&lawyer\'(oriented\')solicitor&#age#*ff-nesting%*ord-turner%"s.&$ides%$wall$#ten',
+    '#%macus%)te-change()sensitive&3ic-geomorphological)+morphologic("al$$b-me%#ed.&(r-placed(&upward$)ofunction$$pson#%ncial$$gers%%iness',
+    '%%meter$,ton-inspired\'$ites$$vest#"p.$#box$!p%(er-bowed%#ies$$ston#)torectomy&$idis##via%$lles"!j',
+    '#$cher%\'foldich$(k-candle&\'doubled&$like&(watching%&ing-in%(watchers#(dhoppers$%omiro#%isons##kke#\'miphene#&ncurry$)edetector',
+    '$"ic$$mell$&shaugh#&p-clop$$hill$#ped##ris$"ox#(se&num;0%$-air&\'boarded&\'circuit&&fitted&\'packing&#tie',
+    '%(d-belief\'%doors\'#end*"ed\'$form\'&minded\'#off%(ly-dated)$rawn($held(%woven%&r-knit$\'ing-off\'!s#)th-backed',
+    '&\'wrapped%!.%)es-horses(%lines%$iars%&worker#\'ud-base&&capped&$free&&moving&&shapes&#top%%break%%cover%"en',
+    '%$lets$#zot#(ver-like&%field##yne"&uaness#(b-mosses%&record%&trendy$(bability%\'ishness$$like$%maker&"ns%#oss',
+    '##cas#\'mpingly#"ne%!y$\'gunford%#wyn$#ton#$stan%&erings\'$land"#xvi"%yburn#)dagnathus$%eport#&garthy',
+    '!\'m&amp;m#+dollar;disk"%-1.20##api"$.375""/y"!9"$a200""ms""od""s.""yc!&neorum""up!/o&ndash;operate',
+    '0"or#(ucirc;te"$-act$*dventurers#,belligerents#(chairing$(olonised%\'ndensed&(sultants&\'tractor-!s%!s%)venantors$&urator*!s',
+    '&%igner%\'veloper$)iscoverer#&enzyme$)xpression#(financed#+habitations("ed$)eadliners#&incide%\'fection%\'herited%*vestigator#\'leaders$\'ocation',
+    '$#ing#*operations*$vity%$tees&$ions\'"ve&!s$*rdinations*#or.%(ganisers$"wn#)paymaster$,recipitation&\'senters\'&idents',
+    ')!s%%octor&%duces&%moted#%refer%\'sidents#)signatory#)therapist)!y$(reasurer#(variates)#ion\'"es$(enturers#%wives',
+    '"*.operation*"ve"\'/apollo"!3"!4"!7",ach-and-four&&horses($uses%!/%#es.%%liner#&dapted#&gulant#!k',
+    '%$like%$rich%$tips$&escent(!s%!y$&houses$\'itional&"on$#men$%ridge#%rsens#%stway&#ise#*t-of-paint',
+    '$!h$)s/jackets%%leeve$"ts$)zacoalcos"(b-webbed#1b/gloucestershire$)le-stones#$ella#$lyns#\'ol-to-c#(web-like"*ca-dollars%)producing$)ine-based',
+    '#$cids$!o$$yzus#%hleae\'#ria%&iomyia#-k-a-doodle-do%$knee%$main%+of-the-walk$$ades%$igne%&leekie%$tiel%#yne',
+    '$&chafer$%ed-up%-ll/expedition$$iest$6leford/gloucestershire$$shaw&!y%&uckers&&reness$#ups#"le#\'oa-cups&(drinking%!s$%fibre',
+    '"&decall%!s$%watch%$ords#$fish#$icis$)fications&"er#\'onanthe#$well"(ed-y-cra&#cra$&itions#)fficional#$lebs',
+    '$"ho$&ocanth%(ptychium$$uted#$ster##urs#%volve"*ffee-beans\'(drinkers\'&houses\'$mugs\'$pots\'&stalls$"ie%/n-manufacturers',
+    '##one"#gar#"en%\'eration#(gleshall#$hlin#\'itating("on*!s#&nitist&&ronics%%zable$$omen".hesion-tension#&orting',
+    '#&ffeuse$!s#\'l-diode%\'tapping$%ed-up$#les#*n-clippers*#ing%$like%%using$$ings$"s.$&telpro#\'r-based#$tion',
+    '#"in"$lart#%bayns$$ourn$$rook#)d-adapted%%hardy%)sensitive&$ores$#ash$%heart#(e-parmer$,cci&oacute;n$$gios$\'opteran',
+    '$$rton$%scott$)tte-willy$%ville#(fosceril#.gate-palmolive##ine%$vale#*laborator.%.gen-stimulated(.ase/gelatinase+!s&#ues%$nder%)r-and-tie',
+    '\'$stud$)eagueship%!c&%tedly\'"if(,ve-variative)$ised+#tic**t&eacute;s%)ge/london(*university\'"s.(+/institutes&%ially("ta',
+    '%#oni%!r%%ville$#iar%"na&$dale&$gham\'&ridges\'(sborough\'#ton&\'s-style\'!.%(s/county%"um$+ocationally',
+    '%#sal$!y%\'wobbles#*m&aacute;n#(ocynthis$#gny$(m&eacute%"ba&"es$*nic-rectal&!e&#ses&\'zations%"os%%scope',
+    '&!.$%phony$$rant%\'graphic%&script$$sseo&#ian&#oma%&tomies$#tka$\'ur-fast($ield\'\'marking\'\'printed\'&scheme',
+    '.#ity\'$wise($ords&$able&"er&%field\'&ulness&\'masters\'%otion#$pats#$rane#$t.45$&bridge$"en$&ronics',
+    '(!s&(ia-based%*narisation\'#ted#&villes#$yton"6m&eacute;die-italienne/)ltalienne$*rehy;mence,#ted*\'unities#".o#&ancina%#ecj%!s',
+    '#)b-jellies$!a%#lia%+t-effective&%ivity$\'erbache$$like$\'ustion.#(e-all-ye&%nd-go$&con-ec$#dia&*es-ballets%&ogenic%+y-thrillers',
+    '$%liest&!n$!n$$ragh$&t-like%\'abolite$(uppances#$ford&#seg&(t-loving\'&ablest#$ibol$\'c-books$#das$%ng-on',
+    '%#tee#"ly#\'m-booth$+a-separated\'%haped%+nd-in-chief\'%antes\'#eth\'#ist("te\'"s.$\'dlg.dll$(emmorate,!s%%ndeth',
+    '%+rcial-paper+*television*+/industrial*#ize*,ly-available-$bred-*orientated%!y$#ins%*seratingly&%ioner&&saries\'*ion-funded+&hungry\'$ural',
+    '-!y%%tted.(\'e-bound*#man*%rooms*%style)!e$*odiousness\'-ty-capitalist*%money%&n_with&$dale&$land\'+y-available$&screen',
+    '&)icability)#tio,-n-handicapped\'-st-orientated*\'trained)!a)*s-movement\'%ties.+!/("y*)+-orientated)#.in)%based%-ting/carrying$$ynes',
+    '#%oedia$%nomer$"re%#ian&"en$#sus#)p-u-claim$%acter%&niable&)y-centred(%level()sponsored($type%-ring/ordering\'!s',
+    '\'$tive+"ly&,tmentalizing%$ssed\'$ions%*tibilities("ly$"co$\'earance%&nsable((tion.the%$ring%1tence-performance()t-looking&+i&rehy;tive',
+    '++/exhibition)$vity($ors.$,i&eacute;gne%$egne%(lationes$!l%\'acement(#nce&*int/injury%&eatest&(mentiser&%table\'"e1("st',
+    '%-iance-testing(#tly&-cated-looking\'%ities)"ly%%uvium$\'onentry&$iert%$rted%,ser/arranger&&ition.&$tool%!u&)nd-radius(\'/phrase',
+    '&"me%*ehendingly)%sion.&3ssion/decompression)$vely(+or/expander+\'limiter("us%$izmt%&omisos$(stations&"on$(ton-hall$(unctious%2tational-intensive',
+    '&(er-coded+%ntrol)&guided)%maker+)nipulated)%users(!.(#ese(%izing(%s/new(,vertriebsges&*illiterate\'#ng+#-stock-needham##ten',
+    '\'!y##yng"#n-a$)merchants#%_moto#!a$$mara#-bay-greenwood#%cacaf%\'tenates*$ions%$vely&(o-convex$#edi%#ede',
+    '&,tration-camp(&ically%!p&#ts.\'(ualistic+$zers%&rnedly\'$ment\'"us&(t-giving)$oing\'(ina-like$$hies%%ology%%yolin',
+    '%\'liarist(&tingly%#ous($ness%$sion$&luded.&*sion&mdash$(omitance%/urse/caf&eacute$+r&egrave;te%*ete-mixers#(demnable(\'tionist\'#ers%!n',
+    '$"ie%"ta&"io("n.)\'ability$$or-2$$uct.\'$eurs\'&resses%%isant$&ylomas#$ella$"ys#8f&eacute;d&eacute;ration$/erence-drafting',
+    '/!s+%table*"s.\'"rs&%ments%%ssin\'(#on.*%alism$0idence-inspiring(%tial.,$ity.%*gurability("es%\'rmative\'#ed.',
+    '$(ormances\'!e&%table%\'undedly$+raternities$!u%-cian-buddhist%$ndar%+sed-looking&$ion.#,gestion-free$#res#&idence$%stons$!t',
+    '$)ecturally$$oins$&uction%&gality%#nto##mey#"n.$"ar$%ebert%#cti($ons.(&veness%"rs%"tt##omy',
+    '#.science-racked((tisation*&zation%\'ripting*#ons$#ell%&nsuses&#tor%+quentialism."ty*#ly.*!s%*rationists&0vation-conscious-(oriented',
+    ',#ism,!s*&ve-led-)reformist)%oires%!y$)iderable.)&tions.%#lio%%stant\'$ent.*$with\'%ories$-ociationalism,!s',
+    '&#ute%+mm&eacute;s\'!e%&rtium.\'%ships$(picuous.$-table/mcleans*$west&*n&ccedil;a\'!d\')t-current)\'density(#ian)"na*\'e-cyril',
+    '&-tuci&oacute;n(!t),ionalisation%\'raints.,#the&&ucted.$-ubstantiality%%laire\'$tion&(tant-led(,tion/liaison\'#ors&"um%+mer-banking)(friendly',
+    '("s.&&matory&&ptions#+tact-making(\'tracers\'"or)!s%)giousness%\'inments%(minative$%emned&(poraines*$rily%&ndings&)t-focused',
+    '\'&edness\'(iousness\'\'s-pages%\'rminous%%sted.%%xt-cs(7dependence/independence(\'effects\'*ualization$(iguities%"ne\'!d\'&ntally&%ously\'!w',
+    '&#uel("s.\'*ous-speech%$unes$.ra-distinction\'(rotating&%bando(%ssoon&\'cted-in)"rs(%ions.($ors.(&ualism&#ils\'2ndications/special',
+    '&(position,#ves&#rio("um\'"y.&\'variant\'%eners%&e-coup%)ibutions.&"es%+ol&eacute;s\'%lably(#er.*%/data\'$ment',
+    ')!t%&ubtion$%umacy&#ely%#ras#(ulariids$,rbation-wide$%sance#)vectional%"en%!n&%anted)"or)!s&&ience-',
+    '&(t-school\'+ional-style,%ities%$rsat)!e%#xos%$yed.\'"rs$$itto%&vially$#oke#*y-catchers$"ne"%ochie#"de',
+    '##eee#(k-gordon%#off$!.$(/kitchen$(er/stove&\'y-books$&houses$(ing-pots$#lin#&l-warm$&ed-off%,yhighharmony$(ing-down$$more',
+    '#\'mbs/new#&nhound##ool$$rwee#+per-bristol\'%parry&&/award&&ation.+!s&%stock$#per#)rdinadora(,te-invariant)$ions*"ve',
+    '"#pco#$ecks$!k#"go#$ians$)es/genome$#lia$#osa#%lanar&"ds#!o##pee%(r-colour)%vered\'(engraved',
+    '\'%lined\'&plates\'(sheathed(\'ulphate\'$zinc&"as&%heads&)y/gingery#%rario$#efa$)oductions%%lalia%&phagic#"sa#%thorn',
+    '#\'ulative\'"or%#ins#"y-%\'holders%&typing$#art$%books$#in\'&"gs$-right-cleared*)protected)&holder$%taker$%write',
+    '#%acias$)l-eclipse&$like&$pink%"66$!n#!b$$alis&#lis\'!y$&elling$+i&egrave;re$"oz#&d-like$$aite',
+    '$%esman$\'on-bleu\'\'trained&"es$\'ubensis%"la$$well#*e\'journals$\'-funded%$like$)ferential$$less%$scsi$"s.%%ellis',
+    '#$iads$$llon$$nder#&k-like%\'stopper,"ed,!s#"ma#+n-and-sheep%%field&%lakes%$mill%\'stubble$$ball%&orough',
+    '%)o-retinal%\'r-kicks&$back&%light%$wall$\'factors$$land$&stalks$\'tonvale$%ubian%&copias%#tes&"us#%onata%$opus',
+    '%!s#\'p-apple%%sears$%/ross$&ectomy$.oraci&oacute;n(!y\'-te-governance*%style)$ness(\'isation)"ve\'%zioni$*se-candles$%uscle',
+    '%%ctors%(latively+!s%"os$%idoni%%genda%%ngham$%odale%*sion-proof\'#ves$%ugate%$ptor$&yhully#%saire$%elets',
+    '$%icans#$tico%#jos##ves$$ille#(y-wright$#ate#"zo"\'scoroba#&e-like$\'cretion$&ied-up$"ns$!r##ied',
+    '##loy#(metology$#ica\'!l%#que$&ogonic&&raphie#&ntable#%siers$"on&!s%!r$%utius#0t&rehy;effective$(-centres',
+    '%+ineffective%)justified+$ying%)optimised%+performance%\'savings%$wise$!/$%anoan&(tinopoli$!e%!n&#tin$"ia%"ca',
+    '%!n$)ume-maker"$tely$)rminously$%sbach##ier$#nga#%mania##ret$)imoxazole#+swold-stone#)tage-loaf$\'er-pins&$rell%&scombe',
+    '$&ington$*on-growing\'*harvesting\'$rich\'&thread\')wool-like+"ly&%grass&%mouth&#oid&$vale"%u-cou#$bert$%rough##cal',
+    '#!d$#erc#\'ffignal#$gars$#her##ild#$ld\'t%\'/should$)ing/rspca$%ouris$$shed%#ton$$tard&!s%%hards',
+    '$"ba#+ncil-rented\'&lor(s)*"s.+#hip$$ihan$%tably%5er&rehy;revolutionary\'\'-action))ssertions))ttraction2!s(%block($case)%hange',
+    '*"ty)&laimed*#erk)%ourse)\'ritique(%earth($girl)(uerrilla(-interrogation+)imidation+(uitively((marching)\'elodies*$mory)#ove',
+    '((petition)\'ressure*\'ocesses+$mise+\'paganda((reaction*\'ference*(gulatory*&sponse*)volutions)%umour(&signed)$pell))tatements)\'ubjects',
+    '*!e(&tactic)\'endency*$rror)&heatre*&oughts*$reat\'%check((lockwise(&urrent\'5immunoelectrophoresis\'$line\'$move\'&parts.(\'urchase',
+    '\'&tenors("op(&rading\'(weighted%$ings%%lines%#ree&$y-bo($club($folk(%lover(%music(&tinged\'$=044\'#ish',
+    '\'\'side.it($tone\'$week%"ss%\'y-based\'&ground\'%level&)/district&!1#*p&eacute;s$&-prone$+_de_theatre#%raged%$tari$$bets',
+    '$%monts$(not-nash$(se-grain\'"is&*/admission&)s/modules((seminars(%units&%ulles$&t-like%*/hampshire&(tribunal%(eousness&#sey%$hope',
+    '%#ois%)s-martial%!y$"us$%ville#$sin\'$&taussa#$thie$$ured#*ven-museum&$able%!s"%vatta#.entry-produced)5solihull-warwickshire',
+    '&\'picture%#boy%$dell%$girl%)ing-space%$ting%$wood#$ings")w-keepers$%sheds#)ardliness#$bell$$irds$%reath#*es-torquay',
+    '$$eson#&l-neck$"am$\'ey/west$#ick#$punk##tan"(x/thames#"on"%y-yll#.le/northampton&+oxfordshire&%stoke&\'winslow##pus',
+    '!*p29-pulsed""as"%c-464"#fjc""ga"!h"#i-m""ls"*m/&micro;l"#u32%!+!"qc#!s"!r!-r&eacute;dito',
+    '*%merie"#+lf"$-red#&spinel"#.c.""a-#\'b-cakes$#ber$&eaters$.tree/reporting#)ck-crazed&#ups%%erama%$ings%%line.',
+    '#\'ft-type&$work*#ers%$iest&$ness%#man%%point%(sman/men&\'persons#(g-u-like$$gier#!i$(g-martin&%y-don%&/vicar',
+    '%$head%)iebuckler\'#var&%nches%$nure%$side$%ngeau#!k#%mwell##nch$%domna$%e-fly\'\'reuhauf$&iology&$tomy',
+    '$(k-driven%%ed-up%#ish%\'onizers$&merian$!s%#haw$#tit$%worth##obh#%pness$%piest$\'shooter#!s$(h-course',
+    '%$ings$"sa%"er#&tchitt&\'ley/sfv$%eload%&r-like\'*production$%horne#$vate$)en-walker#%wfurd$&laways#$y-3s%*compatible',
+    '#(zy-paved"#che"*e&ccedil;y#!.#&akings$"ly$/m&rehy;coloured%!-&\'striped%!.%\'/yellow%$iest%\'y-faced$#nga$+se-downward',
+    '\'$ines%#ser$,te-a-critter%#in\'\'"in&#on.##cca#"di%"ou%)t-betting\'&giving\'\'ratings\'%using&%ation&$ors.',
+    '$)ulousness#\'echurch$%dence$$lman$$pin\'\'#ess#\'fdl.com\'#log##han##ina#$mate#)nellation$\'ilabrus$\'ulation#(ole-like',
+    '%\'isation#(pe-soled%!y#\'scentia$#sid&%ngton$$wick#.utzfeldt-jacob#&w-cuts$"el&$work$\'members##yke"-icket-playing\',er(&pound;2)',
+    '#"m.$)e-beating&(fighters&$rate%!.%"s.$%inale($ises&#ous$+son-cheeked\'"ed#%ngely$$kley$%oidal#$ollo',
+    '#,sis/hardship$$pest%#ian%"um$$tata#&tchett$%erias\'#on.$*ical-point(.ly/chronically($ness%%sises(!m$!o"&oakers',
+    '$,t-controlled&%owned&)populated%-ian-populated#$cata$#hes$!i$$kard%&enburg$$odil("ed#$esor#(ft-cooke&&murray%&houses',
+    '$(s&eacute#$lles#&matici$!b%#ach%"et$$dale$%ptons$%wells##nos$"yn#2ok/buckinghamshire%#all%$back%&shanks',
+    '&#ngs$!t#(p-haired%(sprayers$%heads#+quet-ground#+ss-addicted\'*pplication\'"rm("ts\'\'tlantic&%bones\'&unkers&(cambered\')ompatible',
+    '((rrelated(\'untries)$pled+#ing&.denominational\')iscipline\'$ress&(european&&faults\')ertilized&%group&(layering&*nationally&\'product)$file',
+    ')&motion&%rails\'%hythm\'\'otation(%uting&%slabs\'$tage(&itched($rait)$eets)%iated&$team\'&rading&,undertakings&%winds',
+    '("re("se%(.section%)/crescent%$beam&(ow-bolts%%check*"ed%/e&amp;blackwell&"rs&)s/corners%$flow&#ord%$gate%$hall',
+    '%)ley-payne&"y.%#ons%$peak&$lank%&raguel&\'eactive%$wood\'\'rdsws20##ups$+sel-robelin#(w-pecked%$size$\'berries$&d-flow',
+    '%&edness$%foots$#mer$%sfoot%#ton$$tree#!y$"de%-on/wallington""p2#!3"%ubain$#een#%chard%#ley',
+    '%#fer&#ies&(orm-plan)!s#%dites#%elest#!g$!s#+ise-missile&%rmart#*j&iacute;a##mby#(nchingly&(y-topped$$dall',
+    '##ral#$sell$"hy$\'oe-like$(t-mantle%)y-looking#&tchley#&z-diez"%ynant#(ohydrate$*protective$%scopy%%phere$\'therapy%(urbation',
+    '%!o&&coccal&%grams)%phers&\'logists#\'staljet\'%loids\'$ware&!u!#s-3#&evoked#!x"!3"&a-cypa#\'llokozi',
+    '#!l""pd""r1""sd!#t17"!9"\'esiphon"&rl-k-b\'!m""ta""up""xa!%u-nim"!2"(ban-born',
+    '#(by-holes%%holes#%elets$#row#%iques$\'to-anal#!r$!y##ura""ci#%k-oos$$ooed#\'ullatus"&ddlier#,gel-wielding',
+    '#!i#!s"(e/review#!2##nta&!s#"ta"%idado#%leann##rim#"us"\'kierman"-l-de-thatcher#$daff#)icifacies',
+    '&#der%#ton$&ifords%!n#(minatory#+otte-shorts#$s-de$&almond#\'t-image%$like$#ism%\'vatable$/ural-historical)*linguistic(,/ideological',
+    '&\'e-based#\'ulative#"za",mani-trained#"b.$-erlin/richard&%some.*"ly*$ness#$erih#&i-cumi$$skey#(merbunds##ont#%plido',
+    '&\'-nimbus"&nhaval#.ningham-burley\'$ness#&t\'anas$%-lips$"ie")pboardful#$rous$"um#&s/mugs$#ful"\'randero#"e.$!l',
+    '#)few-knoll#)iemuirend$+ous-looking\'(ly-named$#sts#%kurca#(lew-like$%icued%$ness$(y-whirly#!n#)rant-eyed$#ell%*nt-derived\'%.unit',
+    '$&iemuir$#ock$(y/friend#$sham$$itor(!s$"on#+tain-makers("up(&walled$#eis%"sy$(lingside$"on#$undu',
+    '$%iness"\'scatlan#%forth#!h$$inan%)on-shaped%#tic##pal#"si#(tard-pie$\'is/john$\'omer(s)((-focused*\'riendly)#led',
+    '()/supplier&&isible$!y#%umano")t-and-run($suck$#ins$$keys$&leaved$(throughs#&/boost#$down#"e\'#%hburh#&iculin',
+    '$*ing-tables&!o"#vee"&xhaven"(ylenburg!#v21"!i#!i$!c$!i!"w5""gc""pr"%utils!$x486',
+    '""li"$xiii!#y-a"+anoferrates%!l%%types#)thostomes"&bermen#$ilia""c1#%lable%&mineus%!x$\'e-clips%&tracks',
+    '$0ic-amp-regulated%&sation&*t-friendly$(oalkanes%&hexene%$idal\'!s%\'propane%(rrhaphan%(sporin-a&$tome*!s%&thyris"+f/snowdonia#\'yngedig',
+    '$0nder-by-cylinder&%racea\'#ica%!k#"la"%mbalo##mer"!n#%ddelw$!i#%eburh$$wise#\'ghanedd#&heidre#-ically-minded',
+    '##rik#"th",rix-designed"#s-x#\'tectomy$)icercosis&"us%!s$\'oscopic&#oma"&tidine#-ofluorimetric$\'keratin%%inins$\'megalic',
+    '%,roliferative$&xicity"#uma"%zicus!!z"%ech-o%!o&\'slavkia#$rkas$#mak"%irjak .d&aacute;valos#$mp;w"&bsol;a\'!b',
+    '*#ris*#uts)(gagement*(ustation)/l&eacute;gation*#its)\'mocrats)4n&eacute;r&eacute;az)$part-$ment)$rain)!s*-habill&eacute)%ville"-lsqb;uke&rsqb',
+    '(!3"\'ndash;2"$phgr"%sharp"#tgr##hgr"*uacute;nem#)uml;mlein\'#nki"\'wcirc;r!-\'&eacute;cole*$lite*(t&eacute"&a&yuml#\'beville',
+    '#&ccordo#%donis##gde$"en$$oult$$rate#"ix#(lbertine%"on$"va#.m&eacute;rique$%boise%\'rumenil$)enagement$$icos',
+    '%$lais&&eterre$"ie$#jou#$ppel%"ui##ran$*chitecture$(gentiere$&magnac&$niac$#ras$(tillerie#%ssisi$"ti',
+    '#/vila/thamesdown$#oir"&egypte#%iffel##lsa#&nergie$+trecasteaux#%pinay#&scosse$&pagnat$%sling$&tampes%%rades#,tablissement#%urope',
+    '#&yville"%garcy"*h&ocirc;te#&erelle%$mine$"ux"%iakov#*nstruments$\'vention&*stissement#+sere/tignes#%talie"$jaga"&lssaux#+udinghausen',
+    '#"ie$$sans#%leron$%ivera$$oron#$pale#%rgano$$male$+ph&eacute;e#&squich#$utre#$ysel"$thee"&ulisse#*nit&eacute',
+    '$(f&eacute%"ey"!y#!a!#(t)!!+"!1!#-11#!6"$40nt"$9000"$base"&decent"#end"%files',
+    '"#o-g"$sign"%to-as#$rain""vs"!y!%.&amp""10##591##631"$2.a."$a.n."%e.s.k"&h.s.s.""l.',
+    '"$m.u."$p.p."$r.h."$s.v.#)ubobscura"$t.i."$viis"$w.c.!+/00/22/0002&&3/0078*"85($2010+!8*"25+!7',
+    '+!4+!9*"51+!2+!5*"70+!2+!7*"92+!3+!6)#100+!4+!6*"11',
+    '*"22+!4+!6+!7*"36+!9*"47*"55*"75+!6)#203*"24&&4/2003+!6&&5/0009',
+    '+!2+!4#)1/23/0024+!9*"30+!3+!6+!7#)2/25/0001+!2+!5#)3/25/0015+!6#)6/25/0005*"17',
+    '"!2"%88/05"!r!#1.1"#2\'s"!6""d2!$2000"!1""34"!5!#3+1""06""a1!"4+',
+    '""10!$5410!#6+1!"70"#633!$9516#"23$!9!):cohesion!"=0#".5!"aa#"wa"#bhk#$rell',
+    '##ent$!y##ite#!k#)tylorhiza"(d-in-law#\'adadada$!r$!s#$dy-o#+f&amp;sharp#"os#\'s-to-be"\'edalian#!k',
+    '$!e%*/associate"&gestan#"ge%&r-like$#ing#!h#$nall##oes$#net#$wood"#hil#%lberg$#ing#%omean',
+    '"\'iliness$.y&times;number#"ni$$tith#"on#&quiris#&ry-cow##sey$*y-flowered&)sprinkled%%wheel#%tlers"&kkabug#%leton#)ota-based',
+    '##yns"%l-led#!a$#ngs$"si$$vich##dis$"ry#&egarth$%smade##gas$$etty##iba$!n#&kamoni',
+    '##lin#%mally%%rnock%!s#$ness#!o$!u#\'swinton#*tonon-tees#$yson")m-busters##aen$*g&rehy;ing$"ra$&scenes',
+    '$$vand#&benzet$%uster##ery##iba#(janovski#&lamian#$mars#&n-near$&ations#\'oiseaux#)p-proofed%(smelling&&tained##yat',
+    '"(n-y-bont$!z##ann#(ce-bands$#hem$)ing-girls##dai$$ling$#ois$\'zangiyn#"ek#&g\'rous$(er-spots&$mond#!h',
+    '$"da$+el/millward&"li&\'s/house%!s$!i$$lova$(schewsky%\'h-based(#orn\'%owned#&kwerts#&nebrog$"ie&#lla',
+    '#!o$!y#$sant$#eco$)produktie#%thine$%os-91$&rolene$#zic"%oists##uad"*phn&eacute#%perly$$orto"(ra\'iyyah',
+    '$(y/county#%cians%"es#\'danelle$"en#(e-devils$\'devilry#\'gaville##ics$#que#+k-dark-grey%\'fringed%&greens%&headed%%robed',
+    '%&tipped%&yellow$$enin$%falls$%inbad$*ly-stained$&nesses#&leston$&ingest\',ton/saltburn*$ians*!s#(mowiyoto#&nedest%!y',
+    '$#ton#"ra%!h%!n%$wish#$shan$,i&egrave;res#)t-playing#"ul#"vi%"ll#$went$$inii&!s"\'saratha',
+    '#)h-mounted%#pot(!s$&ed-off$#iel$$pots#-sault-breguet$#ert"(ta-cubes%$like%,manipulation&(odelling%&object%)processor%+warehousing',
+    '$*base-style("s.$\'centres%-ommunications&$rder$$dase$#hub$&logger*-/photoioniser\'#ics$\'metrics$%reive$%solve%#tar&#rom',
+    '&$onix#\'chworth#,e/time/place$"d.$%marks$"s.#$ings$"on$!r##ost#$uras"%ubert$$ings#"da#"gh',
+    ')&cities,!y)\'in-laws(%board##ney$(orubicin$)tlessness#\'phiness##rah#"to"#ver#\'id-neel%1son/quartermaster&#tow$*es-gilbert',
+    '\'&thames\'$west&"es$#nia$"ot$(s/earlys&&nelson$"tt##lat#"ox##son$$tone##yum"%wamat#"ie',
+    '$$ings$%light#"ud"#xer"4y&ndash;to&ndash;day$+rehy;stages#+-and-a-half$\'centres$\'hunting$)labourers$$pack$%rooms$\'schools$\'workers##.it',
+    '$$time$\'weekend#&adhuam#$beds$#ook#%lamis$!y##mer#(s-at-sea$"/2%9occasionally/rarely/never$%chool)!s$"on#\'tripper',
+    '",zzle-painted!%b-lib&$rary"\'/octave""15"#2/2$#600"!4"$fast"!g""mc""rw!\'c-10-10#$2031##600',
+    '""10$!s""dc"$p614""s/!.d-unemployment"!1"$9-e7"%afydd"\'cs/6000",dddddddddddd"$mmyy""oe"(s/patrol!8e&rehy;industrialisation',
+    '#$caff$+entralisers,#ing$,ommunization&%press%(ntrolled#/democratization#)hardening$+ospitalized##ice$-ndoctrination%2stitutionalisation$&oniser#/materialisation$&ergers',
+    '$\'otivate#\'natured#)pollution$&rogram#)recognise*"ze%&gister&%ulate#*selections$(tabilize%&ocking$-ulphurization##tan$#une#%umpty',
+    '"#/dr$!t"!3"%_deux"*accessions#&d-meat%"on%(reckoned$$ball$#ful$$meat#,fferentation#!h#\'l-maker$$ers.',
+    '%"on\'!s$%maker$#try##mer#(n-shaven$)/scotland$%field$$ston#*r-achieved%#but$$ness%#ley#%ssign("ed',
+    '#,th&mdash;the%&-camps("se&\'penalty&$toll%$.the%!/&$rode%$bats&#eds%%knell"%bases$&ted.so$%uches$#yle',
+    '#)enham/dna$&rnardi#)ilitative$"to##mat#&onaire$%unced#%rided%\'s-flows#(t-burden%$free%(interest%\'payment%&to-gdp$!4',
+    '#".1#$/vms#)ades-long(#old$!l%!s$"ns$\'peptide%%itans$&rteret##cie#$eent$"lx$&mber-1)!7',
+    '%\'lineata$\'nt-size##hen$)lorinator#$iles$%mally$,sion-problem(\'.making("is(\'medical%#ons#\'k-shoes$)er-slaney#)laratives%%ssify',
+    '$$ine.\'"d.#&odable$\'lletage%&ourise$\'mposers&\'ressing$%ncini%\'gestion%)secration%\'version$)rrelation%"us$&urtray$#yed',
+    '$\'easings%#ets%\'menting$$ibed$$ypts#$sion$!t$&ystems#\'ussated#,voicebuilder"$ddle#!e#(icatedly$#nje$!t',
+    '#%locks#-olomitisation"%e-dah#"bs##dee#!n$"ey#-p&rehy;rooted$--conditioning&&rowned%(discount(%posal%%going%&keeled%$laid',
+    '%&pocket%#red%$seal&$pace%&yellow$!a$#end%\'r-level\'&seated$#sea#)r-hunting%(stalkers$&hounds$$like$"ne',
+    '$%iders#"tz")faecating(#ory$#zio##con#(ectively$"et$(mination$(nce-line()splitting&#ism%/dant/respondent)"s.%*estrations',
+    '\'+vely-minded$%rrals#%icit.$#ler$0ned-contribution&*s/explains%&iendum(!s#\'lations$&ective#\'ocusing#&reites##ter%"st"-glycosylation',
+    '#%olyer#(r&eacute$#ess\'#ive#%uerin"%hesas#+istoricizes#$lavi$"er$$oran##orn%!s#(umanizes#(ydrators&)ogenation',
+    '#&ciency##nde%,ustrialising$"en$+onychosaurs$+stallations&-itutionalised#&oniser".jected-looking$"ne##mal#&ong/ap"&kasegi#$lerk"&labere',
+    '$"ge%"oa$+hunt/sports$&minate$$ncey&!y$!p%#age%$hena$$rden$#ted$$vaud#%baere%#nco$#ert',
+    '#&egater$$stre$&tions.$"za##fin$!s$\'t-based##hay$.i&ndash;jaipur,&london#\'i-diner$$ciae&#osa%"ts$&ghteth',
+    '$"ma%(itations$(neations%$kage%+quent-prone*"ly$)on/hoddle$(pidation$&quesce#(l\'abbate%*ombrellino$"ow#(menhorst%!r##ore',
+    '#&phicly&%nidae)!s$$orto#-sol-innocenzi#*ta-epsilon$&rintem##uca$#des$#ise$\'sionary$!z#%vings"%machy$,nd-aggregate',
+    '%$ning$-terialization%%urity#.eester-johnson$!k$)thylation%"ri#\'i-heure%(mondaine%)pirouette%#sel$#dov$%johns$#se.%#ter',
+    '%#ted$$xing#)obilisers(\'zations$-cracy-society\'*t-inclined(!a(,ic-bourgeois*!a(+s&mdash;see$(dulation$*kraattinen\'#tia)!k*!a',
+    '*!i(%yczna$\'lished.$&n-king%"ax%\'isation%,strativeness*"um$\'ralizes$#tes%\'ivation)#ors#$pers##sel$#zky',
+    '$+tionalizing#&beries##den$/rochronological0"st\'%oelum&"id&\'logists#\'e-metis$#gri$%nberg#%g-led$"ra#&itrify##ley',
+    '#\'osovich$\'tations$\'uements#+sely-packed%!n$"il%)ty-matrix$$tone#&t/aged%+oxfordshire$*al-records&#ium$!e%#lle$\'iculata',
+    '$,nciationists#$wick##zin"&odadus%#tus#*ntological#,xynucleotide"#par%,affinisation%.tmentalization."ed$%ssier#"en%"d.&$ance',
+    '&.ence/addiction$)rsonalise$!x#.hosphorization#"it#$lane$&oratio#\'ocentre$\'larizer$#rts$&sit(s)\'(-holders\'"s.$(tentiate$#wer',
+    '#(ravation&%ities$\'edators%&ssion.\'#ors#&t-name$+h-dependent&\'related%$less$"s.##uis$)te-fiscal%$ies.&#zes%*y-chairman',
+    '$(ngements\'!s#*by-winning#%echos$&gister%\'ulators$#san#(imanoczy$*vationally#(kinderen#!l#*m&eacute;e$!a%.to-venereology\'#bia',
+    '#%ogant&#tes\'#ing\'%orily$$ualt#)ravarragh#$vaig##wen&#deg$"ig"*samperados$\'turases#%caves$\'endance\'$ible',
+    '$$hamp$&ripton#)ecrations$(gregated$%nfans$%rbais%*t-dwellers&*ed-looking&!i\'&sation&"s.$+xualisation#,ferrioxamine$#ord#!h',
+    '#%iatin$%ccate$%deria$$erto$,gn-conscious\'$wise&&/build\'.computer-aided\'.implementation\'&layout\'*production&*er-dressed&"s.\'*/irregular$#nor',
+    '%%eable#"k/$$lamp$\'scan/ux$+top-centric(\'to-unix##mid&!s$#oid#&p\'rate$\'arately$&erados$#ire$\'oblados%&ndence',
+    '#\'serprit&"te#-tabilizations*"er%*linisation$!e$+inov&aacute$#our%#yed$%riers%%oyed.%\'uctive\'")tachabead$#ins$$ngle',
+    '#\'ectioun\'\'ve-work$$namo%)tion-camp$+rgent-based%)iorations%(minantal)#tor(*ed-looking(!g()istically%&oriate#$mold#&ouring#$rain',
+    '$#unk#\'terding$"on#)umescence*!t"&ucedly%!s#%dsche#&ocioun"#val$#nna$#rda$%sting#-elopment-area,\'control',
+    '%#ped$&nishes$$rall%#gie%#ils$"si#*iationists$\'ce/full&)=ansi.sys&$name\'"zo$"ng$\'talised%&rified#"oe',
+    '*#ist$\'nshires$#ran\'"do$(tionally%!o#\'station"\'w-claws$$drop$%fresh$%laden##ell$&rstone##ick$"ng',
+    '#%niors#"ry#%sland"4xter/gloucestershire$#ris""zi!%f/sms"$118s"#=12#!8""da#!p#"rs"$l.12#5100,000&ndash;150,000',
+    '!"gc"!s!$h.60#"88"!7"#aba%!s#%hran2#"ir##nik%#ram#$rjee$#man&%shala%$sala',
+    '"%illon#$vehi"$otis"(rogorati#\'ystones"!t"$uqan!"i\'"&-deoxy#\'methile"#/dt"&abelli%(tologist$$olos#)chroneity',
+    '#(g(1,2,3)$1nosis/malfunction*)treatment$%rams.#\'laphone$.ect-divergence\'$ally\'%ician\'\'ologist%!r$%stone$"up$!y#&mantes$\'eter(c)',
+    '#!o#$phot$#irs#%rrhea#%sopan$#ter#\'tomites#%zinon"#bal#%orane"%cebox$"rs$!s#)hograptus$(terliebe',
+    '$%emann%"rs$)ie.bamber%+nson/museum#"op#%ranum##tes$\'ionarie$%orial##unt#!y#\'zfalusy"#d_a#%dledy##s\'t',
+    '#\'-linked$$offs#&bstahl#!l$*ectrically#$mens$!s#"ng$*tzenhofers#*sel-driven\'*mechanical&\'/petrol%!r$(senhofen$\'telkamp',
+    '%)conscious$!.$%erich$#her%/ylhydroxylamine\'-pyrocarbonate#&udonne"(ff\'rence$%-lock$/erent-patterned)!i$&icuity\')lt-to-let%%dent\'%!l',
+    '$"t.$#usa&(er/dryer&$ion.)$ists#\'luoride#)unctional"%gance#$beth#&estifs\'$vely##far$"er##ges#"he',
+    '#%istat$)tal-video\'!s&#ria&"te%"is##lis#&nifies%(t&eacute&%arian\'#tum&"ie#!o#\'uanides"\'hydrate',
+    '\'(pyridine"$jker"*k&eacute;0##fer#%taian"\'lations#(ettantes##lan$!i%%ngton$&on-lee"&m-eyed$#sum#(ercaprol&%urial',
+    '(\'sulfate#6inished-responsibility%&utions$#tru&!y#)okratikis$"na$!v##son"\'ncerler$#ote#$eage$&rstein##ged$#hys',
+    '##kas$$eloo$+i-doodi-den$"ys#$mont#)ner-dates\'&plates&$ware$"ie%%ngton#%obore$"ff$"so#"ts"\'ocesans',
+    '#,de-capacitor##ecy#$icus##lch#&nysios#)xin-laden(#ike"$p-in$$shit#%.h.e.%&e/bed.&!s#,henhydramine&"yl#(loblasts',
+    '%#idy%%ma/ma\'%ticus&$onad%#pia#$nois#%rivan#%slide$%ticks#&terous$+hongisation$"on";r&mdash;integ&mdash;chk.log#"an#"be',
+    '#*ect-labour\'&memory&)/indirect&/ion-independent)"s.&(or-elect)1general-designate0$ship))secretary*+hareholders(&/oxfam(.s/shareholders&"us$!r$\'tissima',
+    '#$iger%%ieren#%schau#)t-smeared&\'treaked##uta"\'s-aster$+information$$obey#*abilities.)"y.%$led*((_because%%using$+ccharidases',
+    '$\'ffinity$(nalogies$&ppear.)#eds&%lying&\'ointed.$*rrangement%)ticulates$)ssociates+#ing%)ter-prone)&relief##bar$\'elieves$%urden',
+    '$\'ernably$\'harged.$/ipline-specific$\'losable\'#ed.$&o-bats&\'dancers%"ds%*mbobulated%&ncerts&*nectedness&%tent\'*$edly\'%inues%"s.',
+    '(#ive\'\'teously%$verd$\'reetest&#tes\'%ional%(iminably*+ted-against$!u%.ssion/homework##eas&.e-of-the-month$(mbarrass&(owelment$)ntailment',
+    ')#ing$#use#(function#&gorges$)runtledly$%ussin&"to#&h-king%\'washers$)armonious$(evelling$$rack$%towel$+washer-safe##ick',
+    '$+nflationary&(rancised%(hibition%*tegrations\'%rring%%vited#%joins\'\'tedness$)unctively#\'k-based%(resident#*mantlement%!s%"ys$&issal.',
+    '#"ny#&oblige$(pyramide$%rder.%(ientates+$ion..!s#&pargum%&tchers$#end&&saires\'$ible%&rsants\'%ement(!r',
+    '$#lex$$onee(!s&-ibilit&eacute%$rted%\'sition.&&sessor$0roportionalities$"ur%.te-settlements\'"s.#*qualified.%&ieteth#)regarded.$#obe',
+    '&\'ointing$%ecans%%mbled%\'ntients("on%/rtation/project$\'imulate%(patively$&olvent$%uader#%taffs%(nciation$"in&5ctiveness/equivalence+!s',
+    '\'(uishably+"er$*ortionless$(ractible&$ints\'"te%!i&!b\'%utism)(or-level&*ct-nursing&"to%"oy$"ur#%union',
+    '#4yllabic/polysyllabic("le"\'tchford%%water#%herer#%tborn$"ie$#oed#!z"&urnall$"on"%vadlo#\'e-bombs$\'rgently%(sifiable',
+    '\'#on.%#tor(!s#(idedness$!n%"as&%tions\'"or)!y%$itie("ve%#sky$,sion-project(+/department)#new',
+    '("s.##ock$"ky$$rce.#\'ulgence##vie"1x-huiti&egrave;me#"ey"(zdarevic#%ygous##zie$(y-making!\'jakarta#(molidine##ssi',
+    '##maa"!h"(iboutien"(umgalbek"!v!"kb!%l-101"!2"%c/llc"#itt"!m"#ugy!&m&lt;t"#0.5"\'1.00=85',
+    '##00m$)7,000,000#!3#%5,000$!0%.&ndash;200,000#"68#"98#!m"!2##.25$!5$"70$$8308$$9537',
+    '%!6#&00,000#!1#"21#"98"%3,500$#600##.20$!3$"93#&00,000#!5$$,000#%8,000$%0,000',
+    '$$,800$#.8m"!4##.02#%0,000$#.8m#%4,000"!5#%0,000$!0#%2,000"%6,800"!7#!0#"b5',
+    '"%9,000##00m#!4""cl"&e-like#(m/10%fcs"!g"%itrov"$k-jd""na"(stlb4281""vs"!x"%ytryk&$shyn',
+    '"!6""a-$%based$*containing&%pying$#dna%#rug$+independent$&strand#\'se-free"!x!#o\'l",-be-do-be-do#"do#%goody',
+    '"$/can""17"$215s"#:nt"#aks"%belle##ler#&ozendi##ras$"es$\'oliubov%*vsk&yacute(!y#$sons#!u',
+    '"$ccia#%k\'ead$(-workers%$yard$\'endorff$#ray$%sides$&worker##ton%/r&mdash;patient&)-assisted&!/\'&healer\'*specialist#!u',
+    '$+ment-driven(&alists)%tion.(+s/envelopes"#dan#%dered#(ekathlos##gy."&es/did$#n\'t%!t#$tsch"&g-ends$#fox$\'handled',
+    '$$lead%%overs$$shit%&itting$%teams%$rack$\'walkers#!/$$cat/#$bury#&collar##dom$#yke##ets#&gerell',
+    '$%y-dos#\'handler#$more#\'s-tooth$#ide#!u#%woods"$hnal#\'renwend#"uk")i-edwards#.ng-it-yourself""ja$"ng"#kle',
+    '##bey##der#$ente%!z$!y$#zal#\'gorukov#!i$(choderus#)l\'s-house$%-mask%%sized$,ar-sensitive$#fus#"ma',
+    '#$phie&&n-like$!o#$tons".m&iacute;nguez#%ain-1\'%based\'+independent$"ni&"al#&berger$%roski#"en%$gini%"ic',
+    '$*stic-based(/ally-orientated#%hnall#"ic$%nancy&&trixes%&icanus&!e&$ques%$orum##kat#$mage$!e$"oc#&odeovo',
+    '&,mess-with-me%$/did#.ald/kidlington\'$stow$(t-cattin%#ism%"or$!u##bas#!c$!k#$e-by$!r%!s$"tz',
+    '#$gbei$!o%"la$"us#$head#"ja#)key-rides&#man#"lt#%nalyn$"ee%"ll\'(/holiday$!o#!o',
+    '$#ugh#$yatt##zac"%o-wop##bie#(dle-bugs##lly$$ough$!y#$mily$&sayers%$tone#"na#!o#$psey',
+    '%$lock%&panels&$osts%$stop$%/door%#lid$$case(!s$\'darshan$\'handles$#key%\'nockers$%locks##san""pa',
+    '%\'dealing#+pler-shifts#"ra#$yera"%radid%!s#5chester-on-the-thames#$este#"ji#%lonco#$mael%"ns\'#ide$"ir#%othee',
+    '%"ty#%salis&!s%"ta$#ets\'$hire$$iger$"um#&tmanna$"on$#yol#"us""s5#$anjh\'(/vehicle',
+    '#(e-effect$$/100$!y#!i##sal$$eret$#ick#(toevskii%&yevski"*t-graphics#$/bar$$dash#"an#!t#"un',
+    '$#rin#0ble&rehy;checked&"-a(#cts\'&banked)$rred(&illing(%ogeys(&uckled\'\'counted(&utaway\'#dip($omed\'\'entries\'&faults',
+    ')%ndred\')insulated\'\'manning\'$neck)"ss\'&octave\'(polished\'!s(%ingle\'(taxation($ests($hick,$ness*"nk(#ime',
+    '&%/twin&*d-breasted($over\'%ecker\'#ick$!s$&t-free%$ful.($ness%%ingly#(gh-faced%%tiest$)las-cowie\'#ton#"la',
+    '%$ouya##nby$#iam##ros#!s#"we")v\'&egrave#&e-tail$#ish$+r-dunkerque%!s"#wan$"yo#$dale#"en',
+    '#,n&rehy;right$!-%)and-dirty%%draft($ught%*escalators%\'lisburn%(payments&(enalties+!y%)regulated%\'shifted&$ized&%tairs&$wing',
+    '$$.the$%beats$(climbing$&flexed$$ings$%light)"er$(regulate$.s/player-coach%&brough%#men$\'towners$,ward-curving&"sh\'$ting',
+    '"%xepin#$ford#%ology##sie"!y##ard#"ce#"ne"#zer#$mary#!n!$p872""lr""m3#!i',
+    '"$-ing#%shift"%.eric#!i"#400"!7"&abbest#&chsler#"ff%"an$)ou&scaron$)t&pound;9%(-quality#+g&eacute;es$&-lifts',
+    '&\'educing$%/lift$!a$$nets$&on-fly\'\'slaying&$folk#(h&aacute#(in-holes&%tiles%*age-basins%%cocks%#ed.%$hole#(kensberg',
+    '$#tic#*p-de-dames$$erie#.ught-excluders\'%board\'$flow\'$less\'0smen&mdash;while#&vidian#\'w-backs\'!r%$down%#off$*bridge-end$$card',
+    '$"in&(g-boards(&pinned$$mops#$ymen$#son##zen",da-compliant"(eam-girl&%image&#man%$girl%%lands&\'essness$$rier',
+    '$&german#&nkmann$"th#*panocladus#$sner$$s-up%#es.%#ier&$ness\'&g-robe)&tables#!t##ver$"in#(w/labour',
+    '%"tt$!s$#ton#"ys"\'ibblers\'\'thwaite$$lets##ft/#\'ll-stem%$ings#&msynie##nk.%!/%-ing-fountains)&houses',
+    '%&s-cans&!.%0water/cheltenham$#non#\'ppingly#%therm#!v$$e-by&%holes&#ins&&shafts\'&timuli&#way\'$heel%(r\'s-side',
+    '\'*technician%$time$(ing-cape()unrelated#(zzly-day"%oites#%llery&!t#(medaries$!i#"ng##obs#\'p-downs%%front%#ins',
+    '%$zone$\'ped-out%!y$%shaft%$ical#%schke$#ten#*ught&mdash\'&-prone(\'ravaged)(esistant$"yn#(ve-roads""tx"&ucilla',
+    '#%esnes#&g-bust)#ing%#dna%&linked%\'pushers%%store%)treatment%$user$(/alcohol%#dna$\'runners$-s-trafficking#&m-beat%&shaped',
+    '$*ballyroney%!o%#uie$%cliff$#dow$\'keeragh%"it\'!s$$mer.$\'nakilly$&ochter$$rane%$unie$"s.%#kin',
+    '%!s##sen""ws"*y-assembly$$cave%"ow$%goods$\'looking$%suits#"as%(/allerod&)preboreal#&bridge%#ook#$dens',
+    '#$noch#+opithecinae,!s#%point$#ure!"s0#"02""19"!3""4c"\'agnidze""dp"!k"&p96002!"t2',
+    '""ds"%i/itd$$serc"/jbkwirzrezlmqco""tp"#x-1!,u&scaron;eks*(n&iacute"#agh#.l-architecture%(carriage\'&ssette&#hip%%edged&&lement',
+    '%\'process%$role%*wavelength$!s"(b&aacute#&-style#$arry#&bed-up$$ings#$edat$"ry#"ha#"ia$#nin$%table',
+    '\')liverpool#"no#"oc$#isi#%reuil$"ow#$yana"%casse#%enius#0h&eacute;-pairie$"ac$"en$"in#&k-toed$#ers',
+    '$)ing-stool$$wich&"ng"#dai#"en#!h#&leston"&emling#$rden$!r#\'senberg#&ttists"+ffel-coated%!y$"ie',
+    '"%gnani$!y"#hig"$ibhe#$gnan#$kers#&rinish#!t"&ketios"%lally#%cetly$"ia%!s$#ote#"ey',
+    '#!i#%l-red##ude$"th#&y-made"\'m-di-di%/o-be-do-dum-dum#"an#.b-bell/barbell&%londe%&waiter$$ells%"st$$head$#les',
+    '#"ky##lao##mie#&ollard#&psters#%ville"&n-aidh$(naomhaig#"ai$#mis#%beath##cah%(n-sandys($mith&#sby',
+    '#+das-whatley$&erhead*"ed*!s$+onald-based$"ry#\'e-buggy$$land$!m$$side#\'g-heaps&#ill)!s$$arth%"te',
+    '\'#ous%!y$%worth##ite&!s#"ja#&kerton%%swell$"il#$nage$"ed$%ikier%#ngs#%ollie&!y',
+    '$%eldyr##sby&%/plum$$eath%#ith$$ford$$tans&!y#!t$%horne#&woodie"\'o-pitch#\'decagon%"na&2ogastrooesophageal',
+    '#(polistic#$some"#pal#%erial#%halac#$ions#\'lantier#(r&eacute##uis"%rably$&linium$#nti$&yappah#-din-robertson0!s',
+    '$"ut&%/host#$hams#)ium-laced#"ji#(novarian$%stein#"or#"ra$&enmatt%$wald#$upty$#tti#$ward"\'skiness',
+    '$$hera#%t-bin%%cover%&devils&"ry%\'jackets%$like%%proof%\'wrapper$$bags%\'in-like\'#ian$%cover$#ily$"on',
+    '$%storm)!s$"up")tch-owned#(ifulness$%lleux""us")val-smith!"v8"%aitin""or""ta!,warf-growing$%kados$$vish',
+    '"%eezil"&iggins!"x7""c4""e4"!i""pp"$s442!&yanmic##son""ba"%cetel#"ks"&edeoxy#"ts',
+    '"#ker$!y"$llis"&metrol#$moke#$phna"%nafit$&graphx$&mation%*ite-packed##ham#&ix/ptx"$rham"\'slexias#&phoria',
+    '$%noeic#)rhythmias#\'trophic))n-related"#ter!(zardyhan#&sokhov")erjhinsky"\'helepov##oni#(umagulov%&galbek$&ngaria"&ongkha *e&agr/&bgr',
+    '"#deg"\'mdash;1"\'ndash;3(!e!\'(e)prom""y)!!+!%-2570"%boats")documents"&grades"!j"!k"(mail/tao&!s',
+    '#&umbers"&series#%haped")venix/386"$word##rap!#.17"!2"!8"!9"$a.f."$d.c.$$t.a."&g.l.r."$h.e.',
+    '"#m.i""o."$s.c.$!p$$r.c."$w.c.!+/00/22/0001+!3&&3/0008*"19*"23+!4*"36+!7*"42',
+    '+!6+!7+!8($2011+!8*"51+!5*"66*"75*"80+!9*"91+!8+!9)#104',
+    '*"11+!3+!5+!7+!8*"20*"37+!9*"40+!1+!5*"69*"73)#203&&4/2013',
+    '+!9*"20+!1+!3+!4+!8&&6/0033#)1/26/0012#)2/25/0001#)3/25/0001+!2#)4/25/0002+!4+!5+!6',
+    '*"11#)5/25/0002+!3+!4+!5&&6/0005#)6/25/0010*"25*"33"!g"!i!#1/2"#0.1$!2#!4',
+    '"#2.1$!2$!3""80!\'2&sol;3"#-e4"&348/69"!6"$8/39!#3/4#$f-b1"!0"!5!\'4&sol;5"!8',
+    '!"7+"".1#!2"!0!+8&ndash;e11"".1"!s!#9.1#!2"!0"!6"!9!"=5!!_!#aba',
+    '"$dgar#$mund"(gleblood%%sbush%"ts"$lier"%nmund"&r-ache$%drums$\'ringing#\'/visual#\'bashing#/lier-than-usual\'&/later$&sferry',
+    '%$gate%$town$&y-20th&*eighteenth&)flowering\'%ormed($urth&#may&\'release&)seventies\',ixth-century&%third&$year##man#&n-outs',
+    '##ole&!s#(p/course$%honed#&rings.#!t$"h-&+and-animals&(centered&$fast&\'mothers&$numb&&packed&#red&\'science',
+    '%&enburg\'%wares&"rs%&liness%%mover(#ing%%sense&)hattering&#ide%$wear"%se-of$!y#+ily-defined\'(obtained\'&worked',
+    '#"om#)t/central%$east%\'pacific$&church%4ombe/gloucestershire$$down$)er-bonnet&$lies&\'n-style$2ham/worcestershire&#ven$&phalia$+ward-facing&!y',
+    '#\'y-carve%(drinking%"go%$knit%(to-carry(#fly(%learn((maintain(%reach&%rieve%$wipe"$t-by#&herley#*ing-places\'%speed',
+    '%%ville"(u-de-vie#"ze!"ba#%lgume"%bings"%erulf""hs"$ling"&maj7th"%onite$)y-tressed#!t"!t"!v',
+    ',)8,500,000+)2,300,000+*52,500,000+*60,800,000*+236,700,000+*72,000,000**70,800,000")-albanian#%based##gcc#)supported""12#!a""2p""3m',
+    '"#acc"#c83#"ho#(lefechan%$siam(#rch(%stica-#lly&%ville"!d#$ysis"+hmatocrinus#)o-gnomics%\'sounder$(/natwest',
+    '$*cardiogram$(genicity$$plex#%risen#\'ternach"7khardt-gramatt&eacute\'s##man""lr"(o-audits$)conscious$&jargon$&labels$(no-miser$*terrorists$$wars',
+    '(*ally-sound-(valuable&+y-conscious#(nomatics&(etrician&)ic/social(.ally-depressed-*orientated\'#zes&\'y-sized\'(/foreign#)ri-bsteii##tec$$onal%#ols',
+    '#$wash%#ter"$tasy$#tic#\'odomain$&morphs%!y&)corrhizal$\'pically%*lasmically"-u-denominated#%1,250$%0,000%)0,000,000$#3.1',
+    '#+250,000,000$"bn#%3,000$$.3bn$%2,500#\'500,000$"bn#+750,000,000#*=usdollars#(adorians$#nor#(menicals(#ism#&reuils!#d48',
+    '#$5/66"#888""at"$burg""de$!y#!o"$elen$%maier&"nn$\'zwicker#%nside%"or#)r-puestow##tic',
+    '"(garstown#\'e-bound%+of-the-seat$0/gloucestershire$%field$$moor$%woods#$hill"&ificio%"ed#&mbourg#*nburgensis(\'h-bound*\'managed$"r.',
+    '#%sbury$\'on-bell#%teurs$"hs$%ions.$(orialist"&leston##ina##und"&minson#,unds/suffolk\'"on\'#ton""ns""oh',
+    '"+sa-national#"on"!u#$arte#"c.$#and%,tion/library*.qualifications$"ed$$tion""w.#$arde&#ses\'"on#$orth',
+    '$,ye-ee-aye-oh"#173"#794$!5$!6"\'c-style"&deelee"+l-fishermen#!a#"de##ing$!s"\'ngleesh"#s-a#"co',
+    '"$tzky!.f1&bgr&ggr&dgr$#dgr#$-11s"\'dalzade""eo"*fac&eacute%"es#&ect(s)&$-the&$ives&\'s-based&$uate$&nterre#.iciency-equity',
+    '*!.#6ort-performance-reward#!y"$ghcd"$imov"$raim"%ta-ec#&hymios!#g/p"%alite"%berto"#don",g-associated$&eating$)infective',
+    '#$ison#\'olsheim#%s/fry"$isto""le#&ington"$nell"\'o-based%$ound$\'feeling$*gratifying$*structures$%trips#,centricities*!s',
+    '#%ismus#%mania#*tistically"#pgc#$tian"&rapsen"*u&iacute;a"*ypt-israel%#air%(ian-made&"on!$h-eh""11"!7"#den',
+    '"\'renberg"$ukai"/yeh-asher-ehyeh!"ic#%hhorn##ken"(derdowns$\'tically&#ker)!s"\'fionydd""ge$)rnordwand%$wand#$ht\'s',
+    '&$chip&$feet\'$ifty("ve\'$rame&$game&$lane&$nine&%pound+"er&&roomed&(stranded)#ing&/to-12-year-olds&\'wheeled',
+    ')\'fifties*#oot)(nineties.\'y-eight)\'sixties-!y(+th-birthday\'!s%\'h-round%0y-seven-year-old\'(thousand),ree-year-old\')year-olds"#iia$!b',
+    '"$lles$"is"!m"#nes#+heitspartei#4stein-podolsky-rosen%#ien"7r&iacute;ksdr&aacute;pa##ene##wen"&sa-emb#$eley$,nhuttenstadt$!r#!l',
+    '#)teddfodau#&ziszki!#jaz$!i")idatarios"$oyed!"k4"#man"#ong"#ron""ta"$vall!(l-amarna#&bahari%#red',
+    '#%hagar$%ejara#%mahdi$%edina#%robee"(1055/108"#34s"+aborateness##gen#%mites#$phus$$idae#*stoplasted#$tius##vil',
+    '#!c#"io#(residenz##urz"&derley#$fell##ils#&on-lee%$ians&#ids##rid"&ean:in#\'ct-ions%(ion-free%(ric-bulb',
+    '(,ally-induced)!s(!i\'$fies&(o-active(&magnet*\'terials)$etal(-physiological)(neumatic)"op()vibratory\'(analysis\'\'candles()omponents',
+    '($raph\'%lumen\'%meter(\'yograms\'(n-proton(\'egative(\'ic-mail*,ally-excited)!k(%volts\')pherogram(&orated)&sitive\'*retinogram\'%scope',
+    '(1tatically-charged\'%voice#*gantissima##kes$,tra-nonesuch&"ik&!o#"ph%)ant-jokes)%sized($ipes#(thandian#(utherios#!v$/ation-signalled',
+    '\'#bar\'#day\'%point\'5to-fourteen-year-olds(%wenty"&f-shot##ish&"ly#$rida%#ede"\'garians"*icitations&#ors#"da#%ments',
+    '#&ptical#(tiveness#"z.$&abeths"\'kabbach#"ie$"ns"$lard#"ef$"n.$-rton-on-swale$"tt#&iptica$"te#%sberg',
+    '##yon"$mlea#%stead"#ner"$odes#"he#"ra"#ric##ose##uge"#sag$#nta#"e-$#car$!n',
+    '#&heimer#$more#!t$%erian""th"$uent#$sion"!v##aco##yra"(y/milton#$akin#!n#!r!$m\'ly',
+    '"\'banking$$rgos%)rassment.&\'essment##erg$)zzlements#\'ioptera#/l-heidelberg.de$(/genbank$!4$#ing#!o$%ldens#(raceable$"un',
+    '&&phytes&"s.#-usqu&eacute;s"#cer"#ely#.rald-encrusted$(y-wallis"#ili%"an##nox#-ssion-control&$vity#&ttance""ly"&ma-hoo',
+    '#"en$%rsons%#ton$#tts#\'issions#"ty"#ona#4tional/psychological)*ly-charged"(parkment#&erface#&hasis.(#ed.)!r#0ire-commonwealth',
+    '%%icals#&leados$#ins$!o%"ye\')e-details)$like(!.\'0r&mdash;employee()-financed("s.))/managers&-ment-creation+#led*-/unemployment',
+    '#*resariales)"os&&sement(!s#%ty(y)%%-eyed&$hand#$usae#%yemas"%see-h#*lie/former##tar""tb""va!*n-tout-cas',
+    '"%29001",amel-dentine$$ines#$ngan$\'tiomers\'&tropes#%rques#"ta$"or"$berg"+capsidation$.rnaci&oacute;n$&shable&%ments#)ephalitic',
+    '(\'opathic#%hanta#$inas#&laves*$$oser&$ure.#$omia\'$stic$$rage$%unted%#rge#%rinus$%uster\'$ment$%yptor',
+    '#!s#!y$(clobanks$$sted"&d-1994\'!5$%april%%ugust$&blocks$&cannot&"ps$(effector,!s$\'filling$$game',
+    '$\'october%%f-the*&-world+$year%\'ver-end$&plates$%stops$$wall#./herefordshire#(angered.$*rterectomy($itis#(eaveours$(rby/ucca%$wick',
+    '##ism$#tes#%notes#(ocardium\'!p%+rinological-#sts$+glycosidase$(membrane$!n%%ymous\'!y$)parasites%$hora$*rsee-buyer',
+    '%\'helines$,wment-linked#"re#+s-and-means$"he#\'ytinges"!e#"as#$maed$&y-held#$rgy-\'%dense)\'pendent\'(guzzling\'$poor',
+    '&\'/matter#&urisis"%fance#&iladed#\'orcable#*ranchising"%gager##esa#(ine-note&#men%!s#+l&auml;nder$"an&\'d-class(\'ireland',
+    '$%ehart$$ish-(%dutch((electric($only)$wned(&texted(%welsh\'\'/creole(\'spanish(%welsh$#ysh#(orgement&#ing#$raph',
+    '$&ossers#\'uerrand$&lfment%!u".hanced-potency$*rmonically#)ydrazines")igmatical"%jambe\'$ment#"oi$&yable.%%ment."%ketei"$larg',
+    '"(meshment#$ired"&n-arno#$alls#"it#%obles"$ogat#$ught"!q##uir&$ies."%rages$\'pturing#"ic%#hen',
+    '$)th-cugell#!y"&schede#%erfed#\'hadowed$(eathment#%kilda##ley#0tone/oxfordshire$#rom"#tad#%elnor$$ndre%$sify%#tes',
+    '&\'enteric&\'pathies%\'prisals)&es.the#*halpically$%ralls$\'usiasm.$&ymemes#$iere$!s$*tled&mdash%-y-identifiers##len##man#*omophilous',
+    '#(r&eacute$$acte%"il%)nce-front($ment$$eats%(nchments$"im$%opion$\'y-point&$year#%wines"&ualios##res")velopment',
+    '$(romental&$nmen*3t&lsqb;vax/vms&rsqb+*-conscious,$like,(oriented,)sensitive+&/welsh+/al/conservation&%scope$!s#$seq7$%fifor"(wrapping"$ybpg',
+    '""zi#&ymatix%+e-catalysed%\'ologist)!y!*oanthropus"$lian"*s-designed#)inophilia""v1!#p20""90"#arn#%ulets""dd',
+    '")eronniers")hemerally$$seus#(ippiatus\'"um"(icanthic$%ercal$%urism%\'ticular#&damnos$&emical\'&ologic%(rmolysis$(idymitis%%orite',
+    '%!s&%trium#&hydrus#%lator$&imnion',
 )
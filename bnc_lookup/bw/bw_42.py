@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_42 = (
+count_42 = 6694
+
+heads_42 = (
     'after-glow',
-    'after-malta',
-    'after-office',
-    'after-shocks',
-    'after-theatre',
-    'afterbirths',
-    'afterno',
-    'afts',
-    'afts.',
-    'afuu',
-    'ag&egrave;d',
-    'ag/agcl',
-    'ag/ct',
-    'ag2',
-    'ag3',
-    'ag8',
     'aga-saga',
-    'again-',
-    'againsthe',
-    'agalev',
-    'agapaki',
-    'agapios',
-    'agard',
-    'agarde',
-    'agariste',
-    'agartala',
-    'agarwal',
-    'agass',
-    'agassizii',
-    'agavaceae',
-    'agbeka',
-    'agbetra',
     'agboyibo',
-    'agca',
-    'agct',
-    'agde',
-    'age-appropriate',
-    'age-dependent',
-    'age-difference',
-    'age-migration',
-    'age-participation',
-    'age-peers',
-    'age-selective',
-    'age-sets',
-    'age-specificity',
-    'age-weighted',
-    'age-wise',
-    'age/wage',
     'agegroup',
-    'agelessness',
-    'agelong',
-    'agence-france',
-    'agencia',
-    'agency-supplied',
-    'agentic',
-    'agerholme',
-    'agesilaus',
-    'aggater',
-    'aggers',
-    'aggghhhhhhh',
-    'agglomerated',
-    'agglutinating',
-    'aggregates-intensive',
-    'aggressionists',
     'aggrevated',
-    'aggro-leader',
-    'aghagallon',
-    'aghras',
-    'agil',
-    'agilis',
-    'agim',
-    'agimus',
-    'agisted',
-    'agister',
-    'agit-poppers',
-    'agit-properly',
-    'aglitter',
-    'aglycone',
-    'aglycosidic',
-    'agnates',
     'agnatic',
-    'agneau',
-    'agnesey',
-    'agnews',
-    'agnieszka',
-    'agnostically',
-    'agonia',
-    'agonisings',
-    'agonism',
-    'agood',
-    'agor&aacute',
-    'agostinelli',
-    'agp/ebp',
-    'agram',
-    'agree/disagree',
-    'agreeableness',
     'agreeement',
-    'agreementappendix',
-    'agregation',
-    'agri-food',
-    'agricultural-botany',
-    'agriculture-related',
-    'agriculture/',
-    'agriculture/conservation',
-    'agricultures',
-    'agrio',
-    'agrion',
-    'agriostomum',
-    'agro-industries',
-    'agrocin',
-    'agronomique',
-    'agrosoke',
     'agrupaci&oacute;n',
-    'ags',
-    'aguardente',
-    'aguecheek',
-    'aguila',
-    'aguzarova',
-    'agvs',
-    'agyrium',
-    'ah-100',
-    'ah-hah',
-    'ah-ing',
-    'ah1/ah2',
-    'ahani',
-    'ahau',
-    'ahead\'',
-    'ahearne',
     'ahearns',
-    'ahhed',
-    'ahilya',
-    'ahlan',
-    'ahlburg',
-    'ahle',
-    'ahlgren',
-    'ahlokoba',
-    'ahma',
-    'ahmadou',
-    'ahmer',
-    'ahmidou',
-    'ahoghill',
-    'ahram',
-    'ahrenson',
-    'ahrons',
     'ahuma',
-    'ahungalla',
-    'ahura-mazda',
-    'ahwoi',
-    'ai-ideas',
-    'ai-workers',
-    'ai7',
-    'ai9',
-    'aiadmk',
-    'aiai',
-    'aibmac',
-    'aichbauer',
-    'aid-for-economic-reform',
-    'aid-giving',
-    'aid-to-india',
-    'aid-users',
     'aid-workers',
-    'aide-memoir',
-    'aide_m&eacute;moire',
-    'aidez-moi',
-    'aids-stricken',
-    'aids-sufferers',
-    'aiee-e',
-    'aiello',
-    'aigaleos',
-    'aiguilles',
-    'aiiiieeeee',
-    'ailbe',
-    'aileen/the',
-    'aileu',
-    'aillen',
-    'ailsh',
     'ailsworth',
-    'aim-inhibited',
-    'ainsworthians',
-    'aioli',
-    'aipadass',
-    'air&ndash;1',
-    'air\'',
-    'air-blue',
-    'air-cored',
-    'air-drop',
-    'air-drops',
-    'air-freighted',
-    'air-gargoyles',
-    'air-guns',
-    'air-hole',
-    'air-hostesses',
     'air-letter',
-    'air-letters',
-    'air-lift',
-    'air-lines',
-    'air-minded',
-    'air-mobile',
-    'air-monitoring',
-    'air-o-bian',
-    'air-operator',
-    'air-pistol',
-    'air-pump',
-    'air-quality',
-    'air-sick',
-    'air-sickness',
-    'air-spaced',
-    'air-strike',
     'air-traffic-control',
-    'air/5%',
-    'aircar',
-    'aircrafts',
-    'airdale',
-    'airdrie1',
-    'aire-sur-la-lys',
-    'airedales',
-    'airex',
-    'aireyholme',
-    'airidh-ghuairidh',
-    'airings',
-    'airlessness',
-    'airlinks',
-    'airmass',
-    'airorhynchous',
     'airorhynchy',
-    'airospace',
-    'airpack',
-    'airpistol',
-    'airport-security',
-    'airscrews',
-    'airsick',
-    'airstrikes',
-    'airtronic',
-    'aisatsu',
-    'aisb',
-    'aischin.',
-    'aissatou',
-    'aitken-walker',
-    'aitken/daughter',
-    'aito',
     'aitogether',
-    'aitzaz',
-    'aix-based',
-    'aiyepeku',
-    'aizawl',
-    'aizik',
-    'aj6',
-    'ajag',
-    'ajanta',
-    'ajazi',
-    'ajc',
-    'ajirno',
-    'ajmer',
-    'ajudged',
-    'ajwaad',
-    'ak2b',
     'akabasharune',
-    'akamantis',
-    'akamatsu',
-    'akarana',
-    'akarit',
-    'akarnanians',
-    'akeakamai',
-    'aked',
-    'akerele',
-    'akey',
-    'akfm',
-    'akhalkatsi',
-    'akhalwaya',
-    'akhenaton',
-    'akhnaten',
-    'akiba',
     'akins',
-    'akmeyon',
-    'akraka',
-    'aksar',
-    'aksel',
-    'aksu',
-    'aktiengesellchaften',
-    'akuoko',
-    'akuzum',
-    'al&rehy;zahrani',
-    'al-abbadi',
-    'al-abbas',
-    'al-ahmed',
-    'al-akhbar',
-    'al-an',
-    'al-ansary',
     'al-ashtal',
-    'al-atasi',
-    'al-ayoun',
-    'al-bira',
-    'al-biruni',
-    'al-bukhari',
-    'al-bursawi',
-    'al-chalabi',
-    'al-dughmi',
-    'al-fayturi',
-    'al-ghazali',
-    'al-hachani',
-    'al-hanafi',
-    'al-haq',
-    'al-harash',
-    'al-hatash',
     'al-hindawi',
-    'al-hol',
-    'al-husayen',
-    'al-jasim',
-    'al-jayfi',
-    'al-jaz',
-    'al-jumhuriya',
-    'al-jumhuriyah',
-    'al-kata\'eb',
-    'al-kazara',
-    'al-khabar',
-    'al-khater',
-    'al-khazraji',
-    'al-khoury',
-    'al-khurayshah',
-    'al-kubra',
     'al-lurd',
-    'al-maalouf',
-    'al-madani',
-    'al-mahalli',
-    'al-malik',
-    'al-malki',
-    'al-mansur',
-    'al-mathami',
-    'al-mubayyidin',
-    'al-muhsin',
-    'al-mukhtar',
-    'al-nafeer',
-    'al-nakshabandi',
-    'al-nida',
-    'al-nouri',
-    'al-nusf',
     'al-oteiba',
-    'al-qa\'ud',
-    'al-qadhadhfa',
-    'al-qadi',
-    'al-qadr',
-    'al-qaiwain',
-    'al-qassimi',
-    'al-qatabi',
-    'al-raguib',
-    'al-rifai',
-    'al-rumaneh',
-    'al-sakhawi',
-    'al-salam',
-    'al-saleh',
-    'al-sha\'ab',
-    'al-shanfari',
     'al-shazli',
-    'al-shuhumi',
-    'al-sudan',
-    'al-sughra',
-    'al-suhaymat',
-    'al-taftazani',
-    'al-tamimi',
-    'al-tawil',
-    'al-ter-nan-the-ra',
-    'al-thalth',
-    'al-turabi',
-    'al-uraybi',
-    'al-usta',
-    'al-waad',
-    'al-wahhab',
-    'al-wazir',
     'al-ya\'qubi',
-    'al-yassin',
-    'al4',
-    'al7',
-    'ala&iuml;a',
-    'ala-pro-gly-pro-arg',
-    'alabama-based',
-    'alabamians',
-    'alachlor',
-    'alamao',
-    'alane',
-    'alanine-rich',
-    'alann',
-    'alanus',
-    'alaskans',
-    'alata',
     'alatyr',
-    'alauda',
-    'alaungpaya',
-    'alaysi',
-    'alazeir',
-    'albadou',
-    'albalooshi',
-    'albanese',
-    'albavera',
-    'albellus',
-    'albercio',
-    'alberdi',
-    'alberico',
-    'alberigo',
-    'alberni',
-    'alberstein',
     'alberston',
-    'albertans',
-    'albida',
-    'albizia',
-    'albo',
-    'alborado',
-    'alborough',
-    'albrite',
-    'albuginea',
-    'alburt',
-    'albyns',
-    'alcal&aacute;-meco',
-    'alcatel-alsthom',
-    'alcedo',
-    'alcholic',
-    'alcms',
     'alcohol-',
-    'alcohol-based',
-    'alcohol-fast',
-    'alcon',
-    'alcoreza',
-    'alday',
-    'aldega',
-    'aldermarston',
-    'aldersey-williams',
-    'aldershot-based',
-    'aldh2*1',
-    'aldina',
-    'aldingham',
-    'aldos',
-    'aldous/wiltshire',
-    'aldringham',
     'aldsworth',
-    'aldward',
-    'aldwyn',
-    'ale-cups',
-    'ale-masters',
-    'aleading',
-    'aleatoric',
-    'alecs',
-    'aleinikov',
-    'aleke',
-    'aleksandra',
-    'alekseyev',
-    'aleksi',
-    'aleksii',
-    'alemannish',
-    'alemu',
     'alen&ccedil;on',
-    'alesius',
-    'aleskerov',
-    'aletschhorn',
-    'aletti',
-    'alevels',
-    'alewives',
-    'alexander/organiser',
-    'alexander/women',
-    'alexandrians',
-    'alexandrium',
-    'alexie',
-    'alexsandr',
-    'alexseva',
-    'alfa-romeo',
-    'alfarista',
     'alfaroist',
-    'alfoat',
-    'alfreds',
-    'alg&eacute;rie',
-    'algabid',
-    'algae-filled',
-    'algemeen',
-    'algemeine',
-    'algenib',
-    'algicide',
-    'algie',
-    'algoflash',
-    'algonkian',
-    'algox\'',
-    'alha8',
-    'alhazen',
     'alhousseini',
-    'aliane',
-    'alice-in-wonderland',
-    'alienability',
-    'alienation.',
-    'alienee',
-    'alienness',
-    'alienor',
-    'aligue',
-    'aliker',
-    'alimentacion',
-    'alimentari',
-    'alinak',
-    'alipui',
-    'alisdaire',
-    'alishan',
     'alism',
-    'alitex',
-    'aliya',
-    'aljathaab',
-    'alkali-rich',
-    'alkalinities',
-    'alkalinity.',
-    'alkanones',
-    'alkathene',
-    'alkawari',
-    'alkibiades',
-    'alkies',
-    'alko',
-    'all-assessing',
-    'all-at-once',
-    'all-bright',
     'all-but-lost',
-    'all-carbon',
-    'all-comprehensive',
-    'all-determining',
-    'all-enfolding',
-    'all-forgiving',
-    'all-fours',
-    'all-fruit',
-    'all-girls-together',
-    'all-graduate',
-    'all-grass',
-    'all-grey',
-    'all-hallows',
-    'all-hearing',
-    'all-highest',
-    'all-human',
     'all-indian',
-    'all-member',
-    'all-original',
-    'all-persuasive',
-    'all-professional',
-    'all-provident',
-    'all-ranks',
-    'all-ravel',
-    'all-roach',
-    'all-smiles',
-    'all-sports',
-    'all-steel',
-    'all-things-bright-and-beautiful',
-    'all-things-considered',
-    'all-too-frequent',
-    'all-too-present',
     'all-too-prevalent',
-    'all-too-rare',
-    'all-too-ready',
-    'all-too-simple',
-    'all-too-well',
-    'all-ukrainian',
-    'all-wheel-drive',
-    'all_at_once',
-    'allamah',
-    'allami',
-    'allanby',
-    'allantois',
-    'allardice',
-    'allazon',
-    'allbutt',
-    'allchurch',
     'allclear',
-    'allcord',
-    'allderidge',
-    'alldigital',
-    'allegedley',
-    'allegorizers',
-    'allegrettos',
-    'allein',
-    'alleluias',
-    'allemagne',
-    'allen/witness',
-    'allentown',
-    'allergy-screened',
-    'allershausen',
-    'allesandro',
-    'allessandria',
     'alletio',
-    'allett',
-    'allexr',
-    'allez-vous',
-    'allfrey',
-    'alligator-skin',
-    'allighan',
-    'allinsons',
-    'alliott',
-    'allis/widow',
-    'alliss/brother',
-    'alliss/wife',
-    'allisses',
-    'alliums',
-    'allmann',
-    'allmole',
     'allmost',
-    'alloca',
-    'allocable',
-    'allocation.',
-    'allocentric',
-    'allods',
-    'allogeneic',
-    'allogenous',
-    'alloimmunisation',
-    'allopathy',
-    'allophony',
-    'alloplastic',
-    'allotment-holders',
-    'allotment.it',
-    'allred',
-    'allseater',
     'allseaters',
-    'alluph',
-    'allusively',
-    'allwright',
-    'almagro',
-    'almail.fil',
-    'almaktoum',
-    'almeira',
-    'almelo',
-    'almendros',
-    'almenial',
-    'alminio',
-    'almon',
-    'almond-eyed',
-    'almonds.',
-    'almondside',
     'almoravides',
-    'almost-dead',
-    'almost-impossible',
-    'almost-invisible',
-    'almost-irish',
-    'almost-new',
-    'almost_as',
-    'almqvist',
-    'alnager',
-    'alness',
-    'alno',
-    'alogoskoufis',
-    'alonim',
-    'alp\'roc',
-    'alp-horn',
-    'alpe',
     'alpen',
-    'alpen-adria',
-    'alpenhof',
-    'alpeninox',
-    'alpeter',
-    'alpha-blockers',
-    'alpha-compiled',
-    'alpha-fetoprotein',
-    'alpha-romeo',
-    'alpha/osf',
-    'alphaeus',
-    'alphaherpesvirinae',
-    'alphekka',
-    'alpilles',
-    'alpinesque',
-    'alpino',
     'alpkem',
-    'already-established',
-    'already-read',
-    'already-tight',
-    'alrewas',
-    'alrigh%',
-    'alsands',
-    'alsberg',
-    'alt+2',
-    'alt+p',
-    'alt+spacebar',
-    'alt+tab',
-    'alt+u',
-    'altar-boys',
-    'altar-frontal',
-    'altar-pieces',
     'altar-rail',
-    'altar-steps',
-    'altaris',
-    'altenbourg',
-    'altener',
-    'altenhow',
-    'altenmarkt',
-    'alterable',
-    'alterations/improvements',
-    'alternances',
-    'alternans',
-    'alterum',
-    'altgraf',
-    'altho\'',
-    'althugh',
-    'althusserians',
     'althyduflokkurinn',
-    'altitude.',
-    'altmark',
-    'altnacealgach',
-    'altogethery',
-    'altoona',
-    'altos/sco',
-    'altovise',
-    'altyn',
-    'aluminimum',
-    'aluminium-framed',
-    'aluminium-rich',
-    'aluminium/carbon',
-    'aluminosilicate',
-    'aluminous',
-    'alumna',
     'alvery',
-    'alvey/edinburgh',
-    'alvio',
-    'alvscott',
-    'alwa',
-    'alwalton',
-    'alwayth',
-    'alwey',
-    'alyakkh',
-    'alyce',
-    'alyd',
-    'alymphoid',
-    'alysardi',
-    'alzenau',
-    'am&eacute;ricas',
-    'am&eacute;rico',
     'am&ndash;12.15',
-    'am&ndash;4.00',
-    'am&ndash;4.30',
-    'am&ndash;5.30',
-    'am-5',
-    'am-dram',
-    'am/am',
-    'am200',
-    'am42',
-    'am43',
-    'am44',
-    'amabalis',
-    'amabilis',
-    'amado',
-    'amahaggar',
-    'amalgamates',
     'amalrik',
-    'amandry',
-    'amanita',
-    'amanuel',
-    'amanuensing',
-    'amaoui',
-    'amap&aacute',
-    'amaravati',
-    'amaray',
-    'amaret',
-    'amarillo',
-    'amarnath',
-    'amasses',
-    'amateur/video',
-    'amateurs.',
-    'amathila',
     'amatoria',
-    'amazon-based',
-    'amazon-centred',
-    'amazonie',
-    'ambaziensium',
-    'amber-brown',
-    'amber-eyed',
-    'amberola',
-    'amberstone',
-    'amberyarn',
-    'ambiences',
-    'ambiente',
-    'ambigua',
-    'ambitiousness',
-    'ambleteuse',
-    'amboinensis',
     'ambracia',
-    'ambraseys',
-    'ambrosian',
-    'ambu',
-    'ambulacra',
-    'ambulation',
-    'amchitka',
-    'amcits',
-    'amdel',
-    'ameca',
-    'ameda',
-    'amegboh',
-    'amego',
-    'amelanchier',
-    'amelchenko',
-    'amelung',
     'amenability',
-    'amenably',
-    'amenity-wise',
-    'ameral',
-    'amerce',
-    'americ',
-    'america&sol;caribbean',
-    'americaine',
-    'americal',
-    'american-indian',
-    'american-italian',
-    'american-russian',
-    'american-trained',
-    'americanese',
-    'americo',
-    'ameripass',
     'ames-lewis',
-    'ameshet',
-    'amgen',
-    'amharas',
-    'amicabilis',
-    'amicorum',
-    'amida',
-    'amidostomum',
-    'amiee',
-    'amilcar',
-    'aminata',
-    'amination',
-    'aminco',
-    'amington',
-    'amino-terminus',
-    'aminopeptidase',
     'amintor',
-    'amintore',
-    'amiram',
-    'amirantes',
-    'amissae',
-    'amityville',
-    'amleto',
-    'amm',
-    'ammani',
-    'ammann',
-    'ammarn&auml;s',
-    'ammc',
-    'ammer',
-    'ammerbach',
-    'ammeters',
-    'ammomanes',
     'ammonitico',
-    'ammoperdix',
-    'ammount',
-    'amnerican',
-    'amnersfield',
-    'amnesiacs',
-    'amnestic',
-    'amniyat-e',
-    'amnon',
-    'amnosia',
-    'amo-te',
-    'amodio',
-    'amoebocyte',
-    'amoeboid',
-    'amoita',
-    'amora',
     'amorally',
-    'amorges',
-    'amorin',
-    'amortises',
-    'amoxicillin/',
-    'amp.',
-    'amp/hour',
-    'amped-up',
-    'ampere',
-    'amperometric',
-    'amphibolitic',
-    'amphictyonic',
-    'amphilepis',
-    'amphilophus',
-    'amphioxus',
-    'ample-bottomed',
     'ampliative',
-    'amplifier/filter',
-    'amplifier/speaker',
-    'amplitaq',
-    'amps/cabinets',
-    'ampy',
-    'amschel',
-    'amsivarii',
-    'amthaal',
-    'amundeville',
-    'amurricanes',
-    'amuthed',
-    'amygdala',
-    'amys',
-    'an&aacute;lisis',
-    'an&oacute;rien',
     'an-yang',
-    'an20',
-    'anabarites',
-    'anacapri',
-    'anacreon',
-    'anadall',
-    'anagen',
-    'anahita',
-    'anakim',
-    'analects',
-    'analgesia/anaesthesia',
-    'analogist',
-    'analogizes',
-    'analogue-digital',
-    'analysed/consulted',
-    'analysis/algebra',
     'analyst/programmer',
-    'analytico-synthetic',
-    'ananieva',
-    'anapaest',
-    'anapril',
-    'anarak',
-    'anarch.',
-    'anasleen',
-    'anaspida',
-    'anastasios',
-    'anastomose',
-    'anastomoses',
-    'anathematized',
-    'anau',
-    'anaxilas',
-    'anbar',
     'ancelotti',
-    'ancendant',
-    'anchor-decorated',
-    'anchor/ballast',
-    'anchoritic',
-    'anchorwoman',
-    'anchouey',
-    'anchuranas',
-    'ancientness',
-    'and-a-half',
-    'and-oh',
-    'and_,_and_,_and_so_on',
-    'and_,_and_so_forth',
-    'and_as',
-    'and_er_and_so_on',
-    'and_er_so_on',
     'and_erm_so_on',
-    'and_even',
-    'and_so_on_and_so_forth',
-    'andahuaylas',
-    'andean-centred',
-    'andeneas',
-    'anderson/chief',
-    'anding',
-    'andouillettes',
-    'andr&aacute;s',
-    'andr&eacute;-charles',
-    'andrai',
-    'andrassy',
-    'andre1e',
-    'andreetti',
-    'andreievich',
     'andrejevs',
-    'andren',
-    'andreson',
-    'andrews-born',
-    'andrews-speed',
-    'andrews/campaign',
-    'andriano&eacute;lison',
-    'andrien',
-    'andriev/haralambie',
-    'andrija',
-    'androcentrism',
-    'androgenic',
-    'androgenicity',
-    'andrology',
-    'andu',
-    'andze',
     'aneirin',
-    'aneka',
-    'anenometer',
-    'anerkannte',
-    'anerood',
-    'anfibio',
-    'anfrage',
-    'ang&uacute;stias',
-    'ang.',
-    'angas',
-    'angband',
-    'angel-like',
-    'angelergues',
-    'angeles-style',
-    'angelesisation',
-    'angelopoulos',
     'angerstein',
-    'anghui',
-    'anginal',
-    'angiogenic',
-    'angioplasties',
-    'angistri',
-    'angjeli',
-    'anglain',
-    'angle-bending',
-    'anglerfish',
-    'angles.',
-    'angli',
-    'anglicanae',
-    'anglin-jarrett',
-    'anglo-america',
-    'anglo-argentinian',
     'anglo-brazilian',
-    'anglo-canadian',
-    'anglo-canadians',
-    'anglo-hellenic',
-    'anglo-hungarian',
-    'anglo-irishman',
-    'anglo-jewry',
-    'anglo-nubians',
-    'anglo-palladian',
-    'anglo-scandinavian',
-    'anglo-turkish',
-    'anglo/american',
-    'anglocentric',
-    'anglophobes',
-    'anglophobic',
-    'ango',
     'angola-namibia',
-    'angoran',
-    'angra',
-    'angra-1',
-    'angrez',
-    'angsana',
-    'anguishedly',
-    'anguishes',
-    'angularities',
-    'anhedonia',
-    'anhidrosis',
-    'anhydrobiosis',
-    'aniane',
-    'animadversions',
-    'animadvert',
-    'animadverted',
     'animal-cruelty',
-    'animal-headed',
-    'animal-health',
-    'animal-watchers',
-    'animalcule',
-    'animalism',
-    'animals/plants',
-    'animam',
-    'animateurs',
-    'anion-exchange',
-    'anisomycin',
-    'anisopliae',
-    'anissa',
-    'anisul',
-    'anjuu',
-    'anketell',
     'ankle-chain',
-    'ankle-jacks',
-    'ankle/arm',
-    'ankle/foot',
-    'anlen',
-    'ann-thennath',
-    'anna-liisa',
-    'anna-maria',
-    'annadale/queen',
-    'annagannihy',
-    'annagh',
-    'annaghmartin',
-    'annaghone',
-    'annalee',
-    'annalibera',
-    'annalong',
     'annamaria',
-    'annatto',
-    'anne-imelda',
-    'annegrit',
-    'anneke',
-    'annelies',
-    'annell',
-    'annes-on-sea',
-    'annetta',
-    'annider',
-    'annie-pod',
-    'annoni',
-    'annotates',
-    'annotator',
-    'annown',
-    'annoyingness',
     'annseley',
-    'annuaire',
-    'annually.',
-    'annuitants',
-    'ano-genital',
-    'ano-rectal',
-    'anoa',
-    'anodic',
-    'anodisation',
-    'anoestrous',
-    'anole',
-    'anomalocaris',
-    'anophthalmos',
-    'anorectic',
-    'anorectum',
-    'anorexically',
     'anorthosites',
-    'anosmia',
-    'anotec',
-    'another\'',
-    'anrep',
-    'ansa',
-    'ansatz',
-    'ansch&uuml;tz',
-    'ansdell',
-    'ansei',
-    'ansen',
-    'anserinaand',
-    'ansford',
-    'anskar',
-    'ansorge',
-    'anstey/farmer',
     'anstraum',
-    'anstruther-gough-calthorpe',
-    'answ',
-    'answered-',
-    'answeres',
-    'answering.but',
-    'ant&ocirc;nio',
-    'ant-eater',
-    'ant-hunt',
-    'antagonizes',
-    'antaios',
-    'antakya',
-    'antalya',
-    'antao',
-    'antarcticus',
-    'ante-dated',
     'ante-fix',
-    'ante-hall',
-    'anted',
-    'antelyas',
-    'antezana',
-    'anthemis',
-    'anthoceros',
-    'antholin',
-    'anthologists',
-    'anthony/owner',
-    'anthonys',
-    'anthozoan-like',
-    'anthrobus',
-    'anthroplogy',
-    'anthropocentrism',
-    'anthropoidea',
     'anthroposophical',
-    'anthroposophy',
-    'anthroposphere',
-    'anti&rehy;immigrant',
-    'anti&rehy;social',
-    'anti-abolitionists',
-    'anti-aesthetic',
-    'anti-african',
-    'anti-anginal',
-    'anti-anti-smoking',
-    'anti-antiracism',
-    'anti-aquino',
-    'anti-aristotelian',
-    'anti-asiatic',
-    'anti-awami',
-    'anti-axis',
     'anti-baldwin',
-    'anti-bfass',
-    'anti-bolsheviks',
-    'anti-bolters',
-    'anti-bureaucratic',
-    'anti-business',
-    'anti-caking',
-    'anti-calvinists',
-    'anti-cd45-coated',
-    'anti-ceausescu',
-    'anti-class',
-    'anti-classical',
-    'anti-climatic',
-    'anti-climbing',
-    'anti-clough',
-    'anti-collectivism',
     'anti-comintern',
-    'anti-conservationist',
-    'anti-correctionalism',
-    'anti-counterfeiting',
-    'anti-credit',
-    'anti-criminal',
-    'anti-cuban',
-    'anti-cult',
-    'anti-cultural',
-    'anti-cyclones',
-    'anti-cytochrome',
-    'anti-damp',
-    'anti-democrats',
-    'anti-deportation',
-    'anti-devolutionist',
-    'anti-disney',
     'anti-drip',
-    'anti-ecology',
-    'anti-ecumenical',
-    'anti-educational',
-    'anti-eec',
-    'anti-egalitarian',
-    'anti-elitism',
-    'anti-emetics',
-    'anti-enjoyment',
-    'anti-ershad',
-    'anti-escobar',
-    'anti-euthanasia',
-    'anti-everything',
-    'anti-evolutionary',
-    'anti-evolutionist',
-    'anti-executive',
     'anti-export',
-    'anti-falangist',
-    'anti-federalists',
-    'anti-free',
-    'anti-free-radical',
-    'anti-friction',
-    'anti-frown',
-    'anti-gambling',
-    'anti-garotting',
-    'anti-goat',
-    'anti-golfers',
-    'anti-gorbachev',
-    'anti-governmental',
-    'anti-gst',
-    'anti-habre',
-    'anti-habsburg',
     'anti-hanoverian',
-    'anti-harassment',
-    'anti-hc',
-    'anti-headhunting',
-    'anti-hebbian',
-    'anti-heroin',
-    'anti-hierarchical',
-    'anti-hitler',
-    'anti-hobbesian',
-    'anti-hypertensive',
-    'anti-idiotypic',
-    'anti-igg',
-    'anti-imperialists',
-    'anti-individualist',
-    'anti-internment',
-    'anti-ira',
     'anti-islamic',
-    'anti-jewishness',
-    'anti-keynesians',
-    'anti-knife',
-    'anti-kurd',
-    'anti-l1',
-    'anti-landlord',
-    'anti-lawson',
-    'anti-lebanon',
-    'anti-leukaemia',
-    'anti-lfa-1',
-    'anti-log',
-    'anti-loraine',
-    'anti-lord',
-    'anti-ltte',
-    'anti-mac-1',
     'anti-marian',
-    'anti-materialistic',
-    'anti-meskhetian',
-    'anti-metaphysical',
-    'anti-mig',
-    'anti-migraine',
-    'anti-militarism',
-    'anti-mitochondrial',
-    'anti-monarchical',
-    'anti-monarchists',
-    'anti-monist',
-    'anti-nasserite',
-    'anti-nationalisation',
-    'anti-nationalists',
-    'anti-naturalistic',
-    'anti-nazism',
     'anti-oppressive',
-    'anti-p-cadherin',
-    'anti-p53',
-    'anti-pain',
-    'anti-patriotic',
-    'anti-pigeon',
-    'anti-pitt',
-    'anti-plaque',
-    'anti-political',
-    'anti-politics',
-    'anti-poor',
-    'anti-positivist',
-    'anti-privatisation',
-    'anti-protection',
-    'anti-protozoal',
-    'anti-racketeering',
     'anti-radar',
-    'anti-rap30',
-    'anti-rationalist',
-    'anti-reagan',
-    'anti-reformer',
-    'anti-right',
-    'anti-rightist',
-    'anti-royalism',
-    'anti-rushdie',
-    'anti-sceptical',
-    'anti-schistosome',
-    'anti-screwworm',
-    'anti-seasick',
-    'anti-self',
-    'anti-shah',
-    'anti-shine',
     'anti-socialism',
-    'anti-soul',
-    'anti-south',
-    'anti-spending',
-    'anti-spirits',
-    'anti-standing',
-    'anti-stokes',
-    'anti-subirachs',
-    'anti-suchinda',
-    'anti-suffragist',
-    'anti-suggestive',
-    'anti-sunningdale',
-    'anti-swapo',
-    'anti-syphilitic',
-    'anti-tactical',
-    'anti-tissue',
     'anti-toff',
-    'anti-tories',
-    'anti-toxins',
-    'anti-trusteeship',
-    'anti-ulster',
-    'anti-urban',
-    'anti-vandal',
-    'anti-vat',
-    'anti-welsh',
-    'anti-wilko',
-    'anti-woodville',
-    'anti-xxxx',
-    'antiabortion',
-    'antiactin',
-    'antiaircraft',
-    'antialbuminuric',
     'antiasthma',
-    'antiauratic',
-    'antibiotics.',
-    'antibiotics/cortisone',
-    'antibody-envelope',
-    'antichrists',
-    'anticipated.',
-    'anticoagulated',
-    'anticyclones',
-    'antifibrin',
-    'antifoulings',
-    'antigen-presenting',
-    'antigenicity',
-    'antigravitational',
-    'antigreen',
-    'antiheparin',
     'antiheroic',
-    'antihypercalcaemic',
-    'antijas',
-    'antimetabolites',
-    'antimitochondrial',
-    'antimycobacterial',
-    'antineoplastic',
-    'antioestrogen',
-    'antioquiensis',
-    'antipapalism',
-    'antiparasitic',
-    'antipaxos',
-    'antiperoxidase',
-    'antipodal',
-    'antique-dealer',
-    'antiscience',
     'antiscorbutic',
-    'antisens',
-    'antitachycardia',
-    'antiterrorist',
-    'antithetic',
-    'antoine-joseph',
-    'antoky',
-    'antonova',
-    'antonymous',
-    'antorbital',
-    'antoun',
-    'antram',
-    'antwerp-based',
-    'antwerp.',
-    'anumber',
-    'anup',
     'anuran',
-    'anutkan',
-    'anwen',
-    'any-way',
-    'anybo',
-    'anybod',
-    'anyo',
-    'anyon/diver',
-    'anyones',
-    'anyons',
-    'anyplace',
-    'anything-',
-    'anywa',
-    'anywhe',
-    'anywhithers',
-    'anzola',
     'aoife',
-    'aok',
-    'aop.9',
-    'ap-navigator',
-    'ap0',
-    'ap1-88s',
-    'ap3',
-    'apache.',
-    'apanavicius',
-    'apara',
-    'aparato',
-    'apart_apart_from',
-    'apartments.',
-    'apastron',
-    'apath&eacute',
-    'apatites',
     'apcims',
-    'apck1',
-    'apck3src1',
-    'ape-keeper',
-    'apeh',
-    'apelike',
-    'aper&ccedil;u',
-    'aperients',
-    'aperiodically',
-    'aperistalsis',
-    'aperitivo',
-    'aperta',
-    'apesco',
-    'aphasias',
-    'aphelia',
-    'aphelion',
     'aphex',
-    'aphoristically',
-    'apicius',
-    'apilco',
-    'apion.',
-    'apistles',
-    'apitop-f',
-    'apivorus',
-    'apme',
-    'apo-c',
-    'apocalyptically',
-    'apocritan',
-    'apolda',
-    'apolgies',
-    'apolipoproteins',
-    'apollo-dionysus',
     'apollodorus',
-    'apologetically.',
-    'apologies.',
-    'apology.',
-    'apostatic',
-    'apostatised',
-    'apostrophizes',
-    'apotropaic',
-    'apowerful',
-    'apparao',
-    'apparat',
-    'apparats',
-    'apparatus.',
-    'appeal-court',
-    'appear_on',
-    'appearences',
     'appeasement-like',
-    'appeases',
-    'appelgren',
-    'appellee',
-    'appenzell-innerrhoden',
-    'appenzeller',
-    'appetit',
-    'appetite.',
-    'appetitively',
-    'appetizers',
-    'appio',
-    'appius',
-    'apple-blossom',
-    'apple-flavoured',
-    'apple-novell',
-    'apple-red',
     'apple-trees',
-    'apple/ibm/motorola',
-    'appleford/oxfordshire',
-    'applemacs',
-    'applet',
-    'appleton/oxfordshire',
-    'applicants.',
-    'application-linking',
-    'application-messaging',
-    'applicationlink',
-    'applications-related',
-    'applications-specific',
-    'applications.',
-    'appliction',
-    'apply.',
-    'appoggiaturas',
     'appointer',
-    'appointers',
-    'appoitnemnt',
-    'appollo',
-    'appolo',
-    'appositely',
-    'appositive',
-    'apppeal',
-    'appr',
-    'apprec',
-    'appreciators',
-    'apprehensible',
-    'approached.',
-    'appropraite',
-    'appropriately-trained',
-    'appropriationist',
     'appropriator',
-    'approve/reject',
-    'approved/rejected',
-    'apr&ndash;31',
-    'apra-dominated',
-    'apradakshina',
-    'apricocks',
-    'april&mdash;may',
-    'april&ndash;15',
-    'april&ndash;2',
-    'april&ndash;23',
-    'april&ndash;8',
-    'april-15',
-    'april-21',
-    'april-22',
-    'april-30',
     'april-6',
-    'april-october',
-    'april-september',
-    'april/june',
-    'aprkov',
-    'aps/psa',
-    'apsg',
-    'aptenodytes',
-    'apterygote',
-    'apthorpe',
-    'apx-4',
-    'apyrexial',
-    'aq7',
-    'aqj',
-    'aqua-tronic',
-    'aqua_vitae',
     'aquabatics',
-    'aqualand',
-    'aquaplane',
-    'aquapore',
-    'aquario',
-    'aquarium-raised',
-    'aquaticum',
-    'aquazorb',
-    'aqui-terme',
-    'aquidens',
-    'aquilaria',
-    'aquilina',
-    'aquisition',
-    'ar&eacute;ol&eacute',
-    'ar&eacute;thuse',
-    'ar-are',
     'ar/',
-    'ar1',
-    'ar614',
-    'arab&mdash;israeli',
-    'arab&ndash;jewish',
-    'arab-arab',
-    'arab-dominated',
-    'arab-israel',
-    'araba',
-    'arabic-language',
-    'arabiensis',
-    'arabsat',
-    'arachnoiditis',
-    'aragnetti',
-    'arahura',
-    'arai',
     'aramta',
-    'araneidae',
-    'arangements',
-    'aranibar',
-    'arar',
-    'aras',
-    'arasak',
-    'arati',
-    'araucanian',
-    'aravalley',
-    'arba',
-    'arbabidine',
-    'arbeiderparti',
-    'arbeiter',
-    'arbitrament',
-    'arbitrary-seeming',
     'arbitrationa',
-    'arbitrator(s)',
-    'arbonia',
-    'arborescens',
-    'arboreum',
-    'arboriculturalist',
-    'arboriculturist',
-    'arbre',
-    'arbs',
-    'arcade-type',
-    'arcadio',
-    'arcanest',
-    'arch&auml;ologisches',
-    'arch-chancellor',
-    'arch-demon',
-    'arch-duke',
     'arch-lined',
-    'arch-priest',
-    'arch-top',
-    'arch-traditionalist',
-    'arch-villains',
-    'arch.',
-    'archaeal',
-    'archaelogical',
-    'archaelogists',
-    'archaelogy',
-    'archaeoastronomy',
-    'archaeology.',
-    'archard',
-    'archbishoprics',
-    'archchancellor',
-    'archeologist',
     'architected',
-    'architecting',
-    'architecure',
-    'archive\'',
-    'archiver',
-    'archmage',
-    'archness',
-    'archtec',
-    'arcmin',
-    'arcnet',
-    'arctic-alpines',
-    'arctics',
-    'arctostaphylos',
-    'arcueil',
-    'ardalan',
-    'ardales',
     'ardallt',
-    'ardblair',
-    'ardea',
-    'ardeevan',
-    'ardenlee',
-    'ardens',
-    'ardito',
-    'ardmair',
-    'ardsheil',
-    'area.',
-    'areas&ndash',
-    'arecibo',
-    'arecord',
-    'arektenje',
-    'arels-felco',
-    'arenae',
     'arenal',
-    'arend',
-    'arendrup',
-    'arenite',
-    'arer',
-    'arestrup',
-    'aretology',
-    'arevalo',
-    'arfer',
-    'arg&uuml;ello',
-    'arg42',
-    'argentan',
-    'argentaria',
-    'argentino',
-    'argentinos',
-    'argentum',
     'argillite',
-    'argins',
-    'argov',
-    'argovians',
-    'arguaments',
-    'argue.',
-    'arguer',
-    'argusoft',
-    'arhens',
-    'arhus',
-    'ari&ntilde;o',
-    'ariachne',
-    'ariadnum',
-    'ariarch',
-    'aridness',
-    'ariele',
     'ariels',
-    'arillate',
-    'arise.',
-    'arises.',
-    'aristar',
-    'aristotles',
-    'arithmetic-logic',
-    'arithmetician',
-    'arived',
-    'arizonans',
-    'arkanas',
-    'arkendale',
-    'arkins',
-    'arklone',
-    'arku',
-    'arla',
     'arlberg',
-    'arlena',
-    'arlidgeqc',
-    'arlinda',
-    'arlit',
-    'arm&eacute;es',
-    'arm-flailing',
-    'arm-like',
-    'arm-pits',
-    'arm-worship',
-    'arm600',
-    'arm610',
-    'armagard',
-    'armagas',
-    'armaghan',
-    'armanino',
     'armary',
-    'armatures',
-    'armenian-inhabited',
-    'armifer',
-    'armijas',
-    'armishir',
-    'armitage-smith',
-    'armiya',
-    'armonia',
-    'armoniche',
-    'armorique',
-    'arms-manufacturing',
-    'arms-related',
-    'arms-sales',
-    'armsby',
-    'army-sponsored',
     'army-type',
-    'arnall',
-    'arnao',
-    'arnaud-raymond',
-    'arnold-forster',
-    'arnoul',
-    'arnsberg',
-    'arnun',
-    'aroi',
-    'aroids',
-    'arole',
-    'aroma.',
-    'aroon',
-    'arooseh',
-    'arou',
-    'aroun',
     'arowanas',
-    'arp&aacute;d',
-    'arpels',
-    'arpin',
-    'arpley',
-    'arquata',
-    'arraignments',
-    'arrangiarsi',
-    'arranz',
-    'arrata',
-    'array/6000',
-    'arrc',
-    'arrecife',
-    'arregui',
-    'arres',
-    'arrester',
     'arresters',
-    'arrests.',
-    'arrhenatherum',
-    'arrhizus',
-    'arrhythmogenesis',
-    'arriccio',
-    'arrindell',
-    'arrived-at',
-    'arrivers',
-    'arrivistes',
-    'arrondissements',
-    'arrowcraft',
-    'arsamenes',
-    'arsdel',
-    'arsenal-norwich',
-    'arsenic-poisoned',
     'arsenil',
-    'arsenious',
-    'arsenite',
-    'arsked',
-    'arslanagic',
-    'arslanagic/aged',
-    'arson-hit',
-    'arsy-versy',
-    'art\'',
-    'art-crap',
-    'art-historically',
-    'art-lovers',
-    'art-loving',
-    'art-pop',
-    'artajo',
-    'artakhaies',
     'artcurial',
-    'artefact-based',
-    'artefact-types',
-    'artefactually',
-    'arteli',
-    'artemio',
-    'artemis/anahita',
-    'artemus',
-    'arterially',
-    'arteriogram',
-    'artesia',
-    'arteveldt',
-    'arthington',
-    'arthouses',
-    'arthritics',
-    'arthrophytes',
     'arthropodan',
-    'arthropophy',
-    'artibeus',
-    'artichaut',
-    'article*',
-    'articulationist',
-    'artie',
-    'artifically',
-    'artificial-snow',
-    'artillerist',
-    'artist-ministry',
-    'artist/model',
-    'artisti',
-    'artistico',
-    'artists/photographers',
-    'artium',
     'artsebarsky',
-    'artwank',
-    'artz',
-    'arugula',
-    'arunasalam',
-    'arups',
-    'arvac',
-    'arvanitaki',
-    'arvid',
-    'arvika',
-    'arvin',
-    'arvn',
-    'arvo',
-    'arwenack',
-    'aryballoi',
-    'aryballos',
     'aryeh',
-    'arz',
-    'arzachena',
-    'arzew',
-    'as&amp;sub2',
-    'as&oacute;0p&oacute;s',
-    'as-and-when-needed',
-    'as-built',
-    'as-is',
-    'as-new',
-    'as-siyayli',
-    'as.6',
-    'as.6s',
-    'as.7',
-    'as/400-based',
-    'as1',
     'as136',
-    'as22',
-    'as_as_well',
-    'as_far_as_,_as_far_as',
-    'as_far_as_er_as_far_as',
-    'as_soon_as_,_as_soon_as',
-    'asaf',
-    'asanbayev',
-    'asaphid',
-    'asbestos-bearing',
-    'asbestos-containing',
-    'asbestos-free',
-    'asc11',
-    'ascalon',
-    'asch2&ndash;3',
-    'ascii/ansi',
     'asclipiodus',
-    'ascona',
-    'asdex',
-    'asdir',
-    'aseasyas',
-    'asef',
-    'aseismic',
-    'asevedo',
-    'asfaw',
-    'asgr&iacute;msson',
-    'ash-gold',
-    'ash-stained',
-    'ash-trays',
-    'ash-tree',
-    'asharq',
-    'ashayer',
     'ashbless',
-    'ashbone',
-    'ashby/organic',
-    'ashdown/liberal',
-    'asheham',
-    'ashelman',
-    'asherson',
-    'asheville',
-    'ashfold',
-    'ashford/transplant',
-    'ashfords',
-    'ashish',
-    'ashiya',
-    'ashkirk',
-    'ashmall',
-    'ashmunein',
     'ashpole/ian',
-    'ashtadhyayi',
-    'ashtar-chemosh',
-    'ashton-under-lyme',
-    'ashtons',
-    'ashwellthorpe',
-    'asi-ayone',
-    'asiana',
-    'asitz',
-    'asjp',
-    'ask/ingres',
-    'ask13',
-    'askern',
-    'askin',
-    'aslanian',
-    'aslevels',
     'asm324t',
-    'asmantas',
-    'asminas',
-    'asn102(co)',
-    'asnier',
-    'asnieres-sur-seine',
-    'asociation',
-    'asolectin',
-    'asomatos',
-    'asp72',
-    'aspal',
-    'aspatial',
-    'aspens',
-    'asperum',
-    'aspetic',
-    'asphyxiates',
     'aspidin',
-    'aspidistras',
-    'aspirin-like',
-    'aspirinated',
-    'aspleniifolia',
-    'asplin',
-    'asrama',
-    'assadollah',
-    'assamaka',
-    'assane',
-    'assante',
-    'assassinorum',
-    'assayers',
-    'assayist',
-    'assembl&eacute;es',
-    'assembler-language',
     'assembler.',
-    'assembler/linker',
-    'assent/dissent',
-    'assentors',
-    'assereto',
-    'asserters',
-    'assessment/',
-    'assessment/evaluation',
-    'assessment/examination',
-    'asset(s)',
-    'asset-price',
-    'asset-stripped',
-    'assets.',
-    'assign-output-file',
-    'assimilation-accommodation',
-    'assimilator',
     'assimilatory',
-    'assinger',
-    'assis',
-    'assisitant',
-    'assistant-keeper',
-    'assistant-manager',
-    'assistante',
-    'assmannshausen',
-    'assocation',
-    'associable',
-    'associatedwith',
-    'associaton',
-    'associazione',
-    'assocication',
-    'asst.',
-    'assualted',
     'assult',
-    'assumably',
-    'assuncao',
-    'assunta',
-    'assurance/quality',
-    'asteroid-like',
-    'asthenospere',
-    'astolat',
-    'aston-martin',
-    'aston-on-carrant',
-    'aston/action',
-    'aston/oxfordshire',
-    'astrada',
-    'astraea',
-    'astricles',
-    'astrilly',
     'astro-archaeology',
-    'astro-b',
-    'astro-c',
-    'astrochemical',
-    'astrocytic',
-    'astrogaze',
-    'astrologically',
-    'astronautics',
-    'astronomia',
-    'astronomica',
-    'astrostereon',
-    'astrozoologists',
-    'astrud',
-    'aswan&ndash;kom',
-    'aswarm',
-    'asylmuratova',
     'asylum-seeker',
-    'at-6',
-    'at-a-glance',
-    'at-alikes',
-    'at-oneness',
-    'at-slow',
-    'at-specific',
-    'at11',
-    'at4',
-    'at_,_at_least',
-    'at_each',
-    'atabey',
-    'atalantas',
-    'ataollah',
-    'atapeuerca',
-    'ataqatigiit',
     'ataraxia',
-    'atassut',
-    'atavenom',
-    'ataxic',
-    'atbara',
-    'atcgtnnnnnysg',
-    'ated',
-    'ateke',
-    'atelectasis',
-    'aterk',
-    'atf1/creb',
-    'atf3-6',
-    'athad',
-    'atharva',
-    'athelney',
-    'athelstone',
     'athenae',
-    'athenaion',
-    'atheneum',
-    'athenion',
-    'athenon',
-    'atheroma-prone',
-    'atherston',
-    'athetosis',
-    'athnamulloch',
-    'athwartships',
-    'atic',
-    'atisha',
-    'atkin/archaeologist',
-    'atkinian',
-    'atkinson/mother',
-    'atkinsons',
     'atkison',
-    'atkyns',
-    'atlaal',
-    'atlante',
-    'atlantic-facing',
-    'atlantica',
-    'atlantick',
-    'atoll-dweller',
-    'atomically',
-    'atomization',
-    'atomon',
-    'atomosphere',
-    'atomsmasher',
-    'atonalism',
-    'atonio',
-    'atony',
     'atory',
-    'atps',
-    'atr/de',
-    'atrioventricular',
-    'atropurpureum',
-    'att&eacute;ghei',
-    'attach&eacute;d',
-    'attach&eacute;e',
-    'attacked.',
-    'attampts',
-    'attardi',
-    'attenborough/director',
-    'attenbrough',
-    'attend/host',
-    'attended.',
-    'attended/seen',
     'attention-grabber',
-    'attentuation',
-    'atteridgeville',
-    'attewell-hughes',
-    'atthis',
-    'attine',
-    'attingham',
-    'attitude-brandishing',
-    'attitudes.',
-    'attlebridge',
-    'attoh',
-    'attorneys-general',
-    'attorns',
-    'attow',
-    'attractability',
-    'attractively-priced',
     'attraxion',
-    'attributional',
-    'atul',
-    'atx',
-    'atz',
-    'aubrieta',
-    'auchenblae',
-    'auchencloss',
-    'auchenree',
-    'auchenshuggle',
-    'auchorachan',
-    'auchterhouse',
-    'auction-house',
-    'auctoritate',
-    'auctoritee',
-    'aud',
     'audenshaws',
-    'audiencia',
-    'audio-disc',
-    'audio-frequency',
-    'audio-in',
-    'audio-out',
-    'audio-recorded',
-    'audio-recordings',
-    'audiobooks',
-    'audiogenic',
-    'audios',
-    'audiotapes',
-    'audiotool',
-    'auditel',
-    'auditex',
-    'auditorially',
     'auditoriums',
-    'auditorship',
-    'auditory-vestibular',
-    'audland',
-    'audofleda',
-    'audrie',
-    'audries',
-    'audy',
-    'aufhebung',
-    'aufkl&auml;rung',
-    'aug&ndash;25',
-    'aug/oct',
-    'augelli',
-    'augenthaler',
-    'aughfad',
-    'augued',
     'augument',
-    'auguments',
-    'august&ndash;12',
-    'august-6',
-    'august-9',
-    'august-december',
-    'august/club',
-    'augustae',
-    'augustifolia',
-    'auhm&uuml;hle',
-    'aukland',
-    'aulonacara',
-    'aumont',
-    'auntly',
-    'aupling',
-    'aupr&egrave;s',
     'auray',
-    'auriculatum',
-    'aurita',
-    'auro',
-    'aurodye',
-    'aurulius',
-    'auschwitz-birkenau-monowitz',
-    'ausdifferenzierung',
-    'ausgabe',
-    'ausgleich',
-    'auspace',
-    'auspicium',
-    'ausseil',
-    'aussiedler',
-    'austen/west',
-    'austick',
     'australia-new',
-    'australian-owned',
-    'australian-style',
-    'austrfararv&iacute;sur',
-    'austro-turkish',
-    'ausub&copy',
-    'autel',
-    'auteurism',
-    'authentic.',
-    'authenticator',
-    'authenticism',
-    'authenticity.',
-    'authigenesis',
-    'author-friendly',
-    'author/narrator',
-    'authoratative',
     'authorities/education',
-    'authority-led',
-    'authority-owned',
-    'authors(s)',
-    'authors.',
-    'authors/editors/teacher/trainers',
-    'authors/writers',
-    'autif',
-    'auto-antibodies',
-    'auto-biography',
-    'auto-crime',
-    'auto-dialler',
-    'auto-eroticism',
-    'auto-iris',
-    'auto-pattern',
-    'auto-regulatory',
     'auto-repeat',
-    'auto-start',
-    'autoantigens',
-    'autobank',
-    'autoburette',
-    'autocare',
-    'autodoc',
-    'autodrive',
-    'autogenous',
-    'autogolpe',
-    'autographing',
-    'autogyros',
-    'autohaus',
-    'autoloader',
-    'automakers',
-    'automatisation',
     'automeas',
-    'automized',
-    'automobilia',
-    'auton',
-    'autonomy\'',
-    'autonomy-centred',
-    'autopaster',
-    'autoradiograms.',
-    'autoradiographies',
-    'autoreactive',
-    'autoreceptors',
-    'autorotations',
-    'autoshaped',
-    'autosketch',
-    'autostradas',
-    'autosuggestion',
     'autotelic',
-    'autotransformer',
-    'autowinder',
-    'auxotroph',
-    'auyu',
-    'av4605',
-    'av6280',
-    'avail-able',
-    'availa',
-    'availability.',
-    'availabilty',
-    'available/unavailable',
-    'avaliani',
-    'avancement',
-    'avant-',
-    'avant-rock',
     'avariciously',
-    'avavnuk',
-    'avco',
-    'avdic/adis',
-    'aveiro',
-    'avellino',
-    'avena',
-    'avenarius',
-    'avenham',
-    'averageness',
-    'avercamp',
-    'averring',
-    'averyanov',
-    'aveugle',
-    'aveyard',
-    'avgarea',
     'avgikos',
-    'aviatical',
-    'aviculturalists',
-    'avidin-biotin-peroxidase',
-    'avidy&amacr',
-    'avignonese',
-    'avildsen',
-    'aviles',
-    'avineri',
-    'avital',
-    'aviv&ndash;jaffa',
-    'aviv1-1',
-    'avocations',
-    'avocats',
-    'avokea',
-    'avoniel',
     'avosetta',
-    'avrel',
-    'avriel',
-    'avs/88',
-    'avtandil',
-    'avuncularity',
-    'avx',
-    'awamutu',
-    'award-nominated',
-    'award-winners',
-    'awdrey',
-    'awe-stricken',
-    'awelon',
-    'awes',
-    'awkwardly-shaped',
-    'awm2',
     'awok',
-    'awori',
-    'awwad',
-    'ax3',
-    'axe-blow',
-    'axe-edge',
-    'axenberg',
-    'axiality',
-    'axiologia',
-    'axiologus',
-    'axonometric',
-    'axp-based',
-    'axp/open',
-    'axtell',
-    'axton',
-    'axxiom',
     'ayahuasca',
-    'ayarga',
-    'aycliffe-based',
-    'ayissah',
-    'aylaus',
-    'ayler',
-    'aylesbury-based',
-    'aymar&aacute',
-    'aynsley',
-    'ayoub',
-    'ayudhya',
-    'ayuurdzanyn',
-    'ayvalik',
-    'ayyub',
-    'az-zibari',
-    'az-zibri',
     'az.g.m.',
-    'azaquinolonecarboxylic',
-    'azeem',
-    'azerbaijan-iran',
-    'azerbijhan',
-    'azeri-populated',
-    'azidothymidine',
-    'azil',
-    'azimi',
-    'azimuthally',
-    'azmai',
-    'azo-bond',
-    'azolla',
-    'azoospermia',
-    'azopardo',
-    'azorian',
     'azorubine',
-    'azoturia',
-    'azovtseva',
-    'azrin',
-    'azuma',
-    'azure-chevroned',
-    'azure-lidded',
-    'azzam',
-    'azzara',
-    'azzilfi',
-    'b&acirc;ton',
-    'b&amacr;nba',
-    'b&amp;o',
-    'b&amp;wr',
-    'b&auml;renreiter',
-    'b&auml;sle',
     'b&dollar;1,000',
-    'b&dollar;243',
-    'b&eacute;char',
-    'b&eacute;horl&eacute;guy',
-    'b&eacute;n&eacute;dict',
-    'b&eacute;nou',
-    'b&eacute;r&eacute;govoy\'s',
-    'b&eacute;thune',
-    'b&eacute;u',
-    'b&eacute;ville',
-    'b&ecirc;che',
-    'b&ecirc;te-noire',
-    'b&gt',
-    'b&gt;a',
-    'b&lt;a',
-    'b&ndash;17d',
     'b&ndash;17gs',
-    'b&ndash;3000',
-    'b&ouml;hmer',
-    'b&ouml;sendorfer',
-    'b&ouml;tticher',
-    'b&uuml;cher',
-    'b&uuml;chner',
-    'b&uuml;lach',
-    'b&uuml;rgerpartei',
-    'b&uuml;tow',
-    'b\'clare',
-    'b\'tselem',
-    'b*',
-    'b-&amp;-b',
-    'b-12',
-    'b-1b',
     'b-23',
-    'b-cll2',
-    'b-complex',
-    'b-file',
-    'b-g',
-    'b-grade',
-    'b-minus',
-    'b-pictures',
-    'b-tech',
-    'b-tested',
-    'b-x',
-    'b.1874',
-    'b.1904',
-    'b.1905',
-    'b.35',
-    'b.585',
     'b.591',
-    'b.7',
-    'b.8',
-    'b.8007',
-    'b.ch.',
-    'b.e',
-    'b.e.m.',
-    'b.e.t',
-    'b.f.g.',
-    'b.h.p.',
-    'b.i.e.',
-    'b.isa',
-    'b.mus.',
-    'b.phil',
-    'b.pure',
-    'b.r.b.',
     'b.s.b.i.',
-    'b.t.a.',
-    'b.the',
-    'b.v',
-    'b.w.i.r.',
-    'b/00/22/0007',
-    'b/00/22/0011',
-    'b/00/23/0002',
-    'b/00/23/0009',
-    'b/00/23/0015',
-    'b/00/23/0024',
-    'b/00/23/0025',
-    'b/00/23/0027',
-    'b/00/23/0041',
-    'b/00/23/0050',
-    'b/00/23/0071',
     'b/00/23/0075',
-    'b/00/23/0076',
-    'b/00/23/2005',
-    'b/00/23/2015',
-    'b/00/23/2020',
-    'b/00/23/2036',
-    'b/00/23/2037',
-    'b/00/23/2049',
-    'b/00/23/2056',
-    'b/00/23/2057',
-    'b/00/23/2060',
-    'b/00/23/2072',
-    'b/00/23/2074',
-    'b/00/23/2083',
-    'b/00/23/2084',
-    'b/00/23/2094',
     'b/00/23/2098',
-    'b/00/23/2099',
-    'b/00/23/2104',
-    'b/00/23/2110',
-    'b/00/23/2115',
-    'b/00/23/2123',
-    'b/00/23/2126',
-    'b/00/23/2127',
-    'b/00/23/2129',
-    'b/00/23/2130',
-    'b/00/23/2133',
-    'b/00/23/2138',
-    'b/00/23/2144',
-    'b/00/23/2147',
-    'b/00/24/2007',
-    'b/00/24/2008',
     'b/00/24/2012',
-    'b/00/24/2013',
-    'b/00/24/2016',
-    'b/00/25/0001',
-    'b/00/25/0010',
-    'b/00/26/0045',
-    'b/01/25/0009',
-    'b/01/25/0010',
-    'b/02/25/0003',
-    'b/02/25/0004',
-    'b/04/23/0011',
-    'b/a-l',
-    'b/c',
-    'b/i',
-    'b/r',
-    'b1-r',
     'b1-rated',
-    'b1.8scfv',
-    'b1/b2',
-    'b1228',
-    'b1248',
-    'b1269',
-    'b1278',
-    'b14&ndash;16',
-    'b1855+09',
-    'b2-level',
-    'b225',
-    'b24',
-    'b3+',
-    'b31',
-    'b4+',
-    'b4027',
     'b4248',
-    'b4423',
-    'b4525',
-    'b5+',
-    'b510',
-    'b6160',
-    'b6270',
-    'b6415',
-    'b642',
-    'b6438',
-    'b709',
-    'b722',
-    'b747f',
-    'b754',
-    'b81',
-    'b83',
     'b869',
-    'b91',
-    'b94',
-    'b9th',
-    'b:grammatical',
-    'b=c',
-    'ba&ntilde;ados',
-    'ba-1',
-    'ba-koe-pa',
-    'ba-usair',
-    'ba/bsc',
-    'ba/usair',
-    'ba44',
-    'ba724',
-    'ba91',
-    'ba93',
     'baa-1',
-    'baaa',
-    'baak',
-    'baalbeck',
-    'baaleboss',
-    'baanga',
-    'babandiga',
-    'babani',
-    'babassana',
-    'babbar',
-    'babbles',
-    'babel-like',
-    'babiak',
-    'babin',
-    'babraham',
-    'babtie',
     'babuscio',
-    'babushkas',
-    'babworth',
-    'baby-buggy',
-    'baby-clothes',
-    'baby-cry',
-    'baby-doll',
-    'baby-dress',
-    'baby-feed',
-    'baby-gro',
-    'baby-madda',
-    'baby-pink',
-    'baby-sits',
-    'baby-sized',
-    'baby-waby',
-    'baby-walkers',
     'baby/',
-    'babyfoods',
-    'babylonish',
-    'babys',
-    'babysafe',
-    'bacame',
-    'bacata',
-    'baccala',
-    'baccata',
-    'bacchanalians',
-    'bachian',
-    'bachs',
-    'bacitracin',
-    'back\'uds',
-    'back-bends',
-    'back-boned',
     'back-filling',
-    'back-fired',
-    'back-fitting',
-    'back-flushing',
-    'back-gardens',
-    'back-gate',
-    'back-ground',
-    'back-home',
-    'back-markers',
-    'back-packers',
-    'back-packs',
-    'back-pocket',
-    'back-projected',
-    'back-projections',
-    'back-propagation',
-    'back-rowers',
     'back-slab',
-    'back-stairs',
-    'back-swing',
-    'back-to-roots',
-    'back/',
-    'back:hundreds',
-    'backakeldy',
-    'backbeats',
-    'backboard',
-    'backdraught',
-    'backe',
-    'backgardens',
-    'background\'',
-    'backgrounds.',
-    'backhanding',
-    'backheel',
     'backing-up',
-    'backlund',
-    'backmost',
-    'backpasses',
-    'backplanes',
-    'backrooms',
-    'backrow',
-    'backs.',
-    'backscratcher',
-    'backslider',
-    'backstop',
-    'backthwing',
-    'backward&rehy;looking',
-    'backwardly',
-    'baco',
-    'bacon-flavoured',
     'bacon-slicer',
-    'baconers',
-    'bacpak6',
-    'bacquier',
-    'bacteria-like',
-    'bacteria/ml',
-    'bactericides',
-    'bacteriocin',
-    'bacteriologically',
-    'bacteriorhodopsin',
-    'bad-minded',
-    'badak',
-    'badalamenti',
-    'badar',
-    'baddeleyite',
-    'badder',
     'baddiley',
-    'badegisel',
-    'badejo',
-    'badelona',
-    'baden-w&uuml;rtemberg',
-    'badger-watcher',
-    'badgeworth',
-    'badies',
-    'badington',
-    'badly-behaved',
-    'badly-decomposed',
-    'badly-lit',
-    'badly-made',
-    'badly-tuned',
-    'badmen',
-    'badrakhani',
     'badruddoja',
-    'badsetup',
-    'badzarhuu',
-    'baelz',
-    'baensch',
-    'baerends',
-    'baeri',
-    'baeyer',
-    'bafa',
-    'baffle-curtain',
-    'bafoussam',
-    'bag-carrier',
-    'bag-snatchers',
-    'bag-snatches',
-    'bagan',
-    'bagargui',
     'bagasse',
-    'bagdade',
-    'bagdelleh',
-    'bagfuls',
-    'baggage/personal',
-    'baggie',
-    'bagginess',
-    'baggitis',
-    'baggydom',
-    'baghli',
-    'bagillt',
-    'bagn&egrave;res-de-bigorre',
-    'bagnell',
-    'bagnigge',
-    'bagoas',
-    'bagpuss',
     'bags.',
-    'bagshawe',
-    'bagsvaerd',
-    'bah&iacute;a',
-    'baha\'is',
-    'bahawalpur',
-    'bahejana',
-    'bahman',
-    'bahmueller',
-    'bahn',
-    'bahrainis',
-    'bahru',
-    'baik',
-    'baikanur',
-    'baikas',
-    'bailey/huntsman',
     'bailey/national',
-    'baillifs',
-    'bain-marie',
-    'bairiki',
-    'bairth',
-    'baith',
-    'baitless',
-    'baiyun',
-    'baize-lined',
-    'bajos',
-    'bajrani',
-    'bajulus',
-    'bakal',
-    'bake-ovens',
-    'baker-saddam',
-    'baker/men',
     'bakery.',
-    'bakha',
-    'bakhramov',
-    'bakhtaran',
-    'baki',
-    'bakkar',
-    'bakkes',
-    'bakoyannis',
-    'bakschev',
-    'bakuhan',
-    'bakur-weiner',
-    'bal31',
-    'bala&iuml;tous',
-    'balam',
-    'balancing-act',
-    'balancings',
     'balancy',
-    'balanoposthitis',
-    'balante',
-    'balaskas',
-    'balbianello',
-    'balbir',
-    'balclutha',
-    'baldachin',
-    'baldaquin',
-    'baldassare',
-    'balde',
-    'baldeh',
-    'balderrama',
-    'baldev',
-    'baldhu',
-    'baldon',
     'baldrey',
-    'baldrickian',
-    'baldridge',
-    'baldung',
-    'baldwinson',
-    'balemartin',
-    'balephuil',
-    'balera',
-    'balfron',
-    'ball-and-stick',
-    'ball-busting',
-    'ball-gowned',
-    'ball-nut',
-    'ball-topped',
-    'ballad-like',
-    'balladeering',
     'ballagh',
-    'ballaghaderreen',
-    'ballance',
-    'ballard/slater',
-    'ballaters',
-    'ballbearings',
-    'ballboy',
-    'ballbreaker',
-    'ballbusters',
-    'balled-up',
-    'ballet-master',
-    'ballet.',
-    'balletto',
-    'ballheaded',
-    'ballighiline',
-    'ballimaran',
     'ballinabeck',
-    'ballintaggart',
-    'balliols',
-    'ballmore',
-    'balloon-like',
-    'balloon-wheeled',
-    'ballot-stuffing',
-    'ballulve',
-    'ballwinner',
-    'ballychatrigan',
-    'ballyeaston',
-    'ballyfermot',
-    'ballygalget',
-    'ballygalley',
-    'ballygrainey',
-    'ballyjamesduff',
     'ballykeel',
-    'ballymun',
-    'ballynaughton',
-    'ballyoran',
-    'ballypatrick',
-    'ballyutoag',
-    'ballywalter',
-    'balmat',
-    'balnagowan',
-    'balnakeil',
-    'balopi',
-    'balram',
-    'balsai',
-    'baltacha',
-    'baltard',
-    'baltravers',
     'baltsa',
-    'baltusnikas',
-    'baluchis',
-    'balulise',
-    'balvaird',
-    'balzanii',
-    'bambaia',
-    'bambang',
-    'bambesi',
-    'bamff',
-    'bamhi/clai',
-    'banaban',
-    'banally',
-    'banana-brain',
-    'banana-flavoured',
-    'banana-skins',
     'banaras',
-    'banas',
-    'banastre',
-    'banba',
-    'banbury-based',
-    'banbury-oxford',
-    'banbury/',
-    'banburyshire',
-    'bancaire',
-    'bancaria',
-    'banchop',
-    'bancomer',
-    'bancrofti',
-    'band-saws',
-    'band/group',
-    'bandage-type',
     'bandala',
-    'bandara',
-    'bandboxes',
-    'bandboys',
-    'bandersnatch',
-    'bandiere',
-    'bandini',
-    'banditti',
-    'bandleaders',
-    'bandora',
-    'bands.',
-    'bandwith',
-    'banegas',
-    'banfi',
-    'banford',
-    'bang-bang-bang',
     'bangability',
-    'bangay',
-    'banged-up',
-    'bangguo',
-    'bangkwang',
-    'bangwa',
-    'banjaluka',
-    'banjo-style',
-    'bank-commissioned',
-    'bank-funded',
-    'bank-industry',
-    'bank-lending',
-    'bank-mikklesen',
-    'bank-sticks',
-    'bank-supported',
-    'bank-wide',
     'bank/',
-    'bank/imf',
-    'bankcentre',
-    'banken',
-    'bankfields',
-    'banking/insurance/finance',
-    'bankment',
-    'banks/organisations',
-    'banks/prisoner',
-    'banksey',
-    'bankshares',
-    'bankwide',
-    'bannaventa',
-    'bannell',
-    'banner-bearers',
-    'banner-pole',
     'bannocks',
-    'banqueters',
-    'banshee-like',
-    'banska',
-    'banteringly',
-    'banters',
-    'bantin',
-    'bantung',
-    'banwell',
-    'banwen',
-    'banwy',
-    'banyard',
-    'banyi',
-    'banyoles',
-    'baobhan',
-    'baphomet',
     'bapp',
-    'baptisteries',
-    'bar&eacute;s',
-    'bar-annexe',
-    'bar-b-que',
-    'bar-coded',
-    'bar-hatch',
-    'bar-kokhba',
-    'bar-lock',
-    'bar/breakfast',
-    'barabajagal',
-    'baracco',
-    'baraclough',
-    'barad-d&ucirc;r',
-    'barajas',
-    'barak-1',
     'barani',
-    'barari',
-    'barbares',
-    'barbells',
-    'barber/supporters',
-    'barberi',
-    'barbero',
-    'barbey',
-    'barbiano',
-    'barbox',
-    'barbulescu',
-    'barbury',
-    'barbus',
-    'barby',
-    'barceloneta',
-    'barcelos',
     'barcharts',
-    'barclayslloydsmidland&verbar;onatwestrbs',
-    'barcodes',
-    'bardach',
-    'bardia',
-    'bardoli',
-    'bardufoss',
-    'bardwell-jones',
-    'bare-armed',
-    'bare-foot',
-    'bare-root',
-    'barely-audible',
-    'barely-concealed',
-    'barely-suppressed',
-    'barely-there',
-    'barentsburg',
     'barfing',
-    'barfrost',
-    'bargain-buy',
-    'bargas',
-    'barge-boards',
-    'barge-owners',
-    'bargeddie',
-    'bargeowners',
-    'barget',
-    'barghash',
-    'barghoorn',
-    'bargin',
-    'barhams',
-    'barhill',
-    'bariba',
-    'barilla',
     'baring-gould',
-    'barje',
-    'barkad',
-    'barkaloff',
-    'barkan/ayverdi',
-    'barkat',
-    'barker/oxford',
-    'barkov',
-    'barland',
-    'barlas',
-    'barlborough',
-    'barle',
-    'barley-sugar',
-    'barmaiding',
-    'barmier',
-    'barmpton',
     'barn-owls',
-    'barnabite',
-    'barnabites',
-    'barnardisation',
-    'barnards',
-    'barnatt',
-    'barnaul',
-    'barnes/blackpool',
-    'barnes/bullingdon',
-    'barnes/cheltenham',
-    'barnes/cowley',
-    'barnes/dinton',
-    'barnes/gloucester',
-    'barnes/live',
-    'barnes/radley',
-    'barnes/survivor',
     'barnes/victim',
-    'barnets',
-    'barnetson',
-    'barnett/brockworth',
-    'barnett/herefordshire',
-    'barnett/leominster',
-    'barnett/malvern',
-    'barnett/stoke',
-    'barnett/teddington',
-    'barnetts',
-    'barnfield',
-    'barnicles',
-    'barnie',
-    'barnsbury',
-    'barnville',
-    'barnys',
     'barograph',
-    'barolo',
-    'baronworth',
-    'baroque-domed',
-    'barostat',
-    'barot',
-    'barotrauma',
-    'barouche',
-    'barpleat',
-    'barr&egrave;re',
-    'barraband',
-    'barrabas',
-    'barracaded',
-    'barrackers',
-    'barratts',
-    'barreau',
     'barreiro',
-    'barrel-bellied',
-    'barrel-load',
-    'barrel-organs',
-    'barrels-per-day',
-    'barrens',
-    'barrenstein',
-    'barrere',
-    'barretta',
-    'barrettstown',
-    'barrey',
-    'barri&egrave;re',
-    'barrie-esque',
-    'barriera',
-    'barrington-ward',
-    'barrionuevo',
     'barrois',
-    'barrons',
-    'barroom',
-    'barrow-boy',
-    'barrow-boys',
-    'barrow-downs',
-    'barrowful',
-    'barrys',
-    'barsoom',
-    'bartas',
-    'bartejeia',
-    'bartelo',
-    'bartestree/herefordshire',
-    'bartha',
-    'barthelemy-madaule',
-    'barthez',
     'barthram',
-    'bartolom&ecaron;jsk&aacute',
-    'barton/reporting',
-    'bartram-hyndes',
-    'barus',
-    'barycentre',
-    'barzen',
-    'bas2000',
-    'basalis',
-    'basanite',
-    'basanjorj',
-    'basari',
-    'baschurch',
-    'base-isolated',
-    'base-maps',
-    'base-metal',
     'base-modification',
-    'base-pairing',
-    'base-rich',
-    'base-weighted',
-    'base/mulhouse',
-    'base24',
-    'baseball-type',
-    'baseborn',
-    'basel-based',
-    'basel-chiasso',
-    'baseliners',
-    'baseplates',
-    'basework',
-    'basey',
-    'basfords',
-    'bash&oacute;0',
     'bashnya',
-    'basho',
-    'basic-ultrabasic',
-    'basicplus',
-    'basilar',
-    'basilicum',
-    'basilius',
-    'basin-forming',
-    'basingfield',
-    'basingwerk',
-    'basis/rightness',
-    'basket-making',
-    'basketballs',
-    'basko',
-    'basmachi',
-    'basohli',
     'basolaterally',
-    'bass-baritone',
-    'bass-guitarist',
-    'bass-o-matic',
-    'bassai',
-    'bassee',
-    'basses-alpes',
-    'basset-horn',
-    'bassett-lowke',
-    'bassic',
-    'bassompierre',
-    'bassoonists',
-    'bassoukou-boumba',
-    'bastad',
-    'bastan',
-    'bastardisation',
     'bastardising',
-    'bastards.',
-    'basti',
-    'bastida',
-    'bastienne',
-    'bastnasite',
-    'bastow',
-    'bat-making',
-    'bat-shaped',
-    'bat-wing',
-    'batchelder',
-    'bately',
-    'batemen',
-    'bates/',
-    'bath-gel',
-    'bath-night',
     'bath-rooms',
-    'bath-salts',
-    'bath-suite',
-    'bath27',
-    'bathampton',
-    'bathan',
-    'bathing-suit',
-    'bathishig',
-    'bathroom.',
-    'bathroom/w.c.',
-    'bathrooms/showers',
-    'bathsalts',
-    'bathtowel',
-    'bathtowels',
-    'bathuyag',
-    'bathypectinura',
     'batmen',
-    'batn',
-    'batol',
-    'baton-wielding',
-    'batov',
-    'batrouk',
-    'batroukh',
-    'batselier',
-    'batsuur',
-    'battaglia',
-    'battell',
-    'batterers',
-    'battery-backed',
-    'battiad',
-    'battier',
-    'battle-cries',
     'battle-grounds',
-    'battle-plans',
-    'battle-scars',
-    'battle-worthy',
-    'battledores',
-    'battleline',
-    'battlestar',
-    'battock',
-    'batum',
-    'batzli',
-    'batzushka',
-    'baudain',
-    'baudys',
-    'bauhaus-inspired',
-    'bauhin',
-    'bauhuis',
     'bauknecht',
-    'baukunst',
-    'baumet',
-    'baux',
-    'bavadra',
-    'bavant',
-    'bavcar',
-    'bavo',
-    'bavon',
-    'bawdy-house',
-    'baxendall',
-    'bay-anglesey',
-    'bay-windows',
-    'bayad&egrave;re',
-    'bayhead',
-    'baykal',
     'baylen',
-    'bayon',
-    'bayonet-marks',
-    'bayrisches',
-    'baytree',
-    'bayu',
-    'bazdarevic',
-    'baziotes',
-    'bazlen',
-    'bazyliszek',
-    'bazza',
-    'bb7',
-    'bb7.2',
-    'bb94',
-    'bbb',
-    'bbc-itv',
     'bbc/itv',
-    'bbgsg',
-    'bbm',
-    'bbps',
-    'bc&ndash;ad',
-    'bc100',
-    'bc108',
-    'bc2',
-    'bc200',
-    'bcap',
-    'bcl-2&agr',
-    'bcl-2/100',
-    'bcl-2/puro',
-    'bcpr',
-    'bd23',
-    'bd7',
     'bd9',
-    'bdb',
-    'bdis',
-    'bds',
-    'be-attitudes',
-    'be-in',
-    'be-medalled',
-    'be-ringed',
-    'be2',
-    'be_all',
-    'be_at',
-    'be_on',
-    'beab',
-    'beach-bum',
-    'beach-cleaning',
-    'beach-heads',
     'beachheads',
-    'beachley',
-    'beachtent',
-    'bead-black',
-    'beadgc',
-    'beadness',
-    'beager',
-    'beagling',
-    'beak-full',
-    'beaking',
-    'beaklength',
-    'beam-ends',
-    'beam-on',
-    'beamier',
-    'beamten',
-    'beamwidth',
     'bean-eating',
-    'bean-nighe',
-    'bean-pole',
-    'beaneasy',
-    'beanflower',
-    'beans.',
-    'beantest',
-    'bear-pit',
-    'bearings.',
-    'bearishness',
-    'bearskins',
-    'beas',
-    'beasley-murray',
-    'beast-face',
-    'beastings',
-    'beat-\'em',
     'beat-off',
-    'beatifications',
-    'beatle-cut',
-    'beatmasters',
-    'beatt',
-    'beauc&eacute',
-    'beaufoy',
-    'beaujon',
-    'beaujoyeulx',
-    'beauregard',
-    'beaute',
-    'beautifully-cut',
-    'beautifully-designed',
-    'beautifully-lit',
-    'beautifully-measured',
-    'beautifully-shaped',
     'beaver-tails',
-    'beaverskins',
-    'bebic',
-    'becau\'',
-    'becaus',
-    'because_er_of',
-    'because_erm_of',
-    'becerra',
-    'bechafen',
-    'becherovka',
-    'beckett-like',
-    'beckie',
-    'beckwithshaw',
-    'becomin\'',
-    'becon',
-    'bed-baths',
     'bed-covers',
-    'bed-curtains',
-    'bed-mates',
-    'bed-occupancy',
-    'bed-parallel',
-    'bed-post',
-    'bed-posts',
-    'bed-rolls',
-    'bed-room',
-    'bed-socks',
-    'bed-springs',
-    'bedall',
-    'bedaux',
-    'bedazzlement',
-    'bedcover.',
-    'beddelem',
     'beddowes',
-    'beddy-byes',
-    'bedel',
-    'bedfordbury',
-    'bedfords',
-    'bedgown',
-    'bedle',
-    'bedlingtonshire',
-    'bedous',
-    'bedrails',
-    'bedrest',
-    'bedrettin',
-    'bedrich',
-    'bedroom.',
-    'bedsitterland',
-    'bedsore',
     'bedsores',
-    'bedworthy',
-    'bee-orchids',
-    'bee-pollinated',
-    'bee-stings',
-    'beebe',
-    'beechamwell',
-    'beecraigs',
-    'beef/suckler',
-    'beefiness',
-    'beeko',
-    'beelitz',
-    'beemer',
-    'been_in',
-    'been_over',
-    'beer-can',
     'beer-loving',
-    'beer-mugs',
-    'beer-producing',
-    'beer-sodden',
-    'beer-tasting',
-    'beergoonath',
-    'beerhalls',
-    'beersheva',
-    'beesix',
-    'beffroy',
-    'befrementd.',
-    'beggarwoman',
-    'beguilement',
-    'behalf_of',
-    'behalfs',
-    'beharrell',
     'behavioural/cognitive',
-    'behbehanians',
-    'behet',
-    'behind-closed-doors',
-    'behind-the',
-    'behm',
-    'behringwerke',
-    'bei-jing',
-    'beiba',
-    'beiderbecke',
-    'beijing-based',
-    'beijingers',
-    'beilinson',
-    'being-for-itself',
-    'being-for-others',
-    'being-in-the-world',
     'being_on',
-    'beings.',
-    'beirut-damascus',
-    'beisa',
-    'beishida',
-    'beisty',
-    'bekale',
-    'bekeford',
-    'bekki',
-    'bel&dollar;107,000,000',
-    'bel&dollar;153,900,000',
-    'bel-shanaar',
-    'belasyse',
-    'belatedness',
-    'belauan',
-    'belaye',
     'belchev',
-    'belchford',
-    'belchier',
-    'belding',
-    'belehradek',
-    'beletuen',
-    'belfast-bangor',
-    'belfast-dublin',
-    'belfastmen',
-    'belfon',
-    'belges',
-    'belgischen',
-    'belgium-luxembourg',
-    'beliavsky',
-    'belief.',
-    'believeable',
     'belinsky',
-    'bell-glasses',
-    'bell-ingram',
-    'bell-pulls',
-    'bell-wether',
-    'bell-wethers',
-    'bella.',
-    'bellaby',
-    'bellak',
-    'bellanoch',
-    'bellario',
-    'bellbuoy',
-    'bellchamber',
-    'belleghem',
-    'bellers',
-    'belles-lettres',
     'bellevin',
-    'bellezza',
-    'bellflower',
-    'bellier',
-    'belljar',
-    'bellona',
-    'bellone',
-    'bellos',
-    'belloso',
-    'bellowings',
-    'bellucci',
-    'belly-buttons',
-    'belly-flopped',
-    'belly-laughs',
-    'belly-upwards',
-    'belmangate',
     'belmont-laon',
-    'belmopan',
-    'belodedic',
-    'belongingness',
-    'belotti',
-    'belousov',
-    'below-inflation',
-    'below-market',
-    'below-standard',
-    'below-the-knee',
-    'belson',
-    'belstrode',
-    'belt-and-braces',
-    'belt-up',
-    'belted-out',
-    'belthook',
     'beltin\'',
-    'beltranena',
-    'belvik',
-    'bemananjara',
-    'bembo',
-    'ben-ben',
-    'ben-david',
-    'ben-eliezer',
-    'ben-hur',
-    'ben-menahem',
-    'benappi',
-    'benburb',
-    'bence-jones',
-    'bencey',
-    'bench-lined',
-    'bench-marks',
     'bench-press',
-    'bench-seat',
-    'bench-tables',
-    'benchley',
-    'bency',
-    'bend-up',
-    'bendaoud',
-    'benderloch',
-    'bendicks',
-    'benedicat',
-    'benedictions',
-    'beneficiation',
-    'benefit/cost',
-    'benefit/income',
-    'benefits-in-kind',
-    'benefits/problems',
     'beneherth',
-    'benenden',
-    'benenin',
-    'benetech',
-    'benett',
-    'benfield/silver',
-    'benfits',
-    'beng(hons)',
-    'bengalensis',
-    'bengals',
-    'benger',
-    'benghalensis',
-    'bengkalis',
-    'bengoetxea',
-    'bengtson',
-    'benhill',
     'beniamina',
-    'benie',
-    'benigh',
-    'benirschke',
-    'benissad',
-    'benjam&iacute;n',
-    'benjamin/consultant',
-    'benjamina',
-    'benjamite',
-    'benkovitz',
-    'benleaze',
-    'benmont',
-    'bennell',
-    'bennets',
-    'bennettite',
-    'bennettites',
     'benneville',
-    'bennie',
-    'bennies',
-    'benor',
-    'benson/oxfordshire',
-    'benstock',
-    'bent-arm',
-    'bent-up',
-    'bent-winged',
-    'bentcho',
-    'benten',
-    'benthall',
-    'bentheim',
-    'bentkowski',
-    'bentonville',
-    'benvie',
     'benwick',
-    'benyi',
-    'benzeval',
-    'benzinol',
-    'benzopyrene',
-    'beosystem',
-    'beowulfian',
-    'beqa\'a',
-    'berani',
-    'berardenga',
-    'berardius',
-    'berardo',
-    'berberati',
-    'berck',
-    'berebury',
-    'bereland',
     'berend-corinth',
-    'bereng',
-    'beres',
-    'beretitenti',
-    'berewan',
-    'berg-like',
-    'bergf&uuml;hrer',
-    'bergholm',
-    'bergins',
-    'bergschrunds',
-    'bergsons',
-    'bergstein',
-    'berillium',
-    'beris',
-    'berj',
-    'berjasa',
     'berkas',
-    'berkenhead',
-    'berkerhofer',
-    'berkishness',
-    'berlak',
-    'berlick',
-    'berlin\'',
-    'berlingen',
-    'berlinguer',
-    'berlinski',
-    'berlioz\'',
-    'berlow',
-    'bermaldo',
-    'bermoothes',
-    'berms',
-    'bermudan-registered',
     'bern-langnau-luzern',
-    'bernales',
-    'bernander',
-    'bernard-henri',
-    'bernardine',
-    'bernas',
-    'bernay',
-    'berne-bound',
-    'bernfeld',
-    'bernkastel',
-    'bernkastel-kues',
-    'bernon',
-    'bernstein-baker',
-    'bernward',
-    'berny',
-    'beroe',
     'berofsky',
-    'berretz',
-    'berriew',
-    'berrisford',
-    'berry-bearing',
-    'berry-laden',
-    'berry-rogghe',
-    'berry/local',
-    'berrybank',
-    'bers',
-    'bersted',
-    'bert&iacute',
-    'bertele',
-    'bertelsman',
-    'bertens',
-    'berthefred',
     'berties',
-    'bertilskold',
-    'bertola',
-    'beru',
-    'berufsfachschule',
-    'beruit',
-    'berus',
-    'beruwela',
-    'berwickers',
-    'besana',
-    'besard',
-    'beshara',
-    'besieger',
-    'beskine',
-    'besmirsching',
-    'bessell',
     'best-behaved',
-    'best-coloured',
-    'best-developed',
-    'best-documented',
-    'best-funded',
-    'best-heeled',
-    'best-made',
-    'best-of-the-week',
-    'best-off',
-    'best-practice',
-    'best-practices',
-    'best-qualified',
-    'best-represented',
-    'best-rewarded',
-    'best-supported',
-    'best-tasting',
     'best/1',
-    'bestall',
-    'bestari',
-    'besthorpe',
-    'bestiarii',
-    'bestsellerdom',
-    'bet-the-company',
-    'beta-decay',
-    'beta-ionine',
-    'betablockers',
-    'betalite',
-    'betanbeau',
-    'betcha',
-    'betcherrygah',
-    'beteille',
-    'bethania',
     'bethincourt',
-    'bethmann',
-    'bethmann-hollweg',
-    'bethoc',
-    'bethsaida',
-    'betir',
-    'betrand',
-    'betson',
-    'betsworth',
-    'better-adapted',
-    'better-armed',
-    'better-bred',
-    'better-loved',
-    'better-organised',
-    'better-preserved',
-    'better-protected',
     'better-structured',
-    'bettray',
-    'bettyhill',
-    'bettystown',
-    'betulaceae',
-    'between-meal',
-    'betweene',
-    'beukema',
-    'beuren',
-    'beuve',
-    'bevans',
-    'bevere',
-    'beverland',
-    'beverle',
-    'beverstone',
-    'beverton',
     'bevil',
-    'bevilacqua',
-    'bewailed',
-    'bewilderments',
-    'bewitches',
-    'bewteen',
-    'beya',
-    'beyleveld',
-    'beylul',
-    'beyrie',
-    'bezafibrate',
-    'bezer/princess',
-    'bezprizornye',
-    'bf397,000',
-    'bg5',
-    'bg7',
     'bgbw',
-    'bgr',
-    'bgs-led',
-    'bh2',
-    'bh21',
-    'bhachu',
-    'bhadgaon',
-    'bhamdoun',
-    'bhamo',
-    'bharatha',
-    'bharti',
-    'bhaskara',
-    'bhawan',
-    'bhead',
-    'bhekisizwe',
-    'bhichai',
     'bhk',
-    'bhlh',
-    'bhoe',
-    'bhojpuri',
-    'bholsa',
-    'bhr',
-    'bhuachaille',
-    'bhujpal',
-    'bhumipol',
-    'bi-annually',
-    'bi-centennial',
-    'bi-dialectal',
-    'bi-directionally',
-    'bi-focal',
-    'bi-modal',
-    'bi-partite',
     'bi-planes',
-    'bi-product',
-    'bi-wiring',
-    'bi/col',
-    'bi:nz',
-    'biaggi',
-    'biagi',
-    'bialler',
-    'biannually',
-    'biasia',
-    'bib-and-brace',
-    'bib-taps',
-    'biberstein',
-    'bibikov',
-    'bibios',
-    'bibl.',
     'bible-based',
-    'bibliographers',
-    'bibliopegist',
-    'bibliophilic',
-    'biblioth&egrave;ques',
-    'bibliotheca/ts',
-    'bibury/gloucestershire',
-    'bibvewadi',
-    'bicarb.',
-    'bichon',
-    'bicirrhosum',
-    'bickershaw',
-    'bickie',
-    'bicknacre',
-    'bicknoller',
-    'bicommunal',
     'biconfessional',
-    'biconical',
-    'bicornis',
-    'bicron',
-    'bicycle-clips',
-    'bidded',
-    'biddell',
-    'bidder.',
-    'bidding-up',
-    'biddiscombe',
-    'bidds',
-    'bide-a-wee',
-    'bidey-in',
-    'bidford',
-    'bidialectal',
-    'bielckus',
     'bielsa',
-    'bierce',
-    'biesty',
-    'biffins',
-    'bifield',
-    'bifold',
-    'bifolium',
-    'big-',
-    'big-\'un',
-    'big-bodied',
-    'big-bosomed',
-    'big-boys',
-    'big-brimmed',
-    'big-cat',
-    'big-crested',
-    'big-engined',
     'big-fish',
-    'big-hit',
-    'bigbury',
-    'bigelowii',
-    'bigemini',
-    'bigena',
-    'bigger-than-expected',
-    'biggest&rehy;ever',
-    'biggs-davison',
-    'biglands',
-    'bigli',
-    'bignell',
-    'bigombe',
-    'bigot.',
-    'bigotries',
-    'bigs',
     'bigshot',
-    'biguanides',
-    'biha',
-    'bijenkorf',
-    'bijoutier',
-    'bijoux',
-    'bike-and-ride',
-    'bikethon',
-    'bikethons',
-    'bikila',
-    'bikini-line',
-    'bilainkin',
-    'biland',
-    'bilateralisation',
-    'bilbao-vizcaya',
-    'bilberrying',
     'bilboa',
-    'bildeston',
-    'bildung',
-    'bili',
-    'bilinda',
-    'biliopancreatic',
-    'bilking',
-    'bill&lsqb;s&rsqb',
-    'bill-board',
-    'bill-boards',
-    'bill-paying',
-    'billable',
-    'billabongs',
-    'billard/ipms',
-    'billcliffe',
-    'billennia',
     'billfish',
-    'billion-10',
-    'billion-4',
-    'billion-5',
-    'billion-50',
-    'billionairess',
-    'billis',
-    'billitt',
-    'billon',
-    'billposter',
-    'billspike',
-    'billups',
-    'billy-tuckett-shaped',
-    'billycans',
-    'billycock',
-    'bilobed',
     'bilocca',
-    'bimaculated',
-    'bimanual',
-    'bimboy',
-    'bimescol',
-    'bimini',
-    'bimsley',
-    'binanianae',
-    'binary-only',
-    'binational',
-    'binbirdirek',
-    'bind-over',
-    'bindley',
-    'binegar',
-    'bingham-jones',
-    'binghampton',
     'bingo-playing',
-    'bingol',
-    'binham',
-    'binkley',
-    'binman',
-    'binmen',
-    'binn',
-    'binnein',
-    'binnig',
-    'binocularity',
-    'binot',
-    'binsbergen',
-    'binsey',
-    'binstead',
-    'binta',
-    'binya\'a',
     'bio-accumulative',
-    'bio-chemicals',
-    'bio-days',
-    'bio-degradation',
-    'bio-foam',
-    'bio-hours',
-    'bio-implants',
-    'bio-inorganic',
-    'bio-intermediate',
-    'bio-limiting',
-    'bio-organic',
-    'bio-physical',
-    'bio-plan',
-    'bio-polymers',
-    'bio-reactors',
-    'bio-rhythms',
     'bio-slime',
-    'bio-unlimiting',
-    'bioaccumulation',
-    'bioactive',
-    'bioactivity',
-    'biocentric',
-    'biochemistries',
-    'bioclimatic',
-    'bioconversion',
-    'biodivision',
-    'biofoam',
-    'biogeology',
-    'biographic',
-    'biographical/historical',
-    'biographically',
-    'biographics',
     'biographie',
-    'biol.',
-    'biolayers',
-    'biollay',
-    'biological/genetic',
-    'biologised',
-    'biomarker',
-    'biomass/plant',
-    'biometricians',
-    'biorhythm',
-    'biosorption',
-    'biotechnical',
-    'biotechnikum',
-    'biothropic',
-    'biotope',
-    'bious-artigues',
     'bipartisanship',
-    'bipasha',
-    'bipedally',
-    'bipolarity',
-    'biquadratic',
-    'biquaternions',
-    'birabeau',
-    'biradiri',
-    'birago',
-    'birama',
-    'birch-twig',
-    'birchanger',
-    'birchburn',
-    'birched.',
-    'birchenough',
-    'birchens',
     'birchirs',
-    'birchwoods',
-    'bird\'s-eye-view',
-    'bird-brained',
-    'bird-breeder',
-    'bird-fanciers',
-    'bird-friendly',
-    'bird-hipped',
-    'bird-songs',
-    'bird-sound',
-    'bird/claimant',
-    'birdcages',
-    'birdfood',
-    'birdless',
-    'birdlime',
-    'birdmen',
     'birdnesting',
-    'birds-foot',
-    'birdshit',
-    'birdston',
-    'birke',
-    'birket',
-    'birkhoff',
-    'birkill',
-    'birkinlig',
-    'birksgreen',
-    'birlinn',
-    'birri',
-    'birt-smith',
-    'birth-determined',
-    'birth-flowers',
-    'birth-sign',
     'birthrights',
-    'birtsmorton',
-    'birua',
-    'bis(2-azidoethyl)ether',
-    'bisacrylamide',
-    'bisby',
-    'bischofberger',
-    'biscuit-thin',
-    'bisdee',
-    'biserial',
-    'bishop/herefordshire',
-    'bishopdom',
-    'bishoprick',
-    'bishopton/redmarshall',
-    'bishr',
-    'bishri',
     'bislama',
-    'bismillahi',
-    'bisons',
-    'bisontes',
-    'bisphosphate',
-    'bispo',
-    'bisques',
-    'bissex',
-    'bista',
-    'bistort',
-    'bisulphate',
-    'bisztyga',
-    'bit-5',
-    'bit-less-bad',
-    'bit-line',
-    'bit-mapping',
     'bit-wise',
-    'bitable',
-    'bitar',
-    'bitchier',
-    'bite-mark',
-    'bite-marks',
-    'biteless',
-    'bitfax',
-    'bitflik',
-    'bitincka',
-    'bitings',
-    'bitofabanter',
-    'bitonto',
-    'bits\'er',
-    'bits-and-pieces',
-    'bits.',
     'bittercress',
-    'bitwix',
-    'biu',
-    'biumba',
-    'bivens',
-    'bivins',
-    'bix',
-    'bixa',
-    'bixaceae',
-    'bizarreness',
-    'bizarreries',
-    'bizkaia',
-    'bizri',
-    'bizz',
-    'bj&ouml;rk',
-    'bj&ouml;rk&ouml',
     'bjarnason',
-    'bjorklund',
-    'bjornson',
-    'bkirki',
-    'bkw',
-    'blaauw',
-    'blaazer',
-    'black-and-white-tiled',
-    'black-armoured',
-    'black-barred',
-    'black-cab',
-    'black-capped',
-    'black-cattle',
-    'black-covered',
-    'black-eared',
-    'black-feathered',
     'black-fringed',
-    'black-jacketed',
-    'black-leathered',
-    'black-magic',
-    'black-maned',
-    'black-masked',
-    'black-on-white',
-    'black-purple',
-    'black-ruled',
-    'black-spots',
-    'black-stained',
-    'black-timbered',
-    'black-tinted',
-    'black-veiled',
-    'blackbottle',
-    'blackburns',
     'blackbush',
-    'blackchurch',
-    'blackcloth',
-    'blackcurrent',
-    'blackfell',
-    'blackhouses',
-    'blackish-green',
-    'blackish-grey',
-    'blackledge',
-    'blacklion',
-    'blackmails',
-    'blackmer',
-    'blackmill',
-    'blackmoors',
-    'blackpatch',
-    'blacksburg',
     'blackskins',
-    'blackstones',
-    'blacky',
-    'bladdered',
-    'bladderwort',
-    'bladen-hovell',
-    'blades.',
-    'bladnoch',
-    'blagajac',
-    'blagoevgrad',
-    'blair-gould',
-    'blair-kerr',
-    'blair/thames',
-    'blairie',
-    'blairman',
-    'blairquhan',
     'blairs',
-    'blaisdell',
-    'blakesley',
-    'blakeway/moseley',
-    'blame&ndash;free',
-    'blamelessness',
-    'blampied',
-    'blanc-bleu',
-    'blanchfield',
-    'bland-looking',
-    'blanda',
-    'blandest',
-    'blandin',
-    'blandly-flavoured',
-    'blaneys',
-    'blank-verse',
     'blanke',
-    'blankenhorn',
-    'blankestijn',
-    'blanket-wrapped',
-    'blankish',
-    'blankney',
-    'blanshard',
-    'blasczyk',
-    'blashford-snell',
-    'blasingame',
-    'blaszk',
-    'blaugdone',
-    'blaupunkt',
-    'blaworth',
-    'blaydes',
-    'blayney',
     'blayneys',
-    'blaziowitz',
-    'blc',
-    'bldgs',
-    'bleach-fixed',
-    'bleacher',
-    'bleadney',
-    'blear-eyed',
-    'bleath-like',
-    'blechner',
-    'bleeding-wound',
-    'bleedings',
-    'bleedproof',
-    'blefuscan',
-    'blefuscans',
-    'bleher',
     'blemishing',
-    'blemleys',
-    'blenkarne',
-    'blennerhasset',
-    'bleomycin.',
-    'bletchley/milton',
-    'bletchworth',
-    'bletherer',
-    'blethering',
-    'blethers',
-    'bletso',
-    'blevey',
-    'blevins',
-    'blezzard',
-    'blg',
-    'bli-xa',
     'blik',
-    'blinco',
-    'blind-man\'s-buff',
-    'blindenhall',
-    'blinders',
-    'blindest',
-    'blindfolding',
-    'blinding-white',
-    'blindnesses',
-    'blindspot',
-    'blipvert',
-    'blis',
-    'blisland',
-    'bliss-out',
-    'blissing',
-    'blisteze',
     'blitar',
-    'blitter',
-    'blizzarding',
-    'bloater',
-    'blobspace',
-    'block-buster',
-    'block-busting',
-    'block-shaped',
-    'blockley/archaeologist',
-    'bloemendaal',
-    'blofield',
-    'blois-champagne',
-    'blomqvist',
-    'blomstedt',
-    'blonc',
-    'blondish',
     'blondness',
-    'blonds',
-    'blong',
-    'blonk',
-    'blood&rehy;stained',
-    'blood-and-thunder',
-    'blood-bathed',
-    'blood-baths',
-    'blood-black',
-    'blood-boltered',
-    'blood-bought',
-    'blood-bright',
-    'blood-cooling',
-    'blood-dimmed',
-    'blood-flow',
-    'blood-glucose',
     'blood-guilt',
-    'blood-letter',
-    'blood-line',
-    'blood-pink',
-    'blood-poisons',
-    'blood-pressure-lowering',
-    'blood-pressures',
-    'blood-related',
-    'blood-royal',
-    'blood-stage',
-    'blood-stains',
-    'blood-suckers',
-    'blood-test',
-    'blood-transfused',
-    'blood-worms',
-    'blood/brain',
     'bloodlessness',
-    'bloodletters',
-    'bloodnott',
-    'bloodwych',
-    'bloody-handed',
-    'bloodymindedness',
-    'bloomfields',
-    'bloomless',
-    'blossomgate',
-    'blotchily',
-    'blotting-hybridization',
-    'blottings',
-    'blow-darts',
-    'blow-drys',
-    'blow-over',
-    'blow-overs',
     'blowy',
-    'bloxham/oxfordshire',
-    'bloy',
-    'bloyeti',
-    'blt',
-    'bludworth',
-    'blue-and-white-striped',
-    'blue-backed',
-    'blue-banded',
-    'blue-bottomed',
-    'blue-cars',
-    'blue-cheeked',
-    'blue-coloured',
-    'blue-dyed',
-    'blue-edged',
-    'blue-ground',
     'blue-leaved',
-    'blue-lined',
-    'blue-lipped',
-    'blue-overalled',
-    'blue-ribbon',
-    'blue-shifted',
-    'blue-shirted',
-    'blue-skinned',
-    'blue-speaker',
-    'blue-stained',
-    'blue-stockinged',
-    'blue-tit',
-    'blue-trees',
-    'blue-uniformed',
-    'blue/purple',
-    'bluebeat',
     'blueboobs',
-    'bluebridge',
-    'bluecher',
-    'bluegums',
-    'bluemner',
-    'blues-based',
-    'blues-derived',
-    'blues-rockers',
-    'bluesers',
-    'bluestockings',
-    'bluestry',
-    'bluethroats',
-    'bluetrees',
-    'bluey-white',
-    'bluffness',
-    'bluiett',
     'bluish-green',
-    'blum-kulka',
-    'blumenau',
-    'blumhardt',
-    'blunderer',
-    'blunderings',
-    'blundred/thames',
-    'blunketts',
-    'blunos',
-    'blunt-end',
-    'blunt-nosed',
-    'blunt-talking',
-    'blurrings',
-    'bluto',
-    'blytons',
-    'bm-test-1&ndash;44',
     'bma/bupa',
-    'bmaa',
-    'bmya',
-    'bnag',
-    'bnass',
-    'bndes',
-    'bndp',
-    'bnoc',
-    'bo&icirc;te',
-    'bo4510',
-    'boa-constrictors',
-    'boabdil',
-    'boada',
-    'boake',
-    'boakes',
-    'board-upgradable',
     'board/indoor',
-    'board/wea',
-    'boarding-pikes',
-    'boarding-up',
-    'boardoom',
-    'boat\'s-crew',
-    'boat-builders',
-    'boat-hire',
-    'boat-stealing',
-    'boats.',
-    'bob-bob-bobbing',
-    'bob-shaped',
-    'bob-sleigh',
-    'bobber',
-    'bobbin-waggler',
-    'bobbitt',
     'bobble-hatted',
-    'bobby-bashing',
-    'bobby-dazzler',
-    'bobgan',
-    'boblyn',
-    'bobok',
-    'bobotie',
-    'bobsleigher',
-    'boccanegra',
-    'boccara/boucherit',
-    'boccas',
-    'bocharov',
-    'bochenek',
-    'bocij',
-    'bod&ouml',
-    'bodafon',
     'bodedern',
-    'bodenham/herefordshire',
-    'bodhidharma',
-    'bodifit',
-    'bodil',
-    'bodines',
-    'bodorgan',
-    'bodwrdin',
-    'body&rehy;work',
-    'body-',
-    'body-bags',
-    'body-beautiful',
-    'body-checked',
-    'body-related',
-    'body-shapes',
-    'body-squire',
     'body-swerve',
-    'body-work',
-    'body/chassis',
-    'bodyboarders',
-    'bodycote',
-    'bodys',
-    'bodyshape',
-    'bodysides',
-    'bodysurfers',
-    'bodytoners',
-    'bodywise',
-    'boekerij',
-    'boell',
-    'boero',
-    'boersema',
-    'boesch-achermann',
     'boetefeur',
-    'boffinery',
-    'boffo',
-    'bog-trotting',
-    'bogaers',
-    'bogan',
-    'bogatcheva',
-    'bogey-five',
-    'bogey-fives',
-    'boggan',
-    'boggarts',
-    'bognessan',
-    'bogo',
-    'bogomolov',
-    'bogoria',
-    'bogroy',
     'bogtrot',
-    'bogying',
-    'bogyo',
-    'bohacs',
-    'boham',
-    'bohannan',
-    'bohemia-moravia',
-    'bohley',
-    'bohnke',
-    'bohol',
-    'bohumil',
-    'boiardo',
-    'boil-off',
-    'boiler-plate',
-    'boiler-room',
-    'boiler-suits',
     'boilered',
-    'boilly',
-    'boings',
-    'boiseries',
-    'boitani',
-    'bojangles',
-    'bokey',
-    'bokha',
-    'bolagnos',
-    'bolah',
-    'bolanger',
-    'bolcek',
-    'boldbaatar',
-    'boldened',
-    'bolderson',
-    'boldre',
     'bolduc',
-    'boleyns',
-    'bolivares',
-    'bolkestein',
-    'bollee',
-    'bolles',
-    'bolletieri',
-    'bolls',
-    'boloardo',
-    'bolsa',
-    'bolsay',
-    'bolshevik-inspired',
-    'bolt-ons',
-    'bolted-down',
-    'bolton-born',
-    'bolton-hunter',
     'bolwell',
-    'bomani',
-    'bomb-attacks',
-    'bomb-builder',
-    'bomb-happy',
-    'bomb-plot',
-    'bomb-ravaged',
-    'bomb-shaped',
-    'bomb-shell',
-    'bomb-vessels',
-    'bombastically',
-    'bombay-born',
-    'bombing-raids',
-    'bombsite',
-    'bomi',
-    'bon-bons',
     'bonacina',
-    'bonardi',
-    'bonavia',
-    'bond-washing',
-    'bonduc',
-    'bonducetta',
-    'bone-crushing',
-    'bone-deep',
-    'bone-dust',
-    'bone-lining',
-    'bone-meal',
-    'bone-pale',
-    'bone-weariness',
-    'bonelessly',
-    'bonello',
-    'boneman',
     'boner',
-    'bones.',
-    'boneshakers',
-    'bonesteel',
-    'bonferroni',
-    'bongchun-dong',
-    'bongers',
-    'bongiovanni',
-    'bonifaci',
-    'bonily',
-    'boniness',
-    'bonnal',
-    'bonnefond',
-    'bonnes',
-    'bonneys',
-    'bonobo',
     'bonola',
-    'bonos',
-    'bonsecours',
-    'bonsmoulins',
-    'bonswa',
-    'bont',
-    'bonte',
-    'bontecou',
-    'bonutto',
-    'bonwick',
-    'bonython',
-    'bonza',
-    'bonzanigo',
-    'boo-ing',
-    'boo-tiful',
-    'boo-yaa',
     'boobie',
-    'boog',
-    'boogaard',
-    'boogeyman',
-    'boogies',
-    'booh-booh',
-    'boojoo',
-    'book(s)',
-    'book*',
-    'book-bag',
-    'book-hand',
-    'book-hands',
-    'book-list',
-    'book-oriented',
-    'book-shop',
-    'book-shops',
     'book-starved',
-    'book-worm',
-    'book-writers',
-    'bookbindings',
-    'bookdata',
-    'bookfetching',
-    'booking-office',
-    'booking/information',
-    'bookings.',
-    'bookjacket',
-    'booklength',
-    'booklet.',
-    'booklice',
-    'booknews',
-    'bookrooms',
-    'bookrunners',
     'booksize',
-    'bookstacks',
-    'boom-hoom',
-    'boom-slump',
-    'boom-town',
-    'boomerang-shaped',
-    'booming.',
-    'boomla',
-    'boomlet',
-    'boomsha',
-    'boon-eua',
-    'boon/gloucestershire',
-    'boonchu',
-    'boondoggle',
-    'booreman',
-    'bootboy',
     'bootboys',
-    'bootee',
-    'booters',
-    'booth-mason',
-    'bootheels',
-    'boothman',
-    'boothstown',
-    'bootle-born',
-    'bootprint',
-    'bootprints',
-    'bootsafe',
-    'bopparder',
-    'boracic',
-    'boraginaceae',
-    'boran',
-    'borapetensis',
     'borborygmi',
-    'borchert',
-    'bordeaux-style',
-    'bordelaise',
-    'border-free',
-    'bordes-pages',
-    'bordua',
-    'bored-out',
-    'boreel',
-    'borel',
-    'boreland',
-    'boreman',
-    'borenius',
-    'boreray',
-    'borers',
-    'borestone',
     'boretti',
-    'borg/jcr',
-    'borgaraflokkurinn',
-    'borgman',
-    'borgois',
-    'borgonuovo',
-    'borgund',
-    'borjas',
-    'borley',
-    'bormio',
-    'born-and-bred',
-    'born-to-be-wild',
-    'born.',
-    'borneensis',
-    'bornholmerstrasse',
-    'boro-silicate',
     'borodino',
-    'borody',
-    'boronation',
-    'borongaj',
-    'borotra',
-    'borra',
-    'borras',
-    'borrero',
-    'borrill',
-    'borrins',
-    'borromini',
-    'borsalino',
-    'borsetshire',
-    'borst-eilers',
-    'bortey',
-    'borton',
     'borzage',
-    'bos.',
-    'boscean',
-    'boschetti',
-    'boschi',
-    'boschmann',
-    'bosenquet',
-    'bosiljko',
-    'boskap',
-    'bosnia&rehy;herzegovina',
-    'bosnia-hercegovinia',
-    'bosnia-herzogovina',
-    'boss-to-be',
-    'bossa',
-    'bossall',
-    'bossey',
     'bossiest',
-    'bota',
-    'botanicus',
-    'botany/zoology',
-    'botcherby',
-    'botesdale',
-    'both-ways',
-    'botheration',
-    'bothered.',
-    'botherer',
-    'botkin',
-    'botomba',
-    'botrel',
-    'botsio',
-    'botswanan',
-    'bottega',
     'botteghe',
-    'botterell',
-    'botti',
-    'bottiglieri',
-    'bottle-banks',
-    'bottle-making',
-    'bottle-openers',
-    'bottle-tops',
-    'bottle-washers',
-    'bottle/',
-    'bottled-gas',
-    'bottlefed',
-    'bottlefeeding',
-    'bottletops',
-    'bottom-dwellers',
-    'bottomleys',
     'bottone',
-    'botwood',
-    'boudenesa',
-    'boudica',
-    'boudjemaa',
-    'bouez',
-    'bouganville',
-    'bougeant',
-    'bough/breaking',
-    'bought-out',
-    'boughton-under-blean',
-    'bouhabib',
-    'bouiali',
-    'bouillons',
-    'bouira',
-    'boulder-chokes',
     'bouleuterion',
-    'boulier/french',
-    'boullaha',
-    'boulmerka',
-    'boulogne-sur-mer',
-    'boulos',
-    'boulou',
-    'boumphreys',
-    'bouna',
-    'bounaama',
-    'bounce-back',
-    'bound&formula',
-    'boundary-lands',
-    'boundry',
-    'bounteously',
-    'bountifull',
     'bountifully',
-    'bounty-hunter',
-    'bourboule',
-    'bourgeoisie.',
-    'bourgeoisification',
-    'bourgeoisophobe',
-    'bourgoise',
-    'bourke-white',
-    'bourla',
-    'bourlon',
-    'bournemouth-weymouth',
-    'boushel',
-    'bousquette',
-    'boussard',
-    'bousse',
-    'boussinesq',
     'boustead',
-    'boutayeb',
-    'boutcher',
-    'boutell',
-    'bouth',
-    'boutinot',
-    'boutwood',
-    'bouvet&oslash;ya',
-    'bouyancy',
-    'bouzoulouk',
-    'bova',
-    'bovell',
-    'boves',
-    'boveton',
-    'bovids',
-    'boville',
     'bow-shaped',
-    'bow-windowed',
-    'bow-windows',
-    'bowd/banbury',
-    'bowd/cheltenham',
-    'bowd/cowley',
-    'bowd/gloucester',
-    'bowd/hereford',
-    'bowd/witney',
-    'bowder',
-    'bowderstone',
-    'bowditch',
-    'bowe-evander',
-    'bowelling',
-    'bowen/thames',
-    'bower-birds',
     'bowers-broadbent',
-    'bowhauliers',
-    'bowie-knives',
-    'bowl.',
-    'bowler-hat',
-    'bowleswood',
-    'bowlie',
-    'bowmat',
-    'bowmont',
-    'bowral',
-    'bowwab',
-    'box&ndash;girder',
-    'box(es)',
-    'box*',
-    'box-shifting',
-    'box-style',
     'box2',
-    'boxed-off',
-    'boxford',
-    'boxing-booths',
-    'boxley',
-    'boxlike',
-    'boxmakers',
-    'boy\'s',
-    'boy-king',
-    'boy-lovers',
-    'boyes-braem',
-    'boyfriend/girlfriend',
-    'boyld',
-    'boyle-charles',
-    'boynton/farmer',
-    'boys:one',
     'boys:two',
-    'boywoman',
-    'bozburun',
-    'bozeman',
-    'bozhe',
-    'bozz',
-    'bozzetti',
-    'bozzetto',
-    'bozzo',
-    'bozzy',
-    'bp-operated',
-    'bp-unipart',
-    'bp.',
-    'bpps',
-    'bpx-a\'s',
-    'bquo',
     'br&ecirc;tigny',
-    'br&egrave;tigny',
-    'br/sncf',
-    'br7',
-    'br8',
-    'bra-and-pants',
-    'brabantio',
-    'bracadale',
-    'braccio',
-    'braceros',
-    'brachiation',
-    'brachot',
-    'brachyceros',
-    'bracings',
-    'brackendene',
-    'brackens',
     'bracketing-off',
-    'bracorina',
-    'bract',
-    'bradenton',
-    'bradford-hill',
-    'bradford-on-tone',
-    'bradley/department',
-    'bradleyan',
-    'bradleyscope',
-    'bradmanesque',
-    'bradnock',
-    'bradshaw/steve',
-    'bradstonians',
-    'bradt',
-    'bradville',
-    'bradway',
     'bradys',
-    'braeside',
-    'brahan',
-    'brahmac&amacr;rin',
-    'brahmadaitya',
-    'brahunisary',
-    'braida',
-    'brain-bending',
-    'brain-derived',
-    'brain-size',
-    'brainard',
-    'brainboxes',
-    'braincase',
-    'braincells',
-    'brainedness',
-    'brainer',
     'braininess',
-    'brainstormers',
-    'brainstorms',
-    'braithwaite/glos',
-    'braka',
-    'brakesmen',
-    'brakework',
-    'bramald',
-    'bramantino',
-    'bramblings',
-    'brambury',
-    'bramdean',
-    'bramfield',
-    'bramling',
-    'brammah',
-    'branaire-ducru',
     'brancardiers',
-    'brance',
-    'branch-and-bound',
-    'branch-based',
-    'branch-coloured',
-    'branch-lines',
-    'branch-off',
-    'branches/organisations',
-    'branchless',
-    'branchnet',
-    'brand-consciousness',
-    'brand-names',
-    'brandenberg',
-    'brandings',
-    'brandis',
-    'brandley',
     'brandlings',
-    'brandmarks',
-    'brandywine',
-    'branigan',
-    'branimir',
-    'branka',
-    'branles',
-    'bransholme',
-    'brashest',
-    'brasileira',
-    'brasilense',
-    'brasington',
-    'brasnett',
-    'brass-banded',
-    'brass-coloured',
-    'brass-making',
     'brass-rimmed',
-    'brass-rule',
-    'brassempouy',
-    'brasserie-style',
-    'brasseur',
-    'brassicae',
-    'brasside',
-    'brassie',
-    'brassiness',
-    'brat-race',
-    'brauchitsch',
-    'braul',
-    'braun-blanquet',
-    'braundschweig',
-    'braunschweig-based',
-    'braunschweiger',
     'brauron',
-    'brautigan',
-    'bravados',
-    'brawler',
-    'brayley',
-    'brayman',
-    'brazilia',
-    'brb/leeds',
-    'breach.',
-    'bread-baking',
-    'bread-winning',
-    'breadpans',
-    'breadth/length',
-    'breadtwists',
-    'break-clauses',
-    'break-notice',
     'break-points',
-    'break-uprithmetic',
-    'break/oxfordshire',
-    'breakback',
-    'breakfast-tray',
-    'breakfast/planet',
-    'breakin',
-    'breaking-strain',
-    'breakthough',
-    'breakups',
-    'breams',
-    'breast-',
-    'breast-cancer',
-    'breast-shot',
-    'breast/',
-    'breastband',
     'breastless',
-    'breastrokers',
-    'breasts.',
-    'breath-catching',
-    'breath-control',
-    'breath-group',
-    'breath-jerking',
-    'breathiness',
-    'breathing-gas',
-    'breathing-in',
-    'breathspace',
-    'brebner',
-    'brecchia',
-    'breckin',
-    'brecknell',
-    'brecknockshire',
     'breckon',
-    'bredahl',
-    'bredder',
-    'bredekis',
-    'bredy',
-    'breechloading',
-    'breedin\'',
-    'breeds.',
-    'breeze-ruffled',
-    'breezeblock',
-    'breg',
-    'bregy',
-    'breifne',
-    'breisach',
-    'breithorn',
-    'breitschwerdt',
     'brekanil',
-    'brekky',
-    'bremenium',
-    'brench',
-    'brendons',
-    'brennans',
-    'brennez',
-    'brenod',
-    'brentonians',
-    'breshnev',
-    'breskens',
-    'bresnan',
-    'bressummer',
-    'bretenoux',
-    'bretigny',
-    'breto&ntilde;a',
     'brett-smith',
-    'brett/civil',
-    'brettan',
-    'breuning',
-    'brevipedicellatus',
-    'brewaeys',
-    'brewongle',
-    'brewood-wheaton',
-    'brians',
-    'briatin',
-    'brib',
-    'bribable',
-    'bribe-hungry',
-    'brick-sized',
-    'brick-throwing',
-    'brick-walled',
     'bricker',
-    'brickert',
-    'brickfields',
-    'bricklin',
-    'brickyards',
-    'bricoleur',
-    'bricoleurs',
-    'briddon',
-    'bride-cake',
-    'bride-price',
-    'bride/divine',
-    'bridei',
-    'bridewood',
-    'bridey',
-    'bridge/tailpiece',
-    'bridgeable',
     'bridgedale',
-    'bridgedeck',
-    'bridgeless',
-    'bridgend4',
-    'bridgeplate',
-    'bridgeport',
-    'bridle-path',
-    'bridle-roads',
-    'bridlepath',
-    'briege',
-    'briercliffe',
-    'brieuc',
-    'brigandines',
-    'brigante',
-    'brigantian',
-    'brigate',
     'brigge',
-    'brigged',
-    'briggflats',
-    'brightenings',
-    'brighter-eyed',
-    'brighteyes',
-    'brightly-painted',
-    'brightons',
-    'brightreason',
-    'brightwells',
-    'briglands',
-    'brigoon',
-    'brigstocke',
-    'brihtwold',
-    'brill/oxfordshire',
-    'brillat',
     'brilliant-coloured',
-    'brilliantly-coloured',
-    'brimpts',
-    'brincliffe',
-    'brine-saturated',
-    'brine-shrimp',
-    'brining',
-    'brinkworth',
-    'brinvilliers',
-    'briollay',
-    'briquetage',
-    'briquette',
-    'briscoe-hooks',
-    'brisley',
-    'bristle-cone',
-    'bristle-like',
     'bristol-coventry',
-    'bristol/bath',
-    'bristolians',
-    'bristow/west',
-    'brit-style',
-    'brit.',
-    'britain-east',
-    'britannias',
-    'british&amp;commonwealth',
-    'british-is-best',
-    'british-manned',
-    'british-manufactured',
-    'british-occupied',
-    'british-powered',
-    'british-protected',
-    'british-registered',
     'british-sponsored',
-    'british-us',
-    'british/belgian',
-    'british/dutch',
-    'british/european',
-    'britnell',
-    'brittan/peacock',
-    'brittas',
-    'brittenesque',
-    'brittle-stars',
-    'brittly',
-    'britto',
-    'britton/parish',
-    'britzka',
-    'brivati',
-    'brives-la-gaillarde',
     'brixworth/northamptonshire',
-    'brmm',
-    'brn-3',
-    'bro\'er',
-    'broaching-to',
-    'broad-beamed',
-    'broad-billed',
-    'broad-sheet',
-    'broadbridge',
-    'broadcastable',
-    'broadclyst',
-    'broaddus',
-    'broaded',
-    'broadheath',
-    'broadleys',
-    'broadly-educated',
     'broadscale',
-    'broadward',
-    'broadways',
-    'brocht',
-    'brochure.',
-    'brockachach',
-    'brockbank/vale',
-    'brockhurst',
-    'brocklebank-fowler',
-    'brockworth/gloucester',
-    'brodeur',
-    'brodhurst',
-    'brodley',
-    'brogdale',
-    'broglie-bohm',
-    'broil',
     'broka',
-    'broke-dick',
-    'brokendown',
-    'broker-dealer',
-    'bromide-stained',
-    'bromiley',
-    'bromilow',
-    'brommage',
-    'bromswell',
-    'bromwell',
-    'bronchiolitis',
-    'bronchitic',
-    'broncho-oesophageal',
-    'bronchodilatation',
-    'bronn',
-    'brontosaur',
     'bronwyn',
-    'bronze-feathered',
-    'bronze-leaved',
-    'broo',
-    'brooke-taylor',
-    'brookes/gloucestershire',
-    'brooklime',
-    'brooklyn-born',
-    'brooks-baker/burke',
-    'broom-cupboards',
-    'broomhurst',
-    'broomie',
-    'broomleaf',
-    'broomstick-thin',
-    'broomy',
-    'broonzy',
     'broster',
-    'brostoff',
-    'broter',
-    'brotherstone',
-    'brough-on-fosse',
-    'brough/occupant',
-    'brought-forward',
-    'broughton-made',
-    'broughton-mcdonald',
-    'brousse',
-    'broussonetia',
-    'browder',
-    'browdie',
-    'brown-crusted',
-    'brown-earth',
-    'brown-outs',
     'brown-paper-wrapped',
-    'brown-speckled',
-    'brown-stained',
-    'brown-uniformed',
-    'brown-wilkinson',
-    'brown/cheltenham',
-    'brown/eleanor',
-    'brown/national',
-    'brownbridge',
-    'brownell',
-    'brownhill',
-    'brownhills',
-    'brownhut',
-    'browningese',
-    'brownly',
-    'brownmoor',
     'brownsdon',
-    'brownshirt',
-    'brownsill/neighbour',
-    'browny-purple',
-    'browsable',
-    'broxton',
-    'brrm',
-    'brs/demon',
-    'brs/native',
-    'brs/thesaurus',
-    'brs/views',
-    'brs/vision',
-    'brs/word',
-    'brsadin',
-    'bruaer',
-    'brucciani',
     'bruce-partington',
-    'brucella',
-    'bruddersford',
-    'brudenells',
-    'bruer',
-    'bruguiere',
-    'bruised-looking',
-    'bruisings',
-    'brularts',
-    'brumel',
-    'brumfitt',
-    'brummitt',
-    'brundisium',
-    'brunhead',
-    'brunhilde',
-    'brunn',
     'brunneras',
-    'brunneus',
-    'brunning',
-    'bruns',
-    'bruntingthorpe',
-    'brush-turkeys',
-    'brushings',
-    'brushless',
-    'brushsellers',
-    'brushwasher',
-    'brushy',
-    'bruss',
-    'brusselator',
-    'brutalisation',
-    'brutalises',
-    'brutalists',
     'bruynse',
-    'bryan-chamorro',
-    'bryans',
-    'brymore',
-    'bryn-y-baal',
-    'bryn-y-neuadd',
-    'bryncir',
-    'bryne',
-    'brynford',
-    'brynglas',
-    'brynhill',
-    'bryophyte',
-    'bryusov',
-    'brzezinksi',
-    'bs12',
-    'bs1363',
     'bs3621',
-    'bs5',
-    'bs5750/bs5850',
-    'bs5750/iso',
-    'bs646',
-    'bsad-adt',
-    'bsdp',
-    'bset',
-    'bsharre',
-    'bso/origin',
-    'bstn',
-    'bstn1',
-    'bt10',
-    'bt20',
-    'bt308',
-    'bt37',
     'bt55',
-    'btnf',
-    'btrieve',
-    'bttf',
-    'btu/hr',
-    'btv-like',
-    'btx',
-    'buadilio',
-    'buagun',
-    'bubanza',
-    'bubbeh',
-    'bubbeleh',
-    'bubblingly',
-    'bubinga',
-    'buboes',
-    'bubonique',
     'bucata',
-    'bucci',
-    'bucharest/romania',
-    'buchmann',
-    'buchung',
-    'buchwitz',
-    'buck-naked',
-    'buck-toothed',
-    'buckden',
-    'buckeburg',
-    'buckers',
-    'bucket-and-spade',
-    'bucket-rearing',
-    'bucketsful',
-    'bucketshop',
-    'buckett',
     'buckhout',
-    'buckingham/thames',
-    'buckish',
-    'bucklebury',
-    'bucklemakers',
-    'bucklers',
-    'buckley-valeo',
-    'bucklow',
-    'buckskin-covered',
-    'bucktons',
-    'bucs',
-    'bud.',
-    'buddenbrooks',
-    'budejovice',
-    'budesonide',
-    'budget-deficit',
     'budget-minded',
-    'budget-setting',
-    'budgetry',
-    'budhsinghwala',
-    'budle',
-    'budokwai',
-    'budragchaagyn',
-    'bue-nas',
-    'bueil',
-    'buelach',
-    'buettner-janusch',
-    'bufus',
-    'bug-for-bug',
-    'bugarach',
-    'buggar',
-    'bugge',
     'bugliosi',
-    'bugojno',
-    'buhagiar',
-    'build-it',
-    'builder/developer',
-    'building-by-building',
-    'building-plots',
-    'buildwas',
-    'buillard',
-    'built-to-order',
-    'buisseret',
-    'bujt',
-    'bukhizam',
-    'bukta',
-    'bulat',
-    'bulba',
     'bulbuls',
-    'bulcamp',
-    'bulcock',
-    'bulcraig',
-    'bulgarian-soviet',
-    'bulging-eyed',
-    'bulk-buy',
-    'bulker',
-    'bull\'s-eyes',
-    'bull-at-a-gate',
-    'bull-runnings',
-    'bull-slaying',
-    'bull-whip',
-    'bull/28/10/93/cde',
-    'bull/sacha',
-    'bullamoor',
     'bulldozes',
-    'bulldozings',
-    'bullet-battered',
-    'bullet-head',
-    'bullet-holes',
-    'bullet-riddled',
-    'bullethole',
-    'bulleyana',
-    'bullfighter',
-    'bullier',
-    'bullit',
-    'bullmaster',
-    'bullock-cart',
-    'bullocking',
-    'bullosa',
-    'bullshine',
     'bullwinkle',
-    'bully-off',
-    'bulot',
-    'bulstrode/trauma',
-    'bulter',
-    'bultitude',
-    'bum-bags',
-    'bum-boys',
-    'bum-cheeks',
-    'bum-freezer',
-    'bumbag',
-    'bumboat',
-    'bump-readers',
-    'bumpety',
-    'bumpiness',
-    'bumpkins',
     'bumps-a-daisy',
-    'bumps.',
-    'bumslide',
-    'bun-fight',
-    'bun-shaped',
-    'buncer',
-    'bunched-up',
-    'bundesanstalt',
-    'bundesgerichtshof',
-    'bundeskanzler',
-    'bundeskriminalamt',
-    'bundesregierung',
-    'bundestags',
-    'bundesverfassungsgericht',
-    'bundle-like',
-    'bundock',
     'bundorragha',
-    'bunfights',
-    'bungaloid',
-    'bungdidin',
-    'bungee-jumping',
-    'bungees',
-    'bunglers',
-    'bungo',
-    'bunja',
-    'bunnage',
-    'bunnens',
-    'bunnet',
-    'bunnhouse',
-    'bunnys',
-    'bunraku',
-    'bunsby',
     'bunta',
-    'buntha',
-    'buntong',
-    'bunwell',
-    'buonarotti',
-    'buonarroti',
-    'buppie',
-    'burakovsky',
-    'buraku',
-    'buranelli',
-    'buraspor',
-    'burca',
-    'burchall',
-    'burchells',
-    'burdass',
-    'burdge',
     'bureacracy',
-    'bureacrats',
-    'bureaucratic-military',
-    'buresova',
-    'burgate',
-    'burgess/maclean',
-    'burgh-by-sands',
-    'burglar-proof',
-    'burgmayer',
-    'burgundy/slate',
-    'burgus',
-    'burial-cliffs',
-    'buriall',
-    'buriats',
-    'burke-davies',
-    'burkey',
     'burkland',
-    'burkliplatz',
-    'burliest',
-    'burlusconi',
-    'burmistrova',
-    'burn-in',
-    'burnant',
-    'burne-jonesy',
-    'burned-down',
-    'burneston',
-    'burnham/horse',
-    'burnholme',
-    'burns/gloucestershire',
-    'burnt-up',
-    'burnu',
-    'burny',
     'burpers',
-    'burr/farmer',
-    'burrard',
-    'burraton',
-    'burrige',
-    'burritt',
-    'burrou',
-    'burroughsian',
-    'burrowings',
-    'bursaspor',
-    'bursitis',
-    'bursting-point',
-    'burton/cpre',
-    'burtonport',
-    'burwalls',
-    'buryatia',
     'buryin\'',
-    'burythorpe',
-    'bus-boys',
-    'bus-connected',
-    'bus/coach',
-    'busboys',
-    'buscayno',
-    'buscemi',
-    'buscetta',
-    'buschbacher',
-    'busenello',
-    'bush-clearing',
-    'bush-like',
-    'bushbury',
-    'bushell-mingo',
-    'bushfire',
     'bushika',
-    'bushiness',
-    'bushire',
-    'bushlands',
-    'bushmeat',
-    'bushmill',
-    'bushwhacking',
-    'bushyleaze',
-    'business-development',
-    'business-friendly',
-    'business-minded',
-    'business-style',
-    'business-suited',
-    'business.the',
-    'business/commerce',
-    'business/financial',
     'businessobject',
-    'businesspersons',
-    'businesstalk',
-    'bussage',
-    'bust-length',
-    'bustamante',
-    'bustiers',
-    'bustly',
-    'buston',
-    'busuutis',
-    'buswatch',
-    'busways',
-    'but-1-ene',
-    'but_according',
-    'but_at',
-    'but_in',
     'but_out',
-    'butane/propane',
-    'butch/femme',
-    'butchart',
-    'butchwana',
-    'buteos',
-    'butetown',
-    'butler-henderson',
-    'butler/chief',
-    'butler/gloucestershire',
-    'butt-ends',
-    'buttell',
-    'butter-coloured',
-    'butter-knife',
-    'buttercup-like',
-    'buttercup-yellow',
     'butterfields',
-    'butterfly-light',
-    'butterfly-shaped',
-    'butterflys',
-    'butterly',
-    'butterstream',
-    'butterworth-heinemann',
-    'buttington',
-    'buttock-clenching',
-    'button-pressing',
-    'button-pushing',
-    'button-to-the-neck',
-    'buttonholing',
-    'buturlin',
-    'butz',
-    'buxton/campaign',
     'buxus',
-    'buy-off',
-    'buy-out/buy-in',
-    'buy-up',
-    'buy.they',
-    'buy/sell',
-    'buyback',
-    'buyer/ensuring',
-    'buyssens',
-    'buzalek',
-    'buzkashi',
-    'buzzin\'',
-    'bv1',
-    'bv2',
-    'bva-paris',
-    'bvrd',
     'bvsc',
-    'bvu',
-    'bvumbras',
-    'bw1',
-    'bw4',
-    'bwangdirola',
-    'bx/bx',
-    'bx/lx',
-    'bx/n',
-    'bxa6',
-    'bxd5',
-    'bxe6',
-    'bxg5',
-    'bychan',
-    'bydd',
-    'bydv',
     'bye-fellowship',
-    'byee',
-    'byerley',
-    'byford/co-promoter/swindon',
-    'bygott',
-    'bylinski',
-    'bylot',
-    'byrdland',
-    'byrne-sutton',
-    'byrnie',
-    'bystrica',
-    'bytek',
-    'bytham',
-    'bytheway',
-    'bzargl',
-    'bzip-dna',
     'bzzzzzzzzzzzzzzz',
-    'c&amp;e',
-    'c&bsol;a',
-    'c&bsol;b',
-    'c&bsol;w',
-    'c&dollar;4',
-    'c&dollar;450m',
-    'c&dollar;5',
-    'c&dollar;54m',
-    'c&dollar;8.5',
-    'c&dollar;900,000',
-    'c&eacute;l&egrave;bre',
-    'c&eacute;lio',
-    'c&eacute;saire',
-    'c&eacute;venol',
-    'c&eacute;zannian',
     'c&lsqb;.',
-    'c&lsqb;5-fc&rsqb;agg',
-    'c&lsqb;p&rsqb',
-    'c&lsqb;q&rsqb',
-    'c&mdash;1',
-    'c&mdash;2',
-    'c&ndash;fjin',
-    'c&ndash;g',
-    'c&oacute;mo',
-    'c&ocirc;te-des-neiges',
-    'c&pound',
-    'c&uacute',
-    'c\'moan',
-    'c\'wealth',
-    'c**t',
-    'c*ntana',
     'c++-based',
-    'c+1',
-    'c+at',
-    'c-11',
-    'c-18',
-    'c-228',
-    'c-ca',
-    'c-class',
-    'c-files',
-    'c-formation',
-    'c-grade',
-    'c-like',
-    'c-m',
-    'c-myc-er',
-    'c-pawn',
-    'c-pillars',
     'c-scape',
-    'c-serotonin',
-    'c-stat',
-    'c-terminally',
-    'c-words',
-    'c.-in',
-    'c.1030',
-    'c.11',
-    'c.1328',
-    'c.1400',
-    'c.1475',
-    'c.1550&ndash;1800',
-    'c.1600',
-    'c.1650',
-    'c.1680',
-    'c.17',
     'c.1720',
-    'c.1850',
-    'c.19',
-    'c.1901',
-    'c.1905',
-    'c.1910',
-    'c.1918',
-    'c.26',
-    'c.50',
-    'c.6',
-    'c.60',
-    'c.8',
-    'c.a.a.',
-    'c.a.b.',
-    'c.a.d.',
-    'c.a.f.',
     'c.a.r',
-    'c.b.t.c.',
-    'c.e.d.a.',
-    'c.e.g.b.',
-    'c.e.v.',
-    'c.g.st.d',
-    'c.g.t.',
-    'c.l.d.',
-    'c.m.',
-    'c.o.d.',
-    'c.p.m.',
-    'c.p.r.e.',
-    'c.p.verrijzer',
-    'c.perfringens',
-    'c.t.d.d.',
-    'c.u.s.c.',
     'c/00/22/0002',
-    'c/00/22/0003',
-    'c/00/22/0005',
-    'c/00/23/0036',
-    'c/00/23/0065',
-    'c/00/23/0067',
-    'c/00/23/0070',
-    'c/00/23/0072',
-    'c/00/23/0073',
-    'c/00/23/0076',
-    'c/00/23/0085',
-    'c/00/23/0091',
-    'c/00/23/0092',
-    'c/00/23/0093',
-    'c/00/23/2009',
-    'c/00/23/2027',
     'c/00/23/2037',
-    'c/00/23/2060',
-    'c/00/23/2062',
-    'c/00/23/2063',
-    'c/00/23/2065',
-    'c/00/23/2075',
-    'c/00/23/2082',
-    'c/00/23/2097',
-    'c/00/23/2113',
-    'c/00/23/2131',
-    'c/00/23/2150',
-    'c/00/23/2155',
-    'c/00/23/2167',
-    'c/00/23/2175',
-    'c/00/23/2180',
-    'c/00/23/2182',
     'c/00/23/2196',
-    'c/00/23/2199',
-    'c/00/23/2202',
-    'c/00/23/2208',
-    'c/00/23/2210',
-    'c/00/23/2216',
-    'c/00/23/2218',
-    'c/00/23/2233',
-    'c/00/23/2236',
-    'c/00/23/2238',
-    'c/00/23/2239',
-    'c/00/23/2246',
-    'c/00/23/2247',
-    'c/00/23/2248',
-    'c/00/23/2252',
-    'c/00/23/2254',
     'c/00/23/2255',
-    'c/00/23/2278',
-    'c/00/23/2286',
-    'c/00/23/2309',
-    'c/00/23/2315',
-    'c/00/24/2011',
-    'c/00/25/0009',
-    'c/00/25/0011',
-    'c/00/26/2066',
-    'c/00/26/2072',
-    'c/01',
-    'c/08/25/0002',
-    'c/08/25/0010',
-    'c/09/25/0003',
-    'c/ebp&bgr',
-    'c/h',
     'c/k',
-    'c/r',
-    'c1+',
-    'c10,200',
-    'c10.1',
-    'c112',
-    'c1600',
-    'c16:0',
-    'c1850-1918',
-    'c18:2n6',
-    'c1900',
-    'c1906',
-    'c19th',
-    'c1s',
-    'c2\'-endo',
-    'c21',
     'c2168',
-    'c291',
-    'c3+',
-    'c3800-es',
-    'c3d',
-    'c3po',
-    'c4\'-c3\'-o3\'-p',
-    'c4\'s',
-    'c50',
-    'c6+',
-    'c7+',
-    'c70',
-    'c90s',
-    'c92a',
-    'c94a',
-    'c=gb',
     'ca&iacute;dos',
-    'ca++',
-    'ca-ca',
-    'ca-dependent',
-    'ca-unicenter/325',
-    'ca-visual',
-    'ca11',
-    'cabalists',
-    'cabanatuan',
-    'cabarave',
-    'cabbage-white',
-    'cabbala',
-    'cabello',
-    'cabezas',
-    'cabin-top',
-    'cabinet-rank',
     'cable-carred',
-    'cable-knit',
-    'cable-like',
-    'cablecars',
-    'cablink',
-    'cabmen',
-    'cabobpurs',
-    'cabochons',
-    'cabourg',
-    'cabrach',
-    'cabriel',
-    'cabrisas',
-    'cabstands',
-    'cacatuoides',
-    'cacgtg-cyc1',
-    'cacheable',
     'cachexia',
-    'cacia',
-    'cacif',
-    'cacking',
-    'cacm',
-    'cacos',
-    'cacs',
-    'cacxatg',
-    'cadam-like',
-    'cadavre',
-    'caddock',
-    'caddocks',
-    'caddstation',
-    'caddyshack',
-    'cadeby',
-    'cademan',
     'cadenza-like',
-    'cadetships',
-    'cadfan',
-    'cadgwith',
-    'cadham',
-    'cadima',
-    'cadmore',
-    'cadomian',
-    'cadorna',
-    'cadows',
-    'cadstar',
-    'cadvance',
-    'cadwgan',
-    'caecilius',
-    'caedmon',
-    'caer-y-n\'a',
     'caerlanrig',
-    'caerleon-on-usk',
-    'caernarfen',
-    'caerwyn',
-    'caesarians',
-    'caespitosa',
-    'caf&eacute;-bars',
-    'caf&eacute;-concert',
-    'caf&eacute;teria',
-    'caf&eacute;ti&egrave;re',
-    'cafe/bar',
-    'caffeine-containing',
-    'caffeine-free',
-    'caffeine-induced',
-    'caffell',
-    'caftans',
     'cagoules',
-    'cagy',
-    'cahoun',
-    'caillau',
-    'cailles',
-    'cailli&eacute',
-    'caillou',
-    'caine/droitwich',
-    'cains',
-    'caiphas',
-    'caipirinha',
-    'cairenes',
-    'cairnbawn',
-    'cairned',
-    'cairnwell',
-    'cairo&ndash;luxor',
     'cairston',
-    'caister-by-yarmouth',
-    'caiston',
-    'caistor-by-norwich',
-    'caith',
-    'cajolingly',
-    'cake-shop',
-    'cake-shops',
-    'cakewalks',
-    'cal&ccedil;ada',
-    'cal-mac',
-    'cal-tech',
-    'cal.rptr.',
-    'cal/kg',
-    'calabash',
-    'calabashes',
     'calabura',
-    'calace',
-    'calam',
-    'calamitously',
-    'calanus',
-    'calas',
-    'calasanti',
-    'calata',
-    'calazans',
-    'calbiochem',
-    'calbourne',
-    'calcitisation',
-    'calcitonin-gene-related',
-    'calcium-binding',
-    'calcium-dependent',
-    'calcium-free',
     'calcium-sensitive',
-    'calcot',
-    'calcu',
-    'calculated-declination',
-    'caldons',
-    'calea',
-    'caledonide',
-    'caletti',
-    'calf-bound',
-    'calf-deep',
-    'calf-love',
-    'calgacus',
-    'calhau',
-    'calheiros',
-    'caliban.',
-    'caliche',
     'calico-derived',
-    'calientes',
-    'calierno',
-    'califano',
-    'california-berkeley',
-    'caliming',
-    'calisthenics',
-    'call-boxes',
-    'call-notes',
-    'call-off',
-    'call-signs',
-    'call/return',
-    'callachan',
-    'callas-like',
-    'callboxes',
-    'called\'',
     'called-in',
-    'callias',
-    'calligraphiae',
-    'calliphora',
-    'callixtus',
-    'callserver',
-    'callywhite',
-    'calme',
-    'calmette',
-    'calmfors',
-    'calorflame',
-    'calorgas',
-    'calorie-crammed',
-    'calorie-low',
-    'calorie-supplying',
-    'calorie-wise',
     'calorimetrically',
-    'calphurnia',
-    'calqued',
-    'calreticulin',
-    'calsequestrin',
-    'calster',
-    'calumkill',
-    'calvaert',
-    'calvario',
-    'calverts',
-    'cam&eacute;es',
-    'cam/gloucestershire',
-    'camacu&aacute',
-    'camadale',
-    'camaguey',
-    'caman',
     'camara/reuter',
-    'camarade',
-    'camasunary',
-    'camay',
-    'cambers',
-    'cambien',
-    'camblets',
-    'cambo-les-bains',
-    'cambr&eacute;sis',
-    'cambrensis',
-    'cambrica',
-    'cambridge-blue',
-    'cambridge/rsa',
-    'cambridgeshire-based',
-    'cambus',
-    'camcord',
     'camden-based',
-    'camel-like',
-    'cameleopard',
-    'camera-gun',
-    'camera-original',
-    'camera-originals',
-    'cameral',
-    'camerounians',
-    'camerun',
-    'caminos',
-    'camlachie',
-    'camley',
-    'camming-device',
-    'camp&rehy;survivor',
-    'camp-agonist',
-    'camp-crp/cytr',
     'camp-following',
-    'camp-grounds',
-    'camp-inducible',
-    'camp-responsive',
-    'camp-sensitive',
-    'camp-stools',
-    'campan',
-    'campanologists',
-    'campbell-fisher',
-    'campbell-lamerton',
-    'campbell-preston',
-    'campbellpur',
-    'campeche',
-    'campervan',
-    'campestre',
-    'campiglio',
     'camping-place',
-    'camping-stove',
-    'camponovo',
-    'camporese',
-    'campsbourne',
-    'campton',
-    'campus-wide',
-    'camuccini',
-    'camulodunum',
-    'can-but-wo',
-    'can-run',
-    'canac',
-    'canaille',
-    'canal-like',
-    'canalizations',
-    'canarium',
     'canary-coloured',
-    'canas',
-    'cancellation/curtailment',
-    'cancer-box',
-    'cancer-like',
-    'cancer-related',
-    'cancer-sufferers',
-    'cancver',
-    'candela',
-    'candelit',
-    'canderbill',
-    'candidness',
-    'candillier',
-    'candle-sticks',
-    'candleland',
-    'candy-coloured',
     'canework',
-    'canfuls',
-    'cani',
-    'caniggia',
-    'canine-tooth',
-    'canings',
-    'cannabinum',
-    'cannabis-like',
-    'canner',
-    'canneries',
-    'cannibis',
-    'cannier',
-    'cannisters',
-    'cannizaro',
-    'cannon-fenske',
-    'cannonbury',
     'cannovan',
-    'cannulating',
-    'cannulations',
-    'canoeable',
-    'canofile',
-    'canoga',
-    'canonisations',
-    'canonistic',
-    'canonizations',
-    'canonizing',
-    'canorus',
-    'canotech',
-    'cant&eacute;yodjay&acirc',
-    'cantacuzenus',
-    'cantamus',
-    'cantarists',
     'canteiro',
-    'cantelli',
-    'canticum',
-    'cantidio',
-    'cantillation',
-    'cantinas',
-    'cantonale',
-    'cantonization',
-    'cantrail',
-    'cantuar',
-    'cantuariensis',
-    'cantyre',
-    'canvas-topped',
-    'canvass-returns',
-    'canzonet',
-    'cap&rehy;tured',
     'cap-trigger',
-    'capabili&rehy;ties',
-    'capaciousness',
-    'capax',
-    'capello',
-    'capercailzie',
-    'capie',
-    'capiendo',
-    'capillarisation',
-    'capillipes',
-    'caping',
-    'capino',
-    'capistratus',
-    'capital&rehy;intensive',
-    'capital-',
-    'capital-gains',
     'capital-importing',
-    'capital-output',
-    'capital-owning',
-    'capitalcard',
-    'capitalist-imperialist',
-    'capitalization-based',
-    'capite',
-    'capitols',
-    'caplen',
-    'caplow',
-    'capmd',
-    'capnuts',
-    'caponigri',
-    'capponi',
-    'cappucino',
-    'capraia',
     'capriccioso',
-    'capricorni',
-    'capsicastrum',
-    'capsticks',
-    'capsular',
-    'captaincies',
-    'captivator',
-    'captivity.',
-    'capucci',
-    'capurnicum',
-    'caque',
-    'car&iacute;as',
-    'car-auction',
-    'car-body',
-    'car-dominated',
-    'car-exhaust',
     'car-induced',
-    'car-load',
-    'car-mad',
-    'car-pool',
-    'car-radio',
-    'car-rental',
-    'car-seat',
-    'car-tool',
-    'car-type',
-    'car/ferry/car',
-    'cara&iuml;be',
-    'carabao',
-    'carabidae',
-    'caractacus',
-    'caradhras',
-    'caradog-jones',
     'carajo',
-    'caramate',
-    'caramelisation',
-    'caramelo',
-    'caransebes',
-    'carapa',
-    'caravaggian',
-    'caravanette',
-    'caravanner',
-    'caraven',
-    'carbamylation',
-    'carbide-tipped',
-    'carbolite',
-    'carbon-black',
-    'carbon-coated',
-    'carbon-impregnated',
     'carbonate-rich',
-    'carbonatitic',
-    'carbonell',
-    'carbonium',
-    'carbonni&egrave;res',
-    'carboplatin',
-    'carboranes',
-    'carboxylesterase',
-    'carboxymethylcellulose',
-    'carbrook',
-    'carbuncular',
-    'carburisation',
-    'carceral',
-    'carchemish',
-    'carcinomata',
-    'carcinus',
     'card-issuer',
-    'card-sharper',
-    'cardboard-backed',
-    'cardboards',
-    'cardiaca',
-    'cardies',
-    'cardif',
-    'cardiff-wales',
-    'cardiff6',
-    'cardiganed',
-    'cardinal-archbishop',
-    'cardinalfish',
-    'cardine',
-    'cardio-thoracic',
-    'cardiographer',
-    'cardmembership',
     'care-call',
-    'careership',
-    'carefoot',
-    'carefreeness',
-    'carefully-applied',
-    'carefully-controlled',
-    'carefully-cultivated',
-    'carefully-penned',
-    'carefully-placed',
-    'carefully-prepared',
-    'carefuly',
-    'carers.',
-    'caretake',
-    'carette',
-    'carevision',
-    'carfully',
     'cargonja',
-    'caridad',
-    'caridi',
-    'caridia',
-    'carillons',
-    'carinas',
-    'carination',
-    'caringly',
-    'carington',
-    'carinhall',
-    'carinoma',
-    'carios',
-    'cariosus',
-    'carivalis',
-    'carjackers',
-    'carla-marie',
     'carlberg',
-    'carles',
-    'carleton-greene',
-    'carleton-in-craven',
-    'carlite',
-    'carlota',
-    'carlsen',
-    'carlstadt',
-    'carltons',
-    'carluccio',
-    'carmi',
-    'carminative',
-    'carmine-red',
-    'carna',
-    'carnarfon',
-    'carnbane',
     'carndonagh',
-    'carneddi',
-    'carnes',
-    'carnhill',
-    'carnica',
-    'carnival-time',
-    'carnmenellis',
-    'carnotaur',
-    'carolans',
-    'carolinensis',
-    'caroomed',
-    'carotenes',
-    'carotenoid',
-    'carow',
-    'carp-like',
-    'carpano',
     'carpathia-tisza',
-    'carpentaria',
-    'carpers',
-    'carpet-baggers',
-    'carpet-retailing',
-    'carpetings',
-    'carpetless',
-    'carpettes',
-    'carpetworld',
-    'carpow',
-    'carpozi',
-    'carrabus',
-    'carrad',
-    'carradice',
-    'carraig',
-    'carraro',
     'carree',
-    'carrers',
-    'carrick-on-suir',
-    'carricknowe',
-    'carrig',
-    'carrigeen',
-    'carrions',
-    'carrisbrooke',
-    'carrock',
-    'carron/mrs',
-    'carrot-',
-    'carrot-and-stick',
-    'carrot-haired',
-    'carrot-like',
-    'carrot-topped',
-    'carrousel',
     'carrus',
-    'carrville',
-    'carryback',
-    'carrycots',
-    'carryin',
-    'carryings-on',
-    'carrys',
-    'carrytot',
-    'carsfad',
-    'carslberg',
-    'carsley',
-    'carstein',
-    'carswalle',
-    'cart-tracks',
-    'cartboy',
-    'cartelisation',
     'carter/probation',
-    'carter/trading',
-    'carterets',
-    'cartermill',
-    'cartha',
-    'carthagena',
-    'cartiers',
-    'cartmell',
-    'cartooned',
-    'cartoonesque',
-    'cartoonish',
-    'cartright',
-    'cartshed',
-    'cartularies',
-    'cartwheel-sized',
-    'carucates',
     'carvalhal',
-    'carvalhas',
-    'carvalhos',
-    'carvallo',
-    'carving-knife',
-    'carying',
-    'casambre',
-    'casaneva',
-    'casby',
-    'case&mdash;so',
-    'case-definition',
-    'case-detection',
-    'case-hardened',
-    'case-manager',
-    'case-officer',
-    'case/does',
     'caseifici',
-    'caselli',
-    'caser&iacute;o',
-    'cases/100000',
-    'cash-balance',
-    'cash-hit',
-    'cash-out',
-    'cash-positive',
-    'cashout',
-    'cashtill',
-    'casler',
-    'caslin',
-    'cason',
-    'casques',
-    'cassat',
-    'cassen',
     'casserley',
-    'casseroling',
-    'cassette-recorder',
-    'cassette-recorders',
-    'cassidy/crematorium',
-    'cassidy/thames',
-    'cassin/mayor',
-    'cassivellaunus',
-    'castaic',
-    'castalian',
-    'castanea',
-    'castaneda',
-    'castaspermine',
-    'caste-like',
-    'caste-ridden',
-    'casteels',
     'castellain',
-    'castellanos',
-    'castellany',
-    'castellina',
-    'casteratie',
-    'castiles',
-    'castillane',
-    'castille-le&oacute;n',
-    'casting-on',
-    'castiron',
-    'castle-palace',
-    'castlefields',
-    'castlegregory',
-    'castleham',
-    'castlehill',
-    'castletroy',
     'castlewilliam',
-    'castner&ndash;kellner',
-    'caston',
-    'castored',
-    'castoriadis',
-    'castratie',
-    'castrator',
-    'castratos',
-    'castro-designed',
-    'castronery',
-    'casualties.',
-    'casuarinaceae',
-    'casuistic',
-    'caswall',
-    'cat-called',
-    'cat-equipped',
     'cat-in-the-hat',
-    'cat-piss',
-    'cat/lamp-post',
-    'catafalques',
-    'catala-roca',
-    'catalogues.',
-    'catalyst-equipped',
-    'catanzaro',
-    'cataphoretic',
-    'cataramie',
-    'cataria',
-    'catastrophising',
-    'catastrophizing',
-    'catavi',
-    'catbells',
-    'catch-water',
     'catchall',
-    'catcliffe',
-    'categorially',
-    'categorisers',
-    'category-judgement',
-    'catenaccio',
-    'catenians',
-    'caterbase',
-    'caterclub',
-    'catering-equipment',
-    'caterpillar-like',
-    'caterthun',
-    'cathair',
-    'cathan',
-    'cathectic',
-    'catheterization',
     'cathi',
-    'catholic-irish',
-    'catholic-owned',
-    'catholic/protestant',
-    'cathos',
-    'cathouse',
-    'catja',
-    'catling',
-    'catnapped',
-    'catoplebas',
-    'catspaws',
-    'catsy',
-    'cattan',
-    'catterton',
-    'cattin',
-    'cattle-drovers',
     'cattle-fever',
-    'cattle-keepers',
-    'cattle-lifters',
-    'cattle-raising',
-    'catulus',
-    'catumarandus',
-    'caudillismo',
-    'caudle',
-    'caught-and-bowled',
-    'caughter',
-    'cauldhames',
-    'caunes',
-    'caur',
-    'caures',
-    'causae',
-    'causalist',
     'causativity',
-    'causebrook',
-    'causers',
-    'causeth',
-    'causevic',
-    'caut',
-    'cavaletto',
-    'cavall',
-    'cavalry&rehy;men',
-    'cavani',
-    'cavaradossi',
-    'cave-dwellers',
-    'cave-exploring',
-    'cave-mouth',
-    'cave/particle',
-    'cavendishes',
     'caveys',
-    'cavia',
-    'cavina',
-    'cavvies',
-    'cawder',
-    'cawdwell',
-    'cawla',
-    'cawte',
-    'caxito',
-    'caxtons',
-    'cayce',
-    'cayhowell',
-    'cb5',
-    'cb8',
-    'cbos',
-    'cbot/cme',
     'cbr6oof',
-    'cc-m3',
-    'cc3',
-    'cccb',
-    'cccccc',
-    'ccds',
-    'ccgt',
-    'cchc',
-    'ccj',
-    'ccjp',
-    'ccjs',
-    'cck/l',
-    'cck8',
-    'ccmc',
-    'ccontents',
-    'cd&mdash;centre',
     'cd-1',
-    'cd-based',
-    'cd-emx',
-    'cd-only',
-    'cd-sar',
-    'cd18',
-    'cd19',
-    'cd2/lfa-3',
-    'cd20',
-    'cd25+',
-    'cd3+',
-    'cd44-immobilized',
-    'cd45+',
-    'cdc10',
-    'cdcp',
-    'cdd521',
     'cdhr',
-    'cdhrnc',
-    'cdna:rna',
-    'cdos',
-    'cdre',
-    'cds&mdash;democratic',
-    'cdu/csu/fdp',
+)
+
+blocks_42 = (
+    '&%malta&&office&&shocks&\'theatre%&births%"no#!s$!.""uu!*g&egrave;d"%/agcl#"ct"!2"!3"!8',
+    '##in-%$sthe##lev#$paki$#ios#"rd%!e$$iste$$tala$#wal#"ss%$izii#&vaceae"$beka$#tra',
+    '""ca#!t""de"-e-appropriate$)dependent%)ifference$)migration$-participation%$eers$)selective&"ts%*pecificity$(weighted%#ise#%/wage',
+    '#(lessness$#ong#*nce-france%"ia%*y-supplied$#tic#&rholme#&silaus"%gater##ers#(ghhhhhhh#)lomerated$)utinating#1regates-intensive%)ssionists',
+    '$(o-leader"(hagallon##ras""il$"is#!m$"us#$sted&!r#)t-poppers&\'roperly"&litter#%ycone&%sidic"%nates',
+    '##eau$#sey$"ws#&ieszka#)ostically"$onia%%sings&!m#"od#(r&aacute#(stinelli"%p/ebp"#ram#+ee/disagree%(ableness',
+    '%,mentappendix$&gation#&i-food$/cultural-botany*)e-related+!/,,conservation+!s$!o%!n%&stomum#,o-industries$#cin$\'nomique$$soke',
+    '"!s"(uardente#&echeek##ila#&zarova""vs"%yrium!%h-100##hah##ing"%1/ah2"#ani#!u"$ead\'$#rne',
+    '"#hed"$ilya"#lan#$burg#!e#$gren#%okoba""ma$#dou#"er#$idou"&oghill"#ram#%enson##ons',
+    '#&ngalla#(ra-mazda"#woi!\'i-ideas#\'workers"!7"!9"$admk#!i"$bmac"\'chbauer"5d-for-economic-reform$&giving$(to-india$%users',
+    '#(e-memoir$/_m&eacute;moire$%z-moi#*s-stricken&(ufferers"$ee-e##llo"&galeos#&uilles"(iiieeeee"#lbe#\'een/the$!u##len#"sh',
+    '"+m-inhibited"+nsworthians"#oli"&padass")r&ndash;1#!\'#%-blue$%cored$$drop(!s$)freighted$)gargoyles%#uns$$hole&\'stesses',
+    '*!s%#ift&#nes$&minded%%obile&(nitoring$&o-bian%\'perator$&pistol%#ump$\'quality$$sick($ness%%paced%%trike',
+    '##/5%##car$%rafts#$dale$$rie1#,e-sur-la-lys$%dales$!x$&yholme#-idh-ghuairidh$#ngs#(lessness$$inks#$mass#*orhynchous',
+    '$%space#$pack$%istol$,ort-security#&screws$#ick$&trikes#&tronic"%satsu#!b#%chin.#%satou"+tken-walker&)/daughter#!o',
+    '##zaz"\'x-based"&yepeku"$zawl#"ik!"j6""ag##nta#"zi"!c"$irno"#mer"%udged"$waad!#k2b',
+    '#&mantis%#tsu#$rana$"it$\'nanians"\'eakamai#!d#$rele#!y""fm"(halkatsi%$waya#&enaton#%naten"#iba',
+    '"%meyon"$raka"#sar#"el#!u"1tiengesellchaften"$uoko##zum!.l&rehy;zahrani"\'-abbadi\'!s$$hmed$%khbar$!n%$sary',
+    '$$tasi$$youn#$bira&#uni$&ukhari%%rsawi#\'chalabi#&dughmi#\'fayturi#\'ghazali#\'hachani%$nafi%!q%$rash%$tash',
+    '$"ol$&usayen#%jasim%#yfi%!z$(umhuriya,!h#\'kata\'eb%$zara$%habar&#ter&%zraji%$oury%(urayshah$$ubra',
+    '#\'maalouf%$dani%%halli%#lik&"ki%$nsur%%thami$)ubayyidin%$hsin%%khtar#&nafeer%)kshabandi$#ida$$ouri$#usf',
+    '#%qa\'ud%\'dhadhfa&!i&!r%%iwain%%ssimi%$tabi#&raguib$$ifai$&umaneh#\'sakhawi%#lam&"eh$%ha\'ab&%nfari',
+    '%%uhumi$$udan%$ghra%&haymat#)taftazani%$mimi%#wil$-er-nan-the-ra$%halth$%urabi#&uraybi$#sta#$waad%$hhab%#zir',
+    '%$ssin"!4"!7"(a&iuml;a#0-pro-gly-pro-arg#*bama-based&$ians#%chlor##mao#"ne$(ine-rich$!n$"us#%skans#"ta',
+    '##uda$&ngpaya##ysi#$zeir"%badou$&looshi$$nese$$vera#%ellus$$rcio%"di%#ico&"go%"ni%%stein',
+    '%$tans##ida$#zia#!o$$rado%$ough#$rite#&uginea$"rt##yns"0cal&aacute;-meco$+tel-alsthom##edo#%holic#"ms',
+    '(%based($fast$!n$$reza"#day##ega$(rmarston%,sey-williams&)hot-based#$h2*1##ina%$gham#"os$,us/wiltshire#\'ringham',
+    '#$ward$"yn"&e-cups$\'masters#%ading$%toric#"cs#&inikov#"ke$&sandra%$eyev%!i&!i#\'mannish$!u',
+    '#$sius$%kerov#(tschhorn$"ti#$vels#%wives#0xander/organiser*%women\'%rians)"um$"ie$%sandr%#eva"(fa-romeo$%rista',
+    '##oat#$reds",g&eacute;rie#$abid$(e-filled#%emeen&#ine$#nib#%icide$!e#&oflash$%nkian$"x\'"#ha8$#zen',
+    '"$iane#0ce-in-wonderland#)enability&%tion.%"ee%$ness%"or##gue##ker#)mentacion("ri##nak##pui#&sdaire$#han',
+    '##tex#"ya"\'jathaab")kali-rich&&nities)"y.$%nones$%thene$$wari#\'ibiades$"es#!o"+l-assessing%&t-once$&bright',
+    '$&carbon%,omprehensive$+determining$)enfolding$)forgiving&#urs%$ruit$.girls-together%\'raduate\'"ss&"ey$\'hallows%&earing%&ighest%$uman',
+    '$&member$(original$*persuasive%+rofessional\'&vident$%ranks&#vel%$oach$&smiles%%ports%$teel$;things-bright-and-beautiful+*considered%+oo-frequent(\'present',
+    '($rare)$eady(&simple($well$)ukrainian$+wheel-drive#(_at_once#$amah%!i$#nby%$tois$%rdice$#zon#$butt#&church',
+    '$#ord#\'deridge$&igital#\'egedley%\'orizers%&rettos$"in$%luias$%magne$)n/witness%$town$,rgy-screened%\'shausen$&sandro%\'sandria',
+    '%!t$"xr$&z-vous#$frey#+igator-skin%#han$%nsons$#ott$\'s/widow%)s/brother\'$wife&"es$#ums#$mann$#ole',
+    '##oca&#ble&%tion.%&entric$"ds$&geneic\'#ous$,immunisation$%pathy%$hony%&lastic$-tment-holders)#.it##red#&seater',
+    '##uph$&sively#&wright"%magro$&il.fil$%ktoum#$eira$"lo$%ndros%#ial#$inio#"on%&d-eyed&"s.\'#ide',
+    '$\'st-dead\'*impossible((nvisible($rish\'#new&#_as#%qvist"%nager##ess#!o"*ogoskoufis##nim"%p\'roc#%-horn#!e',
+    '%&-adria%#hof%$inox$#ter#+ha-blockers&(compiled&+fetoprotein&%romeo%$/osf%#eus%-herpesvirinae$$ekka#%illes$&nesque%!o',
+    '"1ready-established($read(%tight$#was#$igh%"%sands#$berg"#t+2$!p$(spacebar$#tab$!u#\'ar-boys&\'frontal&&pieces',
+    '&%steps%"is#\'enbourg%"er%#how%%markt$%rable&2tions/improvements%&nances(!s%"um#$graf##ho\'$#ugh%(sserians',
+    '#&itude.#$mark#*nacealgach#(ogethery$#ona$%s/sco$$vise#"yn"(uminimum\')um-framed*$rich)\'/carbon&)osilicate\'"us$"na',
+    '$+y/edinburgh#"io#%scott""wa$$lton$#yth#"ey"%yakkh#"ce#!d#&mphoid#%sardi"%zenau!.m&eacute;ricas-!o',
+    ')$4.00+"30)$5.30""-5#$dram"#/am"#200""42#!3#!4"&abalis$$ilis#"do#&haggar#(lgamates',
+    '#$ndry$#ita$#uel&%nsing##oui#(p&aacute#&ravati%!y$"et$$illo$$nath#$sses#*teur/video\'"s.$$hila',
+    '#)zon-based\'\'centred&"ie"*baziensium#(er-brown&$eyed%#ola%%stone%$yarn#&iences&"te$#gua$)tiousness#\'leteuse#(oinensis',
+    '%$seys$%osian#!u$%lacra&$tion"&chitka##its"#del"#eca#"da#$gboh$!o#(lanchier$&chenko$#ung',
+    '&"ly$(ity-wise##ral$"ce$"ic&/a&sol;caribbean\'#ine\'!l\'(n-indian*&talian)\'russian)\'trained(#ese&!o%$pass',
+    '$#het"#gen"%haras"(icabilis$$orum#"da$\'ostomum#"ee#$lcar#$nata&#ion$"co$$gton$*o-terminus%)peptidase',
+    '\'!e##ram%$ntes#$ssae#\'tyville"$leto"!m##ani%!n$)rn&auml;s#!c#"er%$bach$$ters#&omanes',
+    '$&perdix$#unt"\'nerican%&sfield$%siacs%#tic#&iyat-e#"on$#sia"$o-te##dio#\'ebocyte&"id##ita#"ra',
+    '$#ges$"in$%tises#)xicillin/""p.#%/hour#%ed-up$"re%\'ometric#)hibolitic%\'ctyonic%%lepis&%ophus%$oxus#+le-bottomed',
+    '%+fier/filter*\'speaker%#taq#*s/cabinets#!y"%schel#&ivarii"%thaal")undeville#(rricanes#$thed"&ygdala#!s!.n&aacute;lisis#+oacute;rien',
+    '""20"(abarites#%capri$$reon#$dall##gen#$hita##kim#%lects$1gesia/anaesthesia$%ogist\'#zes&*ue-digital$.ysed/consulted&*is/algebra',
+    '%.tico-synthetic#%nieva#%paest$#ril##rak$#ch.#%sleen$$pida$&tasios%%omose*!s#*thematized#!u#%xilas"#bar',
+    '$%ndant#-hor-decorated&(/ballast&$itic&%woman%#uey$&uranas#(ientness"(d-a-half$"oh#2_,_and_,_and_so_on*(so_forth$"as$,er_and_so_on\'%so_on',
+    '%#ven$2so_on_and_so_forth#(ahuaylas#+ean-centred$$neas$*rson/chief##ing#*ouillettes#*r&aacute;s%/eacute;-charles$"ai%#ssy$#e1e%$etti%&ievich',
+    '%!n%#son%\'ws-born(%speed\')/campaign$1iano&eacute;lison%"en&,v/haralambie%"ja$)ocentrism%%genic*#ity%$logy#!u#"ze',
+    '#"ka#\'nometer#\'rkannte$#ood"%fibio#$rage".g&uacute;stias#!.#"as#$band#\'el-like%&ergues&\'s-style\'\'isation%\'opoulos',
+    '##hui#$inal$&ogenic%(plasties$$stri#$jeli#$lain$)e-bending%%rfish%"s.$!i%%canae%)n-jarrett$)o-america\'*rgentinian',
+    '&(canadian.!s&(hellenic\'(ungarian&(irishman&%jewry&\'nubians&)palladian&,scandinavian&\'turkish%)/american%\'centric%&phobes)"ic#!o',
+    '$#ran#"ra%"-1$"ez#$sana#(uishedly(!s$(larities"\'hedonia#\'idrosis#*ydrobiosis"$iane#+madversions)!t*"ed',
+    '\'&headed*#lth\'(watchers&$cule&#ism&(s/plants%!m%%teurs#+on-exchange#\'somycin%%pliae$"sa$"ul"#juu"&ketell',
+    '&%jacks%$/arm&$foot"#len"*n-thennath#\'a-liisa%%maria$*dale/queen$\'gannihy%!h&&martin&#one$#lee%%ibera%#ong',
+    '$#tto#(e-imelda$$grit$"ke$$lies%!l$(s-on-sea$#tta#$ider$%e-pod##oni$%tates\'"or$"wn$(yingness',
+    '#%uaire%$lly.$&itants")o-genital$&rectal#!a##dic%&sation#\'estrous#"le#)malocaris#)phthalmos#&rectic\'"um%\'xically',
+    '#$smia##tec$$her\'"#rep""sa$"tz#*ch&uuml;tz#$dell#"ei$!n$\'rinaand#$ford##kar#$orge#*tey/farmer',
+    '%5uther-gough-calthorpe#!w$%ered-\'!s&\'ing.but"+t&ocirc;nio#&-eater$$hunt#(agonizes$#ios$#kya$#lya$!o$\'rcticus#\'e-dated',
+    '%$hall$!d$$lyas$$zana#%hemis$&oceros%#lin&&ogists%(ny/owner\'!s%)zoan-like$%robus&%plogy\')ocentrism($idea',
+    ',!y)%phere#0i&rehy;immigrant*&social$.-abolitionists&(esthetic&&frican&&nginal\'*ti-smoking)&racism&%quino&+ristotelian&&siatic&$wami&#xis',
+    '&$fass&)olsheviks($ters&+ureaucratic\'&siness%&caking\'(lvinists&*d45-coated&(eausescu&$lass*$ical\'&imatic)$bing\'$ough&+ollectivism',
+    '\'-nservationist\'-rrectionalism\',unterfeiting&%redit\'&iminal&$uban\'"lt)$ural&\'yclones\'(tochrome%$damp&(emocrats\')portation\'+volutionist&%isney',
+    '%\'ecology\'(umenical&*ducational&"ec&*galitarian&&litism&&metics&(njoyment&%rshad&&scobar&)uthanasia&)verything\'*olutionary.#ist&(xecutive',
+    '%)falangist&*ederalists&#ree)(-radical\'&iction\'#own%(gambling\'\'rotting&#oat\'%lfers\'\'rbachev\'*vernmental&"st%%habre(%sburg',
+    '\'(rassment&!c&*eadhunting\'%bbian\'$roin&+ierarchical\'$tler&(obbesian&+ypertensive%)idiotypic&"gg&+mperialists&,ndividualist\'(ternment&"ra',
+    '%*jewishness%*keynesians&$nife&#urd%"l1&\'andlord\'$wson&&ebanon\'\'ukaemia&$fa-1&"og\'%raine(!d&#tte%%mac-1',
+    '\'+terialistic&)eskhetian\'*taphysical&"ig(%raine\'(litarism\'+tochondrial&*onarchical-#sts(#ist%)nasserite\'-tionalisation/"ts()uralistic\'$zism',
+    '%*p-cadherin&"53&#ain\'\'triotic&%igeon\'"tt&%laque&(olitical,!s\'"or\'(sitivist&,rivatisation\'(otection)%ozoal%,racketeering',
+    '\'#p30\')tionalist&%eagan\'&former&$ight*#ist&\'oyalism&&ushdie%)sceptical\')histosome\'\'rewworm&&easick\'"lf&#hah\'#ine',
+    '\'"ul("th&\'pending\'%irits&\'tanding\'$okes&(ubirachs\'&chinda\'(ffragist\'(ggestive\')nningdale&$wapo&)yphilitic%(tactical&%issue',
+    '\'$ries\'$xins&*rusteeship%&ulster&$rban%&vandal\'!t%%welsh&$ilko&(oodville%$xxxx$(abortion%$ctin%\'ircraft%*lbuminuric',
+    '%&uratic$(biotics.+*/cortisone%,ody-envelope$\'christs%\'ipated.%)oagulated%\'yclones$&fibrin%\'oulings$.gen-presenting\'%icity%,ravitational&#een$\'heparin',
+    '%-ypercalcaemic$#jas$+metabolites%,itochondrial%,ycobacterial$*neoplastic$)oestrogen%(quiensis$(papalism&\'rasitic&#xos%)eroxidase%$odal$*que-dealer$\'science',
+    '%#ens$+tachycardia%(errorist%%hetic#+oine-joseph$"ky$$nova%%ymous$&rbital$"un##ram#*werp-based\'!."%umber#!p',
+    '#$tkan"#wen"%y-way#"bo%!d#!o$\'n/diver%"es%!s#%place#&thing-#"wa$"he%&ithers"$zola',
+    '"!k"#p.9!+p-navigator"!0"%1-88s"!3"%ache.#(navicius#"ra%"to$,t_apart_from%&ments.#%stron#)th&eacute$$ites',
+    '#"k1$%3src1"(e-keeper#!h#$like#*r&ccedil;u$%ients%(odically%\'stalsis%$tivo$"ta##sco"&hasias#$elia&"on',
+    '#+oristically"%icius##lco##on.#%stles#%top-f#%vorus""me"#o-c#,calyptically$%ritan##lda$$gies$+ipoproteins$+lo-dionysus',
+    '$+ogetically.&$ies.&"y.#&static(#sed%(rophizes#\'tropaic#&werful"%parao&!t\'!s\'#us.#)eal-court%$r_on&%ences',
+    '\'!s$%lgren%#lee$1nzell-innerrhoden)"er$#tit\'"e.\'%ively&$zers#"io$"us#*le-blossom&)flavoured&&novell&#red',
+    '%-/ibm/motorola%0ford/oxfordshire%$macs%!t&.on/oxfordshire$\'icants.\',tion-linking,)messaging+$link+)s-related-(specific,!.&$tion$"y.#*oggiaturas',
+    ')!s%&tnemnt$#llo%!o$&sitely\'#ive#$peal#!r$"ec&&iators%(hensible$\'oached.%&praite\'.iately-trained*&ionist',
+    '%)ve/reject\'*d/rejected"*r&ndash;31#+a-dominated$(dakshina#&icocks$+l&mdash;may&(ndash;15,!2-!3,!8%#-15&"21\'!2&"30',
+    '&\'october&)september%%/june##kov"%s/psa#!g")tenodytes$&rygote#%horpe"#x-4"\'yrexial!"q7"!j")ua-tronic$&_vitae',
+    '$$land$%plane%#ore$#rio&)um-raised$%ticum$$zorb#\'i-terme$$dens$%laria%#ina$&sition!2r&eacute;ol&eacute*%thuse"$-are',
+    '"!1"#614"0ab&mdash;israeli%,ndash;jewish$%-arab%)dominated%&israel$!a$+ic-language%%ensis$#sat#*chnoiditis#&gnetti#$hura#!i',
+    '#&neidae$\'gements$$ibar#!r#!s$"ak#"ti#\'ucanian#&valley""ba$&bidine#*eiderparti%#ter#(itrament\'*ry-seeming',
+    '(%or(s)#$onia$\'rescens&"um%,iculturalist,#ist#"re#!s")cade-type%"io$$nest#1h&auml;ologisches$+-chancellor%%demon&#uke',
+    '%&priest%#top&-raditionalist%(villains$!.$$aeal&\'logical*#sts)!y&*oastronomy\'%logy.%"rd$*bishoprics$*chancellor$(eologist',
+    ')#ing(#ure%#ve\'\'!r$$mage$$ness$#tec##min##net#+tic-alpines&!s$*ostaphylos#$ueil"%dalan%"es',
+    '#%blair#"ea$$evan$$nlee%!s##ito#$mair#%sheil"#ea.$\'s&ndash#$cibo$#ord#&ktenje#(ls-felco##nae',
+    '$!d%#rup$#ite#!r#%strup#&tology#$valo"#fer"+g&uuml;ello#"42#%entan\'#ria&#ino)!s&"um',
+    '$"ns#"ov%$ians#\'uaments$"e.%!r$$soft"$hens#"us"*i&ntilde;o#%achne$$dnum$#rch#%dness##ele',
+    '#%llate##se.%"s.$#tar%%otles#-thmetic-logic*#ian##ved#&zonans"%kanas#&endale##ins#$lone#!u""la',
+    '##ena#&idgeqc$#nda$!t"+m&eacute;es#)-flailing$$like$$pits$\'worship##600$"10#%agard&!s%#han$$nino',
+    '$%tures#/enian-inhabited#$ifer$#jas$$shir$*tage-smith$"ya#$onia&#che$%rique#/s-manufacturing%\'related%%sales$"by#+y-sponsored',
+    '"$nall$!o$*ud-raymond#+old-forster$"ul#%sberg#"un""oi$"ds#"le##ma.#"on$#seh#!u$!n',
+    '"*p&aacute;d##els#"in##ley"%quata"*raignments$\'ngiarsi%!z$"ta$&y/6000#!c#%ecife$#gui$!s%#ter',
+    '&"s.#*henatherum$$izus$,ythmogenesis#%iccio$%ndell$&ved-at&"rs%%istes#,ondissements$&wcraft"\'samenes##del#,enal-norwich%+ic-poisoned',
+    '&#ous&"te##ked#\'lanagic*%/aged#&on-hit#\'y-versy""t\'#%-crap$,historically$&lovers\'#ing$#pop##ajo$&khaies',
+    '#+efact-based)%types(%ually$"li$#mio&)s/anahita%"us$&rially&%ogram$#sia$%veldt#\'hington$%ouses$&ritics%\'ophytes',
+    '(#phy#%ibeus$%chaut%#le*%*ulationist$!e$\'fically\'(ial-snow$\'llerist$+st-ministry&&/model&!i\'"co&/s/photographers$"um',
+    '#$wank#!z"%ugula#\'nasalam#"ps"#vac$&nitaki#"id$"ka$!n#!n#!o"&wenack"\'yballoi(!s',
+    '"!z#&achena#"ew!*s&amp;sub2#2oacute;0p&oacute;s"0-and-when-needed#%built#"is##new#\'siyayli"".6$!s#!7"*/400-based"!1',
+    '""22"(_as_well#2far_as_,_as_far_as*,er_as_far_as#4soon_as_,_as_soon_as""af#&nbayev#$phid".bestos-bearing)*containing)$free"#c11#$alon#*h2&ndash;3#\'ii/ansi',
+    '##ona"#dex#"ir"&easyas#!f#%ismic#$vedo"#faw"/gr&iacute;msson"&h-gold$\'stained$%trays&"ee##arq$#yer',
+    '$#one$)y/organic#,down/liberal#$eham$$lman$$rson$%ville#$fold%-rd/transplant\'!s##ish$"ya#$kirk#$mall$%unein',
+    '#(tadhyayi%)r-chemosh$-on-under-lyme&!s#*wellthorpe"\'i-ayone##ana#"tz""jp"(k/ingres#"13##ern#"in"&lanian#%evels',
+    '#%antas#$inas"(n102(co)##ier&,es-sur-seine"(ociation#&lectin#%matos"#p72#"al$$tial##ens$#rum$#tic#(hyxiates',
+    '&%stras$(rin-like\'$ated#*leniifolia$"in"$rama"(sadollah$$maka$"ne%"te$(ssinorum$$yers%#ist#.embl&eacute;es\'+er-language',
+    ')\'/linker$*nt/dissent&#ors$$reto%$ters$\'ssment/+*evaluation,*xamination$$t(s)%&-price&(stripped%"s.#/ign-output-file$6milation-accommodation)"or',
+    '$$nger$!s%%itant%+tant-keeper*\'manager)!e#+mannshausen#\'ocation%%iable\'\'tedwith("on\'%zione&&cation#"t.#&ualted',
+    '$%mably$$ncao%"ta$-rance/quality"+teroid-like#)henospere#$olat$(n-martin&*on-carrant%\'/action&+oxfordshire#$rada%"ea$%icles%#lly',
+    '&!b&!c%(chemical&$ytic%$gaze%)logically%\'nautics&$omia)"ca%\'stereon%*zoologists$"ud"-wan&ndash;kom$"rm"*ylmuratova',
+    '!#t-6#(a-glance$%likes#\'oneness#$slow$\'pecific""11"!4"+_,_at_least#$each"$abey#&lantas#%ollah#\'peuerca#(qatigiit',
+    '#$ssut#%venom##xic"$bara"+cgtnnnnnysg""ed#"ke#(lectasis#"rk"\'f1/creb##3-6"#had$#rva#%elney%%stone',
+    '&#ion%#eum%#ion%"on$*roma-prone%$ston$%tosis#)namulloch#)wartships""ic##sha"1kin/archaeologist%#ian%*son/mother(!s',
+    '##yns"$laal$#nte&)ic-facing(!a(!k"+oll-dweller#\'mically%&zation$"on%&sphere$\'smasher#&nalism$"io$!y',
+    '""ps"$r/de#-ioventricular#*opurpureum"-t&eacute;ghei#,ach&eacute;d.!e%$ked.$$mpts$#rdi#2enborough/director&%rough%&d/host&#ed.(%/seen',
+    '&&uation$*ridgeville$+well-hughes##his##ine%$gham$0tude-brandishing("s.#(lebridge#"oh$-rneys-general&!s$!w#+ractability\',ively-priced',
+    '$)ibutional""ul"!x"!z!\'ubrieta"(chenblae&%closs&#ree&\'shuggle$\'orachan$(terhouse#*tion-house$\'oritate("ee"!d',
+    '#&iencia$&o-disc&)frequency&"in&#out&(recorded,$ings%%books%%genic%!s%%tapes&#ool$#tel&!x%\'orially',
+    '\'$ship\',y-vestibular#$land#&ofleda##rie&!s#!y"\'fhebung#,kl&auml;rung"*g&ndash;25#$/oct#$elli$\'nthaler#$hfad##ued',
+    '(!s$+st&ndash;12&"-6\'!9\'(december&%/club&"ae&&ifolia"+hm&uuml;hle"%kland"(lonacara"$mont"$ntly"%pling#*r&egrave;s',
+    '#(iculatum$"ta#!o$#dye#%ulius"9schwitz-birkenau-monowitz#/differenzierung#$gabe$%leich#$pace$%icium#$seil$&iedler#(ten/west$#ick',
+    ')\'n-owned+%style%1fararv&iacute;sur%)o-turkish#\'ub&copy"#tel$%urism#\'hentic.)$ator)#ism*#ty.$(igenesis$+or-friendly&)/narrator&\'atative',
+    '(%y-led*%owned&$s(s)\'!.\'9/editors/teacher/trainers(\'writers#"if#,o-antibodies%)biography%%crime%\'dialler%)eroticism%$iris%\'pattern%*regulatory',
+    '%%start$(antigens$$bank%&urette$$care$#doc%$rive$&genous%$olpe%\'raphing%$yros$$haus$&loader$&makers&(tisation',
+    '%$ized%&obilia$!n%$omy\'((-centred$&paster$+radiograms.,%phies%\'eactive&\'ceptors%(otations$&shaped%%ketch%&tradas%)uggestion',
+    '%*ransformer$&winder"\'xotroph""yu!%v4605"$6280"(ail-able%!a&\'bility.)"ty\'.le/unavailable#%liani#\'ncement$"t-&$rock',
+    '#$vnuk""co"(dic/adis"$eiro#%llino#"na%$rius$#ham#(rageness$$camp$$ring$%yanov#$ugle#$yard"%garea',
+    '"\'iatical#,culturalists#5din-biotin-peroxidase$\'y&amacr#\'gnonese#%ldsen$"es#$neri##tal#-v&ndash;jaffa$#1-1"(ocations&!s##kea#$niel',
+    '"#rel##iel"$s/88"&tandil"*uncularity"!x!&wamutu#,rd-nominated&\'winners"$drey"*e-stricken##lon#!s".kwardly-shaped""m2',
+    '#"ri"#wad!"x3"&e-blow$$edge#%nberg"&iality#&ologia\'"us")onometric"\'p-based#%/open"$tell#"on"$xiom',
+    '##rga",cliffe-based"%issah"$laus#"er$+sbury-based"*mar&aacute"%nsley"#oub"%udhya#(urdzanyn"%valik"#yub!(z-zibari&"ri',
+    '"4aquinolonecarboxylic"#eem#,rbaijan-iran%%ijhan$+i-populated",idothymidine#!l#"mi$\'uthally"#mai"&o-bond##lla#(ospermia#%pardo#$rian',
+    '#%turia#&vtseva"#rin"#uma#,re-chevroned&&lidded"#zam$"ra#$ilfi +b&acirc;ton#(macr;nba$#p;o&"wr#-uml;renreiter\'#sle',
+    ')#243"+eacute;char)/horl&eacute;guy)-n&eacute;dict*"ou)0r&eacute;govoy\'s)%thune)!u)%ville#(circ;che((te-noire""gt$";a"$lt;a")ndash;17d',
+    '($3000")ouml;hmer\')sendorfer\'\'tticher")uuml;cher)#ner\'$lach\'*rgerpartei\'#tow!&\'clare"&tselem!!*!(-&amp;-b""12#!b',
+    '"$cll2#&omplex"$file"!g#$rade"%minus"(pictures"$tech$$sted"!x!%.1874##904%!5""35"#585',
+    '"!7"!8##007"#ch."!e##.m.$!t"$f.g."$h.p."$i.e.#"sa"$mus."$phil##ure"$r.b.',
+    '"$t.a.#"he"!v"&w.i.r.!+/00/22/0007*"11&&3/0002+!9*"15*"24+!5+!7*"41*"50*"71',
+    '+!6($2005*"15*"20*"36+!7*"49*"56+!7*"60*"72+!4*"83+!4*"94',
+    '+!9)#104*"10+!5*"23+!6+!7+!9*"30+!3+!8*"44+!7&&4/2007+!8',
+    '+!3+!6&&5/0001*"10&&6/0045#)1/25/0009*"10#)2/25/0003+!4#)4/23/0011"#a-l"!c"!i"!r!#1-r',
+    '"&.8scfv"#/b2"#228#"48#"69#"78"*4&ndash;16"&855+09!\'2-level""25"!4!"3+"!1!"4+"#027',
+    '"#423"#525!"5+""10!$6160"#270"#415#!2#"38!#709""22"#47f""54!"81"!3',
+    '!"91"!4""th!,:grammatical!"=c!-a&ntilde;ados""-1#&koe-pa#%usair"$/bsc#%usair""44"#724""91#!3',
+    '#!a#!k#%lbeck$%eboss##nga"\'bandiga%!i$%ssana##bar$#les#\'el-like##iak$!n#%raham##tie',
+    '%$hkas#%worth#\'y-buggy%\'clothes&"ry%$doll&$ress%$feed%#gro%%madda%$pink%$sits\'#zed%$waby\'%lkers',
+    '$%foods$&lonish$!s%#afe"$came$"ta#$cala%"ta$)hanalians#$hian$!s#\'itracin#%k\'uds$&-bends&$oned',
+    '\'#red\'%tting&\'lushing%\'gardens\'"te&%round%$home%\'markers%\'packers)!s&%ocket&(rojected,$ions((pagation%&rowers',
+    '&%tairs&$wing%(to-roots$!/$):hundreds$&akeldy$%beats%$oard$\'draught$!e$\'gardens%&round\'*"s.$\'handing%#eel',
+    '$$lund$$most$&passes%%lanes$%rooms&!w$"s.%(cratcher%%lider%#top$&thwing$1ward&rehy;looking("ly#!o$+n-flavoured',
+    '%#ers#$pak6#%quier#*teria-like(#/ml\'%cides\'$ocin()logically()rhodopsin"(d-minded#"ak$\'lamenti$!r#(deleyite%!r',
+    '#&egisel$"jo$$lona$1n-w&uuml;rtemberg#+ger-watcher%%worth##ies$%ngton#*ly-behaved&*decomposed&#lit&$made&%tuned##men#\'rakhani',
+    '#%setup#&zarhuu"#elz#$nsch#%rends$!i##yer""fa#+fle-curtain#&oussam")g-carrier$)snatchers+!s#"an$$rgui',
+    '#$dade$%elleh#$fuls#-gage/personal$"ie%$ness%#tis$$ydom##hli#$illt#7n&egrave;res-de-bigorre$#ell$$igge##oas#$puss',
+    '$$hawe$%vaerd"*h&iacute;a#$a\'is$&walpur#%ejana##man$&ueller#!n#&rainis$!u""ik$$anur%!s#,ley/huntsman',
+    '$$lifs#\'n-marie#$riki$"th#"th$$less##yun#(ze-lined"#jos#$rani#$ulus"#kal#\'e-ovens$(r-saddam%$/men',
+    '#"ha$%ramov$%taran#!i##kar$"es#\'oyannis#%schev#$uhan$(r-weiner"#l31#+a&iuml;tous$!m$)ncing-act)!s',
+    '%*oposthitis%"te$$skas#(bianello%!r#&clutha#&dachin%$quin%%ssare$!e%!h%%rrama%!v$"hu$"on',
+    '%&ickian&#dge$#ung$&winson#\'emartin$%phuil$"ra#$fron#+l-and-stick%\'busting%&gowned%#nut%&topped$\'ad-like&&eering',
+    '\'(aderreen%#nce%)rd/slater%$ters$(bearings%"oy%&reaker%&usters$%ed-up%(t-master&!.&"to$&headed$(ighiline%%maran',
+    '&\'taggart%#ols$$more$(oon-like(\'wheeled%*t-stuffing$$ulve$&winner$*ychatrigan%&easton%&fermot%&galget(#ley&&rainey%)jamesduff',
+    '%#mun%(naughton%$oran%\'patrick%%utoag%&walter##mat#\'nagowan%$keil##opi##ram##sai#%tacha%"rd$&ravers',
+    '$\'usnikas#%uchis$$lise#%vaird#%zanii"%mbaia%"ng$#esi#"ff#\'hi/clai"%naban$#lly$(na-brain\')flavoured\'%skins',
+    '$!s%#tre#"ba$)ury-based(&oxford\'!/\'%shire#%caire%#ria$#hop$$omer$%rofti#&d-saws$&/group$(age-type',
+    '%"ra$%boxes&"ys$(ersnatch$$iere%"ni%#tti$\'leaders$#ora$"s.$$with#$egas#"fi$#ord#+g-bang-bang',
+    '%!y$%ed-up$#guo$%kwang$"wa#&jaluka$\'o-style#.k-commissioned%&funded%(industry%\'lending%)mikklesen%&sticks&(upported%$wide',
+    '%#imf$&centre$"en$&fields$5ing/insurance/finance$$ment$/s/organisations&(prisoner%"ey%%hares$$wide#\'naventa$#ell%)r-bearers\'$pole',
+    '#\'queters#)shee-like$"ka#(teringly&!s$"in$#ung#$well%!n$!y#$yard$!i$$oles"%obhan"&phomet',
+    '#)tisteries"*r&eacute;s#\'-annexe$%b-que$%coded$%hatch$&kokhba$$lock#*/breakfast#(abajagal$#cco%%lough$+d-d&ucirc;r$#jas$#k-1',
+    '$"ri#%bares$$ells%,r/supporters&!i&!o%!y$$iano$"ox$&ulescu%"ry%!s$!y#(celoneta\'!s',
+    '$Dlayslloydsmidland&verbar;onatwestrbs$$odes#$dach$"ia$#oli$%ufoss$*well-jones#\'e-armed%$foot%$root$*ly-audible\')concealed\'*suppressed\'%there$\'ntsburg',
+    '$$rost#(gain-buy%!s$(e-boards&&owners%$ddie%&owners%!t$$hash%$oorn$"in#$hams$#ill##iba$#lla',
+    '#"je##kad%$loff%)n/ayverdi%!t$)er/oxford$"ov#$land%!s$\'borough$!e%\'y-sugar#\'maiding$#ier$$pton',
+    '$%abite)!s%)rdisation\'!s%"tt%"ul$,es/blackpool()ullingdon\'*cheltenham(%owley\'&dinton\'*gloucester\'$live\'&radley\'(survivor',
+    '%"ts\'"on&,t/brockworth(-herefordshire(*leominster(\'malvern(%stoke(*teddington\'!s$%field$%icles%!e$%sbury$%ville$"ys',
+    '$"lo$&nworth$)que-domed$$stat$!t%%rauma$$uche#%pleat#+r&egrave;re$%aband\'!s%%caded&$kers%#tts$#eau',
+    '%)l-bellied\'$load\'&organs&)s-per-day%"ns\'$tein%"re%#tta\'%stown%!y$+i&egrave;re%\'e-esque&"ra%*ngton-ward%&onuevo',
+    '%"ns%"om%%w-boy*!s\'%downs&#ful$"ys#$soom##tas$%ejeia%"lo%3stree/herefordshire$"ha%-elemy-madaule&!z',
+    '$6olom&ecaron;jsk&aacute%+n/reporting$*ram-hyndes#"us#\'ycentre##zen"%s2000#$alis$$nite%$jorj$"ri#&church#*e-isolated%$maps&$etal',
+    '%\'pairing%$rich%(weighted$)/mulhouse$"24$)ball-type%#orn$\'l-based&\'chiasso%%iners$&plates$$work$!y#%fords#*h&oacute;0',
+    '$!o#-ic-ultrabasic%$plus$#lar%$icum&"us$)n-forming%&gfield&$werk$+s/rightness#*ket-making&%balls$!o#%machi#$ohli',
+    '#*s-baritone%)guitarist%\'o-matic$"ai$"ee%\'s-alpes%&t-horn&\'t-lowke$"ic$(ompierre%&onists%+ukou-boumba##tad%!n%)rdisation',
+    '\'"s.$!i%"da%$enne$&nasite$"ow"(t-making$&shaped$$wing#\'chelder##ely$#men$"s/#%h-gel%%night',
+    '%%salts&$uite$"27$&ampton%!n$(ing-suit%$shig$%room.(%/w.c.()s/showers$%salts$%towel)!s$$uyag$*ypectinura',
+    '#!n#"ol$*n-wielding$!v#$rouk\'!h#&selier$#uur#&taglia$#ell%$rers&(y-backed$#iad%"er$(le-cries',
+    '\'%plans\'%scars\'&worthy&%dores&$line&$star$#ock#"um##zli$%ushka"%udain$"ys#-haus-inspired$"in$#uis',
+    '$$unst##met#!x"%vadra$"nt##car#!o$!n")wdy-house"\'xendall"*y-anglesey$\'windows#,ad&egrave;re#$head##kal',
+    '#"on%(et-marks#\'risches#$tree#!u"(zdarevic#%iotes##len#\'yliszek#"za!"b7#".2""94"!b"%c-itv',
+    '"#gsg"!m""ps!*c&ndash;ad"#100$!8"!2#"00""ap"\'l-2&agr%$/100&$puro""pr!#d23"!7',
+    '"!b""is"!s!+e-attitudes#"in#(medalled#&ringed"!2"$_all$!t#"on""ab#&ch-bum&(cleaning&%heads',
+    '%#ley%$tent#\'d-black$"gc$$ness##ger$$ling#&k-full$#ing$&length#&m-ends%"on$#ier$#ten$%width',
+    '%%nighe%$pole$$easy$&flower$"s.$$test#%r-pit$%ings.%&shness$%skins#!s$*ley-murray$&t-face%$ings#%t-\'em',
+    '$*ifications$&le-cut$\'masters$!t#)uc&eacute$#foy$#jon&%yeulx$&regard$"te%*ifully-cut,(designed,#lit,(measured,&shaped',
+    '&%skins"#bic"$cau\'%!s&\'e_er_of*$m_of#$erra#%hafen$&erovka#)kett-like$"ie$(withshaw#%omin\'$!n"\'d-baths',
+    '%\'urtains$%mates$)occupancy$(parallel%#ost(!s$%rolls&"om$%socks%&prings##all$"ux$(zzlement#&cover.#%delem',
+    '$&y-byes#"el#(fordbury\'!s#$gown#"le$+ingtonshire##ous#%rails$#est%$ttin$#ich$$oom.#*sitterland$#ore',
+    '#&worthy")e-orchids$*pollinated$&stings#"be#(chamwell$%raigs#)f/suckler$%iness#"ko#$litz##mer#$n_in%$over#%r-can',
+    '%$mugs%)producing%&sodden%\'tasting$\'goonath$%halls$%sheva##six"%ffroy#(rementd.")ggarwoman#(uilement"\'half_of&!s$%rrell',
+    '#)behanians#"et#0ind-closed-doors\'#the#!m#)ringwerke"&i-jing#"ba#(derbecke#*jing-based\'#ers#&linson#-ng-for-itself*&others&,in-the-world',
+    '%"s.#,rut-damascus#"sa$$hida$"ty"$kale#%eford#"ki"4l&dollar;107,000,000,*53,900,000#(-shanaar#%asyse$\'tedness$#uan$"ye',
+    '%$ford%#ier#$ding#\'ehradek$$tuen#+fast-bangor(&dublin\'#men$"on##ges$&ischen%-um-luxembourg#&iavsky$#ef.%&veable',
+    '#)l-glasses%&ingram%%pulls%&wether+!s$"a.%"by%!k%$noch%#rio$$buoy$\'chamber$%eghem%"rs%)s-lettres',
+    '%#zza$&flower$#ier$#jar$#ona&!e%!s&!o%%wings$$ucci$)y-buttons&\'flopped&&laughs&\'upwards#\'mangate',
+    '%#pan#&odedic$)ngingness$#tti$$usov$+w-inflation&&market&(standard&(the-knee##son$%trode#,t-and-braces%"up$&ed-out$$hook',
+    '$&ranena##vik")mananjara#"bo"%n-ben$%david$\'eliezer$#hur$\'menahem#$appi#$burb#(ce-jones%!y$\'h-lined&%marks',
+    '&$seat&&tables%#ley$!y#$d-up$$aoud$&erloch$$icks#&edicat\'%tions$)ficiation&&t/cost(&income\')s-in-kind()/problems',
+    '$$nden%"in$$tech%!t#,field/silver%"ts#\'g(hons)$\'alensis&!s$"er$(halensis$%kalis$&oetxea$$tson#$hill',
+    '$!e$"gh$&rschke$$ssad#,jam&iacute;n&-in/consultant(!a\'"te#&kovitz#%leaze#$mont#$nell%"ts&$tite*!s',
+    '$"ie&!s#"or#/son/oxfordshire$$tock#%t-arm%"up%&winged$#cho$"en$$hall%#eim$&kowski$\'onville##vie',
+    '#"yi#%zeval$$inol$\'opyrene"\'osystem#\'wulfian"$qa\'a"$rani$&rdenga&#ius&!o#&berati#"ck#%ebury$$land',
+    '%!g$!s$\'titenti$#wan#&g-like$+f&uuml;hrer$$holm$#ins$(schrunds%#ons%$tein#&illium$!s#!j$#asa',
+    '$&enhead%&rhofer$\'ishness##lak$#ick%"n\'&#gen\'#uer&#ski%#oz\'$"ow#%maldo$&oothes$!s$/udan-registered',
+    '$$ales%$nder%(rd-henri\'#ine%!s%!y$\'e-bound$$feld$&kastel*%-kues$"on$+stein-baker$$ward$!y#"oe',
+    '#$retz$#iew%%sford$)y-bearing&%laden&&rogghe%&/local%$bank#!s$#ted#(t&iacute$#ele&$sman%"ns$&hefred',
+    '%&lskold$#ola#!u$,fsfachschule$"it$!s$$wela#\'wickers"$sana$"rd#$hara#%ieger#$kine#)mirsching#$sell',
+    '%(coloured%)developed&)ocumented%&funded%&heeled%$made%+of-the-week\'!f%(practice-!s%)qualified%+represented\'&warded%)supported%\'tasting',
+    '$#all%"ri$%horpe$%iarii$)sellerdom"-t-the-company#\'a-decay%&ionine$(blockers$$lite$%nbeau##cha%\'errygah#%eille#%hania',
+    '$$mann((-hollweg$"oc$%saida#"ir#$rand##son$%worth#+ter-adapted($rmed\'$bred\'%loved\')organised\')preserved)\'otected',
+    '$#ray$%yhill%%stown#\'ulaceae#)ween-meal\'!e"%ukema##ren#"ve"$vans##ere%$land&!e%%stone%#ton',
+    '%%acqua"&wailed#*ilderments$%tches#$teen""ya#&leveld$"ul##rie")zafibrate#+er/princess#)prizornye!(f397,000!"g5"!7',
+    '"!r"%s-led!"h2#!1"$achu#%dgaon#%mdoun$!o#%ratha$"ti#%skara##wan"#ead#\'kisizwe"%ichai',
+    '""lh""oe#%jpuri##lsa"!r")uachaille#$jpal#%mipol!*i-annually#*centennial#)dialectal%+rectionally#%focal#%modal#\'partite',
+    '$&roduct#&wiring"$/col"#:nz"$aggi$!i#$ller#\'nnually##sia"+b-and-brace$$taps#\'erstein#$ikov$"os#"l.',
+    '$*iographers&&pegist\'%hilic&.th&egrave;ques(&eca/ts#3ury/gloucestershire#&vewadi"%carb.##hon#(irrhosum#\'kershaw$"ie$%nacre%%oller#\'ommunal',
+    '%$ical$$rnis##ron#*ycle-clips"$dded%"ll%"r.$&ing-up%&scombe$!s#\'e-a-wee$$y-in#$ford#(ialectal"&elckus',
+    '##rce##sty"%ffins#$ield##old%#ium""g-$#\'un$&bodied&%somed&"ys%&rimmed$#cat%&rested$\'engined',
+    '$#hit#$bury#&elowii$$mini$"na#1ger-than-expected%,st&rehy;ever$)s-davison#%lands$!i#$nell#$ombe$"t.%$ries#!s',
+    '#\'uanides""ha"\'jenkorf#&outier%!x"+ke-and-ride$$thon(!s##ila$\'ni-line"\'lainkin$"nd$,teralisation#+bao-vizcaya$\'errying',
+    '#&deston$#ung#!i$#nda$+opancreatic#$king#-l&lsqb;s&rsqb$&-board*!s%&paying$$able&$ongs%\'rd/ipms$&cliffe$%ennia',
+    '$&ion-10(!4(!5)!0\'&airess%!s%"tt$"on$&poster$%spike$#ups$0y-tuckett-shaped%$cans&#ock#$obed',
+    '")maculated$$nual##boy#%escol##ini#$sley"(nanianae$\'ry-only$&tional#(birdirek#&d-over$#ley#$egar#*gham-jones\'$pton',
+    '%!l##ham#$kley##man$"en#!n$#ein$"ig#)ocularity$!t#\'sbergen$"ey$$tead#"ta#$ya\'a',
+    '$)chemicals$$days%*egradation$$foam$%hours$(implants%(norganic&*termediate$(limiting$\'organic$(physical%#lan%\'olymers$(reactors%&hythms',
+    '$*unlimiting#,accumulation%$tive(#ity#\'centric$*hemistries$\'limatic$)onversion#(division#$foam#\'geology$&raphic*-al/historical,"ly*!s',
+    '#"l.$%ayers$#lay$.ogical/genetic\'#sed#&marker%(ss/plant$)etricians#&rhythm#(sorption#)technical)#kum$&hropic$#ope#+us-artigues',
+    '$#sha#&edally#\'olarity")quadratic%(ternions"&rabeau$$diri$"go$"ma#\'ch-twig%%anger%$burn%#ed.&%nough\'!s',
+    '%%woods#,d\'s-eye-view$(-brained\'%eeder%(fanciers&\'riendly%&hipped%%songs\'#und$)/claimant$%cages$$food$$less%#ime$#men',
+    '$&s-foot%#hit%#ton#"ke%!t$$hoff$#ill%$nlig$&sgreen#$linn#"ri#\'t-smith$,h-determined&\'flowers&$sign',
+    '$\'smorton#"ua"4s(2-azidoethyl)ether#*acrylamide#"by#*chofberger$(uit-thin##dee#%erial#1hop/herefordshire&#dom&$rick&/ton/redmarshall$!r%!i',
+    '#\'millahi##ons%#tes#)phosphate$!o#$ques##sex#"ta$#ort#\'ulphate#%ztyga"#t-5$(less-bad%#ine$\'mapping',
+    '#$able$!r#%chier#&e-mark)!s$$less##fax$#lik#%incka%"gs#)ofabanter$#nto#$s\'er$+-and-pieces$!.',
+    '##wix"!u##mba"$vens##ins"!x#!a$$ceae")zarreness\'$ries#$kaia#"ri#!z!)j&ouml;rk*%&ouml',
+    '"\'orklund$$nson!%kirki"!w!%laauw$#zer#2ck-and-white-tiled\'\'rmoured&&barred&#cab($pped($ttle\'&overed&%eared&)feathered',
+    '&(jacketed&)leathered&%magic(#ned($sked&(on-white&&purple&%ruled&%spots\'&tained&(timbered($nted&&veiled%&bottle&$urns',
+    '%&church&$loth&&urrent%$fell%&houses%)ish-green,!y%%ledge&#ion%%mails&"er&#ill&$oors%%patch%%sburg',
+    '&%tones%!y#&ddered\'$wort$)en-hovell%"s.$$noch#%gajac$\'oevgrad#(ir-gould&$kerr%\'/thames%"ie%#man%%quhan',
+    '$%sdell#&kesley%+way/moseley#-me&ndash;free%(lessness$$pied#\'nc-bleu%&hfield$)d-looking%!a%#est%"in%,ly-flavoured$#eys$\'k-verse',
+    '&%nhorn&%stijn&)t-wrapped%#ish%#ney$%shard#%sczyk$+hford-snell$&ingame$"zk#&ugdone$%punkt#%worth#$ydes$#ney',
+    '#\'ziowitz"!c"#dgs"*each-fixed&"er$$dney$&r-eyed$\'th-like#%chner#+eding-wound(!s%%proof#&fuscan)!s##her',
+    '$$leys#&nkarne$)nerhasset#\'omycin.#-tchley/milton&%worth$%herer\'#ing\'!s$"so##vey$#ins#%zzard"!g"$i-xa',
+    '##nco$,d-man\'s-buff%&enhall&"rs&"st%\'folding%)ing-white%&nesses%$spot#%pvert#!s$$land$%s-out%#ing$$teze',
+    '$#ter#(zzarding"%oater#&bspace#)ck-buster*#ing&&shaped%1ley/archaeologist#(emendaal#%field#,is-champagne#&mqvist$%stedt#"nc$$dish',
+    '%!s$!g$!k#/od&rehy;stained%,-and-thunder&&bathed*!s\'$lack\'\'oltered($ught\'%right&\'cooling&&dimmed&$flow&\'glucose',
+    '&&letter\'#ine&$pink\'&oisons\'0ressure-lowering.!s&\'related\'$oyal&%stage)#ins\'&uckers&$test\')ransfused&%worms%&/brain',
+    '\'%tters%$nott%$wych%(y-handed&*mindedness$\'mfields%$less#(ssomgate#&tchily$2ting-hybridization(!s#\'w-darts&#rys%$over)!s',
+    '#0xham/oxfordshire#!y$#eti"!t"\'udworth#3e-and-white-striped%&backed\'$nded&\'ottomed%$cars&&heeked&\'oloured%$dyed%%edged%&ground',
+    '&$ined\'$pped%)overalled%&ribbon%\'shifted($rted&&kinned&&peaker&&tained\'(ockinged%#tit&$rees%)uniformed$\'/purple$$beat',
+    '%%ridge$$cher$$gums$$mner$\'s-based&\'derived&\'rockers%#ers%(tockings&"ry$\'throats%$rees$\'y-white#&ffness#$iett',
+    '#\'m-kulka$$enau$%hardt#&nderer\'$ings%*red/thames$%ketts$"os$%t-end&%nosed&\'talking#&rrings#"to"%ytons!1m-test-1&ndash;44',
+    '#!a""ya!#nag#"ss"#des#!p""oc!*o&icirc;te"$4510".a-constrictors#$bdil#"da#"ke%!s#-rd-upgradable',
+    '&#wea%)ing-pikes)"up%#oom#(t\'s-crew$)-builders%$hire%(stealing$"s."-b-bob-bobbing$&shaped%%leigh##ber$*in-waggler%"tt',
+    '$)y-bashing&\'dazzler##gan##lyn#"ok$#tie#(sleigher"(ccanegra%,ra/boucherit%!s#%harov$$enek#"ij"&d&ouml#$afon',
+    '$2nham/herefordshire#(hidharma#$ifit$!l$#nes#%organ#%wrdin#+y&rehy;work$!-%$bags&(eautiful%\'checked%\'related%&shapes&%quire',
+    '%$work$(/chassis$(boarders$$cote$!s%$hape%$ides%&urfers$&toners$$wise"&ekerij#"ll#"ro$$sema#-sch-achermann',
+    '"\'ffinery$!o"*g-trotting#$aers$!n$&tcheva#\'ey-five*!s##gan%#rts#&nessan#!o$%molov$#ria##roy',
+    '#$ying$!o"$hacs$!m$$nnan#,emia-moravia##ley##nke#"ol#$umil"%iardo#%l-off$(er-plate\'$room\'%suits',
+    '$"ly##ngs#&series#$tani"\'jangles"#key#"ha"&lagnos$!h$$nger##cek#\'dbaatar$$ened%$rson$"re',
+    '#$eyns#&ivares#\'kestein##lee%!s%%tieri$!s#%oardo#"sa%!y$.hevik-inspired#%t-ons$\'ed-down$\'on-born\'&hunter',
+    '"$mani#)b-attacks%\'builder%%happy%$plot%\'ravaged%&shaped\'#ell%\'vessels$)astically%&y-born$)ing-raids$$site#!i"&n-bons',
+    '$#rdi$#via#)d-washing$"uc&$etta#*e-crushing%$deep&#ust%&lining%$meal%$pale%)weariness$&lessly%"lo$#man',
+    '$"s.%&hakers%$teel#\'ferroni#*gchun-dong$#ers$\'iovanni#%ifaci$"ly$$ness##nal$%efond%!s%"ys##obo',
+    '$!s#\'secours$\'moulins$"wa#!t$!e%#cou#$utto#$wick#%ython#"za%$nigo"%o-ing$%tiful$#yaa',
+    '#!g$$aard$%eyman$#ies#&h-booh##joo#$k(s)$!*$$-bag%$hand)!s%$list%(oriented%$shop)!s',
+    '%$worm&&riters$(bindings$$data$(fetching$*ing-office\',/information\'"s.$&jacket$&length&"t.%#ice$$news$%rooms%&unners',
+    '%%tacks#&m-hoom%%slump%$town$,erang-shaped$$ing.$"la%"et$#sha#%n-eua$0/gloucestershire$#chu$&doggle#%reman#$tboy',
+    '$"ee%"rs$\'h-mason%$eels%#man%%stown$\'le-born$%print)!s$$safe"\'pparder"%racic$(ginaceae$!n$(petensis',
+    '#%chert#+deaux-style%%laise%&r-free%\'s-pages$"ua#&ed-out$"el$!l%#and$#man$$nius$#ray%!s$%stone',
+    '#%g/jcr$-araflokkurinn$#man$#ois%%nuovo$#und##jas##ley##mio#*n-and-bred%*to-be-wild$!.$&eensis$-holmerstrasse#*o-silicate',
+    '%!y$&nation%#gaj$#tra#"ra%!s$#ero$#ill%"ns$%omini#&salino$\'etshire$(t-eilers##tey$"on',
+    '""s.#$cean$%hetti%!i%$mann#&enquet#%iljko##kap#4nia&rehy;herzegovina&--hercegovinia*(zogovina#\'s-to-be$!a%"ll$"ey',
+    '""ta$%nicus%)y/zoology#&cherby#&esdale#&h-ways$\'eration&#ed.\'!r##kin#$omba##rel##sio$%wanan#$tega',
+    '%$rell$!i%&glieri$(le-banks\'&making\'\'openers\'$tops\'\'washers&!/&%d-gas&#fed(%eding&$tops$+om-dwellers&$leys',
+    '#$wood"\'udenesa$#ica$%jemaa#"ez#(ganville$$eant$*h/breaking%%t-out&.on-under-blean#%habib#$iali$%llons$"ra#+lder-chokes',
+    '$*ier/french$$laha$%merka$,ogne-sur-mer%!s%!u#\'mphreys#"na%#ama$\'ce-back$)d&formula%)ary-lands%"ry$\'teously%%ifull',
+    '%(y-hunter#&rboule$(geoisie.*(fication)&ophobe%$oise$(ke-white$"la%"on$0nemouth-weymouth#$shel$&quette$$sard%!e%%inesq',
+    '#%tayeb$$cher$#ell$!h$$inot$$wood#-vet&oslash;ya#%yancy#\'zoulouk""va##ell$!s$#ton##ids$#lle',
+    '$(windowed*!s#)d/banbury%*cheltenham&%owley%*gloucester%(hereford%&witney$"er&%stone$$itch#)e-evander$%lling$(n/thames$\'r-birds',
+    '#(hauliers#)ie-knives#"l.$&er-hat%%swood$"ie##mat$#ont##ral##wab".x&ndash;girder#$(es)#!*#)-shifting%$tyle',
+    '#&ed-off#$ford#*ing-booths##ley$#ike#&makers"#y\'s#%-king$&lovers#(es-braem#1friend/girlfriend#"ld$)e-charles#+nton/farmer#%s:one',
+    '#%woman"&zburun#$eman#"he#!z$$etti\'!o$!o$!y!*p-operated#\'unipart"!.""ps"%x-a\'s!#quo',
+    '$+grave;tigny"%/sncf"!7"!8"+a-and-pants#&bantio#&cadale$#cio$$eros$\'hiation%"ot%&yceros$$ings$\'kendene\'!s',
+    '$%orina$!t#&denton$)ford-hill)\'on-tone$.ley/department\'"an\'%scope$(manesque$$nock$*shaw/steve%\'tonians$!t$%ville$#way',
+    '#%eside##han$-mac&amacr;rin&&daitya$\'unisary##ida$)n-bending&\'derived&$size%#ard%%boxes%$case&$ells%&edness&!r',
+    '%(stormers*!s$,thwaite/glos#"ka$%esmen%$work#$mald%%ntino$&blings%#ury$$dean$%field$$ling$#mah#+naire-ducru',
+    '%!e%+h-and-bound\'%based\'(coloured\'%lines\'#off&0es/organisations&$less&#net$/d-consciousness&%names%&enberg%$ings&!s%#ley',
+    '%%marks%%ywine$$igan%#mir$"ka$#les$&sholme#%shest$&ileira\'#nse%%ngton$$nett$(s-banded&(coloured&&making',
+    '\'#ule%&empouy&)rie-style&"ur%$icae&"de&!e&$ness#&t-race#(uchitsch$!l$*n-blanquet%(dschweig%-schweig-based,"er',
+    '$%tigan#%vados#$wler#$yley$#man#%zilia"\'b/leeds"%each.$(d-baking&\'winning%$pans%)th/length&%wists$)k-clauses&&notice',
+    '&+uprithmetic%,/oxfordshire%$back%)fast-tray)\'/planet%"in\'(g-strain%&though%#ups$"ms$#st-\'&cancer\'$shot&!/&$band',
+    '&&rokers&"s.$+th-catching(&ontrol\'%group\'\'jerking&%iness(%g-gas*"in&%space#$bner#%cchia$#kin%$nell&(ockshire',
+    '#$dahl$#der$$ekis$!y#*echloading$$din\'%"s.$*ze-ruffled&%block#!g$!y#$ifne$$sach$%thorn%(schwerdt',
+    '$"ky#&menium##nch$$dons$$nans%"ez$"od$\'tonians#%shnev$$kens$#nan$&summer#&tenoux$$igny$*o&ntilde;a',
+    '%&/civil%"an#%uning#.vipedicellatus#%waeys$%ongle%*od-wheaton"$ians$#tin#!b$$able$(e-hungry#(ck-sized&(throwing&&walled',
+    '\'!t%&fields%#lin%%yards$%oleur)!s#$ddon$&e-cake&%price%\'/divine%!i%$wood%!y$,ge/tailpiece&$able',
+    '\'#eck&$less&#nd4&%plate\'#ort$\'le-path\'%roads&$path##ege$\'rcliffe$"uc#(gandines&"te\'#ian%"te',
+    '&!d%%flats$(htenings\'&r-eyed\'#yes&*ly-painted&#ons&&reason&%wells$%lands$#oon$&stocke#&htwold#.ll/oxfordshire%"at',
+    ')+ly-coloured#$mpts#\'ncliffe$+e-saturated\'%hrimp$#ing$&kworth$(villiers#%ollay#\'quetage\'"te#*scoe-hooks$#ley$(tle-cone($like',
+    '\'%/bath\'$ians&&w/west#\'t-style$!.$(ain-east%%nnias$4ish&amp;commonwealth\'(-is-best(&manned+)ufactured((occupied(\'powered)(rotected(*registered',
+    '("us\'(/belgian(%dutch((european$$nell$+tan/peacock&!s%\'enesque%(le-stars&!y%!o&(n/parish$#zka#$vati$/es-la-gaillarde',
+    '""mm"#n-3"$o\'er#)aching-to$(d-beamed\'%illed&%sheet%&bridge%(castable&$lyst%#dus%"ed%%heath%$leys&*y-educated',
+    '%$ward\'"ys##cht%$ure.$\'kachach%)bank/vale%%hurst%-lebank-fowler%0worth/gloucester#$deur$%hurst$#ley#%gdale$(lie-bohm#"il',
+    '$&e-dick%%ndown%(r-dealer#,mide-stained%#ley&"ow$$mage$%swell$$well#*nchiolitis\'#tic&-o-oesophageal\'*dilatation$!n$&tosaur',
+    '$,ze-feathered\'&leaved#!o$)ke-taylor&1s/gloucestershire%$lime&\'yn-born%-s-baker/burke$+m-cupboards%%hurst%"ie%$leaf%*stick-thin%!y$#nzy',
+    '%#off##ter$(herstone#,ugh-on-fosse&)/occupant&)t-forward\'\'on-made+\'cdonald$#sse&&onetia#$wder%"ie$)n-crusted&%earth&$outs',
+    '&(speckled\'&tained&)uniformed&)wilkinson%+/cheltenham&\'eleanor&(national%&bridge%#ell%$hill)!s&"ut%&ingese%"ly%$moor',
+    '&$hirt&-ill/neighbour%(y-purple$%sable#$xton""rm"\'s/demon$&native$)thesaurus$%views&$sion$$word#$adin"$uaer#&cciani',
+    '%#lla#)ddersford$&enells#"er#&guiere#,ised-looking%$ings#%larts##mel$$fitt$$mitt#\'ndisium$$head%$ilde$!n',
+    '&"us%#ing$!s$*tingthorpe#*sh-turkeys%$ings%$less%\'sellers%&washer%!y$!s%&elator#*talisation("es("ts',
+    '",yan-chamorro%!s#$more#(n-y-baal\'&neuadd$#cir$!e$$ford$$glas$$hill#&ophyte#$usov"(zezinksi!#s12##363',
+    '"!5#*750/bs5850\'#iso"#646"&ad-adt""dp""et"%harre"(o/origin""tn$!1!#t10""20"#308#!7',
+    '""nf"%rieve""tf"$u/hr"&v-like"!x!\'uadilio##gun"%banza##beh%#leh$&lingly#$inga##oes$%nique',
+    '#"ci#.harest/romania$$mann$#ung$$witz#\'k-naked%\'toothed$#den$%eburg%"rs%+t-and-spade\'\'rearing&$sful\'#hop&!t',
+    '$-ingham/thames%"sh$&lebury&&makers&"rs&\'y-valeo%"ow$,skin-covered$$tons#!s""d.#)denbrooks#\'ejovice$&sonide#+get-deficit',
+    '\'\'setting&"ry#*hsinghwala#"le#%okwai#*ragchaagyn"%e-nas#"il#$lach#-ttner-janusch"#fus")g-for-bug#%arach##gar$!e',
+    '#$ojno"&hagiar"&ild-it%,er/developer%/ing-by-building)%plots%#was$$lard$*t-to-order#&sseret""jt"&khizam#"ta"#lat#"ba',
+    '#$camp$#ock$$raig#-garian-soviet$(ing-eyed#%k-buy$"er#(l\'s-eyes$*-at-a-gate%(runnings%\'slaying%$whip$-/28/10/93/cde%%sacha$%amoor',
+    '\'$ings$+et-battered\'$head($oles\'\'riddled&$hole%$yana$\'fighter$#ier%!t$&master$(ock-cart\'#ing%"sa$%shine',
+    '$%y-off#"ot#-strode/trauma##ter$%itude"&m-bags%#oys$&cheeks$\'freezer##bag$#oat#)p-readers$#ety$%iness$$kins',
+    '%!.#%slide"\'n-fight$&shaped##cer$&hed-up#*desanstalt&+gerichtshof&\'kanzler\'*riminalamt&)regierung&$tags&2verfassungsgericht$\'le-like$#ock',
+    '#&fights#&galoid$%didin$*ee-jumping&!s$$lers$!o#"ja#$nage$#ens%!t$%house$"ys#$raku##sby',
+    '$"ha$#ong#$well"(onarotti&$roti"$ppie"(rakovsky%!u$%nelli$$spor#"ca$$hall%$ells#$dass$"ge',
+    '("ts%0ucratic-military$$sova#$gate$+ess/maclean$*h-by-sands$)lar-proof$%mayer$*undy/slate%!s#*ial-cliffs&!l%"ts#)ke-davies%!y',
+    '%&iplatz#%liest$&usconi#(mistrova#$n-in$#ant$(e-jonesy%&d-down%$ston$)ham/horse%$olme$1s/gloucestershire$$t-up$!u$!y',
+    '#(r/farmer$#ard%#ton$#ige%"tt$"ou&&ghsian%%wings#&saspor$$itis$*ting-point#(ton/cpre&$port#%walls#%yatia',
+    '$&thorpe"&s-boys$)connected#&/coach#$boys#%cayno$#emi%#tta$\'hbacher#&enello#*h-clearing%$like$$bury$)ell-mingo$$fire',
+    '%$ness%"re$%lands$$meat%#ill$(whacking$&yleaze#1iness-development)(friendly)&minded)%style*%uited($.the()/commerce))financial',
+    '(\'persons($talk#$sage#(t-length$&amante$$iers$"ly$"on#%uutis#%watch%"ys"\'t-1-ene#*_according%!t$"in',
+    '#+ane/propane#(ch/femme%#art%$wana##eos$$town#-ler-henderson&&/chief\'/gloucestershire#&t-ends$#ell%*r-coloured\'%knife&(cup-like*&yellow',
+    '\'(ly-light*&shaped)!s&"ly&&stream&/worth-heinemann$&ington$-ock-clenching%*n-pressing(&ushing\'+to-the-neck&&holing#%urlin#!z"-xton/campaign',
+    '"%y-off%)ut/buy-in$"up#%.they#%/sell#$back#+er/ensuring#%ssens"%zalek#%kashi#$zin\'!"v1"!2"\'a-paris""rd',
+    '"!u#%mbras!"w1"!4")angdirola!$x/bx#"lx#!n""a6""d5""e6""g5!%ychan""dd#!v',
+    '#!e#$rley"8ford/co-promoter/swindon"$gott"&linski#"ot"&rdland#)ne-sutton$"ie"&strica"#tek##ham$$eway!%zargl"&ip-dna',
+    ' \'c&amp;e"&bsol;a\'!b\'!w"(dollar;4*#50m)!5*"4m)#8.5)\'900,000"3eacute;l&egrave;bre*"io)%saire)%venol)\'zannian',
+    '\'-5-fc&rsqb;agg\'&p&rsqb\'&q&rsqb"\'mdash;1(!2"*ndash;fjin(!g")oacute;mo#2circ;te-des-neiges"%pound"&uacute!%\'moan"&wealth!#**t"%ntana',
+    '"!1""at!#-11#!8"#228""ca#$lass"%files#(ormation"%grade"$like"!m#%yc-er"$pawn#&illars',
+    '#(erotonin##tat"*terminally"%words!$.-in"$1030#!1##328##400$"75#.550&ndash;1800##600$"50$"80#!7',
+    '##850#!9$"01%!5$"10%!8""26""50"!6#!0"!8"$a.a.$"b.$"d.$"f.',
+    '"&b.t.c."&e.d.a.$$g.b.$"v."&g.st.d$"t."$l.d.""m."$o.d."$p.m.$$r.e.$)verrijzer#*erfringens"&t.d.d."&u.s.c.',
+    '+!3+!5&&3/0036*"65+!7*"70+!2+!3+!6*"85*"91+!2+!3($2009*"27',
+    '*"60+!2+!3+!5*"75*"82*"97)#113*"31*"50+!5*"67*"75*"80+!2',
+    '+!9)#202+!8*"10+!6+!8*"33+!6+!8+!9*"46+!7+!8*"52+!4',
+    '*"78*"86)#309*"15&&4/2011&&5/0009*"11&&6/2066*"72#!1#)8/25/0002*"10#)9/25/0003"\'ebp&bgr"!h',
+    '"!r!"1+"%0,200#".1""12"#600#":0"(850-1918#$:2n6"#900$!6#"th"!s!\'2\'-endo"!1',
+    '""91!"3+"&800-es"!d""po!,4\'-c3\'-o3\'-p#!s!"50!"6+!"7+"!0!#90s""2a""4a!#=gb',
+    '""++"#-ca#)dependent#-unicenter/325#&visual""11"\'balists$&natuan$$rave#*bage-white%"la#$ello$#zas#&in-top%\'et-rank',
+    '&$knit&$like%$cars$#ink##men#&obpurs$%chons$#urg#$rach$#iel%#sas#&stands")catuoides#(gtg-cyc1#&heable',
+    '#"ia$!f#$king#!m#"os#!s#$xatg"(dam-like$#vre#$dock\'!s$\'station$&yshack##eby$#man',
+    '$&tships##fan#%gwith##ham##ima#$more#%omian$#rna$"ws#$star#%vance#$wgan"\'ecilius#$dmon#\'r-y-n\'a',
+    '%*eon-on-usk$&narfen$#wyn#\'sarians$&pitosa".f&eacute;-bars,\'concert+%teria,+i&egrave;re#%e/bar#0feine-containing)$free)\'induced%"ll#$tans',
+    '#!y"$houn"%illau%"es%(i&eacute%"ou#,ne/droitwich$!s#$phas$&irinha#%renes$%nbawn%"ed%$well$-o&ndash;luxor',
+    '#0ster-by-yarmouth%"on&,r-by-norwich#"th"(jolingly"\'ke-shop)!s$%walks",l&ccedil;ada#$-mac$$tech#&.rptr.##/kg#%abash("es',
+    '$"ce$!m%\'itously$#nus$!s%$anti$"ta$$zans#\'biochem$%ourne#*citisation&1onin-gene-related%*um-binding()dependent($free',
+    '$"ot$!u%1lated-declination#$dons#"ea$&donide$#tti#\'f-bound%$deep%$love#%gacus##hau$%eiros#%iban.$#che',
+    '$%entes%#rno$$fano%.ornia-berkeley$$ming$(sthenics#\'l-boxes%%notes%#off%%signs$\'/return$%achan%&s-like$%boxes$#ed\'',
+    '$#ias%(graphiae%%phora%$xtus$&server$&ywhite#"me%#tte$$fors#\'orflame%#gas%*ie-crammed(#low()supplying($wise',
+    '#\'phurnia#$qued#)reticulin#*sequestrin$#ter#&umkill#%vaert%#rio$$erts"+m&eacute;es#0/gloucestershire#*acu&aacute$$dale$$guey$!n',
+    '&"de$&sunary$!y#$bers$#ien$$lets$+o-les-bains$,r&eacute;sis%%ensis%#ica&(dge-blue)$/rsa)+shire-based$"us#$cord',
+    '#\'el-like%&eopard$&ra-gun\'(original/!s&!l%\'ounians%"un#$inos#&lachie$"ey#+ming-device#/p&rehy;survivor$(-agonist%(crp/cytr',
+    '%\'grounds%)inducible%*responsive%)sensitive&%tools$"an&(ologists$+bell-fisher)(lamerton)\'preston(#pur$$eche%$rvan%$stre$%iglio',
+    '(%stove$%onovo%$rese$\'sbourne$#ton$\'us-wide#&uccini$\'lodunum"(n-but-wo$#run#"ac$$ille$&l-like%(izations$$rium',
+    '$!s#5cellation/curtailment%%r-box\'$like\'\'related\')sufferers$#ver#$dela&"it%%rbill$&idness%%llier$)le-sticks&$land$*y-coloured',
+    '#$fuls#!i$$ggia$(ne-tooth%"gs#\'nabinum\'&s-like$"er&#ies$$ibis%"er%%sters%$zaro$)on-fenske&$bury',
+    '$\'ulating)#ons#&oeable$$file$"ga$)nisations\'#tic&\'zations\'#ing$#rus$$tech#5t&eacute;yodjay&acirc$(acuzenus%#mus%%rists',
+    '%#lli$$icum%#dio%\'llation%#nas$%onale&\'ization$$rail$#uar\'&iensis$#yre#*vas-topped&)s-returns#%zonet",p&rehy;tured',
+    '#/abili&rehy;ties$)ciousness$!x#$ello$(rcailzie#"ie%#ndo$+llarisation&$ipes$"ng%!o$\'stratus$2tal&rehy;intensive\'!-(%gains',
+    '(&output)%wning\'$card\'/ist-imperialist(,zation-based%!e%#ols##len$"ow#"md#$nuts#&onigri#$poni$%ucino#$raia',
+    '&$orni#)sicastrum$%ticks$$ular#(taincies$&ivator&$ity.#$ucci$&rnicum"#que"+r&iacute;as#(-auction$$body$)dominated$\'exhaust',
+    '$$load$#mad$$pool$%radio%%ental$$seat$$tool%#ype#*/ferry/car#)a&iuml;be$#bao%$idae$&ctacus$%dhras%(og-jones',
+    '$$mate%)elisation\'!o$&nsebes$"pa$\'vaggian&%nette\'#ner%"en#*bamylation$*ide-tipped$%olite%\'n-black\'&coated\'+impregnated',
+    '($itic&#ell&#ium&-ni&egrave;res%&platin%%ranes%+xylesterase\'/methylcellulose$$rook$\'uncular%(risation#%ceral$&hemish$\'inomata&"us',
+    '%\'sharper$,board-backed)!s$$iaca%"es%!f&\'f-wales\'!6%%ganed%.nal-archbishop($fish&!e%*o-thoracic&\'grapher$*membership',
+    '$&ership$$foot%\'reeness%,ully-applied**controlled+)ultivated*&penned+%laced+\'repared\'!y$#rs.$$take%"te$&vision#%fully',
+    '#$idad%!i&!a$%llons$#nas&$tion%#gly&#ton%$hall%#oma$"os&"us$%valis#\'jackers#(la-marie',
+    '$"es%*ton-greene))in-craven$#ite$#ota$#sen%$tadt$$tons$%uccio#"mi%&native&%e-red#"na%$rfon$$bane',
+    '$$eddi%!s$$hill$#ica%(val-time$(menellis$%otaur#%olans%\'inensis$$omed$%tenes\'#oid$!w#&p-like$#ano',
+    '$\'entaria%"rs%)t-baggers\')retailing&$ings&$less&#tes&%world$"ow%"zi#%rabus%!d&#ice%"ig%"ro',
+    '%"rs$+ick-on-suir\'$nowe%!g&#een%#ons%\'sbrooke$#ock%%n/mrs%"t-\')and-stick\'&haired\'$like\'&topped%$usel',
+    '$%ville$%yback%$cots%"in\'%gs-on%!s%#tot#$sfad$%lberg%"ey$$tein$%walle#(t-tracks$#boy$)elisation',
+    '\'\'trading&#ets&$mill$"ha&$gena$$iers$$mell$%ooned($sque\'#ish$%right$$shed$\'ularies$+wheel-sized#&ucates',
+    '(!s\'"os&"lo$)ing-knife#$ying"&sambre$$neva#"by#*e&mdash;so$+-definition\'\'tection%(hardened%\'manager%\'officer$%/does',
+    '$#lli$*r&iacute;o$(s/100000#)h-balance%#hit%#out%(positive$#out$$till##ler$"in#"on#$ques##sat$"en',
+    '&%oling%,tte-recorder1!s$/idy/crematorium(&thames%\'n/mayor%)vellaunus#$taic%$lian%#nea\'"da%(spermine$&e-like&&ridden%#els',
+    '(#nos)!y\'#ina%%ratie$$iles&$lane\'-e-le&oacute;n%%ng-on%#ron$)le-palace&&fields&\'gregory&#ham\'#ill&$troy',
+    '$1ner&ndash;kellner$"on%#red&%iadis$%ratie\'"or(!s%*o-designed&$nery#(ualties.%(rinaceae$%istic#$wall"(t-called$(equipped',
+    '$$piss#*/lamp-post#(afalques$\'la-roca%&ogues.%,yst-equipped$%nzaro$(phoretic$%ramie%"ia$+strophising+$zing$"vi#%bells#(ch-water',
+    '$%liffe#)egorially($sers\'+y-judgement$&naccio%$ians$%rbase%$club%-ing-equipment%+pillar-like%$thun#$hair%!n$%ectic%*terization',
+    '$*olic-irish)%owned(+/protestant%!s%#use#"ja#$ling#&napped#\'oplebas#%spaws$!y##tan$%erton$"in$*le-drovers',
+    '\'\'keepers\'\'lifters\'\'raising#$ulus$(marandus")udillismo$"le#.ght-and-bowled&"er#\'ldhames##nes#!r$"es##sae%$list',
+    '$&ebrook%"rs%"th%#vic#!t"\'valetto%!l%+ry&rehy;men$"ni$\'radossi#*e-dwellers%)exploring%%mouth$)/particle$\'ndishes',
+    '#"ia$"na#$vies"$wder$$well#"la#"te"$xito#$tons"#yce#&howell!"b5"!8""os#%t/cme',
+    '!$c-m3"!3""cb##ccc""ds""gt""hc"!j#!p#!s"#k/l#!8""mc"\'ontents!.d&mdash;centre',
+    '#%based##emx#$only##sar""18#!9"\'2/lfa-3#!0#"5+""3+".44-immobilized#"5+"#c10#!p"$d521',
+    '$"nc"&na:rna""os""re"2s&mdash;democratic',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_43 = (
+count_43 = 6694
+
+heads_43 = (
     '24-goal',
-    '24-handicap',
-    '24-handicapper',
-    '24-lane',
-    '24-plane',
-    '24-sep',
-    '24.0%',
-    '24.1.92',
-    '24.10',
-    '24.1p',
-    '24.2.92',
-    '24.3.93',
-    '24.40',
-    '24.5p',
-    '24.6.91',
-    '24.75',
     '24.9%',
-    '24.95',
-    '24/26',
-    '240%',
-    '2400/2452',
-    '2400bps',
-    '2401',
-    '2402',
-    '240241',
-    '2404.2',
-    '240cm',
-    '240g',
-    '240mv',
-    '241&ndash;2',
-    '241,139',
-    '241.5',
     '241312',
-    '2414',
-    '24150',
-    '242&frac12;p',
-    '242&ndash;3',
-    '2420',
-    '2422',
-    '2424',
-    '2427',
-    '2429',
-    '242a',
-    '242mm',
-    '243&ndash;6',
-    '2434',
-    '2436.4',
-    '24370',
     '243ff.',
-    '244&ndash;9',
-    '244,103',
-    '244,140,625',
-    '2444',
-    '244444',
-    '244p',
-    '244pp.',
-    '244x183cms',
-    '245,857',
-    '245.77',
-    '2450',
-    '2458',
-    '245p',
-    '246&ndash;8',
-    '246,000',
     '246.',
-    '246.24',
-    '246.42',
-    '2462',
-    '24680',
-    '247(3)',
-    '2471',
-    '2477',
-    '24773',
-    '248155',
-    '2488',
-    '249,632,692',
-    '2492',
-    '2492.8',
-    '2493.9',
-    '2495',
     '2496',
-    '2498',
-    '24:18',
-    '24:26',
-    '24cm',
-    '24hrs',
-    '24k',
-    '24kg',
-    '24km/15mls',
-    '24mm',
-    '24r',
-    '24st',
-    '24th-minute',
-    '24th.',
-    '24w',
-    '24year-old',
     '25%&ndash;30%',
-    '25%+',
-    '25&deg;n',
-    '25&frac12',
-    '25&ndash;14',
-    '25&ndash;30,000',
-    '25&ndash;32',
-    '25&ndash;34-year-olds',
-    '25&ndash;35%',
-    '25&ndash;37',
-    '25&ndash;48',
-    '25&ndash;50mm',
-    '25&ndash;8',
-    '25&ndash;90',
-    '25&ndash;thu',
-    '25(3)',
     '25+',
-    '25,000-30,000',
-    '25,000-mile',
-    '25,000-plus',
-    '25,000ft',
-    '25,100',
-    '25,21',
-    '25-0',
-    '25-10',
-    '25-18',
-    '25-29',
-    '25-34',
-    '25-35',
-    '25-6',
-    '25-april',
-    '25-aug.',
     '25-centimetre',
-    '25-fold',
-    '25-inch',
-    '25-km',
-    '25-october',
-    '25-per-cent',
-    '25-track',
-    '25.03',
-    '25.1%',
-    '25.11.92',
-    '25.16',
-    '25.2%',
-    '25.2.92',
-    '25.22',
-    '25.25',
-    '25.29',
     '25.37',
-    '25.44',
-    '25.45',
-    '25.59',
-    '25.6.90',
-    '25.92r.',
-    '25/1000',
-    '25/3/93',
-    '25/33',
-    '25/4/93',
-    '25/75ths',
-    '250&ndash;1',
-    '250,000th',
-    '250-km',
-    '250-year-old',
-    '250.550',
     '2500&ndash;2000',
-    '2500rpm',
-    '2500th',
-    '25010',
-    '2502',
-    '2506',
-    '2509',
-    '250km',
-    '250lm',
-    '250mb',
-    '250mg',
-    '250mhz',
-    '250s',
-    '2512',
-    '25131',
-    '2514',
     '25148',
-    '25150',
-    '2515106',
-    '2522',
-    '253%',
-    '253.47',
-    '2536.7',
-    '253643',
-    '2537.1',
-    '253716',
-    '2539',
-    '254(1)',
-    '2543.4',
-    '2547',
-    '2548',
-    '25480',
     '25490',
-    '254nm',
-    '254p',
-    '255&mdash;92',
-    '255&ndash;7',
-    '255,804',
-    '25525-26',
-    '2558',
-    '2559',
-    '255mm',
-    '255pp.',
-    '256&ndash;264',
-    '256,112',
-    '256-cpu',
-    '2560',
-    '2564',
     '2567.0',
-    '2571.2',
-    '257km',
-    '2580',
-    '2582',
-    '2584',
-    '2588',
-    '25920',
-    '25:14&ndash;30',
-    '25:31',
-    '25:31&ndash;46',
-    '25:34',
-    '25:8',
-    '25cm/10in',
-    '25ft-wide',
-    '25kms',
     '25mb',
-    '25mm-long',
-    '25mph',
-    '25sec',
-    '26&ft',
-    '26&ndash;0',
-    '26&ndash;12',
-    '26&ndash;20',
-    '26&ndash;35',
-    '26&ndash;60',
-    '26&ndash;69',
-    '26,000rpm',
-    '26,230',
-    '26,338',
-    '26,400',
-    '26,400,000',
     '26,800',
-    '26-0',
-    '26-14',
-    '26-15',
-    '26-16',
-    '26-6',
-    '26-7',
-    '26-match',
-    '26-party',
-    '26-storey',
-    '26-week',
-    '26-years-old',
-    '26.0%',
-    '26.10.92',
-    '26.11',
-    '26.2.92',
     '26.25',
-    '26.38',
-    '26.4.93',
-    '26.5.93',
-    '26.56',
-    '26.5pc',
-    '26/09/93',
-    '26/3/74',
-    '260&ndash;261',
-    '260,757',
-    '260-km',
-    '2601',
-    '2601.0',
-    '260g',
-    '260m',
-    '260mm',
     '2611',
-    '26151-52',
-    '262,000',
-    '26220',
-    '262262',
-    '262906',
-    '262ff',
-    '263&ndash;8400',
-    '263&sol;78',
-    '26320',
-    '2632m',
-    '2633',
-    '26340',
-    '263p',
-    '264&ndash;6',
-    '264&sol;78',
     '26426',
-    '264563',
-    '264m',
-    '265627',
-    '265bp',
-    '266,072',
-    '2662',
-    '266522',
-    '26661-66',
-    '266663',
-    '267,667',
-    '267,844',
-    '26750',
-    '2679.2',
-    '268&ndash;9',
-    '2687.8',
     '26870-71',
-    '26873-74',
-    '2688',
-    '268888',
-    '2689',
-    '2691.7',
-    '2696.8',
-    '2697.5',
-    '26:1',
-    '26:18',
-    '26cm',
-    '26cms',
-    '26km',
-    '26mm',
-    '26mpg',
-    '26pm',
     '27&frac12;p',
-    '27&ndash;10',
-    '27&ndash;24',
-    '27&ndash;26',
-    '27&ndash;28h',
-    '27&ndash;34',
-    '27&ndash;41',
-    '27&ndash;50',
-    '27&ndash;59',
-    '27&ndash;70',
-    '27,063',
-    '27,556',
-    '27,750',
-    '27,834',
-    '27-14',
-    '27-21',
     '27-3',
-    '27-6',
-    '27-7',
-    '27-june',
-    '27-minute',
-    '27.32',
-    '27.4.',
-    '27.44',
-    '27.46',
-    '27.47',
-    '27.4m',
-    '27.5p',
-    '27.64',
-    '270,670',
-    '270-acre',
-    '270-seat',
     '27000',
-    '270028',
-    '2702.7',
-    '270391',
-    '2705.6',
-    '2706.2',
-    '27080',
-    '2709.6',
-    '270bp',
-    '270kg',
-    '270mm',
-    '271&ndash;2',
-    '271&ndash;4',
-    '271(3)',
-    '271(4)',
-    '271,000',
     '2710',
-    '2711',
-    '2711.1',
-    '271441',
-    '27161-63',
-    '272,000',
-    '2721',
-    '2727.1',
-    '272p',
-    '272pp.',
-    '272pts',
-    '273,000',
-    '27364',
-    '2737.8',
-    '274,200',
-    '2741.8',
     '27487-89',
-    '2751',
-    '2754.5',
-    '2756.39',
-    '27560',
-    '27570',
-    '2759.4',
-    '275g/10oz',
-    '275gtb/gts',
-    '275kv',
-    '275mhz',
-    '2760.1',
-    '276mjy',
-    '2773.4',
-    '2774',
-    '2778.8',
     '27850',
-    '2787',
-    '27880',
-    '27886-88',
-    '27906-07',
-    '2793.1',
-    '27:1&ndash;11',
-    '27ff',
-    '27m',
-    '27specint92',
-    '27th.',
-    '27year-old',
-    '28&deg;c',
-    '28&ft',
-    '28&ins',
-    '28&middot;5',
     '28&ndash;0',
-    '28&ndash;135',
-    '28&ndash;20',
-    '28&ndash;24',
-    '28&ndash;32',
-    '28&ndash;33',
-    '28&ndash;35',
-    '28&ndash;4',
-    '28&ndash;52',
-    '28&ndash;69',
-    '28&ndash;70mm',
-    '28&ndash;79',
-    '28\'s',
-    '28(1)',
-    '28,002.07',
-    '28,051',
     '28,143',
-    '28,400',
-    '28,452',
-    '28,800',
-    '28-16',
-    '28-cm',
-    '28-hour',
-    '28-run',
-    '28-strong',
-    '28-years-old',
-    '28.1.92',
-    '28.10.93',
-    '28.2.92',
-    '28.25',
-    '28.28',
-    '28.32',
     '28.8gb',
-    '28/2/93',
-    '28/29th',
-    '28/32',
-    '280%',
-    '280&deg',
-    '280&ndash;653',
-    '280-member',
-    '280000',
-    '2807\'s',
-    '28070',
-    '280mm',
-    '281&ndash;309',
-    '281,000',
-    '281-member',
-    '2812.2',
     '282(1)',
-    '2822',
-    '2823',
-    '28273',
-    '283&ndash;7',
-    '2834.4',
-    '2837',
-    '2837.7',
-    '284&ndash;304',
-    '2840.7',
-    '2841',
-    '28440',
-    '2845.9',
-    '2846.5',
-    '2847.8',
-    '284p',
     '285,016',
-    '2852',
-    '28533',
-    '285lb',
-    '286&ndash;40',
-    '286&sol;86',
-    '286(5)',
-    '286-12',
-    '286-compatible',
-    '2866',
-    '287(2)',
-    '287,000',
-    '2872',
-    '28750',
-    '2879.4',
-    '287p',
     '288,000',
-    '2881',
-    '2885.5',
-    '288pp',
-    '289&ndash;90',
-    '289(1)',
-    '289,000',
-    '28920',
-    '289505',
-    '28:3',
-    '28b',
-    '28c',
-    '28e',
-    '28h',
-    '28in',
-    '28lb/12.5kg',
     '28min',
-    '28year-old',
-    '29&frac34',
-    '29&ins',
-    '29&ndash;0',
-    '29&ndash;12',
-    '29&ndash;13',
-    '29&ndash;32',
-    '29(1)',
-    '29,078',
-    '29,30',
-    '29,300',
-    '29,524',
-    '29-9',
-    '29-nov.',
-    '29.0',
     '29.10.93',
-    '29.14',
-    '29.15',
-    '29.19',
-    '29.20',
-    '29.75',
-    '29.88',
-    '29/11/2',
-    '29/2a',
-    '29/4/87',
-    '290&ndash;1',
-    '290(2)',
-    '2902',
-    '2905',
-    '29050',
-    '29056',
     '290ff',
-    '290k',
-    '290kg',
-    '290p',
-    '2910',
-    '2912',
-    '2912a',
-    '2918.6',
-    '2919.3',
-    '292-member',
-    '2920',
-    '29216-18',
-    '2924',
-    '29260',
-    '29300',
-    '293p',
     '2940',
-    '2941',
-    '2944',
-    '2948',
-    '294p',
-    '2952',
-    '2953.4',
-    '29565-67',
-    '295g',
-    '296&ndash;297',
-    '2963',
-    '2968',
-    '2969',
-    '2972',
-    '2980',
-    '2986.4',
     '29876',
-    '29880',
-    '299-member',
-    '2991',
-    '299293',
-    '29950',
-    '29970',
-    '2999',
-    '29cm',
-    '29in',
-    '29lbs',
-    '29min',
-    '29th-minute',
-    '2:0',
-    '2:1&ndash;20',
-    '2:11&ndash;14',
     '2:16&ndash;17',
-    '2:18&ndash;22',
-    '2:18:11',
-    '2:23&ndash;28',
-    '2:25.0',
-    '2:27',
-    '2:35',
-    '2:36',
-    '2:41',
-    '2:41&ndash;52',
-    '2_per',
-    '2a-c',
-    '2ae',
-    '2ah',
-    '2and1/2',
-    '2aq',
     '2b-4b',
-    '2br',
-    '2bs',
-    '2care*',
-    '2df',
-    '2dl',
-    '2dr',
-    '2dy',
-    '2dz',
-    '2ea',
-    '2eq',
-    '2fl',
-    '2ft-long',
-    '2hq',
-    '2hu',
-    '2hz',
     '2ins.',
-    '2ja',
-    '2l/r',
-    '2late',
-    '2lg',
-    '2ln',
-    '2lz',
-    '2m+',
-    '2mins6secs',
-    '2mph',
-    '2nd&ndash;4th',
-    '2nd-4th',
-    '2nd.',
-    '2nd/3rd',
-    '2nmf',
-    '2o&deg;c',
     '2pu',
-    '2px',
-    '2ql',
-    '2ra',
-    '2rt',
-    '2s.e.',
-    '2sa',
-    '2sh',
-    '2si206',
-    '2t',
-    '2t7',
-    '2te',
-    '2tr/3',
-    '2ub',
-    '2x12&ins',
-    '2x15',
     '2x15&ins',
-    '2xf',
-    '2xs',
-    '2xssc',
-    '2xu',
-    '2y',
-    '2yn',
-    '3&agr',
-    '3&ast',
-    '3&frac12;ft',
-    '3&frac12;oz',
-    '3&frac12;points',
-    '3&frac34;p',
-    '3&micro;g',
-    '3&ndash;14',
-    '3&ndash;14&ndash;0',
     '3&ndash;19',
-    '3&ndash;20',
-    '3&ndash;23',
-    '3&ndash;25',
-    '3&ndash;26',
-    '3&ndash;28',
-    '3&ndash;33',
-    '3&ndash;35',
-    '3&ndash;36',
-    '3&ndash;39',
-    '3&ndash;4&deg;c',
-    '3&ndash;4&ins',
-    '3&ndash;4&ndash;0',
-    '3&ndash;5&ndash;4',
-    '3&ndash;5-year',
-    '3&ndash;8&ndash;0',
     '3&ndash;8-',
-    '3&percnt',
-    '3&prime;59&prime',
-    '3&sol;76',
-    '3&sol;88',
-    '3\',5\'',
-    '3\',5\'-monophosphate',
-    '3\'-direction',
-    '3\'esv',
-    '3(5)&mdash',
-    '3(8)',
-    '3(c)',
-    '3*3',
-    '3+2',
-    '3+3',
-    '3,000,000-strong',
     '3,000-5,000',
-    '3,000-foot',
-    '3,000-user',
-    '3,000kms',
-    '3,000t',
-    '3,015',
-    '3,024',
-    '3,030,000',
-    '3,045th',
-    '3,050',
-    '3,072m',
-    '3,075',
-    '3,079',
-    '3,1',
-    '3,105',
-    '3,118',
     '3,136',
-    '3,184,000',
-    '3,200ft',
-    '3,230',
-    '3,232',
-    '3,240',
-    '3,280',
-    '3,287,263',
-    '3,3',
-    '3,3\'-diaminobenzidine',
-    '3,300hp',
-    '3,300m',
-    '3,303',
-    '3,317',
-    '3,372',
-    '3,445',
     '3,450',
-    '3,480',
-    '3,5,7',
-    '3,500kg',
-    '3,505.01',
-    '3,511.65',
-    '3,512',
-    '3,514.69',
-    '3,560',
-    '3,600-mile',
-    '3,625',
-    '3,626',
-    '3,628,800',
-    '3,660',
-    '3,683',
-    '3,702,000',
     '3,735',
-    '3,768',
-    '3,816',
-    '3,845',
-    '3,855',
-    '3,860',
-    '3,882',
-    '3,891',
-    '3,924',
-    '3,944',
-    '3,960',
-    '3,986',
-    '3-13',
-    '3-bedroomed',
-    '3-foot',
-    '3-grams',
     '3-hydroxy',
-    '3-lbs',
-    '3-month-old',
-    '3-monthly',
-    '3-night',
-    '3-o-methyl',
-    '3-speed',
-    '3-system',
-    '3-under-par',
-    '3.0&aring',
-    '3.0/3.1',
-    '3.04',
-    '3.0i',
-    '3.1&aring',
-    '3.1&ins',
-    '3.1(c)',
     '3.1-based',
-    '3.1.7',
-    '3.10c',
-    '3.11(b)',
-    '3.11.93',
-    '3.12.1',
-    '3.13%',
-    '3.13(a)',
-    '3.13(b)',
-    '3.13a',
-    '3.16(b)',
-    '3.1:1',
-    '3.1c',
-    '3.1kb',
-    '3.1p',
-    '3.2&ndash;32.6',
     '3.2.1.3',
-    '3.2.2(10)',
-    '3.24(a)',
-    '3.25am',
-    '3.25m',
-    '3.25pm',
-    '3.27(d)',
-    '3.29%',
-    '3.2km',
-    '3.3&ndash;38.3',
-    '3.3(a)',
-    '3.3(b)',
-    '3.3.1.3',
-    '3.3.6',
-    '3.3.8',
-    '3.30m',
     '3.3kg',
-    '3.3pc',
-    '3.4&aring',
-    '3.4(a)',
-    '3.4(b)',
-    '3.4.2.1',
-    '3.4.2.2',
-    '3.4.2.3',
-    '3.4.2.4',
-    '3.4.2.5',
-    '3.4.4',
-    '3.4.4.1',
-    '3.46',
-    '3.47.37',
-    '3.4pc',
-    '3.5&ndash;6',
     '3.5\'',
-    '3.5(1)',
-    '3.5.4',
-    '3.5/',
-    '3.52',
-    '3.55&ndash;4.30pm',
-    '3.58',
-    '3.59',
-    '3.59.7',
-    '3.5:1',
-    '3.5lbs',
-    '3.6.',
-    '3.6.3',
-    '3.6/',
-    '3.60m',
-    '3.63',
     '3.69',
-    '3.6gbps',
-    '3.6kb',
-    '3.7.',
-    '3.7.0',
-    '3.7.13',
-    '3.7.6',
-    '3.70',
-    '3.72',
-    '3.78',
-    '3.7:1',
-    '3.7p',
-    '3.7pc',
-    '3.8(a)',
-    '3.8(b)',
-    '3.8(c)',
     '3.81',
-    '3.85m',
-    '3.86',
-    '3.87',
-    '3.8p',
-    '3.9.3',
-    '3.93',
-    '3.95p',
-    '3.98&deg;c',
-    '3.98&ndash;4.02',
-    '3.99',
-    '3.9gb',
-    '3.9m',
-    '3.9p',
-    '3.9pc',
-    '3.x',
     '3/1',
-    '3/10',
-    '3/1000',
-    '3/160',
-    '3/3/87',
-    '3/4-inch',
-    '3/day',
-    '30%-80%',
-    '30&micro;g',
-    '30&ndash;150',
-    '30&ndash;17',
-    '30&ndash;216',
-    '30&ndash;3',
-    '30&ndash;32',
-    '30&ndash;35%',
-    '30&ndash;40&deg',
     '30&ndash;40min',
-    '30&ndash;44',
-    '30&ndash;59',
-    '30&ndash;60min',
-    '30&ndash;69',
-    '30&ndash;70',
-    '30&ndash;75',
-    '30&ndash;94',
-    '30&ndash;sep',
-    '30&plus',
-    '30\'',
-    '30,000&ndash;40,000',
-    '30,000-40,000',
-    '30,31',
-    '30,355',
-    '30,519',
     '30,600',
-    '30-021',
-    '30-13',
-    '30-14',
-    '30-30',
-    '30-32',
-    '30-60',
-    '30-akce',
-    '30-degree',
-    '30-kilometre',
-    '30-lap',
-    '30-min',
-    '30-nation',
-    '30-question',
-    '30-sept.',
-    '30-something',
     '30-tonne',
-    '30-years-old',
-    '30.102r.',
-    '30.15',
-    '30.26',
-    '30.4%',
-    '30.51',
-    '30/40',
-    '30/8/87',
-    '300&deg;f',
-    '300&ndash;399',
-    '300&ndash;400kg',
-    '300(3)',
-    '300,473',
-    '300-',
-    '300-320',
     '300-600',
-    '300-megawatt',
-    '300/l',
-    '3000&ndash;4000',
-    '3000&times',
-    '3000/400',
-    '30010',
-    '3004',
-    '30070',
-    '300:0:0',
-    '300a',
-    '300bhp',
-    '300cm',
-    '300g/10oz',
-    '300mg',
-    '300ms',
     '300nm',
-    '300se',
-    '301,277',
-    '301-member',
-    '301223/4',
-    '301733',
-    '301835',
-    '301p',
-    '302,000',
-    '3024',
-    '3031',
-    '303158',
-    '3032',
-    '3036.9',
-    '30370',
-    '3040',
     '3041',
-    '3043',
-    '30437-51',
-    '3047',
-    '3050lc',
-    '3050mm',
-    '30522',
-    '3055',
-    '3057',
-    '3059',
-    '305mjy',
-    '305p',
-    '306,209',
-    '30631-32',
-    '3064',
-    '306p',
     '307&ndash;308',
-    '3075',
-    '3079',
-    '3079.2',
-    '307p',
-    '308,000',
-    '30828',
-    '3083',
-    '30870',
-    '3091',
-    '30925',
-    '30926',
-    '3099.1',
-    '309gti',
-    '30gm',
-    '30ins',
     '30kb',
-    '30kda',
-    '30lbs',
-    '30lc',
-    '30mb',
-    '30mg',
-    '30ng',
-    '30sec',
-    '30v',
-    '30year-old',
-    '30z',
-    '31&ndash;12',
-    '31&ndash;15',
-    '31&ndash;16',
-    '31&ndash;3',
-    '31&ndash;32',
     '31&ndash;34',
-    '31&ndash;38',
-    '31&ndash;45',
-    '31&ndash;6',
-    '31&ndash;72',
-    '31&sol;79',
-    '31(1)',
-    '31(3)',
-    '31,000,000',
-    '31,200',
-    '31,32',
-    '31,400',
-    '31,500',
-    '31,600',
-    '31,680',
-    '31-8',
     '31-jan-1990',
-    '31.03',
-    '31.1%',
-    '31.18',
-    '31.21',
-    '31.24',
-    '31.25',
-    '31.37',
-    '31.40',
-    '31.45',
-    '31.56',
-    '31.8%',
-    '31/4s',
-    '310&deg;f.',
-    '310,000',
-    '3100.6',
     '31010',
-    '3103',
-    '3105',
-    '310725',
-    '310g',
-    '3110',
-    '31116',
-    '311273',
-    '3116',
-    '3117',
-    '3118',
-    '3119',
-    '311p',
-    '312&ndash;337',
-    '312,000',
-    '312,500',
     '312,683',
-    '312.5',
-    '31200',
-    '31260',
-    '3127',
-    '3128',
-    '312t5',
-    '31333',
-    '3134',
-    '31369',
-    '3138',
-    '3139',
-    '313p',
-    '314,000',
-    '314,328',
-    '31410',
     '3142',
-    '3146',
-    '31477-86',
-    '315&ndash;16',
-    '3150',
-    '31501-02',
-    '315th',
-    '315th-ranked',
-    '316,000',
-    '316,400',
-    '31621-22',
-    '317,000',
-    '317-member',
-    '317/661',
-    '3170',
-    '3179',
     '318,000',
-    '318.',
-    '3182',
-    '31828',
-    '3188',
-    '318i',
-    '31908-09',
-    '3192',
-    '31935',
-    '31945',
-    '31:3',
-    '31:31',
-    '31:5',
-    '31i',
-    '31lb',
-    '31st-ranked',
     '32&ndash;0',
-    '32&ndash;38',
-    '32&ndash;53',
-    '32&ndash;6',
-    '32,768',
-    '32-0',
-    '32-9',
-    '32-day',
-    '32-foot',
-    '32-minute',
-    '32-year-olds',
-    '32.0',
-    '32.00',
-    '32.02',
-    '32.08',
-    '32.3%',
     '32.6%',
-    '32.70',
-    '32.95',
-    '320%',
-    '32000',
-    '3206',
-    '32071',
-    '32083',
-    '32098',
-    '320g',
-    '320gb',
-    '320kg',
-    '320l',
-    '320m',
-    '321s',
-    '322,462',
     '3223',
-    '3226',
-    '3227',
-    '3228',
-    '32293',
-    '323,000',
-    '323,878',
-    '3236',
-    '3237',
-    '324&ndash;325',
-    '324.2million',
-    '3244',
-    '32457-59',
-    '3246',
-    '3248',
-    '3249',
     '325&ndash;3',
-    '325&ndash;6',
-    '325144',
-    '32517-18',
-    '325i\'s',
-    '325kg',
-    '326,000',
-    '326022',
-    '326235',
-    '3263',
-    '32632',
-    '32649-51',
-    '32660',
-    '3268',
-    '326p',
-    '327&ndash;8',
     '32700',
-    '3270s',
-    '3274',
-    '32768',
-    '327p',
-    '328&ndash;5544',
-    '328,000',
-    '3281',
-    '328515',
-    '3287',
-    '3288',
-    '329,566',
-    '329,758',
-    '32957',
-    '3297',
-    '3299',
     '32b',
-    '32c',
-    '32ff',
-    '32g',
-    '32kbps',
-    '32kg',
-    '32km',
-    '32mhz',
-    '32min',
-    '32mpg',
-    '32nds',
-    '32oz',
-    '32pp',
-    '33&frac13%',
-    '33&ndash;16',
-    '33&ndash;262',
     '33&ndash;282',
-    '33&ndash;36',
-    '33&ndash;6',
-    '33&sol;74',
-    '33&sol;78',
-    '33(2)',
-    '33(3)',
-    '33(4)',
-    '33(5)',
-    '33,000,000',
-    '33,000-volt',
-    '33,000ft',
-    '33,287',
-    '33,900',
-    '33,937',
-    '33-fight',
     '33.1%',
-    '33.23',
-    '33.3&percnt',
-    '33.4%',
-    '33.9%',
-    '33/1',
-    '33/4',
-    '33/76',
-    '330&deg',
-    '330&deg;f.',
-    '330-g',
-    '330000',
-    '330209',
-    '33037-38',
-    '330bc',
-    '330ft',
     '330kg',
-    '330lbs',
-    '330m',
-    '330s',
-    '331&ndash;70',
-    '331013',
-    '3311',
-    '33149',
-    '3319',
-    '332424',
-    '33247-48',
-    '332661',
-    '33286-87',
-    '33292',
-    '33292-93',
-    '33384',
     '3339',
-    '333d',
-    '333p',
-    '333t',
-    '33435',
-    '3348',
-    '33499-501',
-    '335&ndash;263',
-    '335s',
-    '336&ndash;323',
-    '33655-60',
-    '337,000',
-    '3375',
-    '33759',
-    '33792',
-    '33793-94',
     '337p',
-    '338,145',
-    '3380s',
-    '338211',
-    '33836-37',
-    '33852-54',
-    '33852-55',
-    '33882',
-    '3389',
-    '338p',
-    '339&ndash;40',
-    '33917',
-    '33930',
-    '33967',
-    '33970',
-    '33987',
     '33:6',
-    '33b',
-    '33kv',
-    '33m',
-    '33mbps',
-    '33min',
-    '33mm',
-    '33pc',
-    '33secs',
-    '34&deg;c',
-    '34&ft',
-    '34&ndash;16',
-    '34&ndash;32',
-    '34&ndash;39',
-    '34&ndash;43',
-    '34&ndash;48',
     '34&ndash;63',
-    '34&ndash;8',
-    '34,069,433',
-    '34,100',
-    '34,320,000',
-    '34,600',
-    '34,800',
-    '34,961',
-    '34-article',
-    '34.',
-    '34.06',
-    '34.10',
-    '34.4p',
-    '34.7%',
-    '34.70',
-    '34.74',
     '34000',
-    '3407',
-    '34094-95',
-    '340m',
-    '340mb',
-    '340x',
-    '34107-08',
-    '34110',
-    '34140',
-    '3417',
-    '34230',
-    '34252',
-    '34253',
-    '34266-68',
-    '34269',
-    '34270',
     '34297-302',
-    '34308',
-    '34318',
-    '343p',
-    '344&sol;87',
-    '344.5',
-    '34406',
-    '3444',
-    '345-40',
-    '34503-04',
-    '34518-20',
-    '3454',
-    '3457',
-    '34588',
-    '34663',
-    '347-member',
     '34717-18',
-    '34749',
-    '3478',
-    '348&ndash;50',
-    '34804-05',
-    '34821',
-    '34831',
-    '34872',
-    '3488',
-    '34883',
-    '349(1)',
-    '349,000',
-    '34904',
-    '34941',
-    '34947',
-    '34959',
     '34e',
-    '34in',
-    '34m',
-    '35%.',
-    '35&ins',
-    '35&ndash;15',
-    '35&ndash;30',
-    '35&ndash;44-year-olds',
-    '35&ndash;48',
-    '35&ndash;49',
-    '35&ndash;54',
-    '35&ndash;7',
-    '35(2)',
-    '35,500',
-    '35,900',
-    '35-',
     '35-37',
-    '35-page',
-    '35-year-olds',
-    '35.0%',
-    '35.23',
-    '35.26',
-    '35.3%',
-    '35.5%',
-    '35.6%',
-    '35/6',
-    '350&deg;c',
-    '350-foot',
-    '350-member',
-    '350-strong',
-    '350-tps',
-    '350-year-old',
     '350.5',
-    '3500&ndash;4000',
-    '350000',
-    '35014-15',
-    '35024-28',
-    '35079',
-    '35088',
-    '35091',
-    '350f',
-    '350f/175c/gas',
-    '350m',
-    '350ml/15fl',
-    '351&ndash;2',
-    '35109-10',
-    '35126',
-    '35137',
     '3514',
-    '35187',
-    '35187-88',
-    '35194-95',
-    '352&sol;85',
-    '35206',
-    '35208',
-    '35227-29',
-    '35251-55',
-    '35256-88',
-    '35269',
-    '35289',
-    '352a',
-    '352p',
-    '35319-20',
-    '35321-22',
     '35327',
-    '35336',
-    '35346-47',
-    '3535',
-    '35367',
-    '35373',
-    '35378',
-    '35378-79',
-    '353p',
-    '354&ndash;430',
-    '354(2)',
-    '354.8',
-    '35425',
-    '35428',
-    '35441-42',
-    '35444',
     '35460',
-    '35462',
-    '35490',
-    '35493',
-    '355,600',
-    '35504',
-    '35544',
-    '35567-70',
-    '3558',
-    '35586',
-    '35586-88',
-    '35592',
-    '355b',
-    '355p',
-    '356&ndash;517',
-    '35601',
     '35601-03',
-    '35631-32',
-    '35635-36',
-    '35666-67',
-    '3567',
-    '35676-77',
-    '35688',
-    '35690',
-    '357(3)',
-    '357,000',
-    '35701',
-    '35709-11',
-    '35715',
-    '35716-17',
-    '35722-23',
-    '35740-42',
     '35748',
-    '3575',
-    '35756',
-    '35759',
-    '35766',
-    '35768-71',
-    '35790-91',
-    '35793',
-    '35812',
-    '35815',
-    '35818',
-    '35840',
-    '35844',
-    '35849-50',
-    '35850',
-    '35855',
     '35876-79',
-    '35887',
-    '35895-96',
-    '359%',
-    '359&ndash;360',
-    '35902',
-    '35905',
-    '35906',
-    '35913',
-    '35959',
-    '35964',
-    '35966',
-    '35970-71',
-    '35990',
-    '35bn',
-    '35dl',
     '35kg',
-    '35min',
-    '35ng',
-    '35s.',
-    '35secs',
-    '35th-minute',
-    '36&deg;f',
-    '36&mdash;7',
-    '36&ndash;137',
-    '36&ndash;37&deg;c',
-    '36&ndash;38',
-    '36&ndash;39',
-    '36&ndash;6',
-    '36&ndash;9',
-    '36,059.87',
-    '36,125',
     '36,280',
-    '36,286.92',
-    '36,610',
-    '36-0',
-    '36-38',
-    '36-49',
-    '36-minute',
-    '36-month',
-    '36.0',
-    '36.32',
-    '36.8%',
-    '36.9%',
-    '36/4',
-    '360%',
-    '360&ndash;361',
-    '360-day',
     '36009',
-    '36018',
-    '36044-45',
-    '36045',
-    '36052',
-    '36052-53',
-    '36062',
-    '36067',
-    '36073',
-    '360777',
-    '36086',
-    '361,000',
-    '36102',
-    '3614',
-    '36171',
-    '36180',
     '36189',
-    '36190',
-    '36200',
-    '36212',
-    '36227',
-    '36236',
-    '36237',
-    '36239-40',
-    '36244',
-    '36257',
-    '36264-65',
-    '36266',
-    '36267',
-    '36278',
-    '36281-82',
-    '36288',
     '36293',
-    '36294',
-    '36296',
-    '363.30',
-    '36300',
-    '36310',
-    '36322',
-    '36337-42',
-    '36347-48',
-    '36352-53',
-    '36355',
-    '36361-63',
-    '36365',
-    '36379',
-    '3638',
-    '36391',
     '36392',
-    '36394-95',
-    '36399',
-    '364,000',
-    '3640',
-    '36401',
-    '36405-06',
-    '36408',
-    '36414',
-    '36419',
-    '36425',
-    '36425-27',
-    '36429-30',
-    '36448-49',
-    '3645',
-    '36450',
     '36452',
-    '36453',
-    '36457',
-    '36462',
-    '36471',
-    '36476-77',
-    '36479-81',
-    '36481',
-    '36486',
-    '36487',
-    '36489',
-    '36491',
-    '36496',
-    '36499',
-    '364a',
-    '364p',
     '365&ndash;6',
-    '36504',
-    '36505-06',
-    '36506',
-    '36506-07',
-    '36521',
-    '36521-22',
-    '36529',
-    '36532',
-    '36535',
-    '36541-2',
-    '365433',
-    '36550',
-    '36555',
-    '36561',
-    '36566',
     '36572',
-    '36576-77',
-    '36578',
-    '36586',
-    '36596',
-    '366(1)',
-    '36601',
-    '36609',
-    '36610',
-    '36611',
-    '36614',
-    '36620',
-    '36627',
-    '36628',
-    '36629',
-    '36635-36',
     '36636',
-    '36640',
-    '36640-41',
-    '36641',
-    '36644',
-    '36649',
-    '36653-54',
-    '36656',
-    '36660',
-    '36663',
-    '36666-67',
-    '36669-70',
-    '36674',
-    '36676',
-    '36679',
-    '36688',
     '36692',
-    '36693',
-    '36695',
-    '367&ndash;8',
-    '36701',
-    '36704',
-    '36707',
-    '36711',
-    '36714',
-    '36734',
-    '36737',
-    '36738-39',
-    '36739-40',
-    '36743',
-    '36744-45',
-    '36745',
     '36747',
-    '36749-50',
-    '36751',
-    '36771',
-    '36774',
-    '36775',
-    '36783-84',
-    '36784',
-    '36791-92',
-    '367p',
-    '368.5',
-    '36800',
-    '36809',
-    '36812',
-    '36816-17',
-    '36819',
     '36821-22',
-    '36823',
-    '36828',
-    '36832',
-    '36842',
-    '36845',
-    '36846',
-    '36858',
-    '36859-60',
-    '36874-75',
-    '36880',
-    '36880-81',
-    '36881',
-    '36886-87',
-    '36889',
-    '36890',
     '36894',
-    '36894-95',
-    '36899',
-    '3690',
-    '36901',
-    '36906',
-    '36907-08',
-    '36912',
-    '36918',
-    '36923',
-    '36931',
-    '36932',
-    '36933',
-    '36934',
-    '36942',
-    '36946',
     '36957',
-    '36960',
-    '36966',
-    '36967',
-    '36969',
-    '3697',
-    '36988-89',
-    '36990',
-    '3699895',
-    '369p',
-    '36ha',
-    '36k',
-    '36lb',
-    '36t',
-    '37&ft',
-    '37&ndash;13',
     '37&ndash;260',
-    '37&ndash;4',
-    '37&ndash;41',
-    '37&ndash;42',
-    '37&ndash;9',
-    '37(2)',
-    '37(3)',
-    '37,993',
-    '37-year',
-    '37.2%',
-    '37.24',
-    '37.8&deg;c',
-    '37.90p',
-    '37/38',
-    '37/39',
-    '370&mgr;m',
     '37000',
-    '37011',
-    '37012',
-    '37013',
-    '37016',
-    '37017',
-    '37018',
-    '37021',
-    '37024-25',
-    '37024-26',
-    '37025-26',
-    '37029',
-    '3703',
-    '37034',
-    '37039-40',
-    '37041-42',
     '37046',
-    '37048-49',
-    '37049',
-    '37051-52',
-    '37056-57',
-    '37059',
-    '37061',
-    '37075',
-    '37077',
-    '37079',
-    '37085',
-    '37089',
-    '37090',
-    '37095-96',
-    '37098',
-    '37099',
     '370a',
-    '370m',
-    '370s',
-    '371,000',
-    '37107-09',
-    '37118',
-    '37120',
-    '37122-23',
-    '37123-24',
-    '37127',
-    '37136',
-    '37142',
-    '37143',
-    '37146',
-    '37150-51',
-    '371527',
     '37155',
-    '37156',
-    '37162',
-    '37164',
-    '37177-79',
-    '37180',
-    '37187',
-    '37190',
-    '37194-95',
-    '37199-200',
-    '372,081',
-    '372.5',
-    '3720',
-    '37203',
-    '37204',
-    '37205',
     '37208',
-    '37210',
-    '37210-11',
-    '37211',
-    '37213',
-    '37218',
-    '37221',
-    '37228',
-    '37232-34',
-    '37236-37',
-    '37237-38',
-    '37240-41',
-    '37246-47',
-    '37247-48',
-    '37248-49',
-    '37254',
     '37259-60',
-    '37261-62',
-    '37265-66',
-    '37271',
-    '37275',
-    '37280',
-    '37284',
-    '37289',
-    '37296',
-    '372p',
-    '373,804',
-    '37313-14',
-    '37315-16',
-    '37319-20',
-    '37320',
-    '37324',
     '37328-29',
-    '37329-30',
-    '37344',
-    '37345',
-    '37348',
-    '37354',
-    '37361',
-    '37361-62',
-    '37362',
-    '37362-63',
-    '37363',
-    '37363-64',
-    '37368',
-    '37368-69',
-    '37373-74',
-    '37387',
     '37392-93',
-    '37398',
-    '373a',
-    '374&ndash;375',
-    '37401',
-    '37407',
-    '37409',
-    '37412-13',
-    '37424',
-    '37428-29',
-    '37433',
-    '37446-47',
-    '37447',
-    '37455-56',
-    '37456',
-    '37456-57',
     '37459',
-    '37459-60',
-    '37460',
-    '37461',
-    '37464',
-    '37470-71',
-    '37473-74',
-    '37477',
-    '37478',
-    '37481',
-    '37484',
-    '37488',
-    '37494',
-    '37495',
-    '37498',
-    '375(1)',
     '375,972',
-    '3750',
-    '37502',
-    '37508',
-    '37515',
-    '37516',
-    '37520',
-    '37520-21',
-    '37521-22',
-    '37532-33',
-    '37537-38',
-    '37539',
-    '37539-40',
-    '37553',
-    '37554',
-    '37557',
     '37559',
-    '37561',
-    '37567',
-    '37571',
-    '37577',
-    '37578',
-    '37580',
-    '37585',
-    '37589',
-    '37591',
-    '37592-93',
-    '37595',
-    '375mm',
-    '37601',
-    '37601-02',
-    '37606',
     '37610-11',
-    '37612-13',
-    '37613-14',
-    '37616',
-    '376252',
-    '37626-27',
-    '37628-29',
-    '37631',
-    '37632-35',
-    '37638',
-    '37644-45',
-    '37647',
-    '37650-51',
-    '37657-58',
-    '37661-62',
-    '37667-68',
     '37672',
-    '37676-77',
-    '37699',
-    '37699-700',
-    '377,815',
-    '37703-04',
-    '37713-14',
-    '37716-17',
-    '37721-22',
-    '37725',
-    '37731-32',
-    '37733',
-    '37739',
-    '37743',
-    '37746-47',
-    '37748',
     '37749',
-    '37751',
-    '37758-60',
-    '37770-71',
-    '377713',
-    '37772-73',
-    '37774-75',
-    '37775-76',
-    '37776',
-    '37780-81',
-    '37782-83',
-    '37785-86',
-    '37788',
-    '37792-93',
-    '37795-96',
-    '37799',
     '37799-800',
-    '377c',
-    '378&ndash;9',
-    '37804',
-    '37805',
-    '37813',
-    '37819',
-    '37822-23',
-    '37823',
-    '37827',
-    '37828-29',
-    '37840-41',
-    '37841-42',
-    '37850-51',
-    '37852-53',
-    '37856-57',
     '3786',
-    '37860-61',
-    '37864-65',
-    '37870-71',
-    '37870-72',
-    '37878',
-    '37887',
-    '37888-89',
-    '37895',
-    '37907-08',
-    '37927-28',
-    '37936',
-    '37937-38',
-    '37938',
-    '37941-42',
-    '37944',
     '37950-51',
-    '37952',
-    '37952-53',
-    '37955-56',
-    '37956-57',
-    '37967-68',
-    '37975',
-    '37984',
-    '37991',
-    '37994-95',
-    '37996',
-    '37998',
-    '37999',
-    '37cm',
-    '37ft',
-    '37m',
     '37sec',
-    '37t',
-    '37year-old',
-    '38&deg',
-    '38&ndash;0',
-    '38&ndash;114',
-    '38&ndash;46',
-    '38&sol;81',
-    '38(1)',
-    '38(6)',
-    '38,439.10',
-    '38,800',
-    '38,915.87',
-    '38-11',
-    '38-footer',
-    '38.4&deg;c',
     '38.5&deg;c',
-    '38.57',
-    '38.99',
-    '380&ndash;384',
-    '380-384',
-    '3801',
-    '38012',
-    '38016',
-    '38017-18',
-    '38019-20',
-    '38023-24',
-    '38026-27',
-    '3806',
-    '38078',
-    '38078-79',
-    '38078-80',
     '38080',
-    '38082',
-    '38084',
-    '38085-86',
-    '38089',
-    '38090',
-    '38091',
-    '380kg',
-    '38104-05',
-    '38109-10',
-    '38111-12',
-    '38113-14',
-    '38121',
-    '38126',
-    '38137',
-    '38139',
     '38147-48',
-    '38152-53',
-    '38154-55',
-    '38157-58',
-    '38175-76',
-    '38176',
-    '38177-78',
-    '38182',
-    '38182-83',
-    '38187-88',
-    '38195',
-    '38196',
-    '38197-98',
-    '382&ndash;383',
-    '38203-04',
-    '38205',
     '38221-22',
-    '38231',
-    '38259',
-    '38260',
-    '38270',
-    '38270-71',
-    '38278-79',
-    '38282',
-    '38284',
-    '38285',
-    '38295-96',
-    '38297-98',
-    '38299-300',
-    '38300-01',
-    '38304',
-    '38307-08',
     '38328',
-    '38335',
-    '38339-40',
-    '38345-46',
-    '38348-49',
-    '38349',
-    '38367',
-    '38373-76',
-    '38374',
-    '38377',
-    '38379-80',
-    '38386',
-    '383p',
-    '38401',
-    '38415',
-    '38417',
     '38420-22',
-    '38421',
-    '38430-31',
-    '38437-38',
-    '38443-44',
-    '38444-45',
-    '38445-46',
-    '38453',
-    '38454',
-    '38464',
-    '38479',
-    '3848',
-    '38497',
-    '384k',
-    '385,000',
-    '38505',
     '38506',
-    '38510',
-    '38510-11',
-    '38527',
-    '38533-34',
-    '38534-35',
-    '38535-36',
-    '38542',
-    '38543',
-    '38549',
-    '3855',
-    '38569-70',
-    '38572',
-    '38574',
-    '38584',
-    '38584-85',
     '38592',
-    '38594',
-    '385th',
-    '386&ndash;387',
-    '386,000',
-    '38600',
-    '38601',
-    '38620',
-    '38623',
-    '38628',
-    '38631',
-    '38662-63',
-    '38664',
-    '38678',
-    '38681-82',
-    '38688',
     '38692',
-    '38697',
-    '386i',
-    '386max',
-    '386sx/25c',
-    '387,000',
-    '387,500',
-    '38702',
-    '38704-05',
-    '38707',
-    '38711-12',
-    '38713',
-    '38714-15',
-    '38719',
-    '38719-20',
-    '38720',
     '38720-21',
-    '38731-32',
-    '38736',
-    '3874',
-    '38747',
-    '38752-53',
-    '38756',
-    '38759',
-    '38766-67',
-    '38768',
-    '38769',
-    '38771-72',
-    '38772',
-    '38774',
-    '38790-91',
-    '38791',
     '38793',
-    '38795',
-    '387p',
-    '38801',
-    '38801-02',
-    '38809-10',
-    '38810',
-    '38812',
-    '38815-16',
-    '38818-19',
-    '38823-24',
-    '38847-48',
-    '38848-49',
-    '38859',
-    '38861',
-    '38864',
     '38870',
-    '38876',
-    '38877-78',
-    '38895-96',
-    '38896-97',
-    '38900',
-    '38908',
-    '38911',
-    '38912',
-    '38925-26',
-    '38929',
-    '3893',
-    '38931-32',
-    '38932',
-    '38933',
-    '38934',
     '38939',
-    '3894',
-    '38945',
-    '38945-47',
-    '38954-55',
-    '38955',
-    '38956',
-    '38962',
-    '38972-73',
-    '38992',
-    '38997-98',
-    '389p',
-    '38f',
-    '38ins',
-    '38sec',
-    '39&ins',
     '39&ndash;41',
-    '39&sol;75',
-    '39&sol;79',
-    '39(6)',
-    '39-43',
-    '39-hour',
-    '39-month',
-    '39.3%',
-    '39.5&deg;c',
-    '39.58',
-    '39.71',
-    '39.85',
-    '39.96',
-    '39/6',
-    '390,759',
-    '390/l',
     '39000-01',
-    '39003-04',
-    '39004',
-    '39014',
-    '39023-24',
-    '39024',
-    '39027-28',
-    '39028',
-    '39029',
-    '39038',
-    '39041-42',
-    '39054',
-    '39056',
-    '39057',
-    '3906',
-    '39060',
     '39061-62',
-    '39063',
-    '39065',
-    '39065-66',
-    '39067',
-    '39078-79',
-    '39082',
-    '39083',
-    '39096',
-    '39097',
-    '39097-98',
-    '39102',
-    '39112',
-    '39113',
-    '39114',
-    '39126-27',
     '39130-31',
-    '39131',
-    '39143',
-    '39147',
-    '39149',
-    '3915',
-    '39153',
-    '39154',
-    '39160',
-    '39162',
-    '39166',
-    '39180',
-    '39184',
-    '39185',
-    '39187',
-    '39191',
     '39202',
-    '39207',
-    '39212',
-    '39225',
-    '39250',
-    '3934',
-    '3935',
-    '39350',
-    '393p',
-    '394,000',
-    '394.2',
-    '3950',
-    '395p',
-    '396,000',
-    '396,200',
-    '396-seat',
     '396/90',
-    '396p',
-    '3970',
-    '3974',
-    '398p',
-    '3990',
-    '3991',
-    '3999',
-    '39990',
-    '399p',
-    '39km',
-    '39th-minute',
-    '3:1&ndash;13',
-    '3:1&ndash;8',
-    '3:19:4',
-    '3:20',
     '3:3&ndash;8',
-    '3:30pm',
-    '3:33',
-    '3:34',
-    '3:35',
-    '3:3:0',
-    '3:40',
-    '3:48',
-    '3:7&ndash;10',
-    '3:7&ndash;9',
-    '3:9',
-    '3a10',
-    '3an',
-    '3b(2)',
-    '3bb',
-    '3bc',
     '3bn',
-    '3bw.',
-    '3cu',
-    '3dl',
-    '3dr',
-    '3ed',
-    '3ee',
-    '3emes',
-    '3er',
-    '3ff',
-    '3g',
-    '3g8',
-    '3hh',
-    '3inches',
-    '3jq',
-    '3jt',
     '3jw',
-    '3jx',
-    '3k&ohm',
-    '3lg',
-    '3lq',
-    '3ls',
-    '3mos',
-    '3n-dimensional',
-    '3ng',
-    '3nr',
-    '3nt',
-    '3oz.',
-    '3pd',
-    '3ph',
-    '3pr',
-    '3pw',
     '3qn',
-    '3rd&ndash;7th',
-    '3rd-4th',
-    '3rhe',
-    '3sec',
-    '3sf',
-    '3sq',
-    '3st',
-    '3t/acre',
-    '3tj',
-    '3u',
-    '3w1',
-    '3x/400',
-    '3xx',
-    '4&frac12%',
-    '4&frac12&ft',
     '4&frac14',
-    '4&frac14%',
-    '4&frac14;-mile',
-    '4&gt;4.9%',
-    '4&mdash;5',
-    '4&mdash;6',
-    '4&mgr;gml',
-    '4&micro;g',
-    '4&middot;6',
-    '4&ndash;1/2',
-    '4&ndash;12&ndash;0',
-    '4&ndash;13&ndash;0',
-    '4&ndash;17',
-    '4&ndash;18',
-    '4&ndash;19',
-    '4&ndash;2&ndash;0',
     '4&ndash;21',
-    '4&ndash;24',
-    '4&ndash;3&ndash;3',
-    '4&ndash;36',
-    '4&ndash;37',
-    '4&ndash;4&frac12;lb/1.8&ndash;2kg',
-    '4&ndash;49',
-    '4&ndash;5&deg',
-    '4&ndash;53',
-    '4&ndash;54',
-    '4&ndash;7&ndash;0',
-    '4&ndash;october',
-    '4&shilling;6d',
-    '4&sol;5',
-    '4&sol;76',
-    '4\'',
     '4(c)',
-    '4+1',
-    '4+4',
-    '4,000&ndash;0yrbp',
-    '4,000-acre',
-    '4,000-foot',
-    '4,000-member',
-    '4,000-plus',
-    '4,000-year',
-    '4,000ft',
-    '4,000kg',
-    '4,000lb',
-    '4,020',
-    '4,033',
-    '4,046',
-    '4,120',
     '4,141',
-    '4,200-strong',
-    '4,250rpm',
-    '4,271',
-    '4,274',
-    '4,300mbq',
-    '4,301',
-    '4,302',
-    '4,309',
-    '4,348',
-    '4,350',
-    '4,365',
-    '4,444',
-    '4,451',
-    '4,454',
-    '4,5,6,7',
     '4,500-strong',
-    '4,552',
-    '4,600kg',
-    '4,624',
-    '4,647',
-    '4,660',
-    '4,691',
-    '4,700,000',
-    '4,790',
-    '4,800,000',
-    '4,800bps',
-    '4,834',
-    '4,848',
-    '4,886',
-    '4,896',
-    '4,921',
     '4,935',
-    '4-46',
-    '4-band',
-    '4-d',
-    '4-for-1',
-    '4-lb/&pound;7.29',
-    '4-o',
-    '4-port',
-    '4-s',
-    '4-skins',
-    '4-space',
-    '4-stringer',
-    '4-tonne',
-    '4-week',
-    '4.00p.m.',
-    '4.01.43',
     '4.02.52',
-    '4.04.31',
-    '4.05pm',
-    '4.06',
-    '4.07',
-    '4.0kb',
-    '4.12(a)',
-    '4.12(b)',
-    '4.13(b)',
-    '4.13.0',
-    '4.13.3',
-    '4.14(c)',
-    '4.15%',
-    '4.16(a)',
-    '4.16(b)',
-    '4.17(b)',
     '4.236',
-    '4.24&ndash;6',
-    '4.2gb',
-    '4.3(2)',
-    '4.3(c)',
-    '4.3.',
-    '4.35pm',
-    '4.36',
-    '4.39',
-    '4.3b',
-    '4.3p',
-    '4.3pc',
-    '4.4.',
-    '4.4.5',
-    '4.4.7',
-    '4.41',
     '4.42',
-    '4.43%',
-    '4.44',
-    '4.48',
-    '4.4fl.',
-    '4.4pc',
-    '4.5&deg;c',
-    '4.5&ins',
-    '4.5(c)',
-    '4.5.2.3',
-    '4.5.4',
-    '4.5.5',
-    '4.5/',
-    '4.55pm',
-    '4.55pm/4.05pm',
-    '4.5a',
     '4.5b',
-    '4.5cm',
-    '4.5kb',
-    '4.6.4',
-    '4.62',
-    '4.65',
-    '4.66',
-    '4.67',
-    '4.6kb',
-    '4.6pc',
-    '4.7.0',
-    '4.7.3',
-    '4.72',
-    '4.76',
-    '4.77',
-    '4.7:1',
     '4.7a',
-    '4.7b',
-    '4.7p',
-    '4.8.1',
-    '4.83',
-    '4.84',
-    '4.85%',
-    '4.86&ndash;2.38',
-    '4.8:1',
-    '4.8v',
-    '4.9.1',
-    '4.9.3',
-    '4.93',
-    '4.97',
-    '4.99',
-    '4.9a',
     '4.9m',
-    '4.9secs',
-    '4/0',
-    '4/11',
-    '4/120',
-    '4/13',
-    '4/180&amp;c/350&amp;f',
-    '4/25sl',
-    '4/33',
-    '4/350f/180c',
-    '4/5&ndash;0',
-    '4/80',
-    '4/86',
-    '4/9',
-    '4/90',
-    '4/92',
     '4/93',
-    '4/f',
-    '4/lg',
-    '4/the',
-    '40%&ndash;50%',
-    '40%&ndash;60%',
-    '40&amp;shilling.',
-    '40&deg;f',
-    '40&deg;n',
-    '40&deg;w',
-    '40&ft',
-    '40&ndash;14',
-    '40&ndash;15',
-    '40&ndash;2',
-    '40&ndash;200',
-    '40&ndash;30',
     '40&ndash;4',
-    '40&ndash;42',
-    '40&ndash;45min',
-    '40&ndash;46',
-    '40&ndash;47',
-    '40&ndash;50,000',
-    '40&ndash;55',
-    '40&ndash;59',
-    '40&ndash;64',
-    '40&ndash;70%',
-    '40&shilling',
-    '40,000-word',
-    '40,000ft',
-    '40,000th',
-    '40,200',
-    '40-kilometre',
     '40-something',
-    '40-year-olds',
-    '40.16',
-    '40.22',
-    '40.26',
-    '40.27',
-    '40.4',
-    '40.84',
-    '40/1',
-    '40/41',
-    '40/50',
-    '400+',
-    '400-acre',
-    '400-mile',
-    '400/400s',
-    '4000/620',
     '4000er',
-    '4000gns',
-    '4001b',
-    '4005',
-    '4007',
-    '400asa',
-    '400e',
-    '400g/1lb',
-    '400hz',
-    '400km',
-    '400ml/14fl',
-    '400mph',
-    '400mw',
-    '4010',
-    '40106',
-    '40160',
     '4017b',
-    '4019',
-    '402&ndash;8',
-    '402(1)',
-    '402,000',
-    '402,617',
-    '402770',
-    '402nd',
-    '402p',
-    '403,000',
-    '40330',
-    '4035',
-    '403a',
-    '4040',
-    '4051',
-    '405nm',
     '406,752',
-    '4069',
-    '407,000',
-    '4070',
-    '40700',
-    '4078',
-    '4095',
-    '40:1',
-    '40du',
-    '40ff',
-    '40hp',
-    '40hr',
-    '40km/25mls',
-    '40mbyte',
-    '40ngml',
-    '40pts',
     '40sec',
-    '40z',
-    '41&mdash;2',
-    '41&ndash;43',
-    '41&ndash;6',
-    '41(11)',
-    '41,000,000',
-    '41,293',
-    '41,667',
-    '41.',
-    '41.1%',
-    '41.4%',
-    '41.5%',
-    '41.6mhz',
-    '41.7%',
-    '41.9',
     '41.9547',
-    '410&ndash;414',
-    '410222',
-    '4104mph',
-    '410nm',
-    '410p',
-    '411037',
-    '41131',
-    '411g',
-    '4120',
-    '412th',
-    '413,000',
-    '4133',
-    '414&ndash;15',
-    '414,000',
-    '414843',
     '415&ndash;413',
-    '4155',
-    '4157',
-    '416369',
-    '4170',
-    '4173',
-    '4184',
-    '419,000',
-    '41970',
-    '41c',
-    '41in',
-    '41mpg',
-    '42&deg',
-    '42&frac12',
-    '42&ndash;108777',
-    '42&ndash;81',
     '42&percnt',
-    '42(1)',
-    '42(6)',
-    '42,800',
-    '42-17',
-    '42-20',
-    '42-day',
-    '42.7',
-    '42.9%',
-    '420,000-strong',
-    '420000',
-    '420nm',
-    '4211',
-    '42271',
-    '423(2)',
-    '4236',
     '423p',
-    '4240',
-    '425&deg;s',
-    '425045',
-    '4253',
-    '425382',
-    '4256',
-    '425g',
-    '425v',
-    '4260',
-    '4262',
-    '426444',
-    '42690',
-    '4272',
-    '427271',
-    '428.6%',
     '4281',
-    '4285',
-    '429,000',
-    '4293',
-    '42c',
-    '42k',
-    '42kg',
-    '42m',
-    '42pp',
-    '42specint92',
-    '43&frac12',
-    '43&ndash;44',
-    '43&ndash;46',
-    '43&ndash;47',
-    '43&ndash;48',
-    '43&ndash;50',
     '43&ndash;53',
-    '43&ndash;57g',
-    '43\'w',
-    '43(8)',
-    '43,262',
-    '43,300',
-    '43,355',
-    '43,490',
-    '43-member',
-    '43.2%',
-    '43.34',
-    '43.9%',
-    '43/20',
-    '430e',
-    '430k',
-    '43150',
     '431bc',
-    '431p',
-    '4323',
-    '432mb',
-    '43370',
-    '43390',
-    '43500',
-    '4360',
-    '436451',
-    '4367',
-    '4368',
-    '436p',
-    '437p',
-    '438,000',
-    '438,317',
-    '438181',
     '4383',
-    '439%',
-    '43b',
-    '43mb',
-    '43secs',
-    '44&deg;c',
-    '44&ins',
-    '44&ndash;131',
-    '44&ndash;22614',
-    '44&ndash;3',
-    '44&ndash;45',
-    '44&ndash;47',
-    '44&ndash;6',
-    '44\'x32\'',
-    '44(1a)',
-    '44(4)',
     '44(7)',
-    '44(a)',
-    '44-acre',
-    '44-point',
-    '44-tonne',
-    '44.',
-    '44.0',
-    '44.07',
-    '44.4%',
-    '44.47secs',
-    '44.7',
-    '44/10',
-    '44/107',
-    '44/124',
-    '44/142',
-    '44/15',
     '44/2',
-    '44/205',
-    '44/229',
-    '44/27',
-    '44/48',
-    '440&mdash;1',
-    '440-megawatt',
-    '44010',
-    '4404',
-    '440ml',
-    '441.6',
-    '44115&ndash;1100',
-    '44122',
-    '441338',
-    '441339',
-    '442,000',
     '4420',
-    '442f',
-    '4440',
-    '444971',
-    '4451',
-    '446,681',
-    '44610',
-    '4466',
-    '446600',
-    '4469',
-    '4470',
-    '4473',
-    '44767',
-    '4486',
-    '44871',
-    '44b',
     '44in',
-    '44lbs',
-    '44m',
-    '44pts',
-    '44s',
-    '44sec',
-    '45&ndash;54',
-    '45&ndash;55%',
-    '45&ndash;60min',
-    '45&percnt',
-    '45&times;60',
-    '45(1)',
-    '45(7)',
-    '45,500',
-    '45,622',
-    '45-mile',
     '45-page',
-    '45.',
-    '45.1',
-    '45.14',
-    '45.26',
-    '45.3%',
-    '45.44secs',
-    '45.5kg',
-    '45.82p',
-    '45.9%',
-    '45/1',
-    '45/176',
-    '45/55',
-    '45/78',
-    '450&ndash;500',
-    '450&ndash;700',
     '45009',
-    '4506',
-    '450bp',
-    '450f',
-    '450hp',
-    '450k',
-    '450m',
-    '45110',
-    '45128',
-    '452,000',
-    '453918',
-    '454g',
-    '454p',
-    '456,976',
-    '4562',
-    '4566',
     '456gt',
-    '456p',
-    '458&ndash;810',
-    '458,000',
-    '458/7',
-    '4581',
-    '459,000',
-    '4596',
-    '45:9',
-    '45a',
-    '45b',
-    '45f',
-    '45f5',
-    '45jy',
-    '45kg',
-    '45metre',
     '45mpg',
-    '45secs',
-    '46&frac12',
-    '46&ft',
-    '46&sol;76',
-    '46,000,000',
-    '46,180',
-    '46-chromosome',
-    '46.',
-    '46.0',
-    '46.50',
-    '46.8',
-    '46.8%',
-    '46.9%',
-    '460%',
-    '460&ndash;446',
     '460-member',
-    '460-seat',
-    '460211',
-    '4604',
-    '460mm',
-    '461,000',
-    '4610',
-    '461221',
-    '4618',
-    '462,840',
-    '4631',
-    '463900',
-    '465kg',
-    '4669',
-    '466se/dsa',
-    '467000',
     '4679',
-    '468-641',
-    '4684',
-    '469&ndash;5469',
-    '469,000',
-    '46a',
-    '46b',
-    '46cm/18in',
-    '46ft',
-    '46pm',
-    '46s.8d',
-    '47&ndash;138',
-    '47&ndash;43',
-    '47&ndash;533',
-    '47&ndash;9',
-    '47,200',
     '47,400',
-    '47,500',
-    '47,520',
-    '47-goal',
-    '47-yard',
-    '47-year',
-    '47.1f',
-    '47/7',
-    '470&ndash;460',
-    '4700rpm',
-    '470ft',
-    '4711',
-    '473&ndash;5',
-    '4734',
-    '4737',
-    '47383',
     '473mph',
-    '475,442',
-    '4750',
-    '475kg',
-    '475p',
-    '477,000',
-    '4772',
-    '477p',
-    '478,000',
-    '478p',
-    '4793',
-    '47cm',
-    '47k',
-    '47lb',
-    '47sec',
-    '47th-minute',
     '48&ndash;47',
-    '48&ndash;50',
-    '48&ndash;72',
-    '48,072',
-    '48,600',
-    '48-lite',
-    '48-strong',
-    '48-x',
-    '48.0%',
-    '48.3',
-    '48.8%',
-    '48.84p',
-    '480&ndash;470',
-    '4800/320',
-    '4800/330',
-    '4800/360',
     '4800rpm',
-    '480mb',
-    '480mhz',
-    '4818',
-    '481919',
-    '48226',
-    '482611',
-    '482p',
-    '483024',
-    '483768',
-    '4848',
-    '484ft',
-    '485,000',
-    '4850',
-    '4850158',
-    '485079',
     '486/50',
-    '486/l',
-    '486/t',
-    '4860mp',
-    '486dx/33',
-    '486e',
-    '486p',
-    '486s',
-    '486s/25',
-    '486slc2',
-    '48773',
-    '487p',
-    '4888',
-    '489&ndash;493',
-    '489,000',
-    '48bhp',
     '48c',
-    '48km/30mls',
-    '48m',
-    '48mm',
-    '49&ndash;53',
-    '49&ndash;95',
-    '49,500',
-    '49,700',
-    '49.',
-    '49.0',
-    '49.2%',
-    '49.5%',
-    '49.6%',
-    '49.7%',
-    '49.9%',
-    '49/5a',
     '490&ndash;sd&ndash;1991',
-    '4907',
-    '491&ndash;518',
-    '491p',
-    '4929',
-    '493&ndash;5',
-    '4936',
-    '4941',
-    '494p',
-    '4950',
-    '496-member',
-    '4970',
-    '497p',
-    '498,000',
-    '498.9m',
-    '4995',
     '49:6',
-    '49a',
-    '49c',
-    '4:1&ndash;7',
-    '4:1,14',
-    '4:16.1',
-    '4:19',
-    '4:2',
-    '4:24&ndash;26',
-    '4:30pm',
-    '4:35&ndash;41',
-    '4:38',
-    '4:4:2',
-    '4:5',
-    '4:54.6',
-    '4:7',
     '4ay',
-    '4b\'s',
-    '4bb',
-    '4bhp',
-    '4cu',
-    '4dd',
-    '4ee',
-    '4eh',
-    '4hs',
-    '4in.',
-    '4inch',
-    '4kg',
-    '4l73',
-    '4le',
-    '4lq',
-    '4m-bit',
     '4ml/hour',
-    '4nd',
-    '4ng',
-    '4nn',
-    '4oth',
-    '4oz/&pound;4.99',
-    '4oz/&pound;9.95',
-    '4oz/125g',
-    '4pf',
-    '4pital',
-    '4qj',
-    '4qr',
-    '4qt',
-    '4qx',
-    '4r',
-    '4rd',
     '4rh',
-    '4sp',
-    '4tb',
-    '4th-century',
-    '4th.',
-    '4ts',
-    '4ul',
-    '4v',
-    '4ws',
-    '4ww',
-    '4x100',
-    '4x50m',
-    '4x8inches',
-    '4yrs',
-    '5&frac12;in',
-    '5&frac14;p',
     '5&ft;7&ins',
-    '5&mdash;17',
-    '5&mdash;30(1)',
-    '5&mdash;44',
-    '5&mdash;6',
-    '5&mdash;7&frac12;p',
-    '5&mgr;g',
-    '5&mgr;l',
-    '5&micro;m',
-    '5&ndash;1&ndash;1',
-    '5&ndash;10mcg/kg',
-    '5&ndash;14&ndash;0',
-    '5&ndash;15%',
-    '5&ndash;161',
-    '5&ndash;37',
-    '5&ndash;39',
     '5&ndash;41',
-    '5&ndash;43',
-    '5&ndash;46',
-    '5&ndash;49',
-    '5&ndash;53',
-    '5&ndash;6&ndash;0',
-    '5&ndash;6,000',
-    '5&ndash;60',
-    '5&ndash;7%',
-    '5&ndash;8%',
-    '5&ndash;99',
-    '5\'-cgcggatcccccaacacgcattttgtg',
-    '5\'-direction',
-    '5\'-sugar',
-    '5\'2',
-    '5\'ea',
     '5\'esv',
-    '5(7)',
-    '5(c)',
-    '5(d)',
-    '5(i)',
-    '5+2',
-    '5,000-gallon',
-    '5,000-year-old',
-    '5,000mev',
-    '5,000t',
-    '5,040',
-    '5,10,24,25',
-    '5,105',
-    '5,152',
-    '5,169',
-    '5,18',
     '5,200gns',
-    '5,225',
-    '5,241',
-    '5,280',
-    '5,340',
-    '5,360,000',
-    '5,364m',
-    '5,400m',
-    '5,413',
-    '5,433',
-    '5,450',
-    '5,500m',
-    '5,550',
-    '5,568',
-    '5,6,7',
-    '5,6,7,8',
     '5,600,000',
-    '5,622',
-    '5,624',
-    '5,670',
-    '5,700,000',
-    '5,733',
-    '5,750rpm',
-    '5,852m',
-    '5,933',
-    '5-12',
-    '5-14',
-    '5-19',
-    '5-21',
-    '5-29',
-    '5-3.',
-    '5-all',
     '5-amino',
-    '5-azacytidine',
-    '5-cent',
-    '5-cm',
-    '5-hour',
-    '5-irons',
-    '5-m',
-    '5-megawatt',
-    '5-minute',
-    '5-point',
-    '5-position',
-    '5-stage',
-    '5-woods',
-    '5.0&mgr;g',
-    '5.0.0',
-    '5.01%',
     '5.02',
-    '5.06',
-    '5.0w',
-    '5.1(a)',
-    '5.1.1.1',
-    '5.1.1.2',
-    '5.1.1.4',
-    '5.1.2.',
-    '5.1.2.1',
-    '5.1.2.3',
-    '5.1.2.4',
-    '5.1.6',
-    '5.1.8',
-    '5.1.9',
-    '5.10.2',
-    '5.12.1',
     '5.12.4',
-    '5.14c',
-    '5.15(a)',
-    '5.156.30pm',
-    '5.16&ndash;5.18',
-    '5.16.1',
-    '5.16.2',
-    '5.16a',
-    '5.16b',
-    '5.18(2)',
-    '5.18.2',
-    '5.19b',
-    '5.2.0',
-    '5.2/100000',
-    '5.20(a)',
-    '5.20(b)',
     '5.22b',
-    '5.25inch',
-    '5.26c',
-    '5.2c',
-    '5.2secs',
-    '5.3(c)',
-    '5.3.',
-    '5.3.0',
-    '5.3.10',
-    '5.3.9',
-    '5.30p.m.',
-    '5.36b',
-    '5.39b',
-    '5.3m',
-    '5.3pc',
-    '5.4(a)',
     '5.4(b)',
-    '5.40c',
-    '5.45am',
-    '5.4m',
-    '5.5&ins',
-    '5.5(a)',
-    '5.5-hour',
-    '5.5.',
-    '5.5.6',
-    '5.57',
-    '5.5a',
-    '5.5cm',
-    '5.5lb',
-    '5.6(f)',
-    '5.6.6',
-    '5.60',
     '5.62',
-    '5.67',
-    '5.7-day',
-    '5.72',
-    '5.79',
-    '5.7a',
-    '5.7pc',
-    '5.8&ndash;9',
-    '5.8.1.1',
-    '5.8.1.2',
-    '5.8.1.3',
-    '5.8.6',
-    '5.83',
-    '5.87',
-    '5.8m',
-    '5.9(a)',
     '5.9.10',
-    '5.9.2',
-    '5.9.3',
-    '5.9.4',
-    '5.9.6.1',
-    '5.9.6.2',
-    '5.9.6.3',
-    '5.9.6.5',
-    '5.9.6.6',
-    '5.9.6.7',
-    '5.9.6.8',
-    '5.95',
-    '5.98',
-    '5.99',
-    '5.99%',
-    '5/10/87',
     '5/16in',
-    '5/2',
-    '5/28',
-    '5/375f/190c',
-    '5/5',
-    '5/66',
-    '5/80',
-    '5/89',
-    '5/92',
-    '5/lg',
-    '50%&ndash;60%',
-    '50%-owned',
-    '50&deg&mdash;60&deg;n',
-    '50&mgr;gml',
-    '50&mgr;l',
-    '50&micro;t',
     '50&ndash;100mhz',
-    '50&ndash;125',
-    '50&ndash;150',
-    '50&ndash;4',
-    '50&ndash;51',
-    '50&ndash;52',
-    '50&ndash;60,000',
-    '50&ndash;60mph',
-    '50&ndash;65',
-    '50&ndash;6o&deg;c',
-    '50&ndash;75%',
-    '50&ndash;75g/2&ndash;3oz',
-    '50&ndash;80%',
-    '50&ogr',
-    '50&shilling',
-    '50&times;2.5cm/1in',
     '50,000-70,000',
-    '50,000-acre',
-    '50,000-odd',
-    '50,000th',
-    '50-6',
-    '50-60%',
-    '50-70',
-    '50-bed',
-    '50-bedroom',
-    '50-cent',
-    '50-kilometre',
-    '50-km',
-    '50-overs',
-    '50-piece',
-    '50-storey',
-    '50-ton',
     '50.00',
-    '50.1%',
-    '50.4%',
-    '50.55sec',
-    '50.70',
-    '50.72',
-    '50.8&times;76.2',
-    '500&mgr;m',
-    '500&micro;g',
-    '500&ndash;1286',
-    '500&ndash;700',
-    '500&ndash;800',
-    '500,000-piece',
-    '500-1,000',
-    '500-seat',
-    '500/500s',
     '5000&ndash;10,000',
-    '5001',
-    '50010',
-    '50015',
-    '500173',
-    '500400',
-    '50043',
-    '5005',
-    '5006',
-    '500c',
-    '500club',
-    '500ft/min',
-    '500g/1&frac14',
-    '500hz',
-    '500kgm',
-    '500km',
     '500w',
-    '5010',
-    '50100',
-    '5011',
-    '502&ndash;810',
-    '5025',
-    '5030',
-    '504,782',
-    '505,000',
-    '5053',
-    '507p',
-    '5093',
-    '5099',
-    '50:1',
-    '50ff',
-    '50g/',
     '50g/2',
-    '50hp',
-    '50kms',
-    '50mg/litre',
-    '50ng',
-    '50ns',
-    '50p.',
-    '50secs',
-    '50w',
-    '51&ndash;128',
-    '51&ndash;58',
-    '51&ndash;69',
-    '51&sol;87',
-    '51\'s',
-    '51(2)',
-    '51(6)',
     '51,100',
-    '51,136',
-    '51,200',
-    '51.05',
-    '51.2%',
-    '51.3%',
-    '51.8',
-    '51.9',
-    '510,625',
-    '51000',
-    '511&mdash;24',
-    '511&mdash;58',
-    '511&mdash;61',
-    '511,000',
-    '5110',
-    '5110500',
     '511245',
-    '5114',
-    '511kev',
-    '512-cpu',
-    '5122k',
-    '512gb',
-    '512mp',
-    '512tr',
-    '513,115',
-    '5136',
-    '51388',
-    '514.1',
-    '5144',
-    '514p',
-    '515.4',
-    '5155',
     '517p',
-    '51830',
-    '5186',
-    '5188',
-    '51cm',
-    '51mjy',
-    '51secs',
-    '51x56cms',
-    '52&deg;c',
-    '52&deg;f',
-    '52&frac12;p',
-    '52&ndash;0',
-    '52&ndash;333',
-    '52&ndash;54',
-    '52,560',
-    '52-minute',
     '52-storey',
-    '52.11',
-    '52.4',
-    '52.4%',
-    '52.7',
-    '52.7%',
-    '52.8%',
-    '52.9%',
-    '520&ndash;510',
-    '52021',
-    '520k',
-    '520kg',
-    '5210',
-    '521546',
-    '5218',
-    '5220',
     '5229',
-    '522h',
-    '523h',
-    '52400',
-    '525i',
-    '526&ndash;48',
-    '526&ndash;527',
-    '527&ndash;31',
-    '527&ndash;65',
-    '527mb',
-    '5283',
-    '528bp',
-    '5290',
-    '529p',
-    '52a',
-    '52b',
     '52cm',
-    '52gb',
-    '52m',
-    '52secs',
-    '52year-old',
-    '53&frac12',
-    '53&ndash;5',
-    '53&ndash;58',
-    '53&ndash;6',
-    '53&ndash;63',
-    '53&ndash;66',
-    '53&ndash;71',
-    '53&sol;81',
-    '53\'s',
-    '53(1)',
-    '53,371',
     '53-hour',
-    '53.',
-    '53.3%',
-    '53.4%',
-    '53.5&deg;n',
-    '53.7%',
-    '53.9',
-    '53.9%',
-    '530.1',
-    '5305',
-    '530k',
-    '5310',
-    '5315',
-    '532p',
-    '533,000',
-    '5337',
     '534&ndash;50',
-    '534&ndash;6',
-    '534.63',
-    '5347',
-    '535&ndash;43',
-    '535,000',
-    '535mb',
-    '535p',
-    '536740',
-    '5377',
-    '539a',
-    '53a',
-    '53c',
-    '53m',
-    '53secs',
-    '53x53cm',
     '54&deg',
-    '54&ndash;47',
-    '54&ndash;56',
-    '54&ndash;57',
-    '54&ndash;64',
-    '54(3)',
-    '54,400',
-    '54.0',
-    '54.03',
-    '54.2',
-    '54.6%',
-    '54.64secs',
-    '54.8%',
-    '540%',
-    '5400',
-    '54000',
     '540myr',
-    '540p',
-    '541,000',
-    '542-member',
-    '5421',
-    '543,965',
-    '54355',
-    '543p',
-    '544000',
-    '544484',
-    '54450',
-    '544535',
-    '5446',
-    '544p',
-    '5455',
-    '546-mile',
     '5472',
-    '5483',
-    '5484',
-    '549,000',
-    '54:2&ndash;3',
-    '54f',
-    '54s',
-    '55&deg;f',
-    '55&mdash;6',
-    '55&ndash',
-    '55&ndash;57',
-    '55&ndash;61',
-    '55&ndash;63',
-    '55&ndash;88%',
-    '55&ndash;9',
-    '55&percnt',
     '55(1)',
-    '55,100',
-    '55,56',
-    '55-64',
-    '55-second',
-    '55.2',
-    '55.25',
-    '55.3',
-    '55.30',
-    '55.5%',
-    '55.51',
-    '55.59',
-    '55.7',
-    '5500rpm',
-    '55019',
-    '5503',
     '550bhp',
-    '550l',
-    '550m/600yds',
-    '550xl',
-    '553,000',
-    '5533',
-    '554161',
-    '555,337',
-    '5559',
-    '555p',
-    '5569',
-    '5570',
-    '5574',
-    '5577',
-    '5585',
-    '559.15',
     '5592944',
-    '55bhp',
-    '55e',
-    '55ff',
-    '55mb',
-    '55s',
-    '55th-minute',
-    '56&deg;c',
-    '56&ins',
-    '56&ndash;71',
-    '56(4)',
-    '56,100,000',
-    '56,785',
-    '56-57',
-    '56-member',
-    '56.04',
     '56.5%',
-    '56.51',
-    '56.57',
-    '56.8',
-    '56.9%',
-    '560&ndash;600',
-    '5600gns',
-    '560s',
-    '5613',
-    '561p',
-    '5630',
-    '56353',
-    '5650',
-    '5653',
-    '5665',
-    '568m',
     '56kph',
-    '56pp',
-    '56s',
-    '56sec',
-    '56year',
-    '57&deg',
-    '57&frac12;p',
-    '57-60',
-    '57.0',
-    '57.16',
-    '57.4',
-    '57.4%',
-    '57.50',
-    '57.56',
-    '57.8',
-    '57.9%',
     '572&ndash;574',
-    '5720',
-    '573665',
-    '574p',
-    '575&mdash;96',
-    '575,000',
-    '5750g',
-    '5750rpm',
-    '5756',
-    '575g',
-    '576/sko2',
-    '5760',
-    '5764',
-    '5776',
-    '577733',
-    '5780',
     '57840',
-    '5785',
-    '578p',
-    '5790',
-    '57cm',
-    '57f',
-    '57kg',
-    '57pm',
-    '57r',
-    '57sec',
-    '57secs',
-    '57year-old',
-    '58%-owned',
-    '58&deg;c',
-    '58&deg;n',
-    '58&frac12',
     '58&mdash;60',
-    '58&ndash;64',
-    '58(4)',
-    '58,500',
-    '58.00',
-    '58.2%',
-    '58.3%',
-    '58.39',
-    '58.4%',
-    '58.5%',
-    '58.7%',
-    '58.7p',
-    '58.8',
-    '58.8%',
-    '58028',
-    '581p',
     '582,000',
-    '582,646',
-    '582/3',
-    '582p',
-    '583738',
-    '584&mdash;629',
-    '5848',
-    '584p',
-    '5855',
-    '5858',
-    '5860',
-    '587,041',
-    '5874',
-    '588.7k',
-    '5884',
-    '589/l',
     '58a',
-    '58pc',
-    '58secs',
-    '58th-minute',
-    '59&ndash;68',
-    '59(1)',
-    '59-member',
-    '59-style',
-    '59.1%',
-    '59.13',
-    '59.2',
-    '59.26',
-    '59.51',
-    '590&ndash;604',
-    '5900rpm',
-    '590p',
     '59101',
-    '5912',
-    '5927',
-    '592800',
-    '5930',
-    '594376',
-    '5951',
-    '595522',
-    '595c',
-    '5966',
-    '598232',
-    '5990',
-    '59ml',
-    '59no',
-    '59s',
-    '5:0',
     '5:1&ndash;20',
-    '5:10',
-    '5:12&ndash;16',
-    '5:14',
-    '5:16',
-    '5:18ff',
-    '5:20',
-    '5:21&ndash;24',
-    '5:22',
-    '5:22&ndash;23',
-    '5:23',
-    '5:25',
-    '5:25&ndash;34',
-    '5:3',
-    '5:30',
-    '5:31',
     '5:32',
-    '5:34',
-    '5:36',
-    '5:8',
-    '5:9',
-    '5_per',
-    '5a.',
-    '5a.6',
-    '5a/5b',
-    '5a3',
-    '5ab',
-    '5aj',
-    '5al',
-    '5ar',
-    '5b/c',
-    '5bn',
     '5bu',
-    '5du',
-    '5e11',
-    '5eh',
-    '5ess',
-    '5eu',
-    '5fl',
-    '5ft.',
-    '5gal',
-    '5hj.',
-    '5hr',
-    '5kg/10lb',
-    '5lf',
-    '5m/16ft',
-    '5ma',
-    '5mgml',
     '5micron',
-    '5mls',
-    '5mm/',
-    '5mph',
-    '5myr',
-    '5n3',
-    '5na',
-    '5nb',
-    '5ng',
-    '5nh',
-    '5nl',
-    '5ns',
-    '5op',
-    '5ozs',
-    '5per',
-    '5ppm',
     '5pts',
-    '5rt',
-    '5rx',
-    '5secs',
-    '5th/6th',
-    '5u',
-    '5wb',
-    '5xdenhardt',
-    '5xssc',
-    '6&amp;in',
-    '6&commat;1/2',
-    '6&frac12%',
-    '6&frac12&ndash;13',
-    '6&frac14',
-    '6&ft;2&ins',
-    '6&ft;4&ins',
     '6&mdash;10',
-    '6&middot;5cm',
-    '6&ndash;12&ndash;0',
-    '6&ndash;13',
-    '6&ndash;14',
-    '6&ndash;14&ndash;0',
-    '6&ndash;20',
-    '6&ndash;20%',
-    '6&ndash;24',
-    '6&ndash;25',
-    '6&ndash;39',
-    '6&ndash;53',
-    '6&ndash;55',
-    '6&ndash;7&ins',
-    '6&ndash;74',
-    '6&ndash;8%',
     '6&ndash;8&ndash;0',
-    '6&ndash;9&ndash;0',
-    '6&shilling;8d.',
-    '6&sol;1986&sol;104&sol;152',
-    '6&sol;76',
-    '6&sol;81',
-    '6\'s',
-    '6,000-plus',
-    '6,000-year-old',
-    '6,096',
-    '6,121',
-    '6,142',
-    '6,200,000',
-    '6,202,000',
-    '6,289',
-    '6,304ft',
     '6,342',
-    '6,349m',
-    '6,400yrbp',
-    '6,488',
-    '6,500,000',
-    '6,536',
-    '6,537m',
-    '6,586',
-    '6,680',
-    '6,920',
-    '6,929',
-    '6-&flat;7',
-    '6-19',
-    '6-aminopenicillanic',
-    '6-figure',
-    '6-in-1',
     '6-in-3-hours',
-    '6-litre',
-    '6-pixel',
-    '6-well',
-    '6.0&ndash;6.6',
-    '6.04',
-    '6.05',
-    '6.06',
-    '6.1.5',
-    '6.1.6',
-    '6.105',
-    '6.111',
-    '6.113',
-    '6.113(4)',
-    '6.115',
-    '6.132(2)',
     '6.14(b)',
-    '6.148(2)',
-    '6.156',
-    '6.15am',
-    '6.1million',
-    '6.2.3.1',
-    '6.2.3.3',
-    '6.2.8',
-    '6.20am',
-    '6.22am',
-    '6.22pm',
-    '6.3&ins',
-    '6.3.',
-    '6.3.0',
-    '6.38%',
-    '6.3b',
     '6.3bn',
-    '6.3fl',
-    '6.3gb',
-    '6.3m',
-    '6.3t/ha',
-    '6.4.0',
-    '6.4.6',
-    '6.47',
-    '6.4p',
-    '6.5&ndash;7.6',
-    '6.5-7.5',
-    '6.5.5',
-    '6.56',
-    '6.57',
-    '6.60',
-    '6.62',
     '6.625%',
-    '6.64',
-    '6.6pc',
-    '6.6secs',
-    '6.7&ins',
-    '6.7.3',
-    '6.75pc',
-    '6.77',
-    '6.78',
-    '6.79',
-    '6.8&ndash;7.2',
-    '6.81',
-    '6.82216',
-    '6.84',
-    '6.88%',
-    '6.89509',
     '6.8p',
-    '6.8secs',
-    '6.9(1)',
-    '6.9.1',
-    '6.9.2',
-    '6.9.4',
-    '6.9.5',
-    '6.93',
-    '6.93(3)',
-    '6.94',
-    '6.99',
-    '6.99%',
-    '6.9bn',
-    '6.9p',
-    '6.9pc',
-    '6/18',
     '6/2',
-    '6/200&deg;c/400&deg;f',
-    '6/36',
-    '6/4',
-    '6/700',
-    '6/89',
-    '6/900',
-    '6/91',
-    '6/kg',
-    '60&deg&ndash;64&deg;f',
-    '60&deg&ndash;72&deg;f',
-    '60&ndash;1',
-    '60&ndash;57',
-    '60&ndash;71',
-    '60&ndash;79',
-    '60&ndash;83',
     '60&ndash;85',
-    '60(2)',
-    '60,500',
-    '60-',
-    '60-80%',
-    '60-footer',
-    '60-gun',
-    '60-pdr',
-    '60-seat',
-    '60.1%',
-    '60.3',
-    '60.5%',
-    '60.6%',
-    '60.9%',
-    '60/',
-    '60/61',
     '60/70',
-    '600&ogr',
-    '600-seater',
-    '600.33',
-    '600/l',
-    '6000-mile',
-    '6000000',
-    '6000i',
-    '6000km',
-    '6000mw',
-    '6001',
-    '600400',
-    '600ad',
-    '600hp',
-    '600hz',
-    '600km',
     '600mph',
-    '601b',
-    '602.00',
-    '602232',
-    '6025',
-    '602832',
-    '604604',
-    '605%',
-    '605582',
-    '6060',
-    '60606',
-    '60631',
-    '606p',
-    '608p',
-    '609,000',
-    '6090',
     '6092dwk',
-    '6095',
-    '60c',
-    '60k',
-    '60metres',
-    '60ng',
-    '60o',
-    '60specint92',
-    '60th-minute',
-    '60v',
-    '61&deg;f',
-    '61&ndash;2',
-    '61&ndash;3',
-    '61&ndash;80',
-    '61&ndash;i',
-    '61&ndash;iv',
     '61&sol;86',
-    '61(4)',
-    '61,500',
-    '61.1%',
-    '61.2%',
-    '61.3',
-    '61.4%',
-    '61.6%',
-    '61.8',
-    '61.8%',
-    '61/84',
-    '610-based',
-    '61003',
-    '610734',
-    '610kb',
-    '611.5',
     '61145',
-    '6115',
-    '61158',
-    '611611',
-    '612p',
-    '613&ndash;615',
-    '6130',
-    '61312',
-    '614000',
-    '61445',
-    '6148',
-    '615,000',
-    '6153',
-    '6159',
-    '6164',
-    '6167',
     '616789',
-    '617,000',
-    '617p',
-    '617th',
-    '618,000',
-    '618ft',
-    '618p',
-    '61b',
-    '61cm',
-    '61min',
-    '62&deg&ndash;76&deg;f',
-    '62&deg&ndash;77&deg;f',
-    '62&ndash;3',
-    '62&ndash;4',
-    '62&ndash;64',
-    '62&ndash;68',
     '62(4)',
-    '62,076',
-    '62,100',
-    '62,365',
-    '62-3',
-    '62-63',
-    '62.0',
-    '62.2',
-    '62.2%',
-    '62.4%',
-    '62.5%',
-    '62.6',
-    '62.7%',
-    '62.71',
-    '6200rpm',
-    '620mm',
     '620p',
-    '620s',
-    '62123',
-    '621621',
-    '622,984',
-    '6221',
-    '6222',
-    '6223',
-    '622975',
-    '623/9&mdash;39',
-    '6230',
-    '6233',
-    '62355',
-    '6244',
-    '624p',
-    '625&ndash;6',
     '625p',
-    '626&ndash;627',
-    '626/7',
-    '629&ndash;631',
-    '62mb',
-    '62nd-minute',
-    '62pc',
-    '63&ndash;67',
-    '63&ndash;94',
-    '63&sol;86',
-    '63(ii)',
-    '63(v)',
-    '63,000,000',
-    '63,900',
-    '63.',
-    '63.0',
     '63.2%',
-    '63.6',
-    '63.6%',
-    '630&ndash;639',
-    '630-member',
-    '630-mile',
-    '6300rpm',
-    '630s',
-    '6318',
-    '632&mdash;c.',
-    '632a',
-    '634&mdash;57',
-    '6344',
-    '635,000',
-    '6352',
-    '635p',
     '6363',
-    '63680',
-    '637,657',
-    '63771',
-    '638,000',
-    '6387',
-    '6393',
-    '63a',
-    '63f.',
-    '63k/240k',
-    '63mm',
-    '64&deg&ndash;77&deg;f',
-    '64&ndash;128',
-    '64&ndash;5',
-    '64&ndash;65',
-    '64,000,000',
     '64,000-dollar',
-    '64,900',
-    '64-11',
-    '64-run',
-    '64.1',
-    '64.10',
-    '64.8',
-    '64.9%',
-    '640&ndash;64',
-    '640&ndash;646',
-    '6400/6800',
-    '64000',
-    '640m',
-    '640p',
-    '640x480',
-    '64180',
     '641917',
-    '641p',
-    '642,500',
-    '6424',
-    '643,000',
-    '6431',
-    '644993',
-    '6450',
-    '645p',
-    '646-1055',
-    '646p',
-    '647047',
-    '647934',
-    '6487',
-    '6497',
-    '649p',
     '64pp.',
-    '64th-minute',
-    '65%&sol',
-    '65&ndash;68',
-    '65&ndash;7',
-    '65&ndash;84',
-    '65&ndash;91',
-    '65&percnt',
-    '65(4)',
-    '65,536mb',
-    '65-70',
-    '65.1%',
-    '65.3',
-    '65.4%',
-    '65.5%',
-    '65.6%',
     '65.8%',
-    '65/1000',
-    '650,000,000',
-    '650-acre',
-    '650a',
-    '650e',
-    '650ft',
-    '650mm',
-    '650p',
-    '650s',
-    '651658',
-    '652,225',
-    '65270',
-    '6528',
-    '6534',
-    '6537',
     '653p',
-    '655,000',
-    '655p',
-    '6561',
-    '6580',
-    '6581',
-    '658179',
-    '658338',
-    '65b',
-    '65g',
-    '65g/2&frac12;oz',
-    '65min',
-    '65mph',
-    '65xe',
-    '66&deg&ndash;72&deg;f',
-    '66&deg&ndash;77&deg;f',
     '66&deg&ndash;78&deg;f',
-    '66&deg;c',
-    '66&ndash;69',
-    '66(3)',
-    '66-67',
-    '66.14',
-    '66.3%',
-    '66.4%',
-    '66.5%',
-    '66/1',
-    '6601',
-    '660809',
-    '660mm',
-    '6612704',
-    '6620',
-    '66320',
     '663869',
-    '66400',
-    '664p',
-    '6652',
-    '666666',
-    '666999',
-    '667p',
-    '668071',
-    '668072',
-    '66a',
-    '66m',
-    '66m-bytes',
-    '66min',
-    '66s',
-    '67&ndash;611',
-    '67&ndash;68',
     '67&ndash;8',
-    '67,420,000',
-    '67-foot',
-    '67.',
-    '67.1%',
-    '67.3%',
-    '67.5%',
-    '67.8',
-    '6702',
-    '670mp',
-    '670p',
-    '672,000',
-    '6727',
-    '6736',
-    '675,000',
-    '675680',
     '675g/1&amp;lb',
-    '676,552',
-    '67950',
-    '67ins',
-    '67k',
-    '67s',
-    '68&deg&ndash;74&deg;f',
-    '68&deg&ndash;76&deg;f',
-    '68&deg&ndash;80&deg;f',
-    '68&deg;f',
-    '68&ndash;4',
-    '68&ndash;73',
-    '68&ndash;84',
-    '68,200',
-    '68.',
-    '68.8',
     '68.8%',
-    '680&ndash;1',
-    '68009',
-    '6802',
-    '68020',
-    '68030-based',
-    '6806',
-    '68080',
-    '680g',
-    '680mb',
-    '68100',
-    '682,000',
-    '6825',
-    '6827',
-    '683000',
-    '68341',
     '6838',
-    '683p',
-    '6843',
-    '6845',
-    '684p',
-    '6865',
-    '687.9:331.2',
-    '6878633',
-    '688.47',
-    '6885377',
-    '6886',
-    '688e&ndash;f',
-    '68k',
-    '68min',
-    '69&deg',
-    '69&ndash;71',
     '69,300',
-    '69.',
-    '69.1',
-    '69.2',
-    '69.28',
-    '69.3p',
-    '69000',
-    '690p',
-    '691,200',
-    '693p',
-    '6942',
-    '6943',
-    '698,000',
-    '6981',
-    '6994',
-    '6:1&ndash;4',
     '6:11',
-    '6:14',
-    '6:17',
-    '6:30&ndash;44',
-    '6:45&ndash;52',
-    '6:48',
-    '6:8',
-    '6:9',
-    '6aa',
-    '6al',
-    '6ay',
-    '6b/c',
-    '6c8',
-    '6d6&ins',
-    '6db',
-    '6dg',
     '6dt',
-    '6ef',
-    '6ff',
-    '6g/&frac14;oz',
-    '6h-4h',
-    '6hb',
-    '6hr',
-    '6hrs',
-    '6hu',
-    '6inch',
-    '6inches',
-    '6kb',
-    '6khz',
-    '6kw',
-    '6la',
-    '6mhz',
     '6million',
-    '6min',
-    '6mph',
-    '6ne',
-    '6nh',
-    '6nm',
-    '6ns',
-    '6per',
-    '6qt',
-    '6rh',
-    '6td',
-    '6u',
-    '6x4',
-    '6xj',
-    '7&agr;-hydroxylase',
-    '7&frac12;oz',
     '7&frac14;p',
-    '7&ft&frac14&ins',
-    '7&ft;6&ins',
-    '7&middot;5cm',
-    '7&ndash',
-    '7&ndash;08',
-    '7&ndash;1/2',
-    '7&ndash;10&ndash;0',
-    '7&ndash;11pm',
-    '7&ndash;27',
-    '7&ndash;28',
-    '7&ndash;29',
-    '7&ndash;31',
-    '7&ndash;32',
-    '7&ndash;33',
-    '7&ndash;35',
     '7&ndash;36',
-    '7&ndash;38',
-    '7&ndash;41',
-    '7&ndash;42%',
-    '7&ndash;45',
-    '7&ndash;47',
-    '7&ndash;50',
-    '7&ndash;52',
-    '7&ndash;63',
-    '7&ndash;7.5',
-    '7&ndash;9%',
-    '7&ndash;sat',
-    '7&plus;1',
-    '7&shilling;6d',
-    '7&shilling;6d.',
-    '7(7)',
     '7,000-',
-    '7,014',
-    '7,020',
-    '7,065',
-    '7,098',
-    '7,11',
-    '7,150',
-    '7,180m',
-    '7,233',
-    '7,271',
-    '7,289',
-    '7,300,000',
-    '7,400,000',
-    '7,436',
-    '7,450',
-    '7,476',
     '7,500ft',
-    '7,515',
-    '7,664',
-    '7,682,300',
-    '7,8,9',
-    '7,825',
-    '7,860',
-    '7,887,000',
-    '7,900m.',
-    '7,916,106',
-    '7-15',
-    '7-7',
-    '7-ft',
-    '7-hour',
-    '7-membrane-spanning',
-    '7-plus',
     '7.0&ndash;19.3',
-    '7.00&ndash;9.00',
-    '7.05',
-    '7.08',
-    '7.0secs',
-    '7.1.5',
-    '7.1.8',
-    '7.10(b)',
-    '7.10pm',
-    '7.15(a)',
-    '7.15pm.',
-    '7.2(a)',
-    '7.2.7',
-    '7.20%',
-    '7.23(44)',
-    '7.24',
     '7.27',
-    '7.2a',
-    '7.2gb',
-    '7.3.0',
-    '7.3.2.2',
-    '7.30&ndash;10.30pm.',
-    '7.30p.m',
-    '7.31',
-    '7.310',
-    '7.4(a)',
-    '7.4.5',
-    '7.4.6',
-    '7.4.7',
-    '7.41secs',
-    '7.43secs',
-    '7.48',
     '7.4m',
-    '7.4pc',
-    '7.5&times;10',
-    '7.5(d)',
-    '7.5.1.1',
-    '7.5.1.2',
-    '7.5.3&ndash;4',
-    '7.5.4',
-    '7.5.8',
-    '7.50am',
-    '7.50pm',
-    '7.53',
-    '7.54g/t',
-    '7.56',
-    '7.57',
-    '7.5cm/3in',
     '7.5secs',
-    '7.5t/ha',
-    '7.6.1.2',
-    '7.64%',
-    '7.65mm',
-    '7.66',
-    '7.68',
-    '7.6secs',
-    '7.7(a)',
-    '7.7(b)',
-    '7.7.0',
-    '7.7.4',
-    '7.7.9',
-    '7.75901',
-    '7.76',
-    '7.78125',
     '7.79',
-    '7.7b',
-    '7.7pc',
-    '7.81',
-    '7.84',
-    '7.84195',
-    '7.85',
-    '7.85%',
-    '7.88%',
-    '7.89',
-    '7.9(a)',
-    '7.9(b)',
-    '7.9.2',
-    '7.9.4',
-    '7/1',
-    '7/32',
     '7/6',
-    '7/7',
-    '7/73',
-    '7/8in',
-    '7/9',
-    '7/91',
-    '7/k',
-    '7/kg',
-    '70%-80%',
-    '70&deg&ndash;74&deg;f',
-    '70&deg&ndash;77&deg;f',
-    '70&deg;n',
-    '70&mgr;m',
-    '70&ndash;110',
-    '70&ndash;140',
-    '70&ndash;200',
     '70&ndash;85%',
-    '70&ndash;90',
-    '70&ndash;90%',
-    '70()',
-    '70(1)',
-    '70+',
-    '70,000&mdash;80,000',
-    '70,000,000',
-    '70,283',
-    '70,800',
-    '70-100',
-    '70-30',
-    '70-yard',
-    '70.2%',
-    '70.4%',
-    '70.7%',
     '70.8',
-    '70/80',
-    '700&deg;c',
-    '700&ndash;750',
-    '700,000-strong',
-    '700-person',
-    '700-year-old',
-    '7000/610',
-    '7000i',
-    '7000s',
-    '700500',
-    '700dpi',
-    '700ft',
-    '700k',
-    '700km',
-    '700lb',
     '701601',
-    '702&ndash;703',
-    '7020',
-    '7022',
-    '705b',
-    '706/1',
-    '7090',
-    '7091',
-    '70f',
-    '70g',
-    '70kcs',
-    '70kjmol',
-    '70lbs',
-    '70min',
-    '70pp',
-    '71&ndash;89',
     '71,740',
-    '71-6',
-    '71-member',
-    '71.1%',
-    '71.2',
-    '71.4',
-    '71.5',
-    '71.6',
-    '71.9%',
-    '71/2',
-    '710&ndash;15',
-    '710&ndash;19',
-    '710710',
-    '7110',
-    '711555',
-    '7129',
     '7130',
-    '713320',
-    '713713',
-    '7140',
-    '715p',
-    '716530',
-    '718&ndash;29',
-    '7190',
-    '71cm',
-    '71pc',
-    '72&deg&ndash;78&deg',
-    '72&deg;c-2min',
-    '72&ndash;79&deg;f',
-    '72(5)',
-    '72,060',
-    '72-cap',
     '72-foot',
-    '72-run',
-    '72.2',
-    '72.4%',
-    '72.7%',
-    '72.9',
-    '72.9%',
-    '72/159',
-    '720&deg',
-    '720,000',
-    '720-channel',
-    '720-page',
-    '7202',
-    '7203',
-    '720m',
-    '720p',
     '7210',
-    '721p',
-    '721x',
-    '722,000',
-    '7220',
-    '7233217',
-    '723512',
-    '7241',
-    '724222',
-    '7244',
-    '724740',
-    '724983',
-    '725(2)',
-    '725/50',
-    '7255',
-    '7261',
     '7262',
-    '727,312',
-    '7280',
-    '72ins',
-    '72kg',
-    '72m',
-    '72year-old',
-    '73&ndash;205',
-    '73&ndash;4',
-    '73&ndash;6',
-    '73-acre',
-    '73-year',
-    '73.0%',
-    '73.2',
-    '73.4/100000/year',
-    '73.7',
     '73.8',
-    '73000',
-    '730495',
-    '73129',
-    '7317',
-    '7318',
-    '732,000',
-    '7320kg',
-    '7330',
-    '733p',
-    '734&ndash;735',
-    '734&ndash;756',
-    '7340',
-    '7344294',
-    '735(4)',
-    '737&ndash;58',
     '737,000',
-    '737-400',
-    '738,000',
-    '7390',
-    '7392',
-    '7396',
-    '739bp',
-    '73a',
-    '73c',
-    '73f',
-    '73rd-minute',
-    '74&ndash;100',
-    '74&ndash;77',
-    '74&ndash;79',
-    '74&sol;76',
-    '74(4)',
     '74(a)',
-    '74,014',
-    '74.07',
-    '74.1',
-    '74.1%',
-    '74.42',
-    '74.6',
-    '740500',
-    '740i',
-    '740s',
-    '741669',
-    '7419',
-    '742a',
-    '743(4)',
-    '744.18',
-    '744720',
     '745p',
-    '747-200',
-    '7470',
-    '7471',
-    '7474',
-    '747597',
-    '748.8',
-    '74pc',
-    '74s',
-    '75%&ndash;90%',
-    '75&deg&ndash;78&deg;f',
-    '75&deg;30\'n',
-    '75&ndash;100',
-    '75&ndash;71',
-    '75&ndash;79',
-    '75&ogr',
     '75,328',
-    '75-80',
-    '75-mile',
-    '75.4',
-    '75.47',
-    '75.6',
-    '75.9',
-    '75/1000',
-    '750&deg;c',
-    '750-mile',
-    '75008',
-    '7500gns',
-    '75029',
-    '750i',
-    '750v',
-    '752,614',
     '7520',
-    '7523',
-    '752774',
-    '7534',
-    '754p',
-    '756&ndash;7',
-    '756,626',
-    '756p',
-    '757&ndash;8',
-    '7575',
-    '759&ndash;7025',
-    '759,000',
-    '759a',
-    '75:25',
-    '75c',
-    '75d',
     '75e',
-    '75f',
-    '75ft.',
-    '75gb',
-    '75kts',
-    '75lbs',
-    '75min',
-    '76&deg',
-    '76&deg;s',
-    '76&mdash;82',
-    '76&ndash;89',
-    '76&ndash;90',
-    '76(d)',
-    '76.0',
-    '76.3%',
-    '76.38',
     '76.6%',
-    '76.7',
-    '76047',
-    '760mp',
-    '760s',
-    '761,000',
-    '761081',
-    '767400',
-    '7693',
-    '7699',
-    '76cm',
-    '76ers',
-    '76g',
-    '76pc',
-    '76x61cms',
-    '77&ndash;74',
     '77&ndash;85',
-    '77(3)',
-    '77,082',
-    '77,400',
-    '77,700',
-    '77-seat',
-    '77-year',
-    '77.',
-    '77.2%',
-    '77.2/1000',
-    '77.5',
-    '77.6',
-    '77.83',
-    '77.84',
-    '770,000',
-    '7702',
     '770345',
-    '770439',
-    '770939',
-    '771/1369&ndash;70',
-    '7712136',
-    '7712246',
-    '772611',
-    '7731',
-    '7734',
-    '7738',
-    '774535',
-    '776/1374&ndash;5',
-    '7770',
-    '7777',
-    '779,452',
-    '77pc',
     '78&deg;c',
-    '78&ndash;80',
-    '78&ndash;80&deg;f',
-    '78-minute',
-    '78.0',
-    '78.2',
-    '78.3%',
-    '78.5%',
-    '78.6%',
-    '78.9',
-    '78/79',
-    '780056',
-    '7821',
-    '7834&ndash;0287',
-    '7836',
-    '7842',
     '7844',
-    '7845',
-    '786,000',
-    '7869',
-    '78cm',
-    '78mins',
-    '79&deg',
-    '79&deg;f',
-    '79&deg;s',
-    '79&ndash;80',
-    '79&ndash;81',
-    '79&ndash;82',
-    '79&ndash;88',
-    '79&ndash;90',
-    '79&ndash;97',
-    '79-amino-acid',
     '79.43',
-    '79.6',
-    '79.7%',
-    '79/7',
-    '7900',
-    '7903',
-    '790o',
-    '791066',
-    '791175',
-    '792,000',
-    '795/1392&ndash;3',
-    '796&ndash;8',
-    '7960',
-    '799,000',
-    '799,380',
-    '79m',
     '7:10',
-    '7:11',
-    '7:11&ndash;17',
-    '7:13',
-    '7:17',
-    '7:2',
-    '7:2&ndash;5',
-    '7:22',
-    '7:24&ndash;30',
-    '7:25',
-    '7:34',
-    '7:37',
-    '7:45',
-    '7:5',
-    '7:50',
-    '7:6',
     '7:9',
-    '7ar',
-    '7b4',
-    '7bq.',
-    '7db',
-    '7dd',
-    '7dg',
-    '7e',
-    '7ha',
-    '7he',
-    '7hq',
-    '7hr',
-    '7je',
-    '7jg',
-    '7jq',
-    '7july',
     '7ld',
-    '7lj',
-    '7lx',
-    '7ma',
-    '7mb',
-    '7mhz',
-    '7ml',
-    '7mm',
-    '7mph',
-    '7ms',
-    '7ns',
-    '7pb',
-    '7pl',
-    '7qb',
-    '7qj',
-    '7qp',
     '7r75m',
-    '7rj',
-    '7sec',
-    '7sq',
-    '7te',
-    '7th.',
-    '8&deg',
-    '8&mdash;9',
-    '8&middot;9',
-    '8&ndash',
-    '8&ndash;11&deg',
-    '8&ndash;12%',
-    '8&ndash;12&deg;dh',
-    '8&ndash;18',
-    '8&ndash;27',
-    '8&ndash;37',
     '8&ndash;4&ndash;0',
-    '8&ndash;4&ndash;13&ndash;1',
-    '8&ndash;4\'',
-    '8&ndash;47',
-    '8&ndash;48',
-    '8&ndash;49',
-    '8&ndash;5&ndash;0',
-    '8&ndash;57',
-    '8&ndash;63',
-    '8&ndash;thu',
-    '8&plus;1',
-    '8&shilling',
-    '8&times;4in',
-    '8\'s',
-    '8(6)',
-    '8(7)',
     '8(8)',
-    '8+2',
-    '8,000-year-old',
-    '8,047',
-    '8,10',
-    '8,192mb',
-    '8,2',
-    '8,200,000',
-    '8,207',
-    '8,229',
-    '8,23',
-    '8,250m',
-    '8,322',
-    '8,360,000',
-    '8,511,965',
-    '8,538',
     '8,600,000',
-    '8,664,000',
-    '8,713',
-    '8,750',
-    '8,760',
-    '8,867',
-    '8,900',
-    '8,948',
-    '8,959',
-    '8,993/46,000',
-    '8-25',
-    '8-a',
-    '8-channel',
-    '8-fold',
-    '8-in-1',
-    '8-line',
     '8-ohm',
-    '8-oz.',
-    '8-page',
-    '8-port',
-    '8-pounder',
-    '8-slot',
-    '8-string',
-    '8.00p.m.',
-    '8.02%',
-    '8.04',
-    '8.05%',
-    '8.0p',
-    '8.1(c)',
-    '8.1.4',
-    '8.10(b)',
-    '8.11(a)',
     '8.11(b)',
-    '8.12(b)',
-    '8.1375',
-    '8.15.10',
-    '8.17.3',
-    '8.17.5',
-    '8.2(1)',
-    '8.2(a)',
-    '8.20am',
-    '8.24a',
-    '8.282b.',
-    '8.2ms',
-    '8.3.4',
-    '8.3.5',
-    '8.3.93',
-    '8.30&ndash;11pm',
     '8.35%',
-    '8.35b',
-    '8.38',
-    '8.39',
-    '8.3yd',
-    '8.4&mdash;8.16',
-    '8.4(a)',
-    '8.4(c)',
-    '8.4.',
-    '8.4.4',
-    '8.4.5',
-    '8.43p',
-    '8.45%',
-    '8.4c',
-    '8.5&ndash;57',
-    '8.5(a)',
     '8.5(b)',
-    '8.5.2',
-    '8.50p',
-    '8.54',
-    '8.58',
-    '8.59',
-    '8.5kb',
-    '8.5m',
-    '8.6&ins',
-    '8.6(1)',
-    '8.6.1986',
-    '8.62608',
-    '8.64%',
-    '8.6a',
-    '8.6secs',
-    '8.7.1',
     '8.7.2',
-    '8.7.3',
-    '8.7.4',
-    '8.7.6',
-    '8.75&ndash;4.22',
-    '8.85',
-    '8.8secs',
-    '8.9(a)',
-    '8.90&ndash;32.60',
-    '8.92p',
-    '8.99',
-    '8/14',
-    '8/153',
-    '8/2',
-    '8/450f/230c',
-    '8/81',
     '8/88',
-    '8/a',
-    '8/line',
-    '8/sac',
-    '80%-owned',
-    '80%-plus',
-    '80&ndash;2',
-    '80&ndash;5',
-    '80&ndash;84',
-    '80&ndash;85%',
-    '80,000-line',
-    '80,000-plus',
-    '80-02-24',
-    '80-90',
-    '80-km',
-    '80-page',
     '80-year',
-    '80.',
-    '80.4',
-    '80.4%',
-    '80.7',
-    '80/80',
-    '800&mgr;l',
-    '800&ndash;900',
-    '800-acre',
-    '800-hpa',
-    '800-km',
-    '800-room',
-    '80002',
-    '8004',
-    '800434',
-    '800hp',
     '800kg',
-    '800mg',
-    '800nm',
-    '800rpm',
-    '80186',
-    '80188',
-    '801p',
-    '801st',
-    '802.6',
-    '803,943',
-    '8033',
-    '80386/486',
-    '80386sx/25',
-    '80486\'s',
-    '80486-compatible',
-    '80486dx-33',
     '80486dx2/66',
-    '80486dx3',
-    '80486sl',
-    '80486slc',
-    '80486sx/33',
-    '805/1402&ndash;3',
-    '8050',
-    '8061',
-    '8066',
-    '8090',
-    '80960cf',
-    '809ff',
-    '80c186',
-    '80cc',
-    '80lb',
-    '80m-byte',
     '80mbps',
-    '80mg/100ml',
-    '80mins',
-    '80r',
-    '80r\'s',
-    '80z',
-    '81&ndash;7',
-    '81&sol;87',
-    '81,607',
-    '81-member',
-    '81-year',
-    '81.',
-    '81.1%',
-    '81.3%',
-    '81.7',
-    '81058',
     '81083',
-    '811548',
-    '81188',
-    '812&sol;79',
-    '812,000',
-    '81216',
-    '81220',
-    '812547',
-    '813,000',
-    '8130',
-    '8131',
-    '813677',
-    '8138',
-    '814,000',
-    '8159',
-    '816/1413',
     '8166',
-    '816p',
-    '819/august',
-    '819439',
-    '81d',
-    '82&deg',
-    '82&deg;c',
-    '82-ish',
-    '82.1',
-    '82.2%',
-    '82.3',
-    '82.4',
-    '82.7',
-    '820/september-october',
-    '8202',
-    '8209',
     '820e',
-    '8210',
-    '8217',
-    '822,000',
-    '82244',
-    '823/6',
-    '824,000',
-    '8252',
-    '8256',
-    '825hp',
-    '8260',
-    '82650',
-    '826f',
-    '827679',
-    '827701',
-    '82bhp',
     '82h',
-    '82mph',
-    '83&ndash;4',
-    '83&percnt',
-    '83&sol;78',
-    '83&sol;79',
-    '83,857',
-    '83.',
-    '83.3',
-    '83.4',
-    '83.6',
-    '83.6%',
-    '83.7%',
-    '83.8%',
-    '830,000',
-    '8300',
     '830p',
-    '8310',
-    '832,000',
-    '832p',
-    '8334',
-    '834/march-april',
-    '834596',
-    '8356',
-    '8361',
-    '837%',
-    '838&mdash;9',
-    '838,000',
-    '838/1434&ndash;5',
-    '8380',
-    '838222',
-    '84&frac12',
     '84&ndash;5',
-    '84&ndash;87',
-    '84(2)',
-    '84(6)',
-    '84.14',
-    '84.2',
-    '84.6',
-    '84.6%',
-    '84/83',
-    '840/1436&ndash;7',
-    '840429',
-    '840ci',
-    '842,504',
-    '8450',
-    '845s',
-    '846/1442&ndash;3',
     '848/1444',
-    '8480',
-    '848p',
-    '84cm',
-    '85&deg;f',
-    '85&ndash;88',
-    '85&sol;79',
-    '85,000,000',
-    '85,300',
-    '85.1',
-    '85.1%',
-    '85.5%',
-    '85.9',
-    '85/374/eec',
-    '850-acre',
-    '850505',
     '850cc',
-    '850ci',
-    '850yrbp',
-    '8514',
-    '8514/a',
-    '85145',
-    '852817',
-    '852myr',
-    '8540',
-    '8550',
-    '85532',
-    '8558',
-    '858&ndash;72/1454&ndash;68',
-    '85:15',
-    '85bhp',
-    '85g/3oz',
     '85mhz',
-    '85ml',
-    '86&ndash;337',
-    '86&ndash;8',
-    '86&ndash;98',
-    '86,858',
-    '86.1%',
-    '86.5%',
-    '86.5x144cms',
-    '86.6%',
-    '86.66',
-    '86.8p',
-    '8600&ndash;9227',
-    '861/1457',
-    '861000',
-    '8611196',
     '8613',
-    '862,000',
-    '863615',
-    '8638',
-    '8649',
-    '865,000',
-    '8656',
-    '866,335',
-    '866p',
-    '8687',
-    '868803',
-    '869123',
-    '869p',
-    '86a',
-    '87&deg',
-    '87&ndash;9',
     '87&ndash;92',
-    '87,500',
-    '87.2%',
-    '87.4',
-    '87.6%',
-    '87.97',
-    '87/0',
-    '87010',
-    '87109&ndash;3432',
-    '872,700',
-    '872/1467&ndash;8',
-    '872937',
-    '873,000',
-    '874/1469&ndash;70',
-    '875/1470&ndash;1',
-    '875929',
     '875a',
-    '876,000',
-    '877&ndash;8/1472&ndash;3',
-    '87bhp',
-    '87min',
-    '88&ndash;9',
-    '88&ndash;92',
-    '88\'s',
-    '88-bout',
-    '88.',
-    '88.4%',
-    '88.4/1000',
-    '88.7%',
-    '88.8',
-    '880471',
-    '880s',
     '88100/200',
-    '88100s',
-    '88110-88410-62110',
-    '88120',
-    '8822',
-    '883p',
-    '886&ndash;918/1481&ndash;1512',
-    '8860',
-    '886415',
-    '887s',
-    '888299',
-    '88f',
-    '88open-based',
-    '89(2)',
-    '89,200',
-    '89.1',
     '89.2%',
-    '89.3%',
-    '89.4%',
-    '89.6%',
-    '89.7%',
-    '8900',
-    '890s',
-    '890s/100',
-    '891605',
-    '892505',
-    '8969',
-    '8977',
-    '899&ndash;1',
-    '899p',
-    '89in',
-    '8:10',
     '8:19,20',
-    '8:22&ndash;25',
-    '8:24',
-    '8:25',
-    '8:27&ndash;9:1',
-    '8:30',
-    '8:30pm',
-    '8:4',
-    '8:45',
-    '8:6',
-    '8:9&ndash;11',
-    '8=0',
-    '8af',
-    '8b&plusmn',
-    '8b+',
-    '8b/c',
     '8bg',
-    '8bn',
-    '8bp',
-    '8br',
-    '8bs',
-    '8bu',
-    '8cms',
-    '8df',
-    '8e2',
-    '8ft.',
-    '8g',
-    '8hr',
-    '8i',
-    '8jb',
-    '8jz',
-    '8k',
     '8kg',
-    '8ld',
-    '8m3',
-    '8nt',
-    '8nw',
-    '8o',
-    '8p.m',
-    '8pn',
-    '8qq',
-    '8r',
-    '8secs',
-    '8tf',
-    '8v',
-    '8x4ft',
-    '8xa',
-    '8xt',
     '8xu',
-    '9%.',
-    '9&frac12%',
-    '9&frac14',
-    '9&frac38%',
-    '9&micro;l',
-    '9&ndash;03',
-    '9&ndash;04',
-    '9&ndash;05',
-    '9&ndash;06',
-    '9&ndash;08',
-    '9&ndash;10%',
-    '9&ndash;10pm',
-    '9&ndash;11am',
-    '9&ndash;12(a)',
-    '9&ndash;12in',
     '9&ndash;13-year-olds',
-    '9&ndash;27',
-    '9&ndash;3&ndash;8',
-    '9&ndash;3(a)',
-    '9&ndash;32',
-    '9&ndash;36',
-    '9&ndash;42',
-    '9&ndash;83',
-    '9&plus;2',
-    '9&sol;88',
-    '9(8)',
-    '9(c)',
-    '9+',
-    '9+1',
-    '9,000-strong',
-    '9,009',
     '9,100',
-    '9,123',
-    '9,251',
-    '9,372,614',
-    '9,470',
-    '9,571,300',
-    '9,657',
-    '9,700,000',
-    '9,730',
-    '9,752',
-    '9,758',
-    '9,847',
-    '9,970,610',
-    '9-',
-    '9-16',
-    '9-27',
     '9-irons',
-    '9-year-olds',
-    '9.0.3',
-    '9.04',
-    '9.05pm',
-    '9.06',
-    '9.09',
-    '9.0d.p.c.',
-    '9.0secs',
-    '9.1(b)',
-    '9.1.1.2',
-    '9.1.4',
-    '9.1.6',
-    '9.12a',
-    '9.15(b)',
-    '9.15.3',
     '9.16(a)',
-    '9.1pc',
-    '9.2m',
-    '9.3(b)',
-    '9.30am-2pm',
-    '9.30p.m',
-    '9.3m',
-    '9.3mph',
-    '9.3pc',
-    '9.4&ins',
-    '9.4.',
-    '9.4.5',
-    '9.4.6',
-    '9.4.7',
-    '9.42',
-    '9.43&ndash;10.12',
     '9.46',
-    '9.47',
-    '9.48%',
-    '9.49pm',
-    '9.5&ins',
-    '9.5.2',
-    '9.52',
-    '9.55p',
-    '9.57',
-    '9.5km',
-    '9.5pc',
-    '9.5secs',
-    '9.6(b)',
-    '9.6.2',
-    '9.61',
-    '9.65',
     '9.67',
-    '9.69',
-    '9.71',
-    '9.72',
-    '9.8.1',
-    '9.80',
-    '9.8m',
-    '9.8pc',
-    '9.91',
-    '9.95%',
-    '9.9pc',
-    '9/10/87',
-    '9/11',
-    '9/16',
-    '9/3/87',
-    '90&deg;e',
     '90&ins',
-    '90&ndash;120',
-    '90&percnt',
-    '90(1)',
-    '90+',
-    '90-based',
-    '90-tonne',
-    '90-year',
-    '90-year-olds',
-    '90.0%',
-    '90.3',
-    '90.47',
-    '90.5',
-    '90.55',
-    '90.9%',
-    '90/100',
     '90/88/eec',
-    '90/green',
-    '900&deg;f',
-    '900-mile',
-    '900-strong',
-    '900-year-old',
-    '900/march-april',
-    '9000/700s',
-    '9000/890',
-    '900000',
-    '9000i',
-    '90034',
-    '9004',
-    '9005',
-    '9008',
-    '9009043504',
     '900g/2lb',
-    '900h04158',
-    '900ml',
-    '900psi',
-    '904&ndash;905',
-    '9049',
-    '9090',
-    '90a',
-    '90b',
-    '90bp',
-    '90cm/3ft',
-    '90deg',
-    '90mhz',
-    '90min',
-    '91&ndash;2',
-    '91&ndash;21',
     '91&ndash;5',
-    '91&ndash;9',
-    '91(1)',
-    '91-69',
-    '91-member',
-    '91.1',
-    '91.2',
-    '91.4',
-    '91.6',
-    '91/533',
-    '91/p.557',
-    '910,000',
-    '91003',
-    '9104',
-    '9107',
-    '912,050',
     '914.5',
-    '9141',
-    '9144',
-    '915p',
-    '9180',
-    '919,102',
-    '9191',
-    '91mhz',
-    '91p',
-    '91x182cm',
-    '92&mdash;4',
-    '92&ndash;101',
-    '92&ndash;102',
-    '92,072',
-    '92,490',
-    '92-82',
     '92.2',
-    '92.4%',
-    '92.5%',
-    '92.6',
-    '92/85/eec',
-    '92/89',
-    '920,000',
-    '9217429',
-    '9221',
-    '922335',
-    '9228',
-    '923,768',
-    '92352',
-    '92353',
-    '92356',
-    '92357',
     '92358',
-    '92361',
-    '924/1518',
-    '92407',
-    '9273',
-    '929/1523',
-    '92f',
-    '92pc',
-    '93,033',
-    '93.3',
-    '93.35mph',
-    '93.4%',
-    '93.5',
-    '93.6p',
-    '930/1524',
-    '930219',
     '930319',
-    '931,690',
-    '9311',
-    '9330',
-    '9337-compatible',
-    '9350',
-    '9360',
-    '9361',
-    '9368',
-    '9371',
-    '9395',
-    '94%-rated',
-    '94&deg;c-1min',
-    '94&ndash;5',
-    '94(3)',
-    '94,000km',
     '94,500',
-    '94.',
-    '94.2',
-    '94.77',
-    '940,000',
-    '9400',
-    '9401',
-    '9404',
-    '9431',
-    '944/1537&ndash;8',
-    '9442',
-    '945,087',
-    '9471',
-    '95&frac12;p',
-    '95&ndash;100%',
-    '95&ndash;105',
     '95&ndash;7',
-    '95,000,000',
-    '95-year-old',
-    '95.',
-    '95.22',
-    '95.5',
-    '95.5%',
-    '95.7%',
-    '950/950i',
-    '950ft',
-    '950s',
-    '9519',
-    '953/1546&ndash;7',
-    '9532',
-    '9571',
-    '95b',
     '95bhp',
-    '95hp',
-    '96&mdash;7',
-    '96&percnt',
-    '96,300',
-    '96,700',
-    '96.0%',
-    '96.5p',
-    '96.6p.',
-    '960&ndash;1279',
-    '960-based',
-    '9605',
-    '962s',
-    '963/1555&ndash;6',
-    '9632',
-    '964/1557',
     '96gb',
-    '96in',
-    '96m',
-    '96pp.',
-    '97&deg',
-    '97,740',
-    '97,800',
-    '97.0',
-    '97.1%',
-    '97.3',
-    '97.3%',
-    '97.6',
-    '9705',
-    '9708',
-    '970e',
-    '971/1564',
     '973/1566',
-    '9730',
-    '9750',
-    '9760',
-    '978&ndash;9/1570&ndash;1',
-    '9792',
-    '97c',
-    '97pp',
-    '98&ndash;117',
-    '98-91',
-    '98.2',
-    '98.2%',
-    '98.3',
-    '98.54',
-    '98.6',
-    '98.6&deg;c',
     '98.75',
-    '98.76',
-    '98.9%',
-    '9810',
-    '981m',
-    '982/1575',
-    '982541',
-    '985/1577',
-    '985m',
-    '989/1581',
-    '9890',
-    '98in',
-    '99&deg',
-    '99&deg;c',
-    '99&ndash;102',
-    '99&ndash;176',
     '99,222',
-    '99.1%',
-    '99.6%',
-    '99.70&plusmn;0.02%',
-    '99.78',
-    '99.98',
-    '99.999',
-    '99.9999',
-    '99.99x',
-    '99/xxx',
-    '990/100',
-    '9900&ndash;13700m',
-    '991&ndash;992',
-    '9940',
-    '9940/3',
-    '997,738',
     '9990',
-    '99999',
-    '99p/100g',
-    '99x99',
-    '9:10',
-    '9:30',
-    '9:31',
-    '9:37',
-    '9:4',
-    '9:40am',
-    '9:51',
-    '9a.m.',
-    '9ad',
-    '9ae',
-    '9am&ndash;5pm',
-    '9ap',
     '9ar',
-    '9at',
-    '9bb',
-    '9br',
-    '9cms',
-    '9d8y',
-    '9da',
-    '9eg',
-    '9el',
-    '9er',
-    '9ha',
-    '9hf',
-    '9hw',
-    '9hy',
-    '9jf',
-    '9k',
     '9kw',
-    '9lz',
-    '9mb',
-    '9np',
-    '9nr',
-    '9o',
-    '9os',
-    '9pa',
-    '9pf',
-    '9pl',
-    '9pm.',
-    '9px',
-    '9rf',
-    '9rh',
-    '9ry',
-    '9sd',
     '9sp',
-    '9tbsp',
-    '9ths',
-    '9tt',
-    '=/',
-    '=/+',
-    '=0.2',
-    '=0.35',
-    '=0.65',
-    '=1.45',
-    '=12',
-    '=18.0',
-    '=19',
-    '=19.9',
-    '=3.1',
-    '=3.2',
     '=3.49',
-    '=350',
-    '=42',
-    '=45&deg',
-    '=5.0',
-    '=5.05',
-    '=5.7',
-    '=58',
-    '=6.1',
-    '=6.31',
-    '=6.7',
-    '=7.1',
-    '=8.67',
-    '=9.70',
-    '=90',
-    '=bout',
     '@',
-    'a&amp;aee',
-    'a&amp;d',
-    'a&amp;p',
-    'a&amp;r-ing',
-    'a&amp;rs',
-    'a&bgr',
-    'a&bgr;e&agr',
-    'a&dollar;1,700',
-    'a&dollar;10.66m',
-    'a&dollar;100',
-    'a&dollar;120m',
-    'a&dollar;17,000',
-    'a&dollar;22',
-    'a&dollar;250m',
-    'a&formula',
     'a&icirc&nacute',
-    'a&mdash;3',
-    'a&ndash;f',
-    'a&prime',
-    'a&yuml;-champagne',
-    'a\'chearcaill',
-    'a\'flaq',
-    'a\'mhadaidh',
-    'a\'right',
-    'a(2)',
-    'a(34)',
-    'a(t)',
-    'a+g',
-    'a+indomethacin',
-    'a-440',
-    'a-a-a',
     'a-a-l',
-    'a-borrowing',
-    'a-class',
-    'a-dewin\'',
-    'a-flap',
-    'a-fusion',
-    'a-glow',
-    'a-going',
-    'a-grade',
-    'a-h',
-    'a-helix',
-    'a-ko-rus',
-    'a-n',
-    'a-one',
-    'a-p-a',
-    'a-playing',
     'a-political',
-    'a-priori',
-    'a-r',
-    'a-raining',
-    'a-rational',
-    'a-registration',
-    'a-series',
-    'a-sitting',
-    'a-sorrowing',
-    'a-talking',
-    'a-tc65n',
-    'a-test',
-    'a-thirty',
-    'a-to-d',
-    'a-tract',
-    'a-week',
     'a.11',
-    'a.14',
-    'a.27',
-    'a.3.1',
-    'a.3.2',
-    'a.5',
-    'a.86',
-    'a.a.a.',
-    'a.a.c.u.',
-    'a.b.a.',
-    'a.c.k.',
-    'a.c.s.t.t.',
-    'a.c.t.s.',
-    'a.cacatuoides',
-    'a.d.a.s.',
-    'a.e.j.',
     'a.e.o.t.',
-    'a.e.r.',
-    'a.e.s.d.',
-    'a.f.c.',
-    'a.f.s.',
-    'a.g',
-    'a.i.r',
-    'a.j.c.',
-    'a.m.i.c.',
-    'a.n.z.',
-    'a.r.a.',
-    'a.r.c.a.',
-    'a.r.p',
-    'a.s.a.',
-    'a.s.r.',
-    'a.t.p.',
     'a.trifasciata',
-    'a.v.m.',
-    'a.w.b.',
-    'a/00/23/2001',
-    'a/00/25/0002',
-    'a/00/26/0004',
-    'a/00/26/0007',
-    'a/05/25/2001',
-    'a/05/25/2006',
-    'a/05/25/2007',
-    'a/05/25/2010',
-    'a/05/25/2012',
-    'a/05/25/2016',
-    'a/05/25/2021',
-    'a/05/25/2022',
-    'a/05/25/2023',
     'a/05/25/2025',
-    'a/05/25/2027',
-    'a/05/27/0001',
-    'a/09/25/0001',
-    'a/16/25/0003',
-    'a/16/25/0004',
-    'a/16/25/0006',
-    'a/16/26/0004',
-    'a/21/05/0001',
-    'a/23/32/0001',
-    'a/23/32/0002',
-    'a/23/32/0003',
-    'a/23/32/0005',
-    'a/23/32/0006',
-    'a/23/32/0007',
-    'a/23/32/0008',
     'a/23/32/0009',
-    'a/23/32/0010',
-    'a/23/32/0011',
-    'a/23/32/0012',
-    'a/23/32/0013',
-    'a/23/32/0015',
-    'a/23/32/0019',
-    'a/23/32/0020',
-    'a/23/32/0023',
-    'a/23/32/0031',
-    'a/33/25/0002',
-    'a/33/25/0003',
-    'a/33/25/0031',
-    'a/401/06/4011',
-    'a/401/26/4001',
-    'a/401/26/4002',
     'a/413/25/4002',
-    'a/413/26/4012',
-    'a/413/26/4018',
-    'a/413/26/4019',
-    'a/413/26/4025',
-    'a/413/26/4036',
-    'a/414/26/4004',
-    'a/418/25/4005',
-    'a/418/35/4001',
-    'a/418/35/4002',
-    'a/419/26/4002',
-    'a/432/09/0891',
-    'a/439/09/0492',
-    'a/439/26/4011',
-    'a/451/26/400157',
-    'a/451/26/400201',
     'a/451/26/400205',
-    'a/451/26/400285',
-    'a/451/26/400287',
-    'a/501/26/5006',
-    'a/501/26/5009',
-    'a/516/31/5003',
-    'a/at',
-    'a/mano',
-    'a/w',
-    'a1\'s',
-    'a1-70',
-    'a1.2',
-    'a104',
-    'a1085',
-    'a11\'',
-    'a127',
     'a142',
-    'a147',
-    'a15',
-    'a163',
-    'a169',
-    'a170',
-    'a172',
-    'a190s',
-    'a1gsm',
-    'a253',
-    'a300s',
-    'a330s',
-    'a350',
-    'a351',
-    'a38m',
-    'a39',
     'a4.',
-    'a403',
-    'a4085',
-    'a4086',
-    'a414/4',
-    'a415',
-    'a415/2',
-    'a415/6',
-    'a418',
-    'a43/10',
-    'a43/13',
-    'a43/3',
-    'a44',
-    'a443',
-    'a456',
-    'a5-sized',
     'a5/a49',
-    'a50',
-    'a500',
-    'a5012',
-    'a537',
-    'a540',
-    'a548',
-    'a60',
-    'a6011',
-    'a6095',
-    'a628',
-    'a69',
-    'a6m',
-    'a72',
-    'a74(m)',
-    'a75',
     'a835',
-    'a837',
-    'a85',
-    'a87',
-    'a881',
-    'a94',
-    'a952',
-    'a:chris.txt',
-    'a=b',
-    'a_,_a_few',
-    'a_a_little_bit',
-    'a_la_mode',
-    'aa-',
-    'aa-kheper-re-senb',
-    'aa-size',
-    'aa/02/28/0001-1',
     'aa/39/26/0005',
-    'aa/kodak',
-    'aa3',
-    'aa5',
-    'aaa/baab',
-    'aaaaaaaaagh',
-    'aaaaaw',
-    'aahah',
-    'aahmes',
-    'aaland',
-    'aalen',
-    'aams',
-    'aarons',
-    'aarseth-brewington',
-    'aart',
-    'aasman',
     'ab-u-dah',
-    'ab1380',
-    'ab2',
-    'ab9',
-    'abaa',
-    'abacuses',
-    'abada',
-    'abaddon',
-    'abalance',
-    'abandonments',
-    'abare',
-    'abarew',
-    'abaroa',
-    'abascal',
-    'abatements',
-    'abazi',
     'abba-esque',
-    'abba/2',
-    'abbatoir',
-    'abbeglen',
-    'abberation',
-    'abbondio',
-    'abbott/glos',
-    'abbott/headmasters',
-    'abc1s',
-    'abd&uuml;lhamid',
-    'abdel-latif',
-    'abdelal',
-    'abdelatif',
-    'abdelazziz',
-    'abdelbaset',
-    'abdelfatah',
     'abderahmane',
-    'abderrahim',
-    'abdingdon',
-    'abdol-hossein',
-    'abdominoperineal',
-    'abdorrahim',
-    'abducxted',
-    'abdul-rabur',
-    'abdul-wakil',
-    'abdulaziz',
-    'abdulkadir',
-    'abdullatif',
-    'abdulnabi',
-    'abdulsalam',
-    'abdur-rabbur',
-    'abebe',
     'abeche',
-    'abed-rabbo',
-    'abem',
-    'abend',
-    'abenhall',
-    'aberargie',
-    'aberchalder',
-    'aberdale',
-    'aberdaron',
-    'aberford',
-    'aberforest',
-    'aberlady',
-    'aberlemno',
-    'aberrent',
-    'abers',
-    'aberthaw',
     'aberystwyth-based',
-    'abetment',
-    'abf2',
-    'abgal',
-    'abhorr',
-    'abi/banks',
-    'abi/inform',
-    'abia',
-    'abidin',
-    'abileah',
-    'ability-to-pay',
-    'abingdon.',
-    'abjectness',
-    'abjures',
-    'able&mdash;list.log',
-    'able-oboe-charlie',
     'ablebodiedness',
-    'abley',
-    'abnormal-normals',
-    'aborad',
-    'aboral',
-    'aborally',
-    'abortion-restricting',
-    'abortionists',
-    'abour',
-    'aboutness',
-    'above-numbered',
-    'above-plan',
-    'above-stairs',
-    'abowt',
-    'abrantes',
-    'abrashes',
     'abrasion-resistant',
-    'abris',
-    'abroad\'',
-    'abrogations',
-    'abruptly.',
-    'abs/san',
-    'absailing',
-    'absence-prone',
-    'absent&rehy;mindedly',
-    'absinthium',
-    'absolom',
-    'absoloutely',
-    'absorptance',
-    'absorptiometer',
-    'absorption.',
-    'abstentionist',
     'abstract/axiomatic',
-    'abstractable',
-    'abstractive',
-    'abstrusus',
-    'absurdest',
-    'absurdists',
-    'abtot',
-    'abu-halima',
-    'abu2',
-    'abundante',
-    'abune',
-    'aburdene',
-    'abutilons',
-    'abutta',
-    'abysses',
-    'abzoelutely',
     'ac&amp;d',
-    'acad&eacute;mies',
-    'acadian',
-    'acappella',
-    'acbt-2/6/ns1/7',
-    'acbt-3/2/5/7',
-    'acbt-6/ns1/7',
-    'acceler8',
-    'accelerando',
-    'accelerants',
-    'accelerated/automated',
-    'accelerato',
-    'accell/object',
-    'accelsteel',
-    'accentuations',
-    'accept/reject/defer',
     'acceptance/rejection',
-    'accepted/rejected',
-    'acceptis',
-    'access-per-cycle',
-    'access/sql',
-    'acciajuoli',
-    'accidence',
-    'accident/incident',
-    'accidentalist',
-    'accidentally/inadvertently',
-    'acclimated',
-    'acco',
-    'accommdation',
-    'accommodatingly',
-    'accommodation/loss',
-    'accomodating',
     'accompanist/narrator',
-    'accompt',
-    'accor',
-    'accouchement',
-    'account\'',
-    'account-book',
-    'account-holding',
-    'account-keeping',
-    'account-trading',
-    'accounts.',
-    'accredition',
-    'accredits',
-    'accretion-induced',
-    'accroaching',
-    'accrual-based',
-    'accst',
     'accumaster',
-    'accura',
-    'accuracy.',
-    'ace/d',
-    'ace/dd',
-    'ace/intel',
-    'acelt',
-    'acephalus',
-    'acerba',
-    'acerframe',
-    'acerous',
-    'acetal',
-    'acetoxymethyl',
-    'acetylenes',
-    'acetylsalicylic',
-    'acfield',
     'achampong',
-    'achan',
-    'achanalt',
-    'achanical',
-    'acharnians',
-    'acharniens',
-    'achievement-oriented',
-    'achinsk',
-    'achive',
-    'achmelvich',
-    'achtawilling',
-    'aci',
-    'acid-crazed',
-    'acid-etched',
-    'acid-fast',
-    'acid-like',
     'acid-rain',
-    'acid/alkaline',
-    'acid/day',
-    'acid/water',
-    'acidaspis',
-    'acidini',
-    'acids.',
-    'acinus',
-    'ack-tors',
-    'ackergill',
-    'ackman',
-    'acland-hood',
-    'acne-ridden',
-    'acommodation',
-    'acorn/polycell',
-    'acornhoek',
     'acoustic-based',
-    'acquah',
-    'acquaintanceships',
-    'acquiesces',
-    'acquiesence',
-    'acquire.',
-    'acquired-distinctiveness',
-    'acquisitions.',
-    'acquitaine',
-    'acquits',
-    'acratic',
-    'acrid-smelling',
-    'acritarchs',
-    'acritical',
-    'acrobated',
-    'acrocentric',
     'acrocentrics',
-    'acrolein',
-    'across-the-table',
-    'acrylamide/',
-    'acrylic-based',
-    'actants',
-    'actg',
-    'acti',
-    'actinians',
-    'actinomyces',
-    'action(s)',
-    'action-adventure',
-    'action-result',
-    'actionists',
-    'actionsport',
-    'activation-energy',
     'activatory',
-    'activisation',
-    'activites',
-    'actor-director',
-    'actor/actress',
-    'actor/director',
-    'actss',
-    'actts',
-    'actualism',
-    'actualit&aacute',
-    'actualizes',
-    'actuall',
-    'actuelle',
-    'actv',
-    'acucobol-85',
-    'aculeatus',
     'acus&aacute;s',
-    'acutronic',
-    'acutus',
-    'aczel',
-    'ad-as',
-    'ad-dali',
-    'ad-din',
-    'ad13',
-    'ad13/8e2',
-    'ad350',
-    'ad400',
-    'ad43',
-    'adada',
-    'adakite',
-    'adam-gibbs',
-    'adamancy',
     'adamantios',
-    'adamistic',
-    'adams-robinson',
-    'adams/widow',
-    'adamsons',
-    'adano',
-    'adanson',
-    'adcomp',
-    'add-listed',
-    'add01',
-    'addamax\'',
-    'adder-accumulator',
-    'addestone',
-    'addey',
-    'addies',
-    'addlebrough',
     'address/telephone',
-    'addresser/addressee',
-    'adeanes',
-    'adegbehin',
-    'adeimantos',
-    'adeliae',
-    'adelies',
-    'adeline',
-    'adella',
-    'adelmanno',
-    'adendorf',
-    'adeney',
-    'adenoid',
-    'adenomata',
-    'adenophylla',
-    'adeptus',
     'adequacies',
-    'adetunji',
-    'adgar',
-    'adh2',
-    'adh3*1',
-    'adhered-to',
-    'adhesion-activation',
-    'adib',
-    'adirondacks',
-    'adisappointing',
-    'adish',
-    'adji',
-    'adjunctivetherapy',
-    'adjutant-',
-    'adlestone',
-    'adlib/soundblaster',
     'admd=cwmail',
-    'admi',
-    'administrated',
-    'administration/benefits',
-    'administratrix',
-    'adminstrator',
-    'admissability',
-    'admissable',
-    'admissions.',
-    'admissions/confessions',
-    'admyssyon',
-    'adney',
-    'adoko',
-    'adolescence.',
-    'adorada',
-    'adorers',
     'adpcm',
-    'adpeople',
-    'adrain',
-    'adrenocorticotrophic',
-    'adrich',
-    'adrie',
-    'ads.',
-    'adsett',
-    'adstone',
-    'adulis',
-    'adult/child',
-    'adults.',
-    'adumbrating',
-    'adus/uk',
-    'advan&rehy;tageous',
-    'advanced-level',
     'advantages/disadvantages',
-    'adve',
-    'advents',
-    'adverbals',
-    'adverbially',
-    'adversarialism',
-    'adverteerders',
-    'adverti',
-    'advertising-agency',
-    'advic',
-    'advisers.',
-    'advisers/',
-    'advts',
-    'adwy-yr-eryon',
-    'ae3',
-    'aeci',
     'aedeagus',
-    'aedes',
-    'aegrotat',
-    'aegyptiacus',
-    'aelwyd',
-    'aem',
-    'aemilia',
-    'aemula',
-    'aemulus',
-    'aemulus(mf)',
-    'aen',
-    'aeneus',
-    'aeo',
-    'aeonium',
-    'aera',
-    'aereo',
     'aereos',
-    'aerhart',
-    'aeritalia',
-    'aerobic/anaerobic',
-    'aerodyne',
-    'aeroengine',
-    'aerogenerator',
-    'aerostat',
-    'aerostation',
-    'aeruginosus',
-    'aesopian',
-    'aestheticisation',
-    'aeternitatis',
-    'aethelthryth',
-    'aethelwulf',
-    'aethereal',
     'aethia',
-    'aethiopica',
-    'aetolia',
-    'afanas\'yev',
-    'afanasii',
-    'afanasyev',
-    'afeard',
-    'afebrile',
-    'afej',
-    'afew',
-    'affable-looking',
-    'affairs*',
-    'affectingly',
-    'affective/attitudinal/social',
-    'affectively',
-    'affeed',
     'afferents',
-    'affinely',
-    'affinity-pure',
-    'affrayd',
-    'affreux',
-    'affrontery',
-    'afghan-soviet',
-    'aflatoxin',
-    'aflutter',
-    'aformer',
-    'afoul',
-    'africa-homelands',
-    'african-appointed',
-    'african-based',
-    'african-caribbean',
-    'african-controlled',
     'afro-asiatic',
-    'afro-brazilian',
-    'afrobeat',
-    'afrocentrists',
-    'afrodite',
-    'after-cooking',
+)
+
+blocks_43 = (
+    '#(handicap+#per#$lane#%plane##sep"#.0%#$1.92$!0$!p#$2.92#$3.93#"40#"5p#$6.91#"75',
+    '$!5"#/26""0%#&0/2452$#bps#!1#!2$"41##4.2#"cm#!g#"mv")1&ndash;2#$,139#".5',
+    '#!4#"50"*2&frac12;p$\'ndash;3#!0#!2#!4#!7#!9#!a#"mm")3&ndash;6#!4##6.4#"70',
+    '")4&ndash;9#$,103%&40,625#!4$"44#!p$"p.#\'x183cms"%5,857##.77#!0#!8#!p")6&ndash;8#$,000',
+    '$"24$"42#!2#"80"$7(3)#!1#!7$!3"$8155#!8")9,632,692#!2$".8##3.9#!5',
+    '#!8"#:18#"26""cm"#hrs"!k#!g#\'m/15mls""mm"!r""st")th-minute$!."!w"(year-old',
+    '#!+"&&deg;n#&frac12#(ndash;14)&30,000*!2*+4-year-olds*"5%*!7)"48)$50mm)!8)"90)#thu"#(3)',
+    '"+,000-30,000\'$mile\'$plus&"ft##100#"21""-0#"10$!8#"29#"34$!5#!6#%april$#ug.',
+    '#$fold#$inch#"km#\'october#(per-cent#%track"#.03#"1%$$1.92$!6#"2%$#.92$!2$!5$!9',
+    '#"44$!5#"59#$6.90#$92r."%/1000#$3/93$!3#$4/93#%75ths")0&ndash;1#&,000th##-km$(year-old#$.550',
+    '$#rpm$"th#"10#!2#!6#!9#"km#"lm#"mb$!g$"hz#!s""12#"31#!4',
+    '#"50$#106""22""3%##.47##6.7$"43##7.1$"16#!9"$4(1)##3.4#!7#!8$!0',
+    '#"nm#!p"*5&mdash;92$\'ndash;7#$,804#%25-26#!8#!9#"mm##pp."+6&ndash;264#$,112#$-cpu#!0#!4',
+    '"$71.2#"km""80#!2#!4#!8"#920",:14&ndash;30#"31%)&ndash;46$!4#!8"\'cm/10in"\'ft-wide"#kms',
+    '#&m-long#"ph"#sec!$6&ft#\'ndash;0)"12)"20)"35)"60*!9"\',000rpm##230##338##400&$,000',
+    '""-0#"14$!5$!6#!6#!7#%match#%party#&storey#$week#)years-old"#.0%#%10.92$!1#$2.92',
+    '#"38#$4.93#$5.93$!6$"pc"&/09/93#$3/74"+0&ndash;261#$,757##-km#!1$".0#!g#!m$!m',
+    '#%51-52"%2,000#"20$"62##906#"ff",3&ndash;8400$&sol;78#"20$!m#!3#"40#!p")4&ndash;6$&sol;78',
+    '##563#!m"$5627#"bp"%6,072#!2##522#%61-66$"63"%7,667$#844#"50##9.2")8&ndash;9##7.8',
+    '$$3-74#!8$"88#!9"$91.7##6.8##7.5"":1$!8""cm$!s""km""mm#"pg""pm',
+    '#(ndash;10)"24*!6*"8h)"34)"41)"50*!9)"70"$,063##556##750##834"#-14#"21',
+    '#!6#!7#$june#&minute"#.32#"4.$!4$!6$!7$!m#"5p#"64"%0,670#%-acre$$seat',
+    '$"28##2.7##391##5.6##6.2#"80##9.6#"bp#"kg#"mm")1&ndash;2*!4##(3)$"4)#$,000',
+    '#!1$".1##441#%61-63"%2,000#!1##7.1#!p$"p.$"ts"%3,000#"64##7.8"%4,200##1.8',
+    '""51##4.5#$6.39$!0#"70##9.4#&g/10oz$&tb/gts#"kv##mhz"$60.1##mjy"$73.4#!4##8.8',
+    '#!7#"80$$6-88"&906-07##3.1"+:1&ndash;11""ff"!m")specint92"#th."(year-old!\'8&deg;c#"ft##ins#(middot;5',
+    ')#135)"20*!4)"32*!3*!5)!4)"52)"69)$70mm*!9""\'s"#(1)"\',002.07$"51',
+    '##400$"52##800"#-16#"cm#$hour##run#&strong#)years-old"%.1.92$$0.93#$2.92$!5$!8#"32',
+    '"%/2/93$#9th#"32""0%#$&deg$)ndash;653#\'-member##000##7\'s$!0#"mm"+1&ndash;309#$,000#\'-member##2.2',
+    '#!2#!3#"73")3&ndash;7##4.4#!7$".7"+4&ndash;304##0.7#!1#"40##5.9##6.5##7.8#!p',
+    '#!2#"33#"lb"*6&ndash;40$&sol;86##(5)##-12$*compatible#!6"$7(2)#$,000#!2#"50##9.4#!p',
+    '#!1##5.5#"pp"*9&ndash;90##(1)#$,000#"20##505"":3"!b"!c"!e"!h""in")lb/12.5kg',
+    '"(year-old!(9&frac34##ins#\'ndash;0)"12*!3)"32"#(1)"$,078#"30%!0##524""-9#$nov."".0',
+    '$!4$!5$!9#"20#"75#"88"%/11/2#"2a#$4/87")0&ndash;1##(2)#!2#!5$!0$!6',
+    '#!k$!g#!p""10#!2$!a##8.6##9.3"(2-member#!0#%16-18#!4#"60"#300#!p',
+    '#!1#!4#!8#!p""52##3.4#%65-67#!g"+6&ndash;297#!3#!8#!9""72""80##6.4',
+    '#"80"(9-member#!1##293#"50#"70#!9""cm""in"#lbs"#min")th-minute!":0"*1&ndash;20#*1&ndash;14',
+    '#*8&ndash;22$#:11"+23&ndash;28##5.0#!7""35#!6""41$)&ndash;52!$_per!#a-c"!e"!h"%nd1/2"!q',
+    '"!r"!s!%care*!"df"!l"!r"!y"!z!"ea"!q!"fl"&t-long!"hq"!u"!z',
+    '!"ja!#l/r"#ate"!g"!n"!z!"m+"(ins6secs""ph!,nd&ndash;4th#$-4th#!.#$/3rd""mf!\'o&deg;c',
+    '"!x!"ql!"ra"!t!$s.e."!a"!h"$i206!!t"!7"!e"#r/3!"ub!\'x12&ins#!5',
+    '"!f"!s#"sc"!u!!y"!n %3&agr#"st")frac12;ft)"oz)&points&$34;p"\'micro;g"(ndash;14*(&ndash;0',
+    '("20)!3)!5)!6)!8("33)!5)!6)!9(\'4&deg;c*#ins*\'ndash;0()5&ndash;4)%-year()8&ndash;0',
+    '"&percnt#-rime;59&prime"&sol;76&"88!$\',5\'%.-monophosphate"*-direction"#esv!)(5)&mdash""8)""c)!"*3!"+2"!3!/,000,000-strong',
+    '&$foot&$user%#kms%!t#"15#"24#&30,000#$45th#"50##72m$!5$!9"!1#"05#"18',
+    '#&84,000"%200ft#"30$!2#"40#"80$%7,263"!3#2\'-diaminobenzidine#$00hp%!m$!3#"17#"72"#445',
+    '#"80"#5,7#$00kg$$5.01#%11.65$!2$$4.69#"60"(600-mile#"25$!6$%8,800#"60#"83"\'702,000',
+    '#"68"#816#"45#"55#"60#"82#"91"#924#"44#"60#"86!#-13")bedroomed"$foot"%grams',
+    '"#lbs")month-old\'"ly"%night"(o-methyl"%speed#%ystem")under-par!(.0&aring#$/3.1#!4#!i"\'1&aring$#ins##(c)',
+    '#".7#"0c#$1(b)$#.93##2.1#"3%$#(a)%"b)$!a#$6(b)#":1#!c#"kb#!p",2&ndash;32.6',
+    '$%2(10)#$4(a)##5am$!m$"pm#$7(d)#"9%#"km",3&ndash;38.3##(a)$"b)#$.1.3$!6$!8#"0m',
+    '#"pc"\'4&aring##(a)$"b)#$.2.1&!2&!3&!4&!5$!4%".1#!6#$7.37#"pc")5&ndash;6',
+    '##(1)#".4#!/#!2#.5&ndash;4.30pm#!8#!9$".7#":1##lbs""6.$!3#!/#"0m#!3',
+    '#$gbps#"kb""7.$!0$"13$!6#!0#!2#!8#":1#!p$!c"$8(a)$"b)$"c)',
+    '#"5m#!6#!7#!p"#9.3#!3#"5p#\'8&deg;c%*ndash;4.02#!9#"gb#!m#!p$!c"!x',
+    '#!0$"00#"60"$3/87"&4-inch"#day!&0%-80%"(&micro;g#)ndash;150*!7)#216)!3*!2*"5%)&40&deg',
+    '*!4)"59)%60min*!9)"70*!5)"94)#sep#$plus"!\'"1,000&ndash;40,000&\'-40,000#"31$"55##519',
+    '"$-021#"13$!4#"30$!2#"60#$akce#&degree#)kilometre##lap##min#&nation#(question#%sept.$(omething',
+    '#)years-old"&.102r.$!5#"26#"4%#"51"#/40#$8/87"\'0&deg;f$)ndash;399*%400kg##(3)#$,473#!-$#320',
+    '$(megawatt#"/l#,0&ndash;4000%%times$$/400#"10#!4#"70#$:0:0#!a##bhp#"cm#&g/10oz#"mg$!s',
+    '#"se"%1,277#\'-member#%223/4##733##835#!p"%2,000#!4""31$"58#!2##6.9#"70""40',
+    '#!3$$7-51#!7"$50lc$"mm#"22#!5#!7#!9##mjy#!p"%6,209#%31-32#!4#!p',
+    '#!5#!9$".2#!p"%8,000#"28#!3#"70""91#"25$!6##9.1##gti""gm"#ins',
+    '#"da"#lbs#!c""mb#!g""ng"#sec"!v"(year-old"!z!*1&ndash;12*!5*!6)!3*!2',
+    '*!8)"45)!6)"72#&sol;79"#(1)#"3)"(,000,000##200#"32##400##500##600$"80""-8',
+    '"#.03#"1%$!8#"21$!4$!5#"37#"40$!5#"56#"8%"#/4s"(0&deg;f.#$,000##0.6',
+    '#!3#!5##725#!g""10#"16##273#!6#!7#!8#!9#!p"+2&ndash;337#$,000$#500',
+    '#".5#"00#"60#!7#!8#"t5"#333#!4#"69#!8#!9#!p"%4,000$#328#"10',
+    '#!6#%77-86"*5&ndash;16#!0$$1-02#"th%\'-ranked"%6,000$#400#%21-22"%7,000#\'-member#$/661#!0#!9',
+    '#!.#!2$!8#!8#!i"&908-09#!2#"35#"45"":3$!1#!5"!i""lb")st-ranked',
+    ')"38)"53)!6"$,768""-0#!9##day#$foot#&minute#)year-olds"".0$!0$!2$!8#"3%',
+    '#"70#"95""0%#"00#!6#"71#"83#"98#!g$!b#"kg#!l#!m""1s"%2,462',
+    '#!6#!7#!8#"93"%3,000$#878#!6#!7"+4&ndash;325#).2million#!4#%57-59#!6#!8#!9',
+    '*!6##144$$7-18##i\'s#"kg"%6,000##022##235#!3$!2#%49-51#"60#!8#!p")7&ndash;8',
+    '$!s#!4#"68#!p",8&ndash;5544#$,000#!1##515#!7#!8"%9,566$#758#"57#!7#!9',
+    '"!c""ff"!g"$kbps#!g#!m"#mhz#"in#"pg"#nds""oz""pp!)3&frac13%#(ndash;16)#262',
+    ')"36)!6#&sol;74(!8"#(2)#"3)#"4)#"5)"(,000,000&%-volt&"ft##287##900$"37"&-fight',
+    '#"23#(3&percnt#"4%#"9%""/1#!4#"76"%0&deg\'#;f.#"-g##000##209#%37-38#"bc#"ft',
+    '##lbs#!m#!s"*1&ndash;70##013#!1#"49#!9"$2424$$7-48##661#%86-87#"92%#-93"#384',
+    '#!d#!p#!t"#435#!8#&99-501"+5&ndash;263#!s"+6&ndash;323#%55-60"%7,000#!5$!9#"92$$3-94',
+    '"%8,145#"0s##211#%36-37#%52-54\'!5#"82#!9#!p"*9&ndash;40#"17#"30#"67#"70#"87',
+    '"!b""kv"!m##bps#"in#!m""pc"$secs!\'4&deg;c#"ft#(ndash;16)"32*!9)"43*!8',
+    ')!8"(,069,433##100#\'320,000##600##800##961"(-article"!.#"06#"10#"4p#"7%$!0$!4',
+    '#!7#%94-95#!m$!b#!x"&107-08#"10#"40#!7"#230#"52$!3#%66-68$!9#"70',
+    '"#308#"18#!p"(4&sol;87#".5#"06#!4"$5-40#%03-04#%18-20#!4#!7#"88"#663"(7-member',
+    '#"49#!8"*8&ndash;50#%04-05#"21#"31#"72#!8$!3"$9(1)#$,000#"04#"41$!7#"59',
+    '""in"!m!#5%."$&ins#(ndash;15)"30),44-year-olds*!8*!9)"54)!7"#(2)"$,500##900"!-',
+    '#$page#)year-olds"#.0%#"23$!6#"3%#"5%#"6%""/6"\'0&deg;c#%-foot$&member$&strong$#tps$(year-old',
+    '#,0&ndash;4000$"00#%14-15#%24-28#"79#"88#"91#!f$)/175c/gas#!m$&l/15fl")1&ndash;2#%09-10#"26#"37',
+    '#"87%#-88#%94-95"(2&sol;85#"06$!8#%27-29#%51-55$$6-88#"69#"89#!a#!p"&319-20#%21-22',
+    '#"36#%46-47#!5#"67#"73$!8%#-79#!p"+4&ndash;430##(2)#".8#"25$!8#%41-42$!4',
+    '$!2#"90$!3"%5,600#"04#"44#%67-70#!8$!6%#-88#"92#!b#!p"+6&ndash;517#"01',
+    '#%31-32$$5-36#%66-67#!7$$6-77#"88#"90"$7(3)#$,000#"01$$9-11#"15$$6-17#%22-23#%40-42',
+    '#!5$!6$!9#"66$$8-71#%90-91$!3"#812$!5$!8#"40$!4$$9-50#"50$!5',
+    '#"87#%95-96""9%#*&ndash;360#"02$!5$!6#"13#"59#"64$!6#%70-71#"90""bn""dl',
+    '"#min""ng""s.##ecs")th-minute!\'6&deg;f#\'mdash;7#)ndash;137)(37&deg;c*!8*!9)!6)!9"\',059.87##125',
+    '%$6.92##610""-0#"38#"49#&minute$$onth"".0#"32#"8%#"9%""/4""0%#*&ndash;361#$-day',
+    '#"18#%44-45$!5#"52%#-53#"62$!7#"73$"77#"86"%1,000#"02#!4#"71#"80',
+    '#"90"#200#"12#"27#"36$!7$$9-40#"44#"57#%64-65$!6$!7#"78#%81-82$!8',
+    '$!4$!6"$3.30#"00#"10#"22#%37-42#%47-48#%52-53$!5#%61-63$!5#"79#!8#"91',
+    '$$4-95$!9"%4,000#!0$!1$$5-06$!8#"14$!9#"25%#-27$$9-30#%48-49#!5$!0',
+    '$!3$!7#"62#"71$$6-77$$9-81#"81$!6$!7$!9#"91$!6$!9#!a#!p',
+    '#"04$$5-06$!6%#-07#"21%#-22$!9#"32$!5#$41-2$"33#"50$!5#"61$!6',
+    '$$6-77$!8#"86#"96"$6(1)#"01$!9#"10$!1$!4#"20$!7$!8$!9#%35-36',
+    '#"40%#-41$!1$!4$!9#%53-54$!6#"60$!3$$6-67$$9-70#"74$!6$!9#"88',
+    '$!3$!5")7&ndash;8#"01$!4$!7#"11$!4#"34$!7$$8-39$$9-40#"43$$4-45$!5',
+    '$$9-50#"51#"71$!4$!5#%83-84$!4#%91-92#!p"#8.5#"00$!9#"12$$6-17$!9',
+    '$!3$!8#"32#"42$!5$!6#"58$$9-60#%74-75#"80%#-81$!1$$6-87$!9#"90',
+    '%#-95$!9""90$!1$!6$$7-08#"12$!8#"23#"31$!2$!3$!4#"42$!6',
+    '#"60$!6$!7$!9#!7#%88-89#"90$#895#!p""ha"!k""lb"!t!$7&ft#(ndash;13',
+    ')!4*!1*!2)!9"#(2)#"3)"$,993"%-year"#.2%$!4#\'8&deg;c##90p"#/38$!9"\'0&mgr;m',
+    '#"11$!2$!3$!6$!7$!8#"21$$4-25\'!6$$5-26$!9#!3$!4$$9-40#%41-42',
+    '$$8-49$!9#%51-52$$6-57$!9#"61#"75$!7$!9#"85$!9#"90$$5-96$!8$!9',
+    '#!m#!s"%1,000#%07-09#"18#"20$$2-23$$3-24$!7#"36#"42$!3$!6#%50-51$"27',
+    '$!6#"62$!4#%77-79#"80$!7#"90$$4-95$%9-200"%2,081#".5#!0$!3$!4$!5',
+    '#"10%#-11$!1$!3$!8#"21$!8#%32-34$$6-37$$7-38#%40-41$$6-47$$7-48$$8-49#"54',
+    '#%61-62$$5-66#"71$!5#"80$!4$!9#"96#!p"%3,804#%13-14$$5-16$$9-20#"20$!4',
+    '$$9-30#"44$!5$!8#"54#"61%#-62$!2%#-63$!3%#-64$!8%#-69#%73-74#"87',
+    '$!8#!a"+4&ndash;375#"01$!7$!9#%12-13#"24$$8-29#"33#%46-47$!7#%55-56$!6%#-57',
+    '%#-60#"60$!1$!4#%70-71$$3-74$!7$!8#"81$!4$!8#"94$!5$!8"$5(1)',
+    '#!0$!2$!8#"15$!6#"20%#-21$$1-22#%32-33$$7-38$!9%#-40#"53$!4$!7',
+    '#"61$!7#"71$!7$!8#"80$!5$!9#"91$$2-93$!5#"mm"#601%#-02$!6',
+    '$$2-13$$3-14$!6##252$$6-27$$8-29#"31$$2-35$!8#%44-45$!7#%50-51$$7-58#%61-62$$7-68',
+    '$$6-77#"99%$-700"%7,815#%03-04#%13-14$$6-17#%21-22$!5#%31-32$!3$!9#"43$$6-47$!8',
+    '#"51$$8-60#%70-71$"13$$2-73$$4-75$$5-76$!6#%80-81$$2-83$$5-86$!8#%92-93$$5-96$!9',
+    '#!c")8&ndash;9#"04$!5#"13$!9#%22-23$!3$!7$$8-29#%40-41$$1-42#%50-51$$2-53$$6-57',
+    '$$0-61$$4-65#%70-71\'!2$!8#"87$$8-89#"95"&907-08#%27-28#"36$$7-38$!8#%41-42$!4',
+    '$!2%#-53$$5-56$$6-57#%67-68#"75#"84#"91$$4-95$!6$!8$!9""cm""ft"!m',
+    '"!t"(year-old!%8&deg#\'ndash;0)#114)"46#&sol;81"#(1)#"6)"\',439.10##800#&915.87"#-11#&footer"(.4&deg;c',
+    '$!7#"99"+0&ndash;384#$-384#!1$!2$!6$$7-18$$9-20#%23-24$$6-27#!6#"78%#-79&"80',
+    '$!2$!4$$5-86$!9#"90$!1#"kg"&104-05$$9-10#%11-12$$3-14#"21$!6#"37$!9',
+    '#%52-53$$4-55$$7-58#%75-76$!6$$7-78#"82%#-83$$7-88#"95$!6$$7-98"+2&ndash;383#%03-04$!5',
+    '#"31#"59#"60#"70%#-71$$8-79#"82$!4$!5#%95-96$$7-98$%9-300"&300-01$!4$$7-08',
+    '#"35$$9-40#%45-46$$8-49$!9#"67#%73-76$!4$!7$$9-80#"86#!p"#401#"15$!7',
+    '$!1#%30-31$$7-38#%43-44$$4-45$$5-46#"53$!4#"64#"79#!8#"97#!k"%5,000#"05',
+    '#"10%#-11#"27#%33-34$$4-35$$5-36#"42$!3$!9#!5#%69-70#"72$!4#"84%#-85',
+    '$!4#"th"+6&ndash;387#$,000#"00$!1#"20$!3$!8#"31#%62-63$!4#"78#%81-82$!8',
+    '$!7#!i##max#&sx/25c"%7,000$#500#"02$$4-05$!7#%11-12$!3$$4-15$!9%#-20#"20',
+    '#%31-32$!6#!4$!7#%52-53$!6$!9#%66-67$!8$!9#%71-72$!2$!4#%90-91$!1',
+    '$!5#!p"#801%#-02$$9-10#"10$!2$$5-16$$8-19#%23-24#%47-48$$8-49#"59#"61$!4',
+    '$!6$$7-78#%95-96$$6-97"#900$!8#"11$!2#%25-26$!9#!3$$1-32$!2$!3$!4',
+    '#!4$!5%#-47#%54-55$!5$!6#"62#%72-73#"92$$7-98#!p"!f"#ins"#sec!%9&ins',
+    '#&sol;75(!9"#(6)"#-43#$hour#%month"#.3%#\'5&deg;c$!8#"71#"85#"96""/6"%0,759#"/l',
+    '$$3-04$!4#"14#%23-24$!4$$7-28$!8$!9#"38#%41-42#"54$!6$!7#!6$!0',
+    '$!3$!5%#-66$!7#%78-79#"82$!3#"96$!7%#-98"#102#"12$!3$!4#%26-27',
+    '$!1#"43$!7$!9#!5$!3$!4#"60$!2$!6#"80$!4$!5$!7#"91',
+    '$!7#"12#"25#"50""34#!5$!0#!p"%4,000#".2""50#!p"%6,000$#200#%-seat',
+    '#!p""70#!4""8p""90#!1#!9$!0#!p""km")th-minute!+:1&ndash;13*!8##9:4""20',
+    '##0pm#!3#!4#!5#":0""40#!8"*7&ndash;10*!9"!9!#a10"!n!$b(2)"!b"!c',
+    '""w.!"cu!"dl"!r!"ed"!e"#mes"!r!"ff!!g"!8!"hh!&inches!"jq"!t',
+    '"!x!%k&ohm!"lg"!q"!s!#mos!-n-dimensional"!g"!r"!t!#oz.!"pd"!h"!r"!w',
+    '!,rd&ndash;7th#$-4th""he!#sec"!f"!q"!t!&t/acre"!j!!u!"w1!%x/400"!x )4&frac12%(#&ft',
+    '(!%(&;-mile"\'gt;4.9%"\'mdash;5(!6#&gr;gml#&icro;g$&ddot;6")ndash;1/2))2&ndash;0))3&ndash;0)!7)!8)!9()2&ndash;0',
+    ')!4()3&ndash;3)!6)!7(94&frac12;lb/1.8&ndash;2kg)!9(%5&deg)!3)!4()7&ndash;0(\'october"+shilling;6d#$ol;5&"76!!\'',
+    '!"+1"!4!0,000&ndash;0yrbp%%-acre&$foot&&member&$plus&$year%"ft%"kg%"lb#"20#"33#"46"#120',
+    '"*200-strong#%50rpm#"71$!4"&300mbq$!1$!2$!9#"48#"50#"65"#444#"51$!4"%5,6,7',
+    '#"52"%600kg#"24#"47#"60#"91"\'700,000#"90"\'800,000%#bps#"34#"48#"86#"96"#921',
+    '!#-46"$band"!d"%for-1".lb/&pound;7.29"!o"$port"!s#$kins#$pace#\'tringer"%tonne"$week!\'.00p.m.#$1.43',
+    '#$4.31##5pm#!6#!7#"kb"%12(a)%"b)#$3(b)$".0%!3#$4(c)#"5%#$6(a)%"b)#$7(b)',
+    '#)4&ndash;6#"gb"$3(2)$"c)#!.##5pm#!6#!9#!b#!p$!c""4.$!5$!7#!1',
+    '#"3%#!4#!8##fl.#"pc"\'5&deg;c$#ins##(c)#$.2.3$!4$!5#!/##5pm&\'/4.05pm#!a',
+    '#"cm#"kb"#6.4#!2#!5#!6#!7#"kb#"pc"#7.0$!3#!2#!6#!7#":1',
+    '#!b#!p"#8.1#!3#!4#"5%#,6&ndash;2.38#":1#!v"#9.1$!3#!3#!7#!9#!a',
+    '#$secs!"/0""11#"20#!3#280&amp;c/350&amp;f"$25sl""33#(50f/180c")5&ndash;0""80#!6"!9#!0#!2',
+    '"!f""lg"#the!,0%&ndash;50%*#60%".&amp;shilling.#%deg;f\'!n\'!w#"ft#(ndash;14*!5)!2*"00)"30',
+    '*!2*$5min*!6*!7)&50,000*!5*!9)"64)#70%#(shilling"),000-word&"ft&"th##200"*-kilometre',
+    '#)year-olds"#.16#"22$!6$!7#!4#"84""/1#"41#"50""0+#%-acre$$mile#%/400s#%0/620',
+    '$#gns#"1b#!5#!7##asa#!e#%g/1lb#"hz#"km#\'ml/14fl$"ph$!w""10$!6#"60',
+    '#!9")2&ndash;8##(1)#$,000$#617##770#"nd#!p"%3,000#"30#!5#!a""40""51#"nm',
+    '#!9"%7,000#!0$!0#!8""95"":1""du""ff""hp#!r"(km/25mls"%mbyte"$ngml"#pts',
+    '"!z!)1&mdash;2#(ndash;43)!6"$(11)"(,000,000##293##667"!.#"1%#"4%#"5%#$6mhz#"7%#!9',
+    '"+0&ndash;414##222#$4mph#"nm#!p"$1037#"31#!g""20#"th"%3,000#!3"*4&ndash;15#$,000##843',
+    '#!5#!7"$6369""70#!3""84"%9,000#"70"!c""in"#mpg!%2&deg#&frac12#,ndash;108777)"81',
+    '"#(1)#"6)"$,800"#-17#"20##day"".7#"9%",0,000-strong##000#"nm""11"#271"$3(2)#!6',
+    '""40"\'5&deg;s##045#!3$"82#!6#!g#!v""60#!2##444#"90""72$"71"$8.6%',
+    '#!5"%9,000#!3"!c"!k#!g"!m""pp")specint92!(3&frac12#(ndash;44*!6*!7*!8)"50',
+    '*"7g""\'w"#(8)"$,262##300$"55##490"\'-member"#.2%#"34#"9%"#/20""0e#!k"#150',
+    '#!p""23#"mb"#370#"90"#500""60##451#!7#!8#!p""7p"%8,000$#317##181',
+    '""9%"!b""mb"$secs!\'4&deg;c##ins#)ndash;131)%22614)!3)"45*!7)!6"%\'x32\'"$(1a)#"4)',
+    '#"a)"%-acre#%point#%tonne"!.#!0$!7#"4%$%7secs#!7"#/10%!7$"24$"42$!5',
+    '$"05$"29$!7#"48")0&mdash;1#)-megawatt#"10#!4#"ml"#1.6#-15&ndash;1100#"22##338%!9"%2,000',
+    '#!f""40##971""51"%6,681#"10#!6$"00#!9""70#!3#"67""86#"71"!b',
+    '"#lbs"!m"#pts"!s#"ec!*5&ndash;54*"5%)%60min#&percnt#(times;60"#(1)#"7)"$,500##622"%-mile',
+    '"!.#!1$!4#"26#"3%#&44secs##5kg##82p#"9%""/1$"76#"55#"78"+0&ndash;500*#700',
+    '#!6#"bp#!f#"hp#!k#!m"#110#"28"%2,000"$3918""4g#!p"%6,976#!2#!6',
+    '#!p"+8&ndash;810#$,000#"/7#!1"%9,000#!6"":9"!a"!b"!f#!5""jy""kg"%metre',
+    '"$secs!(6&frac12$!t#&sol;76"(,000,000##180"+-chromosome"!.#!0#"50#!8$!%#"9%""0%#*&ndash;446',
+    '$$seat##211#!4#"mm"%1,000#!0##221#!8"%2,840""31##900"#5kg""69#&se/dsa"$7000',
+    '"%8-641#!4",9&ndash;5469#$,000"!a"!b"\'cm/18in""ft""pm"$s.8d!+7&ndash;138)"43)#533)!9"$,200',
+    '##500$"20"%-goal#$yard$#ear"#.1f""/7"+0&ndash;460#$0rpm#"ft""11")3&ndash;5#!4#!7#"83',
+    '"%5,442#!0#"kg#!p"%7,000#!2#!p"%8,000#!p""93""cm"!k""lb"#sec")th-minute',
+    ')"50)"72"$,072##600"%-lite#&strong#!x"#.0%#!3#"8%$"4p"+0&ndash;470#%0/320&"30&"60',
+    '#"mb$"hz""18##919"#226##611#!p"$3024##768""48#"ft"%5,000#!0$#158$"79',
+    '$!l$!t##0mp#%dx/33#!e#!p#!s$#/25$#lc2"#773#!p""88"+9&ndash;493#$,000"#bhp',
+    '"(km/30mls"!m#!m!*9&ndash;53)"95"$,500##700"!.#!0#"2%#"5%#"6%#"7%#"9%"#/5a',
+    '#!7"+1&ndash;518#!p""29")3&ndash;5#!6""41#!p""50"(6-member""70#!p"%8,000##.9m""95',
+    '"!a"!c!*:1&ndash;7##,14##6.1#!9"!2#*4&ndash;26"$30pm#*5&ndash;41#!8"#4:2"!5##4.6"!7',
+    '!#b\'s"!b""hp!"cu!"dd!"ee"!h!"hs!#in.#"ch!"kg!#l73"!e"!q!%m-bit',
+    '!"nd"!g"!n!#oth"-z/&pound;4.99+$9.95$$125g!"pf"$ital!"qj"!r"!t"!x!!r"!d',
+    '!"sp!"tb")h-century#!."!s!"ul!!v!"ws"!w!$x100"#50m"\'8inches!#yrs +5&frac12;in\'#4;p',
+    '"(mdash;17(%30(1)("44(!6(*7&frac12;p#$gr;g&!l#&icro;m"/ndash;1&ndash;1)\'0mcg/kg))4&ndash;0)"5%)"61("37)!9',
+    ')!3)!6)!9("53()6&ndash;0)$,000)!0("7%("8%("99!=\'-cgcggatcccccaacacgcattttgtg#)direction#%sugar"!2""ea',
+    '!#(7)""c)""d)""i)!"+2!+,000-gallon&(year-old%#mev%!t#"40"(10,24,25$!5#"52#"69#!8',
+    '#"25#"41#"80"#340#&60,000$"4m"$400m#"13#"33#"50"$500m#"50#"68"#6,7%",8',
+    '#"22$!4#"70"\'700,000#"33#%50rpm"$852m"#933!#-12#!4#!9""21#!9""3."#all',
+    '#*zacytidine"$cent#!m"$hour"%irons"!m#\'egawatt#%inute"%point$&sition"%stage"%woods!(.0&mgr;g#".0#"1%',
+    '#!6#!w"$1(a)#$.1.1&!2&!4$"2.&!1&!3&!4$!6$!8$!9##0.2##2.1',
+    '#"4c#$5(a)$&6.30pm#,6&ndash;5.18$".1%!2$!a$!b#$8(2)$".2#"9b"#2.0#\'/100000#$0(a)%"b)',
+    '#%5inch#"6c#!c#$secs"$3(c)#!.$!0$"10$!9#%0p.m.#"6b#"9b#!m#"pc"$4(a)',
+    '#"0c##5am#!m"%5&ins##(a)#%-hour#!.$!6#!7#!a#"cm#"lb"$6(f)#".6#!0',
+    '#!7"%7-day#!2#!9#!a#"pc")8&ndash;9#$.1.1&!2&!3$!6#!3#!7#!m"$9(a)',
+    '$!2$!3$!4$#6.1&!2&!3&!5&!6&!7&!8#!5#!8#!9$!%!&/10/87',
+    '"!2#!8")375f/190c"!5""66""80#!9""92""lg!,0%&ndash;60%#&-owned"3&deg&mdash;60&deg;n#\'mgr;gml\'!l$&icro;t',
+    '*"25*"50)!4)"51*!2)&60,000+#mph*!5*\'o&deg;c)#75%+-g/2&ndash;3oz)#80%##ogr#(shilling#/times;2.5cm/1in',
+    '\'$acre\'#odd&"th""-6$"0%#"70##bed&$room#$cent#)kilometre$!m#%overs#%piece#&storey##ton',
+    '#"1%#"4%#%55sec#"70$!2#,8&times;76.2"\'0&mgr;m%&icro;g$*ndash;1286*#700*#800#*,000-piece#&-1,000$$seat#%/500s',
+    '#!1$!0$!5$"73##400$!3#!5#!6#!c$#lub#&ft/min#*g/1&frac14#"hz##kgm$!m',
+    '""10$!0#!1"+2&ndash;810#!5""30"%4,782"%5,000#!3""7p""93#!9"":1""ff""g/',
+    '""hp"#kms"(mg/litre""ng#!s""p."$secs"!w!+1&ndash;128)"58)"69#&sol;87""\'s"#(2)#"6)',
+    '$"36##200"#.05#"2%#"3%#!8#!9"%0,625#"00"*1&mdash;24*"58*"61#$,000#!0$#500',
+    '#!4##kev"%2-cpu#"2k#"gb#"mp#"tr"%3,115#!6#"88"#4.1#!4#!p"#5.4#!5',
+    '"#830#!6#!8""cm"#mjy"$secs"&x56cms!\'2&deg;c\'!f#(frac12;p#\'ndash;0)#333)"54"$,560"\'-minute',
+    '"#.11#!4$!%#!7$!%#"8%#"9%"+0&ndash;510#"21#!k$!g""10##546#!8""20',
+    '#!h""3h"#400""5i"*6&ndash;48*#527"*7&ndash;31*"65#"mb""83#"bp""90#!p"!a"!b',
+    '""gb"!m"$secs"(year-old!(3&frac12#\'ndash;5*!8)!6*!3*!6)"71#&sol;81""\'s"#(1)"$,371',
+    '"!.#"3%#"4%#\'5&deg;n#"7%#!9$!%"#0.1#!5#!k""10#!5""2p"%3,000#!7',
+    '*!6##.63#!7"*5&ndash;43#$,000#"mb#!p"$6740""77""9a"!a"!c"!m"$secs"%x53cm',
+    '#(ndash;47)"56*!7)"64"#(3)"$,400"".0$!3#!2#"6%$%4secs#"8%""0%#!0$!0',
+    '#!p"%1,000"(2-member#!1"%3,965#"55#!p"$4000##484#"50$"35#!6#!p""55"&6-mile',
+    '""83#!4"%9,000"*:2&ndash;3"!f"!s!\'5&deg;f#\'mdash;6#%ndash(#;57)"61*!3)#88%)!9#&percnt',
+    '"$,100#"56"#-64#&second"".2$!5#!3$!0#"5%$!1$!9#!7"%00rpm#"19#!3',
+    '#!l#(m/600yds#"xl"%3,000#!3"$4161"%5,337#!9#!p""69""70#!4#!7""85"$9.15',
+    '"#bhp"!e""ff""mb"!s")th-minute!\'6&deg;c##ins#(ndash;71"#(4)"(,100,000##785"#-57#&member"#.04',
+    '$!1$!7#!8#"9%"+0&ndash;600#$0gns#!s""13#!p""30#"53""50#!3""65""8m',
+    '""pp"!s#"ec"$year!%7&deg#(frac12;p"#-60"".0#"16#!4$!%#"50$!6#!8#"9%',
+    '#!0"$3665""4p"*5&mdash;96#$,000#"0g$#rpm#!6#!g"&6/sko2#!0#!4""76##733""80',
+    '#!5#!p""90""cm"!f""kg""pm"!r"#sec%!s"(year-old!(8%-owned"&&deg;c\'!n#&frac12',
+    '#(ndash;64"#(4)"$,500"#.00#"2%#"3%$!9#"4%#"5%#"7%$!p#!8$!%"#028""1p',
+    '$#646#"/3#!p"$3738"+4&mdash;629#!8#!p""55#!8""60"%7,041#!4"$8.7k#!4"#9/l',
+    '""pc"$secs")th-minute!*9&ndash;68"#(1)"\'-member#%style"#.1%$!3#!2$!6#"51"+0&ndash;604#$0rpm#!p',
+    '#!2""27##800""30"$4376""51##522#!c""66"$8232""90""ml""no"!s!":0',
+    '#!0#*2&ndash;16#!4#!6##8ff""20#*1&ndash;24#!2$)&ndash;23#!3#!5$)&ndash;34"!3#!0#!1',
+    '#!4#!6"!8"!9!$_per!"a.#!6"#/5b"!3"!b"!j"!l"!r!#b/c"!n',
+    '!"du!#e11"!h""ss"!u!"fl""t.!#gal!#hj."!r!\'kg/10lb!"lf!&m/16ft"!a"#gml',
+    '""ls""m/""ph""yr!"n3"!a"!b"!g"!h"!l"!s!"op""zs!#per""pm',
+    '!"rt"!x!$secs!&th/6th!!u!"wb!)xdenhardt"#ssc (6&amp;in"*commat;1/2"\'frac12%()&ndash;13\'!4#\'t;2&ins%%4&ins',
+    '#)iddot;5cm"0ndash;12&ndash;0)!3)!4*(&ndash;0("20*!%)!4)!5("39("53)!5(%7&ins)!4("8%',
+    '()9&ndash;0",shilling;8d.#7ol;1986&sol;104&sol;152&"76&"81!"\'s!),000-plus&(year-old#"96"#121#"42"\'200,000$%2,000#"89"%304ft',
+    '$"9m"\'400yrbp#"88"\'500,000#"36$"7m#"86"#680"#920$!9!(-&flat;7""19"1aminopenicillanic"&figure"$in-1',
+    '"%litre"%pixel"$well!,.0&ndash;6.6#!4#!5#!6"#1.5$!6#"05#"11$!3%#(4)$!5#%32(2)',
+    '$$8(2)#"56$"am#\'million"%2.3.1&!3$!8##0am##2am$"pm"%3&ins#!.$!0#"8%#!b',
+    '#"fl#"gb#!m#$t/ha"#4.0$!6#!7#!p"+5&ndash;7.6#$-7.5#".5#!6#!7""60#!2',
+    '#!4#"pc#$secs"%7&ins#".3##5pc#!7#!8#!9"+8&ndash;7.2#!1#$2216#!4#"8%#$9509',
+    '#$secs"$9(1)#".1$!2$!4$!5#!3$#(3)#!4#!9$!%#"bn#!p$!c!#/18',
+    '#200&deg;c/400&deg;f""36"!4"#700""89"#900#!1""kg!40&deg&ndash;64&deg;f-(72&deg;f#\'ndash;1)"57)"71*!9)"83',
+    '"#(2)"$,500"!-##80%#&footer##gun##pdr#$seat"#.1%#!3#"5%#"6%#"9%"!/#"61',
+    '"%0&ogr#\'-seater##.33#"/l#&0-mile$#000$!i$"km$"mw#!1##400#"ad#"hp$!z#"km',
+    '""1b"$2.00##232#!5##832"$4604""5%##582""60$!6#"31#!p""8p"%9,000#!0',
+    '#!5"!c"!k"&metres""ng"!o")specint92")th-minute"!v!\'1&deg;f#\'ndash;2)!3)"80)!i*!v',
+    '"#(4)"$,500"#.1%#"2%#!3#"4%#"6%#!8$!%"#/84"\'0-based#"03##734#"kb"#1.5',
+    '#!5$!8##611""2p"+3&ndash;615#!0#"12"$4000#"45#!8"%5,000#!3#!9""64#!7',
+    '"%7,000#!p#"th"%8,000#"ft#!p"!b""cm"#min!42&deg&ndash;76&deg;f.\'7&deg;f#\'ndash;3)!4)"64*!8',
+    '"$,076##100##365""-3#"63"".0#!2$!%#"4%#"5%#!6#"7%$!1"%00rpm#"mm',
+    '#!s"#123##621"%2,984#!1#!2#!3##975",3/9&mdash;39#!0#!3#"55""44#!p")5&ndash;6',
+    '"+6&ndash;627#"/7"+9&ndash;631""mb")nd-minute""pc!*3&ndash;67)"94#&sol;86"$(ii)#"v)"(,000,000##900"!.#!0',
+    '#!6$!%"+0&ndash;639#\'-member%#ile#$0rpm#!s""18"*2&mdash;c.#!a"*4&mdash;57#!4"%5,000#!2#!p',
+    '#"80"%7,657#"71"%8,000#!7""93"!a""f."&k/240k""mm!44&deg&ndash;77&deg;f#)ndash;128)!5)"65"(,000,000',
+    '##900"#-11##run"".1$!0#!8#"9%"*0&ndash;64,!6#&0/6800$!0#!m#!p#$x480"#180',
+    '#!p"%2,500#!4"%3,000#!1"$4993""50#!p"&6-1055#!p"$7047##934""87""97#!p',
+    '")th-minute!&5%&sol")&ndash;68)!7)"84)"91#&percnt"#(4)"&,536mb"#-70"#.1%#!3#"4%#"5%#"6%',
+    '"%/1000")0,000,000#%-acre#!a#!e#"ft#"mm#!p#!s"$1658"%2,225#"70#!8""34#!7',
+    '"%5,000#!p""61""80#!1$"79##338"!b"!g#,/2&frac12;oz"#min#"ph""xe!46&deg&ndash;72&deg;f.\'7&deg;f',
+    '&";c#(ndash;69"#(3)"#-67"#.14#"3%#"4%#"5%""/1""01##809#"mm"%12704""20"#320',
+    '"#400#!p""52"$6666##999""7p"$8071%!2"!a"!m#&-bytes#"in"!s!+7&ndash;611*!8',
+    '"(,420,000"%-foot"!.#"1%#"3%#"5%#!8""02#"mp#!p"%2,000#!7""36"%5,000##680',
+    '"%6,552"#950"#ins"!k"!s!48&deg&ndash;74&deg;f.\'6&deg;f-(80&deg;f&";f#\'ndash;4)"73)"84"$,200"!.#!8',
+    '")0&ndash;1#"09#!2$!0#(30-based#!6#"80#!g#"mb"#100"%2,000#!5#!7"$3000#"41',
+    '#!p""43#!5#!p""65")7.9:331.2#$8633"$8.47#$5377#!6#)e&ndash;f"!k"#min!%9&deg#(ndash;71',
+    '"!.#!1#!2$!8#"3p"#000#!p"%1,200""3p""42#!3"%8,000#!1""94!*:1&ndash;4',
+    '#!4#!7"+30&ndash;44"+45&ndash;52#!8"!8"!9!"aa"!l"!y!#b/c!"c8!&d6&ins"!b"!g',
+    '!"ef!"ff!,g/&frac14;oz!$h-4h"!b"!r#!s"!u!$inch%"es!"kb""hz"!w!"la!#mhz',
+    '#!n""ph!"ne"!h"!m"!s!#per!"qt!"rh!"td!!u!"x4"!j 27&agr;-hydroxylase")frac12;oz',
+    '#,t&frac14&ins$&;6&ins"*middot;5cm"%ndash\'#;08(#1/2))0&ndash;0)#1pm("27)!8)!9("31)!2)!3)!5',
+    ')!8("41)"2%)!5)!7("50)!2("63(#7.5("9%(#sat"&plus;1"+shilling;6d-!.!#(7)',
+    '#"14#"20#"65#"98""11#"50##80m"#233#"71#"89"\'300,000"\'400,000#"36#"50#"76',
+    '#"15"#664#&82,300"#8,9#"25#"60#&87,000"%900m.#&16,106!#-15"!7""ft"$hour"1membrane-spanning"$plus',
+    '#,0&ndash;9.00#!5#!8#$secs"#1.5$!8#$0(b)$"pm#$5(a)$#pm."$2(a)#".7#"0%#%3(44)#!4',
+    '#!a#"gb"#3.0$#2.2#00&ndash;10.30pm.$#p.m#!1$!0"$4(a)#".5$!6$!7#%1secs#%3secs#!8',
+    '#"pc"*5&times;10##(d)#$.1.1&!2$)3&ndash;4$!4$!8##0am$"pm#!3#$4g/t#!6#!7#&cm/3in',
+    '#$t/ha"%6.1.2#"4%##5mm#!6#!8#$secs"$7(a)$"b)#".0$!4$!9#$5901#!6#$8125',
+    '#!b#"pc""81#!4$#195#!5$!%#"8%#!9"$9(a)$"b)#".2$!4!"/1""32',
+    '"!7#!3"#8in"!9#!1"!k#!g!&0%-80%"3&deg&ndash;74&deg;f.\'7&deg;f&";n#%mgr;m#)ndash;110*"40)#200',
+    ')"90+!%""()#"1)"!+"1,000&mdash;80,000&$,000##283##800"$-100#"30#$yard"#.2%#"4%#"7%',
+    '"#/80"\'0&deg;c$)ndash;750#+,000-strong#\'-person$(year-old#%0/610$!i$!s##500##dpi#"ft#!k$!m#"lb',
+    '"+2&ndash;703#!0#!2""5b"#6/1""90#!1"!f"!g"#kcs#$jmol"#lbs"#min""pp!*1&ndash;89',
+    '""-6#&member"#.1%#!2#!4#!5#!6#"9%""/2"*0&ndash;15+!9##710""10##555""29',
+    '##320##713""40""5p"$6530"*8&ndash;29""90""cm""pc!22&deg&ndash;78&deg&\';c-2min#.ndash;79&deg;f"#(5)"$,060"$-cap',
+    '##run"".2#"4%#"7%#!9$!%"$/159"%0&deg#$,000#(-channel$$page#!2#!3#!m#!p',
+    '#!p#!x"%2,000#!0"%33217##512""41##222#!4##740##983"$5(2)##/50#!5""61',
+    '"%7,312""80"#ins""kg"!m"(year-old!+3&ndash;205)!4)!6"%-acre#$year"#.0%#!2#-4/100000/year#!7',
+    '"#000##495"#129#!7#!8"%2,000##0kg""30#!p"+4&ndash;735+"56#!0#$4294"$5(4)"*7&ndash;58',
+    '#$-400"%8,000""90#!2#!6#"bp"!a"!c"!f")rd-minute!+4&ndash;100)"77*!9#&sol;76"#(4)',
+    '"$,014"#.07#!1$!%#"42#!6"$0500#!i#!s"$1669#!9""2a"$3(4)"$4.18##720',
+    '"%7-200#!0#!1#!4##597"#8.8""pc"!s!,5%&ndash;90%"3&deg&ndash;78&deg;f&%;30\'n#)ndash;100)"71*!9##ogr',
+    '"#-80#$mile"".4$!7#!6#!9"%/1000"\'0&deg;c#%-mile#"08$#gns#"29#!i#!v"%2,614',
+    '#!3##774""34""4p")6&ndash;7#$,626#!p")7&ndash;8#!5",9&ndash;7025#$,000#!a"#:25"!c"!d',
+    '"!f#"t.""gb"#kts"#lbs"#min!%6&deg&";s#(mdash;82#(ndash;89)"90"#(d)"".0#"3%$!8',
+    '#!7"#047#"mp#!s"%1,000##081"$7400""93#!9""cm"#ers"!g""pc"&x61cms!*7&ndash;74',
+    '"#(3)"$,082##400##700"%-seat#$year"!.#"2%$%/1000#!5#!6#"83$!4"%0,000#!2',
+    '##439##939"/1/1369&ndash;70#$2136$#246"$2611""31#!4#!8"$4535".6/1374&ndash;5""70#!7"%9,452""pc',
+    '#(ndash;80+&&deg;f"\'-minute"".0#!2#"3%#"5%#"6%#!9"#/79"$0056""21"-34&ndash;0287#!6""42',
+    '#!5"%6,000#!9""cm"$mins!%9&deg&";f\'!s#(ndash;80*!1*!2*!8)"90*!7"+-amino-acid',
+    '#!6#"7%""/7""00#!3#!o"$1066##175"%2,000".5/1392&ndash;3")6&ndash;8#!0"%9,000$#380"!m',
+    '#!1$)&ndash;17#!3#!7"!2#(&ndash;5#!2#*4&ndash;30#!5""34#!7""45"!5#!0"!6',
+    '!"ar!"b4""q.!"db"!d"!g!!e!"ha"!e"!q"!r!"je"!g"!q"#uly',
+    '"!j"!x!"ma"!b""hz"!l"!m""ph"!s!"ns!"pb"!l!"qb"!j"!p',
+    '"!j!#sec"!q!"te""h. %8&deg"\'mdash;9#\'iddot;9"%ndash\'\';11&deg)"2%*\'&deg;dh)!8("27("37',
+    '0*13&ndash;1)!\')!7)!8)!9()5&ndash;0)!7("63(#thu"&plus;1"(shilling")times;4in!"\'s!#(6)""7)',
+    '!"+2!-,000-year-old#"47""10#$92mb"!2#&00,000$!7#"29#!3##50m"#322#&60,000"\'511,965#"38',
+    '#&64,000"#713#"50#"60"#867"#900#"48#"59#)93/46,000!#-25"!a"\'channel"$fold"$in-1"$line',
+    '#"z."$page##ort$%under"$slot#%tring!\'.00p.m.#"2%#!4#"5%#!p"$1(c)#".4#$0(b)#$1(a)',
+    '#$2(b)##375#$5.10##7.3%!5"$2(1)$"a)##0am#"4a#$82b.#"ms"#3.4$!5$"93#,0&ndash;11pm',
+    '$!b#!8#!9#"yd",4&mdash;8.16##(a)$"c)#!.$!4$!5#"3p#"5%#!c"*5&ndash;57##(a)',
+    '#".2#"0p#!4#!8#!9#"kb#!m"%6&ins##(1)#%.1986#$2608#"4%#!a#$secs"#7.1',
+    '$!3$!4$!6#,5&ndash;4.22""85#$secs"$9(a)#-0&ndash;32.60#"2p#!9!#/14#"53"!2")450f/230c""81',
+    '"!a"$line"#sac!(0%-owned$$plus"(&ndash;2)!5)"84*"5%"),000-line\'$plus"&-02-24#"90#"km#$page',
+    '"!.#!4$!%#!7"#/80"\'0&mgr;l$)ndash;900#%-acre$#hpa$"km$$room#"02#!4$"34#"hp',
+    '#"mg#"nm##rpm"#186$!8#!p#"st"#2.6"%3,943#!3#&86/486%%sx/25"%486\'s%+-compatible%%dx-33',
+    '\'!3%"sl\'!c&$x/33".5/1402&ndash;3#!0""61#!6""90#$60cf#"ff"$c186#!c""lb"&m-byte',
+    '#\'g/100ml##ins"!r#"\'s"!z!)1&ndash;7#&sol;87"$,607"\'-member#$year"!.#"1%#"3%#!7"#058',
+    '"$1548#"88"(2&sol;79#$,000#"16#"20##547"%3,000#!0#!1##677#!8"%4,000""59"&6/1413',
+    '#!p"(9/august##439"!d!%2&deg&";c"$-ish"".1#"2%#!3#!4#!7"30/september-october#!2#!9',
+    '""10#!7"%2,000#"44"#3/6"%4,000""52#!6#"hp""60#"50#!f"$7679##701"#bhp',
+    '"#mph!)3&ndash;4#&percnt#&sol;78(!9"$,857"!.#!3#!4#!6$!%#"7%#"8%"%0,000#!0',
+    '""10"%2,000#!p""34"-4/march-april##596""56""61""7%")8&mdash;9#$,000#-/1434&ndash;5#!0##222!(4&frac12',
+    ')"87"#(2)#"6)"#.14#!2#!6$!%"#/83".0/1436&ndash;7##429#"ci"%2,504""50#!s".6/1442&ndash;3',
+    '#!0#!p""cm!\'5&deg;f#(ndash;88#&sol;79"(,000,000##300"".1$!%#"5%#!9"(/374/eec"&0-acre##505',
+    '$!i#$yrbp""14$"/a$!5"$2817##myr""40""50#"32#!8"88&ndash;72/1454&ndash;68"#:15"#bhp"%g/3oz',
+    '#!l!+6&ndash;337)!8)"98"$,858"#.1%#"5%$\'x144cms#"6%$!6#"8p"-00&ndash;9227"&1/1457##000#$1196',
+    '"%2,000"$3615#!8""49"%5,000#!6"%6,335#!p""87##803"$9123#!p"!a!%7&deg#\'ndash;9',
+    '"$,500"#.2%#!4#"6%#"97""/0"#010".109&ndash;3432"%2,700#-/1467&ndash;8##937"%3,000"/4/1469&ndash;70".5/1470&ndash;1##929',
+    '"%6,000"67&ndash;8/1472&ndash;3"#bhp"#min!)8&ndash;9*!2""\'s"%-bout"!.#"4%$%/1000#"7%#!8"$0471#!s',
+    '%!s#.10-88410-62110#"20""22""3p";6&ndash;918/1481&ndash;1512#!0##415""7s"$8299"!f"*open-based!$9(2)"$,200"".1',
+    '#"3%#"4%#"6%#"7%""00#!s$$/100"$1605"$2505""69""77")9&ndash;1#!p""in!#:10',
+    '"+22&ndash;25#!4#!5#+7&ndash;9:1""30$"pm"!4#!5"!6"*9&ndash;11!"=0!"af!(b&plusmn"!+""/c',
+    '"!n"!p"!r"!s"!u!#cms!"df!"e2!#ft.!!g!"hr!!i!"jb"!z!!k',
+    '!"ld!"m3!"nt"!w!!o!#p.m"!n!"qq!!r!$secs!"tf!!v!$x4ft"!a"!t',
+    ' #9%.!(&frac12%\'!4&#38%"\'micro;l"(ndash;03)!4)!5)!6)!8(#10%*"pm)#1am)$2(a)*"in',
+    '("27()3&ndash;8)#(a))!2)!6("42("83"&plus;2"&sol;88!#(8)""c)!!+"!1!+,000-strong$!9',
+    '#"23"#251"\'372,614"#470"\'571,300"#657"\'700,000#"30#"52$!8"#847"\'970,610!!-""16""27',
+    '")year-olds!$.0.3#!4##5pm#!6#!9#&d.p.c.#$secs"$1(b)#$.1.2$!4$!6#"2a#$5(b)$".3',
+    '#"pc""2m"$3(b)#\'0am-2pm$#p.m#!m$"ph#"pc"%4&ins#!.$!5$!6$!7#!2#-3&ndash;10.12',
+    '#!7#"8%##9pm"%5&ins#".2#!2#"5p#!7#"km#"pc#$secs"$6(b)#".2#!1#!5',
+    '#!9""71#!2"#8.1#!0#!m#"pc""91#"5%#"pc!&/10/87#!1#!6"$3/87!\'0&deg;e',
+    '#)ndash;120#&percnt"#(1)"!+"&-based#%tonne#$year\'%-olds"#.0%#!3#"47#!5$!5#"9%"$/100',
+    '#%green"\'0&deg;f#%-mile$&strong$(year-old#,/march-april#&0/700s%#890$"00$!i#"34#!4#!5#!8#\'9043504',
+    '#&h04158#"ml##psi"+4&ndash;905#!9""90"!a"!b#!p"&cm/3ft"#deg"#mhz#"in!)1&ndash;2*!1',
+    ')!9"#(1)"#-69#&member"".1#!2#!4#!6"$/533#%p.557"%0,000#"03#!4#!7"%2,050',
+    '#!1#!4""5p""80"%9,102#!1"#mhz"!p"&x182cm!)2&mdash;4#)ndash;101+!2"$,072##490"#-82',
+    '#"4%#"5%#!6"\'/85/eec$!9"%0,000"%17429""21##335#!8"%3,768#"52$!3$!6$!7',
+    '#"61"&4/1518#"07""73"&9/1523"!f""pc!%3,033"".3$$5mph#"4%#!5#"6p"&0/1524##219',
+    '"%1,690#!1""30#,7-compatible""50""60#!1#!8""71""95!(4%-rated"+&deg;c-1min#\'ndash;5"#(3)"&,000km',
+    '"!.#!2#"77"%0,000#!0#!1#!4""31".4/1537&ndash;8#!2"%5,087""71!*5&frac12;p#*ndash;100%+!5',
+    '"(,000,000")-year-old"!.#"22#!5$!%#"7%"&0/950i#"ft#!s""19".3/1546&ndash;7#!2""71"!b',
+    '""hp!)6&mdash;7#&percnt"$,300##700"#.0%#"5p##6p.",0&ndash;1279#&-based#!5""2s".3/1555&ndash;6#!2"&4/1557',
+    '""in"!m"#pp.!%7&deg"$,740##800"".0#"1%#!3$!%#!6""05#!8#!e"&1/1564',
+    '#!0""50""60"68&ndash;9/1570&ndash;1""92"!c""pp!+8&ndash;117"#-91"".2$!%#!3#"54#!6$&&deg;c',
+    '$!6#"9%""10#!m"&2/1575##541"&5/1577#!m"&9/1581#!0""in!%9&deg&";c#)ndash;102*"76',
+    '"#.1%#"6%#/70&plusmn;0.02%$!8#"98$"99&!9%!x"$/xxx"%0/100#.0&ndash;13700m"+1&ndash;992""40$"/3"%7,738',
+    '#"99"&p/100g"#x99!#:10""30#!1#!7"!4##0am""51!$a.m."!d"!e"+m&ndash;5pm"!p',
+    '"!t!"bb"!r!#cms!#d8y"!a!"eg"!l"!r!"ha"!f"!w"!y!"jf!!k',
+    '!"lz!"mb!"np"!r!!o"!s!"pa"!f"!l""m."!x!"rf"!h"!y!"sd',
+    '!$tbsp""hs"!t "=/"!+!#0.2#"35#"65!$1.45"!2"#8.0"!9#".9!#3.1#!2',
+    '""50!"42"%5&deg!#5.0$!5#!7"!8!#6.1#"31#!7!#7.1!$8.67!$9.70"!0!$bout',
+    ' )a&amp;aee&!d&!p&%r-ing\'!s"#bgr%&;e&agr",dollar;1,700*%0.66m+!0*#20m*%7,000)"22*#50m"\'formula',
+    '"\'mdash;3"\'ndash;f"%prime"/yuml;-champagne!+\'chearcaill"$flaq"(mhadaidh"%right!#(2)"#34)""t)!"+g",indomethacin!$-440"#a-a',
+    '")borrowing"%class"&dewin\'"$flap#%usion"$glow#$oing#$rade"!h#$elix"&ko-rus"!n"#one"#p-a#&laying',
+    '#%riori"!r#&aining$&tional#+egistration"&series#&itting#(orrowing"\'talking#$c65n##est#%hirty##o-d#$ract"$week',
+    '#!4""27"#3.1$!2"!5""86"$a.a.$$c.u."$b.a."$c.k.$&s.t.t.$$t.s.#*acatuoides"&d.a.s."$e.j.',
+    '$"r.$$s.d."$f.c.$"s."!g"#i.r"$j.c."&m.i.c."$n.z."$r.a.$$c.a.$!p"$s.a.$"r."$t.p.',
+    '"$v.m."$w.b.!+/00/23/2001&&5/0002&&6/0004+!7#)5/25/2001+!6+!7*"10+!2+!6*"21+!2+!3',
+    '+!7&&7/0001#)9/25/0001"*16/25/0003+!4+!6&&6/0004"*21/05/0001#)3/32/0001+!2+!3+!5+!6+!7+!8',
+    '*"10+!1+!2+!3+!5+!9*"20+!3*"31"*33/25/0002+!3*"31"+401/06/4011&\'26/4001,!2',
+    '\'&6/4012,!8,!9+"25+"36$)4/26/4004$)8/25/4005&\'35/4001,!2$)9/26/4002#*32/09/0891$)9/09/0492&\'26/4011#,51/26/400157,#201',
+    '-"85.!7"+501/26/5006,!9#*16/31/5003""at"$mano"!w!#1\'s"#-70"".2""04#"85""1\'""27',
+    '#!7"!5""63#!9""70#!2"#90s"#gsm!#253!$300s"#30s""50#!1""8m"!9',
+    '""03#"85$!6"$14/4#!5$"/2%!6#!8"$3/10%!3$!3"!4#!3""56!\'5-sized',
+    '"!0#!0#"12""37""40#!8!"60#"11#"95""28"!9"!m!"72"$4(m)"!5',
+    '#!7"!5"!7""81!"94""52!*:chris.txt!"=b!(_,_a_few",a_little_bit"\'la_mode!"a-#.kheper-re-senb#$size"-/02/28/0001-1',
+    '#%kodak"!3"!5"&a/baab#(aaaaaagh%!w"#hah##mes"$land#"en""ms"$rons#/seth-brewington#!t"$sman',
+    '"$1380"!2"!9""aa#%cuses#"da$#don#%lance#)ndonments#"re%!w$"oa#$scal#\'tements#"zi',
+    '$"/2$$toir#%eglen$&ration#%ondio$\'tt/glos\'+headmasters"#c1s"-d&uuml;lhamid#(el-latif%"al&#tif&$zziz%%baset%%fatah',
+    '%%rahim#&ingdon#*ol-hossein$,minoperineal$&rrahim#&ucxted$\'l-rabur&%wakil%$aziz%%kadir%%latif%$nabi%%salam$(r-rabbur"#ebe',
+    '#\'d-rabbo#!m#"nd$$hall#&rargie$\'chalder$$dale&#ron$$ford\'#est$$lady%$emno$$rent$!s$$thaw',
+    '#%tment""f2"#gal"$horr"\'i/banks$&inform#!a##din#$leah$*ity-to-pay#&ngdon."(jectness#$ures"1le&mdash;list.log$--oboe-charlie',
+    '$!y".normal-normals"$orad%!l&"ly$0tion-restricting($ists#"ur$%tness#+ve-numbered&$plan&&stairs#"wt"&rantes$$shes',
+    '#"is#$oad\'$\'gations#&uptly."%s/san#&ailing#*ence-prone%/t&rehy;mindedly#\'inthium#$olom&%utely$\'rptance\'\'iometer)"n.#*tentionist',
+    '($able(#ive%$usus#&urdest&$ists"#tot"(u-halima#!2#&ndante$!e#%rdene#&tilons$"ta"%ysses")zoelutely',
+    '".ad&eacute;mies$#ian#&ppella",bt-2/6/ns1/7%\'3/2/5/7%\'6/ns1/7"&celer8\'$ando)"ts(-ted/automated)!o%(l/object%%steel$)ntuations$/pt/reject/defer',
+    '&+ed/rejected&"is$,ss-per-cycle&$/sql#\'iajuoli$%dence\'*t/incident(%alist*0ly/inadvertently#\'limated#!o$(mmdation&)odatingly+\'on/loss%\'odating',
+    '&!t$!r$(uchement%#nt\'\'%-book(\'holding(\'keeping(\'trading\'"s.#(redition(!s%,tion-induced$\'oaching$)ual-based#"st',
+    '$"ra&#cy."#e/d%!d$%intel#"lt#&phalus##rba$%frame$#ous##tal$)oxymethyl$&ylenes&)salicylic"%field',
+    '$!n%#alt%$ical$&rnians\'#ens#1ievement-oriented$#nsk$"ve#\'melvich#)tawilling"!i#(d-crazed%&etched%$fast%$like',
+    '$)/alkaline%#day%%water$%aspis$#ini$"s.##nus"&k-tors#&ergill##man")land-hood")ne-ridden"*ommodation#+rn/polycell%$hoek',
+    '"$quah%,intanceships$&iesces\'$ence%#re.\'1d-distinctiveness%(sitions.%%taine&!s"%ratic#+id-smelling$&tarchs%$ical#&obated$\'centric',
+    '$$lein$,ss-the-table#(ylamide/%(ic-based"%tants#!g#!i$%nians%&omyces$%on(s)&*-adventure\'&result&$ists&%sport$-vation-energy',
+    '%\'isation&#tes#+or-director%(/actress&(director#"ss#"ts#&ualism\'(t&aacute\'#zes&!l$$elle#!v")ucobol-85#&leatus',
+    '#&tronic$"us"#zel!$d-as#$dali$"in""13$$/8e2"#350"#400#!3"#ada#$kite#\'m-gibbs$$ancy',
+    '$%istic$*s-robinson%&/widow%#ons#"no$#son"$comp"(d-listed#"01#%amax\'#.er-accumulator$%stone$!y##ies#(lebrough',
+    '\',er/addressee"%eanes#&gbehin#\'imantos#$liae%"es%"ne$"la$%manno#%ndorf$"ey$#oid%$mata%&phylla#$ptus',
+    '#%tunji"#gar""h2##3*1#\'ered-to$/sion-activation""ib#(rondacks#+sappointing$!h""ji#.unctivetherapy$%tant-"\'lestone#/ib/soundblaster',
+    '#!i$)nistrated+,ion/benefits+#rix%\'strator$)ssability("le&%ions.*,/confessions#&yssyon"#ney"#oko#)lescence.#$rada$#ers',
+    '#%eople"$rain#1enocorticotrophic##ich$!e""s.##ett#$tone"$ulis$\'t/child%"s.#(mbrating#$s/uk"0van&rehy;tageous%)ced-level',
+    '#!e$#nts$%rbals&%ially%)sarialism%(teerders&!i\'+sing-agency#"ic$%sers.(!/#"ts"+wy-yr-eryon!"e3""ci',
+    '$!s"&grotat#(yptiacus"$lwyd"!m#$ilia##ula%"us\'$(mf)"!n##eus"!o#$nium""ra#"eo',
+    '#$hart#&italia#.obic/anaerobic$$dyne$&engine$)generator$$stat(#ion#(uginosus"&sopian#-theticisation"*ternitatis#)helthryth&$wulf%$real',
+    '%%opica#$olia!)fanas\'yev&"ii&#yev"$eard#%brile#!j#!w"-fable-looking$$irs*#(ectingly\'5ve/attitudinal/social)"ly$"ed',
+    '#%inely%(ity-pure#$rayd$#eux$&ontery"+ghan-soviet"\'latoxin#%utter"%ormer#"ul".rica-homelands&+n-appointed(%based()caribbean))ontrolled',
+    '%)brazilian$$beat$)centrists$$dite +cdu/csu/fdp',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_44 = (
+count_44 = 6695
+
+heads_44 = (
     '&pound;23.1m',
-    '&pound;23.2bn',
-    '&pound;23.44',
-    '&pound;23.4million',
-    '&pound;23.7',
-    '&pound;23.90',
-    '&pound;234m',
-    '&pound;235m',
-    '&pound;237',
-    '&pound;24&ndash;95',
-    '&pound;24,196',
-    '&pound;24,400&ndash;36,600',
-    '&pound;24.1',
-    '&pound;24.2',
-    '&pound;24.25',
-    '&pound;24.3',
     '&pound;24.45',
-    '&pound;24.4million',
-    '&pound;24.6',
-    '&pound;24.7',
-    '&pound;24.76',
-    '&pound;242,900,000',
-    '&pound;243billion',
-    '&pound;244m',
-    '&pound;246,699',
-    '&pound;247,000',
-    '&pound;247million',
-    '&pound;248m',
-    '&pound;249.95',
-    '&pound;25&ndash;30',
-    '&pound;25,000-&pound;30,000',
-    '&pound;25,000-a-year',
     '&pound;25,200',
-    '&pound;25,650',
-    '&pound;25-a-week',
-    '&pound;25.3',
-    '&pound;25.30',
-    '&pound;25.35',
-    '&pound;25.5m',
-    '&pound;25.60',
-    '&pound;25.75',
-    '&pound;25.7bn',
-    '&pound;25.7m',
-    '&pound;250&ndash&pound;300',
-    '&pound;250,000&ndash;300,000',
-    '&pound;250.00',
-    '&pound;25000',
-    '&pound;250k',
     '&pound;251',
-    '&pound;251m',
-    '&pound;251pp',
-    '&pound;252,000',
-    '&pound;253',
-    '&pound;253m',
-    '&pound;254,000',
-    '&pound;254.3m',
-    '&pound;255m',
-    '&pound;256m',
-    '&pound;258,000',
-    '&pound;258,868',
-    '&pound;25billion',
-    '&pound;26,400',
-    '&pound;26.25',
-    '&pound;26.30',
     '&pound;26.4',
-    '&pound;26.45',
-    '&pound;26.6',
-    '&pound;26.7',
-    '&pound;26.9m',
-    '&pound;261',
-    '&pound;263million',
-    '&pound;264,000',
-    '&pound;264m',
-    '&pound;266m',
-    '&pound;268,200',
-    '&pound;269,000',
-    '&pound;26bn',
-    '&pound;27,000m',
-    '&pound;27.00',
-    '&pound;27.1m',
     '&pound;27.2',
-    '&pound;27.25',
-    '&pound;27.30',
-    '&pound;27.3m',
-    '&pound;27.8',
-    '&pound;27.87',
-    '&pound;27.8m',
-    '&pound;271.76m',
-    '&pound;273m',
-    '&pound;274,000',
-    '&pound;276,000',
-    '&pound;27million',
-    '&pound;28,900',
-    '&pound;28.04',
-    '&pound;28.3',
-    '&pound;28.5',
     '&pound;28.5m',
-    '&pound;28.70',
-    '&pound;28.8',
-    '&pound;283,000',
-    '&pound;283m',
-    '&pound;286',
-    '&pound;287.50',
-    '&pound;288,000',
-    '&pound;289.9m',
-    '&pound;29,400',
-    '&pound;29.1',
-    '&pound;29.2m',
-    '&pound;29.35',
-    '&pound;29.6bn',
-    '&pound;29.7',
-    '&pound;29.70',
     '&pound;29.75',
-    '&pound;29.8',
-    '&pound;29.80',
-    '&pound;29.9',
-    '&pound;290.2m',
-    '&pound;291,000',
-    '&pound;292,000',
-    '&pound;292m',
-    '&pound;293,656',
-    '&pound;294',
-    '&pound;295m',
-    '&pound;298',
-    '&pound;2k',
-    '&pound;2m-rated',
-    '&pound;2o',
-    '&pound;2oo',
     '&pound;3&frac12',
-    '&pound;3&frac12;m',
-    '&pound;3&ndash;4,000',
-    '&pound;3&ndash;5',
-    '&pound;3,000,000',
-    '&pound;3,000m',
-    '&pound;3,060',
-    '&pound;3,150',
-    '&pound;3,300-a-month',
-    '&pound;3,335',
-    '&pound;3,500,000',
-    '&pound;3,647m',
-    '&pound;3,650',
-    '&pound;3,664',
-    '&pound;3,695',
-    '&pound;3,877',
     '&pound;3,934.82',
-    '&pound;3,976',
-    '&pound;3-an-hour',
-    '&pound;3.03',
-    '&pound;3.13m',
-    '&pound;3.1million',
-    '&pound;3.23',
-    '&pound;3.24',
-    '&pound;3.2bn',
-    '&pound;3.32',
-    '&pound;3.38',
-    '&pound;3.3billion',
-    '&pound;3.3m.',
-    '&pound;3.3s.0d.',
-    '&pound;3.43',
-    '&pound;3.44',
     '&pound;3.4bn',
-    '&pound;3.51m',
-    '&pound;3.57',
-    '&pound;3.59',
-    '&pound;3.5m.',
-    '&pound;3.60/150ml',
-    '&pound;3.73',
-    '&pound;3.75m',
-    '&pound;3.8bn',
-    '&pound;3.90/150ml',
-    '&pound;3.97',
-    '&pound;3.9bn',
-    '&pound;30,000-&pound;40,000',
-    '&pound;30,000-a-year',
-    '&pound;30,500',
-    '&pound;30,800',
     '&pound;30.9bn',
-    '&pound;300,000&ndash;400,000',
-    '&pound;300,000,000',
-    '&pound;300-&pound;500',
-    '&pound;300-a-week',
-    '&pound;300-plus',
-    '&pound;300.',
-    '&pound;300.24',
-    '&pound;300m-plus',
-    '&pound;301,000',
-    '&pound;304m',
-    '&pound;305m',
-    '&pound;305million',
-    '&pound;306,000',
-    '&pound;308m',
-    '&pound;309,000',
     '&pound;30m-plus',
-    '&pound;30million',
-    '&pound;31,250',
-    '&pound;31.2',
-    '&pound;31.40',
-    '&pound;31.5',
-    '&pound;310m',
-    '&pound;311.50',
-    '&pound;312,000',
-    '&pound;317',
-    '&pound;31million',
-    '&pound;32.00',
-    '&pound;32.1m',
-    '&pound;32.2',
-    '&pound;32.3',
-    '&pound;32.4m',
     '&pound;32.6m',
-    '&pound;322.5m',
-    '&pound;322m',
-    '&pound;323,000',
-    '&pound;324.6m',
-    '&pound;325.0.0',
-    '&pound;329,000',
-    '&pound;329,426',
-    '&pound;33,050',
-    '&pound;33,300',
-    '&pound;33.1m',
-    '&pound;33.3million',
-    '&pound;33.5million',
-    '&pound;33.6m',
-    '&pound;33.70',
-    '&pound;33.75',
     '&pound;3300',
-    '&pound;331',
-    '&pound;331,218',
-    '&pound;335m',
-    '&pound;337',
-    '&pound;337.6m',
-    '&pound;338,000',
-    '&pound;338.90',
-    '&pound;339.96',
-    '&pound;34*',
-    '&pound;34-99',
-    '&pound;34.1',
-    '&pound;34.1bn',
-    '&pound;34.25',
-    '&pound;34.5',
-    '&pound;34.6',
     '&pound;34.7m',
-    '&pound;34.8',
-    '&pound;342m',
-    '&pound;345,000',
-    '&pound;346m',
-    '&pound;348',
-    '&pound;348,000',
-    '&pound;35,000-a-year',
-    '&pound;35.1m',
-    '&pound;35.3',
-    '&pound;35.35',
-    '&pound;35.4',
-    '&pound;35.60',
-    '&pound;35.75',
-    '&pound;35.8',
-    '&pound;350&ndash;450,000',
     '&pound;350-a-night',
-    '&pound;350.00',
-    '&pound;351.3',
-    '&pound;351.4',
-    '&pound;352',
-    '&pound;352,000',
-    '&pound;353,000',
-    '&pound;353m',
-    '&pound;354',
-    '&pound;356',
-    '&pound;357,000',
-    '&pound;358,000',
-    '&pound;35million',
-    '&pound;36,375',
-    '&pound;36,700&ndash;55,000',
-    '&pound;36.5',
     '&pound;36.5m',
-    '&pound;36.7',
-    '&pound;362',
-    '&pound;362.51',
-    '&pound;365,000',
-    '&pound;365m',
-    '&pound;366',
-    '&pound;369,000',
-    '&pound;37.5',
-    '&pound;37.60',
-    '&pound;37.63',
-    '&pound;37.7m',
-    '&pound;37.80',
-    '&pound;373',
-    '&pound;375.',
-    '&pound;375m',
     '&pound;376m',
-    '&pound;377',
-    '&pound;378m',
-    '&pound;379,000',
-    '&pound;38.00',
-    '&pound;38.25',
-    '&pound;38.2m',
-    '&pound;38.3m',
-    '&pound;38.6',
-    '&pound;38.7m',
-    '&pound;38.8',
-    '&pound;38.8m',
-    '&pound;383,935',
-    '&pound;384',
-    '&pound;384,000',
-    '&pound;384m',
     '&pound;385.00',
-    '&pound;385m',
-    '&pound;387',
-    '&pound;389,431',
-    '&pound;38million',
-    '&pound;39,950',
-    '&pound;39-99',
-    '&pound;39.00',
-    '&pound;39.1m',
-    '&pound;39.2',
-    '&pound;39.25',
-    '&pound;39.40',
-    '&pound;39.5m',
-    '&pound;39.95+vat',
-    '&pound;3900',
-    '&pound;391',
     '&pound;391.09',
-    '&pound;391.1m',
-    '&pound;392',
-    '&pound;395+vat',
-    '&pound;396',
-    '&pound;396,000',
-    '&pound;398',
-    '&pound;4,000&ndash;6,000',
-    '&pound;4,000-a-week',
-    '&pound;4,100',
-    '&pound;4,200,000',
-    '&pound;4,240',
-    '&pound;4,370',
-    '&pound;4,450',
-    '&pound;4,500,000',
-    '&pound;4,560',
     '&pound;4,684',
-    '&pound;4,715',
-    '&pound;4,950',
-    '&pound;4,999',
-    '&pound;4--',
-    '&pound;4.04',
-    '&pound;4.05',
-    '&pound;4.09m',
-    '&pound;4.0m',
-    '&pound;4.15',
-    '&pound;4.18',
-    '&pound;4.35bn',
-    '&pound;4.38',
-    '&pound;4.39',
-    '&pound;4.43',
-    '&pound;4.5&ndash;6.5',
     '&pound;4.55',
-    '&pound;4.57',
-    '&pound;4.63m',
-    '&pound;4.6m',
-    '&pound;4.70',
-    '&pound;4.78',
-    '&pound;4.86',
-    '&pound;4.87',
-    '&pound;4.8bn',
-    '&pound;4.8million',
-    '&pound;4.90',
-    '&pound;4.90/150ml',
-    '&pound;4.9m',
-    '&pound;40&ndash;50,000',
-    '&pound;40,000-&pound;50,000',
-    '&pound;40,000-a-year',
     '&pound;40,000-worth',
-    '&pound;40,230',
-    '&pound;40,700',
-    '&pound;40.3',
-    '&pound;40.3m',
-    '&pound;40.4',
-    '&pound;40.5m',
-    '&pound;40.6m',
-    '&pound;40.95',
-    '&pound;400-&pound;500',
-    '&pound;400-&pound;600',
-    '&pound;401m',
-    '&pound;402,000',
-    '&pound;406.5',
-    '&pound;406m',
-    '&pound;407,000',
     '&pound;408',
-    '&pound;409m',
-    '&pound;40m.',
-    '&pound;410,000',
-    '&pound;414',
-    '&pound;416.7m',
-    '&pound;417m',
-    '&pound;418',
-    '&pound;42,399',
-    '&pound;42,426,421',
-    '&pound;42.2m',
-    '&pound;42.3m',
-    '&pound;42.4m',
-    '&pound;42.5m',
-    '&pound;42.7',
-    '&pound;420million',
     '&pound;423',
-    '&pound;425m',
-    '&pound;427',
-    '&pound;427,000',
-    '&pound;42k',
-    '&pound;42million',
-    '&pound;43.1',
-    '&pound;43.10',
-    '&pound;433',
-    '&pound;435,000',
-    '&pound;436,000',
-    '&pound;437',
-    '&pound;44,400',
-    '&pound;44.1m',
-    '&pound;44.5m',
-    '&pound;44.66',
     '&pound;44.98',
-    '&pound;441',
-    '&pound;442',
-    '&pound;444m',
-    '&pound;448',
-    '&pound;448m',
-    '&pound;449.00',
-    '&pound;45,000&ndash;55,000',
-    '&pound;45-million',
-    '&pound;45.5m',
-    '&pound;45.6m',
-    '&pound;45.95',
-    '&pound;45.99',
-    '&pound;450.00',
-    '&pound;451m',
-    '&pound;453',
     '&pound;454,000',
-    '&pound;457',
-    '&pound;458',
-    '&pound;459.99',
-    '&pound;46,400',
-    '&pound;46.10',
-    '&pound;46.1m',
-    '&pound;46.30',
-    '&pound;46.5m',
-    '&pound;460million',
-    '&pound;461',
-    '&pound;463m',
-    '&pound;465,000',
-    '&pound;466',
-    '&pound;469,000',
-    '&pound;47,500',
     '&pound;47,600',
-    '&pound;47.00',
-    '&pound;47.4',
-    '&pound;47.40',
-    '&pound;47.4m',
-    '&pound;47.6',
-    '&pound;47.95',
-    '&pound;470,000',
-    '&pound;474',
-    '&pound;475.00',
-    '&pound;479.90',
-    '&pound;48.5m',
-    '&pound;480million',
-    '&pound;481,405',
-    '&pound;4820.27.',
-    '&pound;484',
     '&pound;484.53',
-    '&pound;488',
-    '&pound;49,995',
-    '&pound;49.3m',
-    '&pound;492,000',
-    '&pound;496',
-    '&pound;499.99',
-    '&pound;4oo',
-    '&pound;5&frac12;m',
-    '&pound;5&ndash;10',
-    '&pound;5&ndash;8,000',
-    '&pound;5,000&ndash;8,000',
-    '&pound;5,000-&pound;10,000',
-    '&pound;5,000-&pound;8,000',
-    '&pound;5,000.',
-    '&pound;5,000a-year',
     '&pound;5,355',
-    '&pound;5-&pound;10',
-    '&pound;5.',
-    '&pound;5.08',
-    '&pound;5.09',
-    '&pound;5.18',
-    '&pound;5.32',
-    '&pound;5.39',
-    '&pound;5.3million',
-    '&pound;5.40/50ml',
-    '&pound;5.44',
-    '&pound;5.55',
-    '&pound;5.65',
-    '&pound;5.6million',
-    '&pound;5.80',
-    '&pound;5.89',
     '&pound;5/&pound;3.50/&pound;2.50',
-    '&pound;5/hr',
-    '&pound;50&ndash;100',
-    '&pound;50&ndash;60,000',
-    '&pound;50,000&ndash;60,000',
-    '&pound;50,287',
-    '&pound;50,620',
-    '&pound;50-worth',
-    '&pound;50.1',
-    '&pound;50.3m',
-    '&pound;50.50',
-    '&pound;50.6m',
-    '&pound;50.75',
-    '&pound;50/column',
-    '&pound;500-&pound;700',
-    '&pound;500-a-plate',
     '&pound;500k',
-    '&pound;500m-600m',
-    '&pound;500million',
-    '&pound;501m',
-    '&pound;502',
-    '&pound;503',
-    '&pound;505m',
-    '&pound;506.78',
-    '&pound;508',
-    '&pound;508.3m',
-    '&pound;509',
-    '&pound;50pa',
-    '&pound;51,500',
-    '&pound;51.2m',
-    '&pound;510,000',
-    '&pound;517',
     '&pound;518m',
-    '&pound;52&ndash;70,000',
-    '&pound;52.10',
-    '&pound;52.18s.8d.',
-    '&pound;52.2',
-    '&pound;52.25',
-    '&pound;52.6',
-    '&pound;52.65',
-    '&pound;52.9',
-    '&pound;5227.03',
-    '&pound;5227.63.',
-    '&pound;524,000',
-    '&pound;527',
-    '&pound;527.22',
-    '&pound;52m',
-    '&pound;53,100',
     '&pound;53.1million',
-    '&pound;530m',
-    '&pound;532,000',
-    '&pound;533,000',
-    '&pound;533,000&ndash;800,000',
-    '&pound;534',
-    '&pound;534,000',
-    '&pound;535',
-    '&pound;535,000',
-    '&pound;536,000',
-    '&pound;538',
-    '&pound;54.1m',
-    '&pound;54.2m',
-    '&pound;54.40',
-    '&pound;540,000',
-    '&pound;543',
     '&pound;549.99',
-    '&pound;55.1m',
-    '&pound;55.20',
-    '&pound;55.5m',
-    '&pound;55.6million',
-    '&pound;5500',
-    '&pound;555,000',
-    '&pound;558,432',
-    '&pound;559,124',
-    '&pound;55million',
-    '&pound;56,400',
-    '&pound;56,998,221',
-    '&pound;56.10',
-    '&pound;560,000',
-    '&pound;566',
-    '&pound;567.22',
     '&pound;568',
-    '&pound;57.15',
-    '&pound;57.5',
-    '&pound;57.60',
-    '&pound;571',
-    '&pound;572,000',
-    '&pound;572m',
-    '&pound;574,000',
-    '&pound;576,000',
-    '&pound;578',
-    '&pound;578m',
-    '&pound;57m.',
-    '&pound;58.00',
-    '&pound;58.33',
-    '&pound;58.50',
-    '&pound;58.95',
     '&pound;58.99',
-    '&pound;580m',
-    '&pound;583',
-    '&pound;584',
-    '&pound;585m',
-    '&pound;588.4',
-    '&pound;589',
-    '&pound;59.00',
-    '&pound;59.4m',
-    '&pound;59.7m',
-    '&pound;591',
-    '&pound;591.90',
-    '&pound;592',
-    '&pound;594m',
-    '&pound;595,000',
-    '&pound;5950',
     '&pound;597',
-    '&pound;599.99',
-    '&pound;5b',
-    '&pound;5billion',
-    '&pound;5oo',
-    '&pound;6&ndash;800',
-    '&pound;6,000&ndash;8,000',
-    '&pound;6,230',
-    '&pound;6,400',
-    '&pound;6,500,000',
-    '&pound;6,510',
-    '&pound;6,835',
-    '&pound;6.03',
-    '&pound;6.15',
-    '&pound;6.15s.0d.',
-    '&pound;6.18',
     '&pound;6.1bn',
-    '&pound;6.29',
-    '&pound;6.30',
-    '&pound;6.358',
-    '&pound;6.45',
-    '&pound;6.49m',
-    '&pound;6.55',
-    '&pound;6.59',
-    '&pound;6.5bn',
-    '&pound;6.75m',
-    '&pound;6.84',
-    '&pound;6.85bn',
-    '&pound;6.89',
-    '&pound;6.96',
-    '&pound;6/&pound;4.50/&pound;3',
-    '&pound;60,000&ndash;90,000',
     '&pound;60,000,000',
-    '&pound;60,000-a-year',
-    '&pound;60.',
-    '&pound;60.6m',
-    '&pound;60.9m',
-    '&pound;600&ndash;800,000',
-    '&pound;600-a-term',
-    '&pound;600million',
-    '&pound;602',
-    '&pound;604',
-    '&pound;605,000',
-    '&pound;609',
-    '&pound;60million',
-    '&pound;61,750',
-    '&pound;61,900&ndash;92,900',
-    '&pound;61.02',
     '&pound;61.8',
-    '&pound;612',
-    '&pound;614',
-    '&pound;615,000',
-    '&pound;615m',
-    '&pound;618',
-    '&pound;619,000',
-    '&pound;61million',
-    '&pound;62,300',
-    '&pound;62,480,893',
-    '&pound;62,500&ndash;93,750',
-    '&pound;62.50',
-    '&pound;62.7m',
-    '&pound;620,000',
-    '&pound;622',
-    '&pound;625m',
     '&pound;629',
-    '&pound;63,000',
-    '&pound;63.00',
-    '&pound;63.40',
-    '&pound;63.5m',
-    '&pound;630,000',
-    '&pound;631',
-    '&pound;631.76',
-    '&pound;63180',
-    '&pound;632,000',
-    '&pound;638',
-    '&pound;64.00',
-    '&pound;64.4',
-    '&pound;640m',
-    '&pound;641',
-    '&pound;646,000',
     '&pound;648',
-    '&pound;649',
-    '&pound;65,000,000',
-    '&pound;65.00',
-    '&pound;65.2m',
-    '&pound;65.7m',
-    '&pound;652',
-    '&pound;653',
-    '&pound;653,000',
-    '&pound;655',
-    '&pound;655,000',
-    '&pound;657',
-    '&pound;659',
-    '&pound;66,700',
-    '&pound;66.2m',
-    '&pound;664',
     '&pound;67.4m',
-    '&pound;67.5',
-    '&pound;674',
-    '&pound;679',
-    '&pound;67m',
-    '&pound;68.5m',
-    '&pound;680m',
-    '&pound;681',
-    '&pound;687,500',
-    '&pound;69,240',
-    '&pound;69,500',
-    '&pound;69.1m',
-    '&pound;69.4',
-    '&pound;69.80',
-    '&pound;693,000',
-    '&pound;695,000',
     '&pound;697',
-    '&pound;697million',
-    '&pound;69million',
-    '&pound;7&ndash;10,000',
-    '&pound;7&pound;10',
-    '&pound;7,000,000',
-    '&pound;7,000-a-year',
-    '&pound;7,000-plus',
-    '&pound;7,100',
-    '&pound;7,150',
-    '&pound;7,599,000',
-    '&pound;7,645',
-    '&pound;7,840',
-    '&pound;7,850',
-    '&pound;7-&pound;15',
-    '&pound;7.10',
     '&pound;7.35',
-    '&pound;7.59',
-    '&pound;7.6m',
-    '&pound;7.76million',
-    '&pound;7.79m',
-    '&pound;7.81m',
-    '&pound;70,000&ndash;100,000',
-    '&pound;70,765',
-    '&pound;70000',
-    '&pound;700000',
-    '&pound;702',
-    '&pound;703',
-    '&pound;703m',
-    '&pound;704',
-    '&pound;705',
-    '&pound;706',
     '&pound;71.1m',
-    '&pound;71.4',
-    '&pound;71.7',
-    '&pound;71.85',
-    '&pound;710.96',
-    '&pound;717',
-    '&pound;72,300',
-    '&pound;72.2m',
-    '&pound;72.95',
-    '&pound;723',
-    '&pound;728',
-    '&pound;73.2',
-    '&pound;73.3',
-    '&pound;731.38',
-    '&pound;733',
-    '&pound;733,000',
     '&pound;735,000',
-    '&pound;735m',
-    '&pound;736',
-    '&pound;738',
-    '&pound;73billion',
-    '&pound;740,700',
-    '&pound;742,000',
-    '&pound;746',
-    '&pound;748,000',
-    '&pound;750.',
-    '&pound;750million',
-    '&pound;755',
-    '&pound;75k',
-    '&pound;762m',
-    '&pound;766',
-    '&pound;766,000',
     '&pound;77,500',
-    '&pound;770m',
-    '&pound;774',
-    '&pound;776',
-    '&pound;778',
-    '&pound;782',
-    '&pound;783',
-    '&pound;79,500',
-    '&pound;79.00',
-    '&pound;790m',
-    '&pound;794',
-    '&pound;795,000',
-    '&pound;796',
-    '&pound;799.00',
-    '&pound;8&ndash;9',
-    '&pound;8&pound;15',
     '&pound;8,000&ndash;12,000',
-    '&pound;8,000-&pound;10,000',
-    '&pound;8,000-a-year',
-    '&pound;8,100',
-    '&pound;8,320',
-    '&pound;8,340',
-    '&pound;8,450',
-    '&pound;8,750',
-    '&pound;8,850',
-    '&pound;8,900',
-    '&pound;8.0',
-    '&pound;8.15',
-    '&pound;8.30',
-    '&pound;8.35',
-    '&pound;8.574',
-    '&pound;8.58',
     '&pound;8.72',
-    '&pound;8.7m',
-    '&pound;8.81',
-    '&pound;8.8m',
-    '&pound;8.9',
-    '&pound;8.90',
-    '&pound;80&ndash&pound;100',
-    '&pound;80&ndash;100,000',
-    '&pound;80&ndash;120',
-    '&pound;80,000-a-year',
-    '&pound;80,000-plus',
-    '&pound;803',
-    '&pound;803,000',
-    '&pound;805',
-    '&pound;8063.36',
-    '&pound;807,230.31',
     '&pound;809,000',
-    '&pound;809.8m',
-    '&pound;80bn',
-    '&pound;80k',
-    '&pound;81,600',
-    '&pound;81.5m',
-    '&pound;81.98',
-    '&pound;810s.',
-    '&pound;824m',
-    '&pound;83,812',
-    '&pound;83.15',
-    '&pound;83.8m',
-    '&pound;830,000',
-    '&pound;831m',
-    '&pound;838',
-    '&pound;84,400',
     '&pound;840,000',
-    '&pound;840,799',
-    '&pound;840m',
-    '&pound;849',
-    '&pound;85.00',
-    '&pound;85.3',
-    '&pound;85.50',
-    '&pound;855',
-    '&pound;856,000',
-    '&pound;857',
-    '&pound;858,000',
-    '&pound;859',
-    '&pound;86.66',
-    '&pound;860,000',
-    '&pound;862',
-    '&pound;863',
     '&pound;864',
-    '&pound;865,000',
-    '&pound;868',
-    '&pound;87.1m',
-    '&pound;87.5',
-    '&pound;87.50',
-    '&pound;8750',
-    '&pound;878',
-    '&pound;88.95',
-    '&pound;888',
-    '&pound;89.90',
-    '&pound;892',
-    '&pound;9,125',
-    '&pound;9,200',
-    '&pound;9,260,761',
-    '&pound;9,680',
     '&pound;9,800',
-    '&pound;9,942',
-    '&pound;9,950',
-    '&pound;9,960',
-    '&pound;9,995',
-    '&pound;9.16m',
-    '&pound;9.22m',
-    '&pound;9.30',
-    '&pound;9.54',
-    '&pound;9.5bn',
-    '&pound;9.66',
-    '&pound;9.6billion',
-    '&pound;9.73',
-    '&pound;90.00',
-    '&pound;90.4m',
-    '&pound;902',
     '&pound;902,000',
-    '&pound;902m',
-    '&pound;903',
-    '&pound;910,319',
-    '&pound;918',
-    '&pound;92,500',
-    '&pound;92.60',
-    '&pound;921',
-    '&pound;922,000',
-    '&pound;925m',
-    '&pound;93,500',
-    '&pound;93,750&ndash;125,000',
-    '&pound;93.5',
-    '&pound;93.75',
-    '&pound;93.90',
-    '&pound;930,000',
     '&pound;934,000',
-    '&pound;935',
-    '&pound;935,000',
-    '&pound;940m',
-    '&pound;952',
-    '&pound;953',
-    '&pound;956',
-    '&pound;960,000',
-    '&pound;9600',
-    '&pound;968m',
-    '&pound;97,500',
-    '&pound;97.50',
-    '&pound;97.9m',
-    '&pound;970',
-    '&pound;978,000',
-    '&pound;98.1million',
     '&pound;98.2m',
-    '&pound;980',
-    '&pound;99,950',
-    '&pound;99,999,999',
-    '&pound;99.02',
-    '&pound;99.4',
-    '&pound;9907&ndash&pound',
-    '&pound;994',
-    '&pound;996,000',
-    '&pound;999.00',
-    '&pound;9bn',
-    '&pound;d',
-    '&pound;g',
-    '&pound;i',
-    '&pound;l.70',
-    '&pound;pound',
     '&pound;pound1,000',
-    '&pound;pound10',
-    '&pound;pound12',
-    '&pound;pound2',
-    '&pound;pound5',
-    '&pound;pound50',
-    '&pound;r',
-    '&pound;so',
-    '&pound;the',
-    '&radic;3',
-    '&radic;3:1',
-    '&rarr;salivation',
-    '&rarr;uf',
-    '&rgr&bsol;s',
-    '&scaron;irok&aacute',
-    '&scaron;kocjan',
     '&scaron;kvoreck&yacute\'s',
-    '&scaron;porkova',
-    '&scaron;tipl',
-    '&scedil;erif',
-    '&sect;1.19',
-    '&sect;1.22',
-    '&sect;10',
-    '&sect;2.10.1',
-    '&sect;252',
-    '&sect;281',
-    '&sect;282',
-    '&sgr;-subunit',
-    '&sharp;4/&sharp;11',
-    '&sim;2',
-    '&sim;3',
-    '&sim;300',
     '&sim;8',
-    '&thgr/z',
-    '&thorn&aacute',
-    '&thorn;onne',
-    '&times;10/ml',
-    '&times;2',
-    '&times;22',
-    '&times;26',
-    '&times;300',
-    '&times;45',
-    '&times;7',
-    '&times;8in',
-    '&verbar&lt;keyword',
-    '&verbar;g&verbar',
-    '&verbar;i',
-    '&verbar;qaworkspace&verbar',
     '&verbar;ri&verbar',
-    '&verbar;time',
-    '&ycirc',
-    '&yen;1',
-    '&yen;1.2',
-    '&yen;107',
-    '&yen;115',
-    '&yen;13.2',
-    '&yen;150',
-    '&yen;20',
-    '&yen;4',
-    '&yen;40',
-    '&yen;400',
-    '&yen;455',
-    '&zcaron;i&zcaron;ka',
-    '&zcaron;iga',
     '\'\'\'',
-    '\'07',
-    '\'20',
-    '\'31',
-    '\'46',
-    '\'51',
-    '\'55',
-    '\'56',
-    '\'65',
-    '\'80s-style',
-    '\'86/\'87',
-    '\'alf-a-crown',
-    '\'annah',
-    '\'annoyance\'',
-    '\'ansom',
-    '\'antrim\'',
     '\'appel\'',
-    '\'arassment',
-    '\'ard-up',
-    '\'arringay',
-    '\'asty',
-    '\'aybag',
-    '\'best',
-    '\'boat',
-    '\'bus',
-    '\'by',
-    '\'can',
-    '\'cave',
-    '\'cello',
-    '\'come',
-    '\'dall',
-    '\'dogs',
     '\'drome',
-    '\'e\'s.',
-    '\'eadache',
-    '\'eavens',
-    '\'elped',
-    '\'elpless',
-    '\'elps',
-    '\'en',
-    '\'f\'',
-    '\'failure\'',
-    '\'for',
-    '\'gators',
-    '\'get',
-    '\'good',
-    '\'has',
-    '\'heads',
     '\'hung\'',
-    '\'i\'',
-    '\'ide',
-    '\'iding',
-    '\'ill',
-    '\'isself',
-    '\'itler',
-    '\'jamas',
-    '\'large',
-    '\'lash',
-    '\'less',
-    '\'little',
-    '\'long',
-    '\'look',
-    '\'may',
-    '\'moves',
     '\'neath',
-    '\'new',
-    '\'no\'',
-    '\'obby',
-    '\'old-up',
-    '\'on',
-    '\'ooter',
-    '\'orror',
-    '\'otel',
-    '\'ousemaid',
-    '\'phoned',
-    '\'re_all_the',
-    '\'reasonably',
-    '\'rebajaz\'',
-    '\'red',
-    '\'right',
     '\'rung\'',
-    '\'s_all',
-    '\'s_an_awful',
-    '\'saying',
-    '\'see',
-    '\'seventies',
-    '\'shall',
-    '\'sitting',
-    '\'social',
-    '\'soft',
-    '\'spiritual',
-    '\'springboard',
-    '\'stand',
-    '\'stralia',
-    '\'supply',
-    '\'th',
     '\'thank',
-    '\'twenties',
-    '\'two',
-    '\'undreds',
-    '\'urts',
-    '\'use\'',
-    '\'way',
-    '\'with',
-    '\'without',
-    '\'works',
-    '\'your',
-    '\'zine',
-    '******',
-    '****ed',
-    '****prof',
-    '***communist',
     '***new',
-    '**abdullah',
-    '**additional',
-    '**alan',
-    '**alhaji',
-    '**allen',
-    '**anna',
-    '**augusto',
-    '**bob',
-    '**carlo',
-    '**chong',
-    '**col',
-    '**desmond',
-    '**district',
-    '**first',
-    '**hamid',
     '**hytrel',
-    '**includes',
-    '**including',
-    '**ion',
-    '**jean-luc',
-    '**khalid',
-    '**kuo',
-    '**kurdistan',
-    '**lt.',
-    '**m',
-    '**maj',
-    '**michel',
-    '**mir',
-    '**mohammed',
-    '**party',
-    '**reshuffled.',
     '**retained',
-    '**shaikh',
-    '**shirley',
-    '**sir',
-    '**the',
-    '*adnan',
-    '*alfred',
-    '*alfredo',
-    '*amaret',
-    '*arlindo',
-    '*badamdorjiyn',
-    '*boris',
-    '*brian',
-    '*capt',
-    '*care',
-    '*carlo',
     '*chang',
-    '*charles',
-    '*chief',
-    '*choi',
-    '*choudhry',
-    '*christian',
-    '*currently',
-    '*d',
-    '*dimo',
-    '*do',
-    '*e',
-    '*edward',
-    '*elisabeth',
-    '*emiliya',
-    '*erase',
-    '*farah',
     '*finds',
-    '*formed',
-    '*fran&ccedil;ois',
-    '*georgi',
-    '*gerda',
-    '*gholam',
-    '*greens',
-    '*guido',
-    '*he',
-    '*herbert',
-    '*hu',
-    '*if',
-    '*included',
-    '*insert',
-    '*j&oacute;n',
-    '*jamal',
     '*janusz',
-    '*jawdat',
-    '*jos&eacute',
-    '*k',
-    '*left',
-    '*leopoldo',
-    '*libere',
-    '*liu',
-    '*louis',
-    '*lt.',
-    '*luis',
-    '*maria',
-    '*matey',
-    '*maulana',
-    '*mihai',
-    '*mihnea',
     '*mir',
-    '*mircea',
-    '*misoji',
-    '*most',
-    '*natsagiyn',
-    '*nb',
-    '*never*',
-    '*nikolaos',
-    '*olawale',
-    '*om',
-    '*palestinian',
-    '*paul',
-    '*pham',
-    '*phan',
-    '*polygon',
-    '*r',
     '*rafael',
-    '*re-elected',
-    '*really*',
-    '*ren&eacute',
-    '*rename',
-    '*robert',
-    '*rudolf',
-    '*s',
-    '*salih',
-    '*sardar',
-    '*sayed',
-    '*shetima',
-    '*shkelqim',
-    '*spool',
-    '*stop',
-    '*strike',
     '*tan',
-    '*that',
-    '*tran',
-    '*transport',
-    '*two',
-    '*umar',
-    '*vaclav',
-    '*wang',
-    '*wei',
-    '*why',
-    '*wu',
-    '*zakari',
-    '*zhang',
-    '+&pound;20',
-    '+&pound;3',
-    '+0.171875',
     '+0.66',
-    '+0800',
-    '+10%',
-    '+10.6',
-    '+11.0',
-    '+12db',
-    '+15',
-    '+150',
-    '+16',
-    '+16.5',
-    '+16.6',
-    '+17.5',
-    '+180',
-    '+1rn',
-    '+26.2',
-    '+30%',
     '+31',
-    '+32',
-    '+35',
-    '+35.2',
-    '+4.2',
-    '+45&deg',
-    '+45&deg;c',
-    '+48.5%',
-    '+49',
-    '+4db',
-    '+6.0',
-    '+60',
-    '+7mv',
-    '+81',
-    '+9',
-    '+:f7',
     '+alhaji',
-    '+david',
-    '+joseph',
-    '+p.',
-    '+round',
-    '+the',
-    '+us&dollar;1,600',
-    '+us&dollar;300',
-    '+us&dollar;966',
-    '+x',
-    '-&formula',
-    '-&pound;15',
-    '-&prime',
-    '-(-c)',
-    '-(c)',
-    '---',
     '-/-',
-    '-0.05',
-    '-0.07',
-    '-0.096',
-    '-0.1',
-    '-0.12',
-    '-0.23',
-    '-0.35',
-    '-0.5&deg;c',
-    '-0.82',
-    '-0.9%',
-    '-1.2%',
-    '-1.5',
-    '-1.6',
-    '-1.7',
-    '-10%',
     '-10.1',
-    '-100',
-    '-105',
-    '-11.6',
-    '-12&deg;c',
-    '-120',
-    '-12cm',
-    '-13&deg;f',
-    '-130',
-    '-14.6',
-    '-15.3',
-    '-15.6',
-    '-15.8',
-    '-1599',
-    '-15cm',
-    '-16.1',
     '-1600',
-    '-17&deg',
-    '-17.5',
-    '-18%',
-    '-188',
-    '-2&deg',
-    '-2,0,1',
-    '-2-butenyl',
-    '-2.3',
-    '-2.3%',
-    '-20%',
-    '-20&deg',
-    '-20.0',
-    '-2198',
-    '-2199',
-    '-23',
     '-24',
-    '-25&deg;c',
-    '-25.8',
-    '-26',
-    '-26.225',
-    '-2749',
-    '-291',
-    '-2wm',
-    '-3&deg',
-    '-3.1',
-    '-3.2',
-    '-3.3',
-    '-3.4',
-    '-30c',
-    '-31.1',
-    '-314',
     '-34',
-    '-37.5',
-    '-39.5',
-    '-4&deg;c',
-    '-4&deg;f',
-    '-4.5',
-    '-40&deg',
-    '-409',
-    '-40c',
-    '-412',
-    '-42',
-    '-44&deg;20\'',
-    '-4419',
-    '-45&deg',
-    '-45.278',
-    '-45.5',
     '-4500',
-    '-46',
-    '-46.5',
-    '-49.5',
-    '-5%',
-    '-5&deg',
-    '-5&deg;c',
-    '-5.9',
-    '-500',
-    '-50c',
-    '-51',
-    '-52',
-    '-527',
-    '-529',
-    '-531',
-    '-55&deg;c',
     '-594',
-    '-60&deg;c',
-    '-60mv',
-    '-61.5',
-    '-62',
-    '-68',
-    '-690',
-    '-692',
-    '-7&deg',
-    '-7.3',
-    '-70&deg',
-    '-70:c',
-    '-761',
-    '-776',
-    '-8.4',
-    '-82',
     '-84.5',
-    '-88',
-    '-9%',
-    '-92',
-    '-925',
-    '-97',
-    '-996',
-    '-997',
-    '-able',
-    '-acetyl-',
-    '-acid',
-    '-acting',
-    '-address',
-    '-adenosyl',
-    '-adenosylmethionine',
-    '-agencies',
     '-although',
-    '-aminobutyric',
-    '-arg-gly-asp-',
-    '-awareness',
-    '-b51',
-    '-barrels',
-    '-be',
-    '-benzoquinone',
-    '-bia',
-    '-by-',
-    '-central',
-    '-ch2',
-    '-close',
-    '-could',
-    '-cys',
-    '-cys-x',
     '-direction',
-    '-dna',
-    '-dzhanybek',
-    '-ence',
-    '-end',
-    '-eng',
-    '-ephedrinium',
-    '-es',
-    '-especially',
-    '-established',
-    '-every',
-    '-expressing',
-    '-fianc&eacute;e',
-    '-fixation',
-    '-fold',
-    '-friendly',
     '-globulin',
-    '-glycero-3-phosphocholine',
-    '-glycosylation',
-    '-h&bsol;c',
-    '-had',
-    '-half',
-    '-has',
-    '-his-x',
-    '-how',
-    '-if',
-    '-in\'',
-    '-including',
-    '-independent',
-    '-ise',
-    '-ite',
-    '-ize',
     '-j',
-    '-labelled',
-    '-locus',
-    '-m',
-    '-media',
-    '-methylene-bisacrylamide',
-    '-minute',
-    '-monomethyl-l-arginine',
-    '-month',
-    '-nch',
-    '-nh',
-    '-nuclear',
-    '-open',
-    '-orientated',
-    '-ous',
-    '-particle',
     '-plutarch',
-    '-principal',
-    '-principle',
-    '-receptors',
-    '-reluctance',
-    '-ri',
-    '-ridden',
-    '-rms-e-fnf',
-    '-rosalba',
-    '-said',
-    '-sandwich',
-    '-selective',
-    '-she',
-    '-statistics',
-    '-such',
-    '-tetradecanoylphorbol',
     '-us&dollar;1,200',
-    '-us&dollar;100',
-    '-us&dollar;11.6',
-    '-us&dollar;132',
-    '-us&dollar;29',
-    '-us&dollar;300',
-    '-us&dollar;50',
-    '-us&dollar;61',
-    '-us&dollar;690',
-    '-us&dollar;95',
-    '-very',
-    '-vn/2',
-    '.042&ins',
-    '.05',
-    '.10',
-    '.1096',
     '.1220',
-    '.1270',
-    '.15',
-    '.1500&ndash;4',
-    '.1640',
-    '.1654',
-    '.1672',
-    '.1728',
-    '.1740',
-    '.1817',
-    '.1823',
-    '.1830',
-    '.1845',
-    '.308',
-    '.35p',
-    '.380',
     '.38s',
-    '.650',
-    '.700',
-    '.75',
-    '.97',
-    '.99',
-    '.pcx',
-    '.tif',
-    '/&aelig/',
-    '/&agr',
-    '/&dgr;r',
-    '/&uuml/',
-    '/+',
-    '//graphics',
-    '/0.01',
-    '/1',
     '/2f',
-    '/6',
-    '/615',
-    '/a/-backing',
-    '/appearance/sensation',
-    '/back',
-    '/batty/strandli',
-    '/beta',
-    '/bref/',
-    '/by',
-    '/cd8',
-    '/central',
-    '/clairol',
-    '/dance',
-    '/df',
-    '/f:720',
     '/fru',
-    '/god',
-    '/ht',
-    '/is',
-    '/j',
-    '/j/',
-    '/love',
-    '/more',
-    '/of',
-    '/pos.',
-    '/spitting',
-    '/that',
-    '/uptake',
-    '/var',
-    '/video',
-    '/were',
     '/when',
-    '/where',
-    '/which',
-    '/worksheet',
-    '0&amp',
-    '0&deg;n',
-    '0&middot;05',
-    '0&middot;32',
-    '0&middot;66',
-    '0&middot;8',
-    '0&middot;9',
-    '0&ndash;0.6',
-    '0&ndash;042',
-    '0&ndash;11.10',
-    '0&ndash;127',
-    '0&ndash;13',
     '0&ndash;14&ndash;0',
-    '0&ndash;2&ndash;12',
-    '0&ndash;25',
-    '0&ndash;5&deg;c',
-    '0&ndash;50',
-    '0&ndash;50%',
-    '0&ndash;57',
-    '0&ndash;88%',
-    '0\'s',
-    '0\'shaughnessy',
-    '0(5)',
-    '0,1,0',
-    '0,1,2',
-    '0,1,2,3,4,5,6,7,8,9',
-    '0,8',
-    '0-12',
     '0-2',
-    '0-40-st',
-    '0-6',
-    '0-6-0pt',
-    '0-d',
-    '0.0%',
-    '0.0&ndash;1.0',
-    '0.005&ndash;0.341',
-    '0.008in.',
-    '0.01&lt;p&lt;0.05',
-    '0.011',
-    '0.018',
-    '0.019',
-    '0.020',
-    '0.022',
-    '0.023',
     '0.024',
-    '0.02411',
-    '0.025%',
-    '0.0254',
-    '0.02mm',
-    '0.03&ndash;0.06',
-    '0.033',
-    '0.042',
-    '0.043',
-    '0.04db',
-    '0.052',
-    '0.053',
-    '0.054',
-    '0.056',
-    '0.0625',
-    '0.064',
     '0.0815',
-    '0.087',
-    '0.089',
-    '0.093',
-    '0.1&ins;.',
-    '0.1&ndash;1',
-    '0.1&ndash;1.4',
-    '0.1&ndash;10&deg;c',
-    '0.1&ndash;5.5',
-    '0.105',
-    '0.11%',
-    '0.111',
-    '0.114',
-    '0.126',
-    '0.13%',
-    '0.133',
     '0.143',
-    '0.15&ndash;0.45',
-    '0.160',
-    '0.175',
-    '0.17oz',
-    '0.186',
-    '0.1hz',
-    '0.1mg',
-    '0.1ppm',
-    '0.1xssc',
-    '0.2&micro;m-filtered',
-    '0.2&ndash;1.0',
-    '0.2&ndash;2.5',
-    '0.20%',
-    '0.20&ndash;0.25',
-    '0.200',
     '0.215',
-    '0.21ph-1',
-    '0.22in',
-    '0.238',
-    '0.25&deg',
-    '0.25.',
-    '0.25m',
-    '0.25mm',
-    '0.25pc',
-    '0.266',
-    '0.281',
-    '0.2c',
-    '0.2oz',
-    '0.2v',
-    '0.3&ndash;0.6',
-    '0.3&ndash;0.8',
     '0.30&ndash;1.49',
-    '0.304',
-    '0.308',
-    '0.314',
-    '0.318',
-    '0.325',
-    '0.33%',
-    '0.351',
-    '0.365',
-    '0.397',
-    '0.3:1',
-    '0.3pc',
-    '0.4&ndash;0.5',
-    '0.4&ndash;2.6',
-    '0.402',
-    '0.42%',
     '0.42&ndash;0.93',
-    '0.444',
-    '0.482',
-    '0.4m',
-    '0.4v',
-    '0.5&ndash;0.6',
-    '0.5&ndash;1%',
-    '0.5&ndash;11',
-    '0.5&ndash;2',
-    '0.5&ndash;5',
-    '0.5&ndash;50',
-    '0.5&ndash;6.9',
-    '0.5/0.4-micron',
-    '0.505',
-    '0.523',
-    '0.530',
     '0.54%',
-    '0.562',
-    '0.58%',
-    '0.5c',
-    '0.5kg',
-    '0.5mg',
-    '0.5mmdtt',
-    '0.632',
-    '0.65%',
-    '0.65&ndash;0.87',
-    '0.68&ndash;0.98',
-    '0.689533',
-    '0.696904',
-    '0.6kb',
-    '0.6ml',
-    '0.6p',
     '0.700',
-    '0.706',
-    '0.74%',
-    '0.759300',
-    '0.75m',
-    '0.75sq',
-    '0.767417',
-    '0.7pc',
-    '0.8&ndash;2.4',
-    '0.80%',
-    '0.81&ndash;0.95',
-    '0.85&ndash;0.96',
-    '0.887',
-    '0.9&ndash;8.8',
-    '0.90&ndash;1.18',
-    '0.908',
     '0.909%',
-    '0.92p',
-    '0.935',
-    '0.94p',
-    '0.95%',
-    '0.951',
-    '0.987',
-    '0.99&ndash;1.34',
-    '0.999',
-    '0.9bn',
-    '0.9pc',
-    '0/16',
-    '0/4',
-    '0/6',
-    '0/7',
-    '0/8',
     '00,000',
-    '00.01am',
-    '000&ndash;50',
-    '000&ndash;600',
-    '00001111000000110000100011011011',
-    '0001&ndash;0001',
-    '00010011101110010100011101110001',
-    '0005',
-    '0019',
-    '002-000',
-    '0035',
-    '0039',
-    '0047',
-    '005&deg',
-    '005-000',
-    '0061',
     '00919680',
-    '00:03',
-    '00:41',
-    '00:45',
-    '00:52',
-    '00:54',
-    '00:55',
-    '00:56',
-    '01&ndash;387',
-    '01&ndash;636',
-    '01&ndash;730',
-    '01&ndash;836',
-    '01\'s',
-    '01-353',
-    '01-359',
-    '01-383',
     '01-387',
-    '01-407',
-    '01-636',
-    '01-837',
-    '01-839',
-    '01-938',
-    '010&deg',
-    '010203',
-    '0103',
-    '010313',
-    '0104',
-    '013',
-    '0130',
-    '0131',
-    '0134',
-    '0145',
     '015',
-    '0150',
-    '017',
-    '01:03',
-    '01:14',
-    '01:22',
-    '01:23',
-    '01:39',
-    '01:46',
-    '01:53',
-    '01:economnics',
-    '02.30',
-    '02/91/0628',
-    '02/91/1443',
-    '02/92/0124',
-    '02/92/0233',
     '0203&ndash;523692',
-    '0203&ndash;696969',
-    '020622',
-    '0209',
-    '021&ndash;356',
-    '0215',
-    '0224&ndash;625900',
-    '02254',
-    '0226',
-    '023373',
-    '0242-262906',
-    '0249',
-    '0263',
-    '0267',
-    '0268',
-    '0272-276444',
     '0278',
-    '0284',
-    '0285',
-    '0290',
-    '0297',
-    '02:01',
-    '02:04',
-    '02:07',
-    '02:08',
-    '02:15',
-    '02:19',
-    '02:22',
-    '02:25',
-    '02:31',
-    '02:34',
-    '02:36',
     '02:37',
-    '02:38',
-    '02:40',
-    '02:41',
-    '02:43',
-    '02:45',
-    '02:47',
-    '02:48',
-    '02:53',
-    '02:56',
-    '02:59',
-    '03.00',
-    '0301.1',
-    '0301.3',
-    '0303.1',
-    '0303.2',
     '0308',
-    '031&ndash;225',
-    '031&ndash;650',
-    '031-226',
-    '031-557',
-    '031.469.5464',
-    '0327',
-    '0328',
-    '0342',
-    '0347',
-    '036',
-    '0371',
-    '0382',
-    '0386',
-    '0388',
-    '039',
     '0394',
-    '03:01',
-    '03:02',
-    '03:13',
-    '03:18',
-    '03:26',
-    '04&ndash;2',
-    '0401',
-    '0402',
-    '0402.3',
-    '0402.5',
-    '0403.4',
-    '0403.5',
-    '0404.1',
-    '0405.43',
-    '0406',
     '0407.3',
-    '041&ndash;332',
-    '041-227',
-    '041-332',
-    '04105',
-    '0426',
-    '0439',
-    '0451',
-    '0458',
-    '0462',
-    '0475',
-    '0491',
-    '0495',
-    '04:05',
-    '04:37',
-    '04:43',
     '04:53',
-    '04:59',
-    '04:psychology',
-    '04v0001068',
-    '05/15',
-    '0501',
-    '0502.22',
-    '0502.53',
-    '0504.2',
-    '0504.32',
-    '0505.22',
-    '0505.32',
-    '0505.33',
-    '0505.42',
-    '0505.44',
-    '0505.45',
     '0505.5',
-    '0505.51',
-    '0505.52',
-    '0505.62',
-    '0505.8',
-    '0507.2',
-    '0508',
-    '0508.2',
-    '0509.2',
-    '051-777',
-    '0512',
-    '0515',
-    '0526',
-    '053',
-    '0532&ndash;710710',
-    '0532-462453',
     '0535',
-    '0538',
-    '05394',
-    '054',
-    '056',
-    '0579',
-    '059',
-    '0599',
-    '05:03',
-    '05:06',
-    '05:11',
-    '05:17',
-    '05:21',
-    '05:23',
-    '05:24',
-    '05:30',
     '05:34',
-    '05:39',
-    '05:40',
-    '05:45',
-    '05t',
-    '06.40',
-    '06000',
-    '0602.1',
-    '0602.4',
-    '0602.41',
-    '0603-618499',
-    '061&ndash;832',
-    '0610.3',
-    '0611',
-    '0621',
-    '0629',
     '0638',
-    '064',
-    '0653',
-    '0655',
-    '069',
-    '06:02',
-    '06:04',
-    '06:09',
-    '06:12',
-    '06:14',
-    '06:16',
-    '06:21',
-    '06:30',
-    '06:35',
-    '06:36',
-    '06:41',
     '06:44',
-    '06:46',
-    '06:48',
-    '06:51',
-    '06:52',
-    '06:54',
-    '06:55',
-    '07.25',
-    '07.30',
-    '07.52',
-    '0701',
-    '0702.5',
-    '0704.3',
-    '0709',
-    '071&ndash;223',
-    '071&ndash;224',
     '071&ndash;226',
-    '071&ndash;228',
-    '071&ndash;251',
-    '071&ndash;278',
-    '071&ndash;280',
-    '071&ndash;289',
-    '071&ndash;323',
-    '071&ndash;378',
-    '071&ndash;383',
-    '071&ndash;404',
-    '071&ndash;408',
-    '071&ndash;409',
-    '071&ndash;454',
-    '071&ndash;486',
-    '071&ndash;487',
-    '071&ndash;491',
     '071&ndash;498',
-    '071&ndash;580',
-    '071&ndash;609',
-    '071&ndash;623',
-    '071&ndash;704&ndash;8101',
-    '071&ndash;723',
-    '071&ndash;793',
-    '071&ndash;821',
-    '071&ndash;837',
-    '071&ndash;929',
-    '071&ndash;930',
-    '071&ndash;936',
-    '071&ndash;956',
-    '071-223',
-    '071-273',
-    '071-276',
     '071-404',
-    '071-528',
-    '071-588',
-    '071-628',
-    '071-637',
-    '071-730',
-    '071-757',
-    '071-938',
-    '073',
-    '0732',
-    '0736',
-    '0737',
-    '0741',
-    '0747',
-    '07478368',
-    '0749',
     '0751',
-    '0754',
-    '0762',
-    '0763',
-    '0764',
-    '0780',
-    '0785',
-    '0788&ndash;578328',
-    '0790',
-    '0794',
-    '0799',
-    '07:15',
-    '07:22',
-    '07:28',
-    '07:33',
-    '07:34',
     '07:38',
-    '07:40',
-    '07:41',
-    '07:43',
-    '07:45',
-    '07:55',
-    '07:57',
-    '07mins',
-    '08.35',
-    '08.40',
-    '0800hrs',
-    '0801',
-    '0802.31',
-    '0802.32',
-    '0802.33',
-    '0802.34',
     '0802.35',
-    '0804',
-    '0804.1',
-    '0806',
-    '0806.2',
-    '0807',
-    '081&ndash;460',
-    '081&ndash;579',
-    '081&ndash;741',
-    '081&ndash;846',
-    '081&ndash;900',
-    '081-200',
-    '081-903',
-    '082',
-    '0839&ndash;141415',
-    '0839&ndash;141416',
     '0842',
-    '0845',
-    '08494',
-    '085',
-    '0850',
-    '0855',
-    '0872',
-    '08770',
-    '0883',
-    '0888',
-    '089',
-    '08:00',
-    '08:00&ndash;12:00',
-    '08:05',
-    '08:06',
-    '08:07',
     '08:11',
-    '08:22',
-    '08:24',
-    '08:30',
-    '08:35',
-    '08:42',
-    '08:45',
-    '08:49',
-    '09.00&ndash;19.00',
-    '09.15',
-    '09.20',
-    '09.30-21.30',
-    '09.35',
-    '09.45',
-    '09.50',
-    '090&deg;.',
     '0900hrs',
-    '0906',
-    '0907',
-    '091&ndash;2328708',
-    '091&ndash;384&ndash;2261',
-    '091&ndash;416',
-    '091&ndash;567&ndash;3422',
-    '091-232',
-    '0910',
-    '0911',
-    '0912',
-    '0924',
-    '0926',
-    '09277-61311',
-    '0938',
-    '094',
     '0946',
-    '0949',
-    '0950',
-    '0959',
-    '09735',
-    '09743-516',
-    '0978',
-    '0991',
-    '09:02',
-    '09:06',
-    '09:12',
-    '09:13',
-    '09:21',
-    '09:26',
-    '09:27',
-    '09:29',
     '09:39',
-    '09:41:24',
-    '09:43:54',
-    '09:57:36',
-    '09:59',
-    '0:04',
-    '0:08',
-    '0:10',
-    '0:12',
-    '0:17',
-    '0:19',
-    '0:20',
-    '0:21',
-    '0:23',
-    '0:24',
-    '0:36',
     '0:39',
-    '0:40',
-    '0:43',
-    '0:48',
-    '0:56',
-    '0=normal',
-    '0aj',
-    '0ap',
-    '0be',
-    '0bh',
-    '0bp',
-    '0bs',
-    '0dz',
-    '0ez',
-    '0ft',
-    '0hb',
     '0hl',
-    '0nn',
-    '0p3',
-    '0qb',
-    '0qn',
-    '0rd',
-    '0rq',
-    '1%-5%',
-    '1&amp;1',
-    '1&amp;2',
-    '1&commat;1/2',
-    '1&frac12%',
-    '1&frac12&ft',
-    '1&frac12&ndash;2hr',
-    '1&frac12;in.',
-    '1&frac12;inch',
     '1&frac12;ins',
-    '1&frac12;m',
-    '1&frac12;tsp',
-    '1&frac14;d',
-    '1&frac14;oz',
-    '1&half',
-    '1&mdash;10',
-    '1&mdash;2',
-    '1&mdash;7',
-    '1&mdash;8',
-    '1&mgr;g',
-    '1&micro;g',
-    '1&middot;35ltr',
-    '1&ndash;1.2m',
-    '1&ndash;1.5%',
-    '1&ndash;1/2&ins',
     '1&ndash;1/2in',
-    '1&ndash;10%',
-    '1&ndash;1000000',
-    '1&ndash;2&frac12',
-    '1&ndash;2&ndash;0',
-    '1&ndash;25',
-    '1&ndash;26',
-    '1&ndash;272',
-    '1&ndash;2hr',
-    '1&ndash;2m',
-    '1&ndash;32',
-    '1&ndash;39',
-    '1&ndash;4%',
-    '1&ndash;415',
-    '1&ndash;49',
-    '1&ndash;4pm',
     '1&ndash;5%',
-    '1&ndash;50',
-    '1&ndash;75',
-    '1&ndash;88',
-    '1&ndash;99',
-    '1&ndash;a',
-    '1&prime;19&prime',
-    '1&shilling;1d',
-    '1&shilling;8d',
-    '1&times;3',
-    '1(-)',
-    '1(10)',
-    '1(f)/121',
-    '1(i)',
-    '1+1',
-    '1+i%',
     '1+r',
-    '1,000&ndash;1',
-    '1,000-1,500',
-    '1,000-bed',
-    '1,000-megawatt',
-    '1,000-metre',
-    '1,000-piece',
-    '1,000-word',
-    '1,000-year',
-    '1,000lbs',
-    '1,005,000',
-    '1,012',
-    '1,016',
-    '1,018',
-    '1,021',
-    '1,023',
     '1,026',
-    '1,030,000',
-    '1,030,700',
-    '1,037',
-    '1,039',
-    '1,040m',
-    '1,043',
-    '1,050kg',
-    '1,051',
-    '1,055',
-    '1,057,428',
-    '1,059',
-    '1,067',
-    '1,073',
-    '1,082',
-    '1,083',
     '1,087,000',
-    '1,088',
-    '1,094',
-    '1,095,000',
-    '1,098,581',
-    '1,10-12',
-    '1,100m',
-    '1,118',
-    '1,125',
-    '1,127',
-    '1,130',
-    '1,133',
-    '1,138',
-    '1,139',
-    '1,141,748',
-    '1,143',
     '1,145',
-    '1,154',
-    '1,156',
-    '1,164',
-    '1,172p',
-    '1,177',
-    '1,181',
-    '1,182',
-    '1,186,000',
-    '1,2,3,4,5',
-    '1,2-dithiadiazoles',
-    '1,200bps',
-    '1,200lb',
-    '1,200sq',
-    '1,202',
-    '1,203',
     '1,206',
-    '1,209',
-    '1,212',
-    '1,221,037',
-    '1,223',
-    '1,228,000',
-    '1,230',
-    '1,230,000',
-    '1,238',
-    '1,240,192',
-    '1,244',
-    '1,246,700',
-    '1,251,282',
-    '1,252',
-    '1,254',
-    '1,257',
     '1,259',
-    '1,263',
-    '1,264',
-    '1,266',
-    '1,267,000',
-    '1,268',
-    '1,275',
-    '1,276',
-    '1,279',
-    '1,280,000',
-    '1,283',
-    '1,284,000',
-    '1,285,216',
-    '1,286',
-    '1,289',
-    '1,294',
     '1,298',
-    '1,299',
-    '1,3,2,4-dithiadiazoles',
-    '1,3,5,7',
-    '1,300-strong',
-    '1,300m',
-    '1,313',
-    '1,314,000',
-    '1,315',
-    '1,320,000',
-    '1,322',
-    '1,323',
-    '1,334',
-    '1,340,000',
-    '1,343',
-    '1,347',
     '1,354',
-    '1,361',
-    '1,364',
-    '1,385',
-    '1,392',
-    '1,4,7',
-    '1,400-litre',
-    '1,404',
-    '1,406,796',
-    '1,412-bp',
-    '1,414',
-    '1,423',
-    '1,429',
-    '1,430',
-    '1,432',
-    '1,435kms',
     '1,445',
-    '1,474',
-    '1,478',
-    '1,480',
-    '1,483',
-    '1,500&ndash;2,000',
-    '1,500-acre',
-    '1,500-tonne',
-    '1,500-user',
-    '1,5000-metre',
-    '1,502',
-    '1,508',
-    '1,520mhz',
-    '1,542',
-    '1,544',
-    '1,550,000',
     '1,565',
-    '1,565,000',
-    '1,566',
-    '1,571',
-    '1,588',
-    '1,598',
-    '1,600ft',
-    '1,601',
-    '1,604',
-    '1,610',
-    '1,620',
-    '1,626',
-    '1,635',
-    '1,636',
-    '1,660',
-    '1,660mhz',
     '1,667',
-    '1,669',
-    '1,671',
-    '1,674',
-    '1,678',
-    '1,680',
-    '1,681',
-    '1,686',
-    '1,698',
-    '1,699',
-    '1,700-strong',
-    '1,700ft',
-    '1,706',
-    '1,719',
-    '1,720',
-    '1,724',
     '1,728',
-    '1,731',
-    '1,739',
-    '1,749',
-    '1,751,000',
-    '1,752',
-    '1,772',
-    '1,775,500',
-    '1,776',
-    '1,784',
-    '1,800-odd',
-    '1,809',
-    '1,813',
-    '1,816',
-    '1,820',
-    '1,823',
     '1,828',
-    '1,830',
-    '1,843',
-    '1,846',
-    '1,851',
-    '1,854',
-    '1,862',
-    '1,862m',
-    '1,864',
-    '1,868',
-    '1,870',
-    '1,870,000',
-    '1,873',
-    '1,885',
-    '1,893',
-    '1,901',
     '1,904,569',
-    '1,906',
-    '1,909',
-    '1,915',
-    '1,920',
-    '1,922m',
-    '1,930',
-    '1,932',
-    '1,934',
-    '1,943',
-    '1,947',
-    '1,952',
-    '1,953',
-    '1,954,000',
-    '1,958,201',
-    '1,974',
     '1,980',
-    '1,995',
-    '1,ooo',
-    '1-&gt;100',
-    '1-10',
-    '1-19',
-    '1-2%',
-    '1-2-1',
-    '1-2-3/g',
-    '1-30',
-    '1-31',
-    '1-byte',
-    '1-c',
-    '1-cyclopropyl-azaquinolonecarboxylic',
-    '1-cyclopropyl-quinolonecarboxylic',
-    '1-dimensional',
     '1-ethyl-quinolonecarboxylic',
-    '1-for-3',
-    '1-m-long',
-    '1-mile',
-    '1-min',
-    '1-ml',
-    '1-month',
-    '1-oleoyl-2-acetyl-glycerol',
-    '1-stop',
-    '1-up',
-    '1.0&aring',
-    '1.0&ndash;12.7',
-    '1.0&ndash;9.0',
-    '1.0-3.0',
-    '1.0.20',
-    '1.002',
     '1.00am',
-    '1.00v',
-    '1.05m',
-    '1.05pm',
-    '1.06&ndash;1.34',
-    '1.085',
-    '1.0p',
-    '1.1.45',
-    '1.1.85',
-    '1.11%',
-    '1.11.1',
-    '1.11.10',
-    '1.11.11',
-    '1.11.38',
-    '1.11.6',
-    '1.11.7',
     '1.133',
-    '1.15.3',
-    '1.16.7',
-    '1.16.8',
-    '1.16.9',
-    '1.1bn',
-    '1.1x',
-    '1.2&ndash;2.8',
-    '1.2&ndash;22.9',
-    '1.2.1.1',
-    '1.2.6',
-    '1.2.9',
-    '1.20pm',
-    '1.21.1',
-    '1.21.2',
-    '1.22m',
     '1.23%',
-    '1.233',
-    '1.25*1011',
-    '1.25:although',
-    '1.25gbps',
-    '1.25pm',
-    '1.26x10',
-    '1.27m',
-    '1.2a',
-    '1.2ii',
-    '1.2j',
-    '1.2kg',
-    '1.2w',
-    '1.3&ins',
-    '1.3-litre',
-    '1.3.0',
     '1.3.15',
-    '1.3.5(ii)',
-    '1.3.5(iii)',
-    '1.3.6',
-    '1.3.8',
-    '1.32%',
-    '1.33p',
-    '1.35%',
-    '1.35pm',
-    '1.37m',
-    '1.3:1',
-    '1.3bn',
-    '1.3p',
-    '1.4&ndash;8.1',
-    '1.4.17',
-    '1.4.8',
     '1.4.9',
-    '1.4.94',
-    '1.40pm',
-    '1.45am',
-    '1.4a',
-    '1.4b',
-    '1.4cfi',
-    '1.4k',
-    '1.4mb',
-    '1.4x10',
-    '1.5&ndash;4.0',
-    '1.5&times;basal',
-    '1.5-metre',
-    '1.5.10',
-    '1.5.8',
-    '1.50&ndash;3.50pm',
     '1.50m',
-    '1.54p',
-    '1.55m',
-    '1.5:1.0',
-    '1.5a',
-    '1.5c',
-    '1.5in',
-    '1.5kb',
-    '1.5kw',
-    '1.5mb',
-    '1.5million',
-    '1.5oz',
-    '1.5x10',
-    '1.6&aring',
-    '1.6&ins',
-    '1.6&times;10',
     '1.6.7',
-    '1.630',
-    '1.63r.',
-    '1.64',
-    '1.69%',
-    '1.6gbps',
-    '1.6l',
-    '1.6mbits',
-    '1.6pc',
-    '1.7&ndash;10.3',
-    '1.7.2.1',
-    '1.7.3',
-    '1.740',
-    '1.74m',
-    '1.7812',
-    '1.78million',
     '1.7p',
-    '1.8&ins',
-    '1.84',
-    '1.86%',
-    '1.86p',
-    '1.8:1',
-    '1.8i',
-    '1.8mm',
-    '1.9(3)',
-    '1.9(8)',
-    '1.9.10',
-    '1.9.18',
-    '1.9.5',
-    '1.9.8',
-    '1.9.85',
-    '1.9.90',
     '1.92m',
-    '1.94',
-    '1.97',
-    '1.9:1',
-    '1.9kw',
-    '1.9pc',
-    '1/05',
-    '1/1/93',
-    '1/20',
-    '1/200',
-    '1/2000',
-    '1/200th',
-    '1/2500',
-    '1/250th',
-    '1/32',
-    '1/5/93',
     '1/6000',
-    '1/72',
-    '1/76',
-    '1/79',
-    '1/83',
-    '1/85',
-    '1/86',
-    '1/93',
-    '1/9d',
-    '1/b',
-    '1/ctr-900',
-    '1/cv',
-    '1/e',
-    '1/f',
-    '1/i',
-    '1/k',
     '1/sf-900',
-    '1/t',
-    '10%&ndash;15%',
-    '10&amp;shilling',
-    '10&deg;f',
-    '10&frac12;d.',
-    '10&frac12;in',
-    '10&frac12;p',
-    '10&mdash;12',
-    '10&micro;g',
-    '10&micro;l',
-    '10&micro;m',
-    '10&micro;s',
-    '10&ndash;11am',
-    '10&ndash;12cm',
-    '10&ndash;12min',
     '10&ndash;13&ndash;0',
-    '10&ndash;14%',
-    '10&ndash;15&deg;c',
-    '10&ndash;15c',
-    '10&ndash;15mm',
-    '10&ndash;2(a)',
-    '10&ndash;25%',
-    '10&ndash;29',
-    '10&ndash;30%',
-    '10&ndash;33',
-    '10&ndash;34',
-    '10&ndash;59%',
-    '10&ndash;6&ndash;0',
-    '10&ndash;8(b)',
-    '10&ndash;90%',
-    '10&plus;1',
     '10&shilling;6',
-    '10&shilling;6d',
-    '10&sol;61',
-    '10&times;10',
-    '10&times;14&ins',
-    '10&times;8',
-    '10\'',
-    '10,000&ndash;20,000',
-    '10,000-mile',
-    '10,000-seat',
-    '10,000-ton',
-    '10,000-word',
-    '10,000:1',
-    '10,000km',
-    '10,000sq',
-    '10,076ft',
     '10,100',
-    '10,11,12',
-    '10,150',
-    '10,381',
-    '10,399',
-    '10,452',
-    '10,460',
-    '10,480',
-    '10,5',
-    '10,991',
-    '10-10-18',
-    '10-3',
-    '10-30',
-    '10-bed',
-    '10-compatibles',
-    '10-country',
     '10-derived',
-    '10-dollar',
-    '10-feet',
-    '10-foot',
-    '10-gallon',
-    '10-game',
-    '10-methyl-palmitic',
-    '10-mm',
-    '10-storey',
-    '10-stud',
-    '10-teacher',
-    '10-under-par',
-    '10-week-old',
-    '10.0%',
-    '10.00&ndash;13.00',
-    '10.00&ndash;17.30',
     '10.00&ndash;22.00',
-    '10.00&ndash;23.00',
-    '10.00am&ndash;4.00pm',
-    '10.02',
-    '10.1(a)',
-    '10.1(b)',
-    '10.10(a)',
-    '10.10am',
-    '10.11a',
-    '10.15p.m.',
-    '10.19secs',
-    '10.2.1',
-    '10.2.2',
-    '10.2.3',
-    '10.25pm',
-    '10.29secs',
     '10.2pc',
-    '10.3(b)',
-    '10.3.2',
-    '10.3.4',
-    '10.30&ndash;12.30',
-    '10.30am-12.30pm',
-    '10.3pc',
-    '10.4&ins',
-    '10.4(b)',
-    '10.42',
-    '10.43',
-    '10.45pm',
-    '10.4oz',
-    '10.5(a)',
-    '10.5.3',
-    '10.51',
     '10.54',
-    '10.55pm',
-    '10.57',
-    '10.58',
-    '10.5cm',
-    '10.5d.p.c.',
-    '10.5km',
-    '10.5kw',
-    '10.5m',
-    '10.6(a)',
-    '10.67',
-    '10.69',
-    '10.6fl.',
-    '10.7.1',
-    '10.7.2.1',
-    '10.7.2.2',
     '10.7.3',
-    '10.7.7.1',
-    '10.70',
-    '10.72',
-    '10.74',
-    '10.75%',
-    '10.77',
-    '10.78',
-    '10.79',
-    '10.8(b)',
-    '10.8(c)',
-    '10.8(d)',
-    '10.80',
-    '10.9p',
-    '10/10ths',
-    '10/115',
     '10/402',
-    '10/51',
-    '10/512',
-    '100&micro',
-    '100&micro;l',
-    '100&micro;mol',
-    '100&ndash;0',
-    '100&ndash;130',
-    '100&ndash;400',
-    '100&ndash;500',
-    '100\'s',
-    '100(1)',
-    '100(2)',
-    '100(a)',
-    '100,000-200,000',
-    '100,000m',
     '100,101,102',
-    '100-&mgr;m',
-    '100-30',
-    '100-bed',
-    '100-cow',
-    '100-inch',
-    '100-kg',
-    '100-line',
-    '100-minute',
-    '100-odd',
-    '100-seater',
-    '100-ton',
-    '100-winner',
-    '100.',
-    '100.0',
-    '100.3',
     '100.3%',
-    '100/1000',
-    '1000%',
-    '1000&ndash;8000',
-    '1000\'s',
-    '1000+',
-    '1000-page',
-    '1000000',
-    '10001',
-    '100016',
-    '1000bc',
-    '1000c',
-    '1000ft',
-    '1000kg',
-    '1000lb',
-    '1000u/ml',
     '1000xe',
-    '10010',
-    '10011',
-    '10012',
-    '10021',
-    '10040',
-    '1006/1598',
-    '1008.1',
-    '100=worst',
-    '100h',
-    '100ha',
-    '100ll',
-    '100lx',
-    '100mbytes',
-    '100million',
-    '100mm/4in',
     '100myr',
-    '100nm',
-    '100r',
-    '100rpm',
-    '100sq',
-    '100v',
-    '101&ndash;120',
-    '101&ndash;7',
-    '101&ndash;9',
-    '101(5)',
-    '101,347',
-    '101.2%',
-    '101.325',
-    '1010-a',
-    '10102',
-    '10104',
     '10110',
-    '10115',
-    '101b',
-    '102&ndash;104',
-    '102&ndash;3',
-    '102&ndash;5',
-    '102-seat',
-    '102-year-old',
-    '102.1',
-    '102.3',
-    '102.8',
-    '102/2',
-    '1025d',
-    '102f',
-    '102ms',
-    '102p',
     '103(1)',
-    '103-year',
-    '103.9%',
-    '1030ls',
-    '10314',
-    '1039c',
-    '103mins',
-    '104%',
-    '104&ndash;6',
-    '104-5',
-    '104.15',
-    '104.6',
-    '104/2',
-    '104/300',
-    '1040&deg',
-    '1040b',
     '1040ls',
-    '1040mm',
-    '1041l',
-    '1041ls',
-    '10460',
-    '1048&mdash;54',
-    '10480',
-    '104:30',
-    '104m',
-    '105&mdash;7',
-    '105&ndash;3',
-    '105,070',
-    '105-member',
-    '105.2',
-    '105000',
-    '1052ls',
     '105kg',
-    '105mb',
-    '106&ndash;107',
-    '106&sol;77',
-    '106,400',
-    '106,598',
-    '106-1',
-    '106.7',
-    '106.7%',
-    '106/77',
-    '1066&ndash;1300',
-    '10690',
-    '106cm',
-    '106mb',
-    '107&mdash;8',
-    '107&ndash;8',
     '107&ndash;9',
-    '107&sol;83',
-    '107,992,140',
-    '107.1',
-    '107.3',
-    '10700',
-    '10710',
-    '1073&ndash;85',
-    '10740',
-    '10760',
-    '10790',
-    '107ft',
-    '108&ndash;110',
-    '108&ndash;13',
-    '108&ndash;9',
-    '108,889',
     '108-3',
-    '108.2',
-    '108.9m',
-    '10800',
-    '10871',
-    '108a',
-    '108cm',
-    '109&mdash;10',
-    '109&ndash;11',
-    '109&ndash;111',
-    '109&ndash;5',
-    '109&ndash;6',
-    '109(2)',
-    '109.5',
-    '1090%',
-    '1099&mdash;1118',
     '109mph',
-    '10:07',
-    '10:13',
-    '10:14&ndash;15',
-    '10:19&ndash;25',
-    '10:20',
-    '10:20.4',
-    '10:21:04',
-    '10:22',
-    '10:25',
-    '10:25&ndash;37',
-    '10:25:54',
-    '10:30:27',
-    '10:34',
-    '10:35:58',
-    '10:39',
     '10:42',
-    '10:46',
-    '10:48',
-    '10:56',
-    '10:58',
-    '10:58:35',
-    '10:59',
-    '10am-12.30pm',
-    '10am3pm',
-    '10cu',
-    '10db',
-    '10dh',
-    '10e',
-    '10hz',
-    '10in/25cm',
-    '10kg.',
     '10khz',
-    '10mcg/kg',
-    '10me16:0',
-    '10mgml',
-    '10net',
-    '10nf',
-    '10per',
-    '10ps',
-    '10q11.2-qter',
-    '10s.6d.',
-    '10u',
-    '10uml',
-    '10x50',
-    '10x8ml',
-    '10z',
-    '11&frac14;p',
     '11&mdash',
-    '11&mdash;13',
-    '11&ndash;07',
-    '11&ndash;19',
-    '11&ndash;22',
-    '11&ndash;24',
-    '11&ndash;25%',
-    '11&ndash;30',
-    '11&ndash;32',
-    '11&ndash;328',
-    '11&percnt',
-    '11\'s',
-    '11(10)',
-    '11(8)',
-    '11(c)',
-    '11,000-volt',
     '11,000km',
-    '11,100',
-    '11,13',
-    '11,132',
-    '11,250',
-    '11,295',
-    '11,333',
-    '11,437',
-    '11,587,000',
-    '11,677,500',
-    '11,700',
-    '11,931,000',
-    '11-17',
-    '11-22',
-    '11-5',
-    '11-page',
     '11-tonne',
-    '11-years-old',
-    '11.00&ndash;18.00',
-    '11.00am&ndash;5.00pm',
-    '11.01am',
-    '11.02',
-    '11.10am',
-    '11.1m',
-    '11.1pc',
-    '11.2&ndash;4',
-    '11.20am',
-    '11.23',
-    '11.25%',
-    '11.25&deg',
-    '11.25am',
-    '11.25pm',
     '11.3(a)',
-    '11.3(b)',
-    '11.3.1',
-    '11.30am-12.15pm',
-    '11.35pm',
-    '11.3pc',
-    '11.4(a)',
-    '11.4.1',
-    '11.42am',
-    '11.45%',
-    '11.46',
-    '11.47',
-    '11.4m',
-    '11.5.3',
-    '11.5.5',
-    '11.50am',
     '11.51',
-    '11.53',
-    '11.55',
-    '11.55pm',
-    '11.56secs',
-    '11.58',
-    '11.5m',
-    '11.6.3',
-    '11.66',
-    '11.68',
-    '11.6c',
-    '11.7.2',
-    '11.70',
-    '11.75p',
-    '11.82',
-    '11.85',
     '11.87',
-    '11.8m',
-    '11.95',
-    '11.96',
-    '11/10',
-    '11/1956',
-    '11/2',
-    '11/20',
-    '11/32',
-    '11/750',
-    '11/780',
-    '11/80',
-    '11/90',
-    '11/91',
-    '110&ndash;120',
-    '110,184',
     '110,860',
-    '110,994',
-    '110.3',
-    '110.38p',
-    '110.57mph',
-    '110.7%',
-    '110.82mph',
-    '110.9',
-    '1100.00',
-    '110014',
-    '1100m',
-    '1100nm',
-    '1101.11',
-    '1101.12',
-    '1101.3',
-    '1101.4',
     '1101.5',
-    '1101.7',
-    '1101.9',
-    '1102.11',
-    '1102.13',
-    '1102.14',
-    '1102.15',
-    '1102.16',
-    '1102.17',
-    '1102.18',
-    '1102.19',
-    '1102.20',
-    '1102.21',
-    '1102.23',
-    '1102.4',
-    '1102.6',
     '1102.8',
-    '1102.9',
-    '1104.1',
-    '1104.2',
-    '1104.3',
-    '1105.1',
-    '1105.2',
-    '1105.3',
-    '1105.4',
-    '1105.5',
-    '1106.1',
-    '1106.2',
-    '1106.3',
-    '1106.5',
-    '1106.6',
-    '1107.1',
     '1108.2',
-    '1108.4',
-    '1108.6',
-    '1108.7',
-    '1108.8',
-    '110a',
-    '110k',
-    '110mb',
-    '110mh',
-    '111.1',
-    '111.1p',
-    '111.4',
-    '11100',
-    '1112mil',
-    '111s',
-    '112,088',
     '112,622',
-    '112-year-old',
-    '112.0',
-    '112.1%',
-    '112.2',
-    '112.5',
-    '112.9%',
-    '11200',
-    '1122.32.31',
-    '1123&ndash;38',
-    '11240',
-    '112a',
-    '112gb',
-    '112mph',
-    '113&ndash;0',
-    '113&ndash;14',
     '113-tps',
-    '113.4',
-    '113.75',
-    '113/4',
-    '113bhp',
-    '113cm',
-    '113g/4oz',
-    '114%',
-    '114-acre',
-    '114-member',
-    '114.49',
-    '114.5p',
-    '114/115',
-    '114mph',
-    '115&ndash;113',
-    '115&ndash;116',
     '115&ndash;16',
-    '115-',
-    '115.06',
-    '115.62mph',
-    '115.6p',
-    '1154&ndash;74',
-    '115cm',
-    '115cu',
-    '11610',
-    '11638',
-    '11650',
-    '11675',
-    '116:12',
-    '116b',
-    '116ff',
-    '116g',
     '117&ndash;118',
-    '117&ndash;38',
-    '117,500',
-    '117-member',
-    '117.5p',
-    '117.6%',
-    '117.7',
-    '11700',
-    '1176&ndash;7',
-    '117mph',
-    '118%',
-    '118&ndash;9',
-    '118(a)',
-    '118,484',
-    '118.',
-    '118.4p',
     '118.9',
-    '1180&ndash;1204',
-    '118p',
-    '119&mdash;21',
-    '119&ndash;20',
-    '119-seat',
-    '119.4',
-    '11958',
-    '11977',
-    '119mmol/l',
-    '119th',
-    '11:02:32',
-    '11:05:08',
-    '11:07',
-    '11:15&ndash;18',
-    '11:29',
     '11:30',
-    '11:32:29',
-    '11:4&ndash;5',
-    '11:44',
-    '11:47',
-    '11:52',
-    '11:53:07',
-    '11:56',
-    '11:59',
-    '11:9',
-    '11ac',
-    '11am&ndash;4pm',
-    '11am-7pm',
-    '11ghz',
-    '11sec',
-    '11t',
     '11x18in',
-    '11x22',
-    '12&frac14;p',
-    '12&frac34',
-    '12&middot;7',
-    '12&ndash;02',
-    '12&ndash;11',
-    '12&ndash;12:30',
-    '12&ndash;13%',
-    '12&ndash;13th',
-    '12&ndash;2(c)',
-    '12&ndash;38',
-    '12&ndash;6&ndash;0',
-    '12&ndash;8&ndash;0',
-    '12&ndash;9',
-    '12&plus;1',
     '12&shilling;6d',
-    '12(6)',
-    '12(b)',
-    '12(c)',
-    '12,000-odd',
-    '12,118',
-    '12,190',
-    '12,197',
-    '12,323',
-    '12,814',
-    '12,900',
-    '12,900,000',
-    '12,911',
-    '12,986',
-    '12,992',
-    '12-11',
     '12-24',
-    '12-4',
-    '12-club',
-    '12-cylinder',
-    '12-hole',
-    '12-kilometre',
-    '12-litre',
-    '12-pack',
-    '12-party',
-    '12-second',
-    '12-try',
-    '12-volt',
-    '12-yard',
-    '12-years-old',
-    '12.02',
-    '12.03',
     '12.05',
-    '12.05am',
-    '12.05pm',
-    '12.07',
-    '12.08',
-    '12.09',
-    '12.1(b)',
-    '12.1pc',
-    '12.2(b)',
-    '12.20am',
-    '12.258',
-    '12.27',
-    '12.3.2',
-    '12.3m',
-    '12.3pc',
-    '12.40pm',
     '12.44',
-    '12.5&mgr;m',
-    '12.50pm',
-    '12.53',
-    '12.5pstg.',
-    '12.6.1986',
-    '12.7&ins',
-    '12.70',
-    '12.74p',
-    '12.98',
-    '12.9p',
-    '12/26',
-    '12/86',
-    '12/92',
-    '120&ndash;125',
-    '120&ndash;140',
     '120&ndash;150',
-    '120&ndash;150myr',
-    '120,000-member',
-    '120,254',
-    '120,538',
-    '120-clause',
-    '120.000,00',
-    '1200&ndash;1800',
-    '1200c/ps',
-    '1200gns',
-    '1200gph',
-    '1200m',
-    '1202&ndash;4',
-    '1203&mdash;4',
-    '1203b',
-    '120db',
     '120hp',
-    '120in',
-    '120kms',
-    '120p-a-share',
-    '120rpm',
-    '121&ndash;1138',
-    '121&ndash;8',
-    '1218&ndash;19',
-    '121nt',
-    '122&ndash;123',
-    '122&ndash;3',
-    '122.00',
-    '122.5',
-    '122.8',
-    '1224&ndash;5',
-    '1225&ndash;74',
     '122cm',
-    '122m',
-    '122mm',
-    '122mph',
-    '122nd',
-    '123&ndash;6',
-    '123&ndash;8',
-    '123,800',
-    '1233&ndash;4',
-    '12330',
-    '12345',
-    '123m',
-    '124.5p',
-    '1240s',
-    '1241&ndash;2',
-    '1242&ndash;3',
     '124a',
-    '124bhp',
-    '124kjmol',
-    '125%',
-    '125&ndash;1000',
-    '125&ndash;400',
-    '125&ndash;800',
-    '125-',
-    '125-800',
-    '125000',
-    '1254&ndash;5',
-    '125ff',
-    '125gb',
-    '125s',
-    '125w',
-    '126&ndash;7',
     '126&ndash;8',
-    '126-member',
-    '1263&ndash;4',
-    '1265-x',
-    '1266&ndash;8',
-    '126ff',
-    '126s',
-    '127&ft',
-    '127&mdash;46',
-    '127&ndash;31',
-    '127&ndash;8',
-    '127,905',
-    '127.3',
-    '127.799mph',
-    '1272cc',
-    '12733',
     '12750',
-    '1277&ndash;8',
-    '1279&ndash;1368',
-    '1279&ndash;81',
-    '127mph',
-    '127th',
-    '127x127cm',
-    '128&ndash;9',
-    '128,000',
-    '128,300',
-    '128-user',
-    '128.',
-    '128.3p',
-    '128.8',
-    '128gb',
-    '128m-word',
     '128pp',
-    '128pp.',
-    '129%',
-    '129,000',
-    '129,500',
-    '129.5p',
-    '1290&ndash;1324',
-    '1292&ndash;3',
-    '1294&ndash;7',
-    '1297&ndash;1305',
-    '129mph',
-    '12:00&ndash;16:00',
-    '12:02',
-    '12:04',
-    '12:04:28',
-    '12:05:18',
     '12:08:15&ndash;0500',
-    '12:0:0',
-    '12:13',
-    '12:13&ndash;21',
-    '12:16&ndash;17',
-    '12:17',
-    '12:18',
-    '12:19',
-    '12:21',
-    '12:25',
-    '12:30am',
-    '12:33',
-    '12:36',
-    '12:45:27',
-    '12:46:13',
-    '12:48:50',
     '12:54',
-    '12:55',
-    '12:6',
-    '12:7',
-    '12ax7',
-    '12ax7s',
-    '12d.',
-    '12db',
-    '12ff',
-    '12hour',
-    '12kbytes',
-    '12kyr',
-    '12mhz',
-    '12q24.3-qter',
-    '12rds',
-    '12th-seeded',
     '12th.',
-    '12th/13th',
-    '12vdc',
-    '12year-old',
-    '13&deg;c/55&deg;f',
-    '13&ndash;1',
-    '13&ndash;13',
-    '13&ndash;13.5h',
-    '13&ndash;14th',
-    '13&ndash;20',
-    '13&ndash;24',
-    '13&ndash;27',
-    '13&ndash;28',
-    '13&ndash;33',
-    '13(11)',
-    '13(5)',
     '13(a)',
-    '13(b)',
-    '13,000-square',
-    '13,058',
-    '13,060',
-    '13,135',
-    '13,300',
-    '13,300,000',
-    '13,939',
-    '13-12',
-    '13-13',
-    '13-a-side',
-    '13-game',
-    '13-page',
-    '13.0%',
-    '13.00-15.00',
     '13.04',
-    '13.07',
-    '13.1%',
-    '13.100',
-    '13.11secs',
-    '13.12.1',
-    '13.14.4',
-    '13.18',
-    '13.2.4',
-    '13.25',
-    '13.26',
-    '13.27',
-    '13.28',
-    '13.2p',
-    '13.2pc',
-    '13.3.6',
     '13.3.7',
-    '13.35',
-    '13.37',
-    '13.38',
-    '13.3p',
-    '13.3pc',
-    '13.4.3',
-    '13.45',
-    '13.5.2',
-    '13.5.4',
-    '13.5.5',
-    '13.5.6',
-    '13.58',
-    '13.5m',
-    '13.6.4',
-    '13.6.89',
     '13.64',
-    '13.65',
-    '13.69',
-    '13.7.2',
-    '13.7.4',
-    '13.732',
-    '13.75',
-    '13.79',
-    '13.8.1',
-    '13.8.3',
-    '13.83',
-    '13.92',
-    '13.95',
-    '13/14th',
-    '13/6',
-    '130&ndash;131',
     '130&ndash;150',
-    '130&ndash;5',
-    '130,000,000',
-    '130-acre',
-    '130-fold',
-    '130/140',
-    '1300-mw',
-    '1300-mwe',
-    '1302&ndash;3',
-    '1304&ndash;74',
-    '130r(4)',
-    '131%',
-    '131,957',
-    '131.38',
-    '1315&ndash;17',
-    '131a',
     '132&ndash;6',
-    '132,900',
-    '132-133',
-    '132-page',
-    '13200',
-    '1323&ndash;5',
-    '1326&ndash;59',
-    '132cm',
-    '133%',
-    '133&ndash;150',
-    '133&ndash;4',
-    '133&sol;81',
-    '133.3%',
-    '133.631',
-    '1330hrs',
-    '13344',
     '1338&ndash;41',
-    '13386',
-    '1339&ndash;1340',
-    '1339&ndash;41',
-    '13390',
-    '133m-bytes',
-    '134&mdash;5',
-    '134&ndash;9',
-    '134,000',
-    '134th',
-    '135&ndash;205',
-    '135&ndash;7',
-    '135&ndash;8',
-    '135(3)',
-    '135,000,000',
-    '13507',
     '13510kyr',
-    '135ml',
-    '136&ndash;137',
-    '1369&ndash;75',
-    '136mm',
-    '136pc',
-    '136th',
-    '137&ndash;138',
-    '137000',
-    '1375&ndash;1443',
-    '1376&ndash;7',
-    '137bhp',
-    '138&ndash;61',
-    '138,500',
-    '138a',
-    '138b',
     '139&sol;85',
-    '139(1)',
-    '139,000',
-    '139,810',
-    '139.176',
-    '1399&ndash;1413',
-    '139a',
-    '139b',
-    '139p',
-    '13:03',
-    '13:08:54',
-    '13:09:57',
-    '13:10&ndash;17',
-    '13:11',
-    '13:17',
-    '13:21',
     '13:25',
-    '13:26',
-    '13:27',
-    '13:28',
-    '13:30',
-    '13:31',
-    '13:31&ndash;32',
-    '13:33:52',
-    '13:4&ndash;7',
-    '13:4&ndash;9,18&ndash;23',
-    '13:44&ndash;46',
-    '13:49:33',
-    '13:51',
-    '13:51:22',
-    '13:53',
-    '13:53:55',
     '13:56:58',
-    '13:6:8',
-    '13cm/5in',
-    '13db',
-    '13secs',
-    '13th-minute',
-    '14&frac12&ins',
-    '14&ft;6&ins',
-    '14&mdash;16',
-    '14&ndash;12',
-    '14&ndash;146',
-    '14&ndash;16h',
-    '14&ndash;22',
-    '14&ndash;40',
-    '14&ndash;5',
-    '14&ndash;7',
     '14&ndash;7&ndash;0',
-    '14&ndash;8',
-    '14&sol;76',
-    '14(12)',
-    '14,000-km',
-    '14,000gn',
-    '14,100',
-    '14,385',
-    '14,654',
-    '14,700',
-    '14,769',
-    '14-13',
-    '14-14',
-    '14-20',
-    '14-21',
-    '14-22',
     '14-25',
-    '14-26',
-    '14-3',
-    '14-30',
-    '14-bed',
-    '14-hectare',
-    '14-minute',
-    '14.05',
-    '14.07',
-    '14.11.1',
-    '14.11.2',
-    '14.17',
-    '14.1bn',
-    '14.1p',
-    '14.2.1',
-    '14.2.2',
     '14.2.3',
-    '14.2.4',
-    '14.2.5',
-    '14.2.6',
-    '14.28',
-    '14.29',
-    '14.2hh',
-    '14.3.6',
-    '14.3.7',
-    '14.34',
-    '14.35',
-    '14.37',
-    '14.39',
-    '14.3p',
-    '14.4.2',
-    '14.4.3',
     '14.4.5',
-    '14.43',
-    '14.46',
-    '14.49',
-    '14.4bn',
-    '14.5.1',
-    '14.5.2',
-    '14.55',
-    '14.5bn',
-    '14.5m',
-    '14.6(b)',
-    '14.65',
-    '14.7.2',
-    '14.70',
-    '14.7pc',
-    '14.8&ndash;126',
     '14.87',
-    '14/-',
-    '14/10/93',
-    '14/26',
-    '14/89',
-    '140&deg',
-    '140&deg;f',
-    '140&ndash;2',
-    '140&ndash;4',
-    '140,000d',
-    '140-year-old',
-    '14029',
-    '14050',
-    '1408/71',
-    '140as',
-    '140c/275f/gas',
     '140kcals',
-    '140km.',
-    '141&ndash;4',
-    '141(c)',
-    '141,500',
-    '141-seat',
-    '1411&ndash;12',
-    '1413&ndash;21',
-    '141mg',
-    '141p',
-    '141st',
-    '142&ndash;143',
-    '142&ndash;144',
-    '1421&ndash;2',
-    '1421&ndash;51',
-    '14218',
     '142:5',
-    '142cm',
-    '142g',
-    '142s',
-    '143,998',
-    '143.7',
-    '143/88',
-    '143a',
-    '143rd',
-    '143rd-ranked',
-    '144&sol;86',
-    '144(3)',
-    '144-strong',
-    '1441792',
-    '144kbits',
-    '144p',
     '145&deg',
-    '145&sol;88',
-    '145.0',
-    '145.8',
-    '145/86',
-    '1457&ndash;1743',
-    '145bhp',
-    '145cm',
-    '145mm',
-    '146&ndash;8',
-    '146(1)',
-    '146(4)',
-    '146.8',
-    '1460&ndash;1',
-    '146000',
-    '14605',
     '146a',
-    '147&ndash;8',
-    '147(1)',
-    '147,181',
-    '147-member',
-    '147-year-old',
-    '1473&ndash;5',
-    '1475&ndash;c.',
-    '147:9:0',
-    '147mph',
-    '147th',
-    '148,700',
-    '148-member',
-    '1480&ndash;2',
-    '14800',
-    '1482&ndash;3',
     '1482/3',
-    '1483&ndash;4',
-    '1485&ndash;1509',
-    '1485&ndash;c.',
-    '14853',
-    '1488&ndash;89',
-    '148cm',
-    '149&ndash;4',
-    '149&ndash;50',
-    '149&ndash;8',
-    '149,000',
-    '149.5p',
-    '149.8',
-    '1490&ndash;c.',
-    '1497&ndash;1691',
-    '1499&ndash;1500',
     '14:08:46',
-    '14:14',
-    '14:19:42',
-    '14:20',
-    '14:21',
-    '14:22&ndash;33',
-    '14:23',
-    '14:24',
-    '14:27',
-    '14:4',
-    '14:44',
-    '14:48:32',
-    '14:5',
-    '14:50',
-    '14:51:34',
-    '14:6',
     '14:9',
-    '14ff',
-    '14ghz',
-    '14lb/6.5kg',
-    '14min',
-    '14mph',
-    '14sec',
-    '14st',
-    '14thc',
-    '15&frac12;p',
-    '15&mdash',
-    '15&mdash;16',
-    '15&micro;h',
-    '15&ndash;14',
-    '15&ndash;18in',
-    '15&ndash;20min',
     '15&ndash;40',
-    '15&ndash;43',
-    '15&times;10cm/6&times;4in',
-    '15\'',
-    '15,000&ndash;20,000',
-    '15,000-30,000',
-    '15,000-member',
-    '15,16',
-    '15,767',
-    '15-20%',
-    '15-amino-acid',
-    '15-aside',
-    '15-country',
-    '15-cwt.',
-    '15-for-12',
-    '15-kb',
     '15-odd',
-    '15-seat',
-    '15.01',
-    '15.02&mdash;15.04',
-    '15.05',
-    '15.10p',
-    '15.11.1',
-    '15.15',
-    '15.19',
-    '15.2.1',
-    '15.2.2',
-    '15.2.3',
-    '15.2.7',
-    '15.2.8',
-    '15.22',
-    '15.24',
     '15.26',
-    '15.27',
-    '15.3.1',
-    '15.3.3',
-    '15.3.4',
-    '15.31',
-    '15.34',
-    '15.35',
-    '15.3hh',
-    '15.3pc',
-    '15.40%',
-    '15.47',
-    '15.5.4',
-    '15.5.6',
-    '15.58%',
-    '15.5kg',
     '15.625',
-    '15.7.6',
-    '15.7.7',
-    '15.7.8',
-    '15.9p',
-    '15/100000',
-    '15/11',
-    '15/365',
-    '150&deg;f',
-    '150&ft',
-    '150&mgr;l',
-    '150&ndash;1',
-    '150&ndash;250',
-    '150&ndash;51',
-    '150&ndash;6',
-    '150+',
     '150,000&ndash;200,000',
-    '150-day',
-    '150-place',
-    '150/2',
-    '150/200',
-    '1500&ft',
-    '1500&ndash;1600',
-    '1500-1900',
-    '1500ft',
-    '1500gns',
-    '1500v',
-    '1503&ndash;1506',
-    '1505&ndash;y20r',
-    '150ft.',
-    '150khz',
-    '150lb',
     '150ml/6fl',
-    '150s',
-    '150x200cm',
-    '151&ndash;75',
-    '151&ndash;8',
-    '151(1)',
-    '151(2)',
-    '151,000',
-    '151-member',
-    '151.2p',
-    '1515&ndash;34',
-    '1518&ndash;19',
-    '151p',
-    '151st',
-    '152&ndash;6',
-    '152(1)',
     '152,900',
-    '152,989',
-    '1520&ndash;1591',
-    '1520&ndash;1620',
-    '1521&ndash;1603',
-    '1523&ndash;4',
-    '1525kg',
-    '1529&ndash;1601',
-    '152a',
-    '152mm',
-    '152p',
-    '153&ndash;87',
-    '153.6',
-    '1532&ndash;3',
-    '1535&ndash;96',
-    '1538&ndash;9',
     '1538.24',
-    '1539&ndash;40',
-    '153p',
-    '153s',
-    '154&ndash;7',
-    '154&sol;78',
-    '154,000',
-    '1540&ndash;1599',
-    '1542&ndash;3',
-    '15460',
-    '1547&ndash;8',
-    '1548&ndash;1600',
-    '154e',
-    '154p',
-    '154x113cm',
-    '155&ndash;5',
     '155-member',
-    '155.0',
-    '1550&ndash;1650',
-    '1550/51',
-    '1551&ndash;2',
-    '1552&ndash;3',
-    '1553&ndash;1606',
-    '1553&ndash;1639',
-    '1554&ndash;5',
-    '1555&ndash;1612',
-    '1556&ndash;7',
-    '1558/59',
-    '1559&ndash;1581',
-    '155ff.',
-    '155g',
-    '155k',
     '155p',
-    '1562&ndash;4',
-    '1564&ndash;1612',
-    '1564&ndash;1628',
-    '1565&ndash;8',
-    '15690',
-    '157,000',
-    '1575&ndash;1642',
-    '157p',
-    '157th',
-    '158&ndash;160',
-    '158,000',
-    '1583&ndash;1643',
-    '1584&ndash;5',
-    '1586&ndash;87',
-    '1588&ndash;1648',
     '1588&ndash;1653',
-    '158ft',
-    '159%',
-    '159&ndash;162',
-    '159&ndash;63',
-    '1590&ndash;7',
-    '1591&ndash;1664',
-    '15951-59',
-    '1596&ndash;1622',
-    '1596&ndash;1651',
-    '15:00',
-    '15:01',
-    '15:11',
-    '15:15',
-    '15:19',
-    '15:2',
     '15:20:57',
-    '15:24',
-    '15:34',
-    '15:37',
-    '15:39:18',
-    '15:40:30',
-    '15:51',
-    '15:57:35',
-    '15:59:44',
-    '15:7',
-    '15ci',
-    '15f.',
-    '15f.22',
-    '15ff',
-    '15fl',
-    '15g/',
     '15g/&amp;oz',
-    '15gb',
-    '15ins',
-    '15k',
-    '15ma',
-    '15mins',
-    '15mton',
-    '15myr',
-    '15nm',
-    '15ns',
-    '15pts',
-    '15secs',
-    '15th-minute',
-    '15w',
-    '16&ft;6&ins',
-    '16&ndash;15',
     '16&ndash;18-year-olds',
-    '16&ndash;19-year-olds',
-    '16&ndash;24-year-olds',
-    '16&ndash;35',
-    '16&ndash;40',
-    '16&ndash;60',
-    '16&ndash;8&ndash;0',
-    '16&times;12&ins',
-    '16(16)',
-    '16(6)',
-    '16,000ft',
-    '16,17,18',
-    '16,195,000',
-    '16,25',
-    '16,393',
-    '16,600,000',
     '16,700',
-    '16,700ft',
-    '16,800',
-    '16-13',
-    '16-14',
-    '16-18-year-olds',
-    '16-24',
-    '16-25',
-    '16-28',
-    '16-6',
-    '16-bedroom',
-    '16-goal',
-    '16-greyscale',
-    '16-metre',
-    '16-mile',
-    '16-seat',
     '16-valves',
-    '16.0%',
-    '16.1(a)',
-    '16.16',
-    '16.20p',
-    '16.21',
-    '16.22',
-    '16.24',
-    '16.27',
-    '16.29',
-    '16.30&ndash;19',
-    '16.39',
-    '16.40',
-    '16.44',
-    '16.46',
-    '16.47',
     '16.49',
-    '16.50',
-    '16.53',
-    '16.5cm',
-    '16.7p',
-    '16.8/1000',
-    '16.80%',
-    '16.85',
-    '16.8p',
-    '16/1',
-    '16/10',
-    '16/20',
-    '16/32-bit',
-    '16/5',
-    '160&deg',
-    '160&deg;f',
     '160&ndash;1',
-    '160&ndash;70',
-    '160&ndash;8',
-    '160,000,000',
-    '160-170',
-    '160-page',
-    '160-strong',
-    '160.',
-    '1600&ndash;1',
-    '1600&ndash;1500',
-    '1600bpi',
-    '1600mm',
-    '1601&ndash;1685',
-    '1603&ndash;1640',
-    '1608&ndash;1674',
-    '1609&ndash;10',
     '16090',
-    '160:1',
-    '160g',
-    '160hz',
-    '160mhz',
-    '160ml',
-    '160nt',
-    '160th',
-    '161&ndash;3',
-    '161&ndash;80',
-    '1615&ndash;1680',
-    '1617&ndash;1677',
-    '1618&ndash;19',
-    '162&ndash;5',
-    '162,000',
-    '162.5%',
     '1620&ndash;1687',
-    '1623&ndash;69',
-    '1624&ndash;9',
-    '163&ndash;6',
-    '163,265',
-    '1631&ndash;1711',
-    '1632.36',
-    '1637&ndash;8',
-    '1638&ndash;9',
-    '163p',
-    '164&ndash;166',
-    '164&ndash;77',
-    '164-yard',
-    '164.1',
-    '1640&ndash;1840',
-    '1640&ndash;60',
     '1640&ndash;8',
-    '1641&ndash;2',
-    '1642&ndash;51',
-    '1642&ndash;6',
-    '1643&ndash;7',
-    '1645&ndash;8',
-    '1648&ndash;9',
-    '1649&ndash;1660',
-    '165%',
-    '165&ndash;7',
-    '165-member',
-    '165/65',
-    '1650-1713',
-    '1650-1914',
-    '16500',
-    '1652&ndash;4',
     '1654&ndash;5',
-    '1659&mdash;60',
-    '165bhp',
-    '165ft',
-    '165g',
-    '165k',
-    '165lb',
-    '165th',
-    '166,407',
-    '166-member',
-    '166.3',
-    '166.7%',
-    '1660&mdash;1715',
-    '1660&ndash;1',
-    '1660&ndash;1685',
-    '1660&ndash;1700',
     '1660&ndash;1760',
-    '1660&ndash;1782',
-    '1660&ndash;1840',
-    '1663&ndash;1708',
-    '1665/6',
-    '1668&ndash;1738',
-    '166p',
-    '167&ndash;9',
-    '167&sol;73',
-    '1670&ndash;71',
-    '1673&ndash;1755',
-    '16739',
-    '16750',
-    '1676&ndash;84',
-    '1677&ndash;8',
-    '1677&ndash;80',
     '1679&ndash;80',
-    '167a',
-    '167b',
-    '167c',
-    '167th',
-    '168%',
-    '168&ndash;169',
-    '168(6)',
-    '168-member',
-    '1682&ndash;1725',
-    '1688&ndash;1701',
-    '1688&ndash;1751',
-    '1688&ndash;1800',
-    '1688&ndash;9',
-    '1689&ndash;1713',
-    '168cm',
     '168th',
-    '169&ndash;170',
-    '169.8bn',
-    '1690&ndash;1714',
-    '1690&ndash;1756',
-    '1691&mdash;5',
-    '1691&ndash;2',
-    '1692&ndash;1752',
-    '1695&ndash;1714',
-    '1699&ndash;1768',
-    '16:00&ndash;20:00',
-    '16:06',
-    '16:09',
-    '16:11',
-    '16:13&ndash;28',
-    '16:16',
     '16:17&ndash;19',
-    '16:18',
-    '16:22',
-    '16:24',
-    '16:30',
-    '16:31',
-    '16:33',
-    '16:39',
-    '16:43:18',
-    '16:45:48',
-    '16:50',
-    '16:56',
-    '16:7',
-    '16e',
-    '16fl',
-    '16ha',
     '16hrs',
-    '16in.',
-    '16kbps',
-    '16kda',
-    '16km',
-    '16lbs',
-    '16mbit',
-    '16ms',
-    '16pf',
-    '16sec',
-    '16secs',
-    '16th&ndash;18th',
-    '16th&ndash;19th',
-    '16th-minute',
-    '16th.',
-    '16th/17th',
     '16v8',
-    '16x12ins',
-    '17&deg;c',
-    '17&mdash;21',
-    '17&ndash;10',
-    '17&ndash;20%',
-    '17&ndash;27',
-    '17&ndash;52',
-    '17&ndash;83',
-    '17&ndash;jan',
-    '17&percnt',
-    '17&shilling;6d',
-    '17,000-strong',
-    '17,27,35',
-    '17,363',
-    '17,818',
     '17,900,000',
-    '17-',
-    '17-0',
-    '17-date',
-    '17-gon',
-    '17-track',
-    '17.14',
-    '17.16',
-    '17.17',
-    '17.2.3',
-    '17.23',
-    '17.28',
-    '17.32',
-    '17.34',
-    '17.35',
-    '17.37',
     '17.3p',
-    '17.4.1',
-    '17.48',
-    '17.49',
-    '17.5.1',
-    '17.5.2',
-    '17.53',
-    '17.56',
-    '17.57',
-    '17.59',
-    '17.5km',
-    '17.6.3',
-    '17.60',
-    '17.67',
-    '17.6fl',
-    '17.7p',
     '17.7pc',
-    '17.8cm',
-    '17.93',
-    '17/19',
-    '170,700',
-    '1700&ndash;1470',
-    '1700&ndash;21',
-    '1700-1845',
-    '1701&ndash;1750',
-    '1702&mdash;13',
-    '1702&ndash;13',
-    '17032',
-    '170b',
-    '170c/325f/gas',
-    '170kg',
-    '171,500',
     '171,730',
-    '1712&ndash;78',
-    '1713&ndash;84',
-    '1714&mdash;15',
-    '1714&ndash;88',
-    '1716&ndash;17',
-    '1716&ndash;1780',
-    '17160',
-    '1717&ndash;1801',
-    '1717/18',
-    '171b',
-    '171mb',
-    '171p',
-    '172&ndash;3',
-    '172.0',
-    '172/107',
     '17205',
-    '1721&ndash;5',
-    '1722&ndash;3',
-    '17220',
-    '1723&ndash;1808',
-    '1723&ndash;92',
-    '1724&ndash;29',
-    '1725&ndash;1807',
-    '1726&ndash;27',
-    '1726&ndash;7',
-    '1727&ndash;60',
-    '1727&ndash;8',
-    '1728&ndash;37',
-    '1729&ndash;1809',
-    '172p',
-    '173&mdash;175',
     '173&ndash;3',
-    '173&ndash;4',
-    '173&ndash;5',
-    '1732&ndash;1809',
-    '1732&ndash;3',
-    '1733&ndash;1779',
-    '1734&ndash;1815',
-    '1734-1810',
-    '1735&ndash;1823',
-    '1736&ndash;7',
-    '1737&ndash;1802',
-    '1737&ndash;1809',
-    '1737&ndash;40',
-    '1737&ndash;8',
-    '1739&ndash;1796',
-    '174&ndash;9',
     '174(1)',
-    '174-bp',
-    '1740&ndash;1',
-    '1741&ndash;1807',
-    '1741&ndash;7',
-    '1743&ndash;1805',
-    '1743&ndash;1820',
-    '1743&ndash;4',
-    '1744&ndash;48',
-    '1745&ndash;1814',
-    '1746&ndash;1827',
-    '1746&ndash;7',
-    '1749&ndash;1838',
-    '1749&ndash;51',
-    '174bhp',
-    '175%',
     '175-yard',
-    '175.15',
-    '1750&mdash;4',
-    '1750&ndash;1813',
-    '1750&ndash;1820',
-    '1750&ndash;1850',
-    '1750&ndash;1914',
-    '1750&ndash;1950',
-    '1750-1850',
-    '17500',
-    '1751&ndash;1816',
-    '1751&ndash;1820',
-    '1752&ndash;1799',
-    '1752&ndash;1835',
-    '1753&ndash;1827',
-    '1753&ndash;61',
     '1754&ndash;5',
-    '1754&ndash;8',
-    '1755&ndash;1760',
-    '1755&ndash;1834',
-    '1755&ndash;60',
-    '1756&mdash;7',
-    '1756&ndash;1815',
-    '1756&ndash;1828',
-    '1756&ndash;59',
-    '1757&ndash;8',
-    '1759&ndash;1836',
-    '175bhp',
-    '175cm',
-    '175ft',
-    '175hp',
-    '175mm',
     '176,215',
-    '176.844',
-    '1760&ndash;7',
-    '1760\'s',
-    '1761&ndash;1833',
-    '1762&ndash;3',
-    '1763&ndash;1855',
-    '1764&mdash;5',
-    '1764&ndash;6',
-    '1766&ndash;68',
-    '1766&ndash;81',
-    '1766/7',
-    '1767&ndash;1832',
-    '1768&ndash;1838',
-    '1769&ndash;1831',
-    '1769&ndash;71',
     '177&ndash;81',
-    '177&ndash;9',
-    '177,500',
-    '1770&ndash;1831',
-    '1770&ndash;1850',
-    '1770&ndash;75',
-    '1770\'s',
-    '1771&ndash;1855',
-    '1772&ndash;1773',
-    '1773&ndash;4',
-    '1774&mdash;87',
-    '1774&ndash;1843',
-    '1774&ndash;76',
-    '1775&ndash;1800',
-    '1775&ndash;82',
-    '1776&ndash;1865',
     '1777&ndash;1856',
-    '1777&ndash;81',
-    '1778&ndash;1840',
-    '1778&ndash;9',
-    '177lb',
-    '178%',
-    '1780&ndash;1850',
-    '1780&ndash;1852',
-    '1780&ndash;90',
-    '1780\'s',
-    '17805',
-    '1781&ndash;3',
-    '1782&ndash;1850',
-    '1784&ndash;1858',
-    '1784&ndash;1859',
-    '1784&ndash;91',
     '1787&ndash;1845',
-    '1787&ndash;1863',
-    '1788&ndash;90',
-    '1788&ndash;92',
-    '1789&ndash;1852',
-    '1789&ndash;1854',
-    '1789&ndash;1855',
-    '1789&ndash;1870',
-    '178mm',
-    '178pc',
-    '179&ndash;199',
-    '179&ndash;7',
-    '179&ndash;82',
-    '1790&ndash;1830',
-    '1790&ndash;1847',
-    '1790&ndash;1850',
     '1790&ndash;2',
-    '1791&ndash;1840',
-    '1791&ndash;1852',
-    '1791&ndash;1867',
-    '1791&ndash;7',
-    '1792&ndash;1822',
-    '1792&ndash;1834',
-    '1792&ndash;1860',
-    '1792&ndash;1865',
-    '1793&mdash;1815',
-    '1793&ndash;1847',
-    '1793&ndash;1848',
-    '1793&ndash;1873',
-    '1793&ndash;4',
-    '1793&ndash;5',
-    '1794&ndash;1843',
     '1794&ndash;1846',
-    '1794&ndash;1865',
-    '1794cc',
-    '1795&ndash;1881',
-    '1795&ndash;6',
-    '1796&ndash;1801',
-    '1796&ndash;1802',
-    '1797&mdash;8',
-    '1797&ndash;8',
-    '1798&ndash;1805',
-    '1798&ndash;1854',
-    '1799&ndash;1883',
-    '17:07',
-    '17:1&ndash;8',
-    '17:10',
-    '17:11&ndash;19',
     '17:15',
-    '17:15:35',
-    '17:21',
-    '17:25',
-    '17:30',
-    '17:4',
-    '17:5',
-    '17:6',
-    '17c.',
-    '17ca',
-    '17ci',
-    '17cs',
-    '17e',
-    '17ff',
-    '17g',
-    '17k',
     '17kg',
-    '17km',
-    '17th&ndash;19th',
-    '18&aring',
-    '18&frac12',
-    '18&frac12&ins',
-    '18&ndash;10',
-    '18&ndash;11',
-    '18&ndash;20%',
-    '18&ndash;55',
-    '18&ndash;64',
-    '18&ndash;66',
-    '18&ndash;89',
-    '18&shilling',
-    '18(5)',
-    '18,200',
     '18,300',
-    '18,600',
-    '18,700',
-    '18,980',
-    '18-0',
-    '18-10',
-    '18-12',
-    '18-25',
-    '18-35',
-    '18-6',
-    '18-7',
-    '18-copy',
-    '18-month-long',
-    '18-months',
-    '18-page',
-    '18-person',
     '18-way',
-    '18.0',
-    '18.00&ndash;21.00',
-    '18.05',
-    '18.08',
-    '18.12.93',
-    '18.2(a)',
-    '18.2(b)',
-    '18.20',
-    '18.25',
-    '18.29',
-    '18.35',
-    '18.4.93',
-    '18.52',
-    '18.54',
-    '18.5m',
     '18.6m',
-    '18.77p',
-    '18.8p',
-    '18.98',
-    '18.9m',
-    '18/1000',
-    '18/100000',
-    '18/250',
-    '180&deg;.',
-    '180&ndash;181',
-    '180&ndash;240',
-    '180&ndash;5',
-    '180,000-strong',
-    '180,500',
-    '180-acre',
-    '180-day',
     '180-hour',
-    '180-mile',
-    '1800&ndash;1830',
-    '1800&ndash;1850',
-    '1800&ndash;1882',
-    '1800&ndash;3',
-    '1800&ndash;49',
-    '1800&ndash;7',
-    '1800&ndash;81',
-    '1800gns',
-    '1801&ndash;1889',
-    '1801&ndash;25',
-    '1801&ndash;4',
-    '1802&mdash;3',
-    '1804&ndash;13',
-    '1804&ndash;5',
     '1805&ndash;7',
-    '1806&ndash;8',
-    '1808&ndash;1883',
-    '1808&ndash;1892',
-    '1808&ndash;82',
-    '1809&mdash;12',
-    '1809&ndash;1882',
-    '180ft',
-    '180g',
-    '180gb',
-    '180kg',
-    '180lb',
-    '180th',
-    '181,000',
-    '181,035',
-    '1810&mdash;11',
     '1810&ndash;1894',
-    '1810&ndash;88',
-    '1810.5',
-    '1812&ndash;15',
-    '1812&ndash;1887',
-    '1812/13',
-    '1813&ndash;15',
-    '1813&ndash;1903',
-    '1814&ndash;1940',
-    '1815&ndash;1848',
-    '1816&ndash;1887',
-    '1817&ndash;1886',
-    '1817&ndash;1902',
-    '1818&ndash;1870',
-    '1818&ndash;22',
-    '1819&ndash;1884',
     '1819&ndash;20',
-    '1819&ndash;85',
-    '1819&ndash;90',
-    '181f',
-    '182&ndash;3',
-    '182,000',
-    '182-member',
-    '182.',
-    '1820&ndash;1860',
-    '1820&ndash;2',
-    '1820&ndash;30',
-    '1821&ndash;2',
-    '1821&ndash;90',
-    '1822&ndash;1902',
-    '1822&ndash;25',
-    '1822&ndash;88',
     '1822&ndash;90',
-    '1823&ndash;1899',
-    '1823&ndash;1900',
-    '1824&ndash;7',
-    '1825&ndash;1850',
-    '1825&ndash;1925',
-    '1825&ndash;30',
-    '1825&ndash;31',
-    '1825&ndash;6',
-    '1825&ndash;8',
-    '1826&ndash;1894',
-    '1827&ndash;1900',
-    '1827&ndash;29',
-    '1827&ndash;30',
-    '1828&mdash;9',
-    '1828&ndash;1829',
     '1828&ndash;1905',
-    '1828&ndash;1910',
-    '1828&ndash;1916',
-    '1829&ndash;30',
-    '182e',
-    '182mhz',
-    '183-member',
-    '1830&mdash;1',
-    '1830&ndash;1916',
-    '1830&ndash;50',
-    '1831&ndash;3',
-    '1831&ndash;6',
-    '1832&ndash;1879',
-    '1832&ndash;91',
-    '1833&ndash;1923',
-    '1833&ndash;34',
     '1834&ndash;1910',
-    '1834&ndash;1913',
-    '1834&ndash;1919',
-    '1834&ndash;6',
-    '1835&ndash;1912',
-    '1835&ndash;1924',
-    '1836.',
-    '1837&ndash;1843',
-    '1838&ndash;1935',
-    '1838&ndash;40',
-    '1838&ndash;41',
-    '1839&mdash;41',
-    '1839&ndash;43',
-    '184&ndash;5',
-    '184&ndash;96',
-    '184,050',
     '1840&ndash;1916',
-    '1840&ndash;1922',
-    '1841&ndash;1912',
-    '1841&ndash;1931',
-    '1841&ndash;1992',
-    '1842&ndash;1919',
-    '1842&ndash;1926',
-    '1843&ndash;1916',
-    '1843&ndash;1927',
-    '1843&ndash;5',
-    '1843&ndash;8',
-    '1844&ndash;1912',
-    '1844&ndash;46',
-    '1845&ndash;9',
-    '1846&ndash;1905',
-    '1846&ndash;50',
     '1846&ndash;9',
-    '1847&ndash;1917',
-    '1847&ndash;1924',
-    '1847&ndash;1928',
-    '1847&ndash;1929',
-    '1848&ndash;1867',
-    '1848&ndash;1915',
-    '1848&ndash;1917',
-    '1848&ndash;1918',
-    '1848&ndash;1920',
-    '1848&ndash;1928',
-    '1849&ndash;1918',
-    '1849&ndash;54',
-    '1849&ndash;63',
-    '185%',
-    '185/60',
     '1850&ndash;1',
-    '1850&ndash;1913',
-    '1850&ndash;1922',
-    '1850&ndash;1940',
-    '1850&ndash;1950',
-    '1851&ndash;1892',
-    '1851&ndash;1925',
-    '1851&ndash;1928',
-    '1851&ndash;1981',
-    '1851&ndash;2',
-    '1851&ndash;6',
-    '1852&ndash;1914',
-    '1852&ndash;1933',
-    '1852&ndash;3',
-    '1853&ndash;56',
-    '1854&mdash;5',
     '1854&ndash;1914',
-    '1854&ndash;1920',
-    '1854&ndash;1923',
-    '1854&ndash;1929',
-    '1854&ndash;1931',
-    '1854&ndash;1932',
-    '1854&ndash;1935',
-    '1854&ndash;1941',
-    '185470',
-    '1855&ndash;1881',
-    '1855&ndash;1945',
-    '1855&ndash;7',
-    '1856&ndash;1922',
-    '1856&ndash;1939',
-    '1856&ndash;1943',
-    '1856-68',
     '1857&ndash;1927',
-    '18570',
-    '1858&ndash;1938',
-    '1859&ndash;1899',
-    '1859&ndash;1924',
-    '1859&ndash;70',
-    '185f',
-    '185ff.',
-    '185g/6&amp;oz',
-    '185k',
-    '185mph',
-    '186&ndash;7',
-    '186&ndash;9',
-    '1860&ndash;1900',
-    '1860&ndash;1913',
-    '1860-1960',
     '1861&ndash;1900',
-    '1861&ndash;1925',
-    '1861&ndash;1928',
-    '1861&ndash;1986',
-    '1861&ndash;5',
-    '1861&ndash;70',
-    '1862&ndash;1933',
-    '1862&ndash;1938',
-    '1863&ndash;1936',
-    '1863&ndash;1957',
-    '1863&ndash;4',
-    '1863&ndash;5',
-    '1863&ndash;67',
-    '1864&ndash;1916',
-    '1864&ndash;1929',
-    '1865&ndash;1939',
     '1865&ndash;1945',
-    '1865&ndash;70',
-    '1867&ndash;1924',
-    '1868&ndash;1916',
-    '1868&ndash;1922',
-    '1868&ndash;1927',
-    '1868&ndash;1933',
-    '1868&ndash;1949',
-    '1869&ndash;1871',
-    '1869&ndash;1918',
-    '187&ndash;8',
-    '1870&mdash;71',
-    '1870&ndash;1924',
-    '1870&ndash;1940',
-    '1870&ndash;1950',
-    '1870&ndash;5',
     '1870-1939',
-    '1870-1940',
-    '1870cc',
-    '1870lb',
-    '1871&ndash;1949',
-    '1872&ndash;6',
-    '1873&ndash;1900',
-    '1873&ndash;4',
-    '1873&ndash;7',
-    '1873&ndash;75',
-    '1874&ndash;1944',
-    '1874&ndash;1953',
-    '1874&ndash;7',
-    '1874&ndash;8',
-    '1874&ndash;80',
-    '1875&ndash;1941',
     '1875&ndash;1949',
-    '1875&ndash;76',
-    '1876&ndash;8',
-    '1876&ndash;80',
-    '1877&ndash;8',
-    '1878&ndash;79',
-    '1878&ndash;84',
-    '1878&ndash;9',
-    '1879&ndash;1940',
-    '1879&ndash;1964',
-    '1879&ndash;1978',
-    '1879&ndash;83',
-    '188.2',
-    '1880&ndash;1930',
-    '1880&ndash;1940',
-    '1880&ndash;1945',
     '1880&ndash;1950',
-    '1880&ndash;1969',
-    '1880s/1890s',
-    '1881&ndash;1975',
-    '1881&ndash;82',
-    '1881&ndash;91',
-    '1882&ndash;5',
-    '1882&ndash;83',
-    '1883&ndash;5',
-    '1884&ndash;1976',
-    '1884&ndash;1977',
-    '1884&ndash;87',
-    '1885&ndash;7',
-    '1887&ndash;1975',
-    '1887&ndash;88',
-    '1887&ndash;91',
     '1888&ndash;94',
-    '1889&ndash;1982',
-    '1889&ndash;91',
-    '1889&ndash;93',
-    '189&ndash;90',
-    '189(1)',
-    '1890&ndash;1918',
-    '1890&ndash;1930',
-    '1890&ndash;1971',
-    '1890&ndash;1974',
-    '1890-1930',
-    '1890.',
-    '1891&ndash;1900',
-    '1891&ndash;1901',
-    '1891&ndash;3',
-    '1891&ndash;4',
     '1892&ndash;1895',
-    '1892&ndash;4',
-    '1893&ndash;1894',
-    '1893&ndash;1905',
-    '1893&ndash;1918',
-    '1893&ndash;1921',
-    '1893&ndash;1970',
-    '1894&ndash;1917',
-    '1895&ndash;1905',
-    '1895-1973',
-    '1896&ndash;1901',
-    '1896&ndash;1980',
-    '1897&ndash;1900',
-    '1897&ndash;1904',
-    '1898&ndash;1902',
-    '1898&ndash;1916',
     '1899&ndash;1901',
-    '1899&ndash;1970',
-    '189bhp',
-    '189i',
-    '189p',
-    '189x128cms',
-    '18:20',
-    '18:3',
-    '18:30',
-    '18:31:30',
-    '18:35',
-    '18:4',
-    '18:40:05',
-    '18:6:0',
-    '18:9&ndash;14',
-    '18a10',
     '18comment',
-    '18e',
-    '18f',
-    '18ff',
-    '18gb',
-    '18hz',
-    '18km',
-    '18lbs',
-    '18mg',
-    '18mins',
-    '18months-old',
-    '18secs',
-    '18th&ndash;22nd',
-    '19&deg',
-    '19&frac34;in',
-    '19&ft',
     '19&lsqb',
-    '19&mdash',
-    '19&ndash;14',
-    '19&ndash;17',
-    '19&ndash;2',
-    '19&ndash;29',
-    '19&ndash;34',
-    '19&ndash;46',
-    '19&ndash;5',
-    '19&ndash;55%',
-    '19&ndash;88',
-    '19&ndash;march',
-    '19\'s',
-    '19(a)',
-    '19+',
-    '19,103',
     '19,300',
-    '19,528',
-    '19,765',
-    '19-14',
-    '19-17',
-    '19-26',
-    '19-29',
-    '19-stone',
-    '19.0%',
-    '19.12',
-    '19.171',
-    '19.172',
-    '19.26',
-    '19.4(a)',
-    '19.4(b)',
-    '19.6.92',
     '19.95',
-    '19.99mhz',
-    '19/21',
-    '19/4/93',
-    '190%',
-    '190&deg;c/375&deg;f/gas',
-    '190&ndash;3',
-    '1900&ndash;10',
-    '1900&ndash;14',
-    '1900&ndash;1700',
-    '1900&ndash;1945',
-    '1900&ndash;9',
-    '1900-1954',
-    '1901&ndash;04',
-    '1901&ndash;11',
-    '1902&ndash;5',
     '1902/3',
-    '1903&ndash;05',
-    '1903&ndash;1945',
-    '1903&ndash;6',
-    '1903&ndash;7',
-    '1904&ndash;14',
-    '1904&ndash;1935',
-    '1905&ndash;06',
-    '1905&ndash;15',
-    '1905&ndash;1925',
-    '1905&ndash;1937',
-    '1905&ndash;9',
-    '1906&ndash;07',
-    '1906&ndash;29',
-    '1906&ndash;8',
-    '1906&ndash;9',
     '1906.',
-    '1907&ndash;16',
-    '1907&ndash;1914',
-    '1907&ndash;9',
-    '1907b',
-    '1908&ndash;13',
-    '1909&ndash;13',
-    '1909&ndash;1935',
-    '190bhp',
-    '190bp',
-    '190d&ndash;e',
-    '190g',
-    '190k',
-    '190kjmol',
-    '190km',
-    '191&ndash;2',
     '191-defeat',
-    '1910&ndash;13',
-    '1910&ndash;15',
-    '1910&ndash;1932',
-    '1910&ndash;1974',
-    '1910&ndash;24',
-    '1911&ndash;14',
-    '1911&ndash;18',
-    '1911&ndash;1949',
-    '1912&ndash;1914',
-    '1912-25',
-    '1913&ndash;16',
-    '1913+',
-    '1913-45',
-    '1914&ndash;17',
-    '1914&ndash;1916',
     '1914&ndash;1932',
-    '1914-1918',
-    '191418',
-    '1915&ndash;19',
-    '19150',
-    '1916&ndash;18',
-    '1916&ndash;19',
-    '1916/17',
-    '1917&ndash;20',
-    '1917&ndash;35',
-    '1917/18',
-    '1917a',
-    '1917b',
-    '1918&ndash;1945',
-    '1918&ndash;24',
-    '1918b',
     '1919&ndash;1929',
-    '1919&ndash;23',
-    '1919&ndash;39',
-    '191ff',
-    '191pp.',
-    '192&ndash;3',
-    '192,000,000',
-    '192,500',
-    '192,574',
-    '1920&ndash;1944',
-    '1920&ndash;1987',
-    '1920&ndash;28',
-    '1920&ndash;3',
-    '1920&ndash;4',
-    '1921&ndash;1967',
-    '1921&ndash;4',
     '1921&ndash;5',
-    '1921&ndash;6',
-    '1921&ndash;63',
-    '1921&ndash;81',
-    '1921&ndash;9',
-    '1922&ndash;39',
-    '1922&ndash;4',
-    '1922&ndash;6',
-    '1922b',
-    '1923/4',
-    '19231',
-    '1924&mdash;5',
-    '1924&ndash;27',
-    '1924&ndash;34',
-    '1924&ndash;8',
-    '19240',
     '1925&ndash;1929',
-    '1925&ndash;31',
-    '1925&ndash;33',
-    '1925&ndash;35',
-    '19252',
-    '1925:240',
-    '1926&ndash;28',
-    '1926&ndash;30',
-    '1926&ndash;31',
-    '1926&ndash;32',
-    '1926&ndash;36',
-    '1926-1941',
-    '1927&ndash;31',
-    '1927&ndash;34',
-    '1927&ndash;9',
-    '1927-33',
     '1928&ndash;1932',
-    '1928&ndash;31',
-    '1928&ndash;69',
-    '1929&ndash;34',
-    '1929&ndash;57',
-    '1929-32',
-    '192bhp',
-    '192pp.',
-    '193,000',
-    '193,063',
-    '193-pupil',
-    '1930&ndash;2',
-    '1930&ndash;45',
-    '1931&ndash;34',
-    '1931&ndash;39',
-    '1931&ndash;41',
     '1931&ndash;6',
-    '1931-33',
-    '1932&ndash;1939',
-    '1933&ndash;5',
-    '1933&ndash;6',
-    '1933-45',
-    '1934&ndash;8',
-    '1934-35',
-    '1935&ndash;55',
-    '1936&ndash;38',
-    '1936&ndash;8',
-    '1937&mdash;38',
-    '1937&ndash;1958',
-    '1937&ndash;1973',
-    '1937-38',
-    '1937/8',
     '1938&ndash;1759',
-    '1938-',
-    '1938/9',
-    '1939&ndash;58',
-    '1939b',
-    '193l',
-    '194&sol;84',
-    '1940&ndash;1',
-    '1940&ndash;1990',
-    '1940&ndash;4',
-    '1940&ndash;5',
-    '1940&ndash;60',
-    '1940-',
-    '1941&ndash;1945',
-    '1941&ndash;45',
-    '1941-45',
     '1941b',
-    '1942&mdash;43',
-    '1942&ndash;1943',
-    '1943&ndash;1945',
-    '1943&ndash;44',
-    '1943&ndash;45',
-    '1943&ndash;5',
-    '1944/45',
-    '1945&ndash;1965',
-    '1945&ndash;65',
-    '1945-1955',
-    '1945-46',
-    '1946&ndash;49',
-    '1946&ndash;54',
-    '1946-47',
-    '1947&ndash;51',
     '1947/8',
-    '1948&ndash;50',
-    '1948&ndash;53',
-    '1948&ndash;68',
-    '1948&ndash;69',
-    '19485',
-    '1949&ndash;1950',
-    '1949&ndash;69',
-    '1949-50',
-    '195.',
-    '1950&ndash;1960',
-    '1950&ndash;4',
-    '1950&ndash;52',
-    '1950&ndash;53',
-    '1950&ndash;62',
-    '1950&ndash;72',
     '1950&ndash;80',
-    '1950-51',
-    '1950.',
-    '1950/1',
-    '19500',
-    '1950s-vintage',
-    '1951&ndash;3',
-    '1951&ndash;59',
-    '1951&ndash;75',
-    '1951&ndash;87',
-    '1951/1952',
-    '1951b',
-    '1952&ndash;1981',
-    '1952&ndash;1992',
-    '1952&ndash;55',
-    '1952&ndash;6',
     '1952&ndash;72',
-    '1952.',
-    '1953&mdash;54',
-    '1953&mdash;55',
-    '1953&ndash;61',
-    '1953&ndash;71',
-    '1953&ndash;73',
-    '1954&mdash;55',
-    '1954&ndash;56',
-    '1954&ndash;6',
-    '1954&ndash;68',
-    '1954&ndash;7',
-    '1954&ndash;84',
-    '1954-55',
-    '1954:28',
-    '1955&ndash;57',
     '1955&ndash;62',
-    '1955&ndash;63',
-    '1955&ndash;65',
-    '1955&ndash;74',
-    '1955&ndash;76',
-    '1955&ndash;9',
-    '1955-56',
-    '1955/56',
-    '1956&ndash;62',
-    '1956a',
-    '1957&mdash;the',
-    '1957&ndash;59',
-    '1957&ndash;62',
-    '1957&ndash;69',
-    '1957&ndash;9',
-    '1957.',
     '1957m',
-    '1958&ndash;61',
-    '1958&ndash;64',
-    '1958&ndash;69',
-    '1958&ndash;71',
-    '1958.',
-    '1958/9',
-    '1958:207',
-    '1958:95',
-    '1958a',
-    '1959&mdash;62',
-    '1959&ndash;1970',
-    '1959/60',
-    '195kg',
-    '195p',
-    '196&mdash',
     '196&ndash;202',
-    '196&sol;87',
-    '196,000',
-    '196,722',
-    '196.5',
-    '196.70',
-    '1960&ndash;4',
-    '1960&ndash;75',
-    '1960&ndash;87',
-    '1960&ndash;89',
-    '1960-65',
-    '1960-85',
-    '1961&mdash;63',
-    '1961&ndash;1971',
-    '1961&ndash;4',
-    '1961&ndash;5',
     '1961&ndash;6',
-    '1961&ndash;64',
-    '1961&ndash;74',
-    '1961&ndash;87',
-    '1961.',
-    '19610',
-    '1961a',
-    '1962&ndash;1992',
-    '1962&ndash;5',
-    '1962&ndash;7',
-    '1962-63',
-    '1962.',
-    '1962a',
-    '1963&ndash;1990',
-    '1963&ndash;65',
-    '1963/canon',
     '1964&mdash;65',
-    '1964&ndash;1965',
-    '1964&ndash;68',
-    '1964&ndash;7',
-    '1964-66',
-    '1965&ndash;1968',
-    '1965&ndash;1992',
-    '1965&ndash;68',
-    '1965&ndash;7',
-    '1965&ndash;70',
-    '1965&ndash;72',
-    '1965&ndash;73',
-    '1965/1867',
-    '1965/66',
-    '1966&ndash;1986',
-    '1966&ndash;71',
     '1966&ndash;71&ndash;73',
-    '1966&ndash;77',
-    '1966&ndash;8',
-    '1966&ndash;81',
-    '1966&ndash;84',
-    '1966&ndash;9',
-    '1966-1970',
-    '1966-71',
-    '1966-76',
-    '1966/7',
-    '1966:29&ndash;30',
-    '1966:463',
-    '1967&mdash;68',
-    '1967&ndash;69',
-    '1967&ndash;70',
-    '1967&ndash;73',
     '1967&ndash;74',
-    '1967&ndash;75',
-    '1967&ndash;88',
-    '1967&ndash;9',
-    '1967-73',
-    '1967/68',
-    '1967/8',
-    '1968&ndash;71',
-    '1968&ndash;72',
-    '1968-70',
-    '1969&ndash;76',
-    '1969&ndash;80',
-    '1969&ndash;83',
-    '1969&ndash;87',
-    '1969.',
-    '196lb',
     '197&sol;84',
-    '197&sol;86',
-    '197,000',
-    '197,500',
-    '1970&ndash;5',
-    '1970:115',
-    '1970:87',
-    '1971&ndash;3',
-    '1971&ndash;4',
-    '1971&ndash;73',
-    '1971&ndash;84',
-    '1971&ndash;87',
-    '1971-74',
-    '1971-81',
-    '1971:21',
-    '1971:49',
     '1972&ndash;6',
-    '1972&ndash;7',
-    '1972&ndash;80',
-    '1972&ndash;83',
-    '1972-75',
-    '19721',
-    '1972:37',
-    '1972:6',
-    '1972:8',
-    '1972c',
-    '1972d',
-    '1973&mdash;74',
-    '1973&ndash;1974',
-    '1973&ndash;78',
-    '1973&ndash;80',
-    '1973&ndash;83',
     '1973-76',
-    '1973-82',
-    '1973-90',
-    '1973:145',
-    '1974&ndash;1979',
-    '1974&ndash;80',
-    '1974&ndash;85',
-    '1974\'',
-    '1974-77',
-    '1974-80',
-    '1974-84',
-    '1974.',
-    '1974:42',
-    '1974c',
-    '1975&ndash;1981',
-    '1975&ndash;79',
     '1975&ndash;82',
-    '1975&ndash;88',
-    '1975-77',
-    '1975-80',
-    '1976&ndash;1981',
-    '1976&ndash;1985',
-    '1976&ndash;87',
-    '1976&ndash;9',
-    '1976&ndash;90',
-    '1976-78',
-    '1976-81',
-    '1976/98',
-    '1976:8',
-    '1976k:3',
-    '1977&ndash;82',
-    '1977&ndash;85',
     '1977/9',
-    '19771',
-    '1977:123',
-    '1977:80',
-    '1977a:132',
-    '1977c',
-    '1977e',
-    '1978&ndash;1979',
-    '1978&ndash;1980',
-    '1978&ndash;1982',
-    '1978&ndash;84',
-    '1978&ndash;85',
-    '1978-80',
-    '1978-88',
-    '1978:171',
-    '1978:4',
     '1978:7',
-    '1978:9',
-    '1979&ndash;1981',
-    '1979&ndash;1982',
-    '1979&ndash;85',
-    '1979,1980',
-    '1979,1981',
-    '1979/1980',
-    '1979:106',
-    '1979:155',
-    '1979:80',
-    '198(1)',
-    '198(a)',
-    '1980&mdash;83',
-    '1980&ndash;1984',
-    '1980&ndash;4',
     '1980&ndash;6',
-    '1980&ndash;84',
-    '1980&ndash;87',
-    '1980&ndash;89',
-    '1980&ndash;90',
-    '1980&ndash;91',
-    '1980/',
-    '19801',
-    '1980:10',
-    '1980:13',
-    '1980:297',
-    '1980:78',
-    '1980:ch.',
-    '1980c',
-    '1980e',
-    '1981&mdash;1991',
     '1981&ndash;1982',
-    '1981&ndash;1985',
-    '1981&ndash;1989',
-    '1981&ndash;1990',
-    '1981&ndash;4',
-    '1981&ndash;8',
-    '1981&ndash;9',
-    '1981&ndash;92',
-    '1981\'s',
-    '1981-1984',
-    '1981-84',
-    '1981-85',
-    '1981-87',
-    '1981-88',
-    '1981:307',
-    '1982&ndash;1986',
     '1982&ndash;1987',
-    '1982&ndash;1988',
-    '1982&ndash;1990',
-    '1982&ndash;6',
-    '1982&ndash;86',
-    '1982:290',
-    '1982:ch.',
-    '1982a:37',
-    '1982b:64',
-    '1983&ndash;90',
-    '1983&ndash;91',
-    '1983:15',
-    '1983:43',
-    '1983:44',
-    '1983b:2',
-    '1984&mdash;85',
     '1984&mdash;87',
-    '1984&ndash;1986',
-    '1984&ndash;1989',
-    '1984&ndash;89',
-    '1984-',
-    '1984:189',
-    '1984:40',
-    '1985&mdash;1991',
-    '1985&ndash;1987',
-    '1985&ndash;1988',
-    '1985&ndash;91',
-    '1985,1986',
-    '1985-1987',
-    '1985-7',
-    '1985-89',
-    '1985/173',
     '1985/186',
-    '1985/886',
-    '1985:23',
-    '1985:262',
-    '1985:78',
-    '1985b:158',
-    '1986&ndash;1989',
-    '1986&ndash;1990',
-    '1986&ndash;89',
-    '1986&ndash;92',
-    '1986\'s',
-    '1986,1987',
-    '1986-1990',
-    '1986-8',
-    '1986-95',
-    '1986-may',
     '1986/8',
-    '1986:34',
-    '1986:9',
-    '1987&mdash;see',
-    '1987&ndash;1990',
-    '1987\'s',
-    '1987-1988',
-    '1987-8',
-    '1987-92',
-    '19878',
-    '1987d',
-    '1988&ndash;1990',
-    '1988\'s',
-    '1988-1990',
-    '1988-92',
-    '1988-early',
     '1988-june',
-    '1988-see',
-    '1988:130',
-    '1988:49',
-    '1989&ndash;1991',
-    '1989&ndash;94',
-    '1989-august',
-    '1989-provisional',
-    '1989/brian',
-    '1989/gloucester',
-    '1989:106',
-    '1989:13',
-    '1989:19',
-    '1989:20',
-    '1989:7',
-    '1989:7&mdash;11',
     '1989:8',
-    '1989:ch.',
-    '198cm',
-    '198g',
-    '199&ndash;200',
-    '199-member',
-    '1990&mdash;the',
-    '1990&ndash;1992',
-    '1990&ndash;2025',
-    '1990&ndash;92',
-    '1990&ndash;93',
-    '1990-1992',
-    '1990-94',
-    '1990-july',
-    '1990/h',
-    '1990:20',
     '1990:21',
-    '1990:276',
-    '1990:50',
-    '1990:76',
-    '1991&ndash;friday',
-    '1991-',
-    '1991-1992',
-    '1991-94',
-    '1991-march',
-    '1991/robin',
-    '1991/sellack/herefordshire',
-    '1991/swindon',
-    '1991198719911987',
-    '1991d',
-    '1991s',
-    '1992&ndash;1995',
     '1992-97',
-    '1992/1699',
-    '1992/cannop',
-    '1992/duntisbourne',
-    '1992/heathrow',
-    '1992/longcot/oxfordshire',
-    '1992/northampton',
-    '1992/rape',
-    '1992/reigate/surrey',
-    '1992/stroud/gloucestershire',
-    '1992/witney/oxfordshire',
-    '19920',
-    '19921',
-    '199293',
-    '1992c',
-    '1993&mdash;94',
     '1993&ndash;98',
-    '1993-4',
-    '1993-97',
-    '1993/1994',
-    '1993/93',
-    '1993/sandford/oxfordshire',
-    '1993/sevenhampton/wiltshire',
-    '1994&ndash;1995',
-    '1994-5',
-    '1994.',
-    '1995-97',
-    '1995.',
-    '1996a',
-    '1997-99',
-    '19970',
-    '1998/99',
     '1999&ndash;2000',
-    '1999d',
-    '199g',
-    '19:1',
-    '19:10',
-    '19:11f',
-    '19:2',
-    '19:21',
-    '19:26',
-    '19:3',
-    '19:31',
-    '19:55',
-    '19:6',
-    '19a(1)',
-    '19ff.',
-    '19ga',
     '19mer',
-    '19min',
-    '19st',
-    '19th&ndash;20th',
-    '19th-20th',
-    '19x0',
-    '19x1',
-    '19x3',
-    '1:1,000,000',
-    '1:1.2',
-    '1:1.6',
-    '1:10,000',
-    '1:100000',
-    '1:1024',
-    '1:12&ndash;13',
-    '1:14&ndash;20',
     '1:14.202',
-    '1:16.562',
-    '1:1x',
-    '1:2.8',
-    '1:2000',
-    '1:21&ndash;28',
-    '1:29',
-    '1:2:1',
-    '1:32',
-    '1:34&ndash;35',
-    '1:35',
-    '1:38',
-    '1:3:0',
-    '1:43',
-    '1:500,000',
-    '1:55',
     '1:56',
-    '1:625000',
-    '1:800',
-    '1:m',
-    '1a(1)',
-    '1a1',
-    '1a1/1a2',
-    '1aq',
-    '1bl',
-    '1bp',
-    '1cm/',
-    '1ct',
-    '1dd',
-    '1du',
-    '1dy',
-    '1eq',
     '1et',
-    '1eu',
-    '1fl',
-    '1ha',
-    '1hg',
-    '1i',
-    '1jb',
-    '1jt',
-    '1jy',
-    '1kpc',
-    '1kw',
-    '1ls',
-    '1lt',
-    '1lu',
-    '1m.',
-    '1m/3ft',
     '1mhz',
-    '1min19secs',
-    '1min24secs',
-    '1mmoll',
-    '1mv',
-    '1nb',
-    '1nt',
-    '1nw',
-    '1o5',
-    '1od',
-    '1op',
-    '1pf',
-    '1pp',
-    '1pq',
-    '1pr',
-    '1qb',
     '1rf',
-    '1rh',
-    '1rn',
-    '1secs',
-    '1tf',
-    '1tj',
-    '1ug',
-    '1ul',
-    '1wlr',
-    '1yd',
-    '1yp',
-    '2&agr',
-    '2&amp;times2',
-    '2&deg;dh',
-    '2&dollar',
-    '2&frac12/2',
     '2&frac12;-year-old',
-    '2&frac12;d.',
-    '2&frac12;oz',
-    '2&frac14;in',
-    '2&half;inch',
-    '2&half;pt',
-    '2&mdash;5',
-    '2&mgr;gml',
-    '2&middot;1',
-    '2&ndash;11&ndash;8',
-    '2&ndash;15&ndash;0',
-    '2&ndash;18',
-    '2&ndash;28',
-    '2&ndash;3&deg',
-    '2&ndash;3&ins',
-    '2&ndash;300',
     '2&ndash;34',
-    '2&ndash;3m',
-    '2&ndash;4&ndash;0',
-    '2&ndash;49',
-    '2&ndash;4g',
-    '2&ndash;5-fold',
-    '2&ndash;5-year-olds',
-    '2&ndash;6%',
-    '2&ndash;6&ndash;2',
-    '2&ndash;6&ndash;4',
-    '2&ndash;60',
-    '2&ndash;8&deg;c',
-    '2&ndash;8&ndash;8',
-    '2&ndash;day',
-    '2&prime;43&prime',
-    '2&shilling;9d',
     '2&sol;74',
-    '2&thgr',
-    '2&times',
-    '2(11)',
-    '2(7)',
-    '2(f)',
-    '2*2',
-    '2+4',
-    '2,000-km',
-    '2,000-metre',
-    '2,000gns',
-    '2,000mph',
-    '2,000th',
-    '2,005',
-    '2,010',
-    '2,011',
     '2,016',
-    '2,020',
-    '2,033',
-    '2,035',
-    '2,036',
-    '2,048mb',
-    '2,060',
-    '2,068',
-    '2,074',
-    '2,086',
-    '2,090',
-    '2,094',
-    '2,100-2,200',
-    '2,106',
-    '2,111',
-    '2,113',
     '2,115',
-    '2,117',
-    '2,119',
-    '2,123',
-    '2,125',
-    '2,126',
-    '2,130',
-    '2,132',
-    '2,133',
-    '2,138',
-    '2,141',
-    '2,143',
-    '2,145',
-    '2,152',
-    '2,155',
-    '2,157',
     '2,164',
-    '2,167',
-    '2,168',
-    '2,171',
-    '2,183',
-    '2,192.3',
-    '2,200km',
-    '2,200lb',
-    '2,205',
-    '2,211',
-    '2,221',
-    '2,233.9',
-    '2,235',
-    '2,250-member',
-    '2,266',
-    '2,267',
     '2,278',
-    '2,286',
-    '2,316',
-    '2,320',
-    '2,329',
-    '2,344',
-    '2,344,885',
-    '2,346',
-    '2,348',
-    '2,360mhz',
-    '2,361',
-    '2,382.7',
-    '2,388',
-    '2,4,6,8',
-    '2,400.9',
-    '2,400hp',
     '2,400m',
-    '2,401',
-    '2,412',
-    '2,422.7',
-    '2,446',
-    '2,454',
-    '2,460',
-    '2,463',
-    '2,490',
-    '2,5,8',
-    '2,500lb',
-    '2,529',
-    '2,540',
-    '2,558',
-    '2,563.11',
-    '2,572',
     '2,6',
-    '2,600%',
-    '2,601',
-    '2,602',
-    '2,619',
-    '2,620',
-    '2,633',
-    '2,642',
-    '2,651',
-    '2,657',
-    '2,681',
-    '2,715',
-    '2,720.78',
-    '2,754.56',
-    '2,760',
-    '2,766,889',
     '2,775',
-    '2,780',
-    '2,799',
-    '2,800ft',
-    '2,800gns',
-    '2,812.02',
-    '2,817.19',
-    '2,821',
-    '2,844',
-    '2,849',
-    '2,864',
-    '2,878',
-    '2,879.42',
-    '2,880,000',
-    '2,885',
-    '2,926',
     '2,927',
-    '2,930',
-    '2,956',
-    '2,998',
-    '2-10-0',
-    '2-11',
-    '2-14',
-    '2-22',
-    '2-3%',
-    '2-4-2',
-    '2-6-0t',
-    '2-byte',
-    '2-derived',
-    '2-globulin',
-    '2-l',
-    '2-lane',
     '2-m',
-    '2-machine',
-    '2-mercaptoethanol',
-    '2-mile-long',
-    '2-o',
-    '2-point',
-    '2.0-based',
-    '2.03412',
-    '2.05586',
-    '2.05m',
-    '2.06.13',
-    '2.08ns',
-    '2.093',
-    '2.1(b)',
-    '2.1-litre',
-    '2.1-m',
     '2.1.',
-    '2.1.5',
-    '2.10.1',
-    '2.10.1.2',
-    '2.10.2.16',
-    '2.10.4',
-    '2.101',
-    '2.110',
-    '2.12.',
-    '2.15.7',
-    '2.17pm',
-    '2.1:1',
-    '2.1mm',
-    '2.1x',
-    '2.1x10',
-    '2.2-based',
     '2.2-mm',
-    '2.2.',
-    '2.2.2.2',
-    '2.2.2.3',
-    '2.2.2.4',
-    '2.2.3.1',
-    '2.2.7',
-    '2.20pm',
-    '2.24x10',
-    '2.25p',
-    '2.27.40',
-    '2.27mm',
-    '2.29193',
-    '2.2million',
-    '2.3&ndash;2.5',
-    '2.3&times;10',
     '2.3.8',
-    '2.30p.m.',
-    '2.30pm.',
-    '2.31643',
-    '2.39.06',
-    '2.3i',
-    '2.3x10',
-    '2.4&aring',
-    '2.4&ins',
-    '2.4&ndash;24',
-    '2.4.10',
-    '2.4.2.4',
-    '2.40pm',
-    '2.44m',
-    '2.4mm',
-    '2.4pc',
     '2.5&mgr;gml',
-    '2.5&ndash;10.0',
-    '2.5&ndash;20',
-    '2.5&ndash;5',
-    '2.5&ndash;5cm',
-    '2.5&times;10',
-    '2.5*2',
-    '2.5.',
-    '2.5.4.2',
-    '2.5.5',
-    '2.50.30',
-    '2.50am',
-    '2.51x10',
-    '2.56&times;10',
-    '2.56.08',
-    '2.57',
     '2.58',
-    '2.5:1',
-    '2.5c',
-    '2.5d',
-    '2.5kb',
-    '2.5kg',
-    '2.5km',
-    '2.5mhz',
-    '2.5mph',
-    '2.5v',
-    '2.6.10',
-    '2.6.8',
-    '2.6.9',
-    '2.65',
-    '2.67',
-    '2.6:1',
     '2.6i',
-    '2.6mm',
-    '2.7&deg',
-    '2.7-kg',
-    '2.7.1.5',
-    '2.7.3',
-    '2.7.8',
-    '2.7.9',
-    '2.71828183',
-    '2.73',
-    '2.76',
-    '2.7780',
-    '2.7kg',
-    '2.7pc',
-    '2.85m',
-    '2.86',
     '2.861',
-    '2.9(a)',
-    '2.9.1',
-    '2.9.1.8',
-    '2.9.2',
-    '2.9.4',
-    '2.91',
-    '2.96',
-    '2.97',
-    '2.98',
-    '2.9pc',
-    '2/1',
-    '2/11/87',
-    '2/12',
-    '2/5',
-    '2/9',
     '2/93',
-    '20&aring',
-    '20&deg;c/80',
-    '20&micro;g',
-    '20&micro;g/ml',
-    '20&ndash;0',
-    '20&ndash;12',
-    '20&ndash;17',
-    '20&ndash;22&deg;c',
-    '20&ndash;25&deg;c',
-    '20&ndash;28&deg;c',
-    '20&ndash;3',
-    '20&ndash;30,000',
-    '20&ndash;300',
-    '20&ndash;49',
-    '20&ndash;5',
     '20&ndash;59',
-    '20&ndash;64',
-    '20&ndash;83',
-    '20&ndash;oct',
-    '20&times',
-    '20(3)',
-    '20,000-plus',
-    '20,000-volt',
-    '20,000-word',
-    '20,001',
-    '20,006',
-    '20,059',
-    '20,311',
-    '20,456',
-    '20,800',
-    '20-11',
     '20-13',
-    '20-18',
-    '20-31',
-    '20-7',
-    '20-acre',
-    '20-feb',
-    '20-gallon',
-    '20-hour',
-    '20-kb',
-    '20-tonne',
-    '20.0%',
-    '20.1.93',
-    '20.10',
-    '20.10.93',
-    '20.11',
-    '20.15',
     '20.17',
-    '20.21',
-    '20.4m',
-    '20.4pc',
-    '20.5kg',
-    '20.79',
-    '20.85',
-    '20.97',
-    '20.9mph',
-    '20.9p',
-    '20/-',
-    '20/30',
-    '20/5/93',
-    '20/92',
-    '200&deg',
-    '200&mgr;molm',
     '200&mgr;molmol',
-    '200&ndash;2',
-    '200&ndash;240',
-    '200&ndash;350',
-    '200&ndash;500',
-    '200&times;100mm',
-    '200,00',
-    '200,000-225,000',
-    '200-metre',
-    '200-person',
-    '200-targeted',
-    '2000-5',
-    '2000-ft',
-    '2000-mile',
-    '2000.',
-    '2000/4000',
     '20006',
-    '2000cc',
-    '2000gns',
-    '2000m',
-    '2000rpm',
-    '2000w',
-    '2001&ndash;4500',
-    '200101',
-    '2001s',
-    '2003&ndash;07s',
-    '20085-86',
-    '200dpi',
-    '200du',
-    '200gms',
-    '200grand',
-    '200hz',
     '200lbs',
-    '200m-bytes',
-    '200ngml',
-    '200nm',
-    '200pa',
-    '200ppm',
-    '201&mdash;4',
-    '201lb',
-    '202&ndash;3',
-    '202&ndash;4',
-    '2021',
-    '2022',
-    '20227',
-    '2029',
-    '202pp',
-    '203,000,000',
     '203/80',
-    '203/w',
-    '2034',
-    '2037',
-    '203p',
-    '204&ndash;11',
-    '2040ax',
-    '2042',
-    '204555',
-    '2046',
-    '2049',
-    '204p',
-    '205&ndash;206',
-    '205&ndash;9',
-    '205&sol;78',
-    '205\'s',
     '205.311',
-    '2057',
-    '206&ndash;17',
-    '206&ndash;7',
-    '206&sol;78',
-    '2064',
-    '2065',
-    '20650',
-    '206p',
-    '207&sol;86',
-    '207,000',
-    '20710',
-    '2076',
-    '2079',
-    '2082',
-    '2083',
     '2084',
-    '209&ndash;11',
-    '2092',
-    '20:00&ndash;24:00',
-    '20:10',
-    '20:11',
-    '20:11:14',
-    '20:18',
-    '20:22,23',
-    '20:25',
-    '20:30',
-    '20:4',
-    '20:5',
-    '20:6,7',
-    '20amp',
-    '20bn',
     '20gbps',
-    '20h',
-    '20ha',
-    '20kms',
-    '20kton',
-    '20kw',
-    '20mg',
-    '20mgkg',
-    '20mpg',
-    '20ppm',
-    '20ps',
-    '20pts',
-    '20s/30s',
-    '20sq',
-    '20th&ndash;21st',
-    '20th-',
     '20th-minute',
-    '20year',
-    '20year-old',
-    '21&deg',
-    '21&frac12',
-    '21&frac12;cms',
-    '21&frac12;in',
-    '21&middot;22',
-    '21&ndash;11',
-    '21&ndash;32',
-    '21&ndash;59',
-    '21&ndash;72',
-    '21&ndash;july',
-    '21&ndash;jun',
-    '21&ndash;june',
-    '21&shilling',
     '21,100',
-    '21,300',
-    '21,393',
-    '21,700',
-    '21,700,000',
-    '21,772',
-    '21,906',
-    '21-16',
-    '21-18',
-    '21-19',
-    '21-20',
-    '21-30',
-    '21-6',
-    '21-7',
-    '21-8',
-    '21-feb',
     '21-year-olds',
-    '21.05',
-    '21.09',
-    '21.12',
-    '21.13',
-    '21.18(a)',
-    '21.20',
-    '21.23',
-    '21.24',
-    '21.26',
-    '21.43',
-    '21.46',
-    '21.5cm',
-    '21.5p',
-    '21.75p',
-    '21.83',
     '21/15a',
-    '21/23',
-    '210&deg',
-    '210&deg;s',
-    '210-3',
-    '210-member',
-    '210.41',
-    '2100rpm',
-    '2103',
-    '21092',
-    '210mb',
-    '211&ndash;217',
-    '211,000',
-    '2111',
-    '211535',
-    '21164',
     '2117',
-    '211th',
-    '212,558',
-    '2123',
-    '2125',
-    '21290',
-    '213&ndash;1',
-    '213&ndash;14',
-    '213&ndash;8',
-    '213,000',
-    '213cm',
-    '213p',
-    '214&mdash;15',
-    '214,969',
-    '214pp',
-    '215&ndash;6',
     '2152',
-    '215270',
-    '216135',
-    '2167',
-    '216b',
-    '216p',
-    '217-seat',
-    '217.',
-    '2174',
-    '2177',
-    '21770',
-    '2178',
-    '217mph',
-    '218&ndash;201',
-    '2181',
-    '2188',
     '218a',
-    '218b',
-    '219&ndash;20',
-    '2193',
-    '21970',
-    '21:1&ndash;4',
-    '21:20',
-    '21:23',
-    '21:38',
-    '21:5',
-    '21:6',
-    '21:9',
-    '21bp',
-    '21cennet',
-    '21in',
-    '21ins',
     '21mb',
-    '21mer',
-    '21ms',
-    '21s.',
-    '21st-century',
-    '22&frac12%',
-    '22&frac34',
-    '22&ft',
-    '22&ndash;15',
-    '22&ndash;16',
-    '22&ndash;28&deg;c',
-    '22&ndash;29',
-    '22&ndash;35',
-    '22&ndash;38',
-    '22&ndash;39',
-    '22&ndash;7',
     '22&ndash;70',
-    '22&ndash;jun',
-    '22&ndash;sept',
-    '22&shilling',
-    '22(2)',
-    '22(3)',
-    '22+',
-    '22,300',
-    '22,402,200',
-    '22,682',
-    '22,700,000',
-    '22,800',
-    '22,901',
-    '22,965',
-    '22-0',
-    '22-14',
     '22-21',
-    '22-29',
-    '22-6',
-    '22-july',
-    '22-june',
-    '22-seat',
-    '22-track',
-    '22-years-old',
-    '22.0&ndash;77.3',
-    '22.02',
-    '22.1.7',
-    '22.1.92',
-    '22.14',
-    '22.2.93',
-    '22.25',
-    '22.38',
     '22.4(a)',
-    '22.4(b)',
-    '22.41',
-    '22.42',
-    '22.55',
-    '22.5p',
-    '22.74',
-    '22.9%',
-    '22/25a',
-    '22/27',
-    '22/27a',
-    '22/29',
-    '22/32',
-    '22/4/93',
-    '22/84',
-    '220-page',
     '22000',
-    '2202',
-    '2206',
-    '220lbs',
-    '220mm',
-    '220nm',
-    '220pp',
-    '221&ndash;222',
-    '221(4)',
-    '221,790',
-    '221,995',
-    '22105',
-    '221321',
-    '221b',
-    '221lb',
-    '2222',
     '2223',
-    '2224',
-    '222m',
-    '222p',
-    '223,000',
-    '2233',
-    '2237.8',
-    '2238',
-    '224&ndash;5',
-    '2240',
-    '2241',
-    '2246',
-    '22473',
-    '224pp',
-    '225&ndash;1125',
-    '225&ndash;34',
     '225/8oz',
-    '2254',
-    '2255',
-    '225g/8oz/2',
-    '226&sol;78',
-    '226.7bn',
-    '2260',
-    '2266',
-    '226686',
-    '22677',
-    '226cm',
-    '226p',
-    '227&sol;78',
-    '227043',
-    '2272',
-    '2273',
     '22787-90',
-    '227ff',
-    '228&sol;78',
-    '2281',
-    '2281/92',
-    '228420',
-    '2286cc',
-    '2286dd',
-    '228p',
-    '229&ndash;33',
-    '2292',
-    '22:19&ndash;20',
-    '22:2',
-    '22:20',
-    '22:29',
-    '22:3&ndash;6',
     '22cm/8in',
-    '22cms',
-    '22cnd',
-    '22h',
-    '22khz',
-    '22month-old',
-    '22mpg',
-    '22nd-minute',
-    '22nd.',
-    '22secs',
-    '23&frac12',
-    '23&ndash;125',
-    '23&ndash;29',
-    '23&ndash;3',
-    '23&ndash;420',
-    '23&ndash;59',
     '23&ndash;79',
-    '23&ndash;81',
-    '23&ndash;9',
-    '23&ndash;jul',
-    '23&ndash;oct',
-    '23&percnt',
-    '23(5)',
-    '23,174,336',
-    '23,600',
-    '23,607',
-    '23,650,000',
-    '23,700,000',
-    '23,800,000',
-    '23,945',
-    '23,987',
-    '23-13',
     '23-14',
-    '23-7',
-    '23-jul',
-    '23.0',
-    '23.01',
-    '23.1.5',
-    '23.2.1.1',
-    '23.2.5',
-    '23.25',
-    '23.3.92',
-    '23.34',
-    '23.44',
-    '23.5m',
-    '23.75',
-    '23.7p',
-    '23.9.92',
     '23/10/93',
-    '23/11/87',
-    '23/25',
-    '23/28',
-    '23/34',
-    '23000',
-    '2300bp',
-    '230c',
-    '230mb',
-    '230p',
-    '230th',
-    '2311.6',
-    '232&ndash;4',
-    '232,000',
-    '232.',
-    '23232',
     '232929',
-    '233-231',
-    '2330',
-    '2333',
-    '2334',
-    '2337.7',
-    '234&ndash;1,421',
-    '234(1)',
-    '234,000',
-    '2340',
-    '2346.7',
-    '2347',
-    '235&ndash;249',
-    '235&ndash;256',
-    '235-strong',
-    '2352',
     '23569',
-    '235nm',
-    '236&ndash;6',
-    '236&ndash;8',
-    '236,000',
-    '236,800',
-    '236.3%',
-    '2363.5',
-    '236ml',
-    '236th',
-    '237,000',
-    '2370',
-    '238&ndash;239',
-    '238/260',
-    '2388',
-    '238800',
     '239&ndash;40',
-    '239(2)',
-    '239(3)',
-    '2391',
-    '2393.2',
-    '23986',
-    '239886',
-    '239th',
-    '23:1',
-    '23:11',
-    '23:14&ndash;19',
-    '23:15',
-    '23:16',
-    '23:2',
-    '23:33&ndash;43',
-    '23b',
     '23k',
-    '23rd&ndash;25th',
-    '23rd-minute',
-    '23rd.',
-    '23sec',
-    '23secs',
-    '23x11cms',
-    '23x30cm',
-    '23year-old',
-    '24&deg',
-    '24&frac12',
-    '24&ndash;15',
-    '24&ndash;29',
-    '24&ndash;32',
-    '24&ndash;35',
-    '24&ndash;9',
     '24&ndash;96',
-    '24&ndash;november',
-    '24&ndash;sep',
-    '24&percnt',
-    '24(3)',
-    '24,000,000',
-    '24,000ft',
-    '24,200,000',
-    '24,300',
-    '24,651',
-    '24,700,000',
-    '24-12',
-    '24-17',
-    '24-19',
-    '24-20',
-    '24-30',
     '24-48',
-    '24-country',
-    '24-day',
-    '24-dec-1999',
-    '24-foot',
-    '24-game',
+)
+
+blocks_44 = (
+    '*#2bn*"44+\'million*!7*"90)"4m)"5m)!7(*4&ndash;95)$,196*0400&ndash;36,600)".1*!2+!5*!3',
+    '+\'million*!6*!7+!6))2,900,000)(3billion)"4m)%6,699)%7,000*\'million)"8m)$9.95(*5&ndash;30)2,000-&pound;30,000.&a-year',
+    '*#650)\'-a-week)".3+!0+!5*"5m*"60*"75+"bn+!m)10&ndash&pound;300*2,000&ndash;300,000*#.00*"00*!k',
+    '*!m*"pp)%2,000)!3*!m)%4,000*#.3m)"5m)"6m)%8,000+#868)\'billion(%6,400)#.25*"30',
+    '+!5*!6*!7*"9m)!1)(3million)%4,000*!m)"6m)%8,200)%9,000)"bn(&7,000m)#.00*"1m',
+    '+!5*"30+!m*!8+!7+!m)%1.76m)"3m)%4,000)%6,000)\'million(%8,900)#.04*!3*!5',
+    '*"70*!8)%3,000*!m)!6)$7.50)%8,000)$9.9m(%9,400)".1*"2m*"35*#6bn*!7+!0',
+    '*!8+!0*!9)$0.2m)%1,000)%2,000*!m)%3,656)!4)"5m)!8(!k(\'m-rated(!o)!o',
+    '/";m)+ndash;4,000/!5((,000,000,!m*"60)#150)+300-a-month*"35)\'500,000)$647m*"50*"64*"95)#877',
+    '*"76((-an-hour(#.03)#13m*\'million)"23*!4*"bn)"32*!8*\'billion*"m.*%s.0d.)"43*!4',
+    ')#51m*!7*!9*"m.)(60/150ml)"73*"5m)#8bn)(90/150ml*!7*"bn(30,000-&pound;40,000.&a-year*#500*#800',
+    ')30,000&ndash;400,000.$,000*+-&pound;500+&a-week+$plus*!.+"24*&m-plus)%1,000)"4m)"5m+&illion)%6,000)"8m)%9,000',
+    '*&illion(%1,250)".2*"40*!5)"0m)$1.50)%2,000)!7)\'million($2.00*"1m*!2*!3*"4m',
+    ')$2.5m*!m)%3,000)$4.6m)%5.0.0)%9,000+#426(%3,050*#300)#.1m*(3million*(5million*"6m*"70+!5',
+    ')!1*$,218)"5m)!7*#.6m)%8,000*#.90)$9.96("4*)#-99)".1+"bn*"25*!5*!6',
+    '*!8)"2m)%5,000)"6m)!8*$,000(,5,000-a-year)#.1m*!3+!5*!4*"60*"75*!8)/0&ndash;450,000',
+    '*#.00)#1.3+!4)!2*$,000)%3,000*!m)!4)!6)%7,000)%8,000)\'million(%6,375*0700&ndash;55,000)".5',
+    '*!7)!2*#.51)%5,000*!m)!6)%9,000(#7.5*"60+!3*"7m*"80)!3)"5.*!m',
+    ')!7)"8m)%9,000($8.00*"25+!m*"3m*!6*"7m*!8+!m)%3,935)!4*$,000*!m',
+    '*!m)!7)%9,431)\'million(%9,950)#-99)#.00*"1m*!2+!5*"40*"5m*&95+vat)"00)!1',
+    '+"1m)!2)%5+vat)!6*$,000)!8\'14,000&ndash;6,000,\'-a-week)#100)\'200,000*"40)#370)#450)\'500,000*"60',
+    ')#715)#950*"99("--(#.04*!5*"9m*!m)"15*!8)$35bn*!8*!9)"43)+5&ndash;6.5',
+    '*!7)#63m*!m)"70*!8)"86*!7*"bn*\'million)"90+&/150ml*!m(.0&ndash;50,000)2,000-&pound;50,000.&a-year',
+    '*#230*#700)".3+!m*!4*"5m*"6m*"95),0-&pound;5002#600)"1m)%2,000)#6.5*!m)%7,000',
+    ')"9m)"m.(&10,000)!4)$6.7m)"7m)!8(%2,399*\'426,421)#.2m*"3m*"4m*"5m*!7)(0million',
+    ')"5m)!7*$,000)!k)\'million(#3.1+!0)!3)%5,000)%6,000)!7(%4,400)#.1m*"5m*"66',
+    ')!1)!2)"4m)!8*!m)$9.00(25,000&ndash;55,000)(-million)#.5m*"6m*"95+!9)$0.00)"1m)!3',
+    ')!7)!8)$9.99(%6,400)#.10+!m*"30*"5m)(0million)!1)"3m)%5,000)!6)%9,000(%7,500',
+    ')#.00*!4+!0+!m*!6*"95)%0,000)!4)$5.00)$9.90($8.5m)(0million)%1,405)&20.27.)!4',
+    ')!8(%9,995)#.3m)%2,000)!6)$9.99("oo\'*5&frac12;m)(ndash;10/%8,000(0,000&ndash;8,000,.-&pound;10,0004%8,000,!.,&a-year',
+    '(*-&pound;10(!.)"08*!9)"18)"32*!9*\'million)\'40/50ml*!4)"55)"65*\'million)"80*!9',
+    ')"hr(+0&ndash;1000&60,000)1,000&ndash;60,000*#287*#620)&-worth)".1*"3m*"50*"6m*"75)\'/column),0-&pound;700+\'a-plate',
+    '*&m-600m+&illion)"1m)!2)!3)"5m)$6.78)!8*#.3m)!9)"pa(%1,500)#.2m)%0,000)!7',
+    '(.2&ndash;70,000)#.10+&8s.8d.*!2+!5*!6+!5*!9)%27.03,#63.)%4,000)!7*#.22)!m(%3,100',
+    ')"0m)%2,000)%3,000..&ndash;800,000)!4*$,000)!5*$,000)%6,000)!8($4.1m*"2m*"40)%0,000)!3',
+    '($5.1m*"20*"5m*(6million)"00)%5,000)%8,432)%9,124)\'million(%6,400*\'998,221)#.10)%0,000)!6)$7.22',
+    '($7.15*!5*"60)!1)%2,000*!m)%4,000)%6,000)!8*!m)"m.($8.00*"33*"50*"95',
+    ')"0m)!3)!4)"5m)#8.4)!9($9.00*"4m*"7m)!1*#.90)!2)"4m)%5,000*!0',
+    ')$9.99(!b)&illion("oo\'+6&ndash;800(0,000&ndash;8,000)#230)#400)\'500,000*"10)#835(#.03)"15+%s.0d.*!8',
+    ')"29)"30*"58)"45*"9m)"55*!9*"bn)#75m)"84*#5bn*!9)"96(5/&pound;4.50/&pound;3(20,000&ndash;90,000',
+    '-\'-a-year)!.*"6m*"9m)/0&ndash;800,000*\'-a-term*\'million)!2)!4)%5,000)!9)\'million(%1,750*0900&ndash;92,900)#.02',
+    ')!2)!4)%5,000*!m)!8)%9,000)\'million(%2,300*\'480,893*0500&ndash;93,750)#.50*"7m)%0,000)!2)"5m',
+    '(%3,000)#.00*"40*"5m)%0,000)!1*#.76*"80)%2,000)!8($4.00*!4)"0m)!1)%6,000',
+    ')!9()5,000,000)#.00*"2m*"7m)!2)!3*$,000)!5*$,000)!7)!9(%6,700)#.2m)!4',
+    '*!5)!4)!9)!m($8.5m)"0m)!1)%7,500(%9,240*#500)#.1m*!4*"80)%3,000)%5,000',
+    '*\'million)\'million\'.7&ndash;10,000)(pound;10((,000,000,\'-a-year-$plus)#100*"50)\'599,000)#645)#840*"50(*-&pound;15(#.10',
+    ')"59)"6m))76million*"9m)#81m(30,000&ndash;100,000*#765)#000,!0)!2)!3*!m)!4)!5)!6',
+    '*!4*!7*"85)$0.96)!7(%2,300)#.2m*"95)!3)!8(#3.2*!3)$1.38)!3*$,000',
+    '*!m)!6)!8)\'billion(&40,700)%2,000)!6)%8,000(#50.*\'million)!5)!k(#62m)!6*$,000',
+    ')"0m)!4)!6)!8("82)!3(%9,500)#.00)"0m)!4)%5,000)!6)$9.00\')8&ndash;9)(pound;15',
+    ',.-&pound;10,000-&a-year)#100)#320*"40)#450)#750)#850)#900(".0)"15)"30*!5)#574*!8',
+    '*!m)"81*!m)!9*!0(10&ndash&pound;100/(;100,0001"20)+,000-a-year.$plus)!3*$,000)!5)%63.36)(7,230.31',
+    '*#.8m)"bn)!k(%1,600)#.5m*"98)#0s.(#24m(%3,812)#.15*"8m)%0,000)"1m)!8(%4,400',
+    '+#799*!m)!9($5.00*!3*"50)!5)%6,000)!7)%8,000)!9($6.66)%0,000)!2)!3',
+    ')%5,000)!8($7.1m*!5+!0)"50)!8($8.95)!8($9.90)!2\'%9,125)#200*&60,761)#680',
+    ')#942*"50*"60*"95($.16m)#22m)"30)"54*"bn)"66*\'billion)"73($0.00*"4m)!2',
+    '*!m)!3(&10,319)!8(%2,500)#.60)!1)%2,000)"5m(%3,500*1750&ndash;125,000)".5*"75*"90)%0,000',
+    ')!5*$,000(#40m("52)!3)!6(&60,000*!0)"8m(%7,500)#.50*"9m)!0)%8,000(*8.1million',
+    ')!0(%9,950+&99,999)#.02*!4).07&ndash&pound)!4)%6,000)$9.00("bn\'!d\'!g\'!i\'$l.70\'%pound',
+    '-!0-!2,!2,!5-!0\'!r\'"so\'#the!\'radic;3(":1#-rr;salivation&"uf")gr&bsol;s!2scaron;irok&aacute(&kocjan',
+    '(\'porkova($tipl#)edil;erif"(ect;1.19("22\'!0&&2.10.1\'"52\'"81(!2"+gr;-subunit"0harp;4/&sharp;11"$im;2%!3&"00',
+    '!&thgr/z#*orn&aacute&%;onne"*imes;10/ml\'!2(!2(!6\'#300\'"45\'!7\'#8in!1verbar&lt;keyword\');g&verbar(!i(2qaworkspace&verbar',
+    '($time!%ycirc"$en;1&".2&"07&"15&#3.2&"50%"20%!4&!0\'!0&"55!2zcaron;i&zcaron;ka)"ga',
+    '!"07!"20!"31!"46!"51"!5"!6!"65!)80s-style"%6/\'87!+alf-a-crown"$nnah$\'oyance\'##som#%trim\'',
+    '"(rassment#$d-up#&ringay"#sty"$ybag!$best"#oat""us"!y!#can#"ve"$ello"#ome!$dall"#ogs',
+    '!$e\'s."&adache#$vens"$lped$$less$!s"!n!"f\'"\'ailure\'""or!&gators""et"#ood!#has"$eads',
+    '!"i\'""de##ing""ll"%sself"$tler!%jamas!%large#"sh"#ess"%ittle"#ong#"ok!#may"$oves',
+    '#!w""o\'!$obby"%ld-up"!n"$oter"$rror"#tel"\'usemaid!&phoned!*re_all_the#(asonably#&bajaz\'#!d"$ight',
+    '!%s_all$\'n_awful"%aying""ee#\'venties"$hall"&itting"%ocial#"ft"(piritual#)ringboard"$tand#%ralia"%upply!"th',
+    '"\'wenties#!o!\'undreds"#rts"#se\'!#way"#ith%#out"$orks!$your!$zine &******$"ed$$prof#)communist',
+    '"(abdullah#)dditional##lan$$haji$#len##nna#&ugusto"#bob"%carlo#$hong#"ol"\'desmond#\'istrict"%first"%hamid',
+    '"(includes(#ing#"on"(jean-luc"&khalid#"uo$\'rdistan"#lt."!m#"aj#%ichel$!r#\'ohammed"%party"+reshuffled.',
+    '"&shaikh$%irley#"ir"#the!%adnan"%lfred\'!o"%maret"&rlindo!,badamdorjiyn"$oris"$rian!$capt#"re$"lo',
+    '$$rles##ief#"oi$%udhry#\'ristian"(urrently!!d"#imo"!o!!e"%dward"(lisabeth"&miliya"$rase!%farah',
+    '"%ormed".ran&ccedil;ois!&georgi##rda"%holam"%reens"$uido!"he#%rbert"!u!"if"\'ncluded#$sert!*j&oacute;n"$amal',
+    '#$wdat")os&eacute!!k!$left#&opoldo"%ibere#!u"$ouis""t."#uis!%maria##tey#%ulana"$ihai$#nea',
+    '$#cea#$soji"#ost!)natsagiyn"!b"%ever*"\'ikolaos!\'olawale"!m!+palestinian#"ul"#ham$!n"&olygon!!r',
+    '")e-elected#%ally*#(n&eacute$#ame"%obert"%udolf!!s"$alih#$rdar##yed"&hetima#&kelqim"$pool"#top#$rike',
+    '"#hat"#ran%%sport""wo!$umar!&vaclav!$wang""ei""hy"!u!&zakari"$hang *+&pound;20(!3!(0.171875',
+    '"#800!#10%#".6"#1.0"#2db"!5#!0"!6#".5$!6"#7.5""80""rn!$26.2!#30%',
+    '"!2"!5#".2!#4.2"%5&deg\'";c"$8.5%"!9""db!#6.0"!0!#7mv!"81!!9!#:f7',
+    '!%david!&joseph!"p.!%round!#the!/us&dollar;1,600+#300+#966!!x )-&formula"(pound;15#$rime!$(-c)""c)!"--',
+    '!$0.05$!7$"96#!1$!2#"23#"35#\'5&deg;c#"82#"9%!$1.2%#!5#!6#!7""0%',
+    '#!0#!5"#1.6"\'2&deg;c#!0#"cm"\'3&deg;f#!0"#4.6"#5.3$!6$!8#"99#"cm"#6.1',
+    '"%7&deg#".5""8%#!8!%2&deg"$,0,1"(-butenyl"".3$!%""0%#$&deg#".0"#198$!9"!3',
+    '"\'5&deg;c#".8"!6#$.225"#749""91""wm!%3&deg"".1#!2#!3#!4""0c"#1.1#!4',
+    '"#7.5"#9.5!\'4&deg;c\'!f"".5"%0&deg#!9#!c""12"!2")4&deg;20\'#"19"%5&deg#$.278$!5',
+    '"!6#".5"#9.5!"5%"$&deg&";c"".9""00#!c"!1"!2#!7#!9""31"\'5&deg;c',
+    '!(60&deg;c#"mv"#1.5"!2"!8""90#!2!%7&deg"".3"%0&deg#":c""61""76!#8.4"!2',
+    '"!8!"9%"!2#!5"!7""96#!7!$able"&cetyl-#"id#$ting"&ddress#&enosyl)*methionine"\'gencies',
+    '"+minobutyric"+rg-gly-asp-"(wareness!#b51"&arrels"!e#*nzoquinone""ia""y-!\'central""h2"$lose"$ould""ys$"-x',
+    '""na"(zhanybek!$ence#!d#!g"*phedrinium"!s#(pecially#)tablished"$very")xpressing!.fianc&eacute;e#&xation"#old"\'riendly',
+    '#6ycero-3-phosphocholine%)osylation!(h&bsol;c""ad#"lf#!s"$is-x""ow!"if""n\'#\'cluding#)dependent""se""te""ze',
+    '!(labelled"$ocus!!m"$edia#5thylene-bisacrylamide"%inute"4onomethyl-l-arginine$"th!#nch"!h"&uclear!$open")rientated""us!(particle',
+    '"(rincipal("le!)receptors#(luctance"!i#$dden"(ms-e-fnf"&osalba!$said#&ndwich"(elective""he")tatistics"#uch!4tetradecanoylphorbol',
+    ',"00,#1.6,"32+"29+#300+"50+"61,"90+"95!$very"#n/2 (.042&ins"!5!"10#"96',
+    '#"70"!5#*00&ndash;4"#640#"54#"72"#728#"40"#817#"23#"30#"45!#308""5p""80',
+    '!#650!#700"!5!"97"!9!#pcx!#tif (/&aelig/#"gr"%dgr;r"%uuml/!!+!)/graphics!$0.01!!1',
+    '!!6""15!*a/-backing"3ppearance/sensation!$back#,tty/strandli"#eta"$ref/"!y!#cd8"&entral"&lairol!%dance"!f!%f:720',
+    '!#god!"ht!"is!!j"!/!$love!$more!"of!$pos.!(spitting!$that!&uptake!#var"$ideo!$were',
+    '$"re##ich"(orksheet %0&amp"%deg;n")middot;05)"32)"66)!8)!9")ndash;0.6)"42(%11.10)"27)!3',
+    '(*2&ndash;12)!5(\'5&deg;c)!0*!%)!7(#88%!"\'s#*haughnessy!#(5)!$,1,0$!2%.,3,4,5,6,7,8,9"!8!#-12',
+    '"%40-st"!6#$-0pt"!d!#.0%#*&ndash;1.0#.05&ndash;0.341$$8in.#.1&lt;p&lt;0.05$!1$!8$!9#"20$!2$!3',
+    '%"11$"5%%!4$"mm#,3&ndash;0.06$!3#"42$!3$"db#"52$!3$!4$!6##625$!4',
+    '$!7$!9#"93"\'1&ins;.$\'ndash;1+".4+\'0&deg;c*#5.5#"05#"1%$!1$!4#"26#"3%$!3',
+    '#,5&ndash;0.45#"60#"75$"oz#"86#"hz#"mg##ppm#$xssc"22&micro;m-filtered$)ndash;1.0*#2.5#"0%$+&ndash;0.25$!0',
+    '$$ph-1##2in#"38#%5&deg$!.$!m%!m$"pc#"66#"81#!c#"oz#!v"+3&ndash;0.6,!8',
+    '$!4$!8#"14$!8#"25#"3%#"51#"65#"97#":1#"pc"+4&ndash;0.5*#2.6#"02#"2%',
+    '#"44#"82#!m#!v"+5&ndash;0.6*"1%+!1*!2*!5+!0*#6.9#+/0.4-micron#"05#"23#"30',
+    '#"62#"8%#!c#"kg#"mg$$mdtt"#632#"5%$+&ndash;0.87#,8&ndash;0.98$$9533#%96904#"kb#"ml#!p',
+    '$!6#"4%#%59300$!m$"sq#%67417#"pc"+8&ndash;2.4#"0%#,1&ndash;0.95#,5&ndash;0.96#"87"+9&ndash;8.8#,0&ndash;1.18$!8',
+    '#"2p#"35#"4p#"5%$!1#"87#,9&ndash;1.34$!9#"bn#"pc!#/16"!4"!6"!7"!8',
+    '"%.01am"*0&ndash;50*#600#=01111000000110000100011011011#,1&ndash;0001$<0011101110010100011101110001#!5""19"%2-000""35#!9""47"%5&deg#$-000""61',
+    '"#:03#"41$!5#"52$!4$!5$!6!+1&ndash;387)#636)#730)#836""\'s"$-353%!9$"83',
+    '##407##636##837%!9##938"%0&deg##203#!3$"13#!4"!3#!0#!1#!4""45',
+    '#!0"!7"#:03#"14#"22$!3#"39#"46#"53#*economnics!$2.30"(/91/0628&$1443$&2/0124\'#233',
+    '+&696969##622#!9"+1&ndash;356#!5"/24&ndash;625900#"54#!6"$3373")42-262906#!9""63#!7#!8")72-276444',
+    '""84#!5""90#!7"#:01$!4$!7$!8#"15$!9#"22$!5#"31$!4$!6',
+    '$!8#"40$!1$!3$!5$!7$!8#"53$!6$!9!$3.00"$01.1%!3##3.1%!2',
+    '"+1&ndash;225*#650#$-226$#557#).469.5464""27#!8""42#!7"!6""71""82#!6#!8"!9',
+    '"#:01$!2#"13$!8#"26!)4&ndash;2""01#!2$".3%!5##3.4%!5##4.1#$5.43#!6',
+    '"+1&ndash;332#$-227$#332#"05""26""39""51#!8""62""75""91#!5"#:05#"37#"43',
+    '$!9#*psychology"(v0001068!$5/15""01#$2.22%"53##4.2%"32#$5.22%"32&!3%"42&!4&!5',
+    '&!1&!2%"62%!8##7.2#!8$".2##9.2"%1-777#!2#!5""26"!3#.2&ndash;710710$\'-462453',
+    '#!8#"94"!4"!6""79"!9#!9"#:03$!6#"11$!7#"21$!3$!4#"30',
+    '$!9#"40$!5"!t!$6.40"#000##2.1%!4&!1#(3-618499"+1&ndash;832##0.3#!1""21#!9',
+    '"!4""53#!5"!9"#:02$!4$!9#"12$!4$!6#"21#"30$!5$!6#"41',
+    '$!6$!8#"51$!2$!4$!5!$7.25#"30#"52""01##2.5##4.3#!9"+1&ndash;223,!4',
+    ',!8+"51+"78+"80,!9*#323+"78+"83*#404,!8,!9+"54+"86,!7+"91',
+    '*#580*#609+"23*.704&ndash;8101+"23+"93*#821+"37*#929+"30,!6+"56#$-223%"73&!6',
+    '$#528%"88$#628%"37$#730%"57$#938"!3#!2#!6#!7""41#!7$$8368#!9',
+    '#!4""62#!3#!4""80#!5#.8&ndash;578328""90#!4#!9"#:15#"22$!8#"33$!4',
+    '#"40$!1$!3$!5#"55$!7"$mins!$8.35#"40"%00hrs#!1#$2.31&!2&!3&!4',
+    '#!4$".1#!6$".2#!7"+1&ndash;460*#579*#741*#846*#900#$-200$#903"!2"/39&ndash;1414150!6',
+    '#!5#"94"!5#!0#!5""72#"70""83#!8"!9"#:00%,&ndash;12:00$!5$!6$!7',
+    '#"22$!4#"30$!5#"42$!5$!9!09.00&ndash;19.00#"15#"20#(30-21.30$!5#"45#"50"\'0&deg;.',
+    '#!6#!7"/1&ndash;2328708*.384&ndash;2261*#416*.567&ndash;3422#$-232#!0#!1#!2""24#!6#(77-61311""38"!4',
+    '#!9""50#!9"#735#&43-516#!8""91"#:02$!6#"12$!3#"21$!6$!7$!9',
+    '#%41:24$$3:54#%57:36$!9!#:04#!8""10#!2#!7#!9""20#!1#!3#!4""36',
+    '""40#!3#!8""56!\'=normal!"aj"!p!"be"!h"!p"!s!"dz!"ez!"ft!"hb',
+    '!"nn!"p3!"qb"!n!"rd"!q %1%-5%!&&amp;1&!2"*commat;1/2"\'frac12%(#&ft))ndash;2hr($;in.+"ch',
+    ')!m)#tsp\'#4;d)"oz"$half"(mdash;10(!2(!7(!8#$gr;g#&icro;g$*ddot;35ltr"*ndash;1.2m*"5%)&/2&ins',
+    ')"0%*%00000((2&frac12*\'ndash;0)!5)!6)"72)"hr)!m("32)!9("4%)"15)!9)"pm',
+    ')!0("75("88("99(!a".prime;19&prime"+shilling;1d+"8d"\'times;3!#(-)"#10)"&f)/121""i)!"+1""i%',
+    '!,,000&ndash;1%&-1,500&#bed&(megawatt(#tre&%piece&$word&$year%#lbs$%5,000#"12$!6$!8#"21$!3',
+    '#&30,000&#700$!7$!9##40m$!3#$50kg$!1$!5$%7,428$!9#"67#"73#"82$!3',
+    '$!8#"94$%5,000$%8,581"%10-12$"0m#"18#"25$!7#"30$!3$!8$!9#&41,748$!3',
+    '#"54$!6#"64##72p$!7#"81$!2$%6,000"\'2,3,4,5#/-dithiadiazoles#%00bps%"lb%"sq$!2$!3',
+    '$!9#"12#&21,037$!3$%8,000#"30%$,000$!8#&40,192$!4$%6,700#&51,282$!2$!4$!7',
+    '#"63$!4$!6$%7,000$!8#"75$!6$!9#&80,000$!3$%4,000$%5,216$!6$!9#"94',
+    '$!9"43,2,4-dithiadiazoles$#5,7#)00-strong%!m#"13$%4,000$!5#&20,000$!2$!3#"34#&40,000$!3$!7',
+    '#"61$!4#"85#"92"#4,7#(00-litre$!4$%6,796#%12-bp$!4#"23$!9#"30$!2$$5kms',
+    '#"74$!8#"80$!3"/500&ndash;2,000%%-acre&%tonne&$user%\'0-metre$!2$!8#%20mhz#"42$!4#&50,000',
+    '%$,000$!6#"71#"88#"98"%600ft$!1$!4#"10#"20$!6#"35$!6#"60%#mhz',
+    '$!9#"71$!4$!8#"80$!1$!6#"98$!9"*700-strong%"ft$!6#"19#"20$!4',
+    '#"31$!9#"49#&51,000$!2#"72$%5,500$!6#"84"\'800-odd$!9#"13$!6#"20$!3',
+    '#"30#"43$!6#"51$!4#"62%!m$!4$!8#"70%$,000$!3#"85#"93"#901',
+    '$!6$!9#"15#"20$"2m#"30$!2$!4#"43$!7#"52$!3$%4,000$%8,201#"74',
+    '#"95"#ooo!(-&gt;100""10#!9""2%#"-1$#3/g""30#!1"$byte"!c#Ayclopropyl-azaquinolonecarboxylic.3quinolonecarboxylic"+dimensional',
+    '"%for-3"&m-long##ile$!n#!l#$onth"8oleoyl-2-acetyl-glycerol"$stop""up!(.0&aring$*ndash;12.7*#9.0#$-3.0##.20#"02',
+    '$!v#"5m$"pm#,6&ndash;1.34#"85#!p"$1.45$"85#"1%$".1&!0&!1%"38%!6%!7',
+    '##5.3##6.7%!8%!9#"bn#!x"+2&ndash;2.8+#2.9#$.1.1$!6$!9##0pm##1.1%!2#"2m',
+    '$!3#&5*1011$):although$$gbps$"pm#$6x10#"7m#!a#"ii#!j#"kg#!w"%3&ins#&-litre#".0',
+    '$%5(ii)("i)$!6$!8#"2%#"3p#"5%$"pm#"7m#":1#"bn#!p"+4&ndash;8.1##.17$!8',
+    '%!4##0pm##5am#!a#!b##cfi#!k#"mb##x10"+5&ndash;4.0$+times;basal#&-metre##.10$!8#.0&ndash;3.50pm',
+    '#"4p#"5m#$:1.0#!a#!c#"in#"kb$!w#"mb$&illion#"oz##x10"\'6&aring$#ins$(times;10',
+    '#"30$"r.#!4#"9%#$gbps#!l#%mbits#"pc",7&ndash;10.3#$.2.1$!3#"40$!m##812$\'million',
+    '"%8&ins#!4#"6%$!p#":1#!i#"mm"$9(3)$"8)##.10%!8$!5$!8%!5$"90',
+    '#!4#!7#":1#"kw#"pc!#/05"$1/93""20$!0%!0%"th##500%"th""32"$5/93',
+    '""72#!6#!9""83#!5#!6""93#!d"!b"\'ctr-900#!v"!e"!f"!i"!k',
+    '"!t!,0%&ndash;15%"-&amp;shilling#%deg;f#)frac12;d.*"in*!p#(mdash;12$&icro;g)!l)!m)!s#*ndash;11am*#2cm+#min',
+    '*"4%*\'5&deg;c+!c+"mm)$2(a)*"5%*!9)#30%*!3*!4)#59%))6&ndash;0)$8(b))#90%#&plus;1',
+    '-!d$%ol;61#(times;10*%4&ins)!8"!\'"1,000&ndash;20,000&%-mile\'$seat\'#ton\'$word&":1&"km&"sq$$76ft',
+    '$$1,12$"50##381$"99##452$"60$"80#!5##991"&-10-18#!3$!0##bed#+compatibles%%untry',
+    '$%ollar#$feet$#oot#&gallon%"me#/methyl-palmitic$!m#&storey%"ud#\'teacher#)under-par#(week-old"#.0%$-0&ndash;13.00-$7.30',
+    '-$3.00%/am&ndash;4.00pm$!2#$1(a)%"b)$$0(a)%"am$"1a$%5p.m.$%9secs##2.1%!2%!3$#5pm$%9secs',
+    '#$3(b)$".2%!4$-0&ndash;12.30%*am-12.30pm$"pc#%4&ins$#(b)$!2$!3$#5pm$"oz#$5(a)$".3$!1',
+    '$#5pm$!7$!8$"cm$&d.p.c.$"km%!w$!m#$6(a)$!7$!9$#fl.##7.1%#2.1\'!2',
+    '%#7.1$!0$!2$!4$"5%$!7$!8$!9#$8(b)%"c)%"d)$!0#"9p"&/10ths$"15',
+    '#"51%!2"\'0&micro)";l*#mol$\'ndash;0*#130*#400*#500#"\'s##(1)$"2)$"a)#,,000-200,000\'!m',
+    '#\'-&mgr;m$"30$#bed$#cow$$inch$"kg$$line$&minute$#odd$&seater$#ton$&winner#!.$!0$!3',
+    '#%/1000#"0%$+&ndash;8000$"\'s$!+$%-page$#000$!1%!6$"bc$!c$"ft$"kg$"lb$$u/ml',
+    '#"10$!1$!2#"21#"40#&6/1598##8.1#&=worst#!h$!a#"ll$!x#&mbytes$&illion$%m/4in',
+    '#"nm#!r$"pm#"sq#!v"+1&ndash;120*!7*!9##(5)#$,347##.2%$#325##0-a$!2$!4',
+    '$!5#!b"+2&ndash;104*!3*!5#%-seat$(year-old#".1$!3$!8#"/2#"5d#!f#"ms#!p',
+    '#%-year##.9%##0ls#"14#"9c#$mins""4%#(&ndash;6#"-5##.15$!6#"/2$#300#%0&deg$!b',
+    '$"mm#"1l%!s#"60#*8&mdash;54$!0##:30#!m")5&mdash;7$\'ndash;3#$,070#\'-member#".2##000##2ls',
+    '#"mb"+6&ndash;107$&sol;77#$,400$#598#"-1#".7%!%##/77#,6&ndash;1300#"90#"cm#"mb")7&mdash;8$\'ndash;8',
+    '$&sol;83#(,992,140#".1$!3#"00#"10#*3&ndash;85#"40#"60#"90#"ft"+8&ndash;110+!3*!9#$,889',
+    '#".2$"9m#"00#"71#!a#"cm"*9&mdash;10$(ndash;11,!1*!5*!6##(2)#".5#"0%#,9&mdash;1118',
+    '"#:07#"13$*4&ndash;15$*9&ndash;25#"20%".4$$1:04$!2$!5%)&ndash;37%#:54#%30:27$!4$$5:58$!9',
+    '$!6$!8#"56$!8%#:35$!9"*am-12.30pm$#3pm""cu""db#!h"!e""hz"\'in/25cm"#kg.',
+    '"&mcg/kg#%e16:0##gml"#net#!f"#per#!s"*q11.2-qter"%s.6d."!u#"ml"#x50##8ml"!z!*1&frac14;p',
+    '(#;13#(ndash;07)"19)"22*!4*"5%)"30*!2+!8#&percnt""\'s"$(10)#"8)#"c)"),000-volt',
+    '##100$!3%!2##250$"95##333##437#\'587,000#\'677,500##700#\'931,000"#-17#"22#!5#$page',
+    '#)years-old"/.00&ndash;18.00%/am&ndash;5.00pm$#1am$!2#$10am$!m$"pc#)2&ndash;4$#0am$!3$"5%%$&deg%"am%"pm',
+    '%"b)$".1$+0am-12.15pm$#5pm$"pc#$4(a)$".1$#2am$"5%$!6$!7$!m##5.3%!5$#0am',
+    '$!3$!5%"pm$%6secs$!8$!m##6.3$!6$!8$!c##7.2$!0$"5p#"82$!5',
+    '$!m#"95$!6"#/10$#956#!2$!0#"32##750$"80#"80#"90$!1"+0&ndash;120#$,184',
+    '$#994#".3%"8p$%57mph$"7%$%82mph$!9#$0.00$"14$!m$"nm#$1.11&!2%!3%!4',
+    '%!7%!9#$2.11&!3&!4&!5&!6&!7&!8&!9%"20&!1&!3%!4%!6',
+    '%!9##4.1%!2%!3##5.1%!2%!3%!4%!5##6.1%!2%!3%!5%!6##7.1',
+    '%!4%!6%!7%!8#!a#!k#"mb$!h"#1.1%!p$!4#"00#$2mil#!s"%2,088',
+    '#)-year-old#".0$"1%$!2$!5$"9%#"00#\'2.32.31#*3&ndash;38#"40#!a#"gb##mph")3&ndash;0*"14',
+    '#".4$"75#"/4##bhp#"cm#%g/4oz""4%#%-acre$&member##.49$"5p#$/115##mph"+5&ndash;113,!6',
+    '#!-##.06$%62mph%!p#*4&ndash;74#"cm$!u"#610#"38#"50#"75##:12#!b#"ff#!g',
+    '*"38#$,500#\'-member##.5p$"6%$!7#"00#)6&ndash;7##mph""8%#(&ndash;9##(a)#$,484#!.$"4p',
+    '#,0&ndash;1204#!p"*9&mdash;21$(ndash;20#%-seat#".4#"58#"77#&mmol/l#"th"&:02:32$$5:08$!7#+15&ndash;18#"29',
+    '$$2:29#)4&ndash;5$!4$!7#"52$$3:07$!6$!9#!9""ac#+m&ndash;4pm$$-7pm"#ghz"#sec"!t',
+    '#"22!*2&frac14;p\'"34#(middot;7#(ndash;02)"11*$2:30*"3%+"th)$2(c))"38))6&ndash;0))8&ndash;0)!9#&plus;1',
+    '"#(6)#"b)#"c)"(,000-odd##118$"90%!7##323##814##900&$,000$"11$"86$"92"#-11',
+    '#!4#$club$\'ylinder#$hole#)kilometre#%litre#$pack%#rty#&second##try#$volt#$yard$(ears-old"#.02$!3',
+    '%"am%"pm$!7$!8$!9#$1(b)$"pc#$2(b)$#0am$"58$!7##3.2$!m$"pc#$40pm',
+    '#\'5&mgr;m$#0pm$!3$%pstg.#&6.1986#%7&ins$!0$"4p#"98$!p"#/26#"86#"92"+0&ndash;125+"40',
+    '-#myr#+,000-member$#254$#538#\'-clause#\'.000,00#,0&ndash;1800$$c/ps$#gns%"ph$!m#)2&ndash;4#)3&mdash;4$!b#"db',
+    '#"in##kms#)p-a-share##rpm",1&ndash;1138*!8#*8&ndash;19#"nt"+2&ndash;123*!3##.00$!5$!8#)4&ndash;5#*5&ndash;74',
+    '#!m$!m$"ph#"nd")3&ndash;6*!8#$,800#)3&ndash;4$!0#"45#!m"$4.5p#"0s#)1&ndash;2#)2&ndash;3',
+    '##bhp#%kjmol""5%#+&ndash;1000*#400*#800#!-$#800##000#)4&ndash;5#"ff#"gb#!s#!w")6&ndash;7',
+    '#\'-member#)3&ndash;4##5-x#)6&ndash;8#"ff#!s"$7&ft$(mdash;46$(ndash;31*!8#$,905#".3$&799mph##2cc#"33',
+    '#)7&ndash;8#,9&ndash;1368+"81##mph#"th#&x127cm")8&ndash;9#$,000$#300#%-user#!.$"3p$!8#"gb#&m-word',
+    '%!.""9%#$,000$#500##.5p#,0&ndash;1324#)2&ndash;3#)4&ndash;7#,7&ndash;1305##mph"/:00&ndash;16:00$!2$!4%#:28$$5:18',
+    '$":0#"13%)&ndash;21$*6&ndash;17$!7$!8$!9#"21$!5#$30am$!3$!6#%45:27$$6:13$$8:50',
+    '$!5#!6#!7"#ax7%!s""d.#!b""ff"$hour"&kbytes#"yr"#mhz"*q24.3-qter"#rds")th-seeded',
+    '$%/13th"#vdc"(year-old!03&deg;c/55&deg;f#\'ndash;1*!3+#.5h*#4th)"20*!4*!7*!8)"33"$(11)#"5)',
+    '#"b)"+,000-square$"58$"60##135##300&$,000##939"#-12$!3#&a-side#$game#$page"#.0%$\'0-15.00',
+    '$!7#"1%$"00$%1secs$#2.1$#4.4$!8##2.4$!5$!6$!7$!8$!p%!c##3.6',
+    '$!5$!7$!8$!p%!c##4.3$!5##5.2%!4%!5%!6$!8$!m##6.4%"89',
+    '$!5$!9##7.2%!4$"32$!5$!9##8.1%!3$!3#"92$!5"%/14th#!6"+0&ndash;131',
+    '*!5#(,000,000#%-acre$$fold#$/140#$0-mw\'!e#)2&ndash;3#*4&ndash;74#$r(4)""1%#$,957##.38#*5&ndash;17#!a',
+    '#$,900#$-133$$page#"00#)3&ndash;5#*6&ndash;59#"cm""3%#*&ndash;150*!4$&sol;81##.3%$#631#$0hrs#"44',
+    '$!6#,9&ndash;1340+"41$!0#\'m-bytes")4&mdash;5$\'ndash;9#$,000#"th"+5&ndash;205*!7*!8##(3)#(,000,000#"07',
+    '#"ml"+6&ndash;137#*9&ndash;75#"mm#"pc#"th"+7&ndash;138##000#,5&ndash;1443#)6&ndash;7##bhp"*8&ndash;61#$,500#!a#!b',
+    '##(1)#$,000$#810#$.176#,9&ndash;1413#!a#!b#!p"#:03$$8:54$$9:57#+10&ndash;17$!1$!7#"21',
+    '$!6$!7$!8#"30$!1%)&ndash;32$$3:52#)4&ndash;7+-9,18&ndash;23$*4&ndash;46$$9:33#"51%#:22$!3%#:55',
+    '##6:8"&cm/5in""db"$secs")th-minute!,4&frac12&ins$\'t;6&ins#(mdash;16#(ndash;12*"46*"6h)"22)"40)!5)!7',
+    ')!8#&sol;76"$(12)"\',000-km&"gn##100##385##654##700$"69"#-13$!4#"20$!1$!2',
+    '$!6#!3$!0##bed#\'hectare#&minute"#.05$!7#$11.1&!2$!7$"bn$!p##2.1%!2',
+    '%!4%!5%!6$!8$!9$"hh##3.6%!7$!4$!5$!7$!9$!p##4.2%!3',
+    '$!3$!6$!9$"bn##5.1%!2$!5$"bn$!m#$6(b)$!5##7.2$!0$"pc#+8&ndash;126',
+    '""/-#%10/93#"26#"89"%0&deg\'";f$\'ndash;2*!4#%,000d#)-year-old#"29#"50#$8/71#"as#*c/275f/gas',
+    '$"m.")1&ndash;4##(c)#$,500#%-seat#*1&ndash;12#*3&ndash;21#"mg#!p#"st"+2&ndash;143,!4#)1&ndash;2+"51$!8',
+    '#"cm#!g#!s"%3,998#".7##/88#!a#"rd%\'-ranked"(4&sol;86##(3)#\'-strong#$1792#%kbits#!p',
+    '$&sol;88#".0$!8##/86#,7&ndash;1743##bhp#"cm#"mm")6&ndash;8##(1)$"4)#".8#)0&ndash;1$"00$!5',
+    '")7&ndash;8##(1)#$,181#\'-member$(year-old#)3&ndash;5#*5&ndash;c.#$:9:0##mph#"th"%8,700#\'-member#)0&ndash;2$!0#)2&ndash;3',
+    '#)3&ndash;4#,5&ndash;1509+"c.$!3#*8&ndash;89#"cm")9&ndash;4*"50*!8#$,000##.5p$!8#*0&ndash;c.#,7&ndash;1691#,9&ndash;1500',
+    '#"14$$9:42#"20$!1$*2&ndash;33$!3$!4$!7#!4$!4$$8:32#!5$!0$$1:34#!6',
+    '""ff"#ghz"(lb/6.5kg"#min#"ph"#sec#!t"#thc!*5&frac12;p#%mdash(#;16$&icro;h#(ndash;14*#8in)%20min',
+    '*!3#6times;10cm/6&times;4in"!\'"1,000&ndash;20,000&\'-30,000\'&member#"16##767"$-20%#*amino-acid$$side#\'country$#wt.#&for-12#"kb',
+    '#$seat"#.01$-2&mdash;15.04$!5##10p$#1.1$!5$!9##2.1%!2%!3%!7%!8$!2$!4',
+    '$!7##3.1%!3%!4$!1$!4$!5$"hh$"pc##40%$!7##5.4%!6$"8%$"kg',
+    '##7.6%!7%!8#"9p"\'/100000$!1##365"\'0&deg;f$"ft$%mgr;l$\'ndash;1*#250*"51*!6#!+',
+    '#$-day$%place#"/2%"00#$0&ft%*ndash;1600$%-1900$"ft$#gns$!v#,3&ndash;1506#,5&ndash;y20r##ft.##khz#"lb',
+    '#!s#&x200cm"*1&ndash;75*!8##(1)$"2)#$,000#\'-member##.2p#*5&ndash;34#*8&ndash;19#!p#"st")2&ndash;6##(1)',
+    '%"89#,0&ndash;1591,#620#,1&ndash;1603#)3&ndash;4##5kg#,9&ndash;1601#!a#"mm#!p"*3&ndash;87#".6#)2&ndash;3#*5&ndash;96#)8&ndash;9',
+    '#*9&ndash;40#!p#!s")4&ndash;7$&sol;78#$,000#,0&ndash;1599#)2&ndash;3#"60#)7&ndash;8#,8&ndash;1600#!e#!p#&x113cm")5&ndash;5',
+    '#".0#,0&ndash;1650$#/51#)1&ndash;2#)2&ndash;3#,3&ndash;1606-"39#)4&ndash;5#,5&ndash;1612#)6&ndash;7#$8/59#,9&ndash;1581##ff.#!g#!k',
+    '"*62&ndash;4#,4&ndash;1612-"28#)5&ndash;8#"90"%7,000#,5&ndash;1642#!p#"th"+8&ndash;160#$,000#,3&ndash;1643#)4&ndash;5#*6&ndash;87#,8&ndash;1648',
+    '#"ft""9%#*&ndash;162*"63#)0&ndash;7#,1&ndash;1664#%51-59#,6&ndash;1622-"51"#:00$!1#"11$!5$!9#!2',
+    '$!4#"34$!7$$9:18#%40:30#"51$$7:35$$9:44#!7""ci""f.$"22#!f#!l""g/',
+    '#!b"#ins"!k""ma##ins##ton#"yr""nm#!s"#pts"$secs")th-minute"!w!*6&ft;6&ins#(ndash;15',
+    '*+9-year-olds),24-year-olds)"35)"40)"60))8&ndash;0#,times;12&ins"$(16)#"6)"&,000ft#%17,18$&95,000#"25##393#\'600,000',
+    '&"ft##800"#-13$!4$+8-year-olds#"24$!5$!8#!6#\'bedroom#$goal$(reyscale#%metre$#ile#$seat',
+    '"#.0%#$1(a)$!6##20p$!1$!2$!4$!7$!9#+30&ndash;19$!9#"40$!4$!6$!7',
+    '#"50$!3$"cm#"7p#&8/1000$"0%$!5$!p""/1$!0#"20#&32-bit#!5"%0&deg\'";f',
+    '*"70*!8#(,000,000#$-170$$page$&strong#!.#)0&ndash;1,#500$#bpi$"mm#,1&ndash;1685#,3&ndash;1640#,8&ndash;1674#*9&ndash;10',
+    '#":1#!g#"hz##mhz$!l#"nt#"th")1&ndash;3*"80#,5&ndash;1680#,7&ndash;1677#*8&ndash;19")2&ndash;5#$,000##.5%',
+    '#*3&ndash;69#)4&ndash;9")3&ndash;6#$,265#,1&ndash;1711#$2.36#)7&ndash;8#)8&ndash;9#!p"+4&ndash;166*"77#%-yard#".1#,0&ndash;1840+"60',
+    '#)1&ndash;2#*2&ndash;51+!6#)3&ndash;7#)5&ndash;8#)8&ndash;9#,9&ndash;1660""5%#(&ndash;7#\'-member##/65#&0-1713&#914$!0#)2&ndash;4',
+    '#*9&mdash;60##bhp#"ft#!g#!k#"lb#"th"%6,407#\'-member#".3$"7%#,0&mdash;1715%\'ndash;1,#685,#700',
+    '-"82,#840#,3&ndash;1708##5/6#,8&ndash;1738#!p")7&ndash;9$&sol;73#*0&ndash;71#,3&ndash;1755$!9#"50#*6&ndash;84#)7&ndash;8,!0',
+    '#!a#!b#!c#"th""8%#*&ndash;169##(6)#\'-member#,2&ndash;1725#,8&ndash;1701-"51,#800+!9#,9&ndash;1713#"cm',
+    '"+9&ndash;170#$.8bn#,0&ndash;1714-"56#)1&mdash;5%\'ndash;2#,2&ndash;1752#,5&ndash;1714#,9&ndash;1768"/:00&ndash;20:00$!6$!9#"11$*3&ndash;28$!6',
+    '$!8#"22$!4#"30$!1$!3$!9#%43:18$$5:48#"50$!6#!7"!e""fl""ha',
+    '"#in."$kbps#"da#!m"#lbs"$mbit#!s""pf"#sec%!s"-th&ndash;18th,#9th$\'-minute$!.$%/17th',
+    '"&x12ins!\'7&deg;c#(mdash;21#(ndash;10)#20%*!7)"52)"83)#jan#&percnt#+shilling;6d"+,000-strong#%27,35##363##818',
+    '"!-#!0#$date##gon#%track"#.14$!6$!7##2.3$!3$!8#"32$!4$!5$!7',
+    '##4.1$!8$!9##5.1%!2$!3$!6$!7$!9$"km##6.3$!0$!7$"fl#"7p',
+    '##8cm#"93"#/19"%0,700#,0&ndash;1470+"21$%-1845#,1&ndash;1750#*2&mdash;13%(ndash;13#"32#!b#*c/325f/gas#"kg"%1,500',
+    '#*2&ndash;78#*3&ndash;84#*4&mdash;15%(ndash;88#*6&ndash;17-"80$!0#,7&ndash;1801$#/18#!b#"mb#!p")2&ndash;3#".0#$/107',
+    '#)1&ndash;5#)2&ndash;3$!0#,3&ndash;1808+"92#*4&ndash;29#,5&ndash;1807#*6&ndash;27+!7#*7&ndash;60+!8#*8&ndash;37#,9&ndash;1809#!p"+3&mdash;175',
+    '*!4*!5#,2&ndash;1809+!3#,3&ndash;1779#,4&ndash;1815$%-1810#,5&ndash;1823#)6&ndash;7#,7&ndash;1802.!9+"40+!8#,9&ndash;1796")4&ndash;9',
+    '##-bp#)0&ndash;1#,1&ndash;1807+!7#,3&ndash;1805-"20+!4#*4&ndash;48#,5&ndash;1814#,6&ndash;1827+!7#,9&ndash;1838+"51##bhp""5%',
+    '##.15#)0&mdash;4%*ndash;1813-"20-"50,#914-"50$%-1850$!0#,1&ndash;1816-"20#,2&ndash;1799,#835#,3&ndash;1827+"61',
+    '+!8#,5&ndash;1760,#834+"60#)6&mdash;7%*ndash;1815-"28+"59#)7&ndash;8#,9&ndash;1836##bhp#"cm#"ft#"hp#"mm',
+    '#$.844#)0&ndash;7$"\'s#,1&ndash;1833#)2&ndash;3#,3&ndash;1855#)4&mdash;5%\'ndash;6#*6&ndash;68+"81$"/7#,7&ndash;1832#,8&ndash;1838#,9&ndash;1831+"71',
+    '*!9#$,500#,0&ndash;1831-"50+"75$"\'s#,1&ndash;1855#,2&ndash;1773#)3&ndash;4#*4&mdash;87%*ndash;1843+"76#,5&ndash;1800+"82#,6&ndash;1865',
+    '+"81#,8&ndash;1840+!9#"lb""8%#,0&ndash;1850.!2+"90$"\'s$!5#)1&ndash;3#,2&ndash;1850#,4&ndash;1858.!9+"91',
+    '-"63#*8&ndash;90,!2#,9&ndash;1852.!4.!5-"70#"mm#"pc"+9&ndash;199*!7*"82#,0&ndash;1830-"47-"50',
+    '#,1&ndash;1840-"52-"67+!7#,2&ndash;1822-"34-"60.!5#,3&mdash;1815%*ndash;1847.!8-"73+!4+!5#,4&ndash;1843',
+    '-"65$"cc#,5&ndash;1881+!6#,6&ndash;1801.!2#)7&mdash;8%\'ndash;8#,8&ndash;1805-"54#,9&ndash;1883"#:07#)1&ndash;8$!0$*1&ndash;19',
+    '%#:35#"21$!5#"30#!4#!5#!6""c.#!a#!i#!s"!e""ff"!g"!k',
+    '#!m"-th&ndash;19th!\'8&aring#&frac12)$&ins#(ndash;10*!1)#20%)"55)"64*!6)"89#(shilling"#(5)"$,200',
+    '##600##700##980""-0#"10$!2#"25#"35#!6#!7#$copy#*month-long(!s#$page$%erson',
+    '"".0$-0&ndash;21.00$!5$!8#%12.93#$2(a)%"b)$!0$!5$!9#"35#$4.93#"52$!4$!m',
+    '##77p#"8p#"98$!m"%/1000\'"00##250"\'0&deg;.$)ndash;181*#240*!5#+,000-strong$#500#%-acre$#day',
+    '$$mile#,0&ndash;1830-"50-"82+!3+"49+!7+"81$#gns#,1&ndash;1889+"25+!4#)2&mdash;3#*4&ndash;13+!5',
+    '#)6&ndash;8#,8&ndash;1883-"92+"82#*9&mdash;12%*ndash;1882#"ft#!g$!b#"kg#"lb#"th"%1,000%"35#*0&mdash;11',
+    '+"88$".5#*2&ndash;15,#887$#/13#*3&ndash;15,#903#,4&ndash;1940#,5&ndash;1848#,6&ndash;1887#,7&ndash;1886,#902#,8&ndash;1870+"22#,9&ndash;1884',
+    '+"85+"90#!f")2&ndash;3#$,000#\'-member#!.#,0&ndash;1860+!2+"30#)1&ndash;2+"90#,2&ndash;1902+"25+"88',
+    '#,3&ndash;1899,#900#)4&ndash;7#,5&ndash;1850,#925+"30,!1+!6+!8#,6&ndash;1894#,7&ndash;1900+"29+"30#)8&mdash;9%*ndash;1829',
+    '-"10.!6#*9&ndash;30#!e##mhz"(3-member#)0&mdash;1%*ndash;1916+"50#)1&ndash;3+!6#,2&ndash;1879+"91#,3&ndash;1923+"34',
+    '.!3.!9+!6#,5&ndash;1912-"24#"6.#,7&ndash;1843#,8&ndash;1935+"40,!1#*9&mdash;41%(ndash;43")4&ndash;5*"96#$,050',
+    '-"22#,1&ndash;1912-"31-"92#,2&ndash;1919-"26#,3&ndash;1916-"27+!5+!8#,4&ndash;1912+"46#)5&ndash;9#,6&ndash;1905+"50',
+    '#,7&ndash;1917-"24.!8.!9#,8&ndash;1867,#915.!7.!8-"20.!8#,9&ndash;1918+"54+"63""5%##/60',
+    ',#913-"22-"40-"50#,1&ndash;1892,#925.!8-"81+!2+!6#,2&ndash;1914-"33+!3#*3&ndash;56#)4&mdash;5',
+    '-"20.!3.!9-"31.!2.!5-"41$"70#,5&ndash;1881,#945+!7#,6&ndash;1922-"39-"43$#-68',
+    '$!0#,8&ndash;1938#,9&ndash;1899,#924+"70#!f$"f.#*g/6&amp;oz#!k##mph")6&ndash;7*!9#,0&ndash;1900-"13$%-1960',
+    '-"25.!8-"86+!5+"70#,2&ndash;1933.!8#,3&ndash;1936-"57+!4+!5+"67#,4&ndash;1916-"29#,5&ndash;1939',
+    '+"70#,7&ndash;1924#,8&ndash;1916-"22.!7-"33-"49#,9&ndash;1871,#918")7&ndash;8#*0&mdash;71%*ndash;1924-"40-"50+!5',
+    '\'"40$"cc$"lb#,1&ndash;1949#)2&ndash;6#,3&ndash;1900+!4+!7,!5#,4&ndash;1944-"53+!7+!8,!0#,5&ndash;1941',
+    '+"76#)6&ndash;8,!0#)7&ndash;8#*8&ndash;79+"84+!9#,9&ndash;1940-"64-"78+"83"#8.2#,0&ndash;1930-"40.!5',
+    '-"69$\'s/1890s#,1&ndash;1975+"82+"91#)2&ndash;5+"83#)3&ndash;5#,4&ndash;1976.!7+"87#)5&ndash;7#,7&ndash;1975+"88+"91',
+    '#,9&ndash;1982+"91,!3"*9&ndash;90##(1)#,0&ndash;1918-"30-"71.!4$%-1930$!.#,1&ndash;1900.!1+!3+!4',
+    '+!4#,3&ndash;1894,#905-"18-"21-"70#,4&ndash;1917#,5&ndash;1905$%-1973#,6&ndash;1901-"80#,7&ndash;1900.!4#,8&ndash;1902-"16',
+    '-"70##bhp#!i#!p#\'x128cms"#:20#!3$!0$$1:30$!5#!4$$0:05##6:0#*9&ndash;14"#a10',
+    '"!e"!f#!f""gb""hz""km"#lbs""mg##ins#)onths-old"$secs"-th&ndash;22nd!%9&deg#)frac34;in$!t',
+    '#%mdash#(ndash;14*!7)!2*!9)"34)"46)!5*"5%)"88)%march""\'s"#(a)"!+"$,103',
+    '##528##765"#-14$!7#"26$!9#%stone"#.0%#"12$"71%!2#"26#$4(a)%"b)#$6.92',
+    '$$9mhz"#/21#$4/93""0%#4&deg;c/375&deg;f/gas$\'ndash;3#*0&ndash;10,!4,#700,#945+!9$%-1954#*1&ndash;04+"11#)2&ndash;5',
+    '#*3&ndash;05+$1945+!6+!7#*4&ndash;14,#935#*5&ndash;06+"15,#925-"37+!9#*6&ndash;07+"29+!8+!9',
+    '#*7&ndash;16,#914+!9$!b#*8&ndash;13#*9&ndash;13,#935##bhp$!p#)d&ndash;e#!g#!k$$jmol$!m")1&ndash;2',
+    '#*0&ndash;13,!5,#932-"74+"24#*1&ndash;14,!8,#949#,2&ndash;1914$#-25#*3&ndash;16$!+$#-45#*4&ndash;17,#916',
+    '$%-1918$"18#*5&ndash;19$!0#*6&ndash;18,!9$#/17#*7&ndash;20+"35$#/18$!a$!b#,8&ndash;1945+"24$!b',
+    '+"23+"39#"ff##pp.")2&ndash;3#(,000,000$#500%"74#,0&ndash;1944-"87+"28+!3+!4#,1&ndash;1967+!4',
+    '+!6,!3+"81+!9#*2&ndash;39+!4+!6$!b##3/4$!1#)4&mdash;5%(ndash;27+"34+!8$!0',
+    '+"31,!3,!5$!2$$:240#*6&ndash;28+"30,!1,!2,!6$%-1941#*7&ndash;31,!4+!9$#-33',
+    '+"31+"69#*9&ndash;34+"57$#-32##bhp##pp."%3,000%"63#&-pupil#)0&ndash;2+"45#*1&ndash;34,!9+"41',
+    '$#-33#,2&ndash;1939#)3&ndash;5+!6$#-45#)4&ndash;8$#-35#*5&ndash;55#*6&ndash;38+!8#*7&mdash;38%*ndash;1958-"73$#-38$"/8',
+    '$!-$"/9#*9&ndash;58$!b#!l"(4&sol;84#)0&ndash;1,#990+!4+!5+"60$!-#,1&ndash;1945+"45$#-45',
+    '#*2&mdash;43%*ndash;1943#,3&ndash;1945+"44,!5+!5#$4/45#,5&ndash;1965+"65$%-1955%"46#*6&ndash;49+"54$#-47#*7&ndash;51',
+    '#*8&ndash;50,!3+"68,!9$!5#,9&ndash;1950+"69$#-50""5.#,0&ndash;1960+!4+"52,!3+"62+"72',
+    '$#-51$!.$"/1$!0$)s-vintage#)1&ndash;3+"59+"75+"87$%/1952$!b#,2&ndash;1981-"92+"55+!6',
+    '$!.#*3&mdash;54,!5%(ndash;61+"71,!3#*4&mdash;55%(ndash;56+!6,!8+!7+"84$#-55$#:28#*5&ndash;57',
+    ',!3,!5+"74,!6+!9$#-56$#/56#*6&ndash;62$!a#+7&mdash;the%(ndash;59+"62,!9+!9$!.',
+    '#*8&ndash;61,!4,!9+"71$!.$"/9$$:207%"95$!a#*9&mdash;62%*ndash;1970$#/60#"kg#!p"\'6&mdash',
+    '$&sol;87#$,000$#722#".5$"70#)0&ndash;4+"75+"87,!9$#-65%"85#*1&mdash;63%*ndash;1971+!4+!5',
+    ',!4+"74+"87$!.$!0$!a#,2&ndash;1992+!5+!7$#-63$!.$!a#,3&ndash;1990+"65$&/canon',
+    '%*ndash;1965+"68+!7$#-66#,5&ndash;1968-"92+"68+!7,!0,!2,!3$%/1867%"66#,6&ndash;1986+"71',
+    ',!7+!8,!1,!4+!9$%-1970%"71&!6$"/7$,:29&ndash;30%#463#*7&mdash;68%(ndash;69+"70,!3',
+    ',!5+"88+!9$#-73$#/68%!8#*8&ndash;71,!2$#-70#*9&ndash;76+"80,!3,!7$!.#"lb',
+    ')!6#$,000$#500#)0&ndash;5$$:115%"87#)1&ndash;3+!4+"73+"84,!7$#-74%"81$#:21%"49',
+    '+!7+"80,!3$#-75$!1$#:37%!6%!8$!c$!d#*3&mdash;74%*ndash;1974+"78+"80,!3',
+    '%"82%"90$$:145#,4&ndash;1979+"80,!5$!\'$#-77%"80&!4$!.$#:42$!c#,5&ndash;1981+"79',
+    ',!8$#-77%"80#,6&ndash;1981.!5+"87+!9,!0$#-78%"81$#/98$":8$#k:3#*7&ndash;82,!5',
+    '$!1$$:123%"80$%a:132$!c$!e#,8&ndash;1979-"80.!2+"84,!5$#-80&!8$$:171%!4',
+    '%!9#,9&ndash;1981.!2+"85$%,1980(!1$%/1980$$:106&"55%"80"$8(1)$"a)#*0&mdash;83%*ndash;1984+!4',
+    '+"84,!7,!9+"90,!1$!/$!1$#:10&!3%#297%"78%#ch.$!c$!e#,1&mdash;1991',
+    '.!5.!9-"90+!4+!8+!9,!2$"\'s$%-1984%"84&!5&!7&!8$$:307#,2&ndash;1986',
+    '.!8-"90+!6+"86$$:290%#ch.$$a:37$$b:64#*3&ndash;90,!1$#:15%"43&!4$#b:2#*4&mdash;85',
+    '%*ndash;1986.!9+"89$!-$$:189%"40#,5&mdash;1991%*ndash;1987.!8+"91$%,1986$%-1987%!7%"89$$/173',
+    '%#886$#:23&"62%"78$%b:158#,6&ndash;1989-"90+"89+"92$"\'s$%,1987$%-1990%!8%"95%#may',
+    '$#:34%!9#+7&mdash;see%*ndash;1990$"\'s$%-1988%!8%"92$!8$!d#,8&ndash;1990$"\'s$%-1990%"92%%early',
+    '%#see$$:130%"49#,9&ndash;1991+"94$\'-august%+provisional$&/brian%*gloucester$$:106&!3&!9%"20%!7&)&mdash;11',
+    '%#ch.#"cm#!g"+9&ndash;200#\'-member#+0&mdash;the%*ndash;1992+$2025+"92,!3$%-1992%"94%$july$"/h$#:20',
+    '&"76%"50%"76#.1&ndash;friday$!-%$1992%"94%%march$&/robin%5sellack/herefordshire&&windon$,198719911987$!d$!s#,2&ndash;1995',
+    '$%/1699%&cannop%,duntisbourne%(heathrow%3longcot/oxfordshire%+northampton%$rape&-eigate/surrey%6stroud/gloucestershire%2witney/oxfordshire$!0$!1$"93$!c#*3&mdash;94',
+    '$"-4%"97$%/1994%"93%4sandford/oxfordshire&5evenhampton/wiltshire#,4&ndash;1995$"-5$!.#$5-97$!.#"6a#$7-99$!0#$8/99',
+    '$!d#!g"":1$!0$"1f#!2$!1$!6#!3$!1#"55#!6"$a(1)"#ff.""ga',
+    '#"in""st"-th&ndash;20th$%-20th""x0#!1#!3!*:1,000,000#".2$!6#%0,000$$0000$"24#*2&ndash;13#*4&ndash;20',
+    '#%6.562#!x"#2.8##000#*1&ndash;28#!9#":1""32#*4&ndash;35#!5#!8#":0""43"\'500,000#!5',
+    '"&625000"#800"!m!$a(1)"!1#$/1a2"!q!"bl"!p!#cm/"!t!"dd"!u"!y!"eq',
+    '"!u!"fl!"ha"!g!!i!"jb"!t"!y!#kpc"!w!"ls"!t"!u!"m."$/3ft',
+    '"(in19secs$&24secs"$moll"!v!"nb"!t"!w!"o5"!d"!p!"pf"!p"!q"!r!"qb',
+    '"!h"!n!$secs!"tf"!j!"ug"!l!#wlr!"yd"!p %2&agr#)mp;times2"&deg;dh#%ollar"(frac12/2',
+    ')"d.)"oz\'$4;in")half;inch\'"pt"\'mdash;5#&gr;gml#\'iddot;1"0ndash;11&ndash;8))5&ndash;0)!8("28(%3&deg*#ins)"00',
+    ')!m()4&ndash;0)!9)!g(&5-fold*)year-olds("6%)(&ndash;20!4)!0(\'8&deg;c*\'ndash;8(#day".prime;43&prime"+shilling;9d',
+    '"$thgr#$imes!$(11)""7)""f)!"*2!"+4!\',000-km&%metre%#gns%#mph%"th$!5#"10$!1',
+    '#"20#"33$!5$!6#$48mb#"60$!8#"74#"86#"90$!4")100-2,200$!6#"11$!3',
+    '$!7$!9#"23$!5$!6#"30$!2$!3$!8#"41$!3$!5#"52$!5$!7',
+    '$!7$!8#"71#"83#$92.3"%200km%"lb$!5#"11#"21#$33.9$!5#)50-member#"66$!7',
+    '#"86"#316#"20$!9#"44%$,885$!6$!8#%60mhz$!1#$82.7$!8"%4,6,8#$00.9%"hp',
+    '$!1#"12#$22.7#"46#"54#"60$!3#"90"#5,8#$00lb#"29#"40#"58#%63.11#"72',
+    '##00%$!1$!2#"19#"20#"33#"42#"51$!7#"81"#715#%20.78#%54.56#"60$%6,889',
+    '#"80#"99"%800ft%#gns#%12.02$$7.19#"21#"44$!9#"64#"78$$9.42#&80,000$!5"#926',
+    '#"30#"56#"98!%-10-0#!1#!4""22""3%"#4-2"$6-0t"$byte"\'derived"(globulin"!l##ane',
+    '#&achine#.ercaptoethanol#(ile-long"!o"%point!(.0-based#$3412#$5586$!m#$6.13##8ns#"93"$1(b)#&-litre$!m',
+    '$!5##0.1&".2%$2.16%!4$!1#"10#"2.##5.7##7pm#":1#"mm#!x$"10"\'2-based',
+    '#!.$#2.2&!3&!4$#3.1$!7##0pm#$4x10#"5p#$7.40$"mm#$9193#\'million"+3&ndash;2.5$(times;10',
+    '#%0p.m.%"m.#$1643#$9.06#!i##x10"\'4&aring$#ins$(ndash;24##.10$#2.4##0pm#"4m#"mm#"pc',
+    '$*ndash;10.0*"20*!5+"cm$(times;10#"*2#!.$#4.2$!5#$0.30$"am#$1x10#*6&times;10$#.08#!7',
+    '#":1#!c#!d#"kb$!g$!m##mhz$"ph#!v"$6.10$!8$!9#!5#!7#":1',
+    '#"mm"%7&deg##-kg#$.1.5$!3$!8$!9#\'1828183#!3#!6##780#"kg#"pc"#85m#!6',
+    '"$9(a)#".1%".8$!2$!4#!1#!6#!7#!8#"pc!"/1#$1/87#!2"!5"!9',
+    '!\'0&aring#(deg;c/80#\'micro;g*#/ml#\'ndash;0)"12*!7)(22&deg;c*\'5&deg;c*\'8&deg;c)!3*%0,000+!0)"49)!5',
+    ')"64)"83)#oct#%times"#(3)"),000-plus\'$volt\'$word%!1%!6$"59##311##456##800"#-11',
+    '$!8#"31#!7#$acre##feb#&gallon#$hour#"kb#%tonne"#.0%#$1.93$!0%#.93$!1$!5',
+    '#"21#"4m$"pc##5kg#"79#"85#"97$#mph$!p""/-#"30#$5/93#"92"%0&deg$(mgr;molm',
+    '$\'ndash;2+"40*#350*#500$+times;100mm##,00&)0-225,000#&-metre$&person$(targeted##0-5%"ft%$mile$!.$%/4000',
+    '$"cc$#gns$!m$#rpm$!w#,1&ndash;4500$"01$!s#+3&ndash;07s#%85-86##dpi$!u##gms$$rand#"hz',
+    '#\'m-bytes#$ngml$!m#"pa$"pm")1&mdash;4#"lb")2&ndash;3*!4#!1#!2$!7#!9#"pp")3,000,000',
+    '$!w#!4#!7#!p"*4&ndash;11##0ax#!2##555#!6#!9#!p"+5&ndash;206*!9$&sol;78#"\'s',
+    '#!7"*6&ndash;17*!7$&sol;78#!4#!5$!0#!p"(7&sol;86#$,000#"10#!6#!9""82#!3',
+    '"*9&ndash;11#!2"/:00&ndash;24:00#"10$!1%#:14$!8#%22,23$!5#"30#!4#!5##6,7"#amp""bn',
+    '"!h#!a"#kms##ton#!w""mg$"kg#"pg"#ppm#!s#"ts"%s/30s#!q"-th&ndash;21st$!-',
+    '"$year&$-old!%1&deg#&frac12)$;cms*"in#)middot;22#(ndash;11)"32)"59)"72)$july+!n,!e#(shilling',
+    '##300$"93##700&$,000$"72##906"#-16$!8$!9#"20#"30#!6#!7#!8##feb',
+    '"#.05$!9#"12$!3$$8(a)#"20$!3$!4$!6#"43$!6##5cm$!p##75p#"83',
+    '#"23"%0&deg\'";s#"-3$&member##.41#$0rpm#!3#"92#"mb"+1&ndash;217#$,000#!1##535#"64',
+    '#"th"%2,558#!3#!5#"90")3&ndash;1+!4*!8#$,000#"cm#!p"*4&mdash;15#$,969#"pp")5&ndash;6',
+    '$"70"$6135#!7#!b#!p"&7-seat#!.#!4#!7$!0#!8##mph"+8&ndash;201#!1#!8',
+    '#!b"*9&ndash;20#!3#"70"*:1&ndash;4#"20$!3#"38#!5#!6#!9""bp"&cennet""in$!s',
+    '#"er#!s""s.#)t-century!)2&frac12%\'"34$!t#(ndash;15*!6)(28&deg;c*!9)"35*!8*!9)!7',
+    ')#jun)$sept#(shilling"#(2)#"3)"!+"$,300#\'402,200##682#\'700,000##800##901$"65""-0#"14',
+    '$!9#!6#$july%"ne#$seat#%track#)years-old"-.0&ndash;77.3$!2##1.7%"92$!4#$2.93$!5#"38',
+    '%"b)$!1$!2#"55$!p#"74#"9%"$/25a$!7%!a$!9#"32#$4/93#"84"&0-page',
+    '#!2#!6##lbs#"mm#"nm#"pp"+1&ndash;222##(4)#$,790$#995#"05##321#!b#"lb""22',
+    '#!4#!m#!p"%3,000#!3##7.8#!8")4&ndash;5#!0#!1#!6#"73#"pp",5&ndash;1125*"34',
+    '#!4#!5#\'g/8oz/2"(6&sol;78#$.7bn#!0#!6$"86#"77#"cm#!p"(7&sol;78##043#!2#!3',
+    '#"ff"(8&sol;78#!1$#/92##420##6cc$"dd#!p"*9&ndash;33#!2",:19&ndash;20#!2$!0$!9#)3&ndash;6',
+    '$!s#"nd"!h"#khz")month-old#"pg")nd-minute$!."$secs!(3&frac12#)ndash;125)"29)!3)#420)"59',
+    ')"81)!9)#jul)#oct#&percnt"#(5)"(,174,336##600%!7$&50,000#\'700,000#\'800,000##945$"87"#-13',
+    '#!7##jul"".0$!1##1.5#%2.1.1%!5$!5#$3.92$!4#"44#"5m#"75$!p#$9.92',
+    '$$1/87#"25$!8#"34"#000$"bp#!c#"mb#!p#"th"$11.6")2&ndash;4#$,000#!.#"32',
+    '"%3-231#!0#!3#!4##7.7"-4&ndash;1,421##(1)#$,000#!0##6.7#!7"+5&ndash;249+"56#\'-strong#!2',
+    '#"nm")6&ndash;6*!8#$,000$#800##.3%##3.5#"ml#"th"%7,000#!0"+8&ndash;239#$/260#!8$"00',
+    '##(2)$"3)#!1##3.2#"86$"86#"th"":1$!1$*4&ndash;19$!5$!6#!2#+33&ndash;43"!b',
+    '"-rd&ndash;25th$\'-minute$!."#sec%!s"&x11cms#$30cm"(year-old!%4&deg#&frac12#(ndash;15)"29)"32*!5)!9',
+    ')(november)#sep#&percnt"#(3)"(,000,000&"ft#\'200,000##300##651#\'700,000"#-12$!7$!9#"20#"30',
+    '#\'country##day$\'ec-1999#$foot#$game -after-cooking',
 )
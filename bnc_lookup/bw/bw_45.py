@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_45 = (
+count_45 = 6694
+
+heads_45 = (
     '%component.seq',
-    '%dcl-e-openin',
-    '%rbge',
-    '&aacute;gua',
-    '&aacute;vila',
-    '&acirc;me',
-    '&aelig;lfthryth',
-    '&aelig;thel-red',
-    '&aelig;thelwulf',
-    '&agr;-actinin',
-    '&agr;-chymotrypsin',
-    '&agr;-cyclodextrin',
-    '&agr;-helix',
-    '&agr;-helix-turn-&agr;-helix',
-    '&agr;-mediated',
-    '&agr;-particles',
     '&agr;-peak',
-    '&agr;-value',
-    '&agr;1',
-    '&agr;4&bgr;1',
-    '&agr;6&bgr;1',
-    '&agr;6&bgr;4',
-    '&agr;i',
-    '&agr;s',
-    '&agr;v&bgr;3',
-    '&amacr&sacute;ramas',
-    '&amp;-',
-    '&amp;3/4',
-    '&amp;5a',
-    '&amp;abelson',
-    '&amp;address',
-    '&amp;americas',
     '&amp;ballard',
-    '&amp;barndorff-nielsen',
-    '&amp;blatt',
-    '&amp;boon',
-    '&amp;brass',
-    '&amp;briscoe',
-    '&amp;butcher',
-    '&amp;charles',
-    '&amp;cui',
-    '&amp;dad',
-    '&amp;dollar',
-    '&amp;e',
-    '&amp;excise',
-    '&amp;fm',
-    '&amp;green',
-    '&amp;gretel',
     '&amp;group',
-    '&amp;halley',
-    '&amp;hardiman',
-    '&amp;heynen',
-    '&amp;holyhead',
-    '&amp;illus',
-    '&amp;information',
-    '&amp;l.',
-    '&amp;lawrence',
-    '&amp;lb.',
-    '&amp;leeds',
-    '&amp;limerick',
-    '&amp;lt',
-    '&amp;lyle',
-    '&amp;miller',
-    '&amp;minus',
     '&amp;minus5&deg;c',
-    '&amp;mouton',
-    '&amp;od',
-    '&amp;or',
-    '&amp;partners',
-    '&amp;purchasing',
-    '&amp;ramseyer',
-    '&amp;robbin',
-    '&amp;s',
-    '&amp;sanders',
-    '&amp;semeniuk',
-    '&amp;slovak',
-    '&amp;smyth',
-    '&amp;social',
-    '&amp;style',
-    '&amp;sup218',
     '&amp;sup238',
-    '&amp;techniques',
-    '&amp;tel',
-    '&amp;telephone',
-    '&amp;the',
-    '&amp;trusell',
-    '&amp;veenstra',
-    '&amp;w',
-    '&amp;ward',
-    '&amp;welfare',
-    '&amp;zinkernagel',
-    '&ape;0',
-    '&ast&ast&ast&ast&ast&ast;l',
-    '&auml;gyptische',
-    '&auml;gyptisches',
-    '&bgr&bgr',
     '&bgr;-adrenoreceptor',
-    '&bgr;-myosin',
-    '&bgr;1-',
-    '&bgr;2-',
-    '&bgr;3',
-    '&bgr;5-loop',
-    '&bgr;blocker',
-    '&bgr;c',
-    '&bgr;receptors',
-    '&bgr_',
-    '&bsol&commat*',
-    '&bsol&gt',
-    '&bsol;d',
-    '&bsol;dir1&bsol;file1',
-    '&bsol;dos&bsol;country.sys',
-    '&bsol;dos&bsol;setver.exe',
     '&bsol;dos&bsol;smartdrv.sys',
-    '&bsol;dos&gt;attrib',
-    '&bsol;star',
-    '&bsol;windows&bsol;quote',
-    '&bsol;work',
-    '&bsol;work&bsol;work',
-    '&bsol;work&bsol;work&bsol;work',
-    '&ccaron;erm&aacute;k',
-    '&ccedil;i',
-    '&ccedil;iftliks',
-    '&ccedil;okertme',
-    '&check&check&check&check&check',
-    '&commat;firstpara',
-    '&commat;how',
-    '&commat;if',
-    '&commat;sys&dollar;lifespan:lstrain',
     '&deg;m',
-    '&dgr&lgr',
-    '&dgr/b',
-    '&dgr;e/e',
-    '&dgr;i/&dgr;y',
-    '&dgr;m15',
-    '&dgr;p',
-    '&dgr;u',
-    '&dgr;x/&dgr;63',
-    '&dgr=',
-    '&dollar&dollar',
-    '&dollar/dm',
-    '&dollar;0.38',
-    '&dollar;0.47',
-    '&dollar;0.4m',
-    '&dollar;0.53',
     '&dollar;0.5357',
-    '&dollar;0.58',
-    '&dollar;0.5m',
-    '&dollar;0.6',
-    '&dollar;0.61',
-    '&dollar;0.62',
-    '&dollar;0.64',
-    '&dollar;0.71',
-    '&dollar;0.72',
-    '&dollar;0.75',
-    '&dollar;0.79',
-    '&dollar;0.89',
-    '&dollar;0.96',
-    '&dollar;0.99',
-    '&dollar;1&frac12',
-    '&dollar;1&frac34',
     '&dollar;1,006m',
-    '&dollar;1,030m',
-    '&dollar;1,050',
-    '&dollar;1,059m',
-    '&dollar;1,087m',
-    '&dollar;1,096',
-    '&dollar;1,134m',
-    '&dollar;1,141.3m',
-    '&dollar;1,250,000',
-    '&dollar;1,330',
-    '&dollar;1,355',
-    '&dollar;1,400,000',
-    '&dollar;1,445,900',
-    '&dollar;1,450',
-    '&dollar;1,460',
-    '&dollar;1,500,000',
     '&dollar;1,570',
-    '&dollar;1,580',
-    '&dollar;1,600,000',
-    '&dollar;1,620',
-    '&dollar;1,630',
-    '&dollar;1,650m',
-    '&dollar;1,657',
-    '&dollar;1,660m',
-    '&dollar;1,680,000',
-    '&dollar;1,700,000',
-    '&dollar;1,771m',
-    '&dollar;1,870',
-    '&dollar;1,907m',
-    '&dollar;1,950',
-    '&dollar;1.00=1,000',
-    '&dollar;1.00=1,250',
     '&dollar;1.03',
-    '&dollar;1.04',
-    '&dollar;1.06',
-    '&dollar;1.08',
-    '&dollar;1.1&ndash;1.5m',
-    '&dollar;1.104',
-    '&dollar;1.125',
-    '&dollar;1.1billion',
-    '&dollar;1.1bn',
-    '&dollar;1.20',
-    '&dollar;1.23',
-    '&dollar;1.2bn',
-    '&dollar;1.4&ndash;1.8',
-    '&dollar;1.4345',
-    '&dollar;1.4560',
-    '&dollar;1.46',
     '&dollar;1.5&ndash;2',
-    '&dollar;1.5510',
-    '&dollar;1.5585',
-    '&dollar;1.58',
-    '&dollar;1.59',
-    '&dollar;1.6102',
-    '&dollar;1.67',
-    '&dollar;1.75m',
-    '&dollar;1.8&ndash;2.5',
-    '&dollar;1.8bn',
-    '&dollar;1.98',
-    '&dollar;1.9bn',
-    '&dollar;10,000&ndash;15,000',
-    '&dollar;10,100',
-    '&dollar;10,255',
-    '&dollar;10,300',
     '&dollar;10,425',
-    '&dollar;10,600',
-    '&dollar;10-million',
-    '&dollar;10.00',
-    '&dollar;10.8',
-    '&dollar;10.95',
-    '&dollar;100.4',
-    '&dollar;100m-a-year',
-    '&dollar;100m-plus',
-    '&dollar;100m-worth',
-    '&dollar;101.8m',
-    '&dollar;102',
-    '&dollar;102.6m',
-    '&dollar;102.7m',
-    '&dollar;102m',
-    '&dollar;103m',
     '&dollar;104',
-    '&dollar;104,000',
-    '&dollar;105',
-    '&dollar;105,000,000',
-    '&dollar;105,475',
-    '&dollar;105m',
-    '&dollar;106m',
-    '&dollar;107,522',
-    '&dollar;108.6m',
-    '&dollar;108m',
-    '&dollar;109,000',
-    '&dollar;10m-a-year',
-    '&dollar;10m-worth',
-    '&dollar;11,100',
-    '&dollar;11,130',
-    '&dollar;11,200',
     '&dollar;11,250',
-    '&dollar;11,570',
-    '&dollar;11,627',
-    '&dollar;11,900',
-    '&dollar;11,901',
-    '&dollar;11.1',
-    '&dollar;11.4',
-    '&dollar;11.9',
-    '&dollar;111m',
-    '&dollar;112',
-    '&dollar;112,800,000',
-    '&dollar;112.6m',
-    '&dollar;113.1m',
-    '&dollar;114,000',
-    '&dollar;114.8m',
-    '&dollar;116,000',
     '&dollar;116,000,000',
-    '&dollar;117.3m',
-    '&dollar;117m',
-    '&dollar;118',
-    '&dollar;118m',
-    '&dollar;119',
-    '&dollar;119,300',
-    '&dollar;12,272',
-    '&dollar;12,500,000',
-    '&dollar;12,900m',
-    '&dollar;12,950',
-    '&dollar;12.8billion',
-    '&dollar;12.9',
-    '&dollar;121',
-    '&dollar;122',
-    '&dollar;122,180',
     '&dollar;123,000',
-    '&dollar;124,000',
-    '&dollar;126',
-    '&dollar;127m',
-    '&dollar;128',
-    '&dollar;129',
-    '&dollar;129.0m',
-    '&dollar;129.6m',
-    '&dollar;13,000m',
-    '&dollar;13,490',
-    '&dollar;13.25',
-    '&dollar;13.5',
-    '&dollar;13.7m',
-    '&dollar;130,000',
-    '&dollar;130,000,000',
-    '&dollar;1300',
     '&dollar;131',
-    '&dollar;132,000',
-    '&dollar;132m',
-    '&dollar;133',
-    '&dollar;133.1m',
-    '&dollar;135',
-    '&dollar;135.0m',
-    '&dollar;136,000',
-    '&dollar;136,000,000',
-    '&dollar;138,000',
-    '&dollar;138m',
-    '&dollar;14,000m-a-year',
-    '&dollar;14,300',
-    '&dollar;14,425',
-    '&dollar;14,790',
-    '&dollar;14,900',
     '&dollar;14.0m',
-    '&dollar;14.1m',
-    '&dollar;14.2',
-    '&dollar;14.25',
-    '&dollar;14.2m',
-    '&dollar;14.3m',
-    '&dollar;14.7',
-    '&dollar;141',
-    '&dollar;141.4m',
-    '&dollar;142.3m',
-    '&dollar;144.5m',
-    '&dollar;145.2m',
-    '&dollar;147,000,000',
-    '&dollar;147,800',
-    '&dollar;15&ndash;20,000',
-    '&dollar;15,719m',
     '&dollar;15.0m',
-    '&dollar;15.37',
-    '&dollar;15.3m',
-    '&dollar;15.5',
-    '&dollar;15.9m',
-    '&dollar;150&ndash;200',
-    '&dollar;150&ndash;220,000',
-    '&dollar;151,544',
-    '&dollar;151.3m',
-    '&dollar;154',
-    '&dollar;154,000',
-    '&dollar;154m',
-    '&dollar;155,000',
-    '&dollar;156',
-    '&dollar;159,000',
-    '&dollar;159,900',
     '&dollar;159.5m',
-    '&dollar;16,500',
-    '&dollar;16,667',
-    '&dollar;16,690',
-    '&dollar;16.1m',
-    '&dollar;16.2m',
-    '&dollar;16.3',
-    '&dollar;16.4',
-    '&dollar;16.6m',
-    '&dollar;16.95',
-    '&dollar;16.9m',
-    '&dollar;162,000',
-    '&dollar;162.2m',
-    '&dollar;17.0m',
-    '&dollar;17.25m',
-    '&dollar;17.3',
     '&dollar;17.5',
-    '&dollar;17.50',
-    '&dollar;17.73',
-    '&dollar;17.8',
-    '&dollar;17.9',
-    '&dollar;17.95',
-    '&dollar;170,000,000',
-    '&dollar;171,000',
-    '&dollar;171.6m',
-    '&dollar;171m',
-    '&dollar;172m',
-    '&dollar;173m',
-    '&dollar;175,000,000',
-    '&dollar;176',
-    '&dollar;176.2m',
-    '&dollar;177.7m',
     '&dollar;178,500',
-    '&dollar;18,000m',
-    '&dollar;18,600',
-    '&dollar;18,700m',
-    '&dollar;18.7m',
-    '&dollar;18.89',
-    '&dollar;18.95',
-    '&dollar;18.9m',
-    '&dollar;180&ndash;270,000',
-    '&dollar;180,000&ndash;220,000',
-    '&dollar;182.6m',
-    '&dollar;183,000',
-    '&dollar;185,000',
-    '&dollar;186m',
-    '&dollar;18bn',
-    '&dollar;19,000,000',
     '&dollar;19.1m',
-    '&dollar;19.2m',
-    '&dollar;19.3m',
-    '&dollar;19.5m',
-    '&dollar;19.8m',
-    '&dollar;19.9m',
-    '&dollar;195m',
-    '&dollar;196.2m',
-    '&dollar;198,000',
-    '&dollar;198,900',
-    '&dollar;1m-plus',
-    '&dollar;1m-worth',
-    '&dollar;1m.',
-    '&dollar;2&frac12',
-    '&dollar;2,000&ndash;3,000',
-    '&dollar;2,050',
     '&dollar;2,360m',
-    '&dollar;2,520m',
-    '&dollar;2,650',
-    '&dollar;2,650m',
-    '&dollar;2,675',
-    '&dollar;2,750',
-    '&dollar;2,787',
-    '&dollar;2,870',
-    '&dollar;2,950',
-    '&dollar;2,970',
-    '&dollar;2.09',
-    '&dollar;2.18',
-    '&dollar;2.24',
-    '&dollar;2.25m',
-    '&dollar;2.35',
-    '&dollar;2.59',
     '&dollar;2.5bn',
-    '&dollar;2.75',
-    '&dollar;2.9',
-    '&dollar;2.95m',
-    '&dollar;20&ndash;25,000',
-    '&dollar;20,745',
-    '&dollar;20.0m',
-    '&dollar;20.3',
-    '&dollar;20.3m',
-    '&dollar;20.4',
-    '&dollar;20.6',
-    '&dollar;20.6m',
-    '&dollar;20.8m',
-    '&dollar;20.9',
-    '&dollar;200,000&ndash;250,000',
-    '&dollar;200.',
     '&dollar;201',
-    '&dollar;201,000',
-    '&dollar;204,000',
-    '&dollar;208,000',
-    '&dollar;21,000,000',
-    '&dollar;21,790',
-    '&dollar;21.0m',
-    '&dollar;21.1',
-    '&dollar;21.75',
-    '&dollar;21.7m',
-    '&dollar;21.8m',
-    '&dollar;210&ndash;265,000',
-    '&dollar;212m',
-    '&dollar;215',
-    '&dollar;215,000',
-    '&dollar;217',
     '&dollar;22,600',
-    '&dollar;22,745',
-    '&dollar;22.1m',
-    '&dollar;22.5',
-    '&dollar;22.6m',
-    '&dollar;23,068',
-    '&dollar;23,200',
-    '&dollar;23.50',
-    '&dollar;230',
-    '&dollar;230.2m',
-    '&dollar;231m',
-    '&dollar;234,000',
-    '&dollar;235.2m',
-    '&dollar;238,500,000',
-    '&dollar;24,745',
-    '&dollar;24.2',
     '&dollar;24.6m',
-    '&dollar;247,000',
-    '&dollar;25,070',
-    '&dollar;25,600,000',
-    '&dollar;25.3m',
-    '&dollar;25000',
-    '&dollar;253m',
-    '&dollar;256.4m',
-    '&dollar;258m',
-    '&dollar;25bn',
-    '&dollar;26&ndash;34,000',
-    '&dollar;26,700',
-    '&dollar;26.0m',
-    '&dollar;26.4',
-    '&dollar;26.5',
-    '&dollar;26.50',
     '&dollar;26.5m',
-    '&dollar;26.6m',
-    '&dollar;260,000,000',
-    '&dollar;265&ndash;350,000',
-    '&dollar;265m',
-    '&dollar;267.4m',
-    '&dollar;27.0m',
-    '&dollar;27.375',
-    '&dollar;27.8m',
-    '&dollar;270',
-    '&dollar;270&ndash;360,000',
-    '&dollar;270,000,000',
-    '&dollar;271,360',
-    '&dollar;272,000',
-    '&dollar;278,000',
-    '&dollar;28,500',
     '&dollar;28.2m',
-    '&dollar;28.5m',
-    '&dollar;28.7m',
-    '&dollar;28.8m',
-    '&dollar;280,000,000',
-    '&dollar;280,900',
-    '&dollar;281,000',
-    '&dollar;282.0m',
-    '&dollar;283,000',
-    '&dollar;283m',
-    '&dollar;284,000',
-    '&dollar;285,000,000',
-    '&dollar;288,000',
-    '&dollar;289,000',
-    '&dollar;29,000m',
-    '&dollar;29,200&ndash;43,800',
     '&dollar;29,900',
-    '&dollar;29.1m',
-    '&dollar;29.4m',
-    '&dollar;29.6m',
-    '&dollar;29.7',
-    '&dollar;29.9m',
-    '&dollar;290m',
-    '&dollar;293',
-    '&dollar;295,000',
-    '&dollar;296,000',
-    '&dollar;298m',
-    '&dollar;3,048.1m',
-    '&dollar;3,080',
-    '&dollar;3,200m',
-    '&dollar;3,370',
-    '&dollar;3,375',
     '&dollar;3,625m',
-    '&dollar;3,875',
-    '&dollar;3.20',
-    '&dollar;3.25m',
-    '&dollar;3.35',
-    '&dollar;3.55',
-    '&dollar;3.65bn',
-    '&dollar;3.80',
-    '&dollar;3.92',
-    '&dollar;30&ndash;40,000',
-    '&dollar;30&ndash;50,000',
-    '&dollar;30,000&ndash;50,000',
-    '&dollar;30,500',
-    '&dollar;30.1m',
-    '&dollar;300-million',
-    '&dollar;304,000',
     '&dollar;305,000',
-    '&dollar;308m',
-    '&dollar;30bn',
-    '&dollar;31,000',
-    '&dollar;31.3m',
-    '&dollar;31.6m',
-    '&dollar;31.75',
-    '&dollar;312,000',
-    '&dollar;313',
-    '&dollar;315&ndash;385,000',
-    '&dollar;315&ndash;440,000',
-    '&dollar;315,000',
-    '&dollar;318,100',
-    '&dollar;32,200,000',
-    '&dollar;32.375',
-    '&dollar;32.3m',
     '&dollar;32.4m',
-    '&dollar;32.5m',
-    '&dollar;320',
-    '&dollar;320m',
-    '&dollar;321,100',
-    '&dollar;322m',
-    '&dollar;33,000',
-    '&dollar;33,745',
-    '&dollar;33.1m',
-    '&dollar;33.3m',
-    '&dollar;33.4m',
-    '&dollar;33.6m',
-    '&dollar;330,000',
-    '&dollar;3300',
-    '&dollar;331.1m',
-    '&dollar;335',
     '&dollar;335,000',
-    '&dollar;338m',
-    '&dollar;339',
-    '&dollar;34,500',
-    '&dollar;34.4m',
-    '&dollar;34.7m',
-    '&dollar;340m',
-    '&dollar;345',
-    '&dollar;347.0m',
-    '&dollar;349,800',
-    '&dollar;35.1m',
-    '&dollar;35.2m',
-    '&dollar;35.4m',
-    '&dollar;35.7m',
-    '&dollar;35.8m',
-    '&dollar;351,000',
     '&dollar;354,000',
-    '&dollar;356',
-    '&dollar;358',
-    '&dollar;35billion',
-    '&dollar;36,500',
-    '&dollar;36,700',
-    '&dollar;36.50',
-    '&dollar;36.7m',
-    '&dollar;36.9m',
-    '&dollar;360&ndash;540,000',
-    '&dollar;362,000',
-    '&dollar;365,000',
-    '&dollar;365m',
-    '&dollar;368,000',
-    '&dollar;37,100&ndash;55,700',
-    '&dollar;37.9m',
     '&dollar;370',
-    '&dollar;370.1m',
-    '&dollar;374,000',
-    '&dollar;378,885,900',
-    '&dollar;38.5m',
-    '&dollar;380,000,000',
-    '&dollar;380m',
-    '&dollar;381,000',
-    '&dollar;383',
-    '&dollar;385m',
-    '&dollar;389,000',
-    '&dollar;39,300',
-    '&dollar;39.50',
-    '&dollar;39.5m',
-    '&dollar;39.7m',
-    '&dollar;39.95',
     '&dollar;393',
-    '&dollar;394',
-    '&dollar;395',
-    '&dollar;399,000',
-    '&dollar;4,100m',
-    '&dollar;4,120m',
-    '&dollar;4,150',
-    '&dollar;4,183m',
-    '&dollar;4,450',
-    '&dollar;4,690',
-    '&dollar;4,700m',
-    '&dollar;4,950',
-    '&dollar;4.00',
-    '&dollar;4.1',
-    '&dollar;4.2',
-    '&dollar;4.25',
     '&dollar;4.375',
-    '&dollar;4.4',
-    '&dollar;4.8',
-    '&dollar;4.875',
-    '&dollar;4.8bn',
-    '&dollar;4.9',
-    '&dollar;40&ndash;50,000',
-    '&dollar;40,500',
-    '&dollar;40.1m',
-    '&dollar;40.3',
-    '&dollar;40.7',
-    '&dollar;40000',
-    '&dollar;400000',
-    '&dollar;402,000',
-    '&dollar;409m',
-    '&dollar;40billion',
     '&dollar;40m-a-year',
-    '&dollar;40million',
-    '&dollar;41.1m',
-    '&dollar;41.3m',
-    '&dollar;410',
-    '&dollar;410,000',
-    '&dollar;413',
-    '&dollar;42.1m',
-    '&dollar;42.6m',
-    '&dollar;42.7m',
-    '&dollar;42.88bn',
-    '&dollar;420',
-    '&dollar;420m',
-    '&dollar;425',
-    '&dollar;429,000',
-    '&dollar;42bn',
     '&dollar;43',
-    '&dollar;43.2m',
-    '&dollar;43.4m',
-    '&dollar;43.5m',
-    '&dollar;43.7m',
-    '&dollar;43.9m',
-    '&dollar;430',
-    '&dollar;434,000,000',
-    '&dollar;435,000',
-    '&dollar;439,000',
-    '&dollar;44,400',
-    '&dollar;44.2m',
-    '&dollar;44.5m',
-    '&dollar;440m',
-    '&dollar;442,000',
-    '&dollar;44m',
     '&dollar;45,745',
-    '&dollar;45.5m',
-    '&dollar;45.6m',
-    '&dollar;450&ndash;630,000',
-    '&dollar;450,000,000',
-    '&dollar;455m',
-    '&dollar;45bn',
-    '&dollar;46,100',
-    '&dollar;46,700',
-    '&dollar;46.3m',
-    '&dollar;460',
-    '&dollar;461,000',
-    '&dollar;464.8m',
-    '&dollar;465',
-    '&dollar;465,000',
-    '&dollar;466m',
     '&dollar;47.3m',
-    '&dollar;47.88',
-    '&dollar;470,000',
-    '&dollar;475m',
-    '&dollar;477m',
-    '&dollar;48,500',
-    '&dollar;48.0m',
-    '&dollar;48.5m',
-    '&dollar;48.7m',
-    '&dollar;481,000,000',
-    '&dollar;482',
-    '&dollar;4820.27',
-    '&dollar;5,000&ndash;7,000',
-    '&dollar;5,096m',
-    '&dollar;5,200,000',
-    '&dollar;5,272',
     '&dollar;5,370m',
-    '&dollar;5,440m',
-    '&dollar;5,450',
-    '&dollar;5,550',
-    '&dollar;5,641m',
-    '&dollar;5,740m',
-    '&dollar;5,835',
-    '&dollar;5,900',
-    '&dollar;5,950',
-    '&dollar;5,990',
-    '&dollar;5,995',
-    '&dollar;5-&dollar;10',
-    '&dollar;5-million',
-    '&dollar;5.3bn',
-    '&dollar;5.8',
-    '&dollar;50,000&ndash;70,000',
     '&dollar;50-million',
-    '&dollar;500&ndash;700',
-    '&dollar;500,000&ndash;600,000',
-    '&dollar;500.',
-    '&dollar;50million',
-    '&dollar;51,300',
-    '&dollar;51.25',
-    '&dollar;51.4',
-    '&dollar;51.5m',
-    '&dollar;51.6m',
-    '&dollar;510m',
-    '&dollar;52,000',
-    '&dollar;52.7m',
-    '&dollar;520',
-    '&dollar;524',
-    '&dollar;525',
     '&dollar;53',
-    '&dollar;530&ndash;700,000',
-    '&dollar;530,000,000',
-    '&dollar;531,000',
-    '&dollar;538,000',
-    '&dollar;54,000,000',
-    '&dollar;54.5m',
-    '&dollar;54.7m',
-    '&dollar;540,000,000',
-    '&dollar;547.1m',
-    '&dollar;55&ndash;73,000',
-    '&dollar;55,800&ndash;83,800',
-    '&dollar;55.2m',
-    '&dollar;55.3m',
-    '&dollar;550,000',
-    '&dollar;552,000',
     '&dollar;559,000',
-    '&dollar;56',
-    '&dollar;56.9m',
-    '&dollar;560m',
-    '&dollar;565m',
-    '&dollar;57,000',
-    '&dollar;57,500',
-    '&dollar;57.2m',
-    '&dollar;57.3m',
-    '&dollar;570,000',
-    '&dollar;58.3m',
-    '&dollar;580,000',
-    '&dollar;587,000',
-    '&dollar;59.5',
-    '&dollar;59.50',
-    '&dollar;590,000',
     '&dollar;594,000',
-    '&dollar;59m',
-    '&dollar;6,000,000',
-    '&dollar;6,040',
-    '&dollar;6,400',
-    '&dollar;6,500m',
-    '&dollar;6,618',
-    '&dollar;6,643',
-    '&dollar;6,880',
-    '&dollar;6.75billion',
-    '&dollar;6.8bn',
-    '&dollar;6.9',
-    '&dollar;60,000m',
-    '&dollar;600.1m',
-    '&dollar;603,000',
-    '&dollar;608.0m',
     '&dollar;60billion',
-    '&dollar;61,200&ndash;92,000',
-    '&dollar;61.7m',
-    '&dollar;62',
-    '&dollar;62,180',
-    '&dollar;62.2m',
-    '&dollar;62million',
-    '&dollar;63.2m',
-    '&dollar;630,000,000',
-    '&dollar;633',
-    '&dollar;635m',
-    '&dollar;637',
-    '&dollar;640,000',
-    '&dollar;640m',
-    '&dollar;6482.00',
-    '&dollar;64m',
     '&dollar;656,000',
-    '&dollar;66,000,000',
-    '&dollar;66.6m',
-    '&dollar;660',
-    '&dollar;6600',
-    '&dollar;663',
-    '&dollar;667,865',
-    '&dollar;66m',
-    '&dollar;67.7m',
-    '&dollar;674,000',
-    '&dollar;675,000',
-    '&dollar;67m',
-    '&dollar;68.5m',
-    '&dollar;680,000',
-    '&dollar;680m',
-    '&dollar;683,000,000',
     '&dollar;685,000',
-    '&dollar;688',
-    '&dollar;689,000',
-    '&dollar;69.2m',
-    '&dollar;697,000',
-    '&dollar;699.4m',
-    '&dollar;6billion',
-    '&dollar;6bn',
-    '&dollar;7&ndash;10,000',
-    '&dollar;7,020m',
-    '&dollar;7,100',
-    '&dollar;7,250',
-    '&dollar;7,400',
-    '&dollar;7,600',
-    '&dollar;7,625',
-    '&dollar;7,700',
     '&dollar;7,896m',
-    '&dollar;7,900',
-    '&dollar;7,900m',
-    '&dollar;7.7',
-    '&dollar;7.725m',
-    '&dollar;7.75',
-    '&dollar;70.6',
-    '&dollar;70.6m',
-    '&dollar;700&ndash;900,000',
-    '&dollar;700million',
-    '&dollar;705.6m',
-    '&dollar;71,750',
-    '&dollar;71.1m',
-    '&dollar;71.5m',
-    '&dollar;715,000',
-    '&dollar;72,000',
     '&dollar;72,000,000',
-    '&dollar;72.2m',
-    '&dollar;725,000',
-    '&dollar;727,000',
-    '&dollar;73',
-    '&dollar;73.6m',
-    '&dollar;735',
-    '&dollar;74.9m',
-    '&dollar;740',
-    '&dollar;740,000',
-    '&dollar;744,000',
-    '&dollar;75,000,000',
-    '&dollar;75,300',
-    '&dollar;75,700',
-    '&dollar;75.6m',
-    '&dollar;750000',
     '&dollar;76,500',
-    '&dollar;76,500&ndash;122,000',
-    '&dollar;760',
-    '&dollar;76m',
-    '&dollar;77,000',
-    '&dollar;770,000',
-    '&dollar;770m',
-    '&dollar;78',
-    '&dollar;78,000',
-    '&dollar;785m',
-    '&dollar;789m',
-    '&dollar;790,000',
-    '&dollar;795,000',
-    '&dollar;7billion',
-    '&dollar;8&ndash;10',
-    '&dollar;8&ndash;10,000',
     '&dollar;8&ndash;12,000',
-    '&dollar;8,000m',
-    '&dollar;8,500m',
-    '&dollar;8,696m',
-    '&dollar;8.00',
-    '&dollar;8.125',
-    '&dollar;8.2',
-    '&dollar;8.50',
-    '&dollar;8.8',
-    '&dollar;8.9',
-    '&dollar;80,000&ndash;120,000',
-    '&dollar;80.6m',
-    '&dollar;800,000&ndash;1,000,000',
-    '&dollar;800,000&ndash;1,200,000',
-    '&dollar;82,500,000',
-    '&dollar;82.6m',
     '&dollar;820,000',
-    '&dollar;820m',
-    '&dollar;83',
-    '&dollar;84',
-    '&dollar;84.1m',
-    '&dollar;840,000',
-    '&dollar;843',
-    '&dollar;847m',
-    '&dollar;85.8m',
-    '&dollar;850,000,000',
-    '&dollar;853',
-    '&dollar;858,000',
-    '&dollar;86,000',
-    '&dollar;860,000',
-    '&dollar;87',
-    '&dollar;87,000',
     '&dollar;87.2m',
-    '&dollar;87.4m',
-    '&dollar;870m',
-    '&dollar;872,000',
-    '&dollar;875',
-    '&dollar;875,000',
-    '&dollar;88,000',
-    '&dollar;88.7m',
-    '&dollar;880',
-    '&dollar;883m',
-    '&dollar;886,000',
-    '&dollar;890,000',
-    '&dollar;895',
-    '&dollar;9,000m',
-    '&dollar;9,250',
-    '&dollar;9,669m',
     '&dollar;9.00',
-    '&dollar;9.0m',
-    '&dollar;9.2m',
-    '&dollar;9.3',
-    '&dollar;9.4m',
-    '&dollar;9.50',
-    '&dollar;9.7',
-    '&dollar;90-a-share',
-    '&dollar;9000',
-    '&dollar;905',
-    '&dollar;91,000',
-    '&dollar;91,000,000',
-    '&dollar;92,000',
-    '&dollar;92.3m',
-    '&dollar;92.5m',
-    '&dollar;92m',
     '&dollar;93,200',
-    '&dollar;933,000',
-    '&dollar;935m',
-    '&dollar;94.6m',
-    '&dollar;943m',
-    '&dollar;94m',
-    '&dollar;95.75',
-    '&dollar;95.7m',
-    '&dollar;96,000',
-    '&dollar;96,400',
-    '&dollar;960,000,000',
-    '&dollar;97',
-    '&dollar;97m',
-    '&dollar;982,000',
-    '&dollar;99.95',
-    '&dollar;990',
     '&dollar;990,000',
-    '&dollar;9bn',
-    '&dollar;b5',
-    '&dollar;e',
-    '&dollar;e&lsqb;1',
-    '&dollar;million',
-    '&dollar;o',
-    '&dollar;p&dollar;g',
-    '&dollar;run',
-    '&dollar;us600',
-    '&dollar;x',
-    '&dollar;xx',
-    '&dtrif',
-    '&eacute;cart&eacute',
-    '&eacute;chelon',
-    '&eacute;cologiste',
     '&eacute;cru',
-    '&eacute;narques',
-    '&eacute;owyn',
-    '&eacute;p&eacute;e',
-    '&eacute;p&eacute;es',
-    '&eacute;picerie',
-    '&eacute;pices',
-    '&eacute;puration',
-    '&eacute;tablissements',
-    '&eacute;trangere',
-    '&eacute;trangers',
-    '&eacute;trier',
-    '&eacute;tudiant',
-    '&eacute;tui',
-    '&eacute;v&eacute;nement',
-    '&equals',
     '&flat;6',
-    '&formula%',
-    '&formula&formula',
-    '&formula;c',
-    '&formula;in',
-    '&formula;n',
-    '&formula;p',
-    '&formula;voting',
-    '&frac12&amp;in',
-    '&frac12&deg',
-    '&frac12;-stone',
-    '&frac12;per',
-    '&frac13&amp;in',
-    '&frac14;in/5mm',
-    '&frac34&ndash;1',
-    '&frac34;lb',
     '&frac34;m',
-    '&frac34;oz',
-    '&frac34;pint',
-    '&frac34;pt',
-    '&frac78',
-    '&ggr;-&ggr;f',
-    '&ggr_',
-    '&gt;11',
-    '&gt;150',
-    '&gt;200',
-    '&gt;26',
-    '&gt;32',
-    '&gt;35',
-    '&gt;350000',
-    '&gt;4',
-    '&gt;400',
     '&gt;4000',
-    '&gt;75',
-    '&gt;75%',
-    '&gt;80',
-    '&gt;90%',
-    '&gt;99.999%',
-    '&gt;five',
-    '&gt=35',
-    '&gt=50.80',
-    '&gt=8',
-    '&hellip',
-    '&igr',
-    '&iquest;cada',
-    '&iquest;qu&eacute',
-    '&le',
-    '&le;10%',
     '&le;2',
-    '&le;20',
-    '&le;4',
-    '&lgr;gt11',
-    '&lgr;pt2',
-    '&lgr;zap',
-    '&lowbar&lowbar',
-    '&lsqb;a&rsqb;lthough',
-    '&lsqb;e&rsqb;ven',
-    '&lsqb;i&rsqb;n',
-    '&lt;-1.8',
-    '&lt;0.02&ndash;1.26',
-    '&lt;0.1&ndash;0.6',
-    '&lt;11.5',
-    '&lt;110',
-    '&lt;130%ibw',
     '&lt;19',
-    '&lt;2.4&ndash;23',
-    '&lt;30%',
-    '&lt;300',
-    '&lt;6&ndash;28',
-    '&lt;9.5',
-    '&lt;b&gt',
-    '&lt;caps',
-    '&lt;cr&gt',
-    '&lt;ctrl&gt',
-    '&lt;del&gt;kill',
-    '&lt;dev&gt',
-    '&lt;device',
-    '&lt;device&gt&lt;directory&gt*.fil',
-    '&lt;f2&gt',
-    '&lt;for',
     '&lt;his/your&gt',
-    '&lt;k',
-    '&lt;keyword',
-    '&lt;run&gt',
-    '&lt;save&gt',
-    '&lt;shift&gt/&lt;esc&gt',
-    '&lt;three-letter',
-    '&lt;volume',
-    '&lt;we&gt',
-    '&lt=80%',
-    '&mdash;0.5',
-    '&mdash;122',
-    '&mdash;193',
-    '&mdash;245',
-    '&mdash;252',
-    '&mdash;253',
     '&mdash;4pm',
-    '&mdash;acting',
-    '&mdash;appeared',
-    '&mdash;by',
-    '&mdash;coexistence',
-    '&mdash;currently',
-    '&mdash;czechoslovak',
-    '&mdash;darlington',
-    '&mdash;democratic',
-    '&mdash;does',
-    '&mdash;enshrined',
-    '&mdash;especially',
-    '&mdash;following',
-    '&mdash;four',
-    '&mdash;has',
-    '&mdash;ie',
     '&mdash;itself',
-    '&mdash;mainly',
-    '&mdash;middlesbrough',
-    '&mdash;milia',
-    '&mdash;minister',
-    '&mdash;more',
-    '&mdash;nearly',
-    '&mdash;news',
-    '&mdash;not&mdash',
-    '&mdash;popularly',
-    '&mdash;right',
-    '&mdash;that&mdash',
-    '&mdash;these',
-    '&mdash;things',
-    '&mdash;through',
-    '&mdash;u',
     '&mdash;used',
-    '&mdash;western',
-    '&mdash;while',
-    '&mdash;whose',
-    '&mdash;you',
-    '&micro&sim',
-    '&micro/ml',
-    '&micro;ci/',
-    '&micro;ci/g',
-    '&micro;ci/litre',
-    '&micro;g/24',
-    '&micro;g/kg/hr',
-    '&micro;g/kg/min',
-    '&micro;g/mgw',
-    '&micro;g/min',
-    '&micro;g/ml.',
     '&micro;mol/kg/24',
-    '&ndash;.',
-    '&ndash;1515',
-    '&ndash;1573',
-    '&ndash;21',
-    '&ndash;50%',
-    '&ndash;9',
-    '&ndash;a',
-    '&ndash;c',
-    '&ndash;conservation',
-    '&ndash;heir',
-    '&ndash;how',
-    '&ndash;in',
-    '&ndash;new&ndash;regional',
-    '&ndash;no',
-    '&ndash;oct.',
     '&ndash;sleeping',
-    '&ndash;special',
-    '&ndash;this',
-    '&ndash;unctions',
-    '&ndash;vas',
-    '&ngr\'=',
-    '&num;1',
-    '&oslash;stland',
-    '&ouml;rebro',
-    '&pgr*',
-    '&plus/',
-    '&plus;0.042',
-    '&plus;0.094',
-    '&plus;0.219',
-    '&plus;0.482',
-    '&plus;10',
     '&plusmn;0.2',
-    '&plusmn;21db',
-    '&pound&frac14',
-    '&pound&frac38',
-    '&pound/&dollar',
-    '&pound;.45',
-    '&pound;0.13bn',
-    '&pound;0.1m',
-    '&pound;0.2',
-    '&pound;0.21bn',
-    '&pound;0.25',
-    '&pound;0.48p',
-    '&pound;0.75',
-    '&pound;0.7m',
-    '&pound;0.8',
-    '&pound;0.8m',
     '&pound;1&ndash&pound;2',
-    '&pound;1,000-a-night',
-    '&pound;1,000.',
-    '&pound;1,001',
-    '&pound;1,012',
-    '&pound;1,020,545',
-    '&pound;1,025',
-    '&pound;1,029',
-    '&pound;1,030',
-    '&pound;1,045,000',
-    '&pound;1,048',
-    '&pound;1,082',
-    '&pound;1,085',
-    '&pound;1,092',
-    '&pound;1,095,890',
-    '&pound;1,100,000',
     '&pound;1,118',
-    '&pound;1,125',
-    '&pound;1,135',
-    '&pound;1,150,000',
-    '&pound;1,155',
-    '&pound;1,155,2507',
-    '&pound;1,160',
-    '&pound;1,178',
-    '&pound;1,190',
-    '&pound;1,200m',
-    '&pound;1,227',
-    '&pound;1,228million',
-    '&pound;1,230',
-    '&pound;1,249',
-    '&pound;1,287m',
-    '&pound;1,290',
     '&pound;1,305',
-    '&pound;1,310',
-    '&pound;1,314',
-    '&pound;1,340',
-    '&pound;1,365',
-    '&pound;1,370',
-    '&pound;1,380',
-    '&pound;1,400,000',
-    '&pound;1,430',
-    '&pound;1,460',
-    '&pound;1,470',
-    '&pound;1,500&ndash&pound;2,000',
-    '&pound;1,500&ndash;2,500',
-    '&pound;1,600,000',
-    '&pound;1,624',
-    '&pound;1,625',
     '&pound;1,638',
-    '&pound;1,640',
-    '&pound;1,650,000',
-    '&pound;1,680',
-    '&pound;1,725',
-    '&pound;1,740',
-    '&pound;1,760',
-    '&pound;1,770',
-    '&pound;1,780',
-    '&pound;1,800,000',
-    '&pound;1,810',
-    '&pound;1,833',
-    '&pound;1,870,000',
-    '&pound;1,870m',
-    '&pound;1,876',
-    '&pound;1,886',
     '&pound;1,940',
-    '&pound;1,958',
-    '&pound;1,970m',
-    '&pound;1,999',
-    '&pound;1.013m',
-    '&pound;1.02',
-    '&pound;1.02bn',
-    '&pound;1.05p',
-    '&pound;1.06billion',
-    '&pound;1.07',
-    '&pound;1.08m',
-    '&pound;1.12bn',
-    '&pound;1.14m',
-    '&pound;1.16',
-    '&pound;1.19/200ml',
-    '&pound;1.2&ndash;1.6',
     '&pound;1.22',
-    '&pound;1.236m',
-    '&pound;1.239m',
-    '&pound;1.25m.',
-    '&pound;1.25p',
-    '&pound;1.27m',
-    '&pound;1.28',
-    '&pound;1.28m',
-    '&pound;1.2m.',
-    '&pound;1.31',
-    '&pound;1.33&ndash;2',
-    '&pound;1.33m',
-    '&pound;1.34m',
-    '&pound;1.35m',
-    '&pound;1.36',
-    '&pound;1.36billion',
     '&pound;1.37bn',
-    '&pound;1.38m',
-    '&pound;1.3m.',
-    '&pound;1.41',
-    '&pound;1.42',
-    '&pound;1.43m',
-    '&pound;1.45m',
-    '&pound;1.48',
-    '&pound;1.4billion',
-    '&pound;1.4million',
-    '&pound;1.57',
-    '&pound;1.58',
-    '&pound;1.59/100ml',
-    '&pound;1.5m-rated',
-    '&pound;1.6&ndash;2.2',
-    '&pound;1.61',
     '&pound;1.68m',
-    '&pound;1.6billion',
-    '&pound;1.712',
-    '&pound;1.71m',
-    '&pound;1.73',
-    '&pound;1.754',
-    '&pound;1.78',
-    '&pound;1.792',
-    '&pound;1.79billion',
-    '&pound;1.83m',
-    '&pound;1.84m',
-    '&pound;1.86',
-    '&pound;1.88',
-    '&pound;1.92',
-    '&pound;1.95m',
-    '&pound;1.96m',
     '&pound;1.9million',
-    '&pound;10&ndash;15',
-    '&pound;10,243',
-    '&pound;10,534',
-    '&pound;10,750',
-    '&pound;10,890',
-    '&pound;10,990',
-    '&pound;10-worth',
-    '&pound;10.1',
-    '&pound;10.1bn',
-    '&pound;10.2m',
-    '&pound;10.30',
-    '&pound;10.6',
-    '&pound;10.63',
-    '&pound;10.78',
-    '&pound;10.7million',
     '&pound;10.85',
-    '&pound;100&ndash&pound;180',
-    '&pound;100&ndash;120,000',
-    '&pound;100,000&ndash;133,000',
-    '&pound;100,000-worth',
-    '&pound;1000&ndash&pound;10,000',
-    '&pound;1000000',
-    '&pound;101.70',
-    '&pound;102.6m',
-    '&pound;103bn',
-    '&pound;104,356.55',
-    '&pound;104.2m',
-    '&pound;104:12:0.',
-    '&pound;1050',
-    '&pound;107m',
-    '&pound;108,330',
     '&pound;108,994',
-    '&pound;109,000',
-    '&pound;1094',
-    '&pound;1095',
-    '&pound;1099.00',
-    '&pound;10billion',
-    '&pound;11&frac12;m',
-    '&pound;11&ndash;17,000',
-    '&pound;11,100',
-    '&pound;11,130',
-    '&pound;11,188',
-    '&pound;11,200',
-    '&pound;11,246',
-    '&pound;11,300',
-    '&pound;11,500&ndash&pound;12,500',
-    '&pound;11,566',
     '&pound;11,655',
-    '&pound;11,690',
-    '&pound;11,700',
-    '&pound;11,714,969',
-    '&pound;11,750',
-    '&pound;11,950',
-    '&pound;11.',
-    '&pound;11.20',
-    '&pound;11.4',
-    '&pound;11.55',
-    '&pound;11.7',
-    '&pound;11.70',
-    '&pound;11.75m',
-    '&pound;11.8',
-    '&pound;11/2',
-    '&pound;110.13s.4d.',
     '&pound;110.6m',
-    '&pound;1100',
-    '&pound;111,000',
-    '&pound;111,750',
-    '&pound;111,780',
-    '&pound;112,500',
-    '&pound;112.4m',
-    '&pound;1121532',
-    '&pound;113.6m',
-    '&pound;1135',
-    '&pound;114,000',
-    '&pound;114,533,413',
-    '&pound;1145',
-    '&pound;115&ndash;175,000',
-    '&pound;116,000,000',
-    '&pound;116,250',
     '&pound;116.1m',
-    '&pound;117.1m',
-    '&pound;117.46',
-    '&pound;117.50',
-    '&pound;117.95',
-    '&pound;117m',
-    '&pound;117m.',
-    '&pound;118&ndash&pound;268',
-    '&pound;118,757',
-    '&pound;11million',
-    '&pound;12&ndash&pound;14',
-    '&pound;12&ndash;14',
-    '&pound;12&ndash;16,000',
-    '&pound;12,100',
-    '&pound;12,300',
-    '&pound;12.',
     '&pound;12.20',
-    '&pound;12.2m',
-    '&pound;12.30',
-    '&pound;12.35m',
-    '&pound;12.40',
-    '&pound;12.49',
-    '&pound;12.50&pound;15&pound;15',
-    '&pound;12.6',
-    '&pound;12.70',
-    '&pound;12.8',
-    '&pound;12.94',
-    '&pound;120&ndash;180,000',
-    '&pound;120k',
-    '&pound;121.39',
-    '&pound;122,200',
-    '&pound;122m',
     '&pound;123.90',
-    '&pound;124.61',
-    '&pound;126.3m',
-    '&pound;126.5',
-    '&pound;126.50',
-    '&pound;1260',
-    '&pound;126m',
-    '&pound;127,759',
-    '&pound;128.45',
-    '&pound;128.7m',
-    '&pound;129,000',
-    '&pound;129,374',
-    '&pound;129,650',
-    '&pound;12m.',
-    '&pound;13,100',
-    '&pound;13,428',
     '&pound;13,600',
-    '&pound;13,840',
-    '&pound;13,950',
-    '&pound;13.00',
-    '&pound;13.1',
-    '&pound;13.13',
-    '&pound;13.6m',
-    '&pound;13.80',
-    '&pound;13.9',
-    '&pound;13.90',
-    '&pound;13.9million',
-    '&pound;130.00',
-    '&pound;130million',
-    '&pound;131,133',
-    '&pound;133,000',
-    '&pound;133.',
     '&pound;133.60',
-    '&pound;134.73',
-    '&pound;136,278',
-    '&pound;137,000',
-    '&pound;137million',
-    '&pound;138m',
-    '&pound;139.40',
-    '&pound;139.95',
-    '&pound;139.99',
-    '&pound;139m',
-    '&pound;13million',
-    '&pound;14&frac12;m',
-    '&pound;14,000-a-year',
-    '&pound;14,100',
-    '&pound;14,200',
-    '&pound;14,285',
     '&pound;14,300',
-    '&pound;14,350',
-    '&pound;14,400',
-    '&pound;14,630',
-    '&pound;14,800',
-    '&pound;14,850',
-    '&pound;14,971',
-    '&pound;14.25',
-    '&pound;14.29',
-    '&pound;14.6',
-    '&pound;14.8',
-    '&pound;14.8m',
-    '&pound;14.9',
-    '&pound;14.98',
-    '&pound;140,580',
-    '&pound;140.2m',
     '&pound;141,000',
-    '&pound;141,403',
-    '&pound;141.8',
-    '&pound;141m',
-    '&pound;1425',
-    '&pound;142m',
-    '&pound;143.5m',
-    '&pound;143.75',
-    '&pound;143million',
-    '&pound;145,000-added',
-    '&pound;145million',
-    '&pound;149+vat',
-    '&pound;15&ndash;20',
-    '&pound;15&ndash;25,000',
-    '&pound;15,000&ndash;20,000',
-    '&pound;15,000,000',
     '&pound;15,928',
-    '&pound;15.',
-    '&pound;15.1',
-    '&pound;15.20',
-    '&pound;15.3',
-    '&pound;15.5million',
-    '&pound;15.70',
-    '&pound;15.90',
-    '&pound;15/&pound;10/&pound;5/free',
-    '&pound;150&ndash;200',
-    '&pound;150,000,000',
-    '&pound;150,133',
-    '&pound;150-worth',
-    '&pound;15000',
-    '&pound;150000',
-    '&pound;152.75',
     '&pound;152.7m',
-    '&pound;152m',
-    '&pound;153m',
-    '&pound;154',
-    '&pound;154,000',
-    '&pound;154.60',
-    '&pound;154m',
-    '&pound;155,600',
-    '&pound;155million',
-    '&pound;156,450',
-    '&pound;157',
-    '&pound;157,500',
-    '&pound;157m',
-    '&pound;157million',
-    '&pound;159,500',
-    '&pound;15pp',
     '&pound;16,176',
-    '&pound;16,300',
-    '&pound;16,495',
-    '&pound;16,540',
-    '&pound;16,780',
-    '&pound;16,995',
-    '&pound;16.05',
-    '&pound;16.3',
-    '&pound;16.3m',
-    '&pound;16.4m',
-    '&pound;16.8',
-    '&pound;16.90',
-    '&pound;16.9million',
-    '&pound;160&ndash&pound;275',
-    '&pound;160,907',
-    '&pound;160.4',
     '&pound;160k',
-    '&pound;162m',
-    '&pound;163,000',
-    '&pound;1650',
-    '&pound;167m',
-    '&pound;169.00',
-    '&pound;17&frac12;m',
-    '&pound;17,000,000',
-    '&pound;17,675',
-    '&pound;17,699',
-    '&pound;17,850',
-    '&pound;17.3',
-    '&pound;17.40',
-    '&pound;17.45',
-    '&pound;17.4m',
-    '&pound;17.55',
     '&pound;17.5bn',
-    '&pound;17.75',
-    '&pound;17.80',
-    '&pound;17.90',
-    '&pound;170.00',
-    '&pound;170.75',
-    '&pound;171.72',
-    '&pound;171million',
-    '&pound;176,000',
-    '&pound;176.5million',
-    '&pound;177,000',
-    '&pound;1789',
-    '&pound;178m',
-    '&pound;179.99',
-    '&pound;1799',
-    '&pound;17bn',
     '&pound;18,000&ndash;25,000',
-    '&pound;18,060',
-    '&pound;18-&pound;20',
-    '&pound;18.',
-    '&pound;18.13',
-    '&pound;18.1m',
-    '&pound;18.20',
-    '&pound;18.2m',
-    '&pound;18.3',
-    '&pound;18.3m',
-    '&pound;18.4',
-    '&pound;18.40',
-    '&pound;18.49',
-    '&pound;18.65',
-    '&pound;180&ndash;220,000',
-    '&pound;180,000&ndash;200,000',
     '&pound;1800m',
-    '&pound;180million',
-    '&pound;181.7m',
-    '&pound;183,000',
-    '&pound;184,000',
-    '&pound;184.99',
-    '&pound;184m',
-    '&pound;185,500',
-    '&pound;187m',
-    '&pound;188,000',
-    '&pound;188m',
-    '&pound;19*',
-    '&pound;19,245',
-    '&pound;19,300&ndash;29,000',
-    '&pound;19,400',
-    '&pound;19,900',
     '&pound;19.25m',
-    '&pound;19.3',
-    '&pound;19.40',
-    '&pound;19.6',
-    '&pound;19.75',
-    '&pound;19.89',
-    '&pound;19.98',
-    '&pound;190,000,000',
-    '&pound;190.2m',
-    '&pound;191',
-    '&pound;191,000',
-    '&pound;192,000',
-    '&pound;193',
-    '&pound;193,000',
-    '&pound;193m',
-    '&pound;194',
     '&pound;194.2',
-    '&pound;195m',
-    '&pound;197,000',
-    '&pound;197,620',
-    '&pound;198',
-    '&pound;1995',
-    '&pound;1999',
-    '&pound;1:5',
-    '&pound;1and1/2',
-    '&pound;1o.5',
-    '&pound;2&ndash;10&ndash;0',
-    '&pound;2&ndash;3,000',
-    '&pound;2,000-to-the-winner',
-    '&pound;2,000-worth',
-    '&pound;2,008,137.60p',
-    '&pound;2,011,500',
     '&pound;2,029',
-    '&pound;2,077',
-    '&pound;2,104',
-    '&pound;2,150',
-    '&pound;2,170',
-    '&pound;2,171,912',
-    '&pound;2,250,000',
-    '&pound;2,260',
-    '&pound;2,30',
-    '&pound;2,310',
-    '&pound;2,325',
-    '&pound;2,406.41',
-    '&pound;2,420',
-    '&pound;2,439',
-    '&pound;2,475',
-    '&pound;2,477.9m',
     '&pound;2,50',
-    '&pound;2,500&ndash;3,500',
-    '&pound;2,500-a-night',
-    '&pound;2,500-a-term',
-    '&pound;2,515',
-    '&pound;2,530,000',
-    '&pound;2,550',
-    '&pound;2,640',
-    '&pound;2,745',
-    '&pound;2,850',
-    '&pound;2,856,821',
-    '&pound;2,875',
-    '&pound;2.02',
-    '&pound;2.03',
-    '&pound;2.08',
-    '&pound;2.09m',
     '&pound;2.17',
-    '&pound;2.23',
-    '&pound;2.25/150ml',
-    '&pound;2.25m',
-    '&pound;2.26',
-    '&pound;2.39/200ml',
-    '&pound;2.43',
-    '&pound;2.55m',
-    '&pound;2.57',
-    '&pound;2.5m.',
-    '&pound;2.65m',
-    '&pound;2.81m',
-    '&pound;2.85m',
-    '&pound;2.88',
-    '&pound;2.92',
-    '&pound;2.9million',
     '&pound;2/hr',
-    '&pound;20,000&ndash;30,000',
-    '&pound;20,000,000',
-    '&pound;20,000-&pound;25,000',
-    '&pound;20,0000',
-    '&pound;20,250',
-    '&pound;20,698',
-    '&pound;20-&pound;39',
-    '&pound;20-&pound;40',
-    '&pound;20.2',
-    '&pound;20.25',
-    '&pound;20.3',
-    '&pound;20.37',
-    '&pound;20.4',
-    '&pound;20.4m',
-    '&pound;20.5million',
     '&pound;20.6m',
-    '&pound;20.7',
-    '&pound;20.8',
-    '&pound;20.80',
-    '&pound;20.8m',
-    '&pound;20.9',
-    '&pound;20.99',
-    '&pound;200&ndash;240',
-    '&pound;200,000-worth',
-    '&pound;200-&pound;400',
-    '&pound;201,000',
-    '&pound;201,150',
-    '&pound;201.50',
-    '&pound;201m',
-    '&pound;204,000',
-    '&pound;204.7m',
     '&pound;204m',
-    '&pound;205million',
-    '&pound;206',
-    '&pound;206m',
-    '&pound;207',
-    '&pound;209,000',
-    '&pound;20pp',
-    '&pound;21,250',
-    '&pound;21,420',
-    '&pound;21,428',
-    '&pound;21,500',
-    '&pound;21.00',
-    '&pound;21.1m',
-    '&pound;21.25',
-    '&pound;21.2m',
-    '&pound;21.5',
     '&pound;21.5m',
-    '&pound;21.6',
-    '&pound;21.7',
-    '&pound;21.9',
-    '&pound;210.33',
-    '&pound;2100',
-    '&pound;211m',
-    '&pound;212',
-    '&pound;213,632',
-    '&pound;214,602',
-    '&pound;214m',
-    '&pound;215,000',
-    '&pound;215,216',
-    '&pound;2150',
-    '&pound;216m',
-    '&pound;219,000',
     '&pound;22.',
-    '&pound;22.1',
-    '&pound;22.2',
-    '&pound;22.4',
-    '&pound;22.40',
-    '&pound;22.4m',
-    '&pound;22.60',
-    '&pound;22.8m',
-    '&pound;221',
-    '&pound;221.5m',
-    '&pound;223',
-    '&pound;223m',
-    '&pound;225,983',
-    '&pound;225.00',
-    '&pound;225million',
-    '&pound;227m',
     '&pound;228,000',
-    '&pound;229.95',
-    '&pound;23,100',
-    '&pound;23,200',
-    '&pound;23,300',
-    '&pound;23,600',
-    '&pound;23.1',
-    'repasts',
-    'repayed',
-    'repenteth',
-    'rephotographing',
-    'replastered',
-    'replicant',
-    'report-back',
-    'reposted',
-    'reppion',
     'reprecipitated',
-    'reprised',
-    'reprises',
-    'reprocessors',
-    'reproduce\'',
-    'reprofiled',
-    'reps.',
-    'rept',
-    'reptilia',
-    'republic\'',
-    'requiescat',
-    'requireth',
-    'rerating',
-    'rereleased',
-    'rerngprasertvit',
-    'reroofing',
     'rescources',
-    'research-',
-    'research-driven',
-    'reseating',
-    'reseau',
-    'resecure',
-    'reserach',
-    'reserve-team',
-    'resident-',
-    'resina',
-    'resleeving',
-    'resotred',
-    'resourses',
-    'respecifying',
-    'response\'',
-    'response-produced',
     'respublika',
-    'ressentiment',
-    'rest-day',
-    'restack',
-    'restauri',
-    'restretching',
-    'restringing',
-    'restrung',
-    'resurrectionem',
-    'resuture',
-    'retallack',
-    'rether',
-    'reticuli',
-    'retightened',
-    'retiled',
-    'retina-scan',
     'retinol-binding',
-    'retonio',
-    'retraite',
-    'retransmit',
-    'retransmitted',
-    'retrim',
-    'retro-bolting',
-    'retroflex',
-    'retroussage',
-    'return(s)',
-    'reunifaction',
-    'reutern',
-    'rev\'rend',
-    'reval',
-    'revalving',
-    'revegetated',
     'reverse-osmosis',
-    'reversed-phase',
-    'revetting',
-    'revisionary',
-    'revivers',
-    'revolutionary\'',
-    'revolutionary-sounding',
-    'revuebar',
-    'rewe',
-    'reweighed',
-    'rexine',
-    'reyero',
-    'reykjahlid',
-    'reyne',
-    'rezoning',
-    'rhapsode',
     'rhapsodise',
-    'rhenium',
-    'rheums',
-    'rhi',
-    'rhodope',
-    'rhoikos',
-    'rhr',
-    'rhymers',
-    'rhymesters',
-    'riabhaich',
-    'ribands',
-    'ribband',
-    'ribboning',
-    'ribwort',
-    'richart',
-    'richings',
     'richler',
-    'richmonds',
-    'rick-yard',
-    'riddihough',
-    'ridsdale-tombling',
-    'riegel',
-    'riemenschneider',
-    'rieng',
-    'rift-related',
-    'rigarlsford',
-    'riggit',
-    'rigglesford',
-    'right-eye',
-    'rightish',
-    'rights-',
-    'rigidex',
     'rigorists',
-    'rijk',
-    'rikon',
-    'rillaton',
-    'rilled',
-    'rimmon',
-    'rinder',
-    'rine',
-    'rineloricaria',
-    'ring\'',
-    'ring(s)',
-    'ring-seal',
-    'ringbinder',
-    'ringe',
-    'ringgold',
-    'ringways',
     'ripoffs',
-    'rippers',
-    'risc-system',
-    'riserva',
-    'rishis',
-    'rising-main',
-    'risj',
-    'risk\'',
-    'risk-aversion',
-    'risk-capital',
-    'risk-reward',
-    'rissa',
-    'rissole',
-    'ritcher',
-    'ritech',
-    'rithmetic',
     'riting',
-    'ritters',
-    'river-valley',
-    'riverbend',
-    'riverport',
-    'riverrun',
-    'rivetted',
-    'rivingtons',
-    'rjr-nabisco',
-    'rly.',
-    'rmu',
-    'rnasine',
-    'rnazol',
-    'rnnas',
-    'rnzaf',
-    'ro&ndash;ro',
     'road-map',
-    'road-racing',
-    'road-safety',
-    'road-sign',
-    'roadying',
-    'roasties',
-    'robbiae',
-    'robbin\'',
-    'robin\'',
-    'roblett',
-    'roblin',
-    'robocom',
-    'robotron',
-    'roboz',
-    'robuchon',
-    'rocheforts',
     'rock\'n',
-    'rock-garden',
-    'rock-hewn',
-    'rockbeast',
-    'rockbus',
-    'rocklands',
-    'rockmaster',
-    'rockne',
-    'rockpile',
-    'rockstar',
-    'rocs',
-    'rodden',
-    'rodman',
-    'rodulf',
-    'roelant',
-    'roffensis',
     'rohirrim',
-    'rohr',
-    'rohtang',
-    'roirbak\'',
-    'rojo',
-    'roke',
-    'rokeby',
-    'rokesmith',
-    'rokha',
-    'rokitansky',
-    'rokkakus',
-    'role-breaking',
-    'role-mapping',
-    'role-player',
-    'roleplayed',
-    'roleplays',
     'roll-back',
-    'roll-down',
-    'roll-rate',
-    'rolled-back',
-    'roller-blind',
-    'roller-hockey',
-    'rolling-out',
-    'rollnik',
-    'rollwagen',
-    'romagnola',
-    'romanism',
-    'romanoff',
-    'romanorum',
-    'romb',
-    'romo',
-    'romorola',
     'romper-suit',
-    'rondeaux',
-    'rondel',
-    'roneval',
-    'ronhill',
-    'ronin',
-    'ronne',
-    'rono',
-    'ronsnade',
-    'ronstrip',
-    'rood-loft',
-    'roode',
-    'roof-void',
-    'rooked',
-    'roomes',
-    'roosecote',
     'root&mdash;package&mdash;details',
-    'root-',
-    'root-room',
-    'rootled',
-    'rooty',
-    'rop',
-    'roppongi',
-    'roppou',
-    'ros&egrave',
-    'rosamunde',
-    'rosco',
-    'rose-bowl',
-    'rose-opaline',
-    'rose-orange',
-    'rose-painted',
-    'rosebank',
     'rosenne',
-    'roseveare',
-    'rosh',
-    'rosicrucianism',
-    'rosling',
-    'rosneath',
-    'rosow',
-    'rossano',
-    'rossinish',
-    'rosti',
-    'rosy-purple',
-    'rotaflex',
-    'rotblat',
-    'rothbart',
-    'rothenb&uuml;hler',
-    'rothon',
     'roti',
-    'rotondo',
-    'rotovating',
-    'rotuman',
-    'rouanet',
-    'rouennais',
-    'rough-grassed',
-    'rough-surfaced',
-    'roughcut',
-    'roughing-out',
-    'roughtly',
-    'rouhanyoun',
-    'roulades',
-    'roulez',
-    'roulin',
-    'round-the-table',
     'rounding-up',
-    'roussety',
-    'route-map',
-    'routinise',
-    'routray',
-    'rovere',
-    'rovergarden',
-    'rowark',
-    'rowdon',
-    'rowing-team',
-    'royalp',
-    'royaume',
-    'royaux',
-    'royong',
-    'rozas',
-    'rozavel',
     'rozin',
-    'rp-speaking',
-    'rpc-toolkit',
-    'rpe',
-    'rpgs',
-    'rq-380',
-    'rrap',
-    'rrrs',
-    'rsb',
-    'rse',
-    'rso',
-    'rsus',
-    'ruadh-stac',
-    'ruairi',
-    'ruan',
-    'ruangkanchanaset',
     'rub\'',
-    'rub-a-dub-dub',
-    'rubb',
-    'rubberstamp',
-    'rubbish\'',
-    'rubbish-collection',
-    'rubbo',
-    'rubena',
-    'ruberoid',
-    'rubgy',
-    'rubinfeld',
-    'rubricated',
-    'rubsystem',
-    'rucia',
-    'rudery',
-    'rudloff',
     'rudoe',
-    'ruf',
-    'ruff-sniff',
-    'ruff-stuff',
-    'ruffino',
-    'ruffness',
-    'rug-weaving',
-    'rugman',
-    'ruhamanya',
-    'ruhuhu',
-    'ruhul',
-    'ruinated',
-    'rukoro',
-    'rule-bending',
-    'rule-boundedness',
-    'rules-based',
     'rully',
-    'rum-',
-    'rumbas',
-    'rumillajta',
-    'rummel',
-    'rumpelmayers',
-    'rumper',
-    'rumpf',
-    'rumpling',
-    'run-making',
-    'run-past',
-    'run_away',
-    'runcan',
-    'runcorne',
-    'rundall',
-    'rundfunkwerke',
     'rundquist',
-    'runesmiths',
-    'runing',
-    'ruotolo',
-    'rupestris',
-    'rupicola',
-    'ruppert',
-    'ruschmeyer',
-    'rusell',
-    'rushout',
-    'russett',
-    'russian-built',
-    'russian-held',
-    'russianised',
-    'russische',
-    'rustica',
     'rustkammer',
-    'rutty',
-    'rwegasira',
-    'rwmac',
-    'rws',
-    'rya-recognised',
-    'rycote',
-    'rynkiewich',
-    'rzeszow',
-    's&eacute;bastopol',
-    's&eacute;minaire',
-    's&eacute;n&eacute;chal',
-    's&eacute;r&eacute;nade',
-    's&ndash',
-    's&ucirc;derdithmarschen',
-    's&uuml;leyman',
     's\'all',
-    's\'land',
-    's-10',
-    's-2',
-    's-61',
-    's-bend',
-    's-bit',
-    's-coupe',
-    's-m',
-    's-so',
-    'sa-hoo',
-    'saachi',
-    'saade',
-    'sabaha',
-    'sabbath-breaking',
-    'sabinorum',
     'sabreur',
-    'sacculina',
-    'sackbut',
-    'sackor',
-    'sacomt',
-    'sacque',
-    'sacramentalized',
-    'sacramentals',
-    'sacri',
-    'sad-faced',
-    'sadd',
-    'saddamgate',
-    'saddle-bow',
-    'sadnes',
-    'sadolin',
-    'saegert',
     'saemol',
-    'safaga',
-    'safaniya',
-    'safari-style',
-    'safari-suit',
-    'safe-custody',
-    'safe-guarding',
-    'safe-house',
-    'saferite',
-    'safeti',
-    'safety-check',
-    'safetywear',
-    'saffrall',
-    'saffron-gatherer',
-    'safiqua',
-    'safwat',
     'sagamihara',
-    'sagb',
-    'sagem',
-    'saget',
-    'sagey',
-    'sagramaso',
-    'sagredo',
-    'sahadeo',
-    'sahitharan',
-    'sahsru',
-    'sahul',
-    'sahyadri',
-    'saidou',
-    'saim',
-    'sainovic',
-    'sainte-trinit&eacute',
     'saintsaens',
-    'saire',
-    'saisies',
-    'sait',
-    'sak',
-    'sakaran',
-    'sakulin',
-    'salagama',
-    'salamancas',
-    'salamon',
-    'salarian',
-    'salarye',
-    'salcedo',
-    'saler',
-    'sales-person',
-    'sales-talk',
     'salfords',
-    'salg',
-    'salicaceae',
-    'salin',
-    'saliou',
-    'salkever',
-    'salkind',
-    'sallam',
-    'sallet',
-    'salmantina',
-    'salmon-farming',
-    'salmon-fishing',
-    'salmon-rod',
-    'salomea',
-    'sals',
-    'salt\'n\'pepa',
     'salt-works',
-    'saltglaze',
-    'saltholme',
-    'saltimbocca',
-    'saluki',
-    'salutis',
-    'salvationism',
-    'salvatori',
-    'salzach',
-    'salzgitter',
-    'salzman',
-    'samadhi',
-    'samaha',
-    'samaniego',
-    'samarium',
-    'sambursky',
     'samivel',
-    'saml',
-    'samland',
-    'sammler',
-    'sample-based',
-    'sanatory',
-    'sanction-busting',
-    'sand-covered',
-    'sand-flea',
-    'sand-le-mere',
-    'sand-paper',
-    'sandanista',
-    'sandanistas',
-    'sandbed',
-    'sandbloom',
-    'sandbox',
     'sandee',
-    'sanditon',
-    'sandook',
-    'sandrine',
-    'sandspit',
-    'sanduny',
-    'sandwich-box',
-    'sandymount',
-    'sangers',
-    'sangiovese',
-    'sanitact',
-    'sanken',
-    'sannine',
-    'sannox',
-    'sanpoa',
-    'sans-souci',
     'sansui',
-    'sansyusya',
-    'santangelo',
-    'santes',
-    'santing',
-    'sanyi',
-    'sapey',
-    'sapm',
-    'saposnik',
-    'sappled',
-    'saral',
-    'sargin',
-    'sarinic',
-    'sarojine',
-    'sarpi',
-    'sarrat',
     'sartan',
-    'sartorially-challenged',
-    'saryan',
-    'sasa',
-    'sat&ndash;sun',
-    'satan-worshipping',
-    'satank',
-    'satellite-based',
-    'saterglantan',
-    'satow',
-    'satquote',
-    'satros',
-    'satucc',
-    'satur',
-    'sauce-',
-    'saucing',
     'saudades',
-    'sauerbraten',
-    'saulieu',
-    'saun',
-    'saunt',
-    'sausage-machine',
-    'sausage-maker',
-    'sauti',
-    'savacentres',
-    'savaric',
-    'savary-miller',
-    'saverio',
-    'savic',
-    'savings-bank',
-    'savino',
-    'savitri',
     'savona',
-    'savu',
-    'saw\'em',
-    'saw-blade',
-    'sawdde',
-    'sawe',
-    'sawfat',
-    'saxham',
-    'saxo-norman',
-    'saxones',
-    'say-',
-    'sayes',
-    'sayonara',
-    'sazhen',
-    'sbat',
-    'sbi',
     'sbo',
-    'sbodn',
-    'scabra',
-    'scadavay',
-    'scadder',
-    'scafati',
-    'scaffolded',
-    'scaft',
-    'scale-based',
-    'scalectrix',
-    'scallies',
-    'scamander',
-    'scamps',
-    'scandal-free',
-    'scandalmongering',
-    'scandinavian-managed',
     'scandinavian-type',
-    'scandium',
-    'scanman',
-    'scanno',
-    'scansiris',
-    'scarcroft',
-    'scarf-jointed',
-    'scarped',
-    'scarton',
-    'scatterometer',
-    'scavening',
-    'scd-compliant',
-    'scene-stealer',
-    'scenerama',
-    'sch&uuml;tte',
-    'schaedler',
     'schaer',
-    'schal',
-    'schally',
-    'schalt',
-    'schary',
-    'schauble',
-    'schaufuss',
-    'schauspieldirektor',
-    'schedule(s)',
-    'scheff&eacute',
-    'scheffer',
-    'scheffler',
-    'scheibenbuck',
-    'scheisse',
-    'scheissekommando',
-    'schenkel',
     'schering-plough',
-    'schiavoni',
-    'schikenader',
-    'schiz',
-    'schizostylis',
-    'schlettwein',
-    'schlieker',
-    'schlitz',
-    'schlumbergera',
-    'schlurp',
-    'schmied',
-    'schmucks',
-    'schnablwirt',
-    'schnapp',
-    'schneer',
-    'schoeck',
     'schoeller',
-    'schoerner',
-    'scholar-poet',
-    'scholem',
-    'scholls',
-    'scholtzs',
-    'schone',
-    'school-',
-    'school-educated',
-    'school-girl',
-    'school-yard',
-    'schoolin\'',
-    'schop',
-    'schou',
-    'schram',
-    'schrenk',
     'schriber',
-    'schuldscheine',
-    'schulhoff',
-    'schurman',
-    'schutzstaffel',
-    'schwager',
-    'schwartzman',
-    'schwarzanegger',
-    'schwarzenberger',
-    'schwarzer',
-    'schwarzlose',
-    'schwarzsee',
-    'schwed',
-    'schwob',
-    'schwoerer',
-    'sciadopitys',
     'science-led',
-    'science-policy',
-    'science-writing',
-    'scientized',
-    'scissor-bite',
-    'scleractinia',
-    'sclerosed',
-    'scleroses',
-    'sclerotised',
-    'scoles',
-    'scolytid',
-    'scoopful',
-    'scopas',
-    'scot-am',
-    'scotch-roman',
-    'scotgate',
     'scotgen',
-    'scotichronicon',
-    'scotprime',
-    'scott-hodgetts',
-    'scotties',
-    'scourian',
-    'scouters',
-    'scraggly',
-    'scraperboard',
-    'scratchin\'',
-    'scratchwood',
-    'scree-covered',
-    'screen-tested',
-    'screen-time',
-    'screensaver',
-    'screwchuck',
     'screwjack',
-    'scribners',
-    'scrimmaging',
-    'scrimshandered',
-    'scrimshandering',
-    'scriptores',
-    'scritch',
-    'scrooged',
-    'scrubbing-brush',
-    'scruffed',
-    'scrutineering',
-    'sculpin',
-    'scummed',
-    'scumta',
-    'scupe',
-    'scurfy',
     'scurr',
-    'scurred',
-    'scusi',
-    'scye',
-    'scyphidia',
-    'sd-10',
-    'sdas',
-    'sdg',
-    'sdio',
-    'sdm-79',
-    'se&ntilde;ores',
-    'sea-air',
-    'sea-bass',
-    'sea-board',
-    'sea-bottom',
-    'sea-breeze',
     'sea-cave',
-    'sea-cliff',
-    'sea-deep',
-    'sea-dwelling',
-    'sea-foam',
-    'sea-fowl',
-    'sea-gusting',
-    'sea-island',
-    'sea-living',
-    'sea-lord',
-    'sea-mammal',
-    'sea-room',
-    'sea-route',
-    'sea-worm',
-    'seabathing',
-    'seagar',
     'seahawk',
-    'seal-skin',
-    'seaqaqa',
-    'search-and-rescue',
-    'searelle',
-    'seargeant',
-    'seary',
-    'seaspeed',
-    'seastar',
-    'seat-cover',
-    'seatone',
-    'seattle-worshipping',
-    'seaver',
-    'seaweed-covered',
-    'seborovski',
-    'secant',
     'secateur-type',
-    'second-to-bottom',
-    'second-top',
-    'secratary',
-    'secretarian',
-    'secteur',
-    'sectionalised',
-    'sectretary',
-    'secunderabad',
-    'secured\'',
-    'securitas',
-    'security-code',
-    'sednaoui',
-    'see\'',
-    'seed-sowing',
-    'seedpods',
     'seedtrays',
-    'seefelderhof',
-    'seeliger',
-    'seeling',
-    'seelye',
-    'seesawed',
-    'seesawing',
-    'seglow',
-    'segment-headed',
-    'segue',
-    'segueing',
-    'seguridad',
-    'seicento',
-    'seidelman',
-    'seierstad',
-    'seig',
     'seignoret',
-    'seiken',
-    'seke',
-    'seken',
-    'sekiya',
-    'selase',
-    'selectcare',
-    'selector-coach',
-    'selenium-75',
-    'self&rehy;contained',
-    'self&rehy;effacing',
-    'self&rehy;supporting',
-    'self-acceptance',
-    'self-admitted',
-    'self-adoring',
-    'self-advertising',
     'self-approval',
-    'self-arbitration',
-    'self-arming',
-    'self-caricature',
-    'self-certify',
-    'self-coaching',
-    'self-command',
-    'self-communing',
-    'self-congratulating',
-    'self-consistency',
-    'self-constituted',
-    'self-contradicting',
-    'self-corrective',
-    'self-creation',
-    'self-deconstruction',
-    'self-deluder',
     'self-depreciating',
-    'self-diffusion',
-    'self-disparaging',
-    'self-display',
-    'self-dissolution',
-    'self-documenting',
-    'self-effort',
-    'self-electing',
-    'self-empowering',
-    'self-enhancing',
-    'self-evacuation',
-    'self-excitation',
-    'self-exclusion',
-    'self-excusing',
-    'self-exile',
-    'self-filling',
     'self-fruition',
-    'self-inflated',
-    'self-injection',
-    'self-inquisition',
-    'self-inspection',
-    'self-insufficiency',
-    'self-insuring',
-    'self-interaction',
-    'self-interruption',
-    'self-laceration',
-    'self-liberation',
-    'self-loving',
-    'self-modifying',
-    'self-murder',
-    'self-mutating',
-    'self-narcotisation',
     'self-negotiated',
-    'self-observation',
-    'self-peptide',
-    'self-promoter',
-    'self-pulsing',
-    'self-punishing',
-    'self-quotation',
-    'self-reassurance',
-    'self-referral',
-    'self-run',
-    'self-screening',
-    'self-speech',
-    'self-supported',
-    'self-tailing',
-    'self-taxation',
-    'self-test',
     'self-timing',
-    'self-winding',
-    'selfcontained',
-    'selfdefeating',
-    'selfjustifying',
-    'selfoss',
-    'selinker',
-    'seljalandsfoss',
-    'selket',
-    'sell&rehy;out',
-    'sellary',
-    'selled',
-    'semalaysia',
-    'semaphored',
-    'semi-amateur',
-    'semi-comic',
     'semi-controlled',
-    'semi-det',
-    'semi-institutionalized',
-    'semi-luxury',
-    'semi-monocoque',
-    'semi-pelagian',
-    'semi-shade',
-    'semi-stalled',
-    'semi-upright',
-    'semidetached',
-    'semilarvatus',
-    'seminole',
-    'semiochemicals',
-    'semipalmated',
-    'semite',
-    'semp&eacute',
     'senaki',
-    'seneb',
-    'senechal',
-    'seneschalli',
-    'sennheiser',
-    'sensationalising',
-    'sense-group',
-    'sense-qualification',
-    'sense-unit',
-    'sentence-based',
-    'sentimentalising',
-    'sentry-box',
-    'seperated',
-    'seppelt',
-    'seppings',
-    'seppo',
     'sepracor',
-    'sepultura',
-    'serabend',
-    'seradoy',
-    'serafim',
-    'serbocroatian',
-    'seretse',
-    'sergeant-pilot',
-    'serges',
-    'serging',
-    'sergipe',
-    'serialize',
-    'seriation',
-    'series-clinching',
-    'sermatt',
-    'sernin',
     'seroconvert',
-    'seronera',
-    'serotec',
-    'serotyping',
-    'serphidae',
-    'serpico',
-    'serr',
-    'serrado',
-    'serranno',
-    'serrasalmus',
-    'serret',
-    'servais',
-    'serval',
-    'servant-keeping',
-    'servanus',
-    'serve-and-volley',
     'server-to-server',
-    'service-by-service',
-    'service-led',
-    'service-provision',
-    'servomotors',
-    'sery',
-    'sesay',
-    'sesquicentenary',
-    'sesquipedalian',
-    'session\'',
-    'sessioneer',
-    'sestos',
-    'set-qao-log',
-    'setchfield',
-    'setcreasea',
-    'sethos',
     'setons',
-    'sets-up',
-    'settecento',
-    'seule',
-    'seum',
-    'sev\'n',
-    'seven-acre',
-    'seven-album',
-    'seven-column',
-    'seven-nation',
-    'seven-octave',
-    'seven-phase',
-    'seven-seat',
-    'seven-volume',
-    'seventeen-foot',
-    'seventy-foot',
     'seventy-pound',
-    'sevenup',
-    'severalfold',
-    'severely-depressed',
-    'severfield-reeve',
-    'seversky',
-    'sevillanos',
-    'seviour',
-    'sevvy',
-    'sewa',
-    'sewing-basket',
-    'sex-appeal',
-    'sex-discrimination',
-    'sex-fiend',
-    'sex-for-sale',
-    'sex-kitten',
     'sex-o-lettes',
-    'sexe',
-    'sexercise',
-    'sexta',
-    'sextuple',
-    'sexualise',
-    'seydlitz',
-    'seyler',
-    'seyn',
-    'sezincote',
-    'sezon',
-    'sft',
-    'sgine',
-    'sgs-ca1',
-    'sgs-ca2',
-    'shabbily-dressed',
     'shadday',
-    'shadow-play',
-    'shadrack',
-    'shads',
-    'shadwe',
-    'shaffner',
-    'shafiq',
-    'shafranik',
-    'shaft-driven',
-    'shagger',
-    'shaggin\'',
-    'shaggy-dog',
-    'shagreen',
-    'shah-al-arhee',
-    'shahaptian',
-    'shahnaz',
     'shahumyan',
-    'shakatak',
-    'shakespeares',
-    'shal',
-    'shamlan',
-    'shammai',
-    'shanas',
-    'shanghai-based',
-    'shanked',
-    'shanor',
-    'shant',
-    'shape-changer',
-    'shapeshifter',
-    'shaqlawa',
-    'share-a-yacht',
-    'shareen',
     'sharked',
-    'sharkfin',
-    'sharkmouth',
-    'sharovari',
-    'sharp-beaked',
-    'sharp-looking',
-    'sharp-tasting',
-    'sharply-defined',
-    'sharpnose',
-    'sharu',
-    'shastra',
-    'shastric',
-    'shawnee',
-    'shazam',
-    'she\'d',
-    'shearn',
     'shebah',
-    'sheeny',
-    'sheep-farmer',
-    'sheepshanks',
-    'sheesh',
-    'sheet-ice',
-    'sheet-iron',
-    'shehadat',
-    'sheidal',
-    'sheigra',
-    'sheiling',
-    'sheitel',
-    'shelburne',
-    'shell-blast',
-    'shell-secreting',
-    'shelterbelts',
     'shemaka',
-    'shenkman',
-    'sherbert',
-    'sheredon',
-    'sheriff-clerk',
-    'sherri',
-    'shiant',
-    'shib',
-    'shide',
-    'shift-change',
-    'shiftx',
-    'shigemitsu',
-    'shih-k\'ai',
-    'shiina',
-    'shikai',
-    'shillinglaw',
     'shilluk',
-    'shilo',
-    'shimmed',
-    'shims',
-    'shin-bone',
-    'shindy',
-    'shinehead',
-    'shiney',
-    'shingler',
-    'shinny',
-    'shinozuka',
-    'ship-in-a-bottle',
-    'ship-owning',
-    'ship-to-ship',
-    'shipp',
-    'shippey',
     'shipwrecking',
-    'shirburn',
-    'shirescot',
-    'shiret',
-    'shirred',
-    'shirt-collar',
-    'shirted',
-    'shirvan-grade',
-    'shit-eating',
-    'shit-house',
-    'shit-kicking',
-    'shit-stirring',
-    'shit-strewn',
-    'shitfaced',
-    'shitler',
-    'shivdasani',
     'shmis',
-    'shmucks',
-    'shmueli',
-    'shnezhana',
-    'shock-headed',
-    'shoe-horn',
-    'shoe-maker',
-    'shoe-shop',
-    'shoesmith',
-    'shoji',
-    'shold',
-    'shomer',
-    'shoosmiths',
-    'shooting-brake',
-    'shooting-gallery',
-    'shop-keeping',
     'shopping-centre',
-    'shore-nesting',
-    'shorebirds',
-    'shorebound',
-    'shorshan',
-    'short-axis',
-    'short-held',
-    'short-lasting',
-    'short-passing',
-    'short-straw',
-    'short-working',
-    'shorter-dated',
-    'shortest-lived',
-    'shorthand-typing',
-    'shot-on-the-turn',
-    'should\'',
     'shoulder-mount',
-    'shoulder-shrugging',
-    'shouldn',
-    'shovellin\'',
-    'shovin\'',
-    'show-going',
-    'show-jumpers',
-    'showe',
-    'shower-cap',
-    'showler',
-    'showoff',
-    'shplendid',
-    'shrdlu',
-    'shreve',
-    'shrink-wrapping',
-    'shuailaan',
     'shucked',
-    'shuffletoppin\'',
-    'shugart',
-    'shui-teh',
-    'shul\'govskii',
-    'shuld',
-    'shulevitz',
-    'shuna',
-    'shunso',
-    'shurrup',
-    'shushes',
-    'shutoff',
-    'shuttle-worker',
-    'shwarzenegger',
-    'shwedagon',
-    'shwob',
     'shy-making',
-    'si&acirc;n',
-    'siaochang',
-    'siar',
-    'sibi',
-    'sibree',
-    'sibusiso',
-    'sicad',
-    'sicarii',
-    'sicga',
-    'sicher',
-    'sicinius',
-    'sicras',
-    'sida',
-    'sidcot',
-    'siddick',
     'side-',
-    'side-board',
-    'side-exit',
-    'side-interest',
-    'side-lights',
-    'side-netting',
-    'side-split',
-    'side-turning',
-    'sider',
-    'siders',
-    'sidestroke',
-    'sideswimmers',
-    'sidransky',
-    'siempre',
-    'sierkunst',
-    'siffert',
     'sige',
-    'siger',
-    'sight-bob',
-    'sight-vocabulary',
-    'sigiriya',
-    'sigismondo',
-    'sign-and.magnitude',
-    'sign-posting',
-    'sign-up',
-    'sign-value',
-    'signa',
-    'signature(s)',
-    'siha',
-    'sihr',
-    'sikander',
-    'silane',
     'silberman',
-    'silberysen',
-    'silentia',
-    'silentnight',
-    'silica-based',
-    'silicone-rubber',
-    'siliconing',
-    'silk-draped',
-    'silked',
-    'silkience',
-    'silking',
-    'sillard',
-    'siller',
-    'silus',
-    'silver-birch',
-    'silver-blue',
     'silver-chaser',
-    'silver-leaf',
-    'silver-paper',
-    'silver-shot',
-    'silverbridge',
-    'silverface',
-    'silverlock',
-    'silverspear',
-    'silvestrin',
-    'silvo',
-    'simbomba',
-    'simeti',
-    'similarly-aged',
-    'similies',
-    'simod',
-    'simonds-gooding',
     'simoni',
-    'simonstown',
-    'simple-living',
-    'simple-mindedness',
-    'simpleminded',
-    'simpletons',
-    'simulclass',
-    'simv',
-    'sin-',
-    'sinaed',
-    'sinc',
-    'sincerely-held',
-    'sinead-ism',
-    'sinfonye',
-    'singha',
-    'singhs',
     'singidunum',
-    'singlaub',
-    'single-arch',
-    'single-band',
-    'single-brand',
-    'single-button',
-    'single-car',
-    'single-chain',
-    'single-digit',
-    'single-double',
-    'single-firm',
-    'single-industry',
-    'single-owner',
-    'single-power',
-    'single-suckler',
-    'singlestaff',
     'singulares',
-    'singverein',
-    'sinis',
-    'sinise',
-    'sink-hole',
-    'sinked',
-    'sinken',
-    'sinkiang',
-    'sinne',
-    'sinningia',
-    'sino',
-    'sint',
-    'sioban',
-    'siona',
-    'siorai',
-    'sipp',
     'sippan',
-    'siptu',
-    'sirani',
-    'sireling',
-    'sirmium',
-    'sirohey',
-    'sirteco',
-    'sisikon',
-    'sisknys',
-    'sisteron',
-    'sit\'',
-    'sit-on',
-    'sitaryan',
-    'sitha',
-    'sittang',
-    'sitting/dining',
     'siurell',
-    'sivraj',
-    'six-acre',
-    'six-ball',
-    'six-carbon',
-    'six-character',
-    'six-dog',
-    'six-furlong',
-    'six-horse',
-    'six-module',
-    'six-port',
-    'six-track',
-    'sixscore',
-    'sixteen&rehy;year-old',
-    'sixteen-day',
-    'sixteen-page',
     'siza',
-    'sk&oacute;gafoss',
-    'skanky',
-    'skcm',
-    'skedaddled',
-    'skeel',
-    'skeletonized',
-    'skeltar',
-    'skew-nailing',
-    'skhirat',
-    'ski-rack',
-    'ski-run',
-    'ski-tow',
-    'ski-wear',
-    'skid-row',
-    'skilegs',
     'skilfull',
-    'skillicorn',
-    'skin-flattering',
-    'skinny-rib',
-    'skipfest',
-    'skiploads',
-    'skippety-hop',
-    'skirton',
-    'skittling',
-    'sko',
-    'skoff',
-    'skone',
-    'skoro',
-    'skowron',
-    'skraggin\'',
-    'skragging',
     'skreen',
-    'skuhravy',
-    'skunk-stripe',
-    'sky-rocket',
-    'skybird',
-    'skykings',
-    'skyler',
-    'skyllias',
-    'skynasaur',
-    'skytrain\'',
-    'skyvan',
-    'skyviews',
-    'skyword',
-    'sl&aacute;inte',
-    'slag-heap',
-    'slainte',
     'slaithwaite',
-    'slamet',
-    'slap-stick',
-    'slashed-price',
-    'slatefield',
-    'slav-speaking',
-    'slave-based',
-    'slave-drive',
-    'slave-master',
-    'slavery\'',
-    'slaymaker',
-    'slb',
-    'sledged',
-    'sledgers',
-    'sleeked',
-    'sleep-stage',
     'sleepest',
-    'sleeping-space',
-    'sleeve-buckler',
-    'sleeveen',
-    'sleighing',
-    'sleighride',
-    'sleighs',
-    'slendertone',
-    'slide-back',
-    'slide-car',
-    'slide-tape',
-    'sliderules',
-    'slideshows',
-    'slim-down',
-    'sling-shot',
-    'slinnart',
     'slit-scan',
-    'slo',
-    'slobodnik',
-    'slochd',
-    'sloggers',
-    'slomonin',
-    'slop-pail',
-    'slosh-slosh-slosh',
-    'slow-coach',
-    'slow-growth',
-    'slow-speed',
-    'slow-starter',
-    'slow-wave',
-    'slower-acting',
-    'slowing-down',
-    'slowpoke-2',
     'slubs',
-    'sludgebucket',
-    'sludged',
-    'slurk',
-    'slushed',
-    'slutsky',
-    'smackin\'',
-    'small-format',
-    'small-part',
-    'small-print',
-    'smartgun',
-    'smartsystem',
-    'smashin\'',
-    'smed',
-    'smeggy',
-    'smelders',
     'smellerama',
-    'smic',
-    'smiep',
-    'smileys',
-    'smilin\'',
-    'smirched',
-    'smirlock',
-    'smistig',
-    'smith-cumming',
-    'smithii',
-    'smitted',
-    'smoaking',
-    'smoke-blowing',
-    'smoke-stained',
-    'smoke-stick',
-    'smokehouses',
     'smolt',
-    'smolyan',
-    'smoothly-run',
-    'smoothrite',
-    'smpas',
-    'sn(ij)',
-    'snacked',
-    'snagg',
-    'snagginess',
-    'snail-shell',
-    'snailsden',
-    'snake-root',
-    'snap-in',
-    'snehee',
-    'snicker-snack',
-    'snipef',
     'snitchwatch',
-    'snookers',
-    'snorkelift',
-    'snot-nosed',
-    'snotters',
-    'snottery',
-    'snow-blower',
-    'snowbirds',
-    'snowblower',
-    'snowboy',
-    'snowcapped',
-    'snowgoose',
-    'snowswept',
-    'snowviz',
-    'snoz',
-    'snud',
     'snug-fitting',
-    'snyderman',
-    'so&ccaron;a',
-    'so\'',
-    'so-that',
-    'so928',
-    'soafd',
-    'soare',
-    'sobering-up',
-    'sobero',
-    'sobranie',
-    'sobstad',
-    'social-market',
-    'socialdemokratiet',
-    'socialist-led',
-    'socially-induced',
     'socio-linguistics',
-    'sodano',
-    'sodastream',
-    'soddy',
-    'sodoma',
-    'sodomise',
-    'sodomising',
-    'soemarwoto',
-    'soeryadjaya',
-    'soff',
-    'sofram',
-    'sofroniou',
-    'soft-',
-    'soft-loan',
-    'soft-sell',
-    'soft-soap',
     'soft-water',
-    'softback',
-    'softer-edged',
-    'softlinx',
-    'softs',
-    'softwindows',
-    'sohoite',
-    'sohyo',
-    'soil-conserving',
-    'soken',
-    'soko',
-    'solaglass',
-    'solang',
-    'soldan',
-    'soldi',
-    'soldierfish',
     'sole-surviving',
-    'soleb',
-    'solenodon',
-    'solfatara',
-    'solhan',
-    'solicitors-general',
-    'solid-silver',
-    'solid-topped',
-    'solidarit&eacute',
-    'solidarity-backed',
-    'solman',
-    'solomonoff',
-    'solopark',
-    'solor',
-    'solubilised',
-    'solution-collapse',
     'solvated',
-    'someone-or-other',
-    'somersham',
-    'somethingdifferent',
-    'sommaria',
-    'sommerlad',
-    'somnium',
-    'somo',
-    'sonates',
-    'sonatinas',
-    'sonet',
-    'songcraft',
-    'songmen',
-    'sonilla',
-    'sonnambula',
-    'sonolidating',
     'sonuvabitch',
-    'soo-bak',
-    'sooks',
-    'sooting',
-    'sophisticut',
-    'sophrony',
-    'sophus',
-    'soplaril',
-    'sopp',
-    'sopranino',
-    'sorafom',
-    'sorbed',
-    'sorely-tried',
-    'sori',
-    'sorolla',
-    'sorree',
     'sorrowed',
-    'sorry&mdash;i',
-    'sortbroget',
-    'sortof',
-    'sosandra',
-    'soteag',
-    'sotino',
-    'sots',
-    'souban',
-    'soubiran',
-    'souces',
-    'souf',
-    'souillon',
-    'soukoyant',
-    'soul-loss',
-    'soul-scarring',
     'souldiers',
-    'soumak',
-    'sound-absorbent',
-    'sound-barrier',
-    'sound-box',
-    'sound-card',
-    'sound-symbolism',
-    'soundoff',
-    'soundscapes',
-    'soup-kitchen',
-    'sourbutts',
-    'source-tape',
-    'sourcebooks',
-    'sourdough',
-    'souterrains',
-    'south-',
     'southborough',
-    'southbourne',
-    'southease',
-    'southeran',
-    'southpark',
-    'soutines',
-    'soutra',
-    'soveraigne',
-    'soviet-israeli',
-    'sovovy',
-    'sovrock',
-    'sowe',
-    'sox-5',
-    'sp&ouml;-&ouml;vp',
-    'space-consuming',
-    'space-heating',
     'space-research',
-    'space-savers',
-    'spaceballs',
-    'spack',
-    'spade-end',
-    'spadge',
-    'spadolini',
-    'spaek',
-    'spalpeen',
-    'spanakopitta',
-    'spandaus',
-    'spandex',
-    'spangling',
-    'spanish-born',
-    'sparcbuilders',
-    'sparclite',
     'spare-room',
-    'sparging',
-    'spargo',
-    'spart',
-    'spartokos',
-    'sparva',
-    'spatted',
-    'spawny',
-    'speak-up',
-    'speaker-change',
-    'spear-butt',
-    'spear-carrier',
-    'spear-head',
-    'spearfishing',
-    'speciall',
-    'specialled',
     'specially-',
-    'specially-developed',
-    'specially-prepared',
-    'species-need',
-    'specking',
-    'speckledy',
-    'spectacle-case',
-    'specthruput',
-    'spectron',
-    'spede',
-    'speech-act-based',
-    'speechmaking',
-    'speed-check',
-    'speed-limit',
-    'speed-table',
-    'speedsailing',
     'speedwriting',
-    'speimens',
-    'speitel',
-    'spell-binder',
-    'spell-book',
-    'spell-check',
-    'spelling-bee',
-    'spellmaster',
-    'spelter',
-    'spendaholic',
-    'spendid',
-    'spenlow',
-    'spennithorne',
-    'spennymore',
-    'spenwood',
-    'spermaceti',
     'spermine',
-    'sperrbrecher',
-    'spetember',
-    'spetsy',
-    'sphagna',
-    'sphereality',
-    'spheroplastic',
-    'sphingosine',
-    'sphondylium',
-    'spica',
-    'spicant',
-    'spickhoff',
-    'spid',
-    'spiderline',
-    'spidey',
-    'spieling',
     'spigelia',
-    'spight',
-    'spin\'',
-    'spin-',
-    'spin-bowling',
-    'spin-doctoring',
-    'spin-drier',
-    'spin-drift',
-    'spin-outs',
-    'spinachia',
-    'spinato',
-    'spindle-whorl',
-    'spindling',
-    'spine-chiller',
-    'spinetta',
-    'spinnerette',
     'spiriferina',
-    'spirit-possession',
-    'spirograph',
-    'spirorbid',
-    'spise',
-    'spit-and-sawdust',
-    'splashplate',
-    'splashproof',
-    'spleep',
-    'splendent',
-    'splodcobblers',
-    'splodging',
-    'spokesworker',
-    'spon',
-    'sponging-house',
-    'sporing',
     'sportant',
-    'sportman',
-    'sports-climbing',
-    'sports-fisherman',
-    'sportsground',
-    'sportsview',
-    'spotlisting',
-    'spotteds',
-    'sprachen',
-    'sprachknabe',
-    'spragg',
-    'spray-gun',
-    'spray-paint',
-    'spraydeck',
-    'spread-spectrum',
-    'spreaded',
     'sprechgesang',
-    'sprechstimme',
-    'sprengler',
-    'sprigg',
-    'spring-form',
-    'spring-making',
-    'springheel',
-    'sprinks',
-    'spruth',
-    'spsi',
-    'spurging',
-    'spx',
-    'spy-catching',
-    'spykers',
-    'spynie',
-    'sqaure',
     'sql-to-oracle',
-    'squ',
-    'squaddy',
-    'square-dance',
-    'square-dancing',
-    'square-faced',
-    'square-mile',
-    'square-towered',
-    'squarefoot',
-    'squarks',
-    'squatriti',
-    'squatt',
-    'squeeze-box',
-    'squelches',
-    'squidgey',
-    'squills',
     'squilver',
-    'squircle',
-    'squirrelfish',
-    'srams',
-    'srd-6sb',
-    'srdjan',
-    'sre',
-    'sreelane',
-    'sreeves',
-    'srf-max72',
-    'srhe',
-    'srivastava',
-    'ss-21',
-    'ss135&mdash;138',
-    'ss198&mdash;206',
-    'ss20&mdash;24',
     'ssac',
-    'ssc-40',
-    'sscm',
-    'ssekitoleko',
-    'ssga',
-    'ssha',
-    'ssi-ncube',
-    'ssshhh',
-    'ssss',
-    'ssst',
-    'st-arneault',
-    'st-merri',
-    'st-wart',
-    'staatsarchiv',
-    'stabell',
-    'stable-jockey',
     'stable-room',
-    'stablegirl',
-    'stablising',
-    'stabstitch',
-    'stackpole',
-    'stadial',
-    'stadiometer',
-    'stadnyk',
-    'staff\'',
-    'staffe',
-    'stageprops',
-    'staghorn',
-    'stainex',
-    'stainey',
-    'staith',
-    'stallingborough',
     'stallings',
-    'stamina-building',
-    'stamp-machine',
-    'stampin\'',
-    'stamping-ground',
-    'stamtord',
-    'stanborough',
-    'stand&ndash;by',
-    'stand-back',
-    'stand-point',
-    'standards-making',
-    'standon',
-    'standortkommandantur',
-    'standy',
-    'staneyburn',
-    'stangls',
     'stanglwirt',
-    'stanners',
-    'stanstreet',
-    'stanwix',
-    'stappert',
-    'star-dust',
-    'star-maker',
-    'star-rating',
-    'star-turn',
-    'starbeck',
-    'starbotton',
-    'starclub',
-    'starfleet',
-    'starlust',
-    'starting-handle',
-    'stashes',
     'stasis-field',
-    'stasis-trunk',
-    'stat&ndash',
-    'state&rehy;owned',
-    'state-administered',
-    'state-developed',
-    'state-inspired',
-    'state-side',
-    'states-sponsored',
-    'stathern',
-    'stationwagon',
-    'statius',
-    'stattauto',
-    'statue-filled',
-    'statute-based',
-    'stauche',
     'stavin',
-    'stbo',
-    'stc-616',
-    'steak-',
-    'steam-bending',
-    'steam-distillation',
-    'steam-heating',
-    'steam-packet',
-    'steam-train',
-    'stearate',
-    'stearmen',
-    'sted',
-    'stedfast',
-    'steel-and-glass',
-    'steel-faced',
-    'steel-maker',
     'steel-shod',
-    'steel-string',
-    'steel-toothed',
-    'steelyards',
-    'steenstrup',
-    'steep-to',
-    'steeplejack',
-    'steeplejacks',
-    'steerpike',
-    'steggles',
-    'steglitz',
-    'stegophiura',
-    'steidel',
-    'steinem',
-    'steinhauser',
-    'steinkern',
     'steinthal',
-    'stellazine',
-    'stellweg',
-    'steniatowski',
-    'stenosed',
-    'step-',
-    'step-angle',
-    'step-change',
-    'step-in',
-    'step-parenting',
-    'stepek',
-    'stepfind',
-    'stepped-down',
-    'steppin\'',
-    'steptech',
-    'stere',
     'stereo-type',
-    'stereospecificity',
-    'stereostructure',
-    'sterling-silver',
-    'sterognost',
-    'sterope',
-    'sterotype',
-    'sterry',
-    'stewarded',
-    'stick-float',
-    'stickies',
-    'stickland',
-    'stickle',
-    'sticksman',
-    'sticky-fingered',
-    'sticky-tape',
     'stienhilper',
-    'stiff-fingered',
-    'stigers',
-    'stigmaria',
-    'stilicho',
-    'still-',
-    'still-birth',
-    'still-existing',
-    'stilo',
-    'stimming',
-    'stinge',
-    'stinkin\'',
-    'stip',
-    'stir-up',
-    'stock-car',
-    'stock-check',
     'stock-ownership',
-    'stock-raising',
-    'stockaded',
-    'stocken',
-    'stocking-making',
-    'stockingsful',
-    'stockjobbers',
-    'stockle',
-    'stockleigh',
-    'stocktakers',
-    'stockturn',
-    'stoddy',
-    'stoicescu',
-    'stojanovic',
-    'stokehold',
-    'stoleroff',
     'stomach-firming',
-    'stomatogastric',
-    'stompers',
-    'stone\'s-throw',
-    'stone-mason',
-    'stone-robbing',
-    'stone-walling',
-    'stone-work',
-    'stonechats',
-    'stonehart',
-    'stonehewer',
-    'stong',
-    'stonkin\'',
-    'stool-pigeon',
-    'stoopid',
-    'stop&mdash',
     'stopham',
-    'stopping-point',
-    'store-bought',
-    'storm-damage',
-    'storm-door',
-    'storm-laden',
-    'storm-troops',
-    'storm-wind',
-    'stormclouds',
-    'storme',
-    'stormscope',
-    'stormwater',
-    'stormwing',
-    'storrow',
-    'story&mdash',
-    'stothers',
     'stotter',
-    'stout-stemmed',
-    'stouthamer',
-    'stove-pipe',
-    'stover',
-    'stowmarket-based',
-    'str.',
-    'strachs',
-    'stradivari',
-    'straight-',
-    'straight-armed',
-    'straight-down-the-middle',
-    'straight-time',
-    'straight-to-the-point',
-    'straight-up',
-    'straightbacked',
     'straightedge',
-    'straightworld',
-    'strakes',
-    'strandlooper',
-    'strangeway',
-    'strangle-hold',
-    'strangman',
-    'stranieri',
-    'straphylococcus',
-    'strategix',
-    'strathfoyle',
-    'straw-plait',
-    'strawb',
-    'strawberry-red',
-    'stream-line',
-    'streamside',
     'streap',
-    'streatfeild',
-    'street-',
-    'street-child',
-    'street-fighter',
-    'street-light',
-    'street-style',
-    'street-sweeper',
-    'streetbeat',
-    'streidel',
-    'stresemann',
-    'stress-coping',
-    'stress-filled',
-    'stress-provoking',
-    'stressed-skin',
-    'stretch-lace',
     'stretchford',
-    'strife-',
-    'strike-ridden',
-    'striking-looking',
-    'string-changing',
-    'string-pulling',
-    'strip-cartoon',
-    'strip-lighting',
-    'strip-o-gram',
-    'stripmining',
-    'strocchi',
-    'strollercoaster',
-    'strom',
-    'stromlo',
-    'stromson',
-    'stronach',
     'stronachs',
-    'stronchullin',
-    'strong-stressed',
-    'strongheart',
-    'strongitharm',
-    'strot',
-    'strother',
-    'struga',
-    'strumenti',
-    'strut-braced',
-    'struutz',
-    'stude',
-    'studier',
-    'stuf',
-    'stump-kicking',
-    'stunkard',
     'sturton',
-    'styche',
-    'styed',
-    'styhead',
-    'style-sheet',
-    'styleset',
-    'stylewave',
-    'stylo-statistician',
-    'stynan',
-    'styrene-butadiene-styrene',
-    'su-24',
-    'suabia',
-    'sub-analyses',
-    'sub-bass',
-    'sub-circuit',
-    'sub-command',
     'sub-commissioner',
-    'sub-department',
-    'sub-humanity',
-    'sub-judice',
-    'sub-licensor',
-    'sub-light',
-    'sub-literate',
-    'sub-micron',
-    'sub-ordinate',
-    'sub-parallel',
-    'sub-plinian',
-    'sub-prefect',
-    'sub-sharan',
-    'subaire',
-    'subasio',
-    'subcommand',
     'subdisciplines',
-    'subframes',
-    'subhash',
-    'subiaco',
-    'subject-index',
-    'subject-verb-object',
-    'subl',
-    'submachineguns',
-    'submarine-based',
-    'submarkets',
-    'subnasal',
-    'subscriber-supplied',
-    'subsources',
-    'subspace',
-    'substitue',
-    'substring',
     'subterranea',
-    'subterraneans',
-    'subtopian',
-    'suburban-style',
-    'suburban-type',
-    'subvent',
-    'succeded',
-    'success-related',
-    'suceeded',
-    'suchow',
-    'sucio',
-    'suctioning',
-    'sudesh',
-    'suerte',
-    'sufferered',
-    'sufferred',
     'sugar-based',
-    'sugar-coating',
-    'sugar-loaf',
-    'sugar-master',
-    'sugarcraft',
-    'suggestin\'',
-    'suhaili',
-    'suhayl',
-    'suiza',
-    'sukemi',
-    'sukhozanet',
-    'sukina',
-    'sukuma',
-    'sulan',
-    'suleman',
-    'sullington',
     'sulloway',
-    'sulpher',
-    'sulphur-containing',
-    'sulphur-nitrogen',
-    'sulphur-removing',
-    'sulphuretted',
-    'sumac',
-    'suman',
-    'sumawe',
-    'sumito',
-    'summer-',
-    'sumners',
-    'sun\'',
-    'sun-386i',
-    'sun-burst',
-    'sun-chair',
     'sun-darkened',
-    'sun-dial',
-    'sun-flecked',
-    'sun-shine',
-    'sun-terrace',
-    'sunbass',
-    'sunbathes',
-    'sunblush',
-    'sunbronzed',
-    'sunbursting',
-    'suncrush',
-    'sunday-afternoon',
-    'sunday-best',
-    'sunderland-born',
-    'sunexpo',
-    'sungold',
     'sunguratex',
-    'sunhats',
-    'sunna',
-    'sunningwell',
-    'sunnink',
-    'sunnyvale-based',
-    'sunscreening',
-    'sunspecs',
-    'sunsystems',
-    'suntech',
-    'suntori',
-    'suntraps',
-    'sup&rehy;plemented',
-    'supamix',
-    'supastart',
-    'super-bagshaw',
     'super-light',
-    'super-loud',
-    'super-pipelined',
-    'super-prey',
-    'super-spy',
-    'supercache',
-    'supercalendered',
-    'supercast',
-    'supercolt',
-    'supercross',
-    'superdome',
-    'supererogatory',
-    'supergrains',
-    'superjon',
-    'superlash',
-    'superlite',
     'supermarch&eacute',
-    'supermarket-type',
-    'supermatch',
-    'superpowered',
-    'supersingle',
-    'superstring',
-    'superstud',
-    'supertrams',
-    'supplicate',
-    'supplicating',
-    'supply\'',
-    'supponitur',
-    'support\'',
-    'supranationalist',
-    'suprex',
-    'surcease',
     'surefooted',
-    'sureshot',
-    'surf-board',
-    'surface-dwelling',
-    'surface-living',
-    'surfboarding',
-    'surfline',
-    'surform',
-    'surfside',
-    'surgeon-major',
-    'surgimed',
-    'surnamed',
-    'surplus-product',
-    'surprisin\'',
-    'sursee',
-    'sursum',
     'surtaxes',
-    'surv',
-    'susak',
-    'susans',
-    'suscipere',
-    'susenyos',
-    'suspender-belt',
-    'sustain\'',
-    'sutor',
-    'sux',
-    'suy',
-    'sv-4c',
-    'svan',
-    'svante',
-    'svetozar',
-    'svf',
     'svoj',
-    'swaddle',
-    'swadesh',
-    'swagging',
-    'swalk',
-    'swallow-dive',
-    'swamp-dwelling',
-    'swan-dive',
-    'swanborough',
-    'swanick',
-    'swannington',
-    'swansea-based',
-    'swap-deal',
-    'swapo-democrats',
-    'swash-buckling',
-    'swatter',
     'swayam',
-    'sweat-filled',
-    'swedhouse',
-    'sweep-picked',
-    'sweet-talked',
-    'sweet-tooth',
-    'sweetbriar',
-    'sweetly-smelling',
-    'sweetmix',
-    'sweety-pie',
-    'sweg',
-    'swellin\'',
-    'swilers',
-    'swin',
-    'swindelli',
-    'swinden',
     'swing-',
-    'swing-weight',
-    'swingbeat',
-    'swingbridge',
-    'swingle',
-    'swingler',
-    'swingtip',
-    'swip',
-    'swipin\'',
-    'swir',
-    'swires',
-    'swiss-type',
-    'swit',
-    'switch-blade',
-    'switchbacked',
-    'switchblades',
     'switchcraft',
-    'switchguard',
-    'swoll',
-    'swollen-headedness',
-    'swona',
-    'sword-thrust',
-    'swordfight',
-    'swordplants',
-    'sworls',
-    'swrb',
-    'swyved',
-    'sybil.',
-    'sybils',
-    'sycomore',
-    'sylfaen',
-    'sylke',
     'sylko',
-    'syllepsis',
-    'symmys',
-    'sympathique',
-    'symphonia',
-    'synares',
-    'synchro-energiser',
-    'synchroworks',
-    'syng',
-    'synnema',
-    'synott',
-    'synphonia',
-    'syntactics',
-    'synth&egrave;se',
-    'synthaxe',
-    'synthdiet',
     'synthetic-aperture',
-    'syphilinum',
-    'syrian-sponsored',
-    'syrian-supported',
-    'sysplex',
-    'syst',
-    'systat',
-    'syste',
-    'system-sentence',
-    'syva',
-    'syvota',
-    'szalatnay',
-    'szentagothai',
-    'szilvassy',
-    't&eacute;l&eacute;vision',
-    't&eacute;n&egrave;bres',
     't&ecirc;te-&aacute;-t&ecirc;te',
-    't&egrave',
-    't&ndash;6s',
-    't&oslash;gdr&aacute;pa',
-    't\'check',
-    't\'doctor',
-    't\'ent',
-    't\'full',
-    't\'home',
-    't\'sheep',
-    't\'start',
-    't\'stay',
-    't\'take',
-    't\'would',
-    't-28',
-    't-33',
     't-34',
-    't-55',
-    't-6g',
-    't-bass',
-    't-connector',
-    't-shape',
-    't-tubule',
-    't.t',
-    't480',
-    't5-sb',
-    't80',
-    'ta\'',
-    'tabanus',
-    'tabby-cat',
-    'table\'',
-    'table-fellowship',
     'table-football',
-    'table-lighter',
-    'table-linen',
-    'table-slip',
-    'table-tapping',
-    'tablelands',
-    'tablemats',
-    'tabler',
-    'tabora',
-    'tabou',
-    'tachisme',
-    'tackhead',
-    'tackleton',
-    'tactesse',
-    'taddy',
-    'tadese',
     'tadino',
-    'taekata',
-    'taeymans',
-    'tafler',
-    'tages',
-    'tagetes',
-    'tahrir',
-    'tahu',
-    'tail-bar',
-    'tail-gating',
-    'tail-gunner',
-    'tail-wagger',
-    'tailbrigg',
-    'tailcoated',
-    'tailend',
-    'tained',
     'taiwan-china',
-    'taize',
-    'tajura',
-    'tak\'',
-    'takara',
-    'takashimaya',
-    'take-',
-    'taken&rehy;for-granted',
-    'takla',
-    'talcy',
-    'talhouni',
-    'talkshows',
-    'tallensi',
-    'tallmantz',
-    'talukdar',
-    'talyor',
     'tamarinds',
-    'tambrands',
-    'tambura',
-    'tamisier',
-    'tamlaght',
-    'tampion',
-    'tams',
-    'tanaris',
-    'tancare',
-    'tandia',
-    'tane',
-    'tangerang',
-    'tangle-free',
-    'tangora',
-    'tangut',
-    'tanis',
     'tankage',
-    'tannat',
-    'tannenhof',
-    'tannesterben',
-    'tannhof',
-    'tannoyed',
-    'tanta',
-    'tantalises',
-    'tap-root',
-    'tap-tap-tapping',
-    'tapa',
-    'taphrina',
-    'tapiola',
-    'taquaral',
-    'taramala',
-    'tarascan',
     'taraxacum',
-    'tarazi',
-    'tarbooshes',
-    'tarcondimotus',
-    'tarde',
-    'tardebigge',
-    'tardini',
-    'taree',
-    'targ',
-    'targons',
-    'targum',
-    'tariffing',
-    'tarnero',
-    'tarpaulin-covered',
-    'tarrying',
-    'tarshish',
     'tartarean',
-    'tarvie',
-    'tascher',
-    'tasher',
-    'task-master',
-    'taslen',
-    'taslim',
-    'tasnim',
-    'taspor',
-    'tassie',
-    'tassinari',
-    'tategoi',
-    'tatem',
-    'tatenen',
-    'tatry',
-    'tatsumi',
     'tatterdemalion',
-    'tattier',
-    'tauchnitz',
-    'taugwalder',
-    'tauler',
-    'taumetric',
-    'taurt',
-    'tauxi&egrave;res',
-    'tavastian',
-    'tavic',
-    'tavius',
-    'tawana',
-    'tawaret',
-    'tax-accounting',
-    'tax-dodger',
-    'tax-evasion',
     'tax-reforming',
-    'taxi-man',
-    'taxi-ride',
-    'taygetos',
-    'taylorcraft',
-    'taywood',
-    'tcid',
-    'tcp-ip',
-    'tcpware',
-    'tcsc',
-    'tdong',
-    'tdsob',
-    'te-lc',
-    'tea-gown',
-    'tea-growing',
-    'tea-leaf',
     'tea-taster',
-    'teabreaks',
-    'teacher-learner',
-    'teacher-participation',
-    'teacosy',
-    'teagasc',
-    'teagle',
-    'teamworks',
-    'teaparty',
-    'tearducts',
-    'tearscross',
-    'teba',
-    'tebor',
-    'tec-huc',
-    'tech-sep',
-    'tech-tech',
     'technicals',
-    'technicien',
-    'technicolored',
-    'technobabble',
-    'technolgy',
-    'technolog',
-    'technologically-orientated',
-    'technology-transfer',
-    'technotribe',
-    'tecnimont',
-    'tecnomarine',
-    'tecsidel',
-    'tectip',
-    'teddy-tail',
-    'teddybear',
-    'teddys',
     'tedesco',
-    'tee-box',
-    'teenact',
-    'teeny-bopper',
-    'teeth-chattering',
-    'teeth-grinding',
-    'teethe',
-    'tefal',
-    'teggy',
-    'tegner',
-    'tehuac&aacute;n',
-    'tei-conformant',
-    'tekhne',
-    'tekke',
-    'teknetics',
-    'tel-boy',
     'telco',
-    'tele-tots',
-    'tele-vision',
-    'telecasts',
-    'telecentre',
-    'telecommunicated',
-    'telefilm',
-    'telegu',
-    'teleindustria',
-    'telekos',
-    'telemark',
-    'telematique',
-    'telemetering',
-    'telephone-call',
-    'teleported',
-    'teleports',
     'telepresence',
-    'telerobotics',
-    'telescopium',
-    'television-style',
-    'televsion',
-    'telleth',
-    'tellima',
-    'telman',
-    'telmat',
-    'tels',
-    'telscombes',
-    'temaru',
-    'temiskamming',
-    'temkin',
-    'temora',
-    'temped',
     'temperature-sensitivity',
-    'tempete',
-    'templux',
-    'temporales',
-    'temporalia',
-    'temporized',
-    'tempsford',
-    'ten-coach',
-    'ten-course',
-    'ten-date',
-    'ten-furrow',
-    'ten-gun',
-    'ten-ish',
-    'ten-lane',
-    'ten-part',
-    'ten-per-cent',
     'ten-quid',
-    'ten-seat',
-    'ten-seater',
-    'ten-speed',
-    'ten-under-par',
-    'ten-wheeler',
-    'tenant-finding',
-    'tenanting',
-    'tenasserim',
-    'tender-crisp',
-    'tenderfoot',
-    'tendre',
-    'tendresse',
-    'tendrilled',
-    'tendulkars',
-    'tenesor',
     'tenessee',
-    'tennesse',
-    'tennessean',
-    'tennis-player',
-    'tenrag',
-    'tent-life',
-    'teodato',
-    'ter&aacute;n',
-    'teraflops',
-    'terdam',
-    'tere',
-    'teres',
-    'terfel',
-    'terfenadine',
-    'terminborse',
-    'terni',
     'terra-firma',
-    'terram',
-    'terravision',
-    'terre\'blanche',
-    'terres',
-    'terrier-type',
-    'terriere',
-    'territories.',
-    'territory-by-territory',
-    'terror-bombing',
-    'terror-inspiring',
-    'terror-struck',
-    'terroriste',
-    'tesar',
-    'tese',
-    'tessanna',
     'tessies',
-    'test&rehy;playing',
-    'test-match',
-    'test-rig',
-    'testing-ground',
-    'tetouan',
-    'tetra-ethyl',
-    'tetrafin',
-    'tetragrammaton',
-    'tetramethylbenzidine',
-    'tetrapak',
-    'tetrax',
-    'tetu',
-    'tetzlaff',
-    'teutscher',
-    'tewari',
     'textron',
-    'teyler',
-    'teyrn',
-    'tfa',
-    'tfiis',
-    'tge',
-    'th&uuml;ringen',
-    'th\'best',
-    'th\'fuck',
-    'th\'looks',
-    'th\'mean',
-    'th\'message',
-    'th\'other',
-    'th\'said',
-    'th\'tongue',
-    'th-that',
     'thagard',
-    'thaht',
-    'thai-phoon',
-    'thal&eacute;n',
-    'thalictroides',
-    'thammathirat',
-    'thamnophis',
-    'thamrong',
-    'thanatosis',
-    'thangbrand',
-    'thanke',
-    'thare',
-    'tharn',
-    'thas',
-    'that-a-way',
-    'that_at',
     'that_for',
-    'that_in',
-    'thatcherist',
-    'thawing-out',
-    'thaxton',
-    'the&mdash',
-    'theare',
-    'theatre-in-the-round',
-    'theatre-style',
-    'theatrum',
-    'thebaine',
-    'theer',
-    'thefirst',
-    'theissen',
-    'thelmthorpe',
-    'thelwell',
     'themelthorpe',
-    'then\'',
-    'then-',
-    'thenotsy',
-    'theodom',
-    'theodorescu',
-    'theodossin',
-    'theognis',
-    'theologico-politicus',
-    'theoneste',
-    'theophanu',
-    'theophrastos',
-    'theory-making',
-    'theotokos',
-    'theresien',
-    'thermalite',
     'thermax',
-    'thermo-fixing',
-    'thermoflect',
-    'thermogravimetric',
-    'thermon',
-    'thermostatted',
-    'thern',
-    'theta-burst',
-    'thetas',
-    'theutbald',
-    'thexton',
-    'they\'e',
-    'theywere',
-    'thiaumont',
-    'thick-cut',
-    'thick-knee',
     'thicketed',
-    'thickwire',
-    'thiebaut',
-    'thietart',
-    'thilke',
-    'thing\'',
-    'thing-gummyjig',
-    'thingley',
-    'thingumajiggy',
-    'think\'',
-    'thinking\'',
-    'thinly-cut',
-    'thinn',
-    'thiokol',
-    'thiollay',
-    'thiongo',
     'thiophanate',
-    'thioridazine',
-    'thiq',
-    'third-born',
-    'third-top',
-    'third-trimester',
-    'thirlaway',
-    'thirteenish',
-    'thirties-style',
-    'thirty-pound',
-    'thirtyfive',
-    'this&mdash',
-    'this\'n',
-    'thissen',
-    'thmar',
-    'thoday',
     'thoery',
-    'thomi',
-    'thomis',
-    'thonging',
-    'thorden',
-    'thorhavn',
-    'thorismund',
-    'thornborrows',
-    'thornproof',
-    'thornton-brown',
-    'thort',
-    'thorton',
-    'thought&rehy;provoking',
-    'thought-experiment',
-    'thousand-foot',
-    'thousand-mile',
     'thousand-page',
-    'thousand-yard',
-    'thousiding',
-    'thow',
-    'three&rehy;year',
-    'three-and-a-half-hour',
-    'three-and-a-half-year-old',
-    'three-cpu',
-    'three-eyed',
-    'three-form',
-    'three-hundred-dollar',
-    'three-ish',
-    'three-link',
-    'three-model',
-    'three-pointer',
-    'three-port',
     'three-quarter-hour',
-    'three-setter',
-    'three-story',
-    'three-tooth',
-    'three-view',
-    'three-wavelength',
-    'three-wheeler',
-    'threee',
-    'threepart',
-    'threepwood',
-    'thrice-decorated',
-    'throat-clearing',
-    'throat-slitting',
-    'throop',
-    'through\'',
-    'through-bond',
     'through-pass',
-    'through-the-line',
-    'throughfares',
-    'throw-out',
-    'throw-weight',
-    'throwed',
-    'thru\'',
-    'thuban',
-    'thuggee',
-    'thugut',
-    'thunderpaddy',
-    'thunhurst',
-    'thursley',
-    'thwaits',
-    'thyangboche',
-    'thymol',
     'thyng',
-    'thynn',
-    'thyrsis',
-    'ti\'',
-    'ti\'ro',
-    'tiananmen-style',
-    'tibble',
-    'tichborne',
-    'tick-tick-tick',
-    'ticket-buying',
-    'ticket-holder',
-    'tickit',
-    'tidball',
-    'tiddled',
-    'tiddles',
-    'tiddley',
     'tide-pool',
-    'tided',
-    'tie-ridging',
-    'tiede',
-    'tiens',
-    'tiereel',
-    'tigh',
-    'tight-faced',
-    'tight-shut',
-    'tight-wad',
-    'tightfisted',
-    'tigy',
-    'tihange',
-    'tikopia',
-    'tikva',
-    'tilapias',
     'tile-covered',
-    'tile-work',
-    'tilghman',
-    'tillerettes',
-    'tillet',
-    'tillo',
-    'timah',
-    'timball',
-    'timber-framing',
-    'timber-growing',
-    'timberline',
-    'time&mdash',
-    'time-cycle',
-    'time-filler',
-    'time-reversal',
-    'time-sense',
     'time-sphere',
-    'time-trial',
-    'timebound',
-    'timecard',
-    'timeform',
-    'timewasters',
-    'timezone',
-    'timgad',
-    'timimi',
-    'timmerman',
-    'timmo',
-    'timney',
-    'timoth&eacute;e',
-    'tinea',
-    'tinga',
-    'tinging',
     'tingler',
-    'tinkler-gypsies',
-    'tinselled',
-    'tintacks',
-    'tiny\'',
-    'tip-tank',
-    'tippled',
-    'tipz',
-    'tira',
-    'tirard',
-    'tirolean',
-    'tirrukkovil',
-    'tisa',
-    'tisl',
-    'tissued',
-    'titio',
     'titivated',
-    'tittupping',
-    'tixier',
-    'tjia',
-    'tjokroaminoto',
-    'tkach',
-    'tloome',
-    'to-the-point',
-    'toast-rack',
-    'tobol',
-    'tochigi',
-    'todaysat',
-    'toddle-bike',
-    'toddles',
-    'toe-in',
-    'toe-poke',
     'toe-tapped',
-    'toetuses',
-    'toga-clad',
-    'toglia',
-    'togther',
-    'toilet-bowl',
-    'toilet-train',
-    'toilet-trained',
-    'toing-and-froing',
-    'tokio',
-    'tokomak',
-    'tolbiac',
-    'toler',
-    'toll-in-kind',
-    'tolliver',
-    'tollo',
     'tolmiea',
-    'tom-frode',
-    'tomado',
-    'tomaszewski',
-    'tomato-sauce',
-    'tomb-chest',
-    'tomb-maker',
-    'tombe',
-    'tombi',
-    'tomioka',
-    'tomme',
-    'tommee',
-    'tomorn',
-    'tomoto',
-    'tompion',
-    'ton-mile',
     'tonged',
-    'tongue-tip',
-    'tonhalle',
-    'tonique',
-    'tonite',
-    'tonni',
-    'tonsuring',
-    'tonvit',
-    'tooks',
-    'tool-room',
-    'tool-to-tool',
-    'toolsets',
-    'toom',
-    'toomu',
-    'toone',
-    'tooth-brush',
     'tooth-comb',
-    'toothill',
-    'tootle',
-    'top-40',
-    'top-copy',
-    'top-covered',
-    'top-grossing',
-    'top-management',
-    'top-performing',
-    'topaze',
-    'tophatted',
-    'topic-change',
-    'topic-control',
-    'topicline',
-    'topknots',
-    'toplin',
     'topoi',
-    'toppe',
-    'toppin\'',
-    'topsfield',
-    'topsy-turviness',
-    'toral',
-    'torbett',
-    'torcato',
-    'torchietti',
-    'toribiong',
-    'torna',
-    'toros',
-    'torrence',
-    'torrigiano',
-    'torrina',
-    'tortelloni',
     'tortex',
-    'tortue',
-    'tortuga',
-    'torvean',
-    'torwada',
-    'totalisator',
-    'totanus',
-    'tothe',
-    'totman',
-    'tott',
-    'touch&eacute;e',
-    'touch-control',
-    'touch-pad',
-    'touchaleaume',
-    'touchee',
-    'touchprint',
     'tough-skinned',
-    'toughy',
-    'tourache',
-    'tournedos',
-    'tournoux',
-    'tousle-headed',
-    'touzeau',
-    'tovar',
-    'towe',
-    'toweel',
-    'towerview',
-    'towland',
-    'townshends',
-    'toymaking',
-    'tp-920',
-    'tpca',
     'tpframe',
-    'tr&aacute;fico',
-    'traa',
-    'trabbi',
-    'track-laying',
-    'track-maintenance',
-    'track-suit-style',
-    'tracklaying',
-    'tractarianism',
-    'tractor-mower',
-    'trad-rock',
-    'trade-promotion',
-    'tradenet',
-    'traffic-jam',
-    'traficant',
-    'trag&ouml;die',
     'tragino',
-    'tragique',
-    'trailered',
-    'trailing-edge',
-    'train-tube',
-    'traincrew',
-    'trakl',
-    'trampy',
-    'tramroads',
-    'tranquillize',
-    'tranquillized',
-    'trans-act',
-    'trans-activator',
-    'trans-ocean',
-    'trans-species',
-    'transaction&mdash;the',
     'transaction-based',
-    'transart',
-    'transcendentalization',
-    'transcendentalized',
-    'transcoding',
-    'transdisciplinary',
-    'transfecting',
-    'transfer-deadline',
-    'transfer-printing',
-    'transfering',
-    'transfix',
-    'transhumant',
-    'transition\'',
-    'transliterated',
-    'transmitters/bugs/telephone',
-    'transocean',
     'transpapillary',
-    'transpor',
-    'transporter-erector',
-    'transshipped',
-    'transtrem',
-    'transversed',
-    'transversely-mounted',
-    'tranwood',
-    'tranzophobia',
-    'trapa',
-    'trapline',
-    'traumatizing',
-    'trautenau',
-    'trav',
-    'travado',
-    'trave',
     'travel-writing',
-    'travelback',
-    'travelex',
-    'travelscene',
-    'travelsphere',
-    'travesura',
-    'trayful',
-    'treasure-hunting',
-    'trebuchets',
-    'treby',
-    'tree-frog',
-    'treebank',
-    'treeton',
-    'treffrey',
-    'trefgarne',
-    'trefoiled',
     'tregalan',
-    'tregerthen',
-    'tregidon',
-    'trehane',
-    'treichler',
-    'treleidir',
-    'trematodes',
-    'trembuckers',
-    'trender',
-    'treneague',
-    'trenette',
-    'trepanned',
-    'tresemme\'',
-    'tresorerie',
-    'tresspass',
-    'treveal',
     'trever',
-    'trevisano',
-    'trewartha',
-    'trewe',
-    'trezeta',
-    'trg',
-    'trhe',
-    'tri-',
-    'tri-laminate',
-    'tria',
-    'trial-type',
-    'trialing',
-    'triamine',
-    'trian',
-    'triandha',
-    'tribal-based',
     'tribalist',
-    'tribhuvan',
-    'tribolo',
-    'tribonyx',
-    'tribuna',
-    'tributer',
-    'tributing',
-    'tricast',
-    'trichology',
-    'tricker',
-    'tricolore',
-    'tricolori',
-    'tridacna',
-    'triduum',
-    'trifluralin',
-    'trigen',
     'triglaf',
-    'trijet',
-    'trilaminar',
-    'trinci',
-    'trini',
-    'trinitrate',
-    'trinomic',
-    'trintoc',
-    'triona',
-    'triose',
-    'tripartisme',
-    'tripeptide',
-    'triphosphor',
-    'triple-bypass',
-    'triple-shell',
-    'triplicatella',
     'triply-degenerate',
-    'triptyque',
-    'tripwire',
-    'trisaccharide',
-    'tristesse',
-    'tristran',
-    'triumph-adler',
-    'trivector',
-    'trna-molecule',
-    'troad',
-    'troble',
-    'troglodytic',
-    'trogons',
-    'troiz&emacr;n',
-    'trollslayer',
-    'trompf',
     'tronix',
-    'troph&eacute;e',
-    'tropheus',
-    'trotty',
-    'troublemaking',
-    'trousering',
-    'trowles',
-    'trows',
-    'troxy',
-    'trp121',
-    'truckle-bed',
-    'trued',
-    'truffe',
-    'trugs',
-    'trunked',
-    'truno',
     'trussel',
-    'trust-based',
-    'truth-force',
-    'truth-talk',
-    'truthe',
-    'try-saving',
-    'tryi',
-    'trypsinised',
-    'tshipinare',
-    'tsiba',
-    'tsink',
-    'tsip',
-    'tsuchida',
-    'tsukamoto',
-    'tsvolas',
-    'tu-154',
     'tu-16',
-    'tube-ride',
-    'tuck-box',
-    'tuck-shop',
-    'tueday',
-    'tues-fri',
-    'tufteds',
-    'tug-of-love',
-    'tuhula',
-    'tuibua',
-    'tukuls',
-    'tulf',
-    'tulodo',
-    'tummy-bug',
-    'tumour-inducing',
-    'tundergarth',
     'tuni',
-    'tunicate',
-    'tuning-up',
-    'tunnock',
-    'tunns',
-    'turaatid',
-    'turba',
-    'turban-style',
-    'turbo-fan',
-    'turbo-generator',
-    'turboshafts',
-    'turcoman',
-    'turf-covered',
-    'turfman',
-    'turkeycock',
-    'turmoiled',
     'turnarounds',
-    'turnix',
-    'turnor',
-    'turnstall',
-    'turtle-shell',
-    'tusculum',
-    'tushkar',
-    'tustain',
-    'tutamkhatan',
-    'tutta',
-    'tutuola',
-    'tuv',
-    'tuvans',
-    'tuxy',
-    'tv-style',
-    'tv-viewing',
     'tverskoy',
-    'twamley',
-    'twayblade',
-    'tweedside',
-    'tweezered',
-    'twelve-',
-    'twelve-day',
-    'twelve-mile',
-    'twenty&mdash;five',
-    'twenty\'',
-    'twenty-eight-year',
-    'twenty-first.',
-    'twenty-page',
-    'twere',
-    'twice-a-week',
-    'twigworth',
     'twin-blade',
-    'twin-chassis',
-    'twin-lens',
-    'twin-rail',
-    'twin-tracking',
-    'twinfoil',
-    'twirly',
-    'twitchet',
-    'two&ndash;tone',
-    'two-act',
-    'two-clause',
-    'two-dimensionality',
-    'two-dogs-dying',
-    'two-domain',
-    'two-figure',
-    'two-frame',
     'two-guinea',
-    'two-hundred-year',
-    'two-in-hand',
-    'two-instrument',
-    'two-light',
-    'two-partner',
-    'two-penny',
-    'two-pole',
-    'two-roll',
-    'two-sign',
-    'two-thousand-foot',
-    'two-unit',
-    'twoer',
-    'twot',
-    'twout',
-    'twt',
     'txcficg',
-    'txn',
-    'tying-up',
-    'tymnet',
-    'tympanograms',
-    'tyms',
-    'tyninghame',
-    'tynwald',
-    'type-token',
-    'type-writer',
-    'typographica',
-    'tyr8-substance',
-    'tyrannic',
-    'tyrannized',
-    'tyrannosaur',
-    'tyrannus',
     'tyrocidine',
-    'tyrol-alpenhof',
-    'tythe',
-    'tytler',
-    'tzigane',
-    'u-23',
-    'u-593',
-    'u-tapao',
-    'u6000s',
-    'ubbelohde',
-    'ubf',
-    'ubiquinone',
-    'ucjba',
-    'uck',
-    'ucles',
-    'ucok',
     'udh',
-    'udpa',
-    'ueno',
-    'ufdrop',
-    'ufmd',
-    'ufu',
-    'uget',
-    'uhhh',
-    'uicc',
-    'uil',
-    'uintacrinus',
-    'uj',
-    'ujong',
-    'uk-published',
-    'ukccc',
-    'ukela',
     'ukj',
-    'ukpo',
-    'ulaan',
-    'ulc',
-    'ulccs',
-    'ulcus',
-    'ulnar',
-    'ulrome',
-    'ulster-made',
-    'ultra-fit',
-    'ultra-lite',
-    'ultra-militant',
-    'ultra-radical',
-    'ultra-rightwing',
-    'ultra-secret',
-    'ultra-trace',
     'ultracentrifuge',
-    'ultrahigh',
-    'ultramicrotome',
-    'uludere',
-    'ulvington',
-    'umast',
-    'umbs',
-    'un-appointed',
-    'un-dressing',
-    'un-hinted',
-    'un-made',
-    'un-numbered',
-    'un-published',
-    'un-slept',
-    'unalarming',
-    'unaltering',
     'unbelligerent',
-    'unbelonging',
-    'unbreathing',
-    'unbuckles',
-    'unbuild',
-    'uncap',
-    'unchaining',
-    'uncharming',
-    'uncia',
-    'unco-ordination',
-    'uncoating',
-    'uncomfy',
-    'uncomplex',
-    'unconformity-related',
-    'undarwinian',
-    'undeceive',
     'undecidables',
-    'under-23s',
-    'under-30s',
-    'under-35',
-    'under-5',
-    'under-achieve',
-    'under-compensated',
-    'under-counting',
-    'under-developing',
-    'under-hand',
-    'under-paying',
-    'under-regarded',
-    'under-representing',
-    'under-rewarded',
-    'under-running',
-    'under-served',
     'under-sink',
-    'under-sized',
-    'under-spending',
-    'under-staffing',
-    'under-stocked',
-    'under-taking',
-    'under-utilized',
-    'under-values',
-    'under-writing',
-    'undercoating',
-    'undercounting',
-    'underemphasize',
-    'underglaze',
-    'underground-',
-    'undergrown',
-    'underlaying',
     'underlinen',
-    'underpant',
-    'underpay',
-    'underprices',
-    'underrecording',
-    'underseas',
-    'undersecretaries',
-    'undershaft',
-    'underslating',
-    'underslunky',
-    'understand\'',
-    'understandin\'',
-    'undersung',
-    'undikai',
-    'undisturbing',
-    'unece',
     'unen',
-    'unenlightening',
-    'unesco-sponsored',
-    'unfair\'',
-    'unfetter',
-    'unfixing',
-    'unflickering',
-    'unforecast',
-    'unfound',
-    'ungeheuer',
-    'ungomap',
-    'ungroup',
-    'unharness',
-    'unholiness',
-    'unhrc',
-    'uni-gram',
     'unibank',
-    'unicentre',
-    'unicyle',
-    'unifacts',
-    'unilog',
-    'unimix',
-    'unin',
-    'uningratiating',
-    'union\'',
-    'union-backed',
-    'union-republican',
-    'unipac',
-    'uniprofor',
-    'unirii',
-    'unis',
-    'unit-cost',
     'unitedly',
-    'universel',
-    'universitaria',
-    'university\'',
-    'university-related',
-    'univolt',
-    'unix-',
-    'unix-on-iapx-86',
-    'unix-run',
-    'unix-to-nt',
-    'unknots',
-    'unkown',
-    'unmanageability',
-    'unmanning',
-    'unmeaning',
-    'unmodern',
     'unmown',
-    'unnethes',
-    'unoffending',
-    'unosom',
-    'unpaying',
-    'unpeel',
-    'unpeg',
-    'unpitying',
-    'unreforming',
-    'unrefreshing',
-    'unrounding',
-    'unsafety',
-    'unsat',
-    'unsaturates',
-    'unsealing',
-    'unselfing',
     'unsensationalist',
-    'unsent',
-    'unsex',
-    'unsheathe',
-    'unshorn',
-    'unsmart',
-    'unsnapping',
-    'unsterile',
-    'unsubscribe',
-    'untensing',
-    'untertor',
-    'unwedging',
-    'unweighting',
-    'uova',
-    'up&lsqb',
-    'up&ndash;to&ndash;date',
     'up-and-running',
-    'up-from-under',
-    'up-penalty',
-    'up-stroke',
-    'up-sun',
-    'up-trading',
-    'upchuck',
-    'updrawn',
-    'updrs',
-    'upflung',
-    'upg',
-    'upl',
-    'upline',
-    'uplink',
-    'upmaking',
-    'upper-body',
     'upper-habber',
-    'upper-lipped',
-    'upper-plate',
-    'upper-working',
-    'uppercuts',
-    'uproars',
-    'upshift',
-    'upsizing',
-    'upsons',
-    'uptakes',
-    'upup',
-    'uracil',
-    'uragas',
-    'uranium-enrichment',
-    'urartian',
-    'urate',
     'ureaplasma',
-    'urizen',
-    'urlar',
-    'urne',
-    'urosevac',
-    'urquhart-dykes',
-    'urr&aacute',
-    'urrgh',
-    'uruguayans',
-    'urumqi',
-    'urushiol',
-    'us-epa',
-    'usa-made',
-    'usace',
-    'usarfu',
-    'usasc',
     'uscfrea',
-    'useformfeed',
-    'usefull',
-    'user-chooser',
-    'usher-walker',
-    'uskevagh',
-    'usko',
-    'usle',
-    'usm-quoted',
-    'usowi',
-    'usps',
-    'usry',
-    'usumancinta',
-    'usvi',
-    'ut&ndash;1',
-    'utendi',
     'utet',
-    'utis',
-    'utz',
-    'uv-light',
-    'uwaydah',
-    'uwf',
-    'uwi',
-    'uwist',
-    'uyeshiba',
-    'uz',
-    'uzbaks',
-    'v&auml;rmland',
-    'v&iacute;tor',
-    'v&ndash',
-    'v\'',
-    'v-band',
     'v-cam',
-    'v-domain',
-    'v-groove',
-    'v-jointed',
-    'v-tail',
-    'v-type',
-    'v.k.',
-    'v33',
-    'va-rna',
-    'vacabond',
-    'vachon',
-    'vacumatic',
-    'vacuum-tube',
-    'vaenga',
-    'vahumpuras',
-    'vahun',
     'vaissiere',
-    'vait',
-    'vakhtang',
-    'val&egrave;re',
-    'valcanover',
-    'valceboll&egrave;re',
-    'vald&scaron;tejn',
-    'valdengo',
-    'valdese',
-    'valdostano',
-    'valentis',
-    'vallabriga',
-    'valleyfield',
-    'vallies',
-    'valloni',
-    'valman',
     'valorize',
-    'valschena',
-    'valuate',
-    'value(s)',
-    'value-chain',
-    'value-position',
-    'valuepoints',
-    'valve-based',
-    'vanauken',
-    'vanbergen',
-    'vanberr',
-    'vand',
-    'vandal-hit',
-    'vandergelder',
-    'vanderpant',
-    'vandervalk',
     'vandervell',
-    'vanner',
-    'vannessa',
-    'vantini',
-    'vapona',
-    'varg',
-    'varicoloured',
-    'varie',
-    'vario-steaming',
-    'varitone',
-    'varity',
-    'varved',
-    'vasamedics',
-    'vasary',
-    'vasca',
-    'vasculitides',
     'vase-picture',
-    'vasescu',
-    'vaso-constriction',
-    'vasodilating',
-    'vat-free',
-    'vateesatokit',
-    'vatersay',
-    'vaticani',
-    'vaticano',
-    'vaudier',
-    'vautier',
-    'vaxnotes',
-    'vayu',
-    'vazguen',
-    'vc-7',
-    'vdiff',
     'vdrl',
-    'veba',
-    'vecht',
-    'vectastain',
-    'vectis',
-    'vectoring',
-    'vectorised',
-    'vedius',
-    'vedran',
-    'vees',
-    'vefa',
-    'vegas-style',
-    'vegatables',
-    'vegetating',
-    'veicht',
-    'vekaplast',
     'velcroed',
-    'velcros',
-    'veldhoek',
-    'veleta',
-    'venator',
-    'vendana',
-    'vendome',
-    'veneur',
-    'venganza',
-    'vengeance-seeking',
-    'venire',
-    'venkitaraman',
-    'vennels',
-    'venners',
-    'ventilates',
-    'ventilation-perfusion',
     'ventiquattrofogli',
-    'ventouse',
-    'venuses',
-    'venville',
-    'verapamil',
-    'verb-schema',
-    'verdet',
-    'verdin',
-    'verdoorn',
-    'verfassung&rehy;schutz',
-    'verfassungsrecht',
-    'vergisst',
-    'verjux',
-    'verkehrssysteme',
-    'vermiculated',
-    'vermulen',
     'veroni',
-    'veronicas',
-    'veronika',
-    'verr',
-    'verrrry',
-    'versatec',
-    'versfeld',
-    'versyss',
-    'vertan',
-    'verticillium',
-    'verticorama',
-    'very-low-fat',
-    'vesiculated',
-    'vessa',
-    'vessel-wall',
-    'vesti',
     'vestri',
-    'veza',
-    'vhs-format',
-    'vht',
-    'viacheslav',
-    'vianden',
-    'vibration-free',
-    'vic-20',
-    'vice-clamp',
-    'vice-marshals',
-    'vice-master',
-    'vicegerent',
-    'vicentino',
-    'vichyite',
-    'vickris',
-    'victim-state',
     'victorius',
-    'victual',
-    'vidable',
-    'vidalin',
-    'vidarabine',
-    'video-',
-    'video-led',
-    'video-maker',
-    'video-making',
-    'video-viewing',
-    'videorecorders',
-    'videotron',
-    'vides',
-    'vidi',
-    'vido',
-    'vidoe',
     'viennois',
-    'viewstar',
-    'vigitalle',
-    'viib',
-    'viiii',
-    'village-style',
-    'villagr&aacute;n',
-    'villain\'',
-    'villarsia',
-    'villatoro',
-    'vimer',
-    'vimol',
-    'vinas',
-    'vincy',
-    'vindice',
-    'vindonissa',
     'vinhurst',
-    'vinotheque',
-    'vinyl-covered',
-    'violenza',
-    'violin-leader',
-    'violin-playing',
-    'violone',
-    'vipera',
-    'virgilia',
-    'virginie',
-    'viri',
-    'viring',
-    'viris',
-    'virol',
-    'visayas',
-    'viscaya',
     'visceral-specifc',
-    'viscom',
-    'visconde',
-    'visitron',
-    'visqueen',
-    'vissi',
-    'visting',
-    'visual-judgement',
-    'vitaliy',
-    'vitalstatistix',
-    'vitellozzi',
-    'vitex',
-    'vitm',
-    'vitre',
-    'vitti',
-    'vivagen',
     'vivani',
-    'vivarini',
-    'viveash',
-    'vivers',
-    'viviano',
-    'vividly-coloured',
-    'vla&scaron;im',
-    'vla-6',
-    'vladika',
-    'vlas',
-    'vlieghe',
-    'vlu',
-    'vmi',
-    'vna',
-    'vodafax',
-    'vodata',
     'vogosca',
-    'vogued',
-    'voice\'',
-    'voice-print',
-    'voicewriter',
-    'voici',
-    'voider',
-    'voigny',
-    'voipreux',
-    'voiture',
-    'volant',
-    'volatilize',
-    'vold',
-    'volhard',
-    'volkl',
-    'volkstaat',
     'volkswagon',
-    'volodya',
-    'voltage-boosting',
-    'volumina',
-    'voorhees',
-    'voorhoeve',
-    'vooruitstrevende',
-    'vord',
-    'vosm&iacute;k',
-    'vote\'',
-    'vote-fixing',
-    'vote-getter',
-    'vote-loser',
-    'votos',
-    'vouches',
-    'vout',
     'voyenpredi',
-    'vpx',
-    'vr-4',
-    'vreme',
-    'vremya',
-    'vub',
-    'vucetich',
-    'vujacic',
-    'vulcanized',
-    'vulpes',
-    'vultee',
-    'vulturine',
-    'vulva-vaginitis',
-    'vvers',
-    'vvv',
-    'vwatch',
     'vyatcheslav',
-    'vye',
-    'w&uuml;ppertal',
-    'w-2',
-    'w.j.m.',
-    'waalwijk',
-    'wabimania',
-    'wachtmeister',
-    'wacko-jacko',
-    'wadden',
-    'waddilove',
-    'wado',
-    'wado-ryu',
-    'wagamana',
-    'wage-bill',
-    'wage-book',
     'wage-fund',
-    'wage-payment',
-    'wage-restraint',
-    'waggly',
-    'wagle',
-    'wagon-restaurant',
-    'wahdat',
-    'waheed',
-    'waht',
-    'waidmarkt',
-    'wailoo',
-    'wainhouse',
-    'wainscoted',
-    'wainscots',
-    'wainscotting',
-    'wairarapa',
     'waiter-service',
-    'wakabayashi',
-    'wakhloo',
-    'walbiri',
-    'walbottle',
-    'walcher',
-    'waldcafe',
-    'walder',
-    'waldhauser',
-    'waldrave',
-    'waleswood',
-    'walking-cane',
-    'walkthrough',
-    'walkure',
-    'wall-covering',
-    'wall-system',
     'wallby',
-    'wallond',
-    'wallwalks',
-    'walmgate',
-    'walsegg',
-    'walthwaite',
-    'wanapum',
-    'wanchai',
-    'wanderin\'',
-    'wankie',
-    'wanneroo',
-    'wanysday',
-    'wao',
-    'war-service',
-    'war-zone',
-    'wardrope',
     'warehouse-style',
-    'warewashing',
-    'warm-lite',
-    'warm-looking',
-    'warmcel',
-    'warmth-loving',
-    'warnmed',
-    'warp-ship',
-    'warpstone',
-    'warquignies',
-    'warrantholders',
-    'warriss',
-    'warrshan',
-    'warry',
-    'wart-hog',
-    'was&mdash',
     'was-',
-    'wasem',
-    'wasfi',
-    'wash-tub',
-    'washer-drier',
-    'washer-woman',
-    'wasmes',
-    'wassermann',
-    'wasson',
-    'wastages',
-    'wastecare',
-    'wasw',
-    'wat\'ry',
-    'watchel',
-    'watchies',
-    'watchmate',
     'watchorn',
-    'watelet',
-    'watendlath',
-    'water-absorbing',
-    'water-bearing',
-    'water-bed',
-    'water-butt',
-    'water-carrier',
-    'water-change',
-    'water-channel',
-    'water-closet',
-    'water-cress',
-    'water-formed',
-    'water-gathering',
-    'water-heating',
-    'water-jar',
     'water-lettuce',
-    'water-logging',
-    'water-marked',
-    'water-mint',
-    'water-proofing',
-    'water-softening',
-    'water-speed',
-    'water-surface',
-    'water-trained',
-    'watered-silk',
-    'watermota',
-    'watersheddings',
-    'watersnakes',
-    'waterstarts',
-    'waterzooi',
-    'watford-based',
     'wave-energy',
-    'wavepoint',
-    'waverney',
-    'wavy-edged',
-    'waw-itg',
-    'wawryk',
-    'waxoyl',
-    'waxy-looking',
-    'way-in',
-    'way_of',
-    'waye',
-    'wayler',
-    'wc-squad',
-    'wcomp',
-    'weak-mindedness',
-    'wealed',
     'weapons-related',
-    'wear-and-tear',
-    'weather\'',
-    'weather-eye',
-    'weather-talk',
-    'weatherbys',
-    'wed&ndash;sat',
-    'wed.',
-    'wedding-feast',
-    'wedi',
-    'wee\'un',
-    'weeder',
-    'weelden',
-    'ween',
-    'wefting',
-    'wehave',
     'wehrli',
-    'weibchen',
-    'weierstrass',
-    'weigang',
-    'weimin',
-    'weingrod',
-    'weisbrod',
-    'weissenbruch',
-    'weisshorn',
-    'weizen',
-    'weizenbock',
-    'welched',
-    'welcome&lsqb;d&rsqb',
-    'weldman',
-    'welfare-maximizing',
-    'well&rehy;equipped',
     'well&rehy;represented',
-    'well-based',
-    'well-branched',
-    'well-fitted',
-    'well-greased',
-    'well-housed',
-    'well-i',
-    'well-primed',
-    'well-reported',
-    'well-serviced',
-    'well-stoppered',
-    'well-sung',
-    'well-vegetated',
-    'well-weighted',
-    'well-xxxx',
-    'wellinformed',
     'wellwisher',
-    'welsh-language',
-    'welters',
-    'wenche',
-    'wende',
-    'wenli',
-    'wenvil',
-    'weobly',
-    'were\'t',
-    'weren',
-    'werft',
-    'werkstatt',
-    'wertenbaker',
-    'weryng',
-    'westchepe',
-    'westech',
     'westel',
-    'western-based',
-    'western-made',
-    'westlink',
-    'westmancoat',
-    'westrope',
-    'westview',
-    'westward-flowing',
-    'westward-looking',
-    'westwerk',
-    'westwoods',
-    'westworld',
-    'wet-road',
-    'wethered',
-    'wetpets',
-    'weve',
     'wex',
-    'weyers',
-    'wfwg',
-    'wg&ndash;30',
-    'wh-word',
-    'whackney',
-    'whadda',
-    'whale-bone',
-    'whale-hunt',
-    'whale-ribbed',
-    'whalfirth',
-    'whammed',
-    'whang',
-    'whangdoodles',
-    'whangs',
-    'wharfmaster',
     'whas',
-    'whassname',
-    'whathisname',
-    'whatmole',
-    'whatsaname',
-    'whaur',
-    'whay',
-    'wheat-germ',
-    'wheat-growing',
-    'wheaty',
-    'wheble',
-    'wheel-base',
-    'wheel-twirling',
-    'wheelbarrowing',
-    'wheelclamp',
-    'wheelrims',
     'wheelsets',
-    'wheely-bin',
-    'wheer',
-    'whelps',
-    'when-',
-    'wherr',
-    'whetherall',
-    'whever',
-    'whick',
-    'while-free',
-    'whinbushes',
-    'whippingham',
-    'whippman',
-    'whisky-and-soda',
-    'whitbourn',
-    'white-cloaked',
     'white-hat',
-    'white-hole',
-    'white-thorn',
-    'white-throated',
-    'white-wash',
-    'white-yellow',
-    'whitesmith',
-    'whitewell',
-    'whitework',
-    'whitings',
-    'whitmire',
-    'whitrat',
-    'whitterick',
-    'whittet',
-    'whittow',
-    'whizkid',
     'whodunits',
-    'whole-day',
-    'whole-person',
-    'whoopin\'',
-    'whooshes',
-    'whoremonger',
-    'whrite',
-    'why\'',
-    'whytock',
-    'wicat',
-    'wickert',
-    'wicketkeeper-batsman',
-    'wicketkeeper-bowlers',
-    'widdop',
-    'wide&rehy;ranging',
-    'wide-beam',
     'wide-hipped',
-    'wideband',
-    'widely-drawn',
-    'widely-respected',
-    'widely-spoken',
-    'wideranging',
-    'widest-ranging',
-    'widowed/divorced/separated',
-    'wiedniu',
-    'wieldy',
-    'wienerbr&oslash;d',
-    'wierd',
-    'wierdsma',
-    'wieser',
-    'wife-swapping',
-    'wig-outs',
     'wigborough',
-    'wigman',
-    'wiiw',
-    'wijekoon',
-    'wilberforces',
-    'wilcoxson',
-    'wild-born',
-    'wild-man',
-    'wild-water',
-    'wildhorn',
-    'wildife',
-    'wildlife-conservation',
-    'wildy',
-    'wiligelmo',
-    'wilkinet',
-    'wilkommen',
     'will-less',
-    'will-to-power',
-    'willesley',
-    'willet',
-    'willets',
-    'willeys',
-    'williamsons',
-    'willian',
-    'willkommen',
-    'willow-jack',
-    'willsher',
-    'wilman',
-    'wiltern',
-    'wilxocon',
-    'wimberry',
-    'wimping',
     'wimpled',
-    'wimpo',
-    'win-or-bust',
-    'wind-',
-    'wind-blasted',
-    'wind-screen',
-    'wind-shaken',
-    'wind-storm',
-    'wind-sucker',
-    'wind-worn',
-    'windcutters',
-    'windfallen',
-    'windhill',
-    'windjana',
-    'windlasses',
-    'windlestone',
     'windmilled',
-    'windolene',
-    'windowlene',
-    'windpants',
-    'windproofing',
-    'windridge',
-    'windthorpe',
-    'windway',
-    'windx',
-    'wine-and-cheese',
-    'wine-based',
-    'wine-list',
-    'winefield',
-    'winelands',
-    'winer',
-    'wing-bone',
     'wing-clapping',
-    'wing-forward',
-    'wingel',
-    'winkleman',
-    'winklepicker',
-    'winneck',
-    'winodws',
-    'winold',
-    'winpmt',
-    'winscale',
-    'winsock',
-    'winter-interest',
-    'winteridge',
-    'winterlite',
-    'wintersmith',
-    'wintersports',
     'wintringham',
-    'wiomad',
-    'wipro',
-    'wiracocha',
-    'wire-brushed',
-    'wire-cut',
-    'wirehair',
-    'wirelessed',
-    'wirewound',
-    'wirral-based',
-    'wirral-born',
-    'wisc',
-    'wish-a-day',
-    'wish-bone',
-    'wish-fulfillment',
-    'wishwood',
     'wisny',
-    'wissant',
-    'wissenschaftliche',
-    'witblauw',
-    'witch-hunter',
-    'witness-bearing',
-    'witschge',
-    'wittig',
-    'wiveliscombe',
-    'wk',
-    'wmf',
-    'wob',
-    'wobs',
-    'wodehousian',
-    'woerner',
-    'woferl',
     'woffinden',
-    'wohler',
-    'woks',
-    'wol',
-    'wolf-whistling',
-    'wolfer',
-    'wolfprinces',
-    'wolfsbane',
-    'wolfstein',
-    'wollf',
-    'wolph',
-    'wolstenholme-elmy',
-    'wolterton',
-    'wolwe',
-    'woman-form',
-    'woman-of-the-world',
     'womb-magic',
-    'women-hating',
-    'won\'',
-    'won-over',
-    'wonder-boy',
-    'wonderdog',
-    'wonderin',
-    'wondyful',
-    'wonend',
-    'wood-',
-    'wood-processing',
-    'wood-scented',
-    'wood-screw',
-    'woodar',
-    'woodbenders',
-    'woodchips',
     'woodentop',
-    'woodfiller',
-    'woodfine',
-    'woodfuel',
-    'woodlark',
-    'woodmice',
-    'woodnutts',
-    'woodplank',
-    'woodware',
-    'woodway',
-    'woodwormed',
-    'woodyer',
-    'woof-woof',
-    'wook',
-    'wool-gathering',
-    'woolavington',
     'woolgrove',
-    'woolway',
-    'woon',
-    'wooo-wooo',
-    'woop',
-    'woozle',
-    'worboys',
-    'word-finder',
-    'word-level',
-    'word-matching',
-    'word-search',
-    'word-stress',
-    'wordcall',
-    'wordsley',
-    'wordsquare',
-    'worf',
     'work-book',
-    'work-creation',
-    'work-ethic',
-    'work-permit',
-    'work-product',
-    'work-role',
-    'work-shop',
-    'worker-',
-    'worker-management',
-    'worker-participation',
-    'workgrouping',
-    'workhouse-based',
-    'worksong',
-    'workstage',
-    'worl',
-    'world-music',
     'worldy',
-    'worm-lion',
-    'worred',
-    'worrit',
-    'worry-eater',
-    'worse\'',
-    'wortman',
-    'wosa',
-    'woto',
-    'wotsisname',
-    'wrecched',
-    'wrecs',
-    'wren-lewis',
-    'wrexham-based',
-    'wrinklydom',
-    'wrist-brace',
     'writearound',
-    'writed',
-    'writer-in-residence',
-    'writing-room',
-    'wrongheaded',
-    'wroth',
-    'wrt',
-    'wtl',
-    'wujec',
-    'wuld',
-    'wulfram',
-    'wunsch',
-    'wvc',
-    'wynarczyk',
-    'wyntoun',
-    'wypijewski',
     'wysi-wyg',
-    'wysockyj',
-    'wyth',
-    'x&ndash;xii',
-    'x-28',
-    'x-31',
-    'x-bracing',
-    'x-certificate',
-    'x-ed',
-    'x-form',
-    'x-o\'clock',
-    'xa(d)',
-    'xam',
-    'xanadus',
-    'xanthism',
-    'xanthus',
     'xb',
-    'xdcmp',
-    'xdk',
-    'xemgin',
-    'xeric',
-    'xerse',
-    'xewkija',
-    'xfacemaker',
-    'xfc',
-    'xiiith',
-    'xillix',
-    'xim',
-    'xiola',
-    'xiulian',
-    'xixs',
-    'xk',
     'xmodem',
-    'xmp',
-    'xoren',
-    'xpg4-compliant',
-    'xshell',
-    'xtrapro',
-    'xword',
-    'xxl',
-    'xxxxxxx',
-    'xxyz',
-    'xylophones',
-    'xyplex',
-    'xyw',
-    'xyy',
-    'y\'mean',
-    'y\'star',
     'y\'want',
-    'y-cell',
-    'y-mp2e',
-    'y-neuron',
-    'ya\'kub',
-    'yac-end',
-    'yacc',
-    'yacketing',
-    'yager',
-    'yagna',
-    'yahyali',
-    'yak&ndash;11',
-    'yak&ndash;12',
-    'yak&ndash;12a',
-    'yak&ndash;18',
-    'yak&ndash;38',
     'yale-trained',
-    'yammer',
-    'yang-kang',
-    'yangs',
-    'yankilevski',
-    'yanni',
-    'yariv',
-    'yarn-dyed',
-    'yarne',
-    'yarning',
-    'yarnspinning',
-    'yaro',
-    'yash',
-    'yaswant',
-    'yatsu',
-    'yazid',
     'ybete',
-    'ybf',
-    'yc-5',
-    'ycp',
-    'yealm',
-    'yeames',
-    'year&mdash',
-    'year&mdash;the',
-    'yearby',
-    'years&mdash;the',
-    'yeatses',
-    'yec',
-    'yee-haw',
-    'yegyaw',
-    'yeld',
-    'yellow-backed',
     'yellow-fever',
-    'yellow-hammer',
-    'yellowjackets',
-    'yemeneeyeh',
-    'yennex',
-    'yeon',
-    'yeong',
-    'yersin',
-    'yessiree',
-    'yet-to-be-named',
-    'yett',
-    'yeuch',
-    'yeung',
-    'yevstigneyev',
-    'yez',
-    'ygraine',
     'yiali',
-    'yianni',
-    'yiep',
-    'yik',
-    'yile',
-    'yimidhirr',
-    'ying-jeou',
-    'ying-yang',
-    'yipped',
-    'yish',
-    'yizz',
-    'ymcas',
-    'ymlaen',
-    'ynneforthe',
-    'yobby',
-    'yoc',
     'yochelcionella',
-    'yocum',
-    'yohimbine',
-    'yok',
-    'yol',
-    'yola',
-    'yongchaiyudh',
-    'yonis',
-    'yorck',
-    'yoshihiko',
-    'yoshitaka',
-    'yosser',
-    'you&ndash',
-    'young\'un',
-    'younge',
-    'younger-looking',
     'younghusband',
-    'your\'e',
-    'your\'n',
-    'yousef',
-    'youth-club',
-    'youth-training',
-    'ypfb',
-    'yquem',
-    'ys-x',
-    'ysgrifau',
-    'yttrium-aluminium-garnet',
-    'yucatecos',
-    'yudhishthira',
-    'yueh',
-    'yug',
-    'yummiest',
     'yups',
-    'yurisich',
-    'yurk',
-    'yus',
-    'yusagai',
-    'yutz',
-    'yuv',
-    'z&aacute;bradl&iacute',
-    'z&uuml;lpich',
-    'z-average',
-    'z-boy',
-    'zabern',
-    'zacharoff',
-    'zachert',
-    'zagged',
-    'zahedan',
     'zaher',
-    'zahringen',
-    'zaitun',
-    'zalcitabine',
-    'zald',
-    'zald&iacute;var',
-    'zales',
-    'zamalia',
-    'zamenhof',
-    'zampetti',
-    'zampolli',
-    'zamzams',
-    'zanni',
-    'zante',
-    'zanzibari',
-    'zarit',
     'zarnowiec',
-    'zaronim',
-    'zarri',
-    'zarst&oslash;s',
-    'zastava',
-    'zatun',
-    'zaventem',
-    'zaverda',
-    'zazie',
-    'zazou',
-    'zecevic',
-    'zeds',
-    'zeetank',
-    'zeevi',
-    'zeferino',
-    'zeid',
     'zeiller',
-    'zelie',
-    'zeller',
-    'zemek',
-    'zenit',
-    'zerboni',
-    'zero-defects',
-    'zeroxac',
-    'zetex',
-    'zeug',
-    'zewail',
-    'zewde',
-    'zhendong',
-    'zhigge',
-    'zhongli',
-    'zhurbenko',
     'zian',
-    'ziauddin',
-    'ziemian',
-    'zifferero',
-    'zigeuner',
-    'zigged',
-    'ziggi',
-    'zigs',
-    'zihou',
-    'zikali',
-    'zillertal',
-    'zimmerl',
-    'zimmerli',
-    'zimmerly',
-    'zimove',
-    'zimprecht',
     'zimsci',
-    'zincke',
-    'zinner',
-    'zio',
-    'ziolkiwski',
-    'ziss',
-    'zissick',
-    'zisu',
-    'zito',
-    'zizzing',
-    'zoar',
-    'zoha',
-    'zoladex',
-    'zoller',
-    'zon',
-    'zongalero',
     'zookeeper',
-    'zoomer',
-    'zoshchenko',
-    'zouave',
-    'zow',
-    'zs-lyw',
-    'zsm-5',
-    'zube',
-    'zubizaretta',
-    'zuccari',
-    'zuckerfabrik',
-    'zuglo',
-    'zun',
-    'zunxin',
-    'zutphen',
-    'zuwaitina',
     'zvonko',
-    'zwygart',
-    'zymurgy',
-    'zynar',
-    'zzthat',
-    'zzzzzzzz',
+)
+
+blocks_45 = (
+    '!,dcl-e-openin!$rbge +&aacute;gua($vila"\'circ;me"-elig;lfthryth\'(thel-red+$wulf"+gr;-actinin&,chymotrypsin\'+yclodextrin&%helix+1-turn-&agr;-helix&(mediated&)particles',
+    '&%value%!1%\'4&bgr;1%\'6&bgr;1+!4%!i%!s%\'v&bgr;3"1macr&sacute;ramas##p;-%#3/4%"5a%\'abelson&&ddress&\'mericas',
+    '\'/rndorff-nielsen&$latt&#oon&$rass\'%iscoe&&utcher%\'charles&"ui%#dad&%ollar%!e&%xcise%"fm%%green(#tel',
+    '%&halley\'&rdiman&%eynen&\'olyhead%%illus&*nformation%"l.&\'awrence&"b.&$eeds&\'imerick&!t&#yle%&miller\'#nus',
+    '&%outon%"od&!r%(partners&)urchasing%(ramseyer&%obbin%!s&&anders&\'emeniuk&%lovak&$myth&%ocial&$tyle&%up218',
+    '%*techniques\'!l(&ephone&"he&&rusell%(veenstra%!w&#ard&&elfare%+zinkernagel"$pe;0"8st&ast&ast&ast&ast&ast;l"-uml;gyptische/!s!\'bgr&bgr',
+    '&&myosin%"1-%"2-%!3%&5-loop%\'blocker%!c%)receptors$!_"+sol&commat*&"gt%";d\'.ir1&bsol;file1\'3os&bsol;country.sys/*setver.exe',
+    '*)gt;attrib&$star&2windows&bsol;quote\'#ork**&bsol;work4*&bsol;work!3ccaron;erm&aacute;k#&edil;i)&ftliks(\'okertme"<heck&check&check&check&check"/ommat;firstpara(#how("if(;sys&dollar;lifespan:lstrain',
+    '"&gr&lgr$"/b$$;e/e%(i/&dgr;y%#m15%!p%!u%)x/&dgr;63$!=",ollar&dollar\'#/dm\'%;0.38*"47+!m*"53',
+    '+!8+!m*!6+!1+!2+!4*"71+!2+!5+!9*"89*"96+!9((1&frac12."34',
+    '+#30m+"50,"9m+#87m+"96*$134m+%41.3m*\'250,000*#330+"55*\'400,000+&45,900+"50+"60*\'500,000',
+    '+"80*\'600,000+"20+"30+#50m,!7+#60m+&80,000*\'700,000+#71m*#870*$907m+"50)).00=1,000/#250',
+    '+!4+!6+!8*,1&ndash;1.5m+"04+"25+\'billion,!n*"20+!3+"bn*+4&ndash;1.8+#345+#560+!6',
+    '+#510,"85+!8+!9*$6102+!7*#75m*+8&ndash;2.5+"bn*"98+"bn)20,000&ndash;15,000+#100+#255+#300',
+    '+#600*(-million*#.00+!8+"95*#0.4+(m-a-year-$plus-%worth*$1.8m*!2+#.6m,"7m+!m*"3m',
+    '+$,000*!5+(,000,000,#475+!m*"6m*%7,522*$8.6m+!m*%9,000*(m-a-year,%worth)%1,100,"30+#200',
+    '+#570+#627+#900-!1*".1+!4+!9*"1m*!2+(,800,000+#.6m*$3.1m*%4,000+#.8m*%6,000',
+    '*$7.3m+!m*!8+!m*!9+$,300)%2,272+\'500,000+$900m,"50*).8billion+!9*!1*!2+$,180',
+    '*%4,000*!6*"7m*!8*!9+#.0m,"6m)&3,000m+#490*#.25+!5+"7m*%0,000/$,000+!0',
+    '*%2,000+!m*!3+#.1m*!5+#.0m*%6,000/$,000*%8,000+!m)-4,000m-a-year+#300+#425+#790+#900',
+    '+"1m+!2,!5,!m+"3m+!7*!1+#.4m*$2.3m*$4.5m*$5.2m*)7,000,000,#800).5&ndash;20,000*%,719m',
+    '+"37,!m+!5+"9m*+0&ndash;2003&20,000*%1,544+#.3m*!4+$,000+!m*%5,000*!6*%9,000,#900',
+    ')%6,500+#667,"90*#.1m+"2m+!3+!4+"6m+"95,!m*%2,000+#.2m)$7.0m+#25m+!3',
+    ',!0+"73+!8+!9,!5*)0,000,000*%1,000+#.6m+!m*"2m*"3m*)5,000,000*!6+#.2m*$7.7m',
+    ')&8,000m+#600+$700m*#.7m+"89+"95,!m*/0&ndash;270,000+2,000&ndash;220,000*$2.6m*%3,000*%5,000*"6m*"bn))9,000,000',
+    '+"2m+"3m+"5m+"8m+"9m*"5m*$6.2m*%8,000,#900)&m-plus+%worth*!.((2&frac12)0,000&ndash;3,000+"50',
+    '*$520m*#650-!m+"75*#750+"87*#870*#950+"70)#.09*"18*"24+"5m*"35*"59',
+    '*"75*!9+"5m).0&ndash;25,000*$,745*#.0m+!3,!m+!4+!6,!m+"8m+!9*30,000&ndash;250,000+!.',
+    '+$,000*%4,000*%8,000))1,000,000+#790*#.0m+!1+"75,!m+"8m*/0&ndash;265,000*"2m*!5+$,000*!7',
+    '+#745*#.1m+!5+"6m)%3,068+#200*#.50*!0+#.2m*"1m*%4,000*$5.2m*)8,500,000)%4,745*".2',
+    '*%7,000)%5,070+\'600,000*#.3m*#000*"3m*$6.4m*"8m*"bn).6&ndash;34,000*$,700*#.0m+!4+!5,!0',
+    '+"6m*)0,000,000*/5&ndash;350,000+!m*$7.4m)$7.0m+#375+"8m*!0+.&ndash;360,000+(,000,000*%1,360*%2,000*%8,000)%8,500',
+    '+"5m+"7m+"8m*)0,000,000,#900*%1,000*$2.0m*%3,000+!m*%4,000*)5,000,000*%8,000*%9,000)&9,000m+0200&ndash;43,800',
+    '*#.1m+"4m+"6m+!7+"9m*"0m*!3*%5,000*%6,000*"8m((3,048.1m+"80*$200m*#370,!5',
+    '*#875)#.20+"5m*"35*"55*$65bn*"80*"92).0&ndash;40,0001&50,000*1,000&ndash;50,000+#500*#.1m*)0-million*%4,000',
+    '*"8m*"bn)%1,000*#.3m+"6m+"75*%2,000*!3*/5&ndash;385,0002\'440,000+$,000*%8,100))2,200,000*$.375,!m',
+    '+"5m*!0+!m*%1,100*"2m)%3,000+#745*#.1m+"3m+"4m+"6m*%0,000+!0*$1.1m*!5',
+    '*"8m*!9)%4,500*#.4m+"7m*"0m*!5*$7.0m*%9,800)$5.1m+"2m+"4m+"7m+"8m*%1,000',
+    '*!6*!8*\'billion)%6,500+#700*#.50+"7m+"9m*/0&ndash;540,000*%2,000*%5,000+!m*%8,000)27,100&ndash;55,700*#.9m',
+    '+#.1m*%4,000*)8,885,900)$8.5m*)0,000,000+!m*%1,000*!3*"5m*%9,000)%9,300*#.50,!m+"7m+"95',
+    '*!4*!5*%9,000(&4,100m+#20m+"50+#83m*#450*#690*$700m*#950)#.00*!1*!2+!5',
+    '*!4*!8+"75+"bn*!9).0&ndash;50,000*$,500*#.1m+!3+!7*#000-!0*%2,000*"9m*\'billion',
+    '+&illion)$1.1m+"3m*!0+$,000*!3)$2.1m+"6m+"7m+$88bn*!0+!m*!5*%9,000*"bn',
+    '*#.2m+"4m+"5m+"7m+"9m*!0*)4,000,000*%5,000*%9,000)%4,400*#.2m+"5m*"0m*%2,000*!m',
+    '*#.5m+"6m*/0&ndash;630,000+(,000,000*"5m*"bn)%6,100+#700*#.3m*!0*%1,000*$4.8m*!5+$,000*"6m',
+    '+"88*%0,000*"5m*"7m)%8,500*#.0m+"5m+"7m*)1,000,000*!2+$0.27(15,000&ndash;7,000+#96m*\'200,000+"72',
+    '*$440m+"50*#550*$641m*$740m*#835*#900+"50+"90,!5)+-&dollar;10*\'million)$.3bn*!8)20,000&ndash;70,000',
+    '*+0&ndash;700+2,000&ndash;600,000+!.*\'million)%1,300*#.25+!4+"5m+"6m*"0m)%2,000*#.7m*!0*!4*!5',
+    '*/0&ndash;700,000+(,000,000*%1,000*%8,000))4,000,000*#.5m+"7m*)0,000,000*$7.1m).5&ndash;73,000*1,800&ndash;83,800*#.2m+"3m*%0,000*%2,000',
+    ')!6*#.9m*"0m*"5m)%7,000+#500*#.2m+"3m*%0,000)$8.3m*%0,000*%7,000)#9.5,!0*%0,000',
+    '*!m()6,000,000+"40*#400*$500m*#618+"43*#880)*.75billion*#8bn*!9)&0,000m*$0.1m*%3,000*$8.0m',
+    ')21,200&ndash;92,000*#.7m)!2*$,180*#.2m*\'million)$3.2m*)0,000,000*!3*"5m*!7)&40,000+!m*%82.00*!m',
+    '))6,000,000*#.6m*!0+!0*!3*%7,865*!m)$7.7m*%4,000*%5,000*!m)$8.5m*%0,000+!m*)3,000,000',
+    '*!8*%9,000)$9.2m*%7,000*$9.4m)\'billion*!n(.7&ndash;10,000)%,020m*#100*#250*#400*#600+"25*#700',
+    '*#900-!m)".7+#25m+!5)#0.6,!m*/0&ndash;900,000+\'million*$5.6m)%1,750*#.1m+"5m*%5,000)%2,000',
+    '*#.2m*%5,000*%7,000)!3*#.6m*!5)$4.9m*!0+$,000*%4,000))5,000,000+#300+#700*#.6m*$0000',
+    '..&ndash;122,000*!0*!m)%7,000*%0,000+!m)!8*$,000*"5m*"9m)&90,000*%5,000)\'billion(*8&ndash;102$,000',
+    ')%,000m*$500m*$696m)#.00*#125*!2*"50*!8*!9)30,000&ndash;120,000*#.6m*50,000&ndash;1,000,0008\'200,000))2,500,000*#.6m',
+    '+!m)!3)!4*#.1m*%0,000*!3*"7m)$5.8m*)0,000,000*!3*%8,000)%6,000*%0,000)!7*$,000',
+    '+"4m*"0m*%2,000*!5+$,000)%8,000*#.7m*!0*"3m*%6,000)&90,000*!5(&9,000m*#250*$669m',
+    '+!m*"2m*!3*"4m*"50*!7))0-a-share*"00*!5)%1,000.$,000)%2,000*#.3m+"5m*!m',
+    '*%3,000*"5m)$4.6m*"3m*!m)$5.75,!m)%6,000+#400*)0,000,000)!7*!m)&82,000)$9.95*!0',
+    ')"bn("b5(!e)\'&lsqb;1(\'million(!o(*p&dollar;g(#run(%us600(!x)!x"$trif!2eacute;cart&eacute)%helon)(ologiste',
+    '(\'narques($owyn(*p&eacute;e2!s)&icerie,!s)\'uration(-tablissements)\'rangere/!s*#ier)&udiant*!i(/v&eacute;nement"%quals',
+    '"\'ormula%((&formula(";c)"in)!n)!p)&voting",rac12&amp;in(#deg\'\';-stone(#per&(3&amp;in&(4;in/5mm%*34&ndash;1\'#;lb',
+    '("oz($pint)!t%"78!+ggr;-&ggr;f$!_"$t;11%"50$#200%!6$"32%!5&$0000$!4%"00',
+    '$"75&!%$"80$#90%%&9.999%$$five##=35$%50.80$!8!&hellip!#igr"*quest;cada()qu&eacute!"le#$;10%',
+    '%!0$!4"\'gr;gt11%#pt2%#zap",owbar&lowbar"2sqb;a&rsqb;lthough&*e&rsqb;ven&(i&rsqb;n"&t;-1.8$/0.02&ndash;1.26&+1&ndash;0.6$$11.5&!0%&30%ibw',
+    '$,2.4&ndash;23$#30%&!0$*6&ndash;28$#9.5$$b&gt$$caps%$r&gt%&trl&gt$+del&gt;kill&$v&gt\'#ice*8&gt&lt;directory&gt*.fil$%f2&gt%"or',
+    '$!k%&eyword$&run&gt$\'save&gt%2hift&gt/&lt;esc&gt$,three-letter$&volume$%we&gt#$=80%!)mdash;0.5\'#122("93\'#245("52)!3',
+    '\'&acting(\'ppeared\'"by\'+coexistence((urrently(+zechoslovak\'*darlington()emocratic(#oes\')enshrined()specially\')following)"ur\'#has\'"ie',
+    '\'&mainly(,iddlesbrough)#lia)&nister(#ore\'&nearly)"ws((ot&mdash\')popularly\'%right\'*that&mdash)#ese)$ings)%rough\'!u',
+    '\'\'western($hile)#ose\'#you"(icro&sim&#/ml&$;ci/*!g*%litre\'$g/24)%kg/hr,#min)#mgw*"in*"l.',
+    '!\'ndash;.\'$1515)"73\'"21\'#50%\'!9\'!a\'!c(+onservation\'$heir("ow\'"in\'2new&ndash;regional(!o\'$oct.',
+    '(&pecial\'$this\'(unctions\'#vas"$gr\'="$um;1!-oslash;stland")uml;rebro!$pgr*"$lus/%&;0.042)"94(#219(#482&"10',
+    '($21db"+ound&frac14+"38&(/&dollar&$;.45\'&0.13bn*!m)!2*#1bn*!5)#48p)"75*!m)!8*!m',
+    '(,,000-a-night,!.+!1*"12*&20,545+!5+!9*"30*&45,000+!8*"82+!5*"92+%5,890)\'100,000',
+    '*"25*"35*&50,000+!5,%,2507*"60*"78*"90)$200m*"27+(8million*"30*"49*#87m*"90',
+    '*"10+!4*"40*"65*"70*"80)\'400,000*"30*"60*"70)5500&ndash&pound;2,0002&;2,500)\'600,000*"24+!5',
+    '*"40*&50,000*"80)#725*"40*"60*"70*"80)\'800,000*"10*"33*&70,000,!m+!6*"86',
+    '*"58*#70m*"99(%.013m*!2+"bn*"5p*(6billion*!7*"8m)$12bn*"4m*!6*\'9/200ml)+2&ndash;1.6',
+    '*#36m+"9m*#5m.+!p*"7m*!8+!m*"m.)"31*)3&ndash;2+!m*"4m*"5m*!6+\'billion',
+    '*"8m*"m.)"41*!2*"3m*"5m*!8*\'billion*\'million)"57*!8*\'9/100ml*\'m-rated)+6&ndash;2.2*!1',
+    '*\'billion)#712+!m*!3*"54*!8*"92+\'billion)#83m*"4m*!6*!8)"92*"5m*"6m',
+    '(*0&ndash;15)$,243*#534*#750*#890*#990)&-worth)".1+"bn*"2m*"30*!6+!3*"78+\'million',
+    ')10&ndash&pound;1800(;120,000*2,000&ndash;133,000.&-worth*40&ndash&pound;10,000+#000)$1.70)$2.6m)#3bn)(4,356.55*#.2m*&:12:0.)"50)"7m)%8,330',
+    ')%9,000*!4*!5*$9.00)\'billion(*1&frac12;m*,ndash;17,000)$,100+"30+"88*#200+"46*#300*6500&ndash&pound;12,500+"66',
+    '+"90*#700+&14,969+"50*#950)!.*"20*!4*"55*!7+!0+"5m*!8)"/2))0.13s.4d.',
+    '*!0)%1,000+#750,"80)%2,500*#.4m*$1532)$3.6m*!5)%4,000+\'533,413*!5)/5&ndash;175,000))6,000,000+#250',
+    ')$7.1m+"46+"50+"95*!m+!.)18&ndash&pound;268*$,757)\'million(02&ndash&pound;14/#;141%6,000)$,100*#300)!.',
+    '+!m*"30+"5m*"40+!9*450&pound;15&pound;15*!6*"70*!8*"94)/0&ndash;180,000*!k)$1.39)%2,200*!m',
+    ')$4.61)$6.3m+!5,!0*!0*!m)%7,759)$8.45+"7m)%9,000+#374+#650)"m.(%3,100*#428',
+    '*#840*#950)#.00*!1+!3*"6m*"80*!9+!0+\'million)$0.00*\'million)%1,133)%3,000*!.',
+    ')$4.73)%6,278)%7,000*\'million)"8m)$9.40+"95,!9*!m)\'million(*4&frac12;m)+,000-a-year*#100*#200+"85',
+    '+"50*#400*#630*#800+"50*#971)#.25+!9*!6*!8+!m*!9+!8)%0,580*#.2m',
+    '+#403*".8*!m)"25*!m)$3.5m+"75*\'million)+5,000-added*\'million)%9+vat(*5&ndash;201%5,000)1,000&ndash;20,000-$,000',
+    ')!.*!1*"20*!3*(5million*"70*"90)8/&pound;10/&pound;5/free)+0&ndash;200*(,000,000+#133*&-worth*"00,!0)$2.75',
+    '*!m)"3m)!4*$,000*#.60*!m)%5,600*\'million)%6,450)!7*$,500*!m+&illion)%9,500)"pp',
+    '*#300*#495*#540*#780*#995)#.05*!3+!m*"4m*!8*"90+\'million)10&ndash&pound;275*$,907*".4',
+    ')"2m)%3,000)"50)"7m)$9.00(*7&frac12;m)(,000,000*#675+"99*#850)".3*"40+!5+!m*"55',
+    '*"75*"80*"90)$0.00+"75)$1.72*\'million)%6,000*).5million)%7,000)"89*!m)$9.99*!9)"bn',
+    '+"60)*-&pound;20)!.*"13+!m*"20+!m*!3+!m*!4+!0+!9*"65)/0&ndash;220,000*2,000&ndash;200,000',
+    '*\'million)$1.7m)%3,000)%4,000*#.99*!m)%5,500)"7m)%8,000*!m("9*)$,245*0300&ndash;29,000*#400*#900',
+    '*!3*"40*!6*"75*"89*"98))0,000,000*#.2m)!1*$,000)%2,000)!3*$,000*!m)!4',
+    ')"5m)%7,000+#620)!8)"95*!9(":5(&and1/2(#o.5\'22&ndash;10&ndash;0/%3,000(2,000-to-the-winner-%worth+)8,137.60p*&11,500',
+    '*"77)#104*"50*"70+%1,912)\'250,000*"60)"30*"10*"25)&406.41*"20*"39*"75+$7.9m',
+    '+-0&ndash;3,500,(-a-night/$term*"15*&30,000*"50)#640)#745)#850+%6,821*"75(#.02*!3*!8*"9m',
+    ')"23*\'5/150ml+!m*!6)(39/200ml)"43)#55m*!7*"m.)#65m)#81m*"5m*!8)"92*\'million',
+    '(20,000&ndash;30,000-$,000-.-&pound;25,000-!0*#250*#698)*-&pound;391"40)".2+!5*!3+!7*!4+!m*(5million',
+    '*!7*!8+!0+!m*!9+!9)+0&ndash;240**,000-worth*+-&pound;400)%1,000+#150*#.50*!m)%4,000*#.7m',
+    ')(5million)!6*!m)!7)%9,000)"pp(%1,250*#420,!8*#500)#.00*"1m*"25+!m*!5',
+    '*!6*!7*!9)$0.33*!0)"1m)!2)%3,632)%4,602*!m)%5,000+#216*!0)"6m)%9,000',
+    '*!1*!2*!4+!0+!m*"60*"8m)!1*#.5m)!3*!m)%5,983*#.00*\'million)"7m',
+    ')$9.95(%3,100*#200*#300*#600)".1 \'repasts$#yed#&enteth#,hotographing#(lastered$%icant#(ort-back$$sted#$pion',
+    '$$ised\'!s$(ocessors%%duce\'%%filed#"s.#!t$$ilia#&ublic\'"(quiescat%$reth"&rating#\'eleased#,ngprasertvit#&oofing',
+    '#&earch-)&driven%$ting%!u$$cure$$rach%\'ve-team#&ident-$"na#\'leeving#%otred$%urses#)pecifying$%onse\'()-produced',
+    '#)sentiment#%t-day$#ack%#uri$(retching%&inging%#ung#+urrectionem$$ture"\'tallack##her#%iculi$\'ghtened$#led$\'na-scan',
+    '#$onio#%raite%%nsmit*#ted$"im$)o-bolting%$flex%&ussage#&urn(s)"*unifaction#$tern"&v\'rend#"al%$ving#(egetated',
+    '\'\'d-phase$%tting#(isionary$$vers#+olutionary\'-)-sounding#%uebar""we$%ighed"$xine"$yero#\'kjahlid#"ne"&zoning!\'hapsode',
+    '"%enium##ums"!i"%odope#$ikos"!r"%ymers%%sters!(iabhaich"%bands#$band$%oning#$wort"%chart$$ings',
+    '$%monds#&k-yard"(ddihough#.sdale-tombling"$egel#,menschneider#"ng"*ft-related")garlsford##git$\'lesford#&ht-eye%#ish%"s-#$idex',
+    '""jk"#kon"&llaton$"ed"$mmon"$nder#!e$)loricaria#"g\'$#(s)$%-seal$&binder$!e$$gold$$ways',
+    '#$pers")sc-system#$erva##his#(ing-main#!j#"k\'$)-aversion%\'capital%&reward#"sa$#ole"%tcher##ech#&hmetic',
+    '#$ters"*ver-valley%$bend%$port%#run$$tted#\'ingtons!*jr-nabisco!#ly.!"mu!&nasine##zol"#nas"#zaf!*o&ndash;ro',
+    '%&racing%&safety&#ign$$ying#%sties"%bbiae%"n\'##in\'#$lett$"in#$ocom$$tron$!z#%uchon"(cheforts',
+    '$\'-garden%$hewn$%beast%"us$%lands$&master$"ne$$pile$$star#!s"$dden##man##ulf"%elant"\'ffensis',
+    '#!r#$tang"&irbak\'""jo""ke$"by$%smith#"ha#\'itansky#%kakus"+le-breaking%\'mapping%&player$&played(!s',
+    '%$down%$rate$\'ed-back%\'r-blind\'&hockey$\'ing-out$#nik$%wagen"\'magnola$$nism%#off&#rum#!b#!o$$rola',
+    '"&ndeaux%!l#$eval#$hill#"in#"ne#!o#%snade$$trip"\'od-loft$!e#&f-void##ked##mes#&secote',
+    '$!-%$room$#led$!y"!p#%pongi%!u"(s&egrave#&amunde#"co#&e-bowl%\'opaline&%range%\'painted$$bank',
+    '$%veare#!h#+icrucianism#$ling#%neath#"ow#$sano$%inish#"ti#(y-purple"&taflex#$blat#%hbart$-enb&uuml;hler$"on',
+    '#$ondo$&vating#$uman"%uanet#&ennais#*gh-grassed&(surfaced%#cut%\'ing-out%#tly#\'hanyoun#%lades$"ez$"in#,nd-the-table',
+    '#%ssety#&te-map$%inise$#ray"$vere%&garden"$wark##don#(ing-team"$yalp$#ume%!x##ong"#zas$#vel',
+    '!*p-speaking")c-toolkit"!e""gs!%q-380!#rap""rs!"sb"!e"!o""us!)uadh-stac##iri#!n$,gkanchanaset',
+    '#*-a-dub-dub#!b$\'erstamp$$ish\'\'+-collection$!o##ena$$roid#"gy#&infeld#\'ricated#&system"#cia"$dery#$loff',
+    '"!f#\'f-sniff&$tuff$#ino$$ness")g-weaving##man"\'hamanya##uhu$!l"&inated"$koro"*le-bending&*oundedness$\'s-based',
+    '""m-##bas#\'illajta##mel#)pelmayers%!r$!f$$ling"(n-making$$past#%_away##can$$orne#$dall$)funkwerke',
+    '#\'esmiths##ing"%otolo"\'pestris#%icola#$pert"(schmeyer##ell#$hout#$sett$)ian-built($held\'$ised%$sche#$tica',
+    '"#tty!(wegasira"#mac"!s!-ya-recognised"$cote"(nkiewich!&zeszow 1s&eacute;bastopol)\'minaire)-n&eacute;chal)-r&eacute;nade"%ndash"5ucirc;derdithmarschen#*uml;leyman',
+    '"$land!#-10"!2""61"$bend#"it"%coupe"!m""so!%a-hoo"$achi#"de"$baha#-bath-breaking#&inorum',
+    '"\'cculina#$kbut$"or##omt##que#,ramentalized+!s$!i"\'d-faced#!d$&amgate$&le-bow##nes#$olin"%egert',
+    '"$faga$$niya$(ri-style(#uit#)e-custody%(guarding%%house$$rite$"ti%\'y-check&$wear#%frall%+on-gatherer#$iqua##wat',
+    '#!b#"em$!t$!y#&ramaso$#edo"%hadeo#\'itharan##sru#"ul#%yadri"$idou#!m#%novic$0te-trinit&eacute',
+    '#"re#$sies#!t"!k#$aran#$ulin"&lagama$&mancas%"on$$rian%"ye#$cedo#"er$(s-person&$talk',
+    '#!g#\'icaceae$!n$"ou#%kever$#ind##lam$"et#\'mantina$*on-farming(&ishing\'#rod#$omea#!s#(t\'n\'pepa',
+    '$%glaze$%holme$\'imbocca##uki$#tis#)vationism&#ori#$zach$&gitter$#man"%madhi$"ha$%niego$$rium#&bursky',
+    '#!l$#and#$mler#)ple-based"&natory#-ction-busting#)d-covered%$flea%\'le-mere%%paper$&anista*!s$#bed%$loom%"ox',
+    '$$iton$#ook$$rine$$spit$#uny$(wich-box$&ymount#$gers$&iovese#%itact##ken#$nine$"ox##poa#\'s-souci',
+    '$%yusya#\'tangelo$"es$#ing#"yi"#pey#!m#%osnik#$pled"#ral##gin#$inic#%ojine#"pi##rat',
+    '$2orially-challenged##yan""sa"+t&ndash;sun#.an-worshipping%!k#,ellite-based$(rglantan#"ow#%quote##ros##ucc$!r"$uce-$#ing',
+    '#(erbraten#$lieu#!n$!t#,sage-machine*#ker#"ti")vacentres$#ric%(y-miller#$erio#"ic$(ngs-bank%!o$#tri',
+    '#!u"$w\'em#&-blade##dde#!e##fat"$xham#(o-norman$#nes""y-#"es#%onara"$zhen!#bat"!i',
+    '#"dn!%cabra#%davay$#der#$fati$&folded$!t#(le-based%%ctrix$$lies#&mander$"ps#)ndal-free\')mongering%/inavian-managed',
+    '&"um$#man$"no$%siris#&rcroft$)f-jointed$#ped$#ton#*tterometer#&vening"+d-compliant"+ene-stealer%$rama"*h&uuml;tte#&aedler',
+    '$!l%"ly%!t$"ry$$uble%$fuss%-spieldirektor#(edule(s)$)ff&eacute&"er&#ler$(ibenbuck%#sse((kommando$$nkel',
+    '#&iavoni$\'kenader$!z%\'ostylis#(lettwein$%ieker%"tz$)umbergera%"rp#$mied$$ucks#(nablwirt%"pp$#eer#$oeck',
+    '%$rner$(lar-poet%"em%"ls%#tzs$"ne$#ol-\'(educated\'$girl\'$yard&#in\'$!p$!u##ram$#enk',
+    '#*uldscheine%$hoff$$rman$)tzstaffel#%wager%&rtzman&(zanegger\'(enberger(!r\'$lose\'#see$"ed$"ob%$erer")iadopitys',
+    '(&policy(\'writing%%tized#)ssor-bite"*leractinia%$osed(!s&%tised"$oles$$ytid#%opful##pas#$t-am$(ch-roman$$gate',
+    '$*ichronicon$%prime$*t-hodgetts%#ies#%urian$$ters"&raggly$(perboard$&tchin\'\'$wood#*ee-covered%(n-tested(#ime&%saver$&wchuck',
+    '#&ibners$\'mmaging%)shandered,#ing$&ptores$#tch#%ooged#,ubbing-brush$$ffed$)tineering"%ulpin#$mmed$"ta#"pe##rfy',
+    '%"ed#"si""ye#&phidia!$d-10""as"!g""io"$m-79!-e&ntilde;ores"%a-air$$bass%$oard&$ttom%%reeze',
+    '%$liff$$deep%\'welling$$foam&"wl$\'gusting$&island$&living%#ord$&mammal$$room&#ute$$worm#\'bathing##gar',
+    '#&l-skin#$qaqa#.rch-and-rescue$$elle$%geant$!y#%speed$#tar#\'t-cover$#one$/tle-worshipping##ver#,weed-covered"(borovski"$cant',
+    '#-ond-to-bottom)!p#&ratary$\'etarian#$teur$)ionalised$&retary#)underabad$$red\'%$itas\'&y-code"&dnaoui""e\'#(d-sowing$$pods',
+    '#)felderhof#%liger%"ng$"ye#%sawed&#ing"$glow#+ment-headed#"ue%#ing$%ridad"&icento#&delman#&erstad#!g',
+    '##ken""ke$!n##iya"$lase#\'ectcare&(or-coach$\'nium-75#0f&rehy;contained*(effacing**supporting$+-acceptance&\'dmitted\'%oring\')vertising',
+    '&*rbitration\'$ming%*caricature&&ertify&\'oaching\'%mmand)%uning\',ngratulating((sistency)\'tituted(*tradicting\'(rrective&\'reation%.deconstruction\'%luder',
+    '&(iffusion\')sparaging)#lay((solution&*ocumenting%&effort&\'lecting&)mpowering&(nhancing&)vacuation&)xcitation(&lusion(%using\'#ile%\'filling',
+    '%(inflated\'\'jection\')quisition\'(spection(*ufficiency)$ring\')teraction*\'ruption%*laceration&)iberation&%oving%)modifying&%urder\'&tating%-narcotisation',
+    '%+observation%\'peptide&\'romoter&&ulsing\'\'nishing%)quotation%+reassurance\'&ferral&"un%)screening&%peech&(upported%\'tailing\'&xation&#est',
+    '%\'winding$)contained$)defeating$*justifying$#oss#%inker#+jalandsfoss##ket#*l&rehy;out$#ary$"ed"(malaysia$&phored#)i-amateur%%comic',
+    '%#det%1institutionalized%&luxury%)monocoque%(pelagian%%shade&&talled%\'upright$(detached$(larvatus$$nole$*ochemicals$(palmated$"te#(p&eacute',
+    '#"eb$$chal$\'schalli#\'nheiser#-sationalising$\'e-group&-qualification&$unit#+tence-based$,imentalising$&ry-box"\'perated#$pelt$$ings$!o',
+    '#&ultura"&rabend$#doy$#fim#*bocroatian#$etse#+geant-pilot%!s$#ing%"pe#&ialize%$tion$,es-clinching#$matt##nin',
+    '$$nera$#tec%%yping#&phidae$#ico#!r$#ado%#nno%&salmus$"et#$vais%!l%*nt-keeping&"us$,e-and-volley',
+    '$.ice-by-service(#led()provision$\'omotors#!y"#say#,quicentenary&(pedalian#%sion\'\'#eer##tos")t-qao-log#\'chfield$&reasea##hos',
+    '#$s-up#\'tecento"#ule#!m"#v\'n#\'en-acre\'$lbum&&column&&nation&&octave&%phase&$seat&&volume%)teen-foot&&y-foot',
+    '%"up$\'ralfold%-ely-depressed%+field-reeve%#sky#\'illanos$#our#"vy""wa#*ing-basket"(x-appeal$.discrimination$%fiend%\'or-sale$&kitten',
+    '#!e$%rcise#"ta$$uple#&ualise"&ydlitz##ler#!n"\'zincote#"on!"ft!$gine"%s-ca1&!2!/habbily-dressed',
+    '$\'ow-play$$rack$!s$"we#%ffner$"iq$%ranik$(t-driven#$gger%#in\'%%y-dog$$reen#*h-al-arhee$&aptian$#naz',
+    '#%katak$(espeares#!l#$mlan$#mai##nas$*ghai-based$#ked$"or$!t#*pe-changer%\'shifter#%qlawa#*re-a-yacht%"en',
+    '%#fin%%mouth$%ovari$(p-beaked&\'looking&\'tasting%*ly-defined%$nose$!u#$stra&"ic#$wnee##zam"#e\'d##arn',
+    '##eny$(p-farmer%&shanks$"sh$%t-ice\'#ron#%hadat#$idal$#gra$$ling$#tel#&lburne$\'l-blast&)secreting$(terbelts',
+    '#%nkman#%rbert$$edon$)iff-clerk$"ri"$iant#!b#"de#)ft-change%!x#\'gemitsu#&h-k\'ai##ina##kai#(llinglaw',
+    '$!o#$mmed$!s#&n-bone$"dy$%ehead%!y$$gler$"ny$%ozuka#-p-in-a-bottle%&owning%\'to-ship$!p%"ey',
+    '#%rburn$%escot%!t$#red$(t-collar%"ed$)van-grade#(t-eating%%house%\'kicking%(stirring\'$rewn$%faced$#ler#\'vdasani',
+    '#$ucks$#eli"\'nezhana"*ock-headed#&e-horn%%maker%$shop$%smith#"ji#"ld##mer#\'osmiths$*ting-brake)\'gallery#)p-keeping',
+    '#*re-nesting%%birds&$ound$$shan$&t-axis&$held&\'lasting&\'passing&%straw&\'working%(er-dated&(st-lived%+hand-typing#-t-on-the-turn#$uld\'',
+    '))shrugging&!n#\'vellin\'$#in\'#\'w-going%\'jumpers$!e%%r-cap$#ler$#off"\'plendid"$rdlu##eve#,ink-wrapping"\'uailaan',
+    '#+ffletoppin\'#$gart#%i-teh#)l\'govskii$!d$%evitz#"na$"so#$rrup#$shes#$toff$*tle-worker"+warzenegger#&edagon#"ob',
+    '!)i&acirc;n"\'aochang#!r""bi##ree#%usiso"#cad$#rii#"ga##her#%inius##ras""da##cot#$dick',
+    '%%board%$exit%(interest%&lights%\'netting%%split%\'turning$!r%!s$&stroke%\'wimmers#&ransky"%empre#&rkunst"%ffert',
+    '$!r#&ht-bob&*vocabulary#%iriya$&smondo#/n-and.magnitude%\'posting%"up%%value$!a%\'ture(s)""ha#!r"&kander"$lane',
+    '&$ysen#%entia&%night#)ica-based%*one-rubber\'#ing#(k-draped$"ed$%ience%"ng#$lard$"er#"us#)ver-birch(#lue',
+    '\'$leaf\'%paper\'$shot&&bridge&$face&$lock&%spear%%strin$!o"&mbomba##eti#+ilarly-aged%#ies#"od$+nds-gooding',
+    '%%stown#*ple-living\'*mindedness&&minded&$tons#\'ulclass#!v""n-##aed#!c$*erely-held#\'ead-ism#%fonye##gha%!s',
+    '$$laub%&e-arch\'$band($rand(%utton\'#car($hain\'%digit(%ouble\'$firm\'(industry\'%owner\'%power\'\'suckler&%staff',
+    '$&verein#"is%!e#&k-hole$"ed%!n$$iang#"ne$%ingia#!o#!t"$oban#"na##rai""pp',
+    '#"tu"$rani#%eling#$mium#$ohey#$teco"%sikon#$knys#%teron""t\'##-on#%aryan#"ha#$tang$*ing/dining',
+    '"$vraj"&x-acre$$ball$&carbon%(haracter$#dog$\'furlong$%horse$&module$$port$%track#%score#2teen&rehy;year-old\'$-day($page',
+    '!/k&oacute;gafoss"$anky""cm"(edaddled#"el#)letonized$#tar#)w-nailing"%hirat"&i-rack%"un$#tow$$wear#%d-row#$legs',
+    '$&licorn#,n-flattering$&ny-rib#%pfest$%loads$(pety-hop#$rton#&ttling"!o#"ff#"ne#"ro#$wron"\'raggin\'(!g',
+    '"&uhravy#)nk-stripe"(y-rocket#$bird#%kings##ler$$lias#&nasaur#&train\'##van$$iews#$word!-l&aacute;inte"\'ag-heap#$inte',
+    '##met#\'p-stick#*shed-price#\'tefield#*v-speaking$\'e-based&%drive&&master%#ry\'#&ymaker"!b"%edged&"rs#$eked$\'p-stage',
+    '%)ing-space$*ve-buckler&"en#&ighing&$ride&!s#(ndertone"(ide-back&#car&$tape%%rules%%shows#&m-down#\'ng-shot$$nart',
+    '"!o#&bodnik##chd#%ggers#%monin#&p-pail#.sh-slosh-slosh#\'w-coach%&growth%%speed&&tarter%$wave$)er-acting$(ing-down$&poke-2',
+    '#)dgebucket&!d#"rk#$shed#$tsky!\'mackin\'#)ll-format&$part\'$rint#%rtgun%&system#%shin\'""ed##ggy#%lders',
+    '""ic#"ep#$leys$#in\'#%rched$$lock#$stig#*th-cumming%"ii$#ted"&oaking#*ke-blowing&\'stained(#ick%&houses',
+    '$#yan#)othly-run&$rite"#pas!%n(ij)"%acked#"gg%%iness#(il-shell%$sden#\'ke-root#$p-in"$ehee"+icker-snack##pef',
+    '"&ookers#\'rkelift#\'t-nosed$$ters\'!y#(w-blower$%birds%%lower%"oy$&capped$%goose$%swept$#viz#!z""ud',
+    '"\'yderman!*o&ccaron;a"!\'"%-that"#928"#afd#"re")bering-up%!o#%ranie#$stad"+cial-market&+demokratiet&\'ist-led&*ly-induced',
+    '"$dano$&stream#"dy##oma%#ise\'#ing"(emarwoto#(ryadjaya""ff##ram$%oniou#"t-%$loan%$sell&#oap',
+    '$$back$(er-edged$$linx$!s$\'windows"%hoite#"yo"-il-conserving"#ken#!o"\'laglass$"ng##dan$!i%&erfish',
+    '$!b$%nodon#&fatara##han#/icitors-general$(d-silver&&topped%+arit&eacute)(y-backed##man#\'omonoff$$park$!r#(ubilised$-tion-collapse',
+    '".meone-or-other$%rsham$.thingdifferent#%maria$%erlad#$nium#!o"%nates%$inas#"et#&gcraft$#men#$illa#\'nambula#)olidating',
+    '"%o-bak#"ks#$ting")phisticut$$rony$"us#%laril#!p#&ranino"%rafom##bed#)ely-tried#!i#$olla##ree',
+    '$)y&mdash;i#\'tbroget$"of"&sandra"$teag##ino#!s"$uban$$iran##ces#!f#%illon#&koyant#&l-loss%(scarring',
+    '##mak#,nd-absorbent&\'barrier\'"ox&$card&)symbolism%#off%&scapes#)p-kitchen#&rbutts$\'ce-tape&%books$%dough#(terrains$"h-',
+    '\'$urne%$ease&#ran%$park$$ines$"ra"(veraigne#+iet-israeli##ovy#$rock""we"#x-5!0p&ouml;-&ouml;vp"-ace-consuming&\'heating',
+    '&&savers%%balls$!k#&de-end$"ge$%olini#"ek#%lpeen#)nakopitta$$daus%"ex$%gling$(ish-born#*rcbuilders%$lite',
+    '$$ging%!o$!t%$okos$"va#$tted##wny"&eak-up%)er-change$&r-butt&\'carrier&$head%\'fishing#%ciall("ed',
+    '*)developed*(prepared%\'es-need$$king%$ledy$*tacle-case%&hruput%#ron#"de#-ech-act-based&&making$\'d-check&%limit&%table%\'sailing',
+    '#%imens$#tel#)ll-binder\'#ook&%check%\'ing-bee%&master$#ter#(ndaholic%"id$#low$(nithorne%%ymore$$wood#\'rmaceti',
+    '$(rbrecher#&tember$"sy"%hagna#(ereality%(oplastic#(ingosine#(ondylium"#ica%"nt$%khoff#!d$&erline%!y#%eling',
+    '$"ht#"n\'$!-%\'bowling%)doctoring&$rier("ft%$outs$%achia%"to$)dle-whorl&#ing$)e-chiller%#tta$\'nerette',
+    '%,t-possession$&ograph%$rbid#"se#-t-and-sawdust")lashplate\'$roof##eep$%ndent#*odcobblers%$ging"*okesworker#!n$*ging-house#$ring',
+    '%#man%*s-climbing\')fisherman&&ground&$view#(tlisting$$teds"&rachen&%knabe$"gg$%y-gun&%paint%$deck#,ead-spectrum&"ed',
+    '&&stimme$%ngler##igg$\'ng-form\'&making&$heel%"ks##uth""si"&urging"!x"*y-catching#$kers##nie!%qaure',
+    '"!u#$addy$(re-dance+#ing\'%faced\'$mile\'\'towered&$foot%"ks$%triti%!t#(eeze-box$%lches#%idgey$#lls',
+    '$$rcle%\'relfish!$rams"%d-6sb##jan"!e#%elane$#ves"\'f-max72""he"(ivastava!$s-21"-135&mdash;138#,98&mdash;206"+20&mdash;24',
+    '"$c-40#!m")ekitoleko""ga""ha"\'i-ncube"$shhh#!s#!t!*t-arneault#%merri#$wart"*aatsarchiv#$bell$)le-jockey',
+    '&$girl%%ising$&stitch#&ckpole#$dial%&ometer$#nyk##ff\'%!e#\'geprops$$horn#$inex&!y$"th#,llingborough',
+    '#-mina-building$)p-machine%#in\'\'(g-ground$$tord#(nborough$*d&ndash;by%%-back&%point%+ards-making%"on&.rtkommandantur%!y$&eyburn$#gls',
+    '$$ners$&street$#wix#%ppert#&r-dust%%maker%&rating%$turn$$beck%%otton$$club$%fleet$$lust$+ting-handle#$shes',
+    '\'%trunk#\'t&ndash$,e&rehy;owned%--administered&)developed&(inspired&$side%+s-sponsored$$hern$(ionwagon%"us$%tauto$)ue-filled%(te-based#$uche',
+    '""bo"%c-616"$eak-$)m-bending&,distillation&\'heating&&packet&%train$$rate%#men#!d$$fast#,el-and-glass&%faced&%maker',
+    '\'%tring&\'toothed%%yards$&nstrup$$p-to%&lejack+!s$%rpike#%ggles$$litz$\'ophiura#$idel$#nem%&hauser%$kern',
+    '#\'llazine%#weg#)niatowski$$osed#"p-%%angle%&change%"in%)parenting$"ek$$find$(ped-down%#in\'$$tech#"re',
+    '&+specificity\'(tructure$+ling-silver$&ognost%"pe%$type$"ry#&warded")ick-float%#ies%$land&!e%$sman%*y-fingered\'$tape',
+    '#+ff-fingered#$gers$%maria#%licho$"l-&%birth&(existing$!o#%mming##nge$$kin\'#!p#$r-up"\'ock-car\'$heck',
+    '&\'raising%$aded%"en%*ing-making($sful%\'jobbers%"le\'#igh%&takers&#urn##ddy#&icescu#\'janovic#&kehold#&leroff',
+    '%)togastric$$pers#*ne\'s-throw%&-mason&\'robbing&\'walling\'#ork%%chats%$hart&$ewer$!g$$kin\'#)ol-pigeon$#pid#\'p&mdash',
+    '$*ping-point#)re-bought$(m-damage\'#oor&%laden&&troops&$wind%&clouds%!e%%scope%%water&#ing$#row$\'y&mdash#%thers',
+    '#*ut-stemmed%%hamer#\'ve-pipe%!r#-wmarket-based""r.#$achs$&divari$%ight-)%armed)/down-the-middle)$time*+o-the-point)"up(&backed',
+    '(%world$#kes$(ndlooper%%geway&\'le-hold&#man%$ieri$+phylococcus$%tegix%&hfoyle$\'w-plait%!b&(erry-red#(eam-line&$side',
+    '%&tfeild$#et-\'%child\'\'fighter\'%light\'%style(&weeper&$beat$$idel$&semann%(s-coping\'&filled\')provoking&\'ed-skin$(tch-lace',
+    '#$ife-$)ke-ridden%+ing-looking$+ng-changing\'\'pulling$)p-cartoon&(lighting&&o-gram%&mining#%occhi$+llercoaster$!m%"lo%#son$$nach',
+    '%\'chullin%*g-stressed&%heart&&itharm$!t%#her##uga$%menti$(t-braced$#utz"#ude$#ier#!f#*mp-kicking#%nkard',
+    '"$yche#"ed#$head#(le-sheet%#set%$wave$.o-statistician##nan#6rene-butadiene-styrene!$u-24"$abia"*b-analyses$$bass$\'circuit%&ommand',
+    '$*department$(humanity$&judice$(licensor&#ght&&terate$&micron$(ordinate$(parallel%&linian%&refect$&sharan#$aire$#sio#\'command',
+    '#&frames#$hash#$iaco#*ject-index(+verb-object#!l#+machineguns%*rine-based&$kets#%nasal#0scriber-supplied$&ources$$pace$%titue%$ring',
+    '+"ns$%opian#+urban-style)$type#$vent"&cceded%*ss-related#%eeded##how#"io#\'tioning"$desh"$erte"(fferered&#red',
+    '&\'coating&$loaf&&master%%craft#\'gestin\'"%haili$"yl"#iza"$kemi#\'hozanet##ina##uma"#lan#$eman#\'lington',
+    '#$pher%-ur-containing((nitrogen((removing\'%etted"#mac$!n$"we##ito#$mer-#$ners""n\'#%-386i$%burst$%chair',
+    '%#ial$\'flecked$%shine$\'terrace#$bass%$thes$$lush$&ronzed$\'ursting#%crush#-day-afternoon\'$best$+erland-born#$expo#$gold',
+    '#$hats#"na$\'ingwell&!k$+yvale-based#)screening$$pecs$&ystems#$tech$#ori$$raps"0p&rehy;plemented#$amix$%start#*er-bagshaw',
+    '\'#oud&)pipelined\'#rey&#spy%%cache\'(lendered\'"st&#olt&$ross%$dome%)erogatory%&grains%#jon%$lash&#ite',
+    '((ket-type\'#tch%\'powered%&single&%tring\'"ud%%trams#\'plicate)#ing%"y\'$&onitur%#rt\'#-ranationalist$"ex"&rcease',
+    '$$shot#\'f-board$,ace-dwelling(&living$(boarding$$line$#orm$$side#*geon-major$$imed#%named#,plus-product$&risin\'##see$"um',
+    '#!v"#sak$"ns#&cipere#%enyos#+pender-belt#%tain\'"#tor"!x"!y!$v-4c""an$"te"&etozar"!f',
+    '!&waddle$#esh#%gging#"lk$(low-dive#+mp-dwelling#&n-dive$\'borough$#ick$\'nington$)sea-based#&p-deal$+o-democrats#+sh-buckling#$tter',
+    '"*eat-filled#&dhouse#)ep-picked$(t-talked\'$ooth%%briar%+ly-smelling%#mix%%y-pie#!g#%llin\'"%ilers#!n$%delli&!n',
+    '&&weight%$beat&%ridge%"le\'!r%#tip#!p$#in\'#!r$"es#\'ss-type#!t$(ch-blade&&backed\'%lades',
+    '&%guard"#oll%-en-headedness#"na#)rd-thrust%%fight%&plants$"ls""rb"$yved!%ybil.%!s"&comore"%lfaen#"ke',
+    '#&lepsis"$mmys#(pathique$%honia"%nares#.chro-energiser\'%works#!g#$nema##ott#&phonia#\'tactics$+h&egrave;se%#axe%$diet',
+    '"(philinum".rian-sponsored((upported"%splex#!t$"at$!e%*m-sentence""va##ota!(zalatnay"*entagothai"\'ilvassy 8t&eacute;l&eacute;vision)-n&egrave;bres',
+    '#%grave"(ndash;6s"4oslash;gdr&aacute;pa!&\'check"&doctor"#ent"$full"$home"%sheep#$tart%!y"$take"%would!#-28""33',
+    '""55""6g"$bass")connector"%shape"&tubule!".t!#480!$5-sb!"80!"a\'"%banus#&by-cat##le\'%+-fellowship',
+    '&\'lighter(#nen&$slip&\'tapping%%lands%$mats%!r##ora$!u"&chisme#%khead$%leton#%tesse"#ddy##ese',
+    '"%ekata#%ymans"$fler"#ges$#tes"$hrir#!u"&il-bar%&gating&%unner%&wagger$%brigg$&coated$#end##ned',
+    '#"ze"$jura""k\'##ara$\'shimaya#"e-$2n&rehy;for-granted#"la"#lcy#%houni#&kshows#%lensi$%mantz#%ukdar##yor',
+    '#&brands$#ura#%isier#%laght#$pion#!s"%naris#$care##dia#!e#&gerang$\'le-free$#ora$"ut#"is',
+    '##nat$%enhof%\'sterben$#hof$$oyed#"ta%%lises"&p-root$+tap-tapping#!a#%hrina#$iola"&quaral"&ramala$$scan',
+    '$"zi#\'booshes#*condimotus#"de%%bigge$#ini#"ee#!g$#ons$"um#&iffing#$nero#.paulin-covered#%rying#%shish',
+    '##vie"%scher##her#(k-master##len$"im##nim##por##sie%$nari"%tegoi$!m$#nen#"ry#$sumi',
+    '$#ier"\'uchnitz#\'gwalder##ler#&metric#"rt#-xi&egrave;res"\'vastian#"ic$"us"$wana$#ret",x-accounting$&dodger$\'evasion',
+    '#%i-man%$ride"&ygetos#(lorcraft#$wood!#cid"$p-ip#$ware""sc!$dong"#sob!$e-lc"&a-gown%&rowing$$leaf',
+    '#&breaks#,cher-learner(-participation$#osy#$gasc$"le#&mworks#%party#&rducts$&scross""ba#"or"%c-huc#%h-sep%$tech',
+    '\'#ien\'&olored%\'obabble&#lgy\'"og)1ically-orientated)*y-transfer&%tribe#&nimont$\'omarine#%sidel##tip"(ddy-tail%$bear%!s',
+    '"%e-box#$nact$(y-bopper#-th-chattering&(grinding%!e"#fal"#ggy##ner"-huac&aacute;n",i-conformant"$khne#"ke#&netics"%l-boy',
+    '#&e-tots%&vision$%casts%%entre%+ommunicated$$film$"gu$)industria$#kos$$mark&%tique%\'etering$*phone-call%%orted(!s',
+    '$(robotics$\'scopium$,vision-style%$sion#$leth$#ima##man%!t#!s$&combes"$maru#)iskamming##kin##ora##ped',
+    '%"te$#lux$&orales("ia&$ized$%sford"\'n-coach&$urse$$date$&furrow$#gun$#ish$$lane$$part%\'er-cent',
+    '$$seat("er%$peed$)under-par$\'wheeler#+ant-finding&#ing$&sserim#)der-crisp&$foot$"re&#sse%%illed$&ulkars#$esor',
+    '#%nesse("an$)is-player##rag#&t-life"%odato"*r&aacute;n#&aflops##dam#!e$!s##fel%&nadine#(minborse#"ni',
+    '%!m%&vision$)e\'blanche%!s$(ier-type\'!e%\'tories.(.y-by-territory$*or-bombing\')inspiring\'&struck&$iste"#sar#!e#%sanna',
+    '#.t&rehy;playing$&-match%#rig$*ing-ground"%touan#(ra-ethyl%#fin%)grammaton%/methylbenzidine%#pak%!x#!u#%zlaff"\'utscher"$wari',
+    '"$yler#"rn!"fa"#iis!"ge!-h&uuml;ringen"%\'best#$fuck#%looks#$mean%%ssage#%other#$said#&tongue"%-that',
+    '#"ht#\'i-phoon#*l&eacute;n$)ictroides#)mmathirat$&nophis$$rong#\'natosis$&gbrand$"ke#"re$!n#!s#\'t-a-way$#_at',
+    '%"in$\'cherist#(wing-out#$xton"\'e&mdash##are$0tre-in-the-round(%style&"um#%baine#"er#%first#%issen#(lmthorpe$$well',
+    '#"n\'$!-$$otsy#$odom&%rescu&$ssin$$gnis$0logico-politicus$%neste$%phanu&&rastos$)ry-making$%tokos#&resien$&malite',
+    '%(o-fixing&%flect&+gravimetric&!n&\'statted$!n#(ta-burst%!s#&utbald#$xton##y\'e$$were"\'iaumont#&ck-cut&$knee',
+    '%$wire#%ebaut$$tart##lke##ng\'%)-gummyjig%#ley%(umajiggy$"k\'%$ing\'$&ly-cut$!n#$okol$$llay$#ngo',
+    '$(ridazine#!q#\'rd-born&#top\'(rimester$%laway$\'teenish%)ies-style%\'y-pound&$five#\'s&mdash$"\'n$#sen"#mar"$oday',
+    '#"mi%!s#%nging#$rden$$havn$&ismund$(nborrows%%proof%)ton-brown$!t%"on#3ught&rehy;provoking\'+-experiment$)sand-foot)$mile',
+    ')$yard%%iding#!w"-ree&rehy;year%0-and-a-half-hour1(year-old&#cpu&$eyed&$form&.hundred-dollar&#ish&$link&%model&\'pointer("rt',
+    '&&setter\'$tory&%tooth&$view&*wavelength\'&heeler%!e%$part&$wood#-ice-decorated#,oat-clearing\'(slitting$"op$$ugh\'\'%-bond',
+    '((the-line\'%fares$%w-out&&weight%"ed#"u\'"$uban#$ggee$"ut#)nderpaddy$%hurst#%rsley"%waits")yangboche##mol',
+    '$!n#$rsis!"i\'#"ro"-ananmen-style"$bble"\'chborne#+k-tick-tick$)et-buying\'&holder$"it"%dball#$dled&!s&!y',
+    '$!d")e-ridging#"de#"ns#$reel""gh$\'t-faced&$shut&#wad%&fisted#!y"%hange"%kopia#"va"&lapias',
+    '%$work#%ghman#(lerettes%!t$!o"#mah#$ball$*er-framing\'\'growing&$line#\'e&mdash$&-cycle%&filler%(reversal%%sense',
+    '%%trial$%bound$$card$$form$\'wasters$$zone##gad##imi#&merman$!o##ney#,oth&eacute;e"#nea#"ga$#ing',
+    '#,kler-gypsies#&selled#%tacks#"y\'"&p-tank#$pled#!z""ra$"rd#%olean#(rukkovil""sa#!l#$sued"#tio',
+    '#\'tupping"$xier!#jia"+okroaminoto!$kach!%loome!+o-the-point"(ast-rack"#bol"%chigi"&daysat#(dle-bike&!s"$e-in$$poke',
+    '#%tuses"\'ga-clad##lia#$ther")ilet-bowl\'%train,"ed#-ng-and-froing"#kio#$omak"%lbiac#"er#)l-in-kind$$iver$!o',
+    '"\'m-frode##ado$\'szewski$(to-sauce#\'b-chest%%maker$!e$!i#$ioka#"me%!e##orn$"to#$pion"&n-mile',
+    '$&ue-tip#%halle#$ique$"te#"ni#&suring##vit"#oks#&l-room%\'to-tool$$sets#!m$!u#"ne#(th-brush',
+    '%#ill$"le"$p-40$$copy&%vered$(grossing$*management$*performing##aze#&hatted#)ic-change\'&ontrol%$line#%knots##lin',
+    '#"pe$#in\'#&sfield$+y-turviness"#ral#$bett#$cato$&hietti#&ibiong#"na#"os#%rence$&igiano%"na#\'telloni',
+    '$"ue%"ga#$vean#$wada")talisator$#nus#"he##man#!t",uch&eacute;e%(-control&#pad%\'aleaume%"ee%%print',
+    '%!y#%rache$%nedos%#oux#*sle-headed#$zeau"#var""we$"el$%rview#$land#\'nshends"\'ymaking!%p-920""ca',
+    '!-r&aacute;fico""aa##bbi#)ck-laying&+maintenance&*suit-style%&laying$)tarianism%(or-mower#&d-rock$+e-promotion%#net#(ffic-jam$%icant#*g&ouml;die',
+    '%#que#&ilered%(ing-edge$&n-tube%$crew#"kl##mpy$%roads#)nquillize,!d$%s-act)&ivator&%ocean&\'species%0action&mdash;the',
+    '&"rt%0cendentalization0"ed&%oding%,disciplinary%\'fecting\'*r-deadline)(printing(#ing&"ix%&humant%&ition\'%)literated%6mitters/bugs/telephone%%ocean',
+    '&"or(+ter-erector%\'shipped%$trem%&versed**ly-mounted$$wood$(zophobia#"pa$$line#)umatizing$%tenau#!v$#ado$!e',
+    '&$back&"ex&%scene\'%phere%$sura#$yful".easure-hunting#\'buchets$!y#&e-frog$$bank$#ton#%ffrey$%garne$%oiled',
+    '$&erthen$$idon#$hane#&ichler#&leidir#\'matodes$\'buckers#$nder$%eague%#tte#&panned#&semme\'$&orerie$%spass#$veal',
+    '$%isano#&wartha$!e#$zeta"!g""he""i-$(laminate#!a$&l-type%#ing$$mine$!n%#dha#)bal-based',
+    '$%huvan$#olo%#nyx$#una%#ter&#ing#$cast$&hology$#ker$%olore(!i#%dacna$#uum#(fluralin##gen',
+    '##jet#\'laminar##nci$!i%%trate$$omic$#toc##ona$"se#(partisme$&eptide$\'hosphor$)le-bypass\'%shell%(icatella',
+    '$%tyque$$wire#*saccharide$%tesse%#ran#*umph-adler#&vector"+na-molecule"#oad##ble#(glodytic$#ons#*iz&emacr;n#(llslayer##mpf',
+    '#+ph&eacute;e%#eus##tty#*ublemaking$&sering#$wles$!s#"xy"$p121")uckle-bed#"ed##ffe#"gs#$nked$!o',
+    '$\'t-based#(th-force&$talk%!e"(y-saving#!i#(psinised!)shipinare"#iba#"nk#!p"&uchida#&kamoto"%volas!%u-154',
+    '"\'be-ride"&ck-box%$shop"$eday#%s-fri"%fteds")g-of-love"$hula"$ibua"$kuls""lf##odo"\'mmy-bug#,our-inducing")ndergarth',
+    '$$cate$%ng-up#$nock$!s"&raatid#"ba%\'n-style$%o-fan&)generator%&shafts#%coman#)f-covered$#man#\'keycock#&moiled',
+    '$"ix$"or$%stall#)tle-shell"&sculum#$hkar#$tain")tamkhatan#"ta#$uola"!v##ans""xy!\'v-style#\'viewing',
+    '!&wamley#&yblade"\'eedside$%zered#$lve-\'#day\'$mile#.nty&mdash;five&!\'&+-eight-year\'&first.\'$page#"re"*ice-a-week#&gworth',
+    '%\'chassis%$lens%$rail%(tracking$$foil##rly#%tchet",o&ndash;tone#$-act$&clause$.dimensionality%)ogs-dying&$main$&figure%$rame',
+    '$,hundred-year$\'in-hand&(strument$%light$\'partner%$enny%#ole$$roll$$sign$-thousand-foot$$unit#"er#!t#"ut"!t',
+    '"!n!\'ying-up"$mnet#)panograms#!s"(ninghame#$wald"(pe-token%&writer#)ographica",r8-substance#%annic\'#zed&%osaur&"us',
+    '$*l-alpenhof"#the##ler!&zigane $u-23"#593"%tapao!%6000s!(bbelohde"!f"(iquinone!$cjba"!k"#les""ok',
+    '""pa!#eno!%fdrop""md"!u!#get!#hhh!#icc"!l")ntacrinus!!j"#ong!+k-published"#ccc"#ela',
+    '""po!$laan"!c#"cs#"us"#nar"$rome")ster-made"\'tra-fit&$lite&(militant&\'radical\'(ightwing&&secret&%trace',
+    '%$high%)microtome"%udere"\'vington!$mast""bs!+n-appointed#(dressing#&hinted#$made#(numbered#)published#%slept"(alarming$&tering',
+    '%&onging#(reathing#&uckles$#ild"#cap#\'haining%%rming#"ia#,o-ordination$%ating$#mfy%$plex$0nformity-related")darwinian#&eceive',
+    '$%r-23s&#30s\'!5&!5&\'achieve&+compensated(&unting&*developing&$hand&&paying&(regarded(*presenting(&warded\'&unning&&served',
+    '(#zed\'\'pending\'\'taffing(%ocked&&taking&(utilized&&values&\'writing%\'coating\'&unting%)emphasize%%glaze&&round-("wn%&laying',
+    '%$pant\'!y&%rices%)recording%$seas\')cretaries&$haft&&lating\'$unky&%tand\'*#in\'&#ung#$ikai$(sturbing"#ece',
+    '$*lightening#-sco-sponsored"%fair\'#%etter#%ixing#)lickering#\'orecast$#und"\'geheuer#$omap#$roup"\'harness#\'oliness#"rc"&i-gram',
+    '#&centre$#yle#%facts##log##mix#!n$*gratiating##on\'%\'-backed&*republican##pac$%rofor##rii#!s#&t-cost',
+    '#&versel\'&itaria)"y\'*(-related$#olt#"x-%*on-iapx-86%#run%%to-nt"%knots##own"-manageability%$ning#&eaning#%odern',
+    '"&nethes")offending##som"&paying##eel$!g#&itying")reforming%\'reshing#\'ounding"&safety$!t%&urates#&ealing$%lfing',
+    '%!t$!x#&heathe$#orn#$mart#\'napping#&terile#(ubscribe"\'tensing$$rtor"\'wedging$\'ighting!#ova!&p&lsqb#3ndash;to&ndash;date',
+    '#*from-under#\'penalty#&stroke$"un#\'trading"%chuck"%drawn$!s"%flung"!g"!l##ine%!k"&making"(per-body',
+    '&&lipped&%plate&\'working%$cuts"%roars"%shift#%izing##ons"%takes""up!%racil##gas#/nium-enrichment#%rtian#"te',
+    '"$izen"#lar""ne"&osevac",quhart-dykes"(r&aacute#"gh"(uguayans##mqi#%shiol!%s-epa"&a-made#"ce##rfu#"sc',
+    '")eformfeed$#ull#)r-chooser"*her-walker"&kevagh#!o""le"(m-quoted"#owi""ps""ry")umancinta""vi!)t&ndash;1"$endi',
+    '""is"!z!\'v-light!&waydah"!f"!i#"st!\'yeshiba!!z"$baks -v&auml;rmland"*iacute;tor"%ndash!!\'!%-band',
+    '"&domain"&groove"\'jointed"$tail##ype!#.k.!"33!%a-rna"&cabond##hon#&umatic$\'um-tube"$enga"(humpuras$!n',
+    '#!t"&khtang"+l&egrave;re#\'canover$/eboll&egrave;re#-d&scaron;tejn$$engo%"se$&ostano#%entis#\'labriga$\'eyfield$#ies$#oni##man',
+    '#&schena#$uate$$e(s)%&-chain&(position%&points#(ve-based"&nauken#&bergen&!r#!d$&al-hit$(ergelder&$pant&$valk',
+    '##ner%#ssa#$tini"$pona""rg#)icoloured$!e$*o-steaming$$tone%!y##ved"(samedics$"ry#"ca$(ulitides',
+    '$#scu#.o-constriction$(dilating"&t-free#)eesatokit$$rsay#%icani\'!o"%udier#$tier"&xnotes""yu"%zguen!#c-7!$diff',
+    '!#eba"#cht#\'tastain$"is$%oring\'#sed"$dius##ran""es""fa")gas-style$&tables#\'etating"$icht"\'kaplast',
+    '&!s#%dhoek##eta"%nator#$dana$#ome##eur#%ganza$-eance-seeking##ire#)kitaraman#$nels%"rs#\'tilates(-ion-perfusion',
+    '$$ouse#$uses#%ville"\'rapamil#(b-schema##det$"in$$oorn#3fassung&rehy;schutz*&srecht#%gisst##jux#,kehrssysteme#)miculated$$ulen',
+    '&#cas&"ka#!r$#rry#%satec$$feld$#yss##tan$(icillium&%orama#)y-low-fat")siculated#"sa$\'el-wall#"ti',
+    '""za!)hs-format"!t!)iacheslav#$nden",bration-free"$c-20#\'e-clamp%(marshals\'$ster$&gerent$%ntino#%hyite#$kris#)tim-state',
+    '$#ual"%dable$#lin$&rabine##eo-&#led&%maker)#ing&\'viewing%)recorders%$tron$!s#!i#!o$!e',
+    '#%wstar"\'gitalle""ib#"ii"+llage-style&*r&aacute;n%#in\'%$rsia%$toro"#mer#"ol"#nas#"cy#$dice$&onissa',
+    '#\'otheque#*yl-covered"&olenza$)in-leader\'\'playing$#one"$pera"&rgilia%#nie#!i$"ng$!s#"ol"%sayas#$caya',
+    '$"om%#nde#%itron#%queen#"si#$ting#-ual-judgement"%taliy%)statistix#\'ellozzi$!x#!m#"re#"ti"%vagen',
+    '$$rini#$eash$"rs#$iano$,dly-coloured!,la&scaron;im#"-6#$dika#!s"%ieghe"!u!"mi!"na!&odafax$"ta',
+    '##ued"$ice\'%&-print%&writer$!i##der##gny#%preux#$ture"$lant$&tilize#!d#$hard#"kl$%staat',
+    '#$odya#-tage-boosting#%umina"&orhees%$oeve$,uitstrevende""rd"+sm&iacute;k"#te\'$\'-fixing%&getter%%loser#"os"%uches#!t',
+    '!"px!#r-4"#eme$"ya!"ub"&cetich"%jacic"(lcanized##pes##tee$%urine#,va-vaginitis!$vers"!v!%watch',
+    '"!e .w&uuml;ppertal!"-2!%.j.m.!\'aalwijk"\'bimania"*chtmeister#(ko-jacko"$dden$%ilove#!o$$-ryu"&gamana#&e-bill&#ook',
+    '%\'payment%)restraint##gly#"le#-on-restaurant"$hdat##eed#!t"\'idmarkt##loo#&nhouse$&scoted(!s($ting#&rarapa',
+    '")kabayashi#$hloo"%lbiri$%ottle#$cher#%dcafe$"er$&hauser$$rave#&eswood#)king-cane$\'through$#ure#*l-covering%&system',
+    '$#ond$%walks#%mgate#$segg#\'thwaite"%napum#$chai#&derin\'##kie#%neroo#%ysday"!o")r-service$$zone#%drope',
+    '$\'washing#&m-lite&&ooking$#cel$)th-loving#$nmed#&p-ship$%stone#(quignies#+rantholders$#iss$$shan$!y#%t-hog"\'s&mdash',
+    '#"em#"fi#%h-tub$(er-drier\'%woman##mes#\'sermann$"on#%tages$%ecare#!w"$t\'ry#$chel%#ies%$mate',
+    '#$elet$&ndlath$+r-absorbing&\'bearing(!d\'#utt&\'carrier\'%hange*#nel\'%loset\'$ress&&formed&)gathering&\'heating&#jar',
+    '\'&ogging&&marked\'#int&(proofing&)softening\'$peed\'&urface&\'trained%\'ed-silk%$mota%)sheddings&%nakes&%tarts%$zooi#*ford-based',
+    '$%point$$rney#\'y-edged"%w-itg##ryk"$xoyl#)y-looking"$y-in##_of#!e##ler!\'c-squad"#omp!.eak-mindedness##led',
+    '#*r-and-tear#%ther\'\'$-eye($talk\'#bys"+d&ndash;sat#!.#*ding-feast#!i"$e\'un##der#$lden#!n"%fting"$have',
+    '"&ibchen#(erstrass#$gang##min#%ngrod#%sbrod$(senbruch%$horn##zen&$bock"%lched$/ome&lsqb;d&rsqb#$dman#/fare-maximizing#/l&rehy;equipped',
+    '$&-based&\'ranched%&fitted%\'greased%&housed%!i%&primed%(reported%(serviced&(toppered&#ung%)vegetated%(weighted%$xxxx$(informed',
+    '#+sh-language#$ters"$nche#"de#"li##vil"$obly"$re\'t$!n#"ft#&kstatt#(tenbaker##yng"\'stchepe$#ech',
+    '%(rn-based($made$$link$\'mancoat$$rope$$view$,ward-flowing)\'looking%#erk%$oods&#rld"&t-road#%hered#$pets""ve',
+    '"$yers!#fwg!*g&ndash;30!&h-word"&ackney##dda#\'le-bone&$hunt&&ribbed$%firth#$mmed#"ng%\'doodles%!s#(rfmaster',
+    '$%sname#(thisname$$mole$&saname#"ur#!y"(eat-germ\'&rowing%!y##ble#\'el-base&(twirling%)barrowing%%clamp%$rims',
+    '%%y-bin$!r##lps#"n-#"rr#\'therall##ver"#ick#\'le-free#\'nbushes#(ppingham%#man#,sky-and-soda#&tbourn$)e-cloaked',
+    '\'#ole&%thorn(&roated&$wash&&yellow%%smith%$well&#ork$$ings$$mire$#rat$&terick&!t%"ow#$zkid',
+    '#&le-day&&person#%opin\'$$shes#(remonger"$rite""y\'#$tock!$icat#$kert%/tkeeper-batsman.&owlers"$ddop#.e&rehy;ranging$%-beam',
+    '$$band$(ly-drawn\')respected\'&spoken$\'ranging$*st-ranging#7owed/divorced/separated"%edniu##ldy#.nerbr&oslash;d#"rd%#sma##ser"+fe-swapping"&g-outs',
+    '##man""iw"&jekoon"*lberforces#&coxson#&d-born%#man%%water$$horn$#ife$1life-conservation$!y#&igelmo#%kinet$%ommen',
+    '%(to-power$%esley%!t&!s%"ys$\'iamsons&!n$&kommen$\'ow-jack$$sher##man#$tern#%xocon"&mberry#$ping',
+    '$!o")n-or-bust#"d-%\'blasted%&screen&%haken&$torm&%ucker%$worn$\'cutters$&fallen$$hill$$jana$&lasses%&estone',
+    '$%olene%%wlene$%pants%\'roofing$%ridge$&thorpe$#way$!x#,e-and-cheese%%based%$list$%field$%lands$!r#&g-bone',
+    '%\'forward$"el#&kleman&&picker#$neck#$odws$"ld##pmt#%scale$#ock#,ter-interest&$idge&$lite&%smith\'%ports',
+    '"$omad"#pro"\'racocha#)e-brushed%#cut$$hair$&lessed$%wound#)ral-based(#orn""sc#\'h-a-day%$bone%+fulfillment$$wood',
+    '#$sant$-enschaftliche"&tblauw#)ch-hunter#,ness-bearing#%schge##tig"*veliscombe!!k!"mf!"ob#!s")dehousian"%erner"$ferl',
+    '"$hler""ks"!l#+f-whistling$"er$\'princes$%sbane%$tein#"lf#"ph#.stenholme-elmy#&terton#"we"(man-form&,of-the-world',
+    '#)en-hating""n\'#%-over#\'der-boy&#dog&"in$$yful##end"#od-%*processing%\'scented\'#rew$"ar$\'benders$%chips',
+    '$&filler&"ne%#uel$$lark$$mice$%nutts$%plank$$ware&!y%%ormed$#yer#&f-woof#!k#+l-gathering$(avington',
+    '$#way#!n#&o-wooo#!p##zle"%rboys#(d-finder%%level%(matching%&search&%tress$$call$$sley%%quare#!f',
+    '%(creation%%ethic%&permit&&roduct%$role%$shop$#er-\'*management\'-participation$(grouping$+house-based$$song%$tage#!l$\'d-music',
+    '#&m-lion##red$"it$\'y-eater##se\'#$tman""sa""to#\'sisname!\'recched$!s#\'n-lewis#*xham-based"(inklydom#(st-brace',
+    '%!d%.r-in-residence$(ing-room")ongheaded#"th"!t!"tl!$ujec""ld#$fram"$nsch!"vc!(ynarczyk#$toun"(pijewski',
+    '#%ockyj""th +x&ndash;xii!#-28""31"\'bracing"+certificate""ed"$form"\'o\'clock!$a(d)"!m"%nadus#%thism%"us',
+    '!$dcmp"!k!%emgin"#ric#"se"%wkija!)facemaker"!c!%iiith"$llix"!m"#ola"%ulian""xs!!k',
+    '"!p!$oren!-pg4-compliant!%shell!&trapro!$word!"xl"%xxxxx""yz!)ylophones"$plex"!w"!y &y\'mean"$star',
+    '!%-cell"$mp2e"&neuron!%a\'kub"%c-end#!c#&keting"#ger#"na"%hyali"*k&ndash;11+!2,!a+!8*"38',
+    '"$mmer"\'ng-kang$!s#(kilevski#"ni"#riv#&n-dyed$!e$#ing$(spinning#!o""sh#$want"#tsu"#zid',
+    '"!f!#c-5"!p!$ealm##mes#\'r&mdash*$;the$"by$+s&mdash;the#$tses"!c"%e-haw"$gyaw""ld#*low-backed',
+    '\'&hammer&\'jackets"(meneeyeh"$nnex""on$!g"$rsin"&ssiree"-t-to-be-named#!t"#uch#"ng"*vstigneyev"!z!&graine',
+    '##nni""ep"!k""le"\'midhirr"\'ng-jeou%$yang"$pped""sh""zz!$mcas"$laen!)nneforthe!$obby"!c',
+    '#"um"\'himbine"!k"!l#!a"*ngchaiyudh#"is"#rck"\'shihiko%$taka##ser"\'u&ndash#%ng\'un%!e&)r-looking',
+    '##r\'e%!n##sef#\'th-club&(training!#pfb!$quem!#s-x"&grifau!7ttrium-aluminium-garnet!(ucatecos"*dhishthira""eh"!g"&mmiest',
+    '"&risich#!k"!s#$agai""tz"!v 5z&aacute;bradl&iacute"*uuml;lpich!(-average"#boy!%abern"\'charoff$#ert"$gged"%hedan',
+    '#&ringen"$itun")lcitabine#!d$+&iacute;var#"es"%malia#%enhof#%petti$$olli#$zams"#nni#"te#&zibari"#rit',
+    '#$onim#"ri#+st&oslash;s"%stava"#tun"&ventem$#rda"#zie#"ou!&ecevic""ds"%etank#"vi"&ferino""id',
+    '"#lie##ler"#mek"#nit"%rboni#)o-defects$#xac"#tex""ug"$wail#"de!\'hendong"$igge"%ongli"\'urbenko',
+    '#%uddin"%emian"\'fferero"&geuner##ged$!i#!s"#hou"$kali"\'llertal"%mmerl\'!i\'!y##ove#&precht',
+    '"$ncke##ner"!o#\'lkiwski""ss$#ick#!u""to"%zzing!#oar""ha"%ladex##ler"!n#&galero',
+    '##mer"(shchenko"$uave"!w!%s-lyw"#m-5!#ube#(izaretta"%ccari#)kerfabrik"#glo"!n##xin"%tphen"\'waitina',
+    '!&wygart!&ymurgy"#nar!%zthat"&zzzzzz',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_46 = (
+count_46 = 6694
+
+heads_46 = (
     'henfrey',
-    'henryton',
-    'hentsch',
-    'heparin-binding',
-    'hepatectomised',
-    'heppelwhite',
-    'her&ndash',
-    'heraclius',
-    'herault',
-    'herbertson',
-    'here&mdash',
-    'heren',
-    'herero',
-    'herg&eacute',
-    'herishef',
-    'hermanos',
     'hermanus',
-    'hermeticism',
-    'herndon',
-    'herning',
-    'heroin\'',
-    'herpetology',
-    'herring-curing',
-    'herrn',
-    'herself&mdash',
-    'hershiser',
-    'hertslet',
-    'herwig',
-    'hesl',
-    'heslerton',
-    'hesperion',
-    'hessenthaler',
     'heswell',
-    'heterosoc',
-    'heutenant',
-    'hewan',
-    'hewerdine',
-    'hex-nodes',
-    'hey-ey',
-    'heyliger',
-    'heym',
-    'heymer',
-    'heyndrickx',
-    'hfro',
-    'hge',
-    'hi-aa',
-    'hi-grade',
-    'hi-gro-filla',
     'hi-loft',
-    'hi-nrg',
-    'hiace',
-    'hiang',
-    'hiaticula',
-    'hiba',
-    'hibbit',
-    'hibernicus',
-    'hibrazil',
-    'hiccoughy',
-    'hickathrift',
-    'hickmott',
-    'hickory-shafted',
-    'hidab',
-    'hidage',
-    'hiden',
     'hider',
-    'hidipo',
-    'hied',
-    'hierachy',
-    'hieronym',
-    'higamous',
-    'higgledy',
-    'high&rehy;flying',
-    'high-acidity',
-    'high-angle',
-    'high-back',
-    'high-baroque',
-    'high-cheek-boned',
-    'high-churchman',
-    'high-compression',
-    'high-country',
     'high-floor',
-    'high-hat',
-    'high-inference',
-    'high-life',
-    'high-lights',
-    'high-mid',
-    'high-neck',
-    'high-oxygen',
-    'high-paid',
-    'high-perch',
-    'high-polished',
-    'high-potential',
-    'high-principled',
-    'high-purity',
-    'high-relief',
-    'high-reward',
     'high-road',
-    'high-roof',
-    'high-skilled',
-    'high-thinking',
-    'high-tone',
-    'high-tonnage',
-    'high-torque',
-    'high-unemployment',
-    'high-way',
-    'high-yield-bond',
-    'higher-speed',
-    'highest-average',
-    'highest-placed',
-    'highflier',
-    'highly-centralized',
-    'highly-experienced',
     'highly-specialised',
-    'highly-variable',
-    'highminded',
-    'highpitched',
-    'highranking',
-    'hightailed',
-    'highter',
-    'higley',
-    'higrade',
-    'hii',
-    'hikmat',
-    'hikurangi',
-    'hilat',
-    'hild',
-    'hile',
-    'hilfield',
     'hillmorton',
-    'hillwood',
-    'himelf',
-    'himself\'',
-    'himself-',
-    'hinayana',
-    'hinc',
-    'hinchcliff',
-    'hindawi',
-    'hindbrains',
-    'hindu-nationalist',
-    'hindwing',
-    'hiner',
-    'hingin\'',
-    'hink',
-    'hinku',
     'hip-joint',
-    'hip-pocket',
-    'hippi-based',
-    'hippogryph',
-    'hippuris',
-    'hipsher',
-    'hipsway',
-    'hirundines',
-    'his-',
-    'hispania',
-    'histampica',
-    'histoires',
-    'historex',
-    'historicising',
-    'historismus',
-    'history\'',
     'history-driven',
-    'history-related',
-    'history-writing',
-    'hisy',
-    'hitchcox',
-    'hitchman',
-    'hithercroft',
-    'hitin',
-    'hix',
-    'hjalmar',
-    'hjulstr&oslash;m',
-    'hla-dqa1',
-    'hla-dr4',
-    'hla-drb',
-    'hldgs',
-    'hma',
     'hmmmmmm',
-    'hmr',
-    'hmu',
-    'hmy',
-    'ho-ho-ho',
-    'ho-ome',
-    'hoary-headed',
-    'hoaxed',
-    'hoaxing',
-    'hobbin',
-    'hobbit-based',
-    'hobdayed',
-    'hobdens',
-    'hochoy',
-    'hochwald',
-    'hock-deep',
     'hockey-stick',
-    'hockneys',
-    'hockridge',
-    'hoder',
-    'hodgsoni',
-    'hodie',
-    'hodoul',
-    'hods',
-    'hoenigman',
-    'hoerner',
-    'hoffer',
-    'hogamous',
-    'hogge',
-    'hohenreid',
-    'hoick',
-    'hoicked',
     'hok',
-    'hoke',
-    'hokey-cokey',
-    'holbeins',
-    'holburne',
-    'holcraft',
-    'holdcroft',
-    'holdin\'',
-    'hole-and-corner',
-    'holesaws',
-    'holimarine',
-    'holker',
-    'holle',
-    'hollerbach',
-    'hollie',
-    'holling',
     'hollowbody',
-    'hollywater',
-    'hollywood-type',
-    'holms',
-    'holmstroyd',
-    'holmwood',
-    'holocanthus',
-    'holographs',
-    'holopics',
-    'holstein-friesian',
-    'holstentor',
-    'holte',
-    'holtzman',
-    'holzhamerhof',
-    'home-developed',
-    'home-market',
     'home-prepared',
-    'home-related',
-    'homebody',
-    'homebuying',
-    'homegirl',
-    'homelodge',
-    'homeright',
-    'homero',
-    'hominem',
-    'hominum',
-    'honesta',
-    'honey-hunting',
-    'honeytrap',
-    'honkers',
-    'honkey',
-    'honkytonk',
     'honnold',
-    'honsik',
-    'honza',
-    'hooberman',
-    'hoodie',
-    'hoodmoulds',
-    'hoogvelt',
-    'hooktier',
-    'hool',
-    'hoop-skirt',
-    'hooses',
-    'hopgood',
-    'horejc',
-    'horie',
-    'horizontally-growing',
-    'horn-handled',
     'horninglow',
-    'hornlein',
-    'hornwort',
-    'horny-handed',
-    'horologium',
-    'horror-filled',
-    'horror-story',
-    'horse\'',
-    'horse-and-cart',
-    'horse-cab',
-    'horse-pistol',
-    'horse-radish',
-    'horse-shoeing',
-    'horse-slaughterer',
-    'horse-sweat',
-    'horse-whipped',
     'horsechestnut',
-    'horsefield',
-    'horszowski',
-    'horti',
-    'hose-down',
-    'hosepiping',
-    'hoshiyeh',
-    'hosken',
-    'hosp',
-    'hospita',
-    'hospitalaria',
-    'hossmer',
-    'hostier',
-    'hot\'n\'tender',
-    'hot-film',
-    'hot-headedness',
     'hotair',
-    'hotek',
-    'hotel-keeper',
-    'hotel-owner',
-    'hotel-restaurant',
-    'hothams',
-    'hotpots',
-    'houlding',
-    'houn',
-    'houndslet',
-    'hourquet',
-    'housden',
-    'house\'',
-    'house-boat',
-    'house-buyer',
-    'house-clearance',
     'house-end',
-    'house-keeper',
-    'house-owning',
-    'house-purchase',
-    'house-sale',
-    'house-sit',
-    'househusband',
-    'housekeeper-companion',
-    'houseparent',
-    'houseperson',
-    'housewarmer',
-    'housing-association',
-    'houslay',
-    'houssin',
-    'houze',
-    'hovedene',
     'hoven',
-    'hover-taxi',
-    'howgrave',
-    'howlingly',
-    'howseman',
-    'hoxmark',
-    'hoydenish',
-    'hoyem',
-    'hoys',
-    'hradi&scaron;t&ecaron',
-    'hrair',
-    'hristo',
-    'hroch',
-    'hrvoje',
-    'hrz&aacute;n',
-    'hseq',
     'hsin-chieh',
-    'hsing',
-    'hsing-i',
-    'hsv-140',
-    'hswa',
-    'ht29&ndash;19a',
-    'htk',
-    'huanchaca',
-    'huaqiu',
-    'huarmey',
-    'hubayqah',
-    'hubbell',
-    'hubcap',
-    'hubertushof',
-    'hubland',
-    'hublander',
     'huchra',
-    'huckstep',
-    'huda',
-    'huddersfield-based',
-    'hudlass',
-    'huffer',
-    'hugg',
-    'hughe',
-    'huijghebaert',
-    'huit',
-    'hulcote',
-    'hulloa',
-    'hully-gully',
-    'hulsta',
-    'humaines',
-    'human-chimpanzee',
     'human-enhancing',
-    'human-induced',
-    'human-interest',
-    'humbolt',
-    'humbrol',
-    'humors',
-    'humped-backed',
-    'humpston',
-    'hunapipi',
-    'hunder',
-    'hundred-headed',
-    'hundred-watt',
-    'hungaroton',
-    'hunne',
-    'hunt-cup',
-    'hunt-cups',
     'hunterprint',
-    'hunting-and-fishing',
-    'huntridge',
-    'huon',
-    'hup&ndash;3',
-    'hurroy',
-    'hurson',
-    'huruk',
-    'hus&aacute;k',
-    'husam',
-    'husband-father',
-    'hussenot',
-    'hustles',
-    'hutchesontown',
-    'hutte',
-    'huug',
     'huws',
-    'huysmans',
-    'huyton-born',
-    'huzza',
-    'huzzaing',
-    'hvac',
-    'hwarang',
-    'hybrasil',
-    'hyd&eacute;n',
-    'hyder',
-    'hydnoceras',
-    'hydrides',
-    'hydrilla',
-    'hydro-geology',
-    'hydrobates',
-    'hydrocomp',
     'hydrocyclone',
-    'hydromassage',
-    'hydroxybutyrate',
-    'hydrus',
-    'hyett',
-    'hyginus',
-    'hygrometer',
-    'hygrove',
-    'hylobates',
-    'hymenophyllum',
-    'hymn-motet',
-    'hymn-writer',
-    'hyoscyamine',
-    'hyper-ventilating',
-    'hyperalkaline',
-    'hyperamylasaemia',
     'hyperarc',
-    'hypergames',
-    'hypergraphics',
-    'hypermall',
-    'hypertalk',
-    'hypno',
-    'hypnos',
-    'hypnotone',
-    'hypochloride',
-    'hypodermics',
-    'hypophosphataemia',
-    'hypothesis-seeking',
-    'hypotheticals',
-    'hypsichides',
-    'hyraxes',
-    'hyre',
     'hystrix',
-    'i&mdash',
-    'i\'le',
-    'i\'ver',
-    'i-calmodulin',
-    'i-his',
-    'i-i-',
-    'ia(c)',
-    'iannella',
-    'iannelli',
-    'iaopa',
-    'iasco',
-    'iat',
-    'iatrochemist',
-    'iberis',
-    'ibg',
     'ibis-headed',
-    'ibmspeak',
-    'ibroblasts',
-    'ibsley',
-    'icad',
-    'icca',
-    'iccd',
-    'iccpr',
-    'icdma',
-    'ice-berg',
-    'ice-cliff',
-    'ice-desert',
-    'ice-fishing',
-    'ice-floe',
-    'ice-screw',
-    'ice-skater',
     'iceclouds',
-    'icefields',
-    'icehouse',
-    'icel',
-    'icescape',
-    'icestar',
-    'ichnobates',
-    'icifi',
-    'icing-sugar',
-    'ick',
-    'icklesham',
-    'icks',
-    'icl-kmecs',
-    'iclr',
-    'iconix',
-    'iconostasis',
     'icp-oes',
-    'icpic',
-    'icsitm',
-    'ictinus',
-    'icyb',
-    'id-impulse',
-    'idared',
-    'idcs',
-    'iddo',
-    'idea\'',
-    'identicar',
-    'identifed',
-    'identity-formation',
-    'ideograph',
-    'ideomotor',
-    'idoxuridine',
     'idt',
-    'idumaeans',
-    'ieb',
-    'iecc',
-    'ierusalem',
-    'iesg',
-    'iet',
-    'ietf',
-    'iew',
-    'ieyasu',
-    'if\'t',
-    'if-onlys',
-    'ifema',
-    'iffyish',
-    'ifid',
-    'ifo',
     'ifos-lite',
-    'igbp-dis',
-    'igelfilm',
-    'igk',
-    'iglesia',
-    'igman',
-    'igw',
-    'igy',
-    'ihave',
-    'ihor',
-    'ihr',
-    'ihsan',
-    'ii&ndash;vi',
-    'ii-iii',
-    'iicx',
-    'iii-iv',
     'iij',
-    'iimr',
-    'iipa',
-    'iirc',
-    'ijma',
-    'ijsselmeer',
-    'ikat',
-    'ikbs',
-    'ikoyi',
-    'ikram',
-    'il-4',
-    'ilbery',
-    'ilewin',
-    'ilf',
-    'ilhamy',
-    'ili',
     'ilja',
-    'ilka',
-    'ill-controlled',
-    'ill-hidden',
-    'ill-housed',
-    'ill-kept',
-    'ill-recorded',
-    'ill-shaped',
-    'illmitz',
-    'illo',
-    'iltf',
-    'ilych',
-    'image-',
-    'image-editing',
-    'image-schema',
-    'imagestudio',
     'imagin',
-    'imagineers',
-    'imaz',
-    'imbiber',
-    'imbricate',
-    'imee',
-    'imemo',
-    'imf-supported',
-    'imino-imino',
-    'imj',
-    'iml',
-    'imm&eacute;diatement',
-    'immaterialist',
-    'immed',
-    'immobilon',
-    'immobilon-p',
     'immolate',
-    'immunoalkaline',
-    'immunoblotted',
-    'immunochemistry',
-    'immunodetection',
-    'imotski',
-    'impacto',
-    'impactors',
-    'impasted',
-    'imperiali',
-    'imperiall',
-    'implodes',
-    'importa',
-    'improvisationary',
-    'improvises',
-    'impudicus',
     'impune',
-    'imr',
-    'imt',
-    'imtec',
-    'imvo',
-    'in&ndash',
-    'in-bond',
-    'in-charge',
-    'in-circuit',
-    'in-cockpit',
-    'in-college',
-    'in-control',
-    'in-ex',
-    'in-flood',
-    'in-out',
-    'in-play',
     'in-pond',
-    'in-put',
-    'in-the-round',
-    'in-town',
-    'inachev&eacute',
-    'inan',
-    'inarticulated',
-    'inasti',
-    'inavase',
-    'inbio',
-    'inc-owned',
-    'incan',
-    'incandesce',
-    'incant',
-    'incanted',
-    'incario',
     'incarnatus',
-    'incentivising',
-    'incepted',
-    'inchbold',
-    'inci',
-    'inclusio',
-    'income-generation',
-    'income-producing',
-    'incomprehending',
-    'inconvertibility',
-    'incouragement',
-    'indeces',
-    'indep&ecirc;ndencia',
-    'index-replicating',
-    'indian-brave',
-    'indian-style',
     'indianizing',
-    'indiepop',
-    'inditing',
-    'individualises',
-    'indo-bangladeshi',
-    'indocement',
-    'indpendent',
-    'indris',
-    'indu',
-    'industrial-type',
-    'industriels',
-    'industry\'',
-    'industry-type',
-    'inedited',
-    'infant-feeding',
-    'infantas',
     'infantilized',
-    'infantilizing',
-    'infantine',
-    'infelix',
-    'infin',
-    'inflation-risking',
-    'infoplus',
-    'informate',
-    'information-',
-    'information-bearing',
-    'information-led',
-    'information-packed',
-    'infotel',
-    'ingaged',
-    'ingela',
-    'inghelbrecht',
     'inglesham',
-    'inglesi',
-    'inglish',
-    'ingored',
-    'ingrain',
-    'inhaul',
-    'iniap',
-    'initia',
-    'initio',
-    'initmate',
-    'injur',
-    'injury-ridden',
-    'ink-filled',
-    'inkatha-controlled',
-    'inlanders',
-    'inmark',
     'inmortal',
-    'innamorato',
-    'inner-',
-    'innerlash',
-    'innerst',
-    'innsite',
-    'ino',
-    'inpadoc',
-    'inprints',
-    'inpsector',
-    'input-impedance',
-    'inria',
-    'inrushes',
-    'insentient',
-    'insert-note',
-    'insertion-deletion',
     'inside-edged',
-    'inside-page',
-    'insideout',
-    'insight-generating',
-    'insolubles',
-    'inspecteurs',
-    'inspector-',
-    'inspiriting',
-    'insps',
-    'instan',
-    'instant-by-instant',
-    'institue',
-    'institution-led',
-    'instone',
-    'instrumentorum',
-    'insulin-dependant',
     'insulin-producing',
-    'insulin-requiring',
-    'insulin-treated',
-    'insurace',
-    'inswing',
-    'int\'l',
-    'integra',
-    'integraph',
-    'intell',
-    'intelliport',
-    'intels',
-    'intendin\'',
-    'inter&rehy;mediate',
-    'inter-alu',
-    'inter-change',
-    'inter-confessional',
     'inter-current',
-    'inter-fund',
-    'inter-letter',
-    'inter-node',
-    'inter-project',
-    'inter-proton',
-    'inter-rail',
-    'inter-stimulus',
-    'inter-vertebral',
-    'interbreeds',
-    'interchangeable-blade',
-    'intercommunicating',
-    'interconnection-based',
-    'intercrop',
-    'intercrural',
-    'interdictor',
     'interdigitate',
-    'interdit',
-    'interest\'',
-    'interesting\'',
-    'interface-compliant',
-    'interfluves',
-    'interhotel',
-    'interleukins',
-    'intermarrying',
-    'intermediating',
-    'intermit',
-    'internal-market',
-    'internationally-recognized',
-    'internegative',
-    'internet-based',
-    'interpolates',
     'interport',
-    'intersel',
-    'intersexing',
-    'intersource',
-    'interstack',
-    'intertel',
-    'intertelcom',
-    'intervent',
-    'intervertebral',
-    'intext',
-    'intra-state',
-    'intrabrand',
-    'intracellulary',
-    'intrada',
-    'intraden',
-    'intrastats',
     'intruments',
-    'inveighs',
-    'inverie',
-    'inverlochy',
-    'invitro-fertilisation',
-    'inward-turned',
-    'iogt',
-    'ipecac',
-    'iphigenia',
-    'iplib',
-    'ipp',
-    'ipps',
-    'ipsenta',
-    'ipu',
-    'ipwich',
-    'iqa',
     'iranian-based',
-    'irazu',
-    'ircam',
-    'irf-2',
-    'iridologists',
-    'irish-catholic',
-    'irl',
-    'iron-centre',
-    'iron-oxide',
-    'iron-railed',
-    'iron-smelting',
-    'ironbound',
-    'ironfist',
-    'ironmistress',
-    'irreg\'larity',
-    'irrupted',
     'irsa',
-    'irtelli',
-    'iruhito',
-    'irve',
-    'is\'t',
-    'isam-xa',
-    'isamu',
-    'isaurian',
-    'ished',
-    'ishi',
-    'ishibashi',
-    'ishim',
-    'ishoka',
-    'ishrat',
-    'isidor',
-    'isk',
     'isker',
-    'islamicism',
-    'islamophobia',
-    'island-arc',
-    'islesmen',
-    'ismaeli',
-    'isnardia',
-    'isometrics',
-    'isoproterenol',
-    'isotron',
-    'isp',
-    'israeli&rehy;occupied',
-    'issalu',
-    'issc',
-    'issmfe',
-    'issn',
     'issos',
-    'issro',
-    'issy',
-    'istdc',
-    'istoria',
-    'itacs',
-    'itagaki',
-    'italbrokers',
-    'italian-designed',
-    'italian-ness',
-    'italian-speaking',
-    'italian.',
-    'italianamerican',
-    'italianer',
-    'italie',
-    'itavia',
     'itca',
-    'ither',
-    'itl',
-    'itmi',
-    'itmk',
-    'ito-yokado',
-    'itp',
-    'itrc',
-    'itsy-bitsy',
-    'ittc',
-    'ittehad',
-    'itti',
-    'ituna',
-    'itus',
-    'iudex',
-    'iuris',
     'ivamy',
-    'ivamys',
-    'ivanovic',
-    'ivb',
-    'ivd',
-    'ivenel',
-    'ivry',
-    'ivy-grown',
-    'iwai',
-    'iwould',
-    'ixxviii',
-    'izabal',
-    'izekial',
-    'izenour',
-    'j&auml;mtland',
-    'j\'attendrai',
     'j-',
-    'j-6',
-    'j-bass',
-    'jabaliyah',
-    'jabavu',
-    'jabbar',
-    'jachowicz',
-    'jackaroo',
-    'jackmanii',
-    'jacknife',
-    'jackowska',
-    'jacobin\'',
-    'jacovitch',
-    'jade-working',
-    'jaeckel',
-    'jafar',
     'jagerwirt',
-    'jagging',
-    'jailbreaker',
-    'jambes',
-    'jamc',
-    'jameses',
-    'jamet',
-    'jami',
-    'jamjars',
-    'janaway',
-    'janeway',
-    'janhonen',
-    'janin',
-    'janko',
-    'janmabhoomi',
-    'janu',
     'january&ndash;february',
-    'janya',
-    'japansese',
-    'japonicum',
-    'jaqui',
-    'jardiniere',
-    'jarfalla',
-    'jaricot',
-    'jarnet',
-    'jaross',
-    'jarva',
-    'jas.',
-    'jassem',
-    'jaswant',
-    'javagal',
-    'javictreva',
     'jawa',
-    'jawan',
-    'jawbox',
-    'jawlines',
-    'jayaram',
-    'jaydee',
-    'jayemdoubleyou',
-    'jayes',
-    'jayhawk',
-    'jayswood',
-    'jaytex',
-    'jazz-band',
-    'jazz-musician',
-    'jbc',
-    'jbl',
-    'jccu',
     'je-ne-sais-quoi',
-    'jean-clad',
-    'jeannerod',
-    'jeans-clad',
-    'jeck',
-    'jeezus',
-    'jehoiachin',
-    'jehu',
-    'jejeunoileostomy',
-    'jekou',
-    'jekylls',
-    'jelly-filled',
-    'jeltoksan',
-    'jenewary',
-    'jenik',
-    'jenninger',
     'jeoff',
-    'jepsen',
-    'jerada',
-    'jeri',
-    'jerkwater',
-    'jerpoint',
-    'jersualem',
-    'jervois',
-    'jessiman',
-    'jet-engine',
-    'jet-pipe',
-    'jet-propulsion',
-    'jetez',
-    'jetprint',
-    'jetsetting',
-    'jetski',
     'jetskiing',
-    'jew-boy',
-    'jewelling',
-    'jewells',
-    'jewison',
-    'jeyaretnum',
-    'jezreel',
-    'jgm',
-    'jharsetli',
-    'jhb',
-    'jiacha',
-    'jibing',
-    'jicaro',
-    'jiggers',
-    'jihozapadni',
-    'jilin',
     'jilting',
-    'jina',
-    'jine',
-    'jings',
-    'jipona',
-    'jirat-wasiutynski',
-    'jisc',
-    'jish',
-    'jittered',
-    'jiul',
-    'jived',
-    'jiyeh',
-    'jmi',
-    'jnc',
-    'jno',
-    'job\'',
     'job-lot',
-    'job-preservation',
-    'job-shedding',
-    'jobb',
-    'jobete',
-    'jobhunt',
-    'jockey-club',
-    'jockus',
-    'jogia',
-    'johnen',
-    'joides',
-    'jointer',
-    'joisey',
-    'jokanaan',
-    'jol',
-    'joliet',
     'jolley',
-    'jonesey',
-    'jonti',
-    'jop',
-    'jorio',
-    'jorja',
-    'jork',
-    'jorrocks',
-    'joskiss',
-    'joskow',
-    'josnau',
-    'jospice',
-    'journaling',
-    'journey\'',
-    'journey-men',
-    'jousted',
     'jouve',
-    'jowly',
-    'joyed',
-    'joylon',
-    'jp-6',
-    'jpe',
-    'jtfax',
-    'ju-i',
-    'ju-ju',
-    'jubbulpore',
-    'jubran',
-    'jubula',
-    'jud',
-    'judge(s)',
-    'judiac',
-    'judicatam',
     'judiciaire',
-    'judiciaires',
-    'jug-handle',
-    'jugements',
-    'jugendf&uuml;rsorge',
-    'jugendherbergen',
-    'jugendwohlfahrtsgesetz',
-    'jugovi&cacute;i',
-    'jugovic',
-    'juhan',
-    'juillet',
-    'julianus',
-    'julieta',
-    'july&ndash;august',
-    'july&ndash;november',
-    'jumani',
     'jumma',
-    'jump-in',
-    'jumpstart',
-    'junc',
-    'junglist',
-    'jungst',
-    'jungvolk',
-    'junije',
-    'junk-mail',
-    'junsheng',
-    'junzo',
-    'jupp&eacute',
-    'juri',
-    'jurkic',
-    'juro',
-    'jusque',
     'just&mdash',
-    'just-so',
-    'justavus',
-    'justiceships',
-    'justo',
-    'juxtapositioning',
-    'k&aacute;rm&aacute;n',
-    'k&auml;seplatte',
-    'k&ouml;lbel',
-    'k&ouml;lner',
-    'k&ouml;niggr&auml;tz',
-    'k&ouml;nigskinder',
-    'k&ouml;nigsmarck',
-    'k&uuml;hnpast',
-    'k&uuml;nster',
-    'k&uuml;nstlervereinigung',
     'k-252b',
-    'k-board',
-    'k-k',
-    'k-selected',
-    'k.h.',
-    'k24',
-    'ka-boom',
-    'kabaddi',
-    'kabbalism',
-    'kabbia',
-    'kabin',
-    'kabylie',
-    'kachru',
-    'kacin',
-    'kacou',
-    'kaczmarek',
     'kaddish',
-    'kaddoumi',
-    'kadreddin',
-    'kagoshima',
-    'kagumo',
-    'kahuku',
-    'kaim',
-    'kairoi',
-    'kaki',
-    'kakoo',
-    'kalam',
-    'kalandra',
-    'kalanoi',
-    'kaled',
-    'kalisco',
-    'kalle',
     'kallidromos',
-    'kalliste',
-    'kalnins',
-    'kalpa',
-    'kalyvia',
-    'kamari',
-    'kamata',
-    'kamataka',
-    'kamau',
-    'kamiah',
-    'kamilish',
-    'kaminer',
-    'kamp&ecaron',
-    'kampelman',
-    'kampong',
-    'kan\'an',
     'kanake',
-    'kananaskis',
-    'kanata',
-    'kangaroo-skin',
-    'kanghwa',
-    'kango',
-    'kangwana',
-    'kaniu',
-    'kankoila',
-    'kant&oacute',
-    'kanwisher',
-    'kaoru',
-    'kapalua',
-    'kaplanis',
-    'kapow',
-    'karabagh',
     'karaganda',
-    'karagwe',
-    'karakul',
-    'karatzias',
-    'karawanken',
-    'karezza',
-    'kargbo',
-    'karger',
-    'kariel',
-    'karikari',
-    'kariuki',
-    'kark',
-    'karks',
-    'karlie',
-    'karlson',
-    'karmali',
     'karmenu',
-    'karnofsky',
-    'karolinka',
-    'karpoff',
-    'karrar',
-    'karron',
-    'kartuz',
-    'karunaratne',
-    'karunatilleke',
-    'karwal',
-    'kasama',
-    'kashoggi',
-    'kashubian',
-    'kasikopu',
-    'kaskelot',
-    'kassapu',
     'kassiano',
-    'kassin',
-    'kastri',
-    'kasuga',
-    'katharin',
-    'kathrine',
-    'katsav',
-    'katshuda',
-    'katsuru',
-    'katydids',
-    'kaub',
-    'kaufhof',
-    'kaunic',
-    'kauzmann',
-    'kavan',
-    'kaw',
     'kawagoe',
-    'kawak',
-    'kawakubo',
-    'kawarimono',
-    'kawasakis',
-    'kayoko',
-    'kazan\'',
-    'kazatin',
-    'kazie',
-    'kba',
-    'kci',
-    'kdf',
-    'keary',
-    'keck',
-    'kedourie',
-    'keel-haul',
     'keely',
-    'keemun',
-    'keenlyside',
-    'keeny',
-    'keepsack',
-    'keersmaeker',
-    'kefaloyannis',
-    'keich',
-    'keigo',
-    'keino',
-    'kek-kek-kek',
-    'kelabit',
-    'kelahar',
-    'kelf-cohen',
-    'kellar',
-    'kellow',
     'kelowna',
-    'kemeny',
-    'kempenfelt',
-    'kemppi',
-    'kempten',
-    'kengo',
-    'kenjutsu',
-    'kenn',
-    'kennaways',
-    'kensetsu',
-    'kensley',
-    'kentia',
-    'kenyan-born',
-    'keramik',
-    'keratitis',
-    'kerb-side',
     'kerebos',
-    'kerkut',
-    'kernighan',
-    'kernow',
-    'kerouac-style',
-    'kerpow',
-    'kerrunch',
-    'kerse',
-    'kersh',
-    'kershope',
-    'kershopefoot',
-    'kersten',
-    'kerswall',
-    'kertzman',
-    'kesparates',
-    'kessell',
     'ketch-rigged',
-    'ketchups',
-    'ketonuria',
-    'ketsugo',
-    'kette',
-    'kettleful',
-    'ketziot',
-    'keun',
-    'key-rack',
-    'key-signature',
-    'keyblock',
-    'keybuk',
-    'keye',
-    'kha',
-    'khabar',
-    'khabarin',
     'khabiri',
-    'khabiris',
-    'khachaturian',
-    'khairulin',
-    'khaki-green',
-    'khalichen',
-    'khalis',
-    'khalqi',
-    'khandker',
-    'kharg-5',
-    'khazen',
-    'khazi',
-    'khi',
-    'khlist',
-    'kholstyler',
-    'khomeini.',
     'khoneini',
-    'khornerstone',
-    'khosana',
-    'khoshtaria',
-    'khran',
-    'khudozhnik',
-    'khulafa',
-    'ki-maasai',
-    'kiamtia',
-    'kick-and-rush',
-    'kick-starting',
-    'kickdown',
-    'kickin',
-    'kickit',
-    'kidner',
-    'kidskin',
     'kieth',
-    'kigoma',
-    'kik-kik-kik',
-    'kikka',
-    'kiko',
-    'kilakuldilok',
-    'kilcar',
-    'kilcash',
-    'kilder',
-    'kilderkin',
-    'kileen',
-    'kili',
-    'kili&aacute;n',
-    'kilimnik',
-    'kill-or-cure',
-    'kill-pricking',
     'killalane',
-    'killdeer',
-    'killdozer',
-    'killeavey',
-    'killoran',
-    'kilmarie',
-    'kilmurry',
-    'kiltex',
-    'kiltmakers',
-    'kilturk',
-    'kimata',
-    'kimberlyclark',
-    'kimometres',
-    'kims',
-    'kind-faced',
-    'kinemakolour',
     'kinetoscope',
-    'kinex',
-    'king-making',
-    'kinga',
-    'kinge',
-    'kingoonya',
-    'kingsborough',
-    'kingsferry',
-    'kingsridge',
-    'kingwell',
-    'kinkies',
-    'kinna',
-    'kinnegar',
-    'kinnego',
-    'kinnings',
-    'kinnockic',
     'kinny',
-    'kinship-based',
-    'kintra',
-    'kioni',
-    'kipes',
-    'kippered',
-    'kirch',
-    'kirche',
-    'kirgan',
-    'kirkgrim',
-    'kirkwhinnie',
-    'kirnberger',
-    'kirovabad',
-    'kirsteen',
-    'kirt',
-    'kirvan',
     'kiss-o-gram',
-    'kissoon',
-    'kister',
-    'kitchen-maid',
-    'kithara',
-    'kitkats',
-    'kitman',
-    'kittelman',
-    'kitti-wa-a-a-ake',
-    'kity',
-    'kitzbuheler',
-    'kitzbuhlerhorn',
-    'klamath',
-    'klatch',
-    'klausovitz',
-    'klavdiya',
     'kleditzsch',
-    'kleiger',
-    'kleinworts',
-    'kliment',
-    'klinorhynchy',
-    'klondyking',
-    'kloof',
-    'klopf',
-    'klosterbrau',
-    'knabbelen',
-    'knaben',
-    'knacker-meat',
-    'knazno',
-    'kndo',
-    'kneebone',
-    'kneese',
     'kneesy',
-    'knick-knack',
-    'knicker-elastic',
-    'knickerbockered',
-    'knife-',
-    'knife-creased',
-    'knight-errantry',
-    'knightrider',
-    'knitting-bag',
-    'knitting-wool',
-    'knobelsdorff',
-    'knock-knock',
-    'knockdhu',
-    'knockdow',
-    'knockloughrim',
-    'knopp',
     'knot-garden',
-    'knot-hole',
-    'know-nothings',
-    'knowed',
-    'knowen',
-    'knowl',
-    'knowler',
-    'knowlsey',
-    'knudson',
-    'knufns',
-    'knullar',
-    'kobo',
-    'kochel',
-    'kodacolor',
-    'kodai',
-    'kodra',
     'koebel',
-    'koenigswald',
-    'koepke',
-    'kogu',
-    'kogyo',
-    'kohlrausch',
-    'koian',
-    'koji',
-    'koki-teno',
-    'kokine',
-    'kolbin',
-    'kolesar',
-    'kollontai',
-    'kolodny',
-    'kolon&aacute;ki',
-    'kolone',
     'komal',
-    'komato',
-    'kombayi',
-    'kombinat',
-    'kommandatur',
-    'konak',
-    'konarak',
-    'konfrontasi',
-    'koninklijk',
-    'konkani',
-    'konquest',
-    'konsthall',
-    'kontic',
-    'kontuly',
-    'koopman',
-    'kooshies',
     'kopin',
-    'koppel',
-    'korc',
-    'korcula',
-    'korf',
-    'korm',
-    'kornelia',
-    'kossovo',
-    'kostadinov',
-    'kotka',
-    'kotmale',
-    'koudjolou',
-    'kovacic',
-    'kovaks',
-    'kow',
-    'kozelsk',
     'kozlu',
-    'kp&ouml',
-    'kpk',
-    'kraak',
-    'kracht',
-    'krack',
-    'krafft',
-    'kraits',
-    'krajisnik',
-    'krander',
-    'kranidion',
-    'kranzler',
-    'krase',
-    'krasin',
-    'krasnaia',
-    'krasny',
     'krayushkin',
-    'krediet',
-    'kreeger',
-    'kreglinger',
-    'kreigler',
-    'kreisler',
-    'kressbronn',
-    'kriegel',
-    'krishman',
-    'krishnaji',
-    'krispy',
-    'krol',
-    'kronheimer',
-    'kroop',
-    'krpovic',
-    'kruesi',
     'krugersdorp',
-    'krumhaar',
-    'kruse',
-    'kruskal',
-    'krynn',
-    'ksbs',
-    'kto',
-    'kubacki',
-    'kubat',
-    'kubik',
-    'kuda',
-    'kuendiger',
-    'kuguru',
-    'kui',
-    'kuiper-belt',
-    'kukanjao',
     'kuku',
-    'kulcher-babble',
-    'kulture',
-    'kum',
-    'kumbha',
-    'kumbukan',
-    'kumiss',
-    'kumon',
-    'kump',
-    'kumquat',
-    'kundra',
-    'kunlun',
-    'kunstakademie',
-    'kunstgeschichte',
-    'kunstgewerbemuseum',
-    'kunsthall',
     'kunstler',
-    'kup',
-    'kupolati',
-    'kuppner',
-    'kuranty',
-    'kurils',
-    'kurisches',
-    'kurr',
-    'kurta',
-    'kurukshetra',
-    'kurume',
-    'kushan',
-    'kushti',
-    'kustar\'',
-    'kutenai',
-    'kutnick',
     'kutnik',
-    'kutubu',
-    'kuwaiti-flag',
-    'kv&aelig;g',
-    'kveck',
-    'kwark',
-    'kwick',
-    'kwietniowski',
-    'kwikcoat',
-    'kybosh',
-    'kydds',
-    'kydland',
-    'kyng',
-    'kyphi',
-    'kyriakou',
-    'kysela',
     'kyunghee',
-    'l&auml;ndlerische',
-    'l&eacute;gende',
-    'l&eacute;once',
-    'l&eacute;pine',
-    'l&eacute;rina',
-    'l&eogon;bork',
-    'l&ndash;1049h',
-    'l&ndash;c',
-    'l&ouml;rincz',
-    'l&uuml;tzow',
-    'l\'&acirc;me',
-    'l\'&eacute;tat',
-    'l\'&icirc;le',
-    'l\'actuel',
-    'l\'adieu',
     'l\'americaine',
-    'l\'autobus',
-    'l\'cha',
-    'l\'eau',
-    'l\'escalier',
-    'l\'estampe',
-    'l\'estate',
-    'l\'esth&eacute;tique',
-    'l\'ind&eacute;pendance',
-    'l\'oiseau',
-    'l\'organisation',
-    'l\'origine',
-    'l-5',
-    'l-amino',
-    'l-carnitine',
-    'l-cel',
     'l-dopa',
-    'l-form',
-    'l-glutamine',
-    'l-histidine',
-    'l-lysine',
-    'l-month',
-    'l-plate',
-    'l-year',
-    'l.st',
-    'l50',
-    'l600',
-    'l853',
-    'l920s',
-    'l929',
-    'l964',
-    'l980s',
     'la-la',
-    'la-la-ing',
-    'laaaa',
-    'laach',
-    'lab&egrave;ques',
-    'lab-tek',
-    'labbadia',
-    'label-less',
-    'labianca',
-    'laborde',
-    'laborgie',
-    'laborit',
-    'laborlux',
-    'labour-contract',
-    'labour-hour',
-    'labourish',
     'labout',
-    'labquest',
-    'labridae',
-    'labrokes',
-    'labspace',
-    'labview',
-    'labyrinthian',
-    'lace-',
-    'laceward',
-    'lach',
-    'lacipil',
-    'lacken',
-    'lackford',
-    'lacl&eacute',
-    'lacque',
-    'lactates',
     'lacydere',
-    'ladakhi',
-    'ladder-backed',
-    'ladding',
-    'ladeco',
-    'lades',
-    'ladislaw',
-    'ladra',
-    'ladycroft',
-    'laeti',
-    'lafargue',
-    'laffite',
-    'lafitte',
-    'lagant',
-    'lagered',
-    'laggers',
     'lah-de-dah',
-    'lahar',
-    'lahars',
-    'lahey',
-    'lahure',
-    'laia',
-    'laigwenak',
-    'laim',
-    'lairesse',
-    'lairet',
-    'lajpath',
-    'lake-bed',
-    'lakewater',
-    'lakewoods',
-    'lalevee',
-    'lallemant',
     'lallies',
-    'lamark',
-    'lamarre',
-    'lamasery',
-    'lambed',
-    'lambency',
-    'lamborgini',
-    'lambs-style',
-    'lamby',
-    'lamingtons',
-    'lamour',
-    'lampang',
-    'lampkin',
-    'lampsacus',
-    'lampstand',
-    'lampstands',
     'lampung',
-    'lamu',
-    'lancache',
-    'lancaut',
-    'lance-corporals',
-    'lancefield',
-    'lancefish',
-    'lancy',
-    'land-army',
-    'land-girl',
-    'land-grant',
-    'land-mark',
-    'land-using',
-    'landaulette',
-    'landerbank',
-    'landow',
     'landrum',
-    'landscaper',
-    'landscore',
-    'landsdown',
-    'landstone',
-    'landwehr',
-    'lane-changing',
-    'langa',
-    'langbar',
-    'langebaanweg',
-    'langemarkt',
-    'langen',
-    'langrishe',
-    'langslow',
-    'laniel',
-    'laniers',
     'lannock',
-    'lanolin-free',
-    'lanserver',
-    'lantern-bearer',
-    'lanterna',
-    'lanto',
-    'lantsbery',
-    'lanvin',
-    'lao-tzu',
-    'laquer',
-    'larco',
-    'large-company',
-    'largesse-spending',
-    'largotim',
-    'larkwood',
-    'larrabee',
     'larran',
-    'larter',
-    'laruette',
-    'lasanta',
-    'laschemi',
-    'lascube',
-    'lase',
-    'laser-disc',
-    'laser-lit',
-    'laserfix',
-    'laserprint',
-    'lash-building',
-    'lash-up',
-    'lasic',
-    'lasken',
-    'lasmac',
     'last-',
-    'last-night',
-    'last-second',
-    'latarche',
-    'latarjet',
-    'late\'',
-    'late-1970s',
-    'late-80s',
-    'late-picked',
-    'latexes',
-    'latilla',
-    'latinamerica',
-    'latinity',
-    'lato',
-    'latrigg',
-    'latrobe',
     'latroun',
-    'latzsch',
-    'lauch',
-    'laudaair',
-    'laudas',
-    'laudon',
-    'laughlan',
-    'laughter-filled',
-    'launce',
-    'laurentis',
-    'laurette',
-    'lauri',
-    'lausanne-based',
-    'lauter',
-    'lava-lava',
-    'lavender-water',
     'lavendula',
-    'laverbread',
-    'lavergnes',
-    'lavier',
-    'lavina',
-    'law-suit',
-    'lawis',
-    'lawncare',
-    'lawnmowing',
-    'lawyerly',
-    'laxa',
-    'laxon',
-    'lay-',
-    'lay-abbacy',
-    'lay-reader',
-    'layaway',
     'layde',
-    'layer-cake',
-    'lazarite',
-    'lazarovitch',
-    'lazim',
-    'lazonick',
-    'lazyitis',
-    'lb-',
-    'lcao',
-    'lci',
-    'lct',
-    'lcv',
-    'le\'f',
-    'leachman',
-    'lead-managed',
-    'lead-miner',
     'lead-out',
-    'leader-in-waiting',
-    'leader-manager',
-    'leagach',
-    'leagued',
-    'leap-frogged',
-    'learn-by-doing',
-    'learning-curve',
-    'leaseholding',
-    'leask',
-    'leasor',
-    'least-studied',
-    'leather-work',
-    'leathering',
-    'leathernecks',
-    'leays',
     'lebak',
-    'lebenberg',
-    'lebow',
-    'lebrock',
-    'lecco',
-    'lechmere',
-    'lechuck',
-    'lecointre',
-    'leconto',
-    'lecture-based',
-    'lecture-demonstration',
-    'ledebour',
-    'ledgerwood',
-    'ledro',
-    'leeg',
-    'leeke',
     'leeuw',
-    'lef',
-    'left-and-right',
-    'left-ward',
-    'left-zionist',
-    'legacy\'',
-    'legagneur',
-    'legated',
-    'legende',
-    'legnani',
-    'legover',
-    'lehder',
-    'lehrs',
-    'lehrter',
-    'leia',
-    'leibig',
     'leifer',
-    'leifheit',
-    'leighlin',
-    'leine',
-    'lekule',
-    'lemhi',
-    'lemon-juice',
-    'lemon-peel',
-    'lemonades',
-    'lempertz',
-    'lenci',
-    'lendrum',
-    'lenglen',
-    'length-to-diameter',
-    'leniently-treated',
-    'lenman',
     'lensed',
-    'lensi',
-    'lentin',
-    'lentinue',
-    'lentizol',
-    'lento',
-    'lentsoe',
-    'lenzi',
-    'leodegar',
-    'leonardoxa',
-    'leontiades',
-    'leopard-spot',
-    'leosothosaurus',
-    'lepidopterist',
-    'lepisma',
-    'leppert',
     'leptinotarsa',
-    'lequeux',
-    'lerach',
-    'lerici',
-    'lerissa',
-    'lern',
-    'lerna',
-    'lernea',
-    'leruez',
-    'lescaut',
-    'leser',
-    'lesion-making',
-    'leslee',
-    'less-educated',
-    'less-stiff',
-    'less-well-known',
     'less-well-paid',
-    'lesseps',
-    'lesser-used',
-    'lestai',
-    'let-',
-    'letch',
-    'letchely',
-    'letrastudio',
-    'lettaford',
-    'lettaure',
-    'letter-collection',
-    'letter-position',
-    'lettere',
-    'letterforms',
-    'letterland',
-    'lettie',
     'leuciscus',
-    'leucopenia',
-    'leucorodia',
-    'leuluai',
-    'leved',
-    'levelling-up',
-    'leventis',
-    'levesons',
-    'levinz',
-    'levirate',
-    'levitan',
-    'levitates',
-    'lewkenors',
-    'leylandii',
-    'lgtbs',
-    'lhda',
     'li&egrave;geois',
-    'liabilty',
-    'liberacion',
-    'liberal-humanist',
-    'liberal-nationalist',
-    'liberal-radical',
-    'liberchies',
-    'libertyes',
-    'library-produced',
-    'library-user',
-    'librer&iacute;o',
-    'lichenstein',
-    'lick\'t',
-    'lickbarrow',
-    'lidho',
-    'liduid',
     'lie-flat',
-    'liebling',
-    'liekkio',
-    'lienart',
-    'lier',
-    'liesbosch',
-    'liesel',
-    'lieut&lsqb;enant&rsqb',
-    'lifa',
-    'life&mdash',
-    'life\'',
-    'life-boat',
-    'life-deciding',
-    'life-drawing',
-    'life-eater',
-    'life-endangering',
     'life-guard',
-    'life-pattern',
-    'life-purpose',
-    'life-rent',
-    'life-year',
-    'lifepan',
-    'lifespannode',
-    'lifespantask',
-    'lift-on',
-    'lift-right-leg',
-    'liftin\'',
-    'light-controlled',
-    'light-cured',
-    'light-food',
-    'light-green',
-    'light-railway',
     'light-rock',
-    'light-show',
-    'light-up',
-    'light-well',
-    'lightbound',
-    'lightcnsttype',
-    'lightin\'',
-    'lightnin',
-    'ligia',
-    'ligozzi',
-    'liitto',
-    'like&mdash',
-    'like\'',
-    'lilac-pink',
-    'lilihan',
-    'lilis',
     'lillebonne',
-    'lillesand',
-    'lillycups',
-    'lillyman',
-    'lilstock',
-    'lily-covered',
-    'lily-pond',
-    'limah',
-    'limbed',
-    'lime-soda',
-    'lime-wash',
-    'limeflower',
-    'limenas',
-    'limewash',
-    'limewashed',
-    'limewashing',
     'limeworks',
-    'limina',
-    'limite',
-    'limmack',
-    'limners',
-    'limnocalanus',
-    'limonium',
-    'limpars',
-    'linaker',
-    'linbeck',
-    'lincs-based',
-    'lindesay',
-    'lindquist',
-    'line-breeding',
-    'line-drawing',
-    'line-mode',
     'line-of-battle',
-    'lines-up',
-    'ling&aacute;n',
-    'linga',
-    'lingley',
-    'lingones',
-    'linked-skills',
-    'linkoping',
-    'linlathen',
-    'linnen',
-    'lino-covered',
-    'linomat',
-    'linotype-hell',
-    'linsdall',
-    'linshalm',
-    'linstrum',
     'lintott',
-    'linwell',
-    'lion\'s-head',
-    'lionhead',
-    'lioret',
-    'lip-hold',
-    'lipa',
-    'lipidex-deap',
-    'lippe',
-    'lipschitz',
-    'lipscreen',
-    'lipsticking',
-    'liptons',
-    'liquer',
-    'liquid-helium',
-    'liquid-hydrogen',
     'liquifying',
-    'lir',
-    'lisant',
-    'lisbellaw',
-    'liselund',
-    'lisi',
-    'lispworks',
-    'list(s)',
-    'list-making',
-    'list-priced',
-    'listening-in',
-    'litichevsky',
-    'litlington',
-    'litolff',
-    'litorius',
-    'litost',
     'litten',
-    'litterbugs',
-    'little\'uns',
-    'little-studied',
-    'littlecott',
-    'littlefair',
-    'liuba',
-    'liudprand',
-    'live-storage',
-    'live_up',
-    'livernash',
-    'liverpoool',
-    'living-out',
-    'livio',
-    'livonia',
-    'lizabette',
     'ljadl',
-    'ljubojevic',
-    'ljudevit',
-    'llamatron',
-    'llenor',
-    'llhuyd',
-    'llidiardau',
-    'llma',
-    'lloreda',
-    'llpm',
-    'lmb',
-    'lmgs',
-    'load\'',
-    'loadhigh',
-    'loafs',
-    'loan-note',
     'loan-sharking',
-    'lobectomised',
-    'lobetta',
-    'lobwasser',
-    'local-currency',
-    'local-interest',
-    'localises',
-    'locally-born',
-    'localtalk',
-    'locas',
-    'loch-side',
-    'lochee',
-    'lochinch',
-    'lochlea',
-    'lochore',
-    'lock-down',
     'lock-gate',
-    'lockart',
-    'locksmithing',
-    'lockspieser',
-    'lockstitching',
-    'lodewijk',
-    'lodey',
-    'lodg',
-    'lodgistix',
-    'lody',
-    'loeffler',
-    'loerke',
-    'loesser',
-    'loews',
-    'log-normality',
-    'log.',
     'logiealmond',
-    'logsys',
-    'lohmiller',
-    'lohmuller',
-    'lohr',
-    'loibl',
-    'loimographia',
-    'loinclothed',
-    'loipe',
-    'loire-atlantique',
-    'lokris',
-    'lokrou',
-    'lolas',
-    'lolloped',
-    'lombank',
-    'lompoc',
     'londini',
-    'london.the',
-    'londonbeat',
-    'long&rehy;established',
-    'long&rehy;winded',
-    'long-bond',
-    'long-bow',
-    'long-er',
-    'long-hop',
-    'long-lens',
-    'long-muzzled',
-    'long-note',
-    'long-prayed-for',
-    'long-spun',
-    'long-used',
-    'long-weekend',
     'long-wished-for',
-    'longbotham',
-    'longdwell',
-    'longer&rehy;term',
-    'longer-',
-    'longest-surviving',
-    'longjing',
-    'longliness',
-    'longlining',
-    'longmate',
-    'longstreth',
-    'longueval',
-    'longyear',
-    'lonja',
-    'lonley',
-    'loo-oo-oo-ming',
     'look-angle',
-    'lookin',
-    'loopholed',
-    'loose-flowing',
-    'loose-forward',
-    'loose-lay',
-    'loose-woven',
-    'loosecoat',
-    'lootin\'',
-    'lorence',
-    'lores',
-    'lorimers',
-    'lorra',
-    'lort',
-    'lortzing',
-    'lorus',
     'lorwin',
-    'losabezidze',
-    'loss-free',
-    'loss-of-coolant',
-    'lotharios',
-    'lothidok',
-    'lotis',
-    'lotos',
-    'lotti',
-    'lottizzazione',
-    'lotus-eaters',
-    'loud-mouth',
-    'loughbrickland',
-    'loughman',
-    'loughts',
-    'loughview',
     'louison',
-    'lounge/dining',
-    'lourdais',
-    'loured',
-    'lousiana',
-    'lousing',
-    'lov&ccaron;en',
-    'love-act',
-    'love-all',
-    'love-carriage',
-    'love-cheat',
-    'love-relationship',
-    'love-sonnet',
-    'lovelidge',
-    'lovelocks',
-    'loverboy',
     'loveslave',
-    'lovet',
-    'loveth',
-    'lovro',
-    'low&rehy;lying',
-    'low&rehy;scoring',
-    'low-amplitude',
-    'low-backed',
-    'low-church',
-    'low-degree',
-    'low-impedance',
-    'low-input',
-    'low-lit',
-    'low-load',
-    'low-loading',
-    'low-luminosity',
     'low-medium',
-    'low-no',
-    'low-placed',
-    'low-preference',
-    'low-production',
-    'low-reflectance',
-    'low-relief',
-    'low-smoke',
-    'low-theory',
-    'low-torque',
-    'low-weight',
-    'lower-calorie',
-    'lower-echelon',
-    'lowerhope',
-    'lowest-calorie',
-    'lowie',
     'lowly-placed',
-    'lowthian',
-    'loyonel',
-    'lpbg',
-    'lqr',
-    'lram',
-    'ls&mdash;mgr',
-    'ls-api',
-    'ls-dyna3d',
-    'lsca',
-    'lses',
-    'lslive&mdash;cc1234',
-    'lsm',
-    'lsp',
-    'lswr',
-    'ltda',
     'ltee',
-    'lua',
-    'lucania',
-    'lucar',
-    'lucasfilm',
-    'lucerna',
-    'luchino',
-    'luciferase',
-    'lucullus',
-    'lucy-woosy',
-    'ludemann',
-    'ludet',
-    'ludlowii',
-    'ludmer',
-    'ludovicianum',
-    'ludovicus',
     'ludovit',
-    'ludwigshaven',
-    'ludwigstrasse',
-    'lugdunensis',
-    'lugdunum',
-    'lugol',
-    'luialamo',
-    'lukewarmness',
-    'lumberjacks',
-    'lumbricoides',
-    'lumicolour',
-    'luminaire',
-    'lunantishee',
-    'lunarsee',
-    'lundi',
-    'lung-full',
     'lunger',
-    'lunts',
-    'lunula',
-    'lupone',
-    'lurabus',
-    'lusatia',
-    'lushe',
-    'lustbader',
-    'luster',
-    'lustorol',
-    'lustra',
-    'luteus',
-    'luve',
-    'luvverly',
-    'luxembourgeoise',
-    'luxemburgism',
     'luython',
-    'lvfa',
-    'lwr',
-    'lyc&eacute;e-coll&egrave;ge',
-    'lycra-clad',
-    'lyeth',
-    'lylye',
-    'lymmener',
-    'lymphoctyes',
-    'lynsk',
-    'lynx-eyed',
-    'lyophilized',
-    'lyophylised',
-    'lysing',
-    'lysippides',
-    'lyve',
     'm&aacute;ire',
-    'm&aring;lselv',
-    'm&eacute;c&eacute;nat',
-    'm&eacute;chant',
-    'm&eacute;l&eacute;ra',
-    'm&eacute;lusine',
-    'm&eacute;moire',
-    'm&eacute;salliance',
-    'm&ouml;et',
-    'm&ucirc;ller',
-    'm&uuml;hlfeld',
-    'm&uuml;nchener',
-    'm&uuml;nter',
-    'm&uuml;nzer',
-    'm\'barki',
-    'm\'goi',
     'm\'graw',
-    'm\'learned',
-    'm-11',
-    'm-29',
-    'm-4',
-    'm-8000',
-    'm-8600',
-    'm-f3670',
-    'm-m-memory',
-    'm-tasc',
-    'm-word',
-    'm.a',
-    'm100',
-    'm22',
-    'm24',
-    'm30',
     'm34',
-    'm6100',
-    'ma\'',
-    'maaa',
-    'maal',
-    'maasvlakte',
-    'mabalub',
-    'mabbut',
-    'mabior',
-    'mabon',
-    'mac-1',
-    'macadamed',
-    'macadamia',
-    'macer',
-    'macerating',
-    'machicolations',
     'machine-cut',
-    'machine-franked',
-    'machine-learning',
-    'machine-minder',
-    'machine-to-machine',
-    'machine-woven',
-    'macintosh-on-unix',
-    'maclenan',
-    'macr',
-    'macra',
-    'macro-cannons',
-    'macroscope',
-    'madain',
-    'madchen',
-    'madely',
-    'madhukar',
     'madjit',
-    'madl',
-    'madrigalls',
-    'madrone',
-    'mady',
-    'maen',
-    'maetia',
-    'maffeo',
-    'mafford',
-    'mafremo',
-    'magacad',
-    'magadan',
-    'magazine-style',
-    'magdelene',
-    'mager',
-    'magh',
     'magic-lantern',
-    'magicks',
-    'magin',
-    'magistri',
-    'maglite',
-    'magnaflux',
-    'magnetise',
-    'magnetises',
-    'magnetostratigraphy',
-    'magoi',
-    'magots',
-    'magstore',
-    'maguelonne',
-    'mahany',
-    'mahbubur',
-    'maheux',
     'mahgoub',
-    'mahit',
-    'mahlon',
-    'mahmudul',
-    'mahogany-red',
-    'mahommedans',
-    'maibozani',
-    'maiden-thought',
-    'mail-coat',
-    'mail-in',
-    'mailbase',
-    'mailboats',
-    'mailing-list',
-    'mailsort',
-    'main-',
-    'main-course',
     'mainair',
-    'mainframe-resident',
-    'maino',
-    'mains-type',
-    'mainsails',
-    'maintenace',
-    'maintenant',
-    'maintenon',
-    'maintstream',
-    'maiocchi',
-    'maistraki',
-    'maitrey',
-    'maiziere',
-    'maj-general',
-    'majbari',
-    'majendie',
     'majest&eacute',
-    'majkowski',
-    'majluta',
-    'major-accident',
-    'majorese',
-    'majuba',
-    'maka',
-    'makaha',
-    'makange',
-    'makeum',
-    'makhdoom',
-    'makka',
-    'makmur',
-    'makowka',
-    'makrana',
-    'makuhari',
     'malade',
-    'maladie',
-    'malak',
-    'malalas',
-    'malamuth',
-    'malancourt',
-    'malang',
-    'malapropism',
-    'malaria-ridden',
-    'malaud',
-    'malayalam',
-    'malbork',
-    'malcomia',
-    'malgaches',
-    'malgara',
-    'malgr&eacute',
     'malile',
-    'malimbus',
-    'malkiel',
-    'mallalieu',
-    'mallock',
-    'mallorcan',
-    'malpighian',
-    'malshanger',
-    'malumba',
-    'mamaluke',
-    'mambro',
-    'mamillated',
-    'mamiraua',
-    'mammalian-type',
-    'mammame',
-    'mammies',
     'mammomonogamus',
-    'man&mdash;that',
-    'man&oelig;uvres',
-    'man-computer',
-    'man-hole',
-    'man-jack',
-    'man-of-the-world',
-    'management-employer',
-    'manager-subordinate',
-    'manageresses',
-    'mancho',
-    'mancinelli',
-    'mancuses',
-    'mancy',
-    'mandaean',
-    'mandelbaums',
     'mandolin\'',
-    'mangelwurzel',
-    'mangwende',
-    'manhant',
-    'manhattan-style',
-    'manica',
-    'manicaland',
-    'manicmotors',
-    'maniere',
-    'manimanakis',
-    'manish',
-    'manisty',
-    'manitski',
-    'mankin',
-    'manman',
-    'mannage',
     'mannertreu',
-    'manola',
-    'manouzi',
-    'manses',
-    'manstral',
-    'mantara',
-    'mantel-piece',
-    'manuell',
-    'manura',
-    'manxmen',
-    'many-',
-    'many-branched',
-    'many-electron',
-    'manyana',
-    'manydown',
-    'manyon',
     'maoile',
-    'maometto',
-    'map&mdash;username',
-    'mapa',
-    'mapic',
-    'mapple',
-    'maquillage',
-    'maquimat',
-    'maramures',
-    'marbleised',
-    'marbod',
-    'marbore',
-    'marcasse',
-    'marcheini',
-    'marchois',
-    'marckesano',
     'marcoule',
-    'marcovitch',
-    'mardles',
-    'mareham',
-    'marelli',
-    'marendaz',
-    'marendic',
-    'marfleet',
-    'margareth',
-    'margin\'',
-    'margining',
-    'mari&aacute;nky',
-    'mariachi',
-    'mariamne',
-    'mariarchi',
-    'marid-related',
     'marienburger',
-    'mariental',
-    'marila',
-    'mark-space',
-    'markel',
-    'market&rehy;determined',
-    'market-building',
-    'market-economy',
-    'market-rate',
-    'market-sector',
-    'marking-out',
-    'markku',
-    'markowe',
-    'markstadt',
-    'marktkirche',
-    'marlan',
     'marmand',
-    'marmit',
-    'marmora',
-    'marocaine',
-    'marooning',
-    'marquandistas',
-    'marquet',
-    'marqueterie',
-    'marriage-broking',
-    'marrie',
-    'marrowbone',
-    'marryed',
-    'marsaud',
-    'marshaled',
-    'marshallagia',
-    'marshaller',
     'marshman',
-    'martandem',
-    'martenot',
-    'martham',
-    'marthinus',
-    'martii',
-    'martill',
-    'martinpelto',
-    'martinu',
-    'maruli&cacute',
-    'marum',
-    'marxisant',
-    'marygate',
-    'maryl&egrave;ne',
-    'masa-idah',
-    'masaaki',
     'mascal',
-    'mascaro',
-    'masdit',
-    'masdus',
-    'masherbrum',
-    'mashhad',
-    'mashishka',
-    'masistes',
-    'maslakhaty',
-    'maslen',
-    'mass-acting',
-    'mass-balance',
-    'mass-going',
-    'massai',
-    'massala',
-    'massena',
     'massimi',
-    'massin',
-    'master\'',
-    'master-carpenter',
-    'master-craftsman',
-    'master-general',
-    'master-work',
-    'masterbatch',
-    'masterknit',
-    'mastermatch',
-    'masvengo',
-    'match-box',
-    'match-fixing',
-    'match-making',
-    'matchgirls',
-    'mathematicks',
     'mathesius',
-    'matla',
-    'matochkin',
-    'matrilineages',
-    'matrimonii',
-    'matrixes',
-    'matsinhe',
-    'matthew&mdash',
-    'mattless',
-    'matullah',
-    'matushita',
-    'maughams',
-    'maulden',
-    'mauldin',
-    'maunby',
-    'maupeou',
     'maurette',
-    'mauthe',
-    'mavlyet',
-    'mavro',
-    'max-vp16',
-    'maxi-yacht',
-    'maxillofacial',
-    'maximillian',
-    'maximinianus',
-    'maximo',
-    'maxon',
-    'may-blossom',
-    'maybin',
-    'maye',
-    'mayibuye',
-    'maynegrain',
     'mayo\'',
-    'mayoh',
-    'mazag',
-    'mazelle',
-    'mazing',
-    'mazula',
-    'mazzetti',
-    'mbanefo',
-    'mbengono',
-    'mcallisters',
-    'mcbrien',
-    'mckennas',
-    'mcnairs',
-    'mcqueens',
-    'meadowhead',
-    'meadowlark',
     'meadsmen',
-    'mealies',
-    'mean-mouthed',
-    'mean-reverting',
-    'meaning-capacity',
-    'meara',
-    'meat-cleaver',
-    'meat-packer',
-    'mecca-based',
-    'mechale',
-    'mechanicae',
-    'mechanizing',
-    'mechanus',
-    'mechelin',
-    'mecs',
-    'medan',
     'medardo',
-    'medauschule',
-    'meddowes',
-    'medecin',
-    'medha',
-    'media-based',
-    'medicalised',
-    'medicating',
-    'medie',
-    'medising',
-    'medite',
-    'medium-density',
-    'medium-income',
-    'medizers',
-    'mednoye',
-    'medoff',
     'medroxyprogesterone',
-    'medtech',
-    'meeee',
-    'meenameen',
-    'meenister',
-    'meeow',
-    'mefitis',
-    'mefti',
-    'meg&egrave;ve',
-    'mega-flop',
-    'mega-merger',
-    'mega-mouth',
-    'megabyzos',
-    'megadisk',
-    'megaflop',
-    'megakles',
     'megapode',
-    'megaproject',
-    'megasthenes',
-    'megatech',
-    'megatest',
-    'megaword',
-    'meghe',
-    'meharg',
-    'mehu',
-    'meig',
-    'meiklewood',
-    'meillasoux',
-    'meineke',
-    'meinertzhageni',
-    'meintjies',
-    'meira',
     'meisner',
-    'mejka',
-    'melan',
-    'melcarek',
-    'melikoff',
-    'melinski',
-    'meliora',
-    'mell\'o',
-    'melli',
-    'mellifont',
-    'melmoth',
-    'melodeyen',
-    'melodia',
-    'melodiya',
-    'melopsittacus',
-    'melver',
     'melzack',
-    'membre',
-    'memco-med',
-    'memorialising',
-    'memorialized',
-    'memorie',
-    'memoried',
-    'memory-jogger',
-    'memsahibs',
-    'menchini',
-    'mendaloff',
-    'mendelow',
-    'mendicity',
-    'meneely',
-    'menes',
-    'menezes',
     'menghi',
-    'mengs',
-    'menhir',
-    'meningitus',
-    'menken',
-    'mennonite',
-    'mensan',
-    'menu&rehy;driven',
-    'menziesii',
-    'meole',
-    'meonware',
-    'meows',
-    'meperidine',
-    'mephenesin',
-    'mephile',
-    'merauke',
     'merawec',
-    'merbecke',
-    'mercardier',
-    'merch',
-    'merciar',
-    'merehurst',
-    'meretrix',
-    'merewether',
-    'merica',
-    'meriem',
-    'merimee',
-    'merise',
-    'merker',
-    'merkhet',
-    'merlion',
-    'mermecolion',
     'mero&euml',
-    'merrel',
-    'merri',
-    'merrimack',
-    'merry-faced',
-    'merrymaker',
-    'merseycats',
-    'mery',
-    'mesfets',
-    'mesl&eacute;e',
-    'mesmerist',
-    'mesneux',
-    'mesocaval',
-    'mess-room',
-    'message-sending',
-    'messalina',
     'messere',
-    'mestrinho',
-    'mestrovic',
-    'meta-discourse',
-    'meta-language',
-    'meta-narrative',
-    'metaalnijverheid',
-    'metal-bodied',
-    'metal-covered',
-    'metal-cutting',
-    'metal-free',
-    'metal-to-ligand',
-    'metalheads',
-    'metam',
-    'metapsychology',
-    'metastasise',
     'metastasising',
-    'metastasizing',
-    'metastim',
-    'metastrongyloid',
-    'metastrongylosis',
-    'metathelazia',
-    'metavision',
-    'metaxa',
-    'metaxas',
-    'methogo',
-    'methylation-protection',
-    'methylprednisone',
-    'metics',
-    'metour',
-    'metricated',
-    'metro-vickers',
     'metrogel',
-    'metronidazol',
-    'metronymics',
-    'metroplex',
-    'mettwurst',
-    'meubles',
-    'meulenhoff',
-    'meurdesoif',
-    'meure',
-    'meuron',
-    'mewled',
-    'mewse',
-    'mexome',
-    'mey',
-    'mezes',
-    'mezimesti',
     'mezine',
-    'mezzo-forte',
-    'mgco',
-    'mhara',
-    'mi-17',
-    'michaelhouse',
-    'michalczewski',
-    'michelob',
-    'michoacan',
-    'mickeen',
-    'micklewhite',
-    'mickry',
-    'mico',
-    'miconia',
-    'micro-electrodes',
-    'micro-hydro',
     'micro-macro',
-    'micro-mesh',
-    'micro-states',
-    'microclimatology',
-    'microcomputerbased',
-    'microdissected',
-    'microdots',
-    'microeye',
-    'microft',
-    'microfungi',
-    'microgen',
-    'microgram',
-    'micrographia',
-    'microinstruments',
-    'microlog',
-    'micronodules',
     'microphobia',
-    'microphone-level',
-    'microphone.',
-    'microphoned',
-    'microproducts',
-    'microscalers',
-    'microskirt',
-    'microsofts',
-    'microtec',
-    'microtubule',
-    'microturbo',
-    'mid-1933',
-    'mid-1940',
-    'mid-1942',
-    'mid-1962',
-    'mid-1973',
     'mid-1978',
-    'mid-1996',
-    'mid-antonine',
-    'mid-bend',
-    'mid-cycle',
-    'mid-extreme',
-    'mid-fifteenth-century',
-    'mid-forearm',
-    'mid-range-to-unix',
-    'mid-ranking',
-    'mid-round',
-    'mid-shot',
-    'mid-track',
-    'mid-wail',
-    'mida',
-    'midclass',
     'middle-length',
-    'middle-middle',
-    'middle-tier',
-    'middled',
-    'middlesbrugh',
-    'midem',
-    'midhir',
-    'midnight-dark',
-    'midnite',
-    'midorikawa',
-    'miee',
-    'mieszkowski',
-    'mietkaserne',
-    'migele',
-    'migmatised',
-    'mignot',
     'mih&aacute;ly',
-    'mihaljevi&cacute',
-    'miking',
-    'mikkelsen',
-    'mikrokosmos',
-    'mikroskopie',
-    'miktat',
-    'mila',
-    'milage',
-    'milamb',
-    'milatos',
-    'milch-cow',
-    'milchan',
-    'milfoils',
-    'miliangos',
-    'military-civilian',
     'military-type',
-    'milk-and-meat',
-    'milk-bottling',
-    'milk-buying',
-    'milk-crate',
-    'milk-yield',
-    'milka',
-    'milkcrates',
-    'mill-dam',
-    'millay',
-    'millbay',
-    'milldam',
-    'millenary',
-    'millerson',
-    'millet-i-rum',
-    'millhands',
     'milliamp',
-    'millian',
-    'millikan',
-    'millionfold',
-    'millipored',
-    'millpool',
-    'millside',
-    'milns',
-    'milo&scaron;evi&cacute',
-    'miltown',
-    'mimeme',
-    'mimram',
-    'min\'',
-    'minces',
-    'mind-twisting',
-    'mindblast',
     'mindfucking',
-    'mindvoice',
-    'mineola',
-    'mineral-bearing',
-    'mineral-water',
-    'mineralise',
-    'minet',
-    'ming-style',
-    'mini-business',
-    'mini-button',
-    'mini-byte',
-    'mini-crash',
-    'mini-exhibition',
-    'mini-hero',
-    'mini-moke',
-    'mini-network',
     'mini-riot',
-    'mini-town',
-    'mini-triumph',
-    'mini-tunnel',
-    'mini-tv',
-    'mini-uzi',
-    'mini-vision',
-    'minidet',
-    'minidisks',
-    'miniere',
-    'minifreighter',
-    'minimesh',
-    'miniphone',
-    'miniscules',
-    'minkie',
-    'minkin',
     'minkus',
-    'minsiter',
-    'mint-name',
-    'mintaka',
-    'minuit',
-    'minute-taker',
-    'minuting',
-    'minw',
-    'mipmip',
-    'mir&oacute;n',
-    'mira-type',
-    'mirabello',
-    'miran',
-    'mirando',
-    'mirco',
-    'mireside',
     'miring',
-    'mirkwood',
-    'miroglu',
-    'mirror-backed',
-    'mirrorman',
-    'mirrorsoft',
-    'mirsad',
-    'mirsal',
-    'mirzoeff',
-    'mis-attributed',
-    'mis-casting',
-    'mis-directed',
-    'mis-fired',
-    'mis-kicked',
-    'mis-managed',
-    'mis-represented',
     'mis-spelled',
-    'mis-stated',
-    'mis-understanding',
-    'mis-understood',
-    'misa',
-    'misallocated',
-    'miscalculates',
-    'miscommunication',
-    'misguiding',
-    'misia',
-    'misincorporation',
-    'mispatterning',
-    'misplace',
-    'misplays',
-    'mispositioned',
-    'misremember',
     'misremembering',
-    'misruled',
-    'mississippi-based',
-    'mississippi-style',
-    'missoni',
-    'misstated',
-    'mistyped',
-    'mithradates',
-    'mithun',
-    'mits',
-    'mittelalter',
-    'mixografia',
-    'miyah',
-    'mizen',
-    'mkolongolo',
-    'mlphare',
     'mmg',
-    'mmisd',
-    'mmits',
-    'mnbdo',
-    'mndid',
-    'mngomezulu',
-    'mnouchkine',
-    'mntks',
-    'moakley',
-    'moany',
-    'moatti',
-    'mobarez',
-    'mobile-response',
-    'mobray',
-    'moca',
-    'mocchegiani',
     'mock-infected',
-    'mock-italian',
-    'mock-stealer',
-    'mocroft',
-    'moctezuma',
-    'modacrylic',
-    'moddy',
-    'modem-day',
-    'modern-built',
-    'modha',
-    'modhish',
-    'modotti',
-    'modularising',
-    'modules&mdash;online',
-    'moelleman',
-    'mogdham',
     'moger',
-    'moggonisi',
-    'mogilny',
-    'mogurnda',
-    'mohenjo',
-    'mohon',
-    'moiling',
-    'moirae',
-    'moivre',
-    'moksha',
-    'molasse-type',
-    'molders',
-    'molech',
-    'molenbeek',
-    'molex',
-    'moling',
     'molinos',
-    'mollas',
-    'molokai',
-    'molon',
-    'molte',
-    'moluf',
-    'molycorp',
-    'mon&ndash;thurs',
-    'monachorum',
-    'monarchian',
-    'monarflex',
-    'monbazillac',
-    'monchique',
-    'mondino',
-    'mondschein',
-    'moneda',
     'moneta',
-    'money-center',
-    'moneygrabber',
-    'moneyspinning',
-    'monga',
-    'mongiat',
-    'monikered',
-    'moniliformis',
-    'monitz',
-    'monkey-wrench',
-    'monkeywrench',
-    'monkton-hall',
-    'monkwray',
-    'monnot',
-    'mono-',
-    'mono-unsaturates',
     'monodactylidae',
-    'monodon',
-    'monomakh',
-    'monophysite',
-    'monoplane-type',
-    'monoprints',
-    'monotheist',
-    'monsanta',
-    'monserrat',
-    'monsignors',
-    'monster-god',
-    'monstera',
-    'mont&eacute;clair',
-    'montagnards',
-    'montagny',
-    'montaillou',
     'montanari',
-    'montauban',
-    'montauk',
-    'montbartier',
-    'montclair',
-    'montefeltro',
-    'montefiori',
-    'montendre',
-    'montepellier',
-    'montesdeoca',
-    'monteviot',
-    'montezumas',
-    'montgreenan',
-    'month-end',
-    'montval',
-    'montxo',
     'mood-enhancing',
-    'mood-lifting',
-    'mood-setting',
-    'mooey',
-    'moon-white',
-    'moondork',
-    'mooneyhan',
-    'moonlighted',
-    'moorlynch',
-    'moorman',
-    'moorsee',
-    'mooseburger',
-    'mooseheart',
-    'moosh',
-    'mop-headed',
-    'mopf',
     'mor&oacute;n',
-    'morabit',
-    'morale-sapping',
-    'morani',
-    'morchella',
-    'more\'',
-    'more-than-willing',
-    'morella',
-    'moremi',
-    'moreoever',
-    'morgannwg',
-    'morgenpost',
-    'morgensen',
-    'morgner',
-    'morgoth',
-    'moris',
     'morlaye',
-    'morning&ndash',
-    'morning-',
-    'moroccan-born',
-    'morone',
-    'morongiu',
-    'moronised',
-    'moroti',
-    'morphing',
-    'morricone',
-    'morriston',
-    'morroc',
-    'morroccan',
-    'mortgagesure',
-    'morto',
-    'mortuorum',
     'morue',
-    'mosaicing',
-    'moscou',
-    'moshi',
-    'mosis',
-    'mosler',
-    'mosner',
-    'mossadegh',
-    'mossbauer',
-    'mossed',
-    'mossgara',
-    'moszkowski',
-    'motacilla',
-    'motel-style',
-    'mother\'s-help',
-    'mother-and-child',
     'mother-fucking',
-    'mother-goddesses',
-    'mother-hen',
-    'mother-substitute',
-    'motherdear',
-    'mothwing',
-    'motor-bus',
-    'motor-powered',
-    'motor-voter',
-    'motteose',
-    'mouf',
-    'moul',
-    'moulinette',
-    'moun',
-    'moundy',
-    'mountain-biking',
     'mountaines',
-    'mountaintops',
-    'mountstevens',
-    'mouse-hole',
-    'mousquetaire',
-    'movement\'',
-    'moveth',
-    'movin',
-    'moving-map',
-    'moyano',
-    'moylinn',
-    'moynan',
-    'mozartstrasse',
-    'mp-tv',
-    'mpcu',
-    'mpe-based',
     'mpeg-2',
-    'mppc',
-    'mppl',
-    'mpu-401',
-    'mros',
-    'mrpc',
-    'msai',
-    'msar',
-    'msds',
-    'msha',
-    'msj',
-    'msk',
-    'mso',
-    'mstislav',
-    'mswindows',
-    'mths',
     'mtow',
-    'muavenet',
-    'muay',
-    'much-',
-    'much-dreaded',
-    'much-increased',
-    'much-liked',
-    'much-wronged',
-    'mucklehouse',
-    'mud-bank',
-    'mud-dauber',
-    'mud-loving',
-    'mudbath',
-    'mudcaked',
-    'mudgee',
-    'mudrock',
     'mueshihange',
-    'mufakat',
-    'mugeary',
-    'mugello',
-    'mugwumps',
-    'muirshiels',
-    'muirtown',
-    'mujuru',
-    'mukalla',
-    'mukasas',
-    'mukund',
-    'mukupo',
-    'mulazims',
-    'mulchaey',
-    'mulct',
-    'mulley',
     'mullineaux',
-    'mullineux',
-    'multi&ndash;attribute',
-    'multi-access',
-    'multi-airline',
-    'multi-billionaire',
-    'multi-column',
-    'multi-company',
-    'multi-component',
-    'multi-engine',
-    'multi-file',
-    'multi-organ',
-    'multi-platinum',
-    'multi-poll',
-    'multi-sector',
-    'multi-syllabus',
     'multi-tonne',
-    'multiband',
-    'multicast',
-    'multico',
-    'multifaculty',
-    'multifigure',
-    'multigroup',
-    'multihead',
-    'multinucleated',
-    'multipaint',
-    'multipara',
-    'multiple-',
-    'multiple-family',
-    'multiple-occupancy',
-    'multisync',
-    'multivessel',
     'multos',
-    'mumalissimo',
-    'mume',
-    'mumiai',
-    'mumith',
-    'mummerys',
-    'mumps-meningitis',
-    'munalula',
-    'munchenci',
-    'munchy',
-    'mundie',
-    'mundiford',
-    'mundus',
-    'munge',
-    'munka',
-    'munt',
     'murerwa',
-    'murgu',
-    'murgulescu',
-    'muricids',
-    'murrill',
-    'murtaugh',
-    'murty',
-    'murwa',
-    'murzuk',
-    'muscadine',
-    'muschelkalk',
-    'muscidae',
-    'muscle-man',
-    'mushes',
-    'mushoosh',
-    'musi',
     'music-box',
-    'music-master',
-    'music-theatre',
-    'musicae',
-    'musickies',
-    'musicland',
-    'musikverein',
-    'musk-ox',
-    'musker',
-    'musquash',
-    'musselshell',
-    'mussing',
-    'must\'',
-    'must-fit',
-    'must-see',
-    'must-win',
     'mustard-seed',
-    'muston',
-    'mustow',
-    'mutambaye',
-    'mutation-selection',
-    'mutengene',
-    'mutford',
-    'mutha',
-    'muthuramalingam',
-    'mutilates',
-    'muto',
-    'mutrie',
-    'mutualist',
-    'muwakkil',
-    'mux',
-    'muzik',
     'mv.',
-    'mva',
-    'mvo',
-    'mw(e)',
-    'mwananshiku',
-    'mx-6',
-    'mycella',
-    'mycotoxin',
-    'myelinated',
-    'myerhoff',
-    'myklebust',
-    'mykola',
-    'mylanta',
-    'myle',
-    'mylex',
-    'mylonitized',
     'mynach',
-    'myponya',
-    'myre',
-    'myrina',
-    'myrmecobius',
-    'myshall',
-    'mysteriis',
-    'mysticetes',
-    'mystyle',
-    'myth-telling',
-    'mytton',
-    'n&auml;her',
-    'n&eacute;ant',
-    'n&icirc;mois',
-    'n\'drangheta',
-    'n\'roll',
     'n-acetylcysteine',
-    'n-force',
-    'n-reg',
-    'n.v',
-    'n05',
-    'n15',
-    'n64000',
-    'naaws',
-    'nababsingh',
-    'nabataean',
-    'nabe',
-    'nabila',
-    'nabn',
-    'nabobs',
-    'nabumetone',
-    'naccb',
     'nachman',
-    'nachola',
-    'nachtwey',
-    'naci&oacute;n',
-    'nacked',
-    'nacod',
-    'nadea',
-    'naden',
-    'nadis',
-    'naffy',
-    'nafis',
-    'nafkhosh',
-    'naftali',
-    'nafthe',
-    'nagal',
-    'nagapanchami',
     'nagarkot',
-    'naginata',
-    'nagm',
-    'nagorno',
-    'nagriamel',
-    'naha-te',
-    'nahbo',
-    'nahe',
-    'naher',
-    'nail-making',
-    'nailcraft',
-    'nailed-down',
-    'nailz',
-    'nairacs',
-    'najaar',
-    'namaqua',
     'namby',
-    'name\'',
-    'name-change',
-    'name-changing',
-    'name-dropped',
-    'namechecked',
-    'namik',
-    'namoos',
-    'namuth',
-    'namy',
-    'nanbudo',
-    'nancy-boy',
-    'nandy',
-    'nangle',
-    'nankai',
-    'nankivell',
     'nanning',
-    'nannostomus',
-    'nansha',
-    'nantais',
-    'nanyuki',
-    'naoko',
-    'napap',
-    'napery',
-    'napolean',
-    'napolitana',
-    'napp',
-    'narayanganj',
-    'narcizo',
-    'narkompros',
-    'narod',
-    'narodni',
     'narodnost\'',
-    'narratization',
-    'narrowmarsh',
-    'narrowminded',
-    'nasakom',
-    'nasma',
-    'nasscom',
-    'nata',
-    'natanson',
-    'natascia',
-    'nathu',
-    'nationa',
-    'nationair',
-    'nats',
-    'nattier',
-    'natural-',
     'naturaliter',
-    'nature\'',
-    'nature-conservation',
-    'nature-spirit',
-    'naturopaths',
-    'naturphilosophie',
-    'naud',
-    'naumanni',
-    'naus&eacute;e',
-    'nausea-inducing',
-    'navaid',
-    'navarin',
-    'navarino',
-    'navvying',
-    'naya',
-    'nayib',
     'naykene',
-    'naythuyein',
-    'nazarkin',
-    'nazi-style',
-    'nazione',
-    'nbd',
-    'nber',
-    'nbr',
-    'nccae',
-    'ncopa',
-    'ncore',
-    'ncrv',
-    'ncsc',
-    'ncsi',
-    'nde',
-    'ndeh',
     'ndes',
-    'ndimene',
-    'ndis',
-    'ne&ndash;330s',
-    'neac',
-    'near-anarchy',
-    'near-despair',
-    'near-exhaustion',
-    'near-forgotten',
-    'near-ground',
-    'near-paralysis',
-    'near-perfection',
-    'near-rp',
-    'near-suffocation',
-    'nearsense',
-    'neathey',
     'neato',
-    'nebelwerfer',
-    'neblina',
-    'necator',
-    'neccesary',
-    'necessarianism',
-    'necessarye',
-    'necho',
-    'neck-heaviness',
-    'neck-heavy',
-    'neck-scarf',
-    'neckinger',
-    'necklaced',
-    'necros',
-    'necs',
-    'nede',
     'need\'',
-    'needle-',
-    'needle-gun',
-    'needle-point',
-    'neelam',
-    'neer',
-    'neeve',
-    'nefax',
-    'negational',
-    'negative-sounding',
-    'negligenter',
-    'negro\'',
-    'negroni',
-    'negrophobia',
-    'neidpath',
-    'neiman',
     'nelion',
-    'nell\'',
-    'nelle',
-    'nelso',
-    'neltc',
-    'nemba',
-    'nemet',
-    'nemuchin',
-    'neno',
-    'nentres',
-    'neo-colonialist',
-    'neo-cortex',
-    'neo-expressionist',
-    'neo-mcluhanite',
-    'neo-mod',
-    'neo-modernisation',
     'neo-monetarist',
-    'neo-perpendicular',
-    'neo-platonism',
-    'neo-stalinism',
-    'neo-trotskyist',
-    'neodymium-iron-boron',
-    'neogastropods',
-    'neogen',
-    'neoplatonism',
-    'nepalis',
-    'nephrolepis',
-    'nephrops',
-    'nepp',
-    'nepszabadsag',
-    'nera',
-    'nercom',
     'nere',
-    'nereides',
-    'nerine',
-    'nerve-stretching',
-    'nerve-testing',
-    'nesiotes',
-    'nest-box',
-    'nestfield',
-    'nesting-place',
-    'nestroy',
-    'net-minder',
-    'netc',
-    'netheridge',
-    'neti-neti',
-    'netty',
-    'network-connected',
     'neun',
-    'neuqu&eacute;n',
-    'neuro-anatomist',
-    'neuro-psychologist',
-    'neuroglottis',
-    'neuromancer',
-    'neuropharmacology',
-    'neuters',
-    'neutral-sounding',
-    'neutronization',
-    'never&rehy;ending',
-    'never-before-seen',
-    'never-completed',
-    'nevills',
-    'new-caught',
-    'new-won',
     'new-year',
-    'newcastle-scousers',
-    'newcastle-upon-tyne-based',
-    'newcastles',
-    'newcomen-type',
-    'newdick',
-    'newletter',
-    'newliston',
-    'newlon',
-    'newly-',
-    'newly-emerging',
-    'newly-imported',
-    'newly-lit',
-    'newly-written',
-    'newmap',
-    'newnix',
     'newoed1&ndash;newoed7',
-    'news-reporting',
-    'newsbreak',
-    'newscan',
-    'newsgroup',
-    'newsomes',
-    'newspaper-selling',
-    'newsted',
-    'newsws2-4',
-    'newtone',
-    'newtongrange',
-    'nexor',
-    'nfpa',
-    'ng\'wandu',
-    'ngaoundere',
-    'ngarivue',
     'ngeze',
-    'nghe',
-    'ngonde',
-    'ngwane',
-    'ngwazi',
-    'nher',
-    'nhu',
-    'niacro',
-    'niagaras',
-    'niapaland',
-    'niarchos',
-    'nibelungenlied',
-    'nickel(ii)',
-    'nickered',
-    'nickering',
-    'nicklen',
     'nickleodeon',
-    'nicko',
-    'nicocea',
-    'nicoya',
-    'niemczak',
-    'niemen',
-    'nienaber',
-    'nies',
-    'niff',
-    'niffed',
-    'night-blue',
-    'night-line',
-    'night-safe',
-    'night-scene',
-    'night-side',
-    'night-table',
     'nightclubbers',
-    'nighters',
-    'nightline',
-    'nightlong',
-    'nightowl',
-    'nightshelter',
-    'nightsit',
-    'nightsoil',
-    'nigraha',
-    'nijman',
-    'nikb',
-    'nike-mare',
-    'nikons',
-    'nilde',
-    'nilfisk',
-    'nilssonia',
     'nim-fay-a',
-    'nimal',
-    'nimesh',
-    'nimh',
-    'niminy-piminy',
-    'nine-stone',
-    'nineteen-',
-    'nineteenth/twentieth-century',
-    'ninetta',
-    'ninety-dollar',
-    'ninty',
-    'nip-cheese',
-    'nippled',
-    'nirv&amacr',
-    'nisan',
-    'nisbett',
     'nishino',
-    'niss',
-    'nisyros',
-    'nitc',
-    'nitricum',
-    'nitro-organics',
-    'nitroscanate',
-    'nivr',
-    'nixie',
-    'nizhnevartovsk',
-    'nkipc',
-    'nkulu',
-    'nlva',
-    'nmes',
-    'nmpft',
-    'nni',
     'nnw&ndash;sse',
-    'no&euml',
-    'no&rehy;nonsense',
-    'no&rehy;one',
-    'no-charge',
-    'no-colour',
-    'no-first-use',
-    'no-marking-to-the-market',
-    'no-quibble',
-    'no-side',
-    'no-strings-attached',
-    'no-tillage',
-    'no-visa',
-    'nobber',
-    'nobe',
-    'noble-looking',
     'nobre',
-    'nobuhiko',
-    'noctambules',
-    'noctua',
-    'noder',
-    'noggin\'',
-    'noiret',
-    'noise-level',
-    'noise-reducing',
-    'noise-reduction',
-    'nolder',
-    'noldor',
-    'noleen',
-    'noman',
-    'non&ndash;statutory',
-    'non&rehy;verbal',
     'non-accountancy',
-    'non-alcohol',
-    'non-applicability',
-    'non-application',
-    'non-assertion',
-    'non-assignment',
-    'non-attainment',
-    'non-attribution',
-    'non-axiality',
-    'non-batsman',
-    'non-belligerency',
-    'non-bolshevik',
-    'non-bondholder',
-    'non-breastfeeding',
-    'non-candidacy',
-    'non-carbon',
     'non-cash-limited',
-    'non-chewong',
-    'non-cip',
-    'non-circular',
-    'non-citation',
-    'non-climbing',
-    'non-collaboration',
-    'non-committed',
-    'non-communautaire',
-    'non-commuting',
-    'non-company',
-    'non-confrontation',
-    'non-consequentialist',
-    'non-consultation',
-    'non-consumption',
-    'non-course',
     'non-cross',
-    'non-degradation',
-    'non-directed',
-    'non-directiveness',
-    'non-distorting',
-    'non-domesticated',
-    'non-dos',
-    'non-drug',
-    'non-entailment',
-    'non-erm',
-    'non-essentialist',
-    'non-execution',
-    'non-falangist',
-    'non-feasance',
-    'non-glycine',
-    'non-governing',
     'non-grant',
-    'non-greenbelt',
-    'non-growth',
-    'non-healing',
-    'non-homicide',
-    'non-honours',
-    'non-identified',
-    'non-inclusion',
-    'non-index',
-    'non-individual',
-    'non-intimidating',
-    'non-inverted',
-    'non-jacobite',
-    'non-latin',
-    'non-lead',
-    'non-mammalian',
     'non-market-clearing',
-    'non-melanoma',
-    'non-modernist',
-    'non-moving',
-    'non-museum',
-    'non-music',
-    'non-mutant',
-    'non-nafta',
-    'non-objectified',
-    'non-oil-producing',
-    'non-pareil',
-    'non-patois',
-    'non-payer',
-    'non-perishables',
-    'non-petrol',
-    'non-petroleum',
     'non-phonetic',
-    'non-place-based',
-    'non-politics',
-    'non-primary',
-    'non-prime-time',
-    'non-problem',
-    'non-productivity',
-    'non-programmer',
-    'non-proliferating',
-    'non-puritan',
-    'non-radical',
-    'non-realist',
-    'non-reason',
-    'non-recipient',
-    'non-representation',
-    'non-republican',
     'non-resonance',
-    'non-restraint',
-    'non-rising',
-    'non-rugby',
-    'non-running',
-    'non-selling',
-    'non-sentient',
-    'non-shivering',
-    'non-sibilant',
-    'non-significance',
-    'non-skiing',
-    'non-sting',
-    'non-stretch',
-    'non-strike',
-    'non-striking',
-    'non-student',
     'non-talk',
-    'non-taxing',
-    'non-unitary',
-    'non-viability',
-    'non-wesleyan',
-    'non-written',
-    'nonbusiness',
-    'noncore',
-    'nondecreasing',
-    'nonjuror',
-    'nonmarine',
-    'nonmarket',
-    'nonmetallic',
-    'nonny',
-    'nonoxynol',
-    'nonoxynol-9',
     'nonpossessor',
-    'nonsuited',
-    'nonthreatening',
-    'nontrading',
-    'nonza',
-    'noodling',
-    'noon&ndash;2',
-    'nopec',
-    'noplace',
-    'noral',
-    'norbec',
-    'norblast',
-    'norcap',
-    'nordenfeldt',
-    'nordex',
-    'norex',
     'norge',
-    'norinchukin',
-    'norlite',
-    'norm-creating',
-    'normac',
-    'normalien',
-    'norman-french',
-    'norn',
-    'norne',
-    'nors',
-    'norscot',
-    'nortech',
-    'north-northeast',
-    'north-to-south',
-    'north-west-facing',
-    'northants.',
     'northdown',
-    'northeastward',
-    'northen',
-    'northernness',
-    'northmavine',
-    'northwestward',
-    'norval',
-    'norwegian-based',
-    'norweyan',
-    'norwich\'',
-    'nosc',
-    'nose-blowing',
-    'nose-thumbing',
-    'nosebands',
-    'nosedives',
-    'nosegays',
     'nosewheel',
-    'nossos',
-    'nossy',
-    'nosy-parker',
-    'not-be',
-    'not.',
-    'notating',
-    'note-for-note',
-    'note-material',
-    'note-order',
-    'notejet',
-    'notenbuch',
-    'noter',
-    'notes-based',
-    'notetaker',
-    'nothdurft',
     'notown',
-    'notta',
-    'noufara',
-    'nourish&egrave;d',
-    'nourishin\'',
-    'novacrylic',
-    'noval',
-    'november&ndash;december',
-    'novembre',
-    'novick',
-    'novogorod',
-    'novorossiysk',
-    'now\'',
-    'now-forgotten',
-    'now-legendary',
-    'nowhereland',
     'nown',
-    'nows',
-    'nozovent',
-    'nozy',
-    'npgl',
-    'npro',
-    'nqr',
-    'nrsa',
-    'nsais',
-    'nsf-controlled',
-    'nsrrki',
-    'nsst',
-    'nsta',
-    'nsue',
-    'ntlink',
-    'nttc',
     'ntw',
-    'nubibus',
-    'nuc',
-    'nuclear-reactor',
-    'nugee',
-    'nuggett',
-    'nukul',
-    'nullah',
-    'nulled',
-    'nulligravida',
-    'nullipara',
-    'num&eacute;ro',
-    'numast',
-    'numbat',
-    'numenor',
-    'numorum',
     'numptious',
-    'numskulls',
-    'nuraghe',
-    'nuridzo',
-    'nurit',
-    'nurse-maid',
-    'nurse-receptionist',
-    'nursery-raised',
-    'nursling',
-    'nusur',
-    'nut-eater',
-    'nute',
-    'nuthall',
-    'nuu',
-    'nwm',
-    'nwosu',
     'nya',
-    'nyakyusa',
-    'nyambui',
-    'nyamsambuu',
-    'nyanza',
-    'nycodenz',
-    'nycticorax',
-    'nygaard',
-    'nyha',
-    'nylex',
-    'nylon-clad',
-    'nyloned',
-    'nymansay',
-    'nymphalid',
-    'nymphe',
-    'nympsfield',
     'nyons',
-    'nypl',
-    'nyroca',
-    'nzabahimana',
-    'nzctu',
-    'nzru',
-    'o\'clock-',
-    'o\'erstep',
-    'o\'groat',
-    'o\'tunstead',
-    'o-200',
-    'o-dako',
-    'o.a.',
-    'oaa',
-    'oak-elder',
-    'oak-smoked',
     'oak-thorn',
-    'oaklahoma',
-    'oakport',
-    'oasig',
-    'oast-house',
-    'oasts',
-    'oaten',
-    'oater',
-    'oaxacan',
-    'obbo',
-    'obc',
-    'obducted',
-    'obeah',
-    'obein',
-    'obergruppenf&uuml;hrer',
-    'oberhofen',
     'oberkircher',
-    'oberlandesgericht',
-    'obfuscated',
-    'obi',
-    'obimpeh',
-    'object-referring',
-    'objecteering',
-    'objectiq',
-    'objectteam',
-    'oblidge',
-    'oborony',
-    'obscura',
-    'observator',
-    'obsessione',
-    'oceanian',
-    'oceanodroma',
     'oceanor',
-    'ochrolechia',
-    'ockleigh',
-    'ocko',
-    'ocobamba',
-    'oct-2b',
-    'octaplex',
-    'octaver',
-    'octerotide',
-    'octobre',
-    'octocom',
-    'octon',
-    'oczelebi',
-    'odd-ball',
-    'odeillo',
-    'odescalchi',
     'odet',
-    'odu',
-    'oecophylla',
-    'oek',
-    'oeningen',
-    'oenone',
-    'oer',
-    'ofensiva',
-    'off\'',
-    'off-balance-sheet',
-    'off-comer',
-    'off-on',
-    'off-route',
-    'off-schedule',
-    'off-task',
-    'off-the-road',
     'off-the-street',
-    'off-watch',
-    'off-zone',
-    'offerton',
-    'office-equipment',
-    'office-work',
-    'officer-class',
-    'officiel',
-    'officrs',
-    'offpeak',
-    'offset-litho',
-    'offworld',
-    'ofice',
-    'ofjustice',
-    'ofsted',
-    'ogunbe',
     'ohashi',
-    'ohta',
-    'ohtake',
-    'oiel',
-    'oil-driven',
-    'oil-gas',
-    'oil-industry',
-    'oil-mill',
-    'oil-prospecting',
-    'oil-pumping',
-    'oil-revenue',
-    'oil-shipping',
-    'oil-stove',
-    'oil-well',
-    'oirats',
-    'oissel',
     'ojai',
-    'oji',
-    'ojok',
-    'ok-',
-    'ok-ness',
-    'okie',
-    'okoshi',
-    'okt',
-    'okubo',
-    'okudaira',
-    'olcan',
-    'old&rehy;fashioned',
-    'old\'',
-    'old-people',
-    'older-type',
-    'oldest-looking',
     'oldlands',
-    'oldstyle',
-    'olfacts',
-    'olgiersson',
-    'oligo-dt',
-    'olitski',
-    'olivares',
-    'olivey',
-    'olleveant',
-    'olli',
-    'olurin',
-    'olympias',
-    'olympica',
-    'omagiu',
-    'ombla',
-    'omelet',
     'omerovic',
-    'ominer',
-    'ominipoint',
-    'omniback',
-    'omnicourt',
-    'omnidata',
-    'omnifont',
-    'omnipotenti',
-    'omnopon',
-    'on&ndash;going',
-    'on-camera',
-    'on-court',
-    'on-lend',
-    'on-pitch',
-    'on-the-ball',
-    'on-the-record',
     'on_more',
-    'once-in-a-generation',
-    'once-living',
-    'once-upon-a-time',
-    'ondieki',
-    'ondrej',
-    'one-bird',
-    'one-box',
-    'one-button',
-    'one-component',
-    'one-firm',
-    'one-hit',
-    'one-in',
-    'one-item',
-    'one-megaton',
-    'one-pair',
     'one-phase',
-    'one-ply',
-    'one-race',
-    'one-run',
-    'one-shilling',
-    'one-stage',
-    'one-storeyed',
-    'one-string',
-    'one-tonne',
-    'one-twentyfourth',
-    'one-xxxx',
-    'one_a',
-    'one_as',
-    'oneiromancy',
-    'onigo',
-    'onm',
     'onodera',
-    'onychophores',
-    'oodu',
-    'ooer',
-    'oohhh',
-    'oolong',
-    'oona',
-    'ooooooo-oo-oo',
-    'ooooooooooh',
-    'oopsy',
-    'oostende',
-    'opa',
-    'opaqued',
-    'opd',
-    'open\'',
-    'open-back',
     'open-boat',
-    'open-cell',
-    'open-cockpit',
-    'open-mesh',
-    'open-pit',
-    'open-sprung',
-    'open-style',
-    'open-system-based',
-    'opening-round',
-    'openmessaging',
-    'opera-loving',
-    'operati',
-    'operatin\'',
-    'opet',
-    'ophialcaea',
-    'ophiolepidinae',
     'ophiomyxa',
-    'ophiothamnus',
-    'ophuls',
-    'opinion-polling',
-    'opio',
-    'opitiis',
-    'opl',
-    'oporton',
-    'oppau',
-    'opponant',
-    'opposition-led',
-    'oppy',
-    'oprdered',
-    'optical-disc',
-    'optioning',
-    'opu',
     'opw',
-    'oquel&iacute',
-    'oraba',
-    'oracstar',
-    'orang-hutan',
-    'orange-and-white',
-    'orange-buff',
-    'oranienburg-sachsenhausen',
-    'orapa',
-    'orate',
-    'oratoria',
-    'orb-web',
-    'orbe',
-    'orbium',
-    'orcad',
-    'orcofi',
     'ordered-segmentation',
-    'orderin\'',
-    'ordinis',
-    'oreads',
-    'orenstein',
-    'organ-building',
-    'organi',
-    'organised-crime',
-    'organo-chloride',
-    'oric',
-    'oriflame',
-    'oriskany',
-    'oriundi',
-    'orkneyinga',
-    'orlane',
-    'ormseby',
     'orn',
-    'ornithischia',
-    'oromos',
-    'oronte',
-    'orontes',
-    'orotava',
-    'orridge',
-    'orrys',
-    'orseolo',
-    'orth',
-    'orthodontics',
-    'orthogonalised',
-    'orthogonality',
-    'orto',
-    'ortolan',
-    'ortona',
     'oruc',
-    'osage',
-    'osakazuki',
-    'osamor',
-    'osband',
-    'oscroft',
-    'osi-based',
-    'osk',
-    'oslac',
-    'osmose',
-    'osophageal',
-    'osorkon',
-    'ospf',
-    'ossenkopp',
-    'osses',
-    'ostade',
     'ostara',
-    'osteology',
-    'ostinati',
-    'osyak',
-    'otaheite',
-    'otai',
-    'otieno',
-    'otomat',
-    'otra',
-    'otso',
-    'ottava',
-    'otterspool',
-    'ottobuono',
-    'ottomar',
-    'oudinot',
-    'oudran',
     'oukacha',
-    'oustanding',
-    'out&ndash;trays',
-    'out&rehy;performed',
-    'out-argue',
-    'out-compete',
-    'out-crossing',
-    'out-gassing',
-    'out-hit',
-    'out-in-the-open',
-    'out-jabbed',
-    'out-living',
-    'out-matched',
-    'out-of-',
-    'out-of-balance',
-    'out-of-centre',
     'out-of-dateness',
-    'out-of-office',
-    'out-of-plane',
-    'out-of-reach',
-    'out-of-role',
-    'out-of-the-blue',
-    'out-of-uniform',
-    'out-performing',
-    'out-qualified',
-    'out-ranked',
-    'out-selling',
-    'out-shone',
-    'out-shot',
-    'out-spent',
-    'out-turns',
-    'out-work',
     'outbraked',
-    'outcompeted',
-    'outcross',
-    'outer-ance',
-    'outer-directed',
-    'outer-estate',
-    'outgoers',
-    'outheld',
-    'outler',
-    'outloud',
-    'outraging',
-    'outriding',
-    'outscrummaged',
-    'outsmarting',
-    'outstretch',
-    'ovd',
     'oveissi',
-    'oven-to-table',
-    'over&rehy;confident',
-    'over-25s',
-    'over-70s',
-    'over-administered',
-    'over-arm',
-    'over-balanced',
-    'over-banked',
-    'over-bent',
-    'over-built',
-    'over-capitalized',
-    'over-centralised',
-    'over-corrected',
-    'over-determining',
-    'over-dramatise',
     'over-dramatize',
-    'over-egg',
-    'over-egged',
-    'over-enamoured',
-    'over-engineered',
-    'over-engineering',
-    'over-enjoyed',
-    'over-equipped',
-    'over-excite',
-    'over-farming',
-    'over-fished',
-    'over-grazed',
-    'over-heard',
-    'over-horsed',
-    'over-idealised',
-    'over-learning',
     'over-pleased',
-    'over-policed',
-    'over-polished',
-    'over-pressed',
-    'over-printed',
-    'over-probing',
-    'over-regulate',
-    'over-rely',
-    'over-shooting',
-    'over-spiritualizing',
-    'over-strained',
-    'over-top',
-    'over-value',
-    'over-valuing',
-    'overacting',
-    'overbaked',
     'overbank',
-    'overbid',
-    'overbidding',
-    'overblankets',
-    'overboots',
-    'overborrowed',
-    'overbred',
-    'overcalled',
-    'overcleaned',
-    'overcloth',
-    'overconcern',
-    'overconsume',
-    'overcorrection',
-    'overdamped',
-    'overdecorated',
-    'overdependent',
     'overdetermining',
-    'overdubbing',
-    'overendowed',
-    'overfamiliar',
-    'overglaze',
-    'overhit',
-    'overhitting',
-    'overhunted',
-    'overhyped',
-    'overpackaged',
-    'overpacked',
-    'overpass',
-    'overpraise',
-    'overpublishing',
-    'oversalted',
-    'oversampling',
     'oversewing',
-    'overspecified',
-    'overspilled',
-    'overspray',
-    'overstamped',
-    'overstimulating',
-    'overstitched',
-    'overstreet',
-    'overstriking',
-    'oversupinate',
-    'overtightened',
-    'overtraining',
-    'overuled',
-    'overwatered',
-    'overwear',
-    'ovingdean',
     'ovolo',
-    'ovule',
-    'owana',
-    'own-share',
-    'ownd',
-    'owner-driver',
-    'owwww',
-    'owzat',
-    'ox-drawn',
-    'ox-team',
-    'ox-wagon',
-    'oxalacetic',
-    'oxblood',
-    'oxcis',
-    'oxeye',
-    'oxfordian',
     'oxhides',
-    'oxlip',
-    'oxmoor',
-    'oxocelhaya',
-    'oxybutynin',
-    'oxygen-16',
-    'oxytetracycline',
-    'oyono',
-    'oystermen',
-    'p&eacute;re',
-    'p&eacute;tillant',
-    'p&eacute;tur',
-    'p&egrave;lerinage',
-    'p&egrave;res',
-    'p&rcaron;emysl',
-    'p&uacute;blico',
     'p\'nzance',
-    'p\'tum-chk',
-    'p(u)',
-    'p-27',
-    'p-block',
-    'p-c',
-    'p-cadherin',
-    'p-dctp',
-    'p-detector',
-    'p-direction',
-    'p-n',
-    'p-play',
-    'p-selectin',
-    'p-varying',
-    'p-wave',
-    'p-way',
     'p400',
-    'p483',
-    'pa-ing',
-    'paap',
-    'pacasmayo',
-    'pacaya',
-    'pachta',
-    'pachycephalosaurus',
-    'pacific\'',
-    'packing-up',
-    'paddling-pool',
-    'padouk',
-    'padovan',
-    'paety',
-    'pagemarq',
-    'pagk',
     'pagliuca',
-    'pagon',
-    'pagurus',
-    'pahadia',
-    'paicf',
-    'paich',
-    'paigntons',
-    'pailly',
-    'pain-glove',
-    'pain-producing',
-    'pain-relief',
-    'paint-peeled',
-    'paint-scraper',
-    'paintballing',
-    'paintballs',
-    'painted-over',
     'painter-critic',
-    'painter-stainers',
-    'paintjet',
-    'paintmakers',
-    'paintress',
-    'pairc',
-    'paisa',
-    'paj',
-    'paki-bashing',
-    'pakistani-trained',
-    'paklenica',
-    'paktong',
-    'palace\'',
-    'palaeoanthropology',
-    'palaeocurrent',
-    'palaeologus',
     'palaeotemperatures',
-    'palakona',
-    'palaniappa',
-    'palanque',
-    'palargic',
-    'palat',
-    'palatalized',
-    'palaung',
-    'pale-eyed',
-    'pale-headed',
-    'pale-lemon',
-    'pale-yellow',
-    'palefaces',
-    'palette-knife',
-    'palingenesia',
-    'palinurus',
     'pallazzo',
-    'pallone',
-    'palm-grip',
-    'palmate',
-    'palmboom',
-    'palmleaf',
-    'palona',
-    'palpitate',
-    'palpitated',
-    'pamchenko',
-    'pammon',
-    'pan-shot',
-    'panagia',
-    'panalpina',
-    'panamanian-registered',
-    'panamyes',
     'panax',
-    'panay',
-    'pandion',
-    'pandoro',
-    'panel-picture',
-    'panevors',
-    'panfield',
-    'panforte',
-    'pangbourn',
-    'panic&rehy;stricken',
-    'panis',
-    'pannet',
-    'panorpoid',
-    'panozo',
-    'pansio',
-    'pantaloon',
     'panthalassa',
-    'panyi',
-    'pao-yu',
-    'papabile',
-    'papamarkou',
-    'papanicolaou',
-    'paper-covered',
-    'paper-feed',
-    'paper-producing',
-    'paper-weight',
-    'paperwhite',
-    'papia',
-    'papillomaviruses',
-    'pappalardo',
-    'papush',
-    'par-70',
     'par-73',
-    'par-saving',
-    'para-',
-    'para-incompatibility',
-    'para-relation',
-    'parabellum',
-    'paracel',
-    'paracentral',
-    'paracetamol-methionine',
-    'paracetemol',
-    'parade\'',
-    'paradero',
-    'paradichlorobenzene',
-    'paradigm-shifting',
-    'paradisum',
-    'paraglide',
     'parallel-chord',
-    'parallelise',
-    'paralyzing',
-    'parameta',
-    'paramilitary-style',
-    'paranoid-schizoid',
-    'parapenting',
-    'parascend',
-    'parasitoid',
-    'paraty',
-    'paratyphoid',
-    'pard',
-    'pardave',
-    'pardiggle',
-    'parel',
-    'parent-company',
     'parent-figure',
-    'parenzo',
-    'parigi',
-    'paringaux',
-    'paris-trained',
-    'parishar',
-    'parken',
-    'parkeses',
-    'parking-bay',
-    'parkinsonii',
-    'parkray',
-    'parleyed',
-    'parlow',
-    'parmelia',
-    'parmenidean',
-    'parmentier',
     'parnassos',
-    'parodos',
-    'parravicini',
-    'parravon',
-    'parrington',
-    'parriss',
-    'parrys',
-    'part\'',
-    'part-disposal',
-    'part-filling',
-    'part-proprietor',
-    'part-purchase',
-    'part-rent',
-    'part-shade',
-    'part-tenant',
-    'part-throttle',
     'partagas',
-    'parthenais',
-    'particle-anti-particle',
-    'particu',
-    'partigiani',
-    'partin',
-    'partitas',
-    'partizans',
-    'partrishow',
-    'partsbank',
-    'parturient',
-    'party\'',
-    'party-dominated',
-    'party-loving',
-    'party-plan',
-    'parvati',
     'parvo',
-    'parwan',
-    'pashupatinath',
-    'paskin',
-    'passacaglias',
-    'passats',
-    'passband',
-    'passereau',
-    'passez',
-    'passifloraceae',
-    'passion-killer',
-    'passiontide',
-    'passk',
-    'past\'',
-    'past-president',
-    'pastaza',
     'pasterze',
-    'pasteurella',
-    'pastoralis',
-    'pastores',
-    'pastoring',
-    'pastry-cook',
-    'pasvik',
-    'patates',
-    'pathman',
-    'pathologised',
-    'pathologized',
-    'patient-led',
-    'patijn',
-    'pato',
-    'patoulidou',
-    'patrase',
     'patrem',
-    'patrial',
-    'patriarcha',
-    'pattern-recognition',
-    'pattinsons',
-    'pattullo',
-    'pauker',
-    'paulinho',
-    'paulownia',
-    'paulsen',
-    'paumgartner',
-    'paupered',
-    'pauvres',
-    'pavelic',
-    'pavier',
-    'pavlychko',
     'pavyd',
-    'pay-at-the-gate',
-    'pay-round',
-    'pay-slip',
-    'paya',
-    'paycops',
-    'paydirt',
-    'payg',
-    'payot',
-    'payroll-giving',
-    'pazvant-oglu',
-    'pazyryk',
-    'pbgc',
-    'pbsb-tween',
-    'pbxs',
-    'pc-',
     'pc-6',
-    'pc-9800',
-    'pc-driven',
-    'pc-proof',
-    'pcdob',
-    'pce-5s',
-    'pcprobe',
-    'pdo',
-    'pdois',
-    'pdps',
-    'pdu',
-    'pe&ntilde;aloza',
-    'pea-souper',
-    'peace-broker',
-    'peace-treaty',
-    'pear-tree',
     'pearled',
-    'pearlised',
-    'pearlscale',
-    'peasant-woman',
-    'peasholme',
-    'peat-bog',
-    'peavy',
-    'pebble-filled',
-    'pebbledashed',
-    'peccata',
-    'pech',
-    'pecu',
-    'pecvd',
-    'ped',
-    'pedestrian-scale',
-    'pedestrian-vehicle',
     'pedicularis',
-    'pediplains',
-    'pedometers',
-    'pee-ing',
-    'pee-po-bum-shit-piddle-bugger-damn',
-    'peesy',
-    'peever',
-    'peformed',
-    'pegu',
-    'peigi',
-    'peiner',
-    'peis',
-    'pejot',
-    'pekinel',
-    'peking-owned',
-    'pelagi',
     'pelaw',
-    'peligroso',
-    'peller',
-    'pelligrini',
-    'pelopidas',
-    'peloponnesus',
-    'pelycosaur',
-    'pembangunan',
-    'pembers',
-    'pembo',
-    'pemmatites',
-    'pemon',
-    'pen-nib',
-    'pen-y-clip',
-    'penalver',
-    'pencil-and-paper',
     'pencil-written',
-    'pendente',
-    'pendon',
-    'pendy',
-    'penexec',
-    'penholder',
-    'penhouet',
-    'penicillia',
-    'penis-shaped',
-    'pennate',
-    'pennycress',
-    'pennypinching',
-    'penruddock',
-    'pensa-suhr',
-    'pensher',
-    'pension-scheme',
     'pensioning',
-    'pensoft',
-    'penstocks',
-    'pentelikon',
-    'pentelikos',
-    'pentewan',
-    'pentice',
-    'pentjak',
-    'pentry',
-    'pentstemon',
-    'peole',
-    'peopl',
-    'people-orientation',
-    'people-pleaser',
-    'pep-up',
-    'pepit',
     'pepsodent',
-    'peptavlon',
-    'peptide-pulsed',
-    'per-barrel',
-    'per-capita',
-    'percentaged',
-    'percipi',
-    'perdika',
-    'perel',
-    'pereulok',
-    'perf',
-    'perfector',
-    'perfervid',
-    'performance-artist',
-    'performanceplus',
-    'perfumerie',
     'perfumier',
-    'peri-track',
-    'perico',
-    'perihermeneias',
-    'periodate',
-    'periodise',
-    'peripheralised',
-    'peripteral',
-    'periscoped',
-    'perishin\'',
-    'perklone',
-    'perloff',
-    'perman',
-    'permian-triassic',
-    'permissives',
-    'pern',
     'pern&scaron;tejn',
-    'perpetual-motion',
-    'perran',
-    'perren',
-    'perrhaiboi',
-    'perri&egrave;re',
-    'persea',
-    'pershing-ii',
-    'pershti',
-    'persigny',
-    'perspector',
-    'pertl',
-    'pertusato',
-    'peruke',
-    'peruvain',
-    'peruzzi',
     'pesa',
-    'pescatori',
-    'pest-control',
-    'pet-15b',
-    'petalomyrex',
-    'peterborough-based',
-    'peterhof',
-    'peterite',
-    'peterlee-based',
-    'petersson',
-    'petition-drawer',
-    'petrioli',
-    'petrit',
-    'petro-currency',
-    'petrocella',
-    'petrodollar',
     'petroecuador',
-    'petrol-filled',
-    'petrol-lead',
-    'petrol-price',
-    'petrol-tank',
-    'petrol-truck',
-    'petroquimica',
-    'petrovi&cacute;-njego&scaron',
-    'petru',
-    'petrucciani',
-    'petulancy',
-    'petwatch',
-    'peurl',
-    'pez',
-    'pezzoli',
-    'pfeil',
     'pfingst',
-    'pfrommer',
-    'pfs',
-    'pfsf',
-    'pgr',
-    'phab',
-    'phace',
-    'phacops',
-    'phantasmata',
-    'pharmacogenetics',
-    'pharmacotherapy',
-    'pharo',
-    'pharoahs',
-    'phase-contrast',
-    'phase-modulate',
-    'phased-array',
     'pheasant-eye',
-    'phenformin',
-    'phenobarbitol',
-    'phenylmethylsulphonylfluoride',
-    'phet',
-    'phigalia',
-    'philbeach',
-    'phildar',
-    'phillipinos',
-    'phillpotts',
-    'philodemos',
-    'philosophicum',
-    'philothea',
-    'phish',
-    'phocid',
-    'phonebook',
     'phoneme-based',
-    'phonologie',
-    'phorgh',
-    'phosophatidylcholine',
-    'phosphating',
-    'phosphatized',
-    'phospho-hpr',
-    'phosphoricum',
-    'phosphorus-box',
-    'phosphotungstate',
-    'photech',
-    'photo-cell',
-    'photo-library',
-    'photo-realism',
-    'photofile',
-    'photoframes',
     'photographs/illustrations',
-    'photomurals',
-    'photoplays',
-    'photoreal',
-    'photoreportage',
-    'photosynthesized',
-    'phototrack',
-    'phototypsetting',
-    'phouthang',
-    'phractocephalus',
-    'phrrrt',
-    'phurbu',
-    'phuture',
-    'physica',
-    'physio-therapist',
-    'phytophthora',
     'pi&uacute',
-    'pianist-composer',
-    'piano-stool',
-    'piasecki',
-    'piazzo',
-    'picchi',
-    'pick-popper',
-    'picktel',
-    'pickthall',
-    'pickthorn',
-    'pickwell',
-    'picolax',
-    'picture-house',
-    'pie-in-the-sky',
-    'pie-powder',
-    'piece-by-piece',
     'piece-meal',
-    'pied-fly',
-    'piedra',
-    'pielou',
-    'piemontese',
-    'pier-head',
-    'pierian',
-    'pierro',
-    'piershill',
-    'piesporter',
-    'pietons',
-    'pig-pig',
-    'piggy-eyed',
-    'pigney',
-    'pigperson',
-    'piked',
     'pilafs',
-    'pilaki',
-    'pilce',
-    'pile-weaving',
-    'piliso',
-    'pill-making',
-    'pill-taking',
-    'pillages',
-    'pilleri',
-    'pillowell',
-    'pilot-less',
-    'pin-count',
-    'pinacotheca',
-    'pinakothek',
-    'pine-cone',
-    'pine-tree',
     'pinel',
-    'ping&rehy;pong',
-    'pinge',
-    'pingeot',
-    'pinguifolia',
-    'pini',
-    'pininfarina-styled',
-    'pink-brown',
-    'pink-collar',
-    'pink-edged',
-    'pink-foot',
-    'pink-lit',
-    'pinkish-buff',
-    'pinky-brown',
-    'pinout',
-    'pint-pot',
     'pintucks',
-    'pinzgau',
-    'pipe-clay',
-    'pipe-fish',
-    'pipe-rack',
-    'pipe-sucking',
-    'pipe-tobacco',
-    'pipeclay',
-    'pipelaying',
-    'pipeslice',
-    'pipewell',
-    'pippi',
-    'pirithous',
-    'piroshki',
-    'pirvulescu',
-    'pisar',
     'pished',
-    'pisidia',
-    'pisk',
-    'pist',
-    'pistacia',
-    'pistil',
-    'pistils',
-    'pistol-packing',
-    'pit-boy',
-    'pit-popsy',
-    'pitfighter',
-    'pitlochrie',
-    'pito',
-    'pixtex',
-    'pku',
-    'pkunzip',
     'place\'',
-    'place-kicking',
-    'placet',
-    'plafond',
-    'plagiarise',
-    'plague-carrying',
-    'plague-ridden',
-    'plai',
-    'plains-style',
-    'plainspeople',
-    'plaisterers',
-    'planci',
-    'plancus',
-    'plane-tree',
-    'plane-wave',
-    'planet-based',
     'planetoid',
-    'planh',
-    'planning-programming-budgeting',
-    'plantpots',
-    'plasmapheresis',
-    'plasticey',
-    'plasticware',
-    'plastisol',
-    'plastopan',
-    'platalea',
-    'plate-spinning',
-    'plater',
-    'platey',
-    'platyhelminthes',
-    'plaudit',
-    'plaunotol',
     'play-doh',
-    'play-maker',
-    'play-school',
-    'playacted',
-    'player-power',
-    'player-queen',
-    'playlisted',
-    'playlisting',
-    'playmobile',
-    'playscape',
-    'playtrac',
-    'playweek',
-    'playwrighting',
-    'pleasssse',
-    'pleasure-pain',
-    'plegadis',
     'plegiocidaris',
-    'plenario',
-    'ples',
-    'plessy',
-    'pleurant',
-    'plexaurelia',
-    'pleye',
-    'plfp',
-    'plimsolled',
-    'pliolite',
-    'plisner',
-    'plj',
-    'plodcore',
-    'plodders',
-    'ploesti',
-    'plos',
     'plows',
-    'plowshares',
-    'ployees',
-    'plug-in-and-go',
-    'plumaged',
-    'plumbridge',
-    'plumetted',
-    'plumose',
-    'pluralized',
-    'pluralizing',
-    'plus-factor',
-    'plutonium-239',
-    'pluvinage',
-    'ply-wood',
-    'plymouth&ndash;roscoff',
-    'plymouth&ndash;santander',
     'plywood-covered',
-    'pmbx',
-    'pmc5&ndash;8',
-    'pmle',
-    'pnf',
-    'pno',
-    'po&eacute;sie',
-    'poblet',
-    'pobo',
-    'pocket\'',
-    'poddle',
-    'podgers',
-    'poeciliopsis',
-    'poete',
-    'pofs',
-    'pogoed',
     'pohle',
-    'poil',
-    'poincare',
-    'point(s)',
-    'point-in-polygon',
-    'pointiness',
-    'points-',
-    'poire',
-    'poison-gas',
-    'poison-producing',
-    'poison-tree',
-    'poizone',
-    'poker-player',
-    'pokphand',
-    'pokrovsk',
-    'pol&iacute;vka',
     'pola',
-    'polarguard',
-    'polarite',
-    'polarrfn',
-    'polay',
-    'poldens',
-    'pole-axing',
-    'police-issue',
-    'police-state',
-    'policedog',
-    'polich',
-    'polichetti',
-    'policia',
-    'policy-based',
-    'policy-holder',
-    'policy-implementation',
     'policy-planning',
-    'policy-setting',
-    'polish-style',
-    'politcal',
-    'politia',
-    'polizia',
-    'polkinhorne',
-    'polkovnik',
-    'pollice',
-    'pollit',
-    'poloneck',
-    'poltimore',
-    'poltown',
-    'poly(di-dc)',
-    'poly-cotton',
-    'poly-foam',
     'poly-hema',
-    'poly-tunnel',
-    'polyacrylonitrile',
-    'polyamine',
-    'polyas',
-    'polybag',
-    'polyborus',
-    'polyeidos',
-    'polyethylenes',
-    'polyfoam',
-    'polylines',
-    'polymerize',
-    'polymerizing',
-    'polyneikes',
-    'polyphiloprogenitive',
-    'polyptyque',
     'polysaturates',
-    'polyscope',
-    'polyvinlypyrrolidone',
-    'pom-pom-pom',
-    'pome',
-    'pomerantz',
-    'pompon',
-    'ponape',
-    'poncs',
-    'pond-weed',
-    'ponded',
-    'pondoes',
-    'pondy',
-    'pongidae',
-    'ponor',
-    'ponteus',
     'pontificalis',
-    'pontsticill',
-    'pony-drawn',
-    'pooh-poohing',
-    'pool-edge',
-    'pool-owner',
-    'poolroom',
-    'poomse',
-    'poor-country',
-    'poorly-trained',
-    'poorman',
-    'poorter',
-    'pootling',
-    'pop-culture',
-    'pop-funk',
-    'pop-rock',
     'popat',
-    'poperon',
-    'popits',
-    'popkiss',
-    'popolare',
-    'popovas',
-    'popply',
-    'popstyling',
-    'populare',
-    'popularvote',
-    'populates',
-    'populo',
-    'poralelslivi',
-    'porbeagle',
-    'porcupinefish',
-    'porcus',
     'pordenone',
-    'pore-space',
-    'porkenham',
-    'porlea',
-    'porphyrio',
-    'porsch',
-    'port-level',
-    'porta-potty',
-    'portaged',
-    'portages',
-    'portant',
-    'portesham',
-    'portex',
-    'portglenone',
-    'porthdinllaen',
-    'porthos',
     'porthywaen',
-    'portlligat',
-    'portolan',
-    'portrait-painting',
-    'portsmouth-based',
-    'portuguesa',
-    'poser-phone',
-    'posidonia',
-    'position-register',
-    'positively-charged',
-    'posol',
-    'possagno',
-    'posser',
-    'possest',
-    'possil',
-    'post-1934',
     'post-1981',
-    'post-1987',
-    'post-1993',
-    'post-and-rail',
-    'post-appeal',
-    'post-baptismal',
-    'post-boom',
-    'post-colonialism',
-    'post-conversion',
-    'post-copernican',
-    'post-crime',
-    'post-crisis',
-    'post-depression',
-    'post-determination',
-    'post-devaluation',
-    'post-diploma',
     'post-event',
-    'post-feminism',
-    'post-final',
-    'post-fix',
-    'post-griffiths',
-    'post-heroin',
-    'post-holiday',
-    'post-investment',
-    'post-massacre',
-    'post-material',
-    'post-mating',
-    'post-mill',
-    'post-nationalist',
-    'post-palaeozoic',
-    'post-performance',
-    'post-pill',
     'post-project',
-    'post-pub',
-    'post-publication',
-    'post-release',
-    'post-romantic',
-    'post-script',
-    'post-spawning',
-    'post-transfection',
-    'post-tridentine',
-    'post-welfare',
-    'postchallenge',
-    'postdienst',
-    'posterlink',
-    'postlabelling',
-    'pot&rehy;bellied',
-    'potagers',
     'potato-field',
-    'potato-masher',
-    'potato-patch',
-    'potatoe',
-    'potchefstroom',
-    'potentizing',
-    'potluck',
-    'pottergate',
-    'potterrow',
-    'potterson',
-    'potthast',
-    'potty-trained',
-    'pou-domain',
-    'pouff',
-    'poufs',
-    'poulains',
     'poular',
-    'poulets',
-    'pourceaugnac',
-    'pourin\'',
-    'pourquery',
-    'poutargue',
-    'povahs',
-    'powellites',
-    'power-kiting',
-    'power-line',
-    'power-room',
-    'power-surge',
-    'powerbridge',
-    'powerglyde',
-    'powermate',
-    'powermonger',
     'powersport',
-    'powervac',
-    'powle',
-    'poxed',
-    'poyser',
-    'pozen',
-    'pp4&ndash;7',
-    'pparc',
-    'ppfennigs',
-    'ppru',
-    'pqb',
-    'pqr',
-    'pr&eacute',
-    'pr&eacute;fet',
-    'pr&eacute;vert',
-    'practicks',
     'praecipe',
-    'praesens',
-    'praetextatus',
-    'prai',
-    'prakrit',
-    'pramful',
-    'pranayama',
-    'pranny',
-    'pras',
-    'prasertsuwan',
-    'prasiola',
-    'pratincola',
-    'pratincole',
-    'prayer-filled',
-    'prayer-wheel',
-    'praz',
     'prcd',
-    'pre&rehy;eminent',
-    'pre-16',
-    'pre-1700',
-    'pre-1915',
-    'pre-1917',
-    'pre-1947',
-    'pre-1997',
-    'pre-aids',
-    'pre-authorisation',
-    'pre-banding',
-    'pre-baroque',
-    'pre-beeching',
-    'pre-bid',
-    'pre-boom',
-    'pre-buyout',
     'pre-cataloguing',
-    'pre-census',
-    'pre-classic',
-    'pre-cleaning',
-    'pre-coordination',
-    'pre-cueing',
-    'pre-degree',
-    'pre-demonstration',
-    'pre-destination',
-    'pre-disturbance',
-    'pre-dive',
-    'pre-doctoral',
-    'pre-emptied',
-    'pre-emptying',
-    'pre-finished',
-    'pre-fire',
     'pre-frozen',
-    'pre-heroin',
-    'pre-holiday',
-    'pre-hunting',
-    'pre-influence',
-    'pre-initial',
-    'pre-judgment',
-    'pre-lapsarian',
-    'pre-load',
-    'pre-luncheon',
-    'pre-marketing',
-    'pre-mastering',
-    'pre-mating',
-    'pre-membership',
-    'pre-nationalist',
-    'pre-negotiated',
     'pre-nineteenth-century',
-    'pre-opening',
-    'pre-ordering',
-    'pre-packaging',
-    'pre-partition',
-    'pre-pregnancy',
-    'pre-programming',
-    'pre-pump',
-    'pre-quantum',
-    'pre-reduced',
-    'pre-roost',
-    'pre-run',
-    'pre-sequence',
-    'pre-shampoo',
-    'pre-shrunk',
-    'pre-smog',
     'pre-sonorant',
-    'pre-structural',
-    'pre-supper',
-    'pre-tax-profits',
-    'pre-tv',
-    'pre-wetting',
-    'pre-winter',
-    'pre-woven',
-    'preadapted',
-    'preakness',
-    'precapitalist',
-    'precarcinoid',
-    'precedented',
-    'precepted',
-    'precision-engineering',
-    'preclassic',
     'precomp',
-    'predannack',
-    'predeceases',
-    'predecided',
-    'predefine',
-    'predesigned',
-    'predestiny',
-    'predrilled',
-    'preem',
-    'preety',
-    'preg',
-    'pregardien',
-    'pregassed',
-    'prelavent',
-    'preliterate',
-    'preloading',
     'premastering',
-    'premeren',
-    'premi&eacute;re',
-    'premises-related',
-    'premix',
-    'pren',
-    'prent',
-    'prepar',
-    'preponderate',
-    'preponderates',
-    'prepress',
-    'preprint',
-    'prepulsid',
-    'prequels',
-    'presbiterian',
-    'presensitised',
     'present-opening',
-    'president-director',
-    'presidential-style',
-    'presidential-type',
-    'presidentialist',
-    'press-book',
-    'press-formed',
-    'press-release',
-    'pressa',
-    'presssure',
-    'presswatch',
-    'preston-based',
-    'pretty-boy',
-    'pretyman',
-    'prevue',
-    'prewarmed',
     'prezz',
-    'priapism',
-    'price-',
-    'price-marking',
-    'price-wage',
-    'price-wise',
-    'pricetag',
-    'prickett',
-    'pridenjoy',
-    'primadonna',
-    'primary-producing',
-    'prime-borrowing',
-    'prime-site',
-    'primi',
-    'primipara',
-    'primitif',
     'primodos',
-    'primorje',
-    'primped',
-    'princen',
-    'princenhage',
-    'principate',
-    'principi',
-    'principio',
-    'principis',
-    'prine',
-    'prinjolata',
-    'prinsloo',
-    'print-seller',
-    'printcache',
-    'pripet',
-    'prison-officer',
     'pritchitt',
-    'pritikin',
-    'prius',
-    'private-enterprise',
-    'private-property',
-    'privvy',
-    'priz',
-    'pro-chancellors',
-    'pro-competition',
-    'pro-coup',
-    'pro-crime',
-    'pro-ii',
-    'pro-irish',
-    'pro-mat',
-    'pro-monarchy',
-    'pro-privatisation',
     'pro-treaty',
-    'pro-vichy',
-    'pro-war',
-    'proam',
-    'proamp',
-    'problem-',
-    'probleme',
-    'proboscidea',
-    'proc&egrave;s',
-    'proceso',
-    'processing-',
-    'procom',
-    'procreated',
-    'procreating',
-    'procula',
-    'procuratia',
     'procureur',
-    'procys',
-    'proddies',
-    'prodraw',
-    'producer-consumer',
-    'production-orientated',
-    'productionising',
-    'produktie',
-    'professionalising',
-    'profit-earner',
-    'profit-share',
-    'profugens',
-    'progam',
-    'prognos',
-    'prognosticate',
-    'program-software',
     'programm',
-    'prohibitions-based',
-    'proivide',
-    'project-work',
-    'prolapsing',
-    'proletaria',
-    'prolog-2',
-    'proment',
-    'promhouse',
-    'promostyl',
-    'pron',
-    'pronethalol',
-    'pronoun-plus-verb',
-    'pronucleating',
-    'prop-wash',
-    'propagandised',
     'propagandize',
-    'propane-',
-    'properly-run',
-    'property\'',
-    'property-word',
-    'prophetesses',
-    'prophetz',
-    'propogator',
-    'propos',
-    'propoxur',
-    'prorogate',
-    'pros&iacute;m',
-    'prosafe',
-    'prose-poetry',
-    'proselytised',
-    'proses',
     'prosinecki',
-    'prosite',
-    'prosopagnosia',
-    'prosport',
-    'prostrates',
-    'protein-fat',
-    'protherough',
-    'proto-fascist',
-    'proto-feminist',
-    'proto-industrialization',
-    'proto-punk',
-    'proto-record',
-    'proto-state',
-    'protocad',
-    'protocols-style',
-    'protoconch',
     'protoctista',
-    'protools',
-    'protschka',
-    'prottas',
-    'prouts',
-    'provenancing',
-    'proving-ground',
-    'prud\'hon',
-    'prudenter',
-    'prudentius',
-    'pruneface',
-    'prusik',
-    'prut',
-    'pruteen',
-    'pryed',
-    'prysor',
     'psc-nfd',
-    'pseira',
-    'pseudo-community',
-    'pseudo-fascist',
-    'pseudo-learned',
-    'pseudo-peripteral',
-    'pseudo-problem',
-    'pseudoboeckella',
-    'pseudopolyps',
-    'psi2-nipenv1',
-    'psittacula',
-    'psk',
-    'psl-rebirth',
-    'psr1509&ndash;58',
-    'psr1757&ndash;24',
-    'pssc',
     'psus',
-    'psychiat',
-    'psyching-up',
-    'psycho-babble',
-    'psychoacoustics',
-    'psychohistorian',
-    'psychologising',
-    'psychosynthesis',
-    'ptang',
-    'ptashne',
-    'pterophyllum',
-    'ptolemaics',
-    'pu-abi',
-    'pub-owning',
-    'pubblici',
-    'public-transport',
     'publica',
-    'publicity-generating',
-    'publicly-controlled',
-    'pubsey',
-    'pubwatch',
-    'puccinellia',
-    'puddin',
-    'puff-pastry',
-    'puling',
-    'pulker',
-    'pull-along',
-    'pulled-back',
-    'pulli',
-    'pullin\'',
-    'pullman-car',
-    'pulsed-field',
     'pultneytown',
-    'pultruded',
-    'pultruding',
-    'pultusk',
-    'pump-handle',
-    'pump-prime',
-    'pumpers',
-    'pumpkinseed',
-    'punchdrunk',
-    'punched-card',
-    'pundijl',
-    'pupil-led',
-    'pur-pur',
-    'pur-pyr',
-    'puras',
-    'purdew',
     'pure-minded',
-    'purevdorg',
-    'purey',
-    'purisource',
-    'purple-headed',
-    'pursaude',
-    'purty',
-    'pus-cell',
-    'pus-yellow',
-    'puseyism',
-    'push&ndash;pull',
-    'push-down',
-    'push-up',
-    'pussot',
-    'pussy-cat',
-    'putnik',
     'putrescibles',
-    'puttermesser',
-    'puttman',
-    'puttyng',
-    'putzer',
-    'puzo',
-    'pvcs',
-    'pve',
-    'pvf',
-    'pvuii',
-    'pwllpeiran',
-    'pxg',
-    'pybba',
-    'pybis',
-    'pye-dog',
-    'pylori-associated',
     'pymar',
-    'pyo',
-    'pyocyanase',
-    'pyramide',
-    'pyramiding',
-    'pyrene',
-    'pyreneans',
-    'pyrotenax',
-    'pythoness',
-    'q-car',
-    'q-ship',
-    'q.r.',
-    'q1&mdash;q3',
-    'q101',
-    'q23',
-    'qag',
     'qashga\'i',
-    'qassemlou',
-    'qat',
-    'qeziot',
-    'qingdao',
-    'qirrish',
-    'qpbc',
-    'qpi',
-    'qra',
-    'qte',
-    'qu&eacute',
-    'qu\'en',
-    'qu\'ran',
-    'quadplex',
-    'quadralien',
-    'quadraphony',
     'quadratron',
-    'quadrophonics',
-    'quadruplicated',
-    'quaeritis',
-    'quaestiones',
-    'quaestor',
-    'quaffs',
-    'quail-hunting',
-    'quale',
-    'qualification-bearing',
-    'qualis',
-    'qualit&eacute',
-    'qualitated',
-    'qualtrough',
-    'quantiles',
-    'quantise',
     'quaritch',
-    'quarte',
-    'quarter-acre',
-    'quarter-back',
-    'quarter-miler',
-    'quarter-of-a-mile',
-    'quarter-page',
-    'quarter-rhinu',
-    'quarter-way',
-    'quartz-tourmaline',
-    'quasi-oral',
-    'quasi-sovereign',
-    'quasp',
-    'quatrefoils',
-    'quattrocchi',
-    'quedam',
     'queen-bee',
-    'queenspark',
-    'queenston',
-    'quenerduaine',
-    'querter',
-    'quesnel',
-    'questers',
-    'questi',
-    'questio',
-    'question-tag',
-    'quetzaltenango',
-    'queue-voting',
-    'quick-changing',
-    'quick-draining',
-    'quick-input',
-    'quick-march',
     'quick-response',
-    'quick-silver',
-    'quicker-thinking',
-    'quickset',
-    'quickstepped',
-    'quickwitted',
-    'quidquid',
-    'quiery',
-    'quiet-voiced',
-    'quilt-making',
-    'quilty',
-    'quimica',
-    'quinacrine',
-    'quinbus',
-    'quinoline',
-    'quinotaur',
     'quinquireme',
-    'quinspirus',
-    'quintek',
-    'quinten',
-    'quires',
-    'quodlibeta',
-    'qwrite',
-    'r&aacute;mirez-s&aacute;nchez',
-    'r&eacute;camier',
-    'r&eacute;cits',
-    'r&eacute;flexions',
-    'r&eacute;gions',
-    'r&eacute;moulade',
-    'r&eacute;pond',
-    'r&ndash;101',
-    'r-134a',
     'r-2000',
-    'r-lessness',
-    'r-squared',
-    'r.h.m.',
-    'r.s.v.p.',
-    'r101',
-    'r31',
-    'r342a4-c3',
-    'r4&ndash;6',
-    'r81&ndash;85',
-    'raarsa',
-    'rabi\'i',
-    'rabinovitch',
-    'rabo',
-    'rabs',
-    'racal-honeywell',
     'race\'',
-    'race-going',
-    'race-horse',
-    'race-walking',
-    'racegoing',
-    'racenights',
-    'rachmaninoff',
-    'racing-driver',
-    'rack-rent',
-    'rackliff',
-    'rackmounts',
-    'racom',
-    'raconter',
-    'radcot',
-    'radday',
-    'radial-arm',
     'radical-chic',
-    'radio-equipped',
-    'radio-microphone',
-    'radio-phone',
-    'radio-tv',
-    'radioallergosorbent',
-    'radiolarian',
-    'radiopharmaceuticals',
-    'radiotelephone',
-    'radiotelephony',
-    'radiusing',
-    'radjick',
-    'radmilovic',
-    'raeff',
-    'rafalo',
-    'rafeeuddin',
     'rafha',
-    'rafidain',
-    'rafiqul',
-    'rag-doll',
-    'ragheads',
-    'rahi',
-    'rahsh',
-    'raidion',
-    'rail-car',
-    'railborne',
-    'railbreak',
-    'raimat',
-    'rain-driven',
-    'rainmaker',
-    'rainproofing',
-    'rair',
     'raisbeck',
-    'raiseing',
-    'raita',
-    'raizure',
-    'rajmapata',
-    'rakestraw',
-    'raklli',
-    'rales',
-    'rallycross',
-    'ramangura',
-    'ramapo',
-    'ramar',
-    'rambo-style',
-    'rambusch',
-    'rames',
-    'ramleh',
     'ramnath',
-    'ramona',
-    'ramp\'',
-    'rams-horn',
-    'ramskold',
-    'randan',
-    'randstad',
-    'randtroge',
-    'ranevskaya',
-    'rangarajan',
-    'rangen',
-    'rani',
-    'rank-pulling',
-    'rankins',
-    'ranveer',
-    'ranyard',
     'rape-crisis',
-    'raphidonema',
-    'rapho',
-    'rapidly-expanding',
-    'rapidly-increasing',
-    'rapidly-rising',
-    'rapitest',
-    'rappel',
-    'rappresentazione',
-    'raschel',
-    'rashaya',
-    'rashida',
-    'rashidiyah',
-    'rasing',
-    'rasping-voiced',
-    'rassam',
     'rasterization',
-    'rastrelli',
-    'rat-at-tat',
-    'ratby',
-    'ratcheting',
-    'rate\'',
-    'rate-',
-    'rate-borne',
-    'ratecapping',
-    'ratel',
-    'ratepaying',
-    'rathcullen',
-    'rathkenny',
-    'rathong',
-    'rati',
-    'ratiocinate',
     'rational\'',
-    'rationem',
-    'ratler',
-    'ratm',
-    'ratramnus',
-    'raudspirit',
-    'rautsi',
-    'rauws',
-    'rav',
-    'rava',
-    'ravanel',
-    'ravelli',
-    'ravissant',
-    'rawl',
-    'rawplugs',
-    'rawsons',
     'raying',
-    'rayless',
-    'raynold',
-    'razor-edge',
-    'razor-slash',
-    'razor-slashing',
-    'razz',
-    'rbmk-1500',
-    'rcop',
-    'rd-930',
-    'rdas',
-    'rdbitest',
-    'rde',
-    're&rehy;imposed',
-    're-analysed',
-    're-announced',
     're-architected',
-    're-aroused',
-    're-articulated',
-    're-badges',
-    're-book',
-    're-booting',
-    're-boxed',
-    're-call',
-    're-cap',
-    're-capture',
-    're-coloured',
-    're-combined',
-    're-computed',
-    're-construct',
-    're-convert',
-    're-costed',
     're-count',
-    're-couping',
-    're-crosses',
-    're-dating',
-    're-depositing',
-    're-describe',
-    're-designated',
-    're-developing',
-    're-discount',
-    're-division',
-    're-double',
-    're-doubled',
-    're-embroidered',
-    're-emigrated',
-    're-energised',
-    're-enforced',
     're-enlist',
-    're-exposure',
-    're-fashioned',
-    're-finish',
-    're-finished',
-    're-fitting',
-    're-found',
-    're-frozen',
-    're-fuelled',
-    're-furbish',
-    're-furbishing',
-    're-gaining',
-    're-heard',
-    're-hearing',
-    're-heated',
-    're-heeled',
     're-homed',
-    're-ignited',
-    're-imaged',
-    're-imposing',
-    're-inforces',
-    're-install',
-    're-instituted',
-    're-jigged',
-    're-joined',
-    're-joining',
-    're-keyboarded',
-    're-keyboarding',
-    're-landscaped',
-    're-licensor',
-    're-melted',
-    're-mixed',
     're-mortgaged',
-    're-mortgaging',
-    're-nominated',
-    're-oiled',
-    're-orient',
-    're-orientating',
-    're-oxidised',
-    're-packing',
-    're-parenting',
-    're-peopled',
-    're-photographing',
-    're-powder',
-    're-purchased',
-    're-qualify',
-    're-referral',
-    're-regulating',
     're-scheduling',
-    're-scoring',
-    're-sentenced',
-    're-shuffled',
-    're-silvering',
-    're-slated',
-    're-sprayed',
-    're-stacked',
-    're-stall',
-    're-states',
-    're-sub',
-    're-suspended',
-    're-synchronize',
-    're-testing',
-    're-thatched',
-    're-tiled',
     're-touched',
-    're-tracing',
-    're-tuned',
-    're-turfed',
-    're-typed',
-    're-uniting',
-    're-viewing',
-    're-waterproofing',
-    're-weigh',
-    're-wheeling',
-    're-wire',
-    're-wrap',
-    'reaction-time',
-    'readapting',
-    'reader-accomplice',
-    'reader-awareness',
     'readily-understood',
-    'reading-lamp',
-    'reading-scheme',
-    'ready-assembled',
-    'ready-packed',
-    'ready-seasoned',
-    'ready-to-fly',
-    'ready-use',
-    'readyguide',
-    'reamplified',
-    'reanalyse',
-    'reanimates',
-    'reappropriates',
-    'rearraigned',
-    'reason-',
-    'reassigning',
     'reatus',
-    'reavealed',
-    'rebacked',
-    'rebaptized',
-    'rebinning',
-    'reboarding',
-    'rebolted',
-    'rebolting',
-    'rebooked',
-    'rebore',
-    'rebored',
-    'reborrowed',
-    'rebottled',
-    'recarpeting',
-    'recbcd',
-    'recently-bereaved',
     'recently-installed',
-    'receptor-',
-    'recessing',
-    'recession-beating',
-    'rech',
-    'rechendorff',
-    'rechristening',
-    'rechten',
-    'recieve',
-    'recklinghausen',
-    'recks',
-    'recoatable',
-    'recogniciones',
-    'recollapses',
-    'recolonized',
-    'recombinase',
     'recommittal',
-    'recompenses',
-    'recompress',
-    'reconceiving',
-    'reconceptualising',
-    'reconfiguring',
-    'reconfirming',
-    'recons',
-    'reconstructivist',
-    'recontact',
-    'recontaminated',
-    'record-making',
-    'recorded-delivery',
-    'recordership',
-    'records-keeping',
-    'recouperating',
     'recr',
-    'recreant',
-    'recrosses',
-    'recruit-a-friend',
-    'recrystallised',
-    'red-and-colour',
-    'red-and-whites',
-    'red-back',
-    'red-beard',
-    'red-capped',
-    'red-eye',
-    'red-pointed',
-    'red-us',
-    'redating',
-    'redaxe',
-    'redbeard',
     'redcap',
-    'reddish-orange',
-    'redeemers',
-    'redemptor',
-    'redemptoris',
-    'redenham',
-    'redescribed',
-    'redesmere',
-    'redfaced',
-    'redgra',
-    'redlined',
-    'redner',
-    'redoute',
-    'redrafts',
-    'redrup',
-    'reduced-alcohol',
     'reductant',
-    'redux',
-    'reed-warbler',
-    'reedling',
-    'reeforms',
-    'reekies',
-    'reem',
-    'reenact',
-    'reentering',
-    'refat',
-    'refeened',
-    'referent-modification',
-    'referrent',
-    'reff',
-    'reffing',
-    'reflating',
     'refloored',
-    'reflowering',
-    'refocussed',
-    'reforesting',
-    'refought',
-    'refreshment-room',
-    'refretted',
-    'reft',
-    'refuellers',
-    'refusin\'',
-    'regarde',
-    'regauging',
-    'rege',
-    'regen',
-    'regence',
-    'regestum',
     'reggi',
-    'reggia',
-    'regi',
-    'regilded',
-    'reginiano',
-    'region-by-region',
-    'regionalized',
-    'regioni',
-    'registery',
-    'regrant',
-    'regretter',
-    'regulkar',
-    'rehear',
-    'rehman',
-    'rehome',
-    'reiach',
     'reiche',
-    'reichelt',
-    'reider',
-    'reifezeugnis',
-    'reiksport',
-    'reikwald',
-    'reimported',
-    'reimposing',
-    'reimprisoned',
-    'reinagle',
-    'reincarnating',
-    'reindeer-herding',
-    'reinvaded',
-    'reinvestigate',
-    'reinvests',
-    'reisling',
     'reitzenstein',
-    'rekcon',
-    'reknit',
-    'relativising',
-    'relearns',
-    'relearnt',
-    'relegalized',
-    'releived',
-    'reliables',
-    'relief-agency',
-    'relief-giving',
-    'reliev',
-    'relig',
-    'religionsgeschichtliche',
-    'rellstab',
-    'relman',
     'relus',
-    'remagnetized',
-    'remarketer',
-    'rememb',
-    'remmelink',
-    'remontant',
-    'remotesensing',
-    'renascian',
-    'renckhart',
-    'rendezvousing',
-    'renesancni',
-    'renox',
-    'rensselaer',
-    'rent-a-quote',
-    'rent-boy',
-    'rent-paying',
     'rentoul',
-    'reoccuring',
-    'reoriented',
-    'rep&egrave;re',
-    'repa',
-    'repapering',
+)
+
+blocks_46 = (
+    '#%ryton#$tsch"-parin-binding$*tectomised#(pelwhite"\'r&ndash#&aclius$#ult#\'bertson#\'e&mdash$!n$"ro#(g&eacute#%ishef#%manos',
+    '$\'eticism#$ndon$#ing#$oin\'#(petology#+ring-curing$!n#*self&mdash$%hiser#%tslet##wig""sl$%erton#&perion#)senthaler',
+    '"\'terosoc"\'utenant"#wan#&erdine"\'x-nodes"$y-ey#%liger#!m$"er#\'ndrickx!#fro!"ge!$i-aa#%grade%\'o-filla',
+    '##nrg"#ace#"ng#&ticula""ba##bit#\'ernicus#%razil"\'ccoughy#(kathrift$$mott$+ory-shafted"#dab$"ge#"en',
+    '##ipo""ed#%rachy$$onym"&gamous#%gledy#-h&rehy;flying$(-acidity&$ngle%$back\'%roque%+cheek-boned\'\'urchman&*ompression\'%untry',
+    '%#hat%)inference%$life\'$ghts%#mid%$neck%&oxygen%$paid&$erch&\'olished\'\'tential&)rincipled&%urity%&relief\'$ward',
+    '\'"of%\'skilled%(thinking&#one($nage\'$rque%,unemployment%#way%*yield-bond$(er-speed%*st-average(&placed$%flier$.ly-centralized\'+experienced',
+    '\'(variable$&minded$\'pitched$\'ranking$&tailed%"er##ley#$rade"!i"$kmat#&urangi"#lat#!d#!e#%field',
+    '$$wood"$melf#%self\'\'!-"&nayana#!c$&hcliff#$dawi$&brains$-u-nationalist$$wing#"er#$gin\'#!k$!u',
+    '$&pocket#(pi-based$&ogryph$$uris#$sher$#way"(rundines""s-#%pania#\'tampica$%oires%#rex&\'icising\'$smus&"y\'',
+    '(\'related(\'writing#!y"&tchcox%#man#(hercroft#"in"!x!&jalmar".ulstr&oslash;m!\'la-dqa1%"r4&!b"#dgs!"ma',
+    '"!r"!u"!y!\'o-ho-ho##ome"*ary-headed##xed$#ing"$bbin%\'t-based#%dayed$#ens"$choy$$wald#&k-deep',
+    '$$neys$%ridge"#der#%gsoni#"ie##oul#!s"\'enigman#$rner"$ffer"&gamous#"ge"\'henreid"#ick%"ed',
+    '#!e$\'y-cokey"&lbeins$$urne#%craft#&dcroft$#in\'#,e-and-corner$$saws#\'imarine##ker#"le%%rbach$"ie%"ng',
+    '$&ywater&(ood-type#"ms%%troyd$$wood#(ocanthus$&graphs$$pics#.stein-friesian&$ntor#"te$$zman#)zhamerhof",me-developed%&market',
+    '%\'related$$body%%uying$$girl$%lodge$%right%!o#$inem%"um"%nesta$)y-hunting%$trap#$kers%!y$%ytonk',
+    '##sik#"za"\'oberman##die$&moulds#%gvelt#%ktier#!l#\'p-skirt##ses"%pgood"$rejc#"ie$0zontally-growing#)n-handled',
+    '$$lein$$wort$(y-handed#\'ologium#*ror-filled\'%story##se\'%)-and-cart&#cab&&pistol&&radish&\'shoeing\'*laughterer\'$weat&\'whipped',
+    '%%field$&zowski#"ti"\'se-down$&piping#%hiyeh##ken#!p$#ita\'%laria#$smer#$tier"*t\'n\'tender#%-film$*headedness',
+    '#"ek$(l-keeper&%owner&*restaurant#$hams#$pots"&ulding#!n$%dslet#%rquet#$sden$"e\'%%-boat\'$uyer&)clearance',
+    '&&keeper&&owning&(purchase&$sale\'"it%\'husband%0keeper-companion%&parent&%erson%&warmer$/ing-association$#lay$#sin#"ze"&vedene',
+    '$&r-taxi"&wgrave#&lingly#%seman"%xmark"\'ydenish#"em#!s!4radi&scaron;t&ecaron#"ir"$isto"#och"$voje"*z&aacute;n!#seq',
+    '$!g%"-i"%v-140""wa!-t29&ndash;19a"!k!(uanchaca##qiu#$rmey"&bayqah#$bell##cap#(ertushof#$land\'"er',
+    '#%kstep""da#/dersfield-based#$lass"$ffer""gg#"he"*ijghebaert#!t"%lcote##loa$\'y-gully##sta"&maines$,n-chimpanzee',
+    '&\'induced(&terest#$bolt$#rol##ors#*ped-backed$$ston"&napipi##der$*red-headed($watt#\'garoton#"ne#%t-cup(!s',
+    '$/ing-and-fishing$%ridge""on")p&ndash;3"$rroy##son#"uk"*s&aacute;k#"am#+band-father#%senot#$tles"+tchesontown#"te""ug',
+    '"&ysmans#(ton-born"#zza%#ing!#vac!&warang!\'ybrasil"*d&eacute;n#"er#\'noceras#%rides%#lla$)o-geology%%bates%$comp',
+    '%\'massage%*xybutyrate$"us"#ett"%ginus#\'rometer%"ve"\'lobates"+menophyllum#\'n-motet%&writer")oscyamine"/per-ventilating%(alkaline&*mylasaemia',
+    '%%games&\'raphics%$mall%$talk#"no%!s%$tone#)ochloride$\'dermics$-phosphataemia$.thesis-seeking\'&ticals#(sichides"%raxes#!e',
+    ' \'i&mdash!#\'le"#ver!+-calmodulin"#his""i-!$a(c)"&nnella\'!i"#opa"#sco"!t#)rochemist!%beris"!g',
+    '"&mspeak"(roblasts"$sley!#cad""ca#!d#"pr"#dma"&e-berg$%cliff$&desert$\'fishing%#loe$%screw%%kater',
+    '#&fields#%house#!l#%scape$#tar"(hnobates"#ifi#(ng-sugar"!k#&lesham#!s"\'l-kmecs#!r"$onix$\'ostasis',
+    '#"ic"$sitm"%tinus""yb!)d-impulse"$ared""cs""do"#ea\'#&nticar&#fed&,ty-formation#&ograph$%motor")oxuridine',
+    '"\'umaeans!"eb""cc"\'rusalem""sg"!t#!f"!w"$yasu!#f\'t"&-onlys"#ema"%fyish""id"!o',
+    '!\'gbp-dis"&elfilm"!k"%lesia"#man"!w"!y!$have""or"!r"#san!*i&ndash;vi"$-iii""cx"$i-iv',
+    '""mr""pa""rc!#jma"(sselmeer!#kat""bs"#oyi"#ram!#l-4"$bery"$ewin"!f"$hamy"!i',
+    '""ka",l-controlled$&hidden%%oused$$kept$(recorded$&shaped#$mitz#!o""tf"#ych!%mage-&\'editing&&schema%&studio',
+    '&$eers#!z"%biber#&ricate""ee#"mo"+f-supported")ino-imino"!j"!l"2m&eacute;diatement#*aterialist#"ed#&obilon)"-p',
+    '#+unoalkaline&\'blotted&)chemistry&)detection"%otski"%pacto\'"rs$$sted#&eriali(!l#%lodes#$orta#-rovisationary("es#&udicus',
+    '"!r"!t#"ec""vo!\'n&ndash"%-bond#&charge$&ircuit$&ockpit%%llege%%ntrol#"ex#%flood##out#$play',
+    '$"ut#)the-round$#own",achev&eacute#!n#*rticulated##sti#$vase"#bio"\'c-owned#"an%%desce%!t&"ed$#rio',
+    '#*entivising$$pted#%hbold#!i#%lusio#.ome-generation\')producing%*prehending$,nvertibility$)uragement"%deces$/p&ecirc;ndencia$-x-replicating#)ian-brave\'%style',
+    '$$epop$$ting$*vidualises#-o-bangladeshi$&cement#\'pendent##ris#!u$+strial-type(#els\'"y\'(%-type"&edited",fant-feeding&"as',
+    '*#ing\'"ne#$elix#"in#.lation-risking#%oplus$%rmate($ion-,\'bearing,#led,&packed$#tel"%gaged##ela#)helbrecht',
+    '&!i$#ish#$ored#$rain"$haul"#iap##tia%!o$$mate"#jur%(y-ridden"(k-filled#/atha-controlled"\'landers"$mark',
+    '"(namorato##er-%$lash%"st#$site"!o"%padoc#%rints#&sector#,ut-impedance"#ria#%ushes"(sentient$\'rt-note&,ion-deletion',
+    '\'$page&#out$.ght-generating#\'olubles#(pecteurs\'#or-$\'iriting$!s##tan&,t-by-instant$$itue\'(tion-led$#one$*rumentorum#.ulin-dependant',
+    '()requiring(\'treated$$race#$wing"#t\'l#$egra\'"ph$"ll&%iport%!s$%ndin\'$.r&rehy;mediate%$-alu&&change\'+onfessional',
+    '&$fund&&letter&$node&\'project)#ton&$rail&(stimulus&)vertebral%&breeds%0changeable-blade&,ommunicating\'.nnection-based&#rop\'$ural%&dictor',
+    '\'!t%$est\'($ing\'%.face-compliant&%luves%%hotel%\'leukins%(marrying&(ediating&"it%*nal-market\'3tionally-recognized&\'egative\'\'t-based%\'polates',
+    '%#sel\'$xing&%ource&$tack%#tel(#com%$vent\'\'rtebral$"xt#(ra-state%%brand%)cellulary%"da&"en%%stats',
+    '"&veighs$#rie%%lochy#2itro-fertilisation"+ward-turned!#ogt!%pecac"\'higenia"#lib"!p#!s"%senta"!u"$wich!"qa',
+    '#"zu"#cam"#f-2"*idologists#+sh-catholic"!l")on-centre%%oxide%&railed%(smelting$%bound$$fist$(mistress"*reg\'larity#%upted',
+    '"%telli"%uhito""ve!#s\'t"%am-xa$!u#%urian"#hed#!i$%bashi$!m##oka##rat"$idor"!k',
+    '"(lamicism%\'ophobia$&nd-arc#%esmen"%maeli"&nardia"(ometrics#*proterenol#$tron"!p"3raeli&rehy;occupied"$salu#!c##mfe#!n',
+    '#"ro#!y"#tdc#$oria!$tacs#$gaki#(lbrokers$,ian-designed($ness((speaking\'!.\'(american\'"er%!e##via',
+    '"#her"!l""mi#!k"(o-yokado"!p""rc"(sy-bitsy""tc#$ehad#!i"#una#!s!$udex"#ris',
+    '%!s#%novic"!b"!d"$enel""ry"\'y-grown!#wai"$ould!&xxviii!%zabal"%ekial#$nour -j&auml;mtland!*\'attendrai',
+    '"!6"$bass!(abaliyah$"vu##bar"\'chowicz#%karoo$%manii$$nife$%owska#%obin\'$%vitch"*de-working"%eckel"#far',
+    '#$ging")ilbreaker"$mbes#!c#$eses$!t#!i#$jars"%naway#$eway#%honen#"in#"ko#(mabhoomi#!u',
+    '#"ya"\'pansese#&onicum"#qui"(rdiniere#%falla#$icot##net##oss#"va""s.##sem#$want"%vagal#\'ictreva',
+    '$!n##box#%lines"%yaram##dee#+emdoubleyou$!s#$hawk#%swood##tex"\'zz-band%(musician!"bc"!l!#ccu',
+    '"\'an-clad$%nerod$&s-clad""ck"$ezus"(hoiachin#!u".jeunoileostomy"#kou#$ylls"*lly-filled#&toksan"&newary#"ik#&ninger',
+    '"$psen"$rada#!i#&kwater#%point#&sualem#$vois"&ssiman"(t-engine$$pipe%)ropulsion#"ez#%print#\'setting$"ki',
+    '"%w-boy#&elling&!s#$ison"(yaretnum"%zreel!"gm!(harsetli"!b!%iacha"$bing"$caro"%ggers")hozapadni"#lin',
+    '""na#!e#"gs"$pona"/rat-wasiutynski""sc#!h"&ttered""ul"#ved"#yeh!"mi!"nc"!o!#ob\'',
+    '$,preservation$(shedding#!b##ete#$hunt")ckey-club$"us"#gia"$hnen"$ides#$nter##sey"&kanaan"!l##iet',
+    '"%nesey#"ti"!p"#rio#"ja#!k#%rocks"%skiss$"ow##nau#$pice"(urnaling%#ey\'\'$-men#$sted',
+    '"#wly"#yed##lon!#p-6"!e!$tfax!#u-i#"ju"(bbulpore##ran##ula"!d#%ge(s)##iac$%catam',
+    '*!s"(g-handle#&ements$/ndf&uuml;rsorge&)herbergen&0wohlfahrtsgesetz#,ovi&cacute;i&!c"#han"%illet"&lianus$#eta#.y&ndash;august+(november"$mani',
+    '#$p-in$%start""nc#%glist$"st$$volk##ije#&k-mail#%sheng#"zo")pp&eacute""ri##kic#!o"$sque',
+    '$#-so$$avus$(iceships$!o".xtapositioning 4k&aacute;rm&aacute;n#,uml;seplatte")ouml;lbel(#ner\'-niggr&auml;tz*\'skinder+%marck"+uuml;hnpast\'%nster*.lervereinigung',
+    '"%board"!k"(selected!#.h.!"24!&a-boom"%baddi#&balism$"ia#"in#$ylie"$chru#"in#"ou#&zmarek',
+    '$$oumi#&reddin"\'goshima##umo"$huku""im##roi""ki#"oo"#lam$$ndra%"oi#"ed#$isco#"le',
+    '%#ste#$nins#"pa#$yvia"$mari$"ta&"ka$!u##iah$$lish$#ner#(p&ecaron$%elman$#ong"$n\'an',
+    '$&naskis$"ta#*garoo-skin$#hwa$!o$$wana#"iu#%koila#(t&oacute#&wisher"#oru"%palua#%lanis#"ow"&rabagh',
+    '%"we$#kul$%tzias$&wanken#$ezza##gbo$"er##iel$$kari$#uki#!k$!s##lie$#son#$mali',
+    '#&nofsky#&olinka#$poff##rar$"on##tuz#(unaratne&\'tilleke##wal"$sama#%hoggi$%ubian#%ikopu#%kelot#$sapu',
+    '%!n##tri##uga"&tharin$$rine##sav$$huda$#uru#%ydids""ub#$fhof##nic#%zmann"#van"!w',
+    '$!k%#ubo$&rimono$%sakis"$yoko"$zan\'$#tin#"ie!"ba!"ci!"df!$eary""ck"&dourie"\'el-haul',
+    '##mun#\'nlyside$!y#%psack#(rsmaeker"*faloyannis"#ich#"go#"no")k-kek-kek"%labit$#har#\'f-cohen##lar$"ow',
+    '"$meny#\'penfelt$"pi$#ten"#ngo#%jutsu#!n$%aways#%setsu$#ley##tia#(yan-born"%ramik$%titis#&b-side',
+    '##kut#&nighan$"ow#*ouac-style##pow#%runch#"se$!h%#ope($foot$#ten$$wall#%tzman"(sparates#$sell',
+    '%#ups#&onuria#$sugo#"te$%leful#$ziot""un"&y-rack$)signature#%block$"uk#!e!"ha##bar&"in',
+    '\'!s#)chaturian#&irulin#(ki-green#&lichen%!s$"qi#%ndker#$rg-5##zen$!i"!i"$list"(olstyler#&meini.',
+    '#)rnerstone#$sana$&htaria"#ran"(udozhnik#$lafa!(i-maasai"%amtia"+ck-and-rush%(starting$$down$"in%!t"$dner#$skin',
+    '"$goma")k-kik-kik#"ka#!o"*lakuldilok##car%"sh##der&#kin##een#!i$)&aacute;n$$mnik#)l-or-cure%(pricking',
+    '$$deer%$ozer$%eavey$$oran#%marie$$urry##tex$&makers$#urk"$mata#*berlyclark#\'ometres#!s"(nd-faced#)emakolour',
+    '$!x#(g-making$!a$!e$%oonya$(sborough%%ferry%%ridge$$well#$kies#"na$$egar&!o$$ings$%ockic',
+    '#*ship-based##tra"#oni"#pes#%pered"#rch%!e##gan#%kgrim$\'whinnie#\'nberger#&ovabad#%steen#!t##van',
+    '$#oon##ter"*tchen-maid#$hara#$kats##man#&telman$,i-wa-a-a-ake#!y#(zbuheler\'\'lerhorn!&lamath##tch#\'usovitz#%vdiya',
+    '#$iger$&nworts"%iment#)norhynchy"(ondyking#"of#"pf#(sterbrau!(nabbelen$"en#)cker-meat##zno""do"&eebone$"se',
+    '")ick-knack%*er-elastic\'(bockered##fe-&\'creased#,ght-errantry&%rider#)tting-bag)$wool"*obelsdorff#(ck-knock%#dhu&"ow%(loughrim#"pp',
+    '%$hole#*w-nothings$"ed%!n$!l%"er%#sey"%udson##fns#$llar!#obo"$chel"\'dacolor$!i#"ra',
+    '#(nigswald##pke""gu#"yo"(hlrausch"#ian""ji"\'ki-teno$"ne"$lbin#$esar#&lontai#$odny$+n&aacute;ki%!e',
+    '$"to#$bayi$$inat#(mandatur"#nak$#rak#(frontasi#\'inklijk#$kani#%quest#&sthall##tic$#uly"%opman#%shies',
+    '##pel""rc$#ula#!f#!m#%nelia"%ssovo#\'tadinov"#tka#$male"\'udjolou"%vacic$"ks"!w"%zelsk',
+    '!&p&ouml"!k!$raak##cht$!k##fft##its#&jisnik#$nder$%idion$$zler#"se$"in$$naia%!y',
+    '"%ediet#$eger#\'glinger#%igler$$sler#\'ssbronn"%iegel#%shman%$naji$"py""ol#\'nheimer#"op"%povic"$uesi',
+    '#%mhaar#"se$#kal"#ynn!#sbs!"to!&ubacki$!t#"ik""da"\'endiger"$guru"!i#(per-belt"&kanjao',
+    '",lcher-babble#$ture"!m##bha$$ukan##iss#"on#!p#$quat"$ndra##lun#*stakademie%*geschichte\'+werbemuseum%$hall',
+    '"!p#%olati#$pner"%ranty##ils$%sches#!r#"ta#(ukshetra$"me"$shan$"ti#$tar\'"%tenai#$nick',
+    '##ubu"*waiti-flag!)v&aelig;g"#eck!$wark"#ick#)etniowski#%kcoat!%ybosh"#dds#$land""ng"#phi"&riakou"$sela',
+    ' 1l&auml;ndlerische",eacute;gende)$once)$pine)$rina#)ogon;bork"+ndash;1049h(!c"*ouml;rincz")uuml;tzow!*\'&acirc;me#*eacute;tat#(icirc;le"&actuel#$dieu',
+    '#&utobus"#cha"#eau#\'scalier$%tampe&"te%.h&eacute;tique"3ind&eacute;pendance"&oiseau#+rganisation$%igine!"-5"%amino")carnitine#"el',
+    '"$form")glutamine")histidine"&lysine"%month"%plate"$year!#.st!"50!#600!#853!$920s#!9""64"#80s',
+    '%$-ing"#aaa#"ch"-b&egrave;ques#$-tek#%badia#\'el-less#%ianca#$orde%#gie%"it%#lux$+ur-contract\'$hour&#ish',
+    '#%quest#%ridae$$okes#%space#$view#)yrinthian"#ce-$$ward#!h#$ipil##ken$$ford#(l&eacute##que#%tates',
+    '"%dakhi#*der-backed$#ing##eco$!s#%islaw#"ra#&ycroft"#eti"&fargue#$fite#$itte"$gant#$ered#$gers',
+    '#"ar%!s#"ey##ure""ia#&gwenak#!m#%resse%!t"%jpath"&ke-bed$%water%$oods"%levee#&lemant',
+    '"$mark%"re$$sery##bed%#ncy$&orgini$\'s-style$!y#\'ingtons##our#$pang$#kin$%sacus%$tand)!s',
+    '#!u"&ncache%"ut$+e-corporals%%field\'"sh$!y#&d-army%$girl&$rant%$mark%%using$\'aulette$&erbank$"ow',
+    '$&scaper&#ore%$down%$tone$$wehr#*e-changing#"ga$#bar$(ebaanweg%%markt%!n$%rishe$$slow##iel%"rs',
+    '#)olin-free#&server#+tern-bearer\'!a$!o$%sbery##vin"%o-tzu"$quer"#rco#*ge-company%,sse-spending$$otim#%kwood#%rabee',
+    '##ter#%uette"%santa#%chemi$#ube#!e$&r-disc&#lit%#fix%%print#*h-building%"up#"ic##ken##mac',
+    '%%night%&second"&tarche%#jet#"e\'$&-1970s%#80s%&picked$#xes#$illa$(namerica%#ity#!o#$rigg$#obe',
+    '#$zsch"#uch#%daair%!s$"on#%ghlan%*ter-filled##nce#&rentis%#tte$!i#+sanne-based##ter"\'va-lava#+ender-water',
+    '$&rbread%$gnes##ier$"na"&w-suit#"is#%ncare$&mowing#%yerly""xa#"on""y-$&abbacy$&reader#$away',
+    '#\'er-cake"&zarite%&ovitch#"im#%onick#%yitis!"b-!#cao"!i"!t"!v!#e\'f"&achman#)d-managed&$iner',
+    '$-er-in-waiting\'\'manager#$gach$#ued#)p-frogged#+rn-by-doing%)ing-curve#)seholding$!k$"or$)t-studied#)ther-work\'#ing\'%necks#"ys',
+    '#&enberg#"ow#$rock"#cco#%hmere$#uck#&ointre$#nto#*ture-based(-demonstration"&debour#\'gerwood#"ro""eg#"ke',
+    '"!f#+t-and-right%$ward%\'zionist"%gacy\'$%gneur$#ted#$ende#$nani#$over"$hder#"rs$#ter""ia##big',
+    '$$heit#%ghlin#"ne"$kule"#mhi#(on-juice&$peel%$ades#%pertz"#nci#$drum#$glen$.th-to-diameter#.iently-treated##man',
+    '$!i##tin&"ue%#zol$!o$#soe#"zi"&odegar#\'nardoxa$&tiades#)pard-spot#+sothosaurus"+pidopterist$#sma#$pert',
+    '"%queux"$rach##ici$#ssa#!n$!a$"ea##uez"%scaut#"er#*ion-making##lee#*s-educated%%stiff%*well-known',
+    '$#eps%&r-used##tai""t-#"ch%#ely#(rastudio#&taford%#ure$-er-collection\'(position&!e&%forms&$land$"ie',
+    '$&openia%%rodia#$luai"#ved$(lling-up$$ntis$$sons##inz$$rate$#tan&#tes"\'wkenors"\'ylandii!$gtbs!#hda',
+    '"&abilty"(beracion&*l-humanist(+nationalist(\'radical%%chies%$tyes#-rary-produced($user$+er&iacute;o")chenstein##k\'t$&barrow"#dho##uid',
+    '#%bling#$kkio#$nart#!r#&sbosch$"el#2ut&lsqb;enant&rsqb""fa#\'e&mdash$!\'$%-boat%(deciding&&rawing%%eater&*ndangering',
+    '%\'pattern&&urpose%$rent%$year$#pan$(spannode($task#$t-on%)right-leg$#in\'".ght-controlled\'$ured&$food&%green&\'railway',
+    '&$show&"up&$well%%bound%(cnsttype%#in\'%#nin#"ia#$ozzi"$itto"(ke&mdash$!\'"(lac-pink#$ihan$!s',
+    '%$sand$%ycups%#man#%stock#)y-covered%$pond"#mah##bed#&e-soda%$wash$&flower$#nas$$wash("ed(#ing',
+    '##ina$"te#$mack#$ners$(ocalanus#%onium#$pars"%naker#$beck#(cs-based#%desay$%quist#*e-breeding%\'drawing%$mode',
+    '$$s-up#*g&aacute;n$!a$#ley$$ones#*ked-skills$%oping#&lathen##nen#)o-covered$#mat$)type-hell#%sdall$$halm$$trum',
+    '#$well")on\'s-head$$head##ret"&p-hold#!a#)idex-deap#"pe#&schitz%$reen$\'ticking#$tons"$quer$)id-helium(\'ydrogen',
+    '"!r"$sant#&bellaw#%elund#!i#&pworks#$t(s)$\'-making%&priced$(ening-in")tichevsky#\'lington#$olff$$rius$"st',
+    '%%rbugs$&le\'uns&(-studied&$cott&$fair"#uba#&dprand"*ve-storage$#_up$%rnash%%poool#\'ing-out$!o#$onia"\'zabette',
+    '"(ubojevic#%devit!(lamatron"$enor"$huyd"(idiardau""ma"%oreda""pm!"mb""gs!$oad\'$$high#"fs#&n-note',
+    '"*bectomised$#tta#&wasser",cal-currency&(interest%$ises%\'ly-born%$talk$!s#&h-side$"ee$$inch$#lea$#ore#&k-down',
+    '$#art$(smithing%&pieser%(titching"&dewijk$!y#!g$%istix#!y"&effler##rke#$sser#"ws"+g-normality#!.',
+    '##sys"\'hmiller$%uller#!r"#ibl#)mographia#(nclothed#"pe#-re-atlantique"$kris$"ou"#las#%loped"%mbank##poc',
+    '$&on.the&$beat#2g&rehy;established*&winded$%-bond\'!w%"er%#hop%$lens%\'muzzled%$note%*prayed-for%$spun%$used%\'weekend',
+    '$&botham$%dwell$,er&rehy;term&!-%,st-surviving$$jing$&liness\'#ing$$mate$&streth$%ueval$$year#"ja##ley",o-oo-oo-ming',
+    '$"in#&pholed#*se-flowing\'&orward&#lay&%woven%$coat#$tin\'"%rence$!s#%imers#"ra#!t$$zing#"us',
+    '")sabezidze#&s-free%*of-coolant"\'tharios$$idok#"is#"os#"ti%(zzazione#)us-eaters"(ud-mouth#+ghbrickland%#man%"ts%$view',
+    '#*nge/dining#%rdais$"ed#%siana%"ng"+v&ccaron;en#%e-act&"ll%(carriage&$heat%,relationship%&sonnet$%lidge%$ocks$$rboy',
+    '$!t%!h#"ro",w&rehy;lying)\'scoring#*-amplitude$&backed$&church$&degree$)impedance%$nput$#lit%#oad(#ing%)uminosity',
+    '$"no$&placed%)reference&(oduction$+reflectance&$lief$%smoke$&theory%%orque$&weight#*er-calorie&\'echelon%$hope$*st-calorie#"ie',
+    '#%thian"%yonel!#pbg!"qr!#ram!+s&mdash;mgr"$-api#&dyna3d""ca""es"1live&mdash;cc1234"!m"!p""wr!#tda',
+    '!"ua"%cania$!r$%sfilm#$erna#$hino#\'iferase#%ullus#\'y-woosy"&demann$!t#%lowii##mer#)ovicianum\'"us',
+    '#)wigshaven\'&trasse")gdunensis&"um#"ol"&ialamo"*kewarmness")mberjacks$(ricoides#\'icolour$%naire")nantishee$$rsee#"di#&g-full',
+    '#"ts##ula"$pone"%rabus"%satia#"he#&tbader$"er$$orol$"ra"$teus""ve#%verly"-xembourgeoise&&urgism',
+    '!#vfa!"wr!:yc&eacute;e-coll&egrave;ge#\'ra-clad"#eth"#lye"&mmener#(phoctyes"#nsk#&x-eyed")ophilized%&ylised"$sing$&ppides""ve',
+    '#*ring;lselv"3eacute;c&eacute;nat*$hant)+l&eacute;ra*%usine)%moire))salliance"\'ouml;et"*ucirc;ller#*uml;hlfeld\'\'nchener(#ter(#zer!&\'barki"#goi',
+    '"\'learned!#-11""29"!4"$8000##600"%f3670"(m-memory"$tasc"$word!".a!#100!"22"!4!"30',
+    '!$6100!"a\'""aa#!l#\'svlakte"%balub##but##ior#"on"#c-1#&adamed\'"ia#"er%%ating#+hicolations',
+    '(\'franked((learning(&minder(*to-machine(%woven#.intosh-on-unix#%lenan#!r$!a$)o-cannons%%scope"$dain#$chen##ely#%hukar',
+    '#!l#\'rigalls$#one#!y""en##tia"$ffeo$#ord#$remo"%gacad$#dan$*zine-style#&delene#"er#!h',
+    '%"ks$!n$$stri#$lite#&naflux$%etise)!s&-ostratigraphy#"oi$"ts#%store#\'uelonne"$hany#%bubur##eux',
+    '#"it##lon#%mudul#)ogany-red$\'mmedans"\'ibozani#+den-thought#&l-coat%"in$$base%$oats$(ing-list$$sort#"n-%&course',
+    '$.frame-resident$!o$&s-type%$ails$&tenace("nt\'"on%&stream#%occhi#&straki#$trey#%ziere")j-general#$bari#%endie',
+    '#&kowski#$luta#+or-accident%#ese##uba""ka$"ha$#nge##eum#%hdoom#"ka##mur#$owka#$rana#%uhari',
+    '%"ie$!k$#las$$muth$&ncourt%!g$\'propism$*ria-ridden$"ud$%yalam#$bork#%comia#&gaches%"ra$(r&eacute',
+    '$$mbus#$kiel#&lalieu$#ock%$rcan#\'pighian#\'shanger#$umba"&maluke##bro#\'illated$$raua#+malian-type%"me$#ies',
+    '",n&mdash;that$+oelig;uvres#)-computer$$hole$$jack$,of-the-world#0agement-employer&-r-subordinate\'%esses##cho$&inelli$$uses$!y#%daean$\'elbaums',
+    '#)gelwurzel$%wende#$hant%*ttan-style##ica&$land%&motors$#ere$\'manakis$"sh%"ty$$tski##kin##man#$nage',
+    '##ola$#uzi##ses$$tral#$tara$(el-piece#$uell$"ra#$xmen#"y-%(branched%(electron$#ana$$down$"on',
+    '#%metto"0p&mdash;username#!a#"ic##ple"(quillage%#mat"\'ramures#\'bleised$"od%"re#%casse$%heini%#ois$&kesano',
+    '%%vitch#$dles#$eham$#lli$$ndaz&"ic#%fleet#&gareth$#in\'&#ing#,i&aacute;nky$$achi%#mne%$rchi$)d-related',
+    '&#tal$"la#\'k-space$"el%1t&rehy;determined&)-building\'\'economy\'$rate\'&sector$\'ing-out$"ku$#owe$%stadt$\'tkirche##lan',
+    '$"it$#ora#&ocaine$%oning#*quandistas%"et\'$erie#-riage-broking%!e$&owbone$#yed#$saud$%haled\'%lagia("er',
+    '#&tandem$$enot$#ham%$inus$"ii%"ll%&npelto&!u#*uli&cacute$!m#&xisant#%ygate$+l&egrave;ne"\'sa-idah$#aki',
+    '%"ro##dit$"us#\'herbrum$#had$%ishka#%istes#\'lakhaty$"en#(s-acting%\'balance%%going$"ai%"la$#ena',
+    '%!n#$ter\'&*-carpenter((raftsman\'\'general\'$work&%batch&$knit&%match#%vengo"\'tch-box&&fixing&&making%%girls#)hematicks',
+    '#"la#&ochkin#*rilineages%%monii%#xes#%sinhe#*thew&mdash$$less#%ullah$%shita"&ughams#$lden%"in##nby#$peou',
+    '##the"%vlyet#"ro"&x-vp16#\'i-yacht$)llofacial$\'millian&&nianus%!o#"on")y-blossom##bin#!e#%ibuye#\'negrain',
+    '$!h"#zag#$elle##ing##ula#%zetti!&banefo"&engono!*callisters"%brien"&kennas"%nairs"&queens!)eadowhead&$lark',
+    '#$lies#)n-mouthed%)reverting$,ing-capacity#"ra#)t-cleaver%&packer")cca-based#$hale%%nicae\'$zing&"us$$elin#!s"#dan',
+    '$\'uschule#%dowes#$ecin#"ha#(ia-based$\'calised&$ting$!e$$sing$"te$*um-density\'&income$$zers#$noye##off',
+    '#$tech"#eee#&nameen$%ister#"ow"%fitis#"ti"+g&egrave;ve#&a-flop%&merger&$outh$%byzos$$disk$$flop$$kles',
+    '%&roject$\'sthenes$$tech&"st$$word#"he"$harg#!u""ig#\'klewood#\'llasoux#$neke%)rtzhageni$%tjies#"ra',
+    '"#jka"#lan#%carek#%ikoff$$nski$#ora##l\'o$!i%$font#$moth#&odeyen%"ia&"ya$)psittacus##ver',
+    '"$mbre#&co-med#*orialising)#zed&!e\'!d%(y-jogger#&sahibs"&nchini#&daloff$$elow$%icity#$eely$!s$#zes',
+    '$!s##hir#\'ingitus##ken#&nonite##san#-u&rehy;driven#&ziesii"#ole#%nware#"ws"(peridine#\'henesin$#ile"%rauke',
+    '#%becke#\'cardier$!h$#iar#&ehurst$$trix$&wether##ica$"em$#mee$"se##ker$#het#$lion#(mecolion',
+    '##rel$!i%$mack$\'y-faced%%maker#\'seycats#!y"%sfets#*l&eacute;e#&merist#$neux#&ocaval#&s-room$+age-sending%$lina',
+    '#&trinho%$ovic",ta-discourse%(language%)narrative$,alnijverheid$(l-bodied&\'covered\'&utting&$free&)to-ligand%%heads$!m$*psychology$\'stasise',
+    ')$zing&"im&)rongyloid-#sis$(thelazia$&vision$"xa&!s#$hogo$2ylation-protection&*prednisone##ics##our#\'ricated$)o-vickers',
+    '%\'nidazol&%ymics%$plex#&twurst"%ubles#\'lenhoff#\'rdesoif$!e$"on"$wled#"se"$xome"!y"#zes#&imesti',
+    '#(zo-forte!#gco!$hara!$i-17"*chaelhouse%(lczewski$$elob$%oacan#$keen$\'lewhite$"ry#!o$#nia#-ro-electrodes&%hydro',
+    '\'#esh&&states%+climatology&,omputerbased%)dissected&#ots%#eye%"ft&$ungi%#gen&#ram($phia%+instruments%#log%\'nodules',
+    '((ne-level*!.*!d&\'roducts%\'scalers&$kirt&$ofts%#tec&%ubule\'#rbo"&d-1933&"40\'!2&"62&"73',
+    '&"96$(antonine$$bend$%cycle$\'extreme$1fifteenth-century%&orearm$-range-to-unix\'$king%$ound$$shot$%track$$wail#!a#%class',
+    '\'&middle\'$tier&!d&&sbrugh#"em##hir#*night-dark%"te#\'orikawa""ee#(szkowski#(tkaserne"$gele#\'matised##not',
+    '#-aljevi&cacute"$king#&kelsen#(rokosmos%&skopie##tat""la$"ge$"mb$#tos#&ch-cow%"an#%foils#&iangos$-tary-civilian',
+    '#*k-and-meat%(bottling&%uying%%crate%%yield$!a$&crates#%l-dam$"ay$#bay$#dam$%enary%$rson%\'t-i-rum$%hands',
+    '&!n%#kan%&onfold%%pored$$pool$$side#"ns#3o&scaron;evi&cacute#$town"$meme##ram""n\'##ces#*d-twisting$%blast',
+    '$%voice#$eola$+ral-bearing(%water\'#ise$!t#\'g-style#*i-business\'$tton&#yte%%crash%*exhibition%$hero%$moke%\'network',
+    '%$town&&riumph&%unnel&!v%#uzi%&vision$#det%$isks$#ere$)freighter$$mesh$%phone$&scules##kie%!n',
+    '#%siter#&t-name$#aka##uit$(te-taker%#ing#!w"$pmip"*r&oacute;n#&a-type$%bello$!n%"do#"co#%eside',
+    '#%kwood#$oglu#*ror-backed&#man&$soft##sad%!l#%zoeff",s-attributed$\'casting$(directed$%fired$&kicked$\'managed$+represented',
+    '%%tated$-understanding+#ood#!a$(llocated#*calculates$,ommunication#\'guiding#"ia$,ncorporation#*patterning$$lace&"ys$)ositioned#(remember',
+    '$$uled#.sissippi-based,%style$#oni$%tated#%typed")thradates$"un#!s#(telalter"(xografia"#yah"#zen!)kolongolo!&lphare',
+    '"#isd#"ts!$nbdo"#did"(gomezulu"(ouchkine"#tks!&oakley#"ny##tti"%barez#,ile-response##ray""ca#(chegiani',
+    '&&talian%\'stealer#$roft#&tezuma"(dacrylic#"dy#&em-day$(rn-built#"ha$#ish#$otti#)ularising%/es&mdash;online"\'elleman"%gdham',
+    '#&gonisi#$ilny#%urnda"%henjo#"on"%iling##rae##vre"$ksha"*lasse-type#$ders##ech$%nbeek$!x##ing',
+    '##las#$okai$!n#"te#"uf#%ycorp"-n&ndash;thurs#\'achorum$&rchian%$flex#(bazillac#&chique#$dino$&schein##eda',
+    '$(y-center%\'grabber%(spinning#"ga$#iat#&ikered$(liformis$"tz#*key-wrench&&wrench$(ton-hall$$wray##not#"o-%+unsaturates',
+    '%"on$$makh$\'physite%)lane-type%%rints$&theist#%santa$%errat$&ignors$\'ter-god\'!a#.t&eacute;clair$\'agnards\'!y%%illou',
+    '%$uban&!k$\'bartier$%clair$\'efeltro&$iori%$ndre%\'pellier%&sdeoca%$viot%%zumas$\'greenan$%h-end$#val$"xo',
+    '%\'lifting%\'setting#"ey#\'n-white$$dork$%eyhan$\'lighted#&rlynch$#man$#see#(seburger%%heart$!h"(p-headed#!f',
+    '#$abit$*le-sapping$"ni#&chella#"e\'$--than-willing$#lla$"mi$%oever#&gannwg$&enpost&#sen$#ner$#oth#"is',
+    '#*ning&ndash\'!-#*occan-born$"ne%#giu%$ised$"ti#%phing#&ricone%$ston$"oc&#can#)tgagesure$!o$%uorum',
+    '"\'saicing##cou#"hi#"is##ler##ner#&sadegh$%bauer$"ed$$gara#\'zkowski"\'tacilla#(el-style#*her\'s-help&*-and-child',
+    '\')goddesses\'#hen\'*substitute&$dear$$wing#&or-bus&\'powered&%voter#%teose""uf#!l$&inette#!n$"dy$+tain-biking',
+    '($tops%\'stevens#\'se-hole$(quetaire"\'vement\'$"th#"in%%g-map"$yano#$linn##nan"+zartstrasse!$p-tv""cu"\'e-based',
+    '""pc#!l"%u-401!#ros""pc!#sai#!r""ds""ha"!j"!k"!o"&tislav"\'windows!#ths',
+    '!\'uavenet#!y"#ch-%\'dreaded%)increased%%liked%\'wronged#(klehouse"&d-bank$&dauber$&loving#$bath#%caked##gee#$rock',
+    '"%fakat"%geary$#llo#%wumps"(irshiels$$town"$juru"%kalla$#sas##und$"po"&lazims#%chaey$!t##ley',
+    '\'"ux#2ti&ndash;attribute%\'-access\'&irline&+billionaire&&column(%mpany*%onent&&engine&$file&%organ&(platinum\'#oll&&sector\'\'yllabus',
+    '%$band%$cast&!o%\'faculty&%igure%%group%$head%)nucleated%%paint\'"ra&#le-)&family))occupancy%$sync%&vessel',
+    '")malissimo#!e##iai$"th#%merys#-ps-meningitis"&nalula#&chenci%!y##die%$ford$"us#"ge#"ka#!t',
+    '#"gu%%lescu#%icids#$rill#%taugh$!y#"wa##zuk"\'scadine$\'helkalk$$idae$&le-man##hes$$oosh#!i',
+    '&&master&\'theatre%"ae%$kies%$land$\'kverein#$k-ox$"er#%quash#(selshell$#ing#"t\'$$-fit%#see%#win',
+    '$"on%!w"\'tambaye$.tion-selection#&engene#$ford#"ha$+uramalingam#&ilates#!o##rie#&ualist"&wakkil"!x"#zik',
+    '"!a"!o!$w(e)")ananshiku!#x-6!&ycella#&otoxin"(elinated#%rhoff"\'klebust##ola"%lanta#!e$!x#(onitized',
+    '"%ponya""re##ina#(mecobius"%shall#&teriis$&icetes$#yle"*th-telling##ton *n&auml;her"*eacute;ant"*icirc;mois!*\'drangheta"$roll',
+    '"%force"#reg!".v!"05!"15!%64000!$aaws"(babsingh$%taean#!e##ila#!n##obs#\'umetone"#ccb',
+    '$#ola$$twey#*i&oacute;n##ked#"od"#dea$!n#"is"#ffy#"is#%khosh#$tali$"he"#gal$(panchami',
+    '#%inata#!m#$orno#&riamel"%ha-te#"bo#!e$!r")il-making$%craft$\'ed-down$!z#$racs"$jaar"%maqua',
+    '#"e\'$\'-change*#ing%\'dropped$\'checked#"ik##oos##uth#!y"%nbudo#&cy-boy#"dy##gle##kai$%ivell',
+    '$\'ostomus##sha#$tais#$yuki"#oko"#pap##ery#%olean%%itana#!p")rayanganj#$cizo#\'kompros#"od%"ni',
+    '#*ratization$\'owmarsh\'%inded"%sakom#"ma#$scom""ta$$nson$$scia#"hu#$iona\'"ir#!s#$tier#%ural-',
+    '%"e\'&--conservation\'&spirit%&opaths%+philosophie""ud#%manni#*s&eacute;e$+ea-inducing"$vaid$#rin\'!o#%vying""ya#"ib',
+    '#\'thuyein"&zarkin#\'i-style$#one!"bd""er"!r!$ccae"#opa#"re""rv""sc#!i!"de#!h',
+    '"%imene#!s!,e&ndash;330s""ac#)r-anarchy%\'despair%*exhaustion%)forgotten%&ground%)paralysis&)erfection%"rp%+suffocation$%sense#$they',
+    '")belwerfer#$lina"%cator#&cesary#+essarianism("ye#"ho#+k-heaviness)!y%%scarf$%inger$%laced##ros#!s""de',
+    '$#le-\'#gun\'%point##lam#!r#"ve"#fax"(gational&+ve-sounding#(ligenter##ro\'%"ni%&phobia"&idpath##man',
+    '#"l\'$!e#"so#"tc"#mba#"et#%uchin""no#$tres"-o-colonialist&$rtex$-expressionist$*mcluhanite%"od\'*ernisation',
+    '$-perpendicular%(latonism$)stalinism$*trotskyist#1dymium-iron-boron#*gastropods$"en#)platonism"%palis#(hrolepis&"ps#!p#)szabadsag""ra##com',
+    '$$ides##ine#-ve-stretching&\'testing"&siotes#%t-box$%field$)ing-place$#roy"(t-minder#!c#\'heridge#&i-neti#"ty#.work-connected',
+    '#+qu&eacute;n#,ro-anatomist&,psychologist%\'glottis%&mancer%,pharmacology#$ters$,ral-sounding%)onization"/ver&rehy;ending%,-before-seen&)completed#$ills"(w-caught$#won',
+    '#/castle-scousers*/upon-tyne-based)!s$)omen-type#$dick#&letter$%iston$"on$"y-&(emerging&(imported&#lit&\'written##map##nix',
+    '#+s-reporting$%break$#can$%group$$omes$-paper-selling$#ted$%ws2-4#$tone&&grange"#xor!#fpa!\'g\'wandu"(aoundere#%rivue',
+    '""he"$onde"$wane$"zi!#her"!u!%iacro#%garas#&paland#%rchos",belungenlied"(ckel(ii)%#red&#ing$#len',
+    '$!o#$ocea$"ya"&emczak$"en#%naber#!s""ff$"ed"(ght-blue&$line&$safe\'$cene\'#ide&%table',
+    '%#ers%$line&#ong%#owl%\'shelter&"it&#oil#$raha"$jman""kb#&e-mare##ons"#lde#$fisk#&ssonia',
+    '#"al##esh#!h#*iny-piminy"(ne-stone$%teen-(4th/twentieth-century%"ta%(y-dollar#"ty"(p-cheese#$pled"(rv&amacr"#san#$bett',
+    '#!s#$yros""tc#%ricum$*o-organics%\'scanate""vr"#xie",zhnevartovsk!$kipc"#ulu!#lva!#mes"#pft!"ni',
+    '!&o&euml#-rehy;nonsense(#one"\'-charge$%olour#)first-use#5marking-to-the-market#\'quibble#$side$/trings-attached#\'tillage#$visa"$bber#!e#*le-looking',
+    '#%uhiko")ctambules$"ua"#der"%ggin\'"$iret#(se-level&(reducing+$tion"$lder$"or##een"#man"1n&ndash;statutory$+rehy;verbal',
+    '%&lcohol%,pplicability+$tion%(ssertion\'\'ignment%)ttainment\'(ribution%\'xiality$\'batsman%+elligerency%(olshevik&(ndholder%,reastfeeding$)candidacy&$rbon',
+    '%&hewong%"ip&&rcular&&tation%\'limbing%,ollaboration&\'mmitted()unautaire)$ting\'$pany&+nfrontation\'-sequentialist((ultation)&mption&$urse',
+    '$+degradation%\'irected*\'iveness&(storting%+omesticated&!s%#rug$*entailment%"rm%+ssentialist%(xecution$)falangist%\'easance$\'glycine%(overning',
+    '&\'eenbelt&$owth$\'healing%\'omicide&%nours$*identified%(nclusion&#dex\'\'ividual&*timidating&&verted$(jacobite$%latin%#ead$)mammalian',
+    '%\'elanoma%(odernist&$ving%%useum\'"ic&$tant$%nafta$+objectified%,il-producing$&pareil&$tois&#yer%*erishables&$trol*#eum',
+    '%*lace-based%\'olitics%&rimary(&e-time&%oblem\')ductivity\'\'grammer\'*liferating%&uritan$\'radical%&ealist\'#son&\'cipient&,presentation\'\'ublican',
+    '\'&traint%%ising%$ugby&%nning$\'selling&&ntient%(hivering%\'ibilant&*gnificance%%kiing%$ting&%retch\'#ike)#ing&%udent',
+    '&$xing$\'unitary$)viability$(wesleyan%&ritten#(business#$core#*decreasing#%juror#&marine&#ket$\'etallic#"ny#&oxynol)"-9',
+    '#&suited#+threatening$&rading#"za"&odling#)n&ndash;2"#pec#$lace"#ral##bec$$last##cap#(denfeldt%!x#"ex',
+    '#(inchukin#$lite#*m-creating$"ac%$lien%(n-french#!n$!e#!s$#cot#$tech$+h-northeast&(to-south&+west-facing%%ants.',
+    '%(eastward&!n&&rnness%&mavine%(westward##val#,wegian-based%#yan$$ich\'""sc#)e-blowing%(thumbing$%bands$%dives$$gays',
+    '##sos$!y#(y-parker"$t-be#!.#%ating#*e-for-note%(material%%order$#jet$%nbuch$!r$\'s-based$%taker#&hdurft',
+    '#"ta"%ufara#-rish&egrave;d\'#in\'"(vacrylic$!l#4ember&ndash;december&"re##ick#&ogorod$(rossiysk""w\'#*-forgotten$)legendary#(hereland',
+    '#!s"&zovent#!y!#pgl""ro!"qr!#rsa!$sais",f-controlled"$rrki""st""ta""ue!%tlink""tc',
+    '!&ubibus"!c#,lear-reactor"#gee#$gett"#kul"$llah$"ed$(igravida%$para"+m&eacute;ro##ast##bat#$enor#$orum',
+    '#&skulls"%raghe#$idzo$!t#\'se-maid&,receptionist%)ry-raised$$ling"#sur"\'t-eater#!e#$hall"!u!"wm"#osu',
+    '#%kyusa#$mbui$&sambuu##nza"&codenz#\'ticorax"%gaard""ha"#lex#\'on-clad%"ed"&mansay#&phalid%!e$&sfield',
+    '""pl"$roca!*zabahimana"#ctu""ru (o\'clock-"&erstep"%groat"(tunstead!$-200"$dako!#.a.!"aa"\'k-elder$&smoked',
+    '#&lahoma#$port"#sig#\'t-house$!s"#ten$!r"%xacan!#bbo"!c"&ducted"#eah#"in#3rgruppenf&uuml;hrer$%hofen',
+    '$-landesgericht"(fuscated"!i#$mpeh".ject-referring&&eering&"iq&$team"%lidge"%orony"%scura#\'ervator$&ssione!\'ceanian%&odroma',
+    '")hrolechia"&kleigh#!o"&obamba"$t-2b#%aplex$#ver#\'erotide#$obre$#com$!n"&zelebi!\'dd-ball"%eillo#\'scalchi',
+    '"!u!)ecophylla"!k"&ningen##one"!r!\'fensiva""f\'#.-balance-sheet$%comer$"on$%route$(schedule$$task%\'he-road',
+    '$%watch$$zone#%erton#-ice-equipment\'$work&\'r-class%#iel%"rs#$peak#)set-litho#%world"#ice"\'justice"$sted!%gunbe',
+    '""ta$"ke!#iel"(l-driven$#gas$(industry$$mill$+prospecting%&umping$\'revenue$(shipping%$tove$$well"$rats"$ssel',
+    '"!i""ok!"k-#$ness""ie"$oshi"!t"#ubo#%daira!$lcan"0d&rehy;fashioned#!\'#\'-people#\'er-type$*st-looking',
+    '#%style"%facts"(giersson"&igo-dt#$tski#%vares$"ey"\'leveant#!i"$urin"&ympias&"ca!%magiu"#bla"$elet',
+    '"$iner$&ipoint"&niback$%court$$data$$font$\'potenti#$opon!-n&ndash;going"\'-camera$$ourt#$lend#%pitch#(the-ball\'&record',
+    '"2ce-in-a-generation%&living%+upon-a-time"%dieki##rej"&e-bird%"ox%%utton$)component$$firm$#hit$"in%#tem$\'megaton$$pair',
+    '%"ly$$race%"un$(shilling%$tage&&oreyed&$ring$%tonne%+wentyfourth$$xxxx#"_a%!s#(iromancy"#igo"!m',
+    '"*ychophores!#odu""er"#hhh"$long""na"+ooooo-oo-oo\'$oooh"#psy"&stende!"pa#$qued"!d"#en\'$%-back',
+    '%$cell&&ockpit%$mesh%#pit%&sprung&$tyle&+ystem-based$)ing-round$)messaging#)ra-loving%"ti\'"n\'#!t"(hialcaea$*olepidinae',
+    '%\'thamnus##uls"-inion-polling#!o#$tiis"!l"%orton"#pau#%onant$*sition-led#!y"&rdered"*tical-disc$%oning"!u',
+    '!+quel&iacute!$raba#%cstar#(ng-hutan%+e-and-white\'$buff$5ienburg-sachsenhausen#"pa#"te$$oria"%b-web#!e##ium"#cad##ofi',
+    '%#in\'#$inis"$eads#&nstein",gan-building%!i&)sed-crime%*o-chloride""ic#%flame#%skany#$undi"(kneyinga"$lane"%mseby',
+    '#)ithischia"$omos##nte&!s#$tava"%ridge#"ys"%seolo""th$(odontics%)gonalised+"ty#!o$#lan$"na',
+    '!$sage#&kazuki##mor"$band"%croft"\'i-based"!k"#lac"$mose"(ophageal#$rkon""pf"\'senkopp$!s"$tade',
+    '#&eology#%inati"#yak!\'taheite#!i"$ieno"$omat""ra""so"$tava#\'erspool#&obuono$#mar!&udinot##ran',
+    '"(standing"-t&ndash;trays$.rehy;performed#&-argue$\'compete%\'rossing$\'gassing$#hit$+in-the-open$&jabbed$&living$\'matched$#of-\'\'balance\'&centre',
+    '\'&office\'%plane\'%reach(#ole\'(the-blue\'\'uniform$*performing$)qualified$&ranked$\'selling%$hone\'!t%$pent$%turns$$work',
+    '#(competed$$ross#\'er-ance&(directed&&estate#%goers#$held##ler$#oud#&raging$%iding#*scrummaged$\'marting$&tretch!"vd',
+    '#*n-to-table#0r&rehy;confident$$-25s%#70s%,administered&"rm%(balanced\'$nked&#ent&$uilt%+capitalized&*entralised&(orrected%+determining&(ramatise',
+    '%#egg("ed&(namoured\'(gineered-#ing\'%joyed&\'quipped&%xcite%\'farming&%ished%&grazed%%heard&%orsed%)idealised%(learning',
+    '&&oliced)$shed&&ressed\'%inted\'%obing%(regulate\'"ly%(shooting&-piritualizing&\'trained%#top%%value)#ing$&acting$%baked',
+    '%"id\'$ding%\'lankets%$oots&&rrowed%#red$&called%&leaned&#oth%&oncern\'$sume&(rrection$&damped%(ecorated&\'pendent',
+    '%&ubbing$\'endowed$(familiar$%glaze$#hit\'$ting%%unted%$yped$(packaged("ed&"ss%%raise%)ublishing$&salted&&mpling',
+    '%(pecified&%illed&#ray%&tamped&)imulating\'%tched&$reet\'%iking%\'upinate$)tightened%\'raining$$uled$\'watered%#ear"\'ingdean',
+    '"#ule!$wana"\'n-share#!d#)er-driver"#www"#zat!\'x-drawn#$team#%wagon"(alacetic"%blood"#cis"#eye"\'fordian',
+    '"#lip"$moor"(ocelhaya"(ybutynin#&gen-16#,tetracycline!$yono"\'stermen +p&eacute;re)\'tillant*"ur#.grave;lerinage)#res",rcaron;emysl",uacute;blico',
+    '"\'tum-chk!#(u)!#-27"%block"!c#\'adherin"$dctp#\'etector#(irection"!n"$play"(selectin"\'varying"$wave$!y',
+    '""83!%a-ing""ap"\'casmayo$"ya##hta$.ycephalosaurus#%ific\'#\'king-up"+ddling-pool##ouk$#van"#ety"&gemarq#!k',
+    '#"on#$urus"%hadia"#icf$!h#&gntons##lly#\'n-glove%)producing%&relief$(t-peeled&\'scraper%\'balling)!s%\'ed-over',
+    '((stainers%#jet%&makers%$ress#"rc#"sa"!j"*ki-bashing$-stani-trained#&lenica#$tong"%lace\'$.eoanthropology&\'current&%logus',
+    '$$kona$&niappa%#que$$rgic$!t%&alized$#ung#&e-eyed%&headed%%lemon%&yellow$%faces$)tte-knife#)ingenesia%$urus',
+    '$#one#&m-grip$#ate$$boom$$leaf##ona#&pitate)!d"\'mchenko##mon"&n-shot#$agia$%lpina$1manian-registered%#yes',
+    '$!y#$dion$#oro#*el-picture$$vors#%field$$orte#&gbourn#0ic&rehy;stricken$!s##net#&orpoid$"zo##sio#&taloon',
+    '#"yi"$o-yu"&pabile$&markou$(nicolaou#*er-covered&$feed&)producing&&weight%%white#"ia$,llomaviruses#\'palardo##ush"$r-70',
+    '$&saving#"a-%/incompatibility%(relation$&bellum$#cel&%ntral&0tamol-methionine\'$emol$#de\'&"ro%.ichlorobenzene&+gm-shifting&#sum$%glide',
+    '(#ise%%yzing$$meta%-ilitary-style$-noid-schizoid$\'penting$%scend%%itoid$"ty&%phoid#!d$#ave$%iggle#"el$*nt-company',
+    '%"zo##igi$%ngaux$)s-trained%#har##ken%#ses$\'ing-bay&%sonii$#ray#%leyed$"ow#%melia%&nidean&$tier',
+    '#$odos#(ravicini&"on$&ington%"ss$"ys#"t\'$)-disposal%\'filling%*proprietor&\'urchase%$rent%%shade%&tenant&\'hrottle',
+    '$&henais$2icle-anti-particle&!u%%giani%!n%#tas%$zans$&rishow$%sbank$&urient$"y\'%*-dominated&&loving&$plan#$vati',
+    '##wan"+shupatinath##kin#)sacaglias%"ts$$band$%ereau%!z$*ifloraceae%)on-killer\'$tide$!k#"t\'$*-president$#aza',
+    '%&urella$&oralis&"es&#ing$\'ry-cook##vik"%tates#$hman$(ologised)#zed#(ient-led$"jn#!o$&ulidou#$rase',
+    '$#ial&$rcha#0tern-recognition$&insons$$ullo"$uker#%linho$%ownia$#sen#(mgartner#%pered#$vres"%velic##ier#&lychko',
+    '"-y-at-the-gate$%round$$slip#!a#$cops#$dirt#!g#"ot#+roll-giving"*zvant-oglu#$yryk!#bgc"(sb-tween""xs!"c-',
+    '#$9800#&driven#%proof"#dob"$e-5s"%probe!"do#"is""ps"!u!.e&ntilde;aloza"(a-souper#)ce-broker&&treaty#&r-tree',
+    '%$ised%%scale#*sant-woman$%holme#%t-bog#"vy"+bble-filled&&dashed"%ccata#!h#!u#"vd"!d#-estrian-scale+\'vehicle',
+    '$&plains#\'ometers"%e-ing$>po-bum-shit-piddle-bugger-damn#"sy##ver"&formed""gu"#igi##ner#!s"#jot"%kinel%\'g-owned"$lagi',
+    '#&igroso##ler$&igrini#&opidas%\'onnesus#\'ycosaur")mbangunan$#ers$!o#\'matites#"on"%n-nib$&y-clip#%alver#-cil-and-paper',
+    '#%dente$"on$!y#$exec#&holder%#uet#\'icillia$(s-shaped#$nate$&ycress%(pinching#\'ruddock#\'sa-suhr$#her$*ion-scheme',
+    '$#oft$%tocks#\'telikon)!s%#wan$#ice$#jak$"ry$&stemon"#ole#"pl%-e-orientation\'\'pleaser"$p-up#"it',
+    '#&tavlon$*ide-pulsed"(r-barrel$&capita#(centaged$#ipi#$dika#"el$$ulok#!f$%ector%$rvid$.ormance-artist+$plus$&umerie',
+    '#\'i-track$"co$*hermeneias$%odate&#ise$*pheralised%%teral$&scoped%$hin\'#%klone#$loff##man$,ian-triassic%&ssives#!n',
+    '#-petual-motion##ran$"en$&haiboi$+i&egrave;re##sea$\'hing-ii%"ti$$igny$&pector#"tl$%usato##uke$$vain$#zzi',
+    '#&catori#)t-control"%t-15b#(alomyrex#/erborough-based%#hof%#ite%)lee-based%$sson#,ition-drawer#%rioli%!t$*o-currency%%cella%&dollar',
+    '%(l-filled\'$lead\'%price\'$tank($ruck%\'quimica%7vi&cacute;-njego&scaron$!u%&cciani#&ulancy#%watch"#url"!z#$zoli!$feil',
+    '"&rommer"!s#!f!"gr!#hab#"ce$#ops#(ntasmata#-rmacogenetics(\'therapy$!o%#ahs#+se-contrast&(modulate%\'d-array',
+    '#\'nformin$)obarbitol$9ylmethylsulphonylfluoride#!t"&igalia#&lbeach$#dar$\'lipinos%%potts$&odemos%(sophicum%$thea#"sh"$ocid#&nebook',
+    '$&ologie##rgh#1sophatidylcholine$\'phating)#zed&%o-hpr\'%ricum(&us-box\')tungstate#$tech$&o-cell&\'library&\'realism%$file&%rames',
+    '%&murals%%plays%$real\'\'portage%+synthesized%%track&)ypsetting#&uthang"-ractocephalus##rrt"$urbu#$ture"%ysica%+o-therapist#)tophthora',
+    '".anist-composer$\'o-stool#%secki##zzo"$cchi#(k-popper$#tel%$hall&#orn$$well#$olax#*ture-house",e-in-the-sky$&powder#+ce-by-piece',
+    '#%d-fly$"ra##lou#\'montese#&r-head$#ian$"ro$%shill#\'sporter#$tons"%g-pig#\'gy-eyed##ney#&person"#ked',
+    '$"ki#"ce#)e-weaving##iso#(l-making%&taking$$ages$#eri$%owell#\'ot-less"\'n-count#(acotheca$&kothek#&e-cone%$tree',
+    '#+g&rehy;pong$!e%"ot$\'uifolia#!i$.nfarina-styled#\'k-brown%&collar%%edged%$foot%#lit$(ish-buff$\'y-brown##out#%t-pot',
+    '#$zgau"\'pe-clay%$fish%$rack%\'sucking%\'tobacco$$clay$&laying$%slice$$well#"pi"\'rithous#%oshki#\'vulescu"#sar',
+    '#$idia#!k#!t$$acia$"il&!s$*ol-packing"%t-boy$%popsy#\'fighter#\'lochrie#!o"$xtex!"ku#$nzip',
+    '%(-kicking%!t#$fond#\'giarise$+ue-carrying\'&ridden#!i$(ns-style&&people$\'sterers##nci%"us$&e-tree&$wave%\'t-based',
+    '$!h$:ning-programming-budgeting$%tpots#+smapheresis$%ticey\'$ware&#sol%$opan#%talea$*e-spinning%!r%!y$+yhelminthes#$udit$%notol',
+    '%%maker%&school$%acted$(er-power\'%queen$&listed(#ing$&mobile$%scape$$trac$$week%(righting"\'easssse%(ure-pain#%gadis',
+    '#%nario#!s$"sy#%urant#(xaurelia#"ye""fp"(imsolled#%olite#$sner"!j"&odcore$$ders#$esti#!s',
+    '%%hares#$yees",ug-in-and-go#%maged$&bridge$%etted$#ose#\'ralized(#ing#(s-factor#*tonium-239#&vinage"&y-wood#3mouth&ndash;roscoff/)santander',
+    '!#mbx"*c5&ndash;8""le!"nf"!o!,o&eacute;sie"$blet#!o"%cket\'"$ddle#$gers"*eciliopsis#"te""fs"$goed',
+    '""il#%ncare$$t(s)%+-in-polygon%%iness%"s-#"re#\'son-gas\')producing\'$tree#$zone"*ker-player#%phand#%rovsk",l&iacute;vka',
+    '$&rguard%#ite%#rfn$!y#$dens#\'e-axing#)ice-issue\'%state&#dog%!h&$etti%"ia%\'y-based\'&holder\'.implementation',
+    '\'\'setting$(sh-style$$tcal%"ia$#zia#(kinhorne$%ovnik#$lice%!t#%oneck#&timore$#own#(y(di-dc)$\'-cotton%$foam',
+    '%&tunnel$-acrylonitrile%$mine%!s$#bag%$orus$%eidos%(thylenes$$foam$%lines$&merize)#ing$&neikes$0philoprogenitive%%tyque',
+    '%$cope$0vinlypyrrolidone")m-pom-pom#!e$%rantz##pon"$nape#"cs#&d-weed$"ed$#oes$!y#%gidae#"or#$teus',
+    '$\'sticill#\'y-drawn"*oh-poohing#&l-edge%%owner$$room##mse#)r-country$*ly-trained$#man$#ter#%tling")p-culture$$funk$$rock',
+    '#$eron##its#$kiss#%olare$#vas##ply#\'styling#%ulare\'$vote&#tes%!o"*ralelslivi#&beagle#*cupinefish%!s',
+    '#\'e-space#&kenham##lea#&phyrio##sch#\'t-level$\'a-potty%#ged\'!s%"nt$%esham%!x$\'glenone$)hdinllaen%"os',
+    '$&lligat$$olan$-rait-painting$,smouth-based$&uguesa")ser-phone#&idonia$-tion-register&,vely-charged#"ol#%sagno$"er%"st$"il#&t-1934',
+    '(!7\'"93%(and-rail&%ppeal%)baptismal&#oom%+colonialism\'(nversion\'(pernican&$rime(#sis%*depression\'+termination\')valuation&&iploma',
+    '%(feminism&$inal\'!x%)griffiths%&heroin&&oliday%*investment%(massacre\'&terial(#ing&#ill%+nationalist%*palaeozoic&*erformance&#ill',
+    '&"ub((lication%\'release&\'omantic%&script&\'pawning%,transfection\'(identine%\'welfare$)challenge$&dienst$&erlink$)labelling".t&rehy;bellied#%agers',
+    '\'&masher\'%patch&!e#*chefstroom#(entizing#$luck#\'tergate&#row&#son$$hast$)y-trained"(u-domain#"ff$!s#%lains',
+    '$#ets#)rceaugnac$#in\'$%query#&targue"$vahs"(wellites$(r-kiting&$line&$room&%surge%&bridge%%glyde%$mate&%onger',
+    '%#vac#"le"#xed"$yser"#zen!*p4&ndash;7"#arc"\'fennigs""ru!"qb"!r!(r&eacute)$;fet*$vert"\'acticks',
+    '$$sens$(textatus#!i#$krit#$mful#&nayama$"ny#!s$(ertsuwan$$iola#\'tincola)!e#*yer-filled\'%wheel#!z',
+    '".e&rehy;eminent##-16%#700%#915\'!7&"47&"97$$aids%,uthorisation$\'banding&%roque%\'eeching%"id%#oom%%uyout',
+    '%%ensus%&lassic&&eaning%+oordination%%ueing$&degree&+monstration&)stination%*isturbance&"ve%\'octoral$\'emptied($ying$(finished&"re',
+    '$&heroin%&oliday%&unting$)influence&%itial$(judgment$)lapsarian%#oad%\'uncheon$)marketing&\'stering&$ting%)embership$+nationalist%)egotiated',
+    '$\'opening%\'rdering$)packaging&\'rtition%(regnancy&)ogramming%#ump$\'quantum$\'reduced%$oost%"un$(sequence%&hampoo&$runk%#mog',
+    '%)tructural%%upper$+tax-profits%!v$\'wetting%%inter%$oven#\'adapted$%kness#*capitalist%\'rcinoid$\'edented%$pted$1ision-engineering$&lassic',
+    '#\'dannack$\'eceases&$ided%$fine%&signed&$tiny$&rilled#"em$"ty#!g$&ardien%$ssed#&lavent$\'iterate$&oading',
+    '$$eren$+i&eacute;re%+ses-related%!x#!n$!t##par$(onderate,!s$$ress%#int$%ulsid#%quels#)sbiterian$)ensitised',
+    '$.ident-director))ial-style-$type,#ist$&s-book&&formed&\'release%!a%$sure%%watch$)ton-based#\'tty-boy$$yman##vue#&warmed',
+    '"&iapism##ce-&\'marking&$wage\'#ise%#tag$$kett#&denjoy#\'madonna%,ry-producing$+e-borrowing&$site$!i%$para%#tif',
+    '%#rje$#ped#$ncen\'$hage%%ipate\'!i(!o(!s$!e$&jolata$$sloo$(t-seller%%cache##pet#+son-officer',
+    '$$ikin#"us#/vate-enterprise((property$"vy#!z"-o-chancellors%*ompetition&"up%$rime$"ii%$rish$#mat%\'onarchy$-privatisation',
+    '$%vichy$#war#"am%!p#%blem-\'!e$\'oscidea#*c&egrave;s$#eso&%sing-$"om$&reated(#ing$#ula%%ratia',
+    '$"ys#%ddies$#raw$-ucer-consumer&/tion-orientated*%ising%$ktie#.fessionalising$)it-earner\'%share$%ugens##gam$#nos\'&ticate$,ram-software',
+    '#/hibitions-based#%ivide#)ject-work#\'lapsing$&etaria$$og-2#$ment$%house$%ostyl#!n$\'ethalol$-oun-plus-verb$)ucleating#&p-wash$)agandised',
+    '%#ne-$(erly-run&#ty\'(%-word$(hetesses\'!z$&ogator%!s%#xur#&rogate#*s&iacute;m$#afe$(e-poetry%\'lytised%!s',
+    '%"te$)opagnosia$$port$&trates#(tein-fat$\'herough$)o-fascist\'\'eminist&1industrialization&$punk&&record&%state%#cad&)ols-style\'#nch',
+    '%#ols$%schka$#tas##uts#)venancing$*ing-ground"&ud\'hon$%enter\'#ius#&neface##sik#!t$#een"#yed##sor',
+    '"$eira#-udo-community\'\'fascist\'\'learned\'*peripteral(&roblem&)boeckella&&polyps"*i2-nipenv1#\'ttacula"!k")l-rebirth".r1509&ndash;58$,757&ndash;24""sc',
+    '"&ychiat&%ng-up%(o-babble&)acoustics&)historian&(logising&)synthesis!$tang#$shne"*erophyllum"(olemaics!%u-abi"(b-owning#%blici#-lic-transport',
+    '&.ity-generating&-ly-controlled##sey#%watch")ccinellia"$ddin")ff-pastry"$ling##ker#\'l-along$\'ed-back$!i%"n\'$\'man-car#)sed-field',
+    '$%ruded\'#ing$#usk")mp-handle%%prime$#ers$\'kinseed"(nchdrunk%\'ed-card#$dijl"\'pil-led"%r-pur%"yr#"as##dew',
+    '$%vdorg$!y#\'isource#*ple-headed#%saude#"ty"&s-cell$&yellow#%eyism#,h&ndash;pull$%-down%"up##sot$%y-cat"$tnik',
+    '#)termesser$#man$#yng##zer""zo!#vcs"!e"!f"#uii!)wllpeiran!"xg!$ybba#"is"%e-dog"/lori-associated',
+    '"!o#\'cyanase"&ramide\'#ing##ene&#ans#&otenax"\'thoness %q-car"$ship!#.r.!*1&mdash;q3""01!"23!"ag',
+    '#&semlou"!t!%eziot!&ingdao"%rrish!#pbc"!i!"ra!"te!(u&eacute"#\'en##ran"&adplex$&ralien&%phony',
+    '%(ophonics%)uplicated#&eritis$\'stiones&"or##ffs#*il-hunting#"le$1ification-bearing%!s%(t&eacute&$ated$&trough#&ntiles&"se',
+    '$"te&&r-acre($back(%miler()of-a-mile($page(%rhinu(#way%,z-tourmaline#\'si-oral&)sovereign$!p#(trefoils$\'trocchi"$edam',
+    '%%spark&#ton#)nerduaine#$rter#$snel$$ters%!i&!o\'%n-tag#+tzaltenango#)ue-voting",ick-changing&(draining&%input&%march',
+    '&&silver%+er-thinking%#set&&tepped%&witted#%dquid##ery$(t-voiced#)lt-making%!y#$mica#\'nacrine$#bus$%oline%$taur',
+    '$&spirus$#tek&!n##res"(odlibeta!%write =r&aacute;mirez-s&aacute;nchez"-eacute;camier*#its)(flexions)%gions)\'moulade)$pond")ndash;101!%-134a',
+    '"(lessness"\'squared!%.h.m."&s.v.p.!#101!"31"\'42a4-c3!)4&ndash;6!+81&ndash;85!%aarsa"$bi\'i$\'novitch#!o#!s"-cal-honeywell',
+    '$&-going%%horse%\'walking$%going$&nights#)hmaninoff#*ing-driver#&k-rent$$liff$&mounts#"om$$nter"$dcot##day#\'ial-arm',
+    '$*o-equipped&*microphone&%phone&"tv%.allergosorbent%&larian%/pharmaceuticals%)telephone-!y$%using#$jick#\'milovic"#eff"$falo#\'eeuddin',
+    '#%idain$#qul"&g-doll#%heads""hi#"sh"%idion#%l-car$%borne%$reak##mat#(n-driven$%maker$(proofing#!r',
+    '$$eing#"ta#$zure"\'jmapata"\'kestraw##lli"#les#\'lycross"\'mangura$"po$!r#(bo-style$$usch#"es##leh',
+    '##ona#"p\'#&s-horn$$kold"$ndan$$stad$%troge#\'evskaya#\'garajan$"en#!i#)k-pulling$#ins#$veer#$yard',
+    '#(hidonema$!o#.idly-expanding(*increasing(&rising$$test##pel$,resentazione"%schel#$haya$#ida&$iyah##ing#+ping-voiced##sam',
+    '$%relli"(t-at-tat#"by#\'cheting#"e\'$!-%%borne$\'capping$!l$&paying#\'hcullen$%kenny$#ong#!i$\'ocinate',
+    '&"em##ler#!m#&ramnus"(udspirit##tsi#"ws"!v#!a$#nel#$elli#&issant""wl#%plugs#$sons',
+    '#$less#$nold"(zor-edge&%slash+#ing#!z!(bmk-1500!#cop!%d-930""as"&bitest"!e!.e&rehy;imposed")-analysed%\'nounced',
+    '%%oused%)ticulated#&badges$#ook&$ting%#xed#$call%!p&$ture$\'oloured%&mbined&%puted%\'nstruct&$vert%$sted',
+    '&$ping$&rosses#&dating$)epositing%&scribe&\'ignated%(veloping$\'iscount%&vision$%ouble)!d#+embroidered%\'igrated$(nergised%&forced',
+    '$\'xposure#)fashioned$%inish)"ed%%tting$$ound$%rozen$&uelled%%rbish*#ing#\'gaining#%heard\'#ing&#ted%$eled',
+    '#\'ignited$%maged%&posing$\'nforces%%stall\'&ituted#&jigged$%oined\'#ing#*keyboarded+#ing#*landscaped$\'icensor#&melted$$ixed',
+    '*#ing#)nominated#%oiled$%rient)%ating$\'xidised#\'packing%\'renting$&eopled$,hotographing$%owder$(urchased#\'qualify#(referral%(gulating',
+    '%%oring$(entenced$\'huffled$(ilvering$%lated$&prayed$&tacked&"ll&#tes$"ub%\'spended$*ynchronize#\'testing$\'hatched$$iled',
+    '$&racing$$uned%$rfed$$yped#\'uniting#\'viewing#-waterproofing$$eigh$\'heeling$#ire$#rap"+action-time#\'dapting$-er-accomplice((wareness',
+    '%\'ng-lamp(&scheme$+y-assembled&&packed&(seasoned&&to-fly&#use%%guide#(mplified#&nalyse$&imates#+ppropriates#(rraigned#$son-$\'signing',
+    '#&vealed"&backed$&ptized#&inning#\'oarding$$lted&#ing$$oked$"re&!d%%rowed$%ttled")carpeting##bcd#.ently-bereaved',
+    '$%ptor-$%ssing\'*on-beating#!h$\'endorff$)ristening$#ten#$ieve#+klinghausen$!s#\'oatable$)gniciones$\'llapses%&onized$\'mbinase',
+    '%&penses&$ress$(nceiving\'*ptualising%(figuring\'%rming%!s&*tructivist%$tact\'\'minated$)rd-making&+ed-delivery\'%rship&)s-keeping$)uperating',
+    '$$eant$%osses$,uit-a-friend$*ystallised",d-and-colour(&whites$$back%$eard$&capped$#eye$\'pointed$"us#%ating$"xe#%beard',
+    '#+dish-orange#&eemers$%mptor)"is$$nham$\'scribed%$mere#%faced##gra#%lined##ner#$oute#%rafts$"up#,uced-alcohol',
+    '$!x"*ed-warbler$$ling#%forms#$kies#!m#$nact$&tering"#fat#%eened$1rent-modification%$rent#!f$#ing#&lating',
+    '%&wering#\'ocussed$\'resting$$ught#-reshment-room%$tted#!t#\'uellers$$sin\'"%garde$%uging#!e$!n%"ce$$stum',
+    '%!a#!i$$lded$%niano$,on-by-region&&alized&!i$%stery#$rant$%etter#%ulkar"$hear##man##ome"$iach',
+    '&"lt##der#)fezeugnis#&ksport$$wald#\'mported&$sing%\'risoned#%nagle$)carnating$,deer-herding$%vaded%(estigate(!s#%sling',
+    '"$kcon##nit"*lativising#%earns\'!t$\'galized$$ived#&iables$)ef-agency\'&giving%!v$!g%2ionsgeschichtliche#%lstab##man',
+    '"*magnetized$&rketer##emb#&melink#&ontant$)tesensing"\'nascian#&ckhart#*dezvousing#\'esancni#"ox#\'sselaer#)t-a-quote%#boy%&paying',
+    '"(occuring#\'riented"+p&egrave;re#!a$&pering',
 )
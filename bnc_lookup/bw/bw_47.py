@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_47 = (
+count_47 = 6694
+
+heads_47 = (
     'anmac',
-    'anna&mdash;i',
-    'annaclone',
-    'anneli',
-    'annelida',
-    'annewanter',
-    'annonaceae',
-    'anodising',
-    'anointy',
-    'anoup',
-    'anpe',
-    'ansafone',
-    'ansary',
-    'anshan',
-    'ansichten',
-    'anstie',
     'ansto',
-    'answer-machine',
-    'answerphones',
-    'answerprint',
-    'antarctican',
-    'ante-chapel',
-    'antegrade',
-    'antennapedia',
-    'anterior-posterior',
-    'antex',
-    'anthorpe',
-    'anthraquinones',
-    'anthropomorphized',
-    'anthurium',
-    'anti-adhesion',
-    'anti-appeaser',
     'anti-aristotelianism',
-    'anti-artwank',
-    'anti-austerity',
-    'anti-avidin',
-    'anti-baby',
-    'anti-basque',
-    'anti-bribery',
-    'anti-capillary',
-    'anti-cartel',
-    'anti-cd45',
-    'anti-channel',
-    'anti-commercial',
-    'anti-cruise',
-    'anti-culture',
-    'anti-delta',
-    'anti-draft',
     'anti-empiricist',
-    'anti-euphoriant',
-    'anti-federalism',
-    'anti-fertility',
-    'anti-flood',
-    'anti-foam',
-    'anti-fog',
-    'anti-food',
-    'anti-formalist',
-    'anti-gaullist',
-    'anti-gnostic',
-    'anti-grav',
-    'anti-green',
-    'anti-heterosexist',
-    'anti-incumbent',
-    'anti-jacobinism',
     'anti-korean',
-    'anti-lift',
-    'anti-materialism',
-    'anti-merger',
-    'anti-monarchist',
-    'anti-morrissey',
-    'anti-negro',
-    'anti-noise',
-    'anti-power',
-    'anti-prealbumin',
-    'anti-profit',
-    'anti-prohibitionist',
-    'anti-puritan',
-    'anti-racialist',
-    'anti-rail',
-    'anti-rust',
     'anti-sculptural',
-    'anti-sex',
-    'anti-sovietism',
-    'anti-sun',
-    'anti-tcr-',
-    'anti-testing',
-    'anti-totalitarian',
-    'anti-toxoplasma',
-    'anti-united',
-    'anti-urokinase',
-    'antiblue',
-    'antibody-iga',
-    'antibody-igg',
-    'anticlimaxes',
-    'antiheroes',
-    'antiheros',
     'antikythera',
-    'antilogged',
-    'antimenides',
-    'antimissile',
-    'antipain',
-    'antiphans',
-    'antipolis',
-    'antique-filled',
-    'antired',
-    'antistreptokinase',
-    'antiwhaling',
-    'antiworlds',
-    'antoin',
-    'antonelli',
-    'antonen',
-    'anunciacao',
     'anusha',
-    'anxiety-free',
-    'anywhither',
-    'aoes',
-    'aonghus',
-    'apage',
-    'apas',
-    'apennine',
-    'aphiri',
-    'aphyosemion',
-    'apiarist',
-    'apilu',
-    'apk',
-    'aplan',
-    'apodemus',
-    'apodictic',
     'apog&eacute;e',
-    'apollinarius',
-    'apologie',
-    'apoyo',
-    'apparell',
-    'apparels',
-    'appeldorn',
-    'appendant',
-    'appereth',
-    'appetito',
-    'apple-mac',
-    'application-environment',
-    'appliqu&eacute;ed',
-    'apports',
-    'apppointed',
-    'apprentice-served',
     'apprenticing',
-    'approacheth',
-    'approval-seeking',
-    'apriori',
-    'aptera',
-    'apulius',
-    'aqd',
-    'aqu&iacute',
-    'aqua-blue',
-    'aquabase',
-    'aquablaster',
-    'aquarena',
-    'aquarii',
-    'aquas',
-    'aquascaper',
-    'aquasense',
     'aquasphere',
-    'aquastars',
-    'aquib',
-    'arab-',
-    'arab-looking',
-    'arabick',
-    'arachnaphobics',
-    'aramid',
-    'aramits',
-    'araneus',
-    'arange',
-    'aranged',
-    'aranguren',
-    'arans',
-    'arato',
-    'araujo',
     'araunah',
-    'arax',
-    'araxes',
-    'arbat',
-    'arbeitsgruppe',
-    'arbella',
-    'arbogast',
-    'arbors',
-    'arbory',
-    'arbres',
-    'arby',
-    'arcad',
-    'arcanum',
-    'arccom',
-    'archaeo-astrology',
-    'archaeogastropods',
     'archd',
-    'archean',
-    'archeologica',
-    'archilochos',
-    'architektur',
-    'architettonici',
-    'archivo',
-    'archminster',
-    'arciprete',
-    'arcturan',
-    'arde',
-    'ardeche',
-    'ardee',
-    'ardeer',
-    'ardengo',
-    'ardeola',
     'ardestie',
-    'ardler',
-    'ardo',
-    'ardoch',
-    'ardon',
-    'ardua',
-    'ardvreck',
-    'area-',
-    'areg',
-    'arellano',
-    'arenig',
-    'argana',
-    'argenti',
-    'argolid',
-    'argy-bargy',
-    'ariba',
     'aribal',
-    'arichis',
-    'arics',
-    'aridius',
-    'aristotelean',
-    'aristotelianism',
-    'aristotelis',
-    'arlo',
-    'arm-',
-    'arm-wrestled',
-    'armanjani',
-    'armco',
-    'armero',
-    'armistices',
-    'armlet',
-    'armlocked',
     'armoricain',
-    'arms-cutting',
-    'arms-dealing',
-    'armshells',
-    'army-controlled',
-    'arn&oacute;r',
-    'arncliff',
-    'arnco',
-    'arness',
-    'arnis',
-    'arno&scaron;t',
-    'arnoldii',
-    'arnon',
-    'arnstein',
-    'arnulfist',
-    'aromatherapie',
     'around-the-world',
-    'arpe',
-    'arram',
-    'arraw',
-    'arrick',
-    'arriets',
-    'arrighi',
-    'arrow-chest',
-    'arrrr',
-    'arrys',
-    'arseholed',
-    'arsen',
-    'arsete',
-    'arsinoe',
-    'arslanian',
-    'art-criticism',
     'art-rock',
-    'artagnan',
-    'artemy',
-    'artengill',
-    'artep',
-    'artesanato',
-    'artexing',
-    'artibus',
-    'articulo',
-    'artifex',
-    'artin',
-    'artistique',
-    'artmaking',
-    'artsy',
-    'arudy',
-    'aruncus',
     'arundells',
-    'arveladze',
-    'arzner',
-    'as-easy-as',
-    'as-level',
-    'as_at',
-    'asadabad',
-    'asadillo',
-    'asafo',
-    'asagi',
-    'asas',
-    'asaulted',
-    'asd',
-    'ash-laden',
-    'ashad',
-    'ashall',
     'ashbridge',
-    'ashburner',
-    'ashdene',
-    'ashing',
-    'ashlar-faced',
-    'ashness',
-    'ashot',
-    'ashtina',
-    'ashwall',
-    'ashway',
-    'asigned',
-    'askeran',
-    'askes',
-    'asko',
-    'asnd',
-    'asperge',
     'aspern',
-    'asprella',
-    'asprilla',
-    'asprin',
-    'aspros',
-    'ass-wipe',
-    'assarted',
-    'assem',
-    'asset-strip',
-    'asset-stripper',
-    'assini',
-    'assiniboia',
-    'assistantship',
-    'astatotilapia',
-    'aste',
-    'asterlite',
     'astler',
-    'astr',
-    'astro-physics',
-    'astroglide',
-    'astroid',
-    'astrophel',
-    'asva',
-    'at-',
-    'ataka',
-    'ataque',
-    'atat',
-    'atat&uuml;rk',
-    'atca',
-    'atchley',
-    'atelopus',
-    'athetoid',
     'athi',
-    'athina',
-    'athlant',
-    'athleta',
-    'atlanticists',
-    'atmos',
-    'atmx',
-    'atomica',
-    'atomise',
-    'atos',
-    'atque',
-    'atrans',
-    'attagirl',
-    'attatched',
-    'attende',
-    'attention-demanding',
     'attention-gaining',
-    'atthe',
-    'attilla',
-    'attini',
-    'attn',
-    'attock',
-    'attorned',
-    'attorney-',
-    'au-pairing',
-    'auberges',
-    'auchen',
-    'auchterader',
-    'auchtergaven',
-    'auck',
-    'audemer',
-    'audenshaw',
     'audience-grabbing',
-    'audio-guide',
-    'audiogram',
-    'audiometer',
-    'audit-ing',
-    'audre',
-    'augenlicht',
-    'augereau',
-    'augusti',
-    'aukward',
-    'aul&euml',
-    'aulin',
-    'aultnamain',
-    'aumonier',
-    'auntient',
-    'aur',
     'aureol',
-    'aures',
-    'aurignacian',
-    'auroux',
-    'ausonius',
-    'ausscot',
-    'austenitic',
-    'austro',
-    'auterfoits',
-    'author-in-hiding',
-    'auto-',
-    'autodialler',
-    'autoflow',
-    'autogiros',
-    'autohelm',
-    'autolocator',
     'autonomizing',
-    'autoprint',
-    'autoregistry',
-    'autorit&eacute',
-    'autosport',
-    'autostrade',
-    'autotrace',
-    'autotype',
-    'autour',
-    'autrui',
-    'autumnola',
-    'autumntide',
-    'auug',
-    'auw',
-    'auxetophones',
-    'avaialble',
     'availability-for-work',
-    'avant-gardist',
-    'avante-garde',
-    'avast',
-    'avay',
-    'avdel',
-    'averbuch',
-    'avertin',
-    'aviating',
-    'avicenna',
-    'avionex',
-    'avocado-lime',
-    'avonmore',
-    'avouching',
-    'avp',
-    'avtur',
     'awaked',
-    'award-related',
-    'away-from',
-    'aweary',
-    'awestricken',
-    'awf',
-    'awful_lot',
-    'awight',
-    'axeen',
-    'axil-220',
-    'axime',
-    'axiom(s)',
-    'axlan',
-    'axolotl',
-    'aylett',
-    'ayurveda',
     'ayyubid',
-    'azaire',
-    'azelle',
-    'azerbaidjani',
-    'azincourt',
-    'azmi',
-    'azpeitia',
-    'b&acirc;rladeanu',
-    'b&eacute;b&eacute;ar',
-    'b&eacute;n&eacute;teaus',
-    'b&ecirc;tises',
-    'b&ndash;17ds',
-    'b&oslash;rresen',
-    'b&uuml;chel',
-    'b-1c',
-    'b-29s',
     'b-311',
-    'b-36',
-    'b-boy',
-    'b-carotene',
-    'b-chop',
-    'b-cll1',
-    'b-lymphoma',
-    'b-model',
-    'b-registration',
-    'b-string',
-    'b-team',
-    'b-thromboglobulin',
-    'b.ed.',
-    'b.m.w.',
-    'b1.8scfv-momlv',
-    'b61',
     'ba&scaron;t&ecaron',
-    'ba&uuml;l',
-    'ba-bird',
-    'baa\'th',
-    'baaing',
-    'babich',
-    'babkins',
-    'babt',
-    'babuic',
-    'baby-carriage',
-    'baby-eating',
-    'baby-farming',
-    'baby-minding',
-    'baby-snatching',
-    'babyfeeding',
-    'babymilk',
     'babyrousa',
-    'bacarisse',
-    'bacchantes',
-    'back&mdash',
-    'back-dating',
-    'back-fill',
-    'back-filled',
-    'back-packing',
-    'back-rest',
-    'back-siphoning',
-    'back-titration',
-    'back-to',
-    'back-to-nature',
-    'back_on',
-    'backbarrow',
-    'backett',
     'backgrounded',
-    'backhouses',
-    'backo',
-    'backpacked',
-    'backroad',
-    'backroads',
-    'backscratch',
-    'backswept',
-    'bactria',
-    'bad&rehy;tempered',
-    'bad-light',
-    'bad-luck',
-    'bad-mouth',
-    'bad-weather',
-    'baddish',
-    'badesee',
     'badhaus',
-    'badian',
-    'badische',
-    'badland',
-    'badly-fitting',
-    'badly-produced',
-    'baeza',
-    'bag-man',
-    'baga',
-    'bagg',
-    'baggage-handling',
-    'bagge',
-    'baggrave',
-    'bagh',
-    'baghill',
-    'baginton',
     'bagnoli',
-    'bagrit',
-    'bagthorpe',
-    'bah&aacute\'&iacute;s',
-    'bahar',
-    'bahro',
-    'baigels',
-    'baii',
-    'bailie-substitute',
-    'bailieborough',
-    'bailli&egrave;re',
-    'baiser',
-    'baker-bessmertnykh',
-    'bakfark',
-    'bakhtar',
-    'bakhtir',
     'bakoyiannis',
-    'bakram',
-    'bakufu-',
-    'bal&scaron;i&cacute;i',
-    'balach',
-    'balakrishnan',
-    'balance-of-payment',
-    'balatore',
-    'balcary',
-    'balcony-access',
-    'bald-faced',
-    'baldie',
-    'baldini',
-    'baldirzade',
-    'baldus',
-    'baleares',
     'baleh',
-    'balemartine',
-    'balfarg',
-    'balking',
-    'balkwell',
-    'ball-carrier',
-    'ball-juggling',
-    'ball-shape',
-    'ballan',
-    'ballast-heaving',
-    'ballasting',
-    'ballee',
-    'balloon-borne',
-    'balloon-busting',
-    'ballot-paper',
-    'balls-out',
     'ballsed',
-    'ballycoan',
-    'ballyduggan',
-    'ballyhane',
-    'ballyhooed',
-    'ballymagroarty',
-    'ballynafeigh',
-    'ballyroney',
-    'ballystate',
-    'ballyveamore',
-    'ballyvourney',
-    'balmaceda',
-    'balmpot',
-    'baloch',
-    'balsas',
-    'baltaci',
     'balthild',
-    'balti',
-    'baluch',
-    'balzany',
-    'bamboozles',
-    'bambrough',
-    'bambusa',
-    'bamh',
-    'bami',
-    'bammy',
-    'banana-leaf',
-    'banana-skin',
-    'band-stand',
-    'bandai',
-    'banded-mail',
-    'bandmate',
     'bando',
-    'baneasa',
-    'bangerter',
-    'bangin\'',
-    'banija',
-    'banjoed',
-    'bank-account',
-    'bank-based',
-    'bank-manager',
-    'banking-up',
-    'banner-hung',
-    'banon',
-    'banovi&cacute',
-    'bantam-weight',
-    'baoshan',
-    'baptizatus',
     'bar-built',
-    'bar-owner',
-    'bar-type',
-    'baracchini',
-    'baracus',
-    'baraka',
-    'baranowski',
-    'baratha',
-    'barathes',
-    'baraza',
-    'barbie-doll',
-    'barbur',
-    'barclaybank',
-    'barclays-style',
-    'barcoded',
-    'bardo',
     'barechested',
-    'barelegged',
-    'barelegs',
-    'baretta',
-    'bargain-hunter',
-    'bargain-price',
-    'bargirl',
-    'baric',
-    'bario',
-    'barisal',
-    'barisic',
-    'barkay',
-    'barkis',
-    'barlett',
-    'barley-bread',
-    'barlund',
     'barn-door',
-    'barnesy',
-    'barnhaven',
-    'barnhorne',
-    'barnumising',
-    'baromix',
-    'baronetcies',
-    'baronscourt',
-    'baroque-style',
-    'barp',
-    'barqu',
-    'barracouta',
-    'barraged',
-    'barrault',
-    'barreh',
-    'barret',
     'barricklow',
-    'barripper',
-    'barriques',
-    'barrowing',
-    'barrowland',
-    'barrowman',
-    'barrs',
-    'barseb&auml;ck',
-    'barsham',
-    'bartelski',
-    'barter-based',
-    'bartholomews',
-    'bartjan',
-    'bartolome',
-    'bartolozzi',
-    'bartramia',
     'bartunek',
-    'baruffini',
-    'barzun',
-    'bascom',
-    'bascome',
-    'bascules',
-    'base-base',
-    'base-board',
-    'base-load',
-    'baseband',
-    'baselining',
-    'basely',
-    'basha',
-    'bashin\'',
-    'basilikon',
-    'basket-ball',
     'basket-weaver',
-    'basketmaking',
-    'basketweave',
-    'basman',
-    'basow',
-    'bassani',
-    'bassanos',
-    'bassarids',
-    'bassatne',
-    'bassilekin',
-    'baster',
-    'bastesen',
-    'bastid',
-    'bastogne',
-    'bat-detector',
-    'bat-fowling',
     'batbayar',
-    'batch\'',
-    'batchwood',
-    'batemans',
-    'batho',
-    'bathplug',
-    'batian',
-    'batleys',
-    'batllista',
-    'battallion',
-    'battant',
-    'battells',
-    'batterbee',
-    'battery-time',
-    'battiness',
-    'battle-gear',
     'battle-training',
-    'battle-zone',
-    'battleby',
-    'baty',
-    'baudoin',
-    'bauernmarkt',
-    'bauge',
-    'baume',
-    'baumeister',
-    'baumgartner',
-    'bauteil',
-    'bayarsuren',
-    'baygard',
-    'bayla',
-    'baylet',
-    'bayoneting',
     'bayonetted',
-    'bayonnais',
-    'bayoumi',
-    'bazan',
-    'bazil',
-    'bbctv',
-    'bbt',
-    'bcab',
-    'bccp',
-    'bccs',
-    'bcoa',
-    'bcop',
-    'bdafsa',
-    'bdma',
-    'be-5',
-    'beach-front',
     'beachie',
-    'beachmaster',
-    'beaconing',
-    'beadlet',
-    'beafra',
-    'beakshape',
-    'beam-line',
-    'beamon',
-    'beancounters',
-    'beant',
-    'bear-faced',
-    'bear-hugging',
-    'bear-rug',
-    'bearcoat',
-    'bearden',
-    'beardy',
     'beare',
-    'bearnaise',
-    'bearpits',
-    'beast-fable',
-    'beatbox',
-    'beatties',
-    'beaudouin',
-    'beaupuy',
-    'beauti',
-    'beckingham',
-    'beckinton',
-    'beclouded',
-    'becu',
-    'bed-pan',
-    'bed-roll',
-    'bed-side',
     'bed-space',
-    'bedbound',
-    'bedchair',
-    'bedcradle',
-    'beddable',
-    'bedfast',
-    'bedoun',
-    'bedrule',
-    'bedstone',
-    'bee-flower',
-    'bee-sting',
-    'bee-stung',
-    'beechmast',
-    'beef-rearing',
-    'beef-tea',
-    'beem',
     'been\'',
-    'beer-bottle',
-    'beer-gut',
-    'beer-hall',
-    'beetson',
-    'befeathered',
-    'before\'',
-    'before-tax',
-    'befoul',
-    'beggar-my-neighbour',
-    'begging-letter',
-    'beginning\'',
-    'begl&egrave;s',
-    'beglye',
-    'beguines',
-    'behaviour-modelling',
     'behindhand',
-    'beignets',
-    'beik',
-    'beilstein',
-    'beinge',
-    'beir',
-    'beirne',
-    'bekerian',
-    'bekkersdal',
-    'bel-air',
-    'belaguer',
-    'beland',
-    'belaruse',
-    'belasis',
-    'belcastro',
-    'belchatow',
     'belene',
-    'belfastman',
-    'belfiore',
-    'belfort',
-    'belgroves',
-    'belief-gathering',
-    'belisha',
-    'belittlin\'',
-    'beljame',
-    'bell-boy',
-    'bell-button',
-    'bellac',
-    'bellair',
-    'bellairs',
-    'bellhops',
-    'bellisle',
     'bellver',
-    'belman',
-    'below-cost',
-    'below-strength',
-    'below-the-belt',
-    'bels',
-    'belsham',
-    'belt-drive',
-    'belzebub',
-    'bemerkungen',
-    'ben-porat',
-    'benameur',
-    'benavente',
-    'bencini',
-    'benedicto',
-    'benedikte',
     'benefit-related',
-    'benesch',
-    'beneteau',
-    'benifit',
-    'benifits',
-    'beningborough',
-    'benjies',
-    'benllech',
-    'benlox',
-    'benmohamed',
-    'bennlech',
-    'benoic',
-    'benoir',
-    'benoliel',
-    'benpres',
-    'bensalem',
     'bent-kneed',
-    'bent-leg',
-    'bentall',
-    'bentong',
-    'bentos',
-    'bentovim',
-    'bents',
-    'benumbing',
-    'benzie',
-    'benzoate',
-    'beo',
-    'beorn',
-    'bequai',
-    'bequiffed',
-    'berakah',
-    'berat',
     'bercea',
-    'berchoux',
-    'bercula',
-    'berd',
-    'berengier',
-    'berezevoi',
-    'bergama',
-    'bergens',
-    'bergere',
-    'bergfalke',
-    'bergham',
-    'bergland',
-    'bergmonck',
-    'bergognone',
-    'bergsten',
-    'berjaya',
     'berkertex',
-    'berling',
-    'berlingske',
-    'berlinguet',
-    'bernadino',
-    'bernasconi',
-    'bernat',
-    'bernelle',
-    'bernes',
-    'berno',
-    'beroldingen',
-    'berossus',
-    'berried',
-    'bersham',
-    'bertalan',
-    'bertrank',
     'berwicke',
-    'berwicks',
-    'besar',
-    'beseeches',
-    'beseige',
-    'beserk',
-    'besi',
-    'besigye',
-    'besmirches',
-    'besse',
-    'best-armed',
-    'besterfield',
-    'bestiame',
-    'bestie',
-    'bestinfo',
-    'bestway',
     'beta-test',
-    'beter',
-    'bethoe',
-    'bethurum',
-    'betsan',
-    'bettabuys',
-    'bettaney',
-    'bettany',
-    'better&mdash',
-    'better&rehy;known',
-    'better\'',
-    'better-ball',
-    'better-documented',
-    'better-lit',
-    'better-run',
-    'betti',
     'betting-slip',
-    'between-ness',
-    'betweens',
-    'beu',
-    'beubler',
-    'bevel-edge',
-    'beverleys',
-    'bewickii',
-    'bex',
-    'bfc',
-    'bficc',
-    'bfpos',
-    'bhagyanagar',
-    'bhaluk',
-    'bhg',
-    'bhikku',
     'bhindi',
-    'bhopali',
-    'bhsai',
-    'bhundri',
-    'bi-partisanship',
-    'biberbrugg',
-    'bible-box',
-    'bible-selling',
-    'bichat',
-    'bichromate',
-    'bick',
-    'bicket',
-    'bickies',
-    'bicoloured',
-    'bicorn',
-    'bicton',
     'bid-offer',
-    'bidart',
-    'biemiller',
-    'bienvenu',
-    'bifa',
-    'bifano',
-    'bifd',
-    'biffos',
-    'biffs',
-    'big-capacity',
-    'big-car',
-    'big-mouth',
-    'big-occasion',
-    'big-salary',
-    'big-science',
-    'big-wall',
     'bigga',
-    'bigge',
-    'bignews',
-    'bigshots',
-    'bij',
-    'bikash',
-    'bike-riding',
-    'bikkies',
-    'bilaleet',
-    'bilijana',
-    'bilip',
-    'bill-hook',
-    'billhooks',
-    'billposting',
-    'billstock',
-    'billy-can',
     'billygram',
-    'bilzerian',
-    'bimco',
-    'bin-bag',
-    'binch',
-    'binding-face',
-    'bindloss',
-    'bine',
-    'bingo-caller',
-    'binnenhof',
-    'binnerton',
-    'binny',
-    'bintang',
-    'bio-contour',
-    'bio-diversity',
-    'bio-power',
     'bioanalysis',
-    'biocatalysis',
-    'biochem',
-    'biodiv',
-    'bioelectromagnetic',
-    'bioelectromagnetics',
-    'biofilter',
-    'biog',
-    'bioglan',
-    'bioko',
-    'bioleaching',
-    'biolight',
-    'biomedicine',
-    'biomembranes',
-    'biopoint',
-    'biopol',
     'bioreactor',
-    'biorich',
-    'biosearch',
-    'biotechnology-based',
-    'biovema',
-    'bipacked',
-    'biranese',
-    'birchbank',
-    'bird\'',
-    'bird-cage',
-    'bird-drawing',
-    'bird-feather',
-    'bird-footed',
-    'bird-hunting',
-    'bird-keeping',
-    'bird-swat',
     'bird-wing',
-    'birdwhistell',
-    'birkeland',
-    'birkenhead-based',
-    'birkenstocks',
-    'birrer',
-    'birth-date',
-    'birth-day',
-    'birth-rights',
-    'biscuit-barrel',
-    'bisi',
-    'biskra',
-    'bismallah',
-    'bismarckstrasse',
-    'bissel',
-    'bisses',
     'bisseuil',
-    'bissick',
-    'bisulan',
-    'biswal',
-    'bit-player',
-    'bitat',
-    'bitchin\'',
-    'bitlis',
-    'bittsevsky',
-    'biv',
-    'bivalved',
-    'bivvying',
-    'bjp-controlled',
-    'blaarkop',
-    'blacburn',
-    'blachford',
     'black-and-ambers',
-    'black-and-tan',
-    'black-bodied',
-    'black-body',
-    'black-chalk',
-    'black-comedy',
-    'black-lead',
-    'black-led',
-    'black-mail',
-    'black-on-black',
-    'blackbean',
-    'blackborne',
-    'blackcurranty',
-    'blacke',
-    'blackfaced',
-    'blackhaired',
     'blackhills',
-    'blackhole',
-    'blackleaded',
-    'blackpool-based',
-    'blackridge',
-    'blackstuff',
-    'bladder-grass',
-    'bladderwrack',
-    'blaese',
-    'blagayatch',
-    'blags',
-    'blaiken',
-    'blak',
-    'blammo',
-    'blanc\'',
-    'blanchet',
     'blandishing',
-    'blanning',
-    'blasp',
-    'blat',
-    'blathwayt',
-    'blatting',
-    'blattlhof',
-    'blaw',
-    'blayton',
-    'blazened',
-    'blazoning',
-    'bleaberry',
-    'bleakdown',
-    'bleared',
-    'blebbing',
-    'blech',
     'blechman',
-    'blee',
-    'bleeding-time',
-    'bleepy',
-    'bleich',
-    'blenkin',
-    'blennerhassett',
-    'blepharitis',
-    'blerk',
-    'bleuet',
-    'bleugh',
-    'bleus',
-    'blewberry',
-    'blimy',
-    'blind-eye',
-    'blind-folded',
     'blmc',
-    'block-house',
-    'blod',
-    'bloem',
-    'blonded',
-    'blood-brother',
-    'blood-dripping',
-    'blood-grouping',
-    'blood-hound',
-    'blood-orange',
-    'blood-poisoning',
-    'blood-shedding',
-    'blood-spitting',
-    'blook',
-    'blow\'n\'curl',
-    'blow-football',
     'blowaway',
-    'blowdrying',
-    'blowfield',
-    'blowjobs',
-    'blowout',
-    'bloxford',
-    'blu-tac',
-    'blubs',
-    'bludgeons',
-    'blue\'',
-    'blue-blood',
-    'blue-clad',
-    'blue-jowled',
-    'bluecol',
-    'bluemen',
-    'bluenose',
     'bluestripe',
-    'blumenfeld',
-    'blunt-spoken',
-    'blush-tinted',
-    'blushbaby',
-    'blut',
-    'bmps',
-    'bn.',
-    'bnes',
-    'bo&ccedil;us',
-    'bo&euml;sset',
-    'boak',
-    'boalch',
-    'board-sponsored',
-    'boat-haling',
-    'boat-owner',
     'boath',
-    'boatswains',
-    'bobby-sox',
-    'bobbying',
-    'bobbys',
-    'bobwhite',
-    'bocconi',
-    'bockenfeld',
-    'bockley',
-    'bocskay',
-    'boddenham',
-    'boddies',
-    'bodey',
-    'bodkins',
-    'bodvoc',
-    'body-covering',
     'body-fat',
-    'body-making',
-    'body-mass',
-    'body-mind-spirit',
-    'body-odour',
-    'body-popping',
-    'body-puncher',
-    'body-shaping',
-    'body-shop',
-    'body-snatching',
-    'body-warmer',
-    'bodybags',
-    'bodyboarding',
-    'bodychecked',
-    'bodyfit',
-    'bodysurfed',
     'boedeker',
-    'boehemer',
-    'boeninger',
-    'boesset',
-    'boettner',
-    'boezem',
-    'bog-roll',
-    'bogey-man',
-    'bogi',
-    'bogles',
-    'bogosian',
-    'bogsiders',
-    'boguslaw',
-    'boh&eacute;me',
-    'bohea',
-    'bohncke',
     'boiffard',
-    'boil-in-the-bag',
-    'boilin\'',
-    'boiling-water',
-    'boime',
-    'boisrond',
-    'boj',
-    'bokes',
-    'bolanos',
-    'bolet',
-    'bollo',
-    'bolt&eacute',
-    'bolterol',
-    'boltgun',
-    'bolz',
-    'bomb-shelter',
     'bomba',
-    'bombes',
-    'bombproof',
-    'bombus',
-    'bompito',
-    'bonae',
-    'bond-angle',
-    'bond-dealer',
-    'bond-holder',
-    'bond-stretching',
-    'bondy',
-    'bone-ash',
-    'bone-cracking',
-    'bone-eating',
-    'bone-graft',
-    'bone-shaking',
     'bone-shuddering',
-    'bone-working',
-    'bonefield',
-    'bonehead',
-    'bonfante',
-    'boniek',
-    'bonnefous',
-    'bonsam',
-    'bonsch',
-    'bonusprint',
-    'boogiemen',
-    'book-based',
-    'book-end',
-    'book-jacket',
-    'book-trade',
-    'book/record',
     'booka',
-    'booklovers',
-    'bookseller-publisher',
-    'bookwise',
-    'booky',
-    'boolootian',
-    'boom-time',
-    'boooooom',
-    'boop-oop-a-doop',
-    'boostin\'',
-    'boot-blacking',
-    'boot-button',
-    'booth.',
-    'borah',
-    'borchgrevink',
-    'border-hopping',
     'borelli',
-    'borgen',
-    'borger',
-    'borisa',
-    'borislav',
-    'borman',
-    'bornatt',
-    'boroughmonger',
-    'borrowash',
-    'borrowin\'',
-    'borsum',
-    'boscart',
-    'boskovits',
-    'bosmere',
-    'bosox',
-    'boss-eyed',
     'boss-in-waiting',
-    'bossman',
-    'bosso',
-    'bost',
-    'bostik',
-    'bosuns',
-    'botanique',
-    'botb',
-    'both\'',
-    'botos',
-    'botticker',
-    'bottle-brush',
-    'bottle-opener',
-    'bottlebrush',
-    'bottom-fermenting',
-    'botusharova',
     'bouabid',
-    'boubares',
-    'bouche',
-    'boudhnath',
-    'boukar',
-    'boukrouh',
-    'boulters',
-    'bouraq',
-    'bourcart',
-    'bourgeoisified',
-    'bourgh',
-    'bourgueil',
-    'bournissen',
-    'boutie',
-    'bouyant',
-    'bovisand',
     'bow-front',
-    'bowdlerise',
-    'bowdry',
-    'bowet',
-    'bowl-back',
-    'box\'',
-    'box-containing',
-    'box-fish',
-    'box-iron',
-    'box-set',
-    'boy-child',
-    'boy-life',
-    'boy-scout',
-    'boycotters',
-    'boyers',
-    'boyko',
     'boyland',
-    'boyter',
-    'bozell',
-    'bozzie',
-    'bpif',
-    'bpnorway',
-    'bpsa',
-    'br&uuml;back',
-    'br&uuml;nn',
-    'braathens',
-    'brabantpark',
-    'bracegirdle',
-    'brachiating',
-    'brachiopoda',
-    'brachycephalic',
-    'bracteate',
     'bradby',
-    'braddocks',
-    'bradewell',
-    'bradin',
-    'braeriach',
-    'brain-case',
-    'brain-death',
-    'brake-fluid',
-    'brakeman',
-    'brambell',
-    'bramblevale',
-    'brambly',
-    'bramer',
-    'bramston',
-    'branch-colour',
-    'branchy',
     'brandmark',
-    'brass-railed',
-    'brassnick',
-    'bratska',
-    'brattish',
-    'brazing',
-    'breacon',
-    'breadcrumbed',
-    'breadlines',
-    'breadsall',
-    'break-outs',
-    'breakdance',
-    'breakfast-hour',
-    'breamish',
-    'brearly',
-    'breast-side',
     'breastfeeds',
-    'breastroke',
-    'breath-held',
-    'breathing-out',
-    'brecher',
-    'brecker',
-    'brecks',
-    'bredwardine',
-    'breeching',
-    'breeng',
-    'breeveld',
-    'breeze-blown',
-    'breger',
-    'breken',
-    'brelstaff',
-    'bremel',
     'brentcross',
-    'bresciani',
-    'bretesche',
-    'bretfords',
-    'brettingham',
-    'breugel',
-    'breuhat',
-    'bria',
-    'brian-type',
-    'brick-and-tile',
-    'brick-layer',
-    'brickbuilt',
-    'brickwood',
-    'brickworking',
-    'bricom',
-    'brider',
     'brides-to-be',
-    'bridewells',
-    'bridgemans',
-    'bridgemarsh',
-    'bridgewaters',
-    'bridnorth',
-    'briggait',
-    'bright-field',
-    'bright-headed',
-    'bright-yellow',
-    'brined',
-    'brinker',
-    'brinkmann',
-    'brinks',
-    'brisch',
-    'brissard',
     'bristol-born',
-    'briston',
-    'britaine',
-    'britannis',
-    'british-backed',
-    'british-equity',
-    'brittans',
-    'brittle-bone',
-    'brittonioni',
-    'broad&rehy;chested',
-    'broad-breasted',
-    'broadbrush',
-    'broadbum',
-    'broadus',
-    'brochwel',
-    'brocks',
     'broda',
-    'broder',
-    'brodiaea',
-    'brodigan',
-    'brodski',
-    'broeck',
-    'broils',
-    'broke-even',
-    'broked',
-    'brome',
-    'bromobenzene',
-    'broniwan',
-    'bronterre',
-    'bronze-casting',
-    'brooklynese',
-    'brookmount',
     'brookvale',
-    'broombriggs',
-    'broomhouse',
-    'brossolette',
-    'brother\'',
-    'brother-',
-    'broule',
-    'brouncker',
-    'browbones',
-    'browed',
-    'brown-edged',
-    'brown-gold',
-    'brownish-black',
-    'brownish-pink',
-    'brownish-purple',
-    'browny-grey',
     'brrrm',
-    'bruchid',
-    'brucke',
-    'bruckerl',
-    'bruel',
-    'brufen',
-    'bruggen',
-    'brummagem',
-    'brunelli',
-    'brunels',
-    'bruneval',
-    'brunico',
-    'brush-strip',
-    'brutalist',
-    'brutalize',
-    'bruyere',
     'bruyette',
-    'brynamman',
-    'bryncoch',
-    'bryniau',
-    'brzezicki',
-    'bsdc',
-    'bsec',
-    'bsteii',
-    'btb',
-    'btv-10',
-    'buarque',
-    'buba',
-    'bubble-bath',
-    'bubi',
-    'buchli',
-    'buchon',
     'buckell',
-    'buckeroos',
-    'bucket-shop',
-    'bucksburn',
-    'bud-burst',
-    'buddery',
-    'budlet',
-    'bueller',
-    'buenaventura',
-    'buffery',
-    'bufflehead',
-    'bug-fix',
-    'bugg',
-    'buggeration',
-    'buggin\'',
-    'bugi',
     'bugio',
-    'buh-buh',
-    'buildmark',
-    'built-cane',
-    'buironfosse',
-    'buist',
-    'bujic',
-    'buka',
-    'bukharan',
-    'bukowski',
-    'bulaxie',
-    'buldir',
-    'bule',
-    'bulled',
-    'bullet-point',
-    'bulletin\'',
     'bulley',
-    'bullheaded',
-    'bullhorns',
-    'bullick',
-    'bullnose',
-    'bulls-eye',
-    'bullshitted',
-    'buluk',
-    'bumbler',
-    'bumper-to-bumper',
-    'buna',
-    'bunger',
-    'bunne',
-    'bupacare',
-    'bupati',
-    'buprenorphine',
     'burali',
-    'burao',
-    'buraq',
-    'burawoy',
-    'burcott',
-    'burderop',
-    'burdocks',
-    'bureaucratize',
-    'burgas',
-    'burgerking',
-    'burgrave',
-    'burgruine',
-    'burhinus',
-    'burkert',
-    'burki',
-    'burlesqued',
     'burlesquing',
-    'burling',
-    'burndell',
-    'buro',
-    'burried',
-    'burring',
-    'bursted',
-    'burty',
-    'buru',
-    'burwardsley',
-    'bus-based',
-    'bus-boy',
-    'busey',
-    'bush-fallowing',
-    'bush-fire',
-    'bush-hat',
     'bushwhacked',
-    'bushwing',
-    'business-cycle',
-    'business-woman',
-    'businesse',
-    'busquin',
-    'busser',
-    'bussmann',
-    'bustan',
-    'butcher-bird',
-    'butt-indicator',
-    'butta',
-    'buttasuoco',
-    'butten',
-    'butterfly-net',
-    'butterkist',
     'button-fly',
-    'button-making',
-    'buttonhook',
-    'buv',
-    'buy-and-hold',
-    'buyer-seller',
-    'buzz-bomb',
-    'buzz-phrase',
-    'buzzcock',
-    'bvdg',
-    'by-and-by',
-    'by-and-large',
-    'by-the-castle',
-    'byass',
-    'byegone',
-    'bygd&oslash;y',
     'bygrave',
-    'byrite',
-    'bytex',
-    'byton',
-    'byward',
-    'bywyd',
-    'c&ndash;fobe',
-    'c\'n',
-    'c-46',
-    'c-47',
-    'c-7',
-    'c-boundary',
-    'c-citrulline',
-    'c-come',
-    'c-l',
-    'c-nmr',
     'c-vit',
-    'c0',
-    'c101',
-    'c200',
-    'c3-6&lsqb;pvm39&rsqb',
-    'c916',
-    'ca:p',
-    'cabaero',
-    'caban',
-    'cabbage-green',
-    'cabbing',
-    'cabdriver',
-    'cabin\'',
-    'cable-controlled',
-    'cablesystems',
-    'caboose',
     'cabragh',
-    'caca',
-    'cacak',
-    'cachar',
-    'cacheris',
-    'cacked',
-    'cackup',
-    'cadby',
-    'caddisflies',
-    'caderni',
-    'cadilhe',
-    'cadney',
-    'cadran',
-    'caerbwdy',
-    'caerfai',
-    'caerulescens',
     'caesaristic',
-    'caesaropapism',
-    'cafer',
-    'cafu',
-    'caglione',
-    'cahag',
-    'caim',
-    'caio',
-    'caira',
-    'caire',
-    'cairnbaan',
-    'cairnholy',
-    'cairo-based',
-    'cajabamba',
-    'cake-making',
-    'cakile',
     'caladrius',
-    'calamari',
-    'calan',
-    'calandrella',
-    'calanoid',
-    'calanques',
-    'calathea',
-    'calcium-phosphorus',
-    'calcomp',
-    'calcott',
-    'calendared',
-    'calenders',
-    'calhaem',
-    'calicos',
-    'call-and-response',
-    'callanan',
     'callgirl',
-    'callhaven',
-    'calliphoridae',
-    'callitriche',
-    'callouts',
-    'calor-gas',
-    'caloria',
-    'calorie-counted',
-    'calorifiers',
-    'calot',
-    'calotype',
-    'calotypes',
-    'calp',
-    'calpe',
-    'calpurnia',
-    'calren',
     'caltag',
-    'calvani',
-    'calydonian',
-    'cam&otilde;es',
-    'camaldolese',
-    'camattini',
-    'cambeak',
-    'cambricks',
-    'cambridge-',
-    'cambro-ordovician',
-    'camel-corps',
-    'camelopardalis',
-    'camerarius',
-    'cames',
-    'camlab',
-    'camlough',
     'camon',
-    'camoran',
-    'camplex',
-    'campop',
-    'campus-based',
-    'cana-indian',
-    'canace',
-    'canape',
-    'canborough',
-    'cancale',
-    'cance',
-    'cancell',
-    'cancer-fighting',
-    'candao',
-    'candleflame',
-    'cane-cutting',
     'cane-seated',
-    'canella',
-    'canem',
-    'caners',
-    'canhedo',
-    'cannel',
-    'cannelini',
-    'cannibalises',
-    'cannnot',
-    'canonica',
-    'canonicus',
-    'canonising',
-    'canoodle',
-    'canossa',
-    'canot',
-    'canta',
     'cantarero',
-    'cantarini',
-    'cantaten',
-    'cantaur',
-    'canteena',
-    'canteloupe',
-    'cantharides',
-    'cantine',
-    'cantoris',
-    'cants',
-    'cantz',
-    'canutes',
-    'canuto',
-    'canzona',
-    'canzonetten',
-    'capacity-reduction',
     'capels',
-    'capercaillies',
-    'capered',
-    'capex',
-    'capi',
-    'capillarity',
-    'capiot',
-    'capital-exporting',
-    'capital-raising',
-    'capitant',
-    'capito',
-    'caplin',
-    'caporal',
-    'capparis',
-    'cappelletti',
-    'cappielow',
     'capps',
-    'capriccios',
-    'captain-in-waiting',
-    'captal',
-    'captioning',
-    'capucin',
-    'car-',
-    'car-alarm',
-    'car-crash',
-    'car-producing',
-    'car-sick',
-    'car-theft',
-    'carabid',
-    'caram',
-    'caramelise',
-    'carbamate',
     'carbol',
-    'carbon-containing',
-    'carbon-metal',
-    'carbon-paper',
-    'carbonhydrate',
-    'carcassone',
-    'carceri',
-    'carcharias',
-    'carciofi',
-    'card-sharp',
-    'card-sorting',
-    'cardfile',
-    'cardoon',
-    'cardphones',
-    'carducci',
-    'care-excluding',
     'care-link',
-    'care-related',
-    'care-taker',
-    'career-break',
-    'career-making',
-    'carelle',
-    'carent',
-    'carents',
-    'caret',
-    'carfin',
-    'carignon',
-    'carinae',
-    'carleen',
-    'carlungie',
-    'carmagnole',
-    'carmedy',
     'carmoisine',
-    'carmula',
-    'carnauba',
-    'carnavon',
-    'carnduff',
-    'carnock',
-    'carnovsky',
-    'carol-ini-ana',
-    'carolee',
-    'caromed',
-    'carozzi',
-    'carpeaux',
-    'carpellary',
-    'carpentering',
-    'carpenting',
-    'carperby',
     'carpet-cleaning',
-    'carpetbagger',
-    'carracks',
-    'carratu',
-    'carreres',
-    'carri',
-    'carrickmacross',
-    'carrollton',
-    'carry-outs',
-    'carsa',
-    'carslake',
-    'carsound',
-    'carthago',
-    'cartuja',
-    'carved-wood',
-    'caryopteris',
     'casagrande',
-    'casapalca',
-    'casbar',
-    'cascio',
-    'case-',
-    'case-report',
-    'casebere',
-    'caseworking',
-    'cash-call',
-    'cashiering',
-    'casiraghi',
-    'casken',
-    'casnoff',
-    'casselman',
-    'cassette-tape',
-    'cassetted',
     'cassian',
-    'cassidys',
-    'cassier',
-    'cassiope',
-    'castagna',
-    'castellani',
-    'castelucci',
-    'casti',
-    'castlecroft',
-    'castled',
-    'castlederg',
-    'castlefield',
-    'castlemain',
-    'castleman',
-    'castlemoreton',
-    'castlerea',
     'castlewood',
-    'casto',
-    'castoff',
-    'castra',
-    'castratrix',
-    'castres',
-    'castroite',
-    'castrucci',
-    'casuarius',
-    'cat\'',
-    'cat-',
-    'cat-boat',
-    'cat-box',
-    'cat-hater',
-    'cat-headed',
-    'catacol',
     'catalanism',
-    'catalepsean',
-    'catanach',
-    'catarrhed',
-    'catch-line',
-    'catch-word',
-    'catchlord',
-    'catcote',
-    'catechise',
-    'catechize',
-    'caterbility',
-    'cath&eacute;drale',
-    'cathar',
-    'catherineofaragon',
-    'catholique',
-    'catlet',
     'catlow',
-    'catnaps',
-    'catonica',
-    'catshead',
-    'catsi',
-    'cattle-byre',
-    'cattle-mesh',
-    'cattle-owning',
-    'cattle-rustling',
-    'cattle-truck',
-    'cattoes',
-    'catus',
-    'cauce',
-    'cauchemar',
-    'cauden',
-    'caughts',
     'caulker',
-    'caundle',
-    'causier',
-    'cauterising',
-    'cauvary',
-    'cave-man',
-    'cawdy-mawdies',
-    'cayleyed',
-    'cazal',
-    'cazaudehore',
-    'cazimir',
-    'cbus',
-    'cc-m4',
-    'ccir-601',
-    'ccu',
-    'cd8-fitc',
     'cear&aacute',
-    'ceasar',
-    'ceasg',
-    'ceat',
-    'cebotari',
-    'cecchetti',
-    'cedco',
-    'cedria',
-    'ceed',
-    'cega',
-    'celebrare',
-    'celi',
-    'celje',
-    'cellaring',
-    'cellulose-based',
-    'celmira',
     'celui',
-    'cemwc',
-    'cent\'',
-    'centaurium',
-    'centerprise',
-    'central-area',
-    'centralises',
-    'centralista',
-    'centre-based',
-    'centre-circle',
-    'centre-designed',
-    'centre-related',
-    'centrestage',
-    'centrex',
-    'centuriated',
-    'century\'',
     'ceol',
-    'cepba',
-    'cepeda',
-    'cepple',
-    'cepror',
-    'cerec',
-    'cereclor',
-    'cereopsis',
-    'cerisy',
-    'cerius',
-    'cernach',
-    'cernyw',
-    'cerrado',
-    'certen',
-    'ceruletide',
-    'cerva',
     'cervinia',
-    'cervinus',
-    'cesari',
-    'ceserani',
-    'cess-pit',
-    'cetrimide',
-    'cevik',
-    'cfc-containing',
-    'cfms',
-    'cgce',
-    'ch\'kasia',
-    'ch-1211',
-    'cha-cha',
-    'chaboulon',
-    'chabrol',
-    'chack\'ed',
     'chaetognatha',
-    'chagan',
-    'chagnon',
-    'chagueramas',
-    'chaikin',
-    'chaillu',
-    'chairlegs',
-    'chairn',
-    'chairpeople',
-    'chairside',
-    'chaises',
-    'chal',
-    'chaldean',
-    'chalk-free',
-    'chalkhill',
-    'cham&aelig;leon',
     'chamberpots',
-    'chambrun',
-    'chameau',
-    'chameleoleech',
-    'chamonix-mount',
-    'champery',
-    'championship-standard',
-    'chancellorships',
-    'chancellory',
-    'chandran',
-    'chanel-type',
-    'channel-hopping',
-    'chanonry',
-    'chanteuses',
-    'chantreux',
-    'chaolais',
     'chappaquiddick',
-    'char-a-banc',
-    'character-sketch',
-    'chareau',
-    'chargeurs',
-    'chargin\'',
-    'chargrilled',
-    'chariot-race',
-    'charissa',
-    'charit&eacute',
-    'charitas',
-    'charite',
-    'charlott',
-    'charlson',
-    'charmante',
-    'chartac',
     'charthouse',
-    'chartjunk',
-    'charvet',
-    'chas\'n\'dave',
-    'chasid',
-    'chasing-up',
-    'chasselas',
-    'chastanet',
-    'chattaway',
-    'chatter-filled',
-    'chaud',
-    'chbada',
-    'cheandearg',
-    'chear',
-    'cheavley',
-    'checking-up',
     'checkmating',
-    'checkstay',
-    'cheerful-looking',
-    'cheerleading',
-    'cheese-board',
-    'cheese-grater',
-    'cheesemongers',
-    'cheeseparing',
-    'cheeseplant',
-    'cheesewright',
-    'cheiranthus',
-    'chekol',
-    'chelsey',
-    'chemi-zorb',
-    'cheminova',
-    'chemometrics',
     'chemstations',
-    'chenard',
-    'chene',
-    'chenery',
-    'chengmon',
-    'chenu',
-    'chepchuk',
-    'cheque-cashing',
-    'chercher',
-    'cherednik',
-    'cherles',
-    'chernobyl-style',
-    'cheron',
-    'cherry-blossom',
-    'chery',
-    'chesh',
     'chesire',
-    'chess-piece',
-    'chesshyre',
-    'chessy',
-    'chest-height',
-    'cheswick',
-    'chettiars',
-    'chevreuil',
-    'chewers',
-    'cheyette',
-    'chhay',
-    'chhukha',
-    'chiado',
-    'chicagoan',
-    'chichi',
-    'chick-pea',
     'chicken-based',
-    'chicoutimi',
-    'chida',
-    'chieftancy',
-    'child-based',
-    'child-gazing',
-    'child-killing',
-    'child-king',
-    'child-man',
-    'childed',
-    'chilies',
-    'chillery',
-    'chilley',
-    'chim&uacute',
-    'chimay',
-    'chimborazo',
     'chimpanzee-gorilla',
-    'chin-wag',
-    'chineseness',
-    'chini',
-    'chinn-dearg',
-    'chino-based',
-    'chinyou',
-    'chip-per',
-    'chip-shop',
-    'chipande',
-    'chipps',
-    'chiricahuas',
-    'chirurgeons',
-    'chitted',
-    'chitting',
-    'chiusi',
     'chiveface',
-    'chiweta',
-    'chl',
-    'chlamys',
-    'chloasma',
-    'chlordane',
-    'chlorella',
-    'chlorobutadiene',
-    'chlorothiazide',
-    'chlorpheniramine',
-    'chodacki',
-    'choenyi',
-    'chogram',
-    'choinnich',
-    'choir-boy',
-    'choke-free',
     'cholesterol-containing',
-    'chollah',
-    'chollerford',
-    'chompers',
-    'chooseexposure',
-    'chopping-block',
-    'chorasmian',
-    'chordata',
-    'chordettes',
-    'chorine',
-    'chorrillo',
-    'chota',
-    'chots',
-    'chr&eacute;tiens',
-    'chrichton',
-    'chrisme',
     'chriss',
-    'christ-figure',
-    'christian-humanist',
-    'christianize',
-    'christiansson',
-    'christlike',
-    'christmastide',
-    'christophene',
-    'chromatid',
-    'chromosome-7',
-    'chron',
-    'chrysal',
-    'chuc',
-    'chuch',
-    'chuckball',
-    'chuffer',
     'chuffs',
-    'chuirn',
-    'chukar-type',
-    'chummed',
-    'chuna',
-    'chunder',
-    'chunked',
-    'chuon',
-    'chuquicamata',
-    'church-building',
-    'church-life',
-    'churchilliana',
-    'churriguera',
-    'chusing',
-    'chuters',
-    'chuuk',
     'chuy',
-    'ciampino',
-    'ciara',
-    'ciba-tran',
-    'cicatrices',
-    'cicily',
-    'cicognini',
-    'cidaroid',
-    'cidre',
-    'cielo',
-    'cierach',
-    'ciftci',
-    'cigar-puffing',
-    'cigar-smoking',
-    'cigarette-end',
-    'ciim',
     'cilasun',
-    'cilgerran',
-    'cilt',
-    'cimarron',
-    'cimtech',
-    'cin&eacute;-weave',
-    'cinchonero',
-    'cinema\'',
-    'cinema-screen',
-    'cinemagic',
-    'cinerama',
-    'cinereus',
-    'cinetropolis',
-    'cioch',
-    'ciosc',
-    'cipollino',
     'cipressi',
-    'ciprico',
-    'circini',
-    'circking',
-    'circuit-board',
-    'circuit-training',
-    'circularised',
-    'circum',
-    'circum-pacific',
-    'circumcized',
-    'circumstanced',
-    'cirl',
-    'cirrhotics',
-    'cisl',
-    'cistine',
-    'cito',
     'citoyen',
-    'citrated',
-    'citrussy',
-    'citties',
-    'city-council',
-    'city-dwelling',
-    'city-region',
-    'city-republics',
-    'city-type',
-    'city-wall',
-    'cives',
-    'civette',
-    'civilis',
-    'cizye',
-    'clackety-clack',
-    'claires',
     'clairette',
-    'clamant',
-    'clamoring',
-    'clapper-board',
-    'claptout',
-    'clarety',
-    'clarkia',
-    'class&eacute',
-    'claudianus',
-    'clave',
-    'claver&iacute;a',
-    'clavipes',
-    'clawfist',
-    'clay-based',
-    'clay-puddled',
-    'clean-sheet',
     'clean-sweep',
-    'cleaning-out',
-    'cleaning-woman',
-    'clearlogistics',
-    'clearly-stated',
-    'clearpoint',
-    'clearquality',
-    'clearsupport',
-    'clearview',
-    'clec',
-    'cleggan',
-    'cleisthenes',
-    'clemmey',
-    'clemo',
-    'clericalis',
-    'clericals',
     'clericorum',
-    'clerisy',
-    'clermiston',
-    'clethra',
-    'clever-clogs',
-    'climap',
-    'climbeth',
-    'clinkered',
-    'clippins',
-    'clipso',
-    'clitomachus',
-    'cloathbond',
-    'cloathing',
-    'clock-case',
-    'clock-doubling',
-    'clock-shifting',
     'clockers',
-    'clockspring',
-    'clode',
-    'clomipramine',
-    'clon',
-    'cloncarrig',
-    'clonliffe',
-    'clono',
-    'close-harmony',
-    'close-look',
-    'close-ratio',
-    'close-spaced',
-    'closely-contested',
-    'closing-out',
-    'clothes-press',
-    'clothespegs',
     'cloud-covered',
-    'cloudberries',
-    'club-member',
-    'club-room',
-    'clublife',
-    'cluett',
-    'clulow',
-    'clunio',
-    'cluster-based',
-    'clysmic',
-    'cmf',
-    'cmft',
-    'cmu',
-    'cnidaria',
-    'cnim',
-    'cnip',
     'cno',
-    'co&ndash;ordinated',
-    'co&ntilde;ac',
-    'co-curated',
-    'co-driven',
-    'co-funding',
-    'co-habitating',
-    'co-headline',
-    'co-immunoprecipitates',
-    'co-infected',
-    'co-owned',
-    'co-presented',
-    'co-referring',
-    'co-rotating',
-    'co-write',
-    'coa',
     'coach-building',
-    'coachworks',
-    'coagulating',
-    'coal-fire',
-    'coal-gas',
-    'coal-owner',
-    'coal-powered',
-    'coal-producing',
-    'coal-shed',
-    'coalified',
-    'coalmerchant',
-    'coalpicker',
-    'coar',
-    'coarn',
-    'coarse-featured',
-    'coast-guard',
     'coast-line',
-    'coastliner',
-    'coat-armour',
-    'coat-hook',
-    'coat-stand',
-    'coatalen',
-    'coatman',
-    'coba',
-    'cobbet',
-    'cobbleigh',
-    'cobern/supporters',
-    'coboller',
-    'cobtree',
-    'coburg-trained',
-    'cocaine-dealing',
-    'cocaine-producing',
     'cocaine-smuggling',
-    'cock-er-nee',
-    'cock-of-the-rock',
-    'cock-teaser',
-    'cockaded',
-    'cockahoop',
-    'cockatiels',
-    'cockeram',
-    'cockington',
-    'cockscomb',
-    'cocoapops',
-    'cococay',
-    'cocody',
-    'code(s)',
-    'code-cracker',
-    'codebreaking',
     'coder-decoder',
-    'codford',
-    'codice',
-    'codlin',
-    'codominant',
-    'coeloms',
-    'coenwealh',
-    'cofan',
-    'coff-',
-    'coffea',
-    'cofiant',
-    'cogema',
-    'cogeval',
-    'cognee',
-    'cogniot',
-    'cognitive-behaviour',
     'coiffuring',
-    'coille',
-    'coin-box',
-    'coin-slot',
-    'cointat',
-    'coity',
-    'coked',
-    'col.-',
-    'cola-based',
-    'colard',
-    'colarossi',
-    'colax',
-    'colcemid',
-    'colchinine',
-    'cold&rehy;blooded',
-    'cold-',
     'cold-cream',
-    'coldframe',
-    'colege',
-    'colegrove',
-    'colestrial',
-    'coligny',
-    'colincamps',
-    'colinvaux',
-    'collaring',
-    'collaris',
-    'colleage',
-    'colleages',
-    'collectio',
-    'collector-emitter',
-    'college\'',
-    'collegia',
     'collegiants',
-    'collery',
-    'collessie',
-    'colli',
-    'colligate',
-    'collineige',
-    'collingtree',
-    'collivaccinus',
-    'colloqui',
-    'collotypes',
-    'colobanthus',
-    'colocalized',
-    'colombiano',
-    'colorblend',
-    'colorich',
-    'colorplus',
     'colour-blindness',
-    'colour-pattern',
-    'colportage',
-    'colte',
-    'colting',
-    'columbiade',
-    'columbium',
-    'comacina',
-    'comags',
-    'combien',
-    'combined-cycle',
-    'comcast',
-    'comcon',
-    'come_out',
-    'comfar',
-    'comfort\'',
     'comici',
-    'comick',
-    'comigrates',
-    'commem',
-    'commensalism',
-    'commensality',
-    'commer',
-    'commercial-debt',
-    'commerciales',
-    'commercially-made',
-    'commiserates',
-    'commissary-general',
-    'committ',
-    'committin\'',
-    'commmittee',
-    'commoditized',
     'commodity-based',
-    'commodity-fetishism',
-    'common-base',
-    'common-user',
-    'commonwheal',
-    'communalist',
-    'communist-sponsored',
-    'community-related',
-    'comnet',
-    'comodious',
-    'comp&egrave;red',
-    'compacta',
-    'compagnonnage',
-    'compaignye',
-    'company\'',
-    'company-',
     'company-loving',
-    'companyline',
-    'compar',
-    'comparables',
-    'comparison-contrast',
-    'comparm',
-    'compartmentalises',
-    'compeed',
-    'compenetrazione',
-    'comperes',
-    'competence-led',
-    'competitve',
-    'completed&lcub',
-    'completers',
-    'compleynt',
-    'composit',
     'composited',
-    'compositus',
-    'compromis',
-    'comptronix',
-    'compus',
-    'computability',
-    'computer-operated',
-    'computer-science',
-    'computer-search',
-    'computer-supported',
-    'computer-to-computer',
-    'computer-tomography',
-    'computer-use',
-    'computerwatch',
-    'comservices',
-    'comt',
     'comtat',
-    'comunn',
-    'concaves',
-    'concept-driven',
-    'concert-master',
-    'concertina-ed',
-    'conchiglie',
-    'conchs',
-    'conciergerie',
-    'concilii',
-    'conciones',
-    'concocts',
-    'concours',
-    'concreto',
-    'condorrat',
-    'conern',
     'confessionalist',
-    'confiance',
-    'confidence\'',
-    'conflict-solving',
-    'confr&egrave;re',
-    'confute',
-    'congers',
-    'congreso',
-    'coniacian',
-    'conisborough',
-    'conisbrough',
-    'conjugating',
-    'conjunctival',
-    'connectic',
-    'connells',
-    'conning-tower',
     'connives',
-    'connubii',
-    'conrods',
-    'conron',
-    'consanguine',
-    'consat',
-    'consciousness-raiser',
-    'consejo',
-    'consensus-seeking',
-    'conservatorium',
-    'considine',
-    'consolatione',
-    'consonant-vowel',
-    'constipatied',
-    'constitutionally-minded',
-    'constitutionelle',
     'constr',
-    'consulates-general',
-    'consumate',
-    'consumer-credit',
-    'contact-tracing',
-    'contact-zone',
-    'contain\'',
-    'contains&mdash;source&mdash;of',
-    'contarini',
-    'contax',
-    'contemplatio',
-    'contemptu',
-    'contendere',
-    'contents-density',
-    'context\'',
-    'continuous-feed',
     'contracan',
-    'contracted-exit',
-    'contrejour',
-    'contro',
-    'control-freak',
-    'controling',
-    'controlled-environment',
-    'contruction',
-    'convenant',
-    'conventionalised',
-    'conventioneers',
-    'conversation-stopping',
-    'conversazione',
-    'convicing',
-    'convivium',
-    'conybeare',
     'coo-ed',
-    'coochy-cooed',
-    'cookii',
-    'coolin',
-    'coollattin',
-    'coolmax',
-    'coopt',
-    'coor',
-    'cootchy',
-    'copenhagener',
-    'copenhageners',
-    'coping-stone',
-    'coposu',
-    'coppel',
-    'copper(ii)',
-    'copper-7',
     'coppering',
-    'coppid',
-    'coprinus',
-    'coprophagy',
-    'copulates',
-    'copy-number',
-    'copy-pad',
-    'copyguarding',
-    'coquetting',
-    'coracoid',
-    'corail',
-    'corat',
-    'corbit',
-    'corca',
-    'corcione',
-    'corcuero',
     'cordtex',
-    'core-electron',
-    'core-funding',
-    'coreference',
-    'coria',
-    'corieltavi',
-    'corimme',
-    'corinthe',
-    'cork-screw',
-    'corkage',
-    'cormier',
-    'corn-goddess',
-    'corn-route',
-    'corn-yellow',
-    'corna',
-    'cornbread',
     'cornel',
-    'cornholme',
-    'corniglia',
-    'cornist',
-    'cornovii',
-    'cornstall',
-    'cornu',
-    'corporate-level',
-    'corpusized',
-    'corradini',
-    'corrall',
-    'corrance',
-    'correlli',
-    'correspondence-',
-    'corriendo',
-    'corrieu',
     'corrosion-proofer',
-    'corrrespondent',
-    'corruptione',
-    'corrymella',
-    'corsas',
-    'corsino',
-    'cortile',
-    'cortland',
-    'corvina',
-    'cosalt',
-    'cosep',
-    'cosey',
-    'cosio',
-    'coslet',
-    'cosmeticized',
-    'cosner',
     'cosponsored',
-    'cossec',
-    'cossets',
-    'cossetted',
-    'cost-a-lot',
-    'cost-of-ownership',
-    'cost-price',
-    'costeley',
-    'costie',
-    'costwold',
-    'cosway',
-    'cosying',
-    'cosystems',
-    'cotac',
-    'cotchin',
-    'coterminosity',
     'cotherston',
-    'cothi',
-    'cotleigh',
-    'coto',
-    'cotopaxi',
-    'cottage-based',
-    'cottagy',
-    'cottingley',
-    'cotton-based',
-    'cotton-reel',
-    'cotton-spinner',
-    'cottontail',
-    'cottown',
-    'couglan',
-    'coulommiers',
-    'coulure',
     'council-built',
-    'councill',
-    'councilling',
-    'councillor-officer',
-    'counselling-learning',
-    'counter-act',
-    'counter-order',
-    'counter-plot',
-    'counter-punched',
-    'counter-punching',
-    'counter-shaded',
-    'counter-shading',
-    'counterattacking',
-    'counterblasts',
-    'countermarched',
-    'counteroffers',
     'counterplots',
-    'countershocks',
-    'countervail',
-    'country\'',
-    'country-rock',
-    'couple\'',
-    'coupleness',
-    'courchamps',
-    'couriered',
-    'couronne',
-    'couronnement',
-    'course-number',
-    'court-',
-    'court-based',
-    'court-case',
-    'courtisane',
     'courtrai',
-    'couvade',
-    'covariate',
-    'covenant-agreement',
-    'cover-girl',
-    'cover-line',
-    'coverin\'',
-    'coverline',
-    'covilham',
-    'covina',
-    'cow-pat',
-    'cow-town',
-    'cowabongga',
-    'cowdung',
-    'cowley-built',
-    'cox\'n',
     'coxley',
-    'coxshall',
-    'cp-3',
-    'cpap',
-    'cpj',
-    'cpma',
-    'cpr-number',
-    'cpu-info.exe',
-    'cqt',
-    'cr&ecirc;py',
-    'crack-stopping',
-    'crackwalker',
-    'cragabus',
-    'craigar',
-    'craigavad',
-    'craiglynn',
     'craigmiller',
-    'craigshill',
-    'craigtara',
-    'craigwell',
-    'crakehall',
-    'cranesbills',
-    'cranson',
-    'crash-land',
-    'crashed-landed',
-    'crating',
-    'crau',
-    'craw-thumping',
-    'cray-4',
-    'crazing',
-    'crazyhead',
-    'cream-skimming',
     'creameries',
-    'creamstick',
-    'crease-free',
-    'creaunce',
-    'credit-bearing',
-    'credit-creation',
-    'credo-bit',
-    'creeler',
-    'creesh',
-    'cregar',
-    'creil',
-    'crelinsten',
-    'crenellate',
-    'crenicara',
-    'crenicichla',
-    'crenna',
     'crenosoma',
-    'creoleness',
-    'creoser',
-    'creosoting',
-    'crepe-de-chine',
-    'crerar',
-    'crescent-moon',
-    'cresent',
-    'cressent',
-    'cresser',
-    'crestar',
-    'crestatus',
-    'creusot',
-    'crevassed',
-    'crevecoeurs',
-    'crewel-work',
     'crib-biter',
-    'cribben',
-    'cribbin',
-    'cribby',
-    'crime-prevention',
-    'crime-related',
-    'crimi',
-    'crin',
-    'cringle',
-    'crippin',
-    'crisis-intervention',
-    'crispate',
-    'crispi',
-    'criss&rehy;crossed',
-    'crisscrosses',
-    'crissie',
     'crist&oacute;bal',
-    'cristalize',
-    'critical-path',
-    'crocean',
-    'crochet-work',
-    'crocketed',
-    'crocuta',
-    'crois',
-    'cromemco',
-    'cronite',
-    'crookston',
-    'crooksy',
-    'cropmark',
-    'cropthorne',
-    'croque',
-    'croser',
     'cross-appealed',
-    'cross-collaterisation',
-    'cross-correlation',
-    'cross-fertilize',
-    'cross-funding',
-    'cross-guard',
-    'cross-kick',
-    'cross-licence',
-    'cross-match',
-    'cross-member',
-    'cross-plot',
-    'cross-referred',
-    'cross-referring',
-    'cross-related',
-    'cross-roc',
-    'cross-sectoral',
     'cross-subject',
-    'cross-tabulating',
-    'cross-term',
-    'cross-word',
-    'crossey',
-    'crossframe',
-    'crosshatched',
-    'crossing-sweeper',
-    'crosspeaks',
-    'crostini',
-    'crotons',
-    'crotty',
-    'croud',
-    'croustade',
-    'crow-keeping',
-    'crowd-surfing',
     'crowding-out',
-    'crown-owned',
-    'crowso',
-    'crozet',
-    'crrick',
-    'cruach',
-    'cruachem',
-    'cruces',
-    'crucifige',
-    'crudele',
-    'crudup',
-    'cruickshanks',
-    'cruig-morn',
-    'cruisy',
-    'crumbed',
-    'crumpalls',
     'crumply',
-    'crushed-velvet',
-    'cruxes',
-    'cruzes',
-    'crx-48z',
-    'cryed',
-    'cryla',
-    'cryogenics',
-    'cryptates',
-    'crypto-fascist',
-    'crystal-gazing',
-    'csee',
-    'csicseri',
-    'csillick',
-    'cssr',
-    'csutcb',
     'ct-133',
-    'cth',
-    'ctlo',
-    'ctm',
-    'ctu',
-    'cty',
-    'cuased',
-    'cubatao',
-    'cubbinses',
-    'cubo',
-    'cubo-futurist',
-    'cucina',
-    'cuckolds',
-    'cuckoo-spit',
-    'cud-chewing',
-    'cue-ball',
     'cuerden',
-    'cufton',
-    'cukurca',
-    'culag',
-    'culms',
-    'culra',
-    'cultiver',
-    'cultural-capital',
-    'culwiniac',
-    'cumaean',
-    'cumbering',
-    'cumberledge',
-    'cumbers',
-    'cumbley',
-    'cumhuriyet',
-    'cumulativeness',
     'cunnah',
-    'cuno',
-    'cunobelinus',
-    'cuntano',
-    'cuntonas',
-    'cuo',
-    'cupid\'s-bow',
-    'cupw',
-    'curetting',
-    'curialist',
-    'curiositas',
-    'curioso',
-    'curiosum',
-    'curme',
-    'curraghbinny',
-    'currans',
     'currency-earning',
-    'current-voltage',
-    'current-year',
-    'curriculum-making',
-    'cusping',
-    'custard-skin',
-    'custodia',
-    'custom-house',
-    'customer-contractor',
-    'customer-number',
-    'cut-your-loss',
-    'cutress',
-    'cutt',
-    'cuttinge',
-    'cutv',
-    'cuz',
     'cvdesign',
-    'cvejic',
-    'cvm',
-    'cvware',
-    'cwmni',
-    'cyanate',
-    'cyberman',
-    'cybershit',
-    'cyclamate',
-    'cyclo-cross',
-    'cyclocontrol',
-    'cyder',
-    'cyg',
-    'cylinder-mould',
-    'cymbalines',
-    'cymreig',
     'cymric',
-    'cynarae',
-    'cypressoid',
-    'cyprimat',
-    'cyprinid',
-    'cyprinids',
-    'cypselids',
-    'cyriac',
-    'cythera',
-    'cytob',
-    'cytocentrifuge',
-    'cytochemistry',
-    'cytodex',
-    'cytophaga',
-    'czechoslovak-made',
-    'd&eacute;champs',
     'd&eacute;j',
-    'd&eacute;lices',
-    'd&eacute;livrance',
-    'd&eacute;mod&eacute',
-    'd\'ambert',
-    'd\'arch&eacute;ologie',
-    'd\'arco',
-    'd\'entreprise',
-    'd\'etre',
-    'd\'oil',
-    'd\'ombres',
-    'd\'y\'all',
-    'd(cgcxaattygcg)',
-    'd-dimer',
-    'd-proline',
-    'd-series',
     'd.c',
-    'd115',
-    'd2-mac',
-    'd45',
-    'daah',
-    'dable',
-    'dachsteins',
-    'dacm',
-    'dad\'',
-    'dad-to-be',
-    'daevid',
-    'daggy',
-    'daghir',
-    'dahik',
-    'dahlak',
-    'dahlgren',
     'dahran',
-    'daidan',
-    'daigneault',
-    'daiichi',
-    'daimones',
-    'dairnt',
-    'dairut',
-    'dairy-maid',
-    'daishin',
-    'dakole',
-    'dal&iacute;s',
-    'dalar',
-    'dalekmania',
-    'daler',
-    'dalia',
-    'dalibor',
     'dalisandos',
-    'dalla',
-    'dallas-born',
-    'dallas-style',
-    'dallington',
-    'dalziell',
-    'dam-burst',
-    'damen',
-    'damestic',
-    'damion',
-    'damnified',
-    'damnwell',
-    'damozel',
-    'dampt',
-    'dan.',
-    'danaus',
     'dance\'',
-    'dancemasters',
-    'dancercise',
-    'dancing-master',
-    'dand',
-    'dandini',
-    'dandruff-laden',
-    'danelectro',
-    'danino',
-    'danjuma',
-    'danko',
-    'danned',
-    'danocrine',
-    'danso',
-    'danta',
-    'danto',
     'danu-isation',
-    'daochos',
-    'dapped',
-    'dapples',
-    'daraprim',
-    'darbakalan',
-    'darbo',
-    'darch',
-    'darg',
-    'dargecit',
-    'darier',
-    'dark-gold',
-    'dark-ground',
-    'darlingi',
-    'darlingtonian',
-    'darlink',
     'daron',
-    'darroch',
-    'dartnall',
-    'darwin\'',
-    'darwish',
-    'dasd',
-    'dashamir',
-    'data-bank',
-    'data-file',
-    'data-flow',
-    'data-monitoring',
-    'data-pump',
-    'datachase',
-    'dataclub',
-    'dataflow',
-    'datamonitor',
     'datar',
-    'dataram',
-    'datarecorders',
-    'datasheet',
-    'datatech',
-    'dataterm',
-    'datatree',
-    'datatrends',
-    'datatypes',
-    'datelined',
-    'datini',
-    'datrontech',
-    'daukes',
-    'daulat',
-    'daunsinge',
-    'davedoyle',
     'davent',
-    'daveytown',
-    'davidsonian',
-    'davross',
-    'day-',
-    'day-dreamer',
-    'day-flying',
-    'day-work',
-    'day.',
-    'dayadhvam',
-    'dayle',
-    'daynafile',
-    'dazing',
-    'dazix',
-    'dc-4',
-    'dc-600b',
     'dc-7b',
-    'dc-based',
-    'dca-3',
-    'de-accessioning',
-    'de-blocking',
-    'de-bottlenecking',
-    'de-coding',
-    'de-control',
-    'de-counted',
-    'de-coupling',
-    'de-emphasises',
-    'de-focussing',
-    'de-fragment',
-    'de-historicized',
-    'de-horned',
-    'de-industrialising',
     'de-motivated',
-    'de-oxygenated',
-    'de-politicising',
-    'de-programmed',
-    'de-rail',
-    'de-recognizing',
-    'de-regulated',
-    'de-sexing',
-    'de-stress',
-    'de-train',
-    'de-tuning',
-    'de-watering',
-    'dead-flat',
-    'dead-heated',
-    'dead-letter',
-    'deadish',
     'deadwater',
-    'deae-sephacel',
-    'deaky',
-    'deanesy',
-    'death-cell',
-    'death-drive',
-    'death-in-life',
-    'death-rattle',
-    'death-sentence',
-    'death-threat',
-    'deathlessness',
-    'deathrate',
-    'deathtongue',
-    'deaver',
-    'deba',
-    'debauching',
     'debeers',
-    'debet',
-    'debieux',
-    'debilitate',
-    'debouch',
-    'debrecen',
-    'debska',
-    'debt-collection',
-    'debt-forgiveness',
-    'debt-relief',
-    'debt-waiver',
-    'debusk',
-    'debye',
-    'decarbonising',
-    'dechlorinate',
-    'decimalized',
     'decimates',
-    'decio',
-    'deck-beam',
-    'deckled',
-    'declair',
-    'declease',
-    'declutching',
-    'decodings',
-    'decolonise',
-    'decolourises',
-    'decompact',
-    'decompresses',
-    'deconjugate',
-    'deconvoluted',
-    'deconvolution',
-    'decouple',
     'decr',
-    'decretales',
-    'decriminalized',
-    'dedifferentiate',
-    'deee',
-    'deeg',
-    'deems-figure',
-    'deep-acting',
-    'deep-dish',
-    'deep-end',
-    'deep-lined',
-    'deep-mine',
-    'deep-pan',
-    'deep-penetrating',
-    'deep-ploughing',
-    'deerleaps',
     'defant',
-    'defensive-minded',
-    'deferre',
-    'defragmenter',
-    'defrocking',
-    'deglaze',
-    'degree-giving',
-    'dehavilland',
-    'dehisced',
-    'dehistoricized',
-    'deicing',
-    'deinomenid',
-    'deiter',
-    'dejure',
-    'delange',
-    'delbruck',
     'delfim',
-    'delhi-based',
-    'delic',
-    'delinked',
-    'delinking',
-    'deliyannis',
-    'dell\'arco',
-    'dellenbaugh',
-    'delocalizing',
-    'delouche',
-    'deloused',
-    'delousing',
-    'delport',
-    'delumptious',
-    'delvers',
-    'demagnetised',
     'demainetos',
-    'demand-',
-    'demand-supply',
-    'dematerialized',
-    'demax',
-    'demby',
-    'demetriou',
-    'demi-caract&eacute;re',
-    'demi-pension',
-    'demianuk',
-    'deminished',
-    'demisemiquavers',
-    'demission',
-    'demmollari',
-    'demobilising',
-    'democracy\'',
     'democraten',
-    'democratic-controlled',
-    'democray',
-    'demoed',
-    'demokrat',
-    'demonising',
-    'demoss',
-    'demurrage',
-    'demyelinating',
-    'demythologised',
-    'denaturalizing',
-    'dencher',
-    'dendix',
-    'dendre',
-    'dendrogram',
-    'denemy',
     'deneside',
-    'dengie',
-    'dengo',
-    'deniau',
-    'deniker',
-    'denisoff',
-    'denitrator',
-    'denitrified',
-    'denke',
-    'denofa',
-    'denry',
-    'densimeter',
-    'dentary',
-    'dentils',
-    'denyse',
-    'deoch',
     'deoxygenated',
-    'deoxyribonuclease',
-    'deoxyriboses',
-    'deparis',
-    'departamento',
-    'depaulo',
-    'depc',
-    'dependables',
-    'dephosphorylated',
-    'depitting',
-    'depolarise',
-    'depolarised',
-    'depolarising',
-    'deposit-based',
-    'deposit-insurance',
-    'depot-based',
     'depraves',
-    'depressed\'',
-    'depth-charged',
-    'depth-interviewing',
-    'derab',
-    'derails',
-    'derbyshire-born',
-    'derecho',
-    'dermacort',
-    'dermo',
-    'derning',
-    'derryk',
-    'derryman',
-    'deryabin',
-    'desaguadero',
-    'desalinated',
     'description-type',
-    'desensitising',
-    'desensitized',
-    'desexualised',
-    'desexualized',
-    'desgranges',
-    'desiccant',
-    'design-in',
-    'design-related',
-    'design-room',
-    'desirables',
-    'desjardins',
-    'desk-lamp',
-    'deskfax',
-    'desking',
-    'deskjets',
     'desolate-looking',
-    'despatch-case',
-    'desperus',
-    'dessent',
-    'dessicated',
-    'dessin&eacute;e',
-    'destouches',
-    'destructuring',
-    'detective-superintendent',
-    'determind',
-    'detesting',
-    'dethier',
-    'detonates',
-    'detraining',
-    'deutschelands',
-    'devalerian',
     'deve',
-    'development\'',
-    'developpement',
-    'devicehigh',
-    'devil\'',
-    'devil-worshipper',
-    'devil-worshipping',
-    'devitrify',
-    'devreer',
-    'devtram',
-    'dewart',
-    'dewe',
-    'dewfall',
-    'dewilde',
-    'dewsnap',
-    'dexies',
     'dexon',
-    'dfi',
-    'dgft',
-    'dgxii',
-    'dhairbhreach',
-    'dharam',
-    'dharsana',
-    'dholuo',
-    'dhoog',
-    'dhoon',
-    'dhruv',
-    'dhsi',
-    'di\'ed',
-    'di\'ing',
-    'diaboli',
-    'diabolicum',
     'diacetylene',
-    'diadems',
-    'diagram\'',
-    'diagraming',
-    'diagramming',
-    'dial-a-bus',
-    'dial-a-ticket',
-    'dialability',
-    'dialcom',
-    'dialindex',
-    'dialytrode',
-    'diamagnetic',
-    'diamantino',
-    'diametric',
-    'diametrically-opposed',
-    'dianetics',
     'diaphragm-type',
-    'diapirism',
-    'diaried',
-    'diarralite',
-    'diawl',
-    'dibbits',
-    'dibnah',
-    'dibs',
-    'dick-tionary',
-    'dicking',
-    'dicksee',
-    'dicranopteris',
-    'dictat',
-    'dictogloss',
-    'diddymen',
-    'didieraceae',
     'didn\'',
-    'didymograptus',
-    'diegetic',
-    'diene',
-    'diesel-engine',
-    'diesel-hauled',
-    'diet-breaking',
-    'dietburger',
-    'dietro',
-    'diff\'rent',
-    'diffferent',
-    'diffic',
-    'difficiles',
-    'digging-stick',
-    'digist',
-    'digitises',
     'digitoxin',
-    'digna',
-    'digoll',
-    'dihydrofolate',
-    'diked',
-    'diko',
-    'dikte',
-    'diletti',
-    'dilga',
-    'diltiazem',
-    'dimi',
-    'dimitar',
-    'dimove',
-    'dimu',
-    'dinamap',
-    'dinant',
     'dinch',
-    'dineen',
-    'dingaling',
-    'dingleside',
-    'dingli',
-    'dingus',
-    'dinlabyre',
-    'dinner-gong',
-    'dinner-plate',
-    'dinu',
-    'diodoro',
-    'diok',
-    'diomed',
-    'dionaea',
-    'dionex',
-    'dip-stick',
     'dip-switch',
-    'diplomatique',
-    'dipnoi',
-    'diprete',
-    'diptychs',
-    'direc',
-    'direct-attached',
-    'direct-broadcast',
-    'direct-entry',
-    'direct-feed',
-    'direct-injection',
-    'directed-energy',
-    'direction\'',
-    'directplus',
-    'dirichlet',
-    'dis-barring',
     'disabled-led',
-    'disad',
-    'disassembles',
-    'disavows',
-    'disbudding',
-    'dischord',
-    'discoed',
-    'discographer',
-    'discommoded',
-    'discosoma',
-    'discountenanced',
-    'discourse\'',
-    'discoveryland',
-    'discret',
-    'discretione',
-    'disease-bearing',
     'disease-producing',
-    'disegno',
-    'disenchanting',
-    'dishabituated',
-    'dishclout',
-    'dishmaking',
-    'disimpacted',
-    'disinhibited',
-    'disklone',
-    'dislay',
-    'disllokey',
-    'dismac',
-    'dismounts',
-    'disneyland-style',
-    'disneylands',
-    'disorganise',
     'dispersionist',
-    'dispraise',
-    'disprin',
-    'disquiets',
-    'disrespected',
-    'dissatisfy',
-    'dissembles',
-    'disseminator',
-    'dissimulare',
-    'distance-making',
-    'distaval',
-    'distraining',
-    'disulfiram',
-    'dithiopin',
-    'dithizone',
-    'dittman',
     'dive-in',
-    'divini',
-    'divinycell',
-    'divisionist',
-    'divsion',
-    'divvent',
-    'diwan',
-    'dixielanders',
-    'djaballah',
-    'djax',
-    'djogo',
-    'djordjevi&cacute',
-    'djore',
-    'djukic',
-    'dk\'tronics',
-    'dme-medium',
     'dmi',
-    'dmitriy',
-    'dna-bending',
-    'dna-fingerprinting',
-    'dna-recognition',
-    'dne',
-    'dnepropetrovsk',
-    'dnu-mrh',
-    'do-',
-    'doba',
-    'dobags',
-    'dobbies',
-    'dobcross',
-    'dobs',
-    'doclea',
-    'documentary-style',
     'dodd-noble',
-    'dodelinger',
-    'doe-skin',
-    'doeringer',
-    'doeskins',
-    'doezema',
-    'dog-handler',
-    'dog-relief',
-    'dog-sled',
-    'dog-tag',
-    'dog-tooth',
-    'doggone',
-    'doglegs',
-    'dogmoor',
-    'dogoh',
-    'dogru',
     'doit',
-    'doko',
-    'dokumente',
-    'dolfin',
-    'dolina',
-    'dolly-bird',
-    'dolopes',
-    'dolphin-language',
-    'dolphineers',
-    'dom&egrave;nech',
-    'domangart',
-    'domestic-equity',
-    'domestique',
-    'donacloney',
-    'donaghys',
-    'donatella',
     'donati',
-    'donbavand',
-    'doncaster-based',
-    'donde',
-    'doned',
-    'donegal-born',
-    'dongbang',
-    'dongs',
-    'donibristle',
-    'donkey-drawn',
-    'donnant',
-    'donnet',
-    'donor-dependence',
-    'donora',
-    'dontcha',
-    'donyo',
     'donzel',
-    'doodad',
-    'doodoo',
-    'dooland',
-    'doole',
-    'doompah',
-    'dooms',
-    'doonan',
-    'doonie',
-    'doop',
-    'door-',
-    'door-panel',
-    'door-plate',
-    'door-pocket',
-    'door-top',
-    'doorlatch',
     'doorstops',
-    'dope-testing',
-    'dopiaza',
-    'dor&eacute;e',
-    'doraiswamy',
-    'dorelia',
-    'dorff',
-    'dorfkeller',
-    'dories',
-    'dorky',
-    'dorl',
-    'dorner',
-    'dornfelder',
-    'dornock',
-    'dornseiff',
-    'doromin',
     'dorp',
-    'dorr',
-    'dorrian',
-    'dorsch',
-    'dosemeter',
-    'dossa',
-    'dosses',
-    'dosso',
-    'dostoevski',
-    'dothan',
-    'dothard',
-    'double-a-plus',
-    'double-cream',
-    'double-dealer',
-    'double-image',
-    'double-minded',
     'double-park',
-    'double-potential',
-    'double-pump',
-    'double-stopping',
-    'double-strength',
-    'double-suckler',
-    'double-tape',
-    'double-wishbone',
-    'double-your-money',
-    'doublecheck',
-    'doughray',
-    'doun',
-    'dounce',
-    'douras',
-    'doute',
-    'douthwaite',
     'dove-tailing',
-    'dovehouse',
-    'dovrefjell',
-    'down&rehy;stairs',
-    'down-faulting',
-    'down-haul',
-    'down-regulate',
-    'down-spiral',
-    'down-tariff',
-    'down-to-earthness',
-    'downcutting',
-    'downend',
-    'downfalls',
-    'downforce',
-    'downhall',
-    'downhaul',
     'downhayes',
-    'downslopes',
-    'downstrokes',
-    'downsview',
-    'downwarped',
-    'dowsons',
-    'dozar',
-    'dozey',
-    'dozo',
-    'dp-se',
-    'dpw',
-    'drabo',
-    'dracaena',
-    'drady',
-    'draegebo',
-    'draft-proofing',
     'drag-producing',
-    'dragonescu',
-    'dragons&mdash',
-    'dragoslav',
-    'draguignan',
-    'drainvalves',
-    'dram-bottle',
-    'drama-based',
-    'drama-school',
-    'draught-excluder',
-    'draught-stripping',
-    'draughtproofed',
-    'draw-gear',
-    'draw-sheet',
-    'drawing-in',
-    'drawing-paper',
     'drawly',
-    'drawne',
-    'drawrod',
-    'drayman',
-    'dre-fach',
-    'dream\'',
-    'dream-filled',
-    'dream-interpretation',
-    'dream-time',
-    'dreame',
-    'dreamer-father',
-    'drechsler',
-    'drennans',
-    'dried-flower',
-    'drift-filled',
-    'driftnetting',
     'driglam',
-    'drill-down',
-    'drillien',
-    'drinan',
-    'drinkall',
-    'drinke',
-    'drinking-chocolate',
-    'drip-feeding',
-    'drive-management',
-    'drive-shaft',
-    'drivin',
-    'driving-related',
-    'drizabone',
-    'droguerie',
-    'drop-ball',
-    'drop-kick',
     'drost',
-    'drotar',
-    'drouet',
-    'drove-road',
-    'drubbed',
-    'druck',
-    'drug-addict',
-    'drug-addiction',
-    'drug-based',
-    'drug-smuggler',
-    'drug-use',
-    'drugstores',
-    'druimnich',
-    'drumahoe',
-    'drumcondra',
-    'drumlin',
     'drunconrath',
-    'druscilla',
-    'drusilla',
-    'drusus',
-    'dry-lay',
-    'dry-out',
-    'dry-shod',
-    'drybroughs',
-    'drydock',
-    'dryoskephalai',
-    'dscs',
-    'dsm-iv',
-    'dsp-e1000',
-    'dsssl',
-    'dtac',
-    'dtms',
     'du-du',
-    'dual-mode',
-    'dual-worker',
-    'duas',
-    'dubajic',
-    'dubbin',
-    'dubbined',
-    'dubblejoint',
-    'dubius',
-    'dubonnet',
-    'duchatelet',
-    'ducie',
-    'ducket',
-    'duckponds',
-    'ducum',
-    'dudders',
     'dudson',
-    'duduc',
-    'dues-paying',
-    'duffa',
-    'duggleby',
-    'duin',
-    'dukedog',
-    'dukla',
-    'dukovany',
-    'dukwe',
-    'dulcolax',
-    'dulse',
-    'dumbfound',
-    'dumbshows',
-    'dumfounded',
-    'dump-truck',
     'dumper-bound',
-    'dunajec',
-    'dunant',
-    'dunap',
-    'dunbui',
-    'duncton-born',
-    'dune-slack',
-    'dungareed',
-    'dunging',
-    'dunker',
-    'dunner',
-    'dunnie',
-    'dunottar',
-    'dunoyer',
-    'dunraven',
-    'dunsany',
     'dunskiag',
-    'duntree',
-    'duong',
-    'duphar',
-    'dupla',
-    'duplexing',
-    'duralumin',
-    'duransoy',
-    'durdle',
-    'duris',
-    'dus',
-    'dusseldorf-based',
-    'dust-filled',
-    'dust-sheet',
-    'dust-storm',
-    'dustbathe',
     'dustbin-lid',
-    'dutchness',
-    'duthoit',
-    'duthuit',
-    'duthy',
-    'duuck',
-    'duul',
-    'duz',
-    'dwan',
-    'dwink',
-    'dwt',
-    'dx2-based',
-    'dybbukking',
-    'dyf',
-    'dyfed-based',
-    'dyked',
     'dylon',
-    'dyn',
-    'dynamitards',
-    'dynamometer',
-    'dynamometers',
-    'dynaspek',
-    'dynastes',
-    'dyner&mdash',
-    'dynorod',
-    'dyw',
-    'dzhugashvili',
-    'dzo',
-    'dzongri',
-    'e&ndash',
-    'e-2300',
-    'e-6000',
     'e-cup',
-    'e-e',
-    'e-mailing',
-    'e-model',
-    'e-pawn',
-    'e-team',
-    'e-vu',
-    'e122',
-    'e124',
-    'each-',
-    'eadem',
-    'eadgbe',
-    'eadweard',
-    'eaf',
-    'eaglemoss',
-    'eaglet',
     'eagley',
-    'eak',
-    'eame',
-    'ear-bending',
-    'ear-catching',
-    'ear-trumpet',
-    'earac',
-    'eardisland',
-    'eare',
-    'earith',
-    'early-19th-century',
-    'early-20th-century',
-    'early-afternoon',
-    'early-bird',
-    'early-life',
-    'early-mid',
     'early-riser',
-    'earned-income',
-    'earnest-looking',
-    'earnmouth',
-    'earnouts',
-    'earnwine',
-    'earth-crossing',
-    'earth-cut',
-    'earth-digested',
-    'earth-man',
-    'earth-mover',
-    'earth-saving',
-    'earthlight',
-    'earthpack',
-    'earthwire',
-    'earzone',
     'easel-mounted',
-    'easi-jacks',
-    'easigrow',
-    'easily-developed',
-    'east-northeast',
-    'east-trending',
-    'eastaway',
-    'eastborough',
-    'eastcroft',
-    'easters',
-    'eastex',
-    'easting',
-    'eastney',
-    'eastport',
-    'eastt',
-    'easy-come',
     'easy-to-hold',
-    'easy-to-store',
-    'eating-time',
-    'ebble',
-    'eberswalde',
-    'ebionite',
-    'ebner',
-    'ebus',
-    'ebyl',
-    'ec-acp',
-    'ec-backed',
-    'ec-german',
-    'ec-japanese',
-    'ec-united',
-    'ecca',
-    'ecclesiasticae',
     'echo-sponsored',
-    'echr',
-    'eco-balance',
-    'eco-glasnost',
-    'ecoaction',
-    'ecomaster',
-    'econom',
-    'economic-recovery',
-    'ecor',
-    'ecotoxicology',
-    'ecrits',
-    'edelrid',
-    'edenbeg',
-    'edge\'',
-    'edgeset',
-    'edin-burg',
     'edinb',
-    'edinshall',
-    'editioned',
-    'editorand',
-    'editorialize',
-    'edku',
-    'edminton',
-    'edsac',
-    'edtv',
-    'education-based',
-    'education-industry',
-    'edule',
-    'edw',
-    'eeee',
-    'eeeeee',
-    'eeenglish',
     'eeeuk',
-    'eeikish',
-    'eel-shaped',
-    'eelgrass',
-    'eeney',
-    'eeoc',
-    'ef1-11',
-    'efc-negative',
-    'effect-to-cause',
-    'effectuated',
-    'effed',
-    'effervescing',
-    'efis',
-    'efra&iacute;n',
-    'eg-3',
-    'egal',
     'egba',
-    'egeler',
-    'egg-chamber',
-    'egg-mass',
-    'egg-rolling',
-    'egg-sucking',
-    'eggcups',
-    'egge',
-    'eggert',
-    'eggshell-blue',
-    'eggsperts',
-    'eginhard',
-    'eglises',
-    'egng',
-    'ego-evolution',
-    'ego-ideal',
     'egorova',
-    'ehirobo',
-    'ehmke',
-    'eichorn',
-    'eickhof',
-    'eics',
-    'eidetik',
-    'eifelian-frasnian',
-    'eigene',
-    'eight\'',
-    'eight-acre',
-    'eight-bed',
-    'eight-club',
-    'eight-country',
-    'eight-court',
-    'eight-footer',
     'eight-place',
-    'eight-state',
-    'eighteen-stone',
-    'eighth-',
-    'eightish',
-    'eij',
-    'eilbeck',
-    'einbender',
-    'eirann',
-    'eisenach',
-    'eisenson',
-    'eisenstat',
-    'eisman',
-    'ejaculates',
-    'ejalu',
-    'ejup',
     'ekofo',
-    'ekonomika',
-    'ekram',
-    'ekstra',
-    'el-fil',
-    'el-lahm',
-    'el-sir',
-    'el-tahrir',
-    'elaf',
-    'elamite',
-    'elas',
-    'elastic-banded',
-    'elastica',
-    'elastogran',
-    'elating',
-    'elberfeld',
     'elchaig',
-    'elde',
-    'eldine',
-    'eldinhope',
-    'eleanore',
-    'electic',
-    'election-fighting',
-    'election-winner',
-    'election-winning',
-    'electrabel',
-    'electribe',
-    'electrical-equipment',
-    'electrically-driven',
-    'electro-',
-    'electro-beat',
-    'electro-deposition',
     'electro-erosion',
-    'electro-fishing',
-    'electrocopying',
-    'electrofished',
-    'electrola',
-    'electroloid',
-    'electromotion',
-    'electromotors',
-    'electron-',
-    'electrospray',
-    'elegia',
-    'eler',
-    'eleusinia',
-    'eleutherai',
-    'eleven-metre',
-    'eleven-month',
     'eleventeen',
-    'elfie',
-    'elfin-faced',
-    'elgol',
-    'eliakim',
-    'eliburn',
-    'eliette',
-    'elihu',
-    'eliis',
-    'eliphaz',
-    'eliz',
-    'elizache',
-    'elkan',
-    'elkhorn',
-    'elko',
-    'ellerdor',
     'ellomeyat',
-    'ellstrand',
-    'elmaloglou',
-    'elmar',
-    'elmsford',
-    'eloping',
-    'elsevere',
-    'elstrup',
-    'eltermere',
-    'elthamensis',
-    'elthor',
-    'elvia',
-    'elway',
-    'elwert',
-    'em\'',
-    'em-4',
     'eman',
-    'emaux',
-    'embarcadero',
-    'embrench&eacute',
-    'emdy',
-    'emel',
-    'emendemus',
-    'emerg',
-    'emess',
-    'emett',
-    'emis',
-    'emjoi',
-    'eml',
-    'emlen',
-    'emmeram',
-    'emos',
     'emoted',
-    'empanel',
-    'empathised',
-    'emperor-worship',
-    'empire-builder',
-    'employee-management',
-    'employment-based',
-    'employment-creating',
-    'emply',
-    'empros',
-    'empty(z)',
-    'empty-looking',
-    'emser',
-    'encainide',
-    'encha&icirc;n&eacute',
-    'enchante',
     'enchilada',
-    'encom',
-    'encombred',
-    'encored',
-    'encounter-group',
-    'encuentro',
-    'enculturated',
-    'encumbent',
-    'end-1985',
-    'end-cap',
-    'end-group',
-    'end-labelling',
-    'end-of-file',
-    'end-of-line',
-    'end-of-scene',
-    'end-of-shoot',
     'end-of-the-pier',
-    'end-state',
-    'endeavored',
-    'endesa',
-    'endgrain',
-    'endit',
-    'endopeg',
-    'endorado',
-    'endothorax',
-    'energiya',
-    'energizer',
-    'energy-conserving',
-    'enesco',
-    'enfeeble',
-    'enfeoffed',
-    'enfer',
     'enfilading',
-    'enflamed',
-    'engagement-ring',
-    'engelhardt',
-    'engineerium',
-    'engl',
-    'english-occupied',
-    'englishe',
-    'engraves',
-    'enj',
-    'enkhari',
-    'enlaced',
-    'ennew',
-    'ennion',
-    'enniscorthy',
-    'enough\'',
     'enqu&ecirc;te',
-    'ensaimada',
-    'ensconsed',
-    'enserune',
-    'ensoniq',
-    'entereth',
-    'enteroendocrine',
-    'enterprisal',
-    'enterprize',
-    'entertainment\'',
-    'entity-type',
-    'entores',
-    'entred',
-    'entrenches',
-    'entryist',
-    'enured',
     'envenom',
-    'environ-xxxx',
-    'environment-compliant',
-    'envnotrev',
-    'envy-guilt',
-    'eohr',
-    'eole',
-    'eothen',
-    'epb',
-    'epec',
-    'ephemeropteran',
-    'epicureanism',
-    'epicycloid',
-    'epiphanes',
-    'episcopi',
-    'epoca',
     'epocha',
-    'epoxied',
-    'eppur',
-    'ept',
-    'epte',
-    'epulario',
-    'epyx',
-    'equidistance',
-    'equit&eacute',
-    'equity-warrant',
-    'equivocator',
-    'eragny',
-    'erai',
-    'eraldin',
-    'eratex',
-    'erbakan',
     'ercols',
-    'eremite',
-    'ergay',
-    'erhart',
-    'eriugena',
-    'erkennungsdienst',
-    'erkki',
-    'erlenmeyer',
-    'ermolenko',
-    'ern&ouml',
-    'erno',
-    'eroticises',
-    'erpingham',
-    'error-handling',
-    'error-ridden',
-    'error-strewn',
     'errrr',
-    'erstogoetsland',
-    'ert',
-    'erythrina',
-    'erzsebet',
-    'es-175',
-    'es-345',
-    'esag',
-    'esap',
-    'esber',
-    'escalus',
-    'escap',
-    'eschenchia',
-    'eschscholzia',
-    'escom',
-    'escovar',
     'escriv&aacute',
-    'esden',
-    'esfahan',
-    'espa&ntilde;ia',
-    'espaliu',
-    'espn',
-    'esposizione',
-    'essais',
-    'essay-type',
-    'esseffs',
-    'esser',
-    'essere',
-    'est&eacute;ban',
-    'est-il',
-    'estalia',
-    'esteeming',
     'esterel',
-    'estovers',
-    'estrellas',
-    'estrie',
-    'eszterhaus',
-    'etchachan',
-    'etemad',
-    'eternit&eacute',
-    'eterno',
-    'ethelbald',
-    'etherised',
-    'ethertalk',
-    'ethic-based',
-    'ethnic-latvian',
-    'ethoxy',
-    'eto',
     'etps',
-    'ettal',
-    'ettre',
-    'etzdorf',
-    'euc',
-    'eucalypt',
-    'eucharistia',
-    'eucryphia',
-    'euenor',
-    'euer',
-    'eulogise',
-    'eumobate',
-    'euphausiid',
-    'eurhythmics',
-    'euro-',
-    'euro-auction',
     'euro-beer',
-    'euro-business',
-    'euro-cd',
-    'euro-christian',
-    'euro-conference',
-    'euro-enthusiast',
-    'euro-equity',
-    'euro-jet',
-    'euro-link',
-    'euro-list',
-    'euro-market',
-    'euro-megalopolis',
-    'euro-soap',
-    'euro-year',
-    'eurobarometer',
-    'euroconvertible',
     'eurocraft',
-    'euromac',
-    'euromagnetics',
-    'europe&mdash',
-    'europeanist',
-    'europeanness',
-    'europesat',
-    'europlants',
-    'eurosceptic',
-    'euryalid',
-    'eusa',
-    'eut',
-    'euthanased',
-    'euton',
-    'euug',
-    'ev-4',
     'evangeliary',
-    'evangelistria',
-    'eveing',
-    'eveningwear',
-    'evensen',
-    'eventdata',
-    'ever-advancing',
-    'ever-burning',
-    'ever-developing',
-    'ever-falling',
-    'ever-lengthening',
-    'ever-mobile',
-    'ever-patient',
-    'ever-progressing',
-    'ever-questing',
-    'ever-receding',
     'ever-thickening',
-    'everincreasing',
-    'everley',
-    'everloving',
-    'everready',
-    'everying',
-    'everythin',
-    'everything\'',
-    'evgenia',
-    'evidence-based',
-    'evidence-gathering',
-    'evil\'',
-    'evora',
-    'evostick',
-    'evp',
-    'evryzink',
     'evy',
-    'evzones',
-    'ewans',
-    'ewig',
-    'ewiger',
-    'ewsd',
-    'ex-actress',
-    'ex-advertising',
-    'ex-bank',
-    'ex-boarder',
-    'ex-boxing',
-    'ex-captain',
-    'ex-cat',
-    'ex-colonel',
-    'ex-conservative',
-    'ex-copper',
     'ex-detective',
-    'ex-engineer',
-    'ex-government',
-    'ex-hacker',
-    'ex-house',
-    'ex-hunter',
-    'ex-killing',
-    'ex-musician',
-    'ex-name',
-    'ex-ortf',
-    'ex-owner',
-    'ex-para',
-    'ex-paratroopers',
-    'ex-passenger',
-    'ex-politburo',
-    'ex-queen',
     'ex-racer',
-    'ex-republican',
-    'ex-school',
-    'ex-secretary',
-    'ex-stockbroker',
-    'ex-tutor',
-    'ex-volunteer',
-    'ex-worker',
-    'examen',
-    'examin',
-    'exar',
-    'excelan',
-    'exch',
-    'excitin\'',
-    'excl',
-    'excommunicant',
     'exculpating',
-    'execrate',
-    'exel',
-    'exercise\'',
-    'exercise-book',
-    'exfoliant',
-    'exfoliated',
-    'exhalant',
-    'exhange',
-    'exhibiton',
-    'exhilirating',
-    'exim',
-    'exlax',
-    'exopterygotes',
-    'expansion\'',
-    'expansione',
     'expectorated',
-    'expedicion',
-    'expendables',
-    'expertel',
-    'expertronics',
-    'explan',
-    'export-creating',
-    'export-related',
-    'exports&mdash&dollar;2,500',
-    'exposed-shore',
-    'exspecto',
-    'ext&eacute;rieur',
-    'extbuy',
-    'extemporise',
-    'extended-life',
-    'extensity',
     'exterieur',
-    'exteriorized',
-    'externalising',
-    'externe',
-    'extra-striate',
-    'extra-temporal',
-    'extradural',
-    'extravert',
-    'extrawurst',
-    'extubated',
-    'exudates',
-    'eye-ball',
-    'eye-black',
-    'eye-power',
-    'eye-straining',
-    'eye-watering',
     'eyecon',
-    'eyelashed',
-    'eyelizer',
-    'eyepatches',
-    'eyer',
-    'eyeview',
-    'eylure',
-    'eyring',
-    'eysner',
-    'ezpeleta',
-    'f&mdash;s',
-    'f&ndash;86',
-    'f&ndash;h',
-    'f\'chrissake',
-    'f\'ing',
-    'f-50',
     'f-5a',
-    'f-actin',
-    'f-ed',
-    'f-file',
-    'f-prot',
-    'f-specimen',
-    'f.p.s',
-    'f66',
-    'faam',
-    'fabbriche',
-    'fabc',
-    'fablon',
-    'fabry',
-    'faceting',
-    'fachhochschulen',
-    'facist',
     'facom',
-    'facour',
-    'fact-based',
-    'faction-fighting',
-    'factionalised',
-    'factionalized',
-    'factoid',
-    'factor-i',
-    'factorized',
-    'factural',
-    'faecal-oral',
-    'faenol',
-    'faeries',
-    'faghaggs',
-    'fahmi',
-    'fahmy',
     'faik',
-    'fainters',
-    'fair\'',
-    'fair-headed',
-    'fair-seeming',
-    'fair-trading',
-    'faircheallaigh',
-    'faircroft',
-    'fairisle',
-    'fairlead',
-    'fairy-elves',
-    'faith-sharing',
-    'faiyum',
-    'fajitas',
-    'fake-gold',
-    'fakhro',
     'fakhruddin',
-    'faksimile',
-    'faldella',
-    'falling-behind',
-    'fallot',
-    'famennian',
-    'family\'',
-    'fan-cooled',
-    'fan-flower',
-    'fan-vaulting',
-    'fanal',
-    'fandeo',
-    'fanshaped',
-    'fantaisies',
-    'fantavision',
-    'far&rehy;reaching',
     'far-east',
-    'faraker',
-    'faramea',
-    'farberow',
-    'farbrother',
-    'farda',
-    'farebee',
-    'farflung',
-    'farge',
-    'farged',
-    'fargette',
-    'farika',
-    'farlow',
-    'farlowella',
-    'farm-built',
-    'farm-land',
     'farm-related',
-    'farmacia',
-    'farmaian',
-    'farming-out',
-    'farra',
-    'farragher',
-    'farrochil',
-    'farrows',
-    'fars',
-    'farside',
-    'fasciated',
-    'fascio-max',
-    'fashion-based',
-    'fashion-plate',
-    'fashion-show',
-    'fast-',
     'fast-darkening',
-    'fast-dwindling',
-    'fast-finishing',
-    'fast-forwarded',
-    'fast-jet',
-    'fast-living',
-    'fast-reactor',
-    'fast-stream',
-    'fast-taper',
-    'fastest-moving',
-    'fastflowing',
-    'fastformat',
-    'fastigiata',
-    'fathalla',
-    'father&mdash',
-    'father\'',
     'father-mother',
-    'fatiguin\'',
-    'fatimid',
-    'fatma',
-    'faulknerbrowns',
-    'fault-based',
-    'fault-logging',
-    'fault-related',
-    'fauquier',
-    'faur',
-    'fauske',
-    'favart',
-    'faxagent',
-    'faxfinders',
-    'fayal',
-    'fayiqah',
     'fazila',
-    'fazlur',
-    'fazzi',
-    'fbrs',
-    'fcp',
-    'fddi-based',
-    'fdj',
-    'feagley',
-    'fear-ridden',
-    'fearnyough',
-    'featherbedding',
-    'feature-phone',
-    'feccas-utc',
-    'fecerunt',
-    'fecundating',
-    'fedefam',
     'federal-state',
-    'fednet',
-    'fedorovitch',
-    'fee-charging',
-    'fee-farm',
-    'feeded',
-    'feek',
-    'feeman',
-    'feenix',
-    'feers',
-    'feetwarmers',
-    'fehg',
-    'feichter',
-    'feickert',
-    'felando',
-    'felawnah',
     'felinfach',
-    'felinfoel',
-    'fell-side',
-    'fellated',
-    'fellburn',
-    'fellow-scot',
-    'fellow-staff',
-    'felsenmeer',
-    'feminising',
-    'fen&ecirc;tres',
-    'fenc',
-    'fencibles',
-    'fendered',
-    'fenestrellina',
-    'feng-huang',
-    'fenghuo',
     'fengmin',
-    'fenosa',
-    'fentem',
-    'feola',
-    'fepa',
-    'fer-de-lance',
-    'ferdy',
-    'feredinos',
-    'ferenczi',
-    'ferer',
-    'fergsuon',
-    'ferguslie',
-    'fergussons',
-    'ferina',
-    'ferme',
-    'fern-leaf',
     'fernandel',
-    'ferne',
-    'ferrary',
-    'ferras',
-    'ferrata',
-    'ferrefort',
-    'ferret-god',
-    'ferringhi',
-    'ferzana',
-    'fescues',
-    'feslegen',
-    'festhalle',
-    'festive-looking',
-    'fethard',
-    'fetimmp',
-    'fetishising',
     'fettled',
-    'fety',
-    'feuchtwang',
-    'fezzan',
-    'ffi',
-    'ffis',
-    'fgf-2',
-    'fhuaran',
-    'fiacaill',
-    'fibre-',
-    'fibre-tip',
-    'fibred',
-    'fibwell',
-    'fiction-making',
-    'fictionalising',
-    'fiddle-dee-dee',
     'fiddle-playing',
-    'fidele',
-    'fidoao',
-    'fidos',
-    'fidra',
-    'fiegl',
-    'field-grey',
-    'field-gun',
-    'field-test',
-    'fietzau',
-    'fifteen-inch',
-    'fifteen-month',
-    'fifteen-per-cent',
-    'fifteen-pound',
-    'fifth-placed',
-    'fig-wasp',
     'figeac',
-    'figger',
-    'figlia',
-    'figlio',
-    'figtree',
-    'figure-sculpture',
-    'figure-skimming',
-    'filbey',
-    'filderman',
-    'file\'',
-    'file-based',
-    'file-handling',
-    'fileservers',
-    'filii',
-    'filing-clerk',
-    'filipacchi',
     'filipovi&cacute',
-    'filius',
-    'fill-dyke',
-    'fillettes',
-    'fillin\'',
-    'film-',
-    'film-loop',
-    'film-processing',
-    'film-production',
-    'filmophone',
-    'filomena',
-    'filtrona',
-    'finau',
-    'finbarr',
-    'finchbacked',
-    'findfieldofview',
     'fine-art',
-    'fine-drawn',
-    'fine-paper',
-    'fine-structure',
-    'fineish',
-    'finel',
-    'finem',
-    'finessed',
-    'finessing',
-    'finger-drying',
-    'finger-licking',
-    'finger-painted',
-    'finger-shaped',
-    'finger-socket',
-    'finger-spelling',
-    'fingerfish',
     'fingerling',
-    'fingerpicked',
-    'fingerstalls',
-    'finishings',
-    'finisterre',
-    'finnbogadottir',
-    'finncattle',
-    'finrad',
-    'finsthwaite',
-    'finzis',
-    'fiordaliso',
-    'fiorrucci',
-    'fip',
-    'firbobs',
-    'fire-',
-    'fire-and-brimstone',
     'fire-brand',
-    'fire-control',
-    'fire-insurance',
-    'fire-lit',
-    'fire-resistance',
-    'fire-resisting',
-    'fire-surround',
-    'firebelly',
-    'firecode',
-    'fireescape',
-    'firehole',
-    'fireman-uncle',
-    'firewomen',
-    'firey',
-    'firing-up',
-    'first&rehy;aid',
     'first-ball',
-    'first-cousin',
-    'first-found',
-    'first-light',
-    'first-movement',
-    'first-place',
-    'first-race',
-    'first-use',
-    'first-wave',
-    'firstling',
-    'fischeri',
-    'fischli',
-    'fish-cake',
-    'fish-finger',
-    'fish-food',
-    'fish-frying',
     'fish-scoop',
-    'fishhooks',
-    'fishing-based',
-    'fishwatch',
-    'fission-track',
-    'fist-pumping',
-    'fisunoglu',
-    'fitc-phalloidin',
-    'fitched',
-    'fitness-testing',
-    'fitzbernard',
-    'five-category',
-    'five-city',
-    'five-fathom',
-    'five-fight',
-    'five-finger',
     'five-furlong',
-    'five-gallon',
-    'five-goal',
-    'five-kilometre',
-    'five-mark',
-    'five-nil',
-    'five-race',
-    'five-rise',
-    'five-room',
-    'five-session',
-    'five-shilling',
-    'five-state',
-    'five-stride',
-    'five-stud',
-    'five-tier',
-    'five-years-old',
     'fixed-charge',
-    'fixed-cost',
-    'fixed-factor',
-    'fixed-focus',
-    'fixed-track',
-    'fixot',
-    'fizeau',
-    'fizzer',
-    'fjallbrant',
-    'fl&eacute;malle',
-    'flabber',
-    'flabbergasting',
-    'flabbers',
-    'flachau',
-    'flacks',
-    'flag-desecration',
     'flag-kick',
-    'flagellate',
-    'flagelliflory',
-    'flaglor',
-    'flagyl',
-    'flamar',
-    'flambe',
-    'flame-effect',
-    'flamstead',
-    'flanel',
-    'flanner',
-    'flapjacks',
-    'flash-card',
-    'flash-fire',
-    'flash-light',
-    'flasked',
     'flatbush',
-    'flatty',
-    'flaunching',
-    'flavipes',
-    'flea-market',
-    'fleapits',
-    'fleet-of-foot',
-    'fleetrak',
-    'fleidingerhof',
-    'fleisch',
-    'fleiss',
-    'fleshhound',
-    'flestrin',
-    'fletched',
-    'fleug',
-    'fleural',
     'flexitech',
-    'flexlite',
-    'flid',
-    'flight-weight',
-    'flightcare',
-    'flightlines',
-    'flimsy-looking',
-    'flink',
-    'flint-walled',
-    'flinty-clay',
-    'flish',
-    'floate',
-    'floatless',
-    'flocculated',
-    'flocculates',
-    'flockplan',
     'flogger',
-    'flood-control',
-    'flood-land',
-    'floppo',
-    'floral-design',
-    'floridiana',
-    'floristics',
-    'flos',
-    'flossed',
-    'flotex',
-    'flotow',
-    'flowcharting',
-    'flower-arrangement',
-    'flower-child',
-    'flower-garden',
-    'flower-hung',
     'flowerfield',
-    'floydd',
-    'flra',
-    'flue-brush',
-    'flueing',
-    'fluff-covered',
-    'fluor',
-    'fluoropolymers',
-    'fluorouracil',
-    'fly-',
-    'fly-posted',
-    'flyco',
-    'flying-fish',
-    'flying-helmet',
-    'flytraps',
-    'fmbra',
     'fmis',
-    'fmn',
-    'fnar',
-    'fochiv&eacute',
-    'focker',
-    'focolare',
-    'focus-based',
-    'foday',
-    'foddering',
-    'foerer',
-    'foetida',
-    'fofi',
-    'foinland',
-    'fojut',
-    'fold-in',
-    'foleshill',
     'foliaged',
-    'folk-belief',
-    'folk-culture',
-    'folk-devil',
-    'folk-etymology',
-    'folk-life',
-    'folk-singing',
-    'folk-tradition',
-    'folkestone&ndash;boulogne',
-    'folkweave',
-    'follow-spot',
-    'follyfoot',
-    'folses',
-    'fom',
-    'fomblin',
-    'fondaci&oacute;n',
     'foner',
-    'fonstein',
-    'fontinalis',
-    'fontrevault',
-    'food-aid',
-    'food-purchasing',
-    'food-rewarded',
-    'food-source',
-    'foolery',
-    'foolina',
-    'foord',
-    'foot-pedals',
-    'foot-pump',
-    'foot-salve',
-    'foot-square',
-    'foot-traffic',
     'footframe',
-    'footless',
-    'footsie-footsie',
-    'footsure',
-    'footswitching',
-    'for&mdash',
-    'forbush',
-    'forby',
-    'forcast',
-    'forced-air',
-    'forced-down',
-    'forclaz',
-    'fordbridge',
-    'fordice',
-    'fore-fathers',
-    'fore-stomach',
     'forefather',
-    'foreign-set',
-    'foreign-trained',
-    'foreknew',
-    'forest-floor',
-    'foresteresheye',
-    'foreswore',
-    'forewood',
-    'forez',
-    'forgacs',
-    'forged-iron',
-    'forget-me-',
-    'forghieri',
-    'fork-',
-    'form&rehy;filling',
-    'form-book',
     'formica-clad',
-    'formica-covered',
-    'formicidae',
-    'forsinard',
-    'forsking',
-    'forter',
-    'fortezza',
-    'forties-style',
-    'fortune-500',
-    'forty-day',
-    'forty-eight-hour',
-    'forty-four-week',
-    'forty-pound',
-    'forward\'',
-    'forward-planning',
-    'forward-reverse',
     'forward-tilting',
-    'foscarini',
-    'fossilizing',
-    'fot',
-    'fotbal',
-    'fote',
-    'fotedar',
-    'fothergilla',
-    'foubister',
-    'fouce',
-    'fouche',
-    'foudroyant',
-    'four&mdash;colour',
-    'four-bolt',
-    'four-burner',
-    'four-cell',
     'four-gallon',
-    'four-handed',
-    'four-handicap',
-    'four-lap',
-    'four-level',
-    'four-metre',
-    'four-nil',
-    'four-o',
-    'four-plot',
-    'four-press',
-    'four-room',
-    'four-row',
-    'four-run',
-    'four-runner',
-    'four-section',
-    'four-session',
     'four-song',
-    'four-story',
-    'four-tier',
-    'four-towered',
-    'four-tread',
-    'four-under-par',
-    'four-user',
-    'four-voiced',
-    'fourstones',
-    'fourteen-week',
-    'fourteen-year&rehy;old',
-    'fourth-hand',
-    'fourth-order',
-    'fourth-ranking',
-    'fourth-rate',
-    'fourtou',
     'fourty',
-    'foxface',
-    'foxhunt',
-    'foxx',
-    'fpda',
-    'fphm',
-    'fpr-lz',
-    'fr&eacute;jus',
-    'fr&oacute;tha-frith',
-    'fradgem',
-    'frager',
-    'fragged',
-    'frags',
-    'fraise',
-    'frame-based',
-    'frame-grabbing',
     'francesconi',
-    'francetta',
-    'franche',
-    'francio',
-    'franciscus',
-    'francophiles',
-    'frankfurt-based',
-    'frankston',
-    'frantzen',
-    'franzi',
-    'fratercula',
-    'fratrum',
-    'frauleins',
-    'frco',
-    'freak-outs',
-    'freako',
     'freculf',
-    'fredrickson',
-    'free-port',
-    'free-wheel',
-    'freeborough',
-    'freedom\'',
-    'freedomlink',
-    'freeflowing',
-    'freeminer',
-    'freesheets',
-    'freewheelin',
-    'freewheels',
-    'freezed',
-    'freidman',
-    'freidzon',
-    'freigang',
     'freikultur',
-    'freiston',
-    'fremskridtspartiet',
-    'french-',
-    'french-polish',
-    'french-run',
-    'french-sounding',
-    'frenchpark',
-    'frends',
-    'frenzel',
-    'frequency-count',
-    'frequency-dependence',
-    'fresh-minted',
-    'fresh-run',
-    'freshen-up',
-    'freshly-killed',
     'fresnel',
-    'frestel',
-    'freunde',
-    'freyer',
-    'fricsay',
-    'friday-night',
-    'friederike',
-    'friendlier-looking',
-    'friesn',
-    'frigido',
-    'frileux',
-    'frimble',
-    'frippak',
-    'fris&eacute',
-    'frise',
-    'friso',
     'frist',
-    'frithuric',
-    'fritsche',
-    'froad',
-    'froberger',
-    'froglets',
-    'frolick',
-    'fromages',
-    'fromentin',
-    'frommel',
-    'frommer',
-    'fromont',
-    'front-cover',
-    'front-panel',
-    'front-suspension',
-    'front-to-back',
     'frontager',
-    'frontali',
-    'frontis',
-    'frosh',
-    'frostied',
-    'froufrou',
-    'frowny',
-    'fruit-garden',
-    'fruit-market',
-    'fruitcakes',
-    'frus',
-    'frustules',
-    'fruty',
-    'fryde',
-    'frykowski',
-    'frystetjorn',
     'fses',
-    'fspi',
-    'fuath',
-    'fuccillo',
-    'fuck\'n',
-    'fuckarse',
-    'fudu-myoo',
-    'fuel-economy',
-    'fugu',
-    'fuisse',
-    'fujinon',
-    'fujio',
-    'fukaba',
-    'fulder',
-    'fulembo',
-    'fulfords',
     'fulget',
-    'fuligula',
-    'full-record',
-    'full-thickness',
-    'fullblown',
-    'fullick',
-    'fullstops',
-    'fully-armed',
-    'fully-working',
-    'fulminates',
-    'fumigatus',
-    'fun-seeking',
-    'fun-time',
-    'func',
-    'function-related',
-    'functionlust',
     'fund-management',
-    'fungus-farming',
-    'fungussed',
-    'funk-metal',
-    'funkateers',
-    'funloving',
-    'funning',
-    'funnybones',
-    'fur-trapping',
-    'furfix',
-    'furiant',
-    'furl',
-    'furn',
-    'furnham',
-    'furrin\'',
-    'furrow-drawing',
     'furter',
-    'furthe',
-    'furzey',
-    'fusileers',
-    'future\'',
-    'future-generation',
-    'fynd',
-    'fyw',
-    'fyz',
-    'g&aacute;l',
-    'g&eacute;n&eacute;rales',
-    'g&icirc;te',
-    'g&ndash;aecb',
-    'g&ndash;aedu',
-    'g&ndash;aghb',
-    'g&ndash;ebed',
     'g&ouml;cek',
-    'g&ouml;k&ouml;ova',
-    'g&uuml;ll&uuml;k',
-    'g-ahcl',
-    'g-atbg',
-    'g-component',
-    'g-formation',
-    'g-joey',
-    'g-mate',
-    'g-taxichip',
-    'g-wing',
-    'g.h.j.',
-    'g25',
-    'g90',
-    'gabbay',
-    'gabbitas',
     'gaber',
-    'gabinetto',
-    'gablik',
-    'gadp',
-    'gaean',
-    'gaeltec',
-    'gaet',
-    'gag-binding',
-    'gagan',
-    'gagik',
-    'gaiet&eacute',
-    'gailes',
-    'gainza',
-    'gairm',
-    'gaity',
-    'gaium',
     'galand',
-    'galasso',
-    'galende',
-    'galgani',
-    'galgorm',
-    'galiara',
-    'galibier',
-    'galiot',
-    'galjart',
-    'gallard',
-    'gallaway',
-    'galleytrot',
-    'gallgate',
-    'galli-curci',
-    'galliagh',
-    'galliarda',
     'gallienne',
-    'galligan',
-    'gallowglass',
-    'galo',
-    'galoof',
-    'galosh',
-    'galron',
-    'galthi&eacute',
-    'gamate',
-    'gambei',
-    'gambela',
-    'gambiers',
-    'gamboge',
-    'gamboling',
-    'gambusia',
-    'gamet',
     'gamete-production',
-    'gamma-radiation',
-    'gammagt',
-    'gamul',
-    'gandhar',
-    'gangsta',
-    'gannett',
-    'ganning',
-    'gansleit',
-    'gap-filler',
-    'gapeworm',
-    'garageman',
-    'garah',
-    'garajau',
-    'garbage-filled',
-    'garban',
     'gardano',
-    'garden-path',
-    'gardesana',
-    'gardien',
-    'gareau',
-    'gargiolli',
-    'garmeston',
-    'garnstone',
-    'garon',
-    'garreton',
-    'garrity',
-    'garrya',
-    'garryarde',
-    'garryowens',
-    'garthlands',
-    'gartlan',
     'garys',
-    'gas-jet',
-    'gas-mantle',
-    'gas-meter',
-    'gas-operated',
-    'gasken',
-    'gasnier',
-    'gasser',
-    'gasswater',
-    'gasted',
-    'gastrics',
-    'gastronomico',
-    'gastronomiques',
-    'gastroscan',
-    'gastrosoft',
-    'gastrulate',
     'gate-keeping',
-    'gateliner',
-    'gatling',
-    'gattnar',
-    'gauber',
-    'gauck',
-    'gaud',
-    'gauffred',
-    'gaustad',
-    'gavi&ntilde;o',
-    'gaviscon',
-    'gavrosh',
-    'gawber',
-    'gawked',
-    'gawn',
-    'gayflowers',
     'gaysoc',
-    'gazan',
-    'gazar',
-    'gazules',
-    'gba',
-    'gbfh',
-    'gbg',
-    'gbgsa',
-    'gcb',
-    'gdb',
-    'geak',
-    'gearchanging',
-    'gearshift',
-    'gearwheel',
-    'gebur',
-    'gec-plessey',
     'geck',
-    'geco',
-    'gedaleh',
-    'geddling',
-    'gedgey',
-    'gedoff',
-    'gee-up',
-    'geed',
-    'geeggs',
-    'geemag',
-    'geesin',
-    'geev',
-    'geimreadh',
-    'geissen',
-    'geisteswissenschaft',
-    'gelande',
     'gelbart',
-    'geldin',
-    'gelert',
-    'gelochelidon',
-    'gem-set',
-    'gemara',
-    'gemeentekrediet',
-    'geminiani',
-    'gemmil',
-    'gemsbok',
-    'gender-bender',
-    'gender-bending',
-    'gender-difference',
-    'gender-free',
-    'gene-splicing',
-    'gene-transfer',
     'generalia',
-    'generally-accepted',
-    'generatione',
-    'genevese',
-    'genisis',
-    'genizah',
-    'genocides',
-    'genrikh',
-    'genti',
-    'gentianella',
-    'gentleman-scholar',
-    'gentrify',
-    'geo-demographics',
-    'geochem',
-    'geodesy',
-    'geof',
     'geographia',
-    'geographically-defined',
-    'geordieland',
-    'georgics',
-    'georgs',
-    'geosynclines',
-    'geraldus',
-    'gerhardus',
-    'geri',
-    'geriatrified',
-    'gerland',
-    'german-americans',
-    'german-czech',
-    'german-produced',
-    'germline',
-    'gerna',
     'gerontophilia',
-    'gerremoff',
-    'gerrys',
-    'gershony',
-    'gerster',
-    'gerty',
-    'gesamtkunst',
-    'gesamtmetall',
-    'geschwader',
-    'gesenge',
-    'gesserit',
-    'gest',
-    'gestalts',
-    'gestaltung',
-    'geste-type',
-    'gestodene',
     'gestuno',
-    'gesundheit',
-    'get-well-soon',
-    'getafix',
-    'getbounds',
-    'getting-up',
-    'gevalt',
-    'gevers',
-    'gewisse',
-    'gga',
-    'ghada',
-    'ghain',
-    'ghanaian-born',
-    'ghanem',
-    'ghat',
-    'ghe',
     'gheeraerts',
-    'ghemawat',
-    'ghettogedden',
-    'ghettoize',
-    'ghettoizing',
-    'ghezzi',
-    'ghibli',
-    'ghor',
-    'ghosal',
-    'ghoshi',
-    'ghost-bagging',
-    'ghost-writer',
-    'ghuilbinn',
-    'gi\'',
-    'gianelli',
-    'gianlorenzo',
     'gibberellin',
-    'gibing',
-    'giblet',
-    'giddying',
-    'giesecke',
-    'gieseking',
-    'gigabit',
-    'gigante',
-    'gigantia',
-    'gii',
-    'gilat',
-    'gilbanks',
-    'gile',
-    'gilespie',
-    'gilette',
-    'gilfeather',
     'gili',
-    'gillain',
-    'giltrap',
-    'giltspur',
-    'giminez',
-    'gimona',
-    'gingerbreads',
-    'gingin',
-    'ginna',
-    'ginned',
-    'ginther',
-    'giono',
-    'giornate',
-    'girfriend',
-    'giridhar',
-    'girleen',
     'girning',
-    'girocheque',
-    'gisa',
-    'giscardian',
-    'giscombe',
-    'gitlin',
-    'giulietta',
-    'giulii',
-    'giustiniani',
-    'giusto',
-    'giv-sp',
-    'givarsi',
-    'givat',
-    'givetian',
-    'gkutu',
-    'gl&uuml;hwein',
     'gladstones',
-    'glammy',
-    'glamours',
-    'glannau',
-    'glass-works',
-    'glassie',
-    'glasswort',
-    'glaucus',
-    'glees',
-    'gleet',
-    'gleiwitz',
-    'glem',
-    'glemmtal',
-    'glenapp',
-    'glencolumbcille',
-    'glengariff',
     'glenlight',
-    'glenoid',
-    'glenquoich',
-    'glenrath',
-    'glensanda',
-    'glentree',
-    'glenvale',
-    'gleouraich',
-    'gley',
-    'glidevale',
-    'glissaded',
-    'glissading',
-    'glister',
-    'glitterfests',
-    'gln-250',
-    'globalised',
     'globalxm',
-    'globed',
-    'globigerina',
-    'globol',
-    'glooming',
-    'glops',
-    'glory-hunting',
-    'gloucerster',
-    'glove-box',
-    'glow-globe',
-    'glow-in-the-dark',
-    'glow-plug',
-    'glowglobes',
-    'glowplug',
-    'gloy',
-    'glucosinolate',
     'glue-line',
-    'glue-sniffer',
-    'glum-faced',
-    'glums',
-    'glyncorrwg',
-    'glynleigh',
-    'gmax',
-    'gn\'r',
-    'gnarls',
-    'gnoli',
-    'gnomenreigen',
-    'gnpp',
-    'go&ccaron&aacute;r',
-    'go-',
-    'go-karting',
-    'goafstead',
     'goal-box',
-    'goal-keeping',
-    'goalden',
-    'goat-faced',
-    'goat-hair',
-    'goat-herd',
-    'goateed',
-    'goatskins',
-    'goatsong',
-    'gobbed',
-    'gobbla',
-    'gobierno',
-    'god-damn',
-    'god-making',
-    'godavari',
-    'godd',
     'godegisel',
-    'godess',
-    'godfatherism',
-    'godfearing',
-    'godown',
-    'godsake',
-    'goellner',
-    'goerdeler',
-    'goerner',
-    'goffin',
-    'gogarty',
-    'goggle-eyes',
-    'gohorry',
-    'goju-ryu',
-    'gold-and-ivory',
-    'gold-braid',
     'gold-producing',
-    'goldeck',
-    'golden-age',
-    'golden-bronze',
-    'golden-green',
-    'golden-headed',
-    'goldfish-bowl',
-    'goldfishes',
-    'goldheart',
-    'goldich',
-    'goldleaf',
-    'goldmines',
-    'goldpanning',
-    'goldscheider',
-    'goldsturm',
-    'goldy',
     'goles',
-    'golfbreaks',
-    'golfcourse',
-    'golinkoff',
-    'golledge',
-    'gollingerhof',
-    'golomb',
-    'goltz',
-    'goluchow',
-    'golwg',
-    'gomarsall',
-    'gomel',
-    'gonet',
-    'goniometer',
-    'gonnere',
-    'good&rehy;looking',
     'good-for-nothings',
-    'good-going',
-    'goodeids',
-    'goodexpsrrange',
-    'goodings',
-    'goodsway',
-    'goombay',
-    'goonies',
-    'goose-feather',
-    'goose-neck',
-    'goosen',
-    'goosepimpled',
-    'goosing',
-    'gopak',
-    'gopis',
-    'gor&szlig',
     'goral',
-    'gorbachevism',
-    'gordoni',
-    'gorgeopekos',
-    'gorgias',
-    'gorgo',
-    'gori',
-    'gorlice',
-    'gorlois',
-    'gornisht',
-    'gorringe',
-    'gorter',
-    'goryushkin',
-    'goshai',
-    'goshawks',
-    'gospodars',
     'gossamer-light',
-    'gossan',
-    'gostin',
-    'gostling',
-    'gosudarstv',
-    'gotong',
-    'gotte',
-    'gottesman',
-    'gotto',
-    'gouldens',
-    'goulty',
-    'gourde',
-    'gourevitch',
-    'gourmande',
-    'gourmandisin\'',
-    'gourstave',
     'gouter',
-    'govardhan',
-    'govenors',
-    'governent',
-    'governer',
-    'government-anc',
-    'government-in-waiting',
-    'governrnent',
-    'gowar',
-    'gowen',
-    'gowld',
-    'gowna',
-    'gowri',
-    'goyemido',
-    'goyescas',
-    'goz',
     'gpi',
-    'gr&uuml;mmer',
-    'gr&uuml;nheid',
-    'grab-bag',
-    'grabhorn',
-    'grace-note',
-    'grade-based',
-    'gradgrinds',
-    'gradouge',
-    'gradus',
-    'graecorum',
-    'graffiti-writing',
-    'grafs',
-    'graham-brown',
-    'grahpics',
-    'grain-boundary',
     'grainstacks',
-    'gramley',
-    'grammaticalised',
-    'grammys',
-    'granatelli',
-    'grand&rehy;father',
-    'grand-duchess',
-    'grand-niece',
-    'grandstanding',
-    'granita',
-    'granite-built',
-    'granite-faced',
-    'granitoid',
-    'granpy',
-    'grapheme-to-phoneme',
-    'grasbrunn',
     'grasemere',
-    'grashof',
-    'grasmire',
-    'grass-court',
-    'grass-roofed',
-    'grassies',
-    'grasso',
-    'grastyan',
-    'gratch',
-    'gratiae',
-    'graus',
-    'grave-clothing',
-    'grave-yard',
-    'graved',
-    'gravel-bottomed',
-    'gravel-voiced',
     'gravmag',
-    'gravy-browning',
-    'grayman',
-    'grease&rehy;proof',
-    'grease-monkeying',
-    'greasy-pole',
-    'great-circle',
-    'great-great-grandchildren',
-    'greatrakes',
-    'greave',
-    'grecian-style',
-    'gree',
-    'green\'',
-    'green-and-cream',
-    'green-based',
-    'green-heart',
     'greenbanks',
-    'greencore',
-    'greengauge',
-    'greenhorn',
-    'greenhorns',
-    'greenhouse-effect',
-    'greenish-red',
-    'greenoak',
-    'greenpark',
-    'greenridge',
-    'greenrow',
-    'greensett',
-    'greensit',
-    'greenspaces',
-    'greenview',
-    'greff',
     'gregalach',
-    'gregarians',
-    'greiffenhagen',
-    'greige',
-    'greipbritn',
-    'grenaded',
-    'gret',
-    'gretener',
-    'grette',
-    'greves',
-    'grey-bearded',
-    'grey-flannel',
-    'grey-lag',
-    'grey-slated',
-    'grey-tinged',
-    'greyfriar',
     'greyish-black',
-    'greywell',
-    'gridelin',
-    'gridlocked',
-    'gridmap',
-    'grieman',
-    'grigor',
-    'grikes',
-    'gril',
-    'grimbledon',
-    'grimmitt',
-    'grimsay',
-    'grimson',
-    'grinzing',
-    'gripe-water',
-    'griseofulvin',
     'grisi',
-    'grisogono',
-    'grissini',
-    'grj&oacute;tagj&aacute',
-    'gro&szlig;e',
-    'gro-lux',
-    'grohe',
-    'grolierii',
-    'gronant',
-    'groomers',
-    'groove-pitch',
-    'grooverider',
-    'grossbancher',
-    'grossraum',
-    'grotting',
-    'groun\'',
     'ground-effect',
-    'ground-equipment',
-    'ground-hugging',
-    'ground-share',
-    'ground-sheet',
-    'groundhogs',
-    'groundhoppers',
-    'groundsels',
-    'group\'',
-    'groupement',
-    'grousing',
-    'grovers',
-    'growly',
-    'grox',
-    'grr',
-    'gruak',
     'grubbied',
-    'gruer',
-    'grujovi&cacute',
-    'grumfy',
-    'grump',
-    'gruntled',
-    'gruss',
-    'gruthu',
-    'grzesik',
-    'grzybkowski',
-    'gs-6',
-    'gs-ana',
-    'gsob',
-    'gtp-',
-    'gu&eacute;thary',
-    'guacaran',
     'guambia',
-    'guan',
-    'guanidine',
-    'guard-dog',
-    'guardame',
-    'guardrails',
-    'guazapo',
-    'gudbrandsdal',
-    'guddle',
-    'gudex',
-    'gueffroy',
-    'guenin',
-    'guera',
-    'guerino',
-    'guerrier',
-    'guerrilla-controlled',
     'guesstimates',
-    'guest-lift',
-    'guestimate',
-    'gui-based',
-    'guianan',
-    'guibout',
-    'guidetti',
-    'guidewires',
-    'guilding',
-    'guillain-barre',
-    'guillebaud',
-    'guilt-producing',
-    'guinee',
-    'guisborough-based',
-    'guitar-building',
-    'guitarring',
     'gulamalis',
-    'guleghina',
-    'gulick',
-    'gullied',
-    'gullivers',
-    'gullo',
-    'gullwing',
-    'gulma',
-    'gulmarg',
-    'gumball',
-    'gumby',
-    'gun-barrel',
-    'gun-control',
-    'gun-fight',
-    'gun-firing',
-    'gun-runner',
     'gunasekara',
-    'gunbelt',
-    'gundelach',
-    'gunfleet',
-    'gungawatti',
-    'gungy',
-    'gunhild',
-    'gunkholing',
-    'gunma',
-    'gunnarsson',
-    'gunnera',
-    'gunthardt',
-    'guoqiang',
-    'gup',
-    'gurbir',
-    'gurcharan',
     'gurdial',
-    'gurdwaras',
-    'gurjant',
-    'gurltia',
-    'gurlyi',
-    'gurung',
-    'gushers',
-    'gushometer',
-    'gusta',
-    'gustave-roussy',
-    'gustavs',
-    'gut-feeling',
-    'gute',
-    'guter',
-    'guti&eacute;rez',
-    'gutter-press',
     'guttersnipes',
-    'guttery',
-    'guugu',
-    'guus',
-    'guy-alain',
-    'guybon',
-    'guyots',
-    'guzzini',
-    'gwe',
-    'gwiazda',
-    'gwyndy',
-    'gwynt',
-    'gyldendal',
-    'gylee',
-    'gymnastikschule',
-    'gyoergy',
     'gypsum-fibreboard',
-    'gyred',
-    'gyro-compass',
-    'gyroplane',
-    'gytrash',
-    'gyulay',
-    'gyuto',
-    'h&acirc;mmerling',
-    'h&auml;m&auml;l&auml;inen',
-    'h&auml;ring',
-    'h&eacute;rens',
-    'h&ocirc;tels',
-    'h&ouml;ch',
-    'h&ouml;chstetters',
-    'h&uuml;rriyet',
-    'h\'extra',
     'h\'wit',
-    'h-band',
-    'h-block',
-    'h-dropping',
-    'h-f',
-    'h-registration',
-    'h-street',
-    'h.s',
-    'h19',
-    'ha&ccedil',
-    'ha\'e',
-    'haack',
-    'habbaniya',
-    'haberer',
-    'haberman',
-    'habitans',
     'habitualised',
-    'habitue',
-    'habur',
-    'hacket',
-    'hackled',
-    'haddy',
-    'hadera',
-    'hadger',
-    'hadiths',
-    'hadjiloizu',
-    'hadrill',
-    'hadziyannis',
-    'haemangioma',
-    'haemopoiesis',
-    'haestingas',
-    'haferkamp',
     'haflor',
-    'hafted',
-    'hag-ridden',
-    'hagedorn',
-    'haggai',
-    'haggar',
-    'haggisburgers',
-    'hagnon',
-    'hahanit',
-    'hahnenhof',
-    'haho',
-    'haidian',
-    'haies',
-    'haillng',
-    'hainges',
-    'hair-breadth',
     'hair-free',
-    'hair-grass',
-    'hair-net',
-    'hairpin\'',
-    'hairs-breadth',
-    'hairshine',
-    'haizlip',
-    'hajdu',
-    'hakone',
-    'hakuta',
-    'halahan',
-    'halban',
-    'halberstam',
-    'haldyn',
-    'halebarns',
-    'haler',
     'half&rehy;hearted',
-    'half-a-loaf',
-    'half-alcoholic',
-    'half-an-',
-    'half-angel',
-    'half-articulated',
-    'half-barrier',
-    'half-bird',
-    'half-bound',
-    'half-boy',
-    'half-broken',
-    'half-building',
-    'half-chinese',
-    'half-clad',
-    'half-closing',
-    'half-cousin',
     'half-decided',
-    'half-dolphin',
-    'half-drugged',
-    'half-engaged',
-    'half-eroded',
-    'half-fell',
-    'half-glass',
-    'half-gloom',
-    'half-headed',
-    'half-height',
-    'half-hiding',
-    'half-hope',
-    'half-house',
-    'half-imagined',
-    'half-killing',
-    'half-known',
     'half-load',
-    'half-match',
-    'half-measure',
-    'half-mocking',
-    'half-paralysed',
-    'half-plaited',
-    'half-realised',
-    'half-revealed',
-    'half-rhyme',
-    'half-rolling',
-    'half-romany',
-    'half-shouted',
-    'half-shuttered',
-    'half-squatting',
-    'half-stage',
-    'half-stand',
     'half-standing',
-    'half-sung',
-    'half-toise',
-    'half-volleyed',
-    'half-washed',
-    'half-wheel',
-    'half-width',
-    'half-window',
-    'half-wished',
-    'halfbrother',
-    'halfcastes',
-    'halfpast',
-    'halfway-house',
-    'haliaetus',
-    'halile',
-    'hall-porter',
     'halleluia',
-    'hallidays',
-    'hallinges',
-    'hallmarking',
-    'hallooing',
-    'hallucinates',
-    'hallux',
-    'halonen',
-    'halston',
-    'haltemprice',
-    'haltering',
-    'halu',
-    'ham-handed',
-    'hamadryad',
-    'hamadryads',
-    'hamam',
     'hambra',
-    'hamerton',
-    'hametabad',
-    'hamidollah',
-    'hamilcar',
-    'hamilton-baillie',
-    'hamme',
-    'hammerin\'',
-    'hammerschmidt',
-    'hamnavoe',
-    'hamshaw',
-    'hamsten',
-    'hamwell',
-    'hanami',
-    'hancy',
-    'hand-ball',
     'hand-beating',
-    'hand-copying',
-    'hand-drill',
-    'hand-engraved',
-    'hand-feed',
-    'hand-feeding',
-    'hand-jamming',
-    'hand-marbled',
-    'hand-on-heart',
-    'hand-rearing',
-    'hand-shake',
-    'hand-smocked',
-    'hand-stand',
-    'hand-stitch',
-    'hand-wash',
-    'hand-weeding',
     'handbag-snatching',
-    'handbridge',
-    'handcarved',
-    'handclap',
-    'handcrafts',
-    'handelskorrespondenz',
-    'handfast',
-    'handfasted',
-    'handfull',
-    'handiness',
-    'handprinted',
-    'hands-down',
-    'handscrolls',
-    'handspinning',
-    'handwriter',
-    'hanff',
     'hanfmann',
-    'hangouts',
-    'hangul',
-    'hanham',
-    'hankuk',
-    'hannaniah',
-    'hannas',
-    'hanslip',
-    'hanway',
-    'hapc',
-    'hapoel',
-    'happe',
-    'happily-married',
-    'happy(x)',
-    'hapy',
-    'harambee',
     'haraszti',
-    'haratin',
-    'harbaugh',
-    'harbon',
-    'harbourne',
-    'hard-skinned',
-    'hard-swearing',
-    'hard-to-handle',
-    'hard-to-let',
-    'hard-wiring',
-    'hardhitting',
-    'hardlaw',
-    'hardle',
-    'hardouin',
-    'hardpoint',
-    'hardrow',
     'hardshelled',
-    'hardt',
-    'hardtack',
-    'hardworkin\'',
-    'hare-lipped',
-    'haresfield',
-    'hariati',
-    'hariman',
-    'harkis',
-    'harlaxton',
-    'harleys',
-    'harn',
-    'harnet',
-    'harnoncourt',
-    'haroeris',
-    'harpagon',
     'harpington',
-    'harpocrates',
-    'harpsichord-making',
-    'harpurhey',
-    'harraby',
-    'harres',
-    'harrhy',
-    'harriette',
-    'harrild',
-    'harrogate-based',
-    'harrowell',
-    'hartl',
-    'hartlepudlian',
-    'hartner',
-    'hartsock',
-    'hartwegi',
     'harvestehudur',
-    'hasbeen',
-    'hasdrubal',
-    'haselsberger',
-    'hasids',
-    'hasim',
-    'hasland',
-    'hasluck',
-    'hasn',
-    'hasnt',
-    'hasset',
-    'hat-box',
-    'hat-sellers',
-    'hatchers',
-    'hattalus',
-    'haubenstock-ramati',
     'haughmond',
-    'hauksbee',
-    'haupstadt',
-    'hausen',
-    'haute-savoie',
-    'havce',
-    'have\'',
-    'have-np-v-en',
-    'haven\'t',
-    'havered',
-    'havin',
-    'haviour',
-    'havocs',
-    'hawiyes',
-    'hawk-headed',
-    'hawlader',
     'hawse',
-    'hawth',
-    'hawthornbrae',
-    'hay-msl',
-    'hay-strewer',
-    'hay/msl',
-    'hayday',
-    'hayel',
-    'haysel',
-    'hazama',
-    'hazells',
-    'hazrat',
-    'hbc',
-    'hcba',
-    'hcfc-141b',
-    'hdg',
     'hdt',
-    'heacy',
-    'head-caving',
-    'head-of-state',
-    'head-shunt',
-    'headgroup',
-    'headline-makers',
-    'headphrase',
-    'headscarfed',
-    'headscarved',
-    'healaval',
-    'healthwise',
-    'heames',
-    'heanue',
-    'heao',
-    'hearin\'',
     'hearkened',
-    'hearnshaw',
-    'heart-aching',
-    'heart-sinking',
-    'heartsink',
-    'heartwrenching',
-    'heat-beating',
-    'heat-exchange',
-    'heat-inactivated',
-    'heat-resisting',
-    'heat-set',
-    'heat-up',
-    'heat-wave',
-    'heath-grass',
-    'heathrow-based',
-    'heatshrink',
     'heatwaves',
-    'heaven-haven',
-    'heaven-storming',
-    'heaver',
-    'hebon',
-    'hebraism',
-    'hechalutz',
-    'hechstetter',
-    'hedden',
-    'heel-and-toe',
-    'heel-bone',
-    'heer',
-    'heerbrugg',
-    'heere',
-    'heering',
-    'heffing',
     'hefter',
-    'hegerty',
-    'heggen',
-    'hegi',
-    'hehir',
-    'heiland',
-    'heilbronn',
-    'heimatmuseum',
-    'heineman',
-    'hejab',
-    'helander',
-    'heleen',
-    'helfrecht',
-    'helgaud',
-    'helgeson',
-    'helibore',
     'helically-coiled',
-    'heliostats',
-    'heliotropes',
-    'hellaby',
-    'hellenica',
-    'hellerman',
-    'hellerwork',
-    'hello\'',
-    'helmbold',
-    'helmetplate',
-    'helminthology',
-    'helpsheet',
-    'helsturm',
-    'helves',
-    'helyg',
-    'hem-length',
     'hemipode',
-    'hemmeling',
-    'hempseed',
-    'henbane',
-    'hendrix-style',
-    'hendryx',
+)
+
+blocks_47 = (
+    '"*na&mdash;i$%clone##eli&"da$&wanter#\'onaceae"\'odising#$inty#"up""pe"&safone$"ry##han#&ichten##tie',
+    '#+wer-machine&&phones\'$rint")tarctican#(e-chapel$%grade$(nnapedia$.rior-posterior$!x#%horpe$*raquinones%,opomorphized$%urium#*i-adhesion&\'ppeaser',
+    '\'%twank&(usterity&%vidin%$baby\'$sque&&ribery%)capillary\'$rtel&#d45&&hannel&)ommercial&%ruise&&ulture%%delta&$raft',
+    '&)uphoriant%*federalism\'\'rtility&$lood&#oam\'!g\'"od\'\'rmalist%(gaullist&&nostic&#rav\'#een%,heterosexist%)incumbent%*jacobinism',
+    '%$lift%+materialism&%erger&)onarchist\'\'rrissey%%negro&$oise%%power&)realbumin\'$ofit(+hibitionist&&uritan%)racialist\'"il&#ust',
+    '&"ex&(ovietism&"un%$tcr-&&esting&+otalitarian\'(xoplasma%&united&(rokinase$$blue%\'ody-iga+!g$(climaxes$&heroes(!s',
+    '$&logged$\'menides%&issile$$pain%$hans%$olis$*que-filled$#red$-streptokinase$\'whaling%%orlds##oin$%nelli&!n"(unciacao',
+    '"*xiety-free"(ywhither!#oes"%nghus!$page#!s"&ennine"$hiri#(yosemion"&iarist#"lu"!k"#lan"&odemus$%ictic',
+    '#)llinarius$$ogie#"yo"&parell\'!s#&eldorn$%ndant$$reth$$tito#&le-mac$3ication-environment%,qu&eacute;ed#$orts#\'pointed#.rentice-served',
+    '$\'oacheth%+val-seeking"%riori"$tera"%ulius!"qd"(u&iacute#&a-blue$$base%&laster$$rena%"ii$!s%%caper%$ense',
+    '%$tars#"ib!$rab-%\'looking$#ick#+chnaphobics##mid%"ts#$neus$"ge&!d%$uren$!s#"to##ujo',
+    '#!x$"es"#bat#*eitsgruppe$#lla#%ogast$"rs%!y##res#!y"#cad$#num##com#.haeo-astrology\'*gastropods',
+    '$#ean%\'ologica$\'ilochos%&tektur\'\'ttonici%"vo$\'minster#&iprete#%turan""de$#che$!e%!r$#ngo$#ola',
+    '##ler#!o$"ch$!n#"ua#%vreck"#ea-#!g#%llano##nig"$gana#$enti#$olid#\'y-bargy"#iba',
+    '#$chis$!s#$dius#)stotelean)&ianism*!s""lo""m-$(wrestled#&anjani#"co##ero#\'istices##let$%ocked',
+    '#)s-cutting%\'dealing$%hells#,y-controlled"*n&oacute;r#%cliff$!o##ess#"is#*o&scaron;t$$ldii$!n#%stein#&ulfist"+omatherapie',
+    '""pe"#ram$!w##ick$#ets$#ghi#(ow-chest#"rr#"ys"\'seholed$!n$"te#$inoe#&lanian"+t-criticism',
+    '#%agnan##emy$%ngill$!p$&sanato$$xing#$ibus$$culo$#fex$!n$&stique#&making#"sy"#udy#$ncus',
+    '"\'veladze"$zner!)s-easy-as#%level"#_at"&adabad$$illo#"fo#"gi#!s#%ulted"!d"\'h-laden#"ad$"ll',
+    '$%urner#$dene##ing#)lar-faced#$ness#"ot#$tina#$wall%!y"%igned"%keran$!s#!o""nd"%perge',
+    '#%rella$$illa%!n$"os"&s-wipe#%arted#"em$\'t-strip+#per##ini&$boia$)stantship"+tatotilapia#!e$%rlite',
+    '#!r$)o-physics%%glide%"id%$phel""va!"t-"#aka##que#!t$(&uuml;rk""ca#$hley"&elopus"&hetoid',
+    '$"na#$lant$#eta"*lanticists"#mos#!x"%omica%"se#!s"#que"$rans"&tagirl$%tched#$ende%.tion-demanding',
+    '#"he#$illa$"ni#!n##ock$$rned\'"y-!)u-pairing"&berges"$chen$\'terader\'%gaven#!k"%demer$%nshaw',
+    '$\'o-guide%$gram%%meter$%t-ing#"re"(genlicht$$reau#$usti"%kward"&l&euml#"in#\'tnamain"&monier"&ntient"!r',
+    '$!s#(ignacian##oux"&sonius#$scot#\'tenitic$"ro"(terfoits#-hor-in-hiding#"o-$\'dialler$$flow$%giros$$helm$\'locator',
+    '$%print$(registry%)it&eacute$%sport%%trade$%trace%#ype$"ur##rui#&umnola&$tide""ug"!w"*xetophones!(vaialble',
+    '#*nt-gardist%\'e-garde#"st#!y"#del"&erbuch$#tin"&iating#%cenna#$onex"*ocado-lime#%nmore#&uching"!p"#tur',
+    '#*rd-related#&y-from"$eary#(stricken"!f#&ul_lot"$ight!$xeen"&il-220#"me#%om(s)"#lan"%olotl!%ylett"&urveda',
+    '!%zaire"$elle#)rbaidjani"\'incourt""mi"&peitia 0b&acirc;rladeanu"2eacute;b&eacute;ar).n&eacute;teaus#*circ;tises"*ndash;17ds"-oslash;rresen")uuml;chel!#-1c"#29s',
+    '#!6"#boy"(carotene##hop##ll1"(lymphoma"%model",registration"&string"$team#.hromboglobulin!$.ed."$m.w.!-1.8scfv-momlv!"61',
+    '#&uuml;l"%-bird"$a\'th##ing"$bich#$kins#!t##uic#*y-carriage%&eating%\'farming%\'minding%)snatching$\'feeding$$milk',
+    '"\'carisse#\'chantes#\'k&mdash$\'-dating%$fill)"ed%\'packing%$rest%)siphoning%)titration&!o\'\'-nature$#_on$&barrow$#ett',
+    '$&houses$!o$&packed$$road(!s$\'scratch%$wept#$tria"/d&rehy;tempered#&-light%#uck$%mouth$\'weather#$dish#$esee',
+    '##ian$$sche#$land$)y-fitting&(produced"#eza"%g-man#!a#!g$,age-handling$!e$$rave#!h$#ill#%inton',
+    '##rit#&thorpe"2h&aacute\'&iacute;s#"ar#"ro"%igels#!i#.lie-substitute&\'borough$,li&egrave;re##ser"0ker-bessmertnykh#$fark#$htar%"ir',
+    '##ram#$ufu-"3l&scaron;i&cacute;i##ach$(krishnan$.nce-of-payment$$tore#$cary$*ony-access#\'d-faced$"ie%"ni%%rzade$"us#%eares',
+    '$\'martine#$farg#$king$$well#)l-carrier%(juggling%%shape$"an%*st-heaving\'#ing$"ee$)oon-borne)&usting%\'t-paper$%s-out',
+    '$%ycoan%&duggan%$hane&$ooed%)magroarty%\'nafeigh%%roney%%state%\'veamore&&ourney#&maceda$#pot##och##sas#$taci',
+    '$!i##uch#$zany"(mboozles$%rough$#usa#!h#!i#"my")nana-leaf\'$skin#\'d-stand$"ai$\'ed-mail$$mate',
+    '#$easa#&gerter$#in\'##ija#$joed#)k-account%%based%\'manager$&ing-up#(ner-hung#"on$)vi&cacute#*tam-weight"%oshan"(ptizatus',
+    '$%owner$$type#\'acchini%"us$"ka$&nowski$#tha&"es$"za#(bie-doll$"ur#(claybank\'\'s-style$$oded#"do',
+    '$&legged\'!s$#tta#+gain-hunter(%price$#irl#"ic$!o$#sal%"ic##kay$"is#$lett%\'y-bread$#und',
+    '$#esy$%haven%$orne$\'umising#$omix$\'netcies%&scourt$)que-style#!p#"qu#\'racouta%#ged%#ult$"eh%!t',
+    '%$pper%$ques$%owing&$land&#man$!s#+seb&auml;ck$#ham#&telski%\'r-based$(holomews$#jan$%olome\'#zzi$%ramia',
+    '#&uffini##zun"$scom&!e$$ules#&e-base&$oard%$load$$band$&lining%!y#"ha$#in\'#&ilikon#(ket-ball',
+    '&&making&%weave##man#"ow#$sani&"os%$rids%#tne$&ilekin##ter%#sen$"id$$ogne"*t-detector$\'fowling',
+    '##ch\'%$wood#%emans#"ho$$plug##ian#$leys$%lista#\'tallion%"nt$$ells%$rbee&&y-time$%iness$\'le-gear',
+    '\'$zone&"by#!y"%udoin#(ernmarkt#"ge#"me%%ister$\'gartner#$teil"(yarsuren#$gard#"la$"et#\'oneting',
+    '%$nais$#umi"#zan#"il!$bctv"!t!#cab""cp#!s""oa#!p!%dafsa""ma!#e-5")ach-front',
+    '%&master$%oning#$dlet##fra#&kshape#&m-line$"on#)ncounters$!t#\'r-faced%\'hugging%#rug$$coat$#den%!y',
+    '$%naise$$pits#(st-fable#$tbox$$ties#&udouin$#puy$"ti"(ckingham&#ton#&louded#!u"%d-pan$$roll$$side',
+    '#%bound#%chair$%radle#%dable#$fast##oun#$rule#%stone"(e-flower$%sting&#ung#&chmast#)f-rearing%#tea#!m',
+    '#(r-bottle%#gut%$hall#$tson")feathered#$ore\'&$-tax$"ul"1ggar-my-neighbour$*ing-letter#\'inning\'#*l&egrave;s$"ye#%uines"1haviour-modelling',
+    '"&ignets#!k#&lstein##nge#!r$"ne"&kerian#\'kersdal"%l-air#%aguer$"nd$$ruse$#sis#&castro$%hatow',
+    '#\'fastman$$iore$#ort#&groves#-ief-gathering$#sha$&ttlin\'#$jame#%l-boy&%utton$"ac%"ir\'!s$$hops$$isle',
+    '##man#\'ow-cost&(strength&(the-belt#!s$#ham#\'t-drive#%zebub")merkungen"\'n-porat#%ameur$%vente#$cini#&edicto&#kte',
+    '$#sch$$teau#$ifit\'!s$)ngborough#$jies#%llech$"ox#\'mohamed#%nlech##oic%!r$$liel#$pres#%salem',
+    '%#leg$#all$#ong%!s%#vim$!s#&umbing##zie$$oate"!o#"rn"$quai$%iffed"%rakah$!t',
+    '$$houx$#ula#!d#&engier$%zevoi#$gama$#ens%"re$%falke$#ham$$land$%monck$&ognone$$sten#$jaya',
+    '#$ling\'#ske\'#uet#&nadino%%sconi%!t$$elle%!s$!o#(oldingen$$ssus#$ried#$sham#%talan$$rank',
+    '\'!s"#sar#&eeches$#ige$"rk#!i$#gye#\'mirches#"se#\'t-armed$\'erfield$$iame%!e%#nfo$#way',
+    '#"er##hoe$$urum##san#&tabuys%#ney&!y$(er&mdash\'*rehy;known&!\'&%-ball\'*documented\'#lit\'#run$!i',
+    '#)ween-ness\'!s"!u#$bler"(vel-edge$%rleys"&wickii"!x!"fc"#icc"#pos!*hagyanagar##luk"!g"$ikku',
+    '"%opali"#sai"%undri!.i-partisanship"(berbrugg#&le-box&\'selling"$chat$&romate#!k$"et$#ies#\'oloured$"rn##ton',
+    '##art"\'emiller#%nvenu""fa$"no#!d##fos$!s"*g-capacity&!r$%mouth$(occasion$&salary%&cience$$wall',
+    '$!e#$news#%shots"!j"$kash#(e-riding#$kies"&laleet#%ijana$!p#&l-hook$%hooks$\'posting$%stock$%y-can',
+    '#&zerian"#mco"%n-bag#"ch#)ding-face$$loss#!e#)go-caller#&nenhof%$rton$!y#$tang")o-contour$)diversity$%power',
+    '#)catalysis$#hem##div#/electromagnetic2!s#&filter#!g$#lan#"ko#(leaching$$ight#(medicine%\'mbranes#%point%!l',
+    '$#ich#&search#0technology-based#$vema"&packed"&ranese#&chbank#"d\'$%-cage%\'drawing%\'feather&%ooted%\'hunting%\'keeping%$swat',
+    '$(whistell#&keland%+nhead-based&&stocks##rer#\'th-date(!y&&rights",scuit-barrel#!i##kra#&mallah%*rckstrasse##sel%!s',
+    '$#ick#$ulan##wal"(t-player#"at#%chin\'##lis#\'tsevsky"!v#%alved#%vying!-jp-controlled!\'laarkop#%cburn$%hford',
+    '*#tan&&bodied)!y&%chalk\'%omedy&$lead(!d&$mail&(on-black%$bean&$orne%(curranty%!e%%faced%&haired',
+    '&#ole%&leaded%*pool-based%%ridge%%stuff#*dder-grass\'%wrack##ese#\'gayatch$!s#$iken#!k##mmo##nc\'%#het',
+    '$$ning#"sp#!t$%hwayt$$ting%$lhof#!w#$yton#%zened$%oning"\'eaberry$%kdown$#red#%bbing#"ch',
+    '#!e$)ding-time$"py##ich#$nkin$*nerhassett#(pharitis#"rk##uet$"gh$!s#&wberry"#imy#&nd-eye&&folded',
+    '")ock-house#!d#"em#$nded#*od-brother&(dripping&(grouping&%hound&&orange&)poisoning&(shedding\'\'pitting$!k#(w\'n\'curl$)-football',
+    '$&drying$%field$$jobs$#out#%xford"%u-tac#"bs#&dgeons#"e\'$&-blood%$clad%&jowled$#col$#men$$nose',
+    '#\'menfeld#)nt-spoken#)sh-tinted%$baby#!t!#mps!"n.""es!+o&ccedil;us#)euml;sset""ak##lch#,rd-sponsored#(t-haling%%owner',
+    '$&swains"\'bby-sox%#ing%!s#%white"%cconi#\'kenfeld$#ley#$skay"\'ddenham$#ies#"ey#$kins##voc#*y-covering',
+    '%&making\'"ss&*ind-spirit%%odour%\'popping&&uncher%\'shaping\'"op&(natching%&warmer$$bags%\'oarding$\'checked$#fit$&surfed',
+    '#%hemer#&ninger#$sset#%ttner##zem"&g-roll#&ey-man#!i##les#%osian#&siders#%uslaw"+h&eacute;me#"ea#$ncke',
+    '#,l-in-the-bag$#in\'&\'g-water#"me#%srond"!j"#kes"%lanos#"et#"lo#(t&eacute$$erol$#gun#!z"*mb-shelter',
+    '$"es$%proof$"us#$pito"#nae#\'d-angle%&dealer%&holder%*stretching$!y#%e-ash%(cracking%&eating%%graft%\'shaking',
+    '%\'working$%field$$head#%fante##iek#&nefous##sam$"ch#\'usprint"\'ogiemen#\'k-based%#end%&jacket%%trade$\'/record',
+    '$&lovers$0seller-publisher$$wise$!y#\'lootian#&m-time#%oooom#,p-oop-a-doop#%stin\'#*t-blacking&%utton$"h."#rah#)chgrevink#+der-hopping',
+    '##gen%!r##isa%#lav##man#$natt#*oughmonger#&rowash&#in\'##sum"%scart#&kovits#$mere#"ox#&s-eyed',
+    '$#man$!o#!t$"ik##uns"\'tanique#!b#"h\'#"os#&ticker$(le-brush\'&opener&%brush$-om-fermenting#(usharova',
+    '#%bares##che#&dhnath##kar$$rouh#%lters##raq$$cart$*geoisified%!h%$ueil$&nissen##tie#$yant"&visand',
+    '#\'dlerise$"ry#"et#&l-back""x\'#+-containing$$fish$$iron$#set"\'y-child$$life$%scout#\'cotters##ers#"ko',
+    '##ter"$zell##zie!#pif"&norway""sa!+r&uuml;back("nn"\'aathens#(bantpark#(cegirdle$\'hiating&%opoda%)ycephalic$%teate',
+    '$%docks$%ewell$"in#&eriach#\'in-case&%death#(ke-fluid%#man#%mbell%&levale&!y$"er$$ston#*nch-colour&!y',
+    '#)ss-railed%$nick#$tska$$tish#$zing"%eacon$(dcrumbed%%lines%$sall$&k-outs%%dance%)fast-hour$$mish$#rly$\'st-side',
+    '&$roke$\'th-held&\'ing-out#$cher$#ker%!s#(dwardine#&eching$"ng$$veld$(ze-blown##ger##ken#&lstaff##mel',
+    '#&sciani#&tesche$%fords$\'tingham#$ugel$#hat""ia$&n-type#+ck-and-tile&%layer%%built%$wood\'%rking$"om##der',
+    '%%wells$&gemans(#rsh&&waters$%north#%ggait$(ht-field\'&headed\'&yellow##ned$#ker%$mann%!s##sch$$sard',
+    '&!n#%taine%$nnis$*ish-backed(&equity$$tans%\'le-bone%&onioni"0oad&rehy;chested%)-breasted%%brush&"um%"us#%chwel$"ks',
+    '$"er$$iaea%#gan$#ski##eck##ils#\'ke-even%!d#"me$(obenzene#%niwan$%terre$*ze-casting#(oklynese%%mount',
+    '$\'mbriggs%%house#(ssolette#%ther\'\'!-##ule$%ncker#&wbones$"ed$\'n-edged&$gold%)ish-black)$pink*%urple%&y-grey',
+    '"%uchid$"ke&"rl#"el##fen#$ggen#&mmagem#%nelli&!s%#val$#ico#(sh-strip#&talist\'"ze#$yere',
+    '"\'ynamman$$coch$#iau"\'zezicki!#sdc""ec"$teii!"tb"$v-10!&uarque""ba#(ble-bath#!i"$chli$"on',
+    '%$roos%&t-shop$%sburn"\'d-burst#$dery##let"%eller#)naventura"%ffery$&lehead"%g-fix#!g$\'eration$#in\'#!i',
+    '"%h-buh"\'ildmark$&t-cane#(ronfosse#"st"#jic""ka#%haran#%owski"%laxie##dir#!e##led%\'t-point&#in\'',
+    '$&headed%$orns$#ick$$nose$%s-eye%&hitted#"uk"%mbler#-per-to-bumper""na##ger#"ne"&pacare$"ti#*renorphine',
+    '$!o$!q$#woy#$cott#%derop$$ocks#*eaucratize##gas$&erking$$rave%$uine#%hinus#$kert$!i#\'lesqued',
+    '$#ing#%ndell#!o#$ried%"ng#$sted#"ty#!u#(wardsley"\'s-based%"oy#"ey#+h-fallowing&#ire%#hat',
+    '%#ing#+iness-cycle)%woman(!e#$quin##ser$$mann##tan"*tcher-bird#+t-indicator$!a%%suoco$"en%(rfly-net&$kist',
+    '\'&making&$hook"!v"*y-and-hold#)er-seller"\'zz-bomb%&phrase$$cock!#vdg!(y-and-by\'%large#*the-castle"#ass"%egone"+gd&oslash;y',
+    '"$rite"#tex#"on"$ward#"yd ,c&ndash;fobe!"\'n!#-46#!7"!7"(boundary"*citrulline##ome"!l"#nmr',
+    '!!0!#101!#200!33-6&lsqb;pvm39&rsqb!#916!#a:p"%baero$!n#*bage-green$#ing#&driver##in\'#-le-controlled%\'systems#$oose',
+    '""ca$!k##har$$eris##ked$"up"#dby#(disflies#$erni#$ilhe##ney##ran"&erbwdy$#fai$(ulescens',
+    '&\'opapism"#fer#!u"&glione"#hag""im#!o#"ra$!e$%nbaan%$holy$\'o-based"\'jabamba")ke-making##ile',
+    '$$mari$!n%&drella%#oid%$ques$$thea#/cium-phosphorus$#omp%"tt#\'endared&#ers#$haem#$icos#.l-and-response$$anan',
+    '$%haven$)iphoridae%&triche$$outs#&or-gas%"ia&)e-counted&%fiers$!t%#ype(!s#!p$!e$%urnia##ren',
+    '#$vani#\'ydonian"+m&otilde;es#(aldolese$%ttini#$beak$%ricks&$dge-%,o-ordovician#(el-corps%)opardalis$&rarius$!s##lab$$ough',
+    '$#ran#$plex$"op$(us-based")na-indian$"ce$"pe#\'borough#$cale$!e%"ll%*r-fighting##dao$\'leflame#)e-cutting',
+    '$#lla$!m$"rs#$hedo##nel&#ini$(ibalises$#not#%onica\'"us&$sing$$odle$#ssa$!t#"ta',
+    '&#ini%#ten%"ur$$eena%%loupe$\'harides$#ine$$oris$!s$!z#$utes%!o#$zona&%etten"0pacity-reduction',
+    '$)rcaillies%"ed$!x#!i$\'llarity$"ot$-tal-exporting(\'raising&"nt%!o##lin#$oral#%paris$\'elletti$%ielow',
+    '#\'riccios#/tain-in-waiting%!l$&ioning#$ucin""r-$%alarm$%crash$)producing$$sick$%theft#$abid$!m%%elise#&bamate',
+    '%,n-containing\'%metal\'%paper&\'hydrate#\'cassone$#eri$&harias$$iofi#\'d-sharp&&orting$$file$#oon$&phones$$ucci#+e-excluding',
+    '%\'related%%taker$(er-break\'&making$#lle$"nt&!s$!t##fin#%ignon$#nae#$leen$%ungie#\'magnole$#edy',
+    '$#ula#%nauba%#von$$duff$#ock%$vsky#*ol-ini-ana%"ee$#med$#zzi#%peaux%%llary%\'ntering\'#ing%#rby',
+    '&&bagger#%racks%"tu$$eres$!i%)ckmacross$&ollton$&y-outs#"sa$$lake$$ound#%thago$#uja#(ved-wood#(yopteris',
+    '$%palca##bar##cio#"e-%&report$$bere$\'working#&h-call$&iering#&iraghi##ken#$noff#&selman%(tte-tape(!d',
+    '%#dys%"er%#ope#%tagna$&ellani&$ucci$!i$\'lecroft&!d\'#erg&%field&$main(!n\'&oreton&#rea',
+    '$!o%"ff$"ra&$trix%"es%$oite%$ucci#&uarius""t\'#!-$$boat&!x$%hater%%eaded#$acol',
+    '%&epsean$$nach$%rrhed#\'ch-line&$word%$lord$#ote#&echise\'"ze$\'rbility#.h&eacute;drale$"ar$-erineofaragon$&olique##let',
+    '#$naps#%onica#%shead$!i#(tle-byre\'$mesh\'&owning\'(rustling\'%truck$#oes#"us"#uce$%hemar##den#$ghts',
+    '#$ndle#$sier#(terising#$vary"&ve-man"+wdy-mawdies"&yleyed"#zal$\'udehore#$imir!#bus!$c-m4"&ir-601"!u!\'d8-fitc',
+    '##sar$!g#!t"&botari"\'cchetti"#dco##ria""ed""ga"\'lebrare#!i#"je#&laring$+ulose-based#$mira',
+    '"#mwc"#nt\'$&aurium$\'erprise$(ral-area\'$ises)"ta%\'e-based\'&circle\'(designed\'\'related&%stage&!x$\'uriated&"y\'',
+    '"#pba##eda##ple##ror"#rec%#lor$%opsis##isy$"us#$nach$"yw#$rado##ten#\'uletide#"va',
+    '&"us"$sari#%erani#%s-pit"\'trimide"#vik!-fc-containing""ms!#gce!\'h\'kasia"%-1211"%a-cha#&boulon$#rol#%ck\'ed',
+    '##gan$#non$\'ueramas#$ikin$#llu$%rlegs%!n%&people%$side$#ses#!l$$dean$&k-free%$hill#,m&aelig;leon',
+    '%#run$#eau%(leoleech$*onix-mount$$pery%0ionship-standard#,ncellorships*!y$$dran$\'el-type$+nel-hopping$$onry$&teuses%$reux#%olais',
+    '#(r-a-banc$,acter-sketch$#eau$%geurs%#in\'%&rilled$(iot-race%#ssa%(t&eacute&"as&!e$$lott%#son$%mante$#tac',
+    '%$junk$#vet#(s\'n\'dave$"id%%ng-up$%selas$%tanet#&ttaway%)er-filled#"ud"$bada"(eandearg$!r$$vley#(cking-up',
+    '%$stay#-erful-looking%\'leading$(se-board\'&grater&\'mongers&&paring\'$lant&&wright#(iranthus##kol#$lsey#\'mi-zorb%$nova$(ometrics',
+    '#$nard$!e%"ry$$gmon$!u#%pchuk#+que-cashing#%rcher$%ednik$#les$+nobyl-style$"on$*ry-blossom$!y#"sh',
+    '$\'s-piece%$hyre%!y$(t-height$$wick#&ttiars#&vreuil#$wers#%yette"#hay#$ukha"$iado#&cagoan$"hi$%k-pea',
+    '$&outimi#"da#\'eftancy#(ld-based&&gazing&\'killing("ng&#man%"ed$#ies$$lery&!y#(m&uacute$"ay$&borazo',
+    '#%n-wag$\'eseness$!i$\'n-dearg$\'o-based$#you#%p-per%$shop$$ande$"ps#(ricahuas$\'urgeons#$tted%#ing##usi',
+    '#$weta"!l#$amys#%oasma$%rdane%$ella%*obutadiene&(thiazide%+pheniramine"&odacki#$enyi#$gram#&innich$%r-boy#\'ke-free',
+    '$#lah%&erford#%mpers#+oseexposure#+pping-block#\'rasmian$$data%%ettes$#ine$%rillo#"ta$!s".r&eacute;tiens#&ichton$#sme',
+    '%(t-figure&,ian-humanist)#ize)$sson&$like&\'mastide&&ophene#&omatid%\'osome-7$!n#$ysal""uc$!h$%kball#$ffer',
+    '##irn#(kar-type#$mmed#"na$#der$#ked#"on#)quicamata#,rch-building\'$life&\'illiana$\'riguera#$sing#$ters#"uk',
+    '!\'iampino#"ra"\'ba-tran"(catrices##ily#&ognini"&daroid#"re"#elo#$rach"$ftci"+gar-puffing&\'smoking%(ette-end""im',
+    '#&gerran#!t"&marron#$tech"/n&eacute;-weave#\'chonero#$ema\'&\'-screen&#gic$$rama%#eus$(tropolis"#och#"sc"\'pollino',
+    '$#ico"%rcini$$king$)uit-board((training%\'larised%!m&(-pacific&%cized&\'stanced#!l#\'rhotics""sl#$tine""to',
+    '#%rated$$ussy#$ties#)y-council%(dwelling%&region\'\'publics%$type%$wall"#ves$#tte#$ilis"#zye!-lackety-clack#$ires',
+    '#$mant$%oring#*pper-board$$tout#$rety$#kia#)ss&eacute#\'udianus#"ve%*r&iacute;a$$ipes#%wfist#\'y-based%\'puddled")ean-sheet',
+    '%\'ing-out)%woman$*rlogistics&(y-stated%%point%\'quality%\'support%$view#!c#$ggan#(isthenes#$mmey$!o#\'ricalis(!s',
+    '%"sy$&miston#$thra#)ver-clogs"$imap$$beth#&nkered#%ppins$"so#(tomachus"(oathbond&#ing#\'ck-case&(doubling&(shifting',
+    '%&spring#"de#)mipramine#!n$&carrig$%liffe$!o#*se-harmony&$look&%ratio&&spaced%,ly-contested$\'ing-out#*thes-press\'$pegs',
+    '%\'berries")ub-member%$room$$life##ett##low##nio#*ster-based"%ysmic!"mf#!t"!u!\'nidaria#!m#!p',
+    '!1o&ndash;ordinated$(tilde;ac"(-curated#&driven#\'funding#*habitating$\'eadline#2immunoprecipitates$\'nfected#%owned#)presented#)referring$\'otating#%write"!a',
+    '%%works#(gulating#&l-fire%#gas%%owner%\'powered&(roducing%$shed$%ified$(merchant$&picker#!r$!n$+se-featured#(st-guard',
+    '%%liner#(t-armour%$hook%%stand$$alen$#man""ba##bet$%leigh#.ern/supporters#%oller#$tree#+urg-trained"-caine-dealing()producing',
+    '#(k-er-nee%+of-the-rock%&teaser$$aded%$hoop%%tiels$$eram$&ington$%scomb#&oapops$#cay$"dy"%de(s)$(-cracker$(breaking',
+    '#$ford##ice##lin#\'ominant"%eloms#&nwealh"#fan#"f-$"ea#$iant"$gema$#val##nee$#iot%.tive-behaviour',
+    '##lle#%n-box%$slot$#tat#"ty"#ked"#l.-#\'a-based$"rd%$ossi$!x#%cemid$&hinine#.d&rehy;blooded$!-',
+    '$%frame##ege%$rove$&strial#$igny$&ncamps%$vaux#&laring\'!s$$eage(!s%$ctio\'*or-emitter%#ge\'&"ia',
+    '%"ry%$ssie$!i%$gate%%neige&%gtree%(vaccinus$$oqui%%types#(obanthus$\'calized$&mbiano$&rblend%#ich%$plus',
+    '\'\'pattern#\'portage#"te$#ing#\'umbiade\'"um"&macina$"gs#$bien%)ned-cycle#$cast$"on#%e_out##far$$ort\'',
+    '%!k$&grates##mem%\'nsalism*"ty%!r&)cial-debt*"es*\'ly-made$(iserates&,sary-general%"tt\'#in\'$&mittee$(oditized',
+    '*)fetishism%&n-base\'$user&%wheal$\'unalist&-ist-sponsored\'*ty-related##net#&odious#,p&egrave;red$$acta%(gnonnage%%ignye%#ny\'\'!-',
+    '\'$line%!r&%ables&-ison-contrast&!m&+tmentalises$#eed%*netrazione%#res%)tence-led&$itve$*leted&lcub("rs&#ynt$$osit',
+    '("us$%romis$&tronix$"us%(tability&+er-operated)\'science*%earch*(upported)+to-computer+(mography)#use(%watch#(services#!t',
+    '##unn"&ncaves$*ept-driven%)rt-master\'&ina-ed$&higlie%!s$(iergerie%#lii%$ones$$octs%#urs$$reto#&dorrat##ern',
+    '$%iance%&dence\'$,lict-solving$+r&egrave;re$#ute#$gers$$reso#&iacian$(sborough&%rough#(jugating%\'nctival#&nectic%#lls$)ing-tower',
+    '$$ubii#$rods%!n#(sanguine%!t$0ciousness-raiser$#ejo%,nsus-seeking%)rvatorium$%idine$(olatione%*nant-vowel$(tipatied&1tutionally-minded,$elle',
+    '$.ulates-general%$mate&)er-credit#,tact-tracing($zone%#in\'\'7s&mdash;source&mdash;of%$rini%!x$(emplatio\'"tu%%ndere&*ts-density%#xt\'$+inuous-feed',
+    '\'(ted-exit%%ejour%!o&\'l-freak\'#ing\'/led-environment%&uction#&venant&*tionalised*$eers%0rsation-stopping(%zione$%icing%$vium#&ybeare',
+    '#)chy-cooed##kii##lin$&lattin$#max#"pt#!r#$tchy"*penhagener,!s#)ing-stone##osu##pel%%r(ii)&"-7',
+    '$"id#%rinus$&ophagy#&ulates#(y-number%#pad$(guarding"(quetting"&racoid$"il$!t##bit#"ca$$ione$$uero',
+    '#*e-electron%\'funding$\'ference#"ia$&eltavi$#mme$$nthe#\'k-screw$#age#$mier#)n-goddess%%route%&yellow$!a$%bread',
+    '$%holme$%iglia%"st$$ovii$%stall$!u#,porate-level$&usized#&radini%"ll%#nce$$elli%*spondence-$%iendo&!u',
+    '$*respondent$\'uptione$&ymella##sas$#ino#$tile$$land#$vina"$salt#"ep$!y#"io##let#)meticized##ner',
+    '##sec%"ts&#ted#\'t-a-lot%,of-ownership%%price$$eley$"ie$$wold##way#$ying$%stems"#tac#$chin#*erminosity',
+    '$!i#%leigh#!o$$paxi#*tage-based&!y$&ingley$(on-based\'$reel\'\'spinner&$tail%"wn"%uglan#(lommiers$#ure',
+    '\'!l(#ing(*or-officer$0selling-learning$\'ter-act(%order($plot)&unched-#ing(&shaded,#ing\')attacking\'&blasts\'\'marched\'&offers',
+    '\'&shocks\'$vail%#ry\'\'%-rock#$ple\'&$ness#\'rchamps$%iered$$onne($ment$)se-number$"t-&%based&$case%%isane',
+    '#$vade"\'variate#/enant-agreement$&r-girl&$line%#in\'%$line#%ilham$"na"%w-pat$$town#\'abongga#$dung#)ley-built"#x\'n',
+    '#%shall!#p-3""ap"!j""ma"(r-number"*u-info.exe!"qt!*r&ecirc;py",ack-stopping%&walker#%gabus#$igar&#vad%$lynn',
+    '%%shill%$tara%$well#&kehall#(nesbills$#son#\'sh-land%)ed-landed#$ting#!u#*w-thumping##y-4#$zing$%yhead",eam-skimming',
+    '%%stick$\'se-free$$unce#+dit-bearing\'(creation$%o-bit#$eler$"sh##gar#"il#\'linsten#\'nellate$%icara&%ichla$"na',
+    '#\'oleness$#ser%%oting#+pe-de-chine##rar#*scent-moon$#ent$$sent&!r$#tar&#tus#$usot#&vassed$\'ecoeurs#(wel-work',
+    '$#ben%"in%!y#-me-prevention&\'related$!i#!n$#gle#$ppin#0sis-intervention$$pate%!i$.s&rehy;crossed%\'crosses%"ie',
+    '%%alize#*tical-path"%ocean$(het-work$%keted$#uta#"is#%memco#$nite#&okston&!y#%pmark$&thorne##que##ser',
+    '&/collaterisation()rrelation&)fertilize\'&unding&%guard&$kick&\'licence&%match\'%ember&$plot&(referred,#ing(%lated\'"oc&(sectoral',
+    '&*tabulating\'#erm&$word%"ey%%frame%\'hatched%+ing-sweeper%%peaks$$tini#$tons$"ty#"ud$%stade#)w-keeping$)d-surfing',
+    '$\'n-owned$"so##zet"$rick"$uach&"em##ces$%ifige#$dele$"up#)ickshanks$&g-morn$"sy#$mbed$%palls',
+    '#+shed-velvet##xes##zes"%x-48z"#yed#"la#\'ogenics#&ptates%)o-fascist#+stal-gazing!#see"&icseri#%llick""sr"$utcb',
+    '"!h""lo"!m"!u"!y!%uased"%batao#&binses#!o$)-futurist"$cina#%kolds%&o-spit")d-chewing"&e-ball',
+    '"$fton"%kurca"#lag#"ms#"ra#%tiver$,ural-capital#&winiac"%maean#&bering&%ledge&!s$#ley#\'huriyet#+ulativeness',
+    '#!o$\'belinus#$tano$$onas"!o")pid\'s-bow#!w"\'retting#&ialist$&ositas&!o&"um#"me#)raghbinny%"ns',
+    '&)t-voltage($year$-iculum-making"%sping#)tard-skin$$odia%\'m-house&-er-contractor)&number"+t-your-loss#$ress#!t$$inge#!v"!z',
+    '"$ejic"!m"$ware!$wmni!&yanate"&berman%$shit"\'clamate$\'o-cross%\'control"#der"!g",linder-mould"(mbalines#$reig',
+    '"%narae"(pressoid$$imat%#nid(!s#&selids"$riac"%thera#"ob$*centrifuge%(hemistry$#dex$%phaga!0zechoslovak-made /d&eacute;champs',
+    ')%lices+&vrance)*mod&eacute!\'\'ambert#1rch&eacute;ologie%!o"*entreprise##tre"#oil#%mbres"%y\'all!.(cgcxaattygcg)!&-dimer"\'proline"&series',
+    '!#115!%2-mac!"45!#aah"#ble"(chsteins#!m""d\'#&-to-be"$evid"#ggy##hir"#hik##lak$$gren',
+    '"$idan#\'gneault#$ichi#%mones##rnt$"ut$&y-maid#$shin"$kole"*l&iacute;s#"ar#\'ekmania$!r#"ia$#bor',
+    '#"la%&s-born\'%style$&ington#%ziell"\'m-burst#"en$$stic##ion#&nified$$well#$ozel#"pt""n.##aus',
+    '%\'masters%%rcise$*ing-master#!d$#ini$*ruff-laden#\'electro##ino#$juma#"ko##ned#&ocrine#"so#"ta$!o',
+    '"%ochos"$pped$#les"&raprim#\'bakalan$!o#"ch#!g$$ecit##ier#&k-gold&%round#%lingi\'&tonian&!k',
+    '#$roch#%tnall#$win\'%"sh""sd#%hamir"\'ta-bank%$file&#low%*monitoring%$pump$%chase%#lub$$flow$\'monitor',
+    '%"am%(ecorders$%sheet$$tech&"rm%#ree\'#nds%$ypes#&elined##ini#\'rontech"$ukes##lat#&nsinge"\'vedoyle',
+    '$%ytown#(idsonian#$ross""y-$\'dreamer$&flying$$work#!.#&adhvam#"le#&nafile"$zing$!x!#c-4#$600b',
+    '#%based"#a-3!.e-accessioning#(blocking$,ottlenecking#&coding%%ntrol%%unted&%pling#*emphasises#)focussing$\'ragment#,historicized$%orned#/industrialising',
+    '#*oxygenated#,politicising$)rogrammed#$rail$*ecognizing%\'gulated#&sexing$%tress#%train$%uning#(watering"\'ad-flat%&heated%&letter$#ish',
+    '#*e-sephacel#"ky#$nesy#\'th-cell&%drive&\'in-life&&rattle&(sentence&&threat%(lessness%$rate%&tongue##ver""ba$&uching',
+    '$!t#$ieux$&litate#$ouch#%recen##ska#,t-collection%+forgiveness%&relief%&waiver##usk#"ye"+carbonising#)hlorinate#(imalized',
+    '$!o#&k-beam$#led#$lair$$ease$\'utching#&odings$&lonise&&urises$%mpact&&resses$\'njugate%\'voluted*#ion$$uple',
+    '$&etales$*iminalized"-differentiate""ee#!g#)ms-figure#(p-acting%$dish%#end%%lined%$mine%#pan&*enetrating&(loughing#&rleaps',
+    '#-ensive-minded$#rre#)ragmenter$&ocking"%glaze#*ree-giving")havilland#%isced%)toricized"%icing#\'nomenid##ter"$jure"%lange#%bruck',
+    '#(hi-based#"ic$$nked&#ing$&yannis#&l\'arco$\'enbaugh#)ocalizing$$uche%#sed&#ing#$port#(umptious#$vers"*magnetised',
+    '$#nd-\'&supply$*terialized$!x#"by#&etriou#2i-caract&eacute;re%\'pension$$anuk$&nished$+semiquavers%$sion#\'mollari#)obilising$&cracy\'',
+    '(-ic-controlled\'!y$"ed$$krat$&nising$"ss#&urrage#*yelinating$*thologised",naturalizing#$cher##dix$"re%%ogram##emy',
+    '##gie$!o##iau$#ker$$soff$&trator&%ified#"ke##ofa#"ry#\'simeter#$tary$#ils##yse"#och',
+    '%,ribonuclease)#ses"%paris%\'tamento$#ulo#!c#(endables#-hosphorylated#&itting#\'olarise*!d)#ing$)sit-based()insurance$\'t-based',
+    '$&essed\'#*th-charged&,interviewing"#rab$#ils#,byshire-born#$echo#&macort$!o#$ning##ryk%#man#%yabin")saguadero$\'linated',
+    '#*ensitising)#zed$(xualised)#zed#\'granges#&iccant$%gn-in\'\'related(#oom$&rables#\'jardins#&k-lamp$#fax$#ing$$jets',
+    '#*patch-case$$erus#$sent$&icated%*n&eacute;e#\'touches$)ructuring"6tective-superintendent$%rmind$%sting#$hier#&onates#\'raining"+utschelands"(valerian',
+    '$(lopment\'\'&pement#\'icehigh$"l\'%+-worshipper.#ing$%trify#$reer#$tram"$wart#!e#$fall#$ilde#$snap"$xies',
+    '!"fi!#gft"#xii!+hairbhreach##ram$$sana"$oluo#"og$!n"#ruv""si!$i\'ed##ing"%aboli\'#cum',
+    '#$dems#%gram\'\'#ing\'$ming#\'l-a-bus\'&ticket$\'ability$#com$%index$&ytrode#(magnetic%%ntino$%etric),ally-opposed#&netics',
+    '$%irism#$ried$&ralite#"wl"%bbits##nah#!s"*ck-tionary$#ing$#see#*ranopteris##tat$&ogloss"&ddymen#(ieraceae',
+    '#*ymograptus"&egetic#"ne#*sel-engine\'&hauled#*t-breaking$&burger$"ro"\'ff\'rent$&ferent$"ic&$iles"+gging-stick##ist$%tises',
+    '#"na##oll"+hydrofolate"#ked#!o#"te"%letti#"ga#&tiazem""mi$#tar##ove#!u"%namap$"nt',
+    '##een#&galing$&leside%!i$"us#&labyre#(ner-gong\'%plate#!u"%odoro#!k##med#$naea$"ex"\'p-stick',
+    '#)lomatique##noi#$rete#%tychs"#rec%*t-attached\')broadcast\'%entry\'$feed\')injection&)ed-energy&$ion\'&$plus#&ichlet")s-barring',
+    '$!d$(ssembles$$vows#\'budding#%chord$#oed%\'grapher%&mmoded%$soma%*untenanced&$rse\'%(veryland$#ret\'$ione#,ease-bearing',
+    '$#gno$)nchanting#*habituated$%clout$&making#(impacted$(nhibited#%klone##lay$%lokey##mac$%ounts#-neyland-style*!s#(organise',
+    '$%raise%"in#&quiets#)respected#\'satisfy$&embles&&inator$\'imulare#,tance-making%#val$\'raining#\'ulfiram"\'thiopin%$zone#$tman',
+    '##ini%%ycell$\'sionist#$sion#$vent"#wan"*xielanders!(jaballah#!x"#ogo#-rdjevi&cacute$!e"$ukic!)k\'tronics!)me-medium',
+    '#$triy!*na-bending$.fingerprinting$+recognition"!e#+propetrovsk"%u-mrh!"o-""ba$"gs#$bies#%cross#!s"$clea#.umentary-style',
+    '#\'elinger"&e-skin#&ringer#%skins#$zema")g-handler$&relief$$sled$#tag%$ooth#$gone#$legs#$moor#"oh#"ru',
+    '""ko#&umente"$lfin##ina#\'ly-bird#$opes#-phin-language\'$eers"-m&egrave;nech#&angart#,estic-equity\'#que"(nacloney$$ghys$%tella',
+    '#&bavand#,caster-based#"de#"ed$(gal-born#%gbang$!s#(ibristle#)key-drawn#$nant$"et#-or-dependence%!a#$tcha#"yo',
+    '"$odad$"oo#$land$!e#$mpah$!s##nan$"ie#!p#"r-%%panel&$late&%ocket%#top$%latch',
+    '"*pe-testing#$iaza"*r&eacute;e#\'aiswamy#$elia#"ff$&keller##ies#"ky#!l##ner$&felder$#ock$%seiff#$omin',
+    '#!r$#ian##sch"\'semeter#"sa$"es$!o#\'toevski"$than%"rd"+uble-a-plus\'%cream\'&dealer\'%image\'&minded',
+    '((otential(#ump\'(stopping)&rength(&uckler\'$tape\'(wishbone\'*your-money&%check#%ghray#!n$"ce##ras#"te$&hwaite',
+    '$%house#\'refjell".wn&rehy;stairs$)-faulting%$haul%(regulate%&spiral%&tariff&+o-earthness$\'cutting$#end$%falls%$orce$$hall&"ul',
+    '$&slopes%&trokes%$view$&warped#$sons"#zar#"ey#!o!$p-se"!w!$rabo#%caena#"dy#%egebo#+ft-proofing',
+    '$&onescu&\'s&mdash%$slav$&uignan#(invalves#(m-bottle$\'a-based&&school#-ught-excluder()stripping\'\'proofed#&w-gear%%sheet$&ing-in(%paper',
+    '$"ne$#rod#$yman"&e-fach##am\'%\'-filled&.interpretation&$time%!e&(r-father#&chsler#%nnans"*ied-flower#)ft-filled%\'netting',
+    '#\'ll-down%#ien##nan$$kall%!e%-ing-chocolate#)p-feeding#-ve-management&%shaft$"in&)g-related#&zabone"\'oguerie#&p-ball%$kick',
+    '##tar##uet#\'ve-road"%ubbed#"ck#(g-addict+#ion%%based%(smuggler%#use$&stores#&imnich#%mahoe$&condra$#lin',
+    '#&scilla$$illa$"us"%y-lay$#out$$shod#\'broughs#$dock#*oskephalai!#scs"$m-iv"\'p-e1000"#ssl!#tac""ms',
+    '"\'al-mode%&worker#!s"%bajic##bin&"ed$\'lejoint##ius#%onnet"(chatelet#"ie##ket$%ponds#"um"%dders',
+    '#"uc")es-paying"#ffa"&ggleby""in"%kedog#"la#%ovany#"we"&lcolax#"se"\'mbfound$%shows#\'founded#\'p-truck',
+    '"%najec$"nt$!p##bui#)cton-born#\'e-slack#&gareed$#ing##ker##ner$"ie#%ottar$#yer#%raven#$sany',
+    '#$tree"#ong"$phar#"la$%exing"\'ralumin$$nsoy##dle#"is"!s#-seldorf-based#(t-filled%%sheet&$torm$%bathe',
+    '"\'tchness#$hoit$#uit$!y"#uck#!l"!z!#wan"#ink"!t!(x2-based!)ybbukking"!f#(ed-based"#ked',
+    '"!n#(amitards%&ometer+!s$$spek%#tes#(er&mdash#$orod"!w!+zhugashvili"!o#$ngri \'e&ndash!%-2300"$6000',
+    '"!e"\'mailing#$odel"$pawn"$team""vu!#122#!4!$ach-"#dem##gbe#%weard"!f"\'glemoss%!t',
+    '"!k""me")r-bending$(catching$\'trumpet#"ac#\'disland#!e##ith#/ly-19th-century&,20th-century&)afternoon&$bird&$life&#mid',
+    '#*ned-income%*st-looking$%mouth$$outs$$wine#+th-crossing\'"ut&(digested&#man\'$over&&saving%%light%$pack%$wire#$zone',
+    '#\'i-jacks$$grow$,ly-developed#+t-northeast%(trending$$away$\'borough$%croft$#ers%!x$#ing$#ney$$port$!t#&y-come',
+    '(%store")ting-time!$bble"(erswalde"&ionite"#ner""us""yl!%c-acp#&backed#&german#(japanese#&united""ca#+lesiasticae',
+    '#!r")o-balance$(glasnost#&action#&master##nom&+ic-recovery#!r#*toxicology"$rits!&delrid#$nbeg"#ge\'$#set"\'in-burg',
+    '$%shall#&tioned$%orand&&ialize""ku"&minton"#sac""tv"-ucation-based*(industry#"le"!w!#eee$"ee#&nglish',
+    '"%ikish"(l-shaped#%grass"#ney""oc!%f1-11"*c-negative"-fect-to-cause&%uated$!d$(rvescing""is"+ra&iacute;n!#g-3""al',
+    '"$eler")g-chamber$$mass$\'rolling$\'sucking#$cups#!e$"rt#*shell-blue$%perts"&inhard"%lises""ng"+o-evolution$%ideal',
+    '!&hirobo"#mke!&ichorn#$khof#!s"%detik"/felian-frasnian"$gene##ht\'%%-acre&#bed&$club\'&ountry)"rt&&footer',
+    '&%state%)een-stone%"h-%#ish"!j"%lbeck"\'nbender"$rann"&senach%#son&#tat##man!)jaculates#"lu""up',
+    '#&nomika"#ram"$stra!%l-fil#$lahm##sir#&tahrir""af#$mite#!s$*tic-banded\'!a%%ogran#$ting"\'berfeld',
+    '""de##ine%$hope"&eanore#$ctic&+on-fighting)&winner-#ing%%rabel&#ibe\'-cal-equipment*)ly-driven&"o-($beat(*deposition',
+    '(\'fishing\'\'copying\'&fished\'"la(#oid\'&motion*#ors\'"n-\'%spray##gia#!r#&usinia$&therai#)ven-metre($onth',
+    '"#fie$\'n-faced"#gol"%iakim#$burn#$ette#"hu#"is#$phaz#!z$$ache"#kan#$horn#!o"&lerdor',
+    '#&strand"(maloglou$!r#%sford"%oping"&severe#$trup"\'termere#(hamensis$"or"#via"#way##ert!"m\'""-4',
+    '#"ux")barcadero#,rench&eacute""dy""el#&ndemus#"rg#"ss#"tt""is"#joi"!l#"en"%meram""os',
+    '"%panel$&thised#,eror-worship#+ire-builder#0loyee-management&*ment-based+(creating$!y##ros#%ty(z)%(-looking"#ser!(ncainide#1ha&icirc;n&eacute%#nte',
+    '#"om%$bred$#red$+unter-group#&uentro$(lturated$%mbent"&d-1985$#cap$%group$)labelling$\'of-file\'$line\'%scene($hoot',
+    '$%state#\'eavored$"sa#%grain#"it#$opeg$$rado$&thorax"&ergiya&#zer%,y-conserving##sco"&feeble$%offed$!r',
+    '#%lamed"-gagement-ring#\'elhardt#(ineerium#!l$,ish-occupied\'!e#%raves"!j"%khari"%laced"#new##ion$\'scorthy"%ough\'',
+    '"\'saimada#&consed#%erune#$oniq"&tereth%*oendocrine%&prisal("ze%)tainment\'#(ity-type#$ores##red%%nches$$yist"$ured',
+    '#)iron-xxxx\'.ment-compliant#&notrev#\'y-guilt!#ohr""le"$then!"pb""ec",hemeropteran"*icureanism$&ycloid#&phanes#%scopi"#oca',
+    '#$xied"#pur"!t#!e"&ulario""yx!+quidistance$(t&eacute%)y-warrant$\'vocator!%ragny#!i#$ldin##tex"%bakan',
+    '"%emite"#gay"$hart"&iugena".kennungsdienst#"ki"(lenmeyer"\'molenko"&n&ouml#!o"(oticises"\'pingham",ror-handling&&ridden&&strewn',
+    '",stogoetsland"!t"\'ythrina"&zsebet!%s-175##345""ag#!p"#ber"%calus$!p#\'henchia$(scholzia#"om$#var',
+    '"#den"%fahan",pa&ntilde;ia$#liu#!n#(osizione"$sais$&y-type#$effs$!r%!e",t&eacute;ban##-il#$alia#&eeming',
+    '#%overs#&rellas$"ie"(zterhaus!(tchachan"$emad#+rnit&eacute%!o"\'helbald$%rised%$talk#(ic-based#+nic-latvian##oxy"!o',
+    '"#tal#"re"%zdorf!"uc#%alypt#(haristia#&ryphia"$enor#!r"&logise"&mobate"(phausiid")rhythmics#"o-%\'auction',
+    '&\'usiness%"cd&(hristian&)onference%*enthusiast&%quity%#jet%$link\'"st%&market&*egalopolis%$soap%$year$)barometer$+convertible',
+    '$#mac&\'gnetics$(pe&mdash&%anist($ness&#sat%%lants$\'sceptic#%yalid""sa"!t#\'hanased#"on""ug!#v-4',
+    '(%stria"$eing#(ningwear$#sen$%tdata#+r-advancing%\'burning%*developing%\'falling%+lengthening%&mobile%\'patient&*rogressing%(questing%(receding',
+    '$*increasing$#ley%%oving$%ready$$ying%$thin)"g\'"%genia",idence-based))gathering#"l\'"#ora#%stick"!p"&ryzink',
+    '"%zones!$wans""ig$"er""sd!)x-actress$*dvertising#$bank$&oarder%$xing#\'captain%!t$&olonel%*nservative%$pper',
+    '#(engineer#*government#&hacker$$ouse$%unter#\'killing#(musician#$name#$ortf$$wner#$para\'(troopers%\'ssenger$(olitburo#%queen',
+    '$)epublican#&school$(ecretary$*tockbroker#%tutor#)volunteer#&worker"$amen$"in#!r"%celan#!h#%itin\'#!l#*ommunicant',
+    '"&ecrate#!l#&rcise\'(%-book"\'foliant\'#ted"&halant$#nge#&ibiton$(lirating""im"#lax"+opterygotes"(pansion\')!e',
+    '$&dicion$\'ndables$$rtel&&ronics##lan#,ort-creating\'\'related&4s&mdash&dollar;2,500$)sed-shore"&specto".t&eacute;rieur##buy#(emporise$)nded-life%$sity',
+    '&&orized%(nalising&!e#*ra-striate&(temporal%%dural%$vert%%wurst#&ubated"&udates!\'ye-ball%$lack$%power$)straining$(watering',
+    '#&lashed$$izer#\'patches#!r#$view"$lure"$ring"$sner!\'zpeleta )f&mdash;s"(ndash;86(!h!*\'chrissake"#ing!#-50',
+    '"%actin""ed"$file"$prot"(specimen!$.p.s!"66!#aam"\'bbriche#!c##lon#"ry"&ceting#,hhochschulen##ist',
+    '$"ur#\'t-based$,ion-fighting\'&alised*#zed$#oid%#r-i&$ized$$ural")ecal-oral##nol#$ries"&ghaggs"#hmi$!y',
+    '#%nters#"r\'$\'-headed%\'seeming%\'trading$*cheallaigh%$roft$$isle$$lead$\'y-elves#*th-sharing##yum"%jitas"\'ke-gold##hro',
+    '#&simile"&ldella#+ling-behind$"ot"\'mennian#$ily\'"(n-cooled$&flower$(vaulting#"al##deo#&shaped#\'taisies%&vision"/r&rehy;reaching',
+    '#$aker$#mea#%berow$&rother#"da#$ebee#%flung#"ge%!d%#tte##ika##low&$ella#\'m-built%$land',
+    '$$acia%#ian$\'ing-out#"ra%$gher$%ochil%"ws#!s$#ide"\'sciated%%o-max#*hion-based(%plate($show#"t-',
+    '&(windling%)finishing&(orwarded%#jet%&living%\'reactor%&stream%%taper$*est-moving$\'flowing%%ormat$&igiata"&thalla$(er&mdash&!\'',
+    '#&iguin\'$#mid#"ma",ulknerbrowns$\'t-based&\'logging&\'related#%quier#!r##ske"$vart"&xagent#\'finders"#yal#$iqah',
+    '##lur#"zi!#brs!"cp!)ddi-based"!j!&eagley#(r-ridden$&nyough#+therbedding$)ure-phone"(ccas-utc#%erunt#(undating"%defam',
+    '##net#(orovitch"*e-charging$$farm##ded#!k##man##nix#"rs#(twarmers""hg"&ichter$$kert"%lando$$wnah',
+    '&#oel#&l-side$$ated$$burn$\'ow-scot($taff#\'senmeer"(minising",n&ecirc;tres#!c$%ibles#%dered#*estrellina#\'g-huang$#huo',
+    '##osa##tem"#ola""pa"*r-de-lance#"dy#&edinos$$nczi$!r#%gsuon$%uslie&$sons##ina#"me#&n-leaf',
+    '$!e#$rary%!s%"ta$%efort%%t-god$%inghi#$zana"%scues#%legen#&thalle$+ive-looking"%thard#$immp$\'shising',
+    '#!y"(uchtwang"$zzan!"fi#!s!$gf-2!&huaran!\'iacaill"$bre-&#tip%!d#$well",ction-making\'\'alising",ddle-dee-dee',
+    '##ele##oao$!s#"ra"#egl#\'ld-grey\'"un&$test#$tzau"*fteen-inch(%month((per-cent)$ound$(h-placed"&g-wasp',
+    '##ger##lia%!o#$tree#-ure-sculpture(\'kimming"$lbey#&derman#"e\'$&-based%(handling$\'servers#"ii$(ng-clerk$&pacchi',
+    '$"us#&l-dyke$%ettes$#in\'#"m-%$loop%*processing(\'duction$&ophone#%omena#%trona"#nau#$barr#(chbacked#,dfieldofview',
+    '%%drawn%%paper%)structure$#ish$!l$!m$$ssed&#ing#*ger-drying\'\'licking\'\'painted\'&shaped(%ocket(\'pelling&$fish',
+    '&&picked&&stalls#\'ishings%%terre#+nbogadottir$&cattle##rad#(sthwaite##zis"(ordaliso$%rucci"!p"%rbobs#"e-%-and-brimstone',
+    '%\'control%)insurance%#lit%*resistance+#ing%(surround$%belly$$code$&escape$$hole$)man-uncle$%women$!y#&ing-up#+st&rehy;aid',
+    '&&cousin&%found&%light&(movement&%place&$race&#use&$wave%$ling"&scheri%"li#&h-cake%&finger&#ood&%rying',
+    '$%hooks$)ing-based$%watch#*sion-track#)t-pumping#&unoglu"-tc-phalloidin$#hed#,ness-testing#(zbernard"+ve-category&#ity%&fathom&$ight\'$nger',
+    '%&gallon&#oal%)kilometre%$mark%#nil%$race&#ise&#oom%\'session&\'hilling&$tate\'$ride\'"ud%$tier%)years-old',
+    '\'#ost&&factor\'$ocus&%track#"ot"$zeau##zer!)jallbrant!.l&eacute;malle"%abber\'\'gasting\'!s#$chau$"ks#-g-desecration',
+    '$&ellate\'&iflory$#lor$"yl##mar$"be$(e-effect$%stead##nel$#ner#&pjacks#\'sh-card&$fire&%light$#ked',
+    '$"ty#\'unching#%vipes")ea-market$$pits#*et-of-foot%#rak#*idingerhof$#sch%!s#\'shhound$$trin#%tched#"ug$#ral',
+    '$$lite""id#*ght-weight&$care&%lines#+msy-looking#"nk$(t-walled%&y-clay#"sh"$oate%$less#(cculated*!s$%kplan',
+    '#*od-control&$land##ppo#*ral-design$&idiana%%stics#!s$#sed##tex$"ow#)wcharting$.er-arrangement\'%child\'&garden\'$hung',
+    '##ydd""ra"(ue-brush$#ing#*ff-covered#"or%)opolymers&&uracil""y-$&posted#"co#(ing-fish\'&helmet#%traps!$mbra',
+    '"!n!#nar!,ochiv&eacute##ker#%olare#(us-based"#day#&dering"$erer#$tida""fi"&inland"#jut"%ld-in#&eshill',
+    '#(k-belief%\'culture%%devil%)etymology%$life%\'singing%)tradition$5estone&ndash;boulogne$%weave#(low-spot$%yfoot##ses"!m#$blin".ndaci&oacute;n',
+    '#%stein#\'tinalis$\'revault"&od-aid%*purchasing%(rewarded%&source#$lery$#ina#"rd#(t-pedals&#ump%%salve&%quare%\'traffic',
+    '$$less$+sie-footsie%#ure%(witching"\'r&mdash#$bush$!y#$cast$&ed-air\'$down$#laz#\'dbridge$#ice#)e-fathers%\'stomach',
+    '$\'ign-set(\'trained$$knew$(st-floor&(eresheye%$wore$$wood$!z#$gacs$\'ed-iron%%t-me-$%hieri#"k-#.m&rehy;filling$%-book',
+    ')&overed&$idae#&sinard$$king##ter%#zza$)ies-style$\'une-500$%y-day&*eight-hour&)four-week&%pound#%ward\'\')-planning(\'reverse',
+    '"\'scarini#(silizing"!t##bal#!e$#dar#(hergilla"\'ubister#"ce$"he#\'droyant#.r&mdash;colour$%-bolt&%urner%$cell',
+    '%&handed)$icap%#lap&$evel%%metre%#nil%!o%$plot&$ress%$room\'!w&"un(#ner%\'section\'%ssion',
+    '&$tory%$tier&&owered&$read%)under-par&#ser%&voiced$&stones$)teen-week)-year&rehy;old%&h-hand\'%order\'\'ranking)"te%"ou',
+    '"%xface#$hunt#!x!#pda""hm"$r-lz!,r&eacute;jus#0oacute;tha-frith"%adgem##ger$#ged$!s##ise#(me-based&(grabbing',
+    '&#tta%"he%"io&$scus%\'ophiles$+kfurt-based%$ston$$tzen$"zi#\'tercula$#rum#&uleins""co"(eak-outs%!o',
+    '#(drickson#&e-port%%wheel$\'borough$$dom\'\'$link$\'flowing$%miner$&sheets$\'wheelin)!s$#zed#%idman%#zon$$gang',
+    '$$ston#/mskridtspartiet#$nch-\'&polish\'#run\'(sounding&$park$"ds$#zel#,quency-count**dependence#)sh-minted&#run%%en-up%)ly-killed',
+    '$#tel#$unde##yer"%icsay#)day-night#\'ederike$.ndlier-looking$"sn#$gido#$leux#$mble#$ppak#(s&eacute$!e$!o',
+    '#&thuric$$sche"#oad#&berger#%glets#$lick#%mages$%entin$#mel&!r$#ont#(nt-cover&%panel&*suspension&\'to-back',
+    '&"li%"is#"sh$$tied#%ufrou##wny"*uit-garden&&market%%cakes#!s$%tules#"ty"#yde#&kowski#(stetjorn',
+    '""pi!$uath"&ccillo##k\'n$$arse"\'du-myoo"*el-economy""gu"$isse"%jinon$!o"$kaba"$lder#$embo#%fords',
+    '#%igula#(l-record%)thickness$%blown$#ick$%stops$\'y-armed&\'working#\'minates"\'migatus")n-seeking$$time#!c$,tion-related($lust',
+    '#+gus-farming&#sed#\'k-metal$&ateers#&loving#$ning$&ybones"*r-trapping##fix#$iant#!l#!n$#ham#$rin\'$*ow-drawing',
+    '$"he##zey"\'sileers"%ture\'&+-generation!#ynd"!w"!z *g&aacute;l"5eacute;n&eacute;rales"(icirc;te"*ndash;aecb*"du)#ghb($ebed',
+    '\'*k&ouml;ova".uuml;ll&uuml;k!%-ahcl##tbg")component")formation"$joey"$mate"(taxichip"$wing!%.h.j.!"25!"90!%abbay$$itas',
+    '#&inetto##lik""dp"#ean#$ltec#!t")g-binding#"an#"ik"*iet&eacute##les##nza#"rm#"ty#"um',
+    '$#sso#$ende#$gani$#orm#$iara$$bier$"ot#$jart#$lard%#way$&eytrot$$gate$\'i-curci%#agh&#rda',
+    '%#gan$\'owglass#!o$"of$"sh##ron#*thi&eacute"$mate##bei%"la$$iers$#oge%$ling$$usia#"et',
+    '#,ma-radiation%"gt#"ul"%ndhar#$gsta#$nett$#ing#%sleit"(p-filler#%eworm"\'rageman$!h$#jau#+bage-filled%!n',
+    '$\'en-path%$sana$#ien##eau#&giolli#&meston#&nstone#"on#%reton$#ity$"ya&#rde%%owens#\'thlands$#lan',
+    '"%s-jet$&mantle%$eter$(operated##ken#$nier##ser$%water##ted$$rics%\'onomico*$ques&$scan\'#oft%%ulate',
+    '$%liner#$ling#$tnar"$uber#"ck#!d#%ffred#$stad"+vi&ntilde;o$$scon#$rosh"$wber##ked#!n"(yflowers',
+    '"#zan$!r#$ules!"ba""fh"!g#"sa!"cb!"db!#eak#)rchanging$%shift$%wheel"#bur")c-plessey',
+    '#!o"%daleh#%dling##gey##off"$e-up#!d##ggs##mag##sin#!v"\'imreadh#$ssen$/teswissenschaft"%lande',
+    '##din##ert#)ochelidon"%m-set##ara#,eentekrediet#&iniani##mil#$sbok"+nder-bender+#ing\'*difference\'$free#*e-splicing%(transfer',
+    '\'+ly-accepted&%tione$$vese#$isis$#zah#&ocides#$rikh#"ti%&anella$-leman-scholar$$rify".o-demographics#$chem#$desy#!f',
+    ')-cally-defined#(rdieland$$gics%!s#)synclines"&raldus#&hardus#!i$(atrified#$land#-man-americans\'%czech\'(produced$$line#"na',
+    '#&remoff$"ys#%shony$#ter#"ty")samtkunst&&metall#\'chwader#$enge#%serit#!t$$alts\'#ung$&e-type$%odene',
+    '#\'undheit"+t-well-soon#$afix#&bounds#\'ting-up"$valt##ers"%wisse!"ga!$hada#"in#*naian-born$"em#!t"!e',
+    '#%mawat#)ttogedden&#ize(#ing##zzi"$ibli""or##sal$"hi$)t-bagging&&writer"\'uilbinn!"i\'"&anelli$\'lorenzo',
+    '##ing##let"&ddying"&esecke%$king"%gabit$#nte&"ia"!i"#lat#%banks#!e$$spie$#tte#\'feather',
+    '#$lain#$trap$$spur"%minez##ona"*ngerbreads$"in#"na$"ed#$ther"#ono#%rnate"\'rfriend#%idhar#$leen',
+    '#\'ocheque""sa#\'cardian$$ombe"$tlin"\'ulietta%!i#(stiniani%!o"$v-sp#$arsi$!t#%etian!$kutu!,l&uuml;hwein',
+    '##mmy$$ours#$nnau#(ss-works%"ie%$wort#$ucus"#ees$!t#%iwitz#!m$$mtal#$napp$+columbcille$&gariff',
+    '$#oid$&quoich$$rath$%sanda$$tree$$vale#\'ouraich#!y"\'idevale#&ssaded\'#ing$#ter#)tterfests"%n-250"(obalised',
+    '$"ed$\'igerina$"ol#%oming#"ps#*ry-hunting#(ucerster#&ve-box#\'w-globe%+in-the-dark%$plug$&globes$$plug#!y"+ucosinolate',
+    '%\'sniffer#\'m-faced$!s"(yncorrwg$%leigh!#max!#n\'r"$arls"#oli#)menreigen""pp!1o&ccaron&aacute;r"!-#\'karting"\'afstead',
+    '%\'keeping$#den#\'t-faced%$hair&#erd$#eed$%skins%#ong"$bbed$"la#%ierno"&d-damn$&making#%avari#!d',
+    '$"ss#)fatherism$&earing##own#$sake"&ellner#&rdeler$#ner"$ffin"%garty#(gle-eyes"%horry"&ju-ryu",ld-and-ivory%%braid',
+    '$#eck%%n-age\'&bronze\'%green\'&headed$)fish-bowl("es$%heart$#ich$$leaf$%mines$\'panning$(scheider%$turm$!y',
+    '#\'fbreaks$&course#&inkoff#%ledge$(ingerhof##omb#"tz#%uchow#"wg"\'marsall#"el"#net#\'iometer#$nere"/od&rehy;looking',
+    '%%going$$eids%)xpsrrange$$ings$$sway#$mbay#$nies#*se-feather&$neck%!n%\'pimpled$#ing"#pak#"is"\'r&szlig',
+    '#)bachevism#$doni#(geopekos$#ias$!o#!i#$lice$#ois#%nisht#%ringe##ter#\'yushkin"$shai%#wks#&podars',
+    '%!n##tin$$ling#\'udarstv"$tong#"te%$sman$!o"&uldens$"ty##rde$&evitch$%mande(%isin\'$%stave',
+    '"\'vardhan#%enors$%rnent\'!r&(ment-anc+*in-waiting&%rnent"#war#"en#"ld#"na#"ri"&yemido$$scas"!z',
+    '!+r&uuml;mmer(%nheid"&ab-bag$$horn#\'ce-note#(de-based$&grinds$$ouge$"us#&ecorum#-ffiti-writing$!s#)ham-brown$$pics#+in-boundary',
+    '#$mley$+maticalised%"ys#\'natelli$-d&rehy;father%(-duchess&%niece%(standing$#ita&\'e-built(%faced&#oid$"py#0pheme-to-phoneme#&sbrunn',
+    '$#hof$$mire$\'s-court&&roofed%#ies%!o$$tyan##tch$#iae#"us#+ve-clothing&$yard%!d%*l-bottomed\'&voiced',
+    '$*y-browning#$yman"/ease&rehy;proof&*-monkeying%&y-pole$(t-circle&3great-grandchildren%%rakes$"ve#*cian-style#!e$"n\'%*-and-cream&%based&%heart',
+    '%$core%%gauge%$horn)!s\'*use-effect%\'ish-red%#oak%$park%%ridge&"ow%$sett&"it&%paces%$view#"ff',
+    '%%rians#*iffenhagen$"ge$&pbritn#%naded#!t$$ener$"te##ves#)y-bearded%\'flannel%#lag%&slated%&tinged$%friar',
+    '$$well"&idelin$&locked$#map#$eman##gor##kes#!l#\'mbledon$$mitt$#say%"on#%nzing#(pe-water#)seofulvin',
+    '$%ogono$$sini"4j&oacute;tagj&aacute")o&szlig;e#$-lux#"he#&lierii#$nant#%omers$(ve-pitch&%rider#)ssbancher%$raum#%tting##un\'',
+    '((quipment\'\'hugging\'%share)#eet&$hogs(%ppers&$sels$"p\'%%ement$$sing#$vers##wly#!x"!r"#uak',
+    '#"er#+jovi&cacute##mfy$!p#%ntled#"ss##thu"%zesik#(ybkowski!#s-6##ana""ob!#tp-!.u&eacute;thary"&acaran',
+    '#!n$%idine#&rd-dog%#ame%%rails#$zapo"*dbrandsdal##dle#"ex"&effroy##nin#"ra$#ino$$rier&.lla-controlled',
+    '$&t-lift%%imate"\'i-based#$anan#$bout#%detti%%wires#%lding$*lain-barre%%ebaud$+t-producing##nee#.sborough-based#,tar-building&$ring',
+    '#&eghina##ick#$lied%$vers$!o$$wing#"ma%"rg"%mball$!y"(n-barrel$\'control$%fight&$ring$&runner',
+    '#$belt#&delach#%fleet#\'gawatti$!y#$hild#\'kholing#"ma#\'narsson$#era#&thardt"&oqiang"!p"$rbir#&charan',
+    '$%waras#$jant#$ltia$"yi##ung"%shers$&ometer#"ta%)ve-roussy&!s")t-feeling#!e$!r#,i&eacute;rez#)ter-press',
+    '&!y"#ugu#!s"\'y-alain##bon##ots"%zzini!"we"%iazda"$yndy$!t!(yldendal#"ee"-mnastikschule"%oergy',
+    '"#red#)o-compass$%plane"%trash"$ulay#"to 0h&acirc;mmerling#6uml;m&auml;l&auml;inen\'$ring"+eacute;rens"*ocirc;tels#&uml;ch)(stetters"+uuml;rriyet!&\'extra',
+    '!%-band#$lock"(dropping"!f",registration"&street!".s!"19!(a&ccedil""\'e"#ack"\'bbaniya#$erer%#man#%itans',
+    '&!e#"ur"$cket$#led"#ddy##era##ger#$iths#\'jiloizu#$rill#(ziyannis")emangioma$(opoiesis#\'stingas"\'ferkamp',
+    '##ted"(g-ridden#%edorn##gai%!r$)isburgers##non"%hanit#&nenhof#!o"%idian#"es#$llng#$nges#)r-breadth',
+    '%%grass%#net$$pin\'$)s-breadth%$hine#$zlip"#jdu"$kone##uta"%lahan##ban$&erstam##dyn#&ebarns$!r',
+    '$\'-a-loaf&(lcoholic&"n-\'#gel&*rticulated%\'barrier&#ird&$ound\'!y&%roken&\'uilding%\'chinese&#lad\'%osing&%ousin',
+    '&&olphin&&rugged%\'engaged&%roded%$fell%%glass\'#oom%&headed\'$ight&%iding&#ope\'#use%(imagined%\'killing&$nown',
+    '%%match&&easure&&ocking%)paralysed&&laited%(realised\'&vealed&$hyme&&olling\'$many%\'shouted\'\'uttered&(quatting&$tage("nd',
+    '&#ung%%toise%(volleyed%&washed&$heel&$idth\'$ndow\'$shed$\'brother$&castes$$past$)way-house#&iaetus$"le#(l-porter',
+    '$%idays%$nges$\'marking$%ooing$(ucinates%!x#$onen#$ston#(temprice%$ring#!u"(m-handed#&adryad)!s$!m',
+    '#%erton$%tabad#\'idollah$$lcar%+ton-baillie#"me%$rin\'&\'schmidt#%navoe#$shaw$#ten#$well"$nami#"cy#&d-ball',
+    '%\'copying%%drill%(engraved%$feed)#ing%\'jamming%\'marbled%(on-heart%\'rearing%%shake&&mocked&$tand\'$itch%$wash&&eeding',
+    '%%ridge$&carved%#lap%%rafts$0elskorrespondenz$$fast("ed%#ull$%iness$\'printed$&s-down%&crolls%\'pinning$&writer#"ff',
+    '#%gouts$"ul##ham##kuk#&naniah%!s#$slip##way""pc##oel#"pe$+ily-married$$y(x)#!y"&rambee',
+    '$#tin#%baugh$"on%$urne#)d-skinned&\'wearing%)to-handle(#let%&wiring$\'hitting$#law%!e$$ouin$%point$#row',
+    '$!t%#ack$\'workin\'#(e-lipped$&sfield#$iati$#man##kis#&laxton$#eys#!n$"et$\'oncourt#%oeris#%pagon',
+    '$\'ocrates$.sichord-making$%urhey#$raby$"es$"hy$%iette%"ld$+ogate-based%$well#"tl%(epudlian$#ner$$sock$$wegi',
+    '"%sbeen#&drubal#)elsberger##ids$!m#$land$#uck#!n$!t##set"%t-box$\'sellers#%chers#%talus"0ubenstock-ramati',
+    '#%ksbee#&pstadt##sen#)te-savoie"#vce#"e\'$(-np-v-en$#n\'t$#red#"in$#our##ocs"%wiyes#(k-headed#%lader',
+    '#"th%\'ornbrae"%y-msl$\'strewer#$/msl##day#"el##sel"$zama#$ells##rat!"bc!#cba"\'fc-141b!"dg',
+    '!$eacy#(d-caving%(of-state%%shunt$%group$+line-makers$&phrase$\'scarfed(#ved#%laval$&thwise##mes##nue#!o#$rin\'',
+    '$%nshaw$(t-aching&\'sinking%$sink%)wrenching#)t-beating%(exchange%+inactivated%)resisting%#set%"up%$wave$\'h-grass%)row-based$&shrink',
+    '#)ven-haven\'(storming%!r"#bon#%raism"\'chalutz$\'stetter"$dden"*el-and-toe%$bone#!r$%brugg$!e$#ing"%ffing',
+    '"%gerty##gen#!i"#hir"%iland$%bronn#)matmuseum#%neman"#jab"&lander##een#&frecht#$gaud$$eson#%ibore',
+    '$&ostats%&tropes#$laby$%enica%$rman&$work$"o\'#%mbold$\'etplate$)inthology#&psheet#%sturm##ves#"yg"(m-length',
+    '#&meling#%pseed"%nbane#*drix-style%"yx',
 )
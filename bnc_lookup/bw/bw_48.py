@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_48 = (
+count_48 = 6694
+
+heads_48 = (
     '&aring;land',
-    '&ccaron;rnja',
-    '&commat;datevalue',
-    '&commat;pmt',
-    '&eacute;crevisses',
-    '&eacute;tait',
-    '&lacute;eonie',
-    '&mdash;-relaxation',
-    '&mdash;119',
-    '&mdash;9',
-    '&mdash;about',
-    '&mdash;and&mdash',
-    '&mdash;assuming',
-    '&mdash;comprising',
-    '&mdash;even',
-    '&mdash;firms',
     '&mdash;gases',
-    '&mdash;how',
-    '&mdash;much',
-    '&mdash;state',
-    '&mdash;taking',
-    '&mdash;was&mdash',
-    '&mdash;when',
-    '&ndash;11',
-    '&ndash;12',
-    '&ndash;13',
-    '&ndash;16',
-    '&ndash;and',
-    '&ndash;at',
-    '&ndash;f',
-    '&ndash;here',
-    '&ndash;it',
     '&ndash;m',
-    '&ouml;old',
-    '&ouml;sterlund',
-    '&rehy;and',
-    '&rsqb',
-    '&scaron;imek',
-    '&scaron;tivan',
-    '&verbar;x&verbar',
-    '&yen;1.3',
-    '&yen;14',
-    '&yen;165',
-    '&yen;80',
-    '\'60',
-    '\'90\'s',
-    '\'alfway',
-    '\'arsh',
     '\'ats',
-    '\'aye',
-    '\'cross',
-    '\'earin\'',
-    '\'eathen',
-    '\'elping',
-    '\'empty',
-    '\'ereabouts',
-    '\'gainst',
-    '\'hinch',
-    '\'idin\'',
-    '\'igh',
-    '\'mid',
-    '\'nice',
-    '\'o\'',
-    '\'ollow',
     '\'opes',
-    '\'opin\'',
-    '\'opped',
-    '\'oppit',
-    '\'phones',
-    '\'sand',
-    '\'shut',
-    '\'such',
-    '\'usbands',
-    '-&frac12',
-    '-(6)',
-    '-a-',
-    '-all',
-    '-ane',
-    '-binding',
-    '-bleomycin',
     '-block',
-    '-cher',
-    '-debt',
-    '-dependence',
-    '-driven',
-    '-ene',
-    '-ese',
-    '-form',
-    '-human',
-    '-much',
-    '-ness',
-    '-o',
-    '-old',
-    '-ose',
-    '-problem',
-    '-reading',
     '-round',
-    '-ru',
-    '-starred',
-    '-treated',
-    '-wing',
-    '-worth',
-    '-year',
-    '-yun',
-    '-z',
-    '.010',
-    '0&ndash',
-    '0-4-4t',
-    '0-6-0s',
-    '0-6-2t',
-    '0.1ml-glutamate',
-    '0.6-kb',
     '0.7mm',
-    '0.8mm',
-    '071&ndash;835',
-    '0ba',
-    '1&amp;frac12;oz',
-    '1&ndash;2ft',
-    '1&ndash;2lb',
-    '1,000&ndash;1,500',
-    '1,300mw',
-    '1-ltr',
-    '1-metre',
-    '1-p',
-    '1.9kg',
-    '10&ndash;15cm',
-    '10&ndash;15km',
-    '10-digit',
     '10-page',
-    '10-tonne',
-    '10.66-fold',
-    '100&ndash;9',
-    '100-rupee',
-    '100-years-old',
-    '1000-word',
-    '1000d',
-    '1000mm',
-    '1000mw',
-    '100f',
-    '107-run',
-    '10am&ndash;6pm',
-    '10am-1pm',
-    '10gb',
-    '10pter-p11.2',
     '10pter-q11.2',
-    '11,000rpm',
-    '11-a-side',
-    '11-band',
-    '11-goal',
-    '11-inch',
-    '11-kg',
-    '110-acre',
-    '110-degree',
-    '110-run',
-    '1100s',
-    '112-mile',
-    '112-page',
-    '1190s',
-    '119p',
-    '11am&ndash;5pm',
     '12-bay',
-    '12-goal',
-    '12-match',
-    '12-nation',
-    '12-ounce',
-    '12-player',
-    '12-runner',
-    '12-under',
-    '12-under-par',
-    '120-acre',
-    '120-line',
-    '120f',
-    '125-year',
-    '12ft-square',
-    '12log2&ndash;8',
-    '13-amp',
     '13-nation',
-    '13-volume',
-    '131-member',
-    '134-bp',
-    '138-member',
-    '14-song',
-    '14-stone',
-    '14-storey',
-    '14-week',
-    '14.4p',
-    '140-acre',
-    '140-member',
-    '142-yard',
-    '15&ndash;20cm',
-    '15-storey',
-    '15-under-par',
     '150-',
-    '150-acre',
-    '1564&ndash',
-    '156s',
-    '16-bag',
-    '16-pounder',
-    '16-room',
-    '16-sided',
-    '160-member',
-    '16th-',
-    '17&mdash',
-    '17\'s',
-    '17,000ft',
-    '17.8p',
-    '18&mdash',
-    '18-hold',
     '18-mile',
-    '18.9p',
-    '1890-',
-    '19-acre',
-    '19-month',
-    '19-point',
-    '19-turbo',
-    '190-mile',
-    '1901-',
-    '1914&ndash;25',
-    '1918&ndash;22',
-    '1930&ndash;3',
-    '1935&ndash;7',
-    '1948&ndash;52',
-    '1950&ndash;3',
-    '1960s-built',
     '1960s-style',
-    '1977&ndash;1979',
-    '1977-',
-    '198&mdash',
-    '1980-',
-    '1982-',
-    '1985-',
-    '1988&ndash\'89',
-    '19th-century-style',
-    '1ad',
-    '1ba',
-    '1pm-6pm',
-    '1ps',
-    '1rs',
-    '2&ndash&half',
-    '2&ndash;2&frac12;ft',
     '2&ndash;3cm',
-    '2&ndash;4ft',
-    '2&ndash;6&ndash;4t',
-    '2-6-4t',
-    '2-axis',
-    '2-band',
-    '2-bedroom',
-    '2-level',
-    '2-mile',
-    '2-night',
-    '2-stroke',
-    '2.2-fold',
-    '2.5-year',
-    '2.65m',
-    '2.8e',
-    '20&ndash;25cm',
     '20&ndash;march',
-    '20-date',
-    '20-gun',
-    '20-kilometre',
-    '20-person',
-    '20-seat',
-    '20-seater',
-    '20-volume',
-    '20-week',
-    '200-ton',
-    '200-yard',
-    '2000d',
-    '200mw',
-    '21&ndash;35',
-    '21-stone',
-    '212s',
     '22-day',
-    '22-inch',
-    '22-point',
-    '225-bp',
-    '22in',
-    '23-mile',
-    '23-page',
-    '23-stitch',
-    '24&ndash;hour',
-    '24-bed',
-    '24-exposure',
-    '24-month',
-    '24-piece',
-    '24-pounder',
-    '24-seat',
-    '24-week',
     '2440mm',
-    '25-gauge',
-    '25-goal',
-    '25-person',
-    '25-way',
-    '25.2p',
-    '250-watt',
-    '2500mm',
-    '25year-old',
-    '26s',
-    '27-track',
-    '28&ndash;1',
-    '28-week',
-    '280-page',
-    '29-goal',
-    '29year-old',
     '2ba',
-    '2jp',
-    '3&frac12&ndash;1&frac12',
-    '3&ndash;4,000',
-    '3\'-sugar',
-    '3-based',
-    '3-gram',
-    '3-level',
-    '3-m',
-    '3.05pm',
-    '3.5-year',
-    '3.5kg',
-    '30&ndash;45cm',
-    '30-cwt',
-    '30-footer',
-    '30-goal',
     '30-inch',
-    '30-piece',
-    '30-point',
-    '30-seat',
-    '30-watt',
-    '30-yarder',
-    '300-ton',
-    '3090&ndash;600j',
-    '30hp',
-    '31-man',
-    '31in',
-    '32-county',
-    '32-track',
-    '32-years-old',
-    '33-month',
-    '33-years-old',
     '34-man',
-    '34020-based',
-    '341-member',
-    '3450-mp',
-    '348s',
-    '34secs',
-    '35-mile',
-    '350-mile',
-    '36-fight',
-    '36-piece',
-    '36-track',
-    '360-line',
-    '38-member',
-    '393cm',
-    '3d-design',
-    '3jr',
     '3ra',
-    '4&ndash;6oz',
-    '4-compliant',
-    '4-hour',
-    '4-kg',
-    '4-methylumbelliferone',
-    '4-page',
-    '4.15p',
-    '4.2-litre',
-    '4.3-compliant',
-    '40-',
-    '40-bit',
-    '40-lb',
-    '400-seater',
-    '40in',
-    '41-',
     '41-foot',
-    '41year-old',
-    '45-',
-    '45-day',
-    '45-foot',
-    '450-page',
-    '46-date',
-    '48&ndash;96',
-    '48-user',
-    '486dx-50',
-    '486sx-20',
-    '486sx-33',
-    '48secs',
-    '4pe',
-    '4pp',
-    '4ps',
     '5&ndash;1okm',
-    '5\'-endlabel',
-    '5\'-gg',
-    '5-metre',
-    '5.5-mile',
-    '5.9p',
-    '50&ndash;70kb',
-    '50-acre',
-    '50-hour',
-    '50-man',
-    '50-ms',
-    '500&ndash;600rpm',
-    '500-word',
-    '500-yard',
-    '5000-word',
-    '50s.',
     '51-chromium',
-    '51-year',
-    '5179&ndash;ii',
-    '518-bp',
-    '525-line',
-    '54-inch',
-    '54-page',
-    '55&ndash;1',
-    '55-bed',
-    '55-person',
-    '55-year',
-    '56-',
-    '56-inch',
-    '560-mile',
-    '56no',
-    '58-match',
     '58mm',
-    '58no',
-    '5cs',
-    '5q35-qter',
-    '5s-rrna',
-    '6-a-side',
-    '6-hour',
-    '6-keto-pgf',
-    '6-metre',
-    '6-page',
-    '6-volt',
-    '6.35p',
-    '6.5&ndash;7',
-    '6.6lb',
-    '6.7-litre',
-    '60&ndash;90cm',
     '60&ndash;odd',
-    '60-match',
-    '60-ton',
-    '600-member',
-    '600-plus',
-    '605s',
-    '60in',
-    '62-member',
-    '62-page',
-    '62-year',
-    '633p',
-    '64-',
-    '64-cpu',
-    '64-member',
-    '67-mile',
-    '67-year',
     '68-mile',
-    '68-page',
-    '680-bp',
-    '68020-based',
-    '68f',
-    '69in',
-    '6hq',
-    '6lw',
-    '7&ndash;10pm',
-    '7-aminoactinomycin',
-    '7-foot',
-    '7-night',
-    '7-point',
-    '7.31p',
-    '7.85p',
-    '70-line',
     '70-years-old',
-    '710p',
-    '71s',
-    '72-page',
-    '72-seat',
-    '72-storey',
-    '73-member',
-    '73m',
-    '73s',
-    '75year-old',
-    '767s',
-    '777-3a',
-    '798d',
-    '8-foot',
-    '8-yard',
-    '8.4p',
     '80-foot',
-    '80-litre',
-    '80-metre',
-    '80mw',
-    '81-run',
-    '81-seat',
-    '82-year',
-    '825d',
-    '82f',
-    '88&mdash;not',
-    '88100-based',
-    '88mm',
-    '9-amino',
-    '9-foot',
-    '9-inch',
-    '9-to-5',
     '9-year',
-    '9.30am-4pm',
-    '90-seat',
-    '90-store',
-    '91-\'92',
-    '96-page',
-    '960mp',
-    '999-year',
-    '9th-century',
-    ':',
-    'a&eacute;rien',
-    'a&verbar;b',
-    'a\'r',
-    'a-320s',
-    'a-37',
-    'a-40',
     'a-7',
-    'a-868',
-    'a-b-c',
-    'a-c-d-e',
-    'a-comin\'',
-    'a-dhywar-lur',
-    'a-er',
-    'a-glitter',
-    'a-p-u',
-    'a-pay-gee',
-    'a-sv40',
-    'a-twinkle',
-    'a.o',
-    'a0',
-    'a143',
-    'a355',
     'a440',
-    'a56',
-    'a604',
-    'a_capella',
-    'a_propos',
-    'aaaaaaaaaaahhhhhhhhhh',
-    'aaahed',
-    'aaahh',
-    'aabenraa',
-    'aace',
-    'aach',
-    'aachener',
-    'aaha',
-    'aahed',
-    'aar',
-    'ab&eacute;ch&eacute',
     'ab\'',
-    'ab-',
-    'abaar',
-    'abash',
-    'abbacchio',
-    'abbat',
-    'abbi',
-    'abbing',
-    'abble',
-    'abcdef',
-    'abdabs',
-    'abdelkebir',
-    'abdesellam',
-    'abdo',
-    'abdulrahim',
-    'abdumalik',
     'abends',
-    'abenina',
-    'abercrombies',
-    'abesses',
-    'abets',
-    'abhyankar',
-    'abid',
-    'ablaut',
-    'able&rehy;bodied',
-    'able-bodiedness',
-    'abohalima',
-    'abolhassan',
-    'abon',
-    'abondance',
-    'abortion-related',
-    'above\'',
     'abrotanum',
-    'abrus',
-    'absat',
-    'absit',
-    'absolu',
-    'abstains',
-    'abstractors',
-    'abstruser',
-    'abukar',
-    'abuko',
-    'abusage',
-    'academica',
-    'acanthiza',
-    'acanthocephala',
-    'acanthurus',
-    'acatenango',
     'accessioning',
-    'acci',
-    'accident-proneness',
-    'accidentally\'',
-    'accommodator',
-    'accomodated',
-    'accompts',
-    'accordion-pleated',
-    'accu',
-    'accufilter',
-    'accutrap',
-    'accval',
-    'acda',
-    'ace-in-the-hole',
-    'acehnese',
-    'acetylhydrolase',
     'aceves',
-    'acgh',
-    'achadh',
-    'achaemenian',
-    'achensee',
-    'achey',
-    'achin\'',
-    'achinese',
-    'acht',
-    'achterlonie',
-    'acibs',
-    'acid-pepsin',
-    'acidhouse',
-    'aciego',
-    'acj',
-    'ackroyd\'',
     'ackroyds',
-    'acla',
-    'acmnpv',
-    'acol',
-    'acpcs',
-    'acriflavine',
-    'acromyrmex',
-    'acropora',
-    'act-as-possibility',
-    'actel',
-    'acteon',
-    'action-based',
-    'active-birth',
-    'actor-singer',
-    'actorly',
-    'actron',
     'actuel',
-    'aculeate',
-    'ad\'',
-    'ad(b)',
-    'adab',
-    'adal',
-    'adamantane',
-    'adamishin',
-    'adap',
-    'adare',
-    'adat',
-    'adcm',
-    'addai',
-    'addbits',
-    'adderly',
-    'addisons',
     'addlestrop',
-    'address&mdash;mr',
-    'address-book',
-    'addub',
-    'adducted',
-    'addyman',
-    'adea',
-    'adedy',
-    'adelboden',
-    'adelle',
-    'adelsheiliger',
-    'adeniken',
-    'aderyn',
-    'adieux',
-    'adirondack',
-    'adja',
     'adjuring',
-    'adjustable-height',
-    'adjustables',
-    'adlibbing',
-    'admixing',
-    'admixtures',
-    'adon',
-    'adonnino',
-    'adshel',
-    'adsp-2101',
-    'adult-supported',
-    'adulterant',
-    'advanc',
-    'adventu',
-    'adventure-seeking',
-    'adversus',
     'advt',
-    'adw',
-    'adwatch',
-    'adyebo',
-    'aecoc',
-    'aedile',
-    'aegypius',
-    'aegyptius',
-    'aeolic',
-    'aergo',
-    'aerie',
-    'aerogen',
-    'aeromodelling',
-    'aeronautic',
-    'aeros',
-    'aers',
     'aerts',
-    'aestivate',
-    'aeterna',
-    'aeternam',
-    'aethiops',
-    'aetius',
-    'afairs',
-    'afap',
-    'afassanieff',
-    'affecter',
-    'affekt',
-    'affer',
-    'affo',
-    'afforced',
-    'affreca',
-    'afic',
     'afleodham',
-    'aflex',
-    'aflood',
-    'african-style',
-    'africanised',
-    'africanized',
-    'africanness',
-    'afrolistics',
-    'afshr',
-    'after-market',
-    'after-pannage',
-    'after-treatment',
-    'afterall',
-    'afterwords',
-    'aga&ntilde;a',
-    'agaisnt',
     'agaric',
-    'agcl(s)',
-    'agdere',
-    'age\'',
-    'age-incidence',
-    'age-of-consent',
-    'agences',
-    'ageratum',
-    'aggrandised',
-    'agn',
-    'agnellus',
-    'agni',
-    'agrarians',
-    'agre',
-    'agreement&lsqb;s&rsqb',
-    'agreement-seeker',
     'agri-business',
-    'agricuitural',
-    'aguri',
-    'ah-64',
-    'ahahaha',
-    'ahi-ka',
-    'ahier',
-    'ahims&amacr',
-    'ahorn',
-    'aicc',
-    'aicpa',
-    'aidara',
-    'aides-m&eacute;moire',
-    'aidoc',
-    'aidoo',
-    'aiglet',
     'aih',
-    'aiim',
-    'ailes',
-    'ailish',
-    'aimtrak',
-    'ain\'',
-    'ain-76',
-    'ainsty',
-    'air&ndash;14',
-    'air&ndash;braked',
-    'air-crash',
-    'air-crew',
-    'air-filtration',
-    'air-flight',
-    'air-gunner',
-    'air-hostess',
     'air-pocket',
-    'air-suspension',
-    'air-taxi',
-    'air-tester',
-    'airbourne',
-    'airc',
-    'airlight',
-    'airmailed',
-    'airnote',
-    'airpumps',
-    'airt',
-    'aissf',
-    'aith',
-    'aituc',
-    'ajfan',
-    'ajman',
     'ajs',
-    'ajungilak',
-    'akaky',
-    'akam',
-    'akan',
-    'akarnanian',
-    'akash',
-    'aken',
-    'akenham',
-    'aker',
-    'akeredolu-ale',
-    'akfm-renewal',
-    'akh',
-    'akheloos',
-    'aking',
-    'akm',
     'aksit',
-    'akti',
-    'aku',
-    'akundzadeh',
-    'akwapim',
-    'akyol',
-    'al-dhouri',
-    'al-faqir',
-    'al-fassi',
-    'al-harb',
-    'al-hulwah',
-    'al-jihad',
-    'al-kabir',
-    'al-karaki',
-    'al-mahayni',
-    'al-nidaa',
     'al-ru\'uf',
-    'al-saadoun',
-    'al-salami',
-    'al-saud',
-    'al-shaer',
-    'al-thawrah',
-    'al-watani',
-    'al-yawm',
-    'alabastine',
-    'alacio',
-    'alanya',
-    'alarums',
-    'alary',
-    'alasia',
-    'alauna',
-    'alawsat',
     'alb&uacute;jar',
-    'albanian-speaking',
-    'albas',
-    'alberney',
-    'albero',
-    'alberobello',
-    'albertosi',
-    'albertus',
-    'albicilla',
-    'albiger',
-    'albridge',
-    'albs',
-    'albus',
-    'alcaligenes',
-    'alcee',
-    'alchin',
     'alcidae',
-    'alcm',
-    'alcohol-dependent',
-    'alcool',
-    'aldine',
-    'aldini',
-    'aldyss',
-    'alecko',
-    'alein',
-    'alemanni',
-    'alemans',
-    'alesia',
-    'alessandri',
-    'aleuad',
-    'aleus',
-    'alexopoulos',
     'alfa-laval',
-    'alfas',
-    'alfonsine',
-    'alga-lichen-moss',
-    'algate',
-    'algerien',
-    'alib',
-    'alidoro',
-    'alismaceae',
-    'aliwal',
-    'alkali-silica',
-    'alkalinising',
-    'alkanals',
-    'alken',
-    'alkon',
-    'all&mdash',
     'all&rehy;embracing',
-    'all-change',
-    'all-colour',
-    'all-concrete',
-    'all-controlling',
-    'all-disc',
-    'all-dominating',
-    'all-enclosing',
-    'all-mahogany',
-    'all-news',
-    'all-nigerian',
-    'all-prevailing',
-    'all-pullman',
-    'all-run',
-    'all-seam',
-    'all-swessex',
     'all-the-year-round',
-    'all-timber',
-    'allaf',
-    'allamanda',
-    'allams',
-    'allanfauld',
-    'allcard',
-    'allegorising',
-    'allegrini',
-    'allegros',
-    'allenia',
-    'allerford',
-    'allestree',
-    'allodynia',
-    'allsport',
-    'allt-chaorain',
     'alltel',
-    'almanach',
-    'almazjuvelir',
-    'almer&iacute;a',
-    'almira',
-    'almonte',
-    'almox',
-    'almquist',
-    'almsot',
-    'aln',
-    'aloa',
-    'aloneftis',
-    'alonzo',
-    'aloxite',
-    'alpaslan',
-    'alpe-adria',
     'alphonsus',
-    'alrady',
-    'alreay',
-    'alsatia',
-    'altaf',
-    'altamirano',
-    'altar-boy',
-    'altared',
-    'altecean',
-    'altertext',
-    'altham',
-    'althorpe',
-    'althusserianism',
-    'althydubandalag',
-    'altin',
-    'altis',
     'altissimo',
-    'altithermal',
-    'altofts',
-    'altweg',
-    'aluco',
-    'aluim',
-    'am-am',
-    'amam',
-    'amanaty',
-    'amandus',
-    'amang',
-    'amari',
-    'amarin',
-    'amates',
-    'amateur-built',
-    'amatol',
     'amazon-slaying',
-    'amazonica',
-    'ambion',
-    'ambitron',
-    'amboyna',
-    'ambron',
-    'ambrosden',
-    'ambrosiana',
-    'ambry',
-    'ambulating',
-    'amcit',
-    'amedian',
-    'amedo',
-    'ameno',
-    'amer-indie',
-    'americains',
     'american-',
-    'american-iraqi',
-    'american-type',
-    'americanist',
-    'americium',
-    'amerigo',
-    'amfar',
-    'amfm-3fm',
-    'amic',
-    'amicis',
-    'amick',
-    'amicon',
-    'amidines',
-    'aminah',
-    'amino-',
-    'aminoacyl-stem',
     'aminopterin',
-    'amiti&eacute',
-    'amk',
-    'amn',
-    'amnesics',
-    'amnestying',
-    'amodiaquine',
-    'amorosi',
-    'amos\'n',
-    'amother',
-    'amoureulx',
-    'ampair',
-    'amphiophiura',
-    'amphiurid',
-    'ampico',
-    'ampro',
     'amric',
-    'amrullah',
-    'amser',
-    'amstelkring',
-    'amstral',
-    'amul',
-    'amulree',
-    'amulya',
-    'amunotransferase',
-    'amx',
-    'amylum',
-    'amzallag',
-    'an-najjab',
-    'anafilaroides',
-    'anaglyptas',
-    'anakreon',
     'analar',
-    'analogized',
-    'analytics',
-    'anambra',
-    'ananeosis',
-    'anaphes',
-    'anaplasma',
-    'anarcho-syndicalism',
-    'anarkali',
-    'anastase',
-    'anastasi',
-    'ancas',
-    'ancell',
-    'anchisaurs',
-    'anchor-leg',
-    'ancyent',
     'andebraham',
-    'andegari',
-    'andegavorum',
-    'andel',
-    'andeme',
-    'andersonian',
-    'andf-style',
-    'andhun',
-    'andiamo',
-    'andle',
-    'andp',
-    'andricite',
-    'androsch',
-    'andry',
-    'anencephalic',
-    'anf',
     'ang&eacute;lique',
-    'angel-dust',
-    'angelic-looking',
-    'angelicus',
-    'angelino',
-    'angeliques',
-    'angeln',
-    'angelsey',
-    'angera',
-    'angewandte',
-    'anglica',
-    'anglo-african',
-    'anglo-continental',
-    'anglo-european',
-    'anglo-prussian',
-    'anglophobe',
     'angoisse',
-    'angst-filled',
-    'angstrom',
-    'aniel',
-    'aniff',
-    'anim',
-    'animal-borne',
-    'animal-skin',
-    'animaux',
-    'animi',
-    'ankaa',
-    'ankhsenpaamun',
-    'ankle-tap',
-    'anklebiters',
-    'womblings',
-    'womdale',
     'womeh',
-    'women&mdash',
-    'women&mdash;defiance',
-    'women&rehy;folk',
-    'women\'s-lib',
-    'women\'s-magazine-type',
-    'women\'s-relationship',
-    'women\'s-room',
-    'women\'s/lesbian',
-    'women-14',
-    'women-centred',
-    'women-controlling',
-    'women-dominated',
-    'women-feel',
-    'women-fun',
-    'women-identified',
     'women-in-nylon',
-    'women-led',
-    'women-of',
-    'women-plus-property',
-    'women-power',
-    'women-respecting',
-    'women-run',
-    'women-sisters',
-    'women.3',
-    'women.l8',
-    'women.the',
-    'women/gender',
-    'women/girls',
-    'women/home',
-    'women/ran',
-    'women/some',
     'women/wider',
-    'women/wife/mother',
-    'womenaid',
-    'womenist',
-    'womentalk',
-    'womenws28',
-    'womenws38',
-    'womman',
-    'wommerstone',
-    'womna',
-    'womp',
-    'wompence',
-    'womyn',
-    'won\'t-be-shrugged-off',
-    'won\'t-they',
-    'won-lost',
     'won-o',
-    'won-ton',
-    'wonam',
-    'wondayen',
-    'wonder-golfers',
-    'wonder-rabbis',
-    'wonder-struck',
-    'wonder-worker',
-    'wonder-workers',
-    'wonderbar',
-    'wonderboom',
-    'wonderboot',
-    'wonderbox',
-    'wonderdrug',
-    'wondered-',
-    'wonderer',
     'wonderered',
-    'wonderers',
-    'wonderfuel',
-    'wonderful/terrible',
-    'wonderfully-detailed',
-    'wonderfully-named',
-    'wonderfully-packaged',
-    'wondergirl',
-    'wondergraduate',
-    'wonderingly.',
-    'wonderland.',
-    'wonderley',
-    'wonderling',
-    'wonderloaf',
-    'wonderman',
-    'wondermodel',
     'wonderplane',
-    'wondersome',
-    'wondersplash',
-    'wonderweed',
-    'wonderworld',
-    'wondjina',
-    'wondre',
-    'wondrful',
-    'wondros',
-    'wondrously-named',
-    'wondrousness',
-    'wondyfu',
-    'wonem',
-    'wonersh',
-    'wonfor',
-    'wong-staal',
     'wong/wiltshire',
-    'wongtun',
-    'wonk',
-    'wonkey',
-    'wonkily',
-    'wonky-gobbed',
-    'wonm',
-    'wonna',
-    'wonnacott',
-    'wonos',
-    'wonse',
-    'wonson',
-    'wonter',
-    'wonwaldremere',
-    'woo38',
-    'woo39',
     'wooaah',
-    'wooahh',
-    'wood&rehy;carving',
-    'wood&rehy;lands',
-    'wood&rehy;panelled',
-    'wood&rehy;wose',
-    'wood\'',
-    'wood\'un',
-    'wood-aged',
-    'wood-and-fabric',
-    'wood-and-foam',
-    'wood-and-thatch',
-    'wood-anemone',
-    'wood-anemones',
-    'wood-axe',
-    'wood-bark',
     'wood-bending',
-    'wood-bugs',
-    'wood-burned',
-    'wood-carvings',
-    'wood-chip',
-    'wood-chips',
-    'wood-clad',
-    'wood-cutter',
-    'wood-edges',
-    'wood-encased',
-    'wood-faced',
-    'wood-fibre',
-    'wood-filler',
-    'wood-fire',
-    'wood-fired',
-    'wood-flesh',
     'wood-flour',
-    'wood-frame',
-    'wood-framed',
-    'wood-free',
-    'wood-jagged',
-    'wood-land',
-    'wood-like',
-    'wood-locked',
-    'wood-machining',
-    'wood-notes',
-    'wood-nymphs',
-    'wood-or',
-    'wood-pastures',
-    'wood-path',
-    'wood-plank',
-    'wood-plastic',
     'wood-polystyrene-wood',
-    'wood-powder',
-    'wood-products',
-    'wood-rangers',
-    'wood-rich',
-    'wood-ride',
-    'wood-smiths',
-    'wood-smoked',
-    'wood-spirit',
-    'wood-spirits',
-    'wood-sprite',
-    'wood-stained',
-    'wood-staining',
-    'wood-stealers',
-    'wood-storage',
-    'wood-stoves',
     'wood-surrounded',
-    'wood-to-liquid',
-    'wood-to-wood',
-    'wood-trimmed',
-    'wood-turner',
-    'wood-warbler-like',
-    'wood-wind',
-    'wood-winters',
-    'wood-wool',
-    'wood-worm',
-    'wood-wormed',
-    'wood-wormers',
-    'wood-yard',
-    'wood.and',
-    'wood.they',
-    'wood/bruce',
     'wood/glosters',
-    'wood/gloucestershire',
-    'wood/historian',
-    'wood/pilot',
-    'wood/plaster',
-    'wood/police',
-    'wood/principal/st',
-    'wood/royal',
-    'wood/student',
-    'wood/tornado',
-    'woodbanks',
-    'woodbarf',
-    'woodbased',
-    'woodbine-stained',
-    'woodbone',
-    'woodbones',
     'woodbonn',
-    'woodbound',
-    'woodbrain',
-    'woodbrooke',
-    'woodbum',
-    'woodbune',
-    'woodburn-bamberger',
-    'woodburne',
-    'woodburytype',
-    'woodcarvin\'',
-    'woodcase',
-    'woodchester-built',
-    'woodchester.',
-    'woodchipping',
-    'woodchopper-like',
-    'woodchoppers',
     'woodcliffe',
-    'woodcock/neighbour',
-    'woodcone',
-    'woodcote/oxfordshire',
-    'woodcourt',
-    'woodd',
-    'wooddidden',
-    'woode',
-    'wooded-in',
-    'wooded-wigged',
-    'wooden&rehy;hulled',
-    'wooden-backed',
-    'wooden-beamed',
-    'wooden-bedded',
-    'wooden-blocked',
-    'wooden-clad',
     'wooden-frame',
-    'wooden-headed',
-    'wooden-leg',
-    'wooden-legged',
-    'wooden-looking',
-    'wooden-panelled',
-    'wooden-shafted',
-    'wooden-sided',
-    'wooden-slat',
-    'wooden-slatted',
-    'wooden-soled',
-    'wooden-tongued',
-    'wooden-topped',
-    'wooden-walled',
-    'wooden-walls',
-    'wooden-wheeled',
     'woodenness',
-    'woodens',
-    'wooder',
-    'woodeson',
-    'woodey',
-    'woodfin',
-    'woodfin/cars',
-    'woodfinishing',
-    'woodflour',
-    'woodford/anti',
-    'woodford/cpre',
-    'woodford/lancashire',
-    'woodframe',
-    'woodframed',
-    'woodfull.',
-    'woodgate/headway',
     'woodgate/simon',
-    'woodgates',
-    'woodglue',
-    'woodgrange',
-    'woodgreen',
-    'woodgrove',
-    'woodgust',
-    'woodham/milton',
-    'woodhaunter',
-    'woodhay',
-    'woodhead-faulkner',
-    'woodhen',
-    'woodhey',
-    'woodhorn',
-    'woodhorse',
-    'woodhouse-retford',
     'woodi',
-    'woodings/aa',
-    'woodjew',
-    'woodland-forest',
-    'woodland-style',
-    'woodland/forest',
-    'woodlanded',
-    'woodler',
-    'woodless',
-    'woodlice-breeding',
-    'woodlock',
-    'woodlots',
-    'woodmanston',
-    'woodmaster',
-    'woodmills',
-    'woodnesborough',
     'woodness',
-    'woodnesse',
-    'woodnewton',
-    'woodnook',
-    'woodpecker-like',
-    'woodperry',
-    'woodpigeon-like',
-    'woodpiles',
-    'woodredon',
-    'woodrouffe',
-    'woods-inspired',
-    'woods/aeromedical',
-    'woods/brewer',
-    'woods/fellow',
-    'woods/gardens',
-    'woods/owner',
     'woodscrew',
-    'woodseats',
-    'woodseaves',
-    'woodsett',
-    'woodsford',
-    'woodshots',
-    'woodsia',
-    'woodsmoor',
-    'woodstock-based',
-    'woodstockesque',
-    'woodston',
-    'woodstork',
-    'woodstoves',
-    'woodstow',
-    'woodstrete',
-    'woodstrip',
     'woodtech',
-    'woodton',
-    'woodtones',
-    'woodwar',
-    'woodward/assessor',
-    'woodward/clic',
-    'woodward/investor',
-    'woodward/raf',
-    'woodwardian',
-    'woodwiss',
-    'woodwood/driver',
-    'woodwork.',
-    'woodworm-infested',
-    'woodworm-killing',
-    'woodworm/damp',
-    'woodwoses',
     'woody(cheers)',
-    'woody-scented',
-    'woody-style',
-    'woodyatt',
-    'woodycock',
-    'woodyd',
-    'woof-woof-woof',
-    'woofferton',
-    'wooftahs',
-    'woofter',
-    'woofy',
-    'woogh',
-    'woogie',
-    'woogs',
-    'woogy',
-    'wooks',
     'wool-based',
-    'wool-broker',
-    'wool-brokers',
-    'wool-carding',
-    'wool-churches',
-    'wool-clad',
-    'wool-cloth',
-    'wool-combing',
-    'wool-combs',
-    'wool-dealer',
-    'wool-draper',
-    'wool-gatheringly',
-    'wool-merchant',
-    'wool-mix',
-    'wool-mohair',
-    'wool-packers',
     'wool-ranchers',
-    'wool-shed',
-    'wool-spinning',
-    'wool-trade',
-    'wool-workers',
-    'wool.9',
-    'wool/20',
-    'wool/angora',
-    'wool/cashmere',
-    'wool/chenille',
-    'woolams',
-    'woolard',
-    'woolbearing',
-    'woolbright',
-    'woolbroker',
-    'woolcock/paradise',
     'woolcocks',
-    'woolcomber',
-    'woolcombing',
-    'woolcord',
-    'woolden',
-    'wooldredge',
-    'wooled',
-    'woolen-draper',
-    'woolengers',
-    'woolf/boxing',
-    'woolfendon',
-    'woolgrove/farmer',
-    'woolgrowers',
-    'woolham',
-    'woolier',
-    'wooll',
     'woollacott',
-    'woollam',
-    'woollard',
-    'woollaston',
-    'woollcomber',
-    'woollen-cloth',
-    'woollen-robed',
-    'woollendraper',
-    'woollenmills',
-    'woollerton',
-    'woolliams',
-    'woollie',
-    'woolly-capped',
-    'woolly-hatted',
-    'woolly-jumpered',
-    'woolly-sounding',
     'woollybacks',
-    'woolman',
-    'woolman/director/libra',
-    'woolmans',
-    'woolmen',
-    'woolnough',
-    'wooloongabba',
-    'woolos',
-    'woolovers',
-    'woolpacks',
-    'woolquay',
-    'woolridge/west',
-    'woolsden',
-    'woolsey-brown',
-    'woolstable',
-    'woolstaplers',
     'woolstaton',
-    'woolsthorpe',
-    'woolstone',
-    'wooltons',
-    'woolvet',
-    'woolwark',
-    'woolwell',
-    'woolworth-to-comet',
-    'woolworth-type',
-    'woolworths-to-b&amp;q',
-    'woomargama',
-    'woomp',
-    'woonerf-\'like',
-    'woonerf-like',
-    'woonky',
-    'woood',
     'wooooh',
-    'wooooo-oooohhh',
-    'woooooh',
-    'wooooooooooooooo',
-    'wooosh',
-    'woorerf',
-    'woorkeri',
-    'woorkinge',
-    'woory',
-    'wooshing',
-    'woosnams',
-    'wooster-like-oddity',
-    'woosterish',
-    'woosters',
-    'woosung',
-    'woosup',
     'wooten',
-    'wooton-under-edge',
-    'wootons',
-    'wootton-under-edge',
-    'wootton/nr',
-    'wootton/oxfordshire',
-    'wooty',
-    'wooziness',
-    'woozle-cat',
-    'wop-airs',
-    'wop-bama-lammed',
-    'wopuld',
-    'wor&rehy;thy',
-    'wor\'',
-    'worbali\'n',
-    'worcester/hereford/shropshire',
     'worcesterhsire',
-    'worcestershhire',
-    'worcestershire.the',
-    'word&mdash;we',
-    'word\'\'',
-    'word-1391',
-    'word-1485',
-    'word-against-word',
-    'word-barrier',
-    'word-based',
-    'word-bite',
-    'word-boards',
-    'word-books',
-    'word-breaking',
-    'word-breaks',
-    'word-by',
     'word-candidates',
-    'word-carrying',
-    'word-centred',
-    'word-clotted',
-    'word-covered',
-    'word-crunching',
-    'word-drama',
-    'word-ever',
-    'word-for&rehy;word',
-    'word-form-in-context',
-    'word-forms',
-    'word-frequency',
-    'word-game',
-    'word-grammar',
-    'word-identity',
-    'word-in-your-ear',
     'word-internal',
-    'word-internally',
-    'word-jellied',
-    'word-judgement',
-    'word-lengths',
-    'word-lures',
-    'word-machines',
-    'word-makers',
-    'word-man',
-    'word-merchant',
-    'word-methinks',
-    'word-mungus',
-    'word-music',
-    'word-or-phrase-type',
-    'word-parsing',
-    'word-per-sentence',
     'word-processiong',
-    'word-reading',
-    'word-referent',
-    'word-relation-word',
-    'word-repetition',
-    'word-seam',
-    'word-sense',
-    'word-sentences',
-    'word-specific',
-    'word-spellings',
-    'word-spinning',
-    'word-star',
-    'word-structure',
-    'word-tags',
-    'word-to-picture',
-    'word-tumbling',
     'word-use',
-    'word-which',
-    'word-word',
-    'word.com',
-    'word/image',
-    'word/phrase',
-    'word1',
-    'word2',
-    'word5',
-    'word=list',
-    'wordcard',
-    'wordclasses',
-    'wordes',
-    'wordface',
-    'wordfinder',
-    'wordfinders',
     'wordgame',
-    'wordier',
-    'wordist',
-    'wordlessness',
-    'wordmarc',
-    'wordper',
-    'wordperf',
-    'wordperfectly',
-    'wordproc',
-    'wordrobe',
-    'words&dollar',
-    'words-as-strangers',
-    'words-is',
-    'words-like',
-    'words-on-the&rehy;page',
-    'words-on-the-page',
     'words-small',
-    'words-to',
-    'words/phrases',
-    'words/roles',
-    'words/second',
-    'words/signs',
-    'words:class',
-    'words=evalfield',
-    'wordsafe',
-    'wordshence',
-    'wordsnakes',
-    'wordstar/zsoft',
-    'wordstars',
-    'wordswirls',
-    'wordsworthshire',
-    'wordtags',
     'wordtech',
-    'wordwise+',
-    'wordwlse',
-    'wordworth',
-    'wordworths',
-    'wordwrapping',
-    'wordwriter',
-    'worgans',
-    'worgh',
-    'worgl',
-    'worimi',
-    'work&mdash;it',
-    'work&mdash;the',
-    'work&ndash;g',
-    'work&ndash;place',
-    'work&rehy;bench',
     'work&rehy;experience',
-    'work&rehy;hours',
-    'work&rehy;houses',
-    'work(place)',
-    'work(s)',
-    'work-alike',
-    'work-and',
-    'work-around',
-    'work-assignments',
-    'work-authorisation',
-    'work-battered',
-    'work-bent',
-    'work-books',
-    'work-box',
-    'work-break',
-    'work-camp',
     'work-clothes',
-    'work-coat',
-    'work-conditions',
-    'work-connected',
-    'work-counter',
-    'work-day',
-    'work-discipline',
-    'work-effort',
-    'work-entered',
-    'work-experiences',
-    'work-face',
-    'work-filled',
-    'work-fit',
-    'work-folk',
-    'work-free',
-    'work-from-both-sides',
     'work-hard',
-    'work-hardened',
-    'work-in-process',
-    'work-jacket',
-    'work-leave',
-    'work-leisure',
-    'work-level',
-    'work-loving',
-    'work-mate',
-    'work-net',
-    'work-obsessed',
-    'work-over',
-    'work-pace',
-    'work-paced',
-    'work-pacing',
-    'work-performance',
     'work-potential',
-    'work-practice',
-    'work-processing',
-    'work-psychology',
-    'work-relationship',
-    'work-rider-cum-jockey',
-    'work-rounds',
-    'work-rule',
-    'work-satisfied',
-    'work-saving',
-    'work-shadowing',
-    'work-sharing',
-    'work-sheet-auditing',
-    'work-shift',
-    'work-situation',
-    'work-situations',
     'work-specific',
-    'work-stained',
-    'work-swollen',
-    'work-teams',
-    'work-testing',
-    'work-that',
-    'work-through',
-    'work-time',
-    'work-to-',
-    'work-to-contract',
-    'work-to-rules',
-    'work-tops',
-    'work-watchers',
-    'work-wear',
-    'work-weary',
-    'work-weathered',
     'work-welfare',
-    'work-women',
-    'work-world',
-    'work.',
-    'work.48',
-    'work.6',
-    'work.i',
-    'work.ian',
-    'work.ps',
-    'work/',
-    'work/career',
-    'work/cl.',
-    'work/economic',
-    'work/educational',
-    'work/employment',
-    'work/exercise',
     'work/family',
-    'work/geriatric',
-    'work/gp',
-    'work/have',
-    'work/join',
-    'work/mental',
-    'work/occupation',
-    'work/rate',
-    'work/retirement',
-    'work/routine',
-    'work/services',
-    'work/talents/skills/',
-    'work_',
-    'work_as',
-    'work_in',
-    'work_together',
     'workarounds',
-    'workbays',
-    'workboats',
-    'workbound',
-    'workcamps',
-    'workcard',
-    'workclothes',
-    'workdesk',
-    'worked\'',
-    'worked-not',
-    'worked-on',
-    'worked-through',
-    'worked-up',
-    'workeers',
-    'worker\'',
-    'worker(s)',
     'worker-consciousness',
-    'worker-consultation',
-    'worker-convicts',
-    'worker-farmer',
-    'worker-intelligentsia',
-    'worker-managed',
-    'worker-owned',
-    'worker-ownership',
-    'worker-parkers',
-    'worker-priest',
-    'worker-priests',
-    'worker-revolutionaries',
-    'worker-selection',
-    'worker/case',
-    'worker/client',
-    'worker/fellow',
     'worker/iraq',
-    'worker/management',
-    'worker/morning',
-    'worker/national',
-    'worker/officer',
-    'worker/waiters/waitresses',
-    'workerism',
-    'workerparticipation',
-    'workers\'-compensation',
-    'workers\'interests',
-    'workers-provide',
-    'workers-they',
-    'workers-total',
-    'workers.32',
-    'workers/managers',
-    'workers/prison',
     'workers/public',
-    'workers_for',
-    'workf',
-    'workfile',
-    'workfolk',
-    'workgirl',
-    'workhous',
-    'worki',
-    'workind',
-    'working&mdash;class',
-    'working&mdash;which',
-    'working&rehy;language',
-    'working&rehy;through',
-    'working\'',
-    'working-alms-house',
-    'working-class.',
     'working-class/middle-class',
-    'working-class/proletarian',
-    'working-day',
-    'working-day/mortgage',
-    'working-from-home',
-    'working-girls',
-    'working-group',
-    'working-holiday',
-    'working-hours',
-    'working-in-area',
-    'working-late-at-the-office',
-    'working-level-months',
-    'working-life',
-    'working-over',
-    'working-poor',
-    'working-progress',
     'working-scale',
-    'working-surfaces',
-    'working-with-hands',
-    'working.both',
-    'working/coaching',
-    'working/discussion',
-    'working/hyperactive',
-    'working/teaching',
-    'working_',
-    'workings.',
-    'workingtools',
-    'workitus',
-    'worklights',
-    'workload\'',
-    'workload/demand',
-    'workman\'',
     'workman-',
-    'workman/liberal',
-    'workman/university',
-    'workment',
-    'workover',
-    'workpack',
-    'workpacks',
-    'workpapers',
-    'workparty',
-    'workplace-level',
-    'workpro',
-    'workprocess',
-    'workprogramme',
-    'works\'.',
-    'works-car',
-    'works-led',
     'works-manager',
-    'works.richard',
-    'works/',
-    'works_in',
-    'worksa',
-    'worksearch',
-    'workselection',
-    'workshop-club',
-    'workshop-gallery',
-    'workshop-museum',
-    'workshop-style',
-    'workshop-type',
-    'workshop/information',
-    'workshop/retail',
-    'workshops.',
-    'workshyness',
     'worksongs',
-    'workspace&dollar;disk',
-    'workspace.',
-    'workstation-on-a-chip',
-    'workstation-style',
-    'workstation/server',
-    'workstations:academics',
-    'workstyle',
-    'workstyles',
-    'worksworth',
-    'worksystem',
-    'worktable',
-    'worktopper',
-    'worktwice',
-    'workup',
-    'workwear-as-fashion',
     'workwear/style',
-    'workwoman',
-    'workzone',
-    'worlaby',
-    'worland',
-    'world&mdash',
-    'world&mdash;designed',
-    'world&mdash;hungary',
-    'world&mdash;the',
-    'world&rehy;embracing',
-    'world&rehy;record-holding',
-    'world&rehy;wide',
-    'world(s)',
-    'world-affirming',
-    'world-as-we-perceive-it',
-    'world-band',
     'world-beaters',
-    'world-burial',
-    'world-cancelling',
-    'world-changers',
-    'world-changes',
-    'world-climate',
-    'world-conquering',
-    'world-convulsion',
-    'world-creation',
-    'world-dazzling',
-    'world-death',
-    'world-debt',
-    'world-deep',
-    'world-defying',
-    'world-designers',
-    'world-destroying',
     'world-destruction',
-    'world-direction',
-    'world-dominant',
-    'world-dominating',
-    'world-duma',
-    'world-echo',
-    'world-egg',
-    'world-encompassing',
-    'world-faiths',
-    'world-famed',
-    'world-figure',
-    'world-from&rehy;within',
-    'world-girdling',
-    'world-history',
-    'world-in-the-making',
-    'world-including',
     'world-its',
-    'world-knowledge',
-    'world-known',
-    'world-lead',
-    'world-line',
-    'world-night',
-    'world-of',
-    'world-old',
-    'world-organisational',
-    'world-patented',
-    'world-pictures',
-    'world-premi&egrave;re',
-    'world-rated',
-    'world-respected',
-    'world-rule',
-    'world-scene',
     'world-seasoned',
-    'world-seen-from-just-underneath',
-    'world-series',
-    'world-shakers',
-    'world-shifting',
-    'world-size',
-    'world-slayer',
-    'world-society',
-    'world-spider',
-    'world-stage',
-    'world-stoppers',
-    'world-study',
-    'world-style',
-    'world-supply',
-    'world-systems',
-    'world-third',
     'world-threatening',
-    'world-travelled',
-    'world-vision',
-    'world-war',
-    'world-war-i',
-    'world-war-one',
-    'world-welfare-enhancing',
-    'world-wide-web',
-    'world-wise',
-    'world-wondering',
-    'world.dat',
-    'world.from',
-    'world.it',
-    'world.tim',
-    'world/european',
-    'world/magazine',
     'world/poets',
-    'world2',
-    'world:read',
-    'world:read+execute',
-    'worldbut',
-    'worldclass',
-    'worldcomm',
-    'worlded',
-    'worldexpo',
-    'worldhams',
-    'worldism',
-    'worldli',
-    'worldlier',
-    'worldly-divine',
-    'worldlywise',
-    'worldrenowned',
     'worlds-apart',
-    'worlds.',
-    'worldscan',
-    'worldscape',
-    'worldsieger',
-    'worldspan',
-    'worldtoolkit',
-    'worldweariness',
-    'worldy-wise',
-    'worle',
-    'worleys',
-    'worlidge',
-    'worlingham',
-    'worlington',
-    'worlock/surgeon',
-    'worlwide',
     'worm\'s-eye',
-    'worm-and-sector',
-    'worm-dirt',
-    'worm-gears',
-    'worm-haunted',
-    'worm-hole',
-    'worm-holes',
-    'worm-hunt',
-    'worm-killing',
-    'worm-out',
-    'worm-poor',
-    'worm-runners',
-    'worm-screw',
-    'worm-seeds',
-    'worm-shaped',
-    'worm-sort',
     'worm-wheel',
-    'worman',
-    'wormcasts',
-    'wormeaten',
-    'wormell/video',
-    'wormelow',
-    'wormer',
-    'wormholes',
-    'worminghall/oxfordshire',
-    'wormington',
-    'wormkiller',
-    'wormleighton',
-    'wormscrews',
-    'wormski',
-    'wormwald',
-    'wormwood-flavoured',
     'worn-lipped',
-    'worne',
-    'wornersley',
-    'wornt',
-    'wornum',
-    'woronoff',
-    'worontschak',
-    'woropay',
-    'worpington',
-    'worplesden',
-    'worpswede',
-    'worra',
-    'worrall-thompson',
-    'worre',
-    'worri',
-    'worried/nervous/anxious',
     'worringham',
-    'worringly',
-    'worris',
-    'worrld',
-    'worrries',
-    'worry\'',
-    'worry-free',
-    'worry-gut',
-    'worry-sweat',
-    'worry-time',
-    'worryless',
-    'worrywart',
-    'wors',
-    'worsaae',
-    'worsbrough',
-    'worsdall',
     'worsdall/anti-counterfeiting',
-    'worse-case',
-    'worse-for-wear',
-    'worse:rspca',
-    'worse_now',
-    'worsel',
-    'worsell',
-    'worsencroft',
-    'worsfield',
-    'worsfold',
-    'worship-rites',
-    'worshipfulls',
-    'worshipfulness',
-    'worshiping',
-    'worsley-taylor',
-    'worsnip',
     'worssse',
-    'worst\'',
-    'worst-behaved',
-    'worst-equipped',
-    'worst-exploited',
-    'worst-judged',
-    'worst-managed',
-    'worst-offending',
-    'worstead',
-    'worstedopolis',
-    'worster',
-    'worston',
-    'worsts',
-    'worte',
-    'worth-it',
-    'worth-the-effort',
     'worth/squadron',
-    'worth_out',
-    'wortha',
-    'worthe',
-    'worthenbury',
-    'worthersee',
-    'worthi',
-    'worthie',
-    'worthies-in',
-    'worthily-titled',
-    'worthing/brighton',
-    'worthington+',
-    'worthington-evans',
-    'worthlessness-to',
-    'worthley',
-    'worthwile',
     'worthy\'',
-    'wortks',
-    'wortleberries',
-    'wortly',
-    'woseq',
-    'wosik',
-    'wosk',
-    'wossisnmame',
-    'wossit',
-    'wossname',
-    'wostenholme',
-    'wot-nots',
-    'wot-wot',
-    'wota',
-    'wotchered',
-    'wotchermercallit',
     'woth',
-    'wothout',
-    'wothurst',
-    'wots',
-    'wots-up',
-    'wott-urr',
-    'wotta',
-    'wotterton',
-    'wottolen',
-    'wotton-under&rehy;edge',
-    'wotton-under-edge/gloucestershire',
-    'wotz',
-    'wou-ld',
-    'woud',
-    'woughton-on-the-green/milton',
-    'wouild',
     'wouivre',
-    'wouk',
-    'would&ndash',
-    'would&ndash;take',
-    'would\'',
-    'would\'ya',
-    'would-',
-    'would-bc',
-    'would-be-bowlers',
-    'would-be-fashion',
-    'would-be-leaders',
-    'would-be-love',
-    'would-be-steamy',
-    'would-by',
-    'would-you-believe-it',
-    'would.become',
     'would.n',
-    'would.run',
-    'would/could',
-    'would=be',
-    'would_no',
-    'wouldbe',
-    'wouldbegoods',
-    'wouldest',
-    'woulding',
-    'wouldn\'t/could',
-    'wouldn\'y',
-    'wouldnot',
-    'wouldould',
-    'woulds\'t',
-    'wouldyoubelieve',
-    'woun',
     'wound-in',
-    'wound-induced',
-    'wound-inducible',
-    'wound-licking',
-    'wound-raw',
-    'wound-site',
-    'wound/dressing',
-    'wounded-',
-    'wounded-bird',
-    'wounded.',
-    'wounded9n/a',
-    'woundedn/an/a',
-    'wounder',
-    'wounders',
-    'wounds_as_a',
-    'wous',
     'wouthuysen',
-    'wouthward',
-    'wouwermans',
-    'wouyld',
-    'woven-reed',
-    'woven-together',
-    'woven-type',
-    'wovoka',
-    'wovvy',
-    'wow-wow',
-    'wowser',
-    'wowsers',
-    'woyka',
-    'woz',
-    'woza',
-    'wozencraft',
     'wozenham',
-    'wozniack',
-    'wp-90',
-    'wpbs',
-    'wpj',
-    'wprost',
-    'wps',
-    'wpsa',
-    'wpt',
-    'wpw',
-    'wpwin',
-    'wq125',
-    'wq244',
-    'wqe',
-    'wqysey',
-    'wr&ouml;z',
     'wr/adc/mrd/m1/2',
-    'wr2',
-    'wr250',
-    'wr6',
-    'wr7296/21',
-    'wr7356/2',
-    'wr7458/2',
-    'wr7536/2',
-    'wr9',
-    'wracks',
-    'wrad',
-    'wrafton',
-    'wragby',
-    'wragcast',
-    'wragge/hospital',
-    'wraggs',
     'wraith-chase',
-    'wramsby',
-    'wran',
-    'wrangton',
-    'wranitzky',
-    'wrap-round',
-    'wrap-style',
-    'wras',
-    'wrass',
-    'wrastle',
-    'wrathall',
-    'wrathmall',
-    'wratten/oxford',
-    'wrawby',
-    'wraxhall',
-    'wray-on-windermere',
     'wray/father',
-    'wray/lollipop',
-    'wrayi',
-    'wreakin',
-    'wreath-layings',
-    'wreay',
-    'wreck-salvaging',
-    'wreck-site',
-    'wreck-strewn',
-    'wreck/if',
-    'wrecker\'s-yard',
-    'wree',
-    'wrekendike',
-    'wrekin\'',
-    'wren-lewes',
-    'wrenbridge',
     'wrench-related',
-    'wrenched-apart',
-    'wrenched-up',
-    'wrenchy',
-    'wrenish',
-    'wrennaissance',
-    'wrensfield',
-    'wressil',
-    'wressle',
-    'wrest-plank',
-    'wrestlemania-super',
-    'wrestling-bout',
-    'wrestlingworth',
-    'wrests',
-    'wretch.',
-    'wretched&mdash;in',
     'wretchedest',
-    'wrexford',
-    'wrexhill',
-    'wrfu',
-    'wribenhall',
-    'wrichtis',
-    'wriedel-schatensen',
-    'wriest',
-    'wriggler',
-    'wrigglings',
-    'wright-shearer',
-    'wright/campbell',
-    'wright/captain',
-    'wright/cheltenham',
-    'wright/clearwell',
-    'wright/drinkwise',
     'wright/elton',
-    'wright/european',
-    'wright/former',
-    'wright/head',
-    'wright/hydraulics',
-    'wright/local',
-    'wright/neighbour',
-    'wright/northampton',
-    'wright/northamptonshire',
-    'wright/police',
-    'wright/raf',
-    'wright/spencer',
-    'wright/teacher',
-    'wright/tenant',
-    'wrighthouse',
-    'wrightii',
     'wrighting',
-    'wrighton',
-    'wrightsons',
-    'wrigley/thames',
-    'wrincing',
-    'wringin\'',
-    'wringingly',
-    'wrington',
-    'wringworthy',
-    'wrinkle-brow',
-    'wrinkle-scarred',
-    'wrinklefest',
-    'wriothosleys',
-    'wrist&rehy;slapper',
-    'wrist&rehy;spinner',
-    'wrist-breaking',
     'wrist-buttoning',
-    'wrist-calculator',
-    'wrist-cocking',
-    'wrist-cutting',
-    'wrist-exerciser',
-    'wrist-generated',
-    'wrist-length',
-    'wrist-life',
-    'wrist-memo',
-    'wrist-mounted',
-    'wrist-rest',
-    'wrist-rests',
-    'wrist-rings',
-    'wrist-rupturing',
-    'wrist-slashers',
-    'wrist-slashing',
     'wrist-snapping',
-    'wrist-spinner',
-    'wrist-spinners',
-    'wrist-strengthening',
-    'wrist-thick',
-    'wrist-tinkerer',
-    'wrist-watches',
-    'wrist-worn',
-    'wristguards',
-    'wristlet',
-    'wristwatch-size',
-    'wristwork',
-    'writ-charter',
-    'writ-server',
-    'write&formula',
-    'write&mdash;it',
     'write&rehy;up',
-    'write-a-thon',
-    'write-access',
-    'write-off/obsolescence',
-    'write-on',
-    'write-once-read-many',
-    'write-permission',
-    'write-tip',
-    'write-your-own',
-    'write.',
-    'write/\'phone/visit',
-    'write/read',
-    'write/these',
-    'writeoffs',
-    'writer-photographer',
-    'writer-proclaimed',
     'writer-producer',
-    'writer-to-be',
-    'writer/',
-    'writer/actor/director/oxford',
-    'writer/author',
-    'writer/performer',
-    'writer/performers',
-    'writer/producer/director',
-    'writer/thinker',
-    'writer/translator',
-    'writers-at-work',
-    'writers-in-residence',
-    'writers.but',
-    'writers.john',
-    'writers/consultants',
-    'writership',
     'writerships',
-    'writes.but',
-    'writest',
-    'writeup',
-    'writhen',
-    'writi',
-    'writing&rehy;bureau',
-    'writing-a',
-    'writing-also',
-    'writing-are',
-    'writing-case',
-    'writing-directing',
-    'writing-effect',
-    'writing-pad.',
-    'writing-telegraph',
-    'writing.139&mdash;the',
     'writing.her',
-    'writing/directing',
-    'writingboard',
-    'writingpreferably',
-    'writt',
-    'writte',
-    'written\'',
-    'written-by',
-    'written-in-ten-minutes',
-    'written-on',
-    'writtenness',
-    'writtington',
-    'wrl.037',
-    'wroblewski',
-    'wrock',
-    'wrockwardine',
     'wroks',
-    'wrolstead',
-    'wrong&commat',
-    'wrong&ndash',
-    'wrong&ndash;doing',
-    'wrong\'',
-    'wrong-',
-    'wrong-course',
-    'wrong-doing-disease',
-    'wrong-foots',
-    'wrong-ish',
-    'wrong-kind-of-snow',
-    'wrong-measure',
-    'wrong-the',
-    'wrong-turning',
-    'wrong-way',
     'wrong.',
-    'wrong.teams',
-    'wrongest',
-    'wrongfoot',
-    'wrongheadedness',
-    'wrongly-convicted',
-    'wrongly-sized',
-    'wrongly-spelled',
-    'wroot',
-    'wrot',
-    'wrote-off',
-    'wrott',
-    'wrought-plasteel',
-    'wroughton.the',
-    'wroughton/wiltshire',
-    'wroxall',
     'wroxhall',
-    'wroxons',
-    'wrp',
-    'wrrick',
-    'wrror',
-    'wrt-ridden',
-    'wrth',
-    'wruck',
-    'wryed',
-    'wryly-beloved',
-    'wryly-turned',
-    'wrymouth',
-    'wryth',
-    'wrze&sacute;nia',
-    'ws&dollar;306,000,000-worth',
-    'ws-400',
     'ws-it',
-    'ws1',
-    'ws13',
-    'ws3000',
-    'ws4',
-    'ws486sx-33',
-    'ws486sx/33',
-    'ws692',
-    'ws739',
-    'wsays',
-    'wscf',
-    'wsd',
-    'wsgwynn',
-    'wsh',
-    'wsipc',
-    'wsk&ndash;pzl',
     'wsleader',
-    'wsw',
-    'wt.',
-    'wt/operator',
-    'wt/v',
-    'wt483',
-    'wth.',
-    'wthin',
-    'wtih',
-    'wtssa',
-    'wtssb',
-    'wttv',
-    'wtua',
-    'wu&circ;rm',
-    'wu-tong',
-    'wu-tu',
     'wuarchive.wustl.edu',
-    'wuargh',
-    'wuatelet',
-    'wubbering',
-    'wuben',
-    'wucai-fish',
-    'wucherer',
-    'wuckin\'',
-    'wudjerthink',
-    'wudnbinabluh',
-    'wuerzburg',
-    'wuffeck',
-    'wuffed',
-    'wuffing',
-    'wuffling',
-    'wuffs',
     'wuflingen',
-    'wug',
-    'wuh-hu-ma-han',
-    'wuhrer',
-    'wuhu',
-    'wuillot',
-    'wuk',
-    'wulfenii',
-    'wulfhelm',
-    'wulfige',
-    'wulfren',
-    'wulfrun',
-    'wulfstani',
-    'wulfwig',
-    'wuls',
-    'wulsin',
     'wuluerhampton',
-    'wumni',
-    'wumpus',
-    'wun-sa',
-    'wunda',
-    'wunden',
-    'wunderer',
-    'wunderhorn',
-    'wundersch&ouml;nen',
-    'wundsdorf',
-    'wunmi',
-    'wunna',
-    'wunnenberg',
-    'wunnerfull',
-    'wunschen',
-    'wunthanu',
     'wuppertal-barmen',
-    'wuppisch',
-    'wuran',
-    'wurds',
-    'wurdz',
-    'wurf',
-    'wurkin',
-    'wurley',
-    'wurli',
-    'wurlys',
-    'wurtsmith',
-    'wurttemburg',
-    'wurzell',
-    'wurzels',
-    'wushu',
-    'wusih',
     'wuskey',
-    'wutherich',
-    'wuyts',
-    'wv-cd1e',
-    'wv198',
-    'wv2000',
-    'wvb',
-    'wvn',
-    'wvo',
-    'ww/dec.91-p.1227',
-    'ww/dec.91/p.1227',
-    'ww/dec.91/p.1230',
-    'ww/dec.91/p.1246',
-    'ww/dec.91/p.1284',
-    'ww/nov.91/p.1143',
-    'ww/oct.91/p.1060',
     'ww/sept.89/p.803',
-    'ww1-type',
-    'ww3.pcx',
-    'wwcb',
-    'wwednesday',
-    'wweeekend',
-    'wwf-international',
-    'wwf-style',
-    'wwf/eec',
-    'wwf/exxon',
-    'wwg',
-    'wwiii',
-    'wwith',
-    'wwwww',
-    'wx10a',
-    'wx200',
     'wx303c',
-    'wy&rehy;man-mandy',
-    'wyards',
-    'wyart',
-    'wyatt-or-hughes',
-    'wyatt-smith',
-    'wyatt/bristol',
-    'wybarn',
-    'wybergh',
-    'wyborn',
-    'wybrew',
-    'wybron',
-    'wyc-whack',
-    'wych-hazel',
-    'wychbold',
-    'wycherly',
     'wyck',
-    'wycke',
-    'wyckeham',
-    'wycliff',
-    'wycliffe-went',
-    'wycliffian',
-    'wycliffites',
-    'wycome',
-    'wyd',
-    'wydale',
-    'wyddan',
-    'wyden',
-    'wydo',
-    'wye-delta',
-    'wyeland',
-    'wyersdale',
     'wyeside',
-    'wyfe',
-    'wyffles',
-    'wyfold/oxfordshire',
-    'wyganowski',
-    'wyggestons',
-    'wykeham-martin',
-    'wykham',
-    'wyld/retired',
-    'wyldbore',
-    'wylde',
-    'wyll',
-    'wylle',
-    'wylliam',
-    'wyllockx',
-    'wylson',
     'wylum',
-    'wyman.',
-    'wymondeswold',
-    'wymondham-dereham/ryburgh',
-    'wynalda',
-    'wynalek',
-    'wynants',
-    'wynau',
-    'wynd/queens',
-    'wyndcott',
-    'wyndeatt-whyte',
-    'wynder',
-    'wyndford',
-    'wyndord-thomas',
-    'wynedaele',
-    'wynell-mayow',
     'wyngarde',
-    'wynkoop',
-    'wynmalen',
-    'wynn-parry',
-    'wynn-pope',
-    'wynn-williams',
-    'wynn/former',
-    'wynnes',
-    'wynnstay',
-    'wynorski',
-    'wynra',
-    'wynters',
-    'wyoming-ibid',
-    'wyper',
-    'wypers',
-    'wyplosz',
     'wyploszcinsead',
-    'wyrm',
-    'wyrmbidder',
-    'wyrms',
-    'wyse-enhanced',
-    'wysiwyg-type',
-    'wysock',
-    'wysockyj/aldermaston',
-    'wysong',
-    'wyswig',
-    'wytcherly',
-    'wytheburn',
-    'wythenshaw',
-    'wyther',
-    'wythop',
-    'wytiwyg',
     'wytt',
-    'wytteneye',
-    'wyvell',
-    'wyves',
-    'wyzner',
-    'wz706',
-    'wz944',
-    'wz957',
-    'wz968',
-    'wz999',
-    'x&formula;p',
-    'x&ge;3.8',
-    'x&ge;4.6',
-    'x&ge;5.0',
-    'x&ge;6.0',
-    'x&ge;6.1',
     'x&ge;6.9',
-    'x&lcub',
-    'x&lcub;gd&rcub',
-    'x&lowbar',
-    'x&ndash;1',
-    'x&prime;0',
-    'x&times;1.5m',
-    'x&times;170x&times;61',
-    'x&times;1m',
-    'x&uuml;e',
-    'x\'nadu',
-    'x(1)8',
-    'x(l)',
-    'x(o)',
-    'x(t+t)',
-    'x+2',
     'x+4',
-    'x+i',
-    'x-10',
-    'x-2',
-    'x-80',
-    'x-95',
-    'x-99',
-    'x-across',
-    'x-applications',
-    'x-bar',
-    'x-club',
-    'x-compatible',
-    'x-component',
-    'x-components',
-    'x-coordinate',
-    'x-craft',
     'x-cut',
-    'x-d-e',
-    'x-doer',
-    'x-dozen',
-    'x-effect',
-    'x-experience',
-    'x-films',
-    'x-harbour',
-    'x-j',
-    'x-like',
-    'x-lines',
-    'x-m',
-    'x-mal',
-    'x-mas',
-    'x-modem',
-    'x-motif',
     'x-mp',
-    'x-nanterre',
-    'x-networking',
-    'x-nitrate',
-    'x-oct-1',
-    'x-omat',
-    'x-only',
-    'x-ore',
-    'x-p',
-    'x-phosphate',
-    'x-place',
-    'x-port',
-    'x-position',
-    'x-positioning',
-    'x-press',
-    'x-radiographic',
     'x-rating',
-    'x-ray-emitting',
-    'x-ray/neutron',
-    'x-raying',
-    'x-rayted',
-    'x-registered',
-    'x-registration',
-    'x-seater',
-    'x-series',
-    'x-ships',
-    'x-slot',
-    'x-standard',
-    'x-static',
-    'x-station-specific',
-    'x-tail-fin',
-    'x-tel',
     'x-term',
-    'x-town',
-    'x-treme',
-    'x-type',
-    'x-variable',
-    'x-viewer',
-    'x-viii',
-    'x-voting',
-    'x-widgets',
-    'x-windowing',
-    'x-windows-for-pc',
-    'x-windows-under-microsoft',
-    'x-winserver',
-    'x-world',
-    'x.-d',
-    'x.11',
     'x.400-88',
-    'x.400-compliant',
-    'x.4000',
-    'x.44',
-    'x.500.and',
-    'x.d',
-    'x.emacs',
-    'x/abdul',
-    'x/malik/de',
-    'x/n',
-    'x/not-x-type',
-    'x/open-branded',
-    'x/open-hosted',
-    'x/os',
-    'x/team',
-    'x/unix',
     'x09',
-    'x1,000',
-    'x100\'s',
-    'x100a',
-    'x100b',
-    'x100cm',
-    'x11.5-based',
-    'x11.6',
-    'x119',
-    'x11r3',
-    'x11r4',
-    'x11r6',
-    'x11rs',
-    'x12c',
-    'x14',
-    'x1ab',
     'x1x',
-    'x1xs',
-    'x2-5374',
-    'x2-5454',
-    'x2-y2',
-    'x20',
-    'x206',
-    'x21',
-    'x24&ins',
-    'x24/e',
-    'x24e',
-    'x28',
-    'x3-y3',
-    'x300',
-    'x300km',
-    'x3224',
     'x3h6',
-    'x3j19',
-    'x400-compliant',
-    'x44',
-    'x5&ft',
-    'x50',
-    'x500-compliant',
-    'x52333',
-    'x6&frac12;in',
-    'x68432',
-    'x68684-x68689',
-    'x68721',
-    'x68722',
-    'x69115-6',
-    'x7times',
-    'x9.1m',
     'x90',
-    'x:p',
-    'x:x',
-    'x=-1',
-    'x=0',
-    'x=0.01',
-    'x=15.38',
-    'x=16.24',
-    'x=21.89',
-    'x=4',
-    'x=5.72',
-    'x=6',
-    'x=7.58',
-    'x=o',
-    'x=z',
-    'xa\'-equipped',
     'xa(f)',
-    'xa-compliant',
-    'xa-scm',
-    'xa/38/26/0011',
-    'xa/44/25/0013',
-    'xa/44/25/0018',
-    'xa/44/26/0005',
-    'xa2',
-    'xaba',
-    'xacs',
-    'xaintrailles',
-    'xalam',
-    'xamax',
-    'xamoterol',
-    'xanada',
-    'xanadu-front',
     'xandra',
-    'xaneros',
-    'xantar',
-    'xanthelasma',
-    'xanthic',
-    'xanthine/',
-    'xanthine/hypoxanthine',
-    'xanthine/xanthine',
-    'xanthines',
-    'xanthippes',
-    'xanthogenate',
-    'xanthomata',
-    'xanthommatin',
-    'xanthophyll',
-    'xanthorrhaea',
-    'xanthozona',
     'xanto',
-    'xar',
-    'xarel-lo',
-    'xarhas',
-    'xarit&egrave;s',
-    'xativa',
-    'xaverius',
-    'xaviers',
-    'xax',
-    'xay',
-    'xb-70.',
-    'xb-akm',
-    'xb7+',
-    'xba-1/pst-1',
-    'xbai-xho',
-    'xbv1',
     'xc/00/26/2058',
-    'xc/00/28/0001',
-    'xc/00/28/0004',
-    'xc/00/28/0006',
-    'xc/01/25/0000',
-    'xc/01/25/2025',
-    'xc/01/25/2032',
-    'xc/01/25/2033',
-    'xc/04/25/0003',
-    'xc/04/26/0003',
-    'xc/05/21/0000',
-    'xc/05/25/0007-1',
-    'xc/05/25/0008',
-    'xc/05/25/0009',
-    'xc/05/25/0011',
-    'xc/05/25/0012',
     'xc/05/25/0014',
-    'xc/05/25/0019',
-    'xc/08/25/0000',
-    'xc/08/25/0005',
-    'xc/08/25/0006',
-    'xc/08/25/0011',
-    'xc/08/25/0014',
-    'xc/08/25/0015',
-    'xc/08/25/0016',
-    'xc/08/25/0017',
-    'xc/08/25/0019',
-    'xc/08/26/0004',
-    'xc/09/25/0000',
-    'xc/09/25/0002',
-    'xc/09/25/0004',
-    'xc/09/25/0005',
     'xc/09/25/0006',
-    'xc/11/25/0001',
-    'xc/11/26/0002',
-    'xc/11/26/0003',
-    'xc/11/26/0004',
-    'xc/14/25/0024',
-    'xc/14/25/0027',
-    'xc/14/26/0003',
-    'xc17',
-    'xc20',
-    'xc5+',
-    'xc6+',
-    'xc8',
-    'xca8',
-    'xcc',
-    'xcci',
     'xccv',
-    'xcessory',
-    'xchange',
-    'xchf',
-    'xci.5',
-    'xci:13',
-    'xco',
-    'xcv',
-    'xcviii',
-    'xcy',
-    'xd1+',
-    'xd3+',
-    'xd4+',
-    'xd6+',
-    'xdb-link',
-    'xdb-server',
     'xdb-workbench',
-    'xdp',
-    'xds',
-    'xe-server',
-    'xe0601',
-    'xe2+',
-    'xe3+',
-    'xe650',
-    'xec',
-    'xedoc',
-    'xedos-6',
-    'xehna',
-    'xeina',
-    'xemm',
-    'xen-ls',
-    'xeniai',
     'xenica',
-    'xenix/unix',
-    'xenobiologist',
-    'xenocidal',
-    'xenocrates',
-    'xenocrystic',
-    'xenocrysts',
-    'xenodochium',
-    'xenogeneic',
-    'xenokrates',
-    'xenolithic',
-    'xenomystus',
-    'xenon-133',
-    'xenon-135',
-    'xenon-laser',
-    'xenonymous',
     'xenonymy',
-    'xenophanic',
-    'xenophobes',
-    'xenophobically',
-    'xenophons',
-    'xenopithecus',
-    'xenopsylla',
-    'xenos',
-    'xenotime',
-    'xenova',
-    'xenox',
-    'xenusion',
-    'xepected',
-    'xer',
-    'xerfan',
-    'xerodera',
     'xerolas',
-    'xerophilous',
-    'xerophthalmic',
-    'xerophyte',
-    'xeros',
-    'xerospermum',
-    'xerous',
-    'xerox/apple',
-    'xeroxparc',
-    'xestobium',
-    'xesus',
-    'xex',
-    'xey',
-    'xeye',
-    'xf/13/06/1980',
-    'xf2l&ndash;1s',
     'xf375',
-    'xf4+47',
-    'xf5+',
-    'xface',
-    'xfacec',
-    'xfuzzy',
-    'xg/00/28/0002',
-    'xg/01/25/0002',
-    'xg/01/25/0010',
-    'xg/02/28/0004',
-    'xg/09/29/0001',
-    'xg/10/28/0003',
-    'xg2+',
-    'xg3+',
-    'xg332',
-    'xg4+',
     'xg737',
-    'xg797',
-    'xga-2',
-    'xgato',
-    'xgcy',
-    'xgenetic',
-    'xgtvs',
-    'xh',
-    'xh/02/18/0001',
-    'xh2+',
-    'xh4',
-    'xh5',
-    'xh7',
-    'xh8+',
-    'xhaja',
-    'xhelil',
     'xhenet',
-    'xhosa-speakers',
-    'xhq',
-    'xhuveli',
-    'xi\'an',
-    'xi-nu',
-    'xi.25',
-    'xi.26',
-    'xi.31',
-    'xi.49',
-    'xi.54',
-    'xi.7',
-    'xi.76xii.',
-    'xi.79',
-    'xi.81.3',
-    'xi.87',
     'xi0601',
-    'xia-class',
-    'xia.',
-    'xiafang',
-    'xian-zai',
-    'xiangju',
-    'xianguangiids',
-    'xianhong',
-    'xianjiang',
-    'xianlin',
-    'xianshun',
-    'xiaotian',
-    'xiaoyong',
-    'xiapu',
-    'xicaques',
-    'xicor',
     'xidis',
-    'xiem',
-    'xigaz&ecirc',
-    'xihuang',
-    'xii.271',
-    'xii.30',
-    'xii.36.4',
-    'xii.8',
-    'xii/xiii',
-    'xiii.',
-    'xiii.59',
-    'xiii/z',
-    'xiiii',
-    'xiijs',
-    'xiiv',
-    'xijli',
     'xilin',
-    'xin-huan',
-    'xingan',
-    'xinghua',
-    'xining',
-    'xinwen',
-    'xinzong',
-    'xio',
-    'xiorrappa',
-    'xioupouppas/flood',
-    'xipamanine',
-    'xiphias',
-    'xiphidium',
-    'xippas',
-    'xirivella',
-    'xisha',
     'xishe',
-    'xit',
-    'xitan',
-    'xiu',
-    'xiuying',
-    'xiv.3',
-    'xiv.34',
-    'xiv.4',
-    'xiv.8',
-    'xiv.82',
-    'xivth',
-    'xix-i',
-    'xix.',
-    'xixa',
-    'xixc',
-    'xixe',
     'xixth',
-    'xj-s',
-    'xj-two',
-    'xj12',
-    'xj200',
-    'xj220c',
-    'xj4.2',
-    'xj579',
-    'xj9870',
-    'xjr-15',
-    'xjr15',
-    'xk150',
-    'xk819',
-    'xk824',
-    'xk940',
-    'xkxt',
     'xl&ndash;xliii',
-    'xl(2)',
-    'xl-ent',
-    'xl0601',
-    'xl318',
-    'xl40',
-    'xl500',
-    'xl70',
-    'xlic&mdash;xlii',
-    'xlii&ndash;xliii',
-    'xliv&ndash;xlv',
-    'xliv.17',
-    'xll',
-    'xlll',
-    'xlr-to-jack',
-    'xlr14c',
     'xlr15c',
-    'xlr17c',
-    'xlr17chr',
-    'xlr17g',
-    'xlr19chr',
-    'xlr19g',
-    'xlt',
-    'xlvii&ndash;xlviii',
-    'xm-17',
-    'xm173',
-    'xm594',
-    'xm602',
-    'xmasa',
-    'xmath',
-    'xmillion',
-    'xmint',
     'xmm',
-    'xmni',
-    'xmo',
-    'xmode',
-    'xmp921',
-    'xmt',
-    'xn344',
-    'xn974',
-    'xnet',
-    'xnq&ndash;1',
-    'xo-xy-xx-xyy-xxy-xxyy-xxxx',
-    'xo21',
-    'xoana',
-    'xoanan',
-    'xoanon',
-    'xou',
     'xoy',
-    'xoz',
-    'xp&ndash;50',
-    'xp&ndash;59s',
-    'xp-63',
-    'xp-63ns',
-    'xp1',
-    'xp1-440',
-    'xp10',
-    'xp11.21',
-    'xp11s',
-    'xp11t',
-    'xp12',
-    'xp12t',
-    'xp17',
-    'xp17t',
     'xp18',
-    'xp18t',
-    'xp19t',
-    'xp330s',
-    'xp346',
-    'xp360',
-    'xp486',
-    'xp505',
-    'xp511',
-    'xpediter',
-    'xperiments',
-    'xpes',
-    'xpg-4',
-    'xpg3-branded',
-    'xpg4-branded',
-    'xpg6',
     'xplor/dg',
-    'xposition',
-    'xpr',
-    'xps701',
-    'xq',
-    'xq20',
-    'xq22',
-    'xquisite',
-    'xr-2264',
-    'xr-s200',
-    'xr-x',
-    'xr32k',
-    'xr36p',
-    'xr38r',
-    'xr3is',
-    'xr3s',
     'xr4',
-    'xr4x4s',
-    'xr77j',
-    'xra',
-    'xre',
-    'xref',
-    'xrf-2000',
-    'xri',
-    'xrs',
-    'xrsa',
-    'xrule',
-    'xs&ndash;1',
-    'xs&ndash;l',
-    'xs.',
-    'xs109',
-    'xs24',
     'xs24z',
-    'xs567',
-    'xs8',
-    'xs903',
-    'xsa',
-    'xscript',
-    'xshow',
-    'xspy',
-    'xsql',
-    'xstones.',
-    'xt-',
-    'xt-based',
-    'xt-pp',
-    'xt-quipu',
-    'xt16',
-    'xt600',
     'xtai',
-    'xtend',
-    'xth',
-    'xtp-ii',
-    'xtr',
-    'xtravision',
-    'xtreegold',
-    'xtualplayfulness',
-    'xuecan',
-    'xuefan',
-    'xueguagn',
-    'xuelan',
-    'xueliang',
-    'xuequn',
-    'xuly',
-    'xunta',
     'xurbicum',
-    'xuv',
-    'xuy',
-    'xuyen',
-    'xv-15',
-    'xv-a-sides',
-    'xv-xix',
-    'xv.41.5',
-    'xv.60.',
-    'xv.9',
-    'xv10',
-    'xv2c/taqi',
-    'xv422',
-    'xv424',
-    'xv470',
-    'xv474',
     'xv535',
-    'xv730h',
-    'xv863',
-    'xvedit',
-    'xvi&ndash;xviii',
-    'xvi-style',
-    'xvi.',
-    'xview-based',
-    'xvii&ndash;xxii',
-    'xvii.',
-    'xvii.20',
-    'xvii.49',
-    'xviii-xix',
-    'xviii-xx',
-    'xviii-xxii',
-    'xviii.169',
     'xviiip',
-    'xviri',
-    'xvshow',
-    'xvt++',
-    'xvt-design',
-    'xw',
-    'xw837',
-    'xw887',
-    'xwas',
-    'xwe',
-    'xwexwe',
-    'xwh',
-    'xwords',
-    'xworld',
-    'xwr',
-    'xx\'',
     'xx\'s',
-    'xx-xx',
-    'xx-xxi',
-    'xx.',
-    'xx.42',
-    'xx.6',
-    'xx.xxx',
-    'xx/savall',
-    'xxd',
-    'xxi-xxiii',
-    'xxi.541',
-    'xxii&ndash;xxv',
-    'xxiii.3',
-    'xxiii:1',
-    'xxiiib',
-    'xxiv.3',
     'xxivth',
-    'xxix&ndash;xxx',
-    'xxix-xxx',
-    'xxthe',
-    'xxv&ndash;xxvi',
-    'xxvf.',
-    'xxvi&ndash;xxviii',
-    'xxvi-xxvii',
-    'xxvii&ndash;xxx',
-    'xxvii.942',
-    'xxviii.8.9',
-    'xxvl',
-    'xxx.22',
-    'xxxi.',
-    'xxxi:20',
-    'xxxii&ndash;xxxv',
     'xxxii&ndash;xxxvii',
-    'xxxiii.7',
-    'xxxilia',
-    'xxxv.62',
-    'xxxxxx.exe',
-    'xxyy',
-    'xy-plane',
-    'xy/10-z',
-    'xyalazine',
-    'xyc',
-    'xylazin',
-    'xyleborus',
-    'xylocain',
-    'xylocaine',
-    'xylocoris',
-    'xylogic',
     'xylography',
-    'xylophoning',
-    'xylopia',
-    'xylopic',
-    'xylose',
-    'xyphios',
-    'xyphoid',
-    'xyris',
-    'xystus',
-    'xyzkqu',
-    'xz997',
-    'xza4',
-    'xzb2',
-    'y&aacute&ntilde;ez',
-    'y&amacr',
-    'y&eacute;pez',
     'y&egrave;zi',
-    'y&ndash;u',
-    'y&verbar',
-    'y\'a',
-    'y\'anywhere',
-    'y\'are.',
-    'y\'been',
-    'y\'black',
-    'y\'bloody',
-    'y\'both',
-    'y\'butt',
-    'y\'callin\'',
-    'y\'come',
-    'y\'cool',
-    'y\'devious',
-    'y\'do',
     'y\'doing',
-    'y\'drip-feed',
-    'y\'faces',
-    'y\'fancy',
-    'y\'gal',
-    'y\'going',
-    'y\'gonna',
-    'y\'gotta',
-    'y\'last',
-    'y\'look',
-    'y\'lost',
-    'y\'mouth',
-    'y\'nose',
-    'y\'off',
-    'y\'ol\'',
-    'y\'one',
     'y\'ought',
-    'y\'ready',
-    'y\'recovered',
-    'y\'red',
-    'y\'rself',
-    'y\'selves',
-    'y\'there',
-    'y\'think',
-    'y\'ugly',
-    'y\'waitin\'',
-    'y\'were',
-    'y\'work',
-    'y\'wot',
-    'y\'would',
-    'y\'y\'yes',
-    'y\'yes',
     'y(2)',
-    'y(t)',
-    'y*rk',
-    'y+s',
-    'y-2',
-    'y-aminobutyric',
-    'y-char',
-    'y-chromosome-specific',
-    'y-chromosome-specificsequences',
-    'y-components',
-    'y-dimension',
-    'y-e',
-    'y-er',
-    'y-fran',
-    'y-front',
-    'y-hat',
     'y-i-i-e-e',
-    'y-in-the-fifth-position',
-    'y-inputs',
-    'y-iron',
-    'y-junction',
-    'y-level',
-    'y-motions',
-    'y-mp-class',
-    'y-neurons',
-    'y-position',
-    'y-reg',
-    'y-scales',
-    'y-shape',
-    'y-slot',
-    'y-type',
-    'y-up',
     'y-values',
-    'y-variable',
-    'y-wrecked',
-    'y-y',
-    'y-y-y-',
-    'y-y-y-y-yet',
-    'y-y-yes',
-    'y.-k',
-    'y.a',
-    'y.b.a.',
-    'y.c.',
-    'y.gasser',
-    'y.t.s.',
-    'y.z.',
-    'y/',
-    'y/303/25/3002',
     'y/306/25/3005',
-    'y/c',
-    'y/x',
-    'y01',
-    'y0ur',
-    'y1,361bn',
-    'y1.07',
-    'y1.331',
-    'y1.35',
-    'y1.788',
-    'y1.916',
-    'y1/82',
-    'y10',
-    'y10bn',
-    'y10m',
-    'y12',
     'y140.90',
-    'y142.00',
-    'y142.25',
-    'y15',
-    'y15,000',
-    'y16.3bn',
-    'y18,000',
-    'y19,800',
-    'y2,718',
-    'y2,800',
-    'y2,816',
-    'y20',
-    'y20.5bn',
-    'y21',
-    'y220,000',
-    'y3',
     'y3,398',
-    'y3,864',
-    'y3,884',
-    'y3.3billion',
-    'y342',
-    'y388bn',
-    'y4,078',
-    'y40',
-    'y460',
-    'y48,000',
-    'y5,000',
-    'y5,631',
-    'y5,825',
-    'y6',
-    'y6,019',
-    'y6,602',
     'y65,000',
-    'y7,282',
-    'y7,500',
-    'y9,000',
-    'y93',
-    'y=0.32436&ndash;0.11110',
-    'y=10',
-    'y=117.99+5.58x',
-    'y=146.70+7.13x',
-    'y=2',
-    'y=3.25+0.88x',
-    'y=38.54+7.07x',
-    'y=5',
-    'y=a+bx',
-    'y=e',
-    'y=g+c+e',
     'y=y',
-    'y=y*100/40',
-    'y=yes',
-    'ya&ndash;18',
-    'ya&ndash;20',
-    'ya&ndash;22',
-    'ya&ntilde;ez',
-    'ya\'akov',
-    'ya-boo',
-    'ya-boo-sucks',
-    'ya-ya',
-    'ya/00/25/0003',
-    'ya/00/25/0005',
-    'ya/09/25/0006',
-    'ya/09/25/0008',
-    'ya/09/25/0012',
     'ya/09/25/0013',
-    'ya/09/25/0016',
-    'ya/33/25/0004',
-    'ya/33/25/0011',
-    'ya/33/25/0026',
-    'ya/33/25/0032',
-    'ya/33/25/0035',
-    'ya/33/25/0036',
-    'ya/33/25/0039',
-    'ya/33/25/0047',
-    'ya/33/25/0048',
-    'ya/35/25/0002',
-    'ya4',
-    'yaa-yaa-yaa',
-    'yaaa',
-    'yaaaaaa',
     'yaaaaaaaaaaaaawn',
-    'yaacob',
-    'yaacobi',
-    'yaacov',
-    'yaakobi',
-    'yaakov',
-    'yaalon',
-    'yaaqoub',
-    'yaara',
-    'yaargh',
-    'yaari',
-    'yaass',
-    'yabbering',
-    'yabbing',
-    'yablans',
-    'yachad',
     'yacht-laden',
-    'yacht-like',
-    'yacht-sailing',
-    'yacht-servicing',
-    'yachtfilled',
-    'yachtie',
-    'yachting/competent',
-    'yachtmasters',
-    'yachuk',
-    'yackin\'',
-    'yacking',
-    'yacob',
-    'yacomen',
-    'yacoov',
-    'yacorder',
-    'yacouba',
     'yacov',
-    'yacs.',
-    'yacuma',
-    'yacyret&aacute',
-    'yada',
-    'yadamsuren',
-    'yadegar',
-    'yadev',
-    'yadgaroff',
-    'yadoo',
-    'yadvashim',
-    'yafei',
-    'yaffa',
-    'yaffles',
-    'yage',
-    'yagoda',
     'yagodin',
-    'yahabeebee',
-    'yahannes',
-    'yahia',
-    'yahing',
-    'yahooo',
-    'yahveh',
-    'yahwe',
-    'yahwists',
-    'yaina',
-    'yajuvendra',
-    'yak&ndash;1',
-    'yak&ndash;14',
-    'yak&ndash;18s',
-    'yak&ndash;2',
-    'yak&ndash;24',
     'yak&ndash;25/26/27/28',
-    'yak&ndash;36',
-    'yak&ndash;4',
-    'yak&ndash;40',
-    'yak&ndash;52',
-    'yak&ndash;7',
-    'yak&ndash;9',
-    'yak&ndash;9s',
-    'yak\'s-wool',
-    'yak-1',
-    'yak-12',
-    'yak-18a',
-    'yak-18t',
-    'yak-25',
-    'yak-41',
-    'yak-50',
     'yak-52',
-    'yak-55',
-    'yak-9s',
-    'yak-chucker',
-    'yak-like',
-    'yak-prefix',
-    'yak-yakking',
-    'yakakent',
-    'yakhtaru',
-    'yakir',
-    'yakmen',
-    'yakobashvili',
-    'yakoub',
-    'yakovlev&mdash;chair',
-    'yakovlev&mdash;former',
-    'yakovlev-40',
     'yakubovskiy',
-    'yakup',
-    'yakushimanum',
-    'yakushova',
-    'yakutsia',
-    'yal&iacute',
-    'yalavou',
-    'yalaya',
-    'yales',
-    'yall',
-    'yaller',
-    'yallow',
-    'yalom',
-    'yalouris',
-    'yalta-redefined',
-    'yalurah',
     'yalya',
-    'yam-cultivating',
-    'yamagushi-gumi',
-    'yamaha-roberts',
-    'yamahana',
-    'yamales',
-    'yamanaka',
-    'yamato-1\'s',
-    'yambuki',
-    'yamdrok',
-    'yameossouko',
-    'yamhill',
-    'yaminobutyric',
-    'yammerin',
-    'yammers',
-    'yamming',
     'yamolecivil',
-    'yamut',
-    'yan-kit',
-    'yan-leung',
-    'yan-pascal',
-    'yanagisawa',
-    'yanai',
-    'yanaihara',
-    'yanal',
-    'yanamami',
-    'yanbin',
-    'yance',
-    'yanchinski',
-    'yandja',
-    'yanduri',
-    'yaneyev',
     'yanez',
-    'yang-kan',
-    'yanga',
-    'yangcheng',
-    'yangjiaxiung',
-    'yangste',
-    'yangzu',
-    'yani',
-    'yaniewicz',
-    'yanji',
-    'yank\'s-eye',
-    'yankee-doodle',
-    'yankelovich',
-    'yankified',
-    'yankophile',
-    'yankov',
     'yanmin',
-    'yannakou',
-    'yannoulatos',
-    'yanoff',
-    'yanomani',
-    'yanouzas',
-    'yanow',
-    'yanshin',
-    'yao-hoo',
-    'yao-tung',
-    'yaolun',
-    'yaounde',
-    'yaphet',
-    'yapok',
-    'yapper',
-    'yapton',
     'yar\'adua',
-    'yar-ali-i',
-    'yarangas',
-    'yarbury',
-    'yarbus',
-    'yard&ndash;dringhouses',
-    'yard-arms',
-    'yard-deep',
-    'yard-ferry',
-    'yard-square',
-    'yard-wand',
-    'yard/station/siding',
-    'yardarms',
-    'yardbird',
-    'yarde',
-    'yardemo',
     'yardley.',
-    'yardman',
-    'yardmasters',
-    'yardmen',
-    'yards.only',
-    'yardspinners',
-    'yardstick-plus',
-    'yardwood',
-    'yaremenko',
-    'yargh',
-    'yarkon',
-    'yarlott',
-    'yarlung',
-    'yarmey',
-    'yarmie',
-    'yarmoutn',
     'yarmulka',
-    'yarmulke',
-    'yarmulkes',
-    'yarn-a-rama',
-    'yarn-maker',
-    'yarn-sizing',
-    'yarn-spinning',
-    'yarnall',
-    'yarners',
-    'yarnery',
-    'yarnfield',
-    'yarnit',
-    'yarns.',
-    'yarnspinners',
-    'yarnwinder',
-    'yaroa',
     'yaroh',
-    'yarov',
-    'yarp',
-    'yarpole',
-    'yarpole/herefordshire',
-    'yarramalong',
-    'yarraman-bia',
-    'yarraman-ku',
-    'yarrawon',
-    'yarrowford',
-    'yarrrt',
-    'yarrt',
-    'yarrundi-side',
-    'yarty',
-    'yarub',
-    'yaruba',
     'yaruda',
-    'yarway',
-    'yarzeh',
-    'yasak-paying',
-    'yasaka',
-    'yaseen',
-    'yasensgat',
-    'yasha',
-    'yashar',
-    'yashi',
-    'yasi',
-    'yasir',
-    'yaskawa',
-    'yasmine',
-    'yassar',
-    'yassuh',
     'yassukovich',
-    'yastik',
-    'yastrzhembsky',
-    'yasue',
-    'yasukawa',
-    'yasuni',
-    'yasutsune',
-    'yasyri',
-    'yat/gloucestershire',
-    'yat/herefordshire',
-    'yataghans',
-    'yatch',
-    'yatchsman',
-    'yates/director',
-    'yates/manager',
-    'yates/visits',
     'yatesian',
-    'yatim',
-    'yatskov',
-    'yatta',
-    'yattendon',
-    'yatter',
-    'yattered',
-    'yattering',
-    'yatts',
-    'yau-nan',
-    'yaung',
-    'yaura',
-    'yaval',
-    'yavansky',
-    'yavgeni',
-    'yavlinksy',
     'yavneh',
-    'yavorivsky',
-    'yavroyan',
-    'yaw-free',
-    'yaw/roll',
-    'yawadee',
-    'yawker',
-    'yawn-capacity',
-    'yawn-inducing',
-    'yawn-making',
-    'yawn-provoker',
-    'yawnathon',
-    'yawning.',
-    'yawnsome',
-    'yawnsomely',
-    'yawo',
     'yaws-endemic',
-    'yaya-ba&scedil;is',
-    'yayasan',
-    'yayaya',
-    'yayehrad',
-    'yazdan',
-    'yazdegird',
-    'yazdgard',
-    'yazji',
-    'yazoooo',
-    'yazour',
-    'yazuka',
-    'yb-40',
-    'yb-depleted',
-    'ybor',
-    'yc&ndash;125b',
     'ycas',
-    'yce',
-    'yceland',
-    'yci',
-    'yclad',
-    'yclept',
-    'yct',
-    'ycv-309',
-    'yda1820b',
-    'ydel',
-    'ydra',
-    'ye&mdash;es',
-    'ye&racute;evan',
-    'ye-e-e-es',
-    'ye-i',
-    'ye-olde-worlde',
     'ye-s',
-    'ye-yes',
-    'ye/00/22/0009',
-    'ye/00/22/2005',
-    'ye/00/26/0018',
-    'ye/00/28/0001',
-    'ye/01/26/0010-1',
-    'ye/04/25/0007',
-    'ye/04/25/0008',
-    'ye/04/25/0010',
-    'ye/04/25/0012',
-    'ye/05/25/0006',
-    'ye/05/25/0009',
-    'ye/05/25/0010',
-    'ye/05/25/0014',
-    'ye/05/25/0018',
     'ye/06/25/0013',
-    'ye/06/25/0019',
-    'ye/06/25/0020',
-    'ye/06/25/0023',
-    'ye/06/25/0027',
-    'ye/06/25/0029',
-    'ye/06/25/0031',
-    'ye/06/25/0035',
-    'ye/06/25/0036',
-    'ye/09/25/0001',
-    'ye/09/25/0002',
-    'ye/09/25/0005',
-    'ye/09/25/0006',
-    'ye/09/25/0009',
-    'ye/09/25/0011',
-    'ye/09/25/0013',
     'ye/11/25/0001',
-    'ye/11/25/0002',
-    'ye/11/25/0003',
-    'ye/11/25/0005',
-    'ye/11/25/0006',
-    'ye/11/25/0011',
-    'ye/13/25/0005',
-    'ye:h',
-    'yeabsley',
-    'yeah-they-don\'t-know-shit',
-    'yeah-well-i\'m-inarestid-in-martial&rehy;arts-in\'t-i',
-    'yeah.',
-    'yeah.that',
-    'yeah_because',
-    'yeah_because_,_because_of',
-    'yeah_instead',
     'yeahhh',
-    'yeahhrrr',
-    'yeakel',
-    'yealand',
-    'yeaman',
-    'year&mdash;more',
-    'year&mdash;see',
-    'year&rehy;long',
-    'year\'photograph',
-    'year--is',
-    'year-1977',
-    'year-and-a-half-old',
-    'year-and-half',
-    'year-attracting',
-    'year-based',
-    'year-books',
     'year-dates',
-    'year-earlier',
-    'year-ending',
-    'year-in-year-out',
-    'year-low',
-    'year-numbering',
-    'year-old-girl',
-    'year-ole',
-    'year-only',
-    'year-over-year',
-    'year-planners',
-    'year-start',
-    'year-team',
-    'year-ten',
-    'year-the',
-    'year-though',
     'year-tutors',
-    'year-up',
-    'year.and',
-    'year.be',
-    'year.he',
-    'year.in',
-    'year.ois',
-    'year.only',
-    'year.overall',
-    'year.russell',
-    'year/i',
-    'year/unlimited',
-    'year/what',
-    'year=0.0003&times',
-    'year=1985.',
-    'year_prior',
     'year_so',
-    'yeardley',
-    'yearely',
-    'yearfs',
-    'yearley/coach',
-    'yearley/thames',
-    'yearlie',
-    'yearner',
-    'yearners',
-    'yearning/to',
-    'years&mdash',
-    'years&mdash;as',
-    'years&mdash;she',
-    'years&mdash;two',
-    'years&pound',
-    'years*',
     'years-authenticated',
-    'years-for',
-    'years-imprisonment',
-    'years-in',
-    'years-of-age',
-    'years-probably',
-    'years-since',
-    'years-sooner',
-    'years-will',
-    'years.',
-    'years.5',
-    'years.he',
-    'years.in',
-    'years.johnnie',
-    'years.now',
-    'years.picture',
     'years.richard',
-    'years.u',
-    'years/',
-    'years/a',
-    'years/owns',
-    'years/you',
-    'years1800',
-    'years_because',
-    'yearswith',
-    'yearwoodpublic',
-    'yeas',
-    'yeasr',
-    'yeast-rich',
-    'yeast.',
-    'yeast/celery',
-    'yeast1',
     'yeate',
-    'yeatsian',
-    'yeatsians',
-    'yeatton',
-    'yeay',
-    'yebaw',
-    'yechotinic',
-    'yedders',
-    'yedi',
-    'yediot',
-    'yee-ew',
-    'yee-ha',
-    'yee-yee-yee',
-    'yeeased',
-    'yeee',
-    'yeeeaaahhh',
     'yeeeeaah',
-    'yeeeeeaaah',
-    'yeeeeee-ha',
-    'yeeeeeehhhaaaahhhh',
-    'yeeeeeuch',
-    'yeeeess',
-    'yeeeuk',
-    'yeeh',
-    'yeehaa',
-    'yeehaw',
-    'yeerely',
-    'yeeres',
-    'yees',
-    'yees-gar-oth',
-    'yeesss',
-    'yeetzky',
     'yeeuk',
-    'yefano',
-    'yefim',
-    'yegane',
-    'yegani',
-    'yegorov',
-    'yeh-won',
-    'yehoshavat',
-    'yehoshua',
-    'yehoussi',
-    'yehya',
-    'yeild',
-    'yeilded',
-    'yeilding',
-    'yeilds',
-    'yekepa',
     'yekka',
-    'yekuno',
-    'yeldham',
-    'yelding',
-    'yelds',
-    'yelikovsky',
-    'yeliu',
-    'yellin',
-    'yellow-amber',
-    'yellow-and-brown',
-    'yellow-and-white',
-    'yellow-anoraked',
-    'yellow-bleary-eyed',
-    'yellow-bloomed',
-    'yellow-breasted',
-    'yellow-bright',
     'yellow-browed',
-    'yellow-buff',
-    'yellow-coated',
-    'yellow-coloured',
-    'yellow-covered',
-    'yellow-cream',
-    'yellow-curtained',
-    'yellow-decked',
-    'yellow-featured',
-    'yellow-flecked',
-    'yellow-fleshed',
-    'yellow-greens',
-    'yellow-gutted',
-    'yellow-hammers',
-    'yellow-hot',
-    'yellow-jacket',
     'yellow-like',
-    'yellow-line',
-    'yellow-lit',
-    'yellow-loving',
-    'yellow-man',
-    'yellow-maned',
-    'yellow-moustached',
-    'yellow-ochre',
-    'yellow-papered',
-    'yellow-patterned',
-    'yellow-pink',
-    'yellow-ribbon',
-    'yellow-rumped',
-    'yellow-sheet',
-    'yellow-skinned',
-    'yellow-soap',
     'yellow-soled',
-    'yellow-spotted',
-    'yellow-stamped',
-    'yellow-stemmed',
-    'yellow-streaked',
-    'yellow-striped',
-    'yellow-tailed',
-    'yellow-toned',
-    'yellow-toothed',
-    'yellow-topped',
-    'yellow-wagtail-like',
-    'yellow-walled',
-    'yellow-wort',
-    'yellow/',
-    'yellow/blue',
-    'yellow/burgundy/green',
     'yellow/carmine',
-    'yellow/double',
-    'yellow/grey',
-    'yellow/miniature',
-    'yellow/no',
-    'yellowbacks',
-    'yellowbeard',
-    'yellowcoat',
-    'yellowcraigs',
-    'yellower\'n',
-    'yellowhead',
-    'yellowish-buff',
-    'yellowish-gray',
-    'yellowish-grey',
-    'yellowish-ochre',
-    'yellowish-to',
     'yellowish/beige',
-    'yellowknife',
-    'yellowlegs.v',
-    'yellowly',
-    'yellowstain',
-    'yellowy-browny',
-    'yellowy-cream',
-    'yellowy-orange',
-    'yellowy-orange.',
-    'yellowy-white',
-    'yellsound',
-    'yelpers',
-    'yelsin',
-    'yeltoniensis',
-    'yelva',
-    'yeman',
     'yemane',
-    'yemenite',
-    'yemini',
-    'yen-backed',
-    'yen-based',
-    'yen-denominated',
-    'yen-dollar',
-    'yen/&dollar;35',
-    'yenangyaung',
-    'yenbu',
-    'yenching',
-    'yendley',
-    'yendley/former',
-    'yenipazar',
-    'yenisci',
-    'yeniseisk',
     'yenisey',
-    'yeniseysk',
-    'yens',
-    'yensetter',
-    'yentchabre',
-    'yentl',
-    'yenworthy',
-    'yeo/gloucestershire',
-    'yeoford',
-    'yeoman-like',
-    'yeomans/employee',
-    'yeomen-tailors',
-    'yeopersons',
-    'yeovil-based',
-    'yeowch',
-    'yepishev*',
     'yeppies',
-    'yer\'ll\'av',
-    'yer\'n',
-    'yer-\'ere',
-    'yer.',
-    'yerallriiiiiiight',
-    'yerars',
-    'yeravda',
-    'yerbeston',
-    'yerds',
-    'yerdzook',
-    'yerebatan',
-    'yerely',
-    'yeremenko',
-    'yeres',
-    'yergin',
     'yerin',
-    'yerja',
-    'yerlaten',
-    'yerlie',
-    'yerly',
-    'yero',
-    'yerolim&eacute;na',
-    'yerr',
-    'yerrralllrright',
-    'yerrulabobof',
-    'yersterday',
-    'yervant',
-    'yerz',
-    'yes&lsqb;aha&rsqb',
-    'yes-',
-    'yes-anything',
     'yes-let',
-    'yes-s-s',
-    'yes-to',
-    'yes.it',
-    'yes/',
-    'yes/no/ca',
-    'yes/no/do',
-    'yes:51,136',
-    'yeselves',
-    'yeshibah',
-    'yeshive',
-    'yeshua',
-    'yesil',
-    'yesmanship',
-    'yesplease',
-    'yessah',
     'yessirree',
-    'yessss',
-    'yeste',
-    'yester-day',
-    'yester-night',
-    'yesterd',
-    'yesterday\'',
-    'yesterday-',
-    'yesterday-a',
-    'yesterday.five',
-    'yesterday.just',
-    'yesterday/banbury/oxfordshire',
-    'yesterday/erika',
-    'yesterday/gloucester',
-    'yesterday/linda',
-    'yesterday/mine',
     'yesterday/mortimer/berkshire',
-    'yesterday/oxford',
-    'yesterdayphotograph',
-    'yesterdaypicture',
-    'yesterdaythurs',
-    'yesternight',
-    'yesteryearj',
-    'yestiday',
-    'yesugai',
-    'yet&mdash;and',
-    'yet&ndash',
-    'yet&rehy;what',
-    'yet-been',
-    'yet-more-aloof',
-    'yet-to-be-designed',
-    'yet-to-be-discovered',
     'yet-to-be-heard',
-    'yet-to-be-released',
-    'yet-to-be-shipped',
-    'yet-to-be-sponsored',
-    'yet-to-bes',
-    'yet-to-come',
-    'yet-unannounced',
-    'yet.',
-    'yet/he',
-    'yet/in',
-    'yeterday',
-    'yetholm',
-    'yeti-gaiters',
-    'yeti-like',
-    'yetman',
-    'yetserday',
     'yetton',
-    'yetts',
-    'yeu',
-    'yeudall',
-    'yeungling',
-    'yeurgh',
-    'yeuwhiddens',
-    'yeve',
-    'yevegny',
-    'yevgenii',
-    'yeviakh',
-    'yevlakh',
-    'yevropeiskaya',
-    'yevropeiskikh',
-    'yew-clipped',
-    'yew-hedge',
     'yew-needles',
-    'yew-wood',
-    'yew-yew',
-    'yewdale',
-    'yewens',
-    'yewlett',
-    'yewmanbeen',
-    'yewshul',
-    'yeyn',
-    'yeyyyy',
-    'yf&ndash;117a',
-    'yf-22s',
-    'yfallen',
-    'yfv',
-    'yg/00/29/0003',
-    'yg/13/25/0003',
     'yg/13/25/0005',
-    'yg/13/25/0007',
-    'yg/13/25/0008',
-    'yg/13/25/0009',
-    'yg/13/25/0011',
-    'yg/13/25/0014',
-    'yg/13/25/0015',
-    'yg/13/25/0016',
-    'yg/13/25/0017',
-    'yg/13/25/0018',
-    'yg/13/25/0020',
-    'yg/13/25/0024',
-    'ygarth',
-    'ygdrasil',
-    'ygeia',
-    'ygelda',
     'ygl-3',
-    'yglesias',
-    'ygrrsaeden',
-    'ygwmdfgrrsaeden',
-    'yhd',
-    'yhe',
-    'yhn',
-    'yhombi',
-    'yhour',
-    'yi-hsiung',
-    'yi-jing',
-    'yi-te',
-    'yi-yuan',
-    'yibza',
-    'yicheng',
-    'yiddin',
     'yiddish-speakers',
-    'yiddishisms',
-    'yidjaru',
-    'yiel',
-    'yield-enhancing',
-    'yield-improvement',
-    'yield-increasing',
-    'yield-robbing',
-    'yield-sapping',
-    'yield.',
-    'yieldingly',
-    'yiewsley',
-    'yigor',
-    'yikhav',
-    'yikovlev',
-    'yil',
     'yilan',
-    'yildirimhan',
-    'yili',
-    'yin-chun',
-    'yin-formation',
-    'yin-fu',
-    'yin/yang',
-    'yina',
-    'yinchu',
-    'yings',
-    'yinst',
-    'yinternational',
-    'yioda',
-    'yiorgos',
-    'yip-i',
-    'yip-i-addy-i-ay',
     'yipes',
-    'yippee-ai-ay',
-    'yipper',
-    'yipping',
-    'yippy',
-    'yirol',
-    'yirsels',
-    'yisraeli',
-    'yit',
-    'yitzhaki',
-    'yiur',
-    'yiwara',
-    'yizi',
-    'yj93-5',
-    'yj93-ge-5-powered',
-    'yjada',
     'yjmuiden',
-    'yk&ndash;117s',
-    'yk18u',
-    'ykba2',
-    'yks-7-g-bwac',
-    'ylaft',
-    'ylated',
-    'yleisradio',
-    'ylfe',
-    'ylinen',
-    'ylioppilastutkintotodistus',
-    'yllidomestic',
-    'yllycci',
-    'ym/ywca',
-    'yma',
-    'ymadawiad',
     'ymaginacioun',
-    'ymax',
-    'ymca/ywca',
-    'ymf&ndash;5',
-    'ymitury',
-    'ymm',
-    'ymm&auml;r-r&auml;ttek&ouml',
-    'ymo',
-    'ymr',
-    'ymuiden',
-    'yn/1.7.4',
-    'yn5.48',
-    'ynd',
-    'yng',
-    'yngve',
-    'ynis-hir',
     'ynk',
-    'ynogh',
-    'ynynynyn',
-    'ynyslas',
-    'ynysoedd',
-    'ynysymaengwyn',
-    'ynyuray',
-    'yo\'self',
-    'yo-yo\'s',
-    'yo-yo-like',
-    'yo11',
-    'yo4',
-    'yo5',
-    'yoarth',
-    'yob-heaven',
-    'yobbie',
     'yobbishness',
-    'yobbo-y',
-    'yobe',
-    'yobis',
-    'yobot',
-    'yocals',
-    'yocam',
-    'yod',
-    'yodeller',
-    'yodellers',
-    'yodels',
-    'yodey',
-    'yodie',
-    'yoel',
-    'yoeli',
-    'yoelli',
     'yoen-ki',
-    'yoffe',
-    'yoffie',
-    'yofi',
-    'yofre',
-    'yog',
-    'yoga-based',
-    'yoga-vashishta',
-    'yoga/meditation',
-    'yogai',
-    'yoghourts',
-    'yoghurt\'',
-    'yoghurt-based',
-    'yoghurt-maker',
-    'yoghurt-makers',
-    'yogin',
     'yogonaise',
-    'yogoslavia',
-    'yogoslavian',
-    'yogurt-making',
-    'yohan',
-    'yohon-nukite',
-    'yoichiro',
-    'yoicked',
-    'yoji',
-    'yojo',
-    'yok-sing',
-    'yokam',
-    'yoke-fellow',
-    'yoke-harness',
-    'yoke-less',
-    'yoken',
     'yokie',
-    'yokio',
-    'yokker',
-    'yoko-like',
-    'yokohoma',
-    'yokozuna',
-    'yoku',
-    'yokum',
-    'yolen',
-    'yolked',
-    'yolkless',
-    'yolkys',
-    'yolla',
-    'yollari',
-    'yolton',
-    'yolu',
     'yomper',
-    'yompers',
-    'yondon',
-    'yondonsuren',
-    'yonduach',
-    'yoneda',
-    'yonekawa',
-    'yonezawa',
-    'yonges',
-    'yonghua',
-    'yongphalu',
-    'yongping',
-    'yongs',
-    'yongten',
-    'yonil',
-    'yonks-old',
     'yonty',
-    'yonville',
-    'yoo-hooing',
-    'yoof-crazed',
-    'yook',
-    'yoomtis',
-    'yoonie',
-    'yoooseless',
-    'yoop',
-    'yoouu',
-    'yop/yts',
-    'yoplait',
-    'yopougan',
-    'yopougon',
-    'yorburgh',
-    'yordanova',
     'yorebridge',
-    'yoredale',
-    'yoreveni',
-    'yorgos',
-    'yorhaul',
-    'york&ndash;boston',
-    'york&ndash;cardiff',
-    'york&ndash;hull',
-    'york&ndash;london',
-    'york\'',
-    'york-boston',
-    'york-bound',
-    'york-ish',
-    'york-jfk',
-    'york-liverpool',
-    'york-oriented',
     'york-shire',
-    'york-to-london',
-    'york.',
-    'york.this',
-    'york/new',
-    'york/sydney',
-    'york/thirsk',
-    'yorkbased',
-    'yorker-type',
-    'yorkified',
-    'yorkreco',
-    'yorksh',
-    'yorksheer',
-    'yorkshi',
-    'yorkshie',
-    'yorkshire-',
     'yorkshire-dry',
-    'yorkshire-durham',
-    'yorkshire-ified',
-    'yorkshire-skipton',
-    'yorkshire/lincolnshire',
-    'yorkshire/tyne',
-    'yorkshire123-1288.575.4',
-    'yorkshirebased',
-    'yorkton',
-    'yorkwood',
-    'yorlander',
-    'yorlanders',
-    'yornutta',
-    'yoro',
-    'yorre',
-    'yorrible',
     'yorskhire',
-    'yoruba-dominated',
-    'yoruba-speaking',
-    'yorubas',
-    'yosahiro',
-    'yoshi-ima',
-    'yoshie',
-    'yoshihito',
-    'yoshikuni',
-    'yoshinao',
-    'yoshinobu',
-    'yoshiteru',
-    'yoshiya',
-    'yoshiyuki',
-    'yoshizawa',
-    'yosu',
     'yot',
-    'you&mdash;another',
-    'you&mdash;constanza',
-    'you&mdash;could',
-    'you&mdash;he',
-    'you&mdash;in',
-    'you&mdash;may',
-    'you&mdash;no',
-    'you&mdash;tomorrow',
-    'you&mdash;which',
-    'you&ndash;say',
-    'you&rehy;not',
-    'you\'\'',
-    'you\'-you',
-    'you\'d.just',
-    'you\'ll-do-as-i-say',
     'you\'n',
-    'you\'re-okay-i\'m-okay',
-    'you\'re.right',
-    'you\'res',
-    'you-ain\'t&rehy;getting-change',
-    'you-and-me-having-a-little-joke-together',
-    'you-are-one-of-us',
-    'you-clid',
-    'you-d',
-    'you-did',
-    'you-don\'t-have-to-tell-me-anything-about-carol',
-    'you-don\'t-say',
-    'you-ess',
-    'you-fus',
-    'you-genics',
-    'you-have',
     'you-haven\'t-phoned',
-    'you-hsin',
-    'you-i',
-    'you-know-the-scent-now-try-the-bath-range',
-    'you-know-what-again',
-    'you-know-whats',
-    'you-know-where',
-    'you-ming',
-    'you-name-it-they-had-it',
-    'you-please',
-    'you-plural',
-    'you-rascal-you',
-    'you-return',
-    'you-sean',
-    'you-snap-first-and-i\'ll-snap-back',
-    'you-terminology',
     'you-thanasia',
-    'you-topia',
-    'you-tsao',
-    'you-tube',
-    'you-wo',
-    'you.get',
-    'you.i',
-    'you.wo',
-    'you/but',
-    'you/contours',
-    'you/i',
-    'you/make',
-    'you/re',
-    'you/show',
-    'you/thou',
-    'you/us',
     'you/ye/your/yours/yourself',
-    'you111',
-    'you_as',
-    'you_because',
-    'you_by',
-    'you_from_time',
-    'you_in',
-    'you_know',
-    'you_on',
-    'you_up',
-    'youba',
-    'youca',
-    'youcai',
-    'youcef',
-    'youch',
-    'youdale',
     'youdan',
-    'youhave',
-    'youing',
-    'youings',
-    'youki',
-    'youlden',
-    'youldon',
-    'youlgreave',
-    'youn',
-    'younaaaa',
-    'younaanarr',
-    'young&mdash',
-    'young&mdash;her',
-    'young&ndash;man',
-    'young&ndash;old',
-    'young\'\'',
     'young\'uns',
-    'young-',
-    'young-and',
-    'young-as-you-feel',
-    'young-at-heart',
-    'young-bloods',
-    'young-choon',
-    'young-directed',
-    'young-ey',
-    'young-females',
-    'young-in-heart',
-    'young-james',
-    'young-love',
-    'young-middle-aged',
-    'young-mum',
-    'young-only',
     'young-rearing',
-    'young-sam',
-    'young-seeming',
-    'young-turk',
-    'young-uns',
-    'young-user-friendly',
-    'young/do',
-    'young/food',
-    'young/glasgow',
-    'young/housing',
-    'young/landlord',
-    'young/speaking',
-    'young/support',
-    'young/swindon',
-    'young/the',
-    'young_of',
     'youngbloods',
-    'younger-brother',
-    'younger-i',
-    'younger-sister',
-    'younger-style',
-    'younger/my',
-    'younger/older',
-    'youngerman',
-    'youngest-born',
-    'youngish.',
-    'youngjohn',
-    'youngner',
-    'youngping',
-    'youngself',
-    'youngson',
-    'youngsters.',
     'youngsters.mike',
-    'youngsters/inexperienced',
-    'youngtalent',
-    'youngy',
-    'younie/royal',
-    'younis15',
-    'younis2',
-    'younker',
-    'younkin',
-    'younr',
-    'your&dollar',
-    'your&rehy;self',
-    'your&rehy;selves',
-    'your\'',
-    'your\'s',
-    'your-',
     'your-arse',
-    'your-heart-on-your-sleeve',
-    'your/',
-    'your/a',
-    'youran',
-    'yourdon',
-    'youretournal',
-    'yourhumblemule',
-    'yourinitials1',
-    'yourinitials10',
-    'yourinitials11',
-    'yourinitials12',
-    'yourinitials13',
-    'yourinitials14',
-    'yourinitials16',
-    'yourinitials2',
     'yourinitials22',
-    'yourinitials23',
-    'yourinitials23a',
-    'yourinitials24',
-    'yourinitials25',
-    'yourinitials26',
-    'yourinitials27',
-    'yourinitials28',
-    'yourinitials29',
-    'yourinitials3',
-    'yourinitials30.ltr',
-    'yourinitials30a',
-    'yourinitials30b',
-    'yourinitials30c',
-    'yourinitials32',
-    'yourinitials33',
     'yourinitials4',
-    'yourinitials6',
-    'yourinitials7',
-    'yourinitials7.doc',
-    'yourinitials8',
-    'yourinitials8.doc',
-    'yourinitials9',
-    'yourlowlybeast',
-    'yours-in-hope',
-    'yours/you',
-    'yoursel\'',
-    'yourself\'',
-    'yourself-exploring',
-    'yourself-on',
-    'yourself-to',
-    'yourself-what',
     'yourself/is',
-    'yousen',
-    'youssel',
-    'yousself',
-    'youssoufian',
-    'youssri',
-    'yousuf',
-    'yout',
-    'youth***',
-    'youth-based',
-    'youth-conscious',
-    'youth-democratic',
-    'youth-hostel-cum-doss-house',
-    'youth-hostelled',
-    'youth-hostelling',
-    'youth-of-today',
     'youth-orientated',
-    'youth-sex-madness',
-    'youth-sustaining',
-    'youth-team',
-    'youth-v-experience',
-    'youth.',
-    'youth/junior',
-    'youthquake',
-    'youths&rehy;once',
-    'youthworker',
-    'youtself',
-    'yowei',
-    'yowes',
-    'yowff',
-    'yown',
-    'yows',
     'yowsa',
-    'yoyes',
-    'yoyish',
-    'yoyos',
-    'yoz',
-    'yp6',
-    'ypaeitltw',
-    'ypas',
-    'ypdr601',
-    'ypilach&oacute;0n',
-    'ypocrite',
-    'yport',
-    'ypres-roulers',
-    'ypsi',
-    'ypt&ndash;9',
-    'yr-olds',
     'yrans-pennine',
-    'yrissari',
-    'yrnetn',
-    'yron',
-    'yrr',
-    'ys-11',
-    'ys-11s',
-    'ysabella',
-    'ysatis',
-    'yseult',
-    'ysg',
-    'ysidro',
-    'yslrwqieiifkvwksl',
-    'ysls',
-    'ystalyfera',
-    'ystdy',
     'ystems3c',
-    'ysterics',
-    'ysterplaat-based',
-    'yt-broth',
-    'ytb',
-    'ythinkspitxishlikefa',
-    'ytr',
-    'ytrened',
-    'yts.',
-    'yts/tvei',
-    'yts169.4',
-    'ytterg&auml;rde',
-    'yu&ndash;aff',
-    'yu&ndash;boz',
-    'yu-chu',
-    'yu-hon',
     'yuaka',
-    'yuanjing',
-    'yuans',
-    'yuanyang',
-    'yubani',
-    'yubero',
-    'yucatecan',
-    'yucck',
-    'yucel',
-    'yucelen',
-    'yuck-face',
-    'yuckie',
-    'yucon',
-    'yuda',
-    'yude',
-    'yudishthira',
     'yueh-hwa',
-    'yuenfu',
-    'yuet',
-    'yug-g-g',
-    'yugas',
-    'yugesh',
-    'yugojitter',
-    'yugoslav-austrian',
-    'yugoslav-ec',
-    'yugoslav-greek',
-    'yugoslavia&mdash;later',
-    'yugoslavia\'',
-    'yugoslavia*',
-    'yugoslavia-ec',
-    'yugoslavia-wide',
-    'yugoslavia/holland',
     'yugoslavian-born',
-    'yuguchi',
-    'yuishiro',
-    'yukarigungoren',
-    'yuker',
-    'yukichi',
-    'yukihiko',
-    'yukinoyouni',
-    'yukiso',
-    'yukka',
-    'yukker',
-    'yukki',
-    'yukkie',
-    'yukkified',
-    'yukong',
-    'yuksekova',
     'yula',
-    'yulara',
-    'yule-tide',
-    'yulia',
-    'yulin',
-    'yuliy',
-    'yull',
-    'yulunggu',
-    'yuluo',
-    'yumbo',
-    'yumio',
-    'yumminess',
-    'yummmmm',
-    'yums',
-    'yumyumyum',
-    'yun-cheung',
     'yuna',
-    'yunderup',
-    'yundong',
-    'yungstirs',
-    'yunkers',
-    'yunlin',
-    'yunnanese',
-    'yunny',
-    'yunona',
-    'yunupingu',
-    'yupela',
-    'yuppa',
-    'yuppie-phobia',
-    'yuppie-scum-sucking',
-    'yuppie-style',
-    'yuppiedom',
     'yuppiefied',
-    'yuppieness',
-    'yuppiewhite',
-    'yuppiewhites',
-    'yuppily',
-    'yuppy-jazz',
-    'yups-in-peril',
-    'yuqo',
-    'yuram',
-    'yuran',
-    'yurganysh',
-    'yurgh',
-    'yuriev',
-    'yurike',
-    'yuriria',
-    'yuris-al-hayik',
     'yurodivaya',
-    'yurok',
-    'yuruk',
-    'yurur',
-    'yurze',
-    'yusen',
-    'yushenkov',
-    'yushiskin',
-    'yushiskins',
-    'yusif',
-    'yuspa',
-    'yusshui',
-    'yusufhealth',
-    'yusufov',
-    'yusupov-karpov',
-    'yutang',
     'yuth',
-    'yuthanasium',
-    'yuu',
-    'yuu-mi',
-    'yuu-ndi-mi',
-    'yuu-ndi-yi-mi',
-    'yuuga',
-    'yuval-davies',
-    'yuvaskula',
-    'yuxian',
-    'yuya',
-    'yuye',
-    'yuz',
-    'yuzhen',
-    'yuzhmash',
-    'yuzu',
     'yverdon',
-    'yves-jacky',
-    'yvill',
-    'yvmqkspfthwshlikefv',
-    'yvmqkzpfjxwvhglawfvchqxyopy',
-    'yvmqkzpgjxwvhglawfvchqyopy',
-    'yvn',
-    'yvo',
-    'yvonete',
-    'ywa',
-    'ywes',
-    'ywin',
-    'ywtfghikmccowlxpmtxwkirlmhjdb',
-    'yy/mm/dd',
-    'yyaa',
-    'yyeeeeeeessssss',
     'yynnyynn',
-    'yyyynnnn',
-    'yyyyyeeeeeeeessssss',
-    'yyyyyyyyyyyyyyyyyyyy',
-    'yz125',
-    'yzeiri',
-    'yzermannii',
-    'yzordderrexian',
-    'yzr250',
-    'yzrs',
-    'z&aacute;meck&aacute',
-    'z&auml;irean',
-    'z&auml;uberflote',
-    'z&deg',
-    'z&dollar;1.5',
-    'z&dollar;10',
     'z&dollar;126',
-    'z&dollar;2.2',
-    'z&dollar;30',
-    'z&dollar;300',
-    'z&dollar;33,000',
-    'z&dollar;350,000,000',
-    'z&dollar;40,000',
-    'z&dollar;40,000,000',
-    'z&dollar;420',
-    'z&dollar;5',
-    'z&dollar;50',
-    'z&dollar;500,000',
-    'z&dollar;500m',
-    'z&dollar;6,400',
-    'z&dollar;8,200',
-    'z&eacute;lide',
     'z&eacute;mire',
-    'z&eacute;phire',
-    'z&eacute;phirs',
-    'z&ecirc;tang',
-    'z&gt;0',
-    'z&lstrok;oties',
-    'z&lt;0',
-    'z&lt;o',
-    'z&ndash;wkv',
-    'z&oacute;calo',
-    'z&ouml',
-    'z-150',
-    'z-2',
-    'z-28',
-    'z-80-based',
-    'z-8200',
     'z-axes',
-    'z-bone',
-    'z-buffering',
-    'z-d-k',
-    'z-dna',
-    'z-helix',
-    'z-in',
-    'z-naught',
-    'z-neurons',
-    'z-notes',
-    'z-nought',
-    'z-output',
-    'z-pitch',
-    'z-plan',
-    'z-pres',
-    'z-rock',
     'z-rod',
-    'z-row',
-    'z-sections',
-    'z-server',
-    'z-shape',
-    'z-soft',
-    'z-variable',
-    'z-z-zip',
-    'z.1007bis',
-    'z.5',
-    'z.501',
-    'z.50ls',
-    'z.h.',
-    'z.j.',
-    'z1-style',
-    'z10',
     'z114',
-    'z142',
-    'z143l',
-    'z1827',
-    'z1829',
-    'z1830',
-    'z193',
-    'z2,167,000',
-    'z2033/g&ndash;astl',
-    'z21,000',
-    'z2118',
-    'z22',
-    'z242ls',
-    'z248',
-    'z2505',
-    'z2837',
     'z2838',
-    'z2900',
-    'z2901',
-    'z30',
-    'z30,000',
-    'z303',
-    'z3034',
-    'z3035',
-    'z3036',
-    'z3054',
-    'z3059',
-    'z3060',
-    'z3061',
-    'z4060',
-    'z4087',
-    'z4261',
     'z4544',
-    'z4etc',
-    'z50',
-    'z50lx',
-    'z55',
-    'z5722',
-    'z584,000',
-    'z7015\'s',
-    'z80-type',
-    'z8000',
-    'z80000',
-    'z80s',
-    'z8q',
-    'z900',
-    'z=-7.7565',
-    'z=-a',
     'z=-h',
-    'z=0.33',
-    'z=0.67',
-    'z=0.7',
-    'z=0.88',
-    'z=1',
-    'z=1.75',
-    'z=1.85',
-    'z=10.65',
-    'z=11.83',
-    'z=2',
-    'z=2.18',
-    'z=2.37',
-    'z=2.38',
-    'z=2.64',
-    'z=a',
     'z=h',
-    'z=o',
-    'z_\'s',
-    'za&iuml;de',
-    'za&iuml;reans',
-    'za&iuml;res',
-    'za&iuml;rois',
-    'za\'afac',
-    'za02',
-    'zaahi',
-    'zaandvoort',
-    'zaba',
-    'zabajjkal\'sk',
-    'zaballa',
-    'zabalza',
-    'zabava',
     'zabihollah',
-    'zabijaniu',
-    'zabinskiminister-head',
-    'zablon',
-    'zabolotny',
-    'zabron',
-    'zabrze',
-    'zabul',
-    'zaburi',
-    'zabuton',
-    'zabytkow',
-    'zacapone',
-    'zacar&iacute;as',
-    'zacaria',
-    'zacatecas',
-    'zacatecoluca',
     'zaccagnini',
-    'zaccarelli/general',
-    'zaccheria',
-    'zacco.',
-    'zachalias',
-    'zachar',
-    'zacharapoulos',
-    'zacharay',
-    'zachari&aacute&scaron',
-    'zachariadis',
-    'zacharliuk',
-    'zachau',
-    'zacher',
-    'zacho',
-    'zachramondo',
-    'zaddik',
     'zade',
-    'zadek',
-    'zadik',
-    'zadis',
-    'zadock',
-    'zadok\'',
-    'zadracarta',
-    'zadrozny',
-    'zadrugas',
-    'zaealand',
-    'zaehnsdorf',
-    'zaets',
-    'zafer',
-    'zaffarana',
-    'zafiez',
-    'zafir',
     'zafu',
-    'zafur',
-    'zagajewski',
-    'zagato',
-    'zagel',
-    'zagging',
-    'zaghreb',
-    'zaghulul',
-    'zagi',
-    'zaglebie',
-    'zagorje',
-    'zagreb-belgrade',
-    'zagreb-ljubijana',
-    'zagury',
-    'zagwe',
-    'zaha',
     'zaharias',
-    'zahgawa',
-    'zahirde',
-    'zahiruddin',
-    'zahko',
-    'zahlbericht',
-    'zahle',
-    'zahlen',
-    'zahler',
-    'zahling',
-    'zahlk&ouml;rper',
-    'zahlring',
-    'zahr',
-    'zahrani',
-    'zahringer',
-    'zahringers',
     'zaichiki',
-    'zaida',
-    'zaidan',
-    'zaidani',
-    'zaidman',
-    'zaimis',
-    'zaini',
-    'zaionchkovskii',
-    'zajdler',
-    'zajednica',
-    'zakari',
-    'zakaria',
-    'zakaria-bahauddin',
-    'zakarpatsk&aacute',
-    'zakat',
-    'zakatellos',
     'zakayo',
-    'zakelj',
-    'zakhia',
-    'zakhvat',
-    'zakian',
-    'zaklinsky',
-    'zako',
-    'zakonomernyi',
-    'zakum',
-    'zakynthians',
-    'zalau',
-    'zale',
-    'zaleski',
-    'zalig',
-    'zalon',
-    'zaluar',
     'zamac',
-    'zamaitis',
-    'zamal',
-    'zamanian',
-    'zambaco',
-    'zambardino',
-    'zambian-born',
-    'zambianization',
-    'zamboanga',
-    'zambon',
-    'zamboni',
-    'zambra',
-    'zambrana',
-    'zamecnick',
-    'zamfara',
-    'zamfir',
     'zamiatin',
-    'zamil',
-    'zamindary',
-    'zamir',
-    'zamirah',
-    'zammett',
-    'zamorani',
-    'zamorano',
-    'zamosc',
-    'zamour',
-    'zampa',
-    'zampolit',
-    'zamyatin',
-    'zanadi',
-    'zanbax',
-    'zancer',
     'zando',
-    'zandomeneghi',
-    'zandonai',
-    'zandt',
-    'zandvoorde',
-    'zanesville',
-    'zaneta',
-    'zangana',
-    'zanganeh',
-    'zani',
-    'zania',
-    'zanichallia',
-    'zanichelli',
-    'zanier',
-    'zaniest',
-    'zanin',
     'zaninotto',
-    'zank',
-    'zankaliani',
-    'zanla',
-    'zannier',
-    'zannoby',
-    'zanon',
-    'zanoobia',
-    'zanotti',
-    'zantav',
-    'zanten',
-    'zantford',
-    'zanthoxylums',
-    'zanubia',
-    'zanzinger',
-    'zaorski',
     'zaoulitchnyi',
-    'zaparama',
-    'zaparo',
-    'zapatero',
-    'zaphod',
-    'zaphrentid',
-    'zaphrentis',
-    'zapii',
-    'zaplana',
-    'zapnit',
-    'zaporozhian',
-    'zaporozhye',
-    'zapote',
-    'zappiest',
-    'zapps',
-    'zappy',
     'zapresic',
-    'zapu-pf',
-    'zarabella',
-    'zarak',
-    'zarani',
-    'zarathion',
-    'zarb-',
-    'zardusht',
-    'zarebski',
-    'zarek',
-    'zarg',
-    'zarif',
-    'zark',
-    'zarko',
-    'zarnescu',
-    'zaroug',
     'zarrabian',
-    'zarsto',
-    'zart',
-    'zarubezhe',
-    'zarubezhgeologiya',
-    'zarubin',
-    'zarudnyi',
-    'zarya',
-    'zarycky',
-    'zarzis',
-    'zarzueia',
-    'zarzuela',
-    'zaslavskaia',
-    'zaslavsky',
-    'zastyrday',
-    'zasy',
     'zatkin',
-    'zaton',
-    'zatorska',
-    'zatrwa',
-    'zattore',
-    'zatulin',
-    'zau',
-    'zauberflote',
-    'zauberwurfel',
-    'zaudinskiy',
-    'zaukoenig',
-    'zaun',
-    'zaunkoenig',
-    'zavadi',
-    'zavalishin',
-    'zavaroni',
     'zavbod',
-    'zavgayev',
-    'zavidia',
-    'zavod',
-    'zavodnick',
-    'zavody',
-    'zavoevanie',
-    'zawadzki',
-    'zawi',
-    'zawinul',
-    'zawislak',
-    'zawislakindustry',
-    'zawodzinski',
-    'zawolkow',
-    'zaybek',
-    'zaydani',
     'zayonchkovskiy',
-    'zayyad',
-    'zazi',
-    'zazzau',
-    'zbanic',
-    'zbarbar',
-    'zbinden',
-    'zbm',
-    'zbraslav',
-    'zbynek',
-    'zc',
-    'zchloty',
-    'zchn&mdash;christian',
-    'zdarsky',
-    'zden&ecaron;k',
-    'zdf',
     'zdf/german',
-    'zdobyslaw',
-    'zdrave',
-    'zdravko',
-    'zdxl4',
-    'ze359',
-    'zeal-of-the-land',
-    'zealand-australia',
-    'zealand-based',
-    'zealand-bred',
-    'zealand-canada',
-    'zealand-south',
-    'zealand-trained',
-    'zealand-usa',
-    'zealands',
-    'zeall',
     'zealousness',
-    'zeami',
-    'zebbug',
-    'zeberdee',
-    'zebit',
-    'zebra-skin',
-    'zebra-stripes',
-    'zebra-underwings',
-    'zebra-watching',
-    'zebru',
-    'zebrugge',
-    'zebrugree',
-    'zebu-jerseys',
-    'zebu-taurine',
-    'zebulun',
-    'zebus',
     'zeca',
-    'zechariah\'',
-    'zechsteinkalk',
-    'zed-bombed',
-    'zede',
-    'zedhead',
-    'zednick',
-    'zeebo',
-    'zeelands',
-    'zeelenburg',
-    'zeeman/principal',
-    'zeeta',
-    'zeevaart',
-    'zefa',
-    'zeffar',
-    'zeffirero',
     'zeger',
-    'zegeye',
-    'zegreb',
-    'zegyo',
-    'zehjnulahu',
-    'zehn',
-    'zehnder.',
-    'zeichner',
-    'zeida',
-    'zeihst',
-    'zeile',
-    'zeill',
-    'zeini',
-    'zeisler',
-    'zeit.',
-    'zeitgeister',
     'zeitgiest',
-    'zeithamml',
-    'zeitlyn',
-    'zeitschr',
-    'zeitschr.',
-    'zeitz',
-    'zejnulaju',
-    'zel-i-sultan',
-    'zelanite',
-    'zelazny',
-    'zeled&oacute;n',
-    'zeleia',
-    'zelemi',
-    'zeleney',
-    'zelenskaja',
-    'zeleograd',
     'zelevansky',
-    'zeleznik',
-    'zelig',
-    'zelle',
-    'zellick',
-    'zellig',
-    'zellweger',
-    'zelma-like',
-    'zelnik',
-    'zelotai',
-    'zelter',
-    'zelter/reforest',
-    'zeltweg',
-    'zemaitis-toting',
-    'zemanek',
-    'zemel',
     'zemke',
-    'zemlaya',
-    'zemlja',
-    'zemlyachestva',
-    'zemlyansk',
-    'zemon',
-    'zemour',
-    'zemstovs',
-    'zemyla',
-    'zen-buddhism',
-    'zen-buddhist',
-    'zen-chieh',
-    'zen-do',
-    'zenanas',
-    'zenaruzabeitia',
-    'zendavesta',
     'zendel',
-    'zendocon',
-    'zene',
-    'zeneca/ici',
-    'zenell&mdash',
-    'zenia',
-    'zenith-transits',
-    'zenith.bull',
-    'zenji',
-    'zenkovich',
-    'zenos',
-    'zenro',
-    'zentall',
-    'zentec',
-    'zentilli',
-    'zentis',
     'zentrale',
-    'zentralkriminalamt',
-    'zentralstelle',
-    'zentralwohlfahrtsstelle',
-    'zentris',
-    'zentropa',
-    'zeodary',
-    'zeolite-softened',
-    'zeolite-softening',
-    'zeolitised',
-    'zeos-designed',
-    'zep-clone',
-    'zephanian',
-    'zephirs',
-    'zephranthes',
-    'zephyr-grade',
     'zepke',
-    'zepp',
-    'zepper',
-    'zerata',
-    'zerdani',
-    'zerdusht',
-    'zereske',
-    'zereski',
-    'zerkall',
-    'zermela',
-    'zermelo',
-    'zernatto',
-    'zero&rehy;crossings',
-    'zero-',
-    'zero-degree',
-    'zero-density',
     'zero-divisor',
-    'zero-earner',
-    'zero-emission',
-    'zero-extended',
-    'zero-field',
-    'zero-gyms',
-    'zero-investment',
-    'zero-mass',
-    'zero-modification',
-    'zero-nine-zero-five-nine',
-    'zero-one',
-    'zero-option',
-    'zero-order',
-    'zero-parity',
-    'zero-phoneme',
-    'zero-power',
     'zero-profit',
-    'zero-rate',
-    'zero-reader',
-    'zero-speed',
-    'zero-stage',
-    'zero-temperature',
-    'zero-tillage',
-    'zero-time',
-    'zero-wind',
-    'zero-yielding',
-    'zero/02',
-    'zeroid',
-    'zeroist',
-    'zerorating',
-    'zeroth-order',
-    'zerrs',
     'zerst&ouml;rer',
-    'zeruiah',
-    'zestfulness',
-    'zeta\'',
-    'zeta-powered',
-    'zetaprobe',
-    'zetlein',
-    'zetterling',
-    'zettervall',
-    'zettl',
-    'zeugen',
-    'zeughaus',
-    'zeughausgasse',
-    'zeugite',
-    'zeugites',
-    'zeugma-test',
     'zeuthen',
-    'zeven',
-    'zevenaar',
-    'zevi',
-    'zevon',
-    'zevulun',
-    'zexel-gleason',
-    'zeylaniae',
-    'zeylonensis',
-    'zezeee',
-    'zf1',
-    'zfl',
-    'zghotra',
-    'zgorzelec',
-    'zhaab',
-    'zhako',
     'zhalgiras',
-    'zhalgiris',
-    'zhan',
-    'zhanggufeng',
-    'zhaoguo',
-    'zhara',
-    'zhd-732',
-    'zhdanovism',
-    'zhdanovite',
-    'zhelesnyakov',
-    'zhelev-inspired',
-    'zheleznovodsk',
-    'zheltovsky',
-    'zhelyev',
-    'zhenda',
-    'zhenechka',
     'zhenhuai',
-    'zhenjiang',
-    'zhenqian',
-    'zhiang',
-    'zhigou',
-    'zhisheng',
-    'zhixin',
-    'zhizn',
-    'zhizn\'',
-    'zhl12',
-    'zhmerinka',
-    'zho',
-    'zhongda',
-    'zhongxi',
-    'zhongxian',
-    'zhovtnevy',
     'zhowwee',
-    'zhuangzhuang',
-    'zhubin',
-    'zhukovskii',
-    'zhuravleva',
-    'zhurinsgeye',
-    'ziad',
-    'ziani',
-    'ziaprime',
-    'ziawalla/paediatrician',
-    'zibado',
-    'zibello',
-    'zich',
-    'ziderman',
-    'ziebele',
-    'ziederman',
     'ziedonis',
-    'ziegel',
-    'ziegelbrucke',
-    'ziegler-natta',
-    'ziehl-nielsen',
-    'zielitz',
-    'zielo',
-    'zielona',
-    'zielono-piwne',
-    'zieman',
-    'ziemann',
-    'ziemski',
-    'zienciewicz',
-    'ziens',
-    'ziering',
-    'zietz',
     'zieve',
-    'zif/268',
-    'zig/zag',
-    'ziganiodes',
-    'zigaretten',
-    'ziggerat',
-    'zigging',
-    'zighen',
-    'zighout',
-    'ziglio',
-    'zigmas',
-    'zij',
-    'zikim',
-    'zikmund',
-    'zildjian',
-    'zileuton',
     'zilker',
-    'zilla',
-    'zillebeke',
-    'zilles',
-    'zilliachas',
-    'zilliacus',
-    'zillionaire',
-    'zillur',
-    'zils',
-    'zimbabwe.',
-    'zimbabwe/south',
-    'zimbardo',
-    'zimbra',
-    'zimet',
-    'zimin',
-    'zimmcor',
     'zimmeck',
-    'zimmer-frame',
-    'zimmer-framed',
-    'zimmered',
-    'zimmerleuten',
-    'zimmermans',
-    'zimmerwald',
-    'zimmetri',
-    'zimpfer',
-    'zimring',
-    'zimulator',
-    'zinaad',
-    'zinalco',
-    'zinc&mdash',
-    'zinc&rehy;plated',
-    'zinc-and-castor-oil',
     'zinc-chloride',
-    'zinc-covered',
-    'zinc-finger-dna',
-    'zinc-free',
-    'zinc-rich',
-    'zinc-silicoborate',
-    'zinc-silicoborates',
-    'zinc-tub',
-    'zinc/chrome/nickel',
-    'zinc/copper',
-    'zincbar',
-    'zincirli',
-    'zincon',
-    'zincs',
-    'zindabad',
-    'zindel',
     'zinetti',
-    'zinfandel',
-    'zingara',
-    'zingarelli',
-    'zingaro',
-    'zingerone',
-    'zingi',
-    'zingi-tu\'ii',
-    'zinginess',
-    'zings',
-    'zini',
-    'zink',
-    'zinker',
-    'zinkus',
-    'zinnat',
-    'zinneman',
     'zinnemann',
-    'zinnes',
-    'zinni',
-    'zinnon',
-    'zinsser',
-    'zintelis',
-    'zinyama',
-    'ziolkowski',
-    'zionism-is-racism',
-    'zionistic',
-    'zip-a-dee-doo-dah',
-    'zip-and-link',
-    'zip-bcl-2',
-    'zip-fastener',
-    'zip-front',
-    'zip-fronted',
     'zip-lock',
-    'zip1',
-    'zipaquiva',
-    'zipfos',
-    'ziphiidae',
-    'zipjun',
-    'ziploc',
-    'zipora',
-    'zipper-crazed',
-    'zipper-dependent',
-    'zipper-linked',
-    'zippier',
-    'zippily',
-    'zippo-zappo',
-    'zippos',
-    'zippy/techno-pagan',
     'zipreezed',
-    'zipreezingly',
-    'zipse',
-    'zipup',
-    'zipursky',
-    'zir-el-haaq',
-    'zirc',
-    'zirconia',
-    'zirconium-95',
-    'zirconolite',
-    'zircorium',
-    'zirgana',
-    'zirkle',
-    'zisco',
-    'zisman',
-    'zisong',
     'zit-zeet-zeet',
-    'zitburst',
-    'zitel',
-    'zitella',
-    'zitelle',
-    'zithulele',
-    'zitnay/us',
-    'zitpoppin\'',
-    'zitronen-schuttler',
-    'zits',
-    'zitz',
-    'ziukas',
-    'ziv',
-    'ziva',
-    'zivier',
-    'zivnostenska',
     'zivojinovic',
-    'ziyu',
-    'ziyuan',
-    'zizkov',
-    'zizz',
-    'zizzed',
-    'zizzle',
-    'zjednoczenie',
-    'zk',
-    'zk-caf',
-    'zk-cvg',
-    'zk-dfc',
-    'zk-hea',
-    'zk-registered',
-    'zkharevich',
-    'zl300,000',
     'zl632,000',
-    'zlat&aacute',
-    'zlatoust',
-    'zlaughter',
-    'zlocha',
-    'zloczov',
-    'zloof',
-    'zloties',
-    'zloty&mdash;7,000,000',
-    'zloty&mdash;prevented',
-    'zmago',
-    'zmayevska',
-    'zmelik',
-    'zmud',
-    'zn-cu-pb',
-    'zn-fingers',
     'zn-pb-ba',
-    'zn/cu',
-    'znaimer',
-    'znamensk',
-    'zncl',
-    'znn',
-    'zns',
-    'zo&amp;sup2',
-    'zo&euml;fairbairns',
-    'zo&ouml;nomia',
-    'zoabi',
-    'zoarcidae',
-    'zobi',
-    'zobias',
-    'zobisch',
-    'zochonis',
     'zoe/3',
-    'zoeftig',
-    'zoetropes',
-    'zofia',
-    'zogaj',
-    'zogmolia',
-    'zohab',
-    'zohair',
-    'zoheir',
-    'zohreh',
-    'zoidal',
-    'zoie',
-    'zoilo',
-    'zok',
-    'zoki',
-    'zoklovsky',
     'zol',
-    'zolas',
-    'zoler',
-    'zolla-lieberman',
-    'zolotaya',
-    'zolotow',
-    'zolotyie',
-    'zolt',
-    'zom',
-    'zombeck',
-    'zombie-clerk',
-    'zombie-ish',
-    'zombieness',
-    'zombify',
-    'zomboids',
-    'zombor',
     'zome',
-    'zomepirac',
-    'zomgqashiyo',
-    'zommerfest',
-    'zomo',
-    'zon-o-phone',
-    'zon.',
-    'zonale',
-    'zonality',
-    'zonally-averaged',
-    'zonderan',
-    'zondor',
-    'zone-bit',
-    'zone-dispelling',
-    'zone.',
-    'zone=sea',
     'zoned-out',
-    'zonensis',
-    'zoner',
-    'zones.but',
-    'zones=42',
-    'zongchao',
-    'zongtang',
-    'zonguldak',
-    'zonka',
-    'zonked-out',
-    'zonkered',
-    'zonkers',
-    'zonking',
-    'zonnie',
-    'zono',
-    'zonulae',
     'zonzinski',
-    'zoo\'med',
-    'zoo-blot',
-    'zoo-geographical',
-    'zoo-keepers',
-    'zoo-man',
-    'zoo-owned',
-    'zoo-plankton',
-    'zoo.',
-    'zooblot',
-    'zoogeography',
-    'zoogony',
-    'zool',
-    'zooligists',
-    'zoologia',
-    'zoologica',
     'zoologischer',
-    'zoolympics',
-    'zoom-crash',
-    'zoom-hoom-boom',
-    'zoom-hoom-hoom',
-    'zoom-in',
-    'zoom-lensed',
-    'zoom-lenses',
-    'zoom-out',
-    'zoomed-out',
-    'zoomers',
-    'zoomings',
-    'zoomsters',
-    'zoon',
-    'zoonosis',
-    'zoons',
     'zoooom',
-    'zooper-blast',
-    'zoophile',
-    'zoophycos',
-    'zoopy',
-    'zooshing',
-    'zoot-suited',
-    'zootily',
-    'zootomy',
-    'zootsuits',
-    'zooyaaaa-yaa-yaa',
-    'zophar',
-    'zoraya',
-    'zorgati',
-    'zorgiebel',
-    'zorig',
     'zorilla',
-    'zorlu',
-    'zorndorf',
-    'zoro',
-    'zoroastres',
-    'zorrilla',
-    'zorry',
-    'zorzi.',
-    'zos-terry-foe-lee-a',
-    'zoscales',
-    'zose',
-    'zosen',
-    'zosim.',
-    'zossen-wunsdorf',
-    'zosterifolia',
-    'zote',
     'zotin',
-    'zotkin',
-    'zotov',
-    'zotti',
-    'zotto',
-    'zottola',
-    'zou-western',
-    'zoubaroff',
-    'zoubedi',
-    'zouerate',
-    'zoug',
-    'zouk',
-    'zoukoenig',
-    'zoumangui',
-    'zoumanigui',
-    'zoumri',
     'zound',
-    'zoute',
-    'zouzay',
-    'zowina',
-    'zoy',
-    'zoz',
-    'zp1043/airport.let',
-    'zp1043/almbank1.doc',
-    'zp1043/almbank2.doc',
-    'zp1043/applemac.let',
-    'zp1043/bairdrd.let',
-    'zp1043/bank.let',
-    'zp1043/barnpa1.doc',
-    'zp1043/barrier2.doc',
-    'zp1043/barriers.let',
-    'zp1043/bikwksch.doc',
     'zp1043/bolero93.doc',
-    'zp1043/burnscha.doc',
-    'zp1043/bwbmcbur.doc',
-    'zp1043/bwbstir2.doc',
-    'zp1043/bwbstirl.doc',
-    'zp1043/bwdoc.let',
-    'zp1043/c&amp;bfeb.let',
-    'zp1043/canada93.doc',
-    'zp1043/canalnew.doc',
-    'zp1043/centralr.let',
-    'zp1043/clothing.let',
-    'zp1043/comchal2.doc',
-    'zp1043/commchal.doc',
-    'zp1043/cprog.doc',
-    'zp1043/ctcaffil.doc',
-    'zp1043/ctcnewsl.doc',
     'zp1043/cyclbarr.doc',
-    'zp1043/dlane92.let',
-    'zp1043/drewmoy.let',
-    'zp1043/eigspons.doc',
-    'zp1043/eldcpla.let',
-    'zp1043/etaspons.doc',
-    'zp1043/forests.let',
-    'zp1043/forsyth1.let',
-    'zp1043/forsyth2.let',
-    'zp1043/frphon.doc',
-    'zp1043/greenway.let',
-    'zp1043/harlow.let',
-    'zp1043/histscot.doc',
-    'zp1043/holyrd1.let',
-    'zp1043/howard1.let',
-    'zp1043/inroads.doc',
     'zp1043/jgcpath.let',
-    'zp1043/km152.doc',
-    'zp1043/leigh1.let',
-    'zp1043/leigh2.let',
-    'zp1043/lgreorg.let',
-    'zp1043/lochshot.doc',
-    'zp1043/locplan.doc',
-    'zp1043/magnuss.doc',
-    'zp1043/mcgregr1.let',
-    'zp1043/mtbcode.doc',
-    'zp1043/nfcspons.doc',
-    'zp1043/nzcirc1.doc',
-    'zp1043/nztrip91.doc',
-    'zp1043/pacnew.let',
-    'zp1043/pno1.let',
-    'zp1043/pno2.let',
     'zp1043/poveylet.doc',
-    'zp1043/railchg.doc',
-    'zp1043/railchgs.doc',
-    'zp1043/railchmp.doc',
-    'zp1043/railpriv.doc',
-    'zp1043/railpriv.let',
-    'zp1043/ramblerd.let',
-    'zp1043/rifkecon.let',
-    'zp1043/rifkefa.let',
-    'zp1043/rosebery.let',
-    'zp1043/saftravs.let',
-    'zp1043/sapcrep.doc',
-    'zp1043/scotr593.doc',
-    'zp1043/snhappl.doc',
-    'zp1043/snhrep.let',
-    'zp1043/spv1.doc',
     'zp1043/ssasub.doc',
-    'zp1043/towpavol.doc',
-    'zp1043/tweedcy2.let',
-    'zp1043/tweedway.doc',
-    'zp1043/wldc747.doc',
-    'zp1043/woodhres.let',
-    'zp175',
-    'zp176',
-    'zp177',
-    'zp179',
-    'zp180',
-    'zp181',
-    'zp182',
-    'zp183',
-    'zp184',
-    'zp185',
     'zp186',
-    'zp187',
-    'zp188',
-    'zp189',
-    'zp190',
-    'zp191',
-    'zp250',
-    'zp251',
-    'zp252',
-    'zp253',
-    'zp254',
-    'zp255',
-    'zp256',
-    'zp259',
-    'zp260',
-    'zp269',
     'zp270',
-    'zp271',
-    'zp272',
-    'zp273',
-    'zp274',
-    'zp275',
-    'zp276',
-    'zp280',
-    'zp281',
-    'zp282',
-    'zp283',
-    'zp286',
-    'zp287',
-    'zp288',
-    'zp289',
-    'zp290',
     'zp291',
-    'zp293',
-    'zp300',
-    'zp301',
-    'zp302',
-    'zp304',
-    'zp305',
-    'zp306',
-    'zp308',
-    'zp310',
-    'zp311',
-    'zp312',
-    'zp313',
-    'zp314',
-    'zp315',
-    'zp316',
     'zp317',
-    'zp318',
-    'zp319',
-    'zp322',
-    'zpal',
-    'zpals',
-    'zpt',
-    'zr',
-    'zr-1',
-    'zr-rated',
-    'zr1',
-    'zr16',
-    'zrazy',
-    'zrinski',
-    'zro',
-    'zro2',
     'zruby',
-    'zs&aacute;mb&eacute;k',
-    'zs&ndash;dhx',
-    'zs-afa',
-    'zs-cai',
-    'zs-ddv',
-    'zs-dhx',
-    'zs-diw',
-    'zs-drj',
-    'zs-gpl',
-    'zs-iwl',
-    'zs-jmp',
-    'zs-kei',
-    'zs-lvr',
-    'zs-mrr',
-    'zs-mrs',
     'zs-mru',
-    'zs-mte',
-    'zsabo',
-    'zsays',
-    'zsg',
-    'zsigimondy',
-    'zsigmondy',
-    'zsolt',
-    'zsu-23',
-    'zsupan',
-    'zsuzsanna',
-    'zt',
-    'zt891',
-    'ztripped',
-    'zu&bsol;3rich',
-    'zu&ntilde;o',
     'zuama',
-    'zuang',
-    'zuassantneuf',
-    'zuazo',
-    'zubaida',
-    'zubaidi',
-    'zubeida',
-    'zubenalgubi',
-    'zubenelchemale',
-    'zubenelgenubi',
-    'zuber',
-    'zucarrelli',
-    'zucche',
-    'zucchero',
-    'zucchini',
-    'zucchini-layered',
     'zucconi',
-    'zuchetta',
-    'zuchtrennen',
-    'zucker-franklin',
-    'zudilovo',
-    'zuercher',
-    'zugspitzbahn',
-    'zugspitzkamm',
-    'zugzwang',
-    'zugzwanged',
-    'zuhr',
-    'zuid&mdash;hollandse',
-    'zuiderpershuis',
-    'zuiderterras',
-    'zuidinga',
-    'zuiz',
     'zukhatarian',
-    'zuki',
-    'zukie',
-    'zukin',
-    'zuko',
-    'zukovsky',
-    'zukunft-buch',
-    'zuky',
-    'zul',
-    'zule',
-    'zuleeg',
-    'zulema',
-    'zulfikhar',
-    'zulia',
-    'zulichem',
-    'zullum',
     'zulu-dominated',
-    'zulu-orientated',
-    'zulu-sierra',
-    'zulu-speaking',
-    'zuluc',
-    'zuma',
-    'zumas',
-    'zumaya',
-    'zumbado',
-    'zumel',
-    'zummat',
-    'zumo',
-    'zumthor',
-    'zumtobel',
-    'zunarec',
-    'zunderdorp',
     'zundert',
-    'zungeru',
-    'zuniga',
-    'zunoga',
-    'zupan',
-    'zupko',
-    'zuppi',
-    'zuppinger',
-    'zur&uuml;cktreten',
-    'zuraiq',
-    'zuravin',
-    'zurbak&aacute;n',
-    'zurbano',
-    'zurich-based',
-    'zurich-bound',
-    'zurichberg',
     'zurini',
-    'zurli',
-    'zurs',
-    'zuruck',
-    'zusa',
-    'zusammenbruch',
-    'zusammenhang',
-    'zush',
-    'zustu',
-    'zut',
-    'zuwarah',
-    'zuyev',
-    'zuylestein',
-    'zuzana',
-    'zuzulu',
-    'zva\'i',
     'zvderm',
-    'zvegintzov',
-    'zvei',
-    'zvev',
-    'zvezda',
-    'zvezdochotov',
-    'zviadists',
-    'zvlad',
-    'zvn&ndash;8',
-    'zvogbo',
-    'zvs',
-    'zvyzhen',
-    'zw',
-    'zwa',
-    'zwaag',
-    'zwaardemaker',
     'zwaga',
-    'zwai',
-    'zwangserziehung',
-    'zwarte',
-    'zwe',
-    'zweck',
-    'zweckrationalit&auml;t',
-    'zwedru',
-    'zweierverbindung',
-    'zweiten',
-    'zwelethini',
-    'zwelfer',
-    'zwentendorf',
-    'zwettl',
-    'zwi',
-    'zwi-hamussit',
     'zwickel',
-    'zwijn',
-    'zwillbrocker',
-    'zwinglian',
-    'zwischenbetrachtungen',
-    'zwo',
-    'zwyn',
-    'zwynenburg',
-    'zx1020',
-    'zx80',
-    'zxe4',
-    'zxr',
-    'zxr750s',
-    'zxw',
-    'zy',
-    'zycad',
     'zych',
-    'zycie',
-    'zyder',
-    'zydi',
-    'zygomaxillary',
-    'zygomycetes',
-    'zygomycotina',
-    'zygophyllum',
-    'zygosity',
-    'zygotene',
-    'zygotic',
-    'zyklon',
-    'zyklon-b',
-    'zylenes',
-    'zylin',
-    'zym',
     'zymogens',
-    'zymotic',
-    'zymul',
-    'zysman',
-    'zytko',
-    'zytkow',
-    'zyw',
-    'zyxuqk',
-    'zz-r1100',
-    'zz-r6oo',
-    'zzaperoonies',
-    'zzb',
-    'zzobituary',
-    'zzr1100',
-    'zzt-oop',
-    'zzyzx',
     'zzzsssss-on',
-    'zzzz',
-    'zzzzooooo',
-    'zzzzz',
-    'zzzzzing',
-    'zzzzzzzzzz',
-    'zzzzzzzzzzzzzzzzzzzzzzzz',
+)
+
+blocks_48 = (
+    '!+ccaron;rnja"/ommat;datevalue(#pmt!0eacute;crevisses($tait!,lacute;eonie!1mdash;-relaxation\'#119\'!9\'%about((nd&mdash(\'ssuming\'*comprising\'$even\'%firms',
+    '\'#how\'$much\'%state\'&taking\')was&mdash(#hen!(ndash;11(!2(!3(!6\'#and(!t\'!f\'$here\'"it',
+    '!(ouml;old&(sterlund!(rehy;and"#sqb!+scaron;imek(%tivan!/verbar;x&verbar!\'yen;1.3&!4&"65%"80 #\'60!$90\'s!&alfway"#rsh',
+    '""ye!%cross!&earin\'#$then"%lping"$mpty"(reabouts!&gainst!%hinch!%idin\'""gh!#mid!$nice!"o\'"$llow',
+    '##in\'##ped$"it!&phones!$sand"#hut"#uch!\'usbands (-&frac12!#(6)!"a-""ll""ne!\'binding"(leomycin',
+    '!$cher!$debt#(pendence"%riven!#ene""se!$form!%human!$much!$ness!!o""ld""se!\'problem!\'reading',
+    '"!u!\'starred!\'treated!$wing"$orth!$year""un!!z $.010 \'0&ndash!%-4-4t"$6-0s$"2t!..1ml-glutamate"$6-kb',
+    '"#8mm!,71&ndash;835!"ba /1&amp;frac12;oz")ndash;2ft)"lb!0,000&ndash;1,500"%300mw!$-ltr"%metre"!p!$.9kg!,0&ndash;15cm+"km"&-digit',
+    '#%tonne"(.66-fold")0&ndash;9#&-rupee$)years-old#&0-word$!d$"mm%!w#!f"%7-run",am&ndash;6pm$$-1pm""gb"*pter-p11.2',
+    '!(1,000rpm"\'-a-side#$band#$goal#$inch#"kg"&0-acre$&degree$#run#"0s"&2-mile$$page"#90s#!p",am&ndash;5pm',
+    '#$goal#%match#&nation#%ounce#&player#&runner#%under($-par"&0-acre$$line#!f"&5-year")ft-square",log2&ndash;8!%3-amp',
+    '#&volume"(1-member"$4-bp"(8-member!&4-song$$tone&#rey#$week"#.4p"&0-acre$&member"&2-yard!,5&ndash;20cm"\'-storey#)under-par',
+    '$$acre"(64&ndash#!s!%6-bag#\'pounder#$room#%sided"(0-member"#th-!\'7&mdash""\'s"&,000ft"#.8p!\'8&mdash"%-hold',
+    '"#.9p"#90-!&9-acre#%month#%point#%turbo"&0-mile#"1-"+14&ndash;25#*8&ndash;22"*30&ndash;3#)5&ndash;7"+48&ndash;52"*50&ndash;3")60s-built',
+    '"-77&ndash;1979$!-"\'8&mdash#"0-#"2-#"5-#*8&ndash\'89"0th-century-style!"ad!"ba!&pm-6pm"!s!"rs ,2&ndash&half\',;2&frac12;ft',
+    '(#4ft(*6&ndash;4t!%-6-4t"$axis"$band#&edroom"%level"$mile"%night"&stroke!\'.2-fold"&5-year"#65m""8e!,0&ndash;25cm',
+    '"%-date##gun#)kilometre#&person#$seat\'"er#&volume#$week"%0-ton$$yard#"0d#"mw!*1&ndash;35"&-stone""2s',
+    '#$inch#%point"$5-bp""in!&3-mile#$page#&stitch!,4&ndash;hour"$-bed#(exposure#%month#%piece$&ounder#$seat#$week',
+    '!\'5-gauge$#oal#&person##way"#.2p"&0-watt##0mm"(year-old!"6s!\'7-track!)8&ndash;1"%-week"&0-page!&9-goal"(year-old',
+    '!"jp 73&frac12&ndash;1&frac12"+ndash;4,000!\'\'-sugar!&-based"$gram"%level"!m!%.05pm"&5-year#"kg!,0&ndash;45cm"$-cwt#&footer#$goal',
+    '#%piece$$oint#$seat#$watt#&yarder"%0-ton"-90&ndash;600j""hp!%1-man""in!(2-county#%track#)years-old!\'3-month#)years-old',
+    '")020-based"(1-member"%50-mp""8s"$secs!&5-mile"&0-mile!\'6-fight#%piece#%track"&0-line!(8-member!$93cm!(d-design!"jr',
+    ' +4&ndash;6oz!*-compliant"$hour""kg"3methylumbelliferone"$page!$.15p"\'2-litre"+3-compliant!"0-##bit#"lb"(0-seater""in!"1-',
+    '"(year-old!"5-##day#$foot"&0-page!&6-date!*8&ndash;96"%-user"&6dx-50#%sx-20&"33"$secs!"pe"!p"!s',
+    '!*\'-endlabel#"gg!&-metre!\'.5-mile""9p!,0&ndash;70kb"%-acre#$hour##man$!s".0&ndash;600rpm#%-word$$yard#&0-word""s.',
+    '#$year"+79&ndash;ii"$8-bp!\'25-line!&4-inch#$page!)5&ndash;1"$-bed#&person#$year!"6-#$inch"&0-mile""no!\'8-match',
+    '""no!"cs!(q35-qter!&s-rrna (6-a-side"$hour"(keto-pgf"%metre"$page"$volt!$.35p")5&ndash;7"#6lb"\'7-litre!,0&ndash;90cm',
+    '"&-match##ton"(0-member$$plus""5s""in!(2-member#$page#$year!#33p!"4-##cpu#&member!&7-mile#$year',
+    '#$page"$0-bp#(20-based"!f!#9in!"hq!"lw ,7&ndash;10pm!1-aminoactinomycin"$foot"%night"%point!$.31p"#85p!&0-line',
+    '!#10p"!s!&2-page#$seat$%torey!(3-member"!m"!s!)5year-old!#67s!%77-3a!#98d &8-foot"$yard!#.4p',
+    '#%litre#%metre""mw!%1-run#$seat!&2-year""5d"!f!+8&mdash;not")100-based""mm \'9-amino"$foot"$inch"$to-5',
+    '!).30am-4pm!&0-seat$$tore!%1-\'92!&6-page"#0mp!\'99-year!*th-century !: -a&eacute;rien"(verbar;b!"\'r!%-320s#!7""40',
+    '"#868"#b-c"%c-d-e#%omin\'"*dhywar-lur""er"\'glitter"#p-u#&ay-gee"$sv40"\'twinkle!".o!!0!#143!#355',
+    '!"56!#604!(_capella"&propos!4aaaaaaaaaahhhhhhhhhh##hed$!h"&benraa""ce#!h$$ener""ha#"ed"!r!2b&eacute;ch&eacute',
+    '"!-"#aar#"sh"\'bacchio$!t#!i$"ng#"le"$cdef"$dabs#\'elkebir$&sellam#!o#\'ulrahim$%malik',
+    '$#ina#)rcrombies#$sses#"ts"\'hyankar""id"$laut#-e&rehy;bodied$+-bodiedness"\'ohalima#\'lhassan#!n$%dance#-rtion-related##ve\'',
+    '#"us"#sat#"it##olu#%tains$\'ractors%$user"$ukar$!o#$sage!(cademica#&nthiza&(ocephala&$urus#\'tenango',
+    '#!i$.dent-proneness(%ally\'#)ommodator%&odated%#pts$-rdion-pleated#!u$&filter$$trap##val""da"-e-in-the-hole#%hnese#,tylhydrolase',
+    '""gh"$hadh$\'emenian#%ensee$!y##in\'%#ese#!t$\'erlonie"#ibs#(d-pepsin$%house##ego"!j"&kroyd\'',
+    '""la"$mnpv""ol"#pcs")riflavine#\'omyrmex$$pora"0t-as-possibility#"el$"on#)ion-based$(ve-birth#)or-singer%"ly##ron',
+    '"&uleate!"d\'"#(b)""ab#!l#\'mantane$%ishin#!p#"re#!t""cm"#dai#$bits#$erly#%isons',
+    '#-ress&mdash;mr\'%-book#"ub$$cted#$yman""ea#"dy#&lboden$"le$)sheiliger#%niken##ryn"$ieux#\'rondack""ja',
+    '$-stable-height*!s"\'libbing"&mixing%%tures""on$$nino"$shel#&p-2101"-ult-supported%%erant"$vanc#$entu\'*re-seeking$$rsus',
+    '"!w#$atch"$yebo!$ecoc"$dile"&gypius%$tius"$olic"#rgo#"ie#$ogen$)modelling$&nautic$!s#!s',
+    '"\'stivate"%terna\'!m#%hiops##ius!%fairs#!p#(ssanieff"&fecter$"kt$!r#!o$$rced#$reca""ic',
+    '$!x##ood"+rican-style\'$ised(#zed\'$ness#(olistics"#shr"*ter-market&\'pannage&)treatment%#all%%words!+ga&ntilde;a#$isnt',
+    '"%cl(s)"$dere""e\'#*-incidence$*of-consent#$nces#%ratum")grandised"!n#%ellus#!i"\'rarians#!e$1ement&lsqb;s&rsqb)\'-seeker',
+    '$(cuitural"#uri!$h-64"%ahaha"$i-ka#"er#(ms&amacr"#orn!#icc#"pa"$dara#1es-m&eacute;moire#"oc$!o"$glet',
+    '""im"#les##ish"%mtrak""n\'##-76##sty"*r&ndash;14*&braked#&-crash&"ew$*filtration%%light$&gunner$\'hostess',
+    '$*suspension$$taxi%%ester#&bourne#!c#%light#&mailed#$note#%pumps#!t"#ssf""th#"uc!$jfan"#man',
+    '"\'ungilak!$kaky#!m#!n#\'rnanian#"sh""en$#ham#!r$)edolu-ale"*fm-renewal"!h#%eloos"#ing"!m',
+    '""ti"!u#\'ndzadeh"%wapim"#yol!(l-dhouri#%faqir%#ssi#$harb$%ulwah#%jihad#%kabir%$raki#\'mahayni#%nidaa',
+    '#\'saadoun%$lami%"ud$$haer#\'thawrah#&watani#$yawm"(abastine##cio##nya#$rums$!y##sia##una#$wsat',
+    '#.anian-speaking$!s#%erney%!o&%bello%$tosi&"us#&icilla$#ger#%ridge#!s#"us")caligenes#"ee##hin',
+    '#!m#.ohol-dependent$"ol"$dine%!i##yss"$ecko#"in#%manni&!s##sia$&sandri##uad$!s#(xopoulos',
+    '$!s#&onsine".ga-lichen-moss$"te#%erien""ib#$doro#\'smaceae##wal"+kali-silica&&nising$$nals#"en#"on"\'l&mdash',
+    '#\'-change%%olour&&ncrete\'(trolling$$disc%)ominating$)enclosing$(mahogany$$news%\'igerian$*prevailing%&ullman$#run$$seam%&wessex',
+    '%%imber#"af$%manda%!s$&nfauld#$card#)egorising%$rini&"os$#nia$%rford$%stree#&odynia#%sport#*t-chaorain',
+    '"&manach$(zjuvelir#+er&iacute;a##ira#$onte$!x#%quist##sot"!n""oa#&neftis$"zo#$xite"&paslan#\'e-adria',
+    '"$rady##eay"%satia"#taf$&mirano$%r-boy%"ed#%ecean$%rtext##ham$$orpe$+usserianism$+ydubandalag#"in$!s',
+    '$\'thermal#$ofts##weg"#uco#"im!$m-am""am#$naty$#dus$!g#"ri%!n##tes%(ur-built$"ol',
+    '&#ica"$bion$$tron#$oyna##ron%$sden&$iana$!y#\'ulating"#cit"%edian$!o#"no#\'r-indie$&icains',
+    ')%iraqi)$type(#ist&#ium%"go"#far#%m-3fm""ic$"is$!k$"on#%dines##nah$"o-%)acyl-stem',
+    '#)ti&eacute"!k"!n#%esics%%tying")odiaquine#$rosi##s\'n#$ther#&ureulx"$pair#)hiophiura%$urid##ico#"ro',
+    '#%ullah"#ser#(telkring$#ral""ul$#ree$"ya#-notransferase"!x"$ylum"&zallag!(n-najjab"+afilaroides#\'glyptas#%kreon',
+    '$&ogized$%ytics#$mbra#&neosis#$phes$%lasma#0rcho-syndicalism$$kali#%stase\'!i"#cas##ell#\'hisaurs$&or-leg#$yent',
+    '$$gari&%vorum$!l$"me$\'rsonian#\'f-style##hun#$iamo#"le#!p#&ricite$$osch$!y"*encephalic"!f',
+    '#\'el-dust%*ic-looking\'"us&"no&$ques%!n%#sey$"ra$&wandte#$lica$)o-african&+continental&(european&(prussian%%phobe',
+    '#)st-filled%#rom"#iel#"ff#!m$(al-borne\'$skin%"ux$!i"#kaa#*hsenpaamun#&le-tap%&biters )womblings#$dale',
+    '$\'n&mdash+);defiance&)rehy;folk%&\'s-lib(-magazine-type(,relationship)#oom\'(/lesbian%#-14&\'centred\'*ontrolling&)dominated&$feel\'"un&*identified',
+    '&#led&"of&-plus-property\'$ower&*respecting\'"un&\'sisters%".3&"l8&#the%\'/gender\'$irls&$home&#ran&$some',
+    '()fe/mother%#aid%#ist%$talk%$ws28\'"38##man$\'erstone#"na#!p$$ence#"yn"3n\'t-be-shrugged-off&$they#%-lost',
+    '$#ton#"am#%dayen$*er-golfers\'&rabbis\'&struck\'&worker-!s&#bar\'#oom)!t(!x&$drug&#ed-\'!r',
+    '(!s&$fuel(*l/terrible)+ly-detailed,%named,(packaged&$girl\'\'raduate&&ingly.&%land.\'"ey\'#ing\'#oaf&#man\'$odel',
+    '&$some\'%plash&$weed\'$orld$$jina$"re%#ful%"os&*usly-named($ness$#yfu#"em$#rsh##for#\'g-staal',
+    '$#tun#!k$"ey$#ily$(y-gobbed#!m#"na%$cott#"os#"se$"on##ter#*waldremere"#o38$!9',
+    '$"hh#.d&rehy;carving*%lands*(panelled*$wose$!\'%"un$%-aged&)nd-fabric*#oam)&thatch\'%emone,!s&"xe%$bark',
+    '&#ugs\'$rned%(carvings&#hip)!s&#lad&%utter%%edges&&ncased%%faced&$ibre\'$ller\'"re)!d&$lesh',
+    '&$rame*!d\'"ee%&jagged%$land&#ike&%ocked%)machining%%notes&%ymphs%"or%(pastures\'"th&$lank($stic',
+    '\'$wder&\'roducts%\'rangers&#ich\'"de%&smiths\'$oked&%pirit+!s\'$rite&&tained*#ing\'&ealers\'%orage(#ves',
+    '%)to-liquid($wood&&rimmed&%urner%,warbler-like&#ind($ters&#ool\'"rm)"ed*"rs%$yard$$.and%$they$&/bruce',
+    '(,ucestershire%)historian%%pilot&&laster&%olice&+rincipal/st%%royal%\'student%\'tornado$%banks&"rf&#sed%+ine-stained%#one(!s',
+    '&#und%$rain&$ooke%"um&"ne&,rn-bamberger(!e\'%ytype$\'carvin\'&"se%,hester-built+!.&&ipping&*opper-like+!s',
+    '%-ock/neighbour&"ne&.te/oxfordshire&#urt$!d%%idden$!e%$d-in\'&wigged%-n&rehy;hulled&\'-backed(%eamed)$dded(&locked\'$clad',
+    '\'&headed\'#leg*#ged(&ooking\'(panelled\'\'shafted($ided(#lat+#ted($oled\'\'tongued)$pped\'&walled+!s(&heeled',
+    '&!s%!r%#son%!y$#fin\'%/cars\'&ishing%$lour%(ord/anti)$cpre)*lancashire%$rame)!d%$ull.$,gate/headway',
+    '(!s%#lue%%range&#een&#ove%#ust$*ham/milton&%unter&!y%,ead-faulkner&!n&!y%#orn\'"se&+use-retford',
+    '%&ngs/aa$#jew$+land-forest)%style(\'/forest("ed%"er&"ss%,ice-breeding%#ock&"ts$\'manston&$ster%$ills$*nesborough',
+    '(!e&$wton%#ook$+pecker-like&#rry%*igeon-like&#les$%redon%%ouffe$*s-inspired%,/aeromedical&&brewer&&fellow&\'gardens&%owner',
+    '%$eats\'#ves&"tt%$ford%$hots%"ia%$moor%*tock-based)%esque\'!n\'"rk\'#ves\'!w&$rete\'"ip',
+    '%"on\'"es$#war\'*d/assessor)$clic)(investor)#raf(#ian%#iss%*ood/driver&#rk.\'*m-infested)\'killing(%/damp&#ses',
+    '%(-scented\'$tyle%#att%$cock%!d#+f-woof-woof$&ferton$$tahs%"er$!y#"gh$"ie$!s$!y#"ks',
+    '&%roker+!s%\'carding&\'hurches&#lad\'#oth&&ombing)!s%&dealer&%raper%+gatheringly%(merchant&"ix&%ohair%\'packers',
+    '%$shed&\'pinning%%trade%\'workers$".9$#/20%&angora%(cashmere&\'henille$#ams%"rd$\'bearing%%right&$oker$-cock/paradise',
+    '&$mber(#ing&"rd$#den%%redge$"ed%(n-draper&$gers$(f/boxing%%endon$,grove/farmer\'$wers$#ham$#ier$!l',
+    '&!m&"rd&$ston%&comber%(en-cloth(%robed\'&draper\'%mills&$rton%$iams&!e%(y-capped\'&hatted\'(jumpered\'(sounding',
+    '$#man\'//director/libra\'!s%"en$%nough$(oongabba%!s%$vers$%packs$$quay$*ridge/west$$sden%(ey-brown%%table\'%plers',
+    '&%horpe&#one$$tons$#vet$$wark%#ell%-orth-to-comet+#ype),s-to-b&amp;q#\'margama$!p#*nerf-\'like($like$"ky#"od',
+    '%)o-oooohhh&!h&*oooooooooo$"sh#$rerf$$keri%$inge$!y#%shing$$nams$/ter-like-oddity\'#ish\'!s$#ung%!p',
+    '$-on-under-edge&!s$.ton-under-edge\'#/nr(+oxfordshire$!y#&ziness$&le-cat"&p-airs$+bama-lammed##uld"*r&rehy;thy#!\'#&bali\'n#:cester/hereford/shropshire',
+    ')&shhire+\'ire.the#*d&mdash;we$"\'\'$%-1391&#485%,against-word%\'barrier\'#sed&#ite&%oards\'#oks&\'reaking*!s&!y',
+    '\'&rrying&&entred&&lotted&&overed&(runching%%drama%$ever%-for&rehy;word(,m-in-context)!s&(requency%$game&&rammar%(identity&*n-your-ear',
+    '-"ly%\'jellied&(udgement%\'lengths&$ures%(machines\'$kers\'!n&\'erchant\'&thinks&%ungus\'#sic%.or-phrase-type%\'parsing&+er-sentence',
+    '%\'reading\'&ferent\'+lation-word\'(petition%$seam\'#nse(&tences&\'pecific(&llings\'&inning&#tar\'\'ructure%$tags&)o-picture&\'umbling',
+    '%%which&#ord$$.com$&/image%&phrase$!1$!2$!5$%=list$$card%&lasses$"es$$face%%inder*!s',
+    '$#ier%"st$(lessness$$marc$#per\'!f(%ectly%#roc$$robe$(s&dollar%--as-strangers&"is&$like&0on-the&rehy;page,%-page',
+    '&"to%(/phrases&%roles&&second\'$igns%&:class%*=evalfield%#afe%%hence%%nakes%)tar/zsoft(!s%%wirls&)orthshire$$tags',
+    '$%wise+%#lse%$orth)!s%\'rapping&$iter#$gans$!h$!l##imi#*k&mdash;it+#the%\'ndash;g+%place%*rehy;bench',
+    '*%hours-#ses$\'(place)%"s)$&-alike&"nd&%round&*ssignments&,uthorisation%(battered&#ent&$ooks\'!x&$reak%$camp',
+    '&#oat\'(nditions(&nected\'%unter%#day&)iscipline%&effort&&ntered&*xperiences%$face&%illed\'!t&#olk&#ree\'-om-both-sides',
+    ')$ened%*in-process%&jacket%%leave\'%isure\'#vel&%oving%$mate%#net%(obsessed&#ver%$pace)!d(#ing&*erformance',
+    '&\'ractice\'(ocessing&)sychology%,relationship&/ider-cum-jockey&%ounds&#ule%)satisfied\'$ving&(hadowing($ring\',eet-auditing\'#ift&(ituation.!s',
+    '&&tained&&wollen%%teams\'%sting&#hat\'%rough&#ime&"o-((contract(%rules\'"ps%(watchers&#ear)!y(&thered',
+    '&$omen\'#rld$!.%"48%!6%!i&"an%"ps$!/%&career&"l.%(economic&*ducational&)mployment&\'xercise',
+    '%)geriatric&!p%$have%$join%&mental%*occupation%$rate&)etirement&&outine%(services%/talents/skills/$!_%"as%"in%(together',
+    '$$bays%$oats&#und$%camps&"rd%&lothes$$desk$#ed\'&$-not\'"on\'\'through\'"up%#ers%"r\'&#(s)',
+    '+(ultation*%victs\'&farmer\'.intelligentsia\'\'managed\'%owned+%rship\'\'parkers(%riest-!s\'/revolutionaries\')selection&%/case(%lient\'&fellow',
+    '\'*management(&orning\'(national\'\'officer\'2waiters/waitresses&#ism&-participation&/s\'-compensation()interests\'(-provide($they)$otal\'#.32\')/managers(&prison',
+    '\'$_for$!f%#ile%#olk$$girl$$hous$!i%"nd&-g&mdash;class.%which(-rehy;language-\'through\'!\'\'+-alms-house(&class.',
+    '.+proletarian(#day+)/mortgage()from-home(%girls)$roup(\'holiday*#urs(\'in-area(2late-at-the-office)+evel-months)#ife($over($poor)\'rogress',
+    ')\'urfaces(*with-hands\'%.both\')/coaching(*discussion(+hyperactive((teaching\'!_\'"s.\'%tools%#tus$&lights%$oad\'(\'/demand$$man\'',
+    '\'(/liberal(*university%#ent$$over$$pack(!s&$pers&#rty%*lace-level%"ro\'$cess\'&gramme$#s\'.%$-car&#led',
+    '%(.richard%!/%#_in%!a%%earch&\'lection%(hop-club)\'gallery)&museum)%style)$type(,/information)&retail("s.&%yness',
+    '%0pace&dollar;disk)!.%0tation-on-a-chip,%style+\'/server++s:academics&#yle)!s%%worth%%ystem$%table%%opper%$wice$"up$/wear-as-fashion',
+    '%$oman$$zone#$laby%"nd$\'d&mdash+);designed,\'hungary,#the&.rehy;embracing+.record-holding+$wide%#(s)%*-affirming\'0s-we-perceive-it&$band',
+    '\'%urial&*cancelling\'\'hangers,!s\'&limate\')onquering)\'vulsion\'\'reation&(dazzling\'$eath("bt("ep(%fying(\'signers)\'troying',
+    '\'(irection\'\'ominant,$ting\'#uma&$echo\'"gg\'+ncompassing&&faiths(#med\'%igure\'/rom&rehy;within&(girdling&\'history&-in-the-making(\'cluding',
+    '&)knowledge*!n&$lead\'#ine&%night&"of\'"ld\'-rganisational&(patented\'\'ictures\'.remi&egrave;re&%rated\'(espected\'#ule&%scene',
+    '(7en-from-just-underneath($ries\'&hakers(&ifting\'#ize\'%layer\'&ociety\'%pider\'$tage(&oppers(#udy(#yle\'%upply\'&ystems&%third',
+    '\'(ravelled&&vision&#war)"-i*#one\'0elfare-enhancing\'\'ide-web("se\'(ondering%$.dat&$from&"it&#tim%)/european&(magazine',
+    '%!2%%:read*(+execute%#but%%class&#omm%"ed&#xpo%$hams%#ism%"li\'"er&(y-divine\'$wise%(renowned',
+    '&!.&#can("pe&%ieger&#pan%\'toolkit%)weariness%&y-wise$!e%"ys$$idge%%ngham\'#ton$+ock/surgeon$$wide',
+    '$+-and-sector%$dirt%%gears%\'haunted&#ole)!s&#unt%\'killing%#out%$poor%\'runners%%screw&$eeds&%haped&#ort',
+    '$"an$%casts$%eaten%(ll/video&"ow%!r$%holes$3inghall/oxfordshire\'#ton$&killer$(leighton$&screws%"ki$$wald%-ood-flavoured',
+    '$!e%%rsley$!t$"um#%onoff%&tschak$#pay#\'pington$&lesden$%swede#"ra%+ll-thompson$!e$!i%2ed/nervous/anxious',
+    '\'"ly%!s$"ld$$ries$"y\'%%-free&#gut&%sweat&$time%$less%$wart#!s$#aae$&brough$$dall',
+    '$&e-case&(for-wear%&:rspca%$_now%!l&!l%&ncroft$%field%#old$)hip-rites\'%fulls*$ness\'#ing$*ley-taylor$#nip',
+    '$"t\'%(-behaved&(equipped\'(xploited&&judged&\'managed&)offending%#ead&\'dopolis&!r%"on%!s#"te$$h-it&*the-effort',
+    '%$_out%!a%!e&%nbury&$rsee%!i&!e\'$s-in&)ly-titled&+ng/brighton($ton++&-evans%+lessness-to\'!y%$wile',
+    '$"ks$)leberries%!y"#seq#"ik#!k#(sisnmame%!t$$name#(tenholme"&t-nots$#wot#!a#&chered\')mercallit',
+    '$#out$$urst#!s$#-up#%t-urr$!a$%erton$$olen%1n-under&rehy;edge,5-edge/gloucestershire#!z"$u-ld#!d#9ghton-on-the-green/milton##ild',
+    '#!k#(ld&ndash+%;take%!\'&"ya%!-&"bc\')e-bowlers)\'fashion)\'leaders*#ove)&steamy\'!y&.you-believe-it%\'.become',
+    '&#run%&/could%#=be%#_no%"be\'%goods%#est%#ing%)n\'t/could\'!y&"ot%$ould%#s\'t%*youbelieve#!n',
+    '(%duced+$ible&\'licking&#raw&$site%)/dressing%#ed-($bird\'!.\'$9n/a\'&n/an/a&!r\'!s%&s_as_a#!s',
+    '%$ward#\'wermans##yld"(ven-reed&(together\'#ype##oka#"vy"%w-wow##ser&!s"#yka"!z#!a#\'encraft',
+    '#%niack!$p-90""bs"!j"$rost"!s#!a"!t"!w#"in!$q125"#244"!e"$ysey!(r&ouml;z',
+    '"!2#"50"!6"\'7296/21#%356/2#%458/2#%536/2"!9"$acks#!d#$fton##gby$$cast$+ge/hospital%!s',
+    '#$msby#!n$$gton$%itzky#\'p-round%%style#!s$!s$#tle#%thall%$mall$*ten/oxford##wby#%xhall#/y-on-windermere',
+    '%(lollipop$!i"%eakin$*th-layings$!y#,ck-salvaging\'#ite\'%trewn%#/if%)er\'s-yard#!e#\'kendike$#in\'#\'n-lewes$&bridge',
+    '&(ed-apart)"up&!y$#ish$)naissance$&sfield#$ssil%"le$\'t-plank%-lemania-super&(ing-bout)%worth%!s#$tch.&+ed&mdash;in',
+    '#%xford$$hill""fu"(ibenhall#%chtis#/edel-schatensen$"st#%ggler&$ings$*ht-shearer&)/campbell)%ptain()heltenham((learwell\')drinkwise',
+    '(\'uropean\'&former\'$head()ydraulics\'%local\')neighbour(*orthampton2%shire\'&police\'#raf\'\'spencer\'\'teacher)$nant&%house&"ii',
+    '&"on&$sons$*ley/thames#%ncing$$gin\'\'#gly%#ton%&worthy$(kle-brow(\'scarred\'$fest#)othosleys#/st&rehy;slapper,&pinner%)-breaking',
+    '&*calculator\'&ocking\'&utting&)exerciser&)generated&&length\'#ife&$memo\'&ounted&$rest*!s\'$ings\'(upturing&(slashers+#ing',
+    '\'&pinner-!s\',trengthening&%thick\'\'inkerer&\'watches\'#orn%&guards%#let%*watch-size&#ork#)t-charter%&server$)e&formula&(mdash;it',
+    '%\'-a-thon\'%ccess&0off/obsolescence\'!n(,ce-read-many&*permission&#tip&(your-own%!.%-/\'phone/visit&$read&%these%$offs%.r-photographer()roclaimed',
+    '\'%to-be&!/\'5actor/director/oxford(%uthor\')performer0!s(0roducer/director\'\'thinker()ranslator&)s-at-work(,in-residence\'$.but($john\',/consultants\'#hip',
+    '%%s.but&!t%"up$#hen$!i%.ng&rehy;bureau\'"-a)#lso)"re($case()directing(&effect($pad.()telegraph\'..139&mdash;the',
+    '\'*/directing\'%board\'*preferably$!t%!e&"n\'\'#-by(.in-ten-minutes("on\'$ness%&ington"%l.037"(oblewski#"ck%\'wardine',
+    '#&lstead#)ng&commat&%ndash+&;doing%!\'%!-&&course&-doing-disease&%foots&#ish&,kind-of-snow&\'measure&#the\'&urning&#way',
+    '&%teams%#est%$foot%*headedness%,ly-convicted(%sized)&pelled#"ot#!t$%e-off$!t#-ught-plasteel\'&on.the)*/wiltshire#$xall',
+    '$#ons"!p"$rick#"or"(t-ridden#!h"#uck"#yed#*ly-beloved&&turned#%mouth#"th"-ze&sacute;nia!:s&dollar;306,000,000-worth"$-400',
+    '"!1#!3"$3000"!4#\'86sx-33\'#/33"#692"#739"#ays""cf"!d"%gwynn"!h"#ipc"+k&ndash;pzl',
+    '"!w!"t.")/operator#!v"#483""h.#"in""ih"#ssa$!b""tv""ua!)u&circ;rm"%-tong$!u',
+    '$"gh#%telet"\'bbering#"en"(cai-fish#%herer#$kin\'")djerthink#)nbinabluh"\'erzburg"%ffeck%!d$#ing$$ling$!s',
+    '"!g"+h-hu-ma-han##rer#!u"%illot"!k"&lfenii$$helm$#ige$#ren%"un$%stani$#wig#!s$"in',
+    '"#mni##pus"$n-sa#"da$"en%#rer&$horn&,sch&ouml;nen$%sdorf#"mi#"na$&enberg%%rfull#%schen#%thanu',
+    '$$isch"#ran#"ds$!z#!f##kin##ley$!i$"ys#&tsmith$\'temburg#$zell&!s"#shu#"ih',
+    '"\'therich"#yts!&v-cd1e"#198"$2000"!b"!n"!o!/w/dec.91-p.1227)\'/p.1227."30."46."84#-nov.91/p.1143#-oct.91/p.1060',
+    '"&1-type"%3.pcx""cb"(ednesday#&eekend"/f-international$%style#$/eec%$xxon"!g"#iii#"th"#www!$x10a"#200',
+    '!0y&rehy;man-mandy"$ards$!t#,tt-or-hughes&%smith%(/bristol"$barn#$ergh##orn##rew$"on"\'c-whack#\'h-hazel$$bold$$erly',
+    '$!e%#ham#$liff\'&e-went\'#ian(#tes##ome"!d##ale##dan#"en#!o"\'e-delta#$land#&rsdale',
+    '""fe#$fles#/old/oxfordshire"(ganowski#\'gestons",keham-martin##ham"*ld/retired$$bore$!e#!l$!e$#iam$$ockx##son',
+    '"$man.#)ondeswold&3ham-dereham/ryburgh"%nalda%"ek$#nts$!u#(d/queens$$cott$*eatt-whyte%!r$$ford$*ord-thomas#&edaele$(ll-mayow',
+    '#$koop#%malen#\'n-parry&#ope%(williams$\'/former$"es$$stay#%orski#"ra#$ters"*oming-ibid"#per%!s#$losz',
+    '""rm$&bidder$!s"+se-enhanced#)iwyg-type##ock&.yj/aldermaston$"ng##wig"\'tcherly#&heburn%%nshaw%!r$"op#$iwyg',
+    '$%eneye"$vell$!s"$zner!$z706"#944#"57#"68#"99 +x&formula;p"&ge;3.8%#4.6%#5.0%#6.0\'!1',
+    '"$lcub&(;gd&rcub#%owbar"\'ndash;1"\'prime;0"*times;1.5m),70x&times;61)!m"&uuml;e!%\'nadu!$(1)8""l)""o)"$t+t)!"+2',
+    '"!i!#-10"!2""80""95#!9"&across#+pplications"#bar"$club#)ompatible&%onent+!s$(ordinate#$raft',
+    '"#d-e##oer$#zen"&effect#)xperience"%films"\'harbour"!j"$like$#nes"!m#"al$!s#$odem$#tif',
+    '"(nanterre#)etworking#&itrate"%oct-1##mat##nly#"re"!p#(hosphate#$lace##ort$&sition*#ing#$ress",radiographic',
+    '$*y-emitting%(/neutron%#ing%#ted#)egistered(&ration"&seater$$ries#$hips##lot#\'tandard%#tic\'+on-specific"(tail-fin#"el',
+    '##own#$reme##ype"(variable#%iewer$"ii#%oting"\'widgets$\'ndowing((s-for-pc*/under-microsoft%&server#$orld!#.-d""11',
+    '&)compliant%!0#!4"\'500.and"!d"%emacs!&/abdul"(malik/de"!n#)ot-x-type",open-branded\'&hosted#!s"$team"$unix',
+    '!%1,000"$00\'s$!a$!b$"cm")1.5-based$!6#!9#"r3$!4$!6$!s""2c"!4""ab',
+    '#!s!&2-5374$#454#"y2"!0#!6"!1"%4&ins#"/e#!e"!8!$3-y3""00$"km"#224',
+    '"#j19!-400-compliant"!4!$5&ft"!0#+0-compliant"$2333!+6&frac12;in"$8432#*684-x68689##721%!2"&9115-6!&7times!$9.1m',
+    '!":p"!x!#=-1"!0##.01"%15.38#$6.24"%21.89"!4"$5.72"!6"$7.58"!o"!z!+a\'-equipped',
+    '"*-compliant##scm"+/38/26/0011#*44/25/0013,!8\'&6/0005"!2""ba""cs"*intrailles"#lam"#max#&oterol"$nada%\'u-front',
+    '#$eros##tar$\'helasma%"ic&#ne/),hypoxanthine)(xanthine(!s&$ppes%\'ogenate&$mata\'%matin&%phyll&&rrhaea&$zona',
+    '"!r#%el-lo##has#+it&egrave;s"$tiva"&verius#$iers"!x"!y!%b-70.##akm""7+")a-1/pst-1#%i-xho""v1',
+    '\'&8/0001,!4,!6$)1/25/0000)$2025+"32,!3$)4/25/0003\'&6/0003$)5/21/0000\'(5/0007-1,!8,!9+"11,!2',
+    ',!9$)8/25/0000,!5,!6+"11,!4,!5,!6,!7,!9\'&6/0004$)9/25/0000,!2,!4,!5',
+    '#*11/25/0001\'&6/0002,!3,!4$)4/25/0024,!7\'&6/0003""17""20""5+""6+"!8""a8"!c#!i',
+    '"&essory"%hange#!f"#i.5##:13"!o"!v##iii"!y!#d1+""3+""4+""6+"&b-link$&server',
+    '"!p"!s!(e-server"$0601""2+""3+"#650"!c"#doc$#s-6"#hna"#ina""mm"$n-ls##iai',
+    '$&x/unix#*obiologist$%cidal%%rates&%ystic)!s$\'dochium$&geneic$&krates$&lithic$&mystus$%n-133(!5&%laser%%ymous',
+    '$&phanic&$obes(&ically\'"ns%\'ithecus%%sylla$!s$$time$"va$!x#%usion"&pected"!r##fan#%odera',
+    '$\'philous&\'thalmic&#yte$!s%&permum$"us$\'x/apple%$parc"\'stobium#"us"!x"!y#!e!,f/13/06/1980"+2l&ndash;1s',
+    '"$4+47""5+"#ace%!c"$uzzy!,g/00/28/0002$)1/25/0002+"10$)2/28/0004$)9/29/0001#*10/28/0003""2+""3+#"32""4+',
+    '#"97"#a-2#"to""cy"&enetic"#tvs!!h"+/02/18/0001""2+"!4"!5"!7""8+"#aja"$elil',
+    '",osa-speakers"!q"%uveli!$i\'an"#-nu"#.25$!6#"31#"49#"54#!7$%6xii.$!9#$81.3$!7',
+    '"\'a-class#!.#$fang#%n-zai$#gju%(uangiids$$hong$%jiang$#lin$$shun#%otian$$yong#"pu"&caques#"or',
+    '""em")gaz&ecirc"%huang"%i.271$"30%#6.4$!8#%/xiii#"i.%"59$"/z$!i#"js#!v"#jli',
+    '"&n-huan##gan$#hua##ing##wen#$zong"!o#&rrappa#.upouppas/flood"(pamanine#$hias%$dium##pas"\'rivella"#sha',
+    '"!t#"an"!u#$ying"#v.3%!4$!4$!8%!2#"th"#x-i#!.#!a#!c#!e',
+    '!#j-s##two""12"#200##20c"#4.2"#579"$9870"$r-15#"15!$k150"#819#"24"#940""xt',
+    '"#(2)"$-ent"$0601"#318""40"#500""70"-ic&mdash;xlii#-i&ndash;xliii#+v&ndash;xlv$#.17"!l#!l")r-to-jack##14c',
+    '$"7c&"hr%!g$$9chr%!g"!t"0vii&ndash;xlviii!$m-17"#173"#594"#602"#asa#"th"&illion#"nt',
+    '""ni"!o#"de"$p921"!t!$n344"#974""et")q&ndash;1!9o-xy-xx-xyy-xxy-xxyy-xxxx""21"#ana%!n$"on"!u',
+    '"!z!*p&ndash;50*"9s"#-63%"ns"!1#$-440#!0#$1.21$!s$!t#!2$!t#!7$!t',
+    '$!t#"9t"$330s#"46#"60"#486"#505#"11"&editer#\'riments#!s"#g-4#)3-branded#)4-branded#!6',
+    '"\'osition"!r"$s701!!q""20#!2"&uisite!&r-2264#$s200#!x"#32k#"6p#"8r#"is#!s',
+    '##x4s"#77j"!a"!e#!f"&f-2000"!i"!s#!a"#ule!)s&ndash;1)!l"!."#109""24',
+    '"#567"!8"#903"!a"%cript"#how""py""ql"&tones.!"t-#%based#"pp#%quipu""16"#600',
+    '"#end"!h"$p-ii"!r#\'avision#&eegold".ualplayfulness!%uecan##fan#%guagn##lan$$iang##qun""ly"#nta',
+    '"!v"!y#"en!$v-15#\'a-sides##xix"%.41.5##60.#!9""10"\'2c/taqi"#422$!4#"70$!4',
+    '"$730h"#863"$edit"-i&ndash;xviii#&-style#!.#(ew-based#,i&ndash;xxii$!.%"20%"49$%i-xix\'!x("ii%$.169',
+    '#"ri"$show"#t++#\'-design!!w"#837#"87""as"!e##xwe"!h"$ords$"ld"!r!"x\'',
+    '"#-xx%!i"!.#"42#!6##xxx"\'/savall"!d"\'i-xxiii#$.541#+i&ndash;xxv$#i.3%":1%!b##v.3',
+    '#+x&ndash;xxx$$-xxx"#the",v&ndash;xxvi#"f.#.i&ndash;xxviii$&-xxvii$+i&ndash;xxx%$.942%%i.8.9#!l"$x.22#"i.$#:20$,i&ndash;xxxv',
+    '%#i.7$#lia#$v.62#\'xxx.exe""yy!\'y-plane"%/10-z"\'alazine"!c"%lazin#&eborus#%ocain(!e%$oris$#gic',
+    '$\'phoning%"ia&!c$"se"%phios$#oid"#ris"$stus"$zkqu!$z997""a4""b2 2y&aacute&ntilde;ez#$macr"*eacute;pez',
+    '"\'ndash;u"&verbar!"\'a#\'nywhere##re."$been#$lack$$oody##oth##utt"\'callin\'##ome$"ol"\'devious#!o',
+    '#(rip-feed"%faces$#ncy"#gal#$oing$#nna$#tta"$last##ook$"st"%mouth"$nose"#off#"l\'#"ne',
+    '"%ready$\'covered$!d#$self"&selves"%there$#ink"$ugly"\'waitin\'##ere##ork$!t$#uld"%y\'yes#"es',
+    '""t)!#*rk!"+s!"-2",aminobutyric"$char$1romosome-specific5)sequences#)omponents")dimension"!e#!r"$fran$#ont"#hat',
+    '#4n-the-fifth-position$$puts##ron"(junction"%level"\'motions#\'p-class"\'neurons"(position"#reg"&scales#$hape##lot"$type""up',
+    '$&riable"\'wrecked"!y##-y-&%y-yet%"es!#.-k"!a"$b.a.""c."&gasser"$t.s.""z.!!/"+303/25/3002',
+    '"!c"!x!"01""ur!\'1,361bn"#.07##331$!5##788##916"#/82"!0#"bn#!m"!2',
+    '#$2.00%"25"!5#$,000"%6.3bn"%8,000"%9,800!%2,718##800$"16"!0#$.5bn"!1"&20,000!!3',
+    '##864$"84").3billion""42"$88bn!%4,078"!0""60"%8,000!%5,000##631##825!!6"$,019##602',
+    '!%7,282##500!%9,000"!3!6=0.32436&ndash;0.11110""10#+17.99+5.58x#+46.70+7.13x"!2"*3.25+0.88x#*8.54+7.07x"!5"$a+bx"!e"%g+c+e',
+    '#\'*100/40#"es!*a&ndash;18)"20*!2$(tilde;ez"%\'akov"$-boo&&-sucks#"ya"+/00/25/0003,!5$)9/25/0006,!8+"12',
+    ',!6#*33/25/0004+"11+"26+"32,!5,!6,!9+"47,!8$)5/25/0002"!4")a-yaa-yaa#!a$#aaa',
+    '##cob&!i%!v#$kobi%!v##lon#$qoub#"ra$"gh$!i#"ss"\'bbering$#ing#$lans"$chad',
+    '\'#ike&\'sailing\'(ervicing%&filled%"ie&,ng/competent%\'masters$"uk#$kin\'&!g#"ob$#men$"ov$$rder$#uba',
+    '#"s.##uma#+yret&aacute""da$&msuren#$egar$!v#&garoff#"oo#&vashim"#fei#"fa$#les""ge##oda',
+    '"(habeebee$$nnes#"ia$"ng##ooo##veh#"we$$ists"#ina"(juvendra")k&ndash;1+!4+"8s*!2+!4',
+    '*"36*!4+!0*"52*!7*!9+!s#\'\'s-wool#"-1%!2%"8a&!t$"25$"41$"50',
+    '%!5$"9s$\'chucker$$like$&prefix$\'yakking#%akent#%htaru#"ir##men#)obashvili$"ub$0vlev&mdash;chair/&former(#-40',
+    '$!p$(shimanum&#ova$$tsia"(l&iacute#$avou$"ya#"es#!l$"er$"ow#"om$$uris#,ta-redefined#$urah',
+    '"-m-cultivating#+agushi-gumi$*ha-roberts&"na$#les$$naka$&to-1\'s#$buki#$drok#(eossouko#$hill#*inobutyric#%merin&!s$#ing',
+    '#"ut"%n-kit$%leung$&pascal#\'agisawa$!i%$hara$!l$$mami##bin#"ce$&hinski##dja$#uri#$eyev',
+    '#%g-kan$!a$%cheng$(jiaxiung$#ste$"zu#!i$%ewicz#"ji#\'k\'s-eye$)ee-doodle%&lovich$%ified$&ophile%!v',
+    '#%nakou$\'oulatos##off$$mani$$uzas$!w#$shin"%o-hoo$$tung##lun#$unde"$phet#"ok##per##ton',
+    '#&-ali-i#%angas#$bury%!s#3d&ndash;dringhouses$%-arms%$deep%%ferry%&square%$wand$//station/siding$$arms$$bird$!e%"mo',
+    '$#man&%sters%"en$&s.only%\'pinners%)tick-plus$$wood#&emenko#"gh##kon#$lott$#ung##mey$"ie$$outn',
+    '\'!e(!s#(n-a-rama%%maker%&sizing&\'pinning$#all$#ers&!y$%field$"it$"s.%\'pinners$&winder#"oa',
+    '$!v#!p$#ole\'./herefordshire#(ramalong\'%n-bia)"ku%#won$&owford$"rt$!t$)undi-side#"ty#"ub%!a',
+    '##way##zeh"*sak-paying%!a##een$%nsgat#"ha%!r$!i#!i$!r#$kawa#$mine##sar$"uh',
+    '##tik$)rzhembsky#"ue$$kawa$"ni$%tsune##yri"1t/gloucestershire$-herefordshire#&aghans#"ch%$sman#+es/director&\'manager&&visits',
+    '#"im#$skov#"ta$%endon%!r&"ed&#ing$!s"%u-nan#"ng#"ra"#val$$nsky#$geni#&linksy',
+    '#\'orivsky#%royan"&w-free#%/roll#$adee##ker#*n-capacity%(inducing%&making%(provoker$%athon$$ing.$$some("ly#!o',
+    '"/ya-ba&scedil;is$#san$"ya#%ehrad"$zdan$%egird$$gard#"ji#$oooo$"ur##uka!$b-40#(depleted""or!,c&ndash;125b',
+    '"!e#$land"!i"#lad##ept"!t"%v-309!\'da1820b""el""ra!*e&mdash;es#+racute;evan"\'-e-e-es#!i#+olde-worlde',
+    '##yes"+/00/22/0009)$2005\'&6/0018\'&8/0001$+1/26/0010-1$)4/25/0007,!8+"10,!2$)5/25/0006,!9+"10,!4,!8',
+    ',!9+"20,!3,!7,!9+"31,!5,!6$)9/25/0001,!2,!5,!6,!9+"11,!3',
+    ',!2,!3,!5,!6+"11$)3/25/0005"":h"&absley#6h-they-don\'t-know-shit%Nwell-i\'m-inarestid-in-martial&rehy;arts-in\'t-i$!.%$that$(_because,-_,_because_of%\'instead',
+    '%#rrr##kel#$land##man#,r&mdash;more+#see%)rehy;long$+\'photograph$$--is%$1977%.and-a-half-old)$half&)ttracting%%based&$ooks',
+    '%\'earlier&%nding%+in-year-out%#low%)numbering%(old-girl\'!e&#nly&(ver-year%(planners%%start%$team\'!n&"he\'$ough',
+    '%"up$$.and%"be%"he%"in%#ois&#nly&&verall%\'russell$"/i%)unlimited%$what$-=0.0003&times%%1985.$&_prior',
+    '$$dley$#ely$"fs$)ley/coach(&thames%"ie$#ner\'!s%&ing/to$\'s&mdash+#;as,#she,#two&%pound%!*',
+    '&#for&,imprisonment\'!n&&of-age&(probably&%since\'%ooner&$will%!.&!5&"he&"in&\'johnnie&#now&\'picture',
+    '&!u%!/&!a&$owns&#you%$1800%(_because%$with$*woodpublic#!s$!r$&t-rich%!.%\'/celery%!1',
+    '$$sian(!s$#ton#!y"#baw"(chotinic"%dders#!i$"ot"$e-ew$"ha$\'yee-yee#$ased#!e$&aaahhh',
+    '%%eaaah&$e-ha\'+hhhaaaahhhh&#uch%"ss$"uk#!h$"aa%!w#$rely%!s#!s$(-gar-oth$"ss#$tzky',
+    '"$fano#"im"$gane%!i#$orov"%h-won#\'oshavat&"ua$$ussi#"ya"#ild%"ed%#ing%!s"$kepa',
+    '##uno"%ldham$#ing$!s#\'ikovsky$!u##lin$(ow-amber((nd-brown+%white)&oraked\'+bleary-eyed)%oomed(\'reasted)$ight',
+    '(#uff\'&coated)&loured)%vered($ream((urtained\'&decked\'(featured(&lecked*$shed\'&greens(%utted\'\'hammers("ot\'&jacket',
+    ')"ne)!t(%oving\'#man*"ed()oustached\'%ochre\'\'papered)\'tterned(#ink\'&ribbon(%umped\'%sheet(&kinned(#oap',
+    '(&potted(&tamped)%emmed)&reaked*$iped\'&tailed($oned)%othed)$pped\',wagtail-like)$lled(#ort&!/\'$blue(-urgundy/green',
+    '\'&double\'$grey\')miniature\'"no&%backs\'$eard&$coat\'%raigs&$er\'n&$head&(ish-buff*$gray,"ey*%ochre*"to',
+    '&%knife&&legs.v\'!y&%stain&(y-browny(%cream(&orange.!.(%white$%sound#$pers##sin#)toniensis#"va"#man',
+    '#%enite##ini"(n-backed&#sed$+denominated%%ollar#+/&dollar;35#(angyaung#"bu#%ching#$dley\'\'/former#&ipazar$#sci%$eisk',
+    '\'"sk#!s$%etter#\'tchabre$!l#&worthy"1o/gloucestershire#$ford#(man-like&*s/employee$*en-tailors#\'persons#)vil-based##wch"\'pishev*',
+    '"\'r\'ll\'av$!n#%-\'ere#!.#.allriiiiiiight$"rs$#vda#&beston#"ds$$zook#&ebatan$"ly$%menko$!s##gin',
+    '#"ja#%laten$"ie$!y#!o$-lim&eacute;na#!r$+ralllrright$(ulabobof#\'sterday#$vant#!z"/s&lsqb;aha&rsqb#!-$(anything',
+    '$#s-s$"to##.it#!/$%no/ca\'"do#\':51,136#%elves#%hibah%"ve$"ua#"il#\'manship#&please##sah',
+    '$"ss#"te%%r-day\'%night&!d\'#ay\')!-*!a)%.five*$just)4/banbury/oxfordshire*%erika**gloucester*%linda*$mine',
+    '*&oxford)*photograph*&icture)%thurs&%night&%yearj$$iday#$ugai"+t&mdash;and$%ndash$)rehy;what#%-been$*more-aloof$.to-be-designed+)iscovered',
+    '*(released*\'shipped+(ponsored)!s\'$come$+unannounced#!.##/he$"in#%erday#$holm#)i-gaiters%$like##man#&serday',
+    '$!s"!u#$dall#&ngling##rgh#(whiddens""ve$#gny#%genii#$iakh#$lakh#*ropeiskaya*#ikh")w-clipped$%hedge',
+    '$$wood$#yew#$dale##ens#$lett#\'manbeen#$shul""yn##yyy!,f&ndash;117a"$-22s"%allen"!v!,g/00/29/0003#*13/25/0003',
+    ',!7,!8,!9+"11,!4,!5,!6,!7,!8+"20,!4"$arth"&drasil"#eia##lda',
+    '#%esias"(rrsaeden"-wmdfgrrsaeden!"hd"!e"!n"$ombi#"ur!(i-hsiung#$jing#"te#$yuan"#bza"%cheng"$ddin',
+    '\'$isms#$jaru""el$+d-enhancing&+improvement\')ncreasing&\'robbing&\'sapping%!.%%ingly#%wsley"#gor"$khav#%ovlev"!l',
+    '#(dirimhan#!i"&n-chun$)formation%!u#%/yang#!a##chu#"gs#"st#+ternational"#oda#$rgos"#p-i%*-addy-i-ay',
+    '#)pee-ai-ay%!r$#ing$!y"#rol#$sels"&sraeli"!t#%zhaki""ur"$wara""zi!%j93-5%,ge-5-powered"#ada',
+    '!,k&ndash;117s"#18u"#ba2"*s-7-g-bwac!$laft##ted"(eisradio""fe"$inen#7oppilastutkintotodistus"*lidomestic#$ycci!&m/ywca"!a#&dawiad',
+    '#!x"\'ca/ywca")f&ndash;5"%itury"!m#8&auml;r-r&auml;ttek&ouml"!o"!r"%uiden!\'n/1.7.4"$5.48"!d"!g#"ve"&is-hir',
+    '"#ogh"&ynynyn#$slas$$oedd$)ymaengwyn#$uray!&o\'self"%-yo\'s%%-like""11"!4"!5"$arth"(b-heaven##bie',
+    '$#o-y#!e#"is#"ot"$cals$!m"!d#%eller(!s%!s$!y#"ie""el$!i$"li',
+    '"#ffe$"ie#!i#"re"!g#\'a-based%)vashishta$+/meditation$!i#&hourts$$urt\'\'&-based(%maker-!s#"in',
+    '$&slavia*!n#*urt-making"#han#)on-nukite"&ichiro$#ked""ji#!o"&k-sing#"am#(e-fellow%\'harness%$less$!n',
+    '$!o##ker#&o-like$$homa$$zuna#!u$!m"#len##ked$$less$"ys#"la%"ri##ton#!u',
+    '&!s"$ndon&%suren$$uach##eda$$kawa$$zawa##ges$#hua$%phalu%#ing$!s$#ten#"il#&ks-old',
+    '#%ville"(o-hooing#(f-crazed#!k#$mtis##nie#\'oseless#!p#"uu"%p/yts#$lait#%ougan&"on"&rburgh#&danova',
+    '$$dale$$veni##gos#$haul#.k&ndash;boston+\'cardiff+$hull+&london$!\'$\'-boston\'#und%#ish%#jfk%)liverpool%(oriented',
+    '%)to-london$!.%$this$$/new%&sydney%&thirsk$%based$\'er-type$%ified$$reco$"sh&#eer&!i\'!e\'#re-',
+    '+%urham*%ified*\'skipton)-/lincolnshire*$tyne).123-1288.575.4)%based$#ton$$wood#&lander)!s#%nutta#!o#"re$$ible',
+    '#-uba-dominated\'(speaking&!s"&sahiro#&hi-ima%!e%$hito%$kuni%#nao&#obu%$teru%"ya&#uki%$zawa#!u',
+    '"/u&mdash;another*)constanza,#uld*"he*"in*#may*"no*(tomorrow*%which$)ndash;say$(rehy;not#"\'\'$$-you$&d.just$.ll-do-as-i-say',
+    '$0re-okay-i\'m-okay&&.right&!s#:-ain\'t&rehy;getting-change%Cnd-me-having-a-little-joke-together%,re-one-of-us$$clid$!d%"id%Ion\'t-have-to-tell-me-anything-about-carol*#say$#ess$#fus$&genics$$have',
+    '%#sin$!i$Eknow-the-scent-now-try-the-bath-range)*what-again-!s+#ere$$ming$3name-it-they-had-it$&please&$ural$*rascal-you%%eturn$$sean%<nap-first-and-i\'ll-snap-back$+terminology',
+    '%$opia%#sao%#ube$"wo#$.get$!i$"wo#$/but$(contours$!i$$make$"re$$show$$thou$"us',
+    '##111##_as$\'because%!y$)from_time$"in$$know$"on$"up#"ba#"ca%!i$"ef$!h#$dale',
+    '#$have##ing&!s#"ki#$lden%"on$&greave#!n$$aaaa&$narr$\'g&mdash+$;her&)ndash;man,#old%"\'\'',
+    '%!-&#and\'*s-you-feel\'\'t-heart&&bloods&%choon&(directed&"ey&\'females&(in-heart&%james&$love&+middle-aged\'"um&$only',
+    '&#sam\'&eeming&$turk&#uns\',ser-friendly%#/do&$food&\'glasgow&\'housing&(landlord&(speaking\'&upport\'&windon&#the%#_of',
+    '%*er-brother(!i(&sister)$tyle\'#/my(%older\'#man&\'st-born%$ish.%$john%#ner%$ping%$self&"on&%ters.',
+    '*./inexperienced%&talent%!y$(ie/royal%#s15&!2$#ker%"in$!r#(r&dollar%)rehy;self-#ves$!\'%!s$!-',
+    '%4heart-on-your-sleeve$!/%!a$"an$#don$(etournal$*humblemule$)initials1-!0-!1-!2-!3-!4-!6,!2',
+    '-!3.!a-!4-!5-!6-!7-!8-!9,!3-%0.ltr.!a.!b.!c-!2-!3',
+    ',!6,!7-$.doc,!8-$.doc,!9$*lowlybeast$)s-in-hope%$/you%#el\'\'"f\'(*-exploring)"on)"to)$what',
+    '##sen$#sel\'!f%&oufian%"ri$"uf#!t$$h***%&-based&)conscious&*democratic&5hostel-cum-doss-house,#led-#ing&(of-today',
+    '&+sex-madness\')ustaining&$team&,v-experience%!.%\'/junior%%quake%+s&rehy;once%&worker$$self"#wei$!s#"ff#!n#!s',
+    '"#yes##ish#"os"!z!"p6"\'aeitltw#!s"%dr601"/ilach&oacute;0n"&ocrite#"rt"+res-roulers""si")t&ndash;9!&r-olds',
+    '"&issari"$netn""on"!r!$s-11%!s"&abella##tis"$eult"!g"$idro"/lrwqieiifkvwksl#!s"(talyfera#"dy',
+    '$$rics%+plaat-based!\'t-broth"!b"2hinkspitxishlikefa"!r#$ened""s.#%/tvei#%169.4"-terg&auml;rde!+u&ndash;aff)#boz"$-chu##hon',
+    '#%njing$!s$$yang"$bani##ero"\'catecan#"ck#"el%"en#&k-face$"ie#"on""da#!e#(ishthira',
+    '##nfu#!t"%g-g-g#"as##esh#\'ojitter$-slav-austrian)"ec)%greek(.ia&mdash;later*!\'*!**#-ec+$wide*(/holland',
+    '#$uchi"&ishiro",karigungoren#"er#$ichi$$hiko$\'noyouni$"so#"ka$"er$!i%!e%$fied##ong#&sekova',
+    '$"ra#&e-tide#"ia$!n$!y#!l#%unggu$!o"#mbo#"io#&miness$#mmm#!s#&yumyum"(n-cheung',
+    '#%derup$#ong#&gstirs#$kers##lin#&nanese$!y##ona#&upingu"$pela#"pa$)ie-phobia\',scum-sucking($tyle&#dom',
+    '&$ness&%white+!s%"ly$&y-jazz#*s-in-peril""qo"#ram$!n#&ganysh$!h##iev$"ke$#ria$*s-al-hayik',
+    '$!k#"uk$!r#"ze"#sen#&henkov$%iskin)!s#"if#"pa#$shui#(ufhealth%"ov$*pov-karpov"$tang',
+    '$\'anasium"!u##-mi$&ndi-mi(%yi-mi#"ga"*val-davies$%skula"$xian""ya#!e"!z##hen$$mash#!u',
+    '#\'s-jacky"#ill"1mqkspfthwshlikefv%6zpfjxwvhglawfvchqxyopy\'3gjxwvhglawfvchqyopy"!n"!o#$nete!"wa""es""in";tfghikmccowlxpmtxwkirlmhjdb!\'y/mm/dd""aa"-eeeeeeessssss',
+    '"&yynnnn$/yeeeeeeeessssss%/yyyyyyyyyyyyyyy!$z125"$eiri#\'rmannii",ordderrexian"$r250#!s 4z&aacute;meck&aacute#)uml;irean\')uberflote"#deg#)ollar;1.5*!0',
+    ')#2.2)"30+!0*%3,000**50,000,000)&40,000/$,000*"20)!5*!0+%0,000,!m)%6,400)%8,200"+eacute;lide',
+    ')%phire-!s#)circ;tang"$gt;0",lstrok;oties##t;0%!o")ndash;wkv"+oacute;calo##uml!$-150"!2#!8"(80-based##200',
+    '"$bone#(uffering"#d-k#"na"%helix""in"&naught#&eurons#$otes$$ught"&output"%pitch##lan##res"$rock',
+    '$!w"(sections$$rver#$hape##oft"(variable"%z-zip!(.1007bis"!5#"01$"ls""h.""j.!\'1-style"!0',
+    '""42#"3l"#827$!9#"30""93!)2,167,000"0033/g&ndash;astl"%1,000#"18"!2"$42ls#!8"#505"#837',
+    '"#900$!1!"30#$,000#!3$!4$!5$!6#"54$!9#"60$!1!$4060#"87"#261',
+    '"#etc!"50#"lx"!5"#722"&84,000!&7015\'s!\'80-type#"00%!0#!s"!q!#900!(=-7.7565#!a',
+    '"$0.33$"67$!7$"88"!1##.75$"85#$0.65#$1.83"!2##.18$"37%!8$"64"!a',
+    '"!o!#_\'s!)a&iuml;de(%reans*!s)#ois"%\'afac""02"#ahi#\'ndvoort""ba$(jjkal\'sk$#lla%"za$"va',
+    '$%janiu$1nskiminister-head##lon#&olotny##ron$"ze#"ul$"ri$#ton#%ytkow"&capone$+r&iacute;as%"ia$%tecas\'%oluca',
+    '%-relli/general$%heria$"o.#&halias%!r&\'apoulos\'!y&/i&aacute&scaron\'$adis&$liuk%!u$"er$!o$\'ramondo"$ddik',
+    '$!k#"ik$!s##ock$"k\'#\'racarta$$ozny$$ugas"&ealand#\'hnsdorf#"ts"#fer#&farana##iez$!r',
+    '$!r"(gajewski$"to#"el#$ging#$hreb$$ulul#!i#%lebie#$orje#,reb-belgrade\')ljubijana##ury#"we""ha',
+    '#$gawa#$irde%%uddin#"ko#(lbericht$!e%!n%!r$#ing$+k&ouml;rper$$ring#!r$#ani$%inger)!s',
+    '#"da%!n&!i$#man##mis#"ni#+onchkovskii"%jdler#&ednica"$kari&!a\'*-bahauddin%,patsk&aacute$!t%%ellos',
+    '##elj##hia$#vat##ian#&linsky#!o$(nomernyi#"um#(ynthians"#lau#!e$#ski#"ig#"on##uar',
+    '$$itis$!l$$nian#$baco%%rdino$(ian-born\'\'ization$%oanga%!n&!i$"ra&"na#&ecnick#$fara$"ir',
+    '$!l$%ndary$!r%"ah#$mett#%orani\'!o$"sc$"ur#"pa$$olit#%yatin"$nadi##bax##cer',
+    '%\'meneghi%#nai$!t$&voorde#\'esville$"ta#$gana&"eh#!i$!a$\'challia&$elli$"er%"st$!n',
+    '#!k$&aliani#"la#$nier$#oby#"on$$obia$#tti##tav$"en$$ford$(hoxylums#$ubia#&zinger"%orski',
+    '"&parama%!o$$tero##hod$&rentid)!s#"ii#$lana##nit#(orozhian("ye$"te#%piest$!s$!y',
+    '#$u-pf"\'rabella$!k$"ni$%thion#"b-#%dusht#%ebski$!k#!g#"if#!k$!o#%nescu##oug',
+    '##sto#!t#&ubezhe()geologiya%"in$$dnyi#"ya$#cky##zis$$ueia&"la")slavskaia(!y#&tyrday#!y',
+    '#"on$$rska##rwa#$tore#$ulin"!u#(berflote&&wurfel#\'dinskiy#&koenig#!n$&koenig"$vadi$&lishin$$roni',
+    '#%gayev#$idia#"od%$nick%!y$&evanie"&wadzki#!i$#nul$$slak((industry#(odzinski$$lkow"$ybek#$dani',
+    '##yad""zi##zau!%banic#$rbar"%inden"!m"&raslav"$ynek!!c"%hloty#1n&mdash;christian!&darsky"+en&ecaron;k"!f',
+    '"\'obyslaw"$rave%"ko"#xl4!$e359".al-of-the-land$-and-australia(%based)#red(&canada(%south(\'trained(#usa\'!s$!l',
+    '#"mi"$bbug#%erdee#"it#\'ra-skin\'&tripes&*underwings&(watching$!u%#gge&#ree#)u-jerseys%\'taurine$#lun$!s',
+    '#\'hariah\'$)steinkalk"(d-bombed#!e#$head#$nick"#ebo#%lands$&enburg#-man/principal#"ta#%vaart""fa##far$%irero',
+    '$"ye##reb#"yo"(hjnulahu#!n$$der."&ichner#"da##hst#"le$!l#"ni#$sler#"t.$\'geister',
+    '$%hamml$#lyn$$schr(!.$!z"\'jnulaju"*l-i-sultan#%anite$#zny#+ed&oacute;n$"ia$"mi$#ney%%skaja$%ograd',
+    '$$znik#"ig#"le$#ick%!g$%weger#\'ma-like##nik#$otai##ter&)/reforest$#weg"-maitis-toting$#nek#"el',
+    '#$laya$"ja$)yachestva&#nsk#"on$"ur#%stovs##yla"*n-buddhism+!t$%chieh$"do#$anas$*ruzabeitia#\'davesta',
+    '$$ocon#!e$&ca/ici$(ll&mdash#"ia$+th-transits&%.bull#"ji#&kovich#"os#"ro#$tall$"ec$$illi%!s',
+    '\'+kriminalamt\'&stelle\'0wohlfahrtsstelle%"is%#opa"%odary#-lite-softened.#ing&$ised#*s-designed"\'p-clone#&hanian$#irs$\'ranthes$(yr-grade',
+    '#!p$"er"$rata#$dani$$usht#$eske&!i#$kall#$mela&!o#%natto#0o&rehy;crossings$!-%&degree\'%nsity',
+    '%&earner&\'mission&\'xtended%%field%$gyms%*investment%$mass&+odification%3nine-zero-five-nine%#one&%ption&$rder%&parity&&honeme&$ower',
+    '%$rate&%eader%%speed&$tage%+temperature&&illage\'"me%$wind%(yielding$#/02$"id%"st$&rating$(th-order#"rs',
+    '#$uiah")stfulness"#ta\'$(-powered$%probe#$lein#\'terling&$vall$!l"$ugen$$haus(%gasse$#ite\'!s$\'ma-test',
+    '"#ven%#aar#!i#"on#$ulun"+xel-gleason"\'ylaniae$\'onensis"$zeee!"f1"!l!&ghotra"\'orzelec!$haab#"ko',
+    '\'"is#!n$\'ggufeng#$oguo#"ra"%d-732#\'anovism("te"*elesnyakov%*v-inspired%(znovodsk$&tovsky$#yev##nda$%echka',
+    '$%jiang$$qian"$iang##gou#%sheng##xin#"zn%!\'"#l12"\'merinka"!o#$ngda%"xi\'"an#&vtnevy',
+    '"*uangzhuang##bin#\'kovskii#\'ravleva$\'insgeye!#iad#"ni#%prime#3walla/paediatrician"$bado#$ello""ch"&derman"%ebele#&derman',
+    '##gel&&brucke$)ler-natta#*hl-nielsen#$litz$!o%"na&\'o-piwne##man&!n$#ski#(nciewicz$!s#$ring#"tz',
+    '"%f/268"%g/zag#\'aniodes$&retten#%gerat$#ing##hen$#out##lio##mas"!j"#kim#$mund"&ldjian#%euton',
+    '#"la$%ebeke%!s$&iachas\'"us%&onaire$"ur#!s"\'mbabwe.(&/south%#rdo$"ra#"et#"in#$mcor',
+    '%\'r-frame,!d&"ed&&leuten&$mans&$wald%#tri#$pfer#$ring#&ulator"$naad$#lco#\'c&mdash%+rehy;plated$/-and-castor-oil',
+    '&&overed%*finger-dna&#ree%$rich%,silicoborate1!s%#tub$./chrome/nickel&%opper$#bar$$irli$"on$!s#%dabad$"el',
+    '#&fandel#$gara&$elli&!o$%erone$!i%&-tu\'ii%$ness$!s#!i#!k$"er$"us##nat$$eman',
+    '%!s$!i$"on#$sser#%telis#$yama"(olkowski#.nism-is-racism&#tic"/p-a-dee-doo-dah%\'nd-link$%bcl-2$(fastener%$ront)"ed',
+    '#!1#&aquiva##fos#&hiidae##jun##loc##ora#*per-crazed\')dependent\'&linked$#ier%"ly$\'o-zappo%!s$.y/techno-pagan',
+    '\'%ingly#"se#"up$$rsky")r-el-haaq#!c$$onia\'%um-95&%olite%$rium#$gana##kle"#sco##man##ong',
+    '#%burst#"el%"la&!e#&hulele#&nay/us#\'poppin\'#/ronen-schuttler#!s#!z"$ukas"!v#!a##ier#)nostenska',
+    '""yu$"an"$zkov#!z$"ed$"le!+jednoczenie!!k"$-caf$"vg##dfc##hea#*registered"(harevich!(l300,000',
+    '")at&aacute$$oust#&ughter"$ocha$#zov#"of#$ties$1y&mdash;7,000,000,)prevented!$mago#&yevska"$elik""ud!\'n-cu-pb#\'fingers',
+    '"#/cu"%aimer#%mensk""cl"!n"!s!*o&amp;sup2#/euml;fairbairns#*ouml;nomia"#abi#&rcidae""bi$"as$#sch"&chonis',
+    '#$ftig#&tropes"#fia"#gaj#%molia"#hab$"ir##eir##reh"$idal#!e#"lo"!k#!i#&lovsky',
+    '#"as#"er#,la-lieberman#%otaya%"ow%#yie#!t"!m#$beck$(ie-clerk\'#ish&$ness%"fy$$oids%!r',
+    '$%pirac#(gqashiyo#\'merfest#!o")n-o-phone#!.##ale%#ity%+ly-averaged#%deran$"or#%e-bit%*dispelling$!.$$=sea',
+    '$$nsis$!r$%s.but%#=42#%gchao$$tang$%uldak#"ka$&ed-out%#red&!s$#ing##nie#!o#$ulae',
+    '"%o\'med#%-blot$,geographical$\'keepers$#man$%owned$(plankton#!.#$blot#)geography$#ony#!l$&igists$$ogia\'"ca',
+    '$&ympics#\'m-crash%)hoom-boom*$hoom%"in%&lensed*!s%#out$&ed-out%"rs$$ings$%sters#!n$$osis$!s',
+    '#)per-blast$$hile%$ycos$!y#%shing#(t-suited$#ily$#omy$%suits#-yaaaa-yaa-yaa"$phar"$raya#$gati$%iebel#"ig',
+    '#"lu#%ndorf#!o$&astres#%rilla$!y##zi."1s-terry-foe-lee-a#%cales#!e$!n##im.#,sen-wunsdorf#)terifolia""te',
+    '##kin#"ov#"ti$!o%"la")u-western#&baroff$#edi#%erate#!g#!k$%oenig#&mangui&$igui$"ri',
+    '#"te##zay"$wina"!y"!z!1p1043/airport.let(+lmbank1.doc.%2.doc(+pplemac.let\'+bairdrd.let)&nk.let))rnpa1.doc*)rier2.doc.%s.let(+ikwksch.doc',
+    '(+urnscha.doc(+wbmcbur.doc*)stir2.doc.%l.doc)\'doc.let\'.c&amp;bfeb.let(+anada93.doc+(lnew.doc(+entralr.let(+lothing.let(+omchal2.doc*)mchal.doc((prog.doc(+tcaffil.doc*)newsl.doc',
+    '\'+dlane92.let(*rewmoy.let\',eigspons.doc(*ldcpla.let(+taspons.doc\'+forests.let*)syth1.let.%2.let()rphon.doc\',greenway.let\'*harlow.let(+istscot.doc(*olyrd1.let))ward1.let\'+inroads.doc',
+    '\')km152.doc\'*leigh1.let,%2.let(*greorg.let(+ochshot.doc*(plan.doc\'+magnuss.doc(+cgregr1.let(*tbcode.doc\',nfcspons.doc(*zcirc1.doc)*trip91.doc\'*pacnew.let(\'no1.let*%2.let',
+    '\'+railchg.doc.%s.doc-&mp.doc+(priv.doc0#let)*mblerd.let(+ifkecon.let,&fa.let(+osebery.let\',saftravs.let))pcrep.doc(+cotr593.doc(*nhappl.doc*\'rep.let(\'pv1.doc',
+    '\',towpavol.doc(+weedcy2.let,\'way.doc\'+wldc747.doc(+oodhres.let#"75$!6$!7$!9#"80$!1$!2$!3$!4$!5',
+    '$!7$!8$!9#"90$!1"#250$!1$!2$!3$!4$!5$!6$!9#"60$!9',
+    '$!1$!2$!3$!4$!5$!6#"80$!1$!2$!3$!6$!7$!8$!9#"90',
+    '$!3"#300$!1$!2$!4$!5$!6$!8#"10$!1$!2$!3$!4$!5$!6',
+    '$!8$!9#"22""al$!s"!t!!r""-1#%rated"!1#!6"#azy"%inski"!o#!2',
+    '!4s&aacute;mb&eacute;k#)ndash;dhx"$-afa##cai##ddv$"hx$"iw$"rj##gpl##iwl##jmp##kei##lvr##mrr%!s',
+    '$"te"#abo#"ys"!g"(igimondy$%mondy"#olt"$u-23##pan#&zsanna!!t"#891"&ripped!,u&bsol;3rich#(ntilde;o',
+    '#"ng#)ssantneuf#"zo"%baida&!i#$eida$\'nalgubi%)elchemale\'&genubi$!r"(carrelli##che&"ro%#ini((-layered',
+    '#%hetta$\'trennen#,ker-franklin"&dilovo"&ercher"*gspitzbahn($kamm#%zwang("ed""hr"2id&mdash;hollandse$*erpershuis&&terras$$inga#!z',
+    '#!i$!e$!n#!o$$vsky#)unft-buch#!y"!l#!e$"eg$"ma#&fikhar#"ia$$chem##lum',
+    '%*orientated%&sierra&\'peaking$!c""ma$!s$"ya#$bado#"el##mat#!o#$thor$$obel"%narec#\'derdorp',
+    '#$geru##iga##oga"#pan#"ko#"pi%$nger"/r&uuml;cktreten##aiq$#vin#,bak&aacute;n%"no#)ich-based($ound&$berg',
+    '#"li#!s##uck""sa$)mmenbruch($hang#!h#"tu"!t"%warah"#yev#\'lestein"$zana##ulu!$va\'i',
+    '"(egintzov#!i#!v##zda%\'ochotov"\'iadists"#lad")n&ndash;8"$ogbo"!s"%yzhen!!w"!a#"ag$(rdemaker',
+    '#!i#,ngserziehung##rte"!e#"ck%1rationalit&auml;t##dru#-ierverbindung$#ten#\'lethini$#fer#(ntendorf##ttl"!i#)-hamussit',
+    '#"jn#)llbrocker#&nglian#2schenbetrachtungen"!o""yn$&enburg!%x1020""80""e4"!r#$750s"!w!!y"#cad',
+    '#"ie"#der#!i"+gomaxillary%&ycetes\'%otina$\'phyllum$$sity$$tene%"ic"$klon&"-b"%lenes#"in"!m',
+    '$#tic#"ul"$sman"#tko%!w"!w"$xuqk!\'z-r1100$#6oo"*aperoonies"!b"(obituary"%r1100"%t-oop"#yzx',
+    '#!z$%ooooo$!z%#ing%%zzzzz',
 )
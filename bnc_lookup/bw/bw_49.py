@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_49 = (
+count_49 = 6694
+
+heads_49 = (
     'wahlstedt',
-    'wahlstr&ouml;hm',
-    'wahlstroms',
-    'wahngebilde',
-    'wahrazin',
-    'wahren',
-    'wahs',
-    'wahtever',
-    'wahyudi',
-    'wai\'a',
-    'wai-an',
-    'waiblingen',
-    'waidberg',
-    'waide',
-    'waidmannslust',
-    'waif-cum-designer',
     'waif-life',
-    'waifa',
-    'waifer',
-    'waifish',
-    'waight',
-    'waiguoren',
-    'waikune',
-    'wailingly',
-    'wailua',
-    'waim',
-    'waimairi',
-    'wainapel',
-    'wainat',
-    'waindustry',
-    'wained',
-    'wainewright',
     'waingapu',
-    'wainggai',
-    'wainhomes',
-    'wainman',
-    'wainscoat',
-    'wainscott',
-    'wainui',
-    'wainui-a-rua',
-    'wainuiomata',
-    'wainwright-inspired',
-    'wainwright.',
-    'wainwrights',
-    'waipoua',
-    'waipukurau',
-    'wair-you-a\'',
-    'wairarapa-bush',
     'wais-r',
-    'waisenstrasse',
-    'waisselius',
-    'waist&rehy;deep',
-    'waist&rehy;size',
-    'waist-crushing',
-    'waist-cut',
-    'waist-down',
-    'waist-expanding',
-    'waist-hook',
-    'waist-skimming',
-    'waist-spanning',
-    'waist-string',
-    'waist-to-ankle',
-    'waist-to-shoulder',
-    'waist/tummy/hips/bottom',
     'waistbelts',
-    'waistcoat-w',
-    'waistcoaty',
-    'waistell',
-    'waistless',
-    'waistline-busters',
-    'waistliner',
-    'waistreducing',
-    'waistwatchers',
-    'wait&mdash',
-    'wait-free',
-    'wait-see',
-    'wait-wait-wait',
-    'wait.anger',
-    'waite/successful',
-    'waited-on',
     'waited-until',
-    'waiters/waitresses',
-    'waith',
-    'waithie',
-    'waiti',
-    'waitin',
-    'waiting-area',
-    'waiting-for-ages',
-    'waiting-game',
-    'waiting-maid',
-    'waiting-time',
-    'waiting-times',
-    'waiting-woman',
-    'waiting-women',
-    'waiting.until',
-    'waiting/and',
     'waitng',
-    'waitning',
-    'waitomo',
-    'waiton',
-    'waitress-work',
-    'waitrose&pound;s',
-    'waitrose-lifting',
-    'waits-esque',
-    'waits-soundtracked',
-    'waits/worcester',
-    'waitzkin',
-    'waitzstrasse',
-    'waivered',
-    'waivor',
-    'waizero',
-    'wakaba',
     'wakamba',
-    'wakarusa',
-    'wakasa',
-    'wake-up-a-poet-or-a-madman',
-    'wake.',
-    'wake_as',
-    'wakebridge',
-    'wakefield0',
-    'wakefully',
-    'wakeham/complainant',
-    'wakeing',
-    'wakema',
-    'wakenin\'',
-    'waker',
-    'wakesfield',
-    'wakesome',
     'wakest',
-    'waketh',
-    'wakin\'',
-    'waking-nightmare',
-    'wakitipu',
-    'wakley',
-    'wakley/ledbury',
-    'wakunai',
-    'wakwoya',
-    'wakynge',
-    'wal-hijra',
-    'walas',
-    'walberton',
-    'walbrood',
-    'walbrzych',
-    'walcha',
     'walcker',
-    'walcock',
-    'walcote',
-    'walcottana',
-    'walcotti',
-    'walczak',
-    'walda',
-    'waldau',
-    'waldberg',
-    'waldbezirk',
-    'waldbott',
-    'waldburg',
-    'walde',
-    'waldeck',
-    'waldegard',
-    'waldegate',
     'waldemme',
-    'waldenberg',
-    'waldensian',
-    'waldheim-kohl',
-    'waldhorn',
-    'waldia',
-    'walding',
-    'waldorf-style',
-    'waldram',
-    'waldram/chef',
-    'waldrapp',
-    'waldridge',
-    'waldron/sotheby',
-    'waldrond-skinner',
-    'waldrons',
-    'waldstatten',
     'waldstein',
-    'walega',
-    'wales&rehy;based',
-    'wales\'/astrologer',
-    'wales/',
-    'wales/duchess',
-    'walesby',
-    'waleska',
-    'waleston',
-    'waletsky',
-    'walfish',
-    'walford/herefordshire',
-    'walgate',
-    'walia',
-    'walians',
-    'waligorskitransport',
     'walimu',
-    'waliss',
-    'walk&rehy;over',
-    'walk\'',
-    'walk-',
-    'walk-abouts',
-    'walk-down',
-    'walk-easy',
-    'walk-ed',
-    'walk-forward',
-    'walk-mill',
-    'walk-n-lock',
-    'walk-ons',
-    'walk-overs',
-    'walk-round',
-    'walk-to',
     'walk-trip',
-    'walk/of',
-    'walk/run',
-    'walkaboutabit',
-    'walkait',
-    'walkathons',
-    'walke',
-    'walked-in',
-    'walked_to_and',
-    'walkedst',
-    'walkenshaw/md/jaguar',
-    'walker&rehy;on-water',
-    'walker-ee',
-    'walker-friendly',
-    'walker-orientated',
-    'walker-run',
     'walker-shaw',
-    'walker-warburg',
-    'walker-webb/hotelier',
-    'walker-written',
-    'walker/actor',
-    'walker/car',
-    'walker/cashier',
-    'walker/chess',
-    'walker/chilterns',
-    'walker/economist',
-    'walker/farmer',
-    'walker/ici',
-    'walker/independents',
-    'walker/instructor',
-    'walker/member/conservative',
-    'walker/motor',
     'walker/oxfam',
-    'walker/scrambler',
-    'walker/tesco',
-    'walker/vet',
-    'walker:i',
-    'walkerafter',
-    'walkereducation',
-    'walkerhouse',
-    'walkeri',
-    'walkers-on',
-    'walkers/aircrafts',
-    'walkersteel',
-    'walkersville',
-    'walkes',
-    'walkest',
-    'walki',
     'walkiey',
-    'walkin',
-    'walking-boots',
-    'walking-cycling-bus-using',
-    'walking-hat',
-    'walking-off-into-the-desert-at-the-end-movie',
-    'walking-on-eggs',
-    'walking-pace',
-    'walking-shoes',
-    'walking-stick-in-the-hand',
-    'walking-time',
-    'walking/backpacking',
-    'walking/talking',
-    'walking_apart',
-    'walkingly',
-    'walkingtons',
     'walkland',
-    'walkman-like',
-    'walkman-sized',
-    'walkman-style',
-    'walkman-type',
-    'walkman-zzzsssss',
-    'walkonsky',
-    'walks.',
-    'walks/treasure',
-    'walks_away',
-    'walkstations',
-    'walkup',
-    'walkwayed',
-    'walkworth',
-    'wall&mdash;the',
-    'wall&oslash;e',
     'wall&rehy;and',
-    'wall&rehy;covering',
-    'wall&rehy;coverings',
-    'wall&rehy;lizards',
-    'wall\'',
-    'wall-',
-    'wall-alley',
-    'wall-bashing',
-    'wall-bed',
-    'wall-blood',
-    'wall-board',
-    'wall-boards',
-    'wall-bound',
-    'wall-bracket',
-    'wall-builder',
-    'wall-builders',
     'wall-cabinet',
-    'wall-calendar',
-    'wall-chart',
-    'wall-climbing',
-    'wall-clinging',
-    'wall-courses',
-    'wall-cut',
-    'wall-end',
-    'wall-exhibition',
-    'wall-fireplace',
-    'wall-fixed',
-    'wall-fixing',
-    'wall-flower',
-    'wall-flowers',
-    'wall-forced',
-    'wall-fresco',
     'wall-head',
-    'wall-heaters',
-    'wall-hooks',
-    'wall-ladder',
-    'wall-light',
-    'wall-map',
-    'wall-mirror',
-    'wall-mount',
-    'wall-nest',
-    'wall-nosed',
-    'wall-of-money',
-    'wall-panel',
-    'wall-panels',
-    'wall-papers',
-    'wall-peg',
-    'wall-phone',
     'wall-plane',
-    'wall-planner',
-    'wall-plaque',
-    'wall-plate',
-    'wall-plug',
-    'wall-posters',
-    'wall-power',
-    'wall-racks',
-    'wall-rail',
-    'wall-recessed',
-    'wall-region',
-    'wall-reliefs',
-    'wall-roof',
-    'wall-scounces',
-    'wall-size',
-    'wall-space',
     'wall-speaker',
-    'wall-standing',
-    'wall-tablet',
-    'wall-texts',
-    'wall-thickness',
-    'wall-to-ceiling',
-    'wall-to-gate',
-    'wall-to-wall-carpeted',
-    'wall-tops',
-    'wall-trenches',
-    'wall-units',
-    'wall-walks',
-    'wall-washer',
-    'wall-washers',
-    'wall-washing',
-    'wall.66',
     'wall/',
-    'wall/ceiling',
-    'wall/thames',
-    'wallabee',
-    'wallabee-shod',
-    'wallabees',
-    'wallace(2.9)',
-    'wallace-hadrill',
-    'wallace-reader',
-    'wallace-readers',
-    'wallace-ruddock',
-    'wallace/general',
-    'wallace/horton',
-    'wallace/ndlove',
-    'wallace/sane',
-    'wallachs',
     'wallacian',
-    'wallala',
-    'wallali',
-    'wallam',
-    'wallan',
-    'walland',
-    'wallaroo',
-    'wallasey-based',
-    'wallberg',
-    'wallborder',
-    'wallbridge',
-    'wallcrouch',
-    'wallend',
-    'waller/berkeley',
-    'wallerant',
-    'wallering',
     'wallet-busting',
-    'wallet-first',
-    'wallfisch/goodwin/',
-    'wallfixings',
-    'wallful',
-    'wallfuls',
-    'wallhanging',
-    'wallheath',
-    'wallich-clifford',
-    'wallingfen',
-    'wallington/carshalton',
-    'wallington/london',
-    'wallingtons',
-    'wallins',
-    'wallis/alpine',
-    'wallis/conservation',
     'wallisdown',
-    'wallisellen',
-    'wallises',
-    'wallisian',
-    'wallisii',
-    'wallkill',
-    'wallonie',
-    'walloonian',
-    'wallopin\'',
-    'wallpaintings',
-    'wallpanels',
-    'wallpaper-coating',
-    'wallpaper-like',
-    'wallpaper-stripper',
-    'wallplaster',
-    'wallraf-richartz-museum',
     'wallraff',
-    'wallright',
-    'wallrocks',
-    'walls&lsqb;with',
-    'walls&mdash;shop',
-    'walls-lined',
-    'walls.',
-    'walls.the',
-    'walls/fences/hedges',
-    'wallscot',
-    'wallscreens',
-    'wallsend-based',
-    'wallsend-on-tyne',
-    'wallshield',
-    'wallspace',
-    'wallstr&ouml;m',
     'wallula',
-    'wallwalk',
-    'wallwood',
-    'wallworth',
-    'wally-wally',
-    'wallybaldi',
-    'wallyclose',
-    'wallyworld',
-    'walmart',
-    'walmesley',
-    'walmington-on-sea',
-    'walne',
-    'walnut-coloured',
-    'walnut-framed',
-    'walnut-like',
-    'walnut-trees',
     'walnut-veneer',
-    'walnuts.',
-    'walnutt-tree',
-    'walnuttree',
-    'walo',
-    'walp',
-    'walpen',
-    'walpolean',
-    'walpurgisnacht',
-    'walraven',
-    'walrond/judge',
-    'walrund-skinner',
-    'walrus-ivory',
-    'wals',
-    'walsal',
-    'walsall-brownhilis',
     'walsall-lichfield',
-    'walsch',
-    'walschaerts',
-    'walsegg-stuppach',
-    'walserhoff',
-    'walserian',
-    'walseth',
-    'walsh-dunseith',
-    'walsh/gloucestershire',
-    'walsh/victim',
-    'walsin-lihwa',
-    'walske',
-    'walston',
-    'walter-i',
-    'waltercio',
-    'waltered',
     'walters/ici',
-    'walters/models',
-    'walterus',
-    'walthall',
-    'walthamstow-based',
-    'walthamstowe',
-    'walthe',
-    'waltheof',
-    'walther.3s',
-    'walthers',
-    'walthomstow',
-    'waltisperg',
-    'waltner',
-    'walton-le-dale',
-    'walton/award',
-    'walton/conservative',
     'walton/mother',
-    'walton/plum',
-    'waltonian',
-    'waltonon-thames',
-    'waltraud',
-    'waltrop',
-    'waltz\'',
-    'waltzers',
-    'waltzog',
-    'walubita',
-    'walus',
-    'walvale',
-    'walwyns',
-    'waly',
-    'wamae',
-    'wambizi',
     'wambu',
-    'wammock',
-    'wamp',
-    'wampers',
-    'wamsley',
-    'wamstead',
-    'wamytan',
-    'wan&rehy;stead',
-    'wanatabe',
-    'wanbon',
-    'wancke',
-    'wand\'rin',
-    'wand\'rin\'',
-    'wand\'ring',
-    'wand-bearing',
-    'wand-like',
     'wandali',
-    'wander-lust',
-    'wandering-eyed',
-    'wandering-hero',
-    'wanderings.',
-    'wanderlands',
-    'wandern',
-    'wanderstock',
-    'wanderungen',
-    'wanderwege',
-    'wandjnina',
-    'wandlike',
-    'wandlitz',
-    'wandoo',
-    'wandrin\'',
-    'wandrum',
     'wandsbeck',
-    'wandy',
-    'wang/ibm',
-    'wangara',
-    'wangdat',
-    'wangdi',
-    'wanged',
-    'wangels',
-    'wanging',
-    'wangkananond',
-    'wangling',
-    'wango',
-    'wangri',
-    'wangst',
-    'wangy',
-    'wanigans',
     'wanigeskera',
-    'wanit',
-    'wanita',
-    'wanjau',
-    'wanjik',
-    'wanjiru',
-    'wank-happy',
-    'wank-noise',
-    'wankable',
-    'wankcore',
-    'wanker.',
-    'wankish',
-    'wankpit',
-    'wanky-wanky',
-    'wanlace',
-    'wanna-be',
     'wanna-be-black',
-    'wannamaker',
-    'wannan',
-    'wanneria',
-    'wanning',
-    'wannoo',
-    'wannop',
-    'wannstedet',
-    'wannu',
-    'wanny',
-    'wanrs',
-    'wansborough-jones',
-    'wansfell',
-    'wansum',
-    'want&mdash;within',
-    'want\'-',
     'want-ads',
-    'want-creation',
-    'want-me',
-    'want-would',
-    'want.let',
-    'want.you',
-    'want/',
-    'want/do',
-    'want/original',
-    'want:tax',
-    'wantage-based',
-    'wantagh',
-    'wantaim',
-    'wanted&mdash',
-    'wanted&mdash;with',
-    'wanted\'',
     'wanted-not',
-    'wanted/expected',
-    'wanted_no',
-    'wanteth',
-    'wanting/',
-    'wanting/not',
-    'wantok',
-    'wantoning',
-    'wants_rather',
-    'wantta',
-    'wantth',
-    'wanya',
-    'waoranini',
-    'wap',
-    'wapakabulo',
-    'wapenplein',
     'wapenshaws',
-    'wapentak',
-    'waple',
-    'wapner',
-    'wappin',
-    'wappin\'',
-    'wappin\'.',
-    'waptass',
-    'wapu',
-    'wapyng',
-    'waqar-jack',
-    'waqf',
-    'waqqas',
-    'waquar',
-    'war&mdash',
-    'war&mdash;interstate',
     'war&ndash;del',
-    'war&rehy;mad',
-    'war&rehy;weary',
-    'war&rehy;winning',
-    'war*',
-    'war-based',
-    'war-booty',
-    'war-broken',
-    'war-chargers',
-    'war-chief',
-    'war-control',
-    'war-crazed',
-    'war-cries',
-    'war-crime',
-    'war-criminals',
-    'war-crippled',
     'war-damage',
-    'war-dancing',
-    'war-dead',
-    'war-devastated',
-    'war-disrupted',
-    'war-dogs',
-    'war-dulled',
-    'war-engendered',
-    'war-engines',
-    'war-era',
-    'war-exhausted',
-    'war-film',
-    'war-game',
-    'war-gamers',
-    'war-harbour',
-    'war-hero',
     'war-hits',
-    'war-horns',
-    'war-in',
-    'war-indeed',
-    'war-indemnity',
-    'war-ing',
-    'war-issue',
-    'war-jolly',
-    'war-levies',
-    'war-loan',
-    'war-lords',
-    'war-machine',
-    'war-mongerers',
-    'war-navies',
-    'war-navy',
-    'war-obsessed',
     'war-orphans',
-    'war-pageantry',
-    'war-parties',
-    'war-patrol',
-    'war-picture',
-    'war-planes',
-    'war-planning',
-    'war-play',
-    'war-profiteering',
-    'war-readiness',
-    'war-record',
-    'war-relief',
-    'war-ridden',
-    'war-risk',
-    'war-room',
-    'war-seasoned',
     'war-slogan',
-    'war-song',
-    'war-songs',
-    'war-spears',
-    'war-sport',
-    'war-strategy',
-    'war-surplus',
-    'war-there',
-    'war-trains',
-    'war-type',
-    'war-u-like',
-    'war-wagons',
-    'war-war',
-    'war-whooping',
-    'war-worn',
-    'war-writers',
     'war.d\'indy',
-    'war.elizabeth',
-    'war.time',
-    'war/peace',
-    'war9',
-    'war_in',
-    'waragi',
-    'warau',
-    'warbah',
-    'warbank',
-    'warbird-dominated',
-    'warbleton',
-    'warblette',
-    'warbleys',
-    'warborough',
-    'warbrook',
     'warburgian',
-    'warburgiana',
-    'warcupporum',
-    'ward&ndash;s',
-    'ward-baker',
-    'ward-changes',
-    'ward-made',
-    'ward-maid',
-    'ward-of-court',
-    'ward-room',
-    'ward.after',
-    'ward.doctor',
-    'ward/anesthetist',
-    'ward/archbishop',
-    'ward/ex',
-    'ward/housing',
     'ward/inventor',
-    'ward/patient',
-    'ward/senior',
-    'ward/unit',
-    'ward/weightlifter',
-    'warda',
-    'wardale',
-    'wardance',
-    'wardars',
-    'warde-aldam/chairman',
-    'warden-aided',
-    'warden-assisted',
-    'warden-pies',
-    'warden-supervised',
-    'warden/new',
-    'wardenclyffe',
     'wardens.',
-    'warderishness',
-    'warderns',
-    'wardership',
-    'warderyg-can',
-    'wardha',
-    'wardia',
-    'wardija',
-    'wardle/alan',
-    'wardles',
-    'wardner',
-    'wardour-street',
-    'wardown',
-    'wardro',
-    'wardrobe-keepers',
-    'wardrobe-room',
     'wardrober',
-    'wardrooms',
-    'wards/departments',
-    'wardsby',
-    'wardsman',
-    'wareh',
-    'warehorne',
-    'warehouse-breaker',
-    'warehouse-club',
-    'warehouse-sized',
-    'warehouse/fluxshop',
-    'warehousefuls',
-    'warehousekeeper',
-    'warehouselike',
-    'warehouses-turned-art-galleries',
-    'warehouses.',
     'warehousetype',
-    'warehousing/office',
-    'warel',
-    'warell',
-    'waremquelle',
-    'warenford',
-    'warer',
-    'wares-but',
-    'waresley',
-    'warf',
-    'warfare.',
-    'wargaming',
-    'wargovich',
-    'warhawk',
-    'warholian',
-    'warhols',
     'warhorn',
-    'warhost',
-    'warhouse',
-    'warhust',
-    'warings',
-    'wark-like',
-    'wark/pig',
-    'warki',
-    'warkton',
-    'warlaby',
-    'warld',
-    'warless',
-    'warlock/consultant',
-    'warlordism',
-    'warlustful',
-    'warm-bodied',
     'warm-by',
-    'warm-climate',
-    'warm-clinical',
-    'warm-cold',
-    'warm-eyed',
-    'warm-heartedness',
-    'warm-hot',
-    'warm-side',
-    'warm-sounding',
-    'warm-temperate',
-    'warm-toned',
-    'warm-ups.',
-    'warm/cool',
-    'warm/empathetic/sensitive',
-    'warman/daughter',
-    'warmblooded',
     'warmd',
-    'warmed-over',
-    'warmer-feeling',
-    'warmfield',
-    'warmharbour',
-    'warmheartedness',
-    'warming-pans',
-    'warmingly',
-    'warmly-contested',
-    'warmly-lit-scene',
-    'warmly-offered',
-    'warmly.',
-    'warmoth-made',
-    'warmp',
-    'warmseal',
-    'warmth-coldness',
     'warmth-thickness',
-    'warmth.',
-    'warmth.you',
-    'warmthline',
-    'warmths',
-    'warmwell',
-    'warn-off',
-    'warnaeera',
-    'warnapura',
-    'warne-holland',
-    'warne/friend',
-    'warned-does',
-    'warneken',
-    'warner-lambert',
-    'warner/',
-    'warner/reprise',
     'warner/wilts',
-    'warneria',
-    'warneton',
-    'warney',
-    'warnford-the-mad',
-    'warni',
-    'warnin',
-    'warning-coloured',
-    'warning-cries',
-    'warning-system',
-    'warnings.chris',
-    'warnings.the',
-    'warnink',
-    'warnock-style',
-    'warnography',
-    'warnung',
     'warp-drive',
-    'warp-eddy',
-    'warp-form',
-    'warp-monkeys',
-    'warp-psychosis',
-    'warp-scope',
-    'warp-sharing',
-    'warp-space',
-    'warp-threads',
-    'warp-time',
-    'warp-walking',
-    'warp-world',
-    'warpage',
-    'warped.',
-    'warple',
-    'warpship',
     'warpships',
-    'warpu',
-    'warrack',
-    'warramungu',
-    'warrand',
-    'warrant-bond',
-    'warrant-holders',
-    'warrant-less',
-    'warrant-officer',
-    'warranties/duty',
-    'warrao',
-    'warrappened',
-    'warrau',
-    'warray',
-    'warrem',
-    'warren-wilson',
     'warren/cheltenham',
-    'warren/head',
-    'warren/homeless',
-    'warren/west',
-    'warrendale',
-    'warrenes',
-    'warrening',
-    'warrening/rabbit',
-    'warres',
-    'warrick',
-    'warricker',
-    'warrier',
-    'warrings',
-    'warrington-skelton',
-    'warrington-smith',
-    'warrington30',
     'warrior\'',
-    'warrior-lords',
-    'warrior-monks',
-    'warrior-race',
-    'warrior-retinue',
-    'warrior-sorcerers',
-    'warrior-who-would-kidnap-a-bride',
-    'warriorhood',
-    'warrs',
-    'wars\'-see',
-    'warsaw-kiev',
-    'warsaw-pact',
-    'warsawians',
-    'warshal',
-    'warshattered',
-    'warshawski',
     'warsheik',
-    'warship-building',
-    'warshow',
-    'warsickness',
-    'warsjawski',
-    'warsome',
-    'warszawa',
-    'warszawy',
-    'wart-biters',
-    'wart-charmer',
-    'wart-face',
-    'wart-hogs',
-    'warta',
-    'warth',
-    'warthe',
-    'warthill',
     'warthin-starry',
-    'warthogs',
-    'wartick',
-    'warties',
-    'wartime-approved',
-    'wartling',
-    'wartofsky',
-    'wartre',
-    'wartridge',
-    'warumungu',
-    'warw',
-    'warwara',
-    'warwhoop',
-    'warwich',
-    'warwickists',
-    'warwicks-based',
     'warwickshire.so',
-    'warwickshire/leicestershire',
-    'warwikshire',
-    'wary-eyed',
-    'was&mdash;a',
-    'was&mdash;how',
-    'was&mdash;is&mdash;there',
-    'was&mdash;marginal',
-    'was&mdash;she',
-    'was&ndash;a',
-    'was&ndash;forced',
-    'was&ndash;only',
-    'was\'t',
-    'was-and',
-    'was-carefully',
-    'was-covered',
     'was-flying',
-    'was-in',
-    'was-it',
-    'was-mentally',
-    'was-must',
-    'was-no',
-    'was-not',
-    'was-one',
-    'was-the',
-    'was-the-risk-exaggerated',
-    'was-there',
-    'was-there-a-mr-qualtrough',
-    'was-there-something-else',
-    'was.delivered',
-    'was.here',
-    'was.she',
     'was/',
-    'was_a_little_graze_on_top_of_the_skin_.',
-    'was_all_the',
-    'was_due',
-    'was_less',
-    'was_none',
-    'was_out',
-    'was_over',
-    'was_so',
-    'was_sort',
-    'was_such',
-    'wasabe',
-    'wasactively',
-    'wasaga',
-    'wasalso',
-    'wasan',
     'wasborough/pickerd',
-    'waschen',
-    'wasconia',
-    'waselle',
-    'wasey',
-    'wasfounded',
-    'wash&rehy;severn',
-    'wash\'n\'wear',
-    'wash\'ouse',
-    'wash-',
-    'wash-\'n\'-make-up',
-    'wash-and-wear-ability',
-    'wash-baskets',
-    'wash-cloth',
-    'wash-cubicles',
-    'wash-days',
     'wash-fastness',
-    'wash-hand-basin',
-    'wash-hoos',
-    'wash-in',
-    'wash-it-and-leave-it',
-    'wash-leather',
-    'wash-o-rama',
-    'wash-off',
-    'wash-out-colour',
-    'wash-stands',
-    'wash-through',
-    'washash',
-    'washbag',
-    'washbags',
-    'washboards',
-    'washboiler',
     'washbottle',
-    'washbourn',
-    'washbowl',
-    'washbowls',
-    'washburndale',
-    'washcloth',
-    'washed-away',
-    'washed-down',
-    'washed-out-creature',
-    'washee',
-    'washen',
-    'washer-driers',
-    'washer-dryer',
-    'washer/jumper',
-    'washford',
-    'washier',
     'washing-bag',
-    'washing-down',
-    'washing-his-hands-of-the-matter',
-    'washing-lines',
-    'washing-off',
-    'washing-poles',
-    'washing-post',
-    'washing-powders',
-    'washing-stand',
-    'washing-stones',
-    'washing-up\'',
-    'washing-up-liquids',
-    'washing/drying',
-    'washingly',
-    'washington-area',
-    'washington-bound',
     'washington-starring',
-    'washita',
-    'washkit',
-    'washleathers',
-    'washmill',
-    'washnay',
-    'washoping',
-    'washplace',
-    'washstand-basin',
-    'washwater',
-    'washway',
-    'washwell',
-    'wasington',
-    'wasley/gloucestershire',
-    'wasmosy',
-    'wasn\'',
     'wasn\'t+',
-    'wasn\'t-',
-    'wasn\'t-how',
-    'wasna',
-    'wasniowski',
-    'waso',
-    'wasoff',
-    'wasp-green',
-    'wasp-nematode',
-    'wasp-nests',
-    'wasp-prison',
-    'wasp-sized',
-    'wasp-tail',
-    'wasp-waist',
-    'wasp-y',
-    'waspgrubs',
     'waspie-waisted',
-    'waspishness',
-    'wasplike',
-    'wasps.it',
-    'wasps13',
-    'wasps13pts',
-    'waspwaisted',
-    'waspy',
-    'wasr',
-    'wassat',
-    'wassenaar',
-    'wasserfallboden',
-    'wasserkirche',
-    'wasserschutz',
-    'wasserstom',
-    'wasshoi-wasshoi',
     'wassilij',
-    'wassle',
-    'wasste',
-    'wast-level',
-    'wastdale',
-    'waste&rehy;it',
-    'waste&rehy;paper',
-    'waste\'',
-    'waste-assimilating',
-    'waste-decomposing',
-    'waste-export',
-    'waste-factory',
-    'waste-free',
-    'waste-fuel',
-    'waste-incineration',
-    'waste-lots',
     'waste-of-time',
-    'waste-pipes',
-    'waste-reduction',
-    'waste-smuggling',
-    'waste-sorting',
-    'waste-stream',
-    'waste-that',
-    'waste-watch',
-    'waste/recycled',
-    'waste/soil',
-    'wastebins',
-    'wasted-the',
-    'wasted-through',
-    'wastede',
-    'wasteland.',
-    'wastepaperbasket',
     'wastern',
-    'wastes.',
-    'wastesite',
-    'wasteth',
-    'wastewagon',
-    'wastfield',
-    'wastiaux',
-    'wastoid',
-    'wastoids',
-    'wasun',
-    'wasvery',
-    'wasylikowa',
-    'watabid',
-    'watadar',
-    'watana',
-    'watani',
     'watarah',
-    'watch-',
-    'watch-a',
-    'watch-alarm',
-    'watch-alarms',
-    'watch-chains',
-    'watch-change',
-    'watch-dog',
-    'watch-dogs',
-    'watch-face',
-    'watch-fires',
-    'watch-keeper',
-    'watch-key',
-    'watch-maker',
-    'watch-makers',
-    'watch-making',
     'watch-out',
-    'watch-post',
-    'watch-replacement',
-    'watch-station',
-    'watch-style',
-    'watch-vessels',
-    'watch-worthy',
-    'watch/',
-    'watcham',
-    'watchbell',
-    'watchcase',
-    'watchcase-makers',
-    'watchcases',
-    'watchdog\'',
-    'watched-for',
-    'watched-not',
     'watched/felt/learned',
-    'watcherdoin\'',
-    'watches.truth',
-    'watchfulnesses',
-    'watchguard',
-    'watchin',
-    'watchinghimself',
-    'watchit',
-    'watchkeepers',
-    'watchman\'s',
-    'watchmead',
-    'watchmenders-cum-jewellers',
-    'watchpoint',
-    'watchstrap',
-    'watchstraps',
-    'watchton',
     'watcombe',
-    'wate',
-    'water&mdash;needed',
-    'water&rehy;based',
-    'water&rehy;free',
-    'water&rehy;repellent',
-    'water&rehy;retaining',
-    'water&rehy;shed',
-    'water&rehy;table',
-    'water&rehy;taxi',
-    'water\'',
-    'water-action',
-    'water-affected',
-    'water-babies',
-    'water-baby',
-    'water-bags',
     'water-balance',
-    'water-bearer',
-    'water-beds',
-    'water-beetles',
-    'water-bodies',
-    'water-boosted',
-    'water-born',
-    'water-break',
-    'water-breathing',
-    'water-breeding',
-    'water-brooks',
-    'water-bubbling',
-    'water-bull',
-    'water-bus',
-    'water-call',
-    'water-carriers',
     'water-castle',
-    'water-channels',
-    'water-chestnut',
-    'water-closets',
-    'water-clover',
-    'water-clovers',
-    'water-coated',
-    'water-colorist',
-    'water-coloured',
-    'water-concious',
-    'water-conduit',
-    'water-conserving',
-    'water-consuming',
-    'water-containers',
-    'water-content',
-    'water-control',
     'water-coupled',
-    'water-creatures',
-    'water-crossing',
-    'water-crossings',
-    'water-culture',
-    'water-cum&rehy;jolly',
-    'water-cum-jolly',
-    'water-cures',
-    'water-current',
-    'water-cylinder',
-    'water-depths',
-    'water-development',
-    'water-dipping',
-    'water-discolouring',
-    'water-distribution',
-    'water-dodgems',
     'water-doused',
-    'water-draining',
-    'water-drop',
-    'water-drops',
-    'water-dropwort',
-    'water-edge',
-    'water-efficient',
-    'water-eggs',
-    'water-fairy',
-    'water-falls',
-    'water-filling',
-    'water-filterers',
-    'water-floored',
-    'water-friendly',
-    'water-front',
-    'water-fun',
     'water-gardener',
-    'water-gas',
-    'water-gifted',
-    'water-gilded',
-    'water-gilding',
-    'water-glasses',
-    'water-globe',
-    'water-goddesses',
-    'water-grasses',
-    'water-green',
-    'water-guzzling',
-    'water-hardness',
-    'water-hazard',
-    'water-hen',
-    'water-hoses',
-    'water-hungry',
     'water-ices',
-    'water-in-the-diesel',
-    'water-injected',
-    'water-injection',
-    'water-knowledge',
-    'water-laden',
-    'water-leaf',
-    'water-licking',
-    'water-life',
-    'water-lines',
-    'water-lions',
-    'water-loading',
-    'water-loss',
-    'water-maidens',
-    'water-mattress',
-    'water-meadow',
     'water-milfoil',
-    'water-miscible',
-    'water-music',
-    'water-nymphs',
-    'water-only',
-    'water-owners',
-    'water-pale',
-    'water-party',
-    'water-permeable',
-    'water-pick',
-    'water-piece',
-    'water-pigs',
-    'water-pipe',
-    'water-play',
-    'water-poet',
-    'water-polluting',
     'water-pollution',
-    'water-pools',
-    'water-pot',
-    'water-pots',
-    'water-pressure',
-    'water-pricing',
-    'water-privatization',
-    'water-pumps',
-    'water-race',
-    'water-rafting',
-    'water-rat',
-    'water-rates',
-    'water-repellency',
-    'water-repelling',
-    'water-resource',
-    'water-retention',
     'water-retentive',
-    'water-rich',
-    'water-rights',
-    'water-roots',
-    'water-roughened',
-    'water-rower',
-    'water-rudder',
-    'water-sampling',
-    'water-scrubber',
-    'water-sensitivity',
-    'water-shadows',
-    'water-shedding',
-    'water-shifting',
-    'water-side',
-    'water-sieve',
-    'water-ski-but',
     'water-skied',
-    'water-skiiing',
-    'water-smeared',
-    'water-snake',
-    'water-sodden',
-    'water-softener',
-    'water-softeners',
-    'water-source',
-    'water-spider',
-    'water-splashed',
-    'water-sports',
-    'water-spray',
-    'water-spraying',
-    'water-sprinkler',
-    'water-sprinkling',
-    'water-stains',
     'water-stick',
-    'water-storage',
-    'water-stressed',
-    'water-strewn',
-    'water-style',
-    'water-tanker',
-    'water-testing',
-    'water-thin',
-    'water-thinned',
-    'water-to',
-    'water-torture',
-    'water-towers',
-    'water-traffic',
-    'water-trees',
-    'water-tricks',
-    'water-tube',
     'water-turtle',
-    'water-usage',
-    'water-users',
-    'water-vendor',
-    'water-vole',
-    'water-washed',
-    'water-weed',
-    'water-when',
-    'water-whistle',
-    'water-white',
-    'water-wise',
-    'water-work',
-    'water-works',
-    'water-world',
-    'water.',
-    'water.and',
     'water.having',
-    'water.he',
-    'water.jugs',
-    'water.just',
-    'water.soluble',
-    'water/ditches',
-    'water/gas',
-    'water/mud',
-    'water/ore/dross',
-    'water/vinegar/herbs/garlic',
-    'water:352',
-    'water:flash',
-    'water_on',
-    'waterbabes',
-    'waterballasted',
-    'waterballistic',
     'waterbearing',
-    'waterboard',
-    'waterboats',
-    'waterbrash',
-    'waterbucket',
-    'waterbug',
-    'waterbury',
-    'waterbuster',
-    'waterbutt',
-    'watercarts',
-    'waterchute',
-    'watercolors',
-    'watercoloured',
-    'watercolours:1750&ndash;1880',
-    'watercombe',
-    'watercreeks',
     'watercress-flavoured',
-    'watercrowfoot',
-    'watercut',
-    'waterdark',
-    'waterdate',
-    'waterdetector',
-    'waterdragon',
-    'waterdripping',
-    'watered&rehy;down',
-    'watereri',
-    'waterfa',
-    'waterfal',
-    'waterfall-collection',
-    'waterfall.',
-    'waterfall/red',
-    'waterfalling',
     'waterfilled',
-    'waterflow',
-    'waterfowl.',
-    'waterfrontage',
-    'watergarden',
-    'watergatery',
-    'watergaw',
-    'waterglass',
-    'waterhead',
-    'waterhens',
-    'waterhouse/bank',
-    'waterhouse/pitcher',
-    'waterhouse/willis',
-    'wateridge',
-    'watering-',
-    'watering-can',
     'watering-canful',
-    'watering-cart',
-    'watering-holes',
-    'watering-places',
-    'watering-time',
-    'waterjets',
-    'waterkeeper',
-    'waterlain',
-    'waterlilies.',
-    'waterlily&rehy;shaped',
-    'waterlily-like',
-    'waterlog',
-    'waterloo\'',
-    'waterloo-bournemouth',
-    'waterloo-exeter',
-    'waterloo-gosforth',
     'waterloo4',
-    'waterlovers',
-    'waterlow',
-    'waterlow.',
-    'watermakers',
-    'waterman_et',
-    'watermargins',
-    'watermarking',
-    'watermill-like',
-    'watermites',
-    'waterpieces',
-    'waterpillow',
-    'waterplant',
-    'waterpool',
-    'waterprice',
-    'waterrower',
     'waters-esque',
-    'waters/trust',
-    'waters/west',
-    'watersafe',
-    'waterscape',
-    'waterscaping',
-    'waterschoot',
-    'waterseller',
-    'watersellers',
-    'watersi',
-    'watersides',
-    'watersides.',
-    'waterski-ing',
-    'waterskied',
-    'waterskin',
-    'waterskins',
     'waterskis',
-    'waterson/estate',
-    'waterspace',
-    'watersprite',
-    'waterstones/w',
-    'watertank',
-    'watertanker',
-    'watertight&mdash;the',
-    'watertightness',
-    'watertroughs',
-    'waterwashing',
-    'waterwitch',
-    'waterwo',
-    'waterworkings',
-    'waterworlds',
-    'waterwort',
     'watery-looking',
-    'watford-st',
-    'watford2',
-    'watfz',
-    'wath-on-dearne',
-    'wath.',
-    'wathel',
-    'wathers',
-    'watherston',
-    'watin',
-    'watkins/archaeologist',
-    'watkins/employer',
-    'watkins/oxfam',
-    'watkins/reuter',
-    'watkinses',
-    'watkinson/eyewitness',
     'watkyns',
-    'watlass',
-    'watlington/oxfordshire',
-    'watlowes',
-    'watmoor',
-    'watney/grand',
-    'watry',
-    'watsa',
-    'watsh',
-    'watson&ndash;crick',
-    'watson-forbes',
-    'watson-jone',
-    'watson-jones',
-    'watson-macdonald',
-    'watson-marlow',
-    'watson-wentworth',
     'watson.points',
-    'watson/bus',
-    'watson/co-author',
-    'watson/england',
-    'watson/former',
-    'watson/lothian',
-    'watson/national',
-    'watson/royal',
-    'watson/victor',
-    'watsonii',
-    'watsonlinc',
-    'watt/public',
-    'watteau-composition',
-    'watteaus',
-    'wattenmaker',
-    'wattenscheid',
     'watterson',
-    'watties',
-    'wattle&rehy;and-daub',
-    'wattle-cheeked',
-    'wattley',
-    'wattling-you',
-    'watton-at-stone',
-    'watton/estate',
-    'watts-per-channel',
-    'watts-russell',
-    'watts/bulmers',
-    'watts/christopher',
-    'watts/fraud',
-    'watts/orcharding',
-    'watts/orchards',
-    'watts/victim',
     'watts_et',
-    'wattwil',
-    'watveare',
-    'watyer',
-    'watzman',
-    'wauchula',
-    'waucquez',
-    'waugh\'',
-    'waugh/west',
-    'waught',
-    'waui',
-    'waulk',
-    'waulsortian',
-    'waun',
-    'waunarlwydd',
-    'waunfawr',
     'waur',
-    'wautcoic',
-    'wavaw',
-    'wave-and-wag',
-    'wave-battered',
-    'wave-break',
-    'wave-caps',
-    'wave-carved',
-    'wave-cast',
-    'wave-chevron',
-    'wave-chroniclers',
-    'wave-cut',
-    'wave-driven',
-    'wave-effect',
-    'wave-embossed',
-    'wave-fever',
     'wave-form',
-    'wave-forms',
-    'wave-front',
-    'wave-function',
-    'wave-functions',
-    'wave-generating',
-    'wave-generators',
-    'wave-guide',
-    'wave-guiding',
-    'wave-height',
-    'wave-jumping',
-    'wave-mechanical',
-    'wave-particle',
-    'wave-power',
-    'wave-preventing',
-    'wave-sliding',
     'wave-smashed',
-    'wave-swept',
-    'wave-tank',
-    'wave-theory',
-    'wave-tom',
-    'wave-tops',
-    'wave-washed',
-    'wave-watchers',
-    'wave.she',
-    'wave4',
-    'wave:three',
-    'waveband.',
-    'wavecaps',
-    'waved-a',
-    'waved.',
-    'wavel',
     'wavelength&rehy;coding',
-    'wavelength-dependent',
-    'wavelength-synchronized',
-    'wavelength-tunable',
-    'waveless',
-    'wavells',
-    'wavemaker',
-    'wavenden',
-    'wavendon/milton',
-    'waveney-class',
-    'waveny',
-    'wavepower',
-    'waverings',
-    'waverley-kings',
-    'waves/24',
-    'waveski',
     'wavesliding',
-    'wavetop',
-    'wavin',
-    'waviness',
-    'wavings',
-    'wavy-coated',
-    'wavy-coloured',
-    'wawking',
-    'wawsczcyk',
-    'wax-ass',
-    'wax-based',
-    'wax-chandler',
-    'wax-chandlers',
-    'wax-choked',
-    'wax-coats',
-    'wax-finished',
     'wax-lined',
-    'wax-moustached',
-    'wax-oil',
-    'wax-patterned',
-    'wax-polished',
-    'wax-tipped',
-    'wax-white',
-    'wax-work',
-    'wax/nile',
-    'waxed.',
-    'waxedst',
-    'waxen-faced',
-    'waxen-yellow',
-    'waxer',
-    'waxers',
-    'waxes.',
     'waxholme/withernsea',
-    'waxiness',
-    'waxler',
-    'waxmoths',
-    'waxoiling',
-    'waxoline',
-    'waxoyl/white',
-    'waxy-cuticled',
-    'waxy-yellow',
-    'way&mdash',
-    'way&mdash;the',
-    'way&mdash;two',
-    'way&rehy;back',
-    'way**',
-    'way-and',
-    'way-clive',
     'way-finding',
-    'way-get',
-    'way-hey',
-    'way-laid',
-    'way-leaves',
-    'way-marked',
-    'way-of-being',
-    'way-points',
-    'way.he',
-    'way.more',
-    'way/oh',
-    'way:s',
-    'way_as',
-    'way_instead',
-    'way_out',
-    'way_so',
     'wayakot',
-    'waye/arms',
-    'wayfinding',
-    'wayght',
-    'waylayers',
-    'waylayings',
-    'wayleave',
-    'waymaster',
-    'wayna',
-    'wayne-hating',
-    'wayne-that-might-have&rehy;been',
-    'wayout',
-    'waypethue',
-    'ways-',
-    'ways-including',
-    'ways.leviticus',
     'waysgooses',
-    'waysiders',
-    'waysides',
-    'wayst',
-    'waystage',
-    'wayter',
-    'wayto',
-    'waywarden',
-    'waza-ari',
-    'wazansky',
-    'wazar',
-    'wazaris',
-    'wazok',
-    'wazste',
-    'wazter',
-    'wazzer',
     'wazzle',
-    'wazzocks',
-    'wb/00/25/0009',
-    'wb/00/26/0009-2',
-    'wb/00/28/0001',
-    'wb/01/25/0006',
-    'wb/01/25/0011',
-    'wb/01/25/0012',
-    'wb/01/25/0013',
-    'wb/01/25/0014',
-    'wb/01/25/0015',
-    'wb/01/25/0016',
-    'wb/01/25/0019',
-    'wb/01/25/0025',
-    'wb/01/25/0026',
-    'wb/01/25/0032',
     'wb/01/25/0034',
-    'wb/01/25/0036',
-    'wb/02/25/0005',
-    'wb/02/25/0006',
-    'wb/02/25/0007',
-    'wb/02/25/0008',
-    'wb/04/25/0012',
-    'wb/05/25/0001',
-    'wb/05/25/0002',
-    'wb/05/25/0003',
-    'wb/05/25/0004',
-    'wb/05/25/0010',
-    'wb/07/25/0001',
-    'wb271',
-    'wb440',
-    'wb505',
     'wbb',
-    'wbbs',
-    'wbc=10322',
-    'wbcp/1/67',
-    'wbcp/22/1811',
-    'wbdc',
-    'wbdf',
-    'wbdm',
-    'wbg',
-    'wbk',
-    'wbl',
-    'wblf',
-    'wbmg',
-    'wbn',
-    'wbps',
-    'wbrc-tv',
     'wbs',
-    'wc\'90',
-    'wc-130',
-    'wc.',
-    'wc/shower',
-    'wc2p',
-    'wc2r0rn',
-    'wc2x',
-    'wced',
-    'wcf',
-    'wcia',
-    'wcj',
-    'wcq',
-    'wcrc',
-    'wcva',
-    'wd-1003-compatible',
     'wd-40',
-    'wd/00/26/0003-4',
-    'wd/00/26/0057',
-    'wd/00/28/0004',
-    'wd/04/25/0000',
-    'wd/04/25/0006',
-    'wd/04/25/0010',
-    'wd/04/25/0011',
-    'wd/04/25/0012',
-    'wd/04/25/0013',
-    'wd/04/25/0015',
-    'wd/04/25/0018',
-    'wd/06/25/0003',
-    'wd/06/25/0004',
-    'wd/06/25/0008',
-    'wd/06/25/0009',
     'wd/06/25/0013',
-    'wd/06/25/0016',
-    'wd/08/25/0007',
-    'wd/08/25/0008',
-    'wd/08/25/0022',
-    'wd/08/25/0024',
-    'wd14c92',
-    'wd1a/6/14/hb/7/ms',
-    'wd21c92',
-    'wd40',
-    'wd6',
-    'wd7',
-    'wd90',
-    'wd90c31',
-    'wdc',
-    'wdex',
     'wdickson',
-    'wdk-u',
-    'wdk-u-generated',
-    'wdldmnlt',
-    'wdlmnlt',
-    'wdltmnlt',
-    'wdr/emi',
-    'wdwk',
-    'wdydze',
-    'we&mdash',
-    'we\'',
-    'we\'ll-believe-it-when-we-see-it',
-    'we\'r',
-    'we\'re-at-the-end-of-the-road',
-    'we\'re4',
-    'we\'vew',
     'we-',
-    'we-177',
-    'we-are-poor-therefore',
-    'we-come-from-place-bilong-far-on-big-bird-that-doesn\'t-go-flap',
-    'we-could',
-    'we-e-e-ll',
-    'we-exclusive-of-addressee',
-    'we-going',
-    'we-got',
-    'we-have-heard-it-all-before',
-    'we-inclusive-of-addressee',
-    'we-know-the-best-for-you',
-    'we-ll',
-    'we-ness',
-    'we-passages',
-    'we-reap-as-we-sow',
     'we-we',
-    'we/',
-    'we/above',
-    'we114',
-    'we_all',
-    'wea/blanco',
-    'weaarrh',
-    'weadall',
-    'weaire',
-    'weak&rehy;ness',
-    'weak&rehy;nesses',
-    'weak\'',
-    'weak-and',
-    'weak-chested',
-    'weak-hearted',
-    'weak-natured',
     'weak-sister',
-    'weak-stem',
-    'weak-stemmed',
-    'weak-stemming',
-    'weak-stomached',
-    'weak-strong-weak',
-    'weak-syllable',
-    'weak-tabby',
-    'weak-tie',
-    'weak-witted',
-    'weake',
-    'weaked',
-    'weakened.',
-    'weaker/dm',
-    'weakest-looking',
-    'weakest.',
     'weakie',
-    'weakling-adolescent',
-    'weakly-developed',
-    'weakly-flying',
-    'weakly-striped',
-    'weakly-structured',
-    'weakness.',
-    'weakness/fever/diarrhoea',
-    'weaknesses&mdash;but',
-    'weaknesses.',
-    'weaknesses/failings',
-    'weald&rehy;based',
-    'wealth-guards',
-    'wealth-holders.',
-    'wealth-losing',
-    'wealth-maximizing',
     'wealth-owners',
-    'wealth-ownership',
-    'wealth-related',
-    'wealth-sharing',
-    'wealthilie',
-    'wealthless',
-    'weaner',
-    'weaner-rearing',
-    'weaning-off',
-    'weaning-trauma',
-    'weanted',
-    'weapon-carrying',
-    'weapon-making',
-    'weapon-minded',
-    'weaponeering',
-    'weapons-carriers',
     'weapons-including',
-    'weapons-makers',
-    'weapons-making',
-    'weapons-motivated',
-    'weapons-procurement',
-    'weapons-wielding',
-    'weapopn',
-    'wear\'st',
-    'wear-ing',
-    'wear-layer',
-    'wear-tees',
-    'wear-the-au-pair-to-a-frazzle',
-    'wearabouts',
-    'wearde',
-    'weares',
-    'wearest',
     'wearfit',
-    'wearhouse',
-    'wearinbg',
-    'wearinesses',
-    'wearing-down-his',
-    'wearing-of',
-    'wearing-out',
-    'wearing-prunella',
-    'wearing/conference',
-    'wearing/holding',
-    'wearingly',
-    'wearings',
-    'wearisomeness',
-    'wearnes',
-    'wearning',
-    'wearside-based',
     'wearwell',
-    'weary-minded',
-    'weary-sounding',
-    'weary-worn',
-    'wearyall',
-    'weasel-pack',
-    'weasel-skins',
-    'weasel-writing',
-    'weaseling-out',
-    'weaselled',
-    'weaselling',
-    'weaselly-looking',
-    'weasenham',
-    'weaseo',
-    'weasep',
-    'weases',
     'weasils',
-    'weasy',
-    'weathampstead',
-    'weather-affected',
-    'weather-board',
-    'weather-boarding',
-    'weather-boards',
-    'weather-browned',
-    'weather-chart',
-    'weather-cloths',
-    'weather-cock',
-    'weather-conditions',
-    'weather-dependent',
-    'weather-fax',
-    'weather-fretted',
-    'weather-front',
     'weather-glass',
-    'weather-hard',
-    'weather-hardened',
-    'weather-head',
-    'weather-man',
-    'weather-out',
-    'weather-prone',
-    'weather-protection',
-    'weather-ravaged',
-    'weather-reddened',
-    'weather-related',
-    'weather-resisting',
-    'weather-satellite',
-    'weather-seamed',
-    'weather-sensitive',
-    'weather-storm',
     'weather-vanes',
-    'weather-watcher',
-    'weather-watchers',
-    'weather-watching',
-    'weather-weary',
-    'weather-wise',
-    'weather/travel',
-    'weatherability',
-    'weatherall-produced',
-    'weatheralls',
-    'weatherbee',
-    'weathercaster',
-    'weathercocks',
-    'weathercockwise',
-    'weathercotes',
-    'weatherdome',
     'weathered\'',
-    'weatherfaxes',
-    'weatherfields',
-    'weatherford',
-    'weatherforecaster',
-    'weatherhood',
-    'weathering-limited',
-    'weatherless',
-    'weatherly',
-    'weathermen/women',
-    'weathernly',
-    'weatherperson',
-    'weatherproofness',
-    'weatherresistant',
-    'weatherseal',
-    'weatherside',
     'weatherstrip',
-    'weathersuits',
-    'weathertightness',
-    'weatherup',
-    'weathervane-fiend',
-    'weatherws30',
-    'weatherws34',
-    'weatherws40',
-    'weatherzoom',
-    'weave\'',
-    'weave-on',
-    'weaver-cottagers',
-    'weaver-finch',
-    'weaver/farmer',
-    'weaver/resident',
-    'weaverfish',
     'weavermaster',
-    'weaving-mills',
-    'weaving-shed',
-    'weazel',
-    'web-fed',
-    'web-groups',
-    'web-like',
-    'web-making',
-    'web-offset',
-    'web-threads',
-    'webb-pomerene',
-    'webb-something',
-    'webb/angler',
-    'webb/angling',
-    'webb/beverley',
-    'webb/competitor',
     'webb/dietician',
-    'webb/driver',
-    'webb/fundraiser',
-    'webb/gloucestershire',
-    'webb/international',
-    'webb/paediatrician',
-    'webb/skipper',
-    'webb/stonemason',
-    'webber/freddie',
-    'webbian',
-    'webbley-stone',
-    'weberian/fordist',
-    'weberish',
-    'webern-like',
-    'webh',
-    'weblen',
     'webley.455',
-    'weblin/owner',
-    'weblin/rosie',
-    'webs.',
-    'webscott',
-    'websdell',
-    'websper',
-    'webster-reynolds-stuart',
-    'wechsel',
-    'weclome',
-    'wed&ndash;thu',
-    'wed-nes-day',
-    'wed-spinning',
-    'wed-sun',
-    'weddedness',
-    'weddelli',
     'weddells',
-    'wedding&rehy;cake',
-    'wedding-album',
-    'wedding-cake-style',
-    'wedding-clothes',
-    'wedding-finger',
-    'wedding-gift',
-    'wedding-guest',
-    'wedding-party',
-    'wedding-presents',
-    'wedding-reception',
-    'wedding-related',
-    'wedding-ringless',
-    'wedding-rings',
-    'wedding-sari',
-    'wedding.the',
     'wedding/divorce',
-    'weddinges',
-    'weddings/engagements',
-    'weddington',
-    'weddingtons',
-    'weddlebeach',
-    'weddw',
-    'wedeking',
-    'wedel/holstein',
-    'wedemeier',
-    'wedford',
-    'wedge&rehy;shaped',
-    'wedge-faced',
-    'wedge-roll',
-    'wedge-soled',
-    'wedge-style',
     'wedge-tilt',
-    'wedgeblock',
-    'wedged-open',
-    'wedged-shaped',
-    'wedgefoot',
-    'wedgeknock',
-    'wedgewood-benn',
-    'wedghogs',
-    'wedhampton',
-    'wedlake',
-    'wedlam',
-    'wedlocks',
-    'wednasday',
-    'wedneday',
-    'wednedsay',
-    'wednes',
     'wednesd',
-    'wednesday&mdash;saturday',
-    'wednesday\'',
-    'wednesday-',
-    'wednesday-bound',
-    'wednesday11',
-    'wednesday2',
-    'wedon',
-    'wedren',
-    'wee\'uns',
-    'wee-ha',
-    'wee-hey',
-    'wee-hours',
-    'wee-it',
-    'wee-wee-wee',
-    'weeckers',
     'weed-eating',
-    'weed-excluding',
-    'weed-festooned',
-    'weed-killing',
-    'weed/chartered',
-    'weed/disease',
-    'weedall',
-    'weedex',
-    'weedies',
-    'weedily',
-    'weedin',
-    'weeding/culling',
-    'weedkiller/fertiliser',
-    'weedle',
-    'weedmaster',
-    'weedon/northamptonshire',
     'weedon/nothamptonshire',
-    'weedonhas',
-    'weedosphere',
-    'weedrop',
-    'weeds.',
-    'weeds/shrubbed',
-    'weedy-looking',
-    'weeeks',
-    'weeel',
-    'weeell',
-    'weegdaies',
-    'weegmann',
-    'weejuns',
-    'week&ndash;10',
-    'week&rehy;out',
-    'week-after',
     'week-and-a-half',
-    'week-enders',
-    'week-ends.',
-    'week-killer',
-    'week-plus',
-    'week.and',
-    'week.as',
-    'week.er',
-    'week.plants',
-    'week/nigel',
-    'week_out',
-    'weekday/weekend',
-    'weeke',
-    'weeken',
-    'weekend-in-paris',
-    'weekend-workshops',
     'weekend.it',
-    'weekend.roads',
-    'weekend/day/evening',
-    'weekend/mid',
-    'weekended',
-    'weekendish',
-    'weekends-only',
-    'weekers',
-    'weeklong',
-    'weekly/fortnightly',
-    'weeknights',
-    'weeks.',
-    'weeks.i',
-    'weeks/',
-    'weeks/six',
-    'weeks_so',
     'weelands',
-    'weele',
-    'weellll',
-    'weemington',
-    'weency',
-    'weened',
-    'weenes',
-    'weening',
-    'weeny-winkle',
-    'weeping-kid',
-    'weert',
-    'weery',
-    'weesker',
-    'weesner',
-    'weet',
-    'weet-a-weet',
     'weet-wit',
-    'weetaflakes',
-    'weeth',
-    'weetman/organiser',
-    'weevilly',
-    'weewak',
-    'weex',
-    'wef',
-    'wefsey',
-    'wegbreit',
-    'weggeland',
-    'weggelie',
-    'weggis',
-    'wegink',
-    'wegmus',
-    'wegon',
     'weh',
-    'wehbeh',
-    'wehee',
-    'weheliych',
-    'weheliyeh',
-    'weheliyehposts',
-    'wehmeiher',
-    'wehr-wolf',
-    'wehrhafte',
-    'wehrkunde',
-    'wehrmacht/waffen',
-    'wehrmachtfahrkahrte',
-    'wei-cheng',
-    'wei-fan',
-    'weialala',
-    'weib',
     'weibring',
-    'weibull',
-    'weichang',
-    'weichsel',
-    'weid',
-    'weidersehn',
-    'weidersen',
-    'weidler',
-    'weidoscope',
-    'weifeng',
-    'weifung',
-    'weig',
-    'weigall',
-    'weigao',
-    'weigel',
-    'weigh-house',
     'weigh-in-motion',
-    'weigh-loss',
-    'weighalls',
-    'weighbridge/plant',
-    'weighers-wilt',
-    'weighin',
-    'weighing-room',
-    'weighing.',
-    'weighlifter',
-    'weighlifters',
-    'weighlifting',
-    'weighorst',
-    'weighscale',
-    'weight&times;100',
-    'weight\'',
-    'weight-',
     'weight-bear',
-    'weight-bias',
-    'weight-carrying',
-    'weight-driven',
-    'weight-for-age',
-    'weight-for-weight',
-    'weight-lifters',
-    'weight-lifting-',
-    'weight-making',
-    'weight-management',
-    'weight-producing',
-    'weight-prone',
-    'weight-reducer',
-    'weight-reduction',
-    'weight-shedding',
-    'weight-style',
     'weight-switching',
-    'weight-to-length',
-    'weight-to-power',
-    'weight-triggered',
-    'weight-watching',
-    'weight-weakened',
-    'weight-wise',
-    'weight/birth',
-    'weight/capacity',
-    'weight/cost',
-    'weight/height',
-    'weight/length',
-    'weight/min',
-    'weight/not',
-    'weight/obesity',
-    'weight/performance',
     'weight/prematurity',
-    'weight/weight',
-    'weightbelt',
-    'weighted-down',
-    'weightedness',
-    'weighting-factor',
-    'weighting.',
-    'weightless/worthless',
-    'weightline',
-    'weights-rise',
-    'weightwatching',
-    'weigman-lavier',
-    'weihe',
-    'weihergut',
-    'weihl',
-    'weijun',
     'weil-am-rhein',
-    'weiland',
-    'weilburg',
-    'weild',
-    'weiler',
-    'weimar-style',
-    'weimerskirch',
-    'wein-berg-salam',
-    'weinachten',
-    'weinberg-salam',
-    'weindling',
-    'weinen',
-    'weinerminister',
-    'weinerwurst',
-    'weingart',
-    'weingarten',
     'weingarter',
-    'weingartner',
-    'weingast',
-    'weinger',
-    'weinheim',
-    'weinhouse',
-    'weininger',
-    'weinkle',
-    'weinraub',
-    'weinreb',
-    'weipa',
-    'weir-a',
-    'weir-houston',
-    'weir-r-rd',
-    'weir/wbo',
-    'weird-pop',
     'weird-sound',
-    'weird-sounding',
-    'weirder-than-thou',
-    'weirdery',
-    'weirdly-moving',
-    'weirdo/i',
-    'weirds',
-    'weirdstone',
-    'weirother',
-    'weirsiders',
-    'weisdale',
-    'weisenborn',
-    'weises',
-    'weishaupt',
-    'weisheit',
-    'weismannist',
     'weissach',
-    'weissberg',
-    'weissenhof',
-    'weissenkirchen',
-    'weissensberg',
-    'weisses',
-    'weissfluhjoch',
-    'weisskopff',
-    'weisthenes',
-    'weiterstadt',
-    'weith',
-    'weithio',
-    'weitkamp',
-    'weitmil',
-    'weitz',
-    'weitz/ap',
     'weitzenhofer',
-    'weitzner',
-    'weizkopf',
-    'wejherowo',
-    'wek',
-    'weke',
-    'wekend',
-    'wekes',
-    'wel&rehy;lington',
-    'welair',
-    'welated',
-    'welby/protestor',
-    'welch/auctioneer',
-    'welche',
-    'welcher',
-    'welchii',
     'welcom',
-    'welcome-back',
-    'welcome-for-foreigners',
-    'welcome-to-the-tribe-of-women',
-    'welcome.exclusion',
-    'welcome/bienvenido',
-    'welcome/menu',
-    'welcome_together',
-    'welcomely',
-    'welcomest',
-    'welcomingly',
-    'welcopme',
-    'weld-seams',
-    'weldable',
-    'welded-on',
-    'welding-gloves',
     'welding-torch',
-    'welding.',
-    'weldments',
-    'weldon-jones',
-    'weldtite',
-    'weleda',
-    'weley',
-    'welfare&rehy;dependent',
-    'welfare**',
-    'welfare-enhancing',
-    'welfare-increasing',
-    'welfare-minded',
-    'welfare-only',
-    'welfare-oriented',
-    'welfare-relevant',
-    'welfare-scrounging',
     'welfare-stations',
-    'welfare-wafflers',
-    'welfare.4',
-    'welfare/education',
-    'welfare/labour',
-    'welfarenatics',
-    'welfares',
-    'welfariat',
-    'welfherd',
-    'welgemoed',
-    'welgemoedadministration',
-    'welgill',
-    'welham/architect',
-    'welham/local',
-    'welhouse',
-    'welitsch',
     'welkoms',
-    'well&gt',
-    'well&mdash;being',
-    'well&mdash;built',
-    'well&mdash;but',
-    'well&mdash;er&mdash;i',
-    'well&mdash;quite',
-    'well&ndash;designed',
-    'well&ndash;known',
-    'well&rehy;aggravated',
-    'well&rehy;brought-up',
-    'well&rehy;camouflaged',
-    'well&rehy;constituted',
-    'well&rehy;constructed',
-    'well&rehy;cut',
-    'well&rehy;deserved',
     'well&rehy;disciplined',
-    'well&rehy;documented',
-    'well&rehy;drained',
-    'well&rehy;filtered',
-    'well&rehy;groomed',
-    'well&rehy;hidden',
-    'well&rehy;hung',
-    'well&rehy;lubricated',
-    'well&rehy;mannered',
-    'well&rehy;meaning',
-    'well&rehy;nigh',
-    'well&rehy;organised',
-    'well&rehy;painted',
-    'well&rehy;preserved',
-    'well&rehy;pressed',
-    'well&rehy;publicised',
     'well&rehy;qualified',
-    'well&rehy;received',
-    'well&rehy;regulated',
-    'well&rehy;resourced',
-    'well&rehy;serviced',
-    'well&rehy;tried',
-    'well&rehy;trodden',
-    'well&rehy;ventilated',
-    'well&rehy;versed',
-    'well\'&ndash',
-    'well(s)',
-    'well-&amp',
-    'well-\'ard',
-    'well-a',
-    'well-a-day',
-    'well-a-well',
     'well-above',
-    'well-above-average',
-    'well-acclaimed',
-    'well-accustomed',
-    'well-acknowledged',
-    'well-acted',
-    'well-affected',
-    'well-agitated',
-    'well-aired',
-    'well-amplified',
-    'well-amused',
-    'well-analysed',
-    'well-animated',
-    'well-anticipated',
-    'well-applied',
-    'well-arched',
     'well-attached',
-    'well-balance',
-    'well-bed',
-    'well-bent',
-    'well-blazed',
-    'well-boozy',
-    'well-bounded',
-    'well-breeched',
-    'well-bribed',
-    'well-bricked',
-    'well-britched',
-    'well-broken',
-    'well-browned',
-    'well-bundled',
-    'well-camouflaged',
-    'well-capitalised',
     'well-carpeted',
-    'well-carved',
-    'well-cast',
-    'well-celebrated',
-    'well-championed',
-    'well-characterised',
-    'well-charted',
-    'well-chiselled',
-    'well-chronicled',
-    'well-circumscribed',
-    'well-closed',
-    'well-coloured',
-    'well-compensated',
-    'well-compiled',
-    'well-completed',
-    'well-composed',
     'well-confirmed',
-    'well-conserved',
-    'well-consolidated',
-    'well-contained',
-    'well-contrasted',
-    'well-contrived',
-    'well-converted',
-    'well-coordinated',
-    'well-corseted',
-    'well-costumed',
-    'well-craftedness',
-    'well-crowned',
-    'well-curtained',
-    'well-dampened',
-    'well-darkened',
-    'well-deck',
     'well-demarcated',
-    'well-determined',
-    'well-diffused',
-    'well-digging',
-    'well-diluted',
-    'well-distanced',
-    'well-doing',
-    'well-dowered',
-    'well-dressings',
-    'well-dried',
-    'well-elaborated',
-    'well-employed',
-    'well-enough-meaning',
-    'well-evidenced',
-    'well-evident',
-    'well-exemplified',
     'well-explained',
-    'well-feathered',
-    'well-featured',
-    'well-feigned',
-    'well-fenced',
-    'well-fertilised',
-    'well-flighted',
-    'well-floured',
-    'well-focussed',
-    'well-fortified',
-    'well-fought',
-    'well-found',
-    'well-framed',
-    'well-gallooned',
-    'well-geared',
-    'well-gnawed',
     'well-gowned',
-    'well-grassed',
-    'well-handicapped',
-    'well-hated',
-    'well-healed',
-    'well-here-and-i-hope-you-are-well-there',
-    'well-hit',
-    'well-hopped',
-    'well-hotel',
-    'well-housing',
-    'well-how-clever',
-    'well-if-you-don\'t-like-it-that\'s-all-right',
-    'well-illuminated',
-    'well-indexed',
-    'well-indoctrinated',
-    'well-ingrained',
     'well-insured',
-    'well-into',
-    'well-invested',
-    'well-jointed',
-    'well-kelp',
-    'well-kempt',
-    'well-knitted',
-    'well-laced',
-    'well-lateralised',
-    'well-launched',
-    'well-laundered',
-    'well-let',
-    'well-loaded',
-    'well-located',
-    'well-lodged',
-    'well-log',
     'well-looked',
-    'well-looked-after',
-    'well-lubricated',
-    'well-man',
-    'well-married',
-    'well-mashed',
-    'well-meaners',
-    'well-meaningly',
-    'well-men',
-    'well-monitored',
-    'well-mothered',
-    'well-moulded',
-    'well-mown',
-    'well-muffled',
-    'well-natured',
-    'well-needed',
     'well-night',
-    'well-noted',
-    'well-nuked',
-    'well-obscene',
-    'well-occupied',
-    'well-off-i',
-    'well-ordering',
-    'well-oriented',
-    'well-packed',
-    'well-past-their-sell-by-date',
-    'well-patronized',
-    'well-paying',
-    'well-peed',
-    'well-picked',
-    'well-pinned',
-    'well-plucked',
     'well-policed',
-    'well-powdered',
-    'well-preened',
-    'well-presses',
-    'well-primped',
-    'well-published',
-    'well-punted',
-    'well-put-on',
-    'well-quiffed',
-    'well-quoted',
-    'well-realised',
-    'well-reared',
-    'well-recalled',
-    'well-received.',
-    'well-regimented',
-    'well-renovated',
     'well-repaired',
-    'well-repressed',
-    'well-reproduced',
-    'well-resolved',
-    'well-restored',
-    'well-ritualized',
-    'well-roasted',
-    'well-ruled',
-    'well-run-in',
-    'well-running',
-    'well-saturated',
-    'well-saved',
-    'well-scented',
-    'well-screened',
-    'well-scripted',
-    'well-sculpted',
     'well-seated',
-    'well-secured',
-    'well-segmented',
-    'well-selling',
-    'well-separated',
-    'well-serves',
-    'well-set-up',
-    'well-settled',
-    'well-sewn',
-    'well-shaded',
-    'well-shined',
-    'well-sifted',
-    'well-sighted',
-    'well-signposted',
-    'well-simulated',
-    'well-sized',
     'well-sketched',
-    'well-smeared',
-    'well-smouldering',
-    'well-socialized',
-    'well-solaced',
-    'well-soled',
-    'well-sourced',
-    'well-specified',
-    'well-spiced',
-    'well-spokenness',
-    'well-stacked',
-    'well-starred',
-    'well-stirred',
-    'well-stones',
-    'well-strewn',
-    'well-stuffed',
     'well-subscribed',
-    'well-sucked',
-    'well-supervised',
-    'well-surfaced',
-    'well-sussed',
-    'well-taught',
-    'well-that',
-    'well-tolerated',
-    'well-treed',
-    'well-unionised',
-    'well-utilised',
-    'well-vascularised',
-    'well-visited',
-    'well-voiced',
-    'well-wall',
-    'well-wardrobed',
     'well-watched',
-    'well-waxed',
-    'well-waymarked',
-    'well-weeded',
-    'well-wild',
-    'well-winnowed',
-    'well-wishes',
-    'well-wishings',
-    'well-won',
-    'well-worn-looking',
-    'well-wrapped-up',
-    'well-writ',
-    'well.damped',
-    'well.nt',
-    'well.you',
-    'well_a',
     'well_according',
-    'well_er_off',
-    'well_even',
-    'well_instead',
-    'well_off\'',
-    'well_once',
-    'well_sort',
-    'well_well_off',
-    'wella-shampoo',
-    'wellaccepted',
-    'welland/worcestershire',
-    'wellard',
-    'wellattended',
-    'wellbrook',
-    'wellburn',
-    'wellclose',
     'wellcom',
-    'wellcontrolled',
-    'welldefined',
-    'welldetailed',
-    'welldisciplined',
-    'welldocumented',
-    'welled-up',
-    'wellenbad',
-    'wellequipped',
-    'weller/swindon',
-    'weller/wiltshire',
-    'wellerisms',
-    'wellershoff',
-    'wellesey',
-    'wellesweiler',
-    'wellesz',
     'wellferon',
-    'wellfish',
-    'wellford',
-    'wellgoverned',
-    'wellgrounded',
-    'wellham',
-    'wellhamser',
-    'wellhausen',
-    'wellhouse',
-    'wellie-chuck',
-    'wellie-wearers',
-    'welling/families',
-    'wellingdon',
-    'wellingore',
-    'wellington-tops',
-    'wellington-type',
     'wellingtonian',
-    'wellingtonians',
-    'wellingtonias',
-    'wellins',
-    'welliver',
-    'welll',
-    'wellll',
-    'wellman-lord',
-    'wellmannered',
-    'wellmer',
-    'wellons',
-    'wellord',
-    'wellplaced',
-    'wellrecognised',
-    'wells-gardner',
-    'wells/coach',
     'wells/headmaster',
-    'wells/leather',
-    'wells/taylor',
-    'wells/trust',
-    'wells/victim',
-    'wellshot',
-    'wellsmead',
-    'wellstar',
-    'wellstone',
-    'wellstood',
-    'wellstruck',
-    'wellswith',
-    'wellsy',
-    'welltended',
-    'welltrained',
-    'welltris',
     'wellwomans',
-    'wellworn',
-    'wellworth',
-    'welly-full',
-    'welly-throwing',
-    'wellyed',
-    'wellying',
-    'welman',
-    'welmet',
-    'welp',
-    'welpac',
-    'wels',
-    'welsbach',
-    'welschap',
-    'welser-m&ouml;st',
-    'welsers',
     'welsh&mdash',
-    'welsh&mdash;pearson',
-    'welsh-argentine',
-    'welsh-english',
-    'welsh-office',
-    'welsh-sounding',
-    'welsh/governor',
-    'welsh/irish',
-    'welsh123-1289.314.1',
-    'welshampton',
-    'welshies',
-    'welshy',
-    'welson',
-    'welsws',
-    'welt.',
-    'weltanschaung',
     'weltanschauungen',
-    'weltauffassung',
-    'welten',
-    'weltenburg',
-    'welter.',
-    'welterweights',
-    'welthie',
-    'weltliche',
-    'weltsschmertz',
-    'weltwoche',
-    'weltzie',
-    'welu',
-    'welweyas',
-    'welwitschii',
-    'wem-ber-lee',
-    'wemba',
     'wembence',
-    'wemberly',
-    'wembezi',
-    'wembley-bound',
-    'wembley-scorer',
-    'wembly',
-    'wemembering',
-    'wemmershoek',
-    'wen-tze',
-    'wenallt',
-    'wenatchee',
-    'wencelous',
-    'wenceslao',
-    'wenched',
-    'wend-tee-ee',
-    'wenden',
     'wendigo',
-    'wendish',
-    'wendolien',
-    'wendon/west',
-    'wendron',
-    'wendy-house',
-    'wendyless',
-    'wened',
-    'wenegade',
-    'weng',
-    'wengraf',
-    'wenhaston',
-    'wenhofer',
-    'wenhui',
-    'wenig',
-    'weninge',
     'wenley',
-    'wenlock/gotland/',
-    'wenlock/niagaran',
-    'wenman',
-    'wennall',
-    'wenning',
-    'wensbury',
-    'wensleydale-born',
-    'went-a-courtin\'',
-    'went-another',
-    'went-worth',
-    'went/are',
-    'went_over',
-    'wentbridge',
-    'wente',
-    'wents',
     'wentworth-brewster',
-    'wentworth-day',
-    'wentworth-stanley',
-    'wentzel',
-    'wentzville',
-    'wenvoe',
-    'wenying',
-    'wenysdaye',
-    'wenz',
-    'wenzeslaus',
-    'wenzu',
-    'weobley/herefordshire',
-    'weor&thorn;an',
-    'weow',
-    'weoxham',
-    'wep',
     'weport',
-    'weppings',
-    'wera',
-    'werbs',
-    'werburgs',
-    'werd',
-    'were\'',
-    'were-always',
-    'were-pale',
-    'were.brought',
-    'were/would',
-    'were_a',
-    'were_as',
-    'were_by_and',
-    'were_on',
-    'were_over',
     'were_seeing',
-    'were_such',
-    'wereavailable',
-    'weredone',
-    'werefkin',
-    'weregeld',
-    'weregemere',
-    'weren\'',
-    'weren\'t',
-    'werena',
-    'weres',
-    'weresworth',
-    'werewolf-whistled',
-    'werfel',
-    'werffs',
-    'wergh',
     'wergin',
-    'wergyng',
-    'werh',
-    'werhh',
-    'werhmacht',
-    'werich',
-    'werith',
-    'werk',
-    'werkst&auml;tte',
-    'werkstoffe',
-    'werkverzeichnis',
-    'werkyng',
-    'werkzeugmaschinen',
-    'werl&eacute',
-    'werleman',
-    'wermelskirchen',
     'wernce',
-    'wernerian',
-    'werners',
-    'werneth',
-    'wernham',
-    'wernigerode',
-    'werny',
-    'werr',
-    'werrae',
-    'werrell/parent',
-    'werren',
-    'werrin',
-    'werrioure',
-    'werrittin\'',
-    'wers',
-    'werst',
     'wertheimstein',
-    'wertheimsteins',
-    'werthman',
-    'wertordnung',
-    'wes.',
-    'wesak',
-    'wesbecker',
-    'weschler',
-    'wescor',
-    'wescott/3',
-    'weseham',
-    'wesen',
-    'wesern',
-    'wesfarmers',
-    'wesh',
-    'weslake',
     'wesleyanism',
-    'weslo',
-    'wesminster',
-    'wesrside',
-    'wess',
-    'wessalith',
-    'wesselingh',
-    'wessell',
-    'wesselmann',
-    'wesselow',
-    'wessely',
-    'wessex125-1308.455.0',
-    'wesshe',
-    'wessi',
-    'wessier',
-    'wessies',
     'wessington',
-    'wesson.38',
-    'wesson.38s',
-    'west&mdash;chose',
-    'west&mdash;industrial',
-    'west&ndash;granton',
-    'west\'',
-    'west*',
-    'west-',
-    'west-about',
-    'west-gate',
-    'west-india',
-    'west-north-west/east-south-east',
-    'west-sou\'-west',
-    'west-to-east',
-    'west-ulster',
     'west-wards',
-    'west-wells',
-    'west-west',
-    'west.',
-    'west/1h',
-    'west/drink',
-    'west/leonard',
-    'west/mother',
-    'west/restaurant',
-    'west/south',
-    'west/wales',
-    'west/wessex',
-    'west121-1268.735.6',
-    'west121-1269.683.9',
-    'west_et',
-    'westabout',
     'westaby/consultant',
-    'westaby/heart',
-    'westair',
-    'westbahn',
-    'westbam',
-    'westbond',
-    'westbrook-friend',
-    'westbrook/incare',
-    'westbrooke',
-    'westbrrok',
-    'westburn/baberton',
-    'westburn/westerhailes',
-    'westbury-taunton',
-    'westbury/farmer',
-    'westcan',
-    'westcar',
     'westcliffe-on-sea',
-    'westcoast',
-    'westcomb',
-    'westcommon',
-    'westcot',
-    'westcott/buckinghamshire',
-    'westcott/chemical',
-    'westcountryman',
-    'westcroft',
-    'westdeutscher',
-    'westecott',
-    'westella',
-    'westemolds',
-    'westendorp',
-    'westenh&ouml;fer',
-    'westenhanger',
     'westens',
-    'westerband',
-    'westerburgh',
-    'westerbury-on-severn',
-    'westerby/consultant',
-    'westerdale/potential',
-    'westered',
-    'westerhof',
-    'westeri',
-    'westerkerk',
-    'westerleigh',
-    'westerlo',
-    'westerlund',
-    'westerly-flowing',
-    'westerlys',
-    'westermann',
     'westermark',
-    'western-',
-    'western-barred',
-    'western-blot',
-    'western-centricness',
-    'western-controlled',
-    'western-dressed',
-    'western-european',
-    'western-financed',
-    'western-held',
-    'western-inspired',
-    'western-language',
-    'western-like',
-    'western-looking',
-    'western-orchestrated',
-    'western-produced',
     'western-standard',
-    'western-super-mare',
-    'western/',
-    'western/developed',
-    'western/racist/capitalist/christian',
-    'western/world',
-    'westernalia',
-    'westernesse',
-    'westernism',
-    'westernizer',
-    'westernness',
-    'westers',
-    'westerwoldicum',
-    'westerwolds',
-    'westfalische',
-    'westferry',
     'westgate-on-sea',
-    'westgrove',
-    'westhampstead',
-    'westhead',
-    'westhoek',
-    'westhof',
-    'westholme',
-    'westhorpe',
-    'westhouney',
-    'westhouse',
-    'westhouses',
-    'westhuizen',
-    'westie',
-    'westinberger',
-    'westland/hill',
-    'westmacotts',
     'westmancote',
-    'westmascott',
-    'westmere',
-    'westmestre',
-    'westminster-directed',
-    'westminster-hall',
-    'westminster-style',
-    'westminster.h',
-    'westminsters',
-    'westminter',
-    'westmont',
-    'westmoor',
-    'westmuir',
-    'westnortheastsouth',
-    'westoll',
-    'weston-howell',
     'weston-longville',
-    'weston-on-avon',
-    'weston-on-the-green/oxfordshire',
-    'weston-s-mare',
-    'weston-sub-edge',
-    'weston-super-medau',
-    'weston-under-lizard',
-    'weston-under-penyard',
-    'weston/house',
-    'weston/loadmaster',
-    'weston/pool',
-    'weston/satan',
-    'westours',
-    'westover',
-    'westow',
-    'westown',
     'westpalen/lippe',
-    'westphalian-d-basin',
-    'westreich',
-    'westrex',
-    'westrick',
-    'westrock',
-    'westroosbeke',
-    'westropp',
-    'westruther',
-    'westsider',
-    'westsound',
-    'westville',
-    'westvries',
-    'westward-bound',
-    'westward-ho',
-    'westward-pointing',
     'westwardness',
-    'westwell',
-    'westwick',
-    'westwind',
-    'westwork',
-    'westworth',
-    'wet&rehy;smear',
-    'wet\'er',
-    'wet\'n\'dry',
-    'wet\'n\'wild',
-    'wet-batteries',
-    'wet-behind-the-ears',
-    'wet-biked',
-    'wet-biking',
-    'wet-blanket',
-    'wet-blankety',
     'wet-chemical',
-    'wet-day',
-    'wet-docks',
-    'wet-down',
-    'wet-dream',
-    'wet-dry',
-    'wet-dry-wet-dry',
-    'wet-etching',
-    'wet-footed',
-    'wet-fresh',
-    'wet-headed',
-    'wet-jowled',
-    'wet-land',
-    'wet-mi-lips',
-    'wet-rag',
-    'wet-rotten',
     'wet-season',
-    'wet-shod',
-    'wet-sieving',
-    'wet-skinned',
-    'wet-soil',
-    'wet-suited',
-    'wet-vacuum',
-    'wet-warm',
-    'wet-white',
-    'wet-wipes',
-    'wet/drys',
-    'wet/liquid',
-    'wet/something',
-    'wetatonmi',
-    'wetaway',
-    'wetback',
     'wetenhall',
-    'wetenschappelijk',
-    'weter',
-    'wetere',
-    'weterings',
-    'wetfoots',
-    'wetherall(1.6)',
-    'wetherall.',
-    'wetherby-york',
-    'wethereds',
-    'wetherlam',
-    'wethers',
-    'wetherspoon',
-    'wethinks',
-    'weticization',
-    'wetjen',
     'wetmoor',
-    'wetrin',
-    'wetrupulis',
-    'wetsmears',
-    'wetstone',
-    'wettability',
-    'wettach',
-    'wetted.',
-    'wetterhorn',
-    'wetterstein',
-    'wettie',
-    'wettin',
-    'wettin\'',
-    'wettings',
-    'wettish',
-    'wettiwetti',
     'wetwang',
-    'wetwhite',
-    'wetzell',
-    'wevela',
-    'wevewent',
-    'wewak',
-    'wewre',
-    'wexcombe',
-    'wexe',
-    'wexford/waterford',
-    'wexfordian',
-    'wexton',
-    'weyberg',
-    'weybourne-sheringham-bessingham',
-    'weyburn',
-    'weycombe',
     'weydemeyer',
-    'weyergans',
-    'weyerhaeuser',
-    'weyford',
-    'weygand',
-    'weygood',
-    'weyher',
-    'weyhill',
-    'weyman-jones/herd',
-    'weyman-jones/lowerhope',
-    'weymann',
-    'weymouth-waterloo',
-    'weyms',
-    'weyser-pratt',
-    'weza',
-    'wezlar',
     'wf/00/22/2002',
-    'wf/00/26/0003-3',
-    'wf/00/29/0001',
-    'wf/00/29/0001-1',
-    'wf/04/26/0007',
-    'wf/05/25/0000',
-    'wf/05/25/0016',
-    'wf/05/25/0020',
-    'wf/05/25/0025',
-    'wf/09/25/0000',
-    'wf/09/25/0095',
-    'wf/09/25/0100',
-    'wf/09/25/0106',
-    'wf/09/25/0109',
-    'wf/09/25/0111',
-    'wf/09/25/0112',
     'wf/09/25/0114',
-    'wf/09/25/0115',
-    'wf/09/25/0116',
-    'wf/09/25/0118',
-    'wf/09/25/0119',
-    'wf/09/25/0121',
-    'wf/09/25/0122',
-    'wf/09/25/0125',
-    'wf/09/25/0126',
-    'wf/09/25/0127',
-    'wf/09/25/0128',
-    'wf/09/25/0129',
-    'wf/09/25/0140',
-    'wf/09/25/0141',
-    'wf/09/25/0151',
-    'wf/09/25/0154',
     'wf/09/25/0157',
-    'wf/09/25/0160',
-    'wf/09/25/0164',
-    'wf/09/25/0168',
-    'wf/09/25/0177',
-    'wf/16/28/0001',
-    'wf/18/25/0002',
-    'wf/20/25/0003',
-    'wf/20/25/0004',
-    'wf/20/25/0005',
-    'wf/20/25/0006',
-    'wf/20/25/0007',
-    'wf/20/25/0015',
-    'wf/20/25/0017',
-    'wf/20/25/0018',
-    'wf/20/25/0019',
     'wf/20/25/0020',
-    'wf/20/25/0022',
-    'wf/20/25/0022-1',
-    'wf/20/25/0023',
-    'wf/20/25/0027',
-    'wf/24/05/0006-2',
-    'wf/24/25/0016',
-    'wf/24/25/0020',
-    'wf/24/25/0021',
-    'wf/24/25/0023',
-    'wf/24/25/0030',
-    'wf/24/25/0032',
-    'wf/28/63/0001',
-    'wf16',
-    'wf502',
-    'wf512',
     'wf527',
-    'wf533',
-    'wf545',
-    'wf553',
-    'wf555',
-    'wf556',
-    'wf560',
-    'wf565',
-    'wf570',
-    'wfh',
-    'wfmt',
-    'wfps',
-    'wfu',
-    'wfw',
-    'wg.13',
-    'wg348/g-bbmv',
     'wga',
-    'wgbh/boston',
-    'wgh',
-    'wgm',
-    'wgo',
-    'wgt',
-    'wgyt',
-    'wh-clauses',
-    'wh-clefts',
-    'wh-question',
-    'wh-question-words',
-    'wh-questions',
-    'wh-structure',
-    'wh-wh-what',
-    'wh-when',
-    'wh-white',
     'wh/',
-    'wh/00/28/0001',
-    'wh0',
-    'wha-a-at',
-    'wha-at',
-    'wha-ay',
-    'wha-what',
-    'whaa-at',
-    'whaaaaaaa',
-    'whaaaaaaaa',
-    'whaaaay',
-    'whaaps',
-    'whaar',
-    'whack-o',
-    'whackable',
-    'whacked-out',
     'whackho',
-    'whackings',
-    'whackos',
-    'whackson',
-    'whad',
-    'whad\'ever',
-    'whad\'ya',
-    'whadayaknow',
-    'whadayamean',
-    'whadcock',
-    'whaddareyawaitinfor',
-    'whaddarya',
-    'whaddayaknow',
-    'whaddva',
-    'whaddy',
-    'whaddyawant',
     'whady\'a',
-    'whadyerwant',
-    'whae',
-    'whakaatu',
-    'whakatane',
-    'whakatans',
-    'whale-',
-    'whale-eaters',
-    'whale-hunters',
-    'whale-linked',
-    'whale-meat',
-    'whale-shaped',
-    'whaleback',
-    'whalebacks',
-    'whalefood',
-    'whalehide',
     'whalelike',
-    'whales.',
-    'whalesome',
-    'whalesong',
-    'whalespine',
-    'whalewatching',
-    'whaley-bonce',
-    'whaling-station',
-    'whallan',
-    'whallen',
-    'whalley/rector',
-    'whalps',
-    'whalsey',
-    'whaltz',
-    'wham-bam&rehy;thank-you-ma\'am',
-    'wham-bang-crash',
     'whama-lama-bam-bam-boy',
-    'whambamthankyouma\'am',
-    'whammery',
-    'whammies',
-    'whamming',
-    'whammy-bar',
-    'whanganga',
-    'whanged',
-    'whanng',
-    'whannies',
-    'whanpoa',
-    'whar',
-    'wharam',
-    'whard',
-    'wharf-side',
-    'wharf-weed',
     'wharfe.',
-    'wharfers',
-    'wharfmasters',
-    'wharlton',
-    'wharped',
-    'wharram-le-street',
-    'wharry',
-    'whart',
-    'whartonesque',
-    'whartons',
-    'whass\'n',
-    'whaston',
-    'what\'',
-    'what\'ll-we-do-now',
-    'what\'s-',
-    'what\'s-\'is-name',
     'what\'s-happening-i-don\'t-believe-this-honey',
-    'what\'s-that-man\'s-name',
-    'what\'s-your-name-then-and-where-do-you-come-from-you-bloody-foreigner',
-    'what\'s-your-toxin',
-    'what\'s.happened',
-    'what\'she',
-    'what\'sisname',
-    'what-',
-    'what-a',
-    'what-are-you-doing-here',
-    'what-d\'ye-call',
-    'what-d\'you&rehy;call-it',
-    'what-d\'you-call-\'em',
-    'what-did-you-call-it',
-    'what-do-you-call-it',
-    'what-do-you-call-them',
     'what-do-you-think-we-are',
-    'what-goes-on',
-    'what-grows-naturally',
-    'what-i\'m-not',
-    'what-i-say',
-    'what-i-think',
-    'what-maner',
-    'what-may-perhaps-be',
-    'what-not-to-eat',
-    'what-nots',
-    'what-on-earth-are-you-doing-here',
-    'what-questions',
-    'what-so-ever',
-    'what-the-hell',
-    'what-they-now-are',
-    'what-to-do',
     'what-were-their-chances',
-    'what-what',
-    'what-you&rehy;see-is-what-you-get',
-    'what-you-see-is-what-you-get',
-    'what.could',
-    'what.place',
-    'whata',
-    'whatchacall',
-    'whatchacallem',
-    'whatchacallit',
-    'whatcott',
-    'whatd\'youcallems',
-    'whatd\'youcallit',
-    'whatda',
-    'whatderwannaknow',
-    'whately/actor',
     'whatelys',
-    'whater',
-    'whatev',
-    'whateve',
-    'whatever\'sstreet',
-    'whatever-it-is-these-days',
-    'whatever-negative-description-you-can-come-up-with',
-    'whatisname',
-    'whativver',
-    'whatizit',
-    'whatjumacallit',
-    'whatlington',
-    'whatmann',
-    'whatmough',
-    'whatnot.',
-    'whatnotted',
     'whatpc.bat',
-    'whats-it',
-    'whatsa',
-    'whatsamatter',
-    'whatseeing',
-    'whatsisface',
-    'whatsitsname',
-    'whatsover',
-    'whatsyername',
-    'whatta',
-    'whatter',
-    'whatthey',
-    'whatton',
-    'whd',
-    'whe-whee-ooo',
-    'wheadon',
     'wheadons',
-    'wheals',
-    'whealt',
-    'wheat-beer',
-    'wheat-buying',
-    'wheat-cakes',
-    'wheat-consuming',
-    'wheat-ears',
-    'wheat-grinding',
-    'wheat-lands',
-    'wheat-red',
-    'wheat-rye',
-    'wheat-sensitivity',
-    'wheat-tomato',
-    'wheatcrofts',
-    'wheaten-coloured',
     'wheathill',
-    'wheatish',
-    'wheatless',
-    'wheatleys',
-    'wheatmeal',
-    'wheatsheaves',
-    'whebell',
-    'wheble/racing',
-    'whed',
-    'whee-oo',
-    'wheeched',
-    'wheedlingly',
-    'wheedly',
-    'wheeee',
-    'wheeeeeeee',
-    'wheeeeeeeee',
     'wheeeeeeeeeeee',
-    'wheeeeeeeeeeeeeeeeeeeeeeee',
-    'wheefed',
-    'wheel&ndash;chair',
-    'wheel&rehy;clamping',
-    'wheel-arches',
-    'wheel-arrangements',
-    'wheel-back',
-    'wheel-barrow',
-    'wheel-barrows',
-    'wheel-based',
-    'wheel-buckler',
-    'wheel-cages',
-    'wheel-carriages',
-    'wheel-chaired',
-    'wheel-clamped',
     'wheel-clamping',
-    'wheel-cutting',
-    'wheel-drive',
-    'wheel-driven',
-    'wheel-drops',
-    'wheel-house',
-    'wheel-locks',
-    'wheel-made',
-    'wheel-marks',
-    'wheel-nuts',
-    'wheel-pit',
-    'wheel-platform',
-    'wheel-power',
-    'wheel-rims',
-    'wheel-screeching',
-    'wheel-sets',
     'wheel-shape',
-    'wheel-shaped',
-    'wheel-spun',
-    'wheel-throwing',
-    'wheel-turned',
-    'wheel-type',
-    'wheel-worked',
-    'wheel-wrestling',
-    'wheel-wrights',
-    'wheelabrator',
-    'wheelan',
-    'wheelans',
-    'wheelarch/side',
-    'wheelback',
-    'wheelbacked',
-    'wheelbarow',
     'wheelbuilding',
-    'wheelcase',
-    'wheelchair\'',
-    'wheelchair-ramps',
-    'wheelchair-to-wheelchair',
-    'wheelchair-user',
-    'wheelchair-users',
-    'wheelchaired',
-    'wheelclamped',
-    'wheeler&rehy;dealer',
-    'wheeler/andrews',
-    'wheeler/farmer',
-    'wheeler/former',
-    'wheeler/landlady',
-    'wheeler/villager',
-    'wheelers/irvine',
     'wheeles',
-    'wheelgate',
-    'wheelin\'',
-    'wheeling-dealing',
-    'wheelings&rehy;in-line',
-    'wheeller',
-    'wheelless',
-    'wheelmarks',
-    'wheels-on',
-    'wheels/high',
-    'wheels/urban',
-    'wheelset',
-    'wheelton',
-    'wheely-',
-    'wheelz',
-    'wheereby',
     'wheesky',
-    'wheet',
-    'wheeuuu',
-    'wheezier',
-    'wheezingly',
-    'wheezling',
-    'whelan/deane',
-    'whelan/western',
-    'wheldall',
-    'whelford/gloucestershire',
-    'whelked',
-    'whelms',
-    'whelo',
-    'whelon/countryside',
-    'whelpton',
-    'when&mdash',
     'when&ndash',
-    'when\'',
-    'when-did-you-last-see-your-father',
-    'when-e\'er',
-    'when-he',
-    'when-i',
-    'when-that',
-    'when-will-it-come-down',
-    'when-you\'ve-had-a-number-one-the-only-way-is-down',
-    'when/how',
-    'when/if',
-    'when/where',
-    'when_a',
-    'when_of',
-    'wheneer',
-    'whent',
     'wherabouts',
-    'wheras',
-    'where\'da',
-    'where\'re-we-going',
-    'where\'s-my-baby-blues',
-    'where\'s-my-next-job',
-    'where+',
-    'where-are-they-now',
-    'where-by',
-    'where-did-he-go-wrong',
-    'where-rather',
-    'where-the-hell-you-think-you\'re-going-you\'re-shagging-some&rehy;other-woman-you-lousy-bastard',
-    'where-to-begin',
-    'where-to-find',
-    'where-upon',
-    'where-ur',
     'where-used',
-    'where-with-all',
-    'where/what',
-    'where_',
-    'whereabo',
-    'whereabou',
-    'whereas-it',
-    'whereat/camera',
-    'wherefor',
-    'wherehouse',
-    'wherelse',
-    'wheres\'sh',
-    'whereso\'er',
-    'wherethe',
-    'wherethro',
-    'whereunder',
     'wherever-the',
-    'wherewithall',
-    'wherin',
-    'wheriver',
-    'wherle',
-    'wherries',
-    'wherry-men',
-    'wherton',
-    'wherwith',
-    'whetenhall',
-    'whetham',
-    'whether\'',
-    'whether-or-not',
-    'whether-to',
-    'whether_or_whether_or_not',
-    'whethir',
     'whetsone',
-    'whetstone(math)',
-    'whetter',
-    'whettons',
-    'whew-yow-ee',
-    'whey-based',
-    'whey-coloured',
-    'whey-face',
-    'whey-like',
-    'wheys',
-    'whft',
-    'whg',
-    'whheeccchhhh',
-    'whheeecchh',
-    'whhich',
-    'whi%e',
     'which&mdash',
-    'which\'',
-    'which-',
-    'which-emphasised',
-    'which-is',
-    'which-mosca',
-    'which-no',
-    'which-was',
-    'which-yew',
-    'which.were',
-    'which=',
-    'whichaway',
-    'whichello',
-    'whichford',
-    'whichg',
-    'whichit',
     'whickers',
-    'whicky',
-    'whidborne',
-    'whieldon',
-    'whiffies',
-    'whiffle',
-    'whiffled',
-    'whiffof',
-    'whig&ndash;liberal',
-    'whig-gish',
-    'whig-liberal',
-    'whigg',
-    'whiggism',
-    'whighams',
-    'whight',
-    'whiich',
     'whikham',
-    'whildon',
-    'while-loops',
-    'while-u-wait',
-    'while-wend',
-    'while/ones',
-    'whilefife',
-    'whilemore',
-    'whilestanding',
-    'whilie',
-    'whillance',
-    'whilom',
-    'whils',
-    'whilte',
-    'whim\'',
-    'whim-wham',
     'whimby',
-    'whimple',
-    'whimsicalities',
-    'whin\'',
-    'whinberg',
-    'whinberries',
-    'whinberry',
-    'whincroft',
-    'whiner',
-    'whineray',
-    'whiney',
-    'whinfell',
-    'whinfield&ndash;dickson',
-    'whingeingly',
-    'whingeings',
-    'whingies',
     'whingrove',
-    'whingy-pingy',
-    'whinin\'',
-    'whinneying',
-    'whinnyfold',
-    'whinnyings',
-    'whinshields',
-    'whinstone',
-    'whioch',
-    'whip&rehy;lashing',
-    'whip-aerials',
-    'whip-and-zip',
-    'whip-ban',
-    'whip-bearing',
-    'whip-crack',
-    'whip-cracked',
     'whip-flick',
-    'whip-handle',
-    'whip-has',
-    'whip-lash',
-    'whip-ma-wop-ma-gate',
-    'whip-pans',
-    'whip-rounds',
-    'whip-thong',
-    'whip-whip-whip',
-    'whipcord-hard',
-    'whipcords',
-    'whiphand',
-    'whiplash.',
-    'whipmakers',
-    'whippelii',
-    'whippers',
     'whippersnappers',
-    'whippery',
-    'whippet-brown',
-    'whipping\'',
-    'whipping.boy',
-    'whippity',
-    'whippoorwill',
-    'whipsaw',
-    'whipsawed',
-    'whipton',
-    'whipwristed',
-    'whirleth',
-    'whirley',
-    'whirlies',
-    'whirligigousticon',
-    'whirline',
     'whirling-wheel',
-    'whirlings',
-    'whirlmixed',
-    'whirlpooling',
-    'whirly-bird',
-    'whirlybird',
-    'whirlygig',
-    'whirpool',
-    'whirr-buzz',
-    'whirrings',
-    'whirrs',
-    'whirry',
-    'whirs',
-    'whis-per-ing',
-    'whisk-like',
-    'whisk/blender',
     'whisk/mixer',
-    'whiskas-guzzling',
-    'whiske',
-    'whisker-growth',
-    'whisker-like',
-    'whiskey-a-gogo',
-    'whiskey-and-forecast',
-    'whiskied',
-    'whiskies.',
-    'whiskified',
-    'whiskin',
-    'whisky-and-sodas',
-    'whisky-blending',
-    'whisky-bottle',
-    'whisky-bound',
-    'whisky-drinkers',
     'whisky-edged',
-    'whisky-induced',
-    'whisky-making',
-    'whisky-producing',
-    'whisky-soaked',
-    'whisky/company',
-    'whiskyfied',
-    'whiskys',
-    'whisp',
-    'whispas',
-    'whisped',
-    'whisper\'',
-    'whispish',
-    'whist-drive',
-    'whistlation',
-    'whistle-a-happy-tune',
     'whistle-blast',
-    'whistle-chains',
-    'whistle-happy',
-    'whistleblowing',
-    'whistlefield',
-    'whistly',
-    'whiston-born',
-    'whisty',
-    'whit-',
-    'whit-lock',
-    'whitaker-dowling',
-    'whitaker/webber',
-    'whitam',
-    'whitaside',
-    'whitbread.',
-    'whitbread/rugby',
     'whitbread/swindon',
-    'whitbred',
-    'whitbrooke',
-    'whitbry',
-    'whitburn-linlithgow',
-    'whitburn/bathgate',
-    'whitby&ndash;darlington',
-    'whitby-based',
-    'whitby-pickering',
-    'whitby-redcarmiddlesbrough',
-    'whitcher/south',
-    'whitchips',
-    'whitcliffe',
-    'whitcott',
-    'whitdale',
-    'white&rehy;coated',
     'white&rehy;edged',
-    'white&rehy;haired',
-    'white&rehy;knuckled',
-    'white\'',
-    'white(1.7)',
-    'white(ish)',
-    'white-aligned',
-    'white-and',
-    'white-and-blacks',
-    'white-and-glass',
-    'white-and-holy',
-    'white-and-pearled',
-    'white-and-reds',
-    'white-and-tan',
-    'white-arse',
-    'white-band',
     'white-based',
-    'white-berried',
-    'white-billed',
-    'white-blackmen',
-    'white-bloused',
-    'white-blue',
-    'white-boned',
-    'white-brick',
-    'white-caked',
-    'white-carpeted',
-    'white-cell',
-    'white-centred',
-    'white-chested',
-    'white-cold',
-    'white-collar-jobs',
-    'white-collar/business',
     'white-colonnaded',
-    'white-coloured',
-    'white-columned',
-    'white-cream',
-    'white-crested',
-    'white-crusted',
-    'white-cuffed',
-    'white-curtained',
-    'white-designated',
-    'white-disc-in-red-square',
-    'white-draped',
-    'white-dressed',
-    'white-dwarf',
-    'white-enamelled',
-    'white-eyebrowed',
-    'white-eyes',
     'white-fanged',
-    'white-figure',
-    'white-finished',
-    'white-fish',
-    'white-flapping',
-    'white-flecked',
-    'white-flight',
-    'white-flowering',
-    'white-framed',
-    'white-fronts',
-    'white-furred',
-    'white-galabeahed',
-    'white-glazed',
-    'white-glossed',
-    'white-glowing',
-    'white-hatted',
     'white-hazed',
-    'white-highlighted',
-    'white-hillman',
-    'white-hooded',
-    'white-house',
-    'white-house-speak',
-    'white-hulled',
-    'white-iced',
-    'white-knuckle-ride',
-    'white-label',
-    'white-lace-and-trimmings',
-    'white-laced',
-    'white-lacquered',
-    'white-leather',
-    'white-lettered',
-    'white-liberal',
     'white-lied',
-    'white-light',
-    'white-limed',
-    'white-line',
-    'white-lining',
-    'white-livered',
-    'white-locked',
-    'white-maned',
-    'white-marble',
-    'white-marked',
-    'white-mask',
-    'white-mice',
-    'white-mouthed',
-    'white-oak',
-    'white-on-black',
-    'white-on-white',
     'white-only',
-    'white-overalled',
-    'white-pantied',
-    'white-paper',
-    'white-patinated',
-    'white-petalled',
-    'white-pillared',
-    'white-pinnacled',
-    'white-powder',
-    'white-powdered',
-    'white-promoted',
-    'white-rayed',
-    'white-ridged',
-    'white-rimed',
-    'white-rose',
-    'white-run',
     'white-sand',
-    'white-sequined',
-    'white-settler',
-    'white-shirt',
-    'white-shod',
-    'white-slobbered',
-    'white-sock',
-    'white-spoke',
-    'white-spot-like',
-    'white-stamened',
-    'white-star',
-    'white-stockinged',
-    'white-stoned',
-    'white-stranded',
-    'white-swathed',
-    'white-sweatered',
     'white-tie',
-    'white-toothed',
-    'white-trash',
-    'white-trunked',
-    'white-turbanned',
-    'white-variegated',
-    'white-vestured',
-    'white-wall',
-    'white-washing',
-    'white-watching',
-    'white-whiskered',
-    'white-wood',
-    'white-woolly',
-    'white-wrapped',
-    'white-yellow-white',
-    'white.stephen',
     'white/',
-    'white/archaelogist',
-    'white/black/white',
-    'white/burgundy/navy',
-    'white/chairman',
-    'white/defendant',
-    'white/esso',
-    'white/evesham',
-    'white/former',
-    'white/forrester',
-    'white/garnett',
-    'white/grey',
-    'white/horse',
-    'white/lazer',
-    'white/merseyside',
-    'white/mother',
     'white/navy',
-    'white/neighbour',
-    'white/orange',
-    'white/oxfordshire',
-    'white/redlands',
-    'white/resident',
-    'white/silver',
-    'white/turquoise',
-    'white/violet/lilac',
-    'white/yellow',
-    'whitearse',
-    'whitebeach',
-    'whitebeams',
-    'whitebeard',
-    'whitebeards',
-    'whiteblade',
     'whitebound',
-    'whiteboy',
-    'whitebred/welsh',
-    'whitecat',
-    'whiteclive',
-    'whitecoated',
-    'whitecoats',
-    'whitecollar',
-    'whitecraigs',
-    'whitecross/street',
-    'whited-out',
-    'whited-sepulchre',
-    'whitefaced',
-    'whitefriar',
-    'whitefront',
-    'whitefronted',
     'whitegloss',
-    'whitehall-dominated',
-    'whitehall-propagated',
-    'whitehallese',
-    'whitehaven&ndash;st',
-    'whitehaven.24',
-    'whitehead/heritage',
-    'whitehead/transplant',
-    'whitehead/victim',
-    'whiteheadof',
-    'whitehorndiscovers',
-    'whitehorns',
-    'whitehough',
-    'whitehouse&ndash;skagway',
-    'whitehouse-set',
-    'whitehouse/project',
     'whitehouse:fury',
-    'whitekind',
-    'whiteknuckle',
-    'whiteknuckled',
-    'whitelaw.',
-    'whiteleafed',
-    'whiteleas',
-    'whiteletter',
-    'whitelocks',
-    'whitemail',
-    'whiteman/tenant',
-    'whitener',
-    'whitens',
-    'whiteouts',
-    'whiter-haired',
-    'whiteriver',
     'whitesheet',
-    'whiteside.',
-    'whiteskinned',
-    'whitesox',
-    'whitestock',
-    'whiteways',
-    'whitewell-on-the-hill',
-    'whitewright',
-    'whitey-blue',
-    'whitey-yellow',
-    'whiteys',
-    'whitfiles',
-    'whitfords',
-    'whithaugh',
-    'whithheld',
-    'whitiahua',
     'whities',
-    'whiting/independent',
-    'whitish-blue',
-    'whitish-green',
-    'whitish-pink',
-    'whitish-yellow',
-    'whitleather',
-    'whitlehouse',
-    'whitletts',
-    'whitlock/gloucestershire',
-    'whitlow-grass',
-    'whitmanite',
-    'whitmill',
-    'whitmores',
-    'whitney-on-wye/herefordshire',
-    'whitneys',
     'whitrick',
-    'whits',
-    'whitsands',
-    'whitston',
-    'whitsul',
-    'whitsun-gift',
-    'whitsundale',
-    'whittacker',
-    'whittaker/thames',
-    'whittakers',
-    'whittawares',
-    'whittenstall',
-    'whitter',
-    'whittered',
-    'whitteridge',
-    'whittick',
     'whittingale',
-    'whittinghame',
-    'whittings',
-    'whittingshall',
-    'whittingtonesque',
-    'whittinton',
-    'whittlebury',
-    'whittlesford',
-    'whittock/wiltshire',
-    'whittou',
-    'whiturn',
-    'whitwares',
-    'whitwell-on-the-hill',
-    'whitwhams',
-    'whitwich',
-    'whitwick/organiser',
     'whitworth/tennants',
-    'whitworths',
-    'whity',
-    'whity.',
-    'whiz-bang',
-    'whizzery',
-    'whizzpopping',
-    'whn',
-    'who&mdash',
-    'who&ndash;e',
-    'who\'',
-    'who\'d',
-    'who\'s(18)eighteen',
-    'who\'s-that-at-the-door',
-    'who-aids',
-    'who-ari',
     'who-did-it',
-    'who-did-what',
-    'who-does-what',
-    'who-dun-what',
-    'who-gets-what',
-    'who-gives-a-damn',
-    'who-gives-a-flying-',
-    'who-gives-a-shit',
-    'who-got-what-in-which-treaty',
-    'who-har',
-    'who-is-this-jerk-and-why-am-i-married-to-him',
-    'who-knew-what',
-    'who-knows-what',
-    'who-knows-what-enough',
-    'who-knows-when',
-    'who-knows-where',
     'who-length',
-    'who-o-o-o',
-    'who-runs-what',
-    'who-said-what-to-whom',
-    'who-unicef',
-    'who-was',
-    'who-we-are',
-    'who-what-why-and-when',
-    'who-whom\'',
-    'who-would',
-    'who.a',
-    'who/hfa',
-    'who/the',
-    'who/unicef',
-    'who/what',
-    'who/what/where',
     'whoa-yeah',
-    'whoa/my',
-    'whoaa',
-    'whoal',
-    'whoch',
-    'whod',
-    'whoe',
-    'whoesness',
-    'whoever-it-was',
-    'whoever-you-are',
-    'whoise',
-    'whol',
-    'whole&mdash;scarcities',
-    'whole&rehy;school',
-    'whole-',
-    'whole-batch',
     'whole-circuit',
-    'whole-curriculum',
-    'whole-falls',
-    'whole-food',
-    'whole-grain',
-    'whole-gut',
-    'whole-healing',
-    'whole-hospital',
-    'whole-mantle',
-    'whole-meal',
-    'whole-milk',
-    'whole-molecule',
-    'whole-mount',
-    'whole-natured',
-    'whole-north',
-    'whole-of-life',
     'whole-scale',
-    'whole-team',
-    'whole-text',
-    'whole-tones',
-    'whole-wheat',
-    'whole.',
-    'whole.however',
-    'whole.school',
-    'wholemeal-bread',
-    'wholemeal-sandals',
-    'wholemeal/wholegrain',
-    'wholemilk',
-    'wholemount',
-    'wholeperson',
-    'wholesale*',
-    'wholesale-financed',
     'wholesalely',
-    'wholesalers.',
-    'wholesalers/retailers',
-    'wholesome-looking',
-    'wholesomely',
-    'wholething',
-    'wholewheat/high',
-    'wholewood',
-    'wholey',
-    'wholly-',
-    'wholly-owning',
-    'wholphin',
-    'wholphins',
-    'whome',
-    'whomen',
-    'whomp-whomp-whomp-whomp',
     'whomped',
-    'whompf',
-    'whomping',
-    'whomps',
-    'whomsoever\'',
-    'whoo-whoo',
-    'whooargh',
-    'whooed',
-    'whoofers',
-    'whoofing',
-    'whoofle-pouffle',
-    'whooing',
-    'whoomp',
-    'whoomph-whoomphs',
-    'whooo-eee',
-    'whooo-woo-ha',
     'whoooaaa',
-    'whoooaaargh',
-    'whooooah',
-    'whooooeee',
-    'whoop-screech-whoop',
-    'whoop-whoop',
-    'whoops-a-',
-    'whoopsadaisy',
-    'whoopsy-daisy',
-    'whoopy',
-    'whoopy-fuckin-doo',
-    'whoopy-whoopy',
-    'whoor',
-    'whoose',
-    'whoosha',
-    'whoow',
     'whoozing',
-    'whoozy',
-    'whopped',
-    'whopperbears',
-    'whoppin\'',
-    'whoppit',
-    'whops',
-    'whore-house',
-    'whore-houses',
-    'whore/\'old',
-    'whoremaster',
-    'whores.',
-    'whoreson',
-    'whoresons',
-    'whorey',
-    'whorf',
     'whorlow',
-    'whorne',
-    'whortle-leaved',
-    'whortleberries',
-    'whose-ancient',
-    'whose-been-sleeping-with-whom',
-    'whose-main',
-    'whose-tum-bum-or-thighs-would-you-rather-have',
-    'whosever',
-    'whosiss',
-    'whosit',
-    'whosits',
-    'whosn',
-    'whoso',
-    'whothinkstorideanangeldown',
-    'whotsits',
     'whould',
-    'whove',
-    'whow',
-    'whpple',
-    'whse',
-    'whumpf',
-    'whun',
-    'whure',
-    'whut',
-    'why-',
-    'why-dun-its',
-    'why-not',
-    'why.did',
-    'whybourn',
-    'whybrow',
-    'whyche',
     'whycliffe',
-    'whydown',
-    'whydunnit',
-    'whyfor',
-    'whynes',
-    'whysall',
-    'whyston',
-    'whyte/fairclough',
-    'whyteleaf',
-    'whythat',
-    'whythorne',
-    'whyton',
-    'wi&verbar;w1',
-    'wi\'me',
-    'wi\'t',
-    'wi-1',
     'wi:k/',
-    'wia',
-    'wiang',
-    'wiart',
-    'wiat',
-    'wiath',
-    'wiaux',
-    'wibbles',
-    'wibbling',
-    'wibblitt',
-    'wibbly-wobbliness',
-    'wibc',
-    'wibier',
-    'wiblingen',
-    'wibsey',
-    'wic-ing',
     'wicanders',
-    'wicar',
-    'wich',
-    'wichard',
-    'wichelhaus',
-    'wichelow',
-    'wicher',
-    'wicht',
-    'wichterle',
-    'wick-dipping',
-    'wicked-edged',
-    'wicked-stepmother',
-    'wickedary',
-    'wickendens',
-    'wickens/jack',
-    'wicker-basket',
     'wicker-chairs',
-    'wickers',
-    'wickersley',
-    'wicket-covers',
-    'wicket-high',
-    'wicket-keeper-batsman',
-    'wicket-takers',
-    'wicket.',
-    'wicketkeeper-batsmen',
-    'wicketkeeper.',
-    'wicketkeeper/batsman',
-    'wickets=16',
-    'wickfield',
-    'wickham(1917)34',
-    'wickham-jones',
-    'wickham/cox',
     'wickham/house',
-    'wickham/swindon',
-    'wickiups',
-    'wickland',
-    'wickle',
-    'wickliffe',
-    'wicklund',
-    'wickramasingha',
-    'wicksell',
-    'wickwar',
-    'wicomico',
-    'wiczniewski',
-    'wid\'ning',
-    'wid.way',
-    'widdall',
-    'widdamuse',
     'widdesdale',
-    'widdings',
-    'widdington',
-    'widdis',
-    'widdle',
-    'widdleing',
-    'widdles',
-    'widdlesdale',
-    'widdley-widdley',
-    'widdling',
-    'widdly',
-    'widdly-widdly',
-    'widdlywiddlywee',
-    'wide&rehy;spread',
-    'wide-arching',
-    'wide-astride',
     'wide-awakeness',
-    'wide-bandwidth',
-    'wide-based',
-    'wide-bladed',
-    'wide-bodies',
-    'wide-bottomed',
-    'wide-browed',
-    'wide-chested',
-    'wide-eared',
-    'wide-embracing',
-    'wide-eyed-long-legged',
-    'wide-field',
-    'wide-field/planetary',
-    'wide-focus',
-    'wide-foot',
-    'wide-grained',
     'wide-headed',
-    'wide-look',
-    'wide-man',
-    'wide-margin',
-    'wide-margined',
-    'wide-mesh',
-    'wide-money',
-    'wide-pored',
-    'wide-ratio',
-    'wide-scattered',
-    'wide-skirted',
-    'wide-spectrum',
-    'wide-straddled',
-    'wide-strapped',
-    'wide-track',
-    'wide-tread',
     'wide-varying',
-    'wide-vowelled',
-    'wide-wheel',
-    'wide/narrow',
-    'wide/narrower',
-    'wide_papier',
-    'wideacre',
-    'wideawakefield',
-    'widebarn',
-    'widecombe-in-the-moor',
-    'widely-acclaimed',
-    'widely-admired',
-    'widely-adopted',
-    'widely-anticipated',
-    'widely-appreciated',
-    'widely-approved',
     'widely-circulated',
-    'widely-cited',
-    'widely-dispersed',
-    'widely-esteemed',
-    'widely-expected',
-    'widely-expressed',
-    'widely-feared',
-    'widely-felt',
-    'widely-flung',
-    'widely-leaping',
-    'widely-noticed',
-    'widely-opened',
-    'widely-prescribed',
-    'widely-publicized',
-    'widely-quoted',
-    'widely-ranging',
     'widely-ratified',
-    'widely-received',
-    'widely-recognized',
-    'widely-recommended',
-    'widely-reviled',
-    'widely-ridiculed',
-    'widely-shared',
-    'widely-splayed',
-    'widely-spreading',
-    'widely-studied',
-    'widely-sundered',
-    'widely-supported',
-    'widely-touted',
-    'widely-varying',
-    'widely.',
-    'wideman',
     'widemarsh',
-    'widened\'',
-    'widened.',
-    'widepalm',
-    'wider-based',
-    'wider/',
-    'widerberg',
-    'wideselling',
-    'widespreading',
-    'widest-possible',
-    'widesweeping',
-    'widex100&deg',
-    'widford',
-    'widgeons',
-    'widgers',
-    'widget-makers',
     'widgetlibrary',
-    'widgetmaker',
-    'widgetry',
-    'widjaya',
-    'widjayasatra',
-    'widley',
-    'widmaier',
-    'widmanstaetten',
-    'widmerpool',
-    'widmoser',
-    'widna',
-    'widna\'',
-    'widnall/national',
-    'widnell',
-    'widnells',
-    'widnes-castleford',
     'widnes-st.helens',
-    'widnes.',
-    'widny',
-    'widogast',
-    'widohem',
-    'widor',
-    'widow(er)hood',
-    'widow-bird',
-    'widow-birds',
-    'widow-black',
-    'widow-burning',
-    'widow-queen',
-    'widowed/divorced',
-    'widows\'/widowers',
-    'widows/widowers',
-    'widrow',
     'widsith',
-    'width(s)',
-    'width-responds',
-    'width:8.5n',
-    'widukind',
-    'widuri',
-    'widyha',
-    'widyono',
-    'wiebel-palade',
-    'wiebenson',
-    'wiecorek',
-    'wieczorek',
-    'wieczorek-zeul',
-    'wiedersehen',
-    'wiedersehn',
-    'wiegard',
     'wieger',
-    'wiegersma',
-    'wieghbridge',
-    'wiegmann',
-    'wiehl',
-    'wiek',
-    'wieke',
-    'wiel',
-    'wielandt',
-    'wieliczka',
-    'wielki',
-    'wielkiewicz',
-    'wielkiewicz.',
-    'wielkopolski',
-    'wielligh',
-    'wiene',
     'wiener-neustadt',
-    'wienerisch',
-    'wienerwald',
-    'wierenga',
-    'wierschutzin',
-    'wiersema',
-    'wiersma',
-    'wierzuchino',
-    'wies',
-    'wies&auml;ker',
-    'wiesbaden.',
-    'wiesmann',
-    'wiesrawa',
-    'wietersheim',
-    'wieting',
-    'wietske',
     'wiezai',
-    'wif',
-    'wife&rehy\'i',
-    'wife-',
-    'wife-and-child-beater',
-    'wife-and-motherhood',
-    'wife-at',
-    'wife-batterer',
-    'wife-beater',
-    'wife-doesn\'t-understand-me',
-    'wife-giver/wife-receiver',
-    'wife-has',
-    'wife-murder',
-    'wife-next-door',
-    'wife-swappers',
-    'wife-thrashing',
     'wife.richard',
-    'wife/',
-    'wife/children',
-    'wife/collaborator',
-    'wife/daughter',
-    'wife/i',
-    'wife/kid',
-    'wife/mother',
-    'wife/mother/housewife',
-    'wife/secretary/boss',
-    'wife_no',
-    'wifey-at-home',
-    'wiff',
-    'wiffard',
-    'wiffen',
-    'wiffeniana',
     'wifie',
-    'wifies',
-    'wifmen',
-    'wiftly',
-    'wig-holstein',
-    'wig-less',
-    'wig-out',
-    'wig-wearers',
-    'wig-zzzzz',
-    'wigan-leeds',
-    'wigan-st',
-    'wigan50',
-    'wigan50pts',
-    'wigbert',
-    'wigberto',
-    'wigbod',
     'wigens',
-    'wigfalls',
-    'wigg/world',
-    'wiggens',
-    'wiggenshaw',
-    'wiggett',
-    'wiggham',
-    'wiggins(1985)',
-    'wiggins/enthusiast',
-    'wigginton/gloucestershire',
-    'wiggle-waggle',
-    'wigglies',
-    'wiggonholt',
-    'wightlink',
-    'wightman/diabetic',
-    'wigin',
     'wigle',
-    'wigler',
-    'wigless',
-    'wiglike',
-    'wigmaker',
-    'wigmen',
-    'wignalls',
-    'wigstan',
-    'wigstow',
-    'wigtonshire',
-    'wigwell',
-    'wihih',
-    'wihthun',
-    'wihtin',
-    'wiikeri',
-    'wiiliam',
     'wiiling',
-    'wijaszko',
-    'wijayapala',
-    'wijayawickrame',
-    'wijchen',
-    'wijesinghe',
-    'wijetunga',
-    'wijeysinghe',
-    'wijhe',
-    'wijhe_et',
-    'wiji',
-    'wijkmark',
-    'wik-ik-ik',
-    'wik-wik-wik-wik-wik',
-    'wiklund',
-    'wiks',
     'wil-maaaaahh',
-    'wilamowitz-moellendorff',
-    'wilanow',
-    'wilayas',
-    'wilayats',
-    'wilbear',
-    'wilber',
-    'wilberfoss',
-    'wilbey',
-    'wilburton',
-    'wilbury',
-    'wilburys',
-    'wilcannia',
-    'wilcke',
-    'wilcken',
-    'wilcocke',
     'wilcockson',
-    'wilcocksy',
-    'wilcox-wood',
-    'wilcox/environmental',
-    'wild-bird',
-    'wild-flower',
-    'wild-flower-pressing',
-    'wild-flying',
-    'wild-fowling',
-    'wild-growing',
-    'wild-ice',
-    'wild-ish',
-    'wild-living',
-    'wild-men',
-    'wild-oat',
-    'wild-rose',
     'wild-tangle',
-    'wild.type',
-    'wild/medical',
-    'wilday',
-    'wildbird',
-    'wildboar-smith',
-    'wildboarclough',
-    'wildbore',
-    'wildbrook',
-    'wildbunch',
-    'wildcards',
-    'wildcatter',
-    'wildcatting',
-    'wildchild',
-    'wildeblood/pitt-rivers',
-    'wildenberg',
     'wilder-directed',
-    'wilderland',
-    'wildern',
-    'wildern/daughter',
-    'wilderspoool',
-    'wilderthorpe',
-    'wildf',
-    'wildfires',
-    'wildflower-rich',
-    'wildflowers.',
-    'wildflysch',
-    'wildgoose',
-    'wildhaus',
-    'wildhern',
-    'wildinson',
-    'wildish/breastfeeding',
     'wildlands',
-    'wildlife-based',
-    'wildlife/domestic',
-    'wildlife/nature',
-    'wildlifers',
-    'wildlifey',
-    'wildling',
-    'wildly-accelerating',
-    'wildly-blowing',
-    'wildly-eager',
-    'wildly-exaggerated',
-    'wildly-inappropriate',
-    'wildmon',
-    'wildmr',
-    'wildnerness',
-    'wildplants',
     'wildrid',
-    'wilds-geneva',
-    'wildscreen',
-    'wildsen',
-    'wildsounds',
-    'wildstyle',
-    'wildtrack',
-    'wildtrax',
-    'wildtype',
-    'wildwoods',
-    'wiled',
-    'wilemon',
-    'wilen',
-    'wilenski',
-    'wilensky',
-    'wiler',
     'wilesmith',
-    'wilfholme',
-    'wilfon',
-    'wilfra',
-    'wilfrd',
-    'wilfruna',
-    'wilgas',
-    'wilha',
-    'wilhehnstrasse',
-    'wilhelm-sebastian-schmerl',
-    'wilhelma',
-    'wilhelminian',
-    'wilhelmsen',
-    'wilhelmsh&ouml;he',
-    'wilhelmstrasse',
-    'wilhemine',
     'wilhemy',
-    'wilhjelm',
-    'wiliam',
-    'wiliamsburgh',
-    'wilier',
-    'wilikins-the',
-    'wilikinses',
-    'wilkaloid',
-    'wilkeses',
-    'wilkesiana',
-    'wilkies',
-    'wilkin-zeitner',
-    'wilkin/designer',
-    'wilking',
-    'wilking/reuter',
-    'wilkins/morris',
     'wilkins/patient',
-    'wilkinsion',
-    'wilkinson-geary',
-    'wilkinson-holmes',
-    'wilkinson/anti',
-    'wilkinson/disabled',
-    'wilkinson/evesham',
-    'wilkinson/reporting',
-    'wilkinsonfrom',
-    'wilko/list',
-    'wilkof',
-    'wilkoism',
-    'wilkovislak',
-    'wilkstrom',
-    'will&mdash;will',
-    'will&ndash;e',
     'will-become',
-    'will-brushed',
-    'will-gill',
-    'will-he-won\'t-he',
-    'will-it',
-    'will-maker',
-    'will-o-the-wisp',
-    'will-o-the-wisps',
-    'will-only',
-    'will-operate',
-    'will-pack',
-    'will-reading',
-    'will-rotted',
-    'will-to-change',
-    'will-to-exist',
-    'will-to-know',
     'will-to-live',
-    'will-to-meaning',
-    'will-to-survival',
-    'will-yums',
-    'will.do',
-    'will.help',
-    'will.make',
-    'will/should',
-    'will_as_soon',
-    'willaert-for',
-    'willaims',
-    'willallocate',
-    'willam',
-    'willatt',
-    'willatts',
-    'willbe',
     'willbourn',
-    'willbrook',
-    'willcocks/king',
-    'willcox/former',
-    'willd',
-    'willdermiss',
-    'willebeek',
-    'willebrands',
-    'willebrord',
-    'willehad',
-    'willelmo',
-    'willeman',
-    'willemeit',
-    'willemina',
-    'willemse',
-    'willemspoort',
     'willemsz',
-    'willenberg',
-    'willengen',
-    'willersey/gloucestershire',
-    'willesden&ndash;based',
-    'willesden/wembley',
-    'willeth',
-    'willett-whittacker',
-    'willett/consultant',
-    'willetts/aylesbury',
-    'willey/bet',
-    'willhire',
-    'william-and-mary',
-    'williamine',
-    'williams-judd',
-    'williams-wynn',
     'williams/',
-    'williams/bar',
-    'williams/botanist',
-    'williams/brewer',
-    'williams/conservationist',
-    'williams/emi',
-    'williams/forest',
-    'williams/grower',
-    'williams/guild',
-    'williams/headmaster',
-    'williams/hoffman/spielberg',
-    'williams/kelly',
-    'williams/midway',
-    'williams/mother',
-    'williams/neighbour',
-    'williams/organist',
     'williams/oxon',
-    'williams/playhouse',
-    'williams/r-r',
-    'williams/sub-postmaster',
-    'williams/susan',
-    'williams/teacher',
-    'williams/team',
-    'williams/traffic',
-    'williams/vicar',
-    'williams/video',
-    'williamseconomic',
-    'williamsii',
-    'williamsl',
-    'williamson(1968)',
-    'williamson/aged',
-    'williamson/carer',
     'williamson/local',
-    'williamson/strathclyde',
-    'williamson/thames',
-    'williamstrained',
-    'williamthorpe',
-    'willians',
-    'willians/family',
-    'willibiro-sako',
-    'willie-ism',
-    'willie-o',
-    'willie-paugh',
-    'willies-williams/fort',
-    'williford',
-    'willigis',
-    'willin',
-    'willing\'',
     'willing-like',
-    'willinger',
-    'willinghall',
-    'willinghams',
-    'willingly&rehy;or',
-    'willingness-to-pay',
-    'willingon',
-    'willington-born',
-    'willington-rideout',
-    'willis-ee-ee',
-    'willis.',
-    'willis/headteacher',
-    'willisii',
-    'willitt',
-    'williume',
-    'williwaw',
     'williwaws',
-    'willkomen',
-    'willliam',
-    'willloughby',
-    'willment',
-    'willmes',
-    'willmott\'',
-    'willmottianum',
-    'willner/various',
-    'willny',
-    'willoby',
-    'willoch',
-    'willon',
-    'willoughby\'',
-    'willoughby/mare',
-    'willow&rehy',
     'willow-and-cane',
-    'willow-branch',
-    'willow-fringed',
-    'willow-herbs',
-    'willow-like',
-    'willow-planted',
-    'willow-plum',
-    'willow-tree.',
-    'willow-trees',
-    'willow-woods',
-    'willow.',
-    'willow/chiffs',
-    'willowbeck',
-    'willowdale',
-    'willowgate',
-    'willowholme',
     'willowing',
-    'willowmead',
-    'willows/bmw',
-    'willowsprouts',
-    'willowtree',
-    'willprobably',
-    'wills/coach',
-    'willsden',
-    'willshaw',
-    'willsmore',
-    'willsworthy',
-    'willy\'',
-    'willy-willies',
-    'willy-woofers',
-    'willya',
-    'willynilly',
     'willyum',
-    'willywire',
-    'wilmar',
-    'wilmerding',
-    'wilmersdorf',
-    'wilmersdorferstrasse',
-    'wilmhurst',
-    'wilmink',
-    'wilmont',
-    'wilmores',
-    'wilmot-breedon',
-    'wilmot-brown',
-    'wilmot-sitwell',
-    'wilmot/survivor',
-    'wilmotold',
-    'wilna\'',
     'wilo',
-    'wilpak',
-    'wilred',
-    'wils',
-    'wilsden',
-    'wilsford',
-    'wilslow',
-    'wilsnak',
-    'wilso',
-    'wilson&mdash;johnson',
-    'wilson&rehy;roberts',
-    'wilson-cook',
-    'wilson-gray',
-    'wilson-heath-wilson',
-    'wilson-james',
-    'wilson-macdonald/consultant',
     'wilson-macdonald/trauma',
-    'wilson-mitchell',
-    'wilson-roberts',
-    'wilson-salem',
-    'wilson-style',
-    'wilson-type',
-    'wilson-webb',
-    'wilson/actor',
-    'wilson/ben',
-    'wilson/callaghan',
-    'wilson/cambridge',
-    'wilson/chief',
-    'wilson/earth',
-    'wilson/hospital',
-    'wilson/householder',
-    'wilson/labour',
     'wilson/nurse',
-    'wilson/resident',
-    'wilson/st',
-    'wilson/west',
-    'wilsoni',
-    'wilsonianae',
-    'wilsonindustry',
-    'wilsonvilee',
-    'wilstan',
-    'wilstar',
-    'wilstermann',
-    'wilstshire',
-    'wiltchinsky',
-    'wiltering',
-    'wiltingly',
-    'wilton-jones',
     'wiltrud',
-    'wiltshire/architect',
-    'wiltshire/campaign',
-    'wimber.2',
-    'wimbish',
-    'wimbldeon',
-    'wimbledon-based',
-    'wimbledon-style',
-    'wimboldsley',
-    'wimlas',
-    'wimmin-friendly',
-    'wimminuscript',
-    'wimmis',
-    'wimpdom',
-    'wimpenny',
-    'wimper',
     'wimpering',
-    'wimpy-never-let-anyone-know-that-you-goto-church',
-    'wimpy-precinct',
-    'wimpys',
-    'wimshurst',
-    'win&rehy;win',
-    'win\'fred',
-    'win(c)',
-    'win-at-all-costs',
-    'win-dev',
-    'win-dow',
-    'win-hungry',
-    'win-loss',
-    'win-over',
-    'win-win-win',
-    'win.',
     'win.bak',
-    'win/win',
-    'win32c',
-    'winai',
-    'winander',
-    'winandermere',
-    'winbergh',
-    'winblad',
-    'winbstone',
-    'winburgh.they',
-    'wincarnis',
-    'wince-making',
-    'winced.',
-    'winchcombe/team',
-    'wincheater',
-    'winchells',
     'winchelseys',
-    'winchester-based',
-    'winchmill',
-    'winckelman',
-    'winckelmann-lessing',
-    'winckle',
-    'wincott',
-    'wind&rehy;screen',
-    'wind-against-tide',
-    'wind-balanced',
-    'wind-band',
-    'wind-beaten',
-    'wind-bells',
-    'wind-blast',
-    'wind-blow',
-    'wind-born',
     'wind-breath',
-    'wind-buffeted',
-    'wind-cheating',
-    'wind-contorted',
-    'wind-contoured',
-    'wind-currents',
-    'wind-distributed',
-    'wind-eroded',
-    'wind-factor',
-    'wind-fall',
-    'wind-farm',
-    'wind-filled',
-    'wind-fluttered',
-    'wind-fondled',
-    'wind-full',
-    'wind-funnelling',
     'wind-generated',
-    'wind-generators',
-    'wind-group',
-    'wind-in-the-hair',
-    'wind-lashed',
-    'wind-looped',
-    'wind-machine',
-    'wind-music',
-    'wind-on',
-    'wind-operated',
-    'wind-out',
-    'wind-path',
-    'wind-polished',
-    'wind-proof',
-    'wind-proofed',
-    'wind-pruned',
     'wind-ravaged',
-    'wind-recorder',
-    'wind-reddened',
-    'wind-ripped',
-    'wind-ruffled',
-    'wind-scour',
-    'wind-scoured',
-    'wind-sculpted',
-    'wind-sculptured',
-    'wind-shattered',
-    'wind-sheltered',
-    'wind-shield',
-    'wind-shields',
-    'wind-shift',
-    'wind-shriven',
-    'wind-sighs',
     'wind-skill',
-    'wind-sock',
-    'wind-sounds',
-    'wind-spirit',
-    'wind-stirred',
-    'wind-stripes',
-    'wind-suck',
-    'wind-suckers',
-    'wind-surfs',
-    'wind-swirled',
-    'wind-tears',
-    'wind-thrashed',
-    'wind-touched',
-    'wind-trembling',
-    'wind-tunnel-proven',
-    'wind-tunnel-tested',
     'wind-tunnelling',
-    'wind-up.national',
-    'wind-ups',
-    'wind-vane',
-    'wind-walker',
-    'wind-warped',
-    'wind-water',
-    'wind-winnowing',
-    'wind-worked',
-    'wind.',
-    'wind.he',
-    'winda',
-    'windae',
-    'windahl',
-    'windansea',
-    'windau',
     'windbase',
-    'windbitten',
-    'windblow',
-    'windblown-hair',
-    'windborne',
-    'windcheatered',
-    'windcheetah',
-    'windchimes',
-    'windedness',
-    'windels',
-    'winderesque',
-    'winderin',
-    'windermere-based',
-    'windersham',
-    'windes',
-    'windesk',
     'windex',
-    'windfarming',
-    'windfellow',
-    'windfield',
-    'windfill',
-    'windflow',
-    'windfrey',
-    'windgallen',
-    'windgather',
-    'windial',
-    'windier',
-    'windies&amp;supf',
-    'winding&rehy;down',
-    'winding-engine',
-    'winding-hut',
-    'winding-in',
     'winding-on',
-    'windlassed',
-    'windles',
-    'windlessness',
-    'windlift',
-    'windlite',
-    'windmill-tilting',
-    'windmills.',
-    'windo/singer',
-    'windover',
-    'windover-the-graves',
-    'window&mdash',
-    'window&rehy;frame',
-    'window&rehy;mounted',
-    'window\'',
-    'window-',
     'window-and',
-    'window-blind',
-    'window-bursting',
-    'window-catches',
-    'window-compliant',
-    'window-display',
-    'window-dress',
-    'window-dressers',
-    'window-fronted',
-    'window-gap',
-    'window-gazing',
-    'window-glass',
-    'window-glazed',
-    'window-glazing',
-    'window-grammar',
-    'window-grilles',
     'window-hole',
-    'window-icon-mouse-pop-up',
-    'window-ledges',
-    'window-lock',
-    'window-mountable',
-    'window-mounting',
-    'window-oblongs',
-    'window-on-the-world',
-    'window-rail',
-    'window-revels',
-    'window-shaking',
-    'window-shop',
-    'window-sized',
-    'window-slots',
-    'window-smashing',
-    'window-space',
     'window-spaces',
-    'window-square',
-    'window-stickers',
-    'window-suits',
-    'window-to',
-    'window-to-window',
-    'window-type',
-    'window.dressing',
-    'window/valentine',
-    'windowbills',
-    'windowes',
-    'windowframe',
-    'windowframes',
-    'windowful',
-    'windowlight',
-    'windows\'dde',
     'windows-32',
-    'windows-alike',
-    'windows-compliant',
-    'windows-ms-dos',
-    'windows-on',
-    'windows-on-alpha',
-    'windows-on-dos',
-    'windows-on-solaris',
-    'windows-optimized',
-    'windows-type',
-    'windows.i',
-    'windows.networking',
-    'windows.tin',
-    'windows/drivers',
-    'windpipes',
-    'windproofness',
     'windpuff-bonnet',
-    'windpump',
-    'windred',
-    'windrift',
-    'winds-creen',
-    'windsacks',
-    'windsc',
-    'windscape',
-    'windscreen-washers',
-    'windscreen-wiper',
-    'windscreen.',
-    'windshaft',
-    'windshear',
-    'windsheim',
-    'windshifts',
-    'windshine',
     'windsor-lewis',
-    'windsor-style',
-    'windsor/actress',
-    'windsoredge/nailsworth/gloucestershire',
-    'windspeeds',
-    'windsreen',
-    'windstar',
-    'windstorms',
-    'windsucking',
-    'windsufring',
-    'windsurfers.',
-    'windt',
-    'windvale',
-    'windvane',
-    'windwalker/gayla',
-    'windward-leeward',
     'windwhistle',
-    'windx2/50',
-    'windy-pop',
-    'windyedge',
-    'windyridge',
-    'wine&rehy;growers',
-    'wine\'',
-    'wine-',
-    'wine-bottle',
-    'wine-bottles',
-    'wine-breath',
-    'wine-brokers',
-    'wine-buff',
-    'wine-cellars',
-    'wine-conscious',
-    'wine-cured',
     'wine-drenched',
-    'wine-drinkers',
-    'wine-exporting',
-    'wine-filled',
-    'wine-flushed',
-    'wine-glassful',
-    'wine-god',
-    'wine-harvest',
-    'wine-jar',
-    'wine-jars',
-    'wine-labels',
-    'wine-licensing',
-    'wine-lovers',
-    'wine-loving',
-    'wine-merchants',
-    'wine-numbed',
     'wine-offerings',
-    'wine-olive-wheat',
-    'wine-pouch',
-    'wine-producers',
-    'wine-rack',
-    'wine-resistant',
-    'wine-shipping',
-    'wine-shop',
-    'wine-smelling',
-    'wine-sort',
-    'wine-stained',
-    'wine-stains',
-    'wine-swilling',
-    'wine-table',
-    'wine-vat',
-    'wine-wise',
     'wine/',
-    'wine/fruit',
-    'wine/gelatin',
-    'wine/tapas',
-    'wine_at',
-    'winebar',
-    'wineberries',
-    'winegrower',
-    'winegrowing',
-    'wineguardminister',
-    'winek',
-    'winelake',
-    'winer/diner',
-    'winesellers',
-    'winestuffs',
-    'winetasting',
     'wineways',
-    'winfarthing-fersfield',
-    'winfile.ini',
-    'winford',
-    'wing&eacute;d',
-    'wing\'',
-    'wing-base',
-    'wing-bases',
-    'wing-bearing',
-    'wing-bones',
-    'wing-braced',
-    'wing-bud',
-    'wing-buds',
-    'wing-collars',
-    'wing-commanders',
-    'wing-coverts',
     'wing-dance',
-    'wing-ding',
-    'wing-fans',
-    'wing-feathers',
-    'wing-flapping',
-    'wing-flaps',
-    'wing-fold',
-    'wing-folded',
-    'wing-forwards',
-    'wing-hair',
-    'wing-heeled',
-    'wing-it',
-    'wing-knuckles',
-    'wing-less',
-    'wing-level',
-    'wing-leveller',
     'wing-loading',
-    'wing-movement',
-    'wing-movements',
-    'wing-nut',
-    'wing-nuts',
-    'wing-nutted',
-    'wing-parties',
-    'wing-polarizing',
-    'wing-powers',
-    'wing-roots',
-    'wing-rudiment',
-    'wing-rudiments',
-    'wing-scales',
-    'wing-screws',
-    'wing-spans',
-    'wing-spread',
     'wing-stirrings',
-    'wing-stretched',
-    'wing-stretching',
-    'wing-tagged',
-    'wing-tat',
-    'wing-threequarter',
-    'wing-to-fuselage',
-    'wing-tremble',
-    'wing-walk',
-    'wing-walked',
-    'wing-walkers',
-    'wing-walking',
-    'wing-whirring',
-    'wing.coupling',
-    'wing.development',
-    'wing.margins',
     'wing.scales',
-    'wing.when',
-    'wing/',
-    'wing_as_long',
-    'wingard',
-    'wingbacked',
-    'wingbar',
-    'wingbones',
-    'wingborne',
-    'wingding',
-    'wingdrop',
-    'winged-back',
-    'winger/disco',
-    'winger/jane',
-    'winger/outside-half',
-    'wingert',
     'wingetts',
-    'wingfield-digby',
-    'wingfield-led',
-    'winglet',
-    'wingletted',
-    'wingmaster',
-    'wingnut',
-    'wingrave/buckinghamshire',
-    'wingroot-mounted',
-    'wingrove/education',
-    'wingrson',
-    'wings-eleven',
-    'wings-level',
-    'wings-open',
-    'wings/',
-    'wingshield',
     'wingspread',
-    'wingtip.',
-    'wingwork',
-    'winifride',
-    'winifried',
-    'winisatt',
-    'winkel',
-    'winkelerf',
-    'winkelerven',
-    'winkies',
-    'winkl',
-    'winkle-bag',
-    'winkle-eating',
-    'winkle-pickered',
-    'winkleberries',
-    'winklebury',
     'winkley',
-    'winkley/governor',
-    'winkowskis',
-    'winky-winky',
-    'winlaw',
-    'winlok',
-    'winmill/conservative',
-    'winmill/former',
-    'winn-darley',
-    'winnal',
-    'winneba',
-    'winner-drought',
-    'winner-making',
-    'winner.the',
-    'winner/film',
-    'winner/tackler',
     'winners-and-losers',
-    'winneth',
-    'winney/new',
-    'winnifred',
-    'winnin\'',
-    'winnington-ingram',
-    'winnners',
-    'winnnnerrrr',
-    'winnock',
-    'winnows',
-    'winnsboro',
-    'winocour',
-    'winoes',
-    'winokur',
-    'winoto',
-    'winows/nt',
     'winowska',
-    'winpmt=',
-    'winram',
-    'winrow',
-    'winscreen',
-    'winsdale',
-    'winshill',
-    'winsick',
-    'winskill',
-    'winslc',
-    'winsley',
-    'winsockets',
-    'winsom',
-    'winson/gloucestershire',
-    'winsone',
-    'winsten',
     'winstler',
-    'winstonlead',
-    'winstons',
-    'winsum',
-    'winsx',
-    'wintec',
-    'winter\'s-end',
-    'winter-bare',
-    'winter-blinded',
-    'winter-bound',
-    'winter-bright',
-    'winter-drilled',
-    'winter-dry',
-    'winter-early',
-    'winter-fashion',
-    'winter-gripped',
     'winter-grown',
-    'winter-hardy',
-    'winter-hungry',
-    'winter-inn',
-    'winter-lean',
-    'winter-lit',
-    'winter-pallid',
-    'winter-plumage',
-    'winter-plumaged',
-    'winter-roost',
-    'winter-sown',
-    'winter-stored',
-    'winter-stripped',
-    'winter-to-spring',
-    'winter-visiting',
-    'winter-warmer',
     'winter-weary',
-    'winter-weight',
-    'winter-woods',
-    'winter-yarded',
-    'winter.the',
-    'winter/bosnia',
-    'winter/chateau',
-    'winter/early',
-    'winter/summer',
-    'winterborn',
-    'winterborne',
-    'winterbothams',
-    'winterbreak',
-    'winterers',
-    'winterfield',
-    'winterhalder',
     'winterhalters',
-    'winteringham',
-    'winterized',
-    'winterlarken',
-    'winterlong',
-    'winterly',
-    'winterman',
-    'winterschool',
-    'winterset',
-    'wintershove',
-    'wintertaylors',
-    'wintertide',
-    'wintertons',
-    'winterwear',
-    'winterwood',
-    'winther',
     'winthrop.',
-    'wintoncester',
-    'wintoun',
-    'wintour-pudding',
-    'wintours',
-    'wintree',
-    'wintzenheim',
-    'winvisible',
-    'winwindows',
-    'winwood/musician',
-    'winy-patches',
-    'winzerhaus',
-    'wioth',
-    'wipe-away',
-    'wipe-outs',
-    'wipe-over',
     'wipe-through',
-    'wipe/wash',
-    'wiped-clean',
-    'wiped-up',
-    'wiper-blades',
-    'wipers-this',
-    'wipline',
-    'wiplines',
-    'wipp',
-    'wipperman',
-    'wippy',
-    'wiptc',
-    'wira',
-    'wirawan',
-    'wirchynges',
-    'wirds',
     'wire&rehy;cut',
-    'wire&rehy;rimmed',
-    'wire-armoured',
-    'wire-brush',
-    'wire-cutting',
-    'wire-drawers',
-    'wire-drawing',
-    'wire-fragile',
-    'wire-free',
-    'wire-guarded',
-    'wire-guided',
-    'wire-less',
-    'wire-line',
-    'wire-meshed',
-    'wire-net',
-    'wire-pullers',
     'wire-pulling',
-    'wire-reinforced',
-    'wire-rope',
-    'wire-secured',
-    'wire-service',
-    'wire-spoke',
-    'wire-spoked',
-    'wire-stripper',
-    'wire-strippers',
-    'wire-tie',
-    'wire-ties',
-    'wire-tight',
-    'wire-wheeled',
-    'wire-worm',
-    'wire-wound',
-    'wire/components',
     'wire/therapist',
-    'wired-made',
-    'wiredrawer',
-    'wireframe-orientated',
-    'wireless-directed',
-    'wireless-mechanic',
-    'wireless-owning',
-    'wirepulling',
-    'wiretapping',
-    'wireways',
-    'wirewool',
-    'wireworm',
-    'wirier',
-    'wiriest',
-    'wirk',
-    'wirkand',
     'wirken',
-    'wirklichkeiten',
-    'wirkyng',
-    'wirkynge',
-    'wirl',
-    'wirling',
-    'wirmola',
-    'wirnsberger',
-    'wirra',
-    'wirral-',
-    'wirral-6.3',
-    'wirral-wide',
-    'wirralians',
-    'wirs3',
-    'wirsels',
-    'wirst',
     'wirth/designer',
-    'wirthses',
-    'wirtschaftsalphabet',
-    'wirtschaftsgebiet',
-    'wirtschaftspartei',
-    'wirtschaftspruferkammer',
-    'wirtschaftsrat',
-    'wirtschaftsvergleiche',
-    'wirtwhile',
-    'wis&lstrok;a',
-    'wis-out',
-    'wisal',
-    'wisanbell',
-    'wisara',
-    'wisbeach',
-    'wiscasset',
     'wisconsin-stout',
-    'wiscus',
-    'wisd',
-    'wisdom-giving',
-    'wisdom-tooth',
-    'wisdom.',
-    'wisdon',
-    'wise-bade',
-    'wise-child-selves',
-    'wise-cracks',
-    'wise-head',
-    'wise-looking',
-    'wise-owl',
-    'wise-sky',
-    'wise/victim',
-    'wiseacre',
     'wisebacked',
-    'wisecrackers',
-    'wiseguys',
-    'wisehart',
-    'wiseheads',
-    'wisely-silent',
-    'wisely.',
-    'wisely.and',
-    'wiseman/village',
-    'wisemens',
-    'wisenden',
-    'wisenheimer',
-    'wisent',
-    'wisenthal',
-    'wiseton',
-    'wish-',
     'wish-dreams',
-    'wish-impulse',
-    'wish-you-were-here',
-    'wishard',
-    'wishbear',
-    'wishe',
-    'wisheart',
-    'wished.',
-    'wishee',
-    'wishes-\'i',
-    'wishes-has',
-    'wishest',
-    'wishford',
-    'wishful-thinking',
-    'wishfulness',
-    'wishing&mdash;perhaps',
     'wishing-ring',
-    'wishing-well',
-    'wishing-your-life-away',
-    'wishlist',
-    'wishmoor',
-    'wishram',
-    'wishwa',
-    'wisible',
-    'wisiwig',
-    'wisiwyg',
-    'wiskes',
-    'wislang',
-    'wislon',
-    'wisma',
-    'wismut',
-    'wisner',
     'wisniewski',
-    'wisniewskie',
-    'wisogast',
-    'wisono',
-    'wisp\'',
-    'wispas',
-    'wispiest',
-    'wispily',
-    'wispiness',
-    'wisplike',
-    'wispy-haired',
-    'wisselingh',
-    'wissenchaften',
-    'wissenden',
-    'wissenschaften',
-    'wissenschaftler-integrationsprogramm',
     'wissenschaftlich',
-    'wissenschftsrat',
-    'wissh',
-    'wissington',
-    'wister',
-    'wisteria-clad',
-    'wistino',
-    'wisty',
-    'wisznienski',
-    'wit-wit-wit',
-    'witasse',
-    'witbooi',
-    'witch&rehy',
-    'witch&rehy;cults',
-    'witch-burnings',
-    'witch-craze',
     'witch-cursed',
-    'witch-delusions',
-    'witch-doctor-like',
-    'witch-doctored',
-    'witch-evil-woman',
-    'witch-hair',
-    'witch-hare',
-    'witch-herbs',
-    'witch-in-the-cupboard',
-    'witch-king',
-    'witch-lore',
-    'witch-marks',
-    'witch-murderer',
-    'witch-satanist',
-    'witch-sign',
-    'witch-women',
     'witchcraft-murder',
-    'witchcrafts',
-    'witchcrazed',
-    'witchdoctors',
-    'witched',
-    'witchell/pupil',
-    'witchend',
-    'witchfinders',
-    'witchin\'',
-    'witchlord',
-    'witchraft',
-    'witchy',
-    'wite',
-    'witehall',
-    'witek',
-    'witelson',
     'with&mdash',
-    'with&mdash;and',
-    'with&mdash;or',
-    'with&rehy;draw',
-    'with&rehy;drawing',
-    'with&rehy;drawn',
-    'with&rehy;drew',
-    'with\'em',
-    'with(in)',
-    'with-a-run',
-    'with-all-your-heart',
-    'with-and-without',
-    'with-athelstan',
-    'with-beastly',
-    'with-doubts',
-    'with-drawing',
     'with-gall',
-    'with-giant',
-    'with-held',
-    'with-her',
-    'with-holding',
-    'with-out',
-    'with-reserves',
-    'with-shells',
-    'with-the-one-saxophone-tacked-on',
-    'with-wage-led',
-    'with.her',
-    'with.it',
-    'with.stuffed',
-    'with/for',
-    'with/has',
-    'with/know',
     'with/through',
-    'with/utilization',
-    'with/without',
-    'with:a',
-    'with_a_,_with_a',
-    'with_er_regard_to',
-    'with_in_the',
-    'with_reference_erm_to',
-    'with_with_reference_to',
-    'with_with_regard_to',
-    'witha',
-    'withaht',
-    'withan',
-    'withcall',
-    'withcote',
-    'withcryptogenic',
     'withdawn',
-    'withdean',
-    'withdefective',
-    'withdraawl',
-    'withdraw&mdash;see',
-    'withdrawal-',
-    'withdrawal.the',
-    'withdrawals.1',
-    'withdrawl',
-    'withdrawm',
-    'withdrawn.',
-    'withdrawn.chris',
-    'withdrew-to',
-    'withell',
-    'withenfield',
-    'withens',
     'witherby',
-    'witherden',
-    'withered-looking',
-    'witheredness',
-    'withers/estate',
-    'withersford',
-    'withert',
-    'withet',
-    'withg',
-    'withgin',
-    'withh',
-    'withheld&mdash;if',
-    'withheld&mdash;landlord',
-    'withheld.',
-    'withi',
-    'withiel',
     'within-block',
-    'within-country',
-    'within-edifice',
-    'within-level',
-    'within-litter',
-    'within-period',
-    'within-plate',
-    'within-sample',
-    'within-sex',
-    'within-shops',
-    'within-turn',
-    'within-twins',
-    'within_a',
-    'withington-also',
-    'withington-barton',
-    'withington/herefordshire',
     'withinin',
-    'withinshaw',
-    'withint',
-    'withnail',
-    'withnell',
-    'witho',
-    'witholds',
-    'withoput',
-    'withother',
-    'without\'em',
-    'withoutknowledge',
-    'withouts',
-    'withoutsignificant',
-    'withs',
-    'withstandconstant',
-    'withstander',
     'withstandeth',
-    'withstands-bloody-cold-arctic-conditions',
-    'withvery',
-    'withyam',
-    'withypoole',
-    'wititterly',
-    'witlatschil',
-    'witlings',
-    'witloof',
-    'witmen',
-    'witmer',
-    'witness&mdash;you',
-    'witness-lists',
-    'witnessing.',
-    'witnessings',
-    'witny',
     'witoelar',
-    'witon',
-    'witrood',
-    'witrug',
-    'witsen',
-    'witsey',
-    'witshire',
-    'witswatersrand',
-    'witta',
-    'wittel',
-    'wittelsbachs',
-    'witterin\'',
-    'wittersham',
-    'wittgenstein\'',
-    'witthoft',
-    'witting',
     'wittle',
-    'wittled',
-    'wittleder',
-    'wittles',
-    'wittlesbach',
-    'wittlich',
-    'wittol',
-    'witton-le-wear-based',
-    'witton/head',
-    'wittonle-wear',
-    'wittons',
-    'wittrick-williams',
-    'witts',
-    'witwoud',
-    'witz',
-    'witzenberg',
     'witzendorff',
-    'witzenhausen',
-    'witzin',
-    'wiuth',
-    'wive',
-    'wivell',
-    'wivell/mayor',
-    'wivelrod',
-    'wivina',
-    'wizac',
-    'wizanskys',
-    'wizard.',
-    'wizardly',
-    'wized-up',
-    'wizen',
-    'wizzed',
     'wizzer',
-    'wizzywig',
-    'wj&amp;csr',
-    'wj121',
-    'wj146',
-    'wj149',
-    'wj215',
-    'wj244',
-    'wj288',
-    'wj866',
-    'wjh',
-    'wji',
-    'wjkmvlhmlkjolksqmxrtkjdmpgnpp',
-    'wk1',
-    'wklb',
-    'wknd',
     'wksdif',
-    'wl/fc',
-    'wl181',
-    'wl790',
-    'wlad',
-    'wladawsky-berger',
-    'wladfa',
-    'wladislas',
-    'wladislaw',
-    'wlaker',
-    'wlap',
-    'wlawdsky-berger',
-    'wldc',
-    'wlenking',
-    'wlhp',
-    'wliich',
     'wlil',
-    'wlison',
-    'wlodimierz',
-    'wls',
-    'wlt',
-    'wlw',
-    'wm-z',
-    'wm536',
-    'wm969',
-    'wma',
-    'wmcq',
-    'wmffra',
-    'wmgo',
-    'wmt',
-    'wn4',
-    'wn467',
     'wn5',
-    'wn890',
-    'wna',
-    'wnated',
-    'wnbc',
-    'wneh',
-    'wnion',
-    'wnted',
-    'wo&uacute;ld',
-    'wo-',
-    'wo-de-shu',
-    'wo-where\'d-my-stomach-go',
-    'wo/squads',
-    'wo1',
-    'wo13',
-    'woad-dyed',
     'wobb',
-    'wobb-er-ling',
-    'wobba',
-    'wobbe-ohlenburg',
-    'wobbl',
-    'wobble-pump',
-    'wobblebottoms',
-    'wobblingly',
-    'wobblings',
-    'wobbly-eyed',
-    'wobt',
-    'woburn/bedfordshire',
-    'woc',
-    'woce',
-    'wocensaete',
-    'woche',
     'wocheiner',
-    'wochenblatt',
-    'wock',
-    'wockeck',
-    'wocking',
-    'wocklow',
-    'wod',
-    'wodajo',
-    'wodan',
-    'wodecock',
-    'wodemed',
-    'wodgate',
-    'wodgy',
-    'wodrow',
-    'wodwo',
-    'wodwos',
     'woe-begone',
-    'woe-betide',
-    'woe-dark',
-    'woe-drag',
-    'woe-is-me',
-    'woe-to-man',
-    'woed',
-    'woefulness',
-    'woeikof',
-    'woek',
-    'woeld',
-    'woewiyu',
-    'wofsy',
-    'woful',
-    'wog-free',
-    'wogara',
     'wogga-wogga-land',
-    'woggin',
-    'wogginton',
-    'woggle',
-    'woggle-wearing',
-    'woggy',
-    'wogin',
-    'woglom',
-    'wogmobiles',
-    'wohhh',
-    'wohin',
-    'wohlfahrt',
-    'wohlfahrtsverband',
-    'wohlfart',
-    'wohlgemut',
-    'wohlmutsch&uuml;ll',
     'wohlrab',
-    'wohlth&auml;tigkeit',
-    'wohnen',
-    'wohrder',
-    'woi',
-    'woild',
-    'woizikowsky',
-    'wojiciech',
-    'wojju',
-    'wojna',
-    'wojnarowska',
-    'wojtas',
-    'wojtech',
-    'wojtek',
-    'wojupto',
-    'wokalup',
     'woked',
-    'wokham',
-    'woking-based',
-    'wokingham/berkshire',
-    'wokking',
-    'wokler',
-    'wolages',
-    'wolber',
-    'wold/gloucestershire',
-    'woldeab',
-    'woldendorp',
-    'woldingham',
-    'woldiya',
-    'woldopolis',
-    'wolen',
-    'wolf-children',
     'wolf-demon',
-    'wolf-den',
-    'wolf-dieter',
-    'wolf-flesh',
-    'wolf-fur',
-    'wolf-god',
-    'wolf-haunted',
-    'wolf-hounds',
-    'wolf-howl',
-    'wolf-language',
-    'wolf-month',
-    'wolf-pack',
-    'wolf-rats',
-    'wolf-rayet',
-    'wolf-rayet-like',
-    'wolf-repellent',
     'wolf-teeth',
-    'wolf-trap',
-    'wolf-woman',
-    'wolf.',
-    'wolf/thunderbolt',
-    'wolfamcote',
-    'wolfberry',
-    'wolfcreatury',
-    'wolfdogs',
-    'wolfe-mowe',
-    'wolfe/m&ouml;we',
-    'wolfenstein-2',
-    'wolfenstein-3d',
-    'wolferen',
-    'wolfers',
-    'wolffia',
     'wolffs',
-    'wolfgang-san',
-    'wolfgangus',
-    'wolfhamcote',
-    'wolfhangar',
-    'wolfhart',
-    'wolfies',
-    'wolflight',
-    'wolflike',
-    'wolfmeat',
-    'wolfnotes',
-    'wolfovitz',
-    'wolfpack',
-    'wolfrat',
-    'wolfs-heads',
-    'wolfsdale',
     'wolfskins',
-    'wolfson-rilke',
-    'wolfspiders',
-    'wolfstone',
-    'wolfwhistles',
-    'wolgast',
-    'wolgate',
-    'wolhusen-luzern',
-    'wolhuser',
-    'wolinsky',
-    'wolka',
-    'wolkenstein',
-    'wolkensturmer',
-    'wolko',
-    'wolkowitz',
-    'wolland',
     'wolldridge',
-    'wolle',
-    'wollenberg',
-    'wolley/neighbour',
-    'wollow',
-    'wolmuth',
-    'wolno&sacute&cacute',
-    'wolosi',
-    'woloszyn',
-    'wolozhin',
-    'wolper',
-    'wolpin',
-    'wolrath',
-    'wolstanton',
-    'wolstenhome',
-    'wolsthenholme',
     'wolston',
-    'wolstonecraft',
-    'wolsztyn',
-    'wolters-kluwer',
-    'wolton/oxford',
-    'woltons',
-    'woltosz',
-    'woltz',
-    'wolv',
-    'wolvercloth',
-    'wolverhampton.',
-    'wolverston',
-    'wolverton-designed',
-    'wolvine',
-    'woma',
-    'woman&mdash',
     'woman&mdash;let',
-    'woman\'',
-    'woman\'s-magazine',
-    'woman-acting',
-    'woman-as&rehy;mother',
-    'woman-as-art-object',
-    'woman-as-eve',
-    'woman-as-witch',
-    'woman-at-play',
-    'woman-centredness',
-    'woman-chasing',
-    'woman-farmer',
-    'woman-focused',
-    'woman-goddess',
-    'woman-hater.',
-    'woman-hatred',
     'woman-hours',
-    'woman-in-me',
-    'woman-me',
-    'woman-of-advanced-ideas',
-    'woman-of-the-glove',
-    'woman-positive',
-    'woman-post',
-    'woman-pulling',
-    'woman-shaped',
-    'woman-starved',
-    'woman-stealing',
-    'woman-unfriendly',
-    'woman-watching',
-    'woman-who-had-never-had-a',
-    'woman.this',
-    'woman/artist',
     'woman/feminine',
-    'woman/herbal',
-    'woman/notice',
-    'woman/peace',
-    'woman/pure',
-    'woman/silk',
-    'woman/sudden',
-    'woman1',
-    'woman_other',
-    'womanised',
-    'womanists',
-    'womanlecturer',
-    'womanlessness',
-    'womanservant',
-    'womansize',
-    'womanwords',
     'womar',
-    'womb\'',
-    'womb-bearing',
-    'womb-cave',
-    'womb-connections',
-    'womb-door',
-    'womb-echoing',
-    'womb-envy',
-    'womb-glow',
-    'womb-light',
-    'womb-man',
-    'womb-room',
-    'womb-smelling',
-    'womb-sufferer',
-    'womb-warm',
-    'womb-water',
     'womb.',
-    'womb/untimely',
-    'wombadelia',
-    'wombed',
-    'womblemania',
-    'wombling',
+)
+
+blocks_49 = (
+    '&)r&ouml;hm\'#oms#(ngebilde#%razin$"en#!s#%tever#$yudi"#i\'a##-an#\'blingen#%dberg$!e$)mannslust#.f-cum-designer',
+    '$!a$"er$#ish##ght$%uoren#$kune#&lingly$"ua#!m$$airi#%napel%!t$&dustry$"ed%&wright',
+    '%#gai$%homes$#man$%scoat\'"tt$"ui&&-a-rua&%omata$/wright-inspired*!.*!s#$poua$&ukurau#(r-you-a\'$*arapa-bush',
+    '$)enstrasse$&selius$+t&rehy;deep+$size%)-crushing\'"ut&$down&)expanding&$hook&(skimming\'\'panning\'%tring&(to-ankle)(shoulder%2/tummy/hips/bottom',
+    '%&coat-w)!y%#ell%$less&+ine-busters)!r%(reducing%(watchers#\'t&mdash$%-free%#see%)wait-wait$&.anger$,e/successful%$d-on',
+    '%-rs/waitresses$!h%"ie$!i%!n&&g-area((for-ages($game($maid($time,!s(%woman+"en\'&.until\'$/and',
+    '%#ing$#omo%!n$)ress-work%+ose&pound;s((-lifting$\'s-esque&,soundtracked%*/worcester$$zkin%\'strasse#%vered$"or#$zero"$kaba',
+    '$$rusa$"sa#7e-up-a-poet-or-a-madman$!.$#_as$&bridge$&field0%$ully$/ham/complainant$#ing$"ma$$nin\'$!r$&sfield%#ome',
+    '$"th##in\'%+g-nightmare$$tipu##ley&(/ledbury#$unai#$woya#$ynge"\'l-hijra#"as#&berton$$rood%$zych##cha',
+    '$#ock%"te&$tana\'!i$#zak#"da%!u$$berg&$zirk%#ott%#urg$!e%"ck%$gard\'"te',
+    '%%nberg&$sian$)heim-kohl%#orn$"ia%"ng$)orf-style$#ram\'%/chef&"pp%$idge%*on/sotheby\')d-skinner\'!s$\'statten',
+    '##ega$,s&rehy;based%,\'/astrologer%!/&\'duchess%"by%"ka%#ton$$tsky#$fish$1ord/herefordshire#$gate#"ia%"ns$/gorskitransport',
+    '$"ss#+k&rehy;over$!\'$!-%&abouts%$down%$easy&!d%\'forward%$mill%&n-lock%#ons&$vers%%round%"to',
+    '$#/of%#run$)aboutabit%"it%%thons$!e%$d-in&\'_to_and&"st%/nshaw/md/jaguar%/r&rehy;on-water&#-ee\'(friendly\'*orientated\'#run',
+    '\'\'warburg(,ebb/hotelier(&ritten&&/actor\'#car)%shier($hess)\'ilterns\')economist\'&farmer\'#ici(+ndependents)(structor\'3member/conservative($otor',
+    '\')scrambler\'%tesco\'#vet&":i&%after&)education&%house&!i&$s-on\'*/aircrafts\'$teel\'%ville%!s&!t$!i',
+    '%!n&\'g-boots(1cycling-bus-using(#hat(Doff-into-the-desert-at-the-end-movie)&n-eggs($pace(%shoes)0tick-in-the-hand($time\',/backpacking(\'talking\'&_apart\'"ly\'$tons',
+    '$(man-like(%sized)$tyle($type((zzzsssss$%onsky$"s.%)/treasure%%_away%\'tations$"up$%wayed%$orth#+l&mdash;the%(oslash;e',
+    '*(covering2!s*\'lizards$!\'$!-%%alley%\'bashing&"ed&$lood&$oard*!s\'#und&&racket&&uilder,!s',
+    '\'&lendar&$hart&\'limbing(%nging&&ourses&"ut%#end&)xhibition%)fireplace\'#xed(#ing&%lower+!s&%orced&%resco',
+    '($ters&$ooks%&ladder&$ight%#map&%irror&$ount%$nest&$osed%(of-money%%panel*!s\'$pers&"eg&$hone',
+    ')#ner(#que("te\'"ug&&osters\'#wer%%racks\'"il&\'ecessed\'$gion\'%liefs&#oof%(scounces&#ize&$pace',
+    '&\'tanding%&tablet&$exts&(hickness&)o-ceiling($gate(-wall-carpeted\'"ps&\'renches%%units%%walks\'$sher+!s)#ing$#.66',
+    '%\'ceiling%&thames$$abee(%-shod(!s%\'ce(2.9)\'(-hadrill(&reader.!s)&uddock\'(/general(&horton(&ndlove($sane&"hs',
+    '%"la&!i%!m%!n&!d%#roo%)sey-based$$berg%%order%%ridge$&crouch$#end%*r/berkeley&#ant&#ing',
+    '\'%first$.fisch/goodwin/&%xings%"ul\'!s$\'hanging%$eath$,ich-clifford%%ngfen\'.ton/carshalton+&london*!s&!s%(s/alpine\',conservation',
+    '&%ellen\'!s&#ian\'!i$$kill$$onie%%onian%$pin\'$)paintings&$nels&+per-coating*$like*(stripper%&laster$3raf-richartz-museum',
+    '%$ight%$ocks$+s&lsqb;with&*mdash;shop%&-lined%!.&#the%./fences/hedges%#cot&%reens%)end-based)\'on-tyne%%hield%$pace%)tr&ouml;m',
+    '$$walk%#ood&#rth$\'y-wally%%baldi%%close%%world#$mart$%esley$-ington-on-sea#"ne$+ut-coloured\'&framed\'$like\'%trees',
+    '&"s.&&t-tree\'#ree#!o#!p$"en$%olean$*urgisnacht#%raven$)ond/judge$+und-skinner%\'s-ivory#!s$"al&,l-brownhilis',
+    '$"ch&%aerts$,egg-stuppach%%rhoff&#ian%"th$*h-dunseith%0/gloucestershire&&victim$(in-lihwa$"ke$#ton#%ter-i&#cio&"ed',
+    '(&models&"us$$hall&+mstow-based+!e%!e&"of&$r.3s\'!s%&omstow$&isperg$#ner$*on-le-dale&&/award\',conservative',
+    '\'$plum&#ian&)on-thames$$raud%"op$"z\'%#ers%"og#%ubita$!s#$vale#$wyns#!y"#mae#$bizi',
+    '#$mock#!p$#ers#$sley$$tead#$ytan",n&rehy;stead#%atabe##bon##cke#%d\'rin(!\'(!g$(-bearing%$like',
+    '$\'er-lust&(ing-eyed*$hero)"s.&%lands&!n&%stock&%ungen&$wege$%jnina$$like&"tz$"oo$$rin\'%"um',
+    '$!y#%g/ibm$#ara$#dat%!i$"ed%"ls$#ing$(kananond$$ling$!o$"ri$"st$!y#%igans',
+    '$!t%!a##jau$"ik%"ru#\'k-happy%%noise$$able$$core$#er.$#ish$#pit$\'y-wanky#$lace#%na-be',
+    '%%maker%!n$$eria$#ing$"oo%!p$&stedet$!u$!y#"rs#.sborough-jones$$fell$"um#.t&mdash;within$"\'-',
+    '%(creation%"me%%would$$.let%#you$!/%"do%(original$$:tax$)age-based&!h%"im$(ed&mdash,%;with&!\'',
+    '&)/expected&#_no%"th$$ing/(#not$"ok%$ning$(s_rather$"ta%!h#"ya"\'oranini"!p#\'akabulo#\'enplein',
+    '%#tak#"le##ner##pin&!\'\'!.#$tass#!u##yng"(qar-jack#!f##qas##uar"\'r&mdash)+;interstate',
+    '$(rehy;mad)%weary*&inning#!*#&-based%$ooty%%roken$(chargers&#ief%&ontrol%%razed&#ies\'"me(%inals\'%ppled',
+    '&%ncing%#ead&(vastated%(isrupted%#ogs%%ulled$*engendered\'$ines%"ra%(xhausted$$film$$game("rs$\'harbour%#ero',
+    '%$orns$"in&$deed(%mnity&!g%$ssue$%jolly$&levies%#oan&#rds$\'machine%(ongerers$&navies\'!y$(obsessed',
+    '$)pageantry&%rties&$trol%&icture%%lanes($ning\'!y%+rofiteering$)readiness&$cord&$lief%%idden&"sk%#oom$(seasoned',
+    '%#ong(!s%%pears&#ort%\'trategy%&urplus$%there%%rains%#ype$&u-like$&wagons&!r%\'hooping%#orn%&riters',
+    '$)elizabeth$$time#&/peace#!9##_in##agi$!u##bah%"nk$-ird-dominated$%leton\'"te&"ys$&orough$$rook',
+    '*!a#(cupporum#)d&ndash;s$&-baker%\'changes%$made\'"id%(of-court%$room$&.after%&doctor$,/anesthetist&)rchbishop%"ex%\'housing',
+    '%\'patient%&senior%$unit%,weightlifter$!a%"le%#nce%"rs$0e-aldam/chairman%\'n-aided(\'ssisted\'$pies\'*supervised&$/new&&clyffe',
+    '%(rishness&"ns&$ship&&yg-can$"ha$"ia%"ja$\'le/alan&!s$#ner$*our-street%"wn$"ro&*be-keepers)$room',
+    '&#oms$-s/departments%"by%#man#"eh%$orne&+use-breaker*$club*%sized))/fluxshop)$fuls)&keeper)$like)6s-turned-art-galleries*!.',
+    '(*ing/office$!l%!l$\'mquelle$%nford$!r$%s-but%#ley#!f$$are.#&gaming$%ovich#$hawk$%olian&!s',
+    '%"st%#use$#ust#$ings#&k-like$$/pig$!i$#ton#$laby$!d$#ess$.ock/consultant%%rdism$&ustful#(m-bodied',
+    '%\'climate(%nical&#old%$eyed%+heartedness&"ot%$side&\'ounding%)temperate&$oned%$ups.$%/cool%4empathetic/sensitive$+an/daughter$\'blooded',
+    '$\'ed-over%)r-feeling$%field$\'harbour%*eartedness$(ing-pans\'"ly$,ly-contested\')lit-scene\'\'offered&!.$(oth-made$!p$$seal$+th-coldness',
+    '&!.\'#you&$line&!s$$well#%n-off$%aeera%$pura$)e-holland%\'/friend%&d-does%#ken%)r-lambert&!/\'\'reprise',
+    '&"ia%#ton%!y$,ford-the-mad$!i%!n&*g-coloured)$ries(&system\'\'s.chris)#the&!k$)ock-style%&graphy$#ung',
+    '%$eddy%$form%\'monkeys%)psychosis%%scope&&haring&$pace%\'threads&#ime%\'walking&$orld$#age$#ed.$"le$$ship',
+    '$!u#$rack%%mungu%"nd&&t-bond(\'holders($less(\'officer\'(ies/duty%!o%&ppened%!u%!y$"em%(n-wilson',
+    '\'$head(\'omeless\'$west&$dale&"es&#ing)\'/rabbit%!s$#ick\'"er%"er%#ngs\'+ton-skelton,$mith*"30',
+    '\'&-lords(%monks($race)&etinue()sorcerers(8who-would-kidnap-a-bride\'$hood$!s#&s\'-see$\'aw-kiev\'$pact&$ians$#hal&&ttered&$wski',
+    '%+ip-building%"ow$\'ickness$&jawski$#ome$$zawa\'!y#(t-biters%\'charmer%$face%$hogs$!a$!h%!e%#ill',
+    '%#ogs$#ick%"es%+me-approved$$ling$%ofsky$"re%$idge#&umungu#!w$#ara$$hoop$#ich&%kists\'\'s-based',
+    ',//leicestershire%&kshire#&y-eyed")s&mdash;a*#how*.is&mdash;there*(marginal*#she$\'ndash;a*&forced*$only#"\'t#$-and$)carefully%&overed',
+    '$"in%!t$(mentally%#ust$"no&!t$#one$#the\'1-risk-exaggerated\'"re)0-a-mr-qualtrough*.something-else#*.delivered$$here$#she',
+    '#D_a_little_graze_on_top_of_the_skin_.%&ll_the$#due$$less$$none$#out%#ver$"so&"rt%#uch##abe$\'ctively$"ga$#lso$!n',
+    '#$chen$$onia#$elle$!y#\'founded#-h&rehy;severn$\'\'n\'wear%$ouse$!-%+\'n\'-make-up%0and-wear-ability%\'baskets%%cloth&\'ubicles%$days',
+    '%*hand-basin&#oos%"in&.t-and-leave-it%\'leather%&o-rama&"ff&)ut-colour%&stands%\'through$#ash$#bag\'!s%%oards&$iler',
+    '&#urn&"wl(!s%\'urndale$%cloth$\'ed-away\'$down\',out-creature%!e%!n%(r-driers)#yer&\'/jumper$$ford$#ier',
+    '($down(7his-hands-of-the-matter(%lines(#off(%poles*"st*%wders(%stand*$ones(#up\'*(-liquids\'\'/drying\'"ly\'(ton-area+%bound',
+    '%"ta$#kit$(leathers$$mill$#nay$%oping$%place$+stand-basin$%water&!y%#ell#&ington#3ley/gloucestershire#$mosy#"n\'',
+    '&!-\'#how$!a$&iowski#!o$"ff#\'p-green%(nematode\'#sts%&prison%%sized%$tail%%waist%!y$%grubs',
+    '%&shness$$like$$s.it%"13\'#pts$\'waisted$!y#!r##sat$%enaar%*rfallboden&&kirche&&schutz\'#tom$+hoi-wasshoi',
+    '$"le$"te#\'t-level$$dale$)e&rehy;it+%paper%!\'%--assimilating&+decomposing&&export&\'factory\'#ree\'#uel&,incineration&$lots',
+    '&%pipes&)reduction&)smuggling\'&orting\'%tream&$that&%watch%)/recycled&$soil%$bins%%d-the)%rough&!e%%land.%+paperbasket',
+    '%"s.&#ite%"th%%wagon$%field$$iaux$#oid\'!s#"un#$very#\'ylikowa"%tabid$#dar$"na%!i',
+    '##ch-&!a\'$larm+!s&&chains)#nge&#dog)!s&$face\'$ires&&keeper(!y&%maker+!s)#ing',
+    '&$post&+replacement&\'station(#yle&\'vessels&&worthy%!/%"am%$bell%$case)\'-makers)!s%$dog\'%&ed-for(#not',
+    '&&rdoin\'&\'s.truth%)fulnesses%%guard%"in\'(ghimself&!t%\'keepers%%man\'s&#ead\'3nders-cum-jewellers%%point%%strap*!s%#ton',
+    '#!e$.r&mdash;needed&*rehy;based+$free+)repellent-\'taining+$shed+%table-"xi%!\'%\'-action\'\'ffected&&babies)!y("gs',
+    '\'%earer("ds(%etles\'%odies(%osted("rn\'$reak*%thing)%eding($ooks\'\'ubbling("ll(!s&$call(&rriers',
+    '\'\'hannels(&estnut\'&losets)#ver,!s\'%oated(&lorist*$ured(&ncious)$duit)\'serving*%uming)\'tainers*#ent*#rol',
+    '\'(reatures(&ossing.!s\'&ulture(,m&rehy;jolly)&-jolly(#res)$rent\'\'ylinder&&depths()velopment\'&ipping(*scolouring))tribution\'&odgems',
+    '\'\'raining("op*!s*$wort&$edge\'(fficient\'#ggs&%fairy(#lls\'&illing)&terers\'&loored\'\'riendly(#ont\'"un',
+    '(!s\'%ifted($lded*#ing\'&lasses(#obe\'(oddesses\'&rasses(#een\'\'uzzling&(hardness($zard\'"en\'$oses\'%ungry',
+    '\',n-the-diesel(&jected,#ion&)knowledge&%laden\'#eaf\'&icking("fe(#nes(#ons\'&oading("ss&\'maidens(&ttress\'%eadow',
+    '(&scible\'$usic&&nymphs&$only\'%wners&$pale(#rty\'(ermeable\'#ick(#ece("gs("pe\'#lay\'#oet(\'lluting',
+    '(#ols(!t)!s\'\'ressure(%icing)*vatization\'$umps&$race(%fting(!t)"es\')epellency,#ing(&source(\'tention',
+    '\'#ich($ghts\'$oots(\'ughened(#wer\'%udder&(sampling\'\'crubber\'*ensitivity\'&hadows(&edding(&ifting\'#ide(#eve\'&ki-but',
+    ')$iing\'&meared\'$nake\'%odden(&ftener.!s($urce\'%pider(&lashed($orts(#ray+#ing)&inkler-#ing\'%tains',
+    '(%orage(&ressed*"wn(#yle&&tanker\'&esting\'#hin*#ned\'!o(%rture($wers\'&raffic(#ees($icks\'#ube',
+    '&%usage(#ers&&vendor\'#ole&&washed\'#eed\'#hen(%istle)"te\'#ise\'#ork*!s)"ld%!.&#and',
+    '\'!e&$jugs("st&\'soluble%(/ditches&#gas&#mud&)ore/dross&4vinegar/herbs/garlic%$:352&%flash%#_on%%babes\'\'llasted)%istic',
+    '&$oard("ts&$rash&%ucket\'!g\'"ry\'$ster\'"tt%%carts&$hute&%olors)$ured+1s:1750&ndash;1880\'#mbe&%reeks',
+    '\'&owfoot&"ut%$dark\'"te&\'etector&%ragon\'&ipping%,ed&rehy;down&"ri%"fa\'!l(,l-collection)!.)$/red)#ing',
+    '&#low&$owl.&\'rontage%&garden\'$tery\'!w&$lass%$head\'"ns&)ouse/bank+\'pitcher+&willis%$idge&#ng-)#can',
+    '+"rt)%holes)&places)$time%$jets%&keeper%$lain&&ilies.(-y&rehy;shaped)%-like&"og\'"o\'(,-bournemouth)&exeter)(gosforth',
+    '\'$vers\'!w(!.%&makers\'$n_et\'%rgins($king&(ill-like\'#tes%&pieces\'$llow&$lant&#ool&$rice%%rower',
+    '&&/trust\'$west&#afe&$cape)#ing\'$hoot&%eller+!s&!i\'#des*!.&&ki-ing("ed(!n)!s',
+    '&)on/estate&$pace\'$rite&\'tones/w%$tank)"er&.ight&mdash;the*$ness&&roughs%\'washing&$itch&!o\'&rkings(#lds(!t',
+    '#\'ford-st\'!2$!z#+h-on-dearne$!.$"el%"rs\'#ton#"in#2kins/archaeologist((employer(%oxfam(&reuter\'"es\'-on/eyewitness',
+    '#$lass$2ington/oxfordshire$$owes#$moor#)ney/grand#"ry#"sa$!h$.on&ndash;crick&\'-forbes\'$jone+!s\')macdonald)$rlow\')wentworth',
+    '&$/bus\')co-author\'\'england\'&former\'\'lothian\'(national\'%royal\'&victor&"ii&$linc#(t/public$/eau-composition\'!s%&nmaker&&scheid',
+    '$#ies$0le&rehy;and-daub&(-cheeked&!y%\'ing-you$+on-at-stone&\'/estate$-s-per-channel&\'russell%(/bulmers&+christopher&%fraud&*orcharding-!s&&victim',
+    '$#wil#%veare##yer#$zman"&uchula$$quez##gh\'%%/west%!t#!i#"lk$\'sortian#!n$\'arlwydd$$fawr',
+    '#%tcoic"#vaw#)e-and-wag%(battered&$reak%$caps\'$rved\'"st&&hevron\')roniclers&"ut%&driven%&effect&\'mbossed%%fever',
+    ')!s&$ront&\'unction-!s%*generating,#ors&$uide)#ing%&height%\'jumping%*mechanical%(particle&$ower&)reventing%\'sliding',
+    '&$wept%$tank&%heory&"om\'"ps%&washed\'&tchers$$.she$!4$&:three$%band.$$caps$#d-a%!.$!l',
+    '**-dependent+,synchronized+\'tunable&"ss%"ls$%maker$$nden&)on/milton%(ey-class%!y$%power$%rings%)ley-kings$$s/24%"ki',
+    '$#top#"in%#ess%"gs#(y-coated\'&loured"%wking#&sczcyk"%x-ass$%based$(chandler,!s&$oked%$oats$(finished',
+    '$*moustached$#oil$)patterned%\'olished$&tipped$%white%#ork#%/nile##ed.%"st$\'n-faced&&yellow$!r%!s$"s.',
+    '#%iness##ler#%moths#&oiling$$line$(yl/white#*y-cuticled%&yellow"\'y&mdash)$;the+"wo$)rehy;back#"**#$-and$%clive',
+    '$#get$#hey$$laid%%eaves$&marked$(of-being$&points##.he$$more##/oh#":s##_as$\'instead$#out$"so',
+    '#&e/arms#\'finding##ght#&layers&$ings$$eave#&master#"na$(e-hating&9that-might-have&rehy;been##out#&pethue#"s-%)including$*.leviticus',
+    '$%iders\'!s$!t%#age##ter$!o#&warden"&za-ari$$nsky$!r%"is#"ok##ste##ter##zer',
+    '$$ocks!,b/00/25/0009\'(6/0009-2\'&8/0001$)1/25/0006+"11,!2,!3,!4,!5,!6,!9+"25,!6+"32',
+    ',!6$)2/25/0005,!6,!7,!8$)4/25/0012$)5/25/0001,!2,!3,!4+"10$)7/25/0001"#271"#440"#505',
+    '#!s"\'c=10322#&p/1/67%\'22/1811""dc#!f#!m"!g"!k"!l#!f""mg"!n""ps"%rc-tv',
+    '!$c\'90"$-130"!."\'/shower""2p#$r0rn#!x""ed"!f""ia"!j"!q""rc""va!1d-1003-compatible',
+    '"-/00/26/0003-4+"57\'&8/0004$)4/25/0000,!6+"10,!1,!2,!3,!5,!8$)6/25/0003,!4,!8,!9',
+    ',!6$)8/25/0007,!8+"22,!4"%14c92#.a/6/14/hb/7/ms"%21c92""40"!6"!7""90$#c31"!c""ex',
+    '"#k-u%*-generated"&ldmnlt#$mnlt#%tmnlt"%r/emi""wk"$ydze!\'e&mdash"!\'#<ll-believe-it-when-we-see-it#!r$8e-at-the-end-of-the-road%!4##vew',
+    '##177#2are-poor-therefore#[come-from-place-bilong-far-on-big-bird-that-doesn\'t-go-flap%#uld#&e-e-ll$5xclusive-of-addressee#%going%!t#8have-heard-it-all-before#6inclusive-of-addressee#5know-the-best-for-you#"ll#$ness#(passages#.reap-as-we-sow',
+    '"!/#%above"#114"$_all"(a/blanco#$arrh#$dall##ire#+k&rehy;ness."es$!\'$$-and%\'chested%\'hearted%\'natured',
+    '&#tem)#med*#ing\'\'omached\')rong-weak&\'yllable%%tabby&"ie%&witted$!e%!d%$ned.%$r/dm%*st-looking\'!.',
+    '$/ling-adolescent%+y-developed\'&flying\'\'striped*\'uctured$%ness.(0/fever/diarrhoea(,es&mdash;but*!.*)/failings#-ld&rehy;based$)th-guards\'(holders.\'&losing\'*maximizing',
+    '-#hip\'\'related\'\'sharing&$ilie&$less##ner&(-rearing$\'ing-off(&trauma$#ted#,pon-carrying\'&making(%inded&&eering&*s-carriers',
+    '(&makers+#ing)(otivated(+procurement((wielding%"pn#$r\'st$$-ing%%layer%$tees&7he-au-pair-to-a-frazzle$&abouts$"de$"es&!t',
+    '$%house$$inbg&%esses&*g-down-his("of)"ut((prunella\'+/conference(\'holding\'"ly\'!s%(someness$#nes%#ing$*side-based',
+    '$(y-minded&(sounding&$worn%#all#(sel-pack\'%skins\'\'writing&\'ing-out&#led\'#ing\')y-looking%$nham%!o%!p%!s',
+    '$!y#*thampstead%+er-affected(%board-#ing-!s)&rowned(%chart)%loths)#ock*(nditions()dependent(#fax)&retted*#ont',
+    '($hard,$ened)#ead(#man(#out(%prone+\'tection(\'ravaged)\'eddened*%lated*\'sisting()satellite)%eamed*\'nsitive)$torm',
+    '(\'watcher/!s-#ing)$eary)#ise\'\'/travel\'\'ability(+ll-produced*!s\'#bee\'&caster($ocks+$wise)#tes\'$dome',
+    '\'%faxes(%ields(#ord*\'ecaster\'$hood\'+ing-limited\'$less(!y\')men/women\'#nly\'&person((roofness\')resistant\'$seal(#ide',
+    '($uits\')tightness\'"up\'*vane-fiend\'$ws30*!4)"40\'$zoom##ve\'%#-on%+r-cottagers\'%finch&\'/farmer\'(resident&$fish',
+    '$)ing-mills($shed##zel"%b-fed$&groups$$like$&making$&offset$\'threads#*b-pomerene%)something$\'/angler)#ing%(beverley%*competitor',
+    '&%river%*fundraiser%/gloucestershire%-international%-paediatrician%\'skipper&)tonemason$*er/freddie$#ian$)ley-stone#-erian/fordist&"sh%&n-like#!h##len',
+    '$(in/owner\'%rosie#"s.$$cott$$dell$#per$3ter-reynolds-stuart"%chsel#$lome"+d&ndash;thu#(-nes-day$(spinning%"un#\'dedness%#lli',
+    '$-ing&rehy;cake\'&-album(*cake-style)&lothes(&finger($gift)$uest(%party)\'resents()reception*%lated)\'ingless,!s($sari\'$.the',
+    '\'"es\'-s/engagements\'#ton*!s$\'lebeach$!w#%eking$*l/holstein$%meier#$ford#.ge&rehy;shaped%&-faced&$roll&%soled\'$tyle',
+    '%%block%&d-open\'&shaped%$foot%%knock%)wood-benn$$hogs#\'hampton#$lake%!m$$ocks#&nasday$$eday&#say%!s',
+    '\'1ay&mdash;saturday)!\')!-*%bound)"11)!2#"on##ren"%e\'uns##-ha%"ey%$ours$"it$\'wee-wee#%ckers',
+    '&(xcluding%)festooned%\'killing$*/chartered%\'disease$#all$"ex$#ies%"ly%!n&)g/culling$1killer/fertiliser$"le$&master$3on/northamptonshire',
+    '&#has%&sphere$#rop$"s.%)/shrubbed$)y-looking##eks$!l%!l#&gdaies$$mann#$juns#*k&ndash;10%(rehy;out$&-after',
+    '%&enders("s.%&killer%$plus$$.and&!s%"er%&plants$&/nigel$$_out$+day/weekend$!e%!n&*d-in-paris()workshops',
+    '(%roads\',/day/evening(#mid\'"ed\'#ish\'&s-only%"rs$$long%-y/fortnightly$&nights$"s.&!i%!/&#six%#_so',
+    '$!e$#lll#\'mington##ncy$"ed%!s$#ing$(y-winkle#(ping-kid#"rt$!y#$sker$#ner#!t$\'-a-weet',
+    '$\'aflakes$!h$-man/organiser#%villy##wak#!x"!f##sey"&gbreit#&geland&"ie$"is##ink##mus#"on',
+    '##beh#"ee$%liych\'"eh)%posts#&meiher#&r-wolf$%hafte$%kunde$,macht/waffen)*fahrkahrte"\'i-cheng$#fan#%alala#!b',
+    '$#ull#%chang%#sel#!d$&ersehn(!n$#ler$&oscope#$feng$#ung#!g$#all%!o$"el$\'h-house',
+    '&$loss%$alls%,bridge/plant%(ers-wilt%"in\'&g-room(!.%&lifter+!s)#ing%$orst%%scale%+t&times;100&!\'&!-',
+    '(#ias\'(carrying\'&driven\'\'for-age+&weight\'\'lifters+$ing-\'&making)(nagement\')producing*"ne\'\'reducer,$tion\'(shedding($tyle',
+    '\')to-length*%power((riggered\'(watching(\'eakened(#ise&&/birth\'(capacity(#ost\'&height\'&length\'#min\'#not\'\'obesity\'+performance',
+    '\'&weight&$belt&\'ed-down($ness&*ing-factor)!.&.less/worthless\'#ine&&s-rise&(watching$*man-lavier#"he%$rgut$!l##jun',
+    '$#and$$burg$!d$"er#)mar-style$(erskirch#,n-berg-salam$&achten$*berg-salam$%dling$"en%)rminister&%wurst$$gart("en',
+    '(#ner&"st%"er$$heim%$ouse$%inger$#kle$$raub%"eb#"pa##r-a%\'houston%$r-rd$$/wbo$%d-pop',
+    '+#ing%,er-than-thou\'!y%)ly-moving%#o/i%!s&$tone$%other$&siders#%sdale$&enborn%!s$%haupt%#eit$\'mannist',
+    '%$berg%%enhof\'\'kirchen\'%sberg&!s%(fluhjoch%%kopff$&thenes#(terstadt$!h%"io$$kamp$#mil$!z%#/ap',
+    '%#ner#%zkopf"\'jherowo"!k#!e$"nd$!s".l&rehy;lington##air$#ted#,by/protestor#-ch/auctioneer%!e&!r%"ii',
+    '&&e-back(.for-foreigners(5to-the-tribe-of-women\'*.exclusion\'+/bienvenido($menu\')_together\'"ly\'"st&%ingly%#pme#\'d-seams$$able$%ed-on$*ing-gloves',
+    '\'!.$%ments$(on-jones$$tite##eda$!y#3fare&rehy;dependent\'"**\'*-enhancing(*increasing(&minded($only)\'riented((relevant(*scrounging',
+    '((wafflers\'".4\'*/education(&labour\'&natics\'!s&#iat$$herd#&gemoed).administration$#ill#-ham/architect\'%local$$ouse#%itsch',
+    '#$l&gt%+mdash;being,$uilt-!t+*er&mdash;i+%quite%.ndash;designed+%known%/rehy;aggravated**brought-up*+camouflaged+*onstituted/&ructed+"ut*(deserved',
+    '+)ocumented+&rained*(filtered*\'groomed*&hidden+#ung**lubricated*(mannered+&eaning*$nigh*)organised*\'painted+(reserved.#sed+)ublicised',
+    '*(received,\'gulated,\'sourced*(serviced*%tried,%odden**ventilated,$rsed$\'\'&ndash$#(s)$%-&amp%$\'ard%!a&$-day\'$well',
+    '*(-average&(cclaimed(\'ustomed\'*knowledged\'#ted&\'ffected&\'gitated&$ired&(mplified\'$used&\'nalysed\'&imated\')ticipated&&pplied&%rched',
+    '%\'balance&"ed\'"nt&%lazed&$oozy\'%unded&\'reeched\'$ibed($cked(%tched\'$oken($wned&&undled%+camouflaged\')pitalised',
+    '(#ved\'"st&)elebrated&)hampioned(*racterised)#ted\'\'iselled\'(ronicled&,ircumscribed&%losed&\'oloured\')mpensated)$iled)%leted)$osed',
+    '(&served)(olidated(&tained)&rasted*$ived(&verted\')ordinated\'&rseted\'&stumed&*raftedness\'%owned&(urtained%(dampened\'&rkened&#eck',
+    '\'(termined&\'iffused\'%gging\'%luted\'\'stanced&$oing\'%wered&(ressings\'#ied%*elaborated&\'mployed&-nough-meaning&(videnced+!t&*xemplified',
+    '%)feathered)$ured\'%igned\'$nced\'(rtilised&\'lighted\'%oured&\'ocussed\'\'rtified\'$ught("nd&%ramed%)gallooned&%eared&%nawed',
+    '&&rassed%+handicapped\'#ted&%ealed\'@re-and-i-hope-you-are-well-there&"it&%opped\'#tel\'%using\'(w-clever%Eif-you-don\'t-like-it-that\'s-all-right&*lluminated&&ndexed(*octrinated\'\'grained',
+    '\'"to\'&vested%\'jointed%$kelp\'#mpt&&nitted%%laced\')teralised\'&unched)%dered&"et&%oaded\'%cated\'$dged\'!g',
+    '+&-after&)ubricated%#man\'%rried\'$shed&&eaners)%ingly\'!n&(onitored\'&thered\'%ulded\'"wn&&uffled%\'natured&%eeded',
+    '&$oted&$uked%\'obscene&\'ccupied&$ff-i&\'rdering\'&iented%&packed\'5st-their-sell-by-date\'(tronized\'$ying&#eed&%icked\'$nned&&lucked',
+    '\'&wdered&&reened($sses\'%imped&(ublished\'$nted\'$t-on%\'quiffed\'$oted%(realised(#red\'&called(&eived.\'(gimented\'\'novated',
+    '(&ressed)&oduced\'&solved(%tored&)itualized&&oasted&$uled\'$n-in($ning%)saturated\'#ved&&cented\'&reened(%ipted\'&ulpted',
+    '\'%cured\'\'gmented\'%lling\'\'parated\'$rves\'$t-up($tled\'"wn&%haded\'$ined&%ifted\'%ghted(\'nposted\'\'mulated\'#zed',
+    '&&meared\')ouldering&)ocialized\'%laced("ed\'%urced&(pecified\'$iced\'(okenness&&tacked($rred\'%irred\'$ones\'$rewn\'%uffed',
+    '\'$cked\'(pervised\'&rfaced\'$ssed%&taught&#hat&(olerated&$reed%)unionised&\'tilised%,vascularised&&isited&%oiced%$wall\'\'rdrobed',
+    '\'#xed\'\'ymarked&%eeded&#ild\'&nnowed\'$shes)$ings&"on\'*rn-looking&)rapped-up\'"it$\'.damped%"nt%#you$"_a',
+    '%&er_off&#ven%\'instead%$off\'&#nce%$sort%(well_off$)a-shampoo%\'ccepted%1nd/worcestershire%"rd%\'ttended$%brook%#urn$%close',
+    '&(ntrolled$\'defined&&tailed%*isciplined%)ocumented$%ed-up%$nbad%\'quipped%)r/swindon\')wiltshire&$isms&%shoff%#sey&&weiler&!z',
+    '%#ish%#ord$(governed%\'rounded$#ham\'#ser&$usen%$ouse$(ie-chuck\'\'wearers%+ng/families\'#don\'#ore\'(ton-tops,#ype',
+    '-!s,!s&!s%#ver$!l%!l$(man-lord\'%nered%"er$#ons%"rd$&placed$*recognised$)s-gardner%&/coach',
+    '&\'leather&&taylor\'$rust&&victim%#hot%$mead%#tar&#one\'"od&$ruck%$with%!y$&tended%&rained&"is',
+    '&"rn\'"th$&y-full&(throwing%"ed%#ing##man$"et#!p$"ac#!s$$bach$$chap$,er-m&ouml;st&!s',
+    '+(;pearson%*-argentine&\'english&&office&(sounding%)/governor&%irish%.123-1289.314.1%&ampton%#ies%!y$"on$"ws#"t.$)anschaung',
+    '%)uffassung$"en&$burg%"r.&\'weights$#hie$%liche$)sschmertz$%woche$#zie#!u#%weyas$\'itschii")m-ber-lee#"ba',
+    '%#rly%"zi$)ley-bound(&scorer%!y#(embering#(mershoek"%n-tze#$allt$%tchee#&celous%$slao$#hed#(d-tee-ee$"en',
+    '%"sh$%olien%&n/west$#ron$\'y-house%$less#"ed$$gade#!g$#raf#&haston$$ofer$"ui#"ig$#nge',
+    '$,ock/gotland/((niagaran##man#$nall$#ing#%sbury$,leydale-born#,t-a-courtin\'&&nother%%worth$$/are$%_over$&bridge$!e$!s',
+    '*#day*\'stanley$#zel%%ville##voe#$ying$%sdaye#!z$&eslaus$!u"3obley/herefordshire#*r&thorn;an#!w#$xham"!p',
+    '#%pings""ra#"bs$$urgs#!d#"e\'$\'-always%$pale$(.brought$&/would$"_a&!s%&by_and%"on&#ver',
+    '&#uch$)available$$done$$fkin$$geld&$mere$"n\'&!t%!a$!s%%worth$-wolf-whistled##fel$"fs#"gh',
+    '$#yng#!h$!h$%macht##ich$"th#!k$+st&auml;tte&$offe$+verzeichnis$#yng$-zeugmaschinen#(l&eacute$$eman#+melskirchen',
+    '$%erian&!s%"th$#ham$\'igerode$!y#!r$"ae$*ell/parent%!n$"in%$oure%%ttin\'#!s$!t',
+    '-!s%#man$\'ordnung""s.#"ak#&becker#%chler$"or%$tt/3#$eham$!n$"rn#\'farmers#!h#$lake',
+    '$!o#\'minster#%rside#!s$%alith$&elingh&!l&$mann&"ow&!y%/x125-1308.455.0$"he$!i%"er&!s',
+    '$%on.38)!s#-t&mdash;chose+*industrial%-ndash;granton$!\'$!*$!-%%about%$gate%%india%:north-west/east-south-east%)sou\'-west%\'to-east%&ulster',
+    '&$ells\'"st$!.$#/1h%%drink%\'leonard%&mother%*restaurant%%south%%wales&%essex$.121-1268.735.6+\'9.683.9$#_et$%about',
+    '(%heart%"ir$$bahn&!m%#ond%+rook-friend)\'/incare)!e&#rok%,urn/baberton),westerhailes\')y-taunton(\'/farmer$#can&!r',
+    '%$oast&"mb\'#mon&!t\'1t/buckinghamshire)(chemical&(untryman%$roft$)deutscher$%ecott%#lla%%molds%%ndorp&*h&ouml;fer\'%anger',
+    '%%rband\'$urgh)+y-on-severn\',y/consultant&.dale/potential&"ed&#hof&!i&$kerk&%leigh\'!o\'#und\')y-flowing(!s&$mann',
+    '&"n-(&barred)#lot(+centricness))ontrolled(\'dressed((european((financed($held((inspired((language)#ike)&ooking(,orchestrated((produced',
+    '))uper-mare\'!/()developed(;racist/capitalist/christian(%world\'$alia\'$esse\'#ism(#zer\'$ness&!s&(woldicum*!s$(falische%$erry',
+    '%$rove$)hampstead%#ead%#oek&!f&#lme&#rpe&$uney\'"se)!s%%uizen$"ie%\'nberger$)land/hill$\'macotts',
+    '&%scott%#ere&$stre%/inster-directed,$hall,%style+".h+!s\'#ter%#ont&"or%#uir$.northeastsouth$#oll%(n-howell',
+    '\'\'on-avon*5the-green/oxfordshire\'&s-mare(\'ub-edge))per-medau\',under-lizard-\'penyard&&/house\'*loadmaster\'$pool\'%satan%#urs%#ver%!w&!n',
+    '%.halian-d-basin$%reich&!x%#ick%#ock&&osbeke&"pp%%uther$%sider%$ound$%ville%$ries$*ward-bound)"ho)(pointing',
+    '%#ell%#ick&"nd%#ork\'"th",t&rehy;smear##\'er$%n\'dry&$wild#*-batteries%.ehind-the-ears%$iked\'#ing%&lanket+!y',
+    '$#day%$ocks&"wn%$ream&!y\'(-wet-dry$\'etching$&footed%$resh$&headed$&jowled$$land$\'mi-lips$#rag%%otten',
+    '%#hod%&ieving%&kinned%#oil%%uited$&vacuum$$warm%$hite%$ipes#%/drys$&liquid$)something#&atonmi$#way#$back',
+    '%+schappelijk$!r%!e%$ings#%foots#+herall(1.6))!.&\'by-york&#eds&#lam&!s\'$poon$$inks#)icization##jen',
+    '##rin$&upulis#&smears$$tone#(tability%"ch$#ed.%%rhorn&%stein$"ie%!n&!\'&"gs%"sh%%wetti',
+    '$$hite#$zell"$vela$$went"#wak#"re"&xcombe#!e#.ford/waterford\'#ian##ton"%yberg$;ourne-sheringham-bessingham$#urn#%combe',
+    '#&ergans%\'haeuser#$ford#$gand$#ood##her$#ill#.man-jones/herd-)lowerhope&!n$-outh-waterloo$!s#)ser-pratt""za##lar',
+    '\'(6/0003-3\'&9/0001-"-1$)4/26/0007$)5/25/0000+"16+"20,!5$)9/25/0000+"95*#100,!6,!9+"11,!2',
+    ',!5,!6,!8,!9+"21,!2,!5,!6,!7,!8,!9+"40,!1+"51,!4',
+    '+"60,!4,!8+"77#*16/28/0001$)8/25/0002#*20/25/0003,!4,!5,!6,!7+"15,!7,!8,!9',
+    ',!2-"-1,!3,!7$+4/05/0006-2&\'25/0016+"20,!1,!3+"30,!2$)8/63/0001""16"#502#"12',
+    '#"33#"45#"53$!5$!6#"60$!5#"70"!h""mt""ps"!u"!w!$g.13"*348/g-bbmv',
+    '")bh/boston"!h"!m"!o"!t""yt!)h-clauses%$efts#(question+&-words+!s#)structure#\'wh-what%"en%#ite',
+    '#*00/28/0001"!0"&a-a-at%!t%!y$$what#$a-at$%aaaaa)!a&!y$"ps$!r#$ck-o%$able%&ed-out',
+    '%$ings%"os%#son#!d$%\'ever%"ya$\'ayaknow\'$mean$$cock$/dareyawaitinfor\'"ya&&yaknow%"va%!y&%awant',
+    '%&erwant#!e#%kaatu%$tane(!s##le-&&eaters&\'hunters&&linked&$meat&&shaped%$back)!s%$food%$hide',
+    '%"s.&#ome\'"ng&$pine%(watching%\'y-bonce$+ing-station$#lan%"en&(y/rector$"ps$#sey$"tz#:m-bam&rehy;thank-you-ma\'am\'(ng-crash',
+    '$0bamthankyouma\'am$$mery%#ies&"ng%%y-bar#&nganga%"ed$"ng%#ies$#poa#!r$"am$!d$&f-side&$weed',
+    '&"rs%\'masters$$lton$#ped$-ram-le-street%!y$!t%\'onesque\'!s#$ss\'n$#ton#"t\'%,ll-we-do-now%"s-\'(\'is-name',
+    '\'/that-man\'s-name\'^your-name-then-and-where-do-you-come-from-you-bloody-foreigner,%toxin&).happened&"he&&isname$!-%!a&1re-you-doing-here%)d\'ye-call(/ou&rehy;call-it*)-call-\'em&.id-you-call-it&-o-you-call-it1$them',
+    '%\'goes-on&.rows-naturally%\'i\'m-not&$-say\'%think%%maner\',y-perhaps-be%*not-to-eat(!s%;on-earth-are-you-doing-here%)questions%\'so-ever%(the-hell()y-now-are&$o-do',
+    '&#hat%<you&rehy;see-is-what-you-get(4-see-is-what-you-get$&.could%%place$!a$\'chacall+"em+"it%#ott$,d\'youcallems-"it%!a%+erwannaknow$)ely/actor',
+    '%!r%!v&!e\')r\'sstreet(1-it-is-these-days)Inegative-description-you-can-come-up-with$&isname%$vver%#zit$*jumacallit$\'lington$$mann%$ough$$not.\'#ted',
+    '$$s-it%!a&&matter%%eeing%&isface&&tsname%$over%\'yername$"ta%"er%#hey%"on"!d"*e-whee-ooo#$adon',
+    '$"ls%!t$&t-beer\'%uying&%cakes\'(onsuming&$ears&(grinding&%lands&#red\'"ye&+sensitivity&&tomato%&crofts%+en-coloured',
+    '%#ish%$less\'"ys%$meal%\'sheaves#$bell$)le/racing#!d#$e-oo$$ched$\'dlingly&!y$"ee&$eeee*!e',
+    '.,eeeeeeeeeeee$#fed$-l&ndash;chair&-rehy;clamping%\'-arches(*rangements&$back($rrow,!s(#sed\'&uckler&%cages(\'rriages\'&haired\'&lamped',
+    '\'&utting&%drive+!n(#ops&%house&%locks&$made(#rks&$nuts&#pit\'\'latform\'$ower&$rims&*screeching\'#ets',
+    '+!d\'#pun&(throwing\'%urned\'#ype&&worked\'(restling(%ights%\'abrator&!n\'!s&(rch/side%$back)"ed\'#row',
+    '%$case&%hair\'*&-ramps+-to-wheelchair+$user/!s*"ed&&lamped%.er&rehy;dealer\'(/andrews(&farmer)%ormer((landlady((villager\'(s/irvine',
+    '%$gate%#in\'\')g-dealing(.s&rehy;in-line%#ler\'"ss%%marks%$s-on&%/high\'%urban&"et%#ton%"y-%!z$$reby',
+    '$!t$#uuu$$zier&$ngly%$ling#)lan/deane\'\'western$$dall$4ford/gloucestershire$#ked$"ms$!o%-n/countryside$$pton#\'n&mdash',
+    '$!\'$=-did-you-last-see-your-father%$e\'er%"he%!i%$that%1will-it-come-down%Lyou\'ve-had-a-number-one-the-only-way-is-down$$/how%"if%%where$"_a%"of$#eer$!t',
+    '%!s$$e\'da&+re-we-going&/s-my-baby-blues+(next-job%!+%--are-they-now&"by&/did-he-go-wrong&&rather&wthe-hell-you-think-you\'re-going-you\'re-shagging-some&rehy;other-woman-you-lousy-bastard\'\'o-begin)$find&$upon\'!r',
+    '&(with-all%%/what%!_%#abo(!u&$s-it&(t/camera%#for%%house%#lse%$s\'sh&$o\'er%#the\'"ro%%under',
+    '%\'withall$"in%#ver$"le$$ries%%y-men$#ton$$with#\'tenhall$#ham%#er\'\'\'-or-not("to\'2_or_whether_or_not%"ir',
+    '%*tone(math)$#ter%#ons#(w-yow-ee#\'y-based%(coloured%$face%$like$!s""ft"!g"*heeccchhhh%%ecchh##ich"#i%e',
+    '%!\'%!-&*emphasised&"is&%mosca&"no&#was&#yew%%.were%!=%$away%$ello%$ford%!g%"it',
+    '%!y#&dborne#%eldon#%ffies%"le\'!d%"of#/g&ndash;liberal$%-gish%\'liberal$!g%#ism$$hams%!t##ich',
+    '#$ldon$\'e-loops&&u-wait&$wend%%/ones%$fife%$more%(standing$"ie$%lance$"om$!s$"te#"m\'$%-wham',
+    '$#ple$*sicalities#"n\'$$berg\'$ries(!y$%croft$"er&"ay%!y$$fell%2ield&ndash;dickson$\'geingly)!s%#ies',
+    '%\'y-pingy$#in\'$&neying%%yfold&$ings$\'shields%$tone##och#.p&rehy;lashing$(-aerials&&nd-zip%#ban&&earing%%crack*"ed',
+    '%&handle\'!s%$lash%.ma-wop-ma-gate%$pans%&rounds%%thong%)whip-whip$)cord-hard(!s$$hand$%lash.$&makers$%pelii&"rs',
+    '\'!y&\'t-brown%$ing\'($.boy&"ty%\'oorwill$#saw\'"ed$#ton$\'wristed#%rleth&!y%#ies&+gigousticon&"ne',
+    '(!s%%mixed%\'pooling%&y-bird&$bird&#gig$$pool$&r-buzz%$ings%!s%!y$!s#)s-per-ing$&k-like%(/blender',
+    '%+as-guzzling%!e&(r-growth($like&(y-a-gogo)+nd-forecast%#ied\'"s.&$fied&!n%+y-and-sodas\'(blending(%ottle)#und\'(drinkers',
+    '\'\'induced\'&making\')producing\'&soaked&(/company&$fied&!s$!p%"as%"ed&"r\'%#ish$\'t-drive%&lation&.e-a-happy-tune',
+    '(&chains(%happy\'\'blowing\'%field&!y%\'on-born%!y#"t-%$lock$,aker-dowling(\'/webber%!m%$side$&bread.)&/rugby',
+    '\'!d&$ooke&!y%.urn-linlithgow()/bathgate%2y&ndash;darlington&&-based\')pickering\'3redcarmiddlesbrough$*cher/south&#ips%%liffe%#ott$$dale$-e&rehy;coated',
+    '+&haired+(knuckled%!\'%%(1.7)&$ish)%(-aligned\'"nd)\'-blacks*%glass*$holy*\'pearled*$reds*#tan\'#rse&$band',
+    '\'&erried\'%illed\'\'lackmen(%oused("ue\'$oned\'$rick&%caked(&rpeted\'#ell(%ntred\'&hested\'#old)(lar-jobs,)/business',
+    '*$ured)%umned\'$ream)$sted(%usted\'%uffed(\'rtained&*designated\'1isc-in-red-square\'%raped(%essed\'$warf&)enamelled\'(yebrowed)!s',
+    '\'%igure(&nished("sh\'\'lapping(%ecked($ight(\'owering\'%ramed($onts\'%urred&*galabeahed\'%lazed(%ossed)$wing&&hatted',
+    '\'*ighlighted(%llman\'%ooded(#use+&-speak\'%ulled&$iced&,knuckle-ride&%label(0ce-and-trimmings*!d)&quered\'&eather(&ttered\'&iberal',
+    '(#ght(#med("ne)#ing(%vered\'%ocked&%maned($rble)#ked("sk\'#ice\'&outhed&#oak\'\'n-black)%white',
+    '\'(veralled&\'pantied(#per(\'tinated\'\'etalled\'\'illared(\'nnacled\'%owder,"ed\'\'romoted&%rayed\'%idged(#med\'#ose\'"un',
+    '\'\'equined(%ttler\'$hirt("od\'(lobbered\'#ock\'$poke)&t-like\'\'tamened)!r((ockinged)#ned(&randed\'&wathed(\'eatered',
+    '\'&oothed\'$rash(%unked\'(urbanned&*variegated\'\'estured&$wall(%shing(&tching\'(hiskered\'#ood)#lly\'&rapped&,yellow-white%(.stephen',
+    '&,archaelogist&+black/white\',urgundy/navy&(chairman&)defendant&$esso\'&vesham&&former)&rester&\'garnett\'#rey&%horse&%lazer&*merseyside\'%other',
+    '\'(eighbour&&orange\'*xfordshire&(redlands(&sident&&silver&)turquoise&,violet/lilac&&yellow%$arse%%beach("ms("rd*!s&$lade',
+    '\'!y&)red/welsh%#cat&$live&%oated)!s\'$llar&%raigs\'*oss/street%%d-out\')sepulchre%%faced&$riar\'#ont*"ed',
+    '%.hall-dominated**propagated)#ese\',ven&ndash;st*#.24&,ead/heritage**transplant*&victim)"of&,orndiscovers)!s\'#ugh(0se&ndash;skagway*$-set*(/project',
+    '%$kind&&nuckle,!d%$law.&%eafed(!s\'$tter&$ocks%$mail\'(n/tenant%#ner&!s%$outs%(r-haired&$iver',
+    '&$ide.&&kinned&"ox&$tock%$ways&/ell-on-the-hill&%right%&y-blue\'&yellow&!s$%files%$ords$%haugh%$held$%iahua',
+    '%.ng/independent%\'sh-blue(%green($pink(&yellow$\'leather&%house&#tts%3ock/gloucestershire&\'w-grass$&manite%#ill%$ores$8ney-on-wye/herefordshire\'!s',
+    '$!s%$ands%#ton%"ul&&n-gift\'$dale$&tacker&*ker/thames)!s&%wares%\'enstall&!r\'"ed\'$idge%#ick',
+    '($hame(!s)$hall((tonesque\'#ton%&lebury\'%sford%-ock/wiltshire&!u$#urn$%wares%/ell-on-the-hill%$hams%#ich\'+k/organiser',
+    ')!s$!y%!.#&z-bang$$zery%\'popping"!n"\'o&mdash$\'ndash;e#!\'$!d$-s(18)eighteen%1-that-at-the-door#%-aids%"ri',
+    '($what%(oes-what%\'un-what$)gets-what%+ives-a-damn,\'flying-,$shit%7ot-what-in-which-treaty$#har$His-this-jerk-and-why-am-i-married-to-him$)knew-what&(ows-what.\'-enough,"en-"re',
+    '$%o-o-o$)runs-what$1said-what-to-whom$&unicef$#was%%e-are%0hat-why-and-when&#om\'%$ould#".a#$/hfa$#the$&unicef$$what(&/where',
+    '$#/my$!a$!l#"ch#!d#!e$%sness$*ver-it-was(\'you-are##ise#!l$2e&mdash;scarcities&+rehy;school%!-&%batch',
+    '\')urriculum&%falls\'#ood&%grain\'"ut&\'healing\'\'ospital&&mantle\'#eal\'#ilk\'\'olecule(#unt&\'natured\'$orth&\'of-life',
+    '&$team("xt\'$ones&%wheat%!.&\'however&&school%*meal-bread*\'sandals)+/wholegrain&#ilk&$ount%&person%%sale*))-financed',
+    ')#rs.+*/retailers&+ome-looking)"ly%%thing%*wheat/high&#ood%!y$#ly-\'&owning$$phin(!s#"me%!n$3p-whomp-whomp-whomp',
+    '%!f%#ing%!s$\'soever\'#&o-whoo$$argh$"ed$$fers%#ing%*le-pouffle$#ing$"mp&*h-whoomphs$%o-eee&&woo-ha',
+    '(#rgh%#oah&#eee$/p-screech-whoop&%whoop%$s-a-&&adaisy&\'y-daisy%!y&+-fuckin-doo\'&whoopy$!r$"se%"ha$!w',
+    '%!y#$pped&&rbears%#in\'&!t$!s#(re-house+!s%%/\'old%&master%"s.&"on(!s%!y$!f',
+    '$"ne$*tle-leaved\'\'berries#*se-ancient&7been-sleeping-with-whom&$main&Gtum-bum-or-thighs-would-you-rather-have%#ver$#iss%!t&!s$!n$!o#7thinkstorideanangeldown$$sits',
+    '#"ve#!w"$pple""se"$umpf#!n#"re#!t""y-$\'dun-its$#not#$.did#%bourn$#row##che',
+    '#$down$%unnit##for##nes#$sall$#ton#-te/fairclough%$leaf$#hat%$orne$"on!+i&verbar;w1"#\'me#!t""-1',
+    '"!a#"ng#"rt#!t$!h#"ux"%bbles%#ing&"tt%,y-wobbliness#!c##ier#&lingen##sey"%c-ing',
+    '$!r#!h$#ard$&elhaus&"ow%!r$!t%$erle#)k-dipping$(ed-edged\'*stepmother&#ary%%ndens&&s/jack%(r-basket',
+    '&!s\'#ley%(t-covers\'$high\'.keeper-batsman\'&takers&!.&.keeper-batsmen,!.,(/batsman&$s=16$%field$+ham(1917)34\'&-jones\'$/cox',
+    '(\'swindon$$iups$$land%!e%$iffe%#und$*ramasingha$$sell$#war#%omico#(zniewski"&d\'ning#$.way#$dall%$muse',
+    '$$ings\'#ton%!s$"le&#ing&!s\'$dale&)y-widdley%#ing%!y&\'-widdly&)widdlywee#-e&rehy;spread$(-arching&&stride',
+    '%)bandwidth\'#sed&%laded&%odies\'&ttomed&%rowed%\'chested%%eared&(mbracing&/yed-long-legged%%field**/planetary&$ocus\'"ot%\'grained',
+    '%$look%#man\'$rgin+"ed&#esh&$oney%%pored%%ratio%)scattered&&kirted&\'pectrum&(traddled)$pped%%track\'#ead',
+    '&\'owelled%%wheel$\'/narrow+"er$\'_papier$$acre%)wakefield$$barn$1combe-in-the-moor$,ly-acclaimed(&dmired)%opted(*nticipated(*ppreciated+$oved',
+    ')#ted\')dispersed\'(esteemed(\'xpected*&ressed\'&feared)"lt($lung\'\'leaping\'\'noticed\'&opened\'*prescribed()ublicized\'&quoted\'\'ranging',
+    '(\'eceived*\'ognized+\'mmended)%viled((idiculed\'&shared(&played)\'reading(&tudied(\'undered)\'pported\'&touted\'\'varying&!.$#man',
+    '$$ned\'\'!.$$palm$\'r-based%!/%$berg$\'selling%(preading%*t-possible%\'weeping$(x100&deg#$ford#%geons%"rs%(t-makers',
+    '&%maker&"ry#$jaya\'%satra##ley#%maier%)nstaetten$&erpool$$oser#"na%!\'%+ll/national$#ell\'!s%,s-castleford',
+    '&!.$!y#%ogast$#hem$!r$)w(er)hood%%-bird*!s\'$lack\'&urning&%queen%+ed/divorced%+s\'/widowers&)/widowers##row',
+    '#%th(s)%)-responds%%:8.5n#%ukind$"ri##yha$#ono"+ebel-palade%$nson#%corek$%zorek)%-zeul#(dersehen)!n#$gard',
+    '&#sma$\'hbridge$$mann#"hl#!k$!e#!l$$andt$%iczka$"ki&%ewicz+!.%\'opolski$$ligh#"ne',
+    '&$isch&$wald#%renga$(schutzin%#ema%"ma$\'zuchino#!s$)&auml;ker$&baden.$$mann$$rawa#(tersheim$#ing$#ske',
+    '"!f#(e&rehy\'i$!-%0and-child-beater)*motherhood&!t%(batterer&%eater%5doesn\'t-understand-me%3giver/wife-receiver%#has%&murder%)next-door%(swappers%)thrashing',
+    '$!/%(children&+ollaborator%(daughter%!i%#kid%&mother+*/housewife%.secretary/boss$#_no$)y-at-home#!f$#ard$"en&$iana',
+    '%!s##men##tly"*g-holstein$$less$#out$\'wearers$%zzzzz#(an-leeds&"st%"50\'#pts#$bert\'!o$"od',
+    '#%falls#\'g/world$#ens\'#haw%"tt$#ham$)ins(1985)\'+/enthusiast&3ton/gloucestershire$)le-waggle%#ies$&onholt#&htlink%,man/diabetic#"in',
+    '%!r%"ss$#ike#%maker$"en#%nalls#$stan%"ow#(tonshire#$well"#hih#$thun$"in"%ikeri#$liam',
+    '"&jaszko$&yapala&(wickrame#$chen#\'esinghe$%tunga$\'ysinghe#"he%#_et#!i#%kmark"\'k-ik-ik$/wik-wik-wik-wik#$lund#!s',
+    '#4amowitz-moellendorff$#now$#yas&"ts#$bear%!r&$foss%!y$%urton&!y\'!s#&cannia$"ke&!n$$ocke',
+    '(!y%&x-wood&./environmental#&d-bird%&flower+)-pressing\'$ying&&owling%\'growing%#ice&"sh%&living%#men%#oat%$rose',
+    '$%.type$(/medical$"ay$$bird%)oar-smith(&clough&"re%$rook%$unch$%cards&$tter(#ing%$hild$2eblood/pitt-rivers%%nberg',
+    '&$land&!n\')/daughter&&spoool&&thorpe$!f%$ires%*lower-rich*"s.&$ysch$%goose$$haus%#ern$%inson%0sh/breastfeeding',
+    '%)ife-based()/domestic)&nature("rs(!y&"ng%.y-accelerating\'\'blowing\'%eager(*xaggerated\'-inappropriate$#mon%!r$\'nerness$&plants',
+    '$(s-geneva%%creen%"en%%ounds%$tyle$%track\'!x%#ype$%woods#"ed$#mon$!n%#ski\'!y$!r',
+    '#&fholme$"on$"ra%!d%#una##gas#"ha$*ehnstrasse%4lm-sebastian-schmerl\'!a\'%inian\'#sen()h&ouml;he(&trasse%$mine',
+    '$$jelm##iam&&sburgh$"er$(kins-the("es#&kaloid$$eses&$iana$#ies%)n-zeitner&)/designer&!g\'\'/reuter&(s/morris',
+    '\'#ion\'(on-geary*&holmes)%/anti*(disabled*\'evesham*)reporting)$from$&o/list%!f%#ism%&vislak$%strom#,l&mdash;will%\'ndash;e',
+    '&&rushed%$gill%+he-won\'t-he%"it%%maker%*o-the-wisp/!s&#nly&&perate%$pack%\'reading&%otted%)to-change(%exist($know',
+    '(\'meaning((survival%$yums$#.do%$help%$make$\'/should$(_as_soon$(aert-for%#ims%\'llocate%!m%"tt\'!s$"be',
+    '%$rook$*cocks/king&(x/former$!d%&ermiss$%ebeek&%rands\'#ord%#had%#lmo%#man&#eit&#ina&"se\'%poort',
+    '%%nberg&#gen%4rsey/gloucestershire%0sden&ndash;based)(/wembley%"th&,t-whittacker\'+/consultant\'+s/aylesbury%%y/bet$$hire$,iam-and-mary\'#ine\'&s-judd)$wynn',
+    ')#bar*\'otanist*%rewer)/conservationist)#emi)&forest)&grower*$uild)*headmaster*0offman/spielberg)%kelly)&midway*%other))neighbour)(organist',
+    '))playhouse)#r-r).sub-postmaster+#san)\'teacher,!m*&raffic)%vicar+#deo((economic("ii(!l((on(1968)*%/aged+%carer',
+    '++strathclyde+&thames(\'trained\'&thorpe&"ns(\'/family%)biro-sako%%e-ism\'!o\'%paugh&/s-williams/fort%$ford%#gis%!n&"g\'',
+    '\'"er\'$hall)"ms\'*ly&rehy;or\'+ness-to-pay\'"on\'(ton-born+\'rideout%\'s-ee-ee&!.&,/headteacher&"ii%"tt%#ume%#waw',
+    '$%komen$$liam%&oughby$$ment&!s%$ott\'(%ianum$+ner/various%!y$#oby%"ch%!n%&ughby\'*%/mare%&w&rehy',
+    '\'&branch\'\'fringed\'%herbs\'$like\'\'planted)"um\'%tree.+!s\'%woods&!.&\'/chiffs&$beck&$dale&$gate&%holme',
+    '&$mead&%s/bmw\'&prouts&$tree$(probably$\'s/coach%#den%#haw%$more%&worthy$"y\'%(-willies\'&oofers%!a%%nilly',
+    '%$wire##mar$&erding&%sdorf+)erstrasse$%hurst$#ink$#ont%#res%)t-breedon)#own\'\'sitwell&)/survivor&#old##na\'',
+    '##pak##red#!s$#den$$ford$#low$#nak$!o%/n&mdash;johnson\',rehy;roberts&%-cook\'$gray\',heath-wilson\'%james\'4macdonald/consultant',
+    '(\'itchell\'\'roberts\'%salem($tyle\'$type\'$webb&&/actor\'#ben\')callaghan)\'mbridge($hief\'%earth\'(hospital))useholder\'&labour',
+    '\'(resident\'"st\'$west&!i\'$anae\'\'ndustry&%vilee$#tan&!r%&ermann%%shire#(tchinsky$%ering$%ingly$(on-jones',
+    '$/shire/architect*(campaign"&mber.2$#ish$%ldeon%*edon-based*%style$\'oldsley##las#,min-friendly&\'uscript%!s#$pdom$$enny%!r',
+    '$Ly-never-let-anyone-know-that-you-goto-church&(precinct%!s#&shurst"*n&rehy;win#%\'fred##(c)#--at-all-costs$#dev%"ow$&hungry$$loss$$over$\'win-win#!.',
+    '#$/win##32c#"ai$$nder($mere#%bergh$#lad$%stone$)urgh.they#&carnis$(e-making%"d.$+hcombe/team%%eater&#lls',
+    '&*ster-based%$mill$&kelman*)n-lessing%"le$#ott#-d&rehy;screen$--against-tide%(balanced\'"nd&%eaten\'#lls&$last\'"ow&#orn',
+    '&\'uffeted%(cheating&(ontorted*$ured&\'urrents%+distributed%&eroded%&factor\'"ll\'"rm&%illed&(luttered&&ondled&#ull\'(nnelling',
+    ',#ors&$roup%+in-the-hair%&lashed&%ooped%\'machine&$usic%"on&\'perated&"ut%$path&\'olished&$roof*"ed\'$uned',
+    '&\'ecorder\'&ddened&%ipped&&uffled%%scour*"ed\'&ulpted+$ured&(hattered\'\'eltered\'$ield+!s("ft\'%riven&$ighs',
+    '&#ock\'$unds&%pirit&&tirred\'%ripes&#uck)#ers\'#rfs&&wirled%%tears&\'hrashed&&ouched&(rembling&,unnel-proven,&tested',
+    '%+up.national\'!s%$vane%&walker\'$rped\'#ter&(innowing&%orked$!.%"he$!a%!e%"hl%$nsea%!u',
+    '%%itten%#low(&n-hair%$orne$)cheatered\'$etah&$imes$&edness%"ls%&resque&"in&*mere-based&$sham%!s&!k',
+    '$\'farming%%ellow%$ield&"ll%#low%#rey$&gallen&$ther$#ial%"er&*s&amp;supf%,ng&rehy;down\'\'-engine(#hut("in',
+    '$&lassed%"es\'%sness%#ift&"te$,mill-tilting("s.$(o/singer%#ver(+-the-graves%\'w&mdash\'*rehy;frame,\'mounted&!\'&!-',
+    '\'%blind(\'ursting\'\'catches((ompliant\'\'display($ress,#ers\'\'fronted\'#gap)$zing($lass*#zed+#ing(&rammar)%illes',
+    '\'1icon-mouse-pop-up\'&ledges(#ock\')mountable,#ing\'\'oblongs(+n-the-world\'$rail(%evels\'\'shaking)"op($ized($lots(\'mashing($pace',
+    '(%quare(\'tickers($uits\'"to)\'-window(#ype&).dressing&*/valentine&%bills&"es&%frame+!s\'"ul&%light&%s\'dde',
+    '(%alike()compliant(&ms-dos("on*&-alpha+#dos+\'solaris)(ptimized($type\'".i(*networking(#tin\'(/drivers$%pipes%(roofness',
+    '&"mp$#red%#ift$\'s-creen%$acks%!c&#ape&,reen-washers,$iper*!.%$haft&#ear\'"im&$ifts\'"ne',
+    '(%style\'(/actress\'?edge/nailsworth/gloucestershire%%peeds%$reen%#tar&$orms%&ucking&%fring&&rfers.$!t$$vale&"ne$,walker/gayla&*rd-leeward',
+    '$%x2/50$%y-pop%$edge%%ridge#.e&rehy;growers$!\'$!-%&bottle+!s&%reath\'%okers&#uff%\'cellars&(onscious&$ured',
+    '\'&inkers%)exporting%&filled&&lushed%(glassful&"od%\'harvest%#jar(!s%&labels&(icensing&%overs(#ing%)merchants%&numbed',
+    '&*live-wheat%%pouch&(roducers%$rack&(esistant%(shipping\'"op&\'melling&#ort&&tained*!s&\'willing%%table%#vat%$wise',
+    '%%fruit%\'gelatin%%tapas$#_at$#bar%&erries$&grower(#ing%,uardminister$!k$$lake$\'r/diner$\'sellers%%tuffs$\'tasting',
+    '#2farthing-fersfield$\'ile.ini$#ord#*g&eacute;d$!\'$%-base)!s&&earing&$ones&%raced&"ud(!s%\'collars\'(mmanders\'%verts',
+    '&#ing%$fans&\'eathers&\'lapping)!s&#old)"ed\'&rwards%$hair&%eeled%"it%(knuckles%$less\'#vel*#ler',
+    '%(movement-!s%#nut(!s(#ted%\'parties&)olarizing\'$wers%%roots&\'udiment-!s%&scales\'$rews&$pans\'$read',
+    '\'\'retched,#ing%&tagged\'!t&+hreequarter&*o-fuselage&&remble%$walk)"ed*"rs)#ing&\'hirring$).coupling%+development%\'margins',
+    '%$when$!/$(_as_long$#ard$&backed&!r%$ones&#rne$$ding%#rop$\'ed-back%\'r/disco\'$jane\',outside-half&!t',
+    '$+field-digby*#led$#let\'#ted$&master$#nut$4rave/buckinghamshire%+oot-mounted&,ve/education%#son$(s-eleven&%level&$open%!/%%hield',
+    '$$tip.$$work#&ifride\'"ed$$satt##kel&#erf(#ven$#ies$!l%%e-bag\'&eating\'(pickered&\'berries\'#ury',
+    '\')/governor$&owskis$\'y-winky##law$"ok#1mill/conservative(&former#(n-darley$"al$#eba%)r-drought\'&making&$.the&%/film\'\'tackler',
+    '%"th%%y/new$%ifred%"n\'&+gton-ingram$$ners%&nerrrr$#ock%"ws$%sboro#%ocour$"es$#kur$"to$%ws/nt',
+    '#$pmt=##ram$"ow#&screen$$dale$$hill$#ick$$kill$"lc%"ey$&ockets%!m%1n/gloucestershire&!e$#ten',
+    '%&onlead\'!s$"um$!x##tec%\'r\'s-end&%-bare(&linded($ound(%right\'\'drilled)!y\'%early\'\'fashion\'\'gripped',
+    '\'%hardy(%ungry\'#inn\'$lean("it\'&pallid(&lumage.!d\'%roost\'$sown(%tored)&ripped\')to-spring\'(visiting\'&warmer',
+    ')$ight($oods\'&yarded&$.the&\'/bosnia\'\'chateau\'%early\'&summer&$born*!e(%thams\'$reak&#ers&%field&&halder',
+    '&&ingham\'#zed&&larken\'#ong\'!y&#man&&school\'"et\'$hove&\'taylors\'#ide\'#ons&$wear\'#ood$#her',
+    '$(oncester%"un&)r-pudding\'!s$#ree$\'zenheim#\'visible#\'windows$,ood/musician#)y-patches#\'zerhaus"#oth"\'pe-away%$outs&#ver',
+    '$%/wash$\'d-clean&"up$(r-blades%&s-this#$line\'!s#!p$%erman$!y#"tc""ra$#wan#\'chynges#"ds',
+    '*&rimmed$)-armoured%%brush%\'cutting%\'drawers)#ing%\'fragile\'"ee%\'guarded\'$ided%$less&#ine%&meshed%#net%\'pullers',
+    '%*reinforced&#ope%\'secured\'%rvice&$poke*!d&\'tripper-!s%#tie(!s\'#ght%\'wheeled&#orm\'#und$+/components',
+    '$&d-made%%rawer$0frame-orientated$-less-directed)(mechanic)&owning$\'pulling$\'tapping$$ways%#ool&"rm##ier%"st#!k$#and',
+    '$*lichkeiten$#yng\'!e#!l$#ing#$mola#(nsberger#"ra%"l-\'#6.3\'$wide&$ians#"s3$#els$!t',
+    '%#ses$/schaftsalphabet+&gebiet+&partei,+ruferkammer+#rat+*vergleiche$%while"*s&lstrok;a#$-out#"al$%nbell$"ra#%beach#&casset',
+    '$"us#!d$)om-giving\'%tooth&!.%!n#&e-bade%,child-selves&%racks%$head%\'looking%#owl%#sky$\'/victim$$acre',
+    '$(crackers$$guys$$hart%$eads$)ly-silent&!.\'#and$+man/village%#ens$$nden%&heimer%!t&#hal$#ton#"h-',
+    '%\'impulse%-you-were-here$#ard$$bear$!e%#art%"d.%!e%$s-\'i\'#has&!t$$ford%+ul-thinking\'$ness$1ing&mdash;perhaps',
+    '($well(.your-life-away$$list$$moor$#ram$"wa#$ible$#wig%"yg##kes#$lang$"on#"ma$"ut##ner',
+    '*!e#%ogast$"no#"p\'$"as$$iest%"ly%$ness$$like$(y-haired#\'selingh%(nchaften&#den&(schaften,8ler-integrationsprogramm',
+    ')&ftsrat$!h$&ington##ter&\'ia-clad$#ino$!y#(znienski")t-wit-wit#$asse#$booi#\'ch&rehy*&;cults%)-burnings&%craze',
+    '&)delusions\'*octor-like,"ed&*evil-woman&$hair("re\'$erbs&/in-the-cupboard&$king&$lore&%marks\'\'urderer&(satanist\'#ign&%women',
+    '*!s(#zed%\'doctors%"ed&(ll/pupil&"nd%\'finders%#in\'%$lord%$raft%!y#!e$$hall$!k$$lson',
+    '*$;and+"or%)rehy;draw.#ing.!n,"ew$#\'em$$(in)$&-a-run&-ll-your-heart&*nd-without&(thelstan%\'beastly%&doubts&&rawing',
+    '&$iant%$held\'!r&&olding%#out%(reserves%&shells%;the-one-saxophone-tacked-on%(wage-led$$.her%"it%\'stuffed$$/for%#has%$know',
+    '%+utilization%\'without$":a$+_a_,_with_a%,er_regard_to%&in_the%0reference_erm_to%1with_reference_to,\'gard_to$!a%"ht%!n$$call%#ote%*ryptogenic',
+    '%#ean&\'fective%%raawl\'+w&mdash;see(#al-*$.the*#s.1(!l(!m("n.*%chris&%ew-to$#ell%&nfield&!s',
+    '&#den&*ed-looking($ness&(s/estate\'$ford&!t%!t$!g%"in$!h%,eld&mdash;if/(landlord(!.$!i%"el',
+    '\'\'country\'\'edifice\'%level(%itter\'&period($late\'&sample("ex($hops\'$turn($wins&"_a&)gton-also+&barton*./herefordshire',
+    '&$shaw&!t$$nail%#ell$!o%#lds%#put%$ther%%ut\'em\')knowledge\'!s(*ignificant$!s%,tandconstant)"er',
+    ')?s-bloody-cold-arctic-conditions$$very$#yam%%poole#\'itterly#(latschil$$ings$#oof##men%!r#.ness&mdash;you\'&-lists\'$ing.*!s$!y',
+    '$!n#$rood$"ug##sen%!y$$hire$*watersrand#"ta$"el&&sbachs%$rin\'&$sham$)genstein\'$$hoft$#ing',
+    '&!d\'"er&!s\'$bach%#ich$"ol%/n-le-wear-based&%/head&\'le-wear&!s$-rick-williams$!s#$woud#!z$&enberg',
+    '&&hausen$"in"#uth""ve$"ll&&/mayor%#rod##ina"#zac$%nskys$#rd.&"ly#%ed-up$!n##zed',
+    '$$ywig!)j&amp;csr"#121#"46$!9"#215#"44#"88"#866"!h"!i";kmvlhmlkjolksqmxrtkjdmpgnpp!"k1""lb""nd',
+    '!$l/fc"#181"#790""ad$,awsky-berger$"fa$%islas(!w##ker#!p#,wdsky-berger""dc"&enking""hp"$iich',
+    '##son"(odimierz"!s"!t"!w!#m-z"#536"#969"!a""cq"$ffra""go"!t!"n4#"67',
+    '"#890"!a##ted""bc""eh"#ion"#ted!+o&uacute;ld"!-#&de-shu#5where\'d-my-stomach-go"\'/squads"!1#!3"\'ad-dyed',
+    '$(-er-ling$!a$+e-ohlenburg$!l%&e-pump&\'bottoms%%ingly(!s%&y-eyed#!t#0urn/bedfordshire"!c#!e$&nsaete#"he',
+    '%&nblatt#!k$#eck$#ing$#low"!d##ajo$!n#%ecock$#med#$gate$!y##row#"wo%!s',
+    '&$tide$$dark%#rag$%is-me$&to-man#!d#\'fulness#$ikof#!k#"ld#$wiyu"#fsy#"ul"&g-free##ara',
+    '$"in&#ton$"le&(-wearing$!y#"in##lom#\'mobiles"#hhh#"in#&lfahrt)(sverband&"rt$%gemut$.mutsch&uuml;ll',
+    '$/th&auml;tigkeit##nen#$rder"!i#"ld#(zikowsky"\'jiciech#"ju#"na%&rowska##tas$#ech%!k#$upto"%kalup',
+    '##ham#)ing-based&-ham/berkshire#$king##ler"%lages##ber#1d/gloucestershire$#eab%%ndorp$&ingham%"ya$&opolis#"en#*f-children',
+    '\'!n&%ieter%%flesh&"ur%#god%\'haunted&%ounds\'"wl%(language%%month%$pack%$rats\'#yet*%-like&(epellent',
+    '&#rap%%woman$!.$,/thunderbolt$&amcote$%berry$(creatury$$dogs$&e-mowe%*/m&ouml;we%(nstein-2,"3d%#ren&!s$#fia',
+    '$(gang-san("us$\'hamcote&$ngar&"rt$#ies$%light&"ke$$meat$%notes$%ovitz$$pack$#rat$\'s-heads%$dale',
+    '%(on-rilke%&piders%$tone$(whistles#$gast%"te#,husen-luzern\'!r#%insky#"ka$\'enstein(%urmer$!o%$witz#$land',
+    '$!e%%nberg%+y/neighbour$"ow#$muth#0no&sacute&cacute##osi%#zyn$$zhin##per$"in#$rath#\'stanton%&enhome%(henholme',
+    '\'&ecraft$$ztyn#+ters-kluwer$)on/oxford&!s%"sz$!z#!v$\'ercloth&(hampton.&$ston&,ton-designed$#ine""ma$\'n&mdash',
+    '%!\'&*s-magazine%\'-acting\'-s&rehy;mother(+-art-object)#eve)%witch\'&t-play&+centredness\'&hasing&&farmer\'&ocused&\'goddess&&hater.)#red',
+    '&%in-me&"me&1of-advanced-ideas))the-glove&(positive)!t\'&ulling&&shaped\'&tarved(&ealing&*unfriendly&(watching\'2ho-had-never-had-a%%.this%\'/artist',
+    '&&herbal&&notice&%peace\'#ure&$silk\'%udden%!1%&_other%$ised\'"ts%(lecturer\'&ssness%\'servant&#ize%%words',
+    '#"b\'$(-bearing%$cave&*onnections%$door%\'echoing&#nvy%$glow%%light%#man%$room%(smelling&\'ufferer%$warm\'#ter',
+    '$)/untimely$&adelia$"ed$\'lemania 8zzzzzzzzzzzzzzzzzzzzzzzz',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_50 = (
+count_50 = 6694
+
+heads_50 = (
     'urban-dwelling',
-    'urban-funding',
-    'urban-led',
-    'urban-minded',
-    'urban-non',
-    'urban-property',
-    'urban-reared',
-    'urban-renewal',
-    'urban-road',
-    'urban-sounding',
-    'urban/',
-    'urban/56',
-    'urban:rural',
-    'urbana-champaign',
-    'urbani',
-    'urbanicity',
     'urbanist',
-    'urbanities',
-    'urbanly',
-    'urbanscape',
-    'urbany',
-    'urbarium',
-    'urbica',
-    'urbis',
-    'urchenko',
-    'urchin-cut',
-    'urchinhood',
-    'urdal',
-    'urdinola',
-    'urdorf',
-    'urdos',
-    'ureaformaldehyde',
     'urealyticum',
-    'ureau',
-    'ureflex',
-    'uregei',
-    'uremic',
-    'uren',
-    'urena',
-    'ures',
-    'uret',
-    'urethane-anaesthetised',
-    'urethane-polymeric',
-    'urethras',
-    'urethroscopy',
-    'urethrovesical',
-    'urfa',
-    'urfaiys',
     'urfan',
-    'urft',
-    'urganda',
-    'urged.',
-    'urgency-in',
-    'urgency-whether',
-    'urgent\'',
-    'urgent-rate',
-    'urgentest',
-    'urgently-awaited',
-    'urgently-critical',
-    'urghygurghy',
-    'urgle-urgle',
-    'urgok',
-    'urguhart/sun',
-    'urho',
     'urhobo',
-    'uriburu',
-    'urica',
-    'urich',
-    'uricho',
-    'uridians',
-    'uriels',
-    'urification',
-    'urigen',
-    'urigill',
-    'urimecomes',
-    'urinal\'s-eye-view',
-    'urinary-tract',
-    'urinations',
-    'urinators',
-    'urine-encrusted',
     'urine-soaked',
-    'urine-spraying',
-    'urine-stained',
-    'urine-testing',
-    'uriny',
-    'uris',
-    'urisk',
-    'urizar',
-    'urla',
-    'urlogengasse',
-    'urlus',
-    'urma',
-    'urmia',
-    'urmond',
-    'urn-peltae',
-    'urn-shaped',
     'urnerboclen',
-    'urnerboden',
-    'urnings',
-    'urny',
-    'uro\'gen',
-    'uroandrology',
-    'urobilinogen',
-    'uroboros',
-    'urochloa',
-    'urochs',
-    'urogallus',
-    'urogenic',
-    'urokinase-type',
-    'urokinase-type-pa',
-    'urolagnia',
-    'urologist.',
     'uromyces',
-    'urons',
-    'uropathogenic',
-    'uropathy',
-    'urophthalmus',
-    'uroporphyrins',
-    'uropthalma',
-    'uropthalmus',
-    'urothelial',
-    'urozgan',
-    'urozwi',
-    'urpose',
-    'urquart',
-    'urquhan',
-    'urquhart-',
-    'urquhart.',
     'urquijo',
-    'urrea',
-    'urrently',
-    'urrs',
-    'urrutikoetzea',
-    'ursday',
-    'ursel',
-    'urseren',
-    'urshoring',
-    'ursi',
-    'ursine',
-    'ursinia',
-    'ursinity',
-    'urskoy',
-    'urslingen',
-    'ursodeoxycholyl-&bgr;-aminobenzoic',
     'ursodesoxycholic',
-    'ursolic',
-    'ursprache',
-    'ursuleac',
-    'urtext',
-    'urtheill',
-    'urti',
-    'urticaceae',
-    'urticating',
-    'urtubia',
-    'uru',
-    'uruc',
-    'urud',
-    'uruguaiana',
-    'uruguayan-born',
-    'urugyuay',
     'uruk-hai',
-    'urushi',
-    'uruzgan',
-    'us&dollar/dfl',
-    'us&dollar;.00=dr&dollar;7.30',
-    'us&dollar;0.02-0.03',
-    'us&dollar;0.05',
-    'us&dollar;0.08',
-    'us&dollar;0.35&ndash;0.50',
-    'us&dollar;0.5',
-    'us&dollar;0.68&ndash;3.60',
-    'us&dollar;1,007',
-    'us&dollar;1,037',
-    'us&dollar;1,050',
-    'us&dollar;1,054',
-    'us&dollar;1,067',
     'us&dollar;1,075,600',
-    'us&dollar;1,115',
-    'us&dollar;1,125',
-    'us&dollar;1,136',
-    'us&dollar;1,137',
-    'us&dollar;1,138',
-    'us&dollar;1,144',
-    'us&dollar;1,155',
-    'us&dollar;1,160',
-    'us&dollar;1,170',
-    'us&dollar;1,172',
-    'us&dollar;1,180',
-    'us&dollar;1,199,400',
-    'us&dollar;1,216',
-    'us&dollar;1,220',
-    'us&dollar;1,231',
     'us&dollar;1,235,000',
-    'us&dollar;1,240',
-    'us&dollar;1,269',
-    'us&dollar;1,270,000',
-    'us&dollar;1,275',
-    'us&dollar;1,280',
-    'us&dollar;1,284,000',
-    'us&dollar;1,290,000',
-    'us&dollar;1,308',
-    'us&dollar;1,316',
-    'us&dollar;1,319,000',
-    'us&dollar;1,320',
-    'us&dollar;1,330',
-    'us&dollar;1,340',
-    'us&dollar;1,341,000',
-    'us&dollar;1,343',
     'us&dollar;1,400,000',
-    'us&dollar;1,434',
-    'us&dollar;1,445',
-    'us&dollar;1,450',
-    'us&dollar;1,452',
-    'us&dollar;1,470',
-    'us&dollar;1,479',
-    'us&dollar;1,480',
-    'us&dollar;1,490',
-    'us&dollar;1,510',
-    'us&dollar;1,530',
-    'us&dollar;1,535',
-    'us&dollar;1,559',
-    'us&dollar;1,570',
-    'us&dollar;1,590',
-    'us&dollar;1,605',
     'us&dollar;1,610',
-    'us&dollar;1,630,000',
-    'us&dollar;1,660',
-    'us&dollar;1,670',
-    'us&dollar;1,676',
-    'us&dollar;1,680',
-    'us&dollar;1,693',
-    'us&dollar;1,720',
-    'us&dollar;1,780',
-    'us&dollar;1,783',
-    'us&dollar;1,810',
-    'us&dollar;1,823',
-    'us&dollar;1,825',
-    'us&dollar;1,826',
-    'us&dollar;1,830',
-    'us&dollar;1,860',
     'us&dollar;1,864',
-    'us&dollar;1,900',
-    'us&dollar;1,910',
-    'us&dollar;1,920',
-    'us&dollar;1,928',
-    'us&dollar;1,950',
-    'us&dollar;1,959',
-    'us&dollar;1,960',
-    'us&dollar;1,970',
-    'us&dollar;1,974',
-    'us&dollar;1.00',
-    'us&dollar;1.000=19.2037',
-    'us&dollar;1.00=&pound;0.5931',
-    'us&dollar;1.00=&pound;0.6191',
-    'us&dollar;1.00=&pound;s11.4',
-    'us&dollar;1.00=&pound;s15.15',
     'us&dollar;1.00=&pound;s20.9807',
-    'us&dollar;1.00=&pound;s4.4958',
-    'us&dollar;1.00=&pound;syr20.9219',
-    'us&dollar;1.00=0.3137',
-    'us&dollar;1.00=0.3393',
-    'us&dollar;1.00=0.4740',
-    'us&dollar;1.00=0.56',
-    'us&dollar;1.00=0.6022',
-    'us&dollar;1.00=0.614',
-    'us&dollar;1.00=0.6857',
-    'us&dollar;1.00=0.7957',
-    'us&dollar;1.00=0.7985',
-    'us&dollar;1.00=0.9678',
-    'us&dollar;1.00=0.9689',
-    'us&dollar;1.00=0.9725',
-    'us&dollar;1.00=1,026.05',
     'us&dollar;1.00=1,042.38',
-    'us&dollar;1.00=1,208.7349',
-    'us&dollar;1.00=1,322.45',
-    'us&dollar;1.00=1,540,000',
-    'us&dollar;1.00=1,789.24',
-    'us&dollar;1.00=1.032',
-    'us&dollar;1.00=1.3067',
-    'us&dollar;1.00=1.7666',
-    'us&dollar;1.00=1.7834',
-    'us&dollar;1.00=1.80',
-    'us&dollar;1.00=1.9024',
-    'us&dollar;1.00=10,000',
-    'us&dollar;1.00=10,953',
-    'us&dollar;1.00=1018.4638',
-    'us&dollar;1.00=104.4277',
-    'us&dollar;1.00=104.4574',
     'us&dollar;1.00=105.048',
-    'us&dollar;1.00=105.852',
-    'us&dollar;1.00=10538',
-    'us&dollar;1.00=11.5737',
-    'us&dollar;1.00=110,085.043',
-    'us&dollar;1.00=110.953',
-    'us&dollar;1.00=111.689',
-    'us&dollar;1.00=113.203',
-    'us&dollar;1.00=113.994',
-    'us&dollar;1.00=12.0389',
-    'us&dollar;1.00=121.928',
-    'us&dollar;1.00=123.642',
-    'us&dollar;1.00=129.826',
-    'us&dollar;1.00=1299.2029',
-    'us&dollar;1.00=131.74',
-    'us&dollar;1.00=132.772',
     'us&dollar;1.00=133.926',
-    'us&dollar;1.00=135.622',
-    'us&dollar;1.00=137.111',
-    'us&dollar;1.00=14,973.9156',
-    'us&dollar;1.00=14.5',
-    'us&dollar;1.00=145.2802',
-    'us&dollar;1.00=15.8571',
-    'us&dollar;1.00=150',
-    'us&dollar;1.00=150.562',
-    'us&dollar;1.00=16.8218',
-    'us&dollar;1.00=16.9702',
-    'us&dollar;1.00=163.0722',
-    'us&dollar;1.00=173.028',
-    'us&dollar;1.00=175.9656',
-    'us&dollar;1.00=194.967',
-    'us&dollar;1.00=198.991',
     'us&dollar;1.00=2,000',
-    'us&dollar;1.00=2,694.0117',
-    'us&dollar;1.00=2,989.27',
-    'us&dollar;1.00=2.00',
-    'us&dollar;1.00=2.0493',
-    'us&dollar;1.00=2.0534',
-    'us&dollar;1.00=2.385',
-    'us&dollar;1.00=2.5459',
-    'us&dollar;1.00=2.7068',
-    'us&dollar;1.00=2.7318',
-    'us&dollar;1.00=2.7804',
-    'us&dollar;1.00=2.8433',
-    'us&dollar;1.00=2.9406',
-    'us&dollar;1.00=20',
-    'us&dollar;1.00=20,000',
-    'us&dollar;1.00=20.1204',
     'us&dollar;1.00=20.3415',
-    'us&dollar;1.00=200',
-    'us&dollar;1.00=205.50',
-    'us&dollar;1.00=23.6013',
-    'us&dollar;1.00=241',
-    'us&dollar;1.00=25',
-    'us&dollar;1.00=25.6988',
-    'us&dollar;1.00=252.683',
-    'us&dollar;1.00=258.855',
-    'us&dollar;1.00=279.2951',
-    'us&dollar;1.00=284.7540',
-    'us&dollar;1.00=29.9180',
-    'us&dollar;1.00=294.8313',
-    'us&dollar;1.00=3,9970.5014',
-    'us&dollar;1.00=3.0865',
-    'us&dollar;1.00=3.3495',
     'us&dollar;1.00=3.5218',
-    'us&dollar;1.00=3.9475',
-    'us&dollar;1.00=30',
-    'us&dollar;1.00=30.0358',
-    'us&dollar;1.00=309',
-    'us&dollar;1.00=342.934',
-    'us&dollar;1.00=360,000',
-    'us&dollar;1.00=360.186',
-    'us&dollar;1.00=391.55',
-    'us&dollar;1.00=4,489.9115',
-    'us&dollar;1.00=4.72',
-    'us&dollar;1.00=4.9398',
-    'us&dollar;1.00=4.9862',
-    'us&dollar;1.00=4.9955',
-    'us&dollar;1.00=40',
-    'us&dollar;1.00=41.952',
     'us&dollar;1.00=42.72',
-    'us&dollar;1.00=44.3945',
-    'us&dollar;1.00=460.502',
-    'us&dollar;1.00=471.6807',
-    'us&dollar;1.00=5',
-    'us&dollar;1.00=5,006.8674',
-    'us&dollar;1.00=5,800',
-    'us&dollar;1.00=5.23',
-    'us&dollar;1.00=5.3064',
-    'us&dollar;1.00=5.3199',
-    'us&dollar;1.00=5.4186',
-    'us&dollar;1.00=5.5053',
-    'us&dollar;1.00=5.5396',
-    'us&dollar;1.00=5.60',
-    'us&dollar;1.00=5.7322',
-    'us&dollar;1.00=5.9581',
     'us&dollar;1.00=5.9855',
-    'us&dollar;1.00=54.6511',
-    'us&dollar;1.00=56.6172',
-    'us&dollar;1.00=6,500',
-    'us&dollar;1.00=6.0753',
-    'us&dollar;1.00=6.2523',
-    'us&dollar;1.00=6.3848',
-    'us&dollar;1.00=6.4894',
-    'us&dollar;1.00=6.5',
-    'us&dollar;1.00=6.5557',
-    'us&dollar;1.00=60',
-    'us&dollar;1.00=600.924',
-    'us&dollar;1.00=61.6076',
-    'us&dollar;1.00=62.8359',
-    'us&dollar;1.00=621.714',
-    'us&dollar;1.00=63.3145',
     'us&dollar;1.00=649.405',
-    'us&dollar;1.00=651.6611',
-    'us&dollar;1.00=67.9608',
-    'us&dollar;1.00=686.8908',
-    'us&dollar;1.00=699.201',
-    'us&dollar;1.00=7.0773',
-    'us&dollar;1.00=7.9886',
-    'us&dollar;1.00=70.6000',
-    'us&dollar;1.00=704.057',
-    'us&dollar;1.00=711.4041',
-    'us&dollar;1.00=76.25',
-    'us&dollar;1.00=76.6553',
-    'us&dollar;1.00=76.8132',
-    'us&dollar;1.00=78.9813',
-    'us&dollar;1.00=8.74',
-    'us&dollar;1.00=802.15',
     'us&dollar;1.00=839.61',
-    'us&dollar;1.00=89.5858',
-    'us&dollar;1.00=9.0916',
-    'us&dollar;1.00=9.4819',
-    'us&dollar;1.00=9.5255',
-    'us&dollar;1.00=948.0249',
-    'us&dollar;1.00=966.748',
-    'us&dollar;1.00=9728.72',
-    'us&dollar;1.00=a&dollar;1.2965',
-    'us&dollar;1.00=a&dollar;1.3151',
-    'us&dollar;1.00=a&dollar;1.3928',
-    'us&dollar;1.00=ad11.989',
-    'us&dollar;1.00=ad21.112',
-    'us&dollar;1.00=afl1.7883',
-    'us&dollar;1.00=afl1.7900',
-    'us&dollar;1.00=b&dollar;1.6816',
     'us&dollar;1.00=b&dollar;1.8474',
-    'us&dollar;1.00=b&dollar;2.0094',
-    'us&dollar;1.00=b&dollar;2.0113',
-    'us&dollar;1.00=b25.4567',
-    'us&dollar;1.00=b25.4592',
-    'us&dollar;1.00=bd0.3756',
-    'us&dollar;1.00=bd0.3761',
-    'us&dollar;1.00=bel&dollar;1.9982',
-    'us&dollar;1.00=bel&dollar;2.0051',
-    'us&dollar;1.00=bf33.9878',
-    'us&dollar;1.00=bf34.0077',
-    'us&dollar;1.00=bf37.3374',
-    'us&dollar;1.00=c&dollar;0.8300',
-    'us&dollar;1.00=c&pound;0.4891',
-    'us&dollar;1.00=c118.344',
-    'us&dollar;1.00=c344.737',
     'us&dollar;1.00=c640.00',
-    'us&dollar;1.00=c84.4601',
-    'us&dollar;1.00=c88.8',
-    'us&dollar;1.00=ci&dollar;0.8292',
-    'us&dollar;1.00=cves65.3765',
-    'us&dollar;1.00=d0.8297',
-    'us&dollar;1.00=dh3.6589',
-    'us&dollar;1.00=dh3.6655',
-    'us&dollar;1.00=dkr5.6548',
-    'us&dollar;1.00=dkr6.4397',
-    'us&dollar;1.00=dkr7.0201',
-    'us&dollar;1.00=dm1.4455',
-    'us&dollar;1.00=dm1.4885',
-    'us&dollar;1.00=dm1.513',
-    'us&dollar;1.00=dm1.5788',
-    'us&dollar;1.00=dm1.6443',
     'us&dollar;1.00=dm1.6491',
-    'us&dollar;1.00=dm1.6532',
-    'us&dollar;1.00=dm1.7463',
-    'us&dollar;1.00=dm1.7527',
-    'us&dollar;1.00=dm1.8219',
-    'us&dollar;1.00=dm1.85',
-    'us&dollar;1.00=dr&dollar;6.28',
-    'us&dollar;1.00=e&pound;2.9228',
-    'us&dollar;1.00=ecu1.434',
-    'us&dollar;1.00=esc148.4578',
-    'us&dollar;1.00=esc157.377',
-    'us&dollar;1.00=esc65.2801',
-    'us&dollar;1.00=f&dollar;1.4351',
-    'us&dollar;1.00=f&dollar;1.4567',
-    'us&dollar;1.00=f&lt;t5.602',
-    'us&dollar;1.00=f5.3795',
     'us&dollar;1.00=f5.4452',
-    'us&dollar;1.00=f5.5446',
-    'us&dollar;1.00=f5.6099',
-    'us&dollar;1.00=f5.6099=104.4277',
-    'us&dollar;1.00=f5.6999',
-    'us&dollar;1.00=f5.7122',
-    'us&dollar;1.00=f6.1702=113.994',
-    'us&dollar;1.00=f6.5907',
-    'us&dollar;1.00=f61.6625',
-    'us&dollar;1.00=f71.406',
-    'us&dollar;1.00=f78.1146',
-    'us&dollar;1.00=fbu161.511',
-    'us&dollar;1.00=fbu176.8853',
-    'us&dollar;1.00=fl2.051',
-    'us&dollar;1.00=fm4.0622',
-    'us&dollar;1.00=fm4.3109',
     'us&dollar;1.00=fmg1,332.06',
-    'us&dollar;1.00=fmk4.0819',
-    'us&dollar;1.00=g&dollar;115.147',
-    'us&dollar;1.00=g&dollar;33',
-    'us&dollar;1.00=g&pound;0.6024',
-    'us&dollar;1.00=gd7.3096',
-    'us&dollar;1.00=gd7.5470',
-    'us&dollar;1.00=gf299.725',
-    'us&dollar;1.00=gf300.00',
-    'us&dollar;1.00=hk&dollar;7.7304',
-    'us&dollar;1.00=hk&dollar;7.7461',
-    'us&dollar;1.00=hk&dollar;7.7610',
-    'us&dollar;1.00=i&pound;0.6313',
-    'us&dollar;1.00=i&pound;0.6552',
-    'us&dollar;1.00=id0.302',
-    'us&dollar;1.00=id0.31',
     'us&dollar;1.00=ikr60.1445',
-    'us&dollar;1.00=ir71.1848',
-    'us&dollar;1.00=is2.0101',
-    'us&dollar;1.00=is2.0230',
-    'us&dollar;1.00=is2.0323',
-    'us&dollar;1.00=is2.0800',
-    'us&dollar;1.00=j&dollar;6.19',
-    'us&dollar;1.00=j&dollar;6.50',
-    'us&dollar;1.00=j&dollar;7.00',
-    'us&dollar;1.00=j&dollar;7.8199',
-    'us&dollar;1.00=j&dollar;8.0933',
-    'us&dollar;1.00=jd0.6391',
-    'us&dollar;1.00=jd0.647',
-    'us&dollar;1.00=k0.9418',
-    'us&dollar;1.00=k0.9489',
-    'us&dollar;1.00=k125',
     'us&dollar;1.00=k2.8377',
-    'us&dollar;1.00=k39.2645',
-    'us&dollar;1.00=k47.2456',
-    'us&dollar;1.00=kcs15.61',
-    'us&dollar;1.00=kcs24',
-    'us&dollar;1.00=kcs26.4234',
-    'us&dollar;1.00=kcs28',
-    'us&dollar;1.00=kcs31.4117',
-    'us&dollar;1.00=kd0.2857',
-    'us&dollar;1.00=kd0.2899',
-    'us&dollar;1.00=kd0.2930',
-    'us&dollar;1.00=ksh22.9307',
-    'us&dollar;1.00=ksh24.3177',
-    'us&dollar;1.00=kyat6.3587',
-    'us&dollar;1.00=l&dollar;1.00',
-    'us&dollar;1.00=l&pound;1,046.67',
     'us&dollar;1.00=l&pound;1,900',
-    'us&dollar;1.00=l&pound;650',
-    'us&dollar;1.00=l&pound;879.066',
-    'us&dollar;1.00=l&pound;992.561',
-    'us&dollar;1.00=l1,354.18',
-    'us&dollar;1.00=l1354.18',
-    'us&dollar;1.00=ld0.2671',
-    'us&dollar;1.00=le170.4325',
-    'us&dollar;1.00=le184.02',
-    'us&dollar;1.00=lfr',
-    'us&dollar;1.00=m&pound;0.3268',
-    'us&dollar;1.00=m&pound;0.3455',
-    'us&dollar;1.00=md8.1258',
-    'us&dollar;1.00=mk2.6055',
-    'us&dollar;1.00=n',
-    'us&dollar;1.00=n7.9603',
     'us&dollar;1.00=n8.7506',
-    'us&dollar;1.00=nafl1.7883',
-    'us&dollar;1.00=nafl1.7945',
-    'us&dollar;1.00=nk60',
-    'us&dollar;1.00=nkr6.6945',
-    'us&dollar;1.00=nrs28.3647',
-    'us&dollar;1.00=nrs42.7512',
-    'us&dollar;1.00=nt&dollar;26.00',
-    'us&dollar;1.00=nt&dollar;26.5116',
-    'us&dollar;1.00=nt&dollar;27.1064',
-    'us&dollar;1.00=nt&dollar;40.00',
-    'us&dollar;1.00=nz&dollar;1.7576',
-    'us&dollar;1.00=p1.8548',
-    'us&dollar;1.00=p1.8742',
-    'us&dollar;1.00=p22.1233',
-    'us&dollar;1.00=p26.2065',
     'us&dollar;1.00=p7.996',
-    'us&dollar;1.00=p8.0587',
-    'us&dollar;1.00=qr3.6275',
-    'us&dollar;1.00=qr3.633',
-    'us&dollar;1.00=r13.8931',
-    'us&dollar;1.00=r14.8375',
-    'us&dollar;1.00=r65.4593',
-    'us&dollar;1.00=r71.1848',
-    'us&dollar;1.00=rbs0.5425',
-    'us&dollar;1.00=rbs0.5556',
-    'us&dollar;1.00=rf10.1634',
-    'us&dollar;1.00=rf119.099',
-    'us&dollar;1.00=rf78.4304',
-    'us&dollar;1.00=rf9.3864',
-    'us&dollar;1.00=ro0.3817',
-    'us&dollar;1.00=ro0.3835',
     'us&dollar;1.00=ro0.3839',
-    'us&dollar;1.00=rp1,841.4827',
-    'us&dollar;1.00=rp1966.94',
-    'us&dollar;1.00=rps1,897.44',
-    'us&dollar;1.00=rs16.4316',
-    'us&dollar;1.00=rs16.8218',
-    'us&dollar;1.00=rs21.4709',
-    'us&dollar;1.00=rs24.4266',
-    'us&dollar;1.00=rs25.1842',
-    'us&dollar;1.00=rs25.6988',
-    'us&dollar;1.00=rs27.278',
-    'us&dollar;1.00=rs39.5716',
-    'us&dollar;1.00=rs41.8083',
-    'us&dollar;1.00=s&dollar;1.6816',
-    'us&dollar;1.00=s&dollar;1.8474',
-    'us&dollar;1.00=s1,042.64',
     'us&dollar;1.00=s713.8313',
-    'us&dollar;1.00=sch10.7933',
-    'us&dollar;1.00=sch11.9009',
-    'us&dollar;1.00=sch12.7832',
-    'us&dollar;1.00=sh378.1138',
-    'us&dollar;1.00=sh564.819',
-    'us&dollar;1.00=si&dollar;2.5832',
-    'us&dollar;1.00=si&dollar;2.7229',
-    'us&dollar;1.00=sr',
-    'us&dollar;1.00=sr3.7367',
-    'us&dollar;1.00=sr5.0053',
-    'us&dollar;1.00=sr5.5793',
-    'us&dollar;1.00=ss2,629.27',
-    'us&dollar;1.00=ss408.8687',
-    'us&dollar;1.00=taka36.4403',
-    'us&dollar;1.00=tl4,351.67',
     'us&dollar;1.00=tl7,919.02',
-    'us&dollar;1.00=ts1.2481',
-    'us&dollar;1.00=tsh194.4206',
-    'us&dollar;1.00=tsh195.321',
-    'us&dollar;1.00=tt&dollar;4.2462',
-    'us&dollar;1.00=tt&dollar;4.2608',
-    'us&dollar;1.00=tug3.3431',
-    'us&dollar;1.00=ws&dollar;2.2601',
-    'us&dollar;1.00=yr11.83',
-    'us&dollar;1.00=z&dollar;2.4703',
-    'us&dollar;1.00=z&dollar;2.6775',
-    'us&dollar;1.00=z529.1927',
-    'us&dollar;1.00=zl11,100',
-    'us&dollar;1.00=zl11,569',
-    'us&dollar;1.00=zl13,254.9',
-    'us&dollar;1.00=zl9,500',
     'us&dollar;1.00=zl9,681.61',
-    'us&dollar;1.00=zl9,713.39',
-    'us&dollar;1.056',
-    'us&dollar;1.30',
-    'us&dollar;1.36',
-    'us&dollar;1.50',
-    'us&dollar;1.63',
-    'us&dollar;1.7',
-    'us&dollar;1.84',
-    'us&dollar;10,140',
-    'us&dollar;10,300',
-    'us&dollar;10,300,000',
-    'us&dollar;10,340',
-    'us&dollar;10,400',
-    'us&dollar;10,400,000',
-    'us&dollar;10,437',
     'us&dollar;10,441',
-    'us&dollar;10,444',
-    'us&dollar;10,570',
-    'us&dollar;10,600',
-    'us&dollar;10,610',
-    'us&dollar;10,700',
-    'us&dollar;10,700,000',
-    'us&dollar;10,707',
-    'us&dollar;10-15,000,000',
-    'us&dollar;1000m',
-    'us&dollar;102',
-    'us&dollar;103,000,000',
-    'us&dollar;104,000',
-    'us&dollar;104,000,000',
-    'us&dollar;105,600',
-    'us&dollar;105.3',
     'us&dollar;107,700',
-    'us&dollar;109,653.60',
-    'us&dollar;10bn',
-    'us&dollar;11,170',
-    'us&dollar;11,195',
-    'us&dollar;11,375',
-    'us&dollar;11,400',
-    'us&dollar;11,610',
-    'us&dollar;11,640',
-    'us&dollar;11,855',
-    'us&dollar;11,900',
-    'us&dollar;11.5',
-    'us&dollar;11.97',
-    'us&dollar;110,000,000',
-    'us&dollar;110m',
-    'us&dollar;111,000,000',
     'us&dollar;112,000',
-    'us&dollar;112,600,000',
-    'us&dollar;114',
-    'us&dollar;114,000',
-    'us&dollar;115',
-    'us&dollar;117',
-    'us&dollar;117,000,000',
-    'us&dollar;118,680',
-    'us&dollar;118,900',
-    'us&dollar;12,080',
-    'us&dollar;12,125',
-    'us&dollar;12,200',
-    'us&dollar;12,290',
-    'us&dollar;12,390',
-    'us&dollar;12,600',
-    'us&dollar;12,900,000',
     'us&dollar;120,000',
-    'us&dollar;121,300',
-    'us&dollar;121,900',
-    'us&dollar;122',
-    'us&dollar;122,000',
-    'us&dollar;123',
-    'us&dollar;123,000',
-    'us&dollar;124,000',
-    'us&dollar;125,000,000',
-    'us&dollar;125,100',
-    'us&dollar;127,800,000',
-    'us&dollar;128,000,000',
-    'us&dollar;129,122',
-    'us&dollar;13,200',
-    'us&dollar;13,320',
-    'us&dollar;13,500,000',
     'us&dollar;13,680',
-    'us&dollar;13,930',
-    'us&dollar;13.5',
-    'us&dollar;130,500,000',
-    'us&dollar;131',
-    'us&dollar;132',
-    'us&dollar;134,000,000',
-    'us&dollar;135',
-    'us&dollar;135.357',
-    'us&dollar;135.6',
-    'us&dollar;136',
-    'us&dollar;136,000',
-    'us&dollar;137,630,000',
-    'us&dollar;138,000',
-    'us&dollar;138,163',
-    'us&dollar;139',
     'us&dollar;139,000',
-    'us&dollar;14,200,000',
-    'us&dollar;14,500,000',
-    'us&dollar;14,530',
-    'us&dollar;14,550',
-    'us&dollar;14,850',
-    'us&dollar;14,911',
-    'us&dollar;14,950',
-    'us&dollar;140,000',
-    'us&dollar;140,200',
-    'us&dollar;141,088.61',
-    'us&dollar;143,000',
-    'us&dollar;144,500',
-    'us&dollar;145',
-    'us&dollar;145,00,000',
-    'us&dollar;145,300,000',
     'us&dollar;146,000,000',
-    'us&dollar;15,000-20,000',
-    'us&dollar;15,160',
-    'us&dollar;15,200',
-    'us&dollar;15,200,000',
-    'us&dollar;15,270,000',
-    'us&dollar;15,400',
-    'us&dollar;15,500',
-    'us&dollar;15,560',
-    'us&dollar;15,720',
-    'us&dollar;15,770',
-    'us&dollar;15.55',
-    'us&dollar;15.60',
-    'us&dollar;150,000',
-    'us&dollar;150,033',
-    'us&dollar;152',
     'us&dollar;152,000',
-    'us&dollar;154,100',
-    'us&dollar;155',
-    'us&dollar;156',
-    'us&dollar;157,000,000',
-    'us&dollar;157,800',
-    'us&dollar;1570',
-    'us&dollar;158,168',
-    'us&dollar;159',
-    'us&dollar;16,080',
-    'us&dollar;16,100',
-    'us&dollar;16,200',
-    'us&dollar;16,400',
-    'us&dollar;16,400,000',
-    'us&dollar;16,432,600',
-    'us&dollar;16,446',
     'us&dollar;16,500,000',
-    'us&dollar;16,600',
-    'us&dollar;16,600,000',
-    'us&dollar;16,760',
-    'us&dollar;16,800(1988)',
-    'us&dollar;16,839',
-    'us&dollar;16-17',
-    'us&dollar;16.40',
-    'us&dollar;161',
-    'us&dollar;161,000,000',
-    'us&dollar;162,000,000',
-    'us&dollar;164',
-    'us&dollar;164,760',
-    'us&dollar;166',
-    'us&dollar;167,000,000',
-    'us&dollar;17,452',
     'us&dollar;17,865',
-    'us&dollar;170,000',
-    'us&dollar;170,880',
-    'us&dollar;172,000,000',
-    'us&dollar;173',
-    'us&dollar;174,000',
-    'us&dollar;174,000,000',
-    'us&dollar;175',
-    'us&dollar;175,000,000',
-    'us&dollar;176',
-    'us&dollar;176,000,000',
-    'us&dollar;177',
-    'us&dollar;177,200,000',
-    'us&dollar;178,883',
-    'us&dollar;179,000,000',
-    'us&dollar;18,022',
     'us&dollar;18,300',
-    'us&dollar;18,350',
-    'us&dollar;18,470',
-    'us&dollar;18,530',
-    'us&dollar;18,610',
-    'us&dollar;18,700,000',
-    'us&dollar;18,900',
-    'us&dollar;18,970',
-    'us&dollar;18.50',
-    'us&dollar;18.5m',
-    'us&dollar;18.8',
-    'us&dollar;18.88',
-    'us&dollar;180,000',
-    'us&dollar;181.06',
-    'us&dollar;182,000,000',
-    'us&dollar;185,000',
     'us&dollar;187,900',
-    'us&dollar;19,000',
-    'us&dollar;19,150',
-    'us&dollar;19,480',
-    'us&dollar;19,540',
-    'us&dollar;19,587',
-    'us&dollar;19,600',
-    'us&dollar;19,780',
-    'us&dollar;19,800',
-    'us&dollar;190',
-    'us&dollar;190++',
-    'us&dollar;190,000,000',
-    'us&dollar;191,000,000',
-    'us&dollar;193',
-    'us&dollar;194,000',
-    'us&dollar;194,100,000',
     'us&dollar;194,600,000',
-    'us&dollar;195',
-    'us&dollar;196,000,000',
-    'us&dollar;1970',
-    'us&dollar;1=&pound;s15.0305',
-    'us&dollar;1=0.5461',
-    'us&dollar;1=1,000',
-    'us&dollar;1=134.80',
-    'us&dollar;1=161.10',
-    'us&dollar;1=18.45',
-    'us&dollar;1=2.6638',
-    'us&dollar;1=23.8713',
-    'us&dollar;1=238.522',
-    'us&dollar;1=5.4556',
-    'us&dollar;1=6,000',
-    'us&dollar;1=780.697',
     'us&dollar;1=a&dollar;1.3798',
-    'us&dollar;1=dm1.6414',
-    'us&dollar;1=nk6.573',
-    'us&dollar;1=ps10.2',
-    'us&dollar;1=ps7.3',
-    'us&dollar;1=r2.63',
-    'us&dollar;1=rd&dollar;10.9186',
-    'us&dollar;1=rd&dollar;12.9397',
-    'us&dollar;1=tl2,614.6441',
-    'us&dollar;1m',
-    'us&dollar;2,009',
-    'us&dollar;2,036',
-    'us&dollar;2,087',
-    'us&dollar;2,110',
-    'us&dollar;2,135',
-    'us&dollar;2,142,000',
     'us&dollar;2,18o',
-    'us&dollar;2,190',
-    'us&dollar;2,224,500',
-    'us&dollar;2,227',
-    'us&dollar;2,260',
-    'us&dollar;2,280',
-    'us&dollar;2,290',
-    'us&dollar;2,300,000',
-    'us&dollar;2,370',
-    'us&dollar;2,370,000',
-    'us&dollar;2,430',
-    'us&dollar;2,450',
-    'us&dollar;2,460',
-    'us&dollar;2,470',
-    'us&dollar;2,480',
-    'us&dollar;2,488',
     'us&dollar;2,495',
-    'us&dollar;2,500,000-worth',
-    'us&dollar;2,521.7',
-    'us&dollar;2,555',
-    'us&dollar;2,600,000',
-    'us&dollar;2,610',
-    'us&dollar;2,620',
-    'us&dollar;2,640',
-    'us&dollar;2,680',
-    'us&dollar;2,700,000',
-    'us&dollar;2,722',
-    'us&dollar;2,738',
-    'us&dollar;2,750,000',
-    'us&dollar;2,770',
-    'us&dollar;2,835',
-    'us&dollar;2,864.1',
     'us&dollar;2,870',
-    'us&dollar;2,879',
-    'us&dollar;2,890',
-    'us&dollar;2,900,000',
-    'us&dollar;2,918',
-    'us&dollar;2,970',
-    'us&dollar;2,978',
-    'us&dollar;2,985',
-    'us&dollar;2.1',
-    'us&dollar;2.50',
-    'us&dollar;2.9',
-    'us&dollar;20,020',
-    'us&dollar;20,051',
-    'us&dollar;20,130,000',
-    'us&dollar;20,160',
-    'us&dollar;20,200',
     'us&dollar;20,400',
-    'us&dollar;20,500',
-    'us&dollar;20,500,000',
-    'us&dollar;20,602',
-    'us&dollar;20,800,000',
-    'us&dollar;20,950',
-    'us&dollar;20.000',
-    'us&dollar;200,00,000',
-    'us&dollar;200,000,000-worth',
-    'us&dollar;200,000,0000',
-    'us&dollar;202',
-    'us&dollar;203,000',
-    'us&dollar;204,000',
-    'us&dollar;206,000,000',
-    'us&dollar;207,000,000',
-    'us&dollar;209,000',
     'us&dollar;21,500,000',
-    'us&dollar;21.19',
-    'us&dollar;212,000',
-    'us&dollar;212,000,000',
-    'us&dollar;213',
-    'us&dollar;213,000,000',
-    'us&dollar;217,100,000',
-    'us&dollar;218,000,000',
-    'us&dollar;22,114',
-    'us&dollar;22,200,000',
-    'us&dollar;22,500',
-    'us&dollar;22,600',
-    'us&dollar;22,700',
-    'us&dollar;22,800,000',
-    'us&dollar;220,600,000',
-    'us&dollar;224,000,000',
     'us&dollar;225&ndash&dollar;270',
-    'us&dollar;225,000',
-    'us&dollar;225,9000,000',
-    'us&dollar;227,487',
-    'us&dollar;229,000,000',
-    'us&dollar;23,645',
-    'us&dollar;23,700',
-    'us&dollar;23.7',
-    'us&dollar;230,000,000',
-    'us&dollar;231,000',
-    'us&dollar;231.3',
-    'us&dollar;233,000,000',
-    'us&dollar;24,000,000',
-    'us&dollar;24,500,000',
-    'us&dollar;24,640',
-    'us&dollar;240,000',
     'us&dollar;240,000,000',
-    'us&dollar;2400',
-    'us&dollar;242',
-    'us&dollar;247,500,000',
-    'us&dollar;25,500,000',
-    'us&dollar;25,570',
-    'us&dollar;25,600,000',
-    'us&dollar;250,000',
-    'us&dollar;250.4',
-    'us&dollar;251',
-    'us&dollar;252',
-    'us&dollar;252,000,000',
-    'us&dollar;256',
-    'us&dollar;257,000,000',
-    'us&dollar;26',
-    'us&dollar;26,100',
     'us&dollar;26,700',
-    'us&dollar;26,900',
-    'us&dollar;262,000,000',
-    'us&dollar;264',
-    'us&dollar;265',
-    'us&dollar;2695',
-    'us&dollar;27,000',
-    'us&dollar;27,260',
-    'us&dollar;27,300,000',
-    'us&dollar;27,500',
-    'us&dollar;27,580',
-    'us&dollar;27,600',
-    'us&dollar;27,800',
-    'us&dollar;270,000',
-    'us&dollar;271,000,000',
-    'us&dollar;273.1',
     'us&dollar;275',
-    'us&dollar;275.1',
-    'us&dollar;276,250',
-    'us&dollar;278',
-    'us&dollar;278,000,000',
-    'us&dollar;28,000',
-    'us&dollar;28,400,000',
-    'us&dollar;28,500,000',
-    'us&dollar;28,549',
-    'us&dollar;28,900',
-    'us&dollar;280,000,000',
-    'us&dollar;29',
-    'us&dollar;29,200',
-    'us&dollar;29.95',
-    'us&dollar;290,000,000',
-    'us&dollar;292,000,000',
     'us&dollar;293,000,000',
-    'us&dollar;294',
-    'us&dollar;295,000,000',
-    'us&dollar;295,500',
-    'us&dollar;297,657,500',
-    'us&dollar;299,800,000',
-    'us&dollar;2m.',
-    'us&dollar;3,002',
-    'us&dollar;3,099',
-    'us&dollar;3,133',
-    'us&dollar;3,170',
-    'us&dollar;3,180',
-    'us&dollar;3,188.2',
-    'us&dollar;3,230',
-    'us&dollar;3,232',
-    'us&dollar;3,260',
     'us&dollar;3,295',
-    'us&dollar;3,300',
-    'us&dollar;3,415',
-    'us&dollar;3,500,000',
-    'us&dollar;3,500-&dollar;5,999',
-    'us&dollar;3,530',
-    'us&dollar;3,532',
-    'us&dollar;3,560',
-    'us&dollar;3,598',
-    'us&dollar;3,600,000',
-    'us&dollar;3,620',
-    'us&dollar;3,670',
-    'us&dollar;3,678',
-    'us&dollar;3,748',
-    'us&dollar;3,750',
-    'us&dollar;3,923',
     'us&dollar;3,930',
-    'us&dollar;3,960,000',
-    'us&dollar;3,986',
-    'us&dollar;3.2',
-    'us&dollar;3.50',
-    'us&dollar;3.7',
-    'us&dollar;30,300',
-    'us&dollar;30,500',
-    'us&dollar;30,700',
-    'us&dollar;30,800,000',
-    'us&dollar;30.5m',
-    'us&dollar;301',
-    'us&dollar;305,000,000',
-    'us&dollar;31',
-    'us&dollar;31,000,000',
-    'us&dollar;31,400',
     'us&dollar;31,700',
-    'us&dollar;31,770',
-    'us&dollar;313,000,000',
-    'us&dollar;315,000,000',
-    'us&dollar;318',
-    'us&dollar;32,000',
-    'us&dollar;32,400',
-    'us&dollar;32,670',
-    'us&dollar;32,950',
-    'us&dollar;32.6',
-    'us&dollar;320',
-    'us&dollar;320,000',
-    'us&dollar;322',
-    'us&dollar;322,000,000',
-    'us&dollar;323,000,000',
-    'us&dollar;325',
     'us&dollar;325,000,000',
-    'us&dollar;328,000,000',
-    'us&dollar;33',
-    'us&dollar;33,661',
-    'us&dollar;33,700',
-    'us&dollar;331',
-    'us&dollar;331,000,000',
-    'us&dollar;332',
-    'us&dollar;336',
-    'us&dollar;34',
-    'us&dollar;34,070',
-    'us&dollar;34,100,000',
-    'us&dollar;34,900,000',
-    'us&dollar;340',
-    'us&dollar;340,000,000',
-    'us&dollar;341,550',
     'us&dollar;344',
-    'us&dollar;345,500,000',
-    'us&dollar;35,249',
-    'us&dollar;35,500,000',
-    'us&dollar;35-40,000,000',
-    'us&dollar;350,000',
-    'us&dollar;352,000,000',
-    'us&dollar;353,000,000',
-    'us&dollar;354',
-    'us&dollar;358bn',
-    'us&dollar;35m',
-    'us&dollar;36',
-    'us&dollar;36,000,000',
-    'us&dollar;36,580',
-    'us&dollar;36,700,000',
-    'us&dollar;36,800',
     'us&dollar;360,000,000',
-    'us&dollar;365',
-    'us&dollar;365,000,000',
-    'us&dollar;366',
-    'us&dollar;369.1',
-    'us&dollar;37,800,000',
-    'us&dollar;372',
-    'us&dollar;372,000,000',
-    'us&dollar;374,000,000',
-    'us&dollar;375,000',
-    'us&dollar;375,000,000',
-    'us&dollar;376,000,000',
-    'us&dollar;38,000',
-    'us&dollar;38,200',
-    'us&dollar;38,440',
-    'us&dollar;38,830',
     'us&dollar;38.4',
-    'us&dollar;380,000',
-    'us&dollar;380,000,000',
-    'us&dollar;386,000',
-    'us&dollar;39,400,000',
-    'us&dollar;39.3',
-    'us&dollar;393.9',
-    'us&dollar;395',
-    'us&dollar;39m',
-    'us&dollar;4',
-    'us&dollar;4,000,000',
-    'us&dollar;4,010',
-    'us&dollar;4,020,000',
-    'us&dollar;4,045',
-    'us&dollar;4,082',
-    'us&dollar;4,100,000',
     'us&dollar;4,109',
-    'us&dollar;4,110',
-    'us&dollar;4,129',
-    'us&dollar;4,135,000',
-    'us&dollar;4,196.5',
-    'us&dollar;4,257',
-    'us&dollar;4,300',
-    'us&dollar;4,300,000',
-    'us&dollar;4,314',
-    'us&dollar;4,335',
-    'us&dollar;4,366',
-    'us&dollar;4,400,000',
-    'us&dollar;4,410',
-    'us&dollar;4,458',
-    'us&dollar;4,470',
-    'us&dollar;4,494.4',
     'us&dollar;4,536',
-    'us&dollar;4,557',
-    'us&dollar;4,603',
-    'us&dollar;4,710',
-    'us&dollar;4,730',
-    'us&dollar;4,734',
-    'us&dollar;4,769',
-    'us&dollar;4,770',
-    'us&dollar;4,790',
-    'us&dollar;4,890',
-    'us&dollar;4,940',
-    'us&dollar;4,970',
-    'us&dollar;4.4',
-    'us&dollar;4.7',
-    'us&dollar;4.75',
-    'us&dollar;40,200',
     'us&dollar;40,400,000',
-    'us&dollar;40.30',
-    'us&dollar;403,000,000',
-    'us&dollar;404',
-    'us&dollar;404,000,000',
-    'us&dollar;408.6',
-    'us&dollar;409',
-    'us&dollar;418',
-    'us&dollar;42,900',
-    'us&dollar;420,000',
-    'us&dollar;420,000,000',
-    'us&dollar;422,000',
-    'us&dollar;423.4',
-    'us&dollar;425',
-    'us&dollar;425,000,000',
-    'us&dollar;426',
     'us&dollar;428',
-    'us&dollar;43,000',
-    'us&dollar;43,270',
-    'us&dollar;43.2',
-    'us&dollar;430,000',
-    'us&dollar;431,000,000',
-    'us&dollar;435,000',
-    'us&dollar;44,000,000',
-    'us&dollar;44,600,000',
-    'us&dollar;44,960',
-    'us&dollar;440,000',
-    'us&dollar;440,000,000',
-    'us&dollar;444,704,000',
-    'us&dollar;445',
-    'us&dollar;45,700',
-    'us&dollar;45,930',
     'us&dollar;450,000',
-    'us&dollar;455',
-    'us&dollar;458.45',
-    'us&dollar;46,000,000',
-    'us&dollar;46,700',
-    'us&dollar;46.80',
-    'us&dollar;461',
-    'us&dollar;463,000,000',
-    'us&dollar;47,000',
-    'us&dollar;47,400,000',
-    'us&dollar;470',
-    'us&dollar;48',
-    'us&dollar;48,000,000',
-    'us&dollar;48,250,000',
-    'us&dollar;480,000',
-    'us&dollar;480,000,000',
     'us&dollar;484,000,000',
-    'us&dollar;486,400',
-    'us&dollar;49,000',
-    'us&dollar;49.95',
-    'us&dollar;499',
-    'us&dollar;499,000,000',
-    'us&dollar;5,000-us&dollar;7,000',
-    'us&dollar;5,050',
-    'us&dollar;5,070',
-    'us&dollar;5,080',
-    'us&dollar;5,131',
-    'us&dollar;5,180',
-    'us&dollar;5,233,200',
-    'us&dollar;5,240',
-    'us&dollar;5,450',
-    'us&dollar;5,520',
     'us&dollar;5,610',
-    'us&dollar;5,653',
-    'us&dollar;5,676',
-    'us&dollar;5,680',
-    'us&dollar;5,690',
-    'us&dollar;5,700,000',
-    'us&dollar;5,726',
-    'us&dollar;5,760,000',
-    'us&dollar;5,770',
-    'us&dollar;5,800',
-    'us&dollar;5,880',
-    'us&dollar;5,900',
-    'us&dollar;5,913',
-    'us&dollar;5,990',
-    'us&dollar;5-7,000,000',
-    'us&dollar;5.77',
     'us&dollar;5.9',
-    'us&dollar;50,400',
-    'us&dollar;50,630',
-    'us&dollar;50-&dollar;60',
-    'us&dollar;50.3',
-    'us&dollar;500-800,000,000',
-    'us&dollar;508,000,000',
-    'us&dollar;510',
-    'us&dollar;510,450',
-    'us&dollar;511,000,000',
-    'us&dollar;515',
-    'us&dollar;52,490',
-    'us&dollar;521',
-    'us&dollar;525,000,000',
-    'us&dollar;527,000,000',
-    'us&dollar;53,000',
     'us&dollar;53,000,000',
-    'us&dollar;53,600',
-    'us&dollar;53.5',
-    'us&dollar;536',
-    'us&dollar;539',
-    'us&dollar;54',
-    'us&dollar;54,000,000',
-    'us&dollar;54,200',
-    'us&dollar;54,636',
-    'us&dollar;54,700,000',
-    'us&dollar;54,795',
-    'us&dollar;54,800,000',
-    'us&dollar;541,000,000',
-    'us&dollar;545',
-    'us&dollar;549.95',
-    'us&dollar;55,000',
     'us&dollar;55,600',
-    'us&dollar;55,700,000',
-    'us&dollar;550',
-    'us&dollar;550,000',
-    'us&dollar;550,000,000',
-    'us&dollar;551',
-    'us&dollar;553,400,000',
-    'us&dollar;555,500,000',
-    'us&dollar;56',
-    'us&dollar;56,000',
-    'us&dollar;56,000,000',
-    'us&dollar;56.5',
-    'us&dollar;560',
-    'us&dollar;564',
-    'us&dollar;569,000,000',
-    'us&dollar;57,000',
     'us&dollar;57,200,000',
-    'us&dollar;575',
-    'us&dollar;576,000,000',
-    'us&dollar;58,000',
-    'us&dollar;59,000',
-    'us&dollar;59,300,0003',
-    'us&dollar;59,390',
-    'us&dollar;59,960',
-    'us&dollar;590,000,000',
-    'us&dollar;599',
-    'us&dollar;6,040',
-    'us&dollar;6,100,000',
-    'us&dollar;6,150,000',
-    'us&dollar;6,170',
-    'us&dollar;6,200',
-    'us&dollar;6,200,000',
     'us&dollar;6,250,000',
-    'us&dollar;6,260',
-    'us&dollar;6,363',
-    'us&dollar;6,400',
-    'us&dollar;6,450,000',
-    'us&dollar;6,572',
-    'us&dollar;6,610',
-    'us&dollar;6,750',
-    'us&dollar;6,800',
-    'us&dollar;6,831',
-    'us&dollar;6,850,000',
-    'us&dollar;6,924',
-    'us&dollar;6.5',
-    'us&dollar;6.7',
-    'us&dollar;60,500',
-    'us&dollar;60,820',
     'us&dollar;61,000,000',
-    'us&dollar;61,100,000',
-    'us&dollar;612',
-    'us&dollar;617,000,000',
-    'us&dollar;618',
-    'us&dollar;620,000,000',
-    'us&dollar;63,600',
-    'us&dollar;63,800,000',
-    'us&dollar;63,900,000',
-    'us&dollar;63.2',
-    'us&dollar;630,000',
-    'us&dollar;630,000,000',
-    'us&dollar;632',
-    'us&dollar;632,000,000',
-    'us&dollar;64',
-    'us&dollar;64,675,000',
     'us&dollar;640',
-    'us&dollar;641',
-    'us&dollar;645',
-    'us&dollar;646,000,000',
-    'us&dollar;647,000,000',
-    'us&dollar;649',
-    'us&dollar;655',
-    'us&dollar;66,000',
-    'us&dollar;66,000,000',
-    'us&dollar;660,000',
-    'us&dollar;67,000,000',
-    'us&dollar;67,400',
-    'us&dollar;67,500',
-    'us&dollar;674',
-    'us&dollar;674,000,000',
-    'us&dollar;675',
     'us&dollar;68',
-    'us&dollar;68,000,000',
-    'us&dollar;68,300',
-    'us&dollar;68,600',
-    'us&dollar;680,000,000',
-    'us&dollar;69,300',
-    'us&dollar;69,970',
-    'us&dollar;690',
-    'us&dollar;692,000,000',
-    'us&dollar;699,300,000',
-    'us&dollar;7,100,000',
-    'us&dollar;7,250,000',
-    'us&dollar;7,256',
-    'us&dollar;7,300',
-    'us&dollar;7,480',
-    'us&dollar;7,548',
     'us&dollar;7,570',
-    'us&dollar;7,600,000',
-    'us&dollar;7,740',
-    'us&dollar;7,800,000',
-    'us&dollar;7,880',
-    'us&dollar;7,890',
-    'us&dollar;7.3',
-    'us&dollar;7.5',
-    'us&dollar;7.50',
-    'us&dollar;70,600',
-    'us&dollar;70.454',
-    'us&dollar;700,000',
-    'us&dollar;700,000,000-us&dollar;800,000,000',
-    'us&dollar;700and',
-    'us&dollar;703',
-    'us&dollar;704',
     'us&dollar;705,000,000',
-    'us&dollar;71,470',
-    'us&dollar;71.6',
-    'us&dollar;710',
-    'us&dollar;710,000,000',
-    'us&dollar;720',
-    'us&dollar;720,000,000',
-    'us&dollar;723,000,000',
-    'us&dollar;73,000',
-    'us&dollar;73,800,000',
-    'us&dollar;730,000,000',
-    'us&dollar;733',
-    'us&dollar;734,936,000',
-    'us&dollar;735',
-    'us&dollar;740',
-    'us&dollar;745',
     'us&dollar;745,000,000',
-    'us&dollar;746.9',
-    'us&dollar;75',
-    'us&dollar;75,000,000',
-    'us&dollar;750,000',
-    'us&dollar;753,000,000',
-    'us&dollar;76,000',
-    'us&dollar;76,000,000',
-    'us&dollar;77,500',
-    'us&dollar;770',
-    'us&dollar;770,000',
-    'us&dollar;775',
-    'us&dollar;778,700,000',
-    'us&dollar;780,000',
-    'us&dollar;781',
-    'us&dollar;782',
     'us&dollar;784.8',
-    'us&dollar;785,700',
-    'us&dollar;789,000,000',
-    'us&dollar;79,000',
-    'us&dollar;79.95',
-    'us&dollar;790',
-    'us&dollar;791',
-    'us&dollar;8,040',
-    'us&dollar;8,100',
-    'us&dollar;8,110',
-    'us&dollar;8,139',
-    'us&dollar;8,150',
-    'us&dollar;8,175.5',
-    'us&dollar;8,315',
-    'us&dollar;8,323',
-    'us&dollar;8,400',
     'us&dollar;8,550',
-    'us&dollar;8,590',
-    'us&dollar;8,600',
-    'us&dollar;8,630',
-    'us&dollar;8,650',
-    'us&dollar;8,693.4',
-    'us&dollar;8,700,000',
-    'us&dollar;8,730',
-    'us&dollar;8,800',
-    'us&dollar;8,847',
-    'us&dollar;8,851',
-    'us&dollar;8,998',
-    'us&dollar;80',
-    'us&dollar;80,000',
-    'us&dollar;80,500,000',
-    'us&dollar;80-86,000,000',
     'us&dollar;805,000,000',
-    'us&dollar;806,000,000',
-    'us&dollar;81,500,000',
-    'us&dollar;813',
-    'us&dollar;815,800,000',
-    'us&dollar;82',
-    'us&dollar;82,000,000',
-    'us&dollar;82,200',
-    'us&dollar;820',
-    'us&dollar;830',
-    'us&dollar;84',
-    'us&dollar;84,000',
-    'us&dollar;84,000,000',
-    'us&dollar;84,200,000',
-    'us&dollar;840',
-    'us&dollar;845,000,000',
     'us&dollar;85,130',
-    'us&dollar;85,800',
-    'us&dollar;850',
-    'us&dollar;850,000,000',
-    'us&dollar;855,000,000',
-    'us&dollar;856',
-    'us&dollar;859,996',
-    'us&dollar;86',
-    'us&dollar;86.4',
-    'us&dollar;860',
-    'us&dollar;865,000,000',
-    'us&dollar;870',
-    'us&dollar;88,657',
-    'us&dollar;880',
-    'us&dollar;880,000',
-    'us&dollar;883',
     'us&dollar;884',
-    'us&dollar;886',
-    'us&dollar;89',
-    'us&dollar;890,000,000',
-    'us&dollar;9',
-    'us&dollar;9,100',
-    'us&dollar;9,130',
-    'us&dollar;9,230',
-    'us&dollar;9,230,000',
-    'us&dollar;9,450',
-    'us&dollar;9,500',
-    'us&dollar;9,600',
-    'us&dollar;9,620',
-    'us&dollar;9,650,000',
-    'us&dollar;9,700',
-    'us&dollar;90',
     'us&dollar;90,000',
-    'us&dollar;901',
-    'us&dollar;908,000,000',
-    'us&dollar;91,000,000',
-    'us&dollar;91,183',
-    'us&dollar;91,850',
-    'us&dollar;912',
-    'us&dollar;916,000,000',
-    'us&dollar;916,340',
-    'us&dollar;919,000,000',
-    'us&dollar;92',
-    'us&dollar;92,400',
-    'us&dollar;926,000,000',
-    'us&dollar;93,656,000',
-    'us&dollar;930,000',
-    'us&dollar;933',
     'us&dollar;94,000,000',
-    'us&dollar;94,500,000',
-    'us&dollar;94,900,000',
-    'us&dollar;942,500,000',
-    'us&dollar;949,440',
-    'us&dollar;95',
-    'us&dollar;95,700',
-    'us&dollar;950,000',
-    'us&dollar;96,000,000',
-    'us&dollar;967,000',
-    'us&dollar;969',
-    'us&dollar;97,000',
-    'us&dollar;97,500',
-    'us&dollar;970,400,000',
-    'us&dollar;976',
-    'us&dollar;977,000,000',
     'us&dollar;98,000',
-    'us&dollar;98,600,000',
-    'us&dollar;98.6',
-    'us&dollar;987',
-    'us&dollar;987,317,000',
-    'us&dollar;988',
-    'us&dollar;988,000,000',
-    'us&dollar;990',
-    'us&dollar;billions',
-    'us&dollar;million',
-    'us&dollar;o.5',
-    'us&dollar=&pound;0.5963',
-    'us&lsqb;1,836m)',
-    'us&lsqb;1,990m',
-    'us&lsqb;55m',
-    'us&mdash',
     'us&mdash;socialist',
-    'us&mdash;well',
-    'us&ndash;asian',
-    'us&rehy;and',
-    'us-',
-    'us-administered',
-    'us-air',
-    'us-biased',
-    'us-british',
-    'us-can',
-    'us-chaired',
-    'us-chilean',
-    'us-china',
-    'us-chinese',
-    'us-colombian',
-    'us-constructed',
     'us-donated',
-    'us-educated',
-    'us-english',
-    'us-equipped',
-    'us-euro',
-    'us-finished',
-    'us-funded',
-    'us-government-funded',
-    'us-govt',
-    'us-hong',
-    'us-imposed',
-    'us-initiated',
-    'us-iraq',
-    'us-leased',
-    'us-licensed',
-    'us-me',
     'us-mediated',
-    'us-mexico',
-    'us-netherlands',
-    'us-new',
-    'us-ophiles',
-    'us-organized',
-    'us-orientated',
-    'us-oriented',
-    'us-pakistan-backed',
-    'us-panama',
-    'us-philippines',
-    'us-quoted',
-    'us-recognized',
-    'us-romanian',
-    'us-russia',
-    'us-saudi',
     'us-settled',
-    'us-spanish',
-    'us-specification',
-    'us-supervised',
-    'us-this',
-    'us-to',
-    'us-turkey',
-    'us-ussr',
-    'us.it',
-    'us.many',
-    'us.now',
-    'us.the',
-    'us/are',
-    'us/european',
-    'us/japan',
-    'us/japanese',
     'us/nz',
-    'us/our',
-    'us/russian',
-    'us/sas',
-    'us/swiss',
-    'us/the',
-    'us/ussr',
-    'us/with',
-    'us1.00=6.0398',
-    'us18227',
-    'us469,000',
-    'us48,100',
-    'us75lucy',
-    'us87',
-    'us_any',
-    'usa&ndash;canada',
     'usa-built',
-    'usa-dominated',
-    'usa-in',
-    'usa-japan',
-    'usa-style',
-    'usa-trips',
-    'usa-uk',
-    'usa.2',
-    'usa/1989/colour/101',
-    'usa/brazil',
-    'usa/france',
-    'usa/nasa',
-    'usa1.94',
-    'usa94',
-    'usaaf/usaf',
-    'usable-film',
     'usafa',
-    'usaff',
-    'usage-based',
-    'usage-related',
-    'usage.',
-    'usagers',
-    'usakan',
-    'usana',
-    'usance',
-    'usas',
-    'usasshole',
-    'usbaq',
-    'usbekistan',
-    'usc-sponsored',
-    'uscea',
-    'uschi',
     'usdahl',
-    'usdau',
-    'usdp',
-    'use&rehy;fully',
-    'use(s)',
-    'use-',
-    'use--claim',
-    'use-by',
-    'use-classes',
-    'use-life',
-    'use-rates',
-    'use-related',
-    'use-rights',
-    'use-situation',
-    'use-stress',
-    'use-wysiwyg',
     'use.',
-    'use/environmental',
-    'use/non-use',
-    'use/planning',
-    'use/read',
-    'use/to',
-    'use/twin',
-    'use/used',
-    'use_so',
-    'useage',
-    'usecure',
-    'used-',
-    'used-by',
-    'used-camera',
-    'used-looking',
-    'used.mainly',
     'used.transaction',
-    'used/',
-    'used/disclosed',
-    'used/vintage',
-    'used_in_conjunction',
-    'used_so_much',
-    'usedfor',
-    'usedta',
-    'usedul',
-    'usedup',
-    'useexist',
-    'usefu',
-    'useful-but-dull',
-    'useful/useless',
-    'usefulness.',
-    'usefulness/uselessness',
     'useles',
-    'useless-information',
-    'uselss',
-    'user&mdash;given',
-    'user&mdash;name',
-    'user-address',
-    'user-adjustable',
-    'user-attractive',
-    'user-awareness',
-    'user-banded',
-    'user-base',
-    'user-catalogue',
-    'user-charges',
-    'user-created',
-    'user-customisable',
-    'user-dependent',
     'user-designed',
-    'user-helping',
-    'user-initiated',
-    'user-intermediary',
-    'user-involvement',
-    'user-manual',
-    'user-miles',
-    'user-modifiable',
-    'user-of-the-year',
-    'user-producer',
-    'user-rather',
-    'user-ratings',
-    'user-requests',
-    'user-servicing',
-    'user-subcultures',
-    'user-tailorable',
     'user-to-user',
-    'user.aa',
-    'user.pre',
-    'user.res',
-    'user.s01',
-    'user.s02',
-    'user.s03',
-    'user.s04',
-    'user.s05',
-    'user.s06',
-    'user.s07',
-    'user.s08',
-    'user.s09',
-    'user.s10',
-    'user/',
-    'user/authority',
     'user/carer-practitioner',
-    'user/friendly',
-    'user/module',
-    'user/module/dc',
-    'user/preset',
-    'user/provider',
-    'user/user',
-    'user:the',
-    'usergroups',
-    'userinterface',
-    'userkit',
-    'username/password',
-    'users-2.8:1',
-    'users-particularly',
-    'users/',
-    'users/consultative',
     'usership',
-    'usertl.exe',
-    'uses-management',
-    'usest',
-    'useta',
-    'usetab',
-    'usf',
-    'usgovernment',
-    'ushabti',
-    'ushak',
-    'ushare',
-    'usher-smart',
-    'usherette-style',
-    'usherette/narrator',
-    'usherettes/ice-cream',
-    'ushers/usherettes',
     'usherwood/consultant',
-    'ushewokunze',
-    'ushshaq',
-    'usin',
-    'usine',
-    'using(6.24)',
-    'using-the',
-    'using.wood',
-    'using/disclosing',
-    'usinor',
-    'usint.crl',
-    'usit&eacute',
-    'usitatissimum',
-    'usix',
-    'usk-ilimsk',
-    'uski',
     'uskmouth',
-    'uskok',
-    'usl&eacute',
-    'usl-endorsed',
-    'usl-novell',
-    'usl-specified',
-    'usl/univel',
-    'uslar',
-    'usless',
-    'uslp',
-    'uslw',
-    'usm-listed',
-    'usm/fully',
-    'usmane',
-    'usmarc',
-    'usmon',
     'usncc-nas',
-    'usnea-andreaea',
-    'usno-controlled',
-    'usproc.crl',
-    'usque',
-    'usroh',
-    'usrprv.qry',
-    'uss&iacute;a',
-    'ussel',
-    'ussf/lldb',
-    'ussr-romania',
-    'ussr-russia',
-    'ussr-russian',
-    'ussr/cis',
-    'ussr/israeli',
-    'ussr/italian',
     'usss',
-    'ust&aacute;riz',
-    'ust&iacute',
-    'ustachis',
-    'ustad',
-    'ustain',
-    'ustan',
-    'ustane',
-    'ustaritz',
-    'ustashi',
-    'ustashis',
-    'usteristrasse',
-    'usthinks',
-    'ustipraca',
-    'usua',
-    'usual&mdash;we',
     'usual-story',
-    'usually-amusing',
-    'usually/sometimes/never',
-    'usualy',
-    'usuarios',
-    'usum',
-    'usumah',
-    'usuricultivateurs',
-    'ut&ndash;2',
-    'utagawa',
-    'utara',
-    'utatur',
-    'utca',
-    'utchanah',
-    'utd2',
-    'utd7s',
     'utell',
-    'utensills',
-    'utensils:rubbish-filled',
-    'uterosacral',
-    'utheris',
-    'utherwise',
-    'uthority',
-    'utica/st',
-    'utiel',
-    'util',
-    'utilex',
-    'utili&rehy;tarians',
-    'utilisable',
-    'utilisateurs',
-    'utilisations',
-    'utilitarian-inspired',
     'utilitarian.',
-    'utility-creating',
-    'utility-maximising',
-    'utility-they',
-    'utility-webbing',
-    'utility.',
-    'utility/price',
-    'utilizable',
-    'utils',
-    'utin',
-    'utland',
-    'uto-kulm',
-    'utopia(1516)',
-    'utopian-sounding',
-    'utopian.',
-    'utopianist',
     'utopianizing',
-    'utoxeter',
-    'utrainen',
-    'utraque',
-    'utraquist',
-    'utricularia',
-    'utsinmalikin',
-    'utsire',
-    'utstein',
-    'utsumi',
-    'utsunomiya',
-    'utsuri',
-    'utt',
-    'uttambhai',
-    'uttarkashi',
-    'utterance-',
     'utterance-acts',
-    'utterance-in-context',
-    'utterance-products',
-    'utterance-tokens',
-    'utterance-types',
-    'utterances-that',
-    'utteridge',
-    'utterly-spoiled',
-    'utterness',
-    'utterwords',
-    'uttlesbury',
-    'uttmost',
-    'uttoxeter-burton',
-    'utuk',
-    'utula',
-    'utva&ndash;66',
     'uuc',
-    'uucp',
-    'uudecode',
-    'uuencoded',
-    'uuummmm',
-    'uuuniitedd',
-    'uuup',
-    'uuurgh',
-    'uuuuuugggh',
-    'uv&ndash;16&ndash;57',
-    'uv+',
-    'uv-',
-    'uv-975',
-    'uv-activated',
-    'uv-c',
-    'uv-doped',
     'uv-excited',
-    'uv-to-visible',
-    'uv/ebc',
-    'uv/visible',
-    'uvas',
-    'uvea',
-    'uvep',
-    'uverova',
-    'uvf/uff',
-    'uvo',
-    'uvomorulin',
-    'uvp',
-    'uvre',
-    'uvulopalatopharyngoplasty',
-    'uvver',
-    'uvvy',
     'uwais',
-    'uwatec',
-    'uwchaled',
-    'uwchradd',
-    'uwe&rehy;wilhelm',
-    'uwe-jens',
-    'uwe-wilhelm',
-    'uwirt',
-    'ux-ux-what',
-    'uxacona',
-    'uxb',
-    'uxelles',
-    'uxi',
-    'uxkidisfumdkudxi',
-    'uxor',
-    'uxori',
     'uxoricidal',
-    'uxorilocal',
-    'uxoriously',
-    'uxp/ds',
-    'uxp/vpp',
-    'uxxyz',
-    'uyanik',
-    'uye',
-    'uyeda',
-    'uyeno',
-    'uyger',
-    'uygurs',
-    'uyle',
-    'uys',
-    'uyun',
-    'uzala',
     'uzbeck',
-    'uzbek-run',
-    'uzbeki',
-    'uzc&aacute;tegui',
-    'uzelac',
-    'uzell',
-    'uzerche',
-    'uzeste',
-    'uzh',
-    'uzi-o-gram',
-    'uzina',
-    'uzochukwu',
-    'uzumlu',
-    'uzun',
-    'uzzda',
-    'uzzel',
     'uzzia',
-    'uzzis',
-    'v&aacute;monos',
-    'v&aacute;quez',
-    'v&aacute;rgas',
-    'v&aacute;squezjustice',
-    'v&amp;a/royal',
-    'v&amp;m',
-    'v&amp;r',
-    'v&auml&auml;n&auml;nen',
-    'v&auml;sby',
-    'v&auml;ster&aring;s',
-    'v&auml;ttern',
-    'v&circ',
-    'v&eacute;four',
-    'v&eacute;ra',
     'v&eacute;ritable',
-    'v&eacute;zinaminister',
-    'v&ecirc;tement',
-    'v&lsqb;incent&rsqb',
-    'v&ndash;1',
-    'v&ndash;ill',
-    'v&ndash;x',
-    'v&ocirc;tre',
-    'v&ouml;gelf&auml;nger',
-    'v&ouml;kischer',
-    'v&ouml;lk',
-    'v&ouml;lkerkunde',
-    'v&ouml;lkischer',
-    'v&ouml;mel',
-    'v&rehy;struts',
-    'v(0)',
     'v(p)',
-    'v+',
-    'v+h',
-    'v-(d)-j',
-    'v-1000',
-    'v-1650-7',
-    'v-1710',
-    'v-1710-47',
-    'v-77',
-    'v-a-t',
-    'v-baffles',
-    'v-based',
-    'v-block',
-    'v-compatible',
-    'v-day',
-    'v-e-r-n',
     'v-e-r-y',
-    'v-ed',
-    'v-for-vengeance',
-    'v-force',
-    'v-genes',
-    'v-grooved',
-    'v-h12',
-    'v-l',
-    'v-m',
-    'v-mail',
-    'v-onc',
-    'v-perforations',
-    'v-point',
-    'v-profile',
-    'v-reading',
-    'v-registered',
     'v-rocket',
-    'v-rod',
-    'v-slots',
-    'v-specific',
-    'v-systems',
-    'v-t',
-    'v-u',
-    'v-v-very',
-    'v-ven',
-    'v-vii',
-    'v.&ndash;as',
-    'v./application',
-    'v.106',
-    'v.12',
-    'v.18',
-    'v.18/19',
     'v.19',
-    'v.2.2',
-    'v.2.21',
-    'v.2.32',
-    'v.2/3',
-    'v.22bis',
-    'v.26',
-    'v.28',
-    'v.3-based',
-    'v.3.2-level',
-    'v.3.2.5',
-    'v.3.4',
-    'v.3/v.4',
-    'v.32/v.32bis',
-    'v.3225l',
-    'v.3227l',
     'v.3229l',
-    'v.32l',
-    'v.4.0.4',
-    'v.4.1es',
-    'v.4.1es-based',
-    'v.4/5',
-    'v.4/smp',
-    'v.42',
-    'v.42/mnp2-4',
-    'v.42bis',
-    'v.42bis/mnp5',
-    'v.44',
-    'v.45',
-    'v.9',
-    'v.92',
-    'v.a.c',
     'v.burali',
-    'v.corbett',
-    'v.d.l.',
-    'v.d.u.s',
-    'v.etc.',
-    'v.fast',
-    'v.g.h.',
-    'v.government',
-    'v.grad',
-    'v.herrington',
-    'v.i.106ff',
-    'v.i.11&ndash;22',
-    'v.i.121ff',
-    'v.i.126f',
-    'v.i.185ff',
-    'v.i.328ff',
     'v.i.39ff',
-    'v.i.62ff.',
-    'v.i.6ff.',
-    'v.i.9f.',
-    'v.i.l.',
-    'v.i.p',
-    'v.i.p.lounge',
-    'v.ii-ix',
-    'v.ii.17',
-    'v.ii.253f',
-    'v.ii.289f.',
-    'v.ii.303f',
-    'v.ii.304f.',
-    'v.ii.40',
-    'v.ii.484ff.',
-    'v.iii',
     'v.iii.',
-    'v.iii.118&ndash;206',
-    'v.iii.238ff',
-    'v.iii.83ff',
-    'v.iv.125f',
-    'v.iv.72&ndash;83',
-    'v.jenkins(1877)5ch.d.',
-    'v.l.',
-    'v.lawrence',
-    'v.m.',
-    'v.m.k.',
-    'v.mini-enterprise',
-    'v.o.n.',
-    'v.p.hill',
-    'v.rev',
-    'v.s',
     'v.s.s.',
-    'v.sexy',
-    'v.v.c.',
-    'v.vii.',
-    'v/',
-    'v/2',
-    'v/2r',
-    'v/88',
-    'v/d',
-    'v/mls',
-    'v/n',
-    'v/v/v',
-    'v/vi',
-    'v1.11',
-    'v1.5',
-    'v1.6',
     'v1.x',
-    'v100',
-    'v111',
-    'v12-cylinder',
-    'v12-powered',
-    'v12-style',
-    'v125',
-    'v12s',
-    'v14',
-    'v147',
-    'v16\'s',
-    'v16-engined',
-    'v163',
-    'v16s',
-    'v16t',
-    'v173',
     'v2\'s',
-    'v2.1',
-    'v2.3',
-    'v24',
-    'v286m',
-    'v2p2',
-    'v2p6',
-    'v2p6z',
-    'v3.1',
-    'v3.1.4',
-    'v30hl',
-    'v31',
-    'v3100',
-    'v32bis',
-    'v32intfc',
-    'v3978',
     'v3aa139874',
-    'v4&ndash;5.',
-    'v42bis/mnp5',
-    'v45',
-    'v486mx',
-    'v496mx',
-    'v5.0',
-    'v5.2',
-    'v52',
-    'v6\'s',
-    'v6-powered',
-    'v60',
-    'v62',
-    'v634/6',
-    'v6427',
-    'v6460',
     'v6691',
-    'v670',
-    'v6rxe',
-    'v700',
-    'v7072',
-    'v7114',
-    'v7115',
-    'v7121',
-    'v7340',
-    'v7358',
-    'v7365',
-    'v7370',
-    'v7418.',
-    'v7472',
-    'v7474',
-    'v7493',
     'v7495',
-    'v7548',
-    'v7670',
-    'v7671',
-    'v7731',
-    'v7768',
-    'v8&ndash;14',
-    'v8-specific',
-    'v8.',
-    'v8.21',
-    'v86m',
-    'v9-compliant',
-    'v9300',
-    'v=',
-    'v=16',
-    'v=2xy',
     'v=d/t',
-    'v=g+c+e',
-    'va&ccaron;e',
-    'va&rcaron;en&eacute',
-    'va\'na',
-    'va-',
-    'va-350',
-    'va-cherie',
-    'va-cunt',
-    'va-nu-pieds',
-    'va-va-voom',
-    'va-wa',
-    'va:z',
-    'vaagon',
-    'vaagsfjord',
-    'vab',
     'vacancy-sheet',
-    'vacant-faced',
-    'vacarius',
-    'vacationed',
-    'vacationers',
-    'vacca',
-    'vaccenic',
-    'vaccin',
-    'vaccina',
-    'vaccine-preventable',
-    'vaccine-related',
-    'vaccine/damaged',
-    'vaccinia-rabies',
-    'vacciniacae',
-    'vacciniums',
-    'vaccino',
     'vaccins',
-    'vaccum',
-    'vaccuum',
-    'vacent',
-    'vachell',
-    'vacherin',
-    'vacillation.',
-    'vacilus',
-    'vacinations',
-    'vacublotting',
-    'vacularisation',
-    'vaculik',
-    'vacum',
-    'vacuolar',
-    'vacuolated',
-    'vacuolations',
     'vacuolisations',
-    'vacuous-looking',
-    'vacutainers',
-    'vacuum-assisted',
-    'vacuum-dried',
-    'vacuum-imbedded',
-    'vacuum-like',
-    'vacuum-packing',
-    'vacuum-sealed',
-    'vacuum.',
-    'vacuum.cleaning',
-    'vacuus',
-    'vad&eacute;m&eacute;cum',
-    'vad0se',
-    'vadar',
-    'vade-mecums',
     'vadeen',
-    'vadep',
-    'vader/peers',
-    'vadiamians',
-    'vadianstrasse',
-    'vadigamangama',
-    'vadin',
-    'vadinamaina',
-    'vads',
-    'vaerlose',
-    'vaernes',
-    'vaessen',
-    'vaf',
-    'vagabone',
-    'vagaboundes',
-    'vaganian',
     'vagas',
-    'vagelos',
-    'vaghi',
-    'vagi',
-    'vaglieri',
-    'vagly',
-    'vagna',
-    'vagniacae',
-    'vago',
-    'vago-bagal',
-    'vago-vagal',
-    'vagrant-strewn',
-    'vagris',
-    'vagrius',
-    'vague-sided',
-    'vagueries',
     'vahimagi',
-    'vahit',
-    'vai-',
-    'vai-gene',
-    'vaiani',
-    'vaifale',
-    'vaihtoehto',
-    'vailima',
-    'vailland',
-    'vaimilihealth',
-    'vaincrons',
-    'vaingloriously',
-    'vainisi',
-    'vainty',
-    'vair&amacr;gya',
-    'vair\'soon',
     'vaire',
-    'vairimorpha',
-    'vaiser',
-    'vaishnavism',
-    'vaishyas',
-    'vaisnavism',
-    'vaisvila',
-    'vaisyan',
-    'vaitiekunas',
-    'vajacic',
-    'vajen',
-    'vajk',
-    'vajolet',
-    'vajrathon',
-    'vak',
-    'vakatora',
     'vakaturaga',
-    'vakavulewa',
-    'vakifs',
-    'vakil',
-    'vakili',
-    'val-d\'isere',
-    'val/tignes',
-    'val87',
-    'valaable',
-    'valance/sack',
-    'valanginien',
-    'valaquenta',
-    'valastro',
-    'valat',
-    'valauation',
-    'valayer-coster',
     'valbray',
-    'valbruna',
-    'valcourtemployment',
-    'vald&egrave;s',
-    'valdamo',
-    'valdarno',
-    'valdecir',
-    'valdemaras',
-    'valdepe&ntilde;as',
-    'valderama',
-    'valderrabano',
-    'valdettaro',
-    'valdezes',
-    'valdimarsson',
-    'valdiva',
-    'valdiveso',
     'valdiz&aacute;n',
-    'valdonega',
-    'valdor',
-    'valdorf-hansen',
-    'valdostana',
-    'valdres',
-    'valdus',
-    'vale/oxfordshire',
-    'valebjorg',
-    'valech',
-    'valee',
-    'valehouse',
-    'valekh',
-    'valen&ccedil;a',
-    'valencc',
-    'valence-level',
     'valence-valence',
-    'valence-virtual',
-    'valenced',
-    'valencies.',
-    'valensi',
-    'valenstein',
-    'valentian',
-    'valentim',
-    'valentin-hansen',
-    'valentine-ish',
-    'valentiner',
-    'valentinism',
-    'valentino.',
-    'valentinus',
-    'valentir',
-    'valentr&eacute',
     'valenza',
-    'valeriana',
-    'valeriani',
-    'valerie/motherwell',
-    'valeries',
-    'valerionas',
-    'valerosi/rossi',
-    'valery-sur-somme',
-    'valesciano',
-    'valescu',
-    'valesios',
-    'valetin',
-    'valgay',
-    'valgus',
-    'valhallas',
-    'valheim',
     'valheins',
-    'vali',
-    'valia',
-    'valiahd',
-    'valian',
-    'valianat',
-    'valiant-for-truth',
-    'valibus',
-    'valid&mdash;message',
-    'valid-and',
-    'validation/moderation',
-    'validation/review',
-    'validatlon',
-    'validator',
-    'validdate',
-    'valide',
     'validifiable',
-    'validify',
-    'validition',
-    'validov',
-    'valie',
-    'valima',
-    'valinomycin',
-    'valinorean',
-    'valios',
-    'valises',
-    'valium-addicted',
-    'valiums',
-    'valjas',
-    'valjean',
-    'valjevo',
-    'valkaries',
     'valkenberg',
-    'valkenburg',
-    'valko',
-    'valkus',
-    'valkyrian',
-    'vall&eacute',
-    'vall&eacute;s',
-    'vallabhbhai',
-    'vallais',
-    'vallalat',
-    'vallan',
-    'vallarino',
-    'vallat',
-    'vallayer-coster',
-    'valle-bloaise',
-    'vallecano',
     'vallelunga',
-    'vallely(penguin)',
-    'vallenari',
-    'vallence',
-    'vallence/gloucestershire',
-    'vallender',
-    'vallet',
-    'valleti',
-    'valletort',
-    'vallettas',
-    'vallettus',
-    'valleu',
-    'valley&ndash;lake',
-    'valley\'',
-    'valley-bottom',
-    'valley-floor',
     'valley-gutters',
-    'valley-mouth',
-    'valley-skiing',
-    'valley-wide',
-    'valley/blyth',
-    'valleyer',
-    'valleys.',
-    'valleys/',
-    'vallicella',
-    'vallin',
-    'vallombrosa',
-    'valluga',
-    'vallum',
-    'valmasino',
-    'valmer',
-    'valmik',
     'valmonde',
-    'valmost',
-    'valmouth',
-    'valonia',
-    'valora',
-    'valore',
-    'valori',
-    'valorisations',
-    'valorise',
-    'valorized',
-    'valorously',
-    'valorplast',
-    'valors',
-    'valorum',
-    'valours',
-    'valpeda',
     'valproic',
-    'vals&eacute;es',
-    'valsad',
-    'valse-scherzo',
-    'valsella',
-    'valseuses',
-    'valsler/thames',
-    'valspeak',
-    'valtellinese',
-    'valter',
-    'valtin',
-    'valu',
-    'valua',
-    'valuable/key',
-    'valuables.',
-    'valuables/money/travellers',
     'valuates',
-    'valuation-the',
-    'valuation/technical',
-    'value&mdash;or',
-    'value&rehy;system',
-    'value-added-tax',
-    'value-adders',
-    'value-cluster',
-    'value-component',
-    'value-consensus',
-    'value-dependent',
-    'value-driven',
-    'value-education',
-    'value-facts',
-    'value-for',
-    'value-for-calories',
     'value-for-us',
-    'value-for-weight',
-    'value-in-itself',
-    'value-increasing',
-    'value-loaded',
-    'value-matching',
-    'value-maximizing',
-    'value-must',
-    'value-positions',
-    'value-rational',
-    'value-related',
-    'value-ridden',
-    'value-some',
-    'value-spheres',
-    'value-standpoints',
-    'value-subtracting',
     'value-subtractor',
-    'value.',
-    'value.engineering',
-    'value/low',
-    'value/pair',
-    'value/price',
-    'value=0.83',
-    'value=two',
-    'valued-based',
-    'valued.',
-    'valued0added',
-    'valuelessness',
-    'valuer.',
-    'valuers/experts',
-    'valuers/surveyors',
-    'values-added',
     'values-based',
-    'values-system',
-    'values/',
-    'values/traditional',
-    'values=',
-    'valuesfor',
-    'valupoint',
-    'valuta',
-    'valutta',
-    'valvatne',
-    'valve-gear',
-    'valve-making',
-    'valve-trumpet',
-    'valve/solid-state',
-    'valves-per-cylinder',
-    'valvesprings',
     'valville',
-    'valving',
-    'valvona',
-    'valvoplasty',
-    'valya',
-    'valzoldana',
-    'vambery',
-    'vamoussa',
-    'vamped',
-    'vampira',
-    'vampirella',
-    'vampirish',
-    'vampirized',
-    'vampyre',
-    'vampyrus',
-    'van&rehy;his',
     'van-boy',
-    'van-d&uacute;nemplanning',
-    'van-dals',
-    'van-driving',
-    'van-equipped',
-    'van-haul',
-    'van-hear',
-    'van-helten',
-    'van-makers',
-    'van-making',
-    'van-sized',
-    'van-style',
-    'vanable',
-    'vanadiferous',
-    'vanadinite',
-    'vanatu',
     'vanbrugh-hawksmoor-archer',
-    'vanburgh',
-    'vance/owen',
-    'vancel',
-    'vanchetti',
-    'vancil',
-    'vancliff/shelter',
-    'vancomycin',
-    'vanconti',
-    'vancouer',
-    'vancouleurs',
-    'vancouver-fraser',
-    'vandal-plagued',
-    'vandal-resistant',
-    'vandalic',
-    'vandaline',
     'vandalisation',
-    'vandalised-though',
-    'vandalism.',
-    'vandalisms',
-    'vandalist',
-    'vandamme',
-    'vandanesse',
-    'vandeburg',
-    'vandekamer',
-    'vandelia',
-    'vandelsborg',
-    'vandenbroeck',
-    'vandenbroucke',
-    'vandenburg',
-    'vandenesse',
-    'vandenvenn',
     'vandepoel',
-    'vander-molen',
-    'vander-veken',
-    'vanderbank',
-    'vanderfield',
-    'vanderlyn',
-    'vandersteen',
-    'vandersteen/family',
-    'vandertoorn',
-    'vandervent',
-    'vandervilles',
-    'vanderwoude-tananbaum',
-    'vanderwoude-tannenbaum',
-    'vanderwouds-tannenbaum',
-    'vandewiele',
-    'vandjnana',
     'vandoeuveres',
-    'vandome',
-    'vandonselaar',
-    'vandro',
-    'vandy',
-    'vandyke-prince',
-    'vandykes',
-    'vane-tempest',
-    'vanegas',
-    'vaneigen',
-    'vanersborg',
-    'vaness',
-    'vangard',
-    'vangjel',
-    'vanglemesht',
-    'vanguard-class',
     'vanguardism',
-    'vanguardist',
-    'vanguardists',
-    'vanha',
-    'vanhattan',
-    'vanhengel',
-    'vanhove',
-    'vanie',
-    'vanilla-',
-    'vanilla-flavoured',
-    'vanilla-like',
-    'vanilla-nosed',
-    'vanilla-scented',
-    'vanilla-tasting',
-    'vanilla/chocolate',
-    'vanille',
     'vanillin-sweet',
-    'vanillylmandelic',
-    'vaniscotte',
-    'vanish.',
-    'vanishers',
-    'vanit&eacute',
-    'vanitees',
-    'vanitie',
-    'vanity-unit',
-    'vanity/apollonia',
-    'vankashin',
-    'vanke',
-    'vanloads',
-    'vanna',
-    'vanner/metropolitan',
-    'vanneste',
     'vanni',
-    'vannin',
-    'vanning',
-    'vanno',
-    'vannona',
-    'vannozzi/nupe',
-    'vanns',
-    'vanquisher',
-    'vanquishers',
-    'vanquishes',
-    'vanrisamburgh',
-    'vanroch',
-    'vansant',
-    'vansittartism\'',
-    'vantages',
-    'vantaux',
     'vanting',
-    'vantongerloo',
-    'vants',
-    'vanupied',
-    'vanwall.',
-    'vanzie',
-    'vap',
-    'vap/vp',
-    'vapheio',
-    'vaphio',
-    'vaphres',
-    'vaponics',
-    'vaporariorum',
-    'vaporizes',
-    'vaporizing',
-    'vapour-resistant',
     'vapour-transport-grown',
-    'vapouring',
-    'vapourings',
-    'vapourised',
-    'vapouriser',
-    'vapourisers',
-    'vapourises',
-    'vapourization',
-    'vapourized',
-    'vapourizing',
-    'vapours.',
-    'vapourwearers',
-    'vaprio',
-    'vaprk',
-    'vaps',
-    'vaqueros',
     'vaquitas',
-    'var&eacute',
-    'var&egrave;se',
-    'var&lsqb',
-    'var&lsqb&bgr&rsqb',
-    'var&lsqb;n&rsqb',
-    'var(x)',
-    'var:p',
-    'vara&zcaron;din',
-    'varaflame',
-    'varahwear',
-    'varajet',
-    'varallo',
-    'varanasi&ndash;kathmandu',
-    'varangerfjord',
-    'varangeville',
     'varangians',
-    'varas',
-    'varassi',
-    'varathan',
-    'varawalla',
-    'varazdin',
-    'varcoe',
-    'vard',
-    'vard&oslash',
-    'vardarac',
-    'vardharaja',
-    'vardhates',
-    'vardos',
-    'vare',
-    'varea',
-    'vareid',
     'varennes',
-    'varens',
-    'varey',
-    'vargaftig',
-    'vargha-khadem',
-    'varghese',
-    'vargol',
-    'vari&eacute;s',
-    'vari&rehy;ous',
-    'vari-eze',
-    'vari-ously',
-    'vari-speed',
-    'vari-width',
-    'variability.',
-    'variable(s)',
-    'variable-area',
     'variable-focus',
-    'variable-geometry',
-    'variable-grained',
-    'variable-heat',
-    'variable-interest',
-    'variable-ratio',
-    'variable-sided',
-    'variable-social',
-    'variable.length',
-    'variable/made',
-    'variables.x(t)',
-    'variably-expressed',
-    'variance*',
-    'variance=market',
-    'variant/schema',
-    'variation-say',
     'variation-variation',
-    'variation-writing',
-    'variation.',
-    'variation=2.5%',
-    'variation=2.7%',
-    'variationism',
-    'variations&mdash;as',
-    'variations.',
-    'varicella&rehy;zoster',
-    'varicocele',
-    'varied-strophe',
-    'varied.',
-    'varied/uniform',
-    'variegate',
-    'variegated-leafed',
-    'variegatis',
     'variegatus',
-    'varience',
-    'varies.',
-    'variet',
-    'varietie',
-    'varieties.',
-    'varified',
-    'varillas',
-    'varimax',
-    'varin',
-    'vario-elmar-r',
-    'varioations',
-    'variolation',
-    'variometers',
-    'variotyped',
-    'various-leaved',
     'various-shaped',
-    'various-sized',
-    'variously-sized',
-    'variously-styled',
-    'variousn',
-    'varitel',
-    'varium',
-    'variuos',
-    'varius',
-    'varlow',
-    'varmints',
-    'varmland',
-    'varnam',
-    'varnas',
-    'varnedoe',
-    'varnish-crinkled',
     'varnish-like',
-    'varnish-remover',
-    'varnishers',
-    'varo',
-    'varobaco',
-    'varone',
-    'varones',
-    'varosh',
-    'varosha',
-    'varossi',
-    'varrenikov',
-    'varroville',
-    'varry',
-    'vars.',
-    'vars=2',
-    'varseveld',
     'varsini',
-    'varsovia/tang',
-    'varsovians',
-    'varsovie',
-    'varssi',
-    'varta',
-    'vartan',
-    'varteg',
-    'vartry',
-    'vartu',
-    'varuna',
-    'varvic',
-    'varviso',
-    'varvitziotis',
-    'varwell',
-    'varx:r\'',
     'varxp\'',
-    'varxq\'',
-    'vary-between',
-    'vary:p',
-    'vary:q',
-    'varzeas',
-    'vasant',
-    'vascello',
-    'vascoendophilia',
-    'vasconcellos',
-    'vasconie',
-    'vasconselos',
-    'vasconstrictor',
-    'vascos',
-    'vascular-arbuscular',
-    'vascular-endothelial-cell',
     'vascularized',
-    'vasculart',
-    'vase-decorators',
-    'vase-drawing',
-    'vase-figures',
-    'vase-filled',
-    'vase-neck',
-    'vase-pictures',
-    'vasectomize',
-    'vasee',
-    'vasek',
-    'vaselin',
-    'vaseline-covered',
-    'vaseline-smeared',
-    'vaselino',
-    'vaselli',
     'vasemmistoliitto',
-    'vasif',
-    'vasijevic',
-    'vasil\'ev',
-    'vasilariovites',
-    'vasilas',
-    'vasilieva',
-    'vasilii',
-    'vasilio',
-    'vasiliou',
-    'vasilis',
-    'vasiliy',
-    'vasilyevich',
-    'vasilyevskiy',
-    'vaslav',
-    'vasnetsov',
     'vaso-occlusive',
-    'vasocactive',
-    'vasoconstricted',
-    'vasoconstricting',
-    'vasodilated',
-    'vasodilatory',
-    'vasomotion',
-    'vasopressor',
-    'vasorelaxants',
-    'vasorelaxing',
-    'vasotocin',
-    'vassaletti',
-    'vassaux',
-    'vassell',
-    'vassen',
-    'vasseur',
     'vassie',
-    'vassiere',
-    'vassignoria',
-    'vassilakas',
-    'vassilev',
-    'vassili',
-    'vassiliadis',
-    'vassilios',
-    'vassilou',
-    'vassoirs',
-    'vassos',
-    'vast-breasted',
-    'vasted',
-    'vasters',
-    'vastly-superior',
-    'vastness/',
     'vastokas',
-    'vastopol',
-    'vastra',
-    'vasty',
-    'vasu',
-    'vasuolation',
-    'vasymptomatic',
-    'vat-dyeing',
-    'vat-like',
-    'vat-only',
-    'vat-paid',
-    'vat.ii',
-    'vat/paye',
-    'vat=&pound;10.81',
-    'vatana',
-    'vatatebeda',
     'vatch',
-    'vatenen',
-    'vateriaus',
-    'vaterifloris',
-    'vaterite',
-    'vaterland',
-    'vathianos',
-    'vathouses',
-    'vathypetro',
-    'vatiation',
-    'vatican-italian',
-    'vatican-loyal',
-    'vatican.the',
-    'vatican/french',
-    'vaticana',
-    'vaticanist',
     'vatisker',
-    'vatnabrug',
-    'vatogomy',
-    'vatotomy',
-    'vatster',
-    'vatted',
-    'vatter',
-    'vatulele',
-    'vatuz',
-    'vaubernier',
-    'vauclusian',
-    'vauclusienne',
-    'vauclusiennes',
-    'vaud',
-    'vaudable',
-    'vaudancourt',
     'vaudemont',
-    'vaudesir',
-    'vaudevillean',
-    'vaudevillians',
-    'vaudois',
-    'vaudreuil',
-    'vaudrey',
-    'vaues',
-    'vaufreland',
-    'vaughan-thomas',
-    'vaughan/actor',
-    'vaughan/driver',
-    'vaughan/former',
-    'vaughan/singer',
-    'vaughan/snail',
-    'vaughan/wife',
     'vaughans',
-    'vaughanssaga',
-    'vaughni',
-    'vaughter',
-    'vaugirard',
-    'vaulin',
-    'vaulles',
-    'vault-like',
-    'vaulters',
-    'vaultlike',
-    'vauntest',
-    'vaunts',
-    'vaupes',
-    'vause',
-    'vaussieux',
-    'vauville',
     'vaux-le-vicomte',
-    'vaux-owned',
-    'vaux/oxfam',
-    'vauxhal',
-    'vauxhall-a',
-    'vauxhall-opel',
-    'vauxhall-rover',
-    'vauxhall-varajet',
-    'vauxhill',
-    'vauzelles',
-    'vav&rcaron;inec',
-    'vav&rcaron;ineck&eacute',
-    'vavirie',
-    'vavlova',
-    'vawt',
-    'vawter',
     'vax+axp',
-    'vax-cluster',
-    'vax-host/r3000-target',
-    'vax-only',
-    'vax-related',
-    'vax/node',
-    'vax/vme-based',
-    'vax/vms-based',
-    'vax750',
-    'vaxclusters',
-    'vaxft',
-    'vaxstations',
-    'vayas',
-    'vayda',
-    'vayehi',
-    'vayres',
     'vayrua',
-    'vazh',
-    'vazha',
-    'vb-v',
-    'vb.',
-    'vbl.',
-    'vc&ndash;10',
-    'vc-10',
-    'vc-1o',
-    'vc-7/v-1000',
-    'vc2300',
-    'vc3',
-    'vc4',
-    'vc5',
-    'vc5000',
-    'vc6',
     'vc7',
-    'vc8',
-    'vcam-1.',
-    'vce',
-    'vcehicles',
-    'vchristy',
-    'vci',
-    'vcitoria',
-    'vcjk808',
-    'vcp',
-    'vcpi',
-    'vcrkhovensky',
-    'vcs-successor',
-    'vcv',
-    'vd.',
-    'vda',
     'vdenotes',
-    'vdeo',
-    'vdew',
-    'vdk',
-    'vdmc',
-    'vdr',
-    'vdu12',
-    've-day',
-    've-ri-best',
-    've-ry',
-    've-versa',
-    'veal-pale',
-    'veall',
-    'veandercross',
-    'vearing',
-    'veart',
     'veary',
-    'veblenesque',
-    'veca',
-    'vecchi.',
-    'veche',
-    'vechernaya',
-    'vecherny',
-    'vechtstreek',
-    'vecino',
-    'veck',
-    'vecto',
-    'vectomov',
-    'vector&rehy;borne',
-    'vector&rehy;like',
-    'vector-avoidance',
-    'vector-based',
     'vector-boosted',
-    'vector-borne',
-    'vector-field',
-    'vector-operator',
-    'vector-potential',
-    'vector-processing',
-    'vector-producer',
-    'vector-specific',
-    'vector/two',
-    'vectorises',
-    'vectorscope',
-    'vectras',
-    'ved&amacr;nta',
-    'ved\'',
-    'vedantism',
-    'vedast',
     'vedat',
-    'veddahs',
-    'vedding',
-    'vedette',
-    'vedge',
-    'vedi',
-    'vedima',
-    'vedmore',
-    'vedova',
-    'vedra',
-    'vedrai',
-    'vedrana',
-    'veduta',
-    'vee-jay',
-    'veech',
-    'veeco',
     'veedeo',
-    'veeing',
-    'veejay',
-    'veel',
-    'veerapan',
-    'veerappa',
-    'veerkamp',
-    'veery',
-    'veestol',
-    'veezeet',
-    'vefour',
-    'veg\'',
-    'vega-built',
-    'vega/suicide',
-    'veganism',
-    'vegas&ndash;mammoth',
     'vegatali',
-    'vegatarian',
-    'vegation',
-    'vegcore',
-    'vegeburger',
-    'vegesack',
-    'veget-ables',
-    'vegeta',
-    'vegetable-derived',
-    'vegetable-garden',
-    'vegetable-like',
-    'vegetable-preparation',
-    'vegetable-rich',
-    'vegetal-inspired',
-    'vegetarain',
-    'vegetari',
     'vegetarian-quaker',
-    'vegetarian/wholefood',
-    'vegetarians/vegans',
-    'vegetates',
-    'vegetation-climate',
-    'vegetation-eaters',
-    'vegetation-hung',
-    'vegetation-rituals',
-    'vegetation/habitats',
-    'vegetation/wildlife',
-    'vegetbles',
-    'vegged',
-    'veggi',
-    'veggieburger',
-    'veggy',
-    'vegh',
     'veghel',
-    'vegitibbles',
-    'vegvari',
-    'veh/hr',
-    'vehan',
-    'vehbi',
-    'vehciles',
-    'vehi',
-    'vehicle-carrying',
-    'vehicle-checkpoints',
-    'vehicle-licence',
-    'vehicle-like',
-    'vehicle-loving',
-    'vehicle-parts',
-    'vehicle-soil',
-    'vehicle.the',
     'vehicles&mdash;or',
-    'vehicles/general',
-    'vehicles/population',
-    'vehicules',
-    'vehilce',
-    'veieroed',
-    'veil-and-trail',
-    'veil/polycotton',
-    'veila',
-    'veiled.',
-    'veilhan',
-    'veiligheid',
-    'veillard',
-    'veiltail',
-    'vein\'',
-    'vein-blood',
     'vein-fills',
-    'vein-scored',
-    'vein.',
-    'veinier',
-    'veinquartz',
-    'veins.',
-    'veinstone',
-    'veinstones',
-    'veinticinco',
-    'veinwork',
-    'veiny',
-    'veitata',
-    'veith',
-    'veiws',
-    'veiz',
-    'veja',
     'vejarano',
-    'vejce',
-    'vejle',
-    'vejrych',
-    'vejsiu',
-    'vejzovic',
-    'vekas',
-    'vekhi',
-    'vektor',
-    'velamine',
-    'velarisation',
-    'velasquezes',
-    'velayat-e-feqih',
-    'velazquez\'',
-    'velbert',
-    'velcome',
     'velcro-fastening',
-    'velcro-like',
-    'velcro-type',
-    'velda',
-    'velden',
-    'veldon',
-    'velds',
-    'velecky',
-    'veled',
-    'veleda',
-    'velehrad',
-    'velella',
-    'velem',
-    'velerisms',
-    'velicu',
-    'velika',
     'velikhov',
-    'velikhov&mdash;academician',
-    'veliki',
-    'velikii',
-    'velikov',
-    'velikovskianism',
-    'velikovskians',
-    'velin',
-    'velingrad',
-    'velizy',
-    'velizy-based',
-    'velizy-villacoublay',
-    'velk&aacute',
-    'velko',
-    'velkop&rcaron;evorsk&eacute',
-    'velkop&rcaron;evorsk&yacute',
     'velkov',
-    'velky',
-    'vell-dressed',
-    'vellaccio',
-    'velle',
-    'velleius',
-    'velleman/alcohol',
-    'velletri',
-    'vellibia',
-    'vellinga',
-    'vellore',
-    'velloso',
-    'vellottes',
-    'vellottes.',
-    'vells',
-    'vellum-bound',
     'vellum-covered',
-    'vellum-faced',
-    'vellve',
-    'velmans',
-    'velo-city',
-    'veloce',
-    'velocette',
-    'velocit&agrave',
-    'velocita',
-    'velocity-changing',
-    'velocity.',
-    'velocity=3.3',
-    'velokovskianism',
-    'velom',
-    'velompanahy',
-    'velopment',
     'velore',
-    'velos',
-    'velouria',
-    'velox',
-    'velsicol',
-    'velthoven',
-    'velthuijs',
-    'veltliner',
-    'veltman',
-    'veltri',
-    'velumbrella',
-    'velumyl',
-    'velut',
-    'velutus',
-    'velux-type',
-    'velva',
     'velvatone',
-    'velveret',
-    'velvet-',
-    'velvet-black',
-    'velvet-edged',
-    'velvet-finish',
-    'velvet-glove',
-    'velvet-mesh',
-    'velvet-smooth',
-    'velvet-soft',
-    'velvet-topped',
-    'velvet-voiced',
-    'velvet-warm',
-    'velvetbean',
-    'velveted',
-    'velvetine',
     'velveting',
-    'velvetly',
-    'velvets-type',
-    'velvety-brown',
-    'velvety-looking',
-    'velvety-red',
-    'velvety-rich',
-    'velvovski',
-    'vemdalen',
-    'veminous',
-    'ven\'son',
-    'ven-yusa',
-    'venables/henry',
-    'venables/sugar',
-    'venachar',
-    'venae',
     'venaissin',
-    'venaissin.',
-    'venaleck',
-    'venan&ccedil;io',
-    'venancia',
-    'venandi',
-    'venant',
-    'venanzio',
-    'venatrix',
-    'venda/gazankulu',
-    'vendage',
-    'vendee',
-    'vendettta',
-    'vendler',
-    'vendonnais',
-    'vendor\'',
     'vendor-dominated',
-    'vendor-focused',
-    'vendor-led',
-    'vendor-neutrality',
-    'vendor-recruitment',
-    'vendor/vendor',
-    'vendorprogram',
-    'vendors.',
-    'vendors/directors',
-    'vendramini',
-    'vends',
-    'vendu',
-    'venecio',
-    'venedelin',
-    'veneer-presses',
-    'veneer-thin',
     'veneerings',
-    'venefica',
-    'venefit',
-    'venerabili',
-    'venerably',
-    'veneral',
-    'venerande',
-    'venerandum',
-    'venere',
-    'venereable',
-    'venereally',
-    'veneris',
-    'veneroid',
-    'venesection',
-    'veneta',
-    'veneti',
     'venetian-occupied',
-    'venetiann',
-    'veneux-nadon',
-    'venez-vous',
-    'venezeula',
-    'venezuela&mdash;supported',
-    'venezuela*',
-    'venezuela-submitted',
-    'venezuela/colombia',
-    'venezuela/trinidad',
-    'venflon',
-    'vengance',
-    'vengeance-bent',
-    'vengeance-crazed',
-    'vengeance-taking',
-    'vengesai',
     'venging',
-    'vengloss',
-    'venice-',
-    'venice-simplon-orient-express',
-    'venice-where',
-    'veniceby',
-    'venices',
-    'venicoff',
-    'veniemus',
-    'venientium',
-    'venier',
-    'venieri',
-    'venimus',
-    'venini',
-    'venions',
-    'venirefaciatis',
     'venit',
-    'venix',
-    'venizelist',
-    'venkataraghavan',
-    'venkataramiah',
-    'venkatraman',
-    'venner/forestry',
-    'vennootschap',
-    'venny',
-    'veno-occlusive',
-    'venoconstrictive',
-    'venol',
-    'venom-carrying',
-    'venom-gland',
-    'venom-induced',
-    'venom-producing',
     'venomousness',
-    'venoocclusive',
-    'venour',
-    'vensorn',
-    'venstreparti',
-    'vent-a-layer',
-    'vent-a-matic',
-    'vent-axia',
-    'vent-gills',
-    'vent-hole',
-    'vent-line',
-    'vent-type',
-    'vent-ure',
-    'ventages',
-    'ventaglio',
-    'ventana',
     'ventateswaram',
-    'venterpost',
-    'ventidue',
-    'ventilated.',
-    'ventilation.4',
-    'ventilation/&micro;perfusion',
-    'ventilation/perfusion',
-    'ventilations',
-    'ventilator.',
-    'ventilatoren-fabrik',
-    'ventilin',
-    'ventive',
-    'ventless',
-    'ventor',
-    'ventracini',
-    'ventrale',
     'ventricini',
-    'ventricosa',
-    'ventriculocordectomy',
-    'ventriloqual',
-    'ventriloquise',
-    'ventriloquised',
-    'ventriloquism\'',
-    'ventriloquists',
-    'ventriuclar',
-    'ventrola',
-    'ventry',
-    'ventspils',
-    'ventura.pcx',
-    'ventura/vt600',
-    'venture.as',
-    'venture_such',
     'ventured.',
-    'venturelli',
-    'ventures.',
-    'venturi-tube',
-    'venturia',
-    'venturialise',
-    'venturino',
-    'venturism',
-    'venturously',
-    'venues.',
-    'venues/details',
-    'venule',
-    'venus-adonis',
-    'venus-earth',
-    'venusquake',
-    'venyamin',
     'venyew',
-    'venzuelan',
-    'vep&rcaron;ov&eacute',
-    'ver\'',
-    'ver-bal',
-    'ver-near',
-    'ver-ry',
-    'ver.a.bd.1',
-    'verae',
-    'verament',
-    'veramin',
-    'verancius',
-    'veranda-ed',
-    'verandah-ed',
-    'verandah-like',
-    'veranius',
     'verapaz',
-    'veras',
-    'veratrums',
-    'veray',
-    'verb&auml;nde',
-    'verb-initial',
-    'verb-stem',
-    'verb-subject',
-    'verb-with',
-    'verb/adjective',
-    'verbal-manual',
-    'verbal-motor',
-    'verbal-spatial',
-    'verbal.',
-    'verbaliser',
-    'verbalises',
     'verbalism',
-    'verballed',
-    'verbally-presented',
-    'verbally-trimmed',
-    'verband',
-    'verbania',
-    'verbascums',
-    'verbe',
-    'verbella',
-    'verbenas',
-    'verbindung',
-    'verbing',
-    'verbjorn',
-    'verbo',
-    'verbond',
-    'verbphrase',
     'verbraak',
-    'verbrechen',
-    'verbruggen',
-    'verbs/actions',
-    'verbunden',
-    'vercal',
-    'vercellina',
-    'verci',
-    'verclun',
-    'verd',
-    'verdancy',
-    'verdeans',
-    'verdelotto',
-    'verderame',
-    'verdeyen/teacher',
-    'verdi-gris',
     'verdict-reversals',
-    'verdicts.',
-    'verdicty',
-    'verdienstkreuz',
-    'verdieu',
-    'verdieusocial',
-    'verdit',
-    'verdon-like',
-    'verdonelle',
-    'verdonk',
-    'verdot',
-    'verdr&auml;ngung',
-    'verdross',
-    'verdugo-urquidez',
-    'verdurin',
-    'vere-hodge',
     'verehrung',
-    'vereinigtes',
-    'verellapublic',
-    'verendrye',
-    'vereshcbagina',
-    'verethraghna',
-    'verey/owner',
-    'verfassung',
-    'verfassungsbeschwerde',
-    'verfassungschutz',
-    'verfassungsschutzbericht',
-    'verfassungswidrig',
-    'verfassungswirklichkeit',
-    'verfilzung',
-    'verfremdungseffekt',
-    'verg',
     'verg&eacute',
-    'verg&egrave;s',
-    'vergarshei',
-    'verge-period',
-    'vergehen',
-    'vergeht',
-    'vergelegen',
-    'vergene',
-    'vergentis',
-    'vergessen',
-    'vergeze',
-    'vergilian',
-    'verginella',
-    'verginius',
-    'verglassed',
-    'vergleich',
     'vergnes',
-    'vergogna',
-    'vergote',
-    'verhaeghen',
-    'verhagen',
-    'verheugen',
-    'verhofstadt',
-    'verhulst',
-    'veri',
-    'veriability',
-    'verica',
-    'verical',
-    'verically',
-    'verificaci&oacute;n',
-    'verificationalist',
-    'verikios',
     'verilog',
-    'verisimilar',
-    'verisopht',
-    'verit&agrave',
-    'veritchev',
-    'veritec',
-    'verizoglu',
-    'verkade',
-    'verkaufstechnik',
-    'verkauft',
-    'verkehr',
-    'verkehrsb&uuml;ro',
-    'verkehrung',
-    'verkennes',
-    'verkerk',
-    'verkhoyansk',
     'verkl&auml;rte',
-    'verkl&auml;rung',
-    'verlags',
-    'verlagsgemeinschaft',
-    'verlaine-orientated',
-    'verlangen\'',
-    'verleger-arbeitskreis',
-    'verleumdung',
-    'verligtes',
-    'verlorene',
-    'verlucio',
-    'verm&ouml;genssteuer',
-    'vermaak',
-    'vermarkt',
-    'vermaseren',
-    'vermeerian',
     'vermeersch',
-    'vermeil',
-    'vermentino',
-    'vermes',
-    'vermes/oxford',
-    'vermeulen/oxfordshire',
-    'vermiculata',
-    'vermiculate',
-    'vermiculatus',
-    'vermifuge',
-    'vermiis',
-    'vermijs',
-    'vermilio',
-    'vermilion-lined',
-    'vermilioned',
-    'vermin&rehy;infested',
     'vermin\'',
-    'vermin-infested',
-    'vermin-killing',
-    'vermin-poles',
-    'vermine',
-    'vermittlungsausschuss',
-    'vermoegensverwaltungs',
-    'vermoral',
-    'vermorel',
-    'vermorels',
-    'vermouths',
-    'vermuelen',
-    'vernacularisms',
-    'vernacularized',
-    'vernadskii',
-    'vernalis',
     'vernand',
-    'vernear',
-    'verner',
-    'vernia',
-    'vernicos',
-    'vernie',
-    'vernior',
-    'vernon-hunt',
-    'vernone',
-    'vernor',
-    'vernot',
-    'verns',
-    'vernuft',
-    'vernunft',
-    'verny',
-    'verocchio',
     'verofa',
-    'veroica',
-    'veron',
-    'verona-born',
-    'verone',
-    'veronis',
-    'veronna',
-    'verow',
-    'verpflichtet',
-    'verpflichtung/frieden',
-    'verrai',
-    'verran',
-    'verray',
-    'verrazano',
-    'verre/boite',
-    'verreauxi',
     'verrechia',
-    'verree',
-    'verrei',
-    'verrett',
-    'verrine',
-    'verrri',
-    'verrucae',
-    'verrucivorus',
-    'vers-ion',
-    'versacad',
-    'versager',
-    'versaille',
-    'versailles-kitsch',
-    'versailles-style',
-    'versailles/',
-    'versality',
     'versamid',
-    'versand',
-    'verscace',
-    'verschaeve',
-    'verschoyle',
-    'verschuier',
-    'verschuren',
-    'verse-and-refrain',
-    'verse-autobiography',
-    'verse-contests',
-    'verse-epistle',
-    'verse-man',
-    'verse-movement',
-    'verse-scene',
-    'verse-sentence',
-    'verse-speakers',
     'verse-speaking',
-    'verse-specific',
-    'verse-styles',
-    'verse-tragedy',
-    'verse-translator',
-    'verse-tribute',
-    'verse-writing',
-    'verse.',
-    'verse/first',
-    'verse/swedish',
-    'verseatue',
-    'versent',
-    'verses.',
-    'versey',
-    'versfelt',
-    'vershinin',
     'versifications',
-    'versiliana',
-    'versillos',
-    'versines',
-    'version-centric',
-    'version-of',
-    'version.i',
-    'versioning',
-    'versions.',
-    'versiontool',
-    'versitile',
-    'versity',
-    'versn',
-    'verso/',
-    'versova',
-    'verst-eegee',
     'versta',
-    'verstand',
-    'verstandigung',
-    'versuchsanstalt',
-    'versus-evil',
-    'vert&ugrave',
-    'vert-galant',
-    'vertebrae-shattering',
-    'vertebral-body',
-    'vertebraria',
-    'verteidigungsa&uuml;ftrag',
-    'vertere',
-    'vertheuil',
-    'verti-kill-ar-tar',
-    'vertibrate',
-    'vertical-axis',
     'vertical-sided',
-    'vertical-slope',
-    'verticallata',
-    'vertically-angled',
-    'vertically-arranged',
-    'vertically-mounted',
-    'vertically-oriented',
-    'vertically-related',
-    'vertically-sliding',
-    'vertically-unchallenged',
-    'vertice',
-    'verticilli',
-    'vertigo-inducing',
-    'vertigos',
-    'vertinsky',
-    'vertisoft',
     'vertisol',
-    'vertol',
-    'vertoux',
-    'vertov',
-    'vertragt',
-    'vertrauensvotum',
-    'vertuoso',
-    'verucchio',
-    'veruela',
-    'verulam',
-    'verulamion',
-    'verum\'',
-    'verup',
-    'verve/scorpio',
-    'verveeay',
-    'verviers',
     'verwaayen',
-    'verwahrlosung',
-    'verwaltungsrecht',
-    'verwey',
-    'verwirret',
-    'verwoerdburg',
-    'verwood',
-    'verwundt',
-    'very-blue',
-    'very-deep',
-    'very-distant',
-    'very-hard-to-please',
-    'very-low-frequency',
-    'very-nearly',
-    'very-nicely-thank-you',
-    'very-quickly',
     'very-real',
-    'very-small-tree',
-    'very.few',
-    'very.large',
-    'veryard',
-    'veryexposed',
-    'verystrict',
-    'verzeichniss',
-    'verzeray',
-    'ves.',
-    'vesak',
-    'vescari',
-    'veselica',
-    'veselka',
-    'veshem',
-    'vesi-ku-lar-riya',
     'vesical',
-    'vesicalia',
-    'vesicaliaceae',
-    'vesicularization',
-    'vesil',
-    'vesion',
-    'vesko',
-    'vesper',
-    'vespula',
-    'vessailles',
-    'vessantara',
-    'vessel-cum-yacht',
-    'vessel-liquid',
-    'vessel/who',
-    'vessot',
-    'vesssel',
     'vest-pocket',
-    'vestals',
-    'vestberg',
-    'vested-interest',
-    'vestey/chairman/cheltenham',
-    'vestey/constituency',
-    'vestibulo-ocular',
-    'vestibuloacoustic',
-    'vestigials',
-    'vestitus',
-    'vestmann&aelig;yjar',
-    'vestors',
-    'vestrae',
-    'vestrfararv&iacute;sur',
-    'vestrique',
-    'vestrum',
     'vestrymen',
-    'vestutus',
-    'vesty',
-    'vesutor',
-    'vesuv',
-    'vetark',
-    'vetat',
-    'vetch-retch',
-    'vetea',
-    'veteran-cycle',
-    'veteran-dominated',
-    'veteranorum',
-    'veterinarianism',
-    'veterinary/health',
-    'vetheuil',
-    'vetiveria',
     'veto-proof',
-    'veto-wielding',
-    'vetoers',
-    'veton',
-    'vetorlank',
-    'vetranovi&cacute',
-    'vetrice',
-    'vetrie',
-    'vetro',
-    'vetroz',
-    'vets/pet',
-    'vetta/english',
-    'vettel',
-    'vetterlein',
-    'vettese',
-    'vettii',
     'vetulonia',
-    'vetyver',
-    'veuillot',
-    'veux-tu',
-    'vev',
-    'vevers',
-    'vewhicle',
-    'vewsof',
-    'vewy',
-    'vexant',
-    'vexedly',
-    'vexeth',
-    'vexillum',
-    'vextra',
-    'vey-is-mir',
-    'veyatie',
     'veyder-malberg',
-    'veyr',
-    'veyrines',
-    'veyron',
-    'vezarat-e',
-    'vezelay',
-    'vezelio',
-    'vezga',
-    'vezzi',
-    'vf-14',
-    'vf/cf',
-    'vf500',
-    'vfa-hco',
-    'vfd',
-    'vfl',
-    'vfq65',
     'vfr750f',
-    'vg.',
-    'vg1460',
-    'vga-bios',
-    'vga-compatible',
-    'vga-jongg',
-    'vga/mcga',
-    'vgpb',
-    'vgpw2',
-    'vgr',
-    'vgs',
-    'vh&ndash',
-    'vh&ndash;aqj/a17&ndash;26',
-    'vh&ndash;caa',
-    'vh&ndash;cdl',
-    'vh&ndash;czz',
     'vh-baf',
-    'vh-lao/0&ndash;38320',
-    'vh-sbo',
-    'vh-uth',
-    'vh-xxv',
-    'vh.there',
-    'vh/vl',
-    'vhf-fm',
-    'vhf-telephone',
-    'vhf/405',
-    'vhf/df',
-    'vhf/vor',
-    'vhh',
-    'vhs-hi',
-    'vhs/betamax',
-    'vhw/tba',
     'vi&eacute;ville',
-    'vi&ndash;x',
-    'vi&ntilde;a',
-    'vi\'let',
-    'vi(2)',
-    'vi-',
-    'vi-in-the-mirror',
-    'vi-o-lets',
-    'vi-v',
-    'vi-vii',
-    'vi-xi',
-    'vi.131',
-    'vi.17',
-    'vi.20',
-    'vi.38',
-    'vi.47ff.',
     'vi.67',
-    'vi.89',
-    'vi.89ff.',
-    'vi.9',
-    'vi.90.3',
-    'vi.91',
-    'vi/dalgety',
-    'via&ccedil&atilde;o',
-    'viables',
-    'viablity',
-    'viaduct/car',
-    'viafax',
-    'viag/continental',
-    'viaggi',
-    'vial&mdash',
-    'vialou',
     'vianen',
-    'vianne',
-    'viansson-ponte',
-    'viapechio',
-    'viaticae',
-    'viatka',
-    'vibal',
-    'vibebukta',
-    'vibed',
-    'vibed-up',
-    'vibeless',
-    'vibers',
-    'viberti',
-    'vibesy',
-    'vibhushan',
-    'vibra',
     'vibramute',
-    'vibrascaper',
-    'vibrascapers',
-    'vibrated_by_means',
-    'vibratingly',
-    'vibrational/electronic',
-    'vibrationally-excited',
-    'vibrazone',
-    'vibre',
-    'vibrer',
-    'vibrionaceae',
-    'vibro',
-    'vibro-dagger',
-    'vibro-knives',
-    'vibrochamp',
-    'vibrocorer',
     'vibrolux',
-    'vibrostat',
-    'vic&ecirc;ncia',
-    'vic\'n\'bob',
-    'vic-sur-c&egrave;re',
-    'vic-sur-seille',
-    'vic-tor-ee',
-    'vicacious',
-    'vicaire-g&eacute;n&eacute;ral',
-    'vicar-choral',
-    'vicar/',
-    'vicarage-like',
-    'vicarii',
-    'vicariousness',
-    'vicarish',
-    'vicars-general',
     'vicco',
-    'vice&rehy;like',
-    'vice&rehy;presidents',
-    'vice-admirals',
-    'vice-admiralty',
-    'vice-captains',
-    'vice-chairpersonships',
-    'vice-chancellers',
-    'vice-chancellors.',
-    'vice-chancellorship',
-    'vice-commodore',
-    'vice-consuls',
-    'vice-convenor',
-    'vice-counties',
-    'vice-dean',
-    'vice-ducal',
     'vice-gerents',
-    'vice-guildmaster',
-    'vice-keeper',
-    'vice-marshall',
-    'vice-mayor',
-    'vice-plagued',
-    'vice-prefect',
-    'vice-preseident',
-    'vice-presidencies',
-    'vice-presidentship',
-    'vice-rector',
-    'vice-regent',
-    'vice-ridden',
-    'vice-secretaries',
-    'vicecaptaincy',
-    'vicecomital',
     'viceconvenor',
-    'vicedomini',
-    'viceless',
-    'vicenc',
-    'vicencia',
-    'vicepresident',
-    'viceroyalties',
-    'vicers',
-    'vichet',
-    'vichy-appointed',
-    'vichy-treviso',
-    'vicin',
-    'vicinalis',
-    'vicinus',
-    'vicious/spiteful/sarcastic/violent',
-    'viciousburgers',
     'viciousness.',
-    'vick/coach',
-    'vickares',
-    'vicked',
-    'vicker',
-    'vickers-armstrong',
-    'vickers/bbdo',
-    'vickerys',
-    'vicksburg',
-    'vicolo',
-    'vicosa',
-    'vicotry',
-    'vict',
-    'victim(iii)',
-    'victim-based',
-    'victim-blaming',
     'victim-focussed',
-    'victim-impact',
-    'victim-to-be',
-    'victim.',
-    'victim.the',
-    'victim/employer',
-    'victimage',
-    'victime',
-    'victimhood',
-    'victimisation.',
-    'victimism',
-    'victimizes',
-    'victimologies',
-    'victims/',
-    'victo',
-    'victor-emmanuel',
     'victor-masse',
-    'victor-rowe',
-    'victor-smith',
-    'victor-style',
-    'victorbanks',
-    'victore',
-    'victoria&ndash;vancouver',
-    'victoria-folkestone',
-    'victoria-gatwick',
-    'victoria-surf',
-    'victoriae',
-    'victorian-born',
-    'victorian-byzantine-gothic',
-    'victorian-inspired',
-    'victorian/tudor',
-    'victoriana&mdash;i',
     'victorianas',
-    'victorianising',
-    'victorianstyle',
-    'victorinus',
-    'victorious.',
-    'victors.',
-    'victory\'',
-    'victory-emblem',
-    'victory-incense',
-    'victory-inscription',
-    'victory-play',
-    'victrex',
-    'victrix',
-    'victrola',
-    'victualers',
-    'victualing',
     'victuallings',
-    'victum',
-    'vicu&ntilde;a',
-    'vicunas',
-    'vid.',
-    'vidalia',
-    'vidals',
-    'vidane',
-    'vidaurri',
-    'vidc',
-    'vidcasts',
-    'viddy',
-    'vide-printer',
-    'videbech',
-    'vided',
-    'videlicet',
     'videmanette',
-    'video&rehy;arcade',
-    'video&rehy;recorder',
-    'video&rehy;tape',
-    'video&rehy;taped',
-    'video&rehy;transmission',
-    'video-audio',
-    'video-blackmail',
-    'video-camera',
-    'video-clips',
-    'video-conference',
-    'video-conferencing',
-    'video-controlled',
-    'video-disk',
-    'video-disks',
-    'video-duplication',
     'video-film',
-    'video-firm',
-    'video-framed',
-    'video-free',
-    'video-game-addiction',
-    'video-intensive',
-    'video-juke',
-    'video-links',
-    'video-makers',
-    'video-methods',
-    'video-new',
-    'video-on',
-    'video-phone',
-    'video-pop',
-    'video-recorder',
-    'video-screen',
     'video-sculptures',
-    'video-sensors',
-    'video-sessions',
-    'video-sync',
-    'video-system',
-    'video-taping',
-    'video-text',
-    'video-type',
-    'video-wall',
-    'video.it',
-    'video.tape',
-    'video/3rd',
-    'video/abi',
-    'video/british',
-    'video/cheltenham/gloucestershire',
-    'video/clare',
     'video/computer',
-    'video/crowmarsh',
-    'video/elsfield/oxfordshire',
-    'video/ewyas',
-    'video/film-maker',
-    'video/former',
-    'video/gareth',
-    'video/graeme',
-    'video/harriet',
-    'video/hove/sussex',
-    'video/ian',
-    'video/m4/wiltshire',
-    'video/m40/warwickshire',
-    'video/memory',
-    'video/mike',
-    'video/oxford',
     'video/replay',
-    'video/robin',
-    'video/super',
-    'video/swindon/wiltshire',
-    'video/tetsworth/oxfordshire',
-    'video/tv',
-    'video0',
-    'videobox',
-    'videocamera',
-    'videocameras',
-    'videoconferencer',
-    'videoconferences',
-    'videocrypt',
-    'videod',
-    'videodisc-based',
-    'videodisks',
     'videofax',
-    'videofilm',
-    'videofilms',
-    'videofits',
-    'videogames',
-    'videogenic',
-    'videogrant',
-    'videographic',
-    'videoguard',
-    'videomakers',
-    'videopole',
-    'videopolis',
-    'videoprojection',
-    'videorama',
-    'videorecorded',
-    'videoscreens',
     'videoshockers',
-    'videoshow',
-    'videosonic',
-    'videostar',
-    'videotelemetry',
-    'videotex-based',
-    'videoton',
-    'videotoys',
-    'videoview',
-    'videozone',
-    'videpay',
-    'videregaende',
-    'videte',
-    'vidfilm',
-    'vidgin',
-    'vidimus',
     'vidiwall',
-    'vidkun',
-    'vidmail',
-    'vidoes',
-    'vidrieros',
-    'vidyarthi',
-    'vieanne',
-    'viedotape',
-    'viehboeck',
-    'vieil',
-    'vieillesse',
-    'vieillori',
-    'vieillot',
-    'vieja',
-    'viejas',
-    'vielerley',
     'viella',
-    'viellard',
-    'vielles',
-    'viendra',
-    'viene',
-    'vienetta',
-    'vienna-born',
-    'vienna-budapest',
-    'viennese-inspired',
-    'viennettas',
-    'viens-je',
-    'vieotape',
-    'vierikko',
-    'vierney',
-    'viertal',
-    'vierzon',
     'vieste',
-    'viet&rehy;minh',
-    'viet&rehy;nam',
-    'viet-namese',
-    'vietnam\'',
-    'vietnam-era',
-    'vietnam-supported',
-    'vietnam/cambodia/laos',
-    'vietnamese-american',
-    'vietnamese-chinese',
-    'vietnamese-language',
-    'vietnamese-schemed',
-    'vietnamese-sponsored',
-    'vietnamese-uk',
-    'vietnamese-us',
-    'vietnamese.',
     'vietnamica',
-    'vietnamization',
-    'vietnamizing',
-    'vietnams',
-    'vietsovpetro',
-    'vieux-port',
-    'vieville',
-    'view-blockers',
-    'view-data',
-    'view-dig-file',
-    'view-factors',
-    'view-finder',
-    'view-finders',
-    'view-hole',
-    'view-indicator',
-    'view/this',
     'view/update',
-    'view_to',
-    'viewability',
-    'viewcam',
-    'viewdata/teletext',
-    'viewer-activated',
-    'viewer-appeal',
-    'viewer-friendly',
-    'viewer-in-the-picture',
-    'viewer-orientation',
-    'viewer-response',
-    'viewer-supported',
-    'viewer/reader',
-    'viewerland',
-    'viewfinder.',
-    'viewforth',
     'viewgraph',
-    'viewing/appreciation',
-    'viewless',
-    'viewly',
-    'viewmaster',
-    'viewplate',
-    'viewpoints/empathy',
-    'views/culture/political',
-    'viewstations',
-    'viewteam',
-    'viewtron',
-    'viezzar',
-    'vif',
-    'vifas',
-    'vigan&ograve',
-    'vigar',
     'vigean',
-    'vigeans',
-    'vigentina',
-    'vigfusson',
-    'vigger',
-    'viggiano',
-    'vigie',
-    'vigiers',
-    'vigil.',
-    'vigilae',
-    'vigilante-style',
-    'vigilantism',
-    'vigilate',
-    'vigilence',
-    'vigili',
-    'vigilias',
     'vigliacchi',
-    'vignati',
-    'vigneti',
-    'vigneto',
-    'vignette:2',
-    'vignetted',
-    'vigneux',
-    'vigney-welsh',
-    'vignobles',
-    'vignolles',
-    'vignolo',
-    'vignotte',
-    'vignottes',
-    'vigor',
-    'vigorously&rehy;wielded',
-    'vigorously.',
     'vigour-experts',
-    'vigour/languor',
-    'vigoureux',
-    'vigourlessness',
-    'vigourously',
-    'vigouroux',
-    'vihara',
-    'vihman',
-    'vihre&auml;t',
-    'vihret',
-    'vii&mdash;ix',
-    'vii&ndash;xxviii',
-    'vii+',
-    'vii-c',
-    'vii-vi',
-    'vii-x',
     'vii.1.38',
-    'vii.104',
-    'vii.11',
-    'vii.18',
-    'vii.196',
-    'vii.27f',
-    'vii.33',
-    'vii.50.2',
-    'vii.57.',
-    'vii.7',
-    'vii.87',
-    'vii/4',
-    'viic',
-    'viii&lsqb',
-    'viii.126',
-    'viii.22',
     'viii.35.',
-    'viii.39',
-    'viii.4',
-    'viii.46',
-    'viii.5',
-    'viii.69',
-    'viiiiiilla',
-    'viiith',
-    'viijs',
-    'vijandran',
-    'vijau',
-    'vijayabhaskara',
-    'vijayam',
-    'vijen',
-    'vijli',
-    'vijth',
     'vik&aacute&rcaron;sk&aacute',
-    'vik-mo',
-    'vikan',
-    'vikanorum',
-    'vikarbureauer',
-    'vikay',
-    'vikic',
-    'viking-leman',
-    'viking-period',
-    'viking-run',
-    'viking/mbus-based',
-    'viking/national',
-    'viking/supersparc',
-    'vikingur',
-    'viklehnik',
-    'viklehniks',
     'vikoma',
-    'viktorenko',
-    'viktoriastrasse',
-    'vikzhel',
-    'vil&rehy;lain',
-    'vilagers',
-    'vilaire',
-    'vilakazi',
-    'vilardell',
-    'vilaro',
-    'vilasuso',
-    'vilavicencio',
-    'vilaya',
-    'vilbis',
-    'vilbiss',
-    'vilbrun',
     'vilcanota',
-    'vild',
-    'vildan',
-    'vildebeest',
-    'vile-tasting',
-    'vilen',
-    'vilene',
-    'vilenesses',
-    'vilforado',
-    'vilforde',
-    'vilfort',
-    'vilia',
-    'viliame',
-    'vilifiable',
-    'vilifier',
-    'vilius',
     'vilja',
-    'viljoenskroon',
-    'vilkaviki',
-    'villa-bound',
-    'villa-type',
-    'villa-with-pool',
-    'villa1',
-    'villa5',
-    'villacero',
-    'villach-klagenfurt',
-    'villadom',
-    'villaescusa',
-    'villafuerte',
-    'villag',
-    'village&mdash;temps',
-    'village-\'my',
     'village-bobby-type',
-    'village-centred',
-    'village-dwellers',
-    'village-dwelling',
-    'village-museum',
-    'village-policeman',
-    'village-school',
-    'village-soviet',
-    'village-standard',
-    'village-suburb',
-    'village-teachers',
-    'village-type',
-    'village-world',
-    'village.',
-    'village/bicester',
-    'village/town',
     'villagea',
-    'villagers-subsequently',
-    'villages/',
-    'villagisation',
-    'villain-clown',
-    'villain-hero',
-    'villain-proof',
-    'villaine',
-    'villainies',
-    'villaland',
-    'villalta',
-    'villamariona',
-    'villamizar',
-    'villan',
-    'villan&rehy;draut',
-    'villandry',
     'villanescarum',
-    'villanesche',
-    'villans',
-    'villaquir&aacute;n',
-    'villard-mackintosh',
-    'villare',
-    'villari',
-    'villarroel',
-    'villarum',
-    'villasenor',
-    'villasuso',
-    'villavicencio',
-    'villaviciosa',
-    'ville-like',
-    'ville-sur-ancre',
-    'ville-sur-arce',
     'villecroze',
-    'villegas',
-    'villejuif',
-    'villelaure',
-    'villemore',
-    'villena',
-    'villeneuve-la-garenne',
-    'villeneuve-les-avignon',
-    'villers-aux-noeuds',
-    'villers-cott&eacute;r&ecirc;ts',
-    'villers-cotter&ecirc;ts',
-    'villes',
-    'villeurbanne',
-    'villeurbanne-sud',
-    'villiage',
-    'villicus',
     'villiersdevelopment',
-    'villierspublic',
-    'villigen',
-    'villigers',
-    'villions',
-    'villis/kelly',
-    'villit',
-    'villlage',
-    'villons',
-    'villoresi',
-    'villoslada',
-    'villosus',
-    'villotte',
-    'vilmorin',
-    'vilnis',
-    'vilno',
     'vilnuis',
-    'vilnya',
-    'vilon',
-    'vilter',
-    'viluyos',
-    'vilvorde',
-    'vimalaratne',
-    'vimercati',
-    'vimiera',
-    'viminal',
-    'vimoutiers',
-    'vimukthi',
-    'vimule',
-    'vin&acute;rna',
-    'vinal',
-    'vinalon',
     'vinaroz',
-    'vinaver',
-    'vinaya',
-    'vincas',
-    'vince/energy',
-    'vincendeau',
-    'vincent(1987)',
-    'vincent-evans',
-    'vincent-like',
-    'vincent-welsh',
-    'vincent/gwr',
-    'vincent/oxfam',
-    'vincent/raf',
-    'vincentio',
-    'vincentjustice',
-    'vincents',
     'vincenza',
-    'vincenzio',
-    'vincet',
-    'vinchenti',
-    'vinchy',
-    'vinci-style',
-    'vincio',
-    'vincitic',
-    'vinckei',
-    'vincler',
-    'vinculo',
-    'vincze',
-    'vindac&lsqb;ius&rsqb',
-    'vindaloo-stained',
-    'vindeby',
-    'vindel&oslash;v',
     'vinderine',
-    'vindesine',
-    'vindhyan',
-    'vindicator',
-    'vindicators',
-    'vindicatory',
-    'vindictive&rehy;ness',
-    'vindis',
-    'vindogenita',
-    'vindrey',
-    'vine-growers',
-    'vine-hung',
-    'vine-leaf',
-    'vine-studded',
-    'vine-stumps',
-    'vine-tangled',
     'vine-terraces',
-    'vine-training',
-    'vine-wrapped',
-    'vine/family',
-    'vine/glosters',
-    'vineae',
-    'vineam',
-    'vineatica',
-    'vinecash',
-    'vineet',
-    'vinegar-making',
-    'vinegar-pisser',
-    'vinegar-soaked',
-    'vinegar-tasting',
-    'vinegared',
-    'vinegarish',
     'vineland',
-    'vinen',
-    'vineries',
-    'vines/ip',
-    'vineyard-owner',
-    'vineyardlaced',
-    'vingcard',
-    'vingoleuse',
-    'vingresor',
-    'vinhaticos',
-    'vinicola',
-    'vinicole',
-    'vinicombe',
-    'viniculture',
-    'vinique',
-    'viniti',
     'vinitoria',
-    'vink',
-    'vinkel',
-    'vinkelkopf',
-    'vinkovar',
-    'vinle',
-    'vinnegar',
-    'vinnell',
-    'vinney',
-    'vinnicombe',
-    'vinnicome',
-    'vinnies',
-    'vino&mdash',
-    'vinogradoff',
-    'vinogradova',
-    'vinolay',
     'vinolia',
-    'vinsauf',
-    'vinsons',
-    'vint',
-    'vinten',
-    'vinter',
-    'vinters',
-    'vinteuil',
-    'vinti',
-    'vinyards',
-    'vinyl&rehy;covered',
-    'vinyl-backed',
-    'vinyl-surfaced',
-    'vinyl-tiled',
-    'vinyl-to-cd',
-    'vinyl-type',
     'vinyl-upholstered',
-    'vinyl/cassette/cd',
-    'vinylalcohol',
-    'vinylester',
-    'vinylised',
-    'vinzenz',
-    'vio',
-    'viochemical',
-    'vioin',
-    'viol&agrave',
-    'viol&egrave;ne',
-    'viol-da-gamba',
-    'viola-machin',
-    'viola-player',
-    'violante',
-    'violate(s)',
     'violation.',
-    'violen',
-    'violence-',
-    'violence-affected',
-    'violence-free',
-    'violence-grievance-attempted',
-    'violence-monitoring',
-    'violence-prone',
-    'violence-related',
-    'violence-ridden',
-    'violence-threatening',
-    'violence/attacks',
-    'violence/malpractice',
-    'violences',
-    'violencia',
-    'violent\'',
     'violently-educated',
-    'violently-wrenched',
-    'violet-brown',
-    'violet-dye',
-    'violet-eyed',
-    'violet-ink-filled',
-    'violet-lit',
-    'violet-red',
-    'violet-tinged',
-    'violet-tinted',
-    'violet-yellow',
-    'violetly',
-    'violets/sex',
-    'violin\'',
-    'violin-cases',
-    'violin-makers',
     'violin-pupil',
-    'violin-string',
-    'violine',
-    'violinistic',
-    'violins&gt',
-    'violle',
-    'violnce',
-    'viologen',
-    'violoni',
-    'vionnet',
-    'vior',
-    'viotti',
-    'viout',
-    'vip-like',
-    'vip/first-class/full-dining',
-    'vipatasilpin',
     'vipered',
-    'viperish',
-    'viperous',
-    'vipers.',
-    'vipone',
-    'vipralabhda',
-    'vira',
-    'virabongsa',
-    'viracocha',
-    'virages',
-    'virago:1984',
-    'viraj',
-    'virally-infected',
-    'viranda',
-    'viravaidya',
-    'viravaidyaminister',
     'virbram',
-    'virdi',
-    'virdin',
-    'vired',
-    'vires.at',
-    'virescens',
-    'vireyas',
-    'virgaters',
-    'virgatum',
-    'virgi',
-    'virgil\'',
-    'virgilian-dantesque',
-    'virgilijus',
-    'virgilius',
-    'virgilo',
-    'virgin-blockbuster',
     'virgin-born',
-    'virgin-like',
-    'virgin-materials',
-    'virgin-owned',
-    'virgin-violator',
-    'virgin/whore',
-    'virgina',
-    'virginali',
-    'virginalis',
-    'virginalls',
-    'virgine',
-    'virginem',
-    'virgines',
-    'virgini',
-    'virginia-creeper-covered',
-    'virginias',
     'virginibus',
-    'virginities',
-    'virginius',
-    'virginum',
-    'virgo-guest/st',
-    'viridans',
-    'viride',
-    'viridian-orange-magenta',
-    'viridiflora',
-    'viridine',
-    'viridissima',
-    'viridistriata',
-    'virigio',
-    'virility\'',
-    'virilium',
-    'virilocal',
     'virilous',
-    'virino',
-    'virkie',
-    'virmishin',
-    'virnich',
-    'viro',
-    'viroids',
-    'viroli',
-    'virologist',
-    'viromandui',
-    'virosco',
-    'virr',
-    'virreina',
-    'virscan',
-    'virt&ugrave',
-    'virtanen',
     'virtin',
-    'virtu',
-    'virtualities',
-    'virtually+',
-    'virtually-unknown',
-    'virtue\'',
-    'virtue.',
-    'virtue/vice',
-    'virtueherb',
-    'virtuelle',
-    'virtuocracy',
-    'virtuoso-standard',
-    'virtuousness',
-    'virtuouso',
-    'virtuti',
-    'virtutis',
     'virucide',
-    'virus-bub',
-    'virus-expert',
-    'virus-hcv',
-    'virus-induced',
-    'virus-luciferase',
-    'virus-resistant',
-    'virus-rna',
-    'virus-transformed',
-    'virus-turned-epidemic',
-    'viruscan-95',
-    'viruscan-97',
-    'viruses-one',
-    'virusguard',
-    'virusinfection',
-    'virvus',
     'vis&eacute;an-namurian',
-    'vis-',
-    'vis-&aacute&rehy;vis',
-    'vis-&agrave&rehy;vis',
-    'vis-&agrave;vis',
-    'vis--vis',
-    'vis_&aacute_vis',
-    'visa-forging',
-    'visa-versa',
-    'visa/access',
-    'visa/cashcard/',
-    'visa/mastercard',
-    'visacard',
-    'visait',
-    'visakhapatnam',
-    'visam',
     'visas.',
-    'viscaceae',
-    'viscaceous',
-    'viscaria',
-    'visceral:vascular',
-    'visch',
-    'visco',
-    'visco-elastic',
-    'visco-elasticity',
-    'viscoid',
-    'viscometry',
-    'viscona',
-    'visconteum',
-    'visconti-giulini',
-    'viscosity.',
-    'viscosuisse',
     'viscotek',
-    'viscounties',
-    'viscously.',
-    'viscousness',
-    'viscusi',
-    'viscuss',
-    'visean/namurian',
-    'visecomodorio',
-    'visegard',
-    'viseo',
-    'visetti',
-    'vishakapatna',
-    'vishna',
-    'vishnevskaya',
-    'vishnevski',
-    'vishva',
     'vishwas',
-    'visib',
-    'visibiity',
-    'visible/near-infrared',
-    'visible/non-visible',
-    'visible/uv',
-    'visibly_in',
-    'visicord',
-    'visidle',
-    'visie',
-    'visiga',
-    'vision-ghosts',
-    'vision-interpretation',
-    'vision-of-hell-drug',
-    'vision-spirit',
-    'vision-spirits',
     'vision-thing',
-    'vision-ward',
-    'vision-wearing',
-    'vision-weaving',
-    'vision.',
-    'vision/400',
-    'vision/state',
-    'vision/version',
-    'visionaires',
-    'visionary/allegorical',
-    'visioning',
-    'visiphone',
-    'visir',
-    'visist',
-    'visit\'st',
-    'visit/contact',
     'visita',
-    'visitable',
-    'visitant',
-    'visitants',
-    'visitas',
-    'visited.',
-    'visitherm',
-    'visiting-list',
-    'visiting-lists',
-    'visiting-place',
-    'visiting-terms',
-    'visitor&rehy;inter-active',
-    'visitor-frequented',
-    'visitor-orientated',
-    'visitor-related',
-    'visitor-spending',
     'visitor.',
-    'visitor/',
-    'visitos',
-    'visits&mdash',
-    'visits-a-week',
-    'visits/consultations',
-    'visits/exchanges',
-    'visits/time',
-    'visking',
-    'viskovaty',
-    'vismara',
-    'visn',
-    'visnu',
-    'viso-spatial',
-    'visoko',
-    'visonware',
     'visor-cap',
-    'visortron',
-    'visram',
-    'vissarion',
-    'vissarionovitch',
-    'vissiparious',
-    'vist',
-    'vistar',
-    'vistas.',
-    'viste',
-    'vistech',
-    'vistor',
-    'vistorian',
-    'vistory',
-    'vistra',
-    'vistro',
     'visual&rehy;ise',
-    'visual-display',
-    'visual-display-unit-based',
-    'visual-experiential',
-    'visual-field',
-    'visual-reconnaissance',
-    'visual-similarity',
-    'visual-symbolic',
-    'visualisations',
-    'visualise-the',
-    'visually&rehy;handicapped',
-    'visually-guided',
-    'visually-impaired',
-    'visually-recognized',
-    'visuo-spatially',
-    'visuo-tactile',
     'visuospatial',
-    'viswanadha',
-    'vitabank',
-    'vitaceae',
-    'vitacoat',
-    'vitae\'',
-    'vitae-bodied',
-    'vitafit',
-    'vital-witness',
-    'vitalepublic',
-    'vitalert',
-    'vitalian',
-    'vitaliev',
-    'vitalii',
-    'vitalisant',
-    'vitalise',
     'vitalising',
-    'vitalist',
-    'vitalists',
-    'vitalized',
-    'vitalograph',
-    'vitamic',
-    'vitamin(s)',
-    'vitamin-deficient',
-    'vitamin-oozing',
-    'vitamin-plus',
-    'vitamin-rich',
-    'vitaminas',
-    'vitaminized',
-    'vitanda',
-    'vitapointe',
-    'vitarome',
     'vitarum',
-    'vitebsky',
-    'vitec',
-    'vitehall',
-    'vitele',
-    'vitellia',
-    'vitellinus',
-    'vitello',
-    'vitellogin',
-    'vitellozzo',
-    'vitelmo',
-    'vites',
-    'vitezslaw',
-    'vithayasai',
-    'vitiaz',
-    'viticola',
     'viticole',
-    'viticoltori',
-    'viticultivated',
-    'viticultivating',
-    'viticulturally',
-    'viticulturist',
-    'vitieri',
-    'vitifolium',
-    'vitiligo',
-    'vitimins',
-    'vitina',
-    'vitiously',
-    'vitiris',
-    'vitis-idaea',
-    'vitnemal',
-    'viton-b',
     'vitos',
-    'vitoux',
-    'vitr&eacute',
-    'vitray-meyerovitch',
-    'vitreous-enamelled',
-    'vitrinus',
-    'vitrio',
-    'vitrio-spitting',
-    'vitriola',
-    'vitrite',
-    'vitro-ceramic',
-    'vitro-ceramics',
-    'vitro-club',
-    'vitrolles',
-    'vitronix',
-    'vitsnyi',
     'vitsur',
-    'vitta',
-    'vittachi',
-    'vittata',
-    'vittatina',
-    'vitto',
-    'vittoriana',
-    'vittorini',
-    'vittoriosa',
-    'vittoz',
-    'vittrio',
-    'vitu',
-    'vitually',
-    'vitulina',
-    'vituperatively',
-    'vitz',
     'vivacious/brawny/amusing',
-    'vivacis',
-    'vivair',
-    'vivaldian',
-    'vivants',
-    'vivarinis',
-    'vivax',
-    'vivek&amacr;nanda',
-    'viveknagar',
-    'vivela',
-    'vivement-r&eacute;citatif-air',
-    'vivemo',
-    'vivenair',
-    'vivens',
-    'viventium',
-    'vivere',
     'viveridae',
-    'viverrina',
-    'vivette',
-    'vivex',
-    'vivezza',
-    'viviane',
-    'vividly-drawn',
-    'vividly-hued',
-    'vivier',
-    'vivio',
-    'vivions',
-    'vivipara',
-    'viviparum',
-    'vivisecting',
-    'vivisectionists',
-    'vivisections',
     'vivisector',
-    'vivisectors',
-    'vivisent',
-    'vivit',
-    'vivo.these',
-    'vivo/in',
-    'vivons',
-    'vivreations',
-    'vivs',
-    'vivum',
-    'vivyenne',
-    'vixenish',
-    'viyacheslav',
-    'viyaparaya',
-    'vizas',
-    'vizfavourites',
     'vizigothic',
-    'vizored',
-    'vizors',
-    'vizoso',
-    'vizovice',
-    'vizum',
-    'vizzola',
-    'vjb',
-    'vjd',
-    'vjj',
-    'vjli',
-    'vk',
-    'vkhodit',
-    'vkhutemas',
-    'vl&mdash;left',
-    'vl/r',
     'vl/r=',
-    'vla-4(cd49d)',
-    'vla-4/vcam-1',
-    'vla-7',
-    'vlaanderen',
-    'vlacheslavas',
-    'vladikas',
-    'vladimirescu',
-    'vladimirskaya',
-    'vladislavich',
-    'vladivostock',
-    'vlahos',
-    'vlak',
-    'vlas.',
-    'vlasal',
-    'vlasic',
     'vlassoff',
-    'vlassoupolou',
-    'vlast',
-    'vlast\'',
-    'vlast\'iu',
-    'vlasti',
-    'vlastimil',
-    'vlastislav',
-    'vlastos',
-    'vlcek',
-    'vld',
-    'vlei',
-    'vleis',
-    'vliegclub',
-    'vlieger',
-    'vliert',
     'vlies',
-    'vlissinghe',
-    'vliw-on-alpha',
-    'vlk',
-    'vlksm',
-    'vllla',
-    'vlorewere',
-    'vlsi/cmos',
-    'vluables',
-    'vlug',
-    'vlume',
-    'vlychia',
-    'vlykhada',
-    'vm/3812',
-    'vm/cms',
-    'vm/directory',
     'vm/esa',
-    'vm/interactive',
-    'vm/ipcs',
-    'vm/ipf',
-    'vm/sp',
-    'vm2',
-    'vm30',
-    'vm370',
-    'vm7',
-    'vmaccount',
-    'vmbatch',
-    'vme-3000',
-    'vme-x',
-    'vmebus-based',
-    'vmeexec',
-    'vmg',
     'vmos',
-    'vmro',
-    'vms-on-unix',
-    'vms1000',
-    'vms2000',
-    'vmtr2',
-    'vn/2',
-    'vn/vd',
-    'vnderstandes',
-    'vnderstondyng',
-    'vneir',
-    'vnesheconombank',
-    'vnet',
-    'vnexpected',
-    'vnii',
-    'vniverselle',
     'vnknowne',
-    'vnmade',
-    'vnodd',
-    'vnouercomyn',
-    'vnprepared',
-    'vnto',
-    'vnu',
-    'vnukovo',
-    'vnweldy',
-    'vo/v1',
-    'vo2',
-    'voar',
-    'vob',
-    'voc-like',
-    'voc-voc-vocabulary',
-    'vocablry',
     'vocabulator',
-    'vocacionem',
-    'vocal&rehy;isations',
-    'vocal-cord',
-    'vocal/rhythm',
-    'vocalism',
-    'vocalissimus',
-    'vocalist/guitarist',
-    'vocalist/multi&rehy;instrumentalist',
-    'vocalist/rapper',
-    'vocalized',
-    'vocals-only',
-    'vocals/guitar',
-    'vocation-ally-trained',
-    'vocational-courses',
-    'vocational/non-vocational',
     'vocationalising',
-    'vocationally-biased',
-    'vocatively-indicated',
-    'vocatus',
-    'voces',
-    'vociferant',
-    'vociferousness',
-    'vocubulary',
-    'vodac',
-    'vodafone&rehy;based',
-    'vodafone-linked',
-    'vodanovich',
-    'voddies',
-    'voden',
-    'vodenicharov',
-    'vodka-and-lime',
     'vodka-and-limes',
-    'vodka-based',
-    'vodka-bottle',
-    'vodka-clear',
-    'vodka-drinking',
-    'vodka-laden',
-    'vodka-martini',
-    'vodka-sodden',
-    'vodka-swigging',
-    'vodka-tippler',
-    'vodkatini',
-    'vodochody',
-    'vodonovich',
-    'vodoun',
-    'voegelin',
-    'voelcker',
     'voelker',
-    'voelkermarkt',
-    'voelkle',
-    'voena',
-    'voennaia',
-    'voennoe',
-    'voennogo',
-    'voennosluzhilie',
-    'voet',
-    'vog&uuml&eacute;s',
-    'vog&uuml&egrave',
-    'vogae',
-    'vogan',
-    'vogeler',
-    'vogels',
-    'vogenhuber',
     'voget',
-    'vogl',
-    'vogladensis',
-    'vogler-clerks',
-    'vogt-goknil',
-    'vogtland',
-    'vogue-like',
-    'vogue.',
-    'vogueing',
-    'vogueishly',
-    'voguer',
-    'voguishly',
-    'vohmer',
-    'vohumana',
-    'voi&eacute;s',
-    'voice&rehy;annotated',
     'voice(s)',
-    'voice-based',
-    'voice-bubble',
-    'voice-coil',
-    'voice-control',
-    'voice-dynamic',
-    'voice-grade',
-    'voice-groups',
-    'voice-independent',
-    'voice-line',
-    'voice-logging',
-    'voice-magnifying',
-    'voice-pattern',
-    'voice-printed',
-    'voice-quality',
-    'voice-recognition',
     'voice-tone',
-    'voice-track',
-    'voice-training',
-    'voice-vote',
-    'voice-we',
-    'voice-wise',
-    'voice.everybody',
-    'voice.just',
-    'voice/',
-    'voice/speech',
-    'voice/the',
-    'voiceboxes',
-    'voiced/th/',
-    'voiced/voiceless',
-    'voicedial',
-    'voicein',
     'voicelessness',
-    'voiceprint',
-    'voicer',
-    'voices-go-round',
-    'voices.',
-    'voiceworks',
-    'void&mdash;but',
-    'void&mdash;no',
-    'void-bird',
-    'void-brain',
-    'void-filling',
-    'void-gulf',
-    'void-like',
-    'voidable-but-not-avoided',
-    'voidless',
-    'voient',
     'voigle/medical',
-    'voil&aacute',
-    'voilla',
-    'voinovich',
-    'voinovitch',
-    'voirement',
-    'voiron',
-    'voith-schneider',
-    'voitsberg',
-    'voivode',
-    'vojvoda',
-    'vojvodina&mdash;vacant',
-    'vokes',
-    'vol&eacute;s',
-    'vol&egrave;e',
-    'vol-',
     'vol.10',
-    'vol.14',
-    'vol.1v',
-    'vol.3',
-    'vol.35',
-    'vol.4',
-    'vol.8',
-    'vol.9',
-    'vol.i',
-    'vol.iv',
-    'vol.lv',
-    'vol.v',
-    'vol.vi',
-    'vol.xii',
-    'vol/g',
-    'vol/vol/vol',
     'vol:4',
-    'vol:vol:vol',
-    'volac',
-    'volage',
-    'volanic',
-    'volansky',
-    'volants',
-    'volapuke',
-    'volarome',
-    'volatil',
-    'volatile-poor',
-    'volatile/',
-    'volatilisation',
-    'volatilized',
-    'volcae',
-    'volcan',
     'volcanes',
-    'volcanic-exhalative',
-    'volcanic-free',
-    'volcanic-hosted',
-    'volcanic-ophiolite-granite',
-    'volcanic/plutonic',
-    'volcanically-warmed',
-    'volcaniclastics',
-    'volcano&mdash;related',
-    'volcano-forged',
-    'volcano-sedimentary',
-    'volcano-shaped',
-    'volcano-tectonic',
-    'volcanologists',
-    'volcanotectonic',
-    'volcker',
     'volcow',
-    'volcuf',
-    'volcuf/high',
-    'vole&rehy;like',
-    'vole-like',
-    'volea',
-    'volees',
-    'volemic',
-    'volente',
-    'voleris',
-    'volf',
-    'volga-don',
-    'volga-ural',
-    'volgar',
-    'volhynian',
-    'voli',
     'volicer',
-    'voliera',
-    'volitans',
-    'volkani',
-    'volkelt',
-    'volken',
-    'volkerkunde',
-    'volkgonov',
-    'volkischer',
-    'volkist',
-    'volkoff(1939)',
-    'volkonsky',
-    'volkpartei&mdash&ouml;vp',
-    'volks-',
-    'volks-union',
-    'volks-wagen',
     'volksbank',
-    'volksdeutsche',
-    'volksgeist',
-    'volksgemeinschaft',
-    'volkskanzler',
-    'volksopera',
-    'volkspartei/parti',
-    'volkspoliqei',
-    'volksraad',
-    'volkssturm',
-    'volkssturmmann',
-    'volkst&uuml;mlich',
-    'volksunion',
-    'volkswagen-audi',
-    'volkswagenstiftung',
-    'volkswriter',
     'volkszeitung',
-    'volkwein',
-    'vollam',
-    'vollan',
-    'vollekspartei',
-    'vollenberg',
-    'voller',
-    'vollore',
-    'vollst',
-    'volmet',
-    'volna',
-    'volodia',
-    'volokolamsk',
-    'volont&eacute',
-    'volontarie',
-    'volontariste',
     'volopen',
-    'volosinov',
-    'volpeliere-pierrot',
-    'volpelierre',
-    'volpes',
-    'volpierre',
-    'vols-au-vent',
-    'volscians',
-    'volsec',
-    'volstatic',
-    'volstead',
-    'volsung',
-    'volsungs',
-    'volt/metre',
-    'voltage-changing',
-    'voltage-controlled-oscillator',
     'voltage-dependence',
-    'voltage-dropping',
-    'voltage-ratio/frequency',
-    'voltage/current',
-    'voltaireanism',
-    'voltaireeducation',
-    'volte',
-    'volte-',
-    'volterrano',
-    'voltmann',
-    'volto',
-    'volts/metre',
-    'voltswagon',
-    'voluem',
-    'voluerit',
-    'volume(s)',
     'volume-',
-    'volume-based',
-    'volume-compartment',
-    'volume-cycled',
-    'volume-plastics',
-    'volume-production',
-    'volume-selling',
-    'volume-temperature',
-    'volume-wise',
-    'volume/',
-    'volume/doubtful',
-    'volume/pickup',
-    'volume/surface',
-    'volume/tone',
-    'volume/volume',
-    'volume14',
     'volume=2',
-    'volumed',
-    'volumes--6,000',
-    'volumetrical',
-    'voluminousness',
-    'volumise',
-    'volumizer',
-    'volumteers',
-    'volun',
-    'volun&rehy;tarily',
-    'volun&rehy;tarism',
-    'volun&rehy;tary',
-    'voluntairily',
-    'voluntaria',
-    'voluntarie',
-    'voluntaril',
     'voluntary&mdash;do',
-    'voluntary-professional',
-    'voluntary/',
-    'voluntary/charitable',
-    'voluntaryist',
-    'voluntatem',
-    'volunteeers',
-    'volunteer-force',
-    'volunteer-run',
-    'volunteers.tim',
-    'volunteers=79',
-    'volunters',
-    'volupeer',
-    'volupt&eacute',
-    'voluptarian',
-    'voluptate',
     'volupte',
-    'volustana',
-    'voluta',
-    'volute-handles',
-    'voluting',
-    'volver',
-    'volviferous',
-    'volvograd',
-    'volyen',
-    'volyers',
-    'volynsky',
-    'vomero-nasal',
-    'vomeronasal',
-    'vominting',
-    'vomit-filled',
-    'vomit-freak',
     'vomitarium',
-    'vomitific',
-    'vomiting.they',
-    'vomitoriums',
-    'vomitous',
-    'vomitus',
-    'vommy',
-    'von-der-heydt',
-    'voncken',
-    'voncramon',
-    'vondelhof',
-    'vondra',
-    'vongara',
-    'vongphet',
-    'vongs',
-    'vonla',
     'vonservation',
-    'vontobel',
-    'vonunteers',
-    'vony',
-    'voodism',
-    'voodoo-call',
-    'voodoo-men',
-    'voodoos',
-    'voomf',
-    'voorbereidend',
-    'voorhout',
-    'voornitgang',
-    'voors',
-    'voorsanger',
-    'voort',
-    'voortrekker',
     'vor&uuml;ber',
-    'vor-',
-    'vor.',
-    'voragine',
-    'voranart',
-    'vorax',
-    'vorbach',
-    'vorderasiatische',
-    'vordergasse',
-    'vorderrhein',
-    'vorderstadt',
-    'vorechovsk&yacute',
-    'vorghan',
-    'voris',
-    'vork',
-    'vorlager',
     'vormund',
-    'vorobieff',
-    'voronezh\'',
-    'voronina',
-    'voronkov',
-    'voronovs',
-    'voronpsov',
-    'vorontsev',
-    'voroshilovgrad',
-    'vorotyntsev',
-    'vorou',
-    'vorposten',
-    'vorratsstelle',
-    'vorshgar',
-    'vorsitzender',
-    'vorst',
     'vorstadt',
-    'vorstellung',
-    'vorstudium',
-    'vortac',
-    'vortex-like',
-    'vortice',
-    'vortism',
-    'vortographs',
-    'vortoil',
-    'vorwelt',
-    'vorwish',
-    'vorzittzas',
-    'vos-stricker',
-    'voscherau',
-    'voselsang',
-    'voskepar',
     'voslensky',
-    'vossebein',
-    'vossische',
-    'vosstaniye',
-    'vosstrasse',
-    'vosswinnel',
-    'vostochny',
-    'vostre',
-    'vosts',
-    'votchina',
-    'vote(s)',
-    'vote-chasing',
-    'vote-count',
-    'vote-endangering',
-    'vote-gathering',
-    'vote-grabbing',
     'vote-hungry',
-    'vote-maximize',
-    'vote-of-confidence',
-    'vote-winners',
-    'vote-worthiness',
-    'vote-worthy',
-    'vote.worth',
-    'vote/men',
-    'vote/work',
-    'voteless',
-    'voter-familiarity',
-    'voter-vassals',
-    'voter-wooing',
-    'voter.',
-    'voter/non-voter',
-    'voters&mdash;was',
     'votes*',
-    'votes-8.66',
-    'votes-per-seat',
-    'votes_at',
-    'votevotes',
-    'votez',
-    'voth',
-    'voting&mdash;in',
-    'voting*',
-    'voting-oriented',
-    'voting-power',
-    'voting-rights',
-    'voting.',
-    'votively',
-    'votkinsk',
-    'votro',
     'vouce',
-    'voucher-clutchers',
-    'voucher-holders',
-    'voucher-privatisation',
-    'voucher/ticket',
-    'vouchered',
-    'vouchers.',
-    'voudrait',
-    'voudras',
-    'vouet',
-    'voules',
-    'vouloir',
-    'voulon',
-    'voumes',
-    'vounna',
-    'vouri',
     'voussoir',
-    'voussure',
-    'vouvant',
-    'vover',
-    'vowchurch',
-    'vowel(y)',
-    'vowel-change',
-    'vowel-phonemes',
-    'vowel-plus-semivowel',
-    'vowel-sound',
-    'vowel-system',
-    'vowel-type',
-    'vowel-variables',
-    'vowel-varied',
-    'vowel.',
-    'vowls',
     'vox-popping',
-    'voyage.j',
-    'voyaged',
-    'voyages/sailing',
-    'voyageurs',
-    'voyagie',
-    'voyelles',
-    'voyez-vous',
-    'voyle',
-    'voynet',
-    'voyons',
-    'voys',
-    'voyse',
-    'voyvodic',
-    'vozene',
-    'vp&mdash;left',
     'vp&ouml',
-    'vp-1',
-    'vp-16',
-    'vp-4vf',
-    'vp-kjl',
-    'vp-knu',
-    'vp-viscose',
-    'vp-ytt',
-    'vp/va',
-    'vp1',
-    'vp1200',
-    'vp16/etoposide-induced',
-    'vp2/vp5',
-    'vp3/vp7',
-    'vp4',
-    'vp6/ns1/vp7',
     'vpc',
-    'vph-1040qm',
-    'vpm',
-    'vpo/abbado',
-    'vpo/bernstein',
-    'vpo/boskovsky',
-    'vpo/maazel',
-    'vpon',
-    'vpro-4',
-    'vps',
-    'vpstanding',
-    'vpx220',
-    'vpx240/10',
-    'vqu',
-    'vr&scaron;ek',
-    'vr-bob',
     'vr-brm',
-    'vr-o-o-m',
-    'vr.',
-    'vr15',
-    'vr17',
-    'vr249',
-    'vra',
-    'vraalsen',
-    'vraies',
-    'vram',
-    'vranch',
-    'vratislav',
-    'vratnik',
-    'vrau',
-    'vraxoin',
-    'vrbnik',
     'vredo',
-    'vreede',
-    'vreelands',
-    'vreeman',
-    'vreevurg',
-    'vrelo',
-    'vreto',
-    'vriezen',
-    'vrin',
-    'vring',
-    'vrinsky',
-    'vrique',
-    'vrnv',
-    'vrnwy',
-    'vrolijkheid',
-    'vroomen/jewellery',
     'vroomfondel',
-    'vrooming',
-    'vroomking',
-    'vroomm',
-    'vrouw',
-    'vrp',
-    'vrroom',
-    'vrrooommm',
-    'vrtx/os',
-    'vrubel',
-    'vry',
-    'vryburgi',
-    'vrynwy',
-    'vs&gt;vdb',
-    'vs&lt;vdb',
-    'vs(correctnewpos)',
     'vs-vdb',
-    'vs/cobol',
-    'vs/hvs',
-    'vs4c/5a',
-    'vsat-based',
-    'vsats',
-    'vsd',
-    'vse-based',
-    'vseobecna',
-    'vsevelod',
-    'vsli',
-    'vsq',
-    'vst',
-    'vsurpt',
-    'vsvm',
-    'vsx3',
     'vt-600',
-    'vt-atn',
-    'vt1-vt5',
-    'vt100-compatible',
-    'vt10428',
-    'vt10431',
-    'vt22',
-    'vt340',
-    'vt362',
-    'vti',
-    'vto',
-    'vtr21',
-    'vtterance',
-    'vtterly',
-    'vttermoste',
-    'vu&ccaron;i&cacute',
     'vu&ccaron;ini&cacute',
-    'vu&mdash;flemish',
-    'vu&mdash;patriotic',
-    'vuarnet',
-    'vucedol',
-    'vuch',
-    'vuchetich',
-    'vuelva/volviera',
-    'vuelve',
-    'vues',
-    'vuetaki',
-    'vuibau',
-    'vuibert',
-    'vuic',
-    'vuidar',
-    'vuillemin',
     'vujadin',
-    'vujic',
-    'vujica',
-    'vujicic',
-    'vujovic',
-    'vukotic',
-    'vukotinovica',
-    'vulcanello',
-    'vulcanian-type',
-    'vulcanised',
-    'vulcanism',
-    'vulcatherm',
-    'vulchev',
-    'vulgaire',
-    'vulgarbia',
-    'vulgaria',
     'vulgarisation',
-    'vulgarise',
-    'vulgarisers',
-    'vulgarisms',
-    'vulgarizations',
-    'vulgarize',
-    'vulgarly-appointed',
-    'vulgatus',
-    'vulgi',
-    'vulgus',
-    'vuli&ccaron;evi&cacute',
-    'vulic',
-    'vulkan',
-    'vullnet',
-    'vulnerabilit',
-    'vulnerable-parts',
     'vulnerable.27',
-    'vulnerata',
-    'vulnificus',
-    'vulpia',
-    'vultur',
-    'vulture-investors',
-    'vultures.',
-    'vulturnense',
-    'vulva-vaginal',
-    'vulvae',
-    'vulvas',
-    'vundla',
-    'vunibobo',
-    'vunivalu',
-    'vurm',
-    'vurry',
     'vuursche',
-    'vuzzen',
-    'vva&ndash;3',
-    'vvc',
-    'vvd&mdash;people',
-    'vvill',
-    'vvwr1',
-    'vw-branded',
-    'vwa',
-    'vwh',
-    'vwhdc',
-    'vwr',
-    'vx414',
-    'vx770',
-    'vxgdb',
-    'vxi',
     'vxk',
-    'vxmon',
-    'vxor',
-    'vxs',
-    'vxv',
-    'vy&scaron&scaron&iacute',
-    'vy&scaron;ehradsk&yacute',
-    'vy-nay-grette',
-    'vyaas',
-    'vyaches',
-    'vyali',
-    'vyall',
-    'vyazemskaya',
-    'vydrn&iacute;k',
-    'vydubitsky',
-    'vyesna',
     'vygeantic',
-    'vykom',
-    'vyksa',
-    'vykypel',
-    'vynd',
-    'vyrle',
-    'vysotsky',
-    'vyv',
-    'vyver',
-    'vyvx',
-    'vz58p',
-    'vz608',
-    'vz634',
-    'w&amp;f',
-    'w&amp;j',
-    'w&amp;re',
     'w&auml;chter',
-    'w&dollar',
-    'w&dollar;g',
-    'w&egr:nt',
-    'w&egr:t',
-    'w&lcub;211&rcub;-',
-    'w&mdash;n',
-    'w&ndash',
-    'w&ndash;atson',
-    'w&ndash;ell',
-    'w&oacute;den',
-    'w&ouml;lfflin',
-    'w&ouml;lfl',
-    'w&ouml;ltgens',
-    'w&ouml;rterbuch',
-    'w&pound;edwards',
     'w&pound;flared',
-    'w&pound;h',
-    'w&pound;king',
-    'w&uacute;rttemberg',
-    'w&uuml;nderkind',
-    'w&uuml;pper',
-    'w&uuml;rst',
-    'w&uuml;rth',
-    'w&uuml;rttemberger',
-    'w&uuml;rttembergisches',
-    'w&uuml;rzelbauer',
-    'w&uuml;stefeld',
-    'w&uuml;thrich',
-    'w\'0',
-    'w\'1',
-    'w\'2',
     'w\'a',
-    'w\'don',
-    'w\'en',
-    'w\'haven',
-    'w\'houghton',
-    'w\'n',
-    'w\'oopin\'',
-    'w\'sgenerous',
-    'w\'tree',
-    'w(ilf)',
-    'w-1',
-    'w-1a',
-    'w-4',
-    'w-6',
-    'w-6912',
-    'w-a',
     'w-a-l-k.',
-    'w-as',
-    'w-b',
-    'w-based',
-    'w-categories',
-    'w-cell',
-    'w-e-ell',
-    'w-e-i-r',
-    'w-hat',
-    'w-i-t-h',
-    'w-o-m-a-n',
-    'w-ould',
-    'w-particle',
-    'w-particles',
-    'w-reg',
-    'w-the',
     'w-type',
-    'w-w-w-w-wogs',
-    'w-w-w-want',
-    'w-w-w-what',
-    'w-w-way',
-    'w-w-wilderness',
-    'w-was',
-    'w-wear',
-    'w-whaddya',
-    'w-who',
-    'w-why',
-    'w-will',
-    'w-winter',
-    'w-wo',
-    'w-wool',
-    'w-worried',
     'w.1.',
-    'w.121',
-    'w.9',
-    'w.a.a.a.',
-    'w.a.b.',
-    'w.a.f.',
-    'w.a.s.p',
-    'w.amos',
-    'w.audry',
-    'w.axi',
-    'w.b.e.',
-    'w.bright',
-    'w.c.1',
-    'w.c.j.s.',
-    'w.c.s',
-    'w.c.s.',
     'w.c.t.u.',
-    'w.e.f.',
-    'w.e.j.',
-    'w.ere',
-    'w.f.n.',
-    'w.g.t.',
-    'w.h.f.',
-    'w.h.playfair',
-    'w.h.smith/do',
-    'w.ham',
-    'w.heslop',
-    'w.i',
-    'w.j.a.',
-    'w.j.alexander',
-    'w.j.firth',
-    'w.j.fotherby',
     'w.j.j.',
-    'w.j.perry',
-    'w.j.s.',
-    'w.j.t.',
-    'w.j.w.',
-    'w.l.webb',
-    'w.m.s.',
-    'w.metzger',
-    'w.midlands',
-    'w.n.b.s',
-    'w.n.w.-e.n.e.',
-    'w.o',
-    'w.o.g.',
-    'w.p.kinsella',
-    'w.p.lind',
-    'w.s.churchill',
     'w.s.m.',
-    'w.s.r.',
-    'w.t.c.c.',
-    'w.t.ch',
-    'w.v.r.',
-    'w/2000',
-    'w/50',
-    'w/cpl',
-    'w/day',
-    'w/full-text',
-    'w/h',
-    'w/h&amp;sup2',
-    'w/kg',
-    'w/m',
-    'w/r/',
-    'w/russo',
     'w/single',
-    'w/up',
-    'w/vo',
-    'w0i',
-    'w1-100',
-    'w1-based',
-    'w1.',
-    'w1/po',
-    'w1020',
-    'w1041',
-    'w1053',
-    'w1130',
-    'w124s',
-    'w1282x.',
-    'w1282x/f508',
-    'w1282x/w1282x',
     'w14105',
-    'w14112',
-    'w14p',
-    'w1v2bp',
-    'w23.5',
-    'w262',
-    'w27',
-    'w2xbf',
-    'w30',
-    'w302',
-    'w303&ndash;1a',
-    'w303&ndash;1b',
-    'w32',
-    'w35467',
-    'w37',
-    'w37-40',
     'w3d',
-    'w40',
-    'w420',
-    'w49n',
-    'w5644',
-    'w5677',
-    'w5y1',
-    'w70-80',
-    'w756',
-    'w80797',
-    'w=0.01',
-    'w=1',
-    'w=35314.5',
-    'w=39799.5',
-    'w=well',
-    'w=what',
     'wa\'',
-    'wa\'l-shaj\'a',
-    'wa-',
-    'wa-224-p',
-    'wa-8-l',
-    'wa-a-ah',
-    'wa-e-ro',
-    'wa-ha-was',
-    'wa-hey',
-    'wa/08/25/0001',
-    'wa/27/63/0001',
-    'wa/35/25/0007-1',
-    'wa568.310.113,068',
-    'wa591',
-    'wa67',
-    'wa803',
     'wa:ta',
-    'waaa-waaa',
-    'waaaaaaaaaaaaaaaa',
-    'waaaaaaaaah',
-    'waaaaaaaah',
-    'waaaaagh',
-    'waaaaah',
-    'waaaagh',
-    'waaaakeeee',
-    'waaahh',
-    'waaaives',
-    'waaf-issue',
-    'waagen',
-    'waah',
-    'waands',
-    'waant',
     'waardenburg',
-    'waargh',
-    'waasen',
-    'waatchin',
-    'waau',
-    'waba',
-    'wabash',
-    'wabco',
-    'waber',
-    'wabi-kon',
-    'wabi-like',
-    'wabil',
-    'waca',
-    'wacb',
-    'wacc-commissioned',
-    'wacc-indonesia',
     'wacc-initiated',
-    'wacc-member',
-    'wacc-north',
-    'wacc-supported',
-    'waccs',
-    'wach',
-    'wache',
-    'wachenge',
-    'wachovia',
-    'wachowski',
-    'wachs',
-    'wachs/house',
-    'wachsmann',
-    'wachsregimente',
-    'wacked',
-    'wackerman',
     'wackily',
-    'wackily-observed',
-    'wacking',
-    'waclaw',
-    'wacos',
-    'wacs',
-    'wad-carrying',
-    'wadak',
-    'waddam',
-    'wadder',
-    'waddeson',
-    'waddeton',
-    'waddings',
-    'waddington\'s-style',
-    'waddle-alike',
-    'waddledance',
     'waddlin\'',
-    'wade-bramble',
-    'wade-martin',
-    'wade/head',
-    'wade/oxford',
-    'wadebridge-port',
-    'wadeford',
-    'wadeing',
-    'wadesbridge',
-    'wadhams',
-    'wadhams/shape',
-    'wadis.',
-    'wadjet',
-    'wadland/brother',
-    'wadland/missing',
-    'wadless',
     'wadley/dss',
-    'wadling',
-    'wadlow',
-    'wadman',
-    'wadmore',
-    'wadoanshin',
-    'wador',
-    'wadowice',
-    'wadrop',
-    'wadrup/department',
-    'wadson',
-    'wadsworth/tenant',
-    'wadswoth',
-    'wadworth',
-    'wadworths',
-    'wae',
     'waeful',
-    'waele',
-    'waelt',
-    'waerden',
-    'waermund',
-    'waeta',
-    'waf',
-    'wafcol',
-    'wafer-like',
-    'wafer-machine',
-    'waffe',
-    'waffen-grenadier-division',
-    'waffenfarbe',
-    'waffle-irons',
-    'waffle-maker',
-    'waffle-textured',
     'wafl',
-    'waftage',
-    'wafter',
-    'wafters',
-    'wag&mdash;to',
-    'wag-at-the-wall',
-    'wag-o-meter',
-    'wagaddon',
-    'waganda',
-    'wagayo',
-    'wage&rehy;bargaining',
-    'wage&rehy;costs',
-    'wage&rehy;earners',
-    'wage&rehy;labour',
-    'wage&rehy;packet',
-    'wage-bargainers',
     'wage-based',
-    'wage-change',
-    'wage-cost',
-    'wage-costs',
-    'wage-cutting',
-    'wage-drift',
-    'wage-employment',
-    'wage-freeze',
-    'wage-freezes',
-    'wage-increases',
-    'wage-indexation',
-    'wage-money',
-    'wage-paying',
-    'wage-price-expectations',
-    'wage-price-index',
-    'wage-real',
     'wage-reducing',
-    'wage-regulation',
-    'wage-relationship',
-    'wage-rental',
-    'wage-scale',
-    'wage-setters',
-    'wage-slavery',
-    'wage-slips',
-    'wage-structure',
-    'wage/price',
-    'waged/&pound;8',
-    'wagelessness',
-    'wagen',
-    'wagenberg',
-    'wagenheim',
-    'wageningen',
     'wagenitz',
-    'wagenknecht',
-    'wagering',
-    'wages-auction',
-    'wages-prices',
-    'wages.',
-    'wages.that',
-    'wagger',
-    'waggerly',
-    'waggery',
-    'wagges',
-    'waggett',
-    'wagggs',
-    'waggin\'',
-    'waggingly',
-    'waggings',
     'waggle-line',
-    'waggle-steps',
-    'waggler-fished',
-    'waggon-door',
-    'waggon-loads',
-    'waggon-spokes',
-    'waggonbau',
-    'waggy',
-    'waghenaer',
-    'waghorns',
-    'wagih',
-    'wagis',
-    'waglan',
-    'waglelocal',
-    'wagner_et',
-    'wagnerin',
     'wagnerstr.',
-    'wago',
-    'wagon-builders',
-    'wagon-lit',
-    'wagon-load',
-    'wagon-long',
-    'wagon-not',
-    'wagon-road',
-    'wagon-ruts',
-    'wagon-wheel',
-    'wagon/warhorses/crew',
-    'wagoneers',
-    'wagonmaster',
-    'wagonway',
-    'wagrain',
-    'wagram',
     'wagstaff/archdeacon',
-    'wagstaff/nra',
-    'wagstaffs',
-    'wagt',
-    'wah-wah-',
-    'wah-way',
-    'wahakaheke',
-    'wahal',
-    'wahar',
-    'wahbe',
-    'wahchumyus',
-    'wahedyar',
-    'wahh',
-    'wahhabis',
-    'wahhhh',
-    'wahib',
     'wahiba',
-    'wahini',
-    'wahlb&uuml;ndnis',
-    'wahlefeld',
-    'wahlenbergii',
-    'wahlkapitulation',
+)
+
+blocks_50 = (
+    '&\'funding&#led&&minded&#non&(property&&reared(%newal\'#oad&(sounding%!/&"56%&:rural%+a-champaign%!i&$city',
+    '&$ties%"ly%%scape%!y$$rium##ica$!s"&chenko$&in-cut&$hood"#dal#%inola##orf$!s".eaformaldehyde',
+    '$!u#$flex##gei##mic#!n$!a#!s#!t$2hane-anaesthetised))polymeric%#ras&&oscopy\'\'vesical""fa$#iys',
+    '#!t"%ganda##ed.$&ncy-in(\'whether%"t\'&%-rate&#est&*ly-awaited)(critical#(hygurghy#(le-urgle#"ok#)uhart/sun""ho',
+    '"%iburu#"ca$!h%!o#%dians##els#(fication##gen$#ill#\'mecomes#.nal\'s-eye-view%(ry-tract%%tions&#ors$+e-encrusted',
+    '\'\'praying\'&tained&\'testing$!y#!s$!k##zar""la#)ogengasse#"us""ma#"ia##ond"(n-peltae$&shaped',
+    '\'#den#$ings#!y"%o\'gen#)andrology#)bilinogen$$oros#%chloa%!s#&gallus$$enic#+kinase-type.#-pa#&lagnia$&ogist.',
+    '#"ns#*pathogenic\'!y$(hthalmus$)orphyrins$&thalma)"us#\'thelial#$zgan$"wi"$pose"%quart$#han&#rt-(!.',
+    '"#rea$$ntly#!s#*utikoetzea"$sday#"el$#ren#&horing#!i$"ne%"ia&"ty##koy#&lingen#?odeoxycholyl-&bgr;-aminobenzoic',
+    '$#lic#&prache#%uleac"$text#%heill#!i$&caceae&$ting#$ubia"!u#!c#!d#\'guaiana&(yan-born$$yuay',
+    '##shi#$zgan!,s&dollar/dfl)3;.00=dr&dollar;7.30*)0.02-0.03-!5-!8,-35&ndash;0.50,!5,-68&ndash;3.60*%1,007-"37-"50.!4-"67',
+    ',#115-"25-"36.!7.!8-"44-"55-"60-"70.!2-"80-&99,400,#216-"20-"31',
+    '-"40-"69-&70,000.!5-"80.%4,000-&90,000,#308-"16.%9,000-"20-"30-"40.%1,000.!3',
+    '-"34-"45-"50.!2-"70.!9-"80-"90,#510-"30.!5-"59-"70-"90,#605',
+    '-&30,000-"60-"70.!6-"80-"93,#720-"80.!3,#810-"23.!5.!6-"30-"60',
+    ',#900-"10-"20.!8-"50.!9-"60-"70.!4+#.00.)0=19.2037..=&pound;0.59318$61916%s11.48$5.15',
+    '7&4.49587)yr20.9219/&0.31372#3931$47401"561$60222"142#8571$79573"851$96783"892#725/(1,026.05',
+    '1(208.73491&322.451\'540,0001&789.240$.0321$30671$76662#8341"801$90240%0,0002#9531\'18.46381&4.42774#574',
+    '3#8522"380&1.57371)0,085.0432$.9531%1.6891%3.2033#9940&2.03891%1.9281%3.6421%9.8262&9.20290%31.741%2.772',
+    '1%5.6221%7.1110*4,973.91561".51&5.28020&5.85711!02$.5620&6.82182$97021&3.07220&73.0281&5.96560&94.9671%8.991',
+    '1(694.01171&989.270#.002#4932#5341#3851$54591$70682#3182#8041$84331$94060!01$,0001%.1204',
+    '1!01$5.500&3.60130"410!51%.69881%2.6831%8.8550\'79.29510\'84.75400&9.91801&4.8313/+3,9970.50140%.08651$3495',
+    '1$94750!01%.03581!90&42.9340&60,0002$.1860%91.55/*4,489.91150#.721$93982#8622#9550!00%1.952',
+    '0&4.39450&60.5020\'71.6807/!50),006.86741#8000#.231$30642#1991$41861$50532#3961"601$73221$9581',
+    '0&4.65110&6.6172/%6,5000%.07531$25231$38481$48941!52#5570!01%0.9240&1.60760&2.83591%1.7140&3.3145',
+    '0\'51.66110&7.96080\'86.89080&99.201/&7.07731$98860&0.60001%4.0570\'11.40410$6.252$65532$81320&8.9813/$8.740%02.15',
+    '0&9.5858/&9.09161$48191$52550\'48.02490&66.7480&728.72//a&dollar;1.2965:$3151;#9280\'d11.9891&21.1120(fl1.78835#900//b&dollar;1.6816',
+    '8&2.0094;#1130\'25.45675"920\'d0.37565"6100el&dollar;1.9982:&2.00510(f33.98782&4.00772&7.3374//c&dollar;0.83001,pound;0.48910\'118.3440\'344.737',
+    '0\'84.46011#8.80/i&dollar;0.82920*ves65.3765/\'d0.82970\'h3.65894#6550(kr5.65482&6.43972&7.02010\'m1.44554#8853#5134#7883$6443',
+    '4#5323$74634#5273$82194!50-r&dollar;6.28/.e&pound;2.92280\'cu1.4340*sc148.45783&57.3772\'65.2801//f&dollar;1.4351;#5671)lt;t5.6020&5.3795',
+    '2$54462$60996)=104.42773#9992$71220.6.1702=113.9942$59071&1.66250&71.4061&8.11460)bu161.5113\'76.88530&l2.0510\'m4.06223$3109',
+    '1\'k4.0819/0g&dollar;115.1478"331,pound;0.60240\'d7.30963$54700(f299.7251&300.00/0hk&dollar;7.7304<#461<#610/.i&pound;0.6313:#5520&d0.3024!1',
+    '0(r71.18480\'s2.01014#2304#3234#800/-j&dollar;6.19:"508$7.00:$81998&8.09330\'d0.63914"47/\'k0.94184"890#125',
+    '0\'39.26450\'47.24560\'cs15.612"243&6.42343!82\'31.41170\'d0.28575"994#9300)sh22.93073&4.31770)yat6.3587/-l&dollar;1.001.pound;1,046.67',
+    '7#6507\'879.0667\'992.5610(1,354.181&354.180\'d0.26710)e170.43252%84.020"fr/.m&pound;0.3268:#4550\'d8.12580\'k2.6055/!n0&7.9603',
+    '0)afl1.78836#9450#k601\'r6.69450)rs28.36472\'42.75120.t&dollar;26.00<$5116:&7.10649%40.000/z&dollar;1.7576/\'p1.85483#7420\'22.12331&6.2065',
+    '0&8.0587/(qr3.62754"33/(r13.89311&4.83750\'65.45930\'71.18480(bs0.54255#5560(f10.16342&19.0991\'78.43041&9.38640\'o0.38175"35',
+    '0+p1,841.48272&966.941)s1,897.440(s16.43164$82181\'21.47092&4.42662&5.18424$69882%7.2781\'39.57161\'41.8083//s&dollar;1.6816:$84740(1,042.64',
+    '0)ch10.79333&1.90093&2.78320)h378.11381\'564.8190/i&dollar;2.5832;$72290!r1&3.73671&5.00533$57930)s2,629.271(408.8687/+taka36.44030)l4,351.67',
+    '0\'s1.24811)h194.42064%5.3210/t&dollar;4.2462<#6080(ug3.3431/0ws&dollar;2.2601/\'yr11.83//z&dollar;2.4703:$67750(529.19270\'l11,1004#5692\'3,254.91%9,500',
+    '3&713.39-"56,"30-!6,"50,"63,!7,"84+%0,140-#3000$,000."40-#4000$,000."37',
+    '/!4-#570-#600."10-#7000$,000/!7,+-15,000,000,#00m,!2,)3,000,000,%4,0001$,000,%5,600-".3',
+    ',(9,653.60,"bn+%1,170."95-#375-#400-#610."40-#855-#900,".5-"97,)0,000,000-!m,)1,000,000',
+    '.\'600,000,!4-$,000,!5,!7-(,000,000,%8,680.#900+%2,080-#125-#200."90-#390-#600-\'900,000',
+    ',%1,300.#900,!2-$,000,!3-$,000,%4,000,)5,000,000.#100,)7,800,000,)8,000,000,%9,122+%3,200-#320-\'500,000',
+    '-#930,".5,)0,500,000,!1,!2,)4,000,000,!5-$.357.!6,!6-$,000,)7,630,000,%8,000.#163,!9',
+    '+)4,200,000-\'500,000."30."50-#850-#911."50,%0,000.#200,(1,088.61,%3,000,%4,500,!5-\',00,000.\'300,000',
+    '+,5,000-20,000-#160-#2000$,000.&70,000-#400-#500."60-#720."70,#.55-"60,%0,000/"33,!2',
+    ',%4,100,!5,!6,)7,000,000.#800-!0,%8,168,!9+%6,080-#100-#200-#4000$,000.&32,600."46',
+    '-#6000$,000-#760-)800(1988)."39,#-17,#.40,!1-(,000,000,)2,000,000,!4-$,760,!6,)7,000,000+%7,452',
+    ',%0,000.#880,)2,000,000,!3,%4,0001$,000,!5-(,000,000,!6-(,000,000,!7-(,200,000,%8,883,)9,000,000+%8,022',
+    '."50-#470-#530-#610-\'700,000-#900."70,#.50.!m-!8.!8,%0,000,$1.06,)2,000,000,%5,000',
+    '+%9,000-#150-#480-#540."87-#600-#780-#800,!0-"++-(,000,000,)1,000,000,!3,%4,000.\'100,000',
+    ',!5,)6,000,000,"70+0=&pound;s15.0305,&0.5461,%1,000-%34.80-%61.10-$8.45,&2.6638-&3.8713.%8.522,&5.4556,%6,000,\'780.697',
+    ',(dm1.6414,\'nk6.573,&ps10.2.#7.3,%r2.63-0d&dollar;10.91867&2.9397,,tl2,614.6441+!m*%2,009-"36-"87,#110-"35-&42,000',
+    '-"90,\'224,500.!7-"60-"80-"90,\'300,000-"70/$,000,#430-"50-"60-"70-"80.!8',
+    ',-500,000-worth-$21.7-"55,\'600,000-"10-"20-"40-"80,\'700,000-"22-"38-&50,000-"70,#835-$64.1',
+    '.!9-"90,\'900,000-"18-"70.!8-"85+".1,"50,!9+%0,020."51-\'130,000."60-#200',
+    '-#5000$,000-#602-\'800,000-#950,$.000,(0,00,0000+0,000-worth5!0,!2,%3,000,%4,000,)6,000,000,)7,000,000,%9,000',
+    ',#.19,%2,0001$,000,!3-(,000,000,)7,100,000,)8,000,000+%2,114-\'200,000-#500-#600-#700-\'800,000,)0,600,000,)4,000,000',
+    '-$,000.(9000,000,%7,487,)9,000,000+%3,645-#700,".7,)0,000,000,%1,000-".3,)3,000,000+)4,000,000-\'500,000-#640,%0,000',
+    '-!0,!2,)7,500,000+)5,500,000."70-\'600,000,%0,000-".4,!1,!2-(,000,000,!6,)7,000,000+!6,$,100',
+    '-#900,)2,000,000,!4,!5,"95+%7,000-#260-\'300,000-#500."80-#600-#800,%0,000,)1,000,000,#3.1',
+    '-".1,%6,250,!8-(,000,000+%8,000-\'400,000-\'500,000."49-#900,)0,000,000+!9,$,200,#.95,)0,000,000,)2,000,000',
+    ',!4,)5,000,000.#500,)7,657,500,)9,800,000+"m.*%3,002-"99,#133-"70-"80.#8.2,#230.!2-"60',
+    ',#300,#415,\'500,000/.-&dollar;5,999-"30.!2-"60-"98,\'600,000-"20-"70.!8,#748-"50,#923',
+    '-&60,000-"86+".2,"50,!7+%0,300-#500-#700-\'800,000,#.5m,!1,)5,000,000+!1,(,000,000-#400',
+    '."70,)3,000,000,)5,000,000,!8+%2,000-#400-#670-#950,".6,!0-$,000,!2-(,000,000,)3,000,000,!5',
+    ',)8,000,000+!3,$,661-#700,!1-(,000,000,!2,!6+!4,$,070-\'100,000-\'900,000,!0-(,000,000,%1,550',
+    ',)5,500,000+%5,249-\'500,000,+-40,000,000,%0,000,)2,000,000,)3,000,000,!4,#8bn,!m+!6,(,000,000-#580-\'700,000-#800',
+    ',!5-(,000,000,!6,#9.1+)7,800,000,!2-(,000,000,)4,000,000,%5,0001$,000,)6,000,000+%8,000-#200-#440-#830',
+    ',%0,0001$,000,%6,000+)9,400,000,".3,#3.9,!5,!m*!4+(,000,000-"10-&20,000-"45-"82,\'100,000',
+    '-"10-"29-&35,000-$96.5,#257,#300/$,000-"14-"35-"66,\'400,000-"10-"58-"70-$94.4',
+    '-"57,#603,#710-"30.!4-"69-"70-"90,#890,#940-"70+".4,!7-!5+%0,200',
+    ',#.30,)3,000,000,!4-(,000,000,#8.6,!9+"18+%2,900,%0,0001$,000,%2,000,#3.4,!5-(,000,000,!6',
+    '+%3,000-#270,".2,%0,000,)1,000,000,%5,000+)4,000,000-\'600,000-#960,%0,0001$,000,)4,704,000,!5+%5,700-#930',
+    ',!5,$8.45+)6,000,000-#700,#.80,!1,)3,000,000+%7,000-\'400,000,!0+!8,(,000,000-\'250,000,%0,0001$,000',
+    ',%6,400+%9,000,#.95,!9-(,000,000*55,000-us&dollar;7,000-"50-"70-"80,#131-"80,\'233,200-"40,#450,#520',
+    '-"53-"76-"80-"90,\'700,000-"26-&60,000-"70,#800-"80,#900-"13-"90+*-7,000,000+#.77',
+    '+%0,400-#630,+-&dollar;60,".3,-0-800,000,000,)8,000,000+"10-$,450,)1,000,000,!5+%2,490,!1,)5,000,000,)7,000,000+%3,000',
+    '-#600,".5,!6,!9+!4,(,000,000-#200-#636-\'700,000."95-\'800,000,)1,000,000,!5,$9.95+%5,000',
+    '-\'700,000,!0-$,0001$,000,!1,)3,400,000,)5,500,000+!6,$,0000$,000,".5,!0,!4,)9,000,000+%7,000',
+    ',!5,)6,000,000+%8,000+%9,000-(300,0003."90-#960,)0,000,000,!9*%6,040,\'100,000-&50,000-"70,#200/$,000',
+    '-"60,#363,#400-&50,000,#572,#610,#750,#800-"31-&50,000,#924+".5,!7+%0,500-#820',
+    '-\'100,000,!2,)7,000,000,!8+*20,000,000+%3,600-\'800,000-\'900,000,".2,%0,0001$,000,!2-(,000,000+!4,(,675,000',
+    ',!1,!5,)6,000,000,)7,000,000,!9+"55+%6,0000$,000,%0,000+)7,000,000-#400-#500,!4-(,000,000,!5',
+    ',(,000,000-#300-#600,)0,000,000+%9,300-#970,!0,)2,000,000,)9,300,000*)7,100,000,\'250,000.!6,#300,#480,#548',
+    ',\'600,000,#740,\'800,000-"80-"90+".3,!5-!0+%0,600,$.454,%0,0001:,000-us&dollar;800,000,000-#and,!3,!4',
+    '+%1,470,".6,!0-(,000,000+"20-(,000,000,)3,000,000+%3,000-\'800,000,)0,000,000,!3,)4,936,000,!5+"40,!5',
+    ',#6.9+!5,(,000,000,%0,000,)3,000,000+%6,0000$,000+%7,500,!0-$,000,!5,)8,700,000+&80,000,!1,!2',
+    ',%5,700,)9,000,000+%9,000,#.95,!0,!1*%8,040,#100-"10-"39-"50-$75.5,#315-"23,#400',
+    '-"90,#600-"30-"50-$93.4,\'700,000-"30,#800-"47-"51,#998+!0,$,000-\'500,000,+-86,000,000',
+    ',)6,000,000+)1,500,000,!3,)5,800,000+!2,(,000,000-#200,!0+"30+!4,$,0000$,000-\'200,000,!0,)5,000,000',
+    '-#800,!0-(,000,000,)5,000,000,!6,%9,996+!6,".4,!0,)5,000,000+"70+%8,657,!0-$,000,!3',
+    ',!6+!9,)0,000,000*!9+$,100-"30,#230/$,000,#450,#500,#600-"20-&50,000,#700+!0',
+    ',!1,)8,000,000+)1,000,000-#183-#850,!2,)6,000,000.#340,)9,000,000+!2,$,400,)6,000,000+)3,656,000,%0,000,!3',
+    '-\'500,000-\'900,000,)2,500,000,%9,440+!5,$,700,%0,000+)6,000,000,%7,000,!9+%7,000-#500,)0,400,000,!6,)7,000,000',
+    '-\'600,000,".6,!7-(,317,000,!8-(,000,000+"90*(billions*\'million*#o.5).=&pound;0.5963#,lsqb;1,836m)*$990m(#55m#%mdash',
+    ')$well#+ndash;asian#(rehy;and"!-#,administered$"ir#&biased$&ritish##can$&haired%%ilean&"na\'#ese$(olombian%)nstructed',
+    '#(educated$&nglish$\'quipped$#uro#(finished$%unded#1government-funded&!t#$hong#\'imposed$(nitiated$#raq#&leased$\'icensed#"me',
+    '%$xico#+netherlands%!w#\'ophiles$(rganized%(ientated)"ed#/pakistan-backed%$nama$*hilippines#&quoted#*recognized$\'omanian$%ussia#%saudi',
+    '$&panish%+ecification$)upervised#$this$!o$%urkey#$ussr"#.it#$many##now##the"$/are#(european#%japan(#ese',
+    '##our#\'russian##sas$$wiss##the#$ussr#$with"+1.00=6.0398#$8227"\'469,000#%8,100"&75lucy""87"$_any".a&ndash;canada',
+    '$)dominated$"in$%japan$%style$%trips$"uk#".2#0/1989/colour/101$&brazil$&france$$nasa#$1.94#"94#\'af/usaf#(ble-film',
+    '$!f#(ge-based&\'related%!.%"rs##kan#"na$"ce#!s$%shole"#baq#\'ekistan"+c-sponsored#"ea#"hi',
+    '$!u#!p",e&rehy;fully##(s)#!-$&-claim$"by$\'classes$$life$%rates%&elated%%ights$)situation%%tress$\'wysiwyg',
+    '#./environmental$\'non-use$(planning$$read$"to%#win$$used##_so##age#$cure#"d-%"by%&camera%\'looking$\'.mainly',
+    '$!/%)disclosed%\'vintage$/_in_conjunction%\'so_much$#for$"ta$"ul%!p#%exist#"fu%*l-but-dull&(/useless&%ness.*,/uselessness',
+    '&-s-information$"ss#-r&mdash;given+$name$(-address\'(justable&)ttractive&(wareness%&banded\'"se%)catalogue&&harges&&reated&+ustomisable%)dependent',
+    '%\'helping%)initiated\'*termediary\')volvement%&manual&$iles&)odifiable%+of-the-year%(producer%&rather($ings&\'equests%)servicing&*ubcultures%*tailorable',
+    '$#.aa%#pre%#res%#s01\'!2\'!3\'!4\'!5\'!6\'!7\'!8\'!9&"10$!/%)authority',
+    '%(friendly%&module+#/dc%&preset\'&ovider%$user$$:the$&groups$)interface$#kit$-name/password$\'s-2.8:1&,particularly%!/&,consultative',
+    '$&tl.exe#,s-management$!t#"ta%!b"!f"*government"%habti$!k$"re#(er-smart%*ette-style))/narrator)+s/ice-cream%,s/usherettes',
+    '$\'wokunze#$shaq""in$!e$\'g(6.24)%$-the%%.wood%+/disclosing$"or$%t.crl#(t&eacute$)atissimum#!x"(k-ilimsk#!i',
+    '#"ok"(l&eacute#)-endorsed$&novell$)specified#\'/univel#"ar##ess#!p#!w"(m-listed#&/fully##ane$"rc#"on',
+    '#+ea-andreaea#,o-controlled"(proc.crl"#que"#roh#\'prv.qry"*s&iacute;a#"el#&f/lldb#)r-romania&%ussia+!n$$/cis%\'israeli&&talian',
+    '",t&aacute;riz$&iacute#%achis$!d$"in$!n%!e$$ritz$#shi\'!s#*eristrasse#%hinks#&ipraca""ua$*l&mdash;we',
+    '%*ly-amusing\'0/sometimes/never%!y$$rios#!m$"ah#.ricultivateurs!)t&ndash;2"%agawa#"ra##tur""ca#%hanah""d2#"7s',
+    '#&nsills\'0s:rubbish-filled#(rosacral"%heris%$wise#%ority"&ica/st#"el#!l$"ex$.i&rehy;tarians%%sable\'%teurs($ions%/tarian-inspired',
+    '&*y-creating(*maximising($they(\'webbing\'!.\'&/price%%zable$!s#!n"$land"&o-kulm#)pia(1516)&*n-sounding\'!.\'#ist',
+    '#%xeter"&rainen$#que&#ist#(icularia"*sinmalikin$"re#$tein##umi$&nomiya$"ri"!t#&ambhai$&rkashi#\'erance-',
+    '**in-context*(products*&tokens+$ypes)&s-that%$idge%*ly-spoiled%$ness%%words#\'lesbury#$most#-oxeter-burton""uk#"la"+va&ndash;66',
+    '#!p"&decode"\'encoded"%ummmm#\'niitedd#!p##rgh#\'uuugggh!3v&ndash;16&ndash;57"!+"!-##975#)activated#!c#%doped',
+    '#*to-visible"$/ebc#\'visible""as""ea#!p#$rova"%f/uff"!o#\'morulin"!p""re"7ulopalatopharyngoplasty"#ver#!y',
+    '##tec"&chaled$$radd".e&rehy;wilhelm#%-jens$\'wilhelm"#irt!)x-ux-what"%acona"!b"%elles"!i".kidisfumdkudxi""or$!i',
+    '%%local%%ously"$p/ds$#vpp"#xyz!%yanik"!e#"da#"no"#ger##urs""le"!s""un!$zala',
+    '$%k-run%!i".c&aacute;tegui"$elac$!l#$rche##ste"!h"(i-o-gram#"na"\'ochukwu"$umlu#!n"#zda#"el',
+    '$!s .v&aacute;monos)$quez)$rgas),squezjustice#*mp;a/royal&!m&!r#3uml&auml;n&auml;nen&$;sby(+ter&aring;s\'%ttern"$circ"+eacute;four)"ra',
+    '),zinaminister#+circ;tement"0lsqb;incent&rsqb"\'ndash;1(#ill(!x")ocirc;tre#2uml;gelf&auml;nger\'\'kischer\'"lk)\'erkunde)&ischer\'#mel"+rehy;struts!#(0)',
+    '!!+"!h!&-(d)-j"$1000#%650-7##710&#-47""77"#a-t"\'baffles$#sed#$lock"*compatible"#day"%e-r-n',
+    '#!d"-for-vengeance%"ce"%genes#&rooved"#h12"!l"!m##ail"#onc",perforations#$oint#&rofile"\'reading$(gistered',
+    '$!d"%slots#\'pecific#&ystems"!t"!u"&v-very#"en#"ii!*.&ndash;as",/application"#106#!2#!8$#/19',
+    '"#2.2%!1$"32#"/3#$2bis#!6#!8"\'3-based#(.2-level%".5$!4#$/v.4#)2/v.32bis$#25l%"7l',
+    '$!l"%4.0.4$#1es\'&-based#"/5$#smp#!2$\'/mnp2-4$#bis\'%/mnp5#!4#!5"!9#!2"#a.c',
+    '"\'corbett"$d.l.$#u.s"$etc."$fast"$g.h.#)overnment##rad"*herrington"\'i.106ff%*1&ndash;22%$21ff&"6f%$85ff$%328ff',
+    '$%62ff.%#ff.$#9f.$"l.$!p%\'.lounge#$i-ix$#.17%$253f&$89f.%$303f\'#4f.%"40&%84ff.$!i',
+    '&-118&ndash;206&%238ff&$83ff#&v.125f%+72&ndash;83"3jenkins(1877)5ch.d.""l.#\'awrence""m.$"k.#.ini-enterprise"$o.n."&p.hill"#rev"!s',
+    '##exy"$v.c.##ii.!!/"!2#!r""88"!d"#mls"!n"#v/v#!i!$1.11#!5#!6',
+    '""00""11"*2-cylinder$\'powered$%style#!5#!s"!4#!7"#6\'s#(-engined#!3#!s#!t""73',
+    '"".1#!3"!4"#86m""p2#!6$!z!#3.1$".4"#0hl"!1#"00"$2bis#%intfc"#978',
+    '!*4&ndash;5.")2bis/mnp5"!5"$86mx"$96mx!#5.0#!2"!2!#6\'s"(-powered"!0"!2"$34/6"#427#"60',
+    '""70"#rxe!#700#"72"#114$!5#"21"#340#"58#"65#"70"$418.#"72$!4#"93',
+    '"#548"#670$!1"#731#"68!*8&ndash;14")-specific"!.#"21""6m!+9-compliant"#300!!=""16"#2xy',
+    '"%g+c+e!*a&ccaron;e#0rcaron;en&eacute"#\'na"!-##350#&cherie$#unt#(nu-pieds#\'va-voom#"wa"":z"$agon$&sfjord"!b',
+    '%\'t-faced$$rius$&tioned)"rs#"ca$$enic$"in&!a&-e-preventable(\'related\'(/damaged&)ia-rabies(#cae\'#ums&!o',
+    '$"um%"um##ent#$hell%#rin#)illation.%"us$\'nations#)ublotting$*larisation%"ik$!m$$olar\'#ted($ions',
+    '%*us-looking$\'tainers$+um-assisted\'%dried\'(imbedded\'$like\'\'packing\'&sealed&!.\'(cleaning%!s"5d&eacute;m&eacute;cum##0se#"ar#(e-mecums',
+    '$!p$\'r/peers#\'iamians%(nstrasse$)gamangama$!n%&amaina#!s"&erlose$#nes#$ssen"!f"&gabone&%undes$$nian',
+    '#$elos#"hi#!i#%lieri$!y#"na$%iacae#!o$&-bagal%%vagal#+rant-strewn$"is%"us#(ue-sided%$ries',
+    '$!t""i-$$gene##ani#$fale#\'htoehto#$lima$$land#*milihealth#&ncrons$*gloriously$#isi$"ty#+r&amacr;gya$%\'soon',
+    '$\'imorpha##ser$\'hnavism%#yas$&navism$$vila$#yan#(tiekunas"%jacic#"en#!k#$olet#&rathon"!k#%atora',
+    '$&vulewa##ifs$!l%!i")l-d\'isere#\'/tignes#"87#%aable$(nce/sack%&ginien$&quenta$$stro$!t$&uation$*yer-coster',
+    '%#una#/courtemployment#*d&egrave;s$#amo%#rno$$ecir%%maras%,pe&ntilde;as%$rama&&rabano%%ttaro%#zes$(imarsson%"va&#eso',
+    '$%onega%!r&(f-hansen%%stana$#res$"us#-e/oxfordshire$%bjorg$"ch$!e$%house$"kh$*n&ccedil;a%"cc&\'e-level',
+    ')&irtual\'!d&$ies.%"si&$tein%$tian\'!m\'(n-hansen(%e-ish)!r(#ism("o.("us\'!r&(r&eacute',
+    '$%riana(!i&,e/motherwell\'!s&$onas%)osi/rossi%+y-sur-somme$&sciano&!u%#ios$#tin##gay$"us#&hallas$#eim',
+    '#!i$!a%"hd%!n&"at&+t-for-truth$#bus$/d&mdash;message%$-and%0ation/moderation+&review\'#lon\'"or%$date%!e',
+    '\'!y&$tion%"ov$!e$"ma$\'nomycin&$rean$"os$#ses$+um-addicted&!s##jas$#ean%"vo#&karies',
+    '\'#urg$!o$"us$%yrian#(l&eacute+";s$\'abhbhai%"is%#lat%!n%$rino%!t%*yer-coster$)e-bloaise%$cano',
+    '&*y(penguin)%$nari&"ce(0/gloucestershire&#der%!t&!i&#ort&#tas\'"us%!u%,y&ndash;lake&!\'&\'-bottom\'%floor',
+    '\'%mouth\'&skiing\'$wide&&/blyth&"er&"s.\'!/$&icella%!n$\'ombrosa$#uga%!m#&masino$"er$"ik',
+    '%"st%#uth#$onia$"ra%!e%!i&\'sations\'!e&#zed%%ously%%plast%!s%"um$#urs#$peda',
+    '#+s&eacute;es$"ad$)e-scherzo%#lla%$uses$*ler/thames$$peak#)tellinese%!r$"in#!u$!a%\'ble/key("s.)1/money/travellers',
+    '&\'ion-the)*/technical$*e&mdash;or&+rehy;system%*-added-tax*"rs&\'cluster\'(omponent(\'nsensus&)dependent\'%riven&)education&%facts\'"or))-calories',
+    '*&weight&)in-itself((creasing&&loaded&(matching((ximizing\'#ust&)positions&(rational\'&elated\'%idden&$some\'&pheres\'*tandpoints\'*ubtracting',
+    '%!.&+engineering%$/low&$pair\'$rice%%=0.83&#two%\'d-based&!.&&0added%(lessness%"r.&)s/experts()surveyors%\'s-added',
+    '\'&system&!/\'+traditional&!=&#for$%point$"ta%"ta#%vatne$&e-gear&&making&\'trumpet%,/solid-state%.s-per-cylinder&&prings',
+    '%"ng$#ona%&plasty#"ya#\'zoldana"%mbery#%oussa##ped$#ira&$ella&#ish\'#zed$#yre&"us"*n&rehy;his',
+    '$4d&uacute;nemplanning%#als%&riving$(equipped$$haul%#ear&$lten$&makers\'#ing$%sized%$tyle#$able$(diferous&$nite$"tu',
+    '$$urgh#\'ce/owen%!l$%hetti$"il$,liff/shelter$&omycin%#nti%#uer&%leurs&*ver-fraser#+dal-plagued\')resistant&"ic\'"ne',
+    '()ed-though("m.)!s(!t%#mme%%nesse$%eburg%%kamer%#lia&%sborg%\'nbroeck)$ucke\'#urg&$esse&$venn',
+    '%\'r-molen\'%veken&$bank&%field&#lyn&%steen+\'/family&%toorn&$vent\'%illes&/woude-tananbaum/\'nenbaum*,s-tannenbaum%%wiele$%jnana',
+    '%"me%\'nselaar$"ro$!y%)ke-prince\'!s#)e-tempest$#gas$$igen$&rsborg$"ss#$gard$#jel$\'lemesht$*uard-class',
+    '*!t+!s#"ha%$ttan$%engel$#ove#"ie$$lla-()flavoured($like(%nosed(\'scented(\'tasting\'*/chocolate&!e',
+    '&*ylmandelic$&scotte%"h.&#ers$(t&eacute%#ees%"ie%&y-unit&*/apollonia#&kashin$!e#%loads#"na$/er/metropolitan%#ste',
+    '%!n&!g$!o%"na%(zzi/nupe$!s#\'quisher*!s)!s#*risamburgh$#och#$sant$*ittartism\'#%tages%"ux',
+    '$(ongerloo$!s#%upied#%wall.##zie"!p##/vp#$heio$"io$#res#%onics$(rariorum%$izes\'#ing$,ur-resistant',
+    '&#ing)!s\'#sed)!r*!s)!s\'&zation("ed(#ing&"s.&\'wearers##rio$!k#!s"&queros',
+    '"(r&eacute%(grave;se$$lsqb()&bgr&rsqb(\';n&rsqb##(x)#":p#,a&zcaron;din$%flame$%hwear$#jet$#llo$4nasi&ndash;kathmandu%(gerfjord\'%ville',
+    '$!s%"si$$than$%walla$$zdin##coe#!d$\'&oslash$$arac$&haraja&#tes$"os#!e$!a$"id',
+    '%!s$!y#&gaftig$)ha-khadem%#ese$"ol#*i&eacute;s%(rehy;ous$$-eze%%ously%%speed%%width$(ability.&%le(s)(%-area',
+    ')(geometry*&rained)$heat)(interest)%ratio)%sided*%ocial(\'.length(%/made(&s.x(t)\'+y-expressed%$nce*(\'=market&(t/schema%(tion-say',
+    '*\'writing)!.)%=2.5%,"7%)#ism)*s&mdash;as*!.$1cella&rehy;zoster%%ocele$*ed-strophe&!.&(/uniform%$gate)(d-leafed("is',
+    '%#nce%"s.%!t&"ie("s.$$fied$$llas$#max$!n$)o-elmar-r%&ations%&lation%&meters%%typed%)us-leaved',
+    ')$ized\'(ly-sized+%tyled\'!n$#tel$"um%"os%!s##low#%mints$$land##nam%!s$$edoe$,ish-crinkled',
+    '(\'remover\'#ers#!o$$baco$"ne&!s$"sh&!a%"si#\'renikov$&oville$!y#"s.$"=2$%eveld',
+    '$)ovia/tang("ns\'!e$"si#"ta%!n$"eg$"ry$!u##una##vic%"so%\'tziotis#$well#$x:r\'',
+    '$"q\'#)y-between$":p%!q#$zeas"$sant#%cello$+oendophilia%\'ncellos&"ie&%selos\'\'trictor%!s$/ular-arbuscular)0endothelial-cell',
+    '(!t#,e-decorators&&rawing%\'figures\'$lled%$neck%(pictures$\'ctomize$!e$!k$#lin\')e-covered)\'smeared\'!o%"li',
+    '#"if$%jevic$$l\'ev%)ariovites&!s%$ieva&!i&!o\'!u&!s&!y%&yevich($skiy##lav#&netsov',
+    '$\'cactive%*onstricted-#ing$\'dilated)#ory$&motion$\'pressor$)relaxants)#ing$%tocin#\'saletti%"ux$#ell%!n%"ur',
+    '&"re%&gnoria%%lakas&"ev&!i\'$adis\'"os&"ou$$oirs%!s#*t-breasted$"ed%"rs$+ly-superior$%ness/',
+    '%#pol$"ra$!y#!u$\'olation#*ymptomatic"(t-dyeing$$like$$only$$paid##.ii#%/paye#-=&pound;10.81##ana$&tebeda',
+    '#$enen$%riaus&&floris&"te%$land#&hianos$%ouses$&ypetro#&iation$+can-italian(%loyal\'$.the\'\'/french\'!a\'#ist',
+    '#&nabrug#%ogomy$$tomy#$ster##ted%!r#%ulele$!z"(ubernier#\'clusian($enne,!s#!d$$able%&ncourt',
+    '%#sir%\'villean)$ians$#ois$%reuil&!y#"es#\'freland#+ghan-thomas\'&/actor(&driver(&former(&singer)$nail($wife',
+    '($saga%"ni%#ter$%irard##lin$#les$&t-like%#ers%$like#%ntest%!s##pes#"se$%sieux#%ville',
+    '%%owned$&/oxfam$#hal\'#l-a)$opel)%rover)\'varajet%#ill#&zelles"-v&rcaron;inec/(k&eacute#$irie#$lova""wt$"er',
+    '#(-cluster$1host/r3000-target$$only$\'related#%/node$)vme-based&\'s-based##750#(clusters#"ft#(stations"#yas#"da##ehi##res',
+    '""zh$!a!#b-v"!.""l.!*c&ndash;10"#-10$!o#(7/v-1000"$2300"!3"!4"!5##000"!6',
+    '"!8"%am-1."!e#&hicles"&hristy"!i#%toria"%jk808"!p#!i"*rkhovensky"+s-successor"!v!"d."!a',
+    '#!o#!w"!k""mc"!r"#u12!%e-day#\'ri-best$!y#%versa"\'al-pale$!l#)ndercross#$ring$!t',
+    '")blenesque""ca#$chi.#"he%%rnaya\'!y$\'tstreek##ino#!k#"to%#mov%,r&rehy;borne,$like&*-avoidance\'%based',
+    ')#rne\'%field\'(operator\')potential()rocessing*%ducer\'(specific&$/two&$ises&%scope$#ras"+d&amacr;nta#!\'#&antism$"st',
+    '#$dahs$#ing#$ette#"ge#!i$"ma#$more##ova#"ra%!i%"na##uta"%e-jay#"ch$!o',
+    '##ing##jay#!l#%rapan&"pa$$kamp$!y#$stol#$zeet"$four""g\'#\'a-built$(/suicide$$nism$/s&ndash;mammoth',
+    '&$rian%#ion#$core#\'eburger$$sack$\'t-ables%!a&+ble-derived*&garden*$like*+preparation*$rich&*l-inspired&$rain\'!i',
+    '**/wholefood*(s/vegans&#tes\'+ion-climate+&eaters+$hung+\'rituals*)/habitats+(wildlife%$bles##ged$!i%\'eburger$!y#!h',
+    '#(itibbles#$vari"$h/hr#"an#"bi#%ciles#!i$,cle-carrying)*heckpoints(\'licence*"ke)%oving(%parts($soil\'$.the',
+    '((/general)*population%$ules$#lce"&ieroed#+l-and-trail$+/polycotton$!a$#ed.$#han$&igheid$$lard$$tail#"n\'$&-blood',
+    '%&scored$!.$#ier$&quartz$"s.%$tone)!s$\'ticinco$$work$!y#$tata$!h#"ws#!z""ja',
+    '#"ce#"le#$rych##siu#%zovic"#kas#"hi##tor"&lamine$(risation$\'squezes$+yat-e-feqih$&zquez\'#$bert#$come',
+    '\'$like\'$type#"da$"en$"on$!s#$ecky$!d%!a$$hrad$#lla$!m$%risms##icu$"ka',
+    '(2&mdash;academician%!i&!i%"ov\'(skianism,!s$!n%$grad$"zy&&-based\',villacoublay#(k&aacute$!o%6p&rcaron;evorsk&eacute5&yacute',
+    '$!y#)l-dressed$%accio$!e%#ius%+man/alcohol%#tri$$ibia%#nga$#ore%"so%$ttes)!.$!s$(um-bound',
+    '\'%faced$"ve#$mans#&o-city$"ce&#tte%)it&agrave\'!a\'*y-changing(!.($=3.3$+kovskianism$!m%&panahy$%pment',
+    '$!s$$uria$!x#%sicol#&thoven%$uijs$%liner$#man$"ri#(umbrella%"yl$!t%"us$&x-type#"va',
+    '$$eret%"t-\'%black\'%edged\'&finish\'%glove\'$mesh\'&smooth(#oft\'&topped\'&voiced\'$warm&$bean&"ed&#ine',
+    '&"ly&&s-type&\'y-brown(\'looking(#red)#ich$%ovski"&mdalen#%inous"%n\'son#%-yusa#+ables/henry)%sugar$$char$!e',
+    ')!.$$leck$+n&ccedil;io%#cia%"di%!t%#zio$$trix#,da/gazankulu%"ge$"ee%$ttta$#ler$&onnais%"r\'',
+    '\'\'focused\'#led\'*neutrality\'+recruitment&\'/vendor&\'program&"s.\'*/directors$&ramini$!s$!u#$ecio$%delin$*er-presses\'$thin',
+    '$$fica&!t$&rabili\'"ly&!l&#nde("um%!e&$able\'#lly%"is%#oid$\'section$"ta%!i',
+    '(!n$(ux-nadon$&z-vous%$eula%4uela&mdash;supported)!*)*-submitted))/colombia*(trinidad#$flon#%gance$*eance-bent*&crazed*&taking%#sai',
+    '$$loss#$ice-\'6simplon-orient-express\'%where&"by&!s%#off$$emus%%ntium%!r&!i$#mus$"ni$#ons$*refaciatis',
+    '$!x$&zelist#,kataraghavan)$miah&%raman#,ner/forestry$(ootschap$!y#+o-occlusive$,constrictive$!l$*m-carrying&%gland&\'induced&)producing',
+    '$)occlusive$"ur#$sorn$(treparti#)t-a-layer\'%matic&#xia%%gills%$hole%$line%$type%#ure$$ages&#lio%"na',
+    '$&erpost$$idue%&lated.(%ion.4+1/&micro;perfusion,)perfusion+!s(#or.*)en-fabrik&"in%"ve$$less$"or$&racini&"le',
+    '\'#osa\'-ulocordectomy&&loqual*#ise-!d,"m\',"ts&%uclar%#ola%!y$%spils$\'ura.pcx\'&/vt600&$e.as\'%_such',
+    '\'#lli\'"s.&&i-tube\'!a($lise\'"no\'"sm&%ously#$ues.&(/details$"le$(s-adonis&%earth%%quake#%yamin',
+    '#&zuelan"2p&rcaron;ov&eacute""r\'#$-bal$$near$"ry#\'.a.bd.1#"ae$$ment%"in$%ncius%%da-ed\'$h-ed)$like%#ius',
+    '$!s$%trums$!y#*b&auml;nde$(-initial%$stem&&ubject%$with$*/adjective$)al-manual($otor\'\'spatial&!.&$iser)!s',
+    '&#led\'+y-presented)\'trimmed%"nd&"ia%%scums$!e%#lla%#nas$&indung&!g$$jorn$!o%"nd$&phrase',
+    '%%echen%%uggen$)s/actions$%unden##cal$&ellina$!i$#lun#!d$$ancy$$eans%%lotto%$rame%+yen/teacher$&i-gris',
+    '\'"s.\'!y%)enstkreuz&!u\'&social%!t$\'on-like&$elle&!k%!t$,r&auml;ngung%#oss$,ugo-urquidez%#rin#\'e-hodge',
+    '$\'inigtes$)llapublic$%ndrye$)shcbagina$(thraghna$\'y/owner#\'fassung*+sbeschwerde+%chutz+-schutzbericht+&widrig-*rklichkeit$&ilzung$.remdungseffekt#!g',
+    '&\'grave;s$&arshei$(e-period%#hen&!t%%legen%"ne&#tis%$ssen%"ze$%ilian%%nella&#ius$&lassed%$eich',
+    '$$ogna%"te#\'haeghen%#gen$%eugen$\'ofstadt$$ulst#!i$\'ability$"ca&!l\'"ly$/ficaci&oacute;n()tionalist$$kios',
+    '$\'similar%$opht$(t&agrave%$chev%"ec$%zoglu#$kade%*ufstechnik\'!t$#ehr\'*sb&uuml;ro\'#ung%$nnes%"rk$\'hoyansk',
+    ',#ung#$lags\',gemeinschaft%.ine-orientated%%ngen\'$1eger-arbeitskreis%&umdung$%igtes$%orene$$ucio#1m&ouml;genssteuer$#aak%#rkt%%seren$&eerian',
+    '%"il%%ntino%!s&\'/oxford%0ulen/oxfordshire$\'iculata*!e*"us%$fuge%"is%"js%#lio(\'n-lined)"ed%/n&rehy;infested',
+    '&)-infested\'\'killing\'%poles&!e%0ttlungsausschuss$1oegensverwaltungs%#ral&"el(!s%$uths$%uelen#+nacularisms+#zed%%dskii%#lis',
+    '$#ear%!r$"ia%#cos%!e%"or$\'on-hunt&!e%!r%!t$!s$#uft%#nft$!y#&occhio',
+    '$#ica$!n%&a-born%!e%"is%"na$!w#)pflichtet*+ung/frieden##rai%!n%!y%$zano$\'e/boite%$auxi',
+    '%!e%!i%"tt$#ine$"ri$$ucae&&ivorus#%s-ion$$acad%#ger%$ille)(s-kitsch+%style*!/%$lity',
+    '%"nd$$cace%%haeve&$oyle&$uier\'#ren$-e-and-refrain\',utobiography&(contests&\'epistle&#man\'\'ovement&%scene\'\'entence\'\'peakers',
+    ')%cific\'%tyles&\'tragedy)\'nslator(%ibute&\'writing%!.%&/first&\'swedish%$atue%"nt%"s.%!y$$felt$%hinin',
+    '%%liana&#los%#nes%*on-centric("of\'".i\'#ing\'"s.\'$tool%$tile&!y$!n$"o/%"va$\'t-eegee',
+    '&"nd(%igung$+uchsanstalt%&s-evil#(t&ugrave$\'-galant$0ebrae-shattering(&l-body(#ria%4idigungsa&uuml;ftrag%"re$%heuil$-i-kill-ar-tar%%brate%(cal-axis',
+    '*$lope($lata)(y-angled,\'rranged+\'mounted+(oriented+\'related+\'sliding+,unchallenged&!e&$illi%+go-inducing\'!s%$nsky%$soft',
+    '$"ol%"ux%!v$$ragt&)uensvotum$$uoso#&ucchio$#ela$#lam\'#ion$"m\'$!p#*ve/scorpio%#eay$$iers',
+    '%(hrlosung%+ltungsrecht$"ey$%irret$(oerdburg%"od$$undt#&y-blue%$deep&&istant%.hard-to-please%-low-frequency%&nearly&/icely-thank-you%\'quickly',
+    '%*small-tree$$.few%%large$#ard$\'exposed$&strict#)zeichniss%#ray""s.#"ak#$cari#%elica%"ka##hem#-i-ku-lar-riya',
+    '\'"ia)$ceae%+ularization$!l$"on#"ko##per$#ula#\'sailles%%ntara$,el-cum-yacht\'&liquid&$/who$"ot$#sel',
+    '$#als$$berg$+ed-interest%5y/chairman/cheltenham(+onstituency$,ibulo-ocular)(acoustic%%gials%#tus$/mann&aelig;yjar$#ors$#rae%1fararv&iacute;sur%$ique%"um',
+    '$$utus$!y#$utor$!v"$tark$!t#(ch-retch#"ea$)ran-cycle()dominated\'$orum%*inarianism)(y/health#%heuil#&iveria',
+    '%(wielding$#ers$!n$%rlank#-ranovi&cacute$#ice%!e$!o%!z#%s/pet#*ta/english$"el%%rlein%"se$"ii',
+    '#$yver"&uillot#$x-tu"!v##ers"&whicle##sof#!y"$xant#$edly$"th#%illum##tra"(y-is-mir#$atie',
+    '#!r$$ines$"on"\'zarat-e#$elay%"io#"ga#"zi!$f-14"#/cf"#500"%a-hco"!d"!l"#q65',
+    '!"g."$1460"&a-bios$*compatible$%jongg#%/mcga""pb#"w2"!r"!s!\'h&ndash(1;aqj/a17&ndash;26)#caa*"dl*"zz',
+    '#1lao/0&ndash;38320##sbo##uth##xxv"&.there"#/vl"$f-fm$)telephone#$/405$"df$#vor"!h"$s-hi#(/betamax"%w/tba',
+    '#\'ndash;x$\'tilde;a"$\'let"#(2)"!-#-in-the-mirror#&o-lets#!v$"ii#"xi"$.131$!7#"20#"38#%47ff.',
+    '#"89%#ff.#!9$#0.3$!1"(/dalgety"1a&ccedil&atilde;o#$bles%#ity#(duct/car##fax#-g/continental$"gi#\'l&mdash$"ou',
+    '$"ne$*sson-ponte#&pechio#%ticae$"ka"#bal#&ebukta$!d%#-up$$less$"rs%"ti$"sy#&hushan#"ra',
+    '%&scaper+!s%,ted_by_means&%ingly\'/onal/electronic+*ly-excited%$zone$!e%!r$(ionaceae$!o%\'-dagger&&knives%%champ&$orer',
+    '%$stat",c&ecirc;ncia#&\'n\'bob#0-sur-c&egrave;re(&seille$&tor-ee#&acious$9ire-g&eacute;n&eacute;ral$(r-choral%!/%(age-like%"ii&\'ousness&"sh%)s-general',
+    '#+e&rehy;like**presidents$)-admirals,"ty%(captains&/hairpersonships((ncellers-$ors.0#hip&(ommodore\'%nsuls(%venor\'&unties%$dean&$ucal',
+    '&*uildmaster%&keeper%(marshall\'#yor%\'plagued&&refect(\'seident)(idencies-%tship%&rector\'$gent&%idden%+secretaries$)captaincy%&omital',
+    '$&domini$$less$"nc&"ia$)president$)royalties%!s##het$+y-appointed&\'treviso#"in%$alis%"us$>ous/spiteful/sarcastic/violent\'\'burgers',
+    '#\'k/coach$$ares$"ed%!r&+s-armstrong\'%/bbdo&"ys$%sburg##olo$"sa$#try#!t$\'im(iii)&&-based(&laming',
+    '\'&impact\'%to-be&!.\'#the&)/employer&#age&!e&$hood&(isation.(!m\'#zes&\'ologies&"s/$!o%*r-emmanuel',
+    '\'$rowe\'%smith($tyle&%banks&!e&2ia&ndash;vancouver(+-folkestone)\'gatwick)$surf(!e(&n-born+/yzantine-gothic*(inspired)&/tudor))a&mdash;i',
+    ')%ising)%style\'#nus\'$ous.&"s.&"y\'\'\'-emblem(\'incense*)scription($play$#rex%"ix%#ola$&ualers\'#ing',
+    '%!m#*u&ntilde;a$#nas""d.#$alia%!s$"ne$$urri#!c$$asts#"dy#)e-printer$$bech$!d$%licet',
+    '$-o&rehy;arcade+(recorder+$tape/!d,+ransmission%&-audio&)blackmail&&camera\'$lips\')onference/#ing)\'trolled&$disk*!s\'*uplication',
+    '("rm\'%ramed("ee&.game-addiction&)intensive&$juke&%links&&makers\'&ethods&#new&"on&%phone\'"op&(recorder&&screen',
+    '\'&ensors(&ssions\'#ync($stem&&taping\'#ext\'#ype&$wall%#.it&$tape%$/3rd&#abi&\'british&:cheltenham/gloucestershire\'$lare',
+    '\'(rowmarsh&4elsfield/oxfordshire\'$wyas&*film-maker\'%ormer&&gareth\'%raeme&\'harriet\'*ove/sussex&#ian&,m4/wiltshire(.0/warwickshire\'%emory\'#ike&&oxford',
+    '\'$obin&%super\'0windon/wiltshire&5tetsworth/oxfordshire\'!v%!0%#box%&camera+!s&*onferencer/!s&$rypt%!d&)isc-based("ks',
+    '&#ilm)!s\'"ts%%games&$enic&$rant($phic&$uard%&makers%$pole("is&)rojection%$rama&\'ecorded%\'screens',
+    '(!w&$onic&#tar%)telemetry\'\'x-based&"on\'"ys%$view%$zone$#pay$(regaende$"te#$film##gin#$imus',
+    '##kun#$mail##oes#&rieros#&yarthi"%eanne#&dotape#&hboeck#"il%%lesse&#ori\'!t#"ja%!s#&lerley',
+    '&"rd%"es#$ndra$!e%#tta$\'na-born(\'udapest%,ese-inspired&$ttas$$s-je#%otape#%rikko$#ney$#tal$#zon',
+    '#+t&rehy;minh*#nam$\'-namese$$nam\'\'$-era()supported\'./cambodia/laos\',ese-american+\'chinese+(language+\'schemed,(ponsored+"uk,!s*!.',
+    '(&zation)#ing\'!s$(sovpetro#\'ux-port#%ville#*w-blockers%$data&\'ig-file%\'factors&%inder+!s%$hole%)indicator$%/this',
+    '$#_to$\'ability$#cam$-data/teletext$,er-activated(%ppeal\'(friendly\'.in-the-picture\'+orientation\'(response\')supported&\'/reader&$land$\'finder.%$orth',
+    '$0ing/appreciation$$less%!y$&master$%plate%-oints/empathy$3s/culture/political%\'tations$$team%#ron#$zzar"!f#"as"*gan&ograve$!r',
+    '&!s$%ntina#&fusson##ger$$iano#"ie%"rs$"l.%"ae&)nte-style(#ism&"te%$ence%!i&"as',
+    '#$nati$#eti&!o&$te:2(!d%"ux%\'y-welsh$%obles%$lles&!o%#tte(!s#"or%2ously&rehy;wielded*!.',
+    '&(/languor&#eux&(lessness&%ously(!x"$hara##man#)re&auml;t%!t"*i&mdash;ix$,ndash;xxviii#!+#"-c$"vi$!x',
+    '%"04%!1%!8%"96$#27f$"33$$50.2%"7.$!7$"87#"/4#!c#&i&lsqb$$.126%"22',
+    '&!9%!4&!6%!5%"69$&iiilla$"th#"js"\'jandran$!u$*yabhaskara&!m#"en#"li#"th',
+    '##-mo#"an%$orum$)rbureauer$!y#"ic$(ng-leman\'&period\'#run&+/mbus-based\'(national\'*supersparc&"ur#&lehnik)!s',
+    '#\'torenko&)iastrasse#$zhel"+l&rehy;lain#%agers$#ire$$kazi$%rdell%!o$$suso$(vicencio$"ya##bis&!s$#run',
+    '#!d$"an$&ebeest#)e-tasting$!n%!e&$sses#&forado&"de&!t#"ia%"me$&fiable&"er$"us',
+    '$)oenskroon#&kaviki#(la-bound&$type&)with-pool%!1%!5%$cero&,h-klagenfurt%#dom%&escusa%&fuerte%!g&-e&mdash;temps\'$-\'my',
+    '(\'centred((dwellers-#ing(&museum()policeman(&school)%oviet)\'tandard)%uburb((teachers)#ype(%world\'!.\')/bicester($town',
+    '\'/rs-subsequently\'"s/&\'isation%(in-clown($hero(%proof\'!e\'#ies%$land&"ta%\'mariona&$izar%!n&+&rehy;draut&#dry',
+    ')"he&!s%-quir&aacute;n%-rd-mackintosh&!e&!i&$roel&"um%%senor&#uso%(vicencio($iosa$&e-like&)sur-ancre+#rce',
+    '%#gas%$juif%%laure%$more%"na&/euve-la-garenne,*es-avignon%-rs-aux-noeuds(6cott&eacute;r&ecirc;ts,+er&ecirc;ts%!s%\'urbanne,$-sud$$iage%#cus',
+    '(&public%#gen\'"rs%#ons%\'s/kelly%!t$$lage$#ons%$resi%%slada&"us%#tte#%morin##nis$!o',
+    '$"ya#"on##ter#$uyos#%vorde")malaratne#&ercati#$iera$#nal#\'outiers#%ukthi$"le"+n&acute;rna#"al%"on',
+    '$#ver$"ya##cas$(e/energy%%ndeau&\'t(1987)\'&-evans($like(%welsh\'$/gwr(%oxfam(#raf\'"io\'\'justice\'!s',
+    '\'"io%!t$%henti%!y$\'i-style%!o%#tic$#kei$#ler$#ulo$"ze#1dac&lsqb;ius&rsqb%+loo-stained$#eby%*l&oslash;v',
+    '%$sine$$hyan$&icator*!s*!y&.tive&rehy;ness%!s$\'ogenita$#rey#)e-growers%$hung%$leaf%\'studded(#mps%\'tangled',
+    '&\'raining%\'wrapped$\'/family%(glosters$"ae%!m%$tica$$cash$"et$*gar-making(&pisser(&soaked(\'tasting\'"ed\'#ish',
+    '$!n$$ries$$s/ip$*yard-owner(%laced#%gcard$&oleuse$%resor#\'haticos#%icola\'!e&#mbe%&ulture$#que$"ti',
+    '#!k$"el&$kopf$$ovar#"le#%negar%"ll%!y$&icombe(!e%"es#\'o&mdash$\'gradoff)"va$#lay',
+    '#$sauf$#ons#!t$"en%!r&!s%#uil$!i#%yards$.l&rehy;covered%\'-backed&(surfaced&%tiled\'$o-cd\'#ype',
+    '%,/cassette/cd%\'alcohol%%ester%$ised#$zenz"!o#(chemical#"in#(l&agrave%)egrave;ne$)-da-gamba$(a-machin&&player%#nte%%te(s)',
+    '$"en&#ce-)(affected)$free)3grievance-attempted)*monitoring)%prone)\'related*%idden)+threatening((/attacks)+malpractice(!s\'"ia&"t\'',
+    '*(wrenched%\'t-brown\'#dye\'$eyed\'*ink-filled\'#lit\'#red\'&tinged*#ted\'&yellow&"ly&%s/sex$#in\'&&-cases\'&makers',
+    '\'&string&!e&%istic&$s&gt$"le$#nce$$ogen%"ni#$nnet#!r##tti#"ut"&p-like#8/first-class/full-dining#)atasilpin',
+    '%#ish%#ous%"s.##one#(ralabhda""ra$&bongsa$%cocha$#ges%&o:1984$!j$,lly-infected$#nda$&vaidya*(minister',
+    '#"di%!n#"ed$$s.at%$cens$#yas#&gaters&"um$!i%"l\'&-ian-dantesque\'#jus\'"us&!o%-n-blockbuster',
+    '\'$like\')materials\'%owned\'(violator&&/whore&!a\'"li)!s("ls&!e\'!m\'!s&!i\'1a-creeper-covered(!s',
+    '\'$ties\'"us&"um$*o-guest/st#%idans%!e%2ian-orange-magenta&%flora&"ne&%ssima\'&triata$#gio$%lity\'&"um%$ocal',
+    '$"no##kie#&mishin#$nich#!o$#ids$"li%%ogist$&mandui$#sco#!r$$eina#$scan#(t&ugrave$$anen',
+    '$!u%\'alities\'#ly+)(-unknown%"e\'&!.&%/vice&$herb&#lle%&ocracy&+so-standard&&usness(!o%"ti\'!s',
+    '$%s-bub&&expert&#hcv&\'induced&*luciferase&)resistant\'"na&+transformed\'.urned-epidemic%&can-95*!7%&es-one%%guard%)infection##vus',
+    '#!-$0&aacute&rehy;vis&.grave&rehy;vis+$;vis$$-vis#,_&aacute_vis#)a-forging%%versa$\'/access%)cashcard/%*mastercard$$card$"it$)khapatnam$!m',
+    '#&caceae\'#ous%#ria$-eral:vascular$!h$!o%(-elastic-#ity%"id%%metry%"na&$teum\')i-giulini%%sity.&%uisse',
+    '%&unties&$sly.\'$ness$#usi&!s#,ean/namurian$)comodorio$$gard$!o$#tti#)hakapatna$"na%\'evskaya)!i$"va',
+    '#"ib%$iity%0le/near-infrared)*on-visible("uv&$y_in$$cord$#dle$!e$"ga$)on-ghosts\'.interpretation\',of-hell-drug\'&spirit-!s',
+    '\'$ward(&earing*$ving&!.&$/400\'%state\'\'version&%aires\'.ry/allegorical&#ing$%phone$!r$"st$$t\'st%(/contact',
+    '&#ble&"nt(!s&!s%#ed.%$herm%(ing-list-!s)%place)%terms%4or&rehy;inter-active\'+-frequented(*orientated(\'related((spending',
+    '\'!/&!s%\'s&mdash&\'-a-week&./consultations\')exchanges\'$time#$king$%ovaty#$mara#!n$!u#)o-spatial$"ko$%nware',
+    '%$tron##ram#&sarion)&ovitch$(iparious#!t$"ar%"s.$!e%"ch$"or&#ian&!y$"ra%!o',
+    '&(-display.+-unit-based\',experiential\'%field\'.reconnaissance\'*similarity(\'ymbolic&(isations(%e-the&3ly&rehy;handicapped(\'-guided)(impaired)*recognized$+o-spatially&\'tactile',
+    '#\'wanadha"&tabank$$ceae%#oat$"e\'%\'-bodied$#fit$)l-witness%\'epublic&"rt%#ian&"ev&!i&$sant\'!e',
+    '\'!t(!s&#zed%&ograph$#mic&$n(s)\'*-deficient(&oozing($plus($rich\'"as\'$ized$#nda$&pointe$$rome',
+    '#%ebsky$!c$$hall$"le%#lia\'#nus&!o\'#gin\'#zzo%"mo$!s$%zslaw#\'hayasai##iaz$$cola',
+    '\'$tori%)ultivated,#ing(&urally*#ist$#eri$&folium$$ligo$$mins$"na$%ously$#ris$\'s-idaea#%nemal#$on-b',
+    '$"ux#(r&eacute$.ay-meyerovitch$.eous-enamelled$$inus%!o&)-spitting&"la%"te$)o-ceramic-!s\'#lub%$lles%#nix#$snyi',
+    '#"ta%#chi%"ta&#ina$!o%%riana\'"ni\'#osa%!z$#rio#!u$$ally$$lina$*peratively#!z',
+    '&!s$"ir$%ldian$#nts$%rinis$!x#.ek&amacr;nanda%%nagar$"la$9ment-r&eacute;citatif-air%!o$$nair%!s%$tium$"re',
+    '%$rina$#tte$!x$#zza#$iane$)dly-drawn($hued$"er$!o%"ns$$para\'"um$\'secting)&onists+!s',
+    '*!s&"nt$!t#\'o.these$#/in$"ns#(reations#!s#"um#%yenne"&xenish")yacheslav$&paraya"#zas#*favourites',
+    '#$ored%!s$"so$$vice#"um#$zola!"jb"!d"!j""li!!k"%hodit#&utemas!,l&mdash;left""/r',
+    '"*a-4(cd49d)%\'/vcam-1$!7#\'anderen#)cheslavas#%dikas%\'mirescu(%skaya%\'slavich%\'vostock##hos#!k#"s.$"al$"ic',
+    '&&upolou$!t%!\'&"iu%!i&#mil&$slav%"os"#cek"!d""ei$!s"\'iegclub%"er$"rt',
+    '#\'ssinghe#*w-on-alpha"!k#"sm"#lla"\'orewere"\'si/cmos"&uables#!g#"me"%ychia#%khada!&m/3812##cms#)directory',
+    '#+interactive$#pcs%!f#"sp"!2""30#"70"!7"\'account"%batch"&e-3000$!x#)bus-based#$exec"!g',
+    '""ro")s-on-unix#$1000#$2000"#tr2!#n/2#"vd"*derstandes\'&ondyng"#eir#,sheconombank#!t#\'xpected""ii#(verselle',
+    '"$made"#odd#(uercomyn"(prepared""to"!u#$kovo"%weldy!$o/v1"!2""ar"!b"&c-like$.voc-vocabulary#%ablry',
+    '$&cionem$/l&rehy;isations%%-cord%\'/rhythm%#ism\'%simus\'+t/guitarist):multi&rehy;instrumentalist)&rapper&#zed%&s-only&\'/guitar$1tion-ally-trained(*al-courses*//non-vocational',
+    '*)ly-biased&.vely-indicated%"us#"es#\'iferant\'\'ousness#\'ubulary"#dac$/fone&rehy;based(\'-linked$&novich#$dies#"en%\'icharov#+ka-and-lime',
+    '&%based\'%ottle&%clear&(drinking&%laden&\'martini&&sodden\'\'wigging&\'tippler%$tini#&ochody$&novich$"un"&egelin#%lcker',
+    '\'%markt%"le#"na$$naia%"oe&"go&)sluzhilie#!t"/g&uuml&eacute;s*%grave#"ae$!n#$eler%!s$&nhuber',
+    '#!l$\'adensis$)er-clerks#(t-goknil$$land#\'ue-like%!.%#ing&$shly%!r$%ishly"$hmer#%umana"*i&eacute;s#1ce&rehy;annotated',
+    '%&-based\'%ubble&$coil(%ntrol&\'dynamic&%grade($oups&+independent&$line\'&ogging&*magnifying&\'pattern\'&rinted&\'quality&+recognition',
+    '\'$rack)%ining&$vote&"we\'#ise%*.everybody&$just%!/&&speech&#the%%boxes%%d/th/\')voiceless&#ial%"in',
+    '%%print%!r%*s-go-round&!.%%works#+d&mdash;but+"no$%-bird&$rain%\'filling%$gulf%$like$4able-but-not-avoided$$less##ent',
+    '#(l&aacute$"la#&novich\'#tch#&rement$"on#,th-schneider$%sberg#$vode"%jvoda&0ina&mdash;vacant"#kes"*l&eacute;s%\'grave;e#!-',
+    '%!4%!v$!3%!5$!4$!8$!9$!i%!v$"lv$!v%!i$#xii#"/g$\'vol/vol',
+    '$\'vol:vol#"ac$"ge$#nic%#sky%"ts$$puke$$rome$#til\'&e-poor(!/\'\'isation(#zed##cae%!n',
+    '&-ic-exhalative)$free)&hosted)1ophiolite-granite()/plutonic(+ally-warmed(\'lastics&/o&mdash;related\'\'-forged(+sedimentary)%haped((tectonic\'\'logists\'(tectonic$#ker',
+    '$"uf&%/high#+e&rehy;like$%-like$!a$"es$#mic$#nte$#ris#!f#&ga-don&$ural%!r#&hynian#!i',
+    '$#era$$tans#$kani$#elt%!n%&rkunde$%gonov$&ischer&!t$)off(1939)%$nsky$4partei&mdash&ouml;vp$"s-&%union&%wagen',
+    '%(deutsche%%geist\'*meinschaft%\'kanzler%%opera%,partei/parti&&oliqei%$raad%%sturm*$mann%,t&uuml;mlich%%union%*wagen-audi*(stiftung&%riter',
+    '$$wein##lam%!n$)ekspartei%%nberg%!r$#ore$"st##met#"na#$odia$\'kolamsk$)nt&eacute&$arie)#ste',
+    '$%sinov#/peliere-pierrot)"re%!s$%ierre#)s-au-vent$%cians$"ec$%tatic%#ead$#ung\'!s#\'t/metre$,age-changing)4ontrolled-oscillator',
+    ')\'ropping(/ratio/frequency\'(/current%(ireanism()education$!e%!-%%rrano$$mann$!o$\'s/metre%%wagon##uem%#rit$%me(s)',
+    '\'%based\'+compartment(%ycled\'(plastics()roduction\'\'selling\'+temperature\'$wise&!/\'(doubtful\'&pickup\'\'surface\'$tone\'&volume&"14',
+    '&!d&(s--6,000&&trical%)inousness&"se&#zer%%teers$!n%,&rehy;tarily/"sm.!y%\'tairily\'#ria)!e)!l',
+    ')--professional)!/**charitable)#ist\'#tem&%eeers(\'r-force*#run)%s.tim*#=79\'"rs$$peer%(t&eacute&%arian\'"te',
+    '$%stana$"ta%)e-handles%#ing##ver$\'iferous$%ograd##yen%"rs$$nsky"*mero-nasal&%nasal#&inting$(t-filled\'$reak',
+    '%$ific&\'ng.they%&oriums&"us%"us#"my"+n-der-heydt#$cken$%ramon#&delhof$"ra#$gara$$phet$!s#"la',
+    '#%tobel#\'unteers#!y"%odism$\'oo-call\'#men&!s#"mf#*rbereidend$$hout$\'nitgang$!s%%anger$!t%&rekker',
+    '#!-#!.#%agine$$nart$!x#$bach#-derasiatische&%gasse&%rhein&%stadt#.echovsk&yacute#$ghan#"is#!k#%lager',
+    '#&obieff$%nezh\'%#ina%#kov%#ovs%$psov%$tsev$*shilovgrad$\'tyntsev$!u#&posten#*ratsstelle#%shgar$(itzender$!t',
+    '%&ellung%%udium##tac$\'ex-like$#ice%"sm$\'ographs%"il#$welt$#ish#\'zittzas"*s-stricker#&cherau#&elsang#%kepar',
+    '#&sebein$%ische$&taniye%%rasse$&winnel#&tochny$"re$!s"&tchina#$e(s)$(-chasing&$ount%+endangering%)gathering&\'rabbing',
+    '%(maximize%-of-confidence%\'winners&)orthiness*!y$&.worth$$/men%$work$$less$-r-familiarity&\'vassals&&wooing%!.%*/non-voter%+s&mdash;was',
+    '%%-8.66&(per-seat%#_at$%votes$!z#!h#,ing&mdash;in&!*&)-oriented\'%power\'&rights&!.$$vely#%kinsk#"ro',
+    '$-her-clutchers(\'holders(-privatisation\'\'/ticket\'"ed\'"s.#%drait&!s#"et##les$#oir%!n##mes##nna#"ri',
+    '%#ure#$vant"#ver"\'wchurch#%el(y)%\'-change&(phonemes\'-lus-semivowel&%sound\'%ystem&$type&)variables*"ed%!.#"ls',
+    '"&yage.j&!d&)s/sailing&#urs%"ie#%elles$&z-vous#"le##net##ons#!s$!e#%vodic"$zene!,p&mdash;left',
+    '""-1$!6##4vf##kjl$"nu#\'viscose##ytt"#/va"!1##200#36/etoposide-induced"%2/vp5"%3/vp7"!4")6/ns1/vp7',
+    '"(h-1040qm"!m"(o/abbado$)bernstein%(oskovsky$&maazel#!n"$ro-4"!s#\'tanding"$x220$%40/10!"qu!+r&scaron;ek"$-bob',
+    '#%o-o-m"!.""15#!7"#249"!a#%alsen##ies#!m##nch#&tislav$#nik#!u#$xoin"$bnik',
+    '##ede$%lands$#man$$vurg#"lo#"to"%iezen#!n$!g$#sky##que""nv#"wy")olijkheid#.omen/jewellery',
+    '%#ing%$king%!m#"uw"!p"$room%$ommm"%tx/os"$ubel"!y#%burgi##nwy!(s&gt;vdb#&lt;vdb"/(correctnewpos)',
+    '"&/cobol##hvs"%4c/5a"(at-based$!s"!d"\'e-based#&obecna#%velod""li"!q"!t"$urpt""vm""x3',
+    '##atn"%1-vt5#-00-compatible$#428%"31""22"#340#"62"!i"!o"#r21"\'terance%"ly%%moste!1u&ccaron;i&cacute',
+    '#-mdash;flemish))patriotic"%arnet"%cedol#!h$%etich"-elva/volviera%!e#!s#$taki"$ibau$#ert#!c##dar#&llemin',
+    '#"ic%!a%"ic#$ovic"%kotic&&novica"(lcanello&(ian-type\'#sed(!m%%therm$#hev#%gaire%$rbia&"ia',
+    '(!e)"rs("ms\'\'zations(!e&,ly-appointed%#tus$!i$"us#3i&ccaron;evi&cacute$!c##kan#$lnet#)nerabilit((le-parts',
+    '\'"ta$&ificus##pia##tur&+e-investors\'"s.&%nense#*va-vaginal%!e%!s"$ndla#%ibobo$$valu""rm#"ry',
+    '"$zzen!*va&ndash;3"!c".d&mdash;people"#ill"#wr1!)w-branded"!a"!h#"dc"!r!$x414"#770"#gdb"!i',
+    '"#mon""or"!s"!v!6y&scaron&scaron&iacute)/;ehradsk&yacute"+-nay-grette"#aas#$ches#"li$!l#(zemskaya",drn&iacute;k#\'ubitsky"$esna',
+    '"#kom#"sa#$ypel""nd"#rle"&sotsky"!v#"er#!x!$z58p"#608#"34 \'w&amp;f&!j&"re',
+    '"&dollar(";g"&egr:nt&!t"/lcub;211&rcub;-"\'mdash;n"%ndash\'&;atson(#ell"*oacute;den#*uml;lfflin)!l(%tgens\'(rterbuch"-pound;edwards',
+    '(!h($king"0uacute;rttemberg#,uml;nderkind\'$pper\'#rst("th))temberger0&isches((zelbauer\'\'stefeld\'&thrich!"\'0"!1"!2',
+    '"#don""en"%haven#\'oughton"!n"&oopin\'")sgenerous"$tree!%(ilf)!"-1#!a"!4"!6##912"!a',
+    '#!s"!b#$ased"*categories##ell"%e-ell$#i-r"#hat"%i-t-h"\'o-m-a-n##uld"(particle*!s"#reg"#the',
+    '"*w-w-w-wogs\'#ant\'#hat%"ay%)ilderness#"as##ear#&haddya$!o$!y##ill$$nter#!o$"ol$%rried',
+    '#"21"!9"&a.a.a.$"b.$"f.$#s.p##mos#$udry#"xi"$b.e.#%right"#c.1$$j.s.$!s%!.',
+    '"$e.f.$"j.#"re"$f.n."$g.t."$h.f.$(playfair$(smith/do#"am#%eslop"!i"$j.a.%(lexander$%firth%\'otherby',
+    '$%perry$"s.$"t.$"w."&l.webb"$m.s.#&etzger#\'idlands"%n.b.s$)w.-e.n.e."!o##.g."*p.kinsella$$lind"+s.churchill',
+    '$"r."&t.c.c.%!h"$v.r.!%/2000""50"#cpl"#day")full-text"!h#)&amp;sup2""kg"!m""r/#$usso',
+    '""up""vo!"0i!%1-100#%based"!."#/po"#020#"41#"53"#130"#24s#$82x.&%/f508\'&w1282x',
+    '$"12#!p"$v2bp!$23.5""62"!7"#xbf!"30#!2#*3&ndash;1a,!b"!2"$5467"!7##-40',
+    '!"40""20""9n!$5644#"77""y1!%70-80""56!%80797!%=0.01"!1"\'35314.5#&9799.5"$well##hat',
+    '#(l-shaj\'a"!-#%224-p##8-l#$a-ah#$e-ro#&ha-was$"ey"+/08/25/0001#*27/63/0001#,35/25/0007-1"/568.310.113,068#"91""67"#803',
+    '"\'aa-waaa$-aaaaaaaaaaaaa*!h)!h&"gh&!h%"gh%%keeee$"hh$$ives#\'f-issue##gen#!h##nds$!t',
+    '$"gh##sen#%tchin#!u""ba$"sh#"co#"er#%i-kon%$like$!l""ca#!b#.c-commissioned%)indonesia',
+    '%&member%%north%)supported$!s#!h$!e%#nge$$ovia%$wski$!s%&/house%$mann%)regimente##ked%$rman',
+    '\')-observed%"ng##law#"os#!s"*d-carrying#"ak##dam$"er%#son%#ton$$ings\'+ton\'s-style$(le-alike&%dance',
+    '#)e-bramble%&martin$%/head%&oxford$+bridge-port$$ford$#ing$\'sbridge#$hams\'&/shape##is.##jet#,land/brother(\'missing$#ess',
+    '$#ing$"ow##man$#ore#\'oanshin$!r$$wice##rop$-up/department##son$,worth/tenant&"th#%worth(!s"!e',
+    '#"le$!t#$rden$$mund#"ta"!f##col#\'er-like&\'machine#"fe%4n-grenadier-division&%farbe$(le-irons\'%maker\'(textured',
+    '#$tage$"er&!s"*g&mdash;to#,-at-the-wall$\'o-meter#%addon$#nda$"yo#1e&rehy;bargaining*%costs*\'earners*&labour*&packet$+-bargainers',
+    '%&change&#ost)!s&&utting%%drift%*employment%&freeze+!s%)increases\'(dexation%%money%&paying&1rice-expectations+%index%$real',
+    '\'(gulation\'*lationship\'$ntal%%scale&&etters&&lavery\'#ips&(tructure$&/price$*d/&pound;8$(lessness$!n%$berg%$heim%%ingen',
+    '%&knecht$$ring$)s-auction&&prices%!.&$that##ger&"ly&!y%!s%"tt$"gs$#in\'&#gly\'!s',
+    '\'%steps&(r-fished$\'on-door\'%loads\'&spokes&#bau$!y#&henaer$$orns#"ih$!s##lan$&elocal#&ner_et&"in',
+    '#!o$*n-builders&#lit\'#oad("ng&#not&$road\'#uts&%wheel%//warhorses/crew%$eers%&master%#way#$rain%!m',
+    ')#nra(!s#!t"&h-wah-&!y#\'akaheke$!l$!r#"be#\'chumyus#%edyar#!h$$abis$"hh#"ib',
+    '$"ni#-lb&uuml;ndnis$%efeld%\'nbergii!\'ombling',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_51 = (
+count_51 = 6695
+
+heads_51 = (
     'true-seeming',
-    'true-self',
-    'true-that',
-    'true-to-scale',
-    'true-type',
-    'true-value',
-    'true-zero',
-    'true.',
-    'true.ken',
-    'true/as',
-    'trueborn',
-    'truebridge',
-    'truefitt',
-    'trueform',
-    'truehandanstalt',
-    'truelock',
     'truemans',
-    'truesdale/entertainer',
-    'truespin',
-    'trueview',
-    'truf',
-    'trufe',
-    'truff&eacute;es',
-    'truffade',
-    'truffaldino',
-    'truffle-guzzling',
-    'trugenina',
-    'truger',
-    'truggist',
-    'truistic',
-    'trujillio',
-    'trujillo-cenoz',
     'trukese',
-    'truline',
-    'trulite',
-    'trull',
-    'truller',
-    'trullo',
-    'truly-integrated',
-    'truma',
-    'trumans',
-    'trumhere',
-    'trump-card',
-    'trumpcard',
-    'trumpee',
-    'trumper-',
-    'trumper/thames',
-    'trumpet&rehy;playing',
     'trumpet&rehy;shaped',
-    'trumpet-blast',
-    'trumpet-blowers',
-    'trumpet-major',
-    'trumpet-players',
-    'trumpet-sectioned',
-    'trumpet-tong',
-    'trumpet-trombone',
-    'trumpet/flugelhorn',
-    'trumpeters-in-ordinary',
-    'trumpetfish',
-    'trumpets-performed',
-    'trumpettings',
-    'trumphauser',
-    'trumps.',
-    'trunc',
     'truncatus',
-    'truncheon-like',
-    'truncheon-tipped',
-    'truncheon-wielding',
-    'trunculus',
-    'trundlegate',
-    'trundler',
-    'trundlers',
-    'trundley',
-    'trungeon',
-    'trunk&rehy;road',
-    'trunk-call',
-    'trunk-like',
-    'trunk-load',
-    'trunk-owning',
-    'trunk-road',
     'trunk-roads',
-    'trunk-thick',
-    'trunkfish',
-    'trunkless',
-    'trunkload',
-    'trunkloads',
-    'trunnions',
-    'truphemus',
-    'truppe',
-    'trupped',
-    'truprint',
-    'trurnit',
-    'truro-falmouth',
-    'truronians',
-    'trus',
-    'trusbuts',
     'trushin',
-    'truskett',
-    'truslove',
-    'trusov',
-    'truss-maker',
-    'trust&mdash;is',
-    'trust&mdash;receive',
-    'trust&rehy;worthiness',
-    'trust&rehy;worthy',
-    'trust(research)',
-    'trust--founded',
-    'trust-fund',
-    'trust-funded',
-    'trust-going',
-    'trust-mes',
-    'trust-owned',
     'trust-status',
-    'trust.it',
-    'trust.merlin',
-    'trust.the',
-    'trust.they',
-    'trust/',
-    'trust/2',
-    'trust/broughton',
-    'trust/king',
-    'trustbuster',
-    'trustbusting',
-    'truste',
-    'trustecs',
-    'trustee-like',
-    'trustees&mdash;a',
-    'trustees.',
     'trustees/managers',
-    'trustees/parliament',
-    'trusteeship.',
-    'trusteth',
-    'trustlands',
-    'trustor',
-    'trutex',
-    'truth-and-justice',
-    'truth-bearing',
-    'truth-claim',
-    'truth-conditionality',
-    'truth-content',
-    'truth-directed',
-    'truth-drug',
-    'truth-element',
-    'truth-evasion',
     'truth-functionally',
-    'truth-in-a-window',
-    'truth-in-lending',
-    'truth-oriented',
-    'truth-realization',
-    'truth-seeking',
-    'truth-semantics',
-    'truth-tellers',
-    'truth-testing',
-    'truth/and',
-    'truth/lies',
-    'truth_out',
-    'trutnov',
-    'trutype',
-    'trwo',
-    'trwy',
     'try-a-sport',
-    'try-ace',
-    'try-and-fail',
-    'try-cut',
-    'try-glut',
-    'try-hard',
-    'try-iffic',
-    'try-ing',
-    'try-less',
-    'try-outers',
-    'try-planes',
-    'try-tally',
-    'tryad',
-    'tryalls',
-    'tryals',
-    'tryanor',
     'trybus',
-    'trydings',
-    'tryed',
-    'tryford',
-    'tryina',
-    'trying&mdash&mdash',
-    'trying-to-be-friendly',
-    'trying.to',
-    'trymatus',
-    'tryna',
-    'tryngites',
-    'trynite',
-    'tryol',
-    'tryons',
-    'tryosine',
-    'tryosyl',
     'tryout',
-    'tryp-killing',
-    'trypanosomiasis',
-    'trypetidae',
-    'tryphan',
-    'tryphiodorus',
-    'tryphonas',
-    'tryps',
-    'trypsin-edta',
-    'trypsin-resistant',
-    'trypsin/0.02%',
-    'trypsin/0.5%',
-    'trypsination',
-    'trypsinogen',
-    'tryptamine',
-    'tryptics',
     'trypto',
-    'tryptophan.based',
-    'tryptophane',
-    'tryptose',
-    'trystan',
-    'trysting&rehy;places',
-    'trysting-place',
-    'trysull',
-    'trzebnica',
-    'trzeciakowski',
-    'ts&ndash;11',
-    'ts\'ao',
-    'ts\'ong',
-    'ts-through',
-    'ts/peak',
-    'ts1',
     'ts2/7',
-    'ts21',
-    'ts23',
-    'ts367',
-    'ts379',
-    'ts383',
-    'ts399',
-    'ts4000',
-    'ts402',
-    'ts403',
-    'ts404',
-    'ts405',
-    'ts6',
-    'ts9b',
-    'tsadziki',
-    'tsalendzhikha',
     'tsamai',
-    'tsamidhes',
-    'tsampo',
-    'tsanga',
-    'tsangano',
-    'tsangkhang',
-    'tsao-hua',
-    'tsar\'',
-    'tsar-reformer',
-    'tsar-trek',
-    'tsaranasy',
-    'tsarev',
-    'tsarinas',
-    'tsarists',
-    'tsatsiki',
-    'tsatziki',
     'tsbc',
-    'tsce-2000',
-    'tschaa',
-    'tschechova',
-    'tschegrava',
-    'tschelebi',
-    'tschingel',
-    'tschirdilli',
-    'tschirhart',
-    'tschoukine',
-    'tschoval',
-    'tscp-2000',
-    'tsdc',
-    'tse-',
-    'tse-chung',
-    'tse-listed',
     'tse-wei',
-    'tsedenbal-filatova',
-    'tsee',
-    'tseeep',
-    'tseep-tseep',
-    'tseep-tseep\'-ed',
-    'tseep-tseeped',
-    'tseet',
-    'tsegaw',
-    'tsegu',
-    'tsehai',
-    'tsekov',
-    'tsektran',
-    'tselovanik',
-    'tsentr',
-    'tsentroevak',
     'tserendondog',
-    'tserennadmid',
-    'tseshchovsky',
-    'tsetse-free',
-    'tsetse-infested',
-    'tsetung',
-    'tseuc',
-    'tsevenjavyn',
-    'tsh',
-    'tsh118,547',
-    'tsh118,552',
-    'tsh141,248',
-    'tsh142,000',
-    'tsh160,000',
-    'tsh206,000',
-    'tsh22,000',
     'tsh22,696',
-    'tsh292,936',
-    'tsh3,000',
-    'tsh311,478',
-    'tsh46,000',
-    'tsh85,653',
-    'tsherlik',
-    'tshibangu',
-    'tshipsan',
-    'tshirt',
-    'tshisikedi',
-    'tshomb&eacute',
-    'tshoungi',
-    'tshudi',
-    'tsi-tsi-tsi',
-    'tsi-uc',
     'tsi1o-550a',
-    'tsiaras',
-    'tsibu',
-    'tsik',
-    'tsikulin',
-    'tsiliso',
-    'tsimpli',
-    'tsimshians',
-    'tsin',
-    'tsing',
-    'tsingtao',
-    'tsiree',
-    'tsirion',
-    'tsirlin',
-    'tsirr-va-vaa',
-    'tsit-tswit-tswit',
     'tsitses',
-    'tsitsi',
-    'tsiwick',
-    'tsked',
-    'tsmlevel',
-    'tsms',
-    'tso/davis',
-    'tso/ispf',
-    'tsohiogyyn',
-    'tsortsos',
-    'tsos',
-    'tsotetsi',
-    'tsouros',
-    'tsp.',
-    'tssch',
-    'tssi',
     'tssop-nit-palu',
-    'tsst-1',
-    'tst-50',
-    'tst30root',
-    'tsted',
-    'tsti',
-    'tsting',
-    'tsuang',
-    'tsuba',
-    'tsubmit',
-    'tsubo',
-    'tsuboi',
-    'tsuchiya',
-    'tsuda',
-    'tsugumichi',
-    'tsugunao',
     'tsujihata',
-    'tsukaba',
-    'tsukahara',
-    'tsumani',
-    'tsunami-run',
-    'tsunami-strength',
-    'tsunami/high-end',
-    'tsuneyuki',
-    'tsung-dao',
-    'tsung-t\'ang',
-    'tsunga',
-    'tsup',
-    'tsuruo',
-    'tsushin',
-    'tsusing',
-    'tsuzuki',
     'tsw-television',
-    'tswanas',
-    'tsyganov',
-    'tsyu-i',
-    'tt&dollar;1,418',
-    'tt&dollar;2,000',
-    'tt&dollar;296.7',
-    'tt&dollar;300,000,000',
-    'tt&dollar;37,000,000',
-    'tt&dollar;5,498',
-    'tt&dollar;50,000,000',
-    'tt&dollar;547.5',
-    'tt&dollar;7,611,000',
-    'tt(ct)tg(acgt)',
-    'tt.35',
-    'tt.4',
     'tt202',
-    'tt220',
-    'ttactcaacatcaaagaacg',
-    'ttcaagcagagacgcattaagctaggc',
-    'ttcacacagggtgatgtggg',
-    'ttccttcatctaaatcatct',
-    'ttfn',
-    'ttfonts.tif',
-    'ttgca',
-    'tthat',
-    'tthe',
-    'ttj',
-    'ttle',
-    'ttoro',
-    'tts',
-    'tttatata',
     'ttttaa',
-    'ttttggcgggaat',
-    'tttv',
-    'ttuu',
-    'ttw&amp;r',
-    'ttwa',
-    'ttwas',
-    'ttx-sensitive',
-    'tu&eacute;e',
-    'tu\'ii',
-    'tu-',
-    'tu-154m',
-    'tu-16s',
-    'tu-22',
-    'tu-22m',
-    'tu-22s',
     'tu-95',
-    'tu-ee',
-    'tu-i44',
-    'tu-tic',
-    'tu-tu',
-    'tu-tu-tu',
-    'tu-whit',
-    'tu-whoo',
-    'tu154',
-    'tuak',
-    'tualang',
-    'tualatin',
-    'tualist',
-    'tuamotos',
-    'tuanku',
-    'tuar',
     'tuar-tu',
-    'tuatara',
-    'tuath',
-    'tub-garden',
-    'tub-sized',
-    'tub-sizing',
-    'tub-thumper',
-    'tub-water',
-    'tuba-players',
-    'tubalar',
-    'tubayshat',
-    'tubbed',
-    'tubbier',
-    'tubbies',
-    'tubby-buttoned',
-    'tubby-faced',
     'tube(s)',
-    'tube-based',
-    'tube-dwelling',
-    'tube-fixing',
-    'tube-framed',
-    'tube-goer',
-    'tube-legged',
-    'tube-living',
-    'tube-nose',
-    'tube-noses',
-    'tube-riding',
-    'tube-shaped',
-    'tube-side',
-    'tube-squeezed',
-    'tube-train',
-    'tube-tying',
     'tube-tyings',
-    'tubecoat',
-    'tubegoers',
-    'tubeligation',
-    'tubeplates',
-    'tuber-bearing',
-    'tubercles-usually',
-    'tuberculate',
-    'tuberculin-testing',
-    'tuberculins',
-    'tuberculon',
-    'tuberculostearic',
-    'tubergeniana',
-    'tuberosa',
-    'tuberoses',
-    'tuberoses&mdash;last',
     'tuberthaultii',
-    'tubeuf',
-    'tubeway',
-    'tubewells',
-    'tubewise',
-    'tubey',
-    'tubful',
-    'tubiana',
-    'tubifex-related',
-    'tubiflex',
-    'tubigrup',
-    'tubist',
-    'tubists',
-    'tublike',
-    'tubmanburg',
-    'tubovillous',
     'tubul',
-    'tubular-girder',
-    'tubulites',
-    'tubulo-vesicles',
-    'tubulo-vesicular',
-    'tubuloacinar',
-    'tuc&mdash;labour',
-    'tuc-unions',
-    'tucann',
-    'tucci-rosso',
-    'tuce',
-    'tuchel',
-    'tuchlauben',
-    'tuchola',
-    'tucholskie',
-    'tucholsky',
     'tuchomie',
-    'tuchowska',
-    'tuck-away',
-    'tuck-boxes',
-    'tuck-rolled',
-    'tuck-up',
-    'tuck/gloucestershire',
-    'tuckahoe',
-    'tuckbox',
-    'tuckenhay',
-    'tucker/liberal',
-    'tucker/pensioner',
-    'tuckeri',
-    'tucket',
-    'tucking-in',
-    'tucking-mill',
     'tuckit',
-    'tuckleberry',
-    'tuckonie',
-    'tuckton',
-    'tuckwell/national',
-    'tucler',
-    'tucric',
-    'tucuman',
-    'tucuri',
-    'tucxi',
-    'tudful',
-    'tudor-arch',
-    'tudor-cum-georgian',
-    'tudor-effect',
-    'tudor-hart',
-    'tudorburys',
     'tudoresque',
-    'tudorhurst',
-    'tudorish',
-    'tudorville',
-    'tuduns',
-    'tudur',
-    'tue&ndash;sun',
-    'tue-sun',
-    'tuero',
-    'tues&ndash;6.00',
-    'tues&ndash;sun',
-    'tues&ndash;thurs',
-    'tues/wed',
-    'tuesday&ndash;saturday',
-    'tuesday.',
-    'tuesday.the',
     'tuesday/saturday',
-    'tuesdaysaturday',
-    'tuesdee',
-    'tufas',
-    'tufcon',
-    'tufeila',
-    'tuff-pop',
-    'tuffa',
-    'tuffah',
-    'tuffarelli',
-    'tuffatori',
-    'tuffieha',
-    'tuffley/gloucester',
-    'tuffnell',
-    'tufl',
-    'tufnell/author',
     'tufnol',
-    'tufskins',
-    'tuftie',
-    'tuftnot',
-    'tufty-bonced',
-    'tug\'o\'war',
-    'tug-loops',
-    'tug-master',
-    'tug-of',
-    'tug-talk',
-    'tugged-down',
-    'tuggerangong',
-    'tuggeranong',
-    'tugmaster',
-    'tugmasters',
-    'tugmen',
     'tugnoli',
-    'tugulea',
-    'tuh',
-    'tuhafut',
-    'tuik',
-    'tuilerie',
-    'tuiller',
-    'tuin',
-    'tuirc',
-    'tuit',
-    'tuita',
-    'tuitioning',
-    'tujikistan',
-    'tuk-a-tuk',
-    'tuk-tuk',
-    'tukhachevsky',
     'tukl-tukl',
-    'tukmakov',
-    'tukuyu',
-    'tul&eacute;ar',
-    'tula-korovin',
-    'tulach',
-    'tuladhar',
-    'tulagi',
-    'tulai',
-    'tulaichean',
-    'tulan',
-    'tulassay',
-    'tulayeva',
-    'tulbaghia',
-    'tulcan',
-    'tulder',
     'tule',
-    'tulerunt',
-    'tulett',
-    'tuleutai',
-    'tuley',
-    'tuleyev',
-    'tulfarris',
-    'tulgey',
-    'tuli',
-    'tulin',
-    'tulio',
-    'tulip-red',
-    'tulipe',
-    'tulkens',
-    'tulketh',
-    'tullahoma',
     'tullets',
-    'tullia',
-    'tulliallan',
-    'tulliemet',
-    'tulliver',
-    'tulloquhey',
-    'tully/mother',
-    'tully/shop',
-    'tullyally',
-    'tullycarnett',
-    'tullygoonian',
-    'tullyhogue',
-    'tullylish',
-    'tullywhisker',
-    'tulreca',
-    'tulworth',
     'tum-a-hi',
-    'tum-te-tum',
-    'tum-tum',
-    'tumanov',
-    'tumb',
-    'tumble-cut',
-    'tumble-dryers',
-    'tumble-home',
-    'tumble-weed',
-    'tumbleblite',
-    'tumbledried',
-    'tumblerfuls',
-    'tumbling-dance',
-    'tumbling.',
-    'tumbridge',
-    'tumida',
     'tumiko',
-    'tumim/hm',
-    'tumlinson',
-    'tummelside',
-    'tummie',
-    'tummons',
-    'tummy-ache',
-    'tummy-aches',
-    'tummy-flattening',
-    'tummy-trouble',
-    'tummyaches',
-    'tumor-inhibitory',
-    'tumorous',
-    'tumors.',
-    'tumour.dr',
-    'tumour/thrombus',
     'tumoured',
-    'tumourigenesis.',
-    'tumourmacrosis',
-    'tumours.many',
-    'tumoyr',
-    'tumpa',
-    'tumu',
-    'tumultes',
-    'tumultus',
-    'tumwine',
-    'tumy',
-    'tun\'',
-    'tun*',
-    'tun-o-matic',
-    'tun-sean',
-    'tuna-',
     'tuna-ban',
-    'tuna-canners',
-    'tuna-dolphin',
-    'tuna-laundering',
-    'tuna-lookalike',
-    'tuna/',
-    'tuna/dolphin',
-    'tunapuna',
-    'tunberg',
-    'tunbs',
-    'tunbury',
-    'tuncay',
-    'tunceli',
-    'tunch',
-    'tunderish',
-    'tundra-forest',
     'tundra.15',
-    'tundrae',
-    'tune-drenched',
-    'tune-structured',
-    'tune-types',
-    'tuned-arguments',
-    'tuned-arm',
-    'tuned-down',
-    'tuned-for-economy',
-    'tuned.',
-    'tunekpinar',
-    'tunenag',
-    'tunenlightenedhe',
-    'tunes/808',
-    'tung-hui',
-    'tung-min',
     'tungavik',
-    'tungsha',
-    'tungstal',
-    'tungstal-maximite',
-    'tungsten-alloy',
-    'tungsten-halogen',
-    'tungsten-tipped',
-    'tungstenate',
-    'tunguska-sized',
-    'tungxiang',
-    'tunic-and-leggings',
-    'tunic-like',
-    'tunicles',
-    'tuning-dial',
-    'tuning-in',
-    'tuning-screws',
     'tunis/carthage',
-    'tunisian-american',
-    'tunisien',
-    'tunistrasse',
-    'tunja',
-    'tunji',
-    'tunley',
-    'tunmer',
-    'tunmore',
-    'tunnachemootoolt',
-    'tunnacliffe',
-    'tunnadine',
-    'tunnage',
-    'tunncliffe',
-    'tunnel-bound',
-    'tunnel-cross-roads',
     'tunnel-fighting',
-    'tunnel-loops',
-    'tunnel-slide',
-    'tunnel-strewn',
-    'tunnel-the',
-    'tunnel.',
-    'tunnel/high',
-    'tunneling',
-    'tunnellings',
-    'tunnelmouth',
-    'tunnels.their',
-    'tunney-dempsey',
-    'tunnicliff',
-    'tunnies',
-    'tunnyfish',
-    'tunr',
     'tunsgate',
-    'tunsgram',
-    'tunstace',
-    'tunstell',
-    'tunstrom/director',
-    'tunturi',
-    'tunukovic',
-    'tunya',
-    'tunzelman',
-    'tuohy',
-    'tuomisto',
-    'tuoneia',
-    'tuos',
-    'tupai',
-    'tupaiidae',
-    'tupholme',
     'tupi-guarani',
-    'tupinamb&aacute',
-    'tupismati',
-    'tupled',
-    'tupolef',
-    'tuppaware',
-    'tuppence-ha\'-penny',
-    'tuppenth',
-    'tuppeny-ha\'penny',
-    'tupperspeak',
-    'tupples',
-    'tupras',
-    'tupsarse',
-    'tupuola',
-    'tur-kaspa',
-    'turajlic',
     'turandjonzonda',
-    'turangi',
-    'turanian',
-    'turax',
-    'turay',
-    'turbaco',
-    'turban-wise',
-    'turbe',
-    'turbehlyk',
-    'turbellaria',
-    'turbellarians',
-    'turberosum',
-    'turbet',
-    'turbidimeter',
-    'turbidimetrically',
-    'turbiditic',
     'turbidity-maximum',
-    'turbin',
-    'turbinates',
-    'turbine-generators',
-    'turbine-powered',
-    'turbini',
-    'turbo&rehy;prop',
-    'turbo-assisted',
-    'turbo-bentley',
-    'turbo-boost',
-    'turbo-boosted',
-    'turbo-caribou',
-    'turbo-charge',
-    'turbo-conversion',
-    'turbo-diesels',
-    'turbo-fuel',
     'turbo-generating',
-    'turbo-grill',
-    'turbo-jet',
-    'turbo-mowers',
-    'turbo-porter',
-    'turbo-power',
-    'turbo-pressure',
-    'turbo-ram-jet',
-    'turbo-supercharged',
-    'turbo-tortoise',
-    'turbo-vac',
-    'turbo/kerosene',
-    'turbocar',
-    'turbocars',
-    'turbochannel/eisa',
-    'turbofan-engine',
     'turbofans',
-    'turboflash',
-    'turbohalers',
-    'turbolaser',
-    'turbomatic',
-    'turbomotive',
-    'turbopump',
-    'turbospeed',
-    'turboswap',
-    'turbotine',
-    'turbuence',
-    'turbulate',
-    'turbulators',
-    'turbulent-like',
-    'turc',
-    'turcam',
     'turchini',
-    'turckheim',
-    'turco-circassian',
-    'turd-brain',
-    'turd-laden',
-    'turdy',
-    'ture',
-    'turebska',
-    'tureen-sized',
-    'turega',
-    'turek',
-    'turenge',
-    'turf-built',
-    'turf-clad',
-    'turf-cutters',
-    'turf-cutting',
     'turf-faced',
-    'turf-level',
-    'turf-mazes',
-    'turf-sided',
-    'turf-stack',
-    'turf-than',
-    'turf-thatched',
-    'turf-wars',
-    'turfan',
-    'turfe',
-    'turford',
-    'turfrick',
-    'turfwork',
-    'turga',
-    'turganova',
-    'turgeniev',
     'turgeon',
-    'turgidities',
-    'turicum',
-    'turiff',
-    'turihan',
-    'turinese',
-    'turing-like',
-    'turistico',
-    'turkee',
-    'turkestan-siberian',
-    'turkey&rehy;cock',
-    'turkey-cock',
-    'turkey-house',
-    'turkey-huts',
-    'turkey-killings',
-    'turkey-like',
     'turkey-necked',
-    'turkey-oak',
-    'turkey-pen',
-    'turkey-producing',
-    'turkey-syria-iraq',
-    'turkey.',
-    'turkic-mongol',
-    'turkish-american',
-    'turkish-british',
-    'turkish-era',
-    'turkish-flag',
-    'turkish-greek',
-    'turkish-iraqi',
-    'turkish-language',
-    'turkish-oriented',
-    'turkish-produced',
     'turkish-syrian',
-    'turkish-united',
-    'turkish/anatolian',
-    'turkish/spanish',
-    'turkishpipeline',
-    'turkistan-siberian',
-    'turkmanchai',
-    'turkmenis',
-    'turko-iraqi',
-    'turkomen',
-    'turkovi&cacute',
-    'turksib',
-    'turl-browning-goulding',
-    'turle',
-    'turlings',
-    'turlu',
     'turmeric-flavoured',
-    'turmeric-stained',
-    'turmhof',
-    'turmix',
-    'turmoil\'',
-    'turmoil.',
-    'turmoral',
-    'turn&mdash;out',
-    'turn&rehy;about',
-    'turn&rehy;tables',
-    'turn\'',
-    'turn-',
-    'turn-and-',
-    'turn-arounds',
-    'turn-by-turn',
-    'turn-christ',
     'turn-coats',
-    'turn-down',
-    'turn-holding',
-    'turn-if',
-    'turn-lengths',
-    'turn-my-back-on-you',
-    'turn-of-the-',
-    'turn-of-the-nineteenth-century',
-    'turn-offs',
-    'turn-ons',
-    'turn-screw',
-    'turn-up-and-try-it',
-    'turn-up-on-',
-    'turn-wrest',
-    'turn/the',
-    'turnback',
     'turnbelly',
-    'turnbnull',
-    'turnboy',
-    'turnbull-jeffrey',
-    'turnbull/asst',
-    'turnbull/john',
-    'turnbull/kyle',
-    'turnbury',
-    'turncliffe',
-    'turned&ndash',
-    'turned-inside-out',
-    'turned-out-toes',
-    'turned-over',
-    'turned-publican',
-    'turned-slightly',
-    'turned.for',
     'turned.on',
-    'turnedout',
-    'turner-directed',
-    'turner-warwick',
-    'turner/chairman',
-    'turner/enterprise',
-    'turner/fringe',
-    'turner/general',
-    'turner/manageress',
-    'turner/mayor',
-    'turner/national',
-    'turner/nursery',
-    'turner/oxfordshire',
-    'turner/penhill',
-    'turner/race',
-    'turner/sub-officer',
     'turner/theatre',
-    'turner/turner',
-    'turner/white',
-    'turnerian',
-    'turnes',
-    'turneys',
-    'turnicidae',
-    'turning&rehy;point',
-    'turning-',
-    'turning-away',
-    'turning-back',
-    'turning-circle',
-    'turning-in',
-    'turning/',
-    'turningly',
-    'turningpoint',
     'turnip-heads',
-    'turnip-rooted',
-    'turnip-shaped',
-    'turnip-sower',
-    'turnip-tops',
-    'turniphead',
-    'turnning',
-    'turnock/enigma',
-    'turnours',
-    'turnout&mdash;one-third',
-    'turnov',
-    'turnpeny',
-    'turnpike-road',
-    'turnpike.',
-    'turnprofessional',
-    'turnquest',
     'turnrounds',
-    'turns.steering',
-    'turns/coil',
-    'turnscrew',
-    'turnsek',
-    'turntable-mounted',
-    'turntail',
-    'turntaking',
-    'turnu',
-    'turnu-severin',
-    'turnup',
-    'turnus',
-    'turnworth',
-    'turnyng',
-    'turo',
-    'turovsky',
     'turow',
-    'turpem',
-    'turpentine-tasting',
-    'turpiloquence',
-    'turpington',
-    'turpis',
-    'turpovski',
-    'turpsy',
-    'turqouise',
-    'turquand',
-    'turquie',
-    'turquoise-and-gold',
-    'turquoise-coloured',
-    'turquoise-creased',
-    'turquoise-striped',
-    'turquoise/white',
     'turramurra',
-    'turres',
-    'turret-lathe',
-    'turrett',
-    'turrety',
-    'turri',
-    'turriculatus',
-    'turrilites',
-    'turrita',
-    'turron',
-    'tursan',
-    'tursdale',
-    'tursman',
-    'tursunzadevsky',
-    'turt',
-    'turth',
     'turtle-back',
-    'turtle-berries',
-    'turtle-coloured',
-    'turtle-crazy',
-    'turtle-dovin\'',
-    'turtle-riding',
-    'turtle-shaped',
-    'turtle-trapping',
-    'turtledoves',
-    'turtur',
-    'turty',
-    'turvassa',
-    'turveydrop',
-    'turvil',
-    'turvill',
-    'turville',
     'turweston',
-    'turya',
-    'tus',
-    'tusa',
-    'tusa/ubs',
-    'tusart',
-    'tusc',
-    'tusc&aacute;nia',
-    'tuscaloos',
-    'tuscan-doric',
-    'tuscanvilla',
-    'tuscany-villa',
-    'tuscarora',
-    'tusche',
-    'tusci',
-    'tuscini.',
     'tuscolana',
-    'tuscumbia',
-    'tuscumbian',
-    'tusek',
-    'tusell',
-    'tushar',
-    'tushed',
-    'tusita',
-    'tusitala',
-    'tusk-teeth',
-    'tuska',
-    'tuskagee',
-    'tusker.',
-    'tuslog',
-    'tusm',
-    'tusokva',
     'tuson',
-    'tussle-haired',
-    'tussock-forming',
-    'tussock-free',
-    'tussy-mussie',
-    'tustain/caravan',
-    'tut&rehy;tuts',
-    'tut.',
-    'tutaev',
-    'tutamen',
-    'tutankamen',
-    'tutankamen-type',
-    'tutankhaten',
-    'tutela',
-    'tutenkamen',
-    'tutenkamun',
     'tuthankhamun',
-    'tuthill/driver',
-    'tuthill/francis',
-    'tuthill/navigator',
-    'tuthill/winner',
-    'tuti',
-    'tutkhan',
-    'tutko',
-    'tuto',
-    'tutoh',
-    'tutor-chef',
-    'tutor-group',
-    'tutor-groups',
-    'tutor-moderated',
-    'tutor-secretary',
-    'tutor/administrator',
     'tutor/carer',
-    'tutor/counsellor',
-    'tutor/counsellors',
-    'tutor/invigilator',
-    'tutorials/seminars',
-    'tutors.',
-    'tutors/input',
-    'tutors/students',
-    'tutors/supervisors',
-    'tutrix',
-    'tutt-tutt',
-    'tuttabankem',
-    'tuttle-fields',
-    'tuttlingen',
-    'tutto',
-    'tuttson',
     'tutut',
-    'tutweiler',
-    'tutzing',
-    'tutzinger',
-    'tuus',
-    'tuuth',
-    'tuvalian',
-    'tuvaluan',
-    'tuvan',
-    'tuveson',
-    'tuviera',
-    'tuweithah',
-    'tuxedoed',
-    'tuxon',
-    'tuxworth',
-    'tuxwsorth',
     'tuy',
-    'tuyaux',
-    'tuyeres',
-    'tuzcu',
-    'tuzi',
-    'tuzo',
-    'tv&rehy;type',
-    'tv**',
-    'tv-',
-    'tv-action',
-    'tv-aerial',
-    'tv-bred',
-    'tv-cable',
-    'tv-cassette',
-    'tv-crit',
-    'tv-dinner-trays',
     'tv-drama',
-    'tv-driven',
-    'tv-eye',
-    'tv-film',
-    'tv-friendly',
-    'tv-guide',
-    'tv-in-the-sky',
-    'tv-land',
-    'tv-linked',
-    'tv-lounge',
-    'tv-movie-of-the-week',
-    'tv-oriented',
-    'tv-phenomenon',
-    'tv-promoted',
-    'tv-quality',
-    'tv-radio',
     'tv-related',
-    'tv-sat',
-    'tv-size',
-    'tv-video',
-    'tv-video-cd',
-    'tv-writing',
-    'tv.am',
-    'tv/card',
-    'tv/clock/radio',
-    'tv/radio/alarm',
-    'tv/tea/coffee',
-    'tv/vcr',
-    'tv21',
-    'tvad',
-    'tvas',
-    'tvdohlavi',
     'tve',
-    'tvei-related',
-    'tvel',
-    'tverskaya',
-    'tversky',
-    'tvesrp',
-    'tveteras',
-    'tvh',
-    'tvi',
-    'tvind',
-    'tvlink-up',
-    'tvm',
-    'tvor',
-    'tvorchestvo',
-    'tvps',
-    'tvrdosijni',
     'tvs/southern',
-    'tvsat',
-    'tvu',
-    'tw.',
-    'tw04/08',
-    'tw10',
-    'tw117',
-    'tw183a0',
-    'tw25',
-    'tw6',
-    'tw687',
-    'twachtman',
-    'twaddell',
-    'twafeaj',
-    'twaite',
-    'twaites',
     'twala',
-    'twangland',
-    'twangling',
-    'twangman',
-    'twangtwangtwangtwing',
-    'twanky',
-    'twashokay',
-    'twatted',
-    'twdc',
-    'tweacle',
-    'tweaker',
-    'tweakers',
-    'twebty',
-    'tweddle/cancer',
-    'twee-o',
-    'twee-wee-wee',
     'tweed-coated',
-    'tweed-skirted',
-    'tweed-solway',
-    'tweed-suited',
-    'tweed-upholstered',
-    'tweeded',
-    'tweeders',
-    'tweediness',
-    'tweedish',
-    'tweedledum-tweedledee',
-    'tweedley-dee',
-    'tweedley-dum',
-    'tweedshaws',
-    'tweedvale',
-    'tweedy-looking',
-    'tweeking',
     'tweenies',
-    'tweeny-maids',
-    'tweet-tut',
-    'tweetered',
-    'tweeting',
-    'tweetment',
-    'tweets',
-    'tweety',
-    'tweezing',
-    'twegen',
-    'tweirat',
-    'twelfth&ndash;fourteenth',
-    'twelfth-centuries',
-    'twelfth-dynasty',
-    'twelfth-fret',
-    'twelfth-hand',
     'twelfth/thirteenth',
-    'twelfths.',
-    'twells',
-    'twelv',
-    'twelve&rehy;ed&rehy;ged',
-    'twelve&rehy;year-old',
-    'twelve-and-a-half',
-    'twelve-by-six-foot',
-    'twelve-car',
-    'twelve-colour',
-    'twelve-column-inch',
-    'twelve-deep',
-    'twelve-foot-wide',
-    'twelve-footer',
-    'twelve-forty',
-    'twelve-fourteen',
     'twelve-hundred',
-    'twelve-in-one',
-    'twelve-ish',
-    'twelve-item',
-    'twelve-metre',
-    'twelve-millimetre-thick',
-    'twelve-minute',
-    'twelve-module',
-    'twelve-ounce',
-    'twelve-pages-to-view',
-    'twelve-part',
-    'twelve-piece',
-    'twelve-pounder',
-    'twelve-pounders',
-    'twelve-reeler',
-    'twelve-seater',
     'twelve-second',
-    'twelve-sheet',
-    'twelve-sided',
-    'twelve-slotted',
-    'twelve-stone',
-    'twelve-thirty-five',
-    'twelve-thousand-mile',
-    'twelve-times',
-    'twelve-to',
-    'twelve-twenty',
-    'twelve-week-old',
-    'twelve-wheeler',
-    'twelve-wheelers',
-    'twelve-year-old-boy',
-    'twelve-yearold',
-    'twelve-years-olds',
     'twelve/thirteen',
-    'twelvebore',
-    'twelvefold',
-    'twelveish',
-    'tweney',
-    'twenth',
-    'twentie',
-    'twenties-style',
-    'twenties/early',
-    'twentieth&mdash;century',
-    'twentiethcentury',
-    'twenty&mdash;one',
-    'twenty&mdash;third',
-    'twenty&ndash;three&ndash;mile',
-    'twenty&rehy;fifth',
-    'twenty&rehy;first',
     'twenty&rehy;fold',
-    'twenty&rehy;one',
-    'twenty&rehy;second',
-    'twenty&rehy;two-year-old',
-    'twenty-bed',
-    'twenty-centimetre',
-    'twenty-cylinder',
-    'twenty-day',
-    'twenty-day-old',
-    'twenty-eight-',
-    'twenty-eight-building',
-    'twenty-eight-foot',
-    'twenty-eight-inch',
-    'twenty-eight-volume',
-    'twenty-eight-week',
-    'twenty-feet',
     'twenty-five-city',
-    'twenty-five-day',
-    'twenty-five-dollar',
-    'twenty-five-inch',
-    'twenty-five-mile',
-    'twenty-five-odd',
-    'twenty-five-piece',
-    'twenty-five-six',
-    'twenty-five-ton',
-    'twenty-five-year-',
-    'twenty-five.',
-    'twenty-five_per',
-    'twenty-foot-long',
-    'twenty-four&rehy;hour',
-    'twenty-four-bit',
-    'twenty-four-foot',
     'twenty-four-hours-a-day',
-    'twenty-four-hours-in-bed',
-    'twenty-four-year',
-    'twenty-four-years-old',
-    'twenty-fourths',
-    'twenty-franc',
-    'twenty-frequency',
-    'twenty-hour',
-    'twenty-hundred',
-    'twenty-inch-wide',
-    'twenty-kilometre',
-    'twenty-knot',
-    'twenty-live',
-    'twenty-member',
-    'twenty-mile-long',
-    'twenty-mile-square',
     'twenty-million-pound',
-    'twenty-millionth',
-    'twenty-month-old',
-    'twenty-nineth',
-    'twenty-o',
-    'twenty-one-foot',
-    'twenty-one-minute',
-    'twenty-one-page',
-    'twenty-one-year&rehy;old',
-    'twenty-one-year-long',
-    'twenty-one-years-old',
-    'twenty-one.',
-    'twenty-ones',
-    'twenty-past-two',
-    'twenty-pence',
-    'twenty-peseta',
     'twenty-processors',
-    'twenty-quid',
-    'twenty-rod',
-    'twenty-round',
-    'twenty-seconds',
-    'twenty-seven-car',
-    'twenty-seven-mile',
-    'twenty-seven-oh-four',
-    'twenty-seven-oh-six',
-    'twenty-seven-three',
-    'twenty-seven-year',
-    'twenty-six-litre',
-    'twenty-six-member',
-    'twenty-six-mile',
-    'twenty-six-part',
-    'twenty-sixth-century',
     'twenty-sixty-two',
-    'twenty-square',
-    'twenty-squares',
-    'twenty-stroke',
-    'twenty-thirty',
-    'twenty-thousand',
-    'twenty-thousand-pound',
-    'twenty-three&rehy;year-old',
-    'twenty-three-acre',
-    'twenty-three-inch',
-    'twenty-three-year',
-    'twenty-to',
-    'twenty-to-eleven',
-    'twenty-two&rehy;carat',
-    'twenty-two-fold',
-    'twenty-two-function',
     'twenty-two-inch',
-    'twenty-two-room',
-    'twenty-two-year-olds',
-    'twenty-two_out',
-    'twenty-verst',
-    'twenty-watt',
-    'twenty-year&rehy;old',
-    'twenty.dollars',
-    'twenty.five',
-    'twenty/thirty',
-    'twenty/thirty/forty',
-    'twenty/twenties',
-    'twentyeight',
-    'twentyfirst',
-    'twentyfives',
-    'twentyfour',
     'twentyfourth',
-    'twentyman',
-    'twentynothings',
-    'twentyodd',
-    'twentyone',
-    'twentypence',
-    'twentypound',
-    'twentyyear-old',
-    'twerpster',
-    'twic',
-    'twice&ndash;yearly',
-    'twice&rehy;capped',
-    'twice\'',
-    'twice-annual',
-    'twice-cancelled',
-    'twice-champion',
     'twice-convicted',
-    'twice-cooked',
-    'twice-cracked',
-    'twice-defeated',
-    'twice-digested',
-    'twice-divorced',
-    'twice-exiled',
-    'twice-hourly',
-    'twice-imprisoned',
-    'twice-lifesize',
-    'twice-nominated',
-    'twice-olympic',
-    'twice-over',
-    'twice-proven',
-    'twice-repeated',
-    'twice-replayed',
     'twice-sieved',
-    'twice-soaked',
-    'twice-widowed',
-    'twicea',
-    'twicing',
-    'twicker',
-    'twiddler',
-    'twiddlers',
-    'twiddlin\'',
-    'twiddlings',
-    'twidell',
-    'twies',
-    'twig-arms',
-    'twig-finger',
-    'twig-high',
-    'twig-like',
     'twiggery',
-    'twiggly',
-    'twiglet',
-    'twiglike',
-    'twikka',
-    'twilighted',
-    'twill-weave',
-    'twilled',
-    'twillweld',
-    'twilly',
-    'twin&rehy;walled',
-    'twin-and-earth',
-    'twin-balanced',
-    'twin-ballgown',
-    'twin-bin',
-    'twin-bladed',
     'twin-boom',
-    'twin-camshaft',
-    'twin-carb',
-    'twin-carburettor',
-    'twin-castled',
-    'twin-catalyst',
-    'twin-centre',
-    'twin-century',
-    'twin-choke',
-    'twin-colour',
-    'twin-cored',
-    'twin-faced',
-    'twin-featured',
-    'twin-floats',
-    'twin-gabled',
-    'twin-hulled',
     'twin-humbucker-equipped',
-    'twin-jet',
-    'twin-lamp',
-    'twin-laned',
-    'twin-leaved',
-    'twin-level',
-    'twin-lewis',
-    'twin-line',
-    'twin-litre',
-    'twin-masted',
-    'twin-messiah',
-    'twin-nozzle',
-    'twin-pillar',
-    'twin-pipe',
-    'twin-plate',
-    'twin-pointed',
     'twin-pointer',
-    'twin-power',
-    'twin-processor',
-    'twin-prop',
-    'twin-radial-engined',
-    'twin-rear',
-    'twin-reflex',
-    'twin-room',
-    'twin-sailed',
-    'twin-sets',
-    'twin-sisters',
-    'twin-site',
-    'twin-soft',
-    'twin-speaker',
-    'twin-spearhead',
-    'twin-speed',
     'twin-spired',
-    'twin-spotted',
-    'twin-stinson',
-    'twin-stitched',
-    'twin-studies',
-    'twin-supercharged',
-    'twin-tailed',
-    'twin-tier',
-    'twin-tongue',
-    'twin-tracking\'',
-    'twin-tracking-that',
-    'twin-transport',
-    'twin-tub',
-    'twin-turbine',
-    'twin-wall',
-    'twinaxial',
     'twinbed',
-    'twincam',
-    'twindles',
-    'twiners',
-    'twinettes',
-    'twinflush',
-    'twingeing',
-    'twinholme',
-    'twinkick',
-    'twinkie',
-    'twinkies',
-    'twinkle-toed',
-    'twinkleberries',
-    'twinkliest',
-    'twinks',
-    'twinlock',
     'twinnings',
-    'twinpack',
-    'twinphone',
-    'twinsectra',
-    'twinsets',
-    'twinship',
-    'twinstation',
-    'twinstick',
-    'twintrack',
-    'twintwinkling',
-    'twinty',
-    'twinwave',
-    'twinwood',
-    'twirler',
-    'twisdton',
-    'twisick',
     'twisk',
-    'twisleton-wykeham-fiennes',
-    'twiss/doe/greta',
-    'twist\'n',
-    'twist-beam',
-    'twist-grips',
-    'twist-legged',
-    'twist-on',
-    'twist-pile',
-    'twist-tree',
-    'twist-wire',
-    'twisted-off',
-    'twisted-ring',
-    'twisted-wire',
-    'twistedly',
-    'twistedness',
     'twistier',
-    'twistin\'',
-    'twisting-about-a-point',
-    'twistingly',
-    'twistit',
-    'twistleton-wykeham-fiennes',
-    'twistpile',
-    'twit-giggle',
-    'twitch-grass',
-    'twitchiest',
-    'twitchin',
-    'twitenham',
-    'twittery',
-    'twittest',
-    'twivy',
-    'twixty',
     'twizel',
-    'twizzled',
-    'twizzler',
-    'twlch',
-    'twm',
-    'twn',
-    'two&ins',
-    'two&lowbar;component',
-    'two&mdash;and',
-    'two&mdash;former',
-    'two&mdash;the',
-    'two&ndash',
-    'two&ndash;car',
-    'two&ndash;three',
-    'two&ndash;way',
-    'two&rehy;engined',
     'two&rehy;faced',
-    'two&rehy;fifteen',
-    'two&rehy;hour',
-    'two&rehy;iron',
-    'two&rehy;partner',
-    'two&rehy;seater',
-    'two&rehy;semester',
-    'two&rehy;spanner',
-    'two&rehy;term',
-    'two&rehy;thirds',
-    'two&rehy;thirty',
-    'two&rehy;timing',
-    'two&rehy;week',
-    'two&rehy;wheeled',
-    'two-a-level',
-    'two-a-penny',
     'two-abreast',
-    'two-and-a',
-    'two-and-a-half-box',
-    'two-and-a-half-day',
-    'two-and-a-half-inch-heel',
-    'two-and-a-half-month',
-    'two-and-a-half-thousand',
-    'two-and-a-half-ton',
-    'two-and-a-quarter',
-    'two-and-a-quarter-hour',
-    'two-and-eight',
-    'two-and-six',
-    'two-and-three-car',
-    'two-and-three-quarter',
-    'two-and-three-quarter-mile',
-    'two-and-three-quarter-ounce',
     'two-and-three-quarters',
-    'two-apartment',
-    'two-arm',
-    'two-armed',
-    'two-ballot',
-    'two-band',
-    'two-barred',
-    'two-bay',
-    'two-billion-to',
-    'two-birds',
-    'two-bolts-and-a-chain',
-    'two-bowl',
-    'two-branch',
-    'two-budget',
-    'two-burner',
-    'two-by-twos',
     'two-card',
-    'two-cars-in-one',
-    'two-cassette',
-    'two-cd/two-cassette',
-    'two-celled',
-    'two-century',
-    'two-ch\'i-thick',
-    'two-chambered',
-    'two-chef',
-    'two-children',
-    'two-club',
-    'two-clubs-in-one',
-    'two-clubs-stronger',
-    'two-coach',
-    'two-consonant-phoneme',
-    'two-crew',
     'two-crown',
-    'two-d',
-    'two-day-career',
-    'two-decade-long',
-    'two-deck',
-    'two-dimensionally',
-    'two-disk',
-    'two-divisional',
-    'two-double-bedroom',
-    'two-down-with-six-to-play',
-    'two-ducat',
-    'two-eared',
-    'two-earning',
-    'two-egg',
-    'two-element',
-    'two-elevenths',
     'two-engine',
-    'two-entry',
-    'two-explicit',
-    'two-exploration',
-    'two-exponent',
-    'two-family',
-    'two-feet',
-    'two-feet-thick',
-    'two-fifteenths',
-    'two-fight',
-    'two-firm',
-    'two-foot-deep',
-    'two-foot-long',
-    'two-footer',
-    'two-footers',
-    'two-for-four',
     'two-for-seven',
-    'two-for-the',
-    'two-for-three',
-    'two-forty-five',
-    'two-forty-seven',
-    'two-fret',
-    'two-function',
-    'two-fur&rehy;long',
-    'two-furrow',
-    'two-gallon',
-    'two-game',
-    'two-gang',
-    'two-gene',
-    'two-generation',
-    'two-glass',
-    'two-grand',
     'two-hearts-beating-as-one',
-    'two-hour-a-week',
-    'two-house',
-    'two-humped',
-    'two-hundred-',
-    'two-hundred-dollar',
-    'two-hundred-foot-high',
-    'two-hundred-guinea',
-    'two-hundred-mile',
-    'two-hundred-pound',
-    'two-hundred-square-mile',
-    'two-hundred-thousand',
-    'two-identical',
-    'two-implicit',
-    'two-in-a-bed',
-    'two-in-a-row',
     'two-in-three',
-    'two-inch-long',
-    'two-inch-square',
-    'two-income',
-    'two-independent',
-    'two-input',
-    'two-into-one',
-    'two-iron',
-    'two-ish',
-    'two-junction',
-    'two-kilometre',
-    'two-lactation',
-    'two-laminae',
-    'two-lamp',
-    'two-lb.',
-    'two-leaved',
     'two-left-feet',
-    'two-legs',
-    'two-lever',
-    'two-line-source',
-    'two-lined',
-    'two-liners',
-    'two-lipped',
-    'two-loud-speaker',
-    'two-machine',
-    'two-mesh',
-    'two-metre-high',
-    'two-metre-long',
-    'two-metre-wide',
-    'two-metres',
-    'two-mid',
-    'two-millimetre',
     'two-million-pound',
-    'two-motor',
-    'two-movement',
-    'two-named',
-    'two-nation',
-    'two-ness',
-    'two-nucleus',
-    'two-one-two',
-    'two-oven',
-    'two-over',
-    'two-over-one',
-    'two-pace',
-    'two-pack',
-    'two-pair',
-    'two-paragraph',
-    'two-particle',
     'two-party-dominated',
-    'two-patch',
-    'two-pattern',
-    'two-peak',
-    'two-pedal',
-    'two-penalty',
-    'two-penie',
-    'two-pennyworth',
-    'two-pensioner',
-    'two-phases.',
-    'two-phases.on',
-    'two-photon',
-    'two-phrase',
-    'two-pincered',
-    'two-plus-twos',
-    'two-plus-very-small-two',
     'two-pool',
-    'two-port',
-    'two-portion',
-    'two-post',
-    'two-pounds',
-    'two-pp9',
-    'two-price',
-    'two-prong',
-    'two-punch',
-    'two-putt',
-    'two-reef',
-    'two-refrigerator',
-    'two-release',
-    'two-rig',
-    'two-ringer',
-    'two-road',
     'two-rpocessor',
-    'two-satellite',
-    'two-scale',
-    'two-screens',
-    'two-segmented',
-    'two-series',
-    'two-session',
-    'two-setter',
-    'two-sevenths',
-    'two-shelled',
-    'two-ship',
-    'two-shoe',
-    'two-shotters',
-    'two-sidedness',
-    'two-site',
-    'two-sittings',
     'two-slotted',
-    'two-song',
-    'two-span',
-    'two-spar',
-    'two-spit',
-    'two-spreader',
-    'two-spring',
-    'two-station',
-    'two-stoke',
-    'two-stranded',
-    'two-stringed',
-    'two-stripe',
-    'two-strutted',
-    'two-study-bedroom',
-    'two-stump',
-    'two-summer',
     'two-surfaces',
-    'two-temperature',
-    'two-thirties',
-    'two-thonged',
-    'two-thousand',
-    'two-thousand-dollar',
-    'two-thousand-strong',
-    'two-three-four-foot-long',
-    'two-three-one',
-    'two-tine',
-    'two-to-eight',
-    'two-to-five',
-    'two-to-four',
-    'two-to-threefold',
-    'two-to-two',
-    'two-toners',
     'two-train',
-    'two-trigger',
-    'two-type',
-    'two-up-two-downs',
-    'two-voltage',
-    'two-warhead',
-    'two-washing-machine',
-    'two-watch',
-    'two-way-travel-time',
-    'two-weekend',
-    'two-weekly',
-    'two-weeks',
-    'two-well',
-    'two-wheels',
-    'two-world',
-    'two-yard',
     'two-year-long',
-    'two-year-old-daughter',
-    'two-year-separation',
-    'two-year-trial',
-    'two-yearold',
-    'two-years-old',
-    'two-years-olds',
-    'two-zone',
-    'two.metres',
-    'two.phases.on',
-    'two/ninety',
-    'two/three-person',
-    'two/three-star',
-    'two14',
-    'two3812',
-    'two:buy-out',
     'two:enter',
-    'two:hitting',
-    'two:pulling',
-    'two_b',
-    'two_in_front',
-    'twoand-a-half',
-    'twoflower&mdash',
-    'twofolk',
-    'twohanded',
-    'twohy',
-    'twoin-one',
-    'twomey/national',
-    'twoo',
-    'twopenn\'orth',
-    'twopenny-pockets',
-    'twopoint',
     'tworkov',
-    'tworkowski',
-    'tworogal',
-    'twort&ndash;d\'h&eacute;relle',
-    'twos-up',
-    'twos.',
-    'twostar',
-    'twostorey',
-    'twostrokes',
-    'twotiming',
-    'twotowns',
-    'twotwo',
-    'twou',
-    'twould',
-    'twoyear-olds',
-    'twp',
     'twr&rehy;y-felin',
-    'twr-developed',
-    'twrch',
-    'twreaking',
-    'tws',
-    'twtwtw',
-    'twwenty-four',
-    'twydale',
-    'twyi',
-    'twyla',
-    'twyne',
-    'twyning/gloucestershire',
-    'twythe',
-    'twyyn-bryncrug',
-    'tx-based',
-    'tx.2',
     'tx10',
-    'txa1z',
-    'txai',
-    'txaiz',
-    'txapu',
-    'txikierdi',
-    'txp',
-    'txrpc',
-    'txt',
-    'ty&formula;cal',
-    'ty&formula;cally',
-    'ty\'n',
-    'ty-phoo',
-    'tyack/contractor',
-    'tyack/ostrich',
-    'tyack/wellington',
     'tyacks',
-    'tyaylor',
-    'tybe',
-    'tyberton',
-    'tybulevich',
-    'tyce',
-    'tychodrome',
-    'tyco',
-    'tycoon-failing',
-    'tycoon-proof',
-    'tycoon.the',
-    'tycoonski',
-    'tydac',
-    'tyddyn',
-    'tyde',
-    'tydlesley',
     'tydvil',
-    'tyecha',
-    'tyen',
-    'tyers',
-    'tyfil',
-    'tygaflor',
-    'tygasil',
-    'tyi-s-33',
-    'tyier',
-    'tyih&aacute;k',
-    'tying-down',
-    'tykeworld',
-    'tylees',
-    'tyler-upfield',
-    'tyler-upfields',
-    'tyler/british',
     'tyler/campaigning',
-    'tyler/meat',
-    'tylex',
-    'tyll',
-    'tylman',
-    'tylneys',
-    'tylocidaris',
-    'tylorians',
-    'tylte',
-    'tyma',
-    'tymbal',
-    'tymeful',
-    'tymen',
-    'tyminiski',
-    'tymms',
-    'tymon',
     'tympanal',
-    'tympani',
-    'tympanic',
-    'tympanogram',
-    'tympanometrically',
-    'tympanosclerosis',
-    'tympanostomy',
-    'tyn',
-    'tynant',
-    'tyndale-biscoe',
-    'tyndalle',
-    'tyne-alston',
-    'tyne-based',
-    'tyne-wards',
-    'tyne-wear',
-    'tyne-wear-tees',
     'tynesid',
-    'tyneside&mdash;in',
-    'tyneside\'',
-    'tyneside-born',
-    'tynesoft',
-    'tynex',
-    'tyney',
-    'tynlofft',
-    'tynne',
-    'tynt',
-    'tyo-hnl',
-    'typ',
-    'typcial',
-    'type&mdash;each',
-    'type&rehy;writers',
-    'type-23',
     'type-3',
-    'type-case',
-    'type-cast',
-    'type-casting',
-    'type-certificated',
-    'type-character',
-    'type-composing',
-    'type-converted',
-    'type-curves',
-    'type-d',
-    'type-design',
-    'type-from',
-    'type-in',
-    'type-lifting',
-    'type-locality',
-    'type-meaning',
     'type-of',
-    'type-of-occupation',
-    'type-rated',
-    'type-reicher',
-    'type-script',
-    'type-sentence',
-    'type-series',
-    'type-setter',
-    'type-setters',
-    'type-specimen',
-    'type-tested',
-    'type-this',
-    'type-tokens',
-    'type-wise',
-    'type/size',
-    'type7532a',
     'type:ford',
-    'type:token',
-    'type=quantile',
-    'typealign',
-    'typecasted',
-    'typed-out',
-    'typed.',
-    'typee',
-    'typefounder',
-    'typefounders',
-    'typelifter',
-    'typematter',
-    'typen',
-    'types/',
-    'types/varieties',
-    'types/voicings',
     'typesetting&mdash;no',
-    'typesetting&mdash;tends',
-    'typestyle',
-    'typeview',
-    'typewrite',
-    'typewriter&mdash;but',
-    'typewriter-like',
-    'typewriter.',
-    'typhi',
-    'typhlitis',
-    'typhlodromus',
-    'typhloesids',
-    'typhoon-class',
-    'typhosa',
-    'typi',
-    'typieally',
     'typing.pcx',
-    'typist-style',
-    'typists/clerkesses',
-    'typo-lecture',
-    'typo-visuel',
-    'typographia',
-    'typographics',
-    'typographies',
-    'typologist',
-    'typost',
-    'typsin',
-    'tyr&scaron',
-    'tyr/ser-protein',
-    'tyr58',
-    'tyrall',
-    'tyranids',
     'tyrannicide',
-    'tyrannises',
-    'tyrannising',
-    'tyrannizing',
-    'tyrannophobe',
-    'tyrannosaurs',
-    'tyrannosaurus-featured',
-    'tyrannosauruses',
-    'tyrans',
-    'tyrant-slayers',
-    'tyrant/trying',
-    'tyrany',
-    'tyrch',
-    'tyre-exhaust',
-    'tyre-ing',
-    'tyre-kicking',
     'tyre-life',
-    'tyre-maker',
-    'tyre-pressures',
-    'tyre-protected',
-    'tyre-pulling',
-    'tyre-scrabbling',
-    'tyre-screeched',
-    'tyre-squeal',
-    'tyre-tearing',
-    'tyre/recycling',
-    'tyrefitting',
-    'tyrella',
-    'tyremaker',
-    'tyremarks',
-    'tyretracked',
-    'tyretracks',
     'tyrhtil',
-    'tyrley',
-    'tyro-ministers',
-    'tyrocidin',
-    'tyrodiza',
-    'tyrol-innsbruck',
-    'tyrol-with-edelweiss',
-    'tyrolean-style',
-    'tyrolean-type',
-    'tyroleans',
-    'tyroler',
-    'tyrolese',
-    'tyrolia',
-    'tyrolian-like',
-    'tyrone-born',
-    'tyrosine-kinases',
     'tyrosine-specific',
-    'tyrouble',
-    'tyrrannies',
-    'tyrranopolis',
-    'tyrrell-hondas',
-    'tyrrell-matra',
-    'tyrrellian',
-    'tyrrellians',
-    'tyrrells',
-    'tyrrhastiadas',
-    'tyrt',
-    'tyryttiaki',
-    'tyse',
-    'tysehurst',
-    'tyser',
-    'tysetting',
     'tyskiewicz',
-    'tyson-frank',
-    'tyssandier',
-    'tysul',
-    'tytgat',
-    'tythingmen',
-    'tytonidae',
-    'tytti',
-    'tyu-tyu-tyu',
-    'tyuc',
-    'tyuchev',
-    'tyukin',
-    'tywyllwch',
-    'tyyrkyn',
-    'tyzack.',
-    'tyzak',
     'tyzen',
-    'tzabar',
-    'tzagournis',
-    'tzaneen',
-    'tzani-bey.',
-    'tzannatos',
-    'tzanne',
-    'tzara',
-    'tzara-like',
-    'tzarinas',
-    'tzars',
-    'tzd',
-    'tzedaka',
-    'tzedakis',
-    'tzedec',
-    'tzeentchian',
     'tzeltal',
-    'tzitzikia',
-    'tzitzikostas',
-    'tzniut',
-    'tzorriss',
-    'tzortsos',
-    'tzshoo',
-    'tzuriss',
-    'tzus',
-    'tzutuhil',
-    'tzvaras',
-    'tzvetan',
-    'tzvi',
-    'u&amp;lc',
-    'u&dollar;2,800',
-    'u&dollar;3.30',
     'u&lsqb',
-    'u&mdash;f',
-    'u&mdash;n',
-    'u&ndash',
-    'u&ndash;1206',
-    'u&ndash;1230',
-    'u&ndash;1230/g&ndash;dhzz',
-    'u&ndash;1234',
-    'u&ndash;18',
-    'u&ndash;v',
-    'u&zcaron;ice',
-    'u\'',
-    'u\'-bend',
-    'u\'-channel',
-    'u(iv)',
-    'u(vi)',
     'u+',
-    'u+1',
-    'u-13s',
-    'u-15',
-    'u-16.',
-    'u-17',
-    'u-17s',
-    'u-18.',
-    'u-18s',
-    'u-20',
-    'u-21s',
-    'u-24s',
-    'u-3000',
-    'u-3300',
-    'u-534',
-    'u-909',
     'u-axis',
-    'u-bats',
-    'u-bends',
-    'u-bix',
-    'u-bottomed',
-    'u-curve',
-    'u-decays',
-    'u-dune',
-    'u-eee',
-    'u-formation',
-    'u-gouge',
-    'u-iron',
-    'u-k',
-    'u-men',
-    'u-n-w-e-l-l',
-    'u-pa',
     'u-particles',
-    'u-pattern',
-    'u-plan',
-    'u-roy',
-    'u-s',
-    'u-sectioned',
-    'u-tube',
-    'u-turned',
-    'u-turning',
-    'u-v',
-    'u-wire',
-    'u.128',
-    'u.2',
-    'u.505',
-    'u.653',
-    'u.8',
     'u.9',
-    'u.93',
-    'u.99',
-    'u.9s',
-    'u.a.',
-    'u.b.',
-    'u.c.',
-    'u.d.',
-    'u.d.e.',
-    'u.d.t.',
-    'u.g.t',
-    'u.g.v.a.',
-    'u.k.i.a.s.',
-    'u.n.d.r.o.',
-    'u.n.i.c.e.f.',
-    'u.p.v.c',
     'u.r.21',
-    'u.s.&dollar&frac12;m.',
-    'u.s.&dollar;2&frac12;m.',
-    'u.s.&dollar;2,353,991.95',
-    'u.s.&dollar;2m',
-    'u.s.-based',
-    'u.s.-owned',
-    'u.s.-registered',
-    'u.s.-russian',
-    'u.s.a.a.f.',
-    'u.s.a.f.',
-    'u.s.f.w.s.',
-    'u.s.gal.',
-    'u.v',
-    'u.v.c.',
-    'u.w.f.',
     'u/&micro;l',
-    'u/14',
-    'u/14s',
-    'u/16',
-    'u/16s',
-    'u/day',
-    'u/j',
-    'u/kg/',
-    'u/kg/day',
-    'u/l.',
-    'u/u',
-    'u/v/',
-    'u/w',
-    'u/week',
-    'u0.067',
-    'u10',
     'u11-a24',
-    'u12\'s',
-    'u14s',
-    'u169',
-    'u16s',
-    'u19.99',
-    'u2-ish',
-    'u2-mainstreamed',
-    'u206g',
-    'u20s',
-    'u21\'s',
-    'u21-display',
-    'u21-teams',
-    'u220',
-    'u23',
-    'u235',
     'u238',
-    'u24',
-    'u25',
-    'u251mg',
-    'u2s',
-    'u320',
-    'u33-g34-u35',
-    'u40',
-    'u4ra',
-    'u5+ds',
-    'u54',
-    'u6-tata',
-    'u6000/300',
-    'u6000/500',
-    'u6000/dt',
-    'u6015',
     'u6305',
-    'u87mg',
-    'u8a',
-    'u96',
-    'u=0.1',
-    'u=1,000a',
-    'u=j',
-    'u=x2-y2',
-    'ua-6',
-    'ua-financed',
-    'ua251',
-    'uadi',
-    'uag',
-    'uahs',
-    'uality',
-    'uamah',
     'uamhas',
-    'uanle',
-    'uapt\'s-infolink',
-    'uapt-',
-    'uart',
-    'uathaweekulminister',
-    'uation',
-    'uaw',
-    'uawares',
-    'uaychaijustice',
-    'ub-',
-    'ub-levels',
-    'ub11',
-    'ub2',
-    'ub40-',
-    'ub40-labour',
     'ub9',
-    'ub96',
-    'ubackup',
-    'ubalbini',
-    'ubaydat',
-    'ubbar',
-    'ubd',
-    'ube1y',
-    'ubely',
-    'uberbrettl',
-    'ubermoppet',
-    'uberti',
-    'uberto',
-    'ubiety',
-    'ubinsk',
-    'ubiquitousness',
     'ubitron',
-    'ubitrons',
-    'ubley',
-    'ubolrat',
-    'ubs-philips',
-    'ubspd',
-    'ubt',
-    'ubti',
-    'ubuthongo',
-    'uc&ndash;46a',
-    'uc&ndash;64',
-    'uc-sandia',
-    'ucabel',
-    'ucablis',
-    'ucal',
-    'ucat',
     'ucbc',
-    'ucbsa',
-    'uccc',
-    'uccelli',
-    'uccialli',
-    'uccidetemi',
-    'ucero',
-    'ucet',
-    'uch02493',
-    'ucha',
-    'ucheldre',
-    'uchi-mata',
-    'uchikawa',
-    'uchimata',
-    'uchiza',
-    'uchl1',
     'ucht1',
-    'uchupi',
-    'uci/l',
-    'ucip-roc',
-    'ucko',
-    'ucli',
-    'ucml1',
-    'ucopia',
-    'ucrb',
-    'ucrel',
-    'ucsf',
-    'ucst',
-    'ucta&mdash;basically',
-    'ucwetec',
-    'ud&ucirc;n',
-    'ud/mha',
     'uda/',
-    'udairpur',
-    'udale',
-    'udanavayu',
-    'udawattakelle',
-    'udcsig-request&commat;sun.com',
-    'uddan',
-    'uddenholm',
-    'udderwash',
-    'udderwise',
-    'uddm',
-    'udds',
-    'uded',
-    'udeghe',
-    'udeghes',
-    'udf&mdash;an',
     'udf&mdash;deputy',
-    'udf&mdash;finance',
-    'udf&mdash;union',
-    'udf-centre',
-    'udf-led',
-    'udf-liberals',
-    'udf-supported',
-    'udf.the',
-    'udfp',
-    'udhbeg',
-    'uding',
-    'udiremmo',
-    'udit',
-    'udite',
-    'udizma',
-    'udj',
     'udmurtia',
-    'udokan',
-    'udon',
-    'udp&mdash;popular',
-    'udp-n-acetylglucosamine',
-    'udpb',
-    'udpn',
-    'udr/rir',
-    'udskzwdccvyt',
-    'udsp',
-    'udt/seal',
-    'udts',
-    'udu',
-    'udy',
-    'ueber',
-    'uefa-cup',
     'uefa/fifa',
-    'uegaki',
-    'ueki',
-    'ueli',
-    'uemera',
-    'uen',
-    'ueni',
-    'ueo',
-    'uera',
-    'uesat',
-    'uesco',
-    'uetliberg-kulm',
-    'uezdnye',
-    'ufb',
-    'ufby',
-    'ufc/hefce',
     'ufdc',
-    'uffculme',
-    'ufficiale',
-    'uffill',
-    'uffingham',
-    'uffington/oxfordshire',
-    'uffish',
-    'ufflngton',
-    'uffoland',
-    'uffolding',
-    'uffolstery',
-    'uffr',
-    'uffugo',
-    'ufi',
-    'uficyp',
-    'ufinal',
     'ufl',
-    'ufo-detecting',
-    'ufo-lore',
-    'ufo-spotting',
-    'uforb',
-    'ufricks',
-    'ufs',
-    'ufsquare',
-    'ug/g',
-    'ug/tube',
-    'ug1',
-    'ug6',
-    'uga',
-    'ugandan-registered',
-    'ugarit',
-    'ugboajah',
     'ugborough',
-    'ugbrooke',
-    'ugc-imposed',
-    'ugc-type',
-    'ugc/cnaa',
-    'ugeskrift',
-    'uggest',
-    'ugghhh',
-    'ugging',
-    'ugglas',
-    'ugglebarnby',
-    'ughars',
-    'ughh',
-    'ughs',
-    'ugine',
-    'uginon',
     'ugle&scaron',
-    'uglified',
-    'uglify',
-    'uglily',
-    'uglinesses',
-    'uglitch',
-    'ugljanin',
-    'ugly-comic',
-    'ugly-is-beautiful',
-    'ugoh',
-    'ugolin',
-    'ugolinhas',
-    'ugrian',
-    'ugrin',
-    'ugromov',
-    'ugs',
     'ugte',
-    'ugthorpe',
-    'ugtp',
-    'ugtt',
-    'ugua',
-    'uguale',
-    'ugurlutan',
-    'uguyen',
-    'uh&mdash',
-    'uh&ndash;1h',
-    'uh-1',
-    'uh-1b',
-    'uh-hu',
-    'uh-huhs',
-    'uh-tu-tu-',
-    'uhaitxa',
     'uharretuko',
-    'uhc',
-    'uheln&yacute',
-    'uher',
-    'uhf/625',
-    'uhhuh',
-    'uhlandstaresse',
-    'uhlandstrasse',
-    'uhlig',
-    'uhlman',
-    'uhlmann',
-    'uhm-uhm',
-    'uhming',
-    'uhro',
-    'uhse',
-    'uhura',
     'uiagm',
-    'uic.',
-    'uice',
-    'uicvm.uic.edu',
-    'uidh',
-    'uielded',
-    'uift',
-    'uileann',
-    'uillean',
-    'uimx',
-    'uinitial',
-    'uinity',
-    'uinl',
-    'uires',
-    'uirrel',
-    'uis-archive',
     'uis-pacs',
-    'uisgnaval',
-    'uish',
-    'uisng',
-    'uist.',
-    'uitenhage',
-    'uitgeverij',
-    'uiting',
-    'uitlanders',
-    'uitoto',
-    'uitzendbureaux',
-    'ujkdmfeoipsklfhlddwndsloufcsl',
-    'ujksehmskqxgkllqthompdhjjeklo',
-    'ujon',
-    'ujvid&eacute;k',
-    'uk&amp;ireland',
     'uk&mdash;see',
-    'uk&rehy;distributed',
-    'uk\'',
-    'uk-argentina',
-    'uk-australian',
-    'uk-backed',
-    'uk-banned',
-    'uk-bound',
-    'uk-brazilian',
-    'uk-bred',
-    'uk-flag',
-    'uk-german',
-    'uk-held',
-    'uk-incorporated',
-    'uk-iranian',
-    'uk-iraqi',
     'uk-irish',
-    'uk-kuwait',
-    'uk-libyan',
-    'uk-made',
-    'uk-orientated',
-    'uk-produced',
-    'uk-restricted',
-    'uk-s',
-    'uk-sponsored',
-    'uk-supplied',
-    'uk-uk-uk',
-    'uk-vietnam',
-    'uk-vietnamese',
-    'uk.18',
-    'uk.6',
-    'uk.ac.ed.castle',
     'uk.ac.shu',
-    'uk.in',
-    'uk/137',
-    'uk/cool',
-    'uk/dutch',
-    'uk/europe',
-    'uk2012',
-    'uk6',
-    'uk63t',
-    'uk:44',
-    'uk=',
-    'uka',
-    'ukaiim',
-    'ukal',
-    'ukalea',
-    'ukania',
     'ukanian',
-    'ukasta',
-    'ukaz',
-    'ukccs',
-    'ukdghhxbnlqjmdelopsgrtlnaqiff',
-    'uke',
-    'ukele',
-    'ukelelelele',
-    'ukeleles',
-    'ukeles',
-    'ukf',
-    'ukh&amacr',
-    'ukh-ukh',
-    'ukhca',
-    'ukhia',
-    'ukhreeo',
     'ukhrul',
-    'ukirt',
-    'ukkasta',
-    'uknet-relay',
-    'uknown',
-    'ukra',
-    'ukrainain',
-    'ukraine&mdash;the',
-    'ukrainian-populated',
-    'ukrainian-russian',
-    'ukrainophile',
-    'ukrajina',
-    'ukranians',
-    'ukratomenergoprom',
-    'ukrinform',
-    'ukrit',
     'uksc',
-    'ukstu',
-    'ukubstanduka',
-    'ukwill',
-    'ukwimi',
-    'ul&aacute;szl&oacute',
-    'ul&eacute',
-    'ul-haque',
-    'ul-var-ke-oos',
-    'ulama-i',
-    'ulanfu',
-    'ulanov',
-    'ulasey',
-    'ulatowski',
-    'ulayed',
-    'ulb',
     'ulcer-ridden',
-    'ulcerates',
-    'ulcered',
-    'ulcerogenesis',
-    'ulchas',
-    'ulciscaris',
-    'ulcr',
-    'uld',
-    'uldall',
-    'uldb',
-    'ulder',
-    'ulderico',
-    'ulema-i',
-    'ulemnoukogu',
-    'ulev',
-    'ulevs',
     'ulexite',
-    'ulf-dietrich',
-    'ulfberth',
-    'ulfcetel',
-    'ulfonphthaleinyl-n-acetyl-&bgr;-d-glucosamide',
-    'ulfric',
-    'ulfstein',
-    'ulginosum',
-    'ulias',
-    'ulidh',
-    'ulikooli',
-    'uliusfor',
-    'ulker',
-    'ulking',
-    'ull-back',
-    'ulladale',
     'ullapool-achiltibuie',
-    'ullar',
-    'ullaspool',
-    'ullaval',
-    'uller&oslash',
-    'ullet',
-    'ulleval',
-    'ulli',
-    'ullin',
-    'ullinish',
-    'ullman-margalit',
-    'ullmanesque',
-    'ullmann-margalit',
-    'ullmer',
-    'ullna',
-    'ullo-\'ullo-\'ullo',
     'ulloo',
-    'ullscarf.',
-    'ullsfjorden',
-    'ullstein',
-    'ullyart',
-    'ulmarua',
-    'ulmeh',
-    'uln',
-    'ulnlf',
-    'ulnocarpal',
-    'ulo',
-    'uloboridae',
-    'ulose',
-    'ulothrix',
-    'ulowi',
-    'ulozhenie',
     'ulpha',
-    'ulphus',
-    'ulriche',
-    'ulrichs',
-    'ulrik-johansson',
-    'uls/followed',
-    'ulsan',
-    'ulseb',
-    'ulsers',
-    'ulstat',
-    'ulster-built',
-    'ulster-led',
-    'ulster-owned',
-    'ulster-scotland',
-    'ulster-style',
-    'ulster-type',
     'ulsterization',
-    'ulstler',
-    'ulston',
-    'ulstrasound',
-    'ulswater',
-    'ult',
-    'ulta-violet',
-    'ulteriority',
-    'ulther',
-    'ultimacies',
-    'ultimate-copiability',
-    'ultimately_because',
-    'ultimately_in',
-    'ultimatley',
-    'ultimi',
-    'ultimo',
     'ultimos',
-    'ultimus',
-    'ultra&mdash;hygienic',
-    'ultra&rehy;imperialist',
-    'ultra&rehy;lightweight',
-    'ultra&rehy;short',
-    'ultra-',
-    'ultra-absorbent',
-    'ultra-abundance',
-    'ultra-alpine',
-    'ultra-anti-american',
-    'ultra-anxious',
-    'ultra-authoritarian',
-    'ultra-avantgarde',
-    'ultra-beta',
-    'ultra-breathable',
     'ultra-brittle',
-    'ultra-butch',
-    'ultra-centralised',
-    'ultra-combat',
-    'ultra-commercial',
-    'ultra-confident',
-    'ultra-controlled',
-    'ultra-courteous',
-    'ultra-critical',
-    'ultra-current',
-    'ultra-cutesy',
-    'ultra-daring',
-    'ultra-darwinian',
-    'ultra-decorative',
-    'ultra-deep',
-    'ultra-defensive',
     'ultra-detoxi',
-    'ultra-devoted',
-    'ultra-devout',
-    'ultra-diminutive',
-    'ultra-distance',
-    'ultra-drawing',
-    'ultra-easy',
-    'ultra-economical',
-    'ultra-enormous',
-    'ultra-familiar',
-    'ultra-fashionable',
-    'ultra-filtration',
-    'ultra-fine-tuned',
-    'ultra-finite',
-    'ultra-flexibility',
-    'ultra-floral',
     'ultra-free',
-    'ultra-fussiness',
-    'ultra-gentle',
-    'ultra-german',
-    'ultra-glow',
-    'ultra-graphic',
-    'ultra-happy',
-    'ultra-hardcore',
-    'ultra-hawkish',
-    'ultra-hefty',
-    'ultra-high-frequency',
-    'ultra-hip',
-    'ultra-hippy',
-    'ultra-important',
-    'ultra-incorporated',
-    'ultra-introverted',
     'ultra-keen',
-    'ultra-kind',
-    'ultra-leftist-womanist',
-    'ultra-leftists',
-    'ultra-legitimate',
-    'ultra-lightweight',
-    'ultra-low-volume',
-    'ultra-luxurious',
-    'ultra-marxist',
-    'ultra-mate',
-    'ultra-metaphysical',
-    'ultra-miniaturization',
-    'ultra-mod',
-    'ultra-model',
-    'ultra-modest',
-    'ultra-moral',
     'ultra-nation',
-    'ultra-nationalism',
-    'ultra-naughty',
-    'ultra-neat',
-    'ultra-negative',
-    'ultra-objectivist',
-    'ultra-obvious',
-    'ultra-patriotic',
-    'ultra-permissive',
-    'ultra-portability',
-    'ultra-private',
-    'ultra-professional',
-    'ultra-progressive',
-    'ultra-pure',
-    'ultra-quick',
-    'ultra-quiet',
     'ultra-radicals',
-    'ultra-rapid',
-    'ultra-rare',
-    'ultra-real',
-    'ultra-realistic',
-    'ultra-reformist',
-    'ultra-respectability',
-    'ultra-respectable',
-    'ultra-responsive',
-    'ultra-rich',
-    'ultra-right-wingers',
-    'ultra-right.in',
-    'ultra-rightists',
-    'ultra-selective',
-    'ultra-sep',
-    'ultra-sharp',
     'ultra-slow',
-    'ultra-smart',
-    'ultra-smooth',
-    'ultra-socialism',
-    'ultra-sonic',
-    'ultra-sophisticated',
-    'ultra-sophisticates',
-    'ultra-spartan',
-    'ultra-stable',
-    'ultra-stalinists',
-    'ultra-streamlined',
-    'ultra-strict',
-    'ultra-structure',
-    'ultra-stylish',
-    'ultra-super',
-    'ultra-svga',
     'ultra-swim',
-    'ultra-ticklish',
-    'ultra-togs',
-    'ultra-tory',
-    'ultra-trendiness',
-    'ultra-vilified',
-    'ultra-viola',
-    'ultra-vulcanian',
-    'ultra-yah',
-    'ultra-zionist',
-    'ultra.femininity',
-    'ultrabasic-acid',
-    'ultrabasic-basic',
-    'ultrabrite',
-    'ultracad.pcx',
-    'ultracamp',
     'ultracentrifuged',
-    'ultraconservatives',
-    'ultracushion',
-    'ultradense',
-    'ultradextral',
-    'ultrafine',
-    'ultrafree',
-    'ultrahip',
-    'ultraiolet',
-    'ultramagnetic',
-    'ultramarina',
-    'ultramicroscopic',
-    'ultramontanes',
-    'ultramontanist',
-    'ultraquick',
-    'ultrareligious',
     'ultrarunners',
-    'ultrascan',
-    'ultrascreen',
-    'ultrasilence',
-    'ultrasinistral',
-    'ultrasoft',
-    'ultrasonagraphy+oral',
-    'ultrasonographically',
-    'ultrasound-guided',
-    'ultrasound.',
-    'ultrasounds',
-    'ultrasouns',
-    'ultraspecialist',
-    'ultrastor',
-    'ultratherm',
-    'ultrathin',
     'ultraviolent',
-    'ultraviolet-blind',
-    'ultraviolet-irradiated',
-    'ultraviolet/x-ray',
-    'ultraxerous',
-    'ultrix/risc-based',
-    'ultrix/sql',
-    'ultrogotha',
-    'ultroscan',
-    'ulu&aacute',
-    'ulug',
-    'ulugurus',
-    'ului',
-    'uluk',
-    'ulula',
-    'ululated',
     'ululates',
-    'ululodes',
-    'uluots',
-    'uluru',
-    'ulverstone',
-    'ulvestris',
-    'ulviye',
-    'ulya',
-    'ulyanov/lenin',
-    'ulyett',
-    'um&mdash',
-    'um-hm',
-    'um65v',
-    'um66w',
-    'umaa',
-    'umalah',
     'umamung',
-    'uman',
-    'umana',
-    'umang',
-    'umarried',
-    'umaru',
-    'umbara',
-    'umbel',
-    'umbellatum',
-    'umbellatus',
-    'umbellifer',
-    'umber-and-cream-coloured',
-    'umber-coloured',
-    'umberella',
-    'umberleigh',
-    'umbers',
     'umberston',
-    'umbertide',
-    'umbgrove',
-    'umbiko',
-    'umbili',
-    'umbilic',
-    'umbilicaria',
-    'umbilicated',
-    'umbilici',
-    'umbilicum',
-    'umbles',
-    'umbombed',
-    'umbraculifera',
-    'umbrae',
-    'umbrage-taking',
-    'umbrell',
     'umbrella-ed',
-    'umbrella-holder',
-    'umbrella-like',
-    'umbrella-organisation',
-    'umbrella-shaded',
-    'umbrella-stand',
-    'umbrella-topped',
-    'umbrella-type',
-    'umbrellad',
-    'umbrellarama',
-    'umbrello',
-    'umbrells',
-    'umbudi',
-    'umbutfo',
-    'umea',
-    'umemployed',
     'umemployment',
-    'umezawa',
-    'umfolozi',
-    'umfraville',
-    'umfunktionierung',
-    'umgeni',
-    'umh',
-    'umi',
-    'umiaks',
-    'umir',
-    'uml',
-    'umland',
-    'umlands',
-    'umlauts',
-    'umlazi',
-    'umless',
     'umm-shaif',
-    'umming',
-    'ummk',
-    'ummmm',
-    'ummmmm',
-    'ummoved',
-    'umms',
-    'umno-dominated',
-    'umno-led',
-    'umodis',
-    'umol/24',
-    'umpf',
-    'umph',
-    'umping',
-    'umpleby',
-    'umpred',
     'umprimed',
-    'umpteen-nil',
-    'umpton',
-    'umpty',
-    'umruh',
-    'umsl',
-    'umsturzvorlage',
-    'umteteli',
-    'umuahia',
-    'umunna',
-    'umvuma',
-    'umw-dominated',
-    'umwelt-virginity',
-    'umweltschmertz',
-    'umy',
-    'un&rehy',
     'un&rehy;authorised',
-    'un&rehy;balanced',
-    'un&rehy;breakable',
-    'un&rehy;counted',
-    'un&rehy;dernourished',
-    'un&rehy;doubted',
-    'un&rehy;dramatic',
-    'un&rehy;encumbered',
-    'un&rehy;equivocally',
-    'un&rehy;fathomable',
-    'un&rehy;heroic',
-    'un&rehy;known',
-    'un&rehy;likely',
-    'un&rehy;manageable',
-    'un&rehy;matching',
-    'un&rehy;opposed',
     'un&rehy;punished',
-    'un&rehy;refuelled',
-    'un&rehy;stained',
-    'un&rehy;sustainable',
-    'un&rehy;sympathetic',
-    'un&rehy;systematic',
-    'un&rehy;welcome',
-    'un\'',
-    'un\'ape',
-    'un+happy+er',
-    'un-1990s',
-    'un-accompanied',
-    'un-acid',
-    'un-acknowledged',
-    'un-addressed',
-    'un-administered',
     'un-african',
-    'un-americanism',
-    'un-americans',
-    'un-analysed',
-    'un-and',
-    'un-anglican',
-    'un-authoritarian',
-    'un-authorized',
-    'un-based',
-    'un-becoming',
-    'un-belief',
-    'un-belief-a-boll',
-    'un-biased',
-    'un-bloody-natural',
-    'un-body',
-    'un-bolovian',
     'un-bombed',
-    'un-bought',
-    'un-bracketed',
-    'un-builds',
-    'un-built-up',
-    'un-byronic',
-    'un-carpeted',
-    'un-cash',
-    'un-catholic',
-    'un-chamoniard',
-    'un-clammish',
-    'un-cluttered',
-    'un-common',
-    'un-compromising',
-    'un-conscious',
-    'un-convincingly',
     'un-cool',
-    'un-coordinated',
-    'un-create',
-    'un-darkness',
-    'un-dead',
-    'un-democratic',
-    'un-dented',
-    'un-derefield',
-    'un-dergraduate',
-    'un-detected',
-    'un-diesel-like',
-    'un-differentiated',
-    'un-do',
-    'un-documented',
-    'un-doubters',
-    'un-du-lar-toos',
     'un-ealing',
-    'un-easy',
-    'un-ec',
-    'un-ecclesiastical',
-    'un-edifying',
-    'un-egyptian',
-    'un-elected',
-    'un-eliminated',
-    'un-embellished',
-    'un-enforced',
-    'un-english-looking',
-    'un-english-qualified',
-    'un-englishness',
-    'un-erase',
-    'un-excellent',
-    'un-existence',
     'un-exotic',
-    'un-expected',
-    'un-exploited',
-    'un-familiar',
-    'un-favourite',
-    'un-feminist',
-    'un-flat',
-    'un-foppish',
-    'un-format',
-    'un-freezes',
-    'un-friend-li-ness',
-    'un-fucking-real',
-    'un-gaullist',
-    'un-gibson',
-    'un-godly',
-    'un-goos-ti-foe-lia',
     'un-greek',
-    'un-grieg',
-    'un-guarded',
-    'un-hatched',
-    'un-heated',
-    'un-hellenic',
-    'un-highland',
-    'un-historical',
-    'un-hitched',
-    'un-hollywood',
-    'un-hong-kong-like',
-    'un-horsy',
-    'un-hung',
-    'un-iced',
-    'un-idealists',
-    'un-idiom-like',
     'un-impressed',
-    'un-inscribed',
-    'un-inspired',
-    'un-instigated',
-    'un-integrated',
-    'un-intelligenced',
-    'un-invent',
-    'un-irish',
-    'un-irishness',
-    'un-ironic',
-    'un-jaded',
-    'un-jake-like',
-    'un-jam',
-    'un-jetlagged',
-    'un-jewish',
-    'un-labelling',
     'un-ladylike',
-    'un-laid-back',
-    'un-lamb',
-    'un-learning',
-    'un-led',
-    'un-libya',
-    'un-linked',
-    'un-lonely',
-    'un-loony',
-    'un-lovely',
-    'un-makes',
-    'un-making',
-    'un-mark',
-    'un-marriage',
-    'un-measurable',
-    'un-met',
     'un-missable',
-    'un-monitored',
-    'un-moralistic',
-    'un-mortal',
-    'un-motorised',
-    'un-necessary',
-    'un-newsworthy',
-    'un-noble',
-    'un-noise',
-    'un-nunlike',
-    'un-nutritous',
-    'un-oau-ico-arab',
-    'un-obvious',
-    'un-occupied',
-    'un-occur',
-    'un-oceanic',
     'un-oliver-like',
-    'un-optioned',
-    'un-organised',
-    'un-paid',
-    'un-partnered',
-    'un-peaceful',
-    'un-period',
-    'un-permanence',
-    'un-persons',
-    'un-persuaded',
-    'un-platonic',
-    'un-police',
-    'un-polybian',
-    'un-pompous',
-    'un-pop',
-    'un-popular',
     'un-prig',
-    'un-purchased',
-    'un-put-downable',
-    'un-quantified',
-    'un-rabbit-like',
-    'un-rampant',
-    'un-rationed',
-    'un-readable',
-    'un-rebuilt',
-    'un-recognised',
-    'un-recommended',
-    'un-refereed',
-    'un-reformed',
-    'un-related',
-    'un-reliability',
-    'un-rem',
     'un-remembered',
-    'un-reported',
-    'un-required',
-    'un-retriever-like',
-    'un-rigid',
-    'un-rock',
-    'un-romany',
-    'un-routine',
-    'un-run',
-    'un-sanctioned',
-    'un-sarcastic',
-    'un-saudi',
-    'un-scolding',
-    'un-screwed',
-    'un-self',
-    'un-selfconscious',
     'un-sentimental',
-    'un-shaped',
-    'un-sheikhly',
-    'un-solid',
-    'un-souled',
-    'un-spilled',
-    'un-spoilt',
-    'un-startling',
-    'un-supernatural',
-    'un-sustainable',
-    'un-taxed',
-    'un-tellenorean',
-    'un-thatcher',
-    'un-touched',
-    'un-truths',
-    'un-turbo-charged',
     'un-uniformed',
-    'un-user-friendly',
-    'un-usuable',
-    'un-utopian',
-    'un-victorian',
-    'un-visited',
-    'un-volunteer',
-    'un-washed',
-    'un-white',
-    'un-wild',
-    'un-winglike',
-    'un-witching',
-    'un-wormed',
-    'un-yorkshire',
-    'un-zip',
-    'un/',
     'un/ec',
-    'un/ece/ec',
-    'un/gtdi',
-    'un/iaea',
-    'una&rehy;shamed',
-    'una-rigged',
-    'unabh&auml;ngigen/alliance',
-    'unable/unwilling',
-    'unableness',
-    'unabraded',
-    'unabused',
-    'unaccentuated',
-    'unacceptabilities',
-    'unacceptably-toxic',
-    'unacceptibility',
-    'unaccommodable',
     'unaccommodated',
-    'unaccommodating',
-    'unaccounted&rehy;for',
-    'unaccredited',
-    'unaccusing',
-    'unaccustomedly',
-    'unaccustomedness',
-    'unacofl',
-    'unacted',
-    'unactionable',
-    'unactioned',
-    'unactualised',
-    'unadaptive',
-    'unadjacent',
-    'unadmired',
-    'unadoptable',
     'unadventurousness',
-    'unaerodynamic',
-    'unaffected-a',
-    'unaffiliated&mdash;internal',
-    'unafraid.it',
-    'unaggregated',
-    'unaided.',
-    'unakin',
-    'unakul',
-    'unakuldeputy',
-    'unal',
-    'unalienable',
-    'unalive',
-    'unalleviated',
-    'unalleviatedly',
-    'unalloyedly',
     'unalluringly',
-    'unam',
-    'unamazingly',
-    'unambushed',
-    'unamed',
-    'unameliorated',
-    'unamenable',
-    'unamericanism',
-    'unamericans',
-    'unaminously',
-    'unamo',
-    'unamortised',
-    'unamusedly',
-    'unamusing',
-    'unanalytic',
-    'unanalytically',
     'unanalyzed',
-    'unanamously',
-    'unananswered',
-    'unaneled',
-    'unanglican',
-    'unanguished',
-    'unanimous.',
-    'unaninmous',
-    'unanswering',
-    'unanxious',
-    'unapparelled',
-    'unappealably',
-    'unappealingly',
-    'unappeasing',
-    'unappetising-looking',
-    'unappointed',
     'unapprenticed',
-    'unapproached',
-    'unapprovedd',
-    'unargumentative',
-    'unarmned',
-    'unarrange',
-    'unarrested',
-    'unashamededly',
-    'unaspiring',
-    'unassailable.',
-    'unassaulted',
-    'unassertive/being',
-    'unassessed',
-    'unassumed',
-    'unastounding',
-    'unastronomical',
     'unatmospheric',
-    'unattachedness',
-    'unattachment',
-    'unattacked',
-    'unattained',
-    'unattracted',
-    'unattri',
-    'unattributably',
-    'unauditable',
-    'unauspicious',
-    'unauthenticated',
-    'unautherised',
-    'unauthorisedly',
-    'unauthoritarian',
-    'unauthoritative',
-    'unavail',
     'unavailabilities',
-    'unavailables',
-    'unavem',
-    'unavenged',
-    'unavoidability',
-    'unavowed',
-    'unaw',
-    'unawar',
-    'unawarded',
-    'unbabylike',
-    'unbackable',
-    'unbagshaw',
-    'unbaited',
-    'unbaking',
-    'unbalanced\'',
-    'unballasted',
     'unballed',
-    'unban',
-    'unbandaged',
-    'unbankable',
-    'unbar',
-    'unbased',
-    'unbearability',
-    'unbears',
-    'unbeated',
-    'unbecome',
-    'unbedded',
-    'unbedingtheit',
-    'unbefitting',
-    'unbegotten',
-    'unbekannt',
-    'unbekannten',
     'unbeknowing',
-    'unbeleivable',
-    'unbeliev',
-    'unbelievable.',
-    'unbelievably-coloured',
-    'unbelieve',
-    'unbelieved',
-    'unbeloved',
-    'unbendable',
-    'unbenevolent',
-    'unbequeathed',
-    'unberto',
-    'unbewussten',
-    'unbiassed',
-    'unbid',
-    'unbinned',
     'unbiodegradable',
-    'unbiological',
-    'unbiopsy',
-    'unbioturbated',
-    'unblacked-out',
-    'unblanched',
-    'unbland',
-    'unbleeding',
-    'unbleeped',
-    'unbleievable',
-    'unblendable',
-    'unblighted',
-    'unblurred',
-    'unbobbing',
-    'unbogus',
-    'unbolts',
     'unboned',
-    'unbonussed',
-    'unbored',
-    'unbottlenecked',
-    'unbought',
-    'unbounced',
-    'unbound1',
-    'unbowdlerising',
-    'unbowled',
-    'unboyish',
-    'unbraceleted',
-    'unbraid',
-    'unbrained',
-    'unbraked',
-    'unbranching',
-    'unbreached',
     'unbreakfasted',
-    'unbreaking',
-    'unbreathed',
-    'unbred',
-    'unbribable',
-    'unbribed',
-    'unbridgable',
-    'unbridle',
-    'unbridling',
-    'unbrilliant',
-    'unbroached',
-    'unbrokenly',
-    'unbrokenness',
-    'unbrotherly',
-    'unbrutalised',
-    'unbudging',
     'unbuffeted',
-    'unbuilding',
-    'unbunched',
-    'unbunches',
-    'unbundlers',
-    'unburies',
-    'unburning',
-    'unburnished',
-    'unburst',
-    'unburthened',
-    'unbury',
-    'unburying',
-    'unbusy',
-    'unbuttered',
-    'unbuttonable',
-    'unbz',
     'unca',
-    'uncabbed',
-    'uncalculated',
-    'uncalloused',
-    'uncallused',
-    'uncanceled',
-    'uncancelled',
-    'uncandled',
-    'uncanned',
-    'uncanniest',
-    'uncanonicles',
-    'uncanonized',
-    'uncapitalist',
-    'uncaptioned',
-    'uncaptured',
-    'uncarded',
     'uncare',
-    'uncaressed',
-    'uncaria',
-    'uncarlike',
-    'uncarriably',
-    'uncarved',
-    'uncasing',
-    'uncastigated',
-    'uncastrated',
-    'uncatch',
-    'uncatlike',
-    'uncelebrate',
-    'uncensorious',
-    'uncentralised',
-    'uncer&rehy;tainty',
-    'uncert',
     'uncertain-tempered',
-    'uncertainity',
-    'uncertaintly',
-    'uncertainty&mdash;for',
-    'uncertanties',
-    'uncertayne',
-    'uncertente',
-    'uncessary',
-    'uncf',
-    'uncfder',
-    'unchain',
-    'unchainable',
-    'unchamfered',
-    'unchangeableness',
-    'unchannelled',
-    'uncharacterized',
     'uncharecteristically',
-    'unchargeable',
-    'uncharitableness',
-    'uncharmable',
-    'uncharred',
-    'unchastenable',
-    'uncheatable',
-    'uncheckable',
-    'unchelated',
-    'unchemicated',
-    'uncherished',
-    'unchewable',
-    'unchildish',
-    'unchippable',
-    'unchippy',
-    'unchoosy',
     'unchopped',
-    'unchristened',
-    'uncialis',
-    'uncials',
-    'uncid',
-    'uncinariasis',
-    'uncinatus',
-    'uncinula',
-    'uncircled',
-    'uncirculating',
-    'uncivility',
-    'unciviliz',
-    'unclamp',
-    'unclarified',
-    'unclasp',
-    'unclassifable',
     'unclassifiables',
-    'unclassy',
-    'unclawed',
-    'uncle\'',
-    'uncle-camillo-eyes',
-    'uncle-father',
-    'uncle-george',
-    'uncle-ly',
-    'uncle-solicitor',
-    'uncle/godfather',
-    'uncle/nephew',
-    'uncleaness',
-    'uncleanly',
-    'uncleby',
-    'unclenches',
-    'unclimable',
     'unclips',
-    'unclocking',
-    'uncloggable',
-    'uncloistered',
-    'unclothing',
-    'unclotted',
-    'uncloven',
-    'unclutched',
-    'unco-ordinates',
-    'uncoached',
-    'uncoagulated',
-    'uncock',
-    'uncocked',
-    'uncodable',
-    'uncol',
-    'uncollectivist',
     'uncollegial',
-    'uncolloquial',
-    'uncom&rehy;fortable',
-    'uncom&rehy;petitive',
-    'uncombusted',
-    'uncomformably',
-    'uncomfort&rehy;able',
-    'uncomfortable.',
-    'uncomfortableness',
-    'uncomfortably-phrased',
-    'uncomforting',
-    'uncommanded',
-    'uncommemorated',
-    'uncommercialised',
-    'uncommercialized',
-    'uncommercially',
     'uncommonable',
-    'uncommunicated',
-    'uncompacted',
-    'uncompassed',
-    'uncompelling',
-    'uncompetitively',
-    'uncomplacently',
-    'uncomplicated.',
-    'uncomplicatedness',
-    'uncomposed',
-    'uncomprehensive',
-    'uncompresses',
-    'uncomputed',
-    'uncomventional',
-    'uncon&rehy;stitutional',
-    'unconciliatory',
     'unconcious',
-    'unconcise',
-    'unconconscious',
-    'uncondensed',
-    'uncondescending',
-    'unconditional-surrender',
-    'unconditionality',
-    'unconducive',
-    'unconfiding',
-    'unconformity-bounded',
-    'unconfortably',
-    'uncongested',
-    'unconjecturable',
-    'unconmscious',
-    'unconnectable',
-    'unconnectedly',
     'unconscientious',
-    'unconscious-dominated',
-    'unconscious_by',
-    'unconsented',
-    'unconservative',
-    'unconserved',
-    'unconstant',
-    'unconstitootional',
-    'unconstricted',
-    'unconstructed',
-    'unconstructively',
-    'uncontemplatable',
-    'uncontemplated',
-    'uncontextualised',
-    'uncontextualized',
-    'uncontoured',
     'uncontrolable',
-    'uncontroversial-looking',
-    'uncontroverted',
-    'unconvenanted',
-    'unconvention',
-    'unconventional-looking',
-    'unconveyed',
-    'uncoolest',
-    'uncopiable',
-    'uncopyable',
-    'uncopyrighted',
-    'uncored',
-    'uncorrectable',
-    'uncorrosible',
-    'uncostable',
-    'uncostumed',
     'uncosy',
-    'uncounselled',
-    'uncountrylike',
-    'uncoupler',
-    'uncouples',
-    'uncourageous',
-    'uncoursed',
-    'uncourteous',
-    'uncourtly',
-    'uncouth-',
-    'uncouthness',
-    'uncouthnesses',
-    'uncowled',
-    'uncrackable',
-    'uncramped',
-    'uncrating',
     'uncreamed',
-    'uncrease',
-    'uncreating',
-    'uncreation',
-    'uncreditworthy',
-    'uncriminalised',
-    'uncrippled',
-    'uncriticised',
-    'uncrontrolled',
-    'uncross',
-    'uncrosslinked',
-    'uncrtain',
-    'uncrumbed',
-    'uncrumpling',
-    'uncrushability',
-    'uncrusting',
     'uncrystallised',
-    'uncrystallized',
-    'uncstd',
-    'unctions',
-    'uncubated',
-    'uncucarable',
-    'unculled',
-    'uncultivatable',
-    'uncured',
-    'uncustomarily',
-    'uncuttable',
-    'und-orr',
-    'unda-al',
-    'unda-latin',
-    'unda-wacc',
-    'undamaging',
     'undamming',
-    'undamned',
-    'undanceability',
-    'undark',
-    'undarned',
-    'undashed',
-    'undate',
-    'undauntedly',
-    'undd',
-    'undead/passed',
-    'undeadnik',
-    'undebatable',
-    'undebated',
-    'undebuggable',
-    'undecayed',
-    'undecidable.',
     'undecidedly',
-    'undecideds',
-    'undeclamatory',
-    'undeconstructed',
-    'undedeclared',
-    'undefaced',
-    'undefeatedly',
-    'undefendable',
-    'undeferentially',
-    'undeflected',
-    'undegraded',
-    'undeleted',
-    'undeliberate',
-    'undelighted',
-    'undelimited',
-    'undeliverable',
     'undeluded',
-    'undemandingly',
-    'undemocracy',
-    'undemolished',
-    'undemonstrable',
-    'undenied',
-    'undeplete',
-    'undeployable',
-    'undepreciated',
-    'undeputed',
-    'under&dollar;6,000',
-    'under&mdash;paid',
-    'under&mdash;represented',
-    'under&ndash;19',
-    'under&ndash;estimation',
-    'under&rehy;arm',
     'under&rehy;body',
-    'under&rehy;consult',
-    'under&rehy;current',
-    'under&rehy;determined',
-    'under&rehy;employed',
-    'under&rehy;employment',
-    'under&rehy;estimate',
-    'under&rehy;foot',
-    'under&rehy;going',
-    'under&rehy;growth',
-    'under&rehy;involvement',
-    'under&rehy;nose',
-    'under&rehy;nourished',
-    'under&rehy;par',
-    'under&rehy;performed',
-    'under&rehy;provision',
     'under&rehy;remunerated',
-    'under&rehy;represent',
-    'under&rehy;sized',
-    'under&rehy;stand',
-    'under&rehy;stated',
-    'under&rehy;storied',
-    'under&rehy;utilisation',
-    'under&rehy;utilized',
-    'under&rehy;valued',
-    'under&rehy;valuing',
-    'under&rehy;write',
-    'under\'t',
-    'under-&dollar;100',
-    'under-11\'s',
-    'under-14-year-olds',
-    'under-15\'s',
     'under-2.5w',
-    'under-20s',
-    'under-24s',
-    'under-25-year',
-    'under-25-year-olds',
-    'under-30',
-    'under-40s',
-    'under-42',
-    'under-7-day',
-    'under-72kg',
-    'under-8s',
-    'under-95kg',
-    'under-absorbency',
-    'under-accentuated',
-    'under-active',
-    'under-aged',
     'under-assessed',
-    'under-aware',
-    'under-baking',
-    'under-base',
-    'under-beered',
-    'under-bellies',
-    'under-belly',
-    'under-bid',
-    'under-billing',
-    'under-blanket',
-    'under-blankets',
-    'under-breeches',
-    'under-bridge',
-    'under-brush',
-    'under-butlers',
-    'under-canvassed',
     'under-capacity',
-    'under-capitalization',
-    'under-capitalized',
-    'under-carriages',
-    'under-certification',
-    'under-challenged',
-    'under-charged',
-    'under-chassis-mounted',
-    'under-classes',
-    'under-colour',
-    'under-colour.',
-    'under-compensating',
-    'under-conceptualised',
-    'under-confidence',
-    'under-confident',
-    'under-consumptionism',
     'under-consumptionist',
-    'under-control',
-    'under-costing',
-    'under-counter',
-    'under-crotch',
-    'under-culled',
-    'under-currents',
-    'under-curtain',
-    'under-curtains',
-    'under-declares',
-    'under-defined',
-    'under-demanding',
-    'under-determine',
-    'under-development\'',
-    'under-diagnosed',
-    'under-diagnosis',
     'under-documented',
-    'under-draining',
-    'under-drawings',
-    'under-dress',
-    'under-earth',
-    'under-edge',
-    'under-emphasized',
-    'under-encouraged',
-    'under-exercised',
-    'under-experienced',
-    'under-expose',
-    'under-exposed',
-    'under-fda',
-    'under-fed',
-    'under-felt',
-    'under-fifteens',
     'under-fitted',
-    'under-foot',
-    'under-footman',
-    'under-forecasting',
-    'under-foreman',
-    'under-foremen',
-    'under-fours',
-    'under-fourteens',
-    'under-frame',
-    'under-fund',
-    'under-fuselage',
-    'under-gardeners',
-    'under-garment',
-    'under-garments',
-    'under-graduate',
-    'under-groin',
     'under-ground',
-    'under-headed',
-    'under-hedged',
-    'under-hit',
-    'under-hound',
-    'under-indeed',
-    'under-inflated',
-    'under-integration',
-    'under-invoicing',
-    'under-involved',
-    'under-issues',
-    'under-kill',
-    'under-labourer',
-    'under-layer',
-    'under-leases',
-    'under-led',
     'under-levels',
-    'under-liquid',
-    'under-maids',
-    'under-maintained',
-    'under-make-up',
-    'under-managed',
-    'under-matron',
-    'under-mining',
-    'under-modulated',
-    'under-motivated',
-    'under-neath',
-    'under-nine',
-    'under-nourishes',
-    'under-nourishment',
-    'under-nutrition',
-    'under-one',
     'under-ones',
-    'under-ordered',
-    'under-ordering',
-    'under-organised',
-    'under-payment',
-    'under-perform',
-    'under-pinned',
-    'under-pins',
-    'under-planned',
-    'under-planting',
-    'under-played',
-    'under-polluted',
-    'under-predict',
-    'under-prescribing',
-    'under-presser',
-    'under-pressured',
     'under-price',
-    'under-pricing',
-    'under-producing',
-    'under-promised',
-    'under-publicity',
-    'under-rather',
-    'under-react',
-    'under-record',
-    'under-recruited',
-    'under-recruitment',
-    'under-registration',
-    'under-road',
-    'under-roof',
-    'under-sample',
-    'under-saving',
-    'under-sea',
     'under-seasoned',
-    'under-seat',
-    'under-secetary',
-    'under-secretaryship',
-    'under-selection',
-    'under-sell',
-    'under-selling',
-    'under-servant',
-    'under-servants',
-    'under-settling',
-    'under-sheet',
-    'under-shepherds',
-    'under-shirt',
-    'under-side',
-    'under-sides',
-    'under-sixteens',
     'under-sixties',
-    'under-socialized',
-    'under-soil',
-    'under-specified',
-    'under-stairs',
-    'under-stand',
-    'under-stand(s)',
-    'under-standing',
-    'under-stated',
-    'under-stimulated',
-    'under-stimulates',
-    'under-stimulation',
-    'under-storey',
-    'under-strain',
-    'under-street',
-    'under-stressed',
     'under-studied',
-    'under-tail',
-    'under-taxed',
-    'under-ten-year-olds',
-    'under-the',
-    'under-the-bedcovers',
-    'under-the-floor',
-    'under-the-neck',
-    'under-the-skin',
-    'under-the-tank',
-    'under-the-tongue',
-    'under-the-wood',
-    'under-theorized',
-    'under-things',
-    'under-thirteens',
-    'under-thirties',
     'under-thought-out',
-    'under-threat',
-    'under-threat-of-closure',
-    'under-treasurer',
-    'under-treated',
-    'under-treatment',
-    'under-twenties',
-    'under-usage',
-    'under-utilise',
-    'under-utilising',
-    'under-utilizing',
-    'under-valuation',
-    'under-valuing',
-    'under-vehicle',
-    'under-waiter',
-    'under-wear',
     'under-worked',
-    'under-worldy',
-    'under-written',
-    'under-xxxx',
-    'under.emphasized',
-    'under.utilised',
-    'under/ct',
-    'under/or',
-    'under/overspends',
-    'under/the',
-    'under/their',
-    'under15',
-    'under21',
-    'under35',
-    'underabundance',
-    'underaccretion',
     'underachievement\'',
-    'underachiever',
-    'underachieves',
-    'underacknowledged',
-    'underadvertise',
-    'underanalysed',
-    'underanticipating',
-    'underappreciation',
-    'underarmed',
-    'underback',
-    'underbanks',
-    'underbelieve',
-    'underbite',
-    'underbound',
-    'underbounding',
-    'underbudgeted',
     'underbuilt',
-    'underbutler',
-    'undercapitalisation',
-    'undercarpet',
-    'undercarved',
-    'undercast',
-    'undercatalogued',
-    'underclaiming',
-    'underclinging',
-    'underclubbing',
-    'undercompensated',
-    'underconditions',
-    'underconfident',
-    'underconsumption/',
-    'undercook',
-    'undercounted',
     'undercrofts',
-    'undercur&rehy;rent',
-    'undercurtain',
-    'undercurtains',
-    'undercutters',
-    'underdeck',
-    'underdeclared',
-    'underdevelop',
-    'underdevelop&rehy;ment',
-    'underdeveloped/unfavoured',
-    'underdeveloping',
-    'underdocumented',
-    'underdose',
-    'underdress',
-    'underdtanding',
-    'underemphasise',
     'underemphasising',
-    'underendowed',
-    'underestmate',
-    'underexpectation',
-    'underexpose',
-    'underexposing',
-    'underexposure',
-    'underfelting',
-    'underfinancing',
-    'underfives',
-    'underfulfilled',
-    'underfunding\'',
-    'underg',
-    'underglass',
-    'underglaze-red',
-    'undergo&rehy;ing',
     'undergoe',
-    'undergound',
-    'undergoverned',
-    'undergrad',
-    'undergraded',
-    'undergrads',
-    'undergraduate.',
-    'undergrazed',
-    'underground&rehy;was',
-    'underground\'',
-    'underground-as',
-    'underground-br',
-    'underground-dwelling',
-    'underground-oriented',
-    'undergrounded',
-    'undergrounds',
     'underhandedly',
-    'underhill/popular',
-    'underhive',
-    'underhoof',
-    'underinsuring',
-    'underinvest',
-    'underinvested',
-    'underinvestment',
-    'underivatised',
-    'underived',
-    'underlaced',
-    'underlap',
-    'underlives',
-    'underloaded',
-    'underlocal',
-    'underlord',
     'undermanaged',
-    'undermanager',
-    'undermarket',
-    'undermat',
-    'undermicroaerophilic',
-    'underminer',
-    'underminers',
-    'underminings',
-    'undermotivated',
-    'underne',
-    'underneath/',
-    'underneath/beside',
-    'undernourished-looking',
-    'underoccupancy',
-    'underocean',
-    'underoll',
     'underpainted',
-    'underpanties',
-    'underpart',
-    'underperceived',
-    'underperformers',
-    'underpin\'',
-    'underpitched',
-    'underplant',
-    'underplantings',
-    'underplot',
-    'underpopulation',
-    'underpraise',
-    'underpredict',
-    'underprepared',
-    'underprescribers',
-    'underpresenting',
     'underpressure',
-    'underpriviledged',
-    'underprivileged-',
-    'underpriviliged',
-    'underproduction',
-    'underpromote',
-    'underprotected',
-    'underqualified',
-    'underran',
-    'underratted',
-    'underrecognised',
-    'underrecorded',
-    'underrehearsed',
-    'underrepresent',
-    'underrr',
-    'underrrr',
     'underruns',
-    'undersa',
-    'underscum',
-    'underseal',
-    'underseasoned',
-    'undersells',
-    'underserving',
-    'undersharer',
-    'undershaw',
-    'undershell',
-    'undershrubs',
-    'undersink',
-    'undersisized',
-    'undersizing',
-    'underskid',
-    'underslab',
     'underslips',
-    'underslung',
-    'undersocialisation',
-    'undersold-its',
-    'underspends',
-    'underspread',
-    'understa',
-    'understadning',
-    'understage',
-    'understand.',
-    'understand/that',
-    'understandably-depressed',
-    'understande',
-    'understanders',
-    'understanding/learning',
-    'understated\'',
     'understatedness',
-    'understeered',
-    'understeerer',
-    'understitching',
-    'understocking',
-    'understond',
-    'understonde',
-    'understood-to-be-known',
-    'understood.',
-    'understrapper',
-    'understreet',
-    'understressed',
-    'understudy-plus-supplement',
-    'undersurfaces',
-    'undertaken.one',
-    'undertakin',
     'undertaking&mdash;but',
-    'undertaking\'',
-    'undertakings.',
-    'undertalented',
-    'undertand',
-    'undertank',
-    'undertermined',
-    'undertested',
-    'underthread',
-    'underthrusts',
-    'undertrain',
-    'undertreat',
-    'undertreatment',
-    'underused/unused',
-    'underutilization',
-    'undervests',
     'underviewers',
-    'underware',
-    'underwat',
-    'underway.chris',
-    'underway/after',
-    'underwear-as-outerwear',
-    'underwear-fixated',
-    'underweighted',
-    'underwelt',
-    'underwire',
-    'underwr',
-    'underzone',
-    'undescended',
-    'undescroybable',
-    'undesigning',
-    'undesirable.',
     'undesiring',
-    'undespairing',
-    'undespoiled',
-    'undestroying',
-    'undetained',
-    'undetctable',
-    'undetectable.',
-    'undetermination',
-    'undeviatingly',
-    'undevoted',
-    'undialectical',
-    'undialysed',
-    'undiddled',
-    'undientified',
-    'undilatable',
-    'undilatably',
     'undilemmatic',
-    'undill',
-    'undine',
-    'undines',
-    'undis&rehy;puted',
-    'undiscarvard',
-    'undiscernible',
-    'undisconcerted',
-    'undiscover',
-    'undiscoverable',
-    'undiseased',
-    'undislosed',
-    'undisputable',
-    'undisrupted',
-    'undisseminated',
-    'undissipated',
     'undissociated',
-    'undistilled',
-    'undiverted',
-    'undivested',
-    'undividedly',
-    'undivulged',
-    'undo/redo',
-    'undoable',
-    'undodgeable',
-    'undog-like',
-    'undomestic',
-    'undoubt',
-    'undoubtedlty',
-    'undoubting',
-    'undowered',
-    'undramatised',
     'undraped',
-    'undre',
-    'undreaded',
-    'undredweight',
-    'undregraduate',
-    'undrest',
-    'undrstnd',
-    'undrstndg',
-    'undrugged',
-    'undskyld',
-    'undubitably',
-    'undulatory',
-    'undulatum',
-    'undusted',
-    'unearthedby',
-    'unease.',
     'uneasily.',
-    'uneasy-an',
-    'unecclesiastical',
-    'unecessary',
-    'unecstatic',
-    'uned',
-    'unedo',
-    'uneducable',
-    'unefficacious',
-    'unegalitarian',
-    'unegyptian',
-    'unelaborate',
-    'unelect',
-    'unelectrified',
-    'unelevated',
-    'unelicited',
     'uneloquent',
-    'unelucidated',
-    'unemended',
-    'unemotion',
-    'unemotive',
-    'unempathic',
-    'unemphatically',
-    'unemployed.29',
-    'unemployed/or',
-    'unemployed_as',
-    'unemploym',
-    'unemployment&mdash;100,000',
-    'unemployment-',
-    'unemployment-benefit',
-    'unemployment-inflation',
-    'unemployment-related',
     'unemployment/social',
-    'unemptied',
-    'unenacted',
-    'unenchanted',
-    'unenchanting',
-    'unencountered',
-    'unencouraged',
-    'unended',
-    'unendorsed',
-    'unenforceable.',
-    'unengaged',
-    'unengaging',
-    'unengraved',
-    'unenlivened',
-    'unenterprisingly-ridden',
-    'unentertaining',
     'unenthralling',
-    'unenthusiasm',
-    'unenticing',
-    'unentitlement',
-    'unentombed',
-    'unentrepreneurial',
-    'unenvy',
-    'unepigrammatic',
-    'uneployment',
-    'unequality',
-    'unequally-bestowed',
-    'unequilibrated',
-    'unequivical',
-    'unerased',
-    'unerigg',
-    'unerodable',
     'unescapably',
-    'unesco-commissioned',
-    'unesco-decreed',
-    'unesco/pugwash',
-    'unesco/undp',
-    'unessentials',
-    'unestimated',
-    'unetched',
-    'unethereal',
-    'unetherised',
-    'uneuphemistic',
-    'unevasive',
-    'uneven-ness',
-    'unevent',
-    'uneventfulness',
-    'unevil',
     'unex&rehy;pected',
-    'unexceeded',
-    'unexcitable',
-    'unexcitement',
-    'unexcitingly',
-    'unexhausted',
-    'unexhibitable',
-    'unexorcised',
-    'unexotic',
-    'unexpandable',
-    'unexpecte',
-    'unexpected.',
-    'unexpectednesses',
-    'unexpeditated',
-    'unexplainedly',
-    'unexplicated',
     'unexploitable',
-    'unexported',
-    'unexpressable',
-    'unexpungeable',
-    'unextraordinary',
-    'unf',
-    'unf&ecirc;ted',
-    'unf.',
-    'unfaald',
-    'unfaceted',
-    'unfaired',
-    'unfaithfully',
-    'unfalsifiability',
-    'unfalsified',
-    'unfamiliarly',
-    'unfanciful',
     'unfankle',
-    'unfarmed',
-    'unfast',
-    'unfastens',
-    'unfathomability',
-    'unfazable',
-    'unfearing',
-    'unfeasibility',
-    'unfeather',
-    'unfeathering',
-    'unfeelingness',
-    'unfeignable',
-    'unfeignedly',
-    'unfeline-like',
-    'unfeminist',
-    'unferground',
     'unferocious',
-    'unferreted',
-    'unfestive',
-    'unfettable',
-    'unfication',
-    'unfiled',
-    'unfilial',
-    'unfillial',
-    'unfinalised',
-    'unfinalized',
-    'unfinished-looking',
-    'unfirm',
-    'unfit\'',
-    'unfits',
-    'unfix',
-    'unfixedness',
     'unflabbable',
-    'unflagged',
-    'unflapped',
-    'unflared',
-    'unflashy',
-    'unflat',
-    'unflattered',
-    'unfledged',
-    'unfleeced',
-    'unfleshy',
-    'unflexing',
-    'unflowing',
-    'unfluent',
-    'unfluttering',
-    'unflyable',
-    'unfo',
     'unfoldment',
-    'unfond',
-    'unfood',
-    'unfoolable',
-    'unfoortunate',
-    'unfor',
-    'unfor&rehy;tunately',
-    'unforatunate',
-    'unforbidding',
-    'unforeseeably',
-    'unforgetaball',
-    'unforgetable',
-    'unforgiveable.but',
-    'unforgiveably',
-    'unformalized',
-    'unformatted',
     'unformulable',
-    'unfort\'nate',
-    'unfortu',
-    'unfortuantely',
-    'unfortulately',
-    'unfortun',
-    'unfortunaltely',
-    'unfortunate-looking',
-    'unfortuynately',
-    'unforunately',
-    'unfossilisable',
-    'unfounds',
-    'unframe',
-    'unfrazzled',
-    'unfreemen',
-    'unfrequent',
     'unfresh',
-    'unfriend&rehy;ly',
-    'unfriended',
-    'unfriendlies',
-    'unfriends',
-    'unfrightened',
-    'unfrock',
-    'unfrogettable',
-    'unfrustrating',
-    'unfucking',
-    'unfuckingbelievable',
-    'unfulfillable',
-    'unfunctioning',
-    'unfunnily',
-    'unfunniness',
-    'unfuriatingly',
     'unfused',
-    'unga',
-    'ungainful',
-    'ungainliest',
-    'ungainly-looking',
-    'ungalvanised',
-    'ungardened',
-    'ungarlanded',
-    'ungarrisoned',
-    'ungartered',
-    'ungassed',
-    'ungated',
-    'ungava',
-    'ungeneralized',
-    'ungenerate',
-    'ungenerosity',
     'ungentleness',
-    'ungenuine',
-    'ungeometric',
-    'ungerleider',
-    'ungh',
-    'ungharetti',
-    'ungiddy',
-    'ungilded',
-    'ungiven',
-    'ungivenness',
-    'ungku',
-    'unglaciated',
-    'unglamorously',
-    'unglamourise',
-    'unglaring',
-    'unglazed-opening',
     'unglesby',
-    'ungluable',
-    'unglueing',
-    'ungluing',
-    'ungol',
-    'ungorgeous',
-    'ungrained',
-    'ungrammatic',
-    'ungrammaticalities',
-    'ungrammatically',
-    'ungrammaticalness',
-    'ungrammticality',
-    'ungrasping',
-    'ungrated',
-    'ungratefulness',
-    'ungratifying',
     'ungreased',
-    'ungrim',
-    'ungritted',
-    'ungritty',
-    'ungroomed',
-    'unground',
-    'ungroundedly',
-    'ungrouped',
-    'ungrown-up',
-    'ungrumbling',
-    'ungry',
-    'unguals',
-    'unguaranteed',
-    'unguardedness',
-    'unguds',
-    'unguessable',
     'unguessably',
-    'unguiculat',
-    'ungullability',
-    'ungullible',
-    'ungum',
-    'ungummed',
-    'unhackable',
-    'unhad',
-    'unhad.',
-    'unhafted',
-    'unhandicapped',
-    'unhands',
-    'unhappen',
-    'unhappening',
-    'unhappily-married',
-    'unhappy-looking',
     'unharmful',
-    'unharmoniously',
-    'unharmonised',
-    'unharried',
-    'unharvested',
-    'unhastily',
-    'unhatted',
-    'unhaughty',
-    'unhaunted',
-    'unhaveable',
-    'unhcr-sponsored',
-    'unhealth',
-    'unhearable',
-    'unheard-of-level',
-    'unheaval',
-    'unheaving',
     'unheavy',
-    'unheill',
-    'unhelmeted',
-    'unhelpable',
-    'unheroically',
-    'unhesitant',
-    'unhide',
-    'unhilarious',
-    'unhinges',
-    'unhinging',
-    'unhingingly',
-    'unhired',
-    'unhistorically',
-    'unhobble',
-    'unholesome',
-    'unholstering',
     'unhoneyed',
-    'unhood',
-    'unhooks',
-    'unhopefully',
-    'unhorned',
-    'unhorse',
-    'unhorsey',
-    'unhouseled',
-    'unhouselled',
-    'unhumble',
-    'unhung',
-    'unhungry',
-    'unhurrying',
-    'unhusbanded',
-    'unhushed',
-    'unhybridised',
     'unhysterical',
-    'unhysterically',
-    'uni&aacute;o',
-    'uni&ograve;n',
-    'uni-cycling',
-    'uni-dimensionally',
-    'uni-functional',
-    'uni-k-swiss',
-    'uni-lever',
-    'uni-liverpool',
-    'uni-mates',
-    'uni-media',
-    'uni-processors',
-    'uni-sex',
-    'uni-size',
-    'uni-turf',
     'uni-versity',
-    'uni/xt',
-    'unian',
-    'uniate-orthodox',
-    'unican',
-    'unicare',
-    'unicas',
-    'unicipia',
-    'uniciss',
-    'unicity',
-    'unico',
-    'unicode',
-    'unicolor',
-    'unicord',
-    'unicornes',
-    'unicornis',
     'unicos',
-    'unicums',
-    'unicursal',
-    'unicycle.put',
-    'unicyst',
-    'unid=s&gt',
-    'unidare',
-    'unideal',
-    'unidealistic',
-    'unidentifiably',
-    'unideological',
-    'unifactorial',
-    'unifet',
-    'unifi&eacute',
-    'unifi&eacute;e',
-    'unificada',
     'unificado',
-    'unification*',
-    'unification-grammar',
-    'unification-seeking',
-    'unificatory',
-    'unifix',
-    'unifolium',
-    'uniform-cost',
-    'uniform-state',
-    'uniforme',
-    'uniformes',
-    'uniformily',
-    'uniformise',
-    'uniforum.',
-    'unigenitus',
-    'unigram-for-nt',
     'unigraphics',
-    'unigroom',
-    'unigroup',
-    'unihierarchical',
-    'unik',
-    'unil',
-    'unilamellar',
-    'unilater-whatsit',
-    'unilaterallywhile',
-    'unilevel',
-    'unilevers',
-    'unilift',
-    'unilinearity',
-    'unilluminated',
-    'unim&rehy;pressed',
-    'unimaginatively-presented',
     'unimaginativeness',
-    'unimak',
-    'unimap',
-    'unimar',
-    'unimate',
-    'unimgag',
-    'unimmunised',
-    'unimmunized',
-    'unimolecular',
-    'unimport&rehy;ant',
-    'unimportant-that',
-    'unimpregnable',
-    'unimpressible',
-    'unimpressionable',
-    'unimpressive-looking',
-    'unimpressiveness',
     'unimproving',
-    'unimpugnably',
-    'unindeighted',
-    'unindividual',
-    'unindustrialized',
-    'uninfatuated',
-    'uninfiltrated',
-    'uninflated',
-    'uninformatively',
-    'uninhibitedness',
-    'uninitiate',
-    'uninjected',
-    'uninjured/unsuspended',
-    'uninked',
-    'uninnervated',
-    'uninnovative',
     'uninquiring',
-    'uninscribed',
-    'uninspiring\'',
-    'uninstitutionalized',
-    'uninstructive',
-    'uninsurably',
-    'uninsured.',
-    'unintegral',
-    'unintelligence',
-    'unintercepted',
-    'uninteresting-looking',
-    'uninterestingness',
-    'unintermitted',
-    'uninterrrupted',
-    'unintimate',
-    'unintimidating',
     'unintoxicating',
-    'unintruding',
-    'unintrusive',
-    'uninvaded',
-    'uninvitingly',
-    'unio',
-    'union&mdash;a',
-    'union&mdash;dvu&mdash;for',
-    'union&mdash;patriotic',
-    'union&rehy;controlled',
-    'union-agreed',
-    'union-building',
-    'union-controlled',
-    'union-corporate',
-    'union-focused',
-    'union-government',
     'union-jack',
-    'union-jack-encrusted',
-    'union-jack-i\'m-backing-britain',
-    'union-led',
-    'union-negotiated',
-    'union-organized',
-    'union-oriented',
-    'union-party',
-    'union-public',
-    'union-recognition',
-    'union-related',
-    'union-republic',
-    'union-shipping',
-    'union-to-union',
-    'union/cis',
-    'union/constituency',
     'union/management',
-    'union/non-union',
-    'union/professional',
-    'union/russia',
-    'union/worker',
-    'unionist-controlled',
-    'unionist-dominated',
-    'unionists.',
-    'unionizing',
-    'unionlaw',
-    'unionless',
-    'unions&mdash;the',
-    'unions.s',
-    'unions/manage&rehy;ment',
-    'unions/staff',
-    'unionwide',
     'uniparental',
-    'unipersonal',
-    'unipixel',
-    'uniplam',
-    'uniplex\'',
-    'unipolarity',
-    'unipork',
-    'uniq',
-    'uniqbatch',
-    'uniqfax',
-    'uniqprint',
-    'uniqtelex',
-    'unique&lsqb;sic&rsqb',
-    'uniquely&mdash;a',
-    'uniquely-constructed',
-    'uniquely-talented',
     'uniquely-valuable',
-    'uniquely-voiced',
-    'uniqueness-type',
-    'uniqwa',
-    'uniras/unimap',
-    'unirish',
-    'unirix',
-    'unis.',
-    'uniscience',
-    'unisexed',
-    'unisexual',
-    'unishred',
-    'unism.',
-    'unison-combinations',
-    'unispace',
-    'unisql/m',
     'unists',
-    'unisur',
-    'unit&lsqb;s&rsqb',
-    'unit&mdash',
-    'unit\'',
-    'unit-cell',
-    'unit-credit',
-    'unit-level',
-    'unit-load',
-    'unit-loads',
-    'unit-membrane',
-    'unit-meme',
-    'unit-school',
-    'unit-shifting',
-    'unit-such',
-    'unit.ed',
     'unit/district',
-    'unit/model',
-    'unit/specialty',
-    'unit=83',
-    'unitaf',
-    'unitario',
-    'unitary-tax',
-    'unitas',
-    'unite&lsqb;d&rsqb',
-    'united-city',
-    'united-front',
-    'united-type',
-    'united-villa',
-    'united.',
-    'united.now',
-    'united0',
     'united1',
-    'united4',
-    'unitemized',
-    'uniter',
-    'uniterms',
-    'unitg',
-    'uniti',
-    'unitiated',
-    'unitization',
-    'unitize',
-    'unitized',
-    'unitor',
-    'unitory',
-    'units-that',
-    'units.it',
-    'units/&micro;l',
     'units/establishments',
-    'units/forage',
-    'units/freezers',
-    'units/l',
-    'units/litre',
-    'units/modules',
-    'unity-coupled',
-    'unity-landslide',
-    'unity-scaled',
-    'unity/movement',
-    'univ0',
-    'univ41',
-    'univalents',
-    'univallate',
-    'univap',
-    'univariately',
     'univer',
-    'univer&rehy;sality',
-    'univeristies',
-    'univeritaria',
-    'universa',
-    'universae',
-    'universalists',
-    'universalities',
-    'universalization',
-    'universalk&uuml;nstler',
-    'universally-accepted',
-    'universally-applicable',
-    'universally-shared',
-    'universally-valid',
-    'universe&mdash;no',
-    'universe-a',
     'universe-and',
-    'universe/in',
-    'universidade',
-    'universit',
-    'universit&aacute;ria',
-    'universit&agrave',
-    'universit&auml;tsphilologie',
-    'universit\'e',
-    'universitatii',
-    'universite\'',
-    'universiteits',
-    'universites',
-    'universities/polytechnics',
-    'universitiet',
-    'university*',
-    'university-accredited',
     'university-biased',
-    'university-bound',
-    'university-industrial',
-    'university-leavers',
-    'university-led',
-    'university-originated',
-    'university-owned',
-    'university-provided',
-    'university-rafelski',
-    'university-run',
-    'university-style',
-    'university-supported',
-    'university.the',
-    'university/college',
-    'university/drugs',
-    'university/government',
     'university/humberside',
-    'university/star',
-    'universityto',
-    'universty',
-    'universum',
-    'univibe',
-    'uniview',
-    'univisitaire',
-    'univite',
-    'univocality',
-    'univocally',
-    'univoque',
-    'univoques',
-    'univs.',
-    'univy',
-    'unix-add',
     'unix-capable',
-    'unix-dependent',
-    'unix-killer',
-    'unix-lover',
-    'unix-on-a-pc',
-    'unix-on-risc',
-    'unix-oriented',
-    'unix-specific',
-    'unix-systems',
-    'unix-to-pc',
-    'unix-to-sna',
-    'unix-to-windows',
-    'unix/aix',
-    'unix/client-server',
-    'unix/dos',
-    'unix/motif',
     'unix/motif-based',
-    'unix/nfs',
-    'unix/ositel/400',
-    'unix/sna',
-    'unix/vms',
-    'unix/workstation',
-    'unix/x-windows',
-    'unixexpo',
-    'unjacking',
-    'unjammable',
-    'unjealous',
-    'unjoined',
-    'unjostled',
-    'unjoyous',
-    'unjust\'',
-    'unjustice',
     'unjusticiable',
-    'unkeen',
-    'unkennels',
-    'unkerridgean',
-    'unkeyed',
-    'unkillable.',
-    'unkin',
-    'unkinde',
-    'unkindled',
-    'unkingly',
-    'unkinks',
-    'unkles',
-    'unknickered',
-    'unknighted',
-    'unknocked',
-    'unknowerr',
     'unknowingness',
-    'unknownst',
-    'unkynde',
-    'unl',
-    'unlabeled',
-    'unlaboured',
-    'unlading',
-    'unlady-like',
-    'unlagered',
-    'unlagged',
-    'unlaminated',
-    'unlark-like',
-    'unlaundered',
-    'unlawfull',
-    'unlawfully\'',
-    'unlayered',
     'unlc',
-    'unlead',
-    'unleaned',
-    'unlearns',
-    'unlearnt',
-    'unled',
-    'unlengthened',
-    'unleninist',
-    'unleopard-like',
-    'unless-redeemed',
-    'unless.politically',
-    'unless/however/but',
-    'unless/new',
-    'unlettable',
-    'unliberating',
-    'unlicenced',
     'unlicing',
-    'unlidded',
-    'unlignified',
-    'unlikeability',
-    'unlikeley',
-    'unlikelier',
-    'unlikes',
-    'unlikey',
-    'unlimitable',
-    'unlimited-mileage',
-    'unlimited-use',
-    'unlipping',
-    'unlistened',
-    'unlithified',
-    'unlived',
-    'unlived&rehy;in',
     'unlively',
-    'unliving',
-    'unloadable',
-    'unloader',
-    'unloaders',
-    'unloadings',
-    'unlocalised',
-    'unlocalized',
-    'unlocatable',
-    'unlog',
-    'unlook',
-    'unloop',
-    'unloosen',
-    'unloosening',
-    'unlooses',
-    'unloosing',
     'unlovably',
-    'unlove',
-    'unloveable',
-    'unlovingly',
-    'unluckier',
-    'unlucrative',
-    'unluted',
-    'unluturk',
-    'unluxurious',
-    'unlyrical',
-    'unlywilling',
-    'unma\'an',
-    'unmagnified',
-    'unmailed',
-    'unmaimed',
-    'unmakeable',
     'unmakes',
-    'unmalicious',
-    'unmanagable',
-    'unmangled',
-    'unmanicured',
-    'unmanipulated',
-    'unmanoeuvrability',
-    'unmanufacturable',
-    'unmanured\'',
-    'unmarked/marked',
-    'unmarried.',
-    'unmartyr',
-    'unmarxist',
-    'unmasculine',
-    'unmaskt',
-    'unmathematical',
     'unmathematically',
-    'unmatriculated',
-    'unmeaningly',
-    'unmeant',
-    'unmeasurably',
-    'unmediatedly',
-    'unmedicated',
-    'unmeetable',
-    'unmellowed',
-    'unmelodic',
-    'unmelodramatic',
-    'unmelting',
-    'unmemorably',
-    'unmendable',
-    'unmentionably',
-    'unmerged',
     'unmeritocratic',
-    'unmeshing',
-    'unmetaphorical',
-    'unmethodical',
-    'unmetrical',
-    'unmilitant',
-    'unmilled',
-    'unmired',
-    'unmistakenly',
-    'unmitigable',
-    'unmitigatedly',
-    'unmitigating',
-    'unmitred',
-    'unmittigated',
-    'unmlos',
-    'unmoderated',
     'unmodernized',
-    'unmodifiable',
-    'unmollified',
-    'unmorose',
-    'unmortaged',
-    'unmortgageable',
-    'unmortgaged',
-    'unmotherly',
-    'unmotive',
-    'unmoulding',
-    'unmov',
-    'unmuddled',
-    'unmufflable',
-    'unmuffled',
-    'unmugged',
-    'unmussed',
     'unmuted',
-    'unmuzzling',
-    'unmysteriously',
-    'unn&ouml;tig',
-    'unn-derr-tay-kerr',
-    'unnaffected',
-    'unnaming',
-    'unnational',
-    'unnationalized',
-    'unnatural-looking',
-    'unnatural-sounding',
-    'unnaturalistic',
-    'unnd',
-    'unnecesarily',
-    'unnecessarily.the',
-    'unnecessariness',
     'unnegotiated',
-    'unner',
-    'unnerstand',
-    'unnerving-',
-    'unnessarily',
-    'unnesting',
-    'unnetted',
-    'unnetworked',
-    'unnh',
-    'unnominated',
-    'unnotice&rehy;ably',
-    'unnoticeability',
-    'unnotified',
-    'unnourishing',
-    'unnumber',
-    'unnutritious',
     'unobjectionably',
-    'unobligingly',
-    'unobliterated',
-    'unobserved.',
-    'unobtru',
-    'unobvious',
-    'unoffended',
-    'unoffical',
-    'unoffically',
-    'unoiled',
-    'unoiled-hinge',
-    'unopenability',
-    'unopening',
-    'unoptimistic',
-    'unorthodox-theory',
-    'unostentation',
     'unoticed',
-    'unotta',
-    'unowned',
-    'unpackaging',
-    'unpacker',
-    'unpackin\'',
-    'unpackings',
-    'unpadding',
-    'unpaged',
-    'unpaid-for',
-    'unpained',
-    'unpaletteable',
-    'unparallel',
-    'unparallelled',
-    'unpardoned',
-    'unparrotlike',
     'unparsed',
-    'unparticularized',
-    'unpassionate',
-    'unpassioned',
-    'unpatched',
-    'unpatentable',
-    'unpatinated',
-    'unpatrolled',
-    'unpatronizing',
-    'unpause',
-    'unpeated',
-    'unpeeling',
-    'unpejoratively',
-    'unpenetrable',
-    'unpenetrated',
-    'unpenitential',
     'unpensioned',
-    'unpent',
-    'unperceiving',
-    'unperdictably',
-    'unperforated',
-    'unperformed',
-    'unperfused',
-    'unpermed',
-    'unpermissive',
-    'unperplexed',
-    'unperson',
-    'unpersons',
-    'unpersuasively',
-    'unperturb',
-    'unperturbably',
-    'unpestered',
     'unphased',
-    'unphoney',
-    'unphosphorylated',
-    'unphotogenic',
-    'unphotographed',
-    'unphysiologic',
-    'unphysiological',
-    'unpicks',
-    'unpickupable',
-    'unpicturable',
-    'unpicturesque',
-    'unpiety',
-    'unpigeonholeable',
-    'unpiling',
-    'unpillowed',
-    'unpiloted',
     'unpinning',
-    'unpinpointed',
-    'unpitied',
-    'unpitted',
-    'unplait',
-    'unplaiting',
-    'unplannable',
-    'unplanned.',
-    'unplatformed',
-    'unplatitudinous',
-    'unplatonic',
-    'unplayablly',
-    'unpleaded',
-    'unpleasable',
-    'unpleasant-coloured',
-    'unpleasant-tasting',
     'unpleasanter',
-    'unpleasantness&rehy;to',
-    'unpleasantry',
-    'unpleasentness',
-    'unpleasing-no',
-    'unpleasingly',
-    'unpleasnat',
-    'unpleasure',
-    'unplied',
-    'unploughable',
-    'unplucked',
-    'unpluggable',
-    'unplugs',
-    'unplushy',
-    'unpoetical',
-    'unpointed',
     'unpolarized',
-    'unpolishable',
-    'unpoliticised',
-    'unpollinated',
-    'unpopped',
-    'unpopular.',
-    'unposh',
-    'unpositional',
-    'unpossessed.',
-    'unpossessive',
-    'unposted',
-    'unpotentized',
-    'unpowdered',
-    'unpracticable',
-    'unpractis',
-    'unpre&rehy;tentious',
     'unprecented',
-    'unpredicability',
-    'unpredicable',
-    'unpredictabilities',
-    'unpredictable.i',
-    'unpredictableness',
-    'unpredictive',
-    'unprescient',
-    'unprescriptive',
-    'unpresented',
-    'unpretty',
-    'unpreventably',
-    'unprevented',
-    'unprincipled\'',
-    'unprincipledness',
-    'unprinked-up',
     'unprintably',
-    'unpro&rehy;tected',
-    'unproblematise',
-    'unprodigal',
-    'unproduced',
-    'unproductive.',
-    'unproductively.',
-    'unprofessorial',
-    'unproficient',
-    'unprofitableness',
-    'unprogrammmed',
-    'unprone',
-    'unpronouncable',
-    'unpronounced',
-    'unpropelled',
-    'unprospective',
     'unprotect',
-    'unproteolyzed',
-    'unprotonated',
-    'unprovability',
-    'unprovenance',
-    'unprovenanced',
-    'unpsychological',
-    'unpuffin-like',
-    'unpumpable',
-    'unpunched',
-    'unpunished\'\'',
-    'unpunned',
-    'unpurified',
-    'unpuritan',
-    'unpurposeful',
-    'unpushable',
     'unqualifiedly',
-    'unquelled',
-    'unquenching',
-    'unques&rehy;tioned',
-    'unquestionability',
-    'unquizzical',
-    'unquotable',
-    'unquotes',
-    'unraceable',
-    'unracialised',
-    'unradiated',
-    'unraked',
-    'unramm',
-    'unrandomized',
-    'unranyl',
-    'unrattled',
     'unraveling',
-    'unravellings',
-    'unravelment',
-    'unread-',
-    'unreal.',
-    'unrealiability',
-    'unrealistic.',
-    'unrealities',
-    'unreality-away',
-    'unreality.',
-    'unrebated',
-    'unrebuked',
-    'unrecapturable',
-    'unreclaimable',
-    'unreclusive',
-    'unrecognizable&mdash;for',
     'unrecombinable',
-    'unrecommended',
-    'unreconstruct',
-    'unrecoupable',
-    'unrecyclable',
-    'unrecycleable',
-    'unrecycled',
-    'unredeemably',
-    'unredeemingly',
-    'unreefed',
-    'unreefing',
-    'unreel',
-    'unreels',
-    'unreferred',
-    'unreffled',
-    'unrefining',
     'unreflected',
-    'unreflectedly',
-    'unreflectively',
-    'unreflexive',
-    'unrefreshed',
-    'unrefrigerated',
-    'unrefundable',
-    'unrefuted',
-    'unregenerated',
-    'unregenerative',
-    'unregistered&mdash;together',
-    'unregretted',
-    'unregretting',
-    'unrejoicing',
-    'unrelated.',
-    'unrelatedness',
     'unrelentingness',
-    'unreliables',
-    'unreliant',
-    'unrelievable',
-    'unreligious',
-    'unremarkableness',
-    'unremittable',
-    'unremmed',
-    'unremorseful',
-    'unrenewed',
-    'unrenovated',
-    'unrenowned',
-    'unreorganized',
-    'unrepair',
-    'unrepented',
-    'unrepentingly',
     'unrepining',
-    'unreplenishable',
-    'unreplenished',
-    'unrepresentable',
-    'unrepresentational',
-    'unrepresentivity',
-    'unrepressed',
-    'unreprimand',
-    'unreprocessed',
-    'unrequested',
-    'unrequitedly',
-    'unrescinded',
-    'unrescuable',
-    'unresearchable',
-    'unresentful',
-    'unresistant',
     'unresonably',
-    'unresourcing',
-    'unrespected',
-    'unrespectful',
-    'unresponding',
-    'unresponsively',
-    'unrest-which',
-    'unrestimulated',
-    'unresting',
-    'unrestricting',
-    'unrestrictive',
-    'unreticent',
-    'unretire',
-    'unretiring',
-    'unretractable',
-    'unretrievable',
     'unrevetted',
-    'unrevisably',
-    'unrevived',
-    'unrevoked',
-    'unrevolutionary',
-    'unrhetorical',
-    'unrhymable',
-    'unrhythmic',
-    'unriddling',
-    'unriddlings',
-    'unrighted',
-    'unrigid',
-    'unrihta',
-    'unrinsed',
-    'unripely',
-    'unrisen',
     'unrivetting',
-    'unroadworthiness',
-    'unrobust',
-    'unrock',
-    'unrole',
-    'unroofing',
-    'unrotten',
-    'unrouteable',
-    'unrule',
-    'unrulier',
-    'unrusted',
-    'uns.',
-    'unsackable',
-    'unsacked',
-    'unsacrosanct',
-    'unsad',
     'unsafeguarded',
-    'unsaintly',
-    'unsalability',
-    'unsalable',
-    'unsalan',
-    'unsalubrious',
-    'unsaluting',
-    'unsampled',
-    'unsane',
-    'unsanitised',
-    'unsatiated',
-    'unsatis&rehy;factory',
-    'unsatisfaction',
-    'unsatisfactory\'',
-    'unsavoury-looking',
-    'unsay',
     'unscalable',
-    'unscaled',
-    'unscandalised',
-    'unscanned',
-    'unsceptical',
-    'unschematic',
-    'unscientific.',
-    'unscientifically',
-    'unscom',
-    'unscorable',
-    'unscottish',
-    'unscoured',
-    'unscramblers',
-    'unscraping',
-    'unscreening',
-    'unscrewable',
     'unscribed',
-    'unscrolled',
-    'unscrolling',
-    'unscuffed',
-    'unseam',
-    'unseamanlike',
-    'unseamed',
-    'unsearchable',
-    'unseared',
-    'unseatable',
-    'unseats',
-    'unsecret',
-    'unsectarianism',
-    'unsectioned',
-    'unsecured/secured',
-    'unseductive',
     'unseemliness',
-    'unselect',
-    'unselectivity',
-    'unself-disciplined',
-    'unselved',
-    'unsend',
-    'unsensationalised',
-    'unsensibility',
-    'unsensitivity',
-    'unsent-for',
-    'unsentenced',
-    'unsentimentalized',
-    'unseren',
-    'unserrated',
-    'unsers',
-    'unserviceabilities',
     'unserviced',
-    'unsettled-looking',
-    'unsettlingly',
-    'unseverable',
-    'unsexable',
-    'unsexiest',
-    'unsexual',
-    'unshackle',
-    'unshackling',
-    'unshakably',
-    'unshareably',
-    'unshattering',
-    'unshaveable',
-    'unsheathes',
-    'unshered',
-    'unship',
     'unshirkable',
-    'unshone',
-    'unshouldered',
-    'unshown',
-    'unshrunk',
-    'unshyness',
-    'unsighlty',
-    'unsignable',
-    'unsilent',
-    'unsimulated',
-    'unsingable',
-    'unsisterly',
-    'unsited',
-    'unskewered',
-    'unskilfully',
-    'unskilfulness',
     'unskillable',
-    'unskilled-worker',
-    'unskilled/',
-    'unskilled/semi-skilled',
-    'unskillfully',
-    'unskimmed',
-    'unskinned',
-    'unskinny',
-    'unslakeable',
-    'unsleepingly',
-    'unslept-in',
-    'unsliceable',
-    'unsling',
-    'unslurred',
-    'unsmelted',
-    'unsmoking',
     'unsnap',
-    'unsnarl',
-    'unsnobbish',
-    'unsnoblike',
-    'unsober',
-    'unsocialized',
-    'unsociological',
-    'unsocked',
-    'unsoftenable',
-    'unsolder',
-    'unsoldered',
-    'unsoldierly',
-    'unsolicitated',
-    'unsolid',
-    'unsolvated',
-    'unsolveds',
     'unsophistic&rehy;ation',
-    'unsorry',
-    'unsounded',
-    'unspace',
-    'unspeakabilities',
-    'unspeakables',
-    'unspecialist',
-    'unspectacularly',
-    'unspellable',
-    'unspend',
-    'unspiked',
-    'unspilled',
-    'unspliced',
-    'unsplit',
-    'unspoken-for',
-    'unspontaneous',
     'unspooled',
-    'unspun',
-    'unspurred',
-    'unsquired',
-    'unstabilised',
-    'unstable-looking',
-    'unstableness.',
-    'unstably-sprung',
-    'unstacked',
-    'unstacking/putting',
-    'unstaged',
-    'unstain',
-    'unstalked',
-    'unstalling',
-    'unstandardized',
-    'unstarry',
     'unstartling',
-    'unsteadied',
-    'unsteading',
-    'unsteady-looking',
-    'unstealthy',
-    'unsteassed',
-    'unstemmable',
-    'unstepping',
-    'unster-mittelfranken',
-    'unstereotypable',
-    'unstereotyped',
-    'unsticky',
-    'unstiff',
-    'unstigmatizing',
-    'unstill',
-    'unstilled',
     'unstillness',
-    'unstilted',
-    'unstimulatedly',
-    'unstipulated',
-    'unstirring',
-    'unstitch',
-    'unstitched',
-    'unstockinged',
-    'unstolen',
-    'unstoned',
-    'unstop',
-    'unstopper',
-    'unstoried',
-    'unstraight',
-    'unstraps',
-    'unstreamed',
     'unstreaming',
-    'unstreet',
-    'unstreetwise',
-    'unstriated',
-    'unstripped',
-    'unstriven-for',
-    'unstruggling',
-    'unstung',
-    'unsually',
-    'unsub',
-    'unsub/suspend',
-    'unsubbed',
-    'unsubmersible',
-    'unsubordinated',
-    'unsubscribing',
-    'unsubstitutable',
     'unsubtlety',
-    'unsuccesfully',
-    'unsuccess',
-    'unsuccessfuly',
-    'unsucessful',
-    'unsuckled',
-    'unsufferable',
-    'unsuffering',
-    'unsuitable-as',
-    'unsuitable.',
-    'unsunny',
-    'unsuperintended',
-    'unsupermen',
-    'unsupermodels',
-    'unsupervisable',
-    'unsurely',
     'unsurpassingly',
-    'unsurper',
-    'unsurpliced',
-    'unsurprisable',
-    'unsurprise',
-    'unsurprisingness',
-    'unsurvivable',
-    'unsuspended',
-    'unsussed',
-    'unsustainability',
-    'unsustainably-produced',
-    'unswear',
-    'unsweaty',
-    'unswimmable',
-    'unswollen',
-    'unswung',
     'unsycophantic',
-    'unsymmetrically',
-    'unsympathy',
-    'unsystematized',
-    'untac-controlled',
-    'untac-supervised',
-    'untack',
-    'untackle',
-    'untalkative',
-    'untame',
-    'untamedness',
-    'untampered',
-    'untap&rehy;ped',
-    'untapered',
-    'untargetted',
-    'untariffed',
     'untarred',
-    'untattered',
-    'untax',
-    'unteacherlike',
-    'untebaugebiet',
-    'untelephoned',
-    'unten',
-    'untendentious',
-    'untendentiously',
-    'untense',
-    'untensed',
-    'unterergraben',
-    'untergang',
-    'untermaier',
-    'unteroffizieren',
-    'unterraced',
     'unterredung',
-    'unterrifi',
-    'untersberg',
-    'unterschachen',
-    'unterthanspatent',
-    'unterweger',
-    'unterwllden',
-    'untethering',
-    'untextured',
-    'unthankful',
-    'unthawed',
-    'untheological',
-    'untheorized',
-    'untherapeutic',
-    'unthinkable.',
-    'unthinkably',
     'unthinkingness',
-    'unthought-up',
-    'unthread',
-    'unthreading',
-    'unthreateningly',
-    'unthrilled',
-    'unthrilling',
-    'unthrown',
-    'unthunderouslylikely',
-    'unthwartable',
-    'unticketed',
-    'untidinesses',
-    'untidy-haired',
-    'untidy-looking',
-    'untighten',
-    'until&rehy;then-secret',
     'until-\'jennings',
-    'until-then-pleasant',
-    'until/since',
-    'until/unless',
-    'until14',
-    'until19',
-    'untilat',
-    'untiled',
-    'untilled',
-    'untimbered',
-    'untimeable',
-    'untinged',
-    'untinted',
-    'untoasted',
-    'untogether',
-    'untogetherness',
     'untoilet-trained',
-    'untold-of',
-    'untorn',
-    'untouched-by-anything',
-    'untouched-she',
-    'untowardly',
-    'untowered',
-    'untrackably',
-    'untraded',
-    'untrafax',
-    'untragic',
-    'untraining',
-    'untranscendable',
-    'untranscribable',
-    'untransduced',
-    'untransferable',
     'untranslatableness',
-    'untransmittable',
-    'untransmitted',
-    'untransportable',
-    'untrappable',
-    'untrasound',
-    'untravell',
-    'untreated.',
-    'untrembling',
-    'untrifling',
-    'untrivialized',
-    'untropical',
-    'untrouserlike',
-    'untrusted',
-    'untrustworthies',
-    'untube',
     'untuneful',
-    'unturndownable',
-    'unturned-out',
-    'untweedy',
-    'untwining',
-    'untwinned',
-    'untwirling',
-    'untwitched',
-    'untyped',
-    'unukalhai',
-    'ununionized',
-    'ununique',
-    'unus',
-    'unusally',
-    'unuse',
-    'unuseful',
     'unuser',
-    'unusjurisperitus',
-    'unusual-sounding',
-    'unusuall',
-    'unusually-full',
-    'unusually-gifted',
-    'unusually-shaped',
-    'unusually-shy',
-    'unvail',
-    'unvalidatable',
-    'unvaluable',
-    'unvandalized',
-    'unvanquishable',
-    'unvanquished',
-    'unvariable',
-    'unvariables',
     'unvascularized',
-    'unveiled.',
-    'unveilings',
-    'unveined',
-    'unvenal',
-    'unverbalizable',
-    'unverge',
-    'unverifiability',
-    'unverricht',
-    'unversity',
-    'unvibrant',
-    'unvieled',
-    'unviolable',
-    'unviolent',
-    'unvisual',
-    'unvitiated',
     'unvocal',
-    'unvocalized',
-    'unvoluptuous',
-    'unvortunately',
-    'unwaged/student/oap',
-    'unwalkable',
-    'unwalked',
-    'unwarmed',
-    'unwarranty',
-    'unwarrented',
-    'unwasted',
-    'unwealthy',
-    'unweariedly',
-    'unwearyingly',
-    'unweave',
-    'unwedged',
     'unwedges',
-    'unweight',
-    'unweildy',
-    'unwelcomely',
-    'unwell.',
-    'unwellness',
-    'unweshed',
-    'unwhiffed',
-    'unwhimpering',
-    'unwhipped',
-    'unwhistled',
-    'unwholsome',
-    'unwifely',
-    'unwigged',
-    'unwilled',
-    'unwilling-to-be-interviewed',
     'unwillingly.',
-    'unwilted',
-    'unwin-esque',
-    'unwin-inspired',
-    'unwin/tree',
-    'unwinesque',
-    'unwiped',
-    'unwired',
-    'unwish',
-    'unwith-its',
-    'unwithered',
-    'unwithit',
-    'unwitnessed',
-    'unwitty',
-    'unwoken',
-    'unwolf',
     'unwomanlike',
-    'unwoo',
-    'unwooded',
-    'unwordable',
-    'unworded',
-    'unworkable\'',
-    'unworked-out',
-    'unworking',
-    'unworriedly',
-    'unwoven',
-    'unwrappedness',
-    'unwrappers',
-    'unwrecked',
-    'unwrinkle',
-    'unwritable',
-    'unwrite',
     'unwriting',
-    'unxpeckeded',
-    'unyarded',
-    'unyieldingness',
-    'unyoking',
-    'unyouthful',
-    'unzippable',
-    'unzipper',
-    'unzippered',
-    'unzoom',
-    'uo',
-    'uo2',
-    'uo2(no3)2',
-    'uoce',
-    'uomini',
-    'uoplf',
     'uoret',
-    'uosat',
-    'uosukainen',
-    'up&mdash',
-    'up&mdash;they',
-    'up&rehy;and',
-    'up&rehy;and-coming',
-    'up&rehy;dated',
-    'up&rehy;dating',
-    'up&rehy;ending',
-    'up&rehy;front',
-    'up\'n\'at\'em',
-    'up\'t',
-    'up-and&rehy;coming',
-    'up-and&rehy;running',
-    'up-and-comings',
     'up-and-thrusting',
-    'up-and-unders',
-    'up-and:coming',
-    'up-branch',
-    'up-breeze',
-    'up-bullets',
-    'up-current',
-    'up-dip',
-    'up-ends',
-    'up-escalator',
-    'up-escalators',
-    'up-flight',
-    'up-goods',
-    'up-gradeable',
-    'up-grades',
-    'up-gradient',
     'up-gradings',
-    'up-holding',
-    'up-hook',
-    'up-lake',
-    'up-level',
-    'up-lifted',
-    'up-lighter',
-    'up-line',
-    'up-man',
-    'up-pseudo-cost',
-    'up-rate',
-    'up-rating',
-    'up-regulated',
-    'up-regulation',
-    'up-right',
-    'up-rootedness',
     'up-side-down',
-    'up-skilling',
-    'up-slope',
-    'up-spec',
-    'up-specification',
-    'up-stage',
-    'up-staged',
-    'up-stand',
-    'up-starting',
-    'up-strokes',
-    'up-swing',
-    'up-the-price',
-    'up-tide',
-    'up-to',
-    'up-to-200-mile',
-    'up-to-date-records',
     'up-to-minute',
-    'up-to-the&rehy;minute',
-    'up-to-the-hilt',
-    'up-tothe-minute',
-    'up-town',
-    'up-turning',
-    'up-up-and-away',
-    'up-valley',
-    'up-ya-boya',
-    'up.',
-    'up.keith',
-    'up.that',
-    'up.the',
-    'up/',
-    'up/bm',
-    'up/consolidation/action',
     'up/down/behind/',
-    'up/hr',
-    'up/in',
-    'up/ml',
-    'up/pushes',
-    'up/right',
-    'up/the',
-    'up/wash',
-    'up_,_it\'s_up_to',
-    'up_,_up_to',
-    'up_add_up_to',
-    'up_as_soon',
-    'up_er_to',
-    'up_erm_to',
-    'up_in',
-    'up_on',
     'up_out',
-    'up_right_up_until',
-    'up_up_up_up_to',
-    'upaci',
-    'upadhyay',
-    'upanisads',
-    'upano',
-    'upavon',
-    'upazilla',
-    'upbeats',
-    'upbraded',
-    'upbringings',
-    'upbuilds',
-    'upbury',
-    'upchange',
-    'upchatting',
     'upcountry',
-    'upcurrents',
-    'upda',
-    'update&mdash;baseline.log',
-    'update-only',
-    'update/alter',
-    'updateable',
-    'updater',
-    'updatings',
-    'updoming',
-    'updraft',
-    'updrafts',
-    'upds',
-    'updt',
-    'upeb',
-    'upends',
     'upf7',
-    'upfilling',
-    'upfling',
-    'upfold',
-    'upfolded',
-    'upfrontness',
-    'upglare',
-    'upheaved',
-    'upheld&mdash;as',
-    'upheld&mdash;if',
-    'upheld.',
-    'uphill-shopping-street',
-    'upho',
-    'upholder-class',
-    'upholsterer/soft',
-    'upholsterings',
     'upias',
-    'upitis',
-    'upkeep.',
-    'upland-areas',
-    'upland/lowland',
-    'uplander',
-    'uplands.',
-    'uplawmoor',
-    'uplazas',
-    'upleaden',
-    'uplift-under-wired-half-cup-sponge-rubber-lace-nylon',
-    'uplifted.',
-    'uplifters',
-    'uplighting',
-    'uploaded',
-    'upm',
     'upmanship',
-    'upmarket-area',
-    'upmrc',
-    'upoli',
-    'upolu',
-    'uponn',
-    'upottery',
-    'upozila',
-    'uppa',
-    'uppance',
-    'uppe',
-    'upper&rehy;middle-income',
-    'upper-air',
-    'upper-and',
-    'upper-arm',
-    'upper-bagshaw',
     'upper-bank',
-    'upper-bourgeois',
-    'upper-classy',
-    'upper-elementary',
-    'upper-fret',
-    'upper-hand',
-    'upper-hemisphere',
-    'upper-hive',
-    'upper-house',
-    'upper-lip',
-    'upper-lounge',
-    'upper-lower-middle',
-    'upper-mantle-derived',
-    'upper-manual',
-    'upper-market',
-    'upper-medium',
     'upper-medium-sized',
-    'upper-mid',
-    'upper-middle-class-accent',
-    'upper-range',
-    'upper-rear',
-    'upper-register',
-    'upper-respiratory-tract',
-    'upper-second-class',
-    'upper-stage',
-    'upper-teeth',
-    'upper-thigh',
-    'upper-working-class',
-    'upper/lower',
-    'upper/middle',
-    'upperbreck',
-    'upperby',
     'upperline',
-    'upperlipped',
-    'upperlips',
-    'upperplate',
-    'uppersides',
-    'upperton',
-    'uppertown',
-    'uppie',
-    'uppity-know-all',
-    'uppland',
-    'upravlenie',
-    'upravleniye',
-    'upreared',
-    'upregulate',
-    'upremeditated',
-    'uprichard',
     'uprightly',
-    'uprise',
-    'uprisen',
-    'uprisin\'',
-    'uprite',
-    'upriver/downriver',
-    'uproariousy',
-    'uprolled',
-    'uproots',
-    'uprose',
-    'ups-are',
-    'upsa',
-    'upsadaisy',
-    'upsd',
-    'upseat',
-    'upsel',
     'upset&rehy;ting',
-    'upset/annoyed/embarrassed',
-    'upsetted',
-    'upsetter',
-    'upsetters',
-    'upsettin\'',
-    'upsettingly',
-    'upshaw',
-    'upshot-bagley',
-    'upshots',
-    'upsidaisy',
-    'upside&rehy;down',
-    'upside-downed',
-    'upsilon&amp;sup4',
-    'upsilons',
-    'upski',
     'upskiing',
-    'upskilled',
-    'upskirted',
-    'upslopes',
-    'upsloping',
-    'upson-trained',
-    'upson/trainer',
-    'upspecked',
-    'upstages',
-    'upstai',
-    'upstairs&mdash',
-    'upstairs-downstairs',
-    'upstairs.it',
-    'upstairs/downstairs',
-    'upstands',
-    'upstation',
     'upston',
-    'upstone',
-    'upstream-forever',
-    'upstrokes',
-    'upsurgence',
-    'upsurging',
-    'upsweeping',
-    'upswell',
-    'upswellings',
-    'upswinging',
-    'upt',
-    'uptake-evoked',
-    'uptake-induced',
-    'upthe',
-    'upthrusts',
-    'uptide',
     'uptilting',
-    'uptix',
-    'upto-date',
-    'uptodate',
-    'upton-by-chester',
-    'upton-on-severn',
-    'upton-upon-severn',
-    'uptowner',
-    'upupa',
-    'uput',
-    'upvalued',
-    'upvaluing',
-    'upw',
-    'upward-curving',
-    'upward-opening',
-    'upward-plunging',
     'upward-rushing',
-    'upward-spiralling',
-    'upward-striving',
-    'upward-tilted',
-    'upward-travelling',
-    'upward-turning',
-    'upwardbound',
-    'upwarde',
-    'upwardly-registered',
-    'upwards-and-downwards',
-    'upwards-compatible-',
-    'upwards-facing',
-    'upwards-sloping',
-    'upwater',
-    'upwave',
-    'upwell',
     'upwelled',
-    'upwelling-diffusion',
-    'upwellings',
-    'upwrenched',
-    'uq',
-    'uqbar',
-    'uqueque',
-    'ur-epic',
-    'ur-freezer',
-    'ur-mother',
-    'ur410',
-    'ura3',
-    'urabandai',
-    'urabe',
-    'uracil-c',
-    'uracil-n-',
     'uracilated',
-    'uraemicsyndrome',
-    'uraeus',
-    'uraguayan',
-    'uraguayans',
-    'uraitsev',
-    'uraken',
-    'uralaz',
-    'uralensis',
-    'uralinda',
-    'uralitised',
-    'uranerz',
-    'uraniferous',
-    'uranium-238',
-    'uranium-based',
-    'uranium-fuel',
     'uranium-graphite-gas',
-    'uranium-mineralised',
-    'uranium-molybdenum',
-    'uranium-powered',
-    'uranium-processing',
-    'uranium-seller',
-    'uranium.',
-    'uranius',
-    'uranov',
-    'uraricaa',
-    'urartu',
-    'urate-lowering',
-    'urathion',
-    'urawa',
-    'uray',
-    'uray/miller',
     'urba-gracco',
-    'urban-',
-    'urban-aid',
-    'urban-biased',
-    'urban-born',
-    'urban-centered',
+)
+
+blocks_51 = (
+    '\'"lf%$that&\'o-scale&#ype%%value%$zero$!.%#ken$#/as$$born%%ridge$$fitt%#orm$+handanstalt$$lock',
+    '$1sdale/entertainer%#pin$$view#!f$!e$+f&eacute;es%#ade&%ldino%+le-guzzling#&genina%!r$$gist#%istic#&jillio\'\'o-cenoz',
+    '#$line%"te$!l%"er%!o$,y-integrated#"ma%"ns$$here$&p-card%$card%"ee&"r-\'\'/thames&.t&rehy;playing',
+    '\'&-blast*%owers(%major(\'players()sectioned($tong)\'rombone\'+/flugelhorn\'/ers-in-ordinary\'$fish\'+s-performed\'%tings%&hauser%"s.#"nc',
+    '%)heon-like*&tipped*(wielding%$ulus$\'dlegate\'!r(!s\'!y$$geon$+k&rehy;road%%-call&$like\'#oad&&owning&$road',
+    '&%thick%$fish%$less&#oad)!s$%nions#&phemus$"pe&!d$$rint#$rnit$*o-falmouth%%nians#!s$$buts',
+    '$$kett$$love$"ov$\'s-maker$*t&mdash;is,\'receive&/rehy;worthiness0!y%*(research)%)--founded&$fund*"ed&%going&#mes&%owned',
+    '%#.it&&merlin&#the)!y%!/&!2&)broughton&$king%&buster)#ing%!e&"cs&&e-like\')s&mdash;a(!.',
+    ')*parliament($hip.&"th%%lands%"or##tex$-h-and-justice&\'bearing&%claim\'-onditionality)$tent&(directed\'#rug&\'element\'&vasion',
+    '&+in-a-window)\'lending&(oriented&+realization&\'seeking(\'mantics&\'tellers(%sting%$/and&$lies%$_out$#nov$#ype""wo#!y',
+    '%"ce%\'nd-fail$#cut$$glut$$hard$%iffic%"ng$$less$&outers$&planes$%tally#"ad$#lls%!s$#nor',
+    '#%dings#"ed#$ford##ina%-g&mdash&mdash&/-to-be-friendly&#.to#%matus#"na$%gites$#ite#"ol$"ns$$sine%"yl',
+    '#)p-killing$+anosomiasis$&etidae$#han%\'iodorus%$onas$!s%\'in-edta()resistant\'&/0.02%*"5%\'%ation\'$ogen$&tamine%#ics',
+    '&*phan.based*!e&"se#$stan%/ing&rehy;places(&-place$#ull"\'zebnica$)ciakowski!*s&ndash;11"#\'ao##ong"(-through"%/peak"!1',
+    '#!1#!3"#367#"79#"83#"99"$4000$!2$!3$!4$!5"!6""9b"&adziki#*lendzhikha',
+    '$%idhes$"po##nga&"no%%khang#%o-hua#"r\'$)-reformer%$trek$%anasy$"ev$$inas%#sts#%tsiki$$ziki',
+    '"\'ce-2000##haa$&echova%%grava%$lebi$%ingel%&rdilli&$hart$&oukine%#val#&p-2000""dc""e-$%chung$&listed',
+    '#/denbal-filatova#!e$"ep$\'p-tseep+$\'-ed+"ed$!t##gaw$!u##hai##kov$$tran#\'lovanik##ntr&%oevak',
+    '&&nadmid#)shchovsky#(tse-free\'(infested$#ung#"uc#(venjavyn"!h#\'118,547("52$&41,248%%2,000$&60,000#\'206,000$%2,000',
+    '$&92,936#%3,000$&11,478#&46,000#&85,653#%erlik#&ibangu$$psan$"rt$&sikedi#*omb&eacute$$ungi##udi")i-tsi-tsi$"uc',
+    '#$aras#"bu#!k$$ulin#$liso#$mpli$&shians#!n$!g%#tao##ree$#ion$#lin$(r-va-vaa#-t-tswit-tswit',
+    '%!i#$wick"#ked"&mlevel#!s"\'o/davis$$ispf#\'hiogyyn#%rtsos#!s#%tetsi#$uros""p."#sch#!i',
+    '##t-1"$t-50#&30root#"ed#!i$"ng"$uang#"ba$#mit$!o%!i#%chiya#"da#\'gumichi%#nao',
+    '#$kaba%$hara#$mani#(nami-run((strength\')/high-end$%eyuki$%g-dao&%t\'ang%!a#!p##ruo#$shin$#ing#$zuki',
+    '#$anas"&yganov##u-i!.t&dollar;1,418*%2,000+$96.7*+300,000,000+)7,000,000*%5,498+)0,000,000+$47.5*)7,611,000",(ct)tg(acgt)"#.35#!4',
+    '#"20"2actcaacatcaaagaacg"9caagcagagacgcattaagctaggc$0cacagggtgatgtggg#1cttcatctaaatcatct""fn#(onts.tif"#gca"#hat#!e"!j""le"#oro"!s"&tatata',
+    '$)ggcgggaat#!v""uu"\'w&amp;r#!a$!s"+x-sensitive!*u&eacute;e"#\'ii"!-#$154m$"6s#"22%!m%!s',
+    '#"ee##i44##tic$!u%#-tu#$whit%"oo"#154""ak#$lang%#tin$#ist#%motos##nku#!r',
+    '#$tara$!h"(b-garden$%sized\'#ing$\'thumper$%water#)a-players$#lar$%yshat##bed$#ier&!s$*y-buttoned&%faced',
+    '$&-based%(dwelling%&fixing&%ramed%$goer%&legged&%iving%$nose)!s%&riding%&shaped&#ide&\'queezed%%train&$ying',
+    '$$coat$%goers$(ligation$&plates$)r-bearing%,cles-usually&%ulate(*in-testing*!s("on)\'stearic%\'geniana%#osa\'"es)+&mdash;last',
+    '$"uf$#way%$ells%#ise$!y##ful#$iana$+fex-related%#lex$$grup$"st&!s#$like#\'manburg#(ovillous',
+    '%)ar-girder%$ites%*o-vesicles,$ular&&acinar".c&mdash;labour#\'-unions##ann#(ci-rosso#!e##hel$&lauben$#ola&$skie(!y',
+    '%$wska#&k-away%%boxes%&rolled%"up$0/gloucestershire$$ahoe$#box$%enhay%)r/liberal\')pensioner&!i%!t$&ing-in($mill',
+    '$\'leberry$$onie$#ton$-well/national##ler##ric#$uman$"ri#"xi"$dful#\'or-arch&,cum-georgian&&effect&$hart%%burys',
+    '%%hurst%#ish%%ville##uns$!r"+e&ndash;sun#$-sun#"ro#,s&ndash;6.00+#sun+%thurs$$/wed$2day&ndash;saturday\'!.(#the',
+    '\'(saturday%"ee"#fas##con#$eila#%f-pop$!a%!h%%relli%$tori$$ieha$.ley/gloucester$$nell#!l#+nell/author',
+    '#%skins##tie$#not$(y-bonced"\'g\'o\'war#&-loops$&master$"of$$talk#(ged-down%\'rangong(#ong#&master)!s$"en',
+    '#$ulea"!h#$afut""ik#%lerie$#ler#!n#"rc#!t$!a$&ioning"(jikistan"\'k-a-tuk$#tuk#)hachevsky',
+    '#%makov##uyu"+l&eacute;ar#)a-korovin$"ch$$dhar$"gi$!i%%chean$!n$$ssay$$yeva#&baghia##can##der',
+    '$$runt$"tt$$utai$!y%"ev#&farris##gey#!i$!n$!o$%p-red%!e#$kens%"th#&lahoma',
+    '$"ia&$llan%$emet%#ver$&oquhey$(y/mother&$shop%$ally%\'carnett%\'goonian%%hogue%$lish%\'whisker#$reca#%worth',
+    '$&te-tum%"um#$anov#!b$&le-cut\'&dryers\'$home\'$weed&%blite&%dried&%rfuls%)ing-dance(!.$%ridge##ida',
+    '$$m/hm#&linson#\'melside$"ie$#ons$&y-ache*!s&*flattening&\'trouble%%aches#-or-inhibitory%#ous%"s.$%ur.dr&)/thrombus',
+    '&)igenesis.&(macrosis&&s.many$"yr#"pa#!u$$ltes&"us#$wine#!y""n\'#!*#(-o-matic$$sean#"a-',
+    '%\'canners%\'dolphin%*laundering&(ookalike$!/%\'dolphin$$puna#$berg$!s$#ury##cay$#eli$!h#&derish$)ra-forest',
+    '&!e#*e-drenched%*structured%%types$+d-arguments(!m&$down&+for-economy%!.$&kpinar$#nag%+lightenedhe$%s/808#%g-hui%#min',
+    '$#sha%#tal()-maximite&(en-alloy)\'halogen)&tipped(#ate$*uska-sized$%xiang#/ic-and-leggings&$like%#les$\'ng-dial\'"in\'&screws',
+    '%,ian-american&"en%&trasse#"ja$!i##ley##mer$#ore#-nachemootoolt&%liffe%$dine%"ge$&cliffe$(el-bound\'+cross-roads',
+    '\'%loops\'%slide(%trewn\'#the&!.&%/high&#ing&%lings&%mouth&\'s.their%)y-dempsey$&icliff%"es$%yfish#!r',
+    '%#ram$$tace%#ell%,rom/director#$turi#&ukovic#"ya#&zelman"#ohy#%misto#$neia#!s"#pai%$idae#%holme',
+    '$+namb&aacute$%smati##led#$olef#&paware$.ence-ha\'-penny&"th&*y-ha\'penny%&rspeak$#les##ras#%sarse#$uola"\'r-kaspa#%ajlic',
+    '%"gi%#ian$!x$!y#$baco%&n-wise$!e%$hlyk%&llaria+"ns%%rosum%!t$(idimeter*\'rically\'#tic',
+    '%!n&$ates&,e-generators(\'powered&!i$+o&rehy;prop%)-assisted&\'bentley\'$oost+"ed&\'caribou\'%harge\')onversion&\'diesels&$fuel',
+    '\'$rill&#jet&&mowers&&porter(#wer\'\'ressure&\'ram-jet&,supercharged&(tortoise&#vac%)/kerosene%#car(!s&+hannel/eisa%*fan-engine',
+    '&$lash%&halers%%laser%%matic&%otive%$pump%%speed&#wap%$tine$%uence%$late(#ors&(ent-like#!c$"am',
+    '$%kheim$,o-circassian#\'d-brain%%laden$!y#!e$$bska$(en-sized$"ga$!k$#nge#\'f-built%$clad&&utters)#ing',
+    '%%level%%mazes%%sided&$tack%$than(%tched%$wars$"an$!e$#ord$$rick$$work#"ga%$nova$%eniev',
+    '$\'idities#$icum$"ff$#han$$nese%&g-like$%stico##kee%-stan-siberian%+y&rehy;cock&%-cock\'%house(#uts\'(killings\'$like',
+    '\'#oak\'#pen((roducing\'*syria-iraq&!.$)ic-mongol%+sh-american(\'british(#era($flag(%greek(%iraqi((language((oriented((produced',
+    '(&united\'*/anatolian(\'spanish\'(pipeline&,tan-siberian$\'manchai%$enis$\'o-iraqi%#men%)vi&cacute$#sib#3l-browning-goulding$!e$$ings$!u',
+    ')\'stained$#hof$"ix$$oil\'\'!.%#ral#+n&mdash;out%*rehy;about*&tables$!\'$!-%$and-&&rounds%\'by-turn%&christ',
+    '%$down%\'holding%"if%\'lengths%.my-back-on-you%\'of-the-,2nineteenth-century\'"fs&"ns%%screw%-up-and-try-it(#on-%%wrest$$/the$$back',
+    '%$null%"oy%+ull-jeffrey(%/asst)$john)$kyle&"ry$&cliffe$(ed&ndash&+-inside-out\'(out-toes(#ver\'(publican\'(slightly&$.for',
+    '&#out%*r-directed\'\'warwick&)/chairman\'*enterprise\'&fringe\'\'general\'*manageress)#yor\'(national(&ursery\'+oxfordshire\'\'penhill\'$race\'+sub-officer',
+    '(%urner\'%white&#ian%!s%"ys$&icidae%-ng&rehy;point\'!-($away($back(&circle("in\'!/\'"ly\'%point',
+    '\'&rooted\'&shaped($ower\'$tops&$head$$ning$*ock/enigma%#urs&1t&mdash;one-third%!v$$peny%(ike-road(!.%+rofessional$%quest',
+    '$*s.steering%%/coil%$crew%"ek$-table-mounted&"il&$king$!u%(-severin%!p%!s$%worth$#yng#!o$$vsky',
+    '##pem%-ntine-tasting$)iloquence%%ngton%!s$%ovski$"sy#&qouise$$uand%"ie%-oise-and-gold*(coloured+&reased*\'striped)&/white',
+    '$"es%\'t-lathe&!t&!y$!i%\'culatus%%lites%"ta$"on##san$$dale$#man$*unzadevsky#!t$!h',
+    '(&erries\'(coloured($razy\'&dovin\'\'&riding\'&shaped\'(trapping&%doves$"ur$!y#%vassa$&eydrop$"il&!l\'!e',
+    '#"ya"!s#!a$$/ubs$"rt#!c$+&aacute;nia$%aloos%\'n-doric&%villa&\'y-villa%$rora$"he$!i%#ni.',
+    '$%umbia)!n#"ek$"ll##har$"ed##ita&"la#\'k-teeth$!a%#gee$#er.##log#!m#$okva',
+    '#*sle-haired$+ock-forming)#ree$(y-mussie#,tain/caravan"+t&rehy;tuts#!.##aev$#men$&nkamen*%-type&%haten##ela$&nkamen("un',
+    '$*ill/driver(\'francis()navigator(&winner#!i#$khan$!o#!o$!h$&r-chef&%group+!s&)moderated&)secretary%./administrator',
+    '\')ounsellor0!s&+invigilator%-ials/seminars%"s.&&/input\'(students(*upervisors##rix#&t-tutt$\'abankem$)le-fields%%ingen$!o$#son',
+    '#&weiler#$zing\'"er""us#"th"&valian%#uan$!n#$eson#$iera"\'weithah"&xedoed#"on#%worth$%sorth',
+    '##aux#$eres"#zcu#!i#!o!+v&rehy;type""**"!-#&action$%erial#$bred#%cable%&ssette$#rit#,dinner-trays',
+    '%$iven##eye#$film$\'riendly#%guide#*in-the-sky#$land$%inked$%ounge#1movie-of-the-week#(oriented#*phenomenon$\'romoted#\'quality#%radio',
+    '##sat$#ize#%video(#-cd#\'writing"#.am"%/card$*lock/radio#+radio/alarm#*tea/coffee##vcr""21""ad#!s"\'dohlavi',
+    '#)i-related#!l#&rskaya&!y##srp#%teras"!h"!i#"nd"\'link-up"!m""or$\'chestvo""ps"(rdosijni',
+    '#"at"!u!"w."%04/08""10#"17#$83a0""25"!6#"87"\'achtman#%ddell#$feaj##ite&!s',
+    '#&ngland&#ing%#man%/twangtwangtwing$"ky#&shokay#$tted""dc"%eacle$#ker\'!s##bty#+ddle/cancer##e-o%\'wee-wee',
+    '&\'skirted\'%olway\'%uited&+upholstered%"ed&"rs%%iness&"sh%0ledum-tweedledee\'%y-dee*"um%%shaws%$vale%)y-looking$$king',
+    '%\'y-maids$%t-tut%$ered%#ing%$ment%!s%!y$$zing##gen#$irat#5lfth&ndash;fourteenth\'*-centuries(\'dynasty($fret($hand',
+    '\'"s.$"ls$!v%2e&rehy;ed&rehy;ged,(year-old&+-and-a-half\'+by-six-foot\'#car(%olour*(umn-inch\'$deep\')foot-wide+"er)#rty)&urteen',
+    '\'&in-one("sh(#tem\'%metre(/illimetre-thick)$nute(%odule\'%ounce\'-pages-to-view)"rt($iece(&ounder.!s\'&reeler\'&seater',
+    '($heet($ided(&lotted($tone\'+thirty-five)+ousand-mile($imes(!o(%wenty\'(week-old(&heeler.!s\',year-old-boy+#old+&s-olds',
+    '&$bore&$fold&#ish##ney$"th%"ie\'\'s-style(&/early\'0th&mdash;century)\'century%+y&mdash;one-%third\'6ndash;three&ndash;mile\'*rehy;fifth.#rst',
+    ',#one,&second,,two-year-old&$-bed\'*centimetre(\'ylinder\'#day*$-old\'&eight--(building-$foot-$inch-&volume-$week\'$feet',
+    ',#day-%ollar,$inch,$mile,#odd,%piece,#six,#ton,%year-+!.+$_per((oot-long),ur&rehy;hour+$-bit,$foot',
+    '2&in-bed,$year0%s-old+#ths($ranc)\'equency\'$hour(&undred\')inch-wide\')kilometre(#not\'$live\'&member((ile-long,&square',
+    '."th((onth-old\'&nineth\'!o(\'ne-foot+&minute+$page+-year&rehy;old/%-long/%s-old*!.*!s\'(past-two($ence)$seta',
+    '\'$quid\'#rod)#und\'\'seconds)\'ven-car-$mile-\'oh-four0#six-%three-$year((ix-litre+&member,#ile+$part**th-century',
+    '(%quare-!s(%troke\'&thirty)&ousand/&-pound)1ree&rehy;year-old,%-acre-$inch-$year(!o)\'-eleven(-wo&rehy;carat*%-fold,\'unction',
+    '+$room+)year-olds*$_out\'%verst\'$watt\'-year&rehy;old&(.dollars\'$five&\'/thirty-&/forty(\'wenties&%eight&%first(#ves\'#our',
+    '&#man&(nothings&#odd\'"ne&%pence\'$ound&(year-old#&rpster""ic$.e&ndash;yearly&+rehy;capped%!\'%\'-annual&)cancelled\'\'hampion',
+    '($oked\'&racked&(defeated\'\'igested(&vorced&&exiled&&hourly&*imprisoned&(lifesize&)nominated&\'olympic\'#ver&&proven&(repeated)%layed',
+    '\'%oaked&\'widowed%!a$#ing$#ker#%ddler(!s&#in\'("gs$#ell#"es#&g-arms%&finger%$high%$like',
+    '%"ly$#let%#ike##kka#\'lighted$\'l-weave%"ed%$weld%!y#-n&rehy;walled$*-and-earth%(balanced(%lgown&"in&%laded',
+    '%(camshaft\'"rb)\'urettor\'%stled\'&talyst&%entre)#ury&$hoke&%olour\'#red%%faced&\'eatured&%loats%&gabled%&hulled',
+    '%#jet%$lamp\'#ned&%eaved\'#vel\'#wis&#ine\'#tre%&masted&&essiah%&nozzle%&pillar\'"pe&$late&&ointed',
+    '\'#wer&(rocessor(!p%.radial-engined&#ear\'$flex&#oom%&sailed&#ets&&isters\'"te&#oft&&peaker)%rhead("ed',
+    '\'%otted&&tinson(%tched\'%udies&+upercharged%&tailed&#ier&%ongue&(racking\'-%-that(&nsport&"ub\'%rbine%$wall$%axial',
+    '$#cam$$dles$#ers%$ttes$%flush$%geing$%holme$$kick&!e\'!s%\'le-toed\'\'berries&$iest%!s$$lock',
+    '$$pack%$hone$&sectra&"ts%#hip%&tation&#ick$%track%(winkling%!y$$wave%#ood#$rler#%sdton$#ick',
+    '$5leton-wykeham-fiennes$+s/doe/greta$#t\'n%%-beam&%grips&&legged&"on&$pile&$tree&$wire%&ed-off($ring($wire\'"ly\'$ness',
+    '&"n\'\'/g-about-a-point("ly&!t%5leton-wykeham-fiennes%$pile#(t-giggle$(ch-grass&$iest\'!n$%enham$$tery&"st#"vy##xty',
+    '$$zled\'!r"#lch"!m"!n"%o&ins$0lowbar;component$)mdash;and*&former*#the$%ndash)$;car*%three*#way$,rehy;engined',
+    '*&ifteen)$hour)$iron)\'partner)&seater+&mester*&panner)$term*%hirds-"ty*%iming)$week*&heeled#(-a-level&%penny',
+    '%$nd-a))-half-box/#day/)inch-heel/%month/(thousand0"on*\'quarter1%-hour(%eight(#six()three-car.\'quarter5%-mile6%ounce',
+    '%(partment%"rm\'"ed$&ballot&"nd&$rred&!y%)illion-to&#rds%0olts-and-a-chain&"wl%%ranch%%udget&$rner%&y-twos',
+    '\'(s-in-one&&ssette%.d/two-cassette%%elled&%ntury%)h\'i-thick&\'ambered&"ef&&ildren%#lub((s-in-one*(stronger%$oach&/nsonant-phoneme%#rew',
+    '$!d%)ay-career%*ecade-long\'!k%,imensionally&"sk&(visional%-ouble-bedroom&3wn-with-six-to-play%$ucat$%eared\'$ning%"gg%&lement\'&venths',
+    '&#try%\'xplicit(\'oration\'%onent$&family%#eet(&-thick%)ifteenths&#ght&"rm%(oot-deep)$long("er*!s&&r-four',
+    '(#the*#ree\'\'ty-five*%seven%#ret%\'unction&+r&rehy;long\'#row$&gallon&"me&"ng%#ene(&ration%$lass%$rand',
+    '%*our-a-week\'"se%%umped&&ndred-,&dollar,)foot-high,&guinea,$mile,%pound,+square-mile,(thousand$)identical%\'mplicit%\'n-a-bed)#row',
+    '&\'ch-long)&square\'#ome&)dependent&#put&&to-one%#ron%"sh$(junction$)kilometre$)lactation&%minae\'!p%"b.%%eaved',
+    '&"gs&#ver%*ine-source(!d("rs&$pped%+oud-speaker$\'machine%#esh&(tre-high*$long*$wide)!s%"id&(llimetre',
+    '%$otor&&vement$%named&$tion%#ess%&ucleus$\'one-two%#ven\'!r($-one$$pace\'!k&"ir&\'ragraph\'%ticle',
+    '&#tch\'$tern%#eak&#dal&%nalty\'"ie\'\'nyworth\'&sioner%&hases.+"on&$oton&$rase%\'incered%(lus-twos).very-small-two',
+    '&"rt(#ion&"st&$unds%"p9%$rice&#ong%$unch&"tt$$reef&*frigerator&%lease%"ig&$nger%#oad',
+    '$)satellite%$cale&%reens%(egmented&$ries&%ssion&$tter&&venths%&helled&"ip&"oe\'%tters%(idedness&"te\'%tings',
+    '%#ong%#pan\'!r&"it&&reader\'#ing%&tation&#oke&&randed\'%inged("pe\'%utted&+udy-bedroom\'"mp%%ummer',
+    '$+temperature%\'hirties&%onged\'%usand,\'-dollar-&strong&2ree-four-foot-long*#one%#ine%\'o-eight\'$five(#our\')threefold("wo&$ners',
+    '&%igger%#ype$,up-two-downs$\'voltage$\'warhead&-shing-machine&#tch&-y-travel-time%&eekend("ly(!s&"ll%%heels%$orld$$yard',
+    '),old-daughter)*separation)%trial(#old(%s-old-!s$$zone#\'.metres$)phases.on#\'/ninety$,three-person*$star#"14#$3812#(:buy-out',
+    '$\'hitting$\'pulling#"_b$(in_front#*and-a-half#,flower&mdash$#olk#&handed$!y#&in-one#,mey/national#!o#)penn\'orth\')y-pockets$$oint',
+    '&$wski$$ogal$8t&ndash;d\'h&eacute;relle#$s-up$!.$#tar%$orey%%rokes#&timing$$owns$"wo#!u$"ld#)year-olds"!p',
+    '#*-developed#"ch#&eaking"!s"$twtw"*wenty-four"%ydale#!i#"la#"ne$3ing/gloucestershire##the#+yn-bryncrug!\'x-based"".2',
+    '"#a1z#!i$!z#"pu"\'ikierdi"!p"#rpc"!t!-y&formula;cal."ly""\'n"%-phoo".ack/contractor&\'ostrich&*wellington',
+    '#$ylor""be$$rton#\'ulevich""ce#\'hodrome#!o$*on-failing\'%proof&$.the&#ski"#dac##dyn#!e#&lesley',
+    '"$echa#!n#"rs"#fil"&gaflor$#sil"&i-s-33#"er#*h&aacute;k#\'ng-down"\'keworld"$lees$)r-upfield-!s%(/british',
+    '&$meat$!x#!l##man#$neys#(ocidaris$%rians#"te""ma##bal#$eful$!n#&iniski#"ms#"on',
+    '&!i\'!c&%ogram\'*metrically\')sclerosis($tomy"!n##ant#+dale-biscoe&"le#(e-alston%%based%%wards&#ear)%-tees',
+    '\'*e&mdash;in(!\'(%-born%#oft$!x$!y#%lofft#"ne#!t"%o-hnl"!p#$cial#,e&mdash;each%,rehy;writers$#-23',
+    '%$case(!t)#ing&+ertificated&(haracter&(omposing\'\'nverted&%urves%!d&%esign%$from%"in%\'lifting&\'ocality%\'meaning',
+    '\'+-occupation%%rated&&eicher%&script&\'entence\'$ries\'$tter+!s&\'pecimen%&tested&#his&%okens%$wise$%/size$%7532a',
+    '%%token$)=quantile$%align$&casted$%d-out%!.$!e$\'founder+!s$&lifter$&matter$!n$"s/&)varieties\'\'oicings',
+    '2%tends%$tyle$$view$%write)+r&mdash;but*%-like*!.#"hi$%litis%\'odromus&%esids$)oon-class%"sa#!i$%eally',
+    '$(st-style&,s/clerkesses#)o-lecture%&visuel$\'graphia*"cs*"es$&logist$"st##sin"(r&scaron#,/ser-protein#"58##all$$nids',
+    '\'#ses(#ing\'$zing&&ophobe\'%saurs++us-featured-"es%!s%)t-slayers&\'/trying%!y#"ch#)e-exhaust%#ing%\'kicking',
+    '%%maker%)pressures\'\'otected&&ulling%*scrabbling(&eeched&%queal%\'tearing$*/recycling$\'fitting$#lla$%maker&#rks$\'tracked)!s',
+    '##ley#+o-ministers$%cidin$$diza$+l-innsbruck&.with-edelweiss%)ean-style)$type(!s&!r&"se%"ia\'&n-like$\'ne-born$,sine-kinases',
+    '$$uble#\'rannies&&opolis$*ell-hondas(%matra\'#ian*!s\'!s$)hastiadas#!t#\'yttiaki""se$%hurst$!r$%tting',
+    '#(on-frank#\'sandier#"ul"$tgat#\'hingmen#&onidae#"ti")u-tyu-tyu#!c$#hev##kin"\'wyllwch"%yrkyn"%zack.$!k',
+    '!%zabar#\'gournis#$neen$&i-bey.$%natos%!e#"ra%%-like$$inas$!s"!d"%edaka&"is$"ec#(entchian',
+    '"\'itzikia\'%ostas"$niut"&orriss$$tsos"$shoo"%uriss#!s#%tuhil"%varas#$etan#!i (u&amp;lc",dollar;2,800)$3.30',
+    '"\'mdash;f(!n"%ndash\'%;1206*"30,-/g&ndash;dhzz+!4)!8(!v"*zcaron;ice!!\'"%-bend#\'channel!$(iv)"#vi)',
+    '"!1!$-13s#!5#"6.#!7$!s#"8.$!s""20#"1s#"4s"$3000##300"#534"#909',
+    '"$bats#$ends#"ix#\'ottomed"%curve"&decays##une"#eee")formation"%gouge"$iron"!k"#men")n-w-e-l-l""pa',
+    '$%ttern##lan"#roy"!s#(ectioned"$tube$$rned&#ing"!v"$wire!$.128"!2"#505"#653"!8',
+    '#!3#!9#!s""a.""b.""c.""d.$"e.$"t."#g.t$$v.a."(k.i.a.s."(n.d.r.o.$(i.c.e.f."%p.v.c',
+    '"3s.&dollar&frac12;m.+,;2&frac12;m.-+,353,991.95-!m$&-based%%owned%*registered&&ussian$&a.a.f.&"f.$&f.w.s.$$gal."!v##.c."$w.f.',
+    '""14$!s#!6$!s"#day"!j"#kg/%#day""l."!u""v/"!w##eek!%0.067!"10',
+    '"#2\'s""4s""69#!s"$9.99!%2-ish#,mainstreamed"#06g#!s"#1\'s#(-display$%teams""20"!3#!5',
+    '"!4"!5##1mg"!s!#320")3-g34-u35!"40""ra!$5+ds"!4!&6-tata"\'000/300&#500&"dt#"15',
+    '!$87mg"!a!"96!$=0.1"&1,000a"!j"%x2-y2!#a-6#(financed"#251""di"!g""hs"$lity"#mah',
+    '"#nle"-pt\'s-infolink$!-""rt"1thaweekulminister##ion"!w#$ares",ychaijustice!"b-#&levels""11"!2"#40-%&labour',
+    '#!6"%ackup#%lbini#$ydat"#bar"!d"#e1y#"ly#\'rbrettl$&moppet$"ti%!o"$iety##nsk#+quitousness',
+    '\'!s"#ley"%olrat")s-philips#"pd"!t#!i"\'uthongo!+c&ndash;46a)"64"\'-sandia"$abel$#lis#!l#!t',
+    '#"sa""cc#$elli#%ialli$&detemi"#ero#!t"&h02493#!a#%eldre#&i-mata$$kawa$$mata$"za#"l1',
+    '##upi"#i/l#%p-roc""ko""li"#ml1"$opia""rb#"el""sf#!t"2ta&mdash;basically"%wetec!)d&ucirc;n"$/mha',
+    '#%irpur#"le#&navayu#*wattakelle";csig-request&commat;sun.com"#dan#&enholm$%rwash&#ise#!m#!s""ed##ghe&!s"*f&mdash;an',
+    '*\'finance*%union#\'-centre$#led%\'iberals$)supported#$.the#!p"$hbeg"#ing#%remmo#!t$!e##zma"!j',
+    '"$okan#!n"/p&mdash;popular#4-n-acetylglucosamine#!b#!n"%r/rir"*skzwdccvyt#!p"&t/seal#!s"!u"!y!$eber"&fa-cup',
+    '"$gaki""ki""li"$mera"!n#!i"!o""ra"#sat#"co",tliberg-kulm"%zdnye!"fb#!y"\'c/hefce',
+    '"&fculme#&iciale$"ll$%ngham&/ton/oxfordshire$"sh#&lngton#%oland%$ding%%stery#!r##ugo"!i##cyp##nal',
+    '"+o-detecting$$lore$(spotting#"rb"%ricks"!s#%quare!#g/g#$tube"!1"!6"!a#/ndan-registered##rit"&boajah',
+    '#%rooke")c-imposed$$type#%/cnaa"\'eskrift"$gest##hhh##ing##las$\'ebarnby"$hars#!h#!s"#ine$"on',
+    '#%ified%!y$"ly$&nesses$#tch#%janin#\'y-comic%,is-beautiful""oh##lin&#has"$rian$!n#$omov"!s',
+    '#%horpe#!p#!t""ua$"le#&rlutan##yen!\'h&mdash#(ndash;1h""-1$!b#"hu%"hs#&tu-tu-"%aitxa',
+    '"!c"*eln&yacute#!r"%f/625"#huh",landstaresse(%rasse#"ig##man&!n"%m-uhm##ing""ro""se"#ura',
+    '""c.#!e#*vm.uic.edu""dh"%elded""ft"%leann#$lean""mx"&nitial%!y#!l"#res##rel")s-archive',
+    '#&gnaval#!h#"ng#"t."\'tenhage#\'geverij##ing#\'landers##oto#+zendbureaux!<jkdmfeoipsklfhlddwndsloufcsl#:sehmskqxgkllqthompdhjjeklo""on",vid&eacute;k!-k&amp;ireland',
+    '#0rehy;distributed"!\'"*-argentina$)ustralian#&backed%$nned$$ound$(razilian%"ed#$flag#&german#$held#,incorporated$&ranian&"qi',
+    '#&kuwait#&libyan#$made#*orientated#(produced#*restricted#!s$(ponsored$\'upplied#%uk-uk#\'vietnam*#ese"#.18#!6#,ac.ed.castle',
+    '#"in"$/137#$cool#%dutch#&europe"$2012"!6#"3t"#:44"!="!a##iim#!l$"ea##nia',
+    '##sta#!z"#ccs";dghhxbnlqjmdelopsgrtlnaqiff"!e#"le%&lelele\'!s%!s"!f"\'h&amacr#$-ukh#"ca#"ia#$reeo',
+    '"#irt"%kasta")net-relay##own""ra$%inain&+e&mdash;the&-ian-populated*\'russian&&ophile$$jina$%nians$-tomenergoprom#&inform$!t',
+    '#"tu"*ubstanduka"$will$"mi!3l&aacute;szl&oacute#&eacute"&-haque#*var-ke-oos"%ama-i##nfu$"ov##sey#&towski##yed"!b',
+    '%$ates%"ed%(ogenesis##has#\'iscaris#!r"!d##all#!b#"er%#ico"%ema-i$\'noukogu#!v$!s',
+    '"*f-dietrich#%berth#%cetel#Jonphthaleinyl-n-acetyl-&bgr;-d-glucosamide##ric#%stein"\'ginosum"#ias#"dh#%kooli#%usfor"#ker##ing"&l-back#%adale',
+    '$!r$%spool$#val#)er&oslash$!t$#val#!i$!n%#ish#,man-margalit&%esque&*n-margalit$"er#"na#-o-\'ullo-\'ullo',
+    '#&scarf.$\'fjorden$$tein#$yart"%marua#"eh"!n#"lf#\'ocarpal"!o#\'boridae#"se#%thrix#"wi#&zhenie',
+    '$"us"%riche&!s$+k-johansson"*s/followed#"an#"eb$"rs##tat$(er-built\'#led\'%owned\'(scotland($tyle\'$type',
+    '$#ler$"on$\'rasound#%water"!t#(a-violet#(eriority##her#\'imacies&.te-copiability(*ly_because+"in\'#ley%!i%!o',
+    '%"us#1ra&mdash;hygienic&0rehy;imperialist++lightweight+%short%!-&)absorbent(\'undance\'%lpine\',nti-american(%xious\',uthoritarian\')vantgarde&$beta\')reathable',
+    '\'$utch&+centralised\'%ombat)\'mercial(\'nfident)\'trolled(\'urteous\'\'ritical\'&urrent($tesy&&daring)&winian\')ecorative("ep(\'fensive',
+    '(%voted*"ut\')iminutive(&stance\'&rawing&$easy\')conomical\'\'normous&(familiar()shionable\')iltration((ne-tuned)#ite\'*lexibility($oral',
+    '\'(ussiness&&gentle($rman\'#low\'&raphic&%happy(&rdcore(%wkish\'$efty\'-igh-frequency(!p)"py&)important\'+ncorporated()troverted',
+    '\'#ind&0leftist-womanist-!s((gitimate\'*ightweight\')ow-volume\'(uxurious&\'marxist("te\'+etaphysical\'.iniaturization\'"od)"el*"st(#ral',
+    ',%alism(%ughty\'#eat(&gative&+objectivist(%vious&)patriotic\')ermissive\'*ortability\'&rivate(*ofessional)(gressive\'#ure&%quick)"et',
+    '(#pid("re\'#eal*%istic(\'formist(,spectability/"le*&onsive\'#ich(+ght-wingers+#.in+$ists&)selective(!p\'$harp',
+    '\'$mart($ooth\'(ocialism(#nic(+phisticated2!s\'&partan\'%table)\'linists()reamlined)#ict)&ucture(%ylish\'$uper\'#vga',
+    '&(ticklish\'#ogs("ry\')rendiness&(vilified(#ola\'(ulcanian&#yah&\'zionist%+.femininity%*basic-acid+%basic&$rite%\'cad.pcx\'"mp',
+    '&,onservatives&&ushion%%dense\'%xtral%$fine&#ree%#hip%%iolet%(magnetic\'$rina&*icroscopic&\'ontanes+#ist%%quick%)religious',
+    '%$scan\'$reen&&ilence\'\'nistral&#oft\'-nagraphy+oral(,ographically\'*und-guided*!.*!s)!s&)pecialist&#tor%%therm\'"in',
+    '*\'t-blind,*irradiated+&/x-ray%&xerous$-ix/risc-based\'#sql$&ogotha%$scan"(u&aacute#!g$$urus#!i#!k#"la%#ted',
+    '$$odes##ots#"ru"(verstone$%stris##iye""ya$)nov/lenin##ett!\'m&mdash"#-hm"#65v#"6w""aa##lah',
+    '#!n$!a$!g#%rried$!u"$bara#"el%%latum)!s&$ifer$4r-and-cream-coloured&(coloured%$ella%%leigh%!s',
+    '%$tide#%grove##iko$"li&!c\'$aria(#ted\'!i\'"um##les#%ombed#*raculifera%!e%)ge-taking$#ell',
+    ')&holder)$like),organisation)&shaded*$tand)&topped*#ype(!d($rama\'!o\'!s##udi$#tfo""ea#\'mployed',
+    '#$zawa"&folozi#\'raville#-unktionierung"$geni"!h"!i##aks#!r"!l##and&!s$#uts$"zi##ess',
+    '##ing#!k#"mm%!m#$oved#!s",no-dominated%#led"$odis#$l/24""pf#!h##ing#$leby##red',
+    '#(teen-nil$"on$!y"#ruh""sl#+turzvorlage"&teteli"%uahia##nna"$vuma"+w-dominated#-elt-virginity&(schmertz"!y!&n&rehy',
+    '((balanced)(reakable(\'counted(,dernourished)&oubted)\'ramatic(*encumbered)*quivocally(*fathomable(&heroic(%known(&likely(*manageable*&tching(\'opposed',
+    '()refuelled(\'stained)*ustainable)*ympathetic*(stematic(\'welcome"!\'##ape")+happy+er"&-1990s#+accompanied%"id%*knowledged$(ddressed%*ministered',
+    '$*mericanism+!s$\'nalysed%!d%&glican$,uthoritarian*#zed#%based$\'ecoming%$lief)\'-a-boll$%iased$-loody-natural$#ody%&lovian',
+    '%$ught$(racketed$%uilds\'$t-up$&yronic#(carpeted%"sh%&tholic$)hamoniard$\'lammish%\'uttered$%ommon&)promising%\'nscious&)vincingly',
+    '&(rdinated$%reate#(darkness$#ead%(mocratic%$nted%\'refield&(graduate%&tected$*iesel-like%,fferentiated$!o%(cumented%&ubters$*u-lar-toos',
+    '%"sy$!c%,clesiastical$\'difying$\'gyptian$&lected%(iminated$*mbellished$\'nforced%-glish-looking+)qualified*$ness$$rase$(xcellent%\'istence',
+    '%&pected&&loited#(familiar%\'vourite$\'eminist$#lat$&oppish%$rmat$&reezes%,iend-li-ness$+ucking-real#(gaullist$%ibson$$odly%-os-ti-foe-lia',
+    '%#ieg$&uarded#\'hatched$%eated%&llenic$\'ighland%(storical%%tched$(ollywood%,ng-kong-like%#rsy$#ung#$iced$(dealists%(iom-like',
+    '$(nscribed&%pired&\'tigated%(tegrated\')lligenced%$vent$$rish($ness%$onic#%jaded%\'ke-like%!m$(etlagged%$wish#)labelling',
+    '%\'id-back%"mb$\'earning%!d$$ibya%$nked$%onely%#ony%$vely#%makes&#ing%"rk&%riage$)easurable%!t',
+    '$(onitored%(ralistic&#tal%\'torised#)necessary%(wsworthy$$oble%#ise$&unlike%\'tritous#,oau-ico-arab$&bvious$\'ccupied\'!r%%eanic',
+    '$\'ptioned$(rganised#$paid%\'rtnered$\'eaceful%$riod&\'manence&$sons\'%uaded$\'latonic$%olice&%ybian%%mpous%!p&$ular',
+    '$(urchased%*t-downable#*quantified#+rabbit-like%%mpant%&tioned$\'eadable%%built%(cognised\'\'mmended%&fereed&%ormed%%lated&(iability%!m',
+    '%&ported%&quired%,triever-like$$igid$#ock%$many%%utine$"un#*sanctioned%\'rcastic%#udi$\'colding%%rewed$#elf\')conscious',
+    '$%haped%&eikhly$$olid%$uled$&pilled%$oilt$(tartling$+upernatural%)stainable#%taxed$*ellenorean$\'hatcher$&ouched$%ruths$,urbo-charged',
+    '$,ser-friendly%%uable$&topian#)victorian%%sited$(olunteer#&washed$$hite$#ild%&nglike%&tching$%ormed#)yorkshire##zip"!/',
+    '%$e/ec#$gtdi#$iaea"-a&rehy;shamed#\'-rigged#7bh&auml;ngigen/alliance$,le/unwilling&$ness$%raded$$used#*ccentuated&+ptabilities*(ly-toxic(\'ibility%)ommodable',
+    ',#ing&.unted&rehy;for%\'redited%%using\'\'tomedly,$ness$#ofl$#ted%\'ionable("ed%\'ualised#\'daptive$&jacent$%mired$\'optable',
+    '#*erodynamic#)ffected-a%6iliated&mdash;internal$\'raid.it#)ggregated#%ided.##kin$"ul&&deputy#!l$\'ienable%"ve$(leviated,"ly%&oyedly',
+    '#!m$\'azingly$&bushed$"ed%(liorated%%nable%(ricanism*!s$\'inously$!o%&rtised$&usedly&#ing#\'nalytic*$ally',
+    '%&mously%\'nswered$$eled$&glican%&uished$&imous.%%nmous$\'swering$%xious#)pparelled%\'ealably(%ingly\'$sing&.tising-looking%&ointed',
+    '&&oached\'$vedd#,rgumentative$$mned$%range%%ested#*shamededly$&piring$)sailable.&%ulted%,ertive/being&$ssed%$umed$(tounding%)ronomical',
+    '$*tachedness($ment\'#ked&$ined%&racted&!i\'\'butably#(uditable$(spicious$+thenticated\'%rised&(orisedly)&tarian+$tive#$vail',
+    ')#les$"em%$nged$*oidability%#wed#!w$"ar&#ded"(babylike$&ckable$%gshaw$$ited$$king$\'lanced\'%&lasted',
+    '$!n%%daged%%kable$!r$#sed#*earability&!s%#ted$$come$$dded%(ingtheit$\'fitting$&gotten$%kannt)"en',
+    '$(leivable%#iev(%able.+*y-coloured(!e)!d%$oved$&ndable%\'evolent$(queathed$#rto$\'wussten#&iassed$!d$$nned',
+    '%\'logical%#psy%(turbated#*lacked-out%%nched&!d$&eeding&#ped%\'ievable%&ndable$&ighted$%urred#&obbing$#gus$#lts',
+    '%%ussed$#red$*ttlenecked$$ught%$nced&"d1$*wdlerising%#led$$yish#)raceleted%"id&#ned%#ked%&nching$&eached',
+    '\'#ing&$thed%!d$&ibable&"ed%&dgable&"le\'#ing%&lliant$&oached%%kenly($ness%&therly$(utalised#&udging',
+    '$&ilding$%nched(!s%%dlers$$ries%$ning\'$shed%"st%&thened%!y&#ing$"sy$&ttered&&onable#!z',
+    '$$bbed$(lculated%&loused&$used$&nceled(#led%$dled%#ned&$iest%\'onicles(#zed$(pitalist%&tioned&$ured$$rded',
+    '&$ssed%"ia%$like%&riably%#ved$$sing%\'tigated&%rated$#tch%$like#(elebrate$(nsorious%(tralised$-r&rehy;tainty%!t',
+    ')#ity)#tly*+y&mdash;for\'%nties\'#yne&$ente$%ssary#!f$#der#$hain\'$able%&mfered%+ngeableness&&nelled%*racterized',
+    '&&geable&*itableness&%mable&#red%(stenable$\'eatable%&ckable%%lated%\'micated%&rished%%wable$&ildish%&ppable\'!y$$oosy',
+    '$(ristened#%ialis&!s$!d$(nariasis&#tus%#ula$%rcled&\'ulating$&vility(!z#$lamp%&rified%"sp&\'sifable',
+    '\'!y%#wed$"e\'%--camillo-eyes&&father&&george&"ly&)solicitor%*/godfather&&nephew%%aness\'"ly%"by%%nches$&imable',
+    '$&ocking%&ggable%\'istered%%thing&#ted%#ven$&utched#+o-ordinates$%ached%\'gulated$"ck&"ed$%dable$!l%)lectivist',
+    '&&oquial$/m&rehy;fortable+(petitive%&busted%(formably(+t&rehy;able)%able.-$ness,)y-phrased)#ing%&manded&(emorated\')rcialised-#zed,"ly',
+    '&(unicated%&pacted\'$ssed&&elling\'(titively&(lacently\'\'icated.-$ness&$osed&)rehensive($sses&$uted%)ventional$2n&rehy;stitutional%)ciliatory',
+    '\'"se&(onscious%&densed\'(scending&1itional-surrender-#ity&%ucive%&fiding&.ormity-bounded(%tably%&gested%*jecturable%\'mscious%(nectable)$edly',
+    '(-ous-dominated+#_by&%ented\'\'rvative)"ed&$tant\'*itootional\'&ricted(%ucted+%ively%+templatable,"ed\')xtualised-#zed&%oured',
+    '(/versial-looking+#ted%(venanted($tion,*al-looking\'#yed$%olest$&piable%%yable&\'righted$#red%(rectable&&osible$&stable&$umed',
+    '$(unselled&\'trylike%$pler(!s%\'rageous&#sed&%teous\'"ly%#th-\'$ness+"es$$wled#(rackable%$mped%$ting',
+    '&"se&$ting("on%)ditworthy$*iminalised%%ppled%\'ticised$)ontrolled%"ss\'&linked$$tain$%umbed&%pling%)shability&$ting',
+    '+#zed##std#%tions#&ubated$\'carable$$lled%)tivatable$#red$)stomarily$&ttable"%d-orr#$a-al%%latin%$wacc$&maging',
+    '%#ned$*nceability$"rk%#ned$$shed$"te$\'untedly#!d#*ead/passed&#nik$\'batable\'"ed%\'uggable$%cayed%\'idable.',
+    ')!s%(lamatory%*onstructed$(declared$%faced%\'eatedly&&ndable&)rentially%&lected$&graded$%leted%\'iberate&%ghted&%mited&\'verable',
+    '$)mandingly%&ocracy&&lished&(nstrable$$nied$%plete&&oyable%(reciated%$uted$.r&dollar;6,000&*mdash;paid,+represented&(ndash;19,*estimation&(rehy;arm',
+    '+\'consult,&urrent+*determined+(employed1$ment,\'stimate+$foot+%going,%rowth++involvement+$nose-\'urished+#par,(erformed,(rovision',
+    '-\'present+%sized,$tand.#ted-%oried++utilisation0#zed+&valued/#ing+%write%"\'t%,-&dollar;100&$11\'s\'+4-year-olds\'#5\'s',
+    '\'"0s\'"4s\'&5-year-%-olds&"30&#40s\'!2&%7-day\'#2kg&"8s&$95kg&*absorbency\'*ccentuated($tive\'#ged',
+    '\'$ware&&baking("se\'%eered(%llies*!y\'"id(%lling\'&lanket-!s\'\'reeches($idge(#ush\'&utlers&)canvassed',
+    ')+italization/"ed(\'rriages\',ertification\')hallenged)$rged),ssis-mounted\'&lasses\'%olour,!.(*mpensating(,nceptualised)\'fidence.!t)+sumptionism',
+    ')$trol(%sting(%unter\'%rotch\'%ulled(&rrents)$tain-!s&(declares(%fined(\'manding(\'termine(*velopment\'\'(iagnosed-"is',
+    '\'\'raining)%wings(#ess&%earth\'#dge\')mphasized\')ncouraged\'(xercised()perienced)#ose,!d&#fda\'"ed("lt\'\'ifteens',
+    '\'#oot*#man()recasting*#man+"en(#urs*%teens\'$rame\'#und(&selage&)gardeners)$ment-!s\'\'raduate(#oin',
+    '&&headed($dged\'"it\'$ound&&indeed(&flated()tegration(\'voicing*$lved\'%ssues&$kill&(labourer(#yer\'%eases(!d',
+    '\'%iquid&%maids)\'ntained(%ke-up(%naged($tron\'%ining\'(odulated(\'tivated&%neath\'#ine\'(ourishes-$ment\'(utrition&#one',
+    '\'&rdered+#ing(\'ganised&\'payment\'&erform\'%inned)!s\'&lanned*$ting)#yed\'\'olluted\'&redict)(scribing*#ser+$ured',
+    '*#ing(\'oducing)%mised\'(ublicity&&rather\'$eact($cord)&ruited-$ment(*gistration\'#oad("of&&sample($ving\'"ea',
+    ')!t(&cetary)*retaryship(\'lection)!l*#ing(%rvant-!s(&ttling\'$heet)&pherds(#irt\'#ide*!s(&xteens',
+    '\')ocialized("il\'(pecified\'%tairs)"nd+#(s)+#ing)#ted((imulated/!s.#ion($orey($rain)#eet*$ssed',
+    '&$tail(#xed\',en-year-olds\'"he)*-bedcovers*%floor*$neck*$skin*$tank+%ongue*$wood)&orized($ings)&rteens+#ies',
+    '($reat,+-of-closure\'(reasurer*#ted+$ment\'\'wenties&%usage\'&tilise,#ing+$zing&)valuation*#ing\'&ehicle&&waiter\'#ear',
+    ')#ldy\'&ritten&$xxxx%+.emphasized&(utilised%#/ct&"or\')verspends&#the)"ir%"15%"21%"35%)abundance&(ccretion',
+    ',!r,!s\'*knowledged&(dvertise&\'nalysed\'*ticipating&+ppreciation&$rmed%$back\'#nks&&elieve&#ite&$ound*#ing&\'udgeted',
+    '\'$tler%.capitalisation\'$rpet(#ved\'"st\'(talogued&\'laiming\'&inging\'&ubbing&*ompensated\'(nditions(&fident()sumption/\'"ok\'%unted',
+    '&,ur&rehy;rent($tain,!s\'%tters%$deck(%lared\'%velop,*&rehy;ment,-ed/unfavoured,#ing&)ocumented\'"se&$ress&\'tanding%)emphasise',
+    '&&ndowed&&stmate&*xpectation(#ose*#ing*#ure%\'felting&(inancing\'#ves&(ulfilled\'&nding\'%!g&$lass(&ze-red&*o&rehy;ing',
+    '\'#und\'&verned&#rad)"ed)!s)%uate.(#zed\'-ound&rehy;was+!\'+#-as,"br,(dwelling,(oriented+"ed+!s',
+    '&+ill/popular\'"ve&#oof%(insuring\'$vest+"ed+$ment&\'vatised\'"ed%%laced\'!p&$ives&%oaded\'#cal\'"rd',
+    '+!r\'$rket\'!t&.icroaerophilic\'#ner*!s($ings&(otivated%"ne\'$ath/+&beside&0ourished-looking%)occupancy\'#ean&"ll',
+    '\'%nties\'"rt&(erceived(\'formers&#in\'\'%tched&$lant*$ings\'"ot&)opulation&%raise\'%edict(%pared((scribers)&enting',
+    '\')iviledged,$ged-+$iged\'(oduction($mote(&tected%)qualified%#ran\'$tted&)ecognised)$rded\'\'hearsed\'\'present&!r\'!r',
+    '%"sa&#cum&#eal(%soned\'#lls\'%rving&%harer(!w\'#ell\'$rubs&#ink\'%sized\'$zing&#kid&#lab',
+    '\'#ung&,ocialisation\'&ld-its&%pends\'$read&"ta(%dning("ge(#nd.*%/that*.ably-depressed*!e+"rs*,ing/learning($ted\'',
+    '\'%eered+!r\'\'itching\'&ocking("nd*!e(.od-to-be-known*!.\'&rapper(#eet)$ssed\'3udy-plus-supplement&\'urfaces%)taken.one("in',
+    '+!\'+"s.\'&lented\'"nd(!k&\'ermined\'$sted&%hread($usts&$rain\'#eat*$ment%+used/unused&*tilization%%vests',
+    '%$ware\'!t\'\'y.chris(&/after&0ear-as-outerwear*\'fixated\'&ighted\'"lt&#ire&!r%$zone$\'scended&(roybable%&igning&&rable.',
+    '%\'pairing&%oiled%\'troying$&tained%&ctable%(ectable.&)rmination$)viatingly%$oted#*ialectical&$ysed$%ddled$(entified$\'latable*!y',
+    '%!l$"ne&!s$,s&rehy;puted%\'carvard&\'ernible&(oncerted\'#ver*$able%%eased%%losed%\'putable%&rupted%)seminated&&ipated',
+    '%&tilled$&verted&$sted%&idedly%%ulged#&o/redo$$able$\'dgeable$&g-like$&mestic$#ubt\'%edlty\'#ing$%wered#)ramatised',
+    '$!e%$aded%\'dweight%(graduate%"st$$stnd(!g$%ugged#%skyld#(ubitably$&latory\'"um$$sted")earthedby$#se.',
+    '%$y-an#-cclesiastical$&essary$&static#!d$!o$&ucable#*fficacious#*galitarian$&yptian#(laborate$#ect\'&rified%%vated$&icited',
+    '$(ucidated#&mended$%otion\'"ve$&pathic%)hatically%(loyed.29*#/or*#_as(!m)1ent&mdash;100,000,!--\'benefit-)inflation-\'related',
+    '%$tied#&nacted$\'chanted)#ing%(ountered\'%raged$#ded%%orsed$*forceable.$%gaged\'#ing%%raved$\'livened$3terprisingly-ridden\'\'taining',
+    '&&usiasm%%icing&\'tlement%%ombed%,repreneurial$"vy#+pigrammatic$\'loyment#\'quality\'+ly-bestowed%)ilibrated&%vical#%rased$#igg$&odable',
+    '%.o-commissioned\'\'decreed&(/pugwash\'$undp$(sentials$\'timated#%tched$&hereal\'$ised#*uphemistic#&vasive$\'en-ness&!t\'\'fulness$"il',
+    '$&ceeded%&itable\'%ement\'%ingly$\'hausted%(ibitable$\'orcised%#tic$(pandable%$ecte)"d.*&nesses&\'ditated%(lainedly&&icated',
+    '%%orted%(ressable%(ungeable$+traordinary"!f#*&ecirc;ted#!.#$aald$%ceted$$ired%\'thfully$,lsifiability)"ed$(miliarly$&nciful',
+    '$$rmed$"st&#ens$+thomability$%zable#&earing%(sibility%$ther)#ing$)elingness$\'ignable\'$edly$)line-like$&minist$\'rground',
+    '%%reted$%stive$&ttable#\'ication$#led%#ial%$lial$\'nalised(#zed%-ished-looking$"rm$"t\'%!s$!x%&edness',
+    '%$gged%$pped%#red%#shy%!t&%tered$%edged%$eced%#shy%$xing$%owing$$uent%\'ttering$%yable#!o',
+    '$"nd$"od%%lable%\'rtunate$!r%.&rehy;tunately%\'atunate%\'bidding%(eseeably%(getaball*"le&+iveable.but,!y%\'malized\'$tted',
+    '%&t\'nate&!u\'&antely\'&lately\'!n(&altely)*te-looking\'\'ynately%\'unately$*ssilisable$$unds#$rame%%zzled$%eemen%%quent',
+    '$,iend&rehy;ly("ed($lies(!s%\'ghtened$#ock%(gettable$)ustrating#&ucking)*believable$)lfillable$)nctioning%$nily\'$ness$)riatingly',
+    '""ga$%inful&%liest\')y-looking$(lvanised$&rdened%&landed%\'risoned%%tered$$ssed$#ted$"va#*eneralized("te\'%osity',
+    '%$uine$\'ometric$\'rleider#!h$&aretti#$iddy$$lded$#ven\'$ness#"ku#(laciated%(morously\'%urise%$ring%+zed-opening',
+    '$%uable%$eing%#ing#"ol$&rgeous#&rained%&mmatic+\'alities-"ly-$ness\'(ticality%%sping%#ted\'\'fulness&&ifying',
+    '$"im%$tted\'!y$%oomed%#und($edly&#ped%%wn-up$\'umbling$!y#$uals%\'ranteed&\'dedness$"ds$\'essable',
+    '$&iculat$)llability&$ible$!m%#med"(hackable$!d%!.$$fted$)ndicapped&!s$$ppen(#ing&+ily-married&)y-looking',
+    '&(oniously)#sed%$ried%&vested$%stily$$tted$%ughty%$nted$&veable#,cr-sponsored#%ealth%%rable&*d-of-level%#val&#ing',
+    '$#ill$&lmeted%%pable$(roically$&sitant##ide$\'larious$$nges&#ing)"ly$#red$*storically#%obble$&lesome%\'stering',
+    '$"od%"ks$\'pefully$$rned%"se\'!y$&useled(#led#%umble$"ng&"ry$&rrying$\'sbanded%#hed#)ybridised',
+    ',"ly"*i&aacute;o$(ograve;n#(-cycling$-dimensionally$*functional$\'k-swiss$%lever%(iverpool$%mates%$edia$*processors$#sex%#ize$$turf',
+    '##/xt#"an$+te-orthodox##can%"re%!s$$ipia%"ss%"ty$!o%"de%#lor%"rd&#nes\'"is',
+    '$#ums%$rsal$(ycle.put%"st#&d=s&gt$#are$#eal\'%istic%)ntifiably%(ological#)factorial$"et$(i&eacute,";e%$cada',
+    '\'%tion*+(-grammar,\'seeking(#ory%!x$%olium%\'rm-cost(%state\'!e(!s\'#ily("se&#um.#\'genitus$*ram-for-nt',
+    '%#oom&"up#,hierarchical#!k#!l$\'amellar%+ter-whatsit()allywhile$$evel\'"rs$#ift%\'nearity$)luminated#.m&rehy;pressed$5aginatively-presented',
+    '%!k%!p%!r%"te$#gag$\'munised(#zed$(olecular$-port&rehy;ant((ant-that%(regnable\'&ssible*&onable**ve-looking,$ness',
+    '%\'ugnably#)ndeighted%\'ividual%+ustrialized$(fatuated%(iltrated%%lated%*ormatively$+hibitedness$&itiate$&jected%0ured/unsuspended$#ked$(nervated%\'ovative',
+    '$\'scribed%\'piring\'%.titutionalized&\'ructive%&urably\'#ed.$&tegral&(lligence&\'rcepted\'.esting-looking-$ness\'&mitted\'\'rrupted%%imate\'\'idating',
+    '%&ruding\'$sive$%vaded%\'itingly#!o$)n&mdash;a,-dvu&mdash;for,)patriotic&/rehy;controlled%\'-agreed&(building&*controlled(\'rporate&\'focused&*government',
+    '**-encrusted+3i\'m-backing-britain&#led&*negotiated&)organized(&iented&%party\'%ublic&+recognition(%lated(&public&(shipping&(to-union%$/cis\'+onstituency',
+    '&)non-union&,professional&&russia&&worker%.ist-controlled))dominated("s.&$zing%#law&#ess%+s&mdash;the&".s&1/manage&rehy;ment\'%staff%$wide',
+    '$\'ersonal$$ixel$#lam%#ex\'$\'olarity%"rk#!q$%batch$#fax$%print$%telex$0ue&lsqb;sic&rsqb&*ly&mdash;a(,-constructed)(talented',
+    '*%oiced&)ness-type$"wa#*ras/unimap$#ish%!x#"s.$&cience$$exed&#ual$$hred$"m.$/on-combinations$$pace$$ql/m',
+    '$"ur#-t&lsqb;s&rsqb%%mdash$!\'$%-cell&%redit%%level&#oad)!s%(membrane(!e%&school&\'hifting&#uch$#.ed',
+    '%%model%)specialty$#=83$"af%#rio&%y-tax%!s$-e&lsqb;d&rsqb%&d-city\'%front\'$type\'%villa&!.\'#now&!0',
+    '&!4%%mized%!r&"ms$!g$!i%$ated%&zation&!e\'!d$"or&!y$&s-that%#.it%)/&micro;l',
+    '&&forage\'\'reezers&!l\'$itre&\'modules$)y-coupled&)landslide&&scaled%)/movement#"v0$"41$&alents&$late%!p%\'riately',
+    '&,&rehy;sality&&isties\'%taria&"sa(!e(%lists*$ties*&zation)-k&uuml;nstler)+ly-accepted-)pplicable,&shared,%valid\'*e&mdash;no("-a',
+    '(#/in\'%idade(!t)+&aacute;ria+%grave+0uml;tsphilologie)"\'e)$atii)"e\'*#its*!s)0ies/polytechnics+!t)"y**+-accredited',
+    ',$ound+*industrial+\'leavers-!d+*originated,$wned+(provided+(rafelski,"un+%style,(upported*$.the*(/college+%drugs+*government',
+    '+$star*"to\'"ty\'"um$#ibe%"ew%\'sitaire%"te$\'ocality("ly%#que(!s$"s.$!y#%x-add',
+    '%)dependent%&killer%%lover%\'on-a-pc($risc&\'riented%(specific&&ystems%%to-pc(#sna(\'windows$$/aix%-client-server%#dos%%motif',
+    '%#nfs%*ositel/400%#sna%#vms%+workstation%)x-windows$$expo"\'jacking$&mmable#&ealous#%oined$%stled$$yous#$ust\'&#ice',
+    '"$keen$%nnels$(rridgean$#yed#(illable.$!n%"de&#led%#gly%"ks##les#(nickered%%ghted$%ocked%$werr',
+    '&#nst#$ynde"!l#&abeled%%oured$$ding%&y-like$%gered%#ged$\'minated$\'rk-like$\'undered$%wfull)"y\'$%yered',
+    '##ead%#ned%#rns\'!t$!d$(ngthened%%inist$*opard-like$+ss-redeemed&,.politically&,/however/but\'#new$&ttable#)iberating$&cenced',
+    '$$dded$\'gnified$)keability&#ley\'#ier&!s&!y$\'mitable\'*ed-mileage*#use$%pping$&stened$\'thified$#ved\'(&rehy;in',
+    '%#ing#\'oadable&"er(!s&$ings$\'calised(#zed&%table$!g$"ok%!p%#sen(#ing\'!s&#ing',
+    '%!e&$able%%ingly#&uckier%&rative$#ted%#urk$\'xurious#&yrical$\'willing"%ma\'an$\'gnified$$iled%#med$&keable',
+    '$\'licious$\'nagable%$gled%&icured&\'pulated%,oeuvrability%+ufacturable&$red\'$+rked/marked%%ried.%#tyr%$xist$\'sculine%"kt$*thematical',
+    '%)riculated#(eaningly&!t%\'surably$(diatedly&%cated$&etable$&llowed%$odic\'\'ramatic%$ting$\'morably$&ndable%(tionably$$rged',
+    '$%shing$*taphorical%\'hodical%%rical#\'ilitant%#led$#red$(stakenly$\'tigable(%tedly)#ing%#red%\'tigated##los#(oderated',
+    '%\'ifiable$\'llified$$rose%%taged&(gageable*!d$&therly%#ive$&ulding$!v#&uddled$\'fflable\'"ed$$gged$$ssed',
+    '$&zzling#+ysteriously"*n&ouml;tig#.-derr-tay-kerr#(affected$$ming$&tional*$ized%,ural-looking*(sounding)%istic#!d#)ecesarily\'*sarily.the+$ness',
+    '$!r%%stand%%ving-$\'ssarily%$ting$$tted%&worked#!h#(ominated$.tice&rehy;ably(\'ability&$fied$(urishing#%umber$(tritious',
+    '$(ligingly&\'terated$\'served.$#tru$%vious#\'ffended%$ical)"ly#$iled\'&-hinge#*penability&#ing$(timistic#.rthodox-theory#*stentation',
+    '$"ta#$wned")packaging&"er&#in\'("gs$%dding$#ged$&id-for%#ned$)letteable$&rallel*#led%%doned%\'rotlike',
+    '%+ticularized$(ssionate)"ed$%tched%\'entable%&inated%&rolled\'&nizing$#use#%eated$%eling$*joratively$(netrable)#ted%(itential',
+    '%!t$(rceiving%(dictably%\'forated(#med&$used%#med&&issive%&plexed%#son(!s&(uasively%$turb)$ably$&stered',
+    '$$oney%+sphorylated%\'togenic(&raphed$)ysiologic-"al#$icks&&upable%\'turable(%esque$#ety$,geonholeable$$ling%%lowed%$oted',
+    '%\'pointed$$tied%#ted#$lait\'#ing%&nnable\'#ed.%\'tformed&)itudinous&$onic%&yablly$%eaded&%sable(+nt-coloured+\'tasting',
+    '*,ness&rehy;to*"ry\'\'entness\'&ing-no*"ly\'#nat\'#ure$#ied$(oughable$%ucked%&ggable&!s%#shy#\'oetical$%inted',
+    '%\'ishable&\'ticised%\'linated$$pped%%ular.$"sh%\'itional%\'sessed.)#ive%#ted$(tentized$&wdered#*racticable(!s$/e&rehy;tentious',
+    '%*dicability*"le(*tabilities+$le.i-$ness)#ive%&scient\'\'riptive&%ented%#tty%(ventably)"ed$)incipled\',$ness&&ked-up',
+    '$-o&rehy;tected%)blematise%%digal&$uced(%tive.,#ly.%)fessorial&&icient\')tableness%(grammmed%"ne&(ouncable*"ed%&pelled%(spective',
+    '\'&olyzed&&onated%(vability&&enance,!d#,sychological#*uffin-like$&mpable$%nched%\'ished\'\'%#ned$&rified&#tan%\'poseful$&shable',
+    '$%elled%&nching%-s&rehy;tioned&+tionability$\'izzical$&otable&"es"(raceable%\'ialised$&diated$#ked$"mm$(ndomized%"yl$%ttled',
+    '\'%lings\'$ment#$ead-%"l.&(iability\'%stic.\'$ties(&y-away)!.$%bated%$uked$*capturable%(laimable&%usive%3ognizable&mdash;for',
+    '\'&mended&\'nstruct&&upable%\'yclable(%eable)!d$(deemably(%ingly$$efed&#ing%!l&!s$&ferred%$fled%%ining',
+    '+"ly)%ively\'$xive%&reshed&(igerated%\'undable&#ted$)generated+#ive%6istered&mdash;together%&retted)#ing$\'joicing$&lated.)$ness',
+    '%&iables\'"nt&&evable&%gious$,markableness%\'ittable%#med%\'orseful$%newed%&ovated&$wned$)organized$$pair%%ented(%ingly',
+    '%*lenishable+"ed%*resentable,&tional+%ivity(#sed&%imand&\'ocessed$\'quested&&itedly$\'scinded&%uable%)earchable&%ntful%&istant',
+    '&&urcing%&pected)#ful&&onding(&sively%\'t-which&(imulated\'"ng&\'ricting+"ve$&ticent&"re\'#ing%(ractable&\'ievable',
+    '%&isably&#ved%$oked&)lutionary#)hetorical$&ymable%%thmic#\'iddling*!s$%ghted%"id$#hta$$nsed$$pely$#sen',
+    '#-oadworthiness$$bust$"ck$"le$%ofing$$tten$\'uteable##ule%#ier$$sted""s.#\'ackable&"ed%\'rosanct$!d',
+    '$%intly$(lability\'"le&!n%\'ubrious&$ting$%mpled$"ne%&itised$&tiated&.s&rehy;factory\'\'faction+$ory\'$-voury-looking$!y',
+    '&"ed%(ndalised&#ned$\'eptical$\'hematic$)ientific.,$ally$"om%%rable%%ttish%$ured$(ramblers&$ping%&eening&%wable',
+    '%%olled(#ing$%uffed##eam&&anlike&"ed%\'rchable&"ed%%table&!s$$cret%)tarianism&%ioned%,ured/secured$\'ductive',
+    '$$lect(%ivity%-f-disciplined%#ved$"nd%,sationalised&\'ibility\'&tivity%%t-for&%enced&+imentalized$#ren%%rated%!s%-viceabilities',
+    '$-ttled-looking\'%ingly$\'verable$%xable%$iest%#ual#&hackle(#ing%%kably%&reably%\'ttering%&veable$&eathes%#red$"ip',
+    '$#one%\'uldered%"wn$$runk$%yness#&ighlty%%nable$$lent$\'mulated$&ngable$&sterly$#ted#\'kewered$\'ilfully)$ness',
+    '\')ed-worker)!/*,semi-skilled\'%fully%$mmed%$nned\'!y#(lakeable$(eepingly%%pt-in$\'iceable%"ng$%urred#&melted$%oking',
+    '%"rl$&obbish&$like#$ober$(cialized&(ological%#ked$(ftenable$$lder("ed&%ierly%(icitated&!d%%vated&#eds',
+    '$#rry$%unded#$pace$,eakabilities)#les%\'cialist&)tacularly%&llable%"nd$$iked%$lled$%liced&!t$(oken-for%(ntaneous',
+    '$"un%$rred#&quired#)tabilised&*le-looking(%ness.\'(y-sprung%$cked\'+ing/putting%#ged%"in%$lked&$ling%)ndardized%#rry',
+    '$&eadied("ng\')y-looking&$lthy&$ssed%&mmable%%pping%/r-mittelfranken&)eotypable+"ed$$icky%"ff%)gmatizing%"ll\'"ed',
+    '&#ted%)mulatedly%\'pulated%%rring%#tch("ed$(ockinged%#len%#ned%!p&#per%$ried$&raight&"ps%%eamed',
+    '&"et($wise%%iated&$pped&\'ven-for%\'uggling$#ung#%ually$!b%(/suspend%#bed%(mersible%)ordinated%(scribing&)titutable',
+    '$)ccesfully(!s)$fuly%&essful%$kled$(fferable(#ing$)itable-as*!.$#nny$+perintended\'#men(%odels\'\'visable$$rely',
+    '&"er&%liced&\'risable)!e)\'ingness%\'vivable$\'spended%#sed%+tainability++ly-produced#$wear&"ty$\'immable$%ollen$#ung',
+    '$+mmetrically%%pathy$*stematized".tac-controlled&*supervised%!k&"le$\'lkative$"me&%dness%%pered$*p&rehy;ped%$ered$\'rgetted%%iffed',
+    '$&ttered$!x#*eacherlike$)baugebiet$(lephoned$!n%(dentious-"ly%"se\'!d$)rergraben%$gang%%maier%*offizieren%%raced',
+    '&#ifi%%sberg&\'chachen%+thanspatent%%weger&%llden$\'thering$&xtured#\'hankful%#wed$)eological&%rized%(rapeutic$(inkable.*!y',
+    '$(ought-up$$read(#ing\'(teningly%%illed(#ing%#own$0underouslylikely$(wartable#\'icketed$(dinesses%(y-haired\'\'looking$%ghten$2l&rehy;then-secret',
+    '&-then-pleasant%&/since&&unless%"14&!9%"at%"ed%#led$&mbered%%eable$$nged%#ted#&oasted$&gether*$ness',
+    '$%ld-of$"rn$1uched-by-anything*#she$&wardly%$ered#(rackably%#ded%#fax%#gic%%ining%*nscendable(\'ribable\'%duced\'\'ferable',
+    '\'(mittable+"ed\'(portable%&ppable%%sound%$vell$&eated.%&mbling$&ifling%(vialized$&opical%(userlike$%usted\'(worthies##ube',
+    '$*rndownable&&ed-out#%weedy$%ining&#ned%%rling%%tched#$yped"\'ukalhai#(nionized%#que#!s$$ally$!e%#ful',
+    '$,jurisperitus$,ual-sounding\'!l(&y-full*&gifted*&shaped,!y"$vail$)lidatable%%uable$(ndalized%)quishable*"ed$&riable*!s',
+    '#&eiled.&$ings%#ned$#nal$*rbalizable%"ge%*ifiability%%richt%$sity#&ibrant$$eled$&olable&#ent$$sual$&tiated',
+    '\'$ized$(luptuous$)rtunately"1waged/student/oap$&lkable&"ed$$rmed%%ranty&%ented$$sted#&ealthy%&riedly&&yingly%"ve$$dged',
+    '$$ight%#ldy$\'lcomely%"l.&$ness$$shed#&hiffed%\'mpering%$pped%%stled$&olsome#%ifely$$gged$$lled&5ing-to-be-interviewed',
+    '%#ted$\'n-esque&(inspired%%/tree%%esque$#ped$#red$"sh$&th-its&$ered&"it%&nessed%"ty#$oken$"lf',
+    '$!o%#ded$&rdable&"ed%&kable\'&&ed-out&#ing%&riedly$#ven#*rappedness("rs$%ecked$%inkle%%table&!e',
+    '")xpeckeded"&yarded#+ieldingness#%oking$&uthful"(zippable&"er("ed##oom!!o"!2#&(no3)2""ce"$mini"#plf',
+    '"#sat#\'ukainen!\'p&mdash(%;they#(rehy;and+\'-coming(%dated+#ing(&ending(%front"(\'n\'at\'em#!t"0-and&rehy;coming,\'running&(-comings',
+    '\'&unders&\':coming#&branch%$eeze$&ullets#\'current##dip#$ends$(scalator,!s#&flight#%goods$(radeable(!s\'$ient',
+    '#\'holding%"ok#$lake$$evel$%ifted%%ghter%"ne##man#+pseudo-cost#$rate&#ing$(egulated*#ion$$ight$)ootedness',
+    '$\'killing$$lope$#pec\')ification$$tage(!d&"nd&%rting%%rokes$$wing#)the-price$#ide$!o%)-200-mile&,date-records',
+    '&/the&rehy;minute)%-hilt%*the-minute%"wn$&urning#+up-and-away#&valley#\'ya-boya"!.#%keith#$that%!e"!/#"bm#4consolidation/action',
+    '#"hr#"in#"ml#&pushes#%right##the#$wash"-_,_it\'s_up_to%%up_to#)add_up_to$&s_soon#%er_to%$m_to#"in#"on',
+    '#.right_up_until#+up_up_up_to"#aci#%dhyay#&nisads$!o##von#%zilla"%beats#%raded$\'ingings#%uilds$"ry"&change%%tting',
+    '#\'urrents""da$5te&mdash;baseline.log&%-only&&/alter&$able&!r%$ings#%oming#$raft\'!s#!s#!t""eb##nds',
+    '#&illing#$ling##old&"ed#(rontness"%glare"&heaved$+ld&mdash;as-"if&!.#3ill-shopping-street#!o$*lder-class%+sterer/soft)$ings',
+    '##tis"%keep."*land-areas&(/lowland&"er&"s.$%wmoor$#zas#%eaden#Qift-under-wired-half-cup-sponge-rubber-lace-nylon&#ed.\'"rs$&ghting#%oaded"!m',
+    '$)rket-area#"rc"#oli$!u#"nn#%ttery#$zila""pa$#nce#!e$4r&rehy;middle-income%$-air\'"nd\'"rm&\'bagshaw',
+    '\'(ourgeois&&classy&*elementary&$fret&$hand\')emisphere\'#ive\'$ouse&#lip\'%ounge(*wer-middle&.mantle-derived)#ual($rket\'%edium',
+    '\'"id)0dle-class-accent&%range\'#ear(&gister(/spiratory-tract&,second-class\'$tage&%teeth\'$high&-working-class%&/lower&&middle%%breck&!y',
+    '\'$pped(!s%%plate%%sides%#ton\'"wn#"ie$+ty-know-all#$land"(ravlenie)"ye#%eared$&gulate$)meditated#&ichard',
+    '$"se&!n%#in\'$"te$-ver/downriver#(oariousy$$lled$#ots$"se"%s-are#!a$%daisy#!d##eat$!l',
+    '%4/annoyed/embarrassed%#ted\'!r(!s&#in\'(#gly##haw$)ot-bagley&!s#&idaisy%+e&rehy;down&\'-downed$,lon&amp;sup4\'!s#"ki',
+    '%$lled%$rted#%lopes&#ing#*on-trained%(/trainer#&pecked#%tages%!i&(rs&mdash(+-downstairs(#.it(+/downstairs%#nds%$tion',
+    '&!e$,ream-forever%$okes#\'urgence&#ing#\'weeping%"ll\'$ings$&inging"!t#*ake-evoked\'\'induced#"he$%rusts##ide',
+    '$!x#&o-date$$date$,n-by-chester&)on-severn&+upon-severn$$wner"#upa#!t"&valued&#ing"!w#+ard-curving\'\'opening\'(plunging',
+    '\'*spiralling(\'triving\'&tilted()ravelling(&urning&%bound&!e&-ly-registered&/s-and-downwards(+compatible-(&facing(\'sloping$#ter$"ve##ell',
+    '&-ing-diffusion)!s#\'renched!!q"#bar"%ueque!&r-epic#\'freezer#&mother"#410""a3#&bandai$!e#%cil-c\'"n-',
+    '#,emicsyndrome$"us#&guayan)!s#%itsev##ken##laz$%ensis$$inda%%tised#$nerz$\'iferous%&um-238(%based($fuel',
+    '(+mineralised))olybdenum(\'powered))rocessing(&seller\'!.&!s$"ov#%ricaa$"tu#+te-lowering$$hion#"wa#!y$\'/miller',
+    '$"n-&#aid&&biased\'#orn&(centered 0wahlkapitulation',
 )
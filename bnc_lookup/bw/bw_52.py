@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_52 = (
+count_52 = 6694
+
+heads_52 = (
     'thing-',
-    'thing-a',
-    'thing-all',
-    'thing-always',
-    'thing-i',
-    'thing-if',
-    'thing-not',
-    'thing-so',
-    'thing-that-matters',
-    'thing.',
-    'thing_but',
-    'thing_in',
-    'thingamabobbit',
-    'thingambob',
-    'thingamijig',
-    'thinge',
     'thingfrith',
-    'thinghood',
-    'thingill',
-    'thingis',
-    'thingmajig',
-    'thingme',
-    'thingness',
-    'thingo',
-    'things&mdash',
-    'things&mdash;like',
-    'things&mdash;nothing',
-    'things-',
-    'things-as-they-are',
-    'things-cups',
-    'things-for',
-    'things-in-themselves',
     'things-just',
-    'things-the',
-    'things-to-do',
-    'things-were-just-getting-interesting',
-    'things.they',
-    'things/ideas',
-    'things_in_,_in',
-    'thingsgetwet',
-    'thingumabob',
-    'thingummajiggeries',
-    'thingummycallit',
-    'thingums',
-    'thingwiricci',
-    'thingybobs',
-    'thingymebob',
-    'think&mdash',
     'think--by',
-    'think-big',
-    'think-ers',
-    'think-i\'m-gonna-dance',
-    'think-piece',
-    'think/bother',
-    'think/feel',
-    'think/sleep/work',
-    'think_in_terms',
-    'think_so',
-    'thinkabout',
-    'thinker/artist',
-    'thinkest',
-    'thinki',
-    'thinking-all',
-    'thinking-but',
     'thinking-by-pun',
-    'thinking.based',
-    'thinking/acting',
-    'thinking/cerebral',
-    'thinking/imagery',
-    'thinking/imagination',
-    'thinking/stress',
-    'thinking/writing',
-    'thinking_in_terms',
-    'thinkingly',
-    'thinkings/as',
-    'thinkl',
-    'thinkly',
-    'thinks/discusses',
-    'thinkst',
-    'thinktank',
     'thinkth',
-    'thinkwrite',
-    'thinly-',
-    'thinly-concealed',
-    'thinly-covered',
-    'thinly-spread',
-    'thinly-stretch',
-    'thinly-upholstered',
-    'thinly.',
-    'thinned-down',
-    'thinned-out',
-    'thinner&mdash;much',
-    'thinner-hair',
-    'thinner-necked',
-    'thinner-walled',
-    'thinner/brush',
     'thinness-conscious',
-    'thinspace',
-    'thint',
-    'thio',
-    'thio-',
-    'thioacids',
-    'thiobacillus',
-    'thioglycollate',
-    'thiol-protein',
-    'thiong\'o',
-    'thiooxidans',
-    'thiosulphate.',
-    'thiosulphate/citrate/bile-salts',
-    'thiosuphuric',
-    'thirburn',
-    'third&mdash',
     'third&rehy;round',
-    'third&rehy;scale',
-    'third\'',
-    'third-age',
-    'third-based',
-    'third-best',
-    'third-bottom',
-    'third-brake',
-    'third-category',
-    'third-change',
-    'third-cousins',
-    'third-day',
-    'third-end',
-    'third-fastest',
-    'third-finger-of-the-left-hand',
-    'third-formers',
     'third-from-bottom',
-    'third-from-the-left',
-    'third-gear',
-    'third-growth',
-    'third-holiest',
-    'third-man',
-    'third-of-a-second',
-    'third-of-an-acre',
-    'third-of-the',
-    'third-or',
-    'third-party-payer',
-    'third-personal',
-    'third-phase',
-    'third-pint',
-    'third-preference',
-    'third-rank',
     'third-rater',
-    'third-richest',
-    'third-row',
-    'third-second',
-    'third-seeded',
-    'third-share',
-    'third-stage',
-    'third-storey',
-    'third-story',
-    'third-string',
-    'third-team',
-    'third-than',
-    'third-time-lucky',
-    'third-to',
-    'third-tones',
-    'third-worldism',
     'third-worst',
-    'third.',
-    'third.they',
-    'thirdparty',
-    'thirdperson',
-    'thirds/one',
-    'thirdy',
-    'thirion',
-    'thiripyitsaya',
-    'thirkell-designed',
-    'thirkill',
-    'thirkleby',
-    'thirlestone',
-    'thirlings',
-    'thirne',
-    'thirring',
     'thirsa',
-    'thirsk-based',
-    'thirst-driven',
-    'thirst-quenchers',
-    'thirst-rousing',
-    'thirst-satisfying',
-    'thirstiest',
-    'thirstiness',
-    'thirte',
-    'thirteen-',
-    'thirteen-and-a-half-year-old',
-    'thirteen-arched',
-    'thirteen-chapter',
-    'thirteen-episode',
-    'thirteen-fold',
-    'thirteen-goal',
     'thirteen-inch',
-    'thirteen-item',
-    'thirteen-kilometre',
-    'thirteen-line',
-    'thirteen-man',
-    'thirteen-page',
-    'thirteen-part',
-    'thirteen-person',
-    'thirteen-stone',
-    'thirteen-week',
-    'thirteenth&rehy;century',
-    'thirteenth-/early',
-    'thirteenth-early',
-    'thirteenth-to',
-    'thirteenth/fourteenth',
-    'thirteth',
     'thirth',
-    'thirties-',
-    'thirtieth-century',
-    'thirtle',
-    'thirtleby',
-    'thirtwell',
-    'thirty&rehy;five-year-old',
-    'thirty&rehy;six',
-    'thirty\'s',
-    'thirty-and-five',
-    'thirty-bobs',
-    'thirty-eight-foot',
-    'thirty-eight-state',
-    'thirty-eight-tonne',
-    'thirty-eight-year',
-    'thirty-eights',
     'thirty-feet-wide',
-    'thirty-fifths',
-    'thirty-five&mdash;forty',
-    'thirty-five-footer',
-    'thirty-five-year',
-    'thirty-five-year-olds',
-    'thirty-fivish',
-    'thirty-foot-high',
-    'thirty-footer',
-    'thirty-four-fold',
-    'thirty-hour',
-    'thirty-hundredweight',
-    'thirty-inch',
-    'thirty-kilometre',
-    'thirty-league',
-    'thirty-line',
     'thirty-love',
-    'thirty-mark',
-    'thirty-metre',
-    'thirty-oared',
-    'thirty-oh-five',
-    'thirty-oh-four',
-    'thirty-oh-seven',
-    'thirty-one-inch',
-    'thirty-one-rig',
-    'thirty-piece',
-    'thirty-point',
-    'thirty-roomed',
-    'thirty-round',
-    'thirty-seater',
-    'thirty-sev&mdash;thirty-eight',
-    'thirty-seven-year',
     'thirty-shilling',
-    'thirty-six-inch',
-    'thirty-six-patch',
-    'thirty-storey',
-    'thirty-thousand',
-    'thirty-three-footers',
-    'thirty-three-metre',
-    'thirty-two-bed',
-    'thirty-two-county',
-    'thirty-two-foot',
-    'thirty-two-legged',
-    'thirty-two-seater',
-    'thirty-two-thousand',
-    'thirty-year&rehy;old',
-    'thirty-year-long',
-    'thirty/forty/fifty',
     'thirtyfold',
-    'thirtynine',
-    'thirtyseventh',
-    'thirwall',
-    'thiry',
-    'thiry-nine',
-    'thirza',
-    'this\'/',
-    'this(37)',
-    'this-election',
-    'this-heah',
-    'this-in',
-    'this-is-old-hat-to-me',
-    'this-ism',
-    'this-represents',
-    'this-that',
     'this-there',
-    'this-you',
-    'this.ii',
-    'this.one',
-    'this.section',
-    'this.vertical',
-    'this.we',
-    'this/',
-    'this/i',
-    'this/that',
-    'this_as',
-    'this_at',
-    'this_in',
-    'this_on',
-    'thisand',
-    'thisb&eacute',
     'thisletex',
-    'thisness',
-    'thispiece',
-    'thissa',
-    'thisss',
-    'thistle-bloom',
-    'thistle-cup',
-    'thistle-down',
-    'thistle-filled',
-    'thistle-like',
-    'thistle-seed',
-    'thistle-shaped',
-    'thistle/magnus',
-    'thistlebrook',
-    'thistleflats',
-    'thisu',
     'thit',
-    'thitlingham',
-    'thixotrophic',
-    'thixotropy',
-    'thk',
-    'thledge',
-    'thlice',
-    'thlyy\'gzul\'zhaell',
-    'thnum',
-    'tho\'t',
-    'thoab',
-    'thoat',
-    'thoc',
-    'thoddy',
-    'thode',
-    'thoghtes',
     'thohoyandou',
-    'thoi',
-    'thojib',
-    'thokk',
-    'thollaidh',
-    'thollow',
-    'tholoid',
-    'thom-as',
-    'thomaides',
-    'thomam',
-    'thomas(earthscan)',
-    'thomas(usa)',
-    'thomas-a-beckett',
-    'thomas-baker',
-    'thomas-ferrand/prison',
-    'thomas-in-the-cliffe',
     'thomas-scheler',
-    'thomas/animal',
-    'thomas/british',
-    'thomas/commoners',
-    'thomas/diocese',
-    'thomas/ex-wife',
-    'thomas/haywood',
-    'thomas/historian',
-    'thomas/lumberjill',
-    'thomas/malvern',
-    'thomas/nuclear',
-    'thomas/oxford',
-    'thomas/pharmacist',
-    'thomas/spider',
-    'thomased',
-    'thomasescu',
     'thomasino',
-    'thomasius',
-    'thomaskantor',
-    'thomaskirche',
-    'thomasschule',
-    'thomasz',
-    'thomayer',
-    'thomaz',
-    'thomazine',
-    'thomboemboli',
-    'thombury',
-    'thomesone',
-    'thomham',
-    'thomire',
-    'thomkos',
-    'thommassen',
     'thommen',
-    'thomo',
-    'thompkins',
-    'thompkins/adkins',
-    'thompson-chesson',
-    'thompson-mccausland',
-    'thompson/association',
-    'thompson/bereaved',
-    'thompson/bullingdon',
-    'thompson/calverton',
-    'thompson/central',
-    'thompson/cheltenham',
-    'thompson/gloucestershire',
-    'thompson/hartwells',
-    'thompson/hereford',
-    'thompson/kidlington',
     'thompson/meb',
-    'thompson/parent',
-    'thompson/ross',
-    'thompsoncommunity',
-    'thompstone',
-    'thomsom',
-    'thomson-cfs',
-    'thomson-houston',
-    'thomson/house',
-    'thomsonian',
-    'thomsonii',
-    'thomspon',
-    'thone',
-    'thones',
-    'thongvinh',
-    'thongweed',
     'thoni',
-    'thoo.',
-    'thop',
-    'thops',
-    'thor-delta',
-    'thor-lo',
-    'thoracica',
-    'thoracico-abdominal',
-    'thoracoabdominal',
-    'thoraxes',
-    'thorbj&ouml;rn',
-    'thorbjoern',
-    'thordis',
-    'thordur',
-    'thored',
-    'thorell',
     'thoren',
-    'thorfinnsson',
-    'thorgan',
-    'thorgeirsson',
-    'thorgills',
-    'thorgilsson',
-    'thorgut',
-    'thorhallsdottir',
-    'thorichtere',
-    'thorichthys',
-    'thorikos-kephale-prospalta-sphettos',
-    'thorketil',
-    'thorkild',
-    'thorn&amp;e',
-    'thorn-apple',
-    'thorn-clad',
     'thorn-free',
-    'thorn-hedge',
-    'thorn-impaled',
-    'thorn-ivy',
-    'thorn-like',
-    'thorn-planted',
-    'thorn-ridden',
-    'thorn-roots',
-    'thorn-spattered',
-    'thorn-tree',
-    'thorn/',
-    'thorn/acacia',
-    'thornaby-based',
-    'thornalley',
-    'thornally',
-    'thornburn',
     'thornbushes',
-    'thornby',
-    'thorncroft',
-    'thorne-',
-    'thorne-leggatt',
-    'thorne/lab',
-    'thorne/macintyre',
-    'thorne/managing',
-    'thorned',
-    'thornensians',
-    'thorneyburn',
-    'thorneycroft/forestry',
-    'thorneycroft/mountbatten',
-    'thorngren',
-    'thornleys',
-    'thornliebank',
     'thornlike',
-    'thornscrub',
-    'thornsett',
-    'thornside',
-    'thornton-berry',
-    'thornton-le-beans',
-    'thornton/grand-daughter',
-    'thornwood',
-    'thorny-headed',
-    'thorny-vines',
-    'thornybank',
-    'thornybauk',
-    'thornycroft/forest',
-    'thornycrofts',
-    'thornyheaded',
-    'thoro',
     'thorolds',
-    'thoronet',
-    'thorough-colour',
-    'thorough-paced',
-    'thoroughbass',
-    'thoroughbraces',
-    'thoroughlky',
-    'thoroughly-there',
-    'thoroughout',
-    'thorpe-beeston',
-    'thorpe/protest',
-    'thorpe/triple',
-    'thorpeby-newark',
-    'thorpelands',
-    'thorrington',
-    'thorrun',
     'thorseby',
-    'thorsrud',
-    'thorstein',
-    'thorstvedt-berg',
-    'thorton-berry',
-    'thorvaldsson',
-    'thosand',
-    'those&mdash',
-    'those-of',
-    'those.in',
-    'those_in_favour',
-    'those_over',
-    'those_up',
-    'thoses',
-    'thosestarting',
-    'thospson',
     'thote',
-    'thotte',
-    'thou\'lt',
-    'thou/thee/thy/thine/thyself',
-    'thouands',
-    'thouars',
-    'though&ndash',
-    'though-groups',
-    'though-i-wear-a-dog-collar',
-    'though-the',
-    'though.',
-    'thoughly',
-    'thought&mdash;i&mdash',
-    'thought&mdash;see',
-    'thought\'',
-    'thought-',
     'thought-acts',
-    'thought-content',
-    'thought-crater',
-    'thought-crime',
-    'thought-diary',
-    'thought-experiences',
-    'thought-filled',
-    'thought-i',
-    'thought-lines',
-    'thought-mutterings',
-    'thought-object',
-    'thought-of',
-    'thought-penetration',
-    'thought-rather-than-action',
-    'thought-reader',
-    'thought-stimulating',
     'thought-stream',
-    'thought-symbol',
-    'thought-systems',
-    'thought-to-be',
-    'thought-transference',
-    'thought-transmission',
-    'thought.44',
-    'thought.i',
-    'thought.provoking',
-    'thought/idea/memory',
-    'thought/too',
-    'thoughtaction',
-    'thoughtb',
-    'thoughte',
-    'thoughtes',
-    'thoughtforms',
     'thoughtful-faced',
-    'thoughtfull',
-    'thoughtfully.',
-    'thoughtlifes',
-    'thoughts&mdash;yes',
-    'thoughts/beliefs',
-    'thoughts/the',
-    'thoughts/words/',
-    'thoughtwaves',
-    'thoughtworld',
-    'thouria',
-    'thourians',
-    'thourioi',
-    'thourot',
-    'thousan',
-    'thousan\'',
     'thousand\'',
-    'thousand-acre',
-    'thousand-bedroom',
-    'thousand-candle&rehy;power',
-    'thousand-day',
-    'thousand-legged',
-    'thousand-metre',
-    'thousand-mile-long',
-    'thousand-miles-an-hour',
-    'thousand-odd',
-    'thousand-petalled',
-    'thousand-pound',
-    'thousand-seat',
-    'thousand-seven',
-    'thousand-strong',
-    'thousand-voice',
     'thousand-volume',
-    'thousand-watt',
-    'thousand-year-long',
-    'thousand-years',
-    'thousand/two',
-    'thousander',
-    'thousandsths',
-    'thowghe',
-    'thowz',
-    'thoyras',
-    'thpat',
-    'thquire',
-    'thr\'',
-    'thr12',
-    'thr25\'',
-    'thr41',
     'thr73',
-    'thraceward',
-    'thracia',
-    'thragmipedium',
-    'thrail',
-    'thralled',
-    'thralling',
-    'thran',
-    'thranceastre',
-    'thrandeston',
-    'thranged',
-    'thranging',
-    'thrased',
-    'thrash&rehy;metal',
-    'thrash-lobotomised',
-    'thrash/hardcore',
     'thrashcore',
-    'thrashian',
-    'thrashin\'',
-    'thrashing-drum',
-    'thrashing-ground',
-    'thrashingly',
-    'thrasybulus',
-    'thrave',
-    'thrax',
-    'thre30&mdash',
-    'threa-tened',
-    'thread-bare',
-    'thread-bound',
-    'thread-cutting',
-    'thread-fine',
-    'thread-link',
     'thread-losing',
-    'thread-mill',
-    'thread-safe',
-    'thread-stalked',
-    'thread-veins',
-    'thread-wide',
-    'threadbear',
-    'threaders',
-    'threadgood',
-    'threadwaxing',
-    'threapingham',
-    'threar',
-    'threasure',
-    'threat\'ning',
-    'threat-dangerhero',
-    'threat-dismissal',
     'threat-stare',
-    'threat-that-was',
-    'threat.interestingly',
-    'threat/danger',
-    'threat/neutral',
-    'threatener',
-    'threatening.',
-    'threatful',
-    'threatned',
-    'threatning',
-    'threatnings',
-    'threatre',
-    'threatregoer',
-    'threats.',
-    'threatware',
-    'threbled',
     'three&mdash',
-    'three&mdash;colour',
-    'three&ndash;19',
-    'three&rehy;and-a-half',
-    'three&rehy;bedroomed',
-    'three&rehy;book',
-    'three&rehy;child',
-    'three&rehy;course',
-    'three&rehy;fifteen',
-    'three&rehy;fifths',
-    'three&rehy;finger',
-    'three&rehy;hour',
-    'three&rehy;month-old',
-    'three&rehy;pennyworth',
-    'three&rehy;quarters',
-    'three&rehy;syllable',
     'three&rehy;test',
-    'three&rehy;tiered',
-    'three&rehy;to',
-    'three&rehy;volume',
-    'three(s)',
-    'three-a',
-    'three-a-side',
-    'three-adult',
-    'three-age',
-    'three-album',
-    'three-and',
-    'three-and-a-half-kilometre',
-    'three-and-a-half-thousand',
-    'three-and-a-half-years',
-    'three-and-a-halfoctave',
-    'three-and-a-halfton',
     'three-and-half-years',
-    'three-angled',
-    'three-armed',
-    'three-aside',
-    'three-atom',
-    'three-balls',
-    'three-bayed',
-    'three-bedsit',
-    'three-beta-three-one-double-one-one',
-    'three-block',
-    'three-body',
-    'three-bout',
-    'three-box',
-    'three-burner',
-    'three-bus',
-    'three-bus-an-hour',
     'three-candidate',
-    'three-carbon',
-    'three-cell',
-    'three-centre',
-    'three-centred',
-    'three-chain',
-    'three-channel',
-    'three-chapter',
-    'three-choir',
-    'three-clawed',
-    'three-coach',
-    'three-compartment',
-    'three-component',
-    'three-condition',
-    'three-count',
-    'three-countries',
     'three-crested',
-    'three-crown',
-    'three-cushion',
-    'three-cycle',
-    'three-date',
-    'three-day-eventer',
-    'three-day-one',
-    'three-deep',
-    'three-degrees',
-    'three-dimensionalities',
-    'three-dimensioned',
-    'three-dimensions',
-    'three-disc',
-    'three-division',
-    'three-dog',
-    'three-doors',
     'three-down',
-    'three-drawer',
-    'three-drug',
-    'three-edged',
-    'three-equation',
-    'three-factor',
-    'three-feet',
-    'three-fifth',
-    'three-fin',
-    'three-finger',
-    'three-fish',
-    'three-flights-a-day',
-    'three-foot-wide',
-    'three-footed',
-    'three-footer',
-    'three-for-&pound;1',
     'three-for-one',
-    'three-for-seven',
-    'three-forty',
-    'three-four-five',
-    'three-fours-in-an-over',
-    'three-gluon',
-    'three-goblin',
-    'three-graph',
-    'three-guinea',
-    'three-guitar',
-    'three-halfpence',
-    'three-hander',
-    'three-handicap',
-    'three-handled',
-    'three-horned',
-    'three-hours',
     'three-hours-seeming',
-    'three-hundred-level',
-    'three-hundred-lire',
-    'three-hundred-year',
-    'three-hundredth',
-    'three-in-a-bar',
-    'three-in-the-bed',
-    'three-inch-long',
-    'three-inches',
-    'three-iron',
-    'three-irons',
-    'three-jet',
-    'three-junction',
-    'three-key',
-    'three-kilo',
-    'three-laned',
     'three-lap',
-    'three-lead',
-    'three-leaf',
-    'three-leg',
-    'three-length',
-    'three-liners',
-    'three-love',
-    'three-masters',
-    'three-median',
-    'three-membered',
-    'three-mile-long',
-    'three-mile-radius',
-    'three-million-dollars',
-    'three-million-year',
-    'three-months-long',
-    'three-months-old',
     'three-moon',
-    'three-more',
-    'three-movement',
-    'three-movie',
-    'three-nen',
-    'three-nights-a-week',
-    'three-nineties',
-    'three-octave',
-    'three-one-three',
-    'three-over-two',
-    'three-pack',
-    'three-packs',
-    'three-pair',
-    'three-paragraph',
-    'three-parameter',
-    'three-parter',
     'three-pence',
-    'three-pennyworth',
-    'three-pension',
-    'three-period',
-    'three-petalled',
-    'three-phases-on',
-    'three-piece-suite',
-    'three-pillared',
-    'three-pilot',
-    'three-plank',
-    'three-plus-three',
-    'three-plus-two',
-    'three-point-turn',
-    'three-pounder',
-    'three-print',
-    'three-product',
     'three-putt',
-    'three-quarter-acre',
-    'three-quarter-bed',
-    'three-quarter-mile',
-    'three-quarter-monde',
-    'three-quarter-ton',
-    'three-quarterings',
-    'three-quarters-full',
-    'three-reception',
-    'three-record',
-    'three-region',
-    'three-republic',
-    'three-residue',
-    'three-rig',
-    'three-road',
-    'three-rod',
     'three-schema',
-    'three-school',
-    'three-screen',
-    'three-sectioned',
-    'three-sector',
-    'three-segment',
-    'three-sentence',
-    'three-series',
-    'three-seven',
-    'three-seven-oh',
-    'three-sevenths',
-    'three-seventy-five',
-    'three-shelf',
-    'three-shilling',
-    'three-ship',
-    'three-shire',
     'three-shotters',
-    'three-sixteenths',
-    'three-some',
-    'three-span',
-    'three-spar',
-    'three-sprayed',
-    'three-square-mile',
-    'three-stall',
-    'three-star-quality',
-    'three-state',
-    'three-stem',
-    'three-stoke',
-    'three-stone',
-    'three-storey-high',
-    'three-storied',
-    'three-stringer',
     'three-stripe',
-    'three-striped',
-    'three-strozzi',
-    'three-study-bedroom',
-    'three-systems',
-    'three-tape',
-    'three-task',
-    'three-thousand',
-    'three-threats',
-    'three-three-eight',
-    'three-times-a-day',
-    'three-times-daily',
-    'three-tined',
-    'three-to-five',
-    'three-to-four',
-    'three-to-seven-year',
     'three-tonner',
-    'three-tonners',
-    'three-tracker',
-    'three-train',
-    'three-triangle',
-    'three-trigger',
-    'three-truck',
-    'three-two-one',
-    'three-two-one-five',
-    'three-two-one-rolling&mdash',
-    'three-under-69',
-    'three-unit',
-    'three-upper-part',
-    'three-user',
-    'three-valve-per-cylinder',
-    'three-vaned',
     'three-vector',
-    'three-voiced',
-    'three-wattled',
-    'three-winged',
-    'three-woman',
-    'three-woods',
-    'three-work',
-    'three-year&rehy;old',
-    'three-year-plan',
-    'three-year-posting',
-    'three-year-study',
-    'three-years-old',
-    'three-zone',
-    'three.quarters',
-    'three.stage',
-    'three.year',
     'three.year.',
-    'three/four',
-    'three/two',
-    'threeandshe\'sareal',
-    'threeball',
-    'threechannel',
-    'threeer',
-    'threemile',
-    'threeminute',
-    'threemorbidly',
-    'threeparter',
-    'threepenny-bit',
-    'threepennyworth',
-    'threequarter-line',
-    'threes.',
-    'threescore',
     'threescore-years-and-ten',
-    'threespoked',
-    'threeway',
-    'threipmuir',
-    'threnodic',
-    'threnos',
-    'threo',
-    'threonine-',
-    'threonine-rich',
-    'threse',
-    'threshfield',
-    'threshing-floor',
-    'threshing-ground',
-    'threshings',
-    'threshold\'--a',
-    'thresian',
     'threskiornis',
-    'threskiornithidae',
-    'threts',
-    'thriasian',
-    'thribb',
-    'thribbler',
-    'thribe',
-    'thrice-blessed',
-    'thrice-happy',
-    'thrice-repured',
-    'thrice-risen',
-    'thrice-taken',
-    'thrice-yearly',
-    'thricely',
-    'thridde',
-    'thrievers',
     'thrift-liquidating',
-    'thriftlessly',
-    'thrifts-rescue',
-    'thrill&rehy;hungry',
-    'thrill-a-minute',
-    'thrill-free',
-    'thrill-hungry',
-    'thrill-of-a-lifetime',
-    'thrill-packed',
-    'thrill-seekers',
-    'thriller-style',
-    'thrills\'-type',
-    'thrindon',
-    'thringstone',
-    'thrity-six',
-    'throat&mdash',
     'throat-',
-    'throat-band',
-    'throat-burn',
-    'throat-constricting',
-    'throat-drying',
-    'throat-hold',
-    'throat-rip',
-    'throat-strings',
-    'throat-tearing',
-    'throat-theory',
-    'throat-tightening',
-    'throat-tract',
-    'throat/and',
-    'throat/you',
-    'throatbound',
-    'throatfuls',
     'throaty-cum-husky',
-    'throbbingness',
-    'throge',
-    'thrombasthenia',
-    'thrombasthenic',
-    'thrombin-induced',
-    'thromboangiitis',
-    'thrombocytes',
-    'thrombocytopaenia',
-    'thrombocytopenia.',
-    'thromboemboli',
-    'thrombogenic',
-    'thrombogenicity',
-    'thrombolysis.3',
-    'thrombomodulin',
-    'thrombophlebitis',
     'thromboplastin-like',
-    'thromboprophylaxis',
-    'thromboresistant',
-    'thrombospondin-related',
-    'thromboysis',
-    'thron',
-    'throne&ndash',
-    'throne-name',
-    'throne-room',
-    'throne.124',
-    'throne/',
-    'throneless',
-    'throneships',
-    'throneworthy',
-    'thronus',
-    'throo',
     'throope',
-    'thrope',
-    'throshing',
-    'throsk',
-    'throssel',
-    'throstle',
-    'throston',
-    'throttle-rods',
-    'throttle/rpm',
-    'throttlers',
-    'through&mdash',
-    'through&mdash;the',
-    'through-action',
-    'through-fare',
-    'through-flowing',
-    'through-other',
     'through-rail',
-    'through-rim',
-    'through-rooms',
-    'through-route',
-    'through-stitched',
-    'through-streets',
-    'through-the-body',
-    'through-the-cistern',
-    'through-the-looking-glass',
-    'through-the-wall',
-    'through-the-week',
-    'through-ticketing',
-    'through-tickets',
-    'through-time',
-    'through-view',
-    'through-wall',
     'through.6',
-    'through.which',
-    'through/wedged',
-    'through_as_far_as_erm',
-    'through_in',
-    'througham',
-    'througham/gloucestershire',
-    'throughball',
-    'throughcampbell',
-    'throughfare',
-    'throughoput',
-    'throughout-the-year',
-    'throughtout',
-    'throughut',
-    'throughways',
-    'througout',
     'throw-a-dice-and-take-off-some-clothes',
-    'throw-backable',
-    'throw-fetch',
-    'throw-forward',
-    'throw-it-all-in',
-    'throw-it-all-in-a-pot',
-    'throw-it-away',
-    'throw-offs',
-    'throw-outs',
-    'throw-rugs',
-    'throw-yourself-off',
-    'throw.',
-    'throwdown',
-    'thrower-in',
-    'throwers/',
-    'throwghe',
     'throwing-away',
-    'throwing-billiards',
-    'throwing-in',
-    'throwing-off',
-    'throwing-open',
-    'throwing-up',
-    'throwing.',
-    'thrown-in',
-    'thrown-up',
-    'thrown_out',
-    'throwster',
-    'thrrrrp',
-    'thrrrrrrrrp',
-    'thrty-eight',
-    'thrubwell',
-    'thrumble',
     'thruputs',
-    'thrush-like',
-    'thrush-sized',
-    'thrust-reverse',
-    'thrusted',
-    'thrustingly',
-    'thrutch',
-    'thrutches',
-    'thrutching',
-    'thrutchy',
-    'thruway',
-    'thrydde',
-    'thses',
-    'thsoe',
-    'thtr',
-    'thtwength',
     'thu-sat',
-    'thua',
-    'thuath',
-    'thuch',
-    'thucyd.',
-    'thucydidean',
-    'thud-thud',
-    'thudde',
-    'thuddingly',
-    'thuderbolt',
-    'thuds-off',
-    'thuggee\'',
-    'thuggees',
-    'thuggery.',
-    'thuhool',
-    'thuile',
     'thujone',
-    'thulane',
-    'thulden',
-    'thulium',
-    'thullier',
-    'thumb&rehy;nail',
-    'thumb-',
-    'thumb-cocked',
-    'thumb-knuckle',
-    'thumb-mark',
-    'thumb-marked',
-    'thumb-nails',
-    'thumb-operated',
-    'thumb-picked',
-    'thumb-pluck',
-    'thumb-print',
     'thumb-rest',
-    'thumb-screwing',
-    'thumb-tack',
-    'thumb-typed',
-    'thumb-wind',
-    'thumb/',
-    'thumbball',
-    'thumbcuffs',
-    'thumbnail-size',
-    'thumbnail-sized',
-    'thumbnailing',
-    'thumboo',
-    'thumbpick',
-    'thumbwheel',
-    'thumbwrestling',
-    'thumma',
     'thummim',
-    'thumpers',
-    'thumpings',
-    'thumpity-thump',
-    'thumppp',
-    'thun-konolfingen-luzern',
-    'thunbergia',
-    'thunby',
-    'thundal/swedish',
-    'thunder-and-fire',
-    'thunder-boy',
-    'thunder-clouds',
-    'thunder-flashes',
-    'thunder-god',
-    'thunder-plump',
-    'thunder-shower',
     'thunder-storms',
-    'thunder-struck',
-    'thunder/24',
-    'thunderbasses',
-    'thunderbird-handed',
-    'thunderbirds.',
-    'thundercats',
-    'thunderchief',
-    'thunderchiefs',
-    'thundercrackers',
-    'thunderd',
-    'thunderdent',
-    'thunderdome',
-    'thundereth',
-    'thunderflies',
-    'thunderforce',
     'thunderingly',
-    'thunderites',
-    'thunderousness',
-    'thunderstorm-laden',
-    'thunderstreak',
-    'thunderthighs',
-    'thunderword',
-    'thunen',
-    'thunersee',
-    'thung',
-    'thungon',
-    'thungummy',
-    'thunking',
-    'thunor',
-    'thuns',
-    'thuot',
     'thup',
-    'thupannaka',
-    'thupten',
-    'thur.',
-    'thurant',
-    'thurar-rahulan',
-    'thurberesque',
-    'thurberish',
-    'thurbin',
-    'thurburn',
-    'thurday',
-    'thurday/wednesday',
-    'thurdin',
-    'thurdle',
-    'thurgauerhof',
-    'thurgh',
     'thurgurtoun',
-    'thurham',
-    'thurians',
-    'thurigiensis',
-    'thuring',
-    'thurkleby',
-    'thurleston',
-    'thurley/red',
-    'thurls',
-    'thurlstoners',
-    'thurmair1990',
-    'thurmarsh',
-    'thurmer',
-    'thurmond/clinton',
-    'thurn-taxis',
-    'thurn-valsassina',
     'thurnall',
-    'thurnam',
-    'thurneysen',
-    'thurnscoe',
-    'thurring',
-    'thurry',
-    'thurs&ndash;fri',
-    'thurs&ndash;sun',
-    'thurs-sat.',
-    'thursday-afternoon',
-    'thursday-evening',
-    'thursday/friday',
-    'thursday/wednesday',
-    'thursden',
-    'thursfield',
-    'thursfield/west',
     'thursten',
-    'thurstine',
-    'thursz',
-    'thurulf',
-    'thury',
-    'thus-and-so',
-    'thusand',
-    'thusness',
-    'thust',
-    'thuwaini',
-    'thuwayn',
-    'thuya-wood',
-    'thuyas',
-    'thv',
-    'thw',
-    'thwaites-ee-ee',
     'thwanging',
-    'thwap',
-    'thwe-thauk',
-    'thwenge',
-    'thwitel',
-    'thwok',
-    'thwung',
-    'thx',
-    'thy\'',
-    'thy1',
-    'thyatira',
-    'thye',
-    'thylacines',
-    'thylacinus',
-    'thylacosmilus',
-    'thymallus',
     'thyme-covered',
-    'thymic-derived',
-    'thymidine-labelled',
-    'thymines',
-    'thymus.',
-    'thynidine',
-    'thynkand',
-    'thynke',
-    'thynnes',
-    'thyristors-triacs',
-    'thyristors/triacs',
-    'thyroditis',
-    'thyroid-stimulating',
-    'thyroscin',
-    'thyrotoxically',
-    'thyrotropin-releasing',
     'thyroxine-deficient',
-    'thyrsiflorus',
-    'thysanoptera',
-    'thysanuran',
-    'thyseen',
-    'thysen',
-    'thyssen-bornemisza-habsburg',
-    'thyssen-nordseewerke',
-    'thystere-thicaya',
-    'thyterion',
-    'thyumidine',
-    'ti&eacute;de',
-    'ti-59',
-    'ti-che',
-    'ti-ichomes',
-    'ti-ight',
     'ti-me',
-    'ti-n-terirt',
-    'ti-rpc',
-    'ti-tzu',
-    'ti1ley',
-    'tiaa-cref',
-    'tiahuanuco',
-    'tianda',
-    'tianming',
-    'tianshun',
-    'tianzheng',
-    'tiaoyutai',
-    'tiapkin',
-    'tiarama',
-    'tiary',
-    'tiatelolco',
     'tiatra',
-    'tibaldry',
-    'tibar&emacr;noi',
-    'tibba',
-    'tibbia',
-    'tibbilda',
-    'tibbiwell',
-    'tibbu-ownership',
-    'tibbu-speakers',
-    'tibbutt',
-    'tibenham',
-    'tiber/did',
-    'tiberation',
-    'tiberina',
-    'tiberthwaite',
-    'tibes',
     'tibetan.',
-    'tibetorp',
-    'tibetot',
-    'tibial',
-    'tibington',
-    'tibnin',
-    'tiburon',
-    'tiburtio',
-    'tic-ridden',
-    'tic-tac-toe',
-    'tic-tac-toe/connect',
-    'tic-tic',
-    'tic-toc',
-    'ticc',
-    'ticciati',
-    'tich\'',
     'ticha',
-    'tichenko',
-    'tichter',
-    'ticinesi',
-    'tick\'ed',
-    'tick-associated',
-    'tick-boxes',
-    'tick-list',
-    'tick-off',
-    'tick-tack-toe',
-    'tick-the-box',
-    'tick-ticking',
-    'tick-tocked',
-    'tick-tocking',
-    'tick-tocks',
-    'tick.',
     'tickatickatick',
-    'ticked/updated',
-    'tickenham',
-    'ticker&rehy;off',
-    'tickery',
-    'ticket&mdash;office',
-    'ticket\'',
-    'ticket-',
-    'ticket-barrier',
-    'ticket-chip',
-    'ticket-clipper',
-    'ticket-desk',
-    'ticket-drawer',
-    'ticket-holding',
-    'ticket-issuing',
-    'ticket-machine',
     'ticket-mislayers',
-    'ticket-paying',
-    'ticket-souness',
-    'ticket-stub',
-    'ticket-that',
-    'ticket-window',
-    'ticket.s',
-    'ticket/',
-    'ticket/ash',
-    'ticketofleave',
-    'tickets/sales',
-    'tickets/showcards',
-    'ticketty-boo',
-    'ticketyboo',
-    'tickford',
-    'ticking-lined',
     'ticking-over',
-    'tickledy',
-    'ticklem',
-    'ticklepenny',
-    'tickletoe',
-    'tickley',
-    'tickliness',
-    'ticklishness',
-    'ticksheets',
-    'tickt',
-    'ticktin',
-    'ticky-tacky',
-    'ticondcroga',
-    'ticonderoga',
-    'ticotin',
-    'ticst',
     'tid-bit',
-    'tidalwave',
-    'tidbit',
-    'tidburn',
-    'tidcombe',
-    'tidd',
-    'tiddle-diddle-liddle-liddle',
-    'tiddly&rehy;winks',
-    'tiddly-i-ty',
-    'tiddlywink',
-    'tide-can',
-    'tide-caused',
-    'tide-cracks',
-    'tide-limit',
-    'tide-marked',
-    'tide-marks',
     'tide-people',
-    'tide-rnarked',
-    'tide-surveyor',
-    'tide-tables',
-    'tide-tossed',
-    'tide-water',
-    'tide-way',
-    'tidelines',
-    'tideposts',
-    'tides.jutson',
-    'tidiane',
-    'tidibed',
-    'tidied.',
-    'tidiman',
-    'tidley',
-    'tidman',
     'tidmarsh/gloucestershire',
-    'tidwell',
-    'tidy-i',
-    'tidy-like',
-    'tidy/too',
-    'tidyin\'',
-    'tie&rehy;breakers',
-    'tie-beam',
-    'tie-breaker.',
-    'tie-breakers',
-    'tie-breaking',
-    'tie-breaks',
-    'tie-clips',
-    'tie-cord',
-    'tie-died',
-    'tie-down',
     'tie-downs',
-    'tie-drawer',
-    'tie-hole',
-    'tie-lines',
-    'tie-maker',
-    'tie-pulser',
-    'tie-rack',
-    'tie-rod',
-    'tie-tacks',
-    'tie-tape',
-    'tie-tapes',
-    'tie-tie-italiano',
-    'tie-wearer',
-    'tie-wearers',
-    'tie-wig',
-    'tie-wraps',
     'tie/belt',
-    'tieback',
-    'tiebreakers',
-    'tieck',
-    'tiecoura',
-    'tied-agency',
-    'tied-back',
-    'tied-on',
-    'tiedeman',
-    'tiedemann',
-    'tiedown',
-    'tiefe',
-    'tiefer',
-    'tiefland',
-    'tieghem',
-    'tieko',
     'tielines',
-    'tieman',
-    'tiemann',
-    'tiems',
-    'tien-shan',
-    'tien-tsang',
-    'tienari',
-    'tienda',
-    'tiene',
-    'tieng',
-    'tiennent',
-    'tient',
-    'tiento',
-    'tientsins',
-    'tieoule',
-    'tiepolos',
     'tiercels.',
-    'tiered-support',
-    'tierkopfranke',
-    'tierney/thames',
-    'tierno',
-    'tierrie',
-    'tiers.',
-    'ties-like',
-    'tiesinga',
-    'tiessing',
-    'tiethanolamine',
-    'tietmayer',
-    'tietzes',
-    'tievebulliagh',
-    'tiffany\'s',
-    'tiffany-style',
     'tiffanys',
-    'tiffen',
-    'tiffield',
-    'tiffies',
-    'tiffin-tins',
-    'tig-en-cruig',
-    'tiga.drv',
-    'tiga/dos',
-    'tigani',
-    'tigania',
-    'tigapolu',
-    'tiger-frighteners',
-    'tiger-growl',
-    'tiger-palm',
-    'tiger-rubies',
-    'tiger-rug',
     'tiger-shooting',
-    'tiger-skin',
-    'tiger-skins',
-    'tiger-trap',
-    'tiger.',
-    'tigercats',
-    'tigerfish',
-    'tigerhaven',
-    'tigering',
-    'tigerishly',
-    'tigerman',
-    'tigerrail',
-    'tigers.',
-    'tigerstriping',
-    'tigertailz',
-    'tigerwood',
     'tiggerdine',
-    'tiggies',
-    'tiggwinkle',
-    'tiggwinkles',
-    'tiggywickle',
-    'tigharry',
-    'tighary',
-    'tighes',
-    'tighfield',
-    'tighnabruaich',
-    'tighnacala',
-    'tight&rehy;lipped',
-    'tight&rehy;waisted',
-    'tight-arses',
-    'tight-ass',
-    'tight-assed',
     'tight-bended',
-    'tight-capped',
-    'tight-centre',
-    'tight-closed',
-    'tight-coiled',
-    'tight-coupling',
-    'tight-covered',
-    'tight-cropped',
-    'tight-eyed',
-    'tight-fist',
-    'tight-fitted',
-    'tight-formed',
-    'tight-grained',
-    'tight-held',
-    'tight-lipp&eacute;d',
-    'tight-lips',
     'tight-little',
-    'tight-loose',
-    'tight-radius',
-    'tight-reined',
-    'tight-sealing',
-    'tight-skirted',
-    'tight-smooth',
-    'tight-trousered',
-    'tight-white-collar',
-    'tightarsed',
-    'tighten-up',
-    'tighten.',
-    'tightening-radius',
-    'tighter-fisted',
-    'tightest-ever',
-    'tightframed',
     'tightly&rehy;garrisoned',
-    'tightly-argued',
-    'tightly-capped',
-    'tightly-centralized',
-    'tightly-closed',
-    'tightly-closing',
-    'tightly-constructed',
-    'tightly-curled',
-    'tightly-curved',
-    'tightly-drawn',
-    'tightly-fought',
-    'tightly-furled',
-    'tightly-governed',
-    'tightly-gripped',
-    'tightly-guarded',
-    'tightly-integrated',
     'tightly-knotted',
-    'tightly-laced',
-    'tightly-regulated',
-    'tightly-rolled',
-    'tightly-structured',
-    'tightly-woven',
-    'tightly-wrapped',
-    'tightly-written',
-    'tightrope-walked',
-    'tightrope-walkers',
-    'tightroped',
-    'tightropes',
-    'tights.',
-    'tights/stockings',
-    'tigilinea',
-    'tignet',
     'tigon',
-    'tigor',
-    'tigouga',
-    'tigra',
-    'tigrella',
-    'tigrida',
-    'tigridia',
-    'tigridias',
-    'tigrillo',
-    'tigrinum',
-    'tigron',
-    'tigus',
-    'tigwell/britsh',
-    'tihama',
-    'tihany',
-    'tihar',
     'tihomir',
-    'tiina',
-    'tijdschrift',
-    'tijianiya',
-    'tijou',
-    'tiju',
-    'tijuca',
-    'tijunga',
-    'tik',
-    'tikal',
-    'tikcha',
-    'tike',
-    'tikes',
-    'tikhait',
-    'tikitere',
-    'tikopians',
     'tilade',
-    'tilahu',
-    'tilberthwarte',
-    'tilbian',
-    'tilburn',
-    'tilcon',
-    'tildey',
-    'tile-hanging',
-    'tile-importing',
-    'tile-kilns',
-    'tile-red',
-    'tile/window',
-    'tilea',
-    'tiled-in',
-    'tiled-roofed',
-    'tilehouse',
     'tileries',
-    'tiles-which',
-    'tiles.',
-    'tiletrasher',
-    'tiley',
-    'tilhill',
-    'tiliaceae',
-    'tiling-factory',
-    'till-death-us-do-tedium',
-    'till-holger',
-    'till-snatchers',
-    'till-work',
-    'till/cheque/credit',
-    'tilla',
-    'tillakaratne',
-    'tillam',
     'tillbrook',
-    'tille/and',
-    'tillekaratne',
-    'tillemans',
-    'tiller\'',
-    'tiller-steered',
-    'tiller/planning',
-    'tillering',
-    'tillesworth',
-    'tilleul',
-    'tilleuls',
-    'tilley/forestry',
-    'tilley/wiltshire',
-    'tilleys',
-    'tillichian',
-    'tillierfour',
     'tillings',
-    'tilloch',
-    'tillot&rehy;sons',
-    'tills.',
-    'tillsonburg',
-    'tillyardian',
-    'tillypronie',
-    'tilmann',
-    'tilmanston',
-    'tilmes',
-    'tilmore',
-    'tilne',
-    'tilokaikt',
-    'tilseter',
-    'tilsey',
-    'tilsworth',
     'tilt&rehy;hammers',
-    'tilt\'n\'turn',
-    'tilt-adjustable',
-    'tilt-and-turn',
-    'tilt-back',
-    'tilt-shots',
-    'tilt-top',
-    'tilt-yard',
-    'tilt.',
-    'tilted-squares',
-    'tilter',
-    'tilting-top',
-    'tilturn',
-    'tily',
-    'tim\'rous',
-    'timac',
     'timagoras',
-    'timaios',
-    'timan',
-    'timarchos',
-    'timars',
-    'timballs',
-    'timber-arched',
-    'timber-boarded',
-    'timber-bodied',
-    'timber-buyers',
-    'timber-ceilinged',
-    'timber-clad',
-    'timber-effect',
-    'timber-encrusted',
-    'timber-fronted',
-    'timber-hauling',
     'timber-import',
-    'timber-industry',
-    'timber-look',
-    'timber-processing',
-    'timber-rich',
-    'timber-smells',
-    'timber-textured',
-    'timber-vault',
-    'timber-work',
-    'timber.',
-    'timbercroft',
-    'timbered-covered',
-    'timberlog',
-    'timbermen',
-    'timberscombe',
-    'timbersfield',
     'timbery',
-    'timbet',
-    'timbre-codes',
-    'timbred',
-    'timbrell',
-    'timbrelle',
-    'timchenko',
-    'time&gt;ph',
-    'time&mdash;as',
-    'time&mdash;could',
-    'time&mdash;gave',
-    'time&mdash;i',
-    'time&mdash;it',
-    'time&mdash;papa',
-    'time&mdash;plus',
-    'time&mdash;they',
     'time&mdash;to&mdash;time',
-    'time&mdash;you',
-    'time&rehy;honoured',
-    'time&rehy;lapse',
-    'time&rehy;periods',
-    'time&rehy;resolved',
-    'time&rehy;saving',
-    'time&rehy;server',
-    'time\'\'',
-    'time-accounting',
-    'time-adverbials',
-    'time-allowance',
-    'time-analysis',
-    'time-and-attendance',
-    'time-and-labour-saving',
-    'time-and-material',
     'time-and-space',
-    'time-atoms',
-    'time-awful',
-    'time-balls',
-    'time-band',
-    'time-being',
-    'time-bidingly',
-    'time-budgeting',
-    'time-but',
-    'time-capsule',
-    'time-check',
-    'time-checks',
-    'time-coded',
-    'time-complex',
-    'time-compression',
-    'time-conditions',
     'time-consciousness',
-    'time-consistency',
-    'time-constant',
-    'time-continuum',
-    'time-control',
-    'time-controlled',
-    'time-correlation',
-    'time-cripples',
-    'time-critical',
-    'time-delayed',
-    'time-difference',
-    'time-directed',
-    'time-distortions',
-    'time-division',
-    'time-domain',
-    'time-dulled',
     'time-eaters',
-    'time-efficient',
-    'time-elements',
-    'time-energy',
-    'time-equivalent',
-    'time-even',
-    'time-expensive',
-    'time-exposure',
-    'time-for-a-change',
-    'time-frozen',
-    'time-fused',
-    'time-fuses',
-    'time-geared',
-    'time-gone-by-period',
-    'time-hallowed',
-    'time-he',
     'time-hewn',
-    'time-hon',
-    'time-integrated',
-    'time-intensive',
-    'time-is',
-    'time-it',
-    'time-keeping.',
-    'time-lapsed',
-    'time-lessness',
-    'time-loop',
-    'time-mentality',
-    'time-multiplexed',
-    'time-oblivion',
-    'time-obsessed',
-    'time-of-her',
-    'time-of-the-month',
     'time-old',
-    'time-ordered',
-    'time-oriented',
-    'time-outs',
-    'time-passing',
-    'time-paths',
-    'time-perspectives',
-    'time-phase',
-    'time-pips',
-    'time-place',
-    'time-place-person',
-    'time-plan',
-    'time-point',
-    'time-points',
-    'time-pressure',
-    'time-price',
     'time-process',
-    'time-proportionality',
-    'time-rationing',
-    'time-ravaged',
-    'time-restricted',
-    'time-riven',
-    'time-ruptures',
-    'time-sample',
-    'time-savings',
-    'time-segment',
-    'time-sequencing',
-    'time-server',
-    'time-she',
-    'time-shift',
-    'time-shifted',
-    'time-shifting',
     'time-ship',
-    'time-ships',
-    'time-signal',
-    'time-signals',
-    'time-slip',
-    'time-slots',
-    'time-sociology',
-    'time-sorting',
-    'time-spaces',
-    'time-spot',
-    'time-stamps',
-    'time-standards',
-    'time-step',
-    'time-stopped',
-    'time-structured',
-    'time-study',
     'time-style',
-    'time-switch',
-    'time-tailoring',
-    'time-teller',
-    'time-then',
-    'time-they',
-    'time-to-answer',
-    'time-to-come',
-    'time-to-go',
-    'time-tunnel',
-    'time-variable',
-    'time-wage',
-    'time-warping',
-    'time-warpish',
-    'time-was-past',
-    'time-wasting.',
     'time-wearied',
-    'time-weighted',
-    'time-worker',
-    'time.5',
-    'time.ago',
-    'time.being',
-    'time.between',
-    'time.he',
-    'time.how',
-    'time.immediately',
-    'time.okay',
-    'time.richard',
-    'time.shortly',
-    'time.the',
-    'time.this',
-    'time.varying',
     'time.will',
-    'time/a',
-    'time/doppler',
-    'time/expense',
-    'time/location',
-    'time/more',
-    'time/out',
-    'time/part',
-    'time/task',
-    'time/temperature',
-    'time/travelling',
-    'time/two',
-    'time=17',
-    'time=6',
-    'time=9',
-    'time_as',
     'time_being',
-    'time_no',
-    'time_out',
-    'timebo',
-    'timebombs',
-    'timeburst',
-    'timecharts',
-    'timechenko',
-    'timeclock',
-    'timeconsuming',
-    'timed-out',
-    'timefiller',
-    'timefor',
-    'timeframes',
-    'timehonoured',
-    'timehri',
     'timeing',
-    'timeish',
-    'timelike',
-    'timeouts',
-    'timepac',
-    'timepath',
-    'timepiece.',
-    'timeplace',
-    'timer-counter',
-    'timer-framed',
-    'times&commat;2:10',
-    'times&dollar',
-    'times&rehy;was',
-    'times-\'my',
-    'times-ing',
-    'times-picayune',
     'times-r.i.c.s',
-    'times-reading',
-    'times-side',
-    'times-stock',
-    'times-table',
-    'times-tables',
-    'times-union',
-    'times.relax',
-    'times.then',
-    'times/aer',
-    'times/days',
-    'times/lot',
-    'times/places',
-    'times/riba',
-    'times/riba/business',
-    'times/social',
     'times/week',
-    'times_now',
-    'timescale.',
-    'timeshifts',
-    'timesin',
-    'timespots',
-    'timestamped',
-    'timestep',
-    'timesthe',
-    'timestream',
-    'timeswitches',
-    'timetable&lsqb',
-    'timetable/calendar',
-    'timewell',
-    'timewise',
-    'timid-looking',
     'timidities',
-    'timikata',
-    'timin\'',
-    'timing-cycle',
-    'timing.',
-    'timios',
-    'timisia',
-    'timmel',
-    'timmer',
-    'timmington',
-    'timmins/campaigner',
-    'timmins/daughter',
-    'timmins/mother',
-    'timmins/prison',
-    'timmony',
-    'timmortalshe',
     'timms/former',
-    'timmy-the-dog',
-    'timnus',
-    'timo&scirc;oara',
-    'timocratic',
-    'timofeev',
-    'timofeevich',
-    'timofey',
-    'timofte',
-    'timoken',
-    'timokles',
-    'timokrates',
-    'timole&oacute;n',
-    'timolol',
-    'timon-like',
-    'timosha',
     'timoshenko',
-    'timoteo',
-    'timothee',
-    'timotheos',
-    'timouchoi',
-    'timp-1',
-    'timpanaro',
-    'timpane',
-    'timpany',
-    'timpany/mother',
-    'timpkiss',
-    'timps',
-    'timtum',
-    'timus',
-    'timworth',
-    'tin-',
     'tin-bashers',
-    'tin-coloured',
-    'tin-cupping',
-    'tin-eared',
-    'tin-free',
-    'tin-helmeted',
-    'tin-in-concentrates',
-    'tin-man',
-    'tin-opening',
-    'tin-pan',
-    'tin-prospecting',
-    'tin-roof',
-    'tin-snips',
-    'tin-streaming',
-    'tin-suited',
-    'tin-tacks',
     'tin-teapot',
-    'tin-tungsten',
-    'tin-whistle',
-    'tin-workers',
-    'tin/silver',
-    'tina-marie',
-    'tinaia',
-    'tinamous',
-    'tinari',
-    'tinas',
-    'tinch',
-    'tincommius',
-    'tinctly',
-    'tinctorius',
-    'tindale',
-    'tindburgen',
     'tinder-old',
-    'tinder.',
-    'tindholmur',
-    'tineke',
-    'tinerhir',
-    'tinfoils',
-    'ting-a-ling-a-ling',
-    'ting-ting',
-    'tingaling',
-    'tingay/captain',
-    'tingay/hercules',
-    'tingay/raf',
-    'tinge.',
-    'tingey/farmer',
-    'tingling.',
-    'tinglish',
     'tingmo',
-    'tingrace',
-    'tingry',
-    'tingue',
-    'tingueley',
-    'tinguished',
-    'tingvellir',
-    'tininess',
-    'tiningham',
-    'tinitus',
-    'tinity',
-    'tinken',
-    'tinker-belle',
-    'tinker-looking',
-    'tinker-tailoring',
-    'tinkerbells',
     'tinkertoy',
-    'tinkery',
-    'tinkies',
-    'tinklar',
-    'tinkle-plunk',
-    'tinkler-trained',
-    'tinkundla',
-    'tinmoth',
-    'tinned-food',
-    'tinniness',
-    'tinniney',
-    'tinof',
-    'tinoverman',
-    'tinpane',
-    'tinquawi',
-    'tinryland',
     'tinsdale',
-    'tinsel-hung',
-    'tinselling',
-    'tinselly',
-    'tinsels',
-    'tinsley-dewsnap',
-    'tint-molecules',
-    'tintandu',
-    'tinted-pink',
-    'tintelize',
-    'tinter',
-    'tinters',
-    'tintings',
-    'tintinnabulant',
-    'tintinnabulating',
-    'tintinnabulations',
     'tintinnids',
-    'tintwistle',
-    'tinty',
-    'tinwooey',
-    'tinworks',
-    'tinworth',
-    'tiny-brained',
-    'tiny-exception',
-    'tiny-headed',
-    'tiny-leaved',
-    'tiny-little',
-    'tiny-looking',
-    'tiny-plates',
-    'tiny/inverted/underlined',
-    'tinyefusa',
-    'tinyefuza',
     'tiomanicus',
-    'tiong',
-    'tioown',
-    'tioram',
-    'tiorbe',
-    'tiotidine',
-    'tiough',
-    'tiousso',
-    'tip-e-cat',
-    'tip-holding',
-    'tip-of-the-tongue',
-    'tip-over',
-    'tip-tanks',
-    'tip-to-tip',
-    'tip-trotters',
-    'tip-twitching',
     'tip-upwards',
-    'tiphareth',
-    'tiphys',
-    'tipis',
-    'tiplady/julie',
-    'tipladys',
-    'tiplessness',
-    'tipling',
-    'tipoffs',
-    'tipp-exed',
-    'tippable',
-    'tippacott',
-    'tippe-tops',
-    'tipper-lorry',
-    'tipper/friend',
-    'tipperaray',
     'tipperlinn',
-    'tippett-like',
-    'tippett/widow',
-    'tippex.',
-    'tippy-toe',
-    'tippy/czech',
-    'tipsheets',
-    'tipsiness',
-    'tiptanks',
-    'tipu',
-    'tipula',
-    'tipy',
-    'tipyahlahnah',
-    'tiql',
-    'tiquet',
-    'tir&acirc;z',
     'tir&eacute',
-    'tir&eacute;e',
-    'tir-na-n&oacute;g',
-    'tirading',
-    'tirailleur',
-    'tiranno',
-    'tirano',
-    'tirc',
-    'tired&mdash;the',
-    'tired-',
-    'tired-not',
-    'tired-of-leeds',
-    'tired-sounding',
-    'tiredest',
-    'tiredness-behaviour',
-    'tiredness-syndrome',
     'tirelessness',
-    'tirer',
-    'tireseus',
-    'tiret',
-    'tirez',
-    'tirga',
-    'tirgu-mure&scedil',
-    'tirgu-mures',
-    'tirion',
-    'tirjohn',
-    'tirl',
-    'tirnova',
-    'tirnovo',
-    'tironensians',
-    'tiros-n',
-    'tirpak',
     'tirpit',
-    'tirrick',
-    'tirricks',
-    'tirril',
-    'tirroloni',
-    'tirunelveli',
-    'tischenko',
-    'tise',
-    'tishina',
-    'tishreen',
-    'tishrin',
-    'tisio',
-    'tisiphone',
-    'tiss',
-    'tissaphernes',
-    'tissue-associated',
     'tissue-culture',
-    'tissue-dependent',
-    'tissue-lined',
-    'tissue-off',
-    'tissue-oriented',
-    'tissue-padded',
-    'tissue-papered',
-    'tissue-typeplasminogen',
-    'tissue.',
-    'tissue/cells',
-    'tissuer',
-    'tissuey-textured',
-    'tissulaire',
-    'tissular',
-    'tissumizer',
-    'tista',
     'tistall',
-    'tisted',
-    'tistrum',
-    'tiszanogyores',
-    'tit-licking',
-    'tit-looeet',
-    'titanate',
-    'titancorp',
-    'titangay',
-    'titanica',
-    'titaniferous',
-    'titanium-dioxide',
-    'titanium-sapphire',
-    'titanomachy',
-    'titanomagnetite',
-    'titanomagnetite-enriched',
     'titans.seizing',
-    'titchard',
-    'titchener',
-    'titchmarch',
-    'titcombes',
-    'titer',
-    'titeup',
-    'titfers',
-    'titford.',
-    'titford/carpenter',
-    'tithby',
-    'tithe-payers',
-    'tithe-pig',
-    'tithed',
-    'tither',
-    'titherington/former',
     'titherington/independent',
-    'titherington/member/conservative',
-    'titheyard',
-    'tithonia',
-    'tithraustes',
-    'tithwal',
-    'titia',
-    'titian-haired',
-    'titianesque',
-    'titillatingly',
-    'titillations',
-    'titillator',
-    'titillatory',
-    'titinius',
-    'titisee',
-    'titium',
     'title&rehy;page',
-    'title\'',
-    'title-changes',
-    'title-chasers',
-    'title-clinching',
-    'title-dropping',
-    'title-hungry',
-    'title-mongering',
-    'title-piece',
-    'title-song',
-    'title-story',
-    'title-tattling',
-    'title-track',
-    'title-winning-side',
-    'title-word',
-    'title.alice',
     'title/funder',
-    'title/names',
-    'title/verso',
-    'titlepages',
-    'titlepiece',
-    'titlers',
-    'titles.',
-    'titlets',
-    'titley/herefordshire',
-    'titli',
-    'titman',
-    'titmusses',
-    'titon',
-    'titonus',
-    'titos',
-    'titou',
     'titov',
-    'titova',
-    'titovo',
-    'titrable',
-    'titrators',
-    'titred',
-    'titrimeter',
-    'tits-',
-    'tits-and-ass',
-    'titterstone',
-    'titteya',
-    'tittie',
-    'tittle-tattling',
-    'tittlefield',
-    'tittupped',
-    'titty-bottle',
     'tittymatawta',
-    'titualistic',
-    'tityanova',
-    'tiumen',
-    'tiumpan',
-    'tiuna',
-    'tiutchev',
-    'tiutiunyk',
-    'tiveropolis',
-    'tividale',
-    'tividale.',
-    'tivoli-cin&eacute;ma',
-    'tivoli-style',
-    'tivoli/application',
-    'tivolo',
-    'tivvy',
     'tivy',
-    'tiwag',
-    'tiy',
-    'tiyas',
-    'tiz',
-    'tize',
-    'tizer-sponsored',
-    'tiziatin',
-    'tizwas',
-    'tizziness',
-    'tj&ouml;rnes',
-    'tj&ouml;rnin',
-    'tj138',
-    'tj412',
-    'tja',
-    'tjaden',
     'tjd',
-    'tjedloya',
-    'tjele',
-    'tjf',
-    'tjf-10',
-    'tjf10',
-    'tjinas',
-    'tjitendero',
-    'tjolobal',
-    'tjosvold',
-    'tjuo',
-    'tk-promoter',
-    'tk100',
-    'tkachenko',
-    'tkachev',
-    'tkacz',
     'tkalec',
-    'tkfs',
-    'tkm',
-    'tkvarcheli',
-    'tl&ouml;n',
-    'tl-2',
-    'tl-datable',
-    'tl-sensitive',
-    'tl1',
-    'tl140,366',
-    'tl2,000,000',
-    'tl2,400,000',
-    'tl3800/&pound;1',
-    'tl412,710',
-    'tl63,600,000',
-    'tl67,056',
     'tl73,310',
-    'tl9,400,000',
-    'tlalixcoy&aacute;n',
-    'tlalixcoyan',
-    'tlaloc',
-    'tlatter',
-    'tlc34074',
-    'tlc34075',
-    'tld',
-    'tlec',
-    'tlephone',
-    'tleson',
-    'tlh',
-    'tlian',
-    'tlingit',
-    'tlis',
     'tll',
-    'tlost',
-    'tltis',
-    'tlui',
-    'tlvs',
-    'tlvsn',
-    'tm-12',
-    'tm-15',
-    'tm-8',
-    'tm-sidhi',
-    'tm32010',
-    'tm40',
-    'tm4000',
-    'tm91',
-    'tmbfl',
-    'tmca:na=tmca+0.24(urinary',
     'tmetuchel',
-    'tmf',
-    'tmg',
-    'tmi-2',
-    'tmimi',
-    'tmj',
-    'tmp=d',
-    'tmr',
-    'tms320',
-    'tms32010',
-    'tms320c25',
-    'tms320c40',
-    'tms340',
-    'tms390s10',
-    'tmst',
-    'tmv',
     'tmw',
-    'tn12',
-    'tn16',
-    'tn19',
-    'tn20',
-    'tn21',
-    'tn3',
-    'tn3.1.',
-    'tn3270',
-    'tn33',
-    'tn37',
-    'tn8',
-    'tnbs/e',
-    'tnc-dominated',
-    'tnc-owned',
-    'tnc-the',
     'tnc-woven',
-    'tnr',
-    'tnt-ammonium',
-    'tnt-sponsored',
-    'to&formula;c',
-    'to&iacute;b&iacute;n',
-    'to&mdash;everybody',
-    'to&mdash;facts',
-    'to&mdash;i',
-    'to&mdash;is',
-    'to&ndash',
-    'to\'o',
-    'to(9)',
-    'to-a',
-    'to-air',
-    'to-analogue',
     'to-back',
-    'to-be-avoided',
-    'to-be-created',
-    'to-be-defined',
-    'to-be-looked-at-ness',
-    'to-bloodymorra',
-    'to-die-for',
-    'to-do-list',
-    'to-door',
-    'to-face',
-    'to-fakie',
-    'to-fore',
-    'to-go',
-    'to-hell-with-it',
-    'to-hell-with-them-all',
-    'to-home',
     'to-in',
-    'to-income',
-    'to-justify',
-    'to-keep',
-    'to-less',
-    'to-make',
-    'to-mar',
-    'to-marry',
-    'to-mehu',
-    'to-moche',
-    'to-morrow&mdash',
-    'to-move(d)',
-    'to-name',
-    'to-ness',
-    'to-o-o',
-    'to-one-side',
     'to-read',
-    'to-spit',
-    'to-stoupe',
-    'to-the',
-    'to-the-',
-    'to-the-letter',
-    'to-the-rescue',
-    'to-then',
-    'to-to-to',
-    'to-wards',
-    'to-whit-too-whoo',
-    'to-yards',
-    'to.but',
-    'to.he',
-    'to.kill',
-    'to.lead',
     'to.penetrate',
-    'to.provide',
-    'to.reading',
-    'to.sit',
-    'to.t',
-    'to.the',
-    'to/',
-    'to/accommodated',
-    'to/adapted',
-    'to/amended',
-    'to/in',
-    'to/miscarriages',
-    'to/open',
-    'to/required',
-    'to/secure',
-    'to/shown',
     'to/subservient',
-    'to/to',
-    'to/useful',
-    'to/wed',
-    'to/with',
-    'to1',
-    'to10',
-    'to15',
-    'to17',
-    'to171',
-    'to1840',
-    'to19,000',
-    'to195.6',
-    'to3',
-    'to49',
-    'to_in',
     'to_more',
-    'to_no',
-    'to_one',
-    'to_wit',
-    'toaccept',
-    'toad-badges',
-    'toadal',
-    'toadfish',
-    'toadlets',
-    'toadlike',
-    'toadskin',
-    'toaid',
-    'toan',
-    'toarcian',
-    'toast-and-marmalade',
-    'toast-cinder',
     'toast-making',
-    'toast.',
-    'toastcrumbs',
-    'toaste',
-    'toasted-tea-cake',
-    'toaster-type',
-    'toastie',
-    'toastin\'',
-    'toastiness',
-    'toastmasters',
-    'toasty-warm',
-    'toatsu',
-    'toaustralia',
-    'toba-fushimi',
-    'tobacco-advertising',
-    'tobacco-assisted',
     'tobacco-chewing',
-    'tobacco-drying',
-    'tobacco-free',
-    'tobacco-heavy',
-    'tobacco-spitting',
-    'tobacco-to-jacuzzi',
-    'tobacco-yellowed',
-    'tobaccotin',
-    'tobalaba',
-    'tobbacco',
-    'tobbercurry',
-    'tobbi',
-    'tobby',
-    'tobe',
-    'tobe.',
-    'tober',
     'tobermorite',
-    'tobiano',
-    'tobien',
-    'tobin-markowitz',
-    'tobin/customer',
-    'tobiss',
-    'tobit',
-    'toblerones',
-    'toboganning',
-    'tobolsky',
-    'tobozier',
-    'tobruk-mersa',
-    'tobusiness',
-    'tobybalding',
-    'tobyward',
-    'toc-toc-toc',
     'toccatalike',
-    'toccato',
-    'toccatos',
-    'tochts',
-    'tocius',
-    'tockenham',
-    'tocker',
-    'tockholes',
-    'tocknells',
-    'toco',
-    'tocopherol',
-    'tocopherols',
-    'tocopherols.',
-    'tocquevillian',
-    'tocumen',
-    'toczyska',
     'tod/john',
-    'today&mdash;i',
-    'today&pound;s',
-    'today\'s-instead',
-    'today(thurs)',
-    'today-all',
-    'today-as',
-    'today-sat',
-    'today.c',
-    'today.ep',
-    'today.it',
-    'today.they',
-    'today/13.10.93',
-    'today/22.10.93',
-    'today/28.10.93',
-    'today/cnn/gallup',
     'today/coatbridge',
-    'today/denny',
-    'today/dwh/27/10/93',
-    'today/edinburgh',
-    'today/gallup',
-    'today/gb',
-    'today/glasgow',
-    'today/icm',
-    'today/icr/1.11.93',
-    'today/icr/28.10.93',
-    'today/london',
-    'today/my',
-    'today/only',
-    'today/pearl',
-    'todaym',
-    'todaymon',
     'todayphotograph',
-    'todber',
-    'todd/alastair',
-    'todd/father',
-    'todd/former',
-    'todd/mother',
-    'todd/sands',
-    'toddbrook',
-    'toddler-free',
-    'toddler-proof',
-    'toddler-type',
-    'todedo',
-    'todiaghilev',
-    'todman',
-    'todonai',
-    'todsay',
     'todshill',
-    'toe-capped',
-    'toe-crease',
-    'toe-cruncher',
-    'toe-end',
-    'toe-happy',
-    'toe-hole',
-    'toe-hook',
-    'toe-off',
-    'toe-operated',
-    'toe-plated',
-    'toe-poked',
-    'toe-print',
-    'toe-rings',
-    'toe-spacers',
-    'toe-sucker',
     'toe-suckers.',
-    'toe-tappers',
-    'toe-tappin\'',
-    'toe-tappingly',
-    'toe-touching',
-    'toe-traps',
-    'toecapped',
-    'toecurling',
-    'toed-in',
-    'toed-out',
-    'toed-y-rhiw&rehy;gou',
-    'toedi-mesurado',
-    'toeg',
-    'toeing-off',
-    'toekomsrus',
-    'toensure',
     'toernaes',
-    'toes-es',
-    'toesa',
-    'toesie',
-    'toesillitis',
-    'toey',
-    'tofaeono',
-    'tofalar',
-    'tofayli',
-    'tofday',
-    'tofeili',
-    'toffana',
-    'toffee-',
-    'toffee-applies',
-    'toffee-coloured',
-    'toffee-er',
     'toffee-noses',
-    'toffeeish',
-    'toffler-junkies',
-    'toffolo',
-    'toffrey',
-    'toffy-nosed',
-    'tofik',
-    'tofler',
-    'tog.',
-    'toga-style',
-    'togcs',
-    'together&mdash',
-    'together-',
-    'together-ward',
-    'together.',
-    'together.chris',
     'together.jill',
-    'together.police',
-    'together/not',
-    'together_rather',
-    'togetherwith',
-    'togewer',
-    'togewther',
-    'togged-up',
-    'toggenbergs',
-    'togging',
-    'toggle-switch',
-    'toggle-switches_in_place',
-    'togher',
-    'togidre',
-    'togither',
-    'toglach',
     'togliattigrad',
-    'tognazzi',
-    'togodumnus',
-    'togoimijustice',
-    'togou',
-    'togrday',
-    'togston',
-    'toha',
-    'tohan',
-    'tohara',
-    'tohil',
-    'tohra',
-    'tohsaku',
-    'tohu-bohu',
-    'toi-',
-    'toida',
     'toil-baked',
-    'toil/flexitime',
-    'toilet-bag&mdash;should',
-    'toilet-blocking',
-    'toilet-bucket',
-    'toilet-freshener',
-    'toilet-rolls',
-    'toilet-seats',
-    'toilet-training-indeed',
-    'toilet.',
-    'toilet.ask',
-    'toilet/bathroom',
-    'toiletries/cosmetics',
-    'toiletroll',
-    'toiletry-wise',
-    'toilets/showers',
     'toiletta',
-    'toiletting',
-    'toilettrain',
-    'toilibou',
-    'toim',
-    'toira',
-    'toireasa',
-    'tojudith',
-    'tojuly',
-    'toka',
-    'tokacs',
-    'tokajumi',
-    'tokalon',
-    'tokar',
-    'tokarczuk',
-    'tokarev',
     'tokeep',
-    'tokelauans',
-    'token-reflexivity',
-    'tokened',
-    'tokening',
-    'tokenistically',
-    'tokenizes',
-    'tokenizing',
-    'tokentalk',
-    'tokenyng',
-    'toker',
-    'toking',
-    'tokinoya',
-    'tokiwa',
-    'tokkin',
-    'toko-ru',
     'tokonoma',
-    'tokonye',
-    'tokoza',
-    'toktok',
-    'toku-ru',
-    'tokunaga',
-    'tokuo',
-    'tokyo-baikal',
-    'tokyo-born',
-    'tokyo.similar',
-    'tokyom',
-    'tol\'',
-    'tol\'able',
-    'tolab',
-    'tolagee',
-    'tolagol',
     'tolaini',
-    'tolan/thames',
-    'tolar',
-    'tolbe',
-    'tolberstead',
-    'tolbrook',
-    'tolbuknin',
-    'told-and',
-    'told.lotus',
-    'told.you',
-    'tolds',
-    'tole',
-    'tolerabilty/acceptability',
-    'tolerable-instead',
-    'toleran',
-    'tolerance/level',
     'tolerences',
-    'tolerince',
-    'tolerton',
-    'tolethorpe',
-    'tolfa',
-    'tolfenamic',
-    'toliara',
-    'toliet',
-    'toliman',
-    'tolinas',
-    'toliwaga',
-    'tolkachenko',
-    'tolkatsya',
-    'tolkien-influenced',
-    'tolkiens',
-    'toll-bar',
     'toll-bars',
-    'toll-board',
-    'toll-booths',
-    'toll-call',
-    'toll-charge',
-    'toll-financed',
-    'toll-keeper',
-    'toll-motorway',
-    'toll-paying',
-    'toll-roads',
-    'toll/pilton',
-    'tollaidh',
-    'tollana',
-    'tolland',
-    'tollat',
-    'tollens',
     'tolleranza',
-    'tollersbury',
-    'tollervey',
-    'tolleshund',
-    'tolley/david',
-    'tollies',
-    'tollin',
-    'tollington',
-    'tollison',
-    'tollit',
-    'tollkeepers',
-    'tollund',
-    'tollway',
-    'tolmeia',
-    'tolmer',
-    'tolmides',
     'tolmie',
-    'tology',
-    'tolosa',
-    'tolosanurn',
-    'tolouse',
-    'tolsey',
-    'tolson/british',
-    'tolsta',
-    'tolstoy-disliking',
-    'tolstoy/wife',
-    'tolstoyan',
-    'tolstoys',
-    'toltec',
-    'toltecs',
-    'toluca',
-    'toluene/methanol',
     'tolven',
-    'tolverne',
-    'tolwells',
-    'tolwood',
-    'tolypothrix',
-    'tolzey',
-    'tom&aacute;sovce',
-    'tom&agrave',
-    'tom\'',
-    'tom-boyish',
-    'tom-cat/kitten',
-    'tom-haymarket',
-    'tom-tit',
-    'tom/helper',
-    'tomac',
-    'tomacelli',
     'tomahowk',
-    'tomanaga',
-    'tomany',
-    'tomar',
-    'tomari-te',
-    'tomarlborough',
-    'tomaro',
-    'tomascan',
-    'tomasik',
-    'tomassi',
-    'tomassini',
-    'tomasso',
-    'tomasso/trainer/thames',
-    'tomasson',
-    'tomat',
-    'tomato\'ettes',
     'tomato-based',
-    'tomato-coloured',
-    'tomato-faced',
-    'tomato-ketchup',
-    'tomato-less',
-    'tomato-red',
-    'tomato-rice',
-    'tomatoes/mushrooms',
-    'tomatoey',
-    'tomayto',
-    'tomb-black',
-    'tomb-boards',
-    'tomb-builders',
-    'tomb-chests',
-    'tomb-cutter',
-    'tomb-decoration',
     'tomb-paintings',
-    'tomb-robber',
-    'tomb-robbing',
-    'tomb-slab',
-    'tomb-stone',
-    'tomb-walls',
-    'tomb/of',
-    'tomber',
-    'tombes',
-    'tombleson',
-    'tombol',
-    'tomczak',
-    'tomeh',
-    'tomelty-carnegie',
-    'tomentosum',
-    'tometin',
     'tomfooleries',
-    'tomii',
-    'tominga',
-    'tomini',
-    'tominomori',
-    'tomintoul',
-    'tomis',
-    'tomiyama',
-    'tomlins/grandfather',
-    'tomlins/grandmother',
-    'tomlinson-keasey',
-    'tomlinson/surgery',
-    'tommahawk',
-    'tommahawks',
-    'tommasini',
-    'tommed',
     'tommey',
-    'tomming',
-    'tommorrows',
-    'tommotian',
-    'tommy-gunners',
-    'tommy-sized',
-    'tommys',
-    'tomnadashan',
-    'tomnahurich',
-    'tomograph',
-    'tomohawk',
-    'tomohei',
-    'tomoko',
-    'tomonaga.',
-    'tomonova',
-    'tomoo',
     'tomorah',
-    'tomorite',
-    'tomororrow',
-    'tomorr',
-    'tomorrow&mdash;let',
-    'tomorrow(2)',
-    'tomorrow**',
-    'tomorrow-land',
-    'tomorrow-singer',
-    'tomorrow.',
-    'tomorrow.but',
-    'tomorrow.l',
-    'tomorrow.organiser',
-    'tomorrow.sun',
-    'tomorrow.the',
-    'tomorrowsun',
     'tomorrowwed',
-    'tomos',
-    'tomoyuki',
-    'tompe',
-    'tomplins',
-    'tompsett',
-    'tomrley',
-    'tomsa',
-    'tomson',
-    'tomtits',
-    'tomtom',
-    'tomytime',
-    'ton&eacute',
-    'ton-cups',
-    'ton-kilometre',
-    'ton-miles',
     'tona',
-    'tonal-sounding',
-    'tonalists',
-    'tonalites',
-    'tonalitic',
-    'tonally-challenging',
-    'tonally-related',
-    'toname',
-    'tonami',
-    'tonard',
-    'tonarigumi',
-    'tonbridges',
-    'tonbridgians',
-    'tonder',
-    'tondguyan',
-    'tondino',
     'tondo-picture',
-    'tondut',
-    'tone\'',
-    'tone-\'that',
-    'tone-chemistry',
-    'tone-discouraging',
-    'tone-explorations',
-    'tone-groups',
-    'tone-marks',
-    'tone-modifying',
-    'tone-on-tone',
-    'tone-phones',
-    'tone-producing',
-    'tone-raiser',
-    'tone-scale',
-    'tone-shock',
     'tone-sink',
-    'tone-symbolism',
-    'tone-unit(s)',
-    'tone-ups',
-    'tone.ray',
-    'toned-up',
-    'tonee',
-    'toneful',
-    'tonemes',
-    'tonepoem',
-    'tonerlow',
-    'tonetic',
-    'tonewood',
-    'tonfanau',
-    'tong-a',
-    'tong-bo',
     'tong-pok',
-    'tong-term',
-    'tong.',
-    'tong/british',
-    'tonga-kermadec',
-    'tongas',
-    'tongeren',
-    'tongfei',
-    'tonghak',
-    'tonghua',
-    'tongiavalu',
-    'tongling.',
-    'tongmenghui',
-    'tongres',
-    'tongue&mdash;tied',
-    'tongue-and&rehy;grooved',
     'tongue-and-grooved',
-    'tongue-back',
-    'tongue-depressors',
-    'tongue-frazzling',
-    'tongue-in-the-cheek',
-    'tongue-incheek',
-    'tongue-lash',
-    'tongue-lashings',
-    'tongue-lip',
-    'tongue-poking',
-    'tongue-sandwiches',
-    'tongue-setting',
-    'tongue-slip',
-    'tongue-swelling',
-    'tongue-teasing',
-    'tongue-twisters',
     'tongue-wagging',
-    'tongueland',
-    'tonguewag',
-    'tonic\'',
-    'tonic-clonic',
-    'tonic-submediant',
-    'tonight.see',
-    'tonight.she',
-    'tonight/tomorrow',
-    'tonight:deadlock',
-    'tonight:digging',
-    'tonik',
-    'toniks',
-    'toninelli',
-    'toninia',
-    'tonk&uuml;nstler-societ&auml;t',
     'tonke',
-    'tonkinese',
-    'tonkonow',
-    'tonkses',
-    'tonksing',
-    'tonkunst',
-    'tonmawr',
-    'tonms',
-    'tonn',
-    'tonnay-charente',
-    'tonne-miles',
-    'tonnelets',
-    'tonnelle',
-    'tonnerre',
-    'tonnersjoheden',
-    'tonnes.',
     'tonnes/cm',
-    'tonnes/hectare',
-    'tonnesen',
-    'tonnite',
-    'tonnnage',
-    'tonofibrilla',
-    'tonoight',
-    'tonometer',
-    'tonoplast',
-    'tonoscope',
-    'tonquin',
-    'tonroe',
-    'tonry',
-    'tons/hairdryer/heated',
-    'tonsberg',
-    'tonsil-trembling',
     'tonsilar',
-    'tonsillitis.',
-    'tonsorial',
-    'tonsorially-challenged',
-    'tonsors',
-    'tonsura',
-    'tonteg',
-    'tonto-hairstyled',
-    'tonu',
-    'tonuu',
-    'tony-',
-    'tony-coton-at-man-city-last-august',
-    'tony/former',
-    'tonypandy-based',
-    'tonyrefail',
-    'tonys',
     'too&bsol;few',
-    'too&mdash',
-    'too&ndash',
-    'too&rehy;constantly',
-    'too\'.',
-    'too-',
-    'too-abstract',
-    'too-big',
-    'too-busy',
-    'too-circular',
-    'too-dainty',
-    'too-deep',
-    'too-distant',
-    'too-eager',
-    'too-early',
-    'too-expensive',
     'too-fab-for-words',
-    'too-faithful',
-    'too-far-miles',
-    'too-fast',
-    'too-fat',
-    'too-free',
-    'too-frequently',
-    'too-friendly',
-    'too-gentle',
-    'too-grim',
-    'too-happy',
-    'too-honest',
-    'too-hot',
-    'too-individualistic',
-    'too-it',
-    'too-little-seen',
     'too-long-ignored',
-    'too-long-neglected',
-    'too-low',
-    'too-obtrusive',
-    'too-obvious',
-    'too-pale',
-    'too-penguins',
-    'too-polite',
-    'too-powerful',
-    'too-public',
-    'too-readily',
-    'too-real',
-    'too-recent',
-    'too-rich',
-    'too-sensible-for-his-own-good',
-    'too-shiny',
     'too-similar',
-    'too-slow',
-    'too-small-for-comfort',
-    'too-sober',
-    'too-soft',
-    'too-stiff',
-    'too-strict',
-    'too-strong',
-    'too-subtle',
-    'too-sweet',
-    'too-thorough',
-    'too-ugly',
-    'too-well',
-    'too-well-celebrated',
-    'too-well-informed',
-    'too-wit',
     'too-young',
-    'too.i',
-    'too.thus',
-    'too/',
-    'toobin\'',
-    'tood',
-    'toodaloo',
-    'toodle-pip\'',
-    'toodleoo',
-    'toodlepip',
-    'toodling',
-    'toogether',
-    'toogood/shop',
-    'toohoolhlzote',
-    'took-i',
-    'took-monetary',
     'took-on',
-    'took-up',
-    'tookatookatook',
-    'tookatookatookatookatookatookatook',
-    'tooked',
-    'tooken',
-    'tookover',
-    'tool-belt',
-    'tool-end',
-    'tool-free',
-    'tool-hardening',
-    'tool-house',
-    'tool-like',
-    'tool-maker',
-    'tool-pieces',
-    'tool-roll',
     'tool-shop',
-    'tool-use',
-    'tool-worn',
-    'tool/crimper',
-    'toolan',
-    'tooland',
-    'toolbag',
-    'toolbuilder',
-    'toolbuster',
-    'tooled-up',
-    'toolholder',
-    'toolin',
-    'tooling-up',
-    'toolkit-8in',
-    'toolkit.',
-    'tools&ndash;and',
     'tools-in-hand',
-    'tools-looking',
-    'tools/equipment',
-    'tools/skills',
-    'tooltalk-enabled',
-    'toolwatch',
-    'toolworks',
-    'toomalatai',
-    'toomas',
-    'toombridge',
-    'toome',
-    'toomer',
-    'toon/director',
-    'toon/director/leys',
-    'toon/master',
-    'toonagh',
     'toong',
-    'toony',
-    'tooooo',
-    'toops',
-    'toor',
-    'toorak',
-    'toord',
-    'toorop',
-    'toot-sweet',
-    'tootals',
-    'tooter',
-    'tooth&rehy;ache',
-    'tooth-',
-    'tooth-aching',
-    'tooth-and-socket',
-    'tooth-cavity',
     'tooth-coloured',
-    'tooth-forming',
-    'tooth-grinding',
-    'tooth-marks',
-    'tooth-mug',
-    'tooth-nibble',
-    'tooth-paste',
-    'tooth-plates',
-    'tooth-pullers',
-    'tooth-relic',
-    'tooth-sized',
-    'tooth-spitting',
-    'tooth-white',
-    'tooth/air-gap/stator',
-    'tooth/and',
-    'toothache.',
     'toothaches',
-    'toothbrushes.',
-    'toothcarp',
-    'toothcombs',
-    'toothed-plate',
-    'toothiest',
-    'toothily',
-    'toothing',
-    'toothlessness',
-    'toothline',
-    'toothmugs',
-    'toothpaste/brush',
-    'toothpluckled',
-    'toothpowder',
-    'tootie',
-    'tootsies',
     'toowoos',
-    'top&rehy;class',
-    'top&rehy;four',
-    'top&rehy;grade',
-    'top&rehy;heavy',
-    'top&rehy;notch',
-    'top&rehy;priced',
-    'top&rehy;roped',
-    'top&rehy;secret',
-    'top&rehy;spending',
-    'top&verbar;btm',
-    'top\'s.',
-    'top(ish)',
-    'top(t)',
-    'top-100',
-    'top-100-selling',
     'top-25',
-    'top-5',
-    'top-50',
-    'top-and-tailed',
-    'top-attraction',
-    'top-billing',
-    'top-coating',
-    'top-cross',
-    'top-dog',
-    'top-down/control',
-    'top-dressed',
-    'top-earners',
-    'top-edge',
-    'top-fed',
-    'top-grosser',
-    'top-gun',
     'top-hat-and-tailed',
-    'top-hats',
-    'top-heat',
-    'top-job',
-    'top-left-hand',
-    'top-lighting',
-    'top-lighting.',
-    'top-liner',
-    'top-loading',
-    'top-marker',
-    'top-notcher',
-    'top-notchers',
-    'top-o',
-    'top-of-joist',
-    'top-of-range',
-    'top-of-the-bill',
     'top-of-the-head',
-    'top-of-the-market',
-    'top-of-the-neck',
-    'top-of-the-voice',
-    'top-of-the-world',
-    'top-off-the-brain',
-    'top-opening',
-    'top-page',
-    'top-pit',
-    'top-placed',
-    'top-price',
-    'top-rail',
-    'top-rank',
-    'top-ropes',
-    'top-sand',
-    'top-seller',
     'top-sergeant',
-    'top-shells',
-    'top-shop',
-    'top-speed',
-    'top-spin',
-    'top-spinner',
-    'top-spinning',
-    'top-spot',
-    'top-staying',
-    'top-strength',
-    'top-table',
-    'top-to-',
-    'top-to-bottoms',
-    'top-value',
-    'top-volume',
-    'top.down',
     'topagar',
-    'topal',
-    'topanga',
-    'topaz-bearing',
-    'topchic',
-    'topdown',
-    'topdrawer',
-    'topdressed',
-    'topdressing',
-    'topeca',
-    'topez',
-    'topfler',
-    'topgallants',
-    'tophat',
-    'tophet',
-    'topiaried',
     'topiary-style',
-    'topic\'',
-    'topic-closing',
-    'topic-directional',
-    'topic-initiator',
-    'topic-loan',
-    'topic-neutrally',
-    'topic-plus',
-    'topic-points',
-    'topic-shifting',
-    'topic-specific',
-    'topic-structure',
-    'topic-type',
-    'topic/author',
-    'topic/noun',
-    'topicalisation',
     'topicalise',
-    'topicalities',
-    'topicalized',
-    'topically-named',
-    'topicalstreptokinase',
-    'topick',
-    'topicks',
-    'topics/authors',
-    'topics/issues',
-    'topics/themes',
-    'topin',
-    'topisomerases',
-    'topjet',
-    'topknot-tail',
-    'topkov',
-    'toplady',
     'topler-schlieren',
-    'toplights',
-    'toplit',
-    'toploski',
-    'topmen',
-    'topminnow',
-    'topmix',
-    'topnotch',
-    'topo-',
-    'topoclimatology',
-    'topofunction',
-    'topographical.',
-    'topologically-equivalent',
-    'topolski-itis',
-    'topolski/former',
-    'topometrix',
     'topos/guides',
-    'toposa',
-    'toposcope',
-    'topoy',
-    'toppan',
-    'topped-and-tailed',
-    'topped-up',
-    'topped.',
-    'toppers.',
-    'toppier-sounding',
-    'toppigala',
-    'topple-proof',
-    'toppy',
-    'topr',
-    'topra',
-    'topraisar',
     'topries',
-    'toprope',
-    'tops\'l',
-    'tops\'ls',
-    'tops/cabs',
-    'topscorer',
-    'topselling',
-    'topset',
-    'topsi',
-    'topsider',
-    'topslice',
-    'topsoiled',
-    'topspins',
-    'topster',
-    'topstitcher',
-    'topstitching',
     'topsy-turvey',
-    'topten',
-    'topup',
-    'topweights',
-    'topwith',
-    'toq-toq',
-    'toquinho',
-    'tor-like',
-    'tor-ture',
-    'tor/pym',
-    'torabi',
-    'torada',
-    'torah-in',
-    'torah-observant',
-    'torajans',
-    'toralien',
     'torand',
-    'toranfield',
-    'toranosuke',
-    'torbanite',
-    'torbin',
-    'torbion',
-    'torbrien',
-    'torbryan',
-    'torbsy',
-    'torby',
-    'torch&rehy;beam',
-    'torch-carrying',
-    'torch-hearts',
-    'torch-light',
-    'torch-lights',
-    'torch-on',
     'torch-song',
-    'torch-songs',
-    'torchbeam',
-    'torchbeam-pierced',
-    'torchbearer',
-    'torchie',
-    'torchless',
-    'torchmark',
-    'torchon',
-    'torcoth',
-    'torcuato',
-    'torda',
-    'tordaunt',
-    'tordjo',
-    'tore-apply',
-    'tore-enter',
     'tore-instruct',
-    'toreadors',
-    'torecha',
-    'torenias',
-    'torentanz',
-    'torero',
-    'torf-skeri',
-    'torfason',
-    'torg',
-    'torgellini',
-    'torggate',
-    'torgormack',
-    'torgos',
-    'torgyan-led',
-    'torhouse',
-    'torhtmund',
     'torie',
-    'tories.',
-    'torigian',
-    'torigny',
-    'torill',
-    'torinese',
-    'torion',
-    'torir',
-    'torisholme',
-    'torita',
-    'torkildson',
-    'torloisk',
-    'torlonia',
-    'torlundy',
-    'tormae',
-    'tormain',
     'tormal',
-    'tormek',
-    'torment-wise',
-    'tormenta',
-    'tormentedly',
-    'tormenters',
-    'tormentors.',
-    'tormentosas',
-    'torminalis',
-    'tormisdale',
-    'tormogen',
-    'tormoham',
-    'torn-haired',
-    'torn-open',
-    'tornadic',
-    'tornadoes.',
     'tornaroy',
-    'tornay',
-    'torne',
-    'tornedoes',
-    'tornio',
-    'tornoe',
-    'tornus',
-    'torodov',
-    'toroghu',
-    'torogoces',
-    'toroids',
-    'torola',
-    'torold',
-    'toronay-five',
-    'toroni-vilmouth',
-    'toronto&ndash;kingston',
     'toronto&ndash;london',
-    'toronto&ndash;niagara',
-    'toronto-born',
-    'torontonian',
-    'torontonians',
-    'tororo',
-    'torotel',
-    'torpe',
-    'torpedo-boat',
-    'torpedo-bomber',
-    'torpedo-handling',
-    'torpedo-like',
-    'torpedo-nose',
-    'torpedo-sized',
-    'torpedo-tubes',
-    'torpedos',
     'torphichen',
-    'torpids',
-    'torpo',
-    'torporley',
-    'torquayor',
-    'torque-passing',
-    'torque-rise',
-    'torque-tighten',
-    'torque/current',
-    'torque/inertia',
-    'torque/position/current',
-    'torque/tail',
-    'torquier',
-    'torquilla',
-    'torrabus',
-    'torrance/blackbird',
     'torrances',
-    'torras-owned',
-    'torrebianca',
-    'torrechiara',
-    'torrel',
-    'torrenns',
-    'torrenova',
-    'torrent-beds',
-    'torrenti',
-    'torrero',
-    'torres-garcia',
-    'torresfisheries',
-    'torriani',
-    'torric',
-    'torridly',
-    'torriense',
     'torrigay',
-    'torrigiani',
-    'torrijos-carter',
-    'torrinhas',
-    'torrone',
-    'torryburn',
-    'torschlusspanik',
-    'torsion-bar',
-    'torsk',
-    'torslanda',
-    'torso&rehy;sized',
-    'torstrasse',
-    'torsvale',
-    'torsville',
-    'tortelli',
-    'tortellier',
     'tortellio',
-    'torti',
-    'tortion',
-    'tortional',
-    'tortoise-belly',
-    'tortoise-fancier',
-    'tortoise-like',
-    'tortoise-necked',
-    'tortoise-shell-like',
-    'tortoised',
-    'tortoiseshell-framed',
-    'tortoishell',
-    'tortoising',
-    'torton',
-    'tortona',
-    'tortoni',
     'tortora',
-    'tortorella',
-    'tortosa',
-    'tortossa',
-    'tortugero',
-    'tortuguero',
-    'tortula-grimmia',
-    'tortuosa',
-    'tortuous/scenic',
-    'tortuousness',
-    'tortur',
-    'torturable',
-    'torture-chamber',
-    'torture-chambers',
-    'torture-house',
-    'torture-induced',
     'torturi',
-    'torturings',
-    'torukwon',
-    'torus/ware',
-    'torvil',
-    'tory-',
-    'tory-backing',
-    'tory-blue',
-    'tory-fed',
-    'tory-inclined',
-    'tory-ism',
-    'tory-jacobite',
-    'tory-labour',
-    'tory-liberal',
-    'tory-made',
-    'tory-style',
     'tory-type',
-    'torybimbo',
-    'torydom',
-    'toryglen',
-    'torygragh',
-    'toryspeak',
-    'torzhok',
-    'tosas',
-    'toscaig',
-    'toscani',
-    'toscanini/koussevitsky',
-    'toscanini/rca',
-    'toseland',
-    'toselli',
-    'tosher',
-    'toshida',
     'toshie',
-    'toshimichi',
-    'toshiro',
-    'toshiyasu',
-    'toshiyoki',
-    'tosho',
-    'tosini',
-    'tosio',
-    'tosit',
-    'toslink',
-    'toso',
-    'tosoh',
-    'toss-off',
-    'toss-pot',
-    'toss-pots',
-    'tossed-out',
     'tosseth',
-    'tosspots',
-    'tost',
-    'tostao',
-    'tostones',
-    'tosufloxacin',
-    'tosyl',
-    'tot-she',
-    'totaal',
-    'totacide',
-    'total&mdash',
-    'total-',
-    'total-amputee',
-    'total-football',
-    'total-immersion',
-    'total-intensity',
     'total-stumped',
-    'total-total',
-    'total/fit',
-    'total205',
-    'total23119250',
-    'total9,000',
-    'total=sum',
-    'totaled',
-    'totalised',
-    'totalises',
-    'totalitarian\'',
-    'totallie',
-    'totallin\'',
-    'totally-owned',
-    'totals571017305224',
-    'totaltheater',
     'totara',
-    'totaranui',
-    'totasl',
-    'tote-boxes',
-    'tote-pan',
-    'tote-portland',
-    'totem-father',
-    'totem-pole-like',
-    'totem-poles',
-    'totem-worship',
-    'totemically',
-    'totemistically',
-    'toten',
-    'totev',
-    'totexas',
-    'tothillfields',
     'tothova',
-    'tothrombolytic',
-    'totleben',
-    'totobi',
-    'toton(to)',
-    'totonicapan',
-    'totora',
-    'totowa',
-    'totsikas',
-    'totsuka',
-    'tott\'ring',
-    'tottan',
-    'tottel',
-    'tottenham0',
-    'tottenhan',
-    'totternhoe',
     'tottey',
-    'totting-up',
-    'tottinham',
-    'tottori',
-    'totz',
-    'tou40er',
-    'touareg',
-    'toubert',
-    'toubro',
-    'touch&eacute\'',
-    'touch&rehy;paper',
-    'touch-and-goes',
-    'touch-and-try',
-    'touch-and=try',
-    'touch-dampness',
-    'touch-holes',
     'touch-induced',
-    'touch-of-a-button',
-    'touch-of-the-button',
-    'touch-opening',
-    'touch-operated',
-    'touch-parking',
-    'touch-passing',
-    'touch-ropes',
-    'touch-that',
-    'touch-typist',
-    'touch-ups',
-    'touch-wah',
-    'touch-worn',
-    'touch/feel',
-    'touch:pleas',
-    'touchbank',
     'touchbase',
-    'touche-&agrave;-tout',
-    'touched-down',
-    'touched-her',
-    'touched-up',
-    'touched.',
-    'touches/skill',
-    'toucheth',
-    'touchier',
-    'touchily',
-    'touchingly-willed',
-    'touchjudge',
-    'touchline/crowd',
-    'touchlines',
-    'touchlok',
-    'touchpad',
     'touchpapers',
-    'touchpoint',
-    'touchpool',
-    'touchs',
-    'touchtone',
-    'touchtone/pulse',
-    'touchvision',
-    'touggourt',
-    'tough\'un',
-    'tough-as-nails',
-    'tough-bargaining',
-    'tough-guys',
-    'tough-it-out',
-    'tough-leaved',
-    'tough-mindedness',
-    'tough-speaking',
     'tough-to-prove',
-    'tough-wearing',
-    'toughed',
-    'toughened-up',
-    'tougher-looking',
-    'tougher-minded',
-    'toughest-ever',
-    'toughies',
-    'toughtest',
-    'toughtrack',
-    'touhgest',
-    'touhy',
-    'touiss',
-    'toujour',
-    'toukie',
-    'toulagian',
     'toule',
-    'touloum',
-    'toulousians',
-    'toum',
-    'toumanova',
-    'toumert',
-    'toumi',
-    'tounderline',
-    'touneyadzi',
-    'toungoon',
-    'tounis',
-    'toup&eacute;e-taped',
-    'toupe&eacute',
-    'toupee-cases',
-    'toupee-tricksters',
-    'toupeed',
     'toupin',
-    'touques',
-    'tour\'',
-    'tour(s)',
-    'tour-day',
-    'tour-expired',
-    'tour-gittel-plus-eight',
-    'tour-in',
-    'tour-ists',
-    'tour-nament',
-    'tour-opening',
-    'tour-style',
-    'tour/',
-    'tour/stay',
-    'touracos',
-    'tourah',
     'touralp',
-    'tourama',
-    'tourament',
-    'tourbillons',
-    'tourcoing',
-    'tourelles',
-    'tourettish',
-    'tourha\'',
-    'tourism*',
-    'tourism-based',
-    'tourism-driven',
-    'tourism-oriented',
-    'tourism-related',
-    'tourism.',
-    'tourism/hotel',
-    'tourism/recreational',
     'tourissmo',
-    'tourist-appeal',
-    'tourist-conscious',
-    'tourist-free',
-    'tourist-generating',
-    'tourist-information',
-    'tourist-related',
-    'tourist-ridden',
-    'tourist-shooting',
-    'tourist-style',
-    'tourist-traffic',
-    'tourist-trap',
-    'touristed',
-    'touristically',
-    'touristless',
-    'tourlies',
     'tourmalinisation',
-    'tourn&eacute;e',
-    'tournadre',
-    'tournai.',
-    'tournament-proper',
-    'tournament-winning',
-    'tournament.',
-    'tournant',
-    'tournant&agrave',
-    'tournay',
-    'tourne-pierre',
-    'tourneyed',
-    'tourniayre',
-    'tournmament',
-    'tournod',
-    'tournoi',
     'tournon',
-    'tournus',
-    'tours-en-vimeu',
-    'tours-poitiers',
-    'tourtel',
-    'tourterelles',
-    'tourteron',
-    'tourville-la-riviere',
-    'tous-azimuths',
-    'tousand',
-    'toushe',
-    'tousled-hair',
-    'tousled-headed',
-    'tousled-tressed',
-    'toussus',
-    'touster',
     'touter',
-    'toutle',
-    'touz',
-    'touzels',
-    'tov',
-    'tovalieri',
-    'tovarish',
-    'tovarishch',
-    'tovaritch',
-    'tovdal',
-    'toviere',
-    'tovill',
-    'tow&rehy;rope',
-    'tow-ball',
-    'tow-bar',
-    'tow-barge',
     'tow-bracket',
-    'tow-carbon',
-    'tow-coloured',
-    'tow-headed',
-    'tow-lift',
-    'tow-lifts',
-    'tow-ropes',
-    'tow-trucks',
-    'towans',
-    'towar',
-    'toward&ndash',
-    'towarde',
-    'towardly',
-    'towawa',
-    'towaways',
-    'towback',
     'towbin',
-    'towcar',
-    'towcester/northamptonshire',
-    'towel-',
-    'towel-draped',
-    'towel-drying',
-    'towel-fights',
-    'towel-headed',
-    'towel-heads',
-    'towel-heater',
-    'towel-holders',
-    'towel-off',
-    'towel-rail',
-    'towel-rails',
-    'towelling-look',
-    'towells',
     'tower-8',
-    'tower.',
-    'towerhead',
-    'towerless',
-    'towers/group',
-    'towers/harrison',
-    'towers/resident',
-    'towers/rover',
-    'towes',
-    'towever',
-    'towhshend',
-    'towing-away',
-    'towinnie',
-    'towlines',
-    'towlinson',
-    'town&mdash;first&mdash;because',
     'town&ndash;liverpool',
-    'town\'',
-    'town-',
-    'town-aspiring',
-    'town-child',
-    'town-club',
-    'town-conditions',
-    'town-crier',
-    'town-dumps',
-    'town-dwelling',
-    'town-gate',
-    'town-laying',
-    'town-life',
-    'town-manure',
-    'town-site',
-    'town-type',
     'town-views',
-    'town-village',
-    'town-workers',
-    'town.58',
-    'town.now',
-    'town.why',
-    'town/area',
-    'town/brush',
-    'town/shopping',
-    'townbound',
-    'towners',
-    'townful',
-    'townhill',
-    'townified',
-    'towning',
-    'townish',
     'townlets',
-    'townload',
-    'townparks',
-    'townphotograph',
-    'townplanners',
-    'towns&mdash;prijedor',
-    'towns-folk',
-    'towns-people',
-    'towns.the',
-    'townsend/district',
-    'townsend/fruit',
-    'townsend/headmistress',
-    'townsend/oxford',
-    'townsend/pervaiz',
-    'townsend/stabbing',
-    'townsend/worker',
     'townser',
-    'townser.',
-    'townsley/commandery',
-    'townsley/organiser',
-    'townsleys',
-    'townspace',
-    'townstall',
-    'townstyle',
-    'townswomens',
-    'towntown',
-    'townwomen',
-    'towny',
-    'towpaw',
-    'towplanes',
-    'towre',
-    'towrope.',
     'towry',
-    'towse',
-    'towte',
-    'toxacara',
-    'toxemia',
-    'toxicaria',
-    'toxicologically',
-    'toxicomania',
-    'toxin-contaminated',
-    'toxin-producing',
-    'toxin-users',
-    'toxinc',
-    'toxity',
-    'toxo-captia',
-    'toxodon',
-    'toxophilite',
     'toxophilus',
-    'toxotes',
-    'toy-',
-    'toy-approved',
-    'toy-boys',
-    'toy-car',
-    'toy-filled',
-    'toy-scattered',
-    'toy-soldier',
-    'toy-soldiers',
-    'toy-strewn',
-    'toyakata-kogata',
-    'toyed-around',
-    'toyes',
-    'toyirural',
-    'toyl',
     'toylands',
-    'toyle',
-    'toyme',
-    'toyobo',
-    'toyoharu',
-    'toyohashi',
-    'toyohiro',
-    'toyoki',
-    'toyokura',
-    'toyonian',
-    'toyota-benz',
-    'toyotomi',
-    'toytown.',
-    'tozaj',
-    'tp-thermal',
-    'tp/9',
     'tp/toolkit',
-    'tp276',
-    'tp280/g&ndash;btxe',
-    'tp280/g-btxe',
-    'tp810v',
-    'tpa-induced',
-    'tpa-plasmin',
-    'tpa/gkk',
-    'tpd',
-    'tpha',
-    'tpj',
-    'tpn',
-    'tpo\'mahony',
-    'tpr',
-    'tpt',
-    'tptp',
     'tpus',
-    'tpy',
-    'tpydinqml',
-    'tq5',
-    'tqa',
-    'tqf',
-    'tqm-based',
-    'tqm1',
-    'tqm2',
-    'tr&aacute;s-os-montes',
-    'tr&eacute;mo&icirc;lle',
-    'tr&eacute;port',
-    'tr&eacute;ves',
-    'tr&eacute;viers',
-    'tr&eacute;ville',
-    'tr&ecirc;s',
     'tr&egr;p',
-    'tr&egrave;fle',
-    'tr&oacute;ia',
-    'tr&oacute;ja',
-    'tr&oslash;msdalen',
-    'tr&oslash;ndelagen',
-    'tr&oslash;nderfe',
-    'tr&zcaron;i&ccaron',
-    'tr-1s',
-    'tr1/tr2',
-    'tr10',
-    'tr24',
-    'tr25',
-    'tr6201/4',
-    'tr6202/1',
-    'tr6205/7',
     'tr7',
-    'tr720',
-    'tr9',
-    'tra&icirc;n&eacute;e',
-    'tra&ndash;yth',
-    'tra-la-la',
-    'tra-la-lahing',
-    'tra1',
-    'traack',
-    'traan',
-    'trab',
-    'trabaci',
-    'trabajadores-convenci&oacute',
-    'trabajos',
-    'trabaria',
-    'trabb',
     'trabbie',
-    'trabeation',
-    'trabecca',
-    'trabhakar',
-    'traboulsi',
-    'trabuc',
-    'trabudge',
-    'trabut-cussac',
-    'traccks',
-    'trace\'n\'paper',
-    'trace-element-rich',
-    'trace-elements',
-    'trace-fossil',
-    'trace-ii',
-    'trace-metal',
-    'trace.fossils',
     'trace=1',
-    'trace=2',
-    'traced.',
-    'tracerco',
-    'tracery-like',
-    'traces.',
-    'traceys',
-    'tracheal/caecal',
-    'trachealis',
-    'tracheas',
-    'tracheated',
-    'tracheational',
-    'trachedy',
-    'tracheitis',
-    'tracheliotus',
-    'trachelospermum',
     'tracheobronchial',
-    'tracheolar',
-    'trachodon',
-    'trachonitis',
-    'trachycarpus',
-    'trachytes',
-    'traci',
-    'tracies',
-    'track&rehy;suited',
-    'track(i',
-    'track(s)',
-    'track-bouncing',
-    'track-diagram',
-    'track-driven',
-    'track-hoppers',
-    'track-lighting',
     'track-lines',
-    'track-lit',
-    'track-miles',
-    'track-mischievous',
-    'track-owner',
-    'track-owners',
-    'track-records',
-    'track-running',
-    'track-side',
-    'track-suited',
-    'track-time',
-    'track-while-scan',
-    'track/footpath',
-    'track/jogging',
-    'trackable',
-    'trackdown',
     'tracker-action',
-    'trackies',
-    'tracking/logging',
-    'trackings',
-    'tracklights',
-    'tracklisting',
-    'trackman',
-    'trackmeister',
-    'trackmen',
-    'trackmo',
-    'tracks-and-signs',
-    'tracks-though',
-    'tracks.',
-    'tracksides',
-    'tracksizes',
-    'tracksters',
     'tracksuit-style',
-    'tracomin',
-    'tract.',
-    'tractate',
-    'tractible',
-    'traction-engine',
-    'tractometer',
-    'tractor-beam',
-    'tractor-belt-driven',
-    'tractor-driven',
-    'tractor-driving',
-    'tractor-feed',
-    'tractor-lawnmower',
-    'tractor-load',
-    'tractor-pulling',
-    'tractor-rutted',
     'tractor/machinery',
-    'tractor/taxi',
-    'tractored',
-    'tractus',
-    'tracy\'d',
-    'tracy-jo',
-    'trad/rap',
-    'tradability',
-    'tradables',
-    'tradate',
-    'tradbudge',
-    'tradcoms',
-    'traddies',
-    'traddles',
-    'trade&mdash',
-    'trade&mdash;and',
     'trade&rehy;the',
-    'trade&rehy;weighted',
-    'trade-conscious',
-    'trade-fallen',
-    'trade-finance',
-    'trade-goods',
-    'trade-in-discount',
-    'trade-ins',
-    'trade-liberalisation',
-    'trade-name',
-    'trade-off-',
-    'trade-oriented',
-    'trade-replacing',
-    'trade-reported',
-    'trade-retaliation',
-    'trade-source',
     'trade-store',
-    'trade-union-sponsored',
-    'trade-unions',
-    'trade.58',
-    'trade.this',
-    'trade.tribesmen',
-    'trade/profession',
-    'trade/transit',
-    'tradeability',
-    'traded&mdash;is',
-    'traded-goods',
-    'traded-in',
-    'tradenamed',
-    'tradenames',
-    'tradents',
-    'trader-in-chief',
     'traders/sellers',
-    'traderships',
-    'trades-coal',
-    'trades-council-based',
-    'trades.',
-    'tradesmanship',
-    'tradespark',
-    'tradeston',
-    'tradeswomen',
-    'tradeup',
-    'tradewise',
-    'tradezines',
-    'tradi&rehy;tionally',
-    'tradici&oacute;n',
-    'tradiderunt',
-    'trading-fund',
     'trading-manufacturing',
-    'trading-peace',
-    'trading-posts',
-    'trading-up',
-    'trading/clearing',
-    'trading/service',
-    'tradings',
-    'tradionelle',
-    'tradistiunta',
-    'traditio',
-    'tradition-based',
-    'tradition-conscious',
-    'tradition-laden',
-    'traditional-shaped',
-    'traditional/conventional',
-    'traditionalistic',
     'traditionally-designed',
-    'traditionally-english',
-    'traditionally-patterned',
-    'traditionally-pointed',
-    'traditionally-run',
-    'traditionally-shaped',
-    'traditionally-situated',
-    'traditionals',
-    'traditionary',
-    'traditionelle',
-    'traditious',
-    'tradito',
-    'traditonal',
-    'traditonalists',
-    'traditonally',
-    'tradtional',
     'traducer',
-    'traducers',
-    'traducing',
-    'traethodydd',
-    'traff',
-    'traffic&rehy;stopper',
-    'traffic-affecting',
-    'traffic-bearing',
-    'traffic-bound',
-    'traffic-filled',
-    'traffic-flow',
-    'traffic-grimed',
-    'traffic-hells',
-    'traffic-induced',
-    'traffic-islands',
-    'traffic-laden',
     'traffic-logged',
-    'traffic-offenders',
-    'traffic-restrained',
-    'traffic-scheme',
-    'traffic-signal',
-    'traffic-slowing',
-    'traffic-warden',
-    'traffic.36',
-    'traffic/liveability',
-    'traffick',
-    'trafficless',
-    'trafficmaster',
-    'traffico',
-    'traffik',
-    'trafford-bound',
-    'trafford.fergie',
     'trafford/patient',
-    'trafice',
-    'tragara',
-    'tragedia',
-    'tragedie',
-    'tragedy\'',
-    'tragedy-centred',
-    'tragedy-haunted',
-    'tragedy-queen',
-    'tragedy.calls',
-    'tragedy/impairment/',
-    'tragetted',
-    'traggoon',
-    'traghetto',
-    'traghettos',
-    'tragi&rehy',
     'tragi-comedies',
-    'tragi-romantic',
-    'tragic-comedy',
-    'tragic-comic',
-    'tragically-curtailed',
-    'tragicomedia',
-    'tragicomedy',
-    'tragicomical',
-    'trahie',
-    'trahison',
-    'traian',
-    'traicte',
-    'traid',
-    'trail&rehy;blazing',
-    'trail\'',
-    'trail-barrow',
     'trail-blazers',
-    'trail-boss',
-    'trail-markers',
-    'trailbaston',
-    'trailblazed',
-    'trailblazes',
-    'trailer\'',
-    'trailer-blazer',
-    'trailer-hauling',
-    'trailer-wise',
-    'trailer.',
-    'trailertrain',
-    'trailing-edges',
-    'trailing/consequence',
-    'traill',
-    'trails*',
     'trailtrow',
-    'train&rehy;crews',
-    'train&rehy;spotting',
-    'train-animal',
-    'train-announcing',
-    'train-be',
-    'train-bearers',
-    'train-board',
-    'train-borne',
-    'train-buffs',
-    'train-carriage',
-    'train-crew',
-    'train-daft',
-    'train-detector',
-    'train-lighting',
-    'train-loads',
     'train-loco',
-    'train-loving',
-    'train-mad',
-    'train-miles',
-    'train-obsessed',
-    'train-operating',
-    'train-protection',
-    'train-ride',
-    'train-robbing',
-    'train-sets',
-    'train-spotterish',
-    'train-stop',
-    'train-supposedly',
-    'train-timetables',
-    'train-tour',
-    'train-tubes',
     'train.at',
-    'train/bus',
-    'train/ferry/train',
-    'train/he',
-    'train/with',
-    'traina',
-    'trainant',
-    'trainbearer',
-    'traine',
-    'trained-in',
-    'trained-up',
-    'trained/paid/',
-    'trainee-computer',
-    'trainee-teachers',
-    'trainee-trainer',
-    'trainee-trainers',
     'trainee/one',
-    'trainer-clad',
-    'trainer-fighters',
-    'trainer-jockey',
-    'trainer-manager',
-    'trainer/owner',
-    'trainer/participant',
-    'trainer/rider',
-    'trainer/tourer',
-    'trainer/tutors',
-    'trainers/assessors',
-    'trainers/facilitators',
-    'trainful',
-    'training&mdash;a',
-    'training-',
-    'training-board',
     'training-camp',
-    'training-courses',
-    'training-of',
-    'training-oriented',
-    'training-records',
-    'training-scheme',
-    'training-shoes',
-    'training-the',
-    'training-therapist',
-    'training.colleges',
-    'training/assertive',
-    'training/development',
-    'training/development/personnel',
-    'training/educational',
-    'training/employability',
-    'training/familiarisation',
     'training/learning',
-    'training/professional',
-    'training/recreation',
-    'training/retraining',
-    'training/staff/development/research',
-    'training:4',
-    'training_and',
-    'training_at',
-    'training_in',
-    'traininng',
-    'trainmakers',
-    'trains-cars-aeroplanes',
-    'trains.',
-    'trainset',
-    'trainshed',
-    'trainspotniks',
     'trainspotterism',
-    'traintime',
-    'trainy',
-    'traipses',
-    'traipsin\'',
-    'traist',
-    'trait&eacute;-contrat',
-    'trait&eacute;es',
-    'trait/characteristic',
-    'traiterous',
-    'traites',
-    'traitoresses',
-    'traitz',
-    'traivellers',
-    'trakehner',
-    'traktoreksport',
     'tral',
-    'trala',
-    'tralatitious',
-    'tralhaut',
-    'trallwyn',
-    'tralos',
-    'tram-conductress',
-    'tram-duty',
-    'tram-like-a-train',
-    'tram-lines',
-    'tram-makers',
-    'tram-only',
-    'tram-ride',
-    'tram-riding',
-    'tram-stop',
-    'tram-ttm',
     'tram-ways',
-    'tram/train',
-    'tramdrivers',
-    'trameleuc',
-    'tramen',
-    'trameza&iuml;gues',
-    'tramezzini',
-    'traminer',
-    'trammed',
-    'trammellings',
-    'tramore',
-    'tramp-art',
-    'trampdom',
-    'trampe',
-    'tramped-on',
-    'trampess',
     'tramplike',
-    'trampo',
-    'trampoline-cover',
-    'trampolined',
-    'trampor',
-    'tramshed',
-    'tramsheds',
-    'tramtrack',
-    'tramway.',
-    'tramwayman',
-    'tran-',
-    'tran-european',
-    'tran-sport',
-    'trance-channelling',
-    'trance-inducing',
-    'trance-national',
     'trance-out',
-    'trance.',
-    'tranceland',
-    'trancendental',
-    'trancentental',
-    'tranceporter',
-    'tranches.',
-    'tranchet',
-    'tranchette',
-    'trancik',
-    'tranducers',
-    'trane',
-    'tranfer',
-    'trang',
-    'trangenic',
-    'trango',
     'trangression',
-    'traning',
-    'trankell',
-    'trankle',
-    'trannes',
-    'trannie',
-    'tranport',
-    'tranq',
-    'tranquility-seekers',
-    'tranquille',
-    'tranquillisation',
-    'tranquilliser-addicted',
-    'tranquils',
-    'trans&rehy',
-    'trans&rehy;continental',
-    'trans&rehy;european',
     'trans&rehy;formation',
-    'trans&rehy;historically',
-    'trans&rehy;judaic',
-    'trans&rehy;mitters',
-    'trans&rehy;parency',
-    'trans&rehy;pose',
-    'trans-activate',
-    'trans-aegean',
-    'trans-africa',
-    'trans-alaskan',
-    'trans-asian',
-    'trans-australia',
-    'trans-avant-garde',
-    'trans-baikal',
-    'trans-canada',
-    'trans-caucasian',
     'trans-contextualization',
-    'trans-cutaneous',
-    'trans-denominational',
-    'trans-dihydrodiols',
-    'trans-dominant',
-    'trans-double',
-    'trans-en-provence',
-    'trans-enterprise',
-    'trans-field',
-    'trans-form',
-    'trans-formation',
-    'trans-globally',
-    'trans-himalayan',
-    'trans-isomerism',
-    'trans-isthmian',
-    'trans-migration',
     'trans-mongolian',
-    'trans-nationwide',
-    'trans-oxianan',
-    'trans-personal',
-    'trans-phonemic',
-    'trans-poly(1,3-butadiene)',
-    'trans-polyisoprene',
-    'trans-provincial',
-    'trans-racially',
-    'trans-regional',
-    'trans-scabon',
-    'trans-shed',
-    'trans-situational',
-    'trans-soviet',
-    'trans-spliced',
-    'trans-stellar',
     'trans-tasmanian',
-    'trans-tokyo',
-    'trans-world',
-    'transaccion',
-    'transaction&mdash;which',
-    'transaction\'',
-    'transaction-',
-    'transaction-by-transaction',
-    'transaction-hungry',
-    'transaction-level',
-    'transaction-secret',
-    'transaction-to-transaction',
-    'transaction.',
-    'transactionalists',
-    'transactions&mdash;the',
-    'transactions/settlements',
     'transactivating',
-    'transactor',
-    'transacts',
-    'transadeuche',
-    'transalls',
-    'transalted',
-    'transam',
-    'transamerica',
-    'transanal',
-    'transarch',
-    'transarctic',
-    'transat',
-    'transations',
-    'transatlantic/europe',
-    'transavia',
-    'transaxle',
     'transbronchial',
-    'transcaspia',
-    'transceivered',
-    'transcendence-as-surplus',
-    'transcendentalism',
-    'transcendentality',
-    'transcendential',
-    'transcervical',
-    'transcininase',
-    'transciption',
-    'transcoded',
-    'transcommunications',
-    'transconjugation',
-    'transcript.',
-    'transcript/srrna',
-    'transcription-amplification',
     'transcription/translation',
-    'transcytosed',
-    'transdnestr',
-    'transdominant',
-    'transduce',
-    'transduces',
-    'transducin',
-    'transearch',
-    'transecting',
-    'transection/resuture',
-    'transections',
-    'transen-dentals',
-    'transendoscopic',
-    'transendothelial',
-    'transens',
-    'transential',
     'transept-',
-    'transethnic',
-    'transexuality',
-    'transexuals-three',
-    'transfectam',
-    'transfection.',
-    'transfemoral',
-    'transfer&mdash;20',
-    'transfer&mdash;schedule',
-    'transfer(s)',
-    'transfer-print',
-    'transfer-printed',
-    'transfer-seeking',
-    'transfer-to',
-    'transfer/lease',
-    'transfer/redeployment',
     'transferee\'',
-    'transference/counter',
-    'transfererd',
-    'transferor-assignor',
-    'transferor/transferee',
-    'transferred=',
-    'transferrins',
-    'transfigure',
-    'transfigurer',
-    'transfill',
-    'transfini',
-    'transfinite',
-    'transfiniten',
-    'transfixedly',
-    'transforma&rehy;tion',
-    'transformable',
     'transformation-focus',
-    'transformation-generative',
-    'transformation.',
-    'transformational/generative',
-    'transformationalist',
-    'transformer-coupled',
-    'transformer/adaptor',
-    'transformer/rectifier',
-    'transformerless',
-    'transformist',
-    'transforrning',
-    'transgene.',
-    'transgenerational',
-    'transglobal',
-    'transglobally',
-    'transglobe',
     'transgresseth',
-    'transgression/containment',
-    'transgressions.',
-    'transhepatically',
-    'transhipments',
-    'transhuman',
-    'transhumanity',
-    'transhumante',
-    'transi-lion',
-    'transi-plaza-the',
-    'transilluminated',
-    'transilvano',
-    'transistor-powered',
-    'transistors/heatsinks',
-    'transit-load',
-    'transit-taking',
     'transit-time',
-    'transit-tube',
-    'transite',
-    'transited',
-    'transition-metal',
-    'transition-metaphors',
-    'transition-stage',
-    'transition-state',
-    'transitionals',
-    'transitive/intransitive',
-    'transitivity-and',
-    'transitorily',
-    'transitray',
-    'transitted',
-    'transitting',
-    'transjordanians',
     'transjugaulr',
-    'transjungle',
-    'transkeian',
-    'translacions',
-    'translaters',
-    'translatese',
-    'translations/interpreting',
-    'translatory',
-    'translatum',
-    'translinear',
-    'transliterate',
-    'translocators',
-    'translucencies',
-    'transmedian',
-    'transmediterranean',
-    'transmetallation',
     'transmigrate',
-    'transmigrated',
-    'transministry',
-    'transmis&rehy;sion',
-    'transmiss&rehy;ion',
-    'transmissable',
-    'transmission-like',
-    'transmission-type',
-    'transmissionretrytimeout=45',
-    'transmissively',
-    'transmissivities',
-    'transmit/receive',
-    'transmitted-light',
-    'transmitted-reflected',
-    'transmitter-cum-microphone-cum-hologram',
-    'transmitter-receiver',
     'transmitter-receptor',
-    'transmitttance',
-    'transmobile',
-    'transmogrify',
-    'transmore',
-    'transmucosal',
-    'transmusicales',
-    'transnet',
-    'transneuronally',
-    'transoesophageal',
-    'transom-sterned',
-    'transomes',
-    'transoxania',
-    'transoxianan',
-    'transoxides',
-    'transpalene',
     'transpanama',
-    'transparents',
-    'transparenty',
-    'transperitoneally',
-    'transpersonalize',
-    'transphase',
-    'transpierced',
-    'transpired.',
-    'transpiring',
-    'transplacental',
-    'transplantion',
-    'transplants.in',
-    'transponding',
-    'transporation',
-    'transport&ndash\'',
-    'transport**',
     'transport-aircraft',
-    'transport-backed',
-    'transport-services',
-    'transport-technology',
-    'transport-traffic',
-    'transport/conveyance',
-    'transport/land',
-    'transportants',
-    'transportedly',
-    'transportees',
-    'transporter-mediated',
-    'transporteven',
-    'transportive',
-    'transportnode',
-    'transposase',
-    'transposer',
     'transposon-like',
-    'transpotech',
-    'transpressive',
-    'transpschycosis',
-    'transradio',
-    'transreflective',
-    'transregional',
-    'transrhenani',
-    'transripts',
-    'transsexual/transvestite',
-    'transsib&eacute;rien',
-    'transsiberia',
-    'transsplicing',
-    'transtab',
-    'transtelephonic',
-    'transtension',
     'transtensional',
-    'transthoracic',
-    'transtubation',
-    'transudate',
-    'transudates',
-    'transudation',
-    'transulucent',
-    'transurethral',
-    'transvaals',
-    'transvaginal',
-    'transvaginally',
-    'transvalues',
-    'transve',
-    'transvenous',
-    'transvenously',
-    'transversality',
     'transverse-leaf',
-    'transy',
-    'transylvanis',
-    'transyt',
-    'trantelle',
-    'tranter/transport',
-    'tranto',
-    'trants',
-    'tranzair',
-    'tranzophobic',
-    'trap&mdash;but',
-    'trap-breaching',
-    'trap-doors',
-    'trap-maker',
-    'trap-nesting',
-    'trap/catalyst',
     'trapesing',
-    'trapezium-first',
-    'trapezoids',
-    'trapezuntine',
-    'trapley',
-    'traplines',
-    'trappability',
-    'trappable',
-    'trappatoni',
-    'trappe',
-    'trappists',
-    'trappitt',
-    'trapps',
-    'trappy',
-    'traps.',
-    'traquandi',
     'trarza',
-    'traschen',
-    'trash-cans',
-    'trash-collecting',
-    'trash-filled',
-    'trash-heap',
-    'trash-strewn',
-    'trash.',
-    'trash/sleaze',
-    'trashings',
-    'trashmen',
-    'trasimene',
-    'traskites',
-    'traslated',
-    'trasler',
-    'trasmission',
     'trasna',
-    'trasnfer',
-    'trassi',
-    'tratado',
-    'tratados',
-    'trate',
-    'trathan',
-    'trattato',
-    'tratzberg',
-    'trauaile',
-    'traublingerhof',
-    'trauchle',
-    'trauergondel',
-    'trauermarsch',
-    'trauermusik',
-    'trauerspiel',
     'traum',
-    'trauma-free',
-    'trauma-ridden',
-    'trauma.',
-    'trauma/deprivation',
-    'trauma/nervous',
-    'traumagenic',
-    'traumatizes',
-    'traumatologist',
-    'traume',
-    'traumenden',
-    'traumerei',
-    'traums',
-    'traurig',
-    'trautman',
-    'trav&rehy;elling',
     'travail.',
-    'travailen',
-    'travaileur',
-    'travaille',
-    'travailler',
-    'travailleur',
-    'travaillistes',
-    'travana',
-    'travanca',
-    'travancore-cochin',
-    'travanti',
-    'travassos',
-    'trave-massuyes',
-    'traveeling',
-    'travel&rehy;stained',
-    'travel-',
     'travel-ad',
-    'travel-agency',
-    'travel-agents',
-    'travel-bag',
-    'travel-books',
-    'travel-brochure',
-    'travel-cam',
-    'travel-document',
-    'travel-expense',
-    'travel-folder',
-    'travel-friendly',
-    'travel-guide',
-    'travel-hungry',
-    'travel-loving',
-    'travel-on-the-cheap',
-    'travel-operator',
     'travel-sharing',
-    'travel-sick',
-    'travel-speak',
-    'travel-story',
-    'travel-they',
-    'travel-writers',
-    'travel/',
-    'travel/communication',
-    'travel/holiday',
-    'travel/resources',
-    'travel/subsistence',
-    'travelair',
-    'travelbag',
-    'travelforce',
-    'travelguard',
-    'traveller-ethnographers',
     'traveller-gypsies',
-    'traveller-told',
-    'traveller/gipsy',
-    'traveller/narrator/reader',
-    'travellers.',
-    'travellers.landowners',
-    'travellers.villagers',
-    'travelling-bag',
-    'travelling-carriage',
-    'travelling-rug',
-    'travelling/bridge-playing/',
-    'travelling/teaching',
-    'travellors',
-    'travelodge-to-posthouse',
-    'travels&mdash;tourist',
-    'travelsand',
     'travelwise',
-    'travelwright',
-    'travenol',
-    'traver',
-    'traversa',
-    'traversez',
-    'traversi&egrave;re',
-    'traverso',
-    'travertina',
-    'travertine-marble',
-    'travesti',
-    'travestied',
-    'travis-based',
-    'travis/disc',
-    'travisher',
-    'travllers',
     'travolator',
-    'travolta-style',
-    'travolta/',
-    'travunija',
-    'travyth',
-    'trawan',
-    'trawler-owners',
-    'trawler-owning',
-    'traxit',
-    'traxler',
-    'tray-bake',
-    'tray-load',
-    'traycloth',
-    'trayfuls',
-    'trayhorne',
-    'trayler',
     'trayload',
-    'trayloads',
-    'trayner',
-    'traynor/scottish',
-    'traywasher',
-    'traywashing',
-    'trazlor',
-    'trba',
-    'trbutaline',
-    'trc15',
-    'trd',
-    'tre\'r',
-    'tre-nails',
-    'treacey',
-    'treachers',
-    'treacle-brown',
     'treacle-dark',
-    'treacle-like',
-    'tread-impact',
-    'treadcole',
-    'treaddur',
-    'treader',
-    'treadeth',
-    'treading-in',
-    'treadle-powered',
-    'treadles',
-    'treadless',
-    'treadling',
-    'treadmaster',
-    'treadwheel',
-    'treagus',
-    'treak',
     'trealaw',
-    'treamtent',
-    'treamtnettreatment',
-    'treas',
-    'trease',
-    'treason-until',
-    'treason.l&ndash',
-    'treasurably',
-    'treasure-box',
-    'treasure-hoard',
-    'treasure-hunter',
-    'treasure-seeker',
-    'treasure-seeking',
-    'treasure-troving',
-    'treasure/',
-    'treasurehouse',
     'treasurer-at-wars',
-    'treasurer-secretary',
-    'treasurers-at-war',
-    'treasurerships',
-    'treasureship',
-    'treasury&mdash;w',
-    'treasury-bond',
-    'treasury-financed',
-    'treasury-held',
-    'treasury/',
-    'treasury/cabinet',
-    'treat&lsqb;s&rsqb',
-    'treated_as',
-    'treatedwith',
-    'treatement',
-    'treaties&mdash;for',
     'treaties-for',
-    'treatment\'',
-    'treatment-especially',
-    'treatment-rooms',
-    'treatment-time',
-    'treatment.and',
-    'treatment/curricular',
-    'treatment/damp',
-    'treatment/drugs',
-    'treatment/intervention',
-    'treatmentin',
-    'treatmnent',
-    'treaty\'',
-    'treaty-',
-    'treaty-aircraft',
-    'treaty-limited',
     'treaty-obligation',
-    'treaty-revising',
-    'treaty.339',
-    'treaty/libations',
-    'treaty358',
-    'treatyse',
-    'treaure',
-    'treaury',
-    'treausres',
-    'trebarwith',
-    'trebawith',
-    'trebbiano',
-    'trebbiatura',
-    'treberfydd',
-    'trebilcock/probation',
-    'trebilcot',
     'treble-boost',
-    'treble-chance',
-    'treble-clef',
-    'treble-heavy',
-    'treble-violl',
-    'treble-winning',
-    'treble/bass',
-    'trebliness',
-    'trebonius',
-    'treborth',
-    'trecadifor',
-    'trecarrel',
-    'trecherie',
-    'trecherous',
-    'trecker',
-    'treckers',
     'trecking',
-    'trecwn',
-    'trecynon',
-    'tredegar-born',
-    'tredenham',
-    'tredget',
-    'tredinnock',
-    'tredisgn',
-    'tredworth/gloucester',
-    'tredy',
-    'tree&lsqb;s&rsqb',
-    'tree\'/',
-    'tree(s)',
-    'tree-',
-    'tree-and-shrub',
-    'tree-boa',
     'tree-column',
-    'tree-conversation',
-    'tree-crowned',
-    'tree-crowns',
-    'tree-cutting',
-    'tree-cyling',
-    'tree-decked',
-    'tree-diagram',
-    'tree-dotted',
-    'tree-dwarf',
-    'tree-fellers',
-    'tree-ferns',
-    'tree-flattening',
-    'tree-girt',
-    'tree-holder',
-    'tree-light',
     'tree-mendous',
-    'tree-nester',
-    'tree-nests',
-    'tree-node',
-    'tree-oceans',
-    'tree-pipit-like',
-    'tree-rat',
-    'tree-rewrite',
-    'tree-roosting',
-    'tree-root',
-    'tree-scapes',
-    'tree-search',
-    'tree-shade',
-    'tree-shadowed',
-    'tree-sheltered',
-    'tree-shuttered',
     'tree-sized',
-    'tree-snakes',
-    'tree-stock',
-    'tree-structure',
-    'tree-top.',
-    'tree-toppling',
-    'tree-tree-tree',
-    'tree-turns',
-    'tree-type',
-    'tree-walk',
-    'tree-wife',
-    'tree-wood',
-    'tree-wrecks',
-    'tree.does',
-    'tree/artificial',
-    'tree/f',
     'tree1',
-    'treebranch',
-    'treebys',
-    'treeds',
-    'treees',
-    'treefrog',
-    'treefuls',
-    'treehorn',
-    'treehouses',
-    'treelets',
-    'treelines',
-    'treeload',
-    'treemen',
-    'treemonisha',
-    'treen',
-    'treena',
     'treenager',
-    'treep',
-    'trees&mdash;as',
-    'trees-great',
-    'trees-worth',
-    'trees.',
-    'trees.but',
-    'trees/',
-    'trees/bushes',
-    'trees/no',
-    'treescapes',
-    'treesnakes',
-    'treetops&ndash;samburu',
-    'treetops.',
-    'treets',
-    'treffer',
     'treffgarne',
-    'treflyf',
-    'trefoilers',
-    'trefonnen',
-    'trefri',
-    'trefriw',
-    'trega',
-    'tregaminion',
-    'tregantle',
-    'tregarthen',
-    'tregastel',
-    'tregeagle',
-    'tregelles',
-    'tregenna',
-    'tregenza',
-    'treglown',
     'trego',
-    'tregoning',
-    'tregothnan',
-    'tregoze',
-    'tregoze/wiltshire',
-    'tregubov',
-    'trehame',
-    'trehandiri',
-    'treharnes',
-    'treherne/wyevale',
-    'treholt',
-    'treib-seelisberg',
-    'treibseelisberg',
-    'treif',
-    'treignac',
-    'treister',
     'trejo',
-    'trejos',
-    'trek-style',
-    'trekforce',
-    'treking',
-    'trekking.',
-    'trekstyle',
-    'trelawneys',
-    'trelford/editor',
-    'trelissick',
-    'trellis-backed',
-    'trellisage',
-    'trellisworks',
-    'treloars',
-    'treloup',
-    'trem-y-ffridd',
     'tremadoc',
-    'tremaine',
-    'tremaine/villager',
-    'trematomus',
-    'tremblet',
-    'tremblin\'',
-    'trembling\'',
-    'tremella',
-    'tremellan',
-    'tremellen',
-    'tremen',
-    'tremendum',
-    'tremenheere',
-    'tremens',
-    'tremetrics',
-    'tremezzina',
     'tremin',
-    'tremmy',
-    'tremndous',
-    'tremolandi',
-    'tremolat',
-    'tremoli',
-    'tremolo-picked',
-    'tremor_out',
-    'tremored',
-    'tremoring',
-    'tremoto',
-    'tremper',
-    'trempolino',
-    'trems',
-    'tremuit',
-    'tremulous.',
     'tremulousness',
-    'trenails',
-    'trenant',
-    'trencavels',
-    'trencern',
-    'trench-built',
-    'trench-filling',
-    'trench-strafing',
-    'trench-warfare',
-    'trench/reception',
-    'trencherperson',
-    'trenchfoot',
-    'trenchless',
-    'trenchmac',
-    'trenchworks',
-    'trend-getters',
     'trend-spotters',
-    'trend-surface',
-    'trend=0.000',
-    'trend=0.001',
-    'trend=0.132',
-    'trend=3.32',
-    'trendall',
-    'trended',
-    'trendelenberg',
-    'trendified',
-    'trendily-cut',
-    'trendle',
-    'trendline',
-    'trends&lt;0.001',
-    'trendsome',
-    'trendspotters',
     'trendystyle',
-    'trenear',
-    'treneman',
-    'trenes',
-    'trenethick',
-    'trengate',
-    'trengirth',
-    'trengove',
-    'trenhaile',
-    'trenkie',
-    'trenkler',
-    'treno',
-    'trense',
-    'trent-jones',
-    'trent/biffa',
-    'trent125-1308.254.5',
     'trenta',
-    'trental',
-    'trentman',
-    'treowen',
-    'trepan',
-    'trepanation',
-    'trepanning',
-    'trepca',
-    'trepewet',
-    'trephination',
-    'trephine',
-    'trephining',
-    'trepid',
-    'trepidantly',
-    'trepidations',
-    'trepidatiously',
     'treponematosis',
-    'trepostomes',
-    'trepov',
-    'treppchen',
-    'trepsack',
-    'trerulefoot',
-    'tresaith',
-    'tresavean',
-    'tresbasses',
-    'tresckow',
-    'trese',
-    'treseder-griffin',
-    'tresgoz',
-    'tresh',
-    'tresidder',
-    'tresise',
     'tresons',
-    'tresoor',
-    'tresour',
-    'trespass-offering',
-    'tress-shop',
-    'tressart',
-    'tresse',
-    'tressed',
-    'tressel',
-    'tressels',
-    'tressider',
-    'tressilian',
-    'trestled',
-    'trestling',
-    'trestrail',
-    'tresury',
     'tret\'',
-    'treta',
-    'trethevy',
-    'tretheway',
-    'trethewy',
-    'trethowans',
-    'treuhand-controlled',
-    'treuhandstalt',
-    'treut',
-    'trevallyn',
-    'trevathan',
-    'trevean',
-    'trevecca',
-    'trevellas',
-    'trevelyan/production',
-    'trevelyans',
     'trevena',
-    'trevent',
-    'trevereux',
-    'treveri',
-    'treverorum',
-    'treverton-jones',
-    'trevethoe',
-    'treviglio',
-    'treville',
-    'trevillet',
-    'trevira',
-    'treviri',
-    'trevis',
-    'trevis/director',
-    'trevisan',
-    'trevisani',
     'trevise',
-    'trevone',
-    'trevowhan',
-    'trewennack',
-    'trewennick',
-    'trewhella',
-    'trewia',
-    'trex',
-    'trexacarna',
-    'trexeno',
-    'treybig',
-    'treze',
-    'trezibond',
-    'trezzi',
-    'trf',
-    'trfue',
     'trgs',
-    'trhousand',
-    'tri&rehy;umphs',
-    'tri-allate',
-    'tri-annually',
-    'tri-axle',
-    'tri-bucket',
-    'tri-carb',
-    'tri-centenary',
-    'tri-chlorethylene',
-    'tri-choral',
-    'tri-composite',
-    'tri-council',
-    'tri-ethnic',
-    'tri-federation',
-    'tri-film-tie-in',
     'tri-floor-oom',
-    'tri-focals',
-    'tri-function',
-    'tri-gear',
-    'tri-iodobenzoic',
-    'tri-level',
-    'tri-metallic',
-    'tri-nitrate',
-    'tri-p&eacute',
-    'tri-pada',
-    'tri-party',
-    'tri-portal',
-    'tri-protocol',
-    'tri-scorer',
-    'tri-series',
-    'tri-shaws',
     'tri-short',
-    'tri-sonic',
-    'tri-sport',
-    'tri-spot',
-    'tri-star-shaped',
-    'tri-stars',
-    'tri-vision',
-    'tri.',
-    'triable-either',
-    'triable-either-way',
-    'triacanthos',
-    'triacle',
-    'triacs',
-    'triad/tetrad',
-    'trial&mdash;and',
-    'trial-by-jury',
     'trial-by-newspaper',
-    'trial-by-trial',
-    'trial-by-video',
-    'trial-damages',
-    'trial-size',
-    'trial-to-trial',
-    'trialeurodes',
-    'triall',
-    'trialogus',
-    'trials&mdash;see',
-    'trianco',
-    'triandis',
-    'triandrus',
-    'triangle&ndash',
-    'triangle\'',
-    'triangle-language',
     'triangular-faced',
-    'triangular-section',
-    'triangularly',
-    'triangularly-folded',
-    'triangulars',
-    'triangulated',
-    'triangulatus',
-    'trianons',
-    'triarch',
-    'triaryl',
-    'triassic.',
-    'triaxises',
-    'triazine',
-    'triazole',
-    'tribal-acid-funk',
-    'tribal-influenced',
     'tribal-love-rock',
-    'tribal-rights',
-    'tribalise',
-    'tribalize',
-    'triballat',
-    'tribasl',
-    'tribe\'',
-    'triber',
-    'triberg',
-    'tribes-people',
-    'tribesfolk',
-    'tribolium',
-    'tribological',
-    'triboluminescence',
-    'tribond',
-    'tribonian',
     'tribromoethyl',
-    'tribs',
-    'tribu',
-    'tribularer',
-    'tribunal-appointed',
-    'tribunal-substitutes',
-    'tribune-journal',
-    'tribuni',
-    'tribunician',
-    'tribunites',
-    'tribute-assessments',
-    'tribute-children',
-    'tribute-district',
-    'tribute-exaction',
-    'tribute-lands',
-    'tribute-list',
     'tribute-lists',
-    'tribute-payment',
-    'tribute-payments',
-    'tribute/',
-    'tributyltin',
-    'tric-trac',
-    'tricalarium',
-    'tricalcium',
-    'tricarboxylate',
-    'tricarico',
-    'trice-rolph/champion',
-    'tricha',
-    'trichet',
-    'trichinella',
-    'trichinopoly',
-    'trichinosis',
     'trichloracetid',
-    'trichlorethane',
-    'trichloro',
-    'trichloroisocyanuric',
-    'trichloromelamine',
-    'trichloromethane',
-    'trichloromethane/',
-    'trichlorotrifluoroethane',
-    'trichocarpa',
-    'trichogen',
-    'trichoglossus',
-    'tricholorotheane',
-    'trichomanis',
-    'trichomonads',
-    'trichophylla',
-    'trichoplusia',
     'trichopsis',
-    'trichopteran',
-    'trichopterus',
-    'trichopus',
-    'trichostrongy',
-    'trichothecene',
-    'trichuroid',
-    'trick-cyclist',
-    'trick-cyclists',
-    'trick-diving',
-    'trick-ending',
-    'trick-feeder',
-    'trick-or-treat',
-    'trick-or-treats',
-    'trick-rider',
-    'trickers',
     'trickle-bar',
-    'trickle-charged',
-    'trickle-charger',
-    'trickle-on',
-    'tricks.',
-    'tricks.5',
-    'trickses',
-    'trickwise',
-    'tricky-dicky',
-    'tricky-looking',
-    'trickydick',
-    'triclinium',
-    'triclopyr',
-    'tricoleur',
-    'tricolo',
-    'tricolon',
     'tricolos',
-    'tricomp',
-    'tricone',
-    'tricoteuses',
-    'tricouleur',
-    'triculzo',
-    'tricuspidata',
-    'tricuspis',
-    'tricyanobenzene',
-    'tricyanomethanide',
-    'tricycle-geared',
-    'tridactyl',
-    'tridactylus',
-    'tridel',
-    'trident-based',
-    'trident-head',
     'tridentini',
-    'trideocolor',
-    'tridimas',
-    'tridsnap',
-    'triebling',
-    'tried-to',
-    'triemli',
-    'trien',
-    'triene',
-    'triennale',
-    'triento',
-    'triepel',
-    'trierarch',
-    'triermain',
-    'tries.',
-    'triest',
     'triestine',
-    'triethylphosphine',
-    'trietz',
-    'triewald',
-    'trifels',
-    'triffling',
-    'trifids',
-    'triflauto',
-    'trifle-dish',
-    'trifling\'',
-    'triflon',
-    'triflorum',
-    'trifluoroacetic',
-    'trifluoromethoxycarbonylcyanide',
-    'trifly',
-    'triforia',
     'triforked',
-    'triform',
-    'trifox',
-    'trifthorn',
-    'trig&rehy;gered',
-    'trig-point',
-    'trigamy',
-    'trigg/birdland',
-    'trigg/neighbourhood',
-    'trigger&rehy;finger',
-    'trigger-controlled',
-    'trigger-event',
-    'trigger-features',
-    'trigger-finger',
-    'trigger-off',
-    'trigger-release',
     'triggerings',
-    'triggerman',
-    'triggerthis',
-    'triggooms',
-    'triglon',
-    'triglyce',
-    'triglyceride-carrying',
-    'triglyceride-enriched',
-    'trigonafulviventris',
-    'trigonids',
-    'trigonocarpus',
-    'trigonocephalum',
-    'trigs',
-    'trigwell',
-    'trihalides',
-    'trihedrons',
     'trihydrate',
-    'trijunct',
-    'triklone',
-    'trilab',
-    'trilbied',
-    'trile',
-    'trilineal',
-    'trilingually',
-    'trilla',
-    'triller',
-    'trilli',
-    'trillick',
-    'trillingly',
-    'trillings',
-    'trillion-dollar',
-    'trillion-star',
     'trillion-yen',
-    'trills.',
-    'triloba',
-    'trilobita',
-    'trilogic',
-    'trilogies',
-    'trilyn',
-    'trim&umacr;rti',
-    'trim-fitting',
-    'trim-quality',
-    'trim-rigged',
-    'trim-tab',
-    'trim-trab',
-    'trim.the',
-    'trimalert',
-    'trimazepam',
     'trimazepam.',
-    'trimbach',
-    'trimblemill',
-    'trimboards',
-    'trimby',
-    'trimdon-based',
-    'trimebutin',
-    'trimel',
-    'trimellitic',
-    'trimeric',
-    'trimers',
-    'trimestal',
-    'trimethoxybenzyl',
-    'trimethylaminuria',
-    'trimethylammonium',
-    'trimethylsilyl',
     'trimingham',
-    'trimleys',
-    'trimly-dressed',
-    'trimmable',
-    'trimmed-down',
-    'trimmed-off',
-    'trimming.',
-    'trimnell',
-    'trimolecular',
-    'trimontium',
-    'trimsaran',
-    'trimsaren',
-    'trimurti',
-    'trin.',
-    'trinacrian',
-    'tringa.',
     'tringo',
-    'trinian\'s.',
-    'trinians-style',
-    'trinibis',
-    'trinidad-born',
-    'trinidada',
-    'trinidadian-born',
-    'trinita',
-    'trinitrin',
-    'trinitrotoluene',
-    'trinity.',
-    'trinket-seller',
-    'trinkhaus',
-    'trinkle',
-    'trinkling',
-    'trinko',
     'trinonic',
-    'trinovantum',
-    'trinquetaille',
-    'trinquets',
-    'trint',
-    'trintellas',
-    'trintopec',
-    'trinucleids',
-    'trinucleotides',
-    'trinucleus',
-    'trio-finale',
-    'triode/pentode',
-    'triolian',
-    'triology',
-    'triomphes',
-    'trionaid',
     'trionfo',
-    'triongle',
-    'triop',
-    'triosseum',
-    'triox',
-    'trip&rehy;of-a-lifetime',
-    'trip-and-throw',
-    'trip-free',
-    'trip-hammer',
-    'trip-like',
-    'trip-tropped',
-    'trip.',
-    'trip.his',
-    'trip/trance',
-    'trip_on',
-    'tripang',
     'triparite',
-    'triparsaidide',
-    'tripart',
-    'tripartisan',
-    'tripathi',
-    'tripball',
-    'tripe\'',
-    'tripedal',
-    'tripehounds',
-    'tripeptides',
-    'triphammering',
-    'triphenyl',
-    'triphenylated',
-    'triphibian',
-    'triphones',
-    'triphosphatase',
     'triphosphors',
-    'triphthongs',
-    'triphylla',
-    'tripla',
-    'triple&rehy;century',
-    'triple&rehy;subject',
-    'triple-',
-    'triple-action',
-    'triple-aisled',
-    'triple-album',
-    'triple-arch',
-    'triple-arched',
-    'triple-as',
-    'triple-bogeyed',
-    'triple-bonded',
-    'triple-bridging',
     'triple-canopy',
-    'triple-celled',
-    'triple-checked',
-    'triple-counting',
-    'triple-d',
-    'triple-deck',
-    'triple-decker',
-    'triple-digit',
-    'triple-domed',
-    'triple-edged',
-    'triple-engined',
-    'triple-expansion',
-    'triple-filtered',
-    'triple-fractured',
-    'triple-glazing',
-    'triple-grating',
     'triple-grooved',
-    'triple-handicapped',
-    'triple-honours',
-    'triple-lane',
-    'triple-layered',
-    'triple-line',
-    'triple-lobed',
-    'triple-neck',
-    'triple-nippled',
-    'triple-nuke',
-    'triple-one',
-    'triple-p',
-    'triple-pile',
-    'triple-pronged',
-    'triple-ring',
-    'triple-stalked',
     'triple-striped',
-    'triple-strung',
-    'triple-take',
-    'triple-tiered',
-    'triple-tonguing',
-    'triple-towered',
-    'triple-track',
-    'triple-unrequited',
-    'triple-woven',
-    'triple-zero',
-    'triple.length',
-    'triplecore',
-    'tripled-towered',
-    'tripledecker',
-    'tripletail',
-    'triplett',
     'tripleurospermum',
-    'triplicated',
-    'triplication',
-    'triplicity',
-    'triplike',
-    'triplings',
-    'triploblast',
-    'triplochiton',
-    'triploidy',
-    'tripod-fired',
-    'tripod-style',
-    'tripod/mini-tripod',
-    'tripodally',
-    'tripolar',
-    'tripolis',
-    'tripolyphosphate',
     'tripometer',
-    'triposes',
-    'trippies',
-    'trippiest',
-    'tripping-up',
-    'trippings',
-    'tripple',
-    'tripplehorn',
-    'trippleton',
-    'trippling',
-    'trips/accident',
-    'trips/meetings',
-    'triptazol',
-    'triptich',
-    'tripyer',
-    'triquetrous',
     'triradial',
-    'tris(dithiadiazolium)',
-    'tris-borate',
-    'tris-borate-edta',
-    'tris-boric',
-    'tris-bsa',
-    'tris-hc1',
-    'tris/edta',
-    'tris/hci',
-    'tris/methanol/glycine',
-    'trisaccharides',
-    'trisanna',
-    'trisanton',
-    'triscale',
-    'triscari',
-    'trishaws',
     'trisilicate',
-    'trisland',
-    'trismegistes',
-    'trisomic',
-    'trisomies',
-    'trispinosus',
-    'trisport',
-    'trista',
-    'tristam',
-    'tristes',
-    'tristessa',
-    'tristi',
-    'tristia',
-    'tristis',
-    'tristitia',
-    'tristram.',
     'tristram/vicar',
-    'trisure',
-    'trisyllable',
-    'tritel',
-    'triterpenoid',
-    'triterpenoidal',
-    'tritheism',
-    'triticaily',
-    'tritici',
-    'triticium',
-    'tritium-based',
-    'tritocerebral',
-    'triton-born',
-    'tritrust',
-    'tritsch-tratsch',
-    'tritt',
     'trittbrett',
-    'triturated',
-    'trituris',
-    'triturus',
-    'trium',
-    'triumpalism',
-    'triumpantus',
-    'triumph\'',
-    'triumph-of-miniaturisation',
-    'triumph-song',
-    'triumph/leyland/bl/austin',
-    'triumphalia',
-    'triumphantly&rehy',
-    'triumphants',
-    'triumphator',
-    'triumphatus',
     'triumphed&mdash;by',
-    'triumpher',
-    'triumphes',
-    'trius',
-    'triv',
-    'trivariate',
-    'trivedi',
-    'triveneto',
-    'trivette',
-    'trivial\'',
-    'trivselspartiet',
-    'trivulziana',
-    'trivvelin',
-    'trixi',
-    'trixiebelle',
-    'trkulja',
     'trl-trilobal',
-    'trlby',
-    'trmptd',
-    'trna(&psgr;35)pseudouridylate',
-    'trna(&psgr;40)-pseudouridylate',
-    'trna(gm18)methyltransferase',
-    'trna-',
-    'trna-modifications',
-    'trna-modifying',
-    'trna-variants',
-    'trna/aminoacyl',
-    'trnjani',
-    'trnka',
-    'trnovo',
-    'tro-uble',
-    'troarn',
     'troas',
-    'trobarrow',
-    'trocal',
-    'trocar',
-    'trocaz',
-    'trochar',
-    'trochetiopsis',
-    'trochilidae',
-    'trockener',
-    'trodden-on',
-    'troduced',
-    'troed',
-    'troedsson',
-    'troeglhand',
-    'troezen',
-    'troffling',
     'trofimenko',
-    'troger',
-    'troggin',
-    'trogging',
-    'trogir-born',
-    'troglodiplura',
-    'trogog',
-    'trogon',
-    'troiani',
-    'troilist',
-    'troilite',
-    'trois-puits',
-    'trois-villes',
-    'troisdord',
-    'troisdorf',
-    'troissy',
     'troiti&ntilde;o',
-    'troitino',
-    'troitskaya',
-    'troizenia',
-    'troizenian',
-    'trol',
-    'trolium',
-    'troll-madam',
-    'trollbane',
-    'trollen',
-    'trolley-full',
-    'trolley-load',
-    'trolley-loads',
-    'trolleyed',
-    'trolleyhead',
-    'trolleyish',
     'trolleyloads',
-    'trolleys.but',
-    'trolleysafe',
-    'trolligarth',
-    'trollingand',
-    'trollius',
-    'trollope.',
-    'trollope/writer',
-    'trollopean',
-    'trollopeian',
-    'trollops',
-    'trollopy',
-    'trollskin',
-    'trom&oslash',
-    'troma',
-    'troman',
     'trombetta',
-    'trombicula',
-    'trombones.',
-    'tromboni',
-    'trombonic',
-    'tromboning',
-    'trometamol',
-    'tromethamine',
-    'tromeur',
-    'tromp-l\'oeil',
-    'trompe-l\'oeils',
-    'trompeau',
-    'tromper',
-    'trompets',
-    'trompillos',
-    'tromping',
     'troms',
-    'troms&ouml',
-    'troms7',
-    'tromsoe.',
-    'tronagers',
-    'tronc',
-    'tronchet',
-    'troncoso',
-    'trondhjemite',
-    'trondhjemite-tonalite-dacite',
-    'tronoh',
-    'tronsmo',
-    'troo',
-    'troolin\'',
-    'troop-carriers',
-    'troop-contributing',
     'troop-either',
-    'troop-ship',
-    'troop-ships',
-    'troop-train',
-    'troop/blumenthal',
-    'trooping-aircraft',
-    'troops&mdash;a',
-    'tropaeolum',
-    'tropea',
-    'tropez/st',
-    'trophae',
-    'tropheops',
-    'tropheryma',
-    'trophic-dynamic',
-    'trophic-level',
-    'trophoblastic',
     'trophy-filled',
-    'trophy-hung',
-    'trophy-hunting',
-    'trophy-laden',
-    'trophy-winners',
-    'trophy.',
-    'trophyless',
-    'trophyman',
-    'trophys',
-    'tropic-blue',
-    'tropical-coloured',
-    'tropical-fish',
-    'tropical-forest',
-    'tropical-style',
-    'tropical-type',
-    'tropical-weight',
     'tropical/coldwater',
-    'tropicalismo',
-    'tropicalized',
-    'tropicanas',
-    'tropicarr',
-    'tropics-wide',
-    'tropiquaria',
-    'tropique',
-    'tropiques',
-    'tropix',
-    'troplogical',
-    'tropoj&euml',
-    'tropoje',
-    'tropomyosin',
-    'tropomysin',
-    'troponin',
     'tropp',
-    'trops',
-    'tropwood',
-    'trosavat',
-    'troschin',
-    'troscianko',
-    'trosser',
-    'troteman',
-    'troth-plight',
-    'trothed',
-    'trotsky.',
-    'trott/reporting',
-    'trotter-bone',
-    'trotter/former',
-    'trotter/rsi',
-    'trotter/teacher',
     'trottiscliffe',
-    'trottle',
-    'trotton',
-    'trotwoods',
-    'trou&eacute;e',
-    'trou-ou-ou-oubles&mdash',
-    'troub',
-    'troubk',
-    'trouble&ndash',
-    'trouble&rehy;hunter',
-    'trouble-',
-    'trouble-cases',
-    'trouble-fee',
-    'trouble-makers.',
-    'trouble-prone',
-    'trouble-saving',
     'trouble-shoot',
-    'trouble.',
-    'troubled-funk',
-    'troublefree',
-    'troubles&mdash',
-    'troubleshoots',
-    'troubleshot',
-    'troublesomeness',
-    'troublespot',
-    'troublew',
-    'troublin\'',
-    'troublings',
-    'trough-drinking',
-    'trough-laminated',
-    'trough-like',
-    'trough-shaped',
     'trough-with-trough',
-    'trough.shaped',
-    'troughia',
-    'trouillot',
-    'trounces',
-    'trounsem',
-    'troups',
-    'trousdell',
-    'trouser-and',
-    'trouser-arousers',
-    'trouser-bottom',
-    'trouser-bottoms',
-    'trouser-cuffs',
-    'trouser-dropping',
-    'trouser-fly',
-    'trouser-front',
     'trouser-fronts',
-    'trouser-happy',
-    'trouser-material',
-    'trouser-presses',
-    'trouser-stretching',
-    'trouserbottoms',
-    'trouserleg',
-    'trouserly',
-    'trouserpress',
-    'trousers/colorado',
-    'trousers/skirts/culottes',
-    'trousers/tight',
-    'trousers/tracksuits',
-    'trousersuit',
-    'trouserwear',
-    'trousseau-stuff',
     'trousseaus',
-    'trousseaushopping',
-    'trout-breeding',
-    'trout-farmers',
-    'trout-ferox',
-    'trout-like',
-    'trout-ringed',
-    'trout-rods',
-    'trout-starved',
-    'trout-stocked',
-    'trout/father',
-    'troutman',
-    'troutspawn',
-    'trouv&egrave;re',
-    'trouverent',
-    'trouves',
     'trov&eacute;s',
-    'trovato',
-    'trowel-fed',
-    'trowel-full',
-    'trowelled',
-    'trowelled-on',
-    'trowers',
-    'trowhill',
-    'troxide',
-    'troyas',
-    'troye',
-    'troyon',
-    'troyos',
-    'troys',
-    'troytown',
-    'trp-lac',
     'trpgdc',
-    'trphy',
-    'trrops',
-    'trrrrrfffaow',
-    'trrrrrrrrrrrrrfffaow',
-    'trs-80',
-    'trs/80',
-    'trsb',
-    'trstenik',
-    'trsut',
-    'tru-zero',
-    'truancies',
-    'truancy.',
-    'truande',
-    'truax',
-    'truble',
     'trubs',
-    'trubshaw',
-    'trucchi',
-    'truce-making',
-    'truce-terms',
-    'truchart',
-    'truchsess',
-    'trucibaldo',
-    'truck-belch',
-    'truck-makers',
-    'truck-making',
-    'truck-sized',
-    'truck-stop',
-    'truck-tyre',
-    'truckcab',
-    'truckdrivers',
     'truckell',
-    'truckies',
-    'truckled',
-    'truckline',
-    'trucks/company',
-    'truckstop',
-    'truckstops',
-    'trucky',
-    'tructollean',
-    'truden',
-    'true&mdash',
-    'true&mdash;i',
-    'true\'',
-    'true-and-fair',
-    'true-blooded',
-    'true-born',
     'true-brit',
-    'true-grit',
-    'true-hearted',
-    'true-human',
-    'true-light',
-    'true-love',
+)
+
+blocks_52 = (
+    '&!a\'"ll($ways&!i\'!f&#not&"so&,that-matters%!.%$_but&"in%)amabobbit\'#bob\'$ijig%!e',
+    '%$hood%#ill&!s%%majig&!e%$ness%!o%\'s&mdash,%;like-\'nothing&!-\'+as-they-are\'$cups\'#for\'-in-themselves',
+    '\'#the($o-do\'=were-just-getting-interesting&%.they&&/ideas&(_in_,_in&&getwet%&umabob\'+majiggeries(\'ycallit\'!s%\'wiricci%%ybobs&%mebob$\'k&mdash',
+    '&#big&#ers&/i\'m-gonna-dance&%piece%\'/bother&$feel&*sleep/work%)_in_terms&"so%%about%)er/artist&"st%!i&&ng-all)#but',
+    '(&.based(\'/acting)(cerebral)\'imagery-\'ination)&stress)\'writing()_in_terms("ly($s/as%!l&!y%+s/discusses&!t%$tank',
+    '%%write$#ly-\')concealed)%vered\'&spread(&tretch\'+upholstered&!.$(ned-down(#out&,r&mdash;much\'%-hair(&necked(&walled\'&/brush',
+    '$%space$!t#!o$!-$%acids$(bacillus$*glycollate$)l-protein$$ng\'o$\'oxidans$)sulphate.,3/citrate/bile-salts&&phuric#%rburn$\'d&mdash',
+    '+%scale%!\'%$-age&%based\'#est\'%ottom\'$rake&(category\'%hange\'&ousins&#day&#end&\'fastest\'6inger-of-the-left-hand\'&ormers',
+    '+(the-left&$gear\'%rowth&\'holiest&#man&+of-a-second*&n-acre)#the\'!r&+party-payer\'\'ersonal\'$hase\'#int\')reference&$rank',
+    '\'&ichest\'"ow&&second($eded\'$hare\'$tage($orey*!y($ring&$team\'#han\')ime-lucky\'!o(#nes&(worldism',
+    '%!.&$they%%party&%erson%%s/one%!y$#ion%(pyitsaya$-kell-designed%#ill%$leby$\'lestone%$ings$"ne$$ring',
+    '%\'k-based%(t-driven\')quenchers\'\'rousing\'*satisfying&$iest\'$ness$"te&#en-)3and-a-half-year-old*%rched)\'chapter)\'episode)$fold)$goal',
+    '*#tem))kilometre)$line)#man)$page+"rt*%erson)%stone)$week(/th&rehy;century*\'-/early+%early+"to*+/fourteenth&"th',
+    '%$ies-\'*th-century%"le\'"by%$well%4y&rehy;five-year-old,#six&"\'s&)-and-five\'$bobs\'*eight-foot-%state-%tonne-$year,!s',
+    '(%ifths).ve&mdash;forty+\'-footer,$year0%-olds*#ish((oot-high+"er)\'ur-fold\'$hour(,undredweight\'$inch\')kilometre\'&league(#ine',
+    '\'$mark($etre\'%oared(&h-five+#our*%seven(\'ne-inch+#rig\'%piece($oint\'&roomed)#und\'&seater)4v&mdash;thirty-eight*\'en-year',
+    '(\'ix-inch+%patch(%torey\'(thousand)+ree-footers-%metre(&wo-bed+&county+$foot+&legged+&seater+(thousand\'-year&rehy;old+%-long&,/forty/fifty',
+    '&$nine&\'seventh$$wall$!y%%-nine$"za##s\'/$$(37)$)-election%$heah%"in&/s-old-hat-to-me\'!m%*represents%$that',
+    '%#you$#.ii%#one%\'section%(vertical%"we$!/%!i%$that$#_as&!t%"in%"on$#and$(b&eacute',
+    '$$ness$%piece$"sa%!s$)tle-bloom(#cup($down(&filled($like($seed)%haped\'\'/magnus\'%brook\'%flats$!u',
+    '$\'lingham#)xotrophic)!y"!k"%ledge##ice#.yy\'gzul\'zhaell"#num"#o\'t#"ab$!t#!c##ddy$!e#%ghtes',
+    '#!i##jib#"kk#&llaidh%"ow$#oid#$m-as$%aides%!m%,s(earthscan)\'$usa)&*-a-beckett\'%baker\'.ferrand/prison\'-in-the-cliffe',
+    '&\'/animal\'\'british\')commoners\'\'diocese\'\'ex-wife\'\'haywood((istorian\'*lumberjill\'\'malvern\'\'nuclear\'&oxford\'*pharmacist\'&spider&"ed\'#scu',
+    '\'"us&&kantor\'%irche&&schule&!z%#yer%!z&#ine$(boemboli%#ury$%esone$#ham$#ire$#kos$&massen',
+    '$!o$%pkins)\'/adkins%+son-chesson)*mccausland(,/association)(bereaved*)ullingdon))calverton*&entral*)heltenham)/gloucestershire))hartwells*\'ereford)*kidlington',
+    ')&parent)$ross()community&$tone$#som&%n-cfs(\'houston\'&/house\'#ian(!i%#pon#"ne%!s$%gvinh%$weed',
+    '#"o.#!p$!s#\'r-delta%"lo$%acica(+o-abdominal&*oabdominal%#xes$*bj&ouml;rn&$oern$#dis%"ur$"ed%"ll',
+    '$(finnsson$#gan%\'eirsson%$ills\'$sson%"ut$+hallsdottir$\'ichtere(#hys%>kos-kephale-prospalta-sphettos$%ketil%#ild$\'n&amp;e%&-apple&$clad',
+    '&%hedge&\'impaled\'"vy&$like&\'planted&&ridden\'$oots&)spattered&$tree%!/&&acacia%)aby-based&$lley(!y%$burn',
+    '&!y%%croft%"e-\'\'leggatt&$/lab\')macintyre)&naging&!d&&nsians&%yburn\'.croft/forestry-+mountbatten%$gren%$leys&&iebank',
+    '%%scrub&#ett&#ide%)ton-berry)(le-beans(//grand-daughter%$wood%(y-headed\'%vines&$bank("uk&,croft/forest+!s&&headed$!o',
+    '%#net%*ugh-colour)%paced($bass)%races(#lky)\'y-there(#out$*pe-beeston&(/protest\'&triple&)by-newark&%lands$\'rington%"un',
+    '%#rud%$tein&)vedt-berg$)ton-berry$(valdsson#$sand$\'e&mdash%#-of%#.in%*_in_favour&$over&"up%!s&\'tarting$$pson',
+    '$"te#$u\'lt$7/thee/thy/thine/thyself$$ands%"rs$(gh&ndash&\'-groups\'3i-wear-a-dog-collar\'#the&!.&"ly&/t&mdash;i&mdash.#see\'!\'\'!-',
+    '(\'content)%rater*#ime(%diary(+experiences(&filled(!i(%lines(*mutterings(&object)!f(+penetration(2rather-than-action)%eader(+stimulating',
+    ')%ymbol*%stems(%to-be)+ransference-\'mission\'#.44(!i()provoking\',/idea/memory(#too\'&action\'!b\'!e(!s\'%forms',
+    '*!l+"y.\'%lifes\'+s&mdash;yes((/beliefs)#the)&words/\'%waves($orld$#ria\'"ns&"oi%"ot$#san\'!\'',
+    '(%-acre)\'bedroom)1candle&rehy;power)#day)&legged)%metre*(ile-long-)s-an-hour)#odd)(petalled*$ound)$seat+#ven*%trong)%voice',
+    ')$watt))year-long-!s($/two("er($sths#$wghe$!z#$yras"#pat"%quire""r\'#"12##25\'#"41',
+    '#\'aceward%"ia$)gmipedium$"il$$lled&#ing$!n%\'ceastre%&deston%#ged&#ing$#sed%,h&rehy;metal&,-lobotomised&)/hardcore',
+    '&#ian\'"n\'(&g-drum*&ground)"ly%&ybulus$"ve$!x#)e30&mdash$\'a-tened%&d-bare($ound\'\'cutting\'$fine\'$link',
+    '\'$mill\'$safe(&talked\'%veins\'$wide&$bear&#ers&$good&&waxing%\'pingham%!r%$sure%&t\'ning&+-dangerhero((ismissal',
+    '\'(that-was&..interestingly&\'/danger\'\'neutral&$ener($ing.&#ful&#ned\'#ing*!s&"re($goer&"s.&$ware$$bled',
+    '+\';colour&(ndash;19&/rehy;and-a-half+)bedroomed,#ook+%child,%ourse+\'fifteen/"hs-$nger+$hour+)month-old+*pennyworth+(quarters+(syllable',
+    ',%iered,!o+&volume%#(s)%"-a\'%-side\'$dult\'"ge\'$lbum\'"nd)1-a-half-kilometre1(thousand1%years0&octave0#ton',
+    '($gled\'$rmed\'$side\'#tom&%balls(#yed\'%edsit(;ta-three-one-double-one-one\'$lock\'#ody("ut(!x\'%urner(!s)(-an-hour',
+    '($rbon\'#ell($ntre,!d\'$hain)$nnel)$pter(#oir\'%lawed\'$oach()mpartment*%onent(\'ndition(#unt+$ries',
+    '(#own\'&ushion\'$ycle&$date()y-eventer*#one\'#eep(%grees\'/imensionalities/"ed/!s("sc(&vision\'"og(#ors',
+    '\'%rawer("ug&%edged\'\'quation&&factor\'#eet\'$ifth(!n)#ger("sh\',lights-a-day\'(oot-wide*"ed+!r(*r-&pound;1',
+    '*%seven)"ty(\'ur-five*,s-in-an-over&%gluon\'%oblin\'$raph\'%uinea)#tar&)halfpence($nder*$icap*#led\'%orned(#urs',
+    '\',undred-level/#ire.$year-"th&(in-a-bar)\'the-bed(\'ch-long*"es\'#ron*!s&#jet\'\'unction&#key\'#ilo&%laned',
+    '\'#ead)!f(!g($ngth\'%iners\'#ove&\'masters\'%edian(&mbered\'(ile-long+&radius),lion-dollars.$year\'*onths-long-#old',
+    '("re(&vement)"ie&#nen\',ights-a-week(&neties&&octave\'(ne-three\'\'ver-two&$pack*!s("ir(\'ragraph*%meter)#ter',
+    ')\'nyworth)$sion($riod(&talled\'(hases-on\'*iece-suite(&llared)"ot\'$lank((us-three,"wo\')oint-turn(%under\'$rint(%oduct',
+    '&,quarter-acre.#bed.$mile/$onde.#ton-$ings-&s-full&)reception)#ord($gion(&public(%sidue\'"ig\'#oad(!d',
+    ')#ool($reen\'(ectioned*"or(%gment(&ntence($ries(#ven+#-oh+#ths,&y-five\'$helf(&illing)!p)"re',
+    '\')ixteenths\'#ome\'#pan)!r(%rayed\'*quare-mile\'$tall))r-quality)"te("em(#oke)"ne)(rey-high*#ied(&ringer',
+    ',!d)$ozzi(+udy-bedroom\'&ystems&$tape("sk\'\'housand(%reats*\'e-eight\'*imes-a-day,%daily(#ned\'&o-five*#our)*seven-year',
+    ',!s\'&racker)"in(&iangle)$gger(#uck\'&wo-one-%-five.-rolling&mdash&(under-69("it\')pper-part\'#ser&2valve-per-cylinder(#ned',
+    '\'%oiced&\'wattled\'%inged\'$oman(#ods("rk&-year&rehy;old*%-plan,&osting+%study*%s-old&$zone%).quarters&%stage&$year',
+    '%%/four&#two%-andshe\'sareal%$ball%\'channel%"er%$mile\'$nute&\'orbidly%&parter&(enny-bit*%worth%,quarter-line%"s.&$core',
+    '&%poked%#way$&ipmuir$%nodic&!s$!o%%nine-*$rich$"se%&hfield&)ing-floor*&ground)!s&\'old\'--a%#ian',
+    '+&thidae$"ts#&iasian$"bb&#ler%!e$*ce-blessed\'%happy\'\'repured($isen\'%taken\'&yearly&"ly$#dde$%evers',
+    '&&lessly&(s-rescue$.ll&rehy;hungry&)-a-minute\'$free\'&hungry\'-of-a-lifetime\'&packed\'\'seekers&(er-style&\'s\'-type$$ndon%&gstone$&ty-six#)oat&mdash',
+    '\'$band(#urn\',constricting\'&drying\'$hold\'#rip\'\'strings\'\'tearing(%heory()ightening($ract&$/and\'#you&%bound&$fuls',
+    '$)bbingness$"ge$*mbasthenia-!c&*in-induced&)oangiitis\'%cytes*\'opaenia,%enia.\'&emboli\'%genic,#ity\'\'lysis.3\'\'modulin\')phlebitis',
+    '(*rophylaxis\')resistant\'/spondin-related\'$ysis$!n%\'e&ndash&%-name\'$room&$.124&!/&$less&%ships&&worthy%"us$!o',
+    '$"pe$%shing%!k%#sel%#tle&"on$)ttle-rods($/rpm("rs$)ugh&mdash-$;the\'\'-action($fare)&lowing(%other',
+    ')"im)$ooms*#ute((stitched*%reets((the-body,\'cistern,-looking-glass,$wall-#eek)(icketing.!s*"me($view($wall',
+    '(%which\'\'/wedged\'._as_far_as_erm("in\'"am)0/gloucestershire\'$ball\'(campbell\'$fare\'$oput(+ut-the-year\'$tout\'"ut\'$ways&#out',
+    '&(backable&%fetch\'&orward&)it-all-in/&-a-pot*#way&$offs\'#uts&$rugs&,yourself-off%!.%$down%%er-in\'"s/%#ghe',
+    '))billiards)"in)#off*#pen)"up(!.%$n-in\'"up&$_out%$ster#$rrrp&%rrrrp#(ty-eight#&ubwell$$mble',
+    '$\'sh-like\'%sized%)t-reverse&"ed&%ingly$#tch\'"es\'#ing\'!y$#way#$ydde"#ses#"oe""tr#&wength',
+    '#!a$"th#"ch$#yd.&%idean#&d-thud$"de%%ingly$&erbolt$%s-off#%ggee\'\'!s&#ry.#$hool##ile',
+    '#$lane$#den$#ium$$lier#,mb&rehy;nail%!-&&cocked&\'knuckle&$mark*"ed&%nails&(operated&&picked\'$luck\'$rint',
+    '&(screwing&$tack\'$yped&$wind%!/%$ball%%cuffs%)nail-size.!d)#ing%"oo%$pick%%wheel&(restling$"ma',
+    '$$pers%$ings&(ty-thump%"pp#4n-konolfingen-luzern$&bergia%!y$+dal/swedish%+er-and-fire(#boy(&clouds(\'flashes(#god(%plump(&shower',
+    '*$ruck\'#/24\'&basses(*ird-handed+"s.\'$cats($hief,!s(\'rackers\'!d(#ent(#ome\'#eth\'%flies($orce',
+    '(#tes\'\'ousness\'+storm-laden)$reak\'&thighs\'$word$"en%$rsee$!g%"on%$ummy$$king$"or$!s#"ot',
+    '$&annaka$#ten#"r.$#ant%)r-rahulan$(beresque\'#ish%"in%#urn$#day\'*/wednesday%"in%"le$(gauerhof%!h',
+    '$#ham$$ians%\'giensis%"ng$%kleby$&leston&%y/red%!s&&toners$(mair1990&#rsh%"er%+ond/clinton$\'n-taxis&*valsassina',
+    '&!m%%eysen%$scoe$$ring%!y$+s&ndash;fri,#sun%%-sat.%-day-afternoon)\'evening(\'/friday))wednesday&"en%%field*%/west',
+    '&#ine%!z$#ulf$!y#(s-and-so$#and$$ness$!t#%waini%"yn#\'ya-wood%!s"!v"!w#+aites-ee-ee',
+    '$!p#\'e-thauk$#nge#$itel#"ok##ung"!x""y\'#!1#%atira#!e#\'lacines("us&\'osmilus#&mallus',
+    '$*ic-derived%-dine-labelled%#nes$#us.#&nidine$$kand%!e$#nes#.ristors-triacs*\'/triacs$&oditis%.id-stimulating%$scin%)toxically&/ropin-releasing',
+    '$(siflorus#)sanoptera&$uran$#een%!n$7sen-bornemisza-habsburg(,nordseewerke$,tere-thicaya#&terion#\'umidine!+i&eacute;de"#-59##che#\'ichomes$#ght',
+    '#(n-terirt##rpc##tzu"$1ley"\'aa-cref#\'huanuco##nda$$ming$$shun$%zheng#&oyutai#$pkin#$rama$!y#\'telolco',
+    '"&baldry$+r&emacr;noi#"ba$"ia%#lda%$well$+u-ownership&(speakers%"tt#%enham$%r/did%%ation%#ina%\'thwaite$!s',
+    '%#orp&!t##ial$%ngton##nin#$uron%#tio"(c-ridden$\'tac-toe+(/connect%"ic%"oc#!c$$iati#"h\'',
+    '$$enko$#ter#%inesi#$k\'ed$+-associated%%boxes%$list%#off%(tack-toe&&he-box&&icking&%ocked)#ing)!s$!.',
+    '$*ed/updated%$nham%*r&rehy;off&!y%.t&mdash;office&!\'&!-\'\'barrier\'$chip(&lipper\'$desk(%rawer\'\'holding\'\'issuing\'\'machine',
+    '\'&paying\'\'souness(#tub\'$that\'&window&".s&!/\'#ash&\'ofleave&\'s/sales)(howcards&&ty-boo&$yboo$$ford$)ing-lined',
+    '$$ledy&!m&%penny&#toe&!y%%iness&&shness$&sheets$!t%"in$\'y-tacky#(ondcroga&%eroga$#tin#"st',
+    '#&alwave##bit$#urn#%combe#!d$7le-diddle-liddle-liddle%,y&rehy;winks&%-i-ty&$wink#%e-can\'$used&%racks%%limit%&marked)!s',
+    '%\'rnarked%(surveyor%&tables&%ossed%%water\'!y$%lines$%posts$(s.jutson#$iane$#bed$#ed.$#man##ley##man',
+    '#$well##y-i%$like$$/too$#in\'"/e&rehy;breakers#%-beam%\'reaker.+!s)#ing)!s$%clips%#ord$$died%#own',
+    '%%rawer$$hole$%lines$%maker$&pulser$$rack%"od$%tacks&"pe(!s%+ie-italiano$&wearer*!s%"ig%$raps',
+    '#$back$\'reakers#"ck$$oura#(d-agency%$back%"on$$eman(!n$#own#"fe%!r$$land#$ghem#"ko',
+    '##man&!n$!s#&n-shan%%tsang$#ari$"da$!e$!g$$nent$!t%!o%$sins#$oule#%polos',
+    '$*ed-support$)kopfranke$*ney/thames%!o$#rie$"s.#&s-like$$inga$$sing#+thanolamine$%mayer$#zes#*vebulliagh"\'ffany\'s\'&-style',
+    '$"en$$ield&!s%&n-tins"*g-en-cruig#%a.drv$$/dos$"ni&!a$$polu#.er-frighteners&%growl&$palm&&rubies(!g',
+    '\'#kin*!s&$trap%!.%$cats%$fish%%haven%#ing&$shly%#man%$rail%"s.&\'triping%%tailz%$wood',
+    '$#ies$&winkle*!s$\'ywickle#%harry&!y$"es$%field$)nabruaich&$cala$-t&rehy;lipped+\'waisted%&-arses\'"ss)"ed',
+    '&&capped\'%entre\'%losed\'%oiled(&upling(%vered\'&ropped&$eyed&$fist($tted\'%ormed&\'grained&$held&-lipp&eacute;d)!s',
+    '\'$oose&&radius\'%eined&\'sealing\'&kirted\'%mooth&)trousered&,white-collar%%arsed%%en-up\'!.\'*ing-radius&(r-fisted&\'st-ever%&framed',
+    '\'\'-argued(&capped)*entralized)%losed,#ing)*onstructed)%urled+#ved(%drawn(&fought)%urled((governed)&ripped)&uarded(*integrated',
+    '(%laced()regulated)%olled(*structured(%woven)&rapped*%itten%+rope-walked/"rs)!d)!s%"s.&*/stockings#&ilinea##net',
+    '$!r$#uga#"ra$$ella$#ida&"ia(!s%#llo%#num$"on#"us#+well/britsh"$hama$"ny$!r',
+    '"#ina")jdschrift#&ianiya#"ou#!u$"ca$#nga"!k#"al##cha#!e$!s#$hait#%itere#&opians',
+    '$"hu#*berthwarte$#ian$#urn##con##dey#)e-hanging%)importing%%kilns%#red$\'/window$!a$$d-in&&roofed$%house',
+    '$\'s-which%!.$\'trasher$!y#$hill#&iaceae$*ng-factory#4l-death-us-do-tedium%&holger%)snatchers%$work$./cheque/credit$!a%\'karatne%!m',
+    '$%e/and%\'karatne%$mans%"r\'&(-steered&)/planning&#ing%&sworth%"ul\'!s%*y/forestry\')wiltshire&!s$&ichian%&erfour',
+    '$#och%+t&rehy;sons$"s.%&onburg$\'yardian%&pronie#$mann&$ston$"es$#ore#"ne#&okaikt#%seter%!y$%worth',
+    '$\'\'n\'turn$+-adjustable&\'nd-turn%$back%%shots%#top%$yard$!.$*ed-squares%!r$\'ing-top$#urn#!y"&m\'rous#"ac',
+    '$#ios$!n$%rchos%!s#%balls$)er-arched\'\'boarded)$died(%uyers\')ceilinged(#lad\'&effect((ncrusted\'\'fronted\'\'hauling',
+    '(\'ndustry\'$look\'*processing\'$rich\'&smells\'(textured\'%vault\'$work&!.&%croft&*ed-covered&#log&#men&&scombe\'%field',
+    '%!t$(re-codes&!d&"ll(!e#&chenko#\'e&gt;ph%(mdash;as+%could+$gave+!i,!t+$papa,#lus+$they',
+    '+#you%-rehy;honoured*%lapse*\'periods*(resolved*&saving+%erver$"\'\'$+-accounting&)dverbials&(llowance&\'nalysis\',d-attendance)-labour-saving)(material',
+    '&$toms&$wful%%balls\'"nd&$eing&\'idingly&(udgeting\'!t%\'capsule&$heck*!s&$oded\'%mplex)\'ression\'(nditions',
+    ')\'istency)$tant(&tinuum)#rol,#led\')rrelation&\'ripples(%tical%\'delayed&)ifference\'&rected\')stortions\'&vision&%omain&%ulled',
+    '&(fficient&\'lements&%nergy&)quivalent&#ven&(xpensive(%osure%,for-a-change&%rozen&$used)!s%&geared&-one-by-period%(hallowed&!e',
+    '&"on%*integrated)%nsive&!s&!t%(keeping.%&lapsed&\'essness&#oop%)mentality&*ultiplexed%(oblivion\'&sessed&%f-her()the-month',
+    '&&rdered\'&iented&#uts%\'passing\'#ths&+erspectives&$hase&#ips&$lace*\'-person(!n&$oint*!s&\'ressure\'#ice',
+    '(,portionality%)rationing\'%vaged&)estricted&$iven&\'uptures%&sample\'%vings&&egment\'(quencing\'$rver&"he\'#ift*"ed*#ing',
+    ')!s&%ignal+!s&#lip\'#ots&(ociology\'%rting&%paces\'"ot&%tamps(&ndards\'"ep\'%opped\'(ructured\'#udy',
+    '&%witch%)tailoring&%eller&#hen(!y&(o-answer($come("go&%unnel%(variable%$wage\'%rping*"sh\'&s-past(%ting.',
+    '\'&ighted&%orker$".5%#ago%%being\'%tween%"he&"ow%+immediately%$okay%\'richard%\'shortly%#the\'"is%\'varying',
+    '$"/a%\'doppler%\'expense%(location%$more%#out%$part%$task&*emperature&)ravelling&"wo$#=17%!6%!9$#_as',
+    '%"no%#out$"bo&#mbs%$urst$&charts&$enko%$lock%(onsuming$%d-out$&filler%"or%%rames$(honoured%"ri',
+    '%"sh$$like$$outs$#pac&"th%%iece.%$lace$)r-counter&&framed$-s&commat;2:10&&dollar&(rehy;was%$-\'my&#ing&(picayune',
+    '\'&eading&$side\'$tock&%table+!s&%union%&.relax&$then%$/aer&$days&#lot&&places&$riba*)/business&&social',
+    '%$_now%%cale.%%hifts%"in%$pots%&tamped&"ep&"he&$ream%\'witches$*table&lsqb))/calendar$$well%#ise#*id-looking',
+    '$$kata$"n\'%\'g-cycle&!.$"os$#sia##mel%!r$&ington&,s/campaigner((daughter(&mother(&prison$#ony%\'rtalshe',
+    '$)y-the-dog##nus#,o&scirc;oara$&cratic$$feev(#ich&!y%"te$#ken%#les%%rates$+le&oacute;n%"ol$&n-like$#sha',
+    '$#teo%#hee\'"os$%uchoi##p-1$%anaro&!e&!y\'\'/mother$$kiss$!s##tum#"us#%worth""n-',
+    '$(coloured%&upping$%eared$$free$(helmeted$/in-concentrates$#man$\'opening$#pan%*rospecting$$roof$%snips%(treaming%%uited$%tacks',
+    '%\'ungsten$\'whistle%&orkers#\'/silver#\'a-marie$"ia$$mous$"ri$!s#"ch$&ommius$#tly%%orius#$dale$&burgen',
+    '&!.$&holmur##eke$$rhir#%foils#/g-a-ling-a-ling%$ting$%aling%)y/captain\'(hercules\'#raf$"e.%(y/farmer$%ling.&"sh',
+    '$$race%!y$"ue&#ley%%ished$&vellir#%iness%$gham$#tus%!y##ken%\'r-belle\'\'looking\')tailoring&%bells',
+    '&!y$#ies$#lar%\'e-plunk&)r-trained$%undla#$moth#(ned-food$%iness\'!y#"of$&verman#$pane#%quawi#&ryland',
+    '$\'el-hung&$ling\'!y&!s$+ley-dewsnap#+t-molecules$$andu$\'ed-pink%$lize%!r&!s$$ings&(nabulant,$ting.#ons',
+    '$&wistle$!y#%wooey%#rks&"th#)y-brained%)exception%&headed%&leaved&%ittle&&ooking%&plates$4/inverted/underlined$%efusa\'"za',
+    '#"ng##own##ram$"be#&tidine##ugh$#sso"\'p-e-cat$\'holding$-of-the-tongue%#ver$%tanks%%o-tip%\'rotters%(witching',
+    '#&hareth$"ys#"is#*lady/julie\'!s$\'essness$#ing#$offs#&p-exed$$able%$cott$&e-tops%\'r-lorry&\'/friend&$aray',
+    '%\'tt-like\'&/widow%"x.$%y-toe%&/czech#&sheets$%iness#%tanks#!u$"la#!y$(ahlahnah""ql##uet")r&acirc;z',
+    '*";e#.-na-n&oacute;g#%ading$&illeur$#nno%!o#!c#,ed&mdash;the%!-&#not&(of-leeds&(sounding%#est%.ness-behaviour*(syndrome',
+    '$!r$$seus$!t$!z#"ga$-u-mure&scedil*!s##ion#$john#!l#$nova&!o#)onensians$#s-n##pak',
+    '#$rick\'!s%!l$%oloni#(unelveli"\'schenko#!e#$hina$$reen%"in#"io$%phone#!s$(aphernes$-ue-associated',
+    '\')dependent\'%lined\'#off(\'riented\'&padded)%pered\'/typeplasminogen&!.&&/cells&!r&*y-textured%%laire\'!r%%mizer#"ta',
+    '$"ed$#rum#*zanogyores")t-licking%%ooeet#%anate%$corp%#gay%#ica&&ferous&*um-dioxide)(sapphire%&omachy(\'gnetite/)-enriched',
+    '#%chard%$ener%%march$%ombes#"er$"up#$fers$$ord.\'*/carpenter##hby$(e-payers\'"ig%!d%!r&-ington/former',
+    '-3member/conservative%$yard$$onia$\'raustes$#wal#"ia%(n-haired&%esque$)llatingly)#ons("or*!y$$nius$#see$"um',
+    '%!\'%(-changes)$sers\'(linching&(dropping&&hungry&)mongering&%piece&$song\'$tory&(tattling\'$rack&,winning-side\'#ord%&.alice',
+    '&%names&%verso%%pages&$iece%"rs%"s.%"ts%/y/herefordshire$!i##man$%usses#"on%"us$!s$!u',
+    '%!a%!o#%rable%$tors$"ed$&imeter#"s-%\'and-ass#(terstone%"ya$"ie$+le-tattling&%field$%upped$(y-bottle',
+    '#(ualistic#&yanova"$umen$#pan#"na#%tchev$%iunyk")veropolis#%idale(!.#1oli-cin&eacute;ma\'%style&,/application%!o#"vy',
+    '"#wag"!y#"as"!z#!e$+r-sponsored#%iatin##was#&ziness!+j&ouml;rnes*"in"#138"#412"!a##den',
+    '"&edloya#"le"!f##-10#"10"$inas#\'tendero"&olobal#%svold""uo!*k-promoter"#100"\'achenko&!v$!z',
+    '""fs"!m"(varcheli!(l&ouml;n""-2#\'datable#)sensitive"!1#&40,366")2,000,000$\'400,000"-3800/&pound;1"\'412,710"*63,600,000#%7,056',
+    '")9,400,000"0alixcoy&aacute;n)"an$"oc#$tter"&c34074\'!5"!d""ec#%phone##son"!h"#ian#$ngit#!s',
+    '"#ost"#tis""ui""vs$!n!$m-12$!5#!8#%sidhi"%32010""40$"00""91"#bfl"7ca:na=tmca+0.24(urinary',
+    '"!f"!g"#i-2#"mi"!j"#p=d"!r"$s320&"10&#c25\'"40$"40$%90s10#!t"!v',
+    '!#n12#!6#!9""20#!1"!3##.1.##270#!3#!7"!8"$bs/e"+c-dominated$%owned$#the',
+    '"!r"*t-ammonium$)sponsored!+o&formula;c#1iacute;b&iacute;n#/mdash;everybody)%facts)!i*!s#%ndash""\'o"#(9)""-a$"ir$\'nalogue',
+    '$)e-avoided&\'created&\'defined&.looked-at-ness$*loodymorra#\'die-for$&o-list%"or#$face%#kie$#ore#"go#,hell-with-it-(them-all$#ome',
+    '%$come#\'justify#$keep#$less#$make%!r&"ry$#ehu$$oche%*rrow&mdash%%ve(d)#$name$#ess##o-o$\'ne-side',
+    '#$spit$%toupe##the&!-\'&letter\'&rescue&!n$$o-to#%wards$,hit-too-whoo#%yards"$.but#"he#$kill#$lead',
+    '$&rovide#\'reading##sit#!t$"he"!/#,accommodated$&dapted$&mended#"in#,miscarriages#$open#(required#&secure$$hown',
+    '#"to#&useful##wed$#ith"!1#!0#!5#!7$!1##840#%9,000$#5.6"!3""49"#_in',
+    '#"no##one##wit"&accept#(d-badges$"al$$fish$$lets%#ike$$skin#"id#!n#%rcian#0st-and-marmalade&&cinder',
+    '%!.%&crumbs%!e&*d-tea-cake&&r-type%"ie&"n\'\'#ess%\'masters%&y-warm##tsu#(ustralia"*ba-fushimi$/cco-advertising)\'ssisted',
+    '(&drying($free(%heavy((spitting(*to-jacuzzi((yellowed\'#tin$$laba#%bacco$\'ercurry$!i$!y#!e$!.$!r',
+    '#$iano$"en$+n-markowitz%)/customer$"ss$!t#\'lerones#(oganning$$lsky$$zier#)ruk-mersa#\'usiness#(ybalding$$ward")c-toc-toc',
+    '&!o\'!s##hts##ius#&kenham%!r$%holes$%nells#!o$&pherol*!s+!.#*quevillian#$umen#%zyska',
+    '#*ay&mdash;i&\'pound;s%*\'s-instead%\'(thurs)%$-all\'!s&#sat%".c&"ep&"it&$they%)/13.10.93&(22.10.93\'\'8.10.93&*cnn/gallup',
+    '&%denny\'+wh/27/10/93&)edinburgh&&gallup\'!b\'&lasgow&#icm()r/1.11.93*(28.10.93&&london&"my&$only&%pearl%!m&"on',
+    '##ber#*d/alastair%&father&%ormer%&mother%%sands$%brook$(ler-free(%proof($type##edo#(iaghilev##man#$onai##say',
+    '"(e-capped%%rease&&uncher$#end$%happy%#ole&"ok$#off%\'perated$&plated%$oked%$rint$%rings$\'spacers%%ucker',
+    '$\'tappers(#in\'*#gly%\'ouching%$raps#&capped$&urling#$d-in%#out%/y-rhiw&rehy;gou$*i-mesurado#!g#\'ing-off#\'komsrus#%nsure',
+    '#$s-es$!a$"ie%&llitis#!y"&faeono$#lar$#yli##day#$eili#$fana$#ee-\'\'applies\'(coloured\'"er',
+    '&#ish$+ler-junkies$#olo$#rey$\'y-nosed#"ik##ler""g.#\'a-style#"cs#+ether&mdash(!-)$ward(!.)%chris',
+    ')&police($/not(\'_rather($with$#wer%$ther#&ged-up%&nbergs$#ing$)le-switch-+es_in_place##her#$idre$$ther#$lach',
+    '#%nazzi#\'odumnus$*imijustice$!u#$rday#$ston""ha$!n$"ra#"il#"ra#$saku#&u-bohu""i-#"da',
+    '$*/flexitime$3et-bag&mdash;should(\'locking(%ucket\')freshener\'%rolls\'%seats\'/training-indeed&!.\'#ask&)/bathroom&.ries/cosmetics\'#oll\'&y-wise&)s/showers',
+    '\'#ing\'$rain$$ibou#!m#"ra$$easa"&judith$"ly""ka$"cs$$jumi$#lon$!r%$czuk%"ev',
+    '$&lauans$-n-reflexivity%"ed%#ing&(stically&#zes\'#ing%$talk%#yng$!r##ing%#oya$"wa##kin#$o-ru',
+    '%"ye$"za##tok#$u-ru$$naga$!o#)yo-baikal\'#orn%(.similar%!m""l\'$$able#"ab$#gee%"ol',
+    '$(n/thames$!r#"be%&rstead$$rook$%uknin#%d-and$&.lotus%#you$!s#!e$5rabilty/acceptability\'*le-instead&!n\'(ce/level',
+    '%$ince%#ton$&thorpe#"fa$&enamic#$iara$"et$#man$#nas$$waga#(kachenko%$tsya$.ien-influenced\'!s#%l-bar',
+    '&$oard\'$oths%$call&%harge%(financed%&keeper%(motorway%&paying%%roads$\'/pilton$$aidh%"na&!d%!t$#ens',
+    '&%sbury&#vey%%shund%\'y/david$#ies%!n&$gton%#son%!t$\'keepers$#und$#way#$meia%!r$$ides',
+    '##ogy$"sa&$nurn$#use##sey$*on/british$"ta%,oy-disliking\'%/wife\'"an\'!s##tec&!s##uca$,ene/methanol',
+    '%#rne#%wells$#ood#(ypothrix##zey".m&aacute;sovce%%grave#!\'#\'-boyish$*cat/kitten$)haymarket$#tit#\'/helper#"ac%$elli',
+    '$$naga%!y$!r%$i-te%(lborough%!o$$scan%"ik%"si\'"ni&!o\'//trainer/thames\'!n$!t%\'o\'ettes',
+    '\'(coloured\'%faced\'\'ketchup\'$less\'#red(#ice&,es/mushrooms\'!y$#yto#\'b-black&%oards&\'uilders%&chests&%utter%*decoration',
+    '%&robber)#ing%$slab&$tone%%walls$#/of$"er%!s$%leson$"ol#$czak#"eh$,lty-carnegie$&ntosum$#tin',
+    '#"ii$#nga%!i%%omori%$toul$!s$$yama#0lins/grandfather-&mother\')on-keasey)(/surgery#&mahawk)!s%$sini$"ed',
+    '$#ing$&orrows%$tian$)y-gunners&%sized%!s#(nadashan%&hurich#&ograph$$hawk%"ei$"ko$%naga.%#ova$!o',
+    '%#ite%%orrow%!r&,ow&mdash;let(#(2)("**(%-land)&singer(!.)#but)!l))organiser)#sun)#the(#sun',
+    '$!s$$yuki#"pe$$lins$$sett#$rley#"sa$"on#$tits$"om#%ytime"(n&eacute#%-cups$)kilometre$%miles',
+    '$*l-sounding%$ists&#tes\'"ic%.ly-challenging(\'related$"me%!i$"rd%%igumi#\'bridges($ians##der$%guyan$#ino',
+    '$"ut#"e\'$&-\'that%)chemistry%,discouraging%,explorations%&groups%%marks&(odifying%\'on-tone%&phones&(roducing%&raiser%%scale&$hock',
+    '&(ymbolism%\'unit(s)&"ps$$.ray$$d-up$!e$#ful$#mes$$poem$$rlow$#tic$$wood#%fanau##g-a%"bo',
+    '%$term$!.$(/british$*a-kermadec%!s$$eren$#fei$#hak%"ua$&iavalu$%ling.$\'menghui$#res$-ue&mdash;tied&1-and&rehy;grooved',
+    '\'$back\'*depressors\')frazzling\',in-the-cheek)%cheek\'$lash+$ings("ip\'&poking\'*sandwiches(&etting(#lip(\'welling\'\'teasing(\'wisters',
+    '&$land&#wag##ic\'%\'-clonic&*submediant$\'ght.see)"he\')/tomorrow\'):deadlock)&igging$!k%!s$%nelli%"ia#;k&uuml;nstler-societ&auml;t',
+    '$%inese$$onow$#ses%#ing$$unst#$mawr$!s#!n$+ay-charente$\'e-miles%$lets&"le%#rre&(sjoheden%"s.',
+    '\'\'hectare&"en$#ite$$nage#)ofibrilla$$ight$%meter$%plast$%scope#$quin##roe$!y#2s/hairdryer/heated$$berg$,il-trembling',
+    '&&litis.$%orial)-ly-challenged&!s$#ura##teg$,o-hairstyled#!u$!u#"y-%=coton-at-man-city-last-august$\'/former$+pandy-based$&refail$!s',
+    '$%mdash$%ndash$/rehy;constantly#"\'.#!-$(abstract$#big%#usy$(circular$&dainty%#eep%&istant$%eager&#rly%(xpensive',
+    '&&ithful&\'r-miles&"st&!t%#ree\'\'quently&&iendly$&gentle%#rim$%happy%%onest&!t$/individualistic%!t$+little-seen',
+    '))neglected&!w$)obtrusive&%vious$$pale%\'enguins%%olite&&werful%%ublic$\'readily\'!l&$cent%#ich$9sensible-for-his-own-good%$hiny',
+    '%#low%0mall-for-comfort%$ober&"ft%$tiff&$rict\'#ong%%ubtle%$weet$(thorough$$ugly$$well(+-celebrated)(informed%"it',
+    '#".i$$thus#!/#$bin\'#!d$$aloo$\'le-pip\'&"oo&#pip%#ing#&gether$(ood/shop#*hoolhlzote##k-i%(monetary',
+    '%"up$*atookatook.4atookatookatookatook$"ed%!n$$over#&l-belt%#end%$free%)hardening&$ouse%$like%%maker%&pieces%$roll',
+    '%#use%$worn$(/crimper$"an&!d$#bag%&uilder&$ster$%ed-up$&holder$"in&$g-up$\'kit-8in\'!.$+s&ndash;and',
+    '&\'looking%*/equipment&&skills$,talk-enabled$%watch%$orks#\'malatai%!s$&bridge$!e%!r#*n/director-%/leys%&master$#agh',
+    '$!y##ooo#"ps#!r$"ak$!d$"op#\'t-sweet$#als$"er$+h&rehy;ache%!-&&aching\')nd-socket&&cavity',
+    '&\'forming&(grinding&%marks\'"ug&&nibble&%paste\'%lates\'&ullers&%relic&%sized\'\'pitting&%white%//air-gap/stator\'"nd%%ache.',
+    '%(brushes.%$carp&$ombs%(ed-plate%$iest&"ly&"ng%(lessness&#ine%$mugs%+paste/brush&\'luckled&%owder$"ie$$sies',
+    '",p&rehy;class)$four)%grade)%heavy)%notch)&priced)%roped)&secret*\'pending$*verbar;btm##\'s.#%(ish)$"t)#$-100\'(-selling',
+    '$!5%!0$*and-tailed%)ttraction$\'billing$\'coating%$ross$#dog&*wn/control%&ressed$\'earners%#dge$#fed$\'grosser%"un',
+    '\'!s%#eat$#job$)left-hand%\'ighting,!.&#ner%&oading$&marker$\'notcher+!s$!o%\'f-joist\'%range\'(the-bill',
+    '+&market+$neck+%voice+%world&+f-the-brain%&pening$$page%"it%%laced%$rice$$rail&"nk%$opes$$sand%%eller',
+    '%%hells&"op%$peed&"in(#ner)#ing&"ot%&taying&&rength$%table%"o-\'\'bottoms$%value%%olume#%.down',
+    '$!l$#nga$)z-bearing#$chic#$down$%rawer%%essed(#ing##eca$!z#$fler#(gallants##hat$"et#&iaried',
+    '$"c\'%(-closing&+directional&)initiator&$loan&)neutrally&$plus\'%oints&(shifting\'\'pecific\'(tructure&$type%\'/author&$noun%)alisation',
+    '($ties(#zed\'(ly-named\'-streptokinase%!k&!s%)s/authors\'&issues\'&themes$!n$)somerases##jet#)knot-tail$"ov#$lady',
+    '$%ights%!t$$oski##men$%innow%!x#%notch#"o-$+climatology$(function$*graphical.$4logically-equivalent%(ski-itis(\'/former$&metrix',
+    '%!a%$cope$!y##pan$-ed-and-tailed\'"up&!.%#rs.$,ier-sounding%$gala$(le-proof$!y#!r$!a%$isar',
+    '$#ope##s\'l&!s$%/cabs$%corer$&elling%!t$!i%#der$$lice$%oiled$$pins$#ter%&itcher)#ing',
+    '##ten#"up#\'weights$#ith"%q-toq#%uinho"&r-like$$ture#$/pym##abi$"da$$h-in&)observant$$jans$$lien',
+    '%%field%%osuke#&banite$"in%"on$$rien%#yan$"sy$!y#,ch&rehy;beam%)-carrying&&hearts&%light+!s&"on',
+    '*!s%$beam)(-pierced(#rer%"ie%$less%$mark%"on$#oth$$uato#"da%#unt$"jo#\'e-apply%%enter',
+    '$%adors$#cha$$nias%$tanz$"ro#\'f-skeri$$ason#!g$&ellini$$gate$&ormack%!s$\'yan-led#%house$%tmund',
+    '%"s.$$gian%"ny$"ll$$nese$"on$!r$&sholme$"ta#\'kildson#%loisk%#nia$$undy##mae%"in',
+    '$"ek%\'nt-wise\'!a\'$edly("rs\'$ors.(#sas$&inalis%%sdale$$ogen%#ham#(n-haired%$open$$adic&$oes.',
+    '%!y$!e%$does$"io$"oe$"us#$odov$#ghu%$oces$#ids$"la%!d$(nay-five%*i-vilmouth%1to&ndash;kingston',
+    '.\'niagara\'%-born\'$nian+!s$"ro$#tel#"pe%\'do-boat*$mber((handling($like($nose(%sized(%tubes\'!s',
+    '$#ids$!o%$rley#&quayor%)e-passing\'$rise\'\'tighten&(/current\'\'inertia\'0position/current\'$tail%#ier&#lla#%rabus%-nce/blackbird',
+    '%\'s-owned$\'ebianca%&chiara%!l%#nns&#ova&&t-beds\'!i%"ro%(s-garcia&)fisheries$$iani%!c%#dly%$ense',
+    '&$iani%*jos-carter%$nhas$#one$%yburn#,schlusspanik$\'ion-bar$!k$%landa$,o&rehy;sized$&trasse$$vale%$ille#%telli("er',
+    '$!i%"on\'"al$*oise-belly)\'fancier)$like)&necked)*shell-like(!d(,shell-framed\'$hell\'#ing%!n&!a&!i',
+    '&$ella%"sa&"sa$%ugero&$uero%*la-grimmia%#osa&)us/scenic($ness%!r&$able&)e-chamber/!s(%house(\'induced',
+    '\'#ngs#%ukwon$&s/ware##vil#"y-%\'backing&#lue%#fed%(inclined&"sm%(jacobite%&labour&&iberal%$made%%style',
+    '$%bimbo$#dom$$glen%$ragh$%speak#$zhok"#sas#$caig%"ni\'/ni/koussevitsky*#rca#%eland%"li##her$#ida',
+    '%%michi%"ro%$yasu&#oki$!o##ini$!o$!t#$link#!o$!h#%s-off%#pot(!s$&ed-out',
+    '$$pots#!t$"ao$$ones#)ufloxacin#"yl"%t-she##aal$$cide$\'l&mdash%!-&\'amputee&(football&)immersion\'(ntensity',
+    '&%total%$/fit%#205&\'3119250%%9,000%$=sum%"ed%$ised(!s&\'tarian\'%#lie\'"n\'&\'y-owned%-s571017305224%\'theater',
+    '&#nui$"sl#\'e-boxes%#pan&\'ortland$(m-father&)pole-like*!s&\'worship%&ically&(stically$!n$!v$#xas#*hillfields',
+    '$*rombolytic#%leben##obi$%n(to)%&icapan$"ra$"wa#%sikas$#uka#&t\'ring$"an$"el%%nham0(!n%%rnhoe',
+    '$&ing-up&#ham$#ori#!z"%u40er#$areg#$bert$"ro#*ch&eacute\'&*rehy;paper%)-and-goes*#try)$=try&(dampness&%holes',
+    '&+of-a-button)*the-button\'&pening)%rated&\'parking(%ssing&%ropes&$that\'%ypist&#ups&#wah\'#orn%%/feel%&:pleas%$bank',
+    '%/e-&agrave;-tout&&d-down(#her("up\'!.&\'s/skill&"th%#ier&"ly&+ngly-willed%%judge%*line/crowd)!s&"ok%#pad',
+    '&$oint\'"ol%!s%$tone)&/pulse%&vision#&ggourt$$h\'un%)-as-nails&*bargaining&$guys&&it-out&&leaved&*mindedness&(speaking',
+    '&\'wearing%"ed&&ned-up&)r-looking(&minded&\'st-ever%#ies%$test&$rack#%hgest$!y##iss#$jour##kie#&lagian',
+    '$#oum&%sians#!m$%anova$#ert$!i#(nderline$&eyadzi$$goon$"is#0p&eacute;e-taped$(e&eacute%\'e-cases\'*tricksters&!d',
+    '#$ques#"r\'$#(s)$$-day%\'expired%1gittel-plus-eight%"in&#sts%&nament%\'opening%%style$!/%$stay$$acos%!h',
+    '%"ma&#ent$\'billons$%coing$%elles%%ttish$#ha\'$$ism*\'&-based(&driven((oriented(\'related\'!.\'&/hotel(,recreational',
+    '&(t-appeal()conscious($free(*generating(+information(\'related)%idden((shooting)$tyle(\'traffic+!p\'"ed\'&ically\'$less$$lies',
+    '$*n&eacute;e%$adre&"i.&+ment-proper+\'winning*!.&"nt(\'&agrave&!y%(e-pierre&#yed%%iayre%&mament%"od&!i',
+    '%"us$*s-en-vimeu&(poitiers$#tel&&relles\'"on$0ville-la-riviere#*s-azimuths$#and$"he$(led-hair)%eaded(\'tressed$#sus$#ter',
+    '$"le#!z$#els"!v#&alieri$$rish("ch&#tch##dal#$iere$"ll"+w&rehy;rope#%-ball&!r\'"ge',
+    '$&carbon%\'oloured$&headed$$lift(!s$%ropes$&trucks##ans$!r%\'d&ndash&!e&"ly$"wa&"ys#$back',
+    '##car$6ester/northamptonshire##el-&&draped($ying&&fights&&headed*!s)#ter\'&olders&#off&$rail*!s%)ling-look&!s',
+    '%!.%$head%$less%\'s/group\'(harrison\'(resident($over$!s$#ver#&hshend#(ing-away%#nie#%lines&#son#;n&mdash;first&mdash;because',
+    '$!\'$!-%(aspiring%%child&#lub&)onditions&$rier%%dumps&\'welling%$gate%&laying&#ife%&manure%$site%$type',
+    '\'%llage%\'workers$#.58%#now%#why$%/area%%brush%(shopping$%bound$#ers$#ful$$hill$%ified%"ng%"sh',
+    '%#oad$%parks%)hotograph%\'lanners$0s&mdash;prijedor%%-folk&&people%$.the%,end/district)%fruit),headmistress)&oxford)\'pervaiz)(stabbing)&worker',
+    '\'!.%.ley/commandery))organiser(!s%$pace%$tall&#yle%&womens$$town$%women$!y##paw$%lanes#"re$$ope.',
+    '#"se#"te"&xacara#$emia#&icaria%*ologically&%mania$.n-contaminated&)producing&%users%!c$"ty#(o-captia$#don$\'philite',
+    '$#tes""y-$(approved$$boys$#car$&filled$)scattered%&oldier+!s%%trewn#,akata-kogata#)ed-around$!s#&irural#!l',
+    '$!e#"me##obo$$haru&#shi%#iro$"ki%#ura$$nian$\'ta-benz%#omi#%town."#zaj!)p-thermal""/9',
+    '"#276#/80/g&ndash;btxe\'%-btxe"$810v")a-induced$\'plasmin#$/gkk"!d""ha"!j"!n"(o\'mahony"!r"!t#!p',
+    '"!y#&dinqml!"q5"!a"!f"\'m-based#!1#!2!4r&aacute;s-os-montes#3eacute;mo&icirc;lle*$port*#ves+$iers,#lle$&circ;s',
+    '&\'ave;fle#)oacute;ia*"ja$-slash;msdalen*(ndelagen-#rfe#/zcaron;i&ccaron"#-1s"%1/tr2#!0""24#!5"&6201/4%#2/1%#5/7',
+    '#"20"!9"2a&icirc;n&eacute;e$)ndash;yth#&-la-la)$hing#!1##ack$!n#!b$#aci%7jadores-convenci&oacute&"os%#ria$!b',
+    '$&eation%#cca$%hakar$%oulsi$"uc%#dge%(t-cussac#$ccks$)e\'n\'paper%--element-rich-!s&&fossil&"ii&%metal%(.fossils',
+    '&!2%"d.%#rco&&y-like%"s.%"ys$+heal/caecal("is\'!s\'#ted(%ional&"dy&$itis&&liotus\'(ospermum',
+    '\'#lar%$odon&%nitis%\'ycarpus&#tes$!i%"es$-k&rehy;suited%"(i&"s)%)-bouncing&\'diagram\'%riven&\'hoppers&(lighting',
+    '(!t&%miles()schievous&%owner+!s&\'records\'&unning&$side\'%uited&$time&*while-scan%)/footpath&\'jogging%$able%$down',
+    '%#ies&*ng/logging(!s%&lights\'%sting%#man&&eister\'!n&!o%+s-and-signs\'&though&!.&$ides\'#zes&$ters',
+    '$$omin$"t.%#ate%$ible&)on-engine%&ometer&&r-beam*)lt-driven(&driven,#ing($feed()lawnmower)#oad(\'pulling(&rutted',
+    '($taxi\'"ed%"us$#y\'d%#-jo#%d/rap$\'ability&#les%"te$%budge$$coms$$dies%#les$\'e&mdash+$;and',
+    '+(weighted%*-conscious&&fallen\'&inance&%goods&+in-discount(!s&.liberalisation&$name&$off-\'\'riented&)replacing)%orted()taliation&&source',
+    '&/union-sponsored+!s%#.58&$this\'(ribesmen%+/profession&\'transit%\'ability%*d&mdash;is&&-goods\'"in%%named)!s&"ts%*r-in-chief',
+    '\'$hips%&s-coal)+uncil-based&!.&\'manship&$park&#ton&%women%"up%$wise%%zines$/i&rehy;tionally%+ci&oacute;n%&derunt%\'ng-fund',
+    '(%peace)$osts("up\')/clearing(\'service\'!s%&onelle%\'stiunta%#tio(\'n-based*)conscious*%laden))al-shaped+-/conventional+%istic',
+    '.\'english.)patterned/&ointed.#run.&shaped/\'ituated+!s*"ry)$elle("us&!o\'#nal*$ists*"ly$&tional',
+    '(!s&#ing#(ethodydd#"ff%/ic&rehy;stopper\'*-affecting(\'bearing)$ound(&filled)#low(&grimed(%hells(\'induced)&slands(%laden',
+    '()offenders(*restrained(&scheme)%ignal)&lowing(&warden\'#.36\',/liveability\'!k\'$less\'&master\'!o&!k%)ord-bound(\'.fergie',
+    '$#ice#$gara$$edia\'!e&"y\'\'(-centred(\'haunted(%queen\'&.calls\',/impairment/%$tted$$goon$%hetto)!s$&i&rehy',
+    '&(romantic%(c-comedy*"ic&.ally-curtailed&&omedia*!y($ical##hie%#son##ian$#cte$!d$.l&rehy;blazing%!\'%\'-barrow',
+    '\'#oss&\'markers%&baston&%lazed*!s%#er\'\'\'-blazer(\'hauling($wise\'!.\'%train%)ing-edges(,/consequence%!l%"s*',
+    '$,n&rehy;crews+(spotting%\'-animal((nouncing&"be(%arers\'$oard(#rne\'$uffs&(carriage\'#rew&$daft\'\'etector&(lighting\'$oads',
+    '($ving&#mad\'$iles&(obsessed\'(perating&*protection&$ride\'&obbing&$sets\')potterish\'#top\')upposedly&*timetables\'#our\'$ubes',
+    '%$/bus&+ferry/train&"he&$with%!a&"nt%&bearer%!e&$d-in("up\'&/paid/&*e-computer((teachers)&rainer/!s',
+    '&&r-clad((fighters(&jockey(\'manager\'&/owner(+participant(%rider(&tourer)%utors\'+s/assessors),facilitators%#ful%+ing&mdash;a(!-)%board',
+    '*&ourses)"of*\'riented)\'records)&scheme*$hoes)#the,&rapist().colleges(*/assertive)+development4*/personnel)+educational*,mployability)/familiarisation',
+    '),professional)*recreation+(training):staff/development/research(":4($_and*!t)"in\'"ng%&makers%1s-cars-aeroplanes&!.&"et&#hed&\'potniks',
+    '%$time%!y$$pses&#in\'$"st$1t&eacute;-contrat-"es%//characteristic%%erous&!s%\'oresses%!z$\'vellers#&kehner$*toreksport',
+    '$!a%\'titious$$haut$$lwyn$"os#-m-conductress%$duty%,like-a-train\'#nes%&makers%$only%$ride(#ing%$stop%#ttm',
+    '$&/train$\'drivers$%eleuc%!n%,za&iuml;gues&$zini$$iner$#med&&llings$#ore$%p-art%#dom%!e&$d-on&"ss',
+    '%!o&*line-cover*!d&!r$$shed(!s$%track$$way.\'#man#"n-%(european%%sport$.ce-channelling\'(inducing\'(national',
+    '&!.&$land&\'ndental\'&tental&&porter%$hes.\'!t("te%"ik$&ducers$!e$#fer$!g%$enic%!o',
+    '$#ing$$kell%"le$#nes%"ie$$port$!q%.uility-seekers("le)\'isation++er-addicted(!s$&s&rehy*,;continental+(european',
+    '+,historically+&judaic+\'mitters+\'parency,#ose%)-activate\'%egean\'%frica\'&laskan\'$sian\'(ustralia\'*vant-garde&&baikal&&canada(\'ucasian',
+    '\'(utaneous&.denominational\'+ihydrodiols\'\'ominant($uble&+en-provence((terprise&%field\'#orm*%ation&(globally&)himalayan&)isomerism(&thmian&)migration',
+    '&*nationwide&\'oxianan&(personal\'\'honemic\'2oly(1,3-butadiene)*(isoprene\')rovincial&(racially\'\'egional&&scabon\'#hed\'*ituational\'%oviet\'&pliced\'&tellar',
+    '\'$okyo&%world%&accion\'0tion&mdash;which+!\'+!-,.by-transaction,&hungry,%level,&secret,.to-transaction+!.+&alists++s&mdash;the,,/settlements',
+    '("or(!s&&deuche&#lls\'#ted&!m\'%erica&#nal&#rch(#tic&!t\'$ions\'-lantic/europe&#via&#xle',
+    '%&caspia&\'eivered\'1ndence-as-surplus+&talism/"ty,#ial\'&rvical&\'ininase\'%ption&$oded\',mmunications\')njugation&%ript.*&/srrna*1ion-amplification',
+    '&&ytosed%&dnestr&\'ominant&#uce)!s("in%%earch&%cting)+on/resuture+!s&)n-dentals\'(doscopic)\'thelial\'!s\'$tial',
+    '&%thnic&\'xuality*\'s-three%&fectam)$ion.\'%moral\'*r&mdash;20/(schedule(#(s)(&-print."ed)\'seeking)"to(&/lease),redeployment',
+    ')+nce/counter)"rd(+or-assignor*+/transferee($red=)#ins&%igure+!r\'"ll\'"ni)"te+!n\'%xedly&.orma&rehy;tion*#ble',
+    '/*generative.!..-al/generative0#ist)*er-coupled+(/adaptor,)rectifier+$less)#ist(%rning%%gene.)(rational&%lobal+"ly)!e',
+    '*/ion/containment-"s.%+hepatically&\'ipments&$uman*#ity*"te%&i-lion\')plaza-the&*lluminated\'$vano&,stor-powered*+s/heatsinks&&t-load(&taking',
+    ')#ube\'!e(!d\')ion-metal/%phors+%stage."te*#als(/ve/intransitive)\'ity-and\'%orily\'#ray\'#ted(#ing%*jordanians',
+    '\'$ngle%%keian%\'lacions\'$ters)"se(1ions/interpreting(#ory("um&%inear\'&terate&\'ocators&(ucencies%&median))terranean\')tallation',
+    ',!d\'&nistry\'+s&rehy;sion(*s&rehy;ion)$able)(ion-like-$type,/retrytimeout=45*$vely+%ities\')t/receive()ted-light,)reflected*=r-cum-microphone-cum-hologram,(receiver',
+    ')%tance&%obile\'%grify\'"re&&ucosal\'\'sicales%#net\'(uronally%+oesophageal&)m-sterned\'"es&%xania\'%ianan(#des%&palene',
+    '\'%rents+!y&+eritoneally((sonalize&$hase&&ierced\'$red.(#ing&(lacental(%ntion*$s.in&&onding\'&ration((t&ndash\')"**',
+    '*&backed*(services**technology+&raffic)+/conveyance*$land)$ants)$edly*"es**r-mediated*#ven)#ive)$node\'$sase("er',
+    '\'$tech&\'ressive&)schycosis%%radio&)eflective\'&gional&&henani&$ipts%3sexual/transvestite&.ib&eacute;rien($eria&\'plicing%#tab&)elephonic\'%nsion',
+    '&\'horacic&\'ubation%%udate*!s)#ion&&lucent&\'rethral%%vaals\'%ginal,"ly\'$lues&!e\'$nous+"ly\'\'rsality',
+    '%!y&&lvanis&!t$%telle&+r/transport%!o%!s$$zair%\'ophobic#+p&mdash;but$*-breaching%%doors%%maker%\'nesting$)/catalyst',
+    '%*zium-first&$oids&&untine$#ley%$ines$(pability\'"le&$toni%!e%$ists&"tt%!s%!y$"s.#&quandi',
+    '#%schen$&h-cans\')ollecting&&filled&$heap&&strewn%!.%\'/sleaze%$ings%#men$%imene$%kites$%lated%"er$\'mission',
+    '%#fer$"si#$tado\'!s$!e$#han$$tato$%zberg#%uaile$*blingerhof$$chle$(ergondel&&marsch\'$usik&%spiel',
+    '%&a-free\'&ridden&!.&,/deprivation\'\'nervous&%genic&%tizes\'\'ologist%!e&$nden&#rei%!s$#rig$$tman#-v&rehy;elling',
+    '\'"en("ur\'"le)!r)"ur(%istes%"na&"ca\'*ore-cochin&"ti%$ssos$*e-massuyes%%eling%.l&rehy;stained&!-',
+    '(%gency+"ts\'#bag($ooks(\'rochure\'#cam\'(document\'\'expense\'&folder(\'riendly\'%guide\'&hungry\'&loving\',on-the-cheap(\'perator',
+    '(#ick($peak($tory\'$they\'\'writers&!/\'-communication\'\'holiday\')resources\'+subsistence&#air&#bag&%force&%guard&1ler-ethnographers',
+    '*$told)&/gipsy*/narrator/reader)"s.+*landowners+)villagers\'\'ing-bag+(carriage+#rug*0/bridge-playing/+(teaching\'#ors&1odge-to-posthouse&/s&mdash;tourist\'#and',
+    '\'%right%#nol%!r&"sa\'"ez\'+i&egrave;re\'!o&$tina)(e-marble%#sti("ed$(is-based&%/disc&#her$%llers',
+    '&(ta-style(!/$%unija$#yth##wan$*ler-owners+#ing##xit$#ler#&y-bake%$load$%cloth$$fuls$%horne$#ler',
+    '(!s$#ner%+or/scottish$&washer(#ing#$zlor""ba#\'utaline"#c15"!d"#e\'r#&-nails#$acey%$hers%(le-brown',
+    '($like$(d-impact%$cole%#dur%"er&"th%&ing-in%*le-powered\'!s(!s&#ing%&master%%wheel$#gus$!k',
+    '$%mtent&,nettreatment$!s%!e%(on-until\'(.l&ndash%&urably\'%e-box)%hoard*%unter)&seeker-#ing)\'troving(!/(%house',
+    '*)secretary)(s-at-war*$hips($ship\')y&mdash;w(%-bond)(financed)$held(!/)\'cabinet$-t&lsqb;s&rsqb%%ed_as\'$with&$ment%-ies&mdash;for',
+    '%%ment\')+-especially*%rooms*$time)$.and)+/curricular*$damp+$rugs*,intervention)"in&$nent%"y\'&!-\'(aircraft\'\'limited',
+    '\'(revising&$.339&*/libations&#358&"se$#ure&!y%$sres#\'barwith%$with$%biano\'$tura$&erfydd$0ilcock/probation(!t',
+    '\'&chance(#lef\'%heavy\'%violl\'\'winning&%/bass%%iness$%onius%#rth#\'cadifor%$rrel$%herie\'#ous$#ker\'!s',
+    '$"wn$$ynon#*degar-born%$nham$#get$&innock%#sgn$0worth/gloucester$!y#-e&lsqb;s&rsqb$"\'/$#(s)$!-%)and-shrub%#boa',
+    '\'*nversation&&rowned*!s&&utting&%yling%&decked&&iagram&%otted&$warf%\'fellers\'#rns&)lattening%$girt%&holder%%light',
+    '%&nester)!s&#ode%&oceans%*pipit-like%#rat&&ewrite&\'oosting(!t%&scapes&%earch&$hade)$owed\'\'eltered\'\'uttered',
+    '&%nakes&$tock\'\'ructure%$top.(%pling&(ree-tree&$urns&#ype%$walk&#ife&#ood&%recks$%.does$+/artificial%!f',
+    '$&branch%"ys$"ds$"es$$frog%#uls$$horn&$uses$$lets%$ines%#oad$#men%&onisha$!n%!a',
+    '$!p$*s&mdash;as%&-great&%worth%!.&#but%!/&&bushes&"no%%capes%%nakes$2tops&ndash;samburu(!.%!s#$ffer',
+    '$#lyf$&oilers%$nnen$"ri&!w#"ga%&minion%$ntle%%rthen%$stel$%eagle%$lles%#nna&"za$$lown',
+    '%$ning%%thnan%"ze\'*/wiltshire$$ubov#$hame%%ndiri%$rnes$,erne/wyevale$#olt#-ib-seelisberg%*seelisberg$!f$$gnac$$ster',
+    '%!s#\'k-style$%force$#ing$%king.$%style#\'lawneys$+ford/editor$&issick$*lis-backed\'#age\'%works$$oars%"up#*m-y-ffridd',
+    '%#ine()/villager%%tomus$$blet&#in\'("g\'$$ella(!n\'"en%!n&#dum&%heere&!s%%trics%%zzina',
+    '$"my$%ndous$&olandi\'!t&!i&(o-picked%%r_out&"ed&#ing%"to$#per%%olino$!s$#uit%%lous.',
+    '#%nails%"nt$&cavels%#ern%\'h-built\'\'filling\'(strafing\'\'warfare&*/reception&(erperson&$foot&$less&#mac&%works$)d-getters',
+    '\'&urface%&=0.000*!1(#132&$3.32%#all%"ed&\'lenberg%%ified&&ly-cut%"le&#ine%*s&lt;0.001&#ome&\'potters',
+    '$#ear%#man%!s%%thick$$gate%$irth%#ove$%haile$#kie%#ler$!o$"se$\'t-jones%&/biffa%.125-1308.254.5',
+    '&!l%#man#$owen##pan&%ation&$ning$"ca$$ewet$(hination\'!e\'#ing$"id&%antly\'%tions*$usly',
+    '%&stomes%!v$%pchen$$sack#(rulefoot#%saith%$vean$&basses$$ckow$!e%+der-griffin$#goz$!h$%idder%"se',
+    '%"or%"ur$-pass-offering$&s-shop%#art%!e&!d&!l\'!s%$ider&$lian$$tled&#ing%$rail$#ury',
+    '$!a$$hevy&#way\'!y%%owans#0uhand-controlled(%stalt$!t#&vallyn%$than$#ean%#cca%$llas&.yan/production)!s',
+    '&!t%$reux&!i&$orum&)ton-jones%$thoe$%iglio%#lle(!t%"ra&!i%!s&)/director&"an(!i',
+    '$#one%$whan#\'wennack\'#ick$%hella$"ia#!x$&acarna$#eno#$ybig#"ze$%ibond$"zi"!f#"ue',
+    '"\'housand",i&rehy;umphs#\'-allate%\'nnually%#xle$&bucket$$carb%(entenary%,hlorethylene&$oral%(omposite&%uncil$&ethnic$*federation%*ilm-tie-in',
+    '%%ocals%\'unction$$gear$+iodobenzoic$%level$(metallic$\'nitrate$(p&eacute%#ada&#rty%%ortal%\'rotocol$&scorer%%eries%$haws',
+    '%$onic%$port\'!t%*tar-shaped(!s$&vision#!.#+able-either.$-way$\'canthos%"le%!s$(d/tetrad$+l&mdash;and%(-by-jury',
+    ')%trial)%video&\'damages&$size&(to-trial%\'eurodes%!l%$ogus%+s&mdash;see$#nco%#dis&#rus%)gle&ndash(!\'()-language',
+    '+\'section*"ly,\'-folded*!s)#ted*"us%#ons$#rch%"yl$%ssic.$%xises$$zine%#ole#-bal-acid-funk\'*influenced',
+    '\'&rights&#ise\'"ze&#lat%"sl$"e\'%!r&!g%(s-people&$folk$%olium&&ogical&+uminescence%"nd&#ian',
+    '$!s$!u%%larer%-nal-appointed)+substitutes&)e-journal&!i\'$cian\'#tes%.te-assessments((children((district((exaction(%lands)#ist',
+    '(\'payment/!s\'!/&%yltin#&c-trac$\'alarium&$cium%)rboxylate&#ico$0e-rolph/champion$"ha%"et%&inella\'%opoly(#sis',
+    '(&ethane(!o)+isocyanuric)(melamine+%thane0!/)/trifluoroethane%&ocarpa&#gen\'&lossus&*lorotheane&%manis\'%onads&&phylla\'%lusia',
+    '\'%teran*"us\'"us&\'strongy&\'thecene%%uroid$)k-cyclist-!s&&diving&&ending&&feeder&(or-treat.!s&%rider%#ers',
+    '(\'charged.!r("on%"s.\'!5&"es%$wise%\'y-dicky\'\'looking&$dick$&linium%$opyr$%oleur&!o\'!n',
+    '%"mp%"ne%&teuses%%uleur$$ulzo%\'spidata(!s$+yanobenzene()methanide%*cle-geared#&dactyl)"us$"el%(nt-based($head',
+    '%&ocolor$$imas$$snap#&ebling$$d-to$#mli$!n%!e%$nale%"to$#pel$%rarch%$main$"s.%!t',
+    '$-thylphosphine%!z$$wald#$fels$%fling$#ids$%lauto%&e-dish%$ing\'%"on&#rum%*uoroacetic)6methoxycarbonylcyanide%!y$$oria',
+    '&!m%!x$%thorn#,g&rehy;gered$&-point$#amy$*g/birdland&-neighbourhood%.er&rehy;finger\'+-controlled(%event((features)%inger(#off(\'release',
+    '\'#man\'$this%$ooms$#lon%#yce(-ride-carrying-(enriched$/onafulviventris&#ids&\'ocarpus(\'ephalum$!s$$well#\'halides$&edrons',
+    '#%junct#%klone##lab$$bied$!e$%ineal&&gually$"la%"er%!i&"ck&$ngly(!s&)on-dollar)$star',
+    '%"s.$#oba&#ita%#gic\'"es$"yn#+m&umacr;rti$(-fitting%\'quality%&rigged%#tab&#rab$$.the$%alert%%zepam',
+    '$$bach%&lemill%%oards%!y$)don-based$&ebutin%!l&%litic%#ric&!s%$stal%+thoxybenzyl\'*ylaminuria+&monium)%silyl',
+    '$$leys%)y-dressed$%mable%\'ed-down(#off%$ing.$$nell$(olecular%%ntium$%saran\'"en$$urti#"n.$&acrian$#ga.',
+    '$&ian\'s.\'\'s-style%#bis%(dad-born(!a((ian-born%"ta&#rin\'(otoluene&"y.$*ket-seller%$haus%"le&#ing%!o',
+    '%&vantum$)quetaille(!s$!t%%ellas%$opec$\'ucleids(&otides("us#(o-finale$*de/pentode$$lian%#ogy$%mphes$$naid',
+    '%#gle$!p$%sseum$!x#4p&rehy;of-a-lifetime$*-and-throw%$free%&hammer%$like%\'tropped$!.%#his$\'/trance$#_on$#ang',
+    '&\'saidide&!t\'$isan%#thi$$ball$"e\'%#dal%&hounds%&ptides$)hammering%$enyl)$ated%%ibian%$ones&(sphatase',
+    '%&thongs%$ylla$"la%.e&rehy;century,\'subject&!-\'&action(%isled($lbum(#rch+"ed(!s\'\'bogeyed)$nded(\'ridging',
+    '(%elled(&hecked(\'ounting\'!d(#eck+"er($igit($omed\'%edged(&ngined((xpansion\'(filtered((ractured\'\'glazing(&rating',
+    '\'+handicapped(&onours\'$lane)%yered(#ine($obed\'$neck(&ippled(#uke\'#one\'!p(#ile(&ronged\'$ring\'\'stalked',
+    '*#ung\'$take(%iered(\'onguing)%wered($rack\'*unrequited\'%woven\'$zero&\'.length&$core&)d-towered\'%ecker&$tail\'!t',
+    '%&icated)#ion\'#ity&"ke&#ngs%&oblast&&chiton&#idy$(od-fired\'%style&,/mini-tripod&$ally%#lar&"is&*yphosphate',
+    '%#ses$$pies(!t&%ng-up(!s%"le\'$horn\'#ton&#ing$*s/accident&(meetings$%tazol%#ich$#yer#(quetrous',
+    '#2s(dithiadiazolium)$\'-borate+%-edta("ic&"sa%#hc1$%/edta%#hci%0methanol/glycine$*accharides%#nna&#ton$$cale&"ri$$haws',
+    '$$land$(megistes$$omic\'"es$\'pinosus%#ort$"ta&!m%"es\'"sa%!i&!a&!s&#tia%$ram.',
+    '$#ure$\'yllable##tel%\'rpenoid,"al$%heism$&icaily&!i\'"um%(um-based$)ocerebral%&n-born$$rust$+sch-tratsch$!t',
+    '$&urated&"is&"us#"um%&palism\'$ntus&"h\'\'3-of-miniaturisation($song\'2/leyland/bl/austin\'$alia()ntly&rehy*!s(#tor)"us',
+    '(!r(!s$!s#!v$&ariate$#edi%$neto%#tte$$ial\'$+selspartiet$\'ulziana$%velin#"xi%&ebelle"%kulja',
+    '#"by"$mptd";na(&psgr;35)pseudouridylate+340)-pseudouridylate%6gm18)methyltransferase$!-%-modifications*$ying%(variants$*/aminoacyl#$jani#"ka##ovo"&o-uble##arn',
+    '#&barrow##cal%!r%!z$#har%(etiopsis%&ilidae$%kener#\'dden-on$$uced#"ed%$sson$&glhand$#zen#&ffling',
+    '##ger$#gin\'!g$\'ir-born$)lodiplura$"og%!n#$iani$$list&"te$\'s-puits&&villes%$dord(!f%"sy',
+    '&"no%%skaya$%zenia)!n#!l$#ium$\'l-madam%$bane%"en&&y-full($load,!s\'"ed\'$head\'#ish',
+    '\'%s.but(#afe%&igarth&%ngand&"us%$ope.(\'/writer("an(#ian\'!s\'!y%$skin#(m&oslash$!a%!n',
+    '%%icula%%ones.\'!i(!c("ng$&etamol&&hamine%"ur$(p-l\'oeil%)e-l\'oeils&"au&!r&"ts%%illos&"ng',
+    '%%&ouml%!7%#oe.#&nagers$!c%#het%#oso$(dhjemite,0-tonalite-dacite$"oh$#smo#!o$$lin\'$*p-carriers\'+ontributing',
+    '&$ship*!s&%train%+/blumenthal%,ing-aircraft%)s&mdash;a#\'paeolum$"ea%$z/st$#hae%$eops&$ryma%*ic-dynamic(%level%(oblastic',
+    '\'$hung*$ting\'%laden\'\'winners&!.&$less&#man&!s$\'ic-blue&+al-coloured)$fish*%orest)%style)$type)&weight',
+    '($ismo)#zed\'#nas\'"rr&&s-wide%&quaria\'!e(!s%!x$\'logical$\'oj&euml&!e%&myosin\'#sin%#nin',
+    '$!s$$wood#%savat$$chin%%ianko$#ser#%teman$(h-plight%"ed$$sky.$+t/reporting%\'er-bone\'\'/former(#rsi(\'teacher',
+    '%"le%"on$%woods#*u&eacute;e$3-ou-ou-oubles&mdash$!b%!k%(le&ndash(+rehy;hunter\'!-(%cases(#fee(\'makers.(%prone(&saving',
+    '\'!.\'&d-funk\'$free\'\'s&mdash(%hoots*!t(\'omeness(#pot\'!w&#in\'("gs$+gh-drinking\')laminated(#ike\'&shaped',
+    '&\'.shaped&"ia$%illot$$nces%#sem$"ps$%sdell%&er-and)\'rousers(&bottom.!s(%cuffs((dropping(#fly)$ront',
+    '(%happy((material(\'presses(*stretching\'\'bottoms\'#leg(!y\'%press\'*s/colorado)/skirts/culottes)%tight*)racksuits(#uit\'$wear%*seau-stuff',
+    '*\'hopping$*t-breeding&\'farmers\'$erox&$like&&ringed\'#ods&\'starved(%ocked%\'/father%#man%%spawn$+v&egrave;re%%erent&!s',
+    '$#ato#\'wel-fed(#ull&#led)#-on%"rs$$hill#$xide##yas$!e$"on%!s$!s$$town"%p-lac',
+    '#"hy"$rops#)rrrfffaow&.rrrrrrrrfffaow"$s-80##/80#!b#%tenik#"ut"&u-zero#&ancies&"y.%"de$!x##ble',
+    '%#haw#$cchi$(e-making&%terms$$hart%$sess$&ibaldo$\'k-belch&&makers)#ing&%sized\'#top&$tyre%#cab%\'drivers',
+    '%#ies%#led&#ine%)s/company&#top)!s%!y$\'tollean##den#\'e&mdash*";i$!\'$)-and-fair%\'blooded&#orn',
+    '%$grit%\'hearted&$uman%%light&#ove',
 )
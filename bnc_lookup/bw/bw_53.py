@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_53 = (
+count_53 = 6694
+
+heads_53 = (
     'swiftly-flowing',
-    'swiftly-moving',
-    'swiftly-taken',
-    'swiftsure',
-    'swiggans',
-    'swill-makers',
-    'swillin\'',
-    'swillinmg',
-    'swim&rehy;platform',
-    'swim-bladders',
-    'swim-suit',
-    'swim-suited',
-    'swim-suits',
-    'swim/swimming',
-    'swimcap',
-    'swimmable',
     'swimmed',
-    'swimmer.',
-    'swimminess',
-    'swimming-bath',
-    'swimming-club',
-    'swimming-floating',
-    'swimming-shorts',
-    'swimming-slip',
-    'swimming-wise',
-    'swimming.',
-    'swimming/fitness',
-    'swimmingpool',
-    'swimmings',
-    'swimmming',
-    'swimsuited',
-    'swin\'',
     'swina',
-    'swinbourne',
-    'swinbumian',
-    'swinburn/kington',
-    'swinburne/kington',
-    'swinburnese',
-    'swincombe',
-    'swindle\'',
-    'swindon(t11)',
-    'swindon(t11/5149)',
-    'swindon-leeds',
-    'swindon-oxford',
-    'swindon-striker',
-    'swindon-welsh',
-    'swindon-west',
-    'swindon.he',
     'swindon.the',
-    'swindon/rocky',
-    'swindonites',
-    'swindown',
-    'swine-herds',
-    'swineford',
-    'swinehund',
-    'swinehunt',
-    'swineside',
-    'swinester',
-    'swinfield',
-    'swinford.even',
-    'swing&ndash;bridge',
-    'swing-arounds',
-    'swing-away',
-    'swing-beat',
     'swing-bell',
-    'swing-chains',
-    'swing-like',
-    'swing-ometer',
-    'swing-out',
-    'swing-plane',
-    'swing-posts',
-    'swing-threw',
-    'swing-tipping',
-    'swing-to-the-right',
-    'swing-weights',
-    'swing-wing',
-    'swing.local',
-    'swingball',
-    'swingdale',
-    'swingdoors',
     'swinged',
-    'swinges',
-    'swingfire',
-    'swinging-arm',
-    'swingingness',
-    'swingland',
-    'swingline',
-    'swingometers',
-    'swingtipping',
-    'swingtips',
-    'swingtop',
-    'swingvine',
-    'swingwise',
-    'swinhoe',
-    'swinithwaite',
-    'swinkbacks',
     'swinley',
-    'swinsford',
-    'swinside',
-    'swinsto',
-    'swinsy',
-    'swintons',
-    'swirl-free',
-    'swirl-surge',
-    'swirlpot',
-    'swirly-amber',
-    'swirly-lined',
-    'swish-swish',
-    'swishest-looking',
-    'swishingly',
-    'swishy',
-    'swiss&rehy;born',
     'swiss-alsatian',
-    'swiss-built',
-    'swiss-chalet',
-    'swiss-darned',
-    'swiss-french',
-    'swiss-inclined',
-    'swiss-kraut',
-    'swiss-swedish',
-    'swiss-trained',
-    'swiss/german',
-    'swissotel',
-    'switalski',
-    'switch-a',
-    'switch-back',
-    'switch-backed',
-    'switch-based',
     'switch-bitch',
-    'switch-change',
-    'switch-customers',
-    'switch-hitting',
-    'switch-me-off',
-    'switch-panel',
-    'switch-point',
-    'switch-sales',
-    'switch-tenders',
-    'switch-track',
-    'switch-type',
-    'switch.bat',
-    'switch/control',
-    'switch/s',
-    'switch3500',
-    'switchbacking',
     'switchbletchley',
-    'switchboard-operator',
-    'switchcard',
-    'switchcraft-type',
-    'switches.',
-    'switchguards',
-    'switching-points',
-    'switching/coil-tap',
-    'switchmasters',
-    'switchmode',
-    'swith',
-    'switha',
-    'swithbank',
-    'swither',
-    'swithered',
-    'swithfrith',
     'swithlands',
-    'swithra',
-    'swithred',
-    'swithun',
-    'swittle',
-    'switzerland/austria',
-    'switzerland/france',
-    'switzerland/portugal',
-    'switzocclusion',
-    'swive',
-    'swivel-action',
-    'swivel-ball',
-    'swivel-eyed',
-    'swivel-heads',
-    'swivel-hipped',
-    'swivel-jerks',
     'swivel-mechanism',
-    'swivel-mounted',
-    'swivel-type',
-    'swivel/lockable',
-    'swivelly',
-    'swiver',
-    'swiwiar',
-    'swizzlesticks',
-    'swizzlewick',
-    'swk',
-    'swkfa',
-    'swl',
-    'swl.',
-    'swle',
-    'swlp',
-    'swlv',
     'swlx',
-    'swobodnik',
-    'swoish',
-    'swokin',
-    'swokowski',
-    'swolled',
-    'swollen-eyed',
-    'swollen-foot',
-    'swollen-footed',
-    'swollen-shoot',
-    'swollen-skulled',
-    'swoln',
-    'swolwe',
-    'swoonin\'',
-    'swoonings',
-    'swoonlike',
     'swooshed',
-    'swoosie',
-    'swor',
-    'sword\'n\'sorcery',
-    'sword-armed',
-    'sword-arms',
-    'sword-bearer',
-    'sword-belt',
-    'sword-bridges',
-    'sword-case',
-    'sword-deck',
-    'sword-edge',
-    'sword-extruding',
-    'sword-fight',
-    'sword-fighting',
-    'sword-fittings',
     'sword-glitter',
-    'sword-like',
-    'sword-masters',
-    'sword-pommels',
-    'sword-sharp',
-    'sword-sharpness',
-    'sword-sticks',
-    'sword-straps',
-    'sword-strokes',
-    'sword-swallower',
-    'sword-whipped',
-    'sword-wielding',
-    'sword.',
-    'sword/phallus',
-    'swordale',
-    'sworded',
     'swordes',
-    'swordfights',
-    'swordfishtrombones',
-    'swordheath',
-    'swording',
-    'swordlike',
-    'swordmaster',
-    'swordplant',
-    'swordpoints',
-    'swords/in',
-    'swordsmith',
-    'swordsmiths',
-    'swordstone',
-    'sworne',
-    'swotzerland',
-    'sws',
     'swsdg',
-    'swsi',
-    'swtnuxmlcdleubxtqhnzvjqf',
-    'swubble',
-    'swyddfa',
-    'swyddogaeth',
-    'swyft',
-    'swynderby',
-    'swynetoun',
-    'swyve',
-    'swyvinges',
-    'sx-m-view',
-    'sx3',
-    'sx8000-2',
-    'sx8000-3',
-    'sx8000-4',
     'sxbr.1972',
-    'sxity',
-    'sy-kick',
-    'sy11.',
-    'sy16',
-    'sy3',
-    'sy6',
-    'sy99/tg77',
-    'syafei',
-    'syam',
-    'syan',
-    'syangela',
-    'syas',
-    'sybase-link',
-    'sybject',
-    'sybol',
     'sybolics',
-    'sybtype',
-    'sybu',
-    'sybyl/qspr',
-    'sycamore-lined',
-    'sycarth',
-    'sychcoed',
-    'sychdyn',
-    'sycher',
-    'sychra',
-    'sychronised',
-    'syd.dms.csiro.au',
-    'syda',
-    'syde',
-    'sydec',
-    'syderstone',
     'sydiha',
-    'sydkraft',
-    'sydney-perth',
-    'sydneysider',
-    'sydonians',
-    'sydsvenska',
-    'sye',
-    'syed/oxford',
-    'syeduz',
-    'syengis',
-    'syenite',
-    'syenites',
-    'syerla',
-    'syers',
-    'sygeia',
-    'syggest',
     'syght',
-    'sygma',
-    'syhlet',
-    'syhridai',
-    'syilabus',
-    'syk',
-    'sykes.',
-    'sykes/genetic',
-    'sykes/lorry',
-    'sykes/otter',
-    'sykes/roman',
-    'sykeses',
-    'sykora',
-    'sylabus',
-    'sylbert',
-    'syleham',
     'sylfaen-welshpool',
-    'sylfum',
-    'sylgard',
-    'sylistic',
-    'sylk',
-    'sylks',
-    'sylkvia',
-    'syll',
-    'syll.132',
-    'syll.3',
-    'syll.a',
-    'syllabicity',
-    'syllabics',
-    'syllabify',
-    'syllable-\'it',
-    'syllable-count',
     'syllable-timing',
-    'syllable_instead',
-    'syllabled',
-    'syllables.',
-    'syllabus-dominated',
-    'syllabus-specific',
-    'syllabuses/reading',
-    'syllabuses/syllabi',
-    'sylli.',
-    'syllogistical',
-    'syllogistically',
-    'sylmaster',
-    'sylosa',
-    'sylow',
-    'sylphe',
-    'sylproof',
     'syltefiord',
-    'sylvaine',
-    'sylvatic',
-    'sylver',
-    'sylvestor',
-    'sylvestri',
-    'sylvio',
-    'sylvite',
-    'sylvopastoralism',
-    'sylvoz',
-    'sym=8.1%',
-    'symap/aspex',
-    'symapathy',
-    'symatery',
-    'symathetically',
-    'symba',
     'symbiose',
-    'symbiote',
-    'symbol(s)',
-    'symbol-dependent',
-    'symbol-laden',
-    'symbol-making',
-    'symbol-processing',
-    'symbol-producing',
-    'symbol/poverty',
-    'symbol/you',
-    'symbolic-language',
-    'symbolic-legal',
-    'symbolic/ideological',
-    'symbolic/numeric',
-    'symboliques',
-    'symbolism.in',
     'symboliste',
-    'symbolistes',
-    'symbollic',
-    'symbologic',
-    'symbologizing',
-    'symbols/abbreviations',
-    'syme-smith',
-    'symeonis',
-    'symes-mcswan',
-    'symington/neighbour',
-    'symmetrically-hydrated',
-    'symmetrically.',
-    'symmetrix-type',
-    'symmetrocapulus',
-    'symmetry-breaking',
-    'symmetry-forbidden',
     'symmetry.',
-    'symmons',
-    'symonds/community',
-    'symonds/hereford',
-    'symonds/managing',
-    'symondsbury',
-    'symonem',
-    'symonides',
-    'sympath&rehy;etic',
-    'sympathetic-looking',
-    'sympathetic.',
-    'sympathic',
-    'sympathin',
-    'sympathins',
-    'sympathomimetic',
-    'sympathy.',
     'sympatrically',
-    'sympcommand',
-    'sympetrum',
-    'symphisis',
-    'symphonics',
-    'symphonique',
-    'symphonists',
-    'symphony*',
-    'symphony-orchestra',
-    'symphylan',
-    'symphysodon',
-    'symphyta',
-    'symphytan',
-    'symplast',
-    'symplectite',
-    'symplegadean',
     'symposiumover',
-    'symptom-formation',
-    'symptom-limited',
-    'symptom-producing',
-    'symptom-relieving',
-    'symptomatized',
-    'symptomatologies',
-    'symptomfree',
-    'symptomology',
-    'symptoms.studies',
-    'symptoms/behavioural',
-    'sympton',
-    'symril',
-    'symses',
-    'symvolon',
-    'syn&rehy;chrony',
     'syn-depositional',
-    'syn-orogenic',
-    'syn.',
-    'synaesthetic',
-    'synagermos',
-    'synagogal',
-    'synalpheus',
-    'synanthropic',
-    'synapsides',
-    'synapsin',
-    'synaptical',
-    'synaptogenic',
-    'synaptophysin',
-    'synar',
-    'synaspismos-nd',
-    'synaspsimos',
     'synbranchidae',
-    'synbranchus',
-    'syncellus',
-    'synched',
-    'synchiropus',
-    'synchotron',
-    'synchro-energy',
-    'synchromists',
-    'synchron',
-    'synchroneity',
-    'synchronies',
-    'synchronisms',
-    'synchronix',
-    'synchronizes',
-    'synchronome',
-    'synchronous/asynchronous',
     'synchronous/diachronous',
-    'synchros',
-    'synchroton',
-    'synchrotrons',
-    'synciatial',
-    'synclinal',
-    'synclines',
-    'synclinorium',
-    'syncopaters',
-    'syncopates',
-    'syncpoint',
-    'syncratic',
-    'syncretisation',
-    'syncronising',
-    'syncrude',
-    'syndactylus',
     'syndepositional',
-    'syndets',
-    'syndey',
-    'syndic-g&eacute;n&eacute;ral',
-    'syndic-general',
-    'syndicale',
-    'syndicates-in-waiting',
-    'syndicating',
-    'syndications',
-    'syndicator',
-    'syndiotacticity',
-    'syndome',
-    'syndrome(ibs)',
-    'syndrome-xo',
-    'syndrome.a',
-    'syndrome/erythrocyte',
     'syndrums',
-    'syne.',
-    'syneclises',
-    'synergeticum',
-    'synergist',
-    'synergists',
-    'synergizes',
-    'synernetics',
-    'synesci',
-    'synesius',
-    'synfyfyrion',
-    'syngand',
-    'syngenetic',
-    'synges',
-    'syngonium',
-    'synidcate',
     'synnoetics',
-    'synod-appointed',
-    'synodal',
-    'synods.',
-    'synogogues',
-    'synoikised',
-    'synolda',
-    'synomous',
-    'synonimes',
-    'synonomous',
-    'synonyme',
-    'synonymous-sequential',
-    'synonyms.',
-    'synopticae',
-    'synorogenic',
-    'synovial-type',
     'synrift',
-    'synsedimentary',
-    'synspilums',
-    'synstemic',
-    'syntactic&rehy;ally',
-    'syntactically-structured',
-    'syntactico-semantic',
-    'syntagmata',
-    'syntagmatic-paradigmatic',
-    'syntax-driven',
-    'syntax-variation',
-    'syntax/semantic',
-    'syntaxe',
-    'syntaxis',
-    'syntectonically',
-    'syntellect',
     'syntenic',
-    'synth-dance',
-    'synth-skin',
-    'synth-splattered',
-    'synth-squiggle-',
-    'synthaprufe',
-    'synthcake',
-    'synthecell',
-    'synthesis.',
-    'synthesis.4',
-    'synthesis/toll',
-    'synthesiser-dance',
-    'synthetic-antagonistic',
-    'synthetic-fibre',
-    'synthetic-filled',
-    'synthfood',
     'synthgruel',
-    'synthoats',
-    'synthon',
-    'synthons',
-    'synthpop',
-    'syntonic',
-    'syntony',
-    'syonymous',
-    'syp',
-    'sypert',
-    'syphilisatrice',
-    'syphilization',
-    'syps',
-    'syptomatic',
-    'syptoms',
-    'syr.',
     'syra',
-    'syracusans',
-    'syreeta',
-    'syrej',
-    'syria-based',
-    'syria-were',
-    'syriack',
-    'syriam',
-    'syrian-',
-    'syrian-held',
-    'syrian-lebanese',
-    'syrian-occupied',
-    'syrian-soviet',
-    'syrian-uk',
-    'syrian-us',
-    'syrie',
     'syrien',
-    'syringae',
-    'syringe-full',
-    'syringeful',
-    'syrinx/chlo&eacute',
-    'syrius',
-    'syrmaticus',
-    'syro-hittite',
-    'syro-lebanese',
-    'syro-palestino-egyptian',
-    'syroechkovskii',
-    'syroechkovskiy',
-    'syrolit',
-    'syrophoenician',
-    'syros',
-    'syrphidae',
     'syrrup',
-    'syrtaki',
-    'syrup-soaked',
-    'syrup.',
-    'syrus',
-    'syryjczyk',
-    'sys&dollar;device',
-    'sys&dollar;help',
-    'sys&dollar;lifespan:crefdl.com',
-    'sys&dollar;lifespan:example.dat',
-    'sys&dollar;lifespan:fdldef.com',
-    'sys&dollar;lifespan:foo.bar',
-    'sys&dollar;lifespan:lstrain.com',
-    'sys&dollar;lifespan:pmr',
-    'sys&dollar;lifespan:usertl.exe',
-    'sys&dollar;lifespanfdldef.com',
     'sys&dollar;manager',
-    'sys&dollar;manager:lifespan&mdash;shutdown.com',
-    'sys&dollar;manager:sylogin.com',
-    'sys&dollar;manager:syshutdwn.com',
-    'sys&dollar;manager:systartup&mdash;v5.com',
-    'sys&dollar;system:shutdown',
-    'sys&dollar;system:sql&dollar',
-    'syson',
-    'sysorex',
-    'syspas',
-    'syssel',
-    'syst&eacute;matique',
-    'syst.',
-    'systaflex',
-    'systams',
-    'systartup.com',
     'system&mdash;especially',
-    'system&mdash;generally',
-    'system&mdash;partially',
-    'system&mdash;will',
-    'system&mdash;would',
-    'system\'',
-    'system\'photograph',
-    'system(s)/component(s)',
-    'system-',
-    'system-administration',
-    'system-and',
-    'system-assuming',
-    'system-breakdown',
-    'system-colon',
-    'system-compatible',
-    'system-conformant',
     'system-cum-database',
-    'system-defined',
-    'system-internal',
-    'system-kontakt',
-    'system-management',
-    'system-orientated',
-    'system-oriented',
-    'system-part-time',
-    'system-ready',
-    'system-related',
-    'system-ridden',
-    'system-specific',
-    'system-threatening',
-    'system-wise',
-    'system.',
-    'system.also',
     'system.dec',
-    'system.that',
-    'system.under',
-    'system/2',
-    'system/36-as/400',
-    'system/36-to-unix',
-    'system/38',
-    'system/3x',
-    'system/a',
-    'system/cuckoo',
-    'system/expert',
-    'system/individual',
-    'system/institution',
-    'system/lifeline',
-    'system/machine',
-    'system/rules',
     'system/trade',
-    'system:read',
-    'systematisations',
-    'systematiser',
-    'systematisers',
-    'systematises',
-    'systemdeck',
-    'systementwicklung',
-    'systemform',
-    'systemically-desirable',
-    'systemically-related',
-    'systemising',
-    'systemix',
-    'systemizers',
-    'systempro/lt',
-    'systems\'--computer',
     'systems\'--london',
-    'systems-',
-    'systems--computer',
-    'systems--england',
-    'systems-building',
-    'systems-management',
-    'systems-purchasing',
-    'systems-related',
-    'systems-thinking',
-    'systems-ultrasonics',
-    'systems.l',
-    'systems/',
-    'systems/services',
-    'systemshouse',
-    'systemsoft',
-    'systemwide',
     'systerm',
-    'systex',
-    'systhane',
-    'systoles',
-    'systolic/diastolic/mean',
-    'systsov',
-    'sysuaf.dat',
-    'sytem',
-    'sythnocomputer',
-    'sytologically',
-    'sytze',
-    'syudies',
-    'syumpathetic',
-    'syverston',
-    'syverud',
-    'syvier',
     'syvret/editor',
-    'sywardby',
-    'sywell-based',
-    'syzran\'',
-    'syzygium',
-    'sz&aacute;zad',
-    'sz&eacute;kesfeh&eacute;rvar',
-    'sz.21',
-    'sz.234',
-    'szab&oacute',
-    'szabad',
-    'szabadsag',
-    'szafer',
-    'szafran',
-    'szakmary',
-    'szamuely',
     'szaniawksi',
-    'szanto',
-    'szatkowski',
-    'szchewan',
-    'szczeklik',
-    'szdzhalombatta',
-    'szechenyi',
-    'szedely',
-    'szeeman',
-    'szeemann',
-    'szeftel',
-    'szego',
-    'szekeley',
-    'szekesfehervar',
-    'szekler-dominated',
-    'szell/cleveland',
     'szemao',
-    'szemle',
-    'szent-gyorgi',
-    'szentes',
-    'szerenyi',
-    'szewczak',
-    'szigetkoz',
-    'szikla',
-    'szikora',
-    'szilagyi',
-    'szilvessy',
-    'szisz',
-    'szklarska',
-    'szkudlapski',
-    'szlumper',
-    'szombathely',
     'szpiner',
-    'szpt',
-    'szt&aacute;-lin',
-    'sztandar',
-    'sztencel',
-    'szubin',
-    'szueroes',
-    'szueros',
-    'szuluk/brother',
-    'szum',
-    'szumski/prisoners',
-    'szwinto',
-    'szybillo',
-    'szyk',
-    'szymanki',
-    'szymanski',
     'szymura',
-    't&aacute;bor',
-    't&aacute;chira',
-    't&aacute;in',
-    't&aacute;lice',
-    't&aacute;naiste',
-    't&aacute;pies',
-    't&aacute;ranto',
-    't&acirc;f',
-    't&amp;c2',
-    't&amp;d',
-    't&amp;h',
-    't&amp;k',
-    't&amp;pf',
-    't&auml;gliche',
-    't&dollar;29,600,000',
     't&dollar;4,000,000-worth',
-    't&eacute;fel',
-    't&eacute;l&eacute;commande',
-    't&eacute;l&eacute;communications',
-    't&eacute;l&eacute;diffusion',
-    't&eacute;l&eacute;graphe',
-    't&eacute;l&eacute;graphique',
-    't&eacute;l&eacute;mondial',
-    't&eacute;l&eacute;phonique',
-    't&eacute;l&eacute;vis&eacute',
-    't&eacute;lmo',
-    't&eacute;moin',
-    't&eacute;moinage',
-    't&eacute;n&egrave;bre',
-    't&eacute;nar&egrave;ze',
-    't&ecirc;l&ecirc;vision',
     't&ecirc;te-&agrave;-t&ecirc;tes',
-    't&ecirc;te-b&ecirc;che',
-    't&egrave;re',
-    't&euml;te',
-    't&iacute;o',
-    't&iacute;w',
-    't&icirc;rgoviste',
-    't&lsqb;a&rsqb;xtile',
-    't&mdash',
-    't&ndash;34a',
-    't&ndash;an',
-    't&ndash;e',
-    't&ndash;me',
-    't&ndash;modern',
-    't&ndash;o',
-    't&ndash;which',
     't&oacute;0g&oacute;0',
-    't&oacute;glach',
-    't&oacute;ib&iacute;n',
-    't&oslash;nder',
-    't&oslash;nnessen',
-    't&ouml;dlische',
-    't&ouml;l&ouml;s',
-    't&ouml;lz',
-    't&ouml;m&ouml;riyn',
-    't&ouml;senerschlucht',
-    't&ouml;senerschluchts',
-    't&pound;2.1',
-    't&rcaron&iacute;da',
-    't&rcaron;ebo&ncaron',
-    't&rehy;shirt',
-    't&times;d',
     't&uacute;rin',
-    't&ucirc;48',
-    't&ucirc;rin',
-    't&umacr;n',
-    't&uuml;mendelger',
-    't&uuml;mengiyn',
-    't&uuml;mpel',
-    't&uuml;rk',
-    't&uuml;ttlingen',
-    't&yacute;nsk&aacute',
-    't\'a',
-    't\'admire',
-    't\'admit',
-    't\'ai-chi',
-    't\'ai-hiu',
-    't\'ai-hs&uuml',
     't\'air',
-    't\'angle',
-    't\'angs',
-    't\'appelles',
-    't\'army',
-    't\'baby',
-    't\'back',
-    't\'backbone',
-    't\'banns',
-    't\'barn',
-    't\'beat',
-    't\'bed',
-    't\'beginning',
-    't\'blizzard',
-    't\'bottom',
-    't\'bride',
     't\'bridge',
-    't\'bring',
-    't\'brown',
-    't\'buildings',
-    't\'canadas',
-    't\'carry',
-    't\'cat',
-    't\'catkins',
-    't\'change',
-    't\'cheer',
-    't\'colour',
-    't\'come',
-    't\'confinement',
-    't\'corner',
-    't\'cumpany',
-    't\'cup',
     't\'date',
-    't\'daughter',
-    't\'decent',
-    't\'do',
-    't\'dog',
-    't\'dole',
-    't\'dollop',
-    't\'draw',
-    't\'ead',
-    't\'earth',
-    't\'eat',
-    't\'elp',
-    't\'emmener',
-    't\'en',
-    't\'es',
-    't\'eyes',
     't\'family',
-    't\'first',
-    't\'food',
-    't\'friend',
-    't\'frocks',
-    't\'funeral',
-    't\'gallant',
-    't\'garden',
-    't\'gate',
-    't\'geese',
-    't\'girt',
-    't\'glory\'ole',
-    't\'good',
-    't\'gooi',
-    't\'gordon',
-    't\'grain',
     't\'house',
-    't\'ien',
-    't\'imagines',
-    't\'infernal',
-    't\'ings',
-    't\'ink',
-    't\'is',
-    't\'ka',
-    't\'keep',
-    't\'kids',
-    't\'kill',
-    't\'lambs',
-    't\'lane',
-    't\'lead',
-    't\'light',
-    't\'local',
     't\'lodge',
-    't\'look',
-    't\'lot',
-    't\'lower',
-    't\'maister',
-    't\'make',
-    't\'manger',
-    't\'mart',
-    't\'martinmas',
-    't\'mayor',
-    't\'meetchya',
-    't\'ment',
-    't\'ment.',
-    't\'mention',
-    't\'milking',
-    't\'mills',
     't\'money',
-    't\'moon',
-    't\'moors',
-    't\'more',
-    't\'morn',
-    't\'most',
-    't\'my',
-    't\'myself',
-    't\'name',
-    't\'naybors',
-    't\'nearest',
-    't\'one',
-    't\'oorselves',
-    't\'orchard',
-    't\'others',
-    't\'pack',
     't\'pau',
-    't\'phon',
-    't\'place',
-    't\'plan',
-    't\'police',
-    't\'postman',
-    't\'prattiest',
-    't\'privilege',
-    't\'pub',
-    't\'railways',
-    't\'rains',
-    't\'record',
-    't\'remain',
-    't\'remember',
-    't\'retire',
-    't\'riffic',
     't\'rific',
-    't\'river',
-    't\'river-side',
-    't\'run',
-    't\'run\'',
-    't\'save',
-    't\'see',
-    't\'shaft',
-    't\'shirt',
-    't\'shoot',
-    't\'shut',
-    't\'sizing',
-    't\'small',
-    't\'smoke',
-    't\'sosei',
-    't\'spinners',
     't\'spongy',
-    't\'stable',
-    't\'staircase',
-    't\'strike',
-    't\'stud',
-    't\'summer',
-    't\'sunday',
-    't\'swingers',
-    't\'tail',
-    't\'the',
-    't\'think',
-    't\'thinkin\'',
-    't\'time',
-    't\'tops',
-    't\'towers',
-    't\'tune',
     't\'two',
-    't\'united',
-    't\'view',
-    't\'way',
-    't\'weather',
-    't\'wharfe',
-    't\'winter',
-    't\'wit',
-    't\'witching',
-    't\'workhouse',
-    't\'yard',
-    't\'young',
-    't\'zand',
-    't(1137)=2.74',
-    't(1137)=4.23',
-    't(1137)=7.13',
     't(1137)=9.79',
-    't(22)=1.89',
-    't(34)=0.33',
-    't(34)=0.85',
-    't(34)=2.64',
-    't(34)=3.57',
-    't(46)=1.28',
-    't(58)=2.58',
-    't(c)',
-    't(eacher)',
-    't(t)',
-    't(z)',
-    't*',
-    't*m*s',
-    't+2',
-    't+4',
     't+j',
-    't-101',
-    't-102',
-    't-2',
-    't-22',
-    't-28d',
-    't-3',
-    't-33s',
-    't-38a',
-    't-4',
-    't-45a',
-    't-50',
-    't-54s',
-    't-59',
-    't-60',
-    't-6s',
     't-77',
-    't-aigeach',
-    't-antigen-gene-transformed',
-    't-axis',
-    't-barb',
-    't-birds',
-    't-boat',
-    't-bones',
-    't-box',
-    't-butanol/water',
-    't-cell-science',
-    't-cell-tropic',
-    't-cell/pan',
-    't-cell/t-helper',
-    't-counter',
-    't-day',
     't-dna',
-    't-end',
-    't-gap',
-    't-gel',
-    't-get-away-with-anything',
-    't-grain',
-    't-grammar',
-    't-grouping',
-    't-in-t',
-    't-life',
-    't-maps',
-    't-o-y-s',
-    't-p-t',
-    't-p-t-p-t',
-    't-pieces',
-    't-plan',
     't-profile',
-    't-ratios',
-    't-sections.',
-    't-shi',
-    't-shirts/',
-    't-shirts/sweat',
-    't-short',
-    't-shorts',
-    't-ski',
-    't-statistics',
-    't-stem',
-    't-strathain',
-    't-switch',
-    't-switches',
-    't-t-t-trrrrrrrrr',
-    't-t-total',
     't-t-trunchbull',
-    't-t-two',
-    't-tabitha',
-    't-taiwan',
-    't-talk',
-    't-talking',
-    't-tea',
-    't-tell',
-    't-told',
-    't-tomorrow',
-    't-tonight',
-    't-took',
-    't-top',
-    't-topic',
-    't-trim',
-    't-trinyl',
     't-tunnel',
-    't-v',
-    't-weighted',
-    't-word',
-    't-zers',
-    't.2',
-    't.20s',
-    't.4/pr.3',
-    't.5&ndash;1.8m',
-    't.5s',
-    't.61',
-    't.a.t',
-    't.acidophilum',
-    't.b.g.a.s',
-    't.b.o.',
-    't.c',
     't.c.i.',
-    't.c.n.',
-    't.cahill',
-    't.d',
-    't.d.haws',
-    't.d.l.',
-    't.d.us',
-    't.d.y.s',
-    't.e.f.l.',
-    't.e.lawrence',
-    't.e.o.',
-    't.e.r.a.s.xiii',
-    't.e.s.o.l.',
-    't.e.s.p.i.',
-    't.eckersley',
-    't.g.w.u.',
     't.gottlieb',
-    't.hulme',
-    't.i.c.s',
-    't.i.r.e.e.',
-    't.j.clark',
-    't.j.f.',
-    't.j.m.',
-    't.j.maxwell',
-    't.j.papenfuss',
-    't.joka',
-    't.k.l.',
-    't.kishimoto',
-    't.l.c.',
-    't.l.s.',
-    't.lunt',
-    't.m.t.',
     't.mcluhan',
-    't.n.s.',
-    't.n.t.',
-    't.o.f.',
-    't.o.p.s.',
-    't.p.b.',
-    't.p.o\'neill',
-    't.powell',
-    't.ruweti',
-    't.s.eliot',
-    't.s.o.',
-    't.shape',
-    't.t.q.m.',
-    't.t.tsui',
-    't.u.b.e.',
-    't.u.c',
     't.v./video',
-    't.v.am',
-    't.v.e.i',
-    't.v.s',
-    't.w.g.',
-    't.w.r',
-    't.w.r.',
-    't/10',
-    't/4',
-    't/8749',
-    't/a\'',
-    't/cytotoxic',
-    't/ha/p.a',
-    't/lo',
-    't/sf',
-    't/to',
     't/y',
-    't0010547+',
-    't0014277',
-    't0016510',
-    't0058053',
-    't0058054',
-    't0058055',
-    't0058060',
-    't0058062',
-    't01/04',
-    't0606',
-    't0n0',
-    't0n0m1',
-    't0n1m1',
-    't1&ndash;t4',
-    't1-t2',
     't1-t5',
-    't1/1',
-    't10',
-    't100',
-    't11/49',
-    't12',
-    't14\'',
-    't154',
-    't18',
-    't2-type',
-    't20',
-    't200s',
-    't201/08',
-    't201a',
-    't204',
-    't21',
     't21b',
-    't25n',
-    't2t',
-    't2transfectants',
-    't3\'s',
-    't3-af',
-    't3/t7',
-    't3010',
-    't31',
-    't3228',
-    't3237',
-    't3239',
-    't3294',
-    't3317',
-    't34',
-    't3629',
     't37a',
-    't3pg4+c9pa10',
-    't40a',
-    't43',
-    't5-t10',
-    't50pl',
-    't55',
-    't550',
-    't560i',
-    't6&ndash;t8',
-    't6-t12',
-    't6.12',
-    't60',
-    't6400/dx2',
-    't64000',
-    't64s',
     't67s',
-    't7.',
-    't7259',
-    't7525',
-    't8\'',
-    't8-a9',
-    't800/t9000',
-    't800s',
-    't805.',
-    't805s',
-    't815',
-    't900',
-    't9000s.',
-    't901',
-    't9046',
-    't920',
     't93',
-    't:0234',
-    't:0252',
-    't:0276',
-    't:0296',
-    't:031&ndash;245',
-    't:041&ndash;332',
-    't:0483',
-    't:0703',
-    't:071&ndash;233',
-    't:071&ndash;236',
-    't:071&ndash;497',
-    't:071&ndash;548',
-    't:071&ndash;831',
-    't:071&ndash;834',
-    't:0730',
     't:0732',
-    't:0795&ndash;531472',
-    't:081&ndash;449',
-    't:081&ndash;458',
-    't:081&ndash;686',
-    't:081&ndash;787',
-    't:081&ndash;983',
-    't:0892',
-    't:0908',
-    't:o7i-828',
-    't:t',
-    't=0.28',
-    't=0.867',
-    't=2.15',
-    't=47mm',
-    't=7.55',
     't=80&ndash;100',
-    't=int',
-    'ta\'in',
-    'ta\'izz',
-    'ta\'qali',
-    'ta-',
-    'ta-100r',
-    'ta-da',
-    'ta-hui',
-    'ta-hung',
-    'ta-men',
-    'ta-raah',
-    'ta-rah',
-    'ta-rp',
-    'ta-tas',
-    'ta1',
     'ta10',
-    'ta100s',
-    'ta122',
-    'ta200s',
-    'ta3',
-    'ta4',
-    'ta50',
-    'ta634',
-    'taa-',
-    'taaaime',
-    'taaatctaaagacga',
-    'taab',
-    'taafe',
-    'taahuku',
-    'taallow',
-    'taam',
     'taamei',
-    'taaran',
-    'taaskin',
-    'taat',
-    'taatgag/tat',
-    'taatgarat-',
-    'tab(s)',
-    'tab-collared',
-    'tab-labs',
-    'tab-pulls',
-    'tab100&ndash;12',
-    'taba',
-    'tabacek',
-    'tabajdi',
-    'tabakaucoro',
-    'taban',
     'tabar',
-    'tabar&eacute',
-    'tabards.',
-    'tabarov',
-    'tabatabai',
-    'tabatchik',
-    'tabatha',
-    'tabati&egrave;res',
-    'tabatinga',
-    'tabazadah',
-    'tabbard',
-    'tabberer',
-    'tabbing',
-    'tabbouleh',
-    'tabby-cats',
-    'tabea',
     'tabebuia',
-    'tabellini',
-    'tabener',
-    'tabernam',
-    'taberner',
-    'tabia',
-    'tabigura',
-    'tabimin',
-    'tabinal',
-    'tabkay.',
-    'table-',
-    'table-bell',
-    'table-clearer',
-    'table-companion',
-    'table-cooked',
-    'table-cover',
     'table-coverings',
-    'table-cricket',
-    'table-cut',
-    'table-fountain-cum-water',
-    'table-full',
-    'table-harpsichord',
-    'table-hopping',
-    'table-like',
-    'table-loading',
-    'table-mat',
-    'table-qualities',
-    'table-rapping',
-    'table-to-table',
-    'table-wine',
-    'table.',
-    'table/',
     'table/chair',
-    'table/diagram',
-    'table/humidification',
-    'table/standard',
-    'table/tray',
-    'table4.4',
-    'table6.2',
-    'tableaus',
-    'tablecloth/napkins',
-    'tableclothes',
-    'tablecloths.',
-    'tableds',
-    'tablees',
-    'tablefare',
-    'tablepiece',
-    'tablesaw',
     'tablescapes',
-    'tableside',
-    'tablet-called',
-    'tablet-initiated',
-    'tablet-lcd',
-    'tablet/lcd',
-    'tabletennis',
-    'tableting',
-    'tabletools',
-    'tablets&ndash;to',
-    'tableture',
-    'tableux',
-    'tablinum',
-    'tabliture',
-    'tabloid\'',
-    'tabloid-fodder',
     'tabloid-oriented',
-    'tabloid-press',
-    'tabloid-type',
-    'tabloidization',
-    'tabloidy',
-    'tablon',
-    'taboo-loaded',
-    'taboo-ridden',
-    'taborites',
-    'tabors',
-    'tabossi',
-    'tabouleh',
-    'tabouret',
-    'tabraham',
-    'tabrizian',
-    'tabsuwan',
     'tabua',
-    'tabuk',
-    'tabula',
-    'tabulae',
-    'tabulators',
-    'tabulaturbuch',
-    'tabulature',
-    'tabulaturen',
-    'tabules',
-    'tabules/are',
-    'tabunut',
-    'taburel',
-    'tac-tac',
-    'tacchini',
-    'taccola',
-    'tacconi',
     'tacebo',
-    'tacet',
-    'tach',
-    'tachai-type',
-    'tachana',
-    'tachi-s',
-    'tachiarrhythmic',
-    'tachibanaki',
-    'tachie',
-    'tachinidae',
-    'tachnag',
-    'tachochart',
-    'tachometers',
-    'tachos',
-    'tachybaptus',
-    'tachycines',
     'tachydysrhythmia',
-    'tachykinin',
-    'tachykinins',
-    'tachyonic',
-    'tachypeles',
-    'tachypnoeic',
-    'tacitaeper',
-    'tacitical',
-    'tacitists',
-    'taciturne',
-    'taciturney',
-    'tacizade',
-    'tack-free',
-    'tack-sharp',
-    'tack-tack-too',
-    'tackaberry',
     'tackash',
-    'tacked-on',
-    'tacked-up',
-    'tackem',
-    'tackensautis',
-    'tackets',
-    'tacketty',
-    'tackety',
-    'tackity',
-    'tackle-anything',
-    'tackle-making',
-    'tackleby',
-    'tackled-ball',
-    'tackler/ball',
-    'tackleway',
-    'tackman',
     'tacks-in',
-    'tacon',
-    'taconian/caledonian',
-    'tactic/selection',
-    'tactically-minded',
-    'tactics.',
-    'tactics.parents',
-    'tactique',
-    'tactus-giver',
-    'tadahiko',
-    'tadahiro',
-    'tadarida',
-    'taddei',
-    'taddington',
-    'tadek',
-    'tadema',
     'tademy',
-    'tadeos',
-    'tadge',
-    'tadger',
-    'tadila',
-    'tadiwala',
-    'tadjiddine',
-    'tadlow',
-    'tadma',
-    'tadman',
-    'tadmarton',
-    'tadmuir',
-    'tadmur',
-    'tadolini',
-    'tadpole-meteor',
-    'tadpole-shaped',
     'taduactylus',
-    'tadworth',
-    'tadzhikistan',
-    'tadzhiks',
-    'tae-night',
-    'taebaek-san',
-    'taed',
-    'taedium',
-    'taegether',
-    'taejon',
-    'taekyon',
-    'tael',
-    'taele',
-    'taels',
-    'taen',
-    'taeniasporites',
     'taeniatus',
-    'taeniourus',
-    'taes',
-    'taeschner',
-    'taeterrimam',
-    'taez',
-    'tafahians',
-    'tafaj',
-    'tafawa',
-    'tafe',
-    'tafelmusik',
-    'tafelspitz',
-    'taffinder',
-    'taffoni',
-    'tafford',
-    'taffswell',
     'taffy\'',
-    'taffyitis',
-    'tafila',
-    'tafner',
-    'tafton',
-    'tafts',
-    'tag(1&ndash;272)',
-    'tag(s)',
-    'tag-a-long',
-    'tag-end',
-    'tag-line',
-    'tag-triples',
-    'tagalog-speaking',
-    'tagalogs',
-    'tagaror',
-    'tagebuch',
     'taggard',
-    'taggart-face',
-    'taggert',
-    'taggled',
-    'taggs',
-    'taghairn',
-    'taghi',
-    'tagholm',
-    'taghouti',
-    'tagia',
-    'tagiyev',
-    'taglialatela',
-    'tagliasco',
-    'tagliatelli',
-    'tagma',
-    'tagmata',
     'tago',
-    'tagset2',
-    'taguban',
-    'tah',
-    'tahadi',
-    'tahai',
-    'tahar',
-    'tahashshum',
-    'tahdeed',
-    'taheebo',
-    'tahi',
-    'tahini',
-    'tahirou',
-    'tahn',
-    'tahourdin',
-    'tahpanhes',
     'tahsin',
-    'tahta',
-    'tahuantinsuyo',
-    'tai-boxing',
-    'tai-chi',
-    'tai-fing',
-    'tai-pan',
-    'tai-ping',
-    'tai-yu',
-    'taia',
-    'taiano',
-    'taibin',
-    'taibon',
-    'taibutheh',
-    'taichiro',
-    'taid',
     'taieb',
-    'taifang',
-    'taihaku',
-    'taihape',
-    'taiheng',
-    'taihenyoku',
-    'taiho',
-    'taijaing',
-    'taiji',
-    'taik',
-    'taikan',
-    'taikosha',
-    'tail&mdash',
-    'tail-and-dog',
-    'tail-backs',
-    'tail-bell',
     'tail-between-the-legs',
-    'tail-biting',
-    'tail-crushing',
-    'tail-derived',
-    'tail-dropping',
-    'tail-effect',
-    'tail-ended',
-    'tail-ends',
-    'tail-fan',
-    'tail-feather',
-    'tail-feathered-shakin\'',
-    'tail-gates',
-    'tail-half',
-    'tail-heavy',
-    'tail-length',
-    'tail-like',
     'tail-low',
-    'tail-mounted',
-    'tail-off',
-    'tail-reduction',
-    'tail-rudder',
-    'tail-sacrifice',
-    'tail-shaped',
-    'tail-shedding',
-    'tail-shunting',
-    'tail-spine',
-    'tail-stem',
-    'tail-streamers',
-    'tail-stump',
-    'tail-swisher',
-    'tail-tips',
-    'tail-up',
     'tail-waggers',
-    'tail-waggingly',
-    'tail-wags',
-    'tail-wind',
-    'tail.',
-    'tail/',
-    'tail_an',
-    'tailand',
-    'tailarach',
-    'tailband',
-    'tailbands',
-    'tailboards',
-    'tailbone',
-    'taildragging',
-    'tailender',
-    'tailes',
     'tailfins',
-    'tailgate/',
-    'tailgates',
-    'tailgrab',
-    'tailgunner',
-    'tailhade',
-    'tailing-off',
-    'tailis',
-    'tailism',
-    'taille/taillynge',
-    'tailleferre',
-    'taillessness',
-    'taillights',
-    'taillon',
-    'taillynge',
-    'tailor&rehy;made',
     'tailor-caste',
-    'tailor-cut',
-    'tailor-xxxx',
-    'tailor/dressmaker',
-    'tailpipes',
-    'tailplane-elevator',
-    'tailplane-elevator-trim',
-    'tailrace',
-    'tailskid',
-    'tailskin',
-    'tailstream',
-    'tailteann',
-    'tailwards',
-    'tailwinded',
-    'taim',
-    'tainaron',
     'taineachan',
-    'taint-proof',
-    'tainton',
-    'tainton/st',
-    'taipale',
-    'taipei:china',
-    'tair',
-    'tairaval',
-    'tairea',
-    'tairp',
-    'taisei',
-    'taisez-vous',
-    'taiso',
-    'taisuke',
-    'tait/event',
-    'taita',
     'taitbout',
-    'taiti',
-    'taito',
-    'taitt',
-    'taitthealth',
-    'taiwan&mdash;had',
-    'taiwan-bred',
-    'taiwan-elected',
-    'taiwan-financed',
-    'taiwan-funded',
-    'taiwan-made',
-    'taiwan/hong',
-    'taiwanese-backed',
-    'taiwanese-born',
-    'taiyuan',
-    'taiz',
     'taize-style',
-    'taizo',
-    'taizou',
-    'taj-mahal',
-    'taja',
-    'tajas',
-    'tajga',
-    'tajik-afghan',
-    'tajikta',
-    'tajine',
-    'tajines',
-    'tajins',
-    'tajiri',
-    'tajnikar',
-    'tajo',
-    'tajti',
     'taka105,500',
-    'taka12,550',
-    'taka13,800',
-    'taka140,000',
-    'taka15,900',
-    'taka182,900',
-    'taka73,000',
-    'taka75,000',
-    'taka75,627',
-    'taka77,300',
-    'taka80,000',
-    'taka85,030',
-    'taka85,500',
-    'taka86,500',
-    'takabwebwe',
-    'takac',
     'takachi',
-    'takago',
-    'takahara',
-    'takahe',
-    'takahi',
-    'takahiko',
-    'takakura',
-    'takamaka',
-    'takami',
-    'takamine-badged',
-    'takamizawa',
-    'takamori',
-    'takao',
-    'takashigi',
-    'takatoshi',
-    'takayanagi-type',
     'takdir',
-    'take-a',
-    'take-a-pill',
-    'take-away-kebab',
-    'take-it-or-leave-itism',
-    'take-it-or-leave-the-place',
-    'take-me-as-you-find-me',
-    'take-no-thought-for-the-morrow',
-    'take-off-able',
-    'take-off-out-of-trim',
-    'take-one',
-    'take-outs',
-    'take-some-of-it-or-leave-some-of-it',
-    'take-ups',
-    'take-what-you-want',
-    'take-you',
     'take-your',
-    'take/send',
-    'take_a',
-    'takeable',
-    'takeback',
-    'takebacks',
-    'takedowns',
-    'takehiro',
-    'takeichi',
-    'takeing',
-    'takeji',
-    'taken-aback',
-    'taken-for-grantedness',
-    'taken-for-grated',
-    'taken-forgranted',
-    'taken.an',
     'taken.for-granted',
-    'taken.richard',
-    'taken/over',
-    'takenhall',
-    'takenoff',
-    'takeoffs',
-    'takeoka',
-    'takeouts',
-    'takeover-defence',
-    'takeover-threatened',
-    'takeover/merger',
-    'taker-of-the-minutes',
-    'taker-out',
-    'taker-overs',
-    'taker/supplier',
-    'takers-up',
     'takes-off',
-    'takeshiro',
-    'takeway',
-    'takher',
-    'takhisis',
-    'takht-e-jamshid',
-    'takiguchi',
-    'takijiro',
-    'takin\'s',
-    'taking\'53\'',
-    'taking-apart',
-    'taking-care-of-business',
-    'taking-down',
-    'taking-me-for-granted',
-    'taking-sides',
-    'taking-workaholism',
     'taking/',
-    'taking_a',
-    'takishima',
-    'taklen',
-    'taklon',
-    'takoes',
-    'takovo',
-    'takrir-e',
-    'takriti',
-    'takshasila',
-    'takushoku',
-    'tal-haddiema',
-    'tal-y-cafn',
-    'tala-ngai',
-    'talaat',
-    'talabardon',
     'talabec/lower',
-    'taladrid',
-    'talage',
-    'talahari',
-    'talahassee-based',
-    'talaheel',
-    'talairach',
-    'talakhadze',
-    'talamanca',
-    'talamantes',
-    'talat',
-    'talawa',
-    'talbenny',
-    'talbot/governor',
-    'talbot/northampton',
-    'talbot/oncology',
     'talbrager',
-    'talced-up',
-    'talcs',
-    'talde',
-    'tale(s)',
-    'tale-spinners',
-    'tale-teller',
-    'tale-tellers',
-    'talefre',
-    'taleggio',
-    'taleghani',
-    'talence',
-    'talent-based',
-    'talent-free',
-    'talent-governed',
-    'talent-hunting',
     'talent-impaired',
-    'talent-packed',
-    'talent-rewarding',
-    'talent-spotted',
-    'talentlessness',
-    'talentmark',
-    'talento',
-    'taleo',
-    'talers',
-    'tales.',
-    'talesanta',
-    'talese',
-    'talfourd',
-    'talgo',
-    'tali',
-    'taliabu',
     'talibani',
-    'taligent/pink',
-    'taligent/workplace',
-    'talin',
-    'talinn',
-    'talipia',
-    'talipot',
-    'talisa',
-    'talish',
-    'talismen',
-    'talitha',
-    'talk&mdash;now',
-    'talk&mdash;the',
-    'talk\'',
-    'talk-about-the-weather',
-    'talk-and-chalk',
     'talk-exchanges',
-    'talk-in',
-    'talk-to-plus',
-    'talk-up',
-    'talk-whistles',
-    'talk.',
-    'talk/interview',
-    'talk/upon',
-    'talkatively',
-    'talked/written',
-    'talkers.',
-    'talkhouse',
-    'talki',
-    'talkie_out',
-    'talking-about-himself',
-    'talking-brain',
     'talking-dolls',
-    'talking-down',
-    'talking-machine',
-    'talking-over',
-    'talking-shops',
-    'talking/laughing',
-    'talking/quoting',
-    'talkings',
-    'talks-see',
-    'talks/de',
-    'talks/panels/seminars',
-    'talks_out',
-    'talkshop',
-    'talkshow',
-    'talkt',
-    'talktative',
     'talkthrough',
-    'talkuassir',
-    'tall-boy',
-    'tall-chimney',
-    'tall-female',
-    'tall-pyramid',
-    'tall-short',
-    'tall-stack',
-    'tall-standing',
-    'tall-stemmed',
-    'tall-thinness',
-    'tall.maureen',
-    'tall/8ft',
-    'tall/emerald',
-    'tall/flat',
-    'tall/short',
     'talla',
-    'talladega',
-    'tallal',
-    'tallanstown',
-    'tallantire',
-    'tallauli',
-    'tallegio',
-    'tallent',
-    'taller-like',
-    'taller/shorter',
-    'tallest/you',
-    'tallet',
-    'talleyrand-perigord',
-    'talleyrand-perigords',
-    'talleyrands',
-    'tallien',
     'talliens',
-    'tallis-byrd',
-    'talliss',
-    'tallow-pale',
-    'tallow-smeared',
-    'tallow-woods',
-    'tallship',
-    'tally-making',
-    'tally-man',
-    'talmage/bbc',
-    'talmouses',
-    'talmudical',
-    'talmuds',
-    'talnotry',
-    'taloqan',
-    'talou',
     'talouns',
-    'talpa',
-    'talpade',
-    'talu',
-    'talukder',
-    'talukderlocal',
-    'taluntais',
-    'talvan',
-    'talwani',
-    'talwinder',
-    'taly',
-    'talybont&rehy;on-usk',
-    'talybont-on-usk',
-    'talycafn',
-    'talysarn',
-    'talywaun',
     'tam&aacute;s',
-    'tam-donning',
-    'tam-made',
-    'tam/paediatric',
-    'tamacipan',
-    'tamagno',
-    'tamahine',
-    'tamaioasa',
-    'tamaiosa',
-    'tamaka',
-    'tamale',
-    'tamales',
-    'tamalpais',
-    'tamana',
-    'tamandua',
-    'tamari',
     'tamarillo',
-    'tamarindus',
-    'tamarinte',
-    'tamarir',
-    'tamaris',
-    'tamarit',
-    'tamarugo',
-    'tamashek',
-    'tamasp',
-    'tamaya',
-    'tamaz',
-    'tamazepan',
-    'tamb.',
-    'tambatan',
-    'tambe',
-    'tambi&eacute;n',
     'tamborlane',
-    'tambotata',
-    'tamboured',
-    'tambourine-playing',
-    'tambov-kozlov',
-    'tambrand',
-    'tambryn',
-    'tambs',
-    'tamburi',
-    'tamburini',
-    'tamdin',
-    'tameer',
-    'tameh',
-    'tamerlan',
-    'tamerlano',
-    'tamet',
     'tamil-based',
-    'tamil-held',
-    'tamil-minority',
-    'tamilnadu',
-    'tamim',
-    'tamir',
-    'tamisuke',
-    'tamisura',
-    'tamiya',
-    'tamkang',
-    'tamma',
-    'tammany-type',
-    'tammen',
-    'tammie',
-    'tammisola',
-    'tammur',
     'tamodine',
-    'tamootsin',
-    'tamoren',
-    'tamotsu',
-    'tampan',
-    'tamper-evident',
-    'tampica',
-    'tampin',
-    'tamplin/businessman',
-    'tamplin/developer',
-    'tamponoir',
-    'tamposi',
-    'tamsie',
-    'tamson',
-    'tamujin',
-    'tamwood',
     'tamworth-born',
-    'tamyr',
-    'tan-',
-    'tan-220',
-    'tan-and-silver',
-    'tan-pits',
-    'tanada',
-    'tanago',
-    'tanais',
-    'tanajaro',
-    'tanakadate',
-    'tanakae',
-    'tanakatransport',
-    'tanaki',
-    'tanakia',
-    'tanalized',
     'tanami',
-    'tanarov',
-    'tancho',
-    'tanchuma',
-    'tancia',
-    'tancig',
-    'tancr&egrave',
-    'tancrede',
-    'tancy',
-    'tandai',
-    'tandata',
-    'tandbeg',
-    'tandjung',
-    'tandom',
-    'tandomly',
-    'tandona',
     'tandoori-cooked',
-    'tandooried',
-    'tandooris',
-    'tandown',
-    'tandridge',
-    'tandulkar',
-    'tandy-grid',
-    'tandy/grid',
-    'tandys',
-    'tanenbaum(1976)',
-    'tanenbaums',
-    'taner',
-    'tanetoa',
-    'tanev',
-    'tanezrouft',
-    'tangalla',
     'tanganicodus',
-    'tangata',
-    'tangee',
-    'tangham',
-    'tanginess',
-    'tangle-bearing',
-    'tangle-free.',
-    'tangle-fringed',
-    'tangle-scented',
-    'tangle-web',
-    'tangmeres',
-    'tango+',
-    'tango-tutor',
-    'tangrams',
-    'tangtai',
-    'tanguigue',
     'tangunt',
-    'tangutica',
-    'tangy-flavoured',
-    'tanichthys',
-    'taniela',
-    'tanigawa',
-    'tanikawa',
-    'tanin',
-    'taninim',
-    'tanisha',
-    'tanjga',
-    'tanjong',
-    'tank(s)',
-    'tank-builder',
-    'tank-bulldozers',
-    'tank-buster',
     'tank-busting',
-    'tank-cleaning',
-    'tank-fire',
-    'tank-full',
-    'tank-mate',
-    'tank-mix',
-    'tank-proof',
-    'tank-raised',
-    'tank-related',
-    'tank-space',
-    'tank-tracks',
-    'tank-traps',
-    'tank/pond',
-    'tankard-full',
-    'tanked-up',
-    'tanker\'',
     'tanker-based',
-    'tanker-load',
-    'tanker-loading',
-    'tanker-loads',
-    'tankeu',
-    'tankfuls',
-    'tankha',
-    'tankman',
-    'tankmasters',
-    'tankmate',
-    'tankraised',
-    'tankroom',
-    'tanks.',
-    'tanks/bowls',
-    'tankships',
-    'tanky',
     'tanla',
-    'tanlaw',
-    'tanmatras',
-    'tannahill/friend',
-    'tannaim',
-    'tanne',
-    'tanneds',
-    'tanner-ba',
-    'tanner/lab',
-    'tanner/oxford',
-    'tanner/tommy',
-    'tannert',
-    'tannian',
-    'tannin-free',
-    'tannin-pepsin',
-    'tannin-rich',
     'tannin/protein',
-    'tanninim',
-    'tannoch',
-    'tannochside',
-    'tannouri',
-    'tannu',
-    'tanoh',
-    'tanriverdi',
-    'tansads',
-    'tansferred',
-    'tansfield',
-    'tanshill',
-    'tanshill/victim',
-    'tanshire',
-    'tanski',
-    'tanskiagriculture',
     'tanstaafl',
-    'tant&ocirc;t',
-    'tantabin',
-    'tantaliser',
-    'tantallum',
-    'tantamoumt',
-    'tantawi',
-    'tantistisuk',
-    'tantka',
-    'tantra',
-    'tantras',
-    'tantrism',
-    'tantrum-filled',
-    'tantrums.',
-    'tants',
-    'tanturi',
     'tantzen',
-    'tanu-',
-    'tanui',
-    'tanura/singapore',
-    'tanuvasa',
-    'tanver',
-    'tanyar',
-    'tanycastell',
-    'tanygroes',
-    'tanypterus',
-    'tanzimat',
-    'tanzin',
-    'tanzio',
-    'taoibh',
-    'taoists',
-    'taonga',
     'tap&rehy;dancing',
-    'tap&rehy;room',
-    'tap-borne',
-    'tap-danced',
-    'tap-dancer',
-    'tap-handles',
-    'tap-hole',
-    'tap-in-putt',
-    'tap-ins',
-    'tap-penalties',
-    'tap-penalty',
-    'tap-rooted',
-    'tap-tap-tap',
-    'tap-technique',
-    'tap-the-tip-tank',
-    'tap-turning',
     'tap.',
-    'tap/faucet',
-    'tap1a',
-    'tap2a',
-    'tapable',
-    'tapachula',
-    'tapajos',
-    'tapanahony',
-    'taparua',
-    'tapdance',
-    'tape&ccedil;aria',
-    'tape&ccedil;arias',
-    'tape-bonded',
-    'tape-driven',
-    'tape-journal',
-    'tape-machine',
     'tape-monitor',
-    'tape-number',
-    'tape-path',
-    'tape-player',
-    'tape-recorder(s)',
-    'tape-tastic',
-    'tape-up',
-    'tape/cd',
-    'tape/disk',
-    'tape/min',
-    'tape/tickets/press',
-    'tape250',
-    'tapedeck',
-    'tapeinosis',
-    'tapemeisters',
-    'tapenades',
     'tapenda',
-    'taper-drawing',
-    'taper-edge',
-    'taperecording',
-    'tapered-sided',
-    'taperell',
-    'tapering-off',
-    'tapes.',
-    'tapes/seventy',
-    'tapes/tape',
-    'tapeshelves',
-    'tapestry-covered',
-    'tapestry-hung',
-    'tapestry-maker',
-    'tapestry-making',
-    'tapestry-work',
     'tapestry.',
-    'tapesys',
-    'tapetes',
-    'taphrogeosynclines',
-    'tapin',
-    'tapioca-like',
-    'tapis',
-    'tapotement',
-    'tappa',
-    'tappertit',
-    'tappin',
-    'tappin\'',
-    'tappin/bus',
-    'tappin/gloucester',
-    'tapping/microsurgery',
-    'tappit',
     'tappo',
-    'tappy',
-    'taprain',
-    'taps_on',
-    'tapsall',
-    'tapsall/widow',
-    'tapscott',
-    'tapscotts',
-    'tapsell/karate',
-    'tapshoes',
-    'tapsoba',
-    'tapti',
-    'tapton',
-    'tapu',
-    'tapueluelu',
-    'tapundas',
     'taqadossi',
-    'taqiyah',
-    'taqizadah',
-    'taqtaq',
-    'taquan',
-    'taqui',
-    'taquina',
-    'tar&rehy;touillat',
-    'tar-baby',
-    'tar-bound',
-    'tar-bucket',
-    'tar-drenched',
-    'tar-file',
-    'tar-free',
-    'tar-laying',
-    'tar-macadam',
     'tar-reaching',
-    'tar-stained',
-    'tar-surfaced',
-    'tar-sweated',
-    'tar-water',
-    'tar/lower',
-    'tarabini',
-    'tarabulsi',
-    'tarabulus',
-    'taradiddles',
-    'tarak',
-    'taraket',
-    'taralli',
-    'taramakau',
-    'taran',
-    'taranaka',
     'taranarac',
-    'tarantelle',
-    'tarapur',
-    'tarascon',
-    'tarasia',
-    'taraval',
-    'tarawali',
-    'tarawalie',
-    'tarawih',
-    'tarazed',
-    'tarbais',
-    'tarballs',
-    'tarbart',
-    'tarbat',
-    'tarbes/mooney',
-    'tarbock',
     'tarboosh',
-    'tarbor',
-    'tarbrush',
-    'tarbuck/comedian',
-    'tarbutt',
-    'tarcisio',
-    'tardar',
-    'tardets-sorholus',
-    'tardislike',
-    'tarditional',
-    'tardivel',
-    'tardives',
-    'tardos',
-    'tardus',
-    'tardyon',
-    'tarelli',
     'tarentines',
-    'tarf',
-    'target&mdash;and',
-    'target-man',
-    'target-practice',
-    'target-range',
-    'target-readership',
-    'target-screen',
-    'target-see',
-    'target-selecting',
-    'target-shooter',
-    'target-specific',
-    'target-testing',
-    'target-topics',
-    'target-tug',
-    'target-word',
     'target15',
-    'targeting.',
-    'targetising',
-    'targetry',
-    'targets-instruments',
-    'targets.',
-    'targettotalannual',
-    'targon/31',
-    'targon/31s',
-    'targon/35',
-    'targt',
-    'targus',
-    'tarianas',
-    'taric/commodity',
-    'tarifa',
-    'tariff-induced',
     'tariff-making',
-    'tariff-reductions',
-    'tarims',
-    'tarina',
-    'taringar',
-    'tarisker',
-    'tarita',
-    'tarja',
-    'tarjan',
-    'tark',
-    'tarkhanov',
-    'tarkoff',
-    'tarkunde',
-    'tarl',
-    'tarmac-and-broken-glass',
-    'tarmac-covered',
     'tarmac-kissing',
-    'tarmac-pounding',
-    'tarmac-scorching',
-    'tarmac-vacuuming',
-    'tarmacking',
-    'tarmiyah',
-    'tarn-et-garonne',
-    'tarne',
-    'tarnip',
-    'tarnjacket',
-    'tarnmere',
-    'tarnobrzeg',
-    'tarnopol',
-    'tarnopol-lemberg',
-    'tarnow-mordi',
-    'tarnowski',
     'tarob',
-    'tarogan',
-    'tarom-e',
-    'taronga',
-    'taroomba',
-    'taroona',
-    'tarot-sneak',
-    'tarp',
-    'tarpaper',
-    'tarpawling',
-    'tarpeius',
-    'tarpey',
-    'tarpley',
-    'tarps',
-    'tarquinii',
-    'tarraa',
     'tarraco',
-    'tarradale',
-    'tarradiddle',
-    'tarran',
-    'tarranium',
-    'tarrantula',
-    'tarras',
-    'tarrasa',
-    'tarrasch',
-    'tarratt',
-    'tarrazona',
-    'tarre',
-    'tarrers',
-    'tarres',
-    'tarriff',
-    'tarriffs',
     'tarrington/herefordshire',
-    'tarrocks',
-    'tarry-hooded',
-    'tarsa',
-    'tarsadalmi',
-    'tarsals',
-    'tarsier-like',
-    'tarsila',
-    'tarsius',
-    'tarson',
-    'tarsus-schmarsus',
-    'tart-lash',
-    'tart-skinned',
-    'tart-tongued',
-    'tart-trotters',
-    'tart-with-a-golden-heart',
     'tart/tangy',
-    'tartabull',
-    'tartaglia',
-    'tartaglione',
-    'tartan-clad',
-    'tartan-inspired',
-    'tartan-lined',
-    'tartan-skirted',
-    'tartan-style',
-    'tartan-trimmed',
-    'tartanry',
-    'tartanware',
-    'tartarea',
-    'tartarin',
-    'tartarus',
-    'tartas',
     'tartaya',
-    'tarter',
-    'tartifkoff',
-    'tartily',
-    'tartines',
-    'tartish',
-    'tartorria',
-    'tartrate',
-    'tartter',
-    'tartufo',
-    'taruc',
-    'tarun',
-    'tarver',
-    'tarvit',
-    'taryans',
-    'taryn',
     'tarzie',
-    'tasaday',
-    'tasc&oacute;n',
-    'tasca',
-    'taschen',
-    'tascio',
-    'tase',
-    'taser',
-    'tashaka',
-    'tashaliyev',
-    'tashdzhyan',
-    'tashenu',
-    'tashiha',
-    'tashin',
-    'tashjian',
-    'tashkent-moscow',
     'tashlak',
-    'tashlich',
-    'tashnag',
-    'tashpinar',
-    'tasika',
-    'tasilova',
-    'task&rehy;focused',
-    'task(s)',
-    'task-adapted',
-    'task-culture',
-    'task-goal',
-    'task-independent',
-    'task-instruction',
-    'task-level',
-    'task-management',
-    'task-orientation',
     'task-relevant',
-    'task-setters',
-    'task-use',
-    'task/',
-    'task/evidence',
-    'task/standing',
-    'task4',
-    'task5yourinitials',
-    'task5yourinitials.doc',
-    'task7yourinitials',
-    'taskar',
-    'taske',
-    'tasker-poland/gas',
-    'tasker/access',
-    'taskhkent',
-    'taskmanager',
     'taskmax',
-    'taskopru',
-    'tasks_such',
-    'taslanised',
-    'tasleen',
-    'taslitzky',
-    'taslk',
-    'tasman-2',
-    'tasman/south',
-    'tasmanians',
-    'tasms',
-    'tasos',
-    'tassaduq',
-    'tassel-shaped',
-    'tasseling',
-    'tassell',
     'tassili-n-ajer',
-    'tassin',
-    'tassios',
-    'tassle',
-    'tassos',
-    'taste\'',
-    'taste-changes',
-    'taste-evoking',
-    'taste-high',
-    'taste-maker',
-    'taste-poison',
-    'taste-presumably',
-    'taste-shaping',
-    'taste-testing',
-    'taste-tingling',
-    'tastefully-designed',
     'tastefully-furnished',
-    'tastefully-lit',
-    'tastelessness',
-    'taster-in-chief',
-    'tastery',
-    'tasti',
-    'tastily',
-    'tastiness',
-    'tasty.',
-    'tasuku',
-    'tat&egrave',
-    'tat-eared',
-    'tata-box-factor',
-    'tata-containing',
-    'tata-less',
-    'tata-motif',
     'tata-sequences',
-    'tataatgaatttgggaga',
-    'tatab&acirc;nya',
-    'tatam',
-    'tatams',
-    'tatanka',
-    'tatarskaya',
-    'tatason',
-    'tatat',
-    'tate/fund',
-    'tate/patient',
-    'tategaki',
-    'tater-',
-    'tater-picking',
-    'tateraka',
-    'tateson',
     'tateurndina',
-    'tatggccata',
-    'tathagata',
-    'tatham/rscg',
-    'tathlum',
-    'tatia',
-    'tatianas',
-    'tatiani',
-    'tatile',
-    'tation',
-    'tatischeff',
-    'tatistical',
-    'tatitlek',
-    'tatlin-like',
-    'tatmadaw',
-    'tato',
     'tatoo',
-    'tatooed',
-    'tatransk&aacute',
-    'tatshenshini',
-    'tatside',
-    'tatsienense',
-    'tatsufumi',
-    'tatsuo',
-    'tatsuro',
-    'tatsuta',
-    'tatsuyoshi',
-    'tatt',
-    'tattembach',
-    'tatten',
-    'tatter-edged',
-    'tattered-looking',
     'tatters.',
-    'tattershaw',
-    'tatti-like',
-    'tatties.',
-    'tattily',
-    'tattinger',
-    'tattingstone',
-    'tattoed',
-    'tatton-brown',
-    'tattoo-wearin\'',
-    'tattwa',
-    'tatty.however',
-    'tatwine',
-    'tau&amp;sup3',
-    'tau&amp;sup6',
-    'tau-antineutrinos',
     'tau-cluster',
-    'tau-neutrinos',
-    'taub-nut',
-    'tauber-arp',
-    'taubes',
-    'taubman-goldie',
-    'taucheira',
-    'tauentzien',
-    'tauentzienstrasse',
-    'tauern',
-    'tauernkraftwerk',
-    'taufan',
-    'taugh',
-    'taught&rehy;it',
-    'taught-course',
-    'taught-lexis',
     'taught-myself-with-mothers-clothesline-brigade',
-    'taught.a',
-    'taulbee',
-    'tauman',
-    'taunagh',
-    'taung-gyi',
-    'taunggyi',
-    'taunggyi&ndash;kalaw',
-    'taungin-in',
-    'taunters',
-    'taunton-based',
-    'taupe/peach',
-    'taupo-rotorua',
-    'taur',
-    'taura',
-    'tauranac',
     'tauregs',
-    'taurinensia',
-    'tauromachia',
-    'tauromenium',
-    'taurulus',
-    'tausch',
-    'tausk',
-    'taussig',
-    'taut-faced',
-    'taut-stretched',
-    'tauting',
-    'tautly-held',
-    'tautochrone',
-    'tautonymous',
-    'tautonyms',
-    'tautonymy',
     'tauveve',
-    'tavalams',
-    'tavalqia',
-    'tavant',
-    'tavara',
-    'tavard',
-    'tavari',
-    'tavarishch',
-    'tavastia',
-    'tavedikul',
-    'tavender',
-    'tavender/labour',
-    'tavender/malaya',
-    'tavera',
-    'taveras',
-    'tavern-league',
     'tavernas/bars',
-    'taverne',
-    'tavernelle',
-    'tavernetta',
-    'taverstock',
-    'taveta',
-    'taviani',
-    'taviner',
-    'tavio',
-    'tavistocks',
-    'tavkhelidze',
-    'tavle',
-    'tavner',
-    'tavollo',
-    'tavolo',
-    'tavora',
     'tavra',
-    'tawahka',
-    'tawakha',
-    'tawantinsuyo',
-    'tawar',
-    'tawarikh',
-    'taweche',
-    'tawells',
-    'tawheed',
-    'tawia',
-    'tawiah',
-    'tawmaw',
-    'tawn',
-    'tawniness',
-    'tawny-blond',
-    'tawny-haired',
     'tawny-limbed',
-    'tawny-shouldered',
-    'tawstock',
-    'tawton',
-    'tax&mdash;bearing',
-    'tax&mdash;the',
-    'tax\'',
-    'tax-and-grants',
-    'tax-assessed',
-    'tax-assessments',
-    'tax-averse',
-    'tax-avoiders',
-    'tax-back',
-    'tax-benefit',
-    'tax-boundary',
-    'tax-breaks',
     'tax-collection',
-    'tax-concessions',
-    'tax-conscious',
-    'tax-cum-monetary',
-    'tax-cut-financed',
-    'tax-deductable',
-    'tax-deducted',
-    'tax-deductibility',
-    'tax-deferring',
-    'tax-dodge',
-    'tax-dodges',
-    'tax-driven',
-    'tax-effectively',
-    'tax-evaders',
-    'tax-evading',
-    'tax-finance',
     'tax-financing',
-    'tax-forms',
-    'tax-friendlier',
-    'tax-gatherers',
-    'tax-government',
-    'tax-grabs',
-    'tax-granting',
-    'tax-heavy',
-    'tax-increase',
-    'tax-increasing',
-    'tax-inspector',
-    'tax-minimising',
-    'tax-mix',
-    'tax-neutral',
-    'tax-penalised',
-    'tax-plan',
     'tax-protest',
-    'tax-protesters',
-    'tax-raisers',
-    'tax-refusal',
-    'tax-relief-induced',
-    'tax-reliefs',
-    'tax-revenue',
-    'tax-saver',
-    'tax-shield',
-    'tax-spending',
-    'tax-status',
-    'tax-subsidized',
-    'tax-to-date',
-    'tax-tree',
-    'tax-weary',
-    'tax-writing',
     'tax-xxxx',
-    'tax-year',
-    'tax.',
-    'tax.collector',
-    'tax.collectors',
-    'tax/corporation',
-    'tax/public',
-    'tax/sales',
-    'taxan',
-    'taxation-class',
-    'taxation/social',
-    'taxatores',
-    'taxaxerol',
-    'taxcollectors',
-    'taxeis',
-    'taxell',
     'taxes&mdash;a',
-    'taxi\'',
-    'taxi-association',
-    'taxi-bills',
-    'taxi-bound',
-    'taxi-bus',
-    'taxi-divers',
-    'taxi-ed',
-    'taxi-licence',
-    'taxi-operators',
-    'taxi-runs',
-    'taxi-stand',
-    'taxi-van',
-    'taxi-way',
-    'taxi/bus/train',
-    'taxic',
     'taxidrivers',
-    'taximax',
-    'taxis/coaches',
-    'taxline',
-    'taxono',
-    'taxonomical',
-    'taxonoms',
-    'taxophobia',
-    'taxpayer-financed',
-    'taxpayer-funded',
-    'taxthresh',
-    'tay-sachs',
-    'tayburn',
-    'tayer',
-    'tayfield',
-    'taygete',
     'taygetus',
-    'tayjack',
-    'taylersons',
-    'tayloes',
-    'taylor(1986)',
-    'taylor-east',
-    'taylor-elder',
-    'taylor-evans',
-    'taylor-griffiths',
-    'taylor-issajenko',
-    'taylor-smith',
-    'taylor/bruce',
-    'taylor/clough',
-    'taylor/college',
-    'taylor/ex',
-    'taylor/ex-apprentice',
     'taylor/grandmother',
-    'taylor/henri',
-    'taylor/horse',
-    'taylor/l',
-    'taylor/letcombe',
-    'taylor/mother',
-    'taylor/national',
-    'taylor/organic',
-    'taylor/organiser',
-    'taylor/oxfordshire',
-    'taylor/pensioner',
-    'taylor/st',
-    'taylor/swindon',
-    'taylor/world',
-    'taylorhe',
-    'taylorian/ashmolean',
     'taylorite',
-    'taylorization',
-    'taylour/trading',
-    'tayman',
-    'tayo',
-    'taypayer',
-    'taype',
-    'tayside/la',
-    'taysir',
-    'tayvailin',
-    'tayvelka',
-    'tayverka',
-    'tayvullin',
-    'tazama',
-    'tazara',
-    'tazelle',
     'tazn',
-    'tazzi',
-    'tb-9',
-    'tb-infected',
-    'tb-testing',
-    'tb03',
-    'tb1/1',
-    'tb1/2',
-    'tb10s',
-    'tb2',
-    'tb20/tb21',
-    'tb21',
-    'tb863',
-    'tb9',
-    'tb9s',
-    'tbdfs',
     'tbili',
-    'tbls',
-    'tblsps',
-    'tboc3',
-    'tborpey',
-    'tbp-associated',
-    'tbp-binding',
-    'tbto',
-    'tc(ct)tg(acgt)gc-',
-    'tc-130g',
-    'tc-2290',
-    'tc-4',
-    'tc-ec',
-    'tc-hmpao',
-    'tc-ldiethylene',
-    'tc-sulphur',
     'tc-treated',
-    'tc/154',
-    'tc/tt',
-    'tc1000',
-    'tc199',
-    'tc=',
-    'tca-precipitation',
-    'tcaacc-17-tataat',
-    'tcalls',
-    'tcatg.tcc.gaa.cat.gag.acc.cgt',
-    'tcca',
-    'tcda',
-    'tce-contaminated',
-    'tcep',
-    'tcf-1&agr',
-    'tcf8',
     'tcgcccagctcagggccgcgtgtgttagtt',
-    'tch-ed',
-    'tch-tch-tch',
-    'tchaboure',
-    'tchadien',
-    'tchadien-fdt',
-    'tchadiennes',
-    'tchai',
-    'tchaikovskian',
-    'tchalla',
-    'tchekov',
-    'tchelitchew',
-    'tcherepnin',
-    'tcherikover',
-    'tchernia',
-    'tchertsivittchi',
     'tchi-tchirrp',
-    'tchick',
-    'tchik',
-    'tchimne',
-    'tchirozerine',
-    'tchitchi',
-    'tchollir',
-    'tchombegoposts',
-    'tchoo',
-    'tchoudnovsky',
-    'tchoukou-hadje',
-    'tchourou',
-    'tchouta',
-    'tchueet',
-    'tchup',
-    'tcj',
     'tcket',
-    'tcl200',
-    'tcl400',
-    'tcp/ip-oriented',
-    'tcp/ip.',
-    'tcpp',
-    'tcr-positive',
-    'tcrm',
-    'tcru',
-    'tcs1',
-    'tcu-pa',
-    'tcup',
-    'tcv+platelet',
-    'tcv-309+',
-    'tcw',
-    'tcw03',
     'tczew',
-    'td/congressperson/senator',
-    'td/ed',
-    'td1',
-    'td166vi',
-    'td2',
-    'td248/g&ndash;oxvi',
-    'td3',
-    'tdb',
-    'tdh',
-    'tdrsa',
-    'tdrss',
-    'tds.2',
-    'tdt',
-    'tdtlq-',
-    'te-',
     'te-e-e-sti-fyyy',
-    'te-e-e-stify',
-    'te-ec',
-    'te-hsiung',
-    'te-k\'un',
-    'te-roe-puss',
-    'te-total',
-    'te31',
-    'te517',
-    'tea&rehy;cosy',
-    'tea&rehy;pot',
-    'tea&rehy;towel',
-    'tea&rehy;towels',
-    'tea-and-bed',
-    'tea-and-toast-type',
-    'tea-basket',
     'tea-boys',
-    'tea-bread',
-    'tea-brewing',
-    'tea-bulb',
-    'tea-carrier',
-    'tea-ceremony',
-    'tea-chest-sized',
-    'tea-culture',
-    'tea-dance',
-    'tea-dancers',
-    'tea-dances',
-    'tea-dispensing',
-    'tea-drinker',
-    'tea-drinkers',
-    'tea-drinkings',
-    'tea-from',
     'tea-garden',
-    'tea-glasses',
-    'tea-kettles',
-    'tea-laden',
-    'tea-leavery',
-    'tea-leaves.',
-    'tea-less',
-    'tea-machine',
-    'tea-meeting',
-    'tea-meetings',
-    'tea-mug',
-    'tea-picking',
-    'tea-plant',
-    'tea-planter',
-    'tea-planting',
-    'tea-pot-like',
     'tea-producing',
-    'tea-room.',
-    'tea-rose',
-    'tea-scented',
-    'tea-sellers',
-    'tea-sieve',
-    'tea-smelling',
-    'tea-tables',
-    'tea-tax',
-    'tea-ti',
-    'tea-times',
-    'tea-toast-and-tinned-soup',
-    'tea-trays',
-    'tea-warehouses',
-    'tea-with-the-beatles',
-    'tea/toast',
     'tea=bag',
-    'teabowl',
-    'teabread',
-    'teach&mdash;in',
-    'teach&rehy;yourself',
-    'teach-yourself-photography',
-    'teachability',
-    'teachableness',
-    'teacher&rehy;pupil',
-    'teacher\'',
-    'teacher\'s-eye',
-    'teacher\'s/library',
-    'teacher-accountability',
-    'teacher-appraisal',
-    'teacher-appropriated',
-    'teacher-as-social-worker',
     'teacher-assessment',
-    'teacher-author',
-    'teacher-awareness',
-    'teacher-consultant',
-    'teacher-control',
-    'teacher-controlled',
-    'teacher-critics',
-    'teacher-day',
-    'teacher-dependent',
-    'teacher-designed',
-    'teacher-driven',
-    'teacher-education',
-    'teacher-effectiveness',
-    'teacher-entrepreneurs',
-    'teacher-entry',
-    'teacher-expectations',
     'teacher-fellows',
-    'teacher-function',
-    'teacher-generated',
-    'teacher-imposed',
-    'teacher-interpreter',
-    'teacher-librarianship',
-    'teacher-members',
-    'teacher-nurse',
-    'teacher-preparation',
-    'teacher-proof',
-    'teacher-report',
-    'teacher-roasting',
-    'teacher-scales',
-    'teacher-structuring',
-    'teacher-supported',
-    'teacher-team',
     'teacher-trainees',
-    'teacher-turned-comic',
-    'teacher-turnover',
-    'teacher-tutor',
-    'teacher-tutors',
-    'teacher-user',
-    'teacher-users',
-    'teacher-writers',
-    'teacher.exposition',
-    'teacher.support',
-    'teacher/academic',
-    'teacher/adviser',
-    'teacher/author',
-    'teacher/learner',
-    'teacher/librarian',
-    'teacher/manager',
     'teacher/outreach',
-    'teacher/poet',
-    'teacher/practitioner',
-    'teacher/program',
-    'teacher/researcher',
-    'teacher/researchers',
-    'teacher/supervisor',
-    'teacher/teacher',
-    'teacher/technician',
-    'teacher/writer',
-    'teacher:pupil',
-    'teacherly',
-    'teachers-dem',
-    'teachers/lecturers',
-    'teachers/practical',
-    'teachers/trainers',
     'teachers_as',
-    'teachership',
-    'teaches.a',
-    'teachests',
-    'teachi',
-    'teachin\'',
-    'teaching-in-role',
-    'teaching-machine-style',
-    'teaching-only',
-    'teaching-post',
-    'teaching-training',
-    'teaching.staff',
-    'teaching/discipline',
-    'teaching/dissemination',
-    'teaching/non-teaching',
-    'teaching/personnel',
     'teaching_so',
-    'teachum',
-    'teacing',
-    'teacloths',
-    'teafolk',
-    'teague.',
-    'teague/gloucester',
-    'teahouses',
-    'teak&rehy;wood',
-    'teak-dark',
-    'teak-finished',
-    'teak-laid',
-    'teak-lined',
-    'teak-tough',
-    'teak-veneered',
-    'teal-like',
     'tealady',
-    'teale/tgwu',
-    'tealham',
-    'tealing',
-    'team&gt',
-    'team\'',
-    'team-',
-    'team--multidisciplinary',
-    'team-changing',
-    'team-handling',
-    'team-leader/manager',
-    'team-list',
-    'team-load',
-    'team-managed',
-    'team-managers',
-    'team-managing',
     'team-meeting',
-    'team-member(s)',
-    'team-nursing',
-    'team-owners',
-    'team-pal',
-    'team-places',
-    'team-players',
-    'team-room',
-    'team-run',
-    'team-sized',
-    'team-skills',
-    'team-songs',
-    'team-spirit',
-    'team-spokesman',
-    'team-structured',
-    'team-style',
     'team-talk',
-    'team-teach',
-    'team.no',
-    'team/',
-    'team/cellular',
-    'team/departmental/individual',
-    'team/module',
-    'team/official',
-    'team0',
-    'teamaking',
-    'teamat',
-    'teamate',
-    'teamates',
-    'teamhair',
-    'teammakes',
-    'teampull',
     'teams-of-eight',
-    'teams/players',
-    'teamsheet',
-    'teamsheet.',
-    'teamsmanship',
-    'teamwear',
-    'teamworkers',
-    'teane',
-    'teaney',
-    'teanga',
-    'teape/arjomari',
-    'teaplanter',
-    'teaplates',
-    'teapot\'',
-    'teaqchers',
-    'tear-',
     'tear-blob',
-    'tear-bright',
-    'tear-brimmed',
-    'tear-dampened',
-    'tear-drops',
-    'tear-gassing',
-    'tear-in-her-eye',
-    'tear-in-my-beer',
-    'tear-inducing',
-    'tear-jerk',
-    'tear-laden',
-    'tear-resistant',
-    'tear-smudged',
-    'tear-swollen',
-    'tear-tracked',
-    'tear/abrasion',
     'tear/trial',
-    'tearable',
-    'teararse',
-    'tearbombs',
-    'tearfall',
-    'tearful\'',
-    'teargassed',
-    'tearin\'',
-    'tearing-apart',
-    'tearingly',
-    'tearings',
-    'tearle',
-    'tearlessly',
-    'tearney',
-    'tearout',
-    'tears-and-outrage',
     'tears-away',
-    'tears-of',
-    'tears.5',
-    'tearse',
-    'tearsheet',
-    'teartment',
-    'teary-eyed',
-    'teas.',
-    'teasdel',
-    'teasdill',
-    'tease.',
-    'teased.',
-    'teasets',
-    'teashoppe/cafe',
-    'teasin',
-    'teasin\'',
     'teasing-out',
-    'teasp',
-    'teaspon',
-    'teaspoonful-and-a-half',
-    'teasy',
-    'teasy-weasy',
-    'teatable',
-    'teather',
-    'teatime.',
-    'teatini',
-    'teatles',
-    'teatment',
-    'teatowel',
-    'teatowels',
-    'teatralny',
-    'teatray',
     'teatre-museu',
-    'teatrecho',
-    'teatrolley',
-    'teau',
-    'teaware',
-    'teawares',
-    'teazel',
-    'teazles',
-    'teb',
-    'tebaldo',
-    'tebania',
-    'tebay',
-    'tebbal',
-    'tebbet',
-    'tebbetts',
-    'tebbit-like',
     'tebbitite',
-    'tebbits',
-    'tebble',
-    'tebbut',
-    'tebby',
-    'tebe',
-    'tebedge',
-    'teberosky',
-    'tebitto',
-    'tebogo',
-    'teburoro',
-    'tebya',
-    'tec-1',
-    'tec-bond',
-    'tec-funded',
-    'tec-ni-pli',
     'tecchies',
-    'tech&rehy;nical',
-    'tech-air',
-    'tech-boy',
-    'tech-info',
-    'tech-side',
-    'tech-skragging',
-    'tech-speak',
-    'tech.',
-    'tech/high',
-    'techa',
-    'techdata',
-    'techgen',
-    'techgreen',
-    'techician',
-    'techino',
     'techis',
-    'techmark',
-    'technerds',
-    'technetium-diethylene-triamino-pentaacetic',
-    'technica/professionale',
-    'technical-bureaucratic',
-    'technical-drawing',
-    'technical-help',
-    'technical-legal',
-    'technical-market',
-    'technical-scientific',
-    'technical-sounding',
-    'technical-support',
-    'technical-to',
-    'technical/academic',
-    'technical/specialised',
     'technical/vocational',
-    'technicaldirector',
-    'technically&rehy;orientated',
-    'technically-defined',
-    'technically-minded',
-    'technically-orientated',
-    'technically-sophisticated',
-    'technically/financially',
-    'technicalsuperior',
-    'technicare',
-    'technicatome',
-    'technichal',
-    'technician-craftsman',
-    'technician-type',
-    'technician/assistant',
-    'technician/scientist',
     'technician_as',
-    'technicians/technician',
-    'techniciens',
-    'technicity',
-    'technicky',
-    'technico',
-    'technicues',
-    'techniflex',
-    'technimont',
-    'techniqes',
-    'techniqu',
-    'technique(s)',
-    'technique-intensive',
-    'techniquemay',
-    'techniques-',
-    'techniques.5',
     'technis',
-    'technischen',
-    'technischer',
-    'technitron',
-    'techno&rehy;crats',
-    'techno&rehy;economic',
-    'techno-archaeology',
-    'techno-art',
-    'techno-based',
-    'techno-brutalism',
-    'techno-chic',
-    'techno-confusion',
-    'techno-culture',
-    'techno-ed',
-    'techno-flash',
-    'techno-guerrillas',
     'techno-gym',
-    'techno-heads',
-    'techno-master',
-    'techno-mercenary',
-    'techno-myth',
-    'techno-overkill',
-    'techno-pagan',
-    'techno-phobia',
-    'techno-pioneer',
-    'techno-pop',
-    'techno-rumpy',
-    'techno-sale',
-    'techno-science',
-    'techno-structure',
-    'techno-superheroes',
-    'techno-tasting',
     'techno-terrorists',
-    'techno-theological',
-    'technobombs',
-    'technobureaucratic',
-    'technocentric&rehy;inspired',
-    'technocop',
-    'technoculture',
-    'technoflash',
-    'technogical',
-    'technoish',
-    'technol',
-    'technologia',
-    'technologial',
-    'technological-bureaucratic',
-    'technological-feasibility',
-    'technologically-challenged',
     'technologically-induced',
-    'technologically/vocationally',
-    'technologico-benthamism',
-    'technologico-benthamite',
-    'technologico-economic',
-    'technologies\'\'',
-    'technologies.',
-    'technologies.taken',
-    'technologies.the',
-    'technologiques',
-    'technologisdts',
-    'technologising',
-    'technologism',
-    'technologist-in-chief',
-    'technology&mdash;even',
-    'technology&rehy;based',
     'technology-conscious',
-    'technology-designed',
-    'technology-developed',
-    'technology-forcing',
-    'technology-free',
-    'technology-is-politically-neutral',
-    'technology-orientated',
-    'technology-specific',
-    'technology-swapping',
-    'technology-trading',
-    'technology-wise',
-    'technology/computerization/automation',
-    'technology/learning',
-    'technology/nature/medicine/etc',
-    'technologydriven',
-    'technomats',
     'technopark',
-    'technophilia',
-    'technophobe',
-    'technophobia',
-    'technopol',
-    'technopoli',
-    'technopolitan',
-    'technorton',
-    'technos',
-    'technosoft',
-    'technosphere',
-    'technospheres',
-    'technostructure',
-    'technosyn',
-    'technotile',
-    'technovidea',
     'techntsche',
-    'techsystems',
-    'techtextil',
-    'techtrend',
-    'techy',
-    'teckman',
-    'tecmedia',
-    'tecnico',
-    'tecnofrite',
-    'tecnol',
-    'tecnol&oacute;gico',
-    'tecnologie',
-    'tecnomare',
-    'tecnomatix',
-    'tecroghan',
-    'tecta',
     'tectelles',
-    'tectogene',
-    'tectona',
-    'tectono-stratigraphic',
-    'tectosilicates',
-    'tectum',
-    'tecture-mapped',
-    'teculescu',
-    'tecuya',
-    'ted-buddhism',
-    'ted-decorated',
-    'ted/wayne',
-    'tedale',
-    'tedd',
-    'teddie',
-    'teddleton',
     'tedford',
-    'tedia',
-    'tediary',
-    'tedio',
-    'tedius',
-    'tedmans',
-    'tedstone',
-    'tedulkar',
-    'tee-',
-    'tee-ed',
-    'tee-fittings',
-    'tee-hinge',
-    'tee-markers',
-    'tee-oo',
-    'tee-oo-ee',
-    'tee-pieces',
     'tee-ser',
-    'tee-shirted',
-    'tee-tew',
-    'tee-times',
-    'tee-to-green',
-    'tee-totalling',
-    'tee-up',
-    'teeange',
-    'teeangers',
-    'teeboon',
-    'teebridge',
-    'teecher',
-    'teed-off',
-    'teed-up',
-    'teefal',
-    'teefs',
     'teegers',
-    'teeh',
-    'teeing-up',
-    'teeka',
-    'teel',
-    'teele',
-    'teeling-smith',
-    'teem-x',
-    'teeming-pit',
-    'teen-\'zine',
-    'teen-idol',
-    'teen-machine',
-    'teen-mag',
-    'teen-prostitute-victim',
-    'teen-queen',
-    'teen-rebel',
     'teen-star',
-    'teenage-flavoured',
-    'teenage-mutant-ninja-mole',
-    'teenager-is',
-    'teenagers.',
-    'teendream',
-    'teenegers',
-    'teenfic',
-    'teenie',
-    'teenoso',
-    'teenpop',
-    'teens/low',
-    'teensy-weensiest',
-    'teensy-weensy',
-    'teeny-boppers',
-    'teeny-weenies',
     'teenybopper',
-    'teenybopperish',
-    'teeoo',
-    'teep',
-    'teep-teep-teep',
-    'teepee',
-    'teepees',
-    'teepeg',
-    'teerasut',
-    'teerenatch',
-    'teerlinc',
-    'teerlincs',
-    'teerp',
-    'tees-up',
-    'teese',
-    'teeshot',
     'teesiders',
-    'teeswater',
-    'teeswaters',
-    'teesway',
-    'teetaire',
-    'teetery',
-    'teeth&rehy;but',
-    'teeth-achingly',
-    'teeth-and-tentacles',
-    'teeth-bared',
-    'teeth-clenching',
-    'teeth-gnashing',
-    'teeth-grindingly',
-    'teeth-gritter',
-    'teeth-gritting',
-    'teeth-jarring',
     'teeth-loosening',
-    'teeth-marks',
-    'teeth-pulling',
-    'teeth-scrubbing',
-    'teeth-sucking',
-    'teeth-together',
-    'teeth-washing',
-    'teeth.that',
-    'teethache',
-    'teethed',
-    'teether',
-    'teething-smith',
-    'teeths',
-    'teetum',
-    'teez',
-    'tefe',
     'teferred',
-    'teff',
-    'tefferson',
-    'tefi',
-    'tefillin',
-    'tefl/tesl',
-    'teflon-coating',
-    'teflon-glass',
-    'teft',
-    'tegalensis',
-    'tegernsee',
-    'tegetmeier',
-    'tegfan',
-    'tegg',
-    'teggart',
-    'teggin',
     'tegmina',
-    'tegodor',
-    'tegs',
-    'teguia',
-    'tegulated',
-    'tegumentary',
-    'tehachapi',
-    'tehandiri',
-    'tehas',
-    'tehbazaari',
-    'tehee',
-    'teheran-born',
-    'teheran-europe',
-    'tehidy',
-    'tehiyaand',
-    'tehnique',
     'tehran-ashkhabad',
-    'tehran-baku',
-    'tehranmany',
-    'tehri',
-    'tehuantepec',
-    'tei-l',
-    'teibenbacher',
-    'teich',
-    'teichova',
-    'teicoplanin',
-    'teige',
-    'teigh',
-    'teigngrace',
-    'teikyo',
-    'teile',
-    'teilfod/officer',
     'teilhardian',
-    'teillard',
-    'teilo',
-    'teilungen',
-    'teimuraz',
-    'teinart',
-    'teinds',
-    'teintes',
-    'teinturie',
-    'teiresias',
-    'teise',
-    'teisho',
-    'teisiphone',
-    'teissier',
-    'teiste',
-    'teitelboim',
     'teitlebaum',
-    'teitsch',
-    'teitz',
-    'teixera',
-    'teixid&oacute',
-    'teja',
-    'tejapaibuls',
-    'tejas',
-    'tejera',
-    'tejo',
-    'tejole',
-    'tek-500',
-    'tek-sea',
-    'tekakwitha',
-    'tekbase',
-    'tekel',
     'tekelek',
-    'teken',
-    'tekeze',
-    'tekhnologia',
-    'tekinaiti',
-    'tekken',
-    'tekl&eacute',
-    'teknek',
-    'teknika',
-    'teknivent',
-    'tekno',
-    'teknoliji',
-    'teknologi',
-    'teknonymy',
-    'teknor',
-    'tektites',
     'tekua',
-    'tel&eacute;fono',
-    'tel-echo',
-    'tel-el-kebir',
-    'tel.031&ndash;650',
-    'tel.0420',
-    'tel.0442',
-    'tel.0784',
-    'tel.0932',
-    'tel.473631',
-    'tel.482681',
-    'tel.504186',
-    'tel.565418',
-    'tel.770439',
-    'tel.86341',
-    'tel.billingham',
     'tel.leader',
-    'tel.leven',
-    'tel.mavis',
-    'tel.mbro',
-    'tel.pat',
-    'tel/fax',
-    'tel:000',
-    'tel:024024',
-    'tel:031-2252595',
-    'tel:041-946',
-    'tel:071',
-    'tel:0932',
-    'telagu',
-    'telal',
-    'telam',
-    'telangiectasis',
     'telangiectatic',
-    'telarana',
-    'telcombe',
-    'telcomm',
-    'telcommunications',
-    'telcoms',
-    'teldeniya',
-    'tele&rehy;graphic',
-    'tele&rehy;vised',
-    'tele-',
-    'tele-action',
-    'tele-ad',
-    'tele-celebrities',
-    'tele-coaching',
-    'tele-commuting',
-    'tele-con',
     'tele-conferencing',
-    'tele-generated',
-    'tele-images',
-    'tele-kinetic',
-    'tele-marketing',
-    'tele-nova',
-    'tele-shopping',
-    'tele-smell',
-    'tele-style',
-    'tele-terminal',
-    'tele-trade',
-    'tele-visionaries',
-    'teleada-exec',
-    'teleb',
-    'telebanco',
-    'telebanking',
     'teleborgs',
-    'telecarte',
-    'telecaster-knob',
-    'telecaster-type',
-    'telecastering',
-    'telecasting',
-    'telecheric',
-    'telecinco',
-    'teleclaims',
-    'telecom-bundespost',
-    'telecom-deutsche',
-    'telecom-equipment',
-    'telecom/birmingham',
-    'telecomasia',
-    'telecomm',
-    'telecommuncation',
     'telecommunica-tions',
-    'telecommunicaciones',
-    'telecommunication-based',
-    'telecommunication/information',
-    'telecommunications**',
-    'telecommunications--widely',
-    'telecommunications-based',
-    'telecommunications-related',
-    'telecommute',
-    'telecoms-hardware',
-    'telecoms-supplier',
-    'telecomsoft',
-    'telecomunicacion',
-    'telecomunications',
-    'teledata',
-    'telediffusion',
     'telefactor',
-    'teleflex',
-    'telefoto',
-    'telefotos',
-    'telefusion',
-    'telega',
-    'telegram.',
-    'telegrams/telexes/faxes/express',
-    'telegramtne',
-    'telegraph-boy',
-    'telegraph-ese',
-    'telegraph-operator',
-    'telegraph-pole',
-    'telegraph-wires',
-    'telegraph-workers',
-    'telegraph/micropal',
     'telegraph/sugar',
-    'telegraph/times/',
-    'telegrapher',
-    'telegraphers',
-    'telegraphique',
-    'telegraphist/air',
-    'telegraphists',
-    'telegraphone',
-    'telekineticist',
-    'telekis',
-    'telekomindo',
-    'telekomunickacja',
-    'telekomunikasyon',
-    'telekon',
-    'telel-kebir',
-    'telelink',
     'telelogic',
-    'telemachos',
-    'telemags',
-    'telemanagement',
-    'telemarketers',
-    'telematic',
-    'telemax',
-    'telemedia',
-    'telemensaje',
-    'telemessage',
-    'telemetered',
-    'telemeters',
-    'telemonitoring',
-    'telemonster',
-    'telemontecarlo',
-    'telemundi',
     'telencephalic',
-    'telenet',
-    'telengit',
-    'telenguty',
-    'teleocractic',
-    'teleonomic',
-    'teleoperator',
-    'teleostei',
-    'telepa',
-    'telepathetic',
-    'telepathica',
-    'telepathise',
-    'telepaths',
-    'telepen',
-    'telephone&rehy;heads',
-    'telephone\'-type',
     'telephone-answering',
-    'telephone-book',
-    'telephone-calls',
-    'telephone-directory',
-    'telephone-hole',
-    'telephone-holes',
-    'telephone-network',
-    'telephone-number',
-    'telephone-operator',
-    'telephone-owning',
-    'telephone-polled',
-    'telephone-selling',
-    'telephone-set',
-    'telephone-style',
-    'telephone-table',
-    'telephone-to-computer',
     'telephone-wire',
-    'telephone.9',
-    'telephone:031',
-    'telephonics',
-    'telephoning-answering',
-    'telephonique',
-    'telephonist-receptionists',
-    'telephonist/receptionist',
-    'telephotogenic',
-    'telephotos',
-    'telephus',
-    'telepods',
-    'teleporting',
-    'teleprint',
-    'teleprinted',
-    'teleprompt',
     'teleragh',
-    'telerate',
-    'telerecorded',
-    'telerevista',
-    'teleri',
-    'telesale',
-    'telescabbing',
-    'telescope-',
-    'telescopic-action',
-    'telescopic-lens',
-    'telesec',
-    'telesia',
-    'telespazio',
-    'telespectroradiometer',
-    'telesystemes',
-    'teletec',
     'teletex',
-    'teletexes',
-    'teletherapy',
-    'telethon\'90',
-    'telethons',
-    'teletots',
-    'teletra',
-    'teletrade',
-    'teletrainer',
-    'teletrak',
-    'teletransmission',
-    'teletype-style',
-    'teleuts.',
-    'televeision',
-    'televiews',
-    'televion',
     'televisao',
-    'televises',
-    'television&mdash',
-    'television-based',
-    'television-documentary',
-    'television-friendly',
-    'television-quality',
-    'television-station',
-    'television-trained',
-    'televisor',
-    'televisuals',
-    'teleworked',
-    'teleworker',
-    'teleworld',
-    'telex/fax',
-    'telex/telegram/cable',
     'telex:97391',
-    'telezign',
-    'telfax',
-    'telfener',
-    'telfers',
-    'telford-designed',
-    'telford-shrewsbury',
-    'telford-xxxx',
-    'telgte',
-    'telha',
-    'telicherry',
-    'telidon-based',
-    'telimena',
-    'telkom',
-    'tell&mdash',
-    'tell&mdash;not',
     'tell-it-all',
-    'tell-nothing',
-    'tell-nothing-but-know-everything',
-    'tell-table',
-    'tell-tale-tit',
-    'tell-why',
-    'tellability',
-    'tellabs',
-    'tellaforeign',
-    'tellastory',
-    'tellectual-philosophic',
-    'tellees',
-    'tellehallez',
-    'teller-ulam',
-    'tellerault',
-    'tellest',
     'tellier',
-    'telligan',
-    'tellin&ndash',
-    'tellinella',
-    'telling-all',
-    'telling-them-to-go',
-    'tellingly-named',
-    'tellings',
-    'tellins',
-    'tellisperos',
-    'telljohann',
-    'tells.',
-    'tellson',
-    'tellurides',
-    'tellus',
-    'telly-ads',
     'telly-don',
-    'telly-impressions',
-    'telly-owning',
-    'telly-presenters',
-    'telly-probe',
-    'telly-tale',
-    'tellya',
-    'tellys',
-    'telmar',
-    'telmo',
-    'telmont',
-    'telnet-derived',
-    'telo',
-    'telogenetic',
-    'telomere-like',
-    'telone',
     'telos',
-    'telramund',
-    'telskyn',
-    'teltext',
-    'teltscher',
-    'telvision',
-    'telxon',
-    'telynegion',
-    'telys',
-    'telz',
-    'temafloxacin',
-    'temair',
-    'temanite',
-    'temazepan',
-    'tembe',
-    'tembeling',
     'tembladera',
-    'temburong',
-    'tembus',
-    'temby',
-    'temco',
-    'teme-augama',
-    'temecula',
-    'temed',
-    'temel',
-    'temelkov',
-    'temephos',
-    'temerary',
-    'temessy',
-    'temesvar',
-    'temete',
-    'temezepan',
     'temia',
-    'temic',
-    'temin',
-    'temirkanov',
-    'temiyaveh',
-    'temloc',
-    'temminckii',
-    'temminicki',
-    'temnota',
-    'temnye',
-    'temocillin',
-    'temp\'rate',
-    'temp\'ry',
-    'temp/acting',
-    'temp=d',
-    'tempel',
     'temper&mdash;he',
-    'temper-\'women',
-    'temper-mental',
-    'temper-tantrum',
-    'tempera-on-panel',
-    'tempera-on-wood',
-    'temperal',
-    'temperaments.',
-    'temperance-ites',
-    'temperance-style',
-    'temperary',
-    'temperas',
-    'temperate-climate',
-    'temperate-oriented',
-    'temperate-zone',
-    'temperateness',
     'temperato',
-    'temperatues',
-    'temperature-a',
-    'temperature-and-time-dependent',
-    'temperature-composition',
-    'temperature-control',
-    'temperature-increasing',
-    'temperature-induced',
-    'temperature-produced',
-    'temperature-tolerant',
-    'temperature-treated',
-    'temperature/',
-    'temperature/depth',
-    'temperature/high',
-    'temperature/mean',
-    'temperature/oven',
     'temperature/pressure',
-    'temperature/time',
-    'temperature/ventilation',
-    'temperature:74&deg&ndash;78&deg;f',
-    'temperer',
-    'tempero-mandibular',
-    'temperton',
-    'tempest-mitchell',
-    'tempest/seaham',
-    'tempestina',
-    'tempestites',
-    'tempestoso',
-    'tempestuousness',
-    'tempier',
-    'tempio',
-    'tempisque',
     'templar-style',
-    'template-independent',
-    'templating',
-    'temple(hartlepool)',
-    'temple(s)',
-    'temple-',
-    'temple-centre',
-    'temple-centres',
-    'temple-complexes',
-    'temple-cox',
-    'temple-form',
-    'temple-gables',
-    'temple-haunting',
-    'temple-nugent-brydges-chandos-grenville',
-    'temple-precincts',
-    'temple-sculpture',
     'temple-servants',
-    'temple-smith',
-    'temple-state',
-    'temple-sur-lot',
-    'temple-tower',
-    'templecorran',
-    'templefields',
-    'templegate',
-    'templehill',
-    'templemeads',
-    'templepa',
-    'templestate',
-    'templetown',
-    'templett',
-    'templeville',
-    'templi',
     'templorum',
-    'templum',
-    'tempor',
-    'temporaily',
-    'temporar',
-    'temporarily-closed',
-    'temporario',
-    'temporary-looking',
-    'temporary-memory',
-    'temporary-walled',
-    'temporary/fixed',
-    'temporise',
-    'temporisers',
-    'temporize',
-    'temporrary',
-    'tempory',
     'tempramental',
-    'temprary',
-    'tempras',
-    'tempry',
-    'temps.',
-    'temptation-scene',
-    'tempting-looking',
-    'temption',
-    'tempyo',
-    'temselves',
-    'temtories',
-    'temuco',
-    'temuka',
-    'ten&rehy;hour',
-    'ten&rehy;minute',
-    'ten&rehy;month-son',
     'ten&rehy;nent',
-    'ten&rehy;year-old',
-    'ten-14',
-    'ten-album',
-    'ten-bay',
-    'ten-bayed',
-    'ten-bedroom',
-    'ten-bedroomed',
-    'ten-bout',
-    'ten-by-eight',
-    'ten-by-four-inch',
-    'ten-cd',
-    'ten-cent',
-    'ten-centimetre',
-    'ten-client',
-    'ten-column',
     'ten-count',
-    'ten-degree',
-    'ten-denier',
-    'ten-digit',
-    'ten-dimensional',
-    'ten-disc',
-    'ten-drachma',
-    'ten-dwelling',
-    'ten-ell-oos',
-    'ten-em-bee',
-    'ten-feet-deep',
-    'ten-feet-high',
-    'ten-fifty',
-    'ten-film',
-    'ten-foot-thick',
-    'ten-foots',
     'ten-four',
-    'ten-franc',
-    'ten-furlong',
-    'ten-gauge',
-    'ten-guinea',
-    'ten-handicapper',
-    'ten-horned',
-    'ten-hundredweight',
-    'ten-inch-wide',
-    'ten-key',
-    'ten-kilometre',
-    'ten-kilometre-wide',
-    'ten-legged',
-    'ten-lesson',
-    'ten-mark',
-    'ten-member',
     'ten-men',
-    'ten-metre-square',
-    'ten-million-ton',
-    'ten-millionths',
-    'ten-nil',
-    'ten-nine-eight&mdash',
-    'ten-node',
-    'ten-o\'clock',
-    'ten-page',
-    'ten-past',
-    'ten-past-six',
-    'ten-pences.',
-    'ten-person',
-    'ten-piece',
-    'ten-pint',
-    'ten-pitch',
     'ten-plus-four',
-    'ten-rouble',
-    'ten-rounder',
-    'ten-section',
-    'ten-seven',
-    'ten-sided',
-    'ten-sixtieths',
-    'ten-spot',
-    'ten-step',
-    'ten-stone',
-    'ten-subject',
-    'ten-thirty-ish',
-    'ten-thousand&rehy;franc',
-    'ten-thousand-dollar',
-    'ten-thousand-mile',
-    'ten-thumbed',
     'ten-times-larger',
-    'ten-to',
-    'ten-to-the-eightieth',
-    'ten-track',
-    'ten-trial',
-    'ten-warhead',
-    'ten-wicket',
-    'ten-year-old-son',
-    'ten-year-older',
-    'ten-years-old',
-    'ten-years-on',
-    'ten-years-straight',
-    'ten.co',
-    'ten/fifteen/twenty',
-    'tena',
-    'tena&rehy;ciously',
     'tenably',
-    'tenacities',
-    'tenaga',
-    'tenancies&mdash;traps',
-    'tenancies-in-chief',
-    'tenancy/rental',
-    'tenant&mdash',
-    'tenant\'',
-    'tenant-at-will',
-    'tenant-farmers',
-    'tenant-led',
-    'tenant-management',
-    'tenant-occupied',
-    'tenantable',
-    'tenantes',
-    'tenantlike',
     'tenants-in-common',
-    'tenants-inchief',
-    'tenants.',
-    'tenants/potential',
-    'tenario',
-    'tenative',
-    'tenaunt',
-    'tenbry',
-    'tencel/rayon',
-    'tend/upon',
-    'tendancy',
-    'tenday',
-    'tende',
-    'tendem',
-    'tendencia',
-    'tendending',
     'tendentially',
-    'tendentious&mdash;the',
-    'tender\'st',
-    'tender-',
-    'tender-clumsy',
-    'tender-headed',
-    'tender-heartedness',
-    'tender-hooks',
-    'tender-minded',
-    'tenderhooks',
-    'tenderiser',
-    'tenderises',
-    'tenderize',
-    'tenderizing',
-    'tenderlean',
-    'tenderly.',
     'tendeth',
-    'tendillas',
-    'tendineae',
-    'tending-to-fat',
-    'tendon-like',
-    'tendrement',
-    'tendril-haired',
-    'tendril-like',
-    'tendrillar',
-    'tendrils.',
-    'tendring-based',
-    'tendto',
-    'tendue',
-    'tenea',
-    'teneatis',
-    'tenebres',
     'tenebrio',
-    'tenebrionis',
-    'tenebrosissimus',
-    'tenedo',
-    'tenedos',
-    'tenella',
-    'tenement-lined',
-    'tenency',
-    'tenenda',
-    'tenendi',
-    'tenente',
-    'tenentium',
-    'tenera',
-    'tenerby',
-    'teneric',
-    'tenerife-',
     'tenerife-born',
-    'tenetts',
-    'tenev',
-    'tenezrouft',
-    'teng-fa',
-    'tengen',
-    'tengo',
-    'tengu',
-    'tenguiz',
-    'tenia',
-    'teniae',
-    'teniente',
-    'tenieu',
-    'tenir',
-    'tenish',
-    'tenminute',
     'tennal',
-    'tenneco',
-    'tennenhof',
-    'tennesseans',
-    'tennessee-',
-    'tennessee-arkansas-mississippi',
-    'tennessee-based',
-    'tennet',
-    'tenneyex',
-    'tenniels',
-    'tennil&auml',
-    'tennis-ball-sized',
-    'tennis-club',
-    'tennis-courts',
-    'tennis-players',
-    'tennis-racket',
     'tennis-related',
-    'tennis-shoe',
-    'tennis.',
-    'tennis/bowls',
-    'tennisquick',
-    'tenno',
-    'tennysonian',
-    'teno',
-    'tenochtitlan',
-    'tenoner',
-    'tenor-bass',
-    'tenor-players',
-    'tenorio',
-    'tenorist',
-    'tenorseductor',
-    'tenos',
     'tenotomy',
-    'tenous',
-    'tenpences',
-    'tenpins',
-    'tenpole',
-    'tenrec',
-    'tenriss',
-    'tense-mother/crying-baby',
-    'tense/relaxed',
-    'tenseless',
-    'tensely-held',
-    'tensility',
-    'tensilon',
-    'tensing-up',
-    'tension-fatigue',
-    'tension-filled',
     'tension-free',
-    'tension-leg',
-    'tension-reducing',
-    'tension-release',
-    'tension-releasing',
-    'tension-relieving',
-    'tension-ridden',
-    'tension-soothing',
-    'tension-to-pitch',
-    'tension-wise',
-    'tension.',
-    'tension/personal',
-    'tension/release',
-    'tension/resolution',
-    'tension/structure',
-    'tensionless',
     'tensionmeter',
-    'tensions.',
-    'tenskwatawa',
-    'tensomethings',
-    'tent-covering',
-    'tent-dwelling',
-    'tent-hall',
-    'tent-hangings',
-    'tent-hold',
-    'tent-husband',
-    'tent-pegs',
-    'tent-shrines',
-    'tent-wall',
-    'tentacle-arms',
-    'tentacle-bearing',
-    'tentaculitids',
     'tentativity',
-    'tenterborn',
-    'tentered',
-    'tentergrounds',
-    'tenterhooked',
-    'tentering',
-    'tenth-anniversary',
-    'tenth-fastest',
-    'tenth-point',
-    'tenth-ranked',
-    'tenth-rate',
-    'tenth-round',
-    'tenth-strongest',
-    'tenth-wicket',
-    'tenthe',
-    'tenthly',
     'tenths.',
-    'tento',
-    'tentoni',
-    'tentrek',
-    'tents-under-thatch',
-    'tenue',
-    'tenues',
-    'tenuistrosis',
-    'tenuit',
-    'tenukku',
-    'tenuousness',
-    'tenure-track',
-    'tenuta',
-    'tenuto',
-    'teny-dhurgon',
-    'teny-durgon',
     'tenyear-old',
-    'tenyears',
-    'teoboldo',
-    'teodori',
-    'teodoriu',
-    'teofilio',
-    'teofisto',
-    'teol&oacute;gica',
-    'teolinde',
-    'teor&iacute;a',
-    'teordescu',
-    'teori',
-    'teorico',
-    'teos',
-    'teotihuac&aacute;n',
-    'teotihuaca/n',
     'tep',
-    'tepel',
-    'teper',
-    'tephillim',
-    'tepikin',
-    'teplenichev',
-    'tepnel',
-    'teppanyaki',
-    'teppennyse',
-    'tepual',
-    'tepuhi\'',
-    'teques',
-    'tequila-flavoured',
-    'tequilana',
-    'ter-bin-a-fiene',
-    'ter-centenary',
     'ter-petrossyan',
-    'ter-race',
-    'ter-terrib-b-ter-not',
-    'tera',
-    'terace',
-    'teracette',
-    'teracolus',
-    'teradam',
-    'teradata.',
-    'teraflop',
-    'teraflopper',
-    'terafloppers',
-    'teraflops-boasting',
-    'teraflops-peak',
-    'teraflops-performance',
-    'terano',
     'teraoka',
-    'teraskirts',
-    'terassa',
-    'terasse',
-    'teratogen',
-    'teratogenesis',
-    'teratogenicity',
-    'teratosaur',
-    'terawatt',
-    'terawatt-hours',
-    'terbeek',
-    'terblanche',
-    'terborch',
-    'terboven',
-    'terbutryne',
-    'tercer',
     'tercera',
-    'tercet',
-    'tercia',
-    'terebratulids',
-    'teredo-proof',
-    'terekh',
-    'terekhov',
-    'terelj',
-    'teremengal',
-    'teren',
-    'terenc',
-    'terengganu-based',
-    'terentius',
-    'teresas',
-    'tereshkova',
-    'teresian',
     'tereskinas',
-    'terespol',
-    'terex',
-    'terezin',
-    'terfynan',
-    'tergether',
-    'tergiversation',
-    'tergoflex&rehy;light',
-    'tergopleurals',
-    'terid',
-    'teriers',
-    'terima',
-    'teristic',
-    'terjheyden',
-    'terker',
-    'terlingen',
     'terlipressin',
-    'term&amp;sub1',
-    'term&amp;sub2',
-    'term&mdash;a',
-    'term-a',
-    'term-borrowings',
-    'term-by-term',
-    'term-length',
-    'term-limits',
-    'term-long',
-    'term-trend',
-    'term-work',
-    'term/',
-    'term/fixed',
-    'term/patent\'',
-    'term/permanent',
     'term/year',
-    'termansen',
-    'termas',
-    'termaters',
-    'termes',
-    'termez',
-    'terminal-cancer',
-    'terminal-flare',
-    'terminal-strewn',
-    'terminal/binding',
-    'terminal/comms',
-    'terminal/minicomputer-based',
-    'terminals.',
-    'terminari',
-    'terminate-and-stay',
-    'terminate-and-stay-resident',
     'terminate-stay-resident',
-    'terminated.',
-    'terminates.',
-    'termination.',
-    'terminator=0',
-    'termine',
-    'terminiello',
-    'terminologically',
-    'terminologie',
-    'termintade',
-    'terminuses',
-    'terminux',
-    'termitarium',
-    'termite-mound',
-    'termite-ravaged',
-    'termitic',
     'termitologists',
-    'termoli',
-    'terms&mdash',
-    'terms&mdash;drafting',
-    'terms&mdash;price',
-    'terms-',
-    'terms-it',
-    'terms-pensions',
-    'terms/jargon',
-    'terms_as',
-    'terna',
-    'ternant',
-    'ternes',
-    'ternetzi',
-    'terney',
-    'ternight.',
     'ternopol',
-    'teromolpos',
-    'terontola',
-    'terpe',
-    'terpene',
-    'terpenoid',
-    'terpenoidal',
-    'terpenoids',
-    'terpsichore',
-    'terr-eeble',
-    'terr-ibly',
-    'terr-rific',
-    'terra-cotta',
-    'terra-cottas',
-    'terracciano',
-    'terrace&mdash',
     'terrace-anthem',
-    'terrace-back',
-    'terrace-backs',
-    'terrace-house',
-    'terrace-houses',
-    'terrace-plateau',
-    'terrace-player',
-    'terrace-type',
-    'terrace-walk',
-    'terrace-way',
-    'terrace/balconies-cum-decks',
-    'terrace/holmbyre',
-    'terracers',
-    'terraces.',
-    'terrachino',
-    'terracina',
     'terracotta-',
-    'terracotta-coloured',
-    'terracotta-finish',
-    'terracotta-style',
-    'terracottaheads',
-    'terractotta',
-    'terradawn.and',
-    'terrafirme',
-    'terraform',
-    'terraforming',
-    'terrail',
-    'terrain.',
-    'terramares',
-    'terrane-but',
-    'terraplane',
-    'terrariums',
     'terrassa-based',
-    'terrasses',
-    'terratorial',
-    'terratorially',
-    'terrawatt',
-    'terrazas',
-    'terrazza',
-    'terrebanche',
-    'terreorist',
-    'terrestrial.john',
-    'terrets',
-    'terreus',
-    'terri&rehy;tory',
-    'terribilis',
-    'terribilitas',
-    'terribl&gt',
     'terrible-tempered',
-    'terribleness',
-    'terriblis',
-    'terrier-cross',
-    'terrif',
-    'terrif-hick',
-    'terrific-looking',
-    'terrifick',
-    'terrifie',
-    'terrified-looking',
-    'terrist',
-    'territorial/role',
-    'territoriale',
-    'territorialization',
-    'territorially-based',
-    'territorio',
     'territorium',
-    'territory-defending',
-    'territory-holders',
-    'territory-level',
-    'territory-owners',
-    'terrm',
-    'terrns',
-    'terror\'',
-    'terror-attacks',
-    'terror-driven',
-    'terror-free',
-    'terror-inducing',
-    'terror-ridden',
-    'terror-sport',
-    'terror-symbols',
-    'terror-tactics',
     'terror.',
-    'terrordome',
-    'terrorgation',
-    'terroribus',
-    'terrorisation',
-    'terrorism\'',
-    'terrorism-related',
-    'terrorist-cover',
-    'terrorist-held',
-    'terrorist-inspired',
-    'terrorist-training',
-    'terrorities',
-    'terroritory',
-    'terrortories',
-    'terrorvision',
-    'terrour',
     'terrs',
-    'terrt',
-    'terrust',
-    'terry-alike',
-    'terry-sounding',
-    'terrye',
-    'terryhoogan',
-    'terryll',
-    'terrys',
-    'ters',
-    'tersane',
-    'terschelling',
-    'tersteegen',
-    'tert-',
-    'tertiary-butyl',
-    'tertiary.',
     'tertiary/section',
-    'tertiaty',
-    'tertio',
-    'terts',
-    'tertull',
-    'teruhide',
-    'teruhiko',
-    'terutau',
-    'tervet',
-    'terwijden',
-    'terwilliger',
-    'terzetti',
-    'terzi',
-    'terzio',
-    'terzo',
-    'tes-ti-i-i-fyy',
     'tescari',
-    'tesco-sponsored',
-    'tesfai',
-    'teshufin',
-    'tesi',
-    'teslaco',
-    'tesorababi',
-    'tessaiohanues',
-    'tessana',
-    'tessellating',
-    'tessellations',
-    'tessellatum',
-    'tessera',
-    'tessera-like',
-    'tesseyman',
-    'tesside',
     'tessier',
-    'tessili',
-    'tessla',
-    'tessonii',
-    'test&rehy;match',
-    'test(s)',
-    'test-',
-    'test-and-measurement',
-    'test-bench',
-    'test-bores',
-    'test-cases',
-    'test-cell',
-    'test-copying',
-    'test-erected',
-    'test-flew',
-    'test-flights',
     'test-fly',
-    'test-flying',
-    'test-intestinal',
-    'test-led',
-    'test-marketing',
-    'test-marking',
-    'test-piloting',
-    'test-pressing',
-    'test-pressings',
-    'test-reactor',
-    'test-related',
-    'test-rigs',
-    'test-run',
-    'test-sailed',
-    'test-sessions',
-    'test-strength',
     'test-track',
-    'test-type',
-    'test-walked',
-    'test-wicket',
-    'test/alert',
-    'test/modify',
-    'test/revision',
-    'test30root0',
-    'test30root1',
-    'test=6.7',
-    'testacea',
-    'testament-based',
-    'testar',
-    'testarossas',
-    'testate',
-    'testatoris',
     'testatum',
-    'testaverde',
-    'testbeds',
-    'testbit/decode',
-    'testbooks',
-    'testd',
-    'testdrill',
-    'testdrive',
-    'tested&ndash',
-    'tested.',
-    'tested.research',
-    'tester-bottle-wielders',
-    'tester-testee',
-    'tester-top',
-    'tester/giesen',
-    'testerto',
     'testgene',
-    'testi',
-    'testically',
-    'testicle(s)',
-    'testicle-grabbing',
-    'testicularly',
-    'testier',
-    'testif',
-    'testifie',
-    'testifies.',
-    'testify-she',
-    'testimonio',
-    'testimony.',
-    'testing-out',
-    'testing-zones',
-    'testingly',
     'testingness',
-    'testioni',
-    'testmant',
-    'testo',
-    'testof',
-    'testori',
-    'tests&mdash',
-    'tests*',
-    'tests.this',
-    'testscores',
-    'testslaves',
-    'testudo',
-    'testwood',
-    'testwork',
-    'tet&rehy;ley',
-    'tet-',
     'tetaeka',
-    'tetanically',
-    'tetanically-induced',
-    'tetanization',
-    'tetanized',
-    'tetebury',
-    'teten',
-    'tetenhaul',
-    'tetewsky',
-    'teth',
-    'tether-grazed',
-    'tetherball',
-    'tethering-rope',
-    'tethn&eacute;k&eacute;.',
-    'tethys/mediterranean',
-    'tetiaroa',
     'tetin',
-    'tetnall',
-    'tetnanger',
-    'tetra-',
-    'tetra-hydro.',
-    'tetra-pak',
-    'tetra-radial',
-    'tetra-structure',
-    'tetrabiblos',
-    'tetraborate',
-    'tetrabromoethane',
-    'tetrachlorethylene',
-    'tetrachloroethane',
-    'tetrachloroethylene',
-    'tetrachordon',
-    'tetracubes',
     'tetracyanoquinodimethane',
-    'tetracys',
-    'tetrada&sacute;i',
-    'tetradecanoylphorbol',
-    'tetraether',
-    'tetraethyl',
-    'tetragastris',
-    'tetragnathinae',
-    'tetragona',
-    'tetragonorobus',
-    'tetragonotheca',
-    'tetragrams',
-    'tetrahedra',
-    'tetrahedrals',
-    'tetrahedrane',
-    'tetrahedrons',
     'tetrahit',
-    'tetrahydrobiopterin',
-    'tetrahydrocannabinols',
-    'tetrahydrocannabivarin',
-    'tetrahydrochloride-hydrogen',
-    'tetrahydrodicyclopentadiene',
-    'tetrahydrothiophen',
-    'tetraktys',
-    'tetramers',
-    'tetrameters',
-    'tetramethyl',
-    'tetramethylindocarbocyanine',
-    'tetramethylrhodamine',
-    'tetramethyltetraselenafulvalene',
-    'tetramisole',
-    'tetrammine',
     'tetranalysis',
-    'tetranychus',
-    'tetrao',
-    'tetraonidae',
-    'tetraonidae.',
-    'tetraphylla',
-    'tetrapod',
-    'tetrapus',
-    'tetrapylon',
-    'tetrarchies',
-    'tetrarose',
-    'tetrastes',
-    'tetrastigma',
-    'tetrazzin',
-    'tetris/columns',
-    'tetris/klax',
     'tetrix',
-    'tetro',
-    'tetrosyl',
-    'tetsuichi',
-    'tetsuro',
-    'tetsuyu',
-    'tett',
-    'tetter',
-    'tettering',
-    'tettigonia',
-    'tettigoniidae',
-    'tettnang',
-    'teu-hu-hu',
-    'teucer',
-    'teuchat',
-    'teuchtars',
     'teudt',
-    'teufen',
-    'teuk-teuk-teuk',
-    'teukolsky',
-    'teuku',
-    'teulade',
-    'teus',
-    'teutch',
-    'teutches',
-    'teuten',
-    'teuter',
-    'teuter-press',
-    'teuthis',
-    'teutloff',
-    'teutoa',
-    'teutoburger',
     'teutoburgian',
-    'teutonis',
-    'teutsches',
-    'teuvo',
-    'tevan',
-    'tevar',
-    'teversal',
-    'tevfik',
-    'teviothead',
-    'teviso',
-    'tevita',
-    'tevoedjre',
-    'tew/oxfordshire',
-    'tewareka',
-    'tewdwr',
-    'teweles',
     'tewell',
-    'tewfiq',
-    'tewibly',
-    'tewid',
-    'tewit',
-    'tewitt',
-    'tewl',
-    'tewolde',
-    'tews',
-    'tewsdee',
-    'tewts',
-    'texa',
-    'texana',
-    'texapore',
-    'texaport',
-    'texarcana',
     'texarkana',
-    'texas-1',
-    'texas-born',
-    'texas-el',
-    'texas-fashion',
-    'texas-size',
-    'texas-style',
-    'texas-to-montana',
-    'texas.the',
-    'texas/cajun',
-    'texas/sun',
-    'texeira',
-    'texel-ijsselmeer',
-    'texelaar',
-    'texensis',
-    'texere',
     'texline',
-    'texon',
-    'texscan',
-    'texsel',
-    'text&copy',
-    'text&lsqb;5&rsqb',
-    'text&rehy;based',
-    'text\'',
-    'text-adventure',
-    'text-analysis',
-    'text-and-data',
-    'text-archives',
-    'text-attachment',
-    'text-attatchment',
-    'text-base',
-    'text-by-text',
     'text-centred',
-    'text-copying',
-    'text-databases',
-    'text-driven',
-    'text-files',
-    'text-handling',
-    'text-hung',
-    'text-illustrative',
-    'text-immanent',
-    'text-intensive',
-    'text-linguistics',
-    'text-maker',
-    'text-methods',
-    'text-on-the-wall-as-art',
-    'text-processors',
-    'text-producers',
     'text-reader',
-    'text-receivers',
-    'text-related',
-    'text-searching',
-    'text-sentence',
-    'text-to-hypertext',
-    'text-world',
-    'text-worlds',
-    'text-writers',
-    'text/graphical',
-    'text/nothing',
-    'text/source',
-    'texta/textb',
-    'textbook\'',
-    'textbook-learnt',
-    'textbook-type',
     'textbookers',
-    'textbookish',
-    'textface',
-    'textil',
-    'textile&rehy;dominated',
-    'textile-artisan',
-    'textile-based',
-    'textile-exporting',
-    'textile-machinery',
-    'textile-making',
-    'textile-manufacturing',
-    'textile-operatives',
-    'textile-oriented',
-    'textile-processing',
-    'textile-related',
-    'textile-to-foods',
     'textile-trade',
-    'textile-warehouse',
-    'textile-worker',
-    'textile/fashion',
-    'textiles/clothing/footwear',
-    'textiles/women/femininity',
-    'textj',
-    'textlinguistics',
-    'textoverdorum',
-    'textpac',
-    'textpert',
-    'textratex',
-    'textronic',
-    'textronix',
-    'texts.',
-    'texts/textuality',
     'texts_as',
-    'textual&mdash;linguistic',
-    'textual-sexual',
-    'textualisation',
-    'textualism',
-    'textualist',
-    'textualists',
-    'textualized',
-    'textually-oriented',
-    'texture.',
-    'texturizers',
-    'texturizing',
-    'texturous',
-    'textxx',
-    'teye',
-    'teyfant',
     'teynard',
-    'teyrnon',
-    'teyu',
-    'tez',
-    'teza',
-    'tezcatlipoca',
-    'teziyev',
-    'tezkare',
-    'tezpur',
-    'tf-104g',
-    'tf-taffeta',
-    'tf-thermoflect',
-    'tf.1',
-    'tfe-731-3',
-    'tfe3',
-    'tffs',
     'tfi-180i',
-    'tfi-230i',
-    'tfiia-containing',
-    'tfiie',
-    'tfiiib-tbp-tfiiic-dna-complex',
-    'tfn',
-    'tfn-&agr',
-    'tfpart',
-    'tfpl',
-    'tfps',
-    'tfsgen',
-    'tfsr',
-    'tfto',
-    'tg-300',
-    'tga(n)',
-    'tga-3',
     'tgaaaagtcaacccttactcaac',
-    'tgate',
-    'tgc',
-    'tgcc',
-    'tgct',
-    'tgd',
-    'tgf-&bgr',
-    'tggatattagaaatttcc',
-    'tgggatac',
-    'tgm',
-    'tgs',
-    'tgtaatgacaaaggcagtga',
-    'tgtatgggctgtatttattac',
-    'tgwu-dominated',
-    'th&amacr;rp&amacr',
-    'th&eacute;lin',
     'th&eacute;obald',
-    'th&eacute;odule',
-    'th&eacute;ologien',
-    'th&eacute;orbe',
-    'th&eacute;orbes',
-    'th&eacute;ovard-sur-mer',
-    'th&eacute;rapeute',
-    'th&eacute;riault',
-    'th&eacute;roigne',
-    'th&eacute;ry',
-    'th&eacute;s&eacute;e',
-    'th&uuml;rmer',
-    'th\'abuse',
-    'th\'arcadian',
-    'th\'art',
-    'th\'back',
     'th\'be',
-    'th\'bed',
-    'th\'belly',
-    'th\'better',
-    'th\'brains',
-    'th\'breach',
-    'th\'bustles',
-    'th\'ca',
-    'th\'came',
-    'th\'champagne',
-    'th\'cmj',
-    'th\'daydreaming',
-    'th\'devil\'sh',
-    'th\'does',
-    'th\'doing',
-    'th\'dozy',
     'th\'drink',
-    'th\'expect',
-    'th\'exterior',
-    'th\'faith',
-    'th\'fancy',
-    'th\'feet',
-    'th\'fence',
-    'th\'flow',
-    'th\'funds',
-    'th\'gallivanting',
-    'th\'gates',
-    'th\'gave',
-    'th\'gets',
-    'th\'goes',
-    'th\'goodness',
-    'th\'got',
     'th\'guts',
-    'th\'habits',
-    'th\'half-witted',
-    'th\'hand',
-    'th\'has',
-    'th\'hate',
-    'th\'head',
-    'th\'heard',
-    'th\'hit',
-    'th\'inward',
-    'th\'iongo',
-    'th\'job',
-    'th\'learn',
-    'th\'leave',
-    'th\'level',
-    'th\'line',
     'th\'little',
-    'th\'lives',
-    'th\'loose',
-    'th\'managed',
-    'th\'manners',
-    'th\'master',
-    'th\'measure',
-    'th\'mind',
-    'th\'missus',
-    'th\'most',
-    'th\'muscles',
-    'th\'near',
-    'th\'need',
-    'th\'next',
-    'th\'old',
-    'th\'otchin',
     'th\'pleases',
-    'th\'pockets',
-    'th\'porridge',
-    'th\'resta',
-    'th\'ribs',
-    'th\'road',
-    'th\'scratty',
-    'th\'servants',
-    'th\'show',
-    'th\'sit',
-    'th\'size',
-    'th\'some',
-    'th\'spleen',
-    'th\'stays',
-    'th\'strength',
-    'th\'stripping',
     'th\'summat',
-    'th\'taking',
-    'th\'thinks',
-    'th\'ticket',
-    'th\'told',
-    'th\'trouble',
-    'th\'two',
-    'th\'two-faced',
-    'th\'understanding',
-    'th\'varmint',
-    'th\'wait',
-    'th\'walk',
-    'th\'wants',
-    'th\'was',
-    'th\'waterfront',
-    'th\'what',
     'th\'wo',
-    'th\'won',
-    'th-e-n',
-    'th-rich',
-    'th-self',
-    'th-th-th-',
-    'th-th-thank',
-    'th-th-there',
-    'th-thing',
-    'th-thinsulate',
-    'th-this',
-    'th-thought',
-    'th.',
-    'th/',
-    'th/pb',
-    'th1-',
     'th1-like',
-    'th2-stimulating',
-    'th4',
-    'th6',
-    'tha%',
-    'tha&iuml;s',
-    'tha&ndash',
-    'tha\'rt',
-    'tha\'sh',
-    'thaa',
-    'thaalik',
-    'thaba',
-    'thabet',
-    'thabong',
-    'thabyinnyu',
-    'thaccomplisshement',
     'thaccompt',
-    'thackaray',
-    'thackeray-like',
-    'thackeways',
-    'thad',
-    'thaden',
-    'thaelmann',
-    'thaerbe',
-    'thage',
-    'thai-based',
-    'thai-cambodia',
-    'thai-controlled',
-    'thai-japanese',
-    'thai-kampuchia',
-    'thai-language',
-    'thai-laotian',
     'thai-s',
-    'thai-style',
-    'thai-vietnam',
-    'thai/chinese',
-    'thai/indonesian',
-    'thaid',
-    'thaidid',
-    'thaididae',
-    'thaididae-a',
-    'thaidus',
-    'thailands',
-    'thain/shelter',
-    'thainstone',
-    'thairith',
-    'thairs',
-    'thakat',
     'thaker',
-    'thakerar',
-    'thakketh',
-    'thakorbhai',
-    'thakral',
-    'thakrar',
-    'thal-ik-troy-days',
-    'thala',
-    'thalamas',
-    'thalassa',
-    'thalassaemias',
-    'thalassarctos',
-    'thalassina',
-    'thalassokratia',
-    'thalassoma',
-    'thalatine',
     'thalben',
-    'thale',
-    'thalgo',
-    'thalgo-mince',
-    'thalli',
-    'thallium-208',
-    'thalweg',
-    'thambetolepis',
-    'thambipillai',
-    'thambiraja',
-    'thamby',
-    'thamen',
-    'thames-based',
-    'thames-blue',
-    'thames/bbc',
-    'thames127-1328.105.8',
     'thammasat',
-    'thammavong',
-    'thammavong*',
-    'thamnomys',
-    'thampson',
-    'than&mdash',
-    'than\'',
-    'than-working',
-    'than.a',
-    'than.your',
-    'than/less',
-    'than10000000',
-    'than12ins',
-    'than14',
-    'than30',
-    'than_a',
     'thanachanan',
-    'thanas',
-    'thanassis',
-    'thanatician',
-    'thanatological',
-    'thanavuth',
-    'thanb',
-    'thandigudi',
-    'thanehood',
-    'thang&rehy;orodrim',
-    'thanga',
-    'thange',
-    'thangue',
-    'thaniah',
-    'thank&rehy;you',
-    'thank\'ee',
     'thank-you.in',
-    'thankerton',
-    'thanki',
-    'thankingly',
-    'thanklessly',
-    'thanklessness',
-    'thankq',
-    'thanks_a',
-    'thanks_ever',
-    'thankyouthankyouthank',
-    'thankyouverymuchforallyouhavedonegoodbye',
-    'thann',
-    'thanomile',
-    'thanotopractical',
-    'thanquo',
-    'thany',
     'thap',
-    'thapsigargin-sensitive',
-    'tharakan',
-    'tharawaddy',
-    'thareed',
-    'tharg',
-    'tharin',
-    'thark',
-    'tharkas',
-    'tharpu',
-    'tharrawaddy',
-    'tharsuinn',
-    'tharunka',
-    'thasians',
-    'thassh',
-    'thassit',
     'thast',
-    'that&mdash;in',
-    'that&mdash;just',
-    'that&mdash;you',
-    'that&pound;s',
-    'that\'e',
-    'that\'s',
-    'that\'s-all',
-    'that\'s-right',
-    'that\'s_up_to',
-    'that\'socialism',
-    'that\'ss',
-    'that\'til',
-    'that-as',
-    'that-but',
-    'that-contrast',
     'that-fundamental',
-    'that-half',
-    'that-ism',
-    'that-joining',
-    'that-mania',
-    'that-many',
-    'that-parents',
-    'that-peter',
-    'that-place',
-    'that-they',
-    'that-time-only',
-    'that-which-dwells-in-darkness',
-    'that-will',
-    'that.as',
-    'that.no',
-    'that.the',
     'that.we',
-    'that.when',
-    'that/and',
-    'that/he',
-    'that/high',
-    'that/jobs',
-    'that/rob',
-    'that/u/',
-    'that:britain',
-    'that_',
-    'that_all',
-    'that_because',
-    'that_by',
-    'that_er_is',
-    'that_from_time',
-    'that_in_,_in',
     'that_off',
-    'that_on',
-    'that_out',
-    'that_together',
-    'thata',
-    'thatany',
-    'thataway',
-    'thataways',
-    'thatcfinds',
-    'thatch-stone',
-    'thatched-roof',
-    'thatcher-and-after',
-    'thatcher-bush',
-    'thatcher-devotees',
-    'thatcher-dominated',
-    'thatcher-era',
     'thatcher-major',
-    'thatcher.he',
-    'thatcher/major',
-    'thatcher/speaking',
-    'thatcherella',
-    'thatcheriana',
-    'thatcherii',
-    'thatcherite-style',
-    'thatcherlike',
-    'thatcheromics',
-    'thatherism',
-    'thatleukotriene',
-    'thatlong',
-    'thatmodernist',
-    'thatmrs',
-    'thatorn',
     'thatsh',
-    'thatsuch',
-    'thatth',
-    'thatthey',
-    'thatz',
-    'thaukt',
-    'thaumas',
-    'thaumasite',
-    'thaumatin',
-    'thaumatology',
-    'thaumatourgos',
-    'thaumaturgas',
-    'thaumaturgical',
-    'thaumaturgist',
-    'thaung',
-    'thaungyin',
     'thavich',
-    'thaw-mounted',
-    'thaw-water',
-    'thawakib',
-    'thawrah',
-    'thaxter',
-    'thaya',
-    'thayed',
-    'thayne',
-    'thayre',
-    'thcac',
-    'the&acirc;tre',
-    'the&eacute&acirc;tre',
-    'the&lsqb',
-    'the&lsqb;ir&rsqb',
-    'the&ndash;e',
     'the&ndash;index',
-    'the&ndash;parents',
-    'the&pound;30m',
-    'the&rehy;changeover',
-    'the(&pound;766,000)',
-    'the(epic)',
-    'the(real)',
-    'the-art',
-    'the-bank',
-    'the-boy-stood-on-the-burning-deck',
-    'the-building',
-    'the-cab',
-    'the-carving-of-mahogany-to-fit-the-cami-knickers',
-    'the-commission',
-    'the-cosmological',
-    'the-cows',
     'the-creed',
-    'the-crustaceans',
-    'the-data',
-    'the-day',
-    'the-door',
-    'the-e',
-    'the-e-e',
-    'the-economic',
-    'the-end-of-the-millennium',
-    'the-er',
-    'the-factor',
-    'the-farmer',
-    'the-fields',
-    'the-food',
-    'the-freeholds',
-    'the-from',
     'the-garden',
-    'the-glee',
-    'the-graveyard',
-    'the-headlands',
-    'the-hero-as-artist',
-    'the-horizon',
-    'the-horrors',
-    'the-house-in-the-valley-where-the-yew-trees-grow',
-    'the-knife',
-    'the-list',
-    'the-little',
-    'the-man-as-poet',
-    'the-man-who-is-the-poet',
-    'the-marsh',
-    'the-middle',
-    'the-most-important-film-star-of-the-nineties',
     'the-open',
-    'the-other',
-    'the-participants',
-    'the-place',
-    'the-presence',
-    'the-prisoner',
-    'the-rapist',
-    'the-risk',
-    'the-role',
-    'the-royal',
-    'the-savoy',
-    'the-slot',
-    'the-soughing',
-    'the-spiral',
-    'the-stripe-repeated',
-    'the-stumpy-tail',
     'the-table',
-    'the-the',
-    'the-they',
-    'the-time',
-    'the-timidity',
-    'the-total',
-    'the-troops',
-    'the-two',
-    'the-ukraine',
-    'the-wind',
-    'the-woman-in-the-street',
-    'the.anonymous',
-    'the.bay',
-    'the.building',
-    'the.financial',
-    'the.first',
     'the.full',
-    'the.little',
-    'the.monster',
-    'the.oil',
-    'the.once',
-    'the.ones',
-    'the.police',
-    'the.possible',
-    'the.process',
-    'the.usa',
-    'the.varieties',
-    'the/for',
-    'the08.30',
-    'the140k',
-    'the1561',
-    'the1880s',
     'the9',
-    'the_,_part_of',
-    'the_ad',
-    'the_at',
-    'the_in',
-    'the_light_of',
-    'the_ma&icirc;tre',
-    'the_part_of',
-    'the_status',
-    'thea-josephine',
-    'theaa',
-    'theaceae',
-    'theadom',
-    'theagenes',
-    'theaker',
-    'theakstone',
     'theakstons-on-tyne',
-    'theangela',
-    'thear',
-    'thearabout',
-    'theatened',
-    'theatens',
-    'theater-bred',
-    'theater-de-lys',
-    'theater-erneuerungen',
-    'theater-journal',
-    'theatine',
-    'theatiron',
-    'theatre\'',
-    'theatre-/supper-goers',
-    'theatre-and-music',
-    'theatre-based',
     'theatre-bell',
-    'theatre-capital',
-    'theatre-curtain',
-    'theatre-dance',
-    'theatre-dundee',
-    'theatre-group',
-    'theatre-like',
-    'theatre-loving',
-    'theatre-making',
-    'theatre-of-the-air',
-    'theatre-productions',
-    'theatre-tickets',
-    'theatre-training',
-    'theatre-trolley',
-    'theatre-type',
-    'theatre/film',
     'theatre/football/movie',
-    'theatrecard/friends',
-    'theatrepack',
-    'theatrevision',
-    'theatrical-machiavellian',
-    'theatrical_tour',
-    'theatricalisation',
-    'theatricalities',
-    'theatricalizes',
-    'theatrically-minded',
-    'theatrograph',
-    'theatrophone',
-    'theatum',
-    'theaudience',
-    'theb',
-    'theberton',
     'thebes-haters',
-    'theca',
-    'thecae',
-    'thecodonians',
-    'thecodont',
-    'thed',
-    'thede',
-    'thedifferences',
-    'thedispossessed(1974)',
-    'thedric',
-    'thee\'',
-    'thee-ay-tah',
-    'thee-day',
-    'thee.',
-    'theear',
-    'theeeerm',
     'theenks',
-    'theere',
-    'theeves',
-    'theevish',
-    'thefbian',
-    'thefirst-ever',
-    'thefish',
-    'theforos',
-    'theft\'',
-    'theft-murders',
-    'theft-resistant',
-    'theft/loss',
-    'thefto',
-    'thegenius',
-    'thegither',
-    'thegnaby',
     'thegovernment',
-    'theh',
-    'thehealthy',
-    'thehere',
-    'thei',
-    'theide',
-    'theile',
-    'theiler',
-    'theileria',
-    'theileriosis',
-    'theilheimer',
-    'theim',
-    'theims',
-    'theincidence',
-    'theinistokles',
-    'theintensity',
     'their&ndash;very',
-    'their\'/',
-    'their-',
-    'their.303',
-    'their.expertise',
-    'theirfor',
-    'theirs-had',
-    'theirs/themselves',
-    'theirse',
-    'theis',
-    'theism\'',
-    'theives',
-    'thejamb',
-    'thejob',
-    'thejoint',
-    'thejumbo',
     'thekaekara',
-    'thekaekare',
-    'theklae',
-    'thelanthera',
-    'thelen',
-    'thelevel',
-    'thelion',
-    'theliver',
-    'thellier',
-    'thellusson',
-    'thelmo',
-    'thelnetham',
-    'thelodontida',
-    'thelodus',
-    'thelton',
-    'thelveton',
     'thelypteris',
-    'them&dollar',
-    'them&mdash;and',
-    'them&mdash;even',
-    'them&mdash;i',
-    'them&mdash;in',
-    'them&mdash;mena',
-    'them&mdash;normally',
-    'them&mdash;that',
-    'them&mdash;the',
-    'them&mdash;though',
-    'them&mdash;you',
-    'them&rehy;swept',
-    'them*',
-    'them-\'murrells',
-    'them-although',
     'them-fanny',
-    'them-it',
-    'them-not',
-    'them-perhaps',
-    'them-slowing',
-    'them-they',
-    'them.46',
-    'them.although',
-    'them.chris',
-    'them.go',
-    'them.mike',
-    'them.the',
-    'them.they',
-    'them/dem',
-    'them:sorry',
-    'them:wheelchair',
     'them=',
-    'them_a',
-    'them_all',
-    'them_as',
-    'them_by_way',
-    'them_on',
-    'them_over',
-    'thema',
-    'themania',
-    'themap',
-    'thematic-driven',
-    'thematic-map',
-    'thematic-mapper',
-    'thematic/rhematic',
-    'thematicized',
-    'thematisation',
     'thematise',
-    'themba',
-    'theme\'',
-    'theme-city',
-    'theme-pub',
-    'theme-pubs',
-    'theme-setting',
-    'theme-tunes',
-    'theme/topic',
-    'theme/you',
-    'themedium',
-    'themelis',
-    'themes.',
-    'themes/theses',
-    'themetal',
-    'themeteorological',
     'themiscyra',
-    'themistokies',
-    'themistokleian',
-    'themistokles-saga',
-    'themmos',
-    'themnselves',
-    'themodynamic',
-    'themore',
-    'themse',
-    'themsel',
-    'themself.',
-    'themselves&mdash;nature',
-    'themselves&mdash;the',
-    'themselves&mdash;they',
-    'themselves.',
-    'themselves.even',
     'themselves.this',
-    'themselves/are',
-    'themselves/reinforce',
-    'themslves',
-    'themusic',
-    'then&gt',
-    'then&mdash;cannot',
-    'then&mdash;overpay',
-    'then-and',
-    'then-arthritic',
-    'then-aspiring',
-    'then-available',
-    'then-boss',
-    'then-burgeoning',
-    'then-bursar',
-    'then-cbs',
     'then-chief',
-    'then-deserted',
-    'then-existing',
-    'then-girlfriend',
-    'then-manager',
-    'then-mp',
-    'then-needy',
-    'then-new',
-    'then-nobodies',
-    'then-nobody',
-    'then-outra&rehy;geous',
-    'then-popular',
-    'then-post-burgeoning',
-    'then-president',
-    'then-remote',
-    'then-slowest',
     'then-subsidiary',
-    'then-the',
-    'then-they',
-    'then-tiny',
-    'then-told',
-    'then-unknown',
-    'then-unnannounced',
-    'then-unusual',
-    'then-vacant',
-    'then-vibrant',
-    'then.as',
-    'then.come',
-    'then.just',
-    'then.the',
-    'then/he',
-    'then_along',
     'then_some',
-    'thenault',
-    'thenb',
-    'theneck',
-    'thenford',
-    'theni',
-    'theniger',
-    'thenium',
-    'thenken',
-    'thenking',
-    'thenness',
-    'thenormal',
-    'thenseforth',
-    'thenumber',
-    'theo-chronological',
-    'theo-something',
     'theobold',
-    'theobromifolia',
-    'theocracies',
-    'theoder',
-    'theodolites',
-    'theodore-ford',
-    'theodoretus',
-    'theodoric-story',
-    'theodoro',
-    'theodorous',
-    'theodoru',
-    'theodossiou',
-    'theodulph',
-    'theofraste',
-    'theognidea',
-    'theokratie',
     'theologian-bard',
-    'theologian-martyr',
-    'theologically-minded',
-    'theologico',
-    'theologico-political',
-    'theologue',
-    'theomonoism',
-    'theone',
-    'theonomous',
-    'theopening',
-    'theopera',
-    'theophanes',
-    'theophanic',
-    'theophil',
-    'theophoric',
-    'theorbe',
     'theorell',
-    'theorematic',
-    'theoret',
-    'theoreti',
-    'theoretical-political',
-    'theoretical/ideological',
-    'theoretically-in-',
-    'theoretically-informed',
-    'theoretically-possible',
-    'theoretically_at',
-    'theoreticism',
-    'theoretico-political',
-    'theoretized',
-    'theoretizes',
-    'theoric',
-    'theorical',
     'theoried',
-    'theories\'\'',
-    'theories-in-use',
-    'theories.',
-    'theories.g',
-    'theorique',
-    'theoriser',
-    'theorists.',
-    'theorizers',
-    'theorizings',
-    'theory\'',
-    'theory-',
-    'theory-builders',
-    'theory-crammed',
-    'theory-driven',
-    'theory-independent',
     'theory-informed',
-    'theory-makers',
-    'theory-moulded',
-    'theory-neutrality',
-    'theory-part',
-    'theory-specialist',
-    'theory-testing',
-    'theory-unladen',
-    'theory.',
-    'theory/feminist',
-    'theory/practice',
-    'theoryladen',
-    'thepatient',
-    'thepellet',
-    'thephoto',
-    'thepick-up',
     'ther&egrave;se',
-    'ther3e',
-    'therald',
-    'theramenes',
-    'therans',
-    'therapees',
-    'therapentic',
-    'therapeutae',
-    'therapeute',
-    'therapeutic-educative',
-    'therapised',
-    'therapist-patient',
-    'therapist/healer',
-    'therapsid',
-    'therapueitic',
-    'theraputic',
     'therapy-type',
-    'therasia',
-    'therbligs',
-    'therby',
-    'there&mdash;he',
-    'there&mdash;see',
-    'there&mdash;the',
-    'there&mdash;thirdly&mdash;the',
-    'there&mdash;though',
-    'there&mdash;you',
-    'there&rehy;fore',
-    'there\'as',
-    'there\'s_a_few',
-    'there-approach',
-    'there-but',
-    'there-has',
     'there-he',
-    'there-i',
-    'there-on',
-    'there-opening',
-    'there-room',
-    'there-set',
-    'there-was',
-    'there-would',
-    'there.can',
-    'there.in',
-    'there.many',
-    'there.on',
-    'there.we',
-    'there/',
-    'there/arises',
-    'there/reach',
     'there/their/they',
-    'there_are_a_great_many',
-    'there_as_soon',
-    'there_as_well',
-    'there_for',
-    'there_in_front',
-    'there_no',
-    'thereafterwards',
-    'thereand',
-    'thereapy',
-    'therebye',
-    'thered',
-    'thereereere',
-    'thereferendum',
-    'therefore_anything',
-    'therefrequently',
     'therein\'',
-    'therell',
-    'theremins',
-    'thereover',
-    'theresa/fly',
-    'therese&mdash;and',
-    'therese&mdash;i',
-    'theresianstadt',
-    'theresienstadt',
-    'therethrough',
-    'therevnto',
-    'therewas',
-    'therewithal',
-    'thereze',
-    'therfield',
-    'therianthropic',
     'theridamas.',
-    'theridiidae',
-    'theright',
-    'therin',
-    'theriomorphic',
-    'therisk',
-    'therlands',
-    'therm-',
-    'therm-a-rest',
-    'therm-a-rest\'r',
-    'therm-a-stor',
-    'therm-knife',
-    'thermacell',
-    'thermaflash',
-    'thermal-bonded',
-    'thermal-guided',
     'thermal-imperial',
-    'thermal-oxide-reprocessing',
-    'thermal-seeking',
-    'thermally-activated',
-    'thermally-heated',
-    'thermally-induced',
-    'thermalwear',
-    'therman',
-    'thermatex',
-    'thermex',
-    'thermguard',
-    'thermisol',
-    'thermo-',
-    'thermo-ceramic',
-    'thermo-dynamic',
-    'thermo-electric',
     'thermo-ionic',
-    'thermo-king',
-    'thermo-luminescence',
-    'thermo-motor',
-    'thermo-outer',
-    'thermo-regulatory',
-    'thermo-stable',
-    'thermobia',
-    'thermochromic',
-    'thermoclines',
-    'thermocompact',
-    'thermoconduction',
-    'thermocopper',
-    'thermocore',
-    'thermodynaamics',
-    'thermoelectric',
     'thermofelt',
-    'thermofloat',
-    'thermofluid',
-    'thermoforce',
-    'thermoformed',
-    'thermoforms',
-    'thermogenic',
-    'thermograms',
-    'thermographical',
-    'thermogrill',
-    'thermokarst',
-    'thermolactal',
-    'thermolactyl',
-    'thermolite',
-    'thermolysis',
-    'thermometer-reading',
     'thermometric',
-    'thermometry',
-    'thermoneutral',
-    'thermonukes',
-    'thermophilic',
-    'thermophilic/',
-    'thermophilous',
-    'thermophyllic',
-    'thermopolae',
-    'thermopylaes',
-    'thermoregulative',
-    'thermoremanent',
-    'thermos-flask',
-    'thermosafe',
-    'thermosensitive',
-    'thermospheres',
     'thermospheric',
-    'thermost',
-    'thermostat-setpoint',
-    'thermostat.',
-    'thermotron',
-    'thermuthis',
-    'thermwood',
-    'thernistokles',
-    'therris',
-    'therrs',
-    'therry',
-    'thersby',
-    'thes&eacute;e',
-    'thesarurus',
-    'thesaural',
-    'thesauro',
     'thesaurus-like',
-    'these&mdash;bearing',
-    'these&mdash;being',
-    'these-may',
-    'these-memorable',
-    'these-p2645',
-    'these-spells',
-    'these-uninsulated',
-    'these.4',
-    'these.are',
-    'these.ps',
-    'these/curious',
-    'these/skills',
-    'these_in_conjunction',
-    'thesedays',
-    'theses/themes',
     'theseuns',
-    'theseus-legend',
-    'thesigar',
-    'thesiger/explorer',
-    'thesimpler',
-    'thesis-antithesis-synthesis',
-    'thesis-based',
-    'thesis-entry',
-    'thesmelves',
-    'thesmophoriazusai',
-    'thespianism',
-    'thespienne',
-    'thespiennes',
-    'thesprotia',
-    'thessalon&imacr;ke',
-    'thesselves',
     'thestreet',
-    'theta&amp;sup1',
-    'theta&amp;sup2',
-    'thetaiotaomicron',
-    'thetatronics',
-    'thetford/malvern',
-    'theti',
-    'thetip',
-    'thetotal',
-    'thettalos',
-    'thetwo',
-    'thety',
-    'theudas',
-    'theuk',
-    'theunisse',
-    'theurgists',
     'theutenberg',
-    'thevenot',
-    'thevery',
-    'thevoz',
-    'thewh',
-    'thewir',
-    'thewles',
-    'thewlis/community',
-    'thews',
-    'thex',
-    'they\'are',
-    'they\'ll',
-    'they\'re&mdash',
-    'they\'ree',
-    'they\'v',
-    'they\'zre',
     'they-',
-    'they-bother',
-    'they-can-run-but-they-can\'t-hide',
-    'they-don\'t-make-\'em-like-that-any-more',
-    'they-might',
-    'they-re',
-    'they-were',
-    'they-will',
-    'they.',
-    'they.need',
-    'they.will',
-    'they/them/their/',
-    'they/these',
-    'they/we',
-    'they_sort',
-    'theyaalso',
     'theyadd',
-    'theyare',
-    'theycost',
-    'theyll',
-    'theyr\'e',
-    'theyrargues',
-    'theyselves',
-    'theyspoketo',
-    'theytdo',
-    'theywant',
-    'theywould',
-    'thforthcoming',
-    'thh',
-    'thhe',
-    'thi&eacute;ry',
-    'thi-1',
     'thiandoum',
-    'thiara',
-    'thiat',
-    'thiaumont-fleury',
-    'thibaut-des-br&ucirc;l&ecirc;s',
-    'thibeault',
-    'thibodeaux',
-    'thibron',
-    'thick&rehy;necked',
-    'thick-bearded',
-    'thick-bed',
-    'thick-bodied',
-    'thick-bottomed',
-    'thick-brained',
-    'thick-carpeted',
-    'thick-ear',
     'thick-eared',
-    'thick-formed',
-    'thick-grained',
-    'thick-head',
-    'thick-knit',
-    'thick-legged',
-    'thick-linked',
-    'thick-napped',
-    'thick-oiled',
-    'thick-pile',
-    'thick-ribbed',
-    'thick-skulledness',
-    'thick-sprung',
-    'thick-stalked',
-    'thick-stemmed',
-    'thick-stuffed',
     'thick-throbbing',
-    'thick-trunked',
-    'thick-waisted',
-    'thick-witted',
-    'thick-wristed',
-    'thickcoming',
-    'thickear',
-    'thickening_a',
-    'thicker-walled',
-    'thicker/thinner',
-    'thickest-soled',
-    'thicket&mdash',
-    'thicketing',
-    'thickie',
-    'thickies',
-    'thickly-bearded',
     'thickly-branched',
-    'thickly-carpeted',
-    'thickly-forested',
-    'thickly-haired',
-    'thickly-impastoed',
-    'thickly-lashed',
-    'thickly-wooded',
-    'thickness/body',
-    'thickness/frequency',
-    'thicknesses.',
-    'thicky',
-    'thiebault',
-    'thief-like',
-    'thief-proof',
-    'thief-resistant',
-    'thief-taker',
     'thief-takers',
-    'thief.',
-    'thielenplatz',
-    'thieler',
-    'thienamycin',
-    'thiene',
-    'thienhaus',
-    'thienthong',
-    'thiering',
-    'thierno',
-    'thierornamentik',
-    'thiersch',
-    'thieu',
-    'thieves.n',
-    'thieves/ununited',
-    'thievin',
     'thievish',
-    'thiggers',
-    'thigh&rehy;length',
-    'thigh-bones',
-    'thigh-boots',
-    'thigh-cuisses',
-    'thigh-thick',
-    'thigh-throttling',
-    'thighed',
-    'thighful',
-    'thighs/bottom',
-    'thighy',
-    'thigpen',
-    'thiirene',
-    'thile',
-    'thilia',
     'thillo',
-    'thimbalina',
-    'thimble-fulls',
-    'thimble-glasses',
-    'thimble-rigging',
-    'thimbleby',
-    'thimblelike',
-    'thimerosal',
-    'thimerosal-induced',
-    'thimi',
-    'thin&mdash;and',
-    'thin-air',
-    'thin-backed',
-    'thin-cotton-clad',
-    'thin-curtained',
-    'thin-cut',
     'thin-egg',
-    'thin-enough',
-    'thin-flanked',
-    'thin-fleshed',
-    'thin-haired',
-    'thin-line',
-    'thin-necked',
-    'thin-ness',
-    'thin-on-top',
-    'thin-pencilled',
-    'thin-shouldered',
-    'thin-soiled',
-    'thin-stalked',
-    'thin-stemmed',
-    'thin-thigh',
-    'thindwa',
     'thinend-of-the-wedge',
-    'thines',
-    'thing&mdash;a',
-    'thing&mdash;now',
-    'thing&mdash;she',
-    'thing&rehy;like',
-    'thing\'em-bob',
+)
+
+blocks_53 = (
+    '(&moving(%taken%$sure#%ggans#)ll-makers%#in\'\'"mg#/m&rehy;platform$)-bladders%$suit)"ed)!s$)/swimming$#cap$%mable',
+    '&"r.%%iness\'&g-bath)$club)(floating)&shorts*#lip)$wise(!.((/fitness($pool(!s%$ming$&suited#"n\'',
+    '$&bourne%%umian&*rn/kington()e/kington)"se$%combe$$dle\'%\'on(t11)+&/5149)\'&-leeds(&oxford(\'striker(%welsh*"st\'#.he',
+    '\'&/rocky\'$ites&"wn$\'e-herds%$ford%$hund(!t%$side&#ter$%field%(ord.even$.g&ndash;bridge%(-arounds\'#way&$beat',
+    '&&chains&$like&&ometer\'"ut&%plane\'$osts&%threw\'&ipping\'+o-the-right&\'weights\'#ing%&.local%$ball%$dale&$oors',
+    '&!s%$fire%\'ing-arm($ness%$land&#ine%\'ometers%\'tipping(!s&"op%$vine%$wise$#hoe$(ithwaite$&kbacks',
+    '$%sford%#ide%"to%!y$$tons#\'rl-free&%surge%#pot%\'y-amber\'%lined#(sh-swish%+est-looking%%ingly%!y$+s&rehy;born',
+    '&%built&&chalet&&darned&&french&(inclined&%kraut&\'swedish&\'trained%\'/german%$otel#&talski$$ch-a\'$back+"ed)#sed',
+    '\'&change((ustomers\'\'hitting\'&me-off\'%panel($oint\'%sales\'\'tenders($rack(#ype&$.bat&(/control\'!s&$3500&\'backing',
+    '\'-oard-operator&$card\')raft-type&#es.&&guards&*ing-points))/coil-tap&\'masters\'#ode$!h%!a%$bank%"er\'"ed%%frith',
+    '%"ra&"ed%"un$#tle$/zerland/austria,&france,(portugal%)occlusion#"ve%(l-action\'$ball\'$eyed\'%heads(%ipped\'%jerks',
+    '(&ounted\'$type&)/lockable&"ly%!r#$wiar#*zzlesticks\'$wick"!k#"fa"!l#!.#!e#!p#!v',
+    '"\'obodnik##ish##kin$%owski#$lled&&n-eyed($foot,"ed(%shoot)&kulled$!n$"we#%onin\'\'"gs%$like',
+    '%"ie#!r$+d\'n\'sorcery%&-armed)!s&&bearer("lt\'&ridges&$case&$deck&$edge\'(xtruding&%fight+#ing(&ttings',
+    '&$like&\'masters&\'pommels&%sharp+$ness\'%ticks($raps)$okes\'(wallower&\'whipped\'\'ielding%!.%(/phallus%#ale%"ed',
+    '%&fights\'+shtrombones%%heath%#ing%$like%&master%%plant&%oints%$s/in&$mith*!s&$tone$"ne#(tzerland"!s',
+    '#!i"6tnuxmlcdleubxtqhnzvjqf"%ubble"%yddfa%&ogaeth#"ft#&nderby$%etoun#"ve$%inges!(x-m-view"!3"&8000-2\'!3\'!4',
+    '"#ity!&y-kick"#11.#!6"!3"!6"\'99/tg77"$afei#!m#!n$$gela#!s")base-link#$ject#"ol',
+    '#$type#!u#\'yl/qspr",camore-lined$#rth#%hcoed$#dyn$"er$"ra%&onised".d.dms.csiro.au#!a#!e$!c$&rstone',
+    '#%kraft#)ney-perth&%sider#&onians#\'svenska"!e#(d/oxford$"uz#$ngis$#ite\'!s##rla$!s"$geia#$gest',
+    '#"ma"$hlet#%ridai"&ilabus"!k##es.%(/genetic&%lorry&%otter&%roman%"es##ora"%labus#$bert#$eham',
+    '$"um#$gard#%istic#!k$!s$#via#!l$$.132%!3%!a$\'abicity(!s\'"fy&&le-\'it)%count',
+    '((_instead(!d("s.&,us-dominated)(specific(*es/reading+\'syllabi$"i.$)ogistical-"ly#&master##osa$!w##phe$$roof',
+    '#%vaine%#tic$"er%$stor\'"ri$"io%"te$,opastoralism%!z"&m=8.1%#(ap/aspex%$athy$$tery%)hetically#"ba',
+    '&"te$%ol(s)&*-dependent\'%laden\'&making\'*processing*&ducing&(/poverty\'#you&+ic-language*$egal(,/ideological)\'numeric\'$ques\'%sm.in',
+    '*!s&#lic&$ogic)$zing&/s/abbreviations#\'e-smith$$onis$(s-mcswan#0ington/neighbour#3metrically-hydrated-!.(&x-type\'(ocapulus\'*y-breaking))forbidden',
+    '$#ons#.onds/community((hereford((managing\'$bury%"em%$ides#.path&rehy;etic\',etic-looking+!.\'"ic(!n)!s\'(omimetic\'"y.',
+    '$\'command$%etrum$%hisis%%onics(#que(#sts\'"y*(*-orchestra%$ylan&%sodon&"ta(!n$$last%&ectite&&gadean',
+    '$-tom-formation(\'limited()producing()relieving\'&atized)\'ologies\'$free\'%ology\')s.studies(,/behavioural&!n##ril##ses#%volon"-n&rehy;chrony',
+    '$(orogenic#!.#)aesthetic$&germos%$ogal$&lpheus$(nthropic$&psides\'!n%%tical&&ogenic\'&physin$!r$*spismos-nd&%simos',
+    ')"us#&cellus$#hed%&iropus%%otron%)ro-energy\'%mists\'!n($eity(#ies)#sms)!x)#zes(#ome)/us/asynchronous',
+    '\'!s\'#ton($rons$&iatial$%linal\'"es\'%orium$\'opaters)!s$%point$%ratic%)etisation%\'onising%#ude#(dactylus',
+    '%"ts%!y$8ic-g&eacute;n&eacute;ral(&eneral&#ale\'.tes-in-waiting(#ing)#ons("or%*otacticity$#ome$)rome(ibs)(#-xo(".a(,/erythrocyte',
+    '#"e.$&clises$(rgeticum&#ist)!s\'#zes%&netics$#sci%#ius#(fyfyrion#$gand$&enetic%!s$%onium#&idcate',
+    '#,od-appointed%"al%"s.$&gogues$&ikised$#lda$$mous$%nimes%%omous%#yme\'.ous-sequential\'"s.$&pticae$\'rogenic$)vial-type',
+    '#+sedimentary$&pilums$%temic#0tactic&rehy;ally)/ally-structured)*o-semantic%%gmata)/ic-paradigmatic%(x-driven\')variation&)/semantic&!e&"is$+ectonically%%llect',
+    '$\'h-dance&$skin\')plattered\'(quiggle-%&aprufe%$cake%%ecell&$sis.*!4)%/toll)(er-dance&0tic-antagonistic*%fibre,$lled%$food',
+    '%$oats&!n\'!s%#pop$$onic&!y"\'onymous"!p##ert#+hilisatrice\'&zation#!s#\'tomatic&!s""r.',
+    '$&cusans#$eeta$!j#(ia-based&$were%"ck%!m%"n-\'$held\'(lebanese\'(occupied\'&soviet\'"uk(!s$!e',
+    '$$ngae&&e-full\'#ful%-x/chlo&eacute$"us#\'maticus#)o-hittite%(lebanese%2palestino-egyptian$*echkovskii-!y$#lit$*phoenician$!s#&phidae',
+    '#$taki#)up-soaked%!.$!s#&yjczyk"/s&dollar;device+$help+3lifespan:crefdl.com4+example.dat4*fdldef.com5&oo.bar4+lstrain.com4#pmr4*usertl.exe3*fdldef.com',
+    '2<:lifespan&mdash;shutdown.com3+sylogin.com5+shutdwn.com63tartup&mdash;v5.com+/system:shutdown3)ql&dollar#"on$#rex##pas##sel#0t&eacute;matique$!.$%aflex%"ms%(rtup.com',
+    '-)generally-)partially-$will.$ould&!\'\'*photograph&0(s)/component(s)&!-\'.administration("nd(\'ssuming\')breakdown\'%colon)(mpatible)(nformant',
+    '\'\'defined\'(internal\'\'kontakt\'*management\'*orientated-"ed\')part-time\'%ready)%lated(%idden\'(specific\'+threatening\'$wise&!.\'$also',
+    '\'$that\'%under&"/2\')36-as/400*\'to-unix(!8(!x\'!a\'&cuckoo\'&expert\'*individual))stitution\'(lifeline\'\'machine\'%rules',
+    '&%:read&*atisations*"er,!s+!s&$deck&+entwicklung&$form&0ically-desirable-\'related\'$sing\'!x\'$zers&&pro/lt&,s\'--computer',
+    '\'!-()-computer)\'england((building(*management(*purchasing(\'related((thinking(+ultrasonics\'".l\'!/((services\'%house\'#oft&$wide',
+    '%!x$$hane$$oles&1ic/diastolic/mean$#sov#\'uaf.dat"#tem#+hnocomputer#*ologically#"ze"%udies#)mpathetic"\'verston%"ud##ier',
+    '"&wardby#)ell-based"%zran\'#%ygium!,z&aacute;zad#9eacute;kesfeh&eacute;rvar"#.21$"34")ab&oacute$"ad&#sag##fer$#ran#%kmary#%muely',
+    '$"to#\'tkowski"&chewan#&zeklik",dzhalombatta"\'echenyi#$dely#$eman\'!n#$ftel#"go#%keley%)sfehervar$-ler-dominated#,ll/cleveland',
+    '$"le#)nt-gyorgi%"es#%renyi#%wczak"\'igetkoz##kla$#ora#%lagyi$%vessy#"sz"\'klarska#(udlapski"&lumper")ombathely',
+    '#!t"-t&aacute;-lin#%andar#%encel"$ubin#%eroes&!s#+luk/brother#!m$-ski/prisoners"%winto"&ybillo#!k#%manki&#ski',
+    ' ,t&aacute;bor)%chira)"in)$lice)&naiste)$pies)%ranto#&circ;f#%mp;c2&!d&!h&!k&"pf#*uml;gliche"1dollar;29,600,000',
+    '"*eacute;fel)1l&eacute;commande6*unications2)diffusion2&graphe7$ique2\'mondial2(phonique2*vis&eacute*"mo)$moin-#age),n&egrave;bre*,ar&egrave;ze#3circ;l&ecirc;vision',
+    '++b&ecirc;che#(grave;re#&uml;te"(iacute;o)!w#-circ;rgoviste"1lsqb;a&rsqb;xtile"%mdash")ndash;34a("an(!e("me)%odern(!o(%which',
+    ')%glach)+ib&iacute;n#*slash;nder*&nessen#+uml;dlische\'(l&ouml;s(!z\'+m&ouml;riyn\'-senerschlucht4!s")pound;2.1"0rcaron&iacute;da(+;ebo&ncaron#)ehy;shirt"\'times;d',
+    '#\'circ;48(#rin#&macr;n#-uml;mendelger*$giyn(#pel\'"rk\'(ttlingen"1yacute;nsk&aacute!"\'a#%dmire&!t#%i-chi%#hiu&&s&uuml',
+    '#$ngle%!s#\'ppelles##rmy"$baby$"ck&$bone$#nns$"rn##eat$!d$\'ginning#\'lizzard#%ottom#$ride',
+    '%"ng$#own#(uildings"\'canadas$#rry$!t%$kins#%hange$#eer#%olour$"me$)nfinement$$rner#&umpany$!p',
+    '$&ughter#%ecent#!o$!g$"le%#lop##raw"#ead$#rth$!t#"lp#&mmener#!n#!s##yes',
+    '#$irst##ood#%riend$$ocks#&uneral"\'gallant$$rden$"te#$eese##irt#(lory\'ole##ood%!i$$rdon#$rain',
+    '"#ien#\'magines#\'nfernal$"gs$!k#!s""ka##eep##ids$"ll"%lambs$"ne##ead#$ight#$ocal',
+    '$"ok$!t$#wer"\'maister$"ke$$nger$"rt&%inmas$#yor#\'eetchya$"nt&!.&#ion#&ilking%"ls',
+    '$"on%"rs$"re%!n$"st#!y$$self"$name$%ybors#&earest"#one#(orselves#&rchard#%thers"$pack',
+    '##hon#$lace%!n#%olice$%stman#(rattiest$\'ivilege#"ub"(railways%"ns#%ecord$$main%%ember$$tire#%iffic',
+    '$#ver\'%-side#"un%!\'"$save#"ee#$haft$#irt$#oot$"ut#%izing#$mall$#oke#$osei#\'pinners',
+    '#%table%&ircase$$rike$"ud#%ummer$$nday#\'wingers"$tail#"he$#ink\'#in\'##ime##ops$$wers##une',
+    '"&united"$view"#way#&eather#%harfe#%inter$!t%%ching#(orkhouse"$yard#$oung"$zand!+(1137)=2.74($4.23($7.13',
+    '"(22)=1.89"(34)=0.33("85&$2.64&$3.57"(46)=1.28"(58)=2.58""c)"\'eacher)""t)""z)!!*"#m*s!"+2"!4',
+    '!$-101$!2"!2#!2#"8d"!3#"3s#"8a"!4#"5a""50#"4s#!9""60#!s',
+    '"\'aigeach#7ntigen-gene-transformed##xis"$barb#$irds##oat$#nes$!x#,utanol/water",cell-science\'&tropic&$/pan\'(t-helper#&ounter"#day',
+    '"#end"#gap#"el$4t-away-with-anything#$rain%$mmar$&ouping"$in-t"$life"$maps"%o-y-s"#p-t%$-p-t#%ieces##lan',
+    '"&ratios")sections.#"hi%$rts/)%sweat$#ort\'!s#"ki#)tatistics$"em$\'rathain#%witch("es".t-t-trrrrrrrrr%$otal',
+    '%"wo#&abitha$$iwan$"lk&#ing#"ea$"ll##old$&morrow$%night$"ok$!p%"ic##rim%#nyl',
+    '"!v"(weighted##ord"$zers!".2#"0s"&4/pr.3",5&ndash;1.8m#!s""61"#a.t#*cidophilum"\'b.g.a.s$"o."!c',
+    '$"n.#%ahill"!d#%.haws$"l.$"us$#y.s"&e.f.l.$(lawrence$"o.$*r.a.s.xiii$&s.o.l.&$p.i.#(ckersley"&g.w.u.',
+    '"%hulme"%i.c.s$&r.e.e."\'j.clark$"f.$"m.%&axwell$)papenfuss##oka"$k.l.#(ishimoto"$l.c.$"s.##unt"$m.t.',
+    '"$n.s.$"t."$o.f.$$p.s."$p.b.$\'o\'neill#%owell"&ruweti"\'s.eliot$"o.#$hape"&t.q.m.$$tsui"&u.b.e.$!c',
+    '$"am$#e.i$!s"$w.g.$!r%!.!#/10"!4"$8749""a\'")cytotoxic"&ha/p.a""lo""sf""to',
+    '!(0010547+$$4277$$6510#%58053\'!4\'!5&"60\'!2"$1/04"#606""n0$"m1##1m1!*1&ndash;t4"#-t2',
+    '""/1"!0#!0"$1/49"!2""4\'""54"!8!&2-type"!0#"0s#$1/08$!a#!4"!1',
+    '""5n"!t#,ransfectants!#3\'s"#-af"#/t7"#010"!1"#228#"37$!9#"94"#317"!4"#629',
+    '"*pg4+c9pa10!#40a"!3!%5-t10"#0pl"!5#!0"#60i!*6&ndash;t8"$-t12"#.12"!0"\'400/dx2%!0#!s',
+    '!"7."#259"#525!"8\'"#-a9"(00/t9000$!s#"5.$!s""15!#900$#0s.#!1#"46""20',
+    '!%:0234$"52$"76$"96#,31&ndash;245#,41&ndash;332$"83##703$+1&ndash;233.!6,#497,#548,#831.!4$"30',
+    '$/95&ndash;531472#,81&ndash;449-"58,#686,#787,#983$"92##908"\'o7i-828"!t!%=0.28$#867"$2.15"$47mm"$7.55',
+    '"#int!$a\'in$"zz#$qali"!-#$100r#"da##hui%"ng##men#$raah%!h$!p##tas"!1',
+    '$"0s#"22"$200s"!3"!4""50"#634""a-#$aime$+tctaaagacga#!b#"fe#$huku#$llow#!m',
+    '##ran#$skin#!t$\'gag/tat&$rat-"$b(s)#)-collared$$labs$%pulls#,100&ndash;12#!a$#cek$#jdi$\'kaucoro$!n',
+    '%\'&eacute%#ds.%"ov$%tabai%$chik%"ha%,i&egrave;res&#nga$%zadah#$bard$$erer$#ing$%ouleh$&y-cats#"ea',
+    '$%llini$#ner$$rnam&"er#"ia$$gura$#min$#nal#$kay.##le-&$bell&\'clearer\'(ompanion($oked(#ver',
+    '\'&ricket\'"ut&2fountain-cum-water\'#ull&+harpsichord\'&opping&$like\'&oading&#mat&)qualities&\'rapping&(to-table&$wine%!.%!/',
+    '&\'diagram&.humidification&(standard&$tray%#4.4%#6.2%#aus%-cloth/napkins*"es*"s.%"ds%"es%$fare%%piece%#saw',
+    '&#ide%(t-called\')initiated\'#lcd&$/lcd&%ennis&#ing&$ools&*s&ndash;to&#ure%"ux$$inum%$ture$$oid\'\'\'-fodder',
+    '(%press($type\'\'ization\'!y%!n#)oo-loaded&&ridden$%rites%!s$#ssi$$uleh%#ret#%raham$%izian#%suwan',
+    '$!k$"la&!e&$tors\'&urbuch)!e*!n%"es\'$/are$#nut$#rel"%c-tac#%chini$#ola%"ni',
+    '$!t#!h$\'ai-type%"na$#i-s%*arrhythmic%&banaki%!e%%nidae$#nag$&ochart%&meters%!s$\'ybaptus%%cines',
+    '%%kinin*!s%$onic%%peles&%noeic#\'itaeper%$ical&#sts%$urne)!y$$zade#&k-free%%sharp%(tack-too$&aberry',
+    '$%ed-on\'"up%!m%\'nsautis%"ts&"ty&!y$#ity$+le-anything\'&making&"by&&d-ball&&r/ball&#way$#man',
+    '#"on%.ian/caledonian#-tic/selection&+ally-minded&"s.(\'parents%#que$(us-giver"&dahiko&"ro$$rida##dei$&ington#"ek$"ma',
+    '$"os#"ge%!r##ila$$wala#\'jiddine##low#"ma%!n%$rton$#uir%!r#%olini#+pole-meteor(&shaped',
+    '#%worth#)zhikistan\'!s"\'e-night#(baek-san#!d$#ium#&gether##jon#$kyon#!l$!e$!s#!n$*iasporites',
+    '%%ourus#!s$%chner#(terrimam#!z"\'fahians$!j$"wa#!e$&lmusik%%spitz#&finder$#oni%"rd$%swell',
+    '%$itis##ila##ner##ton$!s".g(1&ndash;272)$"s)#\'-a-long$#end$$line$\'triples#-alog-speaking\'!s$#ror#%ebuch',
+    '&&t-face$#ert$#led$!s#%hairn$!i$#olm%#uti#"ia$#yev#)lialatela&#sco&%telli#"ma%"ta',
+    '#$set2#$uban"!h##adi$!i$!r$&shshum#$deed#$eebo#!i$"ni$#rou#!n#&ourdin#&panhes',
+    '#"ta#*uantinsuyo"(i-boxing$#chi$$fing$#pan%#ing$"yu#!a$"no##bin$"on$%utheh#%chiro#!d',
+    '#$fang#$haku%"pe$#eng&$yoku$!o#%jaing$!i#!k$"an$$osha#\'l&mdash$(-and-dog%%backs&#ell',
+    '&%iting%(crushing%\'derived&\'ropping%&effect&$nded(!s%#fan&&eather,*ed-shakin\'%%gates%$half&$eavy%&length&#ike',
+    '%\'mounted%#off%)reduction&%udder%)sacrifice&%haped\'&edding\'&unting&$pine&#tem\'\'reamers\'#ump&&wisher%$tips%"up',
+    ')%ingly(!s&#ind$!.$!/$#_an$#and%$rach$$band(!s%%oards&"ne$(dragging$%ender%!s',
+    '$%gate/(!s%#rab%%unner$$hade$\'ing-off%!s&!m$,le/taillynge&%ferre&&ssness%%ights%"on%$ynge$,or&rehy;made',
+    '("ut\'$xxxx&+/dressmaker$%pipes%-lane-elevator2%-trim$$race$$skid\'!n%%tream$%teann$%wards%%inded#!m#%naron',
+    '$\'t-proof%"on\'#/st#$pale$(ei:china#!r$$aval$"ea$!p##sei%&z-vous$!o$#uke#\'t/event$!a',
+    '$!i$!o$!t%&health#-wan&mdash;had&%-bred\'\'elected\'(financed(%unded\'$made&%/hong&*ese-backed+#orn#$yuan#!z',
+    '$!o%!u"\'j-mahal#!a$!s#"ga#)ik-afghan%"ta$"ne&!s%!s$"ri#%nikar#!o#"ti',
+    '%%2,550%%3,800%&40,000%%5,900%&82,900$&73,000%%5,000\'#627%%7,300$&80,000%%5,030\'#500%%6,500$&bwebwe$!c',
+    '$"go$$hara%!e%!i&"ko$$kura$$maka%!i&)ne-badged&$zawa%#ori$!o$%shigi$%toshi$+yanagi-type',
+    '##e-a&%-pill&)way-kebab%1it-or-leave-itism1)the-place%1me-as-you-find-me%9no-thought-for-the-morrow%(off-able)+out-of-trim&"ne&#uts%>some-of-it-or-leave-some-of-it%#ups%-what-you-want%#you',
+    '$%/send$"_a$$able$$back(!s$%downs$$hiro$$ichi%"ng$"ji$\'n-aback&/for-grantedness-#ted)\'granted%#.an',
+    '&\'richard%%/over%$hall%#off$$offs%"ka%#uts%+ver-defence)*threatened(\'/merger$0r-of-the-minutes\'"ut\'$vers%)/supplier%$s-up',
+    '%$hiro$#way##her$$isis$+t-e-jamshid#&iguchi$$jiro$#n\'s%%g\'53\'&&-apart\'0care-of-business\'$down\'.me-for-granted\'%sides\'+workaholism',
+    '&"_a$%shima##len$"on##oes$"vo#%rir-e%"ti#\'shasila#&ushoku"*l-haddiema$&y-cafn#&a-ngai$"at$&bardon',
+    '$$drid$"ge$$hari&*ssee-based%#eel$%irach$&khadze$%manca\'#tes$!t$"wa#%benny$+ot/governor\'+northampton\'(oncology',
+    '#&ced-up$!s#"de#$e(s)$)-spinners%&teller+!s$#fre$$ggio%$hani$#nce%\'t-based\'$free\'(governed\'\'hunting',
+    '\'&packed\')rewarding\'\'spotted&(lessness&$mark&!o$!o$"rs$"s.%$anta%!e#%fourd#"go#!i$#abu',
+    '$)gent/pink))workplace$!n%!n$#pia%"ot$"sa%!h%#men$#tha#+k&mdash;now+#the$!\'$2-about-the-weather&(nd-chalk',
+    '%"in%\'to-plus%"up%(whistles$!.$*/interview%$upon$\'atively$*ed/written%#rs.$%house$!i%%e_out%0ng-about-himself(%brain',
+    '*"wn(\'machine($over(%shops\')/laughing(\'quoting\'!s$%s-see%#/de&/panels/seminars%$_out%#hop\'!w$!t%%ative',
+    '$&uassir#%l-boy%\'chimney%&female%\'pyramid%%short&$tack(%nding\'%emmed%(thinness$(.maureen$$/8ft%\'emerald%$flat%%short',
+    '%$dega%!l%&nstown&$tire%#uli$$egio%"nt%&r-like&(/shorter%&st/you%!t%.yrand-perigord3!s*!s$#ien',
+    '%&s-byrd&!s$\'ow-pale\'\'smeared\'%woods$$ship$(y-making(!n#(mage/bbc$%ouses$&udical&!s#%notry#$oqan$!u',
+    '#"pa%"de#!u$$kder(%local$%ntais##van#$wani$%inder#!y$0bont&rehy;on-usk(\'-on-usk$$cafn$$sarn$$waun',
+    '#(-donning$$made#+/paediatric#&acipan$#gno$$hine$%ioasa&"sa$"ka$"le&!s%$pais$"na%#dua$"ri',
+    '&$ndus\'"te&!r&!s&!t%#ugo$$shek%!p$"ya$!z%$epan#"b.$$atan$!e$*i&eacute;n',
+    '%$tata%$ured\'+ine-playing%(v-kozlov$$rand%"yn$!s$#uri\'"ni##din##eer$!h$$rlan(!o$!t',
+    '&$held&(minority%$nadu$!m$!r$$suke&"ra$"ya#$kang#"ma%\'ny-type$"en$"ie%$sola$"ur',
+    '$%otsin$#ren$#tsu##pan$*er-evident$#ica%!n$/lin/businessman()developer$%onoir%"si##sie$"on#$ujin#$wood',
+    '#"yr""n-$#220$*and-silver$$pits##ada$"go$"is$$jaro$&kadate&!e&)transport%!i&!a$%lized',
+    '$#rov##cho%#uma$"ia%!g$(r&egrave%#ede$!y##dai%"ta$#beg$$jung$"om&"ly%"na',
+    '("ed(!s%"wn$%ridge$%ulkar$&y-grid%%/grid%!s#,enbaum(1976))!s$!r$#toa$!v$&zrouft#%galla',
+    '%"ta$"ee$#ham$%iness$*le-bearing\'%free.)%inged\'\'scented\'#web$%meres$"o+%&-tutor$$rams$#tai$%uigue',
+    '%$tica$+y-flavoured#\'ichthys$#ela$$gawa$$kawa$!n%"im$#sha##jga$#ong#$k(s)$(-builder\'(lldozers\'$ster',
+    '%(cleaning%$fire&#ull%$mate&"ix%%proof%&raised&&elated%%space%&tracks("ps$%/pond$(ard-full$%ed-up%"r\'',
+    '\'$load+#ing+!s%!u$$fuls$"ha$#man&%sters&"te$&raised%#oom$"s.%&/bowls%$hips$!y',
+    '%!w#&matras#-nahill/friend%"im$!e%"ds%$r-ba&$/lab\'&oxford\'%tommy&!t$#ian%&n-free\'&pepsin\'$rich',
+    '&"im$#och\'$side%#uri$!u#"oh#\'riverdi#$sads$&ferred%$ield$$hill(\'/victim&"re$"ki&+agriculture',
+    '#)t&ocirc;t$$abin%%liser&#lum%%moumt%"wi$\'istisuk$"ka$"ra&!s%#ism%)um-filled\'"s.$!s$#uri',
+    '#"u-$!i$,ra/singapore$$vasa##ver##yar$\'castell$%groes$&pterus#%zimat%!n%!o"$oibh$#sts##nga',
+    ')$room#&-borne$&danced)!r$\'handles%#ole$\'in-putt&!s$)penalties*!y$&rooted$\'tap-tap%(echnique%+he-tip-tank%&urning',
+    '#\'/faucet#"1a#"2a#$able$%chula$#jos$&nahony$#rua#%dance#-e&ccedil;aria0!s$\'-bonded%&driven%\'journal%\'machine',
+    '%&number%$path&%layer%+recorder(s)%&tastic%"up$#/cd%$disk%#min%-tickets/press$#250$$deck$&inosis$(meisters$%nades',
+    '$)r-drawing&$edge%(ecording&\'d-sided&"ll%\'ing-off$"s.%(/seventy&$tape%&helves%+try-covered)$hung)%maker,#ing)$work',
+    '%"ys$#tes#/hrogeosynclines#"in$(oca-like$!s#\'otement#"pa$%ertit$"in&!\'&$/bus\'*gloucester&.g/microsurgery%!t',
+    '$!y#$rain#$s_on$#all\'&/widow$$cott(!s$*ell/karate$$hoes$#oba#"ti$"on#!u$&eluelu$$ndas',
+    '#$iyah$%zadah##taq##uan$!i%"na"/r&rehy;touillat#%-baby%$ound%%ucket$(drenched$$file%#ree$&laying$\'macadam',
+    '$\'stained%\'urfaced%&weated$%water#&/lower#%abini%$ulsi\'"us$\'diddles$!k%"et$#lli$%makau$!n%#aka',
+    '%%telle$#pur$$scon%"ia$#val$$wali(!e%"ih$#zed#$bais%#lls%"rt%!t$)es/mooney$#ock',
+    '%!r$$rush$,uck/comedian%"tt#%cisio##dar$,ets-sorholus$&islike%&tional%#vel\'!s$"os$"us$#yon#$elli',
+    '#!f#-get&mdash;and&$-man\'(practice\'%range()eadership\'&screen("ee)\'lecting(&hooter(\'pecific\'\'testing(%opics("ug\'$word',
+    '&$ing.\'$sing&"ry&-s-instruments\'!.&+totalannual$%on/31)!s(!5$!t$"us#%ianas$+c/commodity$"fa%)f-induced',
+    '\'*reductions$"ms$"na%#gar$$sker$"ta#"ja%!n#!k$%hanov$#off$$unde#!l#4mac-and-broken-glass\'\'covered',
+    '\'(pounding\')scorching\')vacuuming&$king$$iyah#,n-et-garonne$!e$"ip$&jacket$$mere$&obrzeg%#pol((-lemberg%\'w-mordi&#ski',
+    '$#gan$#m-e$#nga$$omba%"na$\'t-sneak#!p$$aper%%wling$$eius%!y$#ley$!s#&quinii##raa',
+    '%$dale&%iddle%!n&#ium&$tula%!s&!a&"ch%"tt%$zona$!e%"rs%!s$#iff\'!s',
+    '$$ocks$(y-hooded#"sa%%dalmi%"ls$(ier-like%"la%"us$"on$,us-schmarsus#&t-lash%\'skinned%\'tongued&\'rotters%3with-a-golden-heart',
+    '$%abull%$glia(#one%&n-clad\'(inspired\'%lined\'\'skirted($tyle\'\'trimmed&"ry&$ware%#rea&"in&"us%!s',
+    '$"er$&ifkoff%"ly%#nes%"sh$%orria$$rate$#ter$#ufo#"uc$!n##ver$"it#$yans$!n',
+    '"%saday#*c&oacute;n$!a$#hen$"io#!e$!r#$haka%%liyev$&dzhyan$#enu$#iha%!n$$jian$+kent-moscow',
+    '%#ich$#nag$%pinar##ika$$lova#.k&rehy;focused$#(s)$(-adapted%\'culture%$goal%+independent\')struction%%level%*management%+orientation',
+    '%\'setters%#use$!/%(evidence%(standing$!4$-5yourinitials1$.doc$-7yourinitials$"ar$!e%,r-poland/gas&\'/access$%hkent$\'manager',
+    '$$opru$&s_such#\'lanised$#een$%itzky$!k#%man-2&&/south&$ians$!s#"os#%saduq$)el-shaped&#ing&!l',
+    '%!n%"os$"le$"os##te\'%(-changes&\'evoking&$high&%maker&&poison\')resumably&\'shaping&\'testing\'\'ingling%.fully-designed',
+    '+#lit%(lessness%*r-in-chief&!y$!i%"ly%$ness$"y.##uku"(t&egrave#&-eared#,a-box-factor%*containing%$less%%motif',
+    '$.atgaatttgggaga$+b&acirc;nya$!m%!s$#nka$&rskaya$#son$!t#&e/fund%\'patient$$gaki$"r-&\'picking%#aka$#son',
+    '#\'ggccata#&hagata%&m/rscg$#lum#"ia%#nas&!i$"le$"on$&scheff%%tical$$tlek#(lin-like#%madaw#!o',
+    '%"ed#,ransk&aacute#)shenshini$#ide%&enense$%ufumi%!o%"ro%"ta%%yoshi#!t$&embach%!n%\'r-edged&*ed-looking',
+    '\'#haw$&i-like%#es.%"ly%$nger\'%stone$#oed%\'n-brown%)o-wearin\'$"wa$)y.however#$wine"*u&amp;sup3+!6#.-antineutrinos',
+    '$)neutrinos#%b-nut$&er-arp%!s$*man-goldie#&cheira#\'entzien*\'strasse$"rn&)kraftwerk##fan#"gh%)t&rehy;it&\'-course\'%lexis',
+    '&".a#$lbee##man#$nagh$%g-gyi%#gyi(,&ndash;kalaw%%in-in$$ters%(on-based#(pe/peach$)o-rotorua#!r$!a%#nac',
+    '$\'inensia$\'omachia&%enium$$ulus##sch$!k$#sig#\'t-faced%)stretched$#ing$\'ly-held$\'ochrone%&nymous(!s(!y',
+    '"&valams%#qia$"nt$"ra%!d%!i&$shch$$stia#&edikul$$nder(\'/labour)&malaya$"ra&!s%(n-league',
+    '&!e\'#lle\'#tta%%stock$"ta#$iani$#ner$!o$&stocks#(khelidze#"le##ner#$ollo%!o$"ra',
+    '"%wahka$#kha$(ntinsuyo$!r%#ikh#$eche$#lls#$heed#"ia%!h##maw#!n$%iness$\'y-blond&&haired',
+    '&*shouldered#%stock##ton"/x&mdash;bearing*#the#!\'#+-and-grants%\'ssessed*%ments%%verse&&oiders$$back%&enefit%\'oundary%%reaks',
+    '&)ncessions\'&scious%+um-monetary&*t-financed$*deductable*"ed*\'ibility&\'ferring%$odge)!s%%riven$+effectively%&vaders(#ing$\'finance',
+    '%$orms%)riendlier$)gatherers%)overnment%$rabs\'%nting$%heavy$(increase+#ing&\'spector$*minimising&!x$\'neutral$)penalised%#lan',
+    '+#ers$\'raisers%&efusal&,lief-induced*!s&%venue$%saver%%hield%\'pending%%tatus%)ubsidized$\'to-date%#ree$%weary%&riting',
+    '$$year#!.$)collector-!s#,/corporation$&public$%sales#"an$*tion-class(\'/social%$ores$%xerol#*collectors##eis$"ll',
+    '#"i\'$,-association%%bills&$ound&"us%&divers%"ed%\'licence%)operators%$runs%%stand%#van%#way$*/bus/train$!c',
+    '$#max$)s/coaches#$line##ono&%mical\'!s$&phobia#.payer-financed*%unded#&thresh"\'y-sachs#$burn#"er#%field#$gete',
+    '#$jack#\'lersons$#oes%\'r(1986)&%-east($lder($vans\')griffiths\')issajenko\'%smith&&/bruce\'&clough(&ollege\'"ex)+-apprentice',
+    '\'%henri($orse\'!l(\'etcombe\'&mother\'(national\'\'organic-#ser(*xfordshire\')pensioner\'"st(&windon\'%world&"he&-ian/ashmolean',
+    '\'&zation%*ur/trading##man#!o#%payer$!e#\'side/la%!r#&vailin$$elka%#rka$%ullin"$zama$"ra#$elle',
+    '#"zi!#b-9#(infected#\'testing""03"#1/1$!2#"0s"!2#&0/tb21#!1"#863"!9#!s"#dfs',
+    '""ls$"ps"#oc3#$rpey",p-associated$\'binding""to!0c(ct)tg(acgt)gc-"%-130g#$2290#!4#"ec#%hmpao#+ldiethylene#\'sulphur',
+    '"$/154#"tt"$1000#"99"!="/a-precipitation#-acc-17-tataat##lls#:tg.tcc.gaa.cat.gag.acc.cgt""ca""da".e-contaminated#!p"\'f-1&agr#!8',
+    '"$h-ed$\'tch-tch#&aboure$$dien($-fdt(#nes$!i%(kovskian$#lla#$ekov$\'litchew$&repnin%&ikover%#nia%*tsivittchi',
+    '$"ck$!k$#mne$(rozerine$$tchi#%ollir$*mbegoposts$!o$(udnovsky%)kou-hadje%#rou%"ta#$ueet$!p"!j',
+    '"$l200##400"-p/ip-oriented&!.#!p"*r-positive#!m#!u""s1"$u-pa#!p"*v+platelet#%-309+"!w#"03',
+    '!8d/congressperson/senator#"ed"!1#$66vi"!2#/48/g&ndash;oxvi"!3"!b"!h"#rsa$!s"#s.2"!t##lq-!"e-',
+    '*"fy$!c#&hsiung#$k\'un#(roe-puss#%total""31"#517"+a&rehy;cosy)#pot)%towel.!s#(-and-bed(*toast-type$&basket',
+    '%$read\'$wing%#ulb$\'carrier%\'eremony%*hest-sized%&ulture$%dance)"rs)!s%)ispensing%&rinker+!s)$ings$$from',
+    '%&lasses$\'kettles$%laden%&eavery)"s.&"ss$\'machine%&eeting+!s%"ug$\'picking%$lant)"er)#ing%\'ot-like',
+    '$%room.&"se$\'scented%&ellers%$ieve%\'melling$&tables&!x%!i&#mes%4oast-and-tinned-soup%$rays$*warehouses%/ith-the-beatles#&/toast',
+    '#$bowl$$read#+ch&mdash;in&-rehy;yourself%5-yourself-photography%\'ability\'&leness%-er&rehy;pupil\'!\'(%s-eye)(/library\'/-accountability)(ppraisal,(opriated)/s-social-worker',
+    ')%uthor)(wareness(*consultant+$trol/#led)&ritics(#day)(ependent*&signed)%riven()education),ffectiveness),ntrepreneurs,!y)+xpectations',
+    ')\'unction()generated(\'imposed)*nterpreter(-librarianship(\'members(%nurse(+preparation*#oof(&report)\'oasting(&scales)*tructuring)(upported($team',
+    ')+urned-comic,$over*#tor-!s($user,!s(\'writers\'+.exposition(\'support\')/academic)&dviser)%uthor(\'learner)(ibrarian(\'manager',
+    '($poet)+ractitioner*%ogram(*researcher2!s(*supervisor(\'teacher*(chnician(&writer\'&:pupil\'"ly\'%s-dem(*/lecturers))practical)(trainers',
+    '(#hip&#s.a\'"ts%!i&"n\'\')g-in-role)-machine-style)$only)$post)(training(&.staff(+/discipline,*semination),non-teaching))personnel',
+    '%"um$#ing$%loths#$folk#$gue.&+/gloucester#&houses#+k&rehy;wood$%-dark%(finished%$laid&$ined%%tough%(veneered#&l-like',
+    '$&e/tgwu$#ham$#ing#$m&gt$!\'$!-%2-multidisciplinary%(changing%(handling%.leader/manager&#ist&#oad%\'managed+"rs*#ing',
+    '\'\'mber(s)%\'nursing%&owners%#pal&%laces($yers%$room&"un%%sized&%kills&$ongs&%pirit\'\'okesman&)tructured\'#yle',
+    '&$each$#.no$!/%(cellular%7departmental/individual%&module%(official$!0$%aking%!t&!e\'!s$$hair$%makes$$pull',
+    '%(/players%$heet)!.%\'manship$$wear%&orkers#"ne%!y$"ga#+pe/arjomari$&lanter&#tes$#ot\'#&qchers#"r-',
+    '&%right($mmed%(dampened&$rops%\'gassing%*in-her-eye(\'my-beer\'&ducing%$jerk%%laden%)resistant%\'smudged&&wollen%\'tracked$)/abrasion',
+    '$$able%#rse$%bombs$$fall%#ul\'$&gassed$#in\'&\'g-apart\'"ly\'!s$"le&$ssly$#ney$#out$-s-and-outrage',
+    '&"of%".5%!e%$heet$%tment$&y-eyed#"s.$#del%#ill$"e.%"d.%"ts$*hoppe/cafe$"in&!\'',
+    '$!p%"on&0onful-and-a-half$!y%&-weasy#%table$#her$$ime.%"ni$#les$$ment$$owel(!s$%ralny&!y',
+    '&#cho%%olley#!u#$ware\'!s##zel$#les"!b#$aldo$#nia$!y##bal$"et&"ts$\'it-like',
+    '&!s$"le$"ut$!y#!e$#dge$%rosky#$itto##ogo#%uroro#"ya"#c-1$$bond$&funded$&ni-pli',
+    '#,h&rehy;nical$$-air%#boy%$info%$side&(kragging&$peak$!.$%/high$!a$$data$#gen%$reen$%ician%"no',
+    '$$mark$%nerds&Dtium-diethylene-triamino-pentaacetic%1ica/professionale(.l-bureaucratic*\'drawing*$help*%legal*&market**scientific+\'ounding+&upport*"to))/academic*+specialised',
+    ')(director)2ly&rehy;orientated+(-defined,&minded,*orientated,-sophisticated+,/financially)(superior("re($tome\'#hal\'-ian-craftsman+$type**/assistant+)scientist',
+    '*,s/technician(#ens("ty\'"ky\'!o\'#ues&$flex&$mont&#qes\'!u($e(s))*-intensive)#may)"s-*".5',
+    '\'$chen*!r&$tron%,o&rehy;crats,(economic&,-archaeology)!t\'%based((rutalism\'$chic((onfusion(&ulture\'"ed\'%flash\'*guerrillas',
+    '\'%heads\'&master((ercenary(#yth\'(overkill\'%pagan(%hobia(&ioneer("op\'%rumpy\'$sale(&cience((tructure(*uperheroes\'\'tasting',
+    '(*heological&%bombs\'+ureaucratic&5centric&rehy;inspired\'"op\'&ulture&%flash&%gical&#ish&!l\'$ogia+!l*0cal-bureaucratic.+feasibility--ly-challenged',
+    '/-/vocationally+,o-benthamism5"te-(economic*$es\'\',!.-%taken."he*$ques*$sdts+#ing+!m+*t-in-chief),y&mdash;even+*rehy;based',
+    '+(designed-\'veloped+\'forcing,#ree+6is-politically-neutral+*orientated+(specific,\'wapping+\'trading+$wise*;/computerization/automation+(learning+3nature/medicine/etc*&driven&$mats',
+    '\'%hilia(#obe*"ia\'"ol)!i*#tan&$rton&!s\'#oft\'%phere,!s\'(tructure\'"yn&$tile&%videa',
+    '$\'systems$&textil%$rend$!y#$kman#%media#$nico$&ofrite%!l&,&oacute;gico&$ogie%$mare\'#tix#&roghan#"ta',
+    '$%ogene%"na&/o-stratigraphic%)silicates$"um%)re-mapped#&ulescu$"ya"*d-buddhism$)decorated#&/wayne##ale#!d$"ie$%leton',
+    '#"ia%"ry$!o$"us#$mans#%stone#%ulkar""e-$"ed$(fittings$%hinge$\'markers$"oo&#-ee$&pieces',
+    '%&hirted$#tew%$imes%\'o-green&\'talling$"up#$ange\'"rs#$boon$%ridge#$cher#%d-off%"up##fal$!s',
+    '#!h#&ing-up#"ka#!l$!e$)ing-smith##m-x$\'ing-pit#\'n-\'zine%$idol%\'machine\'!g%1prostitute-victim%%queen%%rebel',
+    '$-age-flavoured(1mutant-ninja-mole\'$r-is("s.$%dream$%egers$#fic$"ie$#oso$#pop$%s/low%+y-weensiest,!y$)y-boppers&\'weenies',
+    '+#ish#"oo#!p$*-teep-teep$"ee&!s%!g#%rasut$&enatch$$linc(!s$!p#$s-up$!e$#hot',
+    '$%water)!s&!y#%taire$#ery$*h&rehy;but%)-achingly\',nd-tentacles&%bared&)clenching&(gnashing\')rindingly)$tter+#ing&\'jarring',
+    '&%marks&\'pulling&)scrubbing\'&ucking&(together&\'washing%%.that%$ache%"ed&!r%)ing-smith%!s$"um#!z""fe',
+    '#!f$%erson#!i$$llin#&l/tesl$*on-coating\'%glass#!t"(galensis#&ernsee$&tmeier##fan#!g$#art$"in',
+    '#$odor#!s##uia$%lated$\'mentary"\'hachapi$%ndiri$!s#\'bazaari#"ee$(ran-born(&europe##idy$%yaand#%nique',
+    '\'$baku&$many$!i#(uantepec"#i-l#)benbacher#"ch%#ova$\'oplanin#"ge$!h$&ngrace##kyo#"le$+fod/officer',
+    '$$lard$!o$%ungen#%muraz#$nart$"ds$#tes%$urie#&resias#"se$"ho$&iphone$$sier$"te#\'telboim',
+    '$#sch$!z#$xera$)id&oacute""ja$\'paibuls$!s##era#!o$"le"%k-500$#sea#\'akwitha#$base#"el',
+    '$!n$"ze#(hnologia#&inaiti##ken#(l&eacute##nek$#ika%$vent$!o%$liji&#ogi%$nymy%!r#%tites',
+    '"-l&eacute;fono#%-echo%\'l-kebir#..031&ndash;650%#420&"42%#784%#932$&473631%%82681$&504186%%65418$&770439$%86341$*billingham',
+    '&#ven$%mavis%#bro$#pat#$/fax#$:000%%24024%*31-2252595%&41-946%"71%#932##agu$!l$!m$*ngiectasis',
+    '$$rana#%combe&!m\'*unications&!s#&deniya#.e&rehy;graphic*%vised$!-%&action&!d%+celebrities&\'oaching\'\'mmuting\'!n',
+    '%)generated%&images%\'kinetic%)marketing%$nova%(shopping&$mell&$tyle%(terminal&$rade%+visionaries$(ada-exec$!b%$anco\'$king',
+    '$%carte&)ster-knob+$type*#ing(#ing%%heric%$inco%%laims%-om-bundespost((deutsche()equipment\'+/birmingham\'$asia\'!m((uncation',
+    '-&ciones-*tion-based1,/information1#s**2(--widely3%based3\'related)"te\'*s-hardware)(supplier(#oft\')unicacion,%tions$$data%(iffusion',
+    '%#lex%#oto(!s%%usion$"ga%$ram.(7s/telexes/faxes/express(#tne\'&ph-boy*#ese*(operator*$pole*%wires+&orkers))/micropal',
+    '*&times/)"er+!s)$ique*&st/air,!s)#one$*kineticist&!s%&omindo\')unickacja*&kasyon&!n$\'l-kebir%#ink',
+    '$&machos&"gs&(nagement&\'rketers&#tic&!x%$edia&%nsaje&%ssage&%tered)!s%)onitoring\'$ster\'\'tecarlo%$undi',
+    '%"et%#git&#uty$(ocractic%%nomic%\'perator%$stei$"pa&&thetic(#ica)"se(!s%"en%/hone&rehy;heads)&\'-type',
+    '*$book*%calls*)directory*$hole.!s*\'network+%umber*(operator+%wning*&polled*\'selling,!t+$tyle*%table+*o-computer',
+    ')".9)$:031(#ics),ng-answering)#que)0st-receptionists+-/receptionist\'\'togenic)!s&"us%#ods&%rting%$rint)"ed&$ompt',
+    '&"te%\'ecorded&%vista%!i$$sale%\'cabbing&$ope-()ic-action+$lens%"ec%"ia%%pazio&/ectroradiometer%\'ystemes$#tec',
+    '\'"es%&herapy&%on\'90(!s%#ots%"ra\'"de\'$iner\'!k\')nsmission%)ype-style$$uts.$\'veision%$iews&"on',
+    '\'"es\')ion&mdash*&-based++documentary+(friendly+\'quality+\'station+\'trained\'"or\'$uals$&worked)!r\'"ld$%x/fax&.telegram/cable',
+    '$$zign##fax$$ener%"rs$,ord-designed(*shrewsbury($xxxx##gte#"ha#\'icherry$)don-based$$mena##kom#\'l&mdash*$;not',
+    '%\'nothing,4-but-know-everything%%table\'&le-tit%#why$\'ability&!s%\'foreign%%story$2ectual-philosophic%"es%&hallez%&r-ulam&$ault%"st',
+    '%#gan%\'n&ndash&$ella&%g-all(*them-to-go\'(ly-named\'!s&!s%&speros$&johann$"s.%"on$&urides%!s$%y-ads',
+    '&+impressions&&owning&*presenters(#obe&$tale%!a%!s##mar$!o%"nt#+net-derived#!o$\'genetic$)mere-like$"ne',
+    '#&ramund#$skyn#$text$%scher#&vision##xon#\'ynegion$!s#!z"*mafloxacin$"ir$$nite$%zepan#"be%$ling',
+    '$%urong%!s$!y#"co#(e-augama$$cula$!d$!l%#kov$$phos$$rary$#ssy%#var$"te$%zepan',
+    '$!c$!n$&rkanov$%yaveh##loc#\'minckii&$icki#$nota$"ye#\'ocillin#&p\'rate&!y$\'/acting$"=d$"el',
+    '&\'-\'women\'&mental\'\'tantrum&*a-on-panel+$wood\'!l\'&ments.\'(nce-ites+%style\'"ry\'!s\'*te-climate*(oriented*$zone)$ness',
+    '(#ues)$re-a-1nd-time-dependent,+composition.%ntrol,*increasing.%duced,(produced,(tolerant-&reated+!/,%depth,$high,$mean,$oven',
+    ',$time,+ventilation+6:74&deg&ndash;78&deg;f&"er&,o-mandibular&#ton%+st-mitchell\'\'/seaham\'#ina(#tes\'#oso\'(uousness$#ier%!o%$sque',
+    '&.te-independent\'#ing%-e(hartlepool)\'"s)&!-\'&centre-!s((omplexes)!x\'$form\'&gables\'(haunting\'@nugent-brydges-chandos-grenville\')precincts\')sculpture',
+    '($mith($tate(&ur-lot\'%tower&&corran&&fields&$gate&$hill&%meads&"pa&%state&$town\'!t&%ville%!i',
+    '%"um$"or&$aily\'!r(*ily-closed)!o()y-looking*&memory*&walled)&/fixed&#ise)"rs\'"ze&$rary&!y',
+    '&"ry&!s%!y$"s.$,tation-scene%+ing-looking&"on$"yo#&selves#&tories##uco$"ka"+n&rehy;hour)&minute*(onth-son',
+    ')(year-old##-14$%album$#bay\'"ed%&edroom+"ed%#out%\'y-eight\')four-inch$"cd%#ent(&imetre%%lient%%olumn',
+    '$&degree&$nier%$igit&)mensional&"sc%&rachma%\'welling$\'ell-oos%%m-bee$)feet-deep)$high%$ifty&"lm%)oot-thick(!s',
+    '%$ranc%&urlong$%gauge%%uinea$+handicapper%%orned%,undredweight$)inch-wide$#key%(ilometre-%-wide$&legged&$sson$$mark%%ember',
+    '&*tre-square%*illion-ton+#ths$#nil&.ne-eight&mdash%#ode$\'o\'clock$$page&"st($-six%&ences.&$rson%$iece&"nt&#tch',
+    '$&rouble\'$nder$\'section&#ven%$ided&\'xtieths%#pot%#tep&#one%&ubject$*thirty-ish&1ousand&rehy;franc,\'-dollar-$mile&%umbed',
+    '%!o&.-the-eightieth%$rack&#ial$\'warhead%%icket$,year-old-son,"er(%s-old+!n*(straight##.co#//fifteen/twenty#!a$-&rehy;ciously',
+    '$&cities$"ga$1ncies&mdash;traps))-in-chief&(y/rental%\'t&mdash&!\'&(-at-will\'\'farmers\'#led\'*management\'(occupied&$able&"es&$like',
+    '*%chief\'!.\'*/potential$#rio$$tive$#unt##bry#)cel/rayon#&d/upon$$ancy%!y$!e%!m%$ncia&$ding',
+    '(-ous&mdash;the%$r\'st&!-\'&clumsy\'&headed*(rtedness($ooks\'&minded&%hooks&$iser)!s\'"ze(#ing&$lean\'"y.',
+    '$%illas%$neae&(g-to-fat$\'on-like$&rement%)il-haired($like\'#lar\'"s.&(ng-based$"to$"ue#"ea%#tis$$bres',
+    '(#nis&)osissimus$"do&!s$#lla$*ment-lined$#ncy%"da&!i%"te&#ium$"ra%"by%"ic&#fe-',
+    '$#tts$!v$&zrouft#$g-fa$"en$!o$!u%"iz#"ia%!e$$ente%!u$!r$"sh#&minute',
+    '$#eco%$nhof%&sseans("e-*4arkansas-mississippi*%based%!t%#yex$$iels%&l&auml%,s-ball-sized\'$club(%ourts\'\'players\'&racket',
+    '\'$shoe&!.&&/bowls&%quick$!o$\'ysonian#!o$(chtitlan$#ner$&r-bass&\'players%"io&"st%(seductor$!s',
+    '$"us#&pences$#ins$#ole##rec$#iss#5se-mother/crying-baby%(/relaxed%$less&&y-held$%ility&"on%%ng-up%*on-fatigue)%illed',
+    '(#leg((reducing*%lease.#ing+&ieving)%idden((soothing((to-pitch($wise\'!.\')/personal(\'release*(solution()structure\'$less',
+    '\'"s.$\'kwatawa$)omethings#*t-covering%(dwelling%$hall\'&ngings&#old&&usband%$pegs%\'shrines%$wall$)acle-arms)\'bearing&\'ulitids',
+    '$&erborn&"ed&\'grounds&&hooked&#ing$-h-anniversary&\'fastest&%point&&ranked("te\'$ound&)strongest&&wicket%!e%"ly',
+    '$!o%"ni$#rek$.s-under-thatch#"ue%!s$(istrosis%!t$#kku$\'ousness$(re-track$"ta%!o#)y-dhurgon&%urgon',
+    '\'!s"&oboldo#$dori\'!u#%filio%#sto#-l&oacute;gica$$inde#*r&iacute;a$%descu$!i%"co#!s#/tihuac&aacute;n)#a/n',
+    '#"el$!r#&hillim#$ikin#(lenichev##nel#\'panyaki$&ennyse##ual$#hi\'"$ques$-ila-flavoured\'"na"-r-bin-a-fiene$)centenary',
+    '$$race$0terrib-b-ter-not#!a$"ce&#tte%$olus$#dam&#ta.$$flop(#per+!s(*s-boasting*$peak,)rformance$"no',
+    '$&skirts%"sa&!e$%togen)$esis)%icity&$saur$$watt(&-hours#$beek$&lanche$$orch%#ven$&utryne##cer',
+    '%!t$"ia#*ebratulids$(do-proof$"kh&"ov$"lj$&mengal$!n%!c%+gganu-based%$tius$#sas%%hkova%#ian',
+    '%#pol$!x$#zin#%fynan#&gether$*iversation$0oflex&rehy;light%(pleurals#"id$#ers$"ma$$stic#\'jheyden##ker#&lingen',
+    '#*m&amp;sub1,!2%\'mdash;a$"-a%*borrowings&&y-term%&length&%imits&#ong%%trend%$work$!/%%fixed%\'patent\'&(ermanent',
+    '$%ansen%!s%$ters$"es%!z$+inal-cancer)%flare)&strewn((/binding)%comms)2minicomputer-based("s.\'"ri\'+te-and-stay2)-resident',
+    ')"d.)"s.($ion.($or=0&!e&%iello&*ologically+!e&$tade&$uses\'!x%&tarium&\'e-mound(\'ravaged&"ic',
+    '$#oli$\'s&mdash+);drafting,%price%!-&"it&(pensions%\'/jargon%#_as#"na%"nt$"es%#tzi%!y$%ight.',
+    '#\'omolpos$%ntola#"pe%"ne&#oid)"al)!s$\'sichore#\'r-eeble%$ibly%%rific$\'a-cotta+!s%&cciano&\'e&mdash',
+    '($back,!s(%house-!s(\'plateau+#yer($type($walk*!y\'4/balconies-cum-decks((holmbyre\'"rs\'"s.&$hino&#ina',
+    '+(coloured+&finish+%style*%heads&%totta%(dawn.and%%firme&#orm)#ing%"il&"n.%%mares%&ne-but%%plane%%riums',
+    '\'"es%&torial+"ly%$watt%#zas&"za$\'ebanche%%orist%+strial.john%"ts%"us$+i&rehy;tory%%bilis)#tas&$l&gt',
+    '($ness\'"is%(er-cross%!f&%-hick&*ic-looking(!k\'!e()d-looking%"st%+torial/role+!e+\'ization+(ly-based)!o',
+    '(+y-defending*\'holders*%level*&owners$!m$"ns$#or\'&(-attacks\'&driven\'$free\'(inducing\'&ridden\'%sport(&ymbols\'\'tactics',
+    '&$dome&&gation&$ibus\'&sation("m\')(-related(\'t-cover*$held*(inspired*(training\'$ties(#ory&&tories&&vision%"ur',
+    '$!t$#ust$\'y-alike&(sounding%!e%&hoogan%"ll%!s#!s$#ane$(chelling$&teegen#"t-$*iary-butyl(!.',
+    '&"ty%!o$!s$#ull#%uhide&"ko$#tau##vet#&wijden%&lliger#%zetti$!i%!o$!o",s-ti-i-i-fyy',
+    '$+o-sponsored##fai#%hufin#!i#$laco#\'orababi#*saiohanues%"na$(ellating*#ons)"um%"ra\'%-like%$yman$#ide',
+    '%"li$"la$$onii#,t&rehy;match$#(s)$!-%/and-measurement%%bench&$ores%%cases&#ell&&opying%\'erected%$flew\'%ights',
+    '(#ing%*intestinal%#led%)marketing)#ing%(piloting&\'ressing-!s%\'reactor\'%lated&#igs&"un%&sailed&\'essions&\'trength',
+    '&#ype%&walked&%icket$&/alert%&modify%(revision$\'30root0*!1$$=6.7$$acea%*ment-based%!r&%ossas%"te&$oris',
+    '%%verde$$beds%)it/decode%$ooks$!d%$rill\'"ve$(ed&ndash&!.\'(research%1r-bottle-wielders\'&testee("op&\'/giesen&"to',
+    '$!i%%cally&%le(s)()-grabbing&&ularly%"er%!f&"ie("s.&%y-she%%monio("y.%&ng-out(%zones\'"ly',
+    '%#oni$$mant$!o%!f%"ri$\'s&mdash%!*%%.this%%cores%%laves$#udo$$wood&"rk"*t&rehy;ley#!-',
+    '$\'nically+(-induced&&zation\'"ed#%ebury$!n%$haul$$wsky#!h$)er-grazed&$ball&(ing-rope$3n&eacute;k&eacute;.$0ys/mediterranean#%iaroa',
+    '#$nall%$nger##ra-&&hydro.&#pak&&radial&)structure%&biblos&%orate&*romoethane%-chlorethylene*\'oethane.%ylene\'%ordon&$ubes',
+    '\'!s%+da&sacute;i&.ecanoylphorbol%%ether("yl%\'gastris&(nathinae&#ona(&orobus)%theca&$rams%%hedra*"ls*"ne)#ons',
+    '&-ydrobiopterin*+cannabinols1%varin+0hloride-hydrogen*1dicyclopentadiene*(thiophen%$ktys%$mers\'$ters(#hyl+0indocarbocyanine+)rhodamine+4tetraselenafulvalene&%isole&$mine',
+    '&%ychus%!o&%nidae+!.%&phylla&"od&"us&$ylon%&rchies&#ose%$stes\'$igma%$zzin$*is/columns\'$klax',
+    '$!o%#syl#&suichi%"ro%"yu#!t$"er&#ing$&igonia)$idae$$nang"\'u-hu-hu##cer$#hat%$tars',
+    '##fen#+k-teuk-teuk$%olsky$!u#$lade#!s##tch&"es$"en%!r&&-press$#his$$loff$"oa%&burger',
+    '%#nis$%sches#"vo"#van$!r#%ersal##fik#\'iothead$"so$"ta#&oedjre"-w/oxfordshire#%areka##dwr#$eles',
+    '##fiq#$ibly$!d$!t%!t#!l#$olde#!s$#dee#"ts""xa$"na$$pore\'!t$%rcana',
+    '$#s-1&$born&"el&\'fashion&$size\'$tyle&*to-montana%$.the%&/cajun&#sun#$eira$,l-ijsselmeer%#aar$$nsis$"re',
+    '#"on#$scan$"el#&t&copy%+lsqb;5&rsqb%*rehy;based$!\'$*-adventure&\'nalysis\'&d-data&\'rchives&)ttachment)\'tchment%$base&&y-text',
+    '&&opying%)databases&%riven%%files%(handling&#ung%,illustrative&\'mmanent&(ntensive%+linguistics%%maker&&ethods%2on-the-wall-as-art%*processors(&ducers',
+    '\'\'ceivers\'%lated%)searching\'&ntence%,to-hypertext%%world*!s&&riters$*/graphical%\'nothing%&source$\'a/textb$%book\'(\'-learnt)$type',
+    '(#ish$$face$"il&0e&rehy;dominated\'(-artisan(%based()exporting()machinery*$king*+nufacturing(*operatives)\'riented(*processing(\'related((to-foods',
+    '()warehouse)%orker\'(/fashion\'3s/clothing/footwear)0women/femininity$!j$+linguistics$)overdorum$#pac%#ert$%ratex%$onic(!x$"s.%+/textuality',
+    '$4ual&mdash;linguistic\'\'-sexual\'\'isation)!m)!t*!s(#zed\'+ly-oriented%#re.&%izers(#ing&#ous$"xx""ye#$fant',
+    '#$rnon#!u"!z#!a#)catlipoca#$iyev#$kare##pur!&f-104g#\'taffeta$*hermoflect"".1"\'e-731-3#!3""fs',
+    '$$230i#-ia-containing$!e$9ib-tbp-tfiiic-dna-complex"!n#%-&agr"$part#!l#!s"$sgen#!r""to!%g-300"$a(n)#"-3',
+    '#"te"!c#!c#!t"!d"&f-&bgr"0gatattagaaatttcc#%gatac"!m"!s"2taatgacaaaggcagtga$1tgggctgtatttattac",wu-dominated!0h&amacr;rp&amacr#*eacute;lin',
+    '+$dule+&logien+#rbe.!s+,vard-sur-mer*\'rapeute+%iault+%oigne+!y**s&eacute;e#)uuml;rmer"&\'abuse$\'rcadian%!t#$back',
+    '%!d%#lly%$tter$%rains%$each$&ustles#"ca%"me$(hampagne$"mj#+daydreaming$\'evil\'sh$#oes%#ing%"zy',
+    '#&expect%&terior#%faith%#ncy$#eet%#nce$#low$$unds#,gallivanting%#tes%"ve$#ets$#oes%&odness%!t',
+    '#&habits%)lf-witted%"nd%!s%"te$#ead&"rd$"it#&inward$$ongo##job#%learn&"ve%#vel$#ine',
+    '%#ves$$oose#\'managed&$ners%$ster$&easure$#ind%$ssus$#ost$&uscles#$near%"ed%"xt##old$%tchin',
+    '$&ockets%&rridge#%resta$#ibs$#oad#\'scratty$\'ervants$#how$"it%"ze$#ome$%pleen$$tays%&rength&&ipping',
+    '#&taking$%hinks$%icket$#old$&rouble$"wo&&-faced#-understanding#\'varmint#$wait%"lk%#nts%!s%(terfront$#hat',
+    '%!n"$-e-n#$rich#$self#&th-th-(#ank(#ere%#ing\'&sulate&!s%%ought"!."!/#"pb""1-',
+    '"-2-stimulating"!4"!6""a%#\'&iuml;s$%ndash##\'rt$"sh#!a$#lik#"ba$"et$#ong$&yinnyu#/ccomplisshement',
+    '$%karay%)eray-like&$ways#!d$"en#&elmann$#rbe#"ge#\'i-based%(cambodia&)ontrolled%(japanese%)kampuchia%(language\'%otian',
+    '&$tyle%\'vietnam$(/chinese%*indonesian$!d%"id\'"ae)"-a%"us$%lands$)n/shelter%%stone$$rith%!s##kat',
+    '&"ar$$keth$&orbhai$#ral&!r#.l-ik-troy-days$!a%#mas%#ssa(%emias(%rctos\'#ina\'\'okratia("ma%$tine',
+    '$!e$"go&&-mince$"li&&um-208$#weg#*mbetolepis%\'ipillai&$raja%!y$"en%\'s-based(#lue&$/bbc&.127-1328.105.8',
+    '&$vong*!*$%nomys$$pson#\'n&mdash$!\'$(-working$".a%$your$%/less$(10000000%$2ins%!4$"30$"_a',
+    '%!s&#sis%&tician&(ological%$vuth$!b$&digudi$%ehood$.g&rehy;orodrim%!a%!e%"ue$#iah$*k&rehy;you%#\'ee',
+    '%%erton%!i&$ngly%&lessly)$ness%!q%#s_a\'$ever%0youthankyouthank(@verymuchforallyouhavedonegoodbye$!n$%omile%+topractical$#quo$!y',
+    '$2sigargin-sensitive#%rakan%%waddy$#eed$!g$"in$!k%"as$"pu$\'rawaddy$%suinn$$unka#%sians$"sh%"it',
+    '#*t&mdash;in+$just+#you%\'pound;s$"\'e%!s&$-all\'%right&&_up_to&(ocialism&!s%#til$#-as%#but%(contrast',
+    '%$half%#ism%\'joining%%mania(!y%\'parents&$eter&$lace%$they&(ime-only%8which-dwells-in-darkness&#ill$#.as%"no%#the',
+    '&#hen$$/and%"he&#igh%$jobs%#rob%"u/$(:britain$!_%#all%\'because&!y%%er_is%)from_time%\'in_,_in',
+    '&!n&"ut%(together$!a%"ny%#way(!s$&cfinds%\'h-stone&\'ed-roof\'+r-and-after)$bush)(devotees*(ominated)#era',
+    '(#.he(&/major)(speaking($ella($iana)!i)(te-style($like(%omics$&herism$+leukotriene%#ong$)modernist%"rs$#orn',
+    '%#uch$"th&"ey$!z##ukt$#mas\'#ite&#tin\'%ology(%urgos\'%urgas*$ical+"st$"ng&#yin',
+    '#)w-mounted%%water$$akib$#rah#$xter#"ya$"ed$"ne$"re"#cac"+e&acirc;tre$0eacute&acirc;tre$$lsqb((;ir&rsqb$\'ndash;e',
+    '*\'parents$)pound;30m$/rehy;changeover#0(&pound;766,000)$%epic)$%real)#$-art$$bank%<oy-stood-on-the-burning-deck%\'uilding$#cab&Jrving-of-mahogany-to-fit-the-cami-knickers%)ommission&*smological&"ws',
+    '&)ustaceans$$data&!y%#oor$!e%"-e%\'conomic%4nd-of-the-millennium%!r$&factor&$rmer%%ields%#ood%(reeholds&"om',
+    '%#lee%(raveyard$)headlands&,ro-as-artist%&orizon\'$rors&Juse-in-the-valley-where-the-yew-trees-grow$%knife$$list&$ttle$+man-as-poet(/who-is-the-poet&#rsh%%iddle%Gost-important-film-star-of-the-nineties',
+    '%$ther$,participants%$lace%\'resence&&isoner$&rapist%#isk%#ole&#yal$%savoy%#lot%\'oughing%%piral%.tripe-repeated&)umpy-tail',
+    '%"he\'!y%#ime\'%idity%$otal%%roops%"wo$\'ukraine$$wind%2oman-in-the-street#*.anonymous$#bay%\'uilding$)financial&#rst',
+    '$&little$\'monster$#oil%#nce&"es$&police&&ssible%&rocess$#usa$)varieties#$/for#%08.30#$140k$#561$$880s',
+    '#*_,_part_of$"ad%!t$"in$(light_of$,ma&icirc;tre$\'part_of$&status#+a-josephine$!a$$ceae$#dom$%genes$#ker%%stone',
+    '$%ngela$!r%%about$%tened\'!s&&r-bred(&de-lys(,erneuerungen(\'journal%#ine&#ron%#re\'\'.-/supper-goers()and-music(%based',
+    '(\'capital)&urtain(%dance)%undee(%group($like)%oving(&making(*of-the-air(+productions(\'tickets)\'raining*%olley)#ype\'%/film',
+    '\',card/friends\'$pack\'&vision&2ical-machiavellian*%_tour*\'isation+$ties+#zes*)ly-minded&&ograph\'%phone%"um$\'udience#!b$%erton',
+    '#"ca%!e$(odonians(!t#!d$!e$*ifferences%0spossessed(1974)$#ric#"e\'$\'-ay-tah%#day$!.$"ar$$eerm',
+    '$"re$#ves%#ish#%fbian$)irst-ever%"sh$$oros$"t\'%(-murders&)resistant%%/loss%!o#&genius$%ither$$naby',
+    '#!h$&ealthy%"re#!i$"de$"le&!r\'"ia($osis%&heimer$!m%!s$(ncidence%(istokles%\'tensity',
+    '%"\'/%!-%$.303&)expertise%#for%%s-had&+/themselves&!e$!s%"m\'$#ves#$jamb$"ob%#int$$umbo',
+    ')!e$#lae#(lanthera$"en%#vel$#ion%#ver$$lier%%usson$"mo$&netham$(odontida&"us$#ton$%veton',
+    '#(m&dollar%)mdash;and+$even+!i,!n+$mena+(normally+$that-!e-$ough+#you%*rehy;swept$!*$*-\'murrells%(although',
+    '%"it%#not%\'perhaps%\'slowing%$they$#.46%(although%%chris%"go%$mike%#the(!y$$/dem$&:sorry%*wheelchair',
+    '$"_a&"ll&!s%&by_way%"on&#ver$!a%#nia%!p%*tic-driven)#map,#per()/rhematic($ized\'&sation',
+    '$"ba$"e\'%%-city&#pub)!s&\'setting&%tunes%&/topic&#you%$dium%#lis%"s.&\'/theses%#tal&+eorological',
+    '&&tokies)%leian+&s-saga$#mos$\'nselves$(odynamic%"re$"se&!l\'"f.\'0ves&mdash;nature1#the4!y*!.+$even',
+    '*$/are+)reinforce%$lves$$usic#$n&gt%,mdash;cannot+\'overpay$$-and&(rthritic&\'spiring&(vailable%$boss&)urgeoning(#sar%#cbs',
+    '%(deserted%(existing%*girlfriend%\'manager&!p%%needy\'!w&\'obodies*!y%0outra&rehy;geous%\'popular\'-st-burgeoning&(resident%&remote%\'slowest',
+    '%#the(!y&#iny&#old%\'unknown\'*nannounced\'%usual%&vacant&&ibrant$#.as%$come%$just%#the$#/he$&_along',
+    '$$ault$!b$#eck$$ford$!i%#ger%"um$#ken%#ing$$ness$%ormal$\'seforth$%umber#/o-chronological%)something',
+    '%)romifolia$\'cracies$#der%&olites&\'re-ford(#tus\'(ic-story\'!o("us\'!u&%ssiou%$ulph$&fraste$&gnidea$&kratie',
+    '+&martyr(,cally-minded)!o**-political\'"ue$\'monoism$"ne%%omous$&pening&"ra%%hanes("ic&"il&$oric$#rbe',
+    '&%matic&!t\'!i(-cal-political+,/ideological+&ly-in-0&formed.(possible-#_at)#ism)+o-political(#zed*!s%"ic\'"al',
+    '\'#s\'\'(\'-in-use(!.)!g&#que&#ser\'#ts.&$zers\'$ings%"y\'&!-\'(builders\'\'crammed\'&driven\'+independent',
+    '\'&makers(&oulded\'*neutrality\'$part\'*specialist\'\'testing\'\'unladen&!.&)/feminist\'(practice&%laden#\'patient$%ellet$$hoto$&ick-up',
+    '$"3e$#ald%%menes%"ns%$pees\'$ntic\'$utae)!e),ic-educative&$ised()t-patient)\'/healer&#sid&&ueitic\'#tic',
+    '%#sia$%bligs%!y$*e&mdash;he,#see,#the./irdly&mdash;the.$ough,#you&)rehy;fore%#\'as&\'s_a_few%)-approach&#but&#has',
+    '&!i&"on\'&pening&$room&#set&#was\'$ould%$.can&"in&$many&"on&"we%!/&&arises&%reach',
+    '%1_are_a_great_many\'&s_soon)$well&#for&(in_front&"no%*afterwards&"nd&"py%#bye%!d%&ereere%(ferendum&,ore_anything&)requently',
+    '%"ll%$mins%$over%&sa/fly&+e&mdash;and.!i&(ianstadt\'\'enstadt%\'through%$vnto%#was&%ithal%"ze$%field$*ianthropic',
+    '&%iidae%#ght%!n%(omorphic%"sk$%lands$"m-&&a-rest,"\'r($stor&%knife%%acell&%flash&(l-bonded(&guided',
+    '(2oxide-reprocessing(\'seeking\',ly-activated*&heated*\'induced\'$wear&!n&#tex%"ex%%guard%$isol%"o-\'\'ceramic\'\'dynamic\'(electric',
+    '\'$king\',luminescence\'%motor\'%outer\'*regulatory\'&stable&#bia&\'chromic\'%lines\'&ompact((nduction($pper("re&)dynaamics&(electric',
+    '\'$loat(#uid\'$orce)#med*!s&%genic\'$rams)&phical(#ill&%karst&&lactal*"yl\'#ite\'$ysis&-meter-reading',
+    '*!y&\'neutral\'$ukes&&philic,!/*#ous(%yllic\'$olae\'%ylaes&*regulative(&manent&\'s-flask\'#afe\'(ensitive\'&pheres',
+    '\'!t(+at-setpoint*!.&$tron%%uthis%$wood$)nistokles$#ris%!s%!y$#sby#*s&eacute;e$&arurus%$ural\'!o',
+    '$/e&mdash;bearing.#ing%$-may\'(emorable&%p2645&&spells&+uninsulated%".4&#are&"ps%(/curious&&skills%/_in_conjunction%$days%(s/themes',
+    '&(s-legend$$igar&+er/explorer%%mpler%6s-antithesis-synthesis\'%based\'%entry$&melves%,ophoriazusai$\'pianism&$enne*!s%%rotia$.salon&imacr;ke%%elves',
+    '#+ta&amp;sup1-!2%+iotaomicron%\'tronics$,ford/malvern$!i%!p$$otal$%talos$"wo$!y#$udas$!k$%nisse$&rgists',
+    '#%venot%"ry$"oz#"wh$"ir$#les%,is/community$!s#!x#%y\'are%"ll%(re&mdash\'!e%!v%#zre',
+    '%&bother%;can-run-but-they-can\'t-hide%Adon\'t-make-\'em-like-that-any-more%%might%"re%$were&#ill$!.%$need%$will$,/them/their/("se%"we$%_sort$%aalso',
+    '%"re$$cost$"ll$#r\'e%&argues$&selves%&poketo$#tdo$$want%$ould"+forthcoming"!h#!e"+i&eacute;ry#"-1',
+    '$"ra$!t$,umont-fleury#;baut-des-br&ucirc;l&ecirc;s$%eault$&odeaux$#ron#.ck&rehy;necked%(-bearded(!d\'%odied(&ttomed\'&rained&(carpeted&#ear',
+    '&&formed&\'grained&$head&$knit&&legged\'%inked&&napped&%oiled&$pile&&ribbed&+skulledness\'%prung\'&talked(%emmed(%uffed',
+    '\'&runked&\'waisted\'%itted\'&risted%&coming%#ear&&ning_a&(r-walled\'(/thinner&(st-soled&\'t&mdash\'#ing%"ie\'!s%*ly-bearded',
+    '((carpeted((forested(&haired()impastoed(&lashed(&wooded%)ness/body*)frequency)#es.%!y#&ebault$&f-like&%proof&)resistant&%taker',
+    '%!.$(lenplatz&!r$\'namycin%!e%$haus%%thong$$ring%"no%*ornamentik%#sch$!u$%ves.n\')/ununited%"in',
+    '#%ggers$-h&rehy;length%&-bones(#ots&\'cuisses&%thick((rottling%"ed%#ful%(s/bottom%!y$#pen#%irene#"le$"ia',
+    '#\'mbalina%(le-fulls(\'glasses(\'rigging\'"by\'$like$&erosal*(-induced$!i#+n&mdash;and$$-air%&backed%+cotton-clad&(urtained\'!t',
+    '&%nough%\'flanked\'%eshed%&haired%$line%&necked\'"ss%&on-top%)pencilled%*shouldered&%oiled&&talked\'%emmed%%thigh$#dwa',
+    '%!s$)g&mdash;a,#now,#she&)rehy;like',
 )
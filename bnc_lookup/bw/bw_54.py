@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_54 = (
+count_54 = 6694
+
+heads_54 = (
     'status-oriented',
-    'status-player',
-    'status-promoting',
-    'status-rankings',
-    'status-related',
-    'status-seekers',
-    'status-specific',
-    'status-symbols',
-    'status-then',
-    'status.6',
-    'status/on-loan',
-    'status28',
-    'status_in',
-    'statusful',
-    'statut-ory',
-    'statuta',
     'statute-book',
-    'statute-designated',
-    'statute-law',
-    'statute-making',
-    'statutes.',
-    'statutorily-entrenched',
-    'statutory-based',
-    'statutory/quasi-regulatory',
-    'statview',
-    'statwell',
-    'statworks',
-    'staub',
-    'staubi',
-    'staubli',
-    'stauce',
-    'stauding',
     'staues',
-    'stauffer-bern',
-    'staunch-thighed',
-    'staunches',
-    'staunchless',
-    'staunford',
-    'staunton-on-wye',
-    'staunton/gloucestershire',
-    'staurday',
-    'staurday.',
-    'stauro',
-    'stauss',
-    'stautche',
-    'stava',
-    'stavby',
-    'stavdene',
     'stave-diving',
-    'stavedene',
-    'stavitsky',
-    'stavne',
-    'stavordale',
-    'stavov',
-    'stavridi',
-    'stavropoi',
-    'stavropopalopuladis',
-    'stavroula',
-    'staw&rehy;berry',
-    'staward',
-    'stawell',
-    'stawinski',
-    'stawkis',
-    'stawski',
     'stax-happy',
-    'stax/atlantic',
-    'stax/volt',
-    'stay&lsqb;s&rsqb',
-    'stay&mdash;perhaps',
-    'stay\'',
-    'stay-awakes',
-    'stay-cool',
-    'stay-in-touch',
-    'stay-maker',
-    'stay-makers',
-    'stay-on',
-    'stay-slim',
-    'stay-true',
-    'stay-tus',
-    'stay-warm',
     'stay-well',
-    'stayd',
-    'stayed.',
-    'stayeth',
-    'stayin',
-    'stayley',
-    'staymaker',
-    'stayman',
-    'stayres',
-    'staysharp',
-    'stayt/lorry',
-    'stayte/former',
-    'stayte/wife',
-    'stayton',
-    'stazi',
-    'stazioni',
     'stazzer',
-    'stb&mdash;state',
-    'stc-616w',
-    'stcokton',
-    'std\'s',
-    'std.',
-    'std825-829',
-    'stdman.002',
-    'stdman.003',
-    'stdx',
-    'stdy',
-    'ste&uuml;ren',
-    'ste-adresse.',
-    'ste-claire',
-    'ste-croix',
-    'stead.',
     'steadfastly-traditional',
-    'steadham',
-    'steadicam',
-    'steadily-decreasing',
-    'steadily-expanding',
-    'steadily-growing',
-    'steadily-larger',
-    'steadily-rising',
-    'steading\'',
-    'steadman-hawkins',
-    'steady-',
-    'steady-eyed',
-    'steady-flowing',
-    'steady-gravity',
-    'steadyish',
-    'steagall',
     'steak-an\'-kidney',
-    'steak-knife',
-    'steak-red',
-    'steaker',
-    'steale',
-    'stealed',
-    'stealeing',
-    'stealing-and',
-    'stealing.',
-    'stealite',
-    'stealth/mitsubishi',
-    'steam&rehy;baths',
-    'steam&rehy;operated',
-    'steam&rehy;or',
-    'steam&rehy;powered',
-    'steam&rehy;rolling',
     'steam-',
-    'steam-age',
-    'steam-and-gravity',
-    'steam-based',
-    'steam-baths',
-    'steam-boats',
-    'steam-boiler',
-    'steam-carriages',
-    'steam-charter',
-    'steam-clean',
-    'steam-coal',
-    'steam-coated',
-    'steam-collecting',
-    'steam-compatible',
-    'steam-diesel',
-    'steam-engined',
     'steam-generators',
-    'steam-groove',
-    'steam-haulage',
-    'steam-hauled.',
-    'steam-heat',
-    'steam-heat-only',
-    'steam-house',
-    'steam-iron',
-    'steam-jacketed',
-    'steam-jacketing',
-    'steam-laden',
-    'steam-mill',
-    'steam-palace',
-    'steam-pipes',
-    'steam-plough',
-    'steam-presses',
     'steam-pumps',
-    'steam-radio-stanley-holloway-meets-flanders-',
-    'steam-rollering',
-    'steam-shovel',
-    'steam-slick',
-    'steam-smeared',
-    'steam-style',
-    'steam-town',
-    'steam-traction',
-    'steam-trains',
-    'steam-tug',
-    'steam-up',
-    'steam-worked',
-    'steam-wreathed',
-    'steam-xxxx',
-    'steam/convected',
     'steam/electric',
-    'steam/lego',
-    'steamboating',
-    'steamcleaner',
-    'steamer-landings',
-    'steamer-quays',
-    'steamer_out',
-    'steamheated',
-    'steamie',
-    'steamin\'',
-    'steaminess',
-    'steaming-up',
-    'steamingly',
-    'steampunk',
-    'steamraiser',
-    'steamrooms',
     'steamshovels',
-    'steamy-ish',
-    'steamy-shrill',
-    'steanbow',
-    'steanson',
-    'stear',
-    'steares',
-    'stearmans',
-    'stearo',
-    'steatorrhea',
-    'steb&aacute;n',
-    'stebbings',
-    'stebbings/wildlife',
-    'stebson',
-    'stechelberg',
-    'steckler',
     'steckmest',
-    'stedcombe',
-    'stedefast',
-    'stedelijke',
-    'stedfastly',
-    'stedham',
-    'stedlijk',
-    'stedlock',
-    'steeghs',
-    'steekit',
-    'steel&ndash;liner',
-    'steel&ndash;making',
-    'steel&rehy;workers',
-    'steel*',
-    'steel-',
-    'steel-against-steel',
     'steel-and-plexiglass',
-    'steel-and-soot',
-    'steel-arched',
-    'steel-band',
-    'steel-bands',
-    'steel-based',
-    'steel-billet',
-    'steel-black',
-    'steel-built',
-    'steel-caped',
-    'steel-casting',
-    'steel-clad',
-    'steel-closure',
-    'steel-cutter',
-    'steel-designed',
-    'steel-eyed',
     'steel-fingered',
-    'steel-frame',
-    'steel-furnaced',
-    'steel-gray',
-    'steel-headed',
-    'steel-hulled',
-    'steel-jacketed',
-    'steel-legged',
-    'steel-lined',
-    'steel-on-steel',
-    'steel-on-stone',
-    'steel-panelled',
-    'steel-plated',
-    'steel-pointed',
-    'steel-prowed',
-    'steel-rope',
     'steel-runners',
-    'steel-scale',
-    'steel-sharp',
-    'steel-shattering',
-    'steel-shuttered',
-    'steel-spiked',
-    'steel-sprung',
-    'steel-stemmed',
-    'steel-toed',
-    'steel-tough',
-    'steel-trap',
-    'steel-tube',
-    'steel-work',
-    'steel-worker',
-    'steel-workers',
-    'steel/concrete',
     'steel/lambourn',
-    'steel/trader',
-    'steel72',
-    'steele/family',
-    'steeler',
-    'steelestown',
-    'steeley',
-    'steelface',
-    'steelhammer',
-    'steelhead',
-    'steelheel',
-    'steelier',
-    'steelite',
-    'steelmaker',
-    'steelman',
-    'steelmasters',
     'steelmen',
-    'steelmill',
-    'steelon',
-    'steelth',
-    'steelwell',
-    'steely-blue',
-    'steely-eyes',
-    'steely-grey',
-    'steely-haired',
-    'steely-hard',
-    'steelyard',
-    'steenbeek',
-    'steenberg',
-    'steenhuis',
-    'steenis',
-    'steenkolen',
     'steenson',
-    'steenwyk',
-    'steep&rehy;blind',
-    'steep&rehy;sided',
-    'steep-angled',
-    'steep-banked',
-    'steep-flowing',
-    'steep-gabled',
-    'steep-roofed',
-    'steep-walled',
-    'steepe',
-    'steepelchasing',
-    'steepian',
-    'steepie',
-    'steepin\'',
-    'steepings',
     'steeple-cab',
-    'steeple-chaser',
-    'steeple-chasers',
-    'steeple-hooded',
-    'steeple-like',
-    'steeplechased',
-    'steeplechases',
-    'steeply-banked',
-    'steeply-coombed',
-    'steeply-inclined',
-    'steeply-pitching',
-    'steeply-rigged',
-    'steeply-rising',
-    'steeps',
-    'steepways',
-    'steer/commanding',
     'steer/labour',
-    'steerage-changes',
-    'steerage-drill',
-    'steerers',
-    'steerina',
-    'steering-angle',
-    'steering-boxes',
-    'steering-briefs',
-    'steering-wheel-type',
-    'steerio',
-    'steeros',
-    'steetley-tarmac',
-    'steetley/tarmac',
-    'steetly',
-    'steev',
-    'steeven',
     'steevens',
-    'stef-and-hugo',
-    'stefan-boltzmann',
-    'stefan_so',
-    'stefanak',
-    'stefandis',
-    'stefanek',
-    'stefanel',
-    'stefanick',
-    'stefanidis',
-    'stefaniensaal',
-    'stefanina',
-    'stefanis',
-    'stefano.courage',
-    'stefanovi&cacute',
-    'stefanovicz',
     'stefanowicz/competitor',
-    'stefanus',
-    'stefenel',
-    'steffel',
-    'steffensmeier',
-    'steffes',
-    'steffi-crazy',
-    'steffie',
-    'steffisburgstrasse',
-    'steffy',
-    'stefik',
-    'stefnir',
-    'stege',
-    'stegeman',
-    'steggle',
-    'stegm&uuml;ller',
     'stegosauruses',
-    'stegs',
-    'stegsman',
-    'stehura',
-    'steid',
-    'steif',
-    'steig',
-    'steigen',
-    'steigenbergerhof',
-    'steijger',
-    'steilhang',
-    'steimle',
-    'stein/fowler',
-    'steinam',
-    'steinbacher',
-    'steinbauer',
     'steinbergers',
-    'steinbruner',
-    'steindachner',
-    'steinenes',
-    'steinenii',
-    'steiners',
-    'steinfels',
-    'steingberg',
-    'steingesser',
-    'steingladstone',
-    'steinhardts',
-    'steinhouse/friend',
-    'steinie',
-    'steinitzian',
-    'steinle',
-    'steinman',
     'steinski',
-    'steintrager',
-    'steir',
-    'steis',
-    'stekel',
-    'stekenjokk',
-    'stel',
-    'stela',
-    'stelen',
-    'steles',
-    'steleth',
-    'steletsky',
-    'stell-ar-ta',
-    'stellablaze',
-    'stelladine',
-    'stellariaefolia',
     'stellatus',
-    'stellenbosh',
-    'stelleri',
-    'stelleroidea',
-    'stellex',
-    'stelline',
-    'stellingwert',
-    'stellman',
-    'stellung',
-    'stellwaag',
-    'stellwegg',
-    'stelton',
-    'stelux',
-    'stelzmann',
-    'stem+affix',
-    'stem-cell',
     'stem-cutter',
-    'stem-group',
-    'stem-miners',
-    'stem-rotting',
-    'stem-tip',
-    'stemetil',
-    'stemhead',
-    'stemmatics',
-    'stemme',
-    'stemmed\'',
-    'stemmer',
-    'stemmy',
-    'stempein',
-    'stems.',
-    'stemsheets',
-    'sten-gun',
     'stena-sealink',
-    'stenalees',
-    'stenaulorhynchus',
-    'stenbury',
-    'stenchful',
-    'stenciled',
-    'stencillizing',
-    'stenella',
-    'stenga',
-    'stengel',
-    'stenger',
-    'stength',
-    'stenkrith',
-    'stenner',
-    'stenning.',
-    'steno',
     'stenobothrus',
-    'stenocephala',
-    'stenographed',
-    'stenographers',
-    'stenography',
-    'stenomus',
-    'stenonychosaurus',
-    'stenorhynchus',
-    'stenothecoids',
-    'stenothermic',
-    'stenotopic',
-    'stenotopy',
-    'stenotypic',
-    'stensi&ocirc',
-    'stensland',
-    'stensnaes',
     'stensness',
-    'stenters',
-    'stentor',
-    'stentorian-lunged',
-    'stentoriously',
-    'stenura',
-    'step&lcub',
-    'step&rehy;grandmother',
-    'step&rehy;relationships',
-    'step-aerobics',
-    'step-and-scan',
-    'step-antic',
-    'step-aunt',
-    'step-child',
-    'step-compliant',
-    'step-cutting',
     'step-dame',
-    'step-dancing',
-    'step-daughters',
-    'step-fathers',
-    'step-free',
-    'step-grandchild',
-    'step-granddaughter',
-    'step-granddaughters',
-    'step-grandfather',
-    'step-length',
-    'step-little',
-    'step-neck',
-    'step-out',
-    'step-p-e',
-    'step-relations',
-    'step-sibling',
     'step-siblings',
-    'step-sister-to-be',
-    'step-skippin\'',
-    'step-sons',
-    'step-stoning',
-    'step-stool',
-    'step-stools',
-    'step-uncle',
-    'step-ups',
-    'step.angle',
-    'step.the',
-    'step/half',
-    'stepanek',
-    'stepankov',
-    'stepby-step',
-    'stepday',
     'stepfather-daughter',
-    'stepford',
-    'stepframe',
-    'stepgrandmothers',
-    'stephanandra',
-    'stephanas',
-    'stephanes',
-    'stephania',
-    'stephanoaetus',
-    'stephanodiscus',
-    'stephanoi',
-    'stephanopolous',
-    'stephanos',
-    'stephant',
-    'stephanum',
-    'stephanuriasis',
     'stepheni',
-    'stephens-on-the-cliff',
-    'stephens/families',
-    'stephens/pa',
-    'stephens/raf',
-    'stephens/solicitor',
-    'stephenson.',
-    'stephenson/connolly',
-    'stephenson/p',
-    'stephenson/thames',
-    'stepherd',
-    'stephon',
-    'stepin',
-    'stepkids',
-    'stepler',
-    'steplessly',
     'stepmother\'s',
-    'stepmother-she',
-    'stepout',
-    'stepp&lsqb;ed&rsqb',
-    'stepparent',
-    'stepparents-in-law',
-    'steppe-lands',
-    'steppe-like',
-    'stepped&rehy;up',
-    'stepped_out',
-    'stepper-motors',
-    'stepping&rehy;off',
-    'stepping-backwards',
-    'stepping-down',
-    'steppings',
-    'steps-down',
     'steps.in',
-    'steps/min',
-    'stepsd',
-    'stepson-in-law',
-    'stept',
-    'stepulvage',
-    'stepway',
-    'steraloids',
-    'sterazin',
-    'sterbak',
-    'sterberrkunde',
-    'stercoranus',
-    'stercorariidae',
-    'stercoria',
-    'sterculia',
-    'sterdship',
     'stereo&rehy;typical',
-    'stereo-cassette',
-    'stereo-chemical',
-    'stereo-controlled',
-    'stereo-isomerism',
-    'stereo-quality',
-    'stereo-ready',
-    'stereo-regularity',
-    'stereo-related',
-    'stereo-selective',
-    'stereo-types',
-    'stereo/mono',
-    'stereo/tv/vhs',
-    'stereoacuity',
-    'stereochemical',
-    'stereochemically',
     'stereocontrol',
-    'stereodiagrams',
-    'stereograms',
-    'stereographics',
-    'stereographs',
-    'stereoisomer',
-    'stereoisomeric',
-    'stereoisomerism',
-    'stereonets',
-    'stereopair',
-    'stereophoner',
-    'stereophonically-internal',
-    'stereophony',
-    'stereoprofilometry',
-    'stereopticon',
-    'stereopticons',
     'stereoscopically',
-    'stereoscopy',
-    'stereoselective',
-    'stereospecifically',
-    'stereostrips',
-    'stereotaxically',
-    'stereotypies',
-    'stereotypifications',
-    'stereoview',
-    'stereovision',
-    'sterically',
-    'sterie',
-    'sterile-naturalistic',
-    'sterile-towel-covered',
-    'steriliserin',
-    'sterilises',
     'sterimberg',
-    'steriod',
-    'steriods',
-    'steriolithography',
-    'steriotis',
-    'steriseal',
-    'sterk',
-    'sterke',
-    'sterlands',
-    'sterlet',
-    'sterling&mdash;us&dollar=g&pound;0.6191',
-    'sterling+2',
-    'sterling-deutschmark',
-    'sterling-holders',
-    'sterling-related',
-    'sterling-type',
     'sterling/',
-    'sterling/deutschmark',
-    'sterlitamak',
-    'sterlitomak',
-    'stern(3)',
-    'stern-cabin',
-    'stern-castle',
-    'stern-featured',
-    'stern-gerlach',
-    'stern-mounting',
-    'stern-sheets',
-    'stern-sounding',
-    'stern/bob',
-    'stern/partridge',
-    'sternbergea',
-    'sternberger',
     'sternbergs',
-    'sterness',
-    'sternfaced',
-    'sternhold',
-    'sternigov',
-    'sterninae.',
-    'sternites',
-    'sternless',
-    'sternly-held',
-    'sterno-cleido-mastoid',
-    'sternocleido-mastoid',
-    'sternocoxals',
-    'sternopleura',
-    'sternopleurite',
-    'sternorrhynchan',
-    'sternotomy',
     'sternsheets',
-    'sternum-ceiling',
-    'sternwards',
-    'sternwheeler',
-    'sternwood',
-    'stero',
-    'steroid-free',
-    'steroid-induced',
-    'steroid-injected',
-    'steroid-treated',
-    'steroid.',
-    'steroidal',
-    'steroisomer',
-    'sterol-binding',
-    'steromicroscope',
-    'sterotyped',
     'sterotypical',
-    'sterr',
-    'sterreggov',
-    'sterring',
-    'sterrit',
-    'sterrs',
-    'sterry/vet',
-    'stertorously',
-    'stertorousness',
-    'sterzi',
-    'stesia',
-    'stesso',
-    'stetch-pole',
-    'stetchford',
-    'stetham',
-    'stethem',
     'stethescope',
-    'stetigkeit',
-    'stetin',
-    'stetsasonic',
-    'stettiner',
-    'stettinius',
-    'steuerle',
-    'steul',
-    'steumer',
-    'stevanage',
-    'steve\'',
-    'steve/prisoner',
-    'steven/east',
-    'stevengraph',
-    'stevens/drummer',
-    'stevens/garden',
     'stevens/labour',
-    'stevens/managing',
-    'stevens/manufacturing',
-    'stevens/neighbour',
-    'stevens/publican',
-    'stevens/rangers',
-    'stevens/thames',
-    'stevens/trail',
-    'stevenson-eisenhower',
-    'stevenson/harrier',
-    'stevenson/keri',
-    'stevenstown',
-    'steveo',
-    'steves',
-    'stevis',
-    'stevka',
     'stew-blot',
-    'stew-crock',
-    'stew-pan',
-    'steward/stewardess',
-    'stewarde',
-    'stewards/stewardesses',
-    'stewart-cleary/malvern',
-    'stewart-david',
-    'stewart-hunter',
-    'stewart-richardsons',
-    'stewart-wilson',
-    'stewart.i',
-    'stewart/cambuslang',
-    'stewart/contestant',
-    'stewart/director',
-    'stewart/featured',
     'stewart/jones',
-    'stewart/nacro',
-    'stewart/parent',
-    'stewart/peter',
-    'stewart/physiotherapist',
-    'stewart/sovereign',
-    'stewart/vet',
-    'stewartby',
-    'stewartia',
-    'stewartis',
-    'stewarts-melville',
-    'stewarts/crazy',
-    'stewsides',
-    'stewy',
-    'stey',
-    'steynbergh',
     'steyr-mannlicher',
-    'stfw',
-    'stg&pound;1.07',
-    'stg&pound;105',
-    'stg&pound;191.4',
-    'stg&pound;200.1',
-    'stheeman',
-    'sthenelaidas',
-    'stibbington',
-    'stibbles',
-    'stic',
-    'sticgridloc',
-    'stichbury',
-    'stiches',
-    'stichill',
-    'stichmass',
     'stichosome',
-    'sticht',
-    'stichum',
-    'stichwort',
-    'stick-and-carrot',
-    'stick-and-dog',
-    'stick-and-rudder',
-    'stick-figure',
-    'stick-head',
-    'stick-in-the-muddish',
-    'stick-in-the-muds',
-    'stick-insect',
-    'stick-licking',
-    'stick-maker',
-    'stick-man',
-    'stick-microphone',
     'stick-mikes',
-    'stick-nest',
-    'stick-pinned',
-    'stick-signals',
-    'stick-that-in-your-pipe-and-smoke-it',
-    'stick-waving',
-    'stickado',
-    'stickback',
-    'sticked',
-    'sticker.',
-    'stickered',
-    'stickey',
-    'stickford',
-    'stickful',
-    'stickied',
-    'stickin\'',
     'stickin-the-mud',
-    'sticking-place',
-    'sticking-points',
-    'sticking_out',
-    'stickingplaster',
-    'sticklebacking',
-    'sticklebacks.',
-    'sticklen',
-    'sticklepath',
-    'stickler/observer',
-    'stickmen',
-    'stickpinned',
-    'stickroth',
-    'sticks-man',
-    'sticks/skewers',
-    'stickstorm',
     'stickum',
-    'stickwork',
-    'sticky&ndash',
-    'sticky-out',
-    'sticky-palmed',
-    'sticky-paper',
-    'sticky-rubber',
-    'sticky-taped',
-    'sticky-tipped',
-    'sticky-wet',
-    'sticky.',
-    'stickyout',
-    'stiction',
-    'stiebel-stein',
-    'stiedry',
-    'stief',
     'stieher',
-    'stielike',
-    'stierman',
-    'stifel',
-    'stiff&rehy;lipped',
-    'stiff-and-starchy',
-    'stiff-bodied',
-    'stiff-brimmed',
-    'stiff-collared',
-    'stiff-corseted',
-    'stiff-framed',
-    'stiff-in-the-saddle',
-    'stiff-kneed',
-    'stiff-leaf',
-    'stiff-like',
-    'stiff-locked',
     'stiff-looking',
-    'stiff-soled',
-    'stiff-tails',
-    'stiff-upper-lipped',
-    'stiff-upper-lips',
-    'stiffed',
-    'stiffelio',
-    'stiffer-shafted',
-    'stiffies',
-    'stiffle',
-    'stiffly&mdash;constanza',
-    'stiffnecked',
-    'stifford',
-    'stifftails',
-    'stiffupperlippians',
-    'stift',
     'stiftsbibliothek',
-    'stifyn',
-    'stig&rehy;ma',
-    'stiger',
-    'stigioglomerus',
-    'stigmatism',
-    'stigmatogobius',
-    'stigmatomyces',
-    'stike',
-    'stikhi',
-    'stikkes',
-    'stilbene',
-    'stilboestrol',
-    'stiled',
-    'stilehall',
-    'stiletto-bearing',
     'stiletto-clad',
-    'stiletto-pointed',
-    'stiletto-wearing',
-    'stilfragen',
-    'still&mdash;americans',
-    'still&rehy;large',
-    'still\'',
-    'still-active',
-    'still-alive',
-    'still-bitter',
-    'still-bleeding',
-    'still-blossoming',
-    'still-blue',
-    'still-burning',
-    'still-cameras',
-    'still-clear',
     'still-compulsory',
-    'still-daylight',
-    'still-deafening',
-    'still-declining',
-    'still-deserted',
-    'still-determined-to-bust-the-fucker',
-    'still-dimpled',
-    'still-distant',
-    'still-earth-grimed',
-    'still-echoing',
-    'still-empirical',
-    'still-enduring',
-    'still-enormous',
-    'still-eulogised',
-    'still-evolving',
-    'still-existent',
     'still-experimental',
-    'still-extant',
-    'still-faithful',
-    'still-falling',
-    'still-familiar',
-    'still-fiddling',
-    'still-fresh',
-    'still-full',
-    'still-gaoled',
-    'still-got',
-    'still-greater',
-    'still-human',
-    'still-hysterical',
-    'still-immature',
-    'still-important',
-    'still-imprisoned',
     'still-incomplete',
-    'still-insensible',
-    'still-insurgent',
-    'still-irresistible',
-    'still-larger',
-    'still-light',
-    'still-lingering',
-    'still-liquid',
-    'still-literate',
-    'still-locked',
-    'still-lower',
-    'still-married',
-    'still-maturing',
-    'still-mildness',
-    'still-moist',
-    'still-moving',
     'still-narrow',
-    'still-neutral',
-    'still-occupied',
-    'still-outstretched',
-    'still-palpitating',
-    'still-picture',
-    'still-popular',
-    'still-potent',
-    'still-practising',
-    'still-private',
-    'still-quivering',
-    'still-rarefied',
-    'still-recognisably',
-    'still-resident',
-    'still-rooms',
-    'still-ruined',
     'still-saintly',
-    'still-scanty',
-    'still-secret',
-    'still-seeming',
-    'still-shapely',
-    'still-shuddering',
-    'still-simmering',
-    'still-skeletal',
-    'still-sleepy',
-    'still-sloppy',
-    'still-slumbering',
-    'still-smouldering',
-    'still-spinning',
-    'still-stuffy',
-    'still-talking',
-    'still-throbbing',
     'still-to-be-created',
-    'still-traceable',
-    'still-unannounced',
-    'still-unavailable',
-    'still-unbeaten',
-    'still-undiscovered',
-    'still-unexplained',
-    'still-unknown',
-    'still-unpacked',
-    'still-unresolved',
-    'still-unspent',
-    'still-upright',
-    'still-valid',
-    'still-vexed',
-    'still-visible',
-    'still-waiting',
     'still-watered',
-    'still-waters-run-deep',
-    'still-wet',
-    'still-wild',
-    'still-withering',
-    'still-young',
-    'still/',
-    'still_in',
-    'stilla',
-    'stillaci',
-    'stillage',
-    'stillatus',
-    'stillborn.',
-    'stillborns',
-    'stilleth',
-    'stillexpanding',
     'stillkrauth',
-    'stillyans',
-    'stilson',
-    'stilstead',
-    'stilt&rehy;like',
-    'stilt-makers',
-    'stilt-sandpiper',
-    'stilt-walking',
-    'stiltedness',
-    'stiltmen',
-    'stilts.',
-    'stiltwalk',
-    'stiltwalkers',
-    'stilty',
-    'stilus',
-    'stimm',
     'stimme',
-    'stimmer',
-    'stimpfig',
-    'stimsons',
-    'stimulability',
-    'stimulae',
-    'stimulants/addiction',
-    'stimulated/mindblown',
-    'stimuli.',
-    'stimultaneous',
-    'stimultaneously',
-    'stimulus-array',
-    'stimulus-information',
-    'stimulus-recognition',
-    'stimulus-reinforcer',
-    'stimulus-synonymous',
     'stina',
-    'stinaed',
-    'stinc',
-    'stinchar',
-    'stine',
-    'stinehour',
-    'sting\'',
-    'sting-',
-    'sting-ray',
-    'stingaree',
-    'stingebags',
-    'stingel',
-    'stingemore',
-    'stingemore/competitor',
-    'stinging-cell',
-    'stinging-nettles',
     'stingose',
-    'stingray/thunderbirds',
-    'stink-bombed',
-    'stinkbombs',
-    'stinkier',
-    'stinkiest',
-    'stinkingly',
-    'stinko-paralytico',
-    'stinkpot',
-    'stinkwaves',
-    'stinkwood',
-    'stinky-winky',
-    'stinston',
-    'stint-type',
-    'stinted.',
-    'stipendary',
     'stiperstones',
-    'stipites',
-    'stipitis',
-    'stipular',
-    'stipulatio',
-    'stipulation(s)',
-    'stipulative',
-    'stir&rehy;fried',
-    'stir-crazy',
-    'stir-crazy\'',
-    'stir-fries',
-    'stirfry',
-    'stirik',
-    'stirling-american',
-    'stirling-based',
-    'stirling-designed',
     'stirling-falkirk',
-    'stirlingfauld',
-    'stirlingshire-based',
-    'stirn',
-    'stirp',
-    'stirred-up',
-    'stirred:jones',
-    'stirrer-up',
-    'stirrick',
-    'stirrid',
-    'stirring-up',
-    'stirring/dull',
-    'stirrup-cups',
-    'stirrup-handles',
-    'stirrup-holding',
-    'stirrup-jars',
     'stirrup-leather',
-    'stirrup-style',
-    'stisted',
-    'stistically',
-    'stitch-holes',
-    'stitch-in-time',
-    'stitch-ups',
-    'stitch-work',
-    'stitchcombe',
-    'stitched-in',
-    'stitched-out',
-    'stitched-up',
-    'stitchers',
-    'stitches-in-waiting',
-    'stitchin\'',
-    'stitchings',
     'stitherstones',
-    'stitton',
-    'stitzel',
-    'stiva',
-    'stivens',
-    'stiwdio',
-    'stix',
-    'stjemquist',
-    'stjohn',
-    'stk',
-    'stkm2000',
-    'stlg1.8m',
-    'stlg10.8m',
-    'stlg12.2m',
-    'stlg13m',
-    'stlg14.1m',
     'stlg2.5m',
-    'stlg2.8m',
-    'stlg2m',
-    'stlg3m',
-    'stlg475,000',
-    'stlg5.5m',
-    'stlg5.9m',
-    'stlg500.000',
-    'stlg5m',
-    'stlg6.5m',
-    'stlg6m',
-    'stlg7.4m',
-    'stlg75,000',
-    'stlg8.6m',
-    'stlg9',
-    'stlg9.3m',
     'stlgm',
-    'stma20700',
-    'stma23800',
-    'stmt-lamps',
-    'stmulation',
-    'stndrd',
-    'stoated',
-    'stobaeus',
-    'stobb',
-    'stobinian',
-    'stobo',
-    'stobooms',
-    'stoborough',
-    'stobshiel',
-    'stobswell',
-    'stobswood',
     'stochastics',
-    'stochiometric',
-    'stochiometry',
-    'stock&ndash;taking',
-    'stock&rehy;brokers',
-    'stock\'',
-    'stock*',
-    'stock-',
-    'stock-adjustment',
-    'stock-basket',
-    'stock-bowler',
-    'stock-breeders',
-    'stock-building',
-    'stock-checker',
-    'stock-checking',
-    'stock-cube',
     'stock-dove-size',
-    'stock-farming',
-    'stock-feed',
-    'stock-forecasting',
-    'stock-getter',
-    'stock-killing',
-    'stock-marketing',
-    'stock-option',
-    'stock-outs',
-    'stock-picking',
-    'stock-pile',
-    'stock-piles',
-    'stock-piling',
-    'stock-price',
-    'stock-rigging',
-    'stock-takes',
     'stock-trading',
-    'stock-whip',
-    'stock.at',
-    'stock/aitken/waterman',
-    'stock/delivery',
-    'stock/england',
-    'stock/letcombe',
-    'stock/wine',
-    'stock_',
-    'stockaree',
-    'stockarton',
-    'stockbag',
-    'stockboker',
-    'stockbreeders',
-    'stockbreeding',
-    'stockbridge.',
     'stockbroker-belt',
-    'stockbroker-film',
-    'stockbrook',
-    'stockbuild',
-    'stockburn-on-tees',
-    'stocker/wildlife',
-    'stockers',
-    'stockerston',
-    'stockfeed',
-    'stockfish',
-    'stockford/head',
-    'stockforth',
-    'stockhach',
-    'stockhandling',
-    'stockhill',
-    'stockholm\'-style',
     'stockholms',
-    'stockiemuir',
-    'stockill',
-    'stockin',
-    'stockin\'',
-    'stocking-filling',
-    'stocking-top',
-    'stocking-tops',
-    'stocking/oxford',
-    'stockingfillas',
-    'stockingford',
-    'stockinggut',
-    'stockingless',
-    'stockish',
-    'stockists/page',
-    'stockjobber',
     'stockkeeper',
-    'stockkfishe',
-    'stockkman',
-    'stocklake',
-    'stockland',
-    'stockmanship',
-    'stockmarket-listings',
-    'stockmarket-punting',
-    'stockmarket-support',
-    'stockmayer',
-    'stockout',
-    'stockpak',
-    'stockperson',
-    'stockport.',
-    'stockporte',
-    'stockpots',
     'stocks-in-trade',
-    'stockscrapers',
-    'stocksheets',
-    'stockstill',
-    'stocktakings',
-    'stockton&ndash;darlington',
-    'stockton-darlington',
-    'stockton-on-',
-    'stockton-upon-tees',
-    'stockton.',
-    'stocktonians',
-    'stocktons',
-    'stockwell/manager/oxford',
-    'stockwell/womens',
-    'stockwhip',
-    'stod',
     'stodes',
-    'stodgill',
-    'stodgily',
-    'stodmarsh',
-    'stoeckel',
-    'stoeckle',
-    'stoed',
-    'stoekl',
-    'stoelting',
-    'stoemp',
-    'stoeps',
-    'stoerhead',
-    'stoeung',
-    'stoever',
-    'stoffagers',
-    'stohlgren',
     'stohner',
-    'stoia',
-    'stoian',
-    'stoiber',
-    'stoic&rehy;christian',
-    'stoical-witty-rueful',
-    'stoically-not-giggling',
-    'stoichedon',
-    'stoicheion',
-    'stoichiometrical',
-    'stoichiometrically',
-    'stoichiometries',
-    'stoichos',
-    'stoinking',
-    'stoires',
-    'stoitchov',
     'stojalowski',
-    'stoke&rehy;on-trent',
-    'stoke-',
-    'stoke-d\'urbervilles',
-    'stoke-jewington',
-    'stoke-mandeville',
-    'stoke-newington',
-    'stoke-on&mdash;trent',
-    'stoke-sub-hamdon',
-    'stoke-upon-trent',
-    'stoke/oxfordshire',
-    'stoke1',
-    'stokeholder',
-    'stokes/king',
-    'stokes/macintyre',
-    'stokesay',
     'stokeses',
-    'stokesley-based',
-    'stokewatchford',
-    'stokey',
-    'stokie',
-    'stokkan',
-    'stokle/victim',
-    'stoklosa',
-    'stol&eacute;ru',
-    'stol\'n',
-    'stolarska',
-    'stolarski',
-    'stolarzy',
-    'stolata',
-    'stolatae',
-    'stolberg',
     'stolen-to-order-theft',
-    'stolen.the',
-    'stolen.two',
-    'stoley',
-    'stolfus',
-    'stolle',
-    'stollen(s)',
-    'stollercoaster',
-    'stollery',
-    'stolley',
-    'stollhaus',
-    'stollinger',
-    'stollman',
-    'stollting',
-    'stoln',
-    'stolnes',
     'stolon',
-    'stoloniferous',
-    'stolph',
-    'stolports',
-    'stols',
-    'stoltzer',
-    'stomach&rehy;churning',
-    'stomach-churningly',
-    'stomach-clenching',
-    'stomach-clutchingly',
-    'stomach-dropping',
-    'stomach-located',
-    'stomach-pit',
-    'stomach-spin',
-    'stomach-turningly',
-    'stomach-twisting',
     'stomach-wise',
-    'stomach/belly',
-    'stomachchurning',
-    'stomachics',
-    'stomatitis',
-    'stomich',
-    'stommeln',
-    'stompalongs',
-    'stompin\'',
-    'stompo',
-    'stompy',
-    'stondeth',
-    'stone&ndash',
-    'stone&rehy;flagged',
-    'stone-a-second',
-    'stone-and-earth',
     'stone-and-tree',
-    'stone-and-wattle',
-    'stone-arched',
-    'stone-blind',
-    'stone-bridge',
-    'stone-carts',
-    'stone-carving',
-    'stone-choosing',
-    'stone-cladding',
-    'stone-cleaning',
-    'stone-cold-sober-seeming',
-    'stone-coloured',
-    'stone-crop',
-    'stone-crushing',
-    'stone-cults',
-    'stone-cut',
     'stone-cutting',
-    'stone-face',
-    'stone-filled',
-    'stone-flux',
-    'stone-founded',
-    'stone-fronted',
-    'stone-giant',
-    'stone-headed',
-    'stone-heart',
-    'stone-henge',
-    'stone-look',
-    'stone-merchant',
-    'stone-milling',
-    'stone-mute',
-    'stone-numb',
-    'stone-on-stone',
     'stone-pillared',
-    'stone-pitching',
-    'stone-pounding',
-    'stone-proof',
-    'stone-quarry',
-    'stone-quarrying',
-    'stone-rows',
-    'stone-silent',
-    'stone-skittering',
-    'stone-slinging',
-    'stone-slips',
-    'stone-smelling',
-    'stone-still',
-    'stone-stilted',
-    'stone-throw',
-    'stone-thrower',
     'stone-tipped',
-    'stone-until',
-    'stone-veined',
-    'stone-wall',
-    'stone-wallers',
-    'stone-webb',
-    'stone-wigg',
-    'stone-wrought',
-    'stone-yard',
-    'stone/daughter',
-    'stone/head',
-    'stone/manageress',
-    'stone/musician',
-    'stone/oxford',
-    'stone/project',
-    'stone/public',
     'stone/venichka',
-    'stoneacre',
-    'stoneage',
-    'stonearched',
-    'stoneballs',
-    'stonebird\'',
-    'stoneborough',
-    'stonebreakers',
-    'stonecarver',
-    'stonechats.',
-    'stonechipper',
-    'stonechips',
-    'stonechuckled',
-    'stonecot',
-    'stonefalls',
-    'stoneflagged',
     'stonehall',
-    'stoneheads',
-    'stonehenges',
-    'stonehills',
-    'stonelike',
-    'stonely-webb',
-    'stoneman-hunter',
-    'stones-ian',
-    'stonesmason',
-    'stonethrower',
-    'stoneto',
-    'stonewallers',
-    'stonewares',
-    'stonewashing',
-    'stoneway',
-    'stoneworking',
     'stoney/winner',
-    'stoneyards',
-    'stoneyford',
-    'stoneyhill',
-    'stoneythorpewonder',
-    'stoneywell',
-    'stonger',
-    'stonings',
-    'stonne',
-    'stony-broke',
-    'stony-eyed',
-    'stony-iron',
-    'stony-irons',
-    'stony-seeded',
-    'stony-visaged',
-    'stonybrook',
     'stonyhearts',
-    'stoo',
-    'stood\'st',
-    'stoode',
-    'stoodleigh',
-    'stoodley',
-    'stoody',
-    'stoody-west',
-    'stooge-like',
-    'stooged',
-    'stooges-meets-beefheart',
-    'stooges.',
-    'stookey',
-    'stools/wk',
-    'stoom',
-    'stoon',
     'stoop-backed',
-    'stoop-kneed',
-    'stooped-muttering',
-    'stoor',
-    'stop&dollar',
-    'stop\'',
-    'stop-all-wars',
-    'stop-and-go',
-    'stop-and-start',
-    'stop-at-home',
-    'stop-breaker',
-    'stop-deleted',
-    'stop-ended',
-    'stop-her',
-    'stop-lights',
-    'stop-list',
     'stop-microsoft',
-    'stop-offs',
-    'stop-order',
-    'stop-out',
-    'stop-press',
-    'stop-presses',
-    'stop-probably',
-    'stop-punched',
-    'stop-punching',
-    'stop-rate',
-    'stop-rot',
-    'stop-signs',
-    'stop-smoking',
-    'stop-stop',
-    'stop-the',
-    'stop-time',
     'stop-ux',
-    'stop-watches',
-    'stop-you',
-    'stop/starts',
-    'stop/till',
-    'stop/tuffin',
-    'stopcheck',
-    'stopforde',
-    'stopher',
-    'stoplight',
-    'stoplists',
-    'stopp&eacute;d',
-    'stoppa',
-    'stoppani',
-    'stopped-flow',
-    'stopped-out',
     'stopped-up',
-    'stoppel',
-    'stopper-inner',
-    'stopping-down',
-    'stopping-off-point',
-    'stopping-train',
-    'stopping-up',
-    'stoppingly',
-    'stopporte',
-    'stopps',
-    'stops-he',
-    'stopt',
-    'stor',
-    'storage-racks',
-    'storage-room',
-    'storage-type',
     'storage/cooking',
-    'storage/retrieval',
-    'storage/serving',
-    'storageserver',
-    'storagetek-designed',
-    'storandt',
-    'storani',
-    'storao',
-    'storax',
-    'stordy',
-    'store-address',
-    'store-and-control-register',
-    'store-and-forward',
-    'store-building',
-    'store-cupboards',
-    'store-flanked',
     'store-front',
-    'store-houses',
-    'store-opening',
-    'store-owners',
-    'store-place',
-    'store-room-of-secrets',
-    'store-yard',
-    'store.pieces',
-    'store.richard',
-    'store/sale',
-    'storebought',
-    'storecupboards',
-    'stored-up',
-    'storefronts',
-    'storehouse.',
-    'storeman/mechanical',
     'storeprimary',
-    'storerequesttimout',
-    'storeroom-cum-gallery',
-    'stores-all',
-    'stores-buildings',
-    'stores.bulbs',
-    'storesecondary',
-    'storewall',
-    'storey-colonnaded',
-    'storey-gibson',
-    'storey-moore',
-    'storey/county',
-    'storfj&auml;llet',
-    'storhund',
-    'stories-within-stories',
-    'stories.',
     'stories/histories',
-    'storingham',
-    'storioni',
-    'stork/the',
-    'storkyrkan',
-    'storm&ndash',
-    'storm-avoidance',
-    'storm-battened',
-    'storm-battered',
-    'storm-beach',
-    'storm-beat',
-    'storm-blown',
-    'storm-blue',
-    'storm-bound',
-    'storm-centre',
-    'storm-charged',
     'storm-direction',
-    'storm-filled',
-    'storm-fractured',
-    'storm-free',
-    'storm-frequencies',
-    'storm-front',
-    'storm-generated',
-    'storm-god',
-    'storm-harbours',
-    'storm-hit',
-    'storm-induced',
-    'storm-lantern',
-    'storm-lash',
-    'storm-nagy',
-    'storm-ravaged',
-    'storm-rinsed',
     'storm-shortened',
-    'storm-signals',
-    'storm-silver',
-    'storm-station',
-    'storm-style',
-    'storm-swollen',
-    'storm-tracking',
-    'storm-water',
-    'stormay',
-    'stormcock',
-    'stormes',
-    'stormf&uuml;hrer',
-    'stormin',
-    'stormont-based',
-    'stormonth-',
-    'stormridden',
     'stormrider',
-    'stormshield',
-    'stormtroop',
-    'stormwinds',
-    'storr/consultant',
-    'storrar',
-    'storrs-fox',
-    'stortford-based',
-    'story\'',
-    'story-',
-    'story-ballet',
-    'story-board',
-    'story-board-like',
-    'story-building',
-    'story-continuity',
-    'story-contracted',
     'story-cube',
-    'story-cycle',
-    'story-documentaries',
-    'story-hearing',
-    'story-hours',
-    'story-hunting',
-    'story-land',
-    'story-listeners',
-    'story-maskelyne',
-    'story-reading',
-    'story-showing',
-    'story-so-far',
-    'story-vanessa',
-    'story-wise',
-    'story-writing',
-    'story.',
     'story/',
-    'story:7.30am',
-    'story_as',
-    'storybook-by-henty',
-    'storybook-guide',
-    'storybook-his',
-    'storytell',
-    'storyteller\'',
-    'stosic',
-    'stoten',
-    'stotesbury',
-    'stoth',
-    'stotter/victim',
-    'stotties',
-    'stottin\'',
-    'stotting',
     'stotty',
-    'stouffe',
-    'stoughton.',
-    'stoung',
-    'stoup\'',
-    'stourdale',
-    'stourgeon',
-    'stourpaine',
-    'stout-bodied',
-    'stout-made',
-    'stout-sticking',
-    'stout-stowers',
-    'stoutest-billed',
-    'stouthearted',
-    'stoutie',
-    'stoutism',
     'stoutist',
-    'stoutly-built',
-    'stoutly-defended',
-    'stoutz',
-    'stove-blacking',
-    'stove-enamel',
-    'stove-fiddles',
-    'stove-fronts',
-    'stove-like',
-    'stoven',
-    'stoves/heaters',
-    'stoving',
-    'stoviold',
-    'stovold',
-    'stovolosov',
-    'stow-cum-quy',
     'stowable',
-    'stoward',
-    'stowell-brown',
-    'stowjowski',
-    'stowlugs',
-    'stowne',
-    'stowridge',
-    'stowting',
-    'stoyil',
-    'stoyle',
-    'stoys',
-    'stprm',
-    'str&ndash;tegy',
-    'str&ouml;bel',
-    'str&ouml;mgren',
-    'str&ouml;vt&aring;g',
     'str&uuml;big',
-    'strabane-based',
-    'strac',
-    'strach(1.9)',
-    'strach-dol',
-    'strach.gif.uu.z',
-    'strach/batty',
-    'strach/mgt',
-    'strach/rocky',
-    'stracha',
-    'strachan-batty-mcallister-speed',
-    'strachan-like',
-    'strachan/mc',
-    'strachan/mcallister',
-    'strachan/milton',
-    'strachan/wilko',
     'strachanesque',
-    'strachesque',
-    'straciatella',
-    'strad',
-    'strada/ritmo',
-    'stradag',
-    'stradas',
-    'stradbrook',
-    'straddle-leg',
-    'strader',
-    'stradun',
-    'straet',
-    'straf',
-    'strafe-bombed',
-    'straffed',
-    'straffing',
     'strafpatent',
-    'strage',
-    'stragegies',
-    'stragegy',
-    'straggly-maned',
-    'straho',
-    'straight-across',
-    'straight-acting',
-    'straight-arm',
-    'straight-arming',
-    'straight-arrow',
-    'straight-at',
-    'straight-away',
-    'straight-back',
-    'straight-back-over-the-shoulder',
-    'straight-bearded',
     'straight-boned',
-    'straight-bridged',
-    'straight-brim',
-    'straight-cut',
-    'straight-down-the-line',
-    'straight-driven',
-    'straight-driving',
-    'straight-drove',
-    'straight-edged',
-    'straight-edges',
-    'straight-eyed',
-    'straight-facing',
-    'straight-guy',
-    'straight-haired',
-    'straight-head',
-    'straight-jackets',
     'straight-leg',
-    'straight-liberal-plank',
-    'straight-lined',
-    'straight-lining',
-    'straight-man',
-    'straight-not',
-    'straight-on',
-    'straight-ruled',
-    'straight-sawn',
-    'straight-skirted',
-    'straight-spined',
-    'straight-trunked',
-    'straight-up-and-down',
-    'straight-winged',
-    'straight.a',
-    'straight/shiny/side&rehy;parted',
     'straightahead',
-    'straighted',
-    'straightend',
-    'straightened-out',
-    'straightfor&rehy',
-    'straightforward&mdash;and',
-    'straightforward\'',
-    'straightforward-technological',
-    'straightforward.i',
-    'straightjacketed',
-    'straightjackets',
-    'straightlaced',
-    'straighttalking',
-    'straightup',
-    'straigtened',
-    'strain-dependent',
     'strain-on-your-meat-pies',
-    'strain-style',
-    'strain-time',
-    'strain-wire',
-    'strain.',
-    'straining.continue',
-    'strains.',
-    'strainthning',
-    'strait-waistcoat',
-    'straite',
-    'straition',
-    'straitjacket&rehy;ing',
-    'straitjacketing',
-    'straitly',
-    'straitness',
-    'straitsteps',
     'straked',
-    'strakencz',
-    'straker-welds',
-    'stralak',
-    'stralauer',
-    'stramberk',
-    'strambotti',
-    'stramming',
-    'stran',
-    'stran&rehy;gers',
-    'stranach',
-    'stranahan',
-    'stranathro',
-    'strande',
-    'stranded/fallen',
-    'strandhotel',
     'strandley',
-    'strandli-goal',
-    'strandli/forrester',
-    'strandline',
-    'strandon',
-    'strands.',
-    'strands/',
-    'strange-smelling',
-    'strange-style',
-    'strange-tasting',
-    'strange/milton',
-    'strangehold',
-    'strangel',
-    'strangely-clad',
-    'strangely-deserted',
-    'strangely-named',
     'strangely-shaped',
-    'strangely-twisting',
-    'strangenesses',
-    'stranger-danger',
-    'stranger/when',
-    'strangers_en',
-    'strangest-looking',
-    'strangeways.here',
-    'strangle-tight',
-    'strangle-voiced',
-    'strangleweed',
-    'strangulate',
-    'straniera',
-    'stranks',
-    'stranorlar',
-    'stranraer/jailed',
     'strantia',
-    'stranton&ndash;west',
-    'strap&ndash;across',
-    'strap-button',
-    'strap-cum-aerial',
-    'strap-end',
-    'strap-ends',
-    'strap-iron',
-    'strap-line',
-    'strap-on-dildo',
-    'strap-work',
-    'straphylococcal',
-    'strapiron',
-    'straplock',
-    'strappado',
-    'strapped-in',
     'strapped-on',
-    'strappin\'',
-    'strappings',
-    'straps/wipe',
-    'strasbourgeois',
-    'strasburger',
-    'straskiewicz',
-    'strassburg',
-    'strassera',
-    'strassman',
-    'straszny',
-    'strat-bodied',
-    'strat-lover',
-    'strat-orientated',
-    'strat-sound',
-    'strat-tee-o-tays',
     'strat-tone',
-    'strat/nice',
-    'strata-only',
-    'stratagemata',
-    'stratch',
-    'strate',
-    'strategemata',
-    'strategic-investment',
-    'strategic-line',
-    'strategic-metals',
-    'strategic/systemic',
-    'strategic/tactical',
-    'strategics',
-    'strategies/processes',
-    'strategiia',
-    'strategize',
     'strategy-formulation',
-    'strategy-formulators',
-    'strategy-maker',
-    'strategy-management',
-    'strategy-proof',
-    'strategy-setting',
-    'strategy.',
-    'strategy/',
-    'strategy/criteria',
-    'strategy/strategic',
-    'strategy/taxation',
-    'stratex',
-    'stratford-',
-    'stratford-wolverton',
-    'stratford/northamptonshire',
-    'stratfordian',
     'stratfords',
-    'strathaim',
-    'strathairn',
-    'strathan',
-    'strathaven-based',
-    'strathavon',
-    'strathclyde-wide',
-    'strathearne',
-    'strathkelven',
-    'strathkinness',
-    'strathloch',
-    'strathmores',
-    'strathnasheallah',
-    'strathspeys',
-    'strathtummel',
-    'strathtyrum',
     'strathy',
-    'stratifications',
-    'stratigrapher/sedimentologist',
-    'stratilates',
-    'stratiomyid',
-    'stratiotes',
-    'strato-spool',
-    'stratocaster-like',
-    'stratocaster-type',
-    'stratocones',
-    'stratocruisers',
-    'stratofortress',
-    'stratofortresses',
-    'stratoites',
-    'strator',
-    'stratosphear',
     'stratosphere-scraping',
-    'stratosphere-troposphere',
-    'stratosphere.',
-    'stratotone',
-    'stratovolcano',
-    'stratten',
-    'strattord-upon',
-    'stratty',
-    'stratzenburg',
-    'strau',
-    'straubing',
-    'straun',
-    'straunge',
-    'strauss-bashing',
-    'strauss-schiller',
-    'strauss/liszt/mendelssohn',
     'strausses',
-    'straussfurt',
-    'stravaig',
-    'stravaigs',
-    'stravinksy',
-    'stravinskian',
-    'stravinskys',
-    'straw-banning',
-    'straw-based',
-    'straw-bedded',
-    'straw-brick',
-    'straw-chopping',
-    'straw-clutcher',
-    'straw-clutching',
-    'straw-fired',
-    'straw-hats',
     'straw-like',
-    'straw-paper',
-    'straw-plaiters',
-    'straw-plaiting',
-    'straw-poll',
-    'straw-roofed',
-    'straw-tailed',
-    'straw-thatch',
-    'straw-topped',
-    'straw-weight',
-    'straw-yellow',
-    'strawberries-and-cream-tea',
-    'strawberry-and-cream',
-    'strawberry-blond',
-    'strawberry-eating',
-    'strawberry-filled',
     'strawberry-growing',
-    'strawberry-pink',
-    'strawberry-scented',
-    'strawberry-stained',
-    'strawbnerries',
-    'strawbridge',
-    'strawgate',
-    'strawhorn',
-    'strawplaiters',
-    'strawshoes',
-    'strawsons',
-    'strawy',
-    'stray-cat',
-    'straydenyg',
-    'strayhead',
-    'strayt',
     'strba',
-    'strbny',
-    'streaking-then',
-    'streakings',
-    'streaklines',
-    'streaky-breasted',
-    'stream-based',
-    'stream-baseflow',
-    'stream-driven',
-    'stream-laid',
-    'stream-ofconsciousness',
-    'stream-pattern',
-    'stream-required',
-    'stream-two',
-    'stream-washed',
-    'stream-water',
     'stream-waters',
-    'streambank',
-    'streamer-throwing',
-    'streamer/dual',
-    'streamfeeding',
-    'streamier',
-    'streamingly',
-    'streamport',
-    'streams/rivers',
-    'streamselect',
-    'strean',
-    'streator',
-    'streatorrhoea',
-    'streckov',
-    'stredoceska',
-    'stree&mdash',
     'streeets',
-    'streelish',
-    'streem',
-    'streepish',
-    'streepowoman',
-    'street&mdash',
-    'street&mdash;beyond',
-    'street&mdash;the',
-    'street&ndash;cambridge',
-    'street&rehy;corner',
-    'street&rehy;directory',
-    'street&rehy;lights',
-    'street&rehy;you',
-    'street\'',
-    'street-and-smithy',
-    'street-arabs',
     'street-artists',
-    'street-bottoms',
-    'street-boy',
-    'street-brawl',
-    'street-cars',
-    'street-cleaners',
-    'street-comer',
-    'street-corners',
-    'street-cred',
-    'street-cry',
-    'street-doors',
-    'street-driving',
-    'street-drop',
-    'street-ends',
-    'street-festival',
-    'street-fight',
     'street-fights',
-    'street-fuls',
-    'street-gambling',
-    'street-gang',
-    'street-gangs',
-    'street-grid',
-    'street-handsome',
-    'street-hastings',
-    'street-hawker',
-    'street-irony',
-    'street-justice',
-    'street-life',
-    'street-located',
-    'street-market',
-    'street-musicians',
-    'street-names',
     'street-norwich',
-    'street-pals',
-    'street-pamphlet',
-    'street-parties',
-    'street-perrott',
-    'street-photographer',
-    'street-photography',
-    'street-plan',
-    'street-plans',
-    'street-poet',
-    'street-porter-pal',
-    'street-portman',
-    'street-produced',
-    'street-rap',
-    'street-seller',
-    'street-selling',
     'street-side',
-    'street-singer',
-    'street-skinned',
-    'street-slang',
-    'street-soliciting',
-    'street-sound',
-    'street-squads',
-    'street-stalling',
-    'street-stalls',
-    'street-suss',
-    'street-time',
-    'street-to-screen',
-    'street-tough',
-    'street-trader',
-    'street-trades',
-    'street-traffic',
     'street-urchin',
-    'street-vending',
-    'street-victor',
-    'street-visible',
-    'street-warfare',
-    'street-when',
-    'street-window',
-    'street-woman',
-    'street.a',
-    'street.baby',
-    'street.p/36/',
-    'street/bell',
-    'street/eldorado',
-    'street/gloucester',
-    'street/kings',
-    'street/london',
     'street/northamptonshire',
-    'street/sandport',
-    'street/selector',
-    'street/station',
-    'street/york',
-    'street:it',
-    'street_as',
-    'streetcleaner',
-    'streetcrime',
-    'streetduke',
-    'streeters',
-    'streetes',
-    'streetfair',
-    'streetfighters',
-    'streetfighting',
-    'streetlighting',
     'streetly',
-    'streetnames',
-    'streetphone',
-    'streetplan',
-    'streets-full',
-    'streets.villagers',
-    'streetsmart',
-    'streetsounds',
-    'streetsville',
-    'streetwise\'',
-    'streetwise-raver-hardcore-homeboy',
-    'streetwoman',
-    'streetwork',
-    'streey',
-    'strehler',
-    'strehlgasse',
     'streiber',
-    'streich',
-    'streichton',
-    'streifen',
-    'streifenwagen',
-    'streight',
-    'streina',
-    'streit',
-    'streitwieser',
-    'strejau',
-    'strejlaua',
-    'strek',
-    'strelba',
-    'strelitzias',
-    'strelli',
-    'strelzno',
     'stremonius',
-    'streng&rehy;thened',
-    'strenger',
-    'strengh&ndash;weight',
-    'strenghten',
-    'strenghtened',
-    'strenghthen',
-    'strength\'',
-    'strength-saving',
-    'strength-wise',
-    'strength-worship',
-    'strength.',
-    'strength/',
-    'strength/abrasion',
-    'strength/weight',
-    'strengthed',
     'strengthless',
-    'strengths.there',
-    'strengths.this',
-    'strensham/worcestershire',
-    'strenth',
-    'strenua',
-    'strenui',
-    'strenuus',
-    'streonshalh',
-    'strep',
-    'strepa',
-    'strepavidin',
-    'strephons',
-    'strepitacula',
-    'streptavidin-biothin',
-    'streptavidin-biotinylated',
     'streptavidin-coated',
-    'streptavidin-linked',
-    'streptavidin-peroxidase',
-    'streptavidin-red613',
-    'streptodornase',
-    'streptokinase-treated',
-    'streptozotocin-induced',
-    'stress&ndash;inoculation',
-    'stress&rehy;loaded',
-    'stress-buster',
-    'stress-count',
-    'stress-donating',
-    'stress-enhancing',
-    'stress-fractured',
-    'stress-ful',
-    'stress-inducible',
     'stress-inducing',
-    'stress-laden',
-    'stress-path',
-    'stress-phonology',
-    'stress-point',
-    'stress-rating',
-    'stress-reducing',
-    'stress-strain-strength',
-    'stress-superposition',
-    'stress-whitening',
-    'stressa',
-    'stresscount',
-    'stressed.',
-    'stressfully',
-    'stressfulness',
-    'stret',
     'stretch-',
-    'stretch-and-bend',
-    'stretch-limo',
-    'stretch-limos',
-    'stretch-limousine',
-    'stretch-mark',
-    'stretch-marks',
-    'stretch-pull',
-    'stretch-receptors',
-    'stretch-satin',
-    'stretch-steel',
-    'stretch-steps',
-    'stretch-towelling',
-    'stretch-version',
-    'stretched-aga',
-    'stretched-membrane',
     'stretched-on-a-rack',
-    'stretcher-bed',
-    'stretcher-beds',
-    'stretcher-case',
-    'stretcher-like',
-    'stretchers.',
-    'stretchies',
-    'stretchiness',
-    'stretching-out',
-    'stretchs',
-    'strete',
-    'stretes',
-    'stretford-based',
-    'strettford',
-    'stretti',
-    'streuth',
     'strewart',
-    'strewin\'',
-    'strezembosz',
-    'strezov',
-    'striatal',
-    'striatiti',
-    'striatopodocarpites',
-    'stribblehill',
-    'stribley',
-    'stribling',
-    'stribling-wright/producer',
-    'strichter',
-    'strick/general',
-    'strickland/play',
-    'stricklands',
-    'strict-liability',
     'strictly&rehy;formatted',
-    'strictly-establishment',
-    'strictly-off-the-record',
-    'stricture(s)',
-    'strictures/irregularities',
-    'stricutre',
-    'stridden',
-    'striddle',
-    'stride-resident',
-    'stridegen',
-    'stridehost',
-    'stridemark',
-    'striderun',
-    'strideview',
-    'stridor',
-    'stridulant',
     'stridulated',
-    'stridulators',
-    'stridulatory',
-    'strife-motive',
-    'strife-ridden',
-    'strig',
-    'striggen',
-    'stright',
-    'strigidae',
-    'strigilated',
-    'strigils',
-    'strigosa',
-    'strijbos',
-    'strik&rehy;ing',
-    'strik-tar',
-    'strike\'',
     'strike-break',
-    'strike-free',
-    'strike-leader',
-    'strike-on',
-    'strike-out',
-    'strike-related',
-    'strike-team',
-    'strike-through',
-    'strike-waves',
-    'strike/industrial',
-    'strike/reconnaissance',
-    'strikeable',
-    'strikebreaker',
-    'strikemore',
-    'striken',
-    'striker-cum-provider',
     'striker-days',
-    'striker.',
-    'strikes.',
-    'strikes.if',
-    'strikin\'',
-    'striking-surface',
-    'striking-train',
-    'striking.',
-    'strikingly-coloured',
-    'strimming',
-    'strina',
-    'strinasacchi',
-    'strinberg',
-    'strindbergian',
-    'string&dollar',
-    'string-and-patch',
     'string-backed',
-    'string-balance',
-    'string-based',
-    'string-beans',
-    'string-beds',
-    'string-belted',
-    'string-bender',
-    'string-bending',
-    'string-course',
-    'string-cum-keyboard',
-    'string-dominated',
-    'string-infected',
-    'string-making',
-    'string-playing',
-    'string-sets',
-    'string-soaked',
     'string-spacing',
-    'string-style',
-    'string-technique',
-    'string-twister',
-    'string-vests',
-    'string-would',
-    'string.i',
-    'string/client',
-    'string/product',
-    'stringbag',
-    'stringbags',
-    'stringbass',
-    'stringbean',
-    'stringbeans',
-    'stringent&mdash;but',
-    'stringer/asthma',
     'stringhalt',
-    'stringier',
-    'stringiness',
-    'stringless',
-    'stringlines',
-    'stringocephalus',
-    'strings&dollar',
-    'strings-is',
-    'strings.1',
-    'strings/phrases',
-    'stringston',
-    'strinuous',
-    'striolatum',
-    'striongly',
-    'strip(s)',
-    'strip-',
     'strip-a',
-    'strip-a-gram',
-    'strip-cultivation',
-    'strip-dancer',
-    'strip-footing',
-    'strip-grazed',
-    'strip-light',
-    'strip-mined',
-    'strip-mines',
-    'strip-out',
-    'strip-pine',
-    'strip-searching',
-    'strip-shows',
-    'stripdown',
-    'stripdowns',
-    'stripe-patterns',
     'striped-leaved',
-    'striped-pyjama',
-    'striped-scarved',
-    'striped.',
-    'stripesey',
-    'striplins',
-    'stripmine',
-    'stripogrammers',
-    'stripograms',
-    'stripp',
-    'strippable',
-    'stripped-floor',
-    'stripped.from',
-    'stripper/cleaner',
-    'strippergram',
-    'strippingly',
     'strippling',
-    'stripsearched',
-    'stripwash',
-    'stripwax',
-    'stripwood',
-    'stripyness',
-    'stritar',
-    'strittmatter',
-    'strivens',
-    'striver',
-    'strizek',
-    'strn',
-    'stroak',
-    'strobe-equipped',
-    'strobe-laced',
-    'strobe-lights',
     'strobili',
-    'strobus',
-    'strocaryum',
-    'stroemfjord',
-    'stroessnorist',
-    'stroganoffs',
-    'stroganova',
-    'stroh',
-    'strohem',
-    'strohl',
-    'stroikes',
-    'stroikin',
-    'stroitel\'stva',
-    'strok',
-    'stroke&rehy;charts',
-    'stroke\'',
     'stroke-induced',
-    'stroke-maker',
-    'stroke-my-arm-please',
-    'stroke-players',
-    'stroke-playing',
-    'stroke-position',
-    'stroke-stiffened',
-    'stroke-upon-trend',
-    'strokeable',
-    'strokeless',
-    'strokelessness',
-    'strokemaker',
-    'strokemaking',
-    'strokes-a-minute',
-    'strokes.',
-    'strokes_rather',
     'strolin',
-    'stroll-and-browse',
-    'strollathons',
-    'strollin\'',
-    'strolz',
-    'strom.',
-    'stromal/factor-dependent',
-    'stromas',
-    'stromata',
-    'stromatactoid',
-    'stromataporoids',
-    'stromateis',
-    'stromberg-carlson',
-    'stromn',
-    'strondheim',
-    'strong&mdash;not',
     'strong&rehy;featured',
-    'strong-campbell',
-    'strong-charactered',
-    'strong-flavoured',
-    'strong-handed',
-    'strong-headed',
-    'strong-hold',
-    'strong-i',
-    'strong-it',
-    'strong-loam',
-    'strong-lookin\'',
-    'strong-man/trapeze',
-    'strong-mindedness',
-    'strong-muscled',
-    'strong-necked',
-    'strong-points',
     'strong-rooms',
-    'strong-shouldered',
-    'strong-smellin\'',
-    'strong-sounding',
-    'strong-stomached',
-    'strong-tasting',
-    'strong-toothed',
-    'strong-willed/obstinate',
-    'strong-wise',
-    'strong.the',
-    'strong/victim',
-    'strong/weak',
-    'strong/wife',
-    'strongaig',
-    'strongarm',
-    'strongbeam',
     'strongboxes',
-    'stronger-feeling',
-    'stronger-growing',
-    'stronger-minded',
-    'stronger-than-expected',
-    'stronger-willed',
-    'strongest-ever',
-    'strongest-minded',
-    'stronginthearm',
-    'strongly&rehy;walled',
-    'strongly-bonded',
-    'strongly-curved',
-    'strongly-developed',
-    'strongly-felt',
-    'strongly-folded',
-    'strongly-inverted',
     'strongly-made',
-    'strongly-motivated',
-    'strongly-muscled',
-    'strongly-patterned',
-    'strongly-scented',
-    'strongly-stinging',
-    'strongly-timbered',
-    'strongman-cum-cocaine-trafficker',
-    'strongness',
-    'strongwilled',
-    'strongyloidea',
-    'stronista',
-    'strontianite',
-    'strontino',
-    'strontium-89',
-    'stroobant',
     'stroop',
-    'strop/strap',
-    'stroparia',
-    'stropheodontids',
-    'strophic-variation',
-    'strophically',
-    'stropp',
-    'stroppolin\'',
-    'strorny',
-    'stroscio',
-    'stroud-water',
-    'stroud/nuclear',
-    'stroudwaters',
-    'strougal',
-    'stroughton',
-    'strouhal',
     'stroul',
-    'stround',
-    'stroup',
-    'stroustrup',
-    'strouted',
-    'strowd',
-    'strowger',
-    'strows',
-    'strqstmax',
-    'strretch',
-    'strsn',
-    'strteatham',
-    'struban',
-    'struble',
-    'struc',
-    'struc&rehy;turalism',
     'struc&rehy;turalists',
-    'struc&rehy;turally',
-    'struc&rehy;tures',
-    'struck-home',
-    'struck-off',
-    'struck-out',
-    'struction',
-    'structions',
-    'structually',
-    'structural-adjustment',
-    'structural-functionalism',
-    'structural-functionalists',
-    'structural-morphological',
-    'structural/constructional',
-    'structural/institutional',
-    'structuralist.principles',
     'structuralization',
-    'structure&mdash;a',
-    'structure(s)',
-    'structure(s)/alteration',
-    'structure-',
-    'structure-function',
-    'structure-mechanistic',
-    'structure-orientation',
-    'structure-oriented',
-    'structure-property',
-    'structure-recognition',
-    'structure-shared',
-    'structure/agency',
-    'structure/fabric',
-    'structure/local',
-    'structure/outline',
     'structure/procedures',
-    'structured-parts',
-    'structured/',
-    'structured/practice-related',
-    'structurel',
-    'structures-management',
-    'structures/different',
-    'structurespeak',
-    'structurings',
-    'structurn',
-    'strudel-like',
-    'strudes',
-    'strudy',
-    'struensee',
-    'struers',
-    'strug',
     'strug&rehy;gle',
-    'strugggling',
-    'strugging',
-    'struggle\'',
-    'struggle-black',
-    'struggle.s',
-    'struhsaker',
-    'struie',
-    'struisbaai',
-    'strulled',
-    'struma',
-    'strumble',
-    'strumica',
-    'strumilin',
-    'strummable',
-    'strump',
     'strumph',
-    'strumster',
-    'strunin',
-    'struskii',
-    'strut-based',
-    'strut-mounted',
-    'strut-walk',
-    'strut/',
-    'struthiomimus',
-    'struthionidae',
-    'strutt/film',
-    'struttingly',
-    'struttura',
-    'struturally',
-    'struwwelpeter',
-    'struy',
     'strychnos',
-    'strycholine/glycerophosphate',
-    'stryd',
-    'strym&omacr;n',
-    'stryme',
-    'stryver',
-    'stryx',
-    'sts-50',
-    'stt',
-    'sttonehenge',
-    'stttsst',
-    'stu(d)',
-    'stu-pot',
-    'stuard',
-    'stuart&ndash',
-    'stuart-cleary/district',
     'stuart-king',
-    'stuart-wortley',
-    'stuartese',
-    'stuartesque',
-    'stuartwho',
-    'stuarty',
-    'stuat',
-    'stub\'n',
-    'stub-filled',
-    'stub-out',
-    'stubbed-out',
-    'stubbers',
-    'stubberud',
-    'stubbies',
-    'stubble&rehy;covered',
-    'stubble-bearded',
     'stubble-chinned',
-    'stubble-roughened',
-    'stubble-shaved',
-    'stubbler',
-    'stubbly-legged',
-    'stubbornest',
-    'stubby-billed',
-    'stubby-winged',
-    'stubbylee',
-    'stubdale',
-    'stubens',
-    'stubes',
-    'stubguns',
-    'stubica',
-    'stubley',
-    'stucco-covered',
     'stucco-faced',
-    'stucco-work',
-    'stuchell',
-    'stuck-in',
-    'stuck-in-the-mud',
-    'stuck-up-looking',
-    'stucken',
-    'stuckey',
-    'stuckless',
-    'stuckness',
-    'stuckton',
-    'stucley',
-    'stucture',
-    'stud-backed',
-    'stud-band',
-    'stud-fee',
     'stud-groom',
-    'stud-list',
-    'stud.',
-    'studbook',
-    'studd/boat',
-    'studds',
-    'stude-rockers',
-    'studely',
-    'studen',
-    'student(ors)',
-    'student(s)',
-    'student-body',
-    'student-chaired',
-    'student-examensbetyg',
-    'student-exercise',
-    'student-hours',
     'student-module',
-    'student-newman-keuls',
-    'student-observer',
-    'student-orientated',
-    'student-originated',
-    'student-prince',
-    'student-radical-turned-management-consultant',
-    'student-run',
-    'student-welfare',
-    'student/',
-    'student/institution',
-    'student/intellectual',
-    'student/students',
-    'studente',
-    'studentenmuth',
-    'studentereksamen',
     'studenting',
-    'students&mdash;eros',
-    'students/',
-    'students/members',
-    'students/staff',
-    'studentsprof',
-    'studeously',
-    'studer',
-    'studes',
-    'studey',
-    'studge',
-    'studh',
-    'studholme/gloucestershire',
-    'studie',
-    'studiedly-casual',
-    'studies-oriented',
     'studies/',
-    'studies/cookery',
-    'studies/fabric',
-    'studies/is',
-    'studies/oxon',
-    'studies/political',
-    'studies/retailing',
-    'studies/sussex',
-    'studies/women',
-    'studieson',
-    'studii',
-    'studiis',
-    'studio-art',
-    'studio-bedroom',
-    'studio-constricted',
-    'studio-cum-shop',
     'studio-cum-workshop',
-    'studio-dependent',
-    'studio-driven',
-    'studio-friendly',
-    'studio-like',
-    'studio-made',
-    'studio-out',
-    'studio-quality',
-    'studio-recreated',
-    'studio-sharing',
-    'studio-shy',
-    'studio-style',
-    'studio-type',
-    'studio/flat',
-    'studio/gymnasium',
-    'studio/leisure',
     'studio/stage',
-    'studio/study',
-    'studio/tv',
-    'studioland',
-    'studion',
-    'studiopaperback',
-    'studiopaperbacks',
-    'studiorum',
-    'studios-europe',
-    'studiosos',
-    'studiosum',
-    'studly',
-    'studmeyer',
-    'studmix',
-    'studtz',
-    'study&mdash',
     'study-',
-    'study--a',
-    'study-action',
-    'study-bird',
-    'study-carrel',
-    'study-cum-television',
-    'study-designs',
-    'study-feeding',
-    'study-is',
-    'study-period',
-    'study-skills',
-    'study.8',
-    'study/bedroom',
-    'study/bedrooms',
-    'study/library/dining',
-    'study/one',
     'study/training',
-    'study/transport',
-    'study/working',
-    'study_rather',
-    'studying-communication',
-    'studying/disseminating',
-    'studying/working/travelling',
-    'stuer-lauridsen',
-    'stuff\'',
-    'stuff-',
-    'stuff-after',
-    'stuff-must',
-    'stuff-over',
-    'stuff-sodium',
-    'stuff-stuff',
-    'stuff-there',
     'stuff-until',
-    'stuff.',
-    'stuff_for',
-    'stuff_on',
-    'stuffe',
-    'stuffed-to-capacity',
-    'stuffers/leaflets',
-    'stuffery',
-    'stuffie',
-    'stuffier',
-    'stuffingtons',
-    'stuffit',
-    'stuffout',
-    'stuffs.',
-    'stuffyd',
-    'stugan',
     'stuggest',
-    'stuggies',
-    'stuhr',
-    'stui-',
-    'stuiver',
-    'stuka-ed',
-    'stuka-like',
-    'stukageschwader',
-    'stukenbrock',
-    'stuley',
-    'stulli-stuli&cacute',
-    'stulpnagel',
-    'stultification',
-    'stultos',
-    'stults',
-    'stum',
     'stumble-on',
-    'stumblers',
-    'stumbling-stone',
-    'stumey',
-    'stummerslake',
-    'stump-burning',
-    'stump-like',
-    'stump-scorched',
-    'stump-tailed',
-    'stumpage',
-    'stumper',
-    'stumpf/british',
-    'stumpff',
-    'stumpily',
-    'stumpings.',
-    'stumps.',
     'stumpwork',
-    'stumpy-tailed',
-    'stun-gas',
-    'stun-gun',
-    'stun-guns',
-    'stunden',
-    'stundent',
-    'stungun',
-    'stunkit',
-    'stunned\'',
-    'stunniggly',
-    'stunningly-wrought',
-    'stunt-cum-party',
-    'stunt-flying',
-    'stunt-ridden',
-    'stunt-riding',
     'stunted-looking',
-    'stuntfoil',
-    'stuntman/woman',
-    'stuntperson',
-    'stuntsman',
-    'stupart',
-    'stupefies',
-    'stupenda',
-    'stupid&rehy;fresh',
-    'stupid-looking',
-    'stupid/ugly/no',
-    'stupida',
-    'stupididy',
-    'stupidity\'',
-    'stupidity-',
-    'stupids',
     'stupified',
-    'stupit',
-    'stupple',
-    'sturchio',
-    'sturdily-built',
-    'sturdy/historian',
-    'sturgeite',
-    'sturgeites',
-    'sturm&rehy;rugers',
-    'sturm-and(sic)-drang',
-    'sturmey&rehy;archer',
-    'sturminster/dorset',
-    'sturmy',
-    'sturtivant',
-    'sturua',
-    'stussy-style',
     'stutch',
-    'stuteville',
-    'stutfield',
-    'stutt',
-    'stuttaford',
-    'stuttard/national',
-    'stutter-gun',
-    'stutterings',
-    'stutzer',
-    'stuuw',
-    'stux',
-    'stvs',
-    'stweed',
-    'styan',
-    'stycar',
-    'stye',
     'stygant',
-    'styl',
-    'stylar',
-    'style&mdash',
-    'style&mdash;the',
-    'style&rehy;conscious',
-    'style-',
-    'style-an',
-    'style-checkers',
-    'style-groups',
-    'style-level',
-    'style-mag',
-    'style-making',
-    'style-mates',
-    'style-mismatch',
-    'style-obsessed',
     'style-over-content',
-    'style-pointers',
-    'style-shift',
-    'style-shifting',
-    'style-sound-wash',
-    'style-studies',
-    'style-zones',
-    'style.6',
-    'style.fluidity',
-    'style.his',
-    'style:that',
-    'stylecraft',
-    'styleetronic',
-    'stylehaus',
-    'stylepck',
-    'styles-level',
     'styles.',
-    'styles/dialects',
-    'styles/values',
-    'stylesheet/tagging',
-    'styleshift',
-    'stylews32',
-    'styley',
-    'styliform',
-    'stylisations',
-    'stylise',
-    'stylisitic',
-    'stylism',
-    'stylites',
-    'styll',
-    'stylocracy',
-    'stylometrist',
     'stylophones',
-    'stylosa',
-    'stylosanthes',
-    'styluses',
-    'styman',
-    'stymieing',
-    'stymphalis',
-    'stymphalos',
-    'stymphalus',
-    'stymus',
-    'stynkynge',
-    'styooch',
-    'styraciflua',
-    'styracosaurus',
-    'styrene-4',
-    'styrene-stat-acrylonitrile',
     'styrofoam-and-neon',
-    'styron',
-    'stysb',
-    'stysp',
-    'su&egrave;de',
-    'su-',
-    'su-20s',
-    'su-22',
-    'su-24d',
-    'su-25s',
-    'su-26mx',
-    'su-7s',
-    'su-azj',
-    'su-cz-o',
-    'su-san',
-    'su-superloft',
     'su-yung',
-    'su27',
-    'su27s',
-    'su3',
-    'su88',
-    'suae',
-    'suaeda',
-    'suai',
-    'sualidaz',
-    'suame',
-    'suandi',
-    'suardal.',
-    'suardale',
-    'suart',
-    'suat',
-    'suav\'&egrave\'l',
     'suave-looking',
-    'suavest',
-    'suavibus',
-    'suazo',
-    'sub&mdash;national',
-    'sub&ndash;contractor',
-    'sub&ndash;contractors',
-    'sub&ndash;sector',
-    'sub&rehy',
-    'sub&rehy&pound;500',
-    'sub&rehy;assemblies',
-    'sub&rehy;base',
-    'sub&rehy;basement',
-    'sub&rehy;committee',
-    'sub&rehy;contractor',
-    'sub&rehy;disciplinary',
     'sub&rehy;disciplines',
-    'sub&rehy;glacially',
-    'sub&rehy;jecting',
-    'sub&rehy;manne',
-    'sub&rehy;optimality',
-    'sub&rehy;par',
-    'sub&rehy;postmaster',
-    'sub&rehy;routines',
-    'sub&rehy;scriptions',
-    'sub&rehy;sequent',
-    'sub&rehy;sequently',
-    'sub&rehy;specialisation',
-    'sub&rehy;system',
-    'sub&rehy;task',
-    'sub&rehy;tropical',
-    'sub&rehy;type/designation',
     'sub-&dollar;20,000',
-    'sub-&pound;10',
-    'sub-&pound;150',
-    'sub-&pound;20,000',
-    'sub-&pound;5,000',
-    'sub-&pound;5,0000',
-    'sub-0.5',
-    'sub-0.5-micron',
-    'sub-2-litre',
-    'sub-24mm',
-    'sub-28sec',
-    'sub-29',
-    'sub-46',
-    'sub-5,000',
-    'sub-56',
-    'sub-a-',
     'sub-acid',
-    'sub-acqua',
-    'sub-activity',
-    'sub-acute',
-    'sub-agent',
-    'sub-alps',
-    'sub-amatory',
-    'sub-amendments',
-    'sub-antarctic',
-    'sub-apostolic',
-    'sub-aquatic',
-    'sub-art',
-    'sub-aspects',
-    'sub-assembly-type',
-    'sub-assembly/assembly/machine',
-    'sub-assumptions',
     'sub-astral',
-    'sub-atlantic',
-    'sub-attributes',
-    'sub-audible',
-    'sub-average',
-    'sub-b',
-    'sub-bases',
-    'sub-beings',
-    'sub-belinda',
-    'sub-boxes',
-    'sub-brechtian',
-    'sub-breeds',
-    'sub-bureaux',
-    'sub-buyer',
-    'sub-camp',
-    'sub-carpathian',
     'sub-case',
-    'sub-cases',
-    'sub-castes',
-    'sub-categorisations',
-    'sub-ceilings',
-    'sub-cellarer',
-    'sub-cellular',
-    'sub-centres',
-    'sub-chambers',
-    'sub-characters',
-    'sub-charter',
-    'sub-chaucerian',
-    'sub-chiefs',
-    'sub-christian',
-    'sub-circuits',
-    'sub-classifications',
     'sub-classify',
-    'sub-climate',
-    'sub-cloned',
-    'sub-clusters',
-    'sub-collar',
-    'sub-commandant',
-    'sub-commercial',
-    'sub-committeee',
-    'sub-company',
-    'sub-compartments',
-    'sub-competitive',
-    'sub-component',
-    'sub-concert',
-    'sub-conductor',
-    'sub-conductor(s)',
-    'sub-consciousnesses',
     'sub-constituents',
-    'sub-contact',
-    'sub-contracting/',
-    'sub-conversation',
-    'sub-conversions',
-    'sub-copland',
-    'sub-coronation',
-    'sub-cortical',
-    'sub-cot&rehy;racting',
-    'sub-county',
-    'sub-cratonic',
-    'sub-create',
-    'sub-crop',
-    'sub-cults',
-    'sub-daemons',
-    'sub-dallas',
     'sub-deacon',
-    'sub-dealers',
-    'sub-delegation',
-    'sub-desertic',
-    'sub-designation',
-    'sub-dialect',
-    'sub-disciplinary',
-    'sub-discipline-based',
-    'sub-divine',
-    'sub-divisions-are',
-    'sub-dominant',
-    'sub-dynasty',
-    'sub-ealing',
-    'sub-economy',
-    'sub-ed',
-    'sub-editing.',
     'sub-editorial',
-    'sub-editorship',
-    'sub-eight',
-    'sub-elgar',
-    'sub-elite',
-    'sub-endothelial',
-    'sub-endothelium',
-    'sub-environment',
-    'sub-environments',
-    'sub-epithelial',
-    'sub-equal',
-    'sub-equipments',
-    'sub-ether',
-    'sub-ethnicities',
-    'sub-european',
-    'sub-explanation',
     'sub-faces',
-    'sub-factors',
-    'sub-family',
-    'sub-fecundity',
-    'sub-fellini-esque',
-    'sub-femtosecond',
-    'sub-fertility',
-    'sub-filed',
-    'sub-flamenco',
-    'sub-four',
-    'sub-four-minute',
-    'sub-fours',
-    'sub-fractions',
-    'sub-freezing',
-    'sub-fund',
-    'sub-fusc',
     'sub-gaols',
-    'sub-garbo',
-    'sub-gce',
-    'sub-generic',
-    'sub-glass',
-    'sub-goal',
-    'sub-governments',
-    'sub-gradations',
-    'sub-graphs',
-    'sub-gravity',
-    'sub-grounds',
-    'sub-grunge',
-    'sub-harmonics',
-    'sub-headquarters',
-    'sub-hippy',
-    'sub-hitchcock',
     'sub-hitchcockian',
-    'sub-horizontal',
-    'sub-hunters',
-    'sub-hypotheses',
-    'sub-imperial',
-    'sub-impressionist',
-    'sub-incision',
-    'sub-instructions',
-    'sub-issues',
-    'sub-ives',
-    'sub-jagger',
-    'sub-jane',
-    'sub-kingdom',
-    'sub-lava',
-    'sub-leased',
-    'sub-leases',
     'sub-lessor',
-    'sub-lethal',
-    'sub-letted',
-    'sub-levels',
-    'sub-lexicon',
-    'sub-licencees',
-    'sub-limit',
-    'sub-lineage',
-    'sub-lingual',
-    'sub-list',
-    'sub-literary',
-    'sub-louis',
-    'sub-lt',
-    'sub-mach',
-    'sub-machinegun',
-    'sub-man',
     'sub-managers',
-    'sub-manor',
-    'sub-martin',
-    'sub-maxillary',
-    'sub-maximal',
-    'sub-maxims',
-    'sub-maximum',
-    'sub-membrane',
-    'sub-messages',
-    'sub-metacentric',
-    'sub-metal',
-    'sub-mind',
-    'sub-minoan',
-    'sub-model',
-    'sub-modules',
-    'sub-montane',
     'sub-movements',
-    'sub-mtv',
-    'sub-multiple',
-    'sub-mycenaean',
-    'sub-nanosecond',
-    'sub-natural',
-    'sub-networks',
-    'sub-normals',
-    'sub-ocean',
-    'sub-oestrus',
-    'sub-officed',
-    'sub-one-minute',
-    'sub-option',
-    'sub-ordination',
-    'sub-organist',
-    'sub-orwellian',
     'sub-packs',
-    'sub-panels',
-    'sub-para',
-    'sub-paradigm',
-    'sub-part',
-    'sub-passions',
-    'sub-persona',
-    'sub-phrase',
-    'sub-plates',
-    'sub-pledge',
-    'sub-pleural',
-    'sub-po',
-    'sub-poena',
-    'sub-poetic',
-    'sub-polar',
-    'sub-political',
     'sub-ponds',
-    'sub-pop',
-    'sub-postmasters',
-    'sub-prefecture',
-    'sub-principles',
-    'sub-process',
-    'sub-professionals',
-    'sub-profit-',
-    'sub-profit-maximising',
-    'sub-programme',
-    'sub-programmes',
-    'sub-project',
-    'sub-publishers',
-    'sub-pulsar',
-    'sub-question',
-    'sub-rack',
     'sub-radar',
-    'sub-rational',
-    'sub-real',
-    'sub-realistic',
-    'sub-records',
-    'sub-recursive',
-    'sub-regulation',
-    'sub-rent',
-    'sub-rents',
-    'sub-retail',
-    'sub-routes',
-    'sub-rules',
-    'sub-s(1)',
-    'sub-s(8)',
-    'sub-sahelian',
-    'sub-saintly',
     'sub-sale(s)',
-    'sub-schools',
-    'sub-screens',
-    'sub-scripts',
-    'sub-seabed',
-    'sub-sect',
-    'sub-sects',
-    'sub-sell',
-    'sub-selling',
-    'sub-sequences',
-    'sub-sequent',
-    'sub-sexual',
-    'sub-shed',
-    'sub-shrubby',
-    'sub-shrubs',
-    'sub-slate',
     'sub-song',
-    'sub-sorted',
-    'sub-specific',
-    'sub-stages',
-    'sub-stances',
-    'sub-state',
-    'sub-statement',
-    'sub-statesmen',
-    'sub-stavinsky',
-    'sub-stilettoes',
-    'sub-strate',
-    'sub-strategies',
-    'sub-strokes',
-    'sub-structural',
-    'sub-style',
-    'sub-sub&rehy;classes',
     'sub-sub-',
-    'sub-sub-committee',
-    'sub-sub-committees',
-    'sub-sub-headings',
-    'sub-sub-topic',
-    'sub-sub-units',
-    'sub-subdirectories',
-    'sub-subsistence',
-    'sub-supplier',
-    'sub-systems/activities',
-    'sub-targets',
-    'sub-task',
-    'sub-teacher',
-    'sub-techno',
-    'sub-terence',
-    'sub-test',
     'sub-tests',
-    'sub-theory',
-    'sub-tidal',
-    'sub-tippee',
-    'sub-tippees',
-    'sub-titling',
-    'sub-to',
-    'sub-tolkien',
-    'sub-totals',
-    'sub-track',
-    'sub-trades',
-    'sub-treasurer',
-    'sub-triassic',
-    'sub-tries',
-    'sub-triforium',
-    'sub-under-licensees',
     'sub-underleases',
-    'sub-underletting',
-    'sub-unital',
-    'sub-universe',
-    'sub-universes',
-    'sub-university',
-    'sub-urban',
-    'sub-variety',
-    'sub-versions',
-    'sub-violent',
-    'sub-vocal',
-    'sub-vocalize',
-    'sub-vocalizing',
-    'sub-ward',
-    'sub-warholian',
-    'sub-warp',
     'sub-whole',
-    'sub-wildean',
-    'sub-woofing',
-    'sub-zone',
-    'sub-zones',
-    'sub.assembly',
-    'sub.category',
-    'sub.culture',
-    'sub.operation',
-    'sub.parcel',
-    'sub/dom',
-    'sub=contractors',
-    'subadar',
-    'subadditivity-based',
-    'subadio',
-    'subaeras',
     'subaerially',
-    'subait',
-    'subalare',
-    'subalpina',
-    'subamarines',
-    'subamplification',
-    'subang',
-    'subangular',
-    'subaortic',
-    'subaqua',
-    'subardjo',
-    'subarkah',
-    'subarkoses',
-    'subarrangement',
-    'subasi',
-    'subaudial',
     'subbarow',
-    'subbiah',
-    'subbie',
-    'subbornness',
-    'subburbs',
-    'subcaerulea',
-    'subcanopy',
-    'subcapsular',
-    'subcase',
-    'subcaste',
-    'subcastes',
-    'subcategorisation',
-    'subcategorised',
-    'subcategorising',
-    'subcategorizing',
-    'subcaulescens',
     'subcentre',
-    'subception',
-    'subchartered',
-    'subchondral',
-    'subchondrla',
-    'subcision',
-    'subcity',
-    'subclan',
-    'subclassify',
-    'subclauses',
-    'subclavain',
-    'subclaviae',
-    'subclavian',
-    'subcloud',
-    'subcommands',
-    'subconcious',
     'subconciously',
-    'subconscious-mind',
-    'subcription',
-    'subcristatus',
-    'subcritically',
-    'subcultural-orientated',
-    'subcultured',
-    'subcurrents',
-    'subcuticle',
-    'subcuticular',
-    'subcutoneously',
-    'subdean',
-    'subdiaphragmatic',
-    'subdistricts',
-    'subdivisible',
-    'subdocument',
     'subdominants',
-    'subdomination',
-    'subduct',
-    'subdue.',
-    'subdue/in',
-    'subdued-looking',
-    'subeconomic',
-    'subect',
-    'subediting',
-    'subei/south',
-    'subelements',
-    'subendothelial',
-    'subentries',
-    'suber',
-    'suberization',
-    'subersive',
     'subfamilial',
-    'subfecund',
-    'subfloor',
-    'subfloors',
-    'subfunction',
-    'subgenera',
-    'subgingival',
-    'subglottal',
-    'subgrid',
-    'subgroupings',
-    'subh',
-    'subhaas',
-    'subhadradis',
-    'subharmonic',
-    'subharmonics',
-    'subhead&rehy;quarters',
     'subheads',
-    'subhedral',
-    'subhes',
-    'subhumanly',
-    'subhume',
-    'subhumid',
-    'subiciatur',
-    'subiection',
-    'subincidents',
-    'subinfeudated',
-    'subinfeudation',
-    'subino',
-    'subita',
-    'subite',
-    'subject&mdash;modern',
-    'subject&mdash;predicate',
     'subject&rehy;object',
-    'subject-agent',
-    'subject-by-subject',
-    'subject-catalogue',
-    'subject-category',
-    'subject-changing',
-    'subject-classifications',
-    'subject-dependent',
-    'subject-disciplines',
-    'subject-divisions',
-    'subject-driven',
-    'subject-employment',
-    'subject-expert',
-    'subject-free',
-    'subject-independent',
-    'subject-inspired',
     'subject-less',
-    'subject-object-verb',
-    'subject-objectivity',
-    'subject-of-science',
-    'subject-only',
-    'subject-orientation',
-    'subject-sitter',
-    'subject-teacher',
-    'subject-teaching',
-    'subject-victim',
-    'subject.8',
-    'subject/',
-    'subject/artist',
-    'subject/auxiliary',
-    'subject/class',
-    'subject/hobby',
     'subject/interest',
-    'subject/main',
-    'subject/topic',
-    'subjectes',
-    'subjectified',
-    'subjectify',
-    'subjective\'',
-    'subjectively/socially',
-    'subjectives',
-    'subjectivising',
-    'subjects&mdash;anatomy',
-    'subjects/classes',
-    'subjects/heads',
-    'subjects/places',
-    'subjet',
-    'subjets',
     'subjiciendum',
-    'subjmeas',
-    'subjugations',
-    'subjunctive/',
-    'subjunctives',
-    'subkingdom',
-    'subkingdoms',
-    'sublabial',
-    'sublanguage/domain',
-    'sublate',
-    'sublates',
-    'sublating',
-    'sublaxus',
-    'subleaders',
-    'subleasing',
-    'sublevel',
     'sublexical',
-    'subleyras',
-    'sublibrary',
-    'sublicense',
-    'sublicensing',
-    'sublim',
-    'sublimed',
-    'sublimes',
-    'subliminality',
-    'subliminals',
-    'sublimities',
-    'sublimmescence',
-    'subliterature',
-    'subluxation-atlantoaxial',
-    'subluxation-subaxial',
-    'sublyratus',
     'subm',
-    'submanor',
-    'submantle',
-    'submar',
-    'submarina',
-    'submarine-building',
-    'submarine-cable',
-    'submarine-missile',
-    'submarines.',
-    'submarino',
-    'submembranous',
-    'submilligram',
-    'submillimetric',
-    'submission(s)',
-    'submission.',
-    'submissionary',
     'submissions.',
-    'submissions/proposal',
-    'submissions/proposals',
-    'submissive-looking',
-    'submissives',
-    'submitted/',
-    'submitters',
-    'submittted',
-    'submodalities',
-    'submodality',
-    'submodules',
-    'submontane',
-    'submucosa-circular',
-    'submucousal',
-    'submycenaean',
-    'subn',
     'subnet',
-    'subnormals',
-    'subobscura',
-    'suboptimum',
-    'subordin-ation',
-    'subordinate-boss',
-    'subordinate-ruler',
-    'subordinately',
-    'subordinates/',
-    'subordinates/superior',
-    'subordinations',
-    'subordinators',
-    'subornation',
-    'suborner',
-    'suborrhoeic',
-    'suboxia',
     'subparagraphs',
-    'subpeona',
-    'subpeonas',
-    'subperiod',
-    'subperitoneal',
-    'subphonemic',
-    'subpleurally',
-    'subpoea',
-    'subpoenae',
-    'subpoenaed-it',
-    'subpools',
-    'subportion',
-    'subportions',
-    'subpotency',
-    'subprincipal',
-    'subprogramme',
     'subprogrammes',
-    'subproject',
-    'subprostrata',
-    'subpublishes',
-    'subrahmanyan',
-    'subranges',
-    'subreal',
-    'subrent',
-    'subroc',
-    'subrounded',
-    'subruficollis',
-    'subrule',
-    'subrules',
-    'subs&iacute;dios',
-    'subsampling',
-    'subsaturation',
     'subscale',
-    'subscibers',
-    'subscores',
-    'subscribe.',
-    'subscriber/contributor',
-    'subscrip',
-    'subscription-fee',
-    'subscription-funded',
-    'subscription-list',
-    'subscription-paying',
-    'subscriptions/membership',
-    'subse-quently',
-    'subsec',
-    'subsector',
-    'subsectors',
-    'subsequen&rehy;tly',
     'subserica',
-    'subserosa',
-    'subserves',
-    'subsetted',
-    'subshrubs',
-    'subsidary',
-    'subsidence.',
-    'subsidi&rehy;aries',
-    'subsidiaries.',
-    'subsidiaries/associates',
-    'subsidiary/associated',
-    'subsidie',
-    'subsidised.',
-    'subsidy-hooked',
-    'subsistence-driven',
-    'subsistence-food',
     'subsistence.',
-    'subsites',
-    'subsitute',
-    'subsjectively',
-    'subsoiler',
-    'subsoiling',
-    'subsolidus',
-    'subspecialists',
-    'subspecialties',
-    'subspecific',
-    'subspecifically',
-    'subspherical',
-    'subss',
-    'subst.',
-    'substa',
-    'substan',
     'substance\'',
-    'substance-abusers',
-    'substance-with',
-    'substance.',
-    'substance/it',
-    'substances.',
-    'substansive',
-    'substant-ially',
-    'substanti',
-    'substantiality',
-    'substantiall',
-    'substantially-built',
-    'substantially-sized',
-    'substantially_due',
-    'substantila',
-    'substantival',
     'substantival-adjectival',
-    'substated',
-    'substi',
-    'substi&rehy;tute',
-    'substite',
-    'substition',
-    'substitiones',
-    'substitions',
-    'substituants',
-    'substituions',
-    'substitute-gratification',
-    'substitute-mothering',
-    'substituters',
-    'substitutesbased',
-    'substitutis',
-    'substitutivity',
     'substiuted',
-    'substratan',
-    'substrate-coating',
-    'substrategic',
-    'substriatus',
-    'substrings',
-    'substudy',
-    'subsubsection',
-    'subt.',
-    'subtaxa',
-    'subtelomeric',
-    'subtelty',
-    'subtenants.',
-    'subtending',
-    'subtenuis',
-    'subterraneus',
     'subtexts',
-    'subtheme',
-    'subtidal',
-    'subtilly',
-    'subtle-physical',
-    'subtlely',
-    'subtly-expanding',
-    'subtly-lit',
-    'subtly-polished',
-    'subtly-scored',
-    'subtopia',
-    'subtour',
-    'subtrees',
-    'subtribes',
-    'subtype-specific',
-    'subtype:escort',
     'suburb-bred',
-    'suburban-based',
-    'suburban-born',
-    'suburbanisation',
-    'suburbanism',
-    'suburbanity',
-    'suburbette',
-    'subvariscan',
-    'subvented',
-    'subversive.and',
-    'subvital',
-    'subvoices',
-    'subway/elevated',
-    'subwoofers',
-    'subword',
-    'subxerous',
     'subxiphoid',
-    'subzone',
-    'suc&rehy;cesses',
-    'sucalfate',
-    'succ&eacute;s',
-    'succe',
-    'succeeding/all',
-    'succeeds&mdash;more',
-    'succeeeds',
-    'succeptable',
-    'succes',
-    'succes&rehy;sion',
-    'succesfull',
-    'success&rehy;fully',
-    'success-based',
-    'success-implants',
     'success-orientated',
-    'success-rate',
-    'success-story',
-    'success-worship',
-    'successes/mistakes',
-    'successeur',
-    'successeurs',
-    'successful&rehy;ever',
-    'successfull',
-    'successfully-treated',
-    'successfully.richard',
-    'succession-list',
-    'succession-plan',
-    'succession-settlement',
-    'successively\'',
-    'successively_as',
     'successiveness',
-    'successivity',
-    'successline',
-    'successo',
-    'successor(s)',
-    'successor-echo',
-    'successor-states',
-    'successs',
-    'successsful',
-    'successsfully',
-    'successsive',
-    'succint',
-    'succinyl',
-    'succisa',
-    'succoth-brown',
-    'succothmore',
     'succubae',
-    'succubi',
-    'succubuses',
-    'succulent-looking',
-    'succussing',
-    'sucden',
-    'sucer',
-    'sucess',
-    'sucession',
-    'sucette',
-    'such&ndash',
-    'such-',
-    'such-a',
-    'such-a-body',
-    'such-an-such',
-    'such-and',
     'such-and-such.',
-    'sucha',
-    'sucharda',
-    'suche',
-    'suchitoto',
-    'suchna-rudna',
-    'suchov',
-    'sucia',
-    'sucide',
-    'sucilizm',
-    'suck-blow',
-    'suck-holing',
-    'suck-it-and-see',
-    'suck-slurp',
-    'sucka',
-    'suckable',
     'suckale',
-    'sucked-in',
-    'sucked-on',
-    'sucker-ass',
-    'sucker-bearing',
-    'sucker-blower',
-    'sucker-list',
-    'sucker-lists',
-    'sucker-mouths',
-    'suckerdrone',
-    'suckermouths',
-    'suckin\'',
-    'sucking-up',
-    'sucking_up',
-    'suckle-calf',
-    'sucklemouth',
     'sucky',
-    'sucky-grunting',
-    'sucoma',
-    'sucpicious',
-    'sucr&eacute;e',
-    'sucr&egrave;e',
-    'sucrase',
-    'sucre-figarella',
-    'sucre-oenom&egrave;tre',
-    'sucrerie',
-    'sucrier',
-    'sucros',
-    'sucrose-',
-    'sucrose-or',
-    'sucrose-rich',
-    'sucrose/hexose',
     'sucrs',
-    'suction-plug',
-    'suction-powered',
-    'suctioned',
-    'suctions',
-    'suctorial',
-    'sucursal',
-    'sud-est',
-    'sudak',
-    'sudamericana',
-    'sudamericano',
-    'sudan-chad',
-    'sudani',
-    'sudanian',
-    'sudanization',
-    'sudarium',
     'sudarman',
-    'sudbourne',
-    'sudbrooke',
-    'sudbury-based',
-    'sudbury-by-the-sea',
-    'sudburys',
-    'sudd',
-    'suddainly',
-    'suddam',
-    'sudden-like',
-    'suddenly-discovered',
-    'suddenly-made-redundant',
-    'suddenly-paralysed',
-    'suddenly-peaceful',
-    'suddenly-remembered',
-    'suddenly-small',
     'suddenly-widening',
-    'suddenly.',
-    'suddenly.appeared',
-    'suddently',
-    'suddes',
-    'suddeutsche',
-    'suddon',
-    'sudenly',
-    'sudents',
-    'sudetendeutsche',
-    'sudetens',
-    'sudewo',
-    'sudfass',
-    'sudha',
-    'sudhakarrai',
-    'sudhalter',
     'sudharmono',
-    'sudost',
-    'sudtone',
-    'sudworth',
-    'sueann',
-    'suebi',
-    'sueddeutsche',
-    'suede\'-stickered',
-    'suede-booted',
-    'suede-effect',
-    'suede-fronted',
-    'suede-head',
-    'suede-lined',
-    'suede-look',
-    'suede-panelled',
-    'suede-shoe-loving',
     'suede_on',
-    'suedehead\'',
-    'suedetrimmed',
-    'suedette',
-    'sueltz',
-    'suemitsu',
-    'sueraatmadja',
-    'suerbaum',
-    'suerby',
-    'suet-pudding',
-    'suete',
-    'suetoe',
-    'sueton',
-    'suetonius.',
-    'suett',
-    'suevic',
     'suezmax',
-    'suferings',
-    'suferto',
-    'suff',
-    'suff\'rings',
-    'suff**k',
-    'suffer-ing',
-    'sufferable',
-    'sufferage',
-    'sufference',
-    'sufferers.',
-    'sufferersin',
-    'sufferes',
-    'suffereth',
-    'suffering-for-their-art',
-    'suffering-to',
     'suffering.but',
-    'sufferit',
-    'suffern',
-    'sufferring',
-    'suffested',
-    'sufffered',
-    'sufffix',
-    'suffic',
-    'suffice.',
-    'sufficent',
-    'sufficial',
-    'sufficience',
-    'sufficient&mdash;such',
-    'sufficing',
-    'sufficiunt',
-    'suffit',
     'suffixation',
-    'suffixlist',
-    'suffolf',
-    'suffolk-born',
-    'suffolk-essex',
-    'suffolk/cheviot',
-    'suffolkian',
-    'suffrages',
-    'suffragette/black/leeds',
-    'suffragettes.',
-    'suffragettism',
-    'suffragis',
-    'suffragism',
-    'suffrance',
-    'suffras',
-    'suffren',
     'suffruticosa',
-    'sufic',
-    'sufragios',
-    'sug/gest',
-    'sugai',
-    'sugar&rehy;tit',
-    'sugar\'',
-    'sugar***',
-    'sugar-addicted',
-    'sugar-almond',
-    'sugar-and-vanilla-scented',
-    'sugar-basin',
-    'sugar-boom',
-    'sugar-box',
-    'sugar-buns',
-    'sugar-coat',
     'sugar-crystals',
-    'sugar-cube',
-    'sugar-cubes',
-    'sugar-daddies',
-    'sugar-daddy',
-    'sugar-derived',
-    'sugar-doll',
-    'sugar-dusted',
-    'sugar-factories',
-    'sugar-filled',
-    'sugar-frost',
-    'sugar-frosting',
-    'sugar-glazed',
-    'sugar-glider',
-    'sugar-jar',
-    'sugar-lactulose/',
     'sugar-like',
-    'sugar-lump',
-    'sugar-lumps',
-    'sugar-manufacture',
-    'sugar-mills',
-    'sugar-pastry',
-    'sugar-pie',
-    'sugar-pink',
-    'sugar-plantation',
-    'sugar-precursors',
-    'sugar-processing',
-    'sugar-producer',
-    'sugar-producing',
-    'sugar-reduced',
-    'sugar-refinery',
-    'sugar-refining',
     'sugar-running',
-    'sugar-sand',
-    'sugar-shaker',
-    'sugar-some',
-    'sugar-spun',
-    'sugar-stick',
-    'sugar-strewn',
-    'sugar-sweet',
-    'sugar-tongs',
-    'sugar-trading',
-    'sugar-transporting',
-    'sugar-yards',
-    'sugarbench',
-    'sugarbirds',
-    'sugarcane-growing',
-    'sugariest',
     'sugariness',
-    'sugaring',
-    'sugarlandia',
-    'sugarlump',
-    'sugarplum',
-    'sugarsweet',
-    'sugarwork',
-    'sugatani',
-    'sugery',
-    'sugestion',
-    'suggering',
-    'sugges&rehy;tions',
-    'suggessed',
-    'suggest\'',
-    'suggest(s)',
-    'suggest.ways',
     'suggested-learlington',
-    'suggested_more',
-    'suggestingthat',
-    'suggestively-titled',
-    'suggestological',
-    'suggestology',
-    'suggestopaedia',
-    'suggestor',
-    'suggests/proposes',
-    'suggets',
-    'suggetsed',
-    'suggitt',
-    'suggsted',
-    'sugihara',
-    'sugirtharaj',
-    'sugishita',
     'sugjects',
-    'sugs',
-    'suha',
-    'suhail',
-    'suhali',
-    'suhayli',
-    'suhaym',
-    'suhject',
-    'suhner',
-    'suhrenkamp',
-    'sui-ming',
-    'suiable',
-    'suiccessful',
-    'suici',
-    'suicide\'caravans',
-    'suicide-ode',
     'suicide-pact',
-    'suicide-proof',
-    'suicide.simon',
-    'suicidogenic',
-    'suid-afrika',
-    'suid-afrikaanse',
-    'suida-manning',
-    'suidhe',
-    'suif',
-    'suileag',
-    'suin',
-    'suinas',
-    'suinian',
-    'suirville',
-    'suishnish',
-    'suislip',
     'suit-able',
-    'suit-covers',
-    'suit-dress',
-    'suit-heavy',
-    'suit-jacket',
-    'suit-yourself',
-    'suitability\'',
-    'suitable-arranged',
-    'suitable/attractive',
-    'suitableness',
-    'suitcase-full',
-    'suitcase-loads',
-    'suite/substitute',
-    'suited-up',
-    'suiters',
-    'suitland',
     'suitthe',
-    'suivi',
-    'suivies',
-    'suivre',
-    'suj',
-    'sujan',
-    'suji',
-    'suk-m',
-    'suk24002',
-    'suk60022',
-    'sukaab',
-    'sukanya',
-    'sukarton',
-    'sukezane',
-    'sukh',
-    'sukhachov',
     'sukharev',
-    'sukhasana',
-    'sukhdevo',
-    'sukhe',
-    'sukhjit',
-    'sukhnam',
-    'sukhoi-24',
-    'sukhomaj',
-    'sukhumi-tbilisi',
-    'sukk',
-    'sukkar',
-    'sukkoth',
-    'suklje',
-    'sukman',
-    'sukopp',
-    'sukothai',
     'sukroongreung',
-    'sukru',
-    'sukrullah',
-    'suku',
-    'sukuma-speaking',
-    'sukumaland',
-    'sukumar',
-    'sukumuland',
-    'sukun',
-    'sukzession',
-    'sulafa',
-    'sulasikin',
-    'sulc',
-    'sule',
-    'suleh',
-    'sulejmanovic',
     'suleton',
-    'suleymaniya',
-    'sulfa',
-    'sulfa-drugs',
-    'sulfamethazine',
-    'sulfanilamide',
-    'sulfated',
-    'sulfates',
-    'sulfisoxazole',
-    'sulfonation',
-    'sulfotep',
-    'sulfuric',
-    'sulh',
-    'suli',
-    'suling',
-    'sulinus',
     'sulk-metal',
-    'sulk/maintain',
-    'sulka',
-    'sulke',
-    'sulker',
-    'sulkily\'',
-    'sulkin\'',
-    'sulkins',
-    'sulky-looking',
-    'sull\'imbrunire',
-    'sullage',
-    'sullane',
-    'sullavan',
-    'sullavan-stewart',
-    'sulleh',
-    'sullen-eyed',
     'sullen-faced',
-    'sulli',
-    'sullivan-rupert',
-    'sullivan.',
-    'sullivan/chet',
-    'sullivan/collector',
-    'sullivan/gloucestershire',
-    'sullivan/the',
-    'sully-penarth',
-    'sully-sur-loire',
-    'sulmac',
-    'sulmona',
-    'sulmont',
-    'sulnier',
-    'sulphadoxine',
-    'sulphalidomide',
     'sulphanilic',
-    'sulphasalasine',
-    'sulphasalazine/',
-    'sulphasalazine=0.84',
-    'sulphasalazine=17.6',
-    'sulphasalazine=193',
-    'sulphasalazine=202',
-    'sulphasalazine=85',
-    'sulphate-5-water',
-    'sulphate-fuelled',
-    'sulphate-grown',
-    'sulphate-resistant',
-    'sulphate-snorting',
-    'sulphate/',
-    'sulphate/day',
-    'sulphatic',
     'sulphatides',
-    'sulphenamide',
-    'sulphide&rehy;bearing',
-    'sulphide-rich',
-    'sulphide-toned',
-    'sulphide.',
-    'sulphidic',
-    'sulphonated',
-    'sulphones',
-    'sulphonyl',
-    'sulphosalicylic',
-    'sulphosuccinamate',
-    'sulphur-anion',
-    'sulphur-based',
-    'sulphur-coloured',
-    'sulphur-crested',
     'sulphur-free',
-    'sulphur-oxide',
-    'sulphur-scrubbing',
-    'sulphur-yellow',
-    'sulphur.free',
-    'sulphurea',
-    'sulphureous',
-    'sulphureus',
-    'sulphurously',
-    'sulring',
-    'sulski',
-    'sulston',
-    'sult',
-    'sulta',
-    'sultanates',
-    'sultant',
     'sultenfuss',
-    'sultra',
-    'sultriest',
-    'sulukongur',
-    'suluman',
-    'sulwah',
-    'sulyard',
-    'sulyman',
-    'sulzbach',
-    'sulzbergers',
-    'sulzer-engined',
-    'sulzers',
-    'sulzur',
-    'sum(s)',
-    'sum-mer',
-    'sum-total',
     'sum-vector',
-    'suma',
-    'sumacs',
-    'sumalia',
-    'sumar',
-    'sumati',
-    'sumatra-java',
-    'sumatrensis',
-    'sumatriptan-induced',
-    'sumayt',
-    'sumbawa',
-    'sumday',
-    'sumdy',
-    'sumed',
-    'sumei',
-    'sumendus',
     'sumerling',
-    'sumet',
-    'sumfunction',
-    'sumi-&eacute',
-    'sumi-e',
-    'sumikawa',
-    'sumiko',
-    'sumino',
-    'sumishomo',
-    'sumison',
-    'sumiyoshi-kai',
-    'summagraphics',
-    'summam',
-    'summaries-first',
-    'summarisable',
-    'summatative',
     'summates',
-    'summe',
-    'summer\'90',
-    'summer-autumn',
-    'summer-child',
-    'summer-fashion',
-    'summer-holiday',
-    'summer-kissed',
-    'summer-long',
-    'summer-only',
-    'summer-prune',
-    'summer-schools',
-    'summer-season',
-    'summer-shrunken',
-    'summer-skies',
-    'summer-sky',
     'summer-weight',
-    'summer.',
-    'summer.it',
-    'summer.ity',
-    'summer.v',
-    'summer/black',
-    'summerbell',
-    'summerblue',
-    'summerchlld',
-    'summerell',
-    'summerhill-type',
-    'summerhillians',
-    'summerish',
-    'summerly',
-    'summerpond',
-    'summers-smith',
     'summers/inspector',
-    'summerstage/ideal',
-    'summersun',
-    'summertyme',
-    'summerwear',
-    'summerweight',
-    'summerwest',
-    'summi',
-    'summit(1987)',
-    'summit-at-sea',
-    'summiteer',
-    'summiteering',
-    'summitting',
-    'summize',
-    'summley',
-    'summmer',
     'summo',
-    'summoners',
-    'summoning-up',
-    'summonings',
-    'summonsby',
-    'summonsing',
-    'summors',
-    'summus',
-    'sumnall',
-    'sumner.',
-    'sumner/administrator',
-    'sumner/hunt',
-    'sumnik',
-    'sumnmer',
-    'sumnner',
-    'sumo-style',
     'sumorsaetan',
-    'sumotori',
-    'sumpah',
-    'sumpguard',
-    'sumpholes',
-    'sumpin',
-    'sumpstuff',
-    'sumpsucker',
-    'sumpter-horses',
-    'sumptious',
-    'sumpton',
-    'sumpul',
-    'sums-up',
-    'sums.',
-    'sums_in_excess',
-    'sumthin\'',
     'sumthin\'.',
-    'sumthing',
-    'sumtri',
-    'sumu',
-    'sumud',
-    'sumus',
-    'sumutashi',
-    'sun&ndash;wed',
-    'sun&rehy;baked',
-    'sun&rehy;bleached',
-    'sun&rehy;blood',
-    'sun&rehy;dappled',
-    'sun&rehy;days',
-    'sun&rehy;dried',
-    'sun&rehy;reflecting',
-    'sun&rehy;soaked',
     'sun\'n\'sand',
-    'sun(1)',
-    'sun-\'n\'-sex',
-    'sun-100',
-    'sun-abuse',
-    'sun-added',
-    'sun-afternoon',
-    'sun-and-moon',
-    'sun-and-sand',
-    'sun-awnings',
-    'sun-basking',
-    'sun-bathe',
-    'sun-bathers',
-    'sun-bears',
-    'sun-birds',
-    'sun-blasted',
     'sun-blind',
-    'sun-blinded',
-    'sun-blinding',
-    'sun-block',
-    'sun-blocking',
-    'sun-blonde',
-    'sun-boat',
-    'sun-breathing',
-    'sun-bred',
-    'sun-bright',
-    'sun-brown',
-    'sun-burn',
-    'sun-burned',
-    'sun-burnished',
-    'sun-burnt',
-    'sun-capped',
     'sun-cleared',
-    'sun-colours',
-    'sun-compatibles',
-    'sun-craving',
-    'sun-danced',
-    'sun-dark',
-    'sun-darkness',
-    'sun-day',
-    'sun-days',
-    'sun-dazzling',
-    'sun-dec-hp-ibm-sco-mips',
-    'sun-deprived',
-    'sun-dews',
-    'sun-down',
-    'sun-dress',
-    'sun-dry',
     'sun-dusted',
-    'sun-earth',
-    'sun-equivalent',
-    'sun-evaporated',
-    'sun-faded',
-    'sun-filtered',
-    'sun-fish',
-    'sun-flexed',
-    'sun-gilt',
-    'sun-gleam',
-    'sun-glinted',
-    'sun-glo',
-    'sun-globe',
-    'sun-grazing',
-    'sun-hammock',
-    'sun-hatted',
     'sun-heat',
-    'sun-heated',
-    'sun-height',
-    'sun-helmet',
-    'sun-holiday',
-    'sun-hot',
-    'sun-independent',
-    'sun-induced',
-    'sun-kings',
-    'sun-lamp',
-    'sun-lanced',
-    'sun-lawn',
-    'sun-lightened',
-    'sun-linked',
-    'sun-lotioned',
-    'sun-lounge',
     'sun-made',
-    'sun-mercury',
-    'sun-parched',
-    'sun-pat',
-    'sun-peel',
-    'sun-protection',
-    'sun-red',
-    'sun-related',
-    'sun-ridden',
-    'sun-rise',
-    'sun-saloon',
-    'sun-sanctioned',
-    'sun-saturated',
-    'sun-scorch',
-    'sun-screens',
-    'sun-seekers',
     'sun-shafted',
-    'sun-shot',
-    'sun-shy',
-    'sun-sized',
-    'sun-sparkling',
-    'sun-specific',
-    'sun-speckled',
-    'sun-splashed',
-    'sun-split',
-    'sun-spot',
-    'sun-spots',
-    'sun-streaky',
-    'sun-swathed',
-    'sun-symbol',
-    'sun-synchronous',
-    'sun-table',
     'sun-tans',
-    'sun-tired',
-    'sun-tweaked',
-    'sun-twilight',
-    'sun-visor',
-    'sun-warm',
-    'sun-wary',
-    'sun-wed',
-    'sun-whitened',
-    'sun-winged',
-    'sun-wise',
-    'sun-wrap',
-    'sun/',
-    'sun/20th',
-    'sun/4',
-    'sun/at&amp;t',
     'sun/climate',
-    'sun/heat',
-    'sun/helpdesk',
-    'sun/nfs',
-    'sun/public',
-    'sun/video',
-    'sunada',
-    'sunandan',
-    'sunarso',
-    'sunbath',
-    'sunbeam&ndash;talbot&ndash;darracq',
-    'sunbed-users',
-    'sunbelt:frostbelt',
-    'sunbelt:rustbelt',
-    'sunbelt:snowbelt',
-    'sunbitterns',
     'sunblaze',
-    'sunboat',
-    'sunboats',
-    'sunbonnets',
-    'sunbrite',
-    'sunbrowned',
-    'sunburgh',
-    'sunburning',
-    'sunburns',
-    'sunburst/gold',
-    'sunbury-based',
-    'sunbusiness',
-    'sunchair',
-    'sunchairs',
-    'sunchon',
-    'sunclocks',
     'suncor',
-    'suncream.',
-    'suncreams',
-    'sund\'land',
-    'sundae-style',
-    'sundaica\'',
-    'sundal',
-    'sundar',
-    'sundari',
-    'sundasciurus',
-    'sunday&ndash;thursday',
-    'sunday&rehy;school',
-    'sunday\'',
-    'sunday-evening',
-    'sunday-lunch',
-    'sunday-night',
     'sunday-school-level',
-    'sunday-schools',
-    'sunday-shop',
-    'sunday-the',
-    'sunday-though',
-    'sunday/gloucester',
-    'sunday/lechlade/gloucestershire',
-    'sundays-style',
-    'sundays.',
-    'sundayscope',
-    'sundazzle',
-    'sundborg',
-    'sunde',
-    'sundel',
-    'sundeland',
-    'sundell',
     'sundenly',
-    'sunder&rehy;land',
-    'sunderland-company',
-    'sunderland-west',
-    'sunderland0',
-    'sunderland1',
-    'sunderland3',
-    'sundgaard',
-    'sundgot.',
-    'sundisk',
-    'sundius',
-    'sundlund',
-    'sundorne',
-    'sundragons',
-    'sundrenched',
-    'sundri',
     'sundstrom',
-    'sundsvall',
-    'sune',
-    'suney',
-    'sunfished',
-    'sunfishes',
-    'sunflower-seed',
-    'sunflowerseed',
-    'sunfree',
-    'sunfresh',
-    'sunfrock',
-    'sung-along',
-    'sung-ho',
-    'sung-hun',
-    'sung-wu',
-    'sungift',
     'sunglass',
-    'sungs',
-    'sungun',
-    'sungurlu',
-    'sunguza',
-    'suninder',
-    'suningas',
-    'sunipc',
-    'sunita',
-    'sunke',
-    'sunken-cheeked',
-    'sunken-eyed',
-    'sunken-terraced',
-    'sunkin',
-    'sunkletos',
-    'sunkness',
     'sunnah-shi\'ah',
-    'sunnalliance',
-    'sunni-based',
-    'sunnin',
-    'sunnisde',
-    'sunnism',
-    'sunnite',
-    'sunnites',
-    'sunniva',
-    'sunny-natured',
-    'sunny-side',
-    'sunny-tempered',
-    'sunny/shady',
-    'sunnybank',
-    'sunnydales',
-    'sunnylands',
     'sunnymeads',
-    'sunnys',
-    'sunos-compatible',
-    'sunos.',
-    'sunparks',
-    'sunpartners',
-    'sunpensions',
-    'sunphigs',
-    'sunproof',
-    'sunquest',
-    'sunraycer',
-    'sunrgy',
-    'sunrise**',
-    'sunriser',
-    'sunrooms',
-    'suns-',
     'sunsafe',
-    'sunsan',
-    'sunscorched',
-    'sunseeker',
-    'sunset**',
-    'sunset-citizens',
-    'sunset-defying',
-    'sunset-gold',
-    'sunset-lit',
-    'sunshaft',
-    'sunshafts',
-    'sunshield',
-    'sunshimmer',
-    'sunshine-filled',
-    'sunshine-like',
-    'sunship',
     'sunsidiary',
-    'sunsigner',
-    'sunsilk',
-    'sunsite',
-    'sunsite.unc.edu',
-    'sunsmite',
-    'sunsoft-sanctioned',
-    'sunsparc',
-    'sunsparcstations',
-    'sunstarred',
-    'sunstars',
-    'sunstealer',
-    'sunstone',
-    'sunstruck',
-    'sunsuit',
-    'sunswept',
     'suntense',
-    'sunter',
-    'suntop',
-    'suntree',
-    'suntrek-owned',
-    'suntruss',
-    'suntutor',
-    'sunup',
-    'sunvoxel',
-    'sunwashed',
-    'sunwatchers',
-    'sunway',
-    'sunwestern',
-    'sunwise',
-    'sunworks',
-    'sunworship',
     'sunworshipper',
-    'sunworshippers',
-    'sunzha',
-    'suoi',
-    'suomi',
-    'suonare',
-    'suozzo',
-    'sup&eacute;rieures',
-    'sup&eacute;rieurs',
-    'sup&ndash',
-    'sup&rehy;plementing',
-    'sup&rehy;plier',
-    'sup&rehy;pliers',
-    'sup&rehy;posedly',
-    'sup&rehy;pressed',
-    'sup-',
     'sup4',
-    'supa',
-    'supa-clean',
-    'supa-dupa',
-    'supa-scot',
-    'supa-tuta',
-    'supablocs',
-    'supadurable',
-    'suparmurad',
-    'supasinee',
-    'supaspeed',
-    'supatap',
-    'supatimber',
-    'supawrap',
-    'supd-dcm-fla',
-    'supe',
     'supe44',
-    'supelco',
-    'supended',
-    'super&rehy;discipline',
-    'super&rehy;fortunate',
-    'super&rehy;human',
-    'super&rehy;intendent',
-    'super&rehy;loading',
-    'super&rehy;natural',
-    'super&rehy;project',
-    'super&rehy;sanitized',
-    'super&rehy;structures',
-    'super&rehy;tough',
-    'super&rehy;vision',
-    'super&rehy;wicking',
-    'super-&eacute;litist',
     'super-/',
-    'super-10s',
-    'super-8',
-    'super-absorbency',
-    'super-absorbent',
-    'super-abundant',
-    'super-abundantly',
-    'super-accurate',
-    'super-aco',
-    'super-added',
-    'super-alert',
-    'super-alfv&eacute;nic',
-    'super-apostles',
-    'super-archers',
-    'super-athlete',
-    'super-baby',
     'super-bantam',
-    'super-bar&egrave;ges',
-    'super-bed',
-    'super-bid',
-    'super-bike',
-    'super-brat',
-    'super-budget',
-    'super-bull',
-    'super-bush',
-    'super-cafe',
-    'super-car',
-    'super-cheap',
-    'super-chess',
-    'super-chianti',
-    'super-chilling',
-    'super-city',
     'super-cleaned',
-    'super-cliff',
-    'super-collider',
-    'super-colony',
-    'super-commentary',
-    'super-communications',
-    'super-companies',
-    'super-company',
-    'super-computers',
-    'super-conciliatory',
-    'super-conditioners',
-    'super-converse',
-    'super-cosmos',
-    'super-dad',
-    'super-deluxe',
-    'super-dense',
     'super-depot',
-    'super-determinism',
-    'super-discrete',
-    'super-divisions',
-    'super-dog',
-    'super-domestique',
-    'super-domestiques',
-    'super-dreadnoughts',
-    'super-dynamic',
-    'super-effective',
-    'super-efficiency',
-    'super-energetic',
-    'super-ensemble',
-    'super-executives',
-    'super-expensive',
-    'super-exploitation',
     'super-ferries',
-    'super-fitness',
-    'super-forgiving',
-    'super-freighters',
-    'super-friedmanism',
-    'super-fund',
-    'super-funky',
-    'super-gallows',
-    'super-game',
-    'super-gape',
-    'super-gel',
-    'super-glue',
-    'super-golf-course',
-    'super-good',
-    'super-government',
-    'super-grid',
     'super-gs',
-    'super-hairy',
-    'super-hawkish',
-    'super-healthy',
-    'super-heroes',
-    'super-high-end',
-    'super-hip',
-    'super-humans',
-    'super-individual',
-    'super-industrialisers',
-    'super-inflation',
-    'super-insulated',
-    'super-intelligence',
-    'super-irons',
-    'super-jag',
-    'super-jam',
     'super-janet',
-    'super-lars',
-    'super-length',
-    'super-lice',
-    'super-licence',
-    'super-limo',
-    'super-linear',
-    'super-liner',
-    'super-long',
-    'super-lp',
-    'super-lucky',
-    'super-luxury',
-    'super-magnets',
-    'super-male',
-    'super-manager',
-    'super-market',
     'super-markets',
-    'super-masculinity',
-    'super-massive',
-    'super-mathematician',
-    'super-microcomputers',
-    'super-midddleweight',
-    'super-middle',
-    'super-middlewight',
-    'super-mim',
-    'super-mini',
-    'super-mini-computer',
-    'super-minicomputer',
-    'super-minutiae',
-    'super-mobile',
-    'super-monetarist',
-    'super-nationalistic',
     'super-numerary',
-    'super-observant',
-    'super-offspring',
-    'super-optimistic',
-    'super-orders',
-    'super-ordinate',
-    'super-patriotism',
-    'super-patriots',
-    'super-pel',
-    'super-personal',
-    'super-persons',
-    'super-phase',
-    'super-phosphate',
-    'super-pit',
-    'super-position',
-    'super-premium',
     'super-priorities',
-    'super-prix',
-    'super-productive',
-    'super-professional',
-    'super-pruf',
-    'super-psychic',
-    'super-quick',
-    'super-r',
-    'super-race',
-    'super-radiant',
-    'super-rats',
-    'super-real',
-    'super-realisms',
-    'super-realist',
-    'super-realistic',
-    'super-regionals',
     'super-ripe',
-    'super-rocket',
-    'super-route',
-    'super-sad',
-    'super-safe',
-    'super-saints',
-    'super-salesman',
-    'super-saleswoman',
-    'super-scale',
-    'super-scientist',
-    'super-scrummy',
-    'super-secretary',
-    'super-secure',
-    'super-seiner',
-    'super-selective',
-    'super-sensitivity',
     'super-servers',
-    'super-sexy',
-    'super-sharp',
-    'super-shows',
-    'super-shuttle',
-    'super-shy',
-    'super-sixth-form',
-    'super-sleek',
-    'super-sleuth',
-    'super-slug',
-    'super-smart',
-    'super-snap',
-    'super-soap',
-    'super-soft',
-    'super-solid',
-    'super-sophisticated',
     'super-spacecraft',
-    'super-specimen',
-    'super-speed',
-    'super-speedwing',
-    'super-spirituality',
-    'super-sprinter',
-    'super-stable',
-    'super-star',
-    'super-stare',
-    'super-states',
-    'super-stations',
-    'super-status',
-    'super-store',
-    'super-stores',
-    'super-strong',
-    'super-structural',
     'super-structures',
-    'super-suave',
-    'super-success',
-    'super-talented',
-    'super-tanker',
-    'super-tankers',
-    'super-tax',
-    'super-taxed',
-    'super-taxing',
-    'super-technology',
-    'super-territory',
-    'super-tidiness',
-    'super-tigre',
-    'super-trebles',
-    'super-trots',
-    'super-tsar',
     'super-twisted',
-    'super-tyrant',
-    'super-tyrants',
-    'super-villain',
-    'super-virile',
-    'super-vision',
-    'super-vote',
-    'super-wealth',
-    'super-weapons',
-    'super-weird',
-    'super-wide',
-    'super-wife',
-    'super-yacht',
-    'super-zen',
-    'super-zeppelins',
-    'super.capitalism',
     'super.professionalism',
-    'super386',
-    'supera',
-    'superabundo',
-    'superacid',
-    'superaclavicular',
-    'superactivates',
-    'superagent',
-    'superalloy',
-    'superalloys',
-    'superambient',
-    'superann',
-    'superantigen-induced',
-    'superantigen/mhc',
-    'superantigenic',
-    'superb.',
     'superbad',
-    'superbaddies',
-    'superbarrios',
-    'superbase',
-    'superbe',
-    'superbes',
-    'superbi',
-    'superbia',
-    'superbitch',
-    'superblock',
-    'superbly-crafted',
-    'superbly-designed',
-    'superbly-focused',
-    'superbly-located',
-    'superbly-paced',
-    'superbly-painted',
     'superbly-planned',
-    'superbly-run',
-    'superbo',
-    'superboard',
-    'superbonus',
-    'superbooks',
-    'superboot',
-    'superboron',
-    'superboss',
-    'superbowlers',
-    'superboy',
-    'superbug',
-    'superbus',
-    'supercala',
-    'supercalafradgealisticexpealidocius',
-    'supercalifragelisticexpialidocious',
     'supercalologilistic',
-    'supercandid',
-    'supercarb',
-    'supercasp',
-    'supercat',
-    'supercedes',
-    'superceed',
-    'supercelestial',
-    'supercentres',
-    'supercession',
-    'superchache',
-    'superchallenge',
-    'superchampion',
-    'superchannel',
-    'supercharge',
-    'superchargers',
     'superchef',
-    'superchefs',
-    'superchilled',
-    'superchrome',
-    'superchunks',
-    'superciliary',
-    'superciliosa',
-    'superciliosus',
-    'supercinq',
-    'supercluster',
-    'supercoil',
-    'supercolliders',
-    'supercolour',
-    'supercompact',
-    'supercomputer-level',
-    'superconduct',
     'superconsciousness',
-    'superconsortium',
-    'supercorpse',
-    'supercover',
-    'supercrap',
-    'superdancers',
-    'superdeli',
-    'superdepor',
-    'superdirectional',
-    'superdisco',
-    'superdog',
-    'superduper',
-    'supereagle',
-    'supereal',
-    'superego-precursor',
-    'superego-precursors',
     'superego-structure',
-    'supererogation',
-    'superfatted',
-    'superfeatherweight',
-    'superficially.it',
-    'superficies',
-    'superfin',
-    'superfines',
-    'superfirms',
-    'superflies',
-    'superfloc',
-    'superflop',
-    'superflous',
-    'superfluities',
-    'superfolk',
-    'superfoods',
     'superforce',
-    'superformance',
-    'superfortress',
-    'superforts',
-    'superfunk',
-    'superfury',
-    'superfused',
-    'superfuzz',
-    'superga',
-    'supergenerous',
-    'superghosts',
-    'superglues',
-    'supergreen',
-    'supergroupie',
-    'supergroups',
-    'superheat',
     'superheater',
-    'superheavyweight',
-    'superhelicity',
-    'superheliski',
-    'superhelix',
-    'superherb',
-    'superheroine',
-    'superhighways',
-    'superhorse',
-    'superhost',
-    'superhostess',
-    'superhot',
-    'superhybrid',
-    'superi&eacute;ure',
-    'superieur',
-    'superimposers',
     'superincumbent',
-    'superindendent',
-    'superinten&rehy;dent',
-    'superintendencia',
-    'superintendent-general',
-    'superintensive',
-    'superior-grade',
-    'superior-inferior',
-    'superior-looking',
-    'superior/inferior',
-    'superior/subordinate',
-    'superiora',
-    'superioritas',
-    'superioritate',
-    'superiority/humility',
-    'superiority_on_the',
     'superiors-those',
-    'superjudge',
-    'superjuice',
-    'superkeys',
-    'superkid',
-    'superkings',
-    'superlager',
-    'superlativeness',
-    'superlattices',
-    'superlife',
-    'superlinguae',
-    'superlingual',
-    'superlist',
-    'superloan',
-    'superloo',
-    'superloser',
     'superluminous',
-    'superlux',
-    'superma',
-    'supermalt',
-    'supermanager',
-    'supermar',
-    'supermarines',
-    'supermark',
-    'supermarket-commodity',
-    'supermarket-till',
-    'supermarket/the',
-    'supermarketing',
-    'supermarts',
-    'supermature',
-    'supermaxes',
-    'supermercato',
     'supermergers',
-    'supermex',
-    'supermice',
-    'supermicro',
-    'supermiddleweight',
-    'supermidsize',
-    'supermind',
-    'superminister',
-    'supermodel-from-brigadoon',
-    'supermon',
-    'supermoo',
-    'supermum',
-    'supernag',
-    'supernal',
-    'supernational',
-    'supernaturally-flavoured',
     'supernaturally-gifted',
-    'supernits',
-    'supernourissante',
-    'supernov&aelig',
-    'supernumary',
-    'superobesity',
-    'superordinate-hyponym',
-    'superordination',
-    'superorganized',
-    'superovulated',
-    'superoxide-generating',
-    'superoxides',
-    'superpaint',
-    'superpanel',
-    'superparc',
-    'superparticle',
     'superpatriots',
-    'superpex',
-    'superph&eacute;nix',
-    'superphoenix',
-    'superpiplined',
-    'superpit',
-    'superpits',
-    'superplane',
-    'superplonk',
-    'superpoint',
-    'superpolicy',
-    'superpolyhedra',
-    'superpop',
-    'superposability',
-    'superposes',
-    'superpowder',
     'superpowerdom',
-    'superprestigio',
-    'superproduct',
-    'superprofiles',
-    'superpup',
-    'superquarry',
-    'superquinn',
-    'superrace',
-    'superramp',
-    'superreader',
-    'superrealos',
-    'superrich',
-    'supersafe',
-    'supersaturations',
-    'superschools',
-    'superscribed',
     'supersecret',
-    'supersell',
-    'supersenses',
-    'supershifted',
-    'supershine',
-    'supershots',
-    'supersite',
-    'supersites',
-    'superski',
-    'superslide',
-    'supersmart',
-    'supersnaps',
-    'supersnoop',
-    'supersoap\'',
-    'supersonically',
-    'supersow',
     'superspecs',
-    'supersquash',
-    'superst',
-    'superstadium',
-    'superstaff',
-    'superstarish',
-    'superstars-in-the-making',
-    'superstations',
-    'superstimulus',
-    'superstition-free',
-    'superstition-riven',
-    'superstitionem',
-    'superstor&rehy;ed',
-    'superstrats',
-    'superstratum',
-    'superstress',
     'superstrings',
-    'superstrong',
-    'superstuds',
-    'superstuff',
-    'supersub',
-    'supersubjects',
-    'supersugar',
-    'superswift',
-    'supersymmetry',
-    'supertalented',
-    'superteens',
-    'supertheory',
-    'superthief',
-    'supertifo',
-    'supertransfer',
-    'supertrawlers',
     'supertricks',
-    'supertsar',
-    'supertuned',
-    'superunions',
-    'supervi&rehy;sion',
-    'supervillain',
-    'supervise.',
-    'superviser',
-    'supervisers',
-    'supervisor/',
-    'supervisor/superintendent',
-    'supervizing',
-    'supervoltage',
-    'superwash',
-    'superweed',
-    'superweight',
     'superwife',
-    'superwomb',
-    'superwomen',
-    'superxr',
-    'superyacht',
-    'superyachts',
-    'superyob',
-    'superzoom',
-    'suphachai',
-    'suphan',
-    'suphate',
-    'suphated',
-    'supinate',
-    'supination-pronation',
-    'supinators',
-    'supineness',
     'suplentes',
-    'suplex',
-    'suplied',
-    'supo',
-    'supp&eacute;e',
-    'supp&mdash',
-    'suppben',
-    'supper-plates',
-    'supper-room',
-    'supper-theatre',
-    'supper-trays',
-    'supperannuated',
-    'supperless',
-    'suppl',
-    'supple-bodied',
-    'supple-like',
     'supple-stemmed',
-    'supplely',
-    'supplement-and-section',
-    'supplementer',
-    'supplementum',
-    'suppler',
-    'supplest',
-    'supplicantem',
-    'supplicated',
-    'supplicatingly',
-    'supplicator',
-    'supplier\'',
-    'supplier-consumer',
-    'supplier-firms',
-    'supplier-independent',
-    'supplier-oriented',
     'supplier-purchaser',
-    'supplier.for',
-    'supplier/debtor/factor',
-    'supplier/lessor/lessee',
-    'suppliers\'',
-    'suppliers/customers/competitors',
-    'suppliers/manufacturers',
-    'suppliers/own-branders',
-    'suppliers/providers',
-    'supplies.',
-    'suppliment',
-    'supply&mdash;the',
-    'supply*',
-    'supply-',
-    'supply-and-demand',
-    'supply-bound',
     'supply-cables',
-    'supply-contract',
-    'supply-craft',
-    'supply-demand',
-    'supply-line',
-    'supply-lines',
-    'supply-related',
-    'supply-route',
-    'supply-system',
-    'supply-teacher',
-    'supply/',
-    'supply/charger',
-    'supply/management/distribution',
-    'supplyin\'',
-    'supplys',
-    'suppoise',
     'suppons',
-    'suppoosed',
-    'suppor-ted',
-    'supporessor',
-    'support&lsqb;ed&rsqb',
-    'support-base',
-    'support-fighter',
-    'support-gathering',
-    'support-level',
-    'support-post',
-    'support-raising',
-    'support-staff',
-    'support-structure',
-    'support-surface',
-    'support-system',
-    'support-trunks',
     'support-units',
-    'support-widows',
-    'support-workers',
-    'support.for',
-    'support/excuse',
-    'support/supplement/contradict',
-    'support/surface',
-    'support/workshops',
-    'supportability',
-    'supportative',
-    'supporte',
-    'supporter-supportee',
-    'supporters-normal',
-    'supportin\'',
-    'supporto',
-    'supportteam',
     'supporttrak',
-    'supportwatch',
-    'suppos',
-    'supposal',
-    'supposd',
-    'suppose\'',
-    'suppose-',
-    'suppose-the',
-    'suppose.',
-    'supposed-to-be-seductive',
-    'supposin\'',
-    'supposing&formula;1',
-    'supposingly',
-    'supposings',
-    'supposititious',
-    'supposssed',
     'supposte',
-    'suppot-reveilhac',
-    'suppports',
-    'suppresed',
-    'suppressed-carrier',
-    'suppresser',
-    'suppressio',
-    'suppressor/cytotoxic',
-    'supprimant',
-    'supps',
-    'suppuku',
-    'suppurate',
-    'suppurations',
-    'supra-',
-    'supra-authority',
-    'supra-departmental',
     'supra-imposing',
-    'supra-modal',
-    'supra-political',
-    'supra-rational',
-    'supra-realistic',
-    'supra-regions',
-    'supra-segmental',
-    'supra-sonic',
-    'supra-state',
-    'supra-terrestrial',
-    'supra-wealthy',
-    'supracrustal',
-    'supracultural',
-    'supradepartmental',
-    'supragingival',
-    'suprahistorical',
     'suprahyoid',
-    'suprailiac',
-    'suprainiac',
-    'supralaryngeal',
-    'supralegal',
-    'supramental',
-    'supramundane',
-    'supranationality',
-    'supraneural',
-    'supranucleosomal',
-    'supranumerary',
-    'supraphysical',
-    'suprapubically',
-    'supras',
-    'suprasegmentals',
-    'supraspecific',
     'supraspinal',
-    'suprasternal',
-    'supratentorial',
-    'suprathreshold',
-    'supraventriuclar',
-    'supremely-decorative',
-    'supremo.',
-    'supremum',
-    'suprenant',
-    'supresses',
-    'supressing',
-    'supressive',
-    'supressor',
-    'suprises',
-    'supsuned',
-    'suqs',
     'sur\'vey',
-    'sur-really',
-    'sur-tax',
-    'sur-titles',
-    'surabaya-johnny',
-    'surage',
-    'sural',
-    'suranet',
-    'surapee',
-    'surch',
-    'surcharge/expense',
-    'surcingles',
-    'surco',
-    'surd',
-    'surdej',
-    'surdeval',
     'surdevals',
-    'sure&rehy;footed',
-    'sure-all',
-    'sure-and',
-    'sure-founded',
-    'sure-that',
-    'sure-trust',
-    'sureclean',
-    'sured',
-    'surefast',
-    'surefire-winners',
-    'surefootedly',
-    'suregon',
-    'surement',
-    'suren',
-    'surenhusius',
     'sureplus',
-    'suresnes',
-    'surestart',
-    'suretonhie',
-    'surf-',
-    'surf-boarding',
-    'surf-boards',
-    'surf-chanter',
-    'surf-chanting',
-    'surf-check',
-    'surf-going',
-    'surf-lapped',
-    'surf-mad',
-    'surf-off',
-    'surf-rider',
-    'surf-riding',
     'surf-swept',
-    'surf/skate',
-    'surface-antigen',
-    'surface-brightness-diameter',
-    'surface-catalysed',
-    'surface-coatings',
-    'surface-coloured',
-    'surface-deep',
-    'surface-derived',
-    'surface-design',
-    'surface-dived',
-    'surface-dry',
-    'surface-effects',
-    'surface-electron',
-    'surface-enrichment',
-    'surface-facing',
     'surface-gleaning',
-    'surface-grammatical',
-    'surface-harden',
-    'surface-hardened',
-    'surface-immobilised',
-    'surface-induced',
-    'surface-labelling',
-    'surface-level',
-    'surface-litter',
-    'surface-mount',
-    'surface-of',
-    'surface-pattern',
-    'surface-perturbing',
-    'surface-plane',
-    'surface-positive',
-    'surface-read',
     'surface-run',
-    'surface-sensitive',
-    'surface-shoaling',
-    'surface-sized',
-    'surface-skimmer/solids',
-    'surface-skimming',
-    'surface-snatching',
-    'surface-sterilized',
-    'surface-syntax',
-    'surface-to-mass',
-    'surface-tow',
-    'surface/depth',
-    'surface/subsurface',
-    'surface/two',
-    'surfaced-size',
-    'surfaces.',
     'surfaces/safety',
-    'surfachem',
-    'surfacings',
-    'surfact',
-    'surfactant-coated',
-    'surfactant-polymer',
-    'surfactantsmay',
-    'surfacy',
-    'surfax',
-    'surfboard.',
-    'surfcaster',
-    'surfeit-swell',
-    'surfeiting',
-    'surfer-ex',
-    'surfer-turned-designer',
-    'surfer-type',
     'surfer.',
-    'surfiction',
-    'surfing-travelling',
-    'surfists',
-    'surflark',
-    'surforms',
-    'surfrider',
-    'surfynol',
-    'surg.',
-    'surge-free',
-    'surge-ride',
-    'surge-tide',
-    'surge-wave-shaped',
-    'surgeles',
-    'surgeon-sculptor',
-    'surgeon.',
     'surgeon/apothecary',
-    'surgeoncies',
-    'surgeons&mdash;a',
-    'surgeons-in-ordinary',
-    'surgeons-type',
-    'surgeres',
-    'surgery-box',
-    'surgery/five-day',
-    'surgical-type',
-    'surgically-enlarged',
-    'surgically-made',
-    'surgically-reconstructed',
-    'surgikos',
-    'surgitek',
-    'surgleon',
-    'suricates',
     'surienne',
-    'surikov',
-    'surimono',
-    'surintendant-g&eacute;n&eacute;ral',
-    'suristan',
-    'surival',
-    'surj&aacute;n',
-    'surjan',
-    'surjection',
-    'surkamp',
-    'surkh',
-    'surkhi',
-    'surkyn',
-    'surl',
-    'surley',
-    'surliest',
     'surls',
-    'surly-looking',
-    'surly.',
-    'surma',
-    'surmelin',
-    'surmisal',
-    'surmount&rehy;able',
-    'surnaturel',
-    'surnotes',
-    'suroi',
-    'suron',
-    'surovek',
-    'surp',
-    'surpassable',
-    'surpirsed',
-    'surpising',
     'surplice-shrouded',
-    'surplus*',
-    'surplus-kill',
-    'surplus-profit',
-    'surplus-value.',
-    'surplus/deficit',
-    'surprint',
-    'surpris',
-    'surprise-a-day',
-    'surprise-hushed',
-    'surprise-packet',
-    'surprised-looking',
-    'surprisingly-wide',
-    'surprisingness',
-    'surprize',
-    'surprsingly',
     'surr',
-    'surrah',
-    'surrealising',
-    'surrealistically',
-    'surrealized',
-    'surrend',
-    'surrendah',
-    'surrended',
-    'surrendeed',
-    'surrender-back',
-    'surrender/i',
-    'surrending',
-    'surrepitiously',
-    'surrepticiously',
-    'surrex',
-    'surrexit',
     'surrey-hampshire',
-    'surrey-yorkshire',
-    'surrey/hampshire',
-    'surrey/middx',
-    'surrey/sussex/hampshire',
-    'surrey/sussex/hants',
-    'surria',
-    'surrouding',
-    'surroundings.',
-    'surroundings/meeting',
-    'surroundsound',
-    'surrrrlllyee-noloan',
-    'surry',
-    'surso',
-    'surt',
-    'surta',
     'surtitles',
-    'suru',
-    'suruga',
-    'surui',
-    'surukuku',
-    'surur',
-    'survayor',
-    'surveillance-free',
-    'surveillance.',
-    'survery',
-    'survey\'',
-    'survey(ghs)',
-    'survey-data',
-    'survey-making',
-    'survey-type',
-    'survey-valuation',
     'survey-work',
-    'survey/research',
-    'surveyeng',
-    'surveyes',
-    'surveyor.',
-    'surveyor/loss',
-    'surveyorship',
-    'surveyorships',
-    'survged',
-    'survi',
-    'surving',
-    'surviv',
-    'survival-based',
-    'survival-conscious',
-    'survival-kit',
-    'survival-oriented',
     'survival-suited',
-    'survival.',
-    'survival/baby-doll',
-    'survivalists',
-    'survivance',
-    'surviviors',
-    'sury',
-    'sus-an',
-    'susa-funded',
-    'susa-run',
-    'susa-subsidised',
-    'susaaaa',
-    'susamyr',
-    'susan\'s',
-    'susan-shaped',
-    'susanah',
     'susann',
-    'susanta',
-    'susawa',
-    'susbstantially',
-    'suscepimus',
-    'susceptible.people',
-    'susceptibles',
-    'suscite',
-    'suseption',
-    'sush',
-    'sushi-making',
-    'sushil',
-    'susianus',
-    'susiciously',
-    'susies',
-    'susilo',
     'susiya',
-    'susko',
-    'suspeck',
-    'suspect(s)',
-    'suspect-list',
-    'suspecter',
-    'suspence',
-    'suspended&mdash;owing',
-    'suspended-animation',
-    'suspended.',
-    'suspended/marks',
-    'suspendered',
-    'suspendingness',
-    'suspendre',
-    'suspenison',
-    'suspense-comic-horror',
     'suspense-filled',
-    'suspensefully',
-    'suspensful',
-    'suspension-dots',
-    'suspension-feeding',
-    'suspensor-lifted',
-    'suspensorium',
-    'suspensors',
-    'suspensus',
-    'suspi&rehy;cions',
-    'suspic',
-    'suspiccions',
-    'suspicion\'',
-    'suspicions.',
-    'suspicious-sounding',
-    'suspicious/distrustful/watchful/keep',
     'suspiration',
-    'suspire',
-    'suspires',
-    'suspiscious',
-    'sussana',
-    'sussangkarn',
-    'susser',
-    'sussex-born',
-    'sussex-by&rehy;the-sea',
-    'sussex-made',
-    'sussex/surrey',
-    'sussies',
-    'susskind',
-    'sussmann',
-    'sussock',
-    'sussuration',
     'sust',
-    'sustain-but',
-    'sustainable\'',
-    'sustainable.',
-    'sustainable/organic',
-    'sustainably-harvested',
-    'sustaine',
-    'sustained-release',
-    'sustained-yield',
-    'sustainedly',
-    'sustainedness',
-    'sustainin\'',
-    'sustantial',
-    'sustead',
-    'sustem',
-    'susten',
     'sustention',
-    'sustermans',
-    'sustinebit',
-    'sustinui',
-    'sustinuit',
-    'susunan',
-    'sutaine',
-    'sutan',
-    'sutclife',
-    'sutcliffe.',
-    'suter-related',
-    'suter/veterinary',
-    'sutering',
-    'suthas',
-    'suthaus',
-    'suthen',
     'suthep',
-    'sutherland-anderson',
-    'sutherland/glasgow',
-    'sutherlandi',
-    'sutherlandish',
-    'suthers',
-    'sutherst',
-    'sutisna',
-    'sutker',
-    'sutler',
-    'sutnia',
-    'sutomo',
-    'sutona',
-    'sutovec',
-    'sutphen',
-    'sutsakorn',
     'sutta',
-    'sutters',
-    'suttling',
-    'sutton-born',
-    'sutton-in-ashfield',
-    'sutton-on-',
-    'sutton-on-sea',
-    'sutton-smith',
-    'sutton-upon-derwent',
-    'sutton-who',
-    'sutton/georgina',
-    'sutton/insurance',
-    'sutton/magdalen',
-    'sutton/oxfordshire',
-    'suture-lines',
-    'sutureless',
     'sutwana',
-    'suunto-ml',
-    'suus',
-    'suuuuck',
-    'suuuuuuuuuuiii',
-    'suvee',
-    'suvere',
-    'suvery',
-    'suwa',
-    'suwaida',
-    'suwandhi',
-    'suwanee',
-    'suwannagul',
-    'suwannaguluniversity',
-    'suwannaphume',
-    'suwar',
     'suwardjo',
-    'suwon',
-    'suyin',
-    'suykerbuyk',
-    'suyos',
-    'suypported',
-    'suzane',
-    'suze-la-rousse',
-    'suzerainty-treaties',
-    'suzumura',
-    'suzy-q',
-    'sv&ecaron;tl&eacute',
-    'sv&mdash;socialist',
-    'sv/88',
-    'sv40-transformed',
-    'sv40e',
     'sv4o',
-    'svaerdborg',
-    'svane',
-    'svankmajaer',
-    'svankmajer',
-    'svantesson',
-    'svar',
-    'svarog',
-    'svartifoss',
-    'svatopluk',
-    'svatopluka',
-    'svats&mdash;how',
-    'svavar',
-    'sve-developed',
-    'sveaborg',
-    'svedanya',
     'svegn',
-    'sveinsson',
-    'svejk',
-    'svendborg',
-    'svendsr&oslash;d',
-    'svengali-',
-    'svengali-related',
-    'svengalian',
-    'svennson',
-    'sveral',
-    'sverdlov-class',
-    'sverrisson',
-    'svestka',
-    'svetia',
-    'svetlaya',
-    'svetlev',
     'svetlogorsk',
-    'svetomir',
-    'svetoslav',
-    'svfs',
-    'sviatcheslav',
-    'svidler',
-    'svidligailov',
-    'svilen',
-    'sviridov',
-    'svirskaya',
-    'svishtov',
-    'svitavsk&yacute',
-    'svitit',
-    'svlp',
-    'svm',
-    'svoa',
     'svobodnoe',
-    'svoi',
-    'svojlsvoja',
-    'svojo',
-    'svolvar',
-    'svorad',
-    'svp&mdash;south',
-    'svp/udc&mdash;swiss',
-    'svq/general',
-    'svr.4.2',
-    'svr4-compatibles',
-    'svr4-derived',
-    'svr4-loving',
-    'svr4-on-mips',
-    'svr4.1/es',
-    'svr4/mp',
     'svr4mp',
-    'svr5',
-    'svt15ev',
-    'svtar',
-    'svts',
-    'svx',
-    'svyatoslav',
-    'sw-ne',
-    'sw-slant',
-    'sw-sweden',
-    'sw.fr',
-    'sw1.',
-    'sw142',
-    'sw143',
-    'sw225',
-    'sw23',
     'swab-on-a-stick',
-    'swabey',
-    'swabians',
-    'swad',
-    'swaddles',
-    'swaddling-bands',
-    'swadelands',
-    'swadling',
-    'swadlingcote',
-    'swae',
-    'swaefberht',
-    'swaen',
-    'swaffield',
-    'swag-bag',
-    'swaged',
-    'swaggerstick',
     'swaggy',
-    'swahiliization',
-    'swahililand',
-    'swaihwe',
-    'swails',
-    'swain/son',
-    'swainmote',
-    'swainsonii',
-    'swaithe',
-    'swakopmund',
-    'swalcliffe',
-    'swalecliffe',
-    'swaleness',
-    'swales/',
-    'swales/director',
-    'swalesmoor',
     'swalla',
-    'swalloed',
-    'swallow-tail',
-    'swallow-tails',
-    'swallowfield',
-    'swallowing-',
-    'swallowings',
-    'swallows.',
-    'swallows/min',
-    'swami-of-the-month',
-    'swaminathan',
-    'swammerdam',
-    'swamp-covered',
-    'swamp-dozer',
-    'swamp-dweller',
-    'swamp-dwellers',
     'swamp-fever',
-    'swamp-flies',
-    'swamp-forest',
-    'swamp-hunter',
-    'swamp-infested',
-    'swamp-ridden',
-    'swampers',
-    'swampie',
-    'swamping-power',
-    'swamplife',
-    'swamps.',
-    'swan-bows',
-    'swan-ganz',
-    'swan-home',
-    'swan-like',
-    'swan-necks',
     'swan-shaped',
-    'swan-songs',
-    'swan-white',
-    'swan/consultant',
-    'swan/explorer',
-    'swan/light',
-    'swan/nuclear',
-    'swanal',
-    'swancott',
-    'swane',
-    'swangard',
-    'swanherd',
-    'swaniesville',
-    'swanke',
-    'swanked',
-    'swanker',
     'swankers',
-    'swankier',
-    'swankwords',
-    'swankyhouses',
-    'swanmore',
-    'swanmote',
-    'swann/allergy',
-    'swann/gemma',
-    'swanney',
-    'swanny',
-    'swans&rehy;down',
-    'swans-down-trimmed',
-    'swansea-born',
-    'swansea-style',
-    'swansea14',
-    'swanson/dugdale',
     'swansons',
-    'swansuo',
-    'swantantra',
-    'swanu',
-    'swanwhite',
-    'swapdisk=',
-    'swapdisk=in',
-    'swapo-democrat',
-    'swapo-drafted',
-    'swapp',
-    'swappable',
-    'swappers',
-    'swapshops',
-    'swar&amacr;j',
-    'swarbrook',
-    'swarded',
     'sware',
-    'swarfham',
-    'swarkestone',
-    'swarling',
-    'swarme',
-    'swarmes',
-    'swarmin',
-    'swarmy',
-    'swaroop',
-    'swarovski',
-    'swarowsky',
-    'swart-elandre',
-    'swarth',
-    'swarthy-complexioned',
-    'swarthy-featured',
-    'swartland',
     'swartruggens',
-    'swarts',
-    'swarttouw',
-    'swartzenegger',
-    'swarup',
-    'swarzenegger',
-    'swarzentruber',
-    'swas',
-    'swasa',
-    'swash-buckler',
-    'swash-lettered',
-    'swashbuckles',
-    'swashed',
-    'swashing',
-    'swashplate',
-    'swasorie',
     'swastici',
-    'swastika-flagged',
-    'swastika-like',
-    'swastika-patterned',
-    'swastika-wearing',
-    'swat-the-fly',
-    'swather',
-    'swathing-clothes',
-    'swatman',
-    'swatons',
-    'swatragh',
-    'swattest',
-    'swavesy',
-    'sway-backed',
-    'swayable',
-    'swayamsevak',
     'swayback',
-    'swayfield',
-    'swaynes',
-    'swayze/goldberg',
-    'swazis',
-    'swd-funded',
-    'swe*',
-    'swear\'',
-    'sweared',
-    'swearer',
-    'swearingen',
-    'swearinger',
-    'sweat\'',
-    'sweat-curled',
-    'sweat-darkened',
-    'sweat-dewed',
     'sweat-filmed',
-    'sweat-free',
-    'sweat-grey',
-    'sweat-lt-off',
-    'sweat-marks',
-    'sweat-plastered',
-    'sweat-raising',
-    'sweat-soused',
-    'sweat-suit',
-    'sweat-top',
-    'sweat-wet',
-    'sweater/jacket',
-    'sweatiest',
-    'sweatin\'',
-    'sweatiness',
-    'sweating-arguments',
     'sweating.',
-    'sweatings',
-    'sweatit',
-    'sweatless',
-    'sweatman',
-    'sweatshirt-like',
-    'sweatshirt.',
-    'sweaty-faced',
-    'sweaty-fingered',
-    'sweden-but',
-    'sweden-denmark',
-    'sweden/finland',
-    'sweden/norway',
-    'swedenborgian',
-    'swedenborgianism',
-    'swedenborgians',
     'swedeoborgian',
-    'swedges',
-    'swedish&mdash;polish',
-    'swedish-designed',
-    'swedish-financed',
-    'swedish-soviet',
-    'swedish/',
-    'swedishness',
-    'swee&formula;ng',
-    'sweeeeet',
-    'sweeeet',
-    'sweeing',
-    'sweeling',
-    'sweemer',
-    'sweeney/chairman',
-    'sweeney/st',
     'sweeney/strathclyde',
-    'sweenie',
-    'sweep-picking',
-    'sweep-the-mouse',
-    'sweep-through',
-    'sweepable',
-    'sweeper-up',
-    'sweepers-up',
-    'sweepin\'',
-    'sweepingness',
-    'sweepover',
-    'sweers',
-    'sweet\'n\'sour',
-    'sweet-\'n\'-sour',
-    'sweet-an',
-    'sweet-charactered',
     'sweet-cheeked',
-    'sweet-eating',
-    'sweet-grass',
-    'sweet-guzzling',
-    'sweet-heart',
-    'sweet-hearted',
-    'sweet-life',
-    'sweet-meat',
-    'sweet-meats',
-    'sweet-papers',
-    'sweet-ration',
-    'sweet-seller',
-    'sweet-sellers',
-    'sweet-sharp',
-    'sweet-spic',
-    'sweet-spot',
     'sweet-sweat',
-    'sweet-swinging',
-    'sweet-talkin\'',
-    'sweet-thighed',
-    'sweet-water',
-    'sweet-wrappers',
-    'sweet-zephyr',
-    'sweet/a',
-    'sweet/gentle',
-    'sweet/gloucestershire',
-    'sweet/savoury',
-    'sweetback',
-    'sweetbag',
-    'sweetbaum',
-    'sweeteners.',
-    'sweeter-natured',
     'sweeter-smelling',
-    'sweeter-sounding',
-    'sweetest-natured',
-    'sweetgirl',
-    'sweetheart-wife',
-    'sweetie-shops',
-    'sweetinburgh',
-    'sweetish-sour',
-    'sweetleaf',
-    'sweetly-damped',
-    'sweetly-smiling',
-    'sweetnam/calgary',
-    'sweetners',
-    'sweetness-and-light',
-    'sweetnesses',
-    'sweetpotato',
     'sweets-jar',
-    'sweets/silver',
-    'sweetsap',
-    'sweetser',
-    'sweetshop-newsagents',
-    'sweetsir',
-    'sweetsour',
-    'sweetspot.',
-    'sweetspots',
-    'sweetums',
-    'sweetwall',
-    'swega',
-    'swegan',
-    'sweif&ndash;cairo',
-    'swell\'st',
-    'sweller',
     'swellest',
-    'swelling.i',
-    'swellsian',
-    'swellulose',
-    'swelt',
-    'swelters',
-    'swelterweight',
-    'swemix',
-    'swenarton',
-    'sweno',
-    'swepe/balista',
-    'swept-delta',
-    'swept-tee',
-    'swept-volume',
-    'swer',
-    'swerdbreke',
     'swerde',
-    'swerdis',
-    'swetka',
-    'swetly',
-    'swettenesse',
-    'swettie',
-    'swetyng',
-    'swetz',
-    'swg',
-    'swhere',
-    'swi4',
-    'swiahart',
-    'swiat',
-    'swidden\'',
-    'swidden-fallow',
-    'swidger',
     'swidhart',
-    'swidlan',
-    'swiers',
-    'swietalski',
-    'swiety',
-    'swift&rehy;heeled',
-    'swift-armour',
-    'swift-changing',
-    'swift-footed',
-    'swift-footedness',
-    'swift-like',
-    'swift-running',
-    'swift-rushing',
-    'swift-talking',
-    'swift.it',
-    'swift/celia',
     'swift/dentist',
-    'swift/swiftfury',
-    'swifter-moving',
-    'swiftian',
-    'swiftitude',
-    'swiftly-flashing',
+)
+
+blocks_54 = (
+    '\'&player((romoting\'(rankings(&elated\'\'seekers(\'pecific(&ymbols\'$then&".6&(/on-loan&"28&#_in&#ful%%t-ory&!a',
+    '(*designated(#law(&making\'"s.&0orily-entrenched(\'y-based)1/quasi-regulatory$$view$$well%$orks#"ub%!i%"li$"ce$$ding',
+    '$)ffer-bern$+nch-thighed\'"es\'$less%$ford%*ton-on-wye(0/gloucestershire$$rday(!.%!o$"ss$$tche#"va$"by$$dene',
+    '%$dene$%itsky$"ne$&ordale%!v$$ridi%$opoi(+palopuladis&#ula#,w&rehy;berry$#ard$#ell$%inski$#kis$#ski',
+    '$)/atlantic%$volt#-y&lsqb;s&rsqb%-mdash;perhaps$!\'$\'-awakes%$cool%(in-touch%%maker*!s%"on%$slim%$true&"us%$warm',
+    '$!d$#ed.%"th$"in$#ley$%maker&!n$#res$%sharp$\'t/lorry%(e/former\'$wife%"on#"zi%#oni',
+    '"-b&mdash;state"&c-616w#%okton"#d\'s#!.#\'825-829#\'man.002)!3#!x#!y"*e&uuml;ren#)-adresse.$&claire%$roix##ad.',
+    '%#ham%$icam&-ly-decreasing))expanding)\'growing)&larger)&rising&#ng\'%+man-hawkins%"y-\'$eyed\'\'flowing\'\'gravity&#ish$$gall',
+    '&%knife&#red%"er$"le&!d&#ing%\'ing-and(!.&"te%-th/mitsubishi$,m&rehy;baths+(operated,!r+\'powered+\'rolling',
+    '&#age\'*nd-gravity&%based(#ths\'$oats($iler&)carriages\'&harter\'$lean\'#oal)#ted((llecting((mpatible&&diesel&\'engined',
+    '\'%roove&\'haulage*#ed.\'#eat*%-only\'$ouse&$iron&(jacketed,#ing&%laden&$mill&&palace\'$ipes\'%lough\'&resses',
+    '&Fradio-stanley-holloway-meets-flanders-\'(ollering&&shovel\'$lick\'&meared\'$tyle&$town\'\'raction)#ins\'"ug&"up&&worked\'\'reathed&$xxxx%*/convected',
+    '&$lego%\'boating%\'cleaner%+er-landings(%quays\'$_out%&heated%"ie&"n\'\'#ess\'$g-up("ly%$punk%&raiser&$ooms',
+    '%%y-ish\'&shrill$$nbow%#son$!r%"es%$mans%!o$\'torrhea#*b&aacute;n$%bings))/wildlife$#son#(chelberg$$kler',
+    '#&dcombe$%efast%%lijke$&fastly$#ham$$lijk%#ock#$eghs$#kit$-l&ndash;liner,&making&,rehy;workers%!*%!-&-against-steel',
+    '*$soot\'%rched&$band*!s(#sed\'%illet\'$lack\'$uilt&%caped(%sting\'#lad(%osure\'%utter&(designed&$eyed',
+    '\'$rame\'\'urnaced&$gray&&headed\'%ulled&(jacketed&&legged\'$ined&(on-steel+#one&(panelled\'%lated\'&ointed\'%rowed&$rope',
+    '&%scale\'$harp)\'ttering(\'uttered\'%piked($rung\'&temmed&$toed(#ugh\'#rap\'#ube&$work*"er,!s%)/concrete',
+    '&&trader%"72%(e/family&!r&%stown&!y%$face%&hammer&#ead\'"el%#ier&"te%%maker\'!n\'%sters',
+    '&#ill%"on%"th%$well%&y-blue\'$eyes\'$grey\'&haired)"rd&#ard$%nbeek\'"rg%$huis%"is%%kolen',
+    '%#wyk$,p&rehy;blind+%sided%\'-angled&&banked&\'flowing&&gabled&&roofed&&walled%!e&(lchasing%#ian&!e&"n\'\'"gs',
+    ')%haser.!s(&hooded($like\'&chased,!s&(y-banked(\'coombed((inclined((pitching(&rigged*$sing%!s%$ways$,r/commanding',
+    '%+age-changes)%drill%#ers%#ina\'\'g-angle)%boxes*%riefs)*wheel-type&!o%"os$+tley-tarmac(\'/tarmac&!y$!v%"en',
+    '#*f-and-hugo$,an-boltzmann&#_so&"ak&#dis&"ek\'!l&#ick\'#dis\'&ensaal\'"na\'!s&)o.courage\')vi&cacute)"cz',
+    '&"us$$enel$#fel&\'nsmeier&!s%\'i-crazy&!e&,sburgstrasse%!y$"ik$#nir#"ge%#man$#gle$+m&uuml;ller',
+    '$!s%#man#$hura#"id$!f$!g%"en\')bergerhof$$jger$%lhang$#mle$(n/fowler%"am%&bacher\'#uer',
+    '&%runer%\'dachner%$enes\'"ii&"rs%$fels%%gberg&%esser&(ladstone%&hardts&+ouse/friend%"ie&%tzian%"le%#man',
+    '%&trager$!r$!s##kel%%njokk#!l$!a$"en%!s%"th&#sky$\'l-ar-ta%&ablaze&$dine&)riaefolia',
+    '%&enbosh&"ri\'%oidea&!x%#ine\'%gwert%#man%#ung%$waag&#egg$#ton$"ux$%zmann#\'m+affix$%-cell',
+    '%%group%&miners%\'rotting%#tip$$etil$$head$&matics%!e&"d\'&!r%!y$$pein$"s.%%heets#%n-gun',
+    '%$lees%+ulorhynchus$$bury$%chful%$iled\'&lizing$$ella$"ga%"el&!r%"th$%krith$#ner%$ing.$!o',
+    '%\'cephala%\'graphed+"rs*!y%#mus%+nychosaurus%(rhynchus%(thecoids($rmic&$opic(!y&$ypic$(si&ocirc%$land%$naes',
+    '$$ters%"or\'*ian-lunged(%ously$#ura#&p&lcub%0rehy;grandmother*-relationships$)-aerobics&\'nd-scan\'#tic&#unt%%child&(ompliant&&utting',
+    '\'%ncing\'\'ughters%\'fathers&#ree%*grandchild*(daughter2!s*&father%&length&%ittle%$neck%#out%#p-e%)relations%\'sibling',
+    '\'*ster-to-be&\'kippin\'&#ons&&toning("ol*!s%%uncle&"ps$&.angle%#the$%/half$$anek&#kov$\'by-step$#day',
+    '%#ord%$rame$,grandmothers$(hanandra(!s\'"es\'"ia\'&oaetus(&discus(!i(&polous(!s\'!t\'"um(&riasis',
+    '\'.s-on-the-cliff()/families)"pa)#raf))solicitor(#on.*)/connolly+!p+&thames&"rd%"on$"in$$kids$#ler&$ssly',
+    '*$-she$#out$.p&lsqb;ed&rsqb%%arent*(s-in-law%\'e-lands(#ike&)d&rehy;up\'$_out&(r-motors%,ing&rehy;off(*-backwards)$down(!s$&s-down',
+    '%$/min%!d%)on-in-law$!t$&ulvage$#way#\'raloids%#zin$#bak%(errkunde$\'coranus(&riidae\'"ia%$ulia$%dship',
+    '&)-cassette(\'hemical()ontrolled\')isomerism\'\'quality\'%ready)(gularity)%lated\')selective\'%types&%/mono\'&tv/vhs&&acuity&(chemical."ly',
+    '&(diagrams&%grams)%phics+!s&&isomer,"ic-"sm&$nets&$pair\'%honer*/ically-internal*!y\'+rofilometry\'%ticon,!s',
+    '*!y\'(elective\'+pecifically\'%trips&)taxically\'%ypies*)fications&$view($sion$&ically%!e%/le-naturalistic(-towel-covered&&iserin)!s',
+    '%"od\'!s&+lithography&#tis%$seal$!k%!e$%lands%"et%Bing&mdash;us&dollar=g&pound;0.6191("+2(,-deutschmark)\'holders)\'related)$type',
+    ')+deutschmark&%tamak\'$omak$$n(3)%&-cabin($stle&(featured&\'gerlach&(mounting&&sheets\'\'ounding%$/bob&)partridge%&bergea*!r',
+    '%#ess%%faced%$hold%$igov&$nae.&#tes%$less&&y-held%0o-cleido-mastoid&.cleido-mastoid\'%oxals&&pleura+#ite&)rrhynchan&$tomy',
+    '%*um-ceiling%%wards&&heeler&#ood$!o%\'id-free(\'induced*&jected(\'treated\'!.\'"al&%somer%)l-binding%*microscope%%typed',
+    '$!r%%eggov%#ing&!t%!s%%y/vet$(torously*$ness$"zi##sia$"so#(tch-pole&$ford$#ham%"em',
+    '$&igkeit%!n$\'sasonic$%tiner\'#ius#%uerle$!l$#mer#&vanage$"e\'%)/prisoner%&n/east&%graph&)s/drummer(&garden',
+    '((managing+*ufacturing()neighbour((publican(\'rangers(&thames)$rail\'-on-eisenhower)(/harrier*$keri\'$town%!o%!s$"is$"ka',
+    '%%crock%#pan$.ard/stewardess\'!e\'.s/stewardesses&0t-cleary/malvern(%david(&hunter(+richardsons(&wilson\'".i\'+/cambuslang))ontestant((director((featured',
+    '(%nacro(&parent)$eter).hysiotherapist()sovereign(#vet\'"by\'"ia(!s\'*s-melville(&/crazy$%sides$!y#!y$&nbergh',
+    '""fw",g&pound;1.07+"05+$91.4*%200.1"&heeman$(nelaidas")ibbington%#les#!c$\'gridloc$%hbury%"es%#ill%$mass',
+    '%!t%"um%$wort$,k-and-carrot*#dog*&rudder&&figure&$head&.in-the-muddish0!s($sect&\'licking&%maker(!n\')icrophone',
+    '&$nest&&pinned&\'signals&>that-in-your-pipe-and-smoke-it&&waving%#ado%$back%"ed&"r.\'"ed&!y%$ford&"ul%#ied&"n\'',
+    '\'\'g-place*%oints($_out(\'plaster%)lebacking+"s.\'!n\'$path\'*r/observer%#men%&pinned%$roth%%s-man&(/skewers&$torm',
+    '%$work%\'y&ndash&$-out\'&palmed)#per\'&rubber\'%taped(%ipped\'#wet&!.&#out$$tion#*ebel-stein$#dry$!f',
+    '$$like$$rman##fel$-f&rehy;lipped%,-and-starchy&&bodied\'&rimmed&(collared(&rseted&&framed&-in-the-saddle&%kneed&$leaf\'#ike\'%ocked',
+    '&%soled&%tails&,upper-lipped/!s%"ed&#lio&)r-shafted%#ies%"le&1y&mdash;constanza%&necked%#ord%%tails%-upperlippians$!t',
+    '$"yn#)g&rehy;ma$"er$*ioglomerus$&matism\'\'ogobius(%myces#"ke$"hi$#kes#%lbene%\'oestrol$"ed%$hall%+tto-bearing',
+    ')\'pointed)\'wearing$&fragen$1l&mdash;americans&*rehy;large%!\'%\'-active\'$live&&bitter\'\'leeding((ossoming("ue\'&urning&\'cameras\'$lear',
+    '&(daylight\'(eafening(\'clining(&serted(;termined-to-bust-the-fucker\'&impled(%stant&,earth-grimed\'&choing\'(mpirical\'\'nduring(&ormous\'(ulogised\'\'volving\'\'xistent',
+    '($tant&(faithful(%lling(&miliar\'\'iddling\'$resh\'#ull&&gaoled\'"ot\'&reater&%human\')ysterical&(immature(\'portant)\'risoned',
+    '((sensible)&urgent\'+rresistible&&larger\'$ight(\'ngering($quid(&terate\'%ocked(#wer&\'married(&turing\'\'ildness\'$oist($ving',
+    '\'&eutral&(occupied\'+utstretched&+palpitating\'&icture\'&opular($tent\')ractising(%ivate&)quivering&(rarefied\'+ecognisably(&sident\'$ooms\'%uined',
+    '\'%canty\'%ecret(%eming\'&hapely((uddering\'(immering\'\'keletal\'%leepy($oppy((umbering\'*mouldering\'\'pinning\'%tuffy&\'talking\'(hrobbing',
+    '\'(raceable&+unannounced)(vailable(&beaten(*discovered()explained(%known(&packed((resolved(%spent\'&pright&%valid\'$exed\'&isible&\'waiting',
+    '+*s-run-deep\'"et\'#ild(\'thering&%young%!/%#_in%!a&"ci&"ge&#tus%%born.)!s%#eth&(xpanding',
+    '%$yans$#son%$tead$+t&rehy;like%\'-makers&)sandpiper&\'walking%&edness%#men%"s.%$walk)#ers%!y$"us#"mm',
+    '&!r$$pfig$$sons$)ulability\'!e\'-nts/addiction\'-ted/mindblown&"i.&\'taneous-"ly&(us-array)+information)+recognition+(inforcer)*synonymous',
+    '%"ed$!c%#har$!e%$hour$"g\'%!-&#ray%$aree%%ebags&!l&$more*+/competitor%(ing-cell)\'nettles',
+    '%0ray/thunderbirds$(k-bombed%%bombs%#ier\'"st&$ngly%,o-paralytico%#pot%%waves&#ood%\'y-winky$$ston$&t-type%#ed.#\'pendary',
+    '$$ites&"is$$ular\'#tio*$n(s))"ve#,r&rehy;fried$&-crazy*!\'%%fries$#fry$"ik$-ling-american)%based)(designed',
+    '(%fauld(+shire-based$!n$!p$&red-up\'&:jones&$r-up%#ick&!d&%ng-up(%/dull%\'up-cups(\'handles)&olding($jars',
+    '(%style#$sted%&ically#)tch-holes\'\'in-time\'#ups\'$work&%combe&%ed-in)#out)"up\'"rs\',s-in-waiting&#in\'("gs',
+    '$#ton$#zel#"va$#ens#$wdio#!x"(jemquist##ohn"!k#%m2000"&lg1.8m%$0.8m%$2.2m%"3m%$4.1m',
+    '&"8m%!m$"3m$\'475,000$$5.5m&"9m%&00.000%!m$$6.5m%!m$$7.4m%%5,000$$8.6m$!9%#.3m',
+    '"\'ma20700%$3800#\'t-lamps#\'ulation"$ndrd"%oated#%baeus$!b$%inian$!o%#oms%%rough$%shiel%$well&#ood',
+    '%(iometric+!y$.k&ndash;taking&,rehy;brokers%!\'%!*%!-&*adjustment&&basket\'%owler\'\'reeders\'\'uilding&\'checker+#ing\'#ube',
+    '&\'farming\'#eed\'*orecasting&&getter&\'killing&)marketing&&option\'#uts&\'picking("le*!s)#ing\'$rice&\'rigging&%takes',
+    '&$whip%#.at%0/aitken/waterman&(delivery&\'england&(letcombe&$wine%!_%$aree\'#ton%#bag&$oker&\'reeders*#ing\'%idge.',
+    ',$film("ok&$uild\'*rn-on-tees%+er/wildlife\'!s(#ton%$feed&#ish&(ord/head("th%$hach\'&ndling&#ill&*olm\'-style',
+    '%&iemuir&"ll&!n\'!\'\')g-filling)#top,!s(\'/oxford(&fillas)#ord(#gut($less&"sh\'\'ts/page%&jobber',
+    '&%fishe&#man%$lake\'"nd%\'manship\'-rket-listings,\'punting,\'support\'#yer%#out%#pak&%erson&$ort.)!e\'"ts',
+    '&\'crapers&%heets&$till%\'takings&3on&ndash;darlington(+-darlington)#on-))upon-tees(!.($ians(!s%3well/manager/oxford*&womens&#hip#!d',
+    '$$gill\'!y$%marsh#%eckel&"le$!d$"kl$%lting$"mp$"ps$%rhead$#ung$#ver#\'ffagers#&hlgren',
+    '#"ia%!n$#ber$0c&rehy;christian%/al-witty-rueful\'/ly-not-giggling%%hedon\'#ion&*iometrical0"ly-"es&"os$%nking$#res$%tchov',
+    '#0ke&rehy;on-trent%!-&-d\'urbervilles&)jewington&*mandeville&)newington&.on&mdash;trent&*sub-hamdon&*upon-trent%,/oxfordshire%!1%&holder%&s/king\')macintyre&"ay',
+    '&)ley-based%)watchford%!y$"ie$#kan$)le/victim%#osa#+l&eacute;ru$"\'n$%arska(!i&"zy%"ta\'!e$$berg',
+    '&$.the("wo%!y$#fus$"le&$n(s)&(rcoaster\'!y&!y%$haus%%inger%#man%$ting$!n%"es',
+    '&\'iferous$"ph%$orts$!s$$tzer#2mach&rehy;churning\'+-churningly)(lenching*)utchingly((dropping(\'located(#pit($spin()turningly)\'wisting',
+    '\'&/belly\'(churning\'#ics%%titis$#ich$$meln$\'palongs%#in\'%!o%!y#%ndeth$\'e&ndash&,rehy;flagged%)-a-second\'(nd-earth',
+    '*&wattle\'%rched&%blind\'%ridge&%carts)$ving\'\'hoosing\'\'ladding(&eaning\'1old-sober-seeming)%oured\'#rop(&ushing\'$ults(!t',
+    '&$face\'%illed\'#lux\'&ounded\'&ronted&%giant&&headed)"rt(#nge&$look&(merchant\'&illing\'#ute&$numb&(on-stone',
+    '(&tching\'\'ounding\'$roof&&quarry,#ing&$rows&&silent\')kittering\'\'linging)"ps\'\'melling\'$till*#ted&%throw+"er',
+    '&%until&&veined&$wall*#ers\'#ebb\'#igg\'&rought&$yard%)/daughter&$head&*manageress\'\'usician&&oxford&\'project\'%ublic',
+    '%$acre&"ge&%rched%%balls&$ird\'&&orough&\'reakers%&carver&%hats.\'%ipper)!s\'&uckled&"ot%%falls&&lagged',
+    '&$eads\'$nges&$ills%$like&&y-webb%*man-hunter%%s-ian&%mason%\'thrower&!o%\'wallers\'#res\'%shing\'!y&&orking',
+    '&$ards&$ford&$hill&,thorpewonder&$well$#ger$$ings$"ne$\'y-broke&$eyed&$iron*!s&&seeded&\'visaged%%brook',
+    '#!o$$d\'st%!e%%leigh\'!y%!y&%-west$\'ge-like&!d&1s-meets-beefheart\'!.$#key$%ls/wk$!m$!n',
+    '&%kneed%,ed-muttering$!r#(p&dollar$!\'$)-all-wars&%nd-go)%start&&t-home%\'breaker%\'deleted%%ended%#her%&lights\'"st',
+    '%$offs&$rder&"ut%%press*"es\'&obably&&unched*#ing%$rate&"ot%%signs&&moking&#top%#the&#ime',
+    '%\'watches%#you$\'/starts%$till&%uffin$%check$%forde$#her$%light&#sts$*p&eacute;d%!a&"ni%\'ed-flow(#out',
+    '&!l&\'r-inner%(ing-down))off-point)%train)"up("ly%$orte%!s$$s-he$!t#!r$)age-racks)#oom($type',
+    '()retrieval(\'serving\'&server\',tek-designed%#ndt&!i%!o%!x$"dy$)e-address\'3nd-control-register*\'forward&(building&)cupboards&\'flanked',
+    '&&houses&\'opening\'%wners&%place&/room-of-secrets&$yard%\'.pieces&\'richard%%/sale%&bought%)cupboards%$d-up%&fronts%&house.%.man/mechanical',
+    '%-requesttimout&/oom-cum-gallery%%s-all\')buildings&&.bulbs&(econdary%$wall%,y-colonnaded\'&gibson\'%moore&\'/county$,fj&auml;llet$$hund$2ies-within-stories\'!.',
+    '%%ngham%#oni$%k/the%%yrkan$\'m&ndash%*-avoidance&(battened+#red\'$each)!t\'$lown("ue\'$ound&&centre\'&harged',
+    '&&filled\'(ractured("ee)(quencies(#ont&)generated\'"od&(harbours\'"it&\'induced&\'lantern("sh&$nagy&\'ravaged\'%insed',
+    '\'&ignals($lver\'&tation(#yle\'&wollen&(tracking&%water%"ay%$cock%"es%+f&uuml;hrer%"in%)ont-based("h-%&ridden',
+    '%&shield%%troop%%winds$,r/consultant%"ar%%s-fox$+tford-based$"y\'%!-&&ballet\'$oard+%-like\'\'uilding&*continuity*&racted',
+    '\'$ycle&-documentaries&\'hearing\'$ours\'&unting&$land\'(isteners&)maskelyne&\'reading&\'showing\'%o-far&\'vanessa&$wise\'&riting%!.',
+    '%\':7.30am%#_as%-book-by-henty*%guide*#his%$tell)#er\'##sic##ten%%sbury$!h$*ter/victim%#ies&"n\'\'!g',
+    '#$uffe$&ghton.$"ng$"p\'$%rdale%$geon%%paine$(t-bodied&$made&(sticking(%owers%*est-billed%\'hearted%"ie&"sm',
+    '%(ly-built((defended%!z#+ve-blacking&&enamel&\'fiddles\'%ronts&$like%!n%)s/heaters$#ing%#old$#old&$osov#)w-cum-quy',
+    '%"rd$)ell-brown$&jowski$$lugs$"ne$%ridge$$ting##yil$"le$!s"#prm",r&ndash;tegy$(ouml;bel)%mgren)*vt&aring;g',
+    '#+abane-based$!c%&h(1.9)&$-dol&).gif.uu.z&&/batty\'#mgt\'%rocky&!a\'8n-batty-mcallister-speed)$like(#/mc+(allister*%ilton)%wilko',
+    '&%esque%\'iatella$!d%\'a/ritmo&!g&!s%%brook%\'dle-leg%"er%"un$"et$!f%(e-bombed%#fed&#ing',
+    '$"ge&$gies\'!y%)gly-maned$"ho$+ight-across+$ting*"rm,#ing+#row*!t*#way)$back-2-over-the-shoulder*&earded',
+    '*&ridged,!m)#cut)-down-the-line*%riven-#ing+#ove)%edged-!s*#yed)&facing)#guy)&haired*#ead)\'jackets',
+    '*,iberal-plank+#ned,#ing)#man)#not)"on)%ruled)$sawn*&kirted*%pined)\'trunked)+up-and-down)&winged(".a(7/shiny/side&rehy;parted',
+    '("ed)"nd*&ed-out((for&rehy+.ward&mdash;and/!\'/.-technological/".i((jacketed.!s(%laced(\'talking("up&%tened%+n-dependent',
+    '\'%style\'$time\'$wire&!.&,ing.continue&"s.&&thning%+t-waistcoat&!e&#ion&/jacket&rehy;ing,#ing&"ly&$ness&%steps',
+    '&#ncz&\'r-welds$#lak&#uer$%mberk&$otti%$ming$!n%*&rehy;gers%#ach&#han&$thro%"de\'(d/fallen&%hotel',
+    '\'&i-goal(*/forrester("ne&"on&"s.\'!/%+ge-smelling)$tyle(\'tasting\'\'/milton\'$hold\'!l(&y-clad*(deserted*%named',
+    '*(twisting\'&nesses\'(r-danger(%/when($s_en\'*st-looking\')ways.here&(le-tight)&voiced($weed&%ulate%$iera%"ks%%orlar%+raer/jailed',
+    '&-on&ndash;west$.p&ndash;across%\'-button&*cum-aerial&#end)!s&$iron&$line&(on-dildo&$work%*hylococcal%$iron%$lock%$pado&%ed-in',
+    '&#in\'("gs%&s/wipe$*sbourgeois&%urger%\'kiewicz%%sburg&#era&#man%#zny$(t-bodied&%lover&*orientated&%sound&*tee-o-tays',
+    '%%/nice%&a-only&&gemata%"ch%!e&&gemata\'-ic-investment*$line*&metals))/systemic*(tactical)!s(,es/processes("ia("ze',
+    '1#ors)%maker+(nagement)%proof)\'setting(!.(!/)(criteria))strategic)(taxation&!x%%ford-*)wolverton)1/northamptonshire)#ian',
+    '%$haim("rn\'!n\')ven-based("on&*clyde-wide&%earne&&kelven\'&inness&$loch&%mores&*nasheallah&%speys&&tummel\'$yrum',
+    '%*ifications&7grapher/sedimentologist&%lates&%omyid\'#tes%\'o-spool&+caster-like-$type\'$ones\'\'ruisers&(fortress."es&$ites&!r&&sphear',
+    '-+troposphere,!.&$tone&\'volcano%#ten&(ord-upon&!y%\'zenburg$!u%$bing%!n&"ge%*ss-bashing((schiller\'2/liszt/mendelssohn',
+    '\'$furt$$vaig(!s%%inksy\'%skian)"ys$)w-banning(#sed\'%edded\'$rick&(chopping\'\'lutcher,#ing&%fired&$hats',
+    '&%paper\'\'laiters+#ing\'#oll&&roofed&&tailed\'%hatch\'%opped&&weight&&yellow%5berries-and-cream-tea)+y-and-cream+%blond+&eating+&filled',
+    '+$pink+\'scented,&tained&\'nerries&%ridge%$gate%$horn%(plaiters%%shoes&#ons%!y$%y-cat%%denyg%$head%!t',
+    '$"ny#+eaking-then)!s&%lines&*y-breasted%\'m-based+$flow\'&driven\'$laid\'/ofconsciousness\'\'pattern\'(required\'#two\'&washed)#ter',
+    '&$bank&+er-throwing(%/dual&\'feeding&#ier\'$ngly&$port&(s/rivers\'%elect%!n%#tor(%rhoea$$ckov$\'doceska$\'e&mdash',
+    '%$lish%!m%$pish&&owoman%\'t&mdash,\';beyond-#the\'/ndash;cambridge\'+rehy;corner,)directory,&lights,#you&!\'&+-and-smithy($rabs',
+    '\'\'bottoms)!y($rawl\'$cars(\'leaners($omer)%rners(#red)!y\'%doors(&riving)"op\'$ends\'(festival($ight',
+    '(#uls\'(gambling)"ng+!s(#rid\'(handsome)&stings)$wker\'%irony\'\'justice\'$life(&ocated\'&market((usicians\'%names',
+    '\'$pals)&mphlet)%rties(&errott(+hotographer1!y(#lan+!s(#oet)(rter-pal+#man(\'roduced\'#rap\'&seller+#ing',
+    ')$nger(&kinned($lang()oliciting)#und(%quads(\'talling,!s(#uss\'$time((o-screen)#ugh(%rader,!s*$ffic',
+    '\'\'vending(%ictor)%sible\'\'warfare(#hen(%indow($oman&".a\'$baby\'%p/36/&%/bell\'(eldorado\'*gloucester\'%kings\'&london',
+    '\'(sandport(\'elector(&tation\'$york&#:it&#_as&\'cleaner\'$rime&$duke&#ers\'!s&$fair\'\'ighters+#ing&(lighting',
+    '&%names&%phone\'#lan&&s-full\'*.villagers\'$mart\'%ounds\'%ville&%wise\'*7-raver-hardcore-homeboy\'$oman("rk%!y$$hler&%gasse',
+    '%"ch\'#ton%#fen(%wagen%#ght%"na%!t&&wieser$#jau%$laua$!k$#lba%&itzias%"li%#zno',
+    '$.ng&rehy;thened&"er&.h&ndash;weight\'#ten*"ed(#hen&#th\'(\'-saving)$wise*&orship(!.(!/)(abrasion)&weight("ed',
+    '(\'s.there,"is%3sham/worcestershire%"th%"ua&!i&"us$\'onshalh$!p%!a&%vidin%$hons%\'itacula%/tavidin-biothin1(inylated',
+    '-&linked-*peroxidase-&red613&(odornase\'.kinase-treated\'/zotocin-induced$4ss&ndash;inoculation\'+rehy;loaded&\'-buster\'%count\'(donating\')enhancing\')fractured("ul\')inducible',
+    '\'%laden\'$path((honology($oint\'&rating(\'educing\'/strain-strength(,uperposition\')whitening&!a&%count&#ed.&%fully)$ness$!t',
+    '((and-bend($limo,!s,%usine($mark,!s($pull()receptors(%satin)$teel+"ps()towelling(\'version\'&ed-aga*(membrane',
+    '(%r-bed-!s*$case*$like)"s.\'#ies($ness)%g-out\'!s%!e&!s%*ford-based%%tford&!i$#uth',
+    '%#in\'$\'zembosz%"ov#%iatal&#iti&-opodocarpites$(bblehill%#ley&#ing)0-wright/producer$%chter%)k/general&)land/play*!s%+t-liability',
+    '(.-establishment).off-the-record&&ure(s))0s/irregularities%$utre$$dden&"le%*e-resident&#gen&$host&$mark&#run&$view%"or%%ulant',
+    ')#ors+!y$)fe-motive\'&ridden$!g%#gen%"ht%$idae&%lated\'!s%#osa$$jbos$*k&rehy;ing%$-tar%"e\'',
+    '\'$free\'&leader\'"on("ut\'\'related\'$team(&hrough\'%waves&+/industrial\'.reconnaissance&$able&\'breaker&$more&!n&.r-cum-provider',
+    '\'!.&"s.("if%#in\'\')g-surface)%train(!.(+ly-coloured$%mming$"na&&sacchi%$berg%(dbergian%(g&dollar&*-and-patch',
+    ')%lance)#sed($eans)"ds)$lted)$nder+#ing\'&course(+um-keyboard\')dominated\'(infected\'&making\'\'playing\'$sets(%oaked',
+    '($tyle\')technique(&wister\'%vests\'%would&".i&\'/client\'\'product&#bag)!s("ss\'#ean*!s&-ent&mdash;but\'(r/asthma',
+    '&#ier\'$ness&$less\'$ines&)ocephalus&(s&dollar\'#-is\'".1\'(/phrases\'#ton%$uous$&olatum%$ngly$$p(s)%!-',
+    '\'%-gram&+cultivation&&dancer&\'footing&&grazed&%light&%mined*!s&#out&$pine&)searching\'$hows%$down)!s%*e-patterns',
+    '(&pyjama(\'scarved\'!.&#sey%$lins%$mine%)ogrammers*!s%!p&$able&(ed-floor(%.from\')r/cleaner($gram&%ingly',
+    '%(searched%$wash\'!x&#ood%%yness$#tar%\'tmatter$$vens&!r$#zek#!n##oak$+be-equipped\'%laced(%ights',
+    '%"us$&caryum$\'emfjord%(ssnorist$\'ganoffs("va$!h%"em%!l$$ikes&"in%(tel\'stva$!k%-e&rehy;charts&!\'',
+    '\'%maker(,y-arm-please\'\'players+#ing(\'osition\')stiffened\'*upon-trend&$able&$less*$ness&%maker)#ing&*s-a-minute\'!.\'\'_rather',
+    '%,l-and-browse&&athons&#in\'%!z$"m.%3al/factor-dependent&!s&"ta(%ctoid(\'poroids\'#eis%,berg-carlson%!n$&ndheim%+g&mdash;not',
+    '&)-campbell(*haractered\')flavoured\'&handed(%eaded(#old\'!i(!t\'$loam)%okin\'\'+man/trapeze()indedness(&uscled\'&necked\'&points',
+    '\'*shouldered(\'mellin\'(\'ounding((tomached\'\'tasting(&oothed\'0willed/obstinate)"se&$.the&\'/victim\'$weak(#ife&#aig\'"rm&$beam',
+    '&*er-feeling)\'growing)&minded)-than-expected)&willed\'\'st-ever*&minded&(inthearm&.ly&rehy;walled(\'-bonded)&curved))developed)$felt*%olded)(inverted',
+    '*(otivated*&uscled))patterned)\'scented*\'tinging)(timbered&:man-cum-cocaine-trafficker&$ness&&willed&\'yloidea%$ista%\'tianite\'"no\'%um-89$%obant',
+    '$\'p/strap%$aria%*heodontids&,ic-variation($ally%!p&%olin\'$#rny$$scio$(ud-water&(/nuclear&&waters%#gal&$hton%#hal',
+    '%"nd%!p%%strup%#ted$"wd%#ger%!s#&qstmax#%retch#"sn#\'teatham#$uban%"le$!c%.&rehy;turalism',
+    '0"ly."es%&k-home\'#off("ut%$tion)!s&%ually\'.ral-adjustment+-functionalism7"ts+-morphological*//constructional+-institutional*.ist.principles',
+    '()e&mdash;a)#(s),+/alteration)!-*(function*+mechanistic*+orientation0"ed*(property*+recognition*&shared)\'/agency*&fabric*%local*\'outline',
+    ')\'d-parts*!/+0practice-related)!l),s-management**/different*$peak($ings(!n$(del-like&!s%!y$%ensee%"rs$!g',
+    '%&ggling&#ing&#le\'(&-black(".s$&hsaker$"ie%%sbaai$$lled$"ma%#ble%#ica&#lin%%mable%!p',
+    '%$ster$#nin$$skii$\'t-based&\'mounted&$walk%!/%(hiomimus(%nidae%&t/film&%ingly&#ura%&urally$)wwelpeter$!y',
+    '&6oline/glycerophosphate$!d$)m&omacr;n%!e$#ver$!x"$s-50"!t#(onehenge#$tsst"$u(d)#$-pot##ard%\'t&ndash&0-cleary/district',
+    '\'\'wortley&#ese(#que&#who&!y$!t##b\'n$\'-filled%#out$\'bed-out&"rs\'"ud%#ies%/le&rehy;covered\'(-bearded',
+    '()roughened(&shaved\'!r&(y-legged%&ornest%(y-billed\'&winged&#lee$$dale$#ens%!s$$guns$#ica$#ley#+cco-covered',
+    '\'$work$$hell$$k-in((-the-mud&*up-looking%"en&!y%$less%$ness%#ton$#ley$$ture#(d-backed\'"nd%#fee',
+    '%$list$!.$$book$&d/boat%!s$)e-rockers%"ly%!n&&t(ors)("s)\'%-body(\'chaired(,examensbetyg*&ercise(%hours',
+    '(,newman-keuls((observer))rientated+\'ginated(&prince(Dradical-turned-management-consultant)"un(\'welfare\'!/(+institution**tellectual((students\'!e(%nmuth((reksamen',
+    '\',s&mdash;eros(!/)\'members)%staff($prof%%ously%!r%!s%!y$"ge$!h%4olme/gloucestershire$"ie&*dly-casual&*s-oriented',
+    '(\'cookery(&fabric("is($oxon()political()retailing(&sussex(%women\'"on%!i&!s%%o-art\'\'bedroom\'+constricted(\'um-shop',
+    '\')dependent(%riven\'(friendly\'$like\'$made\'#out\'\'quality\')recreated\'\'sharing)!y($tyle\'$type&%/flat\')gymnasium\'\'leisure',
+    ')#udy\'"tv&$land&!n&)paperback/!s&#rum&(s-europe\'"os\'"um$"ly$%meyer%"ix$"tz$\'y&mdash',
+    '&"-a&&action&$bird&&carrel\'-um-television&\'designs&\'feeding&"is&&period&&skills%".8%(/bedroom-!s&.library/dining&#one',
+    ')&nsport&\'working%\'_rather%1ing-communication(./disseminating)2working/travelling#,er-lauridsen##ff\'%!-&%after&$must&$over&&sodium\'$tuff&%there',
+    '%!.%$_for&"on%!e&-d-to-capacity&+rs/leaflets\'!y%"ie\'!r&&ngtons&!t%#out%"s.%"yd##gan',
+    '%#ies#"hr#"i-$#ver#%ka-ed&$like%*geschwader$\'enbrock##ley$/li-stuli&cacute$&pnagel$*tification%"os%!s#!m',
+    '\'"rs&)ing-stone$"ey$(merslake$)p-burning&$like&(scorched&&tailed%#age%"er%)f/british&!f%#ily&$ngs.%"s.',
+    '%(y-tailed#%n-gas&"un(!s$#den\'!t$#gun$#kit$$ned\'%%iggly&,ngly-wrought$+t-cum-party&&flying&&ridden)#ing',
+    '%$foil%)man/woman%&person%$sman#$part$%efies%#nda$-id&rehy;fresh&(-looking&(/ugly/no&!a&#idy\'#ty\')!-&!s',
+    '%!t$#ple#%rchio$*dily-built%+y/historian$%geite)!s$-m&rehy;rugers%/-and(sic)-drang%.ey&rehy;archer%-inster/dorset%!y$&tivant$"ua#)ssy-style',
+    '$&eville$%field$!t%%aford&+rd/national%&er-gun\'$ings$#zer#"uw#!x""vs"$weed"#yan##car#!e',
+    '#!l$"ar$\'e&mdash+$;the&.rehy;conscious%!-&"an&(checkers&&groups&%level&#mag($king(#tes\'\'ismatch&(obsessed',
+    '&(pointers&%shift+#ing\')ound-wash\'&tudies&%zones%".6&(fluidity&#his%%:that%%craft%\'etronic%$haus%#pck%\'s-level',
+    '&)/dialects\'&values&,heet/tagging\'#ift%$ws32%!y$%iform%\'sations&!e&$itic&!m%#tes$!l$&ocracy%\'metrist',
+    '%"sa\'%nthes$$uses##man$%ieing$&phalis("os("us$"us#&nkynge#$ooch#(raciflua&\'osaurus$%ene-4(2stat-acrylonitrile',
+    '%!n#"sb$!p!+u&egrave;de"!-##20s$!2$"4d$"5s$#6mx#"7s##azj#$cz-o##san$(uperloft',
+    '""27$!s"!3""88""ae$"da#!i#%lidaz#"me##ndi#%rdal.\'!e$!t#!t#+v\'&egrave\'l',
+    '%"st$$ibus#"zo"0b&mdash;national$0ndash;contractor4!s*&sector$$rehy(*&pound;500(+;assemblies)$base-$ment))committee+(ntractor),disciplinary',
+    '))glacially)\'jecting)%manne)*optimality)#par*)ostmaster)(routines)*scriptions*&equent0"ly*-pecialisation*%ystem)$task*\'ropical*/ype/designation',
+    '%(pound;10,"50+&20,000+%5,0000!0$#0.5\'\'-micron$\'2-litre%#4mm%$8sec%!9$"46$%5,000%!6$"a-',
+    '&#qua&&tivity&#ute%$gent%#lps%&matory&(endments%(ntarctic%(postolic%&quatic%"rt%&spects&+sembly-type,1/assembly/machine\'(umptions',
+    '%\'tlantic&(tributes%&udible%&verage$!b%$ases%%eings&%linda%$oxes%(rechtian\'#eds%&ureaux&#yer$$camp&(rpathian',
+    '(!s\'#tes&-tegorisations%\'eilings&&llarer($ular&%ntres%\'hambers\'\'racters(#ter\'\'ucerian&$iefs&\'ristian%\'ircuits%.lassifications',
+    '&%imate&$oned&&usters%%ollar&(mmandant(&ercial(&itteee\'$pany)\'rtments(\'etitive(%onent&%ncert\'&ductor-#(s)\',sciousnesses',
+    '\'$tact((racting/\')versation+$ions&%pland&(ronation\'%tical&.t&rehy;racting&$unty%\'ratonic&$eate&"op%$ults$\'daemons&$llas',
+    '\'$lers&(legation&&sertic\'(ignation%&ialect&*sciplinary-\'e-based&$vine()sions-are%\'ominant%&ynasty$&ealing%&conomy%!d&&iting.',
+    '*$ship%$ight%$lgar&#ite%*ndothelial-"um&)vironment/!s%)pithelial%$qual\'\'ipments%$ther\'(nicities%\'uropean%*xplanation',
+    '\'$tors&$mily%(ecundity&+llini-esque&)mtosecond&\'rtility%$iled%\'lamenco%#our(\'-minute(!s%(ractions&&eezing%#und&"sc',
+    '&#rbo%"ce%&eneric%$lass%#oal&)vernments%)radations\'#phs\'$vity&%ounds&$unge$)harmonics%+eadquarters%$ippy&\'tchcock',
+    '%)orizontal%&unters%)ypotheses$(imperial\'*ressionist%\'ncision&*structions%%ssues%#ves$&jagger&"ne$\'kingdom$$lava%%eased)!s',
+    '&$thal\'#ted&$vels&%xicon%(icencees&#mit&%neage\'$gual&"st&&terary%$ouis%!t$$mach(&inegun&!n',
+    '\'"or&$rtin&\'xillary(#mal)!s)"um%\'embrane&&ssages&)tacentric(!l%#ind\'#oan%$odel\'$ules&%ntane',
+    '%"tv%\'ultiple%(ycenaean$*nanosecond&%tural%\'etworks%&ormals$%ocean%&estrus%&fficed%)ne-minute%%ption%)rdination&&ganist&\'wellian',
+    '&$nels&"ra($digm\'!t&&ssions%&ersona%%hrase%%lates&$edge\'$ural%!o&#ena\'#tic&#lar\'&itical',
+    '&!p&)stmasters%)refecture&(inciples&%ocess\'*fessionals(#it-+*maximising\'&gramme-!s\'$ject%)ublishers&$lsar$(question$$rack',
+    '&&tional%#eal(%istic&%cords\'&ursive&(gulation&"nt(!s&$tail%%outes%$ules$$s(1)&"8)%\'ahelian&%intly',
+    '%&chools&%reens\'$ipts%%eabed&"ct(!s&"ll(#ing&\'quences*!t&$xual%#hed&%rubby)!s%$late',
+    '&$rted%\'pecific%%tages\'$nces\'"te)$ment)$smen\'&vinsky&(ilettoes&$rate*$gies\'$okes\'\'uctural&#yle%/ub&rehy;classes',
+    '()committee1!s((headings(%topic(%units\'+directories\'(sistence&&pplier%1ystems/activities$\'targets&"sk%&eacher&$chno&%rence&"st',
+    '%%heory%$idal&$ppee*!s&%tling%!o&%lkien&$tals%$rack\'#des&\'easurer&&iassic\'"es\'&forium$/under-licensees',
+    '+%tting&$ital\'%verse,!s+#ity%$rban$\'variety%\'ersions%&iolent%$ocal)#ize+#ing$$ward\'&holian\'!p',
+    '%&ildean%&oofing$$zone(!s#).assembly$(category%&ulture$)operation$&parcel#$/dom#,=contractors#$adar%.ditivity-based%"io$$eras',
+    '$"it$$lare%$pina$\'marines%+plification$"ng&$ular$%ortic$#qua$$rdjo%#kah&$oses%)rangement$"si$%udial',
+    '$#iah%!e$\'ornness$$urbs#(caerulea%$nopy%&psular%"se&"te(!s%,tegorisation,"ed,#ing+$zing%(ulescens',
+    '%%ption$(hartered%&ondral)"la$%ision%"ty$#lan&%ssify&$uses&$vain\'#iae)!n%#oud$\'ommands%&ncious',
+    '&+scious-mind$\'ription&&status&\'tically$2ultural-orientated)"ed%&rrents%%ticle($ular&(oneously#$dean$,iaphragmatic%\'stricts%\'visible$\'ocument',
+    ')$tion$#uct%"e.&#/in&)d-looking#(economic%!t$&diting$\'i/south$\'lements$*ndothelial%%tries$!r%\'ization%$sive',
+    '$%ecund$$loor(!s$\'unction#&genera$\'ingival$&lottal$#rid%\'oupings#!h$#aas%&dradis%&rmonic+!s$1ead&rehy;quarters',
+    '%$dral%!s$&umanly&!e&"id#\'iciatur$&ection$(ncidents%(feudated+#ion%!o$"ta%!e#1ject&mdash;modern.)predicate',
+    '\'&-agent(*by-subject()catalogue+%egory)\'hanging).lassifications()dependent)*isciplines*\'visions)%riven(*employment)%xpert($free(+independent*&spired',
+    '(+object-verb.%ivity))f-science)#nly)*rientation(&sitter(\'teacher-#ing(&victim\'".8\'!/(&artist)(uxiliary(%class(%hobby',
+    '($main(%topic\'"es\'%ified)!y(#ve\'*+ly/socially*!s)%ising\'/s&mdash;anatomy((/classes)%heads)&places%!t&!s',
+    '$$meas$(ugations%\'nctive/+!s#\'kingdom*!s#&labial%-nguage/domain%"te\'!s&#ing%#xus$&eaders&$sing%#vel',
+    '%$yras$&ibrary%%cense)#ing%!m&"ed\'!s&\'inality*!s\'$ties&(mescence%(terature$4uxation-atlantoaxial,(subaxial$&yratus',
+    '$$anor&#tle%!r&#ina(*e-building*%cable*\'missile)"s.(!o$)embranous$(illigram(&metric%(ssion(s)*!.*#ary',
+    '+)/proposal4!s(*ve-looking*!s%%tted/("rs\'#ted$)odalities*!y&$ules%%ntane$.ucosa-circular\'$usal$(ycenaean#!n',
+    '$&ormals#\'obscura$&ptimum$*rdin-ation((ate-boss,%ruler+"ly+"s/-(superior*$ions*#ors%&nation&"er%&rhoeic$#xia',
+    '$$eona(!s%$riod\'&toneal$\'honemic$(leurally$#oea&#nae)$d-it%#ols%%rtion*!s%%tency$(rincipal%\'ogramme',
+    '&$ject&&strata$(ublishes#)rahmanyan%$nges$#eal%"nt$"oc%%unded$)uficollis%"le\'!s#-s&iacute;dios$\'ampling%(turation',
+    '%%ibers%$ores%%ribe.)-r/contributor\'!p((tion-fee.%unded-$list-&paying,,s/membership$)e-quently%!c&#tor)!s%-quen&rehy;tly',
+    '&#osa&#ves%$tted$%hrubs$%idary&%ence.&,i&rehy;aries\'&aries.,+/associates),y/associated\'!e\'$sed.&(y-hooked%-stence-driven,$food',
+    '%#tes&#ute$)jectively$%oiler\'#ing%%lidus$*pecialists*$ties(#fic+$ally%\'herical$!s$"t.%!a&!n',
+    ')(-abusers*$with)!.)#/it)"s.\'$sive\'\'t-ially(!i)%ality+!l,\'y-built.%sized-$_due)"la)#val',
+    '&#ted%!i&*&rehy;tute&"te\'#ion*"es*!s\'%uants($ions(0te-gratification+)mothering*"rs*&sbased)"is*$vity',
+    '%%ratan()e-coating)#gic&%iatus\'#ngs%#udy$)ubsection#"t.$#axa$(elomeric&"ty%&nants.&$ding&#uis%\'rraneus',
+    '$$heme$$idal%#lly$+le-physical&"ly%+y-expanding\'#lit\'(polished\'&scored$$opia%"ur$$rees%$ibes$,ype-specific\'\':escort',
+    '&(an-based*#orn(\'isation*!m)"ty&$ette#(variscan$%ented%)rsive.and$$ital$%oices#,way/elevated$&oofers%"rd#&xerous',
+    '#$zone"-c&rehy;cesses#&alfate#*c&eacute;s$!e%)eding/all\',s&mdash;more&#eds%&ptable%!s&*&rehy;sion&$full&,s&rehy;fully\'&-based((implants',
+    '($rate(%story(\'worship\'+es/mistakes("ur*!s\'-ful&rehy;ever*!l+)y-treated,(.richard\'(ion-list+$plan+*settlement(%vely\',#_as',
+    ')#ity\'$line\'!o($r(s))%-echo*&states\'!s(#ful+"ly(#ive$#int&"yl%"sa$)oth-brown\'$more',
+    '&!i&$uses%,lent-looking%%ssing##den#"er$"ss&#ion$#tte#\'h&ndash$!-%!a&%-body&&n-such\'!d',
+    '$!a%#rda$!e$%itoto$(na-rudna$"ov#"ia$"de$$lizm#&k-blow%&holing%*it-and-see%%slurp$!a%#ble',
+    '$%ed-in\'"on%%r-ass\'\'bearing(%lower\'$list+!s\'&mouths&%drone&&mouths$#in\'&$g-up\'#_up$\'le-calf&%mouth',
+    '%)-grunting##oma#\'picious#*r&eacute;e&\'grave;e$#ase$+e-figarella&0oenom&egrave;tre%#rie$#ier$"os&"e-("or($rich\'\'/hexose',
+    '#)tion-plug)&owered\'"ed\'!s$%orial#%ursal"%d-est#"ak$(mericana+!o$&n-chad%!i&"an&&zation$$rium',
+    '#&bourne$%rooke$)ury-based))y-the-sea\'!s#!d$%ainly%!m$\'en-like&-ly-discovered).made-redundant))paralysed*\'eaceful)*remembered)%small',
+    '(!.)(appeared&#tly%!s%&utsche$"on#$enly%"ts$+tendeutsche\'!s$"wo#$fass#"ha%&karrai%$lter',
+    '##ost#$tone#%worth"$eann#"bi#)ddeutsche$,e\'-stickered%\'-booted&&effect&\'fronted&$head&%lined\'#ook&(panelled&+shoe-loving',
+    '%%head\'%\'trimmed&"te##ltz#%mitsu#)raatmadja$$baum%!y#)t-pudding$!e$"oe%!n&$ius.$!t##vic',
+    '"\'ferings%"to#!f$&\'rings$#**k$&er-ing&$able\'"ge&$ence\'#rs.)"in\'!s\'"th&1ing-for-their-art*"to',
+    '\'!t&!n&$ring%$sted$%fered%"ix$"ic&"e.\'"nt&#ial\'$ence),t&mdash;such\'"ng\'#unt%!t',
+    '&$list$#olf&&k-born(%essex\'(/cheviot\'#ian$%rages(/tte/black/leeds+"s.*#ism\'"is)!m&#nce&!s%"en',
+    '#"ic#&ragios"&g/gest#"ai$*r&rehy;tit%!\'%#***%)-addicted\'%lmond\'2nd-vanilla-scented&%basin\'#oom(!x\'#uns&$coat',
+    '\'#ube*!s&\'daddies*!y\'&erived\'#oll\'%usted&)factories\'%illed\'$rost+#ing&&glazed($ider&#jar&*lactulose/',
+    '\'#ump*!s&+manufacture\'$ills&&pastry\'"ie("nk\')lantation\')recursors((ocessing)%ducer,#ing&\'reduced(&finery+#ing',
+    '&$sand\'%haker\'#ome\'#pun\'$tick($rewn\'$weet&%tongs\'&rading))nsporting&%yards%%bench&$irds%,cane-growing%$iest',
+    '\'!g%&landia&#ump%$plum%%sweet%$work$$tani##ery$%stion#&gering%,s&rehy;tions&#sed&"t\'\'#(s)\'%.ways',
+    ')%_more\'\'ingthat(+vely-titled\'(ological+!y(&paedia(!r\'*s/proposes%"ts\'"ed$#itt$$sted#%ihara$\'rtharaj$%shita',
+    '#!s""ha$"il$"li$#yli%!m#$ject##ner#\'renkamp"&i-ming#$able#(ccessful$!i%+de\'caravans\'$-ode',
+    ')$roof\'&.simon&&ogenic#(d-afrika+$anse$)a-manning$"he#!f#$leag#!n$"as$#ian#&rville#&shnish$#lip',
+    '%&covers%%dress%%heavy%&jacket%(yourself$(ability\'&+le-arranged(+/attractive($ness$)case-full)%loads$,e/substitute%$d-up%"rs$$land',
+    '#"vi%"es$"re"!j#"an#!i"#k-m#%24002#%60022##aab$#nya$$rton#%ezane#!h$%achov',
+    '%$sana$$devo$!e$#jit$#nam$%oi-24%#maj$+umi-tbilisi#!k$"ar$#oth##lje##man##opp$$thai',
+    '$!u%$llah#!u$+ma-speaking&$land&!r%%uland$!n#\'zession"$lafa$%sikin#!c#!e$!h$(jmanovic',
+    '$\'ymaniya#"fa%&-drugs%)methazine%(nilamide%#ted\'!s$)isoxazole$\'onation%#tep$$uric#!h#!i$"ng%"us',
+    '$)/maintain$!a$!e%!r$$ily\'%"n\'&!s$)y-looking#+l\'imbrunire$#age%"ne%#van((-stewart$"eh%&n-eyed',
+    '$!i%*van-rupert(!.(%/chet*(ollector)/gloucestershire)#the$)y-penarth&)sur-loire##mac$#ona&!t#$nier#)phadoxine&(lidomide',
+    '&(salasine*%zine/.%=0.84/$17.60"93/#202/"85&*te-5-water)\'fuelled)%grown))resistant)(snorting(!/)#day\'"ic',
+    '%\'enamide%0ide&rehy;bearing(%-rich)%toned(!.\'"ic%&onated\'"es\'"yl&)salicylic\'*uccinamate%(ur-anion(%based((coloured)&rested',
+    '(%oxide()scrubbing(&yellow\'%.free\'"ea(#ous("us\'%ously#$ring##ski$#ton#!t$!a%%nates&!t',
+    '$"ra%$iest#\'ukongur$#man##wah#$yard$#man#%zbach%&ergers$*er-engined&!s$"ur"$m(s)#$-mer$%total',
+    '#!a$"cs$#lia$!r$"ti%\'ra-java&%ensis&-iptan-induced$"yt#$bawa##day$!y#"ed$!i$$ndus',
+    '$!t#(function#)i-&eacute%!e$$kawa%!o$"no$%shomo%"on$)yoshi-kai#*magraphics%!m%*ries-first\'%sable%&tative',
+    '$!e%$r\'90&\'-autumn\'%child\'\'fashion\'\'holiday\'&kissed\'$long\'$only\'%prune\'\'schools(%eason(\'hrunken($kies)!y',
+    '&!.\'"it)!y\'!v&&/black&$bell\'#lue&%chlld&#ell&)hill-type*$ians&#ish&"ly&$pond&\'s-smith',
+    '\'*tage/ideal\'"un&$tyme&$wear($ight("st$!i%\'t(1987)&\'-at-sea&#eer)#ing&$ting%"ze$#ley$#mer',
+    '%$ners&&ing-up)!s&#sby\'#ing%"rs$"us#$nall$#er.&./administrator\'$hunt$"ik$#mer$#ner#\'o-style',
+    '$$tori##pah$%guard$%holes$"in$%stuff%%ucker$*ter-horses%$ious%"on$"ul#$s-up$!.$*_in_excess#%thin\'',
+    '\'!g$"ri#!u$!d$!s$%tashi"+n&ndash;wed$*rehy;baked*\'leached+#ood)\'dappled+"ys*$ried)*reflecting)&soaked',
+    '##(1)#(-\'n\'-sex$#100$%abuse%$dded%(fternoon%\'nd-moon($sand%&wnings$\'basking&#the)"rs%$ears%$irds%&lasted',
+    ')"ed)#ing&#ock)#ing\'#nde%#oat%(reathing\'!d&$ight&#own%#urn("ed(%ished(!t$&capped',
+    '%&olours&)mpatibles%&raving$&danced&"rk($ness&!y\'!s&&zzling%2ec-hp-ibm-sco-mips&&prived&"ws%#own%$ress&!y',
+    '$%earth%)quivalent%)vaporated$%faded%\'iltered&"sh%%lexed$$gilt%$leam&%inted&!o\'"be%&razing$\'hammock&$tted',
+    '("ed&$ight&$lmet%&oliday&!t$+independent\'$uced$%kings$$lamp&$nced&"wn%(ightened&$nked%\'otioned&$unge',
+    '%&ercury$\'parched&!t%#eel%)rotection$#red&%lated%%idden&"se$&saloon&(nctioned&\'turated%%corch&%reens%&eekers',
+    '&"ot&!y%$ized%(parkling&&ecific($kled&&lashed\'"it&"ot(!s%&treaky%&wathed%%ymbol&)nchronous$%table',
+    '%$ired%&weaked&&ilight$%visor$$warm\'!y%"ed%\'hitened%%inged&"se%#rap#!/$$20th$!4$(at&amp;t',
+    '$$heat&&lpdesk$#nfs$&public$%video##ada$$ndan$#rso#$bath$>eam&ndash;talbot&ndash;darracq%\'d-users%,lt:frostbelt((rustbelt((snowbelt$\'itterns',
+    '$#oat\'!s%%nnets$$rite%%owned$$urgh&$ning\'!s&\'st/gold&\'y-based%&siness#%chair(!s%"on$%locks',
+    '$%ream.(!s#&d\'land$(ae-style%$ica\'%!l%!r&!i%\'sciurus%0y&ndash;thursday\'+rehy;school&!\'&(-evening\'%lunch\'%night',
+    '-!s(#hop\'#the)$ough&+/gloucester\'8lechlade/gloucestershire&\'s-style\'!.\'$cope%$zzle$$borg$!e%!l&#and&!l',
+    '%+r&rehy;land&,land-company+$west*!0*!1*!3$%gaard%#ot.$#isk%"us$$lund$$orne$&ragons%&enched%!i',
+    '%$vall#!e$!y#&fished(!s$*lower-seed)$seed$#ree&"sh%#ock#\'g-along%"ho&"un%"wu$#ift',
+    '$!s$"un%#rlu%"za#%inder%#gas$"pc$"ta#"ke%)n-cheeked\'$eyed\'(terraced$"in$%letos$$ness',
+    '%\'lliance$\'i-based%!n%#sde&!m%"te\'!s%"va$)y-natured&$side&(tempered%&/shady%$bank%%dales%%lands',
+    '%!s#-os-compatible%!.#%parks&%tners$\'ensions$$higs$$roof#%quest#&raycer$"gy$%ise**\'!r$$ooms#"s-',
+    '%!n$\'corched$%eeker%#t**&)-citizens\'\'defying\'$gold\'#lit$$haft(!s%$ield&$mmer&)ne-filled)$like&!p',
+    '%$gner%"lk%"te\'(.unc.edu$$mite$.oft-sanctioned$$parc((stations$&tarred\'!s%%ealer%#one%$ruck$#uit$$wept',
+    '%!r$"op$#ree&\'k-owned%#uss$$utor#"up#%voxel#&washed%&tchers%!y$&estern$#ise$$orks&$ship',
+    '-!s##zha""oi#"mi#$nare##zzo"0p&eacute;rieures0!s$%ndash$/rehy;plementing+#ier.!s*&osedly*&ressed#!-',
+    '#!a$&-clean%$dupa%$scot%$tuta$%blocs$\'durable$&rmurad$%sinee%$peed$#tap%%imber$$wrap#)d-dcm-fla#!e',
+    '$#lco$$nded$1r&rehy;discipline+)fortunate+%human+)intendent+\'loading+\'natural+\'project+)sanitized,)tructures+%tough+&vision+\'wicking%/-&eacute;litist',
+    '&#10s&!8&*absorbency.!t(&undant."ly\'\'ccurate(!o\'$dded\'$lert(-fv&eacute;nic\'\'postles\'&rchers\'&thlete&$baby',
+    '(,r&egrave;ges\'"ed\'"id("ke\'#rat\'%udget("ll("sh&$cafe(!r\'$heap)"ss(%ianti)%lling\'#ity',
+    '(#iff\'\'ollider)#ony((mmentary**unications)&panies,!y*%uters(*nciliatory))ditioners)%verse($smos&#dad\'%eluxe(#nse',
+    '()terminism\'\'iscrete(\'visions\'"og((mestique0!s\'+readnoughts\'&ynamic&)effective)\'iciency\'(nergetic(&semble\')xecutives(\'pensive))loitation',
+    '\'&itness\'(orgiving\')reighters()iedmanism\'#und)"ky&\'gallows("me("pe\'"el\'#lue\'*olf-course("od((vernment\'#rid',
+    '&%hairy(%wkish\'&ealthy($roes\'\'igh-end(!p\'%umans&*individual),ustrialisers(\'flation(\'sulated(*telligence\'$rons&#jag(!m',
+    '&$lars\'%ength\'#ice*#nce("mo($near*!r\'#ong\'!p\'$ucky($xury&\'magnets("le(%nager($rket',
+    '()sculinity)$sive(+thematician\'-icrocomputers(+dddleweight*"le,%wight(!m("ni*)-computer*(computer)%utiae\'%obile((netarist&-nationalistic',
+    '&)observant\'(ffspring\')ptimistic\'%rders)%inate&*patriotism-!s\'"el(&rsonal,!s\'$hase(\'osphate\'"it\'\'osition\'&remium',
+    ')!x((oductive))fessional("uf\'&sychic&%quick&!r\'#ace(%diant("ts\'#eal*$isms,!t-"ic(\'gionals',
+    '\'%ocket(#ute&#sad("fe($ints(&lesman+%woman\'$cale(\'ientist(%rummy\'(ecretary)#ure($iner(\'lective()nsitivity',
+    '("xy\'$harp(#ows(%uttle(!y\')ixth-form\'$leek)#uth("ug\'$mart\'#nap\'#oap("ft(#lid(+phisticated',
+    '(&ecimen)"ed+$wing(*irituality(&rinter\'%table)!r*!e)#tes*$ions*"us(#ore+!s($rong)\'uctural',
+    '\'$uave(%ccess&(talented($nker,!s(!x)"ed)#ing\')echnology(\'rritory\'\'idiness(#gre\'&rebles(#ots\'#sar',
+    '\'%yrant,!s&\'villain($rile($sion\'#ote&&wealth)$pons(#ird\'#ide("fe&%yacht&#zen(\'ppelins%+.capitalism',
+    '%#386%!a&%bundo&#cid\')lavicular\'\'tivates&$gent&$lloy*!s&&mbient&"nn\'-tigen-induced,$/mhc,"ic%"b.',
+    '($dies\'%rrios\'"se&!e\'!s&!i\'!a\'#tch&$lock\')y-crafted)(designed)\'focused)\'located)%paced+%inted',
+    ')#run&!o\'#ard\'#nus\'#oks(!t\'#ron\'"ss\'%wlers\'!y&"ug\'!s%$cala):fradgealisticexpealidocius(:ifragelisticexpialidocious',
+    '\'$ndid\'"rb\'"sp\'!t&$edes\'"ed\'\'lestial\'%ntres\'%ssion&%hache(&llenge(%mpion($nnel(#rge+"rs',
+    ')!s\'%illed\'$rome\'$unks&&iliary)#osa+"us\'"nq&&luster&#oil\'\'lliders(#our\'%mpact)*uter-level\'%nduct',
+    ')&ortium\'$rpse\'#ver&#rap%\'dancers&#eli\'#por&*irectional\'#sco&"og&$uper%%eagle\'!l&,go-precursor2!s',
+    '&(rogation%&fatted&,eatherweight&*icially.it)"es\'!n("es\'#rms&$lies\'"oc(!p("us\'&uities&#olk\'#ods',
+    '(%mance(%tress)!s&#unk\'"ry\'#sed\'"zz%"ga&\'enerous&%hosts&$lues&$reen\'%oupie*!s%$heat',
+    '((vyweight\'&licity)#ski)!x\'"rb($oine&\'ighways&$orse\'"st)#ess\'!t&%ybrid%,i&eacute;ure&#eur&\'mposers',
+    '\'\'dendent\'-ten&rehy;dent*&dencia-)t-general*$sive&(or-grade)(inferior)\'looking()/inferior)+subordinate(!a($itas+"te**y/humility+\'_on_the',
+    '%%judge\'#ice%$keys&"id\'#ngs%%lager\'(tiveness(%tices&#ife\'%nguae+!l\'"st&#oan\'!o\'#ser',
+    '\'!x%"ma\'"lt\'%nager\'!r($ines(!k),et-commodity,$till+$/the+#ing("ts\'$ture\'#xes&&ercato',
+    '\'!x&#ice("ro\'*ddleweight($size\'"nd(%ister&3odel-from-brigadoon\'!n\'!o&"um%#nag\'!l\'&tional(0urally-flavoured',
+    '&#its&*ourissante\'\'v&aelig&%umary%\'obesity&/rdinate-hyponym,#ion\'\'ganized&\'vulated&/xide-generating*!s%%paint\'#nel\'"rc(%ticle',
+    '&"ex&,h&eacute;nix\'%oenix&\'iplined\'!t(!s&$lane\'#onk&$oint\'$licy(&yhedra\'!p\'(sability("es\'$wder',
+    '&(restigio\'%oduct(%files&"up%&quarry\'#inn%$race\'"mp&%eader(#los&#ich%$safe\')turations&&chools\'%ribed',
+    '\'"ll\'$nses&&hifted("ne\'#ots&#ite)!s&"ki&$lide&$mart&$naps\'#oop&$oap\'\'\'nically\'!w',
+    '&%quash&!t\'%adium("ff($rish)/s-in-the-making(%tions\'&imulus()tion-free-%riven,"em\'*or&rehy;ed\'$rats*"um(#ess',
+    '(#ong\'#uds("ff&"ub(%jects\'#gar&$wift&\'ymmetry%(talented&$eens&%heory\'#ief&#ifo&\'ransfer(%wlers',
+    '&#sar&$uned%&unions%,vi&rehy;sion\'%llain\'#se.)!r*!s(#or/+.superintendent\'$zing&&oltage%$wash&#eed\'$ight',
+    '&#omb("en%"xr%%yacht*!s&"ob%$zoom#&hachai%!n%"te\'!d#%inate\'-ion-pronation\'#ors%%eness',
+    '%!x$#ied#!o#*p&eacute;e%%mdash$#ben$)er-plates\'$room\'\'theatre($rays&(annuated&$less$!l%(e-bodied\'$like',
+    '&"ly&0ment-and-section*"er*"um&!r&"st%\'icantem(#ted)%ingly)"or&#er\'()-consumer)%firms)+independent)(oriented',
+    '($.for(./debtor/factor)-lessor/lessee("s\')6/customers/competitors*-manufacturers*,own-branders*)providers\'"s.&$ment%+y&mdash;the&!*&!-\'*and-demand\'%bound',
+    '(\'ontract($raft\'&demand\'$line+!s\'\'related($oute\'&system\'\'teacher&!/\'\'charger\'7management/distribution&#in\'&!s$$oise',
+    '%$osed%%r-ted&%essor&.t&lsqb;ed&rsqb\'%-base(\'fighter()gathering(%level($post(\'raising(%staff*\'ructure)&urface)%ystem(&trunks',
+    '(&widows)&orkers\'$.for\'\'/excuse(5supplement/contradict*%rface()workshops\'\'ability($tive\'!e(+r-supportee)(s-normal\'#in\'\'!o\'$team',
+    '\'%watch%!s&"al&!d&"e\'\'!-(#the\'!.\'1d-to-be-seductive&#in\'(+g&formula;1)"ly)!s\'\'titious&$ssed',
+    '%+t-reveilhac$%ports$%resed\'+sed-carrier)!r("io(,or/cytotoxic%%imant$!s$#uku%$rate($ions##ra-&)authority&,departmental',
+    '&%modal&)political&(rational\'(ealistic(%gions&)segmental\'$onic\'$tate&+terrestrial&\'wealthy%\'crustal&\'ultural%,departmental%(gingival%*historical',
+    '%%iliac&$niac%)laryngeal&$egal%&mental&&undane%+nationality&%eural&*ucleosomal\'&merary%(physical&(ubically%!s&)egmentals&\'pecific',
+    '&&ternal%)tentorial&(hreshold%+ventriuclar$0emely-decorative&"o.&"um%$nant%$sses\'#ing("ve\'"or$$ises#%suned""qs',
+    '#\'-really$#tax%%itles#,abaya-johnny$"ge$!l$#net$#pee#"ch%,arge/expense$&ingles$!o#!d$"ej%#val',
+    '#-e&rehy;footed$$-all&"nd%\'founded%$that&$rust$%clean$!d$$fast%+ire-winners%\'ootedly$#gon$$ment$!n%&husius',
+    '$$snes%$tart$&tonhie#"f-%(boarding*!s%\'chanter*#ing\'#eck%%going%&lapped%#mad%#off%%rider(#ing',
+    '$&/skate$+ace-antigen(3brightness-diameter()catalysed)\'oatings*&loured($deep*%rived*$sign)$ived)"ry(\'effects)\'lectron))nrichment(&facing',
+    ')*rammatical(&harden."ed(+immobilised)&nduced()labelling)$evel)%itter(%mount("of(\'pattern))erturbing)$lane)\'ositive($read',
+    '()sensitive)\'hoaling)$ized)-kimmer/solids-#ing)(natching))terilized)%yntax(\'to-mass*!w\'&/depth(*subsurface(#two\'&d-size\'"s.',
+    '&#hem&$ings&!t\'*ant-coated+\'polymer*$smay&!y%!x$&board.$&caster$)eit-swell\'#ing%$r-ex\'/turned-designer(#ype',
+    '$&iction%-ng-travelling%#sts$$lark$$orms$%rider$$ynol#"g.$&e-free&$ride&$tide&+wave-shaped%#les%+on-sculptor\'!.',
+    '\'$cies\')s&mdash;a(,-in-ordinary)$type%#res&%y-box\')/five-day$)ical-type(+ly-enlarged+$made+-reconstructed%#kos%#tek$$leon#&icates',
+    '$#kov$$mono$>ntendant-g&eacute;n&eacute;ral$$stan$#val#*j&aacute;n$"an$&ection#$kamp$!h%!i$"yn#!l$"ey$$iest',
+    '$)y-looking%!.#"ma$$elin$$isal$.ount&rehy;able#\'naturel$$otes#"oi$!n$#vek#!p$\'assable$%irsed%$sing',
+    '%#us*\'%-kill(&profit(&value.\'(/deficit$$rint&!s\'\'e-a-day)&hushed)&packet()d-looking\'*ingly-wide*$ness&"ze%&singly',
+    '$"ah$(ealising)\'tically(#zed%"nd\'"ah\'"ed("ed(&r-back)"/i\'#ing%)pitiously&)ticiously%!x&"it',
+    '\')yorkshire&*/hampshire\'%middx\'0sussex/hampshire0#nts$"ia$&ouding&\'ndings.,(/meeting(%sound$/rrlllyee-noloan$!y#"so#!t$!a',
+    '#!u$"ga$!i$$kuku$!r#%vayor$-eillance-free,!.%"ry%"y\'&%(ghs)&%-data\'&making\'$type\')valuation',
+    '&)/research&#eng\'!s&#or.(%/loss($ship,!s$#ged$!i%"ng%!v&(al-based))conscious)#kit)(oriented',
+    '(!.(*/baby-doll($ists\'#nce&$iors#!y"$s-an#(a-funded%#run%*subsidised$#aaa$#myr$#n\'s%\'-shaped%"ah',
+    '%"ta$"wa#+bstantially#\'cepimus&,tible.people+!s$#ite#&eption#!h$(i-making%!l#%ianus$\'ciously$"es$"lo',
+    '#"ko#$peck&$t(s)\'%-list\'"er%#nce&/ded&mdash;owing)*-animation)!.)&/marks(#red\'\'ingness\'"re&$ison&/se-comic-horror',
+    '(%fully\'#ful\'(ion-dots+\'feeding\')or-lifted)#ium)!s\'"us$,i&rehy;cions%!c&%cions&$ion\')"s.(+us-sounding*:/distrustful/watchful/keep',
+    '&!e\'!s%&scious#$sana&%gkarn$"er%&x-born(.y&rehy;the-sea\'$made&\'/surrey$#ies$$kind$$mann$#ock$\'uration',
+    '$\'ain-but\'%able\'+!.+(/organic*+y-harvested\'!e()d-release*%yield)"ly)$ness\'#in\'%%ntial$#ead%!m%!n',
+    '%%rmans$&inebit&"ui(!t#$unan"%taine$!n#%clife\'#fe.#*er-related%+/veterinary%#ing##has%"us$"en',
+    '%.rland-anderson*(/glasgow*!i+"sh&!s\'!t#$isna##ker##ler##nia##omo$"na$#vec#$phen#&sakorn',
+    '$#ers$$ling$\'on-born\'+in-ashfield\'#on-*#sea\'%smith\',upon-derwent\'#who&)/georgina\')insurance\'(magdalen\'+oxfordshire#)ure-lines&$less',
+    '"\'unto-ml#!s#$uuck%)uuuuuuiii"#vee$"re%!y""wa$#ida$$ndhi%"ee%%nagul**university\'%phume$!r',
+    '#"on"#yin#\'kerbuyk#"os#\'pported"$zane#+e-la-rousse$/rainty-treaties#%umura##y-q!2v&ecaron;tl&eacute#/mdash;socialist"#/88".40-transformed$!e',
+    '"(aerdborg#"ne$\'kmajaer("er$&tesson#!r$"og$&tifoss#&topluk)!a$+s&mdash;how##var"+e-developed#%aborg#%danya',
+    '#&insson#"jk#&ndborg%+sr&oslash;d$%gali-)\'related("an$$nson##ral$*dlov-class$&risson#$stka##tia$$laya%"ev',
+    '$$omir%$slav""fs"*iatcheslav#$dler%\'igailov##len#%ridov$%skaya#%shtov#,tavsk&yacute$"it""lp"!m""oa',
+    '#!i#\'jlsvoja$!o#$lvar##rad"-p&mdash;south#0/udc&mdash;swiss")q/general"%r.4.2#-4-compatibles%\'derived%&loving%\'on-mips$%.1/es$#/mp',
+    '#!5"%t15ev#"ar#!s"!x"(yatoslav!$w-ne#%slant$%weden"#.fr""1.#"42$!3"#225#!3',
+    '$"ey$$ians#!d$$dles&)ing-bands$&elands$$ling($cote#!e$&fberht$!n#&ffield#%g-bag$"ed$(gerstick',
+    '#+hiliization\'$land#$ihwe$"ls$%n/son%$mote%%sonii$#the#\'kopmund#\'lcliffe$\'ecliffe%$ness%"s/\'(director&$moor',
+    '%#oed&&w-tail,!s\'%field\'$ing-*!s\'"s.($/min#/mi-of-the-month%&nathan$&merdam$)p-covered&%dozer\'&weller-!s',
+    '\'$lies\'%orest&&hunter&(infested&&ridden%#ers%"ie&(ng-power%$life%"s.#&n-bows%$ganz%$home%$like%%necks',
+    '&$ongs%%white$+/consultant%(explorer%%light%\'nuclear$"al$$cott$!e$$gard$$herd$(iesville$"ke&!d&!r',
+    '%#ier%%words%\'yhouses$$more&"te$)n/allergy&%gemma%"ey%!y$+s&rehy;down%--down-trimmed%\'ea-born(%style\'"14%*on/dugdale',
+    '%"uo$&tantra$!u$%white#&pdisk=)"in$*o-democrat\'&rafted$!p%$able%#ers$%shops#)r&amacr;j$%brook$#ded',
+    '$$fham$\'kestone$$ling$"me&!s%"in%!y$#oop%$vski%$wsky$)t-elandre%!h&.y-complexioned((featured%$land',
+    '%!s%$touw%(zenegger$"up$(zenegger\'&truber#!s$!a$)h-buckler&(lettered%\'buckles%"ed%#ing%%plate$$orie',
+    '&*ka-flagged)$like))patterned)\'wearing#)t-the-fly$#her%+ing-clothes$#man$#ons$$ragh$$test#$vesy#(y-backed$$able%&msevak',
+    '$%field$#nes$+ze/goldberg##zis"(d-funded""e*##ar\'%"ed&!r%%ingen)!r$"t\'%\'-curled&(darkened\'$ewed',
+    '\'#ree&$grey&&lt-off&%marks&)plastered&\'raising&&soused\'#uit&#top&#wet%)er/jacket%$iest&"n\'\'#ess\'+g-arguments',
+    '(!s&!t%$less%#man%*shirt-like*!.%\'y-faced(\'ingered#\'den-but\'\'denmark&(/finland\'&norway&\'borgian-#ism-!s',
+    '$#ges$0ish&mdash;polish\')-designed((financed(&soviet\'!/\'$ness#,e&formula;ng$$eeet&!t$#ing$$ling$#mer$,ney/chairman("st',
+    '%"ie$)p-picking&)the-mouse(%rough%$able%%er-up\'$s-up%#in\'\'%gness%$over$"rs$(t\'n\'sour%)-\'n\'-sour&"an&+charactered',
+    '&&eating&%grass\'\'uzzling&%heart+"ed&$life&$meat*!s&&papers&&ration&&seller,!s\'$harp\'#pic("ot',
+    '(&inging&\'talkin\'\'&highed&%water\'\'rappers&&zephyr%"/a&&gentle\'.loucestershire&\'savoury%$back\'!g\'"um%&eners.&)r-natured',
+    ')\'ounding&*st-natured%$girl%*heart-wife%(ie-shops&&nburgh&\'sh-sour%$leaf&(y-damped(\'smiling%+nam/calgary&#ers\',ss-and-light)"es%&potato',
+    '&\'/silver&"ap&"er&.hop-newsagents&"ir&#our&$pot.)!s%#ums%$wall#"ga%!n#.if&ndash;cairo#%ll\'st%"er',
+    '%%ing.i%$sian%%ulose$!t%#ers\'&weight##mix#&narton$!o#*pe/balista$\'t-delta&#tee&&volume#!r$&dbreke',
+    '%"is##tka$"ly$\'tenesse%"ie$#yng$!z"!g"$here""i4#%ahart$!t#%dden\'\'\'-fallow$#ger',
+    '$#lan##ers$&talski%!y#.ft&rehy;heeled%\'-armour&(changing&&footed,$ness&$like&\'running(%shing&\'talking%#.it%&/celia',
+    '&)swiftfury%)er-moving%#ian&$tude ,thing\'em-bob',
 )
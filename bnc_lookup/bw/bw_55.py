@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_55 = (
+count_55 = 6694
+
+heads_55 = (
     'slummings',
-    'slummintowkens',
-    'slummock',
-    'slump-bashed',
-    'slumpbuster',
-    'slung-weights',
-    'slurpability',
-    'slurpers',
-    'slurpings',
-    'slurr',
-    'slurry/day',
-    'slurry/manure',
-    'slurrying',
-    'slusarchuk',
-    'sluschi',
-    'slush-covered',
     'slush-filled',
-    'slush-like',
-    'slush-slurp',
-    'slushier',
-    'sluthe',
-    'slutty',
-    'slutzkin',
-    'sluzba',
-    'slv-3',
-    'slx',
-    'sly-looking',
-    'sly-punching',
-    'sly-stepped',
-    'sly/grand-daughter',
-    'sly/willis',
-    'slyboots',
     'slycke',
-    'slyly-charming',
-    'slym',
-    'slyman',
-    'slyvia',
-    'sm&aring;land',
-    'sm&eacute;agol',
-    'sm&oslash;rgasbord',
-    'sm-21',
-    'sm-b/pr',
-    'sm-b/rgm',
-    'sm-co',
-    'sm.',
-    'sm/',
-    'sm12',
-    'sm1:sm2',
     'sm2000',
-    'sm2400',
-    'sm58s',
-    'sm832/g&ndash;wwii',
-    'sma&zcaron;en&eacute',
-    'sma-20',
-    'sma-21',
-    'sma1',
-    'smaa',
-    'smaa-aa',
-    'smaaack',
-    'smack\'eads',
-    'smack-addiction',
-    'smack-addled',
-    'smack-dab',
-    'smack-smuggler',
     'smack-snorting',
-    'smack/some',
-    'smacked-out',
-    'smackerooney',
-    'smackeroonies',
-    'smackeroos',
-    'smackings',
-    'smacky',
-    'smaithwaite',
-    'small&mdash;bore',
-    'small&rehy;holdings',
-    'small\'',
-    'small-\'c\'',
-    'small-amplitude',
-    'small-areas',
-    'small-arm',
     'small-billed',
-    'small-block',
-    'small-bone',
-    'small-bosomed',
-    'small-boy',
-    'small-break',
-    'small-budget',
-    'small-businessman',
-    'small-capacity',
-    'small-car',
-    'small-clothes',
-    'small-customer',
-    'small-denomination',
-    'small-dimension',
-    'small-eared',
-    'small-end',
     'small-endians',
-    'small-engined',
-    'small-faced',
-    'small-family',
-    'small-farmer',
-    'small-feathered',
-    'small-featured',
-    'small-flowered',
-    'small-for-dates',
-    'small-form-factor',
-    'small-frame',
-    'small-grown',
-    'small-hope',
-    'small-horned',
-    'small-hour',
-    'small-hours',
     'small-injected',
-    'small-is-beautiful',
-    'small-ish',
-    'small-jawed',
-    'small-limbed',
-    'small-long',
-    'small-medium-sized',
-    'small-meshed',
-    'small-nation',
-    'small-nippled',
-    'small-numbers',
-    'small-office-home-office',
-    'small-package',
-    'small-party',
-    'small-pool',
-    'small-power',
     'small-producer',
-    'small-radius',
-    'small-sample',
-    'small-scales',
-    'small-seeded',
-    'small-set',
-    'small-share',
-    'small-shareholder',
-    'small-shopkeeping',
-    'small-shot',
-    'small-space',
-    'small-state',
-    'small-the',
-    'small-timer',
-    'small-to-microbial',
-    'small-too-medium-sized',
     'small-town-where',
-    'small-unit',
-    'small-venue',
-    'small-vessel',
-    'small-voiced',
-    'small-wave',
-    'small-workshop',
-    'small/labour',
-    'small/lechlade',
-    'small/medium/large',
-    'smallbridge',
-    'smallbrook',
-    'smallcalder',
-    'smalld',
-    'smalldon/river',
-    'smaller-bodied',
     'smaller-company',
-    'smaller-grained',
-    'smaller-growing',
-    'smaller-leaved',
-    'smaller-size',
-    'smaller-step',
-    'smaller-than-normal',
-    'smaller-than-usual',
-    'smaller-type',
-    'smaller-volume',
-    'smaller5',
-    'smallfield',
-    'smallgods',
-    'smallgood',
-    'smallhealth',
-    'smallheath',
     'smallholder/soldiers',
-    'smallholding\'',
-    'smallhythe',
-    'smalling',
-    'smallmans',
-    'smallpage',
-    'smallpecs',
-    'smallpeice',
-    'smallpox-like',
-    'smallscale',
-    'smalltalk-80',
-    'smalltalk/v-cobol',
-    'smallville',
-    'smallweed',
-    'smallwood/villager',
-    'smally',
     'smalt',
-    'smaointe',
-    'smaoui',
-    'smap',
-    'smaragadine',
-    'smaragdine',
-    'smaragdus',
-    'smardale',
-    'smarmily',
-    'smarminess',
-    'smarms',
-    'smarr',
-    'smart&rehy;alec',
-    'smart&rehy;arse',
-    'smart&rehy;looking',
-    'smart-alecks',
     'smart-alecky',
-    'smart-assed',
-    'smart-casual',
-    'smart-drug',
-    'smart-drugs',
-    'smart-format',
-    'smart-liveried',
-    'smart-money',
-    'smart-mouth',
-    'smart-suite',
-    'smart-talk',
-    'smart/accident',
-    'smart/pensioner',
-    'smartarse',
-    'smartcam',
-    'smartcard',
     'smartcards',
-    'smartcau',
-    'smartclick',
-    'smarter-looking',
-    'smarter-than-is-good-for-them',
-    'smartfill',
-    'smartguns',
-    'smarth',
-    'smarticon',
-    'smartingly',
-    'smartly-cut',
-    'smartly-suited',
-    'smartly-taken',
-    'smartobjects',
-    'smartsizing',
-    'smartstart',
     'smartsuite',
-    'smartvu',
-    'smarty-pant',
-    'smarty-pants',
-    'smarty-power',
-    'smartypants',
-    'smash-and-grabbable',
-    'smash-andgrab',
-    'smash-ins',
-    'smash-style',
-    'smasha',
-    'smashed-up-looking',
-    'smashings-up',
-    'smashjaw',
-    'smat',
-    'smatter',
     'smatterings',
-    'smatv',
-    'smaul',
-    'smayda',
-    'smd',
-    'smdp',
-    'smds/cbds',
-    'smean',
-    'smear-',
-    'smear-test',
-    'smeara',
-    'smearings',
-    'smearsm',
-    'smearton',
-    'smearwatch',
-    'smeatonians',
     'smectic',
-    'smedley/former',
-    'smeichel',
-    'smein',
-    'smele',
-    'smeliakov',
-    'smell-absorbing',
-    'smell-cards',
-    'smell-conscious',
-    'smell-detecting',
-    'smell-free',
-    'smell-making',
-    'smell-messages',
-    'smell-o-vision',
-    'smell-receptive',
-    'smell-sense',
     'smell-traps',
-    'smella',
-    'smellable',
-    'smelle',
-    'smeller',
-    'smelliness',
-    'smells.',
-    'smelly&rehy;socked',
-    'smelly-breathed',
-    'smelting-houses',
-    'smelts',
-    'smena',
-    'smenkhkare',
-    'smerdis',
-    'smerdon',
-    'smes.',
     'smestow',
-    'smetanesque',
-    'smetanovo',
-    'smets',
-    'smf',
-    'smi&rcaron;ick&yacute',
-    'smid',
-    'smiiile',
-    'smilacina',
-    'smilanski',
-    'smile\'',
-    'smile-high',
-    'smile-implying',
-    'smile-lines',
-    'smiled.v',
-    'smiles-had',
     'smiles-type',
-    'smiley-like',
-    'smiley-regretful',
-    'smileypenis',
-    'smili',
-    'smilie',
-    'smiling.',
-    'smiljo',
-    'smilodon',
-    'smily',
-    'sminthopsis',
-    'smiraglia',
-    'smirf',
-    'smirnoffs',
-    'smirran',
-    'smirring',
     'smirry',
-    'smis',
-    'smission',
-    'smiteth',
-    'smith&mdash',
-    'smith&mdash;is',
-    'smith(oxfam)',
-    'smith-and-wesson',
-    'smith-dorrien',
-    'smith-eccles',
-    'smith-faines-robinson',
-    'smith-goosne',
-    'smith-hungry',
-    'smith-kline',
-    'smith-led',
-    'smith-mundt',
     'smith-perrin',
-    'smith-prescott',
-    'smith-ryland',
-    'smith-thomson',
-    'smith-veness',
-    'smith-work',
-    'smith.and',
-    'smith/actress',
-    'smith/anti',
-    'smith/appeal',
-    'smith/ashley',
-    'smith/assistant',
-    'smith/association',
-    'smith/blackbird',
-    'smith/blacksmith',
-    'smith/bookie',
     'smith/bride',
-    'smith/british',
-    'smith/broadway',
-    'smith/captain',
-    'smith/carer',
-    'smith/chaplain',
-    'smith/college',
-    'smith/con',
-    'smith/conservation',
-    'smith/engineer',
-    'smith/ex',
-    'smith/farmer',
-    'smith/father',
-    'smith/ford',
-    'smith/gloucs',
-    'smith/harwell',
     'smith/headmaster',
-    'smith/home',
-    'smith/hostel',
-    'smith/independent',
-    'smith/landlord',
-    'smith/local',
-    'smith/madonna/tim',
-    'smith/managing',
-    'smith/mayor',
-    'smith/menzies',
-    'smith/mp',
-    'smith/national',
-    'smith/neighbour',
-    'smith/oxfam',
-    'smith/oxfordshire',
-    'smith/parent',
     'smith/parish',
-    'smith/patient',
-    'smith/project',
-    'smith/pupil',
-    'smith/red',
-    'smith/rescue',
-    'smith/retired',
-    'smith/road',
-    'smith/rowland',
-    'smith/rural',
-    'smith/savage',
-    'smith/shadow',
-    'smith/simpson',
-    'smith/swindon',
-    'smith/tenant',
-    'smith/video',
     'smith/villager',
-    'smith/wiltshire',
-    'smitham',
-    'smithcraft',
-    'smithe',
-    'smithed',
-    'smithereen',
-    'smitherman',
-    'smithers-jones',
-    'smithi',
-    'smithian',
-    'smithies/captain',
-    'smithite',
-    'smithkovsky',
-    'smithm',
-    'smithmania',
     'smithr',
-    'smiths-buffs',
-    'smiths/easterhouse',
-    'smiths/moz',
-    'smithsian-type',
-    'smithson/diving',
-    'smithston',
-    'smithtown\'',
-    'smithville',
-    'smithye',
-    'smithys',
-    'smitin\'',
-    'smits',
-    'smittle',
-    'smittling',
-    'smm6',
     'smo&lstrok;dzino',
-    'smock-and-straw',
-    'smock-like',
-    'smock-maker',
-    'smock-style',
-    'smocky',
-    'smoe',
-    'smog-causing',
-    'smog-filled',
-    'smoggiest',
-    'smoike',
-    'smok',
-    'smokalizer',
-    'smoke&rehy;screen',
-    'smoke-',
-    'smoke-alarm',
     'smoke-ale',
-    'smoke-bathing',
-    'smoke-bleared',
-    'smoke-blue',
-    'smoke-bombs',
-    'smoke-busters',
-    'smoke-carrying',
-    'smoke-cleaning',
-    'smoke-darkened',
-    'smoke-detector',
-    'smoke-dyed',
-    'smoke-fogged',
-    'smoke-grimed',
-    'smoke-involv',
-    'smoke-jack',
-    'smoke-like',
     'smoke-outline',
-    'smoke-producing',
-    'smoke-reeked',
-    'smoke-rooms',
-    'smoke-scented',
-    'smoke-screens',
-    'smoke-signalled',
-    'smoke-signals',
-    'smoke-smelling',
-    'smoke-stacked',
-    'smoke-stop',
-    'smoke-swirls',
-    'smoke-tarred',
-    'smoke-tinted',
-    'smoke-tired',
-    'smoke-trail',
     'smoke-venting',
-    'smoke-wreathed',
-    'smoke.',
-    'smoke.it',
-    'smoke/dye',
-    'smokeball',
-    'smokebox',
-    'smokeless-fuel',
-    'smokelessness',
-    'smokeries',
-    'smokerings',
-    'smokeroom',
-    'smokestack-america',
-    'smokestone',
-    'smokewise',
-    'smokey-bear',
     'smokey-blue',
-    'smokos',
-    'smokovich',
-    'smoky-accented',
-    'smoky-sized',
-    'smolden',
-    'smole',
-    'smolenskaia',
-    'smolenski',
-    'smolgubispolkom',
-    'smolgubkom',
-    'smolin',
-    'smoling',
-    'smolinski',
-    'smolinski/dowty',
-    'smolka',
     'smoller',
-    'smolny',
-    'smoluchowski',
-    'smoochers',
-    'smoochie',
-    'smoochiest',
-    'smoochin\'',
-    'smoodge',
-    'smoora',
-    'smooring',
-    'smooth-',
-    'smooth-adaptation',
-    'smooth-billed',
-    'smooth-bodied',
-    'smooth-brained',
-    'smooth-featured',
     'smooth-finish',
-    'smooth-floored',
-    'smooth-glazed',
-    'smooth-leaved',
-    'smooth-limbed',
-    'smooth-phrased',
-    'smooth-riding',
-    'smooth-shaped',
-    'smooth-sided',
-    'smooth-skulled',
-    'smooth-soled',
-    'smooth-sounding',
-    'smooth-spinning',
-    'smooth-stemmed',
-    'smooth-striding',
-    'smooth-surfaced',
     'smooth-talk',
-    'smooth-talkers',
-    'smooth-textured',
-    'smooth-toned',
-    'smooth-trowelled',
-    'smoothbore',
-    'smoothed-off',
-    'smoother-of-the-way',
-    'smoother-running',
-    'smoother-tongued',
-    'smoothers',
-    'smoothing-down',
-    'smoothlands',
-    'smoothline',
-    'smoothly&mdash;although',
-    'smoothly-blended',
     'smoothly-running',
-    'smoothly-shaven',
-    'smoothly.',
-    'smoothly_on',
-    'smootho',
-    'smoothskin',
-    'smoothy-chops',
-    'smorfia',
-    'smorgans',
-    'smot',
-    'smoth',
-    'smother-love',
-    'smother-smoothed',
-    'smothercated',
-    'smotheringly',
-    'smotryashcy',
     'smotty',
-    'smoulder.i',
-    'smoulderingly',
-    'smoulderings',
-    'smouldery',
-    'smp&mdash;finnish',
-    'smp/mt',
-    'smpa',
-    'smr=191',
-    'smr=210',
-    'smr=44.7',
-    'smr=94.5',
-    'sms-kan',
-    'sms-kcnr',
-    'smsas',
-    'smta',
     'smtp%',
-    'smtp-based',
-    'smu',
-    'smudgeable',
-    'smudgily',
-    'smudgily-printed',
-    'smudginess',
-    'smugger',
-    'smuggest',
-    'smuggles',
-    'smugglin\'',
-    'smugslugs',
-    'smurfitt',
-    'smurthwaite/gloucester',
-    'smushed',
-    'smut-detector',
     'smut-flecked',
-    'smut-free',
-    'smut-peddler',
-    'smut-seeking',
-    'smutched',
-    'smutted',
-    'smuttier',
-    'smuttily',
-    'smuttiness',
-    'smylex',
-    'smyril',
-    'smyrnensis',
-    'smyth-piggott',
-    'smyth-pigott',
-    'smyth/tornado',
-    'smythurst',
     'smythye',
-    'smythyman',
-    'smytinge',
-    'sn&ecaron;movn&iacute',
-    'sn*w\'n',
-    'sn-183',
-    'sn-6911',
-    'sn-7618',
-    'sn-cl',
-    'sn-cu-w',
-    'sn-cu-zn-as',
-    'sn-snuggled',
-    'sn1000',
-    'sn15',
-    'sn1987a',
-    'sn2000',
     'sn5',
-    'sn553',
-    'sn7',
-    'sna-multi-protocol',
-    'sna-on-unix',
-    'sna-unix',
-    'sna/appn',
-    'sna/osi',
-    'sna3270',
-    'snaadee',
-    'snaafowls',
-    'snack-bars',
-    'snack-dispensing',
-    'snack-eating',
-    'snack-sized',
-    'snackbooths',
     'snackers',
-    'snacks.',
-    'snackstuffs',
-    'snacky',
-    'snacpac',
-    'snade',
-    'snader',
-    'snads',
-    'snaebjorn',
-    'snaffle-bits',
-    'snaffle-printed',
-    'snag-free',
-    'snag-toothed',
-    'snaggle-toothed',
-    'snail\'s-pace',
-    'snail-life',
     'snail-proof',
-    'snail-shaped',
-    'snail-slow',
-    'snail-trailing',
-    'snailes',
-    'snailshells',
-    'snake-',
-    'snake-barks',
-    'snake-bite',
-    'snake-buckle',
-    'snake-chasing',
-    'snake-clasped',
-    'snake-cup',
-    'snake-dance',
-    'snake-green',
-    'snake-haired',
     'snake-handled',
-    'snake-headed',
-    'snake-hunters',
-    'snake-in-the-grass',
-    'snake-infested',
-    'snake-laced',
-    'snake-mimicry',
-    'snake-preservation',
-    'snake-ridden',
-    'snake-skin',
-    'snake-stone',
-    'snake-tongued',
-    'snake-tongues',
-    'snake/dolphin/woman',
-    'snake/saracen',
-    'snakeman',
     'snakeproof',
-    'snakesiren',
-    'snakeskin-titles',
-    'snakey',
-    'snakeyes',
-    'snaks',
-    'snall',
-    'snap-box',
-    'snap-brimmed',
-    'snap-cap',
-    'snap-crackle',
-    'snap-fasteners',
-    'snap-fits',
-    'snap-fix',
-    'snap-happy',
-    'snap-hooked',
     'snap-link',
-    'snap-locked',
-    'snap-off',
-    'snap-rolled',
-    'snap-shorts',
-    'snap-to',
-    'snap-together',
-    'snapped-off',
-    'snapped-out',
-    'snappers-up',
-    'snapping-point',
-    'snappit',
-    'snappits',
-    'snapshooter',
-    'snapshooting',
-    'snapshot-sized',
     'snapshot/\'stills',
-    'snapshotting',
-    'snapt',
-    'snarf',
-    'snarford',
-    'snargate',
-    'snarkul',
-    'snarl-gape',
-    'snarl-toothed',
-    'snarled.',
-    'snarlingly',
-    'snarlings',
-    'snarply',
-    'snas',
-    'snash',
-    'snashall',
     'snashnova',
-    'snat',
-    'snatch-and-go',
-    'snatch-free',
-    'snatch-proof',
-    'snatch-shot',
-    'snatchin\'',
-    'snatchman',
-    'snave',
-    'snaw',
-    'snazzily',
-    'sncb',
-    'snce',
-    'sncos',
-    'sndvs',
-    'sneachda',
     'sneak-in',
-    'sneak-line',
-    'sneak-thief',
-    'sneaker-status',
-    'sneakered',
-    'sneakingly',
-    'sneakings',
-    'sneaky-seeming',
-    'sneaton',
-    'sneddles',
-    'sneeky',
-    'sneer-a-like',
-    'sneer-along',
-    'sneerer',
-    'sneerwell',
-    'sneery',
     'sneesby',
-    'sneeshin\'',
-    'sneeze-inducing',
-    'sneezer',
-    'sneezewort',
-    'sneezley',
-    'sneh',
-    'sneiderman',
-    'snelgars',
-    'snelgroves',
-    'snellgrove',
-    'snelson',
-    'snenton',
-    'snepp',
-    'snerdi',
-    'snes-owning',
     'sneva',
-    'snevellicci',
-    'snew',
-    'snewin',
-    'snewing',
-    'snezana',
-    'snfu',
-    'snick-snicked',
-    'snickleways',
-    'snicks',
-    'snidier',
-    'snidley',
-    'sniff-in',
-    'sniffed-over',
-    'snifs',
-    'snig',
     'sniggerings',
-    'sniggle',
-    'snipe-grass',
-    'sniperscopes',
-    'snipped-off',
-    'snipped-photograph',
-    'snipper',
-    'snipperin',
-    'snippers',
-    'snips/',
-    'snitcher',
-    'snitchline',
-    'snitow',
-    'snitterby',
-    'snivelly',
-    'snivels',
     'snix',
-    'snj',
-    'snj-5',
-    'snl/sseb',
-    'snmp-compliant',
-    'snmpv1',
-    'sno-cat',
-    'sno-go',
-    'snoately',
-    'snobol',
-    'snocat',
-    'snock',
-    'snockrigg.',
-    'snoddyisms',
-    'snods',
-    'snoeck-ducaju',
     'snoek',
-    'snoggery',
-    'snoggin',
-    'snogs',
-    'snood-like',
-    'snooke',
-    'snooker(pool)-room',
-    'snooker-fashion',
-    'snooker-free',
-    'snooker:thursday',
-    'snookering',
-    'snoopin\'',
-    'snoopy-like',
-    'snooze-along',
-    'snoozer',
-    'snoozesque',
     'snoozy',
-    'snorbits',
-    'snorebuster',
-    'snorin\'',
-    'snoringly',
-    'snork',
-    'snorkelers',
-    'snorkeling',
-    'snorkeller',
-    'snorkellers',
-    'snorkelors',
-    'snorklers',
-    'snorre',
-    'snort.',
-    'snorted\'\'',
-    'snortian',
     'snot-encrusted',
-    'snot-faced',
-    'snot-rollers',
-    'snotball',
-    'snotches',
-    'snotface',
-    'snotgreen',
-    'snots',
-    'snotta',
-    'snottily',
-    'snottor',
-    'snotty&rehy;nosed',
-    'snouck',
-    'snout-visored',
-    'snouted',
-    'snouter',
     'snouting',
-    'snoutish',
-    'snow&rehy;white',
-    'snow-bank',
-    'snow-banks',
-    'snow-birds',
-    'snow-blanketed',
-    'snow-blocked',
-    'snow-blowers',
-    'snow-blown',
-    'snow-bright',
-    'snow-carpeted',
-    'snow-chaos',
-    'snow-cleaners',
-    'snow-clogged',
-    'snow-cloud',
     'snow-coated',
-    'snow-cock',
-    'snow-covering',
-    'snow-dazzle',
-    'snow-draped',
-    'snow-dripping',
-    'snow-dust',
-    'snow-dusted',
-    'snow-encrusted',
-    'snow-famine',
-    'snow-flakes',
-    'snow-frozen',
-    'snow-gale',
-    'snow-gates',
-    'snow-grooming',
-    'snow-ground',
     'snow-hungry',
-    'snow-job',
-    'snow-laced',
-    'snow-like',
-    'snow-line',
-    'snow-lit',
-    'snow-locked',
-    'snow-lonely',
-    'snow-mantled',
-    'snow-on-the-boots',
-    'snow-piled',
-    'snow-powdered',
-    'snow-scape',
-    'snow-screen',
-    'snow-shoes',
-    'snow-shrouded',
     'snow-skiing',
-    'snow-slope',
-    'snow-spattered',
-    'snow-starved',
-    'snow-storm',
-    'snow-storms',
-    'snow-streaked',
-    'snow-striped',
-    'snow-suit',
-    'snow-tipped',
-    'snow-topped',
-    'snow-vales',
-    'snow-washed',
-    'snow-water',
-    'snow-wet',
-    'snow-wreath',
     'snow/flooding',
-    'snowball-throwing',
-    'snowbanks',
-    'snowbelt',
-    'snowblasted',
-    'snowboarder',
-    'snowboy-fuelled',
-    'snowcat',
-    'snowcemed',
-    'snowcemmed',
-    'snowclad',
-    'snowclouds',
-    'snowcock.',
-    'snowcocks',
-    'snowcover',
-    'snowcovered',
     'snowcrete',
-    'snowdon-sized',
-    'snowdon/prison',
-    'snowdonia:soil',
-    'snowdrifting',
-    'snowella',
-    'snowflaked',
-    'snowfox',
-    'snowiest',
-    'snowily',
-    'snowin\'',
-    'snowing.',
-    'snowless',
-    'snowley',
-    'snowlight',
-    'snowmobiling',
     'snowpack',
-    'snowpake',
-    'snowplast',
-    'snowploughs',
-    'snowprints',
-    'snowscene',
-    'snowscenes',
-    'snowsell',
-    'snowshine',
-    'snowshoeing',
-    'snowshooters',
-    'snowstake',
-    'snowsuits',
-    'snowtime',
-    'snowwhite',
-    'snowwoman-like',
     'snowys',
-    'snozzberries',
-    'snp-',
-    'snps',
-    'snsb',
-    'snub-ended',
-    'snubbins',
-    'snubnosed',
-    'snudge',
-    'snuff&rehy;taking',
-    'snuff-allergy',
-    'snuff-boxes',
-    'snuff-content',
-    'snuff-handkerchief',
-    'snuff-making',
-    'snuff-movie',
     'snuff-sniffing',
-    'snuff-taking',
-    'snuffed-out',
-    'snuffedout',
-    'snuffer-stand',
-    'snuffers',
-    'snuffhouse',
-    'snuffley',
-    'snug-fit',
-    'snugbury',
-    'snugger',
-    'snuggest',
-    'snuggler',
-    'snuggs',
-    'snuzzle',
-    'sny',
     'snydall',
-    'snyrk',
-    'snythesis',
-    'so&mdash;he',
-    'so&mdash;ie',
-    'so&mdash;servants',
-    'so&mdash;there',
-    'so&ndash',
-    'so&oslash;ren',
-    'so\'as',
-    'so-accused',
-    'so-an\'-so',
-    'so-andso',
-    'so-called-interrogators',
-    'so-calledrevolt',
-    'so-centimetre',
     'so-clean',
-    'so-conceived',
-    'so-familiar',
-    'so-far-lucky',
-    'so-far-unnamed',
-    'so-fit',
-    'so-forth',
-    'so-funny',
-    'so-i\'ve-heard',
-    'so-important',
-    'so-lo-head-beg',
-    'so-lonely',
-    'so-many',
-    'so-na',
-    'so-o',
-    'so-o-o',
     'so-often',
-    'so-on',
-    'so-pale',
-    'so-respectable',
-    'so-said',
-    'so-seldom-found',
-    'so-to-speak',
-    'so-typical',
-    'so-vital',
-    'so-when',
-    'so-young',
-    'so.2d',
-    'so.called',
-    'so.j',
-    'so.the',
-    'so/3ll',
     'so/because',
-    'so/eotvos',
-    'so/freccia',
-    'so/hso',
-    'so/levine',
-    'so/maazel',
-    'so/makzymiuk',
-    'so/otaka',
-    'so/pretre',
-    'so/rozhdestvensky',
-    'so/sawallisch',
-    'so/to',
-    'so/zagrosek',
-    'so11',
-    'so1316/f\'',
-    'so17',
     'so21',
-    'so2929',
-    'so2f2',
-    'so41',
-    'so6',
-    'so:afd',
-    'so:perhaps',
-    'so_a_little',
-    'so_apart',
-    'so_at',
-    'so_far_erm_as',
-    'so_i_took_a_nick_out_of',
-    'so_in',
-    'so_on_and_so_on',
-    'so_so_long_as',
-    'soa',
     'soacaich',
-    'soak-spray',
-    'soaking-up',
-    'soakway',
-    'soale',
-    'soang',
-    'soanian',
-    'soanic',
-    'soap-art',
-    'soap-ash',
-    'soap-bag',
-    'soap-boiler',
-    'soap-boiling',
-    'soap-boxing',
-    'soap-bubble',
-    'soap-dispenser',
     'soap-dream',
-    'soap-like',
-    'soap-looking',
-    'soap-makers',
-    'soap-manufacturer',
-    'soap-on-a-rope',
-    'soap-powder',
-    'soap-rack',
-    'soap-scum',
-    'soap-sleeked',
-    'soap-slick',
-    'soap-slicked',
-    'soap-stars',
-    'soap-style',
-    'soap-up',
-    'soapbar',
     'soapboax',
-    'soapbox.it',
-    'soapboxes',
-    'soapcase',
-    'soapers',
-    'soapflakes',
-    'soaptime',
-    'soapworks',
-    'soar-away',
-    'soarers',
-    'soas',
-    'soaves',
-    'sob&ecaron;slav',
-    'sob-shaken',
-    'sob-story',
-    'sob90',
     'sobarattled',
-    'sobbingly',
-    'sobchak&mdash;mayor',
-    'sobel-feldman',
-    'sobelman',
-    'sobels',
-    'soben',
-    'soberania',
-    'soberest',
-    'soberly-clad',
-    'soberly-dressed',
-    'sobersides',
-    'sobey',
-    'sobhan',
-    'sobhi',
-    'sobi',
     'sobieczky',
-    'sobiesky',
-    'sobin',
-    'sobisch',
-    'soble',
-    'sobomoe',
-    'sobona',
-    'sobotka',
-    'sobraon',
-    'sobretta',
-    'sobrinho',
-    'sobrino',
-    'sobukwe',
-    'soby',
-    'soc-held',
-    'soc-iety',
     'socach',
-    'socar',
-    'soccer-ball-shaped',
-    'soccer-illiterate',
-    'soccer-kickabout',
-    'soccer-mad-country',
-    'soccer-only',
-    'soccer-player',
-    'soccer-related',
-    'soccer-saturated',
-    'soccer-speak',
-    'soccer/shop-floor',
-    'soccerdiary',
-    'soccorrere',
-    'sochagota',
-    'soche',
     'sochineniya',
-    'sochoux',
-    'soci&eacute;t&egrave',
-    'soci&eacute;tes',
-    'sociabilities',
-    'sociability.',
-    'sociable\'',
-    'social&rehy;democratic',
-    'social&rehy;expressive',
-    'social\'',
-    'social-',
-    'social-action',
-    'social-aid-cum-aphrodisiac',
-    'social-and-economic-factors',
-    'social-and-economic-factors-',
-    'social-based',
     'social-catholic',
-    'social-class-based',
-    'social-climber',
-    'social-comment',
-    'social-contract',
-    'social-cristiano',
-    'social-cum-geographical',
-    'social-cum-physical',
-    'social-cum-spatial',
-    'social-darwinism',
-    'social-defence',
-    'social-democracy',
-    'social-democrate',
-    'social-dividend-type',
-    'social-dynamic',
-    'social-ecological',
     'social-emotional',
-    'social-engineering',
-    'social-events',
-    'social-fascist',
-    'social-freudian',
-    'social-history',
-    'social-hunting',
-    'social-industrial',
-    'social-learning',
-    'social-metaphysical',
-    'social-movement',
-    'social-revolutionaries',
-    'social-sciences',
-    'social-service',
-    'social-spending',
-    'social-systems',
     'social-tenurial',
-    'social-theoretical',
-    'social-welfare-like',
-    'social-worked',
-    'social-world',
-    'social.wholes',
-    'social/communicative',
-    'social/econ.',
-    'social/educational',
-    'social/emotional',
-    'social/environmental',
-    'social/ethnic',
-    'social/human',
-    'social/organisational',
-    'social/support',
-    'social/women',
     'social_a',
-    'sociali',
-    'socialise.',
-    'socialiser',
-    'socialises',
-    'socialishays',
-    'socialism-for-the-rich',
-    'socialism.',
-    'socialism/left',
-    'socialist-green',
-    'socialist-inclined',
-    'socialist-influenced',
-    'socialist-leaning',
-    'socialist-left',
-    'socialist-realism',
-    'socialist-style',
     'socialist-turned-nap',
-    'socialist/labour',
-    'socialist/separatist',
-    'socialist/social',
-    'socialistes-ffs',
-    'socialistikou',
-    'socialistisk',
-    'socialists.the',
-    'socialization-about',
-    'socialize\'',
-    'socializers',
-    'socially&rehy;conditioned',
-    'socially\'',
-    'socially-',
-    'socially-aware',
-    'socially-biased',
     'socially-changed.',
-    'socially-coded',
-    'socially-committed',
-    'socially-constructed',
-    'socially-created',
-    'socially-embedded',
-    'socially-imprinted',
-    'socially-minded',
-    'socially-orientated',
-    'socially-patterned',
-    'socially-recognised',
-    'socially-relevant',
-    'socially-responsible',
-    'socially-shared',
-    'socially-structured',
-    'socially-unacceptable',
     'socially-valued',
-    'socially-very-much-in-demand',
-    'sociata',
-    'socie',
-    'socieias',
-    'sociely',
-    'societes',
-    'society&mdash\'one',
-    'society&mdash;as',
-    'society&mdash;than',
-    'society&mdash;we',
-    'society&rehy;complete',
-    'society(ies)',
-    'society-are',
-    'society-breaking',
-    'society-column',
     'society-environment',
-    'society-filled',
-    'society-monarchy',
-    'society-mortgagee',
-    'society-organised',
-    'society-s',
-    'society-spring',
-    'society.the',
-    'society/culture',
-    'society/estate',
-    'society/sepsu',
-    'societys',
-    'societyws21',
-    'sociey',
-    'sociis',
-    'socijalisticka',
     'socinian',
-    'socinianism',
-    'socio&ndash;political',
-    'socio&rehy;biological',
-    'socio&rehy;cultural',
-    'socio&rehy;culturally',
-    'socio&rehy;demographic',
-    'socio&rehy;technical',
-    'socio-anthropological',
-    'socio-clinical',
-    'socio-culturally',
-    'socio-economic-cultural-political',
-    'socio-economics',
-    'socio-educational',
-    'socio-explanations',
-    'socio-geographic',
     'socio-historic',
-    'socio-income',
-    'socio-labour',
-    'socio-literary',
-    'socio-logical',
-    'socio-material',
-    'socio-military',
-    'socio-musical',
-    'socio-pedagogical',
-    'socio-philosophical',
-    'socio-physical',
-    'socio-production',
-    'socio-productive',
-    'socio-tenurial',
-    'socio.economic',
-    'socio/psycho-linguistics',
     'socioecologists',
-    'socioeconomic-viewpoint',
-    'sociogenesis',
-    'sociogrammar',
-    'socioial',
-    'sociol',
-    'sociolects',
-    'sociologic',
-    'sociological\'',
-    'sociological.',
-    'sociological/anthropological',
-    'sociologically-based',
-    'sociologico-cultural',
-    'sociologistic',
-    'sociologization',
-    'sociologizing',
     'sociology.',
-    'sociology/centre',
-    'sociophonetic',
-    'socios',
-    'sociosphere',
-    'socjal',
-    'socjaldemokratyczna',
-    'socjalistyczna',
-    'sock-clad',
-    'sock-drawer',
-    'sock-it-to-\'em',
-    'sock-it-to-em',
-    'sock-it-to-him',
-    'sock-laden',
-    'sock-like',
-    'sock-maker',
     'sock-makers',
-    'sock-suspenders',
-    'sock-washing',
-    'sockburn',
-    'socked-inn',
-    'socket-bayonet',
-    'socket-ended',
-    'socket-like',
-    'socket-sadly',
-    'socket-starved',
-    'socket-teeth',
-    'socket/',
-    'socketry',
-    'sockets-based',
-    'sockets.',
-    'socketts',
     'sockfuls',
-    'sockies',
-    'sockli',
-    'socknersh',
-    'socks/tights',
-    'socky',
-    'socoa',
-    'socrate',
-    'socratea',
-    'socratic-alexandrian',
-    'socratic-critical',
-    'socratics',
-    'socratistic',
-    'socsc',
-    'sod\'',
-    'sod\'em',
     'sod-built',
-    'sod-the-brewer',
-    'soda-ash',
-    'soda-bread',
-    'soda-lime-permanganate',
-    'soda-lime-silica',
-    'soda-silica',
-    'soda-syphon',
-    'soda.',
-    'sodalis',
-    'sodalite',
-    'sodamide',
-    'sodapop',
-    'sodawaterwala',
-    'sodbusting',
-    'sodded',
     'soddin\'',
-    'soddit',
-    'soden/wife',
-    'soderburgh',
-    'soderlund',
-    'sodertalje',
-    'sodeyn',
-    'sodeynly',
-    'sodger',
-    'soditic',
-    'sodiu',
-    'sodium-dependence',
-    'sodium-dodecyl-sulfate',
-    'sodium-free',
-    'sodium-lit',
-    'sodium-yellow',
     'sodium/',
-    'sodium/sulphur',
-    'sodiumazide',
-    'sodiumdeoxycholate',
-    'sodiumpicosulfate',
-    'sodn',
-    'sodo',
-    'sodomies',
-    'sodomites',
-    'sodomized',
-    'sodon',
-    'sodone',
-    'sodor',
-    'sodre',
-    'soeboer',
-    'soed-sponsored',
     'soedono',
-    'soehne',
-    'soeieties',
-    'soelne',
-    'soemering',
-    'soemrville',
-    'soendre',
-    'soengi',
-    'soepi',
-    'soerjadi',
-    'soerloth',
-    'sof\'',
-    'sofa-covers',
-    'sofa-cushion',
-    'sofa-lounging',
-    'sofa-swing',
     'sofa-table',
-    'sofabeds',
-    'sofalcone',
-    'sofeti',
-    'soffes',
-    'soffretemi',
-    'sofidou',
-    'sofistication',
-    'sofitex',
-    'sofiya',
-    'sofon&iacute;as',
-    'sofort',
-    'sofrecom',
-    'sofronis',
-    'soft&rehy;hearted',
-    'soft&rehy;porn',
     'soft-back',
-    'soft-backed',
-    'soft-ball',
-    'soft-balls',
-    'soft-bite',
-    'soft-bottomed',
-    'soft-bristled',
-    'soft-but-powerful',
-    'soft-centre',
-    'soft-class',
-    'soft-commission',
-    'soft-commissions',
-    'soft-conventionalist',
-    'soft-couple',
-    'soft-curd',
-    'soft-curled',
     'soft-currency',
-    'soft-cushioned',
-    'soft-drawling',
-    'soft-eating',
-    'soft-featured',
-    'soft-focused',
-    'soft-focusing',
-    'soft-font',
-    'soft-footing',
-    'soft-furred',
-    'soft-glowing',
-    'soft-goods',
-    'soft-green',
-    'soft-grip',
-    'soft-grounded',
-    'soft-gutted',
     'soft-hat',
-    'soft-heartedness',
-    'soft-hued',
-    'soft-iced',
-    'soft-iron',
-    'soft-jowled',
-    'soft-land',
-    'soft-landers',
-    'soft-landing',
-    'soft-law',
-    'soft-leather',
-    'soft-line',
-    'soft-look',
-    'soft-mode',
-    'soft-money',
-    'soft-nose',
     'soft-occult',
-    'soft-on',
-    'soft-packed',
-    'soft-peddling',
-    'soft-plumaged',
-    'soft-porn-tabloid',
-    'soft-rockers',
-    'soft-seated',
-    'soft-seeming',
-    'soft-selling',
-    'soft-serve',
-    'soft-set',
-    'soft-shoed',
-    'soft-shoulder',
-    'soft-shouldered',
-    'soft-skills',
     'soft-sold',
-    'soft-sox',
-    'soft-speaking',
-    'soft-spiked',
-    'soft-spokenness',
-    'soft-spot',
-    'soft-spots',
-    'soft-stick',
-    'soft-talk',
-    'soft-talked',
-    'soft-textured',
-    'soft-tinted',
-    'soft-tissue',
-    'soft-to-the-touch',
-    'soft-toned',
-    'soft-underbelly',
     'soft-ware',
-    'soft-ware-failure',
-    'soft-wood',
-    'soft/applied',
-    'soft/femininity',
-    'soft/hard',
-    'soft/pure',
-    'soft/something',
-    'softalk',
-    'softbacks',
-    'softbyte',
-    'softcore',
-    'softech',
-    'softee',
-    'soften-up',
-    'softened-up',
     'softening-regenerating',
-    'softer-grained',
-    'softer-sounding',
-    'softex',
-    'softfont',
-    'softfonts',
-    'softglow',
-    'softgrain',
-    'softgrained',
-    'softheaded',
-    'softletter',
-    'softley',
-    'softlib&commat;cs.rice.edu',
-    'softlink',
-    'softly&rehy;softly',
-    'softly-carpeted',
     'softly-glowing',
-    'softly-shaped',
-    'softness.to',
-    'softnesses',
-    'softnet',
-    'softpac',
-    'softpedalled',
-    'softquad',
-    'softservice',
-    'softshell',
-    'softshelled',
-    'softw',
-    'software&mdash;library.lstrain.p',
-    'software&rehy;based',
-    'software-controlled',
-    'software-development',
     'software-from-hell',
-    'software-implementation',
-    'software-maintenance',
-    'software-real-time',
-    'software-specific',
-    'software-support',
-    'software-switchable',
-    'software-systems',
-    'software-through-pictures',
-    'software-upgrade',
-    'software.based',
-    'software.the',
-    'software/systems',
-    'software/x',
-    'softwarefabrik',
-    'softwarily',
     'softwash',
-    'softway',
-    'softworld',
-    'softy-softy',
-    'sog&uuml;t',
-    'sog-si',
-    'sogenannte',
-    'soggetti',
-    'soggiest',
-    'sogginess',
-    'soght',
-    'sogin',
-    'sogni',
-    'sogno',
-    'sogreesh\'sia',
-    'sogu',
     'sohag&ndash;el',
-    'sohail45',
-    'sohail51',
-    'sohal',
-    'sohan',
-    'sohani',
-    'sohc',
-    'sohhd',
-    'sohigian',
-    'sohio',
-    'soho-based',
-    'soho-ite',
-    'soho/italian',
-    'sohoni',
-    'sohrab',
-    'sohwa',
     'soi-m&ecirc;me',
-    'soichiro',
-    'soicitor',
-    'soide',
-    'soignee',
-    'soil\'',
-    'soil-assessment',
-    'soil-caked',
-    'soil-climate',
-    'soil-containing',
-    'soil-induced',
-    'soil-inhabiting',
-    'soil-landscape',
-    'soil-mining',
-    'soil-nutrient',
-    'soil-nutrients',
     'soil-plant-water',
-    'soil-preparation',
-    'soil-science',
-    'soil-structure',
-    'soil-testing',
-    'soil-vegetation',
-    'soil-water',
-    'soil.',
-    'soil.they',
-    'soil/air',
-    'soil/climate/water',
-    'soil/water/gravity',
-    'soild',
-    'soilers',
-    'soileth',
-    'soilings',
     'soilmarks',
-    'soime',
-    'soire&eacute',
-    'soissonnais',
-    'soisy-sous-montmorency',
-    'soixante',
-    'soja',
-    'sojer',
-    'sokal',
-    'sokalin',
-    'sokchu',
-    'sokell',
-    'sokhta',
-    'soko&lstrok',
-    'sokolac',
-    'sokollo',
     'sokollu',
-    'sokolova',
-    'sokolovic',
-    'sokolovskii',
-    'sokolow',
-    'sokrat',
-    'sokui-no-rei',
-    'sokullu',
-    'sol&oacute;zarno',
-    'sol-dier',
-    'sol-eau-vent',
-    'solaino',
-    'solanet',
-    'solani',
-    'solanis',
-    'solanopteris',
     'solans',
-    'solanums',
-    'solanus',
-    'solar-cycle-length',
-    'solar-forcing-alone',
-    'solar-gain',
-    'solar-imperial',
-    'solar-mass',
-    'solar-pond',
-    'solar-produced',
-    'solar-reflective',
-    'solar-type',
-    'solar/',
-    'solar/polar',
-    'solaria',
-    'solarin',
     'solaris-based',
-    'solaris-for-sparc',
-    'solarium.',
-    'solarization',
-    'solarized',
-    'solarpanels',
-    'solarpowered',
-    'solars',
-    'solberg',
-    'solberge',
-    'solche',
-    'solcum',
-    'soldanella',
-    'soldani-benzi',
-    'soldaten',
-    'soldati',
     'soldatov',
-    'solden',
-    'solder-tags',
-    'solderable',
-    'solderer',
-    'soldian',
-    'soldier&rehy;clients',
-    'soldier-administrator',
-    'soldier-artist',
-    'soldier-boy',
-    'soldier-diplomat',
-    'soldier-hero',
-    'soldier-heroes',
-    'soldier-husband',
-    'soldier-husbands',
-    'soldier-in-charge',
     'soldier-mps',
-    'soldier-of-fortune',
-    'soldier-pheromone',
-    'soldier-politician',
-    'soldier-saint',
-    'soldier-sayings',
-    'soldier-son',
-    'soldier-statesman',
-    'soldier/central',
-    'soldiers-come-home',
-    'soldiers-of-fortune',
-    'soldiers.',
-    'soldiers.they',
-    'soldierswere',
-    'soldium',
-    'sole-leather',
     'sole-mate',
-    'sole-source',
-    'sole-trader',
-    'sole-trading',
-    'solecki',
-    'soledad',
-    'soleful',
-    'solemn&rehy;faced',
-    'solemn-',
-    'solemnified',
-    'solemnising',
-    'solenelle',
-    'solennes',
-    'solennis',
-    'solent-rouen-sennely',
-    'solenzara',
     'soleplate',
-    'soleras',
-    'soleri',
-    'soles.',
-    'soles.the',
-    'solesmes',
-    'solesterol',
-    'soleto',
-    'solf&eacute;rino',
-    'solfainge',
-    'solfataras',
-    'solfege',
-    'solhall',
-    'soliac',
-    'solicates',
-    'solicitin\'',
     'soliciting/cannot',
-    'solicitor-advocates',
-    'solicitor-client',
-    'solicitor-dishonesty',
-    'solicitorappointed',
-    'solicitors-executor',
-    'solicitors/conveyancing',
-    'solicitorto',
-    'solictor',
-    'solictors',
-    'solid-as',
-    'solid-backed',
-    'solid-bodied',
-    'solid-breasted',
-    'solid-brickwork',
-    'solid-cast',
     'solid-colour',
-    'solid-coloured',
-    'solid-for-the',
-    'solid-framed',
-    'solid-frozen',
-    'solid-headed',
-    'solid-like',
-    'solid-model',
-    'solid-propellant',
-    'solid-riffing',
-    'solid-solid',
-    'solid-timber',
-    'solid-top',
-    'solid-tyred',
-    'solid-void',
-    'solid-wood',
     'solid/liquid',
-    'solid/void',
-    'solidad',
-    'solidarios',
-    'solidarity-as-we-know-it',
-    'solidarity-based',
-    'solidarity-dominated',
-    'solidarity-sponsored',
-    'solide',
-    'solidest',
-    'solidite',
-    'soliditie',
-    'solidly-argued',
-    'solidly-based',
-    'solidly-grouped',
-    'solido',
     'solidox',
-    'solidree',
-    'solids-removal',
-    'solihull.',
-    'solijon',
-    'solikh',
-    'solilo',
-    'soliloquise',
-    'soliloquising',
-    'soliloquized',
-    'soliloquizes',
-    'soliman',
-    'solimnoes',
-    'solinas',
-    'solings',
-    'solipsism\'',
     'solisortus',
-    'solisti',
-    'solitarily',
-    'solitary-place',
-    'solitary.',
-    'soliticors',
-    'soliton.',
-    'solitudinous',
-    'soliu',
-    'solium',
-    'sollahs',
-    'sollemnia',
-    'solley',
-    'sollicitor',
-    'sollicitour',
-    'sollid',
     'sollis/forest',
-    'sollner-web',
-    'sollom',
-    'sollum',
-    'solmes',
-    'solna',
-    'solnyshko',
-    'solo-anchor',
-    'solo-brandy',
-    'solo-work',
-    'solo/choral',
-    'solo/interlude',
-    'solochrome',
-    'solodkoff',
-    'soloff',
-    'solofoson',
     'solognat',
-    'solognate',
-    'soloist-aware',
-    'soloist/narrator',
-    'soloisti',
-    'solomat',
-    'solomou',
-    'solomoukha',
-    'solona',
-    'solonian',
-    'solonnelle',
-    'solorzano',
-    'solotec',
-    'solovetsky',
-    'soloviov/russian',
-    'solpadeine',
     'solphadeine',
-    'solphadeines',
-    'sols',
-    'solskifte',
-    'soltau-luneberg',
-    'soltenpur',
-    'solter',
-    'solti/decca',
-    'solto',
-    'solton',
-    'soltw&bsol;are',
-    'solu',
-    'solu-tions',
-    'soluable',
-    'solubilize',
-    'solubles',
     'soluch',
-    'soluis',
-    'solution\'',
-    'solution(s)',
-    'solution-oriented',
-    'solution-state',
-    'solution/map',
-    'solution/risc',
-    'solv',
-    'solvates',
-    'solve-all',
-    'solve-care',
-    'solveg',
-    'solvencies',
-    'solvendo',
-    'solvenero/adelaide',
     'solvent-cleaned',
-    'solvent-cleaning',
-    'solvent-mediated',
-    'solvent-spun',
-    'solvent-transfer',
-    'solventbased',
-    'solvi',
-    'solvorn',
-    'solwise',
-    'solymian',
-    'solzhenitzyn',
-    'soma-ugt',
-    'somabp',
-    'somain',
-    'somali-ethiopian',
-    'somali-kenyan',
     'somali-language',
-    'somalls',
-    'somalus',
-    'somap',
-    'somas',
-    'somat',
-    'somata',
-    'somatasensory',
-    'somatochlora',
-    'somatomedin',
-    'somatomedin-c',
-    'somatomotor',
-    'somatostatine',
-    'somatostatinoma',
-    'somatotrophin',
-    'somber',
     'somberen',
-    'somberly',
-    'sombolay',
-    'sombra',
-    'sombre-eyed',
-    'sombre-looking',
-    'sombre-suited',
-    'sombre-visaged',
-    'sombre-yet-supportive',
-    'sombreal',
-    'sombrely-attired',
-    'sombun',
-    'somchai',
-    'somdele',
-    'somdomite',
-    'some&pound;thing',
     'some&rehy;time',
-    'some\'',
-    'some\'at',
-    'some\'un',
-    'some-',
-    'some-body',
-    'some-examples',
-    'some-race',
-    'some-something',
-    'some-thing',
-    'some-thing-or-other',
-    'some-what',
-    'some-where',
-    'some-would-say',
-    'some.other',
-    'some/plan',
     'someb',
-    'somebo',
-    'somebody.',
-    'somebodys',
-    'somedays',
-    'somee',
-    'somefin\'',
-    'somehow.',
-    'somehwat',
-    'somekh',
-    'somen',
-    'somenthing',
-    'someoine',
-    'someone\'',
-    'someone-fifth',
-    'someone/something',
     'someone_other',
-    'someones',
-    'someonone',
-    'somep\'n',
-    'somer',
-    'somerhill',
-    'somerses',
-    'somerset-',
-    'somerset-born',
-    'somerset/dorset',
-    'somerstown',
-    'somerton-rayner',
-    'somerville-1941',
-    'somerville-arjat',
-    'somerville-large',
-    'somesul',
     'somet&ndash;g',
-    'something&mdash',
-    'something\'',
-    'something-a',
-    'something-and',
-    'something-bird',
-    'something-for-',
-    'something-not-quite-right',
-    'something-or&rehy;other\'s',
-    'something-or-the-other',
-    'something-perhaps',
-    'something/or',
-    'somethingorother',
-    'somethings-or-other',
-    'sometim',
-    'sometime-sidekick',
     'sometimes&mdash;relied',
-    'sometra',
-    'sometymes',
-    'somew',
-    'somewhat&mdash\'i',
-    'somewhat-pessimistic',
-    'somewhere&mdash',
-    'somewhere&rehy;in',
-    'soming',
-    'somival',
-    'somlo',
-    'somma',
-    'sommerby',
-    'sommerfield',
-    'sommerled',
-    'sommersett',
     'sommerville/itn',
-    'sommerwell',
-    'sommet',
-    'somnambula',
-    'somnambulent',
-    'somnambulis',
-    'somnambulists',
-    'somner',
-    'somnia',
-    'somnific',
-    'somoa',
-    'somocista',
-    'somone',
-    'somos',
-    'somphong',
-    'somycel',
     'son\'',
-    'son-',
-    'son-et-lumi&egrave;re',
-    'son-from-the-flesh-and-wood',
-    'son-god',
-    'son-in-laws',
-    'son-inlaw',
-    'son-la',
-    'son-of',
-    'son-of-a',
-    'son-of-a-gun',
-    'son-of-a-jackass',
-    'son-of-a-kraut-bitch',
-    'son-of-joy-division',
-    'son-of-maastricht',
-    'son-of-metal-pipe',
     'son-religion',
-    'son-shil',
-    'son-shine',
-    'son-t',
-    'son.',
-    'son/communist',
-    'son/his',
-    'son/take',
-    'sona',
-    'sonachan',
-    'sonae',
-    'sonaghen',
-    'sonagraph',
-    'sonald',
-    'sonali',
-    'sonangol',
     'sonarch',
-    'sonarsi',
-    'sonat',
-    'sonate',
-    'soncino',
-    'sond&eacute;n',
-    'sondaicus',
-    'sondashi',
-    'sonday',
-    'sondek',
-    'sonderbehandlung',
-    'sonderborg',
-    'sonderfall',
-    'sonderhausen',
-    'sondern',
-    'sondhang',
     'sondrestrom',
-    'sondup',
-    'sondwana',
-    'soned',
-    'sonee',
-    'sonef',
-    'sonenscher',
-    'sonenstein',
-    'sonerous',
-    'sones',
-    'sonesta',
-    'soneto',
-    'sonetti',
-    'sonex',
-    'sonfist',
-    'sonfonias',
     'song&mdash;the',
-    'song-arrangements',
-    'song-bird',
-    'song-birds',
-    'song-building',
-    'song-composers',
-    'song-composition',
-    'song-copies',
-    'song-dances',
-    'song-flighting',
-    'song-ju',
-    'song-like',
-    'song-melodies',
-    'song-owners',
-    'song-perch',
-    'song-phrase',
     'song-preference',
-    'song-publishers',
-    'song-publishing',
-    'song-rhythms',
-    'song-savvy',
-    'song-sensitive',
-    'song-shapes',
-    'song-sheet',
-    'song-sheets',
-    'song-singing',
-    'song-thrush',
-    'song-thrushes',
-    'song-title',
-    'song-treasury',
-    'song-treatment',
-    'songbag',
     'songea',
-    'songed',
-    'songeuse',
-    'songhay',
-    'songline',
-    'songlist',
-    'songs-baker/',
-    'songshan',
-    'songsmith',
-    'songsmithery',
-    'songspell',
-    'songstrel',
-    'songstresses',
-    'songthrush',
-    'songul',
-    'songwise',
     'songwright.',
-    'songwriter-pianist-producer',
-    'songwriter/artists',
-    'songwriter/composer',
-    'songwriter/guitarist',
-    'songwriter/singer',
-    'songy-type',
-    'sonia\'',
-    'sonic-searchlight',
-    'sonic/ciccone',
-    'sonicating',
-    'soniere',
-    'sonified',
-    'soniharp',
-    'soniprobe',
-    'sonje',
     'sonksen',
-    'sonlet',
-    'sonmez',
-    'sonn&oacute;0',
-    'sonneborn',
-    'sonneillon',
-    'sonneman',
-    'sonnenblumenbild',
-    'sonnenfeld',
-    'sonnenshein',
-    'sonneratiaceae',
-    'sonneries',
-    'sonnes',
-    'sonnet-settings',
-    'sonnet-writers',
-    'sonneteer',
     'sonneteers',
-    'sonnett',
-    'sonnino',
-    'sonntagsblatt',
-    'sonobuoys',
-    'sonochemical',
-    'sonochemistry',
-    'sonocosta',
-    'sonograph',
-    'sonolidate',
-    'sonomatics',
-    'sonoro',
-    'sonovabitches',
-    'sonphongsii',
-    'sonrai',
-    'sons-',
     'sons.',
-    'sons/daughters',
-    'sonsichay',
-    'sonsie',
-    'sonsiri',
-    'sontania',
-    'sontas',
-    'sontax',
-    'sonthal',
-    'sontheimer',
-    'sonthell',
-    'sonthofen',
-    'sontinued',
-    'sonu',
-    'sonvoluted',
-    'sonwic',
     'sony-columbia',
-    'sony-nec',
-    'sony-tek',
-    'sony/columbia',
-    'sonyou',
-    'soo-boo-lar-ta',
-    'sook',
-    'sookers',
-    'sookhdeo',
-    'sookit',
-    'sool',
-    'soolp',
-    'soomers',
-    'soon-ho',
-    'soon-overthrown',
-    'soon-sooner',
     'soon-to-be-beatified',
-    'soon-to-be-deceased',
-    'soon-to-be-expanded',
-    'soon-to-be-familiar',
-    'soon-to-be-flooded',
-    'soon-to-be-foisted-on-us',
-    'soon-to-be-installed',
-    'soon-to-be-novell',
-    'soon-to-be-obsolete',
-    'soon-to-be-opened',
-    'soon-to-be-popular',
-    'soon-to-be-redundant',
-    'soon-to-be-resident',
-    'soon-to-be-retired',
-    'soon-to-be-seen',
-    'soon-to-be-signed-to-geffen',
     'soon-to-be-tv-series',
-    'soon-to-be-worthless',
-    'soon-to-debut',
-    'soon-to-disappear',
-    'soon-to-emerge',
-    'soon-to-mature',
-    'soon-to-merge',
-    'soon.',
-    'soond',
-    'soondless',
-    'soonds',
-    'soone',
-    'sooner-',
-    'sooner-arrive',
-    'soonsiri',
-    'sooooooo',
     'soot-contaminated',
-    'soot-flowers',
-    'soot-free',
-    'soot-marks',
-    'soot-plumed',
-    'soot-smeared',
-    'soot-stains',
-    'soot-streaks',
-    'sootfall',
-    'sooth-moothers',
-    'sooth-sayes',
-    'sootha',
-    'soothmoother',
-    'sooties',
-    'sootnoshenie',
-    'sooty-black',
     'sooty-faced',
-    'sooty-looking',
-    'sooty-mania',
-    'sooty-thick',
-    'sooty-walled',
-    'soouth',
-    'sopac',
-    'sopatros',
-    'soph',
-    'sophi',
-    'sophia-loren',
-    'sophian',
-    'sophic',
-    'sophie-',
-    'sophisicated',
-    'sophism',
     'sophisti&rehy;cation',
-    'sophisto-pop',
-    'sophistocated',
-    'sopho-systemmanager',
-    'sophokles',
-    'sophomore',
-    'sophora',
-    'sophoradin',
-    'sophromy',
-    'sopi',
-    'sopite',
-    'soporifically',
-    'soporificator',
-    'soppa',
-    'soppier',
-    'soppiness',
     'soppy-dog',
-    'soppy-sounding',
-    'soprabolzano',
-    'sopraintendente',
-    'soprani',
-    'sopratutto',
-    'sopravvivenza',
-    'soprintendenti',
-    'soputhwark',
-    'soqosoqo',
-    'sora-ath',
-    'soranzo-piovene',
-    'sorarie',
-    'sorau',
-    'sorba',
-    'sorbants',
     'sorbents',
-    'sorbet.',
-    'sorbeti&egrave;re',
-    'sorbian',
-    'sorbic',
-    'sorbitan',
-    'sorbitol-containing',
-    'sorbo-rubber',
-    'sorbsic',
-    'sorbsil&trade',
-    'sorcerer-in-charge',
-    'sorcha',
-    'sorcieres',
-    'sorcim',
-    'sord',
-    'sordelloform',
     'sordi',
-    'sordide',
-    'sordidly',
-    'sordidum',
-    'sordino',
-    'sordor',
-    'sordwana',
-    'sore-burnt',
-    'sore-infested',
-    'sore-lipped',
-    'sore-ridden',
-    'sore-thumb-ski-bums',
-    'sore/bleeding',
-    'soreau',
-    'sorefooted',
-    'soreiller',
     'sorell',
-    'soremonde',
-    'soren&rehy;sen',
-    'sorenberg',
-    'sorenti',
-    'sorex',
-    'sorgato',
-    'sorgente',
-    'sorghums',
-    'sorich',
-    'soricid',
-    'sorin',
-    'sorinne',
-    'sorjusjaure',
-    'sorjusjokka',
-    'sorley-smith',
     'sorley/cawthorne',
-    'sormani-andreani',
-    'sormiou',
-    'sormunen',
-    'sorneone',
-    'sorners.',
-    'sorns',
-    'sorochinsky',
-    'sorohan',
-    'soroi',
-    'sorokin',
-    'sorono',
-    'sororal',
-    'soros-inspired',
-    'soroya',
-    'sorozabal',
     'sorpe',
-    'sorptive',
-    'sorrel-and-green',
-    'sorrentino',
-    'sorria',
-    'sorrie',
-    'sorried',
-    'sorrit',
-    'sorrow-saying',
-    'sorrow/of',
-    'sorrowfull',
-    'sorrowing/following',
-    'sorry-',
-    'sorry-and-lost-without-her',
-    'sorry-cow',
-    'sorry-for-themselves',
     'sorry-pardon',
-    'sorrying',
-    'sorrysorrysorrysorry',
-    'sort&rehy;and-select',
-    'sort-of-a',
-    'sort-of-wealth-tax',
-    'sort-ofs',
-    'sort-to',
-    'sort/as',
-    'sort/select',
-    'sorted-out',
-    'sortex',
-    'sortext',
-    'sortiantur',
-    'sortilega',
-    'sortileges',
     'sortly',
-    'sortrai',
-    'sorum',
-    'sos-racisme',
-    'soshardamadon/head',
-    'soshit',
-    'soshu',
-    'sosialistiko',
-    'sosialistikon',
-    'sosialistisk',
-    'sosialitiko',
-    'sosigenes',
-    'soskovets',
-    'sosnovyy',
-    'sospan',
-    'sospesa',
     'sospesi',
-    'sospeso',
-    'sospirate',
-    'sospitae',
-    'sosro',
-    'sosrodihardjo',
-    'sossio',
-    'sosthenes',
-    'sostmieu',
-    'sostoyanie',
-    'sostratus',
-    'sosyal',
-    'sosylus',
-    'sotai',
-    'sotalol',
-    'sotec',
     'soteria',
-    'sothbey',
-    'sothcott',
-    'sotheby\'s',
-    'sotheby\'s-new',
-    'sothefast',
-    'sothely',
-    'sotheran',
-    'sotherbys',
-    'sothern',
-    'sothill',
-    'sothis',
-    'sotho',
-    'sothos',
-    'soto&rehy;grande',
-    'soto-ramirez',
     'sotoo',
-    'sotsialistikou',
-    'sotsializm',
-    'sotteville',
-    'sottile',
-    'sottise',
-    'sottises',
-    'sotto-voce',
-    'sottoten',
-    'sottotenente',
-    'sottsass',
-    'sottum',
-    'sotu',
-    'sotw3',
-    'souad',
-    'souar',
     'soubeyran',
-    'soubiane',
-    'soubresauts',
-    'soubrier',
-    'souby',
-    'souchay',
-    'souche',
-    'soudabeh',
-    'soudanese',
-    'soudavar',
-    'soudet',
-    'soudevar',
-    'soudley/gloucestershire',
-    'soueid\'ahmed',
-    'soueif',
-    'souerayntie',
     'souereigntie',
-    'souey',
-    'soufan',
-    'souffl&eacute/late',
-    'souffl&eacute;d',
-    'souffl&eacute;es',
-    'souffl&eacute;my',
-    'souffle-ed',
-    'souffler',
-    'souffre',
-    'souffrez',
-    'souffrir',
-    'soufridre',
-    'soughs',
-    'sought.these',
-    'sought_with',
     'soughtafter',
-    'souhami',
-    'souil',
-    'souissi',
-    'souk-like',
-    'soukup',
-    'soul&rehy;mate',
-    'soul&rehy;pop',
-    'soul-',
-    'soul-animating',
-    'soul-baring',
-    'soul-blaring',
-    'soul-blue',
-    'soul-bound',
-    'soul-boy',
-    'soul-chilling',
     'soul-cialist',
-    'soul-cialists',
-    'soul-damning',
-    'soul-death',
-    'soul-deep',
-    'soul-destroyed',
-    'soul-food',
-    'soul-friend',
-    'soul-friends',
-    'soul-funk',
-    'soul-house',
-    'soul-inspired',
-    'soul-life',
-    'soul-lifting',
-    'soul-like',
-    'soul-man',
     'soul-masses',
-    'soul-murder',
-    'soul-rap-house',
-    'soul-reggae',
-    'soul-sacrifice',
-    'soul-satisfying',
-    'soul-selling',
-    'soul-sick',
-    'soul-sized',
-    'soul-so',
-    'soul-sound',
-    'soul-stilling',
-    'soul-stirring',
-    'soul-style',
-    'soul-winning',
-    'soul-wrenching',
     'soul/gospel-tinged',
-    'soul/hip',
-    'soulanges',
-    'soulaya',
-    'soulcialists',
-    'sould',
-    'souldern',
-    'souldier',
-    'souled',
-    'soulemane',
-    'soulfullness',
-    'soulfulness',
-    'soulhouse',
-    'soulier',
-    'soullessly',
-    'soullet',
     'soully',
-    'soulmen',
-    'soulster',
-    'soulsters',
-    'soultion',
-    'soulton',
-    'soulwoman',
-    'soummam',
-    'sound-',
-    'sound-a-like',
-    'sound-alarms',
-    'sound-amplifiers',
-    'sound-and-vision',
-    'sound-blasted',
-    'sound-booths',
-    'sound-broadcasting',
     'sound-check',
-    'sound-combinations',
-    'sound-concept',
-    'sound-cushioned',
-    'sound-design',
-    'sound-dubbing',
-    'sound-effect',
-    'sound-equipped',
-    'sound-filled',
-    'sound-hearted',
-    'sound-images',
-    'sound-in-itself',
-    'sound-link-up',
-    'sound-man',
-    'sound-meaning',
-    'sound-men',
     'sound-minded',
-    'sound-mix',
-    'sound-mixing',
-    'sound-monitoring',
-    'sound-o',
-    'sound-off',
-    'sound-on-film',
-    'sound-orientated',
-    'sound-oriented',
-    'sound-particles',
-    'sound-piece',
-    'sound-portrait',
-    'sound-processing',
-    'sound-producer',
-    'sound-producing',
-    'sound-pulses',
     'sound-reflective',
-    'sound-segment',
-    'sound-sensitive',
-    'sound-signal',
-    'sound-slide',
-    'sound-structures',
-    'sound-systems',
-    'sound-to-meaning',
-    'sound-visual',
-    'sound-web',
-    'sound-wise',
-    'sound.',
-    'sound.the',
-    'sound/b/',
-    'sound/i/',
-    'sound/of',
     'sound/p/',
-    'sound/picture',
-    'soundbase',
-    'soundbite-ability',
-    'soundblaster/adlib',
-    'soundblaster/roland',
-    'soundcard',
-    'soundcards',
-    'soundcheck-hotel-gig-hotel-travel-hotel',
-    'soundclips',
-    'sounden',
-    'soundex',
-    'soundfield',
-    'soundgames',
-    'soundhouse',
-    'sounding&rehy;board',
     'sounding\'',
-    'sounding-boards',
-    'sounding-box',
-    'sounding-out',
-    'soundish',
-    'soundly-based',
-    'soundly-constructed',
-    'soundpad',
-    'soundposts',
-    'sounds&mdash;and',
-    'sounds-much',
-    'sounds/h/',
-    'sounds_sort',
-    'soundscan',
-    'soundscapers',
-    'soundslike',
     'soundstage',
-    'soundstages',
-    'soundtracking',
-    'soundwaves',
-    'soundz',
-    'sounguiexternal',
-    'soup&ccedil;ons',
-    'soup-bowlheads',
-    'soup-coloured',
-    'soup-dish',
-    'soup-kitchens',
-    'soup-ladle',
-    'soup-like',
-    'soup-making',
-    'soup-meat-cheese',
-    'soup-pan',
     'soup-plates',
-    'soup/stew',
-    'soupault',
-    'soupbowl',
-    'soupbrained',
-    'soupcan',
-    'souper',
-    'soupish',
-    'soupkitchen',
-    'soupon',
-    'sour-breathed',
-    'sour-cream',
-    'sour-grapefruit',
-    'sour-grapes',
-    'sour-looking',
-    'sour-milk',
     'sour-mouthed',
-    'sour-tasting',
-    'sourabaya',
-    'sourbut',
-    'sourc',
-    'source&mdash;they',
-    'source-',
-    'source-adaptive',
-    'source-base',
-    'source-book',
-    'source-critical',
-    'source-discs',
-    'source-language',
-    'source-like',
-    'source-oriented',
-    'source-related',
     'source-specific',
-    'source-texts',
-    'source-work',
-    'source.see',
-    'source/data',
-    'source/migration/entrapment',
-    'source:ghs',
-    'sourdon',
-    'souren',
-    'souret',
-    'sourface',
-    'sourisse',
-    'sourlas*',
-    'sourmires',
-    'sourou',
-    'sourozh',
     'sourpusses',
-    'sourthernmost',
-    'souryanis',
-    'sous-bois',
-    'sous-entendus',
-    'sous-lieutenant',
-    'sous-sol',
-    'souscription',
-    'souse',
-    'sout',
-    'soutache',
-    'soutars',
-    'south&rehy;eastern',
-    'south&sol;south',
-    'south\'',
-    'south-a',
     'south-asians',
-    'south-directed',
-    'south-eas',
-    'south-east-asian',
-    'south-easterlies',
-    'south-eastward-directed',
-    'south-london',
-    'south-of-the-border',
-    'south-pointing',
-    'south-polar',
-    'south-reaching',
-    'south-sea',
-    'south-southwest',
-    'south-to-north',
-    'south-west/north-east',
-    'south-wester',
     'south-westerlies',
-    'south-xxxx',
-    'south/mid',
-    'south/south',
-    'south/south-east',
-    'southall-based',
-    'southall/driver',
-    'southall/hazelwood',
-    'southall/navigator',
-    'southall/worcester',
-    'southalls',
-    'southam/gloucestershire',
-    'southamerica',
-    'southampton-cherbourg',
-    'southampton-portsmouth',
-    'southampton0',
     'southampton1',
-    'southampton2',
-    'southamptoned',
-    'southamptons',
-    'southants',
-    'southard',
-    'southborne',
-    'southbound-only',
-    'southbound/oxfordshire',
-    'southby',
-    'southchurch',
-    'southcombe',
-    'southd3own',
-    'southdale',
-    'southdene',
-    'southeast.',
     'southeasterly-dipping',
-    'southella',
-    'southerly-flowing',
-    'southern\'',
-    'southern-evans',
-    'southern-hemisphere',
-    'southern-spawned',
-    'southern-trained',
-    'southern125-1308.355.4',
-    'southerndown',
-    'southerner-bashers',
-    'southernwaste',
-    'southerst',
-    'southery',
-    'southey.7sup18',
-    'southeys',
     'southfields/northampton',
-    'southgate/headteacher',
-    'southhurst',
-    'southleaze',
-    'southmoore',
-    'southoe',
-    'southolt',
-    'southon',
-    'southpaws',
-    'southport-based',
-    'southport-born',
-    'southport/ainsdale',
-    'southrey',
-    'southrop',
-    'southrop/gloucestershire',
-    'southsea-ryde',
     'southsea/rom',
-    'southseaman',
-    'southshall',
-    'southsider',
-    'southumbrians',
-    'southview',
-    'southwaite',
-    'southward-bending',
-    'southward-dipping',
-    'southward-shifting',
-    'southwater',
-    'southways',
-    'southwest-facing',
-    'southwich',
-    'southwick/portslade',
-    'southwind',
     'southwoark',
-    'southwold-based',
-    'southwood/vice-chancellor',
-    'southwoods',
-    'soutien',
-    'soutwark',
-    'souvala',
-    'souvenir-hunting',
-    'souvenir-shops',
-    'souvenirs.',
-    'souverains',
-    'souveran',
-    'souverks',
-    'souveroff',
-    'souvestre',
-    'souviron',
     'souvit',
-    'souvlaki',
-    'sov-art',
-    'sovac',
-    'sovalbarro',
-    'sovan',
-    'sovegna',
-    'sover&rehy;eighty',
-    'soverato',
-    'soverayne',
-    'sovereign-lord',
-    'sovereign-power',
-    'sovereigns.',
-    'sovereignty-conscious',
-    'sovereygne',
-    'soveria',
     'soverican',
-    'sovetskoye',
-    'soviet&mdash;de',
-    'soviet&mdash;the',
-    'soviet&mdash;was',
-    'soviet&rehy;chinese',
-    'soviet-aided',
-    'soviet-appointed',
-    'soviet-approved',
-    'soviet-arab',
-    'soviet-bloc',
-    'soviet-constructed',
-    'soviet-east',
-    'soviet-ec',
-    'soviet-ethiopian',
-    'soviet-finnish',
     'soviet-french',
-    'soviet-gentech',
-    'soviet-held',
-    'soviet-indonesian',
-    'soviet-iranian',
-    'soviet-irish',
-    'soviet-japanese-us',
-    'soviet-korean',
-    'soviet-libyan',
-    'soviet-like',
-    'soviet-lithuanian',
-    'soviet-marked',
-    'soviet-mexican',
-    'soviet-mongolian',
-    'soviet-omani',
-    'soviet-pakistan',
     'soviet-pakistani',
-    'soviet-persian',
-    'soviet-polish',
-    'soviet-preference',
-    'soviet-tilted',
-    'soviet-uae',
-    'soviet-vatican',
-    'soviet-yugoslav',
-    'sovieticus',
-    'sovietisation',
-    'sovietised',
-    'sovietism',
-    'sovietized',
-    'sovietskogo',
-    'sovietsky',
-    'sovin',
     'soviore',
-    'sovittaja',
-    'soviyetskaya',
-    'sovkhoz',
-    'sovpac',
-    'sovremennik',
-    'sovrintendenza',
-    'sovtelexport',
-    'sovyetsyaka',
-    'sow-and-sow',
-    'sow-gelders',
-    'sow.',
-    'sow/boar',
-    'sowa',
-    'sowan',
-    'soward',
     'sowars',
-    'sowden',
-    'sowens',
-    'sowerby/inventor',
-    'sowersby',
-    'sowerscomplimented',
-    'sowery',
-    'sowetans',
-    'soweth',
-    'soweto-based',
-    'sowfend',
-    'sowin\'',
-    'sowler',
-    'sowley',
-    'sown-in-us',
-    'sown-up',
     'sowneth',
-    'sowre',
-    'sowrness',
-    'sowter',
-    'sowth',
-    'sowthistle',
-    'soxed',
-    'soxers',
-    'soxhlet',
-    'soxs',
-    'soy-based',
-    'soy-sauce',
-    'soya-protein',
-    'soyameat',
-    'soyapango',
-    'soyappo',
     'soyauxii',
-    'soybir',
-    'soyez',
-    'soyland',
-    'soyombo',
-    'soyons',
-    'soyuz-mir',
-    'soyuz-t',
-    'soyuz-tm',
-    'soyuza',
-    'soyuzgasexport',
-    'soyuzpechat',
-    'soz',
-    'sozialchristliche',
-    'sozialdemokratie',
-    'sozialismus',
     'sozialistesch',
-    'sozialwissenchaften',
-    'soziostilistischen',
-    'sozzi',
-    'sp&auml;ss',
-    'sp&auml;tantike',
-    'sp&auml;teren',
-    'sp&eacute;ciales',
-    'sp&eacute;cifique',
-    'sp&eacute;cularisable',
-    'sp&mdash;centre',
-    'sp&mdash;socialist',
-    'sp&ouml&mdash;finance',
-    'sp&ouml&mdash;interior',
-    'sp&ouml&mdash;social',
-    'sp\'kochnoi',
     'sp\'seba',
-    'sp-1',
-    'sp-2330',
-    'sp-sp-sp-speech',
-    'sp-uk-conv',
-    'sp/32',
-    'sp/e/14/4',
-    'sp/ps&mdash;social',
-    'sp0',
-    'sp04/14',
-    'sp1-binding',
-    'sp1/82',
-    'sp10/91',
-    'sp13',
-    'sp15',
-    'sp16/80',
     'sp3',
-    'sp3/91',
-    'sp300',
-    'sp5/92',
-    'sp6/90',
-    'sp7/89',
-    'sp7/92',
-    'sp91/3',
-    'spa&mdash;formerly',
-    'spa&mdash;the',
-    'spa-appointed',
-    'spa-ce',
-    'spa-cheque',
-    'spa-temple',
-    'spa-town',
-    'spaach',
     'spac',
-    'spaccato',
-    'space&mdash;time',
-    'space&rehy;minded',
-    'space-aged',
-    'space-arc',
-    'space-arcs',
-    'space-as',
-    'space-black',
-    'space-boss',
-    'space-buying',
-    'space-camera',
-    'space-capable',
-    'space-charged-limited',
-    'space-chick',
-    'space-cold',
     'space-conscious',
-    'space-contorting',
-    'space-defining',
-    'space-earth',
-    'space-economy',
-    'space-edge',
-    'space-faring',
-    'space-fiction',
-    'space-fictions',
-    'space-flavoured',
-    'space-flight',
-    'space-forging',
-    'space-frame',
-    'space-game',
-    'space-handling',
-    'space-happy',
     'space-hopper',
-    'space-hungry',
-    'space-instead',
-    'space-invader',
-    'space-launch',
-    'space-making',
-    'space-meets-',
-    'space-menace',
-    'space-mission',
-    'space-occupying',
-    'space-of',
-    'space-per-employee',
-    'space-pinching',
-    'space-points',
-    'space-probes',
-    'space-rocket',
     'space-science',
-    'space-sharing',
-    'space-ships',
-    'space-strike',
-    'space-that',
-    'space-time-social',
-    'space-travellers',
-    'space-travelling',
-    'space-vessel',
-    'space-walk',
-    'space-walking',
-    'space.',
-    'space/',
-    'space/carried',
-    'space/dumping',
-    'space/liberty',
     'space/speed',
-    'space/work',
-    'spaceborne',
-    'spacecake',
-    'spacecakes',
-    'spacecrafts',
-    'spaced-window',
-    'spacedancecoremusic',
-    'spacefair',
-    'spacefarers',
-    'spacefaring',
-    'spacefill',
-    'spaceflights',
-    'spacegrand',
-    'spacehoppers',
-    'spacek',
     'spacelagged',
-    'spaceline',
-    'spaceplane',
-    'spaceports',
-    'spacerock',
-    'spacesaver',
-    'spacesuited',
-    'spacewagons',
-    'spacewatch',
-    'spaceways',
-    'spacewoman',
-    'spacex',
-    'spacially',
-    'spacier',
-    'spaciness',
-    'spaciousness.',
     'spackled',
-    'spackman/resident',
-    'spactor',
-    'spadah',
-    'spadang',
-    'spade-bearded',
-    'spade-iron',
-    'spade-lengths',
-    'spade-sized',
-    'spade-steel',
-    'spade-time',
-    'spadeadam',
-    'spaded',
-    'spadehandle-back',
-    'spadona',
-    'spads',
     'spaethii',
-    'spafford/centrepoint',
-    'spaghet',
-    'spaghetti-eating',
-    'spaghetti-fun',
-    'spaghetti-junction',
-    'spaghetti-like',
-    'spaghetti-strapped',
-    'spaghetti-tangle',
-    'spaghetti-western',
-    'spaghettoni',
-    'spaghhetti',
-    'spagni',
-    'spagnole',
-    'spagnoletta',
-    'spagnoli',
     'spagnolis',
-    'spagnum',
-    'spagyrical',
-    'spaher',
-    'spahi',
-    'spahn',
-    'spaht',
-    'spaid',
-    'spain&mdash;pcpe',
-    'spain-barcelona',
-    'spain-bound',
-    'spain-madrid',
-    'spain-peseta',
-    'spain.those',
-    'spain/1988/cert',
-    'spain/usa/france',
     'spain/wednesday',
-    'spainteach',
-    'spaky',
-    'spaladale',
-    'spalatro',
-    'spaldings',
-    'spalenice',
-    'spallanzani',
-    'spallation',
-    'spalled',
-    'spallen',
-    'spalleti',
-    'spalvin',
-    'spam-can',
-    'spambo',
-    'spamish',
     'spammed',
-    'span-farthing',
-    'span-over-chord',
-    'span/depth',
-    'spanaigh',
-    'spanair',
-    'spandex-covered',
-    'spangenberg',
-    'spangin',
-    'spanglish',
-    'spango',
-    'spania',
-    'spaniely',
-    'spanier',
-    'spanischbrotlibahn',
-    'spanish&rehy;style',
     'spanish-accented',
-    'spanish-administered',
-    'spanish-built',
-    'spanish-chilean',
-    'spanish-colonial',
-    'spanish-english',
-    'spanish-french',
-    'spanish-looking',
-    'spanish-made',
-    'spanish-ruled',
-    'spanish-styled',
-    'spanish-uk',
-    'spanish/classical',
-    'spanisher',
-    'spanker',
-    'spankers',
     'spankier',
-    'spanking-clean',
-    'spannbr&uuml;cker',
-    'spannerbreaker',
-    'spar-booms',
-    'spar-dem',
-    'sparanti',
-    'sparassidae',
-    'sparaxis',
-    'sparbu',
-    'sparc-2',
-    'sparc-a-likes',
-    'sparc-compatibles',
-    'sparc-compliant',
-    'sparc-enhanced',
-    'sparc/solaris',
     'sparcboot',
-    'sparcclassic-',
-    'sparcclassics',
-    'sparcengines',
-    'sparckit',
-    'sparclassic',
-    'sparcmakers',
-    'sparcprinter',
-    'sparcraft',
-    'sparcstation-2',
-    'sparcstation10s',
-    'sparcstation2',
-    'sparcststion',
-    'sparcsystem-building',
-    'sparcsystem-compatible',
-    'sparcsystem-compatibles',
     'sparcsystems-building',
-    'sparctations',
-    'sparctstaion',
-    'sparcus',
-    'sparcworks/teamware',
-    'sparditura',
-    'spare&rehy;time',
-    'spare-crew',
-    'spare-framed',
-    'spare-looking',
-    'spare-rib',
-    'spare-ribs',
-    'spare-time/spare-time',
-    'spare/part-time',
-    'spares/after-sales',
-    'sparest',
     'sparetime',
-    'sparfeld',
-    'sparford',
-    'spargens',
-    'sparhawk',
-    'sparinge',
-    'spark-boat',
-    'spark-free',
-    'spark-gap',
-    'spark-generating',
-    'spark-ling',
-    'spark-spattered',
-    'spark-suppressing',
-    'sparkassen',
-    'sparkeforde',
-    'sparkers',
     'sparkeys',
-    'sparkfalls',
-    'sparkily',
-    'sparkins',
-    'sparkish',
-    'sparkit-40',
-    'sparkit-40mbus',
-    'sparklets',
-    'sparkplugs',
-    'sparkster',
-    'sparling/publisher',
-    'sparrow-fart',
-    'sparrow-hawk',
-    'sparrow-hawks',
-    'sparrow.',
-    'sparrowfart',
     'sparrowhawk/pastor',
-    'sparrowmead',
-    'sparrs',
-    'spars.this',
-    'sparsely-curtained',
-    'sparsely-fitted',
-    'sparsely-peopled',
-    'sparsely-written',
-    'sparshott',
-    'sparso',
-    'sparta-hater',
-    'sparta-messenia',
-    'spartahori',
-    'spartakovtsy',
-    'spartakus',
-    'spartan&mdash;i',
     'spartan-led',
-    'spartan-sounding',
-    'spartanism',
-    'sparten',
-    'spartiatai',
-    'spartivento',
-    'spartokids',
-    'sparts',
-    'spasibo',
-    'spasic',
-    'spasitelnitsa',
-    'spasm-scattered',
-    'spasmically',
-    'spasmolytic',
-    'spasmolytics',
-    'spasovich',
     'spassenje',
-    'spassk-ryazanski',
-    'spassof',
-    'spassov',
-    'spasticated',
-    'spatangoid',
-    'spatchett',
-    'spatfall',
-    'spatha',
-    'spathias',
-    'spathodus',
-    'spatial-data-processing',
-    'spatial-file',
-    'spatial-stratigraphic',
-    'spatiales',
-    'spatializes',
     'spatially-dependent',
-    'spatially-discrete',
-    'spatially-related',
-    'spatially-representative',
-    'spatio-temporal-causal',
-    'spatio-temporal-things',
-    'spatio-temporality',
-    'spatlese',
-    'spatt',
-    'spatterdash',
-    'spatterdock',
-    'spattering.',
-    'spatts',
-    'spatula-shaped',
-    'spatular',
-    'spatulas/palette',
     'spaul',
-    'spaull',
-    'spaventa',
-    'spaventati',
-    'spavins',
-    'spawning-grounds',
-    'spaz',
-    'spaziergang',
-    'spazzy',
-    'spb',
-    'spc-04',
-    'spc-1',
-    'spc1',
-    'spc2',
-    'spcific',
-    'spd&mdash;social',
     'spd-alternative',
-    'spd-fdp-alliance',
-    'spd-ruled',
-    'spd/al',
-    'spd/green',
-    'spd474044.838.8',
-    'spdc',
-    'spe&rehy;culating',
-    'spead',
-    'speadbury',
-    'speading',
-    'speadsheets',
-    'speak-do',
-    'speak-easy',
-    'speak-now-think-later',
-    'speak-ups',
     'speak-when',
-    'speak-your-weight',
-    'speaka',
-    'speakable',
-    'speaker-agreement',
-    'speaker-based',
-    'speaker-blaming',
-    'speaker-choice',
-    'speaker-evaluation',
-    'speaker-interaction',
-    'speaker-like',
-    'speaker-oriented',
-    'speaker-related',
-    'speaker-simulating',
-    'speaker-variable',
-    'speaker/listeners',
     'speaker/non-native',
-    'speaker/system',
-    'speaker/text',
-    'speakerless',
-    'speakerphone',
-    'speakers.',
-    'speakers/discussion',
-    'speakers/writers',
-    'speakerspeak',
-    'speakeur',
-    'speakies',
-    'speaking&mdash',
-    'speaking-canada',
-    'speaking-clock',
-    'speaking-tubes',
-    'speaking/voice',
     'speakings',
-    'speakman.',
-    'speakmans',
-    'speakon',
-    'speakout',
-    'speakphone',
-    'spear-bearer',
-    'spear-blade',
-    'spear-blades',
-    'spear-butts',
-    'spear-carrying',
-    'spear-end',
-    'spear-ends',
-    'spear-hand',
-    'spear-length',
-    'spear-shaft',
     'spear-thrust',
-    'spear-tips',
-    'spear-topped',
-    'spear-wielding',
-    'speares',
-    'spearfish',
-    'spearman-karber',
-    'spearpoints',
-    'spec&mdash;and',
-    'spec-building',
-    'spec-built',
-    'specailly',
-    'specatucal',
-    'specchi',
-    'speccy-ported',
-    'specfic',
     'specficity',
-    'specfp89',
-    'speche',
-    'spechler',
-    'specia&rehy;lised',
-    'special-cheap-ish',
-    'special-day',
-    'special-edition',
-    'special-effect',
-    'special-offer',
-    'special-project',
-    'special-quality',
-    'special-risk',
-    'special-school',
-    'special-subject',
-    'special-to-theatre',
     'special-trains',
-    'special/central',
-    'special/remedial',
-    'special/so',
-    'special:why',
-    'specialed',
-    'speciales',
-    'specialf.ssm',
-    'specialibus',
-    'specialilst',
-    'specialing',
-    'specialisation.',
-    'specialisation/functionalisation',
-    'specialised/general',
-    'specialisht',
-    'specialism\'',
     'specialist-expert',
-    'specialist-taught',
-    'specialist/artrock',
-    'specialist/complex',
-    'specialist/consultant',
-    'specialist/oxford',
-    'specialistes',
-    'specialists.it',
-    'specialit&eacute',
-    'speciality-',
-    'speciality-oriented',
-    'specializ&rehy',
-    'specially&rehy;made',
-    'specially-appointed',
-    'specially-arranged',
-    'specially-bred',
     'specially-chartered',
-    'specially-compiled',
-    'specially-convened',
-    'specially-converted',
-    'specially-cooked',
-    'specially-created',
-    'specially-cut',
-    'specially-designated',
-    'specially-enhanced',
-    'specially-favoured',
-    'specially-fortified',
-    'specially-mined',
-    'specially-minted',
-    'specially-negotiated',
-    'specially-painted',
-    'specially-pressed',
     'specially-printed',
-    'specially-recreated',
-    'specially-selected',
-    'specially-staged',
-    'specially.',
-    'specialy',
-    'speciating',
-    'speciea',
-    'specieism',
-    'species&mdash',
-    'species&mdash;this',
-    'species--typical',
-    'species-area',
-    'species-characteristic',
-    'species-diagnostic',
-    'species-inherited',
     'species-isolating',
-    'species-ist',
-    'species-lines',
-    'species-specificity',
-    'species/variation',
-    'specif(ix)',
-    'specifed',
-    'specifially',
-    'specific&rehy;techniques',
-    'specific-issue',
-    'specific-lesson',
-    'specific-to-general',
-    'specific-volume-temperature',
-    'specific.problem',
-    'specifically-',
-    'specifically-bound',
     'specifically-that',
-    'specificatio',
-    'specification/appearance',
-    'specification/drawings',
-    'specificed',
-    'specificially',
-    'specified&mdash;two',
-    'specifiedly',
-    'specifities',
-    'specimen(s)',
-    'specimen+',
-    'specimen+faecal',
-    'specimen+krebs-henseleit',
-    'specimen-hunter',
-    'specimen=150000',
-    'specimens.',
     'speciments',
-    'speciosus',
-    'speciously',
-    'speciousness',
-    'speck-sized',
-    'specklefaced',
-    'speckless',
-    'specklings',
-    'speckman',
-    'specmark-rated',
-    'specmark92',
-    'specola',
-    'specrate&mdash;fp',
-    'specsaver',
-    'specsavers',
-    'spectac',
     'spectacle-lens',
-    'spectacle-making',
-    'spectacle-rims',
-    'spectacolor',
-    'spectactular',
-    'spectactularly',
-    'spectacu&rehy;lar',
-    'spectacula',
-    'spectacular-looking',
-    'spectacularisation',
-    'spectacularist',
-    'spectasonic',
-    'spectatators',
-    'spectated',
-    'spectator-unfriendly',
-    'spectator/consumer',
     'spectator/reader',
-    'spectatorial',
-    'spectatular',
-    'spectaular',
-    'spected',
-    'spectofluorometry',
-    'spectograph',
-    'spectophotometer',
-    'spector/young',
-    'spectors',
-    'spectraline',
-    'spectraphysics',
-    'spectre-hound',
-    'spectre-like',
-    'spectro-microscopes',
-    'spectro-photometer',
     'spectroelectrochemical',
-    'spectrography',
-    'spectrometer.',
-    'spectronic',
-    'spectrophoto',
-    'spectroradiometer',
-    'spectroscopically.',
-    'spectroscopy.',
-    'spectrum-shaping',
-    'spectrum-x',
-    'spectrum.',
-    'spectrums',
-    'spects',
-    'spectulative',
-    'specualr',
-    'specularity',
     'speculation.',
-    'speculative.',
-    'speculativeness',
-    'speculatrix',
-    'spedale',
-    'spedd',
-    'speddings',
-    'spedilec',
-    'speech&rehy;delayed',
-    'speech\'',
-    'speech+facsimile',
-    'speech-action',
-    'speech-aware',
-    'speech-become-song',
-    'speech-communities',
-    'speech-community',
     'speech-driven',
-    'speech-exchange',
-    'speech-exchanges',
-    'speech-forms',
-    'speech-habits',
-    'speech-impediment',
-    'speech-maker',
-    'speech-oriented',
-    'speech-processing',
-    'speech-production',
-    'speech-recognition',
-    'speech-related',
-    'speech-rhythm',
-    'speech-shadowing',
-    'speech-sounds',
-    'speech-styles',
     'speech-supportive',
-    'speech-synthesiser',
-    'speech-waivers',
-    'speech-writer',
-    'speech-writer-in-chief',
-    'speech.this',
-    'speech/',
-    'speech/drama',
-    'speech/language',
-    'speechday',
-    'speeche',
-    'speeches.',
-    'speechlis',
-    'speechreading/',
-    'speechreading/lip-reading',
-    'speechwriting',
     'speed\'',
-    'speed(2.8)',
-    'speed(s)',
-    'speed-boats',
-    'speed-bump',
-    'speed-bumps',
-    'speed-burned',
-    'speed-chess',
-    'speed-chewing',
-    'speed-controlled',
-    'speed-depth',
-    'speed-doubling',
-    'speed-freaking',
-    'speed-fuelled',
-    'speed-gun',
-    'speed-king',
     'speed-launch',
-    'speed-learning',
-    'speed-limiting',
-    'speed-lover',
-    'speed-meter',
-    'speed-neck',
-    'speed-obsessed',
-    'speed-of-light',
-    'speed-of-reflex',
-    'speed-playing',
-    'speed-reading',
-    'speed-reduction',
-    'speed-restriction',
-    'speed-skater',
-    'speed-stable',
-    'speed-starved',
     'speed-talking',
-    'speed-the-plow',
-    'speed-thrash',
-    'speed-tracks',
-    'speed-traps',
-    'speed-type',
-    'speed.com',
-    'speed.dependent',
-    'speed/\'flu\'',
-    'speed/low',
-    'speed/memory/swap',
-    'speed/quite',
-    'speed/she',
-    'speed/strach',
-    'speed_relative',
-    'speedballs',
     'speedbanks',
-    'speedbar',
-    'speedboat-driving',
-    'speedbrake',
-    'speedcore',
-    'speedcraft',
-    'speeddisk',
-    'speedf',
-    'speedformat',
-    'speedin\'',
-    'speeding_up',
-    'speedisk',
-    'speedlace',
-    'speedle',
-    'speedlines',
-    'speedmaster',
     'speedmetal',
-    'speeds-as',
-    'speeds.trailing',
-    'speedsoft',
-    'speedstar',
-    'speedtesting',
-    'speedtwin',
-    'speedups',
-    'speedwagon',
-    'speedware',
-    'speedwatch',
-    'speedwise',
-    'speedwork',
-    'speeech',
-    'speeeed',
-    'speegeless',
     'speek',
-    'speelling',
-    'speelosh',
-    'speen',
-    'speenhamland-like',
-    'speered',
-    'speers',
-    'speery',
-    'speeting',
-    'spef',
-    'speght',
-    'speicher',
-    'speichim',
-    'speific',
-    'speigel',
-    'speiran',
     'speke/halewood',
-    'spekes',
-    'spekkhogger',
-    'spekulation',
-    'spelaea',
-    'speldhurst',
-    'speleo-club',
-    'spelius',
-    'spell&rehy;making',
-    'spell-out',
-    'spell-retention',
-    'spell-ridden',
-    'spell-weaving',
-    'spellar',
-    'spellbounding',
-    'spelled-out',
     'speller.',
-    'spellin\'',
-    'spelling-bees',
-    'spelling-books',
-    'spelling-checkers',
-    'spelling-corrector',
-    'spelling-out',
-    'spelling-reformer',
-    'spelling.',
-    'spelling/typo',
-    'spellmount',
-    'spello',
-    'spellsinger',
-    'spelng',
-    'spelt&rehy;column',
-    'spelt_as',
     'spelted',
-    'spelucin',
-    'spelunkers',
-    'speme',
-    'spence/rosy',
-    'spencean',
-    'spencefield',
-    'spencer-',
-    'spencer-devlin',
-    'spencer-jones',
-    'spencer-nairns',
-    'spencer/',
-    'spencer/holly',
-    'spencer/property',
-    'spencerfield',
-    'spencerism',
     'spencers.',
-    'spencius',
-    'spend-thrift',
-    'spend.',
-    'spend/invest',
-    'spend_a',
-    'spende',
-    'spended',
-    'spender-payne',
-    'spendeth',
-    'spending-brief',
-    'spending-cuts',
-    'spending-divisions',
-    'spending-implications',
-    'spending-led',
-    'spendings',
     'spendition',
-    'spendlove',
-    'spendour',
-    'spends_a',
-    'spendt',
-    'spenetic',
-    'speng',
-    'spenglerian',
-    'spenista',
-    'spennymoor-based',
-    'spensley',
-    'spenson',
-    'spent-fuel',
-    'spent-up',
-    'spent_in_pursuit',
-    'spenz',
     'speranza',
-    'sperasti',
-    'speravit',
-    'sperchieus',
-    'speret',
-    'spergularia',
-    'sperimentale',
-    'sperm-and-egg',
-    'sperm-bearing',
-    'sperm-count',
-    'sperm-whale',
-    'sperm.',
-    'sperm/egg',
-    'spermatheca',
-    'spermatogonia',
-    'spermatogram',
     'spermatophores',
-    'spermed',
-    'spermia',
-    'spermidine',
-    'spermiest',
-    'sperminator.',
-    'spermy',
-    'speromak',
-    'sperrinview',
-    'sperrit',
-    'sperrysun',
-    'sperten',
-    'spessartine-bearing',
-    'spetsai',
-    'spetsopoula',
-    'spewed-out',
     'spewing-out',
-    'speyed',
-    'speyr',
-    'spezialhaus',
-    'spf13',
-    'spf5',
-    'spf6',
-    'spgw',
-    'sph',
-    'sphaeroceridae',
-    'sphecodes',
-    'spheeris-directed',
-    'sphenoid/',
-    'sphenoidal',
-    'sphenophylloides',
-    'sphenops',
     'sphenopteris',
-    'sphere\'',
-    'spheres.',
-    'sphericism',
-    'spherilene',
-    'spheripol',
-    'spheroidally',
-    'spheroids.',
-    'spheromak',
-    'sphettos',
-    'sphex',
-    'sphi-pvuii',
-    'sphincter-like',
-    'sphincterotomes',
-    'sphinctre',
-    'sphingid',
     'sphinteric',
-    'sphinx-head',
-    'sphodrias',
-    'sphodron',
-    'sphygmomanometry',
-    'spi-ra-lis',
-    'spi-rar-lis',
-    'spi-squeezer',
-    'spicatum',
-    'spicatus',
-    'spice-rack',
-    'spice-rich',
-    'spice-ridden',
-    'spice-sellers',
-    'spice-trade',
-    'spice-trading',
     'spiceless',
-    'spicery',
-    'spicheren',
-    'spichernstrasse',
-    'spiciest',
-    'spiciness',
-    'spicken',
-    'spickermann',
-    'spickernell/cpre',
-    'spics',
-    'spicular',
-    'spiculation',
-    'spicule',
-    'spiculocaulus',
-    'spider-gems',
-    'spider-legged',
     'spider-legs',
-    'spider-lightning',
-    'spider-shaped',
-    'spider-silk',
-    'spider-tattoo',
-    'spider-tattooed',
-    'spiderbridge',
-    'spidered',
-    'spiderface',
-    'spiderish',
-    'spiderland',
-    'spiderlike',
-    'spiderlings',
-    'spiderma',
-    'spidernet',
-    'spiderstreams',
     'spidersystems',
-    'spidertcp',
-    'spidertown',
-    'spiderwebbed',
-    'spiderwoman',
-    'spie',
-    'spiegelers',
-    'spiegels',
-    'spieglers',
-    'spielbergian',
-    'spielman',
-    'spier/ex-refugee',
-    'spierin\'',
-    'spiess-jaenicke',
-    'spiff',
-    'spiffin\'',
     'spifflicated',
-    'spifflicating',
-    'spifire',
-    'spigelgass',
-    'spigelman',
-    'spigelmann',
-    'spiggie',
-    'spiggot',
-    'spigulin',
-    'spii',
-    'spike-heads',
-    'spike-heels',
-    'spike-like',
-    'spike-nailed',
-    'spike-plate',
-    'spike-proof',
     'spike-roll',
-    'spike-shouldered',
-    'spike-skinned',
-    'spike/bar',
-    'spikelets',
-    'spikesley',
-    'spikey-haired',
-    'spiky-headed',
-    'spiky-leaved',
-    'spilanthes',
-    'spilette',
-    'spili',
-    'spiling',
-    'spilio',
-    'spilling-out',
-    'spillover\'',
     'spillways',
-    'spilsy',
-    'spin&ndash;off',
-    'spin-&frac12',
-    'spin-allowed',
-    'spin-doctor',
-    'spin-forbidden',
-    'spin-off\'',
-    'spin-related',
-    'spin-spin',
-    'spin-trapping',
-    'spin-trials',
-    'spin-ups',
-    'spin-weighted',
-    'spinabifida',
-    'spinach-dark',
     'spinach-jam',
-    'spinach-risotto',
-    'spinally-injured',
-    'spinalonga',
-    'spinatus',
-    'spinces',
-    'spincter',
-    'spincters',
-    'spinderella',
-    'spindizzy',
-    'spindle-back',
-    'spindle-disrupting',
-    'spindle-leg',
-    'spindle-shanks',
-    'spindle-spanks',
-    'spindled',
     'spindlejack',
-    'spindlers',
-    'spindleruv',
-    'spindlewinter',
-    'spindliness',
-    'spine-bending',
-    'spine-snapper',
-    'spine-snapping',
-    'spine-stretching',
-    'spine-thrilling',
-    'spine-tinglers',
-    'spine-tinglingly',
-    'spine-tipped',
-    'spine-toad',
-    'spine-toothed',
-    'spine.',
     'spinechillers',
-    'spinechilling',
-    'spinelets-low',
-    'spinellis',
-    'spinescence',
-    'spinesheath',
-    'spinet-playing',
-    'spinetingling',
-    'spinette',
-    'spinetti/jacob',
-    'spingleage',
-    'spinical',
-    'spinnakered',
-    'spinneret',
-    'spinneycot',
-    'spinnin\'',
     'spinning&rehy;jenny',
-    'spinning-machine',
-    'spinning-rods',
-    'spinning-rooms',
-    'spinning-tops',
-    'spinningly',
-    'spinnrade',
-    'spinnys',
-    'spinobulbar',
-    'spinoffs',
-    'spinoit',
-    'spinos',
-    'spinosis',
-    'spinozi',
-    'spinozist',
-    'spinster-like',
     'spinster-woman',
-    'spinsterly',
-    'spinstery',
-    'spinturns',
-    'spinulosa',
-    'spinwriter',
-    'spionwagen',
-    'spiraeas',
-    'spiraflite',
-    'spiral-',
-    'spiral-patterned',
-    'spiral-wound',
-    'spiral-wrapped',
-    'spirale',
-    'spiranthes',
-    'spirates',
     'spirduso',
-    'spire-capped',
-    'spirea',
-    'spireites',
-    'spireless',
-    'spirelet',
-    'spirer',
-    'spires.whatever',
-    'spiri',
-    'spiridonov',
-    'spirifer',
-    'spiring',
-    'spirit&rehy;animals',
-    'spirit&rehy;filled',
-    'spirit\'',
-    'spirit-93',
     'spirit-beast',
-    'spirit-beasts',
-    'spirit-behind-the',
-    'spirit-being',
-    'spirit-centred',
-    'spirit-flesh',
-    'spirit-guide',
-    'spirit-lamp',
-    'spirit-lamps',
-    'spirit-meat',
-    'spirit-object',
-    'spirit-person',
-    'spirit-powers',
-    'spirit-raising',
-    'spirit-rapping',
-    'spirit-refractions',
     'spirit-stirring',
-    'spirit-that',
-    'spirit-this',
-    'spirit/soul',
-    'spirite',
-    'spirited-off',
-    'spiriters',
-    'spiriting-out',
-    'spiritist',
-    'spiritists',
-    'spirititual',
-    'spiritlessly',
-    'spiritoso',
-    'spiritous',
-    'spiritual\'',
-    'spiritual-aesthetic',
     'spiritualia',
-    'spiritualit&eacute',
-    'spirituality&rehy;ometer',
-    'spiritualize',
-    'spiritually&mdash;minded',
-    'spiritually-based',
-    'spiritually-secure',
-    'spiritueux',
-    'spirochaete.',
-    'spirochetosis',
-    'spirogram',
-    'spirogyra',
-    'spirolight',
-    'spirov',
-    'spirs',
-    'spirtle',
     'spirto',
-    'spirtu',
-    'spiruline',
-    'spiruroidea',
-    'spiruroids',
-    'spiser',
-    'spisok',
-    'spissk&eacute',
-    'spit-boy',
-    'spit-in-your-eye',
-    'spit-level',
-    'spit-roasting',
-    'spit-shower',
-    'spit/',
-    'spitaldfields-weavers',
-    'spitalflelds',
     'spitalhatch',
-    'spitalhof',
-    'spite-filled',
-    'spite-rays',
-    'spited',
-    'spites',
-    'spitfire/mustang/p-38',
-    'spitful',
-    'spithrobates',
-    'spitophage',
-    'spitta',
-    'spittalfield',
-    'spittalridding',
-    'spittel',
-    'spittelmarket',
-    'spittin',
     'spittle-bugs',
-    'spittle-licking',
-    'spitzhoff',
-    'spivack',
-    'spivey/consultant',
-    'spivvery',
-    'spivvier',
-    'spixworth',
-    'spj',
-    'spkk',
-    'spl&uuml;gen',
-    'spl/db/wattage',
-    'spla-held',
-    'splang',
-    'splash&rehy;in',
-    'splash&rehy;proof',
     'splash-land',
-    'splash-lubricated',
-    'splash-on',
-    'splash-pattern',
-    'splash-proof',
-    'splashback-come',
-    'splashdown',
-    'splashers',
-    'splashily',
-    'splashings',
-    'splashland',
-    'splashout',
-    'splashproofing',
-    'splat&rehy;tered',
-    'splatt',
-    'splatted',
     'splattercore',
-    'splatterfest',
-    'splay-legged',
-    'splch',
-    'spleen&gt;liver&gt;bone',
-    'spleen-rock',
-    'spleen-venting',
-    'spleenwort',
-    'splendeurs',
-    'splendid-looking',
-    'splendid-there',
-    'splendida',
-    'splendido',
-    'splendissimo',
-    'splendored',
-    'splenectomised',
     'splenetically',
-    'splenius',
-    'splenocytes',
-    'splett',
-    'spli',
-    'spliced-up',
-    'spliceosomes',
-    'splicing-tape',
-    'spliffed-out',
-    'spliffed-up',
-    'spline.curve',
-    'splined',
-    'spling',
-    'splink',
-    'splintage',
-    'splinter-thin',
     'splinting',
-    'split&rehy;second',
-    'split-anode',
-    'split-ass',
-    'split-beam',
-    'split-capital',
-    'split-charge',
-    'split-diamond',
-    'split-fold',
-    'split-personality',
-    'split-rail',
-    'split-saddle',
-    'split-vote',
-    'split-voting',
-    'split/splitless',
-    'splitting-off',
     'splitting-up',
-    'splitting.',
-    'splittist',
-    'splitty',
-    'splodgenessabounds',
-    'splodger',
-    'splods',
-    'sploosh',
-    'splooshed',
-    'sploshes',
-    'sploshy',
-    'splotchy',
-    'splt',
-    'splunch',
-    'splurched',
-    'splurchy',
     'splurges',
-    'splurging',
-    'splus',
-    'spluttery',
-    'spmg',
-    'spo1',
-    'spo=',
-    'spoczynska',
-    'spoerry',
-    'spoffer',
-    'spoi',
-    'spoil-tips',
-    'spoilable',
-    'spoilation',
-    'spoilbeds',
-    'spoiled-brat',
     'spoiled.',
-    'spoiling-for-a-fight',
-    'spoilt-rotten',
-    'spoilter',
-    'spoiltly',
-    'spok',
-    'spoke-arms',
-    'spoke-like',
-    'spoke-with',
-    'spokeless',
-    'spoken-of',
-    'spoken-worder',
-    'spoken-written',
-    'spokes-man',
-    'spokes-people',
-    'spokesbear',
     'spokeseman',
-    'spokeshaved',
-    'spokeshaving',
-    'spokesman-in-song',
-    'spokesman.',
-    'spokesman0',
-    'spokesmanship',
-    'spokesowman',
-    'spokespersons.',
-    'spokesthing',
-    'spokesw',
-    'spokewoman',
-    'spoking',
-    'spoksman',
-    'spokus',
-    'spolier',
     'spolin',
-    'spolit',
-    'spolsky',
-    'spon&rehy;taneously',
-    'spondai',
-    'spondalopathy',
-    'spondey',
-    'spondoolies',
-    'spondooliks',
-    'sponds',
-    'spondulicks',
-    'spondulix',
-    'spondulos',
-    'spondylo',
-    'spondyloarthritis',
-    'sponge-divers',
     'sponge-down',
-    'sponge-eating',
-    'sponge-fishing',
-    'sponge-painted',
-    'sponge-rubber',
-    'spongebag',
-    'spongecake',
-    'spongedown',
-    'spongeing',
-    'spongelike',
-    'sponges.',
-    'spongiform-infected',
-    'spongy-brain',
-    'sponlee',
-    'sponne',
-    'spons-a-tee',
     'sponsored-eating-jelly-with-chopsticks-in-half-an-hour-athon',
-    'sponsored-fast',
-    'sponsored-talks',
-    'sponsored/seconded',
-    'sponsorhsip',
-    'sponsors.',
-    'spontaneous-looking',
-    'spontaneously-seeded',
-    'spontaneously.',
-    'spoofery',
-    'spoofs/dummies',
-    'spook-in-residence',
-    'spooked-out',
-    'spookee',
-    'spookier',
-    'spool-up',
     'spooler=yes',
-    'spoon&rehy;backed',
-    'spoon&rehy;fed',
-    'spoon-bending',
-    'spoon-feed',
-    'spoon-feeds',
-    'spoon-full',
-    'spoon-handle',
-    'spoon-like',
-    'spoon-player',
-    'spoon-sized',
-    'spoon/fork',
-    'spoonbenders',
-    'spooncarving',
-    'spoone',
-    'spooner/families',
     'spooner/sanctuary',
-    'spoonerism',
-    'spoonerized',
-    'spoonfeed',
-    'spoonfeeding',
-    'spoonfeeds',
-    'spoonin\'',
-    'spoonists',
-    'spoonley',
-    'spoonsful',
-    'spoookeee',
-    'spoor/parent',
-    'spor',
-    'sporck',
-    'spore-bearing',
-    'spore-producing',
     'sporgersi',
-    'sporine',
-    'sporn',
-    'sporned',
-    'sporocarps',
-    'sporranful',
-    'sport&rehy;ing',
-    'sport\'92',
-    'sport-entertainment',
-    'sport-minded',
-    'sport-related',
-    'sport-shop',
-    'sport-watches',
-    'sport.',
-    'sport/fun',
-    'sport/hobby',
     'sport/tim',
-    'sportaid',
-    'sportatorium',
-    'sportex',
-    'sporthuis',
-    'sportiest',
-    'sportifs',
-    'sportily',
-    'sportin\'',
-    'sportiness',
-    'sporting&rehy;dog',
-    'sporting&rehy;trophies',
-    'sporting-wise',
-    'sportingness',
-    'sportkulur',
-    'sportl',
     'sportorno',
-    'sportpension',
-    'sports**',
-    'sports***',
-    'sports-',
-    'sports-channel',
-    'sports-climbers',
-    'sports-coat',
-    'sports-crazy',
-    'sports-crowd',
-    'sports-day',
-    'sports-fans',
-    'sports-goods',
-    'sports-inspired',
-    'sports-jackets',
-    'sports-loving',
     'sports-nut',
-    'sports-people',
-    'sports-shoe',
-    'sports-style',
-    'sports-thought',
-    'sports-utility',
-    'sports-wear',
-    'sports-winner',
-    'sports-writers',
-    'sports/entertainment',
-    'sports/performance',
-    'sports/utility',
-    'sportsbag',
-    'sportscaster',
-    'sportscasters',
-    'sportscene',
     'sportsclub',
-    'sportscoat',
-    'sportsdrome',
-    'sportsfolk',
-    'sportsgear',
-    'sportshop',
-    'sportsjackets',
-    'sportsmans',
-    'sportsmedicine',
-    'sportsment',
-    'sportsmobiles',
-    'sportspersons',
-    'sportsters',
-    'sportswatch',
-    'sportsworks',
-    'sportwear',
     'sportworld',
-    'sporty-looking',
-    'sporulate',
-    'sposarsi',
-    'spot-',
-    'spot-1',
-    'spot-2',
-    'spot-causing',
-    'spot-checking',
-    'spot-checks',
-    'spot-clean',
-    'spot-cream',
-    'spot-cycle',
-    'spot-free',
-    'spot-i',
-    'spot-inspection',
     'spot-kick.',
-    'spot-kicks',
-    'spot-knee',
-    'spot-lighting',
-    'spot-lights',
-    'spot-listing',
-    'spot-prices',
-    'spot-pricing',
-    'spot-the-eye',
-    'spot-the-sexism',
-    'spot-the-star',
-    'spot-there',
-    'spot-weld',
-    'spot-welding',
-    'spot-woven',
-    'spot-yield',
     'spotcheck',
-    'spotdancing',
-    'spotik',
-    'spotiswood',
-    'spotkick',
-    'spotlights_of',
-    'spotline',
-    'spotman',
-    'spots-',
-    'spotted-billed',
-    'spotted-leafed',
-    'spotted-sided',
-    'spotting-the-influence',
-    'spotts',
-    'spotty-bummed',
-    'spousally',
     'spouse-less',
-    'spouse.',
-    'spouse/',
-    'spousehoods',
-    'spousen',
-    'spousessee',
-    'spouter',
-    'spouters',
-    'spoutgill',
-    'spouthouse',
-    'spouting-clubs',
-    'spox',
-    'spoyce',
-    'sppedy',
-    'spr(s)',
-    'spr/ssrs',
     'spra',
-    'sprachgef&uuml;hl',
-    'sprachgrenze',
-    'sprachlen',
-    'spragged',
-    'spraggon',
-    'sprags',
-    'spraguea',
-    'sprainin\'',
-    'spraire',
-    'spratlings',
-    'spratt-to-be',
-    'spratton/northamptonshire',
-    'sprauts',
-    'sprawiedliwose-postep-demokratcja',
-    'sprawlin\'',
     'sprawton',
-    'spray-blind',
-    'spray-damp',
-    'spray-deck',
-    'spray-drying',
-    'spray-fix',
-    'spray-fixed',
-    'spray-happy',
-    'spray-in',
-    'spray-jobs',
-    'spray-killers',
-    'spray-lashings',
-    'spray-snow',
-    'spray-snowed',
-    'spray-tank',
-    'spraybars',
     'sprayblown',
-    'spraydecks',
-    'spraydrift',
-    'sprayer/spreader',
-    'sprayhead',
-    'sprayhoods',
-    'sprayin\'',
-    'sprayman',
-    'spraymount',
-    'spraypaint',
-    'spraypainters',
-    'spraypainting',
-    'sprays.',
-    'sprdistmax',
-    'spread-\'em-against-the-wall',
-    'spread-armed',
     'spread-eagle',
-    'spread-on',
-    'spread-shot',
-    'spreadable',
-    'spreadeagle-painted',
-    'spreadeagling',
-    'spreadhseet',
-    'spreadin',
-    'spreading-out',
-    'spreadings',
-    'spreadsheet&trade',
-    'spreadsheet-based',
-    'spreadsheet-type',
-    'spreadsheet.',
-    'spreadsheet/charting',
-    'spreadsheety',
     'spready',
-    'sprechan',
-    'sprecher',
-    'spreckels',
-    'spreckley',
-    'spreed',
-    'spreedsheet',
-    'spreet',
-    'spreitzer',
-    'spreng',
-    'spreo',
-    'spresso-presso',
-    'sprig-marked',
-    'spriggily',
-    'sprigging',
-    'sprigginids',
     'sprightlier',
-    'sprightly-looking',
-    'sprightlys',
-    'spriklin',
-    'sprilib',
-    'sprin',
-    'spring&mdash;cleaning',
-    'spring-',
-    'spring-assisted',
-    'spring-bead',
-    'spring-blade',
-    'spring-blooming',
-    'spring-boards',
-    'spring-born',
-    'spring-button',
-    'spring-cleaned',
     'spring-dash-pot',
-    'spring-flower',
-    'spring-grass',
-    'spring-grown',
-    'spring-hares',
-    'spring-heading',
-    'spring-heel',
-    'spring-knives',
-    'spring-leaf',
-    'spring-lined',
-    'spring-load',
-    'spring-loading',
-    'spring-mechanism',
-    'spring-onion',
-    'spring-rain',
-    'spring-release',
     'spring-rice',
-    'spring-scented',
-    'spring-sowing',
-    'spring-steel',
-    'spring-tabs',
-    'spring-tensioned',
-    'spring-tidy-up',
-    'spring-water',
-    'spring/contact',
-    'springaleak',
-    'springan',
-    'springate',
-    'springbank/cheltenham',
-    'springbok-wallaby',
-    'springen',
-    'springer-verlag',
     'springer-verlag.',
-    'springer/house',
-    'springeth',
-    'springett/the',
-    'springfields-based',
-    'springheads',
-    'springholm',
-    'springily',
-    'springlakes',
-    'springle',
-    'springline',
-    'springlo',
-    'springloaded',
-    'springmakers',
-    'springs(3)',
-    'springs/',
     'springs/gloucestershire',
-    'springsteen-goes-broody',
-    'springsteen-style',
-    'springsteen-the',
-    'springtail',
-    'springthorpe',
-    'springtipping',
-    'sprinker',
-    'sprinklered',
-    'sprint-stop',
-    'sprintlink',
-    'sprintmail',
-    'sprintnet',
-    'sprinzen',
-    'spririted',
-    'sprit\'sail',
     'sprit\'sails',
-    'spritual',
-    'spritzing',
-    'spritzy',
-    'sprivers',
-    'sprl',
-    'sprocketed',
-    'sproggs',
-    'sproglets',
-    'spronck',
-    'sprong',
-    'spronge',
-    'sprongel',
-    'sprongs',
-    'spronsen',
-    'sprootin',
     'sprots',
-    'sprotts',
-    'sprouche',
-    'sproulls',
-    'sprouston',
-    'sprouty',
-    'sprowston',
-    'sproxton',
-    'sprs/',
-    'spruce-green',
-    'spruce-up',
-    'sprucely',
-    'spruceness',
-    'sprucer',
-    'spruchbecher',
-    'spruche',
     'spruchlein',
-    'sprugnoli',
-    'spruit',
-    'sprung-loaded',
-    'sprung-stage',
-    'sprung-wheeled',
-    'spryer',
-    'spryngabedde',
-    'sps&mdash;socialist',
-    'spss-',
-    'spss-x',
-    'spss/',
-    'sptc',
-    'sptifire',
-    'spud&mdash',
-    'spud\'',
     'spud-picking',
-    'spud-u-hate',
-    'spudding',
-    'spuggie',
-    'spui',
-    'spuin',
-    'spuing',
-    'spuistraat',
-    'spume-streaked',
-    'spume-whipped',
-    'spun-bonded',
-    'spun-column',
-    'spun-metal',
-    'spun-off',
-    'spun-out-of-air',
-    'spun-silk',
     'spunbonded',
-    'spundrawers',
-    'spunging',
-    'spunk.gave',
-    'spunkers',
-    'spunkie',
-    'spunkier',
-    'spunking',
-    'spunko',
-    'spuomancy',
-    'spur-of=the-moment',
-    'spur-ofthe-moment',
-    'spur-pruned',
-    'spur-thighed',
-    'spur-winged',
-    'spur/greenways',
     'spurdle',
-    'spuren',
-    'spurett',
-    'spurgeon\'s/oasis',
-    'spuria',
-    'spuriousness',
-    'spurlings',
-    'spurrey',
-    'spurriergate',
-    'spurrite',
-    'spurry',
-    'spurs-leeds',
-    'spurs/everton',
-    'spurs/jews',
-    'spurter',
-    'spurthighed',
     'spurtle',
-    'spute',
-    'sputknit',
-    'sputnik-i',
-    'sputterings',
-    'spvsrs',
-    'spw',
-    'spwcious',
-    'spx-90',
-    'spx-900',
-    'spx-900s',
-    'spx1000',
-    'spx90',
-    'spy&mdash;like',
-    'spy-action-hardware',
-    'spy-cartoons',
     'spy-catcher',
-    'spy-hiring',
-    'spy-in-the',
-    'spy-in-training',
-    'spy-master',
-    'spy-phobia',
-    'spy-plane',
-    'spy-running',
-    'spy-school',
-    'spy-writers',
-    'spycer',
-    'spychalski',
-    'spycraft',
-    'spydell',
-    'spye',
-    'spyer',
     'spyer.',
-    'spyes',
-    'spyholes',
-    'spyin\'',
-    'spyra',
-    'spyridon',
-    'spyrites',
-    'spysat',
-    'spyvee',
-    'sq-3000',
-    'sq-ft',
-    'sq-rd',
-    'sq._cm',
-    'sq._ins',
-    'sq._kms',
-    'sq._metres',
     'sq._miles',
-    'sq._mms.',
-    'sq._yd.',
-    'sq._yds',
-    'sq._yds.',
-    'sq.f.',
-    'sq.km.',
-    'sq.miles',
-    'sq1v',
-    'sq_ft.',
-    'sqauds',
-    'sqd.ldr',
-    'sqdrn',
-    'sqeaking',
-    'sqeamishness',
-    'sqeed',
     'sqire',
-    'sql&dollar;database',
-    'sql*c++',
-    'sql*connect',
-    'sql*dba',
-    'sql*net',
-    'sql++',
-    'sql-and',
-    'sql-connect',
-    'sql-retriever',
-    'sql/api',
-    'sql92',
-    'sqlwindows',
-    'sqm',
-    'sqn.',
-    'sqn/ass',
     'sqq.',
-    'sqrt',
-    'squa',
-    'squacco',
-    'squad-car',
-    'squad-mates',
-    'squad/west',
-    'squadders',
-    'squaddie\'',
-    'squadgy',
-    'squadra',
-    'squadro',
-    'squadroms',
-    'squadron-leader',
-    'squair',
-    'squalidly',
     'squalidness',
-    'squall-smokes',
-    'squalled',
-    'squallish',
-    'squalodelphidae',
-    'squalodontidae',
-    'squalodontids',
-    'squalor.',
-    'squalour',
-    'squamipinnis',
-    'squamocellular',
-    'squamosal',
-    'squanderer',
-    'squarane',
-    'square-backed',
-    'square-balled',
     'square-based',
-    'square-bashed',
-    'square-bodied',
-    'square-boned',
-    'square-built',
-    'square-by-square',
-    'square-chinned',
-    'square-drives',
-    'square-driving',
-    'square-drove',
-    'square-flanked',
-    'square-foot',
-    'square-lattice',
-    'square-leaded',
-    'square-lipped',
-    'square-palmed',
     'square-pass',
-    'square-plan',
-    'square-plate',
-    'square-pyramidal',
-    'square-rigger',
-    'square-rooting',
-    'square-set',
-    'square-sided',
-    'square-skulled',
-    'square-slabbed',
-    'square-tails',
-    'square-to-square',
-    'square-up',
-    'square-wall',
-    'square-well',
-    'square/back',
     'square/old',
-    'squarecase',
-    'squared-up',
-    'squareheaded',
-    'squareheads',
-    'squareline',
-    'squarer-tailed',
-    'squarest',
-    'squarestair',
-    'squarewave',
-    'squaric',
-    'squarking',
-    'squarson',
-    'squash-makers',
-    'squash-rackets',
-    'squashball',
     'squashed-pekinese',
-    'squasher',
-    'squashin\'',
-    'squat-dwellers',
-    'squat-thrust',
-    'squat-urn',
-    'squat-urns',
-    'squat/standup/mae-geri',
-    'squatmates',
-    'squatted-in',
-    'squatterdom',
-    'squattervilie',
-    'squattors',
-    'squatworld',
-    'squawkers',
-    'squawled',
     'squaymous',
-    'sque',
-    'squeak\'',
-    'squeakers',
-    'squeakiest',
-    'squeakingly',
-    'squeaky/husky',
-    'squeal-turned',
-    'squealingly',
-    'squealings',
-    'squeedged',
-    'squeegee-suction',
-    'squeeked',
-    'squeekers',
-    'squeel',
-    'squeeze-into-a-car',
     'squeeze-stile',
-    'squeeze-up',
-    'squeezed-in',
-    'squeezed-out',
-    'squeezers',
-    'squeezey',
-    'squeezin',
-    'squeezing-in',
-    'squeezy-mopped',
-    'squeezzzzz',
-    'squelch-like',
-    'squelchiest',
-    'squelchily',
-    'squelchin\'',
-    'squere',
-    'squerr-slice',
     'squerrs',
-    'squi',
-    'squibbing',
-    'squid-ink',
-    'squid-one',
-    'squiddlys',
-    'squidgier',
-    'squidging',
-    'squiggling',
-    'squiggly-hip',
-    'squilla',
-    'squillion',
-    'squillions',
-    'squin',
-    'squinnied',
-    'squint-through',
     'squintish',
-    'squire-bishop',
-    'squire-dominated',
-    'squirearchs',
-    'squireen',
-    'squirmingly',
-    'squirmworthy',
-    'squirmy',
-    'squirrel-eyes',
-    'squirrel-sized',
-    'squirreling',
-    'squirrely',
-    'squirt-by-puff',
-    'squirt-tech',
-    'squirtings',
-    'squishball',
     'squishiness',
-    'squishing',
-    'squitbrit',
-    'squits',
-    'squitted',
-    'squitters',
-    'squot',
-    'squper',
-    'sr&ograve;n',
-    'sr-16',
-    'sr-71s',
-    'sr-800',
-    'sr-dominated',
-    'sr.n4',
-    'sr.n4s',
-    'sr.prime',
     'sr/2',
-    'sr13',
-    'sr25o',
-    'sr498,000',
-    'sr520,000,000',
-    'sr753,000',
-    'sr844,8000,000',
-    'sr87,000,000',
-    'sr91',
-    'sr972,200,000',
-    'sr=0.1194',
-    'sraffa',
-    'sram-2',
-    'sramek',
-    'sramik4',
-    'sratch',
     'srbije',
-    'src-',
-    'src-transformed',
-    'src.doc.ic.ac.uk',
-    'src28c',
-    'srch',
-    'srd-x',
-    'srdan',
-    'srdj',
-    'srebrenikovic',
-    'sredets',
-    'sreekumar',
-    'sreet',
-    'sremski',
-    'sretensk',
-    'sretko',
     'sretzer',
-    'sri-lankan',
-    'sribbine',
-    'sricam-3',
-    'sridah',
-    'sridharan',
-    'sriharikota',
-    'srimuang',
-    'srinagar&ndash;delhi',
-    'srinagar-jammu',
-    'srinagars',
-    'sringhill',
-    'srinivas',
-    'srinivasa',
-    'sripen',
-    'sriperumpudur',
     'sris',
-    'srisa',
-    'sriti',
-    'srivastva',
-    'srm981',
-    'srm987',
-    'srmuc-18',
-    'srmw',
-    'srn&ccaron;iho',
-    'srn1',
-    'sroc',
-    'sron',
-    'sroud',
-    'sroufe',
-    'srow',
-    'srp',
     'srp60',
-    'srpska',
-    'srpske',
-    'srpsko',
-    'srr',
-    'srrna/45s',
-    'srrna/dna',
-    'srsc',
-    'srsf',
-    'srtanded',
-    'sru/adidas',
-    'srudarra',
-    'srul',
-    'srv-2000',
-    'ss-13',
-    'ss-13s',
     'ss-140',
-    'ss-16',
-    'ss-17',
-    'ss-17s',
-    'ss-18s',
-    'ss-19',
-    'ss-19s',
-    'ss-20j',
-    'ss-23',
-    'ss-25',
-    'ss-300',
-    'ss-a',
-    'ss-b',
-    'ss-nx-20',
-    'ss-ruc',
-    'ss-sd-gestapo',
     'ss-type',
-    'ss-ux',
-    'ss.10(1)',
-    'ss.14',
-    'ss.14(4)',
-    'ss.15(1)',
-    'ss.20',
-    'ss.221&ndash;222',
-    'ss.25(7)',
-    'ss.26',
-    'ss.31',
-    'ss.324&ndash;328',
-    'ss.38',
-    'ss.4(1)',
-    'ss.4(2)',
-    'ss.459&ndash;461',
     'ss.47&ndash;52',
-    'ss.48',
-    'ss.5',
-    'ss.61',
-    'ss.65(8)',
-    'ss.76(2)',
-    'ss.92&ndash;99',
-    'ss.l',
-    'ss/2331',
-    'ss/ruc',
-    'ss10',
-    'ss10&ndash;30',
-    'ss10&ndash;41',
-    'ss10(1)',
-    'ss13&mdash;14',
-    'ss135',
     'ss14',
-    'ss14&mdash;21',
-    'ss14(2)',
-    'ss142&mdash;157',
-    'ss15',
-    'ss152&mdash;160',
-    'ss158&mdash;171',
-    'ss159&mdash;161',
-    'ss164&mdash;166',
-    'ss164a',
-    'ss17&mdash;19',
-    'ss18',
-    'ss198&mdash;220',
-    'ss2&mdash;15',
-    'ss2&mdash;5',
-    'ss2(2)',
     'ss20&mdash;21',
-    'ss201',
-    'ss208',
-    'ss20s',
-    'ss22',
-    'ss222',
-    'ss24',
-    'ss24&mdash;28',
-    'ss24(7)',
-    'ss29',
-    'ss31&mdash;32',
-    'ss32',
-    'ss338',
-    'ss348',
-    'ss35',
-    'ss354',
     'ss379,000,000',
-    'ss39&mdash;40',
-    'ss4',
-    'ss4(1)',
-    'ss4(3)',
-    'ss4(4)',
-    'ss4(4)&mdash',
-    'ss4(5)',
-    'ss4(8)',
-    'ss4(9)',
-    'ss41(1)',
-    'ss421',
-    'ss428&mdash;430',
-    'ss44',
-    'ss50,51',
-    'ss6,453',
     'ss64',
-    'ss660&mdash;689',
-    'ss67',
-    'ss671&mdash;682',
-    'ss672',
-    'ss677',
-    'ss681(4)',
-    'ss71',
-    'ss736',
-    'ss74(3)',
-    'ss765&mdash;767',
-    'ss82&mdash;7',
-    'ss839(7)',
-    'ss86,012',
-    'ss87&mdash;96',
-    'ss9(1)',
     'ss9(6)',
-    'ss99',
-    'ssafs',
-    'ssame',
-    'ssamois',
-    'ssap16',
-    'ssap3',
-    'ssap8',
-    'ssass',
-    'ssc/',
-    'ssc/0.1%sds',
-    'ssc=3',
-    'sscms',
-    'ssd650',
-    'ssdc',
-    'ssdp&mdash;finnish',
     'ssdp22.124.14856',
-    'ssds.',
-    'sse-trending',
-    'sseb/snl',
-    'ssebana',
-    'ssgc',
-    'sshome',
-    'ssi/rha',
-    'ssi/swsg',
-    'ssi/us',
-    'ssip',
-    'ssiss',
-    'ssk',
-    'ssl-1',
-    'ssl2',
-    'sslistreqmax',
     'sslists',
-    'ssliststimout',
-    'sslistworkspace',
-    'ssmax',
-    'ssmin',
-    'ssn',
-    'ssn-21',
-    'sson-in-law',
-    'ssp(l)',
-    'ssp1(e)',
-    'ssp1(t)',
-    'sspi',
-    'sspp',
-    'ssr/highest',
-    'ssr/spr',
-    'ssrc-funded',
     'ssrc/esrc',
-    'sssala',
-    'sssalutations',
-    'ssschalala',
-    'ssseductive',
-    'sssee',
-    'ssshhhh',
-    'sssleep',
-    'sssomeone',
-    'ssspecial',
-    'sssplash',
-    'sssplllcchh',
-    'sssr',
-    'ssssa',
-    'sssshh',
-    'sssshhh',
     'sssshhhh',
-    'ssssshh',
-    'ssssssisster',
-    'ssssssssss',
-    'ssssssssssseventeen',
-    'ssssssssssss',
-    'ssstake',
-    'ssstrongest',
-    'ssstuffing',
-    'sssuppose',
-    'sssupposed',
-    'ssta',
-    'sstor',
-    'ssw',
-    'ssylka',
-    'st&aacute;0n',
     'st&auml;dtische',
-    'st&auml;ndchen',
-    'st&auml;rke',
-    'st&eacute;les',
-    'st&lsqb',
-    'st&ndash;1',
-    'st&ndash;4',
-    'st&ndash;6',
-    'st&oacute;ragj&aacute',
-    'st&ouml;ckl',
-    'st&ouml;re',
-    'st&pound;e',
-    'st&rcaron&iacute;brn&aacute',
-    'st&rcaron;eleck&yacute',
-    'st&uuml;mer',
-    'st&uuml;rme',
     'st&uuml;rmischen',
-    'st-&eacute;milion',
-    'st-\'st-\'st',
-    'st-02-3x',
-    'st-1000',
-    'st-2',
-    'st-400',
-    'st-beno&icirc;t',
-    'st-beno&icirc;t-sur-loire',
-    'st-castor',
-    'st-gall',
-    'st-germain-des-',
-    'st-germain-des-pres',
-    'st-hilaire-le-grand',
-    'st-hubert',
-    'st-i-i-n-ng',
     'st-jean-le-sauveur',
-    'st-john',
-    'st-l&eacute;onard-de-noblat',
-    'st-marc',
-    'st-marcellin',
-    'st-medard',
-    'st-michel',
-    'st-moritz',
-    'st-orages',
-    'st-paul-trois-chateaux',
-    'st-peter',
-    'st-philibert',
-    'st-pierre-de-granon',
-    'st-pierre-des-corps',
-    'st-pierres',
-    'st-remi',
     'st-st-studios',
-    'st-tropez',
-    'st-v',
-    'st.-stephen',
-    'st.12',
-    'st.albans',
-    'st.andrew',
-    'st.bart',
-    'st.bede',
-    'st.bride',
-    'st.clair',
-    'st.dunstans-in-the-west',
-    'st.edmund',
-    'st.george',
-    'st.georges',
-    'st.helens',
     'st.joseph',
-    'st.loe',
-    'st.lucia',
-    'st.margaret',
-    'st.neots',
-    'st.p.',
-    'st.paul',
-    'st.trinian',
-    'st.vincent',
-    'st/wapping',
-    'st1',
-    'st10',
-    'st1401',
-    'st18301/11med',
-    'st4',
-    'st7',
     'st9',
-    'sta-tistics',
-    'sta=3',
-    'staak',
-    'staart',
-    'staat',
-    'staatkundig',
-    'staatliches',
-    'staats',
-    'staatsburg',
-    'staatsdenken',
-    'staatsen&rehy;walt',
-    'staatsgem&auml;lde',
-    'staatsgem&auml;ldesammlungen',
-    'staatsgemaldesammlungen',
-    'staatsgerichtsbarkeit',
     'staatssekret&auml;r',
-    'staatssicherheitsdienst',
-    'staatsvertr&auml;ge',
-    'staatsverwaltung',
-    'stab-wounds',
-    'stab/st.g',
-    'stabbd',
-    'stabbed.am',
-    'stabbers-in',
-    'stabbs',
-    'stabby',
-    'stabia',
-    'stabian',
-    'stabilisation\'',
-    'stability-indicating',
-    'stability/compatibility',
     'stabilizers.',
-    'stabilo',
-    'stabilo/arguati',
-    'stabin',
-    'stable\'',
-    'stable-',
-    'stable-boys',
-    'stable-chronic',
-    'stable-cleaning',
-    'stable-companions',
-    'stable-dwelling',
-    'stable-dynamic',
-    'stable-garage',
-    'stable-keeper',
-    'stable-kept',
-    'stable-place',
     'stable-type',
-    'stable-wicket',
-    'stable/unstable',
-    'stableboys',
-    'stablehand',
-    'stablehands',
-    'stablen',
-    'stables&mdash;which',
-    'stables-converted',
-    'stables-cottage',
-    'stables.',
-    'stablespeed',
-    'stablilise',
-    'stablised',
-    'stablity',
-    'stably-integrated',
     'staby',
-    'staccatto',
-    'staccioli',
-    'stacey-cripps',
-    'stach',
-    'stachan',
-    'stache',
-    'stachiewicz',
-    'stachyo&iuml;des',
-    'stack\'em',
-    'stack-heeled',
-    'stack-systems',
-    'stackage',
-    'stackavrallachan',
-    'stackfield',
-    'stackheel',
     'stackhouse',
-    'stacking-cranes',
-    'stackings',
-    'stackometer',
-    'stackroom',
-    'stackyards',
-    'staconers',
-    'stacpoole',
-    'stacpoole/british',
-    'stacyes',
-    'stadacona',
-    'staddajakkstugorna',
-    'stadden',
-    'staddle',
-    'staddles',
-    'stadecker',
     'stadelschule',
-    'stades',
-    'stadex',
-    'stadhampton',
-    'stadhampton/oxfordshire',
-    'stadhaus',
-    'stadhouders',
-    'stadi',
-    'stading',
-    'stadion',
-    'stadionplein',
-    'stadium-based',
-    'stadium-fillers',
-    'stadium-style',
-    'stadium/metal',
-    'stadium/stokowski',
     'stadium/swindon',
-    'stadrill',
-    'stadt-anzeiger',
-    'stadt-theater',
-    'stadtb&auml;umer',
-    'stadtbahn',
-    'stadtbank',
-    'stadtgeschichte',
-    'stadthagen',
-    'stadthalle',
-    'stadtmoers',
-    'stadtpalais',
-    'stadtroda',
-    'stadtsgalerie',
-    'stadtssekret&auml;rin',
-    'stadtteil',
     'stadttheater',
-    'stae',
-    'staechlin',
-    'staedtmores',
-    'stael-like',
-    'staerk',
-    'staert',
-    'staff&rehy;australia',
-    'staff\'/',
-    'staff(stavka)',
-    'staff-appraisal',
-    'staff-captain',
-    'staff-contact',
-    'staff-controlled',
-    'staff-cum-students',
-    'staff-finding',
     'staff-head',
-    'staff-nurse',
-    'staff-officers',
-    'staff-related',
-    'staff-rooms',
-    'staff-sergeant',
-    'staff-shedding',
-    'staff-surgeon',
-    'staff-to-staff',
-    'staff-tutors',
-    'staff/client',
-    'staff/edit',
-    'staff/industry',
-    'staff/or',
-    'staff/patient',
-    'staff/sales',
     'staff/school',
-    'staff:student',
-    'staffelkapit&auml;n',
-    'staffeln',
-    'staffhave',
-    'staffhill',
-    'staffhorst',
-    'staffi',
-    'staffield',
-    'staffin/quiraing',
-    'staffing-level',
-    'staffing.',
-    'staffing/',
-    'stafford&ndash;rugby',
-    'stafford-based',
-    'stafford/solicitor',
     'staffordshire-based',
-    'staffordshire/south',
-    'staffordshires',
-    'staffordsire',
-    'staffordware',
-    'staffs-worcs',
-    'staffs/malvern',
-    'staffware-derived',
-    'staffwork',
-    'staffworking',
-    'staffy',
-    'stafiordshire',
-    'stafix',
-    'staford',
-    'stafort',
-    'stag-beetle',
     'stag-fight',
-    'stag-headed',
-    'stag-hounds',
-    'stag-party',
-    'stag-toe',
-    'stag/cupids',
-    'stage&rehy;managed',
-    'stage\'',
-    'stage\'n\'studio',
-    'stage-belgian',
-    'stage-centre',
-    'stage-coaching',
-    'stage-coughed',
-    'stage-craft',
-    'stage-curtains',
-    'stage-damage',
     'stage-designs',
-    'stage-direction',
-    'stage-dive',
-    'stage-dives',
-    'stage-effects',
-    'stage-flat',
-    'stage-floor',
-    'stage-front',
-    'stage-lights',
-    'stage-like',
-    'stage-lit',
-    'stage-mad',
-    'stage-manages',
-    'stage-orientated',
-    'stage-pit',
-    'stage-plays',
     'stage-royalty',
-    'stage-sampling',
-    'stage-scenery',
-    'stage-setting',
-    'stage-show',
-    'stage-southern',
-    'stage-specific',
-    'stage-the',
-    'stage-usable',
-    'stage-wagon',
-    'stage-wise',
-    'stage.mike',
-    'stage/page',
-    'stage/third',
-    'stage/was',
-    'staged-a',
     'staged.',
-    'stagedived',
-    'stagediver',
-    'stagedives',
-    'stagedoor-keeper',
-    'stagee',
-    'stageing',
-    'stageism',
-    'stagelights',
-    'stageline',
-    'stageloach',
-    'stagemaster',
-    'stagen',
-    'stageplay',
-    'stages/steps',
-    'stageshow',
     'stageshows',
-    'stageside',
-    'stagewear',
-    'stagewise',
-    'stagework',
-    'stagflation-induced',
-    'stagflationary',
-    'staggered/flexible',
-    'staggerer',
-    'staggeringness',
-    'staggery',
-    'staggy',
-    'staghounds',
-    'stagily',
-    'staging&rehy;post',
-    'staging&rehy;posts',
     'staging-point',
-    'stagisti',
-    'stagnance',
-    'stagnates',
-    'stagnatilis',
-    'stagnone',
-    'stahle',
-    'stahlhelm',
-    'stahlman',
-    'stahr',
-    'stai',
-    'staid-looking',
-    'staiend',
-    'staight',
-    'staighten',
-    'staightforward',
     'stail',
-    'stails',
-    'stain-',
-    'stain-absorbing',
-    'stain-fighting',
-    'stain-finished',
-    'stain-proof',
-    'stain-remover',
-    'stain-retardant',
-    'stain/ninety-five',
-    'stain/varnish',
-    'stainbank',
-    'staincliffe',
-    'staincline',
-    'staindale',
-    'staine',
     'stained-glass-effect',
-    'stained-looking',
-    'stained-oak',
-    'staines/nine',
-    'staining.',
-    'stainislaus',
-    'stainless&rehy;steel',
-    'stainless/kelham',
-    'stainsalts',
-    'stair&rehy;ways',
-    'stair-nose',
-    'stair-wells',
-    'stair-wires',
-    'stairacse',
-    'staircase-like',
-    'staircase_in',
     'stairfoot',
-    'stairgate',
-    'stairgates',
-    'stairheads',
-    'stairheid',
-    'stairmaster',
-    'stairs/aquarius',
-    'stairs/freelance',
-    'stairside',
-    'stairway.',
-    'stairwayed',
-    'stait/assistant',
-    'staites',
-    'staiths',
-    'staiton',
-    'stake-',
     'stake-ganging',
-    'stake-in-the-heart',
-    'stake-outs',
-    'stakeboat',
-    'staked-out',
-    'stakeholder-analysis',
-    'stakeholes',
-    'stakeout',
-    'staker/executive',
-    'stakers',
-    'stakhanovites',
-    'stakhov',
-    'stakin\'',
-    'stakisville',
-    'stakker',
-    'stakoo',
     'staks',
-    'stal',
-    'stalactite-like',
-    'stalags',
-    'stalch',
-    'stale&rehy;mate',
-    'stale-breathed',
-    'stale-tobacco',
-    'stalest',
-    'staley-inspired',
-    'stalin-era',
-    'stalin-gothic',
-    'stalin-hitler',
-    'stalinbrass',
-    'stalinised',
-    'stalinish',
     'stalinism\'',
-    'stalinist-dominated',
-    'stalinist-era',
-    'stalinist-style',
-    'stalinvastae',
-    'stalis',
-    'stalisfield',
-    'staliynas',
-    'staliyski',
-    'stalk\'',
-    'stalk-and-slash',
-    'stalk-extension',
-    'stalk-like',
-    'stalker*',
-    'stalker-sampson',
-    'stalks.',
     'stalky-legged',
-    'stall&rehy;ing',
-    'stall-keeper',
-    'stall-like',
-    'stall-sites',
-    'stall-walking',
-    'stall/spin',
-    'stallage',
-    'stalled-career',
-    'stallibrass',
-    'stallin',
-    'stallington',
-    'stallion-leader',
-    'stallkeeper',
-    'stallone-esque',
-    'stalls.',
     'stallwood',
-    'stallybrass',
-    'stalwood',
-    'stalworth',
-    'stalyns',
-    'stamatis',
-    'stambolis',
-    'stamenless',
-    'stamford-bewlay',
-    'stamfordians',
-    'stamina-packed',
-    'staminas',
-    'staminate',
-    'staminodes',
-    'stammerings',
-    'stammerless',
     'stammler',
-    'stammon',
-    'stammtafel',
-    'stamnos',
-    'stamp-collectors',
-    'stamp-duty',
-    'stamp-mill',
-    'stampable',
-    'stampe-gilbert',
-    'stamped-in',
-    'stamped-on',
-    'stampedin\'',
-    'stampen',
-    'stamperia',
-    'stampes',
-    'stampex',
     'stampfer',
-    'stamphas',
-    'stamping-grounds',
-    'stampless',
-    'stan&rehy;dardized',
-    'stan\'',
-    'stan-dards',
-    'stanaformed',
-    'stanage-size',
-    'stanch',
-    'stancheons',
-    'stanchion-gun',
-    'stancliff',
-    'stanczak',
-    'stand&rehy;mounted',
-    'stand&uacute;n',
     'stand-',
-    'stand-ball',
-    'stand-by-my-principles',
-    'stand-collar',
-    'stand-holders',
-    'stand-mounted',
-    'stand-on',
-    'stand-points',
-    'stand.it',
-    'stand/sit',
-    'standa',
-    'standabout',
-    'standage',
-    'standar',
-    'standard&mdash;basket',
-    'standard&ndash;class',
     'standard&rehy;bearers',
-    'standard\'',
-    'standard-',
-    'standard-and',
-    'standard-conformant',
-    'standard-dose',
-    'standard-format',
-    'standard-lamp',
-    'standard-like',
-    'standard-play',
-    'standard-pole',
-    'standard-rate',
-    'standard-repertoire',
-    'standard-setter',
-    'standard-state',
-    'standard-style',
     'standard-trained',
-    'standard-type',
-    'standard-wise',
-    'standard.security',
-    'standard_as_far',
-    'standardbearer',
-    'standardclass',
-    'standardish',
-    'standardiz',
-    'standardizations',
-    'standardless',
-    'standards&mdash;has',
-    'standards-compliant',
-    'standards-conformant',
-    'standards-friendly',
-    'standards-led',
     'standards-setter',
-    'standards-setters',
-    'standards-setting',
-    'standards/registration',
-    'standarised',
-    'standby-credit',
-    'standed',
-    'standedge',
-    'standee',
-    'standen/newly',
-    'standep',
-    'stander',
-    'stander-around',
-    'standers',
-    'standers-by',
-    'standerwick',
     'standes',
-    'standesaint',
-    'standesamter',
-    'standfast',
-    'standfirst',
-    'standford',
-    'standford-tuck',
-    'standgate',
-    'standhalf',
-    'standing-by',
-    'standing-committees',
-    'standing-lug',
-    'standing-only',
-    'standing-out',
-    'standing-pool',
-    'standing-posts',
     'standing-room',
-    'standing-room-only',
-    'standing-to',
-    'standing-up',
-    'standing/dean',
-    'standing/kneeling/lying',
-    'standish/gloucestershire',
-    'standith',
-    'standoffishness',
-    'standouts',
-    'stands-by',
-    'stands-side',
-    'standsing',
-    'standst',
-    'standstead',
-    'staneke',
     'stanesbys',
-    'stanfill',
-    'stanford\'s',
-    'stanford-tuck',
-    'stangled',
-    'stanglmaier',
-    'stangor',
-    'stanground',
-    'stangs',
-    'stanhoe',
-    'stanhopea',
-    'stanhopeinae',
-    'stanhow',
-    'stani',
-    'staniforth/agricultural',
-    'stanik/vet',
     'stanilov',
-    'staningford',
-    'stanislavkian',
-    'stanislawow',
-    'stanislawski',
-    'staniszewska',
-    'stanka',
-    'stankevich',
-    'stankovic',
-    'stanks',
-    'stanley-knife',
-    'stanley/film',
-    'stanley/gloucester',
-    'stanley/gloucestershire',
-    'stanleyville',
-    'stanly',
     'stanmere',
-    'stannage',
-    'stannaries',
-    'stanner',
-    'stanney',
-    'stannier',
-    'stanniferous',
-    'stanningfield',
-    'stannum',
-    'stanoikovic',
-    'stanoje',
-    'stanojkovic',
-    'stanov',
-    'stanovac',
-    'stanovoi',
-    'stanozol',
     'stansbie',
-    'stansburiana',
-    'stanshall',
-    'stanski',
-    'stansky',
-    'stansstad',
-    'stansted&ndash;chicago',
-    'stansteds',
-    'stante',
-    'stantially',
-    'stantibus',
-    'stantion',
-    'stanton/anthony',
-    'stantons',
-    'stanwardine',
-    'stanway-based',
     'stanwood',
-    'stanwyck-starring',
-    'stanyan',
-    'stanydale',
-    'stanza-form',
-    'stanza-linking',
-    'stanzaic',
-    'stapele',
-    'stapes',
-    'stapfii',
-    'staphenandra',
-    'staphorst',
-    'staphylinid',
-    'staphylococcocus',
-    'staple-gunned',
-    'staple-is',
     'staple-like',
-    'staple-marks',
-    'staple/nail',
-    'stapled-together',
-    'staplefore',
-    'staples-brown',
-    'staples/royal',
-    'stapleton/co-driver',
-    'stapness',
-    'stapp',
-    'stappell',
-    'stapylton',
-    'star%',
-    'star%ed',
-    'star&ouml;m&ecaron;stsk&eacute',
-    'star&rehy;jumps',
     'star&rehy;probing',
-    'star\'-martin',
-    'star-100',
-    'star-beads',
-    'star-bird',
-    'star-birth',
-    'star-bright',
-    'star-broken',
-    'star-chamber',
-    'star-clocks',
-    'star-cluster',
-    'star-conscious',
-    'star-corridors',
-    'star-cruising',
-    'star-dance',
-    'star-dusted',
     'star-encrusted',
-    'star-endorsed',
-    'star-f',
-    'star-fastening',
-    'star-field',
-    'star-figures',
-    'star-file',
-    'star-fish',
-    'star-form',
-    'star-formation',
-    'star-frost',
-    'star-gazer',
-    'star-grazer',
-    'star-grooming',
-    'star-heavy',
-    'star-in-the-making',
     'star-knight',
-    'star-launch',
-    'star-launching',
-    'star-mists',
-    'star-name',
-    'star-next-door',
-    'star-oriented',
-    'star-patterned',
-    'star-pitted',
-    'star-pointed',
-    'star-printed',
-    'star-producer',
-    'star-shapes',
-    'star-shell',
-    'star-shells',
-    'star-shipping',
     'star-shoots-his-way-out-of-the-ghetto',
-    'star-show',
-    'star-slave',
-    'star-speckled',
-    'star-splashed',
-    'star-spotter',
-    'star-spun',
-    'star-strangled',
-    'star-striker',
-    'star-systems',
-    'star-tanned',
-    'star-travel',
-    'star-trimm',
-    'star-type',
-    'star-vaulting',
-    'star-void',
     'star-walking',
-    'star-washed',
-    'star.exe',
-    'star.observer',
-    'star/folk',
-    'star/software',
-    'staravia',
-    'staraya',
-    'starbank',
-    'starbase',
-    'starbeam',
-    'starblade',
-    'starbreaker',
-    'starcatcher',
-    'starch-based',
-    'starch-branching',
     'starch-crisp',
-    'starch-reduced',
-    'starch-refined',
-    'starch/flour',
-    'starcharts',
-    'starchers',
-    'starchmill',
-    'starcils',
-    'starcross',
-    'starcruisers',
-    'stardom-without',
-    'starduster',
-    'stardusters',
-    'stare-downs',
-    'stare-threat',
-    'stare.',
     'stare/1',
-    'stared-at',
-    'stared-down',
-    'stared_at',
-    'starer',
-    'staresses',
-    'staretz',
-    'starf&mdash;er',
-    'starfarers',
-    'starfields',
-    'starfished',
-    'starflex',
-    'starforce',
-    'stargirl',
-    'starglider',
-    'stargrace',
     'starica',
-    'starike',
-    'staring-eyed',
-    'stark-staring',
-    'starkadder',
-    'starkey/leader/oxford',
-    'starkie/national',
-    'starkiller',
-    'starkis',
-    'starkov',
-    'starksy',
-    'starkweather',
-    'starlab2',
-    'starlake',
-    'starlan',
-    'starlessness',
     'starlights',
-    'starliner',
-    'starlines',
-    'starling-sized',
-    'starlink',
-    'starna',
-    'starns',
-    'starobinskia',
-    'starodubov',
-    'starosta',
-    'starozhily',
-    'starpitted',
-    'starpoint',
-    'starr-weiner',
-    'starr/neil',
-    'starred.',
     'starres',
-    'starrett',
-    'starriness',
-    'starrs',
-    'stars\'n\'bars',
-    'stars-unseen',
-    'starscape',
-    'starshot',
-    'starsplash',
-    'starspots',
-    'starstation',
-    'starstudded',
-    'start-border',
-    'start-cue',
-    'start-cues',
-    'start-dodman',
     'start-eyed',
-    'start-finish',
-    'start-for',
-    'start-forward',
-    'start-ii',
-    'start-not',
-    'start-off',
-    'start-shaped',
-    'start-to-finish',
-    'start-to-stop',
-    'start-up.',
-    'start-up/shutdown',
-    'start-work',
-    'start-your-own-business',
-    'start.stop',
-    'start/end',
     'start1',
-    'startboard',
-    'started-first',
-    'started-up',
-    'started.a',
-    'started.he',
-    'started/got',
-    'started/stopped',
-    'startegies',
-    'starter-',
-    'starter-home',
-    'starter-motors',
-    'starter-stunters',
-    'startime',
-    'starting-',
-    'starting-block',
     'starting-blocks',
-    'starting-gun',
-    'starting-line',
-    'starting-post',
-    'starting-square',
-    'starting-time',
-    'starting-times',
-    'starting-up',
-    'starting/leaving',
-    'startings-to-work',
-    'startouchers',
-    'startpoint',
-    'startrite',
-    'starts-up',
-    'startsheet',
-    'startsite',
     'startsmart',
-    'startup/shutdown',
-    'starv',
-    'starvation-diet',
-    'starvation-while',
-    'starvations',
-    'starve\'',
-    'starveall',
-    'starved-priest',
-    'starveing',
-    'starvers',
-    'starving.',
-    'starwoman',
-    'starworks',
-    'starwort',
-    'stary',
     'starz',
-    'starzl',
-    'stas',
-    'stasi-related',
-    'stasis-box',
-    'stasis-boxes',
-    'stasis-cases',
-    'stasium',
-    'stasoggia',
-    'stass',
-    'stassinos',
-    'staszkiewicz',
-    'stat(s)',
-    'stat-us',
-    'statable',
-    'statal',
     'statary',
-    'statdtheater',
-    'state&mdash;changed&mdash;on',
-    'state&mdash;in',
-    'state&mdash;those',
-    'state&ndash',
-    'state&rehy;employed',
-    'state&rehy;ments',
-    'state&rehy;sanctioned',
-    'state&rehy;schools',
-    'state&rehy;socialist',
-    'state-1.5',
-    'state-as&rehy;actor',
-    'state-assembly',
-    'state-based',
-    'state-caused',
     'state-centralised',
-    'state-centrists',
-    'state-chartered',
-    'state-check',
-    'state-citizenship',
-    'state-civil',
-    'state-commissioned',
-    'state-control',
-    'state-corporate',
-    'state-creation',
-    'state-defined',
-    'state-dominated',
-    'state-educated',
-    'state-education',
-    'state-employed',
-    'state-entrenched',
     'state-facilitated',
-    'state-form',
-    'state-forming',
-    'state-funding',
-    'state-geography',
-    'state-house',
-    'state-individual',
-    'state-initiated',
-    'state-interest-group',
-    'state-istics',
-    'state-less',
-    'state-licenced',
-    'state-local',
-    'state-managed',
-    'state-masonry',
-    'state-of',
     'state-of-',
-    'state-of-siege',
-    'state-of-the&rehy;art',
-    'state-of-theart',
-    'state-or-the-art',
-    'state-ordained',
-    'state-organ',
-    'state-orientated',
-    'state-oriented',
-    'state-planning',
-    'state-private',
-    'state-produced',
-    'state-railway',
-    'state-recognised',
-    'state-registered',
-    'state-related',
     'state-renouncing',
-    'state-run7.3',
-    'state-sanctioned',
-    'state-sponsorship',
-    'state-style',
-    'state-subsidised',
-    'state-subsidized',
-    'state-support',
-    'state-trusts',
-    'state-ub40',
-    'state-war-navy',
-    'state-within-a-state',
-    'state-xxxx',
-    'state.',
-    'state.31',
-    'state/',
     'state/behavioural',
-    'state/local',
-    'statecentrism',
-    'stated&mdash;probably',
-    'stated/imply',
-    'stategic',
-    'stateinyi',
-    'stateman',
-    'statemanship',
-    'statemen',
-    'statement-kind',
-    'statement-the',
-    'statement.',
-    'statement.but',
-    'statement/print-out',
-    'statement_in',
     'statements-were',
-    'statements.if',
-    'statements_on_the_part',
-    'statensk',
-    'states&mdash;that',
-    'states&mdash;united',
-    'states*',
-    'states-as-suitors',
-    'states-canada',
-    'states-chaperoned',
-    'states-dominated',
-    'states-educated',
-    'states-financed',
-    'states-funded',
-    'states-inspired',
-    'states-japan',
     'states-owned',
-    'states-portuguese',
-    'states-subjects',
-    'states-supplied',
-    'states-within-a-state',
-    'states.',
-    'states.victims',
-    'states/80%',
-    'statesled',
-    'statesman-leader',
-    'statesmanliness',
-    'statesmanly',
-    'statesperson',
-    'statewatch',
-    'statexact',
-    'statgraphics',
     'stather',
-    'stathr',
-    'stati',
-    'static-free',
-    'static-like',
-    'statical',
-    'staticity',
-    'statil',
-    'station\'',
-    'station-',
-    'station-agent',
-    'station-any',
-    'station-builders',
-    'station-buildings',
-    'station-forms',
-    'station-golders',
     'station-houses',
-    'station-keeping',
-    'station-leamington',
-    'station-stonehenge',
-    'station-to-station',
-    'station-yard',
-    'station.they',
-    'station/m4',
-    'station/minimart',
-    'stationair',
-    'stationand',
-    'stationarity',
-    'stations/',
-    'stations/airports',
-    'stations/we',
-    'stationside',
     'stationsoft',
-    'statira',
-    'statism-collectivism',
-    'statistcal',
-    'statistcs',
-    'statistic&rehy;producing',
-    'statistic-faking',
-    'statistically-derived',
-    'statistically-improbable-in-a-direction-specified-without-hindsight',
-    'statistically-remote',
-    'statisticial',
-    'statistico',
-    'statistics-and-dice',
-    'statistics-gathering',
-    'statistics/computing',
-    'statistics/figures',
     'statistisches',
-    'statists',
-    'statium',
-    'statkraft',
-    'statlt',
-    'statment',
-    'statmux',
-    'stato&mdash;ffss',
-    'statoil-operated',
-    'statomatic',
-    'stators',
-    'statos',
-    'statpak',
-    'statsraad',
-    'stattel',
-    'statters',
     'statua',
-    'statuary.',
-    'statue-alarm',
-    'statue-base',
-    'statue-bases',
-    'statue-reliquary',
-    'statue-still',
-    'statuesquely',
-    'status&lt;3',
-    'status&rehy;though',
-    'status-conferring',
-    'status-consciousness',
-    'status-defining',
-    'status-embedded',
-    'status-enhancing',
-    'status-groups',
     'status-hierarchy',
-    'status-hungry',
-    'status-labels',
-    'status-less',
-    'status-levels',
-    'status-neutral',
+)
+
+blocks_55 = (
+    '\'\'towkens%#ock$(p-bashed%&buster#*ng-weights#)rpability%#ers%$ings$!r%%y/day\'&manure&#ing#\'sarchuk$#chi$)h-covered',
+    '&$like&%slurp%#ier##the$"ty$$zkin##zba"#v-3"!x")y-looking$(punching$\'stepped#//grand-daughter$&willis#%boots',
+    '#+ly-charming#!m$"an##via!,m&aring;land#+eacute;agol#/oslash;rgasbord"#-21#$b/pr%#rgm#"co"!."!/""12#$:sm2',
+    '##400"#58s"0832/g&ndash;wwii"2a&zcaron;en&eacute##-20%!1#!1#!a$#-aa$#ack#\'ck\'eads%*-addiction)#led&#dab&(smuggler',
+    '%%/some%&ed-out&&rooney*#ies)!s%$ings%!y#(ithwaite#-ll&mdash;bore&-rehy;holdings%!\'%$-\'c\'&)amplitude\'$reas(!m',
+    '\'$lock\'#one(%somed(!y\'$reak\'%udget()sinessman&(capacity(!r\'&lothes\'\'ustomer&,denomination\'(imension&%eared\'"nd',
+    '(%gined&%faced($mily($rmer\'(eathered*$ured\'\'lowered\'(or-dates)(m-factor\'$rame&%grown&$hope($rned("ur*!s',
+    '\'+s-beautiful(!h&%jawed&&limbed\'#ong&,medium-sized($shed&&nation\'&ippled\'&umbers&2office-home-office&\'package(#rty\'#ool(#wer',
+    '&&radius&&sample\'%cales\'%eeded(!t\'$hare+&holder()opkeeping)!t\'$pace\'$tate&#the\'$imer\'+o-microbial(.o-medium-sized',
+    '&$unit&%venue($ssel\'%oiced&$wave\'\'orkshop%\'/labour\'\'echlade&,medium/large%&bridge\'#ook%&calder%!d&(on/river%)er-bodied',
+    '(\'grained*%owing(&leaved($size)#tep(+than-normal-%usual)#ype(&volume\'!5%%field%$gods\'"od%&health("th',
+    ')$ing\'&$ythe%#ing%$mans%$page&#ecs\'#ice&\'ox-like%%scale%\'talk-80)(/v-cobol%%ville%$weed&,ood/villager%!y',
+    '#%ointe$"ui#!p#(ragadine&$dine\'"us$$dale$$mily&$ness%!s$!r$+t&rehy;alec,#rse+\'looking%\'-alecks',
+    '\'$ssed&&casual&$drug*!s&&format&(liveried&%money(#uth&%suite&$talk%)/accident&)pensioner%$arse%#cam\'"rd',
+    '\'!u&$lick%*er-looking(5than-is-good-for-them%$fill%$guns%!h%$icon&$ngly%&ly-cut(&suited(%taken%\'objects%&sizing&$tart',
+    '%"vu%&y-pant+!s($ower&%pants#0sh-and-grabbable)$grab&#ins&%style%!a%-ed-up-looking%\'ings-up%#jaw#!t$#ter',
+    '$!v#"ul##yda"!d#!p#&s/cbds"#ean$"r-&$test%!a%$ings%"sm%#ton%%watch$\'tonians',
+    '#+dley/former#%ichel$!n#"le$%iakov$+l-absorbing&%cards\'(onscious&)detecting&$free&&making\'\'essages&(o-vision&)receptive&%sense',
+    '%!a&#ble%!e&!r%%iness%"s.%-y&rehy;socked&)-breathed$+ting-houses%!s#"na$&khkare#$rdis%"on#"s.',
+    '#(tanesque&#ovo$!s"!f"3i&rcaron;ick&yacute#!d#$iile#&lacina%$nski$"e\'%%-high&(implying&%lines%#d.v%%s-had',
+    '%&y-like\')regretful&%penis$!i%!e%#ng.$"jo$$odon$!y#(nthopsis#&raglia$!f$%noffs$#ran%#ing',
+    '#!s$$sion#$teth$\'h&mdash+#;is%\'(oxfam)%+-and-wesson&\'dorrien&&eccles&/faines-robinson&&goosne&&hungry&%kline&#led&%mundt',
+    '\'\'rescott&&ryland&\'thomson&&veness&$work%$.and%(/actress\'#nti\'%ppeal\'%shley(\'sistant)(ociation&)blackbird+%smith\'%ookie',
+    ')$tish(&oadway&\'captain(#rer\'\'haplain\'&ollege(!n))servation&(engineer\'!x&&farmer($ther\'#ord&&gloucs&\'harwell',
+    '\'#ome($stel&+independent&(landlord\'$ocal&+madonna/tim(&naging(#yor\'&enzies\'!p&(national\'(eighbour&%oxfam)(ordshire&&parent',
+    '(%tient\'&roject\'$upil&#red($scue(%tired\'#oad(%wland\'$ural&&savage\'%hadow\'&impson\'&windon&&tenant&%video',
+    '&)wiltshire%"am%%craft%!e&!d&$reen\'#man\'\'s-jones%!i&"an&*es/captain&"te%&kovsky%!m&$ania',
+    '%\'s-buffs&,/easterhouse\'#moz&(ian-type&)on/diving&#ton%%town\'%%ville%"ye&!s$#in\'$!s$#tle&#ing""m6',
+    '#,ck-and-straw&$like&%maker&%style%!y#!e#)g-causing%&filled$%giest##ike#!k$&alizer$-e&rehy;screen%!-&%alarm',
+    '&\'bathing\'&leared("ue\'$ombs\'&usters&(carrying\'\'leaning&(darkened\'\'etector\'#yed&&fogged&&grimed&&involv&$jack&$like',
+    '&)producing&&reeked\'$ooms&\'scented(%reens\'(ignalled,!s\'\'melling\'&tacked("op\'%wirls&&tarred\'%inted(#red\'$rail',
+    '&(wreathed%!.&"it%$/dye%$ball&"ox%)less-fuel)$ness%$ries\'#ngs&#oom%-stack-america\'#one%$wise%&y-bear',
+    '$"os%$vich$*y-accented&%sized#$lden$!e%&nskaia(!i$+gubispolkom\'#kom$"in&!g&#ski)&/dowty$"ka',
+    '$"ny$(uchowski#&ochers&"ie("st\'"n\'$#dge$"ra%#ing$#th-\'*adaptation\'&billed(%odied(&rained\'(featured',
+    '(&loored\'&glazed\'&leaved(%imbed\'\'phrased\'&riding\'&shaped($ided(&kulled($oled)&unding(\'pinning(&temmed)&riding(\'urfaced',
+    '+#ers(\'extured($oned((rowelled&$bore&&ed-off\',r-of-the-way)\'running)\'tongued(!s&(ing-down&%lands\'#ine\'0y&mdash;although((-blended',
+    ')&shaven(!.(#_on&!o&$skin&\'y-chops#$rfia$$gans#!t$!h%\'er-love((smoothed\'%cated\'%ingly$\'ryashcy',
+    '#\'ulder.i(%ingly+!s(!y"/p&mdash;finnish##/mt#!a"%r=191$#210$$44.7$$94.5"%s-kan%#cnr#"as""ta',
+    '$&-based"!u#\'dgeable%#ily((-printed&$ness#$gger&"st%#les&#in\'$%slugs#%rfitt$2thwaite/gloucester#$shed#*t-detector',
+    '&#ree%\'peddler%\'seeking$$ched$#ted%#ier&"ly&$ness"$ylex##ril$&nensis#*th-piggott)#ott%(/tornado%$urst',
+    '&#man$$inge!4n&ecaron;movn&iacute"$*w\'n"$-183#$6911#$7618#"cl$#u-w&%zn-as#(snuggled"$1000#!5#$987a"$2000',
+    '#"53"!7"0a-multi-protocol$\'on-unix$$unix#%/appn$#osi#$3270#$adee$%fowls#\'ck-bars&*dispensing&&eating&%sized%&booths',
+    '%"s.&%tuffs%!y$#pac#"de%!r$!s#&ebjorn#)ffle-bits(\'printed#&g-free%\'toothed$+gle-toothed#)il\'s-pace%%-life',
+    '&&shaped\'#low&(trailing%"es%&shells##ke-&%barks\'#ite\'%uckle&\'chasing\'&lasped\'"up&%dance&%green&&haired',
+    '\'%eaded\'&unters&,in-the-grass(&fested&%laced&\'mimicry&,preservation&&ridden&$skin\'$tone&\'tongued,!s%./dolphin/woman&\'saracen%#man',
+    '%%siren&*kin-titles%!y&"es$!s#"ll#%p-box&&rimmed%#cap&&rackle%)fasteners&#its\'!x%%happy&%ooked',
+    '&%ocked%#off%&rolled%&shorts%"to\'&gether$\'ped-off)"ut&%rs-up%)ing-point&!t\'!s$\'shooter)#ing\'\'t-sized',
+    '($ting$!t#"rf%#ord$$gate$#kul$&l-gape&\'toothed%#ed.%%ingly(!s$#ply#!s$!h%#all',
+    '#!t$)ch-and-go\'$free\'%proof\'$shot&#in\'&#man#"ve#!w#%zzily""cb#!e#"os"#dvs"&eachda',
+    '&$line&%thief%)er-status\'"ed%%ingly(!s%)y-seeming$#ton#%ddles##eky$(r-a-like\'$long%"er%$well%!y',
+    '%$hin\'$+ze-inducing&!r&$wort%#ley#!h#\'iderman#%lgars%%roves$&lgrove$#son#$nton#"pp##rdi#(s-owning',
+    '$\'ellicci#!w$"in&!g#$zana""fu"+ick-snicked%&leways%!s#$dier$#ley#%ff-in%\'ed-over$!s#!g',
+    '%"le#(pe-grass%\'rscopes$\'ped-off(*photograph&!r\'"in\'!s$"s/#%tcher&$line$"ow$%terby#%velly&!s',
+    '"!j#"-5"&l/sseb",mp-compliant$"v1"%o-cat$"go#%ately##bol##cat$!k%%rigg.#\'ddyisms$!s#*eck-ducaju',
+    '#%ggery%"in$!s#\'od-like$"ke&,r(pool)-room\'(-fashion)#ree\'):thursday\'#ing$$pin\'%&y-like$(ze-along&!r&$sque',
+    '#%rbits$\'ebuster$#in\'&#gly$!k%%elers\'#ing\'#ler*!s\'#ors%$lers$"re$"t.%$ed\'\'%#ian',
+    '%%faced%\'rollers$$ball$$ches$$face$%green$!s$"ta%#ily%"or%,y&rehy;nosed##uck$)t-visored%"ed&!r',
+    '&"sh#,w&rehy;white$%-bank)!s&$irds&(lanketed\'%ocked($wers)!n&%right%(carpeted&$haos&\'leaners\'%ogged("ud',
+    '\'"ck\'&vering%&dazzle&%raped\'&ipping&#ust)"ed%)encrusted%&famine&%lakes&%rozen%$gale\'#tes&\'rooming(#und',
+    '%#job%%laced&#ike\'"ne\'!t&%ocked\'$nely%\'mantled%,on-the-boots%%piled&\'owdered%%scape\'$reen&$hoes\'&rouded',
+    '&$lope&(pattered&&tarved\'#orm*!s\'&reaked($iped&#uit%&tipped&%opped%%vales%&washed\'#ter&"et&%reath',
+    '$-ball-throwing&#nks%#elt%&lasted%&oarder&)y-fuelled$#cat%$emed\'#med%#lad&$ouds%$ock.(!s&#ver)"ed',
+    '$)don-sized\'\'/prison\'\'ia:soil%\'rifting$$ella$&flaked%"ox$$iest%"ly%"n\'&"g.$$less&!y%$ight$(mobiling',
+    '&"ke%$last&%oughs%%rints$%scene)!s%#ell%$hine&%oeing\'%oters%$take%$uits$$time$%white%)oman-like',
+    '#)zzberries""p-#!s""sb"(ub-ended$$bins$%nosed##dge#.ff&rehy;taking%(-allergy&%boxes&\'content&,handkerchief&&making\'$ovie',
+    '&&taking%&ed-out\'#out&\'r-stand\'!s%%house%#ley#%g-fit$$bury$#ger&"st%#ler%!s#$zzle"!y',
+    '#"rk#&thesis!*o&mdash;he)"ie)(servants)%there#%ndash#*oslash;ren"#\'as"(-accused$%n\'-so%#dso#4called-interrogators)&revolt$)entimetre',
+    '$(onceived#(familiar%\'r-lucky\'\'unnamed$"it$$orth$$unny#*i\'ve-heard$(mportant#+lo-head-beg%$nely#$many#"na#!o$"-o',
+    '$!n#$pale#+respectable#$said$+eldom-found#(to-speak$&ypical#%vital#$when#%young"#.2d#&called#!j##the"$/3ll',
+    '#&eotvos#\'freccia##hso#&levine#&maazel%\'kzymiuk#%otaka#&pretre#.rozhdestvensky#*sawallisch#"to#(zagrosek""11#&316/f\'#!7',
+    '##929#"f2""41"!6"$:afd#\'perhaps")_a_little$$part$!t#*far_erm_as#4i_took_a_nick_out_of$!n#,on_and_so_on#*so_long_as"!a',
+    '#\'k-spray$&ing-up$#way#"le#"ng$#ian%!c#%p-art&"sh%#bag&%oiler)#ing\'$xing&%ubble%)dispenser',
+    '%$like&&ooking%&makers\'*nufacturer%)on-a-rope%&powder%$rack%$scum&&leeked\'#ick*"ed&$tars\'#yle%"up$#bar',
+    '&$x.it\'"es$$case$#ers$&flakes$$time$%works#&r-away$#ers#!s##ves"-b&ecaron;slav#\'-shaken%$tory#"90',
+    '#&bingly#0chak&mdash;mayor#*el-feldman%#man%!s$!n$%rania%#est%\'ly-clad(\'dressed%%sides$!y##han$!i#!i',
+    '%#sky$!n$#sch#"le#$omoe$"na$#tka#$raon$$etta$$inho&!o#$ukwe#!y"&c-held$$iety',
+    '$!r#/cer-ball-shaped\'*illiterate\')kickabout\'+mad-country\'$only\'&player\'\'related\')saturated($peak&+/shop-floor&%diary$&orrere#&hagota$!e',
+    '$#oux#1i&eacute;t&egrave-"es$)abilities*"y.&#le\'%1l&rehy;democratic,*expressive&!\'&!-\'&action(2id-cum-aphrodisiac(3nd-economic-factors;!-\'%based',
+    '(*lass-based)%imber(&omment)&ntract((ristiano(/um-geographical+(physical+\'spatial\')darwinism(&efence)\'mocracy."te(,ividend-type(&ynamic\'*ecological',
+    '(*ngineering(%vents\'\'fascist(\'reudian\'\'history(&unting\'*industrial\'(learning\',metaphysical(\'ovement\'/revolutionaries\'(sciences(&ervice(\'pending(&ystems',
+    '(*heoretical\',welfare-like(%orked*"ld&\'.wholes&./communicative\'%econ.(*ducational((motional(,nvironmental(%thnic\'%human\'.organisational\'\'support\'%women',
+    '&!i\'#se.)!r)!s($hays(.m-for-the-rich)!.)%/left(\'t-green*(inclined,(fluenced*\'leaning,"ft*\'realism*%style',
+    ')\'/labour**separatist+%ocial)&es-ffs)$ikou*"sk)%s.the\',zation-about("e\')"rs&3ly&rehy;conditioned(!\'(!-)%aware)&biased',
+    '*$oded+\'mmitted+)nstructed*&reated)(embedded))imprinted)&minded)*orientated))patterned)*recognised+&levant+)sponsible)&shared*)tructured),unacceptable',
+    '*2ery-much-in-demand%"ta$!e%#ias%"ly%#tes&+y&mdash\'one-#;as.$than."we(-rehy;complete\'%(ies)\'$-are((breaking(&column',
+    '(&filled((monarchy*\'rtgagee()organised(!s)%pring\'$.the\'(/culture(&estate(%sepsu\'!s\'$ws21%!y$"is$*jalisticka',
+    '(#ism$1o&ndash;political&/rehy;biological+(cultural3"ly++demographic+)technical%0-anthropological&(clinical\')ulturally&;economic-cultural-political.!s\'*ducational\'+xplanations&*geographic',
+    '&&income&&labour\'\'iterary\'&ogical&(material\'\'ilitary\'&usical&+pedagogical\',hilosophical(&ysical\')roduction."ve&(tenurial%).economic%3/psycho-linguistics',
+    '(/nomic-viewpoint%\'genesis&&rammar%#ial%!l&$ects&$ogic*#al\',!.,0/anthropological,(ly-based**o-cultural)$stic)&zation*#ing',
+    ')\'/centre%(phonetic%!s&%phere##jal&-demokratyczna&(istyczna#&k-clad%&drawer%)it-to-\'em+"em+#him%%laden&#ike%%maker',
+    '%*suspenders%\'washing$$burn$&ed-inn%)t-bayonet\'%ended\'$like\'%sadly(&tarved\'%teeth&!/&"ry&\'s-based\'!.&"ts',
+    '$#ies$"li$%nersh$(s/tights$!y#"oa#$rate\'!a&.ic-alexandrian)(critical(!s\'$stic#"sc""d\'$"em',
+    '$*the-brewer#%a-ash%%bread%1lime-permanganate*&silica%&silica&%yphon$!.$#lis&"te$$mide$#pop$)waterwala#\'busting##ded',
+    '%!t#\'en/wife$&rburgh%$lund%%talje$"yn&"ly##ger#$itic$!u%,m-dependence(.odecyl-sulfate\'$free\'#lit\'&yellow',
+    '\'\'sulphur&%azide&,deoxycholate&+picosulfate#!n#!o$$mies&#tes&#zed$!n%!e$!r#"re"%eboer#+d-sponsored',
+    '##hne#&ieties##lne#&mering$&rville#$ndre$"gi#"pi#%rjadi$$loth""f\'#(a-covers&&ushion%(lounging%%swing',
+    '$$beds$%lcone##eti##fes$&retemi#$idou$)stication$#tex$"ya#,on&iacute;as$"rt#%recom$$onis#.t&rehy;hearted*$porn',
+    ')"ed\'"ll)!s&#ite&\'ottomed&\'ristled&+ut-powerful%&centre&$lass&)ommission/!s\'-nventionalist\'$uple&#urd(#led',
+    '\'\'shioned%(drawling%&eating%(featured&&ocused*#ing\'"nt\'%oting&%urred%\'glowing&$oods&$reen\'"ip\'&ounded&%utted',
+    '&*eartedness&#ued%$iced&#ron%&jowled%$land)#ers)#ing\'!w&&eather&#ine&#ook%$mode\'#ney%$nose',
+    '&!n%&packed&\'eddling&\'lumaged&+orn-tabloid%\'rockers%&seated\'%eming\'%lling\'#rve\'!t&$hoed(%ulder-"ed&%kills',
+    '\'!x&\'peaking\'$iked\'(okenness(!t)!s&$tick%$talk)"ed&\'extured&%inted\'$ssue&+o-the-touch\'#ned%*underbelly',
+    ')(-failure&#ood$(/applied%*femininity%$hard%$pure%)something$#alk$%backs%#yte$$core$#ech%!e%$n-up&%ed-up',
+    '%)r-grained\'(sounding%!x$$font(!s$$glow%$rain)"ed$&headed$&letter&!y%5ib&commat;cs.rice.edu&"nk%-y&rehy;softly&)-carpeted',
+    '\'&shaped$\'ness.to("es&!t$#pac%\'edalled$$quad$\'service%$hell)"ed$!w%;are&mdash;library.lstrain.p)*rehy;based(+-controlled)+development',
+    ').implementation)+maintenance))real-time)(specific*&upport*)witchable*&ystems)0through-pictures)\'upgrade(&.based)#the((/systems)!x(&fabrik\'#ily',
+    '&!y%$orld$\'y-softy"(g&uuml;t##-si#\'enannte#%getti$$iest%$ness#"ht#"in#"ni$!o#)reesh\'sia#!u',
+    '$$il45&"51$!l$!n%!i#!c#"hd#%igian$!o#\'o-based%#ite$(/italian$"ni##rab#"wa',
+    '#%chiro$$itor#"de#$gnee#"l\'$+-assessment%%caked&&limate&)ontaining%\'induced\'(habiting%)landscape%&mining%(nutrient-!s',
+    '&*reparation%\'science&(tructure%\'testing%*vegetation%%water$!.%$they$$/air%-climate/water%-water/gravity$!d$#ers%"th$$ings',
+    '#"me#)re&eacute#(ssonnais$2y-sous-montmorency#%xante""ja#"er"#kal%"in##chu##ell##hta#(o&lstrok$#lac%"lo',
+    '%#ova\'"ic\'$skii&!w##rat#)ui-no-rei$#llu".l&oacute;zarno#%-dier$(eau-vent#$aino$#net%!i&!s%\'opteris',
+    '%#ums&!s$.r-cycle-length&-forcing-alone&$gain&(imperial&$mass&$pond\'\'roduced&*reflective&$type%!/&%polar%"ia&!n',
+    '()for-sparc&#um.&&zation\'"ed%&panels&&owered%!s#$berg\'!e##che$"um#\'danella&\'i-benzi%#ten&!i',
+    '$"en%&r-tags&$able&"er$#ian%/er&rehy;clients\'.-administrator)%rtist(#boy((diplomat($hero,"es)&usband/!s()in-charge',
+    '(*of-fortune()pheromone))olitician(%saint*%yings)"on)(tatesman\'(/central\'+s-come-home)*of-fortune(!.)$they($were%"um#)e-leather',
+    '%&source%&trader)#ing$#cki$#dad$#ful$-mn&rehy;faced&!-&%ified\'$sing$%nelle%#nes&"is%/t-rouen-sennely%$zara',
+    '$#ras%!i$"s.&#the%#mes%%terol$"to#-f&eacute;rino$%ainge%%taras$#ege#$hall##iac$%cates%%itin\'',
+    '\',or-advocates*&client**dishonesty))appointed)*s-executor*-/conveyancing)"to%#tor(!s$$d-as&&backed\'%odied\'\'reasted(\'ickwork&$cast',
+    ',"ed&\'for-the\'%ramed($ozen&&headed&$like&%model&*propellant&\'riffing&%solid&&timber\'"op\'$yred&$void&$wood',
+    '&$void%"ad&$rios(0ty-as-we-know-it+%based+)dominated+)sponsored%!e&"st%#ite\'"ie%)ly-argued(%based(\'grouped%!o',
+    '%#ree%)s-removal$%hull.$#jon$"kh$"lo&%quise*#ing)#zed+!s$#man%$noes$#nas%"gs$&psism\'',
+    '%"ti$&tarily\'\'y-place(!.%%icors%#on.%\'udinous$!u%!m#$lahs$%emnia%!y$&icitor)"ur%!d',
+    '$\'ner-web$"om$"um##mes#"na$%yshko#(o-anchor%&brandy%$work$\'/choral%)interlude$&chrome$%dkoff$"ff%$oson',
+    '(!e$)ist-aware\')/narrator\'!i$#mat%"ou\'#kha$"na%#ian%%nelle$%rzano$#tec$&vetsky%+iov/russian#\'padeine',
+    '+!s#!s$%kifte#,tau-luneberg$%enpur%!r$\'i/decca$!o%!n$*w&bsol;are#!u$&-tions$$able$&bilize%#les',
+    '$"is$%tion\'(#(s)()-oriented)%state($/map)$risc#!v$$ates$%e-all&$care%!g%%ncies&"do&,ero/adelaide',
+    '-#ing((mediated($spun((transfer\'%based$!i$#orn#$wise#%ymian#)zhenitzyn"&ma-ugt$"bp$"in$,li-ethiopian\'&kenyan',
+    '%"ls%"us$!p$!s$!t%!a&\'sensory%\'ochlora&%medin+"-c\'$otor&\'statine,#oma&\'trophin##ber',
+    '&"ly$$olay$"ra%&e-eyed\'\'looking\'&suited\'\'visaged\'.yet-supportive&"al&*ly-attired$"un#$chai#$dele$%omite#-e&pound;thing',
+    '$!\'%"at%"un$!-%$body%(examples%$race%)something%%thing*)-or-other%$what\'#ere&(ould-say$&.other$%/plan',
+    '%!o&#dy.(!s$$days$!e$$fin\'$$how.%#wat$"kh$!n%%thing$$oine%#ne\'\'&-fifth\'*/something',
+    '\'!s&#one$#p\'n$!r%$hill%#ses\'"t-)$born(\'/dorset&$town%*ton-rayner%*ville-1941+%arjat+%large$#sul',
+    '%*hing&mdash)!\')"-a+"nd*$bird*$for-*/not-quite-right*/or&rehy;other\'s,*-the-other*\'perhaps)#/or)\'orother)*s-or-other%"im\'*e-sidekick',
+    '%"ra%$ymes$!w%+hat&mdash\'i(,-pessimistic&)ere&mdash*\'rehy;in##ing$#val#"lo#"ma$$erby&%field&#led&$sett',
+    '&$well%!t#\'nambula)#ent)"is+"ts$"er$"ia%#fic#"oa$%cista$"ne$!s#%phong#$ycel',
+    '#!-$1et-lumi&egrave;re$7from-the-flesh-and-wood$#god$\'in-laws&#law$"la$"of&"-a($-gun)\'jackass)+kraut-bitch\',joy-division\'*maastricht()etal-pipe',
+    '$$shil\'"ne$!t#!.#*/communist$#his$$take#!a$$chan$!e$$ghen%$raph$"ld%!i$$ngol',
+    '%"si$!t%!e#$cino#*d&eacute;n$%aicus%#shi%!y$"ek%+rbehandlung\'#org&$fall&&hausen&!n$$hang',
+    '$"up$$wana#"ed$!e$!f$&nscher&$tein$$rous$!s%"ta$"to%"ti$!x#$fist$%onias',
+    '$--arrangements%$bird)!s&\'uilding%)composers+%ition\'$pies%&dances%)flighting%"ju%$like%(melodies%&owners%%perch&%hrase',
+    '&)ublishers,#ing%\'rhythms%%savvy&(ensitive&%hapes\'#eet*!s&&inging%&thrush+"es&$itle&\'reasury)%tment$#bag',
+    '%!d%#use$#hay$$line&"st$(s-baker/%#han%$mith)#ery%$pell%$trel($sses$&thrush$"ul$$wise',
+    '\'4ter-pianist-producer*(/artists+(composer+)guitarist+&singer$&y-type##ia\'$-c-searchlight%(/ciccone%%ating$#ere$$fied$$harp$%probe#"je',
+    '##let##mez#*n&oacute;0$%eborn%%illon%#man%+nblumenbild&$feld&%shein%)ratiaceae&#ies%!s%*t-settings\'\'writers&#eer',
+    '&!t$#ino$)tagsblatt#&obuoys$(chemical)$stry%$osta$%graph$&lidate$&matics$"ro$)vabitches#(phongsii##rai#"s-',
+    '$*/daughters$%ichay%!e%"ri#%tania%!s%!x$#hal%%eimer&"ll%$ofen$%inued#!u#\'voluted##wic',
+    '%#nec%#tek$)/columbia$"ou",o-boo-lar-ta#!k$#ers$$hdeo$"it#!l$!p#$mers#$n-ho%*overthrown%&sooner',
+    '+(deceased+(expanded+(familiar,&looded,,oisted-on-us+)installed+&novell+(obsolete,%pened+\'popular+)redundant-&sident-%tired+$seen,/igned-to-geffen',
+    '+)worthless(%debut)(isappear(&emerge(&mature)$erge$!.$!d%$less%!s$!e%"r-\'&arrive$$siri#%ooooo',
+    '%\'flowers&#ree%%marks%&plumed%\'smeared&%tains\'%reaks$$fall$*h-moothers&%sayes%!a%\'moother$#ies$(noshenie$\'y-black',
+    '&\'looking&%mania&%thick&&walled##uth"#pac$$tros#!h$!i%\'a-loren&!n%!c%"e-%\'sicated&!m',
+    '\'%o-pop(%cated$/o-systemmanager%$kles%$more%"ra\'#din$$romy#!i$"te#*orifically*#tor#"pa$#ier%$ness',
+    '&(sounding#)rabolzano%*intendente%"ni%%tutto%(vvivenza$*intendenti#\'uthwark"&qosoqo"&ra-ath$+nzo-piovene$#rie$!u#"ba%#nts',
+    '%"t.&+i&egrave;re$#ian%!c%#tan&-ol-containing$(o-rubber$#sic&\'l&trade#/cerer-in-charge$"ha$%ieres%!m#!d$(elloform',
+    '%"de&"ly&"um%"no$"or$$wana#\'e-burnt%(infested%&lipped%&ridden%.thumb-ski-bums$)/bleeding$"au$&footed$%iller',
+    '$%monde$*n&rehy;sen%$berg%"ti$!x#$gato$$ente$$hums##ich%"id$!n%"ne#(jusjaure\'$okka#)ley-smith',
+    '#-mani-andreani$#iou$$unen#%neone%#rs.$!s#(ochinsky$#han$!i$#kin$"no$#ral$*s-inspired$"ya$%zabal',
+    '$$tive#-rel-and-green%%ntino$"ia%!e&!d%!t$)ow-saying&#/of&$full&-ing/following$"y-&4and-lost-without-her&#cow&.for-themselves',
+    '%#ing%/sorrysorrysorry#1t&rehy;and-select$%-of-a(*wealth-tax\'!s%"to$#/as%&select$&ed-out%!x&!t$&iantur%$lega("es',
+    '$#rai#"um")s-racisme#/hardamadon/head$"it$!u#)ialistiko,!n*"sk\'$tiko$%genes#&kovets#%novyy##pan$#esa',
+    '&!o$%irate%#tae#"ro%(dihardjo##sio#&thenes$$mieu$&oyanie$%ratus##yal$#lus"#tai$#lol#"ec',
+    '#$hbey$$cott$%eby\'s)$-new%$fast%"ly%#ran&#bys&!n$#ill%!s$!o%!s#-o&rehy;grande$(-ramirez',
+    '#+sialistikou("zm#\'teville$#ile%"se\'!s$&o-voce%#ten($ente$$sass$"um#!u#"w3"#uad$!r',
+    '$$iane$\'resauts%#ier$!y#$chay%!e#%dabeh%$nese%#var$"et%#var$3ley/gloucestershire#)eid\'ahmed%!f$\'rayntie',
+    '$!y##fan$.fl&eacute/late-";d."es."my&$e-ed\'!r%"re\'!z&"ir$%ridre##ghs%\'t.these&%_with',
+    '#$hami#"il$#ssi#&k-like$"up#+l&rehy;mate*#pop$!-%)animating%&baring&&laring\'"ue&$ound\'!y%(chilling',
+    ',!s%\'damning&$eath\'"ep\'\'stroyed%$food&%riend+!s&#unk%%house%(inspired%$life($ting\'"ke%#man',
+    '&%urder%)rap-house&%eggae%)sacrifice\'(tisfying&&elling&#ick\'#zed&!o\'#und&\'tilling(%rring\'#yle%\'winning&(renching',
+    '%#hip$%anges%"ya$(cialists$!d%#ern%#ier$"ed%$mane$(fullness\'$ness$%house$#ier$&lessly&!t',
+    '$#men$$ster(!s$$tion%"on$%woman#$mmam##nd-&&a-like\'%larms\')mplifiers\')nd-vision&\'blasted\'%ooths\'+roadcasting',
+    '\'+ombinations(%ncept\'(ushioned&&design\'&ubbing&&effect\'\'quipped&&filled&\'hearted&&images\'(n-itself&\'link-up&#man\'&eaning(!n',
+    '(!x)#ing\')onitoring&!o\'"ff\'&n-film\')rientated,"ed&)particles\'$iece\'\'ortrait\')rocessing)%ducer,#ing\'%ulses',
+    '&\'segment(\'nsitive\'%ignal\'$lide\')tructures\'&ystems&*to-meaning&&visual&#web\'#ise%!.&#the%#/b/&"i/&"of',
+    '\'&icture%$base&+ite-ability&,laster/adlib-&roland%$card)!s&Aheck-hotel-gig-hotel-travel-hotel&$lips%"en&!x%%field%%games%%house%.ing&rehy;board',
+    '(\'-boards+!x)#out&"sh%(ly-based(+constructed%#pad&$osts%+s&mdash;and&%-much&#/h/&%_sort&#can($pers&$like',
+    '*!s%(tracking%%waves%!z$+guiexternal#,p&ccedil;ons$*-bowlheads%(coloured%$dish%(kitchens%%ladle&#ike%&making&*eat-cheese%#pan',
+    '$%/stew$$ault$$bowl%&rained$#can$"er$#ish$\'kitchen$"on#*r-breathed%%cream%*grapefruit*!s%\'looking%$milk',
+    '%\'tasting$%abaya$#but$!c%,e&mdash;they&!-\'(adaptive\'$base(#ook\'(critical\'%discs\'(language(#ike\'(oriented\'\'related',
+    '\'%texts\'$work&$.see&%/data\'4migration/entrapment&$:ghs$#don$"en%!t$$face$$isse$$las*$%mires$"ou%"zh',
+    '$)thernmost$%yanis#&s-bois%(entendus%*lieutenant%#sol$(cription$!e#!t$$ache%"rs$.h&rehy;eastern&)sol;south%!\'%"-a',
+    '&(directed&#eas)\'t-asian*&erlies*-ward-directed&&london&-of-the-border&(pointing(#lar&(reaching&#sea\'(outhwest&(to-north&/west/north-east*"er',
+    '&$xxxx%$/mid&%south+%-east%)all-based(\'/driver))hazelwood))navigator))worcester(!s&1m/gloucestershire\'%erica\'.pton-cherbourg,*portsmouth+!0',
+    '+!2+"ed+!s&#nts&"rd%%borne\'(und-only*,/oxfordshire&!y%&church&$ombe%%d3own&#ale&#ene%%east.',
+    '&#lla&+rly-flowing\'"n\'(&-evans)*hemisphere)\'spawned)\'trained(.125-1308.355.4($down(*er-bashers(%waste\'"st\'!y&(y.7sup18\'!s',
+    '%0gate/headteacher%%hurst%%leaze%%moore%"oe&"lt&!n%$paws&)ort-based+#orn))/ainsdale%#rey&"op(0/gloucestershire%(sea-ryde',
+    '(#man&$hall&$ider%(umbrians%$view%%waite\'*rd-bending*\'dipping*(shifting\'#ter\'"ys&*est-facing&#ich(+k/portslade\'"nd',
+    '\'(ld-based\'2od/vice-chancellor)!s$#ien$$wark#$vala$,enir-hunting)%shops("s.%%rains\'!n&"ks&#off%$stre$$iron',
+    '$$laki"%v-art#"ac$&lbarro$!n#$egna$-r&rehy;eighty%#ato&#yne%)eign-lord*%power)"s.),ty-conscious&$ygne%"ia',
+    '$&tskoye#,iet&mdash;de-#the-#was\',rehy;chinese&&-aided((ppointed*%roved(#rab\'$bloc\'+constructed\'$east(!c((thiopian\'\'finnish',
+    '\'\'gentech\'$held\'*indonesian(&ranian)#ish\'+japanese-us\'&korean\'&libyan)"ke)(thuanian\'&marked(&exican((ongolian\'%omani\'(pakistan',
+    '(&ersian(%olish()reference\'&tilted\'#uae\'\'vatican\'(yugoslav&$icus\'&sation("ed(!m\'#zed&%skogo(!y$!n',
+    '$%ttaja$(yetskaya#$khoz##pac#(remennik$*intendenza#)telexport#(yetsyaka")w-and-sow$\'gelders#!.#%/boar#!a$!n$"rd',
+    '##den##ens$,rby/inventor%#sby&,complimented%!y$$tans%!h%\'o-based#$fend##in\'##ler%!y#\'n-in-us%"up',
+    '#"re$$ness##ter$!h%%istle"#xed$"rs#$hlet#!s"\'y-based$%sauce#)a-protein$$meat$%pango%"po',
+    '##bir#"ez#$land#$ombo$"ns#&uz-mir&!t\'!m%!a%)gasexport%&pechat"!z#.ialchristliche&*demokratie&%ismus',
+    '&-wissenchaften$.ostilistischen#"zi!)p&auml;ss(\'tantike)$eren#-eacute;ciales,%fique+*ularisable#,mdash;centre))socialist#2ouml&mdash;finance.(interior.&social"(\'kochnoi',
+    '""-1#$2330#,sp-sp-speech#\'uk-conv"#/32#&e/14/4#/ps&mdash;social"!0#$4/14")1-binding##/82#$0/91#!3#!5#$6/80',
+    '##/91#"00"$5/92"$6/90"$7/89$"92"$91/3"0a&mdash;formerly*#the#*-appointed$"ce%%heque$&temple%#own##ach',
+    '$$cato$,e&mdash;time&+rehy;minded%%-aged\'"rc)!s\'!s&%black\'#oss\'%uying&&camera(%pable\'.harged-limited(#ick\'#old',
+    ')\'torting&(defining&%earth\'&conomy\'#dge&&faring\'&iction-!s\'(lavoured($ight\'&orging\'$rame&$game&(handling(#ppy',
+    '\'%ungry&\'instead(%vader&&launch&&making\'%eets-($nace\'&ission&)occupying\'!f&,per-employee\'\'inching\'%oints\'%robes&&rocket',
+    '\'&haring(#ips\'%trike&$that\'*ime-social\')ravellers-#ing&&vessel&$walk*#ing%!.%!/&\'carried&\'dumping&\'liberty',
+    '&$work%%borne%$cake)!s&%rafts%(d-window&-ancecoremusic%$fair\'$rers(#ing&#ill&&lights%%grand%\'hoppers%!k',
+    '&#ine%%plane&$orts%$rock%%saver&%uited%&wagons\'#tch\'"ys&$oman%!x$%ially%"er%$ness%(ousness.',
+    '%,man/resident$#tor##dah%"ng$)e-bearded&$iron&\'lengths&%sized\'$teel&$time%$adam%!d%+handle-back$#ona$!s',
+    '#1fford/centrepoint#$ghet\')ti-eating*#fun*(junction*$like*(strapped*&tangle*\'western(#oni%%hetti$"ni%#ole(#tta\'!i',
+    '%"um$&yrical##her$!i$!n$!t#"id$,n&mdash;pcpe%*-barcelona\'$ound&&madrid&&peseta%&.those%*/1988/cert&*usa/france',
+    '%%teach#"ky#&ladale%#tro$%dings$%enice$\'lanzani&$tion%"ed&!n&"ti$#vin#%m-can$"bo$#ish',
+    '#*n-farthing%*over-chord$&/depth$$aigh&!r$+dex-covered$\'genberg%"in%$lish%!o$"ia%#ely&!r%-schbrotlibahn&,h&rehy;style',
+    ')+dministered(%built(\'chilean)\'olonial(\'english(&french(\'looking($made(%ruled(&styled("uk\'*/classical\'"er$#ker\'!s',
+    '&(ng-clean$-nbr&uuml;cker%)erbreaker#\'r-booms%#dem$$anti%&ssidae%#xis$"bu$#c-2&\'a-likes&+compatibles*%liant&(enhanced%(/solaris',
+    '%(classic-,!s%\'engines%#kit%&lassic%&makers%\'printer%$raft%)station-2,#10s,!2\'%stion&.ystem-building,*compatible6!s',
+    '%\'tations&&staion%"us%.works/teamware$&ditura$+e&rehy;time%%-crew&&framed&\'looking&#rib)!s&/time/spare-time%*/part-time%-s/after-sales&!t',
+    '$$feld%#ord$$gens$$hawk$$inge$&k-boat&$free&#gap\')enerating&$ling&)spattered\'*uppressing%%assen%&eforde&"rs',
+    '%%falls%#ily&"ns&"sh&$t-40*$mbus%$lets%%plugs%$ster$.ling/publisher$(row-fart($hawk,!s\'!.\'$fart',
+    '\'$mead%!s$&s.this%-ely-curtained)&fitted)\'peopled)\'written%$hott%!o$(ta-hater\'(messenia&$hori&&kovtsy\'"us&)n&mdash;i',
+    '((sounding\'#ism%"en%%iatai&%vento%%okids%!s#$sibo%!c%(telnitsa$+m-scattered%&ically%&olytic+!s$%ovich',
+    '%+k-ryazanski%"of&!v$\'ticated#\'tangoid$%chett$$fall$"ha%#ias%$odus$3ial-data-processing($file(-stratigraphic\'"es\'$izes',
+    '+\'iscrete*\'related,,presentative%1o-temporal-causal0&things/#ity$$lese$!t%&erdash(#ock\'$ing.%!s$*ula-shaped\'!r\')s/palette',
+    '%!l#%venta("ti$#ins#-wning-grounds#!z$\'iergang$"zy"!b"$c-04$!1#!1#!2#$ific".d&mdash;social',
+    '$,fdp-alliance$%ruled##/al$%green#,474044.838.8#!c"/e&rehy;culating#"ad%$bury%#ing%&sheets$$k-do&$easy&/now-think-later&#ups',
+    '&+your-weight%!a&#ble%,er-agreement(%based)&laming(&choice(*evaluation(+interaction($like((oriented(\'related(*simulating((variable\'*/listeners',
+    '(&system($text\'$less\'%phone\'"s.(+/discussion)\'writers($peak&"ur%#ies&(ng&mdash(\'-canada*$lock)%tubes(&/voice',
+    '%$man.(!s%"on&"ut%%phone$(r-bearer\'$lade+!s\'$utts&(carrying&#end)!s&$hand&&length&%shaft',
+    '\'#ips\'%opped&(wielding%"es%$fish%*man-karber%&points#+c&mdash;and$)-building)!t$%ailly%%tucal$#chi%(y-ported$#fic',
+    '%#p89$"he%#ler$-ia&rehy;lised&+l-cheap-ish(#day(\'edition)%ffect(%offer(\'project(\'quality($risk(&school)&ubject(*to-theatre',
+    '\'(/central((remedial("so\'$:why\'"ed(!s\'%f.ssm\'$ibus(#lst("ng(\'sation..2/functionalisation)*ed/general)"ht)"m\'',
+    '+&taught*(/artrock+\'complex-(nsultant+&oxford*"es*$s.it((t&eacute)"y-+(oriented(&z&rehy\',ly&rehy;made)*-appointed+\'rranged*$bred',
+    '+\'ompiled,&nvened/$rted,$oked+&reated+"ut**designated*(enhanced*(favoured+(ortified*%mined-#ted**negotiated*\'painted+&ressed',
+    '*)recreated*(selected+%taged)!.\'!y&$ting%"ea&#ism&\'s&mdash-%;this\')--typical($area(.characteristic(*diagnostic()inherited',
+    '*!t(%lines(+specificity\'*/variation%%f(ix)&"ed&%ially\'1c&rehy;techniques(&-issue)&lesson)*to-general)2volume-temperature((.problem(%ally--%bound',
+    ')#tio,,n/appearance.(drawings("ed(%ially\',ed&mdash;two)"ly\'$ties%&men(s)(!+)&faecal)/krebs-henseleit(\'-hunter(\'=150000("s.',
+    '%$osus&$usly($ness$\'k-sized%\'lefaced\'"ss&$ings%#man$*mark-rated("92$#ola$-rate&mdash;fp$%saver)!s$#tac',
+    '*&making*$rims\'$olor\'%tular,"ly\'*u&rehy;lar("la*)r-looking+\'isation-!t&%sonic&&tators\'"ed\'-or-unfriendly))/consumer',
+    ')#ial\'$ular&$ular%"ed%,ofluorometry&%graph&*photometer&\'r/young\'!s%&raline\'\'physics&\'e-hound($like&-o-microscopes(*photometer',
+    '\'&graphy\'&meter.\'#nic\'%photo\'*radiometer\'+scopically.+"y.&*um-shaping)!x(!.(!s%!s%\'ulative$$ualr%&larity',
+    ')#ve.+$ness(#rix#$dale$!d%$ings$$ilec#0ech&rehy;delayed&!\'&*+facsimile&\'-action($ware\'+become-song\'+communities/!y',
+    '\'(exchange/!s\'%forms\'&habits\'*impediment\'%maker\'(oriented\'*processing*\'duction\'+recognition)%lated(%hythm\')shadowing(%ounds(%tyles',
+    '(*ynthesiser\'\'waivers(%riter-)-in-chief&%.this&!/\'%drama\'(language&#day&!e\'"s.&#lis&(reading/.+lip-reading&\'writing',
+    '%%(2.8)&"s)%&-boats\'#ump*!s($rned&%chess)$wing\')ontrolled&%depth\'\'oubling&(freaking\'&uelled&#gun&$king',
+    '\'\'earning\'\'imiting\'$over&%meter&$neck&(obsessed\'\'f-light)&reflex&\'playing&\'reading(\'duction()striction&&skater\'%table)$rved',
+    '\'\'he-plow($rash\'%racks)"ps\'#ype%$.com&)dependent%&/\'flu\'&#low&+memory/swap&%quite&#she\'%trach%)_relative%%balls',
+    '\'!r&+oat-driving&$rake%$core&$raft%$disk%!f&%ormat%#in\'\'$g_up&"sk%$lace&!e&$ines%&master',
+    '%$s-as&).trailing&#oft&#tar%\'testing&#win%#ups%%wagon\'"re\'#tch&#ise&#ork$#ech%"ed$&geless',
+    '$%lling%#osh$!n%,hamland-like$#red%!s%!y$$ting#!f##ght#%icher&"im$#fic$#gel$#ran',
+    '%!s$\'khogger$\'ulation#$laea$&dhurst$\'eo-club$#ius$-l&rehy;making%$-out&)retention\'%idden&\'weaving%"ar%(bounding%&ed-out',
+    '%#in\'\'&g-bees*$ooks)(checkers*(orrector)#out)(reformer(!.(%/typo%%mount%!o%&singer$"ng$-t&rehy;column%#_as',
+    '$$ucin%%nkers#"me#(nce/rosy&"an&%field&"r-(&devlin(%jones(&nairns\'!/(%holly((property\'%field\'#ism',
+    '%#ius$(d-thrift%!.%\'/invest%"_a%!e&!d&\'r-payne&"th%)ing-brief)$cuts))divisions),implications)#led(!s',
+    '%$love%#our%#s_a%!t$$etic$!g%&lerian$$ista$,nymoor-based$$sley%"on$&t-fuel&"up%+_in_pursuit$!z',
+    '%#sti%#vit$&chieus$"et$\'gularia$(imentale$)m-and-egg&\'bearing&%count&%whale%!.%$/egg%&atheca\'&ogonia)#ram',
+    '%"ed%"ia&$dine&#est&&nator.%!y$$omak$\'rinview&!t%$ysun$#ten#0ssartine-bearing#$tsai%&opoula#\'wed-out',
+    '##yed$!r#(zialhaus"#f13#!5#!6""gw"!h#+aeroceridae#&ecodes$-eris-directed$%noid/("al&*phylloides\'!s',
+    '$#re\'&"s.%%icism&$lene&#pol%\'oidally("s.&#mak$$ttos$!x#\'i-pvuii$*ncter-like)&otomes\'"re%#gid',
+    '%&x-head#&odrias&"on#-ygmomanometry"(i-ra-lis&%r-lis$(squeezer#%catum\'!s$&e-rack\'#ich($dden&\'sellers&%trade*#ing',
+    '%"ry$%heren\'(nstrasse$$iest%$ness$#ken&%rmann\')nell/cpre$!s$$ular\'$tion&!e&\'ocaulus#(der-gems\'&legged',
+    '((ightning\'&shaped(#ilk\'&tattoo-"ed&&bridge&"ed&$face&#ish&$land\'#ike(#ngs&"ma&#net&\'streams',
+    '&#tcp\'#own&&webbed\'$oman#!e$&gelers\'!s%$lers$(lbergian%#man$,r/ex-refugee%#in\'$+ss-jaenicke#"ff%#in\'',
+    '*#ing$#ire#\'gelgass&#man)!n$#gie%"ot$$ulin#!i#(ke-heads(#els&$like&&nailed&%plate\'$roof',
+    '&*shouldered\'&kinned%$/bar%$lets%$sley%(y-haired$(y-headed&&leaved#\'lanthes$$ette$!i%"ng%!o$(ling-out%%over\'',
+    '$"sy#+n&ndash;off$(-&frac12%\'allowed%&doctor%)forbidden%$off\'%\'related%$spin%(trapping\'$ials%#ups%(weighted$\'abifida%\'ch-dark',
+    '(\'risotto%+lly-injured&$onga%#tus$#ces%#ter(!s$\'derella%$izzy%\'le-back(*disrupting(#leg(&shanks)%panks\'!d',
+    '\'"rs("uv\'&winter&%iness$)e-bending&\'snapper+#ing\')tretching&)thrilling\'\'inglers+%ingly($pped\'#oad(%othed%!.',
+    '*#ing%(lets-low&#lis%&scence&%heath%)t-playing&\'ingling&"te\'\'i/jacob$&gleage$$ical$\'nakered%$eret&$ycot%#in\'',
+    '((-machine)$rods+#oms)$tops("ly%$rade%"ys$\'obulbar%#ffs%"it%!s&"is%"zi\'"st$)ster-like',
+    '("ly(!y$%turns$%ulosa$&writer#\'onwagen#%raeas%%flite%"l-\')patterned\'%wound(&rapped&!e%%nthes%#tes',
+    '$(e-capped%!a%$ites%$less\'!t%!r%*s.whatever$!i%%donov%#fer%"ng%.t&rehy;animals,&filled&!\'&#-93',
+    ',!s)(hind-the)#ing\'\'centred\'%flesh\'%guide\'$lamp+!s\'$meat\'&object\'&person(%owers\'\'raising)%pping(*efractions',
+    '\'$that)"is&%/soul&!e\'%d-off\'"rs&\'ing-out\'"st)!s\'$tual&&lessly&#oso\'"us&$ual\')*-aesthetic',
+    '*(t&eacute+-y&rehy;ometer*"ze)/ly&mdash;minded+&-based,&secure\'#eux$(ochaete.\'&etosis%$gram&#yra%%light%!v$!s$#tle',
+    '%!u$%uline%&roidea)!s##ser$"ok$)sk&eacute#%t-boy%+in-your-eye%%level%(roasting%&shower$!/$1aldfields-weavers&&flelds',
+    '\'"of$(e-filled&$rays%!d%!s$1fire/mustang/p-38%"ul$(hrobates$&ophage$"ta&&lfield\'\'ridding%"el\'&market%"in',
+    '(\'licking$%zhoff#$vack$-ey/consultant$$very%#ier#&xworth"!j""kk"*l&uuml;gen#+/db/wattage#&a-held$"ng$*sh&rehy;in,%proof',
+    '()ubricated\'"on\'\'pattern($roof&)back-come&$down&#ers&#ily\'#ngs&$land&#out&(proofing$,t&rehy;tered%!t&"ed',
+    '($fest$(y-legged#"ch#4een&gt;liver&gt;bone&%-rock\'\'venting&$wort$&ndeurs&*id-looking)%there(!a(!o\'%ssimo&$ored%)ectomised',
+    '%#ius%&ocytes$"tt#!i$&ced-up&&osomes%(ing-tape$(ffed-out)"up$(ne.curve&!d%!g%!k%$tage&\'er-thin',
+    '$-t&rehy;second%&-anode\'"ss&$beam&\'capital\'%harge&\'diamond&$fold&+personality&$rail&&saddle&$vote)#ing%*/splitless%(ting-off',
+    ')!.\'"st&!y#/odgenessabounds\'!r%!s$#osh\'"ed$$shes&!y$$tchy#!t#$unch$%rched\'!y',
+    '&#ing$!s$%ttery""mg""o1#!=#\'czynska#$erry#$ffer#!i$&l-tips%$able&$tion%$beds%\'ed-brat',
+    '%/ing-for-a-fight%(t-rotten&"er&"ly#!k$&e-arms&$like&$with%$less%$n-of\'&worder(&ritten%%s-man\'&people&$bear',
+    '&%haved)#ing&+man-in-song)!.)!0)$ship&%owman&(persons.&%thing&!w%%woman$#ing$$sman$"us#$lier',
+    '%!t$#sky#0n&rehy;taneously$#dai&\'lopathy%"ey%&oolies)"ks%!s%&ulicks(!x\'"os%#ylo()arthritis$)ge-divers',
+    '\'&eating\'\'fishing\'\'painted\'&rubber&#bag&$cake&$down&#ing&$like&"s.%.iform-infected%\'y-brain$#lee$"ne$\'s-a-tee',
+    '*$fast*%talks))/seconded\'$hsip\'"s.$/taneous-looking+)ly-seeded-!.#%ofery%)s/dummies$.k-in-residence%&ed-out&!e%#ier$$l-up',
+    '$-n&rehy;backed+#fed%(-bending&$feed*!s\'#ull&&handle&$like&&player&%sized%%/fork%\'benders%\'carving%!e&*r/families',
+    '\'#ism(#zed%$feed)#ing)!s%#in\'&#sts%#ley%$sful$%okeee$(r/parent#!r$"ck$)e-bearing&)producing',
+    '$#ine$!n%"ed$&ocarps$&ranful$*t&rehy;ing%#\'92%.-entertainment&&minded&\'related&$shop&\'watches%!.%$/fun&%hobby',
+    '%#aid&&torium%"ex%$huis%$iest&"fs&"ly&"n\'\'#ess\'*g&rehy;dog.(trophies(%-wise($ness%%kulur%!l',
+    '%\'pension%#s**(!*&!-\'\'channel(\'limbers(#oat($razy)#owd\'#day\'$fans\'%goods\'(inspired\'\'jackets\'&loving',
+    '\'&people\'$shoe($tyle\'\'thought\'\'utility\'$wear(%inner(&riters&./entertainment\'+performance\'\'utility&#bag&&caster,!s\'#ene',
+    '\'#oat&%drome&$folk&$gear&#hop&\'jackets&$mans\'\'edicine("nt\'&obiles&\'persons&$ters&%watch\'$orks%$wear',
+    '%)y-looking$%ulate#%sarsi#"t-%!1%!2%\'causing&\'hecking*!s&$lean&$ream&$ycle%$free%!i&)nspection',
+    ')!s&#nee%(lighting*!s\'%sting%&prices)#ing%\'the-eye)&sexism*#tar("re%$weld)#ing&$oven%%yield',
+    '$\'dancing$"ik%%swood$$kick$)lights_of&"ne$#man$"s-$*ted-billed(&leafed(%sided%1ing-the-influence%!s%(y-bummed#&usally',
+    '&!.&!/&%hoods&!n&$ssee$#ter\'!s%$gill%%house%)ing-clubs#!x##yce"$pedy"$r(s)#%/ssrs',
+    '$-chgef&uuml;hl\'%renze&#len$$gged&"on%!s%#uea$%inin\'%"re$&tlings%\'t-to-be&3on/northamptonshire$#uts$=wiedliwose-postep-demokratcja%$lin\'',
+    '$\'y-blind&$damp\'#eck\'%rying&#fix)"ed&%happy&"in&$jobs&\'killers&(lashings&$snow*"ed&$tank%$bars',
+    '%%decks&$rift%+er/spreader%$head&$oods%#in\'%#man&$ount%%paint*#ers*#ing%"s.#\'distmax#8ead-\'em-against-the-wall\'%armed',
+    '\'"on\'$shot&$able&-eagle-painted*#ing&%hseet&"in(%g-out)!s&+sheet&trade+&-based,$type+!.+)/charting+!y',
+    '$$chan&"er%$kels&#ley$"ed&%sheet%!t$%itzer$"ng$!o$*sso-presso#)ig-marked%$gily\'"ng(#ids',
+    '()y-looking)!s$$klin$#lib$!n%0g&mdash;cleaning&!-\'(assisted\'$bead($lade)&ooming(%oards)"rn(%utton\'\'cleaned',
+    '\'&flower\'%grass)#own\'%hares(&eading)"el\'&knives\'$leaf($ined(#oad+#ing\')mechanism\'%onion\'$rain(&elease',
+    '\'\'scented(%owing($teel\'$tabs((ensioned(&idy-up\'%water&(/contact&%aleak\'!n\'"te&/bank/cheltenham\'*ok-wallaby&"en\'(r-verlag',
+    '(&/house\'"th(%t/the&,fields-based&%heads\'#olm&#ily&%lakes\'!e\'#ine\'!o($aded&&makers&$s(3)\'!/',
+    '\'0teen-goes-broody,%style,#the&$tail\'%horpe\'&ipping%#ker&%lered%&t-stop&$link&$mail&#net%#zen$%rited$&t\'sail',
+    '%#ual%$zing&!y$$vers#!l#\'ocketed$#ggs%$lets$#nck%!g&!e\'!l&!s%#sen$$otin',
+    '%"ts$$uche%#lls%$ston%"ty$%wston$$xton#"s/#)uce-green\'"up&"ly&$ness&!r%\'hbecher&!e',
+    '$%gnoli$"it$)ng-loaded\'%stage\'\'wheeled##yer$(ngabedde"1s&mdash;socialist#"s-%!x$!/""tc#%ifire"(ud&mdash$!\'',
+    '%&u-hate$$ding#$ggie#!i$!n%!g$&straat#+me-streaked&\'whipped#(n-bonded%&column%%metal%#off&)ut-of-air%$silk',
+    '$\'drawers$$ging$&k.gave%#ers%"ie\'!r&"ng%!o#&omancy#/r-of=the-moment\'*the-moment%&pruned%\'thighed%&winged$*/greenways',
+    '$"en%"tt$,geon\'s/oasis$"ia%\'ousness$%lings$#rey%\'iergate&"te%!y$\'s-leeds%(/everton&$jews$#ter%&highed',
+    '#"te$$knit$%nik-i$\'terings"$vsrs"!w#%cious"$x-90&!0\'!s#$1000#"90",y&mdash;like#0-action-hardware$(cartoons',
+    '$&hiring$&in-the(\'raining$&master$&phobia%$lane$\'running$&school$\'writers##cer$&halski$$raft#$dell#!e$!r',
+    '$!s#%holes##in\'#"ra$$idon%#tes##sat##vee!&q-3000#"ft#"rd"$._cm$#ins$#kms$&metres',
+    '%#ms.$#yd.&!s\'!.#"f.##km.#%miles""1v"$_ft."$auds"%d.ldr#"rn"&eaking$(mishness#"ed',
+    '"1l&dollar;database#$*c++%&onnect$#dba$#net#"++#$-and$\'connect$)retriever#$/api#"92#\'windows"!m""n.#$/ass',
+    '""rt""ua$#cco$%d-car&%mates%%/west%$ders&#ie\'%"gy%"ra&!o\'"ms\'(n-leader$"ir$%lidly',
+    '%(l-smokes&"ed&#ish%*odelphidae\'\'ontidae,!s&"r.&"ur$(mipinnis%)ocellular&#sal$&nderer$$rane%(e-backed)$lled',
+    '*#hed(%odied)#ned($uilt((y-square\'\'chinned\'&drives+#ing)#ove\'\'flanked(#oot\'\'lattice(%eaded(%ipped\'&palmed',
+    '(#lan*"te((yramidal\'&rigger(&ooting\'#set($ided(&kulled(&labbed\'%tails((o-square\'"up\'$wall(#ell&%/back',
+    '&$case&$d-up&&headed*!s&$line&(r-tailed&"st(#air&$wave%"ic%$king%#son$)sh-makers\'\'rackets&$ball',
+    '\'!r&#in\'$*t-dwellers&&thrust&#urn)!s%1/standup/mae-geri%%mates%&ted-in\'$rdom(%vilie&#ors%%world$%wkers%#led',
+    '#!e$#ak\'&#ers&$iest\'$ngly&\'y/husky%(l-turned&%ingly)!s$%edged%+gee-suction%#ked\'"rs%!l%-ze-into-a-car',
+    '("up\'$d-in)#out\'"rs\'!y&"in($g-in&(y-mopped&$zzzz$(lch-like\'$iest("ly("n\'$"re%\'r-slice',
+    '#!i$%bbing$%d-ink&#one%$dlys%$gier\'"ng$&ggling\'%y-hip$#lla&#ion)!s$!n%$nied%)t-through',
+    '$)re-bishop\')dominated&%archs&"en%&mingly&&worthy&!y%(rel-eyes)%sized(#ing(!y%)t-by-puff\'$tech&$ings$&shball',
+    '(!g$%tbrit%!s%#ted\'"rs#"ot##per!*r&ograve;n"#-16##71s##800#)dominated"#.n4%!s#%prime',
+    '""13"#25o"\'498,000"+520,000,000"\'753,000",844,8000,000#)7,000,000""91#*72,200,000"\'=0.1194"$affa##m-2$"ek$#ik4##tch',
+    '""c-$+transformed#-.doc.ic.ac.uk##28c#!h"#d-x#"an#!j"+ebrenikovic#$dets#&ekumar$!t#$mski#%tensk$"ko',
+    '"(i-lankan#%bbine#%cam-3##dah$%haran#(harikota#%muang#1nagar&ndash;delhi(&-jammu(!s$%ghill$$ivas(!a##pen%(rumpudur',
+    '$!a#"ti#&vastva"$m981%!7#%uc-18#!w",n&ccaron;iho#!1""oc#!n#"ud$"fe#!w"!p',
+    '##ska%!e%!o"!r#&na/45s&#dna""sc#!f"&tanded"(u/adidas#%darra#!l"&v-2000!$s-13%!s',
+    '$!6$!7%!s$"8s$!9%!s##20j$!3$!5##300#!a#!b#%nx-20##ruc#*sd-gestapo',
+    '#"ux"&.10(1)$!4%#(4)$$5(1)#"20$,21&ndash;222$$5(7)$!6#"31$,24&ndash;328$!8#$4(1)%"2)$,59&ndash;461',
+    '$!8#!5#"61$$5(8)#%76(2)#+92&ndash;99#!l"%/2331##ruc""10$)&ndash;30+"41$#(1)#*3&mdash;14$!5',
+    '$)&mdash;21$#(2)$+2&mdash;157#!5$+2&mdash;160$+8&mdash;171$+9&mdash;161#,64&mdash;166%!a#*7&mdash;19#!8#,98&mdash;220"*2&mdash;15*!5##(2)',
+    '$!1$!8$!s#!2$!2#!4$)&mdash;28$#(7)#!9"+31&mdash;32#!2#"38#"48#!5$!4',
+    '#*9&mdash;40"!4##(1)$"3)$"4)&&&mdash$"5)$"8)$"9)#$1(1)#"21$+8&mdash;430#!4"%50,51"%6,453',
+    '#,60&mdash;689#!7$+1&mdash;682$!2$!7#%81(4)""71#"36#$4(3)#,65&mdash;767"*82&mdash;7#%39(7)#%6,012#*7&mdash;96"$9(1)',
+    '#!9"#afs#"me$#ois##p16$!3$!8#"ss""c/$\'0.1%sds#"=3#"ms"$d650#!c#/p&mdash;finnish',
+    '#"s."*e-trending#%b/snl$#ana""gc"$home"%i/rha$$swsg$"us#!p#"ss"!k"#l-1#!2#)istreqmax',
+    '\'&timout&)workspace"#max#"in"!n##-21")on-in-law"$p(l)#$1(e)%"t)#!i#!p")r/highest$#spr#(c-funded',
+    '"$sala%(utations#\'chalala#(eductive$!e#$hhhh#$leep#&omeone#&pecial$$lash%&llcchh#!r#"sa$"hh&!h',
+    '$#shh%\'sisster&$ssss*)seventeen+!s#$take$\'rongest$&uffing#&uppose)!d""ta#"or"!w"$ylka!+t&aacute;0n',
+    '(&ndchen(#rke#*eacute;les#$lsqb#\'ndash;1)!4)!6#2oacute;ragj&aacute$\'uml;ckl("re#\'pound;e#8rcaron&iacute;brn&aacute)-;eleck&yacute#(uuml;mer(#rme',
+    '"/-&eacute;milion#\'\'st-\'st#%02-3x#$1000#!2##400#,beno&icirc;t/*-sur-loire#&castor#$gall$+ermain-des-/$pres#0hilaire-le-grand$%ubert#(i-i-n-ng',
+    '$#ohn#8l&eacute;onard-de-noblat#$marc\'%ellin$%edard$%ichel$%oritz#&orages#3paul-trois-chateaux$$eter$(hilibert$/ierre-de-granon,\'s-corps)!s#$remi',
+    '#&tropez#!v").-stephen#"12#&albans$%ndrew#$bart$#ede$$ride#%clair#4dunstans-in-the-west#&edmund#&george)!s#&helens',
+    '##loe$$ucia#(margaret#%neots#"p.$#aul#\'trinian#\'vincent"(/wapping"!1#!0##401#*8301/11med"!4"!7',
+    '")a-tistics#"=3#"ak$"rt$!t%&kundig%&liches%!s&$burg&&denken&,en&rehy;walt&,gem&auml;lde2*sammlungen).aldesammlungen(-richtsbarkeit',
+    '\'0icherheitsdienst&-vertr&auml;ge)\'waltung#(b-wounds$%/st.g$"bd%%ed.am&%rs-in%!s%!y$"ia&!n%)lisation\'\'-ty-indicating)./compatibility',
+    '&!o\'(/arguati%!n$#le\'&!-\'$boys\'\'chronic(\'leaning()ompanions\'(dwelling(&ynamic\'&garage\'&keeper)"pt\'%place',
+    '\'&wicket&)/unstable&$boys&$hand*!s&!n&-s&mdash;which\'*-converted*%ttage\'!.\'$peed%%ilise&#sed&"ty%,y-integrated',
+    '#&ccatto%$ioli$)ey-cripps$!h%"an%!e%&iewicz%+yo&iuml;des$$k\'em%\'-heeled&\'systems%#age&*vrallachan%%field%$heel',
+    '%*ing-cranes(!s%&ometer%$room%%yards$%oners$%poole)(/british$#yes#&dacona$.dajakkstugorna%"en%"le\'!s$%ecker',
+    '%!s%!x$\'hampton+,/oxfordshire&"us%&ouders$!i%"ng%"on\'%plein%(um-based(\'fillers(%style\'&/metal()stokowski',
+    '$$rill$*t-anzeiger&\'theater%+b&auml;umer&#ahn\'"nk%*geschichte%%hagen\'#lle%%moers%&palais%$roda%(sgalerie&/sekret&auml;rin%$teil',
+    '#!e$%chlin$\'dtmores$&l-like$"rk%!t#1ff&rehy;australia%"\'/%((stavka)%*-appraisal&\'captain\'&ontact*&rolled\'+um-students&\'finding',
+    '&%nurse&(officers&\'related\'$ooms&(sergeant\'\'hedding\'&urgeon&(to-staff\'%utors%\'/client&$edit&(industry&"or&\'patient&%sales',
+    '%(:student%.elkapit&auml;n\'!n%$have&#ill&$orst%!i&#eld&*n/quiraing\'\'g-level(!.(!/%/ord&ndash;rugby(&-based(*/solicitor',
+    '-&/south-!s)#ire($ware%\'s-worcs&(/malvern%,ware-derived&#ork)#ing%!y$)iordshire%!x$#ord&!t#(g-beetle',
+    '%&headed&%ounds%%party%#toe$\'/cupids$.e&rehy;managed%!\'&(n\'studio%(-belgian&&centre\'\'oaching(%ughed\'$raft\'\'urtains&&damage',
+    '\'(irection("ve*!s&\'effects&$flat(#oor\'$ront&&lights("ke(!t&#mad(%nages&*orientated&#pit\'$lays',
+    '&(sampling\'&cenery\'&etting\'#how\'\'outhern\'\'pecific&#the&&usable&%wagon\'#ise%%.mike%%/page&%third&#was%#d-a',
+    '&$ived)!r)!s&*oor-keeper%!e%#ing&"sm%&lights\'"ne&$oach%&master%!n%$play%\'s/steps&#how',
+    '&#ide%$wear&#ise&#ork$/flation-induced+#ary$.gered/flexible(!r\'\'ingness\'!y%!y$&hounds$#ily%,ng&rehy;post1!s',
+    '%#sti$%nance&#tes\'$ilis%#one##hle%$helm%#man$!r#!i$)d-looking$#end$#ght\'"en\'\'forward',
+    '%!s$"n-&)absorbing&(fighting(&nished&%proof&\'remover(\'tardant%,/ninety-five&\'varnish%$bank%&cliffe("ne%$dale%!e',
+    '(\'looking(#oak&&s/nine%$ing.&%slaus%/less&rehy;steel)\'/kelham%%salts$+r&rehy;ways%%-nose&%wells\'$ires%$acse%)case-like)#_in',
+    '%$gate)!s%%heads\'"id%&master%*s/aquarius\')freelance&#ide%$way.("ed$+t/assistant%"es%"hs%"on##ke-',
+    '&,in-the-heart&$outs%$boat%%d-out%/holder-analysis("es%#out%+r/executive&!s$)hanovites%"ov$#in\'%&sville$#ker$"oo',
+    '#!l$+actite-like%"gs$"ch$+e&rehy;mate%)-breathed&\'tobacco%"st%*y-inspired$&in-era\'&gothic\'&hitler&%brass&$ised(!h',
+    '(+t-dominated*#era*%style&&vastae%!s&%field%$ynas&#ski$"k\'%*-and-slash&)extension&$like%#er*\'(-sampson%"s.',
+    '$*l&rehy;ing%\'-keeper&$like&%sites&\'walking%%/spin%#age%)ed-career%&ibrass&!n\'$gton&)on-leader%&keeper%)one-esque%"s.',
+    '%&ybrass$$wood&#rth$#yns#%matis$%bolis$&enless$+ford-bewlay($ians$*ina-packed\'!s\'"te&$odes$\'merings\'$less',
+    '%"on%%tafel$#nos$,p-collectors&$duty&$mill%$able%)e-gilbert&$d-in("on\'#in\'&!n&#ria&!s&!x',
+    '%#has%+ing-grounds%$less#/n&rehy;dardized$!\'$&-dards$\'aformed%\'ge-size$"ch&$eons&\'ion-gun%$liff%#zak$.d&rehy;mounted&(uacute;n',
+    '&$ball\'/y-my-principles&&collar&\'holders&\'mounted&"on&&points%#.it%$/sit%!a&$bout&"ge&!r\'.d&mdash;basket)+ndash;class',
+    '(!\'(!-)#and)*conformant)$dose)&format)$lamp*#ike)$play*#ole)$rate*)epertoire)&setter*$tate+#yle',
+    '*#ype)$wise().security(\'_as_far(&bearer(%class(#ish)!z*&ations($less(+s&mdash;has)*-compliant,(nformant*(friendly*#led',
+    '0!s.#ing)-/registration\'$ised%)by-credit%"ed\'"ge&!e&\'n/newly&!p&!r\'\'-around\'!s(#-by\'$wick',
+    '\'$aint($mter%$fast&$irst&#ord)%-tuck%$gate%$half%&ing-by)*committees)#lug)$only*"ut)$pool+#sts',
+    '-%-only)"to)"up(%/dean).kneeling/lying&2sh/gloucestershire&"th%*offishness&#uts%$s-by\'$side&#ing&!t\'#ead$#eke',
+    '$$fill%%ord\'s(%-tuck$$gled&%maier%"or%%round%!s$#hoe&#pea($inae&!w$!i%2forth/agricultural%%k/vet',
+    '%&ngford%(slavkian(#wow)#ski&&zewska$"ka%%evich%$ovic%!s$)ley-knife\'%/film(*gloucester2%shire\'%ville%!y',
+    '$$nage&$ries%"er&!y%#ier&&ferous&\'ngfield%"um$\'oikovic%"je&%kovic%!v&"ac&"oi%#zol',
+    '&&uriana%$hall%"ki&!y%$stad%1ted&ndash;chicago(!s$"te%%ially&#bus&"on%*on/anthony\'!s$\'wardine&\'y-based',
+    '%,yck-starring$#yan%$dale$\'za-form\'\'linking&"ic#$pele%!s$#fii$(henandra%$orst%&ylinid\')ococcocus$)le-gunned\'"is',
+    '\'%marks&%/nail&*d-together&$fore&\'s-brown\'&/royal&-ton/co-driver$$ness$!p%#ell$%ylton#"r%%"ed$:&ouml;m&ecaron;stsk&eacute%*rehy;jumps',
+    '$(\'-martin$$-100%%beads&#ird("th&%right\'$oken%\'chamber&%locks\'%uster&(onscious\'\'rridors&\'ruising%%dance&%usted',
+    '\'&dorsed%!f&(astening&$ield\'%gures\'"le\'"sh&#orm)%ation&$rost%%gazer&%razer\'&ooming%%heavy%-in-the-making',
+    '%&launch+#ing%%mists%$name&(ext-door%(oriented%)patterned&%itted&&ointed&&rinted\'&oducer%&shapes\'#ell*!s\'&ipping',
+    '(!w&$lave&\'peckled\'&lashed\'%otter\'"un&(trangled($iker&&ystems%&tanned&%ravel\'#imm&#ype%(vaulting&#oid',
+    '\'$shed$$.exe%(observer$%/folk%(software$$avia%"ya$$bank&"se%#eam%$lade%&reaker$\'catcher%\'h-based((ranching',
+    '\'\'reduced)%fined&&/flour&$arts&#ers&$mill%#ils%$ross&&uisers$+dom-without%%uster*!s$\'e-downs&&threat%!.',
+    '%$d-at\'$down&#_at%!r%$sses%"tz$*f&mdash;er%%arers%%ields&$shed%#lex%$orce$$girl%%lider%$race',
+    '%"ke%\'ng-eyed$)k-staring%%adder%0ey/leader/oxford%+ie/national&$ller&!s%"ov%"sy%\'weather$$lab2&"ke&!n%\'essness',
+    '&#ner(!s\'\'g-sized\'!k$"na%!s$(obinskia%%dubov%#sta%%zhily$&pitted%$oint$(r-weiner%%/neil%#ed.',
+    '&"tt%%iness%!s$(s\'n\'bars%\'-unseen%$cape%#hot%%plash&#ots%&tation&%udded$(t-border&#cue)!s&&dodman',
+    '&&finish\'"or)$ward&"ii&#not&#off&&shaped&)to-finish)$stop&#up.()/shutdown&$work&1your-own-business%%.stop%$/end',
+    '%%board%(ed-first("up\'".a("he\'$/got(\'stopped&$gies&"r-($home(&motors((stunters%#ime&#ng-)%block',
+    ')#gun)$line)$post)&square)$time-!s)"up((/leaving()s-to-work%\'ouchers%%point%$rite%$s-up&$heet&#ite',
+    '%+up/shutdown$!v%*ation-diet+%while*!s%"e\'&#all&(d-priest&#ing&"rs%$ing.$%woman&#rks\'!t$!y',
+    '%!l#!s$)i-related%%s-box*"es\'%cases%"um$%oggia$!s%$inos$(zkiewicz#$t(s)$#-us$$able%!l',
+    '$(dtheater$8e&mdash;changed&mdash;on,"in,%those&%ndash&-rehy;employed+%ments+*sanctioned,&chools,(ocialist%$-1.5&-as&rehy;actor(&sembly&%based&&caused',
+    '+$ists\'(hartered(#eck\'*itizenship(#vil\'+ommissioned(%ntrol(\'rporate\'\'reation&\'defined\'(ominated&(educated,#ion\'\'mployed\')ntrenched',
+    '\'#orm*#ing\'&unding&)geography&%house&*individual(\'itiated(,terest-group\'%stics&$less\'\'icenced\'$ocal&\'managed(%sonry&"of',
+    ')%siege),the&rehy;art,#art\')r-the-art(&dained(#gan((ientated,"ed&(planning\'&rivate(&oduced&\'railway\')ecognised((gistered(%lated',
+    '\'%un7.3&*sanctioned\'*ponsorship\'$tyle\')ubsidised-#zed(%pport&&trusts&$ub40&(war-navy\'-ithin-a-state&$xxxx%!.&"31%!/',
+    '&%local%(centrism%0d&mdash;probably&&/imply%#gic%$inyi%#man($ship&"en(&t-kind*#the)!.*#but)*/print-out)#_in',
+    '*#.if*,_on_the_part%#nsk%,s&mdash;that-&united&!*&+-as-suitors\'&canada()haperoned\')dominated\'(educated\'(financed(%unded\'(inspired\'%japan',
+    '\'*portuguese\'(subjects)&pplied\'.within-a-state&!.\'\'victims&$/80%&#led&*man-leader)&liness*!y&&person%%watch%$xact$(graphics',
+    '%!r$!i%&c-free\'$like&"al&#ity%!l%#on\'\'!-(%agent)"ny((builders-$ings(%forms(\'golders',
+    '(\'keeping(*leamington(*stonehenge(*to-station($yard\'%.they\'#/m4)\'inimart\'#air("nd($rity\'"s/)(airports)"we(#ide',
+    '%"ra%/sm-collectivism&$tcal(!s\'1ic&rehy;producing)\'-faking),ally-derived.Uimprobable-in-a-direction-specified-without-hindsight.&remote)#ial)!o)*s-and-dice+)gathering**/computing+\'figures',
+    '\'!s%"um$%kraft$"lt$$ment%"ux$,o&mdash;ffss%+il-operated%%matic%"rs%!s$#pak$%sraad$#tel&"rs',
+    '&#ry.%\'e-alarm\'$base+!s\')reliquary\'%still&&squely%&s&lt;3\'+rehy;though&+-conferring**sciousness\'(defining\'(embedded((nhancing\'&groups',
+    '(%ungry\'&labels(#ess)$vels!/wiftly-flashing',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_56 = (
+count_56 = 6694
+
+heads_56 = (
     'seshen',
-    'sesia',
-    'sesit',
-    'seslice',
-    'sesljan',
-    'sesm',
-    'sesok',
-    'sesques',
-    'sesquicentenaries',
-    'sesquiplane',
-    'sess.',
-    'sessa',
-    'sessarago',
-    'sessay',
-    'sessex',
-    'sessey',
     'sessiliflora',
-    'sessilijlorum',
-    'session&mdash',
-    'session-appointed',
-    'session-wise',
-    'session_so',
-    'sessioneers',
-    'sessionmaster',
-    'sessionsfor',
-    'sesslagh',
-    'sesso',
-    'sesterce',
-    'set&mdash;environment',
-    'set&mdash;imagine',
-    'set&rehy;backs',
-    'set\'',
     'set-aside.',
-    'set-behaviour',
-    'set-changing',
-    'set-dancing',
-    'set-designer',
-    'set-fast',
-    'set-forward',
-    'set-ideas',
-    'set-lists',
-    'set-netters',
-    'set-netting',
-    'set-points',
-    'set-price',
-    'set-rest',
-    'set-speed',
-    'set-splitting',
     'set-stocked',
-    'set-tea',
-    'set-theoretical',
-    'set-theoretically',
-    'set-theorists',
-    'set-wise',
-    'set.',
-    'set.exe',
-    'set.it',
-    'set/confidence',
-    'setagaya',
-    'setar',
-    'setaria',
-    'setaside.time',
-    'setchell',
-    'setcrea',
     'setdet',
-    'setdphones',
-    'sete',
-    'setee',
-    'setember',
-    'setences',
-    'seters',
-    'setfonts',
-    'setiakawan',
-    'setif',
-    'setion',
-    'setl',
-    'setled',
-    'setlik',
-    'setnam',
-    'setof',
     'setoff',
-    'setor',
-    'setpieces',
-    'sets&mdash',
-    'sets/decent',
-    'sets/parts',
-    'setsuo',
-    'setswanan',
-    'settable',
-    'settani',
-    'settanni',
-    'settanta',
-    'settee.',
-    'settens',
-    'setterfield',
-    'setteth',
     'settgast',
-    'settimana',
-    'settimane',
-    'settin',
-    'settindown',
-    'setting&mdash',
-    'setting&mdash;where',
-    'setting-\'integration\'',
-    'setting-aside',
-    'setting-but',
-    'setting-china',
-    'setting-down',
-    'setting-gel',
-    'setting-on-dolphins',
-    'setting-stick',
-    'setting-sun',
     'setting-to-rights',
-    'setting/',
-    'setting/reality',
-    'settings.',
-    'settle-bed',
-    'settle-in',
-    'settle-to-carlisle',
-    'settlecarlisle',
-    'settled&mdash;even',
-    'settleme',
-    'settlement&mdash;see',
-    'settlement-seeking',
-    'settlement-the',
-    'settlement/cemetery',
-    'settlement/payment',
-    'settlements-with',
     'settlerist',
-    'settles.',
-    'settling-time',
-    'settlings',
-    'settlingstones',
-    'settlor.',
-    'settlorship',
-    'settree',
-    'settringtom',
-    'setup.exe',
-    'sety',
-    'setyscombe',
-    'seuck',
-    'seugi',
-    'seuil',
-    'seuill',
     'seule\'',
-    'seung-taek',
-    'seuphor',
-    'seurin',
-    'sev-erely',
-    'sevareid',
-    'sevaso',
-    'sevastapol',
-    'sevastyanov',
-    'sevcan',
-    'sevcenko',
-    'seve-ral',
-    'seveal',
-    'sevel',
-    'seven&rehy;spoke',
-    'seven-and-six',
     'seven-arched',
-    'seven-bay',
-    'seven-by-four',
-    'seven-by-four-foot',
-    'seven-by-nine',
-    'seven-car',
-    'seven-chip',
-    'seven-club',
-    'seven-day-trading',
-    'seven-days',
-    'seven-digit',
-    'seven-dimensional',
-    'seven-ears',
-    'seven-element',
-    'seven-employee',
-    'seven-fathom',
     'seven-feet-tall',
-    'seven-fight',
-    'seven-five-one-eight-one',
-    'seven-foot-by-three',
-    'seven-foot-diameter',
-    'seven-foot-square',
-    'seven-foot-tall',
-    'seven-forty-five',
-    'seven-four-five-oh-one',
-    'seven-four-seven',
-    'seven-frame',
-    'seven-furlong',
-    'seven-guinea',
-    'seven-handed',
-    'seven-hectare',
-    'seven-hundred-foot',
     'seven-hundredths',
-    'seven-inches',
-    'seven-ish',
-    'seven-knotted',
-    'seven-league',
-    'seven-line',
-    'seven-litre',
-    'seven-million',
-    'seven-nights-a-week',
-    'seven-number',
-    'seven-over-par',
-    'seven-pawn',
-    'seven-peaked',
-    'seven-picture',
-    'seven-place',
-    'seven-plus',
     'seven-point-solid',
-    'seven-pounder',
-    'seven-processor',
-    'seven-race',
-    'seven-sacrament',
-    'seven-scene',
-    'seven-score',
-    'seven-season',
-    'seven-shot',
-    'seven-sided',
-    'seven-six',
-    'seven-snake-necked',
-    'seven-song',
-    'seven-speed',
-    'seven-spoke',
-    'seven-spot',
     'seven-stone',
-    'seven-team',
-    'seven-terraced',
-    'seven-thirty\'s',
-    'seven-thousand-foot',
-    'seven-three',
-    'seven-tier',
-    'seven-time',
-    'seven-under',
-    'seven-way',
-    'seven-week-long',
-    'seven-woman',
-    'seven-year-long',
-    'seven-year-low',
-    'seven-yearly',
-    'seven_out',
     'sevenday',
-    'sevenish',
-    'sevenless',
-    'sevenoaks-based',
-    'sevens.',
-    'sevente',
-    'seventeen&rehy;year-old',
-    'seventeen-and-a-half',
-    'seventeen-and-six',
-    'seventeen-deep',
-    'seventeen-fifty',
-    'seventeen-forties',
-    'seventeen-mile',
-    'seventeen-month-old',
-    'seventeen-storey-high',
-    'seventeen-whatever',
     'seventeen-year&rehy;old',
-    'seventeenish',
-    'seventeenth-nineteenth',
-    'seventh-',
-    'seventh-wicket',
-    'seventh-year',
-    'seventies-era',
-    'seventies-sounding',
-    'seventies.',
-    'seventy&rehy;five',
-    'seventy&rehy;nine',
-    'seventy-acre',
-    'seventy-day',
-    'seventy-eight-centimetre',
-    'seventy-eight-hour',
-    'seventy-eights',
     'seventy-first',
-    'seventy-five-by-thirty-foot',
-    'seventy-four-year-old',
-    'seventy-fourth',
-    'seventy-hour',
-    'seventy-knot',
-    'seventy-mile',
-    'seventy-ninth',
-    'seventy-one-hour',
-    'seventy-page',
-    'seventy-second',
-    'seventy-thousand',
-    'seventy-two-page',
-    'seventy-two-year',
-    'seventy-yard',
-    'seventyfold',
     'sevenways',
-    'sever-i',
-    'severability.',
-    'several-inch',
-    'several-person',
-    'severalty',
-    'severance-incentive',
-    'severances',
-    'severb',
-    'severe-faced',
-    'severe-weather',
-    'severe/',
-    'severe=13',
-    'severe=any',
-    'severely-clipped',
-    'severely-parted',
     'severely-reduced',
-    'severely-restrained',
-    'severely-shocked',
-    'severely/profoundly',
-    'severeness',
-    'severfield',
-    'severi',
-    'severien',
-    'severinus',
-    'severitas',
-    'severity/pantry',
-    'severius',
-    'severley',
-    'severn/trent',
-    'severn/wash',
-    'severner',
     'severnich',
-    'severnsiders',
-    'severokamen',
-    'severso',
-    'severty',
-    'sevice',
-    'sevigne',
-    'sevigny',
-    'sevillano',
-    'sevilles',
-    'sevillians',
-    'sevin',
-    'sevirty',
-    'sevki',
-    'sevms',
-    'sevrainagriculture',
     'sevs',
-    'sew-along-with-nancy',
-    'sew-in',
-    'sew-on',
-    'sew-one',
-    'sew-sew',
-    'sew/so',
-    'sewage-',
-    'sewage-contaminated',
-    'sewage-infected',
-    'sewage-polluted',
-    'sewage-purification',
-    'sewage-related',
-    'sewage-ridden',
-    'sewage-strewn',
-    'sewage-type',
     'sewage-worker',
-    'sewages',
-    'sewards',
-    'sewart',
-    'sewcz',
-    'sewells',
-    'sewer-before',
-    'sewer-deutsch',
-    'sewer-men',
-    'sewer-stopping',
-    'sewer-use',
-    'sewer-water',
-    'sewered',
-    'sewerfuls',
-    'seweries',
-    'sewers.',
     'sewery',
-    'seweryn',
-    'sewestern',
-    'sewi',
-    'sewin',
-    'sewin\'',
-    'sewing-bench',
-    'sewing-factory',
-    'sewing-machinists',
-    'sewing-meeting',
-    'sewing-needle',
-    'sewing-room-cum-spare-room',
-    'sewings',
-    'sewn-on',
-    'sewrckn',
-    'sewster',
     'sex&rehy;appeal',
-    'sex&rehy;slave',
-    'sex\'n\'drugs',
-    'sex\'n\'drugs\'n\'booze',
-    'sex-',
-    'sex-and-bribery',
-    'sex-and-death',
-    'sex-and-shopping',
-    'sex-as-fun',
-    'sex-as-procreation',
-    'sex-associated',
-    'sex-attacker',
-    'sex-attacks',
-    'sex-balanced',
-    'sex-beat',
-    'sex-biased',
     'sex-blind',
-    'sex-by-class',
-    'sex-calibre',
-    'sex-care',
-    'sex-case',
-    'sex-cats',
-    'sex-centredness',
-    'sex-changes',
-    'sex-class',
-    'sex-craved',
-    'sex-crazy',
-    'sex-crime',
-    'sex-dependent',
-    'sex-desire',
-    'sex-discriminatory',
-    'sex-driven',
     'sex-fun',
-    'sex-games',
-    'sex-god',
-    'sex-graded',
-    'sex-groups',
-    'sex-hell',
-    'sex-hungry',
-    'sex-icon',
-    'sex-inclusive',
-    'sex-indefinite',
-    'sex-kittenish',
-    'sex-love',
-    'sex-machines',
-    'sex-mad-',
-    'sex-mad-filthy',
-    'sex-maniac',
     'sex-murderer',
-    'sex-objects',
-    'sex-of-host',
-    'sex-op',
-    'sex-orgies',
-    'sex-perverts',
-    'sex-play',
-    'sex-pleasure',
-    'sex-plumbing',
-    'sex-poet',
-    'sex-pongs',
-    'sex-pot',
-    'sex-problems',
-    'sex-procreation',
-    'sex-ratio',
-    'sex-reference',
     'sex-reform',
-    'sex-role-appropriate',
-    'sex-role-reversed',
-    'sex-roles',
-    'sex-romp',
-    'sex-scandal',
-    'sex-selective',
-    'sex-sharp',
-    'sex-shy',
-    'sex-siren',
-    'sex-spells',
-    'sex-stewardess',
-    'sex-stirred',
-    'sex-swap',
-    'sex-tests',
-    'sex-therapist',
     'sex-type',
-    'sex-typing',
-    'sex-video',
-    'sex-wall',
-    'sex-war',
-    'sex-wars',
-    'sex-y',
-    'sex/\'born',
-    'sex/murder/mystery',
-    'sex/style',
-    'sexadecimal',
-    'sexagecuple',
-    'sexagenary',
-    'sexagene',
-    'sexalogic',
-    'sexandviolence',
     'sexavalent',
-    'sexbox',
-    'sexby',
-    'sexcess',
-    'sexcuple',
-    'sexdigit',
-    'sexdigital',
-    'sexecutioner',
-    'sexee',
-    'sexemium',
-    'sexen',
-    'sexennarian',
-    'sexer',
-    'sexey',
-    'sexfid',
-    'sexfoil',
     'sexious',
-    'sexist-sounding',
-    'sexist/racist',
-    'sexium',
-    'sexlessly',
-    'sexlessness',
-    'sexmillenary',
-    'sexological/freudian',
-    'sexplicit',
-    'sexploitation',
-    'sexploitative',
-    'sexpress',
-    'sexquake',
-    'sexss',
-    'sexstock',
-    'sextain',
     'sextalk',
-    'sextants',
-    'sextile',
-    'sextilis',
-    'sextipartition',
-    'sextium',
-    'sexto',
-    'sextoncy',
-    'sextons',
-    'sextoy',
-    'sextry',
-    'sextuplet',
-    'sexual-commercial',
-    'sexual-cum-political',
-    'sexual-cum-religious',
-    'sexual-difference',
     'sexual-encounter',
-    'sexual-intercourse-by-numbers',
-    'sexual-religious',
-    'sexual-reproductive',
-    'sexual-social',
-    'sexual-youthful',
-    'sexual/conjugal',
-    'sexual/emotional',
-    'sexual/generative',
-    'sexual/political',
-    'sexual/racial',
-    'sexuality\'',
-    'sexuality-developing',
-    'sexualize',
-    'sexualizes',
-    'sexually-active',
     'sexually-adventurous',
-    'sexually-charged',
-    'sexually-explicit',
-    'sexually-liberated',
-    'sexually-obsessed',
-    'sexually-orientated',
-    'sexually-poor',
-    'sexually-related',
-    'sexually-reproducing',
-    'sexuellen',
-    'sexvirate',
-    'sexwords',
-    'sexy-sounding',
-    'sexy/tug',
-    'sey&eth;isfj&ouml;rdur',
-    'seya-namioka',
     'seychelles/mauritius',
-    'seyde',
-    'seydo',
-    'seydoux',
-    'seyfeddin',
-    'seyfi',
-    'seyhan',
-    'seyhs',
-    'seym',
-    'seymarzio',
-    'seymore',
-    'seymour-equipped',
-    'seymour-stracheys',
-    'seymouriamorph',
-    'seynt',
-    'seyntz',
     'seyssel',
-    'seytjandi',
-    'seyton',
-    'seyyids',
-    'sezan',
-    'sezgin-assad',
-    'sezincot',
-    'sezuan',
-    'sf&mdash;socialist',
-    'sf-1500',
-    'sf1.28',
-    'sf100',
-    'sf2',
-    'sf2,530,000',
-    'sf2.3',
-    'sf2.5',
     'sf200',
-    'sf300&ndash;400,000',
-    'sf300&ndash;450,000',
-    'sf350&ndash;450,000',
-    'sf350,000&ndash;450,000',
-    'sf36',
-    'sf365,000',
-    'sf43',
-    'sf800&ndash;1,200,000',
-    'sfas',
-    'sfe-703',
-    'sfeir-semler',
-    'sfep',
-    'sfera',
-    'sff',
-    'sfgl',
     'sfia',
-    'sfim',
-    'sfl',
-    'sflgs',
-    'sforza-bellini',
-    'sforza-castle',
-    'sforza-cesarini',
-    'sforzandi',
-    'sforzato',
-    'sfp&mdash;swedish',
-    'sfr1,200',
-    'sfr1.5',
-    'sfr10',
-    'sfr100m',
-    'sfr1071m',
-    'sfr12.7',
     'sfr1200m',
-    'sfr14,900',
-    'sfr15',
-    'sfr152',
-    'sfr16,509,700',
-    'sfr17,300,000',
-    'sfr17.7',
-    'sfr1700m',
-    'sfr19,743,130',
-    'sfr2',
-    'sfr200,000,000',
-    'sfr21.5',
-    'sfr2100m',
-    'sfr2400m',
-    'sfr3-4,000,000',
-    'sfr3.5',
     'sfr30',
-    'sfr304,100,000',
-    'sfr390,000',
-    'sfr4,600,000',
-    'sfr40',
-    'sfr41,800,000',
-    'sfr46,000,000',
-    'sfr474,000',
-    'sfr477',
-    'sfr5',
-    'sfr5,750',
-    'sfr50,000',
-    'sfr5000',
-    'sfr6',
-    'sfr70,000',
-    'sfr85,000',
     'sfr9',
-    'sfr935,000',
-    'sfts',
-    'sfunny',
-    'sfvs',
-    'sg-10',
-    'sg-1000s',
-    'sg-2000',
-    'sg-3000',
-    'sg-3000s',
-    'sg-512',
-    'sg-57',
-    'sg-75',
-    'sg-shaped',
-    'sg-style',
-    'sg11',
     'sg13',
-    'sg2100',
-    'sg3000',
-    'sg9',
-    'sga1979',
-    'sgairbh',
-    'sgall',
-    'sgi-based',
-    'sgi/mips',
-    'sgitheanachs',
-    'sgl-based',
-    'sgml-',
-    'sgml-authoring',
-    'sgml-compliant',
-    'sgml-related',
-    'sgoir',
     'sgp&mdash;political',
-    'sgriob',
-    'sgriol',
-    'sgritheall',
-    'sgroi',
-    'sgs/thomson',
-    'sgt-major',
-    'sgt.-maj',
-    'sgt.-maj.',
-    'sgt.curry',
-    'sgtr',
-    'sgu',
-    'sgueal',
-    'sgui',
-    'sgx2000',
-    'sh&oacute;wa',
     'sh&rehy;chug-a-chug',
-    'sh&ugrave',
-    'sh*tting',
-    'sh-2',
-    'sh-2f',
-    'sh-chug-a-chug-chug',
-    'sh-ptp-1',
-    'sh-sh-ed',
-    'sh-sh-sh',
-    'sh-sh-shower',
-    'sh-sh-sure',
-    'sh-shaped',
-    'sh-shingle',
-    'sh-should',
-    'sh-showdown',
-    'sh.1,000,000/',
     'sh.1,050,000/',
-    'sh.200/',
-    'sh.3,000,000/',
-    'sh.4,640,000/-',
-    'sh.450,000/',
-    'sh.7,000,000/',
-    'sh.800,000/',
-    'sh.900,000/',
-    'sh.ct',
-    'sh1/sh2',
-    'sh113,840',
-    'sh2-',
-    'sh206,960',
-    'sh209,200',
-    'sh3-mediated',
-    'sh320,800',
     'sh35',
-    'sh370',
-    'sh375',
-    'sh4',
-    'sh4on',
-    'sh73,600',
-    'sh93,656',
-    'sha&rehy;lom',
-    'shaalan',
-    'shaalds',
-    'shaare',
-    'shaath',
-    'shabaka',
-    'shabana',
-    'shabangu',
-    'shabani',
     'shabash',
-    'shabaz',
-    'shabbath',
-    'shabbatum',
-    'shabby-duckling',
-    'shabini',
-    'shabonov',
-    'shabti-figure',
-    'shabura',
-    'shabwa',
-    'shach',
-    'shack-fork',
-    'shack-to',
-    'shackell/entente',
-    'shackelock',
-    'shackle-pins',
     'shackleford',
-    'shackleton&rehy;equipped',
-    'shackley',
-    'shacklock',
-    'shackman',
-    'shacksville',
-    'shacky',
-    'shadai',
-    'shadchan',
-    'shadchan-a',
-    'shaddafuggup',
-    'shaddap',
-    'shadder',
-    'shade&rehy;groups',
-    'shade-bearers',
-    'shade-demanding',
     'shade-intolerant',
-    'shaded.',
-    'shadeless',
-    'shades&lsqb;of',
-    'shades/',
-    'shadespit',
-    'shadey',
-    'shadforth',
-    'shadi',
-    'shadiness',
-    'shading-down',
-    'shading-edge',
-    'shado',
-    'shadoof',
-    'shadoor',
-    'shadow&rehy;boxin\'',
     'shadow-beam',
-    'shadow-boxed',
-    'shadow-bride',
-    'shadow-brother',
-    'shadow-check',
-    'shadow-corners',
-    'shadow-dappled',
-    'shadow-elms',
-    'shadow-free',
-    'shadow-horror',
-    'shadow-hung',
-    'shadow-land',
-    'shadow-loving',
-    'shadow-pools',
-    'shadow-robed',
-    'shadow-screen',
     'shadow-stained',
-    'shadow-world',
-    'shadowalker',
-    'shadowbase',
-    'shadowboxed',
-    'shadowboxing',
-    'shadowcasting',
-    'shadowe',
-    'shadowily',
-    'shadowmaster&reg',
-    'shadoxhurst',
-    'shadreck',
-    'shadshit',
-    'shaeffer',
-    'shaen',
-    'shafarevich',
     'shafe(ish)',
-    'shafeeu',
-    'shafer/oxford',
-    'shafeyeen',
-    'shaffhausen',
-    'shafford',
-    'shafgar',
-    'shafi/shopkeeper',
-    'shafick',
-    'shafiquzzaman',
-    'shafron',
-    'shaft-grave',
-    'shaft-mining',
-    'shaftari',
-    'shafter',
-    'shaftesburys',
     'shaftin\'',
-    'shaftoe',
-    'shaftpower',
-    'shafts.',
-    'shag-mental',
-    'shagathon',
-    'shagbadly',
-    'shagg',
-    'shagg\'n\'',
-    'shaggability',
-    'shaggable',
-    'shaggers',
-    'shaggily',
-    'shagginess',
-    'shaggy-coated',
-    'shaggy-furred',
     'shaggy-trousered',
-    'shagolle',
-    'shagpiles',
-    'shagstone',
-    'shaham',
-    'shahbazi',
-    'shahed',
-    'shahidan',
-    'shahidul',
-    'shahjahan',
-    'shahjehani-style',
-    'shahpour',
-    'shahr',
-    'shahr-i',
-    'shahriyar',
-    'shahtoosh',
     'shahzad',
-    'shai-hai',
-    'shaida',
-    'shaihah',
-    'shaihali',
-    'shaihk',
-    'shaiken',
-    'shailes',
-    'shailes/speedway',
-    'shair',
-    'shaitan',
-    'shaka',
-    'shake&mdash;up',
-    'shake-\'em-up',
-    'shake-bag',
-    'shake-free',
     'shake-maker',
-    'shake/dark',
-    'shake/thy',
-    'shakell',
-    'shakemantle',
-    'shaken-up',
-    'shakenly',
-    'shaker-',
-    'shakerchief',
-    'shakerley',
-    'shakeshpeare',
-    'shakespaw',
-    'shakespearan',
-    'shakespeare\'',
-    'shakespeare-mad',
-    'shakespeare-spouting',
     'shakespeare/senior',
-    'shakespeare_in',
-    'shakespeherian',
-    'shakings',
-    'shakir',
-    'shakkabaek',
-    'shakle',
-    'shakletons',
-    'shakma',
-    'shakra',
-    'shaksgam',
-    'shaktee',
-    'shaky-hand',
-    'shal-la-la',
-    'shalabai',
-    'shalabi',
     'shalalala-macnamee',
-    'shalden',
-    'shale-dominated',
-    'shale-like',
-    'shalefield',
-    'shalesin',
-    'shalet',
-    'shalini',
-    'shalke',
-    'shall-we-get-muscadet-or-the-chardonnay-',
-    'shall/should',
-    'shalliday',
-    'shallied',
-    'shalloon',
-    'shalloons',
-    'shallow-',
     'shallow-buried',
-    'shallow-dipping',
-    'shallow-draft',
-    'shallow-hipped',
-    'shallow-pitched',
-    'shallow-pool',
-    'shallow-rooted',
-    'shallow-rooting',
-    'shallow-seal',
-    'shallow-skied',
-    'shallowe',
-    'shalls',
-    'shalock',
-    'shalotsky',
-    'sham\'',
-    'sham-chewing',
     'sham-manipulations',
-    'sham-victorian',
-    'shamal',
-    'shamanarchy',
-    'shamanesque',
-    'shamanists',
-    'shamas',
-    'shambas',
-    'shambe',
-    'shambhu',
-    'shamblers',
-    'shamblingly',
-    'shambly',
-    'shambolically',
-    'shambrook',
-    'shamburger',
     'shame&rehy;facedly',
-    'shame-fac&egrave;dly',
-    'shame-facedly',
-    'shame-free',
-    'shame/is',
-    'shamedly',
-    'shameem',
-    'shameer',
-    'shamefacedness',
-    'shamefacely',
-    'shameful.',
-    'shamefull',
-    'shamefulness',
-    'shamelesslessly',
-    'shamelle',
-    'shamen/danny',
     'shamey',
-    'shamfered',
-    'shamin',
-    'shamin\'',
-    'shamir-arens',
-    'shamir-arens-sharon',
-    'shamir-stone',
-    'shamma',
-    'shamp',
-    'shampagne',
-    'shampoo-swilling',
-    'shampoo/conditioning',
-    'shamrock-toutin\'',
-    'shamsa',
-    'shamseddin',
-    'shamser',
     'shamshere',
-    'shamsigeram',
-    'shamsuddin',
-    'shamsur',
-    'shamuses',
-    'shan\'t',
-    'shan-ching',
-    'shanaghy',
-    'shanahan/friend',
-    'shanard',
-    'shance',
-    'shane-spotters',
-    'shane/convicted',
-    'shang-yin',
-    'shangaan-speaking',
-    'shangarry',
     'shanghold',
-    'shangre',
-    'shangrila',
-    'shani',
-    'shanibov',
-    'shank-deep',
-    'shank-to-nut',
-    'shankara',
-    'shankill-based',
-    'shankley',
-    'shankly&rehy;paisley-fagan-dalglish',
-    'shankorak',
-    'shankster',
-    'shanmugan',
-    'shannagh',
-    'shannan',
     'shannara',
-    'shanno',
-    'shannon-cimax',
-    'shannon-climax',
-    'shannon-garryowen',
-    'shannon.',
-    'shanon',
-    'shanqalla',
-    'shanshalminister',
-    'shanson',
-    'shantaram',
-    'shante',
-    'shantiniketan',
-    'shanty-capital',
-    'shanty-type',
-    'shantytowns',
     'shantz',
-    'shanwick',
-    'shao-kang',
-    'shaofang',
-    'shaoib',
-    'shaowen',
-    'shapability',
-    'shapcott',
-    'shape-changers',
-    'shape-concealing',
-    'shape-encoded',
-    'shape-independent',
-    'shape-influenced',
-    'shape-note',
-    'shape-remembering',
-    'shape-shifters',
     'shape-similar',
-    'shape-similarity',
-    'shape-wise',
-    'shape.the',
-    'shape/form',
-    'shape/shell',
-    'shape/to',
-    'shaped-shouldered',
-    'shapeliest',
-    'shapemaster',
-    'shapeofbeak(sparrow)',
-    'shapeofbeak(x)',
-    'shapes&mdash',
-    'shapes-triangles',
-    'shapes.',
-    'shapeshifters',
     'shapeware',
-    'shapiros',
-    'shapless',
-    'shapley',
-    'shaporjee',
-    'shapria',
-    'shaprt',
-    'shapshot',
-    'shapton',
-    'shapurji',
-    'shapwick',
-    'shaqlawah',
-    'shar\'a',
-    'shar-pei',
-    'sharada',
-    'sharansky',
     'sharavsambuu',
-    'shard-like',
-    'shardha',
-    'shardick',
-    'share&lsqb;d&rsqb',
-    'share&mdash;with',
-    'share-based',
-    'share-counting',
-    'share-dealer',
-    'share-dealers',
-    'share-exchange',
-    'share-holding/debenture',
-    'share-hyping',
-    'share-issues',
-    'share-matching',
-    'share-outs',
     'share-owner',
-    'share-picking',
-    'share-register',
-    'share-rigging',
-    'share-settlement',
-    'share-swap',
-    'share-swaps',
-    'share-transactions',
-    'share-warrants',
-    'share-watchers',
-    'share.his',
-    'share.interim',
-    'share.net',
-    'share/bond',
-    'shareability',
-    'sharebase',
     'sharebrokers',
-    'sharebroking',
-    'shared-cost',
-    'shared-equity',
-    'shared-facility',
-    'shared-logic',
-    'shared-memory',
-    'shared-ownership',
-    'sharedealings',
-    'shareef',
-    'shareek',
-    'sharef',
-    'shareh',
-    'shareholder&mdash;see',
-    'shareholder(s)',
-    'shareholder-base',
     'shareholder-centred',
-    'shareholder-customers',
-    'shareholder-depositors',
-    'shareholder-relations',
-    'shareholder-wealth',
-    'shareholder.8',
-    'shareholders\'',
-    'shareholders.the',
-    'shares&mdash;reserved',
-    'shares-for-favour',
-    'shares-for-influence',
-    'shares-for-shares',
-    'shares.',
-    'sharesaver',
-    'shareshop',
-    'sharethe',
     'sharetime',
-    'sharg',
-    'shargill',
-    'sharhan',
-    'shariat-madari',
-    'shariatmadari',
-    'sharifa',
-    'sharifi',
-    'sharina',
-    'sharing\'',
-    'sharing-out',
-    'sharits',
-    'shark&uacute',
-    'shark\'s-tooth',
-    'shark-angled',
-    'shark-headed',
     'shark-nose',
-    'shark-sleek',
-    'shark-snouted',
-    'shark-tooth',
-    'shark-toothed',
-    'sharka',
-    'sharkansky',
-    'sharkfin-shaped',
-    'sharkie',
-    'sharkinfested',
-    'sharklike',
-    'sharkmeat',
-    'sharks.',
-    'sharkteeth',
-    'sharland/eating',
-    'sharland/for',
     'sharley',
-    'sharlott/daughter-in-law',
-    'sharlotte',
-    'sharman/cosmonaut',
-    'sharmila',
-    'sharmpal',
-    'sharn',
-    'sharnford',
-    'sharniad',
-    'sharnidubs',
-    'sharo',
-    'sharon(likud)',
-    'sharp&rehy;cornered',
-    'sharp&rehy;witted',
-    'sharp-bladed',
-    'sharp-designed',
     'sharp-draining',
-    'sharp-dressed',
-    'sharp-electrode',
-    'sharp-ended',
-    'sharp-fingered',
-    'sharp-flat',
-    'sharp-focus',
-    'sharp-gabled',
-    'sharp-jutting',
-    'sharp-knapped',
-    'sharp-peaked',
-    'sharp-pinioned',
-    'sharp-practising',
-    'sharp-pronged',
-    'sharp-red',
-    'sharp-ribbed',
     'sharp-sand',
-    'sharp-shooters',
-    'sharp-shouldered',
-    'sharp-smelled',
-    'sharp-snapped',
-    'sharp-tailed',
-    'sharp-teeth',
-    'sharp-tempered',
-    'sharp-thorned',
-    'sharp-tipped',
-    'sharp-toed',
-    'sharp-toned',
-    'sharp-winged',
-    'sharp/a',
-    'sharp/assistant',
-    'sharp/mother',
     'sharpe-pattison',
-    'sharpe/organiser',
-    'sharpe/paul',
-    'sharped',
-    'sharpeeeee',
-    'sharpees',
-    'sharpei',
-    'sharpener.',
-    'sharpening-up',
-    'sharper-than-usual',
-    'sharper-witted',
-    'sharpeville-mode',
-    'sharpham',
-    'sharphold',
-    'sharpley',
-    'sharply-critical',
     'sharply-divided',
-    'sharply-recounted',
-    'sharply-shadowed',
-    'sharply-suited',
-    'sharpness.',
-    'sharpo',
-    'sharpour',
-    'sharps-related',
-    'sharpsburg',
-    'sharpshooting',
-    'sharpshouldered',
-    'sharpwittedness',
-    'sharquiyya',
-    'sharrock/sheila',
-    'sharrod',
-    'sharrow',
     'shartuyan',
-    'sharwoods.',
-    'shasha',
-    'shashin',
-    'shashis',
-    'shashlik',
-    'shasta-trinity',
-    'shaste',
-    'shastriindustry',
-    'shat-on',
-    'shatalov',
-    'shatatsya',
-    'shate',
-    'shatement',
-    'shatilla',
-    'shatkin',
     'shatran',
-    'shatrov',
-    'shatrugan',
-    'shatt-al-arab',
-    'shatter-resistant',
-    'shatterford',
-    'shatterproof',
-    'shatton',
-    'shaughran',
-    'shaun/prisoner',
-    'shaunesque',
-    'shauri',
-    'shause',
-    'shave-a-thon',
-    'shave-athon',
-    'shavelings',
     'shavell',
-    'shaven-haired',
-    'shaven-skulled',
-    'shavians',
-    'shaving-cream',
-    'shaving-mirror',
-    'shaving-pot',
-    'shavng',
-    'shavu',
-    'shavuot',
-    'shaw-',
-    'shaw-lefevre',
-    'shaw/tewkesbury',
-    'shaw/writer',
-    'shawbury',
-    'shawdering',
     'shawdicth',
-    'shawdring',
-    'shawe-taylor',
-    'shawes',
-    'shawfield-based',
-    'shawhead',
-    'shawl-thing',
-    'shawl-wrapped',
-    'shawm-like',
-    'shawms',
-    'shawns',
-    'shawq',
-    'shawrib',
-    'shawyer',
-    'shaxi',
-    'shayegan',
     'shayi',
-    'shayla',
-    'shayle',
-    'shayle/landlord',
-    'shaylor',
-    'shaymen',
-    'shaz\'n\'trace',
-    'shazad',
-    'shazdeh',
-    'shazelsein',
-    'shazli',
-    'shcherbak',
-    'shcherbatsky',
-    'shcherbina',
-    'shcherbyna',
-    'shchi',
     'shchit',
-    'shchukina/pupil',
-    'shcools',
-    'shd',
-    'shdt',
-    'she&ndash',
-    'she\'s-',
-    'she\'ss',
-    'she\'stouched',
-    'she-',
-    'she-bears',
-    'she-camel',
-    'she-cats',
-    'she-d',
-    'she-found',
-    'she-had',
     'she-hinnies',
-    'she-knew',
-    'she-loves-me-not',
-    'she-minx',
-    'she-pandora',
-    'she-ra',
-    'she-souldiers',
-    'she-started',
-    'she-tragedy',
-    'she-who-carries-torch',
-    'she-who-must-be-obeyed',
-    'she-who-pulls-the-strings',
-    'she-wolf&mdash',
-    'she/amy',
-    'she/barbara',
-    'she/books',
     'she/her/hers/herself',
-    'she/iridiance',
-    'she/jordan',
-    'she/midland',
-    'she/revlon',
-    'she/selsun',
-    'she/seven',
-    'she/trudi',
-    'shea-simmonds',
-    'sheading',
-    'sheaf-like',
-    'sheafed',
-    'sheaff',
-    'sheahan',
-    'shear-free',
-    'shear-strength',
     'shear-wave',
-    'shearar',
-    'shearburn',
-    'sheare',
-    'shearer&mdash',
-    'shearer-shearer',
-    'shearim',
-    'shearlings',
-    'shearography',
-    'shearwatering',
-    'sheasgaich',
-    'sheath-dress',
-    'sheath-like',
-    'sheathes',
-    'sheathknife',
-    'sheave',
     'sheback',
-    'shebeening',
-    'shebib/aged',
-    'shebody',
-    'shebster',
-    'shebumkin',
-    'shec',
-    'shecond',
-    'shed-full',
-    'shed-man',
-    'shed.and',
-    'shedad',
-    'shedder',
-    'shedders',
-    'sheddings',
-    'shedee',
     'sheder',
-    'shedford',
-    'sheding',
-    'shedownstair',
-    'shedplate',
-    'shee-ow',
-    'sheec',
-    'sheech',
-    'sheee',
-    'sheeeeeen',
-    'sheehan/cricket',
-    'sheehe',
-    'sheela',
-    'sheela-nagigs',
-    'sheenan',
-    'sheenes',
     'sheeneur',
-    'sheenin',
-    'sheenless',
-    'sheep&rehy;grazed',
-    'sheep-and-corn',
-    'sheep-and-goats',
-    'sheep-bitten',
-    'sheep-dippers',
-    'sheep-dirt',
-    'sheep-dogs',
-    'sheep-eating',
-    'sheep-fanks',
-    'sheep-fencing',
-    'sheep-filled',
-    'sheep-folds',
-    'sheep-grazed',
     'sheep-grazing',
-    'sheep-hirsels',
-    'sheep-hooks',
-    'sheep-house',
-    'sheep-hurdle',
-    'sheep-meat',
-    'sheep-mown',
-    'sheep-racing',
-    'sheep-ranch',
-    'sheep-ranching',
-    'sheep-rearing',
-    'sheep-rich',
-    'sheep-scaring',
-    'sheep-shagger',
-    'sheep-shears',
-    'sheep-shit',
     'sheep-skins',
-    'sheep-slopes',
-    'sheep-spangled',
-    'sheep-ticks',
-    'sheep-to-wearer',
-    'sheep-track',
-    'sheep-tracks',
-    'sheep-washing',
-    'sheep-white',
-    'sheep-women',
-    'sheep/',
-    'sheep/ha',
-    'sheepbreeder',
-    'sheepcote',
-    'sheepdippers',
-    'sheepen',
     'sheepfarming',
-    'sheephouse',
-    'sheepiness',
-    'sheepishly-but',
-    'sheepishness',
-    'sheeplands',
-    'sheepless',
-    'sheepman',
-    'sheepmarket',
-    'sheepmart',
-    'sheepsbit',
-    'sheepscombe/gloucestershire',
-    'sheepshaggers',
-    'sheepshearer',
-    'sheepshearing',
-    'sheepskin-draped',
     'sheepskin-lined',
-    'sheepwalk',
-    'sheepwhite',
-    'sheer-drop',
-    'sheered-off',
-    'sheerness&ndash;vlissingen',
-    'sheerness-vlissengen',
-    'sheerness-vlissingen',
-    'sheet&mdash;except',
-    'sheet-',
-    'sheet-anchor',
-    'sheet-anchors',
-    'sheet-feed',
-    'sheet-feeder',
-    'sheet-fuse',
-    'sheet-lead',
     'sheet-lightning',
-    'sheet-piled',
-    'sheet-piling',
-    'sheet-sized',
-    'sheet-steel',
-    'sheet-the',
-    'sheet-white',
-    'sheet-wrapped',
-    'sheetage',
-    'sheeter',
-    'sheetflood',
-    'sheetmetal',
-    'sheets-a-month',
-    'sheets.',
-    'sheets/printed',
-    'sheetwise',
     'sheezdi',
-    'sheff.',
-    'sheff.utd.',
-    'sheffe',
-    'sheffi',
-    'sheffield&ndash;baslow',
-    'sheffield-class',
-    'sheffield-cleethorpes',
-    'sheffield-nottingham',
-    'sheffield/london',
-    'sheffieldbased',
-    'sheffielder',
-    'sheffielders',
-    'sheffields',
-    'sheffs',
-    'shefqet',
     'shefsky',
-    'shefter',
-    'shegeharu',
-    'shehab',
-    'shehadi',
-    'shehadie',
-    'sheharyar',
-    'shehnaz',
-    'sheibani',
-    'sheichernich',
-    'sheiham',
-    'sheihk',
-    'sheikdoms',
-    'sheikh-up',
-    'sheikh/sikh',
-    'sheikkariem',
     'sheil/a420',
-    'sheila.',
-    'sheilabai',
-    'sheilds',
-    'sheilla',
-    'sheinis',
-    'sheiss',
-    'sheisse',
-    'shejoined',
-    'shekawat',
-    'shekhar-mann',
-    'shekhina',
-    'shekhinah',
-    'shekhovtsov',
-    'shekipper',
-    'shekou',
     'sheku',
-    'shelabruse',
-    'shelaine',
-    'shelbeck',
-    'shelbourn',
-    'shelby.',
-    'shelderton',
-    'sheldo',
-    'sheldonians',
-    'shelest',
-    'shelf-cataloguing',
-    'shelf-displays',
-    'shelf-feet',
-    'shelf-filler',
-    'shelf-full',
-    'shelf-help',
     'shelf-list',
-    'shelf-mark',
-    'shelf-registered',
-    'shelf-ridden',
-    'shelf-room',
-    'shelf-stacker',
-    'shelf-wobblers',
-    'shelf.',
-    'shelf/slope/basin-plain',
-    'shelfer',
-    'shelfful',
-    'shelfless',
-    'shelfter',
-    'shell-backed',
-    'shell-bedecked',
-    'shell-burst',
     'shell-bursts',
-    'shell-case',
-    'shell-casing',
-    'shell-cock',
-    'shell-confer',
-    'shell-cracking',
-    'shell-crater',
-    'shell-dust',
-    'shell-dweller',
-    'shell-fragments',
-    'shell-growth',
-    'shell-headed',
-    'shell-housing',
-    'shell-initiated',
-    'shell-jacket',
-    'shell-jewelled',
     'shell-keeps',
-    'shell-lie',
-    'shell-making',
-    'shell-material',
-    'shell-operated',
-    'shell-or',
-    'shell-out',
-    'shell-pocked',
-    'shell-script',
-    'shell-shadow',
-    'shell-size',
-    'shell-smashed',
-    'shell-splinters',
-    'shell-suit',
-    'shell-toed',
-    'shell/lso',
     'shellaced',
-    'shellacked',
-    'shellam',
-    'shellbacks',
-    'shellblast',
-    'shellcases',
-    'shelldorado',
-    'shelldwellers',
-    'shelled-out',
-    'shelleen',
-    'shellfish-collecting',
-    'shellfish-eating',
-    'shellfish.',
-    'shellick',
-    'shellin\'',
-    'shellmex',
     'shello',
-    'shells-indeed',
-    'shells-see',
-    'shells-some',
-    'shells-which',
-    'shellwork',
-    'shellyan',
-    'shellycoat',
-    'shelone',
-    'shelsley',
-    'shelson',
-    'shelswell',
-    'sheltand',
-    'shelter-belt',
-    'shelter-homes',
-    'shelter-it',
     'shelter-pits',
-    'shelter-that',
-    'shelter.',
-    'shelter/warmth',
-    'shelter_that',
-    'shelterd',
-    'sheltered-housing',
-    'shelterwood',
-    'shelton/director',
-    'shelty',
-    'shelved.',
-    'shelver',
-    'shelvesful',
-    'shelvocke',
-    'shemaal',
-    'shemar',
     'shemara',
-    'shemau',
-    'shemayah',
-    'shemer',
-    'shemesh',
-    'shemilt',
-    'shemin',
-    'shemona',
-    'shemozzle',
-    'shemu',
-    'shen-kwe-fen',
-    'shen-sei-go',
-    'shenavai',
-    'shengjin',
-    'shengzhen',
-    'shenington/oxfordshire',
     'shensi',
-    'shentou',
-    'shep.',
-    'shepard/jessica',
-    'shephard-thorn',
-    'shepheardes',
-    'shepherd-boys',
-    'shepherd-delighting',
-    'shepherd-farmers',
-    'shepherd-girls',
-    'shepherd/conservative',
-    'shepherd/isis',
-    'shepherd/navigator',
-    'shepherd/oxfordshire',
-    'shepherd/thames',
-    'shepherdessed',
     'shepler',
-    'shepman',
-    'sheppard\'',
-    'sheppard/american',
-    'sheppard/fundraiser',
-    'sheppard/modulations',
-    'sheppard/shop',
-    'sheppe',
-    'sheppeard',
-    'shepperdine',
-    'shepperson',
-    'shepreth',
-    'shepsle',
-    'shepstone/nupe',
-    'sherai',
-    'sherardising',
     'sherardizing',
-    'sheraton/shoreham',
-    'sheratsky',
-    'sherbakov',
-    'sherbert-sharp',
-    'sherbet-makers',
-    'sherborn',
-    'sherborne/gloucestershire',
-    'sherburn-in-',
-    'sherbuttgate',
-    'shere-kahn',
-    'sheref',
-    'sheremetov',
-    'sheremtyero',
-    'sheret',
-    'sheret/sutcliffe',
     'sherfield',
-    'shergar-style',
-    'shergold/parents',
-    'shergottites',
-    'shergottites-nakhlites-chassignites',
-    'shergotty',
-    'sherice',
-    'sheridans',
-    'sheriff-',
-    'sheriffdom',
-    'sheriffe',
-    'sheriffs-depute',
-    'sheriffships',
-    'shering',
-    'sheringa',
-    'sheringham-big',
     'sherk',
-    'sherkat',
-    'sherleys',
-    'sherlock/community',
-    'sherlocks',
-    'shermani',
-    'sherms',
-    'shernhall',
-    'sherpani',
-    'sherpao',
-    'sherpatype',
-    'sherr',
-    'sherratt/howard',
-    'sherriffe',
-    'sherrill',
-    'sherring',
     'sherringtonian',
-    'sherrod',
-    'sherry/campaign',
-    'shers',
-    'shert',
-    'shertogenbosch',
-    'shervington/lord',
-    'sherwani/former',
-    'sherwin-white',
-    'sherwode',
-    'sherwood-call',
-    'sherwood-isms',
-    'sherwood-produced',
-    'sherwood-taylor',
-    'shes',
-    'shescissor',
     'shesecrets',
-    'shesin',
-    'shestack',
-    'shet',
-    'shetani',
-    'shetland-iceland-greenland',
-    'shetlander-incomer',
-    'shetlander/incomer',
-    'shetlander/incomers',
-    'shetlandic',
-    'shetlock',
-    'shetreet',
-    'shettles',
-    'sheu',
-    'sheueth',
-    'sheugh',
     'sheurpe',
-    'shevardnadze&mdash;former',
-    'shevardnadze-bush',
-    'shevardnazde',
-    'shevarnadze',
-    'shevchenku',
-    'shevels',
-    'sheverlay',
-    'shevill',
-    'shevington',
-    'shevlin',
-    'shewalton',
-    'shewanakoo',
-    'shewbread',
-    'shewd',
-    'shewe',
     'shewes',
-    'shewings',
-    'shewry',
-    'shewsbury',
-    'shewyng',
-    'shf-siliconised',
-    'shft',
-    'shgen',
-    'shgortly',
-    'shgould',
-    'shhd/dgm',
-    'shhd/esrc/sheg',
-    'shhhhhhhhhhhhh',
-    'shi%%eries',
-    'shi\'as',
-    'shi\'is',
     'shi\'ism',
-    'shi-ism',
-    'shi-ite',
-    'shi-shi',
-    'shia-dominated',
-    'shiach',
-    'shiakani',
-    'shiants',
-    'shiating',
-    'shiatzu',
-    'shiba',
-    'shibam',
-    'shiban',
-    'shibayama',
-    'shibeens',
-    'shiblak',
     'shibu',
-    'shibutani',
-    'shibuya',
-    'shico',
-    'shidehara',
-    'shiderly',
-    'shiego',
-    'shieh',
-    'shiehallion',
-    'shiekh',
-    'shiela-na-gig',
-    'shield-back',
-    'shield-holders',
-    'shield-hoops',
-    'shield-hung',
-    'shield-money',
     'shield-type',
-    'shield-wall',
-    'shieldlinks',
-    'shields&mdash',
-    'shields-based',
-    'shiella',
-    'shiells',
-    'shielton',
-    'shien',
-    'shienza',
-    'shiest',
-    'shifford',
-    'shifki',
-    'shifra',
-    'shift+alt',
-    'shift+alt+ctrl',
     'shift+ctrl',
-    'shift+del',
-    'shift+direction',
-    'shift+f6',
-    'shift+f7',
-    'shift+f8',
-    'shift-alt-f',
-    'shift-charge',
-    'shift-jis',
-    'shift-key',
-    'shift-lock',
-    'shift-rate',
-    'shift-tab',
-    'shift-working',
-    'shift.',
-    'shift/high',
     'shifta',
-    'shiftier',
-    'shiftin',
-    'shifting&mdash;see',
-    'shifting-cultivation',
-    'shifting.',
-    'shifting_away',
-    'shiftlessness',
-    'shifto',
-    'shifty-eyes-with-dandruff',
-    'shigata',
-    'shigeaki',
-    'shigematsu',
-    'shigemi',
-    'shigenaga',
-    'shigenobu',
     'shigetami',
-    'shigetomi',
-    'shigeyoshi',
-    'shiggelosis',
-    'shiguang',
-    'shiguero',
-    'shih-ch\'iao',
-    'shih-hsien',
-    'shih-shun',
-    'shih-yuan',
-    'shihab',
-    'shihabi',
-    'shihada',
-    'shiho',
-    'shiite-generated',
-    'shijo-dori',
     'shikaki',
-    'shikara',
-    'shikoh',
-    'shikoton',
-    'shikra',
-    'shiksa-feed',
-    'shiksah',
-    'shikses',
-    'shilansky',
-    'shilbottle',
-    'shildon-based',
-    'shildrick',
-    'shileds',
-    'shilelagh',
-    'shilena',
-    'shill-i-shall-i',
     'shilland',
-    'shillay',
-    'shillelaghs',
-    'shilli',
-    'shillied',
-    'shilling\'s-worth',
-    'shilling-paying',
-    'shilling-taker',
-    'shillings\'-worth',
-    'shillingside',
-    'shillito',
-    'shillman',
-    'shilluns',
-    'shilly&rehy;shallying',
-    'shilly-shallied',
-    'shilly-shalliers',
     'shilos',
-    'shilpa',
-    'shilpi',
-    'shils.',
-    'shilton.',
-    'shimane',
-    'shimar',
-    'shimba',
-    'shimbara',
-    'shimbu',
-    'shime',
-    'shimko',
-    'shimla',
-    'shimmen',
-    'shimmersilk',
-    'shimmery-sounding',
     'shimming',
-    'shimmings',
-    'shimmon',
-    'shimojo',
-    'shimoyamada',
-    'shimp-like',
-    'shimpling',
-    'shimshon',
-    'shimying.',
-    'shin\'',
-    'shin-bones',
-    'shin-high',
-    'shin-rengo',
-    'shin-splitting',
-    'shinagawa',
-    'shinageetel',
     'shinahota',
-    'shinai',
-    'shinano',
-    'shinawatra',
-    'shinbun',
-    'shincliffe',
-    'shindi',
-    'shine-dalgarno',
-    'shine-removing',
-    'shingle-headed',
-    'shingleton',
-    'shingling',
-    'shingo',
-    'shiniichiro',
-    'shinin\'',
-    'shining-star',
     'shinjiro',
-    'shinjuku-ku',
-    'shinjuro',
-    'shink',
-    'shinnecock',
-    'shinnick',
-    'shinobi',
-    'shinoussa',
-    'shinpad',
-    'shinpads',
-    'shinro',
-    'shinshu',
-    'shinshun',
-    'shinwells',
-    'shiny-black',
-    'shiny-clean',
     'shiny-elbowed',
-    'shiny-leaved',
-    'shiny-rippled',
-    'shiny-topped',
-    'shinyish',
-    'shiokawa',
-    'shiomi',
-    'shiongo',
-    'shionnach',
-    'ship&ndash',
-    'ship&rehy;killing',
-    'ship&rehy;shape',
-    'ship&rehy;wright',
-    'ship-',
-    'ship-army',
-    'ship-boys',
     'ship-breaker',
-    'ship-breaking',
-    'ship-broker',
-    'ship-broking',
-    'ship-canal',
-    'ship-chip',
-    'ship-design',
-    'ship-gobbling',
-    'ship-insurer',
-    'ship-launched',
-    'ship-load',
-    'ship-money',
-    'ship-mounted',
-    'ship-of-the-line',
-    'ship-operating',
-    'ship-prow',
     'ship-repairers',
-    'ship-running',
-    'ship-shaped',
-    'ship-sheds',
-    'ship-sloop',
-    'ship-to-fort',
-    'ship-wright',
-    'ship-yard',
-    'ship.',
-    'ship/train',
-    'shipa',
-    'shipanga',
-    'shipbreaker',
-    'shipbuilding/engineering',
-    'shipchandlers',
-    'shipdham',
     'shiphard',
-    'shipibo',
-    'shipibos',
-    'shiplake-on-thames',
-    'shiplap-clad',
-    'shipley-born',
-    'shiploader',
-    'shipmates.',
-    'shipment--expected',
-    'shipmoney',
-    'shippable',
-    'shippam',
-    'shipped.',
-    'shipper-owner',
-    'shipperies',
-    'shippes',
     'shipping-fleet',
-    'shipping/handling',
-    'shippings',
-    'shippon/oxfordshire',
-    'shiprepairers',
-    'ships\'sirens',
-    'ships-of-war',
-    'ships.',
-    'shipstal',
-    'shipstone',
-    'shipstones',
-    'shipstons',
-    'shipton-under-wychwood/oxfordshire',
-    'shipwood',
-    'shipworm',
-    'shipwrack',
     'shira',
-    'shiraa',
-    'shiraji',
-    'shiralee',
-    'shiraw',
-    'shirayama',
-    'shire-horses',
-    'shire-mares',
-    'shire-meeting',
-    'shireburn',
-    'shireburns',
-    'shireen',
-    'shiregreen',
-    'shirelake',
-    'shirely',
-    'shiremoor',
     'shirenewtown',
-    'shires-bred',
-    'shirey',
-    'shirin',
-    'shirinov',
-    'shirkin\'',
-    'shirkovsky',
-    'shirley-anne',
-    'shirley/michael',
-    'shirleys',
-    'shirly',
-    'shirom',
-    'shiromuji',
-    'shirra/captain/swindon',
-    'shirt-dress',
-    'shirt-dresses',
     'shirt-factory',
-    'shirt-like',
-    'shirt-neck',
-    'shirt-stud',
-    'shirt-tails',
-    'shirt-throwing',
-    'shirt-wearing',
-    'shirt/t-shirt',
-    'shirtbutton',
-    'shirtcollar',
-    'shirtfronts',
-    'shirting',
-    'shirtness',
-    'shirts-off',
-    'shirts.',
-    'shirts/blouses',
     'shirtwaist',
-    'shirty-something',
-    'shirvans',
-    'shirville',
-    'shirwin',
-    'shis',
-    'shish-kebab',
-    'shisha',
-    'shishido',
-    'shishkin',
-    'shishko',
-    'shisun',
-    'shit-arse',
-    'shit-bag',
-    'shit-box',
-    'shit-dumper',
     'shit-dumping',
-    'shit-eatingly',
-    'shit-face',
-    'shit-food',
-    'shit-for-drink',
-    'shit-hole',
-    'shit-houses',
-    'shit-juice',
-    'shit-kickin\'',
-    'shit-legs',
-    'shit-load',
-    'shit-pushers',
-    'shit-shit-shit',
-    'shit-smeared',
-    'shit-soiled',
-    'shit-stabber',
     'shit-stained',
-    'shit/all',
-    'shit/your',
-    'shit_all',
-    'shitawful',
-    'shitbox',
-    'shitcart',
-    'shite-hot',
-    'shiteating',
-    'shiteball',
-    'shitehawks',
-    'shitehouse',
-    'shites',
-    'shitey',
-    'shitface',
-    'shitfire',
     'shithouses',
-    'shitkickers',
-    'shitland',
-    'shitlington',
-    'shitlist',
-    'shitload',
-    'shitloads',
-    'shito-ryu',
-    'shiton',
-    'shitpot',
-    'shitrit',
-    'shitters',
-    'shittes',
-    'shittily',
-    'shitvolumes',
-    'shitwell',
     'shiu-kay',
-    'shivah',
-    'shivaji',
-    'shivekiar',
-    'shively',
-    'shivered.',
-    'shivery-shakes',
-    'shivinder',
-    'shivindor',
-    'shivite',
-    'shivpuri',
-    'shivs',
-    'shiwiar',
-    'shixth',
-    'shiyah',
-    'shizoku',
     'shizuko',
-    'shizushin',
-    'shjelstad',
-    'shkelqim',
-    'shklovskian',
-    'shkurnichestvo',
-    'shlapping',
-    'shlatter',
-    'shledanou',
-    'shleep',
-    'shlighe-sa',
-    'shlom',
-    'shlomith',
-    'shlyakhtin',
-    'shlykov',
-    'shm',
     'shmaltz',
-    'shmarov',
-    'shmatte',
-    'shmeckle',
-    'shmekov',
-    'shmichael',
-    'shmoozing',
-    'shneider',
-    'shnexnayder',
-    'shnorrers',
-    'shoaf',
-    'shoah',
-    'shoak',
-    'shoal-encumbered',
-    'shoal-lighthouse',
-    'shoal-mates',
     'shoalers',
-    'shoane',
-    'shoap',
-    'shoart',
-    'shoat',
-    'shoats',
-    'shobaki',
-    'shobdon',
-    'shobitajain',
-    'shobo',
-    'shocat',
-    'shochat',
-    'shock&rehy;absorbing',
-    'shock&rehy;packed',
-    'shock-ads-for-profit',
-    'shock-avoidance',
     'shock-darkened',
-    'shock-effects',
-    'shock-like',
-    'shock-reinforced',
-    'shock-resistant',
-    'shock-screens',
-    'shock-tactic',
-    'shock-treatment',
-    'shock-troop',
-    'shock-troops',
-    'shock/suspense',
-    'shockabilly',
-    'shockable',
-    'shockcord',
-    'shockeroo',
-    'shockguard',
     'shockin\'ly',
-    'shockley',
-    'shockpad',
-    'shockplate',
-    'shockproof',
-    'shocksafe',
-    'shod\'',
-    'shod-wave',
-    'shoddier',
-    'shoddiest',
-    'shodding',
-    'shoddywards',
-    'shode',
-    'shoe-adviser',
-    'shoe-binder',
-    'shoe-binding',
     'shoe-box-shaped',
-    'shoe-buckles',
-    'shoe-buying',
-    'shoe-clad',
-    'shoe-cleaning',
-    'shoe-eating',
-    'shoe-gazer',
-    'shoe-gazing-infatuated',
-    'shoe-gazy',
-    'shoe-horning',
-    'shoe-horns',
-    'shoe-hunting',
-    'shoe-in',
-    'shoe-less',
-    'shoe-makers',
-    'shoe-manufacturer',
     'shoe-mender',
-    'shoe-polishes',
-    'shoe-repair',
-    'shoe-shape',
-    'shoe-shapes',
-    'shoe-shined',
-    'shoe-soles',
-    'shoe-sponge',
-    'shoe-step',
-    'shoe-tree',
-    'shoe-trees',
-    'shoe-using',
-    'shoe-vamper',
-    'shoe.a',
-    'shoe/boot',
-    'shoebags',
     'shoeblacks',
-    'shoehorn-like',
-    'shoei',
-    'shoeing-smith',
-    'shoelaced',
-    'shoeload',
-    'shoeman',
-    'shoenberg',
-    'shoenut',
-    'shoer',
-    'shoes/i',
-    'shoes/ready',
-    'shoeshiners',
-    'shoeshining',
-    'shofar',
-    'shofelmeer',
     'shoft',
-    'shog',
-    'shogetsu',
-    'shoggly',
-    'shogunal',
-    'shoguni',
-    'shohat',
-    'shoja',
-    'shojo',
-    'shoka',
-    'shokat',
-    'shoko',
-    'shokumshun',
-    'sholing',
-    'sholl',
-    'shollais',
     'sholtz',
-    'shon',
-    'shona-speaking',
-    'shonagh',
-    'shone/community',
-    'shonekan',
-    'shoney',
-    'shongwe/swindon',
-    'shonjin',
-    'shoo-gaay',
-    'shooch',
-    'shoogly',
-    'shoogy-shaggy',
-    'shoolbred',
-    'shoolbreds',
-    'shooooo',
     'shooosh',
-    'shooshing',
-    'shoot\'-em-up',
-    'shoot-\'em',
-    'shoot-\'em-ups',
-    'shoot-em',
-    'shoot-from-the-hip',
-    'shoot-me-before-i-go-mad',
-    'shoot-off',
-    'shoot-the-bad-guys',
-    'shoot.',
-    'shooting-down',
-    'shooting-jacket',
-    'shooting-lodge',
-    'shooting-match',
-    'shooting-out',
     'shooting-parties',
-    'shooting-range',
-    'shooting-stars',
-    'shooting-sticks',
-    'shooting/heading',
-    'shootist',
-    'shootists',
-    'shoots/kicks',
-    'shootting',
-    'shop&rehy;keepers',
-    'shop-before-lunch',
-    'shop-boys',
-    'shop-brought',
-    'shop-closing',
-    'shop-cum-\'spiritual',
-    'shop-cum-guesthouse',
     'shop-cum-post',
-    'shop-cum-showroom',
-    'shop-door',
-    'shop-doorway',
-    'shop-dwellings',
-    'shop-fitter',
-    'shop-fitting',
-    'shop-fittings',
-    'shop-ledges',
-    'shop-lift',
-    'shop-lifters',
-    'shop-like',
-    'shop-lined',
-    'shop-painting',
-    'shop-purchased',
-    'shop-sized',
     'shop-taverns',
-    'shop-walker',
-    'shop-within-the-shop',
-    'shop-woman',
-    'shop-work',
-    'shop-worker',
-    'shop-worker-wary',
-    'shop-workers',
-    'shop-worn',
-    'shop.live',
-    'shop/a',
-    'shop/bar',
-    'shop/boutique',
-    'shop/business/company/restaurant',
-    'shop/cafe',
-    'shop/catering',
     'shop/gate',
-    'shop/in',
-    'shop/label',
-    'shop/meeting',
-    'shop/on',
-    'shop/point',
-    'shop/restaurant',
-    'shop/skateboard',
-    'shop/ski',
-    'shop/snack',
-    'shop/ticket',
-    'shopaholism',
-    'shopbreaker',
-    'shopbreaking',
-    'shopbreakings',
-    'shopface',
     'shopfittings',
-    'shopfix',
-    'shopflifting',
-    'shopfloors',
-    'shophouses',
-    'shoplights',
-    'shopmade',
-    'shopmen',
-    'shopocracy',
-    'shopowner',
-    'shopper-numbers',
-    'shopperss',
-    'shoppie',
-    'shopping&rehy;around',
-    'shopping\'',
-    'shopping-',
     'shopping-and&rehy;memo',
-    'shopping-bags',
-    'shopping-baskets',
-    'shopping-entertainment',
-    'shopping-malls',
-    'shopping-precinct',
-    'shopping-street',
-    'shopping-sunday',
-    'shopping-trips',
-    'shopping-trolley',
-    'shopping-world',
-    'shopping.she',
-    'shopping/',
-    'shopping/entertainment',
-    'shopping/leisure',
-    'shopping/marketing/trading',
     'shopping/sightseeing',
-    'shoppings',
-    'shoprite',
-    'shops-type',
-    'shops-windows',
-    'shops.hp-type',
-    'shops.it',
-    'shopuld',
-    'shopville',
-    'shopwalkers',
-    'shopwoman',
-    'shorbridge',
-    'shorden',
-    'shore-bank',
-    'shore-bound',
-    'shore-break',
     'shore-caught',
-    'shore-foam',
-    'shore-mud',
-    'shore-notably',
-    'shore-power',
-    'shore-sea',
-    'shore-side',
-    'shore.2',
-    'shore/nacro',
-    'shore_a',
-    'shorebased',
-    'shorebases',
-    'shorebury',
-    'shored-up',
-    'shorefishing',
-    'shoregoing',
     'shoreham-based',
-    'shorehead',
-    'shorelands',
-    'shoreless',
-    'shoremen',
-    'shorepower',
-    'shores-based',
-    'shores.',
-    'shores/cull/malizia',
-    'shorey',
-    'shorina',
-    'shorkley',
-    'shorland',
-    'shorn-haired',
-    'shorn-off',
-    'shorn/shaun/shawn',
     'shorne',
-    'shorned',
-    'short&mdash',
-    'short&mdash;or',
-    'short&rehy;cuts',
-    'short&rehy;hand',
-    'short&rehy;haul',
-    'short&rehy;lived',
-    'short&rehy;sightedly',
-    'short&rehy;tempered',
-    'short&rehy;termism',
-    'short-*****',
-    'short-and',
-    'short-and-long',
-    'short-and-mild',
-    'short-arse',
     'short-arsed',
-    'short-based',
-    'short-breathed',
-    'short-changers',
-    'short-coming',
-    'short-contract',
-    'short-courses',
-    'short-crested',
-    'short-cumings',
-    'short-distances',
-    'short-duration',
-    'short-faced',
-    'short-falling',
-    'short-fatness',
-    'short-fingered',
-    'short-funding',
     'short-fuse',
-    'short-gilt',
-    'short-grain',
-    'short-hair',
-    'short-hair-cutted',
-    'short-headed',
-    'short-hemmed',
-    'short-in',
-    'short-iron',
-    'short-ish',
-    'short-jointed',
-    'short-lease',
-    'short-leasehold',
-    'short-leet',
-    'short-length',
-    'short-line',
     'short-lists',
-    'short-liv',
-    'short-measure',
-    'short-medium',
-    'short-nor',
-    'short-nose',
-    'short-odds',
-    'short-paragraph',
-    'short-radius',
-    'short-reach',
-    'short-repayment-period',
-    'short-rhymed',
-    'short-robe',
-    'short-rotation',
-    'short-route',
-    'short-scaled',
     'short-sea',
-    'short-sentence',
-    'short-series',
-    'short-shield',
-    'short-shrifted',
-    'short-sight',
-    'short-sixes',
-    'short-skirt',
-    'short-sleeves',
-    'short-snorters',
-    'short-sterling',
-    'short-stories',
-    'short-sword',
-    'short-tail',
-    'short-term/emergency',
-    'short-throw',
     'short-trader',
-    'short-tubed',
-    'short-turfed',
-    'short-water',
-    'short-weapons',
-    'short-weight',
-    'short-wheel',
-    'short-whip',
-    'short-word',
-    'short/fine/dull',
-    'short/medium',
-    'short/mid',
-    'short/quick',
-    'short/thames',
-    'shorta',
-    'shortages&mdash;unemployment',
     'shortarse',
-    'shortbows',
-    'shortcake-like',
-    'shortchange',
-    'shortchanging',
-    'shortcircuit',
-    'shortcircuited',
-    'shortcircuiting',
-    'shortcovering',
-    'shorte',
-    'shorten/lengthen',
-    'shorter-acting',
-    'shorter-course',
-    'shorter-distance',
-    'shorter-growing',
-    'shorter-horned',
     'shorter-lasting',
-    'shorter-maturity',
-    'shorter-paper',
-    'shorter-phase',
-    'shorter-range',
-    'shorter-span',
-    'shorter-tempered',
-    'shorter-wavelength',
-    'shorterlived',
-    'shortest-billed',
-    'shortest-living',
-    'shortest-path',
-    'shortest-priced',
-    'shortest-route',
-    'shortfalled',
-    'shortfield',
     'shortform',
-    'shorthand-book',
-    'shorthand-typists',
-    'shorthand/jargon',
-    'shortholds',
-    'shorthop',
-    'shorthorn/galloway',
-    'shorthorn/highland',
-    'shortlife',
-    'shorton',
-    'shorts-clad',
-    'shorts-owned',
-    'shorts-to-be',
-    'shortscale',
-    'shortsight',
-    'shortsightedness/injustice/lack',
     'shortsleeved',
-    'shortstaffed',
-    'shortstop',
-    'shortwheelbase',
-    'shortwhile',
-    'shortwindedness',
-    'shorwell',
-    'shoshani',
-    'shoshone-bannock',
-    'shoshones',
-    'shostak',
-    'shostakovich-',
-    'shostakovichian',
-    'shot-bags',
-    'shot-blasting',
-    'shot-faced',
     'shot-firers',
-    'shot-firing',
-    'shot-glass',
-    'shot-holes',
-    'shot-in-newcastle',
-    'shot-in-the',
-    'shot-in-the-arm',
-    'shot-like',
-    'shot-list',
-    'shot-putt',
-    'shot-putting',
-    'shot-reverse-shot',
-    'shot-scarred',
-    'shot-size',
-    'shot-to-hell',
-    'shot-wyndowe',
     'shot.was',
-    'shot/attack',
-    'shot/tarred',
-    'shota',
-    'shotaro',
-    'shotbolt/youth',
-    'shotfirers',
-    'shotghun',
-    'shotgun-toting',
-    'shotguns-in',
-    'shothole',
-    'shotingo',
-    'shotput',
-    'shots/corners',
-    'shott',
-    'shotters',
     'shotterys',
-    'shottesbrooke',
-    'shottisham',
-    'shotton.',
-    'shotuing',
-    'shotwick',
-    'shotyk',
-    'shotz',
-    'shoud',
-    'shoukeir',
-    'shoul&rehy',
-    'should-be-condemned',
-    'should-clauses',
-    'should-know',
-    'should-read',
-    'should-she-leave-him',
     'should-she-love-him',
-    'should.',
-    'should.be',
-    'should/could',
-    'should/will',
-    'shouldall',
-    'shouldd',
-    'shoulde',
-    'shoulder&mdash',
-    'shoulder&rehy;charged',
-    'shoulder&rehy;deep',
-    'shoulder-bags',
-    'shoulder-barges',
-    'shoulder-bubble',
-    'shoulder-butted',
-    'shoulder-charging',
     'shoulder-deep',
-    'shoulder-excuse',
-    'shoulder-fired',
-    'shoulder-girdle',
-    'shoulder-height',
-    'shoulder-holder',
-    'shoulder-holstered',
-    'shoulder-injury',
-    'shoulder-less',
-    'shoulder-mouth',
-    'shoulder-pads',
-    'shoulder-satchels',
-    'shoulder-seam',
-    'shoulder-shaking',
-    'shoulder-shrug',
-    'shoulder-skimming',
     'shoulder-slings',
-    'shoulder-to-ceiling',
-    'shoulder/the',
-    'shoulderbags',
-    'shoulderblade',
-    'shoulderboards',
-    'shouldercheck',
-    'shoulderin',
-    'shoulderless',
-    'shoulderpads',
-    'shoulders/back',
-    'shoulderspan',
-    'shoulderstraps',
-    'shouldery',
-    'shouldn\'a',
-    'shouldn\'ts',
     'shoult',
-    'shoulthwaite',
-    'shoultz',
-    'shoup',
-    'shourbaji',
-    'shourie',
-    'shourter',
-    'shout-out',
-    'shout-swift',
-    'shout-up',
-    'shout.',
-    'shouted.',
-    'shouth',
-    'shouting.in',
-    'shoutline',
-    'shouts/hits',
     'shove-ha\'penny',
-    'shove-halfpenny',
-    'shove-off',
-    'shovel-like',
-    'shovel-off',
-    'shovel-sized',
-    'shovel.',
-    'shovelhead',
-    'shovell',
-    'shoveller',
-    'shovelles',
-    'shovellings',
-    'shovells',
-    'shoven',
-    'shover',
-    'shovers',
     'show&lsqb;s&rsqb',
-    'show&rehy;up',
-    'show\'rs',
-    'show-and-tell',
-    'show-bench',
-    'show-bib',
-    'show-bizzery',
-    'show-card',
-    'show-cards',
-    'show-cars',
-    'show-cased',
-    'show-ed',
-    'show-girl',
-    'show-mostly',
-    'show-of-force',
-    'show-pieces',
     'show-quality',
-    'show-reel',
-    'show-reels',
-    'show-standard',
-    'show-time',
-    'show-trials',
-    'show-us-yer-knockers',
-    'show-window',
-    'show-winning',
-    'show-work',
-    'show.back',
-    'show/background',
-    'show/national',
-    'show/stud',
-    'showalter',
-    'showbiz-patter',
     'showbiz-sports',
-    'showbizz',
-    'showcasting',
-    'showders',
-    'showdog',
-    'showeing',
-    'showell/co-driver',
-    'showens',
-    'shower-',
-    'shower-baths',
-    'shower-cabinet',
-    'shower-cubicle',
-    'shower-filled',
-    'shower-gel',
-    'shower-jets',
-    'shower-proof',
     'shower/bathroom',
-    'shower/dryer',
-    'showerage',
-    'showergel',
-    'showerpack',
-    'showertime',
-    'showes',
-    'showeth',
-    'showfield',
-    'showfronts',
-    'showgoers',
-    'showground.the',
-    'showgrower',
-    'showh',
-    'showhorse',
-    'showhorses',
     'showhouses',
-    'showin',
-    'showiness',
-    'showlaces',
-    'showman-like',
-    'showmanlike',
-    'showmaster',
-    'shown.',
-    'showne',
-    'showprint',
-    'showq',
-    'showqing',
-    'showsa',
-    'showtank',
-    'showtape',
-    'showthrough',
     'showus',
-    'shoy',
-    'shoyswell',
-    'shoyu',
-    'shozaburo',
-    'shozo',
-    'shp&mdash;social',
-    'shpar',
-    'shpowers',
-    'shqiptare',
-    'shr',
-    'shra',
-    'shrada',
-    'shrager-powell',
-    'shraley',
-    'shrank_away',
     'shrapnel-like',
-    'shrapnel-proof',
-    'shrapnel-scatter',
-    'shrapnel/roadrunner',
-    'shrapnell',
-    'shrave',
-    'shreader',
-    'shredbucker',
-    'shreddie',
-    'shreddrr',
-    'shredmaster',
-    'shres-based',
-    'shresthacommerce',
-    'shreveport',
-    'shrew-mice',
-    'shrewbury',
     'shrewd-hearted',
-    'shrewd-looking',
-    'shrewishness',
-    'shrewsbury\'',
-    'shrewsbury-aberystwyth',
-    'shrewsbury-based',
-    'shrewsbury-born',
-    'shrewsbury-chester',
-    'shrewsbury-hereford',
-    'shrewsbury-llandrindod',
-    'shrewsbury.they',
-    'shrewsbury/shropshire',
-    'shrewsburys',
-    'shri',
-    'shriek-as',
-    'shrieking.',
     'shriekingly',
-    'shriekings',
-    'shriekometer',
-    'shrillest',
-    'shrills/all',
-    'shrimp-and-rollmop',
-    'shrimp-farm',
-    'shrimp-seller',
-    'shrimp-sized',
-    'shrimp/anemone',
-    'shrimpfish',
-    'shrimpfly',
-    'shrimptons',
-    'shrinam',
-    'shrine&rehy;laden',
-    'shrine-building',
     'shrine-first',
-    'shrine-tree',
-    'shrines.',
-    'shrink-to-fit',
-    'shrinkage-time',
-    'shrinker',
-    'shrinkes',
-    'shrinkfit',
-    'shrinking-back',
-    'shrinking-on',
-    'shrinkle',
-    'shristava',
-    'shriteh',
-    'shrived',
-    'shriveling',
-    'shrivelled-looking',
     'shrivelled-up',
-    'shriving',
-    'shrlie',
-    'shroeder',
-    'shromazdeni',
-    'shrood',
-    'shroot',
-    'shropshire-based',
-    'shropshire-montgomeryshire',
-    'shropshireman',
-    'shropshlre',
-    'shrotria',
-    'shroud-covered',
-    'shroud-waving',
-    'shroud.',
-    'shrub-beds',
     'shrub-bordered',
-    'shrub-roses',
-    'shrubbery\'',
-    'shrubs.',
-    'shrubs.as',
-    'shrubs/grassland',
-    'shrubsole',
-    'shruder',
-    'shrug-it-all-off',
-    'shrug-of-the&rehy;shoulders-and-oh-what-the-hell',
-    'shrug-of-the-shoulders',
-    'shrug-that',
-    'shrugger',
-    'shrugging-off',
-    'shruggings',
-    'shrunk-back',
     'shrunken-looking',
-    'shrunkenly',
-    'shsh',
-    'shshing',
-    'sht',
-    'shtaff',
-    'shtakelberg',
-    'shteingel',
-    'shtetels',
-    'shtuck',
-    'shu\'aiba',
-    'shu-jung',
-    'shuaghr',
-    'shuaghra',
-    'shuaibah',
-    'shuala',
     'shuan-ch\'eng-tsu',
-    'shuangming',
-    'shubha',
-    'shubik.',
-    'shucker/local',
-    'shucking',
-    'shuckman',
-    'shucknell',
-    'shuckskin',
-    'shudder-\'this',
-    'shudder.',
-    'shuddup',
-    'shudras',
-    'shudy',
-    'shuel',
-    'shuf',
     'shuffalot',
-    'shuffle-board',
-    'shufflebeat',
-    'shuffleboard',
-    'shufflebottom',
-    'shufflingly',
-    'shuffs',
-    'shuhada',
-    'shuhei',
-    'shuhite',
-    'shuji',
-    'shuk',
-    'shukbah',
-    'shuke',
-    'shukhrat',
-    'shukle',
     'shuko',
-    'shukri',
-    'shulbrede',
-    'shulkai',
-    'shull',
-    'shulte',
-    'shulz',
-    'shum',
-    'shumacher',
-    'shumachers',
-    'shumariyah',
-    'shumate',
-    'shumch&uuml;n',
-    'shumikha',
-    'shumin',
-    'shumskiy',
     'shumsky',
-    'shunammite',
-    'shunde',
-    'shungiku',
-    'shungsep',
-    'shunju',
-    'shunna',
-    'shunnas',
-    'shunnish',
-    'shuntaro',
-    'shuntings',
-    'shunyata',
-    'shuonn',
-    'shuqing',
-    'shurey',
-    'shurflo',
     'shuri-te',
-    'shurikat',
-    'shuriken-starman',
-    'shurley',
-    'shurmer/senior',
-    'shurmurs',
-    'shurrup\'n\'have',
-    'shushan',
-    'shushenskoe',
-    'shushhh',
-    'shushtar',
-    'shusssshhh',
-    'shuswap',
-    'shut-eyed',
-    'shut-ins',
-    'shut-outs',
     'shut-tight',
-    'shutdown.',
-    'shute/tutor',
-    'shuteye',
-    'shutov',
-    'shutshutshut',
-    'shutt/taylor',
-    'shutt/tgwu',
-    'shutted',
-    'shutter&mdash',
-    'shutter-speed',
-    'shutterman',
-    'shuttin\'',
-    'shutting-down',
-    'shutting-up-shop',
-    'shuttle-bus',
     'shuttle-orbiter',
-    'shuttle.',
-    'shuttle/redgrove',
-    'shuttlecock-like',
-    'shuttlecocked',
-    'shuttlewood',
-    'shuttlings',
-    'shuttterbug',
-    'shutty',
-    'shuvalov',
-    'shuvalova',
-    'shuvorn',
-    'shuwaikh',
-    'shuxian',
-    'shvartzer',
-    'shved',
     'shw',
-    'shwayb',
-    'shwezigon',
-    'shwoo',
-    'shwooh',
-    'shwooo',
-    'shws',
-    'shy-eyed',
-    'shy-faced',
-    'shy-guy',
-    'shy-looking',
-    'shy/brash',
-    'shya',
-    'shyamadas',
-    'shyes',
-    'shyn',
     'shynah',
-    'shyne',
-    'shynende',
-    'shype',
-    'shyps',
-    'shyris',
-    'si&eacute;cle',
-    'si&eacute;ge',
-    'si&egrave;cles',
-    'si&ndash;st',
-    'si&rehy;hour',
-    'si\'',
-    'si-0',
-    'si-di-wi',
-    'si-kiang',
-    'si-o',
     'si-the-re-an',
-    'si1990',
-    'si3n4',
-    'siab',
-    'siac',
-    'siacupuncturists',
-    'siadatan',
-    'siaguru',
-    'siaka',
-    'sialis',
-    'sialoid',
-    'sialomucin',
-    'siam(7)',
-    'siamese-twin',
-    'siamese-twinned',
-    'siamesed',
     'sian.',
-    'sianel',
-    'sianfu',
-    'sians',
-    'siard',
-    'sias',
-    'siauliai',
-    'siavush',
-    'sib-regulated',
-    'sib/oft',
-    'sibacha',
-    'sibanda',
-    'sibane',
-    'sibartie',
-    'sibaya',
-    'sibbalds',
     'sibbert/trading',
-    'sibbet',
-    'sibbles',
-    'sibelian',
-    'sibella',
-    'sibenici',
-    'siberia\'',
-    'siberian-manchurian',
-    'siberianise',
-    'siberry',
-    'sibert',
-    'sibhion',
-    'sibhorpii',
-    'sibilant/hard-consonant',
-    'sibilantly',
-    'sibilatrix',
     'sibilla',
-    'sibillance',
-    'sibillations',
-    'sibiril',
-    'sibirskiye',
-    'sibling-thwarted',
-    'sibling/sibling',
-    'sibling/younger',
-    'siblinghood',
-    'sibneftepererabotka',
-    'siboga-expedition',
-    'sibomanaprime',
-    'sibson/stibbington',
-    'sibsp',
-    'sibte',
-    'sibthorp',
     'sibundo',
-    'sic&lsqb',
-    'sic&rehy;month',
-    'sic.',
-    'sic=\'suspicios',
-    'sic=\'txtual',
-    'sic=acknowledgment',
-    'sic=comittment',
-    'sic=contoller',
-    'sic=coverd',
-    'sic=disavantages',
-    'sic=idiosyncracies',
-    'sic=recenty',
-    'sic=there',
-    'sic=witten',
-    'sic=womenswomen',
     'sicam',
-    'sicario',
-    'sicartsa',
-    'sicav',
-    'sicca',
-    'siccama',
-    'siccus',
-    'sice',
-    'siceraria',
-    'sicherman',
-    'sicht',
-    'sichuanese',
-    'sici',
-    'sicilian-born',
-    'siciliana-where',
-    'siciliani',
     'siciliano',
-    'sicily-based',
-    'sicily-lipari',
-    'sick-',
-    'sick-a-bed',
-    'sick-absence',
-    'sick-bedside',
-    'sick-looking',
-    'sick-rooms',
-    'sick-to-the-gut',
-    'sick-to-your',
-    'sick-visiting',
-    'sick/',
-    'sick/handicapped',
-    'sick/maternity',
-    'sick/we',
     'sickbay',
-    'sicke',
-    'sickener\'',
-    'sickerts',
-    'sickhair',
-    'sickies',
-    'sickified',
-    'sickle-hocked',
-    'sickle-like',
-    'sickled',
-    'sicklehocked',
-    'sicklied',
-    'sicklier',
-    'sickliness',
-    'sickly-smelling',
-    'sickman',
     'sickness/absence',
-    'sickness/annual',
-    'sickness/special',
-    'sicknote',
-    'sickoes',
-    'sickos',
-    'sicl',
-    'sicord',
-    'sicuan',
-    'sicuani',
-    'sicuri',
-    'sid\'ahmed',
-    'sid-ud-dins',
-    'sid-y',
-    'sidac',
-    'sidalcea',
     'sidbury',
-    'sidda',
-    'siddarth',
-    'siddeshwari',
-    'siddhartha',
-    'siddhis',
-    'siddig',
-    'siddonindian',
-    'siddons/springhill',
-    'side&mdash',
-    'side&mdash;plaintiff',
-    'side&mdash;the',
-    'side&rehy;entrance',
-    'side&rehy;footed',
-    'side&rehy;tracked',
-    'side&rehy;windows',
     'side\'-have',
-    'side-aisle',
-    'side-aisles',
-    'side-aligned',
-    'side-bax',
-    'side-benches',
-    'side-benefits',
-    'side-boom',
-    'side-booth',
-    'side-branch',
-    'side-business',
-    'side-by',
-    'side-canal',
-    'side-carcross',
-    'side-chains',
-    'side-chair',
     'side-chapel',
-    'side-chapels',
-    'side-commentary',
-    'side-corridor',
-    'side-curls',
-    'side-demand',
-    'side-dish',
-    'side-drums',
-    'side-e&ndash;it',
-    'side-effects.so',
-    'side-elasticated',
-    'side-emptying',
-    'side-ends',
-    'side-facing',
-    'side-feathers',
-    'side-flaps',
     'side-footer',
-    'side-gated',
-    'side-glances',
-    'side-hall',
-    'side-have',
-    'side-headings',
-    'side-hill',
-    'side-issues',
-    'side-joins',
-    'side-lamp',
-    'side-length',
-    'side-lighting',
-    'side-lines',
-    'side-loader',
-    'side-look',
-    'side-looking',
     'side-office',
-    'side-opening',
-    'side-panel',
-    'side-passages',
-    'side-patch',
-    'side-path',
-    'side-pillars',
-    'side-play',
-    'side-pocket',
-    'side-pods',
-    'side-product',
-    'side-products',
-    'side-purposes',
-    'side-reaction',
-    'side-relief',
-    'side-rockets',
     'side-scatter',
-    'side-screen',
-    'side-shoot',
-    'side-shunting',
-    'side-slips',
-    'side-splitter',
-    'side-splittingly',
-    'side-spring',
-    'side-stage',
-    'side-stall',
-    'side-stalls',
-    'side-steped',
-    'side-stitched',
-    'side-stories',
-    'side-streams',
-    'side-stroke',
     'side-tanks',
-    'side-thrust',
-    'side-tone',
-    'side-tracks',
-    'side-trips',
-    'side-tunnels',
-    'side-up',
-    'side-view',
-    'side-ward',
-    'side-wards',
-    'side-wheeler',
-    'side-whiskered',
-    'side-wings',
-    'side-wrought',
-    'side.',
-    'side/',
     'side/edge',
-    'side/player',
-    'side/tail',
-    'side_as',
-    'sidearms',
-    'sidebats',
-    'sideboard.',
-    'sideborad',
-    'sidebottom/prisoner',
-    'sidecut',
-    'sidecuts',
-    'sidecutting',
-    'sidedness',
-    'sidegate',
-    'sideglass',
-    'sidehops',
     'sidek',
-    'sidelegs',
-    'sidelock',
-    'sidelocks',
-    'sidenoted',
-    'sidepath',
-    'sidepersons',
-    'sidepieces',
-    'sideplanting',
-    'sideplate',
-    'sideplated',
-    'sidepockets',
-    'sider&uacute;rgica',
-    'sider&uacute;rgicos',
-    'sideras',
-    'siderations',
     'sideritis',
-    'sideroots',
-    'siderophile',
-    'siderosticta',
-    'sideroxylon',
-    'sides.council',
-    'sides_with_respect',
-    'sidesaddle',
-    'sideshore',
-    'sideslipped',
-    'sidespins',
-    'sidesplitting',
-    'sidestrand',
-    'sideswiped',
-    'sideswiping',
-    'sidet',
     'sideviewing',
-    'sidewalkin\'',
-    'sideward',
-    'sideways-facing',
-    'sideways-gliding',
-    'sideways-moving',
-    'sidewheels',
-    'sidewise',
-    'sidework',
-    'sideywyes',
-    'sidham',
-    'sidhartha',
-    'sidied-up',
-    'sidique',
-    'sidiya',
-    'sidler',
     'sidnell',
-    'sidnum',
-    'sidon&ndash;beirut',
-    'sidor',
-    'sidorowiczhealth',
-    'sidqi',
-    'sidra',
-    'sidrach',
-    'sidrekapsi',
-    'sidrophel',
-    'sidthimunki',
-    'sidus',
-    'sidvale',
-    'sieben',
-    'siebenlist',
-    'sieberi',
     'sieboldii',
-    'siebu',
-    'sieburth',
-    'sieca',
-    'siecles',
-    'sied',
-    'siedle',
-    'siedlice',
-    'siege-economy',
-    'siege-tower',
-    'siege-towers',
-    'siege-troops',
-    'siege-works',
-    'siege.',
-    'siegels',
-    'siegenthaler',
     'siegery',
-    'siegeworks',
-    'siegfried.',
-    'sieghart/publisher',
-    'sieging',
-    'sieglinde',
-    'siegling',
-    'siegmar',
-    'siegwart',
-    'sieh',
-    'sielaff',
-    'siemaszdo',
-    'siemens-martin',
-    'siemens-rolm',
-    'siemens/gec',
-    'siemens/xentronics',
     'siemensstadt',
-    'siemenstadt',
-    'siemerink',
-    'siemieniuch/grant',
-    'sienkiewicz',
-    'sienna-coloured',
-    'siennas',
-    'sienne',
-    'siennese',
-    'sient',
-    'siento',
-    'siepi',
-    'sierbein',
-    'sierpinski',
-    'sierra-style',
-    'sierra/cavalier',
     'sierre',
-    'siess',
-    'siet',
-    'siev',
-    'sieve-like',
-    'sieve.',
-    'sieved.',
-    'siever',
-    'sieverts',
-    'sievier',
-    'siewert',
-    'siey&egrave;s',
-    'sieze',
-    'siezing',
-    'siezures',
-    'sifaka',
     'sifare',
-    'sifbronze',
-    'siferth',
-    'sifirwas',
-    'sifneos',
-    'sifnos',
-    'sifranos',
-    'sifrin',
-    'sifters',
-    'siftings',
-    'siftlik',
-    'sifton',
-    'sifuiva',
-    'sig-nora',
-    'sigbjorn',
-    'sigeferth',
     'sigelhearwan',
-    'sigeum',
-    'sigewulf',
-    'sigf&uacute;sson',
-    'sigg',
-    'siggers/astaire',
-    'sigh-',
-    'sigh-posted',
-    'sighel',
-    'sighes',
-    'sighing-that',
-    'sighisoara',
-    'sight&rehy;saving',
-    'sight-bite',
-    'sight-distances',
-    'sight-finding',
     'sight-impaired',
-    'sight-leading',
-    'sight-saving',
-    'sight-starved',
-    'sight-test',
-    'sight.and',
-    'sight/presence',
-    'sight/understanding',
-    'sighted.her',
-    'sighter',
-    'sightin\'',
-    'sighting-in',
-    'sightlessness',
-    'sightly',
-    'sightreading',
-    'sighvatur',
     'sigil',
-    'sigilata',
-    'sigismond',
-    'siglestorne',
-    'siglish',
-    'sigma&amp;sup1',
-    'sigma&amp;sup2',
-    'sigma-ray',
-    'sigman',
-    'sigmarite',
-    'sigmascan',
-    'sigmiodoscopy',
-    'sigmoid-rectal',
-    'sigmoid/',
-    'sigmoidoscopically',
-    'sign&rehy;based',
     'sign&rehy;ings',
-    'sign\'',
-    'sign-based',
-    'sign-board',
-    'sign-confusable',
-    'sign-extended',
-    'sign-group',
-    'sign-groups',
-    'sign-langauge',
-    'sign-language-dominated',
-    'sign-languages',
-    'sign-like',
-    'sign-making',
-    'sign-of',
-    'sign-painter',
-    'sign-post',
     'sign-quality',
-    'sign-theory',
-    'sign-to-english',
-    'sign-to-speech',
-    'sign-writer',
-    'sign-written',
-    'sign-wrote',
-    'sign.posting',
-    'sign/magnitude',
-    'sign/that',
-    'sign=offs',
-    'signaal',
-    'signal&eacute',
-    'signal&mdash',
-    'signal&ndash;box',
-    'signal-averaging',
     'signal-bearing',
-    'signal-code',
-    'signal-extraction',
-    'signal-lights',
-    'signal-like',
-    'signal-power-gain',
-    'signal/call',
-    'signal:control',
-    'signalise',
-    'signalised',
-    'signals-intelligence',
-    'signals.',
-    'signals/calls',
-    'signatura',
-    'signature-recognition',
-    'signed-binary',
     'signed-for',
-    'signed-off',
-    'signed-rank',
-    'signet-ring',
-    'signficance',
-    'signficantly',
-    'signi',
-    'signifer',
-    'signifers',
-    'signifi',
-    'signific',
-    'significance\'',
-    'significant&ndash',
-    'significant-looking',
-    'significantly.',
-    'significating',
     'significator',
-    'significent',
-    'signifidant',
-    'signifie',
-    'signifie.',
-    'signifier/signified',
-    'signin\'',
-    'signing-in',
-    'signing.',
-    'signings/appearances',
-    'signior',
-    'signiorial',
-    'signiorini',
-    'signless',
-    'signning',
-    'signo',
     'signoles',
-    'signorellis',
-    'signoret',
-    'signorine',
-    'signreading',
-    'signup',
-    'sigo',
-    'sigon',
-    'sigonella',
-    'sigridur',
-    'sigur',
-    'sigurdard&oacute;ttir',
-    'sigurimi',
-    'sigurjonsson',
-    'sigurnost',
-    'sigurthard&oacute;ttir',
     'sigurthsson',
-    'sigvec',
-    'sih4',
-    'siham',
-    'sihanouk-hun',
-    'sihanoukist-soc',
-    'sihi',
-    'sihon',
-    'siia',
-    'siim',
-    'siimann',
-    'sika&rehy;robot',
-    'sikandar',
-    'sikarobots',
-    'sikel',
-    'sikelile',
     'sikelle',
-    'sikerer',
-    'sikhist',
-    'sikita',
-    'sikker',
-    'siklos',
-    'sikorsky-fiat',
-    'sikota',
-    'sikrit',
-    'siksi',
-    'siku',
-    'sikujua',
-    'sil&egrave;ne',
-    'sila-nowicki',
-    'sila-oncommerce',
-    'silable',
     'siladzic',
-    'silaev',
-    'silages',
-    'silali',
-    'silanation',
-    'silandra',
-    'silanisation',
-    'silanized',
-    'silanols',
-    'silanov',
-    'silar',
-    'silasia',
-    'silatoli',
-    'silbergeld',
-    'silbermayr',
-    'silbernagl',
     'silberne',
-    'silberschmerze',
-    'silco',
-    'silcoates',
-    'silcretes',
-    'sild',
-    'sile',
-    'sileage',
-    'sileas',
-    'silecroft',
-    'silence&rehy;that',
-    'silence/drinking',
-    'silencingly',
-    'silenou',
-    'silent&mdash;but',
-    'silent-footed',
     'silent-movie',
-    'silent-screamingly',
-    'silent.3',
-    'silent.it',
-    'silentbloc',
-    'silentness',
-    'silentwriter&mdash;it',
-    'silenzed',
-    'silenzio',
-    'siler',
-    'siles',
-    'silesa',
-    'silesians',
-    'silesium',
-    'silesius',
-    'silford',
     'silglaze',
-    'silhouette-principle',
-    'silhouettists',
-    'silhoutted',
-    'silibubs',
-    'silica-',
-    'silica-garden',
-    'silica-immobilised',
-    'silicaceous',
-    'silical',
-    'silicate-rich',
-    'siliciclastics',
-    'silicification',
-    'silicious',
-    'silicite',
-    'silicoflagellate',
     'silicon(iv)',
-    'silicon-32',
-    'silicon-bismuth',
-    'silicon-bronze',
-    'silicon-gallium',
-    'silicone-based',
-    'silicone-coated',
-    'silicone/rubber',
-    'siliconix',
-    'siliconizing',
-    'silicosis-sufferer',
-    'silicott',
-    'siligrove',
-    'siliguri',
-    'silii',
-    'silikon',
     'siliquae',
-    'siliquastrum',
-    'siliquoidea',
-    'siliquosa',
-    'silk&rehy;stockinged',
-    'silk-and-cashmere',
-    'silk-and-satin',
-    'silk-buyer',
-    'silk-canopied',
-    'silk-compatible',
-    'silk-gloved',
-    'silk-hatted',
-    'silk-hung',
-    'silk-jersey',
-    'silk-manufacturing',
-    'silk-moth',
     'silk-resembled',
-    'silk-sheathed',
-    'silk-slashed',
-    'silk-soft',
-    'silk-stockings',
-    'silk-swathed',
-    'silk-tie',
-    'silk-weaver',
-    'silk-winding',
-    'silk-woven',
-    'silk/satin',
-    'silk/viscose',
-    'silka',
-    'silken-patterned',
-    'silken-shoulder',
-    'silken-smooth',
     'silken-turbaned',
-    'silkenly',
-    'silkenthighs',
-    'silkier',
-    'silkiest',
-    'silkless',
-    'silklook',
-    'silkman',
-    'silkmoths',
-    'silko',
-    'silkscreen-on-metal',
-    'silkscreened',
-    'silkscreens',
-    'silktail',
-    'silkweed',
-    'silky-finish',
     'silky-pale',
-    'silky-plumed',
-    'silky-smooth',
-    'silky-white',
-    'silky/rayon/polyester',
-    'sillabubs',
-    'sillacybin',
-    'sillamae',
-    'sillans',
-    'sillar',
-    'sillbourne',
-    'silled',
-    'sillees',
-    'sillence',
-    'sillerton',
-    'sillett/hereford',
     'silley',
-    'sillick',
-    'sillie',
-    'silliman',
-    'sillimanite',
-    'sillinesses',
-    'sillitoe&amp;m',
-    'sillitoe/climber',
-    'sillographs',
-    'sillon',
-    'sillwood',
-    'silly-buggers',
-    'silly-like',
-    'silly-little-me-late-again-ish',
-    'silly-looking',
-    'silly-mid-scone',
     'silly-point',
-    'silly-season',
-    'sillywilly',
-    'silmarillion\'',
-    'siloa',
-    'silolota',
-    'silouetted',
-    'siloxy',
-    'silq',
-    'silsila',
-    'silstar',
-    'silt-filled',
-    'silt-laden',
-    'silt-like',
-    'silt-sized',
-    'silt/clay',
     'silt/organic',
-    'silt/sand',
-    'siltasaarenk',
-    'siltier',
-    'silting-up',
-    'silton',
-    'siluria',
-    'silurian/early',
-    'silurist',
-    'silvacommunication',
-    'silvaesa',
-    'silvaires',
-    'silvalux',
-    'silvania',
-    'silvanian',
-    'silvano',
     'silvea',
-    'silveira',
-    'silveiro',
-    'silver&rehy;grey',
-    'silver-banded',
-    'silver-beaded',
-    'silver-bearded',
-    'silver-bearing',
-    'silver-blonde',
-    'silver-bound',
-    'silver-bright',
-    'silver-bubble',
-    'silver-chased',
-    'silver-collared',
-    'silver-content',
-    'silver-copper-sulphide',
     'silver-encrusted',
-    'silver-fish',
-    'silver-flecked',
-    'silver-flooded',
-    'silver-foil',
-    'silver-foliaged',
-    'silver-frosted',
-    'silver-grain',
-    'silver-greys',
-    'silver-handled',
-    'silver-headed',
-    'silver-knobbed',
-    'silver-lead',
-    'silver-leafed',
-    'silver-lined',
-    'silver-loaded',
     'silver-medallist',
-    'silver-mercury',
-    'silver-mesh',
-    'silver-papered',
-    'silver-plate',
-    'silver-polishing',
-    'silver-sandalled',
-    'silver-sheathed',
-    'silver-shod',
-    'silver-shoed',
-    'silver-sided',
-    'silver-silver',
-    'silver-skipper',
-    'silver-skirted',
-    'silver-soldered',
-    'silver-spoon',
     'silver-spooned',
-    'silver-spotted',
-    'silver-stamped',
-    'silver-stone',
-    'silver-streaked',
-    'silver-sulphide',
-    'silver-thread',
-    'silver-threaded',
-    'silver-tinted',
-    'silver-top',
-    'silver-train',
-    'silver-veined',
-    'silver-ware',
-    'silver-wimpled',
-    'silver-winged',
-    'silver-wiring',
     'silver/consultant/spinal',
-    'silver/dive',
-    'silver/laserline',
-    'silver/solicitor',
-    'silver/zinc',
-    'silvera',
-    'silverback',
-    'silverballs',
-    'silverbird',
-    'silverboard',
-    'silverbound',
-    'silverburst',
-    'silvercloth',
-    'silverfur',
-    'silverglass',
-    'silverheels',
     'silverknowes',
-    'silverknowes/granton',
-    'silverlady',
-    'silverleaf',
-    'silvermere',
-    'silvermoor',
-    'silvero',
-    'silverpainted',
-    'silverplated',
-    'silverpoints',
-    'silvershine',
-    'silversides',
-    'silversmith-cum-general',
-    'silverspa',
-    'silverspoon',
-    'silverston/chelsea',
     'silverstone-based',
-    'silverstream',
-    'silverthorne',
-    'silvertrees',
-    'silvery-blue',
-    'silvery-cream',
-    'silvery-crowned',
-    'silvery-leaved',
-    'silvery-pale',
-    'silvery-yellow',
-    'silvestretrade',
-    'silvestris',
-    'silvipasture',
-    'silvius',
-    'silwood',
-    'silybum',
     'silyl',
-    'silylated',
-    'sim&atilde;o',
-    'sim\'an',
-    'sim-luing',
-    'sim-weighted',
-    'sim0n',
-    'simancas',
-    'simandl',
-    'simanggang',
-    'simanowitz',
-    'simao',
-    'simatai',
-    'simatupang',
-    'simavi',
-    'simax',
     'simazine-based',
-    'simba/communications',
-    'simbar',
-    'simbarakiye',
-    'simbarakiyepublic',
-    'simbodyal',
-    'simbolo',
-    'simbongile',
-    'simbulan',
-    'simbun',
-    'simcha',
-    'simcox/severn',
-    'simd/mimd',
-    'sime/apollo',
-    'sime/deputy',
-    'simel',
     'simenson',
-    'simeonov',
-    'simethicone',
-    'simetite',
-    'simeto',
-    'simha',
-    'simians',
-    'simiar',
-    'simiawood',
-    'simil',
-    'similar-although',
-    'similar-coloured',
-    'similar-format',
-    'similar-powered',
-    'similar-spec',
-    'similar.',
     'similar/legend',
-    'similaris',
-    'similarites',
-    'similarlooking',
-    'similarly-affected',
-    'similarly-birdseyed',
-    'similarly-caused',
-    'similarly-coloured',
-    'similarly-configured',
-    'similarly-controlled',
-    'similarly-emotionally',
-    'similarly-shaped',
-    'similarly-underrated',
-    'similarsounding',
-    'simili',
-    'similiarities',
     'similiarity',
-    'similiarly',
-    'similibus',
-    'similimum',
-    'similitudes',
-    'simillium',
-    'siminovitch',
-    'simitis',
-    'simizine',
-    'simkinses',
-    'simko',
-    'simma',
-    'simmalavong',
-    'simme',
-    'simmental-type',
-    'simmer-stop',
     'simmerer',
-    'simmermann',
-    'simmerson',
-    'simmery',
-    'simmetry',
-    'simmie',
-    'simmies',
-    'simmon',
-    'simmonite',
-    'simmonite/women',
-    'simmons/hereford',
-    'simmons/laser',
-    'simmons/patient',
-    'simmons/rotunda',
-    'simmons/vitez',
-    'simmonsjustice',
     'simmonswood',
-    'simmonte',
-    'simmonton',
-    'simms/family',
-    'simms/wallingford',
-    'simnplky',
-    'simom',
-    'simon&mdash;the',
-    'simon&rehy;who',
-    'simon-barron',
-    'simon/sunshine',
-    'simona',
-    'simonde',
-    'simonetta',
-    'simoniac',
-    'simoniacal',
     'simonie',
-    'simonise',
-    'simonite',
-    'simonka',
-    'simons/deputy',
-    'simons/gr',
-    'simonsbath',
-    'simonside',
-    'simontons',
-    'simonyi',
-    'simoom',
-    'simor',
-    'simovic',
-    'simp&aacute;tico',
-    'simp\'ring',
-    'simphonie',
     'simpkins/danielle',
-    'simpkiss',
-    'simplate',
-    'simple&rehy;minded',
-    'simple-',
-    'simple-complex',
-    'simple-deep',
-    'simple-mindedly',
-    'simple-parent',
-    'simple-to-administer',
-    'simple-to-follow',
-    'simple-to-grasp',
-    'simple-to-operate',
-    'simple-to-read',
-    'simple.',
-    'simple.you',
     'simple/advanced',
-    'simplefit',
-    'simpler-natured',
-    'simples-collectors',
-    'simplicated',
-    'simplicicolis',
-    'simplicism',
-    'simplicit&eacute',
-    'simplicitie',
-    'simplicity\'',
-    'simplicity.',
-    'simplicty',
-    'simplicus',
-    'simpliest',
-    'simplificate',
-    'simplificatory',
     'simplify-and-idealize',
-    'simpling',
-    'simplizissimus',
-    'simplo',
-    'simplomatic',
-    'simply&rehy;furnished',
-    'simply-administered',
-    'simply-far',
-    'simply-spoken',
-    'simply-stated',
-    'simply_in',
-    'simpson-charles',
-    'simpson-orlebar',
-    'simpson/',
-    'simpson/australian',
-    'simpson/australians',
     'simpson/daughter',
-    'simpson/grandaughter',
-    'simpson/presentation',
-    'simpson/vet',
-    'simpsons\'',
-    'sims/acting',
-    'sims/beekeepers',
-    'sims/teasdale',
-    'simsons',
-    'simstat',
-    'simuchimba',
-    'simuitaneous',
-    'simulacres',
-    'simularia',
-    'simulation-based',
-    'simulationem',
     'simult',
-    'simultan&eacute;e',
-    'simultan&eacute;it&eacute',
-    'simultan&eacute;ment',
-    'simultaneism',
-    'simultaneit&agrave',
-    'simultaneities',
-    'simultaneos',
-    'simultaneously.',
-    'simultaniously',
-    'simultanism',
-    'simultanisme',
-    'simultanisme-librettisme',
-    'simvastin',
-    'sin&uacute',
-    'sin-binning',
     'sin-deny',
-    'sin-gle',
-    'sin-itiro',
-    'sin-kiang',
-    'sin-nay-ma',
-    'sin-sick',
-    'sin.s',
-    'sinaas',
-    'sinacalia',
-    'sinachi',
-    'sinah',
-    'sinaitic',
-    'sinaiticus',
-    'sinally',
-    'sinamoi',
-    'sinapis',
     'sinapisms',
-    'sinapsis',
-    'sinasina-youngumgi',
-    'sinatra-outs',
-    'sinatra-style',
-    'sinatra/jagger/jive',
-    'sinatratype',
-    'sinbat',
-    'sinbearing',
-    'sinbinned',
-    'sinble',
-    'since&mdash',
-    'since-dissolved',
-    'since-fallen',
-    'since-his',
-    'since.the',
     'since1983',
-    'since1986',
-    'sinced',
-    'sincere/wet',
-    'sincerely/yours',
-    'sincerer',
-    'sincerities',
-    'sincerley',
-    'sincerly',
-    'sincipita-stevedore',
-    'sinclair-lockhart',
-    'sinclair-poulton',
-    'sinclair/avon',
-    'sinclair/dermatologist',
-    'sinclair/royal',
-    'sinclair/wiltshire',
     'sincock',
-    'sincure',
-    'sindacato',
-    'sindaharaye',
-    'sindal',
-    'sindarin',
-    'sindebahd',
-    'sindecut',
-    'sindelar',
-    'sindhri',
-    'sindhu',
-    'sindibad',
-    'sindicalista',
-    'sindicatos',
-    'sindikubwabo',
-    'sindos',
     'sindre',
-    'sindys',
-    'sineadist',
-    'sineads',
-    'sinecurists',
-    'sinem',
-    'sinemurian',
-    'sinergy',
-    'sinevicius',
-    'sinew-hardened',
-    'sinfonias',
-    'sinfonietta/thomas',
-    'sinful\'',
-    'sinful/corrupt',
-    'sing-',
-    'sing-a-longs',
     'sing-po',
-    'sing-songed',
-    'singaloada',
-    'singalongaknife',
-    'singalongamax',
-    'singalongasteg',
-    'singalongaswans',
-    'singapore-bound',
-    'singapore-cambridge',
-    'singapore-headquartered',
-    'singapuras',
-    'singaris',
-    'singarounds',
-    'singelenn\'',
-    'singelmann',
-    'singer-',
     'singer-and-songwriter',
-    'singer-comediennne',
-    'singer-composer',
-    'singer-guitarist',
-    'singer-impressionist',
-    'singer-songwriter-storyteller',
-    'singer-strummers',
-    'singer-turned',
-    'singer-turned-actor',
-    'singer/actor',
-    'singer/actress',
-    'singer/composer',
-    'singer/songwriter/activist',
-    'singer/songwriters',
-    'singer/writer',
-    'singeries',
     'singers.',
-    'singers/composers',
-    'singers/spicer',
-    'singerspecial',
-    'singes',
-    'singet',
-    'singh/newsagent',
-    'singh/police',
-    'singhal',
-    'singhgeneral',
-    'singhing',
-    'singier',
-    'singin\'n\'jiving',
-    'singing-man',
-    'singing-master',
-    'singing-nun',
     'singing-places',
-    'singing-telegram',
-    'singing/dancing',
-    'single&ndash;car',
-    'single&ndash;sheet',
-    'single&rehy;breasted',
-    'single&rehy;contract',
-    'single&rehy;cylinder',
-    'single&rehy;issue',
-    'single&rehy;minded',
-    'single&rehy;mindedness',
-    'single&rehy;parent',
-    'single&rehy;seat',
-    'single&rehy;storeyed',
-    'single&rehy;stranded',
-    'single-a-1',
     'single-a-plus',
-    'single-action',
-    'single-application',
-    'single-arched',
-    'single-are',
-    'single-aspect',
-    'single-assailant',
-    'single-authority',
-    'single-b',
-    'single-bar',
-    'single-bedded',
-    'single-blind',
-    'single-blot',
-    'single-book',
-    'single-brooded',
-    'single-bulb',
     'single-buoy',
-    'single-buying',
-    'single-called',
-    'single-campus',
-    'single-camshaft',
-    'single-candidate',
-    'single-chimneyed',
-    'single-class',
-    'single-clause',
-    'single-clawed',
-    'single-club',
-    'single-college',
-    'single-company',
-    'single-consonant',
-    'single-country',
-    'single-cpu',
     'single-crop',
-    'single-cutaway',
-    'single-digest',
-    'single-dimension',
-    'single-discipline',
-    'single-dollar',
-    'single-door',
-    'single-dose',
-    'single-drawer',
-    'single-drop',
-    'single-edged',
-    'single-element',
-    'single-emission',
-    'single-ends',
-    'single-energy',
-    'single-entendres',
     'single-enterprise',
-    'single-entry',
-    'single-exit',
-    'single-faceted',
-    'single-female',
-    'single-fins',
-    'single-fisherman',
-    'single-flight',
-    'single-flowered',
-    'single-flowers',
-    'single-foundress',
-    'single-frequency',
-    'single-fronted',
-    'single-groove',
-    'single-handers',
-    'single-handicap',
     'single-headed',
-    'single-hearted',
-    'single-hit',
-    'single-hole',
-    'single-hood',
-    'single-hump',
-    'single-humped',
-    'single-in-line',
-    'single-in-waiting',
-    'single-indicator',
-    'single-input',
-    'single-institutional',
-    'single-judge',
-    'single-lamp',
-    'single-lane',
-    'single-launch',
     'single-layered',
-    'single-leg',
-    'single-licence',
-    'single-longitudinal',
-    'single-malt',
-    'single-man',
-    'single-minded-sized',
-    'single-model',
-    'single-mother',
-    'single-motherhood',
-    'single-mothers',
-    'single-needle',
-    'single-node',
-    'single-objective',
-    'single-occupant',
-    'single-pane',
     'single-paragraph',
-    'single-parry',
-    'single-pass',
-    'single-path',
-    'single-payer',
-    'single-payment',
-    'single-pensioner',
-    'single-petalled',
-    'single-pilot-panel',
-    'single-plant',
-    'single-plate',
-    'single-platformed',
-    'single-point-of-view',
-    'single-pointed',
-    'single-pole',
-    'single-portion',
     'single-premium',
-    'single-putt',
-    'single-rail',
-    'single-rate',
-    'single-reed',
-    'single-roomed',
-    'single-row',
-    'single-sailed',
-    'single-season',
-    'single-shell',
-    'single-sideband',
-    'single-skill',
-    'single-slit',
-    'single-sourced',
-    'single-speaker',
-    'single-specialty',
     'single-species',
-    'single-spouted',
-    'single-spouting',
-    'single-spread',
-    'single-staircase',
-    'single-stallion',
-    'single-stand',
-    'single-stem',
-    'single-stepping',
-    'single-strength',
-    'single-string',
-    'single-stroke',
-    'single-suckled',
-    'single-supplier',
-    'single-tail',
-    'single-take',
     'single-task',
-    'single-teacher',
-    'single-term',
-    'single-terminal',
-    'single-tone',
-    'single-towered',
-    'single-transferable',
-    'single-trial',
-    'single-unit',
-    'single-use',
-    'single-value',
-    'single-valued',
-    'single-venue',
-    'single-verse',
-    'single-vineyard',
-    'single-well',
     'single-width',
-    'single-willed',
-    'single-worded',
-    'single-workstation',
-    'single.address',
-    'single.phase',
-    'single/breasted',
-    'single/double',
-    'singleborough',
-    'singledecker',
-    'singlemindedly',
-    'singlemode',
-    'singles\'\'',
-    'singles-buying',
-    'singles-compilation',
-    'singles.',
     'singles/doubles',
-    'singles/students',
-    'singlesheet',
-    'singlestick',
-    'singleton/prisoner',
-    'singleton/yasserarafat/the',
-    'singlewell',
-    'singolare',
-    'singpho',
-    'sings/',
-    'singsaneh',
-    'singsanehfinance',
-    'singson',
-    'singsonged',
-    'sington',
-    'singularization',
     'singularly-depressed',
-    'singularum',
-    'singulatum',
-    'singuler',
-    'sinhala-speakers',
-    'sinhala-speaking',
-    'sinhalese-majority',
-    'sinhg',
-    'sinibaldi',
-    'sinica',
-    'sinigaglia',
-    'siniora',
-    'siniperca',
-    'sinisalu',
-    'siniscalchi',
-    'sinister\'',
     'sinister/fontana',
-    'sinisterly-named',
-    'sinisters',
-    'sinistre',
-    'sinistrorse',
-    'sinit',
-    'sinita',
-    'sinix-based',
-    'siniy',
-    'sink-bath',
-    'sink-edge',
-    'sink-into',
-    'sink-or-swim',
-    'sink-until',
-    'sink/source',
-    'sinkfuls',
     'sinkiang-uighur',
-    'sinkiangs',
-    'sinking-speak',
-    'sinking/in',
-    'sinkins',
-    'sinkler',
-    'sinkloads',
-    'sinkside',
-    'sinky',
-    'sinnamary',
-    'sinner-a',
-    'sinnes',
-    'sinneth',
-    'sino-albanian',
-    'sino-america',
-    'sino-cambodian',
     'sino-foreign',
-    'sino-german',
-    'sino-indonesian',
-    'sino-lao',
-    'sino-north',
-    'sino-spanish',
-    'sino-thai',
-    'sinodun',
-    'sinoia',
-    'sinologists',
-    'sinology',
-    'sinophile',
-    'sinophiles',
-    'sinot',
-    'sinovial',
-    'sinowilsonia',
     'sinpo',
-    'sinsabaugh',
-    'sintacel',
-    'sintagro',
-    'sinters',
-    'sintes',
-    'sinting',
-    'sintis',
-    'sintrabanano',
-    'sintram',
-    'sintrom',
-    'sinuatum',
-    'sinularias',
-    'sinuosity',
-    'sinuousness',
-    'sinus(oid)',
     'sinyavsky',
-    'sinzinger',
-    'sio2',
-    'siobahn',
-    'sioe',
-    'siome',
-    'sioned',
-    'sioners',
-    'sionit',
-    'sions',
-    'siostaloir',
-    'sioufas',
-    'siouxie',
-    'sip-well',
-    'sip/guzzle',
-    'sipah-i-sabahah-i-pakistan',
     'siphai',
-    'siphogonuchitids',
-    'siphon-snort',
-    'siphonate',
-    'siphoned-off',
-    'siphonophores',
-    'sipila',
-    'sipp-green',
-    'sippanond',
-    'sipper-guzzler',
-    'sippets',
-    'sipps',
-    'siput',
-    'siquieroli',
-    'sir&egrave;nes',
-    'sir&mdash',
     'sir-i',
-    'sir-mix-a-lot',
-    'sir-thomas',
-    'siracourt',
-    'siracusa',
-    'sirajul',
-    'siran',
-    'sirant',
-    'sirapite',
-    'sirazi',
-    'sircar',
-    'sirculians',
-    'sirdars',
-    'siren-call',
-    'siren-screaming',
-    'siren-song',
     'siren-suited',
-    'siren-victim-criminal',
-    'sirendra',
-    'sirenia',
-    'sirenians',
-    'sirenomelia',
-    'sirian',
-    'siriasis',
-    'siriphanit',
-    'sirit',
-    'siritsu',
-    'siriz',
-    'sirkar',
-    'sirl',
-    'sirmadamsirmadam',
-    'sirne',
     'siro-dbms',
-    'siroki',
-    'siroky',
-    'sironen',
-    'sirop',
-    'sirpa',
-    'sirros',
-    'sirse',
-    'sirtalis',
-    'sirtis',
-    'sirus',
-    'sirvent',
-    'sirventes',
-    'sis-q',
-    'sisakht',
-    'sisal/cord',
     'sisaleumsak',
-    'sisamnes',
-    'siscia',
-    'sisgoreus',
-    'sisikyou',
-    'sisisthal',
-    'sismi',
-    'sismondi',
-    'sisobyk',
-    'sisoumang',
-    'sispa',
-    'sisquoc',
-    'sissen',
-    'sissin',
-    'sissolution',
-    'sissonne',
     'sisted',
-    'sistelecom',
-    'sistema',
-    'sistemi',
-    'sistency',
-    'sister&mdash;she',
-    'sister\'',
-    'sister(s)',
-    'sister-',
-    'sister-cell',
-    'sister-city',
-    'sister-hospital',
-    'sister-hunting',
-    'sister-in-',
-    'sister-in-charge',
-    'sister-in-law-to-be',
     'sister-knew',
-    'sister-newspaper',
-    'sister-parties',
-    'sister-queens',
-    'sister-senses',
-    'sister-town',
-    'sister/',
-    'sister/mother',
-    'sister/soft',
-    'sister/staff',
-    'sister_over',
-    'sister_provided',
-    'sisteradmission-ward',
-    'sisterlike',
-    'sisterliness',
-    'sisters-in',
     'sistership',
-    'sisth',
-    'sisthy',
-    'sistiana',
-    'sisting',
-    'sistu',
-    'sistuhs',
-    'sisty',
-    'sisulus',
-    'siswono',
-    'sisxth',
-    'sisymbrium',
-    'sisyphus-like',
-    'sit(uation)',
-    'sit-',
-    'sit-bag',
     'sit-down/stand-up',
-    'sit-on-the-fence',
-    'sit-up-and-beg',
-    'sit-up-and-beg-bike',
-    'sit-upon',
-    'sit/flat',
-    'sitaki',
-    'sitalkes',
-    'sitamarhi',
-    'sitamun',
-    'sitanarhi',
-    'sitar-playing',
-    'sitar-sounding',
-    'sitastugan',
-    'sitchensis',
-    'sitcom-land',
     'sitcommunity',
-    'sitdown',
-    'site(s)',
-    'site-by-site',
-    'site-dependence',
-    'site-dependent',
-    'site-faithful',
-    'site-independent',
-    'site-preparation',
-    'site-recce',
-    'site-specificity',
-    'site-stratification',
-    'site-types',
-    'site.it',
-    'site.the',
-    'sitella',
     'siter',
-    'sites&mdash;as',
-    'sites-for',
-    'sites.1',
-    'sites.families',
-    'sites/parks',
-    'sithar',
-    'sithern',
-    'sitings',
-    'sition',
-    'sitive',
-    'sitkas',
-    'sitque',
-    'sitra',
-    'sitraihss',
-    'sits_in',
     'sits_on',
-    'sittenfeld',
-    'sitter-in',
-    'sitter/artist/spectator',
-    'sitter/companion',
-    'sitters-up',
-    'sittersdorf',
-    'sittest',
-    'sitteth',
-    'sittin',
-    'sitting-day',
-    'sitting-in',
-    'sitting-up',
-    'sitting/buffet',
-    'sitting:in',
-    'sittyton',
     'situ&eacute',
-    'situ&eacute;s',
-    'situ-prank',
-    'situation\'',
-    'situation-bound',
-    'situation-comedy',
-    'situation-fragment',
-    'situation-free',
-    'situation-independent',
-    'situation.',
-    'situation.2',
-    'situation/difficult',
-    'situationist-inspired',
-    'situations/circumstances',
-    'situations/customers',
-    'situe',
     'situla',
-    'situm',
-    'situps',
-    'situta&rehy;tion',
-    'sitwellian',
-    'sitye',
-    'sitzb.',
-    'siung',
-    'siva-nataraja',
-    'sivalensis',
-    'sivalik',
-    'sivananasiddhiyar',
-    'sivapithecines',
-    'sivaprasadarao',
-    'sivard',
-    'sivebaek',
     'sivertsen',
-    'sivgin',
-    'sivret/editor/gloucestershire',
-    'sivry-sur-meuse',
-    'siwah',
-    'siwalik',
-    'siwan',
-    'siwar',
-    'siwards',
-    'siwertell',
-    'six&mdash;red',
-    'six&mdash;year&mdash;old',
-    'six&ndash;car',
-    'six&rehy',
-    'six&rehy;blade',
-    'six&rehy;former',
     'six&rehy;inch',
-    'six&rehy;masted',
-    'six&rehy;minute',
-    'six&rehy;thirty',
-    'six-10',
-    'six-a&rehy;side',
-    'six-a-sides',
-    'six-album',
-    'six-all',
-    'six-and-',
-    'six-and-a-half-hour',
-    'six-article',
-    'six-atom',
-    'six-axle',
-    'six-bagged',
-    'six-base',
     'six-bathroom',
-    'six-bed',
-    'six-bedded',
-    'six-bedrooms',
-    'six-beige',
-    'six-bit',
-    'six-blade',
-    'six-bladed',
-    'six-bottle',
-    'six-buttoned',
-    'six-by-three',
-    'six-cd',
-    'six-century',
-    'six-coach',
-    'six-colour',
-    'six-column',
     'six-columned',
-    'six-coordinated',
-    'six-county',
-    'six-cup',
-    'six-cylinders',
-    'six-day-a-week',
-    'six-days-a-week',
-    'six-decades-old',
-    'six-degree',
-    'six-disc',
-    'six-door',
-    'six-eighteen',
-    'six-eleven',
-    'six-end',
-    'six-engined',
-    'six-episode',
     'six-feet-six',
-    'six-feet-two',
-    'six-festivals-a-weekend',
-    'six-fingered',
-    'six-foot-four-plus-a-bit',
-    'six-foot-long',
-    'six-foot-six-inch',
-    'six-foot-sixer',
-    'six-foot-square',
-    'six-foot-tall',
-    'six-foot-three-inch',
-    'six-footers',
-    'six-form',
-    'six-four',
-    'six-frame',
-    'six-function',
     'six-guns',
-    'six-hair',
-    'six-hits',
-    'six-hitting',
-    'six-hole',
-    'six-hundred',
-    'six-hundred-foot',
-    'six-in-a-row',
-    'six-in-line',
-    'six-inch-tall',
-    'six-inches',
-    'six-ish',
-    'six-language',
-    'six-letter',
-    'six-lot',
-    'six-monthers',
     'six-nighter',
-    'six-nil',
-    'six-nine',
-    'six-o-six',
-    'six-of-one',
-    'six-one',
-    'six-panel',
-    'six-phase',
-    'six-player',
-    'six-plus-two',
-    'six-point-plan',
-    'six-post',
-    'six-pot',
-    'six-processor',
-    'six-record',
-    'six-rider',
     'six-rink',
-    'six-roomed',
-    'six-rounder',
-    'six-runner',
-    'six-sectioned',
-    'six-segment',
-    'six-session',
-    'six-seven',
-    'six-sevenths',
-    'six-sheet',
-    'six-shooters',
-    'six-spot',
-    'six-spotted',
-    'six-stanza',
-    'six-step',
-    'six-stepped',
     'six-stitch',
-    'six-subject',
-    'six-talks',
-    'six-team',
-    'six-tenths',
-    'six-th-s',
-    'six-thousand-footers',
-    'six-thousand-talent',
-    'six-three',
-    'six-timer',
-    'six-tine',
-    'six-to-seven',
-    'six-ton',
-    'six-two-six-two-oh-one-three',
-    'six-vaned',
-    'six-vehicle',
     'six-vessel',
-    'six-week-long',
-    'six-weeks-dead',
-    'six-weeks-old',
-    'six-wheelers',
-    'six-wire',
-    'six-woman',
-    'six-yarder',
-    'six-zero',
-    'six.',
-    'six/eight',
-    'sixbedroomed',
-    'sixcom',
-    'sixep',
-    'sixieme',
-    'sixmonth',
     'sixpack',
-    'sixpence-a-week',
-    'sixpenny-sized',
-    'sixpennyworth',
-    'sixshooters',
-    'sixsixsixxxxxxxxxxxxxxxxxxxxxx',
-    'sixtee',
-    'sixteen-',
-    'sixteen-cylinder',
-    'sixteen-legged',
-    'sixteen-man',
-    'sixteen-mile',
-    'sixteen-month-old',
-    'sixteen-notch',
-    'sixteen-ounce',
-    'sixteen-paragraph',
     'sixteen-race',
-    'sixteen-sided',
-    'sixteen-storey',
-    'sixteen-thirty',
-    'sixteen-to-eighteen-year-old',
-    'sixteen-tooth',
-    'sixteen-year',
-    'sixteen-year&rehy;old',
-    'sixteen-years-old',
-    'sixteen.',
-    'sixteen/christophers',
-    'sixteener',
-    'sixteenth-and',
-    'sixteenth-birthday',
-    'sixteenth-nineteenth',
-    'sixteenth-or',
     'sixteenth-seventeenth',
-    'sixteenth-to',
-    'sixteenth/early',
-    'sixteenthcentury',
-    'sixth-end',
-    'sixth-fourth',
-    'sixth-magnitude',
-    'sixth-or',
-    'sixth-placed',
-    'sixth-round',
-    'sixth-sense',
-    'sixth-to',
-    'sixties-',
-    'sixties/early',
-    'sixtieth-birthday',
-    'sixtus',
     'sixty&rehy;four-hour',
-    'sixty&rehy;seven&rehy;hour',
-    'sixty&rehy;year',
-    'sixty-acres',
-    'sixty-by-twenty-metre',
-    'sixty-cycle',
-    'sixty-day',
-    'sixty-five-foot',
-    'sixty-five-minute',
-    'sixty-fives',
-    'sixty-fold',
-    'sixty-forty',
-    'sixty-four-hour',
-    'sixty-four-year',
-    'sixty-live',
-    'sixty-man',
     'sixty-member',
-    'sixty-one-year',
-    'sixty-page',
-    'sixty-per',
-    'sixty-per-cent',
-    'sixty-second',
-    'sixty-seven-hour',
-    'sixty-seven-year-old',
-    'sixty-seventh',
-    'sixty-six-storey',
-    'sixty-strong',
-    'sixty-third',
-    'sixty-two-year-old',
-    'sixty-watt',
-    'sixtyish',
-    'sixtynine',
     'sixtyone',
-    'sixx',
-    'siyan',
-    'siyuan',
-    'size&ndash',
-    'size-12',
-    'size-15',
-    'size-24',
-    'size-3',
-    'size-altering',
-    'size-analyst',
-    'size-and-weight-of-head',
-    'size-class',
-    'size-confusion',
-    'size-differences',
-    'size-grading',
     'size-scale',
-    'size-selected',
-    'size-seven',
-    'size-similar',
-    'size-three',
-    'size.',
-    'size.i',
-    'size/colour',
-    'size/complexity',
-    'size/height',
-    'size/number',
-    'size/shape/colour',
-    'size/shell',
-    'sizeable-looking',
-    'sizeably',
-    'sizeism',
     'sizer',
-    'sizes&mdash;a',
-    'sizes.but',
-    'sizes/prices',
-    'sizes/tolerance/requirements',
-    'sizewise',
-    'sizing-up',
-    'sizism',
-    'sizy',
-    'sizzlers',
-    'sizzlin\'',
-    'sizzlingly',
-    'sj&aacute;fstaedisflokkurinn',
-    'sj&aacute;lfstaedisflokkurinn',
-    'sj&ocirc;sten',
-    'sj&ouml;blom',
     'sj-30',
-    'sj-40',
-    'sj/cd114',
-    'sjadzali',
-    'sjamboks',
-    'sjb',
-    'sjihd/dgm',
-    'sjm',
-    'sjobergundy',
-    'sjuro',
-    'sjursen',
-    'sjuzet',
-    'sk&emacr;n&emacr',
-    'sk&oacute;gr',
-    'sk&ouml;ldm',
-    'sk-edek&mdash;socialist',
     'sk/',
-    'sk1.3bn',
-    'sk12',
-    'sk200m',
-    'sk220',
-    'sk3',
-    'sk350m',
-    'sk580',
-    'sk890',
-    'ska-loving',
-    'skaa-funk',
-    'skadden',
-    'skaden',
-    'skaer(1981)it',
-    'skaftafellsj&ouml;kull',
-    'skagast&ouml;lstind',
     'skagastoltind',
-    'skagen',
-    'skagerrack',
-    'skaggs',
-    'skagway&ndash;juneau',
-    'skakkebaek',
-    'skalded',
-    'skalk',
-    'skambonidai',
-    'skanda',
-    'skandinsky',
-    'skanked',
-    'skanking',
-    'skanska',
-    'skanti',
-    'skaraborg',
     'skarbalius',
-    'skarie',
-    'skarke',
-    'skarloey',
-    'skarns',
-    'skarpass',
-    'skatches',
-    'skate-and-potato',
-    'skate-blades',
-    'skateboarding-',
-    'skatefreaks',
-    'skatellites',
-    'skater-directors',
-    'skatewear',
-    'skathi',
-    'skating-rinks',
     'skatonians',
-    'skatrers',
-    'skayting',
-    'skd1',
-    'ske',
-    'skeats',
-    'skedaddle',
-    'skeddadled',
-    'skee-eaz',
-    'skeef',
-    'skeetered',
-    'skeeteringly',
-    'skeetes',
-    'skeets',
-    'skeggi',
-    'skegness-manchester',
     'skehan',
-    'skehan/paul',
-    'skeidar&aacute;rsandur',
-    'skeieeen',
-    'skelcher',
-    'skeldergate',
-    'skelet',
-    'skeleto-muscular',
-    'skeleton-boosting',
-    'skeleton-cleric',
-    'skeleton-covered',
-    'skeleton-crew',
-    'skeleton-frame',
-    'skeleton-key',
-    'skeleton-like',
-    'skeletonal',
     'skeletonised',
-    'skeletonites',
-    'skeletor',
-    'skelgill',
-    'skell',
-    'skelley',
-    'skellingthorpe',
-    'skellington',
-    'skells',
-    'skelmasdale',
-    'skelmersdale-based',
-    'skelmey',
-    'skelmorlie',
-    'skelped',
-    'skelping',
-    'skelton-arpley',
     'skelton/english',
-    'skelton/henry',
-    'skemersdale',
-    'skenda',
-    'skende',
-    'skender-mctaggart',
-    'skenderija',
-    'skeos',
-    'skepings',
-    'skeppargatan',
-    'skepper',
-    'skepticisms',
-    'skeptics',
-    'skeptikos',
-    'skeres',
-    'skern/taxi-driver',
     'skerret',
-    'skerritts',
-    'skerrymor.',
-    'skerton',
-    'sketch-books',
-    'sketch-leaf',
-    'sketch-map',
-    'sketch-pads',
-    'sketch-show',
-    'sketch-titles',
-    'sketch-writer',
-    'sketches/photos/diagrams',
-    'sketchleys',
-    'sketchpads',
-    'sketchwriter',
-    'sketos',
     'sketterskelfe',
-    'skettles',
-    'skeumorph',
-    'skeuomorphic',
-    'skevington',
-    'skew-arch',
-    'skew-hermitian.',
-    'skew-knotted',
-    'skew-wiff',
-    'skewbalds',
-    'skewen',
-    'skewer.',
-    'skewly',
-    'skewwhiff',
-    'skhira',
-    'skhiri',
     'skhul',
-    'ski&rehy;equipped',
-    'ski&rehy;ing',
-    'ski&rehy;pilots',
-    'ski-77tows',
-    'ski-area',
-    'ski-bargains',
-    'ski-bindings',
-    'ski-boots',
-    'ski-bum',
-    'ski-cabin',
-    'ski-caps',
-    'ski-chair',
-    'ski-chalet',
-    'ski-club',
-    'ski-drive',
     'ski-ed',
-    'ski-flap',
-    'ski-flop',
-    'ski-guide',
-    'ski-guiding',
-    'ski-hat',
-    'ski-hire',
-    'ski-holiday',
-    'ski-jumping',
-    'ski-marching',
-    'ski-masks',
-    'ski-mountaineers',
-    'ski-pants',
-    'ski-pole',
-    'ski-racing',
-    'ski-road',
     'ski-schools',
-    'ski-specific',
-    'ski-suits',
-    'ski-surf',
-    'ski-tan',
-    'ski-tourer',
-    'ski-track',
-    'ski-type',
-    'ski/boot/binding',
-    'skiary',
-    'skias',
-    'skiba',
-    'skiboot',
-    'skiboots',
-    'skibums',
-    'skibus',
     'skiclub',
-    'skid-mark',
-    'skid-resistance',
-    'skid-rink',
-    'skid-steer-loaders',
-    'skidbladnir',
-    'skidbrooke',
-    'skiddin\'',
-    'skiddingly',
-    'skiddish',
-    'skidlid',
-    'skidmark',
-    'skidoos',
-    'skidpan',
-    'skids-under',
-    'skie',
     'skies/',
-    'skiet',
-    'skiffia',
-    'skiffler',
-    'skigear',
-    'skikda',
-    'skikholm',
-    'skil&rehy;ful',
-    'skilfu\'',
-    'skilful-stage',
-    'skilfulful',
-    'skilfullness',
-    'skilfully-handled',
-    'skilfully-made',
-    'skilfully-marketed',
-    'skilfully-packaged',
     'skilfully-planned',
-    'skilfully-written',
-    'skilift',
-    'skilken',
-    'skill-',
-    'skill-acquisition',
-    'skill-development',
-    'skill-free',
-    'skill-intensive',
-    'skill-learning',
-    'skill-mix',
-    'skill-orientated',
-    'skill-shortages',
-    'skill-swopping',
-    'skill-train',
-    'skill-trained',
     'skill-use',
-    'skill/',
-    'skillcraft',
-    'skilled-man',
-    'skilled.',
-    'skilled/bored',
-    'skilled/qualified',
-    'skilled/semi-skilled',
-    'skillerlized',
-    'skillfully-wrought',
-    'skillfulness',
-    'skillnet',
-    'skills--ranging',
-    'skills-centred',
-    'skills-culture',
-    'skills-levels',
     'skills-training',
-    'skills-updating',
-    'skills.',
-    'skills.rivers',
-    'skills/',
-    'skills/abilities/aptitudes',
-    'skills/an',
-    'skills/forming',
-    'skills/ideas-based',
-    'skills/job',
-    'skills/relationships',
-    'skills/training',
-    'skills_as',
-    'skillseekers',
-    'skillwisely',
-    'skilly',
     'skim-milk',
-    'skim-net',
-    'skim-read',
-    'skimble',
-    'skimmed-milk',
-    'skimmity',
-    'skimover',
-    'skimpin',
-    'skimps',
-    'skin&rehy;tight',
-    'skin-',
-    'skin-absorption',
-    'skin-boats',
-    'skin-burrowing',
-    'skin-changer',
-    'skin-coloured',
     'skin-colouring',
-    'skin-colours',
-    'skin-conditioning',
-    'skin-contact',
-    'skin-covered',
-    'skin-covering',
-    'skin-cracking',
-    'skin-creams',
-    'skin-dive',
-    'skin-diver',
-    'skin-flint-swimmer',
-    'skin-flintery',
-    'skin-fold',
-    'skin-folds',
-    'skin-food',
-    'skin-friendly',
     'skin-glands',
-    'skin-graft',
-    'skin-hammers',
-    'skin-heads',
-    'skin-of-the-teeth',
-    'skin-peeling',
-    'skin-popping',
-    'skin-safe',
-    'skin-scorcher',
-    'skin-sensitive',
-    'skin-shedding',
-    'skin-silkening',
-    'skin-smoothing',
-    'skin-surface',
-    'skin-test',
-    'skin-tingling',
     'skin-to-skin',
-    'skin-tone',
-    'skin-toned',
-    'skin-whitening',
-    'skin-winged',
-    'skin-wriggling',
-    'skin/and',
-    'skin/enlarged',
-    'skin_a',
-    'skinand',
-    'skinbasher',
-    'skindivers',
-    'skinflaps',
-    'skinfuls',
-    'skingsley',
-    'skingy',
     'skinhead-style',
-    'skinhead/nf',
-    'skinheady',
-    'skinlessness',
-    'skinlike',
-    'skinned-looking',
-    'skinned-off',
-    'skinner-type',
-    'skinner/casualty',
-    'skinner/consultant',
-    'skinner/gilmerton',
-    'skinneresque',
-    'skinness',
-    'skinniest',
-    'skinnily',
-    'skinnned',
     'skinny-bits',
-    'skinny-gutted',
-    'skinny-ribbed',
-    'skinnymalinks',
-    'skinnyness',
-    'skinpopping',
-    'skins/race',
-    'skinside',
-    'skinsman',
-    'skinster',
-    'skintoned',
-    'skip-factor',
-    'skip-over',
-    'skip-owner',
-    'skip-read',
-    'skip-reading',
     'skipalsky',
-    'skipass',
-    'skipd',
-    'skipjacks',
-    'skipload',
-    'skippe',
-    'skipper/examiner',
-    'skippetty',
-    'skippetty-hopped',
-    'skippin\'',
-    'skippon',
-    'skiptia',
-    'skipton&ndash;lancaster',
-    'skiptov',
-    'skipworth',
-    'skircoat',
     'skirlbeck',
-    'skirls',
-    'skirmisher',
-    'skirmishes.',
-    'skiros',
-    'skiroutes',
-    'skirret',
-    'skirring',
-    'skirt-chaser',
-    'skirt-chasing',
-    'skirt-covered',
-    'skirt-edge',
-    'skirt-folds',
-    'skirt-full',
-    'skirt-hem',
-    'skirt-jeans',
     'skirt-length',
-    'skirt-lengths',
-    'skirt-shaped',
-    'skirt.',
-    'skirt/shoes',
-    'skirth',
-    'skirting&rehy;boards',
-    'skirting-boards',
-    'skirtingboard',
-    'skirty',
-    'skirving/daughter',
-    'skischools',
-    'skiside',
-    'skiss',
-    'skisuit',
-    'skisuits',
     'skitchy',
-    'skiting',
-    'skitterdale',
-    'skittle-ground',
-    'skivertex-clad',
-    'skivington',
-    'skizzenbuch',
-    'skjalgsson',
-    'skjelstad',
-    'skjomen',
-    'skks',
-    'skl&mdash;finnish',
-    'sklar-becker',
-    'sklenar',
-    'skobelev',
-    'skobtsova',
     'skocik',
-    'skocjan',
-    'skogeeth',
-    'skoit',
-    'skolar',
-    'skolaskin',
-    'skold',
-    'skole',
-    'skolithos',
-    'skolnik',
-    'skolnikon',
-    'skols',
-    'skomski',
-    'skoob',
-    'skoolgate',
-    'skools',
     'skoosh',
-    'skopads',
-    'skopas',
-    'skopelos',
-    'skopjc',
-    'skopos',
-    'skorpions',
-    'skott',
-    'skoulde',
-    'skousen',
-    'skovde',
-    'skr107',
-    'skr1100m',
-    'skr115',
-    'skr17',
-    'skr19',
     'skr20',
-    'skr248m',
-    'skr2600m',
-    'skr28',
-    'skr331m',
-    'skr392',
-    'skr4000m',
-    'skr400m',
-    'skr500m',
-    'skr7.40',
-    'skr70',
-    'skr9500m',
-    'skraelings',
-    'skrandert',
-    'skrating',
-    'skratta',
     'skraw-aak',
-    'skrawny',
-    'skreeee',
-    'skreeeees',
-    'skrees',
-    'skreta',
-    'skrewbowski',
-    'skrewdriver',
-    'skrezeczkowska',
-    'skriker',
-    'skrimshire',
-    'skrine',
-    'skriv',
-    'skrjabinagia',
-    'skroo',
-    'skryed',
     'skrynnikov',
-    'skrzypek',
-    'skubiszewskiforeign',
-    'skuh-wod',
-    'skuld',
-    'skulker',
-    'skulkers',
-    'skull\'n\'crossbones',
-    'skull-amulet',
-    'skull-collared',
-    'skull-cracking',
-    'skull-flame',
-    'skull-rock',
-    'skull-rooted',
-    'skull-splitting',
-    'skull.numbing',
     'skull/temple',
-    'skullbusting',
-    'skullcracker',
-    'skulled',
-    'skullman',
-    'skulls/bones/japanese',
-    'skullsheath',
-    'skullshill',
-    'skulptur',
-    'skunk-drunk',
-    'skunk-weed',
-    'skunked',
-    'skunkmarks',
-    'skup',
-    'skurry',
-    'skurtfu',
     'skutchii',
-    'skuul',
-    'sky\'',
-    'sky\'s-your-limit',
-    'sky-asserting',
-    'sky-bar',
-    'sky-burials',
-    'sky-clad',
-    'sky-clawing',
-    'sky-coloured',
-    'sky-cover',
-    'sky-darkening',
-    'sky-edge',
-    'sky-embracing',
-    'sky-filling',
-    'sky-fires',
     'sky-flying',
-    'sky-gazed',
-    'sky-goddess',
-    'sky-grey',
-    'sky-larked',
-    'sky-led',
-    'sky-lit',
-    'sky-piercing',
-    'sky-pilot',
-    'sky-proof',
-    'sky-reaching',
-    'sky-rocketed',
-    'sky-rockets',
-    'sky-scraper',
-    'sky-scraper-packed',
-    'sky-scraper-stacked',
     'sky-scrapers',
-    'sky-scything',
-    'sky-tv',
-    'sky-writing',
-    'sky/bbc',
-    'sky/bsb',
-    'skyank',
-    'skybolt/polaris',
-    'skybond',
-    'skyboshed',
-    'skycap',
-    'skycaps',
-    'skye/believed',
-    'skyeman',
-    'skyer',
-    'skyfilling',
     'skyful',
-    'skyhawks',
-    'skyhigh',
-    'skyhooks',
-    'skylark-like',
-    'skylaw',
-    'skyline&mdash;the',
-    'skyline-ridge',
-    'skylined',
-    'skylolimne',
-    'skynet',
-    'skynews',
-    'skynnes',
-    'skyphone',
-    'skyport',
-    'skyr',
     'skyreholme',
-    'skyriote',
-    'skyrmans',
-    'skyrme/captain',
-    'skyrne',
-    'skyrockets',
-    'skyrud',
-    'skysail-yarders',
-    'skyscene',
-    'skyscraper-high',
-    'skyscraping',
-    'skyscrapingly',
-    'skyshow',
-    'skyspaces',
-    'skysport.',
-    'skystorm-god',
     'skytalk',
-    'skytel',
-    'skytours',
-    'skytrack',
-    'skytram',
-    'skytyping',
-    'skyumpies',
-    'skyving',
-    'skywardly',
-    'skywings',
-    'skywriter',
-    'sl&eogon;zaki',
-    'sl&ndash;dco',
-    'sl-1082a',
-    'sl-1082p',
-    'sl-ow-ly',
     'sl-superloft',
-    'sl01',
-    'sl1',
-    'sl13',
-    'sl7',
-    'sla-occupied',
-    'sla/',
-    'sla/jackie',
-    'sla/patsy',
-    'sla/roger',
-    'slab-built',
-    'slab-delicacy',
-    'slab-derived',
-    'slab-induced',
-    'slab/bow',
-    'slab/bow-shaped',
     'slab/under',
-    'slabbish',
-    'slablike',
-    'slabsided',
-    'slabstone',
-    'slabstones',
-    'slachtneill',
-    'slack-baked',
-    'slack-breasted',
-    'slack-lipped',
-    'slack-ma-girdle',
-    'slack-sailed',
-    'slackbridge',
-    'slackskin',
-    'slacky',
-    'sladdery',
     'sladdin',
-    'sladeburn',
-    'slader',
-    'slades',
-    'sladian',
-    'slaes',
-    'slag-face',
-    'slag-holes',
-    'slag-ladies',
-    'slag-off',
-    'slag.',
-    'slagg',
-    'slagger',
-    'slaggy',
-    'slaghuis',
-    'slagstad',
     'slagterier',
-    'slain\'',
-    'slalom-style',
-    'slalomist',
-    'slam-bangers',
-    'slam-dances',
-    'slam-shell',
-    'slam-type',
-    'slam-winning',
-    'slama',
-    'slammin\'',
-    'slammockin\'',
-    'slamp',
-    'slanderers',
-    'slanes',
-    'slange',
     'slanged',
-    'slanging-match',
-    'slangs',
-    'slant-featured',
-    'slant-polarised',
-    'slant-walls',
-    'slanty',
-    'slap-and-tickle',
-    'slap-back',
-    'slap-bangs',
-    'slap-down',
-    'slap-slap',
-    'slap-smack',
-    'slap.',
-    'slapback',
-    'slape',
     'slapeta',
-    'slapheads',
-    'slapin',
-    'slappity',
-    'slark',
-    'slash&rehy;and-burn',
-    'slash\'n\'sideburn',
-    'slash-',
-    'slash-and-bum',
-    'slash-and-dash',
-    'slashbackgnarler',
-    'slashers',
-    'slashingly',
-    'slaski',
-    'slat-backed',
-    'slate-bed',
     'slate-built',
-    'slate-eyed',
-    'slate-fixing',
-    'slate-green',
-    'slate-paved',
-    'slate-pits',
-    'slate-quarries',
-    'slate-quarry',
-    'slate-roof',
-    'slate-tiled',
-    'slate.',
-    'slateblue',
-    'slated-in',
-    'slateford-balerno',
-    'slater-plasterer',
-    'slater-walker',
     'slater/australian',
-    'slater/ms',
-    'slater/study',
-    'slates/',
-    'slates/tiles',
-    'slatestone',
-    'slateyness',
-    'slatford/didcot',
-    'slatina',
-    'slaton',
-    'slatted-wood',
-    'slatter/farmer',
-    'slatterys',
-    'slaty-purple',
-    'slaugh&rehy;tering',
-    'slaughter-cart',
     'slaughter.he',
-    'slaughter/gloucestershire',
-    'slaughtered-pig-like',
-    'slaughterfest',
-    'slaughterhouse-5',
-    'slaunting',
-    'slav&mdash;greek&mdash;latin',
-    'slav-greek-viking',
-    'slav-speakers',
-    'slavdom',
-    'slave&rehy;owner',
-    'slave-auction',
-    'slave-builders',
-    'slave-driven',
-    'slave-drivers',
-    'slave-edwards/',
     'slave-hunting',
-    'slave-ish',
-    'slave-king',
-    'slave-like',
-    'slave-makers',
-    'slave-oared',
-    'slave-plantation',
-    'slave-power',
-    'slave-rags',
-    'slave-raiding',
-    'slave-servitors',
-    'slave-ship',
-    'slave-status',
-    'slave-trader',
-    'slave/narcotics',
-    'slave/serf',
     'slavedriver',
-    'slavegirls',
-    'slaveholding',
-    'slavek',
-    'slaverin\'',
-    'slaverings',
-    'slavery\'\'',
-    'slavgorod',
-    'slavgorodsky',
-    'slavi',
-    'slavica',
-    'slavinski',
-    'slavists',
-    'slavkosk&yacute',
-    'slavks',
-    'slavo',
     'slavonians',
-    'slavonic-speaking',
-    'slavonski',
-    'slavophil',
-    'slavophone',
-    'slawische',
-    'slawomir',
-    'slayde',
-    'slayed',
-    'slayeth',
-    'slayn',
-    'slayne',
-    'slayney',
-    'slazenber',
-    'slb-6200j1',
-    'slbc',
     'slc',
-    'slcc',
-    'slcm',
-    'sle&aacute;n',
-    'sle&ccaron;no',
-    'sleak',
-    'slean',
-    'sleanor',
-    'sleaze-bag',
-    'sleaze-balls',
-    'sleaze-hound',
-    'sleazeballs',
-    'sleaziest-ever',
-    'sleazily',
-    'sleaziness',
-    'sleazy-looking',
     'slebech',
-    'slebsager/denmark',
-    'slection',
-    'sledd',
-    'sleddale',
-    'sledding',
-    'sledge-a',
-    'sledge-block',
-    'sledge-hammered',
-    'sledgehammer-heat',
-    'sledgehammering',
-    'sledmore',
-    'slee-eep',
-    'sleectors',
-    'sleek-furred',
-    'sleek-headed',
     'sleek-jawed',
-    'sleek-looking',
-    'sleeked-down',
-    'sleekit',
-    'sleekways',
-    'sleep-',
-    'sleep-argument',
-    'sleep-around',
-    'sleep-conducive',
-    'sleep-crammed',
-    'sleep-creased',
-    'sleep-cycles',
-    'sleep-deprivation',
-    'sleep-destroying',
-    'sleep-dirt',
-    'sleep-dream',
     'sleep-famished',
-    'sleep-filled',
-    'sleep-inducing',
-    'sleep-learning',
-    'sleep-line',
-    'sleep-logged',
-    'sleep-muddled',
-    'sleep-muffled',
-    'sleep-onset',
-    'sleep-out',
-    'sleep-puffed',
-    'sleep-reduction',
-    'sleep-save',
-    'sleep-sodden',
-    'sleep-talker',
-    'sleep-time',
     'sleep-tousled',
-    'sleep-walkers',
-    'sleep-weary',
-    'sleep.',
-    'sleep.9',
-    'sleep/',
-    'sleep/drop',
-    'sleep_so',
-    'sleeper-built',
-    'sleeper-skeletal',
-    'sleepered',
-    'sleeperette',
-    'sleepeth',
-    'sleepibest',
-    'sleepies',
-    'sleeping-beauty-style',
     'sleeping-cap',
-    'sleeping-platform',
-    'sleeping-policemen',
-    'sleeping-quarters',
-    'sleeping-room',
-    'sleeping-tablets',
-    'sleeping/working/eating',
-    'sleepingbag',
-    'sleepline',
-    'sleepout',
-    'sleeptalk',
-    'sleeptalking',
-    'sleeptime',
-    'sleepwalks',
-    'sleepwear',
-    'sleepy&rehy;fruit',
     'sleepy-headed',
-    'sleepyboots',
-    'sleet-driven',
-    'sleet-greased',
-    'sleet-laden',
-    'sleet-scudding',
-    'sleet-slickened',
-    'sleeted',
-    'sleetier',
-    'sleev',
-    'sleeve-design',
-    'sleeve-lace',
-    'sleeve-notes',
-    'sleeve-tugging',
-    'sleeve.',
-    'sleeve/armhole',
     'sleevers',
-    'sleeves7',
-    'sleevies',
-    'sleevless',
-    'slef',
-    'sleibhe',
-    'sleigh/conservative',
-    'sleigh/trust',
-    'sleighbell',
-    'sleighbells',
-    'sleighed',
-    'sleight-of-atom',
-    'sleightholm',
-    'sleighthome',
-    'sleightolme',
-    'sleipnir',
     'sleith',
-    'slemmadenia',
-    'slendaneck',
-    'slender-faced',
-    'slender-legged',
-    'slender-limbed',
-    'slender-necked',
-    'slender-stemmed',
-    'slender-thighed',
-    'slender-tubed',
-    'slender-waisted',
-    'slendering',
-    'slenderise',
-    'slep',
-    'slepe',
-    'slepian',
     'slepinge',
-    'slept-in',
-    'sleshi',
-    'slesinger',
-    'slesser',
-    'slesvig',
-    'sletill',
-    'sleuth-like',
-    'slever',
-    'sley',
-    'slezak**communications',
-    'slf-ugt',
-    'sliante',
-    'slic',
-    'slice-and-dice',
-    'slice-of-brooklyn',
     'slice-of-life',
-    'slice-shaped',
-    'slice-squared',
-    'sliced-off',
-    'sliced-through',
-    'sliced-white',
-    'slicers',
-    'slices.',
-    'slicing-across-the-stomach',
-    'slick-back',
-    'slick-edged',
-    'slick-moving',
-    'slick-running',
-    'slick-shifting',
-    'slick-soled',
-    'slick-style',
     'slick/typographic',
-    'slickedit',
-    'slickened',
-    'slickening',
-    'slickly-packaged',
-    'slickly-planned',
-    'slicksuits',
-    'slid&rehy;ing',
-    'slid-tackling',
-    'slide-albums',
-    'slide-away',
-    'slide-collection',
-    'slide-down',
-    'slide-holding',
-    'slide-illustrated',
-    'slide-lectures',
     'slide-making',
-    'slide-off',
-    'slide-on',
-    'slide-presentation',
-    'slide-projector',
-    'slide-sequences',
-    'slide-sets',
-    'slide-shows',
-    'slide-tackling',
-    'slide-up',
-    'slide.',
-    'slide/cassette',
-    'slide/film',
-    'slide/fretting',
-    'slide/talk',
-    'slide/video',
     'slided',
-    'sliderskew',
-    'slides-theatres',
-    'slidewalk',
-    'slideways',
-    'slidewriter',
-    'slidey',
-    'slidin\'',
-    'sliding-fence',
-    'sliding-folding',
-    'sliding-front',
-    'sliding-scales',
-    'sliding/',
-    'sliedrecht',
-    'slieveban',
-    'slievelamagan',
     'slievenaman',
-    'slievenamon',
-    'slievetrue',
-    'sligged',
-    'slighltly',
-    'slight-',
-    'slightgest',
-    'slightly-absurd-boyish-middle-aged',
-    'slightly-accented',
-    'slightly-dodgy',
-    'slightly-less-ephemeral',
-    'slightly-modified',
-    'slightly-raise',
-    'slighty',
-    'slih',
-    'slii',
     'slijingaard',
-    'slik',
-    'slikely',
-    'slikstat',
-    'slim-bladed',
-    'slim-fingered',
-    'slim-jim',
-    'slim-weight',
-    'slim-white',
-    'slim/thin',
-    'slimathon',
-    'slime-bag',
-    'slime-ball',
-    'slime-covered',
-    'slime-encrusted',
-    'slime-laden',
     'slime-line',
-    'slime-moulds',
-    'slime/water',
-    'slimfast',
-    'slimfast-addicted',
-    'slimiest',
-    'sliml',
-    'slimlines',
-    'slimling',
-    'slimma',
-    'slimma-soup',
-    'slimmer-looking',
-    'slimmer-of-the-year',
-    'slimmersuit',
-    'slimmish',
-    'slimnastics',
     'slimnote',
-    'slimobility',
-    'sline',
-    'sling*',
-    'sling-bag',
-    'sling-hammock',
-    'sling-like',
-    'slingback',
-    'slingsby-castle',
-    'slingsbybrae',
-    'slingshot-throwers',
-    'slingy',
-    'slinkiest',
-    'slinkin\'',
-    'slinky-funk',
-    'slip-case',
     'slip-cases',
-    'slip-catching',
-    'slip-cover',
-    'slip-decorated',
-    'slip-joint',
-    'slip-knot',
-    'slip-off',
-    'slip-over',
-    'slip-stitched',
-    'slip-stream',
-    'slip-tack',
-    'slipcase',
-    'slipery',
-    'slipform',
-    'sliphouses',
-    'slipman',
     'slipoff',
-    'slipovers',
-    'slippages',
-    'slippd',
-    'slippe',
-    'slipped-disc',
-    'slipper-fight',
-    'slipper-finding',
-    'slipper-like',
-    'slippers_on',
-    'slippery-bodied',
-    'slippery-tongued',
-    'slippin\'',
-    'slippiness',
-    'slippy(w)',
-    'slips/cards',
     'slipstitching',
-    'slipstones',
-    'slipstreaming',
-    'slipt',
-    'slipware',
-    'slipyi',
-    'slist',
-    'slit-mouth',
-    'slit-mouthed',
-    'slit-pupilled',
-    'slit-shaped',
-    'slit-trench',
-    'slitch',
-    'slitest',
-    'slitheringly',
-    'slitherings',
     'slitherkins',
-    'slitshot',
-    'slitter',
-    'slittier',
-    'slitting-mills',
-    'slitts',
-    'sliudikas',
-    'sliver&mdash',
-    'slivered',
-    'sliverstone',
-    'slivery',
-    'slivinski',
-    'slk',
-    'slmp',
-    'slo-blo',
-    'slo-cooking',
     'sloane-kettering',
-    'sloane-type',
-    'sloane/radiographer',
-    'sloaned',
-    'sloanie',
-    'sloatch',
-    'slobbed',
-    'slobber-chops',
-    'slobbered-on',
-    'slobbing',
-    'slobbish',
-    'slobdom',
-    'sloberdan',
-    'slobering',
-    'slobodavian',
-    'slobodchikoff',
     'slobodin',
-    'slobodkina',
-    'slobom',
-    'slochteren',
-    'slock',
-    'slocum',
-    'slodgers',
-    'sloe-black',
-    'sloe-wind',
-    'slogadh',
-    'slogan-filled',
-    'slogan-makers',
-    'slogan-reading',
-    'slogan-spouting',
-    'sloganeer',
-    'sloganizing',
     'sloganned',
-    'slogans.',
-    'sloggi',
-    'sloke',
-    'slomo',
-    'slon',
-    'slonimskii',
-    'slonimsky',
-    'slooping',
-    'slop-basin',
-    'slop-bucket',
-    'slop-girl',
-    'slop-out',
-    'slop-sellers',
-    'slop-shop',
-    'slop-slop-slopping',
     'slop-work',
-    'slope-backed',
-    'slope-masted',
-    'slope-shouldered',
-    'slope.',
-    'slope/intercept',
-    'slopeside',
-    'slopey',
-    'slopeys',
-    'sloping-beamed',
-    'sloppily-knotted',
-    'slopseller',
-    'slorc-appointed',
-    'slorry',
-    'slosh-slosh',
-    'slosh_a',
     'sloshy',
-    'slot-and-filler',
-    'slot-head',
-    'slot-in',
-    'slot-it-out',
-    'slot-machines',
-    'slot-meter',
-    'slot-mouthed',
-    'slot-shaped',
-    'sloterdijk',
-    'slotermeer',
-    'sloth-brained',
-    'sloth-flattened',
-    'sloth-like',
-    'slothlike',
-    'slotnick',
     'slotopal',
-    'slotted/philips/posidrive',
-    'slotties',
-    'slouch-happy',
-    'slough-based',
-    'slough-windsor',
-    'slough/border',
-    'slough/gunsmith',
-    'sloughed-off',
-    'sloughiness',
-    'slous',
-    'slout',
-    'slovak-born',
-    'slovak-hungarian',
-    'slovania',
-    'slovanian',
     'slovansk&yacute',
-    'sloven',
-    'slovenian-made',
-    'slovens',
-    'slovenska',
-    'sloves',
-    'slovic',
-    'slovincian',
-    'slovodan',
-    'slow-bowled',
-    'slow-breathing',
-    'slow-breeding',
-    'slow-burner',
-    'slow-but-sure',
-    'slow-closing',
-    'slow-combustion',
     'slow-core',
-    'slow-crawl',
-    'slow-dance',
-    'slow-dances',
-    'slow-dancing',
-    'slow-developing',
-    'slow-draining',
-    'slow-footed',
-    'slow-going',
-    'slow-groove',
-    'slow-grooving',
-    'slow-grower',
-    'slow-hand-clapped',
-    'slow-learning',
-    'slow-looking',
-    'slow-match',
     'slow-matches',
-    'slow-maturing',
-    'slow-minded',
-    'slow-motioned',
-    'slow-moving\'',
-    'slow-oozing',
-    'slow-paying',
-    'slow-punctured',
-    'slow-reacting',
-    'slow-ripening',
-    'slow-rooting',
-    'slow-running',
-    'slow-simmered',
-    'slow-speaking',
-    'slow-spinning',
-    'slow-spoken',
     'slow-starting',
-    'slow-stately',
-    'slow-stepped',
-    'slow-subsiding',
-    'slow-tempo',
-    'slow-thinking',
-    'slow-top',
-    'slow-twitch',
-    'slow-whirling',
-    'slow-wittedness',
-    'slow/static',
-    'slow=wittedness',
-    'slowacki',
-    'slowboy',
-    'slowclapped',
-    'slowcoaches',
     'slowe',
-    'slower-burning',
-    'slower-evaporating',
-    'slower-footed',
-    'slower-turning',
-    'slowest-ever',
-    'slowest-evolving',
-    'slowest-moving',
-    'slowest-witted',
-    'slowhand',
-    'slowie',
-    'slowings',
-    'slowley',
-    'slowly-growing',
-    'slowly-moving',
-    'slowly-responding',
     'slowly-rotating',
-    'slowly-sinking',
-    'slowly-varying',
-    'slowly.into',
-    'slowly/very',
-    'slowmoving',
-    'slowness.',
-    'slowpoke-2s',
-    'sloy',
-    'slpp',
-    'slsfce',
-    'slsfcecomm',
-    'sltrep',
-    'slubber',
-    'slubby',
-    'slubice',
     'slucky',
-    'sludberry',
-    'sludd',
-    'sludden',
-    'sludents',
-    'sludge-blanket',
-    'sludge-filled',
-    'sludge-green',
-    'sludge-out',
-    'sludgecoloured',
-    'sludgeful',
-    'sluffen',
-    'slug-pellet',
-    'slug-pellets',
-    'slug-witted',
-    'sluggett',
     'sluggishly-coughed',
-    'sluggy',
-    'slughead',
-    'sluglike',
-    'slugsmeared',
-    'sluice-box',
-    'sluice-room',
-    'sluijter',
-    'sluis',
-    'slum-clearance',
-    'slum-dwelling',
-    'slum-housing',
-    'slum-kid',
-    'slum-like',
-    'slumb\'red',
-    'slumbag',
     'slumberdown',
-    'slumberers',
-    'slumberous',
-    'slummers',
-    'slummery',
-    'slummin\'',
+)
+
+blocks_56 = (
+    '#"ia$!t#$lice$#jan#!m#"ok#$ques%,icentenaries&%plane#"s.$!a%$rago%!y$"ex%!y',
+    '\'&jlorum%(on&mdash\'*-appointed($wise\'#_so\'$eers\'&master\'$sfor$$lagh$!o#%terce"3t&mdash;environment*\'imagine$*rehy;backs#!\'',
+    '$)behaviour$(changing$\'dancing%\'esigner$$fast%&orward$%ideas$%lists$\'netters(#ing$&points%$rice$$rest$%speed&\'litting',
+    '$#tea%*heoretical/"ly)$ists$$wise#!.$#exe$"it#+/confidence#%agaya$!r%"ia$)side.time#%chell$#rea',
+    '$&phones#!e$!e$$mber$$nces$"rs#%fonts#\'iakawan$!f$"on#!l$"ed$"ik##nam#"of',
+    '$!r#&pieces#\'s&mdash$\'/decent%%parts$"uo$%wanan#%table%"ni&"ni&"ta$#ee.%"ns%&rfield%"th',
+    '$%imana(!e%!n&$down&\'g&mdash-&;where\'.-\'integration\'(%aside(#but(%china($down(#gel(+on-dolphins(%stick)"un',
+    '\'!/(\'reality\'"s.$&le-bed\'"in\'+to-carlisle&(carlisle&,d&mdash;even&"me(,nt&mdash;see*(-seeking+#the*)/cemetery+\'payment*&s-with',
+    '&"s.%(ing-time(!s)%tones%#or.\'$ship$#ree%&ingtom#&up.exe#!y$&scombe"#uck#"gi#"il%!l',
+    '#\'ng-taek#$phor##rin"\'v-erely#%areid$"so%%tapol&%yanov##can$$enko#%e-ral$"al$!l$,n&rehy;spoke%(-and-six',
+    '&#bay\'&y-four-%-foot)$nine&#car\'#hip\'#lub&+day-trading)!s\'$igit()mensional&$ears\'&lement\'\'mployee&&fathom',
+    '\'$ight(0ve-one-eight-one\',oot-by-three+(diameter+&square+$tall((rty-five(.ur-five-oh-one+%seven\'$rame\'&urlong&&guinea&&handed\'&ectare\'+undred-foot',
+    '&&inches\'"sh&\'knotted&&league\'#ine(#tre&\'million&-nights-a-week\'%umber&(over-par&$pawn\'%eaked\'&icture\'$lace("us',
+    '(%under\'(rocessor&$race&)sacrament\'$cene(#ore\'%eason\'#hot\'$ided(!x\'+nake-necked\'#ong\'$peed(#oke)!t',
+    '&$team(&rraced\'\'hirty\'s(+ousand-foot(#ree\'#ier("me&%under&#way\'(eek-long\'$oman&)year-long-!w*"ly%$_out',
+    '%#ish%$less%*oaks-based%"s.%"te\'0en&rehy;year-old)+-and-a-half.#six*$deep*%fifty+&orties*$mile+(onth-old*+storey-high*(whatever',
+    ')#ish)-th-nineteenth&"h-(&wicket($year&\'ies-era*(sounding)!.&+y&rehy;five-$nine\'%-acre(#day(0eight-centimetre.$hour-!s',
+    '*1ve-by-thirty-foot),our-year-old,"th($hour($knot($mile(%ninth((one-hour($page(&second((thousand)\'wo-page,$year($yard\'$fold',
+    '$#r-i%(ability.&&l-inch(&person\'"ty&-nce-incentive)!s%!b%\'e-faced\'\'weather&!/&#=13\'#any&*ly-clipped)&parted',
+    '+(strained)\'shocked(+/profoundly&$ness%%field%!i&"en&#nus&#tas\'(y/pantry&"us%#ley%\'n/trent\'$wash&"er',
+    '&&siders%&okamen%"so%"ty##ice$#gne&!y$%llano&"es&$ians$!n$#rty#"ki#"ms#/rainagriculture',
+    '"2w-along-with-nancy$"in$"on&!e$#sew##/so#$age-\',contaminated\'(infected\'(polluted(+urification\'\'related(%idden\'&strewn\'$type',
+    '&!s$#rds%!t#"cz#$ells$(r-before&\'deutsch&#men&(stopping&#use&%water%"ed%$fuls%#ies%"s.',
+    '&!n$%stern#!i$!n%!\'%\'g-bench\'\'factory\'*machinists(&eeting\'&needle\'3room-cum-spare-room&!s#$n-on#$rckn#$ster',
+    ')%slave#(\'n\'drugs+(\'n\'booze#!-$+and-bribery(%death((shopping%%s-fun\'+procreation&(sociated%\'ttacker*!s$(balanced%#eat%%iased',
+    '%\'y-class$\'calibre&"re&"se&"ts%*entredness%&hanges%$lass%%raved\'"zy&#ime$)dependent&$sire%-iscriminatory%%riven',
+    '$%games%"od%%raded&$oups$$hell%%ungry$$icon%(nclusive&(definite$)kittenish$$love$(machines&"d-(&filthy&$niac',
+    '$\'objects%&f-host%!p%%rgies$(perverts%#lay&&easure&&umbing%#oet&#ngs&!t%\'roblems\'(creation$%ratio%(eference',
+    '%/ole-appropriate)(reversed(!s&"mp$\'scandal%(elective%$harp&!y%$iren%%pells%)tewardess&%irred%#wap$%tests%(herapist',
+    '\'#ing$%video$$wall&!r\'!s$!y#&/\'born$.murder/mystery$%style#(adecimal$\'gecuple&$nary\'!e$%logic$*ndviolence',
+    '##box$!y#$cess$$uple#%digit("al#)ecutioner$!e$$mium$!n%&narian$!r$!y##fid$#oil',
+    '$+st-sounding&\'/racist$"um#&lessly\'$ness#)millenary#1ological/freudian#&plicit%(oitation+"ve$$ress#%quake#"ss$$tock#$tain',
+    '%#nts$#ile&"is%)partition%"um$!o%#ncy&!s%!y$"ry$%uplet#.ual-commercial(,um-political+)religious\'*difference',
+    '\'6intercourse-by-numbers\')religious)*productive\'&social\'(youthful&)/conjugal\')emotional\'*generative\')political\'&racial&$ity\')+-developing\'"ze)!s&)ly-active',
+    ')\'charged)(explicit))liberated)(obsessed*)rientated)$poor)\'related+)producing$%ellen#&virate#%words#*y-sounding$$/tug"4y&eth;isfj&ouml;rdur#)a-namioka',
+    '#"de$!o%"ux#&feddin$!i##han$!s#!m$%arzio$#ore%+ur-equipped()stracheys\'\'iamorph#"nt%!z',
+    '#&tjandi$"on#$yids"#zan#)gin-assad#%incot##uan!1f&mdash;socialist"%-1500"$1.28#"00"!2#(,530,000#".3$!5',
+    '"1300&ndash;400,000-&50,000#050&ndash;450,000%2,000&ndash;450,000#!6$%5,000""43"3800&ndash;1,200,000""as"%e-703#)ir-semler#!p#"ra"!f""gl',
+    '#!m"!l#"gs",orza-bellini\'&castle(\'esarini&#ndi&"to"/p&mdash;swedish"&r1,200$".5$!0%"0m%#71m$#2.7',
+    '$%4,900$!5%!2$)6,509,700$)7,300,000%".7%#00m$)9,743,130#!2$*00,000,000$#1.5%#00m$$400m#+3-4,000,000$".5',
+    '%)4,100,000$&90,000#)4,600,000$!0$)1,800,000$)6,000,000$&74,000%!7#!5$$,750$%0,000%"00#!6#&70,000#&85,000',
+    '$&35,000""ts"$unny""vs!$g-10%#00s#$2000#$3000\'!s##512$!7#"75#&shaped$$tyle""11',
+    '"$2100"$3000"!9"%a1979#$irbh#"ll"\'i-based#%/mips#)theanachs"\'l-based"#ml-%)authoring%)compliant%\'related"#oir',
+    '"$riob%!l$&theall#"oi")s/thomson"\'t-major#%.-maj(!.$%curry#!r"!u##eal#!i"%x2000!+h&oacute;wa',
+    '#&ugrave"&*tting""-2$!f#0chug-a-chug-chug#%ptp-1#%sh-ed&"sh($ower\'#ure%$aped%%ingle%$ould&%wdown"+.1,000,000/',
+    '#$200/#*3,000,000/#+4,640,000/-$\'50,000/#*7,000,000/#(800,000/#(900,000/#"ct"%1/sh2#&13,840""2-#&06,960$%9,200"*3-mediated#&20,800',
+    '#"70$!5"!4#"on"&73,600"&93,656"*a&rehy;lom#$alan%"ds$"re$"th#$baka%"na&"gu&!i',
+    '%!z$$bath\'"um%*y-duckling$#ini$$onov$)ti-figure$#ura$"wa#"ch$&k-fork&"to%+ell/entente\'#ock%\'le-pins',
+    '\'1ton&rehy;equipped\'!y&#ock%#man%&sville%!y##dai$$chan("-a$(dafuggup&!p%"er$-e&rehy;groups%(-bearers&)demanding',
+    '%"d.%$less%)s&lsqb;of&!/&#pit%!y$%forth$!i%$ness&&g-down($edge$!o%"of&!r%-w&rehy;boxin\'',
+    '($oxed($ride)%other\'%check(&orners\'\'dappled\'$elms\'$free\'&horror(#ung\'$land(%oving\'%pools\'%robed\'&screen',
+    '\'%world&%alker&$base\'$oxed)#ing&\'casting&!e&#ily&*master&reg%&xhurst$$reck$$shit#%effer$!n#(farevich',
+    '%"eu%(r/oxford%$yeen$\'fhausen%#ord$#gar$,i/shopkeeper%"ck%(quzzaman$#ron$\'t-grave&&mining%#ari%"er&&sburys',
+    '%"oe%%power%"s.#(g-mental$%athon$%badly$!g%#\'n\'%\'ability\'"le%#ers%#ily&$ness%(y-coated\'&furred',
+    '$$olle$%piles$%stone##ham$$bazi$"ed$$idan&"ul$%jahan%+ehani-style$$pour$!r%"-i%$iyar$%toosh',
+    '#%i-hai$"da$#hah&"li%!k$#ken$#les\')/speedway$!r$#tan#"ka$*e&mdash;up%\'-\'em-up&#bag&$free',
+    '%%/dark&#thy%"ll%&mantle%$n-up&"ly%"r-&%chief&#ley%\'shpeare&#paw\'%earan*"e\'+$-mad,(spouting',
+    '+#_in(&herian$$ings%!r$&kabaek$"le&$tons$"ma$"ra$$sgam$#tee$&y-hand#\'l-la-la$$abai&!i',
+    '$#den$+e-dominated&$like%%field%#sin%!t$#ini$"ke$Dl-we-get-muscadet-or-the-chardonnay-%\'/should%$iday&"ed%#oon(!s&"w-',
+    '(\'dipping)$raft(&hipped(\'pitched)#ool(&rooted,#ing($seal)$kied\'!e%!s$#ock%$tsky#"m\'$(-chewing',
+    '%)victorian$"al%&narchy&%esque&$ists%!s$#bas%!e%"hu%$lers&%ingly&!y%(olically%$rook%%urger',
+    '%/-fac&egrave;dly)$edly\'#ree%#/is%#dly%"em&!r%)facedness)"ly&#ul.(!l($ness%*lesslessly&"le%\'n/danny',
+    '$%fered$"in&!\'%\'r-arens,\'-sharon\'%stone$"ma$!p%$agne%+oo-swilling\'-/conditioning$,rock-toutin\'$"sa%%eddin&!r',
+    '%&igeram%%uddin&!r$$uses##n\'t$&-ching$$aghy%*han/friend%"rd$"ce$*e-spotters%*/convicted$%g-yin%,aan-speaking&#rry',
+    '%"re&#ila$!i%#bov$&k-deep&&to-nut%#ara%)ill-based%#ley&=y&rehy;paisley-fagan-dalglish%$orak%$ster$%mugan$$nagh&!n',
+    '%!o&\'n-cimax)%limax()garryowen\'!.$"on$%qalla$,shalminister%"on$%taram%!e%(iniketan%)y-capital\'$type&%towns',
+    '$$wick#&o-kang$$fang$"ib$#wen#(pability$$cott$*e-changers\')oncealing&\'encoded&+independent((fluenced&$note&+remembering&(shifters',
+    '-#ity&$wise%$.the%%/form&%shell&"to%,d-shouldered%%liest%&master%/ofbeak(sparrow),"x)%\'s&mdash&*-triangles&!.&\'hifters',
+    '$$iros$$less&!y$%orjee$#ria%!t$$shot$#ton$$urji$$wick#&qlawah##r\'a$$-pei$#ada%$nsky',
+    '$&d-like%"ha%#ick$-e&lsqb;d&rsqb&*mdash;with%&-based&(counting&&dealer,!s&(exchange&1holding/debenture\'%yping&&issues&(matching&$outs',
+    '&\'picking&(register\'&igging&*settlement\'#wap*!s&,transactions&(warrants(&tchers%$.his&\'interim&#net%%/bond%\'ability%$base',
+    ')#ing%&d-cost\'&equity\'(facility\'%logic\'&memory\')ownership&\'ealings%"ef&!k%!f%!h&/older&mdash;see+#(s)+%-base',
+    '-(ustomers,*depositors,)relations,&wealth+".8+"s\',$.the%0s&mdash;reserved&+-for-favour+)influence+&shares&!.&$aver&#hop%#the',
+    '$!g%#ill$#han$*iat-madari\'&madari%"fa&!i%"na&"g\'\'$-out%"ts$(k&uacute%(\'s-tooth%\'-angled&&headed',
+    '&%sleek\'&nouted&%tooth+"ed%!a&$nsky%*fin-shaped%"ie&\'nfested%$like%$meat%"s.%%teeth$+land/eating)#for',
+    '%3ott/daughter-in-law(!e$-man/cosmonaut%#ila%#pal$!n%$ford%#iad&$dubs$!o%(n(likud)$/p&rehy;cornered+&witted%\'-bladed&(designed',
+    '(%essed&)electrode\'$nded&(fingered\'#lat\'$ocus&&gabled&\'jutting&\'knapped&&peaked\'\'inioned\')ractising(%onged&#red\'%ibbed',
+    '\'\'hooters)\'uldered\'&melled\'&napped&&tailed\'$eeth(&mpered\'&horned\'%ipped\'#oed(#ned&&winged%"/a\'(ssistant&&mother',
+    '&*/organiser\'$paul&!d&$eeee\'!s&!i&$ner.\'&ing-up&,r-than-usual(&witted&*ville-mode%#ham&#old%#ley&*y-critical',
+    '()recounted((shadowed)%uited%%ness.%!o&"ur%)s-related&$burg&\'hooting(\'uldered%*wittedness$&quiyya$+rock/sheila&!d&!w',
+    '$&woods.##sha%"in&!s%#lik$*ta-trinity%!e%*riindustry#$t-on$$alov%$tsya$!e%$ment$$illa$#kin',
+    '%"ov%$ugan$)t-al-arab%,er-resistant\'$ford\'%proof%"on#&ughran$*n/prisoner%%esque$"ri$"se#)ve-a-thon\'$thon%%lings',
+    '%(n-haired\'\'skulled$$ians%(ng-cream(&mirror(#pot$"ng$!u%"ot#"w-%\'lefevre$+/tewkesbury%&writer$$bury$&dering',
+    '%$ring$(e-taylor%!s$+field-based$$head$\'l-thing&\'wrapped$&m-like%!s$"ns$!q$#rib$#yer#"xi#%yegan',
+    '$"la%!e&)/landlord%"or$#men#)z\'n\'trace$"ad$#deh$&elsein$"li"\'cherbak($tsky\'#ina\'#yna$!i',
+    '$+ukina/pupil#$ools"!d#!t"\'e&ndash##\'s-%!s%\'touched#!-$%bears$%camel&"ts$!d$%found$#had',
+    '$$knew$,loves-me-not$$minx$\'pandora$"ra$)souldiers%&tarted$\'tragedy$1who-carries-torch(.must-be-obeyed(1pulls-the-strings%)olf&mdash#$/amy$\'barbara%$ooks',
+    '$)iridiance$&jordan$\'midland$&revlon$&selsun&#ven$%trudi#*a-simmonds$$ding$&f-like%"ed%!f$#han$&r-free&(strength',
+    '%"ar%$burn%!e&\'r&mdash\'(-shearer%"im%%lings%\'ography%(watering$&sgaich$(th-dress\'$like&"es&%knife$"ve',
+    '$&eening$\'ib/aged$#ody$$ster$%umkin#!c$#ond#&d-full%#man$$.and$"ad$#der\'!s%$ings$"ee',
+    '$$ford$#ing$(ownstair$%plate#$e-ow$!c%!h$!e%$eeen$+han/cricket%!e$"la&\'-nagigs$#nan%"es',
+    '%"in%$less$-p&rehy;grazed%)-and-corn*%goats&&bitten&\'dippers("rt\'#ogs&&eating&%fanks\'&encing\'%illed\'$olds&&grazed',
+    '&\'hirsels\'$ooks(#use\'%urdle&$meat\'#own&&racing(#nch+#ing\'&earing\'#ich&\'scaring\'&hagger($ears("it',
+    '\'%lopes\'\'pangled&%ticks\'(o-wearer\'$rack+!s&\'washing\'$hite\'$omen%!/&"ha%\'breeder%$cote%\'dippers%"en',
+    '%%house%%iness&(shly-but($ness%%lands&#ess%#man\'$rket(!t%$sbit&5combe/gloucestershire&\'haggers\'%earer*#ing&*kin-draped',
+    '%$walk&$hite$&r-drop%&ed-off%5ness&ndash;vlissingen)+-vlissengen/%ingen$.t&mdash;except%!-&&anchor,!s&$feed*"er\'#use&$lead',
+    '&%piled)#ing&%sized\'$teel&#the&%white\'&rapped%#age%"er%%flood%%metal%)s-a-month&!.&(/printed%$wise',
+    '##ff.&$utd.%!e%!i&0eld&ndash;baslow)&-class,)eethorpes**nottingham)\'/london)%based)"er+!s)!s%!s$#qet',
+    '$#ter#&geharu##hab%"di\'!e%$ryar$#naz#%ibani$(chernich$#ham%!k$%kdoms%$h-up&%/sikh%&kariem',
+    '%"a.&#bai%"ds%"la$#nis$"ss&!e#&joined#%kawat$(har-mann%#ina(!h%&ovtsov$%ipper$"ou',
+    '#\'labruse%#ine$$beck%$ourn%"y.$&derton%!o&%nians$#est$-f-cataloguing&(displays&$feet\'%iller\'#ull&$help',
+    '&$mark&*registered\'%idden\'#oom&\'stacker&(wobblers%!.%2/slope/basin-plain%"er%#ful%$less%#ter$(l-backed\'\'edecked\'$urst',
+    '&$case)#ing\'#ock($nfer\'\'racking)#ter&$dust\'&weller&)fragments&&growth&&headed\'&ousing&)initiated&&jacket\'\'ewelled',
+    '&#lie&&making(&terial&(operated\'!r\'"ut&&pocked&&script\'%hadow\'#ize\'&mashed\'(plinters\'#uit&$toed%$/lso',
+    '\'#ked&!m%%backs&$last%%cases%&dorado&\'wellers%&ed-out&"en%/fish-collecting*&eating)!.%#ick&"n\'%#mex',
+    '%(s-indeed\'#see(#ome\'%which%$work%#yan&$coat$#one$$sley%"on%$well$$tand%\'er-belt(%homes("it',
+    '($that\'!.\'\'/warmth\'%_that\'!d\'*ed-housing\'$wood%+on/director%!y$$ved.&!r&$sful%$ocke#$maal%!r',
+    '%!u%#yah$"er%"sh$#ilt%!n$#ona%$zzle$!u#)n-kwe-fen%&sei-go$$avai$$gjin%$zhen$2ington/oxfordshire',
+    '$#tou#"p.$+ard/jessica$*hard-thorn%&eardes&\'rd-boys)*delighting)\'farmers)%girls(-/conservative)$isis))navigator)+oxfordshire)&thames(%essed',
+    '$#man$%pard\'()/american)*fundraiser)+modulations)$shop%!e&#ard&%rdine\'#son$$reth$#sle%)tone/nupe##rai%\'rdising',
+    '%,ton/shoreham&#sky$%bakov%)ert-sharp&(t-makers%#orn(1e/gloucestershire%\'urn-in-&&ttgate$&e-kahn%!f%%metov&%tyero%!t&*/sutcliffe',
+    '$)gar-style%+old/parents&&ttites,7-nakhlites-chassignites(!y$#ice%$dans%#ff-\'#dom\'!e\'(s-depute($hips%"ng\'!a\'\'ham-big',
+    '%"at$$leys%-ock/community(!s$$mani%!s$%nhall$$pani&!o&$type$!r%*att/howard%$iffe&"ll&"ng',
+    '%"od%*y/campaign$!s$!t%)ogenbosch$,vington/lord$+wani/former%(in-white%#ode&\'od-call)$isms)(produced)&taylor#!s$&cissor',
+    '$"in$$tack#!t$#ani$6land-iceland-greenland(*er-incomer*(/incomer2!s("ic%#ock$$reet$$tles#!u$#eth$"gh',
+    '#6vardnadze&mdash;former,%-bush)#zde&%nadze$&chenku$#els%$rlay$#ill%%ngton$#lin#&walton%%nakoo$%bread$!d$!e',
+    '$$ings$"ry$%sbury$#yng"-f-siliconised#!t"#gen#%ortly$#uld"&hd/dgm%)esrc/sheg#+hhhhhhhhhhh"(i%%eries##\'as$"is',
+    '#$-ism%"te$#shi#+a-dominated$"ch$$kani$#nts$$ting%"zu#"ba%!m%!n%$yama$$eens$#lak',
+    '%$tani%"ya#"co#&dehara%#rly##ego$!h%&allion$"kh$)la-na-gig%&d-back\'\'holders)#ops(#ung\'%money',
+    '\'$wall&%links&\'s&mdash\'&-based%"la&!s%#ton$!n%"za$"st#%fford$"ki$"ra$%t+alt)%+ctrl',
+    '&#del\'(irection&"f6\'!7\'!8%&-alt-f&&charge&#jis&#key&$lock&$rate&#tab&\'working%!.%%/high',
+    '%#ier&!n\'+g&mdash;see(,-cultivation(!.(%_away%(lessness%!o%4y-eyes-with-dandruff#$gata$$eaki%%matsu&!i%$naga&#obu',
+    '&#omi%%yoshi$\'gelosis$$uang%#ero#(h-ch\'iao%%hsien%$shun%$yuan$"ab&!i%"da$!o#-ite-generated#\'jo-dori',
+    '%"ra$"oh%#ton$"ra$\'sa-feed&!h%"es#&lansky$&bottle$)don-based%$rick$#eds%$lagh%"na$+l-i-shall-i',
+    '&!y%&elaghs%!i&"ed&*ng\'s-worth(\'-paying)%taker((s\'-worth)#ide&"to%#man%#uns%0y&rehy;shallying&)-shallied."rs',
+    '$"pa%!i$"s.$$ton.#$mane%!r$"ba&"ra%!u$!e$"ko$"la$#men&%rsilk\'*y-sounding',
+    '(!s%"on$#ojo%&yamada$&p-like%$ling$$shon$%ying.#"n\'$&-bones%$high%%rengo%)splitting$%agawa&%eetel',
+    '%!i%"no%%watra$#bun$&cliffe$"di$*e-dalgarno&(removing$*gle-headed\'#ton&#ing%!o$\'iichiro%"n\'&&g-star',
+    '%&uku-ku&"ro$!k$&necock%#ick$#obi%$ussa$#pad\'!s$"ro$#shu\'!n$%wells$\'y-black&%clean',
+    '&&leaved&\'rippled&&topped%#ish#%okawa$"mi$#ngo%$nach#\'p&ndash%,rehy;killing*%shape*&wright$!-%$army%$boys',
+    '*#ing\'$oker)#ing%%canal&#hip%&design%(gobbling%\'insurer%(launched&#oad%%money\'%unted%+of-the-line&(perating%$prow',
+    '&&unning%&shaped\'#eds&$loop%\'to-fort%&wright%$yard$!.$&/train$!a%#nga$\'breaker%3uilding/engineering$)chandlers$$dham',
+    '$#ibo\'!s$.lake-on-thames&&p-clad%\'ey-born%%oader$&mates.%-ent--expected%$oney$%pable&!m%#ed.&\'r-owner\'#ies&!s',
+    '()/handling(!s%.on/oxfordshire$)repairers$(s\'sirens%\'-of-war%!.%#tal&#one)!s(!s$>ton-under-wychwood/oxfordshire$$wood&"rm%$rack',
+    '%!a%"ji%#lee%!w%$yama$(e-horses&%mares\'&eeting%$burn)!s%"en%%green%$lake&!y%$moor',
+    '%&s-bred%!y$"in&"ov$$kin\'%%ovsky$(ley-anne\'(/michael\'!s%!y$"om&#uji$2ra/captain/swindon$\'t-dress+"es',
+    '&$like&$neck&$stud&%tails\'\'hrowing&\'wearing%(/t-shirt%&button%&collar%&fronts%#ing%$ness%%s-off&!.&(/blouses',
+    '%+y-something$$vans%$ille$#win#!s$\'h-kebab%!a%#ido%#kin&!o$"un#&t-arse%#bag&"ox%&dumper',
+    '%(eatingly%$face&#ood\'\'r-drink%$hole\'$uses%%juice%\'kickin\'%$legs&#oad%\'pushers%)shit-shit&&meared&%oiled&&tabber',
+    '$$/all%$your$$_all$%awful$#box$$cart$%e-hot%%ating%$ball%%hawks&$ouse%!s%!y$$face%#ire',
+    '$\'kickers$$land%&ington&"st%#oad(!s$%o-ryu%!n$#pot$#rit$$ters&!s%#ily$\'volumes$$well',
+    '##vah%"ji$%ekiar%"ly%$red.&(y-shakes$%inder\'"or%"te$$puri$!s#$wiar##xth##yah#$zoku',
+    '%$shin"\'jelstad"&kelqim#(lovskian#+urnichestvo"\'lapping$$tter#&edanou$"ep#\'ighe-sa#"om%#ith#\'yakhtin$#kov"!m',
+    '$#rov$#tte#%eckle$#kov#&ichael#&oozing"&neider$\'xnayder#&orrers"#oaf$!h$!k$,l-encumbered&*lighthouse&%mates',
+    '$"ne$!p$"rt$!t%!s#$baki$#don$\'itajain$!o##cat$#hat$0k&rehy;absorbing+&packed%/-ads-for-profit\'(voidance',
+    '&\'effects&$like&*reinforced(\'sistant&\'screens&&tactic\'(reatment(#oop+!s%)/suspense%&abilly\'"le%$cord%$eroo%%guard',
+    '%#ley%#pad&$late&$roof%$safe#"d\'$%-wave$$dier\'"st&"ng%&ywards$!e#)e-adviser%&binder)#ing',
+    '&&uckles\'$ying%$clad\'&eaning%&eating%%gazer(.ing-infatuated(!y%\'horning)!s&&unting%"in%$less%&makers\'*nufacturer',
+    '%(polishes%&repair%%shape*!s\'$ined&$oles&%ponge&#tep%$tree)!s%%using%&vamper$".a$%/boot$$bags',
+    '$)horn-like$!i%(ng-smith$%laced%#oad$#man$%nberg%"ut$!r$#s/i&%ready%&hiners(#ing##far$&elmeer',
+    '#!g$$etsu$#gly$$unal&!i##hat#"ja$!o#"ka%!t$!o$&umshun#$ling$!l%#ais',
+    '#!n$*a-speaking%"gh$+e/community%#kan%!y$+gwe/swindon$#jin#&o-gaay$"ch$#gly%(y-shaggy$%lbred)!s$#ooo',
+    '$%shing$(t\'-em-up%$-\'em)$-ups&"em&,from-the-hip&2me-before-i-go-mad&#off&,the-bad-guys%!.%(ing-down)&jacket)%lodge)%match)#out',
+    ')%range)%stars+$icks((/heading&"st(!s%\'s/kicks%$ting#.p&rehy;keepers$--before-lunch&#oys&&rought%\'closing&-um-\'spiritual)*guesthouse',
+    ')(showroom%$door)#way&(wellings%&fitter)#ing,!s%&ledges&#ift)#ers\'"ke\'#ned%(painting&(urchased%%sized',
+    '%&walker&.ithin-the-shop&$oman\'"rk)"er+%-wary+!s(!n$%.live$"/a%#bar&\'outique&:usiness/company/restaurant%$cafe\'&tering',
+    '%"in%%label%\'meeting%"on%%point%*restaurant%*skateboard\'!i&$nack%&ticket$\'aholism$\'breaker)#ing,!s$$face',
+    '&!x%\'lifting&$oors$&houses$&lights$$made%"en$&ocracy%$wner$+per-numbers\'"ss%"ie&.ng&rehy;around(!\'(!-',
+    ')$bags+%skets)-entertainment)%malls)(precinct)&street*%unday)%trips+%olley)%world($.she(!/)-entertainment)\'leisure)1marketing/trading',
+    '(!s$$rite$&s-type&\'windows%(.hp-type&"it$#uld$%ville$\'walkers%$oman#\'rbridge$#den$&e-bank\'$ound\'$reak',
+    '&$foam&#mud&\'notably&%power&#sea\'#ide%".2%&/nacro%"_a%%based)!s&#ury%$d-up%\'fishing%%going',
+    '&#ead%%lands&#ess%#men%%power%\'s-based&!.&-/cull/malizia%!y$#ina$$kley$$land$(n-haired&#off%,/shaun/shawn',
+    '&!d$\'t&mdash+#;or&)rehy;cuts+$hand-"ul+%lived+)sightedly+(tempered-%rmism%&-*****&#and)%-long*$mild\'#rse',
+    '&%based\'\'reathed&(changers\'%oming(&ntract(%urses\'&rested\'&umings&)distances\'\'uration&%faced(%lling(%tness\'\'ingered\'&unding',
+    '&$gilt\'$rain&$hair*\'-cutted\'%eaded($mmed&"in\'#ron\'"sh&\'jointed&%lease+$hold("et($ngth\'#ine',
+    '(!v&\'measure($dium&#nor("se&$odds&)paragraph&&radius\'$each(.payment-period\'%hymed\'#obe(&tation(#ute&&scaled',
+    '(&ntence($ries\'%hield(&rifted\'$ight(#xes\'$kirt\'&leeves\'\'norters\'\'terling(%ories\'$word&$tail\'-erm/emergency\'$hrow',
+    '\'$ubed($rfed&%water\'&eapons($ight\'$heel("ip\'#ord%*/fine/dull&&medium\'"id&%quick&&thames%!a&6ges&mdash;unemployment',
+    '%$bows%)cake-like&%hange*#ing&&ircuit,"ed,#ing&\'overing%!e&*n/lengthen&(r-acting(&course((distance(\'growing(&horned',
+    '((maturity(%paper)$hase(%range($span((tempered(*wavelength\'%lived&)st-billed)&living)$path*%riced)%route%&falled&$ield',
+    '%)hand-book*\'typists)\'/jargon&$olds\'!p\'+rn/galloway*(highland%$life%"on%&s-clad\'%owned\'%to-be&$cale&$ight*5edness/injustice/lack',
+    '&&taffed\'"op%)wheelbase\'#ile&)indedness$$well#%shani%+one-bannock(!s$#tak\'&ovich-,#ian#&t-bags&\'lasting%%faced',
+    '(#ing%%glass%%holes%,in-newcastle(#the+$-arm%$like\'"st%$putt)#ing%,reverse-shot%\'scarred&#ize%\'to-hell%\'wyndowe',
+    '$\'/attack%&tarred$!a%"ro$*bolt/youth$&firers$$ghun%)un-toting\'$s-in$$hole$$ingo$#put$)s/corners$!t%#ers',
+    '&\'sbrooke%%isham%#on.$$uing$$wick$"yk$!z#"ud$$keir$&l&rehy%.d-be-condemned\'\'clauses\'$know\'$read\'-she-leave-him',
+    '&!.\'"be&&/could\'$will&#all&!d&!e\'\'r&mdash),rehy;charged.$deep(%-bags+$rges*%ubble+$tted)(charging',
+    ')&excuse)%fired)&girdle)&height*%older,&stered)&injury)$less)%mouth)$pads)(satchels*#eam*&haking+#rug*\'kimming',
+    ')*to-ceiling($/the($bags)$lade)%oards(%check("in($less($pads(&s/back)#pan)%traps(!y&#n\'a("ts',
+    '&&hwaite&!z$!p$%rbaji%"ie%#ter$%t-out&%swift&"up%!.%#ed.%!h%&ing.in%$line%&s/hits',
+    '(\'lfpenny&#off%&l-like\'#off\'%sized&!.&$head&!l\'"er(!s\'$ings\'!s%!n%!r&!s',
+    '%\'rehy;up$#\'rs$)-and-tell%%bench&"ib\'%zzery%$card)!s(!s\'#sed%"ed%$girl%&mostly%(of-force%&pieces',
+    '%$reel)!s%(standard%$time&%rials%/us-yer-knockers%&window($ning&#ork$%.back$+/background%(national%$stud$%alter$*biz-patter',
+    '\'!z$\'casting$$ders%"og$$eing%,ll/co-driver%"ns%"r-\'%baths\'\'cabinet(&ubicle\'&filled\'#gel\'$jets\'%proof',
+    '\'%dryer&#age&#gel&$pack&$time%!s%"th$%field%%ronts$%goers%)round.the\'#wer$!h%$orse)!s',
+    '$"in&#ess$%laces$(man-like\'$like&$ster$"n.%!e$%print$!q%#ing$"sa$$tank&"pe%&hrough',
+    '#!y$%swell$!u#&zaburo$!o".p&mdash;social#"ar#%owers"\'qiptare"!r#!a$"da$*ger-powell$#ley$\'nk_away',
+    ')%proof)\'scatter(+/roadrunner(!l$"ve#%eader$\'dbucker%#die&"rr%&master$\'s-based%+thacommerce$&veport$&w-mice%$bury',
+    '\'\'looking%\'ishness%&sbury\'*,-aberystwyth+%based,#orn+\'chester+(hereford++llandrindod*%.they*+/shropshire*!s#!i$%ek-as&$ing.',
+    ')!s&&ometer$%llest&%s/all$.mp-and-rollmop\'$farm\'&seller($ized&(/anemone&$fish\'"ly&$tons$#nam%,e&rehy;laden&)-building',
+    '\'$tree&"s.%(k-to-fit&(age-time&"er\'!s&#fit&(ing-back*"on&"le$%stava$#teh$#ved&$ling\'+led-looking',
+    '%#ing##lie#%oeder$\'mazdeni$"od%!t$,pshire-based+/montgomeryshire*#man\'#lre$$tria$*ud-covered\'&waving&!.#\'ub-beds',
+    '&%roses%%bery\'%"s.\'"as&*/grassland&#ole$#der$,g-it-all-off&Jof-the&rehy;shoulders-and-oh-what-the-hell,*-shoulders&$that%#ger&\'ing-off)!s$\'nk-back',
+    '("ly""sh$#ing"!t##aff$\'kelberg#&eingel$$tels##uck"&u\'aiba#%-jung#$aghr\'!a$$ibah$"la',
+    '%%gming##bha$#ik.#*cker/local%#ing%#man%$nell%$skin#*dder-\'this\'!.%"up$#ras$!y#"el#!f',
+    '%(le-board\'$beat($oard)$ttom&%ingly%!s#$hada$"ei$#ite#"ji#!k$#bah$!e$$hrat$"le',
+    '$"ri#&lbrede$#kai$!l$"te$!z#!m$%acher)!s%%riyah%"te$)ch&uuml;n$$ikha%!n$$skiy',
+    '#\'nammite$"de$$giku%#sep$"ju$"na&!s%#ish$$taro%$ings$$yata##onn#$qing##rey$#flo',
+    '%#kat&*en-starman$#ley$*mer/senior%#urs$*rup\'n\'have#$shan%&enskoe%"hh%#tar$&ssshhh$#wap#&t-eyed%#ins%$outs',
+    '$%down.$\'e/tutor%"ye$"ov$(shutshut$(t/taylor\'#gwu%"ed&\'r&mdash\'&-speed\'#man%#in\'\'&g-down)\'up-shop%&le-bus',
+    '\'!.\')/redgrove\')cock-like+"ed\'$wood&$ings%&terbug%!y#%valov(!a$#orn#%waikh#$xian"\'vartzer#"ed',
+    '##ayb#&ezigon#"oo%!h%!o#!s"&y-eyed$%faced$#guy$\'looking#&/brash#!a$%madas#"es#!n',
+    '$!e%#nde#"pe$!s##ris!,i&eacute;cle*"ge$*grave;cles#(ndash;st#)rehy;hour"!\'""-0#%di-wi#%kiang#!o',
+    '"$1990"#3n4""ab#!c$,upuncturists#%datan#$guru#"ka##lis$#oid%%mucin#$m(7)$(ese-twin,#ned\'!d',
+    '$"el$"fu$!s#"rd#!s#%uliai#$vush"+b-regulated#$/oft#$acha$#nda%!e$$rtie$"ya#%balds',
+    '%!t$#les#%elian%"la$$nici$$ria\'\',n-manchurian(#ise%"ry%!t#$hion$%orpii#4ilant/hard-consonant("ly&$trix',
+    '\'#nce\'%tions$#ril%%skiye#-ling-thwarted\'(/sibling(\'younger\'$hood#0neftepererabotka#.oga-expedition$)manaprime#/son/stibbington$!p#"te$$horp',
+    '"&c&lsqb$*rehy;month#!.#+=\'suspicios%&txtual$.acknowledgment$*comittment&\'ntoller&$verd$,disavantages$.idiosyncracies$\'recenty$%there$&witten%*omenswomen',
+    '$#rio%#tsa$!v#"ca%"ma$"us#!e$%raria#&herman$!t$&uanese#!i$)lian-born(\'a-where(!i',
+    '%\'y-based\'&lipari#"k-%%a-bed&&bsence%\'bedside%\'looking%%rooms%*to-the-gut($your%(visiting$!/%+handicapped%)maternity%"we',
+    '$!e%$ner\'%#rts$$hair$#ies%$fied$)le-hocked\'$like&!d&&hocked%#ied\'!r&$ness%*y-smelling$#man',
+    '*%nnual)\'special%#ote$#oes%!s#!l##ord##uan&!i$"ri"\'d\'ahmed#(-ud-dins$!y#"ac$$lcea',
+    '#"da%#rth$\'eshwari$&hartha%"is$"ig$(onindian&,s/springhill#\'e&mdash**;plaintiff+#the%-rehy;entrance*&footed*\'tracked*\'windows',
+    '$&-aisle*!s&&ligned%#bax&&enches(%efits&#oom("th&%ranch&\'usiness&!y%%canal\'&rcross&%hains)!r',
+    '+!s&)ommentary\'&rridor&$urls%&demand&#ish&$rums%*e&ndash;it&)ffects.so&*lasticated&\'mptying&#nds%&facing&\'eathers&$laps',
+    '%%gated&&lances%$hall\'"ve&\'eadings&#ill%&issues%%joins%$lamp&%ength&\'ighting\'#nes&%oader\'"ok)#ing',
+    '&&pening%%panel\'&ssages\'#tch(!h&&illars&#lay&%ocket\'"ds&&roduct,!s&\'urposes%(reaction\'$lief&&ockets',
+    '\'$reen&$hoot\'&unting&$lips&\'plitter+%ingly\'$ring&$tage("ll*!s\'$eped\'&itched\'%ories\'%reams(#oke',
+    '&%hrust&#one&%racks\'#ips&&unnels%"up%$view%$ward)!s&&heeler\'\'iskered&$ings&&rought$!.$!/',
+    '%&player%$tail$#_as$$arms$$bats%%oard.&#rad&-ttom/prisoner$#cut\'!s\'$ting$%dness$$gate%$lass$$hops',
+    '$$legs%#ock(!s$%noted$$path%&ersons%%ieces%\'lanting\'"te)!d%&ockets$.r&uacute;rgica1"os%"as&%tions',
+    '%$oots&%phile&&sticta&%xylon$)s.council%-_with_respect%%addle%$hore%&lipped%$pins&\'litting%%trand%%wiped(#ing$!t',
+    '$\'walkin\'&"rd&)ys-facing)\'gliding)&moving%%heels%#ise%#ork$%ywyes##ham%$rtha#&ied-up$#que$"ya##ler',
+    '$"um#/on&ndash;beirut$!r%+owiczhealth#"qi#"ra%"ch$&ekapsi$%ophel#(thimunki#"us#$vale"$eben&$list%"ri',
+    '$!u%#rth#"ca$#les#!d$"le%#ice#*ge-economy&%tower+!s\'%roops&%works%!.%"ls%\'nthaler',
+    '%%works$&fried.$.hart/publisher$#ing$%linde\'!g$#mar$$wart#!h#$laff#&maszdo$*ens-martin($rolm\'$/gec(*xentronics',
+    '\'$tadt%$rink$-ieniuch/grant#(nkiewicz$+na-coloured&!s%!e&"se$!t%!o#"pi#%rbein$&pinski$(ra-style&)/cavalier',
+    '#"ss#!t#!v$&e-like%!.%"d.%!r&"ts$#ier#$wert#*y&egrave;s#"ze$#ing$$ures"$faka',
+    '#&bronze#$erth#%irwas#$neos$"os#%ranos$"in#$ters$$ings$#lik$"on#$uiva"&g-nora#%bjorn#&eferth',
+    '$"um$$wulf#-f&uacute;sson#!g$+ers/astaire#"h-%&posted$"el%!s$(ing-that%%soara$-t&rehy;saving%%-bite&)distances&\'finding',
+    '&\'leading&&saving\'&tarved&$test%$.and%)/presence&-understanding%&ed.her&!r%#in\'\'$g-in%(lessness&!y%\'reading$%vatur',
+    '%#ata$%smond#(lestorne$#ish#+ma&amp;sup1-!2%$-ray%!n%$rite%$scan$)iodoscopy$*oid-rectal\'!/\'+oscopically#,n&rehy;based',
+    '$!\'$&-based&$oard%*confusable%(extended%%group*!s%(langauge).uage-dominated-!s&#ike%&making%"of%\'painter&#ost',
+    '%&theory&)o-english(&speech%&writer)#ten\'#ote$(.posting$*/magnitude%$that$%=offs$#aal%(l&eacute\'%mdash\')ndash;box&*-averaging',
+    '\'$code\'*extraction\'&lights)"ke\'*power-gain&%/call&(:control&#ise)!d&.s-intelligence\'!.\'&/calls%$tura(-e-recognition$)ed-binary',
+    '\'#off\'$rank%&t-ring$\'ficance)#tly$!i%#fer(!s&!i\'!c(%ance\'*\'t&ndash+(-looking+#ly.)$ting',
+    '(#ent\'$dant\'!e(!.(+r/signified%"n\'&$g-in\'!.\'-s/appearances%"or\'#ial("ni$$less$$ning$!o',
+    '%&rellis\'!t&#ine$\'reading$"up#!o$!n%$ella#%ridur#"ur%0dard&oacute;ttir%#imi%\'jonsson%$nost%1thard&oacute;ttir',
+    '##vec""h4#"am$(nouk-hun(\'ist-soc#!i#"on""ia#!m$#ann"-ka&rehy;robot$$ndar$&robots#"el%#ile',
+    '$#rer#$hist##ita##ker##los#*orsky-fiat$"ta##rit#"si#!u$#jua"+l&egrave;ne#)a-nowicki%*oncommerce$#ble',
+    '$"ev$#ges$"li$&nation%#dra%\'isation&#zed%#ols&!v$!r$#sia$$toli#\'bergeld&$mayr&$nagl',
+    '&(schmerze#"co%$ates$%retes#!d#!e$#age%!s$%croft$-nce&rehy;that\')/drinking&%ingly%"ou%+t&mdash;but&\'-footed',
+    '\'+screamingly&".3\'"it&$bloc&$ness&/writer&mdash;it%#zed&"io$!r$!s%!a%$ians&"um\'!s#$ford',
+    '#1houette-principle)$ists&$tted#%ibubs$#ca-\'&garden\'+immobilised&%ceous&!l&\'te-rich%)iclastics&(fication&#ous&"te%+oflagellate',
+    '\'#-32(\'bismuth)%ronze(\'gallium\'\'e-based)&coated(\'/rubber\'"ix($zing&,sis-sufferer&"tt$%grove%#uri$!i$#kon',
+    '\'%strum&%oidea\'"sa#1k&rehy;stockinged$--and-cashmere)%satin%%buyer%(canopied&)ompatible%&gloved%&hatted&#ung%&jersey%-manufacturing&#oth',
+    '%(sheathed&&lashed&#oft&(tockings&&wathed%#tie%&weaver&&inding&$oven$&/satin%\'viscose$!a$,en-patterned\'(shoulder(%mooth',
+    '&"ly&&thighs$#ier&"st$$less%#ook$#man%$oths$!o$/screen-on-metal*"ed*!s$$tail$$weed$(y-finish',
+    '\'%lumed&&smooth&%white%0/rayon/polyester#&labubs%%cybin%#mae%"ns%!r$&bourne$"ed%"es%#nce%$rton%+tt/hereford',
+    '$#ick%!e%#man(#ite%&nesses%)toe&amp;m((/climber$\'ographs%!n$$wood$)y-buggers&$like(6ttle-me-late-again-ish\'&ooking&)mid-scone',
+    '&&season%%willy#*marillion\'#"oa$$lota$&uetted$"xy#!q#$sila$#tar#(t-filled%%laden&#ike%%sized$%/clay',
+    '%$sand$(asaarenk$#ier%%ng-up$"on#$uria\'\'n/early&"st#/vacommunication%#esa%$ires%#lux%#nia(!n&!o',
+    '%#ira\'!o%+r&rehy;grey&\'-banded(%eaded*$rded+#ing(%londe($ound(%right(%ubble\'&chased(\'ollared)%ntent)-pper-sulphide',
+    '\'$fish(&lecked)%ooded(#oil)&liaged(&rosted\'%grain)#eys\'\'handled(%eaded\'\'knobbed\'$lead*#fed($ined(%oaded',
+    ')%rcury)"sh\'\'papered($late((olishing\')sandalled(\'heathed)"od*"ed($ided)$lver(&kipper*$rted(\'oldered($poon',
+    '*$tted(&tamped)#one)&reaked(\'ulphide\'&thread-"ed(%inted("op($rain\'&veined\'$ware(&impled)$nged)$ring',
+    '\'$dive\')laserline\')solicitor\'$zinc&!a&$back(#lls\'#ird\'$oard(#und\'$urst&%cloth&#fur&%glass&%heels',
+    ',(/granton&$lady\'#eaf&$mere\'#oor&!o&\'painted\'%lated\'%oints&%shine\'$ides\'0mith-cum-general\'"pa(#oon\'+ton/chelsea',
+    '($ream&&thorne\'$rees&&y-blue(%cream*%owned(&leaved($pale(&yellow%)stretrade("is$(ipasture%"us#$wood#$ybum',
+    '%$ated"*m&atilde;o##\'an#&-luing$(weighted#"0n#%ancas%"dl%%ggang%%owitz$!o$#tai%%upang$"vi$!x',
+    '#1ba/communications%!r&%akiye+&public$%odyal%"lo%%ngile$$ulan%!n##cha$)ox/severn#&d/mimd#(e/apollo%&deputy$!l',
+    '$$onov$\'thicone%#ite%!o#"ha#$ians%!r%$wood$!l%+ar-although((coloured(&format(\'powered($spec\'!.',
+    '\'"is(#tes\'\'looking(*y-affected*)birdseyed*&caused+\'oloured,(nfigured-\'trolled*+emotionally*&shaped**underrated\'(sounding%!i&\'arities',
+    '("ly&#bus&#mum&%tudes%$lium$\'novitch$#tis$$zine#&kinses$!o#"ma%&lavong$!e%)ntal-type%&r-stop',
+    '&$mann&#son&!y%#try$"ie&!s$"on&#ite)&/women&*s/hereford(%laser(\'patient(\'rotunda(%vitez\'\'justice',
+    '&"te\'"on$(s/family&+wallingford#%nplky#"om$+n&mdash;the&(rehy;who%\'-barron%)/sunshine%!a%"de%$etta%#iac("al',
+    '&"se&"te%"ka%(s/deputy\'"gr&$bath&#ide%$tons%"yi$"om$!r$#vic#-p&aacute;tico$%\'ring$%honie',
+    '&"ss$$late%-e&rehy;minded&!-\'\'complex\'$deep\'(mindedly\'&parent\'-to-administer*&follow*%grasp*\'operate*$read&!.\'#you',
+    '&#fit&)r-natured&,s-collectors%&icated\'&icolis("sm((t&eacute)"ie)"y\'*!.\'"ty\'"us&#est&&ficate+#ory',
+    '&"ng&(zissimus%!o&%matic%0y&rehy;furnished&--administered\'#far\'&spoken(%tated&#_in$+son-charles(\'orlebar\'!/(*australian2!s',
+    '(,grandaughter(,presentation(#vet\'"s\'#(s/acting%*beekeepers%(teasdale$#ons$#tat#\'uchimba$(itaneous$&lacres&#ria&*tion-based*"em',
+    '&+an&eacute;e0)it&eacute0$ment($eism*(t&agrave+#ies)"os*%usly.(&iously)"sm+!e,,-librettisme#&vastin"(n&uacute#(-binning',
+    '$#gle$%itiro$%kiang$&nay-ma$$sick#".s##aas$%calia%"hi$!h$$itic("us$#lly$#moi$#pis',
+    '%#sis$.sina-youngumgi$(tra-outs(%style\',/jagger/jive\'$type##bat$&earing$%inned$"le#(ce&mdash%*-dissolved&&fallen&#his%$.the',
+    '(!6%!d%&re/wet\'(ly/yours\'!r&%ities&#ley\'!y$/ipita-stevedore$-lair-lockhart)\'poulton(%/avon)-dermatologist)%royal))wiltshire',
+    '$#ure#&dacato%&haraye%!l%#rin$%ebahd%#cut%#lar$#hri%!u$$ibad%\'calista\'#tos%\'kubwabo$"os',
+    '$"ys#&eadist&!s$\'curists$!m%%urian$#rgy$&vicius$*w-hardened#&fonias\'+etta/thomas$#ul\'&(/corrupt#"g-%\'a-longs',
+    '%&songed$&aloada\'(ngaknife*#max*$steg+$wans%*pore-bound*)cambridge*-headquartered&$uras%#ris&%ounds$&elenn\'&$mann%"r-',
+    '\'+comediennne*%poser\')guitarist\'-impressionist\'6songwriter-storyteller((trummers\'&turned-&-actor&&/actor*$ress\'(composer\'3songwriter/activist1!s\'&writer&#ies',
+    '\'*/composers(&spicer\'&pecial%!s%!t$+h/newsagent&&police%"al%\'general%#ing$#ier%*n\'n\'jiving&%g-man*$ster(#nun',
+    '((telegram\'(/dancing$,le&ndash;car-%sheet\'-rehy;breasted,(contract-\'ylinder,%issue,&minded2$ness,&parent,$seat-\'toreyed.&randed&$-a-1',
+    '(%ction(*pplication(%rched)!e(%spect)\'sailant((uthority\'!b("ar(%edded($lind)"ot(#ook(&rooded(#ulb',
+    ')$ying\'&called)$mpus*%shaft)\'ndidate((himneyed($lass*#use*#wed)"ub(&ollege)%mpany)\'nsonant)%untry("pu',
+    '(&utaway\'&digest)\'mension)(scipline(%ollar)"or)"se(%rawer)"op\'%edged(&lement(\'mission(#nds)$ergy)\'tendres',
+    '*"ry(#xit\'\'faceted(%emale(#ins)\'sherman(%light)&owered-!s((oundress((requency)%onted\'&groove\'\'handers+$icap',
+    '*$rted("it(#ole)"od(#ump+"ed\'\'in-line*\'waiting)\'dicator)#put)+stitutional\'%judge\'$lamp)"ne)$unch',
+    '("eg(&icence(+ongitudinal\'$malt)!n(+inded-sized($odel)$ther-$hood-!s\'&needle(#ode\')objective(\'ccupant\'$pane',
+    '*"ry)"ss)"th)#yer*$ment((ensioner)&talled(*ilot-panel($lant*"te+&formed(,oint-of-view,"ed)"le)%rtion',
+    '(#utt\'$rail)"te(#eed(%oomed)!w\'&sailed(%eason($hell(\'ideband($kill(#lit(&ourced(&peaker*&cialty',
+    ')%outed,#ing)$read((taircase*%llion*"nd)"em*%pping)&rength*#ing*#oke(&uckled)&pplier\'$tail)"ke',
+    '(&eacher)"rm+$inal(#one)%wered(+ransferable)#ial\'$unit("se\'%value,!d($enue)#rse(\'ineyard\'$well',
+    ')$lled(%orded*(kstation&(.address\'%phase&)/breasted\'&double&\'borough&&decker&(mindedly\'#ode&#s\'\'\'\'-buying(+compilation\'!.',
+    '((students\'$heet\'$tick&,ton/prisoner*0yasserarafat/the&$well$%olare$#pho$"s/%$aneh)\'finance%"on\'#ged$#ton$+ularization',
+    '("um\'#tum&"er#-hala-speakers-#ing&,ese-majority$!g#&ibaldi$"ca$&gaglia$#ora$%perca$$salu%&calchi%$ter\'',
+    '((ly-named(!s&"re\'$orse$!t%!a$\'x-based$!y#&k-bath%$edge%$into%\'or-swim%%until$\'/source$$fuls',
+    '(!s%(ng-speak\'#/in&!s$#ler%$oads$$side$!y#&namary$$er-a%!s%"th#*o-albanian&&merica%)cambodian',
+    '%&german%*indonesian%#lao%%north%\'spanish%$thai$#dun$"ia$\'logists\'!y$%phile)!s$!t$$vial$(wilsonia',
+    '#\'sabaugh#%tacel%#gro$#ers%!s$#ing%!s$(rabanano&!m%"om#%uatum$&larias$%osity%&usness$&s(oid)',
+    '#&zinger""o2#$bahn#!e#"me##ned%"rs$"it$!s#\'staloir#$ufas$#xie"&p-well#\'/guzzle#7ah-i-sabahah-i-pakistan',
+    '$,ogonuchitids%\'n-snort&#ate&&ed-off&\'ophores##ila#\'p-green$%anond$*er-guzzler%"ts$!s#"ut"(quieroli",r&egrave;nes$%mdash',
+    '$)mix-a-lot$&thomas#&acourt%#usa$#jul$!n%!t$$pite$"zi##car$&ulians#$dars#\'en-call&)screaming\'#ong',
+    '&/victim-criminal%#dra%"ia\'"ns%&omelia##ian%#sis$&phanit$!t%"su$!z##kar#!l#-madamsirmadam#"ne',
+    '$"ki%!y$#nen$!p#"pa##ros#"se#%talis$"is#"us#$vent\'"es"#s-q#$akht$&l/cord',
+    '$$mnes##cia#&goreus#%ikyou$%sthal#"mi$$ondi#$obyk$%umang#"pa#$quoc##sen$"in$\'olution%#nne',
+    '%%lecom%"ma&!i%#ncy%+r&mdash;she&!\'&#(s)&!-\'$cell(#ity\'(hospital(&unting\'#in-*&charge*)law-to-be',
+    '\')newspaper\'\'parties\'&queens\'&senses\'$town&!/\'&mother\'$soft($taff&%_over\'(provided&.admission-ward&$like($ness&$s-in',
+    '$!h%!y$$iana%"ng$!u%"hs$!y#$ulus#$wono##xth#\'ymbrium$)phus-like")t(uation)#!-$#bag',
+    '$,on-the-fence$*up-and-beg.%-bike&"on#%/flat##aki$$lkes$%marhi%"un$%narhi$)r-playing&(sounding$&stugan#\'chensis$\'om-land',
+    '#$down#$e(s)$(-by-site%*dependence-!t%(faithful%+independent%+preparation%%recce%+specificity&-tratification%%types$#.it%#the$#lla',
+    '$*s&mdash;as%$-for%".1&(families%&/parks##har$#ern#$ings$"on$"ve##kas##que#"ra%$ihss#$s_in',
+    '#\'tenfeld%$r-in&1/artist/spectator\')companion&$s-up\'$dorf%"st%"th$"in&%g-day("in("up\'\'/buffet\'#:in$$yton',
+    '+";s$&-prank$&ation\')&-bound*&comedy*(fragment,"ee*+independent)!.*!2)*/difficult),ist-inspired)/s/circumstances,(ustomers$!e',
+    '$!m$"ps$,ta&rehy;tion#\'wellian#"ye##zb."#ung"+va-nataraja$&lensis%"ik$-nanasiddhiyar$*pithecines%)rasadarao$"rd#%ebaek',
+    '##gin#:ret/editor/gloucestershire$+y-sur-meuse"#wah$#lik$!n$!r%"ds#&ertell"+x&mdash;red*.year&mdash;old$)ndash;car$$rehy(&;blade)&former',
+    ')&masted*%inute)&thirty##-10$+a&rehy;side%&-sides%$lbum&!l%#nd-(+a-half-hour%&rticle%#tom%#xle$&bagged&"se',
+    '%"ed\'#ded\'%rooms&#ige%"it%$lade)!d%%ottle%\'uttoned%\'y-three$"cd%&entury%$oach&$lour\'#umn',
+    '&)ordinated&$unty%"up%(ylinders$*day-a-week\'(s-a-week%*ecades-old&$gree%#isc%#oor$(eighteen%%leven%"nd&%gined%&pisode',
+    ')#two&1stivals-a-weekend%\'ingered%3oot-four-plus-a-bit)$long)(six-inch,"er*%quare)$tall*)hree-inch(#ers&"rm&"ur%$rame%\'unction',
+    '$$hair%#its\'$ting%#ole%&undred+%-foot$(in-a-row\'$line&\'ch-tall("es%"sh$(language%%etter%"ot$(monthers',
+    '&!l&"ne$%o-six%%f-one%"ne$%panel%$hase%%layer&&us-two%)oint-plan&"st&!t%(rocessor$&record%$ider',
+    '%%oomed&%under%%unner$)sectioned&%gment&%ssion&#ven)#ths%$heet&&ooters%#pot(#ted%%tanza&"ep(#ped',
+    '%&ubject$%talks%#eam&$nths%#h-s&.ousand-footers-&talent&#ree%$imer&"ne%\'o-seven&!n%7wo-six-two-oh-one-three$%vaned%&ehicle',
+    '$)week-long(&s-dead*#old%\'heelers%#ire%$oman$&yarder$$zero#!.#&/eight#)bedroomed##com#"ep#$ieme#%month',
+    '$+ence-a-week&(ny-sized(%worth#(shooters$:ixsixxxxxxxxxxxxxxxxxxxxxx##tee&"n-((cylinder(&legged(#man)#ile)(onth-old(%notch(%ounce()paragraph',
+    '(%sided)%torey(&thirty)3o-eighteen-year-old*#oth($year,)&rehy;old,%s-old\'!.\'-/christophers\'"er\'&th-and*(birthday**nineteenth*"or',
+    '*"to)&/early)\'century$%h-end&&fourth&)magnitude&"or&&placed&%round&%sense&"to$$ies-\'&/early&+th-birthday$"us',
+    '+/seven&rehy;hour+$year%&-acres&/by-twenty-metre&%cycle&#day&)five-foot+&minute*!s\'#old(#rty(\'ur-hour+$year&$live&#man',
+    '&(one-year&$page\'"er)%-cent&&second((ven-hour,(year-old+"th\')ix-storey\'%trong&%third\'+wo-year-old&$watt%#ish%$nine',
+    '#!x"#yan##uan"(ze&ndash$#-12&!5%"24%!3%(altering&&nalyst\'0d-weight-of-head%%class&(onfusion%+differences%\'grading',
+    '&\'elected\'#ven&&imilar%%three$!.%!i$\'/colour\'(mplexity%&height%&number%,shape/colour\'#ell$,able-looking\'!y$#ism',
+    '$)s&mdash;a%$.but%\'/prices&6tolerance/requirements$$wise#&ing-up$"sm#!y#%zlers%#in\'\'#gly!;j&aacute;fstaedisflokkurinn*3lfstaedisflokkurinn#*ocirc;sten$(uml;blom',
+    '#"40"&/cd114"&adzali#%mboks"!b"\'ihd/dgm"!m")obergundy"#uro$#sen##zet!/k&emacr;n&emacr#)oacute;gr$\'uml;ldm"5-edek&mdash;socialist',
+    '"%1.3bn#!2"$200m#"20"!3##50m"#580"#890"(a-loving#&a-funk#$dden$"en#*er(1981)it#3ftafellsj&ouml;kull#0gast&ouml;lstind',
+    '$"en%%rrack$"gs$0way&ndash;juneau#\'kkebaek#$lded$!k#(mbonidai##nda%%insky$#ked%#ing$#ska$"ti#&raborg',
+    '$"ie$"ke$$loey$"ns$$pass#%tches$,e-and-potato&&blades%)boarding-%&freaks%&llites%+r-directors%$wear$"hi$)ing-rinks',
+    '$$rers#%yting""d1"!e##ats#&daddle$&dadled#%e-eaz$!f$%tered\'%ingly&!s%!s##ggi$/ness-manchester',
+    '&%/paul#3idar&aacute;rsandur$$eeen#%lcher$\'dergate$"et&*o-muscular\'*n-boosting)&cleric*&overed*#rew)%frame)#key)$like("al',
+    ')#tes\'!r$$gill$!l%"ey%)ingthorpe)"on%!s$\'masdale%-ersdale-based&!y%%orlie$#ped%#ing$*ton-arpley',
+    '(%henry#(mersdale##nda%!e&+r-mctaggart\'#ija#"os#%pings$(pargatan%"er$\'ticisms\'!s&#kos##res$-n/taxi-driver',
+    '%$itts%%ymor.$#ton#)tch-books\'$leaf\'#map\'$pads\'$show\'&titles\'&writer&2es/photos/diagrams&$leys&$pads&&writer$"os',
+    '%#les#&umorph$(omorphic#\'vington#&w-arch%*hermitian.%\'knotted%$wiff$%balds$"en%"r.$"ly$%whiff"$hira%!i',
+    '"/i&rehy;equipped)#ing)&pilots#\'-77tows$$area$(bargains%\'indings%$oots%"um$%cabin&"ps%$hair\'#let%#lub$%drive',
+    '$$flap&"op$%guide(#ing$#hat%#ire%&oliday$\'jumping$(marching&#sks%+ountaineers$%pants%#ole$&racing%#oad',
+    '%\'pecific%$uits&"rf$#tan%%ourer%$rack%#ype#-/boot/binding##ary$!s#"ba$#oot\'!s$#ums%!s',
+    '#&d-mark%*resistance&#ink%-steer-loaders$\'bladnir%%rooke$$din\'\'#gly&"sh$#lid$$mark$#oos$#pan$\'s-under#!e',
+    '$!t#$ffia%#ler#$gear##kda$$holm#*l&rehy;ful$#fu\'&\'l-stage\'#ful\'%lness()y-handled*$made,&rketed*(packaged',
+    '*\'written$#ift$#ken$"l-&+acquisition&+development&$free&)intensive&(learning&#mix&*orientated&)shortages\'\'wopping&%train+"ed',
+    '%!/%%craft%&ed-man\'!.\'&/bored()qualified(,semi-skilled&&rlized%-fully-wrought($ness%#net%*s--ranging\'\'centred(&ulture\'&levels',
+    '\'(updating&!.\'&rivers&!/\'3abilities/aptitudes(!n\'\'forming\'+ideas-based\'#job\'-relationships\'(training&#_as&&eekers%&wisely%!y',
+    '%#net%$read$#ble$(med-milk%#ity$$over$#pin%!s#,n&rehy;tight$!-%*absorption%%boats&(urrowing%\'changer&\'oloured',
+    '+!s\'*nditioning($tact\'%vered*#ing&\'racking\'$eams%$dive)!r%-flint-swimmer*#ery&#old)!s\'"od&\'riendly',
+    '&$raft%\'hammers&$eads%,of-the-teeth%\'peeling&&opping%$safe&\'corcher&(ensitive&\'hedding&(ilkening&(moothing&&urface%$test&\'ingling',
+    '\'"ne)!d%)whitening&%inged&(riggling$$/and%(enlarged$"_a$#and$&basher$&divers$%flaps%#uls$%gsley%!y',
+    '(#/nf(!y$(lessness%#ike$+ned-looking(#off&&r-type\')/casualty))onsultant()gilmerton\'%esque&"ss%$iest&"ly%#ned',
+    '\'&gutted\'&ribbed&\'malinks&$ness$\'popping$&s/race%#ide%#man%#ter$%toned#(p-factor%$over&$wner%$read)#ing',
+    '%"ss$!d$%jacks$$load$"pe&*r/examiner&#tty)\'-hopped%#in\'%"on$#tia%2on&ndash;lancaster&!v$%worth#%rcoat',
+    '%!s$&misher)"s.$"os%$utes$#ret%#ing$(t-chaser*#ing\'&overed&$edge&%folds\'#ull&#hem&%jeans',
+    ',!s&&shaped%!.%&/shoes%!h%/ing&rehy;boards(\'-boards(%board%!y$-ving/daughter#\'schools$#ide$!s$#uit\'!s',
+    '$#ing$\'terdale%)le-ground#+vertex-clad$&ington#(zzenbuch"(jalgsson#&elstad#$omen""ks"/l&mdash;finnish#)ar-becker#$enar"&obelev$%tsova',
+    '$#jan#%geeth#"it##lar%$skin$!d$!e$%ithos$#nik\'"on$!s#$mski#"ob$%lgate%!s',
+    '#$pads%!s$$elos$"jc$"os#&rpions#"tt#$ulde$#sen##vde"$r107$$100m%!5$!7$!9',
+    '$#48m$$600m$!8#$331m$"92#%4000m&!m#$500m#$7.40$!0#%9500m#\'aelings$%ndert$$ting%"ta',
+    '%"ny#$eeee\'"es%!s$"ta$\'wbowski%&driver$*zeczkowska#$iker$&mshire$"ne$!v#)jabinagia#"oo##yed',
+    '#%zypek"1ubiszewskiforeign#%h-wod#"ld$#ker\'!s$.l\'n\'crossbones%\'-amulet&(collared\'\'racking&%flame&$rock($oted&)splitting%(.numbing',
+    '%\'busting%\'cracker%"ed%#man%0s/bones/japanese&%heath\'#ill$$ptur#(nk-drunk&$weed%"ed%%marks#!p##rry$#tfu',
+    '#"ul""y\'$,s-your-limit#*-asserting$#bar%&urials$$clad\'$wing%\'oloured&#ver$)darkening$$edge%(mbracing$\'filling&#res',
+    '$%gazed%&oddess%#rey$&larked%"ed%"it$(piercing&#lot%$roof$(reaching%\'ocketed*!s$\'scraper+\'-packed,\'stacked',
+    '&&ything$"tv$\'writing#$/bbc%"sb##ank#,bolt/polaris%"nd%$shed##cap&!s#*e/believed$#man$!r#\'filling',
+    '#%hawks$#igh$$ooks#)lark-like%!w$-ine&mdash;the\'&-ridge\'!d$&olimne##net%"ws$#nes#%phone$#ort#!r',
+    '$$iote$$mans%)e/captain$"ne$&ockets$"ud#,sail-yarders$$cene%*raper-high(#ing+"ly$#how$%paces%$ort.$(torm-god',
+    '$"el$$ours$$rack&!m$%yping#&umpies#$ving#&wardly$$ings$%riter!,l&eogon;zaki#)ndash;dco"&-1082a\'!p#%ow-ly',
+    '""01"!1#!3"!7"*a-occupied#!/$&jackie$%patsy$%roger#\'b-built%(delicacy\'%rived%\'induced$$/bow(\'-shaped',
+    '$$bish$$like$%sided%$tone)!s#(chtneill$\'k-baked\'\'reasted&&lipped&)ma-girdle&&sailed%&bridge%$skin%!y#%ddery',
+    '$%eburn%!r%!s$#ian#"es#&g-face%%holes%&ladies%#off$!.$!g%"er%!y$$huis$$stad',
+    '##in\'#)lom-style&#ist#)m-bangers%&dances%%shell%$type%\'winning$!a$$min\'%&ockin\'$!p#\'nderers$"es$"ge',
+    '%)ing-match%!s$*t-featured&)polarised&%walls%!y#,p-and-tickle%$back\'#ngs%$down%$slap&$mack$!.$$back$!e',
+    '$%heads$"in$$pity#"rk#0sh&rehy;and-burn%+\'n\'sideburn%!-&\'and-bum*$dash%+backgnarler%#ers%%ingly$"ki#(t-backed$%e-bed',
+    '&$eyed&&fixing&%green&%paved\'#its&(quarries+!y&$roof&%tiled%!.%$blue%$d-in%,ford-balerno%+r-plasterer\'&walker',
+    '\'"ms\'%study%"s/\'%tiles&$tone%%yness$+ford/didcot$#ina$"on$(ted-wood&(r/farmer\'"ys$(y-purple#/ugh&rehy;tering&(ter-cart',
+    ')0/gloucestershire)+ed-pig-like)$fest)\'house-5$%nting#9v&mdash;greek&mdash;latin$--greek-viking%(speakers$#dom$,e&rehy;owner%(-auction&(builders&&driven+"rs&(edwards/',
+    '&#ish&$king&$like&&makers&%oared&*plantation\'$ower&$rags(%iding&)servitors\'#hip\'%tatus&&trader%*/narcotics&$serf',
+    '%%girls%\'holding%!k%$rin\'("gs&#y\'\'$%gorod)#sky$!i%"ca%$nski%#sts$+kosk&yacute%!s$!o',
+    '\'*c-speaking&#ski%$phil\'#one#&wische$$omir##yde$"ed%"th$!n%!e&!y#&zenber"(b-6200j1#!c',
+    '#!c#!m"*e&aacute;n$)ccaron;no#"ak$!n%"or$&ze-bag)#lls\'%hound&%balls%)iest-ever&"ly&$ness%)y-looking',
+    '$-sager/denmark#%ction#"dd%#ale%#ing$$ge-a\'%block\'(hammered&+hammer-heat,#ing$$more#%e-eep$%ctors$(k-furred&&headed',
+    '&\'looking%\'ed-down%"it%$ways$"p-&(argument($ound&)conducive\'&rammed(%eased\'%ycles&+deprivation((stroying\'#irt\'$ream',
+    '\'%illed&(inducing&(learning\'#ine\'%ogged&\'muddled(%ffled&%onset\'"ut&&puffed&)reduction&$save\'%odden&&talker\'#ime',
+    '&\'walkers\'$eary%!.&!9%!/&$drop%#_so%(er-built((skeletal\'"ed(#tte&"th%%ibest&"es&/ng-beauty-style',
+    ')(platform*(olicemen)(quarters)$room)\'tablets(//working/eating(#bag%$line%#out%$talk)#ing&#ime%%walks&#ear%,y&rehy;fruit',
+    '&%boots$(t-driven&\'greased&%laden&(scudding\'(lickened%"ed%#ier$!v%(e-design\'$lace\'%notes\'\'tugging&!.&(/armhole',
+    '&"s7%#ies%$less#!f#$ibhe$/gh/conservative\'%trust&$bell*!s&"ed&)t-of-atom\'$holm)"me\'$olme$$pnir',
+    '#(mmadenia#\'ndaneck%(er-faced(&legged)%imbed(&necked(\'stemmed(\'thighed)$ubed(\'waisted\'#ing("se#!p$!e$#ian',
+    '$$t-in##shi$%inger$#ser$#vig#$till#(uth-like##ver#!y#3zak**communications"%f-ugt"%iante#!c$*e-and-dice&+of-brooklyn',
+    '&&shaped\'&quared%%d-off\'\'through\'%white%"rs%"s.$6ing-across-the-stomach$&k-back&%edged&&moving&\'running&(shifting\'$oled\'$tyle',
+    '%$edit&#ned\'#ing%+ly-packaged)&lanned%%suits#*d&rehy;ing$)-tackling$(e-albums\'#way&*collection&$down&\'holding&+illustrated&(lectures',
+    '&#off\'!n&,presentation(\'ojector&)sequences("ts\'$hows&(tackling&"up%!.%)/cassette&$film\'\'retting&$talk&%video',
+    '%%rskew%*s-theatres%$walk\'"ys&%riter%!y$#in\'&\'g-fence)&olding)$ront(&scales\'!/#\'edrecht$%veban&\'lamagan',
+    ')"on&$true#$gged$%hltly%"t-&$gest&<ly-absurd-boyish-middle-aged*\'ccented)%dodgy).less-ephemeral)(modified)%raise&!y#!h#!i',
+    '#!k$#ely$$stat#(m-bladed%(fingered%#jim%&weight&$hite$%/thin$%athon$%e-bag("ll&\'covered&)encrusted&%laden',
+    '&&moulds%&/water$$fast()-addicted$$iest$!l%$ines\'!g$"ma&%-soup%*er-looking(+of-the-year\'$suit%#ish$\'nastics',
+    '$\'obility#"ne$"g*%$-bag&\'hammock&$like%$back%*sby-castle($brae&,hot-throwers%!y$%kiest&"n\'%&y-funk#&p-case',
+    '\'&tching&$over%)decorated%%joint%$knot%#off&#ver%(stitched\'$ream%$tack$$case$#ery$$form$&houses$#man',
+    '%$vers$%pages%!d%!e&&d-disc&\'r-fight*%nding($like\'$s_on\'(y-bodied)\'tongued%#in\'\'#ess%$y(w)$\'s/cards',
+    '&$ones&\'reaming$!t$$ware$"yi#"st#\'t-mouth*"ed%(pupilled%&shaped%&trench$"ch$#est$(heringly*!s',
+    '$$shot$#ter%#ier&(ng-mills%!s#&udikas#)ver&mdash&"ed&%stone&!y$%inski"!k""mp"%o-blo$\'cooking',
+    '\'$type&-/radiographer&!d%"ie$#tch#$bbed&\'r-chops\'%ed-on%#ing&"sh$#dom$%erdan&#ing$\'odavian&\'chikoff',
+    '&$kina%!m#\'chteren$!k$"um#%dgers#\'e-black%$wind#$gadh%(n-filled\'&makers\'\'reading\'(spouting&#eer&%izing',
+    '&"s.$"gi#"ke#"mo#!n$&imskii(!y#%oping#\'p-basin&%ucket%$girl%#out%\'sellers&#hop&,lop-slopping',
+    '$(e-backed&&masted&*shouldered%!.%*/intercept%$side%!y&!s$*ing-beamed$,pily-knotted$&seller#,rc-appointed$"ry#(sh-slosh%"_a',
+    '#,t-and-filler%$head%"in&%t-out%(machines&$eter&&outhed%&shaped$&erdijk&$meer$)h-brained&)flattened&$like%$like$$nick',
+    '$5ted/philips/posidrive%#ies#)uch-happy$(gh-based\'\'windsor&\'/border\'(gunsmith&&ed-off&%iness$!s$!t#(vak-born\')hungarian%#nia(!n',
+    '$"en&(ian-made&!s\'"ka%!s$"ic%%ncian$$odan#(w-bowled&(reathing(%eding&%urner\'&t-sure%\'closing&)ombustion',
+    '&$rawl%%dance*!s)#ing&)eveloping&\'raining%&footed%%going&%roove*#ing(#wer%,hand-clapped%(learning&&ooking%%match',
+    '(%uring&%inded&\'otioned\'%ving\'%&oozing%&paying&(unctured%(reacting&\'ipening&&ooting&&unning%(simmered&\'peaking\'&inning\'$oken',
+    '($tely\'%epped&(ubsiding%%tempo&\'hinking&"op&%witch%(whirling&)ittedness$\'/static$+=wittedness$$acki$#boy$\'clapped%&oaches',
+    '%)r-burning\'+evaporating\'&footed\'\'turning%\'st-ever*&olving(&moving(&witted$$hand$"ie%#ngs$#ley%)y-growing\'&moving\'*responding',
+    '\'\'sinking\'\'varying&%.into&%/very$&moving$%ness.$\'poke-2s#!y""pp"$sfce&$comm"$trep"%ubber%!y$#ice',
+    '#&dberry$!d%"en$$ents$*ge-blanket\'&filled\'%green\'#out&(coloured&#ful#$ffen#(g-pellet+!s%&witted$$gett',
+    '%!y$$head$$like$\'smeared#\'ice-box\'$room$$jter$!s#+m-clearance%(dwelling%\'housing%#kid%$like$%b\'red%"ag',
+    '\'#ers\'#ous$$mers\'!y!-tatus-neutral',
 )
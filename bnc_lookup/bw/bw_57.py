@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_57 = (
+count_57 = 6695
+
+heads_57 = (
     'samios',
-    'samiran',
-    'samis',
-    'samiullah',
-    'samkin',
-    'samleilei',
-    'samlingspartiet',
-    'samlot',
-    'samm',
-    'samma',
-    'sammacchini',
-    'sammakkhi',
-    'sammas',
-    'sammat',
-    'sammelbuch',
-    'sammels.',
     'sammick',
-    'sammlungen',
-    'sammonds',
-    'sammons/alzheimers',
-    'sammons/husband',
-    'sammurai',
-    'sammutt/geoff',
-    'sammy-',
-    'samn.',
-    'samochodow',
-    'samoens',
-    'samogneux',
-    'samogon',
-    'samooblozhenie',
-    'samore',
-    'samourai',
     'samoyovska',
-    'sampales',
-    'sampan-crowded',
-    'sampan-ladies',
-    'sampathknmar',
-    'sampe',
-    'sampebogo',
-    'sampford',
-    'sampha',
-    'sampier',
-    'sampl',
-    'sampladelic',
-    'sample-aided',
-    'sample-books',
-    'sample-charging',
-    'sample-laden',
     'sample-replace',
-    'sample-site',
-    'sample-survey',
-    'sample-tracking',
-    'sample/',
-    'sample/liberal',
-    'sample/total',
-    'samplecore',
-    'sampledelic',
-    'samples/200',
-    'samplesat',
-    'sampson&rehy;simon',
-    'sampson/royal',
-    'sampson_at',
-    'sampsons',
-    'samreboi',
     'sams/former',
-    'samsi-adad',
-    'samsing',
-    'samson/series',
-    'samsonowicz',
-    'samsons',
-    'samsungs',
-    'samt&ouml;k',
-    'samtack',
-    'samtredia',
-    'samu',
-    'samudavanij',
-    'samudra',
-    'samuel/apollo',
-    'samuel/chief',
-    'samuelite',
     'samuelson-solow',
-    'samuely',
-    'samugarh',
-    'samwayts',
-    'samwidge',
-    'samwil',
-    'san&amacr;tani',
-    'san&iacute;n',
-    'san\'c',
-    'san-feng',
-    'san-mart&iacute;n',
-    'san.',
-    'sanaan',
-    'sanacja',
-    'sanada',
-    'sanakham',
     'sanandaj',
-    'sanara',
-    'sanatrem',
-    'sanc',
-    'sanc&rehy;tions',
-    'sanca',
-    'sancak',
-    'sances',
-    'sanchaspis',
-    'sanches',
-    'sanchez-pacheco',
-    'sanchez-pizjuan',
-    'sanchezvicario',
-    'sanchi',
-    'sanchia',
-    'sanchos',
     'sanco',
-    'sancreed',
-    'sancroft-baker',
-    'sanct',
-    'sanctifier',
-    'sanctimony-baiting',
-    'sanctionalizing',
-    'sanctioners',
-    'sanctions.',
-    'sanctions/punishments',
-    'sanctissima',
-    'sanctissimae',
-    'sanctitry',
-    'sanctuario',
-    'sanctuary&rehy;buildings',
-    'sanctuary-lamp',
     'sanctums',
-    'sand&oacute;val',
-    'sand&ouml;ya',
-    'sand&rehy;bars',
-    'sand-',
-    'sand-bagging',
-    'sand-bags',
-    'sand-baths',
-    'sand-blocking',
-    'sand-blowing',
-    'sand-brick',
-    'sand-building',
-    'sand-carrying',
-    'sand-channels',
-    'sand-colored',
-    'sand-damaged',
     'sand-deaths',
-    'sand-digging',
-    'sand-dominated',
-    'sand-elephant',
-    'sand-environed',
-    'sand-faced',
-    'sand-fixation',
-    'sand-flecked',
-    'sand-flies',
-    'sand-free',
-    'sand-grain',
-    'sand-green',
-    'sand-house',
-    'sand-jointed',
-    'sand-ladders',
-    'sand-over-rock',
     'sand-papered',
-    'sand-pies',
-    'sand-pile',
-    'sand-pool',
-    'sand-rich',
-    'sand-scoured',
-    'sand-sea',
-    'sand-silt',
-    'sand-sized',
-    'sand-storm',
-    'sand-storming',
-    'sand-trap',
-    'sand-wedge',
-    'sand/glue',
-    'sand/send',
-    'sand:cement',
     'sand:silt:clay',
-    'sandactylus',
-    'sandal-hose',
-    'sandal-wearer',
-    'sandal-wearing',
-    'sandal-wood',
-    'sandal/wiltshire',
-    'sandalwood-sticks',
-    'sandalwoods',
-    'sandaway.',
-    'sandbatch',
-    'sandbath',
-    'sandblast',
-    'sandborne',
-    'sandboxes',
-    'sandbridge',
     'sandbrook',
-    'sandcastling',
-    'sande',
-    'sandefjord',
-    'sandeman/neurosurgeon',
-    'sandemanian',
-    'sander/norton',
-    'sandercock',
-    'sanders/fairport',
-    'sanders/solicitor',
-    'sanderson.',
-    'sanderson/15',
-    'sanderson/author',
-    'sanderson/businessman',
-    'sanderson/collection',
-    'sanderstead-elmers',
     'sandes',
-    'sandfell',
-    'sandfield',
-    'sandflats',
-    'sandflats.',
-    'sandford-on-thames/oxfordshire',
-    'sandgatte',
-    'sandham-gover',
-    'sandheap',
-    'sandhoppers',
-    'sandhurst-educated',
-    'sandhutton',
-    'sandification',
-    'sandifordprime',
-    'sandimmun',
-    'sanding/grinding',
     'sandings',
-    'sandinismo',
-    'sandinist',
-    'sandjak',
-    'sandland',
-    'sandle',
-    'sandleas',
-    'sandleford',
-    'sandles',
-    'sandlime',
-    'sandling/k9',
-    'sandlot',
-    'sandlow',
-    'sandmaster',
-    'sandmo',
-    'sandoricum',
     'sandow',
-    'sandoya',
-    'sandpaper-like',
-    'sandpaperback',
-    'sandpapery',
-    'sandport',
-    'sandra/symington',
-    'sandray',
-    'sandre',
-    'sandrelli',
-    'sandri',
-    'sandringham-envoy',
-    'sandroyd',
-    'sandry',
-    'sandry/club',
-    'sands-patsy',
     'sands/buckinghamshire',
-    'sands/dentist',
-    'sands/driver',
-    'sandscape',
-    'sandschool',
-    'sandschooner',
-    'sandshield',
-    'sandside',
-    'sandslips',
-    'sandspill',
-    'sandstorm-swept',
-    'sandton',
-    'sandugo',
-    'sanduka',
-    'sandurbans',
-    'sandved',
     'sandvicensis',
-    'sandwashed',
-    'sandwasps',
-    'sandwear',
-    'sandwedge',
-    'sandwich-consumption',
-    'sandwich-man',
-    'sandwich-pinching',
-    'sandwich-society',
-    'sandwich-type',
-    'sandwicum',
-    'sandwip',
-    'sandwirth',
-    'sandworm',
-    'sandwort',
-    'sandy&rehy;man',
     'sandy-and-alastair',
-    'sandy-blond',
-    'sandy-clay',
-    'sandy-coated',
-    'sandy-loam',
-    'sandya',
-    'sandybank',
-    'sandyglade',
-    'sandyha',
-    'sandyknowe',
-    'sandyknowes',
-    'sandylands',
-    'sandys-clerk',
-    'saneengraving',
-    'sanel',
-    'sanfoin',
     'sanford-garrod',
-    'sanfords',
-    'sanforised',
-    'sang-koi',
-    'sang-sang-dang',
-    'sangai',
-    'sangak',
-    'sangallo',
-    'sangar',
-    'sangaralinigam',
-    'sangaree',
-    'sangay',
-    'sangeet',
-    'sangemini',
-    'sangermanensis',
-    'sangeveneth',
     'sanghatena',
-    'sanghvi',
-    'sanghyang',
-    'sangiti',
-    'sanglant',
-    'sangrail',
-    'sangreal',
-    'sangs',
-    'sangshak',
-    'sangstha',
-    'sanguettoli',
-    'sanguinaro',
-    'sanguined',
-    'sanguines',
-    'sanguineum',
-    'sanguinity',
     'sanguinolenta',
-    'sangwedge',
-    'sangwidge',
-    'sangwin',
-    'sangyang',
-    'sangyip',
-    'sanh',
-    'sanhailt',
-    'sani&rehy;tation',
-    'sani-duct',
-    'sanibel',
-    'sanica',
-    'sanier',
-    'saniff',
-    'saniflush',
-    'sanilav',
     'sanir',
-    'sanisko',
-    'sanit&agrave',
-    'sanita',
-    'sanitaire',
-    'sanitaria',
-    'sanitarians',
-    'sanitarias',
-    'sanitarium',
-    'sanitas',
-    'sanitises',
-    'sanitization',
-    'sanity-saving',
-    'sanityclawsiscomingtotown',
-    'saniyya',
-    'sanjaasureniyn',
     'sanjeev',
-    'sanjeye',
-    'sanjib',
-    'sanjiv',
-    'sank-i',
-    'sanka',
-    'sankaran',
-    'sankawa',
-    'sankeiv',
-    'sankeys',
-    'sankin',
-    'sanko',
-    'sankofa',
-    'sankoh',
-    'sankong',
-    'sankowski',
     'sankt',
-    'sanliurfa',
-    'sanlucar',
-    'sanmei',
-    'sanmichele',
-    'sanna',
-    'sannat',
-    'sannazzaro',
-    'sanndila.',
-    'sannia',
-    'sannuto',
-    'sannyasin',
-    'sanodin',
-    'sanogo',
-    'sanoko',
-    'sanos',
     'sanquahar',
-    'sanquar',
-    'sanquirico',
-    'sanrizz',
-    'sans-amp',
-    'sansavino',
-    'sansbury',
-    'sanseveria',
-    'sansevero',
-    'sansisu',
-    'sanski',
-    'sanski-most',
-    'sanskrit/bengali/english',
-    'sanskritam',
-    'sansolaine',
-    'sansom/aylesbury',
     'sanspareil',
-    'sanspeur',
-    'sanstisima',
-    'sant\'agnese',
-    'sant\'agostino',
-    'sant\'anna',
-    'sant\'efisio',
-    'sant\'elena',
-    'santa-cruz',
-    'santa-trap',
-    'santacristina',
-    'santacroce',
-    'santalaceae',
-    'santalucia',
-    'santalum',
-    'santamaria(psc)',
     'santamonica',
-    'santampa',
-    'santander-mediterraneo',
-    'santano',
-    'santanta',
-    'santaray',
-    'santecroce',
-    'santero',
-    'santeuil',
-    'santi&agrave',
-    'santi-potros&oacute',
-    'santiago-based',
-    'santillana-del-mar',
-    'santiniketan',
-    'santiprabob',
-    'santissima',
     'santol',
-    'santonian',
-    'santonin',
-    'santonio',
-    'santonlinas',
-    'santos-dumont',
-    'santosc.',
-    'santovenia',
-    'santri',
-    'santschii',
-    'santslaue',
-    'santullano',
-    'santz',
-    'sanus',
-    'sanusiya',
-    'sanxay',
     'sanxters',
-    'sany',
-    'sanyang',
-    'sanyos',
-    'sanzio',
-    'sanzo',
-    'saolanum',
-    'saome',
-    'saomeone',
-    'saos',
-    'saos-2',
-    'sap&mdash;swedish',
-    'sap-feeding',
-    'sap-glove',
-    'sap-water',
-    'sap1-vp16',
     'sapanidis/broadway',
-    'saperavi',
-    'saperda',
-    'saperlipopette',
-    'sapete',
-    'sapeurs',
-    'sapey/worcestershire',
-    'sapha',
-    'saphena',
-    'saphiers',
-    'saphorin',
-    'saphs',
-    'sapien',
-    'sapientes',
-    'sapientia',
-    'sapientiae',
     'sapiential',
-    'sapinense',
-    'sapir-wharf',
-    'sapley',
-    'sapo',
-    'sapodilla',
-    'sapolsky',
-    'sapore',
-    'sapperton/gloucestershire',
-    'sapphica',
-    'sapphire-coloured',
-    'sapphire-hard',
-    'sapphire-hued',
-    'sapphism',
-    'sappi',
-    'sapristi',
     'saprolegniasis',
-    'saprolite',
-    'saprophagy',
-    'sapsea',
-    'sapsunthorn',
-    'sapta',
-    'saptagram',
-    'saqer',
-    'saqqa',
-    'saqqo',
-    'saqueboutes',
-    'saquier',
-    'sar-3',
-    'sar-e-pol-e-zahab',
-    'sar-i-sang',
-    'sara&mdash;i',
     'sarab',
-    'sarabhai',
-    'saraburi',
-    'saracena',
-    'saracouu',
-    'sarafina',
-    'sarafiyah',
-    'sarafotoxins',
-    'sarah-clare',
-    'sarah-jayne',
-    'sarah-louise',
-    'sarah/hiv',
-    'sarah/resident',
-    'sarairehtransport',
-    'sarajavo',
-    'sarajevo-edinburgh',
     'sarajuddin',
-    'saramago',
-    'saramma',
-    'saranda',
-    'sarandi',
-    'sarandon.',
-    'sarangi',
-    'sarariman',
-    'saras',
-    'sarasa',
-    'sarasindeputy',
-    'sarasinforeign',
-    'sarassoro',
-    'sarasusa',
-    'sarasvati',
-    'saraswati',
     'saravanamuttu',
-    'saravejo',
-    'sarawak-based',
-    'sarawat',
-    'sarawhacked',
-    'saray',
-    'sarazin',
-    'sarba',
-    'sarbah',
-    'sarbanes',
-    'sarbethsabanaiel',
-    'sarbin',
-    'sarbskie',
-    'sarca',
-    'sarcandas',
-    'sarcar',
     'sarcarsm',
-    'sarcasin',
-    'sarcastic.',
-    'sarcastically.just',
-    'sarcastics',
-    'sarcenet',
-    'sarcinet',
-    'sarcobatus',
-    'sarcococa',
-    'sarcocornia',
-    'sarcoma.',
-    'sarcomere',
-    'sarcophytons',
-    'sarcophytum',
-    'sarcoptic',
-    'sarcosomes',
     'sarcosyl-200',
-    'sarcotesta',
-    'sarda',
-    'sardarji',
-    'sardasht',
-    'sarde',
-    'sardelov&aacute',
-    'sardet',
-    'sardial',
-    'sardinas',
-    'sardined',
-    'sardinely-intimate',
-    'sardinhas',
-    'sardinia/cannigione',
-    'sardonicus',
-    'sardou',
     'sarecens',
-    'sared',
-    'saree',
-    'sarek',
-    'sarf',
-    'sarfield',
-    'sarflax',
-    'sargent-wallace',
-    'sarginson',
-    'sargsyan',
-    'sarguja',
-    'sari-clad',
-    'sarian',
-    'sarianne',
-    'sarice',
-    'sarie',
     'saried',
-    'sarine',
-    'saring',
-    'sariquey',
-    'sarishvili',
-    'sariska',
-    'sarit',
-    'sariwon',
-    'sarjeant',
-    'sarjo',
-    'sarkara',
-    'sarker',
-    'sarkhel',
-    'sarla',
-    'sarles',
-    'sarling',
     'sarlvik',
-    'sarma',
-    'sarmad',
-    'sarmatia',
-    'sarmatians',
-    'sarmentosa',
-    'sarmineto',
-    'sarn-major',
-    'sarnat',
-    'sarnoeds',
-    'sarod',
-    'sarofim',
-    'saroi',
-    'sarong-dress',
-    'saronging',
-    'sarongwise',
     'sarony',
-    'saros',
-    'sarouks',
-    'sarpedon',
-    'sarphie/oxford',
-    'sarplers',
-    'sarples',
-    'sarpsis',
-    'sarrag',
-    'sarrasin',
-    'sarratt',
-    'sarrazin',
-    'sarreqi',
-    'sarries',
-    'sarsa',
-    'sarsank',
     'sarsden',
-    'sarsenet',
-    'sarsfields',
-    'sarsfleld',
-    'sarsia',
-    'sarsons',
-    'sart-i',
-    'sartilly',
-    'sartine',
-    'sartorially-conscious',
-    'sartorio',
-    'sartre-nizan',
-    'sartre.',
-    'sartreanism',
-    'saruca',
-    'sarukh&aacute;n',
     'sarukh&auml;n',
-    'sarukhani',
-    'saruman-',
-    'sarva',
-    'sarvo',
-    'sarwal',
-    'sarwari',
-    'sarwono',
-    'saryk',
-    'sarzana',
-    'sas-page',
-    'sas-stay',
-    'sas-trained',
-    'sas-type',
-    'sas/lab',
-    'sasanian',
     'sasbacher',
-    'sasbury',
-    'sasebo',
-    'saseno',
-    'sash-and-case',
-    'sash-and-pulley',
-    'sash-cord',
-    'sash-pattern',
-    'sash-window',
-    'sashcord',
-    'sashemene',
-    'sashimi',
-    'sashkin',
-    'sashless',
-    'sashlock',
-    'sasho',
     'sashok',
-    'sasib',
-    'sasino',
-    'saslow',
-    'saso',
-    'saspe',
-    'sasquatch',
-    'sasquianna',
-    'sasra',
-    'sassan',
-    'sassaniansm',
-    'sassanid',
-    'sassettesque',
-    'sassie',
-    'sassine',
-    'sasslong',
     'sassoferrato',
-    'sassoi',
-    'sassolungo',
-    'sassoon&mdash;dead',
-    'sassoon/make-up',
-    'sassou',
-    'sastri',
-    'sastry',
-    'sat&ndash;6.00',
-    'sat&ndash;mon',
-    'sat\'day',
-    'sat-down',
-    'sat-in',
-    'sat-is-factory',
-    'sat-mon',
-    'sat4/sunday',
     'satajit',
-    'sataki',
-    'satanas',
-    'satani',
-    'satans',
-    'satantic',
-    'sataome',
-    'satchanalai',
-    'satchel-briefcase',
-    'satchell/bereaved',
-    'satchell/project',
-    'satchfield',
-    'sate-of-affairs',
-    'sate-of-the-art',
-    'satefl',
-    'satellit',
     'satellite&mdash',
-    'satellite-borne',
-    'satellite-directed',
-    'satellite-earth',
-    'satellite-linked',
-    'satellite-related',
-    'satellite-to-cable',
-    'satellites.',
-    'satelo',
-    'satfa',
-    'sathar',
-    'sathasivam',
-    'sathirakul',
-    'sathor',
-    'satiable',
-    'satie-type',
     'satieties',
-    'satify',
-    'satifying',
-    'satija',
-    'satin-birds',
-    'satin-bound',
-    'satin-clad',
-    'satin-cloaked',
-    'satin-draped',
-    'satin-gloss',
-    'satin-hard',
-    'satin-like',
-    'satin-padded',
-    'satin-quilted',
-    'satin-sheen',
-    'satin-shod',
     'satin-soft',
-    'satin-stitch',
-    'satin-type',
-    'satin-weave',
-    'satinelle',
-    'satinfin',
-    'sations',
-    'satipo',
-    'satir',
-    'satiric-epic',
-    'satirick',
-    'satis-factory',
-    'satisfac',
-    'satisfact',
-    'satisfaction&mdash;there',
-    'satisfaction-guaranteed',
     'satisfaction-less',
-    'satisfaction.',
-    'satisfaction.in',
-    'satisfactory\'',
-    'satisfactory-',
-    'satisfation',
-    'satisfaxtion',
-    'satisficers',
-    'satisfied-',
-    'satisfied-looking',
-    'satisfier',
-    'satisfy-schmatisfy',
-    'satisifes',
-    'satisified',
-    'satist',
-    'sativa/',
     'satkhira',
-    'satomayor',
-    'satorial',
-    'satoru',
-    'satrai',
-    'satrapiff',
-    'satrapize',
-    'satriani-esque',
-    'satriawan',
-    'satschen',
-    'satsriakat',
-    'satstream',
-    'satt',
-    'sattasai',
-    'sattb',
-    'satterly',
     'sattherthwaite',
-    'sattler',
-    'satuki',
-    'satura',
-    'saturady',
-    'saturated-colour',
-    'saturation-bombing',
-    'saturatus',
-    'saturd',
-    'saturday-afternoon',
-    'saturday-sunday',
-    'saturday.friday',
-    'saturday.headteacher',
-    'saturday.the',
-    'saturday/andrew',
-    'saturday/saturday',
     'saturdee',
-    'saturlite',
-    'saturn-neptune',
-    'saturn-skimming',
-    'saturnalian',
-    'saturnalias',
-    'saturnians',
-    'saturniid',
-    'saturnis',
-    'satva',
-    'satway',
-    'satwhile',
-    'satyanarayana',
-    'satyendra',
-    'satyendranath',
-    'satyr-like',
     'satyragraha',
-    'satyrane',
-    'satyromania',
-    'sauce-bottle',
-    'sauce-box',
-    'sauce-covered',
-    'sauce.',
-    'sauce.the',
-    'sauceboat',
-    'sauceboats',
-    'saucepan-hitting',
-    'saucer-sized',
-    'sauces.',
-    'sauchiebank',
-    'sauchieburn',
-    'sauci&egrave;re',
     'saucier',
-    'sauciest',
-    'saucisson',
-    'saucy-face',
-    'saude',
-    'saudi-flag',
-    'saudi-instigated',
-    'saudi-iranian',
-    'saudi-iraqi',
-    'saudi-kuwait',
-    'saudi-led',
-    'saudi-supported',
-    'saudi/iraq',
-    'saudi/iraqi',
-    'saudi/jordanian',
-    'saudita',
     'saudiya',
-    'sauerbrunnen',
-    'sauerdale',
-    'sauerl&auml;nder',
-    'sauerland',
-    'sauff',
-    'saugor',
-    'saugur',
-    'saulces',
-    'sauleyan',
-    'saulez',
-    'saulire',
-    'saulos',
-    'sauls',
-    'saulter',
-    'saumares',
     'sauna-bath',
-    'sauna/bathroom',
-    'sauna/shower',
-    'sauna/solarium',
-    'saunce',
-    'saunchie',
-    'saunders\'challenge',
-    'saunders-atkinson',
-    'saunders/aeeu',
-    'saunders/aston',
-    'saunders/friends',
-    'saunders/landlady',
-    'saunders/principal',
-    'saunders/wiltshire',
-    'saunderton',
-    'saunderton/buckinghamshire',
     'saunher',
-    'sauni',
-    'sauni&egrave;re',
-    'saunk',
-    'saunterer',
-    'saunterers',
-    'saunting',
-    'sauour',
-    'sauoure',
-    'saurashtra',
-    'saurat',
-    'saures',
-    'saurischia',
-    'sauromaulus',
-    'sauropodomorpha',
-    'sauros',
     'saurosuchus',
-    'saurus',
-    'sausag',
-    'sausage-diameter',
-    'sausage-hung',
-    'sausage-munching',
-    'sausage-roll',
-    'sausage-rolls',
-    'sausage-skin',
-    'sausage.the',
-    'sausagey',
-    'sauser-hall',
-    'sausmarez',
-    'saussuritisation',
-    'saut',
-    'saut&eacute;eing',
     'saut&egrave',
-    'sauted',
-    'sauterne',
-    'sauteuse',
-    'sautez',
-    'sautill&eacute',
-    'sautoir',
-    'sautr&acirc;nkitas',
-    'sauts',
-    'sauvages',
-    'sauvagnargues',
-    'sauve',
-    'sauviac',
-    'sauychaisri',
-    'sauze',
-    'sauzon',
     'sav',
-    'sav\'ry',
-    'sav-a-cup',
-    'sava-danube-morava-vardar',
-    'sava-danube-una',
-    'savable',
-    'savage/clerk',
-    'savage/director',
-    'savage/former',
-    'savagery-civilization\'',
-    'savaides',
-    'savanah',
-    'savanahs',
-    'savang',
-    'savanin',
-    'savanna-like',
     'savannah-dwelling',
-    'savannah-like',
-    'savannah:filled',
-    'savannakhet',
-    'savaria',
-    'savart',
-    'savary/iain',
-    'savasi',
-    'savaskan',
-    'save-and-restore',
-    'save.by',
-    'saved\'',
-    'saved-by-the-bell',
-    'saved/',
-    'savedvalues.',
-    'savedvalues.btm.calibmeas',
     'savedvalues.top.calibmeas',
-    'saveli',
-    'savelletri',
-    'saveloys',
-    'saver-class',
-    'saver-plus',
-    'saver-type',
-    'saverimutto',
-    'saverland',
-    'saverne',
-    'savery-gilliard',
-    'saverys',
-    'saves.',
-    'saveurs',
-    'savevski',
-    'savez',
     'saviano',
-    'savica',
-    'savides',
-    'savidge/tugboat',
-    'savignon',
-    'savigny-les-beaune',
-    'savile/speaking',
-    'saville-row',
-    'saville-troike',
-    'savilleion',
-    'savilles.',
-    'saving&amp;investment',
-    'saving\'',
-    'saving_a',
-    'savings&amp;investment',
-    'savings-and-loans',
     'savings-freeze',
-    'savings-investment',
-    'savings-sucking',
-    'savingsd',
-    'savinjski',
-    'savinkov',
-    'savioli',
-    'savioni',
-    'savior',
-    'savior-faire',
-    'saviour\'',
-    'saviour-designate',
-    'saviour-of-the-day',
-    'saviourgate',
-    'saviours/butchers',
-    'savoia-81',
     'savoia-marchetti',
-    'savoias',
-    'savoldi',
-    'savonneries',
-    'savoor',
-    'savoring',
-    'savorys',
-    'savouriness',
-    'savourless',
-    'savoury-snack',
-    'savoy&mdash;vial',
-    'savoy-mont',
-    'savoyarde',
-    'savrasov',
-    'savrola',
-    'savuka',
     'savundra',
-    'savuti',
-    'savva',
-    'savvidhis',
-    'savviest',
-    'savvin',
-    'savy',
-    'savynge',
-    'savzey',
-    'saw\'',
-    'saw-bench',
-    'saw-billed',
-    'saw-bones',
-    'saw-cutting',
-    'saw-dust',
-    'saw-handled',
     'saw-horse',
-    'saw-jaws',
-    'saw-like',
-    'saw-playing',
-    'saw-ree',
-    'saw-scaled',
-    'saw-set',
-    'saw-stroke',
-    'saw-type',
-    'saw-wort',
-    'saw_at',
-    'saw_each',
-    'sawadogo',
-    'sawairi',
-    'sawalha',
-    'sawang',
     'sawant',
-    'sawasdi',
-    'sawasdipanicheducation',
-    'sawblade',
-    'sawbuck',
-    'sawceres',
-    'sawczuk/race',
-    'sawder',
-    'sawdering',
-    'sawdust\'',
-    'sawdust-covered',
-    'sawdust-on-the-floor',
-    'sawdust-scented',
-    'sawdust-strewn',
-    'sawful',
-    'sawhney',
     'sawing-halfway-through',
-    'sawk',
-    'sawlogs',
-    'sawm',
-    'sawmilling',
-    'sawn-faced',
-    'sawn-out',
-    'sawn-up',
-    'sawnwood',
-    'sawori',
-    'sawr',
-    'sawrij',
-    'sawriters',
-    'sawtelle',
-    'sawth',
-    'sawtsila',
     'sawyer/hairdresser',
-    'sawyer/thamesdown',
-    'sawyer/wiltshire',
-    'saxafraga',
-    'saxafrazz',
-    'saxatilis',
-    'saxaul',
-    'saxe-',
-    'saxe-altenburg',
-    'saxe-coburg-saalfeld',
-    'saxe-gotha',
-    'saxed-up',
-    'saxene',
-    'saxida',
-    'saxitoxin',
-    'saxon-dominated',
     'saxon-les-bains',
-    'saxondum',
-    'saxone-to-selfridges',
-    'saxonhouse',
-    'saxonica',
-    'saxonis',
-    'saxonum',
-    'saxophon',
-    'saxophone/vocals',
-    'saxophones.',
-    'saxophonic',
-    'saxophonised',
-    'saxthorpe',
-    'saxton/father',
-    'say&mdash',
-    'say&mdash;but',
     'say&mdash;internal',
-    'say&mdash;nor',
-    'say&mdash;seeing',
-    'say&mdash;whether',
-    'say\'',
-    'say\'st',
-    'say-about',
-    'say-as',
-    'say-foring',
-    'say-ing',
-    'say-understandable',
-    'say.',
-    'say.j',
-    'say.what',
-    'say/are',
-    'say/feel/or',
     'say/think',
-    'say/u/',
-    'saya\'gyi',
-    'sayable',
-    'sayag',
-    'sayah',
-    'sayang',
-    'saychel',
-    'sayde',
-    'sayeef',
-    'sayegh',
-    'sayen',
-    'sayengis',
-    'sayeso',
-    'sayeth',
-    'sayette',
     'saying-that',
-    'saying-the-other-thing',
-    'saying/implying',
-    'saying_a',
-    'saying_as',
-    'saylac',
-    'saylani',
-    'saylex',
-    'sayn',
-    'sayn-wittgenstein',
-    'sayng',
-    'says&mdash',
-    'says&mdash;she',
-    'says\'i',
-    'says-',
-    'says-none',
     'says.his',
-    'says/report',
-    'says:she',
-    'says:yes',
-    'saysomphone',
-    'saysthe',
-    'saythe',
-    'saywhenpleasesir',
-    'saywun',
-    'sayy',
-    'sayyaf',
-    'sazabiss',
-    'sazalapa',
-    'sazan',
-    'sazeman-e-ettle',
-    'sazli',
     'sazmane',
-    'sazonov',
-    'saztec',
-    'sb&ndash;307b',
-    'sb-301',
-    'sb-series',
-    'sb1000',
-    'sb124',
-    'sb125',
-    'sb2',
-    'sb2156',
-    'sb2174-et1',
-    'sb2201',
-    'sb2c-5',
-    'sb301',
-    'sb305',
     'sb4',
-    'sb502',
-    'sb90',
-    'sbaat/hms',
-    'sbbc',
-    'sbc1000',
-    'sbcdc',
-    'sbgp',
-    'sbgr',
-    'sbili',
-    'sbj',
-    'sbj(pmmlib.gimmsjob1)',
-    'sblim-2',
-    'sbml',
-    'sbordini',
-    'sbordoni',
     'sbow',
-    'sbp',
-    'sbt',
-    'sburelin',
-    'sbus-based',
-    'sbus/mbus',
-    'sc&eacute;nes',
-    'sc&ndash;54d',
-    'sc*m',
-    'sc-scared',
-    'sc-u-pa',
-    'sc.12',
-    'sc.2',
-    'sc.3',
-    'sc.5',
-    'sc.7',
     'sc.9',
-    'sc.d',
-    'sc/s',
-    'sc4d4e095h',
-    'sc4d4e133&lsqb;h&rsqb',
-    'sc5-practical',
-    'sc60',
-    'sc71',
-    'sc74',
-    'sc76',
-    'sca-1',
-    'scaachi',
-    'scab-free',
-    'scab-prone',
-    'scab-rar-toom',
-    'scabbiest',
     'scabbing',
-    'scabby-looking',
-    'scabei',
-    'scabetic',
-    'scabied',
-    'scabini',
-    'scabiosa/nigra',
-    'scabland',
-    'scablands',
-    'scabratum',
-    'scabrotrigonia',
-    'scabrousness',
-    'scaccario',
-    'scaccarium',
-    'scaccia',
-    'scachorum',
     'scadgers',
-    'scadron',
-    'scadukm478275',
-    'scaffold-web',
-    'scaffolding-supported',
-    'scaffy',
-    'scaftafjell',
-    'scag',
-    'scail',
-    'scailing',
-    'scaillierez',
-    'scaitcliffe',
-    'scalacronica',
-    'scalambria',
-    'scalambrin',
-    'scalation',
     'scalco',
-    'scald-crows',
-    'scaldava',
-    'scale-backed',
-    'scale-changes',
-    'scale-derived',
-    'scale-drumming',
-    'scale-giveaway',
-    'scale-in',
-    'scale-independent',
-    'scale-less',
-    'scale-logging',
-    'scale-model',
-    'scale-pans',
-    'scale-related',
-    'scale-work',
     'scale.',
-    'scale/chord',
-    'scale/size',
-    'scaleber',
-    'scaled&rehy;down',
-    'scaled-',
-    'scaled-back',
-    'scalelike',
-    'scalers',
-    'scalesburn',
-    'scalesceugh',
-    'scalesman',
-    'scaley',
-    'scali',
-    'scaliaris',
-    'scaligeri',
     'scaligiers',
-    'scaliness',
-    'scaling-ladders',
-    'scaling-ropes',
-    'scalingc',
-    'scalings',
-    'scallini',
-    'scallions',
-    'scallop-shape',
-    'scallop-shell',
-    'scalloped-edged',
-    'scalloping',
-    'scallops.',
-    'scallydelic',
-    'scallywaggery',
-    'scallywags',
     'scallyway',
-    'scalp-hunter',
-    'scalpel-like',
-    'scalpel-probe',
-    'scalpel-sharp',
-    'scalpeled',
-    'scalpelling',
-    'scaltheen',
-    'scaltsas',
-    'scalwell',
-    'scalz',
-    'scam\'',
-    'scamell',
-    'scammed',
-    'scammells',
-    'scamnum',
     'scamp.',
-    'scamperin\'',
-    'scampish',
-    'scampy',
-    'scamster',
-    'scan-endscan',
-    'scan-general',
-    'scan-one',
-    'scan-optics',
-    'scanadal',
-    'scanario',
-    'scanbrit',
-    'scandal-a-week',
-    'scandal-battered',
-    'scandal-bruised',
-    'scandal-monger',
     'scandal-mongering',
-    'scandal-provoking',
-    'scandal-ravaged',
-    'scandal-rocked',
-    'scandal-sheet',
-    'scandal-sheets',
-    'scandal-strewn',
-    'scandal.social',
-    'scandalizes',
-    'scandalkonzert',
-    'scandalometer',
-    'scandaloso',
-    'scandalous-sounding',
-    'scandalum',
-    'scandello',
-    'scandian',
     'scandig',
-    'scandinavia.',
-    'scandinavian-bound',
-    'scandinavian-derived',
-    'scandinavian-irish',
-    'scandinvian',
-    'scandivians',
-    'scandles',
-    'scandza',
-    'scane',
-    'scanie',
-    'scanion',
-    'scann',
-    'scanned-in',
-    'scannet',
-    'scanning-type',
     'scanning/vectorization',
-    'scans1',
-    'scanscape',
-    'scansional',
-    'scanted',
-    'scantest',
-    'scanties',
-    'scantiest',
-    'scanting',
-    'scantling',
-    'scanty-haired',
-    'scantyclad',
-    'scanworkx',
-    'scapania',
-    'scapas',
-    'scaped',
     'scapens',
-    'scapera',
-    'scapes',
-    'scaphandre',
-    'scaphiopus',
-    'scaphites',
-    'scaphium',
-    'scaphoid',
-    'scaphonyx',
-    'scaphopoda',
-    'scaping',
-    'scappa',
-    'scappaticci',
-    'scapped',
-    'scapulars',
-    'scapulary',
     'scapulo-humeral',
-    'scapulocoracoid',
-    'scapyard',
-    'scar-city',
-    'scar-crossed',
-    'scar-face',
-    'scarabae-old',
-    'scarabaeidae',
-    'scarabee',
-    'scaranish',
-    'scarboro',
-    'scarborough-based',
-    'scarce-currency',
-    'scarce-perceptible',
-    'scarcella',
-    'scarcely-lit',
     'scarcely-seen',
-    'scarceness',
-    'scardroy',
-    'scardus',
-    'scare-a-thon',
-    'scare-stories',
-    'scare-story',
-    'scarea',
-    'scarecrow-targets',
-    'scarecrow-thin',
-    'scared-faced',
-    'scared-he',
-    'scaredy-cats',
-    'scarefair',
-    'scaremonger',
-    'scareways',
     'scarf-draped',
-    'scarf-waving',
-    'scarf-wearing',
-    'scarfaced',
-    'scarfing',
-    'scarfo',
-    'scarfton',
-    'scargill-type',
-    'scargill/num',
-    'scargills',
-    'scarhill',
-    'scarification',
-    'scarificator',
-    'scarifiers',
-    'scarilode',
-    'scariston',
     'scarlatina',
-    'scarlattian',
-    'scarle',
-    'scarle/microsurgery',
-    'scarlet-and-white',
-    'scarlet-crimson',
-    'scarlet-lipped',
-    'scarlet-rimmed',
-    'scarlett/thames',
-    'scarlino',
-    'scarlot',
-    'scarometer',
-    'scarpas',
-    'scarpetta',
-    'scarplets',
-    'scarponi',
     'scarred-over',
-    'scarrib',
-    'scarrington',
-    'scartata',
-    'scarum',
-    'scarvee',
-    'scarves&ndash',
-    'scas',
-    'scat-singing',
-    'scatchard',
-    'scatha',
-    'scati',
-    'scating',
-    'scatomanic',
-    'scatra',
-    'scatsta',
     'scatted',
-    'scatter&lsqb;ed&rsqb',
-    'scatter-beading',
-    'scatter-brained',
-    'scatter-effect',
-    'scatter-graphs',
-    'scatter-hoard',
-    'scatter-shot',
-    'scattered/broken',
-    'scattergram',
-    'scattergraphs',
-    'scattergun',
-    'scattershot',
-    'scattiness',
-    'scatting',
-    'scatty-but-obedient',
     'scaur',
-    'scavaging',
-    'scavenger-cum-predator',
-    'scavenger/predatory',
-    'scavengery',
-    'scavi',
-    'scavizzi',
-    'scavone',
-    'scavsurplus-high',
-    'scavved',
-    'scavving',
-    'scavvying',
-    'scawdel',
-    'scawn',
-    'scazebrick',
-    'scca',
     'scd-1',
-    'scda',
-    'sceanes',
-    'scearce',
-    'sceat',
-    'sceats',
-    'sceleratus',
-    'scelidosaurus',
-    'scellery',
-    'sceme',
-    'scenarist',
-    'scence',
-    'scendere',
-    'scene&rehy;painting',
-    'scene-change',
-    'scene-changes',
     'scene-of-crimes',
-    'scene-painter',
-    'scene-setter',
-    'scene-shift',
-    'scene-stealers',
-    'scene-steeped',
-    'scene.a',
-    'scene.it',
-    'sceneries',
-    'scenery-watchers',
-    'scenery.',
-    'scenica',
-    'scenical',
-    'scenically-stunning',
-    'scenographic',
-    'scent-laden',
     'scent-producing',
-    'scent-sensitive',
-    'scent-signalling',
-    'scent-trail',
-    'scented-leaf',
-    'scenter',
-    'scentmaker',
-    'scenty',
-    'sceolon',
-    'sceond',
-    'sceptered',
-    'scepters',
-    'sceptical.',
-    'scepticism.',
-    'sceptos',
-    'sceptrum',
     'scer',
-    'scfv-momlvenv',
-    'sch&auml;ferin',
-    'sch&auml;ufelchen',
-    'sch&ouml;ler',
-    'sch&ouml;nau',
-    'sch&ouml;nbergs',
-    'sch&ouml;nbrun',
-    'sch&ouml;neberger',
-    'sch&ouml;nhausen',
-    'sch&ouml;nheit',
-    'sch&ouml;nlein-henoch',
-    'sch&ouml;nzeler',
-    'sch&ouml;rner',
-    'sch&ouml;rpff',
-    'sch&ouml;ttli',
     'sch&uuml;ttdorf',
-    'sch&uuml;tzen',
-    'sch.ii',
-    'sch20,200',
-    'sch300,000,000',
-    'sch360,000',
-    'sch4,000',
-    'sch537,000',
-    'sch600,000',
-    'sch62,000',
-    'sch63,000',
-    'sch636,000',
-    'scha',
-    'schaal',
-    'schabowski',
-    'schachen',
     'schachter/teresa',
-    'schachwoche',
-    'schack',
-    'schacke',
-    'schacter',
-    'schaecken',
-    'schaerf',
-    'schafer/aero',
-    'schaffers',
-    'schaffler',
-    'schaffter',
-    'schafik',
-    'schagen',
-    'schaie',
-    'schak',
-    'schalfer',
     'schalin-karrila',
-    'schalk-golodkowski',
-    'schalkwijk',
-    'schalle',
-    'schaller-style',
-    'schaller/grover',
-    'schalleri',
-    'schallplatten',
-    'schandoney',
-    'schaparenko',
-    'schapera',
-    'schaperstra&szlig;e',
-    'schara',
-    'scharansky',
-    'schardt',
-    'scharfrichter',
     'scharinger',
-    'scharpf',
-    'scharringhausen',
-    'schartzmann',
-    'scharwenka',
-    'scharzenegger',
-    'schasiepen',
-    'schatt',
-    'schatzis',
-    'schatzki',
-    'schaubach',
-    'schaudroeck',
-    'schauen',
-    'schauermann',
-    'schaufelein',
-    'schaulsohn',
     'schaum',
-    'schaumainkai',
-    'schaumberg',
-    'schaup',
-    'schauspieler',
-    'schaverien',
-    'scheankdong',
-    'schechter',
-    'scheddle',
-    'schedel',
-    'schedular',
-    'schedule-maximum',
-    'scheduled-passenger',
-    'schedules.3',
-    'schedules/lists',
-    'scheelea',
     'scheepvaart',
-    'scheid',
-    'scheidder',
-    'scheidegger',
-    'scheiden',
-    'scheilenberg',
-    'scheine.get',
-    'scheiners',
-    'scheinheilig',
-    'scheinman',
-    'scheiring',
-    'scheiss',
-    'scheisskerl',
-    'scheissmitlister',
-    'scheisters',
-    'schelde',
     'scheleske',
-    'schelff',
-    'schelfhout',
-    'schellenberger',
-    'schellengerg',
-    'schellino',
-    'scheloske',
-    'scheltema',
-    'scheltma',
-    'schelvis',
-    'schema-based',
-    'schema-breaking',
-    'schema-consistency',
-    'schema-inconsistent',
-    'schema-unrelated',
-    'schematic-ally',
     'schematised',
-    'schematization',
-    'schematize',
-    'schematizes',
-    'schematizing',
-    'scheme*',
-    'scheme-by-scheme',
-    'scheme-housing',
-    'scheme-ii',
-    'scheme-making',
-    'scheme-tops',
-    'scheme.coincidentally',
-    'scheme.e',
-    'scheme/',
-    'schemeing',
-    'schemes/',
     'schemes/programmes',
-    'schemichal',
-    'schempp-hirth',
-    'schenemayer',
-    'scheng',
-    'schenk/world',
-    'schenke',
-    'schenkenberger',
-    'schenkweg',
-    'scheper-hughes',
-    'schepherde',
-    'schepke',
-    'schepper',
-    'scherbachev',
-    'scherbius',
-    'scherbo',
     'schering-kahlbaum',
-    'schermer',
-    'schermer-1',
-    'schernito',
-    'schernthaner',
-    'schertz',
-    'scherzingefl',
-    'scherzo-like',
-    'scheuble',
-    'scheuer',
-    'scheuerecker',
-    'scheule',
-    'scheulinghof',
-    'scheutz',
-    'schevengin',
-    'schfield',
     'schh.i',
-    'schiantarelli',
-    'schiavio',
-    'schiavona',
-    'schibler',
-    'schickedanz',
-    'schickelgruber',
-    'schickenader',
-    'schicklgruber',
-    'schickor',
-    'schicksal',
-    'schicksale',
-    'schicksalsjahr',
-    'schidigera',
-    'schiedam',
-    'schiedegg',
     'schiefergebirge',
-    'schieff',
-    'schiefflin',
-    'schiel',
-    'schielicke',
-    'schierbeek',
-    'schiessbefehl',
-    'schiestel',
-    'schiffbauerdamm',
-    'schiffchen',
-    'schifferes',
-    'schiffko',
-    'schiffman',
-    'schiffrin',
-    'schifo',
-    'schikaneder&rehy;from',
     'schil',
-    'schilacci',
-    'schilacci-like',
-    'schilde-boeck',
-    'schildergasse',
-    'schildkamp',
-    'schilflied',
-    'schilldersdorf',
-    'schiller/woodhill',
-    'schillerstein',
-    'schilpp',
-    'schilthornbahn',
-    'schiltron',
-    'schily',
-    'schimansky',
-    'schimatari',
     'schimer/mosel',
-    'schimone',
-    'schimpanse',
-    'schimper',
-    'schindel',
-    'schinke',
-    'schinus',
-    'schinznach',
-    'schireslair',
-    'schirlcar',
-    'schirm',
-    'schirmacher',
-    'schirrmann',
-    'schisbye',
-    'schismed',
-    'schist-like',
     'schistosome-infected',
-    'schitebi',
-    'schizanthus',
-    'schizaster',
-    'schizo-affective',
-    'schizo-bonkers',
-    'schizo-logic',
-    'schizo-world',
-    'schizoidness',
-    'schizoneura',
-    'schizopetalus',
-    'schizophrenic&rehy;like',
-    'schizos',
-    'schjelderup-ebbe',
-    'schl&uuml;ter/webra',
-    'schlachthof',
     'schlaf',
-    'schlafen',
-    'schlafwagen',
-    'schlager',
-    'schlageter',
-    'schlakali',
-    'schlangenfresser',
-    'schlaraffenland',
-    'schlecht',
-    'schlechter',
-    'schlechtes',
-    'schlegelmilch',
-    'schleichkorn',
-    'schleiden',
-    'schleider',
-    'schleissheim',
     'schleissner',
-    'schlem&uuml;ller',
-    'schlema',
-    'schlemiel',
-    'schlemmer/rover',
-    'schlep',
-    'schlepping',
-    'schlerotherapy',
-    'schlesswig',
-    'schlich',
-    'schlick-directed',
-    'schlie&szlig;lich',
-    'schliemann-hoffer',
-    'schlitz-cans',
-    'schlock-shops',
-    'schlockbuster',
     'schlockfest',
-    'schlockmeister',
-    'schlocky',
-    'schloetter',
-    'schloomph',
-    'schlosses',
-    'schlossgarten',
-    'schlossi',
-    'schlote',
-    'schlotter',
-    'schlubach',
-    'schlumpf',
-    'schlup',
-    'schlusnus',
-    'schlussel',
-    'schluup',
     'schmachtenhagen',
-    'schmadribachfall',
-    'schmalenbach',
-    'schmaltz.',
-    'schmaltzing',
-    'schmaus',
-    'schmecker',
-    'schmeicel',
-    'schmeidler',
-    'schmeiss',
-    'schmendrick',
-    'schmerikon',
-    'schmerling',
-    'schmichael',
-    'schmidt-agence',
-    'schmidt-garden',
     'schmidt-koenig',
-    'schmidt/choreographer',
-    'schmidt/usaf',
-    'schmidthammer',
-    'schmidts',
-    'schmieder',
-    'schmiled',
-    'schmink',
-    'schmisch',
-    'schmitt-like',
-    'schmitt-rottluff',
-    'schmitzer',
-    'schmoe',
-    'schmoke',
-    'schmoll',
-    'schmolsin',
     'schmookler',
-    'schmoozerland',
-    'schmoozers',
-    'schmoozing',
-    'schmoranz',
-    'schmuckst&uuml;ck',
-    'schmuel',
-    'schmur',
-    'schmutzst&uuml;ck',
-    'schnabels',
-    'schnake',
-    'schnapf',
-    'schnapps-crazed',
-    'schnath',
-    'schnaubelt',
-    'schnauzers',
     'schnebelt',
-    'schneckenburger',
-    'schnee',
-    'schneede',
-    'schneefernehaus',
-    'schneeman',
-    'schneemann',
-    'schneider-lenne',
-    'schneider/vicarios',
-    'schneiderhan',
-    'schneken',
-    'schnelle',
-    'schneller',
-    'schnelling',
-    'schnieder',
-    'schnirch',
     'schnitter',
-    'schnittlauchsause',
-    'schnitzel-holstein',
-    'schnorbitz',
-    'schnorkel',
-    'schnorkels',
-    'schnozzle',
-    'schnuffler',
-    'schnutgen-museum',
-    'schobert',
-    'schobinger',
-    'schodek',
-    'schoderbek',
-    'schoeffer',
-    'schoelcher',
-    'schoelkopf',
     'schoemel',
-    'schoenberg-reared',
-    'schoenfelder',
-    'schoenholtzeri',
-    'schoenoplectus',
-    'schoenstadt',
-    'schoeppe',
-    'schofield-ellery',
-    'schoinos',
-    'scholar-administrator',
-    'scholar-bishop',
-    'scholar-cd',
-    'scholar-gent',
-    'scholar-gentleman',
-    'scholar-librarians',
-    'scholar-preacher-bard',
     'scholar-priest',
-    'scholar-reviewers',
-    'scholar-soldier',
-    'scholar-students',
-    'scholar/dealer',
-    'scholarcheck',
-    'scholarly-looking',
-    'scholarship-girl',
-    'scholastica',
-    'scholastically-minded',
-    'scholastikia',
-    'schole',
-    'scholey/nra',
-    'scholiast',
-    'scholion',
-    'scholium',
     'scholl\'',
-    'scholler',
-    'schollhammer',
-    'schollmeyer',
-    'scholmaster',
-    'schols',
-    'scholtes',
-    'schonach',
-    'schonburger',
-    'schoneberg',
-    'schonenbourg',
-    'schoner',
-    'schonfield\'',
-    'schonflies',
-    'schongauer',
-    'schonhauser',
     'schonwandt',
-    'schoo\'',
-    'schoogled',
-    'school&mdash',
-    'school&mdash;see',
-    'school&mdash;so',
-    'school&mdash;teachers',
-    'school&rehy;children',
-    'school&rehy;master',
-    'school&rehy;teacher',
-    'school\'',
-    'school-and-garage',
-    'school-boards',
-    'school-book',
-    'school-chapel',
-    'school-controlled',
     'school-crossing',
-    'school-day',
-    'school-district',
-    'school-dodging',
-    'school-fees',
-    'school-fellow',
-    'school-generated',
-    'school-higher',
-    'school-holiday',
-    'school-home',
-    'school-imposed',
-    'school-inspector',
-    'school-issue',
-    'school-jazz',
-    'school-lea',
-    'school-mastering',
     'school-mate',
-    'school-mates',
-    'school-mistressy',
-    'school-of-max',
-    'school-of-sadlers-wells',
-    'school-owner',
-    'school-practice',
-    'school-prefect',
-    'school-report',
-    'school-rooms',
-    'school-run',
-    'school-sanatorium',
-    'school-starting',
-    'school-teacherish',
-    'school-trained',
-    'school-uniforms',
     'school.if',
-    'school.meanwhile',
-    'school.pupils',
-    'school/at',
-    'school/authority',
-    'school/college/any',
-    'school/college/in',
-    'school/college/training',
-    'school/college/work',
-    'school/community',
-    'school/curriculum',
-    'school/home',
-    'school/local-authority',
-    'school/staff',
-    'school/the',
-    'school/university',
     'school/work',
-    'schoolboy-ish',
-    'schoolbuses',
-    'schoolcard',
-    'schoolcase',
-    'schoolchild-fashion',
-    'schoolchilden',
-    'schoolchum',
-    'schoolcroft',
-    'schoold',
-    'schooldaze',
-    'schoolese',
-    'schooley',
-    'schoolfields',
-    'schoolgirl\'',
-    'schoolgirl-like',
     'schoolgirl-woman',
-    'schoolgirl.',
-    'schoolgirlishly',
-    'schoolgoers',
-    'schoolhill',
-    'schoolin',
-    'schoolma\'ms',
-    'schoolmarm-sounding',
-    'schoolmaster-priest',
-    'schoolmasters&ndash;union',
-    'schoolmasters-union',
-    'schoolmastery',
-    'schoolmistressly',
-    'schoolmistressy',
-    'schoolpals',
-    'schools&mdash;sewell',
     'schools-based',
-    'schools-club',
-    'schools.7',
-    'schools.this',
-    'schools/',
-    'schools/churches',
-    'schools/colts/u-21/b',
-    'schools/departments',
-    'schools/lea',
-    'schoolswill',
-    'schooltime',
-    'schooltype',
-    'schoolwhich',
-    'schoom',
-    'schoonmaker',
-    'schoonman',
     'schoools',
-    'schooool',
-    'schoos',
-    'schope',
-    'schopenhauerianism',
-    'schori',
-    'schork',
-    'schorm',
-    'schorn',
-    'schorter',
-    'schortly',
-    'schotten',
-    'schottenkirche',
-    'schotter',
-    'schottische',
-    'schottle',
     'schottm&uuml;ller',
-    'schoukerk',
-    'schouler',
-    'schouwen-duiveland',
-    'schpenhauer',
-    'schr',
-    'schr&auml;der',
-    'schr&ouml;dinger-like',
-    'schraagen',
-    'schrack',
-    'schrader-type',
-    'schrameck',
-    'schreckensregiment',
-    'schrecklich',
-    'schreckliche',
-    'schreibers',
     'schreibfaktor',
-    'schreker',
-    'schriecklicke',
-    'schrier',
-    'schrimpf',
-    'schrock',
-    'schroedel',
-    'schrosbree',
-    'schrund',
-    'schryer',
-    'schryver',
-    'schs',
-    'schtonk',
-    'schtreet',
-    'schtumm',
-    'schubart',
     'schubert-foreseeing',
-    'schubert/liszt',
-    'schuck/manfroni',
-    'schuckman',
-    'schucksen',
-    'schudi',
-    'schudi-kirckman',
-    'schuette',
-    'schuettea',
-    'schuetze',
-    'schuffels',
-    'schuhmacher',
-    'schuhplatter',
-    'schukin',
-    'schulde',
-    'schulen',
     'schulenburg',
-    'schulerstrasse',
-    'schulgasse',
-    'schulkins',
-    'schuller/germany',
-    'schulles',
-    'schulmann',
-    'schulordnung',
-    'schulsinger',
-    'schulte-sasse',
-    'schulter',
-    'schultheis',
-    'schultz-keil',
-    'schulz-evler',
-    'schulzendorff',
-    'schuma-brigade',
     'schumacker',
-    'schuman-european',
-    'schumannesque',
-    'schumman',
-    'schundlers',
-    'schunemann',
-    'schunk',
-    'schunner',
-    'schupke',
-    'schuppan',
-    'schuppen',
-    'schuppexin',
-    'schurer',
-    'schuricht',
-    'schurtz',
-    'schuss',
     'schussing',
-    'schut',
-    'schutterlin/white',
-    'schuttwolf',
-    'schutzengarten',
-    'schutzian',
-    'schutzmann',
-    'schuyff',
-    'schuylkill',
-    'schvanevelt',
-    'schvartze',
-    'schw&auml;bisch-gm&uuml;nd',
-    'schw&auml;bisch-gmund',
-    'schw&auml;bische',
-    'schw&ouml;re',
-    'schwabian',
     'schwach',
-    'schwadron',
-    'schwadschild',
-    'schwaetzer',
-    'schwafenberger',
-    'schwak',
-    'schwake',
-    'schwalb&eacute',
-    'schwalbe',
-    'schwalnthaler',
-    'schwan',
-    'schwanheim',
-    'schwantz/rgv',
-    'schwarlose',
-    'schwartzenegger',
-    'schwartzenneger',
     'schwartzers',
-    'schwartzi',
-    'schwartzkopf',
-    'schwartzmann',
-    'schwarzbier',
-    'schwarzburg-gunther',
-    'schwarzenbergs',
-    'schwarzendom',
-    'schwarzeneger',
-    'schwarzenegg',
-    'schwarzeneggers',
-    'schwarzenneger',
-    'schwarzennegers',
-    'schwarzieger',
-    'schwarzkopf/gulf',
-    'schwarzmarkt',
     'schwarzschild-nut',
-    'schwarzwald',
-    'schwauntz',
-    'schwegmann-fielding',
-    'schweiger',
-    'schweigsame',
-    'schwein-lowitz',
-    'schweinebraden',
-    'schweinfurth',
-    'schweinhund',
-    'schweinitz',
-    'schweisguth',
-    'schweizerische',
-    'schweizerischer',
-    'schweldt',
-    'schwendi',
     'schwendinan',
-    'schwenninger',
-    'schwerdt',
-    'schwering',
-    'schwert',
-    'schwertsik',
-    'schwerzina',
-    'schwetzingen',
-    'schwierzina',
-    'schwimmwagen',
-    'schwing',
-    'schwinge',
-    'schwingmoor',
-    'schwitzerdeutsch',
-    'schylake',
-    'schyms',
     'schyns',
-    'schynynges',
-    'sci-based',
-    'sci-cert',
-    'sci-med',
-    'sci1lonian',
-    'sci43',
-    'sciacchetr&agrave',
-    'sciaccone',
-    'sciaco',
-    'sciaf/justice',
-    'sciaf/oxfam',
-    'sciamachy',
-    'sciara',
-    'sciascia',
-    'scid-hu',
     'science&mdash;veterinary',
-    'science-course',
-    'science-education',
-    'science-fictional',
-    'science-fictionlike',
-    'science-for-arts',
-    'science-his',
-    'science-humanities',
-    'science-literate',
-    'science-orientated',
-    'science-oriented',
-    'science-reasonably',
-    'science-research',
-    'science-social',
-    'science-specific',
-    'science-versus-faith',
     'science-y',
-    'science.',
-    'science/',
-    'science/cognitive',
-    'science/construction',
-    'science/economics',
-    'science/fantasy',
-    'science/humanities',
-    'science/media',
-    'science/pharmacy',
-    'science/sociology',
-    'sciencefiction',
-    'sciencefictionish',
-    'sciences-even',
-    'sciences-national',
-    'sciences/hiking',
     'sciences/medicine',
-    'sciences/social',
-    'scient',
-    'sciente',
-    'scientific-atlanta',
-    'scientific-industrial',
-    'scientific-instrument',
-    'scientific-kendall',
-    'scientific-management',
-    'scientific-rational',
-    'scientific.',
-    'scientific/',
-    'scientific/medical',
-    'scientific/rational',
-    'scientifica-cook',
-    'scientifica/anistica',
     'scientifical',
-    'scientifically&rehy;minded',
-    'scientifically-constructed',
-    'scientifically-controlled',
-    'scientifically-derived',
-    'scientifically-designed',
-    'scientifically-determined',
-    'scientifically-established',
-    'scientifically-minded',
-    'scientifically-skilled',
-    'scientifico-social',
-    'scientifics',
-    'scientifiques',
-    'scientist-scholar',
-    'scientist-soldier',
-    'scientist/bays',
     'scientist/engineer',
-    'scientist/horticulturists',
-    'scientist/nrpb',
-    'scientists.',
-    'scientists/engineers',
-    'scientists/industry',
-    'scientistt',
-    'sciex',
-    'scilian',
-    'scilloides',
-    'scilon',
-    'scimitar-like',
-    'scimitared',
-    'scinde',
-    'scinteia',
-    'scintigraph',
     'scintillant',
-    'scintillated',
-    'scintillates',
-    'scintillatingly',
-    'scintillator',
-    'scintillo',
-    'scintiscanning',
-    'scintiscans',
-    'scinto',
-    'sciolism',
-    'scioto',
-    'scip/oct-6',
-    'scipina',
-    'scipionis',
-    'scipo',
-    'scippa',
     'scira',
-    'sciret',
-    'sciri',
-    'scirpus-erica',
-    'scisasors',
-    'sciskalsi',
-    'scisp',
-    'scissars',
-    'scissor-beam',
-    'scissor-cut-sun-dried',
-    'scissor-cutting',
-    'scissor-kick/volley',
-    'scissor-kicked',
-    'scissor-lady',
-    'scissor-legged',
-    'scissor-man',
     'scissor-over-comb',
-    'scissor-phobic',
-    'scissor-shaped',
-    'scissor-snip',
-    'scissor-type',
-    'scissor-wielder',
-    'scissors-and-paste',
-    'scissors-over-comb',
-    'scissors/shears',
-    'scissortails',
-    'scissory',
-    'scisti',
-    'scit',
-    'sciullo_et',
-    'sciurus',
-    'scivetti',
     'scj',
-    'scjeme',
-    'sclar',
-    'sclaserplus',
-    'sclat',
-    'sclavos',
-    'scleater',
-    'sclera',
-    'sclerisong',
-    'sclerodactyly',
-    'scleropages',
-    'sclerothapy',
-    'sclerotharapy',
-    'sclerotheraphy',
-    'sclerotherpy',
-    'sclerotinised',
     'sclerties',
-    'scluff',
-    'scn.',
-    'scneider',
-    'scns',
-    'scnse',
-    'sco-based',
-    'sco-novell',
-    'sco-run',
-    'sco-xenix',
-    'sco/ixi',
-    'scobbie',
-    'scobie\'s',
-    'scof',
-    'scoffern',
-    'scoffield',
     'scoffields',
-    'scoforum',
-    'scoglio',
-    'scoiety',
-    'scoines',
-    'scolaire',
-    'scolaresco',
-    'scolarship',
-    'scolds_by_means',
-    'scoler',
-    'scolesi',
-    'scolfield',
-    'scoli',
-    'scolithes',
-    'scollett',
-    'scolley',
     'scollo',
-    'scolnick',
-    'scolo',
-    'scolopaceus',
-    'scolopacidae',
-    'scolopacidae.',
-    'scolopax',
-    'scolopendrium',
-    'scolpaig',
-    'scolty',
-    'scom&lsqb;bri&rsqb',
-    'scoms',
-    'scon',
-    'sconags/soor',
-    'sconce-torches',
-    'sconded',
     'scone-crumbs',
-    'scones.',
-    'scones/sour',
-    'sconnes',
-    'scoober',
-    'scoones',
-    'scoonie',
-    'scoop-and-shower',
-    'scoop-type',
-    'scoop.',
-    'scoope',
-    'scooped-neck',
-    'scooped/sidefooted',
-    'scooper-up',
-    'scoopers',
-    'scoopfu\'',
     'scoopfuls',
-    'scoor-nan-gillean',
-    'scoosh',
-    'scooshing',
-    'scootled',
-    'scopalamine',
-    'scopare',
-    'scoparia',
-    'scoparius',
-    'scope.',
-    'scope/voltmeter',
-    'scopex',
-    'scopings',
-    'scopophilia',
-    'scorah',
-    'scorate',
     'scorch-riots',
-    'scorch-squeals',
-    'scorch-trail',
-    'scorched-looking',
-    'scorching/melting/discolouration',
-    'scorcht',
-    'score(s)',
-    'score-based',
-    'score-board',
-    'score-book',
-    'score-cards',
-    'score-draws',
-    'score-fixing',
-    'score-for',
-    'score-keepers',
-    'score-keeping',
     'score-line',
-    'score-making',
-    'score-settling',
-    'score=3',
-    'scoreby',
-    'scorecharts',
-    'scored.',
-    'scorel',
-    'scorer/hercules',
-    'scoreres',
-    'scores.received',
-    'scores/goes',
-    'scoresby',
-    'scoresheets',
-    'scorey',
-    'scorggie',
     'scoriae',
-    'scoring/defensive',
-    'scoring1',
-    'scorner',
-    'scornfully.',
-    'scorpacciata',
-    'scorpion-speakered',
-    'scorpion-tailed',
-    'scorpion.',
-    'scorpionfish',
-    'scorpionis',
-    'scorps',
-    'scorriae',
-    'scorsching',
-    'scorteus',
-    'scot-tish',
     'scota',
-    'scotbac',
-    'scotbald',
-    'scotbic',
-    'scotcatagreement',
-    'scotcats',
-    'scotcell',
-    'scotcerts',
-    'scotch&rehy;and-apollinaris',
-    'scotch-on-the-rocks',
-    'scotch-taped',
-    'scotchbrite',
-    'scotcher',
-    'scotchergill',
-    'scotchgrain',
-    'scotchguard',
     'scotchguarded',
-    'scotford',
-    'scothalls',
-    'scothern',
-    'scothia',
-    'scotiabank',
-    'scotiae',
-    'scotiamcleod',
-    'scotish',
-    'scotist',
-    'scotlan',
-    'scotland-england',
-    'scotland-especially',
-    'scotland-first',
-    'scotland-ireland',
-    'scotland-wales',
     'scotland/gathering',
-    'scotland/glasgow',
-    'scotland/manchester',
-    'scotland/wales',
-    'scotlande',
-    'scotlandfrance',
-    'scotlands',
-    'scotmedia',
-    'scotnat',
-    'scotni',
-    'scotoma',
-    'scotophile',
-    'scotophobin\'',
-    'scotoru&lsqb;m&rsqb',
-    'scotorum',
-    'scots-american',
     'scots-dutch',
-    'scots-italian',
-    'scots-registered',
-    'scots-speaking',
-    'scots/english',
-    'scots/high',
-    'scotstounhill',
-    'scott\'',
-    'scott-',
-    'scott-adie',
-    'scott-bowden',
-    'scott-brown',
-    'scott-cowper',
-    'scott-crickett',
-    'scott-farnell',
-    'scott-gall',
     'scott-gothic',
-    'scott-heron',
-    'scott-hopkins',
-    'scott-hopkins/hereford',
-    'scott-howard',
-    'scott-jones',
-    'scott-like',
-    'scott-malden',
-    'scott-markovitch',
-    'scott-masson',
-    'scott-ordish',
-    'scott-trained',
-    'scott-watson',
-    'scott-wexo',
-    'scott/cirencester',
-    'scott/ecclesiastical',
     'scott/former',
-    'scott/g&eacute;rard',
-    'scott/glasgow',
-    'scott/neuro-psychologist',
-    'scott/new',
-    'scott/owner',
-    'scott/oxford',
-    'scott/pcas',
-    'scott/peace',
-    'scott/rspca',
-    'scott/swindon',
-    'scott/television',
-    'scott/world',
-    'scotta',
-    'scottage',
-    'scottas',
     'scottish&rehy;born',
-    'scottish-accented',
-    'scottish-australian',
-    'scottish-baronial',
-    'scottish-caught',
-    'scottish-chinese',
-    'scottish-directors',
-    'scottish-english',
-    'scottish-headquartered',
-    'scottish-icelandic',
-    'scottish-interest',
-    'scottish-jew',
-    'scottish-looking',
-    'scottish-power',
-    'scottish-produced',
-    'scottish-registered',
     'scottish-sourced',
-    'scottish/american',
-    'scottish/canadian',
-    'scottish/continental',
-    'scottish/nordic',
-    'scottishborn',
-    'scottishe',
-    'scottishmen',
-    'scotto',
-    'scottum',
-    'scottus',
-    'scotty-dog',
-    'scotvec/management',
-    'scotville',
-    'scotwest',
-    'scotyields',
     'scoule',
-    'scouler',
-    'scour-out',
-    'scoure',
-    'scourst',
-    'scouse-hold',
-    'scouseperson',
-    'scousepool',
-    'scouserpool',
-    'scousers/arsenal/man',
-    'scout-knife',
-    'scout-leader',
-    'scouthead',
-    'scouting/guiding',
-    'scoutmastership',
-    'scowby',
     'scozia',
-    'scpdcihe',
-    'scpetical',
-    'scra&rehy;pheap',
-    'scra-scra-scratching',
-    'scrabble-letters',
-    'scrabblings',
-    'scrabbly',
-    'scrabby',
-    'scraben',
-    'scrabster-based',
-    'scrabster/stromness',
-    'scrace',
-    'scrag\'em',
-    'scragboy',
-    'scraggily',
     'scraggle-topped',
-    'scraghey',
-    'scrags',
-    'scraiked',
-    'scramble-able',
-    'scramble.',
-    'scrambled-egg',
-    'scrambler-telephone',
-    'scrambly',
-    'scramming',
-    'scramoff',
-    'scranny',
-    'scrap-body',
-    'scrap-book',
-    'scrap-books',
-    'scrap-cart',
     'scrap-merchant',
-    'scrap-merchants',
-    'scrape-marks',
-    'scrape-tapered',
-    'scraped-out',
-    'scraper-board',
-    'scrapey',
-    'scrapie-affected',
-    'scraping-back',
-    'scrapmen',
-    'scrappage',
-    'scrappet',
-    'scrappies',
-    'scrappiest',
-    'scrappily-engraved',
-    'scrappiness',
     'scrappings',
-    'scraps-we',
-    'scraptoft',
-    'scraptwo',
-    'scrase',
-    'scrat',
-    'scratch\'n\'sniff',
-    'scratch-digging',
-    'scratch-free',
-    'scratch-in',
-    'scratch-mixed',
-    'scratch-mixing',
-    'scratch-off',
-    'scratch-resistant',
-    'scratch-stock',
-    'scratchbuilt',
     'scratcher',
-    'scratchers',
-    'scratching-posts',
-    'scratching/tearing/chewing',
-    'scratchplate-mounted',
-    'scratchproof',
-    'scratchy&rehy;hum',
-    'scratted',
-    'scratter',
-    'scraw',
-    'scrawking',
-    'scrawnier',
-    'scrawny-faced',
-    'scrawny-necked',
-    'scream-up',
-    'screamiest',
     'screamworthiness',
-    'screamy',
-    'screaton',
-    'scree-filled',
-    'scree-slide',
-    'scree-slope',
-    'scree-walking',
-    'screech-guitar',
-    'screech-owls',
-    'screech-turned',
-    'screech-ups',
-    'screech-whistle-screech',
-    'screecher',
-    'screed/concrete',
-    'screeeeee',
-    'screeeeek',
     'screen&mdash;indeed',
-    'screen-eye',
-    'screen-filling',
-    'screen-like',
-    'screen-prints',
-    'screen-room',
-    'screen-saving',
-    'screen-shattering',
-    'screen-shot',
-    'screen-side',
-    'screen-testing',
-    'screen-trading',
-    'screen-watcher',
-    'screen.the',
-    'screen/keyboard',
-    'screen/screen',
     'screen_over',
-    'screendiaries',
-    'screendump',
-    'screened-in',
-    'screenface',
-    'screenlike',
-    'screenmap',
-    'screenphone',
-    'screenprinted',
-    'screenprints',
-    'screensafe',
-    'screenwork',
-    'screeprinting',
-    'screever',
-    'scremosal',
-    'scretion',
     'screw&rehy;driver',
-    'screw&rehy;propelled',
-    'screw-barrel',
-    'screw-cut',
-    'screw-cutting',
-    'screw-down',
-    'screw-fastened',
-    'screw-fitting',
-    'screw-fixed',
-    'screw-jack',
-    'screw-jacks',
-    'screw-legs',
-    'screw-less',
-    'screw-lock',
-    'screw-nailed',
-    'screw-off',
     'screw-pile',
-    'screw-threaded',
-    'screw-through',
-    'screw-type',
-    'screw-ups',
-    'screw-worms',
-    'screwballs',
-    'screwd-river',
-    'screwdriver.',
-    'screwed-down',
-    'screwed-in',
-    'screwed-up-sex',
-    'screwfaces',
-    'screwing.',
-    'screws/bits',
-    'screwsmen',
     'screwtape-',
-    'screwworms',
-    'screwyouupalotodos',
-    'scrfc',
-    'scriabinesque',
-    'scriba',
-    'scribacious',
-    'scribbens',
-    'scribbens/tenant',
-    'scribbled-over',
-    'scribbler-turned-screenwriter',
-    'scribblin\'',
-    'scribbling\'',
-    'scribbling-',
-    'scribbly',
-    'scribe&rehy;evangelist',
     'scribener',
-    'scribentis',
-    'scribling',
-    'scricle',
-    'scrimmaged',
-    'scrimshaw-framed',
-    'scriniodinium',
-    'scripless',
-    'scrips',
-    'scripsi',
-    'script-\'i',
-    'script-based',
-    'script-edited',
-    'script-editing',
-    'script-in-hand',
-    'script-learning',
     'script-reading',
-    'script-writers',
-    'script.',
-    'script/vs',
-    'scripthounds',
-    'scriptible/lisible',
-    'scripton',
-    'scriptor',
-    'scriptorius',
-    'scripts.',
-    'scriptum',
-    'scriptura',
-    'scripturally',
-    'scripture\'=s',
-    'scripture-readings',
-    'scripulum',
     'scritch-owl',
-    'scrivened',
-    'scrivens/fitter',
-    'scriver',
-    'scriverle',
-    'scrivner',
-    'scro',
-    'scrobbling',
-    'scrod',
-    'scrofus',
-    'scrogg',
-    'scroll-bordered',
-    'scroll-moulded',
-    'scroll-waver',
-    'scroll-work',
-    'scrollable',
     'scrollers',
-    'scrollies',
-    'scrolloping',
-    'scroope',
-    'scrooving',
-    'scropes',
-    'scrophularia',
-    'scrota',
-    'scroti',
-    'scrotty',
-    'scrotum-tightener',
-    'scrotum.',
-    'scrotums',
-    'scroungerism',
-    'scrovegni',
-    'scru',
     'scrub-dotted',
-    'scrub-fowl',
-    'scrub-jays',
-    'scrub-land',
-    'scrub-oak',
-    'scrub-topped',
-    'scrubbable',
-    'scrubbed-elm',
-    'scrubfowl',
-    'scrublands',
-    'scrubwood',
-    'scruff(y)',
-    'scruffbag',
-    'scruffdom',
-    'scruffians',
-    'scruffily-dressed',
     'scruffle',
-    'scruffy-arsed',
-    'scruffy-haired',
-    'scruffy-looking',
-    'scrum&rehy;halves',
-    'scrum-halfs',
-    'scrum-wheeling',
-    'scrum-worker',
-    'scrumhalfs',
-    'scrummaged',
-    'scrumple',
-    'scrumpled-up',
-    'scrunch-drying',
-    'scrunched-dried',
-    'scruncher',
-    'scrunchie',
     'scrupulosis',
-    'scrutinisation',
-    'scrutinised.',
-    'scrutinizer',
-    'scruton/disabled',
-    'scruttons',
-    'scruvial',
-    'scry',
-    'scryed',
-    'scryer',
-    'scryfa',
-    'scrymby',
-    'scrymgeour-wedderburn',
-    'scryveyn',
-    'scsd-2',
-    'scse-approved',
     'scsi-',
-    'scsi-to-parallel',
-    'scsi/busmaster',
-    'scsiterminal',
-    'scss',
-    'scsst',
-    'sct',
-    'sctachard',
-    'sctotland',
-    'sctv',
-    'scu-pa',
-    'scuba-dive',
-    'scuba-divers',
-    'scuba-driver',
-    'scubba',
-    'scubette',
     'scucca',
-    'scud&eacute;ry-influenced',
-    'scud-induced',
-    'scud-missiles',
-    'scud57n/a',
-    'scudamore/assistant',
-    'scuddies',
-    'scuderia-italia',
-    'scudery',
-    'scudi',
-    'scudo',
-    'scuff-marks',
-    'scuffing-up',
-    'scufflessly',
-    'sculeni',
-    'sculks',
     'scull-duggery',
-    'scullery-maid',
-    'scullery/kitchen',
-    'sculp&rehy;ture',
-    'sculpsit',
-    'sculptor-gunstocker',
-    'sculptor-stuccoist',
-    'sculptor/model-maker',
-    'sculptoris',
-    'sculptural/architectural',
-    'sculpture/installation',
-    'sculptures/drawings',
-    'sculting',
-    'scum\'',
-    'scum-bashing',
-    'scum-boy',
     'scum-covered',
-    'scum-hunting',
-    'scum-spurs',
-    'scum-thief',
-    'scum.that',
-    'scum/hammers/arse',
-    'scum/liverpool',
-    'scumbergh',
-    'scumday',
-    'scumkid',
-    'scumlover',
-    'scummaging',
-    'scummiest',
-    'scumstoppers',
-    'scun',
-    'scunny',
     'scup',
-    'scupi',
-    'scure',
-    'scurfe',
-    'scurillous',
-    'scurrilitie',
-    'scurrula',
-    'scurs',
-    'scurvy-grass',
-    'scurvy/durfey',
-    'scutcheon',
-    'scutellum',
-    'scuthorpe',
-    'scutifer',
-    'scuts',
-    'scutterings',
     'scutters',
-    'scuttle-free',
-    'scuttlebut',
-    'scuttlewig',
-    'scutums',
-    'scuzz',
-    'scuzz-noise',
-    'scuzzbo',
-    'scuzzie',
-    'scuzzies',
-    'scuzziest',
-    'scvo',
-    'scwarzenneger',
-    'scweaming',
-    'scweiglerand',
-    'scy',
     'scylax',
-    'scyphomedusae',
-    'scypt',
-    'scyre',
-    'scythae',
-    'scythe-blade',
-    'scythe-stone',
-    'scythe-toting',
-    'scythe-wielding',
-    'scythemaking',
-    'scythesmiths',
-    'scythlecester',
-    'scyths',
-    'sd&mdash;democratic',
-    'sd&mdash;social',
-    'sd-1',
     'sd-120l',
-    'sd-20',
-    'sd-30',
-    'sd-40',
-    'sd-scicon/gfi',
-    'sd-superdown',
-    'sd/ds&mdash;swiss',
-    'sd2',
-    'sd9',
-    'sd=2',
-    'sd=2.5',
-    'sd=3.6',
-    'sd=4.4',
-    'sda&mdash;party',
-    'sdays',
-    'sdb',
     'sdc',
-    'sdc051',
-    'sde1000',
-    'sde3000',
-    'sdec',
-    'sdet',
-    'sdex',
-    'sdf2',
-    'sdi\'',
-    'sdillik.',
-    'sdj',
-    'sdjr',
-    'sdlp-sinn',
-    'sdlp/republican',
-    'sdp&mdash;serbian',
-    'sdp-fdp',
     'sdp-sp27',
-    'sdp/sld',
-    'sdp101015.515.224,454',
-    'sdps',
-    'sdr&lt;t',
-    'sdr1,114',
-    'sdr1,224',
-    'sdr1,500',
-    'sdr1,828.6',
-    'sdr10,160,000',
-    'sdr10,570,000',
-    'sdr109,300,000',
-    'sdr112',
-    'sdr112,000,000',
-    'sdr114,000,000',
-    'sdr122,400,000',
     'sdr136,050,000',
-    'sdr14',
-    'sdr14,120,000',
-    'sdr14,650,000',
-    'sdr144',
-    'sdr147.5',
-    'sdr15,200,000',
-    'sdr15,360,000',
-    'sdr16,600,000',
-    'sdr162,600,000',
-    'sdr1=&dollar;1.27549',
-    'sdr1=&dollar;1.28878',
-    'sdr1=&dollar;1.29496',
-    'sdr1=us&dollar;1.24890',
-    'sdr1=us&dollar;1.25783',
-    'sdr1=us&dollar;1.27549',
     'sdr1=us&dollar;1.27818',
-    'sdr1=us&dollar;1.30060',
-    'sdr1=us&dollar;1.30758',
-    'sdr1=us&dollar;1.32182',
-    'sdr1=us&dollar;1.32757',
-    'sdr1=us&dollar;1.34667',
-    'sdr1=us&dollar;1.35476',
-    'sdr1=us&dollar;1.365',
-    'sdr1=us&dollar;1.43',
-    'sdr2,149,250,000',
-    'sdr207,900,000',
-    'sdr21,000,000',
-    'sdr21,280,000',
-    'sdr22,635,000',
-    'sdr22,680,000',
-    'sdr231,700,000',
     'sdr24,388',
-    'sdr24,400,000',
-    'sdr25,603',
-    'sdr26,110,000',
-    'sdr26,400,000',
-    'sdr27,400,000',
-    'sdr279',
-    'sdr286,300,000',
-    'sdr3,020,000',
-    'sdr3,263.4',
-    'sdr3,420,000',
-    'sdr3,703',
-    'sdr300',
-    'sdr314,040,000',
-    'sdr32,600,000',
-    'sdr33,570,000',
     'sdr336,000,000',
-    'sdr343,800,000',
-    'sdr35,000,000',
-    'sdr35,560,000',
-    'sdr37,200,000',
-    'sdr37,622',
-    'sdr39,240,000',
-    'sdr39,700,000',
-    'sdr40,900,000',
-    'sdr41,500,000',
-    'sdr42,300,000',
-    'sdr42,500,000',
-    'sdr42,700,000',
-    'sdr42,800,000',
-    'sdr44,840,000',
-    'sdr442',
     'sdr45,230,000',
-    'sdr46,080,000',
-    'sdr466,200,000',
-    'sdr49,420,000',
-    'sdr49,500,000',
-    'sdr5,600',
-    'sdr5,608',
-    'sdr5,860,000',
-    'sdr53,900,000',
-    'sdr61,000,000',
-    'sdr619.5',
-    'sdr660,600,000',
-    'sdr7,550,000',
-    'sdr719',
-    'sdr74,700,000',
-    'sdr75,000,000',
     'sdr76,800,000',
-    'sdr76,900,000',
-    'sdr780',
-    'sdr8,500,000',
-    'sdr8,790,000',
-    'sdr81,500,000',
-    'sdr82,000,000',
-    'sdr83,530,000',
-    'sdr836,900,000',
-    'sdr85,400,000',
-    'sdr86,000,000',
-    'sdr87,600,000',
-    'sdr88,300,000',
-    'sdr89.9',
-    'sdr89.99',
-    'sdr9',
     'sdr9,150,000',
-    'sdr98,100,000',
-    'sdrg',
-    'sdrp&mdash;social',
-    'sdrrs',
-    'sdrs--approximately',
-    'sds-1',
-    'sds-10%',
-    'sds-gel',
-    'sds/polyacrylamide',
-    'sdvp',
-    'sdw',
-    'se&ndash;brd',
-    'se\'nnight',
-    'se-',
-    'se-5a',
     'se-703',
-    'se-fhe',
-    'se-financed',
-    'se-hun',
-    'se-malaysia',
-    'se-queira',
-    'se-si-lis',
-    'se-z',
-    'se.',
-    'se.5s',
-    'se100',
-    'se13',
-    'se19',
-    'se343197',
-    'se425264',
-    'se5as',
     'se7',
-    'sea&rehy;mews',
-    'sea&rehy;pink',
-    'sea&rehy;ward',
-    'sea&rehy;weeds',
-    'sea-anchor',
-    'sea-and-island',
-    'sea-and-sun-proof',
-    'sea-aster',
-    'sea-barge',
-    'sea-battles',
-    'sea-beast',
-    'sea-beds',
-    'sea-boot',
-    'sea-bound',
-    'sea-bridge',
     'sea-bull',
-    'sea-bunks',
-    'sea-campion',
-    'sea-canoeing',
-    'sea-carved',
-    'sea-cat',
-    'sea-cattle',
-    'sea-chart',
-    'sea-city',
-    'sea-cliffs',
-    'sea-coal',
-    'sea-coasts',
-    'sea-cock',
-    'sea-coloured',
-    'sea-cot',
-    'sea-cow',
     'sea-craft',
-    'sea-divers',
-    'sea-diving',
-    'sea-doors',
-    'sea-drizzle',
-    'sea-drops',
-    'sea-ducks',
-    'sea-dwellers',
-    'sea-eclogues',
-    'sea-estuary',
-    'sea-fairies',
-    'sea-fairy',
-    'sea-fight',
-    'sea-filled',
-    'sea-fishermen',
-    'sea-flat',
     'sea-flats',
-    'sea-flesh',
-    'sea-floors',
-    'sea-fog',
-    'sea-force',
-    'sea-freedom',
-    'sea-fronted',
-    'sea-goat',
-    'sea-goddess',
-    'sea-gods',
-    'sea-grasses',
-    'sea-gravel',
-    'sea-greener',
-    'sea-gull',
-    'sea-hence',
-    'sea-hooks',
     'sea-hunts',
-    'sea-journey',
-    'sea-journeying',
-    'sea-junk',
-    'sea-kale',
-    'sea-kayak',
-    'sea-kayaking',
-    'sea-kindliness',
-    'sea-kindly',
-    'sea-lawyer',
-    'sea-leopards',
-    'sea-lettuce',
-    'sea-light',
-    'sea-lily',
-    'sea-lines',
-    'sea-lore',
     'sea-mail',
-    'sea-marsh',
-    'sea-marshal',
-    'sea-marshals',
-    'sea-metals',
-    'sea-miles',
-    'sea-morning',
-    'sea-novel',
-    'sea-nymph',
-    'sea-obsession',
-    'sea-of-components',
-    'sea-of-gates',
-    'sea-of-ice',
-    'sea-officer',
-    'sea-passage',
-    'sea-pea',
     'sea-pecked',
-    'sea-poem',
-    'sea-port',
-    'sea-pro',
-    'sea-proof',
-    'sea-purslane',
-    'sea-raiders',
-    'sea-rat',
-    'sea-reflected',
-    'sea-road',
-    'sea-robin',
-    'sea-rock',
-    'sea-salts',
-    'sea-scape',
-    'sea-scorpion',
-    'sea-search',
     'sea-service',
-    'sea-sized',
-    'sea-skills',
-    'sea-skimming',
-    'sea-slug',
-    'sea-smoke',
-    'sea-snake',
-    'sea-something',
-    'sea-son',
-    'sea-sprayed',
-    'sea-stacks',
-    'sea-sun',
-    'sea-swimmers',
-    'sea-tangle',
-    'sea-terms',
-    'sea-thistle',
     'sea-thrashed',
-    'sea-threatened',
-    'sea-tide',
-    'sea-to-sea',
-    'sea-ton',
-    'sea-tossed',
-    'sea-towards',
-    'sea-training',
-    'sea-type',
-    'sea-view',
-    'sea-views',
-    'sea-voyage',
-    'sea-waif',
-    'sea-warfare',
-    'sea-watch',
-    'sea-wave',
     'sea-wet',
-    'sea-wolves',
-    'sea-wrought',
-    'sea-zenith',
-    'sea.absorbing',
-    'sea.king',
-    'sea.mike',
-    'sea.when',
-    'sea.whether',
-    'sea/harbour',
-    'sea/land',
-    'sea/palace',
-    'sea/town',
-    'seaaccounts',
-    'seab',
-    'seabeds',
     'seabight',
-    'seablite',
-    'seaboats',
-    'seabord',
-    'seaborg',
-    'seaborough',
-    'seabreeze',
-    'seac-funded',
-    'seacat.',
-    'seacats',
-    'seacaucus',
-    'seach',
-    'seachester',
-    'seacliff',
-    'seacliffs',
-    'seacole',
     'seacord',
-    'seaden',
-    'seadoc',
-    'seadragon',
-    'seaducks',
-    'seadusk',
-    'seafar',
-    'seafire',
-    'seafolk',
-    'seafood-gathering',
-    'seafront.',
-    'seafronts',
-    'seafrost',
-    'seafurls',
-    'seagates',
-    'seageant',
     'seagoers',
-    'seagraves',
-    'seagrim',
-    'seagroatt',
-    'seaguard',
-    'seagull-white',
-    'seaing',
-    'seal-engraving',
-    'seal-fishery',
-    'seal-gut',
-    'seal-hunters',
-    'seal-like',
-    'seal-makers',
-    'seal-of-approval',
-    'seal-oil',
-    'seal-profile',
     'seal-unit',
-    'seal/consultant',
-    'sealanders',
-    'sealanes',
-    'sealasdair',
-    'seale/elliott',
-    'seale/picture',
-    'sealed-bid',
-    'sealed-down',
-    'sealed-in-cosiness',
-    'sealed-type',
-    'sealey/robbery',
-    'sealfast',
-    'sealine',
-    'sealing-off',
-    'sealink-sponsored',
     'sealions.',
-    'sealord',
-    'sealore',
-    'sealsworth',
-    'sealth',
-    'seam-like',
-    'seam-picking',
-    'seam-to-seam',
-    'seam-up',
-    'seam-welded',
-    'seaman-like',
-    'seamarks',
-    'seamas',
-    'seamature',
-    'seamen\'',
-    'seameo',
     'seamer.',
-    'seameth',
-    'seametrix',
-    'seamline.',
-    'seamonster',
-    'seamwise',
-    'seanachaidh',
-    'seanin',
-    'seaon',
-    'seapinks',
-    'seaplant',
-    'seaplaque',
-    'seaplece',
-    'seaql',
-    'searancke',
-    'searbh',
     'searbrow',
-    'searby/parent',
-    'searby/trader',
-    'searcaigh',
-    'search-and-lock',
-    'search-lights',
-    'search-parties',
-    'search-theoretic',
-    'search.1536',
-    'search/replace',
-    'search/selection/advertising',
-    'searchers/intermediaries',
-    'searches&mdash;the',
-    'searches.',
-    'searching-',
-    'searching-image',
     'searchit',
-    'searchlighting',
-    'searchserver',
-    'searcjomg',
-    'seare',
-    'seargent',
-    'searider',
-    'searingly-acted',
-    'searl',
-    'searle/gloucestershire',
-    'searlesja',
-    'searo',
-    'searo-bendum',
-    'searo-cr&aelig;ftig',
-    'searo-net',
-    'searo-ni&thorn;as',
     'searoom',
-    'searoutes',
-    'sears-owned',
-    'searu',
-    'searu-&thorn;ancum',
-    'searu-gimma',
-    'searwade',
-    'seas-mostly',
-    'seas.',
-    'seasalt.',
-    'seasan',
-    'seasat',
-    'seascape/symphonic',
-    'seascene',
-    'seascented',
-    'seaser',
     'seashore&ndash',
-    'seaslug',
-    'season-about',
-    'season-and-a-half',
-    'season-just',
-    'season-openers',
-    'season.',
-    'season.head',
-    'season.over',
-    'seasonably',
-    'seasonless',
-    'seasson',
-    'seasun',
-    'seat-after',
-    'seat-arms',
-    'seat-backs',
     'seat-base',
-    'seat-beds',
-    'seat-furniture',
-    'seat-height',
-    'seat-holders',
-    'seat-jointing',
-    'seat-load',
-    'seat-number',
-    'seat-of-the-pants',
-    'seat-on-a-thousand-boards',
-    'seat-selection',
-    'seat-warmer',
-    'seat-warmers',
-    'seat.then',
-    'seat/flight',
-    'seat/harness',
     'seat_on',
-    'seatallan',
-    'seatbelt.',
-    'seatcovers',
-    'seate',
-    'seatechnical',
-    'seated-convictions',
-    'seated.',
-    'seates',
-    'seatettes',
-    'seath',
-    'seathe',
-    'seating-plan',
-    'seato-type',
-    'seatonian',
-    'seatoun',
     'seatrade',
-    'seats.',
-    'seats/3.5',
-    'seats/kissing/from',
-    'seats:203',
-    'seatspercentage',
-    'seattle-born',
-    'seattle-tacoma',
-    'seattle-type',
-    'seattlefish',
-    'seavegate',
-    'seaward-facing',
-    'seaward/area',
-    'seawater/rainwater',
-    'seaweed-fringed',
-    'seaweed-like',
     'seaweed-strewn',
-    'seawest',
-    'seawise',
-    'seawoman',
-    'seaxbald',
-    'seaxe',
-    'seaya',
-    'sebagerika',
-    'sebaldus',
-    'sebastia',
-    'sebastian-like',
-    'sebastiani/co-driver',
-    'sebastiao-de-arruda',
-    'sebastomaniac',
-    'sebastos',
-    'sebbon',
     'sebby',
-    'sebc',
-    'sebeb',
-    'sebenik',
-    'sebha',
-    'sebhi',
-    'sebi',
-    'sebil',
-    'sebils',
-    'sebon',
-    'sebond',
-    'sebrea',
-    'sebs',
-    'seburt',
-    'sec.47',
-    'sec.cm',
     'secafe',
-    'secal',
-    'secals',
-    'secan',
-    'secanos',
-    'secants',
-    'secarate',
-    'secation',
-    'secaucus',
-    'secay',
-    'secca',
-    'seccade',
-    'secciones',
-    'secco-type',
-    'seccy',
-    'sechat',
     'secher',
-    'sechter',
-    'sechziger',
-    'secil',
-    'secim',
-    'secka',
-    'seckburgers',
-    'seckels',
-    'seckerterries',
-    'seckford',
-    'seckington',
-    'secklow',
-    'seclusa',
-    'seclusionists',
-    'seclusive',
-    'seclusiveness',
     'secnaves',
-    'seco\'',
-    'secodn',
-    'secolo',
-    'secon',
-    'secon-half',
-    'second&mdash',
-    'second&ndash;class',
-    'second&rehy;class',
-    'second&rehy;floor',
-    'second&rehy;hard',
-    'second-\'the',
-    'second-and-a-half',
-    'second-assistant-directors',
-    'second-ball',
-    'second-ballot',
     'second-born',
-    'second-car',
-    'second-category',
-    'second-comers',
-    'second-cousin',
-    'second-cut',
-    'second-day',
-    'second-eldest',
-    'second-features',
-    'second-fiddle',
-    'second-fix',
-    'second-form',
-    'second-fourth',
-    'second-gear',
-    'second-generation-in-power',
-    'second-growth',
     'second-guesses',
-    'second-handedness',
-    'second-hands',
-    'second-heaviest',
-    'second-in-',
-    'second-in-commands',
-    'second-in-department',
-    'second-in-line',
-    'second-in-the-field',
-    'second-its',
-    'second-language',
-    'second-longest',
-    'second-longest-running',
-    'second-longest-serving',
-    'second-lowest',
-    'second-match',
     'second-millennium',
-    'second-mortgage',
-    'second-most',
-    'second-oldest',
-    'second-or',
-    'second-page',
-    'second-party',
-    'second-preferred',
-    'second-priority',
-    'second-quality',
-    'second-ranker',
-    'second-rowers',
-    'second-rung',
-    'second-safest',
-    'second-shortest',
-    'second-sight',
     'second-sighted',
-    'second-skin',
-    'second-strongest',
-    'second-subject',
-    'second-test',
-    'second-third',
-    'second-thought',
-    'second-time-around',
-    'second-to',
-    'second-to-last',
-    'second-tour',
-    'second-trimester',
-    'second-try',
-    'second-unit',
-    'second-vote',
-    'second.generation',
     'second.in',
-    'second.is',
-    'second.to',
-    'second/foreign',
-    'second2',
-    'second_in',
-    'secondaire',
-    'secondaires',
-    'secondand',
-    'secondaries.',
-    'secondariness',
-    'secondary&rehy;school',
-    'secondary-',
-    'secondary-aged',
-    'secondary-feeder',
-    'secondary-institutional',
     'secondary-level',
-    'secondary-market',
-    'secondary-modern-school',
-    'secondary/',
-    'secondary/double',
-    'secondary/institutional',
-    'secondary/junior/infant',
-    'secondary/tertiary',
-    'secondaty',
-    'secondclass',
-    'seconded-according',
-    'seconded.',
-    'secondes',
-    'secondorder',
-    'secondrank',
-    'secondrateness',
     'seconds/image',
-    'seconf',
-    'seconnd',
-    'secor',
-    'secr',
-    'secr&eacute;te',
-    'secr&egrave;te',
-    'secreatry',
-    'secrecies',
-    'secrecy-shrouded',
-    'secrecy.',
-    'secrest',
-    'secresy',
-    'secret\'st',
-    'secret-laden',
-    'secret-police',
     'secret-writing',
-    'secret/clandestine',
-    'secretagogue-induced',
-    'secretagolgs',
-    'secretaires',
-    'secretar',
-    'secretariado',
-    'secretarial/administrative',
-    'secretarial/keyboard',
-    'secretarial/office-type',
-    'secretariat\'',
-    'secretariat/brokers',
-    'secretariers',
-    'secretaries-adjunct',
-    'secretary&mdash;this',
-    'secretary-',
     'secretary-at-war',
-    'secretary-before-last',
-    'secretary-brother',
-    'secretary-companion',
-    'secretary-cum-telephonist-cum-general-dogsbody',
-    'secretary-general:willem',
-    'secretary-librarian',
-    'secretary-managership',
-    'secretary-pa',
-    'secretary-receptionist',
-    'secretary.',
-    'secretary/director',
-    'secretary/first',
-    'secretary/general',
-    'secretary/gloucestershire',
-    'secretary/to',
     'secretary/treasure',
-    'secretary/treasurers',
-    'secretarying',
-    'secretaryship.',
-    'secretaryships',
-    'secretaryw',
-    'secreter',
-    'secretis',
-    'secretly-filmed',
-    'secreto',
-    'secretor',
-    'secretorie',
-    'secrets.',
-    'secretts',
-    'secrists',
-    'sect-',
     'sect-type',
-    'sectarian-based',
-    'sectarian-cum-geographic',
-    'sectarianising',
-    'sectarianism\'',
-    'sectary',
-    'secteurs',
-    'secti',
-    'section&mdash;restricting',
-    'section&rehy;said',
-    'section-by-section',
-    'section-cc',
-    'section-hunting',
-    'section-strength',
-    'section.his',
-    'section/work',
     'section1',
-    'sectionalisation',
-    'sectionalises/parochialises',
-    'sector&mdash;the',
-    'sector\'',
-    'sector-by-sector',
-    'sector-employed',
-    'sector-from',
-    'sector-gender-time',
-    'sector-households',
-    'sector-one',
-    'sector-oriented',
-    'sector-scanning',
-    'sector-the',
-    'sector-units',
-    'sector-wide',
     'sector.by',
-    'sector.likely',
-    'sector/',
-    'sector/finance',
-    'sector/group',
-    'sectoral/industrial',
-    'sectorally',
-    'sectorial',
-    'sectorize',
-    'sectorized',
-    'sectors.',
-    'sectors.the',
-    'sectorul',
-    'sectos',
-    'secual',
-    'secuirty',
     'secular-minded',
-    'secular/humanist/marxist',
-    'secular/religious',
-    'secular/sacred',
-    'secularise',
-    'secularising',
-    'secularism/consumerism/materialism',
-    'secularize',
-    'seculars',
-    'secundario',
-    'secunde',
-    'secunderdad',
-    'secure-and',
-    'secure-line',
-    'secured.',
-    'securemax/ux',
     'securest',
-    'securist',
-    'securitag',
-    'securite',
-    'securities-settlement',
-    'securities-trading',
-    'securitisations',
-    'security&mdash;key',
-    'security&rehy;related',
-    'security**',
-    'security-',
-    'security-based',
-    'security-check',
-    'security-coded',
-    'security-cum-fairly',
-    'security-dealing',
     'security-enhanced',
-    'security-etched',
-    'security-firm',
-    'security-force',
-    'security-funded',
-    'security-on-all-fronts',
-    'security-oriented',
-    'security-patrolled',
-    'security-relevant',
-    'security-scanner',
-    'security-sensitive',
-    'security-service',
-    'security-squad',
-    'security-wise',
-    'security.',
-    'security.d',
     'security/defence',
-    'security/foreign',
-    'security/insurgency',
-    'security/intelligence',
-    'security/messengers/typing',
-    'security/multiprocessing',
-    'security/national',
-    'security/portering',
-    'security/reducing',
-    'securo',
-    'securocracy',
-    'securocrats',
-    'secute',
-    'secutor',
-    'secxtions',
-    'secys',
     'sed&mdash;socialist',
-    'sed.in',
-    'sedan-chairs',
-    'sedation/analgesia',
-    'sedative-induced',
-    'sedber',
-    'sedbergh&mdash;hawes',
-    'sedbury',
-    'sedbusk',
-    'sedden',
-    'seddigh',
-    'seddington',
-    'seddon-atkinson',
-    'seddulbahir',
-    'seden',
-    'sedere',
     'sederholm',
-    'sederon',
-    'sedge-covered',
-    'sedge-grass',
-    'sedge-warbler',
-    'sedgefield-born',
-    'sedgeford',
-    'sedgeman',
-    'sedgfield',
-    'sedgman',
-    'sedgmoor',
-    'sedgwick/dean',
-    'sedgwood',
-    'sediation',
-    'sedicivalvole',
-    'sediment-based',
     'sediment-covered',
-    'sediment-decompaction',
-    'sediment-dispersal',
-    'sediment-starved',
-    'sediment-transport',
-    'sediment-water',
-    'sediment/basement',
-    'sediment/mantle',
-    'sediment/soil',
-    'sedimentating',
-    'sedimentologically',
-    'sedis',
-    'seditionist',
-    'seditions',
-    'sedjadeh',
-    'sedjnane',
     'sedlak',
-    'sedlan',
-    'sedleigh-denfield',
-    'sedley.',
-    'sedlmayr',
-    'sedo',
-    'sedogo',
-    'sedol',
-    'sedooced',
-    'sedu',
-    'seduction-packed',
-    'seduction.permanently',
-    'sedulous',
-    'sedwill',
-    'see&mdash',
-    'see&mdash;the',
     'see&ndash',
-    'see&rehy;through',
-    'see(19)',
-    'see-all-hear-all-say-nowt',
-    'see-and-be-seen',
-    'see-before-you-buy',
-    'see-ers',
-    'see-read-hear',
-    'see-saw-like',
-    'see-the-new-',
-    'see-though',
-    'see-throughs',
-    'see-thru',
-    'see-wreck',
-    'see-you-later-dear',
-    'see-zee',
     'see.er',
-    'see/feel/hear',
-    'see/meet',
-    'see/touch/smell/experience',
-    'see7.4',
-    'see_as',
-    'see_at',
-    'see_in',
-    'seeb',
-    'seebruck',
-    'seec',
-    'seech',
-    'seecoomar',
-    'seed-bearers',
-    'seed-bearing',
-    'seed-capsule',
     'seed-case',
-    'seed-com',
-    'seed-core',
-    'seed-crushing',
-    'seed-crystal',
-    'seed-dispersal',
-    'seed-drill',
-    'seed-ferns',
-    'seed-leaf',
-    'seed-merchant',
-    'seed-mulch',
-    'seed-packets',
-    'seed-pearl',
-    'seed-pearls',
-    'seed-plot',
-    'seed-plumes',
     'seed-pod',
-    'seed-predators',
-    'seed-producing',
-    'seed-seeking',
-    'seed-years',
-    'seed.',
-    'seed/reach',
-    'seedbaits',
-    'seedbeds',
-    'seedbox',
-    'seedboxes',
-    'seedcake',
-    'seedclocks',
-    'seedfern',
-    'seedhill',
-    'seedley',
     'seedlings.',
-    'seedman',
-    'seedpearls',
-    'seeds-',
-    'seeds.',
-    'seedspeople',
-    'seedtime',
-    'seedtray',
-    'seedy-sounding',
-    'seeeing',
-    'seefelderjoch',
-    'seehandlung',
-    'seehas',
-    'seehofer',
-    'seehotel',
-    'seeia',
     'seeing-as',
-    'seeing-lenses',
-    'seeing-through',
-    'seeingly',
-    'seeisa',
-    'seek-meaning',
-    'seek/avoid',
-    'seeke',
-    'seeker-out',
-    'seekest',
-    'seeketh',
-    'seekh',
-    'seekin\'',
-    'seeking-out',
-    'seeking.this',
-    'seekly',
     'seel&amp;supe\'',
-    'seele',
-    'seelenprobleme',
-    'seeli',
-    'seelisches',
-    'seem&rehy;ingly',
-    'seemanii',
-    'seemar',
-    'seemd',
-    'seemed_a',
-    'seemed_as',
-    'seemers',
-    'seeming-innocent',
-    'seemingless',
-    'seemingly-abstruse',
-    'seemingly-barren',
     'seemingly-essential',
-    'seemingly-imperturbable',
-    'seemingly-inconsistent',
-    'seemingly-innocuous',
-    'seemingly-unrelated',
-    'seemings',
-    'seemlily',
-    'seemliness',
-    'seemply',
-    'seems_a',
-    'seems_a_lot',
-    'seems_as',
-    'seemsthat',
-    'seemto',
-    'seen\'',
-    'seen\'em',
     'seen-and-said',
-    'seen-it-all',
-    'seen-to',
-    'seen.they',
-    'seen/felt',
-    'seen_a',
-    'seeney',
-    'seens',
-    'seep-seep-seep',
-    'seep.124',
-    'seep.23',
-    'seepapitso',
-    'seepeople',
-    'seepings',
-    'seeress',
-    'seeringly',
     'seerius',
-    'seerucken',
-    'sees&mdash;to',
-    'seeson',
-    'seet-cheng',
-    'seethingly',
-    'seethrough',
-    'seevli',
-    'seewar',
-    'seewoosagur',
-    'seex/master',
-    'seeyam',
-    'seezer',
-    'sefa-p',
-    'sefarad',
-    'sefcredian',
     'sefel',
-    'seffray',
-    'seffrid',
-    'sefi',
-    'sefined',
-    'sefra',
-    'seft',
-    'sefton/modeller',
-    'seg&rehy;mented',
-    'sega/nintendo',
-    'sega/pontin',
-    'segale-gale',
-    'segalen',
-    'segamo',
-    'segan',
-    'segantini',
     'segarra',
-    'segars',
-    'segatis',
-    'segbwema',
-    'sege',
-    'segefield',
-    'segei',
-    'segeplan',
-    'segerma',
-    'segerstad',
-    'segestans',
-    'segesv&aacute;r',
-    'segetes',
-    'segetum',
-    'segey',
-    'seggs',
     'seggxy',
-    'seghill',
-    'segm&uuml;ller',
-    'segment-by-segment',
-    'segment-leaved',
-    'segment-locating',
-    'segment-restricted',
-    'segment-shedder',
-    'segment/division',
-    'segmental-arched',
-    'segmental-type',
-    'segmentalism',
-    'segmentings',
-    'segments.',
-    'segnere',
-    'sego',
     'segobrigi',
-    'segobrigii',
-    'segole',
-    'segolene',
-    'segrave-daly',
-    'segregants',
-    'segregation&mdash;you',
-    'segregation.',
-    'segregation/surveillance/normalization',
-    'segregational',
-    'segregationism',
-    'segregations',
-    'segretation',
-    'segreti',
-    'segrove',
-    'segrue',
     'seguaro',
-    'seguel',
-    'segues',
-    'seguieriana',
-    'seguimiento',
-    'seguitemi',
-    'segum',
-    'segun',
-    'seguy',
-    'sehoulia',
-    'sehoza',
-    'sei-',
-    'sei-sei-ying',
-    'seibert',
-    'seid',
-    'seidh',
     'seidl',
-    'seidle',
-    'seidner',
-    'seif-centred',
-    'seif-employed',
-    'seif-image',
-    'seifs',
-    'seige-style',
-    'seigne',
-    'seigneural',
-    'seigneuries',
-    'seigo',
-    'seijin',
-    'seikanron',
-    'seiki',
-    'seiku',
     'seiky&oacute',
-    'seileasdair',
-    'seiler',
-    'seilhac',
-    'seillean',
-    'seim',
-    'seima',
-    'seimitsu',
-    'seine-sur-mer',
-    'seine-yonne',
-    'seined',
-    'seineld&iacute;n',
-    'seinem',
-    'seines',
-    'seing',
-    'seir/edom',
     'seiriol',
-    'seirios',
-    'seirpinski',
-    'seis',
-    'seisay',
-    'seisenbacher',
-    'seishas',
-    'seismic-event',
-    'seismic-tomography',
-    'seismically-identified',
-    'seismo-tectonics',
-    'seismographic',
-    'seismologists',
-    'seismometers',
-    'seismophiles',
-    'seisms',
     'seist',
-    'seisuns',
-    'seitan',
-    'seiten',
-    'seium',
-    'seiwa',
-    'seiyu',
-    'seiz',
-    'seiza',
-    'seize-hold-consolidate-develop',
-    'seized-on',
-    'seized-up',
-    'seizi&eacute;me',
-    'seizi&egrave;me',
-    'seizo',
-    'seizure-like',
     'sejanus',
-    'sejdo',
-    'sejm&lt;ro',
-    'sejm-appointed',
-    'sejong',
-    'sejours',
-    'sekand',
-    'sekanina',
-    'sekaten',
-    'sekber',
-    'sekeramayi',
-    'sekeris',
-    'sekertary',
-    'sekhukhuneland',
-    'sekimoto',
-    'sekka',
     'sekmet',
-    'sekondi',
-    'sekshual',
-    'seksler',
-    'seku',
-    'sekund',
-    'sel1000',
-    'sela\'an',
-    'selaginella',
-    'selami',
-    'selasphorus',
-    'selasse',
-    'selatan',
-    'selberg',
-    'selberhalfe',
-    'selbert',
     'selbie',
-    'selbst&auml;ndiger',
-    'selbstbewusstsein',
-    'selbstverwaltung',
-    'selby-bigge',
-    'selby-brigge',
-    'selby/fashion',
-    'selction',
-    'selcuk',
-    'selde',
-    'seldinger',
-    'seldom-at-home-secretary',
-    'seldom-found',
-    'seldom-mentioned',
-    'seldom-told',
-    'seldom-visited',
     'seldom-washed',
-    'seldomly',
-    'selec',
-    'seleccao',
-    'seleccion',
-    'select*e',
-    'select/from/where',
-    'selected-issue&lsqb;3.3&rsqb',
-    'selected-issues',
-    'selected-the',
-    'selected-twin',
-    'selectednamely',
-    'selecter',
-    'selectfeed',
-    'selectin-mediated',
-    'selecting/reappraising',
     'selection&mdash;similarly',
-    'selection-committee',
-    'selection-out',
-    'selection/purchase',
-    'selectionist-neutralist',
-    'selective&mdash;it',
-    'selectivism',
-    'selectivists',
-    'selectivities',
-    'selector-nudging',
-    'selector-switch',
-    'selectorate',
-    'selectorates',
-    'selectory',
-    'selectronic',
-    'selectrons',
     'seleena',
-    'selekhbayev',
-    'selekleka',
-    'selemat',
-    'selen',
-    'selenaspidus',
-    'selengor',
-    'seleni',
-    'selenia',
-    'selenicereus',
-    'seleno-methionine',
-    'seleno-methionyl',
-    'selenotoca',
-    'selered',
-    'selerie',
-    'seleses',
     'seletun',
-    'self&mdash',
-    'self&mdash;at',
-    'self&mdash;employed',
-    'self&mdash;evident',
-    'self&mdash;presentation',
-    'self&mdash;sufficient',
-    'self&mdash;teaching',
-    'self&ndash;employed',
-    'self&ndash;imposed',
-    'self&ndash;selecting',
-    'self&rehy',
-    'self&rehy;absorbed',
-    'self&rehy;absorption',
-    'self&rehy;addressed',
-    'self&rehy;administered',
     'self&rehy;advocacy',
-    'self&rehy;aggrandizement',
-    'self&rehy;appointed',
-    'self&rehy;assured',
-    'self&rehy;centred',
-    'self&rehy;confessed',
-    'self&rehy;confident',
-    'self&rehy;congratulatory',
-    'self&rehy;containment',
-    'self&rehy;contradictions',
-    'self&rehy;control',
-    'self&rehy;defeating',
-    'self&rehy;defining',
-    'self&rehy;deprecatory',
-    'self&rehy;designed',
-    'self&rehy;destroying',
     'self&rehy;development',
-    'self&rehy;division',
-    'self&rehy;esteem',
-    'self&rehy;evaluation',
-    'self&rehy;executing',
-    'self&rehy;flagellation',
-    'self&rehy;forgetfulness',
-    'self&rehy;generated',
-    'self&rehy;giving',
-    'self&rehy;government',
-    'self&rehy;growth',
-    'self&rehy;interest',
-    'self&rehy;justifications',
-    'self&rehy;justificatory',
-    'self&rehy;loading',
-    'self&rehy;locking',
     'self&rehy;monitoring',
-    'self&rehy;organization',
-    'self&rehy;other/us&ndash;them',
-    'self&rehy;perception',
-    'self&rehy;proclaimed',
-    'self&rehy;questioning',
-    'self&rehy;realisation',
-    'self&rehy;recrimination',
-    'self&rehy;reflection',
-    'self&rehy;regulatory',
-    'self&rehy;reinforcing',
-    'self&rehy;report',
-    'self&rehy;reproach',
-    'self&rehy;rewarding',
-    'self&rehy;righteous',
-    'self&rehy;same',
     'self&rehy;supervision',
-    'self-a',
-    'self-abnegating',
-    'self-absolved',
-    'self-absorbing',
-    'self-abusive',
-    'self-accounting',
-    'self-accusatory',
-    'self-accusing',
-    'self-achievements',
-    'self-acknowledged',
-    'self-acquired',
-    'self-active',
-    'self-activity',
-    'self-actualising',
-    'self-adapted',
     'self-adaption',
-    'self-addressing',
-    'self-adequacy',
-    'self-administrations',
-    'self-admirers',
-    'self-adornment',
-    'self-advertised',
-    'self-affirmation_in',
-    'self-aggrandising',
-    'self-aggregate',
-    'self-aid',
-    'self-alerting',
-    'self-aligning',
-    'self-amputation',
-    'self-amused',
-    'self-anaesthetised',
     'self-analysed',
-    'self-analytic',
-    'self-anointed',
-    'self-antigen',
-    'self-antigens',
-    'self-appellation',
-    'self-applause',
-    'self-applying',
-    'self-appointment',
-    'self-appraised',
-    'self-appreciation',
-    'self-approbation',
-    'self-approving',
-    'self-approvingly',
-    'self-arrogated',
-    'self-aspirations',
     'self-assembley',
-    'self-asserted',
-    'self-assessors',
-    'self-assignation',
-    'self-association',
-    'self-assumed',
-    'self-assumption',
-    'self-assuredness',
-    'self-attention',
-    'self-audit',
-    'self-avoiding',
-    'self-avowedly',
-    'self-basted',
-    'self-begot',
-    'self-belt',
-    'self-benefiting',
     'self-billing',
-    'self-blanching',
-    'self-blind',
-    'self-blotting-out',
-    'self-booting',
-    'self-builder',
-    'self-calibrating',
-    'self-cancellingly',
-    'self-caring',
-    'self-carriage',
-    'self-castration',
-    'self-catalysed',
-    'self-categorisation',
-    'self-categorization',
-    'self-celebration',
-    'self-censored',
     'self-censure',
-    'self-centre',
-    'self-centredly',
-    'self-centring',
-    'self-certifying',
-    'self-characterization',
-    'self-charging',
-    'self-chastisement',
-    'self-chronicling',
-    'self-citing',
-    'self-classification',
-    'self-closing',
-    'self-closure',
-    'self-coached',
-    'self-cocking',
-    'self-coded',
     'self-coincide',
-    'self-comforting',
-    'self-commendation',
-    'self-comment',
-    'self-commiserative',
-    'self-communication',
-    'self-compatible',
-    'self-compilation',
-    'self-complementary',
-    'self-con&rehy;tained',
-    'self-concealing',
-    'self-concealment',
-    'self-conceit',
-    'self-conceptualization',
-    'self-concern',
-    'self-conciously',
     'self-condemned',
-    'self-condemning',
-    'self-confessions',
-    'self-confidently',
-    'self-configuring.',
-    'self-confirmed',
-    'self-congratulations',
-    'self-consciousnesses',
-    'self-conservation',
-    'self-consolidating',
-    'self-constituting',
-    'self-constraint',
-    'self-construction',
-    'self-consumed',
-    'self-consuming',
-    'self-consummation',
     'self-consumption',
-    'self-contemplations',
-    'self-contemptuous',
-    'self-contentment',
-    'self-contract',
-    'self-controlling',
-    'self-conversion',
-    'self-cooled',
-    'self-copiers',
-    'self-coronation',
-    'self-corruptingly',
-    'self-coup',
-    'self-covered',
-    'self-crisis',
-    'self-critique',
-    'self-crowned',
     'self-cures',
-    'self-damaging',
-    'self-deceived',
-    'self-deceiver',
-    'self-declaiming',
-    'self-deconstructing',
-    'self-decorated',
-    'self-defacement',
-    'self-defeated',
-    'self-defeatingly',
-    'self-defence\'',
-    'self-defense',
-    'self-deflating',
-    'self-deification',
-    'self-delegation',
-    'self-delighted',
     'self-delighting',
-    'self-demand',
-    'self-demeaning',
-    'self-denials',
-    'self-denied',
-    'self-deportment',
-    'self-derisively',
-    'self-derivation',
-    'self-descriptive',
-    'self-designation',
-    'self-despite',
-    'self-destroying',
-    'self-detachment',
-    'self-detecting',
-    'self-determinant',
-    'self-determine',
     'self-developers',
-    'self-developing',
-    'self-diagnose',
-    'self-diagnosis.the',
-    'self-dial',
-    'self-dignity',
-    'self-dipping',
-    'self-disabled',
-    'self-disc',
-    'self-discharge',
-    'self-disciplinary',
-    'self-discover',
-    'self-discovered',
-    'self-discretion',
-    'self-discussion',
-    'self-disdain',
     'self-disillusionment',
-    'self-dismemberment',
-    'self-dismissive',
-    'self-dissociated',
-    'self-dissolving',
-    'self-dissuasions',
-    'self-distortion',
-    'self-distributed',
-    'self-distrustful',
-    'self-doctoring',
-    'self-donated',
-    'self-doubting',
-    'self-dramatizer',
-    'self-dressing',
-    'self-dug',
-    'self-educator',
     'self-ego',
-    'self-emasculation',
-    'self-employedness',
-    'self-empowered',
-    'self-enclosedness',
-    'self-engrossment',
-    'self-enhancement',
-    'self-enlightenment',
-    'self-enriching',
-    'self-equilibrated',
-    'self-esteem\'',
-    'self-esteeming',
-    'self-evaluative',
-    'self-examinations',
-    'self-examining',
-    'self-excluding',
     'self-exculpation',
-    'self-excuse',
-    'self-excuses',
-    'self-expectations',
-    'self-experimentation',
-    'self-explanations',
-    'self-explication',
-    'self-exploiters',
-    'self-explorers',
-    'self-exposing',
-    'self-extinguishing',
-    'self-extracting',
-    'self-feeding',
-    'self-felicitation',
-    'self-fellating',
-    'self-fill',
     'self-flagellants',
-    'self-flagellating',
-    'self-flattery',
-    'self-fly',
-    'self-focus',
-    'self-focused',
-    'self-forgetful',
-    'self-forgetting',
-    'self-formative',
-    'self-forming',
-    'self-friefing',
-    'self-fulfillment',
-    'self-gift',
-    'self-glorifying',
-    'self-grading',
-    'self-gravitation',
     'self-gravity',
-    'self-grip',
-    'self-grown',
-    'self-growth',
-    'self-guiding',
-    'self-guilt',
-    'self-help.',
-    'self-hood',
-    'self-hooking',
-    'self-hurt',
-    'self-hypnotized',
-    'self-ideas',
-    'self-identical',
-    'self-identifying',
-    'self-igniting',
-    'self-illuminating',
     'self-illumination',
-    'self-imaging',
-    'self-immolating',
-    'self-immolations',
-    'self-impersonation',
-    'self-imprisonment',
-    'self-improved',
-    'self-improvements',
-    'self-imputed',
-    'self-incompatibility',
-    'self-incriminate',
-    'self-incriminatory',
-    'self-indictment',
-    'self-inductances',
-    'self-indulgently',
-    'self-indulgers',
     'self-infatuation',
-    'self-infecting',
-    'self-inflating',
-    'self-ingratiating',
-    'self-inscription',
-    'self-inseminate',
-    'self-insemination',
-    'self-insight',
-    'self-install',
-    'self-installs',
-    'self-instituted',
-    'self-instructor',
-    'self-insulating',
-    'self-interestedly',
-    'self-interestedness',
-    'self-interpretation',
     'self-intervention',
-    'self-intoxication',
-    'self-invented',
-    'self-inventory',
-    'self-investigation',
-    'self-investments',
-    'self-involvement',
-    'self-ironic',
-    'self-ironizing',
-    'self-irritation',
-    'self-isolated',
-    'self-isolating',
-    'self-isolation',
-    'self-kill',
-    'self-knotted',
-    'self-know-ledge',
     'self-knowledgeable',
-    'self-labelled',
-    'self-laudatory',
-    'self-launch',
-    'self-learn',
-    'self-legislating',
-    'self-ligands',
-    'self-ligated',
-    'self-lighting',
-    'self-likenesses',
-    'self-limitation',
-    'self-liquidation',
-    'self-lit',
-    'self-locating',
-    'self-locked',
-    'self-lords',
     'self-loss',
-    'self-luminous',
-    'self-luxuriating',
-    'self-maimed',
-    'self-maintainers',
-    'self-making',
-    'self-manipulation',
-    'self-martyrdom',
-    'self-martyring',
-    'self-massaging',
-    'self-mate',
-    'self-medicating',
-    'self-methylation',
-    'self-mind',
-    'self-mirroring',
-    'self-misdiagnosis',
     'self-mistrust',
-    'self-mobile',
-    'self-model',
-    'self-modernization',
-    'self-monitored',
-    'self-mortification',
-    'self-mutations',
-    'self-mutilations',
-    'self-mutilators',
-    'self-mythography',
-    'self-narcotised',
-    'self-narcotising',
-    'self-neatened',
-    'self-negating',
-    'self-neglectful',
-    'self-nominate',
     'self-notification',
-    'self-nullifying',
-    'self-object',
-    'self-objectification',
-    'self-objective',
-    'self-oppression',
-    'self-optimisation',
-    'self-ordained',
-    'self-organisation\'',
-    'self-orientated',
-    'self-overdosing',
-    'self-owned',
-    'self-owner',
-    'self-ownership',
-    'self-pattern',
-    'self-patterned',
     'self-peptides',
-    'self-periodization',
-    'self-perpetuat&rehy;ing',
-    'self-perpetuate',
-    'self-perspective',
-    'self-perversion',
-    'self-pitiful',
-    'self-playing',
-    'self-pleasure',
-    'self-plundering',
-    'self-poisoner',
-    'self-pollinating',
-    'self-pollution',
-    'self-portrayal',
-    'self-portrayed',
-    'self-pouring',
     'self-preference',
-    'self-prepared',
-    'self-prescribed',
-    'self-present',
-    'self-preserver',
-    'self-pride',
-    'self-priming',
-    'self-processes',
-    'self-proclaiming',
-    'self-producing',
-    'self-professedly',
-    'self-profile',
-    'self-proliferation',
-    'self-promise',
-    'self-promoters',
-    'self-propaganda',
     'self-propagating',
-    'self-protecting',
-    'self-provision',
-    'self-publicising',
-    'self-publicists',
-    'self-purifying',
-    'self-pursuit',
-    'self-questionings',
-    'self-quotations',
-    'self-quoting',
-    'self-raised',
-    'self-rated',
-    'self-reacting',
-    'self-reactive',
-    'self-realising',
-    'self-record',
     'self-recorded',
-    'self-recreation',
-    'self-recriminations',
-    'self-recruiting',
-    'self-referenced',
-    'self-referencing',
-    'self-referentialism',
-    'self-referentially',
-    'self-referrals',
-    'self-reflections',
-    'self-reflexions',
-    'self-reflexivities',
-    'self-reflexivity\'',
-    'self-reformation',
-    'self-refutation',
-    'self-refuting',
     'self-regenerating',
-    'self-registering',
-    'self-regulationconduct',
-    'self-regulationthe',
-    'self-regulators',
-    'self-rejuvenating',
-    'self-relatedness',
-    'self-relaxation',
-    'self-renouncing',
-    'self-renovating',
-    'self-repair',
-    'self-replicators',
-    'self-report/victimization',
-    'self-reporting',
-    'self-repression',
-    'self-reproof',
     'self-rescue',
-    'self-rescuer',
-    'self-rescues',
-    'self-restrained',
-    'self-restraints',
-    'self-restriction',
-    'self-revelations',
-    'self-revelatory',
-    'self-reverence',
-    'self-reviewing',
-    'self-reviews',
-    'self-revising',
-    'self-revulsion',
-    'self-rewarded',
-    'self-ridicule',
-    'self-righting',
     'self-running',
-    'self-salesmanship',
-    'self-satisfying',
-    'self-schooled',
-    'self-scored',
-    'self-scourging',
-    'self-scripture',
-    'self-scrutinising',
-    'self-seal',
-    'self-security',
-    'self-seeding',
-    'self-seeds',
-    'self-seeker',
-    'self-seekers',
-    'self-selective',
-    'self-self',
     'self-self-self',
-    'self-selling',
-    'self-servicing',
-    'self-servings',
-    'self-sexing',
-    'self-shutting',
-    'self-signed',
-    'self-significance',
-    'self-similarity',
-    'self-siphonage',
-    'self-siphoning',
-    'self-slaughter',
-    'self-slaughterer',
-    'self-sowing',
-    'self-sows',
-    'self-spending',
     'self-sponsored',
-    'self-squared',
-    'self-stacking',
-    'self-start',
-    'self-starter.',
-    'self-starting',
-    'self-statement',
-    'self-steer',
-    'self-sterilising',
-    'self-stimulatory',
-    'self-strangulation',
-    'self-strengthening',
-    'self-stripping',
-    'self-stroking',
-    'self-subsisting',
-    'self-subversion',
     'self-suffering',
-    'self-sufficient.the',
-    'self-superior',
-    'self-suppliers',
-    'self-surveillance',
-    'self-survey',
-    'self-sustainability',
-    'self-sustainable',
-    'self-sustenance',
-    'self-tailored',
-    'self-takeovers',
-    'self-tan',
-    'self-taunting',
-    'self-terminating',
-    'self-thwarting',
-    'self-timed',
     'self-tormenting',
-    'self-totalization',
-    'self-touch',
-    'self-touching',
-    'self-trigger',
-    'self-triggers',
-    'self-tuition',
-    'self-tuning',
-    'self-turned',
-    'self-tutored',
-    'self-tutorial',
-    'self-typifications',
-    'self-uglifying',
-    'self-unconfidence',
-    'self-undermining',
-    'self-unease',
     'self-valuable',
-    'self-valuation',
-    'self-ventilating',
-    'self-verifying',
-    'self-vigilance',
-    'self-warranting',
-    'self-washing',
-    'self-wounding',
-    'self-wrapt',
-    'self-write',
-    'self-xxxx',
-    'self.conscious',
-    'self.consciously',
-    'self.denying',
-    'self.financing',
-    'self.sufficiency',
     'self.sufficient',
-    'self/other',
-    'self:control',
-    'self:fulfilling',
-    'self:regulation',
-    'self=begot',
-    'selfaccusation',
-    'selfadminister',
-    'selfadmonition',
-    'selfaggrandisement',
-    'selfassessment',
-    'selfassured',
-    'selfbuilders',
-    'selfcarriage',
-    'selfcentred',
-    'selfconfident',
     'selfcongratulation',
-    'selfcritically',
-    'selfdependence',
-    'selfdetermination',
-    'selfdisparagement',
-    'selfeffacement',
-    'selfes',
-    'selfexpression',
-    'selfgovernment',
-    'selfheal',
-    'selfimage',
-    'selfinduced',
-    'selfinterest',
-    'selfishnesses',
-    'selfjustification',
-    'selfportrait',
     'selfrecommending',
-    'selfregarding',
-    'selfrespect',
-    'selfrighteously',
-    'selfstanding',
-    'selfstarter',
-    'selfsufficient',
-    'selftailing',
-    'selftests',
-    'selfton',
-    'selfwilled',
-    'selia',
-    'seligmann',
-    'seligmanns',
-    'selima',
-    'selimgarh',
     'selimiye',
-    'selinaish',
-    'selinger',
-    'selinunt\'',
-    'selinute',
-    'selja&ccaron;ki',
-    'selkin',
-    'selkups',
-    'sell&mdash;pity',
-    'sell&rehy;by',
-    'sell\'',
-    'sell\'em',
-    'sell-advancement',
-    'sell-determination',
-    'sell-out-tours',
-    'sell-preservation',
     'sell/buy',
-    'sell/true',
-    'sella/ex-refugee',
-    'sellability',
-    'sellaeg',
-    'sellafield/cumbria',
-    'sellags/dirty',
-    'sellasand',
-    'sellascene',
-    'sellatory',
-    'sellby',
-    'sellenger',
-    'sellens',
-    'seller&mdash;and',
-    'seller-landlord',
-    'seller/buyer',
     'sellersburg',
-    'selletbeck',
-    'selli',
-    'sellick',
-    'sellick/chairman/parent',
-    'sellindge',
-    'selling-points',
-    'selling-prices',
-    'selling-up',
-    'selling.',
-    'selling/',
-    'sellings',
-    'sellion',
-    'sello-taped',
-    'selloi',
-    'sellors',
     'sellotape.',
-    'sells.concurrent',
-    'selltiz',
-    'selma-montgomery',
-    'selman/widow',
-    'selmo',
-    'selnau',
-    'selnec',
-    'selniker',
-    'selonamethionine',
-    'selotape',
-    'sels',
-    'selsden',
-    'selsdon-type',
-    'selset',
-    'selsey-on-sea',
     'selson',
-    'selt',
-    'selten',
-    'seltzer/esquire',
-    'selue',
-    'selvage',
-    'selvatico',
-    'selvin',
-    'selwyn-lloyd',
-    'selwyn/veteran',
-    'selye',
-    'selywell-read',
-    'sem&ccaron;ic',
-    'sem-5',
-    'sem-priest',
-    'sem/edx',
     'sem=',
-    'sem=13255',
-    'semaf',
-    'semaine',
-    'semanario',
-    'semander',
-    'semang',
-    'semantech',
-    'semantic-relational',
-    'semantic/cognitive',
-    'semanticity',
-    'semaswati',
-    'sematary',
-    'sematilide',
-    'semb',
-    'sembach',
     'sembat',
-    'sembawang',
-    'sembelo',
-    'sembilan',
-    'semblable',
-    'semblables',
-    'semble-t-il',
-    'sembra',
-    'sembrare',
-    'semchard',
-    'semel',
-    'semen-stained',
-    'semence',
-    'semenoff',
-    'semenzato',
-    'semes',
     'semester-based',
-    'semetipsum',
-    'semi&mdash;desert',
-    'semi&mdash;final',
-    'semi&rehy;adjustable',
-    'semi&rehy;automatique',
-    'semi&rehy;autonomous',
-    'semi&rehy;bureaucratic',
-    'semi&rehy;conquered',
-    'semi&rehy;final',
-    'semi&rehy;finished',
-    'semi&rehy;independent',
-    'semi&rehy;natural',
-    'semi&rehy;precious',
-    'semi&rehy;proletarians',
-    'semi&rehy;raised',
     'semi&rehy;rigid',
-    'semi&rehy;submerged',
-    'semi&rehy;translucent',
-    'semi-absorbent',
-    'semi-abstemious',
-    'semi-abstraction',
-    'semi-academicised',
-    'semi-acceptable',
-    'semi-accidentally',
-    'semi-affluent',
-    'semi-agricultural',
-    'semi-aleatoric',
-    'semi-allegorical',
-    'semi-altruistic',
-    'semi-ambulance',
-    'semi-anaesthetise',
     'semi-anthropomorphic',
-    'semi-apologetically',
-    'semi-apology',
-    'semi-aqueous',
-    'semi-arc',
-    'semi-archaic',
-    'semi-architectural',
-    'semi-aristocracy',
-    'semi-artificial',
-    'semi-asiatic',
-    'semi-astrological',
-    'semi-atheist',
-    'semi-attached',
-    'semi-attractive',
-    'semi-auto',
-    'semi-autobiography',
     'semi-automatics',
-    'semi-automaton',
-    'semi-autonomy',
-    'semi-axes',
-    'semi-axis',
-    'semi-bachelor',
-    'semi-baldness',
-    'semi-barren',
-    'semi-bigamous',
-    'semi-blacked-out',
-    'semi-blind',
-    'semi-bohemian',
-    'semi-bonded',
-    'semi-bridging',
-    'semi-brogue',
-    'semi-bulk',
     'semi-bungalow',
-    'semi-bureaucrats',
-    'semi-business',
-    'semi-cantilever',
-    'semi-carnally',
-    'semi-castrato',
-    'semi-catatonic',
-    'semi-chekhovian',
-    'semi-chorus',
-    'semi-chosen',
-    'semi-civilised',
-    'semi-clad',
-    'semi-clerical',
-    'semi-closed',
-    'semi-closure',
-    'semi-coherent',
     'semi-collapse',
-    'semi-collapsed',
-    'semi-colonies',
-    'semi-colony',
-    'semi-comfortable',
-    'semi-comical',
-    'semi-commercial',
-    'semi-commercially',
-    'semi-complete',
-    'semi-completion',
-    'semi-component',
-    'semi-compulsory',
-    'semi-concrete',
-    'semi-conducting',
-    'semi-conductor-crystal',
-    'semi-confinement',
     'semi-confused',
-    'semi-congealed',
-    'semi-consciously',
-    'semi-conservative',
-    'semi-conservatively',
-    'semi-consonant',
-    'semi-consonants',
-    'semi-constant',
-    'semi-constitution',
-    'semi-contentment',
-    'semi-converted',
-    'semi-country',
-    'semi-covert',
-    'semi-criminal',
-    'semi-crouch',
-    'semi-crucial',
     'semi-cultivated',
-    'semi-curtained',
-    'semi-custom-made',
-    'semi-customers',
-    'semi-cycloidic',
-    'semi-decadent',
-    'semi-decay',
-    'semi-decayed',
-    'semi-decent',
-    'semi-deciduous',
-    'semi-deconstruction',
-    'semi-dedicated',
-    'semi-deep',
-    'semi-definite',
-    'semi-deflated',
-    'semi-demented',
     'semi-demi',
-    'semi-democracy',
-    'semi-destroyed',
-    'semi-detatched',
-    'semi-developed',
-    'semi-diesel',
-    'semi-digger',
-    'semi-digital',
-    'semi-diplomatic',
-    'semi-display',
-    'semi-domestic',
-    'semi-dormant',
-    'semi-double-flowered',
-    'semi-doubles',
-    'semi-drive',
-    'semi-dumb',
     'semi-dwarf',
-    'semi-ecclesiastical',
-    'semi-egalitarian',
-    'semi-elastic',
-    'semi-elective',
-    'semi-embalmed',
-    'semi-emergency',
-    'semi-employed',
-    'semi-enclosed',
-    'semi-equity',
-    'semi-erotic',
-    'semi-ethereal',
-    'semi-evangelistic',
-    'semi-evident',
-    'semi-executive',
-    'semi-existence',
     'semi-explanation',
-    'semi-exposed',
-    'semi-extended',
-    'semi-famous',
-    'semi-federal',
-    'semi-female',
-    'semi-fermented',
-    'semi-fiction',
-    'semi-fictionalised',
-    'semi-figuration',
-    'semi-film',
-    'semi-film-star',
-    'semi-finals.up',
-    'semi-fit',
-    'semi-flat',
-    'semi-flirtatious',
     'semi-floating',
-    'semi-fluency',
-    'semi-fly',
-    'semi-fortified',
-    'semi-fossorial',
-    'semi-fractured',
-    'semi-friendly',
-    'semi-frigid',
-    'semi-frivolously',
-    'semi-frozen',
-    'semi-full',
-    'semi-functioning',
-    'semi-gothic',
-    'semi-grey',
-    'semi-hard-on',
-    'semi-hardcore',
     'semi-hardship',
-    'semi-holiday',
-    'semi-horrible',
-    'semi-housetrained',
-    'semi-human',
-    'semi-humanity',
-    'semi-humanoid',
-    'semi-huts',
-    'semi-hypnotized',
-    'semi-idleness',
-    'semi-illiterate',
-    'semi-imaginary',
-    'semi-immediately',
-    'semi-imperialist',
-    'semi-independent-past',
-    'semi-indeterminate',
     'semi-indifference',
-    'semi-inebriated',
-    'semi-inebriation',
-    'semi-infinite',
-    'semi-inflated',
-    'semi-innocent',
-    'semi-institutional',
-    'semi-insulator',
-    'semi-intensive',
-    'semi-interpreters',
-    'semi-invisible',
-    'semi-isolated',
-    'semi-isolation',
-    'semi-italio',
-    'semi-itinerant',
-    'semi-joked',
     'semi-jokes',
-    'semi-judicial',
-    'semi-labour',
-    'semi-landlord',
-    'semi-legality',
-    'semi-legends',
-    'semi-lethal',
-    'semi-liberated',
-    'semi-lifeless',
-    'semi-literally',
-    'semi-literature',
-    'semi-local',
-    'semi-log',
-    'semi-logarithmic',
-    'semi-long-term',
-    'semi-longitudinal',
     'semi-love',
-    'semi-luxuries',
-    'semi-magical',
-    'semi-maintained',
-    'semi-mancunians',
-    'semi-manufactured',
-    'semi-market',
-    'semi-matter',
-    'semi-mature',
-    'semi-melodramatic',
-    'semi-melody',
-    'semi-meronym',
-    'semi-militaristic',
-    'semi-military',
-    'semi-minims',
-    'semi-minor',
     'semi-modular',
-    'semi-monsters',
-    'semi-moratorium',
-    'semi-motorway',
-    'semi-nakedness',
-    'semi-national',
-    'semi-nautical',
-    'semi-negative',
-    'semi-newspaper',
-    'semi-nomadism',
-    'semi-nomads',
-    'semi-objective',
-    'semi-occlusion',
-    'semi-opacity',
-    'semi-ordered',
-    'semi-organized',
     'semi-oriental',
-    'semi-pacca',
-    'semi-palaces',
-    'semi-palmated',
-    'semi-papal',
-    'semi-paragraph',
-    'semi-partisan',
-    'semi-partitioned',
-    'semi-pastoral',
-    'semi-pauses',
-    'semi-peat',
-    'semi-penal',
-    'semi-pendant',
-    'semi-perforated',
-    'semi-permissive',
-    'semi-personal',
     'semi-photographic',
-    'semi-pluralism',
-    'semi-pointed',
-    'semi-polemical',
-    'semi-polished',
-    'semi-popular',
-    'semi-portable',
-    'semi-posterior',
-    'semi-powershift',
-    'semi-preparative',
-    'semi-profession',
-    'semi-proletarian',
-    'semi-proportion',
-    'semi-pros',
-    'semi-prostrate',
-    'semi-psychedelic',
     'semi-psychotic',
-    'semi-purdah',
-    'semi-pureed',
-    'semi-quango',
-    'semi-quantitabe',
-    'semi-quantitatively',
-    'semi-radial',
-    'semi-rapide',
-    'semi-raps',
-    'semi-rat',
-    'semi-realistic',
-    'semi-realities',
-    'semi-reclined',
-    'semi-reclining',
-    'semi-recluses',
-    'semi-recognition',
     'semi-refined',
-    'semi-reformation',
-    'semi-reformers',
-    'semi-regal',
-    'semi-regulars',
-    'semi-relevant',
-    'semi-remote',
-    'semi-repression',
-    'semi-republican',
-    'semi-resting',
-    'semi-retire',
-    'semi-rigidity',
-    'semi-rigorous',
-    'semi-rock',
-    'semi-romanesque',
-    'semi-rotary',
     'semi-roundel',
-    'semi-royal',
-    'semi-rs',
-    'semi-sa',
-    'semi-sacerdotal',
-    'semi-sacred',
-    'semi-sailor',
-    'semi-salt',
-    'semi-savage',
-    'semi-scientific',
-    'semi-scots',
-    'semi-screech',
-    'semi-sedentary',
-    'semi-self',
-    'semi-semi-disfranchisement',
-    'semi-senior',
     'semi-sentient',
-    'semi-separatist',
-    'semi-seriously',
-    'semi-seriousness',
-    'semi-servile',
-    'semi-servitude',
-    'semi-set',
-    'semi-settlement',
-    'semi-shady',
-    'semi-shaven',
-    'semi-shaven-headed',
-    'semi-sheltered',
-    'semi-sightseers',
-    'semi-situationist',
-    'semi-skeletal',
-    'semi-slash',
     'semi-slave-like',
-    'semi-slavery',
-    'semi-slaves',
-    'semi-slum',
-    'semi-social',
-    'semi-soft',
-    'semi-solidified',
-    'semi-span',
-    'semi-sparkling',
-    'semi-specialism',
-    'semi-spherical',
-    'semi-spin',
-    'semi-spoken',
-    'semi-spontaneous',
-    'semi-spoof',
-    'semi-sporting',
     'semi-stable',
-    'semi-staged',
-    'semi-staging',
-    'semi-standard',
-    'semi-standardised',
-    'semi-stardom',
-    'semi-stasis',
-    'semi-static',
-    'semi-statistical',
-    'semi-statutory',
-    'semi-steamed',
-    'semi-stiff',
-    'semi-still',
-    'semi-stopper',
-    'semi-straight',
-    'semi-strangled',
     'semi-strip',
-    'semi-stuctured',
-    'semi-stylized',
-    'semi-submersibles',
-    'semi-suicidal',
-    'semi-sung',
-    'semi-sunken',
-    'semi-surrealistic',
-    'semi-surreptitious',
-    'semi-symphonic',
-    'semi-synthesise',
-    'semi-tale',
-    'semi-talented',
-    'semi-tarrasch',
-    'semi-terrestrial',
-    'semi-texturised',
     'semi-tough',
-    'semi-traditional',
-    'semi-trained',
-    'semi-troglodyte',
-    'semi-turn',
-    'semi-unconscious',
-    'semi-undress',
-    'semi-undressed',
-    'semi-uniform',
-    'semi-unity',
-    'semi-utopian',
-    'semi-vegetarian',
-    'semi-vertical',
-    'semi-viscous',
-    'semi-voluntarily',
-    'semi-vowels',
     'semi-waterlogged',
-    'semi-wet',
-    'semi-whispered',
-    'semi-wooded',
-    'semi-working',
-    'semiannually',
-    'semiantic',
-    'semiaquatic',
-    'semibarbarous',
-    'semibreif',
-    'semicircle.',
-    'semiclassical',
-    'semicollapsed',
-    'semicondominium',
-    'semiconducters',
-    'semiconductive',
     'semiconductor-based',
-    'semiconductor-trade',
-    'semiconductor/insulator',
-    'semiconfluent',
-    'semiconscious',
-    'semidark',
-    'semiderelict',
-    'semidivine',
-    'semidominant',
-    'semiempirical',
-    'semifasts',
-    'semifinalist',
-    'semifinished',
-    'semifixed',
-    'semiformed',
-    'semiformed=1',
     'semigrave',
-    'semiliterates',
-    'semilla',
-    'semimetaphorical',
-    'semin&aacute&rcaron;e',
-    'semin-aries',
-    'semina',
-    'seminaked',
-    'seminal-sac',
-    'seminally',
-    'seminar-room',
-    'seminar/classrooms',
-    'seminar/meeting',
-    'seminar/workshop/exhibition',
-    'seminara',
-    'seminari',
     'seminarise',
-    'seminarists',
-    'seminars/',
-    'seminars/conferences',
-    'seminars/training',
-    'seminars/workshops/exchanges',
-    'seminary-trained',
-    'semington',
-    'seminis',
-    'seminoma',
-    'semioclasm',
-    'semioctagonal',
-    'semiologist',
-    'semiologists',
-    'semiparalysed',
-    'semiparametric',
     'semiparasitical',
-    'semipelites',
-    'semipelitic',
-    'semiplina',
-    'semiprecious',
-    'semipreparative',
-    'semiquantitive',
-    'semirechensk',
-    'semireclined',
-    'semiregular',
-    'semirestraining',
-    'semiriechinsk',
-    'semirimide',
-    'semiripe',
-    'semiseria',
-    'semisi',
     'semisimple',
-    'semistarvation',
-    'semit',
-    'semitechnical',
-    'semitically-derived',
-    'semitonally',
-    'semivoluminous',
-    'semix',
-    'semkhoz',
-    'semlali',
-    'semley',
-    'semlin',
-    'semlyen/co-founder',
-    'semmens/railway',
-    'semmit',
-    'semmy',
     'semoigne',
-    'semolina-type',
-    'semonda',
-    'semonin',
-    'semont',
-    'semothing',
-    'sempacher',
-    'semparvirens',
-    'semperit',
-    'sempervirene',
-    'sempiternum',
-    'sempleah',
-    'semplici',
-    'sempr&oacute;n',
-    'sempr&uacute;n',
-    'sempstress',
     'semseddin',
-    'semsi',
-    'semtex-packed',
-    'semundo',
-    'semyon',
-    'sen&rehy',
-    'sen(d)',
-    'sen-off',
-    'sen-related',
-    'senafe',
-    'senai',
-    'senaill&eacute',
-    'senaille',
-    'senanayaka',
-    'senapati',
-    'senario',
     'senas',
-    'senate***',
-    'senate/house',
-    'senatus-consulte',
-    'senbef',
-    'sencer',
-    'senchagov',
-    'sencler',
-    'send-and-receive',
-    'send-ups',
-    'send/give',
-    'send/stereo',
-    'send_at',
-    'sender(s)',
-    'sender-receiver',
-    'sender/addressee',
     'sender/receiver',
-    'senderens',
-    'senderista',
-    'sendest',
-    'sendeth',
-    'sendingoff',
-    'sendivogius',
-    'sendmail',
-    'sendun',
-    'sene',
-    'senebron',
-    'seneco/physiotherapist',
-    'senecto',
-    'senectute',
-    'senedd',
-    'senediak',
     'senefelder',
-    'senegal-mauritania',
-    'senegalese-backed',
-    'senegallus',
-    'senegambian',
-    'seneka',
-    'senen',
-    'senepol',
-    'senescallus',
-    'senescfial',
-    'senese',
-    'senesino',
-    'senetenced',
-    'senetnced',
-    'senex',
-    'senft',
     'sengat',
-    'sengor',
-    'sengstaken-blakemore',
-    'sengul',
-    'senhouses',
-    'senijextee',
-    'senile-decays',
-    'senior-junior',
-    'senior-manager',
-    'senior-most',
-    'senior-secondary',
-    'senior/junior',
-    'senior/national',
-    'senior/radcliffe',
-    'seniores',
-    'seniority-related',
     'senis',
-    'senise',
-    'senjak',
-    'senjin',
-    'senkaki',
-    'senken',
-    'sennacharib',
-    'sennacherib',
-    'sennan',
-    'sennar',
-    'sennas',
-    'sennaya',
-    'sennet',
-    'sennies',
-    'sennight',
-    'senno',
     'sennosides',
-    'senoch',
-    'senones',
-    'senoras',
-    'senpachi',
-    'sensaround',
-    'sensating',
-    'sensation-feeling',
-    'sensation-loving',
-    'sensation-mongers',
-    'sensation-seeking',
-    'sensation.',
-    'sensationalizing',
-    'sensations.',
-    'sense&mdash',
-    'sense-',
     'sense-altering',
-    'sense-assaultingly',
-    'sense-awakening',
-    'sense-contents',
-    'sense-datum',
-    'sense-dulling',
-    'sense-experiences',
-    'sense-field',
-    'sense-groups',
-    'sense-making',
-    'sense-modification',
-    'sense-of-wonder',
-    'sense-organ',
-    'sense-perceptions',
-    'sense-sections',
-    'sense-slaughtering',
     'sense-strand',
-    'sense.9',
-    'sense.of',
-    'sense/reason/emotion',
-    'sense/to',
-    'sense_that',
-    'sensed-worlds',
-    'sensee',
-    'senselle',
-    'senses\'ud',
-    'senses-reeling',
-    'senses.',
-    'sensescence',
-    'sensi',
-    'sensi&rehy;tively',
-    'sensibilite',
     'sensible-looking',
-    'sensible-sized',
-    'sensimelle',
-    'sensimental',
-    'sensissent',
-    'sensititre',
-    'sensitiv',
-    'sensitively-restored',
-    'sensitivity-return',
-    'sensitivity-tested',
-    'sensitivity-training',
-    'sensitivity/sustainment',
-    'sensitizers',
-    'sensitve',
-    'sensitvity',
-    'senskell',
     'sensor-analyte',
-    'sensor-controlled',
-    'sensor-studded',
-    'sensori',
-    'sensorily',
-    'sensorineural',
-    'sensory-assault',
-    'sensory-deprivation',
-    'sensory-emotional-disorderly',
-    'sensory/motor',
-    'sensour',
-    'sensualism',
-    'sensualities',
-    'sensuary',
-    'sensuel',
-    'sensuelle',
     'sensuously-worked',
-    'sensuron',
-    'sent/received',
-    'sentational',
-    'sentece',
-    'sentenc',
-    'sentence&rehy;objects',
-    'sentence-analogue',
-    'sentence-construction',
-    'sentence-focussed',
-    'sentence-fragment',
-    'sentence-fragments',
-    'sentence-initially',
-    'sentence-production',
-    'sentence-string',
-    'sentence.it',
     'sentence/cloze',
-    'sentence1',
-    'sentence_such',
-    'sentencefrom',
-    'sentences-in-contexts',
-    'sentences-on-the-page',
-    'sentences-with',
-    'sentences.a',
-    'sentencet',
-    'sentencia',
-    'sententially-structured',
-    'sententias',
-    'sententiis',
-    'senter',
-    'senti&rehy;ment',
-    'sentiero',
     'sentiment-by-numbers',
-    'sentimentalisation',
-    'sentimentalizing',
-    'sentinel-like',
-    'sentinelle',
-    'sentinelled',
-    'sentire',
-    'sento',
-    'sentorian',
-    'sentosa',
-    'sentron',
-    'sentry-go',
-    'sentryman',
-    'sentrymatic',
-    'sentul',
-    'senufo',
     'senwick',
-    'senz',
-    'senzala',
-    'senzenjani',
-    'seo',
-    'seoc',
-    'seociond',
-    'seodhna',
-    'seogi',
-    'seoi-nage',
-    'seoki',
-    'seol',
-    'seonid',
-    'seoposongwe',
-    'seoras',
-    'seos',
     'seoudi',
-    'seoul-based',
-    'seoul-o',
-    'seoung',
-    'sep&ndash;30',
-    'sep-11',
-    'sep-pak',
-    'sepa&rehy;rate',
-    'sepang',
-    'separ&rehy;ately',
-    'separably',
-    'separate\'',
-    'separate-bedroom',
-    'separate/accumulated',
-    'separate/d',
-    'separated-out',
     'separated.',
-    'separated/divorced',
-    'separately-charged',
-    'separately-located',
-    'separately-wired',
-    'separatenesses',
-    'separation-of-spheres',
-    'separation.',
-    'separation/purification/concentration',
-    'separatisms',
-    'separatist-related',
-    'separazione',
-    'separee',
-    'separrate',
-    'sepecat',
-    'seperate.staff',
     'seperates',
-    'seperations',
-    'sephacryl',
-    'sephadex-g50',
-    'sephardism',
-    'sephen',
-    'sephied',
-    'sephirot',
-    'sepi',
-    'sepia&mdash',
-    'sepiad',
-    'sepioids',
-    'sepium',
-    'sepolcro',
-    'sepp&auml',
-    'seppe',
     'seppelt(1986a,1986b)',
-    'sepr',
-    'seprate',
-    'seprut',
-    'sepsu',
-    'sept&ndash;23',
-    'sept&ndash;4',
-    'sept-8',
-    'sept.10',
-    'sept.11',
-    'sept.15',
-    'sept.16',
-    'sept.17',
-    'sept.18',
-    'sept.25',
-    'sept.8',
     'sept24/oct',
-    'sept24/oct23',
-    'septaecemia',
-    'septarian',
-    'septastraea',
-    'septem&rehy;ber',
-    'september&ndash;28',
-    'september&ndash;29',
-    'september&ndash;8',
-    'september&ndash;9',
-    'september&ndash;may',
-    'september&ndash;november',
-    'september&ndash;saturday',
-    'september-21',
-    'september-30',
-    'september-4',
     'september-6',
-    'september-june',
-    'september-may',
-    'september.the',
-    'september/',
-    'september1993',
-    'septembers',
-    'septentriones',
-    'septi',
-    'septicaemic',
-    'septimanian',
-    'septimi',
-    'septium',
-    'septr',
-    'septr.',
-    'septs',
     'septuaginta',
-    'sepuh',
-    'sepulchrale',
-    'sepulchtura',
-    'sepulcra',
-    'sepuldeva',
-    'sepulkralkultur',
-    'sepulveda',
-    'seqencing',
-    'sequal',
-    'sequals',
-    'sequanna',
-    'sequatur',
-    'sequela',
-    'sequenase-kit',
-    'sequence-control',
     'sequence-controlled',
-    'sequence-derived',
-    'sequence-specificity',
-    'sequence-unspecific',
-    'sequence/music',
-    'sequence/region',
-    'sequencer-based',
-    'sequences.',
-    'sequences/regions',
-    'sequencing-quality',
-    'sequencing.',
-    'sequent-based',
-    'sequential-direct',
-    'sequential-to-parallel',
-    'sequenza',
-    'sequeros',
     'sequestrating',
-    'sequestrator',
-    'sequijor',
-    'sequioa',
-    'sequiros',
-    'sequoia&ndash;yosemite',
-    'sequor',
-    'sequoyah',
-    'ser-asn-lys-glu-gln-glu-pro-lys-glu-lys-lys-lys-lys-lys',
-    'ser-gln-glu',
-    'ser-r-geant',
-    'ser-x-pro',
-    'ser.',
-    'ser/thr-gln',
-    'ser/tyr-phosphatase',
-    'ser177',
     'ser18',
-    'ser90',
-    'sera-labo',
-    'serac-edged',
-    'serach',
-    'serached',
-    'seracold',
-    'serafetinides',
-    'serafino',
-    'serag',
-    'serageddin',
-    'seraglios',
-    'serah',
-    'seraient-ils',
-    'seraikella',
-    'seralab',
     'serana',
-    'serangkai',
-    'seraph-pterodactyl',
-    'seraph-serpents',
-    'seraphine',
-    'serapi',
-    'serapion',
-    'serapis.',
-    'seravit',
-    'serb-besieged',
-    'serb-croat-slovene',
-    'serb-domination',
-    'serb-moslem',
-    'serb-muslim',
-    'serb-occupied',
-    'serb-officered',
     'serb-ruled',
-    'serb-slavonic',
-    'serb-speaking',
-    'serba',
-    'serbdom',
-    'serbehoni',
-    'serbezov',
-    'serbi',
-    'serbia-dominated',
-    'serbia/yugoslavia',
-    'serbian-american',
-    'serbian-born',
-    'serbian-croatian',
-    'serbian-latin-german',
-    'serbian-populated',
-    'serbian/croatian',
     'serbian/montenegrin-owned',
-    'serbianness',
-    'serbin',
-    'serbo',
-    'serbo-bloody-croatian',
-    'serbo-croatian',
-    'serbophiles',
-    'serboslavia',
-    'serbronski',
-    'serc/dti',
-    'serc/ssrc',
-    'serching',
-    'serdang',
-    'serdica',
-    'serebriakova',
-    'serebrov',
     'serel',
-    'seremetjevo',
-    'serenaids',
-    'serendipitously',
-    'sereni',
-    'serenitatis',
-    'sereny',
-    'serer',
-    'sererus',
-    'serf&rehy;ridden',
-    'serf-like',
-    'serf-owner',
-    'sergayiz',
-    'sergeant-at-arms',
-    'sergeant-like',
-    'sergeant-majors',
     'sergeantry',
-    'sergeants-at-mace',
-    'sergeants.',
-    'sergeievich',
-    'sergeivitch',
-    'sergejs',
-    'sergioveto',
-    'sergiyev',
-    'sergiyevyy',
-    'sergt',
-    'sergt.-pilot',
-    'serguei',
-    'serh',
-    'serhad',
-    'serhienko',
-    'serial-inverted',
     'serial-killer',
-    'serial-monogamy',
-    'serial-novel',
-    'serial-numbered',
-    'serial/story',
-    'serialisations',
-    'seriality',
-    'serializ&rehy;ations',
-    'serially-produced',
-    'seriana',
-    'serians',
-    'seriatim.',
-    'serica',
-    'sericeus',
-    'sericic',
-    'sericitisation',
     'sericol',
-    'sericoside',
-    'sericulture',
-    'sericultureal',
-    'series&ndash',
-    'series-a',
-    'series-based',
-    'series-derived',
-    'series-pass',
-    'series-timetabled',
-    'series-winning',
-    'series.golf',
-    'serifed',
-    'seriff',
-    'seriffed',
-    'serin',
     'serine-rich',
-    'serine-threonine',
-    'serine/threonine',
-    'serines',
-    'sering',
-    'serio',
-    'serio-comic',
-    'seriosuly',
-    'seriou',
-    'seriouly',
-    'serious&ndash',
-    'serious-art',
-    'serious-mindedness',
-    'seriousaly',
-    'seriouslooking',
-    'seriously\'',
     'seriously-affected',
-    'seriously-ill',
-    'seriously-injured',
-    'seriously-no',
-    'seriously.venezia',
-    'seris',
-    'seritham',
-    'serivce',
-    'serjani',
-    'serjeant-at-mace',
-    'serjeant-of-arms',
-    'serjeant-trumpeter',
-    'serl',
-    'serletis',
-    'serlison',
-    'serman',
     'sermon-tasting',
-    'sermonde',
-    'sermones',
-    'sermoneta',
-    'sermonets',
-    'sermonette',
-    'sermonic',
-    'sermonise',
-    'sermonises',
-    'serne',
-    'serning',
-    'serno-solov\'evich',
-    'serno-solovievich',
-    'serobiochemical',
-    'serodiagnosis',
-    'seroepidemiological',
     'seroepidemiology',
-    'serogroups',
-    'serolabs',
-    'serolla',
-    'serologist',
-    'seromed',
-    'seromuscular',
-    'seron',
-    'serono',
-    'seropostive',
-    'serostatus',
-    'serosurveys',
-    'serotesting',
-    'serotoninergic',
-    'serotype',
-    'serotyped',
     'serotypes',
-    'serovar',
-    'serovonversion',
-    'serpent-bearer',
-    'serpent-licked',
-    'serpent-line',
-    'serpent-locked',
-    'serpent-woman',
-    'serpent-worship',
-    'serpentarium',
-    'serpentes',
-    'serpentine-front',
-    'serpentine-shaped',
-    'serpentining',
-    'serpentinised',
-    'serpentinized',
     'serpentins',
-    'serpentizing',
-    'serperaster',
-    'serphid',
-    'serpina',
-    'serptularoides',
-    'serpukhov.',
-    'serpula',
-    'serpyllifolia',
-    'serpyllium',
-    'serradj',
-    'serraller',
-    'serranid',
-    'serranidae',
-    'serranocirrhitus',
-    'serrao',
     'serrarius',
-    'serras',
-    'serrate',
-    'serrati',
-    'serrating',
-    'serratum',
-    'serrault',
-    'serrells',
-    'serrers',
-    'serriger',
-    'serrone',
-    'serrons',
-    'serrs',
-    'serrulata',
-    'serrure',
-    'serrusalmus',
     'sersale',
-    'serti',
-    'sertillanges',
-    'seruant',
-    'seruantes',
-    'serula',
-    'serum-',
-    'serumchromoglycate',
-    'seruminstitut',
-    'serv(ic)es',
-    'serv-ices',
-    'servaas',
-    'servae',
-    'servaes',
-    'servamus',
-    'servan',
     'servanschreiber',
-    'servant&mdash;competition',
-    'servant\'',
-    'servant-keepers',
-    'servant-maid',
-    'servant-maids',
-    'servant-maintained',
-    'servant-seller',
-    'servant-teachers',
-    'servants&mdash;and',
-    'servants.',
-    'servators',
-    'servaunte',
-    'servay',
-    'servces',
-    'serve\'',
     'serve-and-volleyer',
-    'serve/volley',
-    'serveing',
-    'server(mvs)',
-    'server-backed',
-    'server-centric',
-    'server-compliant',
-    'server-lan',
-    'server-to-network',
-    'server/client',
-    'servera',
-    'serveral',
-    'serverising',
-    'servery-style',
-    'serviant',
-    'servicable',
     'service&mdash;it',
-    'service&mdash;lothian',
-    'service&rehy;inspired',
-    'service(mhs)',
-    'service(s)',
-    'service-base',
-    'service-buying',
-    'service-card',
-    'service-dominated',
-    'service-drafted',
-    'service-groups',
-    'service-in-a-box',
-    'service-intensive',
-    'service-issue',
-    'service-level',
-    'service-men',
     'service-minded',
-    'service-observer/visitor',
-    'service-orientated',
-    'service-oriented',
-    'service-planning',
-    'service-producing',
-    'service-specific',
-    'service-specific-disciplinary',
-    'service-station',
-    'service-type',
-    'service-use',
-    'service-user',
-    'service.but',
-    'service.her',
-    'service/',
-    'service/access',
     'service/corrective',
-    'service/f',
-    'service/house',
-    'service/housing',
-    'service_no',
-    'servicebars',
-    'serviceberry',
-    'serviced/chimney',
-    'serviceline',
-    'servicemaster',
-    'servicemen.',
-    'serviceof',
-    'servicer',
-    'servicers',
-    'services&mdash;is',
-    'services(snads)',
     'services-based',
-    'services-leisure',
-    'services-looks',
-    'services-related',
-    'services-to-jazz',
-    'services.as/400',
-    'services.joyce',
-    'services/card',
-    'services/events',
-    'services/gloucestershire',
-    'services/informal',
-    'services/issues',
-    'services/m-5/worcestershire',
-    'services/work',
-    'services22',
-    'servicese',
     'servicewoman',
-    'servicing-wise',
-    'servicing.',
-    'servicings',
-    'servide',
-    'servientes',
-    'serviette-rings',
-    'serviettes/place',
-    'servillia',
-    'servin',
-    'serving-boy',
-    'serving-dishes',
-    'serving-girls',
-    'serving-man',
-    'serving-people',
-    'serving-spoon',
     'serving-woman',
-    'serving-women',
-    'servir',
-    'servis',
-    'servisair',
-    'servitium',
-    'servitudes',
-    'servo-actuators',
-    'servo-armour',
-    'servo-assisted',
-    'servo-mechanisms',
-    'servo-motor',
-    'servo-rudders',
-    'servo-suit',
-    'servo-system',
-    'servo-tabs',
     'servomech',
-    'servomotorised',
-    'servoz',
-    'servt',
-    'servt.',
-    'servts.',
-    'servy',
-    'serwano',
-    'seryth',
-    'serzhantovich',
-    'ses-sili-flora',
-    'sesame-flavoured',
-    'sesame-seed',
-    'sesame-seeded',
-    'sesbastian',
-    'sesca',
     'sescom',
-    'sesdaq',
-    'seselwa',
-    'seshadri',
-    'seshan',
-    'seshed',
+)
+
+blocks_57 = (
+    '$#ran$!s$%ullah##kin#&leilei$+ingspartiet$"ot#!m$!a%&cchini%$kkhi%!s%!t$&elbuch&"s.',
+    '$&lungen$$onds&,s/alzheimers(\'husband$$urai%(tt/geoff$"y-#"n.#\'ochodow$#ens$%gneux%"on$*oblozhenie$"re$$urai',
+    '#%pales%)n-crowded\'&ladies%\'thknmar$!e%$bogo$$ford$"ha$#ier$!l%&adelic%\'e-aided\'%books\'(charging\'%laden',
+    '\'$site(%urvey\'(tracking&!/\'\'liberal\'%total&$core&%delic&%s/200\'"at$.son&rehy;simon\'&/royal\'#_at\'!s#%reboi',
+    '$&i-adad%"ng$)on/series&%owicz&!s$$ungs#(t&ouml;k$#ack$%redia#!u$\'davanij%"ra$)el/apollo\'%chief&#ite',
+    '&!y$$garh#%wayts$$idge%!l",n&amacr;tani$(iacute;n#"\'c#%-feng$-mart&iacute;n#!.##aan$#cja$"da$$kham',
+    '$"ra$$trem#!c$+&rehy;tions$!a%!k$"es$&haspis%"es&)z-pacheco)&izjuan\'\'vicario%!i&!a%"os',
+    '$$reed%)oft-baker$!t%%ifier&,mony-baiting&)onalizing(#ers("s.),/punishments&%ssima+!e&#try%%uario(0y&rehy;buildings)%-lamp',
+    '#,d&oacute;val&&uml;ya%)rehy;bars$!-%\'bagging(!s\'#ths&\'locking($wing&$rick&\'uilding%(carrying&\'hannels&&olored%\'damaged',
+    '&&igging&(ominated%(elephant&(nvironed%%faced&\'ixation&&lecked\'#ies&#ree%%grain\'#een%%house%\'jointed%\'ladders%)over-rock',
+    '&#ies\'"le&#ool%$rich%\'scoured&"ea&#ilt\'#zed&$torm*#ing%$trap%%wedge$%/glue%$send$\':cement',
+    '$\'actylus%&l-hose\'&wearer+#ing(#ood&*/wiltshire&+wood-sticks*!s%$way.$%batch\'!h%$last%$orne&#xes%%ridge',
+    '$(castling$!e%%fjord%0man/neurosurgeon(#ian%(r/norton&$cock&*s/fairport()solicitor\'#on.)#/15*&author*+businessman**collection\'+tead-elmers',
+    '$$fell%$ield%$lats)!.%9ord-on-thames/oxfordshire$%gatte$)ham-gover%#eap%&oppers%-urst-educated&$tton$)ification&(ordprime%$mmun%+ng/grinding',
+    '&$ismo(!t$#jak$$land%!e&"as&$ford&!s%#ime&%ng/k9%"ot&!w$&master%!o$&oricum',
+    '%"ya$*paper-like)$back)!y%#ort$,ra/symington&!y%!e&#lli%!i&+ngham-envoy%#oyd%!y&%/club$\'s-patsy',
+    '&\'dentist\'%river%$cape&$hool)#ner%%hield%#ide%$lips%$pill%*torm-swept$#ton$#ugo%"ka%%rbans$#ved',
+    '$&washed\'"ps%#ear&#dge%/ich-consumption)#man)(pinching)\'society)$type\'"um&!p&#rth%#orm\'!t$*y&rehy;man',
+    '&%blond&$clay\'%oated&$loam%!a%$bank%%glade%"ha%%knowe*!s%%lands%\'s-clerk#*eengraving$!l#$foin',
+    '\'!s&$ised#%g-koi%)sang-dang$"ai%!k%#llo%!r&(alinigam&"ee%!y$#eet%$mini%)rmanensis%&veneth',
+    '%"vi%$yang$#iti$$lant$$rail%#eal$!s%#hak%#tha$\'uettoli%%inaro\'"ed(!s("um\'#ity',
+    '$%wedge%$idge&!n$$yang%"ip#!h$$ailt#-i&rehy;tation$%-duct$#bel$"ca$"er$"ff%$lush$#lav',
+    '$#sko$(t&agrave%!a&#ire&#ria)"ns)!s("um&!s%$ises&&zation%(y-saving&3clawsiscomingtotown$#yya#+jaasureniyn',
+    '%"ye$"ib%!v##k-i$!a%#ran%"wa$#eiv%"ys$"in$!o%"fa%!h%"ng%$wski',
+    '#&liurfa$$ucar##mei$&ichele#"na%!t%%zzaro$%dila.$"ia$#uto$%yasin#$odin$"go$"ko$!s',
+    '&!r%%irico#$rizz#%s-amp$%avino$$bury$&everia(!o$#isu$"ki&%-most%3rit/bengali/english("am$&olaine%+m/aylesbury',
+    '%#eur$&tisima#(t\'agnese\'&ostino&#nna%&efisio&$lena$&a-cruz&$trap%(cristina\'#oce%&laceae&$ucia\'!m%*maria(psc)',
+    '&"pa%1nder-mediterraneo&!o&"ta%#ray$&ecroce%"ro%#uil$(i&agrave%.-potros&oacute%)ago-based%-llana-del-mar%\'niketan%&prabob%%ssima',
+    '%$nian\'!n\'!o&%linas%(s-dumont&"c.%%venia$"ri$%schii%$laue$&ullano$!z#"us%#iya##xay',
+    '#!y$#ang$"os##zio$!o"&olanum#"me%#one#!s$"-2"/p&mdash;swedish#(-feeding$%glove$%water#&1-vp16',
+    '#%eravi%"da%)lipopette$"te$#urs$0y/worcestershire#"ha$#ena$$iers$$orin$!s##ien&#tes\'"ia)!e',
+    '$%nense$\'r-wharf##ley#!o$%dilla$$lsky$"re#6perton/gloucestershire$$hica&+re-coloured)$hard*#ued&"sm$!i#%risti',
+    '&#ite%%phagy##sea$\'unthorn#"ta%$gram"#qer#"qa$!o#(ueboutes$#ier"#r-3$-e-pol-e-zahab$&i-sang#)a&mdash;i',
+    '%#hai%#uri$$cena%#ouu$$fina&#yah%\'otoxins$\'h-clare&%jayne&&louise%$/hiv&(resident$-irehtransport$$javo%-evo-edinburgh',
+    '$$mago%"ma$#nda&!i&#on.%"gi$%riman$!s%!a%(indeputy\'\'foreign%$soro%#usa%$vati%$wati',
+    '%#ejo$)wak-based&!t%&hacked$!y$#zin#"ba%!h%#nes$,ethsabanaiel$"in$$skie#"ca%$ndas%!r',
+    '%#sin&$tic.))ally.just)!s$$enet$$inet$&obatus%$coca\'$rnia%#ma.&#ere%\'phytons)"um&#tic%%somes',
+    '%%testa#"da%#rji%#sht$!e%*lov&aacute%!t$#ial%#nas&"ed\'+ly-intimate&#has&-ia/cannigione$&onicus%!u',
+    '$!d$!e$!k#!f$$ield$#lax#,gent-wallace$%inson$$syan$#uja#&i-clad$"an&"ne$"ce$!e',
+    '$"ne%!g$$quey$&shvili%"ka$!t$#won#%jeant$!o#$kara$"er$#hel#"la$"es$#ing',
+    '#"ma%!d%#tia("ns$&entosa$%ineto#\'n-major$"at$$oeds#"od$#fim$!i$(ng-dress&#ing&$wise',
+    '$!s$#uks#%pedon$*hie/oxford$$lers&!s$#sis##rag%#sin%"tt%#zin$#eqi$#ies#"sa%"nk',
+    '$$enet$&fields%$leld$"ia$#ons##t-i$$illy%"ne$1orially-conscious\'!o$(re-nizan&!.&%anism##uca$+kh&aacute;n',
+    '&#ani$$man-#"va$!o##wal%"ri$#ono#"yk#$zana"&s-page$$stay$\'trained%#ype#$/lab#%anian',
+    '$#ury##ebo$"no#*h-and-case)&pulley%$cord%\'pattern%&window$$cord$%emene$#imi$#kin$$less%#ock$!o',
+    '#"ib$"no##low#!o#"pe#&quatch%%ianna#"ra##san&%iansm\'!d$(ettesque$"ie%"ne$$long',
+    '%!i%%lungo%-on&mdash;dead\'(/make-up%!u##tri%!y",t&ndash;6.00*#mon#$\'day#%-down$"in%)s-factory$#mon#(4/sunday',
+    '$"ki$#nas%!i%!s%#tic$#ome#(chanalai%,el-briefcase\'*l/bereaved)\'project%%field#,e-of-affairs(\'the-art$"fl$$llit',
+    ')&-borne*(directed*%earth*&linked*\'related*(to-cable)"s.%!o#"fa##har%%sivam$&irakul$"or#%iable$&e-type',
+    '$"fy&#ing$"ja$\'n-birds\'$ound&$clad(%oaked&&draped&%gloss&$hard&$like&&padded&\'quilted&%sheen("od',
+    '\'%titch&$type&%weave%$elle%#fin$#ons$"po$!r%\'ic-epic\'!k$)s-factory%#fac(!t)/ion&mdash;there,+-guaranteed',
+    ',!.-"in)$ory\',!-\'$tion\'%xtion&%icers\'#ed-*\'looking(!r&,y-schmatisfy%$ifes\'#ied%!t$#va/',
+    '#&omayor$$rial%!u##rai%$piff\'"ze$*iani-esque&#wan#%schen$&riakat$%tream#!t$$asai$!b$$erly',
+    '$#ler##uki$"ra&"dy&*ted-colour\'+ion-bombing\'"us%!d&,ay-afternoon)&sunday(\'.friday)+headteacher)#the(\'/andrew)(saturday',
+    '%$lite%)n-neptune\'(skimming&%alian*!s&$ians\'"id\'!s#"va##way$$hile#*yanarayana$%endra)$nath$&r-like',
+    '&"ne%&omania"*uce-bottle(!x&\'covered%!.&#the%$boat)!s%+pan-hitting%\'r-sized%"s.$\'hiebank(#urn$+i&egrave;re',
+    '&"st%$sson$&y-face#"de$&i-flag&*instigated\'&ranian)"qi&&kuwait&#led&)supported%%/iraq*!i&)jordanian%"ta',
+    '#)erbrunnen%$dale%+l&auml;nder&#and#"ff##gor$"ur#$lces$$eyan%!z$#ire$"os$!s$#ter#%mares',
+    '%)/bathroom&&shower\'\'olarium$"ce%#hie$.ders\'challenge()-atkinson(%/aeeu*$ston)\'friends)(landlady))principal))wiltshire\'#ton*0/buckinghamshire',
+    '$!i%*&egrave;re$!k$%terer)!s%#ing##our&!e#\'rashtra%!t$"es$&ischia$\'omaulus%*podomorpha%!s',
+    '$"us##sag&*e-diameter($hung((munching($roll,!s($skin\'$.the\'!y$\'er-hall$%marez$,suritisation#!t$,&eacute;eing',
+    '$"ed%#rne%#use%!z$*ill&eacute$#oir$.r&acirc;nkitas$!s#%vages&\'nargues$!e$#iac#(ychaisri#"ze$"on',
+    '##\'ry#&-a-cup#6a-danube-morava-vardar,#una$#ble$(ge/clerk\'(director\'&former&0ry-civilization\'$$ides$#nah\'!s%!g%"in%\'na-like',
+    ')$like(\':filled\'$khet$#ria%!t%&y/iain$"si%#kan#-e-and-restore$#.by$"d\'%,-by-the-bell%!/%\'values.,-btm.calibmeas',
+    '$"li%%letri%#oys$\'r-class&$plus&$type%&imutto%$land%"ne%*y-gilliard&!s$"s.$#urs$$vski$!z',
+    '$"ca$#des%*ge/tugboat$$gnon&,y-les-beaune$+le/speaking%&le-row(&troike\'#ion\'"s.$1ng&amp;investment&!\'&"_a&0s&amp;investment\'*-and-loans',
+    '(*investment(\'sucking\'!d%$jski%#kov$#oli%"ni%!r&&-faire%#ur\'\'*-designate(*of-the-day\'$gate\'*s/butchers#&oia-81',
+    '&!s$#ldi$\'nneries$"or$$ring%"ys$\'uriness&$less&\'y-snack$,y&mdash;vial%%-mont%$arde#%rasov$#ola##uka',
+    '$"ti#"va$%idhis%#est%!n#!y$#nge##zey""w\'#&-bench%%illed%$ones$\'cutting$$dust$\'handled',
+    '$$jaws$$like$\'playing$#ree$&scaled%"et%%troke$$type$$wort##_at$$each#%adogo$#iri$#lha$"ng',
+    '$#sdi\'/panicheducation#%blade$#uck#%ceres$(zuk/race##der&#ing$$ust\'\'(-covered(,on-the-floor(\'scented)%trewn##ful#$hney',
+    '#!k#$logs#!m$&illing#\'n-faced%#out%"up$$wood##ori#!r$"ij%$ters#%telle$!h$$sila',
+    '\'*thamesdown\')wiltshire"\'xafraga\'"zz$%tilis$"ul#"e-%)altenburg%/coburg-saalfeld%%gotha$$d-up$"ne##ida$%toxin#,on-dominated',
+    '%#dum%/e-to-selfridges%%house%#ica&!s%"um$$phon((e/vocals)"s.("ic)#sed#&thorpe$)on/father"\'y&mdash)$;but',
+    '*#nor*&seeing*\'whether#!\'$"st#&-about%!s$&foring$#ing$.understandable#!.$!j$$what#$/are$\'feel/or',
+    '$"u/#%a\'gyi$#ble$!g$!h$"ng#$chel#"de##eef$"gh$!n%#gis$"so$"th%"te',
+    ')-e-other-thing&)/implying&"_a(!s##lac%"ni$"ex#!n$--wittgenstein$!g#\'s&mdash*$;she$"\'i$!-%$none',
+    '$\'/report$$:she%#yes$\'omphone$#the##the#-whenpleasesir$"un#!y$"af"&zabiss$$lapa$!n#,eman-e-ettle#"li',
+    '#$onov##tec!,b&ndash;307b"$-301#&series"$1000#"24$!5"!2##156$&74-et1##201##c-5"#301$!5',
+    '"#502""90"\'aat/hms""bc"%c1000#"dc""gp#!r"#ili"!j#2(pmmlib.gimmsjob1)"%lim-2""ml"&ordini%#oni',
+    '"!p"!t"&urelin#\'s-based$%/mbus!,c&eacute;nes#)ndash;54d""*m"\'-scared#$u-pa"#.12#!2#!3#!5#!7',
+    '#!d""/s"(4d4e095h&/133&lsqb;h&rsqb"+5-practical""60""71#!4#!6"#a-1#$achi#&b-free%%prone%(rar-toom$%biest',
+    '%)y-looking$"ei%#tic$#ied%"ni%)osa/nigra$$land(!s$%ratum%)otrigonia&&usness#&ccario("um%"ia$%horum',
+    '$#ron$)ukm478275#)ffold-web(-ing-supported%!y$\'tafjell#!g#"il%#ing%&lierez$\'tcliffe#)lacronica%%mbria)!n%$tion',
+    '$\'d-crows%#ava$(e-backed&\'changes&\'derived\'\'rumming&(giveaway&"in()dependent&$less\'&ogging&%model&$pans&\'related&$work',
+    '%&/chord&$size%#ber%+d&rehy;down&!-\'$back%$like%"rs%%sburn&%ceugh&#man%!y$!i%$aris%$geri',
+    '%$ness&)g-ladders(%ropes\'!c\'!s$$lini&#ons%(op-shape*#ell\'(ed-edged\'#ing\'"s.%&ydelic&\'waggery)!s',
+    '$(p-hunter%\'el-like(%probe(%sharp\'"ed\'$ling$%theen%#sas$$well$!z#"m\'$#ell$#med&#lls$#num',
+    '%%erin\'%#ish%!y$$ster#)n-endscan%\'general%#one&%ptics$$adal%#rio$$brit$*dal-a-week((battered)&ruised(&monger',
+    '()provoking(\'ravaged)%ocked(%sheet-!s)%trewn\'\'.social\'$izes\'\'konzert\'&ometer("so(+us-sounding\'"um%$ello%#ian',
+    '&&navia.+\'n-bound-\'derived-%irish\'$vian&%vians%#les%"za$!e$"ie%"on$!n%%ed-in&!t%(ing-type',
+    '$"s1%$cape%%ional$#ted&"st%#ies(!t&"ng%$ling%(y-haired&$clad$%workx#%pania%!s$"ed',
+    '%"ra%!s$&handre%%iopus&#tes&"um%#oid&#nyx&$poda$#ing$"pa&%ticci%"ed$%ulars(!y',
+    '\'(coracoid$$yard#&r-city&&rossed%$face$(abae-old($idae&"ee%$nish$$boro()ugh-based$+ce-currency\'+perceptible&#lla\'%y-lit',
+    '&$ness$$droy%"us$(e-a-thon&\'stories*!y%!a%,crow-targets+#hin%\'d-faced\'"he&&y-cats%$fair%&monger%$ways',
+    '&&waving\'&earing%$aced%#ing%!o%#ton$)gill-type($/num(!s$$hill$)ification*"or\'#ers%$lode%$ston',
+    '\'$tian%!e&-/microsurgery&+t-and-white(\'crimson(&lipped(&rimmed\'(t/thames%#ino%"ot$&ometer$#pas%$etta%$lets%#oni',
+    '%"ib&%ngton$$tata$"um$#vee&\'s&ndash#!s#)t-singing$%chard$"ha$!i%"ng$&omanic$"ra$#sta',
+    '&.r&lsqb;ed&rsqb\'(-beading)&rained(&effect(&graphs(%hoard($shot\')ed/broken\'$gram*#phs("un\'$shot%%iness\'!g%.y-but-obedient',
+    '#&vaging$2enger-cum-predator)*/predatory)!y$!i%#zzi$#one$,surplus-high$#ved%#ing%$ying#$wdel$!n#\'zebrick""ca',
+    '#!a"%eanes$#rce$!t%!s#\'leratus$)idosaurus$$lery#"me#&narist$"ce$$dere$/e&rehy;painting%\'-change,!s',
+    '&\'painter&&setter\'$hift\'\'tealers)$eped%".a&"it%$ries&*y-watchers\'!.$#ica\'!l(+ly-stunning$(ographic$\'t-laden',
+    '&)sensitive\')ignalling&%trail%\'ed-leaf&!r%%maker%!y#$olon$"nd#&ptered\'!s%%ical.\'$ism.%"os%#rum',
+    '"+fv-momlvenv",h&auml;ferin)(ufelchen$(ouml;ler)#nau*%bergs+#run*\'eberger*&hausen+#eit*+lein-henoch*%zeler)$rner*#pff)$ttli',
+    '*#zen##.ii#&20,200#+300,000,000$&60,000#%4,000#\'537,000#\'600,000$%2,000$%3,000%%6,000#!a$"al$&bowski$$chen',
+    '&%woche%!k&!e%#ter$%ecken%"rf$(fer/aero%$fers&#ler&#ter%"ik$#gen$"ie$!k$$lfer',
+    '%-k-golodkowski&$wijk%"le\'\'r-style(\'/grover(!i&\'platten$&ndoney$\'parenko%#era\',stra&szlig;e$"ra&$nsky%"dt%(frichter',
+    '%"pf%*ringhausen%&tzmann%%wenka%(zenegger$&siepen$"tt%#zis&"ki$%ubach%&droeck%"en&%rmann%&felein%%lsohn',
+    '&&ainkai&$berg%!p%\'spieler$&verien#(eankdong$%chter$$ddle%"el%$ular\')e-maximum(+d-passenger(#s.3)&/lists$$elea',
+    '$"id&#der&%egger\'!n%\'lenberg%&ne.get\'"rs&&heilig&#man%$ring%"ss\'$kerl\')mitlister&$ters$#lde',
+    '%"ff&$hout%)lenberger($gerg&#ino%$oske%$tema&"ma%#vis$(ma-based(\'reaking\'+consistency\',inconsistent\')unrelated&(tic-ally',
+    '(&zation)!e*!s)#ing%"e*&*-by-scheme\'\'housing\'"ii\'&making\'$tops&/.coincidentally\'!e&!/&#ing&"s/',
+    '%%ichal%(pp-hirth$\'nemayer%!g%\'k/world&!e\'\'nberger&#weg$*per-hughes%%herde%"ke%#per$\'rbachev&#ius&!o',
+    '%#mer("-1%$nito&&thaner%"tz%\'zingefl&&o-like$$uble%"er\'%ecker%"le&&inghof%"tz$&vengin#%field',
+    '#*iantarelli%#vio&#ona$$bler$\'ckedanz\'\'lgruber\'%nader&\'lgruber&"or&#sal)!e)%sjahr$&digera$$edam&#egg',
+    '&!f\'#lin%!l&$icke%%rbeek%(ssbefehl&#tel$+ffbauerdamm&$chen&$eres&"ko&#man&#rin%!o$1kaneder&rehy;from',
+    '%$acci)%-like%(de-boeck\'&rgasse&$kamp%%flied%)ldersdorf&+er/woodhill(%stein%"pp%)thornbahn&#ron%!y$&mansky&$tari',
+    '%#one%%panse&"er$$ndel%"ke%"us%%znach$\'reslair%$lcar%!m&%acher%%rmann$$sbye%#med%&t-like',
+    '$$tebi$\'zanthus&$ster%+o-affective\'\'bonkers\'%logic\'%world&&idness&%neura&\'petalus\'0hrenic&rehy;like&!s#-jelderup-ebbe#0l&uuml;ter/webra$\'achthof',
+    '&"en&%wagen%#ger\'#ter%$kali%+ngenfresser%*raffenland$$echt("er)!s%(gelmilch%\'ichkorn&#den(!r&&ssheim',
+    '%+m&uuml;ller&!a&#iel&)mer/rover%!p&$ping%)rotherapy%%sswig$#ich&*k-directed%,e&szlig;lich&+mann-hoffer%\'tz-cans$)ock-shops\'&buster',
+    '\'\'meister\'!y%%etter%$omph%$sses\'&garten\'!i%"te&#ter$%ubach%#mpf%!p%$snus&#sel%"up',
+    '%+dribachfall%\'lenbach&#tz.(#ing%"us$%ecker%$icel&$dler&"ss%&ndrick%%rikon&$ling$&ichael%)dt-agence(&garden',
+    '\'./choreographer($usaf\'&hammer\'!s%$eder%#led%"nk%#sch%\'tt-like((rottluff&#zer$"oe%"ke%"ll&#sin',
+    '&\'zerland)!s\'#ing%$ranz$-uckst&uuml;ck%"el%!r%,tzst&uuml;ck#&nabels%"ke%"pf&)ps-crazed%"th%%ubelt&$zers',
+    '%*ckenburger%!e&"de&)fernehaus&#man)!n%*ider-lenne))/vicarios)#han%#ken%#lle(!r\'#ing$%ieder%#rch',
+    '\'*lauchsause&,zel-holstein$&orbitz&#kel)!s%$zzle$&uffler%+tgen-museum#%obert%%inger$#dek&$rbek$%effer%%lcher&$kopf',
+    '%,nberg-reared&&felder&(holtzeri&(oplectus&%stadt%#ppe$,field-ellery$$inos$1lar-administrator(&bishop("cd($gent,%leman(*librarians(-preacher-bard',
+    '()reviewers(\'soldier)\'tudents\'\'/dealer\'%check\'*ly-looking\')ship-girl&%stica+*lly-minded)#kia%!e&%y/nra%$iast&"on&"um',
+    '&"er&&hammer&%meyer%&master%!s%#tes$$nach%&burger%%eberg&&nbourg&!r%&field\'&$lies%%gauer%&hauser',
+    '$"o\'%$gled%\'l&mdash,$;see.!o-(teachers\'-rehy;children,&master,\'teacher&!\'&+-and-garage\'&boards)"ok\'&chapel()ontrolled',
+    '\'#day(\'istrict(&odging\'$fees)$llow\')generated\'&higher(&oliday)"me\'\'imposed((nspector($ssue\'$jazz\'#lea\')mastering',
+    '+!s((istressy\'&of-max*-sadlers-wells($wner\'(practice)%efect\'&report($ooms("un\'*sanatorium(\'tarting\'*teacherish(&rained\'(uniforms',
+    '\')meanwhile\'&pupils&#/at((uthority\'+college/any/"in/(training/$work)\'mmunity()urriculum\'$home\'/local-authority\'%staff\'#the\'*university',
+    '&\'boy-ish\'$uses&$card("se\',hild-fashion+"en("um\'$roft&!d\'#aze&#ese\'!y&&fields&%girl\'*%-like',
+    '*!.*%ishly\'$oers&$hill&"in&%ma\'ms(+rm-sounding(+ster-priest,-s&ndash;union-&-union,!y\')istressly.!y&$pals&.s&mdash;sewell',
+    '($club\'".7($this\'!/((churches)+olts/u-21/b(+departments(#lea\'$will&$time\'#ype&%which%!m%&nmaker(!n',
+    '&"ol%!s$"pe&,nhauerianism$"ri%!k%!m%!n%#ter&"ly$$tten(&kirche\'!r&%ische&"le',
+    '$%ukerk%#ler%-wen-duiveland#(penhauer#!r$)&auml;der%0ouml;dinger-like$%aagen%"ck%(der-type%$meck$.eckensregiment\'$lich+!e%%ibers',
+    '%#ker$)iecklicke&!r%#mpf$#ock%$edel%%sbree$#und$#yer%#ver#!s#$tonk$$reet$#umm#%ubart',
+    '(&/liszt$+ck/manfroni&#man&#sen$"di&)-kirckman$$ette(!a&"ze$%ffels$\'hmacher%\'platter$#kin$#lde%"en',
+    '&(rstrasse%%gasse%$kins%+ler/germany\'!s%$mann%\'ordnung%&singer%(te-sasse\'!r&$heis&&z-keil%\'z-evler&\'endorff$*ma-brigade',
+    '&*n-european\'&nesque%#man$&ndlers%%emann%!k%#ner$#pke%#pan&"en\'#xin$#rer%$icht%"tz$"ss',
+    '$!t%,terlin/white&$wolf%)zengarten&#ian&$mann$#yff%%lkill#(vanevelt%$rtze#7w&auml;bisch-gm&uuml;nd2#und/!e%\'ouml;re$%abian',
+    '%$dron&&schild%%etzer%)fenberger%!k&!e%)lb&eacute\'!e&\'nthaler%!n&$heim&&tz/rgv%%rlose&)tzenegger*%neger',
+    '(!i($kopf($mann&%zbier(+urg-gunther\'\'enbergs)#dom)$eger+!g,#ers)%neger.!s\'%ieger\')kopf/gulf\'%markt',
+    '\'$wald%$untz$/egmann-fielding%$iger\'$same&(n-lowitz\'\'ebraden\'%furth\'$hund\'#itz&%sguth&(zerische.!r%#ldt%#ndi',
+    '&&ninger%#rdt&#ing&!t\'#sik&$zina%\'tzingen$\'ierzina%\'mmwagen%"ng\'!e\'$moor%+tzerdeutsch#%ylake$"ms',
+    '%%ynges"\'i-based$$cert$#med#\'1lonian#"43#.acchetr&agrave&#one%!o$)f/justice&%oxfam$%machy$"ra$$scia#$d-hu',
+    '\'\'-course()education()fictional/$like)\'or-arts(#his))umanities((literate(*orientated."ed(*reasonably*&search(&social)\'pecific(,versus-faith',
+    '\'!.\'!/()cognitive**nstruction()economics(\'fantasy(*humanities(%media((pharmacy()sociology\'\'fiction.#ish\'&s-even)(national(\'/hiking',
+    ')&social%!t&!e&,ific-atlanta+*industrial-(strument+\'kendall+*management+(rational*!.*!/+\'medical+(rational*&a-cook+)/anistica',
+    ',.ly&rehy;minded.,-constructed2\'trolled/\'derived1&signed1(termined/+established/&minded/\'skilled*(o-social*!s)$ques\'*st-scholar+&oldier)%/bays',
+    '*/horticulturists*$nrpb)"s.**/engineers+(industry)!t$!x#$lian$&loides$"on#*mitar-like("ed##nde$$teia%&igraph',
+    ')#ted+!s*%ingly*"or(!o&(scanning*!s%!o#%olism$"to#\'p/oct-6$#ina%$onis$!o$"pa',
+    '$"et$!i$)pus-erica#&sasors$%kalsi$!p$$sars%\'or-beam(-cut-sun-dried+$ting(+kick/volley,"ed($lady)%egged(#man',
+    '(&phobic(&shaped)#nip($type(\'wielder\'+s-and-paste))over-comb(\'/shears\'%tails\'!y$"ti#!t#\'ullo_et$#rus#%vetti',
+    '##eme"#lar$\'serplus$!t$#vos#%eater$"ra%%isong%(odactyly&%pages&%thapy)$rapy(&eraphy*"py\'&inised',
+    '##uff""n.#%eider#!s$!e"\'o-based$&novell$#run$%xenix#$/ixi#$bbie$$ie\'s#!f$$fern%$ield',
+    '$$orum#$glio#$iety$#nes#%laire%%resco&$ship$+ds_by_means$"er%"si$%field$!i%$thes$$lett&!y',
+    '$$nick$!o%&paceus($idae,!.\'!x&\'endrium$$paig$"ty#/m&lsqb;bri&rsqb$!s#!n$(ags/soor$*ce-torches$#ded',
+    '%"s.&%/sour$#nes#$ober$#nes%"ie$,p-and-shower&$type%!.%!e&&d-neck\'+/sidefooted&$r-up\'!s%#fu\'',
+    '$-r-nan-gillean$"sh&#ing$$tled#(palamine%"re&"ia\'"us$"e.%*/voltmeter%!x$$ings$\'ophilia##rah%"te',
+    '\'\'squeals\'%trail&*ed-looking&:ing/melting/discolouration&!t$$e(s)%&-based\'$oard("ok&%cards&%draws&&fixing\'"or&\'keepers*#ing',
+    '&&making&(settling%"=3%"by%&charts%"d.%!l%*r/hercules&"es%*s.received&%/goes&"by&%heets%!y$$ggie',
+    '%,ng/defensive\'!1$#ner%&fully.$(pacciata%-ion-speakered)&tailed(!.($fish("is%!s$$riae$&sching$$teus#&t-tish',
+    '$#bac&"ld%"ic$,catagreement\'!s%#ell&#rts%6h&rehy;and-apollinaris&--on-the-rocks\'%taped&%brite&"er($gill&%grain\'$uard',
+    '$$ford$%halls%#ern%"ia$&iabank&!e&&mcleod%"sh&!t$#lan\')d-england*)specially)%first)\'ireland)%wales',
+    '*&lasgow)*manchester)%wales(!e(&france(!s$%media$#nat%!i$#oma%%phile\'%obin\'%.ru&lsqb;m&rsqb\'!m$*s-american',
+    '&\'italian&*registered&(speaking%(/english&$high%(tounhill$"t\'%!-&$adie&&bowden\'$rown&&cowper\'\'rickett&\'farnell&$gall',
+    '&%heron\'&opkins-)/hereford($ward&%jones&$like&&malden((rkovitch($sson&&ordish&\'trained&&watson\'#exo%,/cirencester&.ecclesiastical',
+    '&-g&eacute;rard\'&lasgow&2neuro-psychologist(!w&%owner\'%xford&$pcas\'$eace&%rspca&\'swindon&*television&%world%!a&"ge&!s',
+    '()-accented*)ustralian)(baronial)&caught*&hinese))directors)\'english)-headquartered))icelandic*\'nterest)#jew)\'looking)%power*\'roduced)*registered',
+    '()/american)(canadian**ontinental)&nordic($born(!e(#men%!o%"um&!s%%y-dog$.vec/management%$ille$$west$&yields',
+    '&!r$%r-out%!e%"st$\'se-hold&&person\'#ool&%rpool\'-s/arsenal/man$\'t-knife&&leader%$head%+ing/guiding%*mastership##wby',
+    '"&pdcihe#&etical"-ra&rehy;pheap$0-scra-scratching$,bble-letters\'$ings\'!y&!y%"en%*ster-based)*/stromness$"ce$$g\'em%#boy%$gily',
+    '%#hey%!s$$iked$)mble-able(!.(%d-egg(+r-telephone\'!y%$ming%#off$#nny$&p-body("ok*!s&$cart',
+    '.!s%\'e-marks\'\'tapered&%d-out&\'r-board&!y%+ie-affected&\'ng-back%#men%$page&"et&#ies)!t\'+ly-engraved\'$ness',
+    '%$s-we%$toft&"wo$"se$!t%*ch\'n\'sniff\'(-digging($free("in(%mixed+#ing(#off()resistant(%stock\'%built',
+    ')!s\')ing-posts*0/tearing/chewing\'-plate-mounted($roof\'*y&rehy;hum%#ted\'!r$!w%$king%$nier&\'y-faced(&necked#&eam-up&$iest',
+    '&!y%#ton$(e-filled&%slide(#ope&\'walking%)ch-guitar($owls(&turned(#ups(/whistle-screech\'"er%*d/concrete%$eeee(!k',
+    '&$-eye\'\'filling\'$like\'&prints\'$room\'&saving()hattering)"ot(#ide\'\'testing(&rading\'\'watcher&$.the&)/keyboard\'&screen',
+    '&\'diaries\'#ump&%ed-in&$face&$like&#map&%phone\'&rinted+!s&$safe&$work%(printing%#ver$%mosal$$tion',
+    '+)propelled%\'-barrel&#cut)$ting&$down&(fastened\'&itting(#xed&$jack*!s&$legs("ss\'#ock&&nailed&#off',
+    '&(threaded)$ough\'#ype&#ups&%worms%%balls%\'d-river&&river.%\'ed-down("in(&up-sex%%faces%$ing.%&s/bits&#men',
+    '%%worms%-youupalotodos#"fc#*iabinesque$"ba&%cious%$bens)\'/tenant&(led-over(5r-turned-screenwriter\'#in\')"g\'*!-\'!y%1e&rehy;evangelist',
+    '\'#tis%$ling$#cle$&mmaged%+shaw-framed$)niodinium$%pless%!s&!i%$t-\'i\'%based\'&edited+#ing\'\'in-hand\'(learning',
+    '\'\'writers&!.&#/vs&&hounds&,ible/lisible&"on\'!r(#ius&"s.&"um\'"ra)#lly($e\'=s))-readings%$ulum',
+    '$%vened\'(s/fitter&!r\'"le%#ner#!o$&bbling$!d$#fus$"gg$+ll-bordered\'\'moulded\'%waver(#ork&$able',
+    '&#ies&%oping$#ope%$ving$#pes%\'hularia$"ta%!i%"ty%,um-tightener\'!.\'!s$(ungerism$%vegni#!u',
+    '&$fowl&$jays&$land&#oak&&topped%%bable&&ed-elm%$fowl%%lands%$wood$%ff(y)&#bag&#dom&$ians\'*ly-dressed',
+    '&\'y-arsed(&haired(\'looking$-m&rehy;halves%&-halfs&(wheeling\'%orker%%halfs%%maged%#ple($d-up$*nch-drying\'(ed-dried(!r\'"ie',
+    '$*tinisation)#ed.(#zer%+on/disabled%$tons$$vial#!y$"ed%!r$"fa$#mby%0geour-wedderburn$$veyn"$sd-2#*e-approved',
+    '%+to-parallel$*/busmaster$(terminal#!s$!t"!t#&achard#&otland#!v"$u-pa#\'ba-dive*"rs\'%river$"ba$$ette',
+    '#6d&eacute;ry-influenced$(-induced%(missiles$%57n/a$/amore/assistant$$dies$+eria-italia&!y$!i$!o#(ff-marks%&ing-up%&lessly#$leni$"ks',
+    '%(ery-maid((/kitchen$+p&rehy;ture%#sit%.tor-gunstocker))stuccoist(,/model-maker("is&2ural/architectural(.e/installation)*s/drawings$$ting#"m\'$(-bashing&"oy',
+    '%\'hunting%%spurs%%thief$%.that$-/hammers/arse%)liverpool$%bergh$#day$#kid$%lover$&maging%$iest$(stoppers#!n$"ny',
+    '$!i#"re$"fe$&illous$\'rilitie%#ula$!s$(vy-grass&\'/durfey#&tcheon$%ellum$%horpe$$ifer$!s$\'terings',
+    '%\'le-free\'#but\'#wig$#ums#"zz%&-noise%"bo%"ie\'!s(!t""vo"+warzenneger#&eaming$(iglerand"!y',
+    '#*phomedusae$!t#"re#$thae%\'e-blade\'%stone\'&toting\'(wielding&&making&&smiths%(lecester%!s!2d&mdash;democratic)&social""-1',
+    '#"20#"30#"40#*scicon/gfi$(uperdown"//ds&mdash;swiss"!2"!9""=2$".5##3.6##4.4"-a&mdash;party#"ys"!b',
+    '##051"%e1000#$3000#!c#!t#!x""f2""i\'#%llik."!j#!r"\'lp-sinn$+/republican"/p&mdash;serbian#$-fdp',
+    '#$/sld#2101015.515.224,454#!s"&r&lt;t#%1,114%#224%#500%%828.6$)0,160,000&\'570,000%)9,300,000$"12&(,000,000%)4,000,000$*22,400,000',
+    '$!4%(,120,000&\'650,000%!4%#7.5$)5,200,000&\'360,000$)6,600,000%)2,600,000$0=&dollar;1.275490$88780$9496%1us&dollar;1.248902$57832$7549',
+    '1%300603#7582$21823#7572$46672$54762"651"43#-2,149,250,000$*07,900,000$)1,000,000&\'280,000$)2,635,000\'&80,000$*31,700,000',
+    '&\'400,000$%5,603$)6,110,000&\'400,000$)7,400,000%!9$*86,300,000#)3,020,000%%263.4%\'420,000%#703$"00$*14,040,000$)2,600,000$)3,570,000',
+    '$*43,800,000$)5,000,000&\'560,000$)7,200,000&#622$)9,240,000&\'700,000#*40,900,000$)1,500,000$)2,300,000&\'500,000&\'700,000&\'800,000$)4,840,000%!2',
+    '$)6,080,000%)6,200,000$)9,420,000&\'500,000#%5,600\'!8%\'860,000$)3,900,000#*61,000,000%#9.5$*60,600,000#)7,550,000$"19$)4,700,000$)5,000,000',
+    '&\'900,000$"80#)8,500,000%\'790,000$)1,500,000$)2,000,000$)3,530,000%)6,900,000$)5,400,000$)6,000,000$)7,600,000$)8,300,000$#9.9\'!9#!9',
+    '$)8,100,000#!g#.p&mdash;social#"rs#0s--approximately"#s-1%"0%$#gel#//polyacrylamide""vp"!w!+e&ndash;brd"\'\'nnight"!-#"5a',
+    '##fhe$\'inanced##hun#(malaysia#&queira#&si-lis#!z"!.#"5s"#100#!3#!9"&343197"&425264"#5as',
+    '"+a&rehy;mews)$pink)$ward*$eeds#\'-anchor&(d-island()sun-proof%$ster$%barge&%ttles%$east&"ds%#oot&#und%%ridge',
+    '&#nks$\'campion&&noeing&$rved&!t\'#tle%$hart%#ity%%liffs%#oal\'#sts&"ck&&loured&!t&!w',
+    '$&divers\'#ing%$oors%&rizzle&#ops%$ucks%\'wellers$(eclogues%&stuary$\'fairies(!y%$ight&$lled&\'shermen%#lat',
+    '&#esh&$oors%"og&#rce%&reedom&%onted$$goat&%ddess\'!s%&rasses\'#vel&%eener%#ull$%hence%$ooks',
+    '$\'journey+#ing%#unk$$kale&#yak)#ing%)indliness)!y$&lawyer%\'eopards&%ttuce%$ight&"ly&#nes%#ore',
+    '&#rsh)"al+!s%%etals%$iles%&orning$%novel%$ymph$)obsession%,f-components\'%gates\'#ice&%ficer$\'passage%"ea',
+    '%#oem&"rt%"ro\'"of%\'urslane$\'raiders&!t%(eflected%#oad&#bin&"ck$%salts%$cape&&orpion%%earch',
+    '%$ized%%kills\'%mming%#lug%$moke%$nake%(omething&!n%&prayed%%tacks%"un%\'wimmers$&tangle%$erms%&histle',
+    '\'\'eatened%#ide%%o-sea&!n&$ssed&%wards%\'raining%#ype$$view(!s%%oyage$$waif&%rfare&#tch&"ve',
+    '%%olves%&rought$&zenith#*.absorbing$$king$$mike$$when\'$ther#(/harbour$$land$&palace$$town#(accounts#!b$#eds',
+    '$$lite$$oats%"rd&!g&$ough$%reeze#(c-funded$#at.&!s%$ucus$!h%%ester$$liff(!s$#ole',
+    '##den$"oc$%ragon$$ucks%"sk##far$#ire$#olk%,od-gathering$%ront.(!s&"st$$urls#%gates$$eant',
+    '$%raves%"im%$oatt$$uard%(ll-white##ing#+l-engraving%\'fishery%#gut%\'hunters%$like%&makers%+of-approval&"il%\'profile',
+    '$+/consultant$&anders&"es%%sdair$)e/elliott&\'picture%%d-bid\'$down\'+in-cosiness\'$type%)y/robbery$$fast$#ine&%g-off&+k-sponsored',
+    '$#ord&!e$&sworth$"th#&m-like%\'picking%\'to-seam%"up%&welded$\'an-like%#rks%!s%$ture$#en\'%!o',
+    '%"th&#rix$%line.$&onster$$wise#(nachaidh$"in#"on#%pinks$$lant&#que%#ece#"ql#&rancke$"bh',
+    '%(y/parent\'&trader$%caigh%*h-and-lock\'&lights\'\'parties\')theoretic&%.1536&(/replace\'5selection/advertising&2ers/intermediaries\'+s&mdash;the(!.&$ing-*%image',
+    '&(lighting&&server%$jomg$!e$$gent$$ider%*ngly-acted$!l%1e/gloucestershire&#sja$!o%\'-bendum&-cr&aelig;ftig&#net\'*i&thorn;as',
+    '%$utes$\'s-owned$!u%--&thorn;ancum&%gimma$$wade#(s-mostly$!.$$alt.%!n%!t$.cape/symphonic%#ene\'#ted$"er',
+    '$#lug$(on-about()nd-a-half\'$just\'\'openers&!.\'$head\'$over&$ably&$less$#son$"un#\'t-after&#rms%%backs',
+    '&#eds%)furniture%&height&&olders%(jointing%$load%&number%,of-the-pants&3n-a-thousand-boards%)selection%&warmer+!s$%.then$\'/flight%\'harness',
+    '$%allan$%belt.$&covers$!e%\'chnical%-d-convictions&!.%!s%$ttes$!h%!e$(ing-plan$&o-type%$nian%"un',
+    '$"s.%$/3.5&,kissing/from%$:203%*percentage$(tle-born(&tacoma)#ype\'$fish#&vegate#+ward-facing\'%/area%-ter/rainwater$+eed-fringed($like',
+    '%"st$#ise$$oman#%xbald$!e#"ya"(bagerika$$ldus$$stia(&n-like)+i/co-driver(+o-de-arruda&\'omaniac\'!s##bon',
+    '#!c#"eb$#nik#"ha$!i#!i$!l%!s#"on%!d##rea#!s##urt"$c.47$"cm',
+    '$!l%!s$!n%"os%"ts$$rate$$tion$$ucus$!y#"ca%"de$%iones$&o-type$!y##hat',
+    '$#ter$%ziger#"il$!m#"ka$\'burgers$#els%(rterries$$ford$&ington$#low#$lusa&\'ionists\'"ve)$ness',
+    '#"o\'$"dn$"lo$!n%%-half%\'d&mdash\'+ndash;class\'*rehy;class,%floor,$hard&%-\'the\'*and-a-half(2ssistant-directors\'$ball+"ot',
+    '\'#car)&tegory(%omers)$usin("ut\'#day\'&eldest\'(features(%iddle)!x(#orm)$urth\'$gear)1neration-in-power(%rowth',
+    '\'*handedness+!s(\'eaviest\'#in-*(commands**department*$line*)the-field("ts\'(language(&ongest.(-running/\'serving)$west\'%match',
+    '(\'ortgage)"st\'&oldest(!r\'$page)#rty((referred)&iority\'\'quality\'&ranker(%owers(#ung\'&safest(\'hortest($ight',
+    '(#kin((trongest(&ubject\'$test($hird)%ought(*ime-around(!o)%-last)"ur((rimester)!y\'$unit\'$vote&+.generation',
+    '(!s\'"to&(/foreign&!2&#_in&$aire*!s\'"nd\'%ries.)$ness(-y&rehy;school)!-*$aged*&feeder*-institutional',
+    '*&market+,odern-school)!/*&double*-institutional*-junior/infant*(tertiary\'"ty&%class&,ed-according(!.\'!s&%order&$rank(&teness',
+    '%!f%"nd$!r#!r$*&eacute;te&(grave;te$%eatry%$cies&*y-shrouded\'!.%"st&!y%$t\'st&&-laden\'&police',
+    '&,/clandestine&.agogue-induced)#lgs\'$ires\'!r($iado*0l/administrative,(keyboard,+office-type*"t\'+(/brokers)#ers*)s-adjunct(,y&mdash;this)!-',
+    '*+before-last+&rother*)companion+Cum-telephonist-cum-general-dogsbody*.general:willem*)librarian*+managership*"pa*,receptionist)!.))/director*%first*\'general+.loucestershire*"to',
+    '2"rs)#ing)%ship.-!s)!w&"er&"is&)ly-filmed&!o\'!r("ie&"s.&"ts$$ists#"t-',
+    '$+arian-based*.cum-geographic)%ising+"m\'&!y$$eurs$!i%4on&mdash;restricting()rehy;said\'+-by-section("cc(\'hunting((strength\'$.his\'%/work',
+    '\')alisation+0es/parochialises$,or&mdash;the&!\'&*-by-sector\'(employed\'$from\'+gender-time\'*households\'#one(\'riented\'(scanning\'#the\'%units\'$wide',
+    '\'&likely&!/\'\'finance\'%group&-al/industrial("ly&#ial\'"ze)!d&"s.(#the&"ul%!s##ual$$irty',
+    '\'1/humanist/marxist()religious(&sacred\'#ise)#ing)9m/consumerism/materialism("ze\'!s$&ndario&!e\'$rdad$&re-and\'$line&"d.&&max/ux',
+    '%#ist&#tag\'!e\'.ies-settlement+\'trading(\'sations\'+y&mdash;key),rehy;related("**(!-)%based)%check*$oded*)um-fairly)\'dealing',
+    '*%tched)$firm*$orce*%unded)-on-all-fronts*\'riented))patrolled)(relevant)\'scanner*(ensitive+%rvice*$quad)$wise(!.)!d',
+    ')\'foreign)*insurgency+*telligence)1messengers/typing*.ultiprocessing)(national))portering)(reducing%!o&%cracy)"ts$"te%"or#&xtions#"ys',
+    '##.in#)an-chairs$.tion/analgesia&*ve-induced##ber&.gh&mdash;hawes$#ury%"sk##den$#igh%%ngton$+on-atkinson$\'ulbahir#"en$"re',
+    '%"on#*ge-covered&%grass&\'warbler%*field-born&#ord%#man$%field$#man%#oor$)wick/dean%#ood#&iation$)civalvole$*ment-based',
+    '),decompaction*(ispersal)\'starved))transport)%water()/basement)&mantle)$soil(%ating(*ologically$!s$\'tionist(!s#%jadeh$$nane',
+    '%!n$-eigh-denfield%"y.$$mayr#!o$"go$!l$$oced#!u$,ction-packed),.permanently$$lous#$will"\'e&mdash)$;the',
+    '$,rehy;through#$(19)#6-all-hear-all-say-nowt%*nd-be-seen$.before-you-buy$#ers$)read-hear$(saw-like$(the-new-&$ough&&roughs\'!u$%wreck$.you-later-dear$#zee',
+    '#*/feel/hear$$meet$6touch/smell/experience##7.4##_as%!t$"in#!b$$ruck#!c$!h$%oomar#)d-bearers)#ing%\'capsule',
+    '&"om\'"re&\'rushing\'%ystal%)dispersal&$rill%%ferns%$leaf%(merchant&$ulch%\'packets&$earl*!s&#lot\'$umes',
+    '&(redators\'\'oducing%\'seeking%%years$!.$&/reach$%baits%#eds%"ox\'"es$$cake%%locks$$fern$$hill$#ley',
+    '$#man$&pearls$"s-%!.%&people$$time%#ray$*y-sounding#$eing#*felderjoch#(handlung%!s$$ofer%#tel#"ia',
+    '\'&lenses\'\'through&"ly$"sa#)k-meaning$&/avoid$!e%%r-out%"st%"th$!h$#in\'&%g-out\'%.this$"ly',
+    '$!e%)nprobleme$!i%%sches#,m&rehy;ingly$$anii%!r$!d$$ed_a(!s%"rs$,ing-innocent\'$less(*y-abstruse*&barren',
+    '*-imperturbable++nconsistent,\'nocuous*)unrelated\'!s$$lily&$ness$#ply$#s_a\'$_lot\'!s%$that$"to#"n\'%"em',
+    '%&it-all%"to$%.they$%/felt$"_a$"ey$!s#+p-seep-seep$$.124%"23$&apitso$%eople$$ings#$ress$%ingly',
+    '$%ucken#*s&mdash;to$"on#\'t-cheng$&hingly%%rough##vli##war$\'oosagur#(x/master##yam##zer"$fa-p$#rad#\'credian',
+    '#$fray%"id#!i$#ned#"ra#!t$+on/modeller"-g&rehy;mented#*a/nintendo%&pontin$\'le-gale&!n$"mo$!n%$tini',
+    '%!s$#tis#%bwema#!e$%field$!i$$plan$#rma%$stad$%stans%*v&aacute;r$#tes%"um$!y#"gs',
+    '#$hill#+m&uuml;ller$.ent-by-segment(&leaved)\'ocating(*restricted(\'shedder\')/division\')al-arched*$type)#ism\'$ings\'"s.#$nere#!o',
+    ')!i$"le&"ne#)rave-daly$&egants\'.tion&mdash;you+!.+;/surveillance/normalization+"al+#ism+!s%&tation&!i$#ove$"ue',
+    '$"el%!s$\'ieriana%&miento%$temi$!m$!n$!y"&houlia$"za""i-$(sei-ying#$bert#!d$!h',
+    '%!e$#ner#)f-centred%(employed%%image$!s#(ge-style$"ne&$ural(#ies$!o##jin#&kanron$!i$!u',
+    '#(leasdair%!r$#hac$$lean#!m$!a$$itsu#*ne-sur-mer&%yonne%!d%+ld&iacute;n%!m%!s$!g#&r/edom',
+    '&!s$&pinski#!s$"ay$(enbacher$#has$)mic-event(*tomography\'/ally-identified%+o-tectonics&\'graphic&\'logists&&meters&&philes%!s',
+    '$#uns##tan$"en#"um#"wa#"yu#!z$!a$:e-hold-consolidate-develop%$d-on\'"up$+i&eacute;me\'(grave;me$!o$(ure-like',
+    '#"do#\'m&lt;ro$*-appointed##ong$#urs"$kand%#ina$#ten##ber#\'eramayi%"is%$tary#+hukhuneland#%imoto#"ka',
+    '#$ondi#%shual$#ler#!u$"nd"%l1000#$a\'an$\'ginella$"mi$\'sphorus%"se$#tan#$berg&%halfe&!t',
+    '$.st&auml;ndiger&+bewusstsein&*verwaltung$\'y-bigge\'%rigge%(/fashion#%ction$"uk#"de$%inger$4om-at-home-secretary\'%found\')mentioned\'$told\'\'visited',
+    '&"ly#"ec%#cao&#ion%#t*e&+/from/where&6ed-issue&lsqb;3.3&rsqb.!s)#the*#win(&namely\'!r&$feed&+in-mediated(.g/reappraising',
+    ')*-committee*#out))/purchase).ist-neutralist\'+ve&mdash;it(#ism*"ts)$ties&*or-nudging)&switch(#ate+!s(!y&%ronic)!s',
+    '$\'khbayev%$leka$#mat$!n%\'aspidus%#gor%!i&!a&&cereus%,o-methionine."yl&$toca$#red%"ie$#ses',
+    '#\'f&mdash*#;at+(employed,&vident+,presentation+*sufficient+(teaching%.ndash;employed+\'imposed+)selecting%$rehy));absorbed/%ption+(ddressed,*ministered',
+    '+-ggrandizement+(ppointed+&ssured*\'centred+(onfessed.%ident-+gratulatory-(tainment.*radictions/"ol*)defeating-%ining,)precatory,&signed-\'troying',
+    '+\'ivision*&esteem+)valuation+(xecuting*,flagellation+,orgetfulness*)generated+%iving+)overnment+%rowth*(interest*.justifications4#ory*\'loading,%cking',
+    '*,organization+2ther/us&ndash;them**perception+)roclaimed*+questioning*+realisation,+crimination,(flection,(gulatory,)inforcing,$port-%roach,\'warding+(ighteous*$same',
+    '$"-a&)bnegating\'&solved)%rbing\'%usive&)ccounting(\'usatory*#ing\'*hievements\'*knowledged\'&quired\'$tive*#ity((ualising&&dapted',
+    '\'(dressing\'&equacy\'-ministrations)$rers\'\'ornment\'(vertised&-ffirmation_in&+ggrandising)%egate&"id&\'lerting\'&igning&)mputation\'$used&,naesthetised',
+    '*#tic\'&ointed\'%tigen,!s&*ppellation(%lause)$ying((ointment(&raised)(eciation)\'obation*$ving."ly&(rrogated&*spirations',
+    ')$rted)%ssors((ignation((ociation($umed*%ption)\'redness&(ttention&$udit&\'voiding(%wedly%&basted&$egot\'"lt\'(nefiting',
+    '&(lanching\'#ind\'*otting-out&&ooting&&uilder%+calibrating\'*ncellingly\'$ring(%riage\'(stration\'\'talysed(+egorisation-&zation&*elebration\'&nsored',
+    '(#tre+#dly*#ing\'(rtifying&/haracterization)$ging()stisement\')ronicling&%iting&-lassification\'%osing)#ure&&oached\'%cking\'#ded',
+    '\'(mforting()mendation+!t))iserative))unication(\'patible)\'ilation))lementary\'-n&rehy;tained(\'cealing,$ment*"it*,ptualization*"rn)&iously',
+    ',#ing((fessions)\'idently*\'guring.*$rmed(,gratulations(,sciousnesses)(ervation))olidating)(tituting*%raint+&uction)$umed+#ing+&mation',
+    '(+templations,%tuous*&ntment)$ract*&olling(\'version\'$oled\'%piers\'(ronation()ruptingly\'"up\'%vered&%risis(%tique\'%owned',
+    '%(damaging&\'eceived,!r(\'laiming(+onstructing)%rated\'(facement(%eated+%ingly)$nce\'*"se(&lating\')ification\'(legation(&ighted',
+    '\'$mand(&eaning\'%nials)"ed\'(portment\'(risively)&vation\')scriptive((ignation($pite(\'troying\'(tachment(&ecting)\'rminant-!e',
+    ',#ing&\'iagnose,&is.the(!l\'%gnity\'%pping\'&sabled(!c)%harge)(iplinary)$over-"ed)&retion)&ussion($dain',
+    '(*memberment)&issive((sociated*%lving)\'uasions(\'tortion)\'ributed*&ustful&(octoring\'%nated\'&ubting&)ramatizer\'&essing&"ug%(educator',
+    '&+masculation\'*ployedness(&owered&+nclosedness\')grossment\')hancement\'+lightenment\'\'riching&+quilibrated&&steem\'+#ing&)valuative&+xaminations+#ing\'\'cluding',
+    ')"se+!s\'*pectations)+rimentation()lanations)\'ication)&oiters*$rers(%osing\'+tinguishing(\'racting%\'feeding\'*licitation(&lating&#ill',
+    '-$ting(%ttery\'!y&$ocus*"ed\'\'rgetful+$ting(&mative)#ing&\'riefing&*ulfillment%$gift&)lorifying&&rading((vitation',
+    '\'"ip\'#own)"th&&uiding("lt%%help.&#ood($king&#urt&)ypnotized%%ideas(&ntical+%fying&\'gniting&+lluminating',
+    '&&maging\'(molating-#ons\'+personation()risonment)$oved,%ments($uted&.ncompatibility((riminate/#ory\'(dictment((uctances)\'lgently,"rs',
+    '(&ecting(&lating\'*gratiating\')scription(\'eminate.#ion($ight($tall,!s)&ituted)&ructor(\'ulating\'*terestedly/$ness*)pretation',
+    '()oxication\'&vented+#ory))stigation+%ments((olvement&%ronic*$zing\'(ritation&\'solated+#ing,"on%$kill&&notted(\'w-ledge',
+    '%(labelled\'\'udatory(#nch&$earn\')gislating&&igands)#ted(%hting\'(kenesses\'(mitation\')quidation\'!t&\'ocating(#ked\'#rds',
+    '&\'uminous\')xuriating%&maimed((ntainers\'$king\'*nipulation\'\'rtyrdom+#ing\'\'ssaging\'"te&)edicating\')thylation&#ind\'\'rroring\'*sdiagnosis',
+    '&%obile\'#del))rnization\'\'nitored\'+rtification&(utations((ilations,#ors&*ythography%*narcotised-#ing&\'eatened\'&gating(\'lectful&\'ominate',
+    '&)ullifying%&object+)ification,"ve&)ppression\'*timisation&\'rdained\'+ganisation\'\'(ientated&)verdosing&$wned)!r*$ship%\'pattern,"ed',
+    '\'+riodization(/petuat&rehy;ing.!e((spective(\'version&&itiful&&laying\'&easure\'(undering&\'oisoner\')llinating)%ution\'\'rtrayal,"ed\'%uring',
+    '(%pared(\'scribed)#ent*$rver\'#ide($ming\'\'ocesses)\'laiming(&ducing((fessedly)#ile(*liferation($mise)%oters(\'paganda',
+    '(\'tecting(&vision&*ublicising-"ts\'\'rifying($suit%,questionings\'(otations)#ing%&raised\'#ted&\'eacting+"ve(&lising\'$cord',
+    '(\'reation)*iminations)&uiting\'(ferenced-#ing,\'tialism0"ly*$rals((lections*%xions,&vities/"y\'((ormation(\'utation*#ing',
+    '((istering(.ulationconduct/#the,#ors\'*juvenating\')latedness)&xation\'(nouncing)&vating\'$pair((licators(1ort/victimization+#ing(\'ression)#oof',
+    '+!r+!s(\'trained-"ts*&iction\')velations,#ory)%rence(&iewing+!s)$sing(&ulsion\'&warded&\'idicule\'&ghting',
+    '%,salesmanship\'(tisfying&\'chooled\'$ored(&urging\'\'ripture()utinising&#eal\'&curity\'%eding)!s(#ker+!s\'\'lective(!f',
+    '($ling\'\'rvicing*#ngs\'$xing&\'hutting&%igned)(ificance\'(milarity\'\'phonage+#ing&(laughter."er&%owing(!s&\'pending',
+    '&&quared&\'tacking("rt*#er.*#ing(&tement\'#eer((rilising\')imulatory\'+rangulation(*engthening(&ipping(%oking&)ubsisting(\'version',
+    ')*icient.the\'&perior(&pliers\'*rveillance*!y\',stainability."le)&enance%(tailored\'\'keovers\'!n\'&unting&*erminating&(hwarting&$imed',
+    '\'*talization\'#uch*#ing&&rigger,!s&&uition\'$ning\'$rned\'%tored*#ial&,ypifications%)uglifying&+nconfidence\')dermining\'$ease',
+    '*$tion&*entilating\'\'rifying&(igilance%*warranting\'%shing&\'ounding&$rapt\'#ite%$xxxx$*.conscious."ly%\'denying%)financing%+sufficiency',
+    '$&/other$(:control%*fulfilling%*regulation$&=begot$*accusation%)dminister\'\'onition%-ggrandisement%)ssessment\'$ured$(builders$(carriage%&entred%(onfident',
+    '%)ritically$*dependence&+termination%,isparagement$*effacement%!s%)xpression$*government$$heal$%image%&nduced&&terest%(shnesses$-justification$(portrait',
+    '&\'garding&%spect%*ighteously$(standing\'$rter%)ufficient$\'tailing%$ests%"on$&willed#"ia$%gmann)!s$"ma%$garh',
+    '$%naish%#ger%$unt\'&"te#,ja&ccaron;ki##kin$#ups#,l&mdash;pity%\'rehy;by$!\'%"em$,-advancement%-determination%)out-tours%,preservation',
+    '%$true$,a/ex-refugee%&bility%"eg%-field/cumbria%(gs/dirty%$sand&$cene%$tory$"by$%enger&!s%+r&mdash;and&)-landlord&&/buyer',
+    '%%tbeck$!i%"ck\'0/chairman/parent%$ndge&(g-points)%rices("up\'!.\'!/\'!s%"on$\'o-taped%!i%"rs',
+    '$,s.concurrent$#tiz#-ma-montgomery%\'n/widow$!o##nau$"ec$$iker#-onamethionine$$tape#!s$#den%\'on-type$"et%(y-on-sea',
+    '#!t$"en$+zer/esquire#"ue#$vage%$tico$"in#)wyn-lloyd&(/veteran#"ye$)well-read"+m&ccaron;ic#"-5$&priest#$/edx',
+    '$%13255#"af$#ine$%nario%#der%!g%$tech&-ic-relational(*/cognitive(#ity$%swati$$tary%%ilide#!b$#ach',
+    '%$wang$#elo$$ilan$%lable)!s%&e-t-il$"ra&"re#%chard#"el$)n-stained%"ce%#off%$zato$!s',
+    '$&tipsum#.i&mdash;desert+%final%/rehy;adjustable+*utomatique.&nomous*,bureaucratic*)conquered*%final-%ished*+independent*\'natural*(precious,*oletarians*&raised',
+    '*)submerged*+translucent$*-absorbent(\'temious)\'raction&+cademicised\'(ceptable()identally&\'ffluent&+gricultural&(leatoric\')legorical\'(truistic&(mbulance&+naesthetise',
+    '&-pologetically+!y&&queous&"rc($haic))itectural\')istocracy\'(tificial&&siatic\'*trological&&theist\'&tached(\'ractive&#uto))biography',
+    ',"on)$nomy&#xes\'"is%(bachelor\'&ldness\'$rren&\'igamous&*lacked-out\'#ind&\'ohemian\'$nded&\'ridging\'$ogue&#ulk',
+    '\')reaucrats\'&siness%*cantilever\'&rnally\'&strato\'\'tatonic&)hekhovian\'$orus(#sen&(ivilised&#lad\'&erical\'$osed)#ure&\'oherent',
+    '-!d(%onies*!y\')mfortable($ical(\'mercial/"ly(%plete,#ion)%onent)&ulsory\'&ncrete(\'ducting,*or-crystal((finement',
+    '(&gealed((sciously)(ervative1"ly)%onant.!s)$tant*\'itution((tentment(&verted\'%untry\'$vert&\'riminal\'$ouch\'%ucial',
+    '\'\'rtained\')stom-made+#ers&(ycloidic%(decadent)!y*"ed(#ent(&iduous(+onstruction\'\'dicated\'"ep\'&finite(%lated\'&mented',
+    '(&ocracy\'\'stroyed\'\'tatched\'\'veloped&%iesel\'$gger($ital\'(plomatic\'%splay&\'omestic\'%rmant\'-uble-flowered+!s&$rive&#umb',
+    '%.ecclesiastical&*galitarian&&lastic\'&ective&\'mbalmed\'\'ergency\'&ployed&\'nclosed&%quity&%rotic&\'thereal&+vangelistic\'%ident&(xecutive\'\'istence',
+    '($osed\'&tended%&famous&&ederal\'$male\'\'rmented&&iction,&alised\'(guration\'"lm)%-star\'\'nals.up\'!t&#lat\')irtatious',
+    '\'%uency\'!y&(ortified\'\'ssorial&(ractured\'&iendly(#gid((volously\'$ozen&#ull\')nctioning%&gothic&#rey%\'hard-on)$core',
+    '&&oliday\'&rrible\'*usetrained&$uman*#ity*#oid\'"ts&)ypnotized%(idleness&)lliterate&(maginary\')mediately\')perialist&/ndependent-past))terminate',
+    '\'(ebriated-#ion\'&finite(%lated\'&nocent\'+stitutional(&ulator\'\'tensive)(rpreters\'\'visible&\'solated+#ion&%talio\'\'inerant%%joked',
+    '&\'udicial%&labour\'&ndlord&\'egality($ends\'$thal&(iberated\'&feless\'\'terally+$ture&$ocal\'!g((arithmic\'\'ng-term)(itudinal',
+    '&\'uxuries%\'magical\'(intained\'(ncunians()ufactured\'$rket\'$tter(#ure&+elodramatic*!y\'%ronym&+ilitaristic,!y\'$nims("or',
+    '\'&nsters\'(ratorium\'&torway%)nakedness\'&tional\'&utical&\'egative\'\'wspaper&\'omadism*!s%)objective&(cclusion&&pacity&&rdered\'\'ganized',
+    '%%pacca\'%laces(%mated\'#pal\'\'ragraph(%tisan*&tioned\'&storal\'$uses&#eat\'#nal($dant\'(rforated(\'missive(%sonal',
+    '&(luralism&&ointed\'\'lemical(%ished\'%pular\'&rtable\'\'sterior\'(wershift&*reparative\'(ofession((letarian(\'portion(!s)%trate&*sychedelic',
+    '&%urdah(#eed%&quango)&titabe-&tively%&radial\'$pide(!s\'!t&(ealistic*$ties\'&clined+#ing)$uses((ognition',
+    '((ormation+#ers\'#gal(%ulars\'&levant\'$mote\'(pression(\'ublican\'%sting\'$tire&\'igidity(%orous&#ock\'(manesque\'$tary',
+    '\'#yal&!s%"sa\'(cerdotal(#red\'$ilor\'"lt\'$vage&)cientific\'#ots\'%reech&(edentary\'"lf\'3mi-disfranchisement\'$nior',
+    '\'(paratist\'\'riously,$ness($vile*$tude\'!t(\'tlement&$hady(#ven+\'-headed\'\'eltered&)ightseers\'*tuationist&\'keletal&$lash',
+    '*"ry*!s\'"um&%ocial\'"ft\'(lidified&#pan(&rkling\'(ecialism\'\'herical\'"in\'$oken((ntaneous("of(%rting',
+    '(#ged)#ing(%ndard-$ised($rdom(#sis(#tic*&stical)%utory\'%eamed\'#iff("ll\'%opper\'&raight)%ngled',
+    '\'\'uctured\'&ylized&+ubmersibles\'&icidal\'"ng(#ken\'*rrealistic*(ptitious&(ymphonic\'(nthesise%$tale)$nted\'&rrasch&*errestrial\'(xturised',
+    '&*raditional($ined\'(oglodyte&#urn%+unconscious\'%dress,"ed\'%iform("ty&&topian%*vegetarian\'&rtical&&iscous&*oluntarily\'$wels',
+    '&"et&(hispered&%ooded\'%rking$(annually&#tic%&quatic$)barbarous%$reif$\'circle.%(lassical%(ollapsed&)ndominium(&ucters+#ive',
+    '.%trade-*/insulator\'&fluent\'&scious$$dark%\'erelict%%ivine%\'ominant$)empirical$%fasts%\'inalist\'%ished&#xed%%ormed*"=1',
+    '$)literates%"la$,metaphorical$1n&aacute&rcaron;e%&-aries%!a&#ked&%l-sac\'"ly&&r-room\'+/classrooms(\'meeting(3workshop/exhibition\'!a\'!i',
+    ')"ts\'"s/)+conferences)(training)3workshops/exchanges\')y-trained%$gton%"is%#oma$&oclasm&\'tagonal%&logist+!s$)paralysed(&metric',
+    '%&elites)"ic%$lina%\'recious\'(parative$*quantitive$(rechensk\'%lined&%gular&)straining%(iechinsk&$mide&"pe$%seria%!i',
+    '%)tarvation$!t%(echnical%.ically-derived%&onally$*voluminous$!x#$khoz#$lali$"ey$"in$.yen/co-founder#,mens/railway$"it$!y',
+    '$)lina-type$#nda%"in%!t$%thing#&pacher%\'rvirens$$erit&&virene$\'iternum$$leah%#ici$*r&oacute;n&(uacute;n$&stress',
+    '$!i#*tex-packed#$undo##yon"&n&rehy##(d)#$-off$\'related##afe$!i%)ll&eacute\'!e$&nayaka$$pati$#rio',
+    '$%te***&&/house%+us-consulte##bef##cer$%hagov$#ler#-d-and-receive%#ups$%/give%&stereo$#_at$%er(s)&)-receiver&*/addressee',
+    '&#ens&$ista%"st%"th$&ingoff%&vogius$$mail$"un#!e$$bron$2co/physiotherapist%"to&#ute$"dd%#iak',
+    '$.gal-mauritania\'*ese-backed\'#lus&%mbian$"ka$!n$#pol$\'scallus&$fial%!e%#ino$&tenced%$nced$!x#"ft',
+    '$"or$0staken-blakemore$"ul#&houses#\'ijextee$)le-decays$)or-junior\'\'manager(#ost\')secondary&\'/junior\'(national\')radcliffe&"es&+ity-related',
+    '%!e##jak$"in#$kaki$"en#(nacharib\'$erib%!n%!r%!s%"ya$"et$#ies%#ght$!o',
+    '##och$#nes$#ras#%pachi#\'saround%$ting\'*on-feeling*&loving*\'mongers*\'seeking)!.)\'alizing)"s.$\'e&mdash%!-',
+    '\'+ssaultingly\'(wakening&(contents&%datum\'&ulling&+experiences&%field&&groups&&making\'+odification&)of-wonder\'$rgan&+perceptions&(sections\'+laughtering',
+    '%".9&"of%//reason/emotion&"to%%_that%(d-worlds%!e%#lle%$s\'ud&(-reeling&!.&%cence$!i%,&rehy;tively%&bilite',
+    ')%sized%%melle\'$ntal%%ssent%%titre\'!v(,ely-restored(*ity-return,&tested-\'raining+,/sustainment\'$zers&"ve\'#ity$$kell',
+    '\'*controlled\'\'studded&!i\'"ly\'&neural&)y-assault(+deprivation(4emotional-disorderly\'&/motor%"ur$&ualism($ties&"ry%"el\'"le',
+    '%#ron#*t/received$\'ational$#ece%"nc\'.e&rehy;objects()-analogue),construction)(focussed*\'ragment1!s))initially)*production)&string(#.it',
+    '(!1(%_such($from(-s-in-contexts*+on-the-page*$with)".a(!t\'"ia&1tially-structured)!s("is%!r$+i&rehy;ment%#ero',
+    '))alisation,$zing%(nel-like("le*!d%"re$!o%$rian%"sa$#ron%$y-go&#man(#tic$"ul##ufo',
+    '#!z$#ala$&enjani"!o#!c$$iond#$dhna#"gi#&i-nage#"ki#!l##nid#(posongwe##ras#!s',
+    '$\'l-based&!o$"ng"*p&ndash;30##-11$#pak#+a&rehy;rate$"ng$,r&rehy;ately%$ably&#te\'((-bedroom(,/accumulated)!d(%d-out',
+    '))/divorced(*ly-charged+\'located+%wired(&nesses\'.ion-of-spheres*!.*;/purification/concentration(#sms))t-related&%zione%"ee%$rate#$ecat$*rate.staff',
+    '\'$ions#&hacryl%\'dex-g50%%rdism$"en$#ied%#rot#!i$\'a&mdash%!d$$oids$"um#%olcro#&p&auml$!e',
+    '#!r$#ate$"ut#"su#*t&ndash;23+!4$"-8$#.10&!1&!5&!6&!7&!8%"25%!8',
+    '*"23$\'aecemia%$rian%&straea$+em&rehy;ber&,ber&ndash;281!90!80!90#may0(november0(saturday)#-21*"30*!4',
+    '*$june*#may)$.the)!/)$1993)!s%(ntriones$!i%&caemic%&manian&!i%"um$!r%!.$!s',
+    '#"uh$\'lchrale\'$tura&"ra%$deva%*kralkultur%$veda"\'qencing##ual&!s%#nna%#tur$#ela%(nase-kit&*ce-control',
+    ')\'derived)+specificity)*unspecific(&/music)&region(\'r-based("s.)(/regions\'+ing-quality*!.&\'t-based\'*ial-direct++to-parallel&"za%#ros',
+    '*"or$$ijor%"oa%#ros$2oia&ndash;yosemite%!r%#yah"Ur-asn-lys-glu-gln-glu-pro-lys-glu-lys-lys-lys-lys-lys$\'gln-glu$\'r-geant$%x-pro#!.#(/thr-gln%.yr-phosphatase##177',
+    '#"90#&a-labo$\'c-edged%!h&"ed%#old$)fetinides%#ino$!g%%eddin%$lios$!h$(ient-ils%%kella$#lab',
+    '%$gkai$.ph-pterodactyl\'(serpents&#ine%!i&"on&"s.$#vit#*b-besieged%-croat-slovene%*domination%&moslem&%uslim%(occupied&(fficered',
+    '%(slavonic&\'peaking$!a$#dom$%ehoni%#zov$!i%+a-dominated&+/yugoslavia&*n-american($born((croatian(,latin-german()populated\')/croatian',
+    '\'$ness%!n$!o%0-bloody-croatian&(croatian%&philes%&slavia$&ronski#%c/dti%$ssrc$$hing#$dang$#ica#)ebriakova&"ov',
+    '$\'metjevo$%naids%*dipitously%!i&%tatis%!y$!r%"us#-f&rehy;ridden$%-like%%owner#%gayiz$,eant-at-arms)$like)&majors',
+    '()s-at-mace)!.%&ievich&%vitch%"js$&ioveto%#yev("yy$!t%\'.-pilot$#uei#!h$"ad$%ienko#,ial-inverted',
+    '\'(monogamy\'%novel(\'umbered&&/story&(isations\'"ty\'-z&rehy;ations&+ly-produced%"na&!s%$tim.$"ca%#eus%"ic&(tisation',
+    '&$side%&ulture+"al$(es&ndash&"-a\'%based\'\'derived\'$pass\'*timetabled\'\'winning&%.golf$#fed%!f&"ed$!n',
+    '\')threonine&*/threonine&!s%!g$!o%&-comic%$suly%!u&"ly&\'s&ndash\'$-art(*mindedness\'#aly\'\'looking("y\'',
+    '*#ill+&njured*"no)(.venezia$!s$$tham$#vce#$jani$,eant-at-mace)\'of-arms))trumpeter#!l$$etis$$ison##man',
+    '&"de&"es\'"ta(!s("te&"ic\'"se)!s#"ne$#ing$-o-solov\'evich+&ievich#,obiochemical$)diagnosis$/epidemiological',
+    '$&groups$$labs%"la%%ogist$#med%\'uscular$!n%!o$\'postive$&status%&urveys$\'testing%)oninergic%#ype(!d',
+    '$#var%)onversion#+pent-bearer(&licked*"ne)%ocked(%woman*%rship\'%arium\'"es\')ine-front+&shaped)#ing*#sed*#zed',
+    '($zing%&raster$#hid$#ina$*tularoides$&ukhov.%"la$)yllifolia("um#$radj%$ller%#nid("ae&*ocirrhitus%!o',
+    '%!s%"te&!i\'"ng&"um%#ult$$ells%"rs$$iger$#one&!s$!s$%ulata%"re%&salmus',
+    '#"ti%\'llanges#$uant\'"es$"la$"m-%-chromoglycate%(institut#\'v(ic)es$%-ices$#aas%!e&!s%#mus%!n',
+    '&3t&mdash;competition\'!\'\'(-keepers($maid,!s+\'ntained(&seller((teachers\'+s&mdash;and(!.%$tors%$unte%!y$#ces$"e\'',
+    '%\'/volley%#ing%&r(mvs)&\'-backed\'\'centric((ompliant\'#lan\'*to-network&\'/client&!a\'!l&%ising&\'y-style$$iant%%cable',
+    '.\'lothian(-rehy;inspired\'%(mhs)("s)\'%-base)%uying($card()dominated)&rafted(&groups((in-a-box*\'tensive)$ssue(%level(#men',
+    '(0observer/visitor))rientated."ed((planning)(roducing((specific0--disciplinary)&tation($type(#use+!r\'$.but(#her\'!/(&access',
+    '(!f(%house,#ing\'#_no\'$bars($erry\')d/chimney\'$line\'&master(#en.\'"of\'!r(!s\'*s&mdash;is(\'(snads)',
+    ')\'leisure*$ooks)\'related)\'to-jazz(\'.as/400)%joyce(%/card)&events)/gloucestershire)(informal*%ssues)2m-5/worcestershire)$work("22(!e',
+    '&(ing-wise)!.)!s%"de%%entes&)tte-rings)\'s/place%$llia%!n&%g-boy(&dishes(%girls(#man(&people(%spoon',
+    '+"en%!r%!s&#air%$tium&$udes$+o-actuators\'%rmour\'\'ssisted&*mechanisms\'$otor&\'rudders&$suit\'%ystem&$tabs',
+    '&(otorised%!z$!t%!.%"s.$!y#$wano##yth#*zhantovich",s-sili-flora#-ame-flavoured\'$seed+"ed#\'bastian#"ca',
+    '##daq#$elwa#%hadri%!n$"ed!\'lummin\'',
 )
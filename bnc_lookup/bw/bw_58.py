@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_58 = (
+count_58 = 6694
+
+heads_58 = (
     'ricardum',
-    'ricberht',
-    'ricca',
-    'ricchieri',
-    'ricciardi',
-    'ricco',
-    'riccoboni',
-    'riccobono',
-    'rice-and-bean',
-    'rice-barns',
-    'rice-beer',
-    'rice-cake',
-    'rice-cakes',
-    'rice-cookers',
-    'rice-davies-type',
-    'rice-grains',
     'rice-green',
-    'rice-growers',
-    'rice-paddy',
-    'rice-planting',
-    'rice-pot',
-    'rice-producing',
-    'rice-pudding',
-    'rice-smith',
-    'rice-sorting',
-    'rice-stook',
-    'rice-white',
-    'rice/lloyd',
-    'rice/road',
-    'ricebarns',
-    'riceland',
-    'ricepot',
     'ricercar-like',
-    'ricercars',
-    'ricerche',
-    'ricevuta',
-    'rich\'',
-    'rich-busy-man',
-    'rich-colouring',
-    'rich-for-life',
-    'rich-hued',
-    'rich-lists',
-    'rich-little-poor-girl',
-    'rich-looking',
-    'rich-smelling',
-    'rich-yolked',
-    'rich/beautiful/married',
-    'rich/daft',
     'richadson',
-    'richain',
-    'richar',
-    'richard-sophie',
-    'richard/athlete',
-    'richard/former',
-    'richard/gorebridge',
-    'richard/homeless',
-    'richard/singer',
-    'richards-for-vice-president',
-    'richards/chief',
-    'richards/competition',
-    'richards/country',
-    'richards/drugs',
-    'richards/festival',
-    'richards/fire',
     'richards/freight',
-    'richards/gloucestershire',
-    'richards/health',
-    'richards/help',
-    'richards/lowerhope',
-    'richards/national',
-    'richards/prodrive',
-    'richards/warwickshire',
-    'richardses',
-    'richardson\'s&rehy',
-    'richardson-made',
-    'richardson/',
-    'richardson/aviculture',
-    'richardson/producer',
-    'richardson/trainer',
-    'richardson/walker',
     'richardsonii',
-    'richardt',
-    'richarsdson',
-    'richartz',
-    'richartzstrasse',
-    'richcliff',
-    'richd',
-    'richebourg',
-    'richeldas',
-    'richen',
-    'richening',
-    'richersan',
-    'richesse',
-    'richford',
-    'richi',
-    'richians',
     'richieri',
-    'richildis',
-    'riching',
-    'riching/rescued',
-    'richings/kidlington',
-    'richisau',
-    'richly-adorned',
-    'richly-coiffed',
-    'richly-coloured',
-    'richly-decorated',
-    'richly-diverse',
-    'richly-embroidered',
-    'richly-endowed',
-    'richly-hued',
-    'richly-interlaced',
-    'richly-varied',
     'richmon',
-    'richmond-has',
-    'richmond-molyneux',
-    'richmond-on-thames',
-    'richmond/cyclist',
-    'richmond/father',
-    'richmond50martin',
-    'richnesses',
-    'richoched',
-    'richochetting',
-    'richonds',
-    'richt',
-    'richter-7',
-    'richter-like',
-    'richterite',
-    'richterliches',
     'richtkrafte',
-    'richtlinienkompetenz',
-    'richwhite',
-    'richworth',
-    'ricinoleic',
-    'rick-houses',
-    'rickarby',
-    'rickard/british',
-    'ricket',
-    'rickets/irvine',
-    'ricketts/',
-    'ricketts/irvine',
-    'rickettsioses',
-    'rickety-looking',
-    'rickham',
-    'ricking',
     'rickits',
-    'rickle',
-    'ricklefs',
-    'ricklepits',
-    'rickles',
-    'rickmers',
-    'rickrack',
-    'rickshaw-type',
-    'rickshaw-wallahs',
-    'ricksy',
-    'rickword',
-    'rickyards',
-    'ricochetting',
-    'ricoh-based',
-    'riconosci',
-    'riconsciuta',
     'ricordea',
-    'ricordo',
-    'ricorsi',
-    'ricos',
-    'ricos-omes',
-    'ricot',
-    'ricots',
-    'ricotta-stuffed',
-    'ricquier',
-    'rictus-strung',
-    'rid-calf-length',
-    'riddels',
-    'ridden-holes',
-    'riddle-style',
-    'riddlesden',
-    'riddlestone',
     'riddlington',
-    'riddo',
-    'riddock',
-    'ride&mdash',
-    'ride-a-cock-horse',
-    'ride-comfort',
-    'ride-like',
-    'ride-sharing',
-    'ride.',
-    'ride/brother',
-    'ride/father',
-    'ride/handling/steering/braking',
-    'ridegewood',
-    'ridehalgh',
-    'riden',
-    'ridenhour',
     'rider-but',
-    'rider/trainer',
-    'riders.',
-    'riders.the',
-    'ridest',
-    'rideways',
-    'ridgbacks',
-    'ridge&rehy;piece',
-    'ridge-and&rehy;furrow',
-    'ridge-backed',
-    'ridge-board',
-    'ridge-line',
-    'ridge-lines',
-    'ridge-piece',
-    'ridge-pole',
-    'ridge-top',
     'ridge-walkers',
-    'ridge-walks',
-    'ridgebacks',
-    'ridgehill',
-    'ridgemont',
-    'ridgetop',
-    'ridgewood-bushwick',
-    'ridibundus',
-    'ridic',
-    'ridic-ule',
-    'ridiculo',
-    'ridiculous-looking',
-    'ridiculous/sublime',
-    'ridiger',
-    'riding-about',
-    'riding-bailiffs',
     'riding-carriage',
-    'riding-class',
-    'riding-clothes',
-    'riding-crops',
-    'riding-felce/general',
-    'riding-gear',
-    'riding-hood',
-    'riding-horse',
-    'riding-house',
-    'riding-mac',
-    'riding-robes',
-    'riding-shoes',
-    'riding-shooting-fishing',
-    'riding-trousers',
-    'riding-whip',
-    'riding.',
     'riding/tool/brake',
-    'ridit',
-    'ridland',
-    'ridleyism',
-    'ridleyville',
-    'ridnell',
-    'ridruejo',
-    'ridulous',
-    'ridvan',
-    'rie&mdash;the',
-    'riebeeck',
-    'riebei',
-    'riechenhall',
-    'riefling',
-    'riege',
-    'riemann-green',
     'riemans',
-    'riemer',
-    'rien.',
-    'riencourt-flesqui&egrave;res',
-    'riendorp',
-    'rienner',
-    'rieper',
-    'riers',
-    'riesco',
-    'riesenwand',
-    'rieslings',
-    'riesner',
-    'riet',
-    'rietbad',
-    'rietberg',
-    'rieter',
     'rieti',
-    'rietling',
-    'rieu',
-    'rieunier',
-    'riez',
-    'rifabutin',
-    'rifai',
-    'riff-',
-    'riff-monster',
-    'riff-raf',
-    'riff-writer',
-    'riff/female',
-    'riffaholic',
-    'riffaramas',
-    'riffbastards',
-    'riffed',
     'riffert',
-    'riffian',
-    'riffka',
-    'riffkind',
-    'riffy',
-    'rifkind/defence',
-    'rifle-bolts',
-    'rifle-butt',
-    'rifle-fire',
-    'rifle-pit',
-    'rifle-range',
-    'rifleshooting',
-    'rifondazione',
-    'rifs',
-    'rift&rehy;lake',
-    'rift-faulting',
     'rig-idy-foe-li-oos',
-    'rig-out',
-    'rig-time',
-    'rigalis',
-    'rigalt',
-    'rigani',
-    'rigatoni',
-    'rigaudon',
-    'rigdely',
-    'rigden',
-    'rigdenjyepo',
-    'rigelian',
-    'rigelnik',
-    'riggall',
-    'rigged-price',
-    'rigget',
     'riggits',
-    'righetti',
-    'right&mdash;hand',
-    'right&ndash;wing',
-    'right&rehy;centre',
-    'right+hand',
-    'right-allied',
-    'right-and',
-    'right-and-a-left',
-    'right-angles.',
-    'right-answerism',
-    'right-ascension',
-    'right-away',
-    'right-backs',
-    'right-band',
-    'right-based',
     'right-brainers',
-    'right-click',
-    'right-cross',
-    'right-dominated',
-    'right-e-oh',
-    'right-ear',
-    'right-eousness',
-    'right-field',
-    'right-footer',
-    'right-had',
-    'right-hand_up',
-    'right-handed/left-handed',
-    'right-handedly',
-    'right-i',
-    'right-i-warned-you-off-to-the-head\'s-study',
-    'right-instruction',
     'right-just',
-    'right-justification',
-    'right-justified',
-    'right-knee',
-    'right-left-right',
-    'right-little',
-    'right-making',
-    'right-of',
-    'right-of-british',
-    'right-of-reply',
-    'right-offs',
-    'right-once',
-    'right-onness',
-    'right-pawed',
-    'right-rear',
-    'right-relatedness',
     'right-republican',
-    'right-resurgence',
-    'right-sided.',
-    'right-sized',
-    'right-sizing',
-    'right-slanted',
-    'right-that',
-    'right-the',
-    'right-there',
-    'right-thinkers',
-    'right-to-cancel',
-    'right-to-pollute',
-    'right-turning',
-    'right-way-up-cups',
-    'right-wheeled',
-    'right-y-ho',
     'right.handed',
-    'right.sided',
-    'right.which',
-    'right/',
-    'right/correct',
-    'right/full',
-    'right/private',
-    'right/wrong',
-    'right81',
-    'right:two',
-    'right_on',
-    'rightdown',
-    'righteous-minded',
-    'righteous.',
-    'righters',
-    'righthanded',
     'rightho',
-    'rightist-nationalist',
-    'rightizing',
-    'rightless',
-    'rightline',
-    'rightly-obscure',
-    'rightneousness',
-    'rightness-making',
-    'righto.',
-    'rightrack',
-    'rights&mdash;where',
-    'rights*',
-    'rights-enforcing',
-    'rights-of-ways',
-    'rights.while',
-    'rights/ethics',
     'rightside',
-    'rightsize',
-    'rightward-leaning',
-    'rightway-around',
-    'righty-o',
-    'rigiblick',
-    'rigid-',
-    'rigid-tined',
-    'rigid-tongued',
-    'rigida',
-    'rigidifying',
-    'rigidly-controlled',
-    'rigids',
-    'riglewski',
-    'rigmaroles',
-    'rigmer',
     'rign',
-    'rignals',
-    'rigo',
-    'rigoletto/trovatore',
-    'rigophila',
-    'rigor-mortgage',
-    'rigorous-critical',
-    'rigorous.nick',
-    'rigot',
-    'rigouts',
-    'rigs.',
-    'rigueurs',
-    'rigutto',
-    'rigzin',
-    'rihanssu',
-    'riht',
     'rihtlicor',
-    'rii-re',
-    'riihij&auml;rvi',
-    'riiight',
-    'riina',
-    'riis',
-    'riitta',
-    'rij',
-    'rijkaard-like',
-    'rijken',
-    'rijkers',
-    'rijks',
-    'rijksbank',
-    'rijksbureau',
-    'rijksen',
-    'rijksmuseumstichtung',
     'rijksprentenkabinet',
-    'rijnen',
-    'rijnhuizen',
-    'rijstafel',
-    'rikaard',
-    'rikavatz',
-    'rike',
-    'riken',
-    'riker',
-    'rikkyo',
-    'riklis',
-    'rikos',
-    'rikushin',
-    'rikyu',
-    'rila',
-    'rilate',
     'rilby',
-    'riler',
-    'riley/teacher',
-    'rileys',
-    'rillets',
-    'rillette',
-    'rilliet',
-    'rillons',
-    'rilu',
-    'rim-drynoch',
-    'rim-level',
-    'rim-most',
-    'rim.',
-    'rimantas',
-    'rimbaldian',
-    'rimbault',
     'rimbaut',
-    'rimbow',
-    'rimbu',
-    'rime-crusted',
-    'rimells',
-    'rimeq',
-    'rimer-alco',
-    'rimers',
-    'riming',
-    'rimland',
-    'rimlock',
-    'rimmers',
-    'rimminen',
-    'rimosum',
-    'rimpton',
-    'rimrose',
     'rimu',
-    'rimutaka',
-    'rimward',
-    'rin-tin-tin',
-    'rinald',
-    'rinaldi/support',
-    'rinaldo',
-    'rinalhi',
-    'rinas',
-    'rincewind&mdash',
-    'rincewind-shaped',
-    'rinchen',
-    'rinchik',
-    'rincome',
-    'rincon',
-    'rindel',
     'rindermarkt',
-    'rineke',
-    'rinelde',
-    'ring&rehy;bearers',
-    'ring&rehy;ing',
-    'ring-a-ring-a-noses',
-    'ring-a-rosy',
-    'ring-and-dot',
-    'ring-attached',
-    'ring-barking',
-    'ring-bound',
-    'ring-closure',
-    'ring-crypt',
-    'ring-dance',
-    'ring-ditches',
-    'ring-dropper',
     'ring-encrusted',
-    'ring-file',
-    'ring-folders',
-    'ring-fort',
-    'ring-grips',
-    'ring-handle',
-    'ring-if',
-    'ring-laden',
-    'ring-mail',
-    'ring-makers',
-    'ring-monitoring',
-    'ring-mountings',
-    'ring-o-roses',
-    'ring-of-two',
-    'ring-on-sea',
-    'ring-piece',
     'ring-ridden',
-    'ring-ring',
-    'ring-roarrrd',
-    'ring-rust',
-    'ring-rustiness',
-    'ring-scarred',
-    'ring-shirr',
-    'ring-spanner',
-    'ring-species',
-    'ring-sports',
-    'ring-stained',
-    'ring-studded',
-    'ring-tail',
-    'ring-theoretic',
-    'ring-toothed',
-    'ring-top',
     'ring-tree',
-    'ring-wall',
-    'ring-work',
-    'ring-worm',
-    'ring/casket',
-    'ring/head-injured',
-    'ring/jez',
-    'ring/toy',
-    'ringbearer',
-    'ringbinders',
-    'ringbone',
-    'ringbridge',
-    'ringcroft',
-    'ringdove',
-    'ringdoves',
-    'ringdufferrin',
     'ringes',
-    'ringfield',
-    'ringfinger',
-    'ringguth',
-    'ringhalls',
-    'ringham',
-    'ringhoff',
-    'ringhorn',
-    'ringi',
-    'ringi-sei',
-    'ringiit',
-    'ringin\'',
-    'ringinglow',
-    'ringisho',
-    'ringk',
-    'ringk&ouml;bing-f&uuml;nen-high',
     'ringlet-type',
-    'ringleted',
-    'ringletted',
-    'ringletty',
-    'ringling',
-    'ringlock',
-    'ringmasters',
-    'ringnes',
-    'ringold',
-    'ringoldswil',
-    'ringolevio',
-    'ringos',
-    'ringour',
-    'ringrose/vicar',
-    'rings_as',
-    'ringsaker',
     'ringseat',
-    'ringsell/father',
-    'ringsell/step-mother',
-    'ringshall',
-    'ringshaped',
-    'ringstones',
-    'ringtop',
-    'ringwald',
-    'ringworks',
-    'ringworms',
-    'ringworth',
-    'ringwould',
-    'ringwraiths',
-    'rini',
-    'rink-like',
-    'rink.there',
     'rinka',
-    'rinkel',
-    'rinking',
-    'rinkside',
-    'rinky',
-    'rinnetou',
-    'rinnin\'',
-    'rinning',
-    'rinnovimento',
-    'rinnu',
-    'rinoloricaria',
-    'rinoscopia',
-    'rinpoche',
-    'rinsability',
-    'rinse-a-leader',
-    'rinse-rinse',
     'rinse-water',
-    'rinsedella',
-    'rinsings',
-    'rinteln',
-    'rintini',
-    'rinty',
-    'rinus',
-    'rinvlak',
-    'rinyaszentkir&aacute;ly',
-    'rio/polygram',
-    'riobamba',
-    'rioghail',
-    'riohgail',
-    'rioli',
-    'riom',
-    'rioms',
     'rione',
-    'rioni',
-    'rioprostil',
-    'riordans',
-    'rios-risc',
-    'riot-cladding',
-    'riot-flics',
-    'riot-fomentation',
-    'riot-gear',
-    'riot-related',
-    'riot-shields',
-    'riot-tom',
-    'riot-training',
-    'riot-visors',
-    'riot-wrecked',
-    'riot.mp',
     'riotin\'',
-    'riotings',
-    'riotous.',
-    'riotousness',
-    'rioumajou',
-    'rioutts',
-    'rip-and-tear',
-    'rip-currents',
-    'rip-cutting',
-    'rip-off\'',
-    'rip-rap',
-    'rip-roarer',
-    'rip-roaringly',
-    'rip-saw',
-    'rip-snorting',
-    'rip-the-jugular',
     'ripalong-a-lucy',
-    'riparians',
-    'ripartition',
-    'ripcords',
-    'ripe-peach',
-    'ripe-smelling',
-    'ripely',
-    'ripeners',
-    'ripeness.',
-    'ripenings',
-    'riperton',
-    'riphean',
-    'ripieni',
-    'ripieno',
-    'ripmax',
-    'ripoli',
     'ripon-based',
-    'riponian',
-    'riposo',
-    'ripost',
-    'rippah',
-    'rippchen',
-    'ripped-out',
-    'ripped-up',
-    'rippenden',
-    'rippengal',
-    'ripper.',
-    'rippin',
-    'rippings',
-    'rippl',
-    'ripple-dissolving',
-    'ripple-laminated',
     'ripple-puddles',
-    'ripple-smoothing',
-    'ripple-velvet',
-    'ripples/waves',
-    'ripplings',
-    'ripply',
-    'rippoe',
-    'rippy-fish',
-    'riprian',
-    'riproaring',
-    'ripsaw',
-    'ript',
-    'riptides',
-    'ripul',
-    'riquebourg',
-    'riquier',
     'rirv5',
-    'risa',
-    'risable',
-    'risak',
-    'risal',
-    'risalwater',
-    'risbey',
-    'risbridge',
-    'risbury',
-    'risbury/herefordshire',
-    'risc&rehy;based',
-    'risc-',
-    'risc-killer',
-    'risc-like',
-    'risc/aix',
-    'riscal',
     'risch',
-    'riscnt',
-    'risco',
-    'risdale',
-    'risden',
-    'rise\'',
-    'rise\'n\'time',
-    'rise-and-',
-    'rise-assuming',
-    'risecote',
-    'risedale',
-    'risee',
-    'risenburgh',
-    'riseness',
-    'risenhuber',
-    'riser/keels',
     'rish',
-    'rishanger',
-    'rishel/cachin',
-    'risher',
-    'rishikesh',
-    'rishworth',
-    'risi',
-    'risin\'',
-    'risingham',
-    'risk&mdash;is',
-    'risk&rehy;free',
-    'risk&rehy;graded',
-    'risk(s)',
-    'risk-',
-    'risk-accepting',
-    'risk-all',
     'risk-assessors',
-    'risk-avoiding',
-    'risk-based',
-    'risk-bearing',
-    'risk-conscious',
-    'risk-minimisation',
-    'risk-minimizing',
-    'risk-premium',
-    'risk-producing',
-    'risk-prone',
-    'risk-recognition',
-    'risk-stratification',
-    'risk-to-benefit',
-    'risk-tolerance',
-    'risk.market',
-    'risk/gas',
     'risk/risk',
-    'risk=0.99',
-    'risk=1.01',
-    'risk=1.06',
-    'risk=1.19',
-    'risk=1.24',
-    'riskat',
-    'risks-insurance/shipping',
-    'risks.',
-    'risky-shift',
-    'rislan',
-    'risley-based',
-    'risoluto',
-    'risoria',
-    'risotto-type',
-    'risoul',
     'risposte',
-    'riss',
-    'risse',
-    'rissington/gloucestershire',
-    'rissingtons',
-    'ristorante.',
-    'ristovski',
-    'rists',
-    'risum',
-    'riszk',
-    'ritalin',
-    'ritardando-diminuendo',
-    'ritblatt',
-    'ritche',
-    'ritchey',
-    'ritchie/lawyer',
     'ritchie/trainee',
-    'ritchies',
-    'ritenour',
-    'rites-of-passage',
-    'rithist',
-    'rithmatic',
-    'ritish',
-    'ritjemokk',
-    'ritmo',
-    'ritodrine',
-    'ritornello-like',
-    'ritorni',
-    'ritratto',
-    'ritro',
-    'ritschel',
-    'ritsos',
     'rittenhouse',
-    'rittenhouse-simmons',
-    'ritterkreuztr&auml;ger',
-    'ritting',
-    'rittmann',
-    'ritto',
-    'ritual\'',
-    'ritual-meaning',
-    'ritual-ridden',
-    'ritualises',
-    'ritualizing',
-    'ritualled',
-    'rituals.',
-    'rituel',
-    'rituro',
-    'ritz-escoffier',
     'ritz/jo',
-    'ritzensee',
-    'ritzi',
-    'ritzier',
-    'riught',
-    'riuniti',
-    'riunti',
-    'riv',
-    'rival&mdash;william',
-    'rival-feelings',
-    'rival-in-love',
-    'rival-yet',
-    'rivalady',
-    'rivaleh',
-    'rivalism',
-    'rivalon',
     'rivalry.',
-    'rivalry/non-rivalry',
-    'rivara',
-    'rivarel',
-    'rivayat',
-    'rivaz\'',
-    'rivazzurra',
-    'rivelino',
-    'riven-faced',
-    'rivens',
-    'river&mdash',
-    'river-animals',
-    'river-based',
-    'river-beds',
-    'river-bore',
-    'river-buses',
     'river-carved',
-    'river-channel',
-    'river-coloured',
-    'river-cooled',
-    'river-delta',
-    'river-deltas',
-    'river-edge',
-    'river-feeding',
-    'river-front',
-    'river-girt',
-    'river-god',
-    'river-level',
-    'river-life',
-    'river-light-sky',
-    'river-maintenance',
-    'river-miles',
     'river-nymph',
-    'river-people',
-    'river-plain',
-    'river-port',
-    'river-rafting',
-    'river-ribbons',
-    'river-shore',
-    'river-smelling',
-    'river-smoothed',
-    'river-steamer',
-    'river-stone',
-    'river-walk',
-    'river-wall',
-    'river-worn',
-    'river-worthy',
-    'river.just',
     'river/',
-    'river/bus',
-    'river/silver',
-    'riverbankers',
-    'riverbreak',
-    'rivercrest',
-    'riverdale',
-    'rivereast',
-    'rivered',
-    'riverflow',
-    'riverfolk',
-    'riverful',
-    'rivergreen',
-    'riverhead',
-    'rivermeads',
-    'riveroll',
     'riverpark',
-    'riverpoint',
-    'rivers.between',
-    'riversides',
-    'riverslea',
-    'riverso',
-    'riverwatch',
-    'riverwater',
-    'rives-renage',
-    'rivet-gun',
-    'rivethead',
-    'rivett-carnac',
-    'rivieraesque',
-    'rivieres',
-    'rivilin',
-    'rivina',
     'rivinoides',
-    'rivoluzione',
-    'rivox',
-    'rivularis',
-    'rivums',
-    'riw',
-    'rixby',
-    'rixdorf/',
-    'riyad',
-    'riyadh2-2',
-    'riyadh21-1130',
-    'riyadh5-14',
-    'rizicultivateurs',
-    'rizivi',
-    'rizo',
-    'rizza',
     'rizzardi',
-    'rizzetto',
-    'rizzla',
-    'rizzoli/universe',
-    'rj.2.5',
-    'rj362/g',
-    'rj4',
-    'rj70s',
-    'rjad',
-    'rje-sna',
-    'rjgg',
-    'rjm',
-    'rjp/mp',
-    'rjs',
-    'rk-32b',
-    'rk-32zb',
     'rk/k',
-    'rk90',
-    'rka',
-    'rkatziteli',
-    'rkka',
-    'rl/rld',
-    'rl30',
-    'rli',
-    'rline',
-    'rlo',
-    'rlr',
-    'rlss',
-    'rlykke',
-    'rm-fortran',
-    'rm-value',
-    'rm/cobol',
     'rm/t',
-    'rm12',
-    'rm3',
-    'rm3.60',
-    'rm300',
-    'rm6000',
-    'rm689',
-    'rm921',
-    'rm921/sg&ndash;57',
-    'rm921/sg&ndash;57.',
-    'rmb',
-    'rmb.',
-    'rmbks',
-    'rmc-1',
-    'rmca',
-    'rmch',
     'rme-fueled',
-    'rmif',
-    'rmm',
-    'rmr',
-    'rms/soft',
-    'rmu/dump',
-    'rmus',
-    'rn1',
-    'rn1.9d',
-    'rn14',
-    'rn3',
-    'rn46',
-    'rn46/rn50',
-    'rn48',
-    'rna-binding',
-    'rna-like',
     'rna-replication',
-    'rna/dna',
-    'rna:rna',
-    'rna:trna',
-    'rnaase',
-    'rnarginally',
-    'rnars',
-    'rnaseh',
-    'rnd(1)',
-    'rndm',
-    'rndp',
-    'rni&gt',
-    'rnight',
-    'rnlb',
-    'rnmh',
-    'rnoc',
     'rnolles',
-    'rnp8&gt',
-    'rnsr',
-    'ro&circ;le-interaction',
-    'ro&circ;le-playing',
-    'ro&circ;les',
-    'ro&ocirc;le',
-    'ro&scaron;kot',
-    'ro\'merholz',
-    'ro-tap',
-    'ro2',
-    'ro31&ndash;8959',
-    'roa/konr',
-    'roace',
-    'roach-bream',
-    'roach-exterminator',
     'roach-killers',
-    'roack/pop',
-    'road&mdash;citizens',
-    'road&ndash;broadway',
-    'road&rehy',
-    'road(s)',
-    'road-accidents',
-    'road-adhering',
-    'road-biased',
-    'road-book',
-    'road-books',
-    'road-breaking',
-    'road-burning',
-    'road-car',
-    'road-casualty',
-    'road-charging',
     'road-cleaning',
-    'road-closure',
-    'road-communications',
-    'road-contracting',
-    'road-crash',
-    'road-dirt',
-    'road-drills',
-    'road-end',
-    'road-filthy',
-    'road-flints',
-    'road-friendly',
-    'road-gang',
-    'road-handling',
-    'road-haulage',
-    'road-hog',
-    'road-humps',
     'road-junction',
-    'road-kill',
-    'road-lobbied',
-    'road-maker',
-    'road-north',
-    'road-novel',
-    'road-on',
-    'road-passenger',
-    'road-price',
-    'road-pricing',
-    'road-race',
-    'road-railway',
-    'road-rally',
-    'road-ready',
-    'road-repairers',
-    'road-route',
     'road-running',
-    'road-safe',
-    'road-sense',
-    'road-sensitive',
-    'road-show',
-    'road-station',
-    'road-stone',
-    'road-tested',
-    'road-testing',
-    'road-to-damascus',
-    'road-to-house',
-    'road-traffic-accident',
-    'road-train',
-    'road-transportable',
-    'road-use',
-    'road-walk',
     'road-weary',
-    'road-which',
-    'road-work',
-    'road-workers',
-    'road-xxxx',
-    'road.cuttings',
-    'road.the',
-    'road/brasnose',
-    'road/hampton',
-    'road/milford',
-    'road/oxford',
-    'road/track',
-    'road_and',
-    'road_up',
-    'roadbed',
-    'roadbuilder',
     'roadcase',
-    'roadcrew',
-    'roadd',
-    'roaded',
-    'roadford',
-    'roadful',
-    'roading',
-    'roadites',
-    'roadkill',
-    'roadlights',
-    'roadline',
-    'roadman-sprinter',
-    'roadmaps',
-    'roadmaster',
-    'roadnames',
-    'roadorientated',
     'roadracer',
-    'roadrunners',
-    'roadrunning',
-    'roads-the',
-    'roads.the',
-    'roads/junctions',
-    'roadscape',
-    'roadships',
-    'roadsign',
-    'roadspeed',
-    'roadstar',
-    'roadstops',
-    'roadsweepers',
-    'roadtank',
-    'roadtest',
-    'roadward',
     'roadway.',
-    'roadworking',
-    'roadworks.they',
-    'roamin',
-    'roanat',
-    'roans',
-    'roar-like',
-    'roar-shriek',
-    'roar.cricket',
-    'roaratorios',
-    'roaraway',
-    'roarers',
-    'roastbeef',
-    'roastin\'',
-    'roasting-fire',
-    'roasting-pan',
     'roasting-pans',
-    'roasting-trays',
-    'roat',
-    'roatan',
-    'roazen',
-    'rob\'t',
-    'rob-goblin',
-    'rob/more',
-    'robati',
-    'robaut',
-    'robb.',
-    'robb/nurseryman',
-    'robbans',
-    'robbe-grillet\'&ndash',
-    'robbed-out',
-    'robber-bandit',
     'robberflies',
-    'robbers.they',
-    'robbery-with-violence',
-    'robbery/theft',
-    'robbi',
-    'robbias',
-    'robbings',
-    'robbins-markham',
-    'robbins/bellringer',
-    'robbins/wilts',
-    'robbos',
-    'robbs',
-    'robbyn',
-    'robcad',
-    'robe-room',
-    'robe.',
     'robec',
-    'roben',
-    'robenek',
-    'robens-led',
-    'robers',
-    'roberses',
-    'roberston',
-    'robert-',
-    'robert-fleury',
-    'robert-houdin',
-    'robert-jan',
-    'robert-jean',
-    'robert-johnson-on-the-acid',
-    'robert/aids',
-    'roberte',
-    'roberthall',
     'robertmedley',
-    'robertos',
-    'roberts-jones',
-    'roberts/branch',
-    'roberts/butterfly',
-    'roberts/consumers',
-    'roberts/director',
-    'roberts/eyewitness',
-    'roberts/gec',
-    'roberts/gloucestershire',
-    'roberts/housing',
-    'roberts/landlady',
-    'roberts/mother',
-    'roberts/nfu',
-    'roberts/oxford',
-    'roberts/paul',
     'roberts/tour',
-    'roberts/unit',
-    'robertsi',
-    'robertsom',
-    'robertson-glasgow',
-    'robertson-walker',
-    'robertson/canada',
-    'robertson/central',
-    'robertson/cheltenham',
-    'robertson/former',
-    'robertson/motor',
-    'robertson/raf',
-    'robertsons',
-    'robertum',
-    'roberty',
-    'robes-pierre',
     'robeson/j',
-    'robespierres',
-    'robeston',
-    'robi',
-    'robichek',
-    'robichon',
-    'robidoux',
-    'robin\'s',
-    'robin\'s-egg',
-    'robin-hood',
-    'robin-leigh',
-    'robin-run-in-the-hedge',
-    'robinae',
-    'robinas',
-    'robineae',
-    'robinette',
     'robingo',
-    'robins-breslow-greenland',
-    'robins/computer',
-    'robins/conservative',
-    'robinson-huron',
-    'robinson-pattisson',
-    'robinson.',
-    'robinson/bucks',
-    'robinson/camra',
-    'robinson/farmer',
-    'robinson/new',
-    'robinson/oxford',
-    'robinson/oxfordshire',
-    'robinson/parent-governor',
-    'robinson/production',
-    'robinson/stewardess',
     'robinson/team',
-    'robinson/trainer',
-    'robinson/west',
-    'robinsonesque',
-    'robinsonian',
-    'robinsonii',
-    'robinsonish',
-    'robinsontrained',
-    'robionson',
-    'robiquet',
-    'roble',
-    'robletts',
-    'robley-dixon',
-    'robo-deth',
-    'robo-legs',
-    'robochef',
     'robocod',
-    'robocop-style',
-    'robocopper',
-    'robocruiser',
-    'robojay',
-    'robore',
-    'robos',
-    'roboski',
-    'robot&rehy;like',
-    'robot-arm',
-    'robot-climbing',
-    'robot-kings',
-    'robot-makers',
-    'robot-making',
-    'robot-operated',
-    'robot-production',
     'robot-welding',
-    'robot-wired',
-    'robotic-techniques',
-    'robotically',
-    'roboticists',
-    'robotics/computer-aided',
-    'robotize',
-    'robotized',
-    'robotnik',
-    'robotrixes',
-    'robson-scott',
-    'robson/chief',
-    'robson/country',
-    'robson/de',
-    'robson/hospital',
-    'robson/spastics',
     'robsons',
-    'robsrecords',
-    'robstans',
-    'robt',
-    'robton',
-    'robull',
-    'robuschi',
-    'robust&rehy;ness',
-    'robust-spirited',
-    'robuster',
-    'robusto',
-    'robustus',
-    'roc&iacute;o',
-    'roc-feather',
-    'roc-ld',
-    'roc-sd',
     'rocade',
-    'rocality',
-    'rocardian',
-    'rocas',
-    'rocc',
-    'roccagiovine',
-    'roccarosa',
-    'roccas',
-    'rocco-saporiti',
-    'rocep',
-    'rocess',
-    'roch-berry/cancer',
-    'rochberg-halton',
-    'rochdale-born',
-    'roche-derrien',
-    'roche-kelly',
     'roche-style',
-    'roche/greenpeace',
-    'rocheau',
-    'rochefordi&egrave;re',
-    'rochefort-montagne',
-    'rochefoucault',
-    'rochem',
-    'rochemont',
-    'rochere',
-    'rochers',
-    'rochesters',
-    'rochet',
-    'rocheter',
-    'rochets',
-    'rochingham',
-    'rochus',
     'rochusclub',
-    'rocio',
-    'rock&rehy;and-roll',
-    'rock\'n\'',
-    'rock\'n\'play',
-    'rock\'n\'roll-related',
-    'rock\'n\'roll-type',
-    'rock\'n\'roll.',
-    'rock\'n\'rollers',
-    'rock\'n\'soul',
-    'rock-',
-    'rock-\'ard',
-    'rock-ballad',
-    'rock-band',
-    'rock-based',
-    'rock-bogography',
     'rock-bridge',
-    'rock-built',
-    'rock-cakes',
-    'rock-chill',
-    'rock-citadel',
-    'rock-concert',
-    'rock-cored',
-    'rock-dating',
-    'rock-dependent',
-    'rock-despised',
-    'rock-drills',
-    'rock-dweller',
-    'rock-dwelling',
-    'rock-edged',
-    'rock-encrusted',
-    'rock-engravings',
     'rock-ette',
-    'rock-faced',
-    'rock-faces',
-    'rock-facing',
-    'rock-falls.',
-    'rock-firm',
-    'rock-flank',
-    'rock-formers',
-    'rock-fortress',
-    'rock-fringed',
-    'rock-fuck',
-    'rock-girl',
-    'rock-hack',
-    'rock-heavy',
-    'rock-ledge',
-    'rock-maker',
     'rock-meets-jazz',
-    'rock-minded',
-    'rock-music',
-    'rock-musician',
-    'rock-n-folkas',
-    'rock-opera',
-    'rock-oriented',
-    'rock-pool',
-    'rock-ribbed',
-    'rock-rose',
-    'rock-salt',
-    'rock-scavengers',
-    'rock-shelters',
-    'rock-shielded',
-    'rock-sounding',
-    'rock-stacks',
     'rock-star',
-    'rock-star-ness',
-    'rock-stars',
-    'rock-store',
-    'rock-trained',
-    'rock-tumbled',
-    'rock-types',
-    'rock-walled',
-    'rock-water',
-    'rock-wise',
-    'rock/',
-    'rock/acoustic',
-    'rock/funk',
-    'rock/indie',
-    'rocka-rocka-rocka-rockabilly',
-    'rockabilly/skiffle',
     'rockadilly',
-    'rockafella',
-    'rockart',
-    'rockawhile',
-    'rockbeare',
-    'rockbed',
-    'rockbeds',
-    'rockbound',
-    'rockboy',
-    'rockbrother',
-    'rockcliff',
-    'rockcliffe\'',
-    'rockclimbing',
-    'rockcrit',
-    'rockdrill',
-    'rockdust',
     'rockdweller',
-    'rockdwelling',
-    'rockeagle',
-    'rockefeller\'',
-    'rockefeller-kissinger',
-    'rocken',
-    'rockendorf',
-    'rockenfield',
-    'rocker-type',
-    'rockerfeller',
-    'rockerific',
-    'rockery-keeper',
-    'rockes',
-    'rockesque',
-    'rocket\'n\'roll',
-    'rocket-assisted',
     'rocket-car',
-    'rocket-fire',
-    'rocket-guidance',
-    'rocket-like',
-    'rocket-load',
-    'rocket-plane',
-    'rocket-proof',
-    'rocket-range',
-    'rocket-sled',
-    'rocket.he',
-    'rocket/i',
-    'rocketeers',
-    'rocketry-launchers',
-    'rocketshare',
-    'rocketted',
-    'rocketts',
     'rockeye',
-    'rockfaces',
-    'rockfield',
-    'rockfoam',
-    'rockglen',
-    'rockhall',
-    'rockhard',
-    'rockie',
-    'rockiest',
-    'rockify',
-    'rockily',
-    'rockiness',
-    'rocking-horses',
-    'rockingfellow',
-    'rockisms',
-    'rockists',
     'rockline',
-    'rocklings',
-    'rockman-queens',
-    'rocko-vario',
-    'rockpiles',
-    'rockpooler',
-    'rocks/bogwood',
-    'rockscape',
-    'rockshots',
-    'rocksil',
-    'rockstars',
-    'rockstorm',
-    'rockstro',
-    'rockumentaries',
-    'rockwart',
-    'rockwater',
     'rockwe',
-    'rockweed',
-    'rockwellian',
-    'rocky-power',
-    'rocky-strachan',
-    'rocky-stuff',
-    'rocky/dorigo/deane/kelly/speed',
-    'rocky/stewart',
-    'rocky/tonight',
-    'rococco',
-    'rococo-ceilinged',
-    'rococofied',
-    'rocordea',
-    'rocquigny',
-    'rocus',
-    'rocyn',
     'rod&eacute',
-    'rod&oacute',
-    'rod-',
-    'rod-bearing',
-    'rod-case',
-    'rod-free',
-    'rod-lengths',
-    'rod-man',
-    'rod-shift',
-    'rod-spikes',
-    'rod/camera/whatever',
-    'rodach',
-    'rodassiers',
-    'rodbororugh',
-    'rodborough/gloucestershire',
-    'rodcarrying',
     'rodded',
-    'rodden-tree',
-    'roddenbury',
-    'roddensvale',
-    'rodderpee',
-    'roddi',
-    'roddicks',
-    'roddis',
-    'roddon',
-    'roddy/gloucestershire',
-    'rodebeek',
-    'rodel',
-    'rodemack',
-    'rodenko',
-    'rodens',
-    'rodent-poisoners',
     'rodent-proof',
-    'rodent-sized',
-    'rodentia',
-    'rodenticide',
-    'rodentine',
-    'rodently',
-    'rodents.',
-    'rodenwald',
-    'roderici',
-    'roders',
-    'rodgers-produced',
-    'rodgers/oxford',
-    'rodgrigo',
-    'rodhe',
-    'rodia',
-    'rodiaei',
     'rodic/kvezenic',
-    'rodilla',
-    'rodimtseva',
-    'rodin-like',
-    'rodinesque',
-    'rodings',
-    'rodinogaster',
-    'rodjmark',
-    'rodker',
-    'rodlington',
-    'rodney/sullivan',
-    'rodneys',
-    'rodolfi',
-    'rodolfus',
-    'rodomontade',
-    'rodonburg',
     'rodopi',
-    'rodrigue',
-    'rodriguez-bachiller',
-    'rodsdens',
-    'rodset',
-    'roduct',
-    'rodway/witness',
-    'rodwell/english',
-    'rody-yev',
-    'rodzina',
-    'roe-deer',
-    'roe-tar-la',
-    'roe.',
-    'roe/drugs',
-    'roebbig',
-    'roebling',
     'roeck',
-    'roedad',
-    'roeg/director',
-    'roeghlisberger',
-    'roehm',
-    'roelandt',
-    'roelants',
-    'roell',
-    'roentgenograms',
-    'roentgenoluminescence',
-    'roentgens',
-    'roesberg',
-    'roeselare',
-    'roethel',
-    'roeux-riencourt',
-    'roevens',
     'roey',
-    'roferon',
-    'roff/westons',
-    'roffe-steinrotter',
-    'rog-babe',
-    'rogaan',
-    'rogacheva',
-    'rogalin',
-    'rogallo-winged',
-    'rogaly',
-    'rogare',
-    'rogari',
-    'rogations',
-    'rogatoire',
-    'rogavit',
-    'roge',
     'roger&rehy;bernard',
-    'rogerdaughter',
-    'rogerfield',
-    'rogerhighfield',
-    'rogerian',
-    'rogers/continuity',
-    'rogers/drink',
-    'rogers/england',
-    'rogers/glider',
-    'rogers/mother',
-    'rogers/radio',
-    'rogers/rospa',
-    'rogers/survivor',
-    'rogers/teacher',
-    'rogerses',
-    'rogersiana',
     'rogersias',
-    'rogerston',
-    'rogerstone',
-    'rogerus',
-    'roggero',
-    'roggin',
-    'roggson',
-    'rognon',
-    'rogoff',
-    'rogosina',
-    'rogozen',
-    'rogozhin4,500',
-    'rogue&rehy;show',
-    'rogueish',
-    'rohani',
-    'rohans',
     'rohela',
-    'roherrim',
-    'rohilkan',
-    'rohilkund',
-    'rohin',
-    'rohini',
-    'rohirric',
-    'rohland',
-    'rohlen',
-    'rohlf',
-    'rohm-ramtron',
-    'rohm/cyro',
-    'rohna',
-    'rohrmann',
-    'rohrsanierungstechnic',
-    'rohrschneider',
     'rohstoff',
-    'roi-geddit',
-    'roiaanshorn',
-    'roiall',
-    'roiaut&eacute',
-    'roid',
-    'roight',
-    'roijen',
-    'roiled-up',
-    'roils',
-    'roineabhail',
-    'roinye',
-    'roirhak',
-    'roissy-en',
-    'roister',
-    'roister-doister',
     'roisterer',
-    'roiuge',
-    'roizen',
-    'rojananil',
-    'rojananin',
-    'rojanini',
-    'rojashousing',
-    'rojot',
-    'rokeach',
-    'rokerites',
-    'rokesley',
-    'roki',
-    'rokita',
-    'rokkashomura',
-    'rokoff',
-    'rokon',
     'rokossovsky',
-    'roks',
-    'roksan',
-    'roksareh',
-    'rokupa',
-    'rokuro',
-    'rol-oyo',
-    'rola',
-    'roladex',
-    'roladex/index',
-    'rolandis',
-    'rolands',
-    'rolandslied',
-    'rolandson',
-    'rolawn',
-    'rolcut',
     'roldan',
-    'role(-to-role)',
-    'role-',
-    'role-appropriate',
-    'role-asymmetry',
-    'role-bearer',
-    'role-behaviour',
-    'role-change',
-    'role-described',
-    'role-description',
-    'role-deviance',
-    'role-filler',
-    'role-fulfilment',
-    'role-going',
-    'role-holder',
-    'role-holders',
     'role-performance',
-    'role-play.',
-    'role-played',
-    'role-position',
-    'role-segregation',
-    'role-sharing',
-    'role-specific',
-    'role-strain',
-    'role-strain\'',
-    'role-strengths',
-    'role-supporting',
-    'role-there',
-    'role-to-',
-    'role-to-role',
-    'role-training',
-    'role.24',
     'role.at',
-    'role/play',
-    'roleholders',
-    'roleplayer',
-    'roles.93',
-    'roles/practices',
-    'roles/relationships/sub',
-    'roles_in',
-    'rolf/national',
-    'rolfe-johnson',
-    'rolfehedges',
-    'rolfes',
-    'roli',
-    'rolins',
-    'roll&mdash;about',
-    'roll\'d/among',
     'roll-a-ball',
-    'roll-a-perm',
-    'roll-across',
-    'roll-backed',
-    'roll-brim',
-    'roll-edge',
-    'roll-fed',
-    'roll-flaps',
-    'roll-like',
-    'roll-meets',
-    'roll-mower',
-    'roll-necks',
-    'roll-out/peg-out',
-    'roll-ramp',
-    'roll-your-owns',
-    'rollabout',
     'rollar',
-    'rollasons',
-    'rollaway/',
-    'rollaways',
-    'rollbar',
-    'rollbars',
-    'rolldies',
-    'rolle/musicians',
-    'rolled-topped',
-    'rollei',
-    'rollen',
-    'roller-',
-    'roller-blinds',
-    'roller-boots',
-    'roller-coasted',
-    'roller-coasting',
     'roller-coasts',
-    'roller-milling',
-    'roller-reefing',
-    'roller-skate',
-    'roller-skaters',
-    'roller-towel',
-    'roller-towels',
-    'roller-upper',
-    'roller/surcingle',
-    'rollerball',
-    'rollerbearing',
-    'rollerblade',
-    'rollering',
-    'rollerskater',
-    'rollerskaters',
-    'rolley',
     'rollgreen',
-    'rollie',
-    'rolling\'',
-    'rolling-collar',
-    'rolling-eyed',
-    'rolling-in',
-    'rolling-in-it',
-    'rolling-maul',
-    'rolling-mill',
-    'rolling-mills',
-    'rolling-pins',
-    'rolling-programme',
-    'rolling-up',
-    'rolling.',
-    'rollingstock',
-    'rollins-show',
     'rollison',
-    'rolliston',
-    'rollman',
-    'rollmop',
-    'rollocks',
-    'rollos',
-    'rollout-cum-developers',
-    'rollova',
-    'rollovers',
-    'rollrights',
-    'rollrock',
-    'rolls-',
-    'rolls-bentleys',
-    'rolls-royce-engined',
-    'rolls-royce-powered',
-    'rolls-royce/bentley',
     'rolls-royces.',
-    'rolls/bentley',
-    'rollsroyce',
-    'rollston',
-    'rollsxxx',
-    'rolltops',
-    'rollup',
-    'rollyson',
-    'rolnis',
-    'rolos',
-    'roly-polying',
-    'rom-chip',
-    'rom-held',
-    'rom-installed',
-    'romada',
-    'romaines',
     'romainia',
-    'romainm&ocirc;tier',
-    'romaldo',
-    'romalli',
-    'roman-built',
-    'roman-catholic',
-    'roman-emperor',
-    'roman-inspired',
-    'roman-italian',
-    'roman-like',
-    'roman-looking',
-    'roman-ness',
-    'roman-shorn',
-    'roman_&agrave_clef',
-    'romance-adventures',
-    'romance-cubes',
     'romance/morgan',
-    'romance_in',
-    'romancier',
-    'romancing-where',
-    'romanee-conti',
-    'romanelli',
-    'romanenko',
-    'romanesques',
-    'romanet',
-    'romanian&ndash;hungarian',
-    'romanian-built',
-    'romanian-italian',
-    'romanian-moldavan',
-    'romanian-speakers',
-    'romanic',
-    'romanica',
     'romanisation',
-    'romanista',
-    'romanit',
-    'romanizing',
-    'romano&rehy;britons',
-    'romano-',
-    'romano-britons',
-    'romano-iberic',
-    'romanovich',
-    'romanovskii',
-    'romanow',
-    'romans-bilan',
-    'romans-christians',
-    'romans-probleme',
-    'romantic&rehy',
-    'romantic-crocean',
     'romantic-fiction',
-    'romantic-historical',
-    'romantic-individualist',
-    'romantic-lookin\'',
-    'romantic-looking',
-    'romantic-lyric',
-    'romantic-lyrical',
-    'romantic-minded',
-    'romantic-sounding',
-    'romantic-style',
-    'romantic-technological',
-    'romantic/cosmic/evolutionary',
-    'romantic/salacious',
-    'romantically&rehy;minded',
-    'romanticals',
-    'romanticist/utilitarian',
     'romantik',
-    'romany-born',
-    'romanza',
-    'romanzas',
-    'romanzoffiana',
-    'romaria',
-    'romarias',
-    'romary',
-    'romas',
-    'romasius',
-    'romaszewski',
-    'romawi',
-    'romba',
-    'romboni',
-    'rombouts-droste',
-    'rome&mdash;it',
     'rome\'',
-    'rome-bound',
-    'rome-you',
-    'rome/',
-    'rome/oxford/naples',
-    'rome527',
-    'romell',
-    'romen',
-    'romeo-and-juliet',
-    'romeo-class',
-    'romer-rosenthal',
-    'romeri',
-    'romes',
-    'romesh',
-    'romful',
-    'romi',
     'romieuzii',
-    'romijn',
-    'romiopoulou',
-    'romische',
-    'romitic',
-    'romley',
-    'romney\'skind',
-    'romneya',
-    'romo-stuart-georgian',
-    'romocion',
-    'romojaro',
-    'rompalong',
-    'romper-suits',
-    'rompings',
-    'rompish',
-    'rompono',
     'rompress',
-    'rompun',
-    'rompuy',
-    'romsdalhorn',
-    'romtelecom',
-    'romu',
-    'romula',
-    'romushas',
-    'ron-bo',
-    'ron-concurrence',
-    'ronaldo',
-    'ronaldshay',
-    'ronauld',
-    'ronay.',
-    'ronayne',
-    'roncal',
     'roncalli',
-    'roncallis',
-    'roncato',
-    'roncerel',
-    'roncesvaux',
-    'ronceval',
-    'roncevalles',
-    'ronchi',
-    'ronco',
-    'roncucci',
-    'rond&ocirc;nia',
-    'rondavels',
-    'ronderos',
-    'rondi',
-    'rondine',
-    'rondomiaow',
     'ronee',
-    'roneoed',
-    'ronet',
-    'ronettes',
-    'roney',
-    'rongai',
-    'rongbuk',
-    'ronge',
-    'rongzhen',
-    'ronick',
-    'ronie',
-    'ronilan',
-    'ronis',
-    'ronita',
-    'ronk',
-    'ronken',
     'ronnau',
-    'ronne-filchner',
-    'ronning',
-    'ronnybrook',
-    'ronscevalles',
-    'ronshaw',
-    'ronsingon',
-    'ronson-produced',
-    'ronuk',
-    'ronyon',
-    'ronzani',
-    'ronzeo',
-    'roo-bars',
-    'roo-bra',
-    'roochy',
-    'rood-stone',
     'roodebloem',
-    'roodee',
-    'roodman',
-    'roof\'\'',
-    'roof-',
-    'roof-a',
-    'roof-breach',
-    'roof-climber',
-    'roof-deck',
-    'roof-disc',
-    'roof-down',
-    'roof-fall',
-    'roof-form',
-    'roof-garden',
-    'roof-girder',
-    'roof-leads',
     'roof-lit',
-    'roof-on-rack',
-    'roof-racks',
-    'roof-sized',
-    'roof-slates',
-    'roof-span',
-    'roof-spans',
-    'roof-thatch',
-    'roof-tiling',
-    'roof-timber',
-    'roof-to-floor',
-    'roof-truss',
-    'roof-work',
-    'roof/bodyside',
-    'roof/loft/windows',
-    'roof/wall',
     'roofbeam',
-    'roofbeams',
-    'roofed-in',
-    'roofed-over',
-    'roofery',
-    'rooff',
-    'roofguns',
-    'roofing-grade',
-    'roofrib',
-    'rooftile',
-    'rooftopping',
-    'roofwards',
-    'roogagh',
-    'roogalator',
-    'roogs',
-    'rook-scaring',
     'rook.',
-    'rooke-matthews',
-    'rooker-wise-lawson',
-    'rookford',
-    'rookhope',
-    'rooking',
-    'rookley',
-    'room&mdash;it',
-    'room&mdash;not',
-    'room-',
-    'room-\'ere',
-    'room-and-kitchens',
-    'room-cum-bedroom',
-    'room-dividers',
-    'room-enhancing',
-    'room-facing',
     'room-heater',
-    'room-in',
-    'room-in-the-roof',
-    'room-key',
-    'room-keys',
-    'room-length',
-    'room-no',
-    'room-nodes',
-    'room-numbering',
-    'room-rupert',
-    'room-sealed',
-    'room-setting',
-    'room-style',
-    'room-temperature',
-    'room-the',
-    'room-to-be',
     'room-to-room',
-    'room.she',
-    'room/bed',
-    'room/breakfast',
-    'room/classroom',
-    'room/cupboard',
-    'room/lounge',
-    'room/sitting',
-    'room/toilet/',
-    'room/ward',
-    'roomand',
-    'roomatism',
-    'roomfull',
-    'roomheaters',
-    'roomrates',
-    'rooms-and',
     'rooms/you',
-    'roomscape',
-    'roomservice',
-    'roomset',
-    'roon\'',
-    'rooney/managing',
-    'roong',
-    'roope',
-    'roopnarine',
-    'roosevelt-pinchot',
-    'rooseveltian',
-    'roosevelts',
-    'rooskies',
-    'roosting-place',
-    'roostmates',
-    'root&mdash;pack',
     'root&mdash;pack/',
-    'root-assignment',
-    'root-beer',
-    'root-bernstein',
-    'root-bound',
-    'root-canal',
-    'root-division',
-    'root-eating',
-    'root-fibres',
-    'root-forms',
-    'root-hairs',
-    'root-hall',
-    'root-hold',
-    'root-knot',
-    'root-lesion',
-    'root-less',
     'root-means',
-    'root-pattern',
-    'root-pruned',
-    'root-pulper',
-    'root-rot',
-    'root-sort',
-    'root-spread',
-    'root-system',
-    'root-tubers',
-    'root-wrapped',
-    'rootbont',
-    'roote',
-    'rooter-out',
-    'rooters',
-    'rootes\'we',
-    'rooteth',
     'roothing',
-    'rootin\'-tootin\'',
-    'rootish',
-    'rootliep-costerman',
-    'rootlike',
-    'roots/i',
-    'rootzone',
-    'rooy',
-    'rooyen',
-    'rop/de',
-    'rope-anchored',
-    'rope-assisted',
-    'rope-bridge',
-    'rope-burn',
-    'rope-dancing',
-    'rope-drawn',
     'rope-ends',
-    'rope-fringed',
-    'rope-hauled',
-    'rope-lead',
-    'rope-light',
-    'rope-maker',
-    'rope-race',
-    'rope-scarred',
-    'rope-soloed',
-    'rope-top',
-    'rope-topped',
-    'rope-walk',
-    'rope-walks',
-    'rope-way',
-    'rope-worked',
-    'ropeable',
     'ropeless',
-    'ropelike',
-    'ropemaker',
-    'ropemate',
-    'roper-inner',
-    'roper/deputy',
-    'ropergate',
-    'roperty',
-    'ropes/chains',
-    'ropeway',
-    'ropeworks',
-    'rophaien',
-    'ropier',
-    'ropies',
-    'ropily',
-    'ropner/general',
     'ropp',
-    'rops',
-    'ropson',
-    'roque-gageac',
-    'roqueforts',
-    'roquetaillade',
-    'ror',
-    'rora',
-    'rorbus',
-    'rore-wert',
-    'rorento',
-    'rorha',
-    'rorippa',
-    'rorkes',
-    'rorsats',
-    'rorschach-heiden',
     'rorschacherberg',
-    'rorsman',
-    'rortyan',
-    'rorys',
-    'rosa-de-monte',
-    'rosa-sinensis',
-    'rosae',
-    'rosainz',
-    'rosal',
-    'rosale',
-    'rosalesfinance',
-    'rosalinda',
-    'rosalinds',
-    'rosalynn',
-    'rosami',
-    'rosanagh',
     'rosand',
-    'rosane',
-    'rosansky',
-    'rosario-braid',
-    'rosary-mumblers',
-    'rosary.',
-    'rosati',
-    'rosato',
-    'rosatomenergo',
-    'rosbaud',
-    'rosborough',
-    'rosbottom',
-    'roscam',
-    'roscelin',
-    'rosche',
-    'roscher',
     'roschlau',
-    'roscian',
-    'rosciszewski',
-    'roscoe-rathbone',
-    'roscoea',
-    'roscorla',
-    'rosdahl',
-    'rose-and-dora',
-    'rose-arbour',
-    'rose-beige',
-    'rose-bloom',
-    'rose-breasted',
-    'rose-brown',
-    'rose-buds',
-    'rose-bushes',
-    'rose-care',
     'rose-clad',
-    'rose-crimson',
-    'rose-croix',
-    'rose-cut',
-    'rose-dora-dieter',
-    'rose-en-soleil',
-    'rose-geranium',
-    'rose-hill',
-    'rose-jointed',
-    'rose-lavender',
-    'rose-leaf',
-    'rose-like',
-    'rose-madder',
-    'rose-period',
-    'rose-petal',
-    'rose-pinks',
     'rose-printed',
-    'rose-purple-coloured',
-    'rose-silk',
-    'rose-thorn',
-    'rose-tipped',
-    'rose-trees',
-    'rose-violet',
-    'rose-windows',
-    'rose-winged',
-    'rose-wood',
-    'rose-y',
-    'rose-young',
-    'rose/carterton',
-    'rose/costume',
-    'rose/manager',
-    'roseann',
     'rosearre',
-    'roseberg',
-    'roseberian',
-    'rosebowers',
-    'rosebridge',
-    'rosebud-gathering',
-    'roseburn&ndash;craigleith',
-    'roseclear',
-    'rosecleer',
-    'rosecoloured',
-    'rosecraddoc',
-    'rosedean',
-    'rosegarden',
-    'rosegarlands',
-    'rosehearty',
-    'roseheath',
     'roseisle',
-    'roselend',
-    'roselini',
-    'rosellini',
-    'rosemarinus',
-    'rosemary-water',
-    'rosemont',
-    'rosenauer',
-    'rosenbau',
-    'rosenbergdalen',
-    'rosenberger',
-    'rosenblood',
-    'rosenbusch',
-    'rosendale',
-    'rosendo',
-    'roseneath',
     'rosenergoatom',
-    'rosenery',
-    'roseney',
-    'rosengerg',
-    'rosengren',
-    'rosenhain',
-    'roseni',
-    'rosenkranzfest',
-    'rosenmayr',
-    'rosenoir',
-    'rosenqvist',
-    'rosens',
-    'rosenstrasse',
-    'rosenthal-joachimedes',
-    'rosenthaler',
-    'rosenthals',
     'rosenthiel',
-    'rosenwald',
-    'rosenwater',
-    'roseo',
-    'roseoplena',
-    'roserie',
-    'roseroot',
-    'roseros',
-    'roses-and-castles',
-    'roses.',
-    'roses.new',
-    'roses/silvertone',
-    'rosette&mdash;come',
-    'rosette&mdash;one',
-    'rosette-coloured',
-    'rosette-like',
     'rosetting',
-    'rosettis',
-    'rosetto',
-    'rosevear',
-    'rosevelt',
-    'rosewarn',
-    'rosewood-board',
-    'rosewood-bodied',
-    'rosewood-coloured',
-    'rosewood-neck',
-    'rosewood-panelled',
-    'rosewood/cedar',
-    'roseyne',
-    'rosgill',
-    'roshingya',
-    'roshingyas',
     'rosi&egrave;re',
-    'rosiere',
-    'rosignoli',
-    'rosika',
-    'rosily',
-    'rosinas',
-    'rosine',
-    'rosins',
-    'roskens',
-    'roskes',
-    'roskha',
-    'rosley',
-    'rosmary',
-    'rosminian',
-    'rosmus',
-    'rosmyastoltorg',
     'rosnaree',
-    'rosolino',
-    'rosolio',
-    'rospa/sapc',
-    'rospo',
-    'ross-',
-    'ross-bain',
-    'ross-barnard',
-    'ross-giverson',
-    'ross-jones',
-    'ross-like',
-    'ross-milbank',
-    'ross/herefordshire',
-    'ross/political',
-    'ross/tv',
-    'ross/viola',
     'rossal',
-    'rossborough',
-    'rossdhu',
-    'rosse&mdash;br',
-    'rosselini',
-    'rosselson',
-    'rosselson(fuse)',
-    'rossendorf',
-    'rossetti\'s/dickens\'s/browning\'s',
-    'rossetti-hell',
-    'rosshandler',
-    'rosshire',
-    'rossifloor',
-    'rossignols',
-    'rossii',
-    'rossing',
     'rossinians',
-    'rossinot',
-    'rossiter-marvell',
-    'rossiter/the',
-    'rossiters',
-    'rossiyskiye',
-    'rossl',
-    'rosslea',
-    'rossmaynes',
-    'rossmeisl',
-    'rossmere',
-    'rossnerin',
-    'rossol',
-    'rossoneri',
-    'rossos',
-    'rosss',
     'rosswall',
-    'rossy',
-    'rosta',
-    'rostad',
-    'rostagno',
-    'rostal',
-    'rostam',
-    'rostas',
-    'rostboell',
-    'rostenberg',
-    'rostern',
-    'rosticceria',
-    'rostker',
-    'rostov-na-donu',
-    'rostralis',
-    'rostrally',
     'rostratula',
-    'rostratulidae',
-    'rostratus',
-    'rostro',
-    'rostroconchs',
-    'rostrums',
-    'rostrun',
-    'rostworowskiculture',
-    'rostyllyn',
-    'rosudgeon',
-    'rosus',
-    'rosvneshgeo',
-    'roswas',
-    'roswell-based',
-    'rosy-bricked',
-    'rosy-bright',
     'rosy-faced',
-    'rosy-hued',
-    'rosy-pink',
-    'rosy-red',
-    'rosy-skinned',
-    'rosy-tipped',
-    'rosy-veined',
-    'rosy-walled',
-    'rosy-yellow',
-    'rosza',
-    'roszack',
-    'roszcanov',
-    'rot-resisting',
-    'rot/decay',
-    'rota-bed',
-    'rota.',
     'rota/panel',
-    'rotadex',
-    'rotadiscids',
-    'rotafac',
-    'rotaflo',
-    'rotamers',
-    'rotamole',
-    'rotanda',
-    'rotaplug',
-    'rotaprint',
-    'rotaria',
-    'rotaris',
-    'rotaru',
-    'rotary-driven',
-    'rotary-engined',
-    'rotary-headed',
     'rotary-mower',
-    'rotary-winged',
-    'rotatable',
-    'rotate-and-move',
-    'rotate/accelerate',
-    'rotating-anode',
-    'rotating-wave',
-    'rotation-powered',
-    'rotation-reflection',
-    'rotation.',
-    'rotationally',
-    'rotator',
-    'rotaty',
-    'rotavata',
-    'rotavate',
-    'rotavating',
     'rote-memorisation',
-    'rotebuehlstr',
-    'rotem',
-    'rotenone',
-    'roters',
-    'roth-behrendt',
-    'roth-ness',
-    'rothaariges',
-    'rothamstead',
-    'rothaus',
-    'rothblat',
-    'rothblatt',
-    'rothchanasathian',
-    'rothemere',
-    'rothenbaum',
-    'rothenbery',
     'rothenburg-ob-der-tauber',
-    'rothenburger',
-    'rothengatter',
-    'rotheram',
-    'rotheray',
-    'rotherhithe.tunnel',
-    'rothermel',
-    'rothern',
-    'rothers',
-    'rotherwas',
-    'rotherwell',
-    'rotherwick',
-    'rothesay-o',
-    'rothfuss',
-    'rothgo',
-    'rothrock',
     'rothsay',
-    'rothwell/mingard',
-    'rotisseries',
-    'roto-combinations',
-    'roto-stripper',
-    'rotobass',
-    'rotobat',
-    'rotobats',
-    'rotol',
-    'rotola',
-    'rotomahana',
-    'rotomat',
-    'rotomoulded',
-    'roton',
-    'rotondi',
-    'rotor/collective',
     'rotoract',
-    'rotorborne',
-    'rotorcure',
-    'rotorhead',
-    'rotork',
-    'rotorkite',
-    'rotoscope',
-    'rotoscoped',
-    'rotospike',
-    'rotovation',
-    'rotsagno',
-    'rotsea',
-    'rotset',
-    'rotstock',
-    'rotten-apple',
-    'rotten-egg',
     'rotten-looking',
-    'rottener',
-    'rotterdam-based',
-    'rotterdam/bremerhaven',
-    'rotterdam/europoort',
-    'rotterdamsche',
-    'rotting-vegetation-flies',
-    'rottingdean/roedean/brighton',
-    'rottmann',
-    'rottmans',
-    'rotto',
-    'rottsann',
-    'rottser',
-    'rottwil',
-    'rotuding',
-    'rotula',
     'rotular',
-    'rotularia',
-    'rotunde',
-    'rotundities',
-    'rotundus',
-    'rotusis',
-    'rotvel',
-    'rotwang',
-    'rotweillers',
-    'roualles',
-    'rouamba',
-    'rouane',
-    'rouart',
-    'rouault/george',
-    'roubein',
-    'roubilliac',
     'rouble-backed',
-    'rouble-dollar',
-    'rouble-paying',
-    'rouble=us&dollar;0.5646',
-    'rouble=us&dollar;0.5708',
-    'roubles-worth',
-    'roubles.',
-    'roubles=1',
-    'roucaou',
-    'roucy',
-    'roudbar',
-    'roudeiko',
-    'roudin',
-    'roudnice',
-    'rouen-dieppe',
-    'rouf',
     'rouff',
-    'rouge-brush',
-    'rouge-croix',
-    'rouge-dominated',
-    'rouge-stained',
-    'rougement',
-    'rougetel',
-    'rougette',
-    'rough&rehy;and-ready',
-    'rough&rehy;housing',
-    'rough\'',
-    'rough\'n',
-    'rough-',
-    'rough-actioned',
-    'rough-and-crusty-but-it\'ll-wash-off-by-monday-morning',
-    'rough-and-readiness',
     'rough-and-tumbles',
-    'rough-at-the-edges',
-    'rough-country',
-    'rough-crushed',
-    'rough-curl',
-    'rough-cut',
-    'rough-cuts',
-    'rough-dry',
-    'rough-faced',
-    'rough-fighting',
-    'rough-grained',
-    'rough-handed',
-    'rough-hewed',
-    'rough-ironed',
-    'rough-lying',
-    'rough-mirror',
     'rough-mouthed',
-    'rough-neck',
-    'rough-planned',
-    'rough-plastered',
-    'rough-raddled',
-    'rough-road',
-    'rough-sharpening',
-    'rough-shaven',
-    'rough-shelled',
-    'rough-sketched',
-    'rough-stalked',
-    'rough-textured',
-    'rough-topped',
-    'rough-tough',
-    'rough-trimmed',
-    'rough-up',
     'rough-voiced',
-    'rough-walled',
-    'rough-weather',
-    'rough-woven',
-    'rough/fast',
-    'roughage.',
-    'roughages',
-    'roughan',
-    'rougher-edged',
-    'rougher-hewn',
-    'roughhewn',
-    'roughie-toughie',
-    'roughies',
-    'roughly-drawn',
-    'roughly-laid',
-    'roughly.',
     'rought-roughts',
-    'roughtongill',
-    'roughtor',
-    'rougie',
-    'rouging',
-    'rougon',
-    'rougon-macquart',
-    'rougons',
-    'rouhanyat',
-    'rouhanyoun-e',
-    'rouill&eacute',
-    'rouiller',
-    'rouissi',
-    'rouke',
-    'roule',
-    'roule/1',
     'roulers',
-    'roules',
-    'rouletabille',
-    'rouleur',
-    'roulston',
-    'roumaine',
-    'roumelian',
-    'roummou',
-    'roun\'',
-    'rounce',
-    'rouncing',
-    'rouncy',
-    'round&mdash;during',
-    'round&rehy;who',
-    'round(s)',
-    'round-bag',
     'round-bale',
-    'round-brimmed',
-    'round-buying',
-    'round-cheeked',
-    'round-dance',
-    'round-edged',
-    'round-fac',
-    'round-figurey',
-    'round-head',
-    'round-house',
-    'round-iceland',
-    'round-ireland',
-    'round-journey',
-    'round-keyed',
-    'round-mouths',
-    'round-nosed',
     'round-seeded',
-    'round-shot',
-    'round-shoulder',
-    'round-skulled',
-    'round-table\'',
-    'round-tablers',
-    'round-text',
-    'round-the-',
-    'round-the-corner',
-    'round-the-corner-from-the-truth',
-    'round-the-head',
-    'round-the-house',
-    'round-the-houses',
-    'round-the-legs',
-    'round-the-pole',
-    'round-the-town',
     'round-the-wall',
-    'round-the=world',
-    'round-ticket',
-    'round-toed',
-    'round-topped',
-    'round-tripping',
-    'round-trips',
-    'round-vowelled',
-    'round-wounds',
-    'round.2',
-    'round/flatwound',
-    'round/marketing',
-    'round:oldham',
-    'rounda',
-    'rounded&rehy;off',
-    'rounded-end',
     'rounded-up',
-    'roundell',
-    'roundeyes',
-    'roundham',
-    'roundhand',
-    'roundhay3',
-    'roundheads.',
-    'roundhegians',
-    'roundhole',
-    'roundin\'',
-    'rounding&rehy;up',
-    'rounding-out',
-    'roundings',
-    'roundmouths',
-    'roundnesses',
-    'roundpoint',
     'roundrobin',
-    'roundsfell',
-    'roundsome',
-    'roundstone',
-    'roundup**',
-    'roundwater',
-    'roundway',
-    'rountree',
-    'rouppe',
-    'rouquelaure',
-    'rouquet',
-    'rouquette',
-    'roure',
-    'rourkes',
-    'rouse/mechanic',
-    'roush',
     'rousham',
-    'rousham/oxfordshire',
-    'roushan',
-    'rousillon',
-    'rousin\'',
-    'rouska',
-    'roussain',
-    'roussane',
-    'rousseau-inspired',
-    'rousseauean',
-    'rousseauness',
-    'roussel-uclaf',
-    'rousselle',
-    'rousselot',
-    'rousses',
-    'rout-furniture',
     'routability',
-    'route(s)',
-    'route-finders',
-    'route-flying',
-    'route-giving',
-    'route-letter',
-    'route-marching',
-    'route-name',
-    'route-networks',
-    'route-planning',
-    'route-setter',
-    'route-ways',
-    'route.the',
-    'routeable',
-    'routebaggers',
-    'routery',
     'routes-including',
-    'routestone',
-    'routh/bellringer',
-    'routh/trust',
-    'routin',
-    'routine.she',
-    'routinely-collected',
-    'routines.',
-    'routines.there',
-    'routines/habits',
-    'routing/cross',
-    'routinises',
-    'routinising',
-    'routinize',
-    'routinizing',
-    'routledge/british',
     'routsis',
-    'routtenberg',
-    'rouvres',
-    'roux\'',
-    'roux-en',
-    'rouxinol',
-    'rouxs',
-    'rov1',
-    'rovacabin',
-    'roval',
-    'rovelander',
-    'rover-badged',
-    'rover-engine',
-    'rover-engined',
-    'rover-front',
-    'rover/bae',
     'rover/land',
-    'rover/rover',
-    'rovercoats',
-    'rovered',
-    'roveres',
-    'roveries',
-    'rovers/2nd',
-    'rovesti',
-    'rovetta',
-    'rovin\'',
-    'rovine',
-    'rovingham',
-    'rovkatch',
-    'rovno',
-    'rovuma',
-    'row&mdash;at',
     'row&mdash;church',
-    'row-boats',
-    'row-by-column',
-    'row-crop',
-    'row-in',
-    'row-ow-ow',
-    'row/midfield',
-    'rowak',
-    'rowallan',
-    'rowallane',
-    'rowan-beer',
-    'rowan-berry',
-    'rowan-hamilton',
-    'rowan/brother',
-    'rowanella',
-    'rowany',
     'roward',
-    'rowatt',
-    'rowbottom/aldbourne',
-    'rowbottom/althorp',
-    'rowbottom/aylesbury',
-    'rowbottom/banbury',
-    'rowbottom/bridego',
-    'rowbottom/bullingdon',
-    'rowbottom/calvert',
-    'rowbottom/castle',
-    'rowbottom/central',
-    'rowbottom/eastleigh',
-    'rowbottom/gloucester',
-    'rowbottom/halton',
-    'rowbottom/haydon',
-    'rowbottom/henley',
     'rowbottom/henley-on-thames',
-    'rowbottom/huntercombe',
-    'rowbottom/lower',
-    'rowbottom/nettlebed',
-    'rowbottom/northampton',
-    'rowbottom/northleach',
-    'rowbottom/northmoor',
-    'rowbottom/peppard',
-    'rowbottom/russell',
-    'rowbottom/silverstone',
-    'rowbottom/stone',
-    'rowbottom/taszar',
-    'rowbottom/waddesdon',
-    'rowbottom/weston',
-    'rowbottom/winslow',
-    'rowchester',
     'rowcroft',
-    'rowdie',
-    'rowdiest',
-    'rowdyism\'',
-    'rowdyism.',
-    'rowe/chiropracter',
-    'rowe/village',
-    'rowel',
-    'rowelling',
-    'rowetta-isms',
-    'rowff',
-    'rowhedge',
-    'rowhex',
-    'rowiecki',
-    'rowin',
-    'rowing&rehy;boat',
     'rowing-boats',
-    'rowing-deck',
-    'rowing-oars',
-    'rowing-parties',
-    'rowing-song',
-    'rowing.',
-    'rowington',
-    'rowl',
-    'rowland/bristol',
-    'rowland/wiltshire',
-    'rowlands.',
-    'rowlands/award',
-    'rowlandsonian',
-    'rowlen',
-    'rowley/royal',
-    'rowleys',
     'rowlings',
-    'rowlinson.',
-    'rowlinson/cheltenham',
-    'rowlock',
-    'rown',
-    'rownd',
-    'rownded',
-    'rowplas',
-    'rowsay',
-    'rowsell/smithkline',
-    'rowstock',
-    'rowstock/oxfordshire',
-    'rowswell',
-    'rowth',
-    'roxani',
-    'roxburghes',
     'roxenburg',
-    'roxtown',
-    'roy\'',
-    'roy-lewis',
-    'royal\'',
-    'royal-family',
-    'royal-gold',
-    'royal-standard',
-    'royal-tour-type',
-    'royal-watchers',
-    'royal-watching',
-    'royal-welcome',
-    'royal/yellow',
-    'royale/herreweghe',
-    'royalish',
-    'royalite',
     'royally-directed',
-    'royalties.',
-    'royalties/advances',
-    'royalty-class',
-    'royalty-style',
-    'royat',
-    'royaulme',
-    'royaumont',
-    'roybridge',
-    'roybrook',
-    'roycayrol',
-    'royce.today',
-    'roye',
-    'royle/coaching',
-    'roynet',
-    'roysterer',
     'royston-based',
-    'royston-cambridge',
-    'royston/cawkell',
-    'rozalia',
-    'rozalla',
-    'rozanovas',
-    'rozario\'ssozario',
-    'rozeby',
-    'rozelaar',
-    'rozelle',
-    'rozells',
-    'rozema',
-    'rozencrantz',
-    'rozencranz',
-    'rozes',
-    'rozhen',
     'rozhin',
-    'rozhukaite',
-    'rozynski',
-    'rp&mdash;welfare',
-    'rp-300',
-    'rp-63a',
-    'rp-63a-11-be',
-    'rp-63g',
-    'rp-65',
-    'rp-refah',
-    'rp-ripstop',
-    'rp.10',
-    'rp/',
-    'rp/kapsco',
-    'rp1',
-    'rp2',
     'rp30',
-    'rp300',
-    'rp42,800,000',
-    'rp67580',
-    'rpb6',
-    'rpf&mdash;reformational',
-    'rpg-based',
-    'rpg-for-the-masses',
-    'rpg-to-cobol',
-    'rpg-to-unix',
-    'rpgii',
-    'rpgii-based',
-    'rpis',
-    'rpm/23',
-    'rpmi1640',
-    'rpo/leibowitz',
     'rported',
-    'rposes',
-    'rpq',
-    'rpq-10',
-    'rpr&mdash;rally',
-    'rprc',
-    'rprf',
-    'rps1,500,000',
-    'rps10,370,000',
-    'rps10,400,000',
-    'rps14,300,000',
-    'rps15,000,000',
-    'rps20,000,000',
-    'rps30,500,000',
-    'rps40,180,000',
-    'rps8,900,000',
     'rpsi',
-    'rr&pound;1',
-    'rr-',
-    'rr-tupolev',
-    'rr-we',
-    'rr.7&ndash;12',
-    'rr.8&ndash;11',
-    'rr2',
-    'rr299',
-    'rr3&mdash;8',
-    'rr7',
-    'rr9&mdash;18',
-    'rr=0.67',
-    'rr=1.30',
-    'rr=1.39',
-    'rr=2.9',
     'rr=3.06',
-    'rr=3.1',
-    'rr=4.02',
-    'rr=4.7',
-    'rrage',
-    'rrah',
-    'rrapo',
-    'rrc',
-    'rri/erc',
-    'rrip',
-    'rrls',
-    'rrn',
-    'rrna-based',
-    'rrollsaa',
-    'rrotten',
-    'rrraaagggh',
     'rrremember',
-    'rrroorrrrr',
-    'rrroorrrrrr',
-    'rrrr',
-    'rrrring',
-    'rrrrring',
-    'rrrrrring',
-    'rrrrrrr',
-    'rrrrrrring',
-    'rrrrrrrr',
-    'rs-232/v24',
-    'rs-323',
-    'rs-4ct',
-    'rs-6000',
-    'rs-8v',
-    'rs-random',
     'rs.3,74,000',
-    'rs.4,62,000',
-    'rs.5',
-    'rs/6000-compatible',
-    'rs/6000-derived',
-    'rs/6000-es/9000',
-    'rs/6000-powerpc',
-    'rs/6000s.',
-    'rs/6ooo',
-    'rs/series',
-    'rs/univrs',
-    'rs1',
-    'rs1,000,000',
-    'rs1,190,000',
-    'rs10,000,000',
-    'rs100',
     'rs1000',
-    'rs118,000',
-    'rs130,000',
-    'rs140,000',
-    'rs141,200',
-    'rs150,000',
-    'rs157,500',
-    'rs17,500',
-    'rs170,000',
-    'rs175,000',
-    'rs18,500',
-    'rs19,000',
-    'rs190,000',
-    'rs200,000,000',
-    'rs202,800',
-    'rs2100',
     'rs230,200',
-    'rs232/v24',
-    'rs250,000',
-    'rs258,300',
-    'rs276,900',
-    'rs292,910',
-    'rs3,000,000',
-    'rs31,000',
-    'rs350,000,000',
-    'rs378,000',
-    'rs4,600',
-    'rs420,000,000',
-    'rs453,000',
-    'rs4ct',
-    'rs5',
-    'rs50',
     'rs500,000,000',
-    'rs55,800',
-    'rs5500',
-    'rs562',
-    'rs6,000,000',
-    'rs6,200',
-    'rs6,500',
-    'rs60,000',
-    'rs600,000,000',
-    'rs60000',
-    'rs6000s',
-    'rs64,400',
-    'rs65,000',
-    'rs66,400',
-    'rs68,400',
-    'rs70,000',
     'rs70,950',
-    'rs712',
-    'rs75,000',
-    'rs76,000',
-    'rs80,710',
-    'rs8100',
-    'rs86,000',
-    'rs90',
-    'rs95,500,000',
-    'rs=0.2',
-    'rs=0.4',
-    'rs=0.47',
-    'rs=0.52',
-    'rs=0.57',
-    'rs=0.6',
-    'rs=0.66',
     'rs=0.7',
-    'rsa/ucles',
-    'rsai-rsai',
-    'rsbs',
-    'rsc-1x',
-    'rsc-sponsored',
-    'rsc.3',
-    'rsc/apa',
-    'rsc/bt',
-    'rsc/sci',
-    'rscc',
-    'rscms',
-    'rscn',
-    'rscorder',
-    'rscpa',
-    'rscu-pa',
     'rscv',
-    'rsd',
-    'rsf1',
-    'rsf3',
-    'rsis',
-    'rsjs',
-    'rsl',
-    'rsmb',
-    'rsmooth',
-    'rso/duarte',
-    'rso/gelmetti',
-    'rso/gibson',
-    'rso/kitajenko',
-    'rsort',
-    'rspb-designed',
-    'rspb/aa',
     'rspb/m',
-    'rspca-sponsored',
-    'rspce',
-    'rsponse',
-    'rst',
-    'rt-based',
-    'rt-global',
-    'rt-pa-tnk',
-    'rt97',
-    'rtas',
-    'rtca',
-    'rtcd',
-    'rtecs',
-    'rtelationship',
-    'rteverand',
-    'rtf\'s',
     'rtfm',
-    'rtg7',
-    'rth/iseler',
-    'rthk',
-    'rtia',
-    'rtm322',
-    'rtnet-ftam',
-    'rtnet-tcp',
-    'rtnet-x25/plus',
-    'rtoa',
-    'rtos',
-    'rtpl',
-    'rts.',
-    'rtx',
-    'ru&eacute;e\'',
-    'ru\'uf',
     'ru-200',
-    'ru-486',
-    'ru-ir-os',
-    'ru-o',
-    'ru-tu',
-    'ru200',
-    'ruadbern',
-    'ruam',
-    'ruanda-burundi',
-    'ruanda-urundi',
-    'ruanne',
-    'ruapehu',
-    'ruardean',
-    'ruataniwha',
-    'rub-in',
-    'rub-off',
     'rub-over',
-    'rub-rubbing',
-    'rub-stone',
-    'rub-up-a-gal',
-    'rub-your-face-in-it',
-    'rubab',
-    'ruback',
-    'rubaiya',
-    'rubalcaba',
-    'rubale',
-    'ruban',
-    'ruband',
-    'rubansi',
-    'rubarto',
-    'rubatex',
-    'rubati',
     'rubay',
-    'rubayat',
-    'rubbd',
-    'rubbed-away',
-    'rubbed-down',
-    'rubbed-off',
-    'rubber&rehy;stamped',
-    'rubber-',
-    'rubber-bands',
-    'rubber-cleated',
-    'rubber-coats',
-    'rubber-encased',
-    'rubber-extruding',
-    'rubber-faced',
-    'rubber-flanged',
-    'rubber-gloved',
     'rubber-heeled',
-    'rubber-legged',
-    'rubber-lipped',
-    'rubber-looking',
-    'rubber-monster',
-    'rubber-moulding',
-    'rubber-necking',
-    'rubber-padded',
-    'rubber-plant',
-    'rubber-rich',
-    'rubber-ridged',
-    'rubber-seekers',
-    'rubber-sheathed',
-    'rubber-shredding',
-    'rubber-stamps',
-    'rubber-stringed',
     'rubber-tread',
-    'rubber-tyre',
-    'rubber-tyred',
-    'rubber/leather',
-    'rubberbandman',
-    'rubberbeck',
-    'rubberiness',
-    'rubbermaid',
-    'rubbernecked',
-    'rubbernecks',
-    'rubberplants',
-    'rubbershod',
-    'rubbersoled',
-    'rubberstamped',
-    'rubberware',
-    'rubbi',
     'rubbin\'',
-    'rubbing-marks',
-    'rubbing-post',
-    'rubbish&mdash;they',
-    'rubbish&rehy;bin',
-    'rubbish-as-fuel',
-    'rubbish-bag',
-    'rubbish-bin',
-    'rubbish-burning',
-    'rubbish-chute',
-    'rubbish-collectors',
-    'rubbish-dumping',
-    'rubbish-mongering',
-    'rubbish-per-head',
-    'rubbish-strewn',
-    'rubbish-tip',
     'rubbish.i',
-    'rubbishy.',
-    'rubble-covered',
-    'rubble-lined',
-    'rubble-walling',
-    'rubble.',
-    'rubbles',
-    'rubbling',
-    'rubel',
-    'rubella-damaged',
-    'rubenden',
-    'rubenses',
-    'rubensesque',
-    'rubenshuis',
-    'rubensian',
-    'ruberglas',
     'ruberry',
-    'rubes',
-    'rubescence',
-    'rubey',
-    'rubible',
-    'rubicon-crossing',
-    'rubicundus',
-    'rubidium-doped',
-    'rubidoux',
-    'rubidus',
-    'rubifrons',
-    'rubine',
-    'rubins',
-    'rubinshteyn',
-    'rubinstein/diacono',
-    'rubinstein/report',
     'rubisco',
-    'rubiya',
-    'rubletsky',
-    'rublyov',
-    'rubner',
-    'rubout',
-    'rubrianum',
-    'rubricalities',
-    'rubrication',
-    'rubrirostris',
-    'rubriventralis',
-    'rubruck',
-    'rubu',
-    'rubusana',
-    'ruby-bright',
-    'ruby-faced',
     'ruby-mauve',
-    'ruby-ringed',
-    'rubyfruit',
-    'rubys',
-    'rubython',
-    'ruc&rehy;garda',
-    'rucajinternal',
-    'rucatse',
-    'ruccolen',
-    'ruchardson',
-    'ruche',
-    'ruchuphandeputy',
-    'ruck/company',
-    'rucked-up',
-    'ruckinge',
-    'ruckle',
     'ruckledge',
-    'ruckman',
-    'rucksack/suitcase',
-    'rucksacked',
-    'rucksana',
-    'ruckstandsbeseitigung',
-    'ruckwick',
-    'rucwas',
-    'rudabanya',
-    'rudai',
-    'rudaragi',
-    'rudchester',
-    'ruddel',
-    'rudden',
-    'rudder-pedal',
-    'rudder-trimming',
     'rudder-waggling',
-    'rudder/aileron',
-    'rudder/dihedral',
-    'rudder/low',
-    'ruddering',
-    'rudderlessness',
-    'ruddervator',
-    'ruddervators',
-    'ruddes',
-    'ruddied',
-    'ruddies',
-    'ruddily',
-    'ruddily-lit',
-    'rudding',
-    'ruddy-brown',
-    'ruddys',
     'rude-boys',
-    'rude-noise',
-    'rudel',
-    'rudeley',
-    'rudels',
-    'ruden',
-    'rudenesses',
-    'rudgard',
-    'rudgard/bulmer',
-    'rudgley',
-    'rudgwick',
-    'rudha',
-    'rudibus',
-    'rudimentarily',
-    'rudinger',
-    'rudis',
     'rudist',
-    'rudistid',
-    'rudistids',
-    'rudjak',
-    'rudjer',
-    'rudko',
-    'rudolfian',
-    'rudolfine',
-    'rudolphe',
-    'rudolphs',
-    'rudolphshohe',
-    'rudrapatna',
-    'rudraprayag',
-    'rudstone',
-    'rudus',
-    'rudwick',
     'rudz',
-    'rue-des',
-    'rue-formica',
-    'rue/curator/pitt',
-    'ruefuly',
-    'ruegg',
-    'rueil-malmaison',
-    'ruellan',
-    'ruelle',
-    'rueschmeyer',
-    'ruet',
-    'ruetschi',
-    'rueval',
-    'rufe',
-    'rufeno',
-    'rufer',
     'ruff-collar',
-    'ruff-core',
-    'ruff-diamond',
-    'ruff-sized',
-    'ruffett',
-    'ruffianism\'',
-    'ruffili',
-    'ruffilli',
-    'ruffle-edged',
-    'ruffle-fronted',
-    'ruffler',
-    'rufflers',
-    'ruffner',
-    'ruffruff',
-    'ruffus',
-    'ruffy',
     'rufin',
-    'rufisque',
-    'rufo-villosum',
-    'rufolo',
-    'rufous-brown',
-    'ruft',
-    'rufug',
-    'ruful',
-    'rug-brilliance',
-    'rug-chested',
-    'rug-laden',
-    'rug-loss',
-    'rug-maker',
-    'rug-scattered',
-    'rug-sized',
-    'rug-smart',
     'rug-wearing',
-    'rug-wisdom',
-    'rug/blanket',
-    'rugabella',
-    'rugatus',
-    'rugbeian',
-    'rugby-conscious',
-    'rugby-crazy',
-    'rugby-mad',
-    'rugby-medicos',
-    'rugby-players',
-    'rugby-shirt',
-    'rugby-shirted',
-    'rugby-soccer',
-    'rugby-tackled',
-    'rugby-tackling',
     'rugby-watching',
-    'rugby29pts',
-    'rugbyclass',
-    'rugbyman',
-    'rugbymans',
-    'rugbymen',
-    'ruge',
-    'rugelach-it',
-    'rugely',
-    'rugenera',
-    'ruger/mac',
-    'rugged-looking',
-    'ruggedising',
-    'ruggelde',
-    'rugger-blue',
-    'rugger-bugger',
     'rugger-player',
-    'ruggered',
-    'ruggers',
-    'ruggieros',
-    'rugging',
-    'ruggish',
-    'ruggitis',
-    'rughani',
-    'rughe',
-    'rugier',
-    'rugless',
-    'rugmaker',
-    'rugmaking',
-    'rugose.',
-    'rugosus',
-    'rugs.',
     'rugunda',
-    'ruhakana',
-    'ruhaniyat',
-    'ruhbc',
-    'ruhee',
-    'ruhieben',
-    'ruhr/benelux',
-    'ruhrberg',
-    'ruhumuliza',
-    'ruiari',
-    'ruijter',
-    'ruilin',
-    'ruiminn',
-    'ruin-studded',
-    'ruin-theory',
-    'ruinam',
     'ruins.s',
-    'ruint',
-    'ruiru',
-    'ruise&ntilde;ada',
-    'ruisi',
-    'ruiss&egrave;le',
-    'ruisseler',
-    'ruisselle',
-    'ruissian',
-    'ruiter',
-    'ruiz-perez',
-    'ruizinterior',
-    'rujeka',
-    'ruju',
-    'ruk',
-    'ruka-ruka-row',
     'rukba',
-    'rukhsana',
-    'rukiya',
-    'ruldolf',
-    'rule&mdash;notably',
-    'rule&rehy',
-    'rule&rehy;governed',
-    'rule&rehy;making',
-    'rule\'',
-    'rule-',
-    'rule-articulated',
-    'rule-beater',
-    'rule-change',
-    'rule-definition',
-    'rule-dependent',
-    'rule-enforcer',
     'rule-enforcing',
-    'rule-follower',
-    'rule-generated',
-    'rule-hard',
-    'rule-maker',
-    'rule-obeying',
-    'rule-observing',
-    'rule-order',
-    'rule-orientated',
-    'rule-response',
-    'rule-specification',
-    'rule-structure',
-    'rule.the',
-    'rule/tenant',
-    'ruled--in',
-    'ruled-based',
     'ruleless',
-    'ruler-ideologue',
-    'ruler-portraits',
-    'ruler-subject',
-    'rulers.',
-    'rulers_in_the_light',
-    'rules&mdash;for',
-    'rules&mdash;gives',
-    'rules-discretion',
-    'rules-of-the-road',
-    'rules-to',
-    'rules/heuristics',
-    'rules/options',
-    'rules_as',
-    'rum\'n',
-    'rum\'un',
     'rum-based',
-    'rum-bubber',
-    'rum-chaser',
-    'rum-laced',
-    'rum-runners',
-    'rum-stick-a-bum',
-    'rum-te-tum',
-    'ruma',
-    'rumailah',
-    'rumals',
-    'rumania&mdash;larousse',
-    'rumania/1990',
-    'rumanian/russian',
-    'rumbaughs',
-    'rumbek',
-    'rumbledethumps',
     'rumbledub',
-    'rumbly',
-    'rumbos',
-    'rumbustiously',
-    'rumbustiousness',
-    'rumby',
-    'rumeila',
-    'rumesh',
-    'rumessen',
-    'rumfitt',
-    'rumillajta(rumillajta)',
-    'ruminant-like',
-    'ruminantium',
-    'rumjahn',
-    'rummage-room',
-    'rummage-search',
     'rumman',
-    'rummelsburg',
-    'rummidge-wallsbury',
-    'rumo',
-    'rumori',
-    'rumour-filled',
-    'rumour-machine',
-    'rumour-mill',
-    'rumour-monger',
-    'rumour-mongering',
-    'rumoured-to-be-great',
-    'rumoursville',
-    'rump-fed',
-    'rump-to-rump',
-    'rumpburger',
-    'rumped',
     'rumph',
-    'rumphius',
-    'rumpier',
-    'rumple-headed',
-    'rumpled-looking',
-    'rumplemeyers',
-    'rumplers',
-    'rumpo-epics',
-    'rumpoe',
-    'rumpuses',
-    'rumpy-humped',
-    'rumpy-pumpy',
-    'rumpy-risers',
-    'rumsay',
-    'rumskin',
-    'rumtickle',
     'run&mdash;circa',
-    'run&mdash;i',
-    'run&rehy;getter',
-    'run\'',
-    'run-a-brite',
-    'run-all-day',
-    'run-away',
-    'run-back',
-    'run-down-at-the-end-of-a-long-hard-term',
-    'run-ed',
-    'run-gathering',
-    'run-getter',
-    'run-makers',
-    'run-of',
-    'run-of-mill',
-    'run-of-mine-material',
     'run-of-paper',
-    'run-of-the',
-    'run-of-the-hill',
-    'run-ons',
-    'run-responsive',
-    'run-rig',
-    'run-riot',
-    'run-round-platforms-collecting-things',
-    'run-swimshoot-horseride-fence',
-    'run-tally',
-    'run-to-failure',
-    'run-ways',
-    'run-xxxx',
-    'run.program',
-    'run.two',
-    'run/don\'t-run',
     'run/shot',
-    'run/win',
-    'run_out',
-    'runaid',
-    'runair',
-    'runaways/girlschool/rock',
-    'runcible',
-    'runcimann',
-    'runcologist',
-    'runcorn-widnes',
-    'runcton',
-    'rundenko',
-    'rundfunkhaus',
-    'rundhof',
-    'rundschau',
-    'rune-based',
     'rune-chased',
-    'rune-friezed',
-    'rune-inscribed',
-    'rune-painted',
-    'rune-scribed',
-    'rune-signs',
-    'rune-stippled',
-    'rune-strewn',
-    'rune-woven',
-    'runedaubed',
-    'runelight',
-    'runestone',
-    'runfold',
-    'runford',
-    'runged',
-    'rungless',
     'runham',
-    'runhbury',
-    'runhide',
-    'runically',
-    'runich',
-    'runless',
-    'runlet',
-    'runlets',
-    'runnacles',
-    'runnalls',
-    'runnan',
-    'runne',
-    'runnelled',
-    'runnelling',
-    'runnen',
-    'runner\'s-up',
     'runner-beans',
-    'runner/bounty',
-    'runnering',
-    'runners-',
-    'runners-searching',
-    'runners/signalmen',
-    'runnerup',
-    'runnin',
-    'runnin\'-board',
-    'running-',
-    'running-boy',
-    'running-i',
-    'running-out',
-    'running-shoe',
-    'running-slip',
-    'running-stitch',
     'running-the',
-    'running-through-the-woods',
-    'running-time',
-    'running/fitness',
-    'running/jogging',
-    'running/minimised',
-    'running/nike',
-    'running_away',
-    'running_out',
-    'runnings-down',
-    'runnington',
-    'runnis',
-    'runnit',
-    'runnner',
-    'runnymead',
-    'runours',
     'runouts',
-    'runpasts',
-    'runs/',
-    'runs/time',
-    'runs=0:03',
-    'runs=0:06',
-    'runs=0:30',
-    'runs=0:45',
-    'runs=1:15',
-    'runs=1:15est',
-    'runs=1:30est',
-    'runs=1:40est',
-    'runs=1:45',
-    'runs=2:00est',
-    'runs=2:05',
-    'runs=2:15',
     'runs=3:00',
-    'runsince',
-    'runt-like',
-    'runted',
-    'runty',
-    'runway(s)',
-    'runway-wrecking',
-    'runway.',
-    'runwell',
-    'ruog',
-    'ruoru',
-    'ruota',
-    'rupasena',
-    'rupaul',
-    'rupee-rouble',
-    'rupert-\'only',
     'rupertus',
-    'rupf',
-    'ruphin',
-    'rupia',
-    'rupiahs',
-    'rupkotha',
-    'rupolei',
-    'ruport',
-    'ruppel',
-    'ruptural',
-    'rupununi',
-    'rupy',
-    'rur',
-    'rural-agrarian',
-    'rural-owned',
-    'rural-proletarian',
     'rural-rural',
-    'rural-seeming',
-    'rural-style',
-    'rural-type',
-    'rural/inner',
-    'rural/social/age',
-    'rurali',
-    'ruralise',
-    'ruralization',
-    'ruralizing',
-    'rurally-based',
-    'rurals',
-    'rurange',
-    'rurar',
-    'rurbanization',
-    'rure',
     'rurgh',
-    'rurghhh',
-    'rurik',
-    'ruropolis',
-    'ruror',
-    'rusakov',
-    'rusalki',
-    'rusanen',
-    'rusbridge',
-    'rusbridger/former',
-    'ruscello',
-    'ruscoe.',
-    'rusday',
-    'ruse-giurgiu',
-    'rusel',
-    'ruseler',
     'ruseler/itn',
-    'rusesetings',
-    'rush-beds',
-    'rush-candle',
-    'rush-immediate',
-    'rush-job',
-    'rush-laid',
-    'rush-leek',
-    'rush-of-blood',
-    'rush-release',
-    'rush-rush-rush',
-    'rush.',
-    'rush/clough/saunders/atkinson/whittingham',
-    'rusham',
-    'rushand',
-    'rushbury',
     'rushby/product',
-    'rushdie-like',
-    'rushdie.',
-    'rushe',
-    'rushenden',
-    'rushent',
-    'rushesha',
-    'rushey',
-    'rushford',
-    'rushhour',
-    'rushillon',
-    'rushin\'',
-    'rushings',
-    'rushleigh',
-    'rushlift',
-    'rushmer',
     'rushout-bowles',
-    'rushpool',
-    'rushtah',
-    'rushyford-woodham',
-    'rusi',
-    'rusing',
-    'rusins',
-    'rusked',
-    'ruski',
-    'ruskin-ian',
-    'rusko',
-    'russ/wiltshire',
-    'russa',
-    'russborough',
-    'russell-copleston',
-    'russell-stoneham',
     'russell/artist',
-    'russell/bishop',
-    'russell/england',
-    'russell/gloucestershire',
-    'russell/plant',
-    'russelling',
-    'russen',
-    'russet-and-black',
-    'russet-and-orange-coloured',
-    'russet-brown',
-    'russet-browns',
-    'russet-orange',
-    'russet-toned',
-    'russetts',
-    'russety',
-    'russety-greenish',
     'russia\'a',
-    'russia-wide',
-    'russia.richard',
-    'russia.the',
-    'russian&rehy;dzhungar',
-    'russian-',
-    'russian-accented',
-    'russian-austrian',
-    'russian-backed',
-    'russian-belorussian',
-    'russian-caught',
-    'russian-chilean',
-    'russian-controlled',
-    'russian-cuban',
-    'russian-educated',
-    'russian-european',
     'russian-french',
-    'russian-georgian',
-    'russian-italian',
-    'russian-kirgiz',
-    'russian-lithuanian',
-    'russian-manufactured',
-    'russian-norwegian',
-    'russian-orientated',
-    'russian-owned',
-    'russian-polish',
-    'russian-produced',
-    'russian-roulette',
-    'russian-speakers',
-    'russian-teleut',
-    'russian-turkish',
-    'russian-us',
     'russian/',
-    'russian/mongolian',
-    'russianism',
-    'russianization',
-    'russianized',
-    'russianizing',
-    'russianness',
-    'russians.',
-    'russify',
-    'russin',
-    'russkaya',
-    'russki',
-    'russkoye',
-    'russo&rehy;bulgarian',
-    'russo&rehy;japanese',
-    'russo-american',
     'russo-french',
-    'russo-georgian',
-    'russo-indian',
-    'russo-polish',
-    'russo-serbian',
-    'russo-swedish',
-    'russocentric',
-    'russojapanese',
-    'russon/hereford',
-    'russon/sports',
-    'russophile',
-    'russum',
-    'rust-blood',
-    'rust-buckets',
-    'rust-eaten',
-    'rust-pink',
     'rust-preventer',
-    'rust-proofed',
-    'rust-stained',
-    'rusta',
-    'rustenburg-1',
-    'rustewellee',
-    'rustic-bridge',
-    'rustic-effect',
-    'rustic-looking',
-    'rustic-sounding',
-    'rustically',
-    'rustichelli',
-    'rustick',
-    'rusticola',
-    'rusticorum',
-    'rusticos',
     'rusticum',
-    'rustier',
-    'rustiest',
-    'rustik',
-    'rustiques',
-    'rustom',
-    'rustow',
-    'rusts-free',
-    'rustu',
-    'rustum',
-    'rusty-black',
-    'rusty-coloured',
-    'rusty-orange',
-    'rusty-pink',
-    'rusty-sounding',
-    'rusty-voiced',
     'rusty.',
-    'rusu',
-    'rusuku',
-    'rusukutransport',
-    'rusyny',
-    'rutan&rehy;designed',
-    'rutan-designed',
-    'rute',
-    'rutenois',
-    'rutenspitz',
-    'rutgeerts',
-    'ruth-baby',
-    'ruth-baiting',
-    'ruth-type',
-    'ruth_as_well',
-    'ruthanna',
     'ruthcote',
-    'ruthen',
-    'ruthenbeck',
-    'ruthenium-103',
-    'ruthenium-106',
-    'ruther',
-    'rutherfurd',
-    'ruthertord',
-    'ruthlessly-applied',
-    'ruthus',
-    'ruthven\'',
-    'ruthwell',
-    'rutigliano/nfl',
-    'rutile',
-    'rutin',
-    'rutishauser',
     'rutkiewicz',
-    'rutkowski',
-    'rutland.and-melton',
-    'rutlandshire',
-    'rutminster',
-    'rutter/boat',
-    'rutter/council',
-    'rutter/labour',
-    'ruttish',
-    'ruttle',
-    'ruttmann',
-    'ruttner',
-    'rutundifolia',
-    'ruud-pedersen',
-    'ruvina',
-    'ruvuma',
     'ruwahutu',
-    'ruweishad',
-    'ruweti',
-    'rux',
-    'rux-burton',
-    'ruxandra',
-    'ruxpin',
-    'ruysbroeck',
-    'ruysdal',
-    'ruyssenaars',
-    'ruz.full',
-    'ruzici',
-    'ruzicka',
-    'ruzizi-ii',
-    'ruzsa',
-    'rv-',
     'rv8s',
-    'rvcma',
-    'rvcvma',
-    'rvealed',
-    'rvolutionary',
-    'rvs',
-    'rw382/g&ndash;xvia',
-    'rw382/g-xvia',
-    'rw450',
-    'rw500',
-    'rwa',
-    'rwaje',
-    'rwamba',
-    'rwanda*',
-    'rwandaise',
-    'rwandanese',
     'rwandese',
-    'rwe-dea',
-    'rwell',
-    'rwp(t)',
-    'rx-360',
-    'rx-l',
-    'rx-v600',
-    'rx03',
-    'rx17',
-    'rx22',
-    'rxd1',
-    'rxd1+',
-    'rxd5+',
-    'rxd5+&verbar&verbar;nd7&verbar&verbar',
-    'rxe6',
-    'rxev6',
     'rxf1',
-    'rxf1+',
-    'rxf7',
-    'rxf8+',
-    'rxfs',
-    'rxg4',
-    'rxg6',
-    'rxq',
-    'ry&uacute;ky&uacute;ans',
-    'rya-approved',
-    'ryabev',
-    'ryabtsev',
-    'ryad-i',
-    'ryal',
-    'ryalle',
-    'ryals',
     'ryan-land',
-    'ryan/headmaster',
-    'ryan/shanks',
-    'ryan/skin',
-    'ryanair',
-    'ryani',
-    'ryazan-uralsk',
-    'ryazanova/parent',
-    'ryazhsk-morshansk',
-    'rybakov',
-    'rybn&aacute',
-    'rybnitsa',
-    'rychard',
-    'rychta',
-    'rydales',
-    'ryder/project',
     'rydman',
-    'rydz',
-    'rye-bread',
-    'rye-grass.',
-    'rye-wheat',
-    'rye/midrips',
-    'ryebank',
-    'ryecart',
-    'ryeland',
-    'ryemark',
-    'ryemarks',
-    'ryenses',
-    'ryer',
-    'ryford',
-    'ryghtwysnes',
-    'ryhall',
     'ryhskmxhwyusghwwmlqwmspleujdm',
-    'ryiance',
-    'ryja',
-    'ryke',
-    'rykodisc',
-    'ryland/friend',
-    'rylander',
-    'rylane',
-    'ryley/',
-    'ryley/abingdon',
-    'ryley/aylesbury',
-    'ryley/cam',
-    'ryley/charlton',
-    'ryley/cheltenham',
-    'ryley/chinnor',
-    'ryley/five',
     'ryley/forest',
-    'ryley/frilford',
-    'ryley/gloucester',
-    'ryley/great',
-    'ryley/henley',
-    'ryley/london',
-    'ryley/mike',
-    'ryley/stow',
-    'ryley/sudeley',
-    'ryley/woodford',
-    'rylock',
-    'rymax',
-    'rymer/charity',
-    'rymer/one',
-    'ryming',
-    'rymouth',
     'rymyng',
-    'rynand',
-    'rynearson',
-    'rynek',
-    'ryng',
-    'rynhart',
-    'rynning',
-    'ryno',
-    'rynoikism',
-    'ryo',
-    'ryoanji',
-    'ryoichi',
-    'ryoji',
-    'ryokan-style',
-    'ryopteris',
-    'ryosuke',
     'ryots',
-    'rypien',
-    'ryr1',
-    'ryrie',
-    'rysa',
-    'ryse',
-    'ryskamp',
-    'ryskov',
-    'ryston',
-    'ryszkowski',
-    'rythme',
-    'rythmically',
-    'rythmn',
-    'rythum',
-    'rythwysnesse',
-    'ryuji',
     'ryukin',
-    'ryumin',
-    'ryzhkov&mdash;chair',
-    'rz',
-    'rz-4',
-    'rz1032',
-    'rzeczpospolita',
-    'rzeczypospolitej',
-    'rzeszewski',
-    'rzevski',
-    'rzr',
-    's&aacute',
-    's&aacute;zava',
-    's&acirc;one',
-    's&acirc;one-doubs',
-    's&aelig;bol',
     's&aelig;culi',
-    's&agrave;nchez',
-    's&amp;a',
-    's&amp;p100',
-    's&aring;rj&aring;sjaure',
-    's&aring;rj&aring;sjaurestugan',
-    's&aring;rsj&aring;sjaure',
-    's&auml;ure-di&auml;thylamid',
-    's&bsol;described',
-    's&dollar;1,330',
-    's&dollar;1,500',
-    's&dollar;1,900',
-    's&dollar;1.2',
-    's&dollar;1.5',
-    's&dollar;10/sq',
-    's&dollar;100,000',
     's&dollar;101.808bn',
-    's&dollar;12.1bn',
-    's&dollar;14,100',
-    's&dollar;14,600',
-    's&dollar;142m',
-    's&dollar;15,600',
-    's&dollar;15,800',
-    's&dollar;17,100',
-    's&dollar;17,200',
-    's&dollar;2.58',
-    's&dollar;2.9bn',
-    's&dollar;200,000',
-    's&dollar;200m',
-    's&dollar;22,867',
-    's&dollar;23.131bn',
-    's&dollar;230,000',
     's&dollar;236',
-    's&dollar;246',
-    's&dollar;2m',
-    's&dollar;3,500',
-    's&dollar;4,900',
-    's&dollar;5,300',
-    's&dollar;5/sq',
-    's&dollar;5bn',
-    's&dollar;636',
-    's&dollar;7,200',
-    's&dollar;70',
-    's&dollar;750',
-    's&dollar;800,000',
-    's&dollar;800m',
-    's&dollar;90',
-    's&dollar;95,200',
     's&dollar;l',
-    's&eacute;amas',
-    's&eacute;ance',
-    's&eacute;ances',
-    's&eacute;bastien',
-    's&eacute;choir-',
-    's&eacute;cure',
-    's&eacute;ez',
-    's&eacute;guy',
-    's&eacute;kou',
-    's&eacute;kou-tour&eacute',
-    's&eacute;l&eacute',
-    's&eacute;lincourt',
-    's&eacute;mantiqe',
-    's&eacute;millon',
-    's&eacute;millon-chardonnay',
     's&eacute;n&eacute;chauss&eacute;es',
-    's&eacute;n&eacute;schauss&eacute;e',
-    's&eacute;nieur',
-    's&eacute;par&eacute;e',
-    's&eacute;para',
-    's&eacute;parant',
-    's&eacute;paration',
-    's&eacute;raphin',
-    's&eacute;rgio',
-    's&eacute;ries',
-    's&eacute;rieux',
-    's&eacute;rusier',
-    's&eacute;tif',
-    's&eacute;vign&eacute',
-    's&egrave;che-cheveu',
-    's&egrave;che-cheveux',
     's&gt',
-    's&iacute;mon',
-    's&lstrok;upia',
-    's&mdash',
-    's&mdash;white',
-    's&ndash;412',
-    's&ndash;55t',
-    's&ndash;dies',
-    's&ndash;ex',
-    's&ndash;ould',
-    's&oacute',
-    's&oacute;ller',
-    's&ocirc;ro',
-    's&oslash;rkapp',
-    's&ouml;-fugl&ouml;ya',
-    's&ouml;derberg',
     's&ouml;dert&auml;lje',
-    's&ouml;derta',
-    's&ouml;rdalen',
-    's&ouml;rensen',
-    's&rarr;a&rarr;b&rarr;c&rarr;d&rarr;e&rarr;p',
-    's&rarr;r',
-    's&rgr;t',
-    's&uacute;arez',
-    's&uacute;illeabh&aacute;in',
-    's&uacute;lukongur',
-    's&ugrave',
-    's&uuml;dtiroler',
-    's&uuml;her',
-    's&uuml;khbaatar',
-    's&uuml;ncler',
-    's&uuml;nde',
     's&uuml;nder',
-    's&uuml;ren',
-    's&uuml;rm&eacute',
-    's&uuml;ssner',
-    's&yacute;rovou',
-    's\'&eacute;lev&egrave;rent',
-    's\'&eacute;prouve',
-    's\'&eacute;tendant',
-    's\'adresser',
-    's\'akhu',
-    's\'ascose',
-    's\'assurer',
-    's\'awricht',
-    's\'been',
-    's\'blood',
-    's\'easy',
     's\'ennuie',
-    's\'express',
-    's\'funny',
-    's\'great',
-    's\'hertogenbosch',
-    's\'i',
-    's\'impose',
-    's\'io',
-    's\'ish',
-    's\'it',
-    's\'just',
-    's\'major',
-    's\'me',
-    's\'n',
-    's\'occulte',
-    's\'only',
     's\'oton',
-    's\'partly',
-    's\'right',
-    's\'ss\'arian',
-    's\'thampton',
-    's\'the',
-    's(wing)',
-    's(y)',
-    's**',
-    's*u',
-    's-12',
-    's-1e',
-    's-1s',
-    's-2251',
-    's-2a',
-    's-2f',
     's-300',
-    's-35',
-    's-3t',
-    's-4/10',
-    's-4/630',
-    's-4/670',
-    's-4/690',
-    's-45',
-    's-5',
-    's-58h',
-    's-61n',
-    's-7',
-    's-70a',
-    's-76',
-    's-a-d',
-    's-adenosyl-&lsqb',
     's-aids',
-    's-bus',
-    's-cargo',
-    's-curve',
-    's-datp',
-    's-e-v-e-n',
-    's-e-x',
-    's-e-x.',
-    's-energy',
-    's-express',
-    's-f',
-    's-family',
-    's-for-sugar',
-    's-gilmour',
-    's-h',
-    's-he',
     's-hooks',
-    's-i-1983',
-    's-ing',
-    's-l-o-w',
-    's-language',
-    's-languages',
-    's-monkton',
-    's-ms',
-    's-n-n-r-r-r-l-l',
-    's-nitrosothiol',
-    's-o-n',
-    's-o-r',
-    's-o-s',
-    's-painful',
-    's-phase-dependent',
-    's-plane.',
     's-pulse',
-    's-rechem',
-    's-record',
-    's-registration',
-    's-rosyth',
-    's-s-s',
-    's-s-s-say',
-    's-s-s-six',
-    's-s-said',
-    's-s-sorry',
-    's-sam',
-    's-say',
-    's-scandal',
-    's-see',
-    's-sell',
-    's-sent',
     's-seriously',
-    's-sevens',
-    's-shall',
-    's-shapes',
-    's-sigmund',
-    's-silly',
-    's-sit',
-    's-sometimes',
-    's-spain',
-    's-specification',
-    's-spin',
-    's-stability',
-    's-stay',
-    's-staying',
-    's-straps',
-    's-such',
     's-suggest',
-    's-swimming',
-    's-terminal',
-    's-trap',
-    's-u-n',
-    's-w',
-    's-warmth',
-    's.-g.',
-    's.08',
-    's.1(3)(a)(b)(c)',
-    's.1(4).',
-    's.1(l)',
-    's.1.',
-    's.103',
-    's.107(1)',
-    's.107(4)',
     's.108(1)',
-    's.10b',
-    's.11(1)',
-    's.11(2)',
-    's.118',
-    's.12(6)',
-    's.12(c)',
-    's.128',
-    's.128(1)',
-    's.13(2)',
-    's.13(3)',
-    's.13(31)',
-    's.132',
-    's.138(1)',
-    's.139(2)',
-    's.139(l).',
     's.139(t)',
-    's.14(e)',
-    's.141.',
-    's.15(3)',
-    's.15(4)',
-    's.170',
-    's.175',
-    's.177',
-    's.177(1)',
-    's.178(1)',
-    's.178(1)-(2)',
-    's.178(2)',
-    's.18(2)',
-    's.180(1)',
-    's.193',
-    's.199',
     's.1xk532',
-    's.200(1)',
-    's.202b',
-    's.204',
-    's.20a(a)',
-    's.21(a)',
-    's.213',
-    's.22',
-    's.222',
-    's.226',
-    's.23(2)',
-    's.23(2)1',
-    's.24(3)',
-    's.245b',
-    's.246',
-    's.25(3)',
     's.25(7)',
-    's.253',
-    's.259(1)',
-    's.26(10)',
-    's.26(2)',
-    's.26(6)',
-    's.27',
-    's.272',
-    's.278',
-    's.28(1)',
-    's.28(3)',
-    's.283',
-    's.283(1)',
-    's.290(1)',
-    's.2b',
-    's.2km',
     's.2r-t34',
-    's.3(6a)',
-    's.30(1)',
-    's.309',
-    's.31(1)',
-    's.31(2)',
-    's.31(8)',
-    's.32',
-    's.32(2)',
-    's.32(7)',
-    's.32(a)',
-    's.325',
-    's.327',
-    's.329',
-    's.33',
-    's.33(6)',
     's.343',
-    's.35',
-    's.35(l)',
-    's.36(8)',
-    's.37(2)',
-    's.38(3)',
-    's.39(4)',
-    's.39(8)',
-    's.4(1).',
-    's.4(2)&mdash',
-    's.4(5)',
-    's.4(a)',
-    's.4.',
-    's.40',
-    's.41(1)',
-    's.42',
     's.42(4)',
-    's.427.',
-    's.43(1a)',
-    's.44',
-    's.45',
-    's.46',
-    's.48',
-    's.49',
-    's.5(2)&mdash',
-    's.5(5)',
-    's.50(d)',
-    's.50a(2)',
-    's.50b(2)',
-    's.50b(3)',
-    's.51(2)',
-    's.52(1)',
     's.54(6)',
-    's.58(1)',
-    's.6(b)',
-    's.6(c)',
-    's.61b.',
-    's.61c.',
-    's.61d.',
-    's.61e.',
-    's.63(1)',
-    's.64(2)',
-    's.66',
-    's.67',
-    's.68',
-    's.686',
-    's.69(1)',
-    's.7&ndash;10',
     's.7(3)',
-    's.7(5)',
-    's.703',
-    's.73(5)',
-    's.75(1)1',
-    's.76',
-    's.76(4)',
-    's.77',
-    's.78(3)',
-    's.8(3)',
-    's.8/8',
-    's.84',
-    's.87',
-    's.9(2)',
-    's.90',
-    's.92&ndash;3',
     's.92(2)',
-    's.94(1)',
-    's.94(5)4',
-    's.96',
-    's.97',
-    's.a.d',
-    's.a.e.for',
-    's.a.e.s',
-    's.a.m.e',
-    's.a.r.',
-    's.a.r.a',
-    's.a.r.l.',
-    's.a.r.u.',
-    's.a.s',
-    's.a.w.',
-    's.a.y.s.f.',
     's.arnold',
-    's.ashton',
-    's.b.o.',
-    's.bordelaises',
-    's.c.c.a.c.',
-    's.c.h',
-    's.c.i.',
-    's.c.l.r.',
-    's.c.m.o.',
-    's.c.u.m',
-    's.capillifolium',
-    's.crowe',
-    's.d',
-    's.d.=',
-    's.d.d.',
-    's.d.s.',
     's.e.5as',
-    's.e.a.l.s',
-    's.e.a.t.',
-    's.e.b.',
-    's.e.c.',
-    's.e.n.',
-    's.e.r.',
-    's.e.s',
-    's.f.x.',
-    's.g.c.p.',
-    's.h.0',
-    's.h.0.',
-    's.h.e',
-    's.hahn',
-    's.harris.',
-    's.i(3)',
     's.i.newhouse',
-    's.i.s.',
-    's.i.s.i.',
-    's.iii',
-    's.inglis',
-    's.iu',
-    's.iv',
-    's.j.perelman',
-    's.j.phillips',
-    's.kilda',
-    's.l.g.a',
-    's.l.mcknight',
-    's.l.t.299',
-    's.l.u.',
-    's.l.u.t.',
-    's.l0',
     's.le',
-    's.lepine',
-    's.m.a.t.v.',
-    's.m.d.',
-    's.m.e',
-    's.mather',
-    's.o.b',
-    's.o.s',
-    's.o.u.',
-    's.o.u.s.a.',
-    's.obliquus',
-    's.p.b.',
-    's.p.e.s.',
-    's.p.k.',
-    's.p.s.t.',
-    's.parish',
     's.pit',
-    's.r.b.',
-    's.r.crockett',
-    's.r.d.t.',
-    's.r.j.walsh',
-    's.r.s.',
-    's.rn',
-    's.rowsen',
-    's.s.o.s',
-    's.s.ray',
-    's.s.s.i.',
-    's.s6',
-    's.schall',
-    's.shiels',
-    's.si',
-    's.sin',
     's.swans',
-    's.swift',
-    's.t.a.r.t',
-    's.t.l.',
-    's.t.s',
-    's.t.s.o.s/t.s.os',
-    's.t.u.c.',
-    's.today/lunch/zmu/1/11/93',
-    's.u.',
-    's.v.',
-    's.v.d.p.',
-    's.v.p.',
-    's.vio',
-    's.volmer',
-    's.w.1.',
-    's.w.2d',
     's.w.3',
-    's.w.i.',
-    's.w.k.f.a.',
-    's.w.r.',
-    's.wed',
-    's.west',
-    's.wyn',
-    's/&dgr;d',
-    's/&radic;n',
-    's/1466',
-    's/957/91/',
-    's/a',
-    's/c',
-    's/dms',
-    's/drms',
-    's/foam',
     's/g2',
-    's/n43',
-    's/pine',
-    's/res',
-    's/s',
-    's/t183021/10med',
-    's/tdy',
-    's/v',
-    's/wheat',
-    's/x',
-    's/y',
-    's0*w\'0',
-    's03',
-    's041',
-    's05',
-    's0ds',
     's0quire',
-    's1&ndash;240c-32',
-    's1&ndash;85g-8',
-    's1&ndash;s3',
-    's1(10)',
-    's1(a)',
-    's1*w\'1',
-    's1-lc',
-    's1.1',
-    's1/n',
-    's10(7)',
-    's10/21',
-    's1002',
-    's101(1)',
-    's102(2)',
-    's102(3)',
     's102(6).',
-    's103(5)',
-    's103(6)',
-    's103(7)',
-    's1032',
-    's104(1)',
-    's105',
-    's105(6)',
-    's109',
-    's11(c)',
-    's110(2)',
-    's113a',
-    's116',
-    's11a(4)',
-    's11s',
-    's12(2)',
     's12(4)',
-    's12(5)',
-    's120\'s',
-    's125',
-    's130',
-    's131(1)',
-    's131(1).',
-    's131(7)',
-    's136',
-    's137/83',
-    's138(1)',
-    's13a',
-    's13a(2)&mdash;this',
-    's13a(2).',
-    's14(3).',
-    's14(5)',
     's14.',
-    's142',
-    's143',
-    's144',
-    's145(1)',
-    's146',
-    's146(1)&mdash',
-    's146(3)',
-    's15(2)(c)',
-    's15(3b)',
-    's15(3c)',
-    's15(3e)',
-    's150',
-    's154',
-    's154(7)',
-    's155.',
     's156',
-    's157',
-    's157(1)',
-    's159(3)',
-    's15a',
-    's16(7)',
-    's160(2)',
-    's160(4)',
-    's161',
-    's162(1)',
-    's162(11)',
-    's163',
-    's163(2)',
-    's164',
-    's164(5)',
-    's164(6)',
     's165',
-    's166(1)',
-    's166(2)',
-    's166(5)',
-    's166(6)',
-    's166(7)',
-    's168',
-    's17(1)',
-    's17(10)',
-    's17(3)',
-    's17(5)',
-    's17(6)',
-    's17(7)',
-    's17(9)',
-    's170',
-    's170(2)',
     's170(4)',
-    's173(2)',
-    's177',
-    's178(2)',
-    's18(4)',
-    's18(6)',
-    's183,000,000,000',
-    's184',
-    's185',
-    's187(2)',
-    's19(3)',
-    's192(3)',
-    's196',
-    's199',
-    's199(2)',
-    's19a',
     's1a(5)',
-    's1s2',
-    's2(6)',
-    's2(7)',
-    's2-ribosomal',
-    's2.78',
-    's20(1)',
-    's20(6)',
-    's20(7)',
-    's20(8)',
-    's2000/200',
-    's205(1)',
-    's20y0',
-    's211',
-    's211(5)',
-    's214',
     's215',
-    's218',
-    's219',
-    's219(2)',
-    's22(1)',
-    's22(2)',
-    's220(2)',
-    's222',
-    's223',
-    's227',
-    's23&mdash;which',
-    's23(3)',
-    's23(5)',
-    's231(4)',
-    's232',
-    's238(3)',
     's24(2)',
-    's24(4)',
-    's24(8)',
-    's245',
-    's249',
-    's25(2)',
-    's251',
-    's253',
-    's254(5)',
-    's26(1)',
-    's263',
-    's267(1)',
-    's267(2)',
-    's267(4)',
-    's268',
-    's268(2)',
     's27(1)',
-    's27(3)',
-    's270',
-    's272',
-    's277',
-    's278(a)',
-    's282',
-    's284',
-    's286(2)',
-    's286(6)',
-    's286(7)',
-    's29(1)',
-    's29(5)',
-    's29(7)',
-    's2a',
-    's2b(e)',
     's3&ndash;s4',
-    's3(3a)',
-    's3(5)',
-    's3(6)',
-    's3(a)',
-    's3(b)',
-    's3/p0:ribotype',
-    's30',
-    's30(2)',
-    's309',
-    's31(2)',
-    's31(5)',
-    's31(6)',
-    's31(7)',
-    's31(8)',
-    's31(9)',
     's310',
-    's3105',
-    's316(3)',
-    's32(1)',
-    's32(1a)',
-    's32(3)',
-    's321',
-    's329',
-    's32a(1)',
-    's33(5)',
-    's33(9)',
-    's330',
-    's336',
-    's337(1)',
-    's337(2)',
-    's338(4)',
     's339(3)',
-    's34(11)',
-    's34(4)',
-    's34(5)',
-    's34(6)',
-    's34(9)',
-    's34.',
-    's341',
-    's347(1)',
-    's347(3)',
-    's349(1)',
-    's35(1)',
-    's356(3)',
-    's361(3)',
-    's363',
-    's367(5)',
     's37(3)',
-    's37(6)',
-    's38(10)',
-    's38(2)',
-    's38(3)',
-    's38(7)',
-    's38(8)',
-    's38.',
-    's380',
-    's381',
-    's382',
-    's39(2)',
-    's39(3)',
-    's39(4)',
-    's393(9)',
-    's393a',
     's3a(2)',
-    's3a(4)',
-    's3a(5)',
-    's4&ndash;s6',
-    's4(3)',
-    's4.4',
-    's40(1)',
-    's40(2)',
-    's40(3)',
-    's402(6)',
-    's403(4)',
-    's409',
-    's41(2)',
-    's41(8)',
-    's412(1)',
-    's414',
     's418',
-    's42(1)',
-    's42(1a)',
-    's42(7)',
-    's425(1)',
-    's425(4)',
-    's426(2)',
-    's426(3)',
-    's426(6)',
-    's43(3)',
-    's430',
-    's430(9)',
-    's437',
-    's44(11)',
-    's44(9)',
-    's44(b)',
     's447',
-    's45',
-    's45(1)',
-    's45(10)',
-    's45(6)',
-    's45(7)',
-    's451',
-    's459.',
-    's46(3)',
-    's47(12)',
-    's47(2)',
-    's47(4)',
-    's47(5)',
-    's47(8)',
-    's47(9)',
-    's478',
     's48',
-    's48(2)',
-    's482',
-    's488',
-    's5(4)',
-    's50(1)',
-    's505',
-    's52(1)',
-    's52(2)',
-    's520',
-    's524',
-    's528',
-    's53',
-    's53(3)',
-    's53(a)',
-    's530',
     's531(3)',
-    's533(1)',
-    's533(7)',
-    's55(1)',
-    's56',
-    's56(4)',
-    's57(1)',
-    's57(2)',
-    's57(3)',
-    's57(4)',
-    's57(6)',
-    's574',
-    's58(1)',
-    's6(1)',
-    's6(6)',
-    's60(5)',
     's61(4)',
-    's61n',
-    's62(1)',
-    's63',
-    's63(1)',
-    's63(2)',
-    's63(3)',
-    's64(4)',
-    's64(5)',
-    's65(7)',
-    's65(8)',
-    's65(b)',
-    's66(2)',
-    's660(1)',
-    's660(2)',
-    's662',
     's663(1)',
-    's664',
-    's665(1)',
-    's665(2)',
-    's668',
-    's670(5)',
-    's672(1)',
-    's674(4)',
-    's675(3)',
-    's676',
-    's677&mdash;although',
-    's677(5)',
-    's677(6)',
-    's677(7)',
-    's677.',
-    's678(3)',
     's678(5)',
-    's678(7)',
-    's679',
-    's67a',
-    's68(b)',
-    's681(5).',
-    's682(2)&mdash',
-    's683(1)',
-    's683(3)',
-    's685(1)',
-    's685(2)',
-    's685(4)',
-    's687',
-    's687(1)',
-    's69(7)',
-    's7(1)',
     's70(3)',
-    's707',
-    's71',
-    's71(3)',
-    's716(1)',
-    's717(1)',
-    's72',
-    's72(8)',
-    's73(5)',
-    's739(2)',
-    's739(4)',
-    's739(5)',
-    's74(2)',
-    's740&mdash;it',
-    's740(2)',
-    's740(3)',
     's740(5)&mdash;individual',
-    's742(9)',
-    's742(e)',
-    's743(1)',
-    's75(1)',
-    's75(2)',
-    's75(6)',
-    's76',
-    's765(1)',
-    's768(5)',
-    's79(1)',
-    's8(2)',
-    's8(3)',
-    's80(1)',
-    's80s',
-    's81(2)',
     's82',
-    's82ff',
-    's83(1)',
-    's835508',
-    's838(1)',
-    's839(7)',
-    's84(1)',
-    's84(12)',
-    's85',
-    's86(1)',
-    's87(1)',
-    's87(4)',
-    's9(2)',
-    's9(4)',
-    's9(6)',
-    's90',
     's900',
-    's91',
-    's91(11)',
-    's91(14)',
-    's91(2)',
-    's91(3)',
-    's91(4)',
-    's912',
-    's93',
-    's93(3)',
-    's94(4)',
-    's94(9)',
-    's95',
-    's95(1)',
-    's95(2)',
-    's95(5)',
     's95(6)',
-    's96',
-    's96(1)',
-    's98',
-    's98(1)',
-    's98(2)',
-    's9a',
-    's=e',
-    's=service',
-    'sa&gt;3000',
-    'sa&iuml;d',
-    'sa&uacute;de',
-    'sa\'ad',
-    'sa\'ad-ul-din',
-    'sa\'adam',
-    'sa\'im',
     'sa-10',
-    'sa-2000',
-    'sa-2100',
-    'sa-5',
-    'sa-derived',
-    'sa-fl',
-    'sa-n-3',
-    'sa-nga',
-    'sa-owned',
-    'sa/nv',
-    'sa2',
-    'sa20',
-    'sa32',
-    'sa4/sd2',
-    'sa42',
-    'sa6',
     'sa62',
-    'sa99',
-    'saa\'da',
-    'saa/cua-compliant',
-    'saaach',
-    'saab-trained',
-    'saab/gm',
-    'saadabad',
-    'saadah',
-    'saadoum',
-    'saadun',
-    'saafi',
-    'saain',
-    'saal',
-    'saalfeld',
-    'saalian',
     'saalman',
-    'saame',
-    'saammuell',
-    'saanans',
-    'saanen',
-    'saanens',
-    'saanichton',
-    'saar&rehy;lorraine',
-    'saarah-mensah',
-    'saarbr&uuml;cken',
-    'saarbrucken-based',
-    'saarbrueken',
-    'saarlandstrasse',
-    'saarlund',
-    'saatb',
-    'saatchi-owned',
     'sabadell-based',
-    'sabaheta',
-    'sabahettin',
-    'sabahni',
-    'sabanadzovic',
-    'sabanas',
-    'sabang',
-    'sabaruddin',
-    'sabastio',
-    'sabatiers',
-    'sabatinca',
-    'sabatino',
-    'sabaudia',
-    'sabaya',
-    'sabazius',
-    'sabbagh',
     'sabban',
-    'sabbaruddin',
-    'sabbat',
-    'sabbatai',
-    'sabbath-dayes',
-    'sabbath-evening',
-    'sabbath-keeping',
-    'sabbath-wracked',
-    'sabbaticae',
-    'sabbatini',
-    'sabbe',
-    'sabben-clare',
-    'sabberton',
-    'sabbin',
-    'sabbing',
-    'sabco',
     'sabdrat',
-    'sabe',
-    'sabeita',
-    'sabej',
-    'sabellastarte',
-    'sabellian',
-    'sabelliditids',
-    'sabetha',
-    'sabhasriscience',
-    'sabi',
-    'sabido',
-    'sabin/son',
-    'sabinal',
-    'sabinanigo',
-    'sabinet',
-    'sabinian',
     'sabio',
-    'sabiro',
-    'sabji',
-    'sabkhas',
-    'sablah',
-    'sable-coloured',
-    'sable-edged',
-    'sable-lined',
-    'sable-winged',
-    'sable/nylon',
-    'sablich',
-    'sablonni&egrave;res',
-    'sablons',
-    'sabne',
-    'sabol',
-    'sabon',
     'sabotage.',
-    'saboted',
-    'saboteurs.both',
-    'sabots',
-    'sabotuer',
-    'sabran',
-    'sabras',
-    'sabre-slash',
-    'sabred',
-    'sabretaches',
-    'sabretooth',
-    'sabri-tabrizi',
-    'sabrinas',
-    'sabrita',
-    'sabriya',
-    'sabrosa',
     'sabrosky',
-    'sabu',
-    'sabugueiro',
-    'sabuleti',
-    'sabus',
-    'sabyasachi',
-    'sabzi',
-    'sac-ville',
-    'sac.lac.',
-    'saca',
-    'sacab',
-    'sacau',
-    'sacb',
-    'saccaria',
-    'saccarinous',
-    'saccharalis',
     'saccharide',
-    'sacchariflorus',
-    'saccharina',
-    'saccharines',
-    'saccharometer',
-    'sacchetti',
-    'sacchini',
-    'saccid&amacr;nanda',
-    'saccomandi',
-    'saccorum',
-    'saccular',
-    'sacculated',
-    'sacculation',
-    'sace',
-    'sacer',
-    'sacerdote',
     'sacerdotum',
-    'sacfry',
-    'sachalinense',
-    'sachar',
-    'sacharine-sweet',
-    'sachdev',
-    'sacheen',
-    'sachertorte',
-    'sacheverall',
-    'sachkhere',
-    'sachlickeit',
-    'sachs-davies',
-    'sachsen-anhalt',
-    'sachsen-gotha',
-    'sachsen-teschen',
-    'sachturia',
     'sacii',
-    'sacilor',
-    'sack\'',
-    'sack-addict',
-    'sack-artist',
-    'sack-artists',
-    'sack-cloth',
-    'sack-handling',
-    'sack-load',
-    'sack-loads',
-    'sack-making',
-    'sack-pictures',
-    'sack-shaped',
-    'sack-shrouded',
-    'sack/bag',
-    'sackbuts',
     'sackcloth-ashes',
-    'sackclothed',
-    'sacked/in',
-    'sackers',
-    'sackett',
-    'sackholders',
-    'sackier',
-    'sacking-like',
-    'sackingen',
-    'sacklike',
-    'sackmann',
-    'sacknussen',
-    'sackpack',
-    'sacks.',
-    'sacksteder',
-    'sacktrucks',
     'sackville/jnr',
-    'saclant',
-    'saclay',
-    'sacleas',
-    'sacler',
-    'sacli',
-    'saconnex',
-    'sacrale',
-    'sacralize',
-    'sacramenta',
-    'sacramentalised',
-    'sacramentality',
-    'sacramentally-based',
-    'sacramentaries',
-    'sacramento-san',
-    'sacraments/ceremonies',
     'sacramentum',
-    'sacrarium',
-    'sacratissimi',
-    'sacred-profane',
-    'sacredly',
-    'sacree',
-    'sacreligious',
-    'sacrementality',
-    'sacrifice.',
-    'sacrificium',
-    'sacriligeous',
-    'sacring',
-    'sacrist&aacute;n',
-    'sacristans',
-    'sacristies',
-    'sacristine',
     'sacriston-based',
-    'sacrists',
-    'sacro',
-    'sacrobosco',
-    'sacrophagus',
-    'sacrosancta',
-    'sacrosanctity',
-    'sacz',
-    'sad&rehy;way',
-    'sad-core',
-    'sad-making',
-    'sad-sack',
-    'sad-sad-sad',
-    'sad-smiling',
-    'sad-sweet',
-    'sad-woozy',
     'sad.he',
-    'sada',
-    'sadanori',
-    'sadanundio',
-    'sadao',
-    'sadaquat',
-    'sadarak',
-    'sadatoshi',
-    'saday',
-    'sadberk',
-    'saddam-controlled',
-    'saddam-hitler',
-    'saddamery',
-    'saddamiyat',
-    'saddamspeak',
-    'saddawi',
     'sadderdaies',
-    'sadding',
-    'saddington',
-    'saddle-back',
-    'saddle-bred',
-    'saddle-brown',
-    'saddle-girths',
-    'saddle-height',
-    'saddle-leather',
-    'saddle-like',
-    'saddle-roof',
-    'saddle-room',
-    'saddle-stitch',
-    'saddle-stitching',
-    'saddle-tank',
-    'saddle-tanks',
     'saddle-tree',
-    'saddle-up-and-ride-into-the',
-    'saddlebacks',
-    'saddlecloths',
-    'saddlemews',
-    'saddlery-makers',
-    'saddlesoaped',
-    'saddlesore',
-    'saddlestones',
-    'saddock',
-    'sadeler',
-    'sademsa',
-    'sadhana',
-    'sadie.',
-    'sadig',
-    'sadigh',
     'sadikhov',
-    'sadiki',
-    'sadir',
-    'sadista',
-    'sadiste',
-    'sadisten',
-    'sadistic.',
-    'sadistic/anal/oral',
-    'sadko',
-    'sadlee',
-    'sadler/shelter',
-    'sadler/whitminster',
-    'sadles',
-    'sadleworth',
-    'sadlier',
-    'sadly-lacking',
     'sadly-missed',
-    'sadly-moribund',
-    'sado-escape',
-    'sado-experts',
-    'sado-manager',
-    'sado-sexual',
-    'sado-sophistication',
-    'sado/masochism',
-    'sadoko',
-    'sadoleto',
-    'sadoo',
-    'sadoon',
-    'sadoul',
-    'sadovaya',
-    'sadowa',
-    'sadowiz',
     'sadowski',
-    'sadowsky',
-    'sadr&mdash;which',
-    'sadrina',
-    'sads',
-    'saduak',
-    'saducees',
-    'saducismus',
-    'sadutismus',
-    'sadye',
-    'sadykhov',
-    'sae/irc',
-    'saeby',
-    'saedler',
-    'saeedhealth',
-    'saeedi',
     'saeima',
-    'saen',
-    'saena',
-    'saenaua',
-    'saenger',
-    'saetas',
-    'saetti',
-    'saeva',
-    'safaev',
-    'safair',
-    'safaniyah',
-    'safarali',
-    'safarian',
-    'safarov',
-    'safaya',
-    'safe&mdash;defeating',
     'safe&rehy;conduct',
-    'safe&rehy;guarded',
-    'safe&rehy;guarding',
-    'safe&rehy;keeping',
-    'safe-as-houses',
-    'safe-blower',
-    'safe-break',
-    'safe-breaker',
-    'safe-breakers',
-    'safe-cracker',
-    'safe-cracking',
-    'safe-deposits',
-    'safe-feeling',
-    'safe-guarded',
-    'safe-handover',
-    'safe-haven',
     'safe-havens',
-    'safe-operating-area',
-    'safe-seal',
-    'safe-t-cube',
-    'safe-wrenching',
-    'safe.',
-    'safe.and',
-    'safe/hold',
-    'safed',
-    'safedeposit',
-    'safegarding',
-    'safegaurds',
-    'safege',
-    'safeit',
-    'safeland',
-    'safelight',
     'safely-sealed',
-    'safely.',
-    'safer-feeling',
-    'safest-looking',
-    'safest-seeming',
-    'safestop',
-    'safestud',
-    'safetey',
-    'safeties',
-    'safetly',
-    'safety&ndash',
-    'safety&ndash;critical',
-    'safety&ndash;related',
-    'safety-advice',
-    'safety-assessment',
-    'safety-assessments',
     'safety-belted',
-    'safety-boots',
-    'safety-cord',
-    'safety-design',
-    'safety-devices',
-    'safety-glasses',
-    'safety-glazed',
-    'safety-labelling',
-    'safety-lights',
-    'safety-netless',
-    'safety-nets',
-    'safety-netted',
-    'safety-oriented',
-    'safety-rail',
-    'safety-relevant',
-    'safety-sheet',
     'safety-straps',
-    'safety-value',
-    'safety-valves',
-    'safety.and',
-    'safety/cost',
-    'safety/environment',
-    'safety/environment/access',
-    'safety/rescue/special',
-    'safeway-sponsored',
-    'saffarac',
-    'saffaracus',
-    'saffer',
-    'safferys',
-    'saffioti',
-    'saffiotti',
-    'safford',
     'saffra',
-    'saffrey',
-    'saffro',
-    'saffron-azure',
-    'saffron-clad',
-    'saffron-dyed',
-    'saffron-like',
-    'saffron-tinted',
-    'saffuriya',
-    'safguard',
-    'safi/',
-    'safilios-rothschild',
-    'safro',
-    'safter',
-    'saftleven',
-    'safyn',
     'sag-bags',
-    'saga.',
-    'sagai',
-    'sagamartha',
-    'sagan.',
-    'saganesque',
-    'saganiuk',
-    'sagansky',
-    'saganuma',
-    'sagaramoso',
-    'sagarin',
-    'sagartia',
-    'sagartian',
-    'sagartians',
-    'sagatal',
-    'sagathies',
     'sagatrieb',
-    'sage-',
-    'sage-covered',
-    'sage-ghost',
-    'sage-like',
-    'sagebrecht',
-    'sagebrush',
-    'sagecover',
-    'sagel',
-    'sagep',
-    'sagesoft',
-    'sagesse',
-    'sagest',
-    'sagette',
-    'saggar',
-    'saggars',
     'sagger',
-    'saggital',
-    'sagi-ash',
-    'sagi-ta-riya',
-    'sagi-ti-foe-li-oom',
-    'sagina',
-    'saginata',
-    'sagittarius-',
-    'sagittifolium',
-    'sagnella',
-    'sago-thatch',
-    'sagor',
-    'sagra',
-    'sagree',
-    'sagrera',
-    'sagrinae',
     'sagster',
-    'sagu',
-    'saguaros',
-    'saguet',
-    'saguia',
-    'saguy',
-    'sahabat',
-    'sahabzadi',
-    'sahafa',
-    'sahafeen',
-    'sahai',
-    'sahal',
-    'sahara-like',
-    'saheena',
-    'sahelians',
-    'saher',
     'saherli',
-    'sahgal',
-    'sahha',
-    'sahi',
-    'sahib(-i)',
-    'sahid',
-    'sahillioglu',
-    'sahin',
-    'sahinguvu',
-    'sahinguvusecretary',
-    'sahinkaya',
-    'sahl',
-    'sahlan',
-    'sahle',
-    'sahlul',
-    'sahng',
     'sahnouni',
-    'saho',
-    'sahour',
-    'sahr',
-    'sahra',
-    'sahrawi',
-    'sahrawis',
-    'sahu',
-    'sahut',
-    'saib',
-    'saice',
-    'said&mdash;he',
-    'said&mdash;with',
-    'said\'',
-    'said-\'so',
-    'said-regretfully',
     'said-to-be',
-    'said.a',
-    'said.bank',
-    'said.d',
-    'said.julie',
-    'said.observers',
-    'said.the',
-    'said/',
-    'said/thy',
-    'said:graham',
-    'said_as',
-    'said_at',
-    'said_even',
-    'saidamin',
-    'saidani',
-    'saide',
     'saie',
-    'saifuddin',
-    'saighead',
-    'saignakong**',
-    'saiid',
-    'saikama',
-    'saiken-yachongtuoa',
-    'saikewicz',
-    'sail-',
-    'sail-carrying',
-    'sail-clips',
-    'sail-it-on-its-ear-and-hard-luck-if-you\'re-seasick',
-    'sail-makin\'',
-    'sail-master',
-    'sail-wardrobe',
-    'sail-winged',
     'sailability',
-    'sailana',
-    'sailathon',
-    'sailaway',
-    'sailbags',
-    'sailboarders',
-    'sailboarding',
-    'sailcat',
-    'sailen',
-    'sailes',
-    'sailfins',
-    'sailform',
-    'sailing-master',
-    'sailing-ship',
-    'sailing-yacht',
-    'sailing.',
     'sailing/relaxing',
-    'sailing/rowing',
-    'sailish',
-    'saille',
-    'sailor-boy',
-    'sailor-collared',
-    'sailor-hero',
-    'sailor-like',
-    'sailor-man',
-    'sailor-suit',
-    'sailor.',
-    'sailormen',
-    'sailortown',
-    'sailosi',
-    'sailroom',
-    'sails.',
     'sailskiffs',
-    'sailspars',
-    'sailspeak',
-    'sain&rehy;tongue',
-    'saines',
-    'saing',
-    'sains-berries',
-    'sainsbury\'s',
-    'sainsbury\'s-sponsored',
-    'sainsbury\'s/bbc',
-    'sainsbury\'s/british',
-    'sainsbury\'s/good',
-    'sainsbury-ad',
-    'sainsbury.political',
-    'sainsby',
-    'saint\'',
     'saint-',
-    'saint-&eacute;tienne',
-    'saint-alban',
-    'saint-amour',
-    'saint-andr&egrave',
-    'saint-andre',
-    'saint-ange',
-    'saint-anne',
-    'saint-antione',
-    'saint-aubin',
-    'saint-augustine',
-    'saint-bernard',
-    'saint-bertrand-de-comminges',
-    'saint-brieuc',
-    'saint-clair',
-    'saint-cricq',
     'saint-exup&eacute;ry',
-    'saint-fond',
-    'saint-germain-des-pr&eacute;s',
-    'saint-gobain',
-    'saint-james',
-    'saint-joire',
-    'saint-joseph',
-    'saint-jours',
-    'saint-just',
-    'saint-lambert-des-bois',
-    'saint-leon',
-    'saint-louis',
-    'saint-luce',
-    'saint-martin-d\'h&eacute;res',
-    'saint-maurice',
-    'saint-maxime',
     'saint-merri',
-    'saint-nicolas',
-    'saint-omer',
-    'saint-ouen-les-docks',
-    'saint-p&eacute',
-    'saint-p&eacute;e-sur-nivelle',
-    'saint-phalle',
-    'saint-preux',
-    'saint-priest',
-    'saint-rambert',
-    'saint-remy-en-provence',
-    'saint-sardos',
-    'saint-savin\'',
-    'saint-sever-de-rustan',
-    'saint-vaast-la-hogue',
-    'saint-victor',
     'saint-vil',
-    'saint-vincent',
-    'sainte-adresse',
-    'sainte-croix-du-mont',
-    'sainte-euge&nacute;ie',
-    'sainte-m&eacute;nehould',
-    'sainte-maxime',
-    'sainthamarathu',
-    'sainthomme',
-    'saintliest',
-    'saints-peres',
-    'saintz',
-    'saiod',
-    'sair-mair',
-    'sairey',
-    'sairr',
     'saision',
-    'saisompheng',
-    'saisuree',
-    'saita',
-    'saite',
-    'saithaelwyd',
-    'saivoure',
-    'saja',
-    'sajambre',
-    'sajit',
-    'saju&iacute;n',
-    'sajudis-affiliated',
-    'sajuin',
-    'sajwaj',
-    'saka',
-    'sakab',
     'sakalas',
-    'sakalauskas',
-    'sakarov',
-    'sakartvelo',
-    'sakartvelos',
-    'sakau',
-    'sakaue',
-    'sake\'',
-    'sake-no',
-    'sakellaridis',
-    'sakers',
-    'sakhat',
-    'sakins',
-    'sakishima',
-    'sakkie',
-    'sakkratians',
     'sakmann',
-    'sako',
-    'sakong',
-    'sakr-el-bahr',
-    'saksena',
-    'saksunarvatn',
-    'sakurada',
-    'sakurai-hung',
-    'sakurauchi',
-    'sakvador',
-    'sakwa',
-    'sal&atilde;o',
-    'sal&ndash;anna',
-    'sal&oacute;n',
-    'sal&ograve',
-    'sal\'khoz',
     'salaam-based',
-    'salaam-orientated',
-    'salaamat',
-    'salaams',
-    'salabat',
-    'salability',
-    'salabuss',
-    'salaciously',
-    'salacities',
-    'salad-',
-    'salad-dressing',
-    'salad-making',
-    'salad-stuffed',
-    'salad.',
-    'saladdin',
-    'saladene',
     'salades',
-    'saladins',
-    'salahs',
-    'salai',
-    'salais',
-    'salajekna',
-    'salala',
-    'salale',
-    'salamah',
-    'salamanca.',
-    'salamander-prince',
-    'salamandra',
-    'salamano',
-    'salamantine',
-    'salambere',
-    'salami-free',
     'salami-type',
-    'salamin',
-    'salamis-marathon',
-    'salamis-sgb',
-    'salamy',
-    'salar',
-    'salari',
-    'salari&eacute;e',
-    'salariat\'',
-    'salaries.',
-    'salario',
-    'salarium',
-    'salary&mdash',
-    'salary\'/',
-    'salary-earners',
-    'salary-in',
     'salary-linked',
-    'salary-ranges',
-    'salary-related',
-    'salary/high',
-    'salary/holidays/conditions',
-    'salary/wages',
-    'salarymen',
-    'salasas',
-    'salat',
-    'salath&eacute',
-    'salati',
-    'salatin',
-    'salauds',
-    'salaut',
-    'salavat',
-    'salavation',
     'salavessa',
-    'salawitch',
-    'salazar-type',
-    'salbakos',
-    'salbin',
-    'salbo',
-    'salcome',
-    'salda&ntilde;a',
-    'saldaan',
-    'saldarriaga',
-    'salde',
-    'saldini-noonan',
-    'sale&mdash;see',
-    'sale\'',
-    'sale-',
-    'sale-day',
     'sale-goer',
-    'sale-voucher',
-    'sale-work',
-    'sale/acquisition',
-    'sale/kiddiswap',
-    'sale/royal',
-    'sale/wanted',
-    'sale15',
-    'saleand',
-    'saleck',
-    'salegast',
-    'saleha',
-    'salehem',
-    'salehtrade',
-    'salema',
-    'saleman',
     'salemoore',
-    'salems',
-    'salentin',
-    'saleries',
-    'sales-',
-    'sales-admin',
-    'sales-and',
-    'sales-driven',
-    'sales-hungry',
-    'sales-ladies',
-    'sales-order\'',
-    'sales-orientation',
-    'sales-oriented',
-    'sales-packs',
-    'sales-price',
-    'sales-promotion',
     'sales-rooms',
-    'sales-task',
-    'sales-tax',
-    'sales-turnover',
-    'sales-type',
-    'sales.richard',
-    'sales/channels',
-    'sales/consumption',
-    'sales/hype',
-    'sales/new',
-    'sales/service',
-    'sales/strategic',
-    'sales14**',
-    'salesiane',
-    'salesio',
-    'salesman\'',
     'salesman-cum-lodging-house',
-    'salesman-like',
-    'salesman/girl',
-    'salesmen.',
-    'salestrak',
-    'saleswork',
-    'saletiendi',
-    'saletime',
-    'salette',
-    'saleuddin',
-    'saleyard',
-    'salgari',
-    'salgo',
-    'salgovic',
-    'salgredo',
-    'salgueiros',
     'salguero',
-    'sali-rsai',
-    'saliba',
-    'salicam',
-    'salicin',
-    'salie',
-    'saliens',
-    'saliently',
-    'salients',
-    'salife',
-    'salifit',
-    'saligna',
-    'saligos',
-    'saliha',
-    'saliheen',
-    'salii',
     'salikh',
-    'salimberi',
-    'salimov',
-    'salin-de-giraud',
-    'salinated',
-    'salinates',
-    'saline-intrusion',
-    'saline/edta',
-    'saling',
-    'salingerism',
-    'salinification',
-    'salinity-such',
-    'salinometers',
-    'salisbury-jones',
-    'salisbury-style',
-    'salisbury.the',
     'salisbury/deputy',
-    'salisburye',
-    'saliva-steeped',
-    'saliva.',
-    'salivarium',
-    'salivates',
-    'salka',
-    'salko',
-    'sall&eacute',
-    'sallah',
-    'sallary',
-    'sallates',
-    'sallee',
-    'sallery',
-    'salles',
-    'sallets',
     'sallinen',
-    'sallingboe/airshow',
-    'sallochy',
-    'sallois',
-    'sallow-looking',
-    'sallright',
-    'sallustian',
-    'sally-b',
-    'salm-salm',
-    'salma',
-    'salmanazar',
-    'salmanov',
-    'salmaso',
-    'salmina',
-    'salmo\'kkan',
-    'salmon-',
     'salmon-beige',
-    'salmon-flies',
-    'salmon-like',
-    'salmon-paste',
-    'salmon-red',
-    'salmon-spawning',
-    'salmon-splash',
-    'salmon/harwell',
-    'salmonby',
-    'salmone',
-    'salmonella-ridden',
-    'salmonelloses',
-    'salmonier',
-    'salmonoid',
-    'salmonoids',
-    'salmonsbury',
     'salmson',
-    'salnamesi',
-    'saloduro',
-    'salodurus',
-    'salofalk',
-    'salojee',
-    'salom&acirc;o',
-    'salom&eacute',
-    'salomao',
-    'salomo',
-    'salomom',
-    'salon-formula',
-    'salon-ish',
-    'salon-la-tour',
-    'salon-like',
-    'salon-look',
     'salon-picture',
-    'salon-style',
-    'salone',
-    'salone/swindon',
-    'salong',
-    'saloniaeducation',
-    'salonius',
-    'saloom',
-    'saloon-bars',
-    'saloon-in-space',
-    'saloon-singer',
-    'saloon-wise',
-    'saloonatic',
-    'salope',
-    'salopeans',
-    'salopes',
     'salor',
-    'salorio',
-    'salosa',
-    'saloumi',
-    'salov',
-    'salp&ecirc;tri&egrave;re',
-    'salpetriere',
-    'salpiglossis',
-    'salpingectomies',
-    'salpiti',
-    'salries',
-    'salsabeel',
-    'salse',
-    'salsevills',
-    'salsiccia',
-    'salso',
     'salsoul',
-    'salsoul/west',
-    'salsus',
-    'salt&rehy;burning',
-    'salt-bathed',
-    'salt-bearing',
-    'salt-bridge',
-    'salt-burn',
-    'salt-bushes',
-    'salt-caked',
-    'salt-cellar',
-    'salt-cellars',
-    'salt-charged',
-    'salt-coffer',
-    'salt-covered',
-    'salt-cracked',
     'salt-crusted',
-    'salt-dependence',
-    'salt-domes',
-    'salt-dried',
-    'salt-driven',
-    'salt-encrusted',
-    'salt-extraction',
-    'salt-fish',
-    'salt-free',
-    'salt-gathering',
-    'salt-glazed',
-    'salt-herring',
-    'salt-kissed',
-    'salt-lakes',
-    'salt-light',
-    'salt-making',
     'salt-n-pepa',
-    'salt-of-the-earth',
-    'salt-petre',
-    'salt-pickled',
-    'salt-pools',
-    'salt-preserved',
-    'salt-pressed',
-    'salt-produced',
-    'salt-scarred',
-    'salt-screw',
-    'salt-seasoned',
-    'salt-seeking',
-    'salt-set',
-    'salt-shaking',
-    'salt-smelling',
-    'salt-snail',
     'salt-spattered',
-    'salt-spoonful',
-    'salt-sticks',
-    'salt-stratified',
-    'salt-streaked',
-    'salt-streaks',
-    'salt-sugar',
-    'salt-tanned',
-    'salt-tolerant',
-    'salt-traders',
-    'salt-washed',
-    'salt-waters',
-    'salt-white',
-    'salt-working',
-    'salt-workings',
-    'salt/postmaster',
     'salt/rinse-aid',
-    'saltarello',
-    'saltationism',
-    'saltative',
-    'saltbath',
-    'saltburn-born',
-    'saltburn-by-sea',
-    'saltbush',
-    'saltcellar',
-    'saltcoats-based',
-    'salteados',
-    'saltees',
-    'salter/anti-war',
-    'salterello',
-    'salterhebble',
-    'saltersgate',
     'saltglazing',
-    'salthair',
-    'salthe',
-    'salthouses',
-    'saltimbanques',
-    'saltines',
-    'saltiness.',
-    'saltini',
-    'saltire/interlaced',
-    'saltish',
-    'saltmarshe',
-    'saltmer',
-    'saltness',
-    'saltoro',
-    'saltosuchus',
-    'saltpacker',
     'saltpan',
-    'saltpans',
-    'saltry',
-    'saltshaker',
-    'saltsjoborg',
-    'saltwort',
-    'salty/grassy',
-    'saltykov-shchedrin',
-    'saltzburg',
-    'saltzburgring',
-    'saltzgaber',
-    'salu',
-    'salue',
-    'saluggia',
-    'saluja',
-    'salum',
     'salusinsky',
-    'salustro',
-    'salutariness',
-    'salutaris',
-    'salutation-prayer',
-    'salutatory',
-    'salute.',
-    'salute.then',
-    'salutem',
-    'salutem.',
-    'salutifera',
-    'salutin\'',
-    'salutory',
-    'saluts',
-    'saluzzo',
-    'salvabile',
     'salvaci&oacute;n',
-    'salvacion',
-    'salvadorans',
-    'salvadore&ntilde;o',
-    'salvadorena',
-    'salvadorenos',
-    'salvament',
-    'salvamenta',
-    'salvatierra',
-    'salvatio',
-    'salvationis',
-    'salvatorian',
-    'salvatoris',
-    'salvavi',
-    'salvavit',
-    'salvemitu',
     'salver-on-foot',
-    'salvere',
-    'salvesan',
-    'salvesons',
-    'salvifici',
-    'salvini',
-    'salviniaceae',
-    'salvis',
-    'salvius',
-    'salvona',
-    'salwarpe',
-    'salwars',
-    'salween',
-    'salwey',
-    'salwick',
-    'salya',
     'salzburger',
-    'salzburgring',
-    'salzcraggie',
-    'salzenmund',
-    'salzer',
-    'sam\'n\'eric',
-    'sam-11',
-    'sam-13',
-    'sam-14',
-    'sam-14s',
-    'sam-3',
-    'sam-ay',
-    'sam-dependence',
-    'sam-dependent',
-    'sam/aged',
-    'sam/brother',
     'samac',
-    'samadov',
-    'samah',
-    'samahdaneh',
-    'samaira',
-    'samajtantrik',
-    'samame',
-    'samamigram',
-    'samandari',
-    'samangan',
-    'samange',
-    'samaniya',
-    'samaratin',
-    'samares',
-    'samaritan.',
-    'samarium-147',
     'samarium-cobalt',
-    'samaroo',
-    'samarpan',
-    'samavians',
-    'samawah',
-    'samawna',
-    'samba-dancing',
-    'sambal',
-    'sambars',
-    'sambeth',
-    'sambetn',
-    'sambhur',
-    'samboras',
-    'sambou',
-    'sambourne',
-    'sambrizzi',
     'sambu',
-    'sambuca',
-    'sambucas',
-    'samburu&ndash;lake',
-    'samdech',
-    'samdporia',
-    'same&mdash',
-    'same&mdash;for',
-    'same&mdash;its',
-    'same-',
-    'same-age',
-    'same-domain',
-    'same-i',
-    'same-ish',
-    'same-name',
-    'same-place',
     'same-response',
-    'same-routine',
-    'same-sex-sharing',
-    'same-time',
-    'same-time-same-place',
-    'same-venue',
-    'same.different',
-    'same/',
-    'same/other',
-    'samelson',
-    'samely',
-    'samer',
-    'sametadine',
-    'samething',
-    'sameyness',
-    'samf',
     'samgate',
-    'samh',
-    'samh&auml;llspartiet',
-    'samhita',
-    'sami-ul-haq',
-    'samin',
+)
+
+blocks_58 = (
+    '#%berht#"ca$%hieri$%iardi$!o%$boni(!o#*e-and-bean%%barns&#eer%$cake)!s&&ookers%+davies-type%&grains',
+    '\'%owers%%paddy&\'lanting&"ot&(roducing&&udding%%smith&&orting&$took%%white$&/lloyd%$road$%barns$$land$#pot',
+    '(!s&"he$$vuta#"h\'$)-busy-man%)colouring%(for-life%$hued%%lists\'.ttle-poor-girl&&ooking%(smelling%&yolked$2/beautiful/married%$daft',
+    '%"in%!r&(d-sophie\'(/athlete(&former(*gorebridge((homeless(&singer\'4s-for-vice-president(&/chief**ompetition+%untry)%drugs)(festival*#ire',
+    ')/gloucestershire)&health+"lp))lowerhope)(national)(prodrive),warwickshire("es()on\'s&rehy*%-made*!/+*aviculture+(producer+\'trainer+&walker',
+    '\'!t&%sdson&"tz(\'strasse$%cliff$!d$&ebourg%$ldas%!n&#ing%$rsan%#sse$$ford$!i%#ans',
+    '%$ldis%"ng\'(/rescued\',s/kidlington%#sau$*ly-adorned\'\'coiffed)&loured\')decorated(&iverse\'+embroidered(&ndowed\'$hued\'*interlaced\'&varied',
+    '\'%d-has)(molyneux))on-thames((/cyclist)&father((50martin$&nesses$%oched(%tting%#nds$!t%$er-7($like\'#ite\'&liches',
+    '%/linienkompetenz$%white%$orth#\'inoleic#(k-houses$$arby&)d/british$"et&(s/irvine&#ts/)&irvine(%ioses&)y-looking$#ham$#ing',
+    '$"le&"fs&$pits&!s$$mers$$rack$)shaw-type)\'wallahs%!y$$word$%yards#)ochetting$\'h-based$%nosci%&sciuta',
+    '&!o%"si$!s%%-omes$!t%!s%*ta-stuffed#%quier#*tus-strung"-d-calf-length#$dels%\'n-holes$(le-style&$sden\'$tone',
+    '$!o%"ck#\'e&mdash$--a-cock-horse%\'comfort%$like%\'sharing$!.$(/brother%&father%9handling/steering/braking$&gewood$%halgh$!n%$hour',
+    '%(/trainer%"s.\'#the$"st$$ways#&gbacks$,e&rehy;piece%0-and&rehy;furrow&&backed\'$oard&$line*!s&%piece\'#ole&#top',
+    '*!s%%backs%$hill%$mont%#top%-wood-bushwick#\'ibundus$!c%$-ule%#ulo(*us-looking*(/sublime$#ger$(ng-about\'(bailiffs',
+    '($lass)%othes($rops\'-felce/general\'$gear\'$hood)#rse)#use\'#mac\'%robes\'%shoes*-oting-fishing\'(trousers\'$whip&!.',
+    '$!t#$land$%eyism&%ville#$nell#%ruejo#%ulous##van"+e&mdash;the#%beeck%!i#(chenhall#%fling#"ge#*mann-green',
+    '$"er#"n.$8court-flesqui&egrave;res$$dorp$#ner##per#"rs##sco$&enwand$%lings$#ner#!t$#bad%#erg$"er',
+    '$$ling#!u$$nier#!z"\'fabutin$!i#"f-%\'monster%#raf%&writer$\'/female$&aholic%%ramas$(bastards$"ed',
+    '$#ian$"ka%#ind$!y#,kind/defence#(le-bolts\'#utt&$fire&#pit&%range%(shooting#)ondazione#!s#+t&rehy;lake$)-faulting',
+    '$#out$$time#$alis%!t$"ni$$toni$$udon#$dely%!n&%jyepo#%elian%#nik#$gall$(ed-price%!t',
+    '#%hetti$,t&mdash;hand&*ndash;wing&+rehy;centre%%+hand%\'-allied\'"nd)\'-a-left(%gles.(\'swerism\'(scension\'#way&%backs("nd(#sed',
+    '&%click\'$ross&)dominated&$e-oh\'"ar\'\'ousness&%field\'%ooter&#had(%nd_up*.ed/left-handed,"ly&!i\'C-warned-you-off-to-the-head\'s-study\'*nstruction',
+    '*)ification-"ed&$knee&*left-right\'%ittle&&making&"of((-british)%reply("fs\'#nce($ness&%pawed&$rear()latedness',
+    '((surgence&&sided.(#zed)#ing\'&lanted&$that(!e)"re(&inkers\'(o-cancel)\'pollute\'&urning&+way-up-cups\'&heeled&$y-ho',
+    '&%sided&%which%!/&\'correct&$full&\'private&%wrong%"81%$:two%#_on%$down%+eous-minded)!.&"rs%&handed',
+    '%/ist-nationalist&$zing%$less&#ine&)y-obscure%)neousness\')ss-making%"o.%$rack%-s&mdash;where&!*&*-enforcing\'\'of-ways&&.while&\'/ethics',
+    '\'"ze%,ward-leaning\'(y-around%#y-o#&iblick$"d-&%tined\'&ongued%!a%&ifying%-ly-controlled%!s#&lewski#\'maroles$"er',
+    '$#als#!o$/letto/trovatore$%phila$*r-mortgage%,ous-critical(%.nick$!t$#uts#"s.#%ueurs$#tto##zin"&hanssu#!t',
+    '"$i-re#,hij&auml;rvi#$ight#"na#!s##tta"!j#*kaard-like$"en%"rs$!s%$bank&%ureau%"en%/museumstichtung',
+    '##nen$&huizen#&stafel"%kaard$$vatz#!e$!n$!r##kyo##lis#"os#%ushin#"yu""la$"te',
+    '#"er$)y/teacher%!s#$lets&"te$#iet$#ons#!u")m-drynoch$%level$$most#!.#%antas#\'baldian%#ult',
+    '$"ow$!u#)e-crusted$#lls$!q$&r-alco%!s##ing#$land$#ock#$mers$$inen#$osum#$pton#$rose',
+    '$$taka#$ward")n-tin-tin##ald&)i/support&!o%"hi$!s#,cewind&mdash)\'-shaped$#hen%"ik$#ome%!n##del',
+    '##eke$#lde#.g&rehy;bearers*#ing$/-a-ring-a-noses(#osy&&nd-dot&\'ttached%\'barking&$ound%\'closure&$rypt%%dance&&itches&&ropper',
+    '%$file&&olders\'"rt%%grips%&handle%"if%%laden%$mail\'$kers&)onitoring\'\'untings%\'o-roses&%f-two&%n-sea%%piece',
+    '\'"ng&&oarrrd&#ust)%iness%\'scarred&$hirr&&panner\'%ecies\'$orts&&tained\'%udded%$tail&(heoretic&&oothed\'!p',
+    '%$wall&#ork(!m$\'/casket%,head-injured%#jez%#toy$&bearer%&inders%#one%%ridge$%croft$$dove(!s%(ufferrin',
+    '$%field&$nger$$guth$%halls&!m%#off&"rn$!i%$-sei%"it%"n\'&$glow%#sho$!k%:&ouml;bing-f&uuml;nen-high',
+    '\'"ed\'#ted(!y%#ing%#ock$\'masters$#nes$#old\'$swil&$evio%!s%"ur$*rose/vicar$$s_as%$aker',
+    '&)ll/father)+step-mother%$hall\'#ped%%tones$#top$$wald%$orks\'"ms\'"th&#uld%&raiths#!i#&k-like$&.there',
+    '$"el$#ing$$side$!y#%netou$#in\'&!g$(ovimento$!u#*oloricaria$&scopia#%poche#(sability$*e-a-leader&%rinse',
+    '%%della$$ings#$teln$#ini$!y#"us#$vlak#4yaszentkir&aacute;ly"*o/polygram#%bamba#%ghail#%hgail#"li#!m$!s',
+    '$!i#\'prostil#%rdans#&s-risc#*t-cladding%%flics&*omentation%$gear%\'related%\'shields%#tom&\'raining%&visors%\'wrecked$#.mp',
+    '&"gs$$ous.\'$ness#&umajou$#tts"*p-and-tear$(currents&%tting$$off\'$#rap%%oarer(%ingly$#saw%\'norting$+the-jugular',
+    '$%rians%&tition#%cords#\'e-peach%(smelling$"ly$$ners&#ss.%$ings$$rton#$hean#$ieni&!o##max##oli',
+    '%#ian$"so%!t##pah$$chen$&ed-out\'"up%$nden&#gal%"r.$"in&"gs$!l%,e-dissolving\')laminated',
+    '\')smoothing\'&velvet&\'s/waves%$ings%!y$"oe$&y-fish#$rian$&oaring##saw#!t$$ides#"ul"(quebourg$#ier',
+    '""sa$#ble$!k$!l%%water##bey$%ridge$#ury\'./herefordshire#,c&rehy;based$!-%&killer%$like$$/aix$"al',
+    '$"nt$!o#$dale$"en#"e\'%&n\'time$%-and-&\'ssuming$$cote$$dale$!e$&nburgh%#ess%%huber$\'r/keels',
+    '$%anger$)el/cachin%!r$%ikesh$%worth#!i$"n\'%$gham#*k&mdash;is%)rehy;free*&graded$#(s)$!-%)accepting&"ll',
+    '&\'voiding%%based&&earing%)conscious%,minimisation+$zing%\'premium\'\'oducing("ne%+recognition%.stratification%*to-benefit\'\'lerance$\'.market$$/gas',
+    '$%=0.99%$1.01(!6\'"19\'"24$"at$4s-insurance/shipping%!.$\'y-shift##lan$(ey-based#%oluto$#ria$(tto-type$"ul',
+    '#!s$!e$6ington/gloucestershire*!s#(torante.%$vski$!s#"um#"zk"%talin$1rdando-diminuendo#%blatt##che&!y%)ie/lawyer',
+    '\'!s#%enour$,s-of-passage#$hist$%matic##ish#&jemokk#"mo#&odrine$+rnello-like&!i#%ratto$!o#%schel$"os',
+    '+(-simmons%1rkreuztr&auml;ger$#ing$$mann$!o#$ual\'&(-meaning\'&ridden&$ises\'$zing&#led&"s.$"el$"ro#+z-escoffier',
+    '$%ensee$!i%"er"$ught#$niti$"ti"!v#0al&mdash;william%)-feelings&\'in-love&#yet%#ady%"eh%#ism%"on',
+    '\',/non-rivalry$"ra%"el$#yat$"z\'%%zurra#%elino$\'n-faced%!s$\'r&mdash%(-animals&%based\'#eds\'#ore\'$uses',
+    '\'&hannel\'\'oloured($oled&%delta+!s&$edge&\'feeding\'$ront&$girt\'"od&%level\'#ife(\'ght-sky&+maintenance\'$iles',
+    '&&people\'$lain\'#ort&\'rafting\'&ibbons&%shore\'\'melling(&oothed\'&teamer(#one&$walk)!l\'#orn)#thy%%.just',
+    '&#bus&&silver%\'bankers&$reak%%crest%$dale%$east&!d%$flow&#olk&"ul%%green%$head%%meads%#oll',
+    '&$oint%)s.between&$ides&#lea&!o%%watch("er$(s-renage$%t-gun%$head%(t-carnac#)ieraesque&"es$#lin$"na',
+    '#(oluzione$!x#&ularis$"ms"!w"#xby#%dorf/"#yad%$h2-2\'&1-1130&$5-14".zicultivateurs$"vi#!o#"za',
+    '$$etto$"la$,oli/universe!%j.2.5"%362/g"!4"#70s""ad"%e-sna""gg"!m"$p/mp"!s!%k-32b%"zb',
+    '""90"!a#\'tziteli""ka!%l/rld""30"!i#"ne"!o"!r""ss"$ykke!)m-fortran#%value"&/cobol',
+    '""12"!3##.60#"00"$6000#"89"#921%,/sg&ndash;571!."!b#!.#"ks"#c-1#!a#!h',
+    '""if"!m"!r"&s/soft"&u/dump#!s!"n1##.9d#!4"!3""46$%/rn50#!8")a-binding$$like',
+    '#$/dna#$:rna$$trna##ase#(rginally$!s##seh"$d(1)#!m#!p"$i&gt##ght""lb""mh""oc',
+    '"%p8&gt""sr!5o&circ;le-interaction+\'playing*!s#(ocirc;le#*scaron;kot"(\'merholz"$-tap"!2"-31&ndash;8959"&a/konr#"ce$\'h-bream&,exterminator',
+    '$%k/pop#0d&mdash;citizens%.ndash;broadway%$rehy$#(s)$*-accidents&\'dhering%&biased&#ook)!s&\'reaking&&urning%#car\'&sualty&\'harging',
+    '\'%osure&-ommunications\')ntracting&$rash%$dirt&%rills%#end%&filthy&%lints&\'riendly%$gang%(handling\'%ulage&"og&$umps',
+    '%$kill%\'lobbied%%maker%%north\'#vel%"on%)passenger&$rice)#ing%$race\'%ilway\'#lly&$eady\'\'pairers&$oute',
+    '%$safe&$ense)%itive&#how&&tation\'#one%&tested)#ing&*o-damascus(%house&/raffic-accident("in(*nsportable%#use%$walk',
+    '&$hich&#ork)#ers%$xxxx$).cuttings%#the$)/brasnose%\'hampton%\'milford%&oxford%%track$$_and%"up$#bed%&uilder',
+    '%#rew$!d$"ed$$ford%"ul$#ing%#tes$$kill$&lights&"ne$,man-sprinter&"ps&$ster$%names$*orientated',
+    '%&unners(#ing$%s-the%$.the%*/junctions%$cape%$hips%#ign%$peed%#tar&#ops%\'weepers$$tank%#est$$ward',
+    '%&orking(&s.they##min##nat$!s#&r-like%&shriek$(.cricket$\'atorios%#way$#ers#&stbeef%#in\'\'&g-fire)#pan',
+    ')%trays#!t$"an##zen"#b\'t#\'-goblin#%/more##ati$"ut#"b.$+/nurseryman$#ans$0e-grillet\'&ndash%%d-out%(r-bandit',
+    '&&s.they&/y-with-violence\'&/theft$!i%"as%#ngs&)s-markham\'+/bellringer(%wilts$"os$!s$"yn##cad#&e-room$!.',
+    '$!n%"ek%%s-led$"rs&"es&#ton%"t-\'&fleury\'&houdin\'#jan(#ean(2ohnson-on-the-acid&%/aids&!e&$hall',
+    '&"os&\'s-jones\'\'/branch)(utterfly()consumers((director(*eyewitness(#gec).loucestershire(\'housing((landlady(&mother(#nfu(&oxford($paul',
+    '($unit\'!i\'"om()n-glasgow*&walker)\'/canada+&entral+)heltenham*&former*%motor*#raf)!s&"um&!y$(s-pierre',
+    '%\'pierres%#ton#!i$$chek&"on$$doux$#n\'s\'$-egg%%-hood&%leigh&0run-in-the-hedge%"ae&!s%#eae&#tte',
+    '%3s-breslow-greenland&)/computer)*nservative&(on-huron))pattisson(!.(&/bucks)%camra)&farmer)#new)&oxford/%shire)/parent-governor*)roduction)*stewardess',
+    '*&rainer)$west(%esque(#ian)!i)"sh(\'trained$%onson$$quet#"le%#tts%\'y-dixon#&o-deth%$legs$$chef',
+    '&\'p-style\'#per%&ruiser$#jay$"re$!s%"ki$+t&rehy;like%$-arm&(climbing&%kings&&makers)#ing&(operated&*production',
+    '\'$ired%-ic-techniques\'$ally\'$ists\'0s/computer-aided&"ze(!d%#nik%%rixes#)son-scott&&/chief(&ountry\'"de\'(hospital\'(spastics',
+    '$\'records$$tans#!t$"on##ull$$schi%+t&rehy;ness&)-spirited&"er&!o&"us"*c&iacute;o#(-feather$"ld$"sd',
+    '$$lity$%rdian$!s#!c$(agiovine%$rosa%!s$*o-saporiti#"ep$"ss#.h-berry/cancer$+berg-halton$)dale-born$)e-derrien&%kelly',
+    '%+/greenpeace%"au%/fordi&egrave;re(*t-montagne\'&ucault%!m&#ont%"re&!s%%sters%!t&"er&!s$&ingham$"us',
+    '#"io#/k&rehy;and-roll$#\'n\'\'$play\',roll-related,$type+!.+#ers\'$soul$!-%$\'ard%&ballad\'"nd\'#sed&)ogography',
+    '&$uilt%%cakes&$hill&&itadel&&oncert\'#red%&dating&(ependent\'&spised&%rills&&weller*#ing%%edged&(ncrusted\'(gravings',
+    '%%faced)!s(#ing\'$lls.&#irm&$lank&&ormers(%tress&&ringed&#uck%$girl%$hack&$eavy%%ledge%%maker',
+    '&%inded&$usic*#ian%(n-folkas%%opera&\'riented%$pool%&ribbed&#ose%$salt&)cavengers&\'helters\'&ielded&\'ounding&%tacks',
+    ')%-ness)!s\'#ore%\'trained&&umbled&$ypes%&walled\'#ter&#ise$!/%(acoustic%$funk%%indie$8a-rocka-rocka-rockabilly%-billy/skiffle',
+    '%%fella%"rt%%while$%beare&!d\'!s%$ound&!y%&rother$%cliff)"e\'\'%mbing%#rit$%drill%#ust',
+    ')#ing$%eagle%\'feller\'+*-kissinger%!n&$dorf&%field%&r-type&&feller&$ific&(y-keeper%!s&#que%(t\'n\'roll&)-assisted',
+    '\'$fire\'(guidance\'$like(#oad\'%plane($roof\'%range\'$sled&#.he&"/i&$eers&,ry-launchers&%share&#ted\'!s',
+    '$%faces%$ield%#oam$$glen$$hall&"rd$"ie&"st%"fy%"ly%$ness&(g-horses\'&fellow%#sms&"ts',
+    '\'"gs$*man-queens$\'o-vario$%piles%%ooler$)s/bogwood%$cape%$hots%"il%$tars&#orm&"ro$*umentaries$$wart&#ter',
+    '&"ed&%llian$\'y-power&(strachan(#uff%9/dorigo/deane/kelly/speed&\'stewart&\'tonight#$occo%+o-ceilinged&$fied$$rdea#&quigny#"us#"yn',
+    '$&oacute#!-$\'bearing$$case$$free$\'lengths$#man$%shift%%pikes#0/camera/whatever##ach$&ssiers#(bororugh\'3ugh/gloucestershire#(carrying',
+    '%&n-tree&$bury&%svale%$rpee$!i%#cks%!s$"on$1y/gloucestershire#%ebeek$!l$$mack$#nko%!s%+t-poisoners',
+    '\'%sized&"ia\'$cide\'"ne&"ly&"s.%$wald$$rici%!s#-gers-produced\'\'/oxford$$rigo#"he#"ia%"ei',
+    '$#lla$&mtseva$&n-like%%esque%"gs%\'ogaster#%jmark##ker#\'lington#,ney/sullivan&!s#$olfi&"us$\'montade$%nburg',
+    '#%rigue(+z-bachiller#%sdens$"et##uct#+way/witness$+ell/english#%y-yev#$zina"&e-deer$&tar-la#!.#&/drugs#$bbig$$ling',
+    '##dad#*g/director$*hlisberger#"hm#%landt&"ts$!l#+ntgenograms),luminescence(!s#%sberg$%elare#$thel#,ux-riencourt#$vens',
+    '"%feron#)f/westons$-e-steinrotter"&g-babe##aan$%cheva$#lin%)lo-winged%!y$"re%!i$%tions%$oire$#vit#!e',
+    '%(daughter%%field%)highfield%#ian%,s/continuity\'%drink\'\'england\'&glider\'&mother\'%radio($ospa\'(survivor\'\'teacher&"es&$iana',
+    '&#ton)!e%"us#$gero$"in$#son##non##off$$sina$#zen%(hin4,500#,ue&rehy;show%#ish"$hani%!s',
+    '$$rrim#%ilkan&#und$!n%!i$$rric#$land$"en$!f#)m-ramtron$%/cyro#"na#%rmann$1sanierungstechnic%(chneider',
+    '"(i-geddit#(aanshorn$"ll$)ut&eacute#!d##ght##jen#&led-up$!s#(neabhail$"ye#$rhak#&ssy-en$#ter\'(-doister',
+    '##uge##zen"\'jananil(!n%#ini$(shousing#"ot"%keach$%rites$$sley#!i$"ta#)kashomura##off$!n',
+    '#!s$"an%#reh##upa$"ro"%l-oyo#!a$#dex\'&/index$$ndis&!s\'$lied\'"on$"wn##cut',
+    '#+e(-to-role)$!-%+appropriate&(symmetry%&bearer\'\'haviour%&change%)described+%ption\'&viance%&filler&)ulfilment%%going%&holder+!s',
+    '&$lay.)"ed&\'osition%+segregation&&haring&\'pecific&%train+!\'(&engths&)upporting%%there&"o-($role&\'raining$#.24',
+    '$%/play$\'holders$&player$$s.93%*/practices&1relationships/sub%#_in#*f/national$)e-johnson%&hedges%!s#!i$"ns#-l&mdash;about$(\'d/among',
+    '\'$perm&%cross%&backed&#rim%$edge%#fed&$laps%$like%%meets&$ower%%necks%+out/peg-out%$ramp%)your-owns$%about',
+    '%$sons%$way/(!s$#bar\'!s$$dies$+e/musicians%(d-topped%!i%!n%"r-\'&blinds($oots\'\'coasted,#ing',
+    '\'\'milling\'\'reefing\'%skate,"rs\'%towel,!s\'%upper&*/surcingle&$ball\'&earing\'$lade&#ing&&skater,!s%!y',
+    '$"ie%#ng\'\'\'-collar($eyed("in*#-it($maul)#ill,!s($pins)(rogramme("up\'!.\'%stock&&s-show',
+    '&#ton$#man%"op$$ocks%!s%1ut-cum-developers%"va&#ers$&rights%#ock$"s-&(bentleys&-royce-engined,\'powered+(/bentley',
+    '%(/bentley%%royce%#ton%#xxx$$tops$"up$$yson##nis#"os#)y-polying"&m-chip$$held$)installed##ada$$ines',
+    '&,m&ocirc;tier$#ldo%"li$\'n-built&(catholic&\'emperor&(inspired\'&talian&$like\'&ooking&$ness&%shorn%-_&agrave_clef%-ce-adventures(%cubes',
+    '\'#_in&#ier\'(ng-where%(ee-conti&#lli&#nko&%sques&!t%3ian&ndash;hungarian(&-built)\'italian)(moldavan)(speakers&!c\'!a',
+    '\'"ta&!t&$zing%.o&rehy;britons&!-\'\'britons\'&iberic&$vich\'$skii&!w%\'s-bilan\'*christians\'(probleme%(tic&rehy((-crocean',
+    ')*historical)-individualist)\'lookin\'/!g*$yric."al)&minded)(sounding*$tyle)-technological(4/cosmic/evolutionary))salacious(0ally&rehy;minded*!s(/ist/utilitarian',
+    '%&y-born%"za\'!s&\'offiana$#ria\'!s%!y$!s%#ius%&zewski$"wi#"ba$#oni%*uts-droste#*e&mdash;it',
+    '$&-bound%#you$!/%-oxford/naples$#527$"ll$!n$,o-and-juliet&%class$+r-rosenthal%!i$!s%!h##ful#!i',
+    '$"jn$\'opoulou$$sche$#tic##ley#)ney\'skind&!a#1o-stuart-georgian$$cion$$jaro#&palong$(er-suits$$ings%"sh$#ono',
+    '$"un%!y#(sdalhorn#\'telecom#!u$"la$$shas"$n-bo$+concurrence#$aldo&$shay$#uld$"y.%"ne##cal',
+    '(!s%"to$$erel%%svaux%#val(#les$"hi$!o$$ucci#+d&ocirc;nia$%avels$$eros$!i%"ne$&omiaow',
+    '$#oed$!t%#tes$!y##gai$#buk$!e$$zhen##ick$!e$#lan$!s$"ta#!k$"en',
+    '$*e-filchner$#ing$&ybrook#)scevalles$#haw$%ingon$+on-produced#"uk##yon#$zani$"eo"&o-bars%"ra##chy#\'d-stone',
+    '%!e$#man##f\'\'$!-%!a%&breach%\'climber%$deck&#isc&#own%$fall&#orm%&garden&%irder%%leads',
+    '%\'on-rack%%racks%%sized&%lates&#pan)!s%&thatch&%iling\'$mber&\'o-floor&$russ%$work$)/bodyside%,loft/windows%$wall',
+    '(!s$%ed-in\'$over%"ry$!f$$guns$)ing-grade$#rib$$tile%&opping$%wards#$gagh%%lator$!s#)k-scaring',
+    '$*e-matthews%-r-wise-lawson$$ford$$hope$#ing$#ley#*m&mdash;it+#not$!-%$\'ere%,and-kitchens%+cum-bedroom%(dividers%)enhancing%&facing',
+    '%"in\')-the-roof%#key(!s%&length%"no\'#des&(umbering%&rupert%&sealed\'%tting&$tyle%+temperature&"he&$o-be',
+    '$$.she$$/bed&(reakfast%)classroom&\'upboard%&lounge%\'sitting%\'toilet/%$ward$#and%$tism$$full$\'heaters$%rates$%s-and',
+    '%$cape%&ervice&!t#"n\'$+ey/managing$!g#"pe$&narine#.sevelt-pinchot)#ian)!s$$kies$*ting-place%%mates#,t&mdash;pack',
+    '$+-assignment%$beer\'\'rnstein&$ound%%canal%(division%&eating%&fibres&$orms%%hairs\'"ll&#old%$knot%&lesion(!s',
+    '%\'pattern&%runed&%ulper%#rot%$sort&%pread&%ystem%&tubers%\'wrapped$$bont$!e%%r-out&!s%$s\'we%"th',
+    '$+in\'-tootin\'%"sh$.liep-costerman&"ke$#s/i$$zone#!y$"en"$p/de#*e-anchored&\'ssisted%&bridge&#urn%\'dancing&$rawn',
+    '%\'fringed%&hauled%$lead&$ight%%maker%$race%\'scarred&%oloed%#top(#ped%$walk)!s\'!y&%orked$$able',
+    '%#ike$%maker&"te$\'r-inner%\'/deputy%$gate%"ty$(s/chains$#way%$orks#%haien##ier%!s$"ly#+ner/general',
+    '#!s$"on"*que-gageac%%forts%(taillade"!r#!a##bus#&e-wert$#nto#"ha#$ippa##kes#$sats$,chach-heiden',
+    '$#man#$tyan#"ys"+sa-de-monte%(sinensis$!e$#inz$!l%!e&(sfinance%$inda(!s%#ynn$"mi$$nagh',
+    '%!e%#sky$)rio-braid%*y-mumblers&!.$"ti%!o&\'menergo#$baud$&orough%$ttom##cam$$elin$"he&!r',
+    '$#ian%\'szewski$+oe-rathbone&!a%#rla#$dahl#*e-and-dora&%rbour%%beige&$loom&\'reasted\'#own&#uds\'$shes%$care',
+    '&&rimson\'#oix&"ut%+dora-dieter%)en-soleil%(geranium%$hill%\'jointed%(lavender&#eaf&#ike%&madder%&period\'#tal&$inks',
+    '&.urple-coloured%$silk%%thorn&%ipped&$rees%&violet%\'windows(#ged&#ood%!y&$oung$*/carterton&&ostume%\'manager$#ann',
+    '$$berg\'#ian%%owers%%ridge%,ud-gathering&3rn&ndash;craigleith$%clear\'"er%\'oloured%&raddoc$$dean$&garden\'%lands$&hearty\'"th',
+    '$$lend%#ini%$lini$\'marinus\'\'y-water%#ont$%nauer%#bau&(ergdalen)"er&$lood&$usch%$dale&!o%$eath',
+    '\'!y&!y%$gerg&#ren%$hain%!i%)kranzfest%$mayr%#oir%%qvist%!s&&trasse%0thal-joachimedes)"er)!s',
+    '%$wald\'#ter$!o%%plena$#rie%#oot&!s$-s-and-castles%!.&#new%+/silvertone$.tte&mdash;come.#one\')-coloured($like',
+    '\'!s&!o$$vear&"lt$$warn%)ood-board+$died)(coloured)$neck)(panelled(&/cedar$#yne#$gill#&hingya)!s',
+    '$#ere$%gnoli$"ka$"ly$#nas%!e%!s#$kens%!s$"ha##ley#$mary$%inian$"us$*yastoltorg',
+    '#%olino&!o#\'pa/sapc$!o#"s-%$bain\'%rnard%(giverson%%jones%$like%\'milbank$./herefordshire%)political%"tv%%viola',
+    '$\'borough$#dhu$*e&mdash;br%$lini&#son)&(fuse)%%ndorf%:tti\'s/dickens\'s/browning\'s(%-hell$\'handler%#ire$&ifloor%%gnols%!i%"ng',
+    '&"ot%+ter-marvell($/the(!s%&yskiye$!l%"ea$&maynes%$eisl&"re$%nerin$"ol%$neri%!s$!s',
+    '$!y#"ta%!d%#gno%!l%!m%!s$%boell$&enberg%"rn$\'icceria$#ker$*ov-na-donu$%ralis\'"ly',
+    ')$idae(!s%!o&&conchs%#ums&!n$/worowskiculture$%yllyn#&udgeon$!s#(vneshgeo##was$)ell-based#)y-bricked(#ght',
+    '%$hued%$pink%#red%\'skinned%&tipped%&veined%&walled%&yellow#"za%"ck$%canov"+t-resisting#&/decay#%a-bed$!.',
+    '$#dex%&iscids$#fac%"lo$$mers%#ole$#nda$$plug%$rint$#ria&!s%!u%(y-driven\'\'engined\'&headed',
+    '\'&winged$%table%*e-and-move&+/accelerate%)ing-anode)$wave&*on-powered)*reflection(!.($ally%"or%!y$$vata\'!e\'#ing',
+    '$(buehlstr$!m$$none$"rs#*h-behrendt%$ness$\'aariges%&mstead%"us$$blat(!t$,chanasathian$%emere%%nbaum\'#ery',
+    '*"er&&gatter%#ram\'!y&,hithe.tunnel&#mel&!n&!s&#was\'#ell\'#ick%%say-o$$fuss$"go$$rock',
+    '$,well/mingard#(isseries#.o-combinations%(stripper$$bass&!t\'!s$!l%!a$&mahana&!t%&oulded$!n%"di$,r/collective',
+    '%%borne%$cure%$head%!k&#ite$%scope)!d%$pike$&vation#%sagno$"ea%!t$$tock#)ten-apple\'#egg',
+    '&"er%*rdam-based),/bremerhaven*)europoort)$sche$4ing-vegetation-flies\'5dean/roedean/brighton$$mann\'!s$!o$$sann%"er$#wil#%uding$"la',
+    '\'"ia$#nde&%ities&"us$#sis##vel#$wang$\'eillers"&ualles$#mba$"ne$"rt$*ult/george#$bein$&illiac',
+    '\'&dollar\'&paying&1=us&dollar;0.56464#708&\'s-worth\'!.\'"=1#$caou$!y#$dbar$$eiko$"in$$nice#)en-dieppe#!f',
+    '#(ge-brush&%croix&)dominated&\'stained%$ment%#tel&"te$0h&rehy;and-ready+\'housing%!\'&!n%!-&(actioned\'Nnd-crusty-but-it\'ll-wash-off-by-monday-morning*)readiness',
+    '\'+t-the-edges&\'country\'&rushed\'#url(!t)!s&#dry&%faced\'\'ighting&\'grained&&handed\'$ewed&&ironed&%lying&&mirror',
+    '&$neck&\'planned)&stered&\'raddled\'#oad&*sharpening)#ven(%elled\'\'ketched\'&talked&(textured\'%opped(#ugh\'&rimmed&"up',
+    '&&walled\'&eather\'$oven%%/fast%$age.(!s&!n%(er-edged($hewn%$hewn%*ie-toughie\'!s%(ly-drawn($laid\'!.',
+    '&&ongill\'!r$"ie%"ng$"on&)-macquart&!s#&hanyat\'%oun-e#*ill&eacute&"er$#ssi#"ke#"le%"/1',
+    '%!s%\'tabille%"ur$$ston#%maine$%elian$#mou#"n\'$"ce%#ing%!y$.d&mdash;during&(rehy;who%#(s)%$-bag',
+    '\'&rimmed\'%uying&\'cheeked&%dance&%edged&#fac\'&igurey&$head\'$ouse&\'iceland\'&reland&\'journey&%keyed&&mouths&%nosed',
+    '\'#hot)%ulder\'&kulled&&table\'+"rs\'#ext\'#he-*&corner0/-from-the-truth*$head+$ouse/!s*$legs*$pole*$town',
+    ')&=world\'%icket\'#oed($pped\'\'ripping*!s&(vowelled&&wounds%".2%*/flatwound&)marketing%\':oldham%!a%+ed&rehy;off\'$-end',
+    '&"ll&#yes%#ham\'"nd\'"y3&%eads.\'%gians&#ole%#in\'\')g&rehy;up($-out(!s%&mouths%&nesses%%point',
+    '%%sfell&#ome&$tone%$up**%%water\'!y$$tree##ppe#(quelaure&!t\'"te#"re$#kes#+se/mechanic$!h',
+    '\',/oxfordshire&!n$%illon%"n\'$"ka$$sain&"ne%,eau-inspired(#ean($ness&\'l-uclaf\'"le\'"ot&!s#+t-furniture',
+    '$$e(s)%(-finders\'%lying&&giving&&letter&(marching&$name\'\'etworks&(planning&&setter&$ways%$.the%$able%\'baggers%"ry',
+    '&$tone$,h/bellringer&%trust$"in&%e.she\',ly-collected\'"s.)%there(\'/habits&\'g/cross&$ises(#ing\'"ze(#ing$-ledge/british',
+    '$\'tenberg#$vres#"x\'$#-en$$inol$!s""v1#&acabin$!l#\'elander$(r-badged&&engine,!d&%front%$/bae',
+    '&%rover%%coats%"ed&!s%#ies%%s/2nd$#sti$#tta##in\'%!e%$gham#%katch#"no##uma"*w&mdash;at',
+    '#&-boats%(y-column$$crop$"in$%ow-ow#)/midfield#"ak$$llan(!e$&n-beer(#rry&(hamilton%(/brother%$ella%!y',
+    '$"tt#0bottom/aldbourne,%thorp+(ylesbury*\'banbury+&ridego+)ullingdon*\'calvert,$stle+&entral*)eastleigh**gloucester*&halton,$ydon+%enley',
+    '+*untercombe*%lower*)nettlebed+*orthampton/%leach/$moor*\'peppard*\'russell*+silverstone+$tone*&taszar*)waddesdon+%eston+&inslow#\'chester',
+    '##die&"st$%yism\'(!.#.e/chiropracter%\'village$!l%$ling$(tta-isms#"ff#%hedge%!x#%iecki$!n%+g&rehy;boat',
+    '\'$deck\'$oars\'\'parties\'$song&!.&#ton#!l$+and/bristol()wiltshire\'"s.(&/award(%onian$"en%\'y/royal&!s',
+    '&$son.)+/cheltenham$#ock#!n$!d%"ed#$plas##say$.ell/smithkline$$tock(,/oxfordshire$$well#"th"$xani#\'burghes',
+    '#$town""y\'#&-lewis##al\'%\'-family&$gold&(standard&)tour-type&(watchers+#ing\'&elcome%\'/yellow%,e/herreweghe%#ish&"te',
+    '%%ties.))/advances&\'y-class(%style$!t$$ulme%$mont#&bridge%#ook#&cayrol$\'e.today#!e#+le/coaching##net#&sterer',
+    '()cambridge\'(/cawkell"%zalia%"la$%novas$,rio\'ssozario##eby$$laar%"le&!s$"ma$\'ncrantz)!z$!s##hen',
+    '$&ukaite#%ynski!/p&mdash;welfare"$-300##63a&&-11-be%!g$!5#%refah$&ipstop"#.10"!/#&kapsco"!1"!2',
+    '$!0"*42,800,000"%67580""b6"5f&mdash;reformational"\'g-based$.for-the-masses$(to-cobol\'$unix#"ii%&-based""is"$m/23#%i1640"+o/leibowitz',
+    '##ses"!q##-10"-r&mdash;rally#!c#!f"*s1,500,000$)0,370,000&\'400,000$)4,300,000$)5,000,000#*20,000,000#*30,500,000#*40,180,000#)8,900,000',
+    '!)r&pound;1"!-#\'tupolev#"we"+.7&ndash;12#*8&ndash;11"!2#"99")3&mdash;8"!7"*9&mdash;18"%=0.67#$1.30&!9##2.9',
+    '%!1#$4.02%!7"#age#!h#"po"!c"%i/erc#!p""ls"!n#\'a-based"&ollsaa#$tten"(raaagggh',
+    '#\'oorrrrr*!r#!r$#ing$$ring%$ring&!r\'#ing\'!r!)s-232/v24##323##4ct#$6000#"8v#&random',
+    '#(4,62,000#!5"0/6000-compatible(\'derived(\'es/9000(\'powerpc\'"s.$#ooo#&series#&univrs"!1#(,000,000$\'190,000#)0,000,000$!0',
+    '#&18,000#&30,000#&40,000$%1,200#&50,000$%7,500#%7,500$%0,000$%5,000#%8,500#%9,000$%0,000"+200,000,000$%2,800##100',
+    '$%2/v24#&50,000$%8,300#&76,900#&92,910")3,000,000#%1,000#*50,000,000#&78,000"%4,600#*20,000,000#&53,000#"ct"!5#!0',
+    '#%5,800$"00#"62")6,000,000$#200$#500#%0,000$)0,000,000%"00&!s#%4,400#%5,000#%6,400#%8,400"&70,000',
+    '#"12#%5,000#%6,000"&80,710##100#%6,000""90#)5,500,000"$=0.2%!4&!7%"52&!7%!6&!6',
+    '"\'a/ucles#&i-rsai""bs"$c-1x$)sponsored#".3#$/apa$"bt$#sci#!c#"ms#!n#%order#"pa#$u-pa',
+    '"!d""f1#!3""is""js"!l""mb#$ooth"(o/duarte$(gelmetti%%ibson$)kitajenko#"rt"+pb-designed$#/aa',
+    '#,ca-sponsored$!e#$onse"!t!\'t-based#&global#&pa-tnk""97""as""ca#!d"#ecs#*lationship#&verand"#f\'s',
+    '""g7"(h/iseler#!k""ia"$m322"(net-ftam&#tcp&(x25/plus""oa#!s""pl""s."!x!+u&eacute;e\'"#\'uf',
+    '##486#%ir-os#!o#"tu"#200"&adbern#!m#+nda-burundi\'&urundi$"ne#$pehu#%rdean#\'taniwha"$b-in$#off',
+    '$\'rubbing$%stone$(up-a-gal$/your-face-in-it#"ab$"ck$#iya$%lcaba%!e$!n%!d%"si$#rto$#tex%!i',
+    '%"at#"bd$\'ed-away\'$down\'#off%.r&rehy;stamped&!-\'%bands\'\'cleated($oats\'\'encased((xtruding\'%faced(&langed\'&gloved',
+    '\'&legged(%ipped(&ooking\'\'monster)&ulding\'\'necking\'&padded($lant\'$rich)$dged\'\'seekers(\'heathed)\'redding(%tamps)&ringed',
+    '(#yre+!d&(/leather&\'bandman\'#eck&%iness&$maid&&necked*!s&&plants&$shod\'$oled\'&tamped&$ware$!i',
+    '&\'g-marks($post%-sh&mdash;they((rehy;bin\'(-as-fuel(#bag)"in)&urning(%chute))ollectors(\'dumping()mongering((per-head(&strewn(#tip',
+    '\'"y.$*le-covered\'%lined\'\'walling&!.&!s%#ing#"el%*la-damaged$$nden%#ses(#que&$huis&#ian$%rglas',
+    '$!s%%cence$!y#$ible$,con-crossing%%undus$*dium-doped%#oux%"us$%frons$"ne%!s&%hteyn&,tein/diacono+&report',
+    '$"ya#&letsky$#yov##ner##out#&rianum%(calities\'$tion%\'rostris%)ventralis$#uck#!u$$sana#(y-bright%%faced',
+    '%&ringed$%fruit$!s$$thon",c&rehy;garda#*ajinternal$#tse#%colen#\'hardson$!e$+uphandeputy#)k/company$%ed-up$$inge$"le',
+    '$#man$-sack/suitcase("ed&"na%0tandsbeseitigung$$wick##was"\'dabanya$!i$$ragi#\'chester##del%!n%\'r-pedal\'(trimming',
+    '&(/aileron\'(dihedral\'#low&#ing&(lessness&%vator+!s%!s$#ied&!s%"ly\'$-lit%"ng$\'y-brown%!s',
+    '%%noise$!l%"ey%!s$!n%%esses#$gard\'\'/bulmer$#ley$$wick#"ha#$ibus$)mentarily$$nger$!s',
+    '&"id(!s##jak$"er#"ko#&olfian\'"ne%#phe\'!s($hohe#\'rapatna&%rayag#%stone#"us#$wick',
+    '"%e-des$\'formica#-/curator/pitt#$fuly#"gg#,il-malmaison#$llan%!e#(schmeyer#!t$$schi##val""fe$"no$!r',
+    '\'"re%\'diamond%%sized$#ett$\'ianism\'%"li&"li$(le-edged\'\'fronted&!r\'!s$#ner$$ruff$"us$!y',
+    '$$sque#*o-villosum$"lo$(us-brown#!t#"ug$!l",g-brilliance$\'chested$%laden%#oss$%maker$)scattered%$ized%$mart',
+    '%%isdom#(/blanket#&abella$#tus#%beian$+y-conscious\'$razy&#mad\'&edicos&\'players&%shirt+"ed\'%occer&\'tackled+#ing',
+    '%%29pts%%class%#man(!s&"en#!e$\'lach-it%!y$$nera$%r/mac#+ged-looking&%ising%#lde%&r-blue(%ugger',
+    '&"ed&!s$%ieros%"ng%"sh%#tis#$hani$!e##ier#$less#%maker&#ing#$ose.%"us#"s.',
+    '"&hakana$%niyat#"bc#"ee#%ieben#)r/benelux$$berg#\'umuliza"$iari#$jter##lin#$minn#)n-studded%&theory$"am',
+    '$!t#"ru#-se&ntilde;ada$!i$+s&egrave;le%$eler\'"le%#ian##ter#\'z-perez$(interior"$jeka#!u"!k#*a-ruka-row',
+    '#%hsana##iya"%ldolf#/e&mdash;notably%$rehy));governed*&making$!\'$!-%+articulated%&beater%&change%*definition\'\'pendent%(enforcer',
+    '%(follower%)generated%$hard%%maker%\'obeying\'\'serving&$rder\'(ientated%(response%-specification&(tructure$$.the$\'/tenant$%d--in&%based',
+    '$+r-ideologue&)portraits&\'subject%"s.&-_in_the_light$+s&mdash;for,%gives%+-discretion&+of-the-road&"to%+/heuristics&\'options%#_as"#m\'n$"un',
+    '%%ubber$&chaser$%laced$\'runners$+stick-a-bum$&te-tum#!a$$ilah$"ls$2nia&mdash;larousse\'%/1990\')n/russian#&baughs$"ek$*ledethumps',
+    '%!y$"os$)ustiously+$ness$!y#$eila$"sh%#sen#$fitt#3illajta(rumillajta)$)nant-like(#ium#$jahn#)mage-room(&search',
+    '$\'elsburg$.idge-wallsbury#!o$"ri$)ur-filled\'\'machine(#ill(%onger-#ing&.ed-to-be-great&&sville#%p-fed%\'to-rump$&burger$"ed',
+    '%#ius$#ier$)le-headed&)d-looking&&meyers&"rs$\'o-epics%!e$$uses$(y-humped&%pumpy&&risers##say$#kin#&tickle',
+    '*!i$+rehy;getter#!\'#(-a-brite%&ll-day%#way$$back$Cdown-at-the-end-of-a-long-hard-term$"ed$)gathering%%etter$&makers$"of&%-mill)+ne-material',
+    '\'#the*%-hill%"ns$*responsive%"ig&"ot%@ound-platforms-collecting-things$9swimshoot-horseride-fence$%tally%)o-failure$$ways$$xxxx#(.program$#two#*/don\'t-run',
+    '$#win#$_out##aid%!r$4ways/girlschool/rock#%cible%$mann$\'ologist%)rn-widnes$#ton#%denko$(funkhaus$#hof$%schau#\'e-based',
+    '%\'friezed%)inscribed%\'painted%\'scribed&$igns&\'tippled\'$rewn%%woven$&daubed$%light$%stone#$fold%"rd##ged$$less',
+    '$$bury$#ide#&ically%!h#$less%!t&!s#&nacles%#lls%!n$!e%$lled\'#ing%!n%&r\'s-up',
+    '&\'/bounty&#ing&"s-()searching\'*/signalmen&"up$"in&\'\'-board&"g-(#boy(!i(#out($shoe)#lip)%titch',
+    '*/rough-the-woods)#ime\'(/fitness(\'jogging()minimised($nike\'%_away(#out\'&s-down\'#ton%!s%!t$#ner$%ymead#$ours',
+    '#%pasts#"s/%$time$%=0:03(!6\'"30\'"45%$1:15)#est\'%30est\'%40est(!5%\'2:00est(!5\'"15',
+    '$$ince#&t-like$"ed$!y#&way(s)&)-wrecking&!.$#ell""og#"ru#"ta"&pasena$"ul#)ee-rouble$(rt-\'only',
+    '#!f##hin#"ia%"hs#%kotha#$olei$"rt##pel#%tural#%ununi#!y"!r#+al-agrarian&%owned&+proletarian',
+    '&\'seeming\'$tyle&$type%&/inner&*social/age%!i&"se&&zation\'#ing%(ly-based%!s$#nge$!r#*banization#!e',
+    '%"hh#"ik#&opolis$!r"%sakov$#lki$#nen#&bridge)(r/former#%cello$#oe.##day#)e-giurgiu$!l%"er',
+    '$\'setings#&h-beds%&candle%)immediate%#job%$laid&#eek%(of-blood%\'release&(ush-rush$!.$E/clough/saunders/atkinson/whittingham$"am%"nd$$bury',
+    '$(die-like\'!.$!e%$nden&!t%#sha%!y$$ford$$hour$%illon%"n\'&"gs$%leigh%#ift$#mer',
+    '$$pool$#tah$-yford-woodham#!i$"ng%!s##ked$!i%%n-ian$!o#+s/wiltshire$!a$\'borough$-ell-copleston((stoneham',
+    '(&bishop(\'england(/gloucestershire(%plant\'#ing%!n%+t-and-black+/orange-coloured\'%brown,!s\'&orange\'%toned&"ts&!y\')-greenish',
+    '&%-wide&(.richard\'#the&/n&rehy;dzhungar\'!-((accented)\'ustrian(&backed)*elorussian(&caught)&hilean))ontrolled)$uban((educated)\'uropean',
+    '((georgian(\'italian(&kirgiz(*lithuanian(,manufactured()norwegian(*orientated)$wned(&polish)\'roduced((roulette((speakers(&teleut)&urkish("us',
+    '()mongolian\'#ism(&zation)"ed)#ing\'$ness\'"s.%"fy%!n$$kaya%!i%#oye$0o&rehy;bulgarian+(japanese%)-american',
+    '&(georgian&&indian&&polish&\'serbian\'&wedish%\'centric%(japanese%*n/hereford\'&sports%%phile$"um#\'t-blood&&uckets%%eaten%$pink',
+    '\'%oofed%\'stained$!a$(enburg-1%&wellee$)ic-bridge\'&effect\'\'looking\'(sounding&$ally&%helli&!k&#ola\'#rum\'!s',
+    '%"er&"st%!k%$ques$"om%!w$&s-free$!u%!m$\'y-black&(coloured&&orange&$pink&(sounding&&voiced',
+    '#!u$"ku&)transport##yny"1tan&rehy;designed%)-designed#!e$$nois%%spitz#&geerts#&h-baby\'%iting%$type$(_as_well$$anna',
+    '$"en&$beck&\'ium-103,!6%!r&$furd&$tord$.lessly-applied$"us$$ven\'$$well#+igliano/nfl$"le$!n$\'shauser',
+    '$%owski#/land.and-melton\'%shire#\'minster#(ter/boat\'\'council\'&labour$#ish$"le$$mann$#ner#)undifolia"+ud-pedersen"$vina##uma',
+    '#&eishad$"ti"!x#\'-burton#%andra##pin"(ysbroeck$#dal$\'senaars"&z.full##ici%"ka$%zi-ii#"sa!"v-',
+    '"#cma##vma"%ealed"*olutionary"!s!1w382/g&ndash;xvia\'%-xvia"#450"#500"!a#"je##mba#$nda*&#ise&$nese',
+    '"%e-dea#"ll"$p(t)!%x-360#!l#$v600""03""17""22""d1$!+#"5+%@&verbar&verbar;nd7&verbar&verbar""e6#"v6',
+    '$!+#!7#"8+#!s""g4#!6"!q!6y&uacute;ky&uacute;ans"*a-approved##bev$$tsev##d-i#!l$"le$!s',
+    '$+/headmaster%&shanks&#kin$#air$!i#*zan-uralsk&*ova/parent$-hsk-morshansk"%bakov#(n&aacute$$itsa"%chard$"ta"%dales#*er/project',
+    '#!z"\'e-bread$&grass.$%wheat#(/midrips#$bank#$cart#$land#$mark\'!s#$nses#!r"$ford")ghtwysnes"$hall',
+    '"%iance""ja""ke#%odisc"+land/friend&"er%!e##ey/&(abingdon\'(ylesbury&#cam\'\'harlton((eltenham(%innor&$five',
+    '\'\'rilford&*gloucester\'$reat&&henley&&london&$mike&$stow\'&udeley&(woodford##ock"#max#*er/charity&#one##ing#$outh',
+    '"$nand#&earson$!k#!g#$hart#$ning#!o$%ikism"!o#$anji#$ichi#"ji#)kan-style#&pteris#$suke',
+    '"$pien""r1#"ie""sa#!e#$kamp$"ov##ton#\'zkowski"$thme%&ically%!n$"um$(wysnesse"#uji',
+    '##min"1zhkov&mdash;chair!!z""-4"$1032",eczpospolita%+ypospolitej#\'szewski#$vski"!r (s&aacute(%;zava#(circ;one+&-doubs#(elig;bol',
+    '#+grave;nchez#$mp;a&$p100#4ring;rj&aring;sjaure7&stugan)/sj&aring;sjaure#8uml;ure-di&auml;thylamid".bsol;described",dollar;1,330+#500+#900*".2+!5*$0/sq+%0,000',
+    '*%2.1bn*%4,100,#600+"2m*%5,600,#800*%7,100,#200)$2.58+#9bn*&00,000,!m*%2,867*\'3.131bn+%0,000',
+    '*"46*!m)%3,500)%4,900)%5,300*#/sq*"bn)#636)%7,200*!0*"50)\'800,000,!m)"90*%5,200',
+    '"+eacute;amas*#nce-!s)\'bastien)&choir-*#ure)"ez)#guy)#kou,,-tour&eacute)(l&eacute*\'incourt)\'mantiqe*%illon/+-chardonnay',
+    '20schauss&eacute;e*$ieur),par&eacute;e,!a-"nt-$tion)&raphin*#gio*#ies,"ux*%usier)#tif)+vign&eacute#0grave;che-cheveu3!x',
+    '"*iacute;mon"+lstrok;upia"%mdash\'&;white")ndash;412(#55t($dies("ex($ould"&oacute(%;ller#\'circ;ro#+slash;rkapp#1uml;-fugl&ouml;ya\'\'derberg',
+    '+!a\'&rdalen(%ensen"Irarr;a&rarr;b&rarr;c&rarr;d&rarr;e&rarr;p\'!r#$gr;t"+uacute;arez)1illeabh&aacute;in)(lukongur#%grave#,uml;dtiroler\'#her\'(khbaatar\'%ncler("de',
+    '\'#ren((m&eacute\'%ssner",yacute;rovou!8\'&eacute;lev&egrave;rent*&prouve*\'tendant"(adresser##khu#%scose$%surer#&wricht"$been#$lood"$easy',
+    '#&xpress"%funny"%great"-hertogenbosch"!i#%mpose#!o#"sh#!t"$just"%major#!e"!n"\'occulte##nly',
+    '"&partly"%right"(ss\'arian"(thampton$!e!&(wing)""y)!"**"!u!#-12#!e#!s"$2251#!a#!f',
+    '#!5#!t"$4/10$#630%"70%"90#!5"!5#"8h"#61n"!7#"0a#!6"#a-d#-denosyl-&lsqb',
+    '"#bus"%cargo#$urve"$datp"\'e-v-e-n$!x%!.#%nergy#&xpress"!f#%amily#(or-sugar"\'gilmour"!h#!e',
+    '"&i-1983#"ng"%l-o-w#\'anguage*!s"\'monkton#!s"-n-n-r-r-r-l-l#+itrosothiol"#o-n$!r$!s"\'painful#.hase-dependent#%lane.',
+    '"&rechem%#ord$*gistration#%osyth"#s-s%$-say\'"ix%#aid%$orry#"am$!y#&candal#"ee$"ll$"nt',
+    '$$vens#$hall%#pes#&igmund$#lly$!t#(ometimes#$pain$+ecification$"in#(tability%!y&#ing$$raps##uch',
+    '#\'wimming"(terminal##rap"#u-n"!w#%armth!$.-g.""08"-1(3)(a)(b)(c)$#4).$"l)#!.#"03$$7(1)&"4)',
+    '$!b#$1(1)%"2)$!8#$2(6)%"c)$!8%#(1)#$3(2)%"3)&"1)$!2$$8(1)$$9(2)&#l).',
+    '#$4(e)$"1.#$5(3)%"4)#"70$!5$!7%#(1)$$8(1)($-(2)&"2)#$8(2)$$0(1)#"93$!9',
+    '"&200(1)$"2b$!4$$a(a)#$1(a)$!3#!2$!2$!6#$3(2)\'!1#$4(3)$"5b$!6#$5(3)',
+    '$!3$$9(1)#%6(10)%"2)%"6)#!7$!2$!8#$8(1)%"3)$!3%#(1)#%90(1)#!b#"km',
+    '"%3(6a)#$0(1)$!9#$1(1)%"2)%"8)#!2$#(2)%"7)%"a)$!5$!7$!9#!3$#(6)',
+    '#!5$#(l)#$6(8)#$7(2)#$8(3)#$9(4)%"8)"%4(1).$(2)&mdash$"5)$"a)#!.#!0#$1(1)#!2',
+    '$"7.#%3(1a)#!4#!5#!6#!8#!9"*5(2)&mdash$"5)#$0(d)$$a(2)$$b(2)&"3)#$1(2)#$2(1)',
+    '#$8(1)"$6(b)$"c)##1b.$"c.$"d.$"e.#$3(1)#$4(2)#!6#!7#!8$!6#$9(1)"*7&ndash;10',
+    '$"5)#"03#$3(5)#%5(1)1#!6$#(4)#!7#$8(3)"$8(3)#"/8#!4#!7"$9(2)#!0#)2&ndash;3',
+    '#$4(1)%#5)4#!6#!7"#a.d$%e.for&!s$#m.e$"r.&!a&"l.&"u.$!s$"w.$&y.s.f.',
+    '#%shton"$b.o.#*ordelaises"(c.c.a.c.$!h$"i.$$l.r.$$m.o.$#u.m#,apillifolium#$rowe"!d#".=$"d.$"s.',
+    '$%a.l.s&"t.$"b.$"c.$"n.$"r.$!s"$f.x."&g.c.p."#h.0%!.$!e##ahn$%rris."$i(3)',
+    '$"s.&"i.#"ii#%nglis#!u#!v"*j.perelman%\'hillips"%kilda"%l.g.a$(mcknight$%t.299$"u.&"t.#!0',
+    '$$pine"(m.a.t.v.$"d.$!e#%ather"#o.b$!s$"u.&$s.a.#\'bliquus"$p.b.$$e.s.$"k.$$s.t.#%arish',
+    '"$r.b.$(crockett$$d.t.$\'j.walsh$"s.#!n#%owsen"%s.o.s$#ray$$s.i.#!6#%chall#%hiels#!i$!n',
+    '$#ift"\'t.a.r.t$"l.$!s%+.o.s/t.s.os$$u.c.#6oday/lunch/zmu/1/11/93""u.""v.$$d.p.$"p.#"io#%olmer"$w.1.$"2d',
+    '$"i.$&k.f.a.$"r.#"ed$"st#"yn!\'/&dgr;d#\'radic;n"$1466"\'957/91/"!a"!c"#dms##rms"$foam',
+    '"#n43"$pine"#res"!s"-t183021/10med#"dy"!v"%wheat"!x"!y!%0*w\'0"!3""41"!5""ds',
+    '!/1&ndash;240c-32)%85g-8)"s3"$(10)#"a)"$*w\'1"#-lc"".1""/n"$0(7)##/21#"02#$1(1)#$2(2)%"3)',
+    '#$3(5)%"6)%"7)$!2#$4(1)#!5$#(6)#!9"$1(c)#$0(2)#"3a#!6#$a(4)#!s"$2(2)',
+    '$"5)##0\'s#!5""30#$1(1)\'!.%"7)#!6#$7/83#$8(1)#!a$.(2)&mdash;this\'!."%4(3).$"5)',
+    '#!2#!3#!4#$5(1)#!6$)(1)&mdash%"3)"\'5(2)(c)$#3b)%"c)%"e)#!0#!4$#(7)#"5.',
+    '#!7$#(1)#$9(3)#!a"$6(7)#$0(2)%"4)#!1#$2(1)&"1)#!3$#(2)#!4$#(5)%"6)',
+    '#$6(1)%"2)%"5)%"6)%"7)#!8"$7(1)%"0)$"3)$"5)$"6)$"7)$"9)#!0$#(2)',
+    '#$3(2)#!7#$8(2)"$8(4)$"6)#-3,000,000,000#!4#!5#$7(2)"$9(3)#$2(3)#!6#!9$#(2)#!a',
+    '""s2!$2(6)#"7)"*-ribosomal"#.78"$0(1)$"6)$"7)$"8)#&00/200#$5(1)#"y0""11$#(5)#!4',
+    '#!8#!9$#(2)"$2(1)$"2)#$0(2)#!2#!3#!7"-3&mdash;which##(3)$"5)#$1(4)#!2#$8(3)',
+    '$"4)$"8)#!5#!9"$5(2)#!1#!3#$4(5)"$6(1)#!3#$7(1)%"2)%"4)#!8$#(2)',
+    '$"3)#!0#!2#!7#$8(a)""82#!4#$6(2)%"6)%"7)"$9(1)$"5)$"7)"!a"$b(e)',
+    '"$(3a)#"5)#"6)#"a)#"b)",/p0:ribotype"!0##(2)#!9"$1(2)$"5)$"6)$"7)$"8)$"9)',
+    '$!5#$6(3)"$2(1)%"a)$"3)#!1#!9#$a(1)"$3(5)$"9)#!0#!6#$7(1)%"2)#$8(4)',
+    '"%4(11)$"4)$"5)$"6)$"9)#!.#!1#$7(1)%"3)#$9(1)"$5(1)#$6(3)"%61(3)#!3#$7(5)',
+    '$"6)"%8(10)$"2)$"3)$"7)$"8)#!.#!0#!1#!2"$9(2)$"3)$"4)#$3(9)$!a',
+    '$"4)$"5)!*4&ndash;s6"#(3)"".4"$0(1)$"2)$"3)#$2(6)#$3(4)#!9"$1(2)$"8)#$2(1)#!4',
+    '"$2(1)%"a)$"7)#$5(1)%"4)#$6(2)%"3)%"6)"$3(3)#!0$#(9)#!7"%4(11)$"9)$"b)',
+    '"!5##(1)%"0)$"6)$"7)#!1#"9."$6(3)"%7(12)$"2)$"4)$"5)$"8)$"9)#!8',
+    '##(2)#!2#!8!$5(4)"$0(1)#!5"$2(1)$"2)#!0#!4#!8"!3##(3)$"a)#!0',
+    '#$3(1)%"7)"$5(1)"!6##(4)"$7(1)$"2)$"3)$"4)$"6)#!4"$8(1)!$6(1)#"6)"$0(5)',
+    '#!n"$2(1)"!3##(1)$"2)$"3)"$4(4)$"5)"$5(7)$"8)$"b)"$6(2)#$0(1)%"2)#!2',
+    '#!4#$5(1)%"2)#!8"%70(5)#$2(1)#$4(4)#$5(3)#!6#07&mdash;although$#(5)%"6)%"7)$!.#$8(3)',
+    '%"7)#!9#!a"$8(b)#%1(5).#*2(2)&mdash#$3(1)%"3)#$5(1)%"2)%"4)#!7$#(1)"$9(7)!$7(1)',
+    '#!7"!1##(3)#$6(1)#$7(1)"!2##(8)"$3(5)#$9(2)%"4)%"5)"$4(2)#*0&mdash;it$#(2)%"3)',
+    '#$2(9)%"e)#$3(1)"$5(1)$"2)$"6)"!6#$5(1)#$8(5)"$9(1)!$8(2)#"3)"$0(1)#!s"$1(2)',
+    '#"ff"$3(1)#$5508#$8(1)#$9(7)"$4(1)%"2)"!5"$6(1)"$7(1)$"4)!$9(2)#"4)#"6)"!0',
+    '"!1#$(11)%"4)$"2)$"3)$"4)#!2"!3##(3)"$4(4)$"9)"!5##(1)$"2)$"5)',
+    '"!6##(1)"!8##(1)$"2)"!a!"=e"\'service!)a&gt;3000#&iuml;d#)uacute;de"#\'ad%\'-ul-din%"am#"im',
+    '#$2000$#100#!5#\'derived#"fl##n-3$"ga#%owned"#/nv"!2#!0""32"%4/sd2#!2"!6',
+    '""99"$a\'da#./cua-compliant##ach#)b-trained$#/gm#%dabad%!h$#oum$"un#"fi#"in#!l$$feld$#ian',
+    '#"me$%muell#$nans$"en&!s$&ichton#/r&rehy;lorraine$)ah-mensah$,br&uuml;cken&+ucken-based\'$eken$+landstrasse%#und#"tb$)chi-owned',
+    '$$heta\'#tin%"ni$(nadzovic&!s%!g$&ruddin$$stio$%tiers&#nca\'!o$$udia$"ya$$zius#$bagh',
+    '%&ruddin%!t&"ai&\'h-dayes(\'evening(\'keeping(\'wracked&$icae\'"ni$!e%\'n-clare%$rton$"in&!g#"co',
+    '#!e$#ita$!j$)llastarte&#ian\'&ditids$#tha#,hasriscience#!i$"do$%n/son%"al&$nigo%"et%#ian',
+    '$"ro#"ji#$khas##lah$*e-coloured&%edged&%lined&&winged%&/nylon$#ich$/onni&egrave;res&!s#"ne#"ol$!n',
+    '%"ed&(urs.both%!s%#uer##ran%!s$\'e-slash%!d%&taches&$ooth$)i-tabrizi%#nas%"ta%"ya$#osa',
+    '#!u$&gueiro$$leti$!s#\'yasachi#"zi"\'c-ville#%.lac.#!a$!b$!u#!b#%caria\'$nous$\'haralis',
+    '(&florus("na)"es\'&ometer%$etti%#ini$.id&amacr;nanda$&omandi%#rum$$ular\'#ted(#ion#!e$!r%$dote',
+    '##fry#)halinense%!r&)ine-sweet$#dev$#een%&rtorte%&verall$%khere$\'lickeit$(s-davies%)en-anhalt(%gotha(\'teschen$%turia',
+    '$#lor#"k\'$\'-addict&%rtist+!s%%cloth%(handling%$load)!s%&making%(pictures%&shaped\'&rouded$$/bag$$buts',
+    ')"ed$%ed/in%"rs%"tt$\'holders$#ier%\'ng-like\'"en$$like$$mann$&nussen$$pack$"s.%%teder$&trucks',
+    '#$lant%!y$#eas%!r$!i#%onnex#$rale&#ize%%menta*%lised,"ty+(ly-based*$ries)%o-san),s/ceremonies',
+    '%$rium%\'tissimi$*ed-profane&"ly%!e%\'ligious%)mentality$&ifice.(#ium%\'ligeous%"ng%+st&aacute;n\'#ans\'#ies("ne',
+    '\'!s$!o%%bosco%&phagus%&sancta*#ity#!z"*d&rehy;way#%-core$&making$$sack&%d-sad%&miling%$weet$%woozy',
+    '#!a$$nori%%undio$!o$$quat$#rak$%toshi$!y#$berk#.dam-controlled\'&hitler&#ery&$iyat&%speak%"wi',
+    '$#ing\'#ton$\'le-back(#red)#own\'&girths\'&height\'\'leather(#ike\'$roof*!m\'&stitch-#ing\'$tank+!s',
+    '\'4up-and-ride-into-the&%backs&&cloths&$mews&)ry-makers&&soaped("re\'%tones$#ock#$eler$#msa#$hana##ie.$!g%!h',
+    '%!i$!r$#sta&!e\'!n&#ic.(*/anal/oral#"ko##lee%)r/shelter\'+whitminster%!s%%worth$#ier$)y-lacking',
+    '\'\'oribund#(o-escape&&xperts%\'manager%&sexual&-ophistication$*/masochism$"ko$$leto$!o%!n$"ul$$vaya$"wa%"iz',
+    '\'!y#-r&mdash;which$#ina#!s##uak$$cees%%ismus$&tismus#"ye$$khov"%e/irc#"by#$dler#(edhealth%!i',
+    '#!n$!a%"ua$#ger##tas$"ti#"va"$faev$"ir$%niyah$$rali%#ian%"ov$"ya#1e&mdash;defeating',
+    '*\'guarded/#ing*\'keeping$*-as-houses%&blower&$reak*"er,!s%\'cracker*#ing%(deposits%\'feeling%\'guarded%(handover\'#ven',
+    '%.operating-area%$seal%&t-cube%)wrenching$!.%#and$%/hold$!d%&eposit$\'garding&$urds%!e$"it$$land%$ight',
+    '&!.$)r-feeling$*st-looking\'\'seeming&"op&"ud$#tey%#ies%"ly%\'y&ndash,);critical-\'related&\'-advice()ssessment1!s',
+    '($oots\'$cord\'&design)%vices\'\'glasses*#zed\')labelling(%ights\'\'netless*!s*#ted\'(oriented\'$rail(\'elevant\'%sheet',
+    '\'%value*#ves&$.and&%/cost\'+environment2\'/access\'.rescue/special$-way-sponsored#%farac("us$"er&"ys$$ioti\'"ti$#ord',
+    '%"ey%!o&\'n-azure($clad($dyed($like(&tinted$%uriya#%guard#"i/$/lios-rothschild#"ro##ter$%leven#"yn',
+    '#"a.$!i$&martha$"n.%%esque%#iuk%#sky%#uma$&ramoso%"in%#tia(!n)!s$#tal%$hies',
+    '#"e-%\'covered%%ghost%$like$&brecht&#ush$%cover$!l$!p$$soft%"se%!t$#tte##gar&!s',
+    '$$ital#%i-ash%\'ta-riya&,i-foe-li-oom$"na&"ta$(ttarius-&\'ifolium#%nella#(o-thatch$!r#"ra$"ee%"ra$$inae',
+    '#!u$$aros$"et$"ia$!y"%habat%$zadi$"fa%#een$!i$!l$\'ra-like#$eena$%lians$!r',
+    '##gal#"ha#!i$%b(-i)$!d$\'llioglu$!n%$guvu))secretary%$kaya#!l$"an$!e$"ul#"ng',
+    '#!o$"ur#!r$!a%"wi\'!s#!u$!t""ib#"ce#*d&mdash;he+$with$!\'$$-\'so%+regretfully',
+    '$".a%$bank%!d%%julie%)observers%#the$!/%#thy$\':graham$#_as&!t%$even$$amin%"ni$!e',
+    '#&fuddin#%ghead$(nakong**#"id#$kama$.en-yachongtuoa%$wicz#"l-%(carrying&$lips%Mit-on-its-ear-and-hard-luck-if-you\'re-seasick%&makin\'\'$ster%(wardrobe&%inged',
+    '%"na%$thon%#way$$bags%\'oarders)#ing$#cat$"en%!s$$fins%#orm$*ing-master($ship(%yacht\'!.',
+    ')%owing%"sh$"le$&or-boy\'(collared\'$hero\'$like\'#man\'$suit&!.&#men&$town%"si$$room$"s.',
+    '%$pars&#eak#-n&rehy;tongue$"es$!g$)s-berries%&bury\'s+*-sponsored+$/bbc-&ritish,$good)#-ad)*.political&!y$"t\'',
+    '&.&eacute;tienne&%alban\'$mour\'*ndr&egrave*!e("ge("ne(%tione\'$ubin(\'gustine&\'bernard)2trand-de-comminges\'%rieuc&%clair\'$ricq',
+    '&$fond&7germain-des-pr&eacute;s\'%obain&%james\'$oire($seph(#urs\'#ust&0lambert-des-bois\'#eon\'$ouis\'#uce&5martin-d\'h&eacute;res(%urice($xime',
+    '&\'nicolas&$omer\'-uen-les-docks&(p&eacute..;e-sur-nivelle\'%halle\'$reux($iest&\'rambert\'/emy-en-provence&&sardos($vin\'\'.ever-de-rustan&.vaast-la-hogue\'%ictor',
+    '(%ncent%)e-adresse\'-croix-du-mont\'.euge&nacute;ie\'0m&eacute;nehould(%axime%)hamarathu&$omme%%liest%\'s-peres%!z#"od#&r-mair$"ey$!r',
+    '$\'ompheng$$uree#"ta$!e$\'haelwyd#%voure""ja$$mbre#"it#*u&iacute;n$.dis-affiliated$"in##waj""ka$!b',
+    '&%uskas$#rov%%tvelo*!s$!u%!e#"e\'$#-no$(llaridis$"rs##hat##ins$%shima##kie$\'ratians',
+    '#!o$"ng#)r-el-bahr#$sena$(unarvatn#%urada&&i-hung&$uchi#%vador#"wa"*l&atilde;o$*ndash;anna$(oacute;n%%grave#%\'khoz',
+    '\'*orientated&"at&!s$#bat%%ility%#uss$\'ciously&$ties$"d-&(dressing&&making&\'stuffed%!.%#din%#ene',
+    '%#ins$"hs$!i%!s$%jekna$"la%!e$#mah&$nca.\'*der-prince("ra\'!o\'$tine%$bere%&i-free',
+    '&!n&*s-marathon(#sgb%!y$!r%!i&)&eacute;e&#at\'&#es.&!o&"um%\'y&mdash&"\'/&(-earners\'"in',
+    '\'&ranges(&elated&%/high(2olidays/conditions\'%wages&#men$#sas$!t%(h&eacute%!i&!n$#uds%!t$#vat\'#ion',
+    '$%witch$(zar-type#%bakos$"in$!o#$come#+da&ntilde;a%"an%&rriaga$!e$*ini-noonan#+e&mdash;see$!\'$!-%#day',
+    '%\'voucher%$work$,/acquisition%)kiddiswap%%royal%&wanted$"15$#and$"ck$$gast$"ha%"em%%trade$"ma&!n',
+    '%!s$$ntin$$ries$"s-&%admin\'"nd&&driven&&hungry&&ladies&&order\'()ientation,"ed&%packs\'$rice(\'omotion',
+    '&$task(!x\'\'urnover\'#ype%(.richard%)/channels\'*onsumption&$hype&#new&\'service\'(trategic%$14**%$iane&!o%$man\'',
+    ')$like(%/girl&#en.%$trak%$work$&tiendi&"me%"te$%uddin$$yard#$gari$!o%#vic$$redo$&ueiros',
+    '#&i-rsai$"ba$#cam%"in$!e%"ns&#tly\'!s$"fe%"it$#gna%"os$"ha%#een$!i',
+    '$%mberi%"ov$+n-de-giraud%$ated(!s%+e-intrusion&%/edta%!g&%erism%)ification&\'ty-such%\'ometers$+sbury-jones*%style)$.the',
+    ')!e$*va-steeped&!.&$rium&#tes#"ka$!o#(l&eacute$"ah%"ry%#tes$"ee%"ry%!s%"ts',
+    '&,gboe/airshow$$ochy%"is%)w-looking$%right$&ustian$#y-b#&m-salm$!a%%nazar&"ov%"so$#ina$&o\'kkan%"n-',
+    '\'%flies\'$like\'%paste\'#red\'(spawning)$lash&(/harwell&"by&!e\'*lla-ridden)$oses&#ier&#oid)!s&%sbury',
+    '#&namesi#%oduro\'"us$$falk$#jee$)m&acirc;o&&eacute%"ao%!o&!m$)n-formula&#ish&\'la-tour\'#ike\'#ook',
+    '&%style%!e&(/swindon%!g%+iaeducation&"us$"om%&n-bars\'(in-space\'&singer\'$wise&$atic$"pe&#ans&!s',
+    '%"io$"sa$#umi$!v#5p&ecirc;tri&egrave;re$\'etriere$(iglossis%*ngectomies%"ti#$ries#&sabeel$!e%%vills$%iccia$!o',
+    '\'%/west$"us#.t&rehy;burning$\'-bathed&&earing&%ridge&#urn\'$shes%%caked&%ellar+!s&&harged&%offer\'%vered&&racked',
+    '%*dependence&$omes&$ried(#ven%)encrusted&)xtraction%$fish&#ree%)gathering&%lazed%\'herring%&kissed%%lakes&$ight%&making',
+    '%,of-the-earth%%petre&&ickled&$ools&(reserved)#sed\'&oduced%\'scarred\'#rew&\'easoned\'%eking\'!t&&haking&\'melling&$nail',
+    '\'&oonful&%ticks\'(ratified(%eaked+!s&$ugar%&tanned&\'olerant&&raders%&washed\'$ters&$hite&&orking,!s$+/postmaster',
+    '$&arello%\'tionism\'"ve$$bath%(urn-born*%y-sea&"sh$&cellar%*oats-based$%eados%"es%*r/anti-war&$ello&&hebble&%sgate',
+    '$$hair%!e%%ouses$)imbanques%#nes("s.&!i%-re/interlaced%"sh$&marshe%"er$$ness$#oro%&suchus$&packer',
+    '\'!s$"ry$&shaker%&joborg$$wort$(y/grassy%-kov-shchedrin$%zburg)$ring%%gaber#!u$!e$$ggia$"ja$!m',
+    '%#tro$(tariness(!s&+tion-prayer\'#ory%"e.\'$then&!m\'!.%%ifera&"n\'%#ory%!s$#zzo#&vabile',
+    '\'"on%&dorans(*e&ntilde;o)"na*"os%$ment)!a%&tierra\'!o(#nis&%orian)!s%"vi\'!t$%emitu',
+    '&!e%#san&#ons$%ifici%"ni\'%aceae%!s%"us$#ona#%warpe&!s$#een%!y$#ick#"ya',
+    '($ring$\'craggie$&enmund%!r"(m\'n\'eric##-11%!3%!4&!s$!3$"ay$*dependence,!t#%/aged$\'brother',
+    '$#dov$!h%%daneh$#ira$(jtantrik$"me%%igram$%ndari%#gan&!e%#iya$%ratin%"es%%itan.&&um-147',
+    '%"oo%#pan$%vians$#wah%"na#*ba-dancing%!l%"rs$#eth&!n$#hur$$oras%!u&#rne$%rizzi',
+    '%"ca\'!s%-ru&ndash;lake#$dech$%poria#\'e&mdash*$;for+#its$!-%#age%&domain%!i&"sh%$name%%place',
+    '&&outine%+sex-sharing%$time)+-same-place%%venue$*.different$!/%%other$$lson%!y$!r$&tadine%$hing$%yness#!f',
+    '#!h$0&auml;llspartiet$#ita#(i-ul-haq$!n',
 )
@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_59 = (
+count_59 = 6694
+
+heads_59 = (
     'randall-davies',
-    'randall-page',
-    'randall/tewkesbury',
-    'randburg',
-    'rande',
-    'randell(1975)',
-    'randell-sly/first-time',
-    'randells',
-    'randi-line',
-    'randier',
-    'randmly',
-    'rando',
-    'randolphs',
-    'randoly',
-    'random-donor',
-    'random-dot',
     'random-or',
-    'random-sample',
-    'random-stitch',
-    'randomisation/stratification',
-    'randomizes',
-    'randomly-chosen',
-    'randomly-differing',
-    'randomly-scattered',
-    'randomly-selected',
-    'randori',
-    'randsworth',
-    'randy\'',
-    'raneen',
-    'ranfon',
-    'ranga',
-    'rangamati',
     'rangaya',
-    'range(s)',
-    'range-extension',
-    'range-land',
-    'range/fiat',
-    'range/new',
-    'range=10&ndash;47',
-    'rangeel',
-    'rangefinder',
-    'rangefinding',
-    'rangemaster',
-    'rangemore',
-    'ranger-guided',
-    'ranger-led',
-    'rangering',
-    'rangers.',
     'rangers/leeds',
-    'rangers1',
-    'rangership',
-    'ranges.',
-    'ranggas',
-    'rangi',
-    'rangier',
-    'rangila',
-    'ranginess',
-    'rangley',
-    'rangoli',
-    'rangoni',
-    'rangoon&ndash;bangkok',
-    'rangoon&ndash;pagan',
-    'rangoon&rehy;singapore',
-    'rangoon-based',
     'rangstrom',
-    'rangzen',
-    'raniditine',
-    'raniero',
-    'raniya',
-    'ranj',
-    'ranjana',
-    'ranjeet',
-    'ranjeeva',
-    'ranjen',
-    'ranjit',
-    'ranjith',
-    'ranjitsinhji',
-    'rank-and-filers',
-    'rank-defining',
-    'rank-financed',
     'rank-hovis-mcdougall',
-    'rank-ordered',
-    'rank-smelling',
-    'rank-specified',
-    'rank-test',
-    'rank-this',
-    'rank-xerox',
-    'rank/associated',
-    'rankest',
-    'rankin-hurst',
-    'rankl',
-    'rankled.',
-    'ranks-but',
-    'ranku',
-    'ranmoor',
-    'rannulph',
     'rannyglass',
-    'ransackers',
-    'ransackin\'',
-    'ransackly',
-    'ranscombe',
-    'ranskar',
-    'ransohoff',
-    'ransom/english',
-    'ransomable',
-    'ransome\'',
-    'ransome-kuti',
-    'rantanen',
-    'rantanen(ssdp)',
-    'ranterish',
-    'ranthambhor',
-    'rantidine',
     'rantin',
-    'rantipole',
-    'rantisi',
-    'rantzen/somerville',
-    'rantzer',
-    'ranu',
-    'ranulf&ndash',
-    'ranwick',
-    'rao&uacute;l',
-    'rao-wickremasingh',
-    'raods',
-    'raogo',
-    'raolecular',
-    'raotma',
-    'rap\'n\'roll',
-    'rap\'n\'rollers',
     'rap-fusion',
-    'rap-like',
-    'rap-stations',
-    'rap-styled',
-    'rap-tap',
-    'rap-tastic',
-    'rap-type',
-    'rap-vocalist',
-    'rap-weary',
-    'rap/slow',
-    'rapa',
-    'rapacki',
-    'rapana',
-    'rapanea',
-    'rapax',
-    'rape-alarm',
     'rape-like',
-    'rape.allegations',
-    'rape/their',
-    'rape:a',
-    'rapeable',
-    'raper/part-time',
-    'rapg',
-    'rapha&eacute;l-leygues',
-    'raphael/balzac',
-    'raphall',
-    'raphanel',
-    'raphel',
-    'raphes',
-    'raphia',
-    'raphides',
-    'raphoff',
     'raphus',
-    'rapid-access',
-    'rapid-action',
-    'rapid-breeding',
-    'rapid-eye',
-    'rapid-fit',
-    'rapid-flowing',
-    'rapid-growth',
-    'rapid-migration',
-    'rapid-response',
-    'rapid-scoring',
-    'rapid-turnover',
-    'rapidas',
-    'rapidly-conducted',
-    'rapidly-declining',
-    'rapidly-depleting',
     'rapidly-disintegrating',
-    'rapidly-escalating',
-    'rapidly-grow&rehy;ing',
-    'rapidly-varying',
-    'rapidresponse',
-    'rapidstrike',
-    'rapier-slim',
-    'rapiered',
-    'rapiet',
-    'rapinam',
-    'rapino',
-    'rapist-gaybashing-scum',
-    'rapist-lenient',
-    'raplin',
-    'rapnouil',
-    'rapoport_et',
     'rappe',
-    'rappee',
-    'rappellers',
-    'rappelling',
-    'rapper/dj',
-    'rapphorst',
-    'rappisms',
-    'rappoport',
-    'rapportage',
-    'rapports',
-    'rapprochment',
-    'rappy',
-    'rapstone',
-    'raptore',
-    'raptou',
-    'raptured',
     'rapuntium',
-    'raquets',
-    'raquin',
-    'raratonga',
-    'rare-breed',
-    'rare-earth-element',
-    'rare-groove',
-    'rare-in-eire',
-    'rare-rage',
-    'rare-vintage',
-    'rareapple',
-    'rarebits',
-    'raree',
-    'rarefactions',
-    'rarefy',
-    'rarefying',
     'rarely-challenged',
-    'rarely-heard',
-    'rarely-performed',
-    'rarely-practised',
-    'rarely-run',
-    'rarely-seen-before',
-    'rarely-used',
-    'rarely/',
-    'rarer-nesting',
-    'rarfer',
-    'rargh',
-    'rarifying',
-    'rarin',
-    'rariores',
-    'rarissima',
-    'raroia',
     'rarongo',
-    'raruaruaha',
-    'rarx',
-    'ras-',
-    'ras-1',
-    'ras-boring',
-    'ras-dependent',
-    'rasalgethi',
-    'rasamanjari',
-    'rasante',
-    'rasayana',
-    'rascahan',
-    'rascalitie',
-    'rascality',
-    'rascalls',
-    'rascarell',
     'raschetny',
-    'rascism',
-    'rased',
-    'raseing',
-    'rasemble',
-    'rasenna',
-    'rasgdp',
-    'rasgtp',
-    'rashbass',
-    'rashdall',
-    'rashed',
-    'rashi',
-    'rashideiyeh',
-    'rashidiya',
-    'rashionability',
-    'rashira',
     'rashit',
-    'rashpal',
-    'rasim',
-    'rasimi',
-    'rasjid',
-    'raska',
-    'raskolnikov-type',
-    'raskolnikov/',
-    'rasman',
-    'rasmanjari',
-    'rasmusson',
-    'rasor',
-    'rasp&rehy;berry',
-    'raspas',
-    'raspberries&mdash;i',
-    'raspberry-fool',
     'raspberry-leaf',
-    'raspberry-shaped',
-    'raspberry-to-beetroot',
-    'raspily',
-    'raspin',
-    'raspison',
-    'rasputins',
-    'rasquin',
-    'rassass',
-    'rassella',
-    'rassembleur',
-    'rassi',
-    'rasstanovka',
-    'rastall',
-    'rasteau',
-    'rastelli',
     'raster-coded',
-    'raster-mask',
-    'raster-scanned',
-    'raster/ascii/vector',
-    'rastered',
-    'rasterise',
-    'rasterising',
-    'rasterize',
-    'rasterizing',
-    'rasthriya',
-    'rastko',
-    'rastricke',
-    'rastron',
-    'rat\'s',
-    'rat\'s-nested',
-    'rat\'s-tail',
     'rat\'s-tails',
-    'rat(s)',
-    'rat-',
-    'rat-1-derived',
-    'rat-1/c-myc',
-    'rat-1j',
-    'rat-arsed.',
-    'rat-bite',
-    'rat-boars',
-    'rat-body',
-    'rat-both',
-    'rat-chewed',
-    'rat-droppings',
-    'rat-filled',
-    'rat-fink',
-    'rat-form',
     'rat-girl',
-    'rat-haunted',
-    'rat-level',
-    'rat-like',
-    'rat-maze',
-    'rat-men',
-    'rat-packs',
-    'rat-pits',
-    'rat-poison',
-    'rat-racing',
-    'rat-ridden',
-    'rat-runs',
-    'rat-tails',
-    'rat-tat-tat-ta',
-    'rat-tat-tats',
-    'rat-tat-tatted',
     'rat-teeth',
-    'rat-thrower',
-    'rat-traps',
-    'rat-type',
-    'ratagain',
-    'ratak',
-    'ratakin\'',
-    'ratam',
-    'ratan',
-    'ratana',
-    'ratanarak',
-    'ratany',
-    'ratarsed',
-    'rataseed',
-    'ratavennie',
-    'ratbelly',
     'ratchaniya',
-    'ratchet&mdash;the',
-    'ratchet/percussion',
-    'ratchett',
-    'ratchety',
-    'ratchis',
-    'ratcliffe-on-soar',
-    'ratcliffe/manufacturer',
-    'rate-56%',
-    'rate-aided',
-    'rate-cappers',
-    'rate-card',
-    'rate-collection',
-    'rate-cutting',
-    'rate-determining',
-    'rate-equation',
     'rate-fixing',
-    'rate-in-the-pound',
-    'rate-inclusive',
-    'rate-investment',
-    'rate-nairu',
-    'rate-of-climb.',
-    'rate-of-descent',
-    'rate-or-tax-payers',
-    'rate-paid',
-    'rate-payer',
-    'rate-receiving',
-    'rate-setting',
-    'rate-so',
-    'rate-subsequently',
-    'rate-supported',
-    'rate/1000',
     'rate/from',
-    'rate/poll',
-    'rate0%',
-    'rate:room',
-    'rateflow',
-    'ratepayer-based',
-    'rates-having',
-    'rates-of-change',
-    'rates/poll',
-    'rates/rent',
-    'rates/service',
-    'ratface',
-    'ratfish',
-    'ratgut',
-    'rathad',
-    'rathar',
     'rathbeg',
-    'rathbun',
-    'rathdrum',
-    'rathen',
-    'rathenraw',
-    'rather-than',
-    'ratherstrasse',
-    'rathgar',
-    'rathgeb',
-    'rathier',
-    'rathindranath',
-    'rathkeele',
-    'rathkirani',
-    'rathliners',
-    'rathman',
-    'rathmann',
     'rathmayr',
-    'rathmell',
-    'rathor',
-    'rathour',
-    'rathus',
-    'ratifie&lsqb;d&rsqb',
-    'ratiken',
-    'ratikon',
-    'ratiner',
-    'ratingen',
-    'ratings.',
-    'ratinoff',
-    'ratio-recording',
-    'ratio=1.6:1.0',
-    'ratio=1015',
-    'ratio=1620',
     'ratio=275',
-    'ratio=667',
-    'ratio=7.0',
-    'ratio_so',
-    'ratioing',
-    'ration-cards',
-    'ration-ridden',
-    'ration-strengths',
-    'rationable',
-    'rational&ndash;emotive',
-    'rational-deductive',
-    'rational-economic',
-    'rational-planning',
-    'rational-semiotic-orderly',
-    'rational-utilitarian',
-    'rational/analytical/',
     'rational/political',
-    'rationalisations.',
-    'rationalisers',
-    'rationalisme',
-    'rationalistically',
-    'rationality/irrationality',
-    'rationaliza&rehy;tions',
-    'rationally-ordered',
-    'rationers',
-    'rationes',
-    'rationin\'',
-    'rations/chemical',
-    'ratiotherapy',
-    'ratites',
-    'ratjen',
-    'ratless',
     'ratley',
-    'ratling',
-    'ratman',
-    'ratmeat',
-    'ratna',
-    'ratnam',
-    'ratnasambhara',
-    'ratnayake',
-    'ratner/businessman',
-    'ratnering',
-    'ratoath',
-    'ratpack',
-    'rats\'-tails',
-    'rats-in-mazes',
-    'rats-tails',
-    'ratsey',
     'ratshit',
-    'ratsiraka.',
-    'ratson',
-    'ratstomach',
-    'ratt-rokk',
-    'ratt/walk',
-    'rattanakoset',
-    'rattee',
-    'ratteen',
-    'ratteens',
-    'rattenburg',
-    'rattenbury',
-    'rattenbury/vehicle',
-    'ratters',
-    'rattiken',
-    'rattl&rehy;ing',
     'rattle-brained',
-    'rattle-snake',
-    'rattle-trap',
-    'rattle/emi',
-    'rattlebones',
-    'rattled-off',
-    'rattlesnake\'',
-    'ratton',
-    'rattrapped',
-    'rattray-taylor',
-    'rattue',
-    'rattues',
-    'ratty/organiser',
-    'rature',
-    'ratushinskaya',
-    'ratvick.',
     'ratzburg',
-    'ratzeburg',
-    'ratzel',
-    'ratzer',
-    'rauball',
-    'raubitschek',
-    'rauch',
-    'rauch-kallat',
-    'raucher',
-    'raucon',
-    'raucous/embarrassed',
-    'raucoux',
-    'raucs',
-    'raudonikis',
-    'raudsepp',
-    'raue',
     'rauferei',
-    'rauhen',
-    'rauher',
-    'rauland',
-    'raulinus',
-    'rauma-repola',
-    'raunchily',
-    'raunching',
-    'rauno',
-    'rauraje',
-    'rauris',
-    'raushan',
-    'rauta',
-    'rautenstrauch-joest-museum',
-    'rauthfeldarson',
-    'rauville&rehy;la-place',
     'rauzzini',
-    'rav-ner',
-    'ravalli',
-    'ravanels',
-    'ravco',
-    'ravden',
-    'rave-dance',
-    'rave-friendly',
-    'rave-goer',
-    'rave-oriented',
-    'rave-pop',
-    'rave-speak',
-    'ravealonga',
-    'ravebeek',
-    'raveish',
-    'ravel/debussy',
     'ravelian',
-    'ravelling',
-    'ravelrig',
-    'ravels',
-    'ravem',
-    'raven-dark',
-    'raven-drawn',
-    'ravendale',
-    'ravenel',
-    'ravenhurst',
-    'ravenous.',
-    'ravens.',
-    'ravensberg',
-    'ravensbourne',
-    'ravensbury',
-    'ravenscliffe',
     'ravenscraft',
-    'ravenscraig.',
-    'ravensknowle',
-    'ravenspur',
-    'ravenstor',
-    'ravera',
-    'raverat',
-    'raverii',
-    'ravesby',
-    'ravetch',
-    'ravette',
-    'ravier',
-    'ravigote',
-    'ravik',
-    'ravil',
-    'ravine-wire',
     'ravinella',
-    'ravingly',
-    'ravioli-like',
-    'raviraj',
-    'ravishable',
-    'ravishers',
-    'ravishes',
-    'ravissent',
-    'ravissime',
-    'ravitaillement',
-    'ravitailleur',
-    'ravlunda',
-    'ravn',
-    'ravni',
-    'ravno',
-    'ravnopraviye',
     'ravnovesie',
-    'ravnskov',
-    'ravony',
-    'ravvolse',
-    'raw&rehy;boned',
-    'raw\'',
-    'raw-arsed',
-    'raw-edged',
-    'raw-flesh-eating',
-    'raw-handedly',
-    'raw-knuckled',
-    'raw-limbed',
-    'raw-looking',
-    'raw-nerved',
-    'raw-onion',
-    'raw/crime',
     'rawa',
-    'rawal',
-    'rawalindi',
-    'rawand',
-    'rawas',
-    'rawden',
-    'rawe',
-    'rawer',
-    'rawes',
-    'rawified',
-    'rawish',
-    'rawk\'n\'rawl',
-    'rawk\'n\'roll',
-    'rawl.',
-    'rawle/fayre',
-    'rawle/festival',
     'rawle/travellers',
-    'rawlingson/collector',
-    'rawlinna',
-    'rawlinson/headmaster',
-    'rawlinson/parcel',
-    'rawlinson/slad',
-    'rawlston',
-    'rawmarsh',
-    'rawni',
-    'rawp-based',
-    'rawp-like',
-    'raws',
-    'rawsen',
-    'rawson/pilot',
-    'rawsthorn',
-    'rawstorne',
     'rawthenstall',
-    'raxco/uis',
-    'ray-fin',
-    'ray-finned',
-    'ray-see',
-    'ray/debating',
-    'ray/former',
-    'rayak',
-    'raybanned',
-    'raybee',
-    'rayboulds',
-    'raybrick',
-    'raybrock',
-    'rayca',
-    'rayford',
-    'raygun',
     'rayhead',
-    'rayleigh-b&eacute;nard',
-    'rayliegh',
-    'raymond/hot',
-    'raymond/rain',
-    'raymondin',
-    'raymondo',
-    'rayna',
-    'raynes/solicitor',
-    'raynwell',
-    'rayon/cotton',
-    'rayonism',
-    'rayonnent',
-    'rayons',
-    'rays.',
-    'raysen',
     'raysun',
-    'raytheon-cossor',
-    'rayure',
-    'rayvern',
-    'razack',
-    'razafimahatratra',
-    'razafitumb',
-    'razamasy',
-    'razamatazz',
-    'razanabahiny',
-    'razavi',
-    'razaz',
-    'razborov',
-    'razdow',
-    'razek',
-    'razmara',
     'razn',
-    'razor-backed',
-    'razor-bladed',
-    'razor-creased',
-    'razor-fish',
-    'razor-keen',
-    'razor-sharp-teeth',
-    'razor-shrapnel',
-    'razor-strop',
-    'razor-styled',
-    'razor-threatening',
-    'razor-wielding',
-    'razorback',
-    'razorblades',
-    'razorfingered',
-    'razorhead',
     'razoring',
-    'razorish',
-    'razorready',
-    'razorscar',
-    'razorsharp',
-    'razorwing',
-    'razuki',
-    'razumikhm',
-    'razumovsky',
-    'razuvaev',
-    'razvedyvatelnoye',
-    'razvivayushchiisya',
-    'razza',
-    'razzamattazz',
-    'razzberry',
-    'razzed',
     'razzeli',
-    'razzle-dazzle',
-    'razzledazzle',
-    'razzy',
-    'rb-',
-    'rb-associated',
-    'rb-doped',
-    'rb-radiant',
-    'rb-related',
-    'rb.1',
-    'rb.108',
-    'rb.1a',
-    'rb/',
-    'rb/00/22/0012',
-    'rb/00/22/2003',
-    'rb/00/22/2005',
     'rb/00/22/2006',
-    'rb/00/22/2008',
-    'rb/00/23/0061',
-    'rb/00/23/0067',
-    'rb/00/23/2013',
-    'rb/00/23/2068',
-    'rb/00/23/2069',
-    'rb/00/23/2081',
-    'rb/00/23/2107',
-    'rb/00/23/2108',
-    'rb/00/23/2124',
-    'rb/00/23/2131',
-    'rb/00/23/2132',
-    'rb/00/23/2137',
-    'rb/00/23/2148',
-    'rb/00/23/2149',
     'rb/00/23/2150',
-    'rb/00/23/2151',
-    'rb/00/23/2152',
-    'rb/00/23/2155',
-    'rb/00/23/2156',
-    'rb/00/23/2157',
-    'rb/00/23/2159',
-    'rb/00/23/2163',
-    'rb/00/23/2164',
-    'rb/00/23/2166',
-    'rb/00/23/2168',
-    'rb/00/23/2171',
-    'rb/00/23/2174',
-    'rb/00/23/2178',
-    'rb/00/23/2179',
-    'rb/00/23/2181',
     'rb/00/23/2184',
-    'rb/00/23/2185',
-    'rb/00/23/2189',
-    'rb/00/23/2194',
-    'rb/00/23/2197',
-    'rb/00/23/2200',
-    'rb/00/23/2202',
-    'rb/00/23/2211',
-    'rb/00/23/2218',
-    'rb/00/23/2221',
-    'rb/00/23/2227',
-    'rb/00/23/2231',
-    'rb/00/23/2234',
-    'rb/00/23/2236',
-    'rb/00/24/2015',
-    'rb/00/24/2020',
     'rb/00/24/2022',
-    'rb/00/24/2023',
-    'rb/sr',
-    'rb00232234',
-    'rb1',
-    'rb211-524',
-    'rb67',
-    'rb7',
-    'rb8',
-    'rbg&mdash;1/supervisor',
-    'rbg&mdash;2/supervisor',
-    'rbg/supervisor',
-    'rbge-owned',
-    'rbge-specific',
-    'rbl2',
-    'rblws',
     'rbmks',
-    'rbocs',
-    'rbs.',
-    'rbs1,000',
-    'rbs1,900',
-    'rbs10,000',
-    'rbs110',
-    'rbs131,000',
-    'rbs18,500',
-    'rbs2,000',
-    'rbs200',
-    'rbs200,000',
-    'rbs25,000',
-    'rbs250,157',
-    'rbs26,663',
-    'rbs27,000',
     'rbs270',
-    'rbs276,820',
-    'rbs3,000',
-    'rbs3,400',
-    'rbs31,000',
-    'rbs35,000',
-    'rbs40',
-    'rbs40,300',
-    'rbs48,200',
-    'rbs480',
-    'rbs500-a-month',
-    'rbs54,000',
-    'rbs58,100',
-    'rbs60',
-    'rbs61,000',
-    'rbs65',
     'rbs69,000',
-    'rbs71,000',
-    'rbs72,000',
-    'rbs78,000',
-    'rbs8,200',
-    'rbs80',
-    'rbs96,563',
-    'rbupc',
-    'rbx',
-    'rbx-550',
-    'rbxes',
-    'rc&amp;w',
-    'rc&amp;w-built',
-    'rc-5',
-    'rc.',
-    'rc/00/22/2005',
     'rc/00/23/0075',
-    'rc/00/23/2053',
-    'rc/00/23/2136',
-    'rc/00/23/2174',
-    'rc/00/23/2177',
-    'rc/00/23/2178',
-    'rc/00/23/2179',
-    'rc/00/23/2181',
-    'rc/00/23/2200',
-    'rc/00/23/2201',
-    'rc/00/23/2213',
-    'rc/00/23/2217',
-    'rc/00/23/2227',
-    'rc/00/23/2229',
-    'rc/00/23/2235',
-    'rc/00/23/2243',
     'rc/00/23/2260',
-    'rc/00/23/2264',
-    'rc/00/23/2275',
-    'rc/00/23/2284',
-    'rc/00/23/2289',
-    'rc/00/23/2296',
-    'rc/00/23/2311',
-    'rc/00/23/2321',
-    'rc/00/23/2323',
-    'rc/00/23/2324',
-    'rc/00/23/2325',
-    'rc/00/23/2326',
-    'rc/00/23/2327',
-    'rc/00/23/2328',
-    'rc/00/23/2331',
-    'rc/00/23/2339',
     'rc/00/23/2340',
-    'rc/00/23/2341',
-    'rc/00/23/2342',
-    'rc/00/23/2359',
-    'rc/00/23/2364',
-    'rc/00/23/2367',
-    'rc/00/23/2368',
-    'rc/00/23/2389',
-    'rc/00/23/2392',
-    'rc/00/23/2393',
-    'rc/00/23/2398',
-    'rc/00/23/2399',
-    'rc/00/23/2400',
-    'rc/00/23/2403',
-    'rc/00/23/2426',
-    'rc/00/23/2432',
     'rc/00/23/2439',
-    'rc/00/23/2441',
-    'rc/00/23/2452',
-    'rc/00/23/2458',
-    'rc/00/23/2470',
-    'rc/00/23/2476',
-    'rc/00/24/2003',
-    'rc/00/24/2016',
-    'rc/ns',
-    'rc1+',
-    'rc210s',
-    'rc27',
-    'rc55',
-    'rc6280',
-    'rc78',
-    'rc79',
     'rc84',
-    'rca/novus',
-    'rcam',
-    'rcb-government',
-    'rccc',
-    'rccs',
-    'rcd-',
-    'rcd-965bx',
-    'rcdfyyyrm',
-    'rcfp',
-    'rchd',
-    'rchm',
-    'rchs',
-    'rcm.',
-    'rcnf',
-    'rcording',
     'rcts',
-    'rctv',
-    'rcvma',
-    'rcxd5',
-    'rcyc',
-    'rd&ndash;10',
-    'rd/00/22/0003',
-    'rd/00/23/2053',
-    'rd/00/23/2152',
-    'rd/00/23/2170',
-    'rd/00/23/2171',
-    'rd/00/23/2178',
-    'rd/00/23/2180',
-    'rd/00/23/2181',
-    'rd/00/23/2189',
-    'rd/00/23/2194',
     'rd/00/23/2198',
-    'rd/00/23/2211',
-    'rd/00/23/2217',
-    'rd/00/23/2222',
-    'rd/00/23/2226',
-    'rd/00/23/2233',
-    'rd/00/23/2237',
-    'rd/00/23/2240',
-    'rd/00/23/2241',
-    'rd/00/23/2252',
-    'rd/00/23/2254',
-    'rd/00/23/2255',
-    'rd/00/23/2257',
-    'rd/00/23/2258',
-    'rd/00/23/2275',
-    'rd/00/23/2277',
     'rd/00/23/2279',
-    'rd/00/23/2282',
-    'rd/00/23/2289',
-    'rd/00/23/2292',
-    'rd/00/23/2301',
-    'rd/00/23/2307',
-    'rd/00/23/2312',
-    'rd/00/23/2335',
-    'rd/00/23/2338',
-    'rd/00/23/2339',
-    'rd/00/23/2346',
-    'rd/00/23/2348',
-    'rd/00/24/2008',
-    'rd/00/24/2009',
-    'rd/00/24/2012',
-    'rd/01/23/0039',
     'rd/td&plusmn',
-    'rd1&verbar&verbar;ke8&verbar&verbar;29',
-    'rd14/box',
-    'rd300s',
-    'rd427',
-    'rd6&verbar&verbar;c5&verbar&verbar;31',
-    'rd7',
-    'rd77',
-    'rd77162',
-    'rd8',
-    'rd87947',
-    'rd91',
-    'rd950',
-    'rdb&mdash;msg.doc',
-    'rdb/open',
-    'rdbi&dollar;inst&mdash;acc',
     'rdbi&dollar;proc&mdash;acc',
-    'rdbi.',
-    'rdbi.aa',
-    'rdbi.ab',
-    'rdbi.ac',
-    'rdbi.ad',
-    'rdbi.bat',
-    'rdbi.pre',
-    'rdbi.res',
-    'rdbi.s01',
-    'rdbi.s02',
-    'rdbi.s03',
-    'rdd',
-    'rdd/c/160',
-    'rdf-rtf',
-    'rdk',
     'rdmbs',
-    'rdme',
-    'rdms&mdash;msg.doc',
-    'rdn',
-    'rdna-based',
-    'rdo',
-    'rds-tmc',
-    'rds.',
-    'rdte',
-    'rdth',
-    'rduction',
-    're&iacute;n',
-    're&mdash;gauge',
-    're&mdash;organisation',
-    're&ndash',
-    're&ndash;evaluate',
     're&ndash;evaluation',
-    're&ndash;seeding',
-    're&ndash;son',
-    're&ndash;use',
-    're&rehy;acquainting',
-    're&rehy;allocation',
-    're&rehy;appear',
-    're&rehy;appeared',
-    're&rehy;applied',
-    're&rehy;appraise',
-    're&rehy;arranged',
-    're&rehy;assembled',
-    're&rehy;assembling',
-    're&rehy;bed',
-    're&rehy;boarding',
-    're&rehy;colonize',
     're&rehy;confirmed',
-    're&rehy;constructions',
-    're&rehy;cyclable',
-    're&rehy;defined',
-    're&rehy;designated',
-    're&rehy;directed',
-    're&rehy;discovered',
-    're&rehy;divorce',
-    're&rehy;drew',
-    're&rehy;erection',
-    're&rehy;exports',
-    're&rehy;expression',
-    're&rehy;formation',
-    're&rehy;fortification',
-    're&rehy;fuelling',
-    're&rehy;glazing',
     're&rehy;ignited',
-    're&rehy;imported',
-    're&rehy;install',
-    're&rehy;installing',
-    're&rehy;insurances',
-    're&rehy;introduced',
-    're&rehy;iterated',
-    're&rehy;mark',
-    're&rehy;negotiated',
-    're&rehy;occupied',
-    're&rehy;offend',
-    're&rehy;offending',
-    're&rehy;organisation',
-    're&rehy;orientate',
-    're&rehy;orientation',
-    're&rehy;partition',
     're&rehy;perm',
-    're&rehy;possess',
-    're&rehy;pub-licans',
-    're&rehy;purchasing',
-    're&rehy;register',
-    're&rehy;roofing',
-    're&rehy;scheduling',
-    're&rehy;scued',
-    're&rehy;sourcefulness',
-    're&rehy;stored',
-    're&rehy;surfaced',
-    're&rehy;tained',
-    're&rehy;tapped',
-    're&rehy;treat',
-    're&rehy;unification',
-    're&rehy;verberating',
     're&rehy;volved',
-    're&rehy;working',
-    're\'bel',
-    're\'durat',
-    're-201',
-    're-absorb',
-    're-absorbing',
-    're-absorbs',
-    're-absorption',
-    're-access',
-    're-accommodated',
-    're-accumulating',
-    're-accustom',
-    're-acetylation',
-    're-acknowledge',
-    're-acquaintance',
     're-acquainted',
-    're-acquire',
-    're-acquired',
-    're-act',
-    're-activating',
-    're-adaptation',
-    're-adaption',
-    're-adjusting',
-    're-adjusts',
-    're-admissions',
-    're-advance',
-    're-advances',
-    're-advertise',
-    're-advertisement',
-    're-advise',
-    're-affiliate',
     're-affirms',
-    're-aggregated',
-    're-aimed',
-    're-alighting',
-    're-alignments',
-    're-allocations',
-    're-allotment',
-    're-amend',
-    're-amending',
-    're-ammunitioning',
-    're-angled',
-    're-animating',
-    're-annexation',
-    're-annexing',
-    're-announcement',
-    're-answered',
     're-applications',
-    're-appoints',
-    're-appraisals',
-    're-appraise',
-    're-appraised',
-    're-apprentice',
-    're-arms',
-    're-arraignment',
-    're-arranges',
-    're-arrested.',
-    're-artexing',
-    're-ascent',
-    're-assemblage',
-    're-assertion',
-    're-assimilating',
-    're-assimilation',
     're-assist',
-    're-association',
-    're-assumes',
-    're-assuringly',
-    're-attach-see',
-    're-attaching',
-    're-attachment',
-    're-attacked',
-    're-attempt',
-    're-attendance',
-    're-attribution',
-    're-authorised',
-    're-availability',
-    're-available',
-    're-awarded',
-    're-awarding',
     're-badge',
-    're-bag',
-    're-balkanisation',
-    're-bandaged',
-    're-baptised',
-    're-bartlett',
-    're-based',
-    're-basing',
-    're-bedded.',
-    're-begun',
-    're-bend',
-    're-bids',
-    're-binding',
-    're-bindings',
-    're-bleed',
-    're-block',
     're-board',
-    're-boil',
-    're-booking',
-    're-bookings',
-    're-boots',
-    're-bore',
-    're-bored',
-    're-borrowed',
-    're-bound',
-    're-box',
-    're-brick',
-    're-bridled',
-    're-brief',
-    're-budget',
-    're-buffed',
-    're-bundling',
     're-burial',
-    're-bury',
-    're-buys',
-    're-cabling',
-    're-calculated',
-    're-calculates',
-    're-calculation',
-    're-calibrating',
-    're-calling',
-    're-capitalisation',
-    're-capitalisations',
-    're-capitalize',
-    're-capitalized',
-    're-capped',
-    're-capturing',
-    're-carpeted',
     're-case',
-    're-categorised',
-    're-cement',
-    're-centralised',
-    're-centralising',
-    're-centralized',
-    're-centring',
-    're-certification',
-    're-channelling',
-    're-channels',
-    're-chargeables',
-    're-charges',
-    're-circulates',
-    're-circulating',
-    're-circulation',
-    're-civilise',
     're-clad',
-    're-cladding',
-    're-clarification',
-    're-clean',
-    're-clicking',
-    're-clothe',
-    're-coat',
-    're-cocked',
-    're-code',
-    're-coding',
-    're-cognition',
-    're-coil',
-    're-coiled',
-    're-colonize',
-    're-colouring',
-    're-combining',
     're-commencement',
-    're-commences',
-    're-commissioned',
-    're-commissioning',
-    're-commit',
-    're-communicate',
-    're-compiling',
-    're-composed',
-    're-conceived',
-    're-concentration',
-    're-condition',
-    're-conditioners',
-    're-configuring',
-    're-confirm',
-    're-confirms',
-    're-connecting',
     're-cons',
-    're-consecrated',
-    're-considering',
-    're-constitute',
-    're-constructing',
-    're-consulted',
-    're-contact',
-    're-contacted',
-    're-contamination',
-    're-conversion',
-    're-converting',
-    're-convictions',
-    're-cool',
-    're-coopered',
-    're-coppiced',
-    're-copy',
     're-copying',
-    're-corking',
-    're-costing',
-    're-counting',
-    're-countings',
-    're-couperating',
-    're-coverall',
-    're-credited',
-    're-crossing',
-    're-crucified-again\'',
-    're-crystallise',
-    're-current',
-    're-cycleable',
-    're-date',
-    're-dated',
-    're-dealt',
     're-debating',
-    're-defect',
-    're-definitions',
-    're-delegated',
-    're-deliver',
-    're-delivered',
-    're-delivering',
-    're-democratization',
-    're-depleted',
-    're-deploy',
-    're-deployed',
-    're-deploying',
-    're-deposition',
-    're-deposits',
-    're-described',
-    're-describes',
     're-designs.',
-    're-determination',
-    're-determine',
-    're-digging',
-    're-dimensioned',
-    're-discountable',
-    're-discounting',
-    're-discover',
-    're-dissolution',
-    're-dissolve',
-    're-distribu&rehy;tive',
-    're-distributes',
-    're-distributing',
-    're-distributive',
-    're-divide',
-    're-donned',
     're-draining',
-    're-dreamed',
-    're-dress',
-    're-dressed',
-    're-dressing',
-    're-drill',
-    're-drilled',
-    're-dub',
-    're-dug',
-    're-eastablished',
-    're-echoes',
-    're-editions',
-    're-educative',
-    're-embodied',
-    're-embodiment',
-    're-embodiments',
     're-emergency',
-    're-emits',
-    're-emitting',
-    're-emphasizing',
-    're-empowerment',
-    're-enaction',
-    're-enactments.',
-    're-enamel',
-    're-enamelling',
-    're-encoded',
-    're-encountering',
-    're-encrypt',
-    're-endoscoped',
-    're-endowment',
-    're-endure',
-    're-energising',
     're-energized',
-    're-energizing',
-    're-enforcement',
-    're-enforcements',
-    're-enforces',
-    're-engagements',
-    're-engined',
-    're-engining',
-    're-engraved',
-    're-enhanced',
-    're-enlightened',
-    're-enlistment',
-    're-enriched',
-    're-enroled',
-    're-enrolment',
-    're-entrance',
     're-entrancy',
-    're-entrap',
-    're-epithelialised',
-    're-equips',
-    're-erect.',
-    're-erecting',
-    're-erupted',
-    're-estimate',
-    're-estimates',
-    're-etching',
-    're-evaluates',
-    're-evaporated',
-    're-evoke',
-    're-evolve',
-    're-examinations',
-    're-examnination',
     're-excavated',
-    're-excreted',
-    're-execute',
-    're-exhibit',
-    're-exhibited',
-    're-expand',
-    're-expanded',
-    're-expanding',
-    're-explained',
-    're-explode',
-    're-exploding',
-    're-explore',
-    're-exporters',
-    're-exposing',
-    're-extended',
-    're-exteriorizes',
     're-extraction',
-    're-fastened',
-    're-fed',
-    're-felt',
-    're-felting',
-    're-fight',
-    're-figures',
-    're-figuring',
-    're-file',
-    're-fire',
-    're-fired',
-    're-fixed',
-    're-flagged',
-    're-flagging',
-    're-fletching',
-    're-float',
     're-floored',
-    're-flotation',
-    're-flued',
-    're-flueing',
-    're-focussing',
-    're-folding',
-    're-forecasts',
-    're-forging',
-    're-formating',
-    're-formatted',
-    're-formulated',
-    're-formulations',
-    're-foundation',
-    're-founded',
-    're-framing',
-    're-franchising',
     're-fretted',
-    're-fried',
-    're-friendly',
-    're-frigerated',
-    're-furbishment',
-    're-gain',
-    're-gather',
-    're-gathered',
-    're-generated',
-    're-gens',
-    're-gilded',
-    're-glossed',
-    're-grade',
-    're-graded',
-    're-grading',
-    're-graduated',
     're-grant',
-    're-graphing',
-    're-greeting',
-    're-grew',
-    're-grinding',
-    're-grinds',
-    're-grip',
-    're-gripping',
-    're-groupings',
-    're-grouted',
-    're-growing',
-    're-grows',
-    're-habbed',
-    're-habilitation',
-    're-habilitation.',
-    're-hallowing',
     're-hand',
-    're-hanging',
-    're-haul',
-    're-heating',
-    're-hegelianization',
-    're-hiring',
-    're-homing',
-    're-humanised',
-    're-hydration',
-    're-iced',
-    're-imagined',
-    're-imaging',
-    're-imburses',
-    're-immerse',
-    're-immersion',
-    're-imperil',
     're-implaced',
-    're-implement',
-    're-implementing',
-    're-implements',
-    're-import',
-    're-in',
-    're-in&rehy;vesting',
-    're-inaugurated',
-    're-inburse',
-    're-incarnated',
-    're-incorporating',
-    're-indexing',
-    're-industrializing',
-    're-infect',
-    're-infected',
-    're-infestation',
     're-inflation',
-    're-inforcement',
-    're-inforcer',
-    're-inhale',
-    're-initialize',
-    're-initiate',
-    're-initiation',
-    're-injectors',
-    're-inquired',
-    're-inserting',
-    're-inserts',
-    're-inspect',
-    're-inspecting',
-    're-inspired',
-    're-installation',
-    're-instated&ndash',
     're-instatements',
-    're-instates',
-    're-institute',
-    're-instituting',
-    're-instruct',
-    're-instrumentation',
-    're-insurers',
-    're-insuring',
-    're-integrating',
-    're-inter',
-    're-intervention',
-    're-interviews',
-    're-intonated',
-    're-intubation',
-    're-invade',
-    're-invasion',
     're-investigating',
-    're-investigations',
-    're-invigorating',
-    're-invoiced',
-    're-invoke',
-    're-involved',
-    're-involvement',
-    're-isolation',
-    're-isolations',
-    're-iterating',
-    're-iteration',
-    're-jig',
-    're-jiggled',
-    're-jigs',
-    're-jinks',
-    're-key',
     're-keyed',
-    're-knit',
-    're-known',
-    're-labelling',
-    're-lapped',
-    're-lau',
-    're-launches',
-    're-lax',
-    're-layed',
-    're-laying',
-    're-layout',
-    're-lays',
-    're-lean',
-    're-leased',
-    're-legalization',
-    're-legalized',
     're-lends',
-    're-lettered',
-    're-licensing',
-    're-lifed',
-    're-ligare',
-    're-lighting',
-    're-lined',
-    're-listed',
-    're-listen',
-    're-listing',
-    're-litigated',
-    're-litigating',
-    're-loads',
-    're-looped',
-    're-mail',
-    're-manufacture',
     're-mapped',
-    're-marked',
-    're-marketing',
-    're-marking',
-    're-marriageable',
-    're-marzipanned',
-    're-mastered',
-    're-match.',
-    're-measured',
-    're-measurement',
-    're-meeting',
-    're-mem-ber',
-    're-merchandising',
-    're-merge',
-    're-merger',
-    're-metalled',
     're-minted',
-    're-mobilised',
-    're-modelling',
-    're-modernized',
-    're-modularisation',
-    're-moisturiser',
-    're-mortar',
-    're-moulds',
-    're-mounted',
-    're-mug',
-    're-myelination',
-    're-nationalize',
-    're-nationalizing',
-    're-notified',
-    're-nourished',
-    're-occurred',
     're-offered',
-    're-operationalize',
-    're-oppose',
-    're-orders',
-    're-organises',
-    're-oriented',
-    're-owned',
-    're-oxygenation',
-    're-packaging',
-    're-packeted',
-    're-padlocks',
-    're-pair',
-    're-pairs',
-    're-palleted',
-    're-palleting',
-    're-palletize',
     're-palletizing',
-    're-parade',
-    're-park',
-    're-partee',
-    're-parting',
-    're-pass',
-    're-passed',
-    're-pastelled',
-    're-patch',
-    're-pattern',
-    're-paving',
-    're-payment',
-    're-penalising',
-    're-perforation',
-    're-performed',
-    're-perm',
     're-perusal',
-    're-petition',
-    're-piled',
-    're-pillared',
-    're-pilot',
-    're-placing',
-    're-plant',
-    're-plantation',
-    're-plaster',
-    're-plating',
-    're-pledged',
-    're-plotted',
-    're-plugged',
-    're-plumbed',
-    're-plumbing',
-    're-pointed',
     're-polarisation',
-    're-polished',
-    're-polled',
-    're-polling',
-    're-poor',
-    're-populated',
-    're-pose',
-    're-possessions',
-    're-post',
-    're-prescription',
-    're-prescriptions',
-    're-presentation/inversion/displacement',
-    're-presentational',
-    're-presentations',
-    're-presenting',
-    're-pressed',
     're-pricing',
-    're-printing',
-    're-prioritisations',
-    're-prioritise',
-    're-privatization',
-    're-process',
-    're-processed',
-    're-produce',
-    're-produced',
-    're-producing',
-    're-programmable',
-    're-proofer',
-    're-proposed',
-    're-proposing',
-    're-protect',
-    're-provision',
     're-provisioned',
-    're-publication',
-    're-publicized',
-    're-published',
-    're-punch',
-    're-puttied',
-    're-putty',
-    're-qualification',
-    're-qualified',
-    're-quartered',
-    're-question',
-    're-quoting',
-    're-radiated',
-    're-rail',
-    're-raised',
-    're-ranking',
     're-rated',
-    're-rationalised',
-    're-re-released',
-    're-recognize',
-    're-recordable',
-    're-recruitment',
-    're-reduced',
-    're-referenced',
-    're-referrals',
-    're-referred',
-    're-reflected',
-    're-registering',
-    're-registers',
-    're-registrations',
-    're-rehearse',
-    're-reindeers',
     're-relate',
-    're-releasings',
-    're-relocating',
-    're-remind',
-    're-repaired',
-    're-represent',
-    're-returns',
-    're-revalued',
-    're-ridged',
-    're-rig',
-    're-rigged',
-    're-rigging',
-    're-rinse',
-    're-riveted',
-    're-riveting',
-    're-role',
     're-rolling',
-    're-roo',
-    're-root',
-    're-s',
-    're-saleable',
-    're-sample',
-    're-sand',
-    're-sawing',
-    're-scale',
-    're-scales',
-    're-scaling',
-    're-scan',
-    're-schooling',
-    're-screening',
-    're-sealing',
-    're-season',
     're-seated',
-    're-seater',
-    're-seating',
-    're-see',
-    're-seeing',
-    're-select',
-    're-selections',
-    're-sensitised',
-    're-sentencing',
-    're-services',
-    're-set&mdash;in',
-    're-setting.',
-    're-sewing',
-    're-sharpen',
-    're-ship',
-    're-shoeing',
     're-shooting',
-    're-shot',
-    're-showing',
-    're-shown',
-    're-shrinking',
-    're-shuffling',
-    're-sights',
-    're-signalling',
-    're-silver',
-    're-size',
-    're-sketching',
-    're-skill',
-    're-skillable',
-    're-skinned',
-    're-sleepering',
-    're-smearing',
     're-smelting',
-    're-snogged',
-    're-soap',
-    're-socialization',
-    're-softening',
-    're-soled',
-    're-solve',
-    're-sort',
-    're-sorted',
-    're-sorting',
-    're-source',
-    're-specifies',
-    're-spiked',
-    're-spinning',
-    're-spool',
-    're-spraying',
     're-spread',
-    're-sprout',
-    're-spun',
-    're-stabilise',
-    're-stabilises',
-    're-staffed',
-    're-staging',
-    're-stalled',
-    're-station',
-    're-sterilised',
-    're-stiffening',
-    're-stirring',
-    're-stitched',
-    're-stoking',
-    're-stowing',
-    're-stress',
     're-striping',
-    're-struck',
-    're-strung',
-    're-stuffed',
-    're-styles',
-    're-submerge',
-    're-subscribe',
-    're-sucked',
-    're-surfaces',
-    're-suspend',
-    're-swung',
-    're-table',
-    're-tabled',
-    're-tabling',
-    're-tag',
-    're-tailoring',
     're-takes',
-    're-taped',
-    're-taping',
-    're-tared',
-    're-target',
-    're-targeted',
-    're-team',
-    're-tendered',
-    're-tendering',
-    're-texturing',
-    're-thaw',
-    're-themed',
-    're-thinkable',
-    're-threading',
-    're-thrombosis',
-    're-tighten',
     're-tile',
-    're-tilted',
-    're-time',
-    're-titling',
-    're-tonique',
-    're-topped',
-    're-trail',
-    're-transfer',
-    're-transformed',
-    're-translating',
-    're-transmitting',
-    're-treat',
-    're-treatment',
-    're-trials',
-    're-tribalize',
-    're-trigger',
     're-triggers',
-    're-trimming',
-    're-tube',
-    're-tubed',
-    're-tudorisation',
-    're-turning',
-    're-tweaked',
-    're-twisted',
-    're-understand',
-    're-unify',
-    're-unifying',
-    're-union.the',
-    're-upholster',
-    're-upholstering',
-    're-upholstery',
-    're-useable',
     're-utilisation',
-    're-utilize',
-    're-vaccinated',
-    're-valve',
-    're-vamps',
-    're-vaulted',
-    're-vegetation',
-    're-view',
-    're-vision',
-    're-visioned',
-    're-visioning',
-    're-visiting',
-    're-vitalization',
-    're-vitalize',
-    're-walk',
-    're-walking',
     're-wash',
-    're-washering',
-    're-washing',
-    're-waxing',
-    're-weighed',
-    're-wet',
-    're-wheeled',
-    're-whitened',
-    're-wired',
-    're-word',
-    're-worded',
-    're-wording',
-    're-writ',
-    're-writeable',
-    're-writers',
-    're-writings',
     're-x-ray',
-    're-xerox',
-    're-yoked',
-    're-zed',
-    're.adoption',
-    're.formulated',
-    're.g',
-    're/00/22/0002',
-    're/00/22/2011',
-    're/00/23/0049',
-    're/00/23/2054',
-    're/00/23/2109',
-    're/00/23/2125',
-    're/00/23/2131',
-    're/00/23/2153',
-    're/00/23/2159',
     're/00/23/2161',
-    're/00/23/2162',
-    're/00/23/2175',
-    're/00/23/2183',
-    're/00/23/2186',
-    're/00/23/2187',
-    're/00/23/2196',
-    're/00/23/2197',
-    're/00/23/2207',
-    're/00/23/2210',
-    're/00/23/2224',
-    're/00/23/2227',
-    're/00/23/2236',
-    're/00/23/2238',
-    're/00/23/2241',
-    're/00/23/2242',
     're/00/23/2245',
-    're/00/23/2246',
-    're/00/23/2251',
-    're/00/23/2270',
-    're/00/23/2277',
-    're/00/23/2283',
-    're/00/23/2287',
-    're/00/23/2289',
-    're/00/23/2292',
-    're/00/23/2294',
-    're/00/24/2038',
-    're/00/24/2045',
-    're/00/24/2050',
-    're/00/24/2057',
-    're3',
-    're3&verbar&verbar;e5&verbar&verbar',
     're301',
-    're570d',
-    're576d',
-    're6+&verbar&verbar;kf7&verbar&verbar;33',
-    're7+&verbar&verbar;kg8&verbar&verbar',
-    're8',
-    're905',
-    're990ct',
-    're:batty',
-    're:bits',
-    're:change',
-    're:elland',
-    're:fantasy',
-    're:joyce.',
-    're:joycing',
-    're:mcallister',
     're:meeting',
-    're:pemberton',
-    're:phoned',
-    're:pickfords',
-    're:rocky',
-    're:strach',
-    're:striker',
-    're:toy',
-    're=enactment',
-    'rea-cta-nts',
-    'rea-lisation',
-    'rea-lly',
-    'rea/farmer',
-    'reab',
-    'reabsorbing',
-    'reabsorbs',
     'reabused',
-    'reacceptance',
-    'reacculturation',
-    'reach-fall-reach',
-    'reach-for-the-moon',
-    'reach-in',
-    'reach-reverse-circle-thrust-reverse-circle',
-    'reach-reverse-thrust',
-    'reach-reverse-thrust-withdraw',
-    'reach/and',
-    'reachable/not',
-    'reached-the',
-    'reachin',
-    'reaching-back',
-    'reaching-for',
-    'reaching.',
     'reachmaster',
-    'reachsouthern',
-    'reacquire',
-    'reacquisition',
-    'react2',
-    'reactants.',
-    'reaction\'',
-    'reaction(s)',
-    'reaction-formation',
-    'reaction-formations',
-    'reaction-mechanisms',
-    'reaction-times',
-    'reactionism',
-    'reactivaci&oacute;n',
-    'reactivart',
-    'reactivator',
     'reactive.',
-    'reactivins',
-    'reactolite',
-    'reactor.',
-    'reactorless',
-    'reactors.the',
-    'reacts.',
-    'read&mdash;from&mdash;package&mdash;pi.log',
-    'read&mdash;module&mdash;pi.log',
-    'read-and-write',
-    'read-back',
-    'read-every-newspaper-in-the-shop',
-    'read-in',
-    'read-only-memory',
-    'read-up',
-    'read/oxfordshire',
     'read/see',
-    'read/send',
-    'read/writer',
-    'read/written',
-    'read_and_so',
-    'reader(s)',
-    'reader-',
-    'reader-centred',
-    'reader-challenge',
-    'reader-effort',
-    'reader-identification',
-    'reader-in-the-text',
-    'reader-loyalty',
-    'reader-oriented',
-    'reader-reaction',
-    'reader-responses',
     'reader-unfriendly',
-    'reader-writes',
-    'reader.printers',
-    'reader/hearer',
-    'reader/joke-writer',
-    'reader/writer',
-    'readerland',
-    'readerman',
-    'readers.it',
-    'readers/',
-    'readers/audiences',
-    'readers/hearers',
-    'readers/viewers',
-    'readicut',
-    'readie',
-    'readily-accessible',
     'readily-bred',
-    'readily-changed',
-    'readily-guaranteed',
-    'readily-leached',
-    'readily-observable',
-    'readily-recognizable',
-    'readily-recognized',
-    'readily.',
-    'readiness-to-roll',
-    'readinesses',
-    'reading&ndash',
-    'reading(s)',
-    'reading-centres',
-    'reading-glass',
-    'reading-glasses',
-    'reading-halls',
     'reading-in',
-    'reading-it',
-    'reading-level',
-    'reading-matter',
-    'reading-passage',
-    'reading-response',
-    'reading-strategies',
-    'reading-the',
-    'reading-they',
-    'reading-tonbridge',
-    'reading/berkshire',
-    'reading/sitting',
-    'reading/tv',
-    'reading/watching/eating',
-    'readingbased',
-    'readinges',
     'readionuclide',
-    'readiopaque',
-    'readjustment.',
-    'readly',
-    'readme',
-    'readme.com',
-    'readopting',
-    'readorned',
-    'readvertise',
-    'readvertised',
-    'readwrite',
-    'ready&rehy;assembled',
-    'ready&rehy;filled',
-    'ready&rehy;made',
-    'ready-',
-    'ready-bottled',
     'ready-bought',
-    'ready-brewed',
-    'ready-calorie-counted',
-    'ready-chopped',
-    'ready-combed',
-    'ready-configured',
-    'ready-filled',
-    'ready-filleted',
-    'ready-finished',
-    'ready-for-action',
-    'ready-formed',
-    'ready-growing',
-    'ready-interleaved',
-    'ready-laden',
-    'ready-laid',
-    'ready-lined',
     'ready-marinated',
-    'ready-market',
-    'ready-meal',
-    'ready-meals',
-    'ready-moulded',
-    'ready-packaged',
-    'ready-painted',
-    'ready-peeled',
-    'ready-planned',
-    'ready-poured',
-    'ready-reckoner',
-    'ready-reference',
-    'ready-rehearsed',
-    'ready-roasted',
-    'ready-salted',
-    'ready-sealed',
     'ready-shelled',
-    'ready-sliced',
-    'ready-strung',
-    'ready-tailored',
-    'ready-taped',
-    'ready-to',
-    'ready-to-assemble',
-    'ready-to-feed',
-    'ready-to-fill',
-    'ready-to-fit',
-    'ready-to-jump',
-    'ready-to-send',
-    'ready-to-serve',
-    'ready-torn',
-    'ready-trained',
-    'ready-washed',
     'ready-written',
-    'ready.',
-    'readymixed',
-    'readyness',
-    'reaestheticizing',
-    'reaffiliate',
-    'reaffiliation',
-    'reaffirmations',
-    'reafforest',
-    'reafs',
-    'reagan\'s',
-    'reagan-appointee',
-    'reagan-gorbachev',
-    'reagan-shultz',
-    'reagan-sized',
-    'reagan-supporting',
     'reagan/brezhnev',
-    'reagan/bush/casey/north',
-    'reagan/carter',
-    'reagan/gorbachev',
-    'reage',
-    'reagent/alcian',
-    'reagents.',
-    'reaggregating',
-    'reagrarianization',
-    'reahc',
-    'reaklli',
-    'reakstead',
-    'real&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar',
-    'real&rehy;and-actual',
-    'real&rehy;life',
-    'real-',
     'real-ale',
-    'real-compiler',
-    'real-death',
-    'real-food',
-    'real-growth',
-    'real-ix',
-    'real-looking',
-    'real-money',
-    'real-ness',
-    'real-nightmare-dream',
-    'real-space',
-    'real-term',
-    'real.three',
-    'real.time',
-    'real/',
-    'real/unreal',
     'reala',
-    'realcote',
-    'realease',
-    'realfoods',
-    'realgar',
-    'realiable',
-    'realien',
-    'realigners',
-    'realis&rehy;ing',
-    'realisability',
-    'realisating',
-    'realise&mdash',
-    'realise\'',
-    'realised/that',
-    'realished',
-    'realising/',
     'realism\'',
-    'realisme',
-    'realist.',
-    'realist/abstract',
-    'realisti&rehy;cally',
-    'realistic\'',
-    'realistica&rehy;lly',
-    'realistical',
-    'realistically-minded',
-    'realistically-modelled',
-    'realite',
-    'realities.',
-    'reality-',
-    'reality-denying',
-    'reality-effect',
-    'reality-effects',
     'reality-orientated',
-    'reality-principle',
-    'reality-talk',
-    'realityengine2s',
-    'realization.',
-    'realizational',
-    'realized\'',
-    'realizer',
-    'realizers',
-    'reallife',
-    'reallotted',
-    'reallowance',
-    'reallowances',
-    'really&rehy;i',
-    'really-',
-    'really_at',
     'really_out',
-    'realm-wide',
-    'realm.is',
-    'realnej',
-    'realness',
-    'realo',
-    'realpolitik.',
-    'realpolitiker',
-    'realsing',
-    'realspace',
-    'realston',
-    'realtime-calculated',
-    'realtionship',
-    'realtionships',
-    'realtively',
-    'realtor',
     'realways',
-    'reamers',
-    'reamined',
-    'reanaesthetized',
-    'reanalyses',
-    'reanastomosis',
-    'reanointed',
-    'reans',
-    'reany',
-    'reaons',
-    'reap&rehy;peared',
-    'reap-oddar',
-    'reap/nothing',
-    'reapears',
-    'reaper-and-binder',
-    'reaper-binder',
     'reapid',
-    'reapin\'',
-    'reappeal',
-    'reappearence',
-    'reapplies',
-    'reappointees',
-    'reappointments',
-    'reappoints',
-    'reapportioned',
-    'reappraises',
-    'reapproaching',
-    'reappropriate',
-    'reappropriating',
-    'rear&rehy;admiral',
-    'rear&rehy;facing',
-    'rear&rehy;guard',
     'rear-axle',
-    'rear-being',
-    'rear-commodore',
-    'rear-ended',
-    'rear-lamp',
-    'rear-mirror',
-    'rear-most',
-    'rear-of-the-year',
-    'rear-projected',
-    'rear-projection',
-    'rear-stage',
-    'rear-vassals',
-    'rearend',
-    'rearfiring',
-    'reargued',
-    'rearlights',
     'rearmered',
-    'rearrangement-promoting',
-    'rearrangement.',
-    'rearranglng',
-    'rearsby',
-    'rearticulating',
-    'rearticulations',
-    'rearward-sliding',
-    'rearwin',
-    'reascending',
-    'reasenberg',
-    'reaser',
-    'reasima',
-    'reasnabell',
-    'reason-action',
-    'reason-based',
     'reason-giving',
-    'reason-sense',
-    'reason-the',
-    'reason.',
-    'reason.i',
-    'reason/',
-    'reason/emotion',
-    'reason/faith',
-    'reason/unreason',
-    'reasonability',
-    'reasonable&rehy;looking',
-    'reasonable-above',
-    'reasonable-looking',
-    'reasonable-sounding',
-    'reasonable/sensible',
-    'reasonableness.',
     'reasonably&rehy;peaceful',
-    'reasonably&rehy;sized',
-    'reasonably\'',
-    'reasonably-minded',
-    'reasonably-rated',
-    'reasonably-uniform',
-    'reasoned.',
-    'reasoning\'',
-    'reasons**',
-    'reasons-exposure',
-    'reasons-unlike',
-    'reasons.40',
-    'reasons.we',
-    'reasons/explanations/excuses',
-    'reasoon',
-    'reass',
     'reassemblage',
-    'reassesment',
-    'reassignments',
-    'reassociate',
-    'reassociation',
-    'reasson',
-    'reasssure',
-    'reassurer',
-    'reassuringness',
-    'reasure',
-    'reasuring',
-    'reath',
-    'reatmosphered',
-    'reattain',
-    'reattained',
-    'reatuarant',
     'reauthorising',
-    'reavell/shop',
-    'reaven',
-    'reaving',
-    'reawakens',
-    'rebadge',
-    'rebaited',
-    'reballoting',
-    'rebanded',
-    'rebaptised',
-    'rebarbatively',
-    'rebase',
-    'rebasification',
-    'rebate-only',
-    'rebates.',
-    'rebay',
     'rebaya',
-    'rebaza',
-    'rebbeck/gloucestershire',
-    'rebbeck/regimental',
-    'rebeh',
-    'rebel-delinquent',
-    'rebel-rouser',
-    'rebelde',
-    'rebell',
-    'rebellionis',
-    'rebellious/manipulative',
-    'reber',
-    'reberrymemberer',
-    'reberty',
-    'rebeuh',
-    'rebeyrolle',
     'rebinders',
-    'rebirth-type',
-    'rebitten',
-    'reblaced',
-    'rebleached',
-    'rebleeds',
-    'reblingen',
-    'reblochon',
-    'reblocked',
-    'reboiled',
-    'rebollo',
-    'rebolusyonaryong',
-    'rebond',
-    'rebooking',
-    'reboots',
-    'reboring',
     'rebottle',
-    'rebottleable',
-    'reboundings',
-    'rebour',
-    'reboux',
-    'rebreathed',
-    'rebrief',
-    'rebriefed',
-    'rebroadcast',
-    'rebroke',
-    'rebs',
-    'rebuckled',
-    'rebuffal',
-    'rebuffat',
-    'rebuildable',
-    'rebuker',
     'rebukingly',
-    'rebul',
-    'reburrowed',
-    'reburying',
-    'rebuttably',
-    'rebutton',
-    'rebuttoned',
-    'rebuy',
-    'rec-',
-    'rec-rooms',
-    'rec.',
-    'rec1',
-    'reca',
-    'reca1',
-    'recabling',
-    'recadi',
     'recalc',
-    'recalcify',
-    'recalculations',
-    'recalibrate',
-    'recall.',
-    'recalls.98',
-    'recanalised',
-    'recane',
-    'recannulisation',
-    'recannulise',
-    'recapitalised',
-    'recapitalising',
-    'recapitalization',
-    'recapitalizations',
-    'recapitulator',
-    'recapitulatory',
     'recarving',
-    'recased',
-    'recastings',
-    'recategorisation',
-    'recategorized',
-    'recation',
-    'recaulk',
-    'recb',
-    'recc',
-    'reccared',
-    'recced',
-    'recchia',
-    'recco',
-    'reccommendation',
-    'reccurence',
-    'reccurrence',
     'reccy',
-    'receaved',
-    'reced',
-    'recedent',
-    'receeded',
-    'receeding',
-    'recei',
-    'receipients',
-    'receipt-holder',
-    'receipts1',
-    'receive-only',
-    'receive/',
-    'received-please',
-    'received/got',
-    'received/hold',
-    'receivedbut',
     'receiver-decoder',
-    'receiver-manager',
-    'receiver-rest',
-    'receiver-transmitters',
-    'receiver/',
-    'receiver/addressee',
-    'receiver/manager',
-    'receivers-general',
-    'receivest',
-    'receiving-room',
-    'receiving-stations',
-    'recemented',
-    'recementing',
-    'recenate',
-    'recenly',
-    'recent-enough',
     'recentering',
-    'recently&rehy;enacted',
-    'recently-accredited',
-    'recently-active',
-    'recently-adopted',
-    'recently-assembled',
-    'recently-awarded',
-    'recently-closed',
-    'recently-come',
-    'recently-commandeered',
-    'recently-constructed',
-    'recently-dead',
-    'recently-deceased',
-    'recently-dedicated',
-    'recently-delivered',
-    'recently-equipped',
     'recently-established',
-    'recently-founded',
-    'recently-gained',
-    'recently-hatched',
-    'recently-held',
-    'recently-issued',
-    'recently-murdered',
-    'recently-named',
-    'recently-poisoned',
-    'recently-prepared',
-    'recently-qualified',
-    'recently-rebuilt',
-    'recently-renovated',
-    'recently-rescued',
-    'recently-restored',
-    'recently-retired',
     'recently-revamped',
-    'recently-started',
-    'recently-won',
-    'recently.',
-    'recentralize',
-    'recentre',
-    'recentring',
-    'recep',
-    'recep-',
-    'receps',
-    'receptance',
-    'reception-class',
-    'reception-clerk',
-    'reception-cum-lounge',
-    'reception-desk',
-    'reception-rooms',
     'reception/bar',
-    'reception/enquiries',
-    'reception/visitor',
-    'receptionist-cum-switchboard',
-    'receptionist/',
-    'receptor\'',
-    'receptor-associated',
-    'receptor-bearing',
-    'receptor-controlled',
-    'receptor-gs',
-    'receptor-matrix',
-    'receptor-mediate',
-    'receptor-selective',
-    'receptor/channel',
-    'receptors/cell',
-    'receptors/enzymes',
     'receptot',
-    'receptum',
-    'receptus',
-    'recercadas',
-    'recercare',
-    'recertification',
-    'recertified',
-    'recession&rehy;ary',
-    'recession-affected',
-    'recession-blasted',
-    'recession-bound',
-    'recession-bruised',
-    'recession-clobbered',
-    'recession-defying',
-    'recession-free',
-    'recession-friendly',
     'recession-gripped',
-    'recession-led',
-    'recession-reinforcing',
-    'recession-resilient',
-    'recession-restrained',
-    'recession-ridden',
-    'recession-savaged',
-    'recession-watchers',
-    'recession.e',
-    'recession.the',
-    'recessively',
-    'recetor',
-    'recettes',
-    'receuil',
-    'recevied',
-    'receving',
     'rechabite',
-    'rechabites',
-    'rechallenges',
-    'recharbonisation',
-    'rechard',
-    'rechargings',
-    'recharted',
-    'rechase',
-    'rechavam',
-    'reched',
-    'rechercari',
-    'recherch&eacute;s',
-    'recherche&eacute',
-    'reches',
-    'rechromatographed',
-    'rechromed',
     'rechter',
-    'rechts',
-    'rechtss&auml;tze',
-    'reci',
-    'recidivate',
-    'recidivating',
-    'recievers',
-    'recinos',
-    'recintly',
-    'recipe.page',
-    'recipe/instruction',
-    'recipe/weekend',
-    'recipes/weekend',
-    'recipesfrom',
-    'recipient\'',
-    'recipients-deprivation',
     'recipies',
-    'recipitents',
-    'reciprocal&mdash',
-    'reciprocal/',
-    'reciprocators',
-    'recips',
-    'recircuit',
-    'recirculatory',
-    'recital-rigid',
-    'recitalist',
-    'recitalists',
-    'recitata',
-    'recitation.',
-    'recitativa',
-    'recitative-like',
-    'reciters',
     'reck\'n',
-    'reckey',
-    'recking',
-    'reckitts',
-    'reckles',
-    'reckless-more',
-    'reckless/ugly',
-    'recklessly-made',
-    'reckling',
-    'recko',
-    'reckonmthey',
-    'reclaimer',
-    'reclaimer-ameliorator-polyremic',
-    'reclam',
-    'reclamaci&oacute;n',
-    'reclamar',
     'reclamations',
-    'reclamp',
-    'reclasping',
-    'reclassifies',
-    'reclenching',
-    'reclericalized',
-    'reclimbing',
-    'recliner-rocker',
-    'recloned',
-    'recloning',
-    'reclosed',
-    'recloses',
-    'reclothing',
-    'reclu',
-    'reclus',
-    'reclusia',
     'reco\'nise',
-    'reco-reco',
-    'recoagulating',
-    'recoat',
-    'recoated',
-    'recodable',
-    'recodified',
-    'recodify',
-    'recoevring',
-    'recog',
-    'recogni',
-    'recognisances',
-    'recognise&lsqb;d&rsqb',
-    'recognised\'',
-    'recognision',
-    'recognitiom',
     'recognition\'',
-    'recognition.',
-    'recognition/elongation',
-    'recognition/status',
-    'recognizability',
-    'recognize.',
-    'recognized.23',
-    'recognized_now',
-    'recognizer',
-    'recoilless',
-    'recoin',
-    'recoit',
-    'recoleta',
-    'recollection&mdash',
-    'recollection.',
-    'recollectors',
     'recollettas',
-    'recolonising',
-    'recolour',
-    'recom',
-    'recom&rehy;mending',
-    'recom&rehy;pensed',
-    'recom-mended',
-    'recombinant-inbred',
-    'recombinational',
-    'recombinations',
-    'recombines',
-    'recomen',
-    'recomme',
-    'recommenc&eacute;e',
-    'recommend/criticise',
-    'recommendatin',
     'recommendational',
-    'recommendations&mdash',
-    'recommendations.',
-    'recommended&mdash;it',
-    'recommended-viewing',
-    'recommended.',
-    'recommendedsurgery',
-    'recommender',
-    'recommitments',
-    'recommitted',
-    'recommitting',
-    'recommndations',
-    'recommunization',
-    'recompact',
-    'recompe',
-    'recompences',
     'recompensing',
-    'recompilations',
-    'recompilers',
-    'recompletion',
-    'recompos&eacute',
-    'reconaissance',
-    'reconcentration',
-    'reconceptualizing',
-    'reconcilement',
-    'reconciliate',
-    'reconciliation.',
-    'reconciliaton',
-    'recondense',
-    'recondensed',
-    'recondensing',
-    'recondita',
     'reconditely',
-    'reconditioners',
-    'reconditions',
-    'reconfort&eacute',
-    'reconjure',
-    'reconna&icirc;tre',
-    'reconnaisance',
-    'reconnaisse',
-    'reconnects',
-    'reconnoitering',
-    'reconose',
-    'reconquista',
-    'reconsecrate',
-    'reconsolidated',
-    'reconstituter',
-    'reconstituters',
     'reconstitutions',
-    'reconstruc&rehy;tion',
-    'reconstrucci&oacute;n',
-    'reconstructer',
-    'reconstructeurs',
-    'reconstructible',
-    'reconstruction\'',
-    'reconstruction-oriented',
-    'reconstruction/3d/yorkshire',
-    'reconstruction/banbury/oxfordshire',
-    'reconstruction/parkend/gloucestershire',
-    'reconstruction/tim',
-    'reconstructionism',
-    'reconstructionist',
-    'reconstrued',
-    'reconstruing',
     'reconsummated',
-    'recontextualisation',
-    'recontextualise',
-    'recontoured',
-    'recontouring',
-    'recontours',
-    'recontract',
-    'reconverts',
-    'reconvic&rehy;tion',
-    'reconvictions',
-    'recook',
-    'record&mdash',
-    'record&ndash;breaking',
-    'record&rehy;equalling',
-    'record\'',
-    'record-and-documentary',
     'record-big',
-    'record-book',
-    'record-buy',
-    'record-buyer',
-    'record-buyers',
-    'record-cleaners',
-    'record-collector',
-    'record-commodity',
-    'record-company',
-    'record-formatting',
-    'record-heads',
-    'record-holders',
-    'record-holding',
-    'record-keeper',
-    'record-keepers',
-    'record-loading',
     'record-locking',
-    'record-offices',
-    'record-packers',
-    'record-pressing',
-    'record-producer',
-    'record-section',
-    'record-shop',
-    'record-shredders',
-    'record-signing',
-    'record-sixth',
-    'record-structured',
-    'record-time',
-    'record.july',
-    'record/book',
-    'record/field',
-    'record/manpower',
     'record/review',
-    'record_in',
-    'recordable-erasable',
-    'recordal',
-    'recordare',
-    'recordbreaker',
-    'recorded-sound',
-    'recorded-the',
-    'recorded.flood',
-    'recorded.the',
-    'recorder-music',
-    'recorder-player',
-    'recorder/helper',
-    'recorder/mixer',
-    'recordering',
-    'recordfor',
     'recording\'',
-    'recording-tape',
-    'recording-the',
-    'recording/etc',
-    'recording/publishing/production',
-    'recordophile',
-    'records&mdash;i',
-    'records-base',
-    'records-managers',
-    'records-sold',
-    'records.',
-    'records.between',
-    'records.the',
-    'records/pieces',
-    'records/tapes',
-    'recordtransfer',
     'recordwise',
-    'recorked',
-    'recorking',
-    'recorporate',
-    'recosted',
-    'recouer',
-    'recounted.',
-    'recounter',
-    'recoupedits',
-    'recoupes',
-    'recouple',
-    'recourd',
-    'recours',
-    'recourses',
-    'recoved',
-    'recovenanting',
     'recovened',
-    'recoverable.the',
-    'recoverall',
-    'recovered/repaired',
-    'recovery-threatening',
-    'recovery/recycling',
-    'recques',
-    'recrafting',
-    'recrded',
-    'recre',
-    'recreatie',
-    'recreation.',
-    'recreation/environment',
-    'recreation/fun',
-    'recreation/tourist',
-    'recreational/cultural',
     'recreationes',
-    'recreationists',
-    'recredits',
-    'recrifying',
-    'recriminalized',
-    'recriminate',
-    'recriminating',
-    'recrimination-wise',
-    'recropping',
-    'recrosigmoid',
-    'recrucifixion',
-    'recrudescent',
-    'recrudescing',
-    'recruitin\'',
-    'recruiting-sergeants',
-    'recruiting-systems',
     'recruitment/activation',
-    'recrutamento',
-    'recruted',
-    'recssion',
-    'recta',
-    'rectal/abdominal',
-    'rectanal',
-    'rectangle.',
-    'rectangula',
-    'rectangular/strip',
-    'recteur',
-    'recti',
-    'rectifiable',
-    'rectifiant',
-    'recto-rectangular',
-    'rectocele',
     'rectonal',
-    'rectorship',
-    'rectory.',
-    'rectosigmoidoscopy',
-    'recue',
-    'reculture',
-    'recuperatio',
-    'recurrance',
-    'recurrencerates',
-    'recurring.',
-    'recurs.',
-    'recursions',
-    'recursiveness',
-    'recuruits',
-    'recurvirostridae',
-    'recurvum',
     'recurvum/auriculatum',
-    'recutita',
-    'recutting/replacing',
-    'recy',
-    'recycled.',
-    'recycling.',
-    'recyclying',
-    'recyled',
-    'recyling',
-    'red&mdash',
-    'red&mdash;breasted',
-    'red&mdash;tailed',
-    'red&mdash;the',
-    'red&rehy;coated',
-    'red&rehy;coloured',
-    'red&rehy;hot',
     'red&rehy;leaved',
-    'red&rehy;striped',
-    'red-and-blacks',
-    'red-and-cream',
-    'red-and-gold',
-    'red-and-pink',
-    'red-and-purple',
-    'red-and-white-check-curtain-windowed',
-    'red-and-white-striped',
-    'red-arrows',
-    'red-awninged',
-    'red-axe',
-    'red-baized',
-    'red-banded',
-    'red-bands',
-    'red-belly',
     'red-bereted',
-    'red-birds',
-    'red-black',
-    'red-blacks',
-    'red-blond',
-    'red-blood',
-    'red-blue',
-    'red-booted',
-    'red-braced',
-    'red-braces',
-    'red-breast',
-    'red-browed',
-    'red-buttoned',
-    'red-canna',
-    'red-cap',
-    'red-carpet',
     'red-chequered',
-    'red-chested',
-    'red-circled',
-    'red-circling',
-    'red-clad',
-    'red-clay',
-    'red-cliffed',
-    'red-cockaded',
-    'red-crimson',
-    'red-cross',
-    'red-crossed',
-    'red-currant',
-    'red-damasked',
-    'red-dirt',
-    'red-dot',
-    'red-draped',
     'red-dressed',
-    'red-earth',
-    'red-earthed',
-    'red-edged',
-    'red-embarrassed',
-    'red-finned',
-    'red-flecked',
-    'red-fleshed',
-    'red-flock',
-    'red-flushed',
-    'red-frame',
-    'red-furred',
-    'red-gel',
-    'red-gilt',
-    'red-gloved',
-    'red-glow',
     'red-golden',
-    'red-green-blue',
-    'red-green-blue\'',
-    'red-ground',
-    'red-group',
-    'red-handled',
-    'red-hats',
-    'red-herren',
-    'red-hottest',
-    'red-jewelled',
-    'red-jumpered',
-    'red-knobbed',
-    'red-land',
-    'red-leaf',
-    'red-leather',
-    'red-leatherbound',
     'red-like',
-    'red-lined',
-    'red-lining',
-    'red-lipstick',
-    'red-lipsticked',
-    'red-liveried',
-    'red-meat',
-    'red-mercury',
-    'red-mire',
-    'red-mist',
-    'red-morocco',
-    'red-nailed',
-    'red-nose',
-    'red-object-appropriate',
-    'red-on-white',
-    'red-on-yellow',
     'red-orbed',
-    'red-ott',
-    'red-padded',
-    'red-pencilled',
-    'red-penned',
-    'red-pepper',
-    'red-point',
-    'red-pooled',
-    'red-raw-with-feeling',
-    'red-ribboned',
-    'red-ringed',
-    'red-rust',
-    'red-rusted',
-    'red-sailed',
-    'red-seated',
-    'red-seeing',
     'red-shaded',
-    'red-side',
-    'red-silk',
-    'red-slit',
-    'red-soaked',
-    'red-socked',
-    'red-soiled',
-    'red-streaked',
-    'red-striped',
-    'red-sweatered',
-    'red-tabbed',
-    'red-tagged',
-    'red-tails',
-    'red-tasselled',
-    'red-tide',
-    'red-tile-roofed',
     'red-tiled-roof',
-    'red-tones',
-    'red-tongued',
-    'red-velvet',
-    'red-wigged',
-    'red/black',
-    'red/blue',
-    'red/deacon',
-    'red/multi',
-    'red/pink',
-    'red/yellow/green',
-    'redab',
-    'redacre',
-    'redaction-critics',
-    'redactor',
-    'redated',
     'redback',
-    'redblackredblack',
-    'redblooded',
-    'redbone',
-    'redbook',
-    'redbourn',
-    'redbourne',
-    'redbrick-professor-writer',
-    'redbrown',
-    'redburn.',
-    'redburst',
-    'redby',
-    'redca',
-    'redcar-born',
-    'redcliffe-maude',
-    'redcoated',
     'redcrosse',
-    'redcrossed',
-    'redcu',
-    'redcurrants.',
-    'reddat',
-    'redded',
-    'reddell',
-    'reddendo',
-    'reddich',
-    'reddish-',
-    'reddish-pink',
-    'reddishe',
-    'reddita',
-    'reddled',
-    'reddoe',
-    'redds',
     'reddy-gold',
-    'redecorates',
-    'redeemably',
-    'redeemed&mdash;p135',
-    'redefended',
-    'redelivered',
-    'redemayer',
-    'redemptio',
-    'redemption-money',
-    'redemption-seeking',
-    'redemptively',
-    'redemptn.',
-    'redemptorist',
-    'redemptory',
-    'redenominated',
-    'redeployments',
     'rederiaktiebolaget',
-    'redescribing',
-    'redesign/new',
-    'redesignates',
-    'redesignating',
-    'redesignations',
-    'redesigners',
-    'redeswire',
-    'redeterminations',
-    'redevloped',
-    'redeye',
-    'redeyed',
-    'redface',
-    'redfang',
-    'redferns',
-    'redfield',
     'redfish',
-    'redfordbacked',
-    'redfordness',
-    'redforth',
-    'redgewell',
-    'redgill',
-    'redgills',
-    'redgrave/minstrels',
-    'redgraves',
-    'redgrift',
-    'redgum',
-    'redhaired',
-    'redheuch',
-    'redi-hots',
-    'redi-mail',
-    'rediagnosed',
     'rediagramming',
-    'redialled',
-    'redials',
-    'redian',
-    'rediculous',
-    'redid',
-    'redifferentiate',
-    'redifon',
-    'redigitize',
-    'redilatation',
-    'redimensioned',
-    'redimet',
-    'redina',
-    'reding',
-    'redingdon',
-    'redington',
     'redirec&rehy;tion',
-    'redis',
-    'rediscoverer',
-    'rediscussed',
-    'redisperse',
-    'redispersion',
-    'redisplay',
-    'redisposition',
-    'redissociates',
-    'redissolving',
-    'redistil',
-    'redistillated',
-    'redistributable',
-    'redistributor',
-    'redivided',
-    'redividing',
     'redivorce',
-    'redivorced',
-    'redjosenpono',
-    'redko',
-    'redlake',
-    'redland/riba',
-    'redleg',
-    'redler',
-    'redletter',
-    'redlight',
-    'redlining',
-    'redloch',
-    'redman/chairman/greene',
-    'redman/head',
-    'redman/hepatitis',
-    'redman/professor',
     'redmann',
-    'redmans',
-    'redmayne-bentley',
-    'redmen',
-    'redmond/civilian',
-    'redmond/national',
-    'rednell',
-    'redners',
-    'rednesses',
-    'redort',
-    'redosed',
-    'redoubl&eacute',
-    'redounds',
-    'redoutensaale',
-    'redown',
-    'redoxin',
     'redoxon',
-    'redpoints',
-    'redpolls.',
-    'redr',
-    'redraftings',
-    'redraped',
-    'redresser',
-    'redressers',
-    'redressive',
-    'redrill',
-    'redrilled',
-    'redrit',
-    'redro',
-    'redrock',
-    'redroofed',
-    'redshank-like',
     'redshift-space',
-    'redshift/',
-    'redstar',
-    'redtenbacher',
-    'redu',
-    'reduc',
-    'reduce\'',
-    'reduce/teenage',
-    'reduce_per',
-    'reduced-depth',
-    'reduced-flush',
-    'reduced-form',
-    'reduced-input',
-    'reduced-price',
-    'reduced-size',
-    'reduced-statures',
     'reduced-to-pole',
-    'reduced-voice',
-    'reduced/h/g',
-    'reduceedge',
-    'reducepaths',
-    'reducers.',
-    'reducevertex',
-    'reduciton',
-    'reduction&mdash;which',
-    'reduction/cessation',
-    'reduction/declarator',
-    'reductionisms',
-    'reductionistic',
-    'reductively',
-    'reductivists',
-    'reducved',
     'redunant',
-    'redundan',
-    'redundances',
-    'redundancy-money',
-    'redundancy/bankruptcy',
-    'redundancy/church',
-    'redundancy/early',
-    'redundancy/pension',
-    'redundancy/severance',
-    'redundandt',
-    'redundant-always',
-    'redundant.lyly',
-    'redundanted',
-    'redundent',
-    'redundo',
-    'reduta',
     'redware',
-    'redwell',
-    'redwood/',
-    'redyces',
-    'redyng',
-    'reebajaz',
-    'reeburs',
-    'reece-carltons',
-    'reece-edwards',
-    'reece/',
-    'reece/oxford',
-    'reechoed',
-    'reechoing',
-    'reed-buntings',
-    'reed-covered',
-    'reed-cutting',
     'reed-lined',
-    'reed-slim',
-    'reed-stumps',
-    'reed-thatch',
-    'reed-thatched',
-    'reed-thatches',
-    'reed-thick',
-    'reed-thin',
-    'reed-warblers',
-    'reed/british',
-    'reed/elsevier',
-    'reed/mayor',
-    'reed/national',
-    'reed/oxfam',
-    'reedbuck',
-    'reede',
     'reederei',
-    'reedgrass',
-    'reedie',
-    'reedijk',
-    'reedlings',
-    'reeds:owl-like',
-    'reedstalks',
-    'reedswamps.',
-    'reef-builders',
-    'reef-cities',
-    'reef-cut',
-    'reef-forming',
-    'reef-hive',
-    'reef-knot',
-    'reef.',
-    'reeference',
     'reefers',
-    'reekit',
-    'reel&ndash;turned',
-    'reel-appeal',
-    'reel-cutter',
-    'reel-to-reels',
-    'reel/spindle',
-    'reelers',
-    'reeling-machine',
-    'reelings',
-    'reelly',
-    'reembarked',
-    'reemergence',
-    'reemission',
-    'reemphasises',
-    'reemphasized',
     'reemployment',
-    'reemploys',
-    'reenacted',
-    'reenactments',
-    'reenan/radio',
-    'reencounter',
-    'reengine',
-    'reengineering',
-    'reent',
-    'reenters',
-    'reently',
-    'reepham',
-    'reeping',
-    'rees&ndash;mogg',
-    'rees-jones',
-    'rees-lik',
     'reesa',
-    'reestimate',
-    'reetha',
-    'reets',
-    'reev',
-    'reevacuated',
-    'reevaluates',
-    'reeve-tucker/ian',
-    'reeve/banbury',
-    'reeve/fairford',
-    'reeve/london',
-    'reeve/sandford',
-    'reeve/wallingford',
-    'reeve9',
-    'reeves/amateur',
-    'reeves/tarmac',
     'reevesii',
-    'reexamines',
-    'reexposed',
-    'reextracted',
-    'ref-17',
-    'ref-induced',
-    'ref-os',
-    'ref-raff',
-    'ref.10',
-    'ref.11',
-    'ref.12',
-    'ref.13',
-    'ref.21',
-    'ref.22',
-    'ref.26',
-    'ref.29',
     'ref.3',
-    'ref.33',
-    'ref.35',
-    'ref.38',
-    'ref.5',
-    'ref.6',
-    'ref.7',
-    'ref.9',
-    'ref.aa',
-    'ref.ab',
-    'ref.ac',
-    'ref.ad',
-    'ref.ae',
-    'ref.af',
-    'ref.ag',
-    'ref.ah',
     'ref.pre',
-    'ref.res',
-    'ref.s01',
-    'ref.s02',
-    'ref.s03',
-    'ref.s04',
-    'ref.s05',
-    'ref.s06',
-    'ref.s07',
-    'ref.s08',
-    'ref.s09',
-    'ref.s10',
-    'ref.s11',
-    'ref.s12',
-    'ref/',
-    'ref:e/3',
     'reface',
-    'refacing',
-    'refactory',
-    'refah',
-    'refamiliarising',
-    'refectance',
-    'refection',
-    'refectory\'',
-    'refectory/social',
-    'refed',
-    'refed/harvested',
-    'refelt',
-    'refence',
-    'refendaries',
-    'refenes',
-    'referant',
     'referee-like',
-    'referee-of-the-year',
-    'referee/linesmen',
-    'refereee',
-    'referees/linesman',
-    'refereez',
-    'reference&mdash;character',
-    'reference&ndash;only',
-    'reference(s)',
-    'reference-group',
-    'reference-modification',
-    'reference-point',
-    'reference-qualification',
-    'reference-qualifiers',
-    'reference-room',
-    'reference-type',
     'references/medical',
-    'referend',
-    'referendar',
-    'referendarius',
-    'referendiary',
-    'referendumdec.',
-    'referent-qualifying',
-    'referent-the',
-    'referentensystem',
-    'referentialist',
-    'refererendum',
-    'refermentation',
-    'referred-to',
-    'refertilize',
-    'referts',
-    'referundum',
     'refettled',
-    'refettorio',
-    'reffin',
-    'refflection',
-    'reffled',
-    'refigured',
-    'refiguring',
-    'refile',
-    'refiled',
-    'refillpack',
-    'refiloe',
-    'refiltered',
-    'refindings',
-    'refinement-centred',
-    'refitment',
-    'refitters',
     'reflagged',
-    'reflast',
-    'reflated',
-    'reflec&rehy;ting',
-    'reflectancy',
-    'reflectant',
-    'reflected-light',
-    'reflected-sound-as-of-underground-spirits',
-    'reflected.',
-    'reflection.',
-    'reflection/absorption',
-    'reflection/of',
-    'reflectogram',
-    'reflectograms',
-    'reflectone',
-    'reflew',
     'reflex(es)',
-    'reflex-action',
-    'reflex-controlled',
-    'reflexe',
-    'reflexing',
-    'reflexiones',
-    'reflexitive',
-    'reflexively-intended',
-    'reflexologist',
-    'reflight',
-    'reflocked',
-    'reflolux',
-    'reflood',
-    'reflooding',
-    'reflooring',
-    'reflotation',
     'reflotron',
-    'reflus',
-    'refluxogenic',
-    'refollows',
-    'refondateur',
-    'refondateurs',
-    'reford',
-    'reforged',
-    'reform&mdash;former',
-    'reform-and-investment',
-    'reform-championing',
-    'reform-orientated',
-    'reform-proof',
-    'reform-through-labour',
-    'reform.',
-    'reform.88',
     'reform.john',
-    'reform/land',
-    'reforma',
-    'reformamini',
-    'reformanda',
-    'reformata',
-    'reformate',
-    'reformatio',
-    'reformation-which',
-    'reformation/counter-reformation',
-    'reformatorische',
-    'reformats',
-    'reforme',
-    'reformer-the',
-    'reformers.',
-    'reformers.john',
     'reformers/radicals',
-    'reformi',
-    'reformings',
-    'reformist-led',
-    'reformist-minded',
-    'reforms&mdash;and',
-    'reforms/production',
-    'reformyng',
-    'refortified',
-    'refortify',
-    'refraction/wide',
-    'refractories',
-    'refractors',
-    'refrain-like',
-    'refrains.ii',
-    'refreezes',
     'refreshen',
-    'refresher/up-dating',
-    'refreshers',
-    'refreshing-looking',
-    'refreshingness',
-    'refreshment\'',
-    'refreshment-making',
-    'refreshment/poster',
-    'refreshments/meals',
-    'refrig',
-    'refriger',
-    'refriger&rehy;ator',
-    'refrigerator-sized',
-    'refrigiate',
-    'refronting',
-    'refs17,18',
     'refuellin\'',
-    'refuge-seeker',
-    'refuge-seeking',
-    'refugee-like',
-    'refugee-producing',
-    'refugees.',
-    'refugess',
-    'refulgence',
-    'refunctioning',
-    'refunctions',
-    'refund/credit',
-    'refunds/exchange',
-    'refunjol',
-    'refurb',
-    'refurbisher',
-    'refurbishers',
     'refurbishes',
-    'refurbs',
-    'refusal/phobia',
-    'refuse-dump',
-    'refuse-filled',
-    'refuse-fuelled',
-    'refuse-matter',
-    'refuse-stink',
-    'refuse/refuse',
-    'refusest',
-    'reg&lsqb;imen&rsqb;t',
-    'reg=',
-    'reg=additional',
-    'reg=independence',
-    'reg=peculiarity',
-    'reg=prerogative',
     'reg=sternness',
-    'reg=technology',
-    'regain\'',
-    'regalvanising',
-    'regan537',
-    'regani',
-    'regar',
-    'regard-less',
-    'regardes',
-    'regardez-les',
-    'regardez-vous',
-    'regardie',
-    'regardin\'',
-    'regardlessly',
-    'regardment',
-    'regardum',
     'regates',
-    'regather',
-    'regatta-',
-    'regatta.but',
-    'regazetting',
-    'regazzi',
-    'regd.',
-    'regeared',
-    'regearing',
-    'regected',
-    'regemorter',
-    'regenbogen',
-    'regencies',
-    'regency-cum-fifties',
-    'regency-style',
-    'regency-white',
     'regency/georgian',
-    'regendam',
-    'regeneration\'',
-    'regeneration.',
-    'regeneration/resurrection',
-    'regensburger',
-    'regent-birds',
-    'regerssion',
-    'regester',
-    'regetting',
-    'regga',
-    'reggae-rapper',
-    'reggae-tinged',
-    'reggaeish',
-    'reggaematic',
-    'regge',
     'reggiane',
-    'reggiano',
-    'reggie-and-anna',
-    'reggie-spotter',
-    'reggio-calabria',
-    'reggiori',
-    'regias',
-    'regicidus',
-    'regierung',
-    'regime&mdash;this',
-    'regime-switching',
-    'regime.',
-    'regime.l',
-    'regime/made',
-    'regime/you',
-    'regimefor',
     'regiment&rehy;then',
-    'regiment-in',
-    'regimentals',
-    'regimento',
-    'regimes&mdash;conventionalism',
-    'regimine',
-    'reginae',
-    'reginae-olgae',
-    'region--by',
-    'region-based',
-    'region-inspired',
-    'region-specific',
-    'region-versus-district',
-    'region.a',
-    'region.if',
-    'region.in',
     'region.its',
-    'region.officers',
-    'region/',
-    'region/country',
-    'region/nation',
-    'region/scottish',
-    'regional-level',
-    'regional-planning',
-    'regional/area',
-    'regional/divisional',
-    'regional/local',
-    'regionale',
-    'regionalisations',
-    'regionalising',
-    'regionalism.',
-    'regionalisms',
     'regionalist\'',
-    'regionalist-centraliser',
-    'regionalistic',
-    'regionality',
-    'regionalize',
-    'regionally-',
-    'regionally-planned',
-    'regionaux',
-    'regions&mdash;and',
-    'regionum',
-    'regionwide',
-    'regioselective',
-    'regir',
-    'regis/oxfordshire',
-    'registar',
-    'registaring',
     'register&mdash;contain',
-    'register&mdash;the',
-    'register*',
-    'register-based',
-    'register-clash',
-    'register-conscious',
-    'register-drift',
-    'register-keeper',
-    'register-meal',
-    'register-shifting',
-    'register-to-register',
-    'register.doc',
-    'registeration',
-    'registere',
-    'registered.',
-    'registerer',
     'registers.',
-    'registrability',
-    'registrarship',
-    'registration.',
-    'registration.a',
-    'registrationwhere',
-    'registrative',
-    'registry-office',
-    'reglamento',
-    'reglar',
-    'reglatively',
-    'reglaze',
-    'reglazes',
-    'regloved',
-    'reglue',
-    'reglued',
     'regluing',
-    'regnancy',
-    'regnans',
-    'regnard',
-    'regnbagen',
-    'regni&eacute',
-    'regny',
-    'regognised',
-    'regognises',
-    'regolini',
-    'regolith/soil',
-    'regolithic',
-    'regr',
-    'regrafting',
-    'regranting',
-    'regravelled',
     'regreened',
-    'regreg',
-    'regressionally',
-    'regressionary',
-    'regressionists',
-    'regressive-progressive',
-    'regressive.',
-    'regressiveness',
-    'regresson',
-    'regressult',
-    'regretable',
-    'regretz',
-    'regrind',
-    'regrinding',
-    'regrip',
-    'regrouper',
     'regrowth.',
-    'regs.',
-    'regsistrar',
-    'regton',
-    'regualtions',
-    'regueiro',
-    'reguera',
-    'regugees',
-    'regul',
-    'regulae',
-    'regular\'',
-    'regular-as-clockwork',
-    'regular-footer',
-    'regular-sized',
-    'regular-strength',
-    'regular.',
     'regular/reserve',
-    'regular_now',
-    'regularian',
-    'regularis',
-    'regularisations',
-    'regularises',
-    'regularizations',
-    'regularizes',
-    'regularly-attested',
-    'regularly-occurring',
-    'regularly-shaped',
-    'regularly-spaced',
-    'regularly.',
-    'regularly/',
-    'regularz',
-    'regulat',
     'regulatio',
-    'regulation\'',
-    'regulation-making',
-    'regulation.',
-    'regulation.much',
-    'regulationists-especially',
-    'regulations.if',
-    'regulations.ps',
-    'regulations.the',
-    'regulations_in_respect',
-    'regulationship',
-    'regulator(s)',
-    'regulator*',
-    'regulator-friendly',
-    'regulatory/quasi-statutory',
-    'regulatuions',
     'reguli',
-    'regulo',
-    'regur',
-    'regurgitate-arianism',
-    'regurgitations',
-    'regus',
-    'rehabilatation',
-    'rehabilitates',
-    'rehabilitation-3,500',
-    'rehabilitation-oriented',
-    'rehabilitation.',
-    'rehabilitee',
-    'rehage',
-    'rehal',
-    'reharmonisation',
-    'reharmonised',
     'reharness',
-    'rehaul',
-    'rehavia',
-    'reheal',
-    'rehearshals',
-    'rehearsin\'',
-    'reheatable',
-    'reheats',
-    'rehersal',
-    'reherse',
-    'rehersyng',
-    'rehidrat',
-    'rehierarchizing',
-    'rehire',
-    'rehm',
-    'rehoboth',
     'rehoisted',
-    'reholstered',
-    'rehomes',
-    'rehomogenised',
-    'rehooked',
-    'rehospitalisation',
-    'rehospitalization',
-    'rehumanize',
-    'rehybridised',
-    'rehybridising',
-    'rehybridization',
-    'rehydrating',
-    'reich-ish',
-    'reichean',
-    'reichenberg',
-    'reichenowi',
     'reichersburg',
-    'reichert-jung',
-    'reiches',
-    'reichf&uuml;hrer',
-    'reichhardt',
-    'reichler',
-    'reichlin',
-    'reichmarshal',
-    'reichnau',
-    'reichsbischof',
-    'reichsgericht',
-    'reichshoffen',
-    'reichsjugendgerichtsgesetz',
-    'reichsjugendwohlfahrtsgesetz',
-    'reichskammer',
-    'reichskommissar',
     'reichskommissariat',
-    'reichsleiter',
-    'reichsluftfahrtminsterium',
-    'reichsmark',
-    'reichspartei',
-    'reichsrat',
-    'reichsschulfonds',
-    'reichsstaat',
-    'reichstadt',
-    'reichswehr',
-    'reichtenberg',
-    'reid-inspired',
-    'reid/british',
-    'reid/coach',
-    'reid/defending',
-    'reid/gloucestershire',
     'reid/joint',
-    'reid/strathclyde',
-    'reidentification',
-    'reidentified',
-    'reidford',
-    'reidh',
-    'reidhachd',
-    'reidij',
-    'reids',
-    'reidswire',
-    'reidunn',
-    'reifenhauser',
-    'reifications',
-    'reifies',
-    'reigate/surrey',
-    'reigen',
     'reight',
-    'reighton',
-    'reign-in',
-    'reign.',
-    'reigned.',
-    'reignement',
-    'reignited',
-    'reigniting',
-    'reihill',
-    'reijo',
-    'reikel',
-    'reikguard',
-    'reiko',
-    'reiksland',
-    'reilly/drink-driver',
-    'reily-collins/antiques',
     'reim&rehy;bursement',
-    'reimagine',
-    'reimagined',
-    'reimbursables',
-    'reimbursal',
-    'reimbursel',
-    'reimbursement.',
-    'reimbursernent',
-    'reimbursment',
-    'reimmersion',
-    'reimmigration',
-    'reimplantation',
-    'reimplemented',
-    'reimut',
-    'rein&rehy;force',
-    'rein&rehy;forcing',
     'rein\'',
-    'reinas',
-    'reinbeck',
-    'reinbert',
-    'reinbold',
-    'reincarceration',
-    'reincarnates',
-    'reincliff',
-    'reincubated',
-    'reindeer-hunters',
-    'reindexing',
-    'reindorp',
-    'reindrop',
-    'reinducing',
-    'reindustrialization',
-    'reinerio',
     'reines',
-    'reinfarct',
-    'reinfarcts',
-    'reinfested',
-    'reinfiltrated',
-    'reinflated',
-    'reinflation',
-    'reinforce-and-stick-with-it',
-    'reinforced-concrete',
-    'reinforced-glass',
-    'reinforcement\'',
-    'reinforcement=',
-    'reinforcment',
-    'reinfused',
-    'reinhabit',
-    'reinhabited',
     'reinhardtius',
-    'reinherit',
-    'reinherited',
-    'reinhiold',
-    'reinitialize',
-    'reinject',
-    'reinjured',
-    'reinjuring',
-    'reinjury',
-    'reinnervate',
-    'reinold',
-    'reinoso',
-    'reinscribed',
-    'reinscribes',
-    'reinscribing',
-    'reinserting',
     'reinspect',
-    'reinspections',
-    'reinspired',
-    'reinstalls',
-    'reinstated.',
-    'reinstituting',
-    'reinstrom',
-    'reinsulated',
-    'reinsurances',
-    'reinsurer',
-    'reintegrates',
-    'reintensify',
-    'reinter',
-    'reinterment',
-    'reinterpretative',
-    'reinterview',
     'reinvading',
-    'reinvasion',
-    'reinve',
-    'reinventor',
-    'reinvigoration',
-    'reinvoicing',
-    'reinvoked',
-    'reinvoking',
-    'reinvolving',
-    'reis-ul-kuttab',
-    'reiselied',
-    'reisenberg',
-    'reisinger',
-    'reism',
-    'reisolated',
-    'reiten',
     'reiterations',
-    'reiterative',
-    'reiterer',
-    'reiterlied',
-    'reith/haley',
-    'reits',
-    'reitsch.she',
-    'reitzel',
-    'reitzler',
-    'reives',
-    'reivew',
-    'reizens',
-    'rejas',
-    'reje',
-    'reject&lsqb;ed&rsqb',
-    'reject-ion',
     'rejected.drawing',
-    'rejecter',
-    'rejection-slip',
-    'rejective',
-    'rejman',
-    'rejoic&rehy;ing',
-    'rejoice.',
-    'rejoicedly',
-    'rejoindered',
-    'rejoiner',
-    'rejoke',
-    'rejoyce',
-    'rejoycing',
-    'rejoycinge',
-    'rejoycings',
-    'rejt',
     'rejudge',
-    'rejudged',
-    'rejuevenation',
-    'rejuvenage',
-    'rejuvenates',
-    'rejuvenations',
-    'rejuvenatory',
-    'rejuvenescence',
-    'rekab',
-    'rekeyboarded',
-    'rekeying',
-    'rekha',
-    'rekhert/team',
-    'rekhmire',
-    'rekitted',
-    'reknotted',
     'reknown',
-    'rekomitjie',
-    'rel-ig-ious',
-    'rela1',
-    'relable',
-    'relache',
-    'relaci&oacute;n',
-    'relactation',
-    'relagated',
-    'relai',
-    'relalive',
-    'relaminarization',
-    'relapsed.',
-    'relapsers',
-    'relat',
-    'relata',
     'relatched',
-    'relatd',
-    'relatedto',
-    'relates.',
-    'relather',
-    'relati',
-    'relatif',
-    'relation-based',
-    'relational-based',
-    'relational-model',
-    'relational/object',
-    'relatione',
-    'relations-speak',
-    'relations/2',
-    'relations/forces',
-    'relations/friends',
     'relations/local',
-    'relations/women',
-    'relationship&ndash',
-    'relationship\'',
-    'relationship-based',
-    'relationship-bonding',
-    'relationship-building',
-    'relationship-challenged',
-    'relationship-metropolitan',
-    'relationships-\'thank',
-    'relative\'s/friend',
-    'relative-ly',
-    'relative-wise',
-    'relative/',
-    'relative/colleague',
-    'relative/friend',
     'relativelty',
-    'relatively&rehy;new',
-    'relatively-error-free',
-    'relatively-high',
-    'relatively-immobile',
-    'relatively-natural',
-    'relatively-open',
-    'relatively-simple',
-    'relatively_a',
-    'relativerisk',
-    'relatives.such',
-    'relativisation',
-    'relativised',
-    'relativism/behaviourism',
-    'relativizer',
-    'relativizes',
     'relatu',
-    'relaview',
-    'relaxating',
-    'relaxation/kisses/caresses/',
-    'relaxation/stress',
-    'relaxer',
-    'relaxin-softened',
-    'relay.',
-    'relayed-the',
-    'relea',
-    'releas',
-    'releasable',
-    'release.',
-    'release.adrian',
-    'release/east-west',
-    'releasin',
     'releasings',
-    'relectsproduct',
-    'releefe',
-    'relegalised',
-    'relegatio',
-    'relegation-safety',
-    'relegation.',
-    'relegations',
-    'releif',
-    'relented.kim',
-    'reler',
-    'relettering',
-    'reletting.',
-    'releuers',
-    'relevanace',
-    'relevance----------------prominence------------deviance',
     'relevance-theoretic',
-    'relevance:2',
-    'relevances',
-    'relevant\'',
-    'relevant.l',
-    'relevant/interesting',
-    'relevant/irrelevant',
-    'relevator',
-    'releveraging',
-    'relexicalized',
-    'reli',
-    'relia',
-    'reliability\'',
-    'reliablity',
-    'relibility',
-    'relic-bag',
     'relic-house',
-    'relic-labels',
-    'relicks',
-    'relicless',
-    'relict-enriched',
-    'relicti',
-    'relief&mdash;since',
-    'relief-areas',
-    'relief-bringing',
-    'relief-colouring',
-    'relief-composition',
-    'relief-decoration',
-    'relief-dependent',
-    'relief-figures',
-    'relief-kitchens',
-    'relief-like',
     'relief-managing',
-    'relief-picture',
-    'relief-pithoi',
-    'relief-slabs',
-    'relief-valve',
-    'relief/celebrations/satisfaction',
-    'relieffund',
-    'relieft',
-    'relievedly',
-    'religated',
-    'relighted',
-    'relights',
-    'religi&oacute;n',
-    'religio-aesthetic',
-    'religio-political',
-    'religion&gt',
     'religion\'',
-    'religion-85%',
-    'religion-97%',
-    'religion-based',
-    'religion-in-negative',
-    'religion-tolerating',
-    'religion-watch',
-    'religion.24',
-    'religion:christianity',
-    'religione',
-    'religiosa',
-    'religiosi',
-    'religiosis',
-    'religious-fascist',
-    'religious-kind',
-    'religious-minded',
     'religious-nationalism',
-    'religious.',
-    'religious/ethnic',
-    'religious/humanitarian',
-    'religious/ideological',
-    'religious/moral',
-    'religious/municipal',
-    'religious/racial',
-    'religiousae',
-    'religiously-divided',
-    'religiously-guarded',
-    'religous',
-    'reline',
-    'relink',
-    'relinoing',
-    'reliquefied',
     'reliqui',
-    'reliquiae',
-    'reliquum',
-    'relise',
-    'relisys',
-    'relitigation',
-    'reljef',
-    'rellenas',
-    'rellford',
-    'rellum',
-    'relo',
-    'relocatable',
-    'relocatees',
-    'relocation/redundancy',
-    'relocators',
-    'relock',
     'relocking',
-    'relodged',
-    'relogio',
-    'relston',
-    'relton',
-    'reluctant-to-move',
-    'reluctantly-shared',
-    'reluktetle',
-    'relumed',
-    'relyin\'',
-    'relypck',
-    'rem-awakening',
-    'rem-oved',
-    'remaaamber',
-    'remachining',
-    'remaded',
     'remain\'',
-    'remain/',
-    'remainder-about',
-    'remainder-man',
-    'remainderman',
-    'remaine',
-    'remaineder',
-    'remainer',
-    'remaines',
-    'remaineth',
-    'remainings',
-    'remains-upright-in-a-force-9-mixed-metaphor',
-    'remakrs',
-    'reman',
-    'remanding',
-    'remands.',
     'remanences',
-    'remans',
-    'remanufactures',
-    'remanufacturing',
-    'remarkable-looking',
-    'remarkable.',
-    'remarkable1,000',
-    'remarkably-featured',
-    'remarkably-thorough',
-    'remarked.',
-    'remarketers',
-    'remarks-',
-    'remarks.a',
-    'remarriage&mdash;one',
-    'remaster',
-    'remastered/repackaged',
     'rematerialised',
-    'remaynid',
-    'remayning',
-    'rembering',
-    'rembrandtesque',
-    'rembrandtsplein',
-    'remeasure',
-    'remeasuring',
-    'remec',
-    'remedial/',
-    'remediating',
-    'remedie',
-    'remedies&mdash;eg',
-    'remedies&mdash;for',
-    'remedies-oriented',
-    'remedies.',
     'remedies.most',
-    'remedy&mdash;as',
-    'remek',
-    'remel',
-    'remeliik',
-    'rememb\'red',
-    'remember\'d/my',
-    'remember-',
-    'remember-as',
-    'remember-not',
-    'remember-or',
-    'remember.',
-    'remember_so',
-    'rememberd',
-    'remembered\'',
-    'remembered-anticipated',
     'remembered-captain',
-    'remembered-in',
-    'remembereth',
-    'remembering/thinking',
-    'remembers-this',
-    'remembre',
-    'remembred',
-    'remembryng',
-    'rememeber',
-    'rememembered',
-    'remenisce',
-    'remerchandising',
-    'remercie',
-    'remes',
-    'remet',
-    'remetalling',
     'remia',
-    'remians',
-    'remigo',
-    'remijio',
-    'remilien',
-    'remilitarization',
-    'remilitarize',
-    'remincent',
-    'remind-her',
-    'remineralization',
-    'remington-harts',
-    'remingtons',
-    'remisa',
-    'remiscent',
-    'remission/',
-    'remission/mildly',
     'remitz',
-    'remmers',
-    'remmonds',
-    'remmy',
-    'remnimbi',
-    'remobilisation',
-    'remobilized',
-    'remobilizing',
-    'remodernised',
-    'remoisten',
-    'remoisturiser',
-    'remond',
-    'remondino',
-    'remonsta',
-    'remonstrants',
-    'remonstrated.',
     'remonstrates',
-    'remonstrative',
-    'remonstrators',
-    'remora',
-    'remorsely',
-    'remortgagors',
-    'remote-area',
-    'remote-node',
-    'remote-sounding',
-    'remote-working',
-    'remotely-seated',
-    'remotist',
-    'remotivating',
-    'remotivation',
-    'remotored',
-    'remouslins',
     'remov&rehy;ing',
-    'remov\'d',
-    'removable-base',
-    'removables',
-    'removal-from-play',
-    'removal-van',
-    'remove-me',
-    'removed-them',
-    'removed/reduced',
-    'remoyely',
-    'rempstone',
-    'rempstones',
-    'rempstons',
-    'remu',
-    'remues-toi',
-    'remuneraphobia',
     'remunerates',
-    'remuneration&mdash;for',
-    'remuneration.',
-    'remunerative/calculative',
-    'remuster',
-    'remyca',
-    'remyelinate',
-    'remyelination',
-    'remythologization',
-    'rena/glasgow',
-    'renacres',
-    'renaissance-in-disneyland',
-    'renaissances',
-    'renal-artery',
-    'renal-replacement',
-    'renal-vein',
     'renalcid',
-    'renaming&gt',
-    'renamo-controlled',
-    'renas',
-    'renascence',
-    'renascences',
-    'renationalised',
-    'renationalize',
-    'renationalized',
-    'renaturability',
-    'renaturalized',
-    'renault-engined',
-    'renault-mitsubishi-volvo',
-    'renault/',
-    'renavigate',
-    'renbad',
     'renbourn/isaac',
-    'rench',
-    'rencher',
-    'rencontre',
-    'rencontres',
-    'rencoule',
-    'renda',
-    'rendait',
-    'rendal',
-    'rended',
-    'rendells',
-    'rendeo',
-    'render-clad',
-    'rendered-visible',
-    'renderers',
-    'rendezous',
     'rendille',
-    'rendingly',
-    'rendings',
-    'rendl',
-    'rendleman',
-    'rendre',
-    'rends',
-    'renee/ward',
-    'reneer',
-    'renegeing',
-    'renegotiable',
-    'renegotiation-proof',
-    'renegotiation-proofness',
-    'renegued',
-    'reneguing',
-    'renenutet',
     'renette',
-    'renew&rehy;ed',
-    'renew/join',
-    'renewable.',
-    'renewal/variation',
-    'renewalist',
-    'renewest',
-    'renfeur/perinatal',
-    'renfree',
-    'renfrew-based',
-    'renga',
-    'rengasdenglok',
-    'renhold',
-    'renicola',
-    'renier',
-    'renihan',
     'renin&ndash;angiotensin',
-    'renish',
-    'renishaws',
-    'renison',
-    'renitelo',
-    'renkou',
-    'rennand',
-    'rennard',
-    'rennells',
-    'rennen',
-    'renner-teller',
-    'rennes-le-',
-    'renneu',
-    'rennie/herdsman',
-    'rennie/mother',
-    'rennilson',
     'rennith',
-    'rennoldson',
-    'renntiger',
-    'renomm&eacute;es',
-    'renormalisation',
-    'renounceable',
-    'renouncements',
-    'renouvellement',
-    'renovaci&ograve;n',
-    'renquin',
-    'rensberg',
-    'rensch',
-    'renschler',
-    'renseigenment',
-    'renshall',
-    'renshenfengwangjiang',
     'rensner',
-    'rent&mdash;i',
-    'rent&rehy;collector',
-    'rent&rehy;reduction',
-    'rent-a-baggy',
-    'rent-a-beating',
-    'rent-a-cause',
-    'rent-a-coach',
-    'rent-a-guard',
-    'rent-a-hoot',
-    'rent-a-mobs',
-    'rent-a-plot',
-    'rent-a-principle',
-    'rent-a-rant',
-    'rent-a-role',
-    'rent-a-room',
     'rent-a-speech',
-    'rent-a-womb',
-    'rent-back',
-    'rent-book',
-    'rent-charges',
-    'rent-collection',
-    'rent-control',
-    'rent-controlled',
-    'rent-income',
-    'rent-pooling',
-    'rent-raising',
-    'rent-reduced',
-    'rent-roll',
-    'rent-subsidy',
-    'rent/i',
-    'rentacar',
     'rentacrates',
-    'rentaf',
-    'rentafone',
-    'rentalles',
-    'rentco',
-    'rentenmark',
-    'renter&iacute;a',
-    'renter-warden',
-    'renters.',
-    'rentfree',
-    'rentin\'',
-    'rentmeister',
-    'rentokilonians',
-    'rentree',
-    'rents-thus',
-    'rentzler',
     'renumeration',
-    'renunciatory',
-    'renurturing',
-    'renwicks',
-    'reny',
-    'renzhi',
-    'renzio',
-    'reoccupying',
-    'reoccurred',
-    'reoccurrences',
-    'reoccurs',
-    'reoch',
-    'reocrders',
-    'reoffenders',
-    'reofos',
-    'reoganisation',
     'reogard',
-    'reohorn',
-    'reole',
-    'reologi',
-    'reon',
-    'reopposed',
-    'reoprts',
-    'reoptimise',
-    'reor',
-    'reordained',
-    'reorders',
-    'reorganisational',
-    'reorganizes',
-    'reorgansises',
-    'reorgnisation',
-    'reovers',
     'reoviridae',
-    'rep&rehy;resentatives',
-    'rep-commissioned',
-    'repackagings',
-    'repaid.',
-    'repaint.',
-    'repaints',
-    'repair\'',
-    'repair-dog',
-    'repair-man',
-    'repair-sealants',
-    'repair-work',
-    'repair/hardware',
-    'repair/replacement',
-    'repairer/dealer',
-    'repairs&mdash;outside',
     'repairs&mdash;repainting',
-    'repairs&mdash;the',
-    'repairs.',
-    'repairs/maintenance',
-    'repairsing',
-    'repairyard',
-    'repandent',
-    'repandu',
-    'repapered',
-    'reparatione',
-    'reparked',
-    'repartitional',
-    'repartitioned',
-    'repartitioning',
-    'reparto',
-    'repassage',
     'repassed',
-    'repatriaci&oacute;n',
-    'repatriators',
-    'repatterning',
-    'repave',
-    'repavement',
-    'repay&rehy;ment',
-    'repayers',
-    'repb',
-    'repco',
-    'repcon',
-    'repealable',
-    'repeale',
-    'repealers-\'a',
-    'repealers-occupied',
-    'repealling',
     'repeat-action',
-    'repeat-call',
-    'repeat-recording',
-    'repeat-use',
-    'repeatable-random',
-    'repeatedly-promised',
-    'repeatedness',
-    'repeating.the',
-    'repechages',
-    'repect',
-    'repected',
-    'repects',
-    'reped',
-    'repellancy',
-    'repelled.',
-    'repellence',
     'repellently',
-    'repeller',
-    'repells',
-    'repentantly',
-    'repenthouse',
-    'repentina',
-    'repeopled',
-    'repeopling',
-    'repere',
-    'reperformed',
-    'reperforms',
-    'reperfuse',
-    'repermed',
-    'repertorial',
-    'repertorio',
-    'repertorium',
     'repertory-book',
-    'repesent',
-    'repesents',
-    'repet',
-    'repetiteur',
-    'repetiteurs',
-    'repetition.',
-    'repetition/synonym',
-    'repetitive.the',
-    'repetitive/unstable',
-    'repetitive/variative',
-    'repetivity',
-    'repetoire',
-    'repforce',
-    'rephaims',
-    'rephlex',
     'rephotograph',
-    'rephotographed',
-    'rephotographic',
-    'rephotography',
-    'repide',
-    'repierced',
-    'repila',
-    'repined',
-    'repinned',
-    'repitch',
-    'repition',
-    'repitition',
-    'replace&rehy;ment',
-    'replacement/competitor',
-    'replacemnet',
-    'replacer',
     'replacing/recruiting',
-    'replacinng',
-    'replai',
-    'replasement',
-    'replat',
-    'replated',
-    'replated.',
-    'replating.',
-    'replayers',
-    'replead',
-    'repleat',
-    'repleate',
-    'replens',
-    'repletion',
-    'replevy',
-    'repli',
     'replica-gun',
-    'replica/copy',
-    'replicant/android',
-    'replicar',
-    'replicated_on',
-    'replicator/vehicle',
-    'replied.',
-    'replin',
-    'replot',
-    'reployment',
-    'replublic',
-    'replug',
-    'replumbed',
-    'reply\'ing',
-    'reply-paid-envelope',
-    'replyed',
     'repo-man',
-    'repocketed',
-    'repoen',
-    'repoint',
-    'repolarising',
-    'repolish',
-    'repolishing',
-    'repoliticised',
-    'repoliticized',
-    'repolluted',
-    'repoman',
-    'repomen',
-    'reponing',
-    'reponses',
-    'reponsiveness',
-    'repopulating',
     'reporeted',
-    'report(1974)',
-    'report(s)',
-    'report-and-election',
-    'report-backs',
-    'report-generation',
-    'report.that',
-    'report.these',
-    'report.toil/flexitime',
-    'report/2',
-    'report/annual',
-    'report/opinion',
-    'report0',
-    'report3',
-    'reportacknowledges',
-    'reportage-type',
     'reportat',
-    'reportback',
-    'reported*',
-    'reported-stolen',
-    'reported-upon',
-    'reported=31%',
-    'reported=35%',
-    'reportees',
-    'reporter-cyclist',
-    'reporter-the',
-    'reporters_fed',
-    'reportin\'',
-    'reporting-back',
-    'reporting.',
-    'reporting/investigative',
-    'reporting/recovery',
     'reportings',
-    'reportline',
-    'reports\'',
-    'reports/comfort',
-    'reports/comments',
-    'reports/software',
-    'reports/write',
-    'reportst',
-    'reportws29',
-    'reportws39',
-    'reporty',
-    'reposant',
-    'repose-figures',
-    'repose-statue',
-    'reposessions',
-    'reposibility',
     'repositionings',
-    'repositions',
-    'repository--strongly',
-    'reposo',
-    'repossesed',
-    'repossesions',
-    'repossessed.',
-    'repossessionary',
-    'reposssession',
-    'reposteria',
-    'repousse',
-    'repowder',
-    'repowered',
-    'repped',
-    'reppin',
-    'repping',
     'repr&eacute;sentative',
-    'repre&rehy;sentative',
-    'repre&rehy;senting',
-    'reprecipitation',
-    'reprehensibility',
-    'reprehension',
-    'reprentation',
-    'reprentatives',
-    'repres&rehy;sion',
-    'represe',
-    'represen',
-    'represen&rehy;tative',
-    'represencing',
-    'represent&lsqb;ed&rsqb',
-    'represent&rehy;ing',
-    'represent-ation',
     'representaci&oacute;n',
-    'representaion',
-    'representation&mdash;the',
-    'representation.',
-    'representation/control/delegated',
-    'representationalism',
-    'representations.',
-    'representative\'',
-    'representative(s)',
-    'representatives/freelance',
-    'representativity',
-    'represented_by',
-    'represented_in',
-    'representer',
-    'representitive',
-    'representive',
     'representor',
-    'represents.',
-    'repressa',
-    'repressed.',
-    'repressed/',
-    'repressionists',
-    'repressynge',
-    'repretitive',
-    'repricated',
-    'reprioritised',
-    'reprioritising',
-    'reprioritizing',
-    'repristination',
-    'reprivatisation',
-    'reprivatization',
-    'reprivatize',
     'repro-antique',
-    'repro-brain',
-    'repro-icons',
-    'reproachfully.',
-    'reprobe',
-    'reprobing',
-    'reprocedures',
-    'reprocesses',
-    'reprocessor',
-    'reprod',
-    'reprodu',
-    'reproduc',
-    'reproduc&rehy;tive',
-    'reproducability',
-    'reproduced.',
-    'reproduct',
     'reproduction-enabling',
-    'reproduction/appropriation',
-    'reproduction/non-reproduction',
-    'reproductional',
-    'reproductivization',
-    'reproduzierbarkeit',
-    'reprofile',
-    'reprofiling',
-    'reprogrammability',
-    'reprographicated',
-    'reprojected',
-    'reproofed',
-    'reprotsentr',
-    'reprovation',
-    'reprovisioning',
-    'reprsents',
     'repsch/author',
-    'repse',
-    'repsearch',
-    'repsiratory',
-    'repsonsible',
-    'reptate',
-    'reptations',
-    'reptilarium',
-    'reptile\'',
-    'reptile-bird',
-    'reptile-fancying',
-    'reptile-like',
-    'reptiles.',
-    'reptilian-like',
-    'reptilians',
-    'reptitive',
     'repubblica-',
-    'repubblicana',
-    'republi',
-    'republic&mdash;in',
-    'republic-czechoslovak',
-    'republic-republican',
-    'republic-sadr',
-    'republic.the',
-    'republicaine',
-    'republicains',
-    'republican-conservative',
-    'republican-radical',
-    'republican-roman',
-    'republicana-partido',
-    'republicanised',
-    'republicanism.',
     'republicano',
-    'republicans.',
-    'republick',
-    'republics*',
-    'republics-are',
-    'republikana',
-    'repuckering',
-    'repude',
-    'repulicans',
-    'repuls',
-    'repulsive-looking',
-    'repulsiveness',
-    'repurchasing',
-    'repurcusions',
-    'reputability',
-    'reputation-making',
     'reputation-type',
-    'reputationmaking',
-    'reputing',
-    'req-sou-of',
-    'reqest',
-    'reqid',
-    'reqruitment',
-    'requalified',
-    'requena',
-    'requent',
-    'request-response',
-    'request/command',
-    'requestor',
-    'requestors',
-    'requests.',
-    'requests/commands',
     'requests/demands',
-    'requests/instructions',
-    'requet&eacute;s',
-    'requi',
-    'requiao',
-    'requieing',
-    'requiem/vaughan',
-    'requiert',
-    'require&rehy;ment',
-    'required&mdash',
-    'required.20',
-    'required/produced',
-    'required/sought',
-    'required_in_favour',
-    'requiredas',
-    'requirement.',
     'requirements.these',
-    'requirements/considerations',
-    'requirements/provisions',
-    'requirers',
-    'requires&mdash',
-    'requires-access-to&lsqb;graphics',
-    'requisition&mdash',
-    'requital',
-    'requitall',
-    'requiting',
-    'requred',
-    'requrested',
-    'requring',
-    'reradiates',
-    'reran',
-    'reranking',
     'rereaders',
-    'rereads',
-    'rerecording',
-    'reredorter',
-    'reredoses',
-    'reregister',
-    'rerehearsals',
-    'reresby',
-    'reresentatives',
-    'rerivet',
-    'reroofed',
-    'reroutes',
-    'resa',
-    'resacralize',
-    'resale-price',
-    'resalve',
     'resang',
-    'resartus',
-    'resat',
-    'resaved',
-    'rescan',
-    'rescher',
-    'reschooling',
-    'rescinds',
-    'rescobie',
-    'rescore',
-    'rescored',
-    'rescoring',
-    'rescorla-wagner',
-    'rescous',
-    'rescrambled',
-    'rescratching',
     'rescrawling',
-    'rescreened',
-    'rescreening',
-    'rescrewed',
-    'rescribed',
-    'rescripted',
-    'rescuable',
-    'rescucitated',
-    'rescue-party',
-    'rescue-squad',
-    'rescuee',
-    'rescuemasters',
-    'rescues/property',
-    'rescure',
-    'rescuscitation',
-    'reseach',
     'reseals',
-    'resear',
-    'research\'',
-    'research--hence',
-    'research-findings',
-    'research-funding',
-    'research-orientated',
-    'research-programme',
-    'research-publications',
-    'research-related',
-    'research-scale',
-    'research-terms',
-    'research.1',
-    'research.there',
-    'research/administrative',
-    'research/evaluation',
     'research/innovative',
-    'research/library',
-    'research/monitoring',
-    'research/teaching',
-    'researchable',
-    'researche',
-    'researcher-cosmonaut',
-    'researchers.',
-    'researchers.clearly',
-    'researchers/',
-    'researchers/consultants',
-    'researchers/scope',
-    'researchline',
-    'reseater',
-    'reseaux',
-    'resect',
     'resecting',
-    'resecton',
-    'resecured',
-    'resedimented',
-    'reseeds',
-    'resegh',
-    'resegmentation',
-    'resellable',
-    'reseller-led',
-    'reseller/licencees',
-    'resemboing',
-    'resemnbles',
-    'resent.my',
-    'resent/disapprove',
-    'resentenced',
-    'resentin\'',
     'resentment.',
-    'resequence',
-    'reserued',
-    'reservando',
-    'reservas',
-    'reservation(s)',
-    'reservation-breaking',
-    'reservation.',
-    'reservations245',
-    'reservatus',
-    'reserve&lsqb;d&rsqb',
-    'reserve-officers',
-    'reserve-type',
-    'reserve.',
-    'reservedness',
-    'reservendo',
     'reserveth',
-    'reservior',
-    'reserviour',
-    'reservoir-owner',
-    'reservoir.',
-    'reservoired',
-    'reservoirwith',
-    'resesarch',
-    'resesh',
-    'reset-all',
-    'resettable',
-    'resettles',
-    'resferve',
-    'reshaken',
-    'resharpenable',
-    'resharpening',
     'resheath',
-    'resheathed',
-    'resheduling',
-    'reshelving',
-    'reshnetikova',
-    'reshod',
-    'reshowing',
-    'reshown',
-    'reshuffle.',
-    'resi&rehy;dence',
-    'residence&mdash;i',
-    'residence&rehy;i',
-    'residence-based',
-    'residence-cum-bunker',
-    'residence-pattern',
-    'residence.',
     'residence/occupation',
-    'residencia',
-    'resident-designer',
-    'resident-free',
-    'resident-related',
-    'resident-superior',
-    'residential-apartment',
-    'residential-based',
-    'residential-mortgage',
-    'residentiaries',
-    'residents-often',
-    'residents-run',
-    'residents.a',
-    'residents/community',
-    'residenzmuseum',
-    'residenztheater',
     'resider',
-    'residual-heat',
-    'residual-should',
-    'residualisation',
-    'residualized',
-    'residue(s)',
-    'residue-after-evaporation',
-    'resighted',
-    'resignation.',
-    'resigned-servant',
-    'resilence',
-    'resilient-looking',
-    'resilite',
-    'resin\'',
-    'resin-bonded',
-    'resin-filled',
     'resin-laced',
-    'resin-miscible',
-    'resin-reinforced',
-    'resin-rubber',
-    'resin/',
-    'resin/hardener',
-    'resin/timber',
-    'resinarius',
-    'resined',
-    'resinoids',
-    'resinously',
-    'resipol',
-    'resist-coated',
-    'resistance-capacitance',
-    'resistance-inducing',
-    'resistance-run',
     'resistance-trained',
-    'resistance/capacity',
-    'resistant-reader',
-    'resistate',
-    'resistates',
-    'resistenza',
-    'resistin\'',
-    'resisting.',
-    'resistively',
-    'resituated',
-    'resituating',
-    'reskinning',
-    'resliced',
-    'resmin',
-    'resnik',
-    'reso&rehy;nance',
     'reso1ution',
-    'resoaked',
-    'resocialization',
-    'resoftened',
-    'resola',
-    'resolubilised',
-    'resolubility',
-    'resolubilized',
-    'resoluble',
-    'resoluion',
-    'resolut',
-    'resolutes',
-    'resolution(s)',
-    'resolution-independent',
-    'resolution/completion',
-    'resolve.',
     'reson',
-    'resonance-enhancement',
-    'resonance-free',
-    'resonations',
-    'resonator-based',
-    'resonse',
-    'resonsible',
-    'resonying',
-    'resophonic',
-    'resophonics',
-    'resor',
-    'resorbed',
-    'resore',
-    'resort&ndash;victoria',
-    'resort\'',
-    'resort-wear',
     'resort.',
-    'resort/hotel',
-    'resorta',
-    'resorte',
-    'resotrative',
-    'resouces',
-    'resoun',
-    'resoundedly',
-    'resource-allocator',
-    'resource-constrained',
-    'resource-controlling',
-    'resource-endowed',
-    'resource-exchange',
-    'resource-generating',
-    'resource-hungry',
-    'resource-led',
     'resource-misallocating',
-    'resource-poor',
-    'resource-processing',
-    'resource-rationing',
-    'resource-saving',
-    'resource-sharing',
-    'resource.based',
-    'resources-led',
-    'resources.this',
-    'resources/time',
-    'resources_on',
-    'resown',
-    'resp-onse',
-    'respeak',
-    'respecifies',
-    'respeck',
     'respect&rehy;ful',
-    'respect&rehy;fully',
-    'respect\'',
-    'respect-is-due',
-    'respect.143',
-    'respect/though',
-    'respectabilize',
-    'respectable-like',
-    'respectable.',
-    'respectable/unrespectable',
-    'respectably-dressed',
-    'respected.',
-    'respectively&mdash;the',
-    'respectively.10',
-    'respectively.7',
-    'respects-',
     'respekt',
-    'resperine',
-    'respirability',
-    'respirate',
-    'respiration-weight',
-    'respirator-then',
-    'respires',
-    'respironics',
-    'respited',
-    'respiting',
-    'resplandores',
-    'resplendence',
-    'respliced',
-    'respo',
-    'responce',
-    'responded.',
     'responibility',
-    'responisbility',
-    'respons',
-    'responsability',
-    'responsaries',
-    'response(s)',
-    'response-ability',
-    'response-correlated',
-    'response-modelling',
-    'response-patterns',
-    'response-signalling',
-    'response-testing',
-    'response/turnaround',
-    'responseand',
-    'responsed',
-    'responsesto',
     'responseto',
-    'responsi&rehy;bilities',
-    'responsibilioty',
-    'responsibility\'',
-    'responsibility-centres',
-    'responsibility-promotion',
-    'responsibility.55',
-    'responsibility/claims/co-ordinated',
-    'responsible-looking',
-    'responsible.the',
-    'responsiblebecause',
-    'responsibleness',
-    'responsibliities',
-    'responsioble',
-    'responsive\'',
-    'responsoria',
     'responsorially',
-    'resposi',
-    'respro',
-    'resprout',
-    'resprouts',
-    'resque',
-    'resreves',
-    'ress.',
-    'ressano',
-    'resserection',
-    'resses',
-    'ressiter',
-    'ressorto',
-    'ressortprinzip',
-    'ressources',
-    'resspppectt',
     'rest-breaks',
-    'rest-camp',
-    'rest-harrow',
-    'rest-home',
-    'rest-house.',
-    'rest-of-the-worl=',
-    'rest-paregoric',
-    'rest-periods',
-    'rest-spot',
-    'rest-station',
-    'rest-stop',
-    'rest-type',
-    'rest/sleep',
-    'restabilisation',
-    'restabilise',
-    'restabilization',
     'restaffed',
-    'restain',
-    'restaked',
-    'restance',
-    'restand',
-    'restandardised',
-    'restarants',
-    'restaur',
-    'restaurant-',
-    'restaurant-cum-souvenir-shop',
-    'restaurant-goers',
-    'restaurant-it',
-    'restaurant-program',
-    'restaurant-reporting',
-    'restaurant-starved',
-    'restaurant-style',
     'restaurant/bistro',
-    'restaurant/cafe/teashop',
-    'restaurant/dining',
-    'restaurant/learned',
-    'restauranteur',
-    'restaurants.',
-    'restaurateuse',
-    'restauration',
-    'restaureant',
-    'restenosis',
-    'restent',
-    'restes',
-    'restful.',
-    'restfully',
-    'resthouse',
-    'resticking',
     'restiffening',
-    'restimulated',
-    'restin\'',
-    'resting&rehy;place',
-    'resting-places',
-    'resting-rooms',
-    'restinga',
-    'restirring',
-    'restituas',
-    'restitude',
-    'restituere',
-    'restituted',
-    'restitutional',
-    'restless.',
-    'restmor',
-    'resto&rehy;ration',
     'restoered',
-    'restoke',
-    'restorat',
-    'restoration-unification',
-    'restoration.',
-    'restorationists',
-    'restore/verify',
-    'restoreth',
-    'restorff-like',
-    'restoring/to',
-    'restrainingly',
-    'restraint-of-trade',
-    'restraint.',
-    'restraint_on_the_part',
-    'restreint',
-    'restreinte',
     'restreints',
-    'restress',
-    'restressed',
-    'restretch',
-    'restric',
-    'restricta',
-    'restrictase',
-    'restricted-access',
-    'restricted-voting',
-    'restricters',
-    'restrictions/lack',
-    'restrictionsled',
-    'restrictionssimilar',
-    'restrictive-trade-practices',
-    'restrictive.',
-    'restrictive/non-restrictive',
     'restricturing',
-    'restrike',
-    'restrospective',
-    'restructuration',
-    'restructuring\'',
-    'restructuring/democratising',
-    'restructurings.',
-    'restsrict',
-    'restsurant',
-    'restuarant',
-    'restucturing',
-    'restudied',
-    'restudies',
-    'restuffed',
-    'resu',
-    'resubmissions',
     'resubscription',
-    'resuiting',
-    'resul-allah',
-    'result\'',
-    'result-wise',
-    'result.',
-    'result.woods',
-    'result/and',
-    'resultants',
-    'resultativity',
-    'resulting-from',
-    'resultless',
-    'results&mdash',
-    'results-based',
-    'results-proven',
-    'results-seen',
     'results.judgement',
-    'results.ps',
-    'results/comments',
-    'results/form',
-    'results/limited',
-    'results/scores',
-    'results/stats',
-    'resultsconfirm',
-    'resumees',
-    'resumetalks',
-    'resumix',
-    'resump',
-    'resumptions',
-    'resupplemented',
-    'resurection',
-    'resurfacings',
     'resurfance',
-    'resurgam',
-    'resurgance',
-    'resurge',
-    'resurgences',
-    'resurrecta',
-    'resurrectio',
-    'resurrection/life',
-    'resurrectionist',
-    'resurrexit',
-    'resurveying',
-    'resuscitates',
-    'resuscitator',
-    'resussitated',
-    'resutl',
-    'resvrrection',
     'reswear',
-    'resynchronization',
-    'resystance',
-    'reszeter',
-    'reszo',
-    'ret.',
-    'ret/dis',
-    'ret01\'',
-    'reta',
-    'retaa',
-    'retabled',
-    'retackle',
-    'retail-',
-    'retail-finance',
-    'retail-industry',
-    'retail-price',
     'retail-sales',
-    'retail/service',
-    'retail/wholesale',
-    'retailable',
-    'retailer-distributor',
-    'retailer-led',
-    'retailer/s',
-    'retailer/staff',
-    'retailer/supplier',
-    'retailor',
-    'retain.',
-    'retaining-wall',
-    'retaker',
-    'retaliate\'',
-    'retaliate.',
-    'retarait',
     'retardataire',
-    'retardates',
-    'retardation.the',
-    'retarded.son',
-    'retardmac',
-    'retardment',
-    'retarget',
-    'retargeting',
-    'retarmacked',
-    'retb',
-    'retches',
-    'retd.',
-    'retel',
-    'retellings',
-    'retenant',
-    'retend',
     'retender',
-    'retentis',
-    'retentivity',
-    'retentum',
-    'reterrage',
-    'retextured',
-    'reteyned',
-    'rethatched',
-    'rethel',
-    'rethickens',
-    'rethreaded',
-    'rethunk',
-    'retiarius',
-    'reticula',
-    'reticularis',
-    'reticulatum',
     'reticulatus',
-    'reticulo-endothelial',
-    'reticulocytes',
-    'reticuloendothelia',
-    'retile',
-    'retime',
-    'retimed',
-    'retina-pattern',
-    'retinaculum',
-    'retinaed',
-    'retinalis',
-    'retino-cortical',
-    'retinophathy',
-    'retinoscopy',
-    'retinotopic',
-    'retinovascular',
     'retinulae',
-    'retir&eacute;e',
-    'retire&rehy;ment',
-    'retired/resigned',
-    'retiredf',
-    'retiredness',
-    'retirement\'',
-    'retirement-ages',
-    'retirement-idleness',
-    'retirement.and',
-    'retirement.below',
-    'retiring-places',
-    'retitle',
-    'retitling',
-    'reto',
-    'retoned',
     'retooled',
-    'retools',
-    'retorno',
-    'retortaeformis',
-    'retouches',
-    'retouchings',
-    'retr',
-    'retrack',
-    'retracked',
-    'retract-',
-    'retracted.',
-    'retractive',
-    'retrained.',
-    'retrainer',
-    'retranchement',
-    'retransfer',
     'retransferring',
-    'retransformation',
-    'retransformed',
-    'retransfusion',
-    'retranslating',
-    'retransmits',
-    'retransplantation',
-    'retreads',
-    'retreatant',
-    'retreatants',
-    'retreatist',
-    'retreatments',
-    'retreats:balmoral',
-    'retributions',
-    'retricting',
-    'retries',
     'retrieval/dispatch',
-    'retrieve-based',
-    'retrieved.',
-    'retro-active',
-    'retro-actively',
-    'retro-classic',
-    'retro-fitted',
-    'retro-frenzy',
-    'retro-funk-by-numbers',
-    'retro-head',
-    'retro-kitsch',
-    'retro-mobile',
-    'retro-nuevo',
-    'retro-numbered',
-    'retro-rockets',
-    'retro-rolling',
     'retro-spi-ra-lis',
-    'retro-style',
-    'retro-styling',
-    'retro-vision',
-    'retro-wave',
-    'retrobolt',
-    'retrobolted',
-    'retroceded',
-    'retrocon',
-    'retroconverted',
-    'retrodict',
-    'retrodictive',
-    'retroduction',
-    'retrofitted',
-    'retroflexion',
-    'retrogradation',
     'retrogradely',
-    'retrogress',
-    'retrogressed',
-    'retroposition',
-    'retroscendent',
-    'retroscender',
-    'retroscrubbers',
-    'retrospections',
-    'retrospectivity',
-    'retrospectroscope',
-    'retrotransposon-like',
-    'retrotransposons',
-    'retrouss&eacute',
-    'retroussee',
-    'retrouv&eacute;e',
-    'retrouve',
     'retroversion',
-    'retrovirus-associated',
-    'retsky',
-    'rettendon',
-    'rettner',
-    'retube',
-    'retubing',
-    'return-by',
-    'return-of-waste',
-    'return-on-investment',
-    'return-to-hegel',
-    'return-to-history',
-    'return-to-learn',
-    'return-to-marx',
-    'return-to-marxism',
-    'return-to-marxists',
     'return-to-products',
-    'return-to-rant',
-    'return-to-sender',
-    'return.susanna',
-    'return/double',
-    'return/new-line/enter',
-    'return/profit',
-    'returne',
-    'returned&mdash;except',
-    'returned.he',
-    'returnes',
-    'returneth',
-    'returning-your-call',
-    'returnings',
-    'returns/attributes',
-    'retyring',
     'retzlaf',
-    'reuan',
-    'reuberwerk',
-    'reuction',
-    'reudel',
-    'reueale',
-    'reuel',
-    'reuil',
-    'reuleaux',
-    'reults',
-    'reumann',
-    'reunderstood',
-    'reunifying',
-    'reunis',
-    'reuo',
-    'reuoke',
     'reupholstered',
-    'reurque',
-    'reuseable',
-    'reussir',
-    'reutterische',
-    'rev\'renc',
-    'rev-limiter',
-    'rev-up',
-    'rev/high',
-    'rev/min',
-    'rev/trem',
-    'revaccinated',
-    'revaccination',
-    'revah',
-    'revalidate',
-    'revalidates',
     'revalorise',
-    'revalorization',
-    'revaluation-based',
-    'revaluations/devaluations',
-    'revalues',
-    'revalve',
-    'revan-powered',
-    'revankar',
-    'revar',
-    'revarnish',
-    'revarnished',
-    'revaulted',
-    'revava',
-    'revco',
-    'revcovering',
-    'reveal&lsqb;ed&rsqb',
     'reveal(s)',
-    'revealing.',
-    'revealings',
-    'reveals/conceals',
-    'revectoring',
-    'revegetate',
-    'reveiw',
-    'reveiwed',
-    'reveiwing',
-    'reveiws',
-    'revelaaaaations',
-    'revelaciun',
-    'revelaed',
-    'revelant',
-    'revelation/s',
-    'revelational',
     'revelationary',
-    'revelealed',
-    'reveley-peter',
-    'revelie',
-    'revell-ations',
-    'revell/british',
-    'revenge-crazed',
-    'revenging',
-    'revenna',
-    'revenue-',
-    'revenue-allocation',
-    'revenue-attracting',
-    'revenue-collecting',
-    'revenue-intensive',
-    'revenue-raisers',
-    'revenue-starved',
     'revenue-yielding',
-    'revenue/operating',
-    'revenus',
-    'reverb-drenched',
-    'reverb/delay',
-    'reverberance',
-    'reverberation-free',
-    'reverbrocket',
-    'reverencing',
-    'reverend-like.',
-    'reverend-who',
-    'reverent-openness-before-life',
-    'reverified',
-    'reveron',
-    'reverred',
-    'reverse-abseiling',
     'reverse-battery',
-    'reverse-body',
-    'reverse-charge',
-    'reverse-crawl',
-    'reverse-discourse',
-    'reverse-engineered',
-    'reverse-facing',
-    'reverse-flip',
-    'reverse-gearing',
-    'reverse-l',
-    'reverse-mutation',
-    'reverse-pivots',
-    'reverse-pulley',
-    'reverse-s',
-    'reverse-stick',
-    'reverse-transcriptase',
     'reverse/forward',
-    'reversed-field',
-    'reversed-s',
-    'reverseflow',
-    'reversely-magnetized',
-    'reversings',
-    'reversive',
-    'revertendi',
-    'reverter',
-    'reverteris',
-    'revetted',
-    'reveunes',
-    'reveur',
-    'revictual',
-    'revictualling',
-    'revierwing',
     'revies',
-    'review--see',
-    'review-article',
-    'review-book',
-    'review/',
-    'review/practitioner',
-    'review/recall',
-    'review/upgrading',
-    'reviewed/american',
-    'reviewed_as',
-    'reviewers\'superlatives',
-    'reviewing.',
-    'reviewsws24-26',
-    'reviewsws27',
-    'reviewsws31',
-    'reviler',
     'revilla',
-    'revillagigedo',
-    'reville',
-    'revilo',
-    'reving',
-    'revington',
-    'revise.the',
-    'revision\'',
-    'revision.',
-    'revisionism\'',
-    'revisit\'st',
-    'revisualising',
-    'revitalise.',
-    'revitalisers',
-    'revitalizer',
-    'revitalizes',
     'revitt',
-    'revival\'',
-    'revival.',
-    'reviviscent',
-    'revlon-smeared',
-    'revmlvpol',
-    'revnell',
-    'revneue',
-    'revocably',
-    'revoch',
-    'revoe',
-    'revoicing',
-    'revol&rehy;utions',
-    'revol.',
-    'revolationized',
-    'revollo',
     'revolt\'',
-    'revolt.',
-    'revoltaire',
-    'revolte',
-    'revolu&rehy;tionaries',
-    'revolu-tionary',
-    'revolucion&aacute;rio',
-    'revolusi',
-    'revoluta',
-    'revolute',
-    'revolutei',
-    'revolutiion',
-    'revolution&rehy;then',
-    'revolution--from',
-    'revolution-although',
-    'revolution-principles',
     'revolution-that-might-have-been',
-    'revolution-the',
-    'revolution-unir',
-    'revolution.they',
-    'revolution/',
-    'revolutionaires',
-    'revolutionary-soviet',
-    'revolutioners',
-    'revolutionist',
-    'revolutionnaire-cdr',
-    'revolutionnaires',
-    'revolutionry',
-    'revolutum',
-    'revolv',
-    'revolving-door',
-    'revs-fall',
     'revs/minute',
-    'revtech',
-    'revue-style',
-    'revulsions',
-    'revved-up',
-    'revvolution',
-    'revvy',
-    'rewang',
-    'reward&rehy;based',
-    'reward-based',
-    'reward-for-getting-it-right/patience-not-punishment-for-getting-it-wrong',
-    'reward-givers',
-    'reward-seeking',
-    'reward-type',
-    'reward/',
-    'reward/payment',
     'reward/sanction',
-    'rewardable',
-    'rewarde',
-    'rewarded.',
-    'rewardedness',
-    'rewarder',
-    'rewards-based',
-    'rewarming',
-    'rewasan',
-    'rewatered',
-    'rewaxed',
-    'rewe-zentralfinanz',
-    'rewelded',
-    'rewell',
-    'rewin',
-    'rewove',
     'rewrap',
-    'rewraps',
-    'rex/olympia',
-    'rexamine',
-    'rexed',
-    'rexham',
-    'rexine-covered',
-    'rexit',
-    'rexol\'rian',
-    'rextar',
-    'rexton',
-    'reya',
-    'reydon',
-    'reye-like',
-    'reyeconomy',
-    'reyes-martinez',
     'reyker',
-    'reykjahli&dstrok;3',
-    'reykjanes',
-    'reykyav&iacute;k',
-    'reylon',
-    'reymers',
-    'reynards',
-    'reynault',
-    'reynette-james',
-    'reyni&egrave;re',
-    'reyniel',
-    'reyniers',
-    'reynisdrangar',
-    'reynithe',
-    'reyno',
-    'reynolds/boom',
     'reynolds/dorothy',
-    'reynolds/eyewitness',
-    'reynolds/nimbus',
-    'reynolds/stringer',
-    'reynolds/thames',
-    'reynolds/wheelchair',
-    'reynoldson',
-    'reynosa',
-    'reynoso',
-    'reynwell',
-    'reynwells',
-    'reyrolle',
-    'reys',
-    'reysbye',
-    'reyu',
-    'rezadeiras',
     'rezal',
-    'rezdore',
-    'rezende',
-    'rezika',
-    'reznek',
-    'reznicek',
-    'rezoned',
-    'rezs&ouml',
-    'rezsoe',
-    'rezvani',
-    'rezzag',
-    'rezzak',
-    'rf-4s',
-    'rf-500',
-    'rf-84f',
-    'rf-out',
     'rf-x',
-    'rf/00/23/2138',
-    'rf/00/23/2149',
-    'rf/00/23/2151',
-    'rf/00/23/2152',
-    'rf/00/23/2190',
-    'rf/00/23/2201',
-    'rf/00/23/2208',
-    'rf/00/23/2226',
-    'rf/00/23/2237',
-    'rf/00/23/2244',
-    'rf/00/23/2263',
-    'rf/00/23/2266',
-    'rf/00/23/2269',
-    'rf/00/23/2278',
-    'rf/00/23/2282',
     'rf/00/23/2294',
-    'rf/00/23/2298',
-    'rf/00/23/2305',
-    'rf/00/23/2348',
-    'rf/00/23/2350',
-    'rf/00/23/2370',
-    'rf/00/23/2374',
-    'rf/00/23/2377',
-    'rf/00/23/2382',
-    'rf/00/23/2387',
-    'rf/00/23/2389',
-    'rf/00/23/2398',
-    'rf/00/23/2409',
-    'rf/00/23/2412',
-    'rf/00/23/2420',
-    'rf/00/23/2424',
     'rf/00/23/2441',
-    'rf/00/24/2015',
-    'rf100,000',
-    'rf14,190,000',
-    'rf14,320,000',
-    'rf180,700,000',
-    'rf2',
-    'rf26,000',
-    'rf290',
-    'rf3&verbar&verbar;ra7&verbar&verbar',
-    'rf30,000,000',
-    'rf32',
-    'rf37,810,000',
-    'rf4+',
-    'rf40,960',
-    'rf41.4',
     'rf5',
-    'rf5,500',
-    'rf6+',
-    'rf6oor',
-    'rf8-f6',
-    'rfac',
-    'rfereee',
-    'rff',
-    'rfff',
-    'rfgs',
-    'rfi-immunity',
-    'rflv',
-    'rfmc',
-    'rfo',
-    'rfrom',
-    'rfts',
     'rfvi',
-    'rfx',
-    'rg-540',
-    'rg-550',
-    'rg-560',
-    'rg-58/50ohm',
-    'rg-750',
-    'rg.',
-    'rg/00/22/2002',
-    'rg/00/22/2005-1',
-    'rg/00/23/2117',
-    'rg/00/23/2121',
-    'rg/00/23/2122',
-    'rg/00/23/2159',
-    'rg/00/23/2163',
-    'rg/00/23/2197',
     'rg/00/23/2211',
-    'rg/00/23/2220',
-    'rg/00/23/2229',
-    'rg/00/23/2239',
-    'rg/00/23/2247',
-    'rg/00/23/2252',
-    'rg/00/23/2254',
-    'rg/00/23/2259',
-    'rg/00/23/2265',
-    'rg/00/23/2267',
-    'rg/00/23/2269',
-    'rg/00/23/2270',
-    'rg/00/23/2280',
-    'rg/00/23/2290',
-    'rg/00/23/2291',
-    'rg/00/23/2296',
     'rg/00/23/2299',
-    'rg/00/23/2300',
-    'rg/00/23/2307',
-    'rg/00/23/2309',
-    'rg/00/23/2311',
-    'rg/00/23/2323',
-    'rg/00/23/2328',
-    'rg/00/23/2334',
-    'rg/00/23/2343',
-    'rg/00/23/2344',
-    'rg/00/23/2345',
-    'rg/00/23/2347',
-    'rg/00/23/2350',
-    'rg/00/23/2353',
-    'rg/00/23/2354',
-    'rg/00/23/2374',
     'rg/00/23/2393',
-    'rg/00/23/2396',
-    'rg/00/23/2442',
-    'rg/00/23/2457',
-    'rg/00/23/2458',
-    'rg/00/24/2039',
-    'rg/393',
-    'rg10',
-    'rg12',
-    'rg124fp',
-    'rg13',
-    'rg24',
-    'rg3',
-    'rg3&verbar&verbar;resigns',
-    'rg4/1550',
-    'rg440',
     'rg560',
-    'rg570',
-    'rg6',
-    'rg7',
-    'rg8',
-    'rg9/453',
-    'rganised',
-    'rgb=',
-    'rgd-containing',
-    'rgdata',
-    'rgh',
-    'rgm/tnb',
-    'rgns',
-    'rgo',
-    'rgp160',
-    'rgrg',
     'rgrp',
-    'rgv250',
-    'rgv25o',
-    'rgx612a',
-    'rgxes',
-    'rgz',
-    'rh&circ;one',
-    'rh&eacute',
-    'rh&ycirc;s',
-    'rh-4',
-    'rh/00/22/2001',
-    'rh/00/23/2006',
-    'rh/00/23/2031',
-    'rh/00/23/2032',
-    'rh/00/23/2058',
-    'rh/00/23/2059',
     'rh/00/23/2063',
-    'rh/00/23/2064',
-    'rh/00/23/2070',
-    'rh/00/23/2071',
-    'rh/00/23/2073',
-    'rh/00/23/2079',
-    'rh/00/23/2082',
-    'rh1&plus',
-    'rh11',
-    'rh191xa',
-    'rh20',
-    'rh3&verbar&verbar;bf6&verbar&verbar',
-    'rh5',
-    'rh8',
-    'rha/office',
-    'rhabditoidea',
     'rhabditoids',
-    'rhabdomys',
-    'rhabdopleurid',
-    'rhacodes',
-    'rhacomitrium',
-    'rhadamanthus',
-    'rhade',
-    'rhadley',
-    'rhaeadr',
-    'rhaeder',
-    'rhaedr',
-    'rhaetavicula',
-    'rhaetian/liassic',
-    'rhaetic',
-    'rhagades',
-    'rhagionid',
     'rhagoletis',
-    'rhaid',
-    'rhamnoides',
-    'rhamnousian',
-    'rhamnus',
-    'rhamphocorys',
-    'rhandirmwyn',
-    'rhangabe',
-    'rhapsodic/iterative',
-    'rhapsodically',
-    'rhapsodize',
-    'rhapsodizes',
-    'rhapsodizing',
-    'rharmous',
-    'rhedae',
-    'rhegium',
     'rheidh',
-    'rheilffordd',
-    'rhein-main',
-    'rhein-ruhr',
-    'rheindhalen',
-    'rheingasse',
-    'rheingrill',
-    'rheinhold',
-    'rheinholds',
-    'rheinhotel',
-    'rheinisch-westfalisches',
-    'rheinische',
-    'rheinisches',
-    'rheinl&auml;nde',
-    'rheinlande',
-    'rheinmuhle',
     'rheinsberg',
-    'rheinstadion',
-    'rheintainer',
-    'rheinwein\'',
-    'rheld',
-    'rhema',
-    'rheni',
-    'rhenium-osmium',
-    'rheno-hercynian',
-    'rheno-lombardic',
-    'rheobatrachus',
-    'rheola',
-    'rheologically',
-    'rheomacrodex',
-    'rheophytic',
-    'rheticus',
     'rhetoric-reality',
-    'rhetorical-lyrical',
-    'rhetoricals',
-    'rhetorick',
-    'rhetorique',
-    'rheuma',
-    'rheumatoid-arthritis',
-    'rheumy-eyed',
-    'rheydt',
-    'rhf',
-    'rhia',
-    'rhiain',
-    'rhidian',
-    'rhie',
-    'rhigian',
-    'rhime',
     'rhinadin',
-    'rhinal',
-    'rhincalanus',
-    'rhincres',
-    'rhincrew',
-    'rhine-',
-    'rhine-rhone',
-    'rhine-westfalia',
-    'rhine-westphalia.',
-    'rhinefield',
-    'rhinelanders',
-    'rhinelands',
-    'rhineloricaria',
-    'rhinestone-clad',
-    'rhinestone-dotted',
-    'rhiniog',
     'rhinns.',
-    'rhino&rehy;viruses',
-    'rhino-hide',
-    'rhino-horn',
-    'rhinoceros-horn',
-    'rhinoceros-like',
-    'rhinocr&eacute;taire',
-    'rhinoderma',
-    'rhinohorn',
-    'rhinolophid',
-    'rhinopharynx',
-    'rhinoplasty',
-    'rhinotracheitis',
-    'rhionna',
-    'rhipsalis',
-    'rhiw-calch',
     'rhiwargor',
-    'rhizoctonia',
-    'rhizoids',
-    'rhizomania',
-    'rhizomatous',
-    'rhizomorphs',
-    'rhizopod',
-    'rhizosolenid',
-    'rhizosphere',
-    'rhizosphere/soil',
-    'rhkaaf',
-    'rho&amp;sup1',
-    'rho&amp;sup2',
-    'rho&amp;sup3',
-    'rho=',
-    'rho=-0.52(p=0.04)',
     'rho=-0.85',
-    'rho=0.45',
-    'rhoadesi',
-    'rhoaes',
-    'rhodactis',
-    'rhodamine-conjugated',
-    'rhodamine-labelled',
-    'rhodes-based',
-    'rhodes/city',
-    'rhodes/universities',
-    'rhodesia/',
-    'rhodeus',
-    'rhodfa\'r',
-    'rhodians',
-    'rhodicare',
-    'rhodie',
     'rhodochiton',
-    'rhodococcus',
-    'rhododendons',
-    'rhododendron-canopied',
-    'rhodomonas',
-    'rhodomontade',
-    'rhodopseudomonas',
-    'rhodopsin-dg',
-    'rhodospirillium',
-    'rhodostethia',
-    'rhodyn',
-    'rhoes',
-    'rhoeume',
-    'rholes',
-    'rhomb',
-    'rhombocorniculids',
     'rhombohedra',
-    'rhombohedral',
-    'rhombophyllum',
-    'rhombopteryx',
-    'rhombos',
-    'rhomer',
-    'rhon',
-    'rhonchi',
-    'rhonealpes',
-    'rhonwy',
-    'rhoode',
-    'rhoplex',
-    'rhos-mynach',
-    'rhos-y-',
-    'rhosbadrig',
-    'rhoscolyn',
     'rhosesmor',
-    'rhosgadfan',
-    'rhosgogh',
-    'rhosneigr',
-    'rhosneigr&amp;district',
-    'rhostyllen',
-    'rhosymedre',
-    'rhosytyllen',
-    'rhoval/modal',
-    'rhovyl',
-    'rhq',
-    'rhsa',
-    'rhsl',
-    'rhuaival',
-    'rhubarb-like',
-    'rhubarb-red',
     'rhubarbed',
-    'rhufoniog',
-    'rhuman',
-    'rhumbatron',
-    'rhur',
-    'rhustoxicodendron',
-    'rhuys',
-    'rhwngddwyryd',
-    'rhy',
-    'rhyacophila',
-    'rhyd-ddu&rehy;porthmadog',
-    'rhyd-dhu',
-    'rhyd-y-car',
-    'rhyd-y-ceirw',
-    'rhyd-y-meinciau',
-    'rhydtalog',
     'rhydwen',
-    'rhyme-',
-    'rhyme-principle',
-    'rhyme-scheme',
-    'rhyme-words',
-    'rhymer.',
-    'rhymes/puns',
-    'rhymester',
-    'rhymin\'',
-    'rhyming-slang',
-    'rhymni',
-    'rhymster',
-    'rhynchocoel',
-    'rhynchonellid',
-    'rhynchonellids',
-    'rhynchops',
     'rhynchosaurus',
-    'rhynchosia',
-    'rhynchospora',
-    'rhyncosaur',
-    'rhynd',
-    'rhyne',
-    'rhynes',
-    'rhythm\'n\'blues',
-    'rhythm-and-blues',
-    'rhythm-changes',
-    'rhythm-guitar',
-    'rhythm-ites',
-    'rhythm.bob',
-    'rhythm/',
-    'rhythm/accompaniment',
-    'rhythm/solo',
     'rhythme',
-    'rhythmes',
-    'rhythmic-harmonic',
-    'rhythmic/harmonic',
-    'rhythmicities',
-    'rhythmites',
-    'rhythmless',
-    'rhythms.',
-    'rhythmscape',
-    'rhytidiadelphus',
-    'rhytym',
-    'ri&mdash',
-    'ri&oacute',
-    'ri-bhi',
-    'ri-fang',
-    'ri/',
     'riaan',
-    'riabead',
-    'riabhachan',
-    'riach',
-    'riada',
-    'riaf',
-    'riagama',
-    'rialas',
-    'rials=0.461',
-    'rialtos',
-    'riannes',
-    'riano',
-    'riant',
-    'riartes',
-    'rias/burrell',
-    'riasat',
     'riazanov',
-    'riazor',
-    'rib-crushing',
-    'rib-free',
-    'rib-hugging',
-    'rib-protector',
-    'rib-revealing',
-    'rib-splintering',
-    'rib-splitting',
-    'rib-tingling',
-    'rib-tip',
-    'rib-vaulted',
-    'rib.',
-    'riba/arcuk',
-    'riba/bit',
-    'riba/building',
     'riba/rias/rsua/aca',
-    'ribaldries',
-    'ribanszki',
-    'ribaris',
-    'ribat',
-    'ribaud',
-    'ribaus',
-    'ribavirin',
-    'ribbands',
-    'ribbeck',
-    'ribbed-silk',
-    'ribbentripe',
-    'ribber-carrying',
-    'ribbesford',
-    'ribbins',
-    'ribbon-bound',
     'ribbon-helix-helix',
-    'ribbon-lace',
-    'ribbon-making',
-    'ribbon-patterned',
-    'ribbon-seal',
-    'ribbon-tied',
-    'ribbon-wearing',
-    'ribby',
-    'ribcrack',
-    'ribe/roander',
-    'ribeirao',
-    'ribelli',
-    'ribena-like',
-    'ribero',
-    'ribhi',
-    'ribigill',
     'ribman',
-    'ribonucleoprotein',
-    'ribopattern',
-    'ribose-phosphate',
-    'ribosome&middot;mrna&middot;peptidyl-trna',
-    'ribosyl',
-    'ribosylpurine',
-    'ribosyltransferase',
-    'ribotype',
-    'ribotypes',
-    'riboud',
-    'ribs.',
-    'ribsgy',
-    'ribstone',
-    'ribticklers',
-    'ribtickling',
     'ribvaulted',
-    'ric-rac',
-    'ricaldoni',
-    'rican-nicaraguan',
-    'ricardo-campbell',
-    'ricardou-dominated',
-    'ricards',
+)
+
+blocks_59 = (
+    '($page\'+/tewkesbury$$burg$!e%(ll(1975)\'/-sly/first-time\'!s$&i-line%"er$#mly$!o%$lphs&!y%\'m-donor)!t',
+    '\'&sample(%titch&6isation/stratification\'#zes&)ly-chosen))differing))scattered*\'elected%"ri$&sworth$"y\'##een##fon#"ga%$mati',
+    '$$e(s)%*-extension&$land%%/fiat&#new%,=10&ndash;47%"el%&finder)#ing%&master&#ore%(r-guided\'#led&#ing&"s.',
+    '\'!1\'#hip%"s.$#gas$!i%"er%"la%$ness$#ley$#oli%"ni%0on&ndash;bangkok.%pagan(.rehy;singapore\'&-based',
+    '$#zen#\'iditine$#ero$"ya#!j$#ana$#eet&"va%!n$"it&!h&&sinhji#,k-and-filers%(defining%(financed',
+    '%\'ordered%(smelling&(pecified%$test&#his%%xerox$+/associated$#est$(in-hurst$!l%#ed.$%s-but$!u#$moor#%nulph',
+    '#\'sackers\'#in\'\'"ly$%combe$#kar$%ohoff%)m/english&$able&"e\'\'%-kuti#%tanen(&(ssdp)$%erish$\'hambhor$%idine',
+    '%$pole%"si$.zen/somerville&!r#!u$(lf&ndash#$wick"*o&uacute;l#.-wickremasingh#"ds#"go#\'lecular##tma"(p\'n\'roll*#ers',
+    '$$like$(stations&$yled$#tap&$stic%#ype$(vocalist$%weary#%/slow#!a$#cki$"na%"ea$!x#\'e-alarm',
+    '$,.allegations$&/their$":a$$able$+r/part-time#!g#3ha&eacute;l-leygues%)el/balzac%"ll%#nel$"el%!s$"ia%#des$#off',
+    '#)id-access($tion&(breeding&#eye&#fit\'&lowing&&growth&)migration&(response&\'scoring&(turnover%"as%,ly-conducted()declining*\'pleting',
+    '(*escalating(-grow&rehy;ing(\'varying%(response%&strike$\'er-slim&"ed%!t$#nam%!o$2st-gaybashing-scum\'\'lenient##lin#%nouil#(oport_et',
+    '%!e%%llers\'#ing%$r/dj$%horst$$isms$%oport%%rtage\'!s$(rochment$!y#%stone#$tore%!u$$ured',
+    '"%quets$"in"\'ratonga#\'e-breed%-earth-element%&groove%\'in-eire%$rage%\'vintage$%apple$$bits$!e$(factions%!y&#ing',
+    '\'%heard\')performed((ractised\'#run\'+seen-before\'$used&!/$)r-nesting##fer#"gh#&ifying$!n$$ores$%ssima##oia',
+    '#\'uaruaha#!x""s-$!1$&boring$)dependent#\'algethi$\'manjari$#nte$$yana#%cahan%%litie(!y&"ls%$rell',
+    '$#ism#"ed$#ing$$mble$#nna##gdp$"tp#%hbass$$dall$"ed$!i%&deiyeh&#iya%)onability%"ra',
+    '$#pal#"im%!i##jid#"ka$,olnikov-type+!/##man&$jari$%usson#"or#,p&rehy;berry$"as$/berries&mdash;i(&y-fool',
+    '*&shaped*+to-beetroot$#ily%!n%#son$%utins#$quin#$sass$$ella%&mbleur$!i$\'tanovka#$tall$#eau%#lli',
+    '\'$mask\'\'scanned&-/ascii/vector&"ed&#ise(#ing\'"ze(#ing$%hriya$"ko$%ricke%"on"#t\'s%\'-nested&$tail',
+    '##(s)#!-$)1-derived%&/c-myc%!j$&arsed.$$bite%$oars&"dy&"th$&chewed$)droppings$&filled&"nk%#orm',
+    '$\'haunted$%level%#ike$$maze%"en$%packs%#its%%oison$&racing%%idden%#uns$%tails&(t-tat-ta+!s+#ted',
+    '%&hrower%$raps%#ype#%again$!k%#in\'$!m$!n%!a&#rak%!y$$rsed$$seed$&vennie#%belly',
+    '%,et&mdash;the\'+/percussion\'!t\'!y%"is$-liffe-on-soar)-/manufacturer#%e-56%%%aided%\'cappers\'"rd&)ollection&&utting%+determining%(equation',
+    '%,in-the-pound\'\'clusive\'(vestment%%nairu%)of-climb.(\'descent&,r-tax-payers%$paid\'#yer%)receiving%\'setting&!o&+ubsequently\'\'pported$%/1000',
+    '%$poll$"0%$%:room$$flow$+payer-based$(s-having&)of-change%%/poll&$rent&\'service#$face$#ish##gut##had%!r',
+    '%"un$$drum$"en&#raw%&r-than&\'strasse$#gar%"eb$#ier%(ndranath$%keele%%irani$&liners$#man\'!n',
+    '%#ell$"or%"ur$"us#0ifie&lsqb;d&rsqb$#ken%"on$#ner%#gen&"s.%#off$+o-recording%(=1.6:1.0\'#015\'#620',
+    '&#667&#7.0%#_so%#ing%\'n-cards\'&ridden\')strengths&$able\'/l&ndash;emotive(*-deductive)(economic)(planning)0semiotic-orderly)+utilitarian(,/analytical/',
+    '()isations.*#ers*"me*\'tically)0ty/irrationality)-za&rehy;tions(*ly-ordered&#ers\'!s&#in\'&*s/chemical%\'therapy$#tes##jen#$less',
+    '$#ing##man$#eat#"na%!m%(sambhara%$yake$.er/businessman&#ing#$oath#$pack#(s\'-tails$)-in-mazes%%tails$"ey',
+    '$&iraka.$"on$&tomach#&t-rokk$%/walk$(anakoset$"ee&!n\'!s%%nburg)!y*(/vehicle%"rs$$iken$*l&rehy;ing',
+    '\'%snake\'$trap&$/emi&%bones&%d-off&&snake\'$"on$&rapped&(y-taylor$"ue&!s$+y/organiser##ure$)shinskaya#%vick.',
+    '$%eburg%!l%!r"%uball$\'itschek#"ch%\'-kallat%"er$"on%.us/embarrassed&!x$!s#\'donikis$$sepp#!e',
+    '##hen%!r#$land$$inus#)ma-repola#&nchily\'"ng$!o#$raje$"is#$shan#"ta$6enstrauch-joest-museum$*hfeldarson#3ville&rehy;la-place',
+    '"%v-ner#$alli$$nels#"co##den#\'e-dance%(friendly%$goer%(oriented%#pop%%speak$&alonga$$beek$#ish$)l/debussy',
+    '%$ling%#rig%!s$!m$&n-dark\'$rawn%$dale%"el%%hurst%$ous.%"s.&$berg\'%ourne\'#ury&&cliffe',
+    ')#ig.&&knowle&#pur&#tor$"ra&!t%"ii$#sby$#tch%"te##ier$$gote$!k$!l$\'ne-wire',
+    '%#gly$(oli-like$#raj$&shable&#ers\'!s%$sent&#ime$*taillement*"ur#%lunda#!n$!i$!o%\'praviye',
+    '$$skov##ony#%volse",w&rehy;boned#!\'#&-arsed$%edged$,flesh-eating$(handedly$(knuckled$&limbed%&ooking$&nerved$%onion#&/crime',
+    '$!l%$indi$"nd$!s##den#!e$!r$!s#%ified$"sh#(k\'n\'rawl(#oll#"l.$\'e/fayre\'\'estival',
+    '$0ingson/collector&"na&.son/headmaster*&parcel*$slad$$ston#%marsh#"ni#\'p-based%$like#!s$"en$(on/pilot$%thorn%$orne',
+    '"\'xco/uis"%y-fin\'#ned$#see#)/debating$&former#"ak#&banned$"ee$%oulds$$rick%#ock#"ca#$ford##gun',
+    '#3leigh-b&eacute;nard$$iegh#(mond/hot($rain\'"in\'!o#"na$,es/solicitor$$well#)on/cotton%#ism%$nent%!s#"s.$"en',
+    '#,theon-cossor##ure#$vern"$zack$,fimahatratra&$tumb$$masy&$tazz$(nabahiny$"vi$!z#%borov##dow#"ek#$mara',
+    '#)or-backed\'%laded&\'creased&$fish&$keen&+sharp-teeth(&rapnel\'$trop($yled&+threatening&(wielding%$back&%lades%(fingered%$head',
+    '&"sh%%ready%$scar&$harp%$wing##uki$%mikhm%%ovsky$$vaev#-vedyvatelnoye$.ivayushchiisya#"za%\'mattazz$%berry$"ed',
+    '$)le-dazzle&&dazzle$!y!"b-#*associated#%doped#\'radiant$&elated"".1$"08$!a"!/#*00/22/0012)$2003,!5',
+    ',!8\'&3/0061,!7)$2013+"68,!9+"81*#107,!8+"24+"31,!2,!7+"48,!9',
+    ',!1,!2,!5,!6,!7,!9+"63,!4,!6,!8+"71,!4,!8,!9+"81',
+    ',!5,!9+"94,!7*#200,!2+"11,!8+"21,!7+"31,!4,!6\'&4/2015+"20',
+    ',!3#"sr"(00232234"!1"\'211-524""67"!7"!8"4g&mdash;1/supervisor*,2/supervisor#+/supervisor#\'e-owned%(specific""l2#"ws',
+    '"#ocs""s.#%1,000%#900$%0,000$"10$&31,000$%8,500#%2,000$"00&$,000$%5,000%%0,157$%6,663$%7,000',
+    '%%6,820#%3,000%#400$%1,000$%5,000#"40%$,300$%8,200%!0#+500-a-month$%4,000$%8,100#"60$%1,000$!5',
+    '#&71,000$%2,000$%8,000#%8,200$!0#&96,563"#upc"!x#$-550#"es!\'c&amp;w(&-built""-5"!."+/00/22/2005',
+    ')$2053*#136+"74,!7,!8,!9+"81*#200,!1+"13,!7+"27,!9+"35+"43',
+    ',!4+"75+"84,!9+"96*#311+"21,!3,!4,!5,!6,!7,!8+"31,!9',
+    ',!1,!2+"59+"64,!7,!8+"89+"92,!3,!8,!9*#400,!3+"26+"32',
+    '+"41+"52,!8+"70,!6\'&4/2003+"16#"ns""1+"$210s#!7""55"$6280""78#!9',
+    '"\'a/novus#!m",b-government""cc#!s""d-$%965bx#&fyyyrm""fp""hd#!m#!s""m.""nf"&ording',
+    '#!v"#vma"#xd5""yc!*d&ndash;10"+/00/22/0003\'&3/2053*#152+"70,!1,!8+"80,!1,!9+"94',
+    '*#211,!7+"22,!6+"33,!7+"40,!1+"52,!4,!5,!7,!8+"75,!7',
+    '+"82,!9+"92*#301,!7+"12+"35,!8,!9+"46,!8\'&4/2008,!9+"12$)1/23/0039',
+    '"D1&verbar&verbar;ke8&verbar&verbar;29#%4/box"$300s"#427"C6&verbar&verbar;c5&verbar&verbar;31"!7#!7$#162"!8#$7947""91#"50"/b&mdash;msg.doc#%/open#7i&dollar;inst&mdash;acc',
+    '$!.%"aa&!b&!c&!d%#bat%#pre%#res%#s01\'!2\'!3"!d#&/c/160"%f-rtf"!k',
+    '#!e#/s&mdash;msg.doc"!n#\'a-based"!o"%s-tmc#!.""te#!h"&uction!*e&iacute;n#+mdash;gauge),organisation#%ndash();evaluate',
+    ')\'seeding*"on)#use#0rehy;acquainting))llocation)%ppear."ed+$lied+%raise)\'rranged)(ssembled/#ing(#bed)\'oarding((colonize',
+    '+*structions)\'yclable(\'defined*(signated)\'irected*(scovered*%vorce)#rew((erection)&xports+\'ression()formation+*tification)\'uelling(\'glazing',
+    ')\'mported)&nstall/#ing+\'urances*(troduced)\'terated($mark(*negotiated((occupied)%ffend.#ing)+rganisation*\'ientate0#ion()partition',
+    ')&ossess))ub-licans*(rchasing((register)&oofing(*scheduling*#ued),ourcefulness)%tored)\'urfaced(&tained*$pped)$reat(+unification(+verberating',
+    '(\'working"$\'bel#%durat"$-201#&absorb)#ing)!s(%ption$%ccess&)ommodated&)umulating\'$stom%)etylation%)knowledge%*quaintance',
+    '\'#ire*!d%!t&\'ivating$)daptation(#ion%\'justing)!s%(missions%%vance*!s&&ertise,$ment&#ise$(ffiliate',
+    '$)ggregated$$imed$(lighting\'&nments%)locations\'%tment$$mend(#ing%+munitioning$%ngled%\'imating%(nexation(#ing&)ouncement%&swered',
+    '&%oints&\'raisals*!e+!d\'&entice$#rms%)raignment\'$nges&&ested.%&texing$%scent%(semblage\'%rtion&)imilating-"on',
+    '&(ociation&$umes\'&ringly$)ttach-see)#ing)$ment(#ked&$empt\'&ndance&(ribution$)uthorised$+vailability*"le$&warded(#ing',
+    '%!g%+lkanisation%&ndaged%&ptised%&rtlett%#sed&#ing$&edded.%#gun%"nd$#ids%%nding*!s$$leed%#ock',
+    '%"il%%oking*!s&"ts%"re\'!d&%rowed%#und%!x$$rick&$dled&"ef$%udget%$ffed%&ndling',
+    '&!y%"ys#\'cabling%(lculated,!s+#ion&(ibrating&$ling%,pitalisation1!s+"ze-!d&#ped&&turing%&rpeted',
+    '%)tegorised$%ement%)ntralised,#ing+#zed(#ing%+rtification$*hannelling*!s&(rgeables)!s$)irculates+#ing,"on%&vilise',
+    '\'$ding&*rification%#ean%&icking%$othe$#oat%$cked%"de&#ing%\'gnition%"il\'"ed%&lonize\'%uring%\'mbining',
+    '+!s\'(issioned-#ing(!t\'\'unicate&&piling\'$osed%\'nceived((ntration&&dition,#ers&(figuring("rm*!s&\'necting',
+    '\'\'ecrated\'\'idering\'&titute(\'ructing\'%ulted&$tact*"ed((mination&\'version)$ting\'\'ictions%"ol&%pered%&ppiced&!y',
+    '%%rking%%sting%&unting+!s&(perating%&verall$\'redited%&ossing%.ucified-again\'%)ystallise$&urrent$(ycleable#$date\'!d$$ealt',
+    '%$fect&(initions%\'legated&$iver*"ed*#ing%-mocratization%&pleted\'"oy)"ed)#ing&\'osition*!s%\'scribed+!s',
+    '%+termination+!e$&igging%)mensioned%*scountable+#ing(#ver&(solution)"ve&/tribu&rehy;tive+#tes,#ing-"ve%$vide$%onned',
+    '%%eamed&"ss("ed(#ing%#ill("ed$"ub%!g#,eastablished$%choes$\'ditions%\'ucative$\'mbodied)$ment-!s',
+    '%#its\'$ting%)phasizing&(owerment$\'naction(&ments.&#mel)$ling%%coded\'(untering&$rypt%(doscoped\'%wment&#ure%(ergising',
+    '*#ing%)forcement.!s*!s%)gagements&$ined(#ing&%raved%&hanced%)lightened\'&stment%&riched&$oled($ment%&trance',
+    '(!p$-pithelialised$%quips$%rect.(#ing%%upted$\'stimate+!s$&tching$(valuates&\'porated%#oke&#lve$+xaminations\'(nination',
+    '&%reted%%ecute%%hibit*"ed%$pand)"ed)#ing&&lained\'#ode)#ing("re&&orters\'$sing%&tended\'(riorizes',
+    '#(fastened$"ed%"lt\'#ing$$ight&$ures(#ing%"le%"re\'!d%#xed$&lagged(#ing%\'etching%#oat',
+    '&&tation%#ued\'#ing$(ocussing%%lding%\'recasts&$ging&&mating)#ted\'&ulated+$ions%(undation("ed$&raming&(nchising',
+    '%#ied\'$ndly&\'gerated$*urbishment#$gain%$ther)"ed$(enerated&!s$%ilded$&lossed$$rade(!d\'#ing\'%uated',
+    '&%phing%&eeting&!w%&inding(!s&!p\'$ping%\'oupings\'#ted&$wing\'!s#&habbed&)ilitation/!.%\'llowing',
+    '&$ging%"ul$&eating%-gelianization$%iring$%oming$(umanised$(ydration#$iced$\'magined)!g%&burses%%merse)#ion%%peril',
+    '\'%ement,#ing,!s&#ort$!n%-&rehy;vesting%)augurated%%burse%(carnated&*orporating%&dexing&,ustrializing%$fect)"ed\'\'station',
+    '&(orcement*!r%$hale%(itialize)"te*#ion%\'jectors%&quired%\'serting)!s&$pect*#ing\'$ired&)tallation()ted&ndash',
+    '*!s\'%itute+#ing\'$ruct))mentation&%urers(#ing%)tegrating\'!r(\'vention)$iews&&onated&\'ubation%$vade\'$sion',
+    '.#ons&)igorating&%oiced\'"ke\'$lved*$ment$(solation,!s$(terating*"on##jig&$gled&!s%#nks##key',
+    '$#nit%#own#)labelling%$pped%!u&%nches%!x%#yed&#ing&#out&!s$#ean&#sed%*galization*"ed',
+    '%&ttered$(icensing%#fed%$gare&%hting%#ned%$sted(!n\'#ing%\'tigated*#ing$$oads%$oped#$mail%)nufacture',
+    '%$rked($ting\'#ing&)riageable&(zipanned%&stered%$tch.$\'easured*$ment%%eting%%m-ber%+rchandising&"ge(!r%&talled',
+    '$(obilised%\'delling\'&rnized&+ularisation%)isturiser%$rtar%$ulds&$nted$"ug$*yelination#+nationalize-#ing$\'otified%\'urished#(occurred',
+    '$-perationalize%$pose$%rders%\'ganises%&iented$$wned$*xygenation#)packaging\'$eted%&dlocks%"ir\'!s%&lleted)#ing*"ze',
+    '%$rade&!k&#tee\'#ing%"ss\'"ed&&telled%#tch&$tern%$ving%%yment$)enalising%)rforation)#med&!m',
+    '%&tition$$iled&%lared&"ot$&lacing&"nt(%ation&$ster&$ting%%edged%%otted%%ugged&$mbed(#ing$&ointed',
+    '&%ished&#led\'#ing%"or%\'pulated%"se&(sessions&!t$+rescription/!s\'?entation/inversion/displacement/"al/!s*#ing\'#sed',
+    '&%nting&,oritisations,!e&*vatization%%ocess*"ed&$duce*!d)#ing&)grammable&$ofer&%posed)#ing&$tect&&vision',
+    '$*ublication)$ized($shed%#nch%%ttied\'!y#-qualification*"ed&&rtered%&estion%%oting#(radiated%"il&#sed%%nking',
+    '&)ionalised$*e-released%\'cognize\'&rdable&(ruitment%%duced%(ferenced($rals)"ed&&lected%)gistering+!s)\'rations%&hearse%\'indeers',
+    '&\'easings&\'ocating%$mind%&paired&&resent%%turns%&valued$%idged%!g&#ged\'#ing%#nse%%veted(#ing$#ole',
+    '%!o&!t#!s$\'aleable%$mple%"nd%$wing$$cale(!s\'#ing&!n%\'hooling%\'reening$&ealing&#son',
+    '(!r\'#ing%!e&#ing%$lect)$ions%(nsitised&\'tencing%&rvices%*t&mdash;in&%ting.%$wing$&harpen%"ip%%oeing',
+    '&!t&$wing\'!n%\'rinking%\'uffling$%ights&\'nalling%$lver%"ze$(ketching%#ill($able&$nned$)leepering$\'mearing',
+    '$&nogged$#oap%+cialization%\'ftening%#led&"ve%"rt\'"ed\'#ing%$urce$(pecifies%$iked&%nning%#ool%&raying',
+    '&#out%"un$(tabilise,!s&$ffed&$ging&$lled&$tion%(erilised%(iffening&%rring&%tched%%oking&$wing%$ress',
+    '&#uck\'"ng%%uffed%$yles$\'ubmerge&&scribe%$cked%&rfaces%%spend$$wung#%table(!d\'#ing%!g%\'iloring',
+    '%#ped&#ing%#red&#get)"ed$#eam%&ndered)#ing%\'xturing$#haw%$emed%\'inkable%\'reading&\'ombosis$&ighten',
+    '&#ted%"me%%tling$&onique%$pped$$rail&%nsfer)%ormed(&lating(\'mitting%#eat($ment%$ials&&balize&$gger',
+    '&%mming$#ube\'!d%*dorisation%%rning$&weaked%%isted#*understand%#ify(#ing&&on.the$(pholster,#ing,!y$&seable',
+    '("ze#*vaccinated%#lve%#mps%%ulted$)egetation$#iew%$sion)"ed)#ing\'$ting%*talization*!e#$walk\'#ing',
+    '\'%ering\'#ing%$xing$&eighed%!t$&heeled%&itened$$ired$#ord\'"ed\'#ing$#rit\'%eable("rs\'$ings',
+    '$$erox#%yoked##zed").adoption#*formulated#!g"+/00/22/0002)$2011\'&3/0049)$2054*#109+"25+"31+"53,!9',
+    ',!2+"75+"83,!6,!7+"96,!7*#207+"10+"24,!7+"36,!8+"41,!2',
+    ',!6+"51+"70,!7+"83,!7,!9+"92,!4\'&4/2038+"45+"50,!7"!3#?&verbar&verbar;e5&verbar&verbar',
+    '"$570d$"6d"E6+&verbar&verbar;kf7&verbar&verbar;33"B7+&verbar&verbar;kg8&verbar&verbar"!8"#905#$90ct"&:batty$#its#&change#&elland#\'fantasy#&joyce.\'#ing#*mcallister',
+    '#)pemberton$%honed$(ickfords#%rocky#&strach&$iker##toy"*=enactment")a-cta-nts$(lisation%"ly#\'/farmer#!b$\'sorbing(!s',
+    '#)cceptance%*ulturation$,h-fall-reach\'+or-the-moon&"in&Dreverse-circle-thrust-reverse-circle.&thrust4)-withdraw%$/and%(able/not%&ed-the%"in\'&g-back)#for(!.',
+    '%(southern$%quire\'&sition$"t2%%ants.%$ion\'(#(s)(*-formation2!s)*mechanisms)%times(#ism&-vaci&oacute;n("rt(#tor',
+    '\'#ins%%olite&"r.\'$less\'%s.the%"s.#Gd&mdash;from&mdash;package&mdash;pi.log+3module&mdash;pi.log$*-and-write%$back%;every-newspaper-in-the-shop%"in%+only-memory%"up$,/oxfordshire',
+    '\'"nd%&writer)#ten$\'_and_so$%er(s)&!-\'\'centred((hallenge\'&effort\'.identification(*n-the-text\'\'loyalty\'(oriented\'(reaction)\'sponses',
+    '\'&writes&).printers&\'/hearer\'+joke-writer\'&writer&$land&#man&$s.it\'!/()audiences(\'hearers(\'viewers$$icut%!e%-ly-accessible',
+    '(\'changed(*guaranteed(\'leached(*observable(,recognizable0"ed\'!.%,ness-to-roll)"es&\'g&ndash\'#(s)\'(-centres(%glass-"es(%halls',
+    ')!t(%level(&matter(\'passage((response(*strategies(#the+!y)(onbridge\'*/berkshire(\'sitting("tv(/watching/eating\'%based\'"es',
+    '&%paque$)justment.$"ly$"me&$.com$&opting%$rned$\'vertise+!d$%write$0y&rehy;assembled+&filled+$made%!-&\'bottled',
+    '\'%rewed&/calorie-counted\'&hopped\'%ombed((nfigured&&filled+#ted(&nished\')or-action)#med&\'growing&+interleaved&%laden("id\'$ined',
+    ')#ket\'#eal*!s\'&oulded&(packaged(%inted\'%eeled\'&lanned\'%oured&(reckoner(\'ference(\'hearsed\'&oasted&&salted\'%ealed',
+    '\'%liced\'%trung&(tailored(#ped\'!o()-assemble)$feed*#ill+!t)$jump)$send+#rve("rn\'&rained&&washed',
+    '%!.%%mixed%$ness#-estheticizing#(ffiliate*#ion&(rmations%%orest$!s#%gan\'s&*-appointee\')gorbachev\'&shultz($ized()upporting',
+    '(/ush/casey/north\'&carter\')gorbachev$!e%)nt/alcian\'"s.$)gregating$-rarianization#"hc#$klli$%stead#\x91l&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar%/rehy;and-actual*$life$!-',
+    '%(compiler%%death%$food%&growth%"ix%\'looking%%money%$ness&.ightmare-dream%%space%$term$&.three&#ime$!/%&unreal',
+    '$$cote$$ease$%foods$#gar$%iable%"en%%gners%*s&rehy;ing&\'ability\'$ting&\'e&mdash\'!\'\'&d/that&#hed&$ing/',
+    '\'!e&"t.\')/abstract\',i&rehy;cally("c\')*a&rehy;lly*!l+)ly-minded/\'odelled%"te&$ies.&"y-(\'denying(&effect.!s',
+    '()principle($talk\'(engine2s%\'zation.+"al&#ed\'\'!r(!s$$life%%otted&%wance+!s%(y&rehy;i&!-&#_at',
+    '$&m-wide%#.is$#nej&"ss$!o$(politik.+"er$$sing%$pace%#ton$/time-calculated&&onship,!s&$vely%"or',
+    '#$mers$$ined#,naesthetized%%lyses%(stomosis$&ointed$!s$!y##ons#-p&rehy;peared$&-oddar$(/nothing$$ears%,r-and-binder\'&binder',
+    '%"n\'$$peal\'%rence%$lies%\'ointees)%ments)!s&\'rtioned%&raises&\'oaching\'&priate,#ing#.r&rehy;admiral*&facing*%guard',
+    '%%being%)commodore%%ended%$lamp%&mirror&#ost%+of-the-year%)projected,#ion%%stage%\'vassals$#end$&firing$$gued$&lights',
+    '$3rangement-promoting-!.(#lng$#sby$*ticulating,#ons$,ward-sliding%"in#(scending$&enberg%!r$#ima$&nabell$)on-action\'%based',
+    '\'%sense\'#the&!.\'!i&!/\'\'emotion\'%faith\'(unreason&\'ability(/le&rehy;looking*&-above+\'looking+(sounding*)/sensible*%ness.',
+    '0%sized*!\'*\'-minded+%rated+\'uniform&#ed.&$ing\'&#s**\')-exposure(&unlike\'#.40("we\'5/explanations/excuses%"on$!s',
+    '&%sment%(ignments%&ociate*#ion&!n%$sure%$urer\'\'ingness$#ure&#ing#"th$)mosphered$$tain("ed$&uarant',
+    '#)vell/shop%!n$#ing#&wakens"%badge$$ited$\'lloting$$nded$&ptised$)rbatively$"se%)ification$\'te-only&"s.$!y',
+    '$"za#4beck/gloucestershire(*regimental#"eh$,l-delinquent&&rouser%"de%!l&%ionis(/us/manipulative$!r%*rymemberer%"ty$"uh$&yrolle',
+    '$(rth-type$$tten#%laced$&eached%#eds$%ingen$%ochon&#ked#%oiled$#llo%+usyonaryong$"nd$%oking%"ts$$ring',
+    '($able$\'undings%!r%!x#\'reathed$#ief\'"ed$\'oadcast%"ke#!s#&uckled$$ffal\'!t$\'ildable$#ker',
+    '$!l$&rrowed%$ying$&ttably&"on("ed$!y""c-$%rooms#!.#!1#!a$!1$%bling$"di',
+    '&#ify&(ulations%&ibrate%"l.&$s.98$\'nalised%!e%*nulisation*!e$)pitalised+#ing*&zation0!s\'&ulator-!y',
+    '$#sed%%tings$,tegorisation*#zed%#ion$#ulk#!b#!c$$ared$"ed$#hia$!o%*mmendation$&urence&%rence',
+    '#%eaved$!d%#ent$$eded&#ing$!i%&pients&(t-holder\'"s1%\'ve-only\'!/\'(d-please($/got)$hold(#but',
+    ')\'manager)$rest),transmitters(!/))addressee)\'manager()s-general\'"st&(ing-room*(stations$&mented(#ing$$nate%"ly%(t-enough',
+    '&/ly&rehy;enacted(+-accredited+$tive*&dopted*(ssembled*&warded)&closed*#ome,)mandeered+)nstructed)$dead+&ceased+\'dicated+\'livered)(equipped',
+    ')\'founded)&gained)\'hatched*#eld)&issued)(murdered)%named)(poisoned*\'repared))qualified)\'rebuilt+\'novated+%scued,%tored+%tired',
+    ')\'started)#won(!.&&ralize\'!e\'#ing$!p%!-%!s%%tance&)ion-class,#erk+)um-lounge*$desk*%rooms',
+    '*)enquiries*\'visitor)3ist-cum-switchboard,!/&#or\'(+-associated)\'bearing)*controlled)"gs)&matrix*&ediate))selective((/channel(&s/cell*\'enzymes',
+    '&"um\'!s$&rcadas\'"re%*tification)"ed$.ssion&rehy;ary))-affected*\'blasted+$ound+&ruised*)clobbered*\'defying*$free,&iendly',
+    '*#led*+reinforcing,\'silient-\'trained+%idden*\'savaged*(watchers)".e*#the\'$vely$#tor%#tes$#uil$$vied&"ng',
+    ')!s%\'llenges%+rbonisation&!d&%gings&#ted%"se%#vam$"ed%%rcari\'*h&eacute;s((e&eacute%!s$-romatographed\'"ed',
+    '%!s&*s&auml;tze#!i$&divate)#ing$%evers$#nos%#tly$\'pe.page&,/instruction\'\'weekend&)s/weekend\'$from%%ient\')-s-deprivation',
+    '&%tents%+rocal&mdash*!/)$tors%!s$%rcuit\'&latory$)tal-rigid\'#ist*!s&"ta\'$ion.("va)&e-like%#ers',
+    '$"ey$#ing%#tts$#les\'&s-more(%/ugly(\'ly-made%#ing$!o%&nmthey#&laimer)6-ameliorator-polyremic%!m&,aci&oacute;n\'!r',
+    '&!p%%sping&&sifies$\'enching%)ricalized$&imbing%*ner-rocker$$oned&#ing%#sed\'!s%%thing$!u%!s&"ia',
+    '$%-reco$)agulating%!t&"ed$%dable%%ified\'!y$&evring$!g%"ni\'&sances(-e&lsqb;d&rsqb)"d\'(#ion\'$tiom',
+    '+!.++/elongation,&status\'(zability("e.)$d.23*$_now)!r$&illess%!n%!t$$leta%-lection&mdash,!.)#ors',
+    '%\'onising&"ur$!m%-&rehy;mending+&pensed%\'-mended%-binant-inbred)&tional-!s("es%"en%"me\'+nc&eacute;e(+d/criticise)$atin',
+    '.\'s&mdash/!.)+ed&mdash;it+(-viewing+!.+\'surgery*!r&\'itments(#ted)#ing&(ndations&)unization%$pact&!e\'$nces',
+    '&(ilations(#ers&&letion&)os&eacute$)naissance%*centration\'*ptualizing&\'ilement($iate+$ion.+"on%%dense*!d)#ing&#ita',
+    '(&ioners+!s%+fort&eacute%$jure%,na&icirc;tre\'&isance)"se&$ects&(oitering%#ose%&quista%\'secrate&(olidated&\'tituter-!s',
+    '\'-ruc&rehy;tion*+ci&oacute;n*#ter,#urs+$ible,#on\'.)-oriented.-/3d/yorkshire/3banbury/oxfordshire/7parkend/gloucestershire/#tim.#ism0!t)"ed)#ing',
+    '%.textualisation.!e&%oured)#ing)!s&$ract%%verts&,ic&rehy;tion(%tions$"ok$(rd&mdash\'.ndash;breaking\'.rehy;equalling&!\'&0-and-documentary',
+    '(#ook("uy*"er,!s\'(cleaners((ollector)\'mmodity*$pany\'*formatting\'%heads(&olders+#ing\'&keeper-!s\'\'loading',
+    '\'\'offices\'\'packers(\'ressing)&oducer\'\'section(#hop)\'redders(&igning)#xth()tructured\'$time&%.july&%/book\'%field\'(manpower',
+    '&#_in&-able-erasable\'!l\'"re&\'breaker&(ed-sound)#the(&.flood)#the\'\'r-music)&player(\'/helper)%mixer(#ing&#for',
+    ')%-tape+"he)$/etc*5publishing/production&&ophile&)s&mdash;i\'%-base((managers($sold\'!.(\'between(#the\'\'/pieces(%tapes&(transfer',
+    '%#ked&#ing%&porate$$sted$#uer%%nted.(!r%&pedits\'!s&"le%"rd&!s\'"es$#ved&\'nanting',
+    '&)rable.the("ll\'+ed/repaired\'-y-threatening(*/recycling#$ques#\'rafting$#ded$!e%$atie(#on.*,/environment+#fun+\'tourist*+al/cultural',
+    '*$ists%$dits$&ifying%)minalized)"te*#ing+\'on-wise$&opping%\'sigmoid$)ucifixion%\'descent)#ing%%itin\')+g-sergeants,&ystems',
+    '%\'tamento&"ed#%ssion#"ta%+l/abdominal%#nal&$gle.\'#ula*\'r/strip$#eur$!i%&fiable("nt$-o-rectangular%$cele',
+    '%%rship&"y.%-sigmoidoscopy#"ue$%lture$\'peratio$&rrance&)encerates&$ing.%"s.&$ions\'&veness%$uits%+virostridae&"um',
+    '$$tita%.ting/replacing#!y$%cled.&$ing.&$ying$#led%#ing"\'d&mdash));breasted*&tailed+"he$+rehy;coated+&loured)#hot',
+    ')\'striped#+-and-blacks(%cream($gold($pink)%urple(<white-check-curtain-windowed.\'striped%%rrows%\'wninged%"xe$&baized&$nded(!s%$elly',
+    '%$irds%$lack)!s&#ond\'"od&"ue%%ooted%%raced)!s&$east&$owed%\'uttoned$%canna&!p&$rpet',
+    '\'$sted%&ircled)#ing%#lad\'!y&%iffed%\'ockaded%&rimson&#oss)"ed%&urrant$(damasked%#irt%"ot%%raped',
+    '$%earth)"ed%$dged%*mbarrassed$&finned%&lecked\'$shed&#ock&%ushed%$rame%%urred$#gel%#ilt%%loved\'!w',
+    '%)reen-blue.!\'&$ound(!p$\'handled&"ts%%erren%&ottest$(jewelled%\'umpered$\'knobbed$$land%#eaf\'$ther+%bound',
+    '&#ned\'#ing&&pstick,"ed&&veried$$meat&%rcury%#ire&"st%&orocco$&nailed%#ose$2object-appropriate%\'n-white\'&yellow',
+    '%"tt$&padded%(encilled\'#ned&$pper%$oint&$oled$0raw-with-feeling%\'ibboned&$nged%#ust("ed$&sailed%%eated&$eing',
+    '%#ide&"lk%#lit%%oaked&$cked&$iled%\'treaked\'$iped%(weatered$&tabbed&$gged&#ils&\'sselled%#ide&)le-roofed',
+    '%$ones\'$gued$&velvet$&wigged#&/black&"ue$&deacon$%multi$$pink$,yellow/green#"ab$#cre%,tion-critics&"or$#ted',
+    '$,lackredblack%%ooded$#one%"ok%#urn(!e$5rick-professor-writer%#own$$urn.&"st$!y#"ca%&r-born$+liffe-maude$%oated',
+    ')!d$!u%\'rrants.##dat$"ed%"ll%#ndo$#ich%#sh-($pink\'!e%"ta$#led$"oe$!s',
+    '#(ecorates$&emably&-ed&mdash;p135$&fended$\'livered$%mayer%$ptio)\'n-money+\'seeking($vely\'"n.\'%orist)!y$)nominated$)ployments',
+    '$(scribing%\'ign/new($ates*#ing+#ons(#ers%$wire$,terminations$&vloped$"ye&!d#$face%"ng$$erns$$ield',
+    '$)ordbacked\'$ness&"th#&gewell$#ill\'!s$.rave/minstrels(!s%#ift$"um#&haired$$euch#&i-hots%$mail$\'agnosed',
+    '%$lled&!s%!n$&culous$!d$+fferentiate%"on$&gitize$(latation$)mensioned&!t$"na%!g&#don&#ton',
+    '$!s%\'coverer&%ussed%%perse)#ion&#lay&\'osition%(sociates\'%lving%#til(%lated&)ributable+"or$%vided\'#ing',
+    ')!d#)josenpono#"ko#$lake%\'nd/riba$"eg%!r%$tter$$ight%$ning$#och#3man/chairman/greene\'$head)\'patitis\')professor',
+    '&!s%+yne-bentley$"en$,ond/civilian((national#$nell%"rs%$sses##ort$#sed$*ubl&eacute%#nds%(tensaale$"wn$#xin',
+    '#&points%$lls.#!r$\'aftings%#ped$%esser)!s\'#ive$#ill\'"ed%!t$!o%"ck%$ofed#*shank-like',
+    '(!/$#tar#)tenbacher#!u$!c%"e\'&(/teenage&$_per&\'d-depth(%flush)#orm(%input(%price($size)\'tatures',
+    '(%voice\'$/h/g&$edge&%paths&#rs.&&vertex%$iton%0tion&mdash;which)*/cessation**declarator)$isms+#tic\'$vely($ists%#ved',
+    '%#dan(#ces)\'y-money*+/bankruptcy+&church+%early+\'pension+)severance("dt((t-always)%.lyly)"ed&#ent&!o$"ta',
+    '$#ell$$ood/#$yces$"ng"&ebajaz$#urs#+ce-carltons&\'edwards%!/&&oxford$$hoed&#ing#*d-buntings%\'covered&&utting',
+    '%$slim&%tumps%&thatch+"ed,!s\'#ick(!n%(warblers$(/british%(elsevier%%mayor%(national%%oxfam$$buck$!e',
+    '$%grass$"ie%"jk$%lings$*s:owl-like%%talks%&wamps.#*f-builders%&cities&"ut%\'forming%$hive%$knot$!.$&erence',
+    '##kit#.l&ndash;turned$\'-appeal%&cutter%(to-reels$(/spindle$#ers$+ing-machine\'!s$"ly#\'mbarked$\'ergence$&ission$(phasises)#zed',
+    '(!s#&nacted\'%ments%\'n/radio$\'counter$$gine(%ering$!t%#ers%"ly#$pham$#ing#,s&ndash;mogg$&-jones%#lik',
+    '$&timate##tha$!s#!v$\'acuated%&luates$,e-tucker/ian%(/banbury&(fairford&&london&(sandford&+wallingford%!9%)s/amateur\'&tarmac',
+    '#\'xamines$%posed$\'tracted"$f-17$\'induced$"os$$raff##.10%!1%!2%!3$"21%!2%!6%!9',
+    '%!3%!5%!8$!5$!6$!7$!9$"aa%!b%!c%!d%!e%!f%!g%!h',
+    '$#res$#s01&!2&!3&!4&!5&!6&!7&!8&!9%"10&!1&!2#!/#$:e/3',
+    '%#ing%$tory$!h$+miliarising#\'ectance&#ion&$ory\')\'/social$!d%*/harvested$"lt$#nce%&daries%"es$$rant',
+    '(+of-the-year\')/linesmen\'!e\'*s/linesman\'!z&3nce&mdash;character**ndash;only)#(s))&-group*,modification*%point*-qualification1#ers*$room*$type',
+    '\'!d("ar*#ius($iary(&umdec.\',t-qualifying)#the((ensystem(&ialist&&rendum%)mentation%&red-to%&tilize&!s%%undum',
+    '&$orio##fin$\'lection&!d#&igured\'#ing$"le&!d%%lpack%"oe%%tered$&ndings%-ement-centred$%tment%$ters',
+    '%"st%#ted$,ec&rehy;ting&%tancy)!t\'(ed-light*?sound-as-of-underground-spirits)!.\'$ion.*+/absorption+"of\'%ogram,!s("ne%!w',
+    '&\'-action\'*controlled&!e&#ing\'$ones\'$tive\'-vely-intended&\'ologist$$ight$%ocked%#lux%"od\'#ing&$ring%&tation',
+    '$"us%\'xogenic#&ollows$\'ndateur+!s$"rd%#ged%.m&mdash;former&/-and-investment\'+championing\'*orientated\'%proof\'.through-labour&!.\'"88',
+    '&%/land&!a\'$mini\'#nda\'"ta(!e("io*\'n-which+4/counter-reformation(\'orische(!s&!e\'%r-the("s.*$john',
+    '&!i\'#ngs\'&st-led*&minded&+s&mdash;and\'+/production&#yng%&tified(!y#,raction/wide\'%ories)!s%\'in-like\'$s.ii$%eezes',
+    '(+r/up-dating)!s\'+ing-looking*$ness\'%ment\'+\'-making+\'/poster+\'s/meals$"ig&"er(*&rehy;ator(*ator-sized&$iate$&onting#&s17,18',
+    '$)ge-seeker+#ing&&e-like()producing\'"s.&"ss$&lgence$)nctioning*!s%(d/credit&*s/exchange%#jol$"rb&%isher+!s',
+    '&!s$*sal/phobia%&e-dump\'&filled(&uelled\'&matter\'%stink&\'/refuse&"st"2g&lsqb;imen&rsqb;t#!=$*additional$,independence$+peculiarity%*rerogative',
+    '$*technology#$ain\'$)lvanising$$n537%!i$!r%&d-less&"es\'%z-les)$vous&"ie\'"n\'&&lessly&$ment&"um',
+    '%#her%#ta-\'$.but$\'zetting%"zi#"d.#%eared&#ing$$cted$&morter$&nbogen%$cies&-y-cum-fifties(%style(%white',
+    '%#dam%(eration\',!.,-/resurrection%\'sburger%\'t-birds$&rssion$$ster$%tting#"ga%(e-rapper\'&tinged&#ish&%matic$!e',
+    '\'!o%*e-and-anna\'\'spotter%*o-calabria&"ri##ias$%cidus$%erung$-me&mdash;this&*-switching&!.\'!l&%/made\'#you&#for',
+    '(#-in(#als(!o&7s&mdash;conventionalism%#ine$#nae\'&-olgae$&on--by\'%based\'(inspired\'(specific\'/versus-district&".a\'"if(!n',
+    '\'(officers&!/\'\'country\'&nation\'(scottish&(al-level)(planning(%/area)*divisional)%local(!e((isations*#ing*"m.+!s',
+    '+,-centraliser+"ic)"ty)"ze(#ly-+\'planned\'"ux&+s&mdash;and&"um&$wide%)selective$!r$-s/oxfordshire%#tar(#ing',
+    '/#the(!*(&-based)%clash*(onscious)%drift)&keeper)$meal)(shifting)+to-register($.doc(%ation(!e)"d.)!r',
+    '&(rability(%rship(%tion.-!a,%where*"ve\'(y-office#\'lamento%!r%&tively%"ze\'!s$$oved$"ue&!d',
+    '#%nancy&!s%"rd$%bagen$(i&eacute$!y#\'ognised)!s$$lini&\'th/soil("ic#!r$&afting%%nting%&velled',
+    '%!g%)ssionally+"ry*$ists(.ve-progressive*!.*$ness\'"on\'#ult%%table&!z$#ind\'#ing%!p$%ouper',
+    '#"s.$&istrar##ton#(ualtions$$eiro%"ra$$gees$!l%"ae&"r\'\'--as-clockwork(&footer(%sized)\'trength\'!.',
+    '\'$_now\'#ian(!s)&ations)"es(\'zations)"es\'+ly-attested*)occurring*&shaped+%paced)!.)!/\'!z&!t',
+    ')"n\'*\'-making*!.+$much*/ists-especially*$s.if,"ps,#the++_in_respect+#hip\'%or(s))!*))-friendly)1y/quasi-statutory\'%uions',
+    '%!o$!r%/gitate-arianism*$ions$!s",habilatation\'&itates+)ion-3,500/(oriented.!.)"ee$"ge$!l$+rmonisation*"ed',
+    '$"ul$#via##eal%&rshals\'#in\'%%table&!s$$rsal&!e&#yng#%idrat$+erarchizing$"re#!m#%oboth',
+    '$\'lstered$#mes%(ogenised$$oked$-spitalisation+&zation#\'umanize#)ybridised*#ing)&zation$\'drating"\'ich-ish%#ean&%nberg\'#owi',
+    '\'&t-jung&!s%+f&uuml;hrer%%hardt%#ler&"in%\'marshal%#nau%(sbischof&\'gericht&&hoffen&4jugendgerichtsgesetz,0wohlfahrtsgesetz&&kammer\'(ommissar',
+    '&&leiter\'2uftfahrtminsterium&$mark&&partei&#rat&*schulfonds\'$taat&$tadt&$wehr%\'tenberg#*d-inspired$(/british%%coach%)defending%/gloucestershire',
+    '%+strathclyde$,entification*"ed$$ford$!h%$achd$"ij$!s%$wire$#unn#)fenhauser$(ications%"es#+gate/surrey$"en',
+    '&"on$$n-in%!.%#ed.&$ment%$ited\'#ing#$hill#"jo##kel$%guard$!o$%sland#0lly/drink-driver$2y-collins/antiques',
+    '$%agine)!d$)bursables)!l("el)%ment.)%rnent($ment$\'mersion%(igration$*plantation&\'emented$"ut#,n&rehy;force.#ing',
+    '$"as$$beck&"rt%#old$+carceration\'%nates%$liff%&ubated$,deer-hunters&$xing%#orp%#rop%%ucing&-strialization$$erio',
+    '$%farct)!s%%ested%(iltrated%%lated(#ion%6orce-and-stick-with-it)*d-concrete+%glass)%ment\'-!=($ment%$used$%habit)"ed',
+    '%$erit)"ed%$iold$(itialize$$ject%$ured\'#ing\'!y$\'nervate$#old%"so$\'scribed*!s)#ing%&erting',
+    ')$ions&$ired%%talls\'$ted.&\'ituting&#rom%&ulated&&rances\'"er$(tegrates&%nsify&!r\'$ment\')pretative\'$view',
+    '&$sion%!e&$ntor%)igoration%&oicing&#ked\'#ing&%lving#+s-ul-kuttab$%elied%%nberg$%inger$!m$&olated##ten',
+    ')"ve&"er&$lied$\'h/haley$!s%&ch.she$#zel%#ler##ves%!w#$zens"#jas#!e$/ct&lsqb;ed&rsqb&$-ion',
+    '\'!r&(ion-slip\'"ve##man#,oic&rehy;ing&"e.\'#dly%&ndered&"er$"ke$#yce&#ing)!e)!s#!t',
+    '\'!d$)evenation$&venage(#tes)$ions)#ory\'\'escence"#kab#)eyboarded%#ing#"ha$(ert/team$$mire#%itted#&notted',
+    '#\'omitjie")l-ig-ious#"a1$#ble$#che%*i&oacute;n%&tation$%gated$!i$$live$,minarization$%psed.\'"rs$!t%!a',
+    '%!d%$edto&"s.%#her%!i&!f&(on-based((al-based+%model*\'/object(!e(\'s-speak)"/2*&forces+&riends',
+    '*%women))hip&ndash,!\',&-based.&onding.\'uilding-*challenged-,metropolitan,(s-\'thank&+ve\'s/friend(#-ly)$wise(!/))colleague)&friend',
+    ')*y&rehy;new*+-error-free+$high+(immobile+\'natural+$open+&simple*"_a($risk(&s.such\'\'isation)"ed).m/behaviourism(#zer*!s',
+    '$$view$&xating(3on/kisses/caresses/+&stress%"er%+in-softened$"y.%&ed-the#"ea%!s&$able&"e.(&adrian\'*/east-west&"in',
+    '$*ctsproduct$#efe$\'galised&#tio)(n-safety*!.*!s$"if$(nted.kim$!r$\'ttering&$ing.$$uers$&vanace\'Pce----------------prominence------------deviance',
+    ')":2)!s\'"t\'(".l(,/interesting*)rrelevant&#tor%\'eraging$)xicalized#!i$!a%\'bility\'&$lity$&bility$%c-bag',
+    '&&labels%"ks%$less%*t-enriched&!i$.ef&mdash;since&&-areas\'(bringing\')colouring))mposition\'*decoration)\'pendent\'\'figures\'(kitchens\'$like',
+    '\'\'picture)$thoi\'%slabs\'%valve&:/celebrations/satisfaction&$fund&!t%%vedly$%gated%$hted\'!s%*i&oacute;n&+o-aesthetic()political\'$n&gt',
+    '($-85%)#97%)%based)+in-negative)*tolerating)%watch(#.24(-:christianity(!e\'"sa(!i)!s\'*us-fascist*$kind*&minded',
+    ')!.)\'/ethnic*,humanitarian*+ideological*%moral+(unicipal*&racial)"ae)*ly-divided,\'guarded%#ous$"ne%!k%$oing$\'quefied',
+    '\'"ae&"um$"se%"ys$(tigation##jef#%lenas$$ford$"um#!o$\'catable\'#ees\'.ion/redundancy\'#ors%!k',
+    '$$dged$#gio#$ston##ton#.uctant-to-move))ly-shared$&ktetle$#med#$yin\'$#pck"+m-awakening$$oved#\'aaamber$\'chining$#ded',
+    '&!/&)der-about*#man)#man&!e\'#der\'!r\'!s\'"th&$ings&Es-upright-in-a-force-9-mixed-metaphor$#krs$!n%$ding&"s.',
+    '%!s%)ufactures,#ing$.rkable-looking*!.*%1,000)*y-featured+(thorough&#ed.\'$ters&"s-\'".a%/riage&mdash;one$$ster(-ed/repackaged',
+    '$$ynid\'"ng#&bering$*randtesque)&splein#&easure(#ing$!c$%dial/\'$ting&!e\'*s&mdash;eg/#for()-oriented(!.',
+    '%*y&mdash;as$!k$!l%#iik$&mb\'red&\'er\'d/my(!-)"as)#not)"or(!.(#_so(!d(#ed\'*,-anticipated',
+    '+"in)"th(,ing/thinking(&s-this&"re(!d\'#yng%$eber&&mbered$%nisce$+rchandising&"ie$!s$!t%&alling',
+    '%"ns$"go$#jio$$lien&*tarization+!e$%ncent%%d-her%+eralization%*gton-harts)!s$"sa%$cent%%sion/*&mildly',
+    '#$mers$$onds$!y#%nimbi#+obilisation(#zed)#ing$(dernised$%isten\'&uriser$"nd&#ino%#sta\'%rants)$ted.',
+    '*#ive*#ors$"ra%$sely%\'tgagors$\'te-area\'$node\'(sounding\'\'working&)ly-seated%#ist&&vating*"on%$ored$&uslins',
+    '%"\'d%)able-base)!s&+l-from-play(#van%$e-me&&d-them\'(/reduced$$yely#&pstone)!s(!s#!u$&es-toi$*neraphobia',
+    ')-ion&mdash;for,!.*.ve/calculative$$ster##yca$\'elinate*#ion$-thologization"*na/glasgow$$cres$5issance-in-disneyland+!s$(l-artery&+replacement&$vein',
+    '$\'ming&gt%,o-controlled$!s%%cence*!s$*tionalised+"ze-!d%)urability(%lized$+ult-engined(0mitsubishi-volvo\'!/$&vigate##bad',
+    '#"ch%"er$%ontre)!s%#ule#"da%"it%!l$"ed%#lls%!o%&r-clad&*ed-visible\'"rs%$zous',
+    '%$ngly\'!s$!l%$eman$"re$!s#\'ee/ward%!r$%geing%\'otiable)*tion-proof3$ness%#ued&#ing$%nutet',
+    '$)w&rehy;ed%%/join%%able.&+l/variation\'#ist%#est#.feur/perinatal$#ree&\'w-based#"ga%(sdenglok#$hold#%icola$"er$#han',
+    '$"sh&#aws%"on$$telo##kou#$nand%"rd$$ells%!n%(r-teller%%s-le-%!u$+ie/herdsman\'&mother%$lson',
+    '$&oldson$%tiger#-omm&eacute;es$+rmalisation$(unceable(%ments%)vellement$-vaci&ograve;n#$quin#%sberg$"ch&#ler$)eigenment$$hall%/enfengwangjiang',
+    '#)t&mdash;i%.rehy;collector*)reduction$(-a-baggy(&eating\'%cause($oach\'%guard\'$hoot\'$mobs\'$plot((rinciple\'$rant(#ole)"om',
+    '\'$womb%$back&#ook%\'charges&)ollection\'%ntrol,#led%&income%\'pooling%\'raising&&educed&#oll%\'subsidy$"/i$$acar',
+    '%!f&#one%$lles$"co$&enmark%*r&iacute;a&\'-warden&"s.$$free$#in\'$\'meister$*okilonians$#ree$&s-thus$$zler',
+    '$(nciatory$\'rturing#%wicks#!y##zhi$"io")occupying&$rred)$nces\'!s$!h$%rders#(ffenders$"os#*ganisation',
+    '#$horn#"le$#ogi#!n#&pposed$#rts$&timise#!r$&dained%#ers$,ganisational(#zes\'%sises%(nisation#$vers',
+    '"3p&rehy;resentatives#--commissioned#)ackagings$#id.%#nt.\'!s%"r\'&$-dog\'#man\'(sealants\'$work&)/hardware\'+replacement&)er/dealer&/s&mdash;outside',
+    '.#the\'!.\',/maintenance\'#ing&$yard$%ndent&!u$%pered$\'ratione%#ked%(titional+"ed+#ing&!o$%ssage',
+    '$/triaci&oacute;n($tors%\'terning$"ve&$ment$+y&rehy;ment%#ers#!b#"co%!n#\'ealable&!e\'%rs-\'a*(occupied&$ling',
+    '\'$call\')recording\'#use&+able-random&-edly-promised($ness&\'ing.the$&chages%!t&"ed&!s$!d$&llancy&#ed.\'#nce',
+    '\'!r&!s$\'ntantly&%house&#ina$%opled\'#ing$"re%&formed)!s&#use%#med%&torial)!o)"um',
+    '$$sent(!s$!t%%iteur*!s\'$ion.*(/synonym(&ve.the*)/unstable+)variative&$vity%$oire#%force#%haims$#lex',
+    ',"ed,"ic,!y##ide$%erced$"la$#ned%#ned$#tch%#ion&$tion#.lace&rehy;ment\'/ment/competitor(#net\'!r',
+    '("ng%!i%&sement%!t&"ed(!.&$ing.%$yers$#ead&!t\'!e%"ns%$tion%"vy$!i',
+    '\'%/copy\'*nt/android\'!r\'&ted_on(*or/vehicle%#ed.%!n$"ot%%yment$%ublic%!g%$mbed$%y\'ing%.-paid-envelope%"ed',
+    '$&cketed$"en$#int$(larising%#ish(#ing&\'ticised*#zed%%luted$#man%"en$$ning%#ses&\'iveness$(pulating',
+    '%\'t(1974)\'"s)&--and-election\'%backs\'*generation&%.that)#ese(-oil/flexitime&"/2\'&annual\'\'opinion&!0&!3&,acknowledges\'\'ge-type',
+    '&$back&#ed*(\'-stolen)$upon($=31%*"5%\'"es\')r-cyclist)#the(%s_fed&#in\'(&g-back)!.)./investigative*(recovery',
+    '&$line&"s\'\'(/comfort+%ments((software(%write\'!t&$ws29("39&!y$$sant%)e-figures\'&statue&&ssions%\'ibility',
+    '*!s\'-ory--strongly%!o%%sesed($ions($sed.)&ionary&\'session%%teria$$usse$$wder%$ered##ped$"in&!g',
+    '$0e&rehy;sentative/#ing%*cipitation%+hensibility*"on%\'ntation*#ves%+s&rehy;sion&!e\'!n(,&rehy;tative($cing(.t&lsqb;ed&rsqb*(rehy;ing)&-ation',
+    '*#ion*.tion&mdash;the.!..2/control/delegated.%alism."s.,#ve\'.#(s).+s/freelance-#ity)%ed_by,"in*!r)%itive*"ve',
+    ')"s.&"sa\'#ed.)!/\'\'ionists\'$ynge%&titive$&icated%(oritised+#ing*$zing%)stination%*vatisation)&zation*!e',
+    '&%brain&%icons%)achfully.%"be&#ing%\'cedures\'$sses)"or%!d&!u\'!c(*&rehy;tive(\'ability(#ed.(!t',
+    ',./appropriation-0non-reproduction,"al*(vization\'+zierbarkeit%$file(#ing%,grammability((phicated%&jected%$ofed%&tsentr%&vation&(isioning$%sents',
+    '$!e%$arch$\'iratory$\'onsible#$tate&$ions$\'ilarium&"e\'\'%-bird((fancying($like\'"s.&(ian-like)!s%$tive',
+    '*"na%"li\'*c&mdash;in(--czechoslovak)*republican)$sadr($.the($aine+!s).n-conservative+\'radical,$oman*)a-partido*$ised,"m.',
+    '*"s.(!k("s*)$-are\'$kana$\'ckering$"de$&licans%!s&+ive-looking)$ness$(rchasing&&usions$(tability&+tion-making',
+    '*&making%#ing"(q-sou-of##est#"id#(ruitment#(ualified$#ena&!t%+st-response\'(/command\'"or)!s\'"s.()/commands',
+    '),instructions%*t&eacute;s$!i%"ao%$eing&)m/vaughan&"rt%,re&rehy;ment\'\'d&mdash(#.20()/produced)&sought(*_in_favour("as\'%ment.',
+    ',//considerations-*provisions\'"rs\'\'s&mdash(8-access-to&lsqb;graphics%,sition&mdash%#tal(!l&#ing$#red&$sted%#ing"(radiates$!n%$king',
+    '&!s$\'cording$&dorter&#ses$&gister$(hearsals$#sby%)entatives#$ivet#%oofed$$utes""sa$\'cralize$(le-price%"ve',
+    '$$rtus$!t$#ved##can$#her%&ooling$$inds$$obie%"re\'!d&#ing&)la-wagner%"us$\'rambled&&tching',
+    '%%eened(#ing&#wed%$ibed&$pted$%uable%\'citated%\'e-party\'%squad&!e&\'masters&*s/property%"re%)scitation#$each',
+    '%!r&#ch\'(\'--hence)(findings*&unding)*orientated))programme*+ublications)\'related)%scale)%terms(".1)%there(//administrative)*evaluation',
+    ')\'library)*monitoring)(teaching($able(!e)+r-cosmonaut*"s.,\'clearly+!/,+consultants,%scope($line%#ter%"ux$"ct',
+    '&"on%$ured$(dimented$#eds$"gh%)mentation$&llable&&er-led(*/licencees$&mboing%%nbles$%nt.my&+/disapprove&%enced&#in\'',
+    '$&quence$$rued%%vando\'!s\'\'tion(s)+)-breaking+!.+$s245("us&-e&lsqb;d&rsqb\')-officers($type\'!.\'%dness\'#ndo',
+    '&#ior("ur&)oir-owner)!.)"ed)$with$%sarch%!h$%t-all%%table&#les#%ferve#%haken%(rpenable)#ing',
+    '("ed%&duling%%lving$(netikova$"od%$wing&!n$&uffle.#,i&rehy;dence$-dence&mdash;i*&rehy;i)&-based**cum-bunker*\'pattern)!.',
+    '("ia\'*t-designer)$free)\'related)(superior(-ial-apartment,%based,(mortgage*$ries(\'s-often*#run)".a)*/community\'\'zmuseum(\'theater',
+    '%(ual-heat)&should(\'isation)#zed&$e(s)\'2-after-evaporation$%ghted%\'nation.&*ed-servant$%lence%,ient-looking&"te$"n\'%\'-bonded&&filled',
+    '&(miscible&*reinforced\'%ubber%!/&(hardener&&timber%%arius%"ed%$oids&$usly$#pol$)st-coated&0ance-capacitance+(inducing+#run',
+    '*)/capacity((t-reader\'"te)!s&$enza&#in\'("g.\'$vely$&tuated(#ing#\'kinning#%liced##min##nik#,o&rehy;nance',
+    '$$aked$+cialization$&ftened$"la%(ubilised*"ty*#zed\'"le&#ion&!t\'"es\'&ion(s)*,-independent*+/completion%#ve.',
+    '%0ance-enhancement*$free&%tions\'(or-based%"se&$ible%$ying$&phonic*!s$!r%#bed%!e%0t&ndash;victoria&!\'&%-wear',
+    '&&/hotel&!a&!e$\'trative$$uces%!n&%dedly%-rce-allocator)+constrained,(trolling)\'endowed*\'xchange)*generating)&hungry)#led',
+    ')$poor*)rocessing))rationing)&saving*&haring(&.based(%s-led)%.this)%/time)#_on$"wn#&p-onse$#eak%&cifies&!k',
+    '0"ly\'!\'\'\'-is-due\'$.143\'\'/though\'\'abilize)\'le-like+!.+./unrespectable*)y-dressed\'#ed.\'/ively&mdash;the,#.10-!7\'"s-',
+    '%$rine$)irability\'"te(*ion-weight(\'or-then&"es&%onics%#ted&#ing$(landores%\'endence%$iced$!o%#nce&$ded.',
+    '\'\'sbility&!s\'\'ability($ries\'$e(s)((-ability)*correlated))modelling)(patterns)*signalling)\'testing(+/turnaround(#and(!d(#sto',
+    '\'/i&rehy;bilities(\'bilioty,#ty\'.(-centres/)promotion.#.55.4/claims/co-ordinated)*le-looking+$.the+\'because+$ness*&iities($oble(#ve\'\'$oria',
+    '%"si$"ro&"ut(!s##que#%reves#"s.$#ano$(erection%!s$$iter$$orto\'\'prinzip%%urces$\'pppectt',
+    '%$camp%&harrow&#ome\'$use.%,of-the-worl=%)paregoric&&eriods%$spot&&tation\'"op%$type$&/sleep$+abilisation*!e)&zation',
+    '%"in%#ked%#nce&!d\'\'ardised%%rants%"ur\'$ant-+1cum-souvenir-shop+%goers+"it+\'program+)reporting+\'starved-#yle',
+    '+,cafe/teashop+&dining+\'learned*#eur*"s.(%teuse)#ion\'$eant$&enosis&!t%!s$$ful.\'"ly$%house$&icking',
+    '%\'mulated%"n\'&,g&rehy;place\'\'-places(%rooms\'!a%%rring%$tuas\'"de\'#ere\'#ted(%ional$%less.$#mor$-o&rehy;ration',
+    '%"ke%#rat(/ion-unification+!.+$ists&(e/verify\'"th&\'ff-like&&ing/to$)rainingly(*t-of-trade)!.),_on_the_part%$eint)!e',
+    '&"ss("ed&#tch%"ic\'"ta)"se()ed-access+&voting)"rs()ions/lack,#led,\'similar)2ve-trade-practices+!.+0/non-restrictive',
+    '&"ke%)ospective%*ucturation*$ing\'-./democratising-"s.$%srict%%urant$&uarant%\'cturing%$died(!s%$ffed#!u$)bmissions',
+    '$%iting$\'l-allah%"t\'&%-wise&!.\'%woods&$/and&$ants\'&tivity&(ing-from&$less&\'s&mdash\'&-based(&proven($seen',
+    '("ps\')/comments($form(\'limited(&scores)$tats\'\'confirm$$mees&%talks%"ix%!p&%tions$*pplemented$\'rection%\'facings',
+    '%#gam\'#nce&!e\'$nces%%recta)"io+&n/life,#ist\'#xit%&veying$(scitates*"or%\'sitated$"tl#)vrrection',
+    '#.ynchronization$&stance#%zeter$!o""t.#$/dis##01\'#!a$!a$$bled$$ckle$#il-\'\'finance\'(industry\'%price',
+    '&(/service\')wholesale&$able&.er-distributor)#led("/s*$taff*\'upplier&"or%"n.&(ing-wall$#ker$&liate\')!.$$rait',
+    '("es(\'ion.the&&ed.son&#mac\'#ent%#get(#ing%&macked#!b#$ches#"d.#"el%%lings$$nant%!d',
+    '%#tis\'$vity&"um$%rrage$&xtured$$yned#\'hatched$"el$&ickens$&readed$#unk#&iarius$$cula(#ris(#tum',
+    '\'-o-endothelial(%cytes(*endothelia$"le$"me&!d$*na-pattern&%culum&"ed&#lis%*o-cortical&&phathy&%scopy&%topic&(vascular',
+    '$*r&eacute;e%+e&rehy;ment&*d/resigned\'!f\'$ness&%ment\'*%-ages+(idleness*$.and+%below%*ing-places$#tle&#ing#!o$#ned',
+    '&!s$#rno%)taeformis$%uches\'$ings#!r$#ack\'"ed&"t-\'#ed.\'#ive%%ined.(!r%(nchement&$sfer',
+    '((ormation+"ed(%usion\'&lating\'$mits\'*plantation$$eads&$tant*!s\'#ist\'%ments\'*s:balmoral$(ibutions%%cting%"es',
+    '\'\'e-based("d.$(o-active,"ly&\'classic&&fitted\'%renzy\'.unk-by-numbers&$head&&kitsch&&mobile&%nuevo(&mbered&\'rockets(%lling',
+    '\'$tyle*#ing&&vision&$wave%$bolt)"ed%%ceded&"on(&verted%$dict)#ive&&uction%&fitted&&lexion%)gradation',
+    '\'#ess*"ed%(position%(scendent+!r\'\'rubbers&(pections+$vity*\'roscope%/transposon-like/!s%*uss&eacute("ee&*v&eacute;e\'!e',
+    '&/irus-associated##sky#&tendon$#ner##ube%#ing$%rn-by\'(of-waste(,n-investment\'(to-hegel+&istory*%learn*$marx.#ism0"ts',
+    '*$rant*&sender&(.susanna&\'/double\'.new-line/enter\'&profit&!e\'.d&mdash;except(#.he\'!s\'"th&-ing-your-call)!s&,s/attributes#%yring',
+    '"#uan#\'berwerk#%ction##del#$eale$!l#"il#%leaux$"ts#$mann#)nderstood$&ifying%!s#!o$"ke',
+    '#$rque#&seable$#sir#)tterische"&v\'renc#(-limiter$"up#%/high$#min$$trem#)accinated*#ion$!h$&lidate*!s',
+    '(&zation%,uation-based+.s/devaluations&"es%"ve$)n-powered%#kar$!r%$nish)"ed$%ulted$"va#"co%&vering#0eal&lsqb;ed&rsqb',
+    '&$ing.)!s&*s/conceals$\'ctoring$&getate$"iw&"ed&#ing&!s$+laaaaations&$ciun&"ed&"nt&&tion/s*"al',
+    '%%ealed&\'y-peter%"ie%(l-ations&(/british$*nge-crazed&#ing%"na%#ue-(*allocation))ttracting(*collecting()intensive(\'raisers(\'starved',
+    '\'*/operating&!s$+rb-drenched&&/delay&&erance))tion-free&&rocket%&encing\'\'d-like.)#who\'6t-openness-before-life%%ified%"on%#red%,se-abseiling',
+    ')#ody(&charge)$rawl()discourse(*engineered(&facing)#lip(\'gearing(!l((mutation(&pivots)%ulley(!s)$tick(-transcriptase',
+    '\'\'d-field)!s\'$flow\'-ly-magnetized&$ings\'"ve%%tendi\'!r("is$$tted$$unes%!r#&ictual)$ling$&erwing',
+    '%&w--see\'\'article\'$book&!/\',practitioner\'&recall\')upgrading&+ed/american(#_as\'/rs\'superlatives&$ing.&(sws24-26*!7)"31$#ler',
+    '\'&gigedo&!e%!o$"ng&#ton$&se.the%$ion\'(!.($ism\'&$t\'st%(ualising$\'talise.*"rs(#zer*!s',
+    '$$val\'\'!.%&iscent#+lon-smeared#&mlvpol#$nell%"ue#&ocably%!h$!e$%icing$-l&rehy;utions%!.%)ationized%"lo',
+    '&!.&$aire&!e%0u&rehy;tionaries&(-tionary&/cion&aacute;rio&"si&"ta\'!e(!i\'$iion(,on&rehy;then*&--from+(although+*principles',
+    '-!e+$unir*%.they*!/*%aires+)ry-soviet*#ers*#ist*)naire-cdr/!s*"ry\'"um%!v&(ing-door#&s-fall',
+    '#$tech#(ue-style$&lsions#&ved-up$\'olution$!y"$wang$-rd&rehy;based&&-based\'afor-getting-it-right/patience-not-punishment-for-getting-it-wrong\'&givers\'\'seeking\'$type&!/\'\'payment',
+    '&$able&!e\'"d.($ness\'!r&\'s-based%$ming$#san$%tered$#xed#/e-zentralfinanz$$lded%!l#"in##ove',
+    '&!s")x/olympia#%amine#"ed##ham#+ine-covered$!t#\'ol\'rian##tar$"on""ya##don#&e-like$&conomy$*s-martinez',
+    '$.jahli&dstrok;3&#nes$,yav&iacute;k##lon#$mers#%nards%#ult$*ette-james$+i&egrave;re%"el&"rs%(sdrangar%#the$!o%(lds/boom',
+    ')*eyewitness)&nimbus)(stringer)&thames)*wheelchair("on%"sa&!o$$well(!s#%rolle#!s$#bye#!u"(zadeiras',
+    '#$dore#$ende##ika##nek$$icek#$oned#&s&ouml$"oe#$vani##zag%!k!$f-4s##500##84f##out',
+    '"+/00/23/2138+"49+"51,!2+"90*#201,!8+"26+"37+"44+"63,!6,!9+"78+"82',
+    ',!8*#305+"48+"50+"70,!4,!7+"82,!7,!9+"98*#409+"12+"20,!4',
+    '\'&4/2015"\'100,000#)4,190,000%\'320,000#*80,700,000"!2#%6,000#"90"A3&verbar&verbar;ra7&verbar&verbar#)0,000,000#!2#)7,810,000""4+#%0,960##1.4',
+    '#$,500""6+##oor"$8-f6""ac"%ereee"!f#!f""gs"*i-immunity""lv""mc"!o"#rom""ts',
+    '"!x!%g-540$"50$"60$\'8/50ohm##750"!."+/00/22/2002,#5-1\'&3/2117+"21,!2+"59+"63+"97',
+    '+"20,!9+"39+"47+"52,!4,!9+"65,!7,!9+"70+"80+"90,!1,!6',
+    '*#300,!7,!9+"11+"23,!8+"34+"43,!4,!5,!7+"50,!3,!4+"74',
+    ',!6*#442+"57,!8\'&4/2039##393""10#!2$#4fp#!3""24"!3#6&verbar&verbar;resigns"&4/1550#"40',
+    '#"70"!6"!7"!8"%9/453"&anised""b=",d-containing##ata"!h"%m/tnb""ns"!o"$p160""rg',
+    '"$v250%!o"%x612a#"es"!z!*h&circ;one#&eacute#\'ycirc;s""-4"+/00/22/2001\'&3/2006+"31,!2+"58,!9',
+    ',!4+"70,!1,!3,!9+"82"&1&plus#!1#$91xa""20"A3&verbar&verbar;bf6&verbar&verbar"!5"!8"(a/office#)bditoidea',
+    '%$omys&\'pleurid#%codes%\'mitrium#)damanthus$!e$#ley#$eadr$#der%!r$(tavicula%+ian/liassic&!c#%gades$%ionid',
+    '#"id#\'mnoides&%usian%"us$(phocorys#(ndirmwyn$$gabe#0psodic/iterative)$ally("ze*!s)#ing#%rmous"$edae#$gium',
+    '$\'lffordd$&n-main&$ruhr%&dhalen%%gasse&$rill%$hold)!s\'#tel%2isch-westfalisches)!e*!s%*l&auml;nde&$ande%%muhle',
+    '&&tadion%&tainer%%wein\'#"ld#"ma#"ni%)um-osmium$+o-hercynian&)lombardic#*obatrachus$"la%(ogically$(macrodex$&phytic#%ticus',
+    '(*al-lyrical*!s(!k\'#que##uma&.toid-arthritis%&y-eyed##ydt"!f""ia$"in#$dian#!e#$gian#"me',
+    '%!l$\'calanus%#res\'!w$"e-&%rhone&)westfalia*\'phalia.%%field%\'landers)!s&(oricaria%*stone-clad+&dotted$#iog',
+    '$.o&rehy;viruses%%-hide\'#orn%*ceros-horn+$like&.r&eacute;taire%%derma%$horn%&lophid%\'pharynx&%lasty%*tracheitis#$onna#&psalis#\'w-calch',
+    '#(zoctonia%#ids%%mania\'$tous&%orphs%#pod%\'solenid&%phere+%/soil"$kaaf"*o&amp;sup1+!2+!3#!=$--0.52(p=0.04)',
+    '$$0.45#%adesi$"es#&dactis%/mine-conjugated*(labelled$(es-based&%/city\',universities&#ia/%"us$$fa\'r$$ians%$care%!e',
+    '&%occus%\'dendons),ron-canopied%%monas($tade%+pseudomonas\'%in-dg%*spirillium&&tethia$"yn#"es$#ume##les#"mb%,ocorniculids',
+    '+!l&\'phyllum\'%teryx&!s$"er#!n$#chi$&ealpes$"wy##ode#$plex#(s-mynach%"y-$&badrig$%colyn',
+    '$&gadfan%#ogh$%neigr)-&amp;district$&tyllen$&ymedre%&tyllen#)val/modal$"yl"!q""sa#!l"&uaival#)barb-like(#red',
+    '#&foniog##man$&batron#!r#.stoxicodendron#"ys"*wngddwyryd"!y#(acophila#5d-ddu&rehy;porthmadog&"hu%%y-car($eirw\'(meinciau$%talog',
+    '##me-&)principle&&scheme&%words%"r.%&s/puns&#ter$#in\'&\'g-slang$"ni$$ster#(nchocoel\'&nellid-!s\'"ps',
+    '("ia($pora%%osaur$!d$!e%!s#+thm\'n\'blues&*-and-blues\'\'changes\'&guitar\'$ites&$.bob&!/\'-accompaniment\'$solo',
+    '\'!s&+ic-harmonic()/harmonic(%ities\'#tes&$less&"s.\'$cape$+idiadelphus$"ym!\'i&mdash#&oacute"$-bhi#$fang"!/',
+    '#$bead$&hachan#"ch#"da#!f#$gama##las$\'s=0.461$#tos#$nnes$!o$!t#$rtes#)s/burrell$"at',
+    '$"or"*b-crushing$$free$\'hugging$)protector$)revealing$+splintering(%tting$(tingling&!p$\'vaulted#!.#\'a/arcuk%#bit&\'uilding',
+    '$&ldries$%nszki$#ris$!t$"ud%!s$%virin#%bands$#eck%&d-silk%&ntripe%*r-carrying%%sford$#ins$(on-bound',
+    '\'$lace\'&making\')patterned\'$seal\'$tied\'\'wearing$!y#%crack#)e/roander$$irao$#lli$\'na-like$"ro#"hi#%igill',
+    '#.onucleoprotein$\'pattern$,se-phosphate%Dome&middot;mrna&middot;peptidyl-trna%"yl\'&purine\'+transferase$$type(!s$"ud#"s.$"gy$$tone#(ticklers(#ing',
+    '"%c-rac#&aldoni$,n-nicaraguan$,rdo-campbell\'+u-dominated',
 )
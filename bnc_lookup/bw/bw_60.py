@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_60 = (
+count_60 = 6694
+
+heads_60 = (
     'pro-smoking',
-    'pro-solidarity',
-    'pro-sovereignty',
-    'pro-spanish',
-    'pro-stalinist',
-    'pro-standards',
-    'pro-strike',
-    'pro-style',
-    'pro-swapo',
-    'pro-swedish',
-    'pro-syrians',
-    'pro-talus',
-    'pro-tanu',
-    'pro-tax',
-    'pro-taylor',
-    'pro-team',
     'pro-technology',
-    'pro-tem',
-    'pro-testant',
-    'pro-themistoklean',
-    'pro-tiger',
-    'pro-tile',
-    'pro-timeshare',
-    'pro-tourist',
-    'pro-trade',
-    'pro-trading',
-    'pro-tram',
-    'pro-trident',
-    'pro-ulcerogenic',
-    'pro-united',
-    'pro-unp',
-    'pro-urokinase',
     'pro-vanguard',
-    'pro-vatican',
-    'pro-vegetarian',
-    'pro-vice-chancellors',
-    'pro-vide',
-    'pro-vietnamese',
-    'pro-violence',
-    'pro-vision',
-    'pro-walking',
-    'pro-washington',
-    'pro-welensky',
-    'pro-welf',
-    'pro-west',
-    'pro-westernism',
-    'pro-whig',
-    'pro-whitehall',
     'pro-wilko',
-    'pro-william',
-    'pro-worker',
-    'pro-yankee',
-    'pro-zhao',
-    'pro.',
-    'pro/am',
-    'pro/celebrity',
-    'pro/paradox',
-    'pro_',
-    'pro_pro_rata',
-    'proabortion',
-    'proact',
-    'proalcohol',
-    'proamises',
-    'proamplifier',
     'proamplifiers',
-    'prob-',
-    'prob/11',
-    'prob/11/373',
-    'prob/11/474/40',
-    'prob/12',
-    'probabaly',
-    'probabil',
-    'probabilism',
-    'probabilistically',
-    'probabilit\'es',
-    'probability.',
-    'probablity',
-    'probably\'',
-    'probably-also',
-    'probably-fictitious',
     'probably-nice',
-    'probably/has',
-    'probably_because',
-    'probaly',
-    'probart',
-    'probart/mother',
-    'probat',
-    'probated',
-    'probation-order',
-    'probationer-superhumanity',
-    'probative-evidential',
-    'probe-like',
-    'probe-probe',
-    'probe/contig',
-    'probe/signal',
-    'probed/after',
     'probenecid',
-    'probert/cambridge',
-    'proberts',
-    'probes.',
-    'probes:i',
-    'probingly',
-    'probitts/accountant',
-    'probl',
-    'proble',
-    'problem&mdash;the',
-    'problem&ndash',
-    'problem&rehy;orientated',
-    'problem&rehy;solving',
-    'problem-areas',
-    'problem-causing',
-    'problem-direct',
     'problem-dominated',
-    'problem-focused/task-centred',
-    'problem-he',
-    'problem-identification',
-    'problem-owner',
-    'problem-page',
-    'problem-proof',
-    'problem-solution',
-    'problem-specific',
-    'problem-the',
-    'problem-understanding',
-    'problem.asquith',
-    'problem.you',
-    'problem/failure/fault',
-    'problem/is',
-    'problem/person/event',
     'problem/resolution',
-    'problem/solutions',
-    'problem/task',
-    'problem:who',
-    'problem_at',
-    'problemmmmm',
-    'problems&mdash;they',
-    'problems--in',
-    'problems-at',
-    'problems-depending',
-    'problems-for-the-solving-of',
-    'problems-of-driving-in-urban-traffic',
-    'problems.',
-    'problems.its',
-    'problems_at',
-    'problemsolving',
     'probolurus',
-    'proboque',
-    'probosces',
-    'proboscideans',
-    'proboscidians',
-    'proboscis-laden',
-    'proboscis-like',
-    'proboscises',
-    'probosutedjo',
-    'probotector',
-    'probouleutic',
-    'probreeder',
-    'probucol',
-    'probyn/estranged',
-    'probyn/husband',
-    'probyne',
     'proc&eacute;d&eacute',
-    'proc&lowbar',
-    'proc&lowbar;aux',
-    'proc&lowbar;saved',
-    'proc&lowbar;screen',
-    'proc2',
-    'procadd',
-    'procaryotes',
-    'proce(b)',
-    'proce(nnnn)',
-    'proceded',
-    'procedura',
-    'procedural-representational',
-    'proceduralism',
-    'proceduralized',
-    'procedure/function',
     'procedure35',
-    'procedurely',
-    'procedures&mdash;methods',
-    'procedures\'.',
-    'procedures.45',
-    'proceduressuch',
-    'proceed.9',
-    'proceede',
-    'procellaria',
-    'procellariidae',
-    'proceptive',
-    'procera',
-    'process&mdash;not',
-    'process-',
-    'process--a',
-    'process-a',
     'process-accountable',
-    'process-approach',
-    'process-centred',
-    'process-diagnostic',
-    'process-equipment',
-    'process-generated',
-    'process-god',
-    'process-independent',
-    'process-is',
-    'process-orientated',
-    'process-related',
-    'process-switching',
-    'process-water',
-    'process.',
-    'process.even',
-    'process.lord',
     'process/action',
-    'process/new',
-    'process/privilege',
-    'process/public',
-    'process/quota',
-    'processability',
-    'processable',
-    'processconfigurationfile',
-    'processed-foods',
-    'processed-whatever-by',
-    'processesor',
-    'processing-based',
-    'processing-friendly',
-    'processing-on-unix',
-    'processing-plant',
-    'processing-relational',
     'processing/forming',
-    'processing/report',
-    'procession.',
-    'processionary',
-    'processor&mdash;intensive',
-    'processor(s)',
-    'processor-',
-    'processor-controlled',
-    'processor-intensive',
-    'processor-memory-switch',
-    'processor-sparc',
-    'processor-specific',
-    'processors/',
-    'processpackage',
-    'processphotograph',
-    'processsing',
     'processwhen',
-    'procf',
-    'prochlorperazine',
-    'procida',
-    'procide',
-    'procides',
-    'procine',
-    'prockters',
-    'procktor',
-    'proclaimer',
-    'proclaimsthe',
-    'proclinsul',
-    'proclitic',
-    'proclitive',
-    'proclus',
-    'procol',
     'procollagen',
-    'procolor',
-    'procommunist',
-    'procomp',
-    'procompilers',
-    'proconsul-',
-    'proconsular',
-    'proconsulate',
-    'proconsulidae',
-    'proconsulids',
-    'procotol',
-    'procrastinates',
-    'procta',
-    'procter&amp;gamble',
-    'procteresque',
-    'procters',
     'procto-',
-    'proctocolectom',
-    'proctocolectony',
-    'proctometrogram',
-    'proctor-general',
-    'procuce',
-    'procumbent',
-    'procur',
-    'procuracies',
-    'procuraduria',
-    'procuratie',
-    'procuratorate',
-    'procuratorial',
-    'procuratorships',
-    'procure.',
-    'procurement-policy',
     'procuresses',
-    'procureuse',
-    'procyclical',
-    'procyclics',
-    'procymidone',
-    'proddings',
-    'proddow',
-    'proddys',
-    'prodecures',
-    'prodere',
-    'prodesco',
-    'prodesigner',
-    'prodge',
-    'prodger-faldo',
-    'prodhon',
-    'prodictoion',
     'prodigals',
-    'prodigeous',
-    'prodigiously-gifted',
-    'prodominance',
-    'prodound',
-    'prodovol\'stvennaia',
-    'prodromos',
-    'prodrug-activating',
-    'produce-a',
-    'produce-marketing',
-    'produce/value',
-    'producer&mdash;director',
-    'producer(s)',
-    'producer-country',
-    'producer-distributors',
-    'producer-entrepreneur',
     'producer-entrepreneurs',
-    'producer-groups',
-    'producer-in-waiting',
-    'producer-manager',
-    'producer-oriented',
-    'producer-originated',
-    'producer-price',
-    'producer-subject',
-    'producer/',
-    'producer/central',
-    'producer/usergroup',
-    'producery',
-    'producets',
-    'producibility',
-    'producibleness',
-    'producibly',
     'producin\'',
-    'produckshun',
-    'product&mdash;down',
-    'product&rehy;centred',
-    'product\'',
-    'product-based',
-    'product-believers',
-    'product-conscious',
-    'product-cost',
-    'product-cycle',
-    'product-differentiation',
-    'product-diversified',
-    'product-efficiency',
-    'product-gdp',
-    'product-gdp-terms',
-    'product-generations',
     'product-ions',
-    'product-labelling',
-    'product-leaflets/literature',
-    'product-lines',
-    'product-moment',
-    'product-of-the',
-    'product-orientated',
-    'product-placement',
-    'product-portfolio',
-    'product-protecting',
-    'product-specification',
-    'product-swap',
-    'product-use',
-    'product/',
-    'product/ideas-based',
-    'product/machine',
     'product/product',
-    'product/project',
-    'product/revenue',
-    'product/sbu',
-    'product2,325,00033.6%6%',
-    'producted',
-    'productiion',
-    'production&mdash;are',
-    'production&mdash;particularly',
-    'production\'',
-    'production-',
-    'production-capacity',
-    'production-centeredness',
-    'production-level',
-    'production-minded',
-    'production-model',
     'production-norms',
-    'production-quality',
-    'production-rate',
-    'production-related',
-    'production-scale',
-    'production-the',
-    'production-type',
-    'production-volume',
-    'production.oriented',
-    'production/consumption',
-    'production/library',
-    'production/marketing',
-    'production/mass',
-    'production/supply',
-    'productionisation',
-    'productionise',
     'productionised',
-    'productionists',
-    'productiou',
-    'productisation',
-    'productising',
-    'productition',
-    'productive.',
-    'productive.harmony',
-    'productivity-accounting',
-    'productivity-improvement',
-    'productivity-profit',
-    'productivity.all',
-    'producto',
-    'productory',
-    'productos',
-    'productpackage',
     'products&mdash;despite',
-    'products.so',
-    'products/augmented',
-    'products/benefits',
-    'products/businesses',
-    'products/markets',
-    'products/performance',
-    'products/processes',
-    'products/product',
-    'products/skills',
-    'productus',
-    'produire',
-    'produit',
-    'produktion',
-    'produktov',
-    'produsdands',
     'prodution',
-    'proect',
-    'proections',
-    'proective',
-    'proembryoes',
-    'proemium',
-    'proespective',
-    'proettes',
-    'profaine',
-    'profamily',
-    'profanes',
-    'profanter',
-    'profashionals',
-    'profecting',
-    'profeel',
-    'proferens.',
     'proferentem&mdash;contrary',
-    'proferentes',
-    'proferring',
-    'profession(s)',
-    'profession-led',
-    'profession-orientated',
-    'profession/regulatory',
-    'professional&rehy;amateur',
-    'professional\'',
-    'professional\'s',
-    'professional-client',
-    'professional-cum-greenkeeper',
-    'professional-general',
-    'professional-negligence',
-    'professional-paraprofessional',
-    'professional-sounding',
     'professional-standard',
-    'professional-tennis',
-    'professional-to-professional',
-    'professional/ami',
-    'professional/commercial/education',
-    'professional/established',
-    'professional/mortgage',
-    'professional/non-professional',
-    'professional/occupational',
-    'professional/scientific',
-    'professional/volunteer',
-    'professionalise',
-    'professionalisms',
-    'professionalists',
-    'professionally-applied',
-    'professionally-built',
     'professionally-defined',
-    'professionally-presented',
-    'professionally-run',
-    'professionally-sound',
-    'professionally-trendy',
-    'professionallyinstalled',
-    'professionals-particularly',
-    'professionals.chris',
-    'professionals.ps',
-    'professionals/managers',
-    'professionals/specialists',
-    'professionel',
-    'professions.',
-    'professof',
-    'professonals',
-    'professor&mdash;i',
     'professor-elect',
-    'professor-student',
-    'professor/associate',
-    'professorate',
-    'professoriat',
-    'professors&mdash;and',
-    'professors&mdash;moorcroft',
-    'professsion',
-    'professsor',
-    'profetas',
-    'proffesor',
-    'proffessional',
-    'proffitt/curator/slimbridge',
-    'proffwyddi',
-    'profi/trekker/pf',
-    'profibrinolytic',
     'proficiencies',
-    'profid',
-    'profile-building',
-    'profile-fitting',
-    'profile-reporting',
-    'profiles/records',
-    'profilews17',
-    'profilometers',
-    'profils',
-    'profit&rehy;centred',
-    'profit&rehy;generating',
-    'profit&rehy;sharing',
-    'profit-achievements',
-    'profit-based',
-    'profit-bashing',
-    'profit-centred',
     'profit-centres',
-    'profit-friendly',
-    'profit-goals',
-    'profit-governed',
-    'profit-improver',
-    'profit-makers',
-    'profit-margin',
-    'profit-maximisation',
-    'profit-maximisers',
-    'profit-maximizer',
-    'profit-mission',
-    'profit-reducing',
-    'profit-sacrificing',
-    'profit-standard',
-    'profit-taker',
-    'profit-taking-the',
     'profit-to-cost',
-    'profit-winning',
-    'profit-yielding',
-    'profit.',
-    'profit/and/or',
-    'profit/nonprofit',
-    'profitabilities',
-    'profitability.',
-    'profitable&mdash',
-    'profitablilty',
-    'profitboss.',
-    'profitebatur',
-    'profiterole',
-    'profiteth',
-    'profitization',
-    'profitproducing',
     'profits-and-loss',
-    'profits-related',
-    'profitwise',
-    'profligately',
-    'profligation',
-    'profluvium',
-    'profond',
-    'profond&eacute;ment',
-    'profondo',
-    'proformance',
-    'proformas',
-    'profound/multiple',
-    'profounds',
-    'proft',
-    'profu',
-    'profuction',
     'profumos',
-    'profundus',
-    'profusedly',
-    'profusive',
-    'prog-thrash',
-    'progalyne',
-    'progamme',
-    'progation',
-    'progen',
-    'progenies',
-    'progenitive',
-    'progenitress',
-    'progenitrix',
-    'progenoids',
-    'progess-based',
-    'progession',
     'progessive',
-    'progesterone-only',
-    'progestogen-only',
-    'progetto',
-    'progfolk-jazz-r&amp;b',
-    'progged',
-    'proggy',
-    'progility',
-    'progna',
-    'prognanil',
-    'prognathism',
-    'progno',
-    'prognostically',
-    'prognosticated',
-    'prognostics',
-    'progoda',
     'progoff',
-    'progradation',
-    'progradational/aggradational',
-    'program&mdash;and',
-    'program(s)/sub-system',
-    'program-crunching',
-    'program-trading',
-    'program-writing',
-    'program.ini',
-    'program/',
-    'program/6000',
-    'program/channel',
-    'program/delete',
-    'program/microcomputer',
-    'program1',
-    'program_so',
     'programa',
-    'programatic',
-    'programatically',
-    'programed',
-    'programma',
-    'programmar',
-    'programmatist',
-    'programme&mdash;described',
-    'programme&mdash;risking',
-    'programme-cum-chat',
-    'programme-driven',
-    'programme-even',
-    'programme-note',
-    'programme-of-the-moment',
-    'programme-to-programme',
-    'programme.',
     'programme.e',
-    'programme.you',
-    'programme/activity',
-    'programme/period',
-    'programme/plus',
-    'programme/tickets',
-    'programmed/preset',
-    'programmer(s)',
-    'programmer/analyst',
-    'programmers/analysts',
-    'programmes*',
-    'programmes.e',
-    'programmes/',
-    'programmeur',
-    'programmme',
-    'programnykh',
     'programs/software',
-    'programs=com',
-    'progres&rehy;sive',
-    'progresista',
-    'progress\'&mdash',
-    'progress-chasing',
-    'progress-gap',
-    'progress-how',
-    'progress-not',
-    'progress-retarded',
-    'progress.what',
-    'progressieve',
-    'progressifs',
-    'progressio',
-    'progressista',
-    'progressive-part',
     'progressive/oppressive',
-    'progressively-minded',
-    'progressively-rising',
-    'progressivists',
-    'progresssion',
-    'progressus',
-    'progrmme',
-    'proguanin',
-    'progy',
-    'prohib',
-    'prohibitable',
-    'prohibited\'',
-    'prohibited.',
-    'prohibitely',
-    'prohm',
-    'proiezioni',
     'proile',
-    'proimager',
-    'projecs',
-    'project&mdash;a',
-    'project&rehy;manage',
-    'project(s)',
-    'project-by-project',
-    'project-finance',
-    'project-funded',
-    'project-independent',
-    'project-involvement',
-    'project-led',
-    'project-linked',
-    'project-management',
-    'project-manages',
-    'project-orientated',
     'project-purchased',
-    'project-specific',
-    'project.a',
-    'project.the',
-    'project/organization',
-    'project/topic',
-    'project_with',
-    'projectile-firing',
-    'projectile-vomited',
-    'projections.',
-    'projections/statements',
-    'projects-',
-    'projects/topics',
-    'projectural',
-    'projectwoche',
-    'projectx.001',
     'projectx.002',
-    'projecty',
-    'projekte/late',
-    'projetion',
-    'projiss',
-    'prokappa',
-    'prokarvotic',
-    'prokofieff',
-    'prokopava',
-    'prokopenko',
-    'prokopie',
-    'prokopis',
-    'prokopovich',
-    'prokopsk&aacute',
-    'prokosch',
-    'prokovief',
     'proktos',
-    'prol&eacute;tarien/monoma',
-    'prol&eacute;tarien/mpitolona',
-    'prolactinomas',
-    'prolains',
-    'prolapses',
-    'prolarised',
-    'prolegomenon',
-    'prolepsis',
-    'proleptically',
-    'proletarianise',
-    'proletarianising',
-    'proletarianism',
-    'proletarianizing',
-    'proliant',
-    'prolier-than-thou',
     'prolifera',
-    'proliferation/',
-    'prolific-growing',
-    'proligesterone',
-    'prolines',
-    'prologue.4',
-    'prolongare',
-    'prolonged.',
-    'prolongeth',
-    'prolongued',
-    'prolongueur',
-    'prolsq',
-    'promachos',
-    'promade',
-    'promarily',
-    'promary',
     'promatch',
-    'promax',
-    'promberton',
-    'promecotheca',
-    'promena',
-    'promenade&ndash;fleetwood',
-    'promenade/how',
-    'promenadenstrasse',
-    'promentalshitback',
-    'promesse',
-    'promessi',
-    'promethacine',
-    'prometheuses',
-    'promin',
-    'prominant',
-    'prominence.',
     'prominentlibel',
-    'prominut&iacute',
-    'promise\'',
-    'promise-breakers',
-    'promise-filled',
-    'promise-he',
-    'promise/contract',
-    'promisees',
-    'promises/all',
-    'promisin\'',
-    'promising-seeming',
-    'promising-very',
-    'promising.looking',
-    'promisingly-entitled',
-    'promisingly-titled',
-    'promisors',
     'promist',
-    'promkunaram',
-    'prommeger',
-    'promnotion',
-    'promo&ndash;on',
-    'promo&rehy;tional',
-    'promo&rehy;tions',
-    'promo-clips',
-    'promo-treadmill',
-    'promodes/dirsa',
-    'promonocyte',
-    'promonocytic',
-    'promot&rehy;ing',
-    'promotability',
-    'promotees',
-    'promoter-containing',
     'promoter-cum-accountant',
-    'promoter-lacz',
-    'promoter-specific',
-    'promoter.',
-    'promoters.',
-    'promotersct01',
-    'promoting/improving',
-    'promotion-challengers',
-    'promotion-clinching',
-    'promotion-play',
-    'promotion-pushing',
-    'promotion-relegation',
-    'promotion-seeking',
-    'promotion-wise',
-    'promotion/',
-    'promotional-based',
     'promotionals',
-    'promotionaries',
-    'promotionless',
-    'promotions-and-appointments',
-    'promotions.',
-    'promotions/laughing',
-    'promotions/merchandising',
-    'promotor-remotor',
-    'promotrans',
-    'prompt-box',
-    'prompt.',
-    'prompt/delayed',
-    'prompting-lines',
-    'prompting_according',
-    'promptingly',
-    'prompture',
     'promter',
-    'promulgations',
-    'promulgators',
-    'promyelocytic',
-    'promysly',
-    'promzina',
-    'pron.',
-    'pronaos',
-    'pronatalism',
-    'pronatalist',
-    'pronating',
-    'pronators',
-    'pronav',
-    'pronet',
-    'prong-horn',
-    'prong-horned',
     'pronghorn',
-    'proni',
-    'pronking',
-    'pronominal-anaphoric',
-    'pronominalisations',
-    'pronominalized',
-    'pronominally',
-    'pronostic',
-    'pronotum',
-    'pronoun-less',
-    'pronoun.',
-    'pronounc',
-    'pronounced&mdash',
-    'pronouncements.',
-    'pronouncer',
-    'pronounciation',
     'pronoune',
-    'prontissimo',
-    'pronunziamento',
-    'pronuptia-youngs',
-    'prood',
-    'prooem.',
-    'prooemium',
-    'proof-',
-    'proof-bringing',
-    'proof-defying',
-    'proof-if',
-    'proof-of-concept',
-    'proof-print',
-    'proof-pulling',
-    'proof-taking',
-    'proof-theoretic',
     'proof.just',
-    'proof/',
-    'proof/an',
-    'proof/jury',
-    'proofe',
-    'proofers',
-    'proop',
-    'prooshan',
-    'proosian',
-    'proosians',
-    'proost',
-    'prooving',
-    'prop&rehy;aganda',
-    'prop&rehy;powered',
-    'prop\'r',
-    'prop-1-ene',
     'prop-builders',
-    'prop-disc',
-    'prop-discs',
-    'prop-driven',
-    'prop-forward',
-    'prop-hooker',
-    'prop-shaft',
-    'prop-up',
-    'propafilm',
-    'propaganda&rehy;figure',
-    'propaganda-propaganda',
-    'propaganda-sweeting',
-    'propaganda/programme',
-    'propagandise',
-    'propagandists.',
-    'propagation/quarantine',
     'propagative',
-    'propanoic',
-    'propanolol',
-    'propapack',
-    'propazine',
-    'propeller-heads',
-    'propeller-like',
-    'propeller.',
-    'propellers.',
-    'propellor-driven',
-    'propend',
-    'propenes',
-    'proper-nouns',
-    'propera',
-    'properer',
-    'properites',
     'properly&rehy;one',
-    'properly*',
-    'properly-arranged',
-    'properly-balanced',
-    'properly-defined',
-    'properly-funded',
-    'properly-i',
-    'properly-informed',
-    'properly-laid',
-    'properly-led',
-    'properly-made',
-    'properly-managed',
-    'properly-organised',
-    'properly-pulled',
-    'properly-qualified',
-    'properly-regulated',
     'properly-rigged',
-    'properly-working',
-    'properly.julian',
-    'propero',
-    'properous',
-    'propers',
-    'propertarians',
-    'propertian',
-    'properties&mdash;for',
-    'properties-',
-    'properties-each',
-    'properties-including',
-    'properties-investigate',
-    'properties-so',
-    'properties.it',
-    'properties_so',
     'propertly',
-    'propertraining',
-    'property&mdash;business',
-    'property-backed',
-    'property-by-property',
-    'property-claims',
-    'property-company',
-    'property-complex',
-    'property-conscious',
-    'property-damaging',
-    'property-deals',
-    'property-disputes',
-    'property-for-property',
-    'property-insurance',
-    'property-investment',
-    'property-it',
     'property-meanings',
-    'property-nucleus',
-    'property-orientated',
-    'property-ownership',
-    'property-poll',
-    'property-price',
-    'property-rights',
-    'property-temperature',
-    'property-which',
-    'property/lack',
-    'property/luggage',
-    'property_subject',
-    'propgagating',
-    'proph&emacr;tes',
-    'proph.',
-    'prophecized',
     'prophetic-dreams',
-    'prophetic-liberating',
-    'prophetically-minded',
-    'prophit',
-    'prophylactics',
-    'propinquitous',
-    'propinquus',
-    'propiska',
-    'propitiates',
-    'propitiatingly',
-    'propitiatio',
-    'propitie',
-    'propo',
-    'propodeum',
-    'propodium',
-    'propoerties',
     'propogation',
-    'propolactic',
-    'propolice',
-    'proponer',
-    'proponerentur',
-    'propor&rehy;tionally',
-    'proporia',
-    'proportion_to',
-    'proportionalisms',
-    'proportionally-reduced',
-    'proportions&rehy;thirty',
-    'proports',
-    'proposal&mdash;an',
-    'proposal-either',
-    'proposal-review',
-    'proposd',
     'proposedly',
-    'proposition_because',
-    'proposition_in',
-    'propositionally',
-    'propositum',
-    'propounder',
-    'propping-up',
-    'propranolol/',
-    'propre.',
-    'proprely',
-    'proprement',
-    'propri&eacute;t&eacute;s',
-    'propriate',
-    'proprietaires',
-    'proprietarial',
-    'proprietary-based',
     'proprietary-branded',
-    'proprietatibus',
-    'proprieters',
-    'proprietership',
-    'proprietess',
-    'proprietibus',
-    'proprietresses',
-    'proprietry',
-    'proprinters',
-    'proprioceptors',
-    'proprotionate',
-    'propser',
-    'propshafts',
-    'propst',
-    'propugnatorius',
-    'propwash',
     'propwash-induced',
-    'propylaea',
-    'propylgallate',
-    'proregulationists',
-    'prorender',
-    'prorogates',
-    'proroguing',
-    'prorsus',
-    'prorutori',
-    'prosaic-sounding',
-    'prosar',
-    'proscar',
-    'proscicard',
-    'proscot',
-    'proscript',
-    'proscuting',
     'prosdociumus',
-    'prose-character',
-    'prose-characters',
-    'prose-man',
-    'prose-sermons',
-    'prose-soliloquy',
-    'prose-speaker',
-    'prose-speakers',
-    'prose-styles',
-    'prose-writing',
-    'prose-writings',
-    'prose.',
-    'prosectued',
-    'prosecuition',
-    'prosecution-minded',
-    'prosecution.',
     'prosecutons',
-    'prosecutrix',
-    'prosecutuionb',
-    'prosee',
-    'proselytisation',
-    'proselytises',
-    'proselytized',
-    'prosen',
-    'proseoia',
-    'prosepene',
-    'proserpinacoides',
-    'proseution',
-    'proshare-mori',
-    'prosig',
-    'prosignias',
-    'prosim',
     'prosimii',
-    'prosing',
-    'prosist',
-    'prositus',
-    'proskovief',
-    'proskynesis',
-    'prosobee',
-    'prosobranch',
-    'prosobranchs',
-    'prosodically',
-    'prosodics',
-    'prosodies',
-    'prosopis',
-    'prosopitis',
-    'prosopograhy',
-    'prosopography',
     'prosorba',
-    'prospec',
-    'prospecci&oacute;n',
-    'prospecls',
-    'prospect-refuge',
-    'prospect-viewers',
-    'prospective-only',
-    'prospectiveness',
-    'prospectivesurveillance',
-    'prospects.',
-    'prospectus.',
-    'prosperity-of',
-    'prospero-like',
-    'prospettive',
-    'prosposed',
-    'pross',
     'prossie',
-    'prost-mansell',
-    'prostaglandine',
-    'prostalandins',
-    'prostanoid',
-    'prostates',
-    'prostatic-specific',
-    'prostatodynia',
-    'prostglandin',
-    'prostheca',
-    'prosti',
-    'prostigmine',
-    'prostite',
-    'prostititis',
-    'prostitu',
-    'prostitues',
     'prostitute\'-',
-    'prostitute-protagonist',
-    'prostitute-related',
-    'prostitutional',
-    'prostomium',
-    'prostor',
-    'prostostrongylus',
-    'prostranthera',
-    'prostrate.',
-    'prostyakov',
-    'prostyle',
-    'prosunt',
-    'prosyndrome',
-    'prot&eacute;g&eacute;es',
-    'prot&eacute;g&eacute;s-turned-scoundrels',
-    'prot&eacute;ge&eacute',
     'prot&eacute;gees',
-    'prot&eacute;qe',
-    'prot&ecirc;g&ecirc',
-    'prot/6460/80',
-    'prot=s:rwed',
-    'prota',
-    'protaganist',
-    'protaganists',
-    'protaglandin',
-    'protaglandins',
-    'protandry',
-    'protaphane',
-    'protasius',
-    'protasov',
-    'protctive',
-    'prote',
     'protean-like',
-    'proteas',
-    'protease-resistant',
-    'proteasomes',
-    'protecion',
-    'protect-the',
-    'protect-themselves',
-    'protectant',
-    'protected&mdash;as',
-    'protected&mdash;no',
-    'protected&mdash;sidekick',
-    'protected-mode',
-    'protectingthe',
-    'protection\'',
-    'protection(consolidation)',
-    'protection-cum-deterrence',
     'protection-forests',
-    'protection-motivation',
-    'protection-pollution',
-    'protection-seeking',
-    'protection-zone',
-    'protection-zone&lt;s&gt',
-    'protection/improvement',
-    'protectorat',
-    'protectrice',
-    'protee',
-    'proteg&mdash;e',
-    'protegee',
-    'proteggeri',
-    'protein\'',
-    'protein-',
-    'protein-2',
     'protein-a-sepharose',
-    'protein-backbone',
-    'protein-building',
-    'protein-coding',
-    'protein-contacting',
-    'protein-derived',
-    'protein-energy',
-    'protein-fed',
-    'protein-free',
-    'protein-lipid',
-    'protein-nucleic',
-    'protein-oligonucleotide',
-    'protein-packed',
-    'protein-rich-diet',
-    'protein-sepharose',
-    'protein-starved',
     'protein-synthesising',
-    'protein-synthesizing',
-    'protein-tree',
-    'protein/fibre',
-    'protein/glutathione-sepharose',
-    'protein/kg',
-    'protein/moisture',
-    'protein/nucleotide',
-    'protein/protein',
-    'protein/reporter',
-    'protein:protein',
-    'proteines',
-    'proteinic',
-    'proteins.',
-    'proteinurial',
-    'protelene',
     'protentiate',
-    'protentiation',
-    'proteo-',
-    'proteoglycan-bound',
-    'proteoglycan-immobilized',
-    'proteolyzed',
-    'proteplex',
-    'protergum',
-    'protessor',
-    'protest-in-itself',
-    'protest-morality',
-    'protest-prone',
-    'protestant-catholic',
-    'protestant-dominated',
-    'protestant-educated',
-    'protestant-led',
     'protestante',
-    'protestantischer',
-    'protestations-',
-    'protestors.',
-    'proteu',
-    'protevangelium',
-    'protext',
-    'protg',
-    'prothero/hereford',
-    'protherough/aylestone',
-    'prothiophos',
-    'prothrombin-converting',
-    'protic',
-    'protimeter',
-    'protion',
-    'protist',
     'protista',
-    'protium',
-    'protner',
-    'proto&rehy;democracy',
-    'proto&rehy;industrial',
-    'proto\'-belief',
-    'proto-australoid',
-    'proto-bankers',
-    'proto-beliefs',
-    'proto-brechtian',
-    'proto-capitalists',
-    'proto-carbohydrate',
-    'proto-caucasian',
-    'proto-class',
-    'proto-continents',
-    'proto-cubist',
     'proto-dadaist',
-    'proto-dionysian',
-    'proto-do',
-    'proto-dramatic',
-    'proto-echinoderm',
-    'proto-ecumenical',
-    'proto-fauve',
-    'proto-form',
-    'proto-funky',
-    'proto-gardens',
-    'proto-glitterati',
-    'proto-green',
-    'proto-hippychick',
-    'proto-impressionist',
-    'proto-industrialists',
-    'proto-jpl',
     'proto-keynesian',
-    'proto-kimberlitic',
-    'proto-lens',
-    'proto-life',
-    'proto-luke',
-    'proto-lung',
-    'proto-majorese',
-    'proto-malays',
-    'proto-middle',
-    'proto-minimalism',
-    'proto-modernisers',
-    'proto-modernism',
-    'proto-monetarist',
-    'proto-nazi',
-    'proto-nerve',
-    'proto-norms',
     'proto-oncogenic',
-    'proto-ovum',
-    'proto-palladian',
-    'proto-plume',
-    'proto-proletariat',
-    'proto-realist',
-    'proto-reptiles',
-    'proto-roman',
-    'proto-satirical',
-    'proto-sciences',
-    'proto-sinaitic',
-    'proto-south',
-    'proto-surrealist',
-    'proto-symbolist',
-    'proto-temple',
-    'proto-texts',
     'proto-type',
-    'proto-underground',
-    'proto-wings',
-    'protoblues',
-    'protocell',
-    'protoclusters',
-    'protocol-and-agenda-laden',
-    'protocol-based',
-    'protocol-compliant',
-    'protocole',
-    'protocolectomy',
-    'protofeminist',
-    'protogalaxies',
-    'protoge',
-    'protogram',
-    'protogynous',
     'protogyny',
-    'protolife',
-    'protomammals',
-    'protomer',
-    'protomers',
-    'proton-detected',
-    'proton-deuteron',
-    'proton-neutron',
-    'proton-neutron-electron',
-    'proton/electron',
-    'protonational',
-    'protonoan',
-    'protonsil',
-    'protopathic',
-    'protoperidinium',
-    'protoplanet',
     'protoplasm.',
-    'protopterus',
-    'protore',
-    'protoreaster',
-    'protoreligious',
-    'protoscan',
-    'protoscientists',
-    'protosoft',
-    'protosol',
-    'protosuchus',
-    'protosun',
-    'protosuns',
-    'prototype\'',
-    'prototype-build',
-    'prototype-of',
-    'prototype.',
     'prototype/testing',
-    'prototypic',
-    'protoview',
-    'protoxin',
-    'protozoal/fluke',
-    'protozoology',
-    'protra',
-    'protrac',
-    'protractedly',
-    'protracts',
-    'protreptikos',
-    'protrusive',
-    'protta',
-    'protuded',
-    'protuding',
-    'protype',
     'proud&mdash;she',
-    'proud-blooded',
-    'proud-rounded',
-    'proud/',
-    'proude',
-    'prouded',
-    'proudhonist',
-    'proudies',
-    'proudly-maintained',
-    'proudr',
-    'proulx',
-    'proun',
-    'prounced',
-    'prourokinase',
-    'proused',
-    'prousse',
     'prout&eacute',
-    'proute',
-    'prouten',
-    'prouville',
-    'prouvost',
-    'provacatively',
-    'provarian',
-    'provde',
-    'prove&ncedil;cal',
-    'prove.',
-    'prove/the',
-    'proved_once',
-    'proven&ccedil;al-print',
-    'proven&ccedil;al-style',
-    'proven&rehy;cale',
-    'proven-am',
     'provenals',
-    'provencales',
-    'provenly',
-    'proverb-spinner',
-    'proverbials',
-    'providal',
-    'provide&lsqb;d&rsqb',
-    'provide\'',
-    'provided\'',
-    'providees',
-    'providences',
-    'providenciae',
-    'providentia',
-    'providently',
-    'provider&mdash;often',
-    'provider-centred',
     'provider-client',
-    'provider/space',
-    'provides.a',
-    'providi',
-    'providin\'',
-    'providiteurs',
-    'provin&ccedil;al',
-    'provin\'',
-    'province&mdash;the',
-    'provinces&mdash;would',
-    'provincial-chronicle',
-    'provincial-theatre',
-    'provincial/english',
-    'provincialis',
-    'provincialisation',
-    'provincien',
     'provinciis',
-    'provinsbanken',
-    'provis&oacute;ria',
-    'provision&mdash;s740&mdash;can',
-    'provision\'',
-    'provisional&mdash;drawn',
-    'provisional-controlled',
-    'provisionalism',
-    'provisionals.',
-    'provisioner',
-    'provisions&mdash;he',
-    'provisions-',
-    'provisive',
-    'provison',
-    'provisonal',
-    'provisor',
     'provisorium',
-    'provita',
-    'provital-h',
-    'provitamin',
-    'provivo',
-    'provocateuse',
-    'provocation&ndash;neutralisation',
-    'provocation:does',
-    'provocatively-titled',
-    'provocatory',
-    'provogue',
-    'provokation',
-    'provoked/mistreated',
-    'provoker',
-    'provokin\'',
-    'provosmarshal',
     'provyded',
-    'prowd',
-    'prowl-boys',
-    'proworks/teamware',
-    'prowse/unison',
-    'prowting',
-    'proxemics',
-    'proxicromil',
-    'proximal/distal',
-    'proximation',
-    'proximities',
-    'proxy&mdash',
-    'proxyholder',
-    'proyectos',
-    'proz',
-    'prozess',
     'prozone',
-    'prozor',
-    'prpety',
-    'prposals',
-    'prr-ip',
-    'prrrit',
-    'prrs',
-    'prs-licenced',
-    'prs.',
-    'prs/eggle',
-    'prsent',
-    'prses',
-    'prsu',
-    'prt&num;-1',
-    'prt463330-1',
-    'prtc',
     'prtein',
-    'prtl',
-    'prtly',
-    'prty',
-    'pru-it',
-    'pru-nella',
-    'pruce',
-    'prudencio',
-    'prudhon',
-    'pruffle',
-    'prufrockian',
-    'pruger',
-    'pruinosus',
-    'pruit',
-    'pruit-early',
-    'pruitt-igoe',
     'pruject',
-    'prum',
-    'prunastri',
-    'prune-coloured',
-    'prune-faced',
-    'pruned-off',
-    'pruned-up',
-    'pruni&egrave;res',
-    'prunieres',
-    'pruning-knives',
-    'prunish',
-    'prunner',
-    'prunuses',
-    'prurgh',
-    'prurient/puritanical',
-    'pruritis',
     'prus',
-    'prusias',
-    'pruss',
-    'prussian&ndash;napoleonic',
-    'prussian-controlled',
-    'prussian-held',
-    'prussion',
-    'prusssia',
-    'pruteen&reg',
-    'prvoven&ccaron;ani',
-    'prw1008',
-    'prw1009',
-    'prw2',
-    'pry-bar',
-    'pryce/reporting',
-    'pryce/worcester',
     'pryces',
-    'prydain',
-    'prydein',
-    'pryme',
-    'pryor/john',
-    'pryors',
-    'prys-davies',
-    'prysche',
-    'pryse',
-    'prysg',
-    'prytaneia',
-    'prytaneum',
-    'pryvie',
-    'przewalskii',
-    'przkladnica',
-    'przno',
     'przyklenk',
-    'ps-2',
-    'ps-led',
-    'ps-parachute',
-    'ps-psc',
-    'ps-reading',
-    'ps.1',
-    'ps.119',
-    'ps.2',
-    'ps.3',
-    'ps.4',
-    'ps.6',
-    'ps.x63.653',
-    'ps.xen',
-    'ps/2-',
-    'ps/2-compatible',
     'ps/v',
-    'ps1',
-    'ps2/30-286',
-    'ps2/model',
-    'ps23',
-    'ps3270',
-    'ps5900',
-    'ps65',
-    'ps853',
-    'ps915',
-    'psabm',
-    'psac',
-    'psad',
-    'psakhis',
-    'psallat',
-    'psalm-composers',
     'psalm-motet',
-    'psalm-tunes',
-    'psalm-writer',
-    'psalmi',
-    'psalmically',
-    'psalmists',
-    'psalmodic',
-    'psalteries',
-    'psalvgau',
-    'psamma',
-    'psammetzchus',
-    'psamtik',
-    'psarouda-benakif',
-    'psc&mdash;christian',
-    'psc-psoe',
-    'psc.',
     'psc/psoe',
-    'psch',
-    'pschyo-motor',
-    'pscript.drv',
-    'psd&mdash;democratic',
-    'psda',
-    'psdec',
-    'psdi&mdash;italian',
-    'pse-binding',
-    'pseaulmes',
-    'pseaumes',
-    'psectrum',
-    'psephopololis',
-    'psephos',
-    'psephurus',
-    'pseudapostolorum',
     'pseudepigrapha',
-    'pseudflesh',
-    'pseudo&rehy',
-    'pseudo&rehy;academic',
-    'pseudo&rehy;bulbar',
-    'pseudo&rehy;hegelian',
-    'pseudo&rehy;professionals',
-    'pseudo-\'folk\'',
-    'pseudo-actuality',
-    'pseudo-adjectives',
-    'pseudo-affixed',
-    'pseudo-albanian',
-    'pseudo-altar',
-    'pseudo-ambassador',
-    'pseudo-anonymous',
-    'pseudo-anthropological',
     'pseudo-apse',
-    'pseudo-archaism',
-    'pseudo-aristeas',
-    'pseudo-aristocratic',
-    'pseudo-art',
-    'pseudo-arthritis',
-    'pseudo-authenticity',
-    'pseudo-authority',
-    'pseudo-autobiography',
-    'pseudo-bishops',
-    'pseudo-bohemian',
-    'pseudo-britain',
-    'pseudo-bubo',
-    'pseudo-centre',
-    'pseudo-changes',
-    'pseudo-citizen',
     'pseudo-clients',
-    'pseudo-communication',
-    'pseudo-cottagey',
-    'pseudo-crocodiles',
-    'pseudo-debate',
-    'pseudo-deixis',
-    'pseudo-democratic',
-    'pseudo-denis',
-    'pseudo-denys',
-    'pseudo-dickensian',
-    'pseudo-dionysians',
-    'pseudo-dionysus',
-    'pseudo-dramatic',
-    'pseudo-dreams',
-    'pseudo-ecological',
-    'pseudo-ecumenical',
     'pseudo-education',
-    'pseudo-egalitarianism',
-    'pseudo-egyptian',
-    'pseudo-emblema',
-    'pseudo-enquiry',
-    'pseudo-escaperoutes',
-    'pseudo-eternity',
-    'pseudo-ethnic',
-    'pseudo-evolutionary',
-    'pseudo-expert',
-    'pseudo-faith',
-    'pseudo-family',
-    'pseudo-female',
-    'pseudo-fishes',
-    'pseudo-flies',
-    'pseudo-gentility',
     'pseudo-georgian',
-    'pseudo-gonococci',
-    'pseudo-grandeur',
-    'pseudo-guerrillas',
-    'pseudo-hannah',
-    'pseudo-hardcore',
-    'pseudo-heads',
-    'pseudo-hitchcockian',
-    'pseudo-hollandaise',
-    'pseudo-homophone',
-    'pseudo-humanity',
-    'pseudo-hypertrophic',
-    'pseudo-ideal',
-    'pseudo-improvements',
-    'pseudo-individualism',
-    'pseudo-infantile',
     'pseudo-information',
-    'pseudo-intellectuals',
-    'pseudo-interest',
-    'pseudo-intimacy',
-    'pseudo-irish',
-    'pseudo-isidore',
-    'pseudo-isidorean',
-    'pseudo-karst',
-    'pseudo-kinship',
-    'pseudo-lesbian',
-    'pseudo-linguistic',
-    'pseudo-literacy',
-    'pseudo-lizards',
-    'pseudo-macho',
-    'pseudo-marxist',
-    'pseudo-masochism',
     'pseudo-military',
-    'pseudo-military-type',
-    'pseudo-modernism',
-    'pseudo-mythic',
-    'pseudo-natural',
-    'pseudo-needs',
-    'pseudo-networking',
-    'pseudo-news',
-    'pseudo-oak',
-    'pseudo-objective',
-    'pseudo-objectives',
-    'pseudo-official',
-    'pseudo-older-and-wiser',
-    'pseudo-one-dimensional',
-    'pseudo-operation',
-    'pseudo-operations',
     'pseudo-opposite',
-    'pseudo-oriental',
-    'pseudo-parallel',
-    'pseudo-participation',
-    'pseudo-pendentives',
-    'pseudo-period',
-    'pseudo-philanthropist',
-    'pseudo-philosopher',
-    'pseudo-picturesquely',
-    'pseudo-pier',
-    'pseudo-pin',
-    'pseudo-planetarium',
-    'pseudo-platanus',
-    'pseudo-political',
-    'pseudo-pregnancy',
-    'pseudo-privatisations',
     'pseudo-purposeful',
-    'pseudo-radical',
-    'pseudo-realism',
-    'pseudo-reformation',
-    'pseudo-relationships',
-    'pseudo-research',
-    'pseudo-revolutionaries',
-    'pseudo-riemannian',
-    'pseudo-romanists',
-    'pseudo-ruthlessness',
-    'pseudo-sacral',
-    'pseudo-satisfaction',
-    'pseudo-scientists',
-    'pseudo-scottish',
-    'pseudo-scrotum',
-    'pseudo-scylax',
     'pseudo-sectarian',
-    'pseudo-self',
-    'pseudo-shakespearean',
-    'pseudo-significance',
-    'pseudo-ski',
-    'pseudo-sophistication',
-    'pseudo-sound',
-    'pseudo-southern',
-    'pseudo-spatial',
-    'pseudo-stars',
-    'pseudo-statement',
-    'pseudo-sterile',
-    'pseudo-structuralist',
-    'pseudo-subject',
-    'pseudo-synonyms',
-    'pseudo-themis',
     'pseudo-theological',
-    'pseudo-tribal',
-    'pseudo-twofold',
-    'pseudo-typeset',
-    'pseudo-variables',
-    'pseudo-vector',
-    'pseudo-victorian',
-    'pseudo-virtuosity',
-    'pseudo-vitamins',
-    'pseudo-whorish',
-    'pseudo-wombles',
-    'pseudo-xxxx',
-    'pseudo-zealot',
-    'pseudoallergy',
-    'pseudobrachiopods',
-    'pseudobulbs',
     'pseudochyluria',
-    'pseudocleft',
-    'pseudocolochirus',
-    'pseudocontinuous',
-    'pseudocrinites',
-    'pseudodynamic',
-    'pseudoelizabethanism',
-    'pseudoephedrine',
-    'pseudoexcitation',
-    'pseudogamous',
-    'pseudogamy',
-    'pseudogene',
-    'pseudohermaphroditism',
-    'pseudohistorical',
-    'pseudohomophone',
-    'pseudohomophones',
     'pseudohyponatraemia',
-    'pseudoindependence',
-    'pseudoisochromatic',
-    'pseudokarst',
-    'pseudoleather',
-    'pseudolineatus',
-    'pseudoliteracy',
-    'pseudolymphoma',
-    'pseudomagnetic',
-    'pseudomechanical',
-    'pseudomedieval',
-    'pseudomembranous',
-    'pseudomemories',
-    'pseudometallic',
-    'pseudomonad',
-    'pseudomonadaceae',
     'pseudomorphic',
-    'pseudomosaicism',
-    'pseudomyrex',
-    'pseudomysticism',
-    'pseudoperceptions',
-    'pseudoperiodic',
-    'pseudopeziza',
-    'pseudopod',
-    'pseudopodia',
-    'pseudopodium',
-    'pseudopolitical',
-    'pseudopontifices',
-    'pseudopregnancy',
-    'pseudorabies',
-    'pseudorca',
-    'pseudoresearch',
     'pseudorotation',
-    'pseudoryx',
-    'pseudosasa',
-    'pseudosciences',
-    'pseudoscientists',
-    'pseudoscorpions',
-    'pseudosexual',
-    'pseudospawning',
-    'pseudotetrascaccharide',
-    'pseudotsuga',
-    'pseudotumour',
-    'pseudouridine',
-    'pseydocyst',
-    'psg',
-    'psg424',
-    'pshaw',
     'pshht',
-    'pshoow',
-    'pshwishwishwishwish',
-    'psi&mdash;italian',
-    'psi-psi-psi',
-    'psi/department',
-    'psi2-nipenv5-virus',
-    'psig',
-    'psillid',
-    'psilocybin',
-    'psilophyta',
-    'psilophytes',
-    'psiloritis',
-    'psilotripitaka',
-    'psimhis',
-    'psions-lack',
     'psis',
-    'psittaci',
-    'psittacine',
-    'psittacoid',
-    'psittacosaurus',
-    'psl&mdash;polish',
-    'psl-s&mdash;polish',
-    'psl-solidarity',
-    'psla',
-    'pslc',
-    'pslo',
-    'psn/first',
-    'psn/group/last',
-    'psn/last',
-    'psn/window/first',
-    'psoe&mdash;spanish',
     'psoralen',
-    'psoralens',
-    'psosible',
-    'psp64t',
-    'pspice',
-    'pspp',
-    'psr-1744&ndash;24a',
-    'psr1800&ndash;21',
-    'psr18219-10',
-    'psr2224+65',
-    'pss&mdash;san',
-    'psshoooow',
-    'psso',
-    'psssst',
-    'pstn',
-    'psu-formerly',
     'psuc',
-    'psuedo-allegorizing',
-    'psuedo-macho',
-    'psusennes',
-    'psv2neo',
-    'psy-ops',
-    'psycards',
-    'psych-profiles',
-    'psych-tech',
-    'psych-tests',
-    'psychanalytiques',
-    'psychatric',
-    'psyche-regenerative',
-    'psyche/milkman/rocking',
-    'psychedelecists',
-    'psychedelic-funk',
     'psychedelically',
-    'psychedelicious',
-    'psychedlic',
-    'psychia',
-    'psychiatrie',
-    'psychiatrisation',
-    'psychic-type',
-    'psychitaric',
-    'psycho&rehy;biological',
-    'psycho&rehy;logical',
-    'psycho-analyse',
-    'psycho-analysed',
-    'psycho-analysing',
-    'psycho-aromatherapy',
-    'psycho-avenger',
-    'psycho-cop',
     'psycho-darwin',
-    'psycho-discursive',
-    'psycho-dramas',
-    'psycho-dramatic',
-    'psycho-educational',
-    'psycho-endocrinological',
-    'psycho-genital',
-    'psycho-geriatrics',
-    'psycho-grunge',
-    'psycho-hormonal',
-    'psycho-killer',
-    'psycho-kinetic',
-    'psycho-kinetics',
-    'psycho-linguistics',
-    'psycho-linguists',
-    'psycho-medical',
     'psycho-medicine',
-    'psycho-navigation',
-    'psycho-nazi',
-    'psycho-pathological',
-    'psycho-pathology',
-    'psycho-physiology',
-    'psycho-sexual-emotional',
-    'psycho-specific',
-    'psycho-spoor',
-    'psycho-surgery',
-    'psycho-symbolic',
-    'psycho-techno',
-    'psycho-therapist',
-    'psychoacoustic',
-    'psychoan',
-    'psychoanaly',
     'psychoanalyses',
-    'psychoanalytical-cum-anthropological',
-    'psychoanalyzing',
-    'psychobilly',
-    'psychobiographer',
-    'psychobiographical',
-    'psychobiologist',
-    'psychochemical',
-    'psychocultural',
-    'psychodelic',
-    'psychodid',
-    'psychodidae',
-    'psychodrama-type',
-    'psychodramas',
-    'psychoendocrine',
-    'psychoevolutionary',
     'psychogenesis',
-    'psychogeographic',
-    'psychogeographics',
-    'psychogerontology',
-    'psychographics',
-    'psychohistory',
-    'psychokinesis',
-    'psychokinetic',
-    'psycholeech',
-    'psycholical',
-    'psychological-cum-biological',
-    'psychological-el',
-    'psychological-social',
-    'psychological/cognitive',
-    'psychological/emotional',
-    'psychological/intelligence',
     'psychological/physical',
-    'psychological/subjectivist',
-    'psychologically-disturbed',
-    'psychologist-cum-sexual',
-    'psychologist-subject',
-    'psychology\'',
-    'psychology-manipulators',
-    'psychology.',
-    'psychology/youth',
-    'psychomechanical',
-    'psychometrists',
-    'psychoneural',
-    'psychoneuroimmunologists',
-    'psychoneurotic',
-    'psychonic',
-    'psychopathologizes',
     'psychopatic',
-    'psychopharmacologic',
-    'psychopharmacologist',
-    'psychopharmacologists',
-    'psychopharmacology',
-    'psychopharmacy',
-    'psychophotography',
-    'psychophysiologic',
-    'psychoplasm',
-    'psychopolis',
-    'psychopomp',
-    'psychoprofile',
-    'psychoprophilaxia',
-    'psychoprosthetic',
-    'psychoscopes',
-    'psychoscopy',
     'psychosemantics',
-    'psychosexually',
-    'psychosocialization',
-    'psychosocially',
-    'psychosomatically',
-    'psychosurgery',
-    'psychothera',
-    'psychotherapy.as',
-    'psychotogenic',
-    'psychotria',
-    'psychotronic',
-    'psychotrope',
-    'psychrosphere',
-    'psyco',
-    'psycological',
-    'psycopath',
     'psycopathic',
-    'psykter',
-    'psytosanitary',
-    'psyttaleia',
-    'pt&amp;r',
-    'pt&rehy;17',
-    'pt-120',
-    'pt-22',
-    'pt-6',
-    'pt-ir',
-    'pt-r-r-r-r',
-    'pt.ii',
-    'pt/diploma',
-    'pt1',
-    'pt3',
-    'pt35',
     'pt425sx',
-    'pt462/g-ctix',
-    'pt6',
-    'pt6a-64',
-    'pt6a-67b-powered',
-    'pt6as',
-    'pta.',
-    'pta1',
-    'pta1,421,100',
-    'pta10',
-    'pta100',
-    'pta1000',
-    'pta108.4',
-    'pta11.29',
-    'pta18&ndash;22',
-    'pta2,300',
     'pta200',
-    'pta200,000',
-    'pta210',
-    'pta22&ndash;26',
-    'pta22.6',
-    'pta23.5',
-    'pta29,040,000',
-    'pta30',
-    'pta358',
-    'pta36,500,000',
-    'pta37',
-    'pta4.3',
-    'pta40',
-    'pta40&ndash;60',
-    'pta50',
-    'pta584',
     'pta60',
-    'pta70',
-    'pta76',
-    'pta800',
-    'ptac',
-    'ptah-ankh',
-    'ptah-hotep',
-    'ptah-tenen',
-    'ptarmicaeflorum',
-    'ptarnigan',
-    'ptas2.4',
-    'ptas300',
-    'ptas33',
-    'ptas500',
-    'ptas51',
-    'ptdins',
     'ptdins(4)p',
-    'ptdinsp',
-    'ptech',
-    'pteralia',
-    'pteraspid',
-    'pteraspis',
-    'pteridines',
-    'pteridological',
-    'pteridomania',
-    'pteridophilia',
-    'pteridosperm',
-    'pteridospermophyta',
-    'pteriodophytes',
-    'pterobranchs',
-    'pteroclidae.',
-    'pterois',
     'pteromalid',
-    'pteromorphs',
-    'pterophylum',
-    'pterophyta',
-    'pteropuo',
-    'pterosaur',
-    'pterostigma',
-    'pterothorac',
-    'pterothorax',
-    'pterygoid',
-    'ptf',
-    'ptfma',
-    'ptfma200',
-    'ptfma204',
-    'ptfma207',
-    'ptfma209',
     'ptfma210',
-    'ptfma214',
-    'ptfma215',
-    'ptg',
-    'pthisis',
-    'pthrp.',
-    'pthrp=11.0',
-    'pthrp=21.0',
-    'pthrp=4.4',
-    'pthrp=8.3',
-    'ptik',
-    'ptilinopus',
-    'ptilotis',
-    'ptis',
-    'ptisannes',
-    'ptks',
     'ptl9',
-    'ptnrs',
-    'ptolemys',
-    'ptong',
-    'ptooff',
-    'ptp-1b',
-    'ptpase1b',
-    'ptr&num;-1',
-    'ptr&num;-returns',
-    'ptr&num;fnum=ext&num;fnum',
-    'ptr&num;num',
-    'ptr.o',
-    'ptrans',
-    'ptrc',
-    'ptrnaba-1',
-    'ptrr',
     'ptrtype',
-    'pts+10',
-    'pts-100',
-    'pts10',
-    'pts11',
-    'ptsmth',
-    'ptss',
-    'pttp',
-    'ptx',
-    'ptx/backup',
-    'ptx/transaction',
-    'pty.',
-    'ptydepe',
-    'ptymilne',
-    'ptyr2',
-    'ptz18',
     'ptz18r',
-    'pu-980',
-    'pu-erh',
-    'pu2.1',
-    'pu3202',
-    'pu4400',
-    'pu4700',
-    'pu6000',
-    'puanga',
-    'puat',
-    'pub(s)',
-    'pub-crawled',
-    'pub-crawling',
-    'pub-fare',
-    'pub-goer',
-    'pub-grub',
     'pub-owners',
-    'pub-rockers',
-    'pub-singing',
-    'pub-spy-cum-physician',
-    'pub-talk',
-    'pub-theatre',
-    'pub-turned-hotel',
-    'pub-type',
-    'pub.',
-    'pub/club',
-    'pub/disco',
-    'pub/folk',
-    'pub/hotels',
-    'puba',
-    'pubbed',
-    'pubber',
     'pubbers',
-    'pubbing',
-    'pubblicazioni',
-    'puber',
-    'pubfitter',
-    'pubgoer',
-    'pubi',
-    'pubics',
-    'pubinervis',
-    'pubished',
-    'publi',
-    'publi-air',
-    'publia',
-    'public&gt',
-    'public&mdash;private',
-    'public&mdash;the',
     'public\'',
-    'public-appointed',
-    'public-borrowing',
-    'public-broadcasting',
-    'public-choice',
-    'public-debt',
-    'public-decency',
-    'public-domain',
-    'public-finance',
-    'public-garden',
-    'public-library',
-    'public-minded',
-    'public-not',
-    'public-notice',
-    'public-order-threat',
-    'public-owned',
     'public-pressure',
-    'public-procurement',
-    'public-rented',
-    'public-school-educated',
-    'public-school-type',
-    'public-schoolmasters',
-    'public-services',
-    'public-spiritedly',
-    'public-telephone',
-    'public-to-private-sector',
-    'public/',
-    'public/client',
-    'public/community-wide',
-    'public/institutional',
-    'public/media',
-    'public/national',
     'public/political',
-    'public/work',
-    'public:private',
-    'public_at',
-    'publica&rehy;tions',
-    'publicaciones',
-    'publically-owned',
-    'publicas',
-    'publication.',
-    'publication.6',
-    'publication.c',
-    'publication/official',
-    'publication1',
-    'publice',
-    'publichouse',
-    'publicisable',
     'publicise/market',
-    'publicist-turned-producer',
-    'publicit&eacute',
-    'publicitaire',
-    'publicity-conscious',
-    'publicity-grabbing',
-    'publicity-seeker',
-    'publicity-seekers',
-    'publicity-wise',
-    'publicize-they-it',
-    'publicke',
-    'publiclty',
-    'publicly&rehy;traded',
-    'publicly-accountable',
-    'publicly-advertised',
-    'publicly-appointed',
     'publicly-approved',
-    'publicly-expressed',
-    'publicly-held',
-    'publicly-professed',
-    'publicly-provided',
-    'publicly-quoted',
-    'publicly-rented',
-    'publicly-sponsored',
-    'publicspirited',
-    'publicun',
-    'publiespana',
-    'publike',
-    'publiques',
-    'publiscation',
-    'publishd',
-    'published\'',
     'published-the',
-    'published/to',
-    'publisher\'',
-    'publisher(s)',
-    'publisher-at-large',
-    'publisher-cum-bookseller',
-    'publisher-photographer',
-    'publisher/author',
-    'publisher/printer',
-    'publishing&mdash;all',
-    'publishing&mdash;an',
-    'publishing-house',
-    'publishing-printing',
-    'publishing-to-oil',
-    'publishing-to-property',
-    'publishing-to-tableware',
     'publishing/book',
-    'publishing/information',
-    'publishpac',
-    'publisly',
-    'publizieren',
-    'publrs',
-    'publshed',
-    'pubs-for-breweries',
-    'puc-based',
-    'puc118',
-    'puc19&ogr',
-    'puc4k',
-    'puc4kn',
-    'puca',
-    'pucara',
-    'pucca',
     'puccaugg',
-    'puccini-domingo/rudel',
-    'puce-coloured',
-    'puchacz',
-    'puchasers',
-    'puchases',
-    'puchazc',
-    'puchberger',
-    'puchbergs',
-    'puchero',
-    'puchitis',
-    'puchrrt',
-    'puciato',
-    'pucik',
-    'pucill',
-    'puck-ish',
     'pucker-cum-squint',
-    'puckle/assistant',
-    'puckleberries',
-    'puckrik',
-    'pucky',
-    'pucture',
-    'pucusana',
-    'puddang',
-    'puddin\'-race',
-    'pudding(w)',
-    'pudding-',
-    'pudding-bowls',
-    'pudding-faced',
-    'pudding.',
-    'puddingdale',
-    'puddingless',
     'puddinglike',
-    'puddingy',
-    'puddle-duck',
-    'puddle-wharf',
-    'puddleduck',
-    'puddler',
-    'puddlers',
-    'puddlewick',
-    'puddocks',
-    'puddydale',
-    'pudenda-sculpted',
-    'pudendotectus',
-    'pudent',
-    'pudenziana',
-    'pudeur',
-    'pudgier',
     'pudgily',
-    'pudhill',
-    'pudic',
-    'pudica',
-    'pudiera',
-    'pudings',
-    'pudley',
-    'pudlleglum',
-    'pue',
-    'pueble',
-    'puede',
-    'puedes',
-    'puehpd',
-    'puerilely',
-    'puerility',
-    'puerisque',
     'puerte',
-    'puerto-rican',
-    'puertorique&ntilde;o',
-    'puff&rehy;puff',
-    'puff-and-blow',
-    'puff-balls',
-    'puff-jawed',
-    'puff-puff',
-    'puff-puffed',
-    'puff-up',
-    'puffa-puffa-rice',
-    'puffa-waistcoats',
-    'puffas',
-    'puffed-wood',
-    'puffer-fish',
-    'puffery',
     'puffett/club',
-    'puffett/resident',
-    'puffily',
-    'puffings',
-    'puffkins',
-    'puffout',
-    'puffy-eyed',
-    'puffy-lipped',
-    'pug-faced',
-    'pug-like',
-    'pug-loving',
-    'pugachova',
-    'pugan',
-    'pugens',
-    'puget-mahe',
-    'puggaree',
     'pugging',
-    'puggled',
-    'puggy',
-    'pugh/mother',
-    'pugh/samaritans',
-    'pughe',
-    'pughpd',
-    'puglian',
-    'puglistica',
-    'pugman',
-    'pugmen',
-    'pugna',
-    'pugnacious-looking',
-    'pugnacium',
-    'pugni',
-    'pugnorum',
     'pugsly',
-    'pugstyles',
-    'puh',
-    'puhar(f)',
-    'puht',
-    'puhtmet',
-    'pui-wing',
-    'puica',
-    'puigcerver',
-    'puigjane',
-    'puihu',
-    'puing',
-    'puis-je',
-    'puisque',
-    'puitsikkakaa',
-    'pujari',
     'pujas',
-    'pujo',
-    'puka',
-    'pukapukan',
-    'pukar',
-    'pukhov',
-    'pukkah',
-    'puko',
-    'pukraj',
-    'puky',
-    'pul-owt',
-    'pul.',
-    'pulacayo',
-    'pulao',
-    'pulaski',
-    'pulbo',
     'pulbrook',
-    'pulchella',
-    'pulchellus',
-    'pulcheria',
-    'pulcherrima',
-    'pulchra',
-    'pulchri',
-    'pulchritude',
-    'pule',
-    'pulers',
-    'pulford/farmer',
-    'pulgeogioides',
-    'pulgrum.',
-    'pulguk-sa',
-    'pulheim',
-    'pulheim-stommeln',
     'puligny',
-    'pulioll-royall',
-    'pulis',
-    'puliter',
-    'pulitzer-prize',
-    'pulitzers',
-    'puliv',
-    'pulka-pulling',
-    'pulkingham',
-    'pulks',
-    'pull-ability',
-    'pull-away',
-    'pull-backs',
-    'pull-chain',
-    'pull-forward',
-    'pull-free',
     'pull-in/layby',
-    'pull-ins',
-    'pull-keri-ma',
-    'pull-line',
-    'pull-me-up',
-    'pull-pot',
-    'pull-ring',
-    'pull-shift',
-    'pull-shot',
-    'pull-together',
-    'pull-you',
-    'pull-your-belts-in',
-    'pull/push',
-    'pull_each',
-    'pullcord',
-    'pulle',
     'pulled-apart',
-    'pulled-in',
-    'pulled-on',
-    'pulled-together',
-    'pullee',
-    'pulleine',
-    'pullen/royal',
-    'pullens',
-    'puller-down',
-    'pulley-assisted',
-    'pulley-blocks',
-    'pulleyn',
-    'pulliam',
-    'pullien-thompson',
-    'pullin/stroud',
-    'pulling-and-sailing',
     'pulling-away',
-    'pulling-no-punches',
-    'pulling-off',
-    'pulling-up',
-    'pulling.',
-    'pullinger/dragon',
-    'pullings',
-    'pullitzer',
-    'pullng',
-    'pullon/conservative',
-    'pullover-style',
-    'pullover.',
-    'pullwinding',
-    'pulmonary-vessel-wall',
-    'pulmonic',
-    'pulne',
     'pulp&lsqb',
-    'pulp-and-paper',
-    'pulp-magazine',
-    'pulp-mill',
-    'pulp-publisher',
-    'pulp-stories',
-    'pulp.',
-    'pulpa',
-    'pulpable',
-    'pulpboard',
-    'pulpers',
-    'pulpit-building',
-    'pulpit-desk',
-    'pulpit-lectern',
-    'pulpit-theatrical',
-    'pulpiteers',
     'pulpitum',
-    'pulpwood',
-    'pulque',
-    'puls.',
-    'pulsafe',
-    'pulsatile',
-    'pulsating-cusp',
-    'pulse-chargers',
-    'pulse-charging',
-    'pulse-echo',
-    'pulse-feeds',
-    'pulse-field',
-    'pulse-filled',
-    'pulse-generating',
-    'pulse-hammering',
-    'pulse-jet',
     'pulse-labelled',
-    'pulse-light',
-    'pulse-like',
-    'pulse-modulated',
-    'pulse-pounding',
-    'pulse-producing',
-    'pulse-pummelling',
-    'pulse-quickening',
-    'pulse-repetition',
-    'pulse-stimulating',
-    'pulse-taking',
-    'pulse-taking.',
-    'pulse.',
-    'pulse.shaped',
-    'pulse/wave',
-    'pulserates',
     'pulses/second',
-    'pulsilogium',
-    'pulsings',
-    'pulsion',
-    'pulton',
-    'pultruders',
-    'pulverem',
-    'pulverization',
-    'pulvillus-like',
-    'pulvino',
-    'pulvirus',
-    'pulzer',
-    'pum',
-    'puma-kumbha',
-    'puma-like',
-    'puma/postman',
     'pumi',
-    'pumices',
-    'pumicestone',
-    'pumilio',
-    'pumilum',
-    'pumilus',
-    'pummel-vision',
-    'pummelo',
-    'pummy',
-    'pump(s)',
-    'pump-assisted',
-    'pump-attendant',
-    'pump-handles',
-    'pump-leak',
-    'pump-mechanism',
-    'pump-oil',
     'pump-oxygenator',
-    'pump-primers',
-    'pump-primes',
-    'pump-probe',
-    'pump-pulse&rehy;probe-pulse',
-    'pump-returned',
-    'pump-room',
-    'pump-sets',
-    'pump-storage',
-    'pump-water',
-    'pump-wells',
-    'pump/mixer',
-    'pumpboat',
-    'pumpclips',
-    'pumped-out',
-    'pumpernickle',
     'pumpguns',
-    'pumph-pumph',
-    'pumphandle',
-    'pumping/winding',
-    'pumpingpop',
-    'pumpkin-faced',
-    'pumpkin-indented',
-    'pumpkin-like',
-    'pumpkin-seed',
-    'pumpmaker',
-    'pumpman',
-    'pumpokol',
-    'pumps.',
-    'punakaiki',
-    'punamchand',
-    'punch-and-judy',
     'punch-bowl',
-    'punch-bowls',
-    'punch-card',
-    'punch-cards',
-    'punch-like',
-    'punch-lines',
-    'punch-paper',
-    'punch-type',
-    'punch-up.',
-    'punch/save',
-    'punchbowls',
-    'punchdrunkness',
-    'punched-cards',
-    'punched-metal',
-    'punched-out',
-    'punched-tape',
     'punchi',
-    'punchinello',
-    'punchless',
-    'punchmarks',
-    'punct',
-    'punctate',
-    'punctatum',
-    'punctatus',
-    'puncto',
-    'punctuationalist',
-    'punctuationists',
-    'punctulata',
-    'punctulatus',
-    'puncture-proof',
-    'puncture-warning',
-    'punen',
     'punga',
-    'pungars',
-    'pungavie',
-    'pungent-smelling',
-    'pungent-sweet',
-    'pungere',
-    'punget',
-    'pungor',
-    'pungtungia',
-    'pungu',
-    'punia',
-    'punid',
-    'puniest',
-    'punishers-',
-    'punishment&ndash;hey',
-    'punishment\'',
     'punishment-oriented',
-    'punitive-damages',
-    'punitor',
-    'punity',
-    'punjab-related',
-    'punjab.',
-    'punjabi-born',
-    'punk-inspired',
-    'punk-neutrons',
-    'punk-style',
-    'punk/grunge',
-    'punk/kabuki',
-    'punkas',
-    'punked-up',
-    'punkier',
-    'punkin\'-sarse',
     'punknoll',
-    'punkoid',
-    'punkshooayshun',
-    'punksters',
-    'punkt',
-    'punktabulous',
-    'punktitude',
-    'punned',
-    'punnishing',
-    'punou-ki-hihifo',
-    'punsaalmagiyn',
-    'puntalette',
-    'puntar&eacute;nas',
-    'punte',
-    'punter-free',
-    'punter-friendly',
     'punter-ish',
-    'punx',
-    'puny-armed',
-    'puny-looking',
-    'puolue-ydenn&auml;isys',
-    'pup\'',
-    'pup.',
-    'puparium',
-    'pupated',
-    'pupates',
-    'pupford',
-    'puphood',
-    'pupies',
-    'pupil(s)',
-    'pupil-',
-    'pupil-based',
     'pupil-dilation',
-    'pupil-driven',
-    'pupil-elected',
-    'pupil-events',
-    'pupil-expectation',
-    'pupil-friendly',
-    'pupil-initiated',
-    'pupil-less',
-    'pupil-managed',
-    'pupil-masters',
-    'pupil-operated',
-    'pupil-product',
-    'pupil-profiling',
-    'pupil-teaching',
-    'pupil-writer',
-    'pupil.guidance',
     'pupil/',
-    'pupil/patient',
-    'pupil/peer',
-    'pupil/staff',
-    'pupil/student',
-    'pupiless',
-    'pupillages',
-    'pupillare',
-    'pupillari',
-    'pupilless',
-    'pupils&mdash;could',
-    'pupils&mdash;i',
-    'pupils&mdash;my',
-    'pupilsilities',
-    'pupitre',
-    'pupker',
     'pupkin',
-    'puplett',
-    'puported',
-    'puppentheater',
-    'puppet-jointed',
-    'puppet-king',
-    'puppet-making',
-    'puppet-thing',
-    'puppeteering',
-    'puppeting',
-    'puppetmaster',
-    'puppets-usually',
-    'pupping',
-    'puppy-farming',
-    'puppy-like',
-    'puppy-walkers',
     'puppy/front',
-    'puppydog',
-    'puppyfat',
-    'puppyishly',
-    'puppyishness',
-    'puppylike',
-    'puppys',
-    'pupu',
-    'pupuke',
-    'pupwgs',
-    'pupwrf',
-    'pupy',
-    'pur&eacute;s',
-    'pur-',
-    'pur-3',
-    'pur-4',
     'puraspec',
-    'purbeck-isle',
-    'purbright',
-    'purcaru',
-    'purcell-jones',
-    'purcellian',
-    'purcellians',
-    'purch',
-    'purchase&mdash;for',
-    'purchase&mdash;never',
-    'purchase&rehy;money',
-    'purchase\'',
-    'purchase-money',
-    'purchase/goods',
-    'purchase/home',
-    'purchase/marine',
     'purchase/rediscounting',
-    'purchase/rental',
-    'purchase/reserve',
-    'purchase/supplier',
-    'purchase_and_so',
-    'purchaseable',
-    'purchased-',
-    'purchased.',
-    'purchaser&ndash;provider',
-    'purchaser\'',
-    'purchaser\'s/lender',
-    'purchaser\'sassessment',
-    'purchaser/provided',
-    'purchaser/vendor',
-    'purchasers.',
-    'purchases&mdash;can',
     'purchases/',
-    'purchasin\'',
-    'purchasing-officers',
-    'purchasing/providing',
-    'purdah-confined',
-    'purday',
-    'purdies',
-    'purdum',
-    'purdysburn',
-    'pure-beef',
-    'pure-blooded',
-    'pure-breds',
-    'pure-breeds',
-    'pure-intellect',
-    'pure-mindedness',
-    'pure-voiced',
     'pure-water',
-    'pure-wool',
-    'purebdorj',
-    'pureflo',
-    'purely-environmental',
-    'puren',
-    'purench&eacute;cuaro',
-    'pureness',
-    'pures',
-    'puressence',
-    'puressencers',
-    'purevdorj',
-    'purey-cust',
-    'purfield',
-    'purflings',
-    'purgatively',
     'purgings',
-    'purgo',
-    'puriance',
-    'purifica&ccedil;ion',
-    'purilan',
-    'purimachos',
-    'purin',
-    'puritan-inclined',
-    'puritani',
-    'puritanian',
-    'puritano',
-    'purite',
-    'purities',
-    'puritry',
-    'purity-this',
-    'purity/immorality',
     'purkar',
-    'purkis',
-    'purldrops',
-    'purled',
-    'purler',
-    'purleymen',
-    'purloins',
-    'purls',
-    'purlside',
-    'purnell/milton',
-    'purneys',
-    'purnim&amacr',
-    'purnululu',
-    'purolite',
-    'purooses',
-    'purp',
     'purple-and-orange',
-    'purple-banded',
-    'purple-blazered',
-    'purple-blues',
-    'purple-bronze',
-    'purple-embroidered',
-    'purple-faced',
-    'purple-haired',
-    'purple-pink',
-    'purple-pinks',
-    'purple-rich',
-    'purple-satin',
-    'purple-scarlet',
-    'purple-shadowed',
-    'purple-sprouting',
-    'purple-striped',
     'purple-veined',
-    'purple-wax-in-clear-oil',
-    'purple-yellow',
-    'purple/jade/red',
-    'purple/pink/gold',
-    'purpleness',
-    'purplest',
-    'purpley-blue',
-    'purplish-brown',
-    'purplish-pink',
-    'purply-bluish',
-    'purply-grey',
-    'purporse',
-    'purportive',
-    'purpos',
-    'purpose&rehy;made',
     'purpose-bred',
-    'purpose-governed',
-    'purpose-oriented',
-    'purpose-so',
-    'purpose-specific',
-    'purpose-written',
-    'purpose.built',
-    'purposedesigned',
-    'purposeful-looking',
-    'purposesee',
-    'purposive-instrumental',
-    'purpura-a',
-    'purpuratus',
-    'purr-fect',
-    'purra',
-    'purrfect',
     'purringly',
-    'purrings',
-    'purs',
-    'purse-holding',
-    'purse-keepers',
-    'purse-mouthed',
-    'purse-mouths',
-    'purse-netted',
-    'purse-pinched',
-    'purse-seines',
-    'purse-snatcher',
-    'purse-string',
-    'purse5',
-    'pursed-up',
-    'purseful',
-    'pursefuls',
     'purseglove',
-    'pursestrings',
-    'pursglove',
-    'pursu',
-    'pursuable',
-    'pursuading',
-    'pursual',
-    'pursued.',
-    'pursuit(s)',
-    'pursuit-scene',
-    'pursuit_of',
-    'purton/wiltshire',
-    'purtscher',
-    'purun',
-    'purus',
-    'puruse',
     'purusha',
-    'puruvate',
-    'purvine',
-    'purvis&ndash;barrett',
-    'purvis/master',
-    'purvoyeur',
-    'purygin',
-    'pus-formerly',
-    'pus-hued',
-    'pus-like',
-    'pus-oozing',
-    'pus-stained',
-    'pus-stinking',
-    'pusa',
-    'pusca',
-    'puschener',
     'puschkinia',
-    'pusd&mdash;polish',
-    'pusey/citizens',
-    'puseyite',
-    'puseys',
-    'pusfoot',
-    'push&rehy;action',
-    'push\'n\'shove',
-    'push-',
-    'push-and-pull',
-    'push-and-run',
-    'push-and-shove',
-    'push-biking',
-    'push-bright',
-    'push-button/electronic',
-    'push-buzzer',
     'push-downs',
-    'push-lever',
-    'push-me',
-    'push-me-pull-you',
-    'push-on',
-    'push-punch',
-    'push-start',
-    'push-stick',
-    'push-through',
-    'push-to-make',
-    'push.',
-    'pushalong',
-    'pushbar',
-    'pushbikes',
-    'pushch',
-    'pushchair/carrycot',
     'pushdown',
-    'pushdragon',
-    'pusherman',
-    'pushers-in',
-    'pushfit',
-    'pushfitted',
-    'pushiest',
-    'pushing-indie-limits',
-    'pushing/holding',
-    'pushings',
-    'pushkarev',
-    'pushkas',
-    'pushkin-leningrad',
-    'pushman',
-    'pushpit',
-    'pushrods',
     'pushscroll',
-    'pushti',
-    'pushto',
-    'pushtos',
-    'pushtu',
-    'pushy-aggression',
-    'pushy.',
-    'pusiano',
-    'pusillanimously',
-    'pusina',
-    'puska',
-    'puss-in-boots',
-    'puss-puss',
-    'pusses',
-    'pussmoth',
-    'pussy-catted',
     'pussy-whipped',
-    'pussybumping',
-    'pussyfooted',
-    'pussymobile',
-    'pussywillows',
-    'pustaka',
-    'puste',
-    'pustetto',
-    'pustyn',
-    'pusuit',
-    'pusztas',
-    'put\'',
-    'put\'10',
-    'put-call',
-    'put-downable',
-    'put-ring',
     'put-together',
-    'put58',
-    'puta',
-    'putable',
-    'putains',
-    'putane',
-    'putchers',
-    'puteh',
-    'puteoli',
-    'putera',
-    'puthers',
-    'puthparker',
-    'putida',
-    'putiloff',
-    'putilov',
-    'putina',
     'putinki',
-    'putnam/jaguar',
-    'putnams',
-    'putnoe',
-    'putred',
-    'putrefaciens',
-    'putrefactions',
-    'putrefied',
-    'putrefy',
-    'putrescine',
-    'putschist',
-    'putschists',
-    'putsman',
-    'putt-off',
-    'putta',
-    'puttee',
     'putter-in',
-    'putter-off',
-    'putterman',
-    'puttermessers',
-    'puttest',
-    'puttick',
-    'puttied',
-    'putties',
-    'putting-away',
-    'putting-down',
-    'putting-in',
-    'putting-out\'',
-    'puttoc',
-    'puttock',
-    'puttrell&rehy;style',
-    'putty-oyster',
     'puttyfied',
-    'putz',
-    'putzi',
-    'putzie',
-    'putzig',
-    'puy-calvary',
-    'puy-like',
-    'puye',
-    'puyguilhem',
-    'puys',
-    'puysegur',
-    'puysseleyr',
-    'puzynski',
-    'puzzle\'',
-    'puzzle-motets',
-    'puzzle-orientated',
     'puzzle-oriented',
-    'puzzle-player',
-    'puzzlement.',
-    'puzzlements',
-    'puzzlequest',
-    'puzzles.',
-    'puzzlie',
-    'puzzlies',
-    'puzzuoli',
-    'pv-wave:nag',
-    'pv18',
-    'pv=100-%',
-    'pvba',
-    'pvc-checked',
-    'pvc-clothed',
-    'pvc-sheathed',
     'pvda&mdash;labour',
-    'pvi',
-    'pvmd14',
-    'pvr200',
-    'pvui-bamhi',
-    'pvv&mdash;freedom',
-    'pvv/plp',
-    'pw-1080a',
-    'pw1080a',
-    'pw3020',
-    'pwalters',
-    'pwank',
-    'pwbotha',
-    'pwc',
-    'pwe',
-    'pweeese',
     'pwesume',
-    'pwethent',
-    'pwit',
-    'pwllbach',
-    'pwllhelli',
-    'pwllycrochan',
-    'pwooooh',
-    'pwr+',
-    'pwr-generated',
-    'pws/as',
-    'pws/oca',
-    'pwurgh',
-    'px-4',
-    'px/xt',
-    'px4s',
-    'pxana',
     'pxel',
-    'pxgh5',
-    'pxi',
-    'pyac-rc',
-    'pyacrc5',
-    'pyaemia',
-    'pyanj',
-    'pyant',
-    'pybuses',
-    'pychard',
-    'pyck',
-    'pycnogenol',
-    'pycnogonid',
-    'pycnophylactic',
-    'pycombe',
-    'pye-unicam',
     'pyecombe',
-    'pyegrave',
-    'pyelogenic',
-    'pyelography',
-    'pyelonephritogenic',
-    'pyer',
-    'pyers',
-    'pyett',
-    'pyewipe',
-    'pyf-polyester',
-    'pyg',
-    'pyg-motorway',
-    'pygmalionitis',
-    'pygope',
-    'pygurus',
-    'pyh&auml;tunturi',
     'pyhatunturi',
-    'pyhrric',
-    'pyidaungsu',
-    'pyidawtha',
-    'pyithu',
-    'pyjama-game',
-    'pyjama-striped',
-    'pyjama-top',
-    'pyjamas-on',
-    'pyjamas.',
-    'pykering',
-    'pykett',
-    'pykie',
-    'pylai',
-    'pyles',
-    'pylgrimages',
     'pylian',
-    'pylon-burn',
-    'pylor',
-    'pyloroduodenal',
-    'pyloromyotomy',
-    'pym/liberal',
-    'pymer',
-    'pymm',
-    'pymmes',
-    'pyn',
-    'pynt',
-    'pyocanea',
-    'pyocyanases',
-    'pyocyaneus',
-    'pyoderma',
-    'pyogenes',
     'pyoluteorin',
-    'pyong',
-    'pyonggang',
-    'pyonyang',
-    'pyorrhea',
-    'pyorrhoea',
-    'pyot',
-    'pyotts',
-    'pypard',
-    'pypin',
-    'pypu',
-    'pyr',
-    'pyr&eacute;n&eacute;es-atlantique',
-    'pyracanthas',
-    'pyracanthus',
-    'pyralis',
     'pyrame',
-    'pyramid-cities',
-    'pyramid-developed',
-    'pyramid-icl',
-    'pyramid-like',
-    'pyramid-selling',
-    'pyramid-type',
-    'pyramidally',
-    'pyramided',
-    'pyramides',
-    'pyramidical',
-    'pyramids-had',
-    'pyramids/the',
-    'pyranosides',
-    'pyrantel',
-    'pyrates',
     'pyrazinamide',
-    'pyrazine',
-    'pyren&eacute;es-orientales',
-    'pyrenaeus',
-    'pyrenee',
-    'pyreneean',
-    'pyreneeist',
-    'pyreneeists',
-    'pyrennean',
-    'pyrennes',
-    'pyrenomycetes',
-    'pyretheum',
-    'pyrethrum-based',
-    'pyretic',
-    'pyrexial',
-    'pyrexias',
     'pyrford',
-    'pyrg',
-    'pyrgoi',
-    'pyridines',
-    'pyridoxal',
-    'pyridoxal-5-phosphate',
-    'pyrimidinepyrazine',
-    'pyrite-pyrrhotite',
-    'pyrithione',
-    'pyritised',
-    'pyrlysis',
-    'pyro-phosphate',
-    'pyrocarbonate',
-    'pyrog&egrave;ne',
-    'pyrogens',
-    'pyrograph',
     'pyrolized',
-    'pyrolysed',
-    'pyrolyser',
-    'pyroma',
-    'pyromaniacs',
-    'pyromanic',
-    'pyrometer',
-    'pyrometers',
-    'pyropes',
-    'pyrophoric',
-    'pyrophyllite',
-    'pyrosulphite',
-    'pyrotechnician',
-    'pyroxenite',
-    'pyroxine',
-    'pyrozine',
     'pyrrh.',
-    'pyrrhalta',
-    'pyrrho',
-    'pyrrhocoris',
-    'pyrrhothorax',
-    'pyrroles',
-    'pyrrolnitrin',
-    'pyrs',
-    'pyrum',
-    'pyry',
-    'pyschiatrist',
-    'pyschologically',
-    'pyschology',
-    'pysford',
-    'pytalovo',
-    'pytches',
     'pythagor.',
-    'pythagorus',
-    'pythan',
-    'pytheos',
-    'pythians',
-    'pythios',
-    'python-infested',
-    'pythonish',
-    'pythonites',
-    'pyttyll',
-    'pyulori',
-    'pyxidata',
-    'pyxides',
-    'pyxidicula',
-    'pyy.',
-    'pyy/tube',
     'pz865',
-    'pzipneosv(x)',
-    'pzl',
-    'pzl&ndash;101',
-    'pzo92',
-    'pzs',
-    'q&amp;r',
-    'q&amp;s',
-    'q&lsqb',
-    'q&ndash;a',
-    'q&ndash;r',
-    'q&plusmn;a',
-    'q&times;h7&plus',
-    'q\'bit',
-    'q(s)',
-    'q+',
     'q+a',
-    'q-100',
-    'q-banding',
-    'q-boat',
-    'q-bus-based',
-    'q-code',
-    'q-kt7',
-    'q-kt7ch',
-    'q-magazine',
-    'q-max',
-    'q-notice',
-    'q-quarrel',
-    'q-quiet',
-    'q-sepharose',
-    'q-sound',
-    'q-stol',
     'q-t',
-    'q-tee',
-    'q-tex',
-    'q-train',
-    'q-twist',
-    'q-wave',
-    'q.1.d.n.s.',
-    'q.1200',
-    'q.2',
-    'q.29',
-    'q.4',
-    'q.5',
-    'q.6',
-    'q.7',
-    'q.8',
-    'q.9',
     'q.931',
-    'q.e.d.',
-    'q.p.b.',
-    'q.p.b.c.',
-    'q.ts.',
-    'q.u',
-    'q.u.',
-    'q.u.i.t',
-    'q.why',
-    'q/t',
-    'q1&mdash;q4',
-    'q1&ndash;1989',
-    'q105',
-    'q107',
-    'q12',
-    'q13',
     'q1692\'s',
-    'q17',
-    'q18',
-    'q1a',
-    'q20',
-    'q2031',
-    'q21',
-    'q22',
-    'q22.3',
-    'q24',
-    'q25',
-    'q26',
-    'q28',
-    'q284a',
-    'q29',
-    'q2=-q1',
     'q3\'s',
-    'q30',
-    'q300',
-    'q31',
-    'q32',
-    'q33',
-    'q34-formation',
-    'q34/mannosyl',
-    'q34/manq34',
-    'q34insertase',
-    'q4&ndash;1987',
-    'q530',
-    'q6&mdash;appendix',
-    'q6-sized',
-    'q607',
-    'q66.9.',
     'q7.5',
-    'q70',
-    'q873',
-    'q94r',
-    'q=220.5',
-    'q=ap',
-    'q=q1=-q2',
-    'q_l',
-    'qa/qc',
-    'qa3+',
-    'qabalism',
-    'qabrikha',
-    'qac',
-    'qac-bisguanide',
-    'qadaffi',
-    'qadam',
     'qaddaffi',
-    'qadesh',
-    'qadian',
-    'qadisiya',
-    'qadr',
-    'qadri',
-    'qaing',
-    'qaiser',
-    'qalaat',
-    'qalat',
-    'qalaun',
-    'qali',
-    'qality',
-    'qamford',
-    'qan',
-    'qandhari',
     'qangtang',
-    'qanjanfu',
-    'qannai',
-    'qansou',
-    'qantara',
-    'qap',
-    'qapack.fil',
-    'qar',
-    'qarantina',
-    'qaresi',
-    'qartopholos',
-    'qaryal',
-    'qasemlu',
-    'qashqai',
-    'qasi',
-    'qasrawet',
     'qassim',
-    'qatami',
-    'qawaali',
-    'qawasim',
-    'qawi',
-    'qaworkspace',
-    'qaybeh',
-    'qayyumabad',
-    'qazvin',
-    'qazwnin',
-    'qb7',
-    'qbasic.exe',
-    'qbasic.hlp',
-    'qbasic.ini',
-    'qbasic:the',
-    'qbo',
     'qc/defence',
-    'qc/howard',
-    'qc2+',
-    'qc5',
-    'qc6',
-    'qc6+',
-    'qc7+',
-    'qc8',
-    'qcic-w',
-    'qd2',
-    'qd3+',
-    'qd4',
-    'qd6+',
-    'qd8+',
-    'qdwfdvioy',
-    'qe11',
     'qe4+',
-    'qe5',
-    'qedn',
-    'qef',
-    'qegs',
-    'qek-qek-qek-qek',
-    'qelt',
-    'qenah',
-    'qenmo',
-    'qes',
-    'qetchua',
-    'qfi',
-    'qfis',
-    'qfs',
-    'qft1',
-    'qft2',
     'qg',
-    'qg1',
-    'qg2',
-    'qg4&verbar&verbar;bb7&verbar&verbar;14',
-    'qgi',
-    'qh7',
-    'qh8',
-    'qi-chao',
-    'qi660ti',
-    'qiagen',
-    'qianli',
-    'qic',
-    'qic-40',
-    'qic-80',
-    'qichao',
-    'qifeng',
     'qift',
-    'qigc',
-    'qik',
-    'qimeng',
-    'qin-he',
-    'qina',
-    'qinghaosu',
-    'qintall',
-    'qintex',
-    'qit',
-    'qitat',
-    'qite',
-    'qivering',
-    'qj',
-    'qkly',
-    'ql/es/ss/',
     'qlg',
-    'qllc',
-    'qly',
-    'qmacmac',
-    'qmf',
-    'qmi',
-    'qmips',
-    'qmp',
-    'qn',
-    'qn57.1',
-    'qng',
-    'qoboza',
-    'qoted',
-    'qoub',
-    'qp20',
-    'qpo.',
     'qpr&mdash;which',
-    'qpr/newc/norw',
-    'qpro01.tif',
-    'qpro02.tif',
-    'qpro03.tif',
-    'qpro04.tif',
-    'qpro05.tif',
-    'qpro06.tif',
-    'qpro07.tif',
-    'qpro08.tif',
-    'qpsx',
-    'qq5',
-    'qqchinese',
-    'qqfacilities',
-    'qqradlord',
-    'qquasar',
     'qquebec',
-    'qr11,700',
-    'qr4,900',
-    'qr7,800',
-    'qs16&ndash;000vi',
-    'qsars',
-    'qsf',
-    'qsls',
-    'qsound',
-    'qspr',
-    'qstart',
-    'qsubd',
-    'qtac',
-    'qtg',
-    'qthr',
-    'qtxldg',
     'qu&eacute;vy',
-    'qu\'',
-    'qu\'&auml',
-    'qu\'allum&eacute;s',
-    'qu\'appelle',
-    'qu\'une',
-    'qu-quallofil',
-    'qua\'fing',
-    'qua-quer-go',
-    'qua-stu',
-    'qua/2779024/h9',
-    'quaalude-fuelled',
-    'quaavian',
-    'quac-quac-quac',
-    'quackage',
-    'quacker',
     'quackings',
-    'quacky-ducks',
-    'quad-cam',
-    'quad-grams',
-    'quad-x',
-    'quadaffi',
-    'quadagno',
-    'quadam',
-    'quadcam',
-    'quadding',
-    'quade',
-    'quader',
-    'quaderia',
-    'quadflex',
-    'quadflieg',
-    'quadgram',
     'quadgrams',
-    'quadra-based',
-    'quadracci',
-    'quadracci.peters',
-    'quadragesimo',
-    'quadragno',
-    'quadralaterals',
-    'quadram',
-    'quadrangularis',
-    'quadrantanopia',
-    'quadrantid',
-    'quadraphonic-style',
-    'quadraphonics',
-    'quadrathon',
-    'quadratically',
-    'quadratojugal',
     'quadrex',
-    'quadri-axial',
-    'quadricornis',
-    'quadricycle',
-    'quadrifoil',
-    'quadrifolia',
-    'quadrifrons',
-    'quadriglume',
-    'quadrilat',
-    'quadrilateral.',
-    'quadrillage',
-    'quadrillion',
-    'quadrilogue',
-    'quadriplane',
-    'quadriplegia',
-    'quadriplegics',
     'quadripod',
-    'quadriradiatus',
-    'quadrivalent',
-    'quadrivalents',
-    'quadrogesimo',
-    'quadroon',
-    'quadropehnia',
-    'quadrum',
-    'quadruple-axe',
-    'quadruple-glazed',
-    'quadruple-neugebauer',
-    'quadruply',
-    'quadrupoles',
-    'quaeritur',
-    'quaesumus',
-    'quaffer',
     'quaffers',
-    'quag',
-    'quaggers',
-    'quagliati',
-    'quaglino',
-    'quahr',
-    'quaid-e-asam',
-    'quail-hunters',
-    'quail-like',
-    'quail-song',
-    'quaile',
-    'quaint-looking',
-    'quaintly-named',
-    'quaker-grey',
-    'quaker-plain',
-    'quaker-run',
     'quakered',
-    'quakerly',
-    'quakerwake',
-    'quakily-written',
-    'quakke',
-    'quakyi',
-    'qualao',
-    'qualawan',
-    'qualcos\'altro',
-    'qualcuno',
-    'quali&rehy;fications',
-    'qualifat',
-    'qualifiable',
-    'qualifiactions',
-    'qualification(s)',
-    'qualification-oriented',
     'qualification-related',
-    'qualification-related/non-qualification',
-    'qualifications*',
-    'qualifications/background',
-    'qualified-majority',
-    'qualified-teacher',
-    'qualified/experienced',
-    'qualifing',
-    'qualify&mdash;he',
-    'qualify.',
-    'qualifyd',
-    'qualinost',
-    'qualitair',
-    'qualitating',
-    'qualitative-type',
-    'qualitative/quantitative',
     'qualitativeness',
-    'qualitators',
-    'qualitec',
-    'qualities-the',
-    'qualities.',
-    'qualities/flexibility/get',
-    'qualities:2',
-    'qualititative',
-    'qualitive',
-    'qualitively',
-    'quality&ndash;based',
-    'quality\'',
-    'quality-assure',
-    'quality-built',
-    'quality-checked',
-    'quality-circle',
     'quality-controlled',
-    'quality-costing',
-    'quality-driven',
-    'quality-enhancing',
-    'quality-minded',
-    'quality-tabloid',
-    'quality/condition',
-    'quality/expensive',
-    'quality/kind',
-    'quality/price',
-    'quality/productivity',
-    'quality/value',
-    'qualityin',
-    'qualitytrak',
-    'qualo',
-    'qualque',
     'qualtiy',
-    'quamdiu',
-    'quanabie',
-    'quandom',
-    'quandrant',
-    'quangaroos',
-    'quango-hunting',
-    'quango-type',
-    'quangoland',
-    'quanities',
-    'quanko',
-    'quant/biba/bus',
-    'quant/nmr',
-    'quante/german',
-    'quanti',
-    'quantication',
     'quantificational',
-    'quantified.',
-    'quantify.',
-    'quantisations',
-    'quantises',
-    'quantit&eacute',
-    'quantitative&mdash;qualitative',
-    'quantitative-mindedness',
-    'quantitative/qualitative',
-    'quantitatively-based',
-    'quantitech',
-    'quantitie',
-    'quantititative',
-    'quantitively',
-    'quantity-addicted',
-    'quantity/quality',
     'quantizing',
-    'quanto',
-    'quantom',
-    'quantomania',
-    'quantum-jumping',
-    'quantum-well',
-    'quapaw',
-    'quarafon',
-    'quaran-tiny',
-    'quaranful',
-    'quaranta',
-    'quarante',
-    'quarantine/hospital',
-    'quarantine/treatment',
-    'quararibea',
-    'quarelled',
     'quarentine',
-    'quaresma',
-    'quark-xpress',
-    'quarkxpress',
-    'quarles',
-    'quarless',
-    'quarll',
-    'quarmyne',
-    'quarndon',
-    'quarnero',
-    'quarralton',
-    'quarre',
-    'quarrel&mdash;at',
-    'quarrel-by-letter',
-    'quarrel.',
-    'quarrell',
     'quarrellers',
-    'quarrellin\'',
-    'quarry-cliff',
-    'quarry-gulf',
-    'quarry-source',
-    'quarry-workers',
-    'quarry-working',
-    'quarryman-prisoner',
-    'quarrymaster',
-    'quarshie',
-    'quart-sized',
-    'quarta',
-    'quartans',
-    'quarteira',
-    'quarter&rehy;century',
-    'quarter&rehy;mile',
     'quarter-advance',
-    'quarter-astern',
-    'quarter-backs',
-    'quarter-berth',
-    'quarter-bottle',
-    'quarter-breed',
-    'quarter-by-quarter',
-    'quarter-eaten',
-    'quarter-empty',
-    'quarter-end',
-    'quarter-full',
-    'quarter-gastronorm',
-    'quarter-horses',
-    'quarter-hourly',
-    'quarter-hundredweight',
-    'quarter-iotum',
     'quarter-landing',
-    'quarter-leather',
-    'quarter-lights',
-    'quarter-litre',
-    'quarter-mark',
-    'quarter-master',
-    'quarter-mastering',
-    'quarter-megahertz',
-    'quarter-million-dollar',
-    'quarter-million-selling',
-    'quarter-minute',
-    'quarter-moon',
-    'quarter-noble',
-    'quarter-of-a-century',
-    'quarter-of-a-dozen',
-    'quarter-of-a-million',
     'quarter-of-an-hour',
-    'quarter-of-an-inch',
-    'quarter-past-five',
-    'quarter-past-three',
-    'quarter-peal',
-    'quarter-phi',
-    'quarter-points',
-    'quarter-profile',
-    'quarter-scale',
-    'quarter-smoked',
-    'quarter-staff',
-    'quarter-staffs',
-    'quarter-stave',
-    'quarter-to',
-    'quarter-to-eleven',
-    'quarter-to-five',
     'quarter-to-one',
-    'quarter-to-two',
-    'quarter-ton',
-    'quarter-tone',
-    'quarter-tonner',
-    'quarter-truths',
-    'quarter-wave',
-    'quarter-year',
-    'quarter.its',
-    'quarterbeck',
-    'quarterbred',
-    'quarterdecks',
-    'quarterfinalists',
-    'quarterlies',
-    'quarterlights',
-    'quartermains',
     'quartermast',
-    'quarterpipes',
-    'quarters-symbolically',
-    'quarterstaff',
-    'quartet-delme',
-    'quartet-suite',
-    'quartetly',
-    'quartets.',
-    'quartetsatz',
-    'quartettsatz',
-    'quartiere',
-    'quarto-size',
-    'quartorse',
-    'quartr',
-    'quartus',
-    'quartz&rehy;fluorite-calcite-sulphide',
     'quartz&rehy;gemmed',
-    'quartz-antimony',
-    'quartz-antimony&rehy;arsenic',
-    'quartz-arsenopyrite',
-    'quartz-bearing',
-    'quartz-carbonate',
-    'quartz-cassiterite',
-    'quartz-crystal-based',
-    'quartz-feldspar',
-    'quartz-feldspar-mica',
-    'quartz-feldspar-rock',
-    'quartz-like',
-    'quartz-porphyry',
-    'quartz-rich',
-    'quartz-sharp',
-    'quartz-stockwork',
     'quartz-sulphide',
-    'quartz-tourmaline-sulphide',
-    'quartz-veins',
-    'quartz-windowed',
-    'quartzy',
-    'quashie',
-    'quasi&rehy;official',
-    'quasi&rehy;partnership',
-    'quasi&rehy;pornographic',
-    'quasi&rehy;proverbial',
-    'quasi&rehy;relationship',
-    'quasi&rehy;scientific',
-    'quasi\'-knowledge',
-    'quasi-absolute',
-    'quasi-academic',
-    'quasi-academics',
     'quasi-adjectives',
-    'quasi-adoptive',
-    'quasi-aesthetic',
-    'quasi-allegorical',
-    'quasi-amorphous',
-    'quasi-anthropological',
-    'quasi-apostolic',
-    'quasi-arbitral',
-    'quasi-arbitration',
-    'quasi-architectural',
-    'quasi-arithmetic',
-    'quasi-authentic',
-    'quasi-authorial',
-    'quasi-automatic',
-    'quasi-automatically',
-    'quasi-balanced',
     'quasi-beliefs',
-    'quasi-benjaminian',
-    'quasi-bimolecular',
-    'quasi-biographical',
-    'quasi-black',
-    'quasi-blank-verse',
-    'quasi-british',
-    'quasi-cabinet',
-    'quasi-cairn',
-    'quasi-canonical',
-    'quasi-capitalist',
-    'quasi-captive',
-    'quasi-celebrations',
-    'quasi-chemical',
-    'quasi-circular',
-    'quasi-civil',
     'quasi-colony',
-    'quasi-commercial',
-    'quasi-competitive',
-    'quasi-conceptual',
-    'quasi-consensus',
-    'quasi-conspiratorial',
-    'quasi-continents',
-    'quasi-contracts',
-    'quasi-corporation',
-    'quasi-corporatist',
-    'quasi-crystalline',
-    'quasi-currency',
-    'quasi-customers',
-    'quasi-cyclical',
-    'quasi-democracy',
-    'quasi-dialogue',
     'quasi-diplomacy',
-    'quasi-divine',
-    'quasi-document',
-    'quasi-documentary',
-    'quasi-domestic',
-    'quasi-duties',
-    'quasi-dynastic',
-    'quasi-easements',
-    'quasi-educational',
-    'quasi-elected',
-    'quasi-emphyteutic',
-    'quasi-environmental',
-    'quasi-episcopal',
-    'quasi-epithelium',
-    'quasi-equities',
-    'quasi-erotic',
     'quasi-essential',
-    'quasi-exceptions',
-    'quasi-executive',
-    'quasi-experimental',
-    'quasi-fascist',
-    'quasi-fictionalised',
-    'quasi-freedom',
-    'quasi-functionalist',
-    'quasi-gang',
-    'quasi-general',
-    'quasi-geometrical',
-    'quasi-groups',
-    'quasi-harem',
-    'quasi-historical',
-    'quasi-homophonic',
-    'quasi-human',
     'quasi-hyponyms',
-    'quasi-imperial',
-    'quasi-imperialism',
-    'quasi-intellectual',
-    'quasi-internal',
-    'quasi-journalistic',
-    'quasi-judicially',
-    'quasi-legendary',
-    'quasi-legislation',
-    'quasi-legitimate',
-    'quasi-linear',
-    'quasi-litigation',
-    'quasi-magical',
-    'quasi-male',
-    'quasi-maternal',
-    'quasi-mathematical',
     'quasi-mechanical',
-    'quasi-mechanistic',
-    'quasi-medieval',
-    'quasi-military-order',
-    'quasi-ministerial',
-    'quasi-minority',
-    'quasi-modernist',
-    'quasi-monopolies',
-    'quasi-mourning',
-    'quasi-musical',
-    'quasi-narrative',
-    'quasi-nationalism',
-    'quasi-nationalization',
-    'quasi-natural',
-    'quasi-neutrality',
-    'quasi-novel',
     'quasi-obbligato',
-    'quasi-objective',
-    'quasi-objects',
-    'quasi-obsession',
-    'quasi-orchestral',
-    'quasi-organic',
-    'quasi-paralytic',
-    'quasi-parliamentary',
-    'quasi-partnership',
-    'quasi-partnerships',
-    'quasi-permanent',
-    'quasi-personal',
-    'quasi-philanthropism',
-    'quasi-police',
-    'quasi-pop',
-    'quasi-popular',
     'quasi-practical',
-    'quasi-prebendary',
-    'quasi-preludial',
-    'quasi-priestly',
-    'quasi-private',
-    'quasi-profession',
-    'quasi-professional',
-    'quasi-property',
-    'quasi-psychedelic',
-    'quasi-psychedelics',
-    'quasi-psychological',
-    'quasi-qualifications',
-    'quasi-rasta',
-    'quasi-record',
-    'quasi-reductionism',
-    'quasi-reductionist',
     'quasi-referential',
-    'quasi-refutation',
-    'quasi-relations',
-    'quasi-representative',
-    'quasi-republican',
-    'quasi-retirement',
-    'quasi-revolutionary',
-    'quasi-ritualistic',
-    'quasi-royal',
-    'quasi-rp',
-    'quasi-ruckers',
-    'quasi-saint',
-    'quasi-sale',
-    'quasi-samurai',
-    'quasi-sardonic',
-    'quasi-secessionist',
     'quasi-securitisation',
-    'quasi-sensual',
-    'quasi-simile',
-    'quasi-single',
-    'quasi-situationist',
-    'quasi-situationists',
-    'quasi-solids',
-    'quasi-splits',
-    'quasi-stable',
-    'quasi-supervisory',
-    'quasi-syndicalist',
-    'quasi-syntactically',
-    'quasi-tax',
-    'quasi-theatrical',
-    'quasi-theoretical',
-    'quasi-theosophical',
     'quasi-totality',
-    'quasi-toxic',
-    'quasi-triadic',
-    'quasi-unification',
-    'quasi-unified',
-    'quasi-uniform',
-    'quasi-uniformly',
-    'quasi-university',
-    'quasi-vassal',
-    'quasi-venetian',
-    'quasi-victorian',
-    'quasi-wagnerian',
-    'quasi-whisper',
-    'quasi-william',
-    'quasiautonomous',
-    'quasielastic',
     'quasifamilial',
-    'quasijudicial',
-    'quasinoso',
-    'quasipantheistic',
-    'quasisimile',
-    'quassia',
-    'quat',
-    'quata',
-    'quatbi',
-    'quatemary',
-    'quatember',
-    'quaternass',
-    'quaternion',
-    'quaternisation',
-    'quatra',
-    'quatrefages',
     'quatremere',
-    'quatres',
-    'quatrocentennial',
-    'quatrro',
-    'quatsch',
-    'quattara',
-    'quattrochi',
-    'quaver-beats',
-    'quaver=84',
-    'quavery-y',
-    'quawawwart',
-    'quayle-hunting',
-    'quayle/edith',
-    'quaytman',
-    'qubba',
-    'qudratic',
     'quds',
-    'qudsi',
-    'queant',
-    'queasy-bright',
-    'queation',
-    'queb&eacute;cois',
-    'quebec&ndash;montreal',
-    'quebecquois',
-    'quebecs',
-    'quebequois',
-    'quebra',
-    'quebrada',
-    'quecho',
-    'quechua-speakers',
-    'quedemos/qued&aacute;ramos',
-    'quedgeley/gloucester',
     'quee-er',
-    'quee-reek',
-    'queec',
-    'queeeep',
-    'queeensland',
-    'queeensr&yuml;che',
-    'queeg',
-    'queek',
-    'queel',
-    'queen-anne-style',
-    'queen-budget',
-    'queen-hithe',
-    'queen-in-council',
-    'queen-regnant',
-    'queen-side',
-    'queen-sized',
     'queen-style',
-    'queen-to-be',
-    'queen.',
-    'queen/a',
-    'queen/she',
-    'queened',
-    'queenford',
-    'queeniegate',
-    'queenies',
-    'queenious',
-    'queenless',
-    'queenmaker',
-    'queensbank',
-    'queensferry-based',
-    'queenshill',
-    'queensize',
     'queensland-style',
-    'queensmere',
-    'queensryche/lynchmob',
-    'queenstowne',
-    'queenswood',
-    'queenzieburn',
-    'queep',
-    'queer-looking',
-    'queerbashed',
-    'queerbashers',
-    'queerbashin\'',
-    'queered',
-    'queerness',
-    'queezy',
-    'queimadas',
-    'queira',
     'quelccaya',
-    'quelene',
-    'quelgos',
-    'quellenschriften',
-    'quellyn',
-    'quelqu\'chose',
-    'quelyia',
-    'quenby',
-    'quenches',
-    'quenchless',
-    'quenelle',
-    'quenes',
-    'quenild',
-    'quenington',
-    'quennels',
-    'quens',
     'quent',
-    'quental',
-    'quenten',
-    'quentified',
-    'quentin\'',
-    'quentin-bauchart',
-    'queratato',
-    'querault',
-    'quercetin',
-    'quercifolium',
-    'querent',
-    'queri',
-    'queridas',
-    'querido',
-    'querne',
-    'quernmore',
     'quernstones',
-    'quero',
-    'querschnitt',
-    'querulousness',
-    'quervain',
-    'query-based',
-    'querzani/raf',
-    'querzoni',
-    'ques1',
-    'quescent',
-    'queschun',
-    'quesition',
-    'quesitoned',
-    'quess',
-    'quest-adventure',
-    'quest-novella',
     'quest-one-a-day',
-    'quest-plots',
-    'quest-story',
-    'questaire',
-    'questin',
-    'question&lsqb;s&rsqb',
-    'question&mdash;answer',
-    'question&mdash;or',
-    'question&rehy;how',
-    'question(4)',
-    'question-and-listen',
-    'question-asking',
-    'question-framework',
-    'question-free',
-    'question-posing',
-    'question-provoking',
     'question-raising',
-    'question-setter',
-    'question-time',
-    'question-times',
-    'question-type',
-    'question.just',
-    'question.the',
-    'question/',
-    'question/problem',
-    'question/statement',
-    'question/subject',
-    'question5',
-    'questionaires',
-    'questionedme',
-    'questioney',
-    'questioni',
     'questionless',
-    'questionmarks',
-    'questionmaster',
-    'questionmasters',
-    'questionnaire-type',
-    'questionnaires.3',
-    'questionned',
-    'questions-',
-    'questions-style',
-    'questions.pc.',
-    'questions/',
-    'questions/answers',
-    'questions/queries',
-    'questions/specific',
-    'questions/writing/',
-    'questionsetter',
     'queston',
-    'questyioned',
-    'quetions',
-    'quetzacoatl',
-    'quetzales',
-    'quetzals',
-    'queu',
-    'queue-control',
-    'queue-free',
-    'queued-for',
-    'queuine',
-    'queuosine',
-    'quevado',
-    'quevedo',
-    'quhame',
-    'qui&ntilde;onez',
     'qui-ick',
-    'quianlong',
-    'quibbling-its',
-    'quibus',
-    'quic',
-    'quic-ic-ic',
-    'quick&rehy;draws',
-    'quick&rehy;editing',
-    'quick&rehy;growing',
-    'quick-',
-    'quick-access',
-    'quick-bitten',
-    'quick-blow',
-    'quick-brained',
-    'quick-changes',
-    'quick-cooked',
     'quick-cut',
-    'quick-decision',
-    'quick-draw',
-    'quick-drawing',
-    'quick-fill',
-    'quick-fisted',
-    'quick-food',
-    'quick-footed',
-    'quick-footedness',
-    'quick-fox',
-    'quick-frozen',
-    'quick-glancing',
-    'quick-grip',
-    'quick-healing',
-    'quick-lime',
-    'quick-loading',
     'quick-lunch',
-    'quick-marched',
-    'quick-minded',
-    'quick-mindedness',
-    'quick-on-the-uptake',
-    'quick-pass',
-    'quick-retracting',
-    'quick-scan',
-    'quick-serving',
-    'quick-set',
-    'quick-sharp',
-    'quick-shifting',
-    'quick-step',
-    'quick-stepping',
-    'quick-steps',
-    'quick-stop',
     'quick-timber',
-    'quick-to-assemble',
-    'quick-to-learn',
-    'quick-to-use',
-    'quick-wittedly',
-    'quick.to',
-    'quick/rapid/jet',
-    'quickbasic',
-    'quickc*',
-    'quickenings',
-    'quicker-moving',
-    'quicker-tempered',
-    'quickest-gobbled',
-    'quickfinder',
-    'quickgrowing',
-    'quicklettes',
     'quickley',
-    'quickly-and',
-    'quickly-changing',
-    'quickly-drying',
-    'quickly-made',
-    'quickly-moving',
-    'quickly-processed',
-    'quickly-seeding',
-    'quickly-taken',
-    'quickly.initally',
-    'quickly/at',
-    'quickly/quite',
-    'quickly/when',
-    'quickmenu',
-    'quickmore',
-    'quickpascal',
     'quickring',
-    'quicksand-like',
-    'quickskim',
-    'quickskimming',
-    'quicksnack',
-    'quickso',
-    'quickspeak',
-    'quickstepping',
-    'quicksteps',
-    'quicksticks',
-    'quickswood',
-    'quicktalk',
-    'quickthorn',
-    'quicktime-compatible',
-    'quickways',
-    'quid\'s-worth',
     'quid.is',
-    'quid_on_top',
-    'quidding',
-    'quidem',
-    'quidging',
-    'quidhe',
-    'quidi-vidi',
-    'quidities',
-    'quids-in',
-    'quidsworth',
-    'quidt',
-    'quieren',
-    'quiescent/active',
-    'quiescere',
-    'quiet-coloured',
-    'quiet-it',
     'quiet-like',
-    'quiet-looking',
-    'quiet-mannered',
-    'quiet-moving',
-    'quietest-ever',
-    'quietists',
-    'quietives',
-    'quietly&rehy;spoken',
-    'quietly.',
-    'quietness/feeling',
-    'quietnesse',
-    'quieto',
-    'quietos',
-    'quietprinter',
-    'quietwater',
-    'quietwriter',
     'quievit',
-    'quifictis',
-    'quiggin',
-    'quigley/family',
-    'quigley/manageress',
-    'quignon',
-    'quilengues',
-    'quileute',
-    'quilici',
-    'quill-end',
-    'quill-feathers',
-    'quill-like',
-    'quill-pens',
-    'quill-written',
-    'quillan',
-    'quilled',
     'quillian',
-    'quilligan',
-    'quillinan',
-    'quillwork',
-    'quillwort',
-    'quilpe',
-    'quilt\'',
-    'quilt-makers',
-    'quim-lips',
-    'quimbourne',
-    'quimicas',
-    'quimperl&eacute',
-    'quimperl&egrave',
-    'quimson',
-    'quina',
-    'quinaig',
     'quinalbarbitone',
-    'quincey\'',
-    'quincunx-panel',
-    'quindlen',
-    'quines',
-    'quinghao',
-    'quinion',
-    'quinkeys',
-    'quinland',
-    'quinn-style',
-    'quinn/flying',
-    'quinn/probation',
-    'quinns',
-    'quino&ntilde;ez',
-    'quinoid',
-    'quinolinic',
     'quinoxaline',
-    'quinoxalinedione',
-    'quinquagesima',
-    'quinquennially',
-    'quinquereme',
-    'quinsac-plessan',
-    'quinspirites',
-    'quint&aacute;ns',
-    'quintain',
-    'quintains',
-    'quintan',
-    'quintanilla',
-    'quintavalle',
-    'quintes',
-    'quintex',
-    'quinti',
     'quintian',
-    'quintiles',
-    'quintillana',
-    'quintillion',
-    'quintis',
-    'quintium',
-    'quintols',
-    'quinton-zorn',
-    'quintsimple',
-    'quintupling',
-    'quintyn',
-    'quippe-quare-quale-quia-quidditive',
-    'quipsters',
-    'quiquillon',
-    'quir',
-    'quirang',
     'quirescreen',
-    'quirici',
-    'quirigua',
-    'quirin',
-    'quirindi',
-    'quiring',
-    'quirino',
-    'quirk-pen',
-    'quirk_et',
-    'quirkes',
-    'quirkishness',
-    'quirm',
-    'quirolgico',
-    'quiroz',
-    'quiscalus',
-    'quisigaard',
     'quisque',
-    'quist-arcton',
-    'quistgard',
-    'quita',
-    'quitak',
-    'quite-downtrodden',
-    'quite-right-enough',
-    'quite.reasonably',
-    'quite_apart',
-    'quite_other',
-    'quiterons',
-    'quitest',
-    'quitline',
-    'quito-based',
-    'quitsch',
-    'quitte',
     'quitter\'',
-    'quitters',
-    'quiuckly',
-    'quiver-tipping',
-    'quiverer',
-    'quivering-nosed',
-    'quiveringly',
-    'quivertip',
-    'quivertips',
-    'quivi',
-    'quivox',
-    'quiwonkpa',
-    'quixis',
-    'quixote-like',
-    'quixote_pas_de',
-    'quixotes',
     'quixotic\'',
-    'quiyas',
-    'quiz-master',
-    'quiz-setter',
-    'quiz/disco',
-    'quizbook',
-    'quizzically-smiling',
-    'qujite',
-    'quk',
-    'qulacomm',
-    'qule',
-    'quliafiers',
-    'qumran-style',
-    'qungshan',
-    'qunitext',
-    'quoc-quan',
     'quogue',
-    'quoist',
-    'quon',
-    'quonset',
-    'quoodle',
-    'quooms',
-    'quora',
-    'quorndon',
-    'quorns',
-    'quorum/apple',
-    'quota-based',
-    'quota-driven',
-    'quota-hopping',
-    'quota-list',
-    'quota-registered',
-    'quotasampling',
     'quotation(s)',
-    'quotation.',
-    'quotations.',
-    'quote-crazy',
-    'quote.',
-    'quotem',
-    'quotemaster',
-    'quotemeister',
-    'quoter',
-    'quotidianus',
-    'quotient&formula;.',
-    'quoties',
-    'quotron',
-    'quow',
-    'qur\'ans',
-    'quraish',
     'quranic',
-    'qurban',
-    'qureshi/asian',
-    'qurnah',
-    'qurusu',
-    'qused',
-    'quwait',
-    'quwatli',
-    'quwaysimah',
-    'quynh',
-    'quyte',
-    'qvc',
-    'qvdhgk',
-    'qvi',
-    'qvr',
-    'qvt82',
     'qwa',
-    'qwaa',
-    'qwak',
-    'qwbdhjkplmcbsxazidzkleghlcvve',
-    'qwest',
-    'qwiche',
-    'qwik',
-    'qwol',
-    'qx',
-    'qxa2',
-    'qxd4',
-    'qxe3',
-    'qxe4',
-    'qxe5+',
-    'qxe6&verbar&verbar;nxe6&verbar&verbar;25',
-    'qxe7',
     'qxg2+',
-    'qy10',
-    'r&aacute;-ko-si',
-    'r&aacute;fti',
-    'r&aacute;mon',
-    'r&aacute;no',
-    'r&aacute;ul',
-    'r&acirc;gout',
-    'r&aelig;d',
-    'r&amacr;m&amacr;nuja',
-    'r&amp:d',
-    'r&amp;b/rap',
-    'r&amp;d/',
-    'r&amp;d/production',
-    'r&amp;d/strategic',
-    'r&amp;f',
     'r&amp;k',
-    'r&amp;r',
-    'r&amp;s',
-    'r&amp;venue',
-    'r&amp;w',
-    'r&aring;d&aring',
-    'r&aring;da',
-    'r&aring;nby',
-    'r&auml;der',
-    'r&auml;terepublik',
-    'r&auml;tzer',
-    'r&bsol;emi',
-    'r&darr',
-    'r&divide;2',
-    'r&eacute;alisme',
-    'r&eacute;bellion',
     'r&eacute;bus',
-    'r&eacute;cent',
-    'r&eacute;cherche',
-    'r&eacute;cit-emploi',
-    'r&eacute;citatif-&lsqb;r&eacute;citatif',
-    'r&eacute;citatif-air-r&eacute;citatif',
-    'r&eacute;citatif-mesur&eacute',
-    'r&eacute;clame',
-    'r&eacute;coltants',
-    'r&eacute;construction',
-    'r&eacute;duction',
-    'r&eacute;duisant',
-    'r&eacute;flexion',
-    'r&eacute;formateurs',
-    'r&eacute;formes',
-    'r&eacute;fugi&eacute;s',
     'r&eacute;g&egrave;nium',
-    'r&eacute;gie',
-    'r&eacute;gina',
-    'r&eacute;gional',
-    'r&eacute;gis',
-    'r&eacute;glisserie',
-    'r&eacute;guli&egrave;re',
-    'r&eacute;guliers',
-    'r&eacute;gulo',
-    'r&eacute;jouir',
-    'r&eacute;lev&eacute;s',
-    'r&eacute;mi',
-    'r&eacute;miniscence',
-    'r&eacute;my-martin',
-    'r&eacute;novateurs',
-    'r&eacute;patrice',
     'r&eacute;pertoire',
-    'r&eacute;pons',
-    'r&eacute;ponse',
-    'r&eacute;s.',
-    'r&eacute;seau',
-    'r&eacute;serv&eacute',
-    'r&eacute;servation',
-    'r&eacute;sident-sup&eacute;rieur',
-    'r&eacute;sultat',
-    'r&eacute;sum&acute',
-    'r&eacute;sum&eacute;of',
-    'r&eacute;sum&eacute;s',
-    'r&eacute;surrection',
-    'r&eacute;to',
-    'r&eacute;troactif',
-    'r&eacute;trogrades',
     'r&eacute;um&eacute',
-    'r&eacute;unionnais',
-    'r&eacute;unit',
-    'r&eacute;v&eacute;rene',
-    'r&eacute;v&egrave;lent',
-    'r&eacute;ve',
-    'r&eacute;veil',
-    'r&eacute;venescente',
-    'r&eacute;voltades',
-    'r&eacute;volver',
-    'r&ecirc;vent',
-    'r&ecirc;verie',
-    'r&ecirc;ves',
-    'r&egr',
-    'r&egr;nt',
-    'r&egrave;cit',
     'r&egrave;giment',
-    'r&egrave;glant',
-    'r&egrave;gle',
-    'r&egrave;gne',
-    'r&gt;0.45',
-    'r&gt;0.48',
-    'r&gt;a',
-    'r&gt;d',
-    'r&lsqb;esistance&rsqb',
-    'r&lt;a',
-    'r&lt;t250,000',
-    'r&ndash;1340&ndash;an&ndash;1',
-    'r&ndash;134s',
-    'r&ndash;2',
-    'r&ndash;985',
-    'r&ndash;rair',
     'r&ndash;y',
-    'r&oacute;le',
-    'r&ocirc;der',
-    'r&ocirc;les',
-    'r&oslash;dbroget',
-    'r&ouml;d',
-    'r&ouml;les',
-    'r&ouml;mer',
-    'r&ouml;merberg',
-    'r&ouml;nsch',
-    'r&ouml;ntgen',
-    'r&ouml;rsch',
-    'r&ouml;ssle',
-    'r&ouml;ssler',
-    'r&prime;l',
-    'r&rehy;1830&ndash;92s',
     'r&times;h4',
-    'r&times;h7',
-    'r&times;h7&plus',
-    'r&uacute;ben',
-    'r&uacute;iz',
-    'r&uuml;ckert-lieder',
-    'r&uuml;cksichglosigkeit',
-    'r&uuml;ckversicherung',
-    'r&uuml;dersdorf',
-    'r&uuml;diger',
-    'r&uuml;hle',
-    'r&uuml;hr',
-    'r&uuml;lander',
-    'r&uuml;ppell',
-    'r&uuml;ppellii',
-    'r&uuml;sch',
     'r&verbar;slr',
-    'r\'\'',
-    'r\'c',
-    'r\'mel',
-    'r\'n\'',
-    'r\'ncs',
-    'r\'w',
-    'r\'z\'',
-    'r()m',
-    'r(1064)=-0.118',
-    'r(1064)=-0.564',
-    'r(1064)=0.142',
-    'r(1064)=0.201',
-    'r(1064)=0.236',
-    'r(1064)=0.246',
-    'r(1064)=0.278',
     'r(1064)=0.294',
-    'r(1603)=0.07',
-    'r(20)=-0.053',
-    'r(20)=0.39',
-    'r(20)=0.43',
-    'r(21)=-0.11',
-    'r(21)=0.39',
-    'r(21)=0.612',
-    'r(22)=-0.04',
-    'r(22)=-0.06',
-    'r(22)=-0.13',
-    'r(22)=-0.42',
-    'r(22)=0.16',
-    'r(22)=0.166',
-    'r(22)=0.211',
-    'r(22)=0.265',
     'r(22)=0.66',
-    'r(22)=0.71',
-    'r(22)=0.711',
-    'r(23)=-0.414',
-    'r(23)=0.414',
-    'r(23)=0.418',
-    'r(23)=0.620',
-    'r(34)=-0.24',
-    'r(38)=0.310',
-    'r(38)=0.517',
-    'r(38)=0.690',
-    'r(38)=0.722',
-    'r(38)=0.791',
-    'r(4)=0.86',
-    'r(46)=0.03',
-    'r(46)=0.06',
     'r(46)=0.09',
-    'r(46)=0.12',
-    'r(46)=0.14',
-    'r(46)=0.16',
-    'r(46)=0.18',
-    'r(46)=0.23',
-    'r(46)=0.27',
-    'r(46)=0.40',
-    'r(46)=0.43',
-    'r(46)=0.44',
-    'r(46)=0.65',
-    'r(46)=0.742',
-    'r(46)=0.75',
-    'r(48)=0.13',
-    'r(58)=-0.20',
-    'r(58)=-0.23',
     'r(58)=-0.27',
-    'r(58)=-0.32',
-    'r(58)=0.03',
-    'r(58)=0.05',
-    'r(58)=0.06',
-    'r(58)=0.07',
-    'r(58)=0.13',
-    'r(58)=0.14',
-    'r(58)=0.16',
-    'r(58)=0.17',
-    'r(58)=0.25',
-    'r(58)=0.39',
-    'r(58)=0.43',
-    'r(58)=0.58',
-    'r(8)=-0.047',
-    'r(8)=-0.21',
     'r(8)=0.66',
-    'r(a)',
-    'r(es)',
-    'r(phi)=0.022',
-    'r(s)1187',
-    'r(s)4182',
-    'r(sb)5/81',
-    'r(u)2/60',
-    'r(x)',
-    'r(x1-y1)',
-    'r(y)',
-    'r+1',
-    'r,s',
-    'r-101',
-    'r-1200',
-    'r-1340',
     'r-1830s',
-    'r-22',
-    'r-24',
-    'r-2800s',
-    'r-30',
-    'r-40',
-    'r-4360-powered',
-    'r-50',
-    'r-6h',
-    'r-7a50m',
-    'r-8h50(b)t',
-    'r-985',
-    'r-and-d',
-    'r-axis',
-    'r-banded',
-    'r-complex',
     'r-d',
-    'r-detector',
-    'r-ful',
-    'r-g',
-    'r-ii',
-    'r-interval',
-    'r-intervals',
-    'r-o-l-l',
-    'r-plate',
-    'r-pronouncing',
-    'r-r\'',
-    'r-r*',
-    'r-r-rien',
-    'r-r-ruup',
-    'r-r/turbomeca',
-    'r-r30/r-r15',
     'r-related',
-    'r-rmax',
-    'r-rmax-r-rmin',
-    'r-rmax/r-rmin',
-    'r-rmin',
-    'r-roomf',
-    'r-selected',
-    'r-shaped',
-    'r-sq%',
-    'r-to',
-    'r-u-a-r-a-i-d-h',
-    'r-uw',
-    'r-uwaf',
-    'r.&amp;r.',
-    'r.-a',
-    'r.-h.',
     'r.1(5)',
-    'r.10',
-    'r.100',
-    'r.13',
-    'r.16(1)',
-    'r.16(2)',
-    'r.1605&ndash;27',
-    'r.1628&ndash;58',
-    'r.18',
-    'r.19',
-    'r.22',
-    'r.23',
-    'r.24(1)',
-    'r.5(2)',
-    'r.5(6)',
-    'r.5(7)',
     'r.5(8)',
-    'r.6',
-    'r.79',
-    'r.8',
-    'r.9',
-    'r.a.d.&mdash',
-    'r.a.d.a.',
-    'r.a.f',
-    'r.a.i.n.b.o.w.',
-    'r.a.leyland',
-    'r.b.a.',
-    'r.b.d.',
-    'r.b.j.',
-    'r.b.s.t.',
-    'r.c.g.',
-    'r.c.j.',
     'r.c.m.p.',
-    'r.c.m.v.',
-    'r.c.s.',
-    'r.campbell',
-    'r.carin',
-    'r.conquest',
-    'r.d',
-    'r.d.b.',
-    'r.d.c',
-    'r.d.f.',
-    'r.d.m',
-    'r.d.s',
-    'r.d.w.',
-    'r.f',
-    'r.f.hickman',
-    'r.f.i',
     'r.f.u.',
-    'r.g.willis',
-    'r.gwynn',
-    'r.h.jr',
-    'r.h.l.',
-    'r.i.l.k.o.',
-    'r.j.w.',
-    'r.j.y.',
-    'r.l.-b.',
-    'r.l.gardner',
-    'r.l.h.',
-    'r.l.p',
-    'r.l.p.o.',
-    'r.l.s.',
-    'r.m.c.s.',
-    'r.m.speed',
     'r.n.a.',
-    'r.n.a.d.',
-    'r.n.i.b.',
-    'r.n.l.i',
-    'r.n.l.i.',
-    'r.n.m.',
-    'r.o.i.',
-    'r.o.w',
-    'r.p.houston',
-    'r.p.i.',
-    'r.roeder',
-    'r.s.n.c.',
-    'r.shepherd',
-    'r.skidelsky',
-    'r.t',
-    'r.t.a.',
     'r.t.p.',
-    'r.t.u.',
-    'r.u.',
-    'r.u.c.',
-    'r.u.r.',
-    'r.v',
-    'r.w.a.',
-    'r.w.v.',
-    'r.y.a.',
-    'r/2p',
-    'r/2tn',
-    'r/4000-based',
-    'r/greenberg',
-    'r/hi',
-    'r/ir',
-    'r/l',
     'r/lo',
-    'r/o',
-    'r/v',
-    'r000231220',
-    'r01/31/93',
-    'r07',
-    'r1&ndash;3',
-    'r1(4)',
-    'r1,000',
-    'r1,500,000',
-    'r1,596,000',
-    'r1-r3',
-    'r1.00=f27.50',
-    'r1.5(4)',
-    'r1.5.',
-    'r1.92m',
     'r10(1)',
-    'r10(2)',
-    'r10(3)',
-    'r10,070',
-    'r100,000',
-    'r103&ndash;105',
-    'r106',
-    'r108',
-    'r10a',
-    'r10b',
-    'r11&ndash;13',
-    'r11(4)',
-    'r11(7)',
-    'r11,600',
-    'r116-17',
-    'r12(1a&mdash;c)',
     'r12(1a)',
-    'r12(1a-c)',
-    'r12(2)',
-    'r12(7)',
-    'r12(a)',
-    'r12,500',
-    'r1247',
-    'r1270&ndash;01',
-    'r12a',
-    'r13&ndash;r18',
-    'r13(4)',
-    'r13,156,289',
-    'r132',
-    'r132m',
-    'r134&ndash;135',
-    'r137',
     'r14&ndash;16',
-    'r14(11)',
-    'r14(2)',
-    'r14(3)',
-    'r14-size',
-    'r14/24',
-    'r140&ndash;143',
-    'r141&ndash;143',
-    'r144',
-    'r149',
-    'r14s',
-    'r15(3)',
-    'r15(4)',
-    'r150',
-    'r150,000',
-    'r153',
     'r15r',
-    'r16&ndash;18',
-    'r16(1)',
-    'r16(5)',
-    'r16(7)',
-    'r16.7m',
-    'r160',
-    'r162',
-    'r17(1)',
-    'r17(2)',
-    'r17(3)',
-    'r170,000,000',
-    'r18',
-    'r18&ndash;20',
-    'r18(3)',
-    'r185',
     'r18s',
-    'r19,000,000',
-    'r1=r3',
-    'r2&ndash;6',
-    'r2,500',
-    'r2,580',
-    'r2,700',
-    'r2-d2',
-    'r2-labelled',
-    'r2-r5',
-    'r2.0',
-    'r2.59(2)',
-    'r2.62m',
-    'r2/3.',
-    'r2/3/4',
-    'r200,000,000',
     'r2000',
-    'r2000-based',
-    'r208m',
-    'r20s',
-    'r20x',
-    'r21&ndash;24',
-    'r21(1)',
-    'r21(2)',
-    'r21(3)',
-    'r21(4)',
-    'r210,000,000',
-    'r22(1)',
-    'r22(2)',
-    'r233,800.000',
-    'r235',
-    'r24',
     'r24&ndash;26',
-    'r25&mdash;namely',
-    'r25&ndash;29',
-    'r25-replacing',
-    'r250,000,000',
-    'r257',
-    'r25dvt',
-    'r27',
-    'r28&ndash;30',
-    'r2800-engineered',
-    'r285',
-    'r290',
-    'r2a',
-    'r2a(10)',
-    'r2a(4)&mdash',
-    'r2ar',
     'r2m',
-    'r2y2',
-    'r3(2)',
-    'r3(5)',
-    'r3+r5',
-    'r3,000',
-    'r3,082',
-    'r3,20,21',
-    'r3,750',
-    'r3.',
-    'r3.18m',
-    'r3.26',
-    'r3/4',
-    'r3/4/5',
-    'r30,000,000',
-    'r3000-derived',
     'r3000/r4000',
-    'r3002a',
-    'r3002as',
-    'r3010-compatible',
-    'r3081',
-    'r33',
-    'r342a4b15',
-    'r342a4c3',
-    'r36',
-    'r38',
-    'r38,500,000',
-    'r380,000,000',
-    'r3d-1',
-    'r4&ndash;8',
-    'r4(1)',
-    'r4(3)',
     'r4(4)',
-    'r4(7)',
-    'r4(8)',
-    'r4+5',
-    'r4,000,000',
-    'r4,600',
-    'r4-labelled',
-    'r4.03m',
-    'r4.10(1)',
-    'r4.10(2)',
-    'r4.11',
-    'r4.11(3)',
-    'r4.12',
-    'r4.12(1)',
-    'r4.14(2)',
-    'r4.14(9)',
     'r4.15(1)',
-    'r4.16(1)',
-    'r4.16(5)',
-    'r4.16(7)',
-    'r4.17(1)',
-    'r4.17(2)',
-    'r4.17(3)',
-    'r4.18(3)',
-    'r4.21(2)',
-    'r4.21(3)',
-    'r4.26',
-    'r4.27m',
-    'r4.3',
-    'r4.3(1)',
-    'r4.3(2)',
-    'r4.4(1)',
     'r4.4(3)',
-    'r4.4(4)',
-    'r4.4(7)',
-    'r4.4(8)',
-    'r4.5(1)',
-    'r4.6',
-    'r4.6(4)',
-    'r4.77m',
-    'r4.8(1)',
-    'r4000-killer',
-    'r4000mc',
-    'r4000mp-based',
-    'r4000sc-based',
-    'r400mp',
-    'r408',
-    'r40e',
     'r40x',
-    'r41.2',
-    'r43.6',
-    'r4400s',
-    'r44s',
-    'r45,000,000',
-    'r4a',
-    'r4d-5',
-    'r4x00',
-    'r5&ndash;7',
-    'r5(1)',
-    'r5,596,000',
-    'r5/27',
-    'r5/r6',
-    'r50&ndash;52',
-    'r55',
     'r56&ndash;59',
-    'r57',
-    'r59&ndash;62',
-    'r6&ndash;8',
-    'r6(6)',
-    'r6(9)',
-    'r6(a)',
-    'r6.05m',
-    'r6.117(4)',
-    'r6.150(2)',
-    'r6.151(3a)',
-    'r6.165(4)',
-    'r6.176(4)',
-    'r6.213',
-    'r6.39(2)',
-    'r6.42',
     'r6.51(6)',
-    'r6.53(3)',
-    'r6.56',
-    'r6.61',
-    'r6.79(4)',
-    'r600',
-    'r6000-based',
-    'r611',
-    'r680',
-    'r6858',
-    'r690,000,000',
-    'r691',
-    'r6a',
-    'r7&ndash;10',
-    'r7&ndash;9',
-    'r7,000,000',
     'r7.33',
-    'r73,900',
-    'r75',
-    'r764',
-    'r78&ndash;80',
-    'r7fr6olb',
-    'r7m',
-    'r8&ndash;13',
-    'r8(5)',
-    'r8,000',
-    'r8,000,000',
-    'r8,100',
-    'r8,900',
-    'r8.08m',
-    'r808',
-    'r814',
     'r819',
-    'r83',
-    'r84,88,94&ndash;96',
-    'r85,000',
-    'r865,100,000',
-    'r9,000',
-    'r9,500',
-    'r9,900',
-    'r931',
-    'r931\'s',
-    'r946m',
-    'r95(d)',
-    'r956',
-    'r97.7m',
-    'r985',
-    'r9854',
     'r9a',
-    'r=-0.08',
-    'r=-0.215',
-    'r=-0.271',
-    'r=-0.3',
-    'r=-0.323',
-    'r=-0.34',
-    'r=-0.43',
-    'r=-0.44',
-    'r=-0.450',
-    'r=-0.49',
-    'r=-0.51',
-    'r=-0.52',
-    'r=-0.53',
-    'r=-0.60',
-    'r=-0.75',
     'r=-0.759',
-    'r=-0.876',
-    'r=-0.98',
-    'r=-9.47',
-    'r=0.02',
-    'r=0.05',
-    'r=0.067',
-    'r=0.07',
-    'r=0.08',
-    'r=0.10',
-    'r=0.12',
-    'r=0.16',
-    'r=0.18',
-    'r=0.20',
-    'r=0.218',
-    'r=0.32',
     'r=0.37',
-    'r=0.39',
-    'r=0.398',
-    'r=0.4',
-    'r=0.42',
-    'r=0.46',
-    'r=0.512',
-    'r=0.52',
-    'r=0.523',
-    'r=0.58',
-    'r=0.6',
-    'r=0.61',
-    'r=0.62',
-    'r=0.63',
-    'r=0.65',
-    'r=0.66',
     'r=0.7',
-    'r=0.72',
-    'r=0.736',
-    'r=0.75',
-    'r=0.80',
-    'r=0.828',
-    'r=0.877',
-    'r=0.88',
-    'r=0.89',
-    'r=0.944',
-    'r=0.957',
-    'r=0.961',
-    'r=0.965',
-    'r=0.987',
-    'r=0.989',
-    'r=3.8',
     'r=it1',
-    'r=itvia',
-    'r=itwants',
-    'ra&formula;dly',
-    'ra&uacute&aelig',
-    'ra-',
-    'ra-mah',
-    'ra-moses',
-    'ra-rah',
-    'ra-regulated',
-    'ra/90/1',
-    'ra/rs',
-    'ra10',
-    'ra1b',
-    'ra2',
-    'ra2000',
     'ra854',
-    'raabe',
-    'raach',
-    'raamses',
-    'raas',
-    'raat',
-    'rabaan',
-    'rabaka',
-    'rabal',
-    'rabanal',
-    'rabaneda',
-    'rabani',
-    'rabassaires',
-    'rabath',
-    'rabatou',
-    'rabbara',
     'rabbat-ammon',
-    'rabbeter',
-    'rabbinates',
-    'rabbinette',
-    'rabbinism',
-    'rabbism',
-    'rabbit&rehy;warrens',
-    'rabbit-bitten',
-    'rabbit-bones',
-    'rabbit-chop',
-    'rabbit-eyed',
-    'rabbit-grazed',
-    'rabbit-hunting',
-    'rabbit-hutch',
-    'rabbit-hutches',
-    'rabbit-in-headlight',
     'rabbit-in-the-headlights',
-    'rabbit-killer',
-    'rabbit-killing',
-    'rabbit-legged',
-    'rabbit-of-the-leaves',
-    'rabbit-of-the-stream',
-    'rabbit-of-the-wind',
-    'rabbit-out-of-a-hat',
-    'rabbit-population',
-    'rabbit-rabbit',
-    'rabbit-run',
-    'rabbit-shooting',
-    'rabbit-style',
-    'rabbit-track',
-    'rabbit-warrening',
-    'rabbit.',
     'rabbit/ferret',
-    'rabbited',
-    'rabbiters',
-    'rabbitfish',
-    'rabbitproof',
-    'rabbits-foot',
-    'rabbits-in',
-    'rabbits.',
-    'rabbitt',
-    'rabble-rousers',
-    'rabbucks',
-    'rabel',
-    'rabemananjara',
-    'rabenoro',
-    'rabesa',
-    'rabesahala',
     'rabevohitra',
-    'rabi-kounga',
-    'rabiers',
-    'rabies-infected',
-    'rabigh',
-    'rabiha',
-    'rabin\'',
-    'rabinach',
-    'rabinder',
-    'rabindra',
-    'rabiner',
-    'rabinovich',
-    'rabins',
-    'rabio',
-    'rabita',
-    'rabitah',
     'rabitting',
-    'rabjohn',
-    'rabkory',
-    'rable',
-    'rabman',
-    'rabochiy',
-    'rabochy',
-    'rabol',
-    'raboni',
-    'rabotnitza',
-    'rabotnov',
-    'rabout',
-    'rabro',
-    'rabselkor',
-    'rabuau',
-    'rac-',
     'rac-supervised',
-    'rac73',
-    'racal-datacom',
-    'racan',
-    'racanteur',
-    'racch-paul',
-    'raccomandazione',
-    'raccoon-hunting',
-    'race&rehy;course',
-    'race&rehy;horse',
-    'race&rehy;horses',
-    'race&rehy;tracks',
-    'race\'-related',
-    'race\'-specific',
-    'race-',
-    'race-biased',
     'race-blind',
-    'race-car',
-    'race-cards',
-    'race-caused',
-    'race-circuit',
-    'race-conscious',
-    'race-day',
-    'race-fit',
-    'race-free',
-    'race-goer',
-    'race-hate',
-    'race-leader',
-    'race-long',
-    'race-meeting',
-    'race-minded',
-    'race-mixing',
     'race-norming',
-    'race-off',
-    'race-polymerase',
-    'race-psychology',
-    'race-ride',
-    'race-suit',
-    'race-team',
-    'race-thinking',
-    'race-track-shaped',
-    'race-warrior',
-    'race-winner',
-    'race.the',
-    'race/1',
-    'race/creed',
-    'race/ethnicity',
-    'race/record',
     'raceable',
-    'raceboat',
-    'racedays',
-    'raceguard',
-    'raceline',
-    'racelines',
-    'racemares',
-    'racemates',
-    'raceplain',
-    'racer/lockheed',
-    'racervine',
-    'races.the',
-    'racette',
-    'raceworld',
-    'rachael-rose',
-    'rachan',
     'rache',
-    'racheed',
-    'rachel&rehy;comes',
-    'racheliae',
-    'rachell',
-    'racher',
-    'racheting-up',
-    'rachewiltz',
-    'rachfuss',
-    'rachh',
-    'rachi',
-    'rachis',
-    'rachitic',
-    'rachma\'an',
-    'rachmaninovian',
-    'rachmanite',
     'rachmann',
-    'rachmat',
-    'rachmil',
-    'rachobites',
-    'rachow',
-    'racial-justice',
-    'racial-law',
-    'racial-preference',
-    'racial-sensitivity',
-    'racial/ethnic',
-    'racial/religious',
-    'racialisation',
-    'racialist-type',
-    'racialists',
-    'racializes',
-    'racializing',
     'racially-discriminatory',
-    'racially-loaded',
-    'racially-structured',
-    'raciborski',
-    'racicot',
-    'raciest',
-    'racines',
-    'racing-camel',
-    'racing-car',
-    'racing-chariots',
-    'racing-engine',
-    'racing-page',
-    'racing-paper',
-    'racing-tyre',
-    'racism\'',
-    'racism-as-false-consciousness',
     'rack-guided',
-    'rack-mounts',
-    'rack-renting',
-    'rack-rents',
-    'rackcase',
-    'racketball',
-    'rackett',
-    'rackfield',
-    'rackmountable',
-    'rackoczy',
-    'rackrent',
-    'rackstraw',
-    'rackwick',
-    'racquin',
-    'ractech',
-    'ractical',
     'ractise',
-    'rad-ical',
-    'rad/fem',
-    'rad/s',
-    'rad8',
-    'rada-speak',
-    'radaelli',
-    'radal',
-    'radala',
-    'radar-blinding',
-    'radar-controlled',
-    'radar-dependent',
-    'radar-imaging',
-    'radar-ranging',
-    'radar-screening',
-    'radar-tracking',
     'radar.the',
-    'radar/contour',
-    'radar/nav',
-    'radar/plotter',
-    'radarsat',
-    'radaune',
-    'radbertus',
-    'radbod',
-    'radbourne',
-    'radbroke',
-    'radbrook',
-    'radburn\'-style',
-    'radc',
-    'radciffe',
-    'radclife',
-    'radcliffes',
     'radclyffe-hall',
-    'radd',
-    'raddatz',
-    'raddings',
-    'raddon',
-    'raddy',
-    'radelescu',
-    'radell',
-    'rademeyer',
-    'rademon',
-    'radens',
-    'rades',
-    'radeschi',
-    'radetsky',
-    'radetzsky',
-    'radev',
     'radevsky',
-    'radfahrer',
-    'radford/church',
-    'radford/diocesan',
-    'radha',
-    'radhakishun',
-    'radi-gauge',
-    'radi-meter',
-    'radiactive',
-    'radial-engined',
-    'radiality',
-    'radially-directed',
-    'radially-expanding',
-    'radiances',
-    'radiancy',
-    'radians.',
     'radiant-faced',
-    'radiant/convector',
-    'radiasa',
-    'radiation-checker',
-    'radiation-detector',
-    'radiation-filled',
-    'radiation-monitoring',
-    'radiation-pressure',
-    'radiation-sensitive',
-    'radiation-shielding',
-    'radiation-trapping',
-    'radiationless',
-    'radiator-outlet',
-    'radiator-type',
-    'radiators-by',
-    'radical\'',
     'radical-conservative',
-    'radical-d&eacute;mocratique',
-    'radical-ecological',
-    'radical-feminist',
-    'radical-inducing',
-    'radical-led',
-    'radical-moderate',
-    'radical-nationalist',
-    'radical-ness',
-    'radical-radical',
-    'radical-reform',
-    'radical-secular-socialist',
-    'radical-seeming',
-    'radical-socialists',
-    'radical/',
-    'radical/communist',
     'radical/conflict',
-    'radical/conservative',
-    'radical/left-leaning',
-    'radical/marxist',
-    'radical/underground',
-    'radicalchip',
-    'radicale',
-    'radicalizes',
-    'radically-improved',
-    'radicans',
-    'radicata',
-    'radiccio',
-    'radice-fossati',
-    'radichev',
-    'radicial',
-    'radicicola',
     'radicle',
-    'radicles',
-    'radiers',
-    'radiesthesia',
-    'radieuse',
-    'radieux',
-    'radiguet',
-    'radinal',
-    'radio-3',
-    'radio-4',
-    'radio-alarm',
-    'radio-astronomer',
-    'radio-biology',
-    'radio-cab',
-    'radio-car',
-    'radio-circuit',
     'radio-dispatched',
-    'radio-ecologist',
-    'radio-electronic',
-    'radio-emitters',
-    'radio-geochemistry',
-    'radio-hplc',
-    'radio-lamp',
-    'radio-listening',
-    'radio-medial',
-    'radio-metric',
-    'radio-navigation',
-    'radio-operated',
-    'radio-pager',
-    'radio-phones',
-    'radio-quasar',
-    'radio-recorded',
     'radio-related',
-    'radio-sensitive',
-    'radio-sets',
-    'radio-signals',
-    'radio-tagged',
-    'radio-telecommunications',
-    'radio-teleswitching',
-    'radio-therapy',
-    'radio-tracked',
-    'radio-transmitter',
-    'radio-type',
-    'radio-unfriendly',
-    'radio-wave',
-    'radio/alarm',
-    'radio/chemotherapy',
-    'radio/clock/alarm',
     'radio/instrument',
-    'radio/navigation',
-    'radio/press',
-    'radio/telephone',
-    'radio/television',
-    'radio_so',
-    'radioactifs',
-    'radioactive-the',
-    'radioaktiver',
-    'radioation',
-    'radiobacter',
-    'radiochemist',
-    'radiocom',
-    'radiocomms',
-    'radiocyathids',
-    'radiodiagnosis',
     'radiodiffusion-t&eacute;l&eacute;vision',
-    'radiodifusoras',
-    'radiodifusores',
-    'radioelements',
-    'radiofacsimile',
-    'radiofax',
-    'radiogenic-isotope-o-isotope',
-    'radiogeochemistry',
-    'radiographed',
-    'radiographer-cum-dispenser',
-    'radiographing',
-    'radiographis',
-    'radioimmunassay',
-    'radioimmunologically',
-    'radioisotopic',
-    'radioland',
     'radioligands',
-    'radiological-endoscopic',
-    'radiologicial',
-    'radiologie',
-    'radioluminescent',
-    'radiomail',
-    'radioman',
-    'radiometrically',
-    'radiometrics',
-    'radiomicrographs',
-    'radiomorphology',
-    'radionucleide',
-    'radioopague',
-    'radioprotective',
-    'radioresistant',
-    'radiosensitive',
     'radiospares',
-    'radiospeak',
-    'radiotelemetric',
-    'radiotelescopy',
-    'radiotelevisione',
-    'radiotracked',
-    'radiouclide',
-    'radisa',
-    'radish-crimson',
-    'radish-size',
-    'radish-sized',
-    'radisich',
-    'radisson',
-    'radite',
-    'raditherapy',
-    'radition',
     'radium-226',
-    'radium-like',
-    'radjavi',
-    'radke',
-    'radko',
-    'radleys/pale',
-    'radm',
-    'radmilo',
-    'radner',
-    'radnor/protest',
-    'rado&scaron',
-    'rado-opaque',
-    'radojka',
-    'radolfzfell',
-    'radom',
-    'radomes',
     'radomir',
-    'radomiro',
-    'radon-222',
-    'radon-measuring',
-    'radon-potential',
-    'radon-related',
-    'radonezh',
-    'radosavljevic',
-    'radoslav',
-    'radovic',
-    'rads.',
-    'radstone',
-    'radtop',
-    'raducioiu',
-    'radue',
-    'radulfi',
     'radulovic',
-    'radvanyi',
-    'radvils',
-    'radway/warwickshire',
-    'radways',
-    'radwell',
-    'radwell/eyewitness',
-    'radzianko',
-    'radziel',
-    'radziwill',
-    'rae.',
-    'rae/cumbernauld',
-    'rae/support',
-    'rae1',
-    'raedene',
-    'raees',
     'raef',
-    'raefnaeskol',
-    'rael-brook',
-    'raeleen',
-    'raelian',
-    'raent',
-    'raetia',
-    'raeve',
-    'raf-decorated',
-    'raf-owned',
-    'raf-style',
-    'raf/rafa',
-    'raf/rn',
-    'raf8',
-    'rafal',
-    'rafalimanana',
     'raffaello',
-    'raffanti',
-    'raffarin',
-    'raffeen',
-    'raffell',
-    'rafferty/artistic',
-    'raffia-encased',
-    'raffia-like',
-    'raffishly',
-    'raffle\'',
-    'raffle-ticket',
-    'raffle.',
-    'raffles-type',
-    'rafflesiana',
-    'rafin',
-    'rafinesque',
     'rafiu',
-    'rafle',
-    'rafnesiaceae',
-    'rafraichit',
-    'rafter-and-purlin',
-    'raftered',
-    'raftery',
-    'raftsmen',
-    'rag&ocirc;ut',
-    'rag&uacute',
-    'rag-2',
-    'rag-arsed',
-    'rag-clouds',
-    'rag-curlers',
-    'rag-day',
-    'rag-dolls',
     'rag-music',
-    'rag-outs',
-    'rag-pack',
-    'rag-pegged',
-    'rag-rolled',
-    'rag-rolling',
-    'rag-tag-and-bobtail',
-    'rag-taggle',
-    'rag-time',
-    'rag-top',
-    'rag-winged',
-    'rag-worted',
-    'ragan',
-    'ragansberg',
-    'ragatag',
-    'ragazzo',
     'ragbags',
-    'ragdolls',
-    'rage-driven',
-    'rage-hungry',
-    'rage-tormented',
-    'rage/or',
-    'rageful',
-    'ragga-gruff',
-    'ragga-hip-hop',
-    'ragga-rap',
-    'ragga-street-afro-swedish',
-    'ragga/rap',
-    'raggahouse',
-    'raggatip',
-    'ragge',
-    'ragge-trade',
     'ragged-edged',
-    'ragged-staff',
-    'raggednition',
-    'raggets',
-    'ragghianti',
-    'raggies',
-    'raggio',
-    'raggity',
-    'raggletagglers',
-    'raghunanadan',
-    'raghunandan',
-    'ragimov',
-    'ragin\'',
-    'raging.',
-    'ragioniera',
-    'raglan-sleeved',
     'ragland-sullivan',
-    'raglans',
-    'ragler',
-    'raglin',
-    'ragman',
-    'ragnarok-spirit',
-    'rago&ucirc;ts',
-    'ragossnig',
-    'ragouts',
-    'ragozine',
-    'rags.',
-    'rags_no',
-    'ragtime/',
-    'ragtop',
-    'raguenet',
-    'ragurag',
     'ragusavecchia',
-    'ragweed',
-    'ragweek',
-    'rahamn',
-    'rahan',
-    'raheens',
-    'rahel',
-    'raheny',
-    'rahid',
-    'rahila',
-    'rahilly',
-    'rahima',
-    'rahimah',
-    'rahimi',
-    'rahmanfinance',
-    'rahmanforeign',
     'rahmatollah',
-    'rahmin',
-    'rahr',
-    'rahtz',
-    'rahunen',
-    'rahway',
-    'rai&ndash;bangkok',
-    'raid-3',
-    'raid-3-like',
-    'raid-by-raid',
-    'raidan',
-    'raidas',
-    'raide',
-    'raiding-party',
-    'raids.',
-    'raigne',
     'raignes',
-    'raihousing',
-    'raijmakers',
-    'raijputana',
-    'raik',
-    'raikinish',
-    'rail&ndash;served',
-    'rail-',
-    'rail-and-road',
-    'rail-bridge',
-    'rail-buffs',
-    'rail-building',
-    'rail-bus-underground',
-    'rail-centres',
-    'rail-coach',
-    'rail-cycle',
     'rail-eagerly',
-    'rail-fall',
-    'rail-head',
-    'rail-inclusive',
-    'rail-joint',
-    'rail-lines',
-    'rail-link',
-    'rail-mobile',
-    'rail-over',
-    'rail-related',
-    'rail-sided',
-    'rail-spike',
-    'rail-trucked',
-    'rail-users',
-    'rail-way',
-    'rail/road',
     'raila',
-    'railbreaks',
-    'railbuf',
-    'railcard-discounted',
-    'railer',
-    'railers',
-    'railfreight&ndash;liveried',
-    'raili',
-    'railings.',
-    'raille',
-    'raillerie',
-    'railmotors',
-    'railport',
-    'railride',
-    'railriders',
-    'railriding',
     'railroaders',
-    'railscene',
-    'railton.',
-    'railton/oxford',
-    'railtons',
-    'railtrak',
-    'railwa',
-    'railway-board',
-    'railway-bridge',
-    'railway-coach',
-    'railway-company',
-    'railway-destruction',
-    'railway-engine',
-    'railway-engineering',
-    'railway-line',
-    'railway-man',
     'railway-men',
-    'railway-platform',
-    'railway-poster',
-    'railway-rooted',
-    'railway-sidings',
-    'railway-signalling',
-    'railway-stations',
-    'railway-style',
-    'railway-timetable',
-    'railway-town',
-    'railway-wagon',
-    'railway-wagons',
-    'railway/museum',
-    'railway/to',
-    'railway_so',
-    'railways.',
     'railways.richard',
-    'railyard',
-    'raimond',
-    'raimonde',
-    'raimondin',
-    'rain&ndash;snow',
-    'rain&rehy;sodden',
-    'rain-as-a-symbol',
-    'rain-bloated',
-    'rain-blur',
-    'rain-blurred',
-    'rain-borne',
-    'rain-causing',
-    'rain-cloud',
-    'rain-clouded',
-    'rain-dances',
     'rain-darkened',
-    'rain-delayed',
-    'rain-drowned',
-    'rain-forests',
-    'rain-free',
-    'rain-gutter',
-    'rain-laden',
-    'rain-laws',
-    'rain-makers',
-    'rain-restricted',
-    'rain-ruined',
-    'rain-scoured',
-    'rain-sensor',
-    'rain-shadow',
-    'rain-shedding',
-    'rain-slashed',
     'rain-soggy',
-    'rain-spattered',
-    'rain-spotted',
-    'rain-storm',
-    'rain-water-spume-blood-oil',
-    'rain-wrapped',
-    'rain.',
-    'rain/',
-    'rain/drizzle',
-    'rainbagh',
-    'rainbath',
-    'rainborough',
-    'rainbow*',
-    'rainbow-arguments',
-    'rainbow-coalition',
-    'rainbow-flashing',
     'rainbow-like',
-    'rainbow-skinned',
-    'rainbow-spattered',
-    'rainbow-splashed',
-    'rainbow.the',
-    'rainboy',
-    'raincoat.',
-    'raindale',
-    'raindancing',
-    'raindle',
-    'raindown',
-    'raindrenched',
-    'raineach',
-    'rained-out',
-    'rained-upon',
-    'raineys',
     'rainfall.',
-    'rainflow',
-    'rainforest-although',
-    'rainforest-dwelling',
-    'rainforest/global',
-    'rainforested',
-    'rainfull',
-    'rainha',
-    'rainhead',
-    'rainich',
-    'rainieri',
-    'rainley',
-    'rainment',
-    'rainmondo',
-    'rainridge',
-    'rains/gooch',
     'rains/steeple',
-    'rainsborough',
-    'rainsboroughs',
-    'rainses',
-    'rainsford-hannay',
-    'rainsfords',
-    'rainsuit',
-    'raintimes',
-    'rainwashed',
-    'rainwater-butt',
-    'rainwood',
-    'rainy-afternoon',
-    'rainy-day',
-    'rainy/windy/busy',
-    'raire',
-    'rairneachan',
     'rairyganoo',
-    'raisanen',
-    'raisd',
-    'raised-beach',
-    'raised-eye',
-    'raised-eyebrow',
-    'raised-spot',
-    'raised-up',
-    'raised/',
-    'raised_in',
-    'raisi',
-    'raisig',
-    'raisin-filled',
-    'raisina',
-    'raising-from-the-dead',
-    'raising.',
     'raising/fund',
-    'raisiny',
-    'raisky',
-    'raisman',
-    'raison&eacute;e',
-    'raison_d\'&circ;etre',
-    'raison_d\'&eacute;tre',
-    'raisonnable',
-    'raisonnables',
-    'raisonneur',
-    'raissa',
-    'raisy-eyebrowed',
-    'rait',
-    'raitha',
-    'raiva',
-    'raiyat',
     'raj&atilde;o',
-    'raj-like',
-    'raj/driver',
-    'raja-shikara',
-    'rajang',
-    'rajaonarivelo',
-    'rajaori',
-    'rajaratnam',
-    'rajaruwo',
-    'rajas',
-    'rajashtan',
-    'rajastani',
-    'rajchtova',
-    'rajczonek',
-    'rajdev',
-    'rajeev',
     'rajender',
-    'rajeshwar',
-    'rajeswar',
-    'rajic',
-    'rajim',
-    'rajit',
-    'rajjuh',
-    'rajka',
-    'rajko',
-    'rajman',
-    'rajmanfal',
-    'rajo',
-    'rajouri',
-    'rajov',
-    'rajputanah',
-    'rajshahi',
     'rajska',
-    'rajski',
-    'rak\'ahs',
-    'raka',
-    'rakant',
-    'rake-held',
-    'rake-hell',
-    'rake-offs',
-    'rake/karen',
-    'rakelands',
-    'rakeoff',
-    'raker',
-    'rakesh',
-    'rakewell',
-    'rakhashas',
-    'rakhim',
     'rakhine',
-    'rakhis',
-    'rakhom',
-    'rakipov',
-    'rakiz',
-    'rakoto',
-    'rakotoharison',
-    'rakotomavo',
-    'rakotovao',
-    'rakovskii',
-    'rakshasa',
-    'rala',
-    'ralahine',
-    'rald',
-    'ralegh-radford',
-    'raleigh-durham',
     'raleigh-esque',
-    'ralgex',
-    'ralik',
-    'ralleye',
-    'rallidae',
-    'rallis',
-    'ralloides',
-    'rally\'',
-    'rally-attenders',
-    'rally-organiser',
-    'rally-rassemblement',
-    'rally-teachers',
-    'rally/demonstration',
-    'rally/reunion',
-    'rallyers',
-    'rallying-cries',
     'rallyists',
-    'rallys',
-    'raloo',
-    'ralph-appeared',
-    'ralph/crooks',
-    'ralph/forestry',
-    'ralph/regent',
-    'ralphe',
-    'ralphie',
-    'ralston-purina',
-    'raly',
-    'ralye',
-    'ram&egrave;ne',
-    'ram(s)',
-    'ram-intensive',
-    'ram-jeep',
     'ram-jets',
-    'ram.0/bbcbasic/progs/test',
-    'ram.o/ee.cli',
-    'ramacake',
-    'ramachandra',
-    'ramagge',
-    'ramaishing',
-    'ramajli',
-    'ramak',
-    'ramakant',
-    'ramakrishnan',
-    'ramalama',
-    'ramalepe',
-    'ramamohanarao',
-    'raman-inactive',
-    'ramanathan',
     'ramangasoavina',
-    'ramani',
-    'ramankutty',
-    'ramansk',
-    'ramarosandratana',
-    'ramasses',
-    'ramaswaram',
-    'ramat',
-    'ramaya',
-    'ramazani',
-    'rambai',
-    'rambaud',
-    'rambla',
-    'ramblage',
-    'rambly',
-    'rambo-esque',
     'ramboe',
-    'rambol',
-    'ramboll',
-    'rambot',
-    'rambuka',
-    'rambusters',
-    'ramby',
-    'ramchandant',
-    'ramcom',
-    'ramd',
-    'ramdac',
-    'ramdathsing',
-    'ramdrv.sys',
-    'rameaugate',
-    'rameaux',
-    'rameez',
     'rameishing',
-    'ramelau',
-    'ramelho',
-    'ramembrit',
-    'ramen',
-    'ramenskoe',
-    'ramesseum',
-    'ramesseye',
-    'ramessids',
-    'ramgarh',
-    'ramgarhians',
-    'ramgharia',
-    'rami&eacute',
-    'ramins',
-    'ramish',
-    'ramjam',
     'ramjets',
-    'ramkalawan',
-    'ramlawi',
-    'ramlet',
-    'ramli',
-    'ramljak',
-    'ramlosa',
-    'rammell.',
-    'rammerorck',
-    'rammers',
-    'ramming-spike',
-    'rammingo',
-    'rammoham',
-    'rammore',
-    'rammulotsi',
-    'ramnefjell',
     'ramonesian',
-    'ramp-up',
-    'ramp/grooves',
-    'ramp/halfpipe',
-    'rampa',
-    'rampageous',
-    'rampal',
-    'rampancy',
-    'rampantly-bad',
-    'rampe',
-    'rampello',
-    'rampenstrasse',
-    'ramper',
-    'rampersad',
-    'ramphastos',
-    'ramphele',
     'ramping-up',
-    'rampino',
-    'rampsgill',
-    'rampton-type',
-    'rampujan',
-    'rampura',
-    'rampus',
-    'ramraiding',
-    'ramraids',
-    'ramrez',
-    'rams&oslash;y',
-    'rams-page',
-    'ramsala',
-    'ramsau',
-    'ramsay/marketing',
-    'ramsay/radar',
     'ramsbottom_et',
-    'ramscar',
-    'ramsdal',
-    'ramsden/accident',
-    'ramsdown',
-    'ramsey-legend',
-    'ramseyer',
-    'ramsgate/dover',
-    'ramshackled',
-    'ramshead',
-    'ramside',
-    'ramsperger',
-    'ramsthorpe',
-    'ramstrasse',
-    'ramtek-9351',
-    'ramu',
     'ramuntcho',
-    'ramushwana',
-    'ramwhale',
-    'ramwong',
-    'ran/hobbled',
-    'rana-mike',
-    'ranakpur',
-    'ranalli',
-    'ranau',
-    'ranby',
-    'ranc',
-    'ranc&eacute',
-    'rancagua',
-    'rance/owner',
-    'ranch-bred',
-    'ranch-farming',
     'ranch-house',
-    'ranchbred',
-    'rancher-businessman',
-    'rancheria',
-    'ranchero',
-    'ranchettes',
-    'ranching.',
-    'ranchland',
-    'ranchlands',
-    'ranchmen',
-    'rancho-style',
-    'ranchod',
-    'ranchus',
-    'rancic',
-    'rancidity',
-    'rancidly',
     'rancis',
-    'rancorously',
-    'rancour.contempt',
-    'rancourt',
-    'randa',
-    'randak',
+)
+
+blocks_60 = (
+    '%)olidarity&)vereignty%&panish%(talinist\'&ndards&$rike&#yle%$wapo&%edish%&yrians$%talus&"nu&!x&$ylor%#eam',
+    '&!m&%stant%,hemistoklean%$iger&"le&\'meshare%&ourist%$rade(#ing\'!m&%ident$+ulcerogenic%%nited&!p%(rokinase',
+    '&%tican%)egetarian%/ice-chancellors&"de&(etnamese&&olence&$sion$\'walking&(shington%\'elensky\'!f&"st(&ernism%#hig\'&tehall',
+    '\'$liam%%orker$&yankee$$zhao#!.##/am$)celebrity$\'paradox#!_$(pro_rata#(abortion$"ct$&lcohol$%mises%\'plifier',
+    '#"b-$#/11\'$/373(&474/40&!2$%abaly&"il(#ism*\'tically)$t\'es*"y.&$lity\'"y\'(%-also)*fictitious',
+    '($/has((_because%"ly%"rt\'\'/mother%!t&"ed&)ion-order)0er-superhumanity\'-ve-evidential$&e-like&%probe%\'/contig&&signal%\'d/after',
+    '%,rt/cambridge\'!s%"s.&":i$%ingly%.tts/accountant$!l%!e&+m&mdash;the(%ndash(/rehy;orientated-\'solving\'&-areas(\'causing(&direct',
+    '(4focused/task-centred("he(.identification(%owner($page)$roof((solution)\'pecific(#the(-understanding\'(.asquith(#you\'./failure/fault("is(,person/event',
+    '()solutions($task\'$:who\'#_at\'$mmmm\',s&mdash;they($--in)"at))depending)2for-the-solving-of);of-driving-in-urban-traffic(!.)#its(#_at(&olving',
+    '%#que%$sces\'&ideans)$ians(\'s-laden+#ike)"es&&utedjo%&tector%\'uleutic$&reeder$$ucol$,yn/estranged\'\'husband&!e',
+    '%&lowbar+$;aux,%saved-%creen$!2$#add%&ryotes$$e(b)&%nnnn)%#ded&#ura)2l-representational*#ism+#zed(*e/function',
+    ')"ly)/s&mdash;methods*"\'.*#.45*$such%$ed.9\'!e%&llaria*$idae%%ptive%"ra%,ss&mdash;not\'!-("-a(!a',
+    ')\'pproach(\'centred(*diagnostic()equipment()generated)"od(+independent)!s(*orientated(\'related()switching(%water\'!.($even($lord',
+    '(#new()privilege)%ublic(%quota\'\'ability)"le\'1configurationfile\'(ed-foods*+whatever-by(#sor\')ing-based+(friendly+\'on-unix+%plant+*relational',
+    '+&report(#on.*#ary\'2or&mdash;intensive)#(s))!-**controlled*)intensive*-memory-switch*%sparc,&ecific)"s/\'\'package()hotograph\'$sing',
+    '$!f$,hlorperazine$#ida&!e\'!s%"ne$%kters&"or$&laimer($sthe%%insul&#tic("ve%"us$"ol',
+    '&"or%\'mmunist&!p\'%ilers%%nsul-)"ar*"te)$idae+!s%#tol$*rastinates$"ta%-er&amp;gamble\'%esque\'!s',
+    '&(colectom-"ny&)metrogram&)r-general$#uce%%mbent%!r&%acies\'%duria\'#tie(%orate*#ial*%ships&"e.\'+ment-policy',
+    '\'#use$\'yclical)!s%&midone#&ddings%"ow%"ys$&ecures%"re%#sco&%igner$"ge&\'r-faldo$#hon$\'ictoion',
+    '&$eous&-iously-gifted$(ominance%#und%-vol\'stvennaia$%romos%-ug-activating$%uce-a()marketing\'&/value\'0r&mdash;director(#(s)((-country),distributors),entrepreneur',
+    ')&groups)*in-waiting)\'manager)(oriented,\'ginated)%price)\'subject(!/)\'central))usergroup(!y\'"ts&\'ibility(&leness)!y',
+    '&%kshun&,t&mdash;down(,rehy;centred\'!\'\'&-based)(elievers()conscious*"st)$ycle(/differentiation*)versified(*efficiency(#gdp+&-terms)*enerations',
+    '()labelling)2eaflets/literature)$ines(&moment(&of-the))rientated()placement)(ortfolio))rotecting(-specification)#wap(#use\'!/(+ideas-based(\'machine',
+    '+$ject(\'revenue(#sbu\'02,325,00033.6%6%\'"ed\'$iion(,on&mdash;are1,particularly*!\'*!-+(capacity,+enteredness+%level+&minded,$odel',
+    '+\'quality+$rate,&elated+%scale+#the,#ype+&volume*).oriented*,/consumption+\'library+)marketing-"ss+&supply*\'isation,!e',
+    ',"ts)!u(&sation)#ing($tion(#ve.+\'harmony).ity-accounting-+improvement-&profit,$.all\'!o("ry(!s\'\'package',
+    '(#.so(*/augmented)(benefits*)usinesses)\'markets)+performance*(rocesses,$duct)&skills\'"us%#ire&!t%%ktion\'"ov%&sdands',
+    '##ect&$ions\'"ve$\'mbryoes%#ium$(spective$$ttes#%faine%$mily%#nes&#ter%(shionals$&ecting%"el%%rens.',
+    '*!s&$ring%(ssion(s)*$-led+*orientated*+/regulatory*/al&rehy;amateur,!\'-!s,\'-client..um-greenkeeper-\'general-*negligence-0paraprofessional-(sounding',
+    '-&tennis..o-professional,$/ami-4commercial/education-+established-(mortgage-0non-professional-,occupational-*scientific-)volunteer,#ise."ms."ts,*ly-applied/%built',
+    '/)presented/#run/%sound/&trendy.)installed,.s-particularly-&.chris."ps-)/managers.+specialists*"el*"s.\'"of($nals()r&mdash;i',
+    '*\'student)*/associate)#ate)#iat)+s&mdash;and1)moorcroft\'$sion("or%#tas$%fesor\'&sional%6itt/curator/slimbridge%%wyddi$,i/trekker/pf%*brinolytic',
+    '%!d%+le-building(\'fitting()reporting\')s/records\'$ws17&\'ometers&!s%.t&rehy;centred,*generating,\'sharing&--achievements\'%based*$hing\'\'centred',
+    '\'(friendly\'%goals)&verned\'(improver\'&makers)$rgin)*ximisation.#ers-#zer(&ission\'(reducing\'+sacrificing(\'tandard\'%taker*\'ing-the',
+    '\'\'winning\'(yielding&!.&\'/and/or\')nonprofit&)abilities,"y.((le&mdash)$ilty&%boss.&&ebatur\'$role\'"th&\'ization&)producing',
+    '(\'related&$wise$(ligately)#ion%%uvium$#ond\',&eacute;ment\'!o%&rmance(!s%,und/multiple(!s$!t$!u%%ction',
+    '%$ndus%%sedly&#ive#(g-thrash$%alyne%#mme%$tion$"en&#ies\'$tive($ress)"ix&$oids%(ss-based\'#ion',
+    '&+terone-only\')ogen-only%#tto$1folk-jazz-r&amp;b$#ged%!y$%ility$"na&#nil&%thism%!o&(stically+#ted*!s$#oda',
+    '$(radation,0al/aggradational&+m&mdash;and\'.(s)/sub-system\'*-crunching(\'trading(\'writing\'$.ini\'!/($6000(\'channel(&delete(-microcomputer\'!1\'#_so',
+    '(#tic+$ally\'"ed\'"ma)!r)$tist(1e&mdash;described0\'risking))-cum-chat*&driven*$even*$note*-of-the-moment*,to-programme)!.',
+    '*#you))/activity*&period+#lus*\'tickets)(d/preset)$r(s)*(/analyst**s/analysts)"s**".e*!/)"ur("me\'$nykh',
+    '($=com%,es&rehy;sive\'$ista\'(s\'&mdash((-chasing)#gap)#how)#not)(retarded(%.what($ieve)"fs)!o)#sta)\'ve-part',
+    '+)ly-minded.&rising*$ists($sion("us%#mme$%uanin$!y##hib&&itable(#ed\'*!.)"ly$!m#\'iezioni',
+    '$%mager#$jecs&)t&mdash;a(+rehy;manage\'#(s)\'+-by-project(\'finance)%unded(+independent*)volvement(#led)%inked(*management.!s(*orientated',
+    '((specific\'".a(#the\'-/organization(%topic\'%_with\'*ile-firing+\'vomited($ons.++/statements\'"s-(\'/topics\'$ural\'%woche\'%x.001',
+    '\'!y%(kte/late%$tion$#iss#%kappa%&rvotic$&ofieff%$pava&$enko&"ie\'!s&%ovich&)sk&aacute%#sch%$vief',
+    '#6l&eacute;tarien/monoma4(pitolona$)actinomas%#ins%$pses%%rised$(egomenon%$psis&\'tically%)tarianise-#ing-!m,$zing$$iant%,er-than-thou',
+    ')%tion/&*ic-growing%)gesterone%#nes$&ogue.4%%ngare\'#ed.("th\'#ued)"ur$"sq#&machos%"de%$rily&!y',
+    '%!x$&berton$(ecotheca%"na\'2de&ndash;fleetwood)$/how)(nstrasse&+talshitback%#sse\'!i%\'thacine\'%euses$"in&#ant&%ence.',
+    '&)ut&iacute%#se\'\')-breakers(&filled("he\')/contract\'"es\'%s/all&#in\'()g-seeming*$very)(.looking)+ly-entitled,&titled&#ors',
+    '$\'kunaram$%meger$&notion$*o&ndash;on&+rehy;tional/!s%&-clips&)treadmill%)des/dirsa%&nocyte*"ic%*t&rehy;ing&\'ability&#ees\',r-containing',
+    ')$lacz)(specific(!.("s.)$ct01&-ing/improving\'.on-challengers+(linching*$play+&ushing**relegation*\'seeking*$wise)!/)(al-based',
+    '*$ries)$less)2s-and-appointments*!.*)/laughing+-merchandising&*or-remotor&$rans$&pt-box&!.&(/delayed&)ing-lines)*_according)"ly&#ure',
+    '$)ulgations)#ors$)yelocytic%#sly$$zina#"n.$#aos%&talism*!t&#ing&#ors%!v$"et$&g-horn*"ed',
+    '$!i$$king$0ominal-anaphoric*(isations+#zed*"ly%$stic%#tum%\'un-less\'!.\'!c((ed&mdash)&ments.)!r(&iation',
+    '$\'tissimo$*unziamento%+ptia-youngs#"od$#em.&#ium$"f-&(bringing&\'defying&"if&*of-concept&%print\'&ulling&&taking\'(heoretic',
+    '%!/&"an&$jury%!e&"rs$!p$$shan%#ian(!s%!t$$ving#-p&rehy;aganda*\'powered$"\'r$&-1-ene',
+    '%$disc)!s&%riven%\'forward%&hooker%%shaft%"up$%afilm%1ganda&rehy;figure*+-propaganda+(sweeting**/programme)#ise+#ts.\'/tion/quarantine',
+    '%$noic\'#lol%$pack%$zine$+eller-heads*$like)!.)"s.\')or-driven%"nd&"es%\'r-nouns&!a&"er&$ites',
+    '(!*()-arranged)(balanced)\'defined)&funded)!i*\'nformed)$laid*"ed)$made+%naged))organised)&pulled))qualified))regulated',
+    ')\'working(\'.julian&!o\'"us&!s&\'tarians\'#ian(,es&mdash;for*!-+$each+)including-)vestigate+"so*#.it*#_so',
+    '\'\'raining\'0y&mdash;business(\'-backed**y-property)&claims*&ompany-#lex+\'nscious)(damaging*$eals*\'isputes),for-property))insurance+(vestment*!t',
+    ')\'nucleus)*orientated*(wnership)$poll*$rice)&rights)+temperature)%which(%/lack*&uggage((_subject$(gagating$+h&emacr;tes%!.%&ecized',
+    '**liberating)+ally-minded%"it%(ylactics$)inquitous("us%#ska%&tiates)%ingly*!o\'!e$!o%$deum&#ium%&erties',
+    '%&lactic&#ice%#ner(%entur%/r&rehy;tionally&"ia&\'tion_to*&alisms,*ly-reduced*-s&rehy;thirty\'!s%,sal&mdash;an(\'-either)&review&!d',
+    '&-ition_because,"in+$ally("um%%under$\'ping-up$(ranolol/%"e.&"ly&$ment%3i&eacute;t&eacute;s&#ate&\'etaires)$rial*\'y-based',
+    ')%tibus(#ers+#hip)"ss($ibus(&resses)!y&%nters&(oceptors%(otionate$#ser%%hafts%!t$*ugnatorius$$wash',
+    '$%ylaea&\'gallate#.regulationists%$nder$&ogates&$uing$#sus$%utori#-saic-sounding%!r$#car%%icard%"ot%$ript%%uting',
+    '$+e-character/!s&#man&\'sermons\'(oliloquy\'&peaker-!s\'%tyles&\'writing-!s%!.%%ctued&&uition\'+tion-minded+!.',
+    '(#rix(%uionb%!e%*lytisation*"es)#zed%!n%#oia%$pene%+rpinacoides%%ution$)hare-mori$"ig&$nias%!m',
+    '%"ng%"st%#tus$&kovief%&ynesis$$obee&%ranch+!s%\'dically(!s\'"es%#pis\'#tis&&ograhy*#phy',
+    '$#pec\'+ci&oacute;n\'"ls\'(t-refuge)\'viewers((ive-only+$ness+,surveillance("s.(#us.&\'rity-of\'&o-like&%ttive%$osed$!s',
+    '$)t-mansell%)aglandine&\'landins&$noid&#tes\'+ic-specific\'&odynia%\'glandin%$heca%!i&%gmine&"te\'$itis\'!u("es',
+    '*,-protagonist+\'related)%ional%%omium&!r&*strongylus%(ranthera\'#te.%%yakov&"le$#unt$\'yndrome#4t&eacute;g&eacute;es53s-turned-scoundrels-(e&eacute',
+    ',"qe&,circ;g&ecirc$(/6460/80$\'=s:rwed$!a%&ganist+!s&&landin,!s%$ndry%%phane%$sius&"ov$%ctive$!e',
+    '&!s\'+e-resistant\'$omes%$cion&%t-the+\'mselves\'#ant\'+ed&mdash;as0"no0(sidekick)%-mode\'&ingthe(#on\'*/(consolidation)*/-cum-deterrence',
+    '+*motivation+)pollution+\'seeking+$zone/(&lt;s&gt*,/improvement\'$orat\'$rice%!e%)g&mdash;e&"ee&$geri%#in\'\'!-(!2',
+    '((backbone)\'uilding(&coding*(ntacting(\'derived(&energy(#fed)#ree(%lipid(\'nucleic(/oligonucleotide(&packed()rich-diet()sepharose)&tarved',
+    '0$zing($tree\'&/fibre(5glutathione-sepharose("kg((moisture(*nucleotide(\'protein((reporter\'(:protein\'"es\'"ic\'"s.\'%urial%$lene',
+    '*#ion%"o-&,glycan-bound-+immobilized&%lyzed%$plex%$rgum%$ssor&+t-in-itself((morality(%prone\',ant-catholic+)dominated+(educated+#led',
+    '*&ischer(&tions-\'$ors.%!u%)vangelium%"xt$!g$-hero/hereford(-ugh/aylestone%&iophos%1rombin-converting$"ic%%meter%"on%"st',
+    '%"um$#ner$0o&rehy;democracy+*industrial%(\'-belief%+-australoid&\'bankers\'&eliefs\'(rechtian&+capitalists(*rbohydrate(\'ucasian\'$lass\')ontinents\'%ubist',
+    '\'(ionysian\'!o\'\'ramatic&*echinoderm((umenical&%fauve\'#orm\'$unky&\'gardens\')litterati\'$reen&*hippychick&-impressionist\'-ndustrialists&#jpl',
+    '\'*imberlitic&$lens\'#ife\'#uke("ng&(majorese($lays\'%iddle((nimalism\'*odernisers.!m((netarist&$nazi\'$erve\'$orms',
+    '\'#vum&)palladian\'$lume\'*roletariat&\'realist(&ptiles\'$oman&)satirical\'\'ciences\'\'inaitic\'$outh\')urrealist\'(ymbolist&&temple(#xts',
+    '&+underground&%wings%%blues%$cell&\'lusters&3ol-and-agenda-laden)%based))compliant(!e)%ctomy%(feminist%(galaxies&!e&#ram&%ynous',
+    '%$life%\'mammals&"er(!s%*n-detected)&uteron\'\'neutron.)-electron&)/electron&\'ational&#oan&#sil%&pathic&)eridinium&%lanet',
+    '&%terus%"re\'%aster\'\'ligious%$scan\'(ientists&#oft\'!l&%uchus\'!n(!s%%type\')&-build*"of)!.',
+    '("ic%$view%#xin%*zoal/fluke\'%ology$"ra&!c\'%tedly(!s%\'eptikos%%usive$"ta$$uded&#ing$#ype',
+    '%(-blooded&\'rounded%!/%!e&!d%&honist%#ies%-ly-maintained%!r$"lx$!n%#ced$(rokinase$#sed%"se',
+    '%!e&!n$%ville%#ost#*vacatively%$rian$"de$,e&ncedil;cal%!.%$/the%&d_once%1n&ccedil;al-print1%style\')rehy;cale&#-am',
+    '&%cales&"ly%*rb-spinner\'$ials$$idal&-e&lsqb;d&rsqb\'!\'\'"d\'\'"es\'$nces)#iae(#tia)"ly\'-r&mdash;often((-centred',
+    '(&/space\'#s.a&!i\'"n\'\'%teurs%+n&ccedil;al&!\'&,ce&mdash;the(-s&mdash;would\'-ial-chronicle+\'theatre*(/english*"is,%ation("en',
+    '&\'sbanken%,s&oacute;ria&8ion&mdash;s740&mdash;can)!\').al&mdash;drawn++-controlled+#ism+"s.)"er)*s&mdash;he*!-\'"ve&"on("al\'!r',
+    '%"ta\'#l-h\'#min%"vo$(ocateuse(8ion&ndash;neutralisation+%:does)+vely-titled(#ory%#gue%&kation&-ed/mistreated\'!r&#in\'%(smarshal',
+    '#"wd$&l-boys$-orks/teamware$)se/unison$$ting#&xemics$\'icromil%*mal/distal\'$tion&%ities$\'y&mdash%&holder#&yectos#!z$#ess',
+    '%!r"$pety#%osals"$r-ip##rit#!s"*s-licenced#!.#&/eggle##ent$!s#!u"(t&num;-1#(463330-1#!c',
+    '#!l$!y#!y"$u-it$%nella#"ce#&dencio$#hon#$ffle$\'rockian##ger#&inosus$!t%&-early%&t-igoe',
+    '#!m#&nastri$*e-coloured&%faced%%d-off\'"up$,i&egrave;res%$eres%)ng-knives%"sh$#ner$$uses##rgh$0ient/puritanical%#tis',
+    '$#ias$!s%4ian&ndash;napoleonic(+-controlled)$held&"on%#sia#(teen&reg"0voven&ccaron;ani"%w1008&!9#!2"%y-bar#,ce/reporting&)worcester',
+    '#$dain$#ein#"me#\'or/john%!s#(s-davies$#che$!e$!g#&taneia\'"um##vie")zewalskii#(kladnica#"no',
+    '!#s-2##led#)parachute$"sc#\'reading"".1$"19#!2#!3#!4#!6#\'x63.653$"en"#/2-%*compatible',
+    '"!1"(2/30-286$%model#!3"$3270"$5900""65"#853"#915"#abm#!c#!d#$khis#$llat$+m-composers',
+    '&%tunes&&writer%!i&%cally&#sts%$odic$&teries$$vgau##mma%\'etzchus$#tik#-rouda-benakif"1c&mdash;christian#%-psoe#!.',
+    '#!h$(yo-motor#(ript.drv"2d&mdash;democratic#!a#"ec#/i&mdash;italian")e-binding#&aulmes%#mes#%ctrum#*phopololis&!s%$urus#-udapostolorum',
+    '%%flesh%&o&rehy+);academic,&bulbar,(hegelian,-professionals&\'-\'folk\'\')actuality()djectives(&ffixed(\'lbanian)#tar()mbassador((nonymous)-thropological',
+    '(\'rchaism)&isteas,\'ocratic)!t*&hritis(+uthenticity+%ority**obiography\'\'bishops(\'ohemian(&ritain(#ubo\'&centre(&hanges(&itizen',
+    '(,ommunication)&ttagey()rocodiles\'&debate)$ixis)(mocratic)#nis*"ys()ickensian)(onysians-"us(\'ramatic)$eams\'*ecological)(umenical',
+    '(-galitarianism)&yptian(&mblema(&nquiry(+scaperoutes(\'ternity)$hnic(+volutionary(%xpert\'%faith)$mily(%emale(%ishes($lies\')gentility',
+    '((onococci(\'randeur()uerrillas\'&hannah)&rdcore($eads(+itchcockian(*ollandaise)\'mophone(\'umanity(+ypertrophic\'%ideal(+mprovements(,ndividualism)\'fantile',
+    ')+tellectuals+$rest*%imacy($rish(&sidore."an\'%karst(&inship\'\'lesbian()inguistic)&teracy)%zards\'%macho)%rxist)\'sochism',
+    '/%-type((odernism(%ythic\'\'natural($eeds)(tworking)"ws\'#oak((bjective0!s(\'fficial(.lder-and-wiser(.ne-dimensional((peration0!s',
+    '(\'riental\'(parallel**ticipation(*endentives)$riod(-hilanthropist+\'osopher(,icturesquely)"er)!n(*lanetarium*%tanus((olitical((regnancy),ivatisations',
+    '\'\'radical(&ealism))formation)+lationships)&search)-volutionaries()iemannian((omanists(+uthlessness\'&sacral)*tisfaction()cientists)&ottish)%rotum)$ylax',
+    ')"lf(,hakespearean(+ignificance("ki(-ophistication)#und*%thern(&patial($tars*&tement)%erile)+ructuralist(&ubject(\'ynonyms\'&themis',
+    '(%ribal(&wofold(&ypeset\')variables(%ector((ictorian)(rtuosity)&tamins\'\'whorish(&ombles\'$xxxx\'&zealot&\'allergy&+brachiopods\'$ulbs',
+    '\'$left\')olochirus((ntinuous\'\'rinites&\'dynamic&.elizabethanism\'(phedrine\')xcitation&&gamous)!y\'#ene&/hermaphroditism\')istorical\'(omophone/!s',
+    '&,independence\'+sochromatic&%karst&\'leather\'\'ineatus(&teracy\'\'ymphoma&(magnetic\')echanical(&dieval((mbranous)%ories(&tallic\'$onad+%aceae',
+    '(\'saicism\'$yrex(\'sticism&+perceptions)%iodic($ziza\'"od)"ia*"um(\'litical((ntifices\'(regnancy&&rabies\'"ca\'\'esearch',
+    '\'"yx&$sasa\'\'ciences+%tists(\'orpions\'%exual\'\'pawning&0tetrascaccharide\'$suga\'%umour&\'uridine#\'ydocyst"!g##424"#haw',
+    '##oow#0wishwishwishwish"/i&mdash;italian#(-psi-psi#+/department#/2-nipenv5-virus#!g#$llid$&ocybin%%phyta)"es%%ritis%)tripitaka#$mhis#(ons-lack',
+    '#%ttaci("ne\'#oid(&saurus".l&mdash;polish#/-s&mdash;polish%)olidarity#!a#!c#!o"\'n/first$*group/last$$last$,window/first"0oe&mdash;spanish',
+    '(!s#%sible"$p64t##ice#!p"0r-1744&ndash;24a#-1800&ndash;21%&219-10#\'2224+65"+s&mdash;san#&hoooow#!o##sst""tn"*u-formerly',
+    '#0edo-allegorizing\'%macho#&sennes"%v2neo"%y-ops#%cards$*h-profiles&$tech(#sts%+analytiques&$tric%.e-regenerative&0/milkman/rocking&)delecists)\'ic-funk',
+    '+$ious\'#lic%"ia\'$trie*&sation&&c-type&%taric%1o&rehy;biological,\'logical&(-analyse.!d-#ing(+romatherapy(&venger\'#cop',
+    '()iscursive(%ramas,#tic\'+educational(/ndocrinological\'\'genital)(riatrics(%runge\'(hormonal\'&killer)%netic.!s\'+linguistics/!s\'\'medical',
+    '\'*navigation)"zi\',pathological/!y()hysiology\'0sexual-emotional(\'pecific)#oor(&urgery(\'ymbolic\'&techno((herapist&(acoustic\'!n(#aly',
+    '+9tical-cum-anthropological+$zing&%billy((ographer.$ical)&logist&(chemical\'\'ultural&%delic\'"id)"ae\')rama-type+!s&)endocrine\'+volutionary',
+    '((ographic0!s()rontology\'\'raphics&\'history&\'kinesis*#tic&%leech\'$ical\'5ogical-cum-biological."el.&social-*/cognitive.)emotional.,intelligence',
+    '.,subjectivist-,ly-disturbed*-st-cum-sexual-\'subject)"y\'*--manipulators*!.*&/youth&*mechanical(&trists&&neural*.oimmunologists+#tic\'"ic&,pathologizes',
+    '\',harmacologic2"st4!s1!y-!y()otography()ysiologic\'$lasm\'$olis("mp\'&rofile)(philaxia)\'sthetic&&scopes*!y',
+    '(&xually\',ocialization,"ly()matically\'&urgery&%thera+%py.as\'&ogenic\'#ria($onic)"pe%(rosphere$!o%\'logical%$path',
+    '#$kter#*tosanitary$&taleia!\'t&amp;r#\'rehy;17"$-120#"22#!6#"ir#\'r-r-r-r"#.ii"(/diploma"!1"!3#!5',
+    '#)62/g-ctix"!6#$a-64&*7b-powered$!s""a.#!1$(,421,100$!0%!0&!0%#8.4$$1.29$*8&ndash;22#%2,300',
+    '&$,000$"10$*2&ndash;26%".6$#3.5$)9,040,000#"30$"58$)6,500,000$!7##4.3$!0%)&ndash;60#"50$"84',
+    '#"70$!6##800#!c#&h-ankh%%hotep%%tenen#,rmicaeflorum$%nigan#$s2.4$#300%!3$#500%!1"$dins',
+    '&!p"#ech#%ralia%$spid(!s$&idines&(ological\'%mania\'&philia\'%sperm,&ophyta%)odophytes$(obranchs%\'clidae.%"is',
+    '&%orphs%&phylum("ta&"uo%$saur&%tigma%&thorac*!x$%ygoid"!f#"ma%#200\'!4\'!7\'!9',
+    '\'!4\'!5"!g"%hisis##rp.%%=11.0&$21.0&#4.4&#8.3""ik#\'linopus$$otis#!s$%annes""ks',
+    '"#nrs"&olemys#"ng##off"$p-1b#%ase1b"(r&num;-1)\'returns(1fnum=ext&num;fnum(#num#".o##ans#!c#&naba-1#!r',
+    '"$s+10#$-100#"10$!1##mth#!s""tp"!x#\'/backup$+transaction""y.#$depe#%milne#"r2"#z18',
+    '!%u-980##erh"#2.1"$3202"$4400##700"$6000"$anga#!t"$b(s)#(-crawled)#ing$$fare$$goer%#rub',
+    '$\'rockers$\'singing%0py-cum-physician$$talk%&heatre%+urned-hotel%#ype#!.#%/club$%disco$$folk$&hotels#!a##bed%!r',
+    '$#ing$)licazioni#"er#&fitter#$goer#!i$"cs$&nervis$$shed#"li%$-air%!a%$c&gt\'-mdash;private-#the',
+    '&*-appointed\')borrowing(+roadcasting\'&choice\'$debt)%cency(%omain\'\'finance\'&garden\'\'library\'&minded\'#not*#ice\',order-threat($wned',
+    '))ocurement\'&rented\'/school-educated.$type-\'masters(\'ervices()piritedly\')telephone(0o-private-sector&!/\'&client(-ommunity-wide\'-institutional\'%media\'(national',
+    '\'$work&(:private&#_at&,a&rehy;tions\'&ciones\')lly-owned\'!s\'%tion.,!6,!c+)/official+!1&!e&%house&&isable',
+    '(1t-turned-producer\'(t&eacute($aire(+y-conscious*(grabbing*&seeker0!s*$wise\'*ze-they-it&"ke&#lty\'-y&rehy;traded(,-accountable*)dvertised*(ppointed',
+    '))expressed)$held))professed,%vided)&quoted)&rented))sponsored&(spirited&"un%&espana%"ke%$ques%\'scation&"hd\'#ed\'',
+    ')#/to("r\')#(s)))-at-large*.cum-bookseller*,photographer)\'/author*\'printer\'-ing&mdash;all2!n*&-house+(printing+&to-oil.(property.)tableware',
+    '++information\'#pac&"ly%&zieren$"rs$$shed#/s-for-breweries"\'c-based##118$%9&ogr#"4k%!n#!a$"ra#"ca',
+    '$1ini-domingo/rudel#*e-coloured#$hacz%$sers\'!s%"zc$&berger(!s$#ero$$itis$#rrt#$iato$!k$"ll#%k-ish',
+    '$,le/assistant&\'berries$#rik$!y#$ture#%usana"%ddang$(in\'-race&$g(w)\'!-(%bowls(%faced\'!.\'$dale\'$less',
+    '\'!y$\'le-duck\'%wharf&$duck&!r\'!s&$wick$$ocks$%ydale#-enda-sculpted&\'otectus%!t%%ziana$"ur#$gier',
+    '#$hill#"ic%!a$#era$#ngs##ley$&leglum"!e##ble#"de%!s##hpd#&rilely&#ity%$sque',
+    '%\'o-rican&.rique&ntilde;o",ff&rehy;puff$)-and-blow%%balls%%jawed%$puff)"ed%"up$,a-puffa-rice&*waistcoats%!s$\'ed-wood%&r-fish&!y',
+    '((resident$#ily%#ngs$$kins$#out$&y-eyed&&lipped"\'g-faced$$like%%oving#&achova$!n##ens$&t-mahe#%garee',
+    '$#led$!y#(h/mother%*samaritans$!e$"pd#$lian%%stica##man$"en#"na%-cious-looking\'"um$!i$$orum',
+    '$%tyles"!h#%ar(f)#!t$#met"&i-wing#"ca#\'gcerver$$jane#"hu#"ng#$s-je$#que#)tsikkakaa"$jari',
+    '#!o""ka$%pukan$!r##hov##kah#!o##raj#!y"%l-owt#!.#%acayo$!o$#ski#"bo',
+    '#&chella("us&#ria\'$rima%"ra&!i\'$tude#!e$"rs#+ford/farmer#*geogioides$$rum.$%uk-sa#$heim\')-stommeln',
+    '$*oll-royall$!s$#ter%)zer-prize(!s$!v#*ka-pulling$&ingham$!s#)l-ability&#way%%backs%%chain%\'forward&#ree',
+    '\'!s%\'keri-ma%$line%%me-up%#pot%$ring%%shift\'"ot%(together%#you(*r-belts-in$%/push$%_each$$cord$!e',
+    '\'"in\'"on\'(together%!e%#ine%\'n/royal&!s%&r-down%*y-assisted\'&blocks&!n$#iam%+en-thompson%(n/stroud&-g-and-sailing',
+    '(*no-punches(#off("up\'!.\')er/dragon\'!s%$tzer$"ng$/on/conservative%)ver-style(!.$\'winding#2monary-vessel-wall&"ic#"ne',
+    '$*-and-paper%(magazine&#ill%)publisher%\'stories$!.$!a%#ble$%board$#ers$+it-building\'$desk\'\'lectern\'*theatrical&$eers',
+    '$$wood##que#"s.$#afe%$tile\'\'ng-cusp$*e-chargers+#ing&$echo&%feeds\'$ield($lled&*generating&)hammering&#jet',
+    '\'$ight("ke&)modulated&(pounding\'(roducing\')ummelling&*quickening&*repetition&+stimulating&&taking,!.%!.&&shaped%%/wave%%rates',
+    '$\'ilogium%#ngs%"on##ton$&ruders#%verem&\'ization$*illus-like%"no%#rus##zer"!m#(a-kumbha%$like$(/postman',
+    '$#ces\'$tone$#lio%"um&!s#*mel-vision&!o$!y#$p(s)$)-assisted&(ttendant%\'handles%$leak%)mechanism%#oil',
+    '%\'primers*!s\'#obe&5ulse&rehy;probe-pulse%(returned&#oom%$sets&&torage%%water&$ells$&/mixer$$boat$%clips$&ed-out%\'rnickle',
+    '$\'h-pumph%%andle$+ing/winding\'#pop$)kin-faced((indented($like($seed$%maker&!n$$okol$"s."\'nakaiki$&mchand#+ch-and-judy',
+    '*!s&$card*!s&$like(#nes&%paper&$type&#up.%%/save%%bowls%)drunkness%(ed-cards(%metal(#out($tape',
+    '&%nello%$less%%marks$!t%#ate\'"um(!s%!o%+uationalist+$ists&$lata)"us&(re-proof)\'warning#"en',
+    '%"rs%#vie$,ent-smelling)$weet%"re%!t$"or$&tungia$!u#"ia$!d$#est$&shers-&.ment&ndash;hey*!\'',
+    '$,tive-damages%"or%!y#+jab-related&!.&&i-born#*k-inspired%(neutrons%%style$\'/grunge%&kabuki$"as$%ed-up$#ier%(n\'-sarse',
+    '$#oid$*shooayshun%$ters$!t%\'abulous%%itude##ned$&ishing#,ou-ki-hihifo#*saalmagiyn#\'talette%,r&eacute;nas$!e%&r-free)&iendly',
+    '#!x#\'y-armed%\'looking"4olue-ydenn&auml;isys""p\'#!.#%arium$#ted&!s#$ford#$hood##ies$$l(s)%!-&%based',
+    '\'%riven&\'elected\'%vents\'*xpectation&(friendly&)initiated&$less&\'managed(%sters&(operated&\'product)&filing&(teaching&&writer%).guidance',
+    '&\'patient\'#eer&%staff(%udent%#ess%%lages\'"re(!i&#ess%-s&mdash;could-!i-"my&\'ilities$#tre##ker',
+    '#$lett#%orted#*pentheater%)t-jointed\'$king\'&making\'%thing&&eering&#ing&&master&)s-usually$#ing$)y-farming&$like&\'walkers',
+    '%#dog%#fat%%ishly($ness%$like%!s#!u$"ke##wgs$"rf#!y"*r&eacute;s#!-$!3$!4',
+    '#)beck-isle$%right#$caru$)ell-jones\'#ian*!s$!h%-ase&mdash;for/%never)*rehy;money(!\'(&-money(&/goods)$home)&marine',
+    '+$ntal+%serve)(supplier(\'_and_so($able("d-)!.(0r&ndash;provider)!\'*(s/lender+*assessment))/provided*&vendor)"s.(+s&mdash;can',
+    '\'#in\')*g-officers**/providing#,dah-confined%!y$#ies$"um$&ysburn#&e-beef&&looded&$reds(#eds%)intellect%*mindedness%&voiced',
+    '&#ool$%bdorj$#flo$0ly-environmental$!n%/ch&eacute;cuaro%#ess$!s%%sence*"rs$%vdorj$&y-cust#%field$%lings#(gatively',
+    '$!o#%iance$/fica&ccedil;ion$#lan$&machos$!n$,tan-inclined\'!i("an\'!o%!e%#ies%"ry%&y-this&+/immorality',
+    '$"is#&ldrops$"ed%!r%$ymen$$oins$!s%#ide#+nell/milton%"ys$(im&amacr$%ululu#%olite$$oses#!p',
+    '\'&banded(\'lazered)#ues(%ronze\'+embroidered\'%faced\'&haired\'$pink+!s\'$rich\'%satin(&carlet(\'hadowed((prouting(&triped',
+    '\'0wax-in-clear-oil\'&yellow&)/jade/red\')pink/gold&$ness&"st&&y-blue%)ish-brown)$pink%(y-bluish\'$grey$$orse&$tive%!s&+e&rehy;made',
+    '((governed((oriented("so)\'pecific(\'written\'&.built\'(designed\'+ful-looking\'#see&0ive-instrumental$%ura-a\'#tus#&r-fect$!a$$fect',
+    '\'!s#!s$)e-holding&\'keepers&\'mouthed+!s&&netted&\'pinched&&seines\'\'natcher\'%tring%!5%$d-up%#ful(!s',
+    '%\'strings$%glove$!u%$able&$ding&!l%#ed.%%it(s)\'&-scene\'#_of#-ton/wiltshire$%scher#"un$!s%!e',
+    '$$vate#$vine%/s&ndash;barrett&\'/master$%oyeur#$ygin"*s-formerly$$hued$$like$&oozing$\'stained&&inking#!a#"ca$%hener',
+    '#.d&mdash;polish#+ey/citizens%#ite%!s#$foot#-h&rehy;action$(\'n\'shove$!-%(and-pull)#run)%shove%&biking&%right&0utton/electronic\'$zzer',
+    '%%lever%"me\')-pull-you%"on%%punch%%start\'#ick%\'through&&o-make$!.$%along$#bar%$ikes$"ch&,air/carrycot',
+    '%%ragon$%erman&$s-in$#fit\'#ted$$iest%/ng-indie-limits\'(/holding\'!s$%karev&!s%,in-leningrad$#man$#pit$$rods',
+    '$"ti%!o&!s%!u$,y-aggression%!.#$iano$+llanimously$"na#"ka#*s-in-boots%$puss$"es$$moth$(y-catted',
+    '%\'bumping%&footed%&mobile%\'willows#$taka$!e%#tto$"yn##uit#$ztas""t\'$"10#%-call$(downable$$ring',
+    '#"58#!a$#ble$#ins$"ne#%chers#"eh$#oli$"ra#$hers$&parker##ida$$loff&!v$"na',
+    '#*nam/jaguar&!s$"oe##red%\'faciens(%tions&#ied&!y%%scine#&schist)!s$#man#%t-off$!a$"ee',
+    '\'#off&#man\'&essers%"st$#ick%"ed&!s%\'ng-away($down("in($out\'$"oc&!k$/rell&rehy;style$(y-oyster',
+    '#!z$!i%!e%!g")y-calvary$$like#!e#\'guilhem#!s$$egur$&seleyr"&zynski#$zle\'&\'-motets\'*orientated',
+    '\'&player&%ment.*!s&%quest&"s.%"ie\'!s$$uoli!*v-wave:nag""18"&=100-%""ba")c-checked%&lothed$(sheathed',
+    '"!i"$md14"$r200"(ui-bamhi"/v&mdash;freedom#$/plp!\'w-1080a"%1080a"$3020"&alters#"nk"%botha"!c"!e#$eese',
+    '#%thent""it"&llbach$%helli$(ycrochan"%ooooh""r+#*-generated"$s/as$#oca"$urgh!#x-4"#/xt""4s"#ana',
+    '"#gh5"!i!&yac-rc$#rc5#$emia#"nj$!t"%buses"%chard#!k#\'nogenol&$onid%)phylactic#$ombe"(e-unicam',
+    '#%grave#\'logenic&%raphy%-nephritogenic#!r$!s#"tt#$wipe"+f-polyester"!g#)-motorway#*malionitis##ope#$urus".h&auml;tunturi',
+    '#$rric"(idaungsu%$wtha##thu")jama-game\'\'striped\'#top&$s-on\'!."&kering$"tt#"ie"#lai#"es#(grimages',
+    '#\'on-burn$!r%)oduodenal&\'myotomy")m/liberal#"er#!m$"es"!n#!t"&ocanea$\'yanases\'#eus#%derma#%genes',
+    '#"ng%$gang$$yang#%rrhea&#oea#!t$"ts"$pard#"in#!u"!r#>&eacute;n&eacute;es-atlantique#(acanthas)"us$#lis',
+    '%)id-cities()developed(#icl($like(\'selling($type\'$ally\'"ed(!s\'$ical\'%s-had($/the$\'nosides%#tel$#tes',
+    '\'!e#7en&eacute;es-orientales%$aeus%"ee\'"an\'#ist*!s%$nean\'!s%(omycetes$%theum&)rum-based%"ic$$xial\'!s',
+    '#!g$"oi#&idines%$oxal),-5-phosphate$.midinepyrazine$-te-pyrrhotite%%hione%$ised#%lysis#+o-phosphate$)carbonate$+g&egrave;ne%#ens%$raph',
+    '%$ysed(!r$"ma&%niacs(!c%$eter)!s$#pes%%horic&&yllite$(sulphite$*technician$&xenite%#ine$$zine',
+    '%$alta%!o&%coris&&thorax$$oles&&nitrin#!s#"um#!y"*schiatrist%*ologically)!y#$ford"&talovo#$ches',
+    '("us%!n$#eos$$ians%"os$+on-infested&#ish\'#tes#$tyll"%ulori"&xidata%"es%%icula""y.#%/tube',
+    '"*ipneosv(x)"!l#*&ndash;101"#o92"!s \'q&amp;r&!s"$lsqb"\'ndash;a(!r"(plusmn;a"-times;h7&plus!$\'bit!#(s)!!+',
+    '!$-100"\'banding##oat#(us-based"$code"#kt7%"ch"(magazine$!x"&notice"\'quarrel$#iet")sepharose#$ound##tol',
+    '#"ee$!x#$rain#$wist"$wave!).1.d.n.s.##200"!2#!9"!4"!5"!6"!7"!8"!9',
+    '"$e.d."$p.b.&"c."#ts."!u#!.$#i.t"#why!"/t!*1&mdash;q4#*ndash;1989""05#!7"!2"!3',
+    '"!7"!8"!a!"20#"31"!1"!2#".3"!4"!5"!6"!8#"4a"!9"$=-q1',
+    '"!0#!0"!1"!2"!3"+4-formation#)/mannosyl\'#q34#)insertase!,4&ndash;1987!#530!06&mdash;appendix"&-sized""07"$6.9.',
+    '"!0!#873!#94r!&=220.5""ap"&q1=-q2!"_l!$a/qc""3+"&balism#%rikha"!c#+-bisguanide"%daffi$!m',
+    '##esh##ian$$siya#!r$!i"#ing##ser"$laat$!t$"un#!i$"ty"%mford"!n#%dhari',
+    '#%janfu##nai##sou#$tara"!p#\'ack.fil"!r#&antina##esi#(topholos##yal"%semlu#$hqai#!i#%rawet',
+    '"$tami"%waali$#sim#!i#(orkspace"$ybeh#\'yumabad"$zvin#$wnin!"b7"(asic.exe\'#hlp\'#ini&$:the"!o',
+    '#&howard""2+"!5"!6#!+""7+"!8"$ic-w!"d2""3+"!4""6+""8+"\'wfdvioy!#e11',
+    '"!5""dn"!f""gs"-k-qek-qek-qek""lt"#nah#"mo"!s"%tchua!"fi#!s"!s""t1#!2',
+    '"!1"!2"D4&verbar&verbar;bb7&verbar&verbar;14"!i!"h7"!8!&i-chao"%660ti"$agen##nli"!c##-40$"80##hao"$feng',
+    '""gc"!k"$meng"$n-he#!a#&ghaosu#$tall$"ex"!t#"at#!e"&vering!!j!#kly!(l/es/ss/',
+    '""lc"!y!&macmac"!f"!i#"ps"!p!!n"$57.1"!g!%oboza"#ted""ub!#p20""o.',
+    '#*/newc/norw#\'o01.tif%%2.tif%%3.tif%%4.tif%%5.tif%%6.tif%%7.tif%%8.tif""sx!"q5"\'chinese"*facilities"\'radlord"%uasar',
+    '!\'r11,700"%4,900"%7,800!/s16&ndash;000vi"#ars"!f""ls"$ound""pr"$tart"#ubd!#tac"!g""hr"$xldg',
+    '"!\'#%&auml#.allum&eacute;s$&ppelle##une"*-quallofil"&a\'fing#(-quer-go$#stu#+/2779024/h9#-alude-fuelled$$vian#+c-quac-quac$$kage%"er',
+    '%\'y-ducks#%d-cam%%grams%!x$$affi%#gno%!m$#cam$$ding$!e%!r&"ia$$flex&#ieg$$gram',
+    '$(ra-based&#cci)\'.peters&&gesimo\'"no&(laterals&!m&(ngularis\'\'tanopia("id&,phonic-style,!s&$thon\'&ically\'&ojugal',
+    '%\'i-axial&&cornis\'$ycle&$foil(#lia\'$rons&%glume&#lat)%eral.\'$lage(#ion\'$ogue&%plane($egia+"cs',
+    '&(radiatus&&valent,!s%\'ogesimo&"on&&pehnia%"um&\'ple-axe*&glazed**neugebauer(!y\'$oles#&eritur$%sumus#$ffer',
+    '#!g$$gers$%liati&"no#"hr#)id-e-asam$)l-hunters&$like&$song%!e$*nt-looking&(ly-named#(ker-grey\'%plain\'#run',
+    '&"ly&$wake$+ily-written$"ke$"yi##lao%#wan$)cos\'altro%#uno$0i&rehy;fications%#fat&%iable(&ctions\')cation(s)-)-oriented',
+    '52/non-qualification-"s*.+/background\'+ed-majority*\'teacher),/experienced\'"ng&*y&mdash;he\'!.\'!d%$nost%$tair\'$ting)\'ve-type+-/quantitative',
+    '(#ors&"ec&\'ies-the)!.)0/flexibility/get)":2\'&tative\'"ve)"ly&-y&ndash;based\'!\'\'\'-assure(%built(\'checked)%ircle',
+    '*%sting(&driven()enhancing(&minded(\'tabloid\'*/condition()expensive($kind(%price**oductivity(%value\'"in\'$trak$!o$#que',
+    '#$mdiu#%nabie$#dom%$rant$&garoos%)o-hunting\'$type&$land$%ities$"ko$*t/biba/bus&#nmr%(e/german%!i&&cation',
+    '(#ed.\'"y.&\'sations\'"es&(t&eacute\'7ative&mdash;qualitative,+-mindedness,,/qualitative,(ly-based\'#ech\'"ie(&tative($vely\'*y-addicted((/quality',
+    '%!o&!m\'$ania%*um-jumping($well##paw#%rafon%&n-tiny&#ful&"ta\'!e\',ine/hospital+)treatment%%ribea$%elled',
+    '%#sma$(k-xpress%&xpress$#les\'!s%!l$$myne$$ndon%#ero$&ralton%!e&*l&mdash;at\'*-by-letter\'!.\'!l',
+    '(#in\'%\'y-cliff\'$gulf\'&source\'\'workers+#ing&,man-prisoner($ster$$shie$\'t-sized%!a&"ns%$eira&.r&rehy;century-$mile',
+    ')%stern(%backs)$erth)%ottle)$reed))y-quarter(%eaten)$mpty)"nd($full(*gastronorm(&horses*$urly),undredweight(%iotum',
+    ')&eather)%ights*#tre($mark*$ster.#ing)(egahertz)-illion-dollar0\'selling*$nute)#oon(%noble(,of-a-century-%dozen-\'million',
+    '.$inch()past-five-%three)#eal)"hi)%oints)&rofile(%scale)%moked)$taff-!s+"ve("to*\'-eleven+$five',
+    '+#two*!n+!e+#ner)%ruths($wave($year\'$.its\'$beck(#red\'%decks\')finalists\'$lies)$ghts\'%mains',
+    '\'%pipes\'.s-symbolically($taff&\'t-delme(%suite\'"ly\'"s.(#atz\'%tsatz%$iere%&o-size&#rse%!r%"us%@z&rehy;fluorite-calcite-sulphide',
+    '&)-antimony/-&rehy;arsenic(+rsenopyrite\'\'bearing\')carbonate))ssiterite(,rystal-based\'(feldspar/%-mica0$rock\'$like\'(porphyry\'$rich\'%sharp((tockwork',
+    '\'3tourmaline-sulphide\'%veins\'(windowed&!y#$shie$/i&rehy;official++partnership,+ornographic,)roverbial+,relationship+*scientific%+\'-knowledge%)-absolute\'\'cademic.!s',
+    '(&optive\'(esthetic\'*llegorical\'(morphous\'.nthropological\'(postolic\'\'rbitral-$tion(+chitectural((ithmetic\'(uthentic*%orial)&omatic/$ally&(balanced',
+    '()njaminian\'*imolecular(*ographical\'$lack)(nk-verse\'&ritish&\'cabinet(#irn(\'nonical((pitalist)$tive\'+elebrations\'\'hemical\'\'ircular(#vil',
+    '((mmercial)(petitive((nceptual)&sensus**piratorial)\'tinents*%racts()rporation/"st\'*rystalline\'\'urrency(\'stomers\'\'yclical&)democracy\'\'ialogue',
+    '($vine\'\'ocument.#ary(&mestic\'%uties\'\'ynastic&)easements\'*ducational\'&lected\'*mphyteutic\',nvironmental\'(piscopal)\'thelium\'\'quities\'%rotic',
+    '\')xceptions(\'ecutive(*perimental&\'fascist\',ictionalised\'&reedom\',unctionalist&$gang\'&eneral()ometrical\'%roups&%harem\')istorical\')omophonic\'$uman',
+    '&(imperial.#ism\'+ntellectual*$rnal&,journalistic\')udicially&)legendary)(islation*&timate\'%inear((tigation&\'magical("le(&ternal))hematical',
+    '-$stic(&dieval\'-ilitary-order()nisterial)%ority\'(odernist((nopolies(&urning\'&usical&)narrative()tionalism/&zation)$ural\')eutrality\'$ovel',
+    '(\'jective,!s(\'session\')rchestral(%ganic&)paralytic)*liamentary)(tnership1!s\'(ermanent)%sonal\'-hilanthropism\'%olice(!p)$ular',
+    '((ebendary)&ludial(&iestly)$vate((ofession0"al)%perty\'*sychedelic1!s+(ological&.qualifications&%rasta\'%ecord(*ductionism1!t',
+    ')\'utation(\'lations(,presentative)\'ublican((tirement(+volutionary\'*itualistic\'$oyal\'!p\'&uckers&%saint("le(%murai(&rdonic\'+ecessionist',
+    '(%nsual\'%imile($ngle(*tuationist2!s\'%olids\'%plits\'%table\'*upervisory\'*yndicalist)*tactically&#tax\')heatrical)(oretical*(sophical',
+    '(#xic\'&riadic&+unification+"ed*#orm-"ly)\'versity&&vassal\'\'enetian\'(ictorian&)wagnerian\'&hisper\'&illiam%*autonomous%\'elastic',
+    '%(judicial%$noso%+pantheistic%&simile$#sia#!t$!a$"bi$%emary&#ber%%rnass\'#ion(&sation$"ra%&efages',
+    '&!s%+ocentennial%"ro$#sch$$tara%%rochi#)ver-beats&#=84&#y-y#\'wawwart#+yle-hunting&&/edith$$tman"#bba"&dratic',
+    '$!i"$eant$)sy-bright$$tion#-b&eacute;cois$1ec&ndash;montreal&%quois&!s%%quois$"ra&"da##cho%+ua-speakers#7demos/qued&aacute;ramos$0geley/gloucester',
+    '%$reek$!c$#eep%&nsland\'*r&yuml;che$!g$!k$!l$,n-anne-style&&budget&%hithe&*in-council&\'regnant&$side(#zed',
+    '&%to-be%!.%"/a&#she%"ed%$ford%&iegate\'!s&#ous%$less%%maker%%sbank&+ferry-based&$hill&#ize',
+    '&$mere&.ryche/lynchmob&%towne&$wood%\'zieburn$!p$)r-looking%&bashed*"rs)#in\'%"ed%$ness$"zy#&imadas$"ra',
+    '$#ene$#gos$,lenschriften%"yn$(qu\'chose$#yia##nby$$ches&$less$$elle%!s$#ild%%ngton$$nels$!s',
+    '%"al%"en%%ified&"n\'\')-bauchart#&ratato%#ult$%cetin%\'ifolium$#ent$!i%#das&!o$"ne%$more',
+    '$!o$\'schnitt$)ulousness$$vain$\'y-based$(zani/raf%#oni#"s1$$cent%#hun$%ition&$oned$!s$+t-adventure&\'novella',
+    '&%plots&%story%$aire%"in&.on&lsqb;s&rsqb),mdash;answer/"or)(rehy;how(#(4)(+-and-listen*%sking))framework+"ee)&posing*(rovoking',
+    ')&setter)$time-!s*#ype(%.just)#the(!/)\'problem))statement*&ubject(!5(%aires($edme)!y(!i',
+    '(%marks*$ster.!s(*naire-type-#s.3)"ed("s-*%style)$.pc.)!/*\'answers*\'queries*(specific*(writing/)%etter',
+    '%&yioned#%tions$\'zacoatl&#les\'!s#!u$)e-control&$free%%d-for$#ine$%osine#$vado$#edo"$hame"-i&ntilde;onez',
+    '#&anlong#*bbling-its$"us#!c$&-ic-ic$,k&rehy;draws+\'editing+\'growing%!-&&access&&bitten\'#low\'&rained&\'changes\'%ooked',
+    '&(decision\'#raw*#ing&$fill($sted\'#ood)#ted,$ness(!x\'%rozen&(glancing\'#rip&\'healing&$lime\'&oading',
+    '&\'marched\'%inded,$ness&-on-the-uptake&$pass&*retracting&$scan\'&erving(!t\'$harp(&ifting\'#tep*$ping*!s("op',
+    '\'*o-assemble)%learn)#use&(wittedly%#.to%*/rapid/jet%%basic%"c*%&enings&(r-moving((tempered&*st-gobbled%&finder%\'growing%&lettes',
+    '&%y-and((changing(&drying($made)%oving()processed(\'seeding(%taken\').initally\'#/at(%quite($when%$menu&#ore%&pascal',
+    '%)sand-like&#kim)$ming&$nack&!o&$peak&\'tepping)!s\'$icks&$wood%$talk&$horn&.ime-compatible%$ways#)d\'s-worth',
+    '$\'_on_top$$ding$"em$$ging$"he$&i-vidi%$ties$$s-in%%worth$!t#$eren$,scent/active\'"re$*t-coloured&"it',
+    '\'&ooking&(mannered\'%oving%(est-ever%$ists&#ves%.ly&rehy;spoken\'!.%,ness/feeling)!e%!o&!s%\'printer%%water&%riter',
+    '#&fictis#$ggin$*ley/family(*manageress$#non#\'lengues%#ute$#ici$%l-end&(feathers&$like&$pens&\'written%"an%"ed',
+    '&#gan&#nan%$work(!t$"pe$"t\'%\'-makers#&m-lips$&bourne$$icas$+perl&eacute*%grave$#son#"na%"ig',
+    '$$cey\'%)unx-panel$$dlen$"es$$ghao$#ion$$keys$$land$\'n-style%\'/flying&)probation%!s$+o&ntilde;ez%"id%%linic',
+    '+%dione$)quagesima&(ennially\'$reme$+sac-plessan%\'pirites$+t&aacute;ns%#ain(!s&!n\'$illa&%valle%"es&!x%!i',
+    '&#les\'$lana(#ion&!s&"um%#ols&&n-zorn%&simple%&upling%"yn#?ppe-quare-quale-quia-quidditive$%sters#\'quillon#!r$#ang',
+    '$#ici%#gua%!n&"di&!g&!o$%k-pen%#_et%"es%\'ishness$!m$&olgico%!z#&scalus$&igaard',
+    '$(t-arcton%$gard#"ta%!k$-e-downtrodden&,right-enough%+.reasonably%&_apart&%other%$rons%"st$$line$\'o-based$#sch$"te',
+    '\'!s#%uckly#+ver-tipping&"er&)ing-nosed)"ly&#tip)!s$!i$"ox#&wonkpa##xis$(ote-like\'\'_pas_de\'!s',
+    '##yas#(z-master%&setter$&/disco$$book$/zically-smiling"$jite"!k"&lacomm#!e#\'iafiers"*mran-style"&ngshan#%itext"\'oc-quan',
+    '##ist#!n$#set#$odle$"ms#"ra$$ndon%!s$(um/apple#(ta-based&&driven&\'hopping&$list&*registered%(sampling',
+    ')!.)"s.$\'e-crazy%!.%!m&%aster&&eister%!r$\'idianus%-ent&formula;.&!s$#ron#!w"%r\'ans#$aish',
+    '##ban#*eshi/asian##nah##usu"#sed"$wait$#tli$&ysimah"#ynh#"te!"vc"$dhgk"!i"!r"#t82',
+    '#!a#!k";bdhjkplmcbsxazidzkleghlcvve"#est"$iche#!k""ol!!x""a2""d4""e3#!4#"5+#E6&verbar&verbar;nxe6&verbar&verbar;25#!7',
+    '!#y10 /r&aacute;-ko-si)#fti)#mon)"no)"ul#)circ;gout#&elig;d#1macr;m&amacr;nuja$#p:d%&;b/rap&"d/(*production()strategic&!f',
+    '&!r&!s&%venue&!w#,ring;d&aring)!a(#nby#\'uml;der\'*terepublik(#zer"(bsol;emi"$darr#\'ivide;2"-eacute;alisme)\'bellion',
+    ')$cent*&herche*)it-emploi,;atif-&lsqb;r&eacute;citatif14air-r&eacute;citatif1,mesur&eacute*$lame*\'oltants+*nstruction)\'duction+%isant)\'flexion*)ormateurs-"es*,ugi&eacute;s',
+    '*"ie+"na+$onal+!s*(lisserie*-uli&egrave;re-#ers,!o)%jouir),lev&eacute;s)"mi+(niscence*(y-martin))novateurs)\'patrice',
+    '*#ons-!e)"s.*#eau+)rv&eacute-%ation*6ident-sup&eacute;rieur*%ultat+\'m&acute-)eacute;of4!s+(rrection)"to*\'roactif,&grades',
+    '*(nionnais,!t)-v&eacute;rene,*grave;lent*!e+"il+(nescente*\'oltades,#ver#)circ;vent*#rie*!s#"gr%#;nt%\'ave;cit',
+    '*$lant+!e*"ne"\'gt;0.45(!8%!a%!d"3lsqb;esistance&rsqb##t;a%(t250,000";ndash;1340&ndash;an&ndash;1+!s(!2(#985($rair',
+    '")oacute;le#(circ;der(#les#-slash;dbroget#%uml;d\'#les\'#mer*$berg\'$nsch($tgen\'$rsch\'$ssle+!r"\'prime;l"3rehy;1830&ndash;92s',
+    ')!7*%&plus"*uacute;ben)"iz#0uml;ckert-lieder).sichglosigkeit),versicherung\'(dersdorf($iger\'#hle(!r\'&lander\'%ppell,"ii\'#sch',
+    '!"\'\'"!c"#mel""n\'#"cs"!w""z\'!#()m",1064)=-0.118+#564(%0.142*#201+"36+"46+"78',
+    '#)603)=0.07"*20)=-0.053&$0.39("43#(1)=-0.11&$0.39(#612#(2)=-0.04*!6)"13)"42&$0.16*!6(#211)"65',
+    '("71*!1#)3)=-0.414&%0.414*!8(#620")34)=-0.24#(8)=0.310(#517(#690(#722)"91"\'4)=0.86#\'6)=0.03)!6',
+    '("12)!4)!6)!8("23)!7("40)!3)!4("65(#742)!5#\'8)=0.13")58)=-0.20*!3',
+    ')"32&$0.03)!5)!6)!7("13)!4)!6)!7("25("39("43("58")8)=-0.047("21',
+    '""a)"#es)"*phi)=0.022"&s)1187$$4182#&b)5/81"&u)2/60""x)#%1-y1)""y)!"+1!",s!$-101##200##340',
+    '""22#!4#$800s""30""40#+360-powered""50""6h"%7a50m"(8h50(b)t"#985"%and-d##xis"&banded"\'complex',
+    '#\'etector"#ful"!g""ii#\'nterval*!s"%o-l-l"%plate#*ronouncing""r\'#!*#%-rien%#uup#*/turbomeca#(30/r-r15',
+    '##max&\'-r-rmin&\'/r-rmin$"in#$oomf"(selected#%haped#"q%""to"-u-a-r-a-i-d-h#!w$"af!(.&amp;r.""-a#"h.',
+    '#!0$!0#!3#$6(1)%"2)$+05&ndash;27$+28&ndash;58#!8#!9""22#!3#$4(1)"$5(2)$"6)$"7)',
+    '"!6""79"!8"!9"*a.d.&mdash&"a.$!f$*i.n.b.o.w.$\'leyland"$b.a.$"d.$"j.$$s.t."$c.g.$"j.',
+    '&"v.$"s.#\'ampbell$#rin#\'onquest"!d##.b.$!c$"f.$!m$!s$"w."!f#(.hickman$!i',
+    '"(g.willis#$wynn"$h.jr$"l."(i.l.k.o."$j.w.$"y."%l.-b.$\'gardner$"h.$!p%#.o.$"s."&m.c.s.$%speed',
+    '&"d.$$i.b.$#l.i\'!.$"m."$o.i.$!w")p.houston$"i."&roeder"&s.n.c.#\'hepherd#(kidelsky"!t##.a.',
+    '$"u.""u.$"c.$"r."!v"$w.a.$"v."$y.a.!#/2p#"tn"*4000-based")greenberg""hi""ir"!l',
+    '"!o"!v!)000231220"\'1/31/93"!7!)1&ndash;3"#(4)"$,000#\'500,000$&96,000"#-r3"*.00=f27.50#$5(4)$!.##92m',
+    '$"2)$"3)#$,070#%0,000#+3&ndash;105#!6#!8#!a#!b"*1&ndash;13##(4)$"7)#$,600#$6-17"-2(1a&mdash;c)',
+    '&#-c)$"2)$"7)$"a)#$,500#"47#+70&ndash;01#!a"+3&ndash;r18##(4)#(,156,289#!2$!m#+4&ndash;135#!7',
+    '#$(11)$"2)$"3)#%-size##/24#+0&ndash;143#+1&ndash;143#!4#!9#!s"$5(3)$"4)#!0$$,000#!3',
+    '"*6&ndash;18##(1)$"5)$"7)##.7m#!0#!2"$7(1)$"2)$"3)#)0,000,000"!8#)&ndash;20##(3)#!5',
+    '")9,000,000"#=r3!)2&ndash;6"$,500$"80##700"#-d2#(labelled#"r5"".0#%59(2)##62m"#/3.$"/4"*00,000,000',
+    '%&-based#"8m#!s#!x"*1&ndash;24##(1)$"2)$"3)$"4)#)0,000,000"$2(1)$"2)"*33,800.000#!5"!4',
+    '".5&mdash;namely$(ndash;29#*-replacing#)0,000,000#!7##dvt"!7"*8&ndash;30#-00-engineered#!5""90"!a#$(10)$(4)&mdash#!r',
+    '""y2!$3(2)#"5)"#+r5"$,000$"82#%20,21##750"!.##18m#"26""/4$"/5")0,000,000#*00-derived',
+    '$"2a&!s#-10-compatible#"81"!3"\'42a4b15&"c3"!6"!8#(,500,000#)0,000,000"#d-1!)4&ndash;8"#(1)#"3)',
+    '#"7)#"8)""+5"(,000,000##600")-labelled"$.03m#%10(1)&"2)$!1%#(3)$!2%#(1)$$4(2)&"9)',
+    '$$6(1)&"5)&"7)$$7(1)&"2)&"3)$$8(3)#%21(2)&"3)$!6$"7m#!3$#(1)%"2)#$4(1)',
+    '%"4)%"7)%"8)#$5(1)#!6$#(4)##77m#$8(1)"*000-killer%"mc&\'p-based%(sc-based$"mp#!8#!e',
+    '"#1.2"#3.6"$400s#!s")5,000,000"!a"#d-5"#x00!)5&ndash;7"#(1)"(,596,000"#/27#"r6"*0&ndash;52"!5',
+    '"!7"*9&ndash;62!)6&ndash;8"#(6)#"9)#"a)"$.05m#&117(4)$%50(2)%%1(3a)$%65(4)$%76(4)##213#%39(2)#"42',
+    '$$3(3)$!6#"61#%79(4)""00$\'0-based""11""80#"58"*90,000,000#!1"!a!*7&ndash;10)!9"(,000,000',
+    '"%3,900"!5""64"*8&ndash;80"&fr6olb"!m!*8&ndash;13"#(5)"$,000&$,000##100##900"$.08m""08""14',
+    '"!3"04,88,94&ndash;96"%5,000"*65,100,000!%9,000##500##900""31$"\'s"#46m"$5(d)#!6"$7.7m""85$!4',
+    '!&=-0.08%#215&"71%!3&"23&!4%"43&!4&"50&!9%"51&!2&!3%"60%"75',
+    '%#876%"98#$9.47"$0.02%!5%"67%!7%!8$"10%!2%!6%!8$"20%"18$"32',
+    '%!9&!8$!4%!2%!6$#512%!2&!3%!8$!6%!1%!2%!3%!5%!6',
+    '%!2%"36%!5$"80%"28%"77%!8%!9$#944%"57%"61&!5%"87&!9"#3.8',
+    '$#via$%wants!-a&formula;dly#,uacute&aelig"!-##mah$$oses##rah$(egulated"%/90/1#"rs""10#!b"!2##000',
+    '"#abe#"ch#$mses#!s#!t"$baan$"ka$!l$#nal%#eda%!i$\'ssaires$"th%"ou#$bara',
+    '$$eter$&inates&$ette&#ism%"sm%.t&rehy;warrens&\'-bitten($ones\'$chop\'$eyed\'&grazed\'\'hunting)#tch,"es\',in-headlight',
+    '\'&killer+#ing\'&legged\'-of-the-leaves.&stream.$wind(+ut-of-a-hat\'*population\'&rabbit("un\'(shooting($tyle\'%track\')warrening&!.',
+    '&"ed\'"rs&$fish&%proof&&s-foot("in\'!.&!t$*le-rousers$$ucks#"el$)mananjara$$noro$"sa&$hala',
+    '#(i-kounga$#ers%*s-infected$"gh$"ha$"n\'%#ach%#der&"ra%"er%%ovich%!s$!o$"ta&!h',
+    '#$john#$kory#"le##man#%ochiy&!y$!l$"ni$&tnitza&"ov$"ut#"ro#&selkor##uau""c-',
+    '#"73#*al-datacom$!n%$teur#\'ch-paul$+omandazione%*on-hunting#-e&rehy;course*%horse/!s*&tracks$)\'-related&(specific$!-%&biased',
+    '%#car("ds\'$used&&ircuit&(onscious%#day%#fit&#ree%$goer%$hate%&leader&#ong%\'meeting&%inded\'$xing',
+    '%#off%*polymerase&)sychology%$ride%$suit%$team&\'hinking&+rack-shaped%\'warrior&%inner$$.the$"/1%%creed%)ethnicity%&record',
+    '$$boat$$days$%guard$$line(!s$%mares&#tes$%plain$*r/lockheed%$vine$%s.the$#tte$%world#)hael-rose%!n',
+    '%"ed%,l&rehy;comes&#iae&!l%!r%\'ting-up%%wiltz$$fuss$!h$!i%!s%#tic$%ma\'an&(ninovian("te',
+    '&!t%"il$&obites%!w#+ial-justice\'#law\'*preference\'+sensitivity&\'/ethnic\')religious&\'isation(&t-type)!s\'#zes(#ing',
+    ')&loaded)*structured$&borski$#cot$#est$#nes%\'g-camel)!r(\'hariots\'&engine\'$page)#per\'$tyre$#sm\'&7-as-false-consciousness',
+    '%&mounts%\'renting)!s$$case$&etball&!t$%field$)mountable$$oczy$$rent$%straw$$wick#$quin#$tech$$ical',
+    '"&d-ical#$/fem$!s#!8#\'a-speak$$elli$!l%!a$*r-blinding&*controlled&)dependent&\'imaging&\'ranging&)screening&(tracking',
+    '%(/contour&#nav&\'plotter%#sat$#une#&bertus$"od%$urne$$roke&"ok$*urn\'-style#!c$$iffe$$life\'#fes',
+    '#!d$#atz$$ings$"on$!y#&elescu%!l$%meyer%"on$"ns$!s%#chi$$tsky%$zsky$!v',
+    '#&fahrer$*ord/church((diocesan#"ha%&kishun#\'i-gauge%%meter$&active%)l-engined&#ity&+ly-directed))expanding%$nces\'!y&"s.',
+    '\'*/convector%"sa%,tion-checker*(detector*&filled**monitoring*(pressure*)sensitive+(hielding*(trapping)$less&)or-outlet)$type($s-by$$cal\'',
+    '(3d&eacute;mocratique(*ecological((feminist((inducing(#led((moderate(+nationalist)#ess(\'radical)%eform(1secular-socialist*%eming))ocialists\'!/()communist',
+    '+)servative(,left-leaning(\'marxist(+underground\'$chip\'!e\'$izes\'+ly-improved&"ns&"ta%#cio%)e-fossati%#hev%#ial&$cola',
+    '\'!s$#ers%\'sthesia%#use&!x$$guet$#nal$#o-3&!4&%alarm\')stronomer&\'biology&#cab(!r\'&ircuit',
+    '&)ecologist\')lectronic\'\'mitters&,geochemistry&$hplc&$lamp\'(istening&&medial($tric&*navigation&(operated&%pager\'%hones&&quasar&(recorded',
+    '&)sensitive("ts\'&ignals&&tagged\'1elecommunications*)switching\'&herapy\'&racked)(nsmitter\'#ype&*unfriendly&$wave%&/alarm&,chemotherapy\'*lock/alarm',
+    '&*navigation&%press&)telephone*&vision%#_so%&actifs)&ve-the&&ktiver&$tion%&bacter%\'chemist&"om("ms&\'yathids%)diagnosis',
+    '(&usoras,"es%(elements%)facsimile\'!x%7genic-isotope-o-isotope\'*ochemistry&&raphed+/r-cum-dispenser*#ing+!s%*immunassay**ologically&\'sotopic%$land',
+    '&1ogical-endoscopic*#ial)!e&*uminescent%$mail\'!n&)etrically+!s&*icrographs&)orphology%(nucleide%&opague%*protective%)resistant%)sensitive',
+    '\'#eak%*telemetric)%scopy)\'visione&&racked%&uclide$"sa%)h-crimson\'$size+!d%#ich%#son$"te%&herapy%#ion',
+    '\'$like#$javi#"ke$!o#)leys/pale#!m$#ilo##ner$*or/protest#(o&scaron$\'-opaque$#jka$\'lfzfell$!m%"es',
+    '\'!o$%n-222&)measuring&)potential&\'related%#ezh$)savljevic%#lav$#vic#"s.$$tone##top#&ucioiu$!e$#lfi',
+    '#%vanyi$#ils#0way/warwickshire&!s$#ell\'+/eyewitness#&zianko%"el%$will""e.#,/cumbernauld$\'support#!1#$dene#"es',
+    '$\'naeskol#\'l-brook$#een$#ian#"nt##tia#"ve"+f-decorated$%owned$%style#%/rafa%!n#!8#"al%\'imanana',
+    '%#nti%#rin$#een%"ll%,rty/artistic$*ia-encased\'$like%$shly$#le\'&\'-ticket&!.&&s-type\'$iana#"in%%esque',
+    '#"le#)nesiaceae#\'raichit#.ter-and-purlin&"ed&!y$$smen"*g&ocirc;ut$&uacute#"-2$%arsed$&clouds%&urlers$#day%$olls',
+    '$$outs$$pack%%egged$&rolled(#ing$/tag-and-bobtail\'#gle%#ime%"op$&winged%%orted#"an%%sberg$#tag$#zzo',
+    '#%dolls#(e-driven%&hungry%)tormented$#/or$#ful#(ga-gruff&\'hip-hop&#rap&3street-afro-swedish%$/rap%%house%#tip$!e%&-trade',
+    '\'%staff&&nition%"ts$&hianti$#ies%!o%"ty$*letagglers#)hunanadan(#dan#$imov$"n\'%"g.$&oniera#+lan-sleeved',
+    '&!s$"er$"in##man#,narok-spirit#*o&ucirc;ts$%ssnig$#uts$$zine#"s.$#_no#%time/$"op#%uenet$#rag',
+    '#$weed&!k"$hamn$!n#$eens$!l$"ny#"id$"la%"ly$"ma&!h%!i#*manfinance\'&oreign',
+    '$"in#!r#"tz#$unen##way"/i&ndash;bangkok##d-3&%-like%\'by-raid$"an%!s$!e$)ing-party$"s.##gne',
+    '#\'housing#\'jmakers$&putana#!k$%inish#.l&ndash;served$!-%(and-road%&bridge&$uffs\'&ilding\'-s-underground%\'centres&$oach&$ycle',
+    '%$fall%$head%)inclusive%%joint%%lines(!k%&mobile%$over%\'related%%sided&$pike%\'trucked%%users%#way$%/road',
+    '$&breaks%"uf$/card-discounted$"er&!s$6freight&ndash;liveried$!i%$ngs.$"le&#rie$&motors$$port$$ride("rs\'#ing',
+    '$%scene$$ton.\'\'/oxford\'!s%#rak$"wa&\'y-board)%ridge(%coach*%mpany(+destruction(&engine.%ering($line(#man',
+    '((platform)%oster(&rooted(\'sidings*(gnalling)\'tations*#yle()timetable)#own(%wagon-!s\'\'/museum("to\'#_so\'"s.',
+    '$$yard#$mond\'!e\'"in#,n&ndash;snow%+rehy;sodden$,-as-a-symbol%\'bloated\'"ur)#red&$orne%\'causing&$loud*"ed%&dances',
+    '&&elayed&&rowned%\'forests&#ree%&gutter%%laden\'"ws%&makers%*restricted&%uined%\'scoured&%ensor&%hadow\'&edding&&lashed',
+    '&(pattered\'%otted&$torm%5water-spume-blood-oil&&rapped$!.$!/%\'drizzle$$bagh&"th%&orough&"w*\'*-arguments()coalition((flashing',
+    '(\'skinned)(pattered*&lashed\'$.the&!y$%coat.$$dale&%ncing%"le%#own%\'renched$$each%%d-out\'$upon%"ys',
+    '%#low%.orest-although+(dwelling*\'/global*"ed%#ull$"ha%#ead$#ich%#eri$#ley$$ment%$ondo$%ridge$\'s/gooch',
+    '%\'borough,!s%"es%+ford-hannay)!s%#uit$%times$&washed&(ter-butt%#ood$+y-afternoon&#day%+/windy/busy#"re$\'neachan',
+    '#%sanen$!d$(ed-beach\'#eye*$brow\'$spot\'"up&!/&#_in$!i%!g%(n-filled&!a&/g-from-the-dead\'!.',
+    '&!y$"ky$#man$+on&eacute;e&-_d\'&circ;etre**eacute;tre&%nable+!s\'#eur$"sa$+y-eyebrowed#!t$"ha#"va##yat',
+    '#%-like#\'/driver#)a-shikara$"ng$)onarivelo%"ri$&ratnam%#uwo$!s%$htan%$tani#&chtova$%zonek##dev##eev',
+    '$%shwar%#war#"ic$!m$!t##juh#"ka$!o##man&#fal#!o$#uri$!v#\'putanah#%shahi',
+    '%!i"%k\'ahs#!a$"nt#&e-held(!l%$offs$&/karen$%lands$#off$!r$"sh$$well#&hashas$"im',
+    '%!s$"om#$ipov$!z##oto&\'harison&$mavo&#vao$%vskii#%shasa""la$$hine#!d#+egh-radford$*igh-durham',
+    '##gex#"ik#$leye$$idae%!s$%oides$"y\'%*-attenders&)organiser&-rassemblement&(teachers%./demonstration&\'reunion%#ers%)ing-cries',
+    '%!s#"oo#+ph-appeared%\'/crooks&(forestry&&regent%!e%"ie#+ston-purina#!y$!e"+m&egrave;ne##(s)#*-intensive$$jeep',
+    '#6.0/bbcbasic/progs/test$(o/ee.cli#%acake%&handra$#gge$&ishing$#jli$!k%#ant%\'rishnan$$lama%#epe$)mohanarao$*n-inactive%%athan',
+    '%!i%%kutty%"sk$,rosandratana$$sses%%waram$!t$"ya$$zani##bai%"ud$"la&"ge%!y$\'o-esque',
+    '%!l&!l%!t$#uka%%sters$!y#(chandant$"om#!d$"ac%&thsing$&rv.sys#\'eaugate&!x$"ez',
+    '$#lau%"ho$%mbrit$!n%$skoe$%sseum\'"ye&#ids#$garh\'$ians$%haria#(i&eacute$"ns$"sh##jam',
+    '#\'kalawan#$lawi$"et$!i$#jak$#osa#%mell.%%rorck&!s$)ing-spike\'!o$$oham%"re$&ulotsi#\'nefjell',
+    '#$p-up$(/grooves%(halfpipe$!a%%geous%!l%#ncy&\'tly-bad$!e%#llo%(nstrasse%!r&#sad$&hastos%#ele',
+    '&!o$%sgill$(ton-type$$ujan%"ra%!s#\'raiding\'!s$"ez#*s&oslash;y$%-page$#ala%!u%+y/marketing\'%radar',
+    '$#car$#dal%+en/accident%#own$)ey-legend&"er$*gate/dover$\'hackled%#ead$#ide$&perger$&thorpe%%rasse#(tek-9351#!u',
+    '$&shwana#%whale$#ong")n/hobbled#&a-mike$$kpur$#lli$!u#"by#!c$\'&eacute$$agua$\'e/owner$&h-bred&\'farming',
+    '%$bred%.er-businessman\'"ia\'!o&$ttes%$ing.%$land)!s%#men%\'o-style&!d%"us$"ic%$dity&"ly',
+    '$\'orously%+ur.contempt\'!t#"da!&icards',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_61 = (
+count_61 = 6694
+
+heads_61 = (
     'plumper-looking',
-    'plumpers',
-    'plumpies',
-    'plumptious',
-    'plumptre',
-    'plumptree',
-    'plumptuous',
-    'plumpy',
-    'plumridge/folly',
-    'plumridge/the',
-    'plumtree/tutur',
-    'plunder-happy',
-    'plunge-action',
-    'plunge-bath',
-    'plunge-divers',
-    'plunge-diving',
     'plungings',
-    'plunkett-green',
-    'plunkett/director',
-    'plunketts',
-    'plunking',
-    'plunks',
-    'plunky',
-    'plural-party',
-    'pluralingual',
-    'pluralising',
-    'pluralisms',
-    'pluralist-institutionalist',
-    'pluralist-orientated',
-    'pluralist-type',
-    'pluralities/synonyms',
-    'pluralization',
     'plurally',
-    'pluri-activity',
-    'pluri-member',
-    'pluriactive',
-    'pluribus',
-    'pluridisciplinarity',
-    'pluriel',
-    'plurima',
-    'pluripotential',
-    'plurium',
-    'pluronic',
-    'plus-handicaps',
-    'plus-one',
-    'plus-two',
-    'pluscarden',
-    'plush&rehy;covered',
     'plush&rehy;velvet',
-    'plush-carpeted',
-    'plush-covered',
-    'plush-lined',
-    'plushest',
-    'plusieurs',
-    'plusmn',
-    'pluspunkt',
-    'pluthero',
-    'pluto/',
-    'plutocrat',
-    'plutonian',
-    'plutonism',
-    'plutonium-238',
-    'plutonium-contaminated',
-    'plutonium-fed',
     'plutonium-fuel',
-    'plutonium-iv',
-    'plutonium-plated',
-    'plutonium-poisoning',
-    'plutonium-powered',
-    'plutons',
-    'plutos',
-    'pluvianus',
-    'pluviose',
-    'pluvious',
-    'pluvius',
-    'pluym',
-    'plyed',
-    'plygram',
-    'plym',
-    'plymbridge',
     'plymouth-edinburgh/glasgow',
-    'plymouth-roscoff',
-    'plymouth/devon',
-    'plymouth/devonport',
-    'plymouth1',
-    'plymouthwood',
-    'plynlimmon',
-    'plynth',
-    'plys',
-    'plytechnic',
-    'plywood-type',
-    'plz/bad',
-    'plze&ncaron;-prague',
-    'pm&ndash;4.00',
-    'pm&ndash;5.00',
-    'pm&ndash;6',
     'pm\'',
-    'pm-6',
-    'pm-polymide',
-    'pm.saturday',
-    'pm.sunday',
-    'pm.thursday',
-    'pm.tomorrow',
-    'pm/',
-    'pm/250&ndash;300',
-    'pm/cim',
-    'pm/kg/hour',
-    'pm/pm',
-    'pm10',
-    'pm4002m',
-    'pm651',
-    'pma/c',
     'pmac',
-    'pmal',
-    'pmap',
-    'pmd.',
-    'pmdl.exe',
-    'pme',
-    'pmf',
-    'pmhf',
-    'pmk',
-    'pmlb1045',
-    'pmm',
-    'pmmlib.gimmspoly',
-    'pmms',
-    'pmof',
-    'pmoi',
-    'pmol/10',
     'pmol/h/',
-    'pmol/h/mg',
-    'pmol/kg/',
-    'pmol/kg/hour',
-    'pmol/kg/hr',
-    'pmol/l-10',
-    'pmol/million',
-    'pmol/ml',
-    'pmol/rat',
-    'pmprb',
-    'pmr.aa',
-    'pmr.ab',
-    'pmr.dir',
-    'pmr.pre',
-    'pmr.res',
-    'pmr.s01',
     'pmr.s02',
-    'pmr.s03',
-    'pmrmpc',
-    'pms-related',
-    'pmspace',
-    'pmtrp',
-    'pmw',
-    'pn&mdash;nationalist',
-    'pn-1',
-    'pn0',
-    'pn12(f2)',
-    'pn36',
-    'pn5',
-    'pnc2',
-    'pnemohydraulic',
-    'pneobarbital',
     'pneu&rehy;monia',
-    'pneumatic-tyred',
-    'pneumatically-operated',
-    'pneumatique',
-    'pneumatocele',
-    'pneumatosis',
-    'pneumoccocal',
-    'pneumological',
-    'pneumonia-which',
-    'pneumoniacutependicitis',
-    'pneupac',
-    'pnl',
-    'pnmn',
-    'pnnk',
-    'pno-polynosic',
-    'pnp-style',
     'pnpr',
-    'pnr',
-    'pnsd',
-    'pnthfv',
-    'pntl',
-    'pnup',
-    'pnv-dominated',
-    'pny',
-    'po&eacute;zie',
-    'po&ecirc;le',
-    'po&egrave;mes',
-    'po&egrave;tes',
-    'po&zcaron;arevac',
-    'po&zcaron;ega',
-    'po-',
-    'po-2',
     'po-ch\'uan',
-    'po-face-that',
-    'po-fagged',
-    'po-lice',
-    'po-lice-men',
-    'po-lo',
-    'po-q',
-    'po-roosky',
-    'po-s',
-    'po-se-da-',
-    'po.',
-    'po/danon',
-    'po/jansons',
-    'po/kondrashin',
-    'po/lazarev',
-    'po/tortelier',
     'po2/po3',
-    'po22',
-    'po2299',
-    'po4/po5',
-    'po6/po7',
-    'poach\'',
-    'poached-egg',
-    'poaching-prevention',
-    'poad',
-    'poale',
-    'poas',
-    'pobee',
-    'pobgees',
-    'pobjoy',
-    'pobjoy-powered',
-    'pobl',
     'poblacion',
-    'poblete',
-    'poblo',
-    'pobol',
-    'pobrecita',
-    'pobrovsky',
-    'pocatello',
-    'pocey',
-    'poch',
-    'pochard-like',
-    'pochata',
-    'pochayses',
-    'pocheen',
-    'pocheza',
-    'pochola',
-    'pock&rehy;fretten',
     'pock-ridden',
-    'pocked-book',
-    'pockedy',
-    'pocket-battleship',
-    'pocket-borough',
-    'pocket-boroughs',
-    'pocket-calculator',
-    'pocket-clipper',
-    'pocket-diary',
-    'pocket-flask',
-    'pocket-handkerchieves',
-    'pocket-knives',
-    'pocket-liners',
-    'pocket-square',
-    'pocket.like',
-    'pocketable',
     'pocketed_a',
-    'pocketknife',
-    'pocketlan',
-    'pocketphone',
-    'pocketsize',
-    'pockley',
-    'pockly',
-    'pockmark',
-    'pockock-designed',
-    'pockrass',
-    'pocks',
-    'pocky/downy',
-    'poco_a_poco',
-    'pococke',
-    'pocohontas',
-    'pocol',
     'pocomoke',
-    'pocono',
-    'pocot',
-    'pocus.',
-    'pod&atilde;o',
-    'pod&ecaron;brad',
-    'pod\'',
-    'pod-and-boom',
-    'pod-danstvo',
-    'pod-like',
-    'podach',
-    'podargus',
-    'podborski',
-    'podded',
-    'poddled',
-    'poddles',
     'podelyakin',
-    'poderes',
-    'poderis',
-    'podeschi',
-    'podesta',
-    'podgered',
-    'podgily',
-    'podgorica',
-    'podgorny',
-    'podhale',
-    'podhrasky',
-    'podials',
-    'podiebrad',
-    'podischnus',
-    'podkopayeva',
-    'podlaska',
     'podlington',
-    'podo',
-    'podobedov',
-    'podocarpaceae',
-    'podocataro',
-    'podoeroticism',
-    'podoinik',
-    'podolia',
-    'podolians',
-    'podophile',
-    'podophiles',
-    'podromanija',
-    'podsnappery',
-    'podsol',
-    'podsolised',
-    'poductivity',
     'poducts',
-    'podule',
-    'podzolic',
-    'podzolisation',
-    'podzolization',
-    'poe-faced',
-    'poech',
-    'poecillopsis',
-    'poehl',
-    'poeke',
-    'poekjdnmfkurhhnrjksslplqxyjdd',
-    'poell',
-    'poem\'',
-    'poem-cum-essay',
-    'poem-cycle',
-    'poem.',
     'poenuius',
-    'poeschke',
-    'poesi',
-    'poesia',
-    'poesy/stared',
-    'poet\'',
-    'poet(s)',
-    'poet-comedian',
-    'poet-conceptualist',
-    'poet-critic',
-    'poet-dandy',
-    'poet-errant',
-    'poet-hero',
-    'poet-in-the-making',
-    'poet-narrator',
-    'poet-novelist',
     'poet-painter',
-    'poet-philosopher',
-    'poet-prophet',
-    'poet-public-faith',
-    'poet-sailor',
-    'poet-teacher',
-    'poet-turned-novelist',
-    'poet/jongleur',
-    'poet/narrator',
-    'poetas',
-    'poetasters',
-    'poeth',
-    'poeticise',
-    'poeticity',
-    'poeticus',
-    'poetising',
     'poetize',
-    'poeton/gloucestershire',
-    'poetries',
-    'poetry-',
-    'poetry-lovers',
-    'poetry-loving',
-    'poetry-phobic',
-    'poetryspeak',
-    'poets/warriors',
-    'poettmes',
-    'poeu',
-    'poeze',
-    'pof',
-    'pof&mdash;a',
-    'pofcher',
-    'poffenberger',
     'pog-polarguard',
-    'pogers',
-    'pogey',
-    'poggibonsi',
-    'pogies',
-    'pogliahi',
-    'pogo-ing',
-    'pogoers',
-    'pogolotti',
-    'pogonomyrmex',
-    'pogonophoran',
-    'pogrom-like',
-    'pogrom-type',
-    'pogson',
-    'pogue-ish',
-    'pohai',
     'pohengamok',
-    'pohiseaduslik',
-    'pohjala',
-    'pohjois-suomalainen',
-    'pohlenz',
-    'pohlia',
-    'pohlin',
-    'pohoddaramulla',
-    'pohorje',
-    'poi-son',
-    'poichel/head',
-    'poictiers',
-    'poiein',
-    'poien',
-    'poiker',
-    'poikile',
     'poikilothermic',
-    'poikilothermics',
-    'poikilothermy',
-    'poin\'ted',
-    'poinar',
-    'poincar&eacute;-liapunov',
-    'poinded',
-    'poineer',
-    'poing-poing-poing-poing',
-    'poinged',
-    'poiniemania',
-    'point&mdash;contrepoint',
-    'point&mdash;electronic',
-    'point&mdash;impudence',
-    'point&mdash;recall',
-    'point&mdash;there',
     'point&rehy;the',
-    'point-5',
-    'point-a-view',
-    'point-and&rehy;click',
-    'point-black',
-    'point-by&rehy;point',
-    'point-counter-point',
-    'point-design',
-    'point-for-point',
-    'point-group',
-    'point-instant',
-    'point-less',
-    'point-mutagenesis',
-    'point-of',
-    'point-of-production',
-    'point-of-sales',
     'point-pepperell',
-    'point-saver',
-    'point-saving',
-    'point-scorers',
-    'point-size',
-    'point-source',
-    'point-the',
-    'point-to-multipoint',
-    'point-winning',
-    'point=',
-    'point=1',
-    'pointage',
-    'pointataing',
-    'pointe-&aacute;-pietre',
-    'pointe-work',
-    'pointed-arch',
     'pointed-butt',
-    'pointed-eared',
-    'pointed-roofed',
-    'pointed-toed',
-    'pointelle',
-    'pointer-',
-    'pointer-readings',
-    'pointer.',
-    'pointewd',
-    'pointhouse',
-    'pointier',
-    'pointin\'',
-    'pointing-to',
-    'pointing-towards',
-    'pointing.',
-    'pointings-out',
     'pointless.',
-    'pointless.and',
-    'pointlessly.',
-    'pointlike',
-    'pointney',
-    'pointon.',
-    'pointplus',
-    'pointrider',
-    'points&mdash;the',
-    'points&rehy;gatherers',
-    'points-at',
-    'points-can',
-    'points-cleaning',
-    'points-counting',
-    'points-of-order',
-    'points-rated',
     'points/passages',
-    'points/subsidiary',
-    'points_in_favour',
-    'pointsman',
-    'pointsmen',
-    'pointy-chested',
-    'pointy-chinned',
-    'pointy-esque',
-    'pointy-headed',
-    'pointy-horned',
-    'pointy-nosed',
-    'pointy-roofed',
-    'pointy-shaped',
-    'pointy/anoint',
-    'pointyheads',
-    'poipou',
     'poir',
-    'poirault',
-    'poireau',
-    'poirot/carnival',
-    'poirshoha',
-    'poises',
-    'poisioning',
-    'poisned',
-    'poison-fed',
-    'poison-filled',
-    'poison-gassed',
-    'poison-pill',
-    'poison-taking',
-    'poisonblade',
-    'poisonously',
-    'poissoni&egrave;re',
     'poistion',
-    'poiters',
-    'poitevin\'',
-    'poitin',
-    'poitou-charentes',
-    'poitou/saintonge',
-    'poitrine',
-    'poitrines',
-    'poivrade',
-    'pok-tainted',
-    'pokal',
-    'pokalde',
-    'pokazukha',
-    'poke(s)',
-    'poke-bonnet',
-    'poker-',
     'poker-buddies',
-    'poker-face',
-    'poker-game',
-    'poker-shaped',
-    'poker-straight',
-    'pokere',
-    'pokerfaced',
-    'pokerwork',
-    'pokery',
-    'pokeweed',
-    'pokeys',
-    'pokhabov',
-    'pokhara&ndash;royal',
-    'pokharel',
-    'pokhrel',
-    'pokin',
     'pokings',
-    'poklonstvo',
-    'pokora/princess',
-    'pokorenie',
-    'pokorny',
-    'pokot',
-    'pokran',
-    'pokrosk',
-    'pokrov',
-    'pokrovsky',
-    'pokule',
-    'pokus',
-    'pokymerase',
-    'pol&iacute;tica',
-    'pol&iacute;tico',
-    'pol&lsqb;itica&rsqb;l',
     'pol&zcaron;ic',
-    'pol\'tics',
-    'pol-nippon',
-    'pol/econ',
-    'polaar',
-    'polabian',
-    'polaca',
-    'polacheck',
-    'poladenylation',
-    'polak/jacques',
-    'polakovic',
-    'polan',
-    'poland&mdash;see',
-    'poland-china',
-    'poland-norway',
-    'poland.gap',
     'polansky',
-    'polar-',
-    'polar-bear',
-    'polar-cap',
-    'polar-guard',
-    'polar-orbiting',
-    'polarfangst',
-    'polarfleece',
-    'polarimeter',
-    'polarimetric',
-    'polaris-armed',
-    'polarisation-2',
-    'polarised-deuterium',
-    'polarises',
-    'polarite-daylight',
-    'polarity-sensitive',
     'polarizes',
-    'polars',
-    'polarstar',
-    'polarsystem',
-    'polartex',
-    'polaryi',
-    'polasminogen',
-    'polataivao',
-    'polatkan',
-    'polatom',
-    'polcari',
-    'polcie',
-    'polder',
-    'polderland',
-    'poldhu',
-    'poldie',
     'poldka',
-    'pole-and-dagga',
-    'pole-axe',
-    'pole-axeing',
-    'pole-barrier',
-    'pole-bearers',
-    'pole-carews',
-    'pole-carrier',
-    'pole-carrying',
-    'pole-catholic',
-    'pole-fished',
-    'pole-like',
-    'pole-marked',
-    'pole-setters',
-    'pole-squatting',
-    'pole-star',
     'pole-tents',
-    'pole-to-equator',
-    'pole-vaulted',
-    'pole-vaulters',
-    'pole-vaulting',
-    'pole-zero',
-    'pole/zero',
-    'polemarchs',
-    'polemicise',
-    'polemicised',
-    'polemicising',
-    'polemicism',
-    'polemicized',
-    'polemicizing',
-    'polemonium',
-    'polena',
     'polenghi',
-    'poleo',
-    'polepiece',
-    'poler',
-    'poles-apart',
-    'polesdon',
-    'polesia',
-    'polestar',
-    'polesworth',
-    'poleumita',
-    'polfa',
-    'polgahavela',
-    'polge',
-    'polglase',
-    'polgreen',
-    'poli&rehy;tician',
     'polic&iacute;a',
-    'polic&rehy;ed',
-    'policano',
-    'policansky',
-    'policarpa',
-    'policarpo',
-    'police&mdash',
-    'police&rehy;men',
-    'police\'',
-    'police-',
-    'police-based',
-    'police-black',
-    'police-blue',
-    'police-box',
-    'police-chief',
-    'police-control',
     'police-court',
-    'police-crime',
-    'police-detective',
-    'police-dominated',
-    'police-escorted',
-    'police-free',
-    'police-general',
-    'police-horse',
-    'police-inspired',
-    'police-keeping',
-    'police-man',
-    'police-military',
-    'police-oriented',
-    'police-picket',
-    'police-recorded',
-    'police-related',
     'police-service',
-    'police-social',
-    'police-stations',
-    'police-training',
-    'police-who',
-    'police-woman',
-    'police-y',
-    'police.as',
-    'police.kim',
-    'police/black',
-    'police/customs',
-    'police/local',
-    'police/officers',
-    'police/press',
-    'police/sociology',
-    'police/striker',
     'police15pts',
-    'policecar',
-    'policem',
-    'policeman\'',
-    'policeman-cum-nursemaid',
-    'policeman-friendly',
-    'policeman-on&rehy;the-beat',
-    'policeman.',
-    'policeman/anthropologist',
-    'policeman/insider',
-    'policeman/peacemaker',
-    'policemanliness',
-    'policemen&ndash',
-    'policemen/nurses/teachers',
-    'policemen/thin',
-    'policey',
     'polici',
-    'policie',
-    'policies-advertising',
-    'policies.beyond',
-    'policies.john',
-    'policies/strategies',
-    'policing/public',
-    'policlinico',
-    'policoro',
-    'policromi',
-    'policy&rehy;shaping',
-    'policy*',
-    'policy-action',
-    'policy-actors',
-    'policy-advisory',
-    'policy-analysis',
     'policy-conscious',
-    'policy-coordinating',
-    'policy-decision',
-    'policy-determined',
-    'policy-driven',
-    'policy-executing',
-    'policy-execution',
-    'policy-executives',
-    'policy-focussed',
-    'policy-forming',
-    'policy-formulation',
-    'policy-goal',
-    'policy-influentials',
-    'policy-initiating',
-    'policy-innovating',
-    'policy-issues',
     'policy-led',
-    'policy-level',
-    'policy-lower',
-    'policy-makers.3',
-    'policy-making-implementation',
-    'policy-minded',
-    'policy-obsessed',
-    'policy-orientation',
-    'policy-prescription',
-    'policy-recommendations',
-    'policy-research',
-    'policy-setters',
-    'policy-strings',
-    'policy-takers',
-    'policy-tools',
-    'policy-variant',
     'policy-writing',
-    'policy.the',
-    'policy/',
-    'policy/administration',
-    'policy/mps',
-    'policyless',
-    'policysetting',
-    'polidoro',
-    'polii-promoters',
-    'poliii-genes',
-    'poliittinen',
-    'polikarpov',
-    'polikon',
-    'polim&eacute;ros',
-    'polino',
-    'polinochi',
     'polinski',
-    'polinsky',
-    'polio-encephalitis',
-    'polio-encephalomyelitis',
-    'polio-endemic',
-    'polio-myelitis',
-    'polio/on',
-    'poliocy',
-    'poliomeningitis',
-    'poliomyelitis-free',
-    'poliorcetes',
-    'polios',
-    'poliptychs',
-    'polish-',
-    'polish-based',
-    'polish-belorussian',
     'polish-czech',
-    'polish-japanese',
-    'polish-latin',
-    'polish-russian',
-    'polish-scented',
-    'polish-tin',
-    'polish-trained',
-    'polish-uk',
-    'polish/american',
-    'polished-brass',
-    'polished-silver',
-    'polished-wood',
-    'polishin\'',
-    'polishings',
-    'polishness',
-    'polit&eacute;cnica',
     'polit-ical',
-    'politbureaucrats',
-    'politburocracy',
-    'politburos',
-    'politburu',
-    'politcally',
-    'politcians',
-    'politcs',
-    'politely.',
-    'politi-cal',
-    'politica',
-    'political&rehy;economic',
-    'political-administrative',
-    'political-ideological',
-    'political-legal',
-    'political-reform',
     'political-religious',
-    'political-scientific',
-    'political-style',
-    'political-symbolic',
-    'political-system',
-    'political-union',
-    'political/cultural',
-    'political/ideological',
-    'political/industrial',
-    'political/moral',
-    'political/national/social',
-    'political/sociological',
-    'politicalamity',
-    'politically&rehy;motivated',
-    'politically-ailing',
-    'politically-appointed',
     'politically-based',
-    'politically-charged',
-    'politically-committed',
-    'politically-correct',
-    'politically-determined',
-    'politically-dubious',
-    'politically-induced',
-    'politically-inflamed',
-    'politically-influenced',
-    'politically-inspired',
-    'politically-isolated',
-    'politically-led',
-    'politically-realistic',
-    'politically-visible',
-    'politican',
-    'politiche',
     'politicheskoe',
-    'politician-directed',
-    'politician-media',
-    'politician-nobleman',
-    'politician-planner-industrial',
-    'politician.can',
-    'politician/official',
-    'politicist',
-    'politicizations',
-    'politicizes',
-    'politick',
-    'politico-freudian',
-    'politico-sociological',
-    'politico-theoretical',
-    'politics-as-usual',
-    'politics-by',
     'politics-watchers',
-    'politics.4',
-    'politics/foreign',
-    'politics/social',
-    'politicsans',
-    'politicsws4',
-    'politicsws6',
-    'politieal',
-    'politiek',
-    'politieke',
-    'politiken',
-    'politikya',
-    'politization',
-    'politrick',
-    'polity\'',
-    'polityczna',
     'poliuce',
-    'poliziano',
-    'polizzotto',
-    'poljana',
-    'polka-dots',
-    'polkinghornes',
-    'polks',
-    'polkyth',
-    'poll&rehy;capping',
-    'poll&rehy;tax',
-    'poll-axed',
-    'poll-capped',
-    'poll-capping',
-    'poll-defying',
-    'poll-led',
-    'poll-parrots',
     'poll-pry',
-    'poll-sapping',
-    'poll-shocker',
-    'poll-takers',
-    'poll-tax-capping',
-    'poll-tax-payers',
-    'pollage',
-    'pollakis',
-    'pollan',
-    'pollard-like',
-    'pollard/club',
-    'pollard/employer',
-    'pollard/hillier',
-    'pollard/macari',
-    'pollard/publisher',
-    'pollardii',
     'polledri',
-    'pollehn',
-    'pollen-and-honey',
-    'pollen-b',
-    'pollen-carriers',
-    'pollen-dated',
-    'pollen-dusted',
-    'pollen-dusty',
-    'pollen-grain',
-    'pollen-spattered',
-    'pollen-transport',
-    'pollen-tube',
-    'pollen-tubes',
-    'polleny',
-    'pollera',
-    'pollerman',
     'pollerton',
-    'pollesley',
-    'polli',
-    'pollia',
-    'pollias',
-    'pollicem',
-    'pollicino',
-    'pollicle',
-    'pollina',
-    'pollinator-pollinated',
-    'polling-day',
-    'polling-related',
-    'polling.',
-    'pollington',
-    'pollinologist',
-    'pollinologists',
     'polliss',
-    'pollitt.',
-    'polloch',
-    'pollock-krasner',
-    'pollock/lee',
-    'pollock/local',
-    'pollock/villager',
-    'pollockshields',
-    'polloi',
-    'pollokshaws',
-    'pollonois',
-    'polluantur',
-    'pollums',
-    'pollution-',
-    'pollution-cutting',
-    'pollution-emitting',
     'pollution-producing',
-    'pollution.clare',
-    'pollution.the',
-    'pollutive',
-    'pollwinner',
-    'pollwinners',
-    'polly/amanda',
-    'pollyannaish',
-    'pollypak',
-    'pollywog',
-    'polmadie',
-    'polmaise',
-    'polmer',
-    'polmood',
-    'polnisches',
-    'polo-coat',
     'polo-field',
-    'polo-mad',
-    'polo-necks',
-    'polo-players',
-    'polo-shirts',
-    'polo-sweater',
-    'polo-type',
-    'polo/halter-neck',
-    'poloc',
-    'pologa',
-    'pologies',
-    'polonaise-fantaisie',
-    'polonaise-fantasie',
-    'polonecked',
-    'polonies',
-    'polonisation',
     'polonise',
-    'polonized',
-    'polonoreste',
-    'polonoroesti',
-    'polonskiy',
-    'poloshirt',
-    'polovina',
-    'polovnick&yacute',
-    'polpero',
-    'polreath',
-    'polsham',
-    'polshek',
-    'polsk&eogon',
-    'polskiej',
-    'polsted',
-    'polston.',
     'polsue',
-    'poltawa',
-    'polten',
-    'poltical',
-    'polticals',
-    'poltics',
-    'poltoratsky',
-    'poltox',
-    'poltroncine',
-    'poltrone',
-    'polugaevsky',
-    'polunnaruwa',
-    'poluostrov',
-    'polvier',
-    'polwarth',
-    'polworth',
     'poly&lsqb;a&rsqb',
-    'poly&rehy;propylene',
-    'poly(alkylmethacrylate)s',
-    'poly(but-1-ene)',
-    'poly(da-dt)',
-    'poly(ethylene)',
-    'poly(hex-1-ene)',
-    'poly(methylmethacrylate)',
-    'poly(p-phenylene)',
-    'poly(vinylchloride)',
-    'poly-(methylmethacrylate)',
-    'poly-chlorinated',
-    'poly-chroma',
-    'poly-correct',
-    'poly-crystalline',
-    'poly-d-lysine',
     'poly-d-lysine-coated',
-    'poly-dextrose',
-    'poly-ethnic',
-    'poly-ethylene',
-    'poly-filter',
-    'poly-l-lysone-coated',
-    'poly-phosphates',
-    'poly-sided',
-    'poly-sperma',
-    'poly-technic',
-    'poly-wrap',
-    'poly/cotton',
-    'poly/cottons',
-    'polya+',
-    'polyacetal',
-    'polyacetylenes',
     'polyacrylamide-7m',
-    'polyacrylamide/38:1',
-    'polyacrylates',
-    'polyacrylic',
-    'polyain.',
-    'polyainus',
-    'polyalkenoate',
-    'polyamid',
-    'polyamino',
-    'polyandrously',
-    'polyanionic',
-    'polyarchies',
-    'polyaromatich',
-    'polyatom',
-    'polyattract',
-    'polyautography',
     'polybac',
-    'polybe',
-    'polybrachygyny',
-    'polybutadienes',
-    'polycaprolactone',
-    'polycarbide',
-    'polycarbide-armoured',
-    'polycarbonates',
-    'polycarpou',
-    'polycat',
-    'polycation',
-    'polycations',
-    'polycel',
-    'polycephalum',
-    'polycheate',
-    'polychlorethene',
     'polychlorobiphenyls',
-    'polychloroethene',
-    'polychloroprene',
-    'polychorality',
-    'polychotomies',
-    'polychotomy',
-    'polychrests',
-    'polychrinides',
-    'polychrome-decorated',
-    'polychrome-painted',
-    'polycistronic',
-    'polyclitan',
-    'polyclongal',
-    'polyconjugated',
-    'polycrystals',
-    'polyculture',
     'polyd(a-t)',
-    'polydendri',
-    'polydesmus',
-    'polydeukes',
-    'polydi.polydc',
-    'polydi:polydc',
-    'polydichloromethylinlon-4',
-    'polydimensional',
-    'polydipsia',
-    'polydonal',
-    'polyembryony',
-    'polyene',
-    'polyester-and-cotton',
-    'polyester-and-worsted',
-    'polyester-coat',
-    'polyester-coated',
     'polyester-dacron',
-    'polyester-fibre',
-    'polyester-mix',
-    'polyester-reinforced',
-    'polyester-satin',
-    'polyester-type',
-    'polyester/50%',
-    'polyester/nylon',
-    'polyethylene/polypropylene',
-    'polyeucte',
-    'polyeurathane',
-    'polyfemus',
-    'polyfil',
-    'polyfilled',
-    'polyfilters',
-    'polyfix',
     'polyfoil',
-    'polyfunction',
-    'polyfunctional',
-    'polygalaceae',
-    'polygamistic',
-    'polygenes',
-    'polygenically',
-    'polygenists',
-    'polyglycine',
-    'polygnotan',
-    'polygon-in-polygon',
-    'polygonal-ended',
-    'polygons/antialiased',
-    'polygraphic',
-    'polygraphs',
-    'polygynandry',
     'polygynously',
-    'polyhalogenate',
-    'polyhedrane',
-    'polyhistor',
-    'polyhomicide',
-    'polyhomicide/suicide',
-    'polyhydramnios',
-    'polyhydroxyether',
-    'polyimide',
-    'polyinosinicpolycytidylic',
-    'polyisobutane',
-    'polyisoprenes',
-    'polykles',
-    'polymathic',
-    'polymax',
-    'polymer-ceramic',
     'polymer-composite',
-    'polymer-diluent',
-    'polymer-liquid',
-    'polymer-modified',
-    'polymer-reinforced',
-    'polymer.',
-    'polymer/additive',
-    'polymer/solvent',
-    'polymerase-',
-    'polymerase-associated',
-    'polymerase-delta',
-    'polymere',
-    'polymerically',
-    'polymerised',
-    'polymerises',
-    'polymerising',
     'polymerizations',
-    'polymers.',
-    'polymes',
-    'polymethacrylonitrile',
-    'polymetis',
-    'polymetrical',
-    'polymicrogyria',
-    'polymix',
-    'polymixin',
-    'polymnia',
-    'polymolybdate',
-    'polymoprhisms',
-    'polymorphisme',
-    'polymyosites',
-    'polymyxins',
-    'polyn&eacute;sie/tavini',
     'polynerase',
-    'polynes',
-    'polynesian-themed',
-    'polyneuropathies',
-    'polynominal',
-    'polynosic',
-    'polynucleotide-specific',
-    'polynuleotide',
-    'polynya',
-    'polyodon',
-    'polyolbion',
-    'polyoma',
-    'polyomavirus',
-    'polyoxenethylated',
-    'polyp-feeding',
-    'polyp-like',
     'polyp/carcinoma',
-    'polypaint',
-    'polyparty',
-    'polypectomies',
-    'polypedon',
-    'polypeptide/kg/h',
-    'polypetides',
-    'polyphant',
-    'polyphonica',
-    'polyphosphoinositide',
-    'polyphospoinositides',
-    'polyphyletic',
-    'polyphyllum',
-    'polypless',
-    'polyplicates',
-    'polypod',
     'polypodiums',
-    'polypody',
-    'polypoidal',
-    'polyprop',
-    'polypropylene-based',
-    'polyprotodonta',
-    'polypterid',
-    'polypteridaw',
-    'polypterids',
-    'polypticus',
-    'polyptoton',
-    'polyptych-surveyors',
-    'polypuththeketlon',
-    'polypyrrole',
-    'polyrhachis',
-    'polysacride',
     'polysacurised',
-    'polysaturate',
-    'polyseal.',
-    'polysemantic',
-    'polysemity',
-    'polysilicon',
-    'polysomes',
-    'polysonics',
-    'polysorbates',
-    'polystichums',
-    'polysticta',
-    'polystyrene/',
-    'polystyrenes',
-    'polysurf',
-    'polysyllable',
-    'polysynaptically',
     'polysynodical',
-    'polysynodie',
-    'polytaffeta',
-    'polytechics',
-    'polytechnic-wide',
-    'polytechnic/',
-    'polytechnic/colleges',
-    'polytechnician',
-    'polytechnicien',
-    'polytechnics-cum-universities',
-    'polytechnics-designate',
-    'polytel',
-    'polytetheastic',
-    'polytextual',
-    'polythanus',
-    'polytheisms',
     'polytheist',
-    'polythetic',
-    'polytomous',
-    'polytrauma',
-    'polytunnel',
-    'polytypes',
-    'polyukhovich',
-    'polyurethane-coated',
-    'polyurethane/silastic',
-    'polyuria',
-    'polyversity',
-    'polyvinly',
-    'polyvinyl-chloride',
-    'polyvinylidene',
-    'polyvinylpyrollidone',
-    'polyvocal',
     'polywater',
-    'polywhatnot',
-    'polyxena',
-    'polyzonal',
-    'pom&rehy;pom',
-    'pom-land',
-    'pom-teasing',
-    'poma',
-    'pomaceo',
-    'pomarede',
-    'pomarina',
-    'pomarinus',
-    'pomatorhinus',
-    'pomatoschistus',
-    'pomatums',
-    'pomc',
     'pomeau',
-    'pomegranate-tough',
-    'pomegranites',
-    'pomeranians',
-    'pomerelia',
-    'pomerellen',
-    'pomerland',
-    'pomeshchiki',
-    'pomganny',
-    'pomgolgub',
-    'pomialovskii',
-    'pomiculture',
-    'pominki',
-    'pomiss',
-    'pommefriterie',
-    'pommel-smashing',
     'pommelled',
-    'pommet',
-    'pommie-bashing',
-    'pommieland',
-    'pommies',
-    'pommy',
-    'pomo',
-    'pomological',
-    'pomology',
-    'pomonella',
-    'pomp-loving',
-    'pompa&rehy;dour',
-    'pompales',
-    'pompeians',
-    'pompeiians',
-    'pompeius',
     'pompes',
-    'pompeux',
-    'pompey&mdash',
-    'pompey/posh',
-    'pomphrey',
-    'pompi',
-    'pompi&egrave;rre',
-    'pompidoms',
-    'pompier',
-    'pompiers',
-    'pompilius',
-    'pompodour',
-    'pompom',
-    'pompom-like',
-    'pompoms',
-    'pomponne',
     'pompons',
-    'pompous-looking',
-    'pompous-merely',
-    'pomr',
-    'pomroy',
-    'pon.cli',
-    'ponapean',
-    'ponatshego',
-    'ponceau',
-    'ponceing',
-    'poncela',
-    'poncelot',
-    'poncelot-type',
-    'poncheville',
-    'ponchielli',
-    'poncho-style',
     'poncins',
-    'poncirus',
-    'pond\'ring',
-    'pond-building',
-    'pond-dwelling',
-    'pond-living',
-    'pond-making',
-    'pond-mud',
-    'pond-owners',
-    'pond-pump',
-    'pond-pumps/systems',
-    'pond-side',
-    'pond-slime',
-    'pond-weeds',
-    'pond/businessman',
-    'pond/public',
     'ponderer',
-    'ponderovo',
-    'pondies',
-    'pondlife',
-    'pondorosity',
-    'pondowners',
-    'ponds/forest',
-    'pondskaters',
-    'pondus',
-    'ponente',
-    'ponerines',
-    'pong-pong-pong',
-    'pongid',
-    'pongines',
-    'pongyi',
-    'poniente',
     'ponnary',
-    'ponnelle',
-    'ponnie',
-    'ponomaryeva',
-    'ponrine',
-    'ponsbourne',
-    'ponses',
-    'ponshed',
-    'ponsonshow',
-    'ponsworthy',
-    'ponsyn',
-    'pont-&agrave;-vendin',
-    'pont-builders',
-    'pont-de-l\'arche',
-    'pont-l\'abbe-d\'arnoult',
-    'pont-l\'ev&egrave;que',
     'pont-merck',
-    'pont-r&eacute;my',
-    'pont-rhyd-y-fen',
-    'pont-y-pant',
-    'pont-yr&rehy;esgob',
-    'pont/thames',
-    'ponta-da-fruta',
-    'pontaccio',
-    'pontamine',
-    'pontano',
-    'pontardawe',
-    'pontarlier',
-    'pontaudemer',
-    'ponticello',
-    'pontificals',
-    'pontification',
     'pontificators',
-    'pontificiae',
-    'pontificis',
-    'pontil',
-    'pontissara',
-    'pontivy',
-    'pontnewynydd',
-    'pontone',
-    'pontooning',
-    'pontoppidan',
-    'pontorson',
-    'pontos',
-    'pontresino',
-    'pontrhydygroes',
-    'pontyberem',
-    'pontybodkin',
     'pontygwindy',
-    'pontypandy',
-    'pontypool3',
-    'pontypool3pts',
-    'pontypridd35',
-    'pontyrhydygroes',
-    'pontysgaryd',
-    'pony-an\'&rehy;trap',
-    'pony-and-trap',
-    'pony-brown',
-    'pony-cart',
-    'pony-dealer',
-    'pony-driven',
-    'pony-escorted',
-    'pony-goddess',
-    'pony-mad',
     'pony-owners',
-    'pony-sized',
-    'pony-trotting',
-    'pony-truck',
-    'pony.',
-    'pony/horse',
-    'ponytrekking',
-    'ponzi',
-    'poo-mi-loom',
-    'poo-poo',
-    'poo-poo-poo',
-    'poo-pooed',
-    'poo-poohing',
-    'poo-poos',
-    'pooder',
-    'poodle-boy',
     'poodle-clipper',
-    'poodle-headed',
-    'poodle-like',
-    'poodled',
-    'poodling',
-    'poody',
-    'pooey-wooey',
-    'poof-dah',
-    'poofie',
-    'poofta',
-    'pooftas',
-    'poofter-joke',
-    'poohed',
-    'poohed-poohed',
-    'poohs',
-    'pooing',
     'poojahs',
-    'poojari',
-    'pooka\'',
-    'pooka-like',
-    'pookie',
-    'pool\'',
-    'pool-based',
-    'pool-cleaning',
-    'pool-rooms',
-    'pool-shark',
-    'pool-strewn',
-    'pool-surround',
-    'pool/agar',
-    'pool/terrace',
-    'poolbeg',
-    'pooldeck',
     'pooldhooie',
-    'poole-bilbao',
-    'poole-wareham',
-    'poole/home',
-    'poole/oxford',
-    'poole/team',
-    'pooled.',
-    'poolers',
-    'pooley-provided',
-    'poolhouse',
-    'poolman',
-    'poolrooms',
-    'pools-winner',
-    'poolsides',
-    'poolton/mother',
-    'poom',
     'poonch',
-    'poonswad',
-    'pooof',
-    'pooooffffff',
-    'pooosh',
-    'poop-scooping',
-    'poop-scoops',
-    'pooper-scoop',
-    'poopo',
-    'poops',
-    'poor&mdash;and',
-    'poor&mdash;someone',
-    'poor-',
-    'poor-box',
-    'poor-from',
-    'poor-house',
     'poor-little-baby',
-    'poor-miss-taylor-that-was',
-    'poor-mouth',
-    'poor-mouthed',
-    'poor-moving',
-    'poor-net',
-    'poor-poo-ray-a',
-    'poor-selling',
-    'poor-spirited',
-    'poor-the',
-    'poor-thing-he',
-    'poor-thing-how-you-must-be-suffering-thank-god-i\'m-not',
-    'poor-tithe',
-    'poor/no',
-    'poorboy',
-    'poorer-paid',
     'poorest-paid',
-    'poorly-armed',
-    'poorly-consolidated',
-    'poorly-controlled',
-    'poorly-damped',
-    'poorly-defended',
-    'poorly-developed',
-    'poorly-documented',
-    'poorly-dressed',
-    'poorly-educated',
-    'poorly-engineered',
-    'poorly-insulated',
-    'poorly-motivated',
-    'poorly-organized',
-    'poorly-performed',
-    'poorly-performing',
     'poorly-prepared',
-    'poorly-protected',
-    'poorly-qualified',
-    'poorly-reviewed',
-    'poorly-run',
-    'poorly-shod',
-    'poorly-struck',
-    'poorly-surfaced',
-    'poorly-understood',
-    'poorly.damped',
-    'poorness',
-    'poort',
-    'poorterboek',
-    'poot',
-    'pootled',
-    'poots',
     'poove',
-    'pooves',
-    'pooya',
-    'pop-',
-    'pop-as-reinvention-of-the-self',
-    'pop-based',
-    'pop-bawlers',
-    'pop-code',
-    'pop-dominated',
-    'pop-down',
-    'pop-esque',
-    'pop-essentials',
-    'pop-eyes',
-    'pop-fabness',
-    'pop-fop',
-    'pop-house',
     'pop-influenced',
-    'pop-kids',
-    'pop-learning',
-    'pop-making',
-    'pop-marketable',
-    'pop-marketing',
-    'pop-meets-politics',
-    'pop-melodrama',
-    'pop-metal',
-    'pop-mobility\'',
-    'pop-noise',
-    'pop-off',
-    'pop-orientated',
-    'pop-panto',
-    'pop-pickers',
-    'pop-popped',
     'pop-popping',
-    'pop-psychology',
-    'pop-punk',
-    'pop-related',
-    'pop-riveted',
-    'pop-science',
-    'pop-slogan',
-    'pop-socks',
-    'pop-stupidity',
-    'pop-up-book',
-    'pop-yoof-electronic-media',
-    'pop/comedy',
-    'pop/folk',
-    'pop/musical',
-    'pop/political',
-    'pop/punk',
     'pop/rock/whatever',
-    'pop/soul/jazz/harmonica',
-    'pop2',
-    'pop2-pop3',
-    'pop2/pop3',
-    'pop3',
-    'pop490',
-    'popadum',
-    'popaj',
-    'popavgaj',
-    'popayan',
-    'popblast',
-    'pope&mdash;lawyers',
-    'pope&rehy;demonstrated',
-    'pope-burning',
-    'pope-burnings',
     'pope-henessy',
-    'pope-hennessey',
-    'pope-like',
-    'pope/bone',
-    'pope/lwt',
-    'popel',
-    'popelo',
-    'popemobile',
-    'poperian',
-    'poperties',
-    'popettes',
-    'popex',
-    'popeyes',
-    'popguns',
-    'popilius',
-    'popillae',
     'popillia',
-    'popin',
-    'popins',
-    'popiwek',
-    'popkid',
-    'popkin',
-    'popkov',
-    'poplak',
-    'poplar-tall',
-    'poplar-trees',
-    'poplier',
-    'popliteal',
-    'poplius',
-    'popmeisters',
-    'popmobility-type',
-    'popmungously',
     'popo',
-    'popocat&eacute;petl',
-    'popocatepetl',
-    'popoffkas',
-    'popokovs',
-    'poporlui',
-    'popout',
-    'popov&mdash;mayor',
-    'popover',
-    'popovici',
-    'popovski',
-    'poppadams',
-    'poppadump',
-    'poppaea',
-    'poppel',
-    'poppere',
     'poppered',
-    'popperian-type',
-    'popperlation',
-    'popperphoto',
-    'popperwell',
-    'poppever',
-    'poppier',
-    'poppies-style',
-    'poppin\'',
-    'popping-crease',
-    'popplau',
-    'poppo',
-    'poppy-and-bangy',
-    'poppy-cock',
-    'poppy-flowered',
-    'poppy-growers',
     'poppy-growing',
-    'poppy-red',
-    'poppy-scarlet',
-    'poppy-seed',
-    'poppy-seeds',
-    'poppy-water',
-    'poppyfilled',
-    'popr',
-    'poprock',
-    'pops.',
-    'popsicle',
-    'popsition',
-    'popso',
-    'popsock',
-    'popstack',
-    'popstars',
     'popstravaganza',
-    'poptel',
-    'popter',
-    'popthrash',
-    'popticians',
-    'populaires-usfp',
-    'populants',
-    'popular-academic',
-    'popular-based',
-    'popular-bourgeois',
-    'popular-festive',
-    'popular-front',
-    'popular-sized',
-    'popular.at',
-    'popular/tourist',
-    'populari',
     'popularis',
-    'popularity-winning',
-    'popularity.',
-    'popularizations',
-    'popularly-called',
-    'popularly-elected',
-    'popularly-held',
-    'popularly-orientated',
-    'populat',
-    'population(&pound;520.03)',
-    'population(s)',
-    'population*',
-    'population-',
-    'population-control',
-    'population-distribution',
-    'population-orientated',
     'population-samples',
-    'population-that',
-    'population.this',
-    'population/housing',
-    'population:10,781,000',
-    'population:106,000',
-    'population:23,200,000',
-    'population:25,355',
-    'population:410,000',
-    'populationist',
-    'populationsof',
-    'populatiosn',
-    'populiats',
-    'populisms',
-    'populist-based',
-    'populist-oriented',
     'populonia',
-    'populos',
-    'populousness',
-    'popunds',
-    'popyan',
-    'poqet',
-    'poquelin',
-    'poquet',
-    'por\'tray',
-    'porana',
-    'poraries',
-    'poraz',
-    'porblems',
-    'porcelain-coated',
-    'porcelain-covered',
-    'porcelain-enamelled',
     'porcelain-like',
-    'porcelain-pale',
-    'porcelain-white',
-    'porcelain.',
-    'porcelite',
-    'porcellanite',
-    'porcelli',
-    'porcellio',
-    'porched',
-    'porchside',
-    'porcius',
-    'porcofram',
-    'porcupined',
-    'pordage',
-    'porden',
-    'pore-canal',
     'pore-saturating',
-    'pore-scouringly',
-    'poreba',
-    'porefluids',
-    'poreless',
-    'porfert',
-    'porfiry-raskolnikov',
-    'porgera',
-    'porgh',
-    'porgramme',
-    'porgueres',
-    'poricidal',
-    'porirua',
-    'porisimetry',
-    'poritt/conservationist',
-    'porizhova',
     'porizkova',
-    'pork-barrelling',
-    'pork-borne',
-    'pork-butcher',
-    'pork-chop-shaped',
-    'pork-dripping',
-    'pork-fat',
-    'pork/human',
-    'porkenhams',
-    'porket',
-    'porkfat',
-    'porkheid',
-    'porkin',
-    'porky-pies',
-    'porkypine',
-    'porlezza',
     'porn-movie',
-    'porn-novel',
-    'porn-star',
-    'pornagraphic',
-    'porne',
-    'pornfinder',
-    'porno&rehy;graphic',
-    'porno-graphic',
-    'porno-politician',
-    'porno-star',
-    'pornocracy',
-    'pornofornocacophagomaniacal',
-    'pornograffiti',
-    'pornografie',
-    'pornographically',
-    'pornography.',
     'pornogrhapic',
-    'pornos',
-    'pornovideo',
-    'porohyropsins',
-    'porometer',
-    'porometry',
-    'poron',
-    'poropak',
-    'porosity-controlled',
-    'porosity-resistivity',
-    'porosity/permeability',
-    'porosus',
-    'porosz',
-    'porozumienie',
-    'porpentine',
-    'porphyries',
     'porphyrin-based',
-    'porphyrin-quinones',
-    'porphyroblastic',
-    'porphyry-crowned',
-    'porphyrystyle',
-    'porpoise\'',
-    'porpoise-hide',
-    'porpoised',
-    'porpoiseskin',
-    'porportional',
-    'porportions',
-    'porretta',
-    'porridge-bowls',
-    'porridge-grey',
-    'porridgecoloured',
-    'porridges',
     'porringer',
-    'porrini',
-    'porrit',
-    'porritt/environment',
-    'porritt/environmental',
-    'porro',
-    'porsche-developed',
-    'porsche-engined',
-    'porsches.',
-    'porschke',
-    'porsgrunn',
-    'porsild',
-    'porson',
-    'porstner',
-    'port&eacute;g&eacute;s',
-    'port&rehy;based',
     'port-bibbing',
-    'port-bou',
-    'port-built',
-    'port-city',
-    'port-coton',
-    'port-d\'envaux',
-    'port-donant',
-    'port-du-salut',
-    'port-folio',
-    'port-like',
-    'port-na-blagh',
-    'port-neuf',
-    'port-purple-nosed',
-    'port-tippling',
-    'port-town',
-    'port-vieux',
     'porta-',
-    'porta-cabins',
-    'portable-oriented',
-    'portable/mobile',
-    'portacraig',
-    'portadown-based',
-    'portadowne',
-    'portaflex',
-    'portage-la-prairie',
-    'portagil',
-    'portaging',
-    'portail',
-    'portales',
-    'portallach',
-    'portamenti',
-    'portaphones',
     'portarlington',
-    'portas',
-    'portastumps',
-    'portative',
-    'portato',
-    'portayed',
-    'portbello',
-    'porte-fen&ecirc;tre',
-    'porte-knapsack',
-    'portefeuille',
-    'porteman',
-    'portending',
-    'porteniel',
-    'portentum',
-    'porter-and-gardener',
-    'porter-brewing',
     'porter-cum-chauffeur',
-    'porter-it',
-    'porter-type',
-    'porter/cleaner',
-    'porter/landlord',
-    'porter/messenger',
-    'porter/messengers',
-    'porter/trauma',
-    'porterfied',
-    'portessie',
-    'porteswell',
-    'porteverde',
-    'portevin',
-    'portfires',
-    'portfolio-management',
-    'portfolios.',
     'portgues',
-    'portguese',
-    'porth-y-rhaw',
-    'porthau',
-    'porthault',
-    'porthkerry',
-    'porthmelgan',
-    'porthneal',
-    'porthole-like',
-    'porthor',
-    'porthpean',
-    'porthreath',
-    'porthscatho',
-    'porti&egrave;re',
-    'porticada',
-    'portico-affair',
     'portico-front',
-    'portier',
-    'portinari',
-    'portingale',
-    'portion-sized',
-    'portion/dose',
-    'portioning',
-    'portlights',
-    'portmahan',
-    'portman-stuart',
-    'portmanmoor',
-    'portmanteaus',
-    'portmantle',
-    'portmouth',
-    'portney',
-    'portnov',
     'portobras',
-    'portocarrero',
-    'portocaval',
-    'portohealth',
-    'porton-diet',
-    'portoroz',
-    'portostudios',
-    'portquin',
-    'portra',
-    'portrait-busts',
-    'portrait-head',
-    'portrait-hung',
-    'portrait-like',
-    'portrait-mode',
-    'portrait-necked',
-    'portrait-photograph',
     'portrait-sculpture',
-    'portrait-sized',
-    'portrats',
-    'portree/dunvegan',
-    'portreeve',
-    'portreeves',
-    'ports-crues',
-    'ports-de-voix',
-    'portsmouth&ndash;caen',
-    'portsmouth&ndash;cardiff',
-    'portsmouth&ndash;cherbourg',
-    'portsmouth&ndash;le',
-    'portsmouth&ndash;st',
-    'portsmouth-bath',
-    'portsmouth-bristol',
-    'portsmouth-liverpool',
     'portsmouth-southampton',
-    'portsmouth1',
-    'portual',
-    'portugaise',
-    'portugal-england',
-    'portugual',
-    'portuguese-born',
-    'portuguese-language',
-    'portuguese-mediated',
-    'portuguese-style',
-    'portulaca',
-    'portulacoides',
-    'portview',
-    'portzamparc',
-    'porubjak',
-    'porud',
     'porus',
-    'porush',
-    'porzner',
-    'pos&eacute;e',
-    'pos&eacute;s',
-    'pos&rehy;itions',
-    'posait',
-    'posalaky',
-    'posc-compliant',
-    'posch',
-    'poscharskyana',
-    'poseiden',
-    'poselenie',
-    'posess',
-    'posessed',
-    'posessing',
     'poset',
-    'posh-looking',
-    'poshall',
-    'poshed',
-    'poshness',
-    'posho',
-    'poshpura',
-    'poshy',
-    'posi-sisters',
-    'posibilidad',
-    'posid.',
-    'posidolius',
-    'posidonus',
-    'posidoriius',
-    'posidotuus',
-    'posidriv-type',
     'posidrive',
-    'posie',
-    'posies/soon',
-    'posimani',
-    'posing-pouch',
-    'posish',
-    'posishun',
-    'posit-',
-    'posited.',
-    'positi',
-    'position-effects',
-    'position-finding',
-    'position-integration',
-    'position-on-host',
-    'position-papers',
-    'position-sensitive',
     'position-statements',
-    'position-taking',
-    'position-to',
-    'position-wise',
-    'position.1',
-    'position.push',
-    'position/',
-    'position/marking',
-    'position=',
-    'position=12.5',
-    'positionalities',
-    'positionality',
-    'positions.',
-    'positive&pound',
-    'positive\'/',
-    'positive-',
     'positive-as',
-    'positive-but-need-to-be-paid-for-it',
-    'positive-charge',
-    'positive-g',
-    'positive-npv',
-    'positive-rated',
-    'positive-thinking',
-    'positive-voltage',
-    'positive-working',
-    'positive/favourable',
-    'positiveassociation',
-    'positively-aggressive',
-    'positively.',
-    'positively/negatively',
-    'positivist-type',
-    'positivity/negativity',
     'posito',
-    'positon',
-    'positons',
-    'positronic',
-    'posits.',
-    'positus',
-    'posiutive',
-    'posix-compliant/x',
-    'posix.1',
-    'posix.2',
-    'poski',
-    'posl&mdash;luxembourg',
-    'posle',
-    'posledgol',
-    'poslethwaite',
-    'posnan',
     'posol\'skii',
-    'poss.',
-    'possbily',
-    'possed',
-    'possente',
-    'posseses',
-    'possess/express',
-    'possessable',
-    'possesser',
-    'possession&mdash;but',
-    'possession-\'here\'',
-    'possession-oriented',
-    'possession/brings',
-    'possession/non-possession',
-    'possessionem',
-    'possessioner',
     'possessiones',
-    'possessive/unreasonable',
-    'posseting',
-    'possi',
-    'possibe',
-    'possibil',
-    'possibili',
-    'possibilit&eacute',
-    'possibility.',
-    'possible-closure',
-    'possible.16',
-    'possible.for',
-    'possible.the',
-    'possible/reasonable',
-    'possible_as',
-    'possiblesee',
     'possiblily',
-    'possiblities',
-    'possibly-aids',
-    'possibly_nearer',
-    'possidet',
-    'possl',
-    'possom',
-    'possossona',
-    'posssible',
-    'posssibly',
-    'possum/robots',
-    'post&mdash;four',
-    'post&mdash;moulay',
-    'post&ndash;1923',
-    'post&ndash;1945',
-    'post&ndash;1959',
     'post&ndash;herpetic',
-    'post&rehy;1960s',
-    'post&rehy;1990s',
-    'post&rehy;althusserian',
-    'post&rehy;holder',
-    'post&rehy;interactionist',
-    'post&rehy;liberal',
-    'post&rehy;liberation',
-    'post&rehy;partition',
-    'post&rehy;plowden',
-    'post&rehy;prandial',
-    'post&rehy;restoration',
-    'post&rehy;resurrection',
-    'post&rehy;retired',
-    'post&rehy;techno',
-    'post&uacute;mus',
     'post-\'87',
-    'post-\'88',
-    'post-.registration',
-    'post-1',
-    'post-1290',
-    'post-14',
-    'post-1511',
-    'post-1540',
-    'post-1688',
-    'post-1689',
-    'post-1823',
-    'post-1831',
-    'post-1857',
-    'post-1861',
-    'post-1873',
-    'post-1881',
     'post-19',
-    'post-1906',
-    'post-1929',
-    'post-1930',
-    'post-1937',
-    'post-1947',
-    'post-1948',
-    'post-1949',
-    'post-1951',
-    'post-1954',
-    'post-1955',
-    'post-1957',
-    'post-1962',
-    'post-1965',
-    'post-1972',
-    'post-1973',
     'post-1980s',
-    'post-1983',
-    'post-1986',
-    'post-1994',
-    'post-20s',
-    'post-50',
-    'post-60/65',
-    'post-60s',
-    'post-9pm',
-    'post-absorptive',
-    'post-accreditation',
-    'post-acid',
-    'post-acquisitions',
-    'post-acting',
-    'post-ad',
-    'post-adam',
     'post-adaptation',
-    'post-aden',
-    'post-adoption',
-    'post-aero',
-    'post-agreement',
-    'post-albert',
-    'post-alcoholic',
-    'post-allende',
-    'post-almost',
-    'post-alportian',
-    'post-alternative',
-    'post-althusserian',
-    'post-anaesthetic',
-    'post-analytic',
-    'post-and-beam',
-    'post-and-wire',
     'post-annexation',
-    'post-anorexic',
-    'post-apocalypse',
-    'post-application',
-    'post-artemidorian',
-    'post-artisan',
-    'post-arusha',
-    'post-ascension',
-    'post-aspects',
-    'post-auditor',
-    'post-audits',
-    'post-auschwitz',
-    'post-authorisation',
-    'post-babel',
-    'post-backed',
-    'post-bag',
     'post-baggy',
-    'post-bains',
-    'post-band',
-    'post-bank',
-    'post-barrage',
-    'post-barthes',
-    'post-barthian',
-    'post-basic/in-service',
-    'post-beatles',
-    'post-bedan',
-    'post-bennett',
-    'post-bergsonian',
-    'post-berlin',
-    'post-beveridge',
-    'post-bi-polar',
-    'post-bid',
     'post-birth',
-    'post-bismarckian',
-    'post-black',
-    'post-blacklist',
-    'post-bloomfieldian',
-    'post-board',
-    'post-boer',
-    'post-bowie',
-    'post-boys',
-    'post-breakfast',
-    'post-brechtian',
-    'post-broadcast',
-    'post-bullock',
-    'post-burdigalian',
-    'post-burial',
-    'post-cabaret',
     'post-caledonian',
-    'post-calvino',
-    'post-cardiac',
-    'post-carriage',
-    'post-castration',
-    'post-cbs',
-    'post-ceasefire',
-    'post-ceausescu',
-    'post-championship',
-    'post-chapel',
-    'post-chapman',
-    'post-charter',
-    'post-cheta',
-    'post-child',
-    'post-cholecystectomy',
-    'post-civil-war',
     'post-clavichord',
-    'post-clerk',
-    'post-climax',
-    'post-club',
-    'post-coach',
-    'post-cockcroft',
-    'post-cocktails',
-    'post-coded',
-    'post-collisional',
-    'post-combat',
-    'post-comintern',
-    'post-committal',
-    'post-common',
-    'post-communism',
-    'post-computer',
-    'post-conceptualists',
     'post-concert',
-    'post-condom',
-    'post-confederation',
-    'post-confucian',
-    'post-congress',
-    'post-consolidation',
-    'post-contact',
-    'post-contract',
-    'post-contractual',
-    'post-coronation',
-    'post-cortot',
-    'post-count',
-    'post-cranial',
-    'post-cretaceous',
-    'post-curfew',
-    'post-custody',
     'post-cut',
-    'post-cyclical',
-    'post-dance',
-    'post-dawn',
-    'post-decadent',
-    'post-degree',
-    'post-demonstration',
-    'post-dependency',
-    'post-deregulation',
-    'post-dinosaur',
-    'post-disaster',
-    'post-discharge',
-    'post-dive',
-    'post-dividend',
-    'post-doc',
-    'post-dope',
     'post-drought',
-    'post-dubbing',
-    'post-dubcek',
-    'post-duopoly',
-    'post-e',
-    'post-ecsc',
-    'post-editing',
-    'post-edwardians',
-    'post-ellis-beto',
-    'post-emergence',
-    'post-empire',
-    'post-environments',
-    'post-evaluation',
-    'post-evaluative',
-    'post-evangelistic',
-    'post-exam',
     'post-excitation',
-    'post-experienced',
-    'post-exposure',
-    'post-extension',
-    'post-fade',
-    'post-fair',
-    'post-family',
-    'post-fce',
-    'post-festival',
-    'post-filter',
-    'post-financial',
-    'post-finniston',
-    'post-fisher',
-    'post-flash',
-    'post-float',
-    'post-flu',
     'post-foaling',
-    'post-formalist',
-    'post-forum',
-    'post-franchise',
-    'post-freudians',
-    'post-fucking-impressionists',
-    'post-fulton',
-    'post-galilean',
-    'post-gary',
-    'post-gay',
-    'post-gazza',
-    'post-generation',
-    'post-generative',
-    'post-gittins',
-    'post-gladstonian',
-    'post-glc',
     'post-goal',
-    'post-gonococcal',
-    'post-gorbachev',
-    'post-gracchan',
-    'post-grad',
-    'post-graduation',
-    'post-gramscian',
-    'post-grand',
-    'post-greatness',
-    'post-gulf-war',
-    'post-gymnastic',
-    'post-h&uuml;sker-d&uuml',
-    'post-hadow',
-    'post-hadrianic',
-    'post-hardcore',
-    'post-hassler',
     'post-healing',
-    'post-hearing',
-    'post-heart',
-    'post-heparin',
-    'post-hercynian',
-    'post-higher',
-    'post-hillsborough',
-    'post-hippie',
-    'post-hippy',
-    'post-history',
-    'post-hitchcock',
-    'post-hnd',
-    'post-hogmanay',
-    'post-hollands',
-    'post-homeric',
-    'post-howl',
     'post-hunt',
-    'post-hunting',
-    'post-hurricane',
-    'post-hypnotic',
-    'post-ice',
-    'post-ideological',
-    'post-imperialist',
-    'post-imprisonment',
-    'post-incident',
-    'post-incident-trauma',
-    'post-inflammatory',
-    'post-inflation',
-    'post-information-technology',
-    'post-input',
-    'post-inspection',
-    'post-instructional',
     'post-interviews',
-    'post-invasion',
-    'post-inversion',
-    'post-iron',
-    'post-irrigation',
-    'post-isaac',
-    'post-isms',
-    'post-johnsonian',
-    'post-josquin',
-    'post-judgment',
-    'post-jungian',
-    'post-kennedy',
-    'post-kennedy-johnson',
-    'post-khomeini',
-    'post-khrushchevian',
-    'post-kinnock',
     'post-kleisthenic',
-    'post-landing',
-    'post-larvae',
-    'post-lateran',
-    'post-launch',
-    'post-lawson',
-    'post-legislative',
-    'post-leonardo',
-    'post-lettrist',
-    'post-liberalisation',
-    'post-lights',
-    'post-liminal',
-    'post-lingual',
-    'post-literacy',
-    'post-literate',
-    'post-lndustrial',
     'post-load',
-    'post-lofthouse',
-    'post-louis',
-    'post-maastrict',
-    'post-macbride',
-    'post-madchester',
-    'post-magyar',
-    'post-mainframe',
-    'post-making',
-    'post-marcos',
-    'post-marital',
-    'post-marital-divorced',
-    'post-mark',
-    'post-martyrdom',
-    'post-marxism',
-    'post-marxists',
     'post-maternity',
-    'post-matt',
-    'post-matted',
-    'post-mature',
-    'post-may',
-    'post-meech',
-    'post-messina',
-    'post-metanarrative',
-    'post-mi',
-    'post-mickey',
-    'post-miss',
-    'post-missile',
-    'post-mistress',
-    'post-modalism',
-    'post-modernish',
-    'post-modernism/post-modernization',
     'post-modernistic',
-    'post-modernity',
-    'post-modifier',
-    'post-modifiers',
-    'post-monarchical',
-    'post-monetarism',
-    'post-monsoon',
-    'post-montague',
-    'post-morphia',
-    'post-morrissey/marr/smiths',
-    'post-mortal',
-    'post-morteming',
-    'post-mortemm',
-    'post-morten',
-    'post-move',
-    'post-msc',
     'post-myocardial-infarction',
-    'post-n&uuml;rburgring',
-    'post-nab',
-    'post-nasal',
-    'post-national',
-    'post-nationalization',
-    'post-nazi',
-    'post-neck',
-    'post-newsnight',
-    'post-newtonianism',
-    'post-nine',
-    'post-nominal',
-    'post-nominally',
-    'post-normalization',
-    'post-normalize',
-    'post-obits',
     'post-obituary',
-    'post-occupational',
-    'post-offices',
-    'post-opec',
-    'post-operation',
-    'post-oscar',
-    'post-otic',
-    'post-oxford',
-    'post-pace',
-    'post-paganini',
-    'post-panto',
-    'post-parkhead',
-    'post-parturient',
-    'post-parturition',
-    'post-parturitive',
-    'post-party',
     'post-partying',
-    'post-pasta',
-    'post-peak',
-    'post-pepper',
-    'post-periclean',
-    'post-permian',
-    'post-peter',
-    'post-petrine',
-    'post-pharyngeal',
-    'post-philosophical',
-    'post-phylloxera',
-    'post-picnic',
-    'post-pilgrimage',
-    'post-pioneer',
-    'post-plaza',
-    'post-pnp',
     'post-police',
-    'post-polio',
-    'post-political',
-    'post-poll',
-    'post-polling',
-    'post-positivism',
-    'post-positivist',
-    'post-postcard',
-    'post-postructuralist',
-    'post-potation',
-    'post-premiere',
-    'post-present',
-    'post-produce',
-    'post-protection',
-    'post-puberty',
-    'post-pubescent',
     'post-puerperal',
-    'post-python',
-    'post-rada',
-    'post-randomisation',
-    'post-reading',
-    'post-reception',
-    'post-receptor',
-    'post-receptoral',
-    'post-recruit',
-    'post-reflex',
-    'post-religious',
-    'post-reorganization',
-    'post-reperfusion',
-    'post-resignation',
-    'post-results',
-    'post-retinal',
     'post-ricardian',
-    'post-rift',
-    'post-rio',
-    'post-rock',
-    'post-rodney',
-    'post-safari',
-    'post-sales',
-    'post-scan',
-    'post-scarcity',
-    'post-schoenbergian',
-    'post-seebohm',
-    'post-selection',
-    'post-seminar',
-    'post-sentence',
-    'post-serial',
-    'post-sharing',
     'post-shipbuilding',
-    'post-shipment',
-    'post-sixteenth-century',
-    'post-sixties',
-    'post-sizewell',
-    'post-slavery',
-    'post-smiths',
-    'post-socialist',
-    'post-somerville',
-    'post-speranskii',
-    'post-splenectomy',
-    'post-stalingrad',
-    'post-stall',
-    'post-station',
-    'post-steam',
-    'post-storage',
     'post-strike',
-    'post-structuralisms',
-    'post-structurally',
-    'post-stude',
-    'post-studio',
-    'post-suez',
-    'post-summer-oh-my-god&rehy;how-can-i-afford-christmas',
-    'post-superior',
-    'post-surgery',
-    'post-surrender',
-    'post-syllabic',
-    'post-synchronised',
-    'post-takeover',
-    'post-tang',
-    'post-taxation',
-    'post-tea',
     'post-teen',
-    'post-teenage',
-    'post-telecoms',
-    'post-tensioned',
-    'post-testing\'',
-    'post-tetanus',
-    'post-the',
-    'post-theatre',
-    'post-therapy',
-    'post-thirty',
-    'post-this',
-    'post-thrash',
-    'post-tmi',
-    'post-tokyo',
-    'post-tonal',
-    'post-top',
     'post-tragedy',
-    'post-training',
-    'post-transfusion',
-    'post-transition',
-    'post-transplant',
-    'post-transplantation',
-    'post-treaty',
-    'post-tribal',
-    'post-tunnel',
-    'post-tv',
-    'post-two',
-    'post-unced',
-    'post-union',
-    'post-university',
-    'post-urban',
-    'post-variscan',
     'post-vedic',
-    'post-velvet',
-    'post-velvets',
-    'post-vert',
-    'post-vichy',
-    'post-victory',
-    'post-vietnam',
-    'post-viral',
-    'post-wales',
-    'post-wall',
-    'post-warhol',
-    'post-warnock',
-    'post-wartime',
-    'post-wayne',
-    'post-wear',
-    'post-wedding',
     'post-wembley',
-    'post-westland',
-    'post-westphalian',
-    'post-whitby',
-    'post-widdicombe',
-    'post-wilkinson',
-    'post-wimbledon',
-    'post-withdrawal',
-    'post-woman',
-    'post-wordsworthian',
-    'post-workout',
-    'post-x',
-    'post-yuppiedom',
-    'post-zechstein',
-    'post-zoroastrian',
-    'post/',
     'post/crossbar',
-    'post/etc',
-    'post/modernists',
-    'post/pupil',
-    'post/thread',
-    'post_for',
-    'post_free',
-    'post_meridiem',
-    'postabank',
-    'postage-stamp-sized',
-    'postages',
-    'postal-addresses',
-    'postalisation',
-    'postally',
-    'postalm',
-    'postans',
     'postavaro',
-    'postbags',
-    'postbellum',
-    'postboy',
-    'postboys',
-    'postcaecal',
-    'postcard-',
-    'postcard-pretty',
-    'postcard-seller',
-    'postcard-size',
-    'postcard-writing',
-    'postcard.',
-    'postcardware',
-    'postcecal',
-    'postchaise',
-    'postcheques',
     'postcholecystectomy',
-    'postclypeus',
-    'postcoding',
-    'postcolectomy',
-    'postcolonial',
-    'postcommunist',
-    'postcopular',
-    'postcoxal',
-    'postcranial-cranial',
-    'postcranially',
-    'postcript',
-    'postdeconstruction',
-    'postdoc',
-    'postdoctor',
-    'postdoctorals',
-    'poste-haste',
     'poste-restante',
-    'postecdysial',
-    'postech',
-    'posted-value',
-    'postembryonically',
-    'postencephalitic',
-    'postendoscopy',
-    'postepowa',
-    'poster-blue',
-    'poster-design',
-    'poster-format',
-    'poster-like',
-    'poster-mags',
-    'poster-making',
-    'poster-opportunities',
-    'poster-opportunity',
     'poster-paint',
-    'poster/leaflet',
-    'posterers',
-    'posterial',
-    'postering',
-    'posterior(cu1b)',
-    'posterior-ventral',
-    'posteriori',
-    'posteriority',
-    'posteriorized',
-    'posteriorizing',
-    'posteritati',
-    'posterman',
-    'posterns',
-    'postero-dorsal',
-    'postero-lateral',
     'posteroanterior',
-    'posterolateral',
-    'posters/cards',
-    'posters/pictures/charts',
-    'postes',
-    'postexperience',
-    'postfeminism',
-    'postfixation',
-    'postgem',
-    'postgena',
-    'postgrad.',
-    'postgres',
-    'posthaemorrhagic',
-    'posthepatitis',
-    'posthill',
-    'posthuman',
     'posthumously-published',
-    'posthumously-released',
-    'posthybridisation',
-    'posties',
-    'postillion',
-    'postinfective',
-    'postinfluenza',
-    'posting-horses',
-    'posting.',
-    'postings.',
-    'postinterpretive',
-    'postions',
-    'postipankki',
-    'postition.',
-    'postkinematic',
-    'postlaunch',
     'postles',
-    'postlethwaite/father',
-    'postlewhite',
-    'postman-poet',
-    'postman/',
-    'postmanship',
-    'postmaster-husband',
-    'postmasters-general',
-    'postmatch',
-    'postmaturity',
-    'postmenopause',
-    'postmistresses',
-    'postmitotic',
-    'postmo',
-    'postmodern-type',
-    'postmodern.',
     'postmodification',
-    'postmortem-s',
-    'postmr.',
-    'postmultiplications',
-    'postmultipliers',
-    'postnuclear',
-    'posto',
-    'postocciput',
-    'postoesophageal',
-    'poston',
-    'postorbital',
-    'postorogenic',
-    'postostial',
-    'postparty',
-    'postperm',
-    'postpharyngeal',
     'postphragmata',
-    'postponable',
-    'postponement&mdash;announced',
-    'postponement.',
-    'postprandia',
-    'postprantial',
-    'postprimary',
-    'postpubertal',
-    'postqualification',
-    'postqualifying',
-    'postregistration',
-    'postreplicative',
-    'postrift',
-    'postroad',
-    'posts-in',
-    'postsaver',
     'postscipt',
-    'postsclerotherapy',
-    'postscript&mdash;the',
-    'postscript-like',
-    'postscriptum',
-    'postsecondary',
-    'postseizure',
-    'postshave',
-    'postshop',
-    'poststernellum',
-    'poststructural',
-    'postsynpatic',
-    'posttreatment',
-    'postulatable',
-    'postulational',
-    'postulational&rehy;deductive',
     'posturally',
-    'posturingly',
-    'postviral',
-    'postwirt',
-    'posty',
-    'posy-style',
-    'pot&eacute;e',
-    'pot&rehy;ash',
-    'pot&rehy;boilers',
-    'pot-',
-    'pot-a-l\'oille',
-    'pot-au-chocolat',
-    'pot-boilers',
-    'pot-bound',
-    'pot-coiling',
-    'pot-decoration',
     'pot-gliadin',
-    'pot-growing',
-    'pot-head',
-    'pot-herbs',
-    'pot-holers',
-    'pot-house',
-    'pot-houses',
-    'pot-lid',
-    'pot-like',
-    'pot-making',
-    'pot-mould',
-    'pot-plant',
-    'pot-pourris',
-    'pot-scourers',
-    'pot-shapes',
-    'pot-shards',
     'pot-stew',
-    'pot-throwing',
-    'pot-up',
-    'pot-valiant',
-    'pot/vodka',
-    'pota',
-    'potable-water',
-    'potacki',
-    'potaholic',
-    'potamic',
-    'potamogetonaceae',
-    'potamos',
-    'potantial',
-    'potard',
-    'potash-feldspar',
-    'potash-rich',
     'potasse',
-    'potassic',
-    'potassium-',
-    'potassium-40',
-    'potassium-doped',
-    'potassium-promoted',
-    'potassium/argon',
-    'potat',
-    'potater',
-    'potation',
-    'potationibus',
-    'potato-beetle',
-    'potato-chip',
-    'potato-faced',
-    'potato-fritters',
-    'potato-growing',
     'potato-head',
-    'potato-lifting',
-    'potato-like',
-    'potato-peeling',
-    'potato-pickers',
-    'potato-planting',
-    'potato-sacks',
-    'potato-shaped',
-    'potato-starch',
-    'potato-storage',
-    'potato-topped',
-    'potatoes-in-a-bag',
-    'potatoes.',
-    'potatoes.ask',
-    'potatoes/apple',
-    'potatoey',
     'potatoprinted',
-    'potbanks',
-    'potboiling',
-    'potbound',
-    'potdukhe',
-    'pote',
-    'potebenko',
-    'poteidaia',
-    'potel',
-    'potell',
-    'poten',
-    'potence',
-    'potency/',
-    'potensac',
-    'potential.m.b',
-    'potentialiser',
     'potentially-damaging',
-    'potentially-fatal',
-    'potentially-in',
-    'potentially-nasty',
-    'potentially-toxic',
-    'potentially-useful',
-    'potentiating/constraining',
-    'potentillae',
-    'potention',
-    'potentising',
-    'potentium',
-    'potenz',
-    'potenzas',
-    'poter',
-    'poter-mo-get-on',
-    'poterba',
     'poterie',
-    'poteris',
-    'potes',
-    'potfuls',
-    'potger',
-    'potgieter',
-    'potgrown',
-    'pothe',
-    'pothered',
-    'pothinus',
-    'potholder',
-    'potholders',
-    'potidas',
-    'potiemkin',
-    'potilla',
-    'potingaris',
     'potiniere',
-    'potion\'',
-    'potion-making',
-    'potion-stained',
-    'potior',
-    'potist',
-    'potkins',
-    'potless',
-    'poto',
-    'potocki',
-    'potoiler',
-    'poton',
-    'potong-gang',
-    'potoroo',
-    'pototskaya',
-    'potperson',
     'potremmo',
-    'potros',
-    'potrush',
-    'potscourers',
-    'potsful',
-    'potsherd',
-    'pottages',
-    'pottall',
-    'pottaugh',
-    'potter-elvehjem',
-    'potter-mog-get-on',
-    'potter-painter',
-    'potter.this',
-    'potter/3',
-    'potter/workshop',
-    'potterers',
     'potterish',
-    'potterne',
-    'potters-ballotini',
-    'pottery-fragments',
-    'pottery-series',
-    'pottery-styles',
-    'pottery/ceramics',
-    'pottie',
-    'pottiez',
-    'pottiness',
-    'potting-shed',
-    'pottisham',
-    'pottled',
-    'potts/barclaycard',
-    'potts/mother',
-    'potts/tourism',
     'pottstown',
-    'pottu',
-    'pottuvil',
-    'potupa',
-    'pou-hd',
-    'pou-spp',
-    'poubelle',
-    'poublic',
-    'poucet',
-    'pouch-carrying',
-    'pouch-lining',
-    'pouch-vaginal',
-    'pouchanal',
-    'poucher',
-    'pouchet',
-    'poucheti',
     'pouchong',
-    'poucnessh',
-    'poudr&eacute',
-    'poudyal',
-    'pouer',
-    'pouff&eacute',
-    'pouffela',
-    'pougy',
-    'pouilly-fum&eacute',
-    'pouilly-fume',
-    'poujade',
-    'pouket',
-    'poul-erik',
-    'poulantaz',
-    'poulard',
-    'poulation',
     'poules-canards',
-    'poulevara',
-    'poulidor',
-    'poulin-le',
-    'poullada',
-    'poulnabrone',
-    'poulpes',
-    'poulsenia',
-    'poulsom',
-    'poulssen',
-    'poulticed',
-    'poulton/base',
-    'poulton/regional',
-    'poultries',
-    'poultry-keeping',
-    'poultry-laying',
     'poultry-pens',
-    'poults',
-    'poulty',
-    'poumon',
-    'pounas',
-    'pounce-box',
-    'pounce.',
-    'pouncers',
-    'pound\'s-worth',
-    'pound-cake',
-    'pound-eliot',
-    'pound-the-man',
-    'pound-the-poet',
-    'pound.',
-    'pound/',
-    'pound/british',
     'pound/joyce',
-    'poundas',
-    'poundbury',
-    'poundes',
-    'poundiana',
-    'poundings',
-    'poundisford',
-    'poundless',
-    'poundlocks',
-    'pounds.',
-    'pounds.and',
-    'pounds.for',
-    'pounds/6.5kg',
-    'poundsavers',
-    'poundstock',
-    'poundsw',
     'poundswick',
-    'poup&eacute;e',
-    'poup&eacute;es',
-    'pourboire',
-    'pourbus',
-    'poured-concrete',
-    'poured-himself',
-    'pourers',
-    'pourfarrokh',
-    'pourfarrokh/philip',
-    'pouring-cream',
-    'pourous',
-    'pourparlers',
-    'pourrais',
-    'pourrir',
-    'pourshoja',
     'pourtalet',
-    'pourtant',
-    'pourtrayed',
-    'poury',
-    'pous',
-    'pousette',
-    'pouss&eacute;s',
-    'pousse',
-    'poussepin',
-    'poussette',
-    'poussi&eacute;reuse',
-    'poussiere',
-    'poussou',
-    'pout-lipped',
-    'pouter-pigeon',
-    'poutily',
     'pouvait',
-    'povero',
-    'poverte',
-    'poverty&rehy;stricken',
-    'poverty-',
-    'poverty-environment',
-    'poverty-induced',
-    'poverty-level',
-    'poverty-prayers',
-    'poverty-striken',
-    'poverty-trap',
-    'poverty.2',
-    'povidone',
-    'povilas',
-    'povre',
-    'pow-mia',
     'pow-wowing',
-    'pow-wows',
-    'pow/milton',
-    'powakaddy',
-    'powan',
-    'powar',
-    'powda',
-    'powder-coating',
-    'powder-covered',
-    'powder-flask',
-    'powder-form',
-    'powder-kegs',
-    'powder-magazine',
-    'powder-mill',
-    'powder-trail',
-    'powder-train',
     'powder-white',
-    'powder-whitened',
-    'powder.',
-    'powdered-down',
-    'powderhounds',
-    'powderiness',
-    'powderized',
-    'powdermaker',
-    'powderpuff',
-    'powderpuffs',
-    'powdery-grey',
-    'powdrill',
-    'powefully',
-    'powell&ndash;bryce',
-    'powell-',
-    'powell-jones',
     'powell-pressburger',
-    'powell/',
-    'powell/ashchurch',
-    'powell/avebury',
-    'powell/berkeley/gloucestershire',
-    'powell/bristol',
-    'powell/cirencester',
-    'powell/disabled',
-    'powell/faringdon',
-    'powell/farmer',
-    'powell/friend',
-    'powell/hankerton',
-    'powell/london',
-    'powell/lydiard',
-    'powell/lydney',
-    'powell/m4',
     'powell/ministry',
-    'powell/netheravon',
-    'powell/newent',
-    'powell/newtown',
-    'powell/northampton',
-    'powell/oxford',
-    'powell/piano',
-    'powell/project',
-    'powell/purton',
-    'powell/river',
-    'powell/sevenhampton',
-    'powell/stanford',
-    'powell/tetbury',
-    'powell/wembley',
-    'powell/woodmancote',
-    'powellii',
     'powellite',
-    'powellweg',
-    'power&mdash;see',
-    'power&mdash;stalin',
-    'power&ndash',
-    'power&rehy;assisted',
-    'power&rehy;filly',
-    'power&rehy;folding',
-    'power&rehy;it',
-    'power&rehy;maximizing',
-    'power&rehy;target',
-    'power-',
-    'power-&eacute;lite',
-    'power-assertive',
-    'power-axes',
-    'power-ballad',
     'power-bases',
-    'power-basic',
-    'power-behavioral',
-    'power-blocs',
-    'power-boating',
-    'power-body',
-    'power-booster',
-    'power-boosting',
-    'power-centre',
-    'power-chordal',
-    'power-coated',
-    'power-conductor',
-    'power-consuming',
-    'power-containers',
-    'power-crazy',
-    'power-cruisers',
     'power-dependency',
-    'power-diffraction',
-    'power-dresser',
-    'power-duct',
-    'power-elite',
-    'power-enabling',
-    'power-engineering',
-    'power-fantasy',
-    'power-fist',
-    'power-fit',
-    'power-force',
-    'power-free',
-    'power-from-tyre',
-    'power-fucking',
-    'power-game',
-    'power-games',
     'power-gas',
-    'power-gigs',
-    'power-giving',
-    'power-grab',
-    'power-groups',
-    'power-had',
-    'power-hammers',
-    'power-happy',
-    'power-heads',
-    'power-in',
-    'power-input',
-    'power-kick',
-    'power-laden',
-    'power-law/poisson',
-    'power-lift',
-    'power-loaded',
     'power-manipulators',
-    'power-maximizers',
-    'power-of-two',
-    'power-on/power',
-    'power-orientated',
-    'power-oriented',
-    'power-pack',
-    'power-packs',
-    'power-planers',
-    'power-points',
-    'power-pole',
-    'power-political',
-    'power-pop',
-    'power-pullers',
-    'power-punch',
-    'power-related',
     'power-resources',
-    'power-rock',
-    'power-safe',
-    'power-sapping',
-    'power-save',
-    'power-saw',
-    'power-seeking',
-    'power-shift',
-    'power-showers',
-    'power-source',
-    'power-state',
-    'power-steered',
-    'power-structure',
-    'power-struggles',
-    'power-suit',
-    'power-switches',
     'power-teaser',
-    'power-the',
-    'power-thrust',
-    'power-trike',
-    'power-tripping',
-    'power-user',
-    'power-using',
-    'power-war',
-    'power-wielding',
-    'power-wise',
-    'power-yes',
-    'power.',
-    'power/attitude',
-    'power/being',
-    'power/dtr',
-    'power/information',
     'power/institutions',
-    'power/lord',
-    'power/planning',
-    'power/powergen',
-    'power/volume',
-    'power1.tif',
-    'power2.tif',
-    'power3.tif',
-    'power4.tif',
-    'power5.tif',
-    'power6.tif',
-    'power=boosted',
-    'powerage',
-    'poweran',
-    'powerarray',
-    'powerbase/workgroup',
     'powerblasts',
-    'powerboater',
-    'powerbroking',
-    'powerbuilder-based',
-    'powercache',
-    'powercar',
-    'powerchords',
-    'powercomputing',
-    'powercote',
-    'powercrush',
-    'powerdialler',
-    'powerdriver',
-    'powerfile',
-    'powerfilters',
-    'powerflood',
-    'powerflow',
     'powerfont',
-    'powerfull',
-    'powerfulness',
-    'powerglydes',
-    'powergrip',
-    'powerholders',
-    'powerkit',
-    'powerlessness_as_well',
-    'powerlifter',
-    'powerline',
-    'powerlines',
-    'powerlink',
-    'powermanager',
-    'poweropen-powerpc',
-    'poweropen/powerpc',
-    'powerpacks',
     'powerpc/macs',
-    'powerpc/poweropen-based',
-    'powerrisc',
-    'powers&mdash',
-    'powers-dissipating',
-    'powers-ofentry',
-    'powers-sallmas',
-    'powers-that',
-    'powers.and',
-    'powers/',
-    'powers/changing',
-    'powerscreens',
-    'powersearch',
-    'powerservers',
-    'powersharers',
-    'powersharing',
     'powerslides',
-    'powersorb',
-    'powerspeed',
-    'powersystem',
-    'powertrack',
-    'powerup',
-    'powerview',
-    'powerwindows',
-    'powesland',
-    'powhattan',
-    'powick/worcestershire',
-    'powler',
-    'powning',
-    'powqerful',
-    'powrie',
-    'powte',
     'powtes',
-    'powting',
-    'powton',
-    'powys/county',
-    'pox-factory',
-    'poxe',
-    'poxwell',
-    'poxy-face',
-    'poyentyng',
-    'poyer',
-    'poyles',
-    'poyning',
-    'poynings',
-    'poynter.',
-    'poyntington',
-    'poynton/team',
     'poysden',
-    'poyton',
-    'pozemni',
-    'pozerski',
-    'pozi&egrave;res-foucaucourt',
-    'pozidriv/',
-    'pozidriv/supadriv',
-    'poznanski',
-    'pozner',
-    'pozza',
-    'pozzoferrato',
-    'pp&mdash;popular',
-    'pp*',
-    'pp-21',
-    'pp-9',
-    'pp-mos',
     'pp-sdp-pa',
-    'pp.1&ndash;112',
-    'pp.1,2',
-    'pp.10&ndash;11',
-    'pp.101&ndash;5',
-    'pp.102&ndash;103',
-    'pp.103&ndash;104',
-    'pp.104&ndash;5',
-    'pp.104&ndash;6',
-    'pp.105',
-    'pp.106&ndash;14',
-    'pp.106&ndash;7',
-    'pp.107',
-    'pp.11&ndash;12',
-    'pp.111',
-    'pp.112&ndash;13',
     'pp.113&ndash;15',
-    'pp.115&ndash;16',
-    'pp.116&ndash;17',
-    'pp.117&ndash;19',
-    'pp.1177&ndash;1178',
-    'pp.118&ndash;21',
-    'pp.12&ndash;24',
-    'pp.120&ndash;1',
-    'pp.123&ndash;4',
-    'pp.1234&ndash;9',
-    'pp.124',
-    'pp.126&ndash;30',
-    'pp.126&ndash;7',
-    'pp.127&ndash;9',
-    'pp.13',
-    'pp.13&ndash;14',
     'pp.131&ndash;2',
-    'pp.132&ndash;154',
-    'pp.135&ndash;136',
-    'pp.136&ndash;7',
-    'pp.14',
-    'pp.140&ndash;53',
-    'pp.140&ndash;6',
-    'pp.145&ndash;7',
-    'pp.146&ndash;7',
-    'pp.151',
-    'pp.152&mdash;3',
-    'pp.153&ndash;6',
-    'pp.153&ndash;60',
-    'pp.156&ndash;7',
-    'pp.158&ndash;9',
-    'pp.159&ndash;60',
     'pp.159&ndash;63',
-    'pp.16&ndash;18',
-    'pp.16&ndash;36',
-    'pp.16-',
-    'pp.160&ndash;2',
-    'pp.162&ndash;3',
-    'pp.165&ndash;7',
-    'pp.167',
-    'pp.169',
-    'pp.17',
-    'pp.17&ndash;19',
-    'pp.170&ndash;1',
-    'pp.170&ndash;3',
-    'pp.172&ndash;3',
-    'pp.174&ndash;5',
-    'pp.175',
     'pp.177&ndash;82',
-    'pp.178&ndash;187',
-    'pp.18&ndash;19',
-    'pp.180&ndash;6',
-    'pp.188&ndash;9',
-    'pp.19',
-    'pp.19&ndash;20',
-    'pp.19&ndash;21',
-    'pp.190&ndash;191',
-    'pp.194&ndash;200',
-    'pp.195&ndash;8',
-    'pp.197&ndash;202',
-    'pp.2&ndash;3',
-    'pp.200',
-    'pp.200&ndash;1',
-    'pp.204&ndash;234',
     'pp.204&ndash;7',
-    'pp.205&ndash;6',
-    'pp.206&ndash;10',
-    'pp.209&ndash;10',
-    'pp.21&ndash;23',
-    'pp.21&ndash;5',
-    'pp.210&ndash;12',
-    'pp.212&ndash;13',
-    'pp.214&ndash;16',
-    'pp.216&ndash;229',
-    'pp.226&ndash;9',
-    'pp.23',
-    'pp.23&ndash;4',
-    'pp.231&ndash;2',
-    'pp.233&ndash;5',
-    'pp.234&ndash;8',
     'pp.235&ndash;6',
-    'pp.24&ndash;6',
-    'pp.245&ndash;6',
-    'pp.25&ndash;6',
-    'pp.251&ndash;3',
-    'pp.258',
-    'pp.259&ndash;61',
-    'pp.26&ndash;31',
-    'pp.26&ndash;7',
-    'pp.265&ndash;73',
-    'pp.266&ndash;73',
-    'pp.27',
-    'pp.27&ndash;40',
-    'pp.272&ndash;3',
-    'pp.274&ndash;93',
-    'pp.276&ndash;7',
     'pp.28&ndash;30',
-    'pp.28&ndash;9',
-    'pp.282&ndash;308',
-    'pp.286&ndash;8',
-    'pp.29&ndash;30',
-    'pp.29&ndash;32',
-    'pp.290&ndash;1',
-    'pp.291',
-    'pp.293&ndash;329',
-    'pp.3&ndash;6',
-    'pp.30&ndash;1',
-    'pp.30&ndash;3',
-    'pp.30&ndash;34',
-    'pp.30-31',
-    'pp.300&ndash;305',
-    'pp.31&ndash;2',
     'pp.31&ndash;9',
-    'pp.313&ndash;23',
-    'pp.32&ndash;5',
-    'pp.321&ndash;77',
-    'pp.33&ndash;41',
-    'pp.33&ndash;56',
-    'pp.334&ndash;5',
-    'pp.338&ndash;42',
-    'pp.338&ndash;9',
-    'pp.339&ndash;40',
-    'pp.34',
-    'pp.34&ndash;5',
-    'pp.340&ndash;1',
-    'pp.342&ndash;58',
-    'pp.34460-62',
-    'pp.345&ndash;6',
     'pp.349&ndash;50',
-    'pp.35&ndash;39',
-    'pp.35&ndash;42',
-    'pp.36&ndash;7',
-    'pp.36-',
-    'pp.36136-37',
-    'pp.363&ndash;4',
-    'pp.364&ndash;8',
-    'pp.36832',
-    'pp.37037-38',
-    'pp.37428-29',
-    'pp.37628-29',
-    'pp.37854-55',
-    'pp.37964',
-    'pp.38&ndash;44',
-    'pp.381&ndash;3',
     'pp.38164-65',
-    'pp.38212',
-    'pp.38579-80',
-    'pp.386&ndash;7',
-    'pp.39&ndash;40',
-    'pp.41',
-    'pp.41&ndash;102',
-    'pp.43&ndash;4',
-    'pp.45&ndash;64',
-    'pp.45&ndash;71',
-    'pp.45&ndash;75',
-    'pp.464',
-    'pp.47&ndash;54',
-    'pp.47&ndash;71',
-    'pp.48',
-    'pp.48&ndash;55',
     'pp.49',
-    'pp.49&ndash;50',
-    'pp.50,51',
-    'pp.509&ndash;27',
-    'pp.51&ndash;2',
-    'pp.511&ndash;13',
-    'pp.52&ndash;4',
-    'pp.521&ndash;2',
-    'pp.53&ndash;4',
-    'pp.531',
-    'pp.57&ndash;67',
-    'pp.58',
-    'pp.60&ndash;2',
-    'pp.61&ndash;2',
-    'pp.62&ndash;4',
-    'pp.63',
     'pp.63&ndash;7',
-    'pp.65&ndash;6',
-    'pp.65&ndash;66',
-    'pp.67&ndash;72',
-    'pp.67&ndash;8',
-    'pp.68',
-    'pp.68&ndash;9',
-    'pp.7-8',
-    'pp.70',
-    'pp.71',
-    'pp.731&ndash;4',
-    'pp.74&ndash;5',
-    'pp.74&ndash;9',
-    'pp.76&ndash;80',
-    'pp.76&ndash;82',
-    'pp.77',
     'pp.77&ndash;80',
-    'pp.79&ndash;80',
-    'pp.8&ndash;10',
-    'pp.86&ndash;89',
-    'pp.88&ndash;115',
-    'pp.9&ndash;10',
-    'pp.91',
-    'pp.92&ndash;5',
-    'pp.94&ndash;5',
-    'pp.941&ndash;53',
-    'pp.95&ndash;126',
-    'pp.96',
-    'pp.98&ndash;103',
-    'pp.99&ndash;104',
-    'pp.l',
-    'pp.l-8',
     'pp.rus',
-    'pp.x',
-    'pp.xii',
-    'pp.xviii',
-    'pp100&ndash;1',
-    'pp102&ndash;6',
-    'pp112',
-    'pp113&mdash;14',
-    'pp116',
-    'pp12',
-    'pp1224&mdash;1225',
-    'pp123&ndash;124',
-    'pp128',
-    'pp13&ndash;14/',
-    'pp13&ndash;39',
-    'pp131318.918.929,861',
     'pp14&mdash;15',
-    'pp143&mdash;4',
-    'pp16&ndash;17/',
-    'pp16&ndash;21/',
-    'pp163&mdash;6',
-    'pp167&mdash;8',
-    'pp17/18',
-    'pp171&mdash;172',
-    'pp18&ndash;19',
-    'pp187f&mdash;188d',
-    'pp2',
-    'pp201&ndash;11',
-    'pp22',
-    'pp300&mdash;301',
-    'pp330&mdash;1',
-    'pp347',
     'pp36&ndash;7',
-    'pp4207',
-    'pp46&mdash;8',
-    'pp466&mdash;7',
-    'pp479&mdash;80',
-    'pp482',
-    'pp503&mdash;4',
-    'pp566',
-    'pp60&ndash;64',
-    'pp656',
-    'pp687&mdash;688',
-    'pp69',
-    'pp70',
-    'pp70&mdash;71',
-    'pp78&mdash;9',
-    'pp79-92',
     'pp8&ndash;13',
-    'pp8&ndash;18',
-    'pp82&ndash;4',
-    'pp844h',
-    'pp86&ndash;8/',
-    'pp86&ndash;92',
-    'pp9',
-    'pp93&ndash;5',
-    'pp95&ndash;120',
-    'pp96&mdash;97',
-    'pp986',
-    'pp:i',
-    'ppa/8',
-    'ppatcr5',
-    'ppatura1',
-    'ppb.',
     'ppbv',
-    'ppcs',
-    'ppdd',
-    'ppeleides',
-    'ppence',
-    'ppenny',
-    'pperspective',
-    'ppesetas',
-    'ppfwooorr',
-    'ppg10',
-    'ppg11',
-    'ppg2',
-    'ppg4',
-    'ppg5',
-    'ppg9',
-    'ppga101',
     'pphh',
-    'pphysiological',
-    'ppint',
-    'ppl(a)',
-    'ppl(h)',
-    'ppl-flyable',
-    'ppl.',
-    'ppl/ir',
-    'pple.',
-    'pplied',
-    'pplo',
-    'ppm.4',
-    'ppn-rda',
-    'ppoa',
-    'pportion',
-    'ppos',
     'ppounds',
-    'ppp-supporting',
-    'pppl',
-    'pppm',
-    'pppsstttt',
-    'pproceed',
-    'pps&mdash;polish',
-    'pps.',
-    'ppvb',
-    'ppy',
-    'ppyarc5',
-    'ppz',
-    'pq-20',
-    'pqzt',
-    'pr&aelig;cipua',
-    'pr&eacute;cieuses',
     'pr&eacute;cis-le-sec',
-    'pr&eacute;curseur',
-    'pr&eacute;dication',
-    'pr&eacute;e',
-    'pr&eacute;liminaires',
-    'pr&eacute;mices',
-    'pr&eacute;min',
-    'pr&eacute;rogatives',
-    'pr&eacute;s',
-    'pr&eacute;sent',
-    'pr&eacute;sentation',
-    'pr&eacute;sidence',
-    'pr&eacute;sidentielle',
-    'pr&eacute;sidents',
-    'pr&eacute;tention',
-    'pr&eacute;v&ocirc;t&eacute',
     'pr&eacute;v&ocirc;t&eacute;s',
-    'pr&eacute;venir.',
-    'pr&eacute;vention',
-    'pr&eacute;vot',
-    'pr&eacute;vot&eacute;s',
-    'pr&ecirc;t',
-    'pr&egrave;ludes',
-    'pr&mdash;keep',
-    'pr&mdash;radical',
-    'pr&mdash;republican',
-    'pr&omacr;t-agonist',
-    'pr&scaron;tina',
-    'pr&uuml;fungsrecht',
-    'pr\'esent',
-    'pr-based',
-    'pr-type',
     'pr.10',
-    'pr.34',
-    'pr.xix',
-    'pr/advertising',
-    'pr/press',
-    'pr0ducts',
-    'pr100',
-    'pr15',
-    'pr7357/4',
-    'pr7463/1',
-    'pr7536/22',
-    'pr8',
-    'pr85',
-    'pr=0&middot;025',
-    'praaaaam',
-    'praak-praak',
     'prabably',
-    'prabandhak',
-    'prabang',
-    'prabhat',
-    'prabhdyal',
-    'prabucki',
-    'praby',
-    'prac&rehy;ticalities',
-    'prac&rehy;tising',
-    'pracha',
-    'prachachon',
-    'prachar',
-    'prachuabmoh',
-    'prachuabmohtransport',
-    'prachutes',
-    'prachyadavi',
     'practic',
-    'practic&rehy;able',
-    'practica',
-    'practical-based',
-    'practical-critical',
-    'practical-minded',
-    'practical.jessica',
-    'practical/operational',
-    'practical/theoretical',
-    'practicality/viability',
-    'practically-based',
-    'practically-embedded',
-    'practically-focused',
-    'practically-minded',
-    'practice&mdash;eg',
-    'practice&mdash;the',
     'practice&mdash;with',
-    'practice-friendly',
-    'practice-ground',
-    'practice-orientated',
-    'practice-oriented',
-    'practice-related',
-    'practice-room',
-    'practice.',
-    'practice/central',
-    'practice/commentary',
-    'practice/learning',
-    'practice/small',
-    'practices/breakdown',
-    'practices/flexibility',
-    'practicising',
-    'practicke',
     'practico',
-    'practioner',
-    'practioniers',
-    'practique',
-    'practise(s)',
-    'practised.among',
-    'practisin\'',
-    'practisyng',
-    'practitioner-based',
-    'practitioner-researcher',
-    'practitioner-researchers',
-    'practitioner/manager',
-    'practitioners-who',
-    'practitioners/medical',
-    'practitoners',
-    'practiucal',
     'practlce',
-    'prad',
-    'pradeep',
-    'pradel',
-    'pradena',
-    'pradesh-bihar',
-    'pradesh-tibet',
-    'prados',
-    'praeceptione',
-    'praeceptionem',
-    'praedicandi',
-    'praedrag',
-    'praefecture',
-    'praelectorship',
-    'praeludia',
-    'praemonstratensian',
     'praenomen',
-    'praeparatio',
-    'praesentes',
-    'praesentia',
-    'praesidiums',
-    'praestabilitata',
-    'praestari',
-    'praestarique',
-    'praestetis',
-    'praesumuntur',
-    'praeter-human',
-    'praeterita',
-    'praeterito',
-    'praetores',
-    'praetoria',
-    'praetorianize',
     'praetorians',
-    'prage',
-    'pragel',
-    'pragensis',
-    'pragers',
-    'pragmalinguistic',
-    'pragmatic-discoursal',
-    'pragmatic.',
-    'pragmatical',
-    'pragmatically-based',
-    'pragmatics-semantics-syntax',
-    'pragmatism&mdash;seems',
-    'pragmatism\'',
-    'pragna',
-    'pragnance',
-    'pragnells',
     'prago-centrism',
-    'pragocar',
-    'prague\'',
-    'prague-born',
-    'prague-residing',
-    'prague-vienna-berlin',
-    'praguian',
-    'praha1',
-    'prahl',
-    'prahu-building',
-    'praia.',
-    'praident',
-    'praier',
-    'praiers',
-    'prail',
-    'prairie-bound',
     'prairie-style',
-    'praise&rehy;worthiness',
-    'praise-god',
-    'praise-my-soul-the-king-of-heaven-to-his-feet-thy-tribute',
-    'praise-worthy',
-    'praise/',
-    'praise/recognition',
-    'praised-up',
-    'praisegod',
-    'praiseless',
-    'praisers',
-    'praiseworthiness',
-    'prakiss',
-    'prakit',
-    'prakla-seismos',
-    'pramatarski',
     'pramila',
-    'prammed',
-    'prana-yama',
-    'pranavayu',
-    'prancelot',
-    'prancin\'',
-    'prang-free',
-    'pranking',
-    'prann',
-    'prannet',
-    'prannies',
-    'pranon',
-    'pranting',
-    'prapass',
-    'praper',
-    'prapiestis',
     'praporshchikovo',
-    'prariond',
-    'prasa-ksiazka-ruch',
-    'prasat',
-    'praschma',
-    'prasert',
-    'prashna',
-    'prasina',
-    'praslins',
-    'prasniewski',
-    'prason',
-    'prassaler',
-    'prassede',
-    'pratas',
-    'pratchett-like',
-    'prated',
     'pratella',
-    'prates',
-    'prather',
-    'prathibha',
-    'prathin',
-    'pratibha',
-    'pratice',
-    'pratices',
-    'pratie',
-    'pratima',
-    'pratinidhi',
-    'pratlncole',
-    'pratolino',
-    'pratt-arrow',
-    'pratt/cradley',
-    'pratte',
     'pratted',
-    'prattfull',
-    'prattica',
-    'prattish',
-    'prattishness',
-    'prattle-box',
-    'prattler',
-    'prattlings',
-    'pratty',
-    'pratville',
-    'praty',
-    'praun',
-    'pravada',
-    'praventivmedizin',
-    'pravice',
-    'pravin',
     'prawar',
-    'prawerjhabvala',
-    'prawl',
-    'prawn&rehy;cocktail-pink',
-    'prawn-',
-    'prawn-catching',
-    'prawn-filled',
-    'prawn-flavoured',
-    'prax&imacr;nos',
-    'praxiological',
-    'pray\'r',
-    'pray\'rs',
-    'pray-ers',
-    'pray-for-peace',
-    'pray-ins',
-    'praya',
     'prayed-for',
-    'prayer-answering',
-    'prayer-beads',
-    'prayer-folded',
-    'prayer-framed',
-    'prayer-gift',
-    'prayer-hearing',
-    'prayer-leader',
-    'prayer-like',
-    'prayer-meeting',
-    'prayer-ridden',
-    'prayer-stool',
-    'prayer-stools',
-    'prayer-wheel-spinning',
-    'prayer-words',
-    'prayers/intercessions',
     'prayes',
-    'prayeth',
-    'praying-beads',
-    'prayut',
-    'praze',
-    'prb-mediated',
-    'prceded',
-    'prcela',
-    'prd&mdash;democratic',
-    'prdicament',
-    'pre&ccaron;ani',
-    'pre&ccedil;ieux',
-    'pre&mdash;1975',
-    'pre&ndash;1800',
-    'pre&ndash;arrangements',
-    'pre&ndash;emptive',
     'pre&rehy',
-    'pre&rehy;adolescents',
-    'pre&rehy;adult',
-    'pre&rehy;antonine',
-    'pre&rehy;arranged',
-    'pre&rehy;assembled',
-    'pre&rehy;christmas',
-    'pre&rehy;conditions',
-    'pre&rehy;dating',
-    'pre&rehy;disposed',
-    'pre&rehy;emptive',
-    'pre&rehy;established',
-    'pre&rehy;estimated',
-    'pre&rehy;evisting',
-    'pre&rehy;exceptional',
-    'pre&rehy;groups',
     'pre&rehy;historic',
-    'pre&rehy;industrialization',
-    'pre&rehy;interview',
-    'pre&rehy;lingually',
-    'pre&rehy;lynch',
-    'pre&rehy;modern',
-    'pre&rehy;occupations',
-    'pre&rehy;ordained',
-    'pre&rehy;output',
-    'pre&rehy;payments',
-    'pre&rehy;planned',
-    'pre&rehy;ponderance',
-    'pre&rehy;saussurian',
-    'pre&rehy;scholastic',
-    'pre&rehy;school',
-    'pre&rehy;senter',
     'pre&rehy;socratics',
-    'pre&rehy;transitional',
-    'pre&rehy;war',
-    'pre&rehy;wimbledon',
-    'pre&scaron;eren',
-    'pre\'sent',
-    'pre-&agr',
-    'pre-\'60s',
-    'pre-\'69',
-    'pre-1',
-    'pre-13,500',
-    'pre-14',
-    'pre-1575',
-    'pre-1640',
-    'pre-1660',
-    'pre-1692',
     'pre-17',
-    'pre-1701',
-    'pre-1720',
-    'pre-1752',
-    'pre-1788',
-    'pre-1801',
-    'pre-1832',
-    'pre-1834',
-    'pre-1835',
-    'pre-1841',
-    'pre-1870',
-    'pre-1871',
-    'pre-1873',
-    'pre-1880',
-    'pre-1881',
-    'pre-1895',
     'pre-1903',
-    'pre-1910',
-    'pre-1921',
-    'pre-1922',
-    'pre-1923',
-    'pre-1925',
-    'pre-1926',
-    'pre-1930',
-    'pre-1930s',
-    'pre-1932',
-    'pre-1933',
-    'pre-1934',
-    'pre-1935',
-    'pre-1936',
-    'pre-1946',
-    'pre-1950s',
     'pre-1951',
-    'pre-1952',
-    'pre-1958',
-    'pre-1959',
-    'pre-1960s',
-    'pre-1963',
-    'pre-1964',
-    'pre-1969',
-    'pre-1971',
-    'pre-1976',
-    'pre-1977',
-    'pre-1981',
-    'pre-1984',
-    'pre-1987',
-    'pre-1993',
-    'pre-20th-century',
     'pre-500',
-    'pre-685',
-    'pre-85',
-    'pre-abolition',
-    'pre-academic',
-    'pre-accelerated',
-    'pre-acceptance',
-    'pre-access',
-    'pre-ache-ed',
-    'pre-adaptedness',
-    'pre-adaptive',
-    'pre-adapts',
-    'pre-addressed',
-    'pre-adjusted',
-    'pre-admission',
-    'pre-adoptive',
     'pre-adsorbed',
-    'pre-aeration',
-    'pre-after-dinner-speech',
-    'pre-aged',
-    'pre-agricolan',
-    'pre-album',
-    'pre-alexandrian',
-    'pre-allocated',
-    'pre-allocation',
-    'pre-alp',
-    'pre-alphabetic',
-    'pre-amalgamated',
-    'pre-amalgamation',
-    'pre-amplifier',
-    'pre-analytical',
-    'pre-andr&eacute;e',
     'pre-angkor',
-    'pre-announcement',
-    'pre-anns',
-    'pre-anorexic',
-    'pre-apolline',
-    'pre-appraisal',
-    'pre-approval',
-    'pre-approved',
-    'pre-arbitral',
-    'pre-army',
-    'pre-arranging',
-    'pre-arthropod',
-    'pre-arthropods',
-    'pre-ascendancy',
-    'pre-assault',
-    'pre-associations',
     'pre-astrid',
-    'pre-asturian',
-    'pre-aswan',
-    'pre-auricular',
-    'pre-automobile',
-    'pre-awareness',
-    'pre-band',
-    'pre-basic',
-    'pre-beatles',
-    'pre-bedroom',
-    'pre-bedtime',
-    'pre-behaviourist',
-    'pre-beijing',
-    'pre-bending',
-    'pre-bent',
-    'pre-bermuda',
     'pre-big-bang',
-    'pre-blitz',
-    'pre-board-meeting',
-    'pre-boarding',
-    'pre-boil',
-    'pre-boreal',
-    'pre-boring',
-    'pre-boulestin',
-    'pre-braille',
-    'pre-breeders',
-    'pre-broadway',
-    'pre-bubbles',
-    'pre-budgeted',
-    'pre-bundled',
-    'pre-bureaucratic',
-    'pre-caldwell',
     'pre-candidate',
-    'pre-canoe',
-    'pre-capellan',
-    'pre-capitalistic',
-    'pre-capping',
-    'pre-caradocian',
-    'pre-carl',
-    'pre-carriage',
-    'pre-case',
-    'pre-casting',
-    'pre-casualty',
-    'pre-catholics',
-    'pre-celebration',
-    'pre-censor',
-    'pre-central',
-    'pre-certification',
     'pre-cfc',
-    'pre-challenge',
-    'pre-chamber',
-    'pre-chapman',
-    'pre-charged',
-    'pre-checked',
-    'pre-chelsea',
-    'pre-cheltenham',
-    'pre-chemotherapy',
-    'pre-chewed',
-    'pre-children',
-    'pre-chilled',
-    'pre-chloroform',
-    'pre-chokierian',
-    'pre-chordal',
-    'pre-chosen',
     'pre-christians',
-    'pre-class',
-    'pre-classified',
-    'pre-classify',
-    'pre-cleveland',
-    'pre-clinically',
-    'pre-coating',
-    'pre-cohort',
-    'pre-coital',
-    'pre-college',
-    'pre-colombian',
-    'pre-column',
-    'pre-combat',
-    'pre-commercial',
-    'pre-committee',
-    'pre-commonwealth',
     'pre-communicative',
-    'pre-competition',
-    'pre-compile',
-    'pre-compiler',
-    'pre-compression',
-    'pre-compulsory',
-    'pre-computer',
-    'pre-conception',
-    'pre-conceptual',
-    'pre-concert',
-    'pre-conditioner',
-    'pre-conditioning',
-    'pre-conferences',
-    'pre-conflict',
-    'pre-connubial',
-    'pre-conscription',
     'pre-constructed',
-    'pre-consultative',
-    'pre-contact',
-    'pre-continental',
-    'pre-contractually',
-    'pre-controversy',
-    'pre-convention',
-    'pre-cook',
-    'pre-cooling',
-    'pre-coordinated',
-    'pre-copulatory',
-    'pre-corded',
-    'pre-corky',
-    'pre-cornmill',
-    'pre-course/meeting',
-    'pre-court',
     'pre-covering',
-    'pre-cretaceous',
-    'pre-crew',
-    'pre-cued',
-    'pre-culturally',
-    'pre-cutting',
-    'pre-dancing',
-    'pre-darwinist',
-    'pre-day-glo',
-    'pre-deadline',
-    'pre-deal',
-    'pre-debt',
-    'pre-decca',
-    'pre-deceased',
-    'pre-deceases',
-    'pre-decide',
     'pre-decisional',
-    'pre-declared',
-    'pre-decorated',
-    'pre-defied',
-    'pre-delegates',
-    'pre-deluge',
-    'pre-democratisation',
-    'pre-dental',
-    'pre-dental/',
-    'pre-deposit',
-    'pre-determine',
-    'pre-determines',
-    'pre-developed',
-    'pre-devonian',
-    'pre-dicts',
-    'pre-differentiation',
     'pre-digitised',
-    'pre-disaster',
-    'pre-disposes',
-    'pre-dividend',
-    'pre-dominating',
-    'pre-dorian',
-    'pre-drainage',
-    'pre-dramatic',
-    'pre-drilling',
-    'pre-driver',
-    'pre-driving',
-    'pre-dryden',
-    'pre-duchy',
-    'pre-dug',
-    'pre-dusk',
-    'pre-duty',
     'pre-dyed',
-    'pre-earthquake',
-    'pre-easter',
-    'pre-ec',
-    'pre-ecclesiological',
-    'pre-echinoderm',
-    'pre-echinoderms',
-    'pre-echoed',
-    'pre-eclamptic',
-    'pre-economic',
-    'pre-edamptics',
-    'pre-educated',
-    'pre-education',
-    'pre-edwina',
-    'pre-eighteenth',
-    'pre-eighteenth-century',
     'pre-einsteinian',
-    'pre-electric',
-    'pre-electrical',
-    'pre-element',
-    'pre-elementary',
-    'pre-elizabethan',
-    'pre-emancipation',
-    'pre-embargo',
-    'pre-embryologists',
-    'pre-emergence',
-    'pre-emimently',
-    'pre-emptions',
-    'pre-emptory',
-    'pre-enclosure',
-    'pre-english',
-    'pre-enlightenment',
     'pre-enlistment',
-    'pre-episternum',
-    'pre-equipped',
-    'pre-eruption',
-    'pre-estimation',
-    'pre-evaluation',
-    'pre-evangelisation',
-    'pre-evangelism',
-    'pre-evita',
-    'pre-evolutionary',
-    'pre-excitation',
-    'pre-exclusion',
-    'pre-exemption',
-    'pre-exhibition',
-    'pre-expansion',
-    'pre-expedition',
     'pre-exploitation',
-    'pre-exploratory',
-    'pre-exponential',
-    'pre-fabrication',
-    'pre-fade',
-    'pre-fair',
-    'pre-fallen',
-    'pre-family',
-    'pre-fascist',
-    'pre-fax',
-    'pre-fce',
-    'pre-feed',
-    'pre-felting',
-    'pre-festival',
-    'pre-feudal',
-    'pre-fibrotic',
     'pre-figurative',
-    'pre-figures',
-    'pre-filmed',
-    'pre-filming',
-    'pre-fit',
-    'pre-fitted',
-    'pre-flashing',
-    'pre-flighting',
-    'pre-flights',
-    'pre-flotation',
-    'pre-floyd',
-    'pre-foaling',
-    'pre-folded',
-    'pre-form',
-    'pre-formal',
-    'pre-formalin',
     'pre-format',
-    'pre-fourth',
-    'pre-fracturing',
-    'pre-fricative',
-    'pre-function',
-    'pre-fund',
-    'pre-funding',
-    'pre-fuss',
-    'pre-garvan',
-    'pre-gcse',
-    'pre-general',
-    'pre-genetical',
-    'pre-geneva',
-    'pre-gig',
-    'pre-glitch',
-    'pre-gockley',
     'pre-grandchild',
-    'pre-griffiths',
-    'pre-groups',
-    'pre-halloween',
-    'pre-halter',
-    'pre-harvest',
-    'pre-harvested',
-    'pre-headed',
-    'pre-headhunting',
-    'pre-heater',
-    'pre-herpes',
-    'pre-heseltine',
-    'pre-higher',
-    'pre-hilbert',
-    'pre-hillsborough',
-    'pre-his-toric',
     'pre-historian',
-    'pre-historically',
-    'pre-holocaust',
-    'pre-hominids',
-    'pre-hugo',
-    'pre-hung',
-    'pre-hyphenated',
-    'pre-identified',
-    'pre-imaginal',
-    'pre-impact',
-    'pre-imposed',
-    'pre-impregnated',
-    'pre-inaugural',
-    'pre-incorporation',
-    'pre-indian',
-    'pre-industrial-revolution',
     'pre-industrialism',
-    'pre-information',
-    'pre-infusion',
-    'pre-inhalation',
-    'pre-install',
-    'pre-insurance',
-    'pre-integrate',
-    'pre-intellectual',
-    'pre-interest',
-    'pre-intifada',
-    'pre-invitation',
-    'pre-irradiation',
-    'pre-isomerised',
-    'pre-issued',
-    'pre-jacket',
-    'pre-job',
     'pre-journey',
-    'pre-judaic',
-    'pre-judges',
-    'pre-judging',
-    'pre-july',
-    'pre-justinianic',
-    'pre-kaiser',
-    'pre-kantian',
-    'pre-khmer',
-    'pre-killed',
-    'pre-kindergarten',
-    'pre-knotted',
-    'pre-l',
-    'pre-labelled',
-    'pre-last',
-    'pre-latest',
     'pre-launching',
-    'pre-lavoisier',
-    'pre-leased',
-    'pre-lenten',
-    'pre-leuktra',
-    'pre-lexical',
-    'pre-liberal',
-    'pre-liberation',
-    'pre-library',
-    'pre-licence',
-    'pre-licentiates',
-    'pre-linnean',
-    'pre-litigation&mdash;hospital',
-    'pre-loading',
-    'pre-loss',
-    'pre-machine',
     'pre-machinery',
-    'pre-maintenance',
-    'pre-map',
-    'pre-march',
-    'pre-marcus',
-    'pre-mariner',
-    'pre-market',
-    'pre-martin',
-    'pre-marxist',
-    'pre-matter',
-    'pre-mature',
-    'pre-matured',
-    'pre-measured',
-    'pre-mechanisation',
-    'pre-medau',
-    'pre-mediaeval',
     'pre-medical',
-    'pre-medieval',
-    'pre-meditation',
-    'pre-meiotic',
-    'pre-mendelian',
-    'pre-menstruation',
-    'pre-merged',
-    'pre-meritocratic',
-    'pre-messenger',
-    'pre-milk',
-    'pre-millennial',
-    'pre-ming',
-    'pre-ministerial',
-    'pre-mistral',
-    'pre-mixing',
-    'pre-modernity',
     'pre-modifier',
-    'pre-modifying',
-    'pre-moistened',
-    'pre-money',
-    'pre-moral',
-    'pre-moslem',
-    'pre-mot',
-    'pre-motorised',
-    'pre-moulded',
-    'pre-murder',
-    'pre-murdoch',
-    'pre-mutiny',
-    'pre-mythago',
-    'pre-napoleonic',
-    'pre-nascent',
-    'pre-nation-state',
     'pre-negotiating',
-    'pre-neolithic',
-    'pre-newtonian',
-    'pre-night',
-    'pre-nine',
-    'pre-nirvana',
-    'pre-no',
-    'pre-normal',
-    'pre-novelistic',
-    'pre-nt',
-    'pre-nuclear',
-    'pre-nursing',
-    'pre-occupies',
-    'pre-occupy',
-    'pre-october',
-    'pre-offence',
     'pre-offer',
-    'pre-oppression',
-    'pre-or',
-    'pre-ordain',
-    'pre-order',
-    'pre-ordered',
-    'pre-oriental',
-    'pre-otic',
-    'pre-oxford',
-    'pre-oxidised',
-    'pre-pa',
-    'pre-palatal',
-    'pre-palladian',
-    'pre-paralympic',
-    'pre-parisian',
-    'pre-parliament',
     'pre-parmenidean',
-    'pre-partum',
-    'pre-party',
-    'pre-pasted',
-    'pre-paying',
-    'pre-payroll',
-    'pre-penicillin',
-    'pre-penultimate',
-    'pre-permissive',
-    'pre-petrine',
-    'pre-phd',
-    'pre-phenomenal',
-    'pre-philosophical',
-    'pre-photographic',
-    'pre-pill',
-    'pre-placed',
     'pre-planting',
-    'pre-plumbed',
-    'pre-podium',
-    'pre-polishing',
-    'pre-pollution',
-    'pre-pop',
-    'pre-portionately',
-    'pre-posed',
-    'pre-posing',
-    'pre-position',
-    'pre-possessed',
-    'pre-post-structuralist',
-    'pre-posthumous',
-    'pre-potato',
-    'pre-potent',
-    'pre-pottery',
     'pre-preceding',
-    'pre-preferential',
-    'pre-pregnant',
-    'pre-preparation',
-    'pre-prepare',
-    'pre-prescription',
-    'pre-presentation',
-    'pre-presocratic',
-    'pre-primers',
-    'pre-primitive',
-    'pre-private',
-    'pre-pro-dynorphin',
-    'pre-processes',
-    'pre-processors',
-    'pre-product',
-    'pre-professionals',
     'pre-profs',
-    'pre-programme',
-    'pre-protected',
-    'pre-protection',
-    'pre-psychoanalytic',
-    'pre-public',
-    'pre-published',
-    'pre-purchase',
-    'pre-putsch',
-    'pre-pyrenean',
-    'pre-quads',
-    'pre-quaker',
-    'pre-qualified',
-    'pre-qualifiers',
-    'pre-raf',
-    'pre-raid',
     'pre-raised',
-    'pre-raphaelitism',
-    'pre-raphealites',
-    'pre-reaction',
-    'pre-reception',
-    'pre-reduction',
-    'pre-reef',
-    'pre-referential',
-    'pre-referral',
-    'pre-refrigeration',
-    'pre-registering',
-    'pre-report',
-    'pre-reproduction',
-    'pre-reproductive',
-    'pre-request',
-    'pre-restoration',
     'pre-retired',
-    'pre-reunification',
-    'pre-revised',
-    'pre-ribosomal',
-    'pre-rift',
-    'pre-rigid',
-    'pre-roasted',
-    'pre-robotised',
-    'pre-rock',
-    'pre-rockist',
-    'pre-roll',
-    'pre-rolled',
-    'pre-romantic',
-    'pre-roy',
-    'pre-royal',
-    'pre-salted',
     'pre-sandblast',
-    'pre-sanusi',
-    'pre-sap',
-    'pre-saturating',
-    'pre-saussurean',
-    'pre-saxon',
-    'pre-scan',
-    'pre-scheduled',
-    'pre-schizophrenic',
-    'pre-school-age',
-    'pre-schools',
-    'pre-sea',
-    'pre-search',
-    'pre-second',
-    'pre-secondary',
-    'pre-secondment',
     'pre-section',
-    'pre-selections',
-    'pre-selector',
-    'pre-sentencing',
-    'pre-sentimental',
-    'pre-sents',
-    'pre-sept.',
-    'pre-septuagint',
-    'pre-sermon',
-    'pre-served',
-    'pre-session',
-    'pre-sets',
-    'pre-settlement',
-    'pre-sevens',
-    'pre-severan',
-    'pre-shakespearean',
     'pre-shapers',
-    'pre-shaping',
-    'pre-shipment',
-    'pre-shoot',
-    'pre-shooting',
-    'pre-shopping',
-    'pre-shrunk.',
-    'pre-sifting',
-    'pre-signed',
-    'pre-signing',
-    'pre-sinking',
-    'pre-sixteenth-century',
-    'pre-skinhead',
-    'pre-sleep-loss',
-    'pre-slump',
-    'pre-smeared',
     'pre-smith',
-    'pre-smoothed',
-    'pre-smoothie',
-    'pre-so',
-    'pre-socialist',
-    'pre-society',
-    'pre-sociological',
-    'pre-socratic',
-    'pre-socratics',
-    'pre-solar',
-    'pre-solidarity',
-    'pre-sophistic',
-    'pre-sound',
-    'pre-spade',
-    'pre-spawning',
-    'pre-sponsorship',
     'pre-spreadsheet',
-    'pre-spring',
-    'pre-stage',
-    'pre-standing',
-    'pre-start',
-    'pre-state',
-    'pre-stocked',
-    'pre-stressed',
-    'pre-stretched',
-    'pre-structuralist',
-    'pre-styling',
-    'pre-sub',
-    'pre-subjective',
-    'pre-suggesting',
-    'pre-suggs',
-    'pre-sumably',
     'pre-sumed',
-    'pre-sun',
-    'pre-suppliers',
-    'pre-support',
-    'pre-supposition',
-    'pre-surgery',
-    'pre-suspension',
-    'pre-swollen',
-    'pre-swung',
-    'pre-sylvestration',
-    'pre-synthesizer',
-    'pre-tabel',
-    'pre-tabor',
-    'pre-tag',
-    'pre-tagged',
-    'pre-taped',
     'pre-taught',
-    'pre-taxed',
-    'pre-taxi',
-    'pre-taylor',
-    'pre-technological',
-    'pre-teen-temptress',
-    'pre-teenager',
-    'pre-teenagers',
-    'pre-teens',
-    'pre-tehran',
-    'pre-telegraph',
-    'pre-telephone',
-    'pre-telescope',
-    'pre-televised',
-    'pre-television',
-    'pre-temple',
     'pre-tendering',
-    'pre-tensioned',
-    'pre-tensions',
-    'pre-tertiary',
-    'pre-textual',
-    'pre-thatcher',
-    'pre-thirteenth',
-    'pre-tilt',
-    'pre-timetabling',
-    'pre-titus',
-    'pre-to',
-    'pre-tokugawa',
-    'pre-tom',
-    'pre-tops',
-    'pre-tourism',
-    'pre-treat',
     'pre-trimmed',
-    'pre-trojan',
-    'pre-tunnel',
-    'pre-turkey',
-    'pre-turkish',
-    'pre-twelfth',
-    'pre-typed',
-    'pre-u/v',
-    'pre-uk',
-    'pre-unced',
-    'pre-unified',
-    'pre-valve',
-    'pre-varnished',
-    'pre-vehicle',
-    'pre-versus',
-    'pre-vga',
     'pre-vichy',
-    'pre-vienna',
-    'pre-viewing',
-    'pre-viking',
-    'pre-village',
-    'pre-voiced',
-    'pre-waking',
-    'pre-walking',
-    'pre-warning',
-    'pre-washes',
-    'pre-waxed',
-    'pre-weaning',
-    'pre-weapon',
-    'pre-welfare',
-    'pre-wembley',
-    'pre-white',
     'pre-whitening',
-    'pre-wilkinson',
-    'pre-windscale',
-    'pre-wiring',
-    'pre-woodland',
-    'pre-woolfenden',
-    'pre-yeasted',
-    'pre-yuppy',
-    'pre.set',
-    'pre/post-operative',
-    'pre=',
-    'pre=war',
-    'prea-chers',
-    'preach-ed',
-    'preacher-bard',
-    'preaches.the',
     'preacheth',
-    'preachifying',
-    'preachin\'',
-    'preachiness',
-    'preachments',
-    'preacquisition',
-    'preactive',
-    'preadator',
-    'preadmission',
-    'preadolescents',
-    'preadsorbed',
-    'preadsorption',
-    'preamable',
-    'preambling',
-    'preambulum',
-    'preamp/eq',
     'preamp/parametric',
-    'preamp/power',
-    'preannounce',
-    'preans',
-    'preap',
-    'preassigned',
-    'preaud',
-    'preaux',
-    'prebagged',
-    'prebbles',
-    'preben',
-    'prebiofeedback',
-    'preble',
-    'prebonderance',
-    'prebook',
-    'prebookable',
     'prebreakfast',
-    'prebuilt',
-    'prec',
-    'prec.',
-    'precambrian-type',
-    'precancerous',
-    'precarial',
-    'precario',
-    'precariously-achieved',
-    'precariously-held',
-    'precariously-perched',
-    'precarius',
-    'precativus',
-    'precaution.',
-    'precautions.on',
-    'precedence-but',
     'precedent-setting',
-    'precedents&mdash;even',
-    'preceed',
-    'preceeds',
-    'preceipitated',
-    'preceiv',
-    'preceive',
-    'preceived',
-    'precented',
-    'precenting',
-    'precentors',
-    'preceptories',
-    'precesses',
-    'precheur',
-    'prechilled',
-    'prechtl',
     'preciados',
-    'precieved',
-    'precincted',
-    'precinorm',
-    'precio',
-    'precios',
-    'precip',
-    'precipi&rehy;tate',
-    'precipitato',
-    'precipitator',
-    'precise-edged',
-    'precisely\'',
-    'precisely-arranged',
-    'precisely-crafted',
-    'precisely-described',
-    'precisian',
     'precising',
-    'precision-bombing',
-    'precision-cut',
-    'precision-directed',
-    'precision-machine',
-    'precision-machined',
-    'precision-shear',
-    'precision.',
-    'precision/jazz',
-    'precisioning',
-    'precisionism',
-    'precisionist',
-    'preclearing',
-    'precloacal',
-    'preclud',
-    'precoeliac',
     'precognita',
-    'precognitive',
-    'precognoscer',
-    'precolumbian',
-    'precompetitive',
-    'precompile',
-    'precompiling',
-    'precomputed',
-    'precon',
-    'precon&rehy;dition',
-    'preconception-shattering',
-    'preconcerted',
-    'precondi&rehy;tions',
-    'preconsidered',
-    'preconsonantal',
-    'preconstituted',
     'preconstructed',
-    'precontraceptions',
-    'precoordination',
-    'precordium',
-    'precursored',
-    'precusor',
-    'precynct',
-    'precyse',
-    'pred-ictable',
-    'pred-league',
-    'predacity',
-    'predannock',
-    'predation-',
-    'predations',
-    'predator-avoidance',
-    'predator-avoiding',
     'predator-like',
-    'predator-near-nest',
-    'predator-to-prey',
-    'predator.',
-    'predatorily',
-    'predators.',
-    'preddy',
-    'prede&rehy;cessors',
-    'predeceasing',
-    'predecess',
-    'predecessor(s)',
-    'predections',
-    'predefinition',
-    'predencia',
-    'predentary',
-    'predescessor',
     'predeterminable',
-    'predi',
-    'predic&rehy;tion',
-    'predic&rehy;tions',
-    'predic-tions',
-    'predicability',
-    'predicables',
-    'predicament.',
-    'predicantium',
-    'predicasts',
-    'predicate-calculus-like',
-    'predicate-term',
-    'predicing',
-    'predicition',
-    'predico',
-    'predict&rehy;ability',
     'predicta',
-    'predictam',
-    'predictd',
-    'predicte',
-    'predicted.73',
-    'prediction-based',
-    'prediction/analysis',
-    'predictiveness',
-    'predictor-corrector',
-    'prediffused',
-    'predigt',
-    'predilictions',
-    'predir',
-    'prediscovery',
-    'predispersed',
-    'predisposal',
     'predissociated',
-    'predistending',
-    'predistilled',
-    'predisturbance',
-    'predjamski',
-    'predjudiced',
-    'predmost',
-    'predmouth',
-    'prednesol',
-    'prednisolene',
-    'prednisolon',
-    'prednisolone/',
-    'prednisolone/kg/day',
-    'prednison',
-    'predolomitization',
-    'predominantin',
     'predominantly-nationalist',
-    'predominantly-rural',
-    'predominantly-slav',
-    'predominateand',
-    'predomination',
-    'predominently',
-    'predose',
-    'predtchenskaya/katya',
-    'preece/teacher',
-    'preeeezents',
-    'preelection',
-    'preenin\'',
-    'preesall',
-    'preestes',
-    'preexisted',
-    'preeze',
     'pref&rehy;erably',
-    'pref.',
-    'prefabricate',
-    'prefabricated-austerity',
-    'prefat',
-    'prefect-apostolic',
-    'prefectoral',
-    'prefence',
-    'prefer&rehy;ably',
-    'prefer&rehy;ring',
-    'preferable.',
-    'preferance',
-    'preferecnes',
-    'preference.',
-    'preference/frequency',
-    'preferentem',
     'prefern',
-    'prefernce',
-    'preferns',
-    'preferr',
-    'preferre',
-    'preferred-',
-    'preferred-issue-in-file&lsqb;file',
-    'preferred_by',
-    'preferrred',
-    'prefetching',
-    'prefigurations',
-    'prefilled',
-    'prefiltration',
-    'prefinished',
-    'prefix-plus-stem',
-    'prefix-suffix',
     'preflight',
-    'preflighting',
-    'prefontaine',
-    'preform',
-    'preformances',
-    'preformation/',
-    'preformationism',
-    'preforming',
-    'preforms',
-    'preformulated',
-    'pregaday',
-    'preganancies',
-    'pregar',
-    'pregel',
-    'pregestimil',
-    'preggy',
     'pregiously',
-    'pregiven',
-    'pregmatic',
-    'pregnance',
-    'pregnancy.',
-    'pregnancy.0',
-    'pregnancy.i',
-    'pregnant&mdash;what',
-    'pregnant\'-looking',
-    'pregnant/tall/pretty/diabetic',
-    'pregnants',
-    'pregnence',
-    'pregos',
-    'pregraph',
-    'pregrouping',
-    'prehaps',
     'preheadfold-stage',
-    'preheater',
-    'preheminence',
-    'prehensility',
-    'prehension',
-    'prehensiveness',
-    'prehepatic',
-    'prehistoric-looking',
-    'prehistorical',
-    'prehospital',
-    'prehybridisations',
-    'prehybridised',
-    'preiampullary',
-    'preie',
-    'preies',
-    'preignition',
     'preincarnation',
-    'preincubating',
-    'preindustrialism',
-    'preinfusion',
-    'preinstalling',
-    'preinsulin',
-    'preintegrate',
-    'preintermediate',
-    'preinterview',
-    'preiser',
-    'preistorico',
-    'prejmer',
-    'prejudice.',
-    'prejudiced-against-smoking',
-    'prek',
-    'preknowledge',
     'preky',
-    'prelavka',
-    'prelimi',
-    'preliminari',
-    'prelimo',
-    'prelinguistic',
-    'prelisted',
-    'prelisting',
-    'prell',
-    'preller',
-    'prelog',
-    'preluciand',
-    'preludio',
-    'premalignancy',
-    'premarriage',
-    'premature-baby',
     'prematurely-worn',
-    'premaxillary/incisive',
-    'premchand',
-    'premco',
-    'premedical',
-    'premedicated',
-    'premelting',
-    'premeno',
-    'prementum.',
-    'premet',
-    'premetallised',
-    'premethylation',
-    'premetrication',
-    'premi&agrave;re',
-    'premi&agrave;res',
-    'premie&egrave;re',
     'premier-elect',
-    'premier-league',
-    'premiering',
-    'premierland',
-    'premierminister',
-    'premiers.',
-    'premiership.',
-    'premiership/home',
-    'premigration',
-    'premillennialism',
-    'premises&mdash;was',
-    'premises-negligence-personal',
-    'premiu',
-    'premium-battered',
-    'premium-branded',
-    'premium-grade',
     'premium-quality',
-    'premium-rate',
-    'premium-strength',
-    'premium.',
-    'premium/beta',
-    'premium/standard',
-    'premium1',
-    'premiums.',
-    'premixes',
-    'premmias',
-    'premodernists',
-    'premodification',
-    'premodified',
-    'premodifying',
-    'premonitary',
-    'premonitionary',
     'premonstratensians',
-    'premonville',
-    'premoral',
-    'premotor',
-    'premuda',
-    'premultiplications',
-    'premultiplier',
-    'premus',
-    'prenatally-acquired',
-    'prenationalist',
-    'prendergrass',
-    'prenderlo',
-    'prendes',
-    'prendine',
-    'prendonzani',
-    'prends',
     'prene',
-    'preneoplastic',
-    'prenez-vous',
-    'prenge',
-    'prengvir',
-    'prenisolone',
-    'prens',
-    'prentice-work',
-    'prentice/artist',
-    'prentise',
-    'prentonfans',
-    'prenzlauerberg',
-    'prenzler',
-    'preobazhensky',
-    'preoblakensky',
-    'preobrajensky',
     'preoccipital',
-    'preoccuption',
-    'preocular',
-    'preocuparia',
-    'preopria',
-    'preoral',
-    'preord',
-    'preordain',
-    'preordaining',
-    'preordination',
-    'preoxygenated',
-    'prep\'',
-    'prep-aration',
-    'prep-schoolboy',
-    'prep-time',
-    'prep-wear',
     'prep8-transfected',
-    'prepa',
-    'prepackages',
-    'prepackaging',
-    'prepacks',
-    'preparation-for-retirement',
-    'preparation_at',
-    'preparations.',
-    'preparator',
-    'preparatory-tutorial',
-    'prepare/submission/modification',
-    'preparedness.',
-    'preparest',
-    'prepareth',
-    'preparez-vous',
-    'prepartion',
     'prepartum',
-    'prepatation',
-    'prepatterning',
-    'prepay',
-    'preped',
-    'preperations',
-    'preperm',
-    'prepermissive',
-    'preping',
-    'prepmaster',
-    'prepnet',
-    'prepolitical',
-    'preponderating',
-    'prepositioning',
-    'prepotence',
-    'preprandially',
     'preprepared',
-    'prepresentative',
-    'prepro',
-    'preprocessed',
-    'preprocessors',
-    'preproduction',
-    'preproducts',
-    'preprogram',
-    'preproletarian',
-    'prepunctual',
-    'prepupal',
-    'prequalified',
-    'prequalifying',
-    'prequelling',
-    'prerandomisation',
-    'prerational',
     'prerehearsed',
-    'prerelas',
-    'prerenal',
-    'prerequisities',
-    'preretirement',
-    'prerevolutionary',
-    'prerogatives-the',
-    'prerogerative',
-    'preromantic',
-    'presants',
-    'presaturation',
-    'presbrey',
-    'presbyacusis',
-    'presbyopia',
-    'presbyterial',
-    'presbyterian/dup',
     'presbytery.',
-    'presbyteryian',
-    'prescaler',
-    'prescalers',
-    'prescaling',
-    'prescence',
-    'prescencer',
-    'prescent',
-    'prescheduled',
-    'prescinded',
-    'prescinding',
-    'prescinds',
-    'prescot-based',
-    'prescote',
-    'prescott-clarke',
-    'prescotts',
     'prescrip&rehy;tive',
-    'prescription.',
-    'prescriptions.',
-    'prescriptions/',
-    'presearched',
-    'presedation',
-    'preselectable',
-    'preselects',
-    'preselli',
-    'presen',
-    'presence\'',
-    'presence-absence',
-    'presence-chamber',
-    'presens',
-    'present&rehy;day',
-    'present\'',
     'present-absent',
-    'present-both',
-    'present-buying',
-    'present-day-wild',
-    'present-generation',
-    'present.church',
-    'present.day',
-    'present.one',
-    'present.the',
-    'present/indicative/',
-    'presentability',
-    'presentaion',
-    'presentation&rehy;quality',
-    'presentation-quality',
-    'presentational/speaking',
-    'presentative',
     'presentatives',
-    'presentaton',
-    'presentazione',
-    'presentday',
-    'presente',
-    'presented\'\'',
-    'presented-it-masculine',
-    'presentedat',
-    'presentence',
-    'presenter-turned-guru',
-    'presenter/model',
-    'presenti',
-    'presentic',
-    'presentings',
-    'presention',
-    'presentists',
     'presently-available',
-    'presently-maligned',
-    'presents.',
-    'presenz',
-    'preserv',
-    'preservable',
-    'preservatif',
-    'preservation-by-exclusion',
-    'preservation-conscious',
-    'preservation/substitution',
-    'preservational',
-    'preservationist-minded',
-    'preservative-filled',
-    'preservative-free',
-    'preservatively',
-    'preservativetreated',
     'preservaton',
-    'preserve.',
-    'preserved\'',
-    'preserved.',
-    'preservene',
-    'preserveth',
-    'preserving\'',
-    'preses',
-    'presetable',
-    'presetting',
-    'presgrave',
-    'president&mdash;see',
-    'president-designate',
-    'president-in-exile',
-    'president/chairman',
-    'president/corporate',
     'president/oxford',
-    'president/prime',
-    'president:sam',
-    'presidentiable',
-    'presidential-level',
-    'presidential-parliamentary',
-    'presidentialism',
-    'presidentials',
-    'presidents-elect',
-    'presider',
-    'presiendanz',
-    'presitgious',
-    'presley.',
-    'presnail',
-    'presnareburn',
-    'presoaking',
     'presolar',
-    'presold',
-    'presorted',
-    'prespa/ohrid',
-    'prespass',
-    'prespawning',
-    'prespecifically',
-    'prespinal',
-    'presquille',
-    'press&rehy;boxes',
-    'press&rehy;stud',
-    'press-',
-    'press-arousal',
-    'press-boxes',
-    'press-button',
-    'press-forming',
     'press-ganging',
-    'press-gangs',
-    'press-head',
-    'press-hounds',
-    'press-lipped',
-    'press-marks',
-    'press-men',
-    'press-out',
-    'press-provoked',
-    'press-released',
-    'press-shy',
-    'press-stud',
-    'press-switch',
-    'press-through',
-    'press-up',
-    'press-wheel',
     'press/grater',
-    'press/ica',
-    'press/iraq',
-    'press/media',
-    'press/news',
-    'press/passholders',
-    'press/photo',
-    'press/pr',
-    'press/quality',
-    'press/sky',
-    'pressable',
-    'pressager',
-    'pressages',
-    'pressbox',
-    'pressburg',
-    'presse-agentur',
     'pressed-glass',
-    'pressed-in',
-    'pressed-out',
-    'pressed.',
-    'pressel',
-    'pressement',
-    'pressers',
-    'presseth',
-    'pressganging',
-    'pressiness',
-    'pressing-cloth',
-    'pressing-rooms',
-    'pressly',
-    'pressmanufactured',
-    'pressmarking',
-    'pressmasters',
     'pressoir',
-    'pressos',
-    'pressouyre',
-    'pressure&rehy;hosing',
-    'pressure&rehy;many',
-    'pressure-cook',
-    'pressure-cooked',
-    'pressure-ejected',
-    'pressure-head',
-    'pressure-high',
-    'pressure-impregnated',
-    'pressure-less',
-    'pressure-marks',
-    'pressure-operated',
-    'pressure-point',
-    'pressure-points',
     'pressure-pop',
-    'pressure-pulse',
-    'pressure-rafting',
-    'pressure-reducing',
-    'pressure-release',
-    'pressure-relief',
-    'pressure-temperature-time',
-    'pressure-that',
-    'pressure-time',
-    'pressure-treated',
-    'pressure-vacuum',
-    'pressure-velocity',
-    'pressure-vessel',
-    'pressure-vulnerable',
-    'pressure.',
-    'pressure/temperature',
     'pressure=238',
-    'pressures&rehy;high',
-    'pressures-this',
-    'pressures.',
-    'pressuress',
-    'pressurewith',
-    'pressuried',
-    'pressuriser',
-    'pressurized-water',
-    'pressurizes',
-    'pressurss',
-    'presswork',
-    'pressy',
-    'prestained',
-    'prestation',
-    'prestcott',
     'prestebruther',
-    'presteignthomas',
-    'prestel-based',
-    'prestel-owning',
-    'prestel.',
-    'presternum',
-    'presthope',
-    'presthus',
-    'prestidge/cherwell',
-    'prestidigitant',
-    'prestidigitators',
-    'prestidigitatory',
-    'prestige&rehy;type',
-    'prestige-based',
-    'prestige-car',
-    'prestiges',
     'prestigiously',
-    'prestion',
-    'prestley',
-    'preston&mdash',
-    'preston-born',
-    'preston-leyland-chorley',
-    'preston/',
-    'preston/gloucestershire',
-    'prestongrange',
-    'prestonians',
-    'prestons',
-    'prestor',
-    'prestos',
-    'prestructured',
-    'prests',
-    'prestudy',
     'prestwick-based',
-    'prestwold',
-    'prestwood',
-    'prestwould',
-    'prestwych',
-    'presu',
-    'presubmission',
-    'presum.tif',
-    'presumab',
-    'presumably-still-alive',
-    'presumably.',
-    'presumasbly',
-    'presumbly',
-    'presuppositional',
-    'presynaptically',
-    'presyncope',
     'presynpatic',
-    'pret-a-porter',
-    'pretaapnarian',
-    'pretations',
-    'prete',
-    'preteceille',
-    'pretence-hall',
-    'pretend-mistress',
-    'pretend-nothing-serious-has-happened',
-    'pretend-tramp',
-    'pretend-writes',
-    'pretended.',
-    'pretender\'s',
-    'pretendest',
-    'pretensioned',
-    'pretention',
     'pretentious-looking',
-    'preterpasanto',
-    'pretest',
-    'pretesting',
-    'prethee',
-    'pretlove',
-    'pretoria-witwatersrand-vaal',
-    'pretoria-witwatersrand-vereeniging',
-    'pretoria.the',
-    'pretournament',
-    'pretranscriptional',
-    'pretransformational',
-    'pretransplant',
-    'pretreating',
-    'pretsch',
-    'prettied-up',
     'prettification',
-    'prettily-lit',
-    'prettily-painted',
-    'pretty-',
-    'pretty-baby',
-    'pretty-behaved',
-    'pretty-face-and-big-tits-to-sell-the-record',
-    'pretty-little-feather-brained-only-good-for-one-thing-bimbo-know-nothing-woman\'s-head',
-    'pretty-pretty',
-    'prettying',
-    'prety',
-    'preu&szlig;ische',
-    'preubas',
-    'preuil',
-    'preussische',
-    'preussischer',
     'preuves',
-    'preux',
-    'prev&ocirc;t&eacute',
-    'prev&ocirc;ts',
-    'preva',
-    'prevalent.',
-    'prevalprime',
-    'preve',
-    'prevelance',
-    'prevelant',
-    'preveli',
-    'preven',
-    'preven&rehy;tive',
-    'prevent/delay',
-    'preventability',
-    'prevented.',
     'preventible',
-    'prevention-is-better-than-cure',
-    'preventional',
-    'preventive/prediction',
-    'preventive/predictive',
-    'preventives',
-    'preventor',
-    'prevents&mdash',
-    'prevezer',
-    'previas',
-    'previati',
-    'previdencia',
-    'preview-knowing',
-    'preview-overview-inview-review',
-    'previn/lso',
-    'previous-highest',
     'previously-described',
-    'previously-expanding',
-    'previously-gained',
-    'previously-held',
-    'previously-identified',
-    'previously-launched',
-    'previously-mentioned',
-    'previously-noted',
-    'previously-protected',
-    'previously-quoted',
-    'previously-stable',
-    'previously-unheard',
-    'previously-used',
-    'previousy',
-    'prevision',
-    'previus',
     'prevnet',
-    'prevocalic',
-    'prevorsek',
-    'prevost-marcilhacy',
-    'prevue-x',
-    'prew',
-    'prewarn',
-    'prewash',
-    'preweighed',
-    'prewired',
-    'prey-but',
-    'prey-capture',
-    'prey-catchers',
-    'prey-catching',
-    'prey-concealed',
-    'prey-hunting',
     'prey-killing',
-    'prey-movement',
-    'prey-rich',
-    'prey.animals',
-    'preye',
-    'preyed-upon',
-    'preysize',
-    'prezented',
-    'prezident',
-    'prezold',
-    'prezzy',
-    'prformance',
-    'prhaps',
-    'prho',
-    'prhps',
-    'pri&mdash;italian',
     'priadel',
-    'priapella',
-    'priately',
-    'pribicevic',
-    'price&mdash;any',
-    'price&mdash;granting',
-    'price&mdash;which',
-    'price&rehy;conscious',
-    'price-adjusted',
-    'price-busting',
-    'price-change',
-    'price-competition',
-    'price-controlled',
-    'price-cuts',
-    'price-discriminate',
-    'price-distance',
     'price-freeze',
-    'price-gap',
-    'price-he',
-    'price-hikes',
-    'price-indexed',
-    'price-inelastic',
-    'price-lifting',
-    'price-linked',
-    'price-lists',
-    'price-lowering',
-    'price-marginal',
-    'price-mear',
-    'price-of-one',
-    'price-off',
-    'price-per-acre',
-    'price-per-seat',
     'price-quantity',
-    'price-rationing',
-    'price-reduction',
-    'price-regulation',
-    'price-reporting',
-    'price-resistance',
-    'price-rise',
-    'price-setters',
-    'price-slashing',
-    'price-stabilizing',
-    'price-support',
-    'price-theoretic',
-    'price-to-book',
-    'price-weighted',
-    'price.',
-    'price/',
     'price/&sgr/k',
-    'price/availability',
-    'price/british',
-    'price/club',
-    'price/foreman',
-    'price/former',
-    'price/gloucestershire',
-    'price/income',
-    'price/kington',
-    'price/kune',
-    'price/lumberjill',
-    'price/mechanic',
-    'price/neighbour',
-    'price/owner',
-    'price/penhill',
-    'price/performances',
     'price/rail',
-    'price/rescuer',
-    'price/super',
-    'price/trainer',
-    'price/turnover',
-    'price/west',
-    'priceable',
-    'pricei',
-    'priceless.',
-    'pricelessly',
-    'pricelist',
-    'pricelists',
-    'pricem',
-    'pricepoints',
-    'pricerite',
-    'prices-as',
     'prices-cattle',
-    'prices.prices',
-    'prices.proprietor',
-    'prices/',
-    'pricewar',
-    'pricey-to-license',
-    'prichard/agatha',
-    'prichett',
-    'pricing.',
-    'priciples',
-    'prick(s)',
-    'prickable',
-    'pricked-up',
-    'pricked.',
-    'prickers',
-    'prickle-ball',
     'prickley',
-    'pricklier',
-    'prickly-heat',
-    'prickly-looking',
-    'prickwillow',
-    'priday-metford',
-    'pride/a',
-    'pride/descends',
-    'pridefully',
-    'prideux/coach',
-    'pridey',
-    'pridgeon',
-    'pridi',
-    'pridie',
-    'pridurki',
-    'priemer',
     'pries',
-    'priesca',
-    'priese',
-    'priesnitz',
-    'priest(ess)',
-    'priest-hole',
-    'priest-magicians',
-    'priest-physician',
-    'priest-ridden',
-    'priest-school',
-    'priest-slayer',
-    'priest-son',
-    'priest-sons',
-    'priest-turned-pirate',
-    'priest-worker',
-    'priest/',
     'priest/parish',
-    'priestcraft',
-    'priester',
-    'priestess&rehy;goddess',
-    'priestesshood',
-    'priestfield',
-    'priesthawes',
-    'priestholm',
-    'priesthoods',
-    'priesthorpe',
-    'priesthouse',
-    'priestland',
-    'priestless',
-    'priestley/engineer/oxfordshire',
-    'priestleyan',
-    'priestleyans',
     'priestleys',
-    'priestliness',
-    'priestling',
-    'priestly-kantian',
-    'priests.',
-    'priesty',
-    'prietini',
-    'priets',
-    'prieur&eacute',
-    'prifysgol',
-    'prig&rehy;gish',
-    'prigg',
-    'priggery',
-    'prigmeat',
-    'prihoda',
-    'prijck',
     'prikazi',
-    'priken',
-    'prikope',
-    'prilosec',
-    'prim-faced',
-    'primacare',
-    'primacies',
-    'primafix',
-    'primage',
-    'primagraphics',
-    'primagravidas',
-    'primaire',
-    'primaletta',
-    'primark',
-    'primary&mdash;secondary',
-    'primary-activity',
     'primary-colour',
-    'primary-quality',
-    'primary-season',
-    'primary-secondary',
-    'primary-sort',
-    'primary-textured',
-    'primary-use',
-    'primate-like',
-    'primatologists',
-    'primatology',
-    'primatu',
-    'primchet',
-    'primco',
-    'prime-3',
-    'prime-age',
-    'prime-crew',
     'prime-minister-before-last',
-    'prime-minister-in-waiting',
-    'prime-ministership',
-    'prime-track',
-    'prime/computervision',
-    'primed-burst',
-    'primed/4',
-    'primely',
-    'primer&iacute;sima',
-    'primer-template',
-    'primer-undercoat-topcoat',
-    'primer-walking',
-    'primeras',
-    'primesight',
-    'primesite',
-    'primester',
     'primeva',
-    'primevally',
-    'primevere',
-    'primevil',
-    'primigravid',
-    'primiparity',
-    'primis',
-    'primitive\'',
-    'primitive-communal',
-    'primitive-looking',
-    'primitive.a',
-    'primitive/gothic',
-    'primitive/modern',
-    'primitives/darling',
-    'primley',
-    'primmest',
     'primo&zcaron',
-    'primo-genitive',
-    'primogenital',
-    'primolis',
-    'primordialist',
-    'primorolo',
-    'primotif',
-    'primp',
-    'primrose&rehy;coloured',
-    'primrose-and-black',
-    'primrose-like',
-    'primrosesmp',
-    'primulinus',
-    'prin&rehy;ciple',
-    'prince(ss)',
-    'prince-',
     'prince-abbot',
-    'prince-cum-amateur-soldier',
-    'prince-enchanter',
-    'prince-in-waiting',
-    'prince-lings',
-    'prince-of&rehy;wales',
-    'prince-patriarch',
-    'prince-sign',
-    'prince-style',
-    'prince/polly',
-    'prince/princess',
-    'princeful',
-    'princelie',
-    'princeliest',
-    'princeliness',
-    'princess-and-the-pea',
     'princesshay',
-    'princesss',
-    'princet',
-    'princethorpe',
-    'princeton-educated',
-    'princey',
-    'princi',
-    'princip&eacute',
-    'principae',
-    'principal&ndash',
-    'principal+',
-    'principal/director/personnel',
-    'principal/head',
-    'principalement',
-    'principality.',
-    'principalls',
     'principals/headmasters',
-    'principj',
-    'principle(s)',
-    'principle-based',
-    'principles&mdash;for',
-    'principles.thus',
-    'principles/',
-    'principley',
-    'principum',
-    'princl.',
-    'prindiville',
-    'prindl',
-    'prindon',
-    'pringi',
-    'pringle-and-sons-how-may-i-help-you',
-    'pringle-pattison',
     'pringle/essex',
-    'pringle/nick',
-    'pringles',
-    'priniatiko',
-    'prinks',
-    'prinn',
-    'prinnie',
-    'prinotto',
-    'prinsen',
-    'prinses',
-    'print&mdash',
-    'print&rehy;outs',
-    'print-absorbing',
-    'print-dominated',
-    'print-imaging',
-    'print-man',
     'print-order',
-    'print-quality',
-    'print-rich',
-    'print-server',
-    'print-shop',
-    'print-shops',
-    'print-to-fit',
-    'print-wise',
-    'print.based',
-    'print.bat',
-    'print.com',
-    'print.unet',
-    'print_a',
-    'printed-cotton',
-    'printed-marbled',
-    'printed-report',
     'printed-silk',
-    'printed.',
-    'printed/deleted',
-    'printed/typed',
-    'printer\'s.',
-    'printer-in&rehy;ordinary',
-    'printer-on',
-    'printer-prepared',
-    'printer-sharing',
-    'printer-status',
-    'printer/fishing',
-    'printerly',
-    'printers/publishers',
-    'printi',
-    'printing-formatted',
-    'printing-ink',
     'printing-machinery',
-    'printing-office',
-    'printing-shop',
-    'printless',
-    'printouris',
-    'printroom',
-    'prints-out',
-    'prints/high',
-    'prints:the',
-    'printscreen',
-    'printserver',
-    'printshop',
-    'printwise',
-    'printworker',
-    'printz',
-    'prinz-carl',
     'priodfab',
-    'prionsias',
-    'prior-to-broadway',
-    'prior/kelly',
-    'prior_,_prior_to',
-    'prioress/and',
-    'priori-ties',
-    'priorial',
-    'prioris',
-    'prioritied',
-    'priorities-accountability',
-    'priorities.',
-    'priorities/situation',
-    'prioritisers',
-    'prioritises',
-    'priority-dispute',
     'priority-disputes',
-    'priority-gaining',
-    'priority-index',
-    'priority-setting',
-    'priority/',
-    'priority/4th',
-    'priosn',
-    'prip',
-    'pripps',
-    'pripria',
-    'priprietor/manager',
-    'prisci',
-    'priscian',
-    'priscila',
-    'prismatically',
-    'prismatics',
     'prisoedinenie',
-    'prison\'',
-    'prison-cages',
-    'prison-exercise',
-    'prison-gate',
-    'prison-officers',
-    'prison-stable',
-    'prison-term',
-    'prison-yard',
-    'prison/grendon',
-    'prison/surrey',
-    'prisoner-and-jury',
-    'prisoner-made',
-    'prisoner-of&rehy;conscience',
-    'prisoner-type',
-    'prisoner-warder',
     'prisoner/itc',
-    'prisoner/staff',
-    'prisonerisation',
-    'prisoners.tomorrow',
-    'prisoners.woodhill',
-    'prisones',
-    'prisoning',
-    'prisonner',
-    'prisonni&egrave;re',
-    'prisonnier',
-    'prisons.the',
-    'prisonscape',
-    'prissiness',
-    'pristigenys',
-    'pristine&rehy;looking',
-    'pristine-white',
     'pristinely',
-    'prisyaga',
-    'prit',
-    'prit5',
-    'pritam',
-    'pritcard',
-    'pritchard/coach',
-    'pritchard/head',
-    'pritchard/secretary',
-    'pritchard/speaking',
-    'pritchard/team',
-    'pritchard/victim',
-    'pritchard/wildlife',
-    'pritesh',
-    'prithie',
-    'prithivi',
     'prithivi-3',
-    'priti',
-    'pritty',
-    'pritykina',
-    'priv&eacute;e',
-    'privacy-obsessed',
-    'privacy.',
-    'privada',
-    'privas',
-    'privat',
-    'privatae',
-    'privatarum',
-    'privatation',
-    'private-car',
-    'private-eyes',
-    'private-for-profit',
     'private-house',
-    'private-like',
-    'private-line',
-    'private-market',
-    'private-pension',
-    'private-practice',
-    'private-rental',
-    'private-renting',
-    'private-school',
-    'private-sector-led',
-    'private-service',
-    'private-study',
-    'private/commercial',
-    'private/in-house',
-    'private/relational',
-    'private:public',
     'privately-',
-    'privately-agreed',
-    'privately-funded',
-    'privately-generated',
-    'privately-made',
-    'privately-managed',
-    'privately-operated',
-    'privately-preserved',
-    'privately-reached',
-    'privatelyowned',
-    'privaten',
-    'privatgelehrter',
-    'privatisated',
-    'privatisation\'',
-    'privatisation-deregulation',
-    'privatisationand',
     'privatises',
-    'privatus',
-    'prive&eacute',
-    'prive&mdash',
-    'privee',
-    'priveleged',
-    'prively',
-    'privet&rehy;lined',
-    'privets',
-    'priviledged',
-    'priviledges',
-    'privilege/contempt',
-    'privilegentsia',
-    'privileges.',
-    'priviliges',
-    'privleged',
     'privy-council',
-    'privy-purses',
-    'privye',
-    'priyayis',
-    'prize-draw',
-    'prize-of-war',
-    'prize-ring',
-    'prize-stuff',
-    'prize-wining',
-    'prize.the',
-    'prize/medallion',
-    'prize/penance/privilege',
-    'prizedays',
-    'prizefighters',
-    'prizefights',
-    'prizefinder',
     'prizegivings',
-    'prizeman',
-    'prizer',
-    'prizes/rewards',
-    'prizren',
-    'prk',
-    'prkos',
-    'prl&mdash;liberal',
-    'prl/6h',
-    'prla',
-    'prm',
-    'prmary',
-    'prmi',
-    'prncipally',
-    'prnt.cli',
-    'prntd',
     'pro&rehy;and',
-    'pro&rehy;anything',
-    'pro&rehy;boer',
-    'pro&rehy;cedure',
-    'pro&rehy;cessors',
-    'pro&rehy;fascist',
-    'pro&rehy;feminist',
-    'pro&rehy;footballer',
-    'pro&rehy;gressed',
-    'pro&rehy;hibit',
-    'pro&rehy;nato',
-    'pro&rehy;nouncements',
-    'pro&rehy;ruling-class',
-    'pro\'s.',
-    'pro-1080',
-    'pro-abortionists',
     'pro-abstention',
-    'pro-act',
-    'pro-acting',
-    'pro-acts',
-    'pro-afrikaner',
-    'pro-agrarian',
-    'pro-aliyev',
-    'pro-am/',
-    'pro-amniotic',
-    'pro-angevin',
-    'pro-anzus',
-    'pro-ap',
-    'pro-arafat',
-    'pro-asquith',
-    'pro-assad',
-    'pro-atlantic',
     'pro-authority',
-    'pro-aylwin',
-    'pro-ball',
-    'pro-biafran',
-    'pro-birth',
-    'pro-black',
-    'pro-blood',
-    'pro-bolshevik',
-    'pro-bonners',
-    'pro-bound',
-    'pro-brit',
-    'pro-bull',
-    'pro-canadian',
-    'pro-car',
-    'pro-career',
-    'pro-cases',
     'pro-casino',
-    'pro-castro',
-    'pro-cathedral',
-    'pro-catholics',
-    'pro-ceausescu',
-    'pro-censorship',
-    'pro-chairperson',
-    'pro-chalerm',
-    'pro-chamorro',
-    'pro-cnd',
-    'pro-commodity',
-    'pro-conscription',
-    'pro-consuls',
-    'pro-contraceptionists',
-    'pro-copernican',
-    'pro-cordes',
     'pro-cr',
-    'pro-creation',
-    'pro-creditor',
-    'pro-cycle',
-    'pro-cyclically',
-    'pro-dante',
-    'pro-defence',
-    'pro-delta',
-    'pro-deltaic',
-    'pro-deregulation',
-    'pro-deterrent',
-    'pro-development',
-    'pro-devolutionists',
-    'pro-dictatorship',
-    'pro-digs',
-    'pro-directorial',
     'pro-directors',
-    'pro-discount',
-    'pro-dnsf',
-    'pro-doe',
-    'pro-dog',
-    'pro-douglas',
-    'pro-drift',
-    'pro-driftnet',
-    'pro-drive',
-    'pro-duct',
-    'pro-duvalierist',
-    'pro-east',
-    'pro-ec',
-    'pro-eea',
-    'pro-emancipationists',
-    'pro-emigration',
     'pro-england',
-    'pro-eta',
-    'pro-ethiopian',
-    'pro-euro',
-    'pro-exclusionist',
-    'pro-executive',
-    'pro-federal',
-    'pro-federalist',
-    'pro-fertility',
-    'pro-fessional',
-    'pro-field',
-    'pro-fietzau',
-    'pro-fights',
-    'pro-filmic',
-    'pro-fis',
-    'pro-football',
     'pro-ford',
-    'pro-format',
-    'pro-formats',
-    'pro-france',
-    'pro-free',
-    'pro-free-market',
-    'pro-freedom',
-    'pro-gaullists',
-    'pro-gay-lesbian',
-    'pro-germans',
-    'pro-gorbachev',
-    'pro-grammes',
-    'pro-green',
-    'pro-guinness',
-    'pro-gun',
-    'pro-hanoverians',
     'pro-hashemite',
-    'pro-health',
-    'pro-hezbollah',
-    'pro-hib-ition',
-    'pro-home',
-    'pro-homosexual',
-    'pro-hoxha',
-    'pro-hungarian',
-    'pro-impeachment',
-    'pro-imperialist',
-    'pro-imperialists',
-    'pro-ingush',
-    'pro-integrationists',
-    'pro-intellectual',
-    'pro-interventionist',
-    'pro-islamist',
     'pro-iv',
-    'pro-james',
-    'pro-japanese',
-    'pro-jerusalem',
-    'pro-jobs',
-    'pro-khomeni',
-    'pro-king',
-    'pro-koffigoh',
-    'pro-laissez-faire',
-    'pro-league',
-    'pro-liberal',
-    'pro-libertad',
-    'pro-lloyd',
-    'pro-log',
-    'pro-logic',
-    'pro-loyalist',
     'pro-lula',
-    'pro-macao',
-    'pro-macmillan',
-    'pro-mahdi',
-    'pro-major',
-    'pro-malai',
-    'pro-male',
-    'pro-management',
-    'pro-marcos',
-    'pro-marketeer',
-    'pro-marketeers',
-    'pro-mazowiecki',
-    'pro-menem',
-    'pro-mengistu',
-    'pro-metalloproteinases',
-    'pro-monarchist',
     'pro-monastic',
-    'pro-mussolini',
-    'pro-naos',
-    'pro-nasser',
-    'pro-nasserite',
-    'pro-natural',
-    'pro-nd',
-    'pro-negotiation',
-    'pro-nigerian',
-    'pro-norman',
-    'pro-nottingham',
-    'pro-num',
-    'pro-o\'brien',
-    'pro-olf',
-    'pro-opencast',
-    'pro-oralist',
     'pro-pac',
-    'pro-page',
-    'pro-palestinians',
-    'pro-panchayat',
-    'pro-patriarchy',
-    'pro-pauline',
-    'pro-peasant',
-    'pro-peking',
-    'pro-persian',
-    'pro-pinochet',
-    'pro-polish',
-    'pro-poll',
-    'pro-pooley',
-    'pro-poor',
-    'pro-pope',
-    'pro-ppp',
     'pro-praetor',
-    'pro-prefect',
-    'pro-president',
-    'pro-pro-proposing',
-    'pro-proctor',
-    'pro-product',
-    'pro-profit',
-    'pro-provisional',
-    'pro-quality',
-    'pro-ratsiraka',
-    'pro-recusant',
-    'pro-reformers',
-    'pro-reformist',
-    'pro-regime',
-    'pro-regionalists',
-    'pro-representative',
     'pro-republicans',
-    'pro-restorationists',
-    'pro-reunification',
-    'pro-revolution',
-    'pro-right-wing',
-    'pro-road',
-    'pro-royalist',
-    'pro-saddam',
-    'pro-salmond',
-    'pro-science',
-    'pro-scottish',
-    'pro-sdf',
-    'pro-security',
-    'pro-sentence',
-    'pro-separatist',
-    'pro-sex',
     'pro-sharon',
-    'pro-shekhar',
-    'pro-singh',
-    'pro-situs',
-    'pro-sizewell',
-    'pro-smith',
+)
+
+blocks_61 = (
+    '\'!s%#ies%%tious&"re(!e&$uous%!y$+ridge/folly*#the$*tree/tutur#*nder-happy$)ge-action\'$bath\'&divers*#ing',
+    '$*kett-green()/director(!s%#ing%!s%!y#)ral-party&&ingual\'$sing("ms(2t-institutionalist**orientated*$type\'-ties/synonyms\'&zation',
+    '$*i-activity&&member%&active%#bus%.disciplinarity%"el%"ma%)potential%"um$$onic#+s-handicaps%#one%#two$&carden$.h&rehy;covered',
+    '%)-carpeted\'&overed&%lined%#est$%ieurs$"mn$%punkt#%thero$"o/%$crat%$nian\'"sm\'&um-238*,contaminated*#fed',
+    '*"iv*&plated+(oisoning,%wered&!s%!s#&vianus%#ose&"us%"us#"ym"#yed#$gram#!m$&bridge',
+    ')\'roscoff(&/devon.$port(!1($wood#\'nlimmon$"th#!s#\'technic#)wood-type"%z/bad#0e&ncaron;-prague!,m&ndash;4.00)$5.00)!6',
+    '""-6#(polymide").saturday$%unday#(thursday$\'omorrow"!/#-250&ndash;300##cim#\'kg/hour#"pm""10"%4002m"#651"#a/c',
+    '#!l#!p""d.#%l.exe"!e"!f""hf"!k"&lb1045"!m#-lib.gimmspoly#!s""of#!i#$l/10',
+    '\'"mg%#kg/($hour)!r%$l-10%\'million&!l%#rat"#prb"$r.aa%!b$#dir$#pre$#res$#s01',
+    '&!3##mpc")s-related#$pace"#trp"!w!3n&mdash;nationalist""-1"!0"&12(f2)""36"!5""c2",emohydraulic#)obarbital',
+    '$+matic-tyred)-ally-operated(#que\'%ocele(#sis%\'occocal&\'logical&)nia-which).cutependicitis$#pac"!l""mn""nk"+o-polynosic"\'p-style',
+    '"!r""sd"$thfv#!l""up"+v-dominated"!y!,o&eacute;zie$\'circ;le$)grave;mes*#tes#-zcaron;arevac*#ega"!-#!2',
+    '#)face-that%$gged#$lice\'$-men$!o#!q#&roosky#!s$%e-da-"!."&/danon#\'jansons#*kondrashin#\'lazarev#)tortelier',
+    '#!2$"99"%4/po5"%6/po7"$ach\'%&ed-egg%.ing-prevention#!d#"le#!s"#bee#$gees##joy&(-powered#!l',
+    '$#ete$!o#"ol#&recita$%ovsky"\'catello#"ey#!h$(ard-like%"ta%$yses$#een%"za$#ola#.k&rehy;fretten',
+    '$\'ed-book&!y%,t-battleship(&orough.!s\'*calculator(&lipper\'%diary\'%flask\'.handkerchieves\'&knives\'&liners\'&square&%.like&$able',
+    '&%knife&#lan&%phone&$size$#ley%!y$$mark$,ock-designed$$rass$!s$\'y/downy#(o_a_poco$#cke$&hontas$!l',
+    '$"no$!t##us."*d&atilde;o$+ecaron;brad#!\'#)-and-boom$\'danstvo$$like##ach$$rgus#&borski##ded$#led&!s',
+    '$#res%"is$$schi%"ta#%gered$#ily$%orica&"ny#$hale$%rasky#$ials$%ebrad$&schnus#(kopayeva#%laska',
+    '#!o$%bedov$)carpaceae&$taro$)eroticism$$inik$#lia\'"ns$%phile)!s#(romanija#(snappery$"ol&$ised#(uctivity',
+    '$"le#%zolic\'&sation\'&zation"\'e-faced#"ch$(illopsis#"hl#"ke$9jdnmfkurhhnrjksslplqxyjdd#"ll#"m\'$*-cum-essay&$ycle$!.',
+    '#%schke$!i%!a$(y/stared#"t\'$#(s)$)-comedian\'+nceptualist&%ritic%%dandy%&errant%$hero%-in-the-making%(narrator&\'ovelist',
+    '&*hilosopher&&rophet&+ublic-faith%&sailor%\'teacher&.urned-novelist$)/jongleur%(narrator$"as&$ters$!h$%icise\'"ty&"us%$sing',
+    '$2on/gloucestershire$$ries%"y-\'&lovers*#ing\'&phobic&%speak$*s/warriors$$tmes#!u#"ze"!f#(&mdash;a#$cher#)fenberger',
+    '##ers$!y#\'gibonsi##ies#%liahi#%o-ing$#ers$%lotti$(nomyrmex&&phoran#(rom-like\'$type##son#&ue-ish"#hai',
+    '#*iseaduslik#$jala$/ois-suomalainen#$lenz$"ia%!n#+oddaramulla$#rje"%i-son#)chel/head$%tiers##ein$!n##ker$#ile',
+    '.!s,!y#%n\'ted$"ar$4car&eacute;-liapunov$#ded$#eer$3g-poing-poing-poing%"ed$\'iemania$3t&mdash;contrepoint,*electronic,)impudence,&recall,%there',
+    '%"-5&&a-view\'-nd&rehy;click&%black\',y&rehy;point&-counter-point&&design&)for-point&%group&\'instant&$less&+mutagenesis&"of(+-production)%sales',
+    '&%saver)#ing\'&corers\'#ize\'%ource&#the\',o-multipoint&\'winning%!=&!1%#age&%taing%1e-&aacute;-pietre\'$work&&d-arch',
+    '(%eared(&roofed($toed&#lle&"r-((readings\'!.&"wd%%house%#ier&"n\'\'$g-to+%wards(!.(%s-out',
+    '*#and)#ly.&#ike%#ney%#on.%$plus%%rider%+s&mdash;the\'.rehy;gatherers&#-at\'#can(\'leaning(\'ounting\'(of-order\'%rated',
+    '\'*subsidiary&*_in_favour&#man\'"en%)y-chested)%inned\'%esque\'&headed(%orned\'%nosed\'&roofed\'&shaped&\'/anoint&%heads##pou',
+    '$$ault$#eau$+ot/carnival$%shoha##ses$&ioning$#ned$&on-fed(%illed\'&gassed\'$pill\'&taking&%blade&%ously$.soni&egrave;re',
+    '#$ters%$vin\'$"in$,ou-charentes&*/saintonge$$rine(!s#%vrade")k-tainted#"al%"de$%zukha#$e(s)$\'-bonnet$"r-',
+    '&$face&$game&&shaped\'\'traight%!e%%faced%$work%!y$$weed$"ys#%habov%.ra&ndash;royal&"el$#rel#"in',
+    '#\'lonstvo#,ora/princess%$enie%"ny$!t##ran$#osk%!v&#sky##ule$!s#\'ymerase"-l&iacute;tica.!o$1lsqb;itica&rsqb;l',
+    '#%\'tics#\'-nippon#%/econ##aar$$bian$"ca%$heck$*denylation$)k/jacques%$ovic$!n%+d&mdash;see&&-china\'&norway&$.gap',
+    '$"r-&$bear&#cap&%guard&(orbiting%&fangst&%leece%&imeter)#ric&\'s-armed\'\'ation-2\',ed-deuterium(!s&+te-daylight\'+y-sensitive',
+    '%!s&#tar&%ystem%#tex%"yi$(sminogen$&taivao%#kan%"om#$cari$"ie##der&$land$"hu$"ie',
+    '#+e-and-dagga&"xe(#ing%\'barrier&&earers%&carews($rier)$ying\'&tholic%&fished%$like%&marked%\'setters&(quatting&#tar',
+    '&)o-equator%\'vaulted+"rs*#ing%$zero$%/zero$&marchs%%icise*!d)#ing)!m(#zed)#ing%%onium$"na',
+    '$!o$%piece$!r$\'s-apart%#don%"ia%#tar%%worth$%umita#"fa#(gahavela$!e$$lase$$reen#-i&rehy;tician',
+    '&\'rehy;ed%#ano\'#sky&#rpa(!o%\'e&mdash\'(rehy;men&!\'&!-\'%based($lack)"ue("ox\'%chief(&ontrol',
+    '($rime\')detective((ominated\'(escorted\'$free\'\'general\'%horse\'(inspired\'\'keeping\'#man(\'ilitary\'(oriented\'&picket\'(recorded)%lated',
+    '(%ocial(\'tations\'(training\'#who($oman\'!y&#.as\'#kim&&/black\'\'customs\'%local\'(officers\'%press\')sociology(&triker',
+    '&#car&!m\'#an\').-cum-nursemaid*(friendly*0on&rehy;the-beat)!.)//anthropologist*\'insider**peacemaker)&liness\'(en&ndash)0/nurses/teachers*$thin&!y',
+    '&!e\'-s-advertising(\'.beyond)$john(+/strategies&)ng/public%&linico%#oro%$romi%.y&rehy;shaping&!*&\'-action*#ors(\'dvisory(\'nalysis',
+    ')*ordinating\'(decision)(termined(%riven\')executing."on.#ves\'(focussed)%rming+\'ulation\'$goal\',influentials)(itiating)(novating(%ssues',
+    ')#vel($ower\'(makers.3*2ing-implementation(%inded\'(obsessed(*rientation\',prescription\'/recommendations)&search\'\'setters(&trings\'&takers($ools\'\'variant',
+    '&$.the&!/\'.administration\'#mps&$less&\'setting$$doro$+i-promoters%\'i-genes%&ttinen$&karpov%"on$,m&eacute;ros$"no&#chi',
+    '\'!y$.o-encephalitis.)omyelitis(%demic&(myelitis%#/on%"cy%*meningitis&,yelitis-free%&rcetes%!s$&ptychs$#sh-\'%based(*elorussian',
+    '\'(japanese\'%latin\'\'russian\'\'scented\'#tin(&rained\'"uk&)/american&(ed-brass)&silver)$wood&#in\'("gs&$ness$.t&eacute;cnica',
+    '%+bureaucrats(&ocracy)!s(!u%%cally&$ians&!s%$ely.%%i-cal&"ca(/l&rehy;economic)/-administrative*+ideological*%legal*&reform',
+    '**scientific+$tyle+\'ymbolic,$stem*%union))/cultural*+ideological+)ndustrial*%moral*/national/social*,sociological)%amity)1ly&rehy;motivated+\'-ailing-(ppointed',
+    ',\'charged-(ommitted.%rrect,*determined-&ubious,\'induced.&flamed0&uenced.&spired-\'solated,#led,)realistic,\'visible(!n\'"he',
+    '\',ian-directed+%media+(nobleman+2planner-industrial*$.can*)/official("st(\'zations)"es\'!k\'*o-freudian),sociological)+theoretical\'*s-as-usual)"by',
+    '(".4((/foreign)&social(#ans(#ws4*!6&#eal\'!k(!e&#ken\'"ya&&zation%$rick%"y\'&$czna',
+    '$%ziano%%zotto#$jana#\'ka-dots$)inghornes$!s$#yth#.l&rehy;capping*#tax$%-axed%&capped)#ing%\'defying%#led%\'parrots',
+    '%\'sapping&&hocker%&takers\')x-capping)&payers$#age%#kis%!n%\'rd-like\'%/club((employer(\'hillier(&macari()publisher\'"ii',
+    '%"hn%+n-and-honey\'!b\'(carriers\'%dated(%usted+!y\'%grain\')spattered\')transport(#ube+!s&!y%"ra&#man',
+    '%$sley$!i%!a&!s%#cem&#ino&"le%"na\'.tor-pollinated&%g-day(\'related\'!.\'#ton&\'ologist-!s',
+    '%#tt.$#och&)k-krasner\'$/lee)$ocal((villager\'\'shields%!i%&kshaws%$nois$&uantur%"ms%%tion-*\'cutting*(emitting',
+    ')&.clare*#the\'"ve$&winner*!s$(y/amanda%\'annaish%#pak%#wog#%madie%#ise$"er$#ood#\'nisches#&o-coat',
+    '%#mad%%necks%\'players%&shirts&&weater%$type$,/halter-neck$!c$"ga%#ies$/naise-fantaisie/#sie%%ecked%#ies&&sation',
+    '&#zed%&oreste\'%oesti%$skiy$%shirt$$vina%+nick&yacute#$pero#%reath#$sham%"ek$\'k&eogon%#iej$#ted%#on.',
+    '#$tawa$"en$$ical(!s&!s$\'oratsky%!x$\'roncine\'!e#(ugaevsky$\'nnaruwa$&ostrov#$vier#%warth$$orth',
+    '%.rehy;propylene$4(alkylmethacrylate)s%*but-1-ene)%&da-dt)%)ethylene)%*hex-1-ene)%3methylmethacrylate)%,p-phenylene)%.vinylchloride)$5-(methylmethacrylate)%+chlorinated\'$roma&&orrect&*rystalline%(d-lysine',
+    '&\'extrose%&ethnic(%ylene%&filter%/l-lysone-coated%*phosphates%%sided&%perma%\'technic%$wrap$\'/cotton+!s$"a+%%cetal(&ylenes',
+    '.%/38:1*#tes)"ic%#in.\'"us%(lkenoate%#mid\'"no%(ndrously&%ionic%&rchies&\'omatich%#tom&%tract%)utography',
+    '%!e%)rachygyny%)utadienes$,caprolactone&%rbide+)-armoured(&onates\'#pou&!t\'#ion*!s%"el&&phalum%%heate&)lorethene',
+    '*&ethene*%prene&\'orality\'&tomies*!y&%rests\'&inides\'-ome-decorated+\'painted%(istronic%%litan&%ongal%)onjugated%\'rystals%&ulture',
+    '%%endri&$smus&$ukes%(i.polydc&\':polydc&3chloromethylinlon-4&)mensional&$psia%$onal$(embryony%"ne%/ster-and-cotton.\'worsted*$coat."ed',
+    '*%fibre*#mix**reinforced*%satin*$type)$/50%*%nylon%5thylene/polypropylene%$ucte&\'rathane$%femus%"il\'#led\'$ters&!x',
+    '%\'unction,"al$(galaceae&&mistic%$enes\'&ically(#sts%&lycine%%notan%-on-in-polygon\'(al-ended\'-s/antialiased%&raphic)!s%\'ynandry',
+    '$*halogenate%&edrane%%istor%\'omicide,(/suicide%)ydramnios((oxyether$%imide%4nosinicpolycytidylic%(sobutane\'&prenes$$kles$&mathic&!x%*er-ceramic',
+    '(\'diluent(&liquid((modified(*reinforced\'!.\')/additive(\'solvent\'$ase-+*associated+%delta\'!e\'&ically(#sed*!s)#ing',
+    '\'"s.&!s&/thacrylonitrile\'"is\'%rical%)icrogyria&!x\'"in%#nia%(olybdate&\'prhisms&\'rphisme%\'yosites&$xins$3n&eacute;sie/tavini',
+    '&!s\'*ian-themed&*uropathies%&ominal&#sic%2ucleotide-specific&\'leotide%"ya$$odon%%lbion%"ma\'%virus%,xenethylated$)p-feeding&$like',
+    '%$aint&#rty%(ectomies&#don&*ptide/kg/h&%tides%$hant&%onica\'-sphoinositide)+oinositides&&yletic(#lum%$less&&icates%"od',
+    '\'!y&$idal%#rop(+ylene-based\'\'todonta%%terid*"aw*!s&$icus&$oton&-ych-surveyors%,uththeketlon%&yrrole$\'rhachis$\'sacride',
+    '&&turate%$eal.&&mantic\'#ity%&ilicon%$omes&$nics&&rbates%\'tichums("ta&&yrene/+!s%#urf%\'yllable&*naptically',
+    '*!e$\'taffeta%&echics((nic-wide+!/,(colleges+#ian,"en+2s-cum-universities-)designate&!l&(theastic&%xtual%%hanus&%eisms',
+    '\'#tic%%omous%%rauma%%unnel%$ypes$(ukhovich%.rethane-coated,)/silastic&"ia$\'versity%$inly\'+yl-chloride)%idene)+pyrollidone%$ocal',
+    '%&hatnot$$xena$%zonal"*m&rehy;pom#%-land$\'teasing#!a$#ceo$$rede%#ina\'"us$(torhinus&(schistus%#ums#!c',
+    '$-granate-tough($ites$\'ranians%$elia\'#len%$land$\'shchiki#%ganny$%olgub#)ialovskii$\'culture$#nki$"ss#*mefriterie%*l-smashing',
+    '%!t$*ie-bashing&$land&!s$!y#!o$\'logical\'!y$%nella#(p-loving$+a&rehy;dour%#les$%eians&$ians&"us',
+    '%"ux%\'y&mdash&%/posh$$hrey$!i%+&egrave;rre%$doms%"er\'!s%$lius$%odour%!m&%-like&!s%#nne',
+    '%*us-looking(&merely#!r$"oy"%n.cli#%apean$&tshego#$ceau%#ing%"la&"ot(%-type$\'heville%%ielli%\'o-style',
+    '%#rus#&d\'ring$)-building%(dwelling%&living%&making&"ud%&owners%$pump))s/systems%$side&$lime%%weeds$,/businessman%&public',
+    '&#ovo$#ies$$life$\'orosity%%wners$(s/forest%&katers$"us#$ente$%rines#+g-pong-pong$"id%#nes$"yi#%iente',
+    '$$elle$"ie#(omaryeva#$rine#\'sbourne$"es$#hed$&onshow$&worthy$"yn#1t-&agrave;-vendin%(builders%*de-l\'arche%0l\'abbe-d\'arnoult\'-ev&egrave;que',
+    '%+r&eacute;my&)hyd-y-fen%&y-pant&,r&rehy;esgob$\'/thames$*a-da-fruta%$ccio%$mine%"no%%rdawe&$lier%&udemer$&icello%&ficals)$tion',
+    '(#iae)!s%!l%%ssara%"vy$(newynydd$#one%%oning%&ppidan%$rson%!s$&resino%)hydygroes$&yberem&%odkin',
+    '%%pandy&$ool3*#pts&&ridd35%*rhydygroes%&sgaryd#/y-an\'&rehy;trap\'&d-trap%%brown%$cart%&dealer&%riven%(escorted%\'goddess%#mad',
+    '%%sized%(trotting\'#uck$!.$&/horse$(trekking#"zi")o-mi-loom$#poo\'$-poo\'"ed\'$hing\'!s##der$&le-boy',
+    '\'&headed\'$like&!d%#ing$!y#(ey-wooey#%f-dah$"ie$"ta&!s%\'er-joke##hed&\'-poohed$!s##ing',
+    '%"ri##ka\'%%-like$"ie#"l\'$&-based%(cleaning%%rooms%%shark&%trewn&\'urround$%/agar%\'terrace$#beg$$deck',
+    '$(e-bilbao&\'wareham%%/home&&oxford&$team%"d.%"rs%*y-provided$%house$#man$%rooms$(s-winner%$ides$*ton/mother#!m',
+    '$$swad#"of$\'offffff$"sh#*p-scooping*!s$(er-scoop$!o$!s#+r&mdash;and+\'someone$!-%#box%$from%%house',
+    '%4miss-taylor-that-was&$outh*"ed\'$ving%#net%)poo-ray-a%\'selling&\'pirited%#the\'&ing-he,Jow-you-must-be-suffering-thank-god-i\'m-not&$ithe$#/no$#boy$\'er-paid',
+    '$(ly-armed\',consolidated*\'trolled\'&damped(\'efended)\'veloped()ocumented(&ressed\'(educated()ngineered\')insulated\')motivated\')organized\')performed.#ing',
+    ')\'otected\')qualified\'(reviewed("un\'$shod(%truck(\'urfaced\'*understood&\'.damped$$ness$!t%&erboek#!t$#led$!s',
+    '%!s#"ya""p-$:as-reinvention-of-the-self$%based&%wlers$$code$)dominated&"wn$%esque&(sentials%#yes$\'fabness%"op$%house',
+    '$$kids$(learning$&making&(rketable*#ing%-eets-politics&\'lodrama&#tal%(obility\'$%noise$#off%)rientated$%panto%&ickers%%opped',
+    '%)sychology%#unk$\'related%&iveted$\'science%%logan%$ocks%(tupidity$\'up-book$5yoof-electronic-media#\'/comedy$$folk$\'musical$)political%#unk',
+    '$3soul/jazz/harmonica#!2$%-pop3$%/pop3#!3##490#$adum$!j$$vgaj$#yan#%blast#/e&mdash;lawyers%1rehy;demonstrated$(-burning,!s',
+    '(&nessey%$like$%/bone%#lwt$!l%!o$&mobile$$rian%$ties$$ttes$!x$#yes#$guns#%ilius%#lae',
+    '$!n%!s$#wek##kid%!n$"ov##lak%&r-tall($rees$#ier%$teal%"us#(meisters$,obility-type$(ungously',
+    '$/cat&eacute;petl\'%epetl$%ffkas$$kovs$$rlui$"ut$-v&mdash;mayor%"er%#ici%#ski#&padams&#ump%"ea$"el%"re',
+    '&(ian-type&&lation&%photo&$well%#ver$#ier&\'s-style%"n\'&(g-crease$#lau$!o$+y-and-bangy&$cock&(flowered&\'growers',
+    '&#red&\'scarlet\'#eed*!s&%water%&filled#!r$#ock#"s.$$icle%$tion$!o%"ck$$tack&"rs',
+    '##tel%!r$%hrash$&icians#,ulaires-usfp&#nts&*r-academic(%based)(ourgeois(\'festive)$ront(%sized\'#.at\'(/tourist\'!i',
+    '(*ty-winning*!.(\'zations\')ly-called*\'elected*$held**orientated&!t\'2ion(&pound;520.03)+"s)*!**!-+\'control+,distribution+*orientated',
+    '+$that*%.this*(/housing*+:10,781,000-%6,000+*23,200,000,%5,355+\'410,000*#ist*#sof)"sn%$iats&#sms\'\'t-based)(oriented',
+    '&!s&&usness$#nds##yan"#qet#%uelin%!t"&r\'tray##ana$$ries$!z#%blems#-celain-coated,%vered*)enamelled',
+    '*$pale*%white)!.&#ite&&lanite\'!i(!o$#hed%$side$#ius$%ofram$&upined#$dage$"en#\'e-canal',
+    '&)couringly$"ba$&fluids$$less#$fert$/iry-raskolnikov#$gera$!h$%ramme$%ueres#&icidal$#rua$\'simetry$2tt/conservationist$%zhova',
+    '#,k-barrelling&$orne&&utcher%+chop-shaped%(dripping%#fat$&/human$&enhams%!t$#fat$$heid$"in$&y-pies%$pine#%lezza',
+    '%%novel%$star$(agraphic$!e$&finder$.o&rehy;graphic%(-graphic&*politician&$star%%cracy%6fornocacophagomaniacal%(graffiti)"ie((phically*"y.',
+    '%!s%%video#*ohyropsins$%meter\'"ry$!n$#pak$/sity-controlled)+resistivity(-/permeability%"us%!z$(zumienie#\'pentine$&hyries',
+    '*(quinones\'(oblastic\')y-crowned(%style$%oise\'(%-hide(!d($skin%\'rtional*!s#%retta$*idge-bowls)$grey((coloured(!s',
+    '&!i%!t&-t/environment3"al$!o#.sche-developed(\'engined\'"s.&"ke$%grunn$#ild$"on$$tner#3t&eacute;g&eacute;s%*rehy;based',
+    '&"ou&$uilt%$city&$oton%(d\'envaux&%onant&\'u-salut%%folio%$like%(na-blagh&#euf%,purple-nosed%(tippling&#own%%vieux',
+    '&&cabins%,ble-oriented(\'/mobile%%craig%*down-based)!e%$flex%-ge-la-prairie&"il\'"ng%"il%#les&$lach%%menti%&phones',
+    '%!s&%tumps%$tive&!o%#yed$%bello$/e-fen&ecirc;tre&(knapsack%\'feuille%#man%%nding&#iel&#tum%.r-and-gardener\'\'brewing',
+    '\'"it\'$type&(/cleaner\'(landlord\')messenger0!s\'&trauma&$fied%$ssie&$well%%verde&"in$%fires%/olio-management)"s.',
+    '(!e$(h-y-rhaw%"au\'"lt%%kerry%&melgan%$neal%(ole-like&!r%$pean%%reath%&scatho$+i&egrave;re%$cada&(o-affair',
+    '%"er%$nari&$gale%(on-sized\'%/dose\'#ing$&lights$%mahan&(n-stuart\'$moor\'%teaus("le%$outh$#ney%"ov',
+    '%\'carrero\'#val%&health%&n-diet%#roz%\'studios$$quin$"ra&(it-busts)$head*#ung)$like)$mode)&necked)*photograph',
+    '*$ized&"ts%+ee/dunvegan\'"ve)!s$\'s-crues&\'de-voix%0mouth&ndash;caen3%rdiff2(herbourg1"le1"st*%-bath,&ristol+)liverpool',
+    '*!1$#ual%%gaise\')l-england&#ual\'(ese-born+(language+(mediated+%style%$laca(%oides$$view$\'zamparc#%ubjak$!d',
+    '%!h#$zner"*s&eacute;e+!s$+rehy;itions##ait$$laky#+c-compliant$!h%(arskyana#%eiden$%lenie$"ss&"ed&#ing',
+    '#)h-looking$#all$"ed$$ness$!o$$pura$!y#)i-sisters$\'bilidad$"d.%%olius&#nus&%riius&$tuus%(riv-type',
+    '$!e%&s/soon$$mani$(ng-pouch$"sh&"un$"t-%#ed.%!i&*on-effects)\'finding)+integration)\'on-host)&papers))sensitive',
+    ')&taking*!o)$wise(".1)$push(!/)\'marking(!=)$12.5(\'alities,!y("s.&(ve&pound("\'/(!-',
+    '):but-need-to-be-paid-for-it)&charge)!g)#npv)%rated)(thinking)\'voltage)\'working(+/favourable(+association(-ly-aggressive*!.*+/negatively\'(ist-type(-ty/negativity',
+    '&!n\'!s%%ronic%"s.%"us$%utive$-x-compliant/x%".1&!2#"ki#2l&mdash;luxembourg$!e%$dgol%\'thwaite##nan',
+    '#"s.$$bily$"ed%#nte%#ses&)s/express\'$able\'"er\'-ion&mdash;but*\'-\'here\'+(oriented*\'/brings+.non-possession*"em+!r',
+    '(/ve/unreasonable%$ting$!i%"be&"il(!i)(t&eacute*"y.&*le-closure(#.16)#for)#the(+/reasonable(#_as(#see',
+    '($ties\'&y-aids(\'_nearer%#det$!l$"om%%ssona$%sible(!y$)um/robots#,t&mdash;four+&moulay%*ndash;1923-"45-"59',
+    '%*rehy;1960s,#90s*,althusserian*&holder*.interactionist*\'liberal0$tion*)partition+&lowden+\'randial*+restoration-)urrection,%tired*&techno%*uacute;mus',
+    '\'!8%-.registration%!1&#290&!4&#511\'"40&#688(!9&#823\'"31\'"57\'"61\'"73\'"81',
+    '\'"06\'"29\'"30(!7\'"47(!8(!9\'"51(!4(!5(!7\'"62(!5\'"72(!3',
+    '(!3(!6\'"94%#20s%"50%%60/65\'!s%#9pm%*absorptive&,ccreditation\'"id\'*quisitions\'$ting&!d\'"am',
+    '\'"en\'&option&#ero&(greement&%lbert\'\'coholic\'%lende\'$most\'\'portian\')ternative()husserian&*naesthetic(%lytic\'&d-beam)$wire',
+    '\'&orexic&)pocalypse\')plication&+rtemidorian($isan\'$usha&(scension\'%pects&&uditor*!s\'\'schwitz\'+thorisation%%babel\'$cked\'!g',
+    '\'#ins\'"nd(!k\'%rrage($thes*#ian\'.sic/in-service&&eatles\'#dan\'%nnett\'(rgsonian(#lin\'\'veridge&\'i-polar\'!d',
+    '\')smarckian&$lack*$list\'+oomfieldian&$oard\'"er\'#wie\'"ys&(reakfast(&chtian\'\'oadcast&&ullock\')rdigalian(#ial%\'cabaret',
+    '($vino\'%rdiac(%riage\'(stration&"bs&(easefire(&usescu&+hampionship(#pel)#man($rter\'#eta\'#ild\'-olecystectomy&(ivil-war',
+    '\'#erk\'$imax\'"ub&$oach\'\'ckcroft)%tails\'#ded\')llisional\'$mbat(&intern(&mittal)"on)%unism(%puter\',nceptualists',
+    '(#dom(*federation)%ucian(%gress(*solidation($tact)$ract-#ual\'(ronation(#tot\'#unt&&ranial\'(etaceous&%urfew\'%stody',
+    '&\'yclical%%dance\'"wn&\'ecadent\'$gree\'+monstration\'(pendency\'*regulation&\'inosaur\'&saster(&charge\'"ve(%idend&"oc\'"pe',
+    '&&ubbing(#cek\'%opoly%!e&#csc&&diting\'(wardians&)llis-beto&(mergence\'$pire&+nvironments&)valuation-"ve()ngelistic&#xam',
+    '\')perienced(%osure\'\'tension%$fade\'"ir\'$mily&"ce&\'estival&%ilter\'\'nancial(&niston\'$sher&$lash\'#oat\'!u',
+    '\'\'rmalist("um&(ranchise\'\'eudians&5ucking-impressionists\'$lton%(galilean\'"ry\'!y\'#zza&)eneration-"ve&&ittins&*ladstonian\'!c',
+    '\'(nococcal\'\'rbachev&\'racchan(!d)&uation(&mscian("nd\'\'eatness&\'ulf-war&(ymnastic%2h&uuml;sker-d&uuml&$adow(&rianic\'&rdcore\'%ssler',
+    '($ring)!t\'%parin\'\'rcynian&%igher\'*llsborough\'$ppie)!y\'%story\'\'tchcock&"nd&\'ogmanay\'&llands\'%meric\'"wl',
+    ')#ing\'\'rricane&\'ypnotic%#ice&*deological&*mperialist()risonment&\'ncident-\'-trauma\'*flammatory*$tion(3ormation-technology\'#put\'(spection(*tructional',
+    '\'&vasion(&ersion&#ron\'(rigation&$saac\'"ms%*johnsonian\'%squin&\'udgment\'%ngian%\'kennedy,(-johnson&\'homeini\'+rushchevian&&innock',
+    '%\'landing\'$rvae\'%teran\'$unch\'$wson&*egislative\'&onardo\'&ttrist&-iberalisation\'$ghts\'%minal\'%ngual\'&teracy+"te&)ndustrial',
+    '\'\'fthouse\'#uis%)maastrict\'&cbride\'(dchester\'$gyar\'\'inframe\'$king\'$rcos($ital,)-divorced(!k(&tyrdom($xism+"ts',
+    '(!t)"ed(#ure\'!y&$eech\'%ssina\'+tanarrative&!i\'$ckey\'"ss)#ile(%tress&\'odalism(&ernish-4m/post-modernization',
+    ',"ty(%ifier-!s\')narchical(\'etarism($soon(%tague\'%rphia(2rissey/marr/smiths(#tal)%eming+!m*!n\'"ve&"sc',
+    '%0n&uuml;rburgring&"ab\'#sal\'&tional-\'ization\'"zi&#eck\'\'wsnight()tonianism&#ine&&ominal,"ly\'+rmalization-!e%%obits',
+    '&+ccupational&&ffices&#pec(&ration&$scar&#tic&%xford%$pace\'&ganini\'#nto\'&rkhead(\'turient,$tion."ve)!y',
+    '\'#sta&#eak\'$pper\'\'riclean($mian\'#ter($rine&)haryngeal\'+ilosophical\'(ylloxera&%icnic\'(lgrimage\'%oneer&$laza&"np',
+    ')!o)%tical(!l)#ing\'(sitivism.!t(%tcard)+ructuralist\'&tation&\'remiere($sent\'%oduce(\'tection&&uberty)%scent',
+    '&%ython%$rada\'+ndomisation&&eading\'\'ception+"or-"al($ruit\'$flex\'\'ligious\',organization\')perfusion\')signation($ults\'%tinal',
+    '\'"ft\'!o&#ock\'$dney%&safari\'#les&#can(%rcity\'+hoenbergian&&eebohm\'\'lection\'%minar\'&ntence\'$rial&&haring',
+    ')$ment&0ixteenth-century)#ies\'&zewell&&lavery&%miths&(ocialist\'(merville&)peranskii\')lenectomy&)talingrad)!l($tion\'#eam\'%orage',
+    '(+ucturalisms/"ly\'#ude)"io&#uez\'Nmmer-oh-my-god&rehy;how-can-i-afford-christmas\'&perior\'%rgery(&render&\'yllabic\'*nchronised%(takeover\'"ng\'&xation&"ea',
+    ')#age\'&lecoms\'\'nsioned\'&sting\'\'%tanus&"he($atre($rapy\'$irty(!s\'$rash&"mi&$okyo\'#nal\'!p',
+    '(%ining((nsfusion*%ition*%plant/%ation\'$eaty\'$ibal&%unnel&!v&"wo%%unced\'#ion(\'versity&$rban%(variscan',
+    '\'$lvet+!s\'"rt&$ichy($tory\'%etnam\'#ral%%wales(!l\'$rhol($nock($time\'#yne&#ear\'%dding',
+    '\'&stland)\'phalian&%hitby&)iddicombe\'\'lkinson\'\'mbledon\'(thdrawal&$oman\'+rdsworthian($kout%!x%)yuppiedom%)zechstein&*oroastrian$!/',
+    '%#etc%*modernists%%pupil%&thread$$_for&#ree%(meridiem$%abank%.ge-stamp-sized\'!s%+l-addresses&\'isation&"ly&!m%"ns',
+    '$$bags%%ellum%"oy\'!s$&caecal&#rd-)&pretty)&seller*#ize)\'writing(!.($ware%$ecal%%haise&%eques',
+    '%&lypeus%%oding&\'lectomy\'%onial&\'mmunist&%pular&#xal%.ranial-cranial+"ly&#ipt$.deconstruction%"oc\'#tor*#als$\'e-haste',
+    '%\'cdysial&!h%\'d-value%,mbryonically%+ncephalitic&\'doscopy%$powa%&r-blue\'&design\'&format\'$like\'$mags)$king\'-opportunities1!y',
+    '&(/leaflet&#ers&#ial\'"ng\'(or(cu1b))(-ventral)!i*"ty*#zed+#ing\'$tati&#man&"ns&(o-dorsal(\'lateral',
+    '\'\'lateral&\'s/cards(/pictures/charts%!s%)xperience$(feminism%\'ixation$#gem&"na%$rad.&"es$,haemorrhagic%(epatitis%#ill%$uman',
+    '-(released%,ybridisation$#ies%%llion%(nfective\'&luenza&(g-horses\'!.\'"s.&*terpretive%#ons%&pankki%%tion.$)kinematic$&launch',
+    '&.thwaite/father&%white$(man-poet\'!/\'$ship&,ster-husband*)s-general&#tch\'%urity%(enopause%)istresses&%totic%!o&)dern-type*!.',
+    '&&rtem-s%"r.%.ultiplications,#ers$\'nuclear$!o%&cciput%*esophageal%!n%&rbital&&ogenic%%stial$%party%#erm%)haryngeal',
+    '%&onable\'5ement&mdash;announced,!.%&randia($tial&%imary%\'ubertal$-qualification*$ying$,registration&)plicative%#ift%#oad$$s-in%$aver',
+    '&+lerotherapy&.ript&mdash;the*%-like*"um%(econdary&%izure%$have&"op%)ternellum&(ructural%\'ynpatic$)treatment$(ulatable(%ional-/&rehy;deductive',
+    '&%ingly$%viral$$wirt$!y#\'y-style"*t&eacute;e$(rehy;ash)\'boilers#!-$)a-l\'oille%*u-chocolat$\'boilers&#und$\'coiling$*decoration',
+    '%&rowing$$head&#rbs%%olers&#use)!s$#lid&"ke$&making%$ould$%plant%&ourris$(scourers%%hapes\'#rds',
+    '$(throwing$"up$\'valiant#&/vodka#!a$)ble-water$#cki$%holic$#mic%+ogetonaceae&!s$%ntial$"rd$+sh-feldspar\'$rich',
+    '&"ic\'#um-*"40*%doped*(promoted)&/argon$!t%"er%#ion($ibus%(o-beetle\'$chip\'%faced(\'ritters\'\'growing',
+    '\'\'lifting)"ke\'\'peeling(&ickers(\'lanting\'%sacks(%haped(%tarch)%orage\'&topped&+es-in-a-bag(!.)#ask(&/apple\'!y',
+    '#%banks$&oiling%#und#%dukhe#!e$%benko$%idaia$!l%!l$!n%"ce&"y/%#sac%(tial.m.b)$iser',
+    ',%fatal,"in,%nasty,%toxic,&useful(1ting/constraining\'$llae\'"on\'$sing\'"um%!z&"as$!r%*-mo-get-on%"ba',
+    '&!s$!s#$fuls##ger$%ieter$$rown#"he%#red$$inus$%older)!s#$idas$%emkin$#lla$&ngaris',
+    '$#on\'&\'-making\'\'stained%!r$"st#$kins#$less#!o$#cki$$iler$!n%&g-gang$#roo$&tskaya#&person',
+    '$"os$#ush#(scourers$#ful$$herd#%tages%"ll%#ugh$+er-elvehjem\'*mog-get-on\'\'painter&%.this&"/3\'(workshop&#ers',
+    '&"ne&+s-ballotini&+y-fragments(&series)%tyles\')/ceramics$"ie&!z%$ness&&g-shed%$sham$#led$-s/barclaycard&&mother&\'tourism',
+    '$!u%#vil##upa"$u-hd$#spp#%belle$#lic##cet$*h-carrying&&lining&\'vaginal%$anal%"er&!t\'!i',
+    '$%nessh#)dr&eacute$#yal#"er#)ff&eacute%#ela#"gy#/illy-fum&eacute+!e#$jade##ket#&l-erik$%antaz%"rd%$tion',
+    '%$vara$$idor%$n-le$$lada$\'nabrone$#pes$%senia%"om%#sen$%ticed%\'on/base((regional%$ries&)y-keeping(&laying',
+    '%!s%!y##mon##nas$&ce-box&!.&"rs$)d\'s-worth%%-cake&%eliot&\'the-man*$poet%!.%!/&\'british',
+    '%"as%$bury%"es%$iana&#ngs&%sford%$less&$ocks%"s.\'#and\'#for&&/6.5kg&%avers&$tock&!w',
+    '#*p&eacute;e-!s#&rboire%"us$+ed-concrete\'\'himself%"rs$\'farrokh+\'/philip$)ing-cream$#ous$\'parlers$$rais%"ir$%shoja',
+    '&"nt%%rayed$!y#!s$$ette$*s&eacute;s%!e&#pin&#tte%.i&eacute;reuse&#ere%"ou#(t-lipped$)er-pigeon$#ily',
+    '"$vero%"te&/y&rehy;stricken\'!-(+environment(\'induced(%level(\'prayers(\'striken($trap\'".2#%idone$#las#"re"%w-mia',
+    '\'!s#\'/milton#&akaddy$!n$!r#"da$*er-coating)%vered\'%flask(#orm\'$kegs\'(magazine(#ill\'%trail+!n',
+    ',#ned&!.&\'ed-down&&hounds&%iness\'#zed&%maker&$puff*!s&&y-grey$$rill#&efully$.ll&ndash;bryce&!-\'%jones',
+    '&!/\')ashchurch(&vebury\'8berkeley/gloucestershire(&ristol\'+cirencester\'(disabled\')faringdon*#mer(%riend\')hankerton\'&london(&ydiard*#ney\'"m4',
+    '\'*netheravon)$went*$town(*orthampton\'&oxford\'%piano(&roject(%urton\'%river\',sevenhampton(\'tanford\'\'tetbury\'\'wembley(*oodmancote&"ii',
+    '&#weg$+r&mdash;see-%talin&%ndash&-rehy;assisted+%filly,&olding+"it+*maximizing+&target%!-&,&eacute;lite&)assertive\'#xes&&ballad',
+    ')"ic\')ehavioral\'$locs\'&oating("dy(%oster+#ing&&centre\'&hordal\'%oated(\'nductor)&suming)\'tainers\'$razy(&uisers',
+    '\'*iffraction\'&resser\'#uct&%elite\'\'nabling()gineering&\'fantasy\'#ist(!t\'$orce\'#ree(\'om-tyre\'&ucking&$game*!s',
+    '\'#igs($ving\'#rab($oups&#had(%mmers(#ppy\'$eads&"in(#put&$kick&%laden()w/poisson\'#ift\'%oaded',
+    '((ximizers&&of-two\'\'n/power\')rientated,"ed&$pack*!s\'&laners\'%oints("le)&itical(!p\'&ullers(#nch&\'related',
+    '\'#ock&$safe(%pping("ve(!w\'&eeking\'$hift(%owers\'%ource\'$tate(%eered(\'ructure*%ggles\'#uit\'\'witches',
+    '\'"he($rust\'$rike)%pping&$user(#ing&#war\'\'ielding("se&#yes%!.%)/attitude&%being&#dtr&+information',
+    '&$lord&(planning\'\'owergen&&volume%%1.tif%%2.tif%%3.tif%%4.tif%%5.tif%%6.tif%(=boosted%#age&!n&$rray%.base/workgroup',
+    '&%oater&&roking&,uilder-based%%cache\'!r&%hords&(omputing\'"te&$rush%\'dialler&%river%$file($ters&$lood(!w',
+    '&#ull($ness%&glydes&#rip%\'holders%#kit%0lessness_as_well&%ifter\'"ne)!s(!k%\'manager%,open-powerpc)(/powerpc%%packs',
+    '(/poweropen-based%$risc%\'s&mdash&,-dissipating\'\'ofentry\'\'sallmas\'$that&$.and&!/\'(changing&&creens&%earch\'%rvers&&harers)#ing',
+    '&#orb&$peed&%ystem%%track%"up%$view%\'windows$%sland#&hattan#2ick/worcestershire##ler#$ning#&qerful##rie#"te',
+    '$#ing$"on#)ys/county")x-factory#!e#$well#&y-face"\'yentyng$!r##les#$ning\'!s$$ter.%&ington%\'on/team',
+    '##ton"%zemni$$rski#8i&egrave;res-foucaucourt$%driv/)(supadriv#&nanski$"er#"za$(oferrato!/p&mdash;popular"!*"#-21#!9##mos',
+    '",.1&ndash;112$",2$*0&ndash;11%)1&ndash;5%+2&ndash;103%+3&ndash;104%)4&ndash;5-!6%!5%*6&ndash;14-!7%!7$*1&ndash;12%!1%*2&ndash;13',
+    '%*5&ndash;16%*6&ndash;17%*7&ndash;19&,7&ndash;1178%*8&ndash;21$*2&ndash;24%)0&ndash;1%)3&ndash;4&)4&ndash;9%!4%*6&ndash;30-!7%)7&ndash;9$!3%)&ndash;14',
+    '%+2&ndash;154%+5&ndash;136%)6&ndash;7$!4%*0&ndash;53-!6%)5&ndash;7%)6&ndash;7$"51%)2&mdash;3%)3&ndash;6.!0%)6&ndash;7%)8&ndash;9%*9&ndash;60',
+    '$*6&ndash;18,"36%!-%)0&ndash;2%)2&ndash;3%)5&ndash;7%!7%!9$!7%)&ndash;19%)0&ndash;1-!3%)2&ndash;3%)4&ndash;5%!5',
+    '%+8&ndash;187$*8&ndash;19%)0&ndash;6%)8&ndash;9$!9%)&ndash;20-!1%+0&ndash;191%+4&ndash;200%)5&ndash;8%+7&ndash;202#)2&ndash;3$"00&(&ndash;1%+4&ndash;234',
+    '%)5&ndash;6%*6&ndash;10%*9&ndash;10$*1&ndash;23,!5%*0&ndash;12%*2&ndash;13%*4&ndash;16%+6&ndash;229$*26&ndash;9$!3%(&ndash;4%)1&ndash;2%)3&ndash;5%)4&ndash;8',
+    '$)4&ndash;6%)5&ndash;6$)5&ndash;6%)1&ndash;3%!8%*9&ndash;61$*6&ndash;31,!7%*5&ndash;73%*6&ndash;73$!7%)&ndash;40%)2&ndash;3%*4&ndash;93%)6&ndash;7',
+    ',!9%+2&ndash;308%)6&ndash;8$*9&ndash;30-!2%)0&ndash;1%!1%+3&ndash;329#)3&ndash;6$)0&ndash;1,!3-!4%#-31%+0&ndash;305$)1&ndash;2',
+    '%*3&ndash;23$)2&ndash;5%*1&ndash;77$*3&ndash;41,"56%)4&ndash;5%*8&ndash;42-!9%*9&ndash;40$!4%(&ndash;5%)0&ndash;1%*2&ndash;58%&460-62%)5&ndash;6',
+    '$*5&ndash;39,"42$)6&ndash;7%!-%&136-37%)3&ndash;4%)4&ndash;8%#832$\'7037-38%&428-29%&628-29%&854-55%#964$*8&ndash;44%)1&ndash;3',
+    '%#212%&579-80%)6&ndash;7$*9&ndash;40#"41%*&ndash;102$)3&ndash;4$*5&ndash;64,"71-!5$"64$*7&ndash;54,"71$!8%)&ndash;55',
+    '%)&ndash;50#%50,51%*9&ndash;27$)1&ndash;2%*1&ndash;13$)2&ndash;4%)1&ndash;2$)3&ndash;4%!1$*7&ndash;67$!8#*60&ndash;2$)1&ndash;2$)2&ndash;4$!3',
+    '$)5&ndash;6-!6$*7&ndash;72,!8$!8%(&ndash;9##7-8$!0$!1$*31&ndash;4$)4&ndash;5,!9$*6&ndash;80-!2$!7',
+    '$*9&ndash;80#*8&ndash;10$*6&ndash;89$+8&ndash;115#*9&ndash;10$!1$)2&ndash;5$)4&ndash;5%*1&ndash;53$+5&ndash;126$!6$+8&ndash;103$+9&ndash;104#!l$"-8',
+    '#!x$"ii$$viii"+100&ndash;1$)2&ndash;6#"12$*3&mdash;14$!6#!2$-24&mdash;1225$+3&ndash;124$!8#+3&ndash;14/+"39$01318.918.929,861',
+    '$)3&mdash;4#+6&ndash;17/+#21/$)3&mdash;6$)7&mdash;8#$7/18$+1&mdash;172#*8&ndash;19$-7f&mdash;188d"!2#+01&ndash;11#!2"-300&mdash;301#*30&mdash;1#"47',
+    '"$4207#)6&mdash;8$)6&mdash;7#+79&mdash;80#"82"+503&mdash;4#"66"+60&ndash;64#"56#,87&mdash;688#!9""70$)&mdash;71#)8&mdash;9#$9-92',
+    '+!8#)2&ndash;4##44h#*6&ndash;8/+"92"!9#)3&ndash;5#+5&ndash;120#*6&mdash;97#"86"":i"#a/8#$tcr5$$ura1""b.',
+    '""cs""dd"\'eleides##nce$"ny#)rspective#%setas"\'fwooorr"#g10$!1#!2#!4#!5#!9#$a101',
+    '#+ysiological"#int"$l(a)$"h)#(-flyable#!.##/ir#"e.##ied#!o"#m.4"%n-rda""oa#%rtion#!s',
+    '",p-supporting#!l#!m#&sstttt"&roceed".s&mdash;polish#!.""vb"!y#$arc5"!z!$q-20""zt!-r&aelig;cipua#.eacute;cieuses',
+    '+&urseur*(dication*!e**liminaires*%mices,!n*)rogatives*!s+#ent.%ation+&idence/&tielle0!s*\'tention*0v&ocirc;t&eacute',
+    '+%enir.-$tion+"ot-)&eacute;s$&circ;t$+grave;ludes#*mdash;keep)\'radical*)epublican#/omacr;t-agonist#+scaron;tina#/uuml;fungsrecht"&\'esent"&-based#$type',
+    '#"34##xix",/advertising#%press"&0ducts"#100#!5"&7357/4#%463/1#&536/22"!8#!5"-=0&middot;025"&aaaaam$\'k-praak',
+    '%%ndhak&!g$#hat%$dyal$$ucki$!y#1c&rehy;ticalities,$sing$"ha&$chon&!r%&uabmoh+)transport&#tes%&yadavi',
+    '\'*&rehy;able\'!a(\'l-based*(critical*&minded)(.jessica),/operational*+theoretical)-ity/viability)(ly-based,(embedded,\'focused,&minded\'*e&mdash;eg/#the',
+    '()-friendly)&ground)*orientated/"ed)\'related*#oom(!.((/central*)ommentary)(learning)%small(+s/breakdown*+flexibility\'%ising\'"ke',
+    '&$oner($iers&#que&%se(s)(\'d.among\'#in\'\'#yng&,tioner-based-*researcher7!s,(/manager,%s-who-(/medical\'%oners&$ucal',
+    '#!d$#eep%!l%"na%(sh-bihar(%tibet$"os#)eceptione,!m$\'dicandi%#rag$\'fecture$*lectorship%$udia$.monstratensian',
+    '$\'paratio$&sentes("ia%&idiums%*tabilitata\'"ri)#que&$etis%\'umuntur$)ter-human\'#ita)!o%$ores\'"ia)$nize',
+    '#"ge%!l%$nsis%"rs$,malinguistic&.tic-discoursal)!.)"al+(ly-based)2s-semantics-syntax(.sm&mdash;seems*!\'$"na&#nce%$ells',
+    '%#car$#ue\'&%-born\'(residing\'-vienna-berlin%#ian##ha1$!l$*u-building##ia.$$dent$"er&!s$!l$)rie-bound',
+    '$2se&rehy;worthiness&$-god\'Rmy-soul-the-king-of-heaven-to-his-feet-thy-tribute\'&worthy&!/\'+recognition&$d-up&#god&$less&"rs&*worthiness#$kiss%!t$*la-seismos#(matarski',
+    '$#med#\'na-yama%$vayu$%celot%#in\'$&g-free$$king$!n%"et%#ies$"on$$ting#$pass$"er$&iestis',
+    '#%riond#/sa-ksiazka-ruch%!t$$chma$#ert$#hna$#ina$$lins$\'niewski$"on$%saler%#ede##tas$*chett-like$"ed',
+    '%!s$#her%$ibha&!n$$ibha%"ce\'!s%!e%"ma%%nidhi$&lncole$%olino$\'t-arrow%(/cradley%!e',
+    '%$full%#ica&"sh($ness%&le-box\'!r&$ings%!y$%ville$!y#"un#$vada$,entivmedizin$#ice%!n',
+    '$*erjhabvala$!l$4n&rehy;cocktail-pink%!-&(catching&&filled\'(lavoured#+x&imacr;nos$)iological##y\'r&!s$$-ers%)for-peace%#ins$!a',
+    '%+r-answering\'%beads\'&folded(%ramed\'$gift\'\'hearing\'&leader(#ike\'\'meeting\'&ridden\'%stool,!s\'.wheel-spinning($ords&/s/intercessions',
+    '%"th$)ing-beads$"ut#"ze"*b-mediated"%ceded$"la"2d&mdash;democratic#\'icament",e&ccaron;ani&)edil;ieux$*mdash;1975$*ndash;1800*,arrangements*\'emptive',
+    '(,;adolescents+#ult*\'ntonine*\'rranged*(ssembled))christmas*)onditions)&dating*\'isposed)\'emptive**stablished,&imated*\'visting**xceptional)&groups',
+    ')1industrialization+\'terview))lingually*$ynch)&modern)+occupations*\'rdained*%utput)(payments*&lanned*)onderance)*saussurian*)cholastic-"ol*%enter',
+    '),transitional)#war*(imbledon$+scaron;eren#%\'sent#%-&agr$$\'60s&!9$!1%%3,500%!4%#575%#640&"60&"92',
+    '&"01&"20&"52&"88%#801&"32\'!4\'!5&"41&"70\'!1\'!3&"80\'!1&"95',
+    '&"10&"21\'!2\'!3\'!5\'!6&"30(!s\'!2\'!3\'!4\'!5\'!6&"46&#50s',
+    '\'!2\'!8\'!9&#60s\'!3\'!4\'!9&"71\'!6\'!7&"81\'!4\'!7&"93$,20th-century',
+    '$#685$"85$)abolition%\'cademic&)celerated(&ptance("ss&%he-ed%*daptedness)#ive)!s&\'dressed&&justed&\'mission&&optive',
+    '%\'eration%2fter-dinner-speech%#ged&\'ricolan%$lbum&)exandrian&\'located+#ion&!p\'\'habetic%*malgamated-#ion&\'plifier%)nalytical&+dr&eacute;e',
+    '&*nouncement\'!s&&orexic%\'polline&\'praisal($oval*"ed%\'rbitral&"my&\'ranging&\'thropod-!s%)scendancy&%sault\')ociations',
+    '\'%urian&#wan%(uricular&(tomobile%(wareness$$band&#sic%&eatles&%droom\'$time&*haviourist&%ijing&%nding\'!t&%rmuda',
+    '%$litz%,oard-meeting)#ing&"il&$real\'#ing&\'ulestin%&raille&&eeders&&oadway%&ubbles&&dgeted&%ndled&*reaucratic$(caldwell',
+    '\'"oe&&pellan\')italistic\'$ping&(radocian\'!l\'%riage&"se\'$ting\'%ualty&\'tholics%*elebration&$nsor\'$tral&+rtification',
+    '%(hallenge\'$mber\'$pman\'$rged&%ecked\'$lsea(&tenham\')motherapy\'#wed&&ildren(#led&(loroform&(okierian\'$rdal\'#sen',
+    '%$lass)%ified+!y&\'eveland&(inically%&oating&$hort&$ital&%llege\'&ombian\'#umn&$mbat\'\'mercial(%ittee((onwealth',
+    '\'(petition(#ile+!r(\'ression(&ulsory)#ter&(nception+#ual)"rt\'(ditioner-#ing\'(ferences($lict\'&nubial\')scription',
+    '((ultative\'$tact(\'inental()ractually)&oversy\'\'vention&"ok\'$ling\'(rdinated&(pulatory&$rded\'"ky\'%nmill&,urse/meeting(!t',
+    '%)retaceous\'!w%#ued&(lturally&%tting$\'dancing&\'rwinist&%y-glo%\'eadline\'!l&"bt&#cca\'%eased+!s\'#ide',
+    '\'%lared\'&orated&$fied&\'legates\'#uge&-mocratisation&$ntal*!/&%posit&\'termine-!s&\'veloped\'%onian%$icts&-fferentiation',
+    '&&saster\'%poses&&vidend%)ominating&$rian%\'rainage\'%matic&&illing\'#ver(#ing&$yden%$uchy&!g&"sk&"ty',
+    '$*earthquake&$ster%!c&-clesiological&(hinoderm.!s\'#oed&\'lamptic&&onomic%(damptics&&ucated*#ion&$wina%)ighteenth.(-century',
+    '%\'lectric,"al\'$ment+#ary&)izabethan%+mancipation&%bargo\'*ryologists&\'ergence&\'imently&&ptions(#ory%(nclosure&%glish&+lightenment',
+    '%)pisternum%\'quipped%\'ruption%)stimation%)valuation\'+ngelisation-!m&#ita&*olutionary%)xcitation\'&lusion&\'emption&(hibition&\'pansion\'\'edition',
+    ')&ratory\'(onential$+fabrication&"de&"ir&$llen&$mily&%scist&!x%"ce%#eed&%lting&&stival&$udal%\'ibrotic',
+    ')"es&$lmed(#ing&!t\'#ted%\'lashing&\'ighting*!s&\'otation\'"yd%&oaling&$lded&"rm("al*"in',
+    '&$urth%)racturing&\'icative%\'unction\'!d(#ing&"ss$&garvan%#cse%&eneral(%tical("va%"ig%%litch%&ockley',
+    '&\'iffiths&$oups$)halloween\'#ter&%rvest+"ed%%eaded(\'hunting\'#ter&$rpes&\'seltine%%igher&%lbert\')lsborough&\'s-toric',
+    '+%cally%(olocaust&&minids%#ugo&"ng%)yphenated$*identified%\'maginal&$pact\'$osed\'(regnated%(naugural&+corporation&$dian\'2ustrial-revolution',
+    '&)formation\'%usion&(halation&%stall\'&urance&\'tegrate((llectual($rest\'%ifada&(vitation%*rradiation%)somerised&$sued$&jacket%"ob',
+    '%%udaic\'#ges(#ing&"ly&)stinianic$&kaiser&%ntian%$hmer%%illed&*ndergarten%&notted$!l%\'abelled&"st&$test',
+    '&\'voisier%%eased&$nten&%uktra&%xical%&iberal*$tion\'$rary&%cence)&tiates&%nnean&7tigation&mdash;hospital%&oading&"ss$\'machine',
+    '&)intenance&!p&#rch("us\'$iner\'#ket\'#tin\'$xist&$tter\'#ure*!d%\'easured&+chanisation&#dau\'&iaeval',
+    '($eval(&tation&%iotic&\'ndelian\')struation&$rged\')itocratic&\'ssenger%#ilk\'\'lennial&"ng\'(isterial&%stral&$xing%(odernity',
+    ')$ying&\'istened&#ney&#ral&$slem&!t\'&orised&%ulded%%urder(#och&$tiny%&ythago$*napoleonic&%scent&*tion-state',
+    '&\'olithic&\'wtonian%$ight&"ne&%rvana%!o&$rmal&(velistic%!t%&uclear&%rsing$(occupies)!y&%tober%&ffence',
+    '%)ppression%!r&$dain\'"er)"ed&&iental%#tic%%xford&&idised$"pa&%latal\'&ladian&(ralympic\'%isian\'\'liament',
+    '\'#tum(!y&$sted&$ying\'$roll%)enicillin\'(ultimate&(rmissive&%trine%"hd&(enomenal&+ilosophical&*otographic%#ill%%laced',
+    '&%umbed%%odium&\'lishing\'&lution&!p&*rtionately&#sed\'#ing($tion\'&sessed\'/t-structuralist(&humous&$tato\'#ent\'$tery',
+    '\')ferential\'%gnant\'(paration*!e\')scription((entation(\'ocratic&%imers(%itive\'$vate&+o-dynorphin\'&cesses+#ors\'$duct\'*fessionals',
+    '\'&gramme\'&tected+#ion%-sychoanalytic%%ublic)$shed&&rchase&$tsch%\'yrenean$%quads\'#ker\'&lified,"rs$#raf&"id',
+    '&*phaelitism(\'ealites%\'eaction&\'ception&\'duction&"ef&)ferential)#ral\'*rigeration&)gistering&$port\')roduction."ve&%quest&)storation',
+    '&+unification&%vised%(ibosomal&"ft&#gid%&oasted&\'botised&"ck(#ist&"ll("ed&&mantic&!y\'"al$&salted',
+    '\'#usi&!p&(turating&(ussurean&#xon%#can&\'heduled\'*izophrenic\'\'ool-age*!s%"ea\'#rch&$cond*#ary*$ment',
+    '&(lections*"or&(ntencing(\'imental(!s&#pt.(&uagint&$rmon\'#ved&%ssion&"ts\'\'tlement&$vens(#ran%,hakespearean',
+    '(#ing&&ipment&#oot)#ing\'%pping&%runk.%&ifting&$gned(#ing&%nking&/xteenth-century%\'kinhead%)leep-loss&#ump%&meared',
+    '&&oothed*"ie%!o&\'cialist(#ety((ological\'%ratic,!s&#lar\'\'idarity&\'phistic&#und%$pade\'%wning&)onsorship',
+    '\'#ing%$tage\'%nding\'"rt\'"te&%ocked&&ressed(%tched\'*ucturalist&%yling%"ub\'\'jective&(ggesting(!s&%mably',
+    '&!n&\'ppliers(#ort)&sition&%rgery&(spension%&wollen&#ung%,ylvestration&)nthesizer$%tabel\'"or&!g\'#ged&#ped',
+    '&#xed\'!i&$ylor%,echnological&,en-temptress($ager,!s(!s&$hran&\'legraph(%phone(%scope(%vised+#ion&$mple',
+    '\'&sioned+!s&&rtiary&%xtual%\'hatcher&(irteenth%#ilt&)metabling&#tus%!o&&kugawa&!m&"ps&%urism%$reat',
+    '&$ojan%%unnel&$rkey(#ish%&welfth%$yped$#u/v%!k%$nced&%ified$%valve&\'rnished%&ehicle&$rsus%"ga',
+    '&$enna\'$wing&$king&%llage%%oiced$&waking&%lking&%rning&$shes&#xed%&eaning\'#pon&%lfare&%mbley%$hite',
+    '%(ilkinson&\'ndscale&$ring%\'oodland\'\'lfenden$\'yeasted%$uppy#$.set#//post-operative#!=$#war#\'a-chers$%ch-ed&\'er-bard\'%s.the',
+    '&&ifying\'"n\'(#ess&%ments%)quisition%$tive$%dator%\'mission%)olescents%&sorbed(%ption$%mable%%bling&$ulum%$p/eq',
+    '($ower$\'nnounce%!s$!p$\'ssigned$"ud%!x#&bagged$$bles$"en$*iofeedback$"le$)onderance%"ok\'$able',
+    '$$uilt#!c$!.$,ambrian-type%\'ncerous%$rial\'!o(-usly-achieved-$held-\'perched\'"us%%tivus%&ution.*$s.on$*edence-but',
+    '),s&mdash;even%"ed\'!s%(ipitated&!v\'!e(!d%$nted\'#ing\'#ors%\'ptories%$sses$$heur%%illed%"tl',
+    '%$eved%%ncted&#orm%!o&!s%!p&+i&rehy;tate\'$tato+!r%(se-edged\'#ly\'))-arranged*\'crafted*)described&#ian',
+    '\'*on-bombing*#cut*(directed*\'machine1!d*%shear)!.)%/jazz)#ing*"sm+!t$\'learing%%oacal%"ud$&oeliac',
+    ')#ive\'%oscer%\'lumbian%)mpetitive\'#ile)#ing\'$uted%!n&,&rehy;dition&2ception-shattering($rted&-di&rehy;tions&\'sidered\'\'onantal\'\'tituted',
+    '&+traceptions%*ordination%%rdium$\'ursored%#sor$$ynct%"se#)d-ictable%&league$%acity%%nnock%%tion-)!s&,or-avoidance.#ing',
+    '))near-nest)\'to-prey(!.(#ily("s.$"dy$.e&rehy;cessors%\'ceasing\'"ss)%or(s)&%tions%(finition%$ncia&$tary%\'scessor',
+    '$!i%+c&rehy;tion0!s&&-tions&\'ability(#les\'%ment.\'%ntium\'#sts\'0te-calculus-like*$term&#ing\'$tion&!o&.t&rehy;ability',
+    '(!m\'!d\'!e($d.73\')ion-based*)/analysis(&veness\',or-corrector%&ffused%"gt%(lictions%!r%\'scovery&&persed\'$osal',
+    '&\'tending\'%illed\'\'urbance$&jamski%&udiced$$most&#uth$%nesol%\'isolene)"on+"e/-&kg/day(!n$-olomitization%(minantin',
+    '.%rural.$slav)%teand*#ion(%ently%"se$0tchenskaya/katya#+ece/teacher$\'eezents$\'lection$$nin\'$$sall%#tes$&xisted$"ze',
+    '$!.$(abricate,+d-austerity%!t$-ect-apostolic\'$oral%#nce%+r&rehy;ably,$ring&%able.\'#nce&%ecnes\'$nce.**/frequency(#tem',
+    '\'"ce\'!s&!r\'!e("d-*7issue-in-file&lsqb;file)#_by\'#red%&tching$*igurations%$lled&\'tration%&nished%+x-plus-stem\'&suffix',
+    ')#ing$\'ontaine%"rm\'%ances(%tion/,#ism\'#ing\'!s\'&ulated#%gaday%\'nancies%!r$"el%&stimil$"gy',
+    '%#ven$%matic$%nance("y.*!0*!i\',t&mdash;what()\'-looking(5/tall/pretty/diabetic(!s%$ence$"os$$raph%&ouping#$haps',
+    '&#ter%\'minence%\'nsility("on(&veness%%patic$/istoric-looking+"al$\'ospital$-ybridisations+"ed#*iampullary$!e%!s$\'gnition',
+    '&\'ubating%+dustrialism%&fusion%(stalling&$ulin%\'tegrate\'(rmediate($view$#ser%&torico#$jmer$&udice.)1d-against-smoking#!k$(nowledge',
+    '#%lavka$#imi\'$nari&!o%(nguistic%$sted\'#ing$!l%"er$"og$&uciand%#dio#*malignancy%&rriage%)ture-baby',
+    '%0xillary/incisive$%chand%!o$&edical)#ted%%lting%"no&$tum.%!t&\'allised&(hylation&(rication$+i&agrave;re/!s%+e&egrave;re',
+    '(&league\'#ing\'$land\'(minister\'"s.($hip.+%/home%\'gration%+llennialism%-ses&mdash;was(4-negligence-personal%!u&*m-battered)&randed(%grade',
+    '($rate((strength\'!.\'%/beta((standard\'!1\'"s.%#xes$$mias$)odernists&)ification)"ed($ying%&nitary(&ionary',
+    '&%ville%#ral%#tor$#uda%-ltiplications+"er%!s#0natally-acquired&(ionalist$(dergrass\'"lo&!s%#ine%&onzani%!s',
+    '%(oplastic%&z-vous$"ge%#vir$\'isolone$!s$)tice-work(\'/artist&"se%&onfans$*zlauerberg&"er#*obazhensky%(lakensky%(rajensky',
+    '&&uption%$ular&%paria$$pria$#ral%!d&#ain)#ing&\'ination$)xygenated#"p\'$(-aration%)schoolboy%$time%$wear',
+    '$!a%&ckages)#ing\'!s%5ration-for-retirement+#_at+"s.("or**y-tutorial&9e/submission/modification\'&dness.\'"st\'"th\'&z-vous&$tion',
+    '%&tation&\'terning%!y$"ed%\'rations&!m\'&issive$#ing$&master$#net$(olitical%)nderating%)sitioning%%tence$)randially',
+    '&)sentative%!o&&cessed*#ors&\'duction*!s&$gram&(letarian$\'unctual%#pal#)qualified)$ying%&elling#-randomisation%&tional',
+    '%#las%#nal%)quisities%(tirement%+volutionary$,ogatives-the&\'erative%&mantic#%sants%(turation$$brey%\'yacusis&$opia&&terial+%n/dup',
+    '*#ian$%caler)!s\'#ing%$ence)!r\'!t%\'heduled%%inded(#ing(!s%(ot-based\'!e\'(t-clarke(!s',
+    '(%tion.,"s.-!/$\'earched%&dation%(lectable)!s&"li%!n&#ce\'((-absence)\'chamber&!s&*t&rehy;day\'!\'',
+    '($both)%uying((day-wild(*generation\'\'.church(#day(#one(#the\',/indicative/\'\'ability(#ion(1tion&rehy;quality,(-quality,+al/speaking*"ve',
+    ')"on(%zione\'#day\'!e(#d\'\')--it-masculine)"at(#nce(-r-turned-guru)&/model\'!i(!c(#ngs("on(#sts',
+    '*(maligned\'"s.&!z%"rv\'$able(#tif*/on-by-exclusion-)conscious,-/substitution,"al,*ist-minded*)ve-filled.#ree,"ly,\'treated',
+    '\'"e.("d\')!.("ne("th\'$ing\'%!s%%table&$ting$%grave$/ident&mdash;see)*-designate*(in-exile))/chairman+(orporate',
+    '*%prime)$:sam)%iable+\'l-level--parliamentary,#ism,!s)\'s-elect\'!r%&endanz%&tgious$$ley.$$nail&&reburn$&oaking',
+    '&!d%$rted$(pa/ohrid&"ss&%wning%*ecifically%$inal$&quille$,s&rehy;boxes+$stud%!-&\'arousal&%boxes\'%utton&\'forming',
+    '*!s&$head\'%ounds&&lipped&%marks\'"en&#out&(provoked&(released&#shy\'#tud\'%witch&\'through&"up&%wheel',
+    '&#ica\'#raq&%media&$news&+passholders\'$hoto\'!r&\'quality&#sky%$able&#ger(!s%#box&#urg%)e-agentur',
+    '("in(#out\'!.&!l&$ment&"rs&"th%\'ganging%%iness\'\'g-cloth)%rooms%"ly%,manufactured\'%rking\'%sters',
+    '&!s&$uyre%/ure&rehy;hosing.$many(%-cook-"ed)\'ejected)$head*#igh)+impregnated)$less)%marks)(operated)%point.!s',
+    '*$ulse)\'rafting*\'educing+%lease,#ief)0temperature-time*#hat*#ime*&reated)&vacuum*\'elocity+$ssel*)ulnerable(!.(,/temperature',
+    '(+s&rehy;high)%-this)!.)!s($with\'#ied(#ser()zed-water*!s\'"ss%$work%!y$&tained&$tion%$cott',
+    '&)ignthomas&\'l-based(&owning\'!.&$rnum%$hope&"us%-idge/cherwell\'\'igitant,$tors/!y&,ge&rehy;type(&-based)#car(!s',
+    '&"on%#ley%(on&mdash\'%-born(/leyland-chorley\'!/(/gloucestershire\'&grange\'$ians\'!s&!r&!s%(ructured%!s%#udy',
+    '&#old\'"od\'#uld&#ych$!u%(bmission%%m.tif&"ab(.ly-still-alive*!.\'$sbly&#bly%+ppositional$+ynaptically&$cope',
+    '#*t-a-porter$)aapnarian%%tions$!e%&ceille%(nce-hall&*d-mistress(<nothing-serious-has-happened(%tramp(&writes\'#ed.(#r\'s("st&&sioned&$tion',
+    '%(rpasanto%"st\'#ing$#hee$$love$7oria-witwatersrand-vaal8*ereeniging($.the%(urnament$.ranscriptional(+formational(%plant%&eating$#sch$\'tied-up',
+    '&&ly-lit)\'painted%"y-\'$baby(&ehaved\'Dface-and-big-tits-to-sell-the-record\'nlittle-feather-brained-only-good-for-one-thing-bimbo-know-nothing-woman\'s-head\'&pretty&#ing$!y#-u&szlig;ische$#bas$"il$\'ssische+!r',
+    '$!x#0v&ocirc;t&eacute,!s$!a%%lent.&%prime$!e%%lance(!t&!i%!n&*&rehy;tive&\'t/delay\'\'ability\'#ed.',
+    '(6on-is-better-than-cure*"al(-ve/prediction3"ve*!s\'"or\'\'s&mdash%#zer$#ias&"ti%&dencia%*ew-knowing(6overview-inview-review%%n/lso%+ous-highest',
+    '+)expanding+&gained+$held+*identified+(launched+)mentioned+%noted+)protected+&quoted+&stable+\'unheard,#sed(!y%$sion%"us',
+    '$&ocalic%$rsek%-st-marcilhacy$$ue-x#!w$#arn%"sh$&eighed$$ired#%y-but%\'capture\'&tchers*#ing&(oncealed%\'hunting',
+    '%(movement%$rich$(.animals$!e%&d-upon$$size#&zented$%ident$#old$"zy"(formance"$haps#!o#"ps"/i&mdash;italian',
+    '$%pella$$tely#\'bicevic#,ce&mdash;any,(granting,%which&.rehy;conscious%)-adjusted&\'busting&&change\'*ompetition((ntrolled\'#uts&,discriminate)%tance',
+    '&#gap&"he\'$ikes&\'indexed(\'elastic&\'lifting($nked(#sts\'\'owering&(marginal\'#ear&&of-one(!f&(per-acre*$seat',
+    '&)rationing\'(eduction((gulation(\'porting((sistance\'#ise&\'setters\'\'lashing\'*tabilizing\'&upport&)theoretic\'&o-book&(weighted%!.%!/',
+    '&,availability&\'british&$club&\'foreman)#mer&/gloucestershire&&income&\'kington\'#une&*lumberjill&(mechanic&)neighbour&%owner&\'penhill(*rformances',
+    '\'&escuer&%super&\'trainer\'\'urnover&$west%$able%!i%%less.)"ly&#ist)!s%!m%&points%$rite%$s-as',
+    '&\'.prices)(oprietor&!/%#war%,y-to-license$+hard/agatha%#ett$$ing.%$ples$$k(s)%$able%%ed-up\'!.&"rs%\'le-ball',
+    '&#ier&&y-heat(\'looking%&willow#+day-metford$#e/a&(descends%%fully%(ux/coach%!y$$geon$!i%!e$$urki#$emer',
+    '%"ca%!e%$nitz%&t(ess)&%-hole\')magicians\')physician\'&ridden\'&school(%layer("on*!s\'-turned-pirate\'&worker&!/',
+    '&%craft&"er\'/ss&rehy;goddess)$hood&%field&%hawes\'#olm(#ods(#rpe(#use&$land\'#ess(6y/engineer/oxfordshire)"an+!s',
+    '\'%iness)!g\')y-kantian&"s.&!y$$tini%!s$)ur&eacute#&fysgol#+g&rehy;gish$!g%#ery$$meat#$hoda##jck',
+    '$"en$#ope#%losec#\'m-faced$%acare&#ies%#fix%"ge&\'raphics(%vidas%#ire%%letta%"rk&1y&mdash;secondary\')-activity',
+    '(\'quality(&season*\'condary)#ort((textured(#use%\'te-like&(ologists*!y&!u$$chet%!o$#e-3&#age&$crew',
+    '/*in-waiting.$ship&%track%//computervision%\'d-burst&"/4%"ly%-r&iacute;sima&)-template\'1undercoat-topcoat\'\'walking&"as%%sight\'"te&#ter',
+    '\'#lly&#ere&"il$\'igravid%&parity%!s%%tive\'))-communal*\'looking)".a)\'/gothic*&modern))s/darling$#ley$$mest',
+    '%)-genitive%\'genital%#lis%(rdialist&#olo%#tif$!p$2rose&rehy;coloured(*-and-black)$like(#smp$&ulinus#,n&rehy;ciple$&ce(ss)&!-',
+    '\'3cum-amateur-soldier\')enchanter\'*in-waiting\'%lings\'-of&rehy;wales\')patriarch\'$sign($tyle&&/polly(\'rincess&#ful&#lie)"st($ness&.ss-and-the-pea',
+    '(!s&!t\'%horpe\'+on-educated&!y%!i&(p&eacute\'"ae(\'l&ndash)!+)3/director/personnel*$head)%ement)$ity.)"ls',
+    '\'!j\'%le(s))&-based)+s&mdash;for*%.thus*!/)!y\'"um%"l.$\'diville%!l%"on$"gi%>le-and-sons-how-may-i-help-you((pattison',
+    '($nick\'!s$&iatiko$"ks$!n%"ie$$otto$#sen&!s$\'t&mdash&)rehy;outs%*-absorbing&)dominated&\'imaging&#man',
+    '&\'quality&$rich&&server\'#hop*!s&&to-fit&$wise%&.based(!t&#com&$unet%"_a%)ed-cotton(\'marbled(&report',
+    '\'!.\'(/deleted(%typed&$r\'s.\'1-in&rehy;ordinary("on((prepared(\'sharing)%tatus\'(/fishing\'"ly\',s/publishers%!i&,ng-formatted)#ink',
+    ')&office)$shop%$less%%ouris%$room%%s-out&%/high&$:the&%creen&%erver&#hop%$wise&%orker%!z$&z-carl',
+    '$%nsias$-r-to-broadway%&/kelly%+_,_prior_to%\'ess/and%&i-ties&"al&!s&$tied)0s-accountability*!.**/situation($sers*!s\')y-dispute',
+    ')\'gaining)%index)\'setting(!/)#4th$"sn#!p$"ps$#ria&,etor/manager##sci&"an&"la$)matically)!s',
+    '%"n\'&&-cages\'(exercise\'$gate\'(officers\'&stable\'$term\'$yard&(/grendon\'&surrey&+er-and-jury)$made)2of&rehy;conscience)$type)&warder',
+    ')%staff(\'isation(*s.tomorrow*(woodhill\'!s&#ing&#ner\'+i&egrave;re("er&%s.the\'$cape$&siness$\'tigenys&/ne&rehy;looking(&-white',
+    '$$yaga#!t$!5$"am$$card%*hard/coach*$head*)secretary+\'peaking*$team*&victim*(wildlife$#esh$#hie&"vi',
+    '$!i$"ty$%ykina#*v&eacute;e$,acy-obsessed\'!.%"da%!s%!t&"ae\'#rum\'$tion&%e-car($eyes(*for-profit',
+    '($like*"ne(&market(\'pension)\'ractice(&rental,#ing(&school))ector-led*%rvice)$tudy\'+/commercial((in-house(*relational\'\':public',
+    '*&agreed*&funded*)generated*$made,%naged*(operated*)preserved*\'reached)%owned\'!n&)gelehrter&&isated*$ion\'---deregulation-#and',
+    '&"us$(e&eacute&%mdash%!e%%leged&!y%,t&rehy;lined&!s$\'iledged*!s\'+ge/contempt)%ntsia)"s.&$iges$%leged',
+    '&&purses%!e#%yayis#\'ze-draw&&of-war&$ring&%stuff&&wining%$.the%*/medallion&1penance/privilege%$days%(fighters*!s\'$nder',
+    '%#man%!r%)s/rewards$#ren"!k#"os"/l&mdash;liberal##/6h#!a"!m##ary#!i"(ncipally#%t.cli$!d',
+    '+&ything)$boer)&cedure+%ssors)\'fascist*\'eminist*)ootballer)\'gressed)%hibit)$nato**ouncements),ruling-class##\'s.#%-1080$,abortionists',
+    '%"ct\'#ing\'!s%(frikaner%\'grarian%%liyev%"m/&&niotic%&ngevin&#zus%!p%%rafat%&squith&#sad%\'tlantic',
+    '%%ylwin$$ball%&iafran&#rth%$lack&#ood%(olshevik&%nners&#und%#rit%#ull$(canadian&!r\'#eer&#ses',
+    '\'#tro&\'thedral(%olics%(eausescu&(nsorship%*hairperson\'$lerm\'%morro%"nd%(ommodity&*nscription(#uls\'.traceptionists&(pernican&$rdes',
+    '&&eation\'%ditor%$ycle(&ically$%dante%&efence&#lta)"ic&*regulation&\'terrent&)velopment\'+olutionists%+ictatorship&"gs&)rectorial',
+    '&&scount%#nsf%"oe&!g&%uglas%$rift)#net\'"ve%#uct&)valierist$$east%!c%"ea%/mancipationists&(igration',
+    '%"ta&\'hiopian%#uro%+xclusionist&\'ecutive$\'federal+#ist&\'rtility&\'ssional%$ield\'$tzau&$ghts&$lmic&!s%\'ootball',
+    '\'#mat*!s%%rance&"ee(\'-market(#dom$)gaullists&)y-lesbian%&ermans%(orbachev%&rammes&#een%\'uinness&!n$+hanoverians',
+    '%%ealth&\'zbollah%(ib-ition%#ome\'\'osexual&#xha%(ungarian$+impeachment(\'rialist/!s%%ngush&-tegrationists((llectual(+rventionist%\'slamist',
+    '$%james&&panese%(erusalem%#obs$\'khomeni%#ing%\'offigoh$-laissez-faire%%eague%&iberal)#tad%$loyd%"og\'"ic&&yalist',
+    '$%macao\'&millan&#hdi&#jor&#lai\'!e&(nagement&$rcos\'&keteer-!s&(zowiecki%$enem\'%gistu&0talloproteinases%)onarchist',
+    '%(ussolini$$naos&$sser*#ite&%tural%!d%*egotiation%\'igerian%%orman&(ttingham%"um$\'o\'brien%"lf%\'pencast%&ralist',
+    '&"ge&*lestinians&\'nchayat&(triarchy&%uline%&easant&$king&%rsian%\'inochet%%olish\'!l&$oley\'!r&"pe%"pp',
+    '&%efect\'&sident&+o-proposing\'$ctor\'$duct\'#fit\'(visional$\'quality$)ratsiraka%\'ecusant&\'formers*#ist&$gime((onalists&,presentative',
+    '&-storationists&+unification&(volution%)ight-wing%#oad&&yalist$&saddam&%lmond%&cience&&ottish%"df%\'ecurity&&ntence&(paratist&!x',
+    '&%ekhar%$ingh&#tus&&zewell &randak',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_62 = (
+count_62 = 6694
+
+heads_62 = (
     'pathoanatomical',
-    'pathogenical',
-    'pathogenisis',
-    'pathographers',
-    'pathohistological',
-    'patholgist',
-    'pathologicals',
-    'pathologiques',
-    'patholoigist',
-    'pathomechanism',
-    'pathomechanisms',
-    'pathopysiological',
-    'paths.',
-    'pathway-specific',
-    'pati&ntilde;os',
-    'pati-led',
     'patia',
-    'patidar',
-    'patience-beads',
-    'patience.',
-    'patient-area',
-    'patient-doctor',
-    'patient-driven',
-    'patient-friendly',
-    'patient-list',
-    'patient-neglect',
-    'patient-nurse',
-    'patient-orientated',
-    'patient-physician',
-    'patient/public',
-    'patient_in',
-    'patienthood',
     'patiently-as',
-    'patiently.',
-    'patients\'-clarke',
-    'patients.3',
-    'patients/parent',
-    'patientswithout',
-    'patietns',
-    'patiets',
-    'patilands',
-    'patiline&tcedil',
-    'patinate',
-    'patinates',
-    'patinating',
-    'patines',
-    'patinigera',
-    'patinnova',
     'patints',
-    'patio-friendly',
-    'patior',
-    'patitvr',
-    'patiwat',
-    'patizzi',
-    'patk',
-    'patlak',
-    'patly',
-    'patnership',
-    'patob',
-    'patois-speaking',
-    'paton-saltzberg',
-    'paton.',
-    'patonga',
-    'patos',
     'patr&amacr;si',
-    'patr-ii',
-    'patrasse',
-    'patrassi',
-    'patreese',
-    'patres',
-    'patrese/moreno',
-    'patriality',
-    'patriarchal-capitalist',
-    'patriarchal-feudal',
-    'patriation',
-    'patrich',
-    'patricial',
-    'patrician\'',
-    'patrician-plebeian',
-    'patriciates',
     'patricios',
-    'patricke',
-    'patrickswell',
-    'patrients',
-    'patrifocal',
-    'patrignano',
-    'patriline',
-    'patrilineage',
-    'patrilineally',
-    'patrilinearity',
-    'patrilines',
-    'patrimonially',
-    'patrini',
-    'patriotically-minded',
-    'patriotiques',
-    'patriotische',
     'patriottica',
-    'patrist',
-    'patrix',
-    'patrizzi',
-    'patroa',
-    'patroklus',
-    'patrol&rehy;ling',
-    'patrol-car',
-    'patrol-wagon',
-    'patroller',
-    'patrollin\'',
-    'patrologi&aelig',
-    'patrologia',
-    'patrols&mdash;vigilante',
-    'patron\'',
-    'patron-saint',
     'patron-states',
-    'patron/client',
-    'patronage&mdash;patronage',
-    'patronale',
-    'patronis&rehy;ingly',
-    'patronisations',
-    'patronising.',
-    'patronization',
-    'patronship',
-    'patronum',
-    'patrulla',
-    'patsch',
-    'patscheke',
-    'patshull',
-    'patsie',
-    'patsy-budding',
     'pattakos',
-    'pattana',
-    'pattani',
-    'patte',
-    'patten-heseltine',
-    'patten-makers',
-    'patten/conservative',
-    'patten/education',
-    'pattenism',
-    'patter(s)',
-    'patter-merchant',
-    'patterers',
-    'pattern&mdash;just',
-    'pattern-book',
-    'pattern-books',
-    'pattern-borders',
     'pattern-controlling',
-    'pattern-creating',
-    'pattern-cutter',
-    'pattern-directed',
-    'pattern-makers',
-    'pattern-plate',
-    'pattern-race',
-    'pattern-watching',
-    'pattern/colour',
-    'patternedy',
-    'patterns&mdash;dynamic',
-    'patterns/1',
-    'patterns/behaviour',
-    'patterny',
-    'patteroes',
-    'patterson/driver',
     'patterson/energy',
-    'patterson/landlord',
-    'patterson/solar',
-    'pattersons',
-    'pattes',
-    'patthanarat',
-    'pattieson',
-    'pattimura',
-    'pattini',
-    'pattisons',
-    'pattle',
-    'pattmore',
-    'patto',
-    'pattons',
-    'pattrn',
-    'pattu',
     'patty-tin',
-    'pattyndenne',
-    'pattyndennes',
-    'patu',
-    'patulous',
-    'patulum',
-    'paturages',
-    'patusan',
-    'patuxent',
-    'patwaris',
-    'patxi',
-    'patzer',
-    'pau-aul',
-    'pau-ching',
-    'paua',
-    'pauca',
     'pauchling',
-    'pauciflorum',
-    'pauciperforata',
-    'paud',
-    'paudi',
-    'paudrat',
-    'paudyellocal',
-    'pauk',
-    'paul-ferdinand',
-    'paul-jan',
-    'paul-outside-the-walls',
-    'paul-schiff',
-    'paul-style',
-    'paul-totin\'',
-    'paul-type',
-    'paul/disraeli',
     'paul/east',
-    'paul/edinburgh',
-    'paul/general',
-    'paul/grendon',
-    'paul/ministry',
-    'paul/squatters',
-    'paul/telecaster',
-    'paulan',
-    'paulden',
-    'paulding',
-    'paule',
-    'pauleen',
-    'paulena',
-    'paulerspury',
-    'paulesu',
-    'paulette.',
     'paulettes',
-    'pauli-for',
-    'paulicians',
-    'paulii',
-    'pauline-like',
-    'paulish',
-    'paulistas',
-    'paulmier',
-    'paulo-tarso',
-    'paulrkrugman',
-    'paulsgrove',
-    'paulter',
-    'paultons',
-    'paulveriser',
-    'paulz',
-    'paumari',
     'paumotuan',
-    'pauncefort',
-    'paunched',
-    'pauntly',
-    'paup&eacute;risme',
-    'pauperibus',
-    'pauperise',
-    'paupiere',
-    'paupiettes',
-    'paupr',
-    'pauric',
-    'pausanius',
-    'pause-calculating',
-    'pause-dependent',
-    'pause-dotted',
-    'pause-engage',
     'pause-type',
-    'pausest',
-    'pauson',
-    'paussac',
-    'paust',
-    'pauw',
-    'pauwels',
-    'pav-a-rotties',
-    'pavanas',
-    'pavane-like',
-    'pavanello',
-    'pavaresh',
-    'pavarini',
-    'pavarotti-sized',
-    'pavarottis',
-    'paved/cobbled',
     'paveley',
-    'paveliev',
-    'pavement-high',
-    'pavement-level',
-    'pavement-like',
-    'pavement-quality',
-    'pavement.',
-    'pavemented',
-    'pavements/',
-    'pavements/sidewalks',
-    'pavenham',
-    'pavese',
-    'pavian',
-    'pavicevic',
-    'pavich/sierra',
-    'pavil',
     'pavilion-like',
-    'pavilionstone',
-    'pavillons',
-    'pavin\'',
-    'paving-slabs',
-    'paving/path',
-    'pavingstone',
-    'pavitra',
-    'pavletic',
-    'pavlicek',
-    'pavlidis',
-    'pavlis',
-    'pavlita',
-    'pavlochieva',
-    'pavlodeograph',
-    'pavlopoulos',
     'pavlovian-type',
-    'pavlovitch',
-    'pavloviy',
-    'pavlovskiy',
-    'pavlow',
-    'pavolva',
-    'pavonazzo',
-    'pavonina',
-    'pavonine',
-    'pavry',
-    'paw-hold',
-    'paw-marks',
-    'paw-signed',
-    'paw-work',
-    'pawanteh',
-    'pawel',
     'pawels',
-    'pawful',
-    'pawkins',
-    'pawle',
-    'pawlet',
-    'pawlike',
-    'pawmarks',
-    'pawn-broker',
-    'pawn.',
-    'pawnees',
-    'pawns.',
-    'pawnshop-owner',
-    'paword-processoraw',
-    'pawprint',
-    'paws-up',
-    'pawsteps',
     'pawtucket',
-    'pax&lsqb;zf-b&rsqb',
-    'pax-2',
-    'pax-6',
-    'pax-wanxie',
-    'pax-warnie',
-    'pax/conf',
-    'paxinou',
-    'paxson',
-    'paxstone',
-    'pay&rehy;and',
-    'pay-',
-    'pay-and-conditions',
-    'pay-as-you\'re-cured',
-    'pay-as-you-breathe',
-    'pay-as-you-use',
     'pay-as-you-view',
-    'pay-bargaining',
-    'pay-booth',
-    'pay-by-instalment',
-    'pay-by-view',
-    'pay-claim',
-    'pay-clerks',
-    'pay-fone',
-    'pay-for-use',
-    'pay-freezes',
-    'pay-gate',
-    'pay-happy',
-    'pay-increase',
-    'pay-key',
-    'pay-lock',
-    'pay-notes',
     'pay-parity',
-    'pay-pennies',
-    'pay-penny',
-    'pay-per-stay',
-    'pay-related',
-    'pay-restraint',
-    'pay-review',
-    'pay-rises',
-    'pay-scale',
-    'pay-scales',
-    'pay-tel',
-    'pay-television',
-    'pay-to-date',
-    'pay-to-enter',
-    'pay-to-watch',
-    'pay-window',
     'pay-workers',
-    'pay-your-way',
-    'pay/salary',
-    'pay_a',
-    'payability',
-    'payacan',
-    'payan',
-    'paybacks',
-    'paybill',
-    'payble.',
-    'paybooks',
-    'paye/ni',
-    'payerne',
-    'payers&pound;39,195',
-    'payers-in',
-    'payhel',
     'payin',
-    'paying-out',
-    'paying-the-rent',
-    'paylor',
-    'paymaster-cadet',
-    'payment&lsqb;s&rsqb',
-    'payment&mdash;see',
-    'payment-by-payment',
-    'payment-in-kind',
-    'payment/settlement',
-    'payments&mdash;the',
-    'payments-by-results',
-    'payments/',
-    'paymer',
-    'payne-james',
-    'payne/environmental',
     'payne/oxford',
-    'paynei',
-    'paynel',
-    'paynim',
-    'paynted',
-    'payntouris',
-    'payo',
-    'paypoints',
-    'payrise',
-    'payroll-based',
-    'paysand&uacute',
-    'paysannats',
-    'paysans',
-    'paytoe',
-    'payton-wright',
-    'paytone',
     'paytress',
-    'payva',
-    'payzu',
-    'pazarcik',
-    'pazelli',
-    'pazhwak',
-    'pazienza',
-    'pazvantoglu',
-    'pazza',
-    'pazzaglini',
-    'pazzia',
-    'pb-01',
-    'pb-1w',
-    'pb-206/pb-207',
-    'pb-ba-zn',
-    'pb-f',
     'pb-f-ba',
-    'pb-zn-ag',
-    'pb1.8scfv',
-    'pb2',
-    'pb74',
-    'pbabe',
-    'pbabepuro',
-    'pbannister',
-    'pbatem2',
-    'pbatneo&bgr',
-    'pbend',
-    'pbj',
-    'pbj14',
-    'pbkal',
-    'pbluescriptii',
-    'pbn69931',
     'pbo',
-    'pbp',
-    'pbr322-',
-    'pbr325',
-    'pbrp4',
-    'pbs-glycerin',
-    'pbsa',
-    'pbsv',
-    'pbsv-based',
-    'pbt',
-    'pby&ndash;4',
-    'pby&ndash;5a',
-    'pby-5',
-    'pc&gt;pe&gt;pi&gt;sm&gt;ll&gt;ps',
-    'pc&mdash;centre',
-    'pc&rehy;compatible',
     'pc\'',
-    'pc(b)',
-    'pc(c)',
-    'pc(d)',
-    'pc(e)',
-    'pc+',
-    'pc-1512s',
-    'pc-425xb',
-    'pc-425xm',
-    'pc-9',
-    'pc-apd',
-    'pc-arc/info',
-    'pc-class',
-    'pc-coated',
-    'pc-dats',
-    'pc-local',
     'pc-nfs-based',
-    'pc-only',
-    'pc-oriented',
-    'pc-priced',
-    'pc-telephones',
-    'pc-to-console',
-    'pc-tools',
-    'pc-training',
-    'pc/',
-    'pc/gene',
-    'pc/mac',
-    'pc/macintosh',
-    'pc/ms-dos',
-    'pc/ms-windows',
-    'pc/pe',
-    'pc/rt',
     'pc1640',
-    'pc17',
-    'pc200',
-    'pc2086',
-    'pc2386',
-    'pc3286',
-    'pc550',
-    'pc580',
-    'pc800',
-    'pc9800',
-    'pc999',
-    'pcak',
-    'pcarotene',
-    'pcb-',
-    'pcb-burning',
-    'pcb-destroying',
     'pcc3',
-    'pcca',
-    'pccs',
-    'pcct',
-    'pcd-gr',
-    'pcd4t',
-    'pcdi',
-    'pcdl-sr',
-    'pcdm8',
-    'pcdos',
-    'pce&mdash;spanish',
-    'pcf&mdash;french',
-    'pcf&mdash;ibid',
-    'pcf-dominated',
-    'pcflu-2',
-    'pch-ml',
     'pchitt',
-    'pchs',
-    'pci&mdash;italian',
-    'pci-renamed',
-    'pci/scsi',
-    'pcjr',
-    'pckd',
-    'pcl&mdash;luxembourg',
-    'pcl4',
-    'pclab',
-    'pclamp',
-    'pcm-10',
-    'pcm-cia',
-    'pcmcia-compatible',
-    'pcna=0.0459+0.3912',
-    'pcnet',
     'pcnet-at',
-    'pcnet/isa',
-    'pco/cluytens',
-    'pconnect',
-    'pcornwall',
-    'pcp&mdash;portuguese',
-    'pcpe',
-    'pcr-1000',
-    'pcr-amplification',
-    'pcr-assay',
-    'pcr.',
-    'pcr/rna',
-    'pcr11&ndash;36',
-    'pcramplification',
-    'pcred',
-    'pcrem&agr',
     'pcrn',
-    'pcs&mdash;christian',
-    'pcs11',
-    'pctropicos',
-    'pcu',
-    'pd&mdash;democratic',
-    'pd&plusmn',
-    'pd-10',
-    'pd-2',
-    'pd-pt',
-    'pd.3276',
-    'pd/pd&plus',
-    'pd/pd&plusmn',
-    'pd/shareware',
-    'pd1200',
-    'pd780-1',
     'pd7plusmn',
-    'pda/pst+alt.',
-    'pda600',
-    'pdan',
-    'pdas/pst&mdash;workers',
-    'pdas/pst+alt.',
-    'pdc&mdash;christian',
-    'pdc***',
-    'pdeal',
-    'pdeastman',
-    'pdes',
-    'pdex',
-    'pdfr',
-    'pdgf-a',
-    'pdgf-aa',
-    'pdgf-secreting',
     'pdl-based',
-    'pdl-coated',
-    'pdm&mdash;malta',
-    'pdm-1',
-    'pdm-2',
-    'pdmsmbbojwsqmnxludttkwklfmrql',
-    'pdox',
-    'pdp&mdash;democratic',
-    'pdp-ana',
-    'pdp-g',
-    'pdp-l',
-    'pdpk',
-    'pdr4',
-    'pdr5&agr&bgr',
-    'pdr540',
-    'pds&mdash;party',
     'pds*',
-    'pds--the',
-    'pds-3s',
-    'pds-formerly',
-    'pds-led',
-    'pdsa',
-    'pdspd',
-    'pdx',
-    'pe&ccaron;jak',
-    'pe&lacute;e',
-    'pe&ntilde;a',
-    'pe&ntilde;afort',
-    'pe&ntilde;iscola',
-    'pe\'tain',
-    'pe-235map',
-    'pe-50',
     'pe-chee-ee',
-    'pe10',
-    'pe13',
-    'pe19',
-    'pe1s',
-    'pe21',
-    'pe3',
-    'pe8',
-    'pe=qd',
-    'pea-',
-    'pea-and-thimble',
-    'pea-body',
-    'pea-canning',
-    'pea-coat',
-    'pea-coats',
-    'pea-fed',
     'pea-nut',
-    'pea-pod',
-    'pea-podding',
-    'pea-shooter',
-    'pea-whistle',
-    'peaberries',
-    'peaberry',
-    'peabo',
-    'peace&rehy;initiatives',
-    'peace&rehy;making',
-    'peace&rehy;worker',
-    'peace-at-any-price',
-    'peace-bringing',
-    'peace-brokers',
-    'peace-enforcing',
-    'peace-feelers',
     'peace-in-our-time',
-    'peace-mission',
-    'peace-monitoring',
-    'peace-outbreak',
-    'peace-policy',
-    'peace-seekers',
-    'peace-studies',
-    'peace-warrant',
-    'peaceability',
-    'peacefire',
-    'peacefrog',
-    'peaceful-sounding',
-    'peaceful.',
-    'peacey',
-    'peacey/gloucestershire',
-    'peach&rehy;canning',
     'peach-blossom',
-    'peach-fed',
-    'peach-flowered',
-    'peach-packaged',
-    'peach-pattern',
-    'peach-pink',
-    'peach-red',
-    'peach-smooth',
-    'peach-sunned',
-    'peachdart',
-    'peached',
-    'peachell',
-    'peaches-and-cream',
-    'peachey/farmers',
-    'peachey/worcester',
-    'peachgate',
     'peachhaven',
-    'peachlike',
-    'peachstone',
-    'peachurst',
-    'peachy-breasted',
-    'peachy-coloured',
-    'peachy-keen',
-    'peachy-orange',
-    'peack',
-    'peacock-gordon',
-    'peacock-shaped',
-    'peacock/yorkshire',
-    'peacockian',
-    'peacocking',
-    'peacy',
-    'peadar',
     'peagreen',
-    'peak-bagging',
-    'peak-flight',
-    'peak-holiday',
-    'peak-load',
-    'peak-loading',
-    'peak-shape',
-    'peak-ticking',
-    'peak-to-valley',
-    'peak-traffic',
-    'peak-with-peak',
-    'peak/rms',
-    'peaked-capped',
-    'peaker',
-    'peaking/stabilising',
-    'peaktime',
     'peaktop',
-    'peaktrak',
-    'peale-esque',
-    'pealts',
-    'peang-meth',
-    'peanut-brained',
-    'peanut-like',
-    'peanut-shaped',
-    'peanut-sized',
-    'peapod',
-    'pear-',
-    'pear-breeding',
-    'pear-drops',
-    'pear-like',
-    'pear-shape',
-    'pear-shaped.',
     'pear-sized',
-    'pear-trees',
-    'pearce(latinamericabureau)',
-    'pearce-boby',
-    'pearce/gloucestershire',
-    'pearce/widow',
-    'pearces',
-    'peardon',
-    'peareth',
-    'pearey',
-    'peark',
-    'pearks',
-    'pearl-bearing',
-    'pearl-buttoned',
-    'pearl-coloured',
-    'pearl-cream-gold',
     'pearl-decked',
-    'pearl-embroidered',
-    'pearl-encrusted',
-    'pearl-eyed',
-    'pearl-faced',
-    'pearl-fishing',
-    'pearl-headed',
-    'pearl-like',
-    'pearl-oyster',
-    'pearl-pale',
-    'pearl-shellers',
-    'pearl-spotted',
-    'pearl-studded',
-    'pearl-swathe',
-    'pearl-tinted',
-    'pearl-tipped',
     'pearl-trimmed',
-    'pearlcorder',
-    'pearleane',
-    'pearlene',
-    'pearles',
-    'pearlescents',
-    'pearlgrey',
-    'pearliest',
-    'pearlized',
-    'pearlwort',
-    'pearly-grey',
-    'pearly-pink',
-    'pearly-smooth',
-    'pearmans',
-    'pears-shaped',
-    'pears.peel',
     'pears/britten',
-    'pearse/national',
-    'pearse/sleep-out',
-    'pearsey',
-    'pearson\'',
-    'pearson/aeromedical',
-    'pearson/elmo',
-    'pearson/oxford',
-    'pearson/shop',
-    'pearson/west&rehy;minster',
-    'pearson/westminster',
-    'pearton',
-    'pearworth',
-    'peasant-cuisine-come-to-kensington',
-    'peasant-farmers',
-    'peasant-gardeners',
     'peasant-holding',
-    'peasant-like',
-    'peasant-lover',
-    'peasant-orientated',
-    'peasant-owner',
-    'peasant-proletarian',
-    'peasant-proletarians',
-    'peasant-soldier',
-    'peasant-subsistence',
-    'peasant-tenements',
-    'peasant-virgin',
-    'peasant-wisdom',
-    'peasant-workers',
-    'peasants.s',
-    'peasefields',
-    'peaslake',
     'peaslee',
-    'peasleys',
-    'peason',
-    'peasouper',
-    'peat-',
-    'peat-beds',
-    'peat-carrier',
-    'peat-cut',
-    'peat-cuts',
-    'peat-development',
-    'peat-digger',
-    'peat-diggers',
-    'peat-digging',
-    'peat-extracting',
-    'peat-filled',
-    'peat-fuelled',
     'peat-grass',
-    'peat-laden',
-    'peat-moulding',
-    'peat-pits',
-    'peat-raised',
-    'peat-substitute',
-    'peat/lorna',
-    'peates',
-    'peatfield',
-    'peathrow',
-    'peatstacks',
-    'peau',
-    'peau-de-soie',
-    'peax',
-    'peazy',
-    'peb',
     'pebble-chafing',
-    'pebble-eyed',
-    'pebble-floor',
-    'pebble-paved',
-    'pebble-picking',
-    'pebble-shaped',
-    'pebble-stone',
-    'pebble-studded',
-    'pebbled-glassed',
-    'pebbledashes',
-    'pebbleson',
-    'peberdy',
-    'pebworth',
-    'pecan-coloured',
-    'pecan-orange',
-    'pecanha',
     'pecca',
-    'peccare',
-    'peccary',
-    'peccatrice',
-    'peccatrix',
-    'peccei',
-    'pecche',
-    'peccune',
-    'pech&eacute;s',
-    'pech&oacute;n',
-    'peche/1',
-    'pecheneg',
-    'peches',
-    'pecheur',
-    'pecheures',
-    'pecheurs',
     'pechi',
-    'pechin',
-    'pechiney-anc',
-    'pechonkin',
-    'pechora',
-    'pechter',
-    'pechurki',
-    'peciam',
-    'pecinje',
-    'peck-owned',
-    'pecke',
-    'peckerdillos',
-    'peckeroo',
-    'peckforton',
-    'peckham/juggler',
-    'peckhams',
     'peckinpah-style',
-    'peckishness',
-    'peckmill',
-    'peckover/step-daughter',
-    'pecksniffs',
-    'peco63',
-    'pecock',
-    'pecora',
-    'pecorama',
-    'pecqueur',
-    'pecsimunkas',
-    'pecss2',
-    'pect',
-    'pectenoides',
-    'pectinate',
-    'pectinated',
     'pectinid',
-    'pectinidae',
-    'pectinids',
-    'pectins',
-    'pector',
-    'pectorales',
-    'pectorus',
-    'pectus',
-    'pecuarius',
-    'peculalalary',
-    'peculalaly',
-    'pecularity',
-    'pecularliarly',
-    'pecuniaria',
-    'pecussionist',
-    'ped-xing',
     'pedabro',
-    'pedagium',
-    'pedagog&iacute;a',
-    'pedagogic/pragmatic',
-    'pedagogically-based',
-    'pedagogically-relevant',
-    'pedagogisation',
-    'pedagogization',
-    'pedagoguish',
-    'pedal-bin',
-    'pedal-bins',
-    'pedal-board',
-    'pedal-car',
-    'pedal-cycles',
-    'pedal-cyclists',
-    'pedal-extension',
     'pedal-less',
-    'pedal-operated',
-    'pedal-point',
-    'pedal-power',
-    'pedal-pushers',
-    'pedal-to-the-metal',
-    'pedal-tones',
-    'pedal/swing',
-    'pedalabikeaway',
-    'pedalboard',
-    'pedalboards',
-    'pedaliter',
-    'pedan',
-    'pedaneus',
-    'pedantically-minded',
-    'pedantries',
     'pedasa',
-    'pedastall',
-    'pedasus',
-    'pedders',
-    'peddeston',
-    'peddie',
-    'peddle-bin',
-    'peddle/world',
-    'peddlety',
-    'pede',
-    'pedelow',
-    'peder',
-    'pederastic',
-    'peders',
-    'pedersen.',
-    'pedersen/cradley',
     'pedersen/world',
-    'pedes',
-    'pedestal-light',
-    'pedestalised',
-    'pedestr',
-    'pedestrian-',
-    'pedestrian-barrier',
-    'pedestrian-controlled',
-    'pedestrian-looking',
-    'pedestrian/vehicle',
-    'pedestrianly',
-    'pedi',
-    'pediados',
-    'pediatrician',
-    'pedicle',
-    'pedicled',
     'pediculidae',
-    'pedicured',
-    'pedigree-drawing',
-    'pedilla',
-    'pediment-compositions',
-    'pediment-groups',
-    'pediment-statues',
-    'pediplain',
-    'pediplained',
-    'pedis',
-    'pedlingham',
-    'pedoe',
-    'pedogeomorphic',
-    'pedogeomorphology',
-    'pedologist',
-    'pedometer.he',
     'pedons',
-    'pedosphere',
-    'pedraza',
-    'pedreschi',
-    'pedrillo',
-    'pedroh',
-    'pedroso',
-    'pedrossian',
-    'pedulla/gotoh',
-    'pedunculus',
-    'pedwar',
-    'pedxing',
-    'pee-bottles',
-    'pee-e-eer',
-    'pee-er',
-    'pee-on-the-audience',
     'pee-oo',
-    'pee-oo-ee',
-    'pee-pee',
-    'pee-pee-pee-pee-pee',
-    'pee-po',
-    'pee-stained',
-    'pee-witted',
-    'peecee',
-    'peecher',
-    'peed-on',
-    'peedee',
-    'peedled',
-    'peeep',
-    'peeesing',
-    'peeet',
-    'peeik',
     'peeinging',
-    'peel-castle',
-    'peel-towers',
-    'peeler\'s',
-    'peely',
-    'peely-wally',
-    'peenie',
-    'peent',
-    'peep-bo',
-    'peep-o',
-    'peep-peep-peep',
-    'peep-toed',
-    'peephological',
-    'peeping-toms',
-    'peepings',
-    'peeptoe',
     'peer&rehy;group',
-    'peer-approved',
-    'peer-assessment',
-    'peer-influenced',
-    'peer-review',
-    'peer-solidarity',
-    'peerce',
-    'peere',
-    'peeroo',
-    'peers-he',
-    'peers/farmer',
-    'peerschke',
-    'peert',
-    'peerybingles',
-    'peesies',
-    'peesley',
     'peeter',
-    'peeters',
-    'peetie',
-    'peets',
-    'peeva',
-    'peevers',
-    'peewitted',
-    'pefec',
-    'pefectionistic',
-    'peffery',
-    'peformance',
-    'peformances',
-    'peforming',
-    'pefull',
-    'peg-doll',
-    'peg-leg',
     'peg-legged',
-    'peg-precipitates',
-    'peg-sellers',
-    'peg-selling',
-    'peg-shape',
-    'peg-top',
-    'peg600',
-    'pegacycle',
-    'pegassus',
-    'pegasus-flotec',
-    'pegazus',
-    'pegboards',
-    'pegden',
-    'pegeen',
-    'pegg/fairport',
-    'pegged-down',
     'peggity',
-    'peggo',
-    'peggottys',
-    'pegheads',
-    'peghorn',
-    'peghouse',
-    'pegi',
-    'pegnado',
-    'pegnall',
-    'pegnitz',
-    'pegnunai',
-    'pegoscapus',
-    'pegram',
-    'pegrum',
-    'pegtop',
-    'pegwinder',
     'peh',
-    'pehaps',
-    'peho&eacute',
-    'pehoe',
-    'pei-ming',
-    'pei-ying',
-    'peibio',
-    'peibron',
-    'peice',
-    'peicheng',
-    'peignot',
-    'peijian',
-    'peijun',
-    'peindre',
-    'peint',
-    'peintres-graveurs',
     'peipus',
-    'peircean',
-    'peirene',
-    'peiser',
-    'peisley',
-    'peitie',
-    'peitions',
-    'peitoneal',
-    'peixoto',
-    'peiyuan',
-    'peiyun',
-    'pejanovic',
-    'pekan',
-    'pekanjustice',
-    'peke',
-    'pekes',
     'pekinels',
-    'peking-appointed',
-    'pekka-mikkola',
-    'pekov',
-    'pel&eacute;e',
-    'pela',
-    'peladan',
-    'pelado',
-    'pelage',
-    'pelagikos',
-    'pelagio',
-    'pelagonija',
-    'pelargonuims',
-    'pelasgian',
-    'pelasgians',
-    'pelasgic',
     'pelay',
-    'pelayo',
-    'pelcel',
-    'pelco',
-    'pelco:gc-100',
-    'pelecypods',
-    'pelegrini',
-    'pelegrinoides',
-    'pelegrinus',
-    'peleponnesus',
-    'peler',
-    'pelerin',
-    'pelerine',
-    'peleton',
-    'peletrines',
-    'pelfreeze',
     'pelham-clinton-hope',
-    'peli',
-    'peliatan',
-    'pelican-adjuster',
-    'pelican-halted',
-    'pelicano',
-    'peligro',
-    'pelileo-patate',
-    'peliosanthes',
-    'pelisses',
-    'pelite',
-    'peljee',
-    'peljekaise',
-    'pellant',
-    'pellegrina',
-    'pellegrneo',
     'pelles',
-    'pellet-fed',
-    'pellet/scat',
-    'pelletise',
-    'pelletized',
-    'pelletizer',
-    'pelletizing',
-    'pelletreau',
-    'pellett',
-    'pelli',
-    'pellicceria',
-    'pellice',
-    'pellicle',
-    'pellion',
-    'pellisier',
-    'pelliti',
     'pellizari',
-    'pellizza',
-    'pellizzi',
-    'pellmell',
-    'pellot',
-    'pellotoidal',
-    'pellow/oxford',
-    'pellow/wet',
-    'pellowe',
-    'pelmanism',
-    'pelo',
-    'peloidal',
-    'pelotas',
-    'pelotons',
-    'pels',
-    'pelsall',
     'pelser',
-    'pelsert',
-    'pelta-pattern',
-    'pelter',
-    'pelteret',
-    'peltigera',
-    'peltirogus',
-    'peltz',
-    'peltzman',
-    'peluchet',
-    'pelv',
-    'pelves/scapulae',
-    'pelvics',
-    'pelvis-grinding',
-    'pelvising',
-    'pelvoux',
     'pelwall',
-    'pembela',
-    'pemberleys',
-    'pembertons',
-    'pembery',
-    'pembleton',
-    'pembridge/gloucestershire',
-    'pembridge/herefordshire',
-    'pemco',
-    'pemeberton',
-    'pemel',
-    'pemimpin',
-    'pemtelic',
-    'pemyll',
-    'pen&rehy;etrated',
-    'pen\'',
     'pen-a',
-    'pen-and-red',
-    'pen-and-wash',
-    'pen-aware',
-    'pen-besmirched',
-    'pen-box',
-    'pen-centric',
-    'pen-clawdd',
-    'pen-drawn',
-    'pen-driving',
-    'pen-ends',
-    'pen-fuckers',
-    'pen-input',
-    'pen-knives',
-    'pen-light',
-    'pen-lights',
     'pen-man',
-    'pen-men',
-    'pen-operated',
-    'pen-pics',
-    'pen-picture',
-    'pen-pockets',
-    'pen-pushing',
-    'pen-screen',
-    'pen-stand',
-    'pen-stroke',
-    'pen-tip',
-    'pen-tops',
-    'pen-type',
-    'pen-ups',
-    'pen-y&rehy;mount-pont',
-    'pen-y-berllan',
     'pen-y-gwryd',
-    'pen-y-mount',
-    'pen-y-pass',
-    'pen-y-pound',
-    'pen-yr-orsedd',
-    'pen.loop',
-    'pen/faulkner',
-    'pen/pencil',
-    'pen/spade/sword',
-    'penacev',
-    'penados',
-    'penafiel',
-    'penal-ties',
-    'penaliver',
-    'penalization',
-    'penalties/benefits',
     'penaltriate',
-    'penalty-ridden',
-    'penalty-stroke',
-    'penalty-taking',
-    'penalty/losing',
-    'penand',
-    'penants',
-    'penarlag',
-    'penaton',
-    'penbank',
-    'penbased',
-    'penbedw',
-    'penberthy',
-    'penbook',
-    'penbury',
-    'penca',
     'pencannow',
-    'pencareg',
-    'pencarreg',
-    'pencarrow',
-    'pencavel',
-    'pence-a-month',
-    'pence-worth',
-    'pencell',
-    'penchants',
-    'pencho',
-    'pencil\'',
-    'pencil-and',
-    'pencil-beamed',
-    'pencil-cases',
-    'pencil-lead',
-    'pencil-licking',
     'pencil-like',
-    'pencil-scribbled',
-    'pencil-sharpener',
-    'pencil-sized',
-    'pencil-torch',
-    'penciled',
-    'pencilshaped',
-    'pencionem',
-    'penclawdd',
-    'pencombe/herefordshire',
-    'pencreas',
-    'pend2',
-    'pendanty',
-    'pendarvis',
-    'pendawalima',
-    'pendefig',
     'pendeford',
-    'pendejo',
-    'pendence',
-    'penderel',
-    'penderry',
-    'pendes',
-    'pendi',
-    'pendik',
-    'pendil',
-    'pending-tray',
-    'penditure',
-    'pendlington',
-    'pendo',
-    'pendrake',
-    'pendreich',
-    'pendrell',
     'pendrous',
-    'pendrous/musician',
-    'pendukini',
-    'pendular',
-    'pendulares',
-    'pendulina',
-    'pendulis',
-    'pendulous-breasted',
-    'pendulum-like',
-    'pendy-bouyiki',
-    'pendyffryn',
-    'pendzenik',
-    'peneaeus',
-    'penedes',
-    'peneil',
-    'penelis',
     'penenden',
-    'peneplain',
-    'penepole',
-    'penerbit',
-    'penerine',
-    'penerive',
-    'penerme',
-    'penes',
-    'peneth',
-    'penetrabili',
-    'penetralium',
-    'penetratively',
-    'penetrometer',
-    'peneva',
-    'penfro',
-    'pengate',
     'penge/beckenham',
-    'pengelley',
-    'pengelley/thames',
-    'pengelly/rover',
-    'pengelstein',
-    'pengfei',
-    'pengilley/thames',
-    'pengilly',
-    'pengosekan',
-    'penguin.com',
-    'pengusaha',
-    'pengwalla',
-    'pengwern',
-    'penh-based',
-    'penh-kompong',
-    'penhallurick',
     'penham',
-    'penheads',
-    'penhelig',
-    'penholders',
-    'penhurst',
-    'peni',
-    'penial',
-    'peniche',
-    'penicillin\'',
-    'penicillin-f',
-    'penicillin-g',
-    'penicillin-i',
-    'penicillin-ii',
-    'penicillin-iii',
-    'penicillin-iv',
-    'penicillin-k',
     'penicillin-producing',
-    'penicillin-splitting',
-    'penicillin-x',
-    'penicillin/streptomycin',
-    'penicillin/streptomycin/amphotericin',
-    'penicillinases',
-    'penicillopepsin',
-    'peniekonier',
-    'penigent',
-    'penile-vaginal',
-    'peninisular',
-    'peninsula/bitez',
-    'peninsular-malaysia',
-    'peninsulares',
-    'penioners',
-    'penis-toting',
     'penis/penetration/ejaculation',
-    'penisarwaen',
-    'penisarwaun',
-    'penised',
-    'penitente',
-    'penitentiales',
-    'penitentiary-like',
-    'peniuto',
-    'penjdeh',
-    'penk',
-    'penkelt',
-    'penkethman',
-    'penkin',
-    'penkull',
-    'penlee',
-    'penlez',
     'penlights',
-    'penllergaer',
-    'penly',
-    'penmachno',
-    'penman-ship',
-    'penmans',
-    'penmark',
-    'penmellyn',
-    'penmon',
-    'penmorfa',
-    'penmynydd',
-    'penn\'nrth',
-    'penn\'orths',
-    'penn-gaskell',
-    'penn.',
-    'pennaforte',
     'pennantian',
-    'pennatulacean-like',
-    'pennatulids',
-    'pennatus',
-    'pennaunt',
-    'penndon',
-    'pennefeather',
-    'penneth',
-    'penney/back',
-    'penney/oxford',
-    'penneys',
-    'pennia',
-    'penniman',
-    'pennina',
-    'pennine-sized',
-    'pennine-wayers',
     'penningtion',
-    'pennington/liberal',
-    'pennink',
-    'penninsula',
-    'pennistons',
-    'penno.',
-    'pennone',
-    'pennoned',
-    'pennsylvannia',
-    'penny\'orth',
-    'penny-',
-    'penny-a-mile',
-    'penny-a-week',
-    'penny-ante',
-    'penny-bright',
-    'penny-counting',
     'penny-for-the-guy',
-    'penny-gaffs',
-    'penny-in-the-pound',
-    'penny-in.',
-    'penny-pinchers',
-    'penny-sized',
-    'penny-teacher',
-    'penny-whistle',
-    'penny.another',
-    'penny/gloucester',
-    'pennycook',
-    'pennycraig',
-    'pennyfarthings',
-    'pennygown',
-    'pennyless',
-    'pennymans',
     'pennypit',
-    'pennys',
-    'pennysworth',
-    'pennyweight',
-    'pennywhistles',
-    'penobscot',
-    'penow',
-    'penparc',
-    'penpom',
-    'penponds',
-    'penpushing',
-    'penquite',
-    'penre',
-    'penrewen',
-    'penrhosgarnedd',
-    'penroc',
     'penrose/cousin',
-    'penryth',
-    'pens&atilde;o',
-    'pens/pencils',
-    'pensacola',
-    'pensak',
-    'pensate',
-    'pensation',
-    'pensato',
-    'pensbury',
-    'pensee',
-    'penselwood',
-    'penseur',
-    'pensford',
-    'pensi',
-    'pensier',
     'pensiero',
-    'pensile',
-    'pensilvania',
-    'pension-holders',
-    'pension-linked',
-    'pension-planning',
-    'pension-policies',
-    'pension-splitting',
-    'pension_because',
-    'pensionable/reckonable',
-    'pensionat',
-    'pensioners.',
-    'pensioners/ub40',
-    'pensionistpartiet',
-    'pensions-committees',
-    'pensions-the',
     'pensions.',
-    'pensions/redundancy',
-    'pensions_in',
-    'pensior',
-    'penskes',
-    'pensoes',
-    'pensychnant',
-    'pensylvania-based',
-    'pensynnu',
-    'penta&rehy;teuchal',
-    'penta-continental',
-    'penta-radial',
-    'pentacarbonyl',
-    'pentaceraster',
-    'pentachlorphenol',
-    'pentacle',
     'pentaclethra',
-    'pentacom',
-    'pentacon',
-    'pentacubes',
-    'pentadecapeptide',
-    'pentaene',
-    'pentagastrine',
-    'pentagastrn',
-    'pentagonally',
-    'pentahydrate',
-    'pentalphas',
-    'pentamerids',
-    'pentamers',
-    'pentan',
-    'pentane-oxy-ethane',
-    'pentangles',
     'pentanoic',
-    'pentaradial',
-    'pentastomids',
-    'pentates',
-    'pentateuchal',
-    'pentathletes',
-    'pentatomid',
-    'pentazocine',
-    'pentec&ocirc;te',
-    'pentecostal-type',
-    'pentecostalism',
-    'penteiacob',
-    'pentekontaetea',
-    'pentekontaetia',
-    'penteli',
-    'pentels',
     'pentene-1',
-    'penthi&eacute;vre',
-    'penthi&egrave;vre',
-    'penthylos',
-    'penticost',
-    'penticostal',
-    'pentii',
-    'pentillie',
-    'pentimento',
-    'pentir',
-    'pentith',
-    'pentium-shaped',
-    'pentium-specific',
-    'pentium/nt',
-    'pentominoes',
-    'pentonwil',
     'pentop',
-    'pentops/pen',
-    'pentoses',
-    'pentoxide',
-    'pentrcwrt',
-    'pentrefelin',
-    'pentreuchaf',
-    'pentrfoelas',
-    'pentrich',
-    'pentrwyn',
-    'pentrybrogan',
-    'pentrych',
-    'pentstemons',
-    'pentti',
-    'pentz',
-    'penumbra\'',
     'penumbras',
-    'penumbria',
-    'penurised',
-    'penuslisan',
-    'penware',
-    'penwhirn',
-    'penwood',
-    'penyard/herefordshire',
-    'penyfford',
-    'penygeulan',
-    'penygloddfa',
-    'penylan',
-    'penymynydd',
-    'penyrhelgi-du',
-    'penzais',
-    'penzance-newlyn',
     'penzer',
-    'penzini',
-    'penzlin',
-    'peobresanskoe',
-    'peockland',
-    'peony-flower',
-    'peony-flowered',
-    'peony-shaped',
-    'peooow',
-    'peopel',
-    'peopil',
-    'people&mdash;her',
-    'people&ndash',
-    'people&rehy;professions',
-    'people\'s.',
-    'people-contact',
     'people-cost',
-    'people-directed',
-    'people-do',
-    'people-factory',
-    'people-friends',
-    'people-groups',
-    'people-intensive',
-    'people-ized',
-    'people-movement',
-    'people-mover',
-    'people-need',
-    'people-orientated',
-    'people-shifting',
-    'people-spotting',
-    'people-state-nation-',
-    'people-take',
     'people-to-people',
-    'people-transfers',
-    'people-watchers',
-    'people-winning',
-    'people.each',
-    'people.i',
-    'people.the',
-    'people.who',
-    'people/',
-    'people/animal',
-    'people/awards',
-    'people/cadbury',
-    'people/can',
-    'people/clients',
-    'people/customers',
-    'people/families',
     'people/nation',
-    'people/politics-rich',
-    'people/satin',
-    'people/stars',
-    'people/strategaeth',
-    'people/torvill',
-    'people/union',
-    'people/who',
-    'people_as_long',
-    'people_so',
-    'peoplebarry',
-    'peopleealth',
-    'peopleeliefs',
-    'peopleisk',
-    'peoplethe',
-    'peounds',
     'peover',
-    'pep-pill',
-    'pep-pills',
-    'pep/unit',
-    'pepachair',
-    'peparethus',
-    'pepel',
-    'peperino',
-    'peperit',
-    'peperomia',
-    'peperoncini',
-    'pepetide',
-    'pephredo',
-    'pepler/environmental',
-    'peplis',
-    'peplum',
     'peponnet',
-    'pepper\'',
-    'pepper-caster',
-    'pepper-coloured',
-    'pepper-covered',
-    'pepper-grinder',
-    'pepper-seven',
-    'pepper.wrap',
-    'pepperberries',
-    'pepperd',
-    'pepperdine',
-    'pepperell',
-    'pepperkakor',
-    'peppermill',
-    'peppermint-scented',
-    'pepperminted',
     'pepperrell',
-    'peppers.',
-    'peppers/',
-    'peppertree',
-    'pepperworks',
-    'pepple',
-    'peprah',
-    'peprotech',
-    'pepsicolagy',
-    'pepsicomane',
-    'pepside',
-    'pepsik-i',
-    'pepsis',
-    'pepstain',
-    'pepsy',
-    'peptide-specific',
     'peptide/interleukin',
-    'peptide/protein',
-    'peptidoglycan',
-    'peptising',
-    'pepto',
-    'pepusch',
-    'pepy',
-    'pepysian',
-    'peque&ntilde;os-anap',
-    'pequena',
-    'pequiv&eacute;n',
-    'pequo',
-    'per&ccedil;u',
-    'per&dollar;1m',
-    'per&mgr;g',
-    'per&rehy;ceived',
     'per&rehy;centage',
-    'per&rehy;manently',
-    'per&rehy;sistent',
-    'per&rehy;spectives',
-    'per&scaron;t&yacute;n',
-    'per&uacute',
-    'per\'mit',
-    'per-acre',
-    'per-cent-increase',
-    'per-don-em-e',
-    'per-foe-li-art-oos',
-    'per-gallon',
-    'per-head',
-    'per-lease',
-    'per-minute',
-    'per-node',
     'per-page',
-    'per-person',
-    'per-pertex',
-    'per-port',
-    'per-pupil',
-    'per-request',
-    'per-son',
-    'per.sea',
-    'per_annum.',
-    'per_cent_per',
-    'per_er_per_capita',
-    'pera',
-    'peracaridae',
-    'perachi',
-    'peradeniya',
-    'perakh&oacute;ra',
     'peralla',
-    'peralta',
-    'peralta.',
-    'peram',
-    'perama',
-    'perambulatory',
-    'perammuna',
-    'peraplasmic',
-    'peras',
-    'perazzo',
-    'perben',
-    'perberton',
-    'perboral',
-    'perborates',
-    'perbrook',
-    'perc&eacute;s',
     'perceaue',
-    'perceiv',
-    'perceiv\'st',
-    'perceivability',
-    'perceivably',
-    'perceived.',
-    'perceivedly',
-    'perceiving.',
-    'percentage&rehy;rate',
-    'percentage&times;number',
-    'percentage-of-sale.',
-    'percentage-wise',
-    'percentage.ii',
-    'percentages.',
-    'percentatge',
-    'percentism',
     'percept/concept',
-    'perception\'',
-    'perception-based',
-    'perception-image-memory-illusion',
-    'perception-independent',
-    'perception/distending',
-    'perception/experience',
-    'perceptions/understanding',
-    'perceptronics',
-    'perceptual-analytic',
-    'perceptual-imaginal',
-    'perceptually-determined',
-    'perceptuo-motor',
-    'percet',
-    'percetekan',
-    'perch-balance',
     'perch-ring',
-    'perch.',
-    'perchard',
-    'perche',
-    'percheron',
-    'perchettes',
-    'perchfishers',
-    'perchikhin',
-    'perchlorethylene',
-    'perchloride',
-    'perchloroethylene',
-    'perchtholdsdorf',
-    'percie',
-    'percier',
-    'percifull',
-    'percivel',
     'percnopterus',
-    'perco',
-    'percoco',
-    'percovich',
-    'percuitaneous',
-    'perculates',
-    'percussed',
-    'percussion/ratchet',
-    'percussions',
-    'percussors',
-    'percutaneous-endoscopic',
-    'perczel',
-    'perd&oacute;n',
-    'perdal',
-    'perdas',
-    'perdeeta',
     'perdei',
-    'perdida',
-    'perdiem',
-    'perditos',
-    'perdiz',
-    'perdon',
-    'perdonnet',
-    'perdre',
-    'perdreaux',
-    'perdrigon',
-    'perduci',
-    'perdues',
-    'perdurable',
-    'perduto',
-    'perearers',
-    'peredelkino',
     'pereg',
-    'perega',
-    'peregra',
-    'peregriaa',
-    'peregrin',
-    'peregrin\'',
-    'peregrinating',
-    'pereira/author',
-    'perejaume',
-    'perella',
-    'peren',
-    'perequisite',
-    'perer',
-    'peress',
-    'peresson',
-    'perestrello',
     'perestroika\'',
-    'perestroika-resistant',
-    'peretti',
-    'peretz(independent)',
-    'pereves',
-    'pereyaslavl-zalesski',
-    'pereyra',
-    'perez-adamson',
-    'perez-aguilar',
-    'perez-cruet',
-    'perez-rivas',
-    'perfeccion',
-    'perfeccionis',
-    'perfect-fit',
-    'perfect-looking',
-    'perfectable',
     'perfectdata',
-    'perfecte',
-    'perfecti',
-    'perfection.',
-    'perfectissimum',
-    'perfectively',
-    'perfectly-',
-    'perfectly-flat',
-    'perfectly-hit',
-    'perfectly-judged',
-    'perfectly-packaged',
-    'perfectly-rounded',
-    'perfectly-shaped',
-    'perfectly-sighted',
-    'perfectly-struck',
-    'perfectly-surviving',
     'perfectly-tailored',
-    'perfectly-targeted',
-    'perfectly-tuned',
-    'perfectly-weighted',
-    'perfectly.',
-    'perfectos',
-    'perfectum',
-    'perferences',
-    'perficit',
-    'perfidiously',
-    'perfidiousness',
-    'perfikt',
-    'perfiliev',
-    'perfo',
-    'perfoliatus',
-    'perfomed',
     'perfor',
-    'perforance',
-    'perforates',
-    'perforatus',
-    'perform&mdash;and',
-    'perform-',
-    'perform-ance',
-    'perform.4',
-    'perform_a',
-    'performace',
-    'performan',
-    'performanc',
-    'performance&mdash;a',
-    'performance-',
-    'performance-affecting',
-    'performance-art',
     'performance-cum-composition',
-    'performance-data',
-    'performance-improving',
-    'performance-indicate',
-    'performance-linked',
-    'performance-measurement',
-    'performance-measuring',
-    'performance-over-a-pint',
-    'performance-per-pound',
-    'performance-programme',
-    'performance-reward',
-    'performance-saloon',
-    'performance-tested',
-    'performance/installation',
-    'performance/monitor',
-    'performance/reward',
     'performance/structural',
-    'performance/trading',
-    'performance/wedding',
-    'performance_rather',
-    'performanceindicators',
-    'performed&mdash;for',
-    'performed-by',
-    'performed-with',
-    'performer-director',
-    'performer.',
-    'performer/writer',
-    'performin\'',
-    'performs/delivers.',
-    'perfromance',
-    'perfrx',
-    'perfume-free',
     'perfumeries',
-    'perfunctoriness',
-    'perfuse',
-    'perfusedat',
-    'perfusion-fixed',
-    'perfusionof',
-    'perfusions',
-    'perg',
-    'perga',
-    'pergament',
-    'pergament-parmet',
-    'pergamon.',
-    'perganol',
-    'pergau',
-    'perger',
-    'pergola-framed',
     'pergola-style',
-    'pergoles',
-    'pergraecari',
-    'perhap',
-    'perhaps&mdash;that',
-    'perhaps-',
-    'perhaps-astonished',
-    'perhaps-it',
-    'perhaps-not-improved',
-    'perhaps.her',
-    'perhaps_as',
-    'perhapses',
-    'perharps',
-    'perhumid',
-    'perhydroisoindole',
-    'peri-bile',
     'peri-ictally',
-    'peri-infomatics',
-    'peri-informatique',
-    'peri-natal',
-    'peri-ventricular',
-    'periampullary',
-    'periander',
-    'perianth',
-    'periapical',
-    'periarteritis',
-    'periasamy',
-    'peribleptos',
-    'peribo',
-    'peric',
-    'perichondrial',
-    'pericle',
     'pericline',
-    'periclymaenum',
-    'pericoloso',
-    'pericom',
-    'pericontinental',
-    'pericoronitis',
-    'pericrypt',
-    'pericula',
-    'periculo',
-    'periculosum',
-    'pericytes',
-    'peridermal',
-    'perietal',
-    'periflux',
-    'perifra',
-    'perigenital',
     'periglaciation',
-    'periglour',
-    'perigny-sur-yerres',
-    'perigons',
-    'perigrines',
-    'perik',
-    'perikles',
-    'periled',
-    'perillus',
-    'perimed',
-    'perimedes',
-    'perimeter-weighting',
-    'perimetral',
-    'perimetric',
-    'perimetry',
-    'perimiter',
     'perimter',
-    'perina',
-    'perinde',
-    'perineums',
-    'perineurial',
-    'peringuey',
-    'perino',
-    'perinthians',
-    'perinthus',
-    'perintis',
-    'perinuclear/nuclear',
-    'perioc',
-    'periocolic',
-    'period&mdash;15',
-    'period&mdash;hence',
-    'period&mdash;in',
     'period&mdash;lock',
-    'period&mdash;two',
-    'period\'&mdash',
-    'period-',
-    'period-by-period',
-    'period-costumes',
-    'period-derivative',
-    'period-hocazade',
-    'period-one',
-    'period-particularly',
-    'period-two',
-    'period.4',
-    'period.bat',
-    'period/movement/idea/event',
-    'period/output/',
-    'period/output/res',
     'periodate-lysine-2%',
-    'periodical-publishing',
-    'periodically-elected',
-    'perioding',
-    'periodity',
-    'periodizations',
-    'periodized',
-    'periodizing',
-    'periodo',
-    'periodograms',
-    'periodontoid',
-    'periods\'',
-    'periods-a',
-    'periods.',
-    'perioesophageal',
-    'perioikic',
     'perion',
-    'periophthalmus',
-    'periosteotomy',
-    'periostitis',
-    'peripancreatic',
-    'peripatetically',
-    'peripatus',
-    'periperative',
-    'periperhap',
-    'peripeteia',
-    'periphera',
-    'peripheral-to-peripheral',
-    'peripheral/least',
-    'peripheralisation',
-    'peripheralism',
-    'peripherals-maker',
     'peripherial',
-    'peripherie',
-    'periphery\'',
-    'periphery-centre',
-    'periphrastic',
-    'periplous',
-    'peripodial',
-    'periscope-like',
-    'perishability',
-    'perishe',
-    'perisheth',
-    'perisiapan',
-    'perisinusoidal',
-    'perissa',
-    'perissat',
-    'peristaltically',
     'peristomal',
-    'peristriate',
-    'peristylium',
-    'perisympathetic',
-    'perit',
-    'peritalsis',
-    'periton',
-    'peritonsillar',
-    'peritubular',
-    'peritumoral',
-    'perityphlitis',
-    'periureteric',
-    'perivenular',
-    'periwigged',
-    'perizzites',
-    'perjuries',
     'perjurors',
-    'perked-up',
-    'perkhofers',
-    'perkikis',
-    'perkin-elmer/cetus',
-    'perkinsop',
-    'perkinsville',
-    'perkovic',
-    'perkpc',
-    'perks*',
-    'perks.this',
-    'perks/resident',
-    'perky.',
-    'perkyns',
-    'perlargoniums',
-    'perleberg',
     'perleihc',
-    'perleman',
-    'perles',
-    'perley',
-    'perlice',
-    'perlis',
-    'perlman/williams',
-    'perlmutter',
-    'perm\'',
-    'perm-headed',
-    'perma-frost',
-    'permaflex',
-    'permahide',
-    'permanance',
-    'permanent-memory',
-    'permanent-sounding',
     'permanent.magnet',
-    'permanent/r.i.c.s.',
-    'permanently-',
-    'permanently-hard',
-    'permanently-worried',
-    'permanents',
-    'permanet',
-    'permaplay',
-    'permaquip',
-    'permar',
-    'permarandy',
-    'permatec',
-    'permeabilised',
-    'permeabilization',
-    'permeant',
-    'permease',
     'permeat',
-    'permed/coloured',
-    'permedability',
-    'permenant',
-    'permian-age',
-    'permindar',
-    'perminute',
-    'permision',
-    'permiss',
-    'permission-giving',
-    'permissionaire',
-    'permissiveness-restrictiveness',
-    'permissivity',
-    'permisssion',
-    'permit-holders',
-    'permit-trainers',
     'permit-wielding',
-    'permit-winning',
-    'permitswith',
-    'permitted/forbidden',
-    'permittee',
-    'permittit',
-    'permixta',
-    'permixtum',
-    'permoglaze',
-    'permoid',
-    'permount',
-    'permselectivity',
-    'permster',
-    'permutating',
-    'permutational',
-    'permutatum',
     'perna',
-    'pernaja',
-    'perne',
-    'pernerstorfer',
-    'pernetiana',
-    'perng',
-    'perniciousness',
-    'pernod-ricard',
-    'pernods',
-    'pernstein',
-    'peroblem',
-    'peroff',
-    'perogative',
-    'peroipatetic',
-    'perom',
-    'peromyscus',
     'peronist-originated',
-    'peronistas',
-    'peronne',
-    'peronospora',
-    'perople',
-    'perormance',
-    'perot-bush',
-    'perot-style',
-    'perotin',
-    'perots.',
-    'perottus',
-    'perovskite',
-    'perowe',
-    'peroxidase-',
-    'peroxidase-antiperoxidase',
-    'peroxidase-conjugated',
     'peroxide-treated',
-    'peroxide.',
-    'peroxidesin',
-    'peroxiding',
-    'peroxisomes',
-    'peroxydase',
-    'perpective',
-    'perpeduan',
-    'perpendicularity',
-    'perpeptual',
-    'perpetiwel',
-    'perpetu',
-    'perpetuamque',
-    'perpetuations',
-    'perpetuators',
-    'perpetue',
     'perpetueum',
-    'perpich',
-    'perplexity/',
-    'perplext',
-    'perq',
-    'perqu&iacute;n',
-    'perr',
-    'perrada',
-    'perre',
-    'perreau-saussine',
-    'perree',
-    'perret-clermont',
-    'perrhaibia',
-    'perricaudet',
-    'perried',
-    'perrier-with-a-twist-of-lime',
     'perries',
-    'perril',
-    'perril-like',
-    'perriman',
-    'perrinpit',
-    'perrins/arms',
-    'perrins/forest',
-    'perrins/sealine',
-    'perrins/vet',
-    'perrodin',
-    'perron',
-    'perrone',
-    'perroni',
-    'perronneau',
-    'perrots',
-    'perroy',
     'perrs',
-    'perruque',
-    'perry-pathetic',
-    'perry/contestant',
-    'perry/credit',
-    'perry/gloucester',
-    'perry/nurse',
-    'perry/sealed',
-    'perry/staff',
-    'perry/study',
-    'perrybar',
-    'perryfields',
-    'perrylin',
-    'perrymount',
-    'perryness',
-    'perrywood',
     'pers.comm.',
-    'persae',
-    'persalt',
-    'persauded',
-    'persection',
-    'persegatti',
-    'perseid',
-    'persephone.',
-    'persequitur',
-    'perservation',
-    'perserve',
-    'perserveres',
-    'perseus-like',
-    'perseverate',
-    'perseveration',
-    'pershad',
     'pershall',
-    'persia.',
-    'persian-backed',
-    'persian-controlled',
-    'persian-design',
-    'persian-inspired',
-    'persian-speakers',
-    'persicifolia',
-    'persicum',
-    'persil-schein',
-    'persil-user',
-    'persimilis',
-    'persimitis',
-    'persional',
-    'persistantly',
-    'persisted.',
     'persistedafter',
-    'persistence/to',
-    'persitaltic',
-    'persius',
-    'persley',
-    'person&bull',
-    'person&mdash;judge',
-    'person&rehy;alized',
-    'person*',
-    'person-',
-    'person-computer',
-    'person-deictic',
-    'person-focused',
-    'person-group',
-    'person-hour',
-    'person-in-relation',
     'person-in-the-street',
-    'person-machine',
-    'person-management',
-    'person-months',
-    'person-orientated',
-    'person-s',
-    'person-specific',
-    'person-specificity',
-    'person-which',
-    'person-who-knowswhat-the-maker-of-clouds-is-thinking',
-    'person-with-everything',
-    'person-year',
-    'person.d',
-    'person.that',
-    'person/2',
-    'person/area',
     'person/company',
-    'person/loitering',
-    'person/official',
-    'person/other',
-    'person/people',
-    'person/s',
-    'person/twin',
-    'person/was',
-    'person/years',
-    'person_at',
-    'persona(s)',
-    'persona-non-fucking-grata',
-    'personably',
-    'personal-equity',
-    'personal-income',
-    'personal-income-tax',
     'personal-injury',
-    'personal-interest',
-    'personal-social',
-    'personal-tax',
-    'personal-weapons',
-    'personal/',
-    'personal/370',
-    'personal/emotional',
-    'personal/family',
-    'personal/impersonal',
-    'personal/institutional',
-    'personal/property',
-    'personal/social',
-    'personal/subjective',
-    'personal/underwriting',
-    'personali&rehy;ties',
     'personalisations',
-    'personalised.',
-    'personalises',
-    'personalising/objectifying',
-    'personalist',
-    'personality&rehy;screening',
-    'personality\'',
-    'personality-projecting',
-    'personality-selling',
-    'personality-typing',
-    'personality-wise',
-    'personall',
-    'personally-devised',
-    'personally-held',
-    'personals',
-    'personaluxury',
     'personaly',
-    'personarum',
-    'personating',
-    'personazh',
-    'personchester',
-    'personholes',
-    'personifi&rehy;cations',
-    'personis',
-    'personlised',
-    'personnel-changes',
-    'personnel/finance',
-    'personnel/management',
-    'personnel/people',
-    'personnel/training',
-    'personnels',
-    'persons&mdash;tax',
     'persons--previously',
-    'persons-in-relation',
-    'persons/ha',
-    'persons/trustees',
-    'personsmulti-disciplinary',
-    'personys',
-    'persoun',
-    'perspectivalism',
-    'perspectivcs',
-    'perspective-glass',
-    'perspective-takings',
-    'perspective/depth',
-    'perspectiveless',
-    'perspectives.',
-    'perspectivism',
-    'perspectivist',
     'perspeholis',
-    'perspektief',
-    'perspex-like',
-    'perspicuously',
-    'perspir&rehy;ation',
-    'perstor',
-    'persua&rehy;sion',
-    'persuaded.',
-    'persuaded/encouraged',
-    'persuadesd',
-    'persuasion.',
-    'persuasion/manipulation',
-    'persue',
-    'persulphate',
-    'persusah',
-    'perswade',
     'persymmetric.',
-    'pert-haran',
-    'pertec',
-    'pertelote',
-    'pertenhall',
-    'pertenue',
-    'perter',
-    'pertex/nylon',
-    'perth&ndash;inverness',
-    'perth-forfar',
-    'perth-inverness',
-    'perthois',
-    'perticularly',
-    'pertie',
-    'pertile',
-    'pertinencies',
     'pertinent.',
-    'pertinent.a',
-    'pertinet',
-    'pertinis',
-    'pertis',
-    'pertshire',
-    'pertubation',
-    'pertubohan',
-    'perturbed.',
-    'pertusaria',
-    'peru-chile',
-    'peru-ecuador',
-    'peru-nefer',
-    'peru/what',
-    'peruana',
-    'peruanidad',
     'peruano',
-    'peruanos',
-    'perugians',
-    'perukes',
-    'perukier',
-    'perun',
-    'perunov',
-    'perus',
-    'peruse_so',
-    'perussina',
-    'peruvian-based',
-    'peruvian-japanese',
-    'peruviana',
-    'peruvianum',
-    'peruvianus',
-    'peruviensis',
     'perv-eys',
-    'perv-pop',
-    'perv-rock',
-    'perveen',
-    'pervenit',
-    'perventage',
-    'perver',
-    'pervers',
-    'perversest',
-    'perversion-targeting',
-    'perversion/homosexuality',
-    'perversions-voyeurism',
-    'perversonality',
-    'pervyse',
-    'pervyshin',
-    'perwin',
     'perziano',
-    'perzon',
-    'pesando',
-    'pesapane',
-    'pescatrice',
-    'peschard',
-    'pescheria',
-    'peschisolido',
-    'peschowsky',
-    'peschsllibo',
-    'pescod',
-    'pescosolido',
-    'pescott',
-    'pesebre',
-    'pesented',
-    'pesenti',
     'pesfull',
-    'peshawar-based',
-    'peskar',
-    'peskibe',
-    'peskiest',
-    'pesne',
-    'peso-dollar',
-    'pesola',
-    'peson',
-    'pesquero',
-    'pessach',
-    'pessaire',
-    'pessell',
-    'pessi',
-    'pessimism/conservatism',
-    'pessin',
     'pessinuntia',
-    'pessl',
-    'pessoais',
-    'pessons',
-    'pest-',
-    'pest-buda',
-    'pest-controlling',
-    'pest-destroyer',
-    'pest-herbicides',
-    'pest-house',
-    'pest-management',
-    'pest-prone',
-    'pest-proof',
-    'pest-ridden',
-    'pest/disease',
-    'pestell/executive',
     'pestential',
-    'pester-the-public',
-    'pestguard',
-    'pesticide-covered',
-    'pesticide-drenched',
-    'pesticide-labelling',
-    'pesticide-related',
-    'pesticide-soaked',
-    'pesticides.it',
-    'pestilences',
-    'pestilentia',
-    'pestivirus',
-    'pet&ouml;fi',
-    'pet&rcaron;in',
-    'pet&rehy;lovers',
-    'pet-3d',
     'pet-a-torn',
-    'pet-ambulance',
-    'pet-crazy',
-    'pet-hate',
-    'pet-his',
-    'pet-hood',
-    'pet-lovers',
-    'pet-seekers',
-    'peta-stretch',
-    'petabecquerels',
-    'petacci',
-    'petai',
-    'petainiste',
-    'petainists',
-    'petal-first',
-    'petal-less',
     'petal-perfect',
-    'petal-shedding',
-    'petal-soft',
-    'petalflesh',
-    'petaling',
-    'petalism',
-    'petaloudes',
-    'petamadine',
-    'petardia',
-    'petarding',
-    'petaskirts',
-    'petches',
-    'petchii',
-    'pete\'n\'dud',
-    'pete\'s',
-    'pete/',
     'petechial',
-    'petel',
-    'peten',
-    'petenia',
-    'peter\'s',
-    'peter\'s-in-the-east',
-    'peter-john',
-    'peter-le-poore',
-    'peter-speak',
-    'peter/aids',
-    'peter/ellen',
-    'peter/grendon',
-    'peter2',
-    'peter:i',
-    'peterae',
-    'peterandpaul',
     'peterborough0',
-    'peterboroughs',
-    'peterbro',
-    'peterculter',
-    'petered-out',
-    'peterhead-type',
-    'peterhofstatt',
-    'peterina',
-    'peterkin/school',
-    'petermann',
-    'petermans',
-    'petermover',
-    'peternousek',
-    'peterport',
-    'petersburg-cannes',
-    'petersburgmurmansk',
     'petersens',
-    'petershausen',
-    'petershead',
-    'peterstock',
-    'peterswort',
-    'petertide',
-    'petes',
-    'petfish',
-    'petford',
-    'peth',
-    'pethadine',
-    'pethedine',
-    'petherham',
-    'petheringtons',
-    'pethor',
-    'peths',
     'peti&oacute;leos',
-    'peticero',
-    'petikostelni',
-    'petil',
-    'petillance',
-    'petingo',
-    'petiolar',
-    'petiolaris',
-    'petion-',
-    'petisi',
-    'petit-bourgeoisie',
-    'petit-goave',
-    'petit-grain',
-    'petit-saut',
-    'petit_bourgeoisie',
-    'petite-bourgeoisie',
     'petitgrain',
-    'petition-drawing',
-    'petitional',
-    'petitti',
-    'petitto',
-    'petkim',
-    'petkoff',
-    'petkovic/co-organiser',
-    'petless',
-    'petn',
-    'petnames',
-    'peto.',
-    'peto/concorde',
-    'peto/editor/raging',
-    'peto/imperial',
-    'petomane',
     'petomania',
-    'petowker',
-    'petr&oacute;polis',
-    'petra-chem',
-    'petrach',
-    'petrakov&mdash;director',
-    'petralona-atapuerca',
-    'petrarca',
-    'petrarchs',
-    'petraroia',
-    'petrascu',
-    'petrea',
-    'petrelle',
-    'petrenko',
-    'petrescus',
-    'petriaggi',
     'petrice',
-    'petricolor',
-    'petrie-hay',
-    'petrin',
-    'petritsch',
-    'petro&rehy;chemical',
-    'petro-chemicals',
-    'petro-economy',
-    'petro-pound',
-    'petrobius',
-    'petroc',
-    'petrocarpus',
-    'petrocelli',
-    'petrocorp',
-    'petroglyph',
-    'petroglyphs',
     'petrograd-',
-    'petroica',
-    'petrol&rehy;pinching',
-    'petrol&rehy;stations',
-    'petrol-bomb',
-    'petrol-bombed',
-    'petrol-caps',
-    'petrol-electric',
-    'petrol-fed',
-    'petrol-fuelled',
-    'petrol-rationing',
-    'petrol-shaded',
-    'petrol-sniffing',
-    'petrol-tin',
-    'petrol-type',
-    'petrol/air',
     'petrol/rust',
-    'petrolacosaurs',
-    'petrolea',
-    'petroleas',
-    'petrolem',
-    'petroleum-based',
-    'petroleum-exporting',
-    'petroleum-led',
-    'petroleum-run',
-    'petroleum/mineral',
-    'petroliferos',
-    'petrolimex',
-    'petrolog&iacute;a',
-    'petrologic',
-    'petrology.',
-    'petrolsplashing',
     'petromyzon',
-    'petronilla',
-    'petropavlosk',
-    'petropavlovsk',
-    'petrophysical',
-    'petrophysicist',
-    'petropolis',
-    'petroqu&iacute;mica',
-    'petrorwanda',
-    'petros',
-    'petrosani',
-    'petroscrites',
-    'petrotilapia',
-    'petrov-vodkin',
-    'petrov-vodkins',
-    'petrova/abbey',
     'petrovicky',
-    'petrovitch',
-    'petrovskaya',
-    'petrovskiy',
-    'petrulis',
-    'petrushenko',
-    'petruska',
-    'petruson',
-    'petry',
-    'petsearch',
-    'petshop',
-    'petsoft',
-    'pett/mother',
-    'pett/rye',
-    'pettaugh',
-    'pettefar',
     'petteford',
-    'pettenkofer',
-    'petterill',
-    'pettichaps',
-    'petticoat-ridden',
-    'petticoatbodice',
-    'pettiest',
-    'pettifer/president',
-    'pettifer/president/bbont',
-    'pettigrews',
-    'pettily',
-    'pettingoe',
-    'pettipaws',
-    'pettitcoat',
-    'pettitoes',
-    'pettnau',
     'pettrac',
-    'petty-bag',
-    'petty-criminal',
-    'petty-fogging',
-    'petty-mindedness',
-    'petty.bourgeois',
-    'petty/robert',
-    'pettycur',
-    'pettys',
-    'petuariensis',
-    'petulances',
-    'petulia',
-    'petur-emil',
-    'peturbed',
-    'petzet',
-    'peucedanum',
     'peuegot',
-    'peugelaar',
-    'peugeot-renault',
-    'peugeot-talbot',
-    'peugoet',
-    'peukert',
-    'peuple-mrp',
-    'peuples',
-    'peur',
-    'peurorum',
-    'peurto',
-    'peuser',
-    'peuterey',
-    'peutinger',
-    'peutz-jeghers',
-    'peveit',
     'peverey',
-    'pevero',
-    'peversed',
-    'pew&eacute',
-    'pew-looking',
-    'pew-stewards',
-    'pewbound',
-    'pewits',
-    'pewked',
-    'pewley',
-    'pews.nigel',
-    'pewsham',
-    'pewter&rehy;coloured',
-    'pewter-coloured',
-    'pewter-look',
-    'pewter-topped',
     'pewtered',
-    'pewterers',
-    'pewterspear',
-    'peyday',
-    'peyelstainin',
-    'peyin\'',
-    'peyrat-le-ch&acirc;teau',
-    'peyrere',
-    'peyrol',
-    'peyron',
-    'peyronne',
-    'peyster',
-    'peyton-bruhl',
-    'pezdek',
-    'pezerovic',
-    'pezim',
     'pezzatta',
-    'pezzetta',
-    'pezzizella',
-    'pf-5',
-    'pf1/&lt;up',
-    'pf309',
-    'pf51',
-    'pfaffinger',
-    'pfafflin',
-    'pfaltz',
-    'pfannenstiel',
-    'pfarrkirche',
-    'pfas',
-    'pfauter',
-    'pfb',
-    'pfe',
     'pfeffermann',
-    'pfennig-pinching',
-    'pfenning\'',
-    'pferdest&auml;rke',
-    'pfetzing',
-    'pfffftt',
-    'pfge-constructed',
-    'pfh',
-    'pfifftriggs',
-    'pfile',
-    'pfitzner',
-    'pfl&ucirc;gl',
-    'pfla',
-    'pflanzenformen',
-    'pflanzer-baltin',
-    'pflaz',
     'pfleger',
-    'pflp&mdash;gc',
-    'pflp-general',
-    'pflugbeil',
-    'pflugzeit',
-    'pfnd',
-    'pforr',
-    'pfr-46000',
-    'pfrunder',
-    'pfu/cell',
-    'pfu5',
-    'pfui',
-    'pfunds',
-    'pg/10',
-    'pg/127',
-    'pg/colour/107',
     'pg/colour/129',
-    'pg/colour/subtitles/120',
-    'pg/colour/subtitles/121',
-    'pg/mg/wet',
-    'pg/tube',
-    'pg10',
-    'pg13',
-    'pg2',
-    'pg3',
-    'pg4',
-    'pg5',
-    'pg6',
-    'pga/',
-    'pga3',
-    'pga4',
-    'pga5',
     'pgc-rflp',
-    'pgc301',
-    'pgce-tefl',
-    'pge_',
-    'pgem-3z',
-    'pgem-3zf(+)',
-    'pgem-7zf(+).',
-    'pgem4',
-    'pgex-2t.',
-    'pgex-3x',
-    'pgex-3xgal4jun1-193',
-    'pgex-cr1&agr',
-    'pgex-cri&agr',
-    'pgex-kg.',
-    'pgf&amp;sub1&agr',
-    'pgflquo',
     'pghorbol',
-    'pgi2',
-    'pgii',
-    'pgood',
-    'pgpr',
-    'pgps',
-    'pgu',
-    'pgw1',
-    'pgw11',
-    'pgw11-tacmetj',
-    'ph&gt;5',
-    'ph&gt;7',
-    'ph&lt;4.0',
-    'ph&ndash;ucg',
-    'ph-',
-    'ph-lps',
     'ph-metry',
-    'ph-value',
-    'ph.',
-    'ph.d/',
-    'ph.l.',
-    'ph1&deg;cat',
-    'ph3.7',
-    'ph36',
-    'ph5',
-    'ph6.7',
-    'ph7&ndash;8',
-    'ph=7.1',
-    'ph=7.6',
-    'pha-stimulated',
-    'phac',
-    'phacelia',
     'phacili',
-    'phacocele',
-    'phadebas',
-    'phadraig',
-    'phaeacians',
-    'phaedrus',
-    'phaeochromocytoma',
-    'phaeocystis',
-    'phaer',
-    'phage-infected',
-    'phagedenic',
-    'phail',
-    'phaire',
-    'phairy',
-    'phal',
-    'phalanger',
     'phalarope.',
-    'phalaropodidae',
-    'phalasarna',
-    'phalera',
-    'phalerata',
-    'phalereus',
-    'phalerum',
-    'phall',
-    'phallic-looking',
-    'phallic-oral-anal',
-    'phallic-shaped',
-    'phallichtyhs',
-    'phallicky',
-    'phallo-centric',
-    'phallo-logocentric',
-    'phallocracy',
     'phallogocentric',
-    'phalloids',
-    'phalloplasty',
-    'phallus-like',
-    'phallus/father/adult',
-    'phalu',
-    'phanaticism',
-    'phancy',
-    'phanerogam',
-    'phanerogams',
-    'phanes',
-    'phang-nga',
-    'phanh',
-    'phanitchaphak',
-    'phantasia',
-    'phantasien',
     'phantasised',
-    'phantasizing',
-    'phantasma',
-    'phantasmagorias',
-    'phantasmagoricals',
-    'phantasmatic',
-    'phantasmes',
-    'phantasmic',
-    'phantasmogoric',
-    'phantassie',
-    'phantastes',
-    'phantasy-gratification',
-    'phantasy-phallus',
-    'phantd',
-    'phantom-bodied',
-    'phantom-like',
     'phantom-ridden',
-    'phantomed',
-    'phanuphong',
-    'phao',
-    'phara',
-    'pharajius',
-    'pharamacia',
-    'pharaoh-style',
-    'pharax',
-    'phardidh',
-    'pharisaically',
-    'pharma-ceutical',
-    'pharma-plast',
-    'pharmaceutic',
-    'pharmaceutical/health',
-    'pharmaceutical/pesticide/herbicide',
     'pharmacia-pl',
-    'pharmacia.',
-    'pharmacodynamic',
-    'pharmacoeconomic',
-    'pharmacoeconomics',
-    'pharmacologia',
-    'pharmacologically-active',
-    'pharmacopaea',
-    'pharmacopeia',
-    'pharmacopoeias',
-    'pharmacopoeta',
-    'pharmacutical',
-    'pharmaecutica',
-    'pharmaecuticals',
-    'pharmakologie',
-    'pharmakon',
     'pharmalogical',
-    'pharmocopia',
-    'pharnabazos',
-    'pharros',
-    'pharsale',
-    'pharsalia',
-    'pharsee',
-    'pharuk',
-    'pharyngeals',
-    'pharyngitic',
-    'pharyngocele',
-    'pharyngolepis',
-    'phase-changing',
-    'phase-lag',
-    'phase-locked',
-    'phase-locking',
     'phase-melting',
-    'phase-related',
-    'phase-sensitive',
-    'phase-shift-keyed',
-    'phase-split',
-    'phased-out',
-    'phasels',
-    'phasering',
-    'phasers',
-    'phases2',
-    'phasi',
-    'phasianidae',
-    'phasianidae.',
-    'phasically',
-    'phasings',
-    'phasis',
     'phasmida',
-    'phasmids',
-    'phatigue',
-    'phatphong',
-    'phaure',
-    'phayao',
-    'phb-rich',
-    'phc-1',
-    'phc-16',
-    'phc-3',
-    'phc1',
-    'phd-years',
-    'phd/',
-    'phe113',
-    'phe480',
-    'phe504',
     'phe60',
-    'phe65',
-    'phe93',
-    'pheasant-shooting',
-    'pheasantries',
-    'pheatures',
-    'phebe',
-    'phebus',
-    'phedang',
-    'phedre',
-    'pheeeww',
-    'pheet',
-    'pheew',
-    'pheidian',
-    'pheidippides',
-    'pheidole',
     'phelam',
-    'phelans',
-    'phellatio',
-    'phelpes',
-    'phelps&ndash;stokes',
-    'phelps-dodge',
-    'phelps/student',
-    'phemonenal',
-    'phen1',
-    'phenanthridinium',
-    'phenazine-1-carboxylic',
-    'phene',
-    'phenemomenon',
-    'pheneomenal',
-    'phenergan',
-    'phengite',
     'phenlmetrazin',
-    'phenobarb',
-    'phenogeny',
-    'phenol-',
-    'phenol-oil',
-    'phenol/chloroform/',
-    'phenol/chloroform/isoamyl',
-    'phenol:chloroform',
-    'phenol:chloroform:isoamyl',
-    'phenological',
-    'phenolphthalein',
-    'phenolsulphonphthalein',
-    'phenomema',
-    'phenomena-hypnotism',
-    'phenomena.t',
-    'phenomenal.',
     'phenomenologioal',
-    'phenomenom',
-    'phenomenon.',
-    'phenomenona',
-    'phenomenum',
-    'phenominally',
-    'phenonemon',
-    'phenonemum',
-    'phenotext',
-    'phenotopic',
-    'phenotype-genotype',
-    'phenoxazone',
-    'phenprint',
-    'phentanyl',
-    'phenylacetonitrile',
-    'phenylalanine-free',
     'phenylamine/water',
-    'phenylated',
-    'phenylethyl',
-    'phenylethylamines',
-    'phenylhydrazone',
-    'phenylketones',
-    'phenylmethylsulfonyl',
-    'phenylmethylsuphonylfluoride',
-    'phenylpentyl',
-    'phenylthiohydantoin-cysteine',
-    'pheoboric',
-    'pheolung',
-    'pheolung/composer',
-    'pheomelanin',
-    'pheomelanosomes',
-    'pheonix',
     'pheriche',
-    'pheromenal',
-    'pheromene',
-    'pheromonally',
-    'pheromone-fizzing',
-    'pherozshaw',
-    'phers',
-    'phew-missus-it\'s-a-scorcher',
-    'phew-nited',
-    'phewf',
-    'phewy',
-    'phffft',
-    'phhhh',
-    'phhor',
-    'phi&amp;sup1',
-    'phi&amp;sup2',
     'phi-based',
-    'phi-phi',
-    'phi/pot',
-    'phiale',
-    'phiall',
-    'phibsborough',
-    'phichitr',
-    'phil&rehy;osophers',
-    'phil-dame',
-    'phil/homeless',
-    'philadelphia-based',
-    'philadelphum',
-    'philaharmonia',
-    'philamore',
-    'philanthropia',
-    'philanthropical',
     'philanthropies',
-    'philanthropologists',
-    'philanthropy/charity',
-    'philaon',
-    'philarmonic',
-    'philaster',
-    'philautus',
-    'philby/mark',
-    'philco',
-    'philcox',
-    'phile',
-    'philebus',
-    'phileftheron',
-    'phileia',
-    'philgun',
-    'philharmonia/klemperer',
     'philharmonics',
-    'philharmoniker',
-    'philhellenic',
-    'philibert-de-gardlieu',
-    'philike',
-    'philip-lorca',
-    'philip-morris',
-    'philipdown',
-    'philipot',
-    'philippatos',
-    'philippe-laurent',
-    'philippensis',
-    'philippes',
-    'philippian',
-    'philippicae',
-    'philippides',
     'philippika',
-    'philippine-based',
-    'philippinean',
-    'philippines-based',
-    'philippines-born',
-    'philippines.l',
-    'philipponnat',
-    'philippopolis',
-    'philippot',
-    'philipps-universitat',
-    'philippus',
-    'philips-led',
-    'philips/grundig',
-    'philips/posidrive',
-    'philips/sony',
-    'philitis',
     'phillies',
-    'phillinganes',
-    'phillip-claude',
-    'phillip/prisoner',
-    'phillipinetown',
-    'phillipium',
-    'phillippi',
-    'phillips&ndash',
-    'phillips-imperial',
-    'phillips-watcher',
-    'phillips/automobile',
-    'phillips/butterfly',
-    'phillips/church',
-    'phillips/deacon',
-    'phillips/ex-offender',
-    'phillips/eye',
     'phillips/farmer',
-    'phillips/former',
-    'phillips/gloucestershire',
-    'phillips/nalgo',
-    'phillips/official',
-    'phillips/pozidriv',
-    'phillips/silverstone',
-    'phillips/the',
-    'phillipses',
-    'phillipsii',
-    'philllips',
-    'phillmore',
-    'phillpot',
-    'phillpott',
-    'phillyrea',
-    'philmore',
     'philnico',
-    'philo-s&oacute;phos',
-    'philo-semites',
-    'philo-semitic',
-    'philo-semitism',
-    'philobiblion',
-    'philocepos',
-    'philoctetes',
-    'philodemus',
-    'philodoroi',
-    'philodromidae',
-    'philogyny',
-    'philokrates',
-    'philologic',
-    'philologischer',
-    'philomela',
     'philomele',
-    'philomelos',
-    'philonymy',
-    'philopappos',
-    'philorth',
-    'philos',
-    'philoscity',
-    'philosit',
-    'philosopber-king',
-    'philosopbers',
-    'philosophemes',
-    'philosopher-agronomists',
-    'philosopher-humanists',
-    'philosopher-psychologist',
-    'philosopher-ruler',
-    'philosopher-scientist',
     'philosopher-theologian',
-    'philosopher.priest',
-    'philosophers&mdash;and',
-    'philosophi&rehy;cal',
-    'philosophic-religious',
-    'philosophically-inspired',
-    'philosophically-minded',
-    'philosophiques',
-    'philosophische',
-    'philosophisches',
-    'philosophises',
-    'philosophizes',
-    'philosophy-',
-    'philosophy-\'we',
-    'philosophy-of-science',
-    'philosophy.2',
     'philosopical',
-    'philospher',
-    'philostrate',
-    'philostratus',
-    'philotimo',
-    'philoxeroides',
-    'philpots',
-    'philpott/wiltshire',
-    'philsburgh',
-    'philsophers',
-    'philsophical',
-    'philsophy',
-    'philuchoros',
-    'phily',
-    'phineus',
-    'phipp',
     'phippen',
-    'phipps-faire',
-    'phipps/chief',
-    'phipps/restore',
-    'phippsia',
-    'phiroun',
-    'phist',
-    'phistiki',
-    'phizaclea',
-    'phizmongers',
-    'phizzog',
-    'phizzogs',
-    'phizzwizardry',
-    'phlebitic',
-    'phlebotomum',
-    'phlegon',
     'phlegyas',
-    'phleious',
-    'phleum',
-    'phlexhair',
-    'phlippa',
-    'phllips',
-    'phlllips',
-    'phloem-transmissible',
-    'phlog',
-    'phlogistic',
-    'phlogopite-bearing',
-    'phlogopite-rich',
-    'phloxes',
-    'phn',
-    'phnaarg',
-    'phnaargs',
     'pho-to-graph',
-    'pho4',
-    'phobe',
-    'phobos-byzantium',
-    'phoby',
-    'phoca',
-    'phocas',
-    'phocids',
-    'phocion',
-    'phocoea',
-    'phodrang',
-    'phoe',
-    'phoebidas',
-    'phoeniceus',
-    'phoeniconaias',
-    'phoenicopteridae',
     'phoenix-based',
-    'phoenix-king',
-    'phoenix/scottsdale&ndash;grand',
-    'phoitographic',
-    'pholmorphism',
-    'pholo',
-    'phomis',
-    'phomn',
-    'phomvihan',
-    'phon-ed',
-    'phonaesthetic',
-    'phonation',
-    'phone&rehy;call',
-    'phone-',
-    'phone-answerer-teamaker',
-    'phone-attachment',
     'phone-booth-to-phone-booth',
-    'phone-boxes',
-    'phone-bugging',
-    'phone-characters',
-    'phone-exchange',
-    'phone-extension',
-    'phone-jack',
-    'phone-ownership',
-    'phone-tap',
-    'phone-taps',
-    'phone-time',
-    'phone-users',
-    'phone.but',
-    'phone.it',
-    'phonebooth',
-    'phonecall.',
     'phoneday',
-    'phonemate',
-    'phoneme-grapheme',
-    'phoneme-monitoring',
-    'phonemicise',
-    'phonemics',
-    'phonepoint',
-    'phones.it',
-    'phonetic-level',
-    'phonetic/fanatic',
-    'phoneticised',
-    'phoneyetic',
-    'phoneys',
-    'phonin\'',
-    'phoning-in',
-    'phonings',
     'phonocentricism',
-    'phonocentricity',
-    'phonocentrism',
-    'phonocentrist',
-    'phonoctonus',
-    'phonogram-fuelled',
-    'phonographer',
-    'phonographic/gramophone',
-    'phonolite',
-    'phonolites',
-    'phonological-recoding',
-    'phonological-similarity',
-    'phonologist',
-    'phonology/phonetics',
-    'phonons',
-    'phonsie',
     'phony-baloney',
-    'phonycord',
-    'phor',
-    'phor-3',
-    'phorbolesters',
-    'phorbyl',
-    'phorcys',
-    'phormia',
-    'phormion',
-    'phoros',
-    'phorrr',
-    'phos-phor-esc-ence',
-    'phos.',
-    'phospha-alkynes',
-    'phosphage',
-    'phosphalipids',
     'phosphatase-antiphosphatase',
-    'phosphate-binding',
-    'phosphate-deficient',
-    'phosphate-dna',
-    'phosphate-removing',
-    'phosphate-rich',
-    'phosphate-stripping',
-    'phosphated',
-    'phosphateoxidase',
-    'phosphatidylchloine',
-    'phosphatidylglucerol',
-    'phosphatization',
-    'phosphines',
-    'phosphite',
-    'phosphlipid',
-    'phosphoacceptor',
     'phosphodiesterases',
-    'phosphoglucomutase',
-    'phosphoglyceric',
-    'phosphoinositide-specific',
-    'phosphokinae',
-    'phospholinase',
-    'phospholipds',
-    'phospholipid/bile',
-    'phosphomolybdate',
-    'phosphonate',
-    'phosphonic',
-    'phosphor-bronze',
-    'phosphoramidon',
-    'phosphorescing',
-    'phosphorite',
-    'phosphorlyation',
     'phosphorus-32',
-    'phosphorus-rich',
-    'phosphoryl-accepting',
-    'phosphorylase',
-    'phosphorylating',
-    'phosphoserine',
-    'phosphotadylinositol',
-    'phosphothioate',
-    'phosphothreonine',
-    'phosporous',
-    'phostoxin',
-    'phot-album',
-    'photgraphic',
-    'photgraphs',
-    'photina',
-    'photo&rehy;journalist',
     'photo&rehy;micrography',
-    'photo-activatable',
-    'photo-affinity',
-    'photo-ageing',
-    'photo-album',
-    'photo-archive',
-    'photo-billboard',
-    'photo-bleaching',
-    'photo-book',
-    'photo-booths',
-    'photo-canvases',
-    'photo-chemistry',
-    'photo-collage',
-    'photo-detectors',
-    'photo-documentation',
-    'photo-electron',
     'photo-excited',
-    'photo-file',
-    'photo-flash',
-    'photo-graph',
-    'photo-graphic',
-    'photo-identification',
-    'photo-identity',
-    'photo-journalist',
-    'photo-kiosks',
-    'photo-labile',
-    'photo-laden',
-    'photo-mechanical',
-    'photo-micrograph',
-    'photo-micrography',
-    'photo-montages',
-    'photo-offset',
     'photo-optical',
-    'photo-painting',
-    'photo-paintings',
-    'photo-peak',
-    'photo-pieces',
-    'photo-printing',
-    'photo-process',
-    'photo-protective',
-    'photo-realists',
-    'photo-receptive',
-    'photo-reporters',
-    'photo-secession',
-    'photo-ship',
-    'photo-stop',
-    'photo-surrealists',
-    'photo-synthesize',
     'photo-synthetic',
-    'photo-theatre',
-    'photo-therapy',
-    'photo-tips',
-    'photo-transformations',
-    'photo-typesetting',
-    'photo-vision',
-    'photo-voltaic',
-    'photo.',
-    'photo/line',
-    'photoallergic',
-    'photobleaching',
-    'photobooths',
-    'photoc',
-    'photocathode',
-    'photochemical-oxidant',
     'photochemicals',
-    'photochromic',
-    'photocollage',
-    'photocompose',
-    'photocomposing',
-    'photocompositioned',
-    'photocopyable',
-    'photocopying/printing',
-    'photocredit',
-    'photocrosslinking',
-    'photocurrent',
-    'photodegradable',
-    'photodestruction',
-    'photodevice',
-    'photodisplay',
-    'photodissociating',
     'photodrama',
-    'photofakes',
-    'photofax',
-    'photofinish.',
-    'photofinishes',
-    'photoflash',
-    'photogeologist',
-    'photografie',
-    'photograher',
-    'photogrammetric',
-    'photographe',
-    'photographer-friend',
-    'photographer-in-residence',
-    'photographer-peer',
-    'photographer/camera',
-    'photographer/journalist',
     'photographic-sculptural',
-    'photographical',
-    'photographically-based',
-    'photographically-enlarged',
-    'photographies',
-    'photographs.',
-    'photographs/cut',
-    'photographs/jan',
-    'photographs/john',
-    'photographs/melvin',
-    'photographs/nadia',
-    'photographs/nutan',
-    'photographs/paul',
-    'photographs/tim',
-    'photographs/tom',
-    'photographs/video',
     'photography.',
-    'photography/chris',
-    'photography/jerry',
-    'photography/mixed',
-    'photography:chris',
-    'photogs',
-    'photoguide',
-    'photoimaging',
-    'photoionised',
-    'photoionized',
-    'photolabile',
-    'photolineaments',
-    'photolithographically',
-    'photoluminescence',
-    'photolysed',
-    'photolytically-generated',
     'photolyzed',
-    'photomasks',
-    'photomechanically',
-    'photometers',
-    'photometrist',
-    'photomicrographer',
-    'photomicroscopes',
-    'photomultipliers',
-    'photon-counting',
-    'photon-induced',
-    'photonic',
-    'photonics',
-    'photonscm',
-    'photopass',
-    'photopghraphy',
-    'photophone',
     'photophonic',
-    'photopigment',
-    'photoprotein',
-    'photoproteins',
-    'photoreaction',
-    'photorealistic',
-    'photoreceptive',
-    'photoreduce',
-    'photorefraction',
-    'photoresist',
-    'photoresists',
-    'photoromances',
-    'photos/bios',
-    'photosculpture',
-    'photosensitizers',
-    'photoseries',
     'photoshoot',
-    'photostad',
-    'photostated',
-    'photostatted',
-    'photostatting',
-    'photostops',
-    'photosynthesis.',
-    'photosyntheticphosphorylation',
-    'photosystem',
-    'phototec',
-    'phototherapist',
-    'photothermolysis',
-    'phototransduction',
-    'phototropism',
-    'phototypeset',
-    'phototypesetter&mdash;anyone',
     'photovideo',
-    'photovoltage',
-    'photowork',
-    'photys',
-    'phox',
-    'phox-bsa-coated',
-    'phox.bsa-coated',
-    'phr',
-    'phr.',
-    'phradhatu-doisuther',
-    'phragma',
-    'phragmocone',
-    'phrakhanana',
-    'phrasal/prepositional',
-    'phrase-',
-    'phrase-book.',
     'phrase-books',
-    'phrase-endings',
-    'phrase-file',
-    'phrase-groupings',
-    'phrase-level',
-    'phrase-maker',
-    'phrase-making',
-    'phrase-matching',
-    'phrase-monger',
-    'phrase-specific',
-    'phrase-structures',
-    'phrase.',
-    'phrase/word',
-    'phrasebooks',
-    'phrasingover',
-    'phratagoune',
     'phrathethnes',
-    'phraxiot',
-    'phray',
-    'phreak',
-    'phreebies',
-    'phreedome',
-    'phreeranger',
-    'phromnia',
-    'phrontistery',
-    'phrp',
-    'phrr',
-    'phrum',
-    'phrygians',
-    'phrygium',
-    'phsphate',
-    'phsphorylation',
     'phsycocines',
-    'phsyical',
-    'phthonos',
-    'phucke',
-    'phugoid',
-    'phukians',
-    'phunky',
-    'phunny',
-    'phunumofathometer',
-    'phuopsis',
-    'phurmomyces',
-    'phus',
-    'phusis',
-    'phut&rehy;phutting',
-    'phut-phut-phut',
-    'phut-phutting',
     'phutel-2-end',
-    'phutt',
-    'phutted',
-    'phwoaaaargghh',
-    'phwoar',
-    'phwoargghh',
-    'phwooar',
-    'phwore',
-    'phwrs',
-    'phwurgh',
-    'phy',
-    'phya',
-    'phycomycetes',
-    'phyenotype',
-    'phyfe',
-    'phyka5',
     'phylacteries',
-    'phylactery',
-    'phylai',
-    'phylarchus',
-    'phylax',
-    'phyle',
-    'phylisan',
-    'phyllan',
-    'phyllanthus',
-    'phylli',
-    'phyllis/burglary',
-    'phyllites',
-    'phyllitis',
-    'phyllobaenus',
-    'phylloclamys',
-    'phylloglossum',
     'phyllomedusa',
-    'phyllon',
-    'phyllonotus',
-    'phyllosan*',
-    'phyllosilicate-type',
-    'phyllosilicates',
-    'phylloxera-proof',
-    'phyllyp',
-    'phylogene&rehy;tic',
-    'phylogenesis',
-    'phylogenically',
-    'phylotaxis',
-    'phylox',
-    'phymateus',
-    'phymatidae',
-    'phynoderee',
     'phyptus',
-    'phys.',
-    'physa',
-    'physalis',
-    'physalus',
-    'physcocine',
-    'physeptone',
-    'physeter',
-    'physhyian',
-    'physi',
-    'physical-chemical',
-    'physical-contact',
-    'physical-education',
-    'physical-geographical',
-    'physical-type',
-    'physical/',
     'physical/biological',
-    'physical/functional',
-    'physical/psychological/logical',
-    'physical/technical',
-    'physicalisation',
-    'physicalising',
-    'physically\'',
-    'physically-based',
-    'physically-handicapped',
-    'physically-i',
-    'physicals',
-    'physicans',
-    'physician&ndash;botanist',
-    'physician-botanist',
-    'physician-elderly',
-    'physician-extraordinary',
     'physician-general',
-    'physician-in-ordinary',
-    'physician-patient',
-    'physician/philosopher/mathematician/astronomer',
-    'physicians&mdash;later',
-    'physicienne',
-    'physicist-poet',
-    'physiclar',
-    'physicochemical/biological',
-    'physics-and-biology',
-    'physics-centred',
-    'physics-orientated',
-    'physics/',
-    'physics/humanities',
-    'physik',
-    'physikalisch',
     'physikalisches',
-    'physike',
-    'physio-coach',
-    'physio-cultural',
-    'physio-geographical',
-    'physio-psychology',
-    'physio/author',
-    'physiocrat',
-    'physiocratic',
-    'physiognomically',
-    'physiograph',
-    'physiologia',
-    'physiologiae',
-    'physiologische',
-    'physionomiae',
-    'physiotherpist',
     'physis',
-    'physisorbable',
-    'physitian',
-    'physitians',
-    'physophorylation',
-    'physostegia',
-    'physostigmine',
-    'physucally',
-    'phytelephas',
-    'phyto-aromatherapists',
-    'phyto-geographical',
-    'phyto-geological',
-    'phytochemically',
-    'phytoclasts',
-    'phytogeographic',
-    'phytogeographically',
     'phytogeography',
-    'phytokarst',
-    'phytolaccaceae',
-    'phytologia',
-    'phytology',
-    'phytomass',
-    'phytooestrogen',
-    'phytooestrogens',
-    'phytopathological',
-    'phytoseiid',
-    'phytosociologiques',
-    'phytosociologists',
-    'phytosome',
-    'phytotherapie',
-    'phytotoxic',
-    'pi%',
     'pi&amp;sup1',
-    'pi&amp;sup2',
-    'pi&amp;sup3',
-    'pi&amp;sup6',
-    'pi&dollar',
-    'pi&eacute;rard',
-    'pi&egrave;ce_de_resistance',
-    'pi&egrave;che',
-    'pi&egrave;ge',
-    'pi&mdash;test',
-    'pi&mdash;util.olb',
-    'pi&ntilde',
-    'pi&ntilde;on',
-    'pi&ntilde;on-juniper',
-    'pi&scaron;t&ecaron;k',
-    'pi\'s',
     'pi-0',
-    'pi-3k',
-    'pi-hinkeeeee',
-    'pi-i-i-i-i-i-sssss',
-    'pi-n',
-    'pi-pi-pi-pi-pi',
-    'pi-rho',
-    'pi.aa',
-    'pi.ab',
-    'pi.ac',
-    'pi.ad',
-    'pi.ae',
-    'pi.af',
-    'pi.ag',
-    'pi.olb',
-    'pi.pre',
     'pi.res',
-    'pi.s01',
-    'pi.s02',
-    'pi.s03',
-    'pi.s04',
-    'pi.s05',
-    'pi.s06',
-    'pi.s07',
-    'pi.s08',
-    'pi.s09',
-    'pi.s10',
-    'pi.s11',
-    'pi.s12',
-    'pi.s13',
-    'pi.s14',
-    'pi.s15',
     'pi.s16',
-    'pi.s17',
-    'pi.s18',
-    'pi.s19',
-    'pi.s20',
-    'pi.s21',
-    'pi.s22',
-    'pi.s23',
-    'pi/180',
-    'pi/2',
-    'pia&tcedil;a',
-    'piacciono',
-    'piacenti',
-    'piacentini',
-    'piacentino',
-    'piacore',
     'piacular',
-    'piaculative',
-    'piaff\'',
-    'piaffe',
-    'piaget-flavell',
-    'piah',
-    'piambo',
-    'pian\'',
-    'piancaballo',
-    'pianer',
-    'piange',
-    'pianim',
-    'pianino',
-    'pianissino',
-    'pianist-conductor',
-    'pianist-husband',
     'pianist/composers',
-    'pianiste',
-    'pianistes',
-    'pianna',
-    'piano\'',
-    'piano-\'come',
-    'piano-accompanied',
-    'piano-driven',
-    'piano-duet',
-    'piano-harpsichord',
-    'piano-key',
-    'piano-led',
-    'piano-legs',
-    'piano-like',
-    'piano-move',
-    'piano-player',
     'piano-sized',
-    'piano-sound',
-    'piano-string',
-    'piano-technique',
-    'piano-tuner',
-    'piano-type',
-    'piano-vocal',
-    'piano-wire',
-    'piano/clarsach',
-    'piano/strings',
-    'pianocide',
-    'pianofiles',
-    'pianofortes',
-    'pianosa',
-    'pianti',
-    'piar-gallup',
     'piara',
-    'piaristenkirche',
-    'piasecka',
-    'piasecka-johnson',
-    'piasky',
-    'piasts',
-    'piatchy',
-    'piatkowski',
-    'piatnitsky',
-    'piatrkow',
-    'piau&iacute',
-    'piau-engaly',
-    'piazetta',
-    'piazzi',
-    'pib',
-    'piber',
     'pic&uacute;n',
-    'pic-nic',
-    'pic-ture',
-    'picador-quilled',
-    'picaliqi',
-    'picarbia',
-    'picardian',
-    'picasso-influenced',
-    'picasso-like',
-    'picasso-style',
-    'picauo',
-    'picc.',
-    'piccaninnies',
-    'piccaninny',
-    'piccasso',
-    'piccaver',
     'picch-u.',
-    'picciafuoco',
-    'piccian',
-    'piccies',
-    'piccin',
-    'piccini',
-    'piccone',
-    'piccys',
-    'picenum',
-    'piche',
-    'pichenibule',
-    'pichers',
-    'pichey',
-    'pichon-lalande',
-    'picidae',
-    'picies',
     'pick&mdash;ups',
-    'pick&ndash;up',
-    'pick\'n',
-    'pick-a-landlord',
-    'pick-a-sticks',
-    'pick-and&rehy;choose',
-    'pick-basic',
-    'pick-compatible',
-    'pick-helve',
-    'pick-lists',
-    'pick-lock',
-    'pick-locks',
-    'pick-men',
-    'pick-pick-picking',
-    'pick-pocketing',
-    'pick-stitching',
     'pick-stroke',
-    'pick-up-able',
-    'pick-up-ey',
-    'pick-up.',
-    'pick/finger',
-    'pick/fingers',
-    'pick_once',
-    'pickable',
-    'pickard/hereford',
-    'pickavance',
-    'pickbourne',
-    'picked-clean',
-    'picked-on',
-    'pickelhaube',
-    'picker-up',
-    'pickerham',
     'pickering/malton',
-    'pickernell',
-    'pickers-up',
-    'picket-fence',
-    'picketline',
-    'picketted',
-    'picketts',
-    'pickhandles',
-    'pickins',
-    'pickle-bottle',
-    'pickle-cocks',
-    'pickle-jar',
-    'picklecock',
-    'pickleey',
-    'picklenash',
-    'pickleses',
     'pickleson',
-    'picklock',
-    'picklocks',
-    'pickmere',
-    'picknett',
-    'picknicking',
-    'pickpocketed',
-    'picksley',
-    'pickson',
-    'pickstock/gloucester',
-    'pickwickian',
-    'picnic-in-the-park',
-    'picnic-patch',
-    'picnic-type',
-    'picnic/barbeque',
-    'picnicers',
     'picnicing',
-    'picnicker',
-    'picnics.',
-    'picnics/barbecue',
-    'pico-kernel',
-    'picodealions',
-    'picoequivalents',
-    'picoides',
-    'picoprocessors',
-    'picornaviruses',
-    'picoskirt',
-    'picotage',
-    'picotee',
-    'picovsky',
-    'picpoul',
-    'picques',
     'picquetting',
-    'picrosirius',
-    'picstrips',
-    'pictish-scottish',
-    'picto',
-    'pictogram-like',
-    'pictographic\'',
-    'pictography',
-    'picton-shipton',
-    'pictoral',
-    'pictore',
-    'pictorer',
-    'pictorials',
-    'pictoris',
-    'pictum',
-    'pictur',
     'pictura',
-    'pictural',
-    'picture&rehy;language',
-    'picture-album',
-    'picture-buyer',
-    'picture-by-picture',
-    'picture-covered',
-    'picture-cum&rehy;flow-chart',
-    'picture-drawing',
-    'picture-edits',
-    'picture-faker',
-    'picture-frames',
-    'picture-galleries',
-    'picture-gallery',
-    'picture-glyphs',
-    'picture-halls',
     'picture-harmonics',
-    'picture-houses',
-    'picture-imp',
-    'picture-in-picture',
-    'picture-labelled',
-    'picture-language',
-    'picture-led',
-    'picture-lending',
-    'picture-like',
-    'picture-lined',
-    'picture-loving',
-    'picture-naming',
-    'picture-obsessed',
-    'picture-palace',
-    'picture-perfect',
-    'picture-plane',
     'picture-postcards',
-    'picture-rail',
-    'picture-reader',
-    'picture-recognition',
-    'picture-recognizing',
-    'picture-recording',
-    'picture-resolution',
-    'picture-seller',
-    'picture-selling',
-    'picture-sequence',
-    'picture-space',
-    'picture-square',
-    'picture-tables',
-    'picture-to',
-    'picture-watching',
-    'picture-writing',
     'picture:brian',
-    'picture:fiona',
-    'picture:jason',
-    'picture:jeff',
-    'picture:stuart',
-    'picturebook',
-    'picturedrome',
-    'picturegram',
-    'picturehouses',
-    'pictureless',
-    'picturemakers',
-    'pictureque',
-    'pictures-avs',
-    'pictures.',
-    'pictures/bicester/oxfordshire',
-    'pictures/bishops',
     'pictures/bullingdon',
-    'pictures/cheltenham/gloucestershire',
-    'pictures/clare',
-    'pictures/frames',
-    'pictures/gloucestershire',
-    'pictures/graeme',
-    'pictures/grendon',
-    'pictures/hailey/oxfordshire',
-    'pictures/information',
-    'pictures/jessica',
-    'pictures/luton/bedfordshire',
-    'pictures/sharpness/gloucestershire',
-    'pictures/stonehenge/wiltshire',
-    'pictures/stonehouse/gloucestershire',
-    'pictures/swindon',
-    'pictures/upper',
     'pictures/washington',
-    'pictures/worcester',
-    'picturist',
-    'picturists',
-    'picturization',
-    'picup',
-    'picutres',
-    'pid/frg/fun',
-    'pidar',
-    'pidcock',
-    'pidcocks',
-    'pidd',
-    'piddledown',
-    'piddletown',
-    'piddley',
-    'pidgeley',
     'pidgeon/winning',
-    'pidgeons',
-    'pidger',
-    'pidgin-english',
-    'pidgin-italian',
-    'pidgin-speaking',
-    'pidginized',
-    'pidra',
-    'pie&rehy;eyed',
-    'pie-3cat',
-    'pie-bald',
-    'pie-based',
-    'pie-brained',
-    'pie-chart',
-    'pie-crust',
-    'pie-dish',
     'pie-dog',
-    'pie-eating',
-    'pie-filling',
-    'pie-frill',
-    'pie-in-the-sky-eyes-in-the-sky',
-    'pie-jarmers',
-    'pie-mash',
-    'pie-noire',
-    'pie-olympics',
-    'pie-rouge',
-    'pie-seller',
-    'pie-sellers',
-    'pie-shop',
-    'pie-warmer',
-    'pieactdc.pen',
-    'pieading',
     'pieasment.pen',
-    'pieassdc.pen',
-    'pieassors.pen',
-    'piebalds',
-    'piec',
-    'piece-box',
-    'piece-dyed',
-    'piece-size',
-    'piece-time',
-    'piece-turned-stuck-up-councillor\'s',
-    'piece-wages',
-    'piecers',
-    'pieces-part',
-    'piecewise',
-    'piecewise-linear',
-    'piecewise/uniform',
     'piecha',
-    'piecharts',
-    'piechniczek',
-    'piecredc.pen',
-    'piecrepck.pen',
-    'piecrust',
-    'pied-&aacute;-terre',
-    'pied-&agrave;-terres',
-    'pied-a-terre',
-    'pied-noir',
-    'piedad',
-    'piedade',
-    'piedish',
-    'piedmonts',
-    'piedras',
-    'pieds-noirs',
     'piee-ou',
-    'pieenter.pen',
-    'piegan',
-    'piege',
-    'piegenrot.pen',
-    'piekins',
-    'piel',
-    'piela',
-    'pielistrp.pen',
-    'pieman\'',
-    'pienaar/transvaal',
-    'pienne',
-    'pieology',
-    'piepline',
-    'piepowder',
-    'pieqaappr.pen',
     'pieqaprep.pen',
-    'pieqasub.pen',
-    'pier-end',
-    'pier-glass',
-    'pier-heads',
-    'pieraldo',
-    'pierandrea',
-    'pierbalancourt',
-    'pierc',
-    'pierce-goulding',
-    'pierce-right',
-    'piercements',
-    'piercers',
-    'piercie',
-    'piercings',
-    'piere',
     'piereadfp.pen',
-    'piereadmd.pen',
-    'piereadrp.pen',
-    'piergiovanni',
-    'pieria',
-    'pierid',
-    'pieridae',
-    'pierino',
-    'pierion',
-    'pierleoni',
-    'piermay',
-    'piermont',
-    'piern&eacute',
-    'pierogi',
-    'pieroth',
-    'pierpaolo',
     'pierquin',
-    'pierre-alain',
-    'pierre-antoine',
-    'pierre-buffi&egrave;re',
-    'pierre-charron',
-    'pierre-emmanuel',
-    'pierre-etienne',
-    'pierre-fran&ccedil;ois',
-    'pierre-francois',
-    'pierre-henri',
-    'pierre-hitting-raoul-to-the-ground',
-    'pierre-joseph',
-    'pierre-michel',
-    'pierre-noire',
-    'pierre-paul',
-    'pierre-premier-de-serbie',
     'pierrefitte-nestalas',
-    'pierrehenri',
-    'pierrel',
-    'pierrelatte',
-    'pierrepoints',
-    'piers.',
-    'pierside',
-    'pierssene',
-    'pierules',
-    'piervittorio',
-    'piesl',
-    'piesmold',
-    'piesrcfgn.pen',
-    'piesting',
-    'piesubdc.pen',
-    'piet&agrave;s',
     'pietade',
-    'pietermaritsburg',
-    'pieterszoon',
-    'pietik&auml;inen',
-    'pietists',
-    'pietr&ograve',
-    'pietralunga',
-    'pietrera',
-    'pietri',
-    'pietruszka',
-    'pietzner',
-    'pieupdtdc.pen',
-    'pieupdtmd.pen',
-    'pieuse',
-    'pieviewdc.pen',
-    'pieviewmd.pen',
     'piezoceramic',
-    'piezoelectricity',
-    'piezoresistive',
-    'pifaretti',
-    'pifco',
-    'piff',
-    'piff-paff',
-    'piffa',
-    'pifferari',
-    'pifling',
-    'pig&rehy;sticking',
-    'pig\'s-head',
-    'pig(white/mushroom)',
-    'pig-',
-    'pig-bin',
-    'pig-brained',
     'pig-breeder',
-    'pig-butcher',
-    'pig-eared',
-    'pig-eyed',
-    'pig-fancier',
-    'pig-farm',
-    'pig-farmer',
-    'pig-farming',
-    'pig-filthy',
-    'pig-footed',
-    'pig-headedly',
-    'pig-hesded',
-    'pig-hut',
-    'pig-lovers',
-    'pig-nests',
-    'pig-offal',
     'pig-outs',
-    'pig-pen',
-    'pig-raising',
-    'pig-roast',
-    'pig-shaped',
-    'pig-shit',
-    'pig-sick',
-    'pig-skin',
-    'pig-sties',
-    'pig-store',
-    'pig-stye',
-    'pig-styes',
-    'pig-tail',
-    'pig-trough',
-    'pig-ugly',
-    'pig-yard',
     'pig1',
-    'pigastric',
-    'pigato',
-    'pigbreeding',
-    'pigdog',
-    'pige',
-    'pigeat',
-    'pigeon-beheading',
-    'pigeon-breeding',
-    'pigeon-droppings',
-    'pigeon-fancier',
-    'pigeon-fancying',
-    'pigeon-hearted',
-    'pigeon-holding',
-    'pigeon-politics',
-    'pigeon-racing',
     'pigeon-shooting',
-    'pigeon-size',
-    'pigeon-soiled',
-    'pigeon-whitened',
-    'pigeoncote',
-    'pigf-i-r.8',
-    'pigfarm',
-    'pigfeed',
-    'pigges',
-    'pigggott',
-    'piggin.',
-    'piggins',
-    'piggish',
-    'piggishly',
-    'piggly',
-    'piggott-sims',
     'piggott-smith',
-    'piggy&rehy;back',
-    'piggy-in-a-poke',
-    'piggy-pink',
-    'piggybacks',
-    'piggyholes',
-    'pigheadedly',
-    'pightles',
-    'pigkilling',
-    'piglett',
-    'piglings',
-    'pigment-backed',
-    'pigment-containing',
-    'pigment-free',
-    'pigment.',
-    'pigmenting',
     'pigmentoseum',
-    'pigmere',
-    'pigmyes',
-    'pigmyfied',
-    'pigneraticia',
-    'pignolet',
-    'pignone',
-    'pigoens',
-    'pigorini',
-    'pigotts',
-    'pigou-friedman',
-    'pigovian',
-    'pigram',
-    'pigreco',
-    'pigsback',
-    'pigshave',
     'pigshit',
-    'pigster',
-    'pigstys',
-    'piipari',
-    'pij&gt;p\'ij',
-    'pij&lt;p\'ij',
-    'pijaudier',
-    'pijs',
-    'pikaia',
-    'pikantus',
-    'pikasheen',
-    'pikasso',
-    'pikcilingis',
-    'pike-men',
-    'pike-pushes',
-    'pike-sea',
     'pike/brenda',
-    'pike/jade',
-    'pike/publican',
-    'pike/site',
-    'pike/solar',
-    'pike/villager',
-    'pikeawassa',
-    'pikelets',
-    'pikeman',
-    'piker',
-    'pikers',
-    'pikestaffs',
-    'pikestone',
-    'pikit',
-    'pikoulis',
-    'pil&acirc;tre',
     'pil&rehy;grims',
-    'pil-a',
-    'pila',
-    'pilae',
-    'pilai',
-    'pilao',
-    'pilaris',
-    'pilatii',
-    'pilato',
-    'pilatte',
-    'pilbora',
-    'pilbro',
-    'pilbrow',
-    'pilchers',
-    'pilchester',
-    'pildinny',
     'pile\'',
-    'pile-\'em-high-and-sell-\'em-cheap',
-    'pile-drivers',
-    'pile-dwellings',
-    'pile-it-high',
-    'pile-of-bricks',
-    'pile-up:two',
-    'pileated',
-    'piled-high',
-    'pilee',
-    'pileless',
-    'pilferers',
-    'pilfering/loss',
-    'pilferproof',
-    'pilg',
-    'pilger-sutton',
     'pilger/journalist',
-    'pilgerite',
-    'pilgram',
-    'pilgram-narrator',
-    'pilgrim-',
-    'pilgrim-community',
-    'pilgrimes',
-    'pilgrimmage',
-    'pilgrimsway',
-    'piliavin',
-    'pilic',
-    'pilin\'',
-    'pilipinas',
-    'pilisuk',
-    'piljian',
-    'pilkem',
     'pilkins',
-    'pilks',
-    'pill-bottles',
-    'pill-eating',
-    'pill-out',
-    'pill-peddler',
-    'pill-popper',
-    'pill-potting',
-    'pill-pushers',
-    'pill-users',
-    'pill/car',
-    'pill/mini-pill',
-    'pill/oxon',
-    'pillagings',
-    'pillah',
-    'pillai/consultant',
     'pillar-\'drums',
-    'pillar-and-concrete',
-    'pillar-capitals',
-    'pillar-idol',
-    'pillar-like',
-    'pillar-mounted',
-    'pillar-mullion',
-    'pillar-to-post',
-    'pillarisation',
-    'pillarised',
-    'pillarists',
-    'pillarization',
-    'pillarless',
-    'pillay',
-    'pilled',
-    'pillement',
     'pillenknick',
-    'pilliers',
-    'pilliga',
-    'pilling/head',
-    'pillius',
-    'pillnitz',
-    'pillow-biter',
-    'pillow-covers',
-    'pillow-fight',
-    'pillow-fighting',
-    'pillow-fights',
-    'pillow-lava/hyaloclastite',
-    'pillow-lavas',
-    'pillow-not',
-    'pillow-slip',
-    'pillow-slips',
     'pillow_as',
-    'pillowcase.',
-    'pillowfight',
-    'pillowslip',
-    'pills\'n\'thrills',
-    'pilm&eacute',
-    'pilmays',
-    'pilning',
-    'pilocene',
-    'piloerection',
-    'pilopts',
-    'pilosa',
-    'pilot\'s-eye',
-    'pilot-adventurer',
-    'pilot-berths',
-    'pilot-coat',
     'pilot-holes',
-    'pilot-in-command',
-    'pilot-plant',
-    'pilot-prince',
-    'pilot-scale',
-    'pilot-seat',
-    'pilot-style',
-    'pilot-surveyed',
-    'pilot-test',
-    'pilot-tested',
-    'pilot-to-controller',
-    'pilot/passenger',
-    'pilota',
-    'pilotari',
-    'pilote',
-    'pilothouse',
     'pilotmen',
-    'pilots-to-be',
-    'pilotted',
-    'pilotwings',
-    'pils-type',
-    'pilsbury',
-    'pilsea',
-    'pilson',
-    'piltdown-type',
-    'piltencreif',
-    'piltzer',
-    'pilulas',
-    'pilus',
-    'pim.',
-    'piman',
-    'pimarnthip',
     'pimary',
-    'pimblett',
-    'pimelic',
-    'pimelodidae',
-    'pimelodids',
-    'pimental',
-    'piments',
-    'pimperne',
-    'pimpinellifolium',
-    'pimple-like',
-    'pimplenose',
-    'pimpliest',
-    'pimply-butted',
-    'pimsleur',
-    'pin&rehy;points',
-    'pin-before',
     'pin-board',
-    'pin-brained',
-    'pin-clear',
-    'pin-curl',
-    'pin-curls',
-    'pin-drop',
-    'pin-eyes',
-    'pin-fine',
-    'pin-flags',
-    'pin-hatted',
-    'pin-heads',
-    'pin-kung',
-    'pin-neat',
-    'pin-pricked',
-    'pin-stripped',
-    'pin-table',
     'pin-tables',
-    'pin-toed',
-    'pin-tucked',
-    'pin-ups.',
-    'pin/smoothers',
-    'pinacidil',
-    'pinacles',
-    'pinafore-like',
-    'pinball-machine',
-    'pinball/arcade',
-    'pinballed',
-    'pinboards',
-    'pinbury',
-    'pincay',
-    'pincel',
-    'pincent',
     'pincents',
-    'pincer-grips',
-    'pincer-hold',
-    'pincer-like',
-    'pincer-movement',
-    'pinch-an-inch',
-    'pinch-and-swell',
-    'pinch-headed',
-    'pinch-hitting',
-    'pinch-induced',
-    'pinch-pleated',
-    'pinch-points',
-    'pinchbetter',
-    'pinchcock',
-    'pinched-down',
-    'pinched-featured',
     'pinched-looking',
-    'pinchemel',
-    'pincher/spy',
-    'pinchin',
-    'pinchings-in',
-    'pincho',
-    'pinchot',
-    'pinchpenny',
-    'pinckney',
-    'pincoffs',
-    'pincot',
-    'pinctada',
-    'pincurl',
-    'pincurled',
-    'pincushions',
-    'pind',
     'pindaya',
-    'pindi',
-    'pindolol',
-    'pindot',
-    'pinds',
-    'pine-and-heather',
-    'pine-bound',
-    'pine-branch',
-    'pine-cased',
-    'pine-effect',
-    'pine-flavoured',
-    'pine-furnished',
-    'pine-marten',
-    'pine-martin',
-    'pine-nuts',
-    'pine-oak',
     'pine-resined',
-    'pine-scrubbed',
-    'pine-shuttered',
-    'pine-stem',
-    'pine-wilderness',
-    'pine-wooded',
-    'pinealoma',
-    'pineappleweed',
-    'pineappley',
-    'pineford',
-    'pineiro',
-    'pinell',
-    'pinellas',
-    'pineres',
-    'pineridge',
-    'pinet',
     'pineta/garden/mare',
-    'pinetown',
-    'pinetree',
-    'pinettes',
-    'piney',
-    'pinfarthings',
-    'pinfolds',
-    'ping-pong-ball',
-    'ping/pong',
-    'ping14',
-    'pingle',
-    'pingleston',
-    'pingouin',
-    'pingshuo',
-    'pinguicula',
-    'pinguid',
     'pinguins',
-    'pinhasi',
-    'pinhay',
-    'pinhead-sized',
-    'pinin',
-    'pininfarina-designed',
-    'pinior',
-    'piniprompter',
-    'pinise',
-    'pinito',
-    'pinjointed',
-    'pink\'',
-    'pink\'uns',
-    'pink-',
-    'pink-and-brown',
-    'pink-and-dark-green',
     'pink-and-gold',
-    'pink-and-green',
-    'pink-and-lavender',
-    'pink-and-mauve',
-    'pink-and-pearl',
-    'pink-arched',
-    'pink-blue-purple',
-    'pink-bottom',
-    'pink-browns',
-    'pink-capped',
-    'pink-coats',
-    'pink-eyed-dilute///wild-type',
-    'pink-flowered',
-    'pink-for-a-girl',
-    'pink-gilled',
-    'pink-ish',
     'pink-kneed',
-    'pink-legged',
-    'pink-membraned',
-    'pink-muzzled',
-    'pink-ohs',
-    'pink-painted',
-    'pink-peach',
-    'pink-pink\'ing',
-    'pink-purple',
-    'pink-red',
-    'pink-side',
-    'pink-splashed-white',
-    'pink-spotted',
-    'pink-sprigged',
-    'pink-stained',
-    'pink-striped',
     'pink-tinted',
-    'pink-tissued',
-    'pink-topped',
-    'pink-trimmed',
-    'pink-turbaned',
-    'pink-walled',
-    'pink-white',
-    'pink-winged',
-    'pink/a',
-    'pink/blue',
-    'pink/blue/yellow/white',
-    'pink/white',
-    'pinka',
-    'pinkam',
-    'pinkantus',
-    'pinkbells',
     'pinkeens',
-    'pinken',
-    'pinkened',
-    'pinkeney',
-    'pinkerton/deacon',
-    'pinkerton/for',
-    'pinkerton/minister',
-    'pinkest',
-    'pinkey',
-    'pinkfoot',
-    'pinkhayan',
-    'pinkie-baited',
-    'pinkish-blue',
-    'pinkish-cinnamon',
-    'pinkish-gold',
-    'pinkish-gray',
     'pinkish-greenish',
-    'pinkish-looking',
-    'pinkish/brown',
-    'pinkman',
-    'pinkoe',
-    'pinkwashed',
-    'pinkworthy',
-    'pinky-beige',
-    'pinky-mauvey',
-    'pinky-orange',
-    'pinky-peach',
-    'pinky-red',
-    'pinky-reds',
-    'pinky-white',
-    'pinky/brown',
-    'pinley',
     'pinmoney',
-    'pinna',
-    'pinnacle-shaped',
-    'pinnacle-top',
-    'pinnaster',
-    'pinnate',
-    'pinnated',
-    'pinneau',
-    'pinned-down',
-    'pinned.',
-    'pinnick',
-    'pinnikin',
-    'pinning-up',
-    'pinniped',
-    'pinnipedia',
-    'pinnochio',
     'pinnocks',
-    'pinocchio-style',
-    'pinocytic',
-    'pinocytosis',
-    'pinoleum',
-    'pinon',
-    'pinotage',
-    'pinowski',
-    'pinquet',
-    'pinschers',
-    'pinsdorf',
-    'pinsent/olympic',
-    'pinsk',
-    'pinsker',
-    'pinski',
-    'pinstrips',
     'pint&amp;pizza',
-    'pint-downing',
-    'pint-glass',
-    'pint-of-water',
-    'pint-pots',
-    'pint-size',
-    'pint/1&frac14',
-    'pint/150ml',
-    'pint/2/&frac12',
-    'pint/200ml',
-    'pint/300',
-    'pint/450ml',
-    'pint/600ml',
-    'pintado',
-    'pintailed',
-    'pinter-bellows/osteo-archaeologist',
     'pinters',
-    'pintid',
-    'pintilie',
-    'pinting',
-    'pintor',
-    'pintrumpet',
-    'pints.',
-    'pints/1',
-    'pints/2&frac14',
-    'pints/3&frac34',
-    'pintsized',
-    'pintucked',
-    'pinturas',
-    'pinu',
-    'pinu**',
-    'pinup',
     'pinups',
-    'pinwales',
-    'pinwell',
-    'pinwheel',
-    'pinwheeled',
-    'pinwheels',
-    'pinzgauers',
-    'pioden',
-    'piola-kirchhoff',
-    'pioloform-coated',
-    'pionair',
-    'pioneer-breed',
-    'pioneeringly',
-    'pionuse',
-    'piot',
-    'piotroski',
     'piotrowksi',
-    'piotrowska',
-    'piotrowski',
-    'pip&ndash',
-    'pip-pip',
-    'pip-pip-pi-p',
-    'pip-pip-pip',
-    'pip-pips',
-    'pip.',
-    'pip86',
-    'pipal',
-    'pipe&rehy;smokers',
-    'pipe-and-slippers',
-    'pipe-bending',
-    'pipe-bomb',
-    'pipe-bombs',
     'pipe-bowl',
-    'pipe-clayed',
-    'pipe-claying',
-    'pipe-dreams',
-    'pipe-fitting',
-    'pipe-freezing',
-    'pipe-gargle',
-    'pipe-jacking',
-    'pipe-lighting',
-    'pipe-major',
-    'pipe-making',
-    'pipe-management',
-    'pipe-march',
-    'pipe-monster',
-    'pipe-smoke',
-    'pipe-testing',
     'pipe-thin',
-    'pipe-tile-making',
-    'pipe/silencer',
-    'pipebombs',
-    'pipecleaner',
-    'piped-water',
-    'pipefishes',
-    'pipefitter',
-    'pipefitting',
-    'pipeful',
-    'pipefuls',
-    'pipelayers',
-    'pipeless',
-    'pipeline-laying',
-    'pipeliners',
-    'pipelline',
     'pipemaking',
-    'pipemaster',
-    'pipemidic',
-    'pipen.pen',
-    'piper-alpha',
-    'piper/angler',
-    'piper/claymore',
-    'piperacillin',
-    'piperazinyl',
-    'piperell',
-    'pipes-of-pan',
-    'pipes_because_erm',
-    'pipestem',
-    'pipettor',
-    'pipework/fittings',
-    'pipeworks',
     'pipewort',
-    'pipex',
-    'pipientis',
-    'pipil',
-    'pipin',
-    'pipin\'',
-    'piping&rehy;hot',
-    'piping.',
-    'pipins',
-    'pipip',
-    'pipistrelles',
-    'pipit-like',
-    'pipitea',
-    'pipitrelles',
-    'pipkins',
-    'pipless',
     'pipo',
-    'pipoli',
-    'pipones',
-    'pippas',
-    'pippin\'',
-    'pippingford',
-    'pipps',
-    'pippy',
-    'pipridae',
-    'pipson',
-    'pipsqueaks',
-    'piqu&eacute;es',
-    'piqu&eacute;s',
-    'piqu&euml;s',
-    'pique-nique',
-    'piquerie',
     'piquion',
-    'pir&aacute;mide',
-    'piracies',
-    'pirag&uuml;ismo',
-    'piranha-filled',
-    'pirans',
-    'pirart',
-    'pirata',
-    'pirate-growth',
-    'pirate-like',
-    'pirate-protected',
-    'pirate-set',
-    'pirate-ships',
-    'piratinera',
-    'pirch',
-    'pirellis',
     'pirhanas',
-    'pirimicarb',
-    'pirimide',
-    'pirinclick',
-    'pirinclik',
-    'pirins',
-    'pirithoos',
-    'piriton',
-    'piritramide',
-    'pirjo',
-    'pirks',
-    'pirmez',
-    'pirna',
-    'pirogi',
-    'piromidic',
-    'pironio',
     'pirons',
-    'pirot',
-    'pirou',
-    'pirprofen',
-    'pirr',
-    'pirt',
-    'pirtskhalaishvili',
-    'piruzeh',
-    'pis&eacute',
-    'pis-ti-ya',
-    'pisador',
-    'pisante',
-    'pisanus',
-    'pisarro',
-    'pisauridae',
-    'piscatorials',
     'piscatory',
-    'piscicide',
-    'pisciola',
-    'piscivore',
-    'piscivores',
-    'piscivorous',
-    'piscod',
-    'piselli',
-    'pisello',
-    'pishogue',
-    'pishpek',
-    'pishu',
-    'pisicola',
-    'pisidian',
-    'pisidium',
-    'pismennye',
     'pismo',
-    'pisolino',
-    'pisolites',
-    'pisoliths',
-    'pisoni',
-    'pisonia',
-    'pispir',
-    'piss-a-beds',
-    'piss-all',
-    'piss-artists',
-    'piss-coloured',
-    'piss-drinking',
-    'piss-filled',
-    'piss-head',
-    'piss-maker',
-    'piss-off',
     'piss-perfumed',
-    'piss-poor-job',
-    'piss-smelling',
-    'piss-stained',
-    'piss-stop',
-    'piss-tasting',
-    'piss-warm',
-    'piss-yellow',
-    'pissard',
-    'pissards',
-    'pissarse',
-    'pisse',
-    'pissed-on',
-    'pissenlit',
-    'pissing-with-rain',
-    'pissings',
     'pisson',
-    'pissouthnes',
-    'pisssh',
-    'pistache',
-    'pistaches',
-    'pistachio-green',
-    'pistachio-growers',
-    'pistacor',
-    'piste-aching',
-    'piste-bashers',
-    'piste-off',
-    'pisted',
-    'pistel',
-    'pistemachine',
-    'pisteur',
-    'pistillate',
     'pistoia',
-    'pistol-butt',
-    'pistol-packin\'',
-    'pistol.',
-    'pistoles',
-    'pistoll',
-    'piston-and-cylinder',
-    'piston-covered',
-    'piston-engine',
-    'piston-engines',
-    'piston-trained',
-    'piston-type',
-    'pistone-salice',
-    'pistonliner',
-    'pistons/valves',
-    'pistoops',
     'pistosenuts',
-    'piswah',
-    'pit\'ead',
-    'pit-a-line-on',
-    'pit-a-pat',
-    'pit-bank',
-    'pit-bulls',
-    'pit-cage',
-    'pit-caves',
-    'pit-craft',
-    'pit-dogs',
-    'pit-door',
-    'pit-face',
-    'pit-fire',
-    'pit-heads',
-    'pit-houses',
     'pit-lad',
-    'pit-marked',
-    'pit-men',
-    'pit-pass',
-    'pit-pond',
-    'pit-ponies',
-    'pit-prop',
-    'pit-spawning',
-    'pit-stalls',
-    'pit-wall',
-    'pit.off',
-    'pit/egg',
-    'pit/poa',
-    'pitahayas',
-    'pitak',
-    'pitakuti',
     'pitallis',
-    'pitangueiras',
-    'pitapat',
-    'pitarda',
-    'pitboard',
-    'pitcairners',
-    'pitcaple',
-    'pitcastle',
-    'pitch-and-putt',
-    'pitch-back',
-    'pitch-balls',
-    'pitch-blackness',
-    'pitch-class',
-    'pitch-classes',
-    'pitch-covered',
-    'pitch-covering',
     'pitch-fibre',
-    'pitch-filled',
-    'pitch-forked',
-    'pitch-forks',
-    'pitch-overs',
-    'pitch-pine',
-    'pitch-pipe',
-    'pitch-pole',
-    'pitch-shifted',
-    'pitch-side',
-    'pitch-thick',
-    'pitch-to-voltage',
-    'pitch/2a',
-    'pitch/attitude/power',
-    'pitch/chorus',
-    'pitch/delay',
     'pitchbending',
-    'pitchblack',
-    'pitchblende&rehy;hydrocarbon-sulphide',
-    'pitched-back',
-    'pitched-over',
-    'pitched-roof-profile',
-    'pitched.',
-    'pitcher-plants',
-    'pitches&mdash;these',
-    'pitches.',
-    'pitchi-i',
-    'pitchill',
-    'pitchlynn',
-    'pitchman',
-    'pitchpipes',
-    'pitchshift',
     'pitchum',
-    'pitcock',
-    'piteousness',
-    'pitfirrane',
-    'pitful',
-    'pith-helmeted',
-    'pith-helmets.',
-    'pithecines',
-    'pithiest',
-    'pithivier',
-    'pithoi',
-    'pithos',
-    'pithtolth',
-    'piti',
-    'pitiao',
-    'pitie',
     'pitieth',
-    'pitiful/as',
-    'pitifull',
-    'pitika',
-    'pitilessness',
-    'pitkeathley/national',
-    'pitkins',
-    'pitkowski',
-    'pitman-moore',
-    'pitman-trained',
-    'pitman.',
-    'pitman/retailer',
-    'pitmarks',
-    'pitmaston',
-    'pitmeadow',
-    'pitmuies',
     'pitney-bowes',
-    'pitnick',
-    'pitots',
-    'pitprops',
-    'pitres',
-    'pitrivie',
-    'pitru',
-    'pitsanuloke',
-    'pitsanuloke&ndash;lampang',
-    'pitscottie',
-    'pitsfield',
-    'pitshanger',
-    'pitsi',
-    'pitside',
-    'pitsmoor',
-    'pitstock/gloucestershire',
     'pitstone',
-    'pitstops',
-    'pitsudski',
-    'pitt/long',
-    'pittagoras',
-    'pittakos',
-    'pittalis',
-    'pittalunga',
-    'pittard/group',
-    'pittas',
-    'pitted-faced',
-    'pitted.',
-    'pitter-pat',
-    'pitter-pattern',
-    'pitters',
-    'pittham',
     'pittilla',
-    'pittington',
-    'pittite',
-    'pittstops',
-    'pittwood',
-    'pittyvaich',
-    'pituisas',
-    'pituriaspis',
-    'pity-filled',
-    'pitzbach',
-    'pitzl',
-    'piub',
-    'piubello',
-    'piva',
-    'pivaldi',
-    'pivdennoukrainsk',
     'piverb.def',
-    'pivnaya',
-    'pivot-based',
-    'pivot-hole',
-    'pivot-point',
-    'pivotally',
-    'pivra',
-    'pix-a',
-    'pix-b',
-    'pixel-based',
-    'pixellated',
-    'pixels/inch',
-    'pixidria',
-    'pixielike',
-    'pixies-esque',
-    'pixies-influenced',
     'pixodaros',
-    'pixon',
-    'pixzies',
-    'piyasiri',
-    'piyush',
-    'pizazzy',
-    'pizetti',
-    'pizjuan',
-    'pizz.',
-    'pizza-munching',
-    'pizzahut',
-    'pizzaman',
-    'pizzamiglio',
-    'pizzano',
-    'pizzardo',
-    'pizzetas',
     'pizzetta',
-    'pizzle-dribble',
-    'pizzo',
-    'pizzy',
-    'pj&mdash;the',
-    'pjanic',
-    'pjbs',
-    'pjc&rehy;1',
-    'pjc-2s',
-    'pjel152-65',
-    'pjel152-68',
-    'pjel152-72',
-    'pjel152-73',
-    'pjel152-75',
-    'pjel152-wt',
-    'pjeter',
     'pk&ndash;rvu',
-    'pk-pk',
-    'pk1-type',
-    'pkj1',
-    'pkm&dgr;-98',
-    'pkm&mdash;malta',
-    'pkos',
-    'pkpk',
-    'pkr',
-    'pks',
-    'pkware',
-    'pl&aacute;ka',
-    'pl&egrave;be',
-    'pl-dominated',
-    'pl-k',
-    'pl.11',
     'pl.13',
-    'pl.16b',
-    'pl.23',
-    'pl.28a',
-    'pl.29',
-    'pl.3.10',
-    'pl.3.6',
-    'pl.30',
-    'pl.31',
-    'pl.37',
-    'pl.43',
-    'pl.47',
-    'pl.56',
-    'pl.60',
-    'pl.63',
-    'pl.64',
     'pl100',
-    'pl113',
-    'pl3',
-    'pl30',
-    'pl360',
-    'pl5',
-    'pl83051',
-    'pl9',
-    'pl965',
-    'pl965/g&rehy;mkxi',
-    'pla1',
-    'pla162*7169',
-    'plac\'t',
-    'placable',
-    'placard-bearer',
-    'placard-carrying',
     'placard-wise',
-    'placarding',
-    'placations',
-    'placatorily',
-    'place&lsqb;d&rsqb',
-    'place&mdash;workmen&mdash',
-    'place\'n',
-    'place(s)',
-    'place-between',
-    'place-by-place',
-    'place-free',
-    'place-holders',
-    'place-kick',
-    'place-marking',
-    'place-mat',
-    'place-men',
     'place-orientated',
-    'place-related',
-    'place-the',
-    'place-to-place',
-    'place.',
-    'place.8',
-    'place.it',
-    'place.s',
-    'place/date/time',
-    'place/india',
-    'place/time',
-    'placeable',
-    'placeat',
-    'placebo-treated',
-    'placebo-type',
-    'placebo=72%',
     'placed.a',
-    'placees',
-    'placeholders',
-    'placehood',
-    'placekickers',
-    'placemat',
-    'placements.',
-    'placements.e',
-    'placemill',
-    'placename',
-    'placental\'',
-    'placentas',
-    'placentation',
-    'placentia',
-    'placeo',
-    'places.',
     'places.andrew',
-    'places:he',
-    'placesto',
-    'placeth',
-    'placets',
-    'placider',
-    'placidina',
-    'placidness',
-    'plackets',
-    'placma',
-    'placode',
-    'placoderms',
-    'placodonts',
-    'pladda',
-    'pladjoe',
-    'plaff',
     'plagal',
-    'plagens',
-    'plagiaristic',
-    'plagiarizations',
-    'plagiaulax',
-    'plagiochila',
-    'plagioclase-rich',
-    'plagnac',
-    'plagnol',
-    'plagu',
-    'plague-bearer',
-    'plague-carrier',
-    'plague-infested',
-    'plague-like',
-    'plague-pit',
-    'plague-sufferers',
     'plaguelord',
-    'plaguesome',
-    'plahte',
-    'plaice/husband',
-    'plaid-cap',
-    'plaid-toting',
-    'plaimant',
-    'plain-boiled',
-    'plain-brand',
-    'plain-chant',
-    'plain-chocolate',
-    'plain-coloured',
-    'plain-contrast',
-    'plain-covered',
-    'plain-ended',
-    'plain-english',
     'plain-fronted',
-    'plain-glass',
-    'plain-jane',
-    'plain-language',
-    'plain-living',
-    'plain-paged',
-    'plain-sailing',
-    'plain-sleeved',
-    'plain-straight-talking',
-    'plain-suited',
-    'plain-talking',
-    'plain-wrapped',
-    'plain/',
-    'plain/reflective',
-    'plainclothed',
-    'plaindre',
     'plaine-saint-denis',
-    'plaine-saint-lange',
-    'plainish',
-    'plainlands',
-    'plainnesse',
-    'plains-grazing',
-    'plainsonged',
-    'plainspun',
-    'plainte',
-    'plaintiff&mdash;in',
-    'plaintiff/applicant',
-    'plaintiff/creditor',
-    'plaintiffs&mdash;his',
-    'plaintiffs.',
-    'plaintive.',
-    'plaintiveness',
     'plais',
-    'plaisance',
-    'plaisent',
-    'plaistered',
-    'plaisters',
-    'plaited-leather',
-    'plaitwork',
-    'plaizier',
-    'plakovski',
-    'plalstic',
-    'plambeck',
-    'plamiceps',
-    'plampin',
-    'plan-chest',
-    'plan-form',
-    'plan-position',
     'plan-view',
-    'plan.further',
-    'plan.he',
-    'plan/4000',
-    'plan/local',
-    'plana',
-    'planaforo',
-    'planalto',
-    'planaria-like',
-    'planarians',
-    'planarity',
-    'planas',
-    'planations',
-    'plancenoit',
-    'planchuelo',
-    'plandome',
     'plane-faced',
-    'plane-laminated',
-    'plane-rules',
-    'plane-spotting',
-    'plane-wise',
-    'plane/ice',
-    'plane/rasp',
-    'plane/sycamore',
-    'planecrash',
-    'planeeload',
-    'planell',
-    'planemaker',
-    'planer-files',
-    'planer-thicknessers',
-    'planer/thicknesser',
-    'planestane',
     'planet-brained',
-    'planet-friendly',
-    'planet-images',
-    'planet-shaper',
-    'planet-soul',
-    'planet-would',
-    'planet-x',
-    'planet-years',
-    'planet.',
-    'planet.this',
-    'planet/',
-    'planetae',
-    'planetillionaires',
-    'planetillions',
-    'planetisation',
-    'planetoids',
     'planetwide',
-    'planicosta',
-    'planifrons',
-    'planig',
-    'planimeter',
-    'planimetrically',
-    'planitzer',
-    'planiuscula',
-    'plank-basher',
-    'plank-built',
-    'plank-gourmets',
-    'plank-like',
-    'plank-spanker',
-    'plank-spanking',
-    'plankers',
-    'plankton-feeding',
     'plankton-proof',
-    'planlessness',
-    'plann-ing',
-    'planned&rehy;for',
-    'planned-for',
-    'planned-market',
-    'plannedactual',
-    'planner-bashing',
-    'planner.',
-    'planner/oxon',
-    'planney',
-    'plannin',
-    'planning&mdash;the',
-    'planning\'',
-    'planning-committee',
-    'planning-control-accountability',
     'planning-however',
-    'planning-led',
-    'planning-oriented',
-    'planning-policy',
-    'planning-programming-budgeting-systems',
-    'planning/building',
-    'planning/executing',
-    'planning/marketing/research',
-    'planning/rating',
-    'planning/rights',
-    'planning/setting',
-    'planning/training',
-    'plano',
-    'planolites',
-    'planoradiatus',
-    'planrainwater\'sts',
     'plans&mdash;that',
-    'plans-built',
-    'plans/career',
-    'plans/diagrams/drawings',
-    'plans/kit',
-    'plans/priorities',
-    'plansfor',
-    'plansweep',
-    'plant&rehy;specific',
-    'plant-abundance',
-    'plant-algal',
-    'plant-aphid-hoverfly-ichneumonid',
-    'plant-available',
-    'plant-baked',
-    'plant-breeders',
-    'plant-buying',
     'plant-care',
-    'plant-collecting',
-    'plant-data',
-    'plant-destroying',
-    'plant-extracted',
-    'plant-feeders',
-    'plant-food',
-    'plant-grinding',
-    'plant-growing',
-    'plant-houses',
-    'plant-hunting',
-    'plant-in',
-    'plant-insect',
-    'plant-moth-ichneumonid',
-    'plant-nutrients',
-    'plant-of-prey',
     'plant-ordering',
-    'plant-pot',
-    'plant-proof',
-    'plant-raising',
-    'plant-rich',
-    'plant-size',
-    'plant-stand',
-    'plant-stroking',
-    'plant.another',
-    'plant/factory',
-    'plant/factory/hangar',
-    'plant/machinery',
-    'plant/researcher',
-    'plantaginaceae',
-    'plantago-aquatica',
-    'plantasia',
     'plantation-owners',
-    'plantations.',
-    'plantcare',
-    'planteater',
-    'planted-trees',
-    'planted-up',
-    'planteria',
-    'plantesamfund',
-    'plantfood',
-    'plantfoods',
-    'planthouse',
-    'plantin-moretus',
-    'plantine',
-    'planting-out',
-    'planting-up',
-    'planting.',
     'plantinga',
-    'plantkeeping',
-    'plantlet',
-    'plantocracy',
-    'plantronics',
-    'plants-woman',
-    'plants.f',
-    'plants.the',
-    'plants/strategies',
-    'plantsbrook',
-    'plantsmanlike',
-    'plantspecies',
-    'plantwell',
-    'plantworks',
-    'plappert',
-    'plaque-forming',
     'plaque-inducing',
-    'plaque.he',
-    'plaquescreen',
-    'plaret',
-    'plarty',
-    'plas-y-',
-    'plascencia',
-    'plaschkes',
-    'plasetal',
-    'plashet',
-    'plashwater',
-    'plashy',
-    'plaskitt/labour',
-    'plasma-exchange',
-    'plasma-like',
-    'plasma/milk',
     'plasma/min',
-    'plasmacytoid',
-    'plasmid(s)',
-    'plasmid-mediated',
-    'plasmid-transfer',
-    'plasmid-vector',
-    'plasmid/phage',
-    'plasminogen-like',
-    'plasmopara',
-    'plasms',
-    'plassard',
-    'plassenburg',
-    'plasta',
-    'plastc',
-    'plasteel-panelled',
-    'plasteel-ribbed',
     'plastek',
-    'plaster-board',
-    'plaster-cast',
-    'plaster-depth',
-    'plaster-embossed',
-    'plaster-like',
-    'plaster-spotted',
-    'plastercast',
-    'plastered-out',
-    'plasterised',
-    'plastermind',
-    'plastiboard',
-    'plastic&rehy;symbolic',
-    'plastic-based',
-    'plastic-belted',
-    'plastic-bodied',
     'plastic-canvas',
-    'plastic-debt',
-    'plastic-faced',
-    'plastic-film',
-    'plastic-flexing',
-    'plastic-flighted',
-    'plastic-flowers',
-    'plastic-fronted',
-    'plastic-grid',
-    'plastic-handled',
-    'plastic-immobilized',
-    'plastic-like',
-    'plastic-pitched',
-    'plastic-sailed',
-    'plastic-scented',
-    'plastic-sheeted',
     'plastic-shrouded',
-    'plastic-sided',
-    'plastic-straw',
-    'plastic-tasting',
-    'plastic-toy&rehy;littered',
-    'plastic/concrete',
-    'plastic/production',
-    'plasticas',
-    'plasticases',
-    'plasticene',
-    'plastici',
-    'plasticiers',
-    'plasticine-like',
-    'plasticising',
-    'plasticize',
-    'plasticized',
     'plastics-framed',
-    'plastics-lined',
-    'plastics.',
-    'plastics/steel',
-    'plastid',
-    'plastids',
-    'plastiflesh',
-    'plastigram',
-    'plastimetal',
-    'plastination',
-    'plastiscrip',
-    'plastitak',
-    'plastiware',
-    'plastochrons',
-    'plastocowell',
-    'plastopake',
     'plat&rehy;forms',
-    'plat-form',
-    'platagenets',
-    'plataians',
-    'platano',
-    'platanos',
-    'plate(s)',
-    'plate-',
-    'plate-boundary',
-    'plate-frame',
-    'plate-fulls',
-    'plate-glass-windowed',
-    'plate-layer',
-    'plate-making',
-    'plate-mark',
-    'plate-marks',
     'plate-mines',
-    'plate-movements',
-    'plate-on-your-lap',
-    'plate-scrapings',
-    'plate-sized',
-    'plate-smashing',
-    'plate-spinner',
-    'plate-warmer',
-    'plate-winning',
-    'plateau-andesite',
-    'plateaux.',
-    'plated-cap',
-    'platel',
-    'platelaying',
-    'platelet-adhesion',
-    'platelet-associated',
     'platelet-binding',
-    'platelet-free',
-    'platelet-function',
-    'platelet-membrane',
-    'platelet-storage',
-    'platelet-vessel',
-    'platelet/',
-    'platelets=439',
-    'platemaking',
-    'platen-machine',
-    'platenoides',
-    'platens',
-    'plateosaurus',
-    'platerias',
-    'plates-can',
-    'platewarming',
     'plateway',
-    'plateys',
-    'platform\'',
-    'platform-based',
-    'platform-building',
-    'platform-committee',
-    'platform-heeled',
-    'platform-less',
-    'platform-mounted',
-    'platform-sole',
-    'platform-specific',
-    'platform-type',
-    'platformed',
-    'platforming',
-    'platformless',
-    'platforms-and-ladders',
     'platforms/launches',
-    'plath.',
-    'plati&rehy;tudes',
-    'platicized',
-    'platignum',
-    'platin\'',
-    'platinized',
-    'platinotype',
-    'platinu',
-    'platinum-blacked',
-    'platinum-coloured',
-    'platinum-dna',
-    'platinum-group',
-    'platinum-induced',
-    'platinum-iridium',
-    'platinum/',
     'platinum/iridium',
-    'platitudinarians',
-    'platitudinously',
-    'platner',
-    'plato-like',
-    'platonics',
-    'platonize',
-    'platonov',
-    'platoon-members',
-    'platreef',
-    'platsh',
-    'platshin',
-    'platt-pollitt',
-    'platt/cotswold',
-    'platta',
-    'plattdeutsch',
     'platten',
-    'plattening',
-    'plattens',
-    'platter-style',
-    'plattsburgh',
-    'plattsville',
-    'platus',
-    'platy-shaped',
-    'platycheirus',
-    'platyfish',
-    'platykurtic',
-    'platypi',
-    'platzek',
-    'platzen',
-    'platzverf&uuml;hrung',
-    'plaus',
     'plausible-looking',
-    'plautilla',
-    'plax',
-    'play&rehy;groups',
-    'play\'',
-    'play\'/',
-    'play-and-pleasure',
-    'play-anywhereness',
-    'play-attack',
-    'play-backs',
-    'play-bike',
-    'play-bills',
-    'play-books',
-    'play-centre',
-    'play-do',
-    'play-doctoring',
     'play-dough',
-    'play-down',
-    'play-ed',
-    'play-extracts',
-    'play-fought',
-    'play-hour',
-    'play-ing',
-    'play-inn',
-    'play-makers',
-    'play-making',
-    'play-mates',
-    'play-music',
-    'play-off.',
-    'play-on-fear-of-greenhouse-effect',
-    'play-once',
-    'play-orientated',
     'play-outs',
-    'play-park',
-    'play-pause/record-pause',
-    'play-rather',
-    'play-scheme',
-    'play-schools',
-    'play-script',
-    'play-texts',
-    'play-themes',
-    'play-type',
-    'play-types',
-    'play-with-yourself-in-a-day',
-    'play-wright',
-    'play-wrights',
-    'play-yard',
-    'play-yards',
     'play.s',
-    'play.the',
-    'play/compose',
-    'play/film/tv',
-    'play/the',
-    'play/work',
-    'playbarn',
-    'playbike',
-    'playboat',
-    'playboater',
-    'playboats',
-    'playbricks',
-    'playcare',
-    'playdates',
-    'playdek',
-    'playden',
     'playdo',
-    'playdog',
-    'playe',
-    'played-back',
-    'played-in',
-    'played.had',
-    'played_a',
-    'playeds',
-    'player-assistant',
-    'player-captain',
-    'player-cash',
-    'player-directed',
-    'player-directors',
-    'player-for-player',
-    'player-led',
-    'player-mgr',
     'player-of-the-tournament',
-    'player-plus-cash',
-    'player-preparation',
-    'player-safety',
-    'player/mgt',
-    'player/sample',
-    'playercoach',
-    'playes',
-    'playesr',
-    'playeth',
-    'playfairs',
-    'playfellows',
-    'playfor',
-    'playforce',
-    'playful-sounding',
-    'playgirls',
     'playgroud',
-    'playground/classroom',
-    'playgroup/speak',
-    'playhatch',
-    'playhorse',
-    'playi',
-    'playing\'chicken',
-    'playing-about',
-    'playing-area',
-    'playing-card',
-    'playing-counter',
-    'playing-off',
-    'playing-out',
-    'playing-places',
-    'playing-up',
-    'playing-working',
     'playing.',
-    'playing/listening',
-    'playist',
-    'playle',
-    'playleaders',
-    'playless',
-    'playmakers',
-    'playmaking',
-    'playmats',
-    'playmatters',
-    'playmore',
-    'playn',
-    'playn-clothes',
-    'playnesse',
-    'playnle',
-    'playout',
     'playplax',
-    'playpool',
-    'plays/',
-    'playschools',
-    'playscreed',
-    'playspaces',
-    'playspot',
-    'playstreet',
-    'playsuit',
-    'playsuits',
-    'playter',
-    'playtesting',
-    'playthings.',
-    'playto',
-    'playway',
-    'playworker',
     'playwright-in-residence',
-    'playwright-turned-politician',
-    'plb',
-    'plc\'s',
-    'plc-based',
-    'plc-mercury',
-    'plc/abc',
-    'plc/organisation',
-    'plc/sa',
-    'plcc',
-    'pldesigner-xl',
-    'plea-bargain',
-    'pleachers',
-    'pleadable',
-    'pleaded.',
-    'pleading.but',
     'pleadings.',
-    'plean',
-    'pleasant&ndash;es',
-    'pleasant-spoken',
-    'pleasant/good-natured/hard-working/ambitious/',
-    'pleasantist',
-    'pleasantly-grained',
-    'pleasantly-illuminate',
-    'pleasaunce',
-    'please&mdash',
-    'please-don\'t-put-us-through-demille-again',
-    'please-don\'t-thank-me',
-    'please-we',
-    'pleaseaaa',
-    'pleased\'',
-    'pleased-with-themselves',
     'pleased.',
-    'pleasedly',
-    'pleasently',
-    'pleasers',
-    'pleases-me',
-    'pleaseure',
-    'pleasin',
-    'pleasin\'',
-    'pleasing-pleasingly',
-    'pleasley.',
-    'pleasse',
-    'pleasur',
-    'pleasurability/sadness',
-    'pleasurable.',
-    'pleasurably\'',
-    'pleasurama',
     'pleasure&mdash;unexpectedly',
-    'pleasure&rehy;sailing',
-    'pleasure-beach',
-    'pleasure-bound',
-    'pleasure-chasing',
-    'pleasure-court',
-    'pleasure-drome',
-    'pleasure-drugged',
-    'pleasure-flying',
-    'pleasure-garden',
-    'pleasure-house',
-    'pleasure-in-itself',
-    'pleasure-land',
-    'pleasure-making',
-    'pleasure-pink',
-    'pleasure-primer',
     'pleasure-principle',
-    'pleasure-steamers',
-    'pleasure-taking',
-    'pleasure/disgust/',
-    'pleasure/pain',
-    'pleasureable',
-    'pleasurebound',
-    'pleasuredome',
-    'pleasures-pinnock/english',
-    'pleasures-watercolours',
-    'pleat-waisted',
-    'pleathe',
-    'pleats-and-spacing',
-    'pleats_',
-    'pleaze',
-    'plebbiness',
     'plebby',
-    'plebeia',
-    'plebeian\'',
-    'plebiscitarian',
-    'plebiscitarianism',
-    'plech',
-    'pleco/spotted',
-    'plectomycetes',
-    'plectonema',
-    'plectranthus',
-    'plectrophenax',
-    'plectrotromus',
-    'pledge&mdash;bush',
-    'pledgee-endorsee',
-    'pledgees',
-    'pledget',
     'plee',
-    'pleeeease',
-    'pleesure',
-    'plegel',
-    'plegheard',
-    'pleiku',
-    'plein-air',
-    'plein-airist',
-    'pleine-airsme',
-    'pleioblastus',
-    'pleiotrophic',
-    'pleitismo',
-    'plekanov',
-    'plenam',
-    'plenaries',
-    'plender',
     'plenderleigh',
-    'plenishings',
-    'plenn',
-    'plent',
-    'plenteousness',
-    'plentifull',
-    'plentitude',
-    'plenty-of',
-    'plenty/famine',
-    'pleonastically',
-    'pleospogia',
-    'pleraque',
-    'pleroma',
-    'plesaunce',
-    'plesetsk',
-    'pleshy',
     'plesiomorphies',
-    'pleso',
-    'pless',
-    'plessey-siemens',
-    'plessey/gec',
-    'plessis-mornay',
-    'plester',
-    'plestin',
-    'pleszczynska',
-    'plethra',
-    'plethysmograph',
-    'plethysmography',
-    'pletrzak',
-    'pletschacher',
-    'plett',
-    'plettosanti',
     'pleughed',
-    'pleurocoxals',
-    'pleurogramma',
-    'pleuropneumonia-like',
-    'pleuropneumony',
-    'pleurotaenia',
-    'pleurozua',
-    'pleurtuit',
-    'pleva',
-    'plexi',
-    'plexippus',
-    'plexogenic',
-    'pleydell/international',
-    'pleyels',
-    'plez',
-    'plg',
     'plh/lip',
-    'pli&mdash;italian',
-    'pliantly',
-    'pliaska',
-    'pliatisky',
-    'plicated',
-    'plication',
-    'plichtimpex',
-    'pliego',
-    'plielle',
-    'plien',
-    'pliers/',
-    'plighte',
-    'plighting',
-    'pliko',
-    'plim',
     'plimmer/rpm',
-    'plimmer/shop',
-    'plimsoles',
-    'plimsoll-line',
-    'plimsoll-shod',
-    'plinius',
-    'plinston',
-    'plinters',
-    'plinth-mounted',
-    'plinthed',
-    'plinys',
-    'pliocence',
-    'plios',
-    'pliosaur',
-    'pliosaurs',
-    'plioway',
     'plip-plopped',
-    'pliqu&eacute;-&agrave;-jour',
-    'pliska',
-    'plisnier',
-    'plisson',
-    'plitted',
-    'pliun',
-    'pliusch',
-    'pliushch',
-    'plix',
-    'pliz',
-    'plkhari',
-    'pll-treated',
-    'pln&euml;n&aacute',
-    'pln&euml;n&eacute',
-    'plo-affiliated',
     'plo-approved',
-    'plo-backed',
-    'plo-endorsed',
-    'plo-hamas',
-    'plo-hashemite',
-    'plo-inspired',
-    'plo-israel',
-    'plo-israeli',
-    'plo-mainstream',
-    'plo-supported',
-    'ploben',
-    'ploceidae',
-    'ploceinae',
-    'plocek',
-    'plodden',
-    'plodmobile',
     'ploeckenpass',
-    'ploem',
-    'ploem-type',
-    'ploey',
-    'plogh',
-    'ploiesti',
-    'plokho',
-    'plom',
-    'plomb',
-    'plombi&egrave;res',
-    'plon',
-    'plonge',
-    'plongeon',
-    'plonky',
-    'plooin',
-    'plook',
     'ploomp',
-    'ploose',
-    'ploosh',
-    'ploot',
-    'plooy',
-    'plop-of',
-    'ploppy',
-    'ploschtchad',
-    'plosions',
-    'plot*',
-    'plot-advancing',
-    'plot-dig-file',
-    'plot-free',
-    'plot-holders',
-    'plot-interest',
-    'plot-paradigms',
     'plot-sequence',
-    'plot-sequences',
-    'plot-stealer',
-    'plot-style',
-    'plot.',
-    'plote',
-    'plother',
-    'plotin',
-    'plotke',
-    'plotlands',
-    'plotnikoff',
-    'plotnikov',
-    'plots.',
-    'plotted-out',
-    'plotter-based',
-    'plotz',
     'plotzek',
-    'plough-bullocks',
-    'plough-coulter',
-    'plough-handles',
-    'plough-horses',
-    'plough-land',
-    'plough-ox',
-    'plough-share',
-    'plough-team',
-    'plough-teams',
-    'plough/press',
-    'ploughback',
-    'ploughboys',
-    'plougher',
-    'ploughers',
-    'ploughhorse',
     'ploughing-up',
-    'ploughmans',
-    'ploughmen-poets',
-    'ploughmens',
-    'ploughox',
-    'ploughpieces',
-    'ploughsoil',
-    'plouha',
-    'plovelance',
-    'plowden\'',
-    'plowfields',
-    'plowmans',
-    'plowtered',
-    'ployed',
-    'plru',
-    'pls.la',
     'plsama',
-    'plso',
-    'plsu',
-    'plt.off.',
-    'plt.offs',
-    'pluckacre',
-    'pluckiest',
-    'pluckin\'',
-    'pluckings',
-    'pluckley',
-    'plucknett',
-    'plue-plue-plue',
-    'plueral',
-    'plug-',
-    'plug-chain',
-    'plug-compatibility',
     'plug-compatibles',
-    'plug-drawing',
-    'plug-flush',
-    'plug-in-and-play',
-    'plug-like',
-    'plug-on',
-    'plug-plant',
-    'plug-planted',
-    'plug-pulling',
-    'plug-type',
-    'plugaru',
-    'plugblocks',
-    'plugboard',
-    'pluggable',
-    'plugged-in',
-    'plugging-in',
     'plugheads',
-    'plugholes',
-    'plugmold',
-    'plugpal',
-    'pluit',
-    'plum&ndash;lump',
-    'plum-and-apple',
-    'plum-and-spilt-milk',
-    'plum-bloom',
-    'plum-dent',
-    'plum-looking',
-    'plum-mouthed',
-    'plum-pickers',
-    'plum-red',
-    'plum-sized',
-    'plum-stippled',
     'plum-stone.',
-    'plumb-bob.',
-    'plumb-in',
-    'plumb-pudding',
-    'plumb/mep',
-    'plumber/tinsmith',
-    'plumberry',
-    'plumbing-in',
-    'plumbosolvency',
-    'plumbosolvent',
-    'plumbum',
-    'plume-like',
-    'plume-rise',
-    'plumery',
-    'plumet',
-    'plumito',
     'plumment',
-    'plumminess',
-    'plummted',
-    'plumosa',
-    'plump-cheeked',
-    'plump-softness',
+)
+
+blocks_62 = (
+    '%\'genical)#sis&\'raphers%,histological%%lgist&\'ogicals)$ques\'%igist%)mechanism.!s%,pysiological$"s.$,way-specific#+i&ntilde;os$$-led',
+    '$#dar$*ence-beads(!.&&t-area(&doctor)%riven((friendly($list(\'neglect)$urse(*orientated()physician\'\'/public\'#_in\'$hood',
+    ')!.\')s\'-clarke(".3(\'/parent(\'without%#tns&!s$%lands%*ine&tcedil$$nate(!s\'#ing%"es%%igera%$nova',
+    '$*o-friendly%!r$#tvr$#wat$#zzi#!k##lak$!y#\'nership#"ob$+is-speaking$+n-saltzberg%!.%"ga$!s',
+    '$#-ii$$asse\'!i$$eese%!s&(e/moreno$&iality&0rchal-capitalist,&feudal&$tion%"ch&#ial("n\'))-plebeian(#tes',
+    '&"ke\'%swell%$ents%%focal%%gnano%$line)#age*#lly*$rity)!s%(monially%"ni%/otically-minded($ques($sche',
+    '%"st%!x%#zzi$"oa%$klus%+l&rehy;ling&$-car\'%wagon&#ler\'#in\'&)ogi&aelig)!a&1s&mdash;vigilante%"n\'&&-saint',
+    '&\'/client&3age&mdash;patronage\'"le&-is&rehy;ingly(&ations($ing.\'&zation&$ship&"um$$ulla##sch&#eke$$hull$"ie$)y-budding',
+    '%"na&!i$!e%+n-heseltine\'&makers&-/conservative\')education&#ism%$r(s)&)-merchant&#ers&,n&mdash;just\'%-book,!s*%rders',
+    ')\'reating)%utter((directed(&makers(%plate($race((watching\'\'/colour\'#edy\'/s&mdash;dynamic("/1))behaviour\'!y&#oes&*son/driver',
+    '*(landlord*%solar)!s%!s$\'hanarat$%ieson%$mura%"ni%$sons$"le$$more$!o%"ns$"rn$!u',
+    '%&ndenne+!s#!u$$lous%"um$%rages$#san$$xent#%waris#"xi##zer"%u-aul$%ching#!a#"ca',
+    '$\'iflorum%)perforata#!d$!i$#rat$(yellocal#!k#+l-ferdinand%#jan%1outside-the-walls%&schiff&$tyle%&totin\'&#ype$)/disraeli',
+    '&(dinburgh%\'general&&rendon%(ministry%)squatters%*telecaster$"an$#den%#ing$!e%"en%"na%&rspury%"su%$tte.',
+    '$%i-for%%cians%!i%\'ne-like%"sh&#tas$$mier$\'o-tarso$(rkrugman$&sgrove$#ter%#ons$\'veriser$!z#$mari',
+    '#\'ncefort%#hed$#tly#.p&eacute;risme$&eribus\'"se$$iere&$ttes$!r##ric#&sanius$-e-calculating&)dependent\'%otted&&engage',
+    '%"st$"on$#sac$!t#!w$#els"+v-a-rotties#$anas%&e-like&#llo$$resh%#ini%*otti-sized)!s#*ed/cobbled',
+    '%#iev$)ment-high)%level*#ike)\'quality(!.("ed("s/*)sidewalks$$nham$"se##ian$%cevic%(h/sierra$!l',
+    '(%stone%$lons$"n\'%\'g-slabs&%/path&%stone$#tra#%letic$$icek%#dis%!s%"ta$\'ochieva%(deograph%&poulos',
+    '\'#tch\'!y&$skiy%!w#$olva$%nazzo%#ina\'!e#"ry"&w-hold$%marks$&signed$$work#%anteh#"el',
+    '##ful#$kins#"le%!t$#ike#%marks#(n-broker$!.$#ees$"s.%)hop-owner#/ord-processoraw#%print#$s-up$$teps',
+    '"0x&lsqb;zf-b&rsqb#"-2$!6$&wanxie&$rnie#%/conf#$inou##son$$tone"*y&rehy;and#!-$.and-conditions%.s-you\'re-cured*(-breathe+#use',
+    '$*bargaining%$ooth%,y-instalment\'$view$%claim&$erks$$fone&%r-use%&reezes$$gate$%happy$(increase$#key$$lock$%notes',
+    '%&ennies(!y&&r-stay$\'related&\'straint&$view%$ises$%scale)!s$#tel\'\'evision%&o-date\'%enter\'%watch$&window',
+    '$(your-way#\'/salary#"_a#\'ability$#can$!n#%backs$#ill$#le.$$ooks#$e/ni$#rne%.s&pound;39,195&#-in##hel',
+    '%%g-out\'(the-rent##lor#,master-cadet$/ent&lsqb;s&rsqb()mdash;see\'+-by-payment(\'in-kind\'+/settlement\'+s&mdash;the(+-by-results(!/%!r#(ne-james%./environmental',
+    '%!i%!l$"im$#ted%%ouris#!o#&points#$rise$)oll-based#+sand&uacute&$nats&!s##toe%(n-wright&!e',
+    '#"va#"zu"&zarcik#$elli#$hwak#%ienza#(vantoglu#"za%%glini$"ia!$b-01#"1w#*206/pb-207#%ba-zn#!f',
+    '#%zn-ag"\'1.8scfv"!2""74"#abe%$puro#\'nnister#$tem2$\'neo&bgr"#end"!j#"14"#kal"+luescriptii"&n69931',
+    '"!p"%r322-%!5#"p4"*s-glycerin#!a#!v$&-based"!t")y&ndash;4*"5a#"-5!?c&gt;pe&gt;pi&gt;sm&gt;ll&gt;ps#,mdash;centre#/rehy;compatible',
+    '"#(b)#"c)#"d)#"e)"!+"&-1512s#%425xb\'!m#!9##apd$\'rc/info#%class$%oated#$dats#%local',
+    '#$only$\'riented#&priced#*telephones$)o-console%#ols$\'raining"!/#$gene##mac&&intosh$%s-dos&\'windows#"pe#"rt',
+    '#!7"#200$"86##386"$3286"#550#"80"#800"$9800#"99""ak#&rotene""b-$\'burning$*destroying',
+    '#!a#!s#!t"$d-gr#"4t#!i#$l-sr#"m8#"os"/e&mdash;spanish".f&mdash;french*$ibid#*-dominated#$lu-2"$h-ml',
+    '#!s"/i&mdash;italian#(-renamed#%/scsi""jr""kd"2l&mdash;luxembourg#!4#"ab$"mp"$m-10$#cia#.cia-compatible"0na=0.0459+0.3912#"et',
+    '%$/isa"*o/cluytens#%nnect#&rnwall"2p&mdash;portuguese#!e"&r-1000$-amplification%$ssay#!.#$/rna#+11&ndash;36#-amplification#"ed$%m&agr',
+    '"1s&mdash;christian#"11"(tropicos"!u!2d&mdash;democratic#&plusmn"#-10#!2#"pt"%.3276"(/pd&plus*"mn#)shareware"$1200"%780-1',
+    '"*a/pst+alt.##600#!n#3s/pst&mdash;workers(%+alt."1c&mdash;christian##***"#eal$%stman#!s#!x""fr"$gf-a&!a%)secreting',
+    '$&coated"-m&mdash;malta#"-1$!2#:smbbojwsqmnxludttkwklfmrql""ox"2p&mdash;democratic#$-ana$!g$!l#!k""r4#)5&agr&bgr$"40"-s&mdash;party',
+    '#%--the$"3s$(formerly$#led#!a#"pd"!x!,e&ccaron;jak#(lacute;e#(ntilde;a+$fort*&iscola"%\'tain"\'-235map#"50',
+    '""10#!3#!9#!s""21"!3"!8"#=qd""a-$+and-thimble$$body$\'canning%#oat(!s$#fed',
+    '$#pod\'$ding$\'shooter$\'whistle#\'berries\'!y$!o#3ce&rehy;initiatives+&making+&worker%--at-any-price&(bringing(%okers&)enforcing&\'feelers',
+    '&\'mission\')onitoring&(outbreak&&policy&\'seekers\'&tudies&\'warrant%\'ability%$fire&#rog&+ul-sounding(!.%!y&0/gloucestershire$.h&rehy;canning',
+    '&#fed\'\'lowered&(packaged(%ttern\'#ink&#red&&smooth\'%unned%$dart%"ed&"ll&+s-and-cream&)y/farmers()worcester%$gate',
+    '%$like%%stone%$urst%*y-breasted\'(coloured\'$keen\'&orange$!k$*ock-gordon(&shaped\'*/yorkshire\'#ian("ng$!y##dar',
+    '#)k-bagging%&flight%\'holiday%$load)#ing%%shape%\'ticking&(o-valley&&raffic%)with-peak$$/rms$)ed-capped%!r$/ing/stabilising$$time',
+    '%#rak#(le-esque$"ts#\'ng-meth$*ut-brained\'$like\'&shaped($ized##pod#"r-%(breeding%%drops%$like%%shape*"d.',
+    '%%trees$6ce(latinamericabureau)&%-boby&0/gloucestershire\'%widow&!s$#don$#eth%!y$!k%!s$)l-bearing\'\'uttoned&(coloured\')ream-gold',
+    '&+embroidered\'(ncrusted\'#yed&%faced\'&ishing&&headed&$like&&oyster&$pale&(shellers\'&potted\'&tudded\'%wathe&&tinted($pped',
+    '%&corder%$eane&"ne&!s\'%cents%$grey%$iest&#zed%$wort%&y-grey\'$pink\'&smooth$$mans$(s-shaped%%.peel',
+    '%*e/national\')sleep-out&!y%#on\'\',/aeromedical($elmo(&oxford($shop(1west&rehy;minster,\'minster$#ton$%worth#?sant-cuisine-come-to-kensington(\'farmers()gardeners',
+    '($like)$over(*orientated)$wner(+proletarian3!s(\'soldier)*ubsistence()tenements(&virgin(&wisdom)&orkers\'#s.s$\'efields$$lake',
+    '&"ys$"on%$uper#"t-%$beds%\'carrier&"ut(!s%+development&%igger+!s)#ing%*extracting%&filled&&uelled',
+    '%%laden%(moulding%$pits%&raised%*substitute$&/lorna$"es$%field$$hrow$&stacks#!u$(-de-soie#!x#"zy"!b',
+    '\'$eyed\'%floor\'%paved(&icking\'&shaped($tone)%udded&)d-glassed\'%ashes&#son#$erdy#%worth",can-coloured&&orange%"ha',
+    '%"re&!y%%trice(!x$"ei$"he$#une#*h&eacute;s%(oacute;n$#e/1%#neg%!s%"ur\'"es\'!s',
+    '%!n&&ey-anc$%onkin%"ra$#ter$$urki##iam$#nje#\'k-owned$!e%\'rdillos&"oo$&forton$+ham/juggler\'!s',
+    '%&shness$$mill$2over/step-daughter$&sniffs##o63$"ck$"ra&"ma#%queur#(simunkas$"s2#!t$\'enoides$%inate)!d',
+    '("ae(!s&!s$"or&$ales&"us$"us#&uarius$(lalalary)!y&$rity\'&liarly$&niaria$(ssionist"&d-xing',
+    '$$gium%+og&iacute;a\',ic/pragmatic)*ally-based.(relevant(&sation(&zation\'$uish$%l-bin)!s\'$oard&#car\'%ycles*$ists&)extension',
+    '&(operated&%point(#wer\'&ushers&,to-the-metal(#nes%&/swing%)abikeaway%%board*!s%$iter$!n%#eus%.tically-minded&$ries',
+    '%$tall%"us#$ders%$ston$"ie$&le-bin&&/world&"ty#!e$#low$!r%%astic%!s&#en.((/cradley',
+    '$!s%)tal-light($ised&!r\'$ian-+\'barrier+*controlled+\'looking*(/vehicle*"ly#!i$$ados%\'trician$#cle\'!d',
+    '&#red$,gree-drawing$#lla$1ment-compositions)&groups)\'statues$%plain)"ed$!s#\'lingham#"oe$*geomorphic,%ology$&logist$(meter.he',
+    '$&sphere#$raza$%eschi$$illo$"oh%"so&$sian#*ulla/gotoh$&nculus##war#$xing")e-bottles$%e-eer%!r$/on-the-audience',
+    '&#-ee$#pee\',-pee-pee-pee%!o$\'stained$&witted##cee$#her#$d-on$"ee$#led#"ep$$sing$!t#"ik',
+    '#(l-castle%&towers$$er\'s$!y%&-wally##nie$!t#$p-bo%!o%)peep-peep%$toed$)hological$(ing-toms\'!s$#toe',
+    '$)-approved&)ssessment%*influenced%&review%*solidarity$"ce$!e$"oo$$s-he%\'/farmer%$chke$!t$(ybingles#$sies$#ley',
+    '&!s$"ie$!s#"va$#ers#&witted"#fec%)tionistic#$fery#\'ormance*!s&#ing##ull"&g-doll$#leg',
+    '$,precipitates$\'sellers(#ing%$hape$#top##600#&acycle$$ssus%)us-flotec$#zus#&boards##den##een#*g/fairport$\'ed-down',
+    '$!o%$ttys#%heads$#orn%#use#!i#$nado%"ll$#itz$$unai#\'oscapus##ram$"um##top#&winder',
+    '##aps#(o&eacute$!e"&i-ming$$ying##bio$#ron#"ce$$heng#$gnot#$jian$"un#$ndre$!t%,res-graveurs',
+    '#%rcean$#ene##ser$#ley##tie%#ons$%oneal#$xoto#$yuan%!n"\'janovic"#kan%\'justice#!e$!s',
+    '%+g-appointed#*ka-mikkola#"ov"*l&eacute;e#!a$#dan%!o$"ge%$ikos&!o%%onija$(rgonuims$%sgian)!s\'!c',
+    '%!o##cel$!o%\':gc-100#\'ecypods$%grini(%oides("us$(ponnesus$!r%"in\'!e$#ton%%rines#&freeze',
+    '#!i$$atan$,can-adjuster(&halted\'!o$#gro$*leo-patate$(osanthes$$sses$"te##jee%%kaise#$lant$&egrina\'#neo',
+    '%%t-fed&%/scat&#ise\'#zed)!r(#ing&$reau&!t$!i%&cceria&!e&"le%"on%$sier%"ti',
+    '&"za\'!i$$mell$"ot&%oidal%(w/oxford\'#wet&!e#&manism#!o$$idal$#tas%#ons#!s$#all',
+    '&!t#*ta-pattern$"er&"et$%igera%%rogus$!z%#man#%uchet#!v$+es/scapulae$#ics%*s-grinding&#ing$#oux',
+    '"%mbela%%rleys&$tons&!y$%leton$5ridge/gloucestershire*-herefordshire#"co#\'eberton$!l#%impin#%telic##yll".n&rehy;etrated#!\'',
+    '%&nd-red($wash%$ware$*besmirched%"ox$\'centric%%lawdd$%drawn&%iving$$ends$\'fuckers$%input$&knives$%light)!s',
+    '%"en$(operated$$pics\'$ture%&ockets%&ushing$&screen%$tand&$roke$#tip%#ops%#ype$#ups$1y&rehy;mount-pont%(-berllan',
+    '&%mount&$pass\'$ound%(r-orsedd#%.loop#)/faulkner$&pencil$+spade/sword#$acev$#dos$$fiel$&l-ties%$iver&&zation%-ties/benefits',
+    '&(y-ridden(&stroke(&taking\'\'/losing$"nd%"ts$$rlag$#ton#$bank%#sed$#edw%$rthy$#ook$#ury#"ca',
+    '%#reg&#reg\'"ow%#vel$)e-a-month&%worth%"ll$%hants%!o$#il\'&$-and\'&beamed\'%cases\'$lead(&icking',
+    '\')scribbled((harpener($ized\'%torch&"ed&&shaped%$onem$%lawdd$2ombe/herefordshire$$reas#"d2$$anty%$rvis%&walima$$efig',
+    '%"jo%#nce%#rel&"ry%!s$!i%!k%!l%\'ng-tray%$ture$\'lington$!o$$rake%$eich&"ll',
+    '()/musician$%ukini%#lar("es&#ina\'!s&,ous-breasted&\'um-like$)y-bouyiki%%ffryn$%zenik#%eaeus$#des$"il$#lis',
+    '$%plain%#ole$$rbit%#ine&"ve%"me$!s$"th%&rabili\'$lium\'&tively&&ometer$"va##fro#$gate',
+    '%$lley)\'/thames\'\'y/rover&%stein$#fei$,illey/thames\'!y$&osekan$\'uin.com%$saha$%walla%#ern#\'h-based%\'kompong$(allurick',
+    '$$eads%#lig$&olders$$urst#!i$"al$#che%&illin\'*"-f+!g+!i,!i-!i,!v+!k',
+    '+)splitting+!x*-/streptomycin7-/amphotericin*$ases(\'opepsin$\'ekonier$$gent$*le-vaginal$\'nisular%*sula/bitez)*r-malaysia*"es$%oners$(s-toting',
+    '%&arwaen)"un%"ed$%tente(%iales*\'ry-like$#uto#$jdeh#!k$#elt%%thman$"in$#ull##lee%!z',
+    '$\'lergaer$!y#&machno%&n-ship&!s%"rk$%ellyn$"on%#rfa$%ynydd#&n\'nrth%%orths$(-gaskell$!.$&aforte',
+    '%-tulacean-like(#ids\'!s%#unt$#don$(efeather%"th%&y/back\'&oxford&!s$"ia%#man%"na&\'e-sized(&wayers',
+    '(*on/liberal&!k&$sula%%stons$"o.%"ne\'!d$)sylvannia$&y\'orth%!-&&a-mile($week\'#nte&&bright&(counting',
+    '&%gaffs&,in-the-pound(!.&(pinchers&%sized&\'teacher&\'whistle%(.another%+/gloucester%$cook&$raig%)farthings%$gown%$less%$mans',
+    '%!s&%worth%&weight&\'histles#&obscot$!w#$parc$"om%#nds$&ushing#%quite#"re%#wen$*hosgarnedd$"oc',
+    '$#yth#*s&atilde;o$(/pencils$%acola%!k%"te&#ion&!o$$bury$"ee%%lwood%"ur$$ford$!i%"er',
+    '%"le&%vania%*on-holders(&linked((planning)\'olicies()splitting\'(_because\'/able/reckonable(!t\'$ers.*%/ub40\'*istpartiet\',s-committees)#the',
+    '(+/redundancy(#_in&!r$#kes$#oes$\'ychnant%,lvania-based%#nnu#/ta&rehy;teuchal%,-continental&&radial%(carbonyl&\'eraster&*hlorphenol&"le',
+    '&"om\'!n&$ubes%+decapeptide%#ene%(gastrine*!n&&onally%\'hydrate%%lphas%&merids(!s%!n&,e-oxy-ethane&$gles',
+    '%&radial%\'stomids%#tes\'%uchal&&hletes&$omid%&zocine$+ec&ocirc;te&*ostal-type+#ism%%iacob%)kontaetea,"ia%"li&!s',
+    '$-hi&eacute;vre()grave;vre%$ylos$%icost)"al%!i%$llie%%mento%!r%"th%)um-shaped)\'pecific\'#/nt$\'ominoes%$nwil',
+    '&%s/pen%#ses%$xide$%rcwrt%&efelin&%uchaf%&foelas%#ich%#wyn%\'ybrogan&"ch$\'stemons$"ti$!z#&umbra\'',
+    '\'"ia$%rised$&slisan#$ware$$hirn$#ood#2yard/herefordshire$%fford$&geulan%&loddfa$#lan$&mynydd$)rhelgi-du#$zais%*nce-newlyn',
+    '$#ini$#lin"+obresanskoe#&ckland#)ny-flower,"ed&&shaped##oow##pel$"il$,le&mdash;her\'%ndash\'0rehy;professions&#\'s.&(-contact',
+    '\'(directed(!o\'\'factory(&riends\'&groups\')intensive(#zed\'(movement+!r\'$need\'*orientated\'(shifting(\'potting(,tate-nation-\'$take',
+    '((ransfers\'(watchers(&inning&%.each\'!i\'#the\'#who&!/\'&animal(%wards\'\'cadbury)!n(&lients((ustomers\'(families',
+    '\'-politics-rich\'%satin($tars))rategaeth\'\'torvill\'%union\'#who&(_as_long\'"so&%barry&%ealth\'%liefs&#isk&#the#$unds',
+    '"&p-pill(!s#%/unit#&achair$&rethus#"el$$rino&!t%$omia&%ncini$$tide#%hredo#1ler/environmental$"is$"um',
+    '#$per\'&\'-caster(\'oloured)%vered\'\'grinder\'%seven&%.wrap&\'berries&!d\'#ine&#ell&%kakor&$mill(*nt-scented*"ed',
+    '&"s.\'!/&$tree&%works$"le##rah$%otech#(sicolagy\'$mane%"de%#k-i%!s$$tain$!y#-tide-specific',
+    '(\'protein&\'oglycan%$sing$!o#$usch#!y$$sian"2que&ntilde;os-anap%"na$+iv&eacute;n$!o"*r&ccedil;u$)dollar;1m$%mgr;g$+rehy;ceived',
+    ')(manently)\'sistent*(pectives$1scaron;t&yacute;n$&uacute#$\'mit#%-acre$-cent-increase$(don-em-e$.foe-li-art-oos$&gallon$$head$%lease$&minute$$node',
+    '%%erson\'#tex%#ort%$upil$\'request$#son#$.sea#\'_annum.$(cent_per$-er_per_capita#!a$\'caridae%"hi$&deniya$,kh&oacute;ra',
+    '%"ta\'!.$!m%!a%(bulatory%$muna$\'plasmic$!s$#zzo##ben%$rton$$oral\'#tes$$rook#*c&eacute;s',
+    '%"iv\'#\'st\'\'ability)"ly\'#ed.)"ly\'$ing.%/ntage&rehy;rate+,times;number*)-of-sale.+$wise*#.ii*"s.(#tge\'#ism',
+    '\'$ion\'*&-based+5image-memory-illusion,*ndependent*+/distending+*experience*/s/understanding\'&ronics\',ual-analytic+(imaginal*-ly-determined(\'o-motor%!t&$ekan$)h-balance',
+    '%!.%#ard%!e&#ron&$ttes%\'fishers%%ikhin%+lorethylene(#ide()oethylene%*tholdsdorf$"ie&!r%$full%#vel',
+    '$!o%"co%$vich$)uitaneous%%lates%$ssed\'+ion/ratchet*!s\'#ors%2taneous-endoscopic$#zel#*d&oacute;n$"al%!s$$eeta',
+    '$#ida%"em%#tos%!z$"on&#net$"re&#aux%$igon$#uci%"es%%rable%"to#&earers$\'delkino',
+    '%!a%"ra&#iaa\'!n(!\'(%ating$*ira/author$%jaume$#lla$!n$\'quisite$!r$"ss&"on%&trello',
+    '+*-resistant$#tti%.z(independent)$#ves$0yaslavl-zalesski%"ra$)z-adamson\'&guilar&%cruet&%rivas#\'feccion*"is&%t-fit(\'looking\'$able',
+    '\'!e\'!i(#on.(&ssimum($vely\'#ly-*$flat*#hit*&judged*(packaged*\'rounded*&shaped+&ighted+%truck+(urviving',
+    ',&rgeted+$uned*(weighted)!.\'"os\'"um%&rences$$icit%\'diously*$ness%"kt%$liev$!o%&liatus%#med',
+    '&$ance\'#tes("us&+m&mdash;and\'!-($ance\'".4\'"_a\'#ace(!n)!c*)e&mdash;a+!-,)affecting-"rt',
+    ',$data,)improving-\'ndicate,&linked,+measurement2#ing,+over-a-pint,)per-pound-(rogramme,&reward,&saloon,&tested+-/installation,\'monitor,&reward',
+    ',\'trading,\'wedding+\'_rather+*indicators\',ed&mdash;for)#-by*$with(*r-director)!.)\'/writer\'#in\'\'+s/delivers.$\'romance%!x$(ume-free',
+    '%*nctoriness%"se\'#dat&)ion-fixed)"of)!s#!g$!a%$ment)\'-parmet&#on.%#nol%!u$"er$*ola-framed',
+    '&"es$\'raecari##hap&,s&mdash;that\'!-(*astonished("it(,not-improved\'$.her\'#_as\'"es%#rps$$umid$-ydroisoindole#&i-bile',
+    '&)nfomatics)(rmatique%%natal%+ventricular$)ampullary%$nder&"th%%pical%(rteritis%$samy$\'bleptos%!o$!c%(hondrial%"le',
+    '&\'ymaenum%%oloso&!m&)ntinental&\'ronitis%$rypt%#ula\'!o(#sum%$ytes$&dermal$$etal$$flux%"ra$\'genital',
+    '&#our%-ny-sur-yerres%#ons%%rines$!k%#les$#led%#lus$#med\'"es&-ter-weighting\'#ral("ic(!y%$iter',
+    '$"na%"de%$eums\'$rial%$guey%!o%&thians\'"us&"is%.uclear/nuclear$"oc&$olic%*d&mdash;15-%hence-"in',
+    '-#two&\'\'&mdash&!-\')by-period\'(costumes\'*derivative\'(hocazade\'#one\',particularly\'#two&".4\'#bat&4/movement/idea/event\'\'output/.#res',
+    '&/ical-publishing**ly-elected\'"ng\'"ty\'\'zations("ed(#ing&!o\'%grams\'%ntoid&"s\'\'"-a\'!.%*esophageal%$ikic',
+    '%)phthalmus%(steotomy\'$itis$*pancreatic&)tetically\'"us%\'erative\'#hap&$teia%$hera)/l-to-peripheral*&/least*\'isation,!m*\'s-maker',
+    ')!e("y\')\'-centre&&rastic%$lous%%odial$*scope-like%(hability&!e\'"th%%iapan&(nusoidal%"sa\'!t%*taltically',
+    '&%riate&%ylium%*ympathetic$!t%%alsis%"on\'&sillar%&ubular&%moral%(yphlitis$(ureteric$\'venular$&wigged$&zzites#&juries',
+    '#&ked-up$&hofers$$ikis%-n-elmer/cetus&#sop\'%ville$$ovic$"pc$"s*%%.this%)/resident$"y.%"ns#*largoniums$%eberg',
+    '%#man%!s%!y$#ice%!s$,man/williams%%utter#"m\'$\'-headed$\'a-frost%$flex%$hide%%nance&*ent-memory*(sounding',
+    '))/r.i.c.s.)#ly-,$hard,\'worried)!s\'!t%$play%$quip%!r&$andy%#tec$)eabilised*&zation&"nt&"se',
+    '%*d/coloured&\'ability%$nant$\'ian-age%$ndar&#ute%$sion&!s\'*ion-giving*$aire(6veness-restrictiveness)#ity\'$sion%)t-holders\'(trainers',
+    ')%nning&%swith&-ted/forbidden(!e\'"it%#xta\'"um$&oglaze%"id%#unt$+selectivity%#ter$\'utating)$onal("um',
+    '%"ja$!e%(rstorfer%%tiana$!g$*iciousness$)od-ricard&!s$%stein#%oblem$"ff$&gative$(ipatetic$!m%%yscus',
+    '("as%"ne%&ospora$#ple$&rmance$&t-bush&%style%"in%"s.%#tus$&vskite$"we$\'xidase-+.antiperoxidase+*conjugated',
+    '(!.(#sin\'#ing&%somes%%ydase#\'pective%$duan%+ndicularity%%ptual%%tiwel&!u\'%amque(%tions)#ors\'!e',
+    '$#ich$\'lexity/\'!t#!q$*u&iacute;n#!r$#ada$!e%+au-saussine%!e%*t-clermont$&haibia$\'icaudet%"ed&6r-with-a-twist-of-lime',
+    '%!l&%-like%#man%$npit&&s/arms(&forest(\'sealine(#vet$$odin%!n&!e&!i&$neau%"ts%!y',
+    '$$uque$*y-pathetic%+/contestant\'%redit&*gloucester&%nurse&&sealed\'$taff(#udy%#bar%&fields%#lin%%mount%$ness%$wood',
+    '$"ae%"lt%$uded$&ection%%gatti%"id%&phone.%&quitur%\'rvation\'!e(#res%\'us-like%&verate*#ion$#had',
+    '$#ia.&(n-backed(*controlled(&design((inspired((speakers%\'cifolia&"um%(l-schein\'$user%%milis\'#tis%$onal%\'stantly\'#ed.',
+    '(&nce/to%&taltic%"us$#ley$\'on&bull\'+mdash;judge\'+rehy;alized&!*&!-\'(computer\'\'deictic\'\'focused\'%group\'$hour\'+in-relation',
+    '\'\'machine)(nagement(%onths\'*orientated\'!s(\'pecific/#ity\'%which)Ko-knowswhat-the-maker-of-clouds-is-thinking(.ith-everything\'$year&".d\'$that&"/2\'$area',
+    '\')loitering\'(official($ther\'&people\'!s\'$twin\'#was\'%years&#_at&$a(s)\'2-non-fucking-grata\'#bly\'(l-equity)&income/$-tax',
+    '+&terest)&social)#tax)\'weapons(!/)#370))emotional)&family)*impersonal*,nstitutional)(property)&social*)ubjective),underwriting(+i&rehy;ties',
+    '*#ed.+!s*0ing/objectifying*!t)1ty&rehy;screening+!\'++-projecting,\'selling,&typing,$wise(!l))y-devised+$held(!s(%uxury',
+    '\'#rum\'$ting\'"zh&\'chester&%holes&0ifi&rehy;cations\'!s&%lised&+nel-changes)(/finance**management*&people*(training)!s&+s&mdash;tax',
+    '(+in-relation\'#/ha((trustees\'2multi-disciplinary&"ys%"un$+pectivalism*"cs*\'e-glass,\'takings+&/depth+$less+"s.*#ism,!t',
+    '&%ktief&&x-like%(icuously&,r&rehy;ation$#tor$,ua&rehy;sion&$ded.)+/encouraged("sd&%sion.*-/manipulation%!e%&lphate%#sah$$wade',
+    '#\'t-haran$"ec%$lote%%nhall&"ue%!r%\'x/nylon$1h&ndash;inverness%\'-forfar&)inverness%#ois$(icularly%!e%"le%\'nencies',
+    '*!a\'!t&"is%!s$%shire$\'ubation&$ohan%%rbed.%%saria#\'u-chile%\'ecuador%%nefer$%/what$#ana&$idad',
+    '\'!s$%gians$#kes%#ier$!n%"ov$!s%$e_so%$sina$*vian-based)(japanese(!a("um)!s&%ensis',
+    '%#pop%$rock$#een%#nit&$tage%!r&!s\'#est\'-ion-targeting*./homosexuality*+s-voyeurism\'\'onality$#yse&#hin##win',
+    '$"on"%sando$$pane#\'catrice$$hard%$eria%\'isolido%%owsky%&sllibo$"od%&solido%"tt#$ebre$$nted&!i',
+    '#+hawar-based##kar$#ibe%#est#"ne#(o-dollar$"la$!n#%quero#$sach%#ire$#ell$!i%1mism/conservatism%!n',
+    '$!l$$oais%"ns#"t-%$buda%+controlling%)destroyer%*herbicides&$ouse%*management%%prone("of%&ridden$(/disease$-ell/executive',
+    '%,r-the-public$%guard$-icide-covered*(drenched*)labelling*\'related*&soaked)$s.it%&lences(#tia%%virus")t&ouml;fi$)rcaron;in%*ehy;lovers##-3d',
+    '%(mbulance$%crazy$$hate%"is%#ood$&lovers$\'seekers#)a-stretch$*becquerels$#cci$!i%%niste)!s$\'l-first&$less',
+    '&(shedding\'#oft%%flesh%#ing&"sm%%oudes$&madine$$rdia\'"ng$&skirts#$ches%"ii#\'e\'n\'dud%!s$!/',
+    '$!l$!n%"ia$#r\'s\',-in-the-east%%-john&(le-poore&%speak%%/aids&%ellen&\'grendon%!2%":i%"ae&&ndpaul',
+    ',!s&"ro%&culter%&ed-out%)head-type&\'ofstatt%#ina%*kin/school%$mann(!s&$over%&nousek%$port%,sburg-cannes*(murmansk',
+    '&&hausen\'#ead&$tock&$wort%$tide$!s#$fish$#ord#!h$%adine$%edine%$rham&\'ingtons$"or$!s',
+    '$$cero$(kostelni$!l%%lance$#ngo$$olar("is%"n-$"si$-t-bourgeoisie&%goave\'$rain&$saut%,_bourgeoisie%-e-bourgeoisie',
+    '%+ion-drawing("al%"ti&!o##kim$#off%0vic/co-organiser#$less#!n$$ames#"o.$)/concorde%-editor/raging%(imperial$$mane',
+    '$$wker#.r&oacute;polis$&a-chem%"ch%2kov&mdash;director%.lona-atapuerca%#rca\'"hs&#oia%#scu$"ea%#lle%#nko%$scus$%iaggi',
+    '&$olor%%e-hay%!n%$tsch$/o&rehy;chemical%*-chemicals&\'economy&%pound%$bius%!c&%arpus&$elli&#orp%%glyph*!s',
+    '%#ica%/l&rehy;pinching,(stations&%-bomb+"ed\'$caps\'(electric\'#fed(&uelled\')rationing\'&shaded(\'niffing\'#tin(#ype&$/air',
+    '&(acosaurs&"ea(!s\'!m\'(um-based*)exporting*#led*#run)(/mineral&&iferos\'#mex&+og&iacute;a("ic("y.&)splashing',
+    '%%nilla%\'pavlosk*#vsk&\'hysical+#ist&$olis%.qu&iacute;mica%&rwanda%!s&#ani&&crites%\'tilapia%(v-vodkin-!s&\'a/abbey',
+    '\'#tch&%skaya("iy$$ulis%&shenko&"ka&"on$!y#&search$#hop$#oft#(t/mother%#rye$$augh$$efar',
+    '%&nkofer%$rill$&ichaps&*oat-ridden)&bodice%#est%-fer/president2&/bbont%%grews%"ly%$ngoe%$paws%%tcoat&#oes$#nau',
+    '$%y-bag&(criminal&\'fogging&*mindedness%*.bourgeois%\'/robert%#cur%!s#)uariensis$&lances%"ia$&r-emil%#bed##zet"(ucedanum',
+    '#&gelaar%*ot-renault(&talbot$#oet#$kert#\'ple-mrp&!s#!r$$orum$"to##ser#%terey$%inger$)z-jeghers"$veit',
+    '%!o%#sed"(w&eacute#(-looking$(stewards#%bound##its##ked##ley#\'s.nigel$#ham#1ter&rehy;coloured&)-coloured\'$look\'&topped',
+    '\'"rs&%spear"$yday#)elstainin##in\'#4rat-le-ch&acirc;teau$#ere$"ol%!n&"ne#$ster#)ton-bruhl"$zdek#&erovic#"im',
+    '$$etta$&izella!#f-5"(1/&lt;up"#309""51"(affinger%#lin##ltz#)nnenstiel#(rrkirche#!s#$uter"!b"!e',
+    '#-nnig-pinching&#ng\'#.rdest&auml;rke#%tzing"%ffftt".ge-constructed"!h")ifftriggs#"le#%tzner"*l&ucirc;gl#!a$*nzenformen\'(r-baltin$!z',
+    '#*p&mdash;gc$(-general#&ugbeil%$zeit""nd"#orr"\'r-46000#%under"&u/cell#!5#!i##nds!$g/10$"27#*colour/107',
+    '*-subtitles/1206!1#&mg/wet#$tube""10#!3"!2"!3"!4"!5"!6""a/#!3#!4#!5',
+    '##301#&e-tefl""e_#$m-3z\'$f(+)%\'7zf(+).$!4#%x-2t.%"3x\',gal4jun1-193%\'cr1&agr\'%i&agr%#kg.".f&amp;sub1&agr#$lquo',
+    '""i2#!i"#ood""pr#!s"!u""w1$!1%(-tacmetj!&h&gt;5&!7#&lt;4.0#)ndash;ucg"!-##lps',
+    '#%value"!.#"d/#"l.")1&deg;cat"#3.7#!6"!5"#6.7")7&ndash;8"$=7.1%!6",a-stimulated#!c$$elia',
+    '$%ocele#%debas$$raig#\'eacians$$drus$-ochromocytoma&%ystis$!r#+ge-infected%%denic#"il$"re%!y#!l$%anger',
+    '(&odidae%%sarna$#era\'"ta&#eus&"um$!l%*ic-looking()oral-anal(&shaped\'%htyhs\'"ky%)o-centric\'+logocentric&%cracy',
+    '&#ids&&plasty%\'us-like\'-/father/adult$!u#(naticism$"cy$&erogam*!s%!s$%g-nga$!h$)itchaphak$%tasia("en',
+    '($zing\'"ma)&gorias-$cals)#tic("es("ic(&ogoric\'#sie\'#tes\'/y-gratification)\'phallus%!d%)om-bodied($like',
+    '\'"ed$&uphong#!o#"ra%$jius%%macia%(oh-style%!x$$didh$)isaically$+ma-ceutical\'%plast&&ceutic,)al/health/3pesticide/herbicide',
+    ')!.\'(odynamic((economic0!s(%logia,,cally-active($paea)#eia)%oeias+"ta\'&utical&\'ecutica-"ls&\'kologie(!n',
+    '%&ocopia$\'nabazos$#ros$$sale\'"ia%"ee$"uk$\'yngeals\'$itic\'%ocele(%lepis#+se-changing&#lag\'%ocked*#ing',
+    '&\'related&)sensitive\'*hift-keyed\'$plit%%d-out%"ls%$ring&!s%"s2$!i%&anidae+!.%%cally%#ngs%!s',
+    '\'!s#%tigue$%phong##ure##yao"&b-rich"#c-1%!6$!3#!1"\'d-years#!/"$e113##480##504',
+    '$!5#"93#.asant-shooting($ries$%tures#"be$"us#$dang$"re#$eeww$!t$!w#%idian&&ppides%#ole',
+    '%"ns$%latio$#pes%.s&ndash;stokes&&-dodge&(/student#\'monenal#"n1$,anthridinium%1zine-1-carboxylic$!e%\'momenon%&omenal%$rgan$$gite',
+    '$%obarb%$geny%"l-\'#oil&,/chloroform/2\'isoamyl&+:chloroform1(:isoamyl&&ogical&)phthalein&0sulphonphthalein%$mema\',na-hypnotism)".t)"l.',
+    ')!m)"n.*!a("um&&inally%%nemon("um%$text&$opic&,ype-genotype%&xazone$%print$%tanyl$.ylacetonitrile\'+lanine-free',
+    '\'#ted&%ethyl+&amines&)hydrazone&\'ketones&.methylsulfonyl..phonylfluoride&&pentyl&6thiohydantoin-cysteine#&oboric$$lung()/composer$\'melanin)&osomes$#nix',
+    '$&omenal(!e&&onally()e-fizzing%%zshaw$!s#8w-missus-it\'s-a-scorcher%%nited$!f$!y"$ffft"#hhh#"or"*i&amp;sup1+!2',
+    '$#phi#$/pot##ale%!l#)bsborough#%chitr#/l&rehy;osophers$%-dame$)/homeless$.adelphia-based*"um%(harmonia%$more%(nthropia,#cal',
+    '+(ologists+)y/charity%"on%&rmonic%$ster%$utus$\'by/mark$"co&!x$!e%#bus%\'ftheron%"ia$#gun$2harmonia/klemperer',
+    '+#ker%\'ellenic$1ibert-de-gardlieu%"ke%\'p-lorca\'&morris&$down&"ot&%patos\')e-laurent($nsis(!s\'#ian(#cae(#des',
+    '((ne-based*"an*\'s-based-#orn+".l\'%onnat(%polis(!t\'-s-universitat\'"us&%s-led\'(/grundig()posidrive($sony%#tis',
+    '&&nganes&(p-claude\')/prisoner\'\'inetown("um\'"pi\'\'s&ndash()-imperial)\'watcher(+/automobile))butterfly)&church)&deacon)+ex-offender*"ye',
+    '*%ormer)/gloucestershire)%nalgo)(official)(pozidriv)+silverstone)#the("es("ii%$lips%$more%#pot(!t%$yrea$$more',
+    '$/o-s&oacute;phos\'&emites+"ic,"sm%\'biblion%%cepos&%tetes%%demus&$oroi&\'romidae%$gyny%&krates%%logic)%scher%$mela',
+    '("os%$nymy%&pappos%#rth%!s&$city&"it&*opber-king+!s(%hemes*-r-agronomists,)humanists,,psychologist,%ruler,)scientist',
+    '+\'.priest++s&mdash;and)*i&rehy;cal*+c-religious+-ally-inspired0&minded*$ques*$sche.!s+"es*#zes)"y-+#\'we+*of-science*".2',
+    '&$pher&%trate*"us%$timo%(xeroides$$pots\'+t/wiltshire$&sburgh%&ophers($ical(!y$\'uchoros$!y#$neus#"pp',
+    '%\'s-faire&&/chief\'\'restore&"ia#$roun#"st%#iki#&zaclea$\'mongers$#zog\'!s%(wizardry"\'lebitic%&otomum$#gon',
+    '$$ious$"um$%xhair#$ippa#$lips$$lips#1oem-transmissible$!g%%istic%-opite-bearing+$rich$#xes"!n#$aarg\'!s',
+    '#!4#"be$,os-byzantium$!y#"ca%!s$#ids%"on$#oea#%drang#!e$%bidas$&niceus\'&onaias((pteridae',
+    '($king\'7/scottsdale&ndash;grand#*itographic#)lmorphism$!o##mis$!n$%vihan#$n-ed$)aesthetic%$tion$+e&rehy;call%!-&1answerer-teamaker\')ttachment',
+    '(#xes\'&ugging&*characters&(exchange(\'tension&$jack&)ownership&#tap)!s\'#ime&%users%$.but&"it%%booth%%call.',
+    '%$mate&*e-grapheme(*monitoring&%icise(!s%%point%$s.it%)tic-level((/fanatic($ised%%yetic&!s$#in\'&$g-in\'!s',
+    '-"ty+"sm,!t&%tonus%,gram-fuelled($pher*-ic/gramophone%$lite)!s&/ogical-recoding-*similarity)"st(+y/phonetics%"ns$#sie',
+    '%$cord#!r$"-3$)bolesters%"yl$#cys$#mia&"on$"os$"rr#/s-phor-esc-ence$!.$+pha-alkynes\'"ge\'&lipids',
+    '()e-binding*)deficient+"na*(removing+#ich*)stripping)!d)\'oxidase(+idylchloine,(glucerol)&zation&$ines\'"te&%lipid&)oacceptor',
+    '\'+glucomutase)&yceric\'2inositide-specific\'%kinae\'&linase)#pds*\'id/bile\')molybdate\'$nate("ic\'(r-bronze(&amidon(&escing(#ite(\'lyation',
+    '+$rich(,yl-accepting*#ase+$ting\'&serine\'-tadylinositol(&hioate)\'reonine%%orous$%toxin#\'t-album$\'graphic)!s$#ina$1o&rehy;journalist',
+    '%,-activatable\'\'ffinity\'%geing\'$lbum\'&rchive&)billboard\'(leaching\'#ook)#ths&(canvases\'(hemistry\'&ollage&)detectors\',ocumentation&(electron',
+    '&$file\'$lash&%graph+"ic&.identification,"ty&*journalist&&kiosks&&labile(#den&*mechanical\')icrograph0!y\'\'ontages&&offset',
+    '&(painting.!s\'#eak\'%ieces\'\'rinting(%ocess)\'tective&(realists(\'ceptive(\'porters&)secession\'#hip\'#top\'*urrealists\')ynthesize',
+    '&\'theatre)$rapy\'#ips\'.ransformations\'*ypesetting&&vision\'&oltaic%!.%%/line%(allergic%)bleaching&%ooths%!c&&athode&/hemical-oxidant',
+    '\'%romic&&ollage\'%mpose+#ing,&tioned\'&pyable),ing/printing&%redit\'*osslinking&&urrent%*degradable\')struction\'$vice&&isplay()sociating',
+    '%%fakes\'!x&&inish.+"es&$lash%)geologist&%rafie(#her(\'mmetric(#phe+(r-friend-,in-residence-$peer,\'/camera-*journalist',
+    ',"al.(ly-based1(enlarged+"es*"s.+$/cut,#jan-#ohn,&melvin,%nadia-$utan,$paul,#tim-"om,%video',
+    '+&/chris,%jerry,%mixed+&:chris&!s&$uide%\'imaging&&onised)#zed%&labile&)ineaments\'.thographically&+uminescence&$ysed\'1tically-generated',
+    '%%masks&+echanically\'$ters($rist&+icrographer*&scopes&*ultipliers%*n-counting\'\'induced&"ic(!s&#scm%$pass&\'ghraphy&$hone',
+    '&&igment&&rotein,!s%(reaction(&listic\'\'ceptive\'$duce\'(fraction\'$sist+!s&\'omances%&s/bios&(culpture&*ensitizers\'$ries',
+    '&#tad(#ted)#ted*#ing\'#ops&)ynthesis.+2ticphosphorylation\'$stem%#tec&(herapist)\'molysis&+ransduction\'%opism&&ypeset,0ter&mdash;anyone',
+    '&&oltage%$work$"ys#!x$+-bsa-coated$+.bsa-coated"!r#!.#0adhatu-doisuther$#gma&%ocone$\'khanana$1sal/prepositional%"e-\'%book.',
+    '\'\'endings\'$file\')groupings\'%level\'%maker*#ing)&tching(%onger\'(specific()tructures&!.&%/word&%books%\'ingover$\'tagoune',
+    '$$xiot$!y##eak$%ebies%$dome%&ranger#%omnia$(ntistery#!p#!r#"um#&ygians&"um"&sphate%)orylation',
+    '$$ical"&thonos"$ucke#$goid#%kians##nky$"ny$-umofathometer#%opsis#(rmomyces#!s$"is#/t&rehy;phutting$*-phut-phut)$ting',
+    '$!t%"ed"+woaaaargghh%!r&$gghh$#oar$"re#"rs#$urgh"!y#!a#)comycetes#\'enotype#"fe##ka5',
+    ')!y%!i%%rchus%!x$!e$$isan$#lan\'$thus%!i&*s/burglary&#tes\'"is%\'obaenus&&clamys&\'glossum',
+    '&!n\'$otus&$san*\',ilicate-type.!s&*xera-proof%"yp$.ogene&rehy;tic)#sis(&ically%%taxis%!x#&mateus&$idae#\'noderee',
+    '#"s.$!a%#lis&"us$&cocine$&eptone%#ter$%hyian$!i%,cal-chemical*&ontact))education),geographical)$type(!/',
+    ')*functional)5psychological/logical))technical(\'isation*#ing(#ly\'*&-based++handicapped+!i(!s\'"ns&2ian&ndash;botanist))-botanist*\'elderly+,xtraordinary',
+    '*+in-ordinary*\'patient)E/philosopher/mathematician/astronomer)-s&mdash;later\'$enne\'\'st-poet&#lar&4ochemical/biological&-s-and-biology(\'centred(*orientated\'!/(*humanities%!k&&alisch',
+    '&!e%\'o-coach(\'ultural\',geographical\'*psychology&\'/author&$crat*"ic&*gnomically\'$raph&%logia+!e*$sche&&nomiae&(therpist',
+    '&\'orbable%$tian)!s$,ophorylation%&stegia\'&igmine$&ucally#(telephas$1o-aromatherapists&,geographical)\'logical%*chemically&%lasts%*geographic/$ally',
+    '%%karst%)laccaceae&$ogia(!y%$mass%)oestrogen.!s%,pathological%%seiid&,ociologiques.#sts\'"me%(therapie&$oxic!"i%',
+    '*!2*!3*!6#&dollar#+eacute;rard$6grave;ce_de_resistance+"he*"ge#*mdash;test)(util.olb#&ntilde)#;on,(-juniper#1scaron;t&ecaron;k""\'s',
+    '#"3k#)hinkeeeee#/i-i-i-i-i-sssss#!n#+pi-pi-pi-pi##rho"#.aa$!b$!c$!d$!e$!f$!g##olb##pre',
+    '##s01%!2%!3%!4%!5%!6%!7%!8%!9$"10%!1%!2%!3%!4%!5',
+    '%!7%!8%!9$"20%!1%!2%!3"$/180#!2"*a&tcedil;a#&cciono$$enti("ni)!o$#ore',
+    '\'$tive##ff\'%!e#+get-flavell#!h##mbo#"n\'$\'caballo$"er$"ge$"im%"no%%ssino&+t-conductor(\'husband',
+    '\'!e(!s$"na$"o\'%&-\'come&+accompanied&&driven\'#uet&+harpsichord&#key&#led("gs\'#ike&$move&&player',
+    '\'$ound\'%tring&)technique\'$uner\'#ype&%vocal&$wire%)/clarsach&\'strings%$cide%%files&%ortes%"sa$"ti#(r-gallup',
+    '$+istenkirche#%secka((-johnson$"ky$"ts#$tchy$&kowski$&nitsky$$rkow#(u&iacute$\'-engaly#%zetta$"zi"!b#"er',
+    '#$-nic$$ture#,ador-quilled$$liqi$$rbia%$dian$.sso-influenced($like(%style$"uo#"c.$(aninnies)!y%#sso%#ver',
+    '$\'iafuoco&!n%"es%!n&!i$#one$"ys#$enum#"he%&nibule%"rs%!y$*on-lalande#$idae$"es',
+    '%(ndash;up$"\'n$+-a-landlord\'&sticks&.nd&rehy;choose%%basic%*compatible%%helve%%lists&#ock)!s%#men%,pick-picking&(ocketing%)stitching',
+    '%\'up-able("ey\'!.$\'/finger+!s$%_once$$able%+rd/hereford%%vance$&bourne$(ed-clean\'"on%&lhaube%$r-up&#ham',
+    '&$nell&$s-up%\'t-fence&$line&#ted\'!s$\'handles$#ins$)le-bottle\'%cocks\'#jar&$cock&"ey&$nash&#ses',
+    '%#ock(!s$$mere$$nett%&icking$(pocketed$$sley%"on%/tock/gloucester$\'wickian#/nic-in-the-park\'%patch\'$type&)/barbeque&#ers',
+    '&#ker&"s.\')/barbecue#(o-kernel$(dealions$+equivalents$$ides$*processors$*rnaviruses$%skirt$$tage%"ee$$vsky#$poul#$ques',
+    '#(rosirius#&strips#-tish-scottish$!o%)gram-like(%phic\'*!y%)n-shipton%#ral&!e\'!r&$ials\'!s$"um%!r',
+    '\'!l&/e&rehy;language\'&-album(%buyer))y-picture(\'covered)2um&rehy;flow-chart(\'drawing(%edits(%faker)%rames()galleries.!y)%lyphs(%halls',
+    ')%ouses(#imp))n-picture((labelled*&nguage)"ed*%nding)#ike*#ned)%oving(&naming((obsessed(&palace)&erfect)$lane',
+    '($rail)%eader*)cognition/$zing,%rding*(solution(&seller,#ing*&quence)$pace)%quare(&tables)!o((watching)&riting',
+    '(%fiona(%jason)#eff(&stuart\'$book\'%drome\'$gram\'&houses\'$less\'&makers\'#que\'%s-avs(!.(5/bicester/oxfordshire+%shops',
+    '):cheltenham/gloucestershire*$lare)&frames)/gloucestershire*%raeme+%endon)2hailey/oxfordshire)+information)\'jessica)2luton/bedfordshire)9sharpness/gloucestershire*3tonehenge/wiltshire/4ouse/gloucestershire*&windon)%upper',
+    '*(orcester&#ist)!s\'&zation#"up$$tres")d/frg/fun#"ar#$cock\'!s#!d$&ledown&$town&!y#%geley',
+    '\'!s%!r$*in-english\'\'italian\'(speaking&$ized#"ra"+e&rehy;eyed#%-3cat$$bald&#sed%&rained$%chart%$rust$$dish',
+    '$&eating$\'filling%$rill$:in-the-sky-eyes-in-the-sky$\'jarmers$$mash$%noire$(olympics$%rouge$&seller*!s%#hop$&warmer#)actdc.pen$$ding',
+    '%\'sdc.pen&\'ors.pen#%balds#!c$%e-box&$dyed&$size&$time\';urned-stuck-up-councillor\'s&%wages%"rs%&s-part%$wise)\'-linear)(/uniform',
+    '&#rts%&niczek$(redc.pen&\'pck.pen%#ust#0d-&aacute;-terre\'-grave;-terres%\'a-terre%$noir$"ad&!e$#ish$%monts$#ras$\'s-noirs',
+    '$(nter.pen##gan$!e%(nrot.pen#$kins#!l$!a$)istrp.pen#$man\'#.naar/transvaal$"ne#%ology#%pline$%owder#*qaappr.pen',
+    '%\'sub.pen#%r-end%%glass%%heads$$aldo%%ndrea$*balancourt$!c%*e-goulding\'%right&%ments&"rs%"ie&#ngs$!e',
+    '\'&md.pen\'&rp.pen$(giovanni$"ia%!d&"ae%"no%"on$%leoni$#may%#ont$(n&eacute$#ogi%"th$%paolo',
+    '$(re-alain(&ntoine\'/buffi&egrave;re\'\'charron\'(emmanuel(&tienne\'/fran&ccedil;ois+$cois\'%henri(:itting-raoul-to-the-ground\'&joseph\'&michel\'%noire\'$paul(0remier-de-serbie',
+    '&%henri&!l\'$atte&&points$"s.%#ide%$sene$$ules$(vittorio#"sl$$mold$)rcfgn.pen$$ting$(ubdc.pen#*t&agrave;s',
+    '$,ermaritsburg&%szoon$,ik&auml;inen%#sts$(r&ograve%&alunga%#era%!i%%uszka$$zner#*updtdc.pen\'&md.pen$"se#*viewdc.pen\'&md.pen',
+    '%+electricity%)resistive"\'faretti#"co#!f$%-paff$!a$%erari#$ling"/g&rehy;sticking#\'\'s-head#0(white/mushroom)#!-$#bin%&rained',
+    '%&utcher$%eared%#yed$\'fancier&"rm("er(#ing%%ilthy%%ooted$(headedly&$sded%"ut$&lovers$%nests$%offal',
+    '$#pen$\'raising%$oast$&shaped&"it%#ick%#kin%$ties&#ore&"ye(!s$$tail%%rough$$ugly$$yard',
+    '#&astric$"to#(breeding##dog#!e$"at$,on-beheading(\'reeding\')droppings\'\'fancier+$ying\'\'hearted(&olding\'(politics\'&racing',
+    '(#ize(%oiled\'(whitened&$cote#\'f-i-r.8$#arm$#eed##ges$$gott$#in.&!s%"sh\'"ly$"ly$(ott-sims',
+    '$+y&rehy;back%*-in-a-poke&$pink%%backs%%holes#(headedly$$tles#\'killing#$lett$$ings#+ment-backed(*containing($free\'!.\'#ing',
+    '%"re$#yes%$fied#)neraticia$$olet%"ne#$oens$$rini$#tts$*u-friedman$$vian##ram$#eco#%sback$$have',
+    '$#ter%"ys"%ipari")j&gt;p\'ij$\'lt;p\'ij#&audier#!s"$kaia$$ntus$%sheen%"so#(cilingis#%e-men%&pushes%#sea',
+    '%$jade%(publican%$site&$olar%(villager$&awassa$$lets$#man$!r%!s$&staffs&#one#"it#%oulis"+l&acirc;tre',
+    '#"-a#!a$!e$!i$!o$#ris$#tii%!o%"te#$bora$"ro&!w#%chers&$ster#%dinny',
+    '$<-\'em-high-and-sell-\'em-cheap%\'drivers&(wellings%\'it-high%)of-bricks%&up:two$$ated$&d-high$!e$$less#&ferers&(ing/loss&%proof#!g$)er-sutton',
+    '&#ite$#ram\')-narrator%#im-()community\'"es\'$mage\'$sway#%iavin$!c$"n\'$%pinas$#suk#$jian##kem',
+    '$!s#)l-bottles%&eating%#out%\'peddler&%opper\'%tting&&ushers%%users$$/car%)mini-pill%$oxon$&agings%!h%,i/consultant',
+    '\',and-concrete\'(capitals\'$idol\'$like\'\'mounted(&ullion\'\'to-post&\'isation("ed("ts\'&zation&$less%!y$"ed%$ment',
+    '$$iers%"ga%\'ng/head%"us$$nitz$(ow-biter\'&covers\'%fight,#ing,!s\'2lava/hyaloclastite+!s\'#not\'$slip+!s',
+    '&%case.&%fight&$slip$+s\'n\'thrills#(m&eacute$#ays#$ning#%ocene$(erection$#pts$"sa$\'t\'s-eye%+-adventurer&&berths&$coat',
+    '&*in-command&%plant\'%rince&%scale\'#eat\'$tyle\'\'urveyed&$test*"ed\',o-controller%*/passenger%!a&"ri%!e%%house',
+    '%\'s-to-be%#ted%%wings#&s-type$$bury$"ea$"on#*tdown-type$\'encreif$#zer#$ulas$!s""m.#"an$&rnthip',
+    '#%blett#$elic%&odidae)!s$$ntal&!s#%perne$,inellifolium$\'le-like&$nose%$iest%(y-butted#%sleur"-n&rehy;points#\'-before',
+    '%&rained$%clear%#url(!s$$drop$$eyes$$fine%$lags$&hatted%$eads$$kung$$neat$\'pricked$(stripped$%table',
+    '%#oed%%ucked$$ups.#*/smoothers#&acidil%#les$)fore-like#,ball-machine\'\'/arcade\'"ed$%oards$#ury##cay$"el%"nt',
+    '%\'r-grips\'$hold\'$like\'(movement$)h-an-inch(\'d-swell&&headed\'&itting&\'induced&\'pleated\'%oints%&better%$cock%\'ed-down((featured',
+    '&#mel&%r/spy%"in\'%gs-in%!o&!t%%penny$$kney$$offs%!t$$tada$#url\'"ed%&shions#!d',
+    '$!i$$olol%!t$!s#-e-and-heather%%bound&%ranch%%cased%&effect%)flavoured&(urnished%&marten)"in%$nuts%#oak',
+    '%(scrubbed&(huttered&#tem%*wilderness&%ooded$%aloma%(ppleweed)!y$$ford$#iro$"ll&"as$#res%$idge$!t',
+    '%#own%#ree%#tes$!y#)farthings$$olds#+g-pong-ball$%/pong$"14$"le&$ston$$ouin$$shuo$&uicula&!d',
+    '#$hasi%!y$)ead-sized#"in%/farina-designed$"or$(prompter$"se$"to#\'jointed#"k\'%#uns$!-%)and-brown)*dark-green',
+    '*$reen)(lavender)%mauve)%pearl&%rched%+blue-purple&%ottom&%rowns%&capped&$oats%7eyed-dilute///wild-type%(flowered&)or-a-girl%&gilled%#ish',
+    '%&legged%)membraned&&uzzled%#ohs%\'painted&$each&\'ink\'ing&%urple%#red%$side&-plashed-white\'%otted\'&rigged&&tained\'%riped',
+    '\'%ssued&%opped&&rimmed&\'urbaned%&walled&$hite&%inged$"/a%$blue)-/yellow/white%%white$!a%!m%$ntus$%bells',
+    '%!n&"ed\'!y%+rton/deacon*#for*(minister%"st%!y$$foot$%hayan$)ie-baited%\'sh-blue((cinnamon($gold)#ray',
+    '(\'looking\'&/brown$#man$"oe$&washed%%orthy$\'y-beige&&mauvey&&orange&%peach&#red)!s&%white%&/brown##ley',
+    '#"na%*cle-shaped)#top%$ster%"te\'!d$#eau%&d-down&!.$#ick%#kin%%ng-up%#ped("ia$%ochio',
+    '#,occhio-style%$ytic\'$osis$$leum$!n$$tage$$wski#$quet#&schers$$dorf$+ent/olympic$!k%"er%!i$%trips',
+    '$(-downing%%glass%(of-water%$pots%$size$)/1&frac14&$50ml%)2/&frac12&$00ml%#300%%450ml%%600ml$#ado%$iled$>er-bellows/osteo-archaeologist',
+    '$"id%#lie%"ng$"or$&rumpet$"s.%"/1&(2&frac14&(3&frac34%$ized$%ucked%#ras#!u$"**$!p',
+    '#%wales$#ell$$heel("ed(!s#\'zgauers"$oden#,la-kirchhoff$,oform-coated#$nair$)eer-breed\'%ingly$#use#!t$%roski',
+    '\'#ska)!i"\'p&ndash#$-pip\'%-pi-p*!p\'!s#!.#"86#"al#.e&rehy;smokers$--and-slippers%\'bending&#omb)!s',
+    '%&clayed)#ing%&dreams%\'fitting&\'reezing%&gargle%\'jacking%(lighting%%major\'$king\'(nagement\'#rch&&onster%%smoke%\'testing',
+    '&*ile-making$)/silencer$%bombs$\'cleaner$\'d-water$&fishes&$tter(#ing%"ul\'!s$&layers%#ess%*ine-laying("rs%$line',
+    '&$ster%$idic$%n.pen$\'r-alpha%\'/angler&(claymore%\'acillin&%zinyl%#ell$(s-of-pan%,_because_erm%#tem$$ttor$-work/fittings(!s',
+    '$!x#&ientis$!l$!n%!\'%*g&rehy;hot&!.%!s$!p$(strelles$&t-like%"ea%&relles#$kins#$less',
+    '$"li$#nes##pas$#in\'&%gford$!s$!y#%ridae##son$&queaks",qu&eacute;es,!s&%uml;s$\'e-nique%#rie',
+    '"-r&aacute;mide#%acies$+g&uuml;ismo$*nha-filled%!s$"rt$"ta%(e-growth\'$like\')protected\'#set($hips%%inera#"ch#%ellis',
+    '#\'imicarb&"de$&nclick(!k%!s$%thoos%"on%&ramide#"jo#"ks##mez#"na##ogi$%midic$#nio',
+    '$!t$!u#&profen#!r#!t$-skhalaishvili#$uzeh"(s&eacute#&-ti-ya#$ador$#nte%"us$#rro$&uridae#)catorials',
+    '$%icide%#ola%$vore)!s(#ous$"od#$elli&!o#%hogue$#pek$!u#%icola$$dian&"um#&mennye',
+    '#%olino&#tes\'"hs$"ni&!a##pir#(s-a-beds&"ll&&rtists%(coloured%(drinking%&filled%$head%%maker%#off',
+    '&\'oor-job%(smelling&&tained\'"op%\'tasting%$warm%&yellow$#ard\'!s&"se$!e%$d-on%$nlit$-ing-with-rain\'!s',
+    '%&uthnes$"sh#%tache(!s\'(io-green,%owers&"or$(e-aching&\'bashers&#off%!d%!l%\'machine%"ur$&illate',
+    '%&l-butt\'\'packin\'&!.&"es&!l%.n-and-cylinder\'\'covered\'&engine-!s\'\'trained(#ype&(e-salice&%liner&(s/valves%#ops',
+    '##wah"%t\'ead#*-a-line-on&#pat$$bank%$ulls$$cage&#ves%$raft$$dogs&"or$$face%#ire$%heads%%ouses',
+    '$&marked%"en$$pass%#ond\'#ies%#rop$(spawning%%talls$$wall#$.off#$/egg$#poa#&ahayas$!k%#uti',
+    '$(ngueiras$#pat$#rda#%board#(cairners%#ple%$stle$*h-and-putt&$back(#lls\'(lackness&%class+"es\'&overed+#ing',
+    '($lled\'%orked*!s&%overs&$pine("pe\'#ole&\'shifted\'#ide&%thick\')o-voltage%#/2a&.attitude/power&&chorus&%delay',
+    '&$lack\'>ende&rehy;hydrocarbon-sulphide%\'ed-back($over(,roof-profile\'!.&(r-plants&-s&mdash;these\'!.%#i-i&"ll%$lynn%#man%%pipes%%shift',
+    '$#ock#(eousness#\'firrane$"ul#*h-helmeted+"s.$&ecines$$iest%$vier$"oi%!s$%tolth#!i$"ao$!e',
+    '$&ful/as\'!l$"ka$(lessness#1keathley/national$#ins$%owski#)man-moore\'\'trained&!.&)/retailer%#rks%$ston$%eadow$$uies',
+    '$#ick##ots#%props##res$$ivie$!u#(sanuloke+.&ndash;lampang$&cottie$%field$&hanger$!i%"de$$moor$4tock/gloucestershire',
+    '&"ps$%udski#&t/long$&agoras%#kos%#lis&$unga%(rd/group%!s$(ed-faced&!.%%r-pat*$tern&!s$#ham',
+    '%%ngton%"te$%stops$$wood$&yvaich#%uisas$\'riaspis#(y-filled#%zbach$!l""ub$$ello""va$#ldi#-dennoukrainsk',
+    '#$naya#(ot-based&$hole&%point%$ally#"ra"#x-a$!b#(el-based%%lated%&s/inch#%idria$%elike%\'s-esque\'*influenced',
+    '$!n#$zies"&yasiri##ush"%zazzy#$etti#$juan#"z.$*a-munching%#hut%#man&%iglio%"no%#rdo$$etas',
+    '$*le-dribble$!o$!y!+j&mdash;the"$anic""bs"(c&rehy;1##-2s"(el152-65)!8("72)!3)!5("wt##ter',
+    '"#-pk"&1-type""j1")m&dgr;-98$+mdash;malta""os""pk"!r"!s"$ware!+l&aacute;ka#)egrave;be"*-dominated#!k"#.11',
+    '$"6b#"23$"8a$!9#$3.10%!6$!0$!1$!7#"43$!7#"56#"60$!3$!4',
+    '#"13"!3#!0#"60"!5"%83051"!9#"65%,/g&rehy;mkxi""a1$\'62*7169##c\'t$$able%)rd-bearer((carrying',
+    '\'#ing%%tions&%orily$-e&lsqb;d&rsqb&3mdash;workmen&mdash%"\'n%#(s)%(-between\'\'y-place&$free&\'holders&$kick&\'marking(!t\'"en',
+    '&\'related&#the\'\'o-place%!.&!8&"it&!s%*/date/time&%india&$time%$able&!t%*bo-treated)#ype\'$=72%',
+    '%"es%\'holders\'"od%\'kickers%#mat&%ents.+!e&#ill%$name&$tal\'(!s($tion\'"ia%!o%"s.',
+    '&#:he&"to%"th&!s$$ider&#ina&$ness$$kets$"ma$#ode\'#rms&$onts##dda$#joe#"ff',
+    '$#ens$(iaristic(\'zations&$ulax%&ochila\')lase-rich$#nac%"ol$!u%(e-bearer\'\'carrier\'(infested\'$like\'#pit\')sufferers',
+    '&$some##hte#+ice/husband$%d-cap&&toting$$mant$(n-boiled\'$rand&%chant(\'ocolate\'\'oloured(&ntrast(%vered&%ended(%glish',
+    '&%glass&$jane&(language\'%iving&%paged&\'sailing\'&leeved\'/traight-talking\'%uited&\'talking&\'wrapped%!/&*reflective%\'clothed%#dre',
+    '-%lange%#ish%%lands%%nesse%)s-grazing&%onged&#pun%"te&,iff&mdash;in)*/applicant*(creditor)+s&mdash;his*!.\'#ve.)$ness',
+    '%$ance%#ent%%tered(!s$+ted-leather%$work$$zier#&kovski#%lstic#%mbeck$%iceps$#pin#\'n-chest%$form%(position',
+    '$(.further%"he$%/4000%%local$!a%$foro%#lto%(ria-like("ns\'"ty%!s%%tions$&cenoit%%huelo$$dome',
+    '&)laminated&%rules&(spotting&$wise%$/ice&$rasp&(sycamore%%crash%%eload%"ll%%maker%\'r-files\',thicknessers&,/thicknesser%%stane',
+    '\'(friendly\'&images\'&shaper(#oul\'%would\'!x\'%years&!.\'$this&!/&"ae&+illionaires,!s\'&sation&$oids',
+    '$&icosta%%frons%!g%%meter(\'rically%$tzer%&uscula$(k-basher\'$uilt&(gourmets&$like&\'spanker+#ing%#ers%+ton-feeding',
+    '$(lessness$%n-ing%+ed&rehy;for\'$-for(&market\'&actual&)r-bashing\'!.\'%/oxon&!y%"in\'+g&mdash;the(!\'(*-committee+4ntrol-accountability',
+    ')#led)(oriented)&policy*<rogramming-budgeting-systems()/building))executing)2marketing/research)&rating*%ights)\'setting)(training$!o%%lites%(radiatus$-rainwater\'sts',
+    '%&-built%\'/career&1diagrams/drawings&#kit&*priorities%#for%$weep$/t&rehy;specific%*-abundance\'$lgal\'9phid-hoverfly-ichneumonid\'(vailable&%baked\'\'reeders\'%uying',
+    '\')ollecting&$data\')estroying&)extracted&\'feeders\'#ood&(grinding(%owing&&houses\'&unting&"in($sect&0moth-ichneumonid&)nutrients&\'of-prey',
+    '&#pot\'$roof&\'raising\'#ich&$size\'$tand(&roking%(.another%(/factory-\'/hangar&)machinery&*researcher%)aginaceae\'*o-aquatica&#sia',
+    '*"s.%$care%%eater&\'d-trees("up&#ria&\'samfund%$food)!s%%house%*in-moretus\'!e\'%g-out)"up(!.',
+    '%\'keeping%#let%&ocracy%&ronics%\'s-woman&".f\'#the&+/strategies&%brook&\'manlike&&pecies%$well&$orks#%ppert#+que-forming',
+    '&#.he&&screen##ret$"ty#$s-y-$&cencia%$hkes$$etal$#het%%water%!y$+kitt/labour$+ma-exchange\'$like&%/milk',
+    '&&cytoid%%id(s)\')-mediated((transfer(&vector\'&/phage&*nogen-like%%opara%!s$$sard%&enburg$"ta%!c%,eel-panelled)&ribbed',
+    '&\'r-board($cast(%depth((embossed($like(\'spotted\'$cast\'&ed-out\'$ised\'$mind%&iboard&/c&rehy;symbolic\'&-based)%elted)%odied',
+    '($debt(%faced)#ilm)&lexing*&ighted*%owers)&ronted($grid(\'handled(+immobilized($like(\'pitched(&sailed)&cented)&heeted',
+    ')$ided)$traw(\'tasting)0oy&rehy;littered\')/concrete(*production\'"as)"es\'#ene\'!i(#ers(\'ne-like($sing("ze*!d',
+    ')%lined(!.(&/steel&!d\'!s&%flesh&$gram&%metal&&nation&%scrip&#tak&$ware%\'ochrons\'%owell&$pake',
+    '$%-form$\'agenets%$ians%"no\'!s$$e(s)%!-&(boundary&%frame\'$ulls&.glass-windowed&%layer&&making("rk*!s',
+    '\'(ovements&+on-your-lap&)scrapings\'$ized\'\'mashing\'&pinner&&warmer\'&inning%+au-andesite\'"x.%%d-cap%!l&%aying&+et-adhesion*)ssociated',
+    ')$free*\'unction)(membrane)\'storage)&vessel(!/(%s=439%&making%)n-machine&%oides&!s%\'osaurus%$rias%%s-can%\'warming',
+    '%"ys$%form\'(&-based*\'uilding))committee)&heeled)$less)\'mounted)$sole*\'pecific)$type("ed(#ing($less(-s-and-ladders',
+    '$"h.$,i&rehy;tudes%%cized%$gnum%"n\'&$ized&%otype&!u\')m-blacked)(coloured)#dna)%group)\'induced*&ridium(!/',
+    '%+tudinarians*%ously$#ner$&o-like%$nics\'"ze&"ov%*on-members$$reef$"sh&"in$)t-pollitt%)/cotswold%!a%\'deutsch',
+    '\'#ing\'!s&\'r-style%&sburgh&%ville$"us$(y-shaped%\'cheirus%$fish%&kurtic%"pi$#zek&!n%/verf&uuml;hrung#"us',
+    '$%tilla#!x#-y&rehy;groups$!\'%!/$--and-pleasure\'*ywhereness&%ttack%%backs&#ike\'#lls&$ooks%&centre%"do\'\'ctoring',
+    '\'"wn%"ed&\'xtracts%&fought%$hour%#ing\'!n%&makers(#ing\'#tes&$usic%$off.&;n-fear-of-greenhouse-effect\'"ce&)rientated',
+    '%$park\'0use/record-pause%&rather%&scheme($ools\'$ript%%texts&%hemes&#ype)!s%6with-yourself-in-a-day&%right+!s%$yard)!s',
+    '%#the$(/compose%\'film/tv%#the%$work$$barn%#ike%#oat("er(!s%%ricks$$care$%dates%"ek&!n',
+    '&!g$!e%&d-back\'"in&$.had&"_a&!s%+r-assistant\'\'captain)"sh\'(directed-#ors\'*for-player\'#led\'#mgr',
+    '\')plus-cash(*reparation\'&safety&$/mgt\'&sample&%coach%!s&!r%"th$%fairs%&ellows%"or\'"ce%+ul-sounding$%girls',
+    '(,nd/classroom(\'p/speak$%hatch%$orse$!i%*ng\'chicken\'&-about)#rea($card)&ounter(#off)"ut(&places("up(\'working',
+    '\'*/listening%"st$"le&%aders&"ss$&makers\'#ing&"ts\'$ters%#ore$!n%(-clothes%$esse%"le$#out',
+    '%#ool$"s/%&chools&$reed%%paces&"ot%%treet%#uit(!s$#ter&%sting%&hings.%!o$#way%%orker',
+    '+1turned-politician"!b"#c\'s#&-based$\'mercury#$/abc$,organisation$"sa#!c"+designer-xl"*ea-bargain$%chers$%dable%#ed.%\'ing.but',
+    '$!n$-sant&ndash;es(\'-spoken(E/good-natured/hard-working/ambitious/(#ist(*ly-grained+*illuminate&$unce%\'e&mdash&C-don\'t-put-us-through-demille-again-(thank-me\'"we&#aaa&"d\'\'0-with-themselves',
+    '\'"ly&$ntly&"rs&$s-me&#ure%"in\'!\'\',g-pleasingly%$ley.%"se%"ur\'/ability/sadness)#le.*"y\'("ma',
+    '),rehy;sailing(&-beach*$ound)\'chasing*$ourt)%drome+%ugged)&flying)&garden)%house))in-itself)$land)&making)$pink*%rimer',
+    ')(steamers)&taking()/disgust/)$pain($able(%bound($dome(1s-pinnock/english*,watercolours$)t-waisted%"he%-s-and-spacing&!_$"ze#\'bbiness',
+    '$#eia\'"n\'$*iscitarian.#ism#"ch$)o/spotted$)tomycetes&$nema%\'ranthus&\'ophenax\'&tromus#.dge&mdash;bush&*e-endorsee\'!s&!t',
+    '$%eease$$sure##gel$%heard##iku$%n-air)#ist%(e-airsme$(oblastus%\'trophic$%tismo#%kanov##nam%$ries$#der',
+    '$\'ishings$!n$!t%(eousness%%ifull&$tude%$y-of&\'/famine#+onastically$&spogia#%raque$#oma#&saunce$$etsk$"hy',
+    '$!o$!s%*ey-siemens\'$/gec%)is-mornay$#ter%"in$(zczynska#$thra%)ysmograph.!y$$rzak$(schacher$!t%&osanti',
+    '$(rocoxals&&gramma&.pneumonia-like-!y&&taenia&#zua%$tuit#"va#"xi%$ppus$&ogenic#3ydell/international$#els#!z"!g',
+    '"/i&mdash;italian#%antly$#ska$%tisky#%cated&#ion$\'htimpex##ego$#lle$!n$#rs/#$ghte&#ing#"ko#!m',
+    '($shop$%soles\'&l-line)$shod#$nius$$ston$$ters%)h-mounted&"ed$"ys#&ocence$!s%#aur(!s$#way',
+    '#8qu&eacute;-&agrave;-jour##ska$$nier$#son#$tted#"un$#sch%#hch#!x#!z"%khari")l-treated"/n&euml;n&aacute+&eacute",o-affiliated',
+    '$&backed$(endorsed$%hamas&\'shemite$(inspired%%srael*!i$*mainstream$)supported##ben#&ceidae&#nae%!k#$dden$&mobile',
+    '$!m%%-type$!y#"gh#%iesti##kho#!m$!b%,i&egrave;res#!n$"ge&"on$"ky##oin$!k',
+    '$"se%!h$!t$!y#$p-of$"py#(schtchad$$ions#"t*$*-advancing%(dig-file%$free%\'holders%(interest%)paradigms',
+    '-!s&&tealer\'#yle$!.$!e$#her$"in$"ke$%lands$&nikoff(!v$"s.$\'ted-out&\'r-based$!z',
+    '#,ugh-bullocks\'\'coulter\'\'handles(%orses\'$land\'"ox\'%share\'$team+!s&&/press&$back\'#oys&"er(!s&%horse',
+    '&$mans\'(en-poets)!s&"ox&&pieces&$soil$"ha#\'velance#%wden\'$&fields$$mans$%tered##yed""ru"$s.la',
+    '#!o#!u"&t.off.\'!s"\'uckacre%$iest&"n\'\'"gs%#ley%$nett#+e-plue-plue$#ral#"g-%%chain&,ompatibility',
+    '%\'drawing%%flush%+in-and-play%$like%"on%%plant*"ed&&ulling%$type$#aru$&blocks%$oard$%gable%%ed-in%&ing-in',
+    '%$oles$$mold$#pal#"it#,m&ndash;lump$*-and-apple)*spilt-milk%%bloom%$dent%\'looking%\'mouthed%\'pickers%#red%%sized&\'tippled',
+    '$&b-bob.&"in&\'pudding%$/mep%+er/tinsmith\'"ry%&ing-in%)osolvency,!t%"um$&e-like&$rise%"ry%!t$#ito',
+    '%%iness%#ted$#osa$)p-cheeked!(ro-smith',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_63 = (
+count_63 = 6695
+
+heads_63 = (
     'orra',
-    'orramer',
-    'orred',
-    'orrel',
-    'orrenda',
-    'orreries',
-    'orrest',
-    'orribile',
-    'orrid',
-    'orriss',
-    'orritor',
-    'orritt',
-    'orrs',
-    'ors&aacute;ggy&uuml;l&eacute;s',
-    'orse.',
-    'orses',
     'orshi',
-    'orsini-colonna',
-    'orsippos',
-    'orsk',
-    'orskov',
-    'orso',
-    'orsoni',
-    'orsted',
-    'orston',
-    'orsz&aacute;gg&uuml;l&eacute;s',
-    'orszaghaz',
-    'ort&iacute;n',
-    'orta&ccedil',
-    'orteil',
-    'ortelli',
-    'orter',
     'orteuil',
-    'orthids',
-    'ortho-chemical',
-    'orthoceras',
-    'orthocide',
-    'orthocone',
-    'orthocreme',
-    'orthodiagnostics',
-    'orthodontists',
-    'orthodoox',
-    'orthodox-catholic',
-    'orthodox-science',
-    'orthodox/rationalist',
-    'orthodoxi',
-    'orthodoxy\'',
-    'orthodx',
     'orthogenic',
-    'orthogneiss',
-    'orthogneisses',
-    'orthogonalises',
-    'orthogonals',
-    'orthograde',
-    'orthokeraten',
-    'orthomat',
-    'orthomorphic',
-    'orthomorphism',
-    'orthopaedically',
-    'orthopaedist',
-    'orthopeadic',
-    'orthopedics',
-    'orthophosphates',
-    'orthophosphoric',
     'orthopod',
-    'orthoptist',
-    'orthoquartzite',
-    'orthothecium',
-    'orthotropic',
-    'ortigia',
-    'ortiz-',
-    'ortiz-navarrete',
-    'ortiz-patino',
-    'ortlieb',
-    'ortman',
-    'ortodoxo',
-    'ortolani',
-    'ortonesque',
-    'ortony',
-    'ortothecium',
     'ortstock',
-    'ortus',
-    'ortwed',
-    'ortygia',
-    'orusese',
-    'oruval',
-    'orval',
-    'orvid',
-    'orvis',
-    'orwel',
-    'orwell&rehy;blair',
-    'orwell/waugh',
-    'orwellian-sounding',
-    'orwellian-speak',
-    'orwells',
-    'orwood',
     'orwriggle',
-    'orx',
-    'oryctolagus',
-    'oryol-gryazi',
-    'oryxes',
-    'oryza',
-    'orz&aacute;ggy&uuml;l&eacute;s',
-    'orzel/sister',
-    'os-2',
-    'os-900',
-    'os-n',
-    'os-offset',
-    'os.2',
-    'os.61h',
-    'os/2-lan',
-    'os/2-presentation',
     'os/2-related',
-    'os/9000',
-    'os/nd',
-    'os2',
-    'os=1.060',
-    'osa-offset',
-    'osadchy',
-    'osafune',
-    'osageorange',
-    'osaki',
-    'osamah',
-    'osamu',
-    'osanna',
-    'osario',
-    'osario/age',
-    'osasuna',
     'osbaldiston',
-    'osbaston',
-    'osberht',
-    'osberto',
-    'osbom',
-    'osborne-mendel',
-    'osborne/',
-    'osborne/anthony',
-    'osborne/author',
-    'osborne/jockey',
-    'osborne/ward',
-    'osbornes',
-    'osborough',
-    'osbournby',
-    'osbourne-produced',
-    'osbourne/clerk',
     'osburn&lsqb;000&rsqb',
-    'oscar-accoladed',
-    'oscar-night',
-    'oscar-nominee',
-    'oscar-proofed',
-    'oscarless',
-    'oschersleben',
-    'oscillations/',
-    'oscilloscope-style',
-    'oscopic',
-    'oscr',
-    'osculating',
-    'osculatory',
-    'oscuridad',
-    'oscurit&agrave',
-    'osdae',
     'osea',
-    'osee',
-    'oseen',
-    'oseney',
-    'osengell',
-    'osentons',
-    'osep',
-    'osetia',
-    'osetians',
-    'oseva',
-    'oseye',
-    'osf-derived',
-    'osf-endorsed',
-    'osf-usl',
-    'osf/1-for-ace',
-    'osf/1-on-alpha',
     'osf/1-on-mips',
-    'osf/1-ultrix-open',
-    'osf/1.0',
-    'osf/1.2',
-    'osf/2',
-    'osf/l',
-    'osf/ui',
-    'osf1',
-    'osfers',
-    'osfi',
-    'osgodby',
-    'osgothorp',
-    'oshac',
-    'oshap',
-    'osharovka',
-    'oshawa',
     'oshenko',
-    'oshige',
-    'oshimai',
-    'oshimensis',
-    'oshivello',
-    'oshogbo',
-    'oshtava',
-    'osi-compatible',
-    'osi-tcp/ip',
-    'osi/tcp',
-    'osibisa',
-    'osic',
-    'osii',
-    'osijek/croatia',
-    'osimo',
-    'osios',
     'osiride',
-    'osiris-isis-horus',
-    'osiris-shaped',
-    'osirus',
-    'ositive',
-    'osjaagriculture',
-    'oskarshamn',
-    'osland',
-    'osleset',
-    'osley',
-    'oslin',
-    'oslizlok',
-    'oslo-based',
-    'oslofjord',
-    'osmace',
-    'osman\'s',
     'osmand',
-    'osmanthus',
-    'osmc',
-    'osmenia',
-    'osmerley',
-    'osmicated',
-    'osmin',
-    'osmington',
-    'osmium-poor',
-    'osmo',
-    'osmometers',
-    'osmond/local',
-    'osmond/thames',
-    'osmosin',
-    'osmotherapy',
-    'osmunda',
     'osnabr&uuml;ck&rehy;he',
-    'osnabrueck',
-    'osofsky',
-    'osogo',
-    'osome',
-    'oson',
-    'osostowicz',
-    'osozly',
-    'osp-1',
-    'ospring',
-    'ossaia',
-    'ossemens',
-    'osseous',
-    'osservanti',
-    'osset',
-    'ossete-controlled',
     'ossetia-ingush',
-    'ossetia-ingushetia',
-    'ossiach',
-    'ossiatuc',
-    'ossifying',
-    'ossola',
-    'ossolinski',
-    'ossoms',
-    'ossuaries',
-    'ossulston',
-    'ost-fjord',
-    'ostanes',
-    'ostar',
-    'ostarbeiters',
-    'ostashek',
-    'ostbataillonen',
     'ostberg',
-    'ostchallenge',
-    'osteichthyes',
-    'ostel',
-    'osten-sacken',
-    'ostendaise',
-    'ostende',
-    'ostenecrosis',
-    'ostens',
-    'ostensam',
-    'ostensible/mainstream',
-    'ostensory',
-    'osteo-pontin',
-    'osteoarthrosis',
-    'osteochondritis',
-    'osteocyte',
     'osteoglossidae',
-    'osteoid',
-    'osteolepsis',
-    'osteologists',
-    'osteolysis',
-    'osteonecrotic',
-    'osteopenia',
-    'osteosarcoma-derived',
-    'osteosperma',
-    'osteostracan',
-    'osteotomies',
-    'osteporosis',
-    'osterburg',
-    'osterc(f)',
-    'osterfeed',
-    'osterfield',
     'osteria',
-    'ostermann',
-    'ostern',
-    'osteroporosis',
-    'osterreichring',
-    'osterrieth',
-    'ostertags',
-    'ostertorte',
-    'osteuropa',
-    'ostfr&auml;nkischen',
-    'osthausmuseum',
-    'osthmotherly',
-    'osti',
-    'ostig',
-    'ostioles',
-    'ostitis',
     'ostium',
-    'ostlanders',
-    'ostle',
-    'ostoji&cacute',
-    'ostomy',
-    'ostorius',
-    'ostr&oacute;w',
-    'ostraciontidae',
-    'ostracises',
-    'ostracod',
-    'ostracode',
-    'ostracoderm',
-    'ostraea',
-    'ostrakism&oacute;s',
-    'ostrakizo',
-    'ostrakon',
     'ostrakov',
-    'ostrea-gryphaea',
-    'ostrich-egg',
-    'ostrich-head-in-sand',
-    'ostrich-sized',
-    'ostrin',
-    'ostro',
-    'ostrogoth',
-    'ostroleka',
-    'ostroumov',
-    'ostrowksi',
-    'osts',
-    'ostschliefe',
-    'ostt',
-    'ostyaks',
-    'osulf',
     'osumi',
-    'osun',
-    'osus',
-    'osvaldova',
-    'osvoboditelnaya',
-    'osvoenie',
-    'oswalds',
-    'oswaldstonian',
-    'oswaldtwis&rehy;tle',
-    'oswestry-based',
-    'oswiecim',
-    'oswold',
-    'osx',
-    'osx.',
-    'ot&aacute;vio',
-    'ot-ay-liya',
     'otacilius',
-    'otained',
-    'otar',
-    'otard',
-    'otavio',
-    'otchiwitchi',
-    'otchizna',
-    'otder',
-    'oteiza',
-    'oten',
-    'otential',
-    'oter',
-    'oterey',
-    'oters',
-    'otey',
-    'otez',
     'otf',
-    'otha',
-    'otham',
-    'othapedic',
-    'othea',
-    'othel',
-    'othello-like',
-    'other&mdash',
-    'other&mdash;a',
-    'other&rehy;socialism',
-    'other&rehy;worldliness',
-    'other\'s',
-    'other**003.12.9',
-    'other-centred',
-    'other-dialect',
-    'other-end',
     'other-life',
-    'other-much',
-    'other-name',
-    'other-oriented',
-    'other-people-',
-    'other-perhaps',
-    'other-sex',
-    'other-side-of-the-world',
-    'other-so',
-    'other-than-spectacular',
-    'other-they',
-    'other-wordly',
-    'other-worldish',
-    'other.',
-    'other.and',
-    'other.of',
     'other/no',
-    'other/not',
-    'other/similar',
-    'other013.14.44,905',
-    'other_,_other_than',
-    'other_other_than',
-    'otherappropriately',
-    'otherdepartments',
-    'otheres',
-    'othering',
-    'otherise',
-    'otherised',
-    'otherlocal',
-    'otherness-across-gender',
-    'otherness.',
-    'otheron',
     'others&mdash',
-    'others\'',
-    'others+',
-    'others-',
-    'others-this',
-    'others-v-eli',
-    'others.59',
-    'others.she',
-    'others.the',
-    'others1,30014.018.7',
-    'others2.32.600',
-    'others3740',
-    'otherwares',
-    'otherwise&mdash;it',
-    'otherwise-',
-    'otherwise-clean',
     'otherwise-that',
-    'othet',
-    'othgr',
-    'othmani',
-    'othmanli',
-    'othmar',
-    'othmayr',
-    'othniel',
-    'othodox',
-    'otholites',
-    'othon',
-    'othonial',
-    'othotenies',
-    'otididae-oddity',
-    'otilia',
-    'otion',
     'otira',
-    'otis/parsons',
-    'otjihase',
-    'otk',
-    'otlet',
-    'otlier',
-    'otnight',
-    'otnosheniia',
-    'otocom',
-    'otocyon',
-    'otokar',
-    'otolaryngological',
-    'otolaryngologists',
-    'otologist',
-    'otomar',
-    'otomyinae',
     'otomyine',
-    'otopen',
-    'otorhinolaryngologists',
-    'otorhinolaryngology',
-    'ototoxicity',
-    'otricoli',
-    'otrokovice',
-    'otsar',
-    'otsu',
-    'ott&oacute',
-    'ottama',
-    'ottavo',
-    'ottawa&ndash;orilla',
-    'ottenburg',
-    'ottens',
-    'otter-skin',
     'otterbourne',
-    'otterbur',
-    'otterhill',
-    'otterlo',
-    'ottersdorf',
-    'otterskin',
-    'ottervanger',
-    'ottervein',
-    'ottesen',
-    'otthard',
-    'ottinger',
-    'ottingham',
-    'ottino',
-    'otto-crepin',
-    'otto-of-roses',
-    'ottobeuren',
     'ottoboni',
-    'ottoia',
-    'ottoman&mdash;habsburg',
-    'ottoman-mamluk',
-    'ottomanize',
-    'ottomised',
-    'ottomores',
-    'ottonel',
-    'ottoneum',
-    'ottoniirolia',
-    'ottorino',
-    'ottos',
-    'ottowa-based',
-    'ottoway',
-    'ottronin\'ny',
-    'ottways',
     'otway-ruthven',
-    'otwinowski',
-    'otx',
-    'otz',
-    'ouabain',
-    'ouachita',
-    'ouadda',
-    'ouadraogo',
-    'ouadrigam',
-    'ouangraoua',
-    'ouarka',
-    'ouatara',
-    'oubanguien',
-    'oubanguien-parti',
-    'oubc',
-    'oubilin',
     'oubreak',
-    'ouca',
-    'ouchy',
-    'oucin',
-    'oucnilc',
-    'oud-loosdrecht',
-    'oudenaarde',
-    'oudenard',
-    'ouderkerk',
-    'oueddi',
-    'oueds',
-    'oueenshithe',
-    'ouelett',
-    'ouen-les-docks',
-    'ouery',
-    'ouesso',
     'ouest-france',
-    'ouf',
-    'oug',
-    'ougenia',
-    'ought\'',
-    'ought-',
-    'ought-bindingness',
-    'ought-to-be-condemned',
-    'oughtershaw',
-    'oughtest',
-    'oughtness',
-    'oughtrington',
-    'oughtta',
-    'ougier',
-    'ougodogoland',
-    'ougoure',
     'ouguiyas',
-    'ougure',
-    'ouhoumoudou',
-    'ouir',
-    'ouiset',
-    'ouka',
-    'ouksel',
-    'oul\'',
-    'oulg',
-    'oulines',
-    'oulook',
-    'oulston',
-    'oum-el-rbia',
-    'oumaldaaya',
-    'ouman&ccedil;off',
-    'oumumbered',
     'ouncches',
-    'ounces.pets',
-    'ounces/gallon',
-    'ounds',
-    'ounsted',
-    'ouologuem',
-    'ouput',
-    'our-',
-    'our-own',
-    'our-story',
-    'our-wildly',
-    'our/',
-    'our/my',
-    'ouragons',
-    'ourang-outang',
-    'ouranopithecus',
     'ourbursts',
-    'oured',
-    'ourier',
-    'ourjills',
-    'ourland',
-    'ouroboros',
-    'ouroriginal',
-    'ourranch',
-    'ours.',
-    'ours_a',
-    'oursel',
-    'oursels',
-    'oursen',
-    'oursevles',
-    'oursian',
-    'oursin',
     'oursler',
-    'ourstory',
-    'ous-minded',
-    'ouse-ure',
-    'ousegate',
-    'oussera',
-    'ousset',
-    'ousters',
-    'out&mdash;about',
-    'out&mdash;dated',
-    'out&mdash;your',
-    'out&rehy',
-    'out&rehy;dated',
-    'out&rehy;door',
-    'out&rehy;guessed',
-    'out&rehy;manoevred',
     'out&rehy;migration',
-    'out&rehy;moded',
-    'out&rehy;of-it',
-    'out&rehy;patient',
-    'out&rehy;pointed',
-    'out&rehy;spoken',
-    'out&rehy;wash',
-    'out\'a',
-    'out\'ard',
-    'out-\'live',
-    'out-accelerate',
-    'out-accelerating',
-    'out-acted',
-    'out-alive',
-    'out-and-out-all-round',
-    'out-and-out-royalists',
     'out-and-return',
-    'out-at-elbow',
-    'out-baskets',
-    'out-blandish',
-    'out-bluff',
-    'out-bluffed',
-    'out-boot',
-    'out-bound',
-    'out-bowl',
-    'out-boxed',
-    'out-break',
-    'out-bribe',
-    'out-chattering',
-    'out-climb',
-    'out-commuting',
-    'out-crop',
     'out-crops',
-    'out-crumpling',
-    'out-cry',
-    'out-departments',
-    'out-deviate',
-    'out-dimbleby',
-    'out-distancing',
-    'out-doors',
-    'out-drank',
-    'out-drink',
-    'out-drinking',
-    'out-driving',
-    'out-drove',
-    'out-eat',
-    'out-englished',
-    'out-evolved',
     'out-fall',
-    'out-falls',
-    'out-faxed',
-    'out-fenced',
-    'out-field',
-    'out-fields',
-    'out-fished',
-    'out-flow',
-    'out-flows',
-    'out-flung',
-    'out-flynn',
-    'out-for',
-    'out-fox',
-    'out-generalled',
-    'out-glare',
-    'out-goings',
     'out-grouping',
-    'out-groups',
-    'out-handle',
-    'out-hikes',
-    'out-houses',
-    'out-housing',
-    'out-i',
-    'out-inspection',
-    'out-invests',
-    'out-island',
-    'out-just',
-    'out-lean',
-    'out-lived',
-    'out-lobby',
-    'out-loud',
-    'out-lying',
     'out-machoing',
-    'out-manoeuvering',
-    'out-manoeuvres',
-    'out-manoeuvring',
-    'out-mario',
-    'out-marriage',
-    'out-migrating',
-    'out-ness',
-    'out-niggered',
-    'out-number',
-    'out-numbering',
-    'out-nursing',
-    'out-of&rehy;condition',
-    'out-of-action',
-    'out-of-alignment',
-    'out-of-cell',
     'out-of-church',
-    'out-of-city',
-    'out-of-country',
-    'out-of-door',
-    'out-of-gauge',
-    'out-of-gear',
-    'out-of-hearings',
-    'out-of-it',
-    'out-of-keeping',
-    'out-of-key',
-    'out-of-laws',
-    'out-of-line',
-    'out-of-loves',
-    'out-of-mind',
-    'out-of-oneself',
-    'out-of-position',
     'out-of-proportion',
-    'out-of-sessions',
-    'out-of-stock',
-    'out-of-subject',
-    'out-of-sync',
-    'out-of-synch',
-    'out-of-the-norm',
-    'out-of-the-practical-swim',
-    'out-of-the-usual',
-    'out-of-the-wayish',
-    'out-of-the-world',
-    'out-of-thebox',
-    'out-of-touch-with-reality',
-    'out-of-towner',
-    'out-of-towners',
-    'out-of-trim',
     'out-of-tuneness',
-    'out-of-work-donation',
-    'out-of-your-heads-is-the-place-to-be',
-    'out-oftowners',
-    'out-or',
-    'out-organized',
-    'out-ottomaned',
-    'out-paced',
-    'out-pacing',
-    'out-parish',
-    'out-party',
-    'out-payment',
-    'out-pedant',
-    'out-pensioners',
-    'out-performanced',
-    'out-planned',
     'out-playing',
-    'out-pointing',
-    'out-polled',
-    'out-port',
-    'out-posed',
-    'out-price',
-    'out-produces',
-    'out-promise',
-    'out-prospered',
-    'out-pulled',
-    'out-put',
-    'out-putted',
-    'out-quarterbacked',
-    'out-race',
-    'out-rank',
-    'out-rankle',
     'out-repeated',
-    'out-respectability',
-    'out-ridden',
-    'out-ride',
-    'out-right',
-    'out-running',
-    'out-sang',
-    'out-servants',
-    'out-serving',
-    'out-shoot',
-    'out-shouting',
-    'out-skirts',
-    'out-smart',
-    'out-sourced',
-    'out-spin',
-    'out-spoke',
     'out-spoken',
-    'out-sprinted',
-    'out-sprinting',
-    'out-squealing',
-    'out-squint',
-    'out-strips',
-    'out-styled',
-    'out-swing',
-    'out-swinger',
-    'out-swingers',
-    'out-talk',
-    'out-talked',
-    'out-tantrum',
-    'out-the',
-    'out-there',
-    'out-thereness',
     'out-to',
-    'out-to-lunch',
-    'out-traded',
-    'out-trays',
-    'out-tro',
-    'out-turned',
-    'out-twee',
-    'out-victored',
-    'out-vote',
-    'out-weigh',
-    'out-weird',
-    'out-which',
-    'out-who',
-    'out-wintering',
-    'out-woodstock',
-    'out-yields',
     'out.',
-    'out.picture',
-    'out.qualities',
-    'out.richard',
-    'out.simon',
-    'out.such',
-    'out.that',
-    'out.the',
-    'out.three',
-    'out.wimbledon',
-    'out/distribute',
-    'out/do/provide',
-    'out/managed',
-    'out/put',
-    'out/thru',
-    'out1/scale',
     'out12',
-    'out15',
-    'out37',
-    'out42',
-    'out85',
-    'out87',
-    'out_,_i_got_it_out_of',
-    'out_,_took_me_out_of',
-    'out_a',
-    'out_anything',
-    'out_as',
-    'out_as_well',
-    'out_erm_of',
-    'out_no_matter',
-    'out_on',
-    'outbalances',
     'outbids',
-    'outblast',
-    'outbluffed',
-    'outboard-facing',
-    'outboard-motor-free',
-    'outbound.',
-    'outbowl',
-    'outboxed',
-    'outbreath',
-    'outburst_because',
-    'outburts',
-    'outc',
-    'outcamp',
-    'outcast.the',
-    'outcentre',
-    'outcha',
     'outcheated',
-    'outcidence-for',
-    'outcidence.1',
-    'outclasses',
-    'outcome(s)',
-    'outcome-based',
-    'outcome.',
-    'outcomings',
-    'outcomne',
-    'outconjured',
-    'outcropped',
-    'outcrossed',
-    'outdistances',
-    'outdoor-clothing',
-    'outdoor-minded',
-    'outdoor-reared',
     'outdoor/indoor',
-    'outdoorsmen',
-    'outdrawn',
-    'outdream',
-    'outdrive',
-    'outdriving',
-    'outdrove',
-    'oute',
-    'outed',
-    'outer-covering',
-    'outer-gap',
-    'outer-garments',
-    'outer-metropolitan',
-    'outer-office',
-    'outer-ring',
-    'outer-suburb',
     'outer-urban',
-    'outercoat',
-    'outergraff',
-    'outerlying',
-    'outfaces',
-    'outfax-been',
-    'outfaxed',
-    'outfaxes',
-    'outfielders',
-    'outfielding',
-    'outfighting',
-    'outfill',
-    'outfit.',
-    'outflanks',
-    'outflooding',
-    'outfly',
     'outflying',
-    'outfox',
-    'outfoxing',
-    'outgirthed',
-    'outgraded',
-    'outgrossed',
-    'outgrossing',
-    'outgrowm',
-    'outguess',
-    'outguessed',
-    'outguessing',
-    'outgunning',
-    'outhitting',
-    'outhousing',
-    'outin\'',
-    'outine',
     'outioi',
-    'outiside',
-    'outjabbed',
-    'outjumping',
-    'outjutting',
-    'outl',
-    'outlaid',
-    'outlandos',
-    'outlawed.',
-    'outlay/pricing',
-    'outleaning',
-    'outleaped',
-    'outlends',
-    'outlets/take-aways',
-    'outlife',
-    'outlined.',
     'outlines&mdash;the',
-    'outlook.',
-    'outman',
-    'outmaneouvre',
-    'outmanoeuvreing',
-    'outmanouevring',
-    'outmartyring',
-    'outmatch',
-    'outmatching',
-    'outmigrate',
-    'outof-the-way',
-    'outoutweighed',
-    'outpandered',
-    'outpersonoeuvred',
-    'outplaced',
-    'outpoint',
     'outpoll',
-    'outpouchings',
-    'outprice',
-    'outpriced',
-    'outproduces',
-    'outpts',
-    'outpur',
-    'output&mdash;more',
-    'output\'',
-    'output(s)',
-    'output-basal',
-    'output-based',
-    'output-led',
-    'output-related',
-    'output-setting',
-    'output-signal',
     'output-system',
-    'output-the',
-    'output-utilization',
-    'output/buried',
-    'output/capital',
-    'output/employee',
-    'output/person',
-    'output/standards',
-    'output3,270,00037.1%6.5%',
-    'output878,00018.9%3.5%',
-    'outquip',
-    'outr',
-    'outrage\'',
-    'outrage-at-intrusion',
-    'outrage/dissonance',
-    'outraged-of-',
     'outrageous.',
-    'outrageously-by',
-    'outramped',
-    'outreached',
-    'outremer\'',
-    'outrights',
-    'outrim',
-    'outrollings',
-    'outrule',
-    'outs(u)',
-    'outs.',
-    'outsalaried',
-    'outsang',
-    'outseam',
-    'outserving',
-    'outshadowed',
     'outshipped',
-    'outshoots',
-    'outshots',
-    'outshout',
-    'outshouting',
-    'outsid',
-    'outside&mdash',
-    'outside-cylinder',
-    'outside-cylindered',
-    'outside-from',
-    'outside-level',
-    'outside-out',
-    'outsider-hack',
-    'outsiderhood',
-    'outsidfe',
-    'outsinned',
     'outsizes',
-    'outsketched',
-    'outskirt',
-    'outskirter',
-    'outslide',
-    'outsniff',
-    'outspan-wielding',
-    'outspanned',
-    'outspend',
-    'outsplayed',
-    'outsprint',
-    'outsprinted',
-    'outstares',
-    'outstaying',
-    'outstretching',
-    'outsung',
     'outswelled',
-    'outswim',
-    'outterside',
-    'outthought',
-    'outttt',
-    'outukumpo',
-    'outvied',
-    'outwale',
-    'outward-',
-    'outward-directed',
-    'outward-opening',
-    'outward-oriented',
-    'outward-sainted',
-    'outward-seeming',
-    'outward-slanting',
-    'outwardly-directed',
     'outwardness',
-    'outwatch',
-    'outweight',
-    'outwent',
-    'outworker',
-    'outworld',
-    'outworlds',
-    'outyield',
-    'outyielded',
-    'ouur',
-    'ouvert',
-    'ouverte',
-    'ouverts',
-    'ouverture',
-    'ouvrage',
-    'ouvrages',
     'ouvrant',
-    'ouvri&egrave;re',
-    'ouvrie',
-    'ouvriere',
-    'ouvriers',
-    'ouw',
-    'ouzon',
-    'ouzou',
-    'ov-10',
-    'ova-enthusiastic',
-    'oval&rehy;shaped',
-    'oval-ended',
-    'oval-headed',
-    'oval-planned',
-    'oval-section',
-    'ovale',
     'ovalifolium',
-    'ovalis',
-    'ovaloid',
-    'ovaltinie',
-    'ovambo',
-    'ovangkol',
-    'ovangol',
-    'ovaodvykdgxdekrvmoggs',
-    'ovata',
-    'ovation-based',
-    'ovatoscutum',
-    'ovejector',
-    'oven(s)',
-    'oven-cleaner',
-    'oven-control',
-    'oven-dried',
     'oven-ends',
-    'oven-fresh',
-    'oven-gloved',
-    'oven-gloves',
-    'oven-pot',
-    'oven-proof',
-    'oven-roasting',
-    'oven-scourer',
-    'oven.i',
-    'ovenbird',
-    'ovendale',
-    'ovenell',
-    'ovenlights',
-    'ovenroom',
-    'over&mdash;riding',
-    'over&ndash;50s',
     'over&ndash;crowded',
-    'over&pound;6',
-    'over&rehy',
-    'over&rehy;50s',
-    'over&rehy;65s',
-    'over&rehy;absorbency',
-    'over&rehy;aged',
-    'over&rehy;ambitious',
-    'over&rehy;analysis',
-    'over&rehy;came',
-    'over&rehy;caution',
-    'over&rehy;controlling',
-    'over&rehy;developed',
-    'over&rehy;dominated',
-    'over&rehy;enthusiastic',
-    'over&rehy;exalted',
     'over&rehy;exposed',
-    'over&rehy;flowed',
-    'over&rehy;generous',
-    'over&rehy;grazing',
-    'over&rehy;grinding',
-    'over&rehy;hanging',
-    'over&rehy;indexing',
-    'over&rehy;indulgence',
-    'over&rehy;inflated',
-    'over&rehy;integration',
-    'over&rehy;literally',
-    'over&rehy;paid',
-    'over&rehy;persuade',
-    'over&rehy;powering',
-    'over&rehy;production',
-    'over&rehy;reactive',
     'over&rehy;riding',
-    'over&rehy;romanticised',
-    'over&rehy;ruled',
-    'over&rehy;ruling',
-    'over&rehy;shadowed',
-    'over&rehy;shadowing',
-    'over&rehy;simplifications',
-    'over&rehy;size',
-    'over&rehy;sized',
-    'over&rehy;stated',
-    'over&rehy;statement',
-    'over&rehy;structured',
-    'over&rehy;subscribed',
-    'over&rehy;taken',
-    'over&rehy;upholstered',
-    'over&rehy;whelming',
     'over&rehy;wintering',
-    'over\'',
-    'over\'-taxed',
-    'over-&pound;2',
-    'over-/under-spending',
-    'over-12',
-    'over-12s',
-    'over-14',
-    'over-14s',
-    'over-18',
-    'over-21',
-    'over-26',
-    'over-60',
-    'over-80s.',
-    'over-85',
-    'over-85-year-olds',
     'over-85s',
-    'over-abrasive',
-    'over-absorbed',
-    'over-abstract',
-    'over-abstractions',
-    'over-abundant',
-    'over-accustomed',
-    'over-achieve',
-    'over-achiever',
-    'over-achieving',
-    'over-acted',
-    'over-action',
-    'over-adjusted',
-    'over-administration',
-    'over-adventurous',
-    'over-aggressive',
     'over-aggressiveness',
-    'over-aller',
-    'over-allocation',
-    'over-allocations',
-    'over-alls',
-    'over-altruism',
-    'over-ambitions',
-    'over-anaesthetised',
-    'over-analysing',
-    'over-and-under',
-    'over-another',
-    'over-anticipate',
-    'over-anxiously',
-    'over-applied',
-    'over-apply',
-    'over-appreciation',
     'over-apprehension',
-    'over-approbation',
-    'over-aroused',
-    'over-arranged',
-    'over-as',
-    'over-asserting',
-    'over-assertive',
-    'over-assertiveness',
-    'over-assisting',
-    'over-attached',
-    'over-attention',
-    'over-attentive',
-    'over-audacious',
-    'over-average',
-    'over-balances',
-    'over-bearingly',
     'over-beat',
-    'over-benefits',
-    'over-bleaching',
-    'over-blessed',
-    'over-boiled',
-    'over-bold',
-    'over-boldly',
-    'over-boldness',
-    'over-bombarded',
-    'over-booked',
-    'over-borrow',
-    'over-bound',
-    'over-breath',
-    'over-breathing',
-    'over-bred',
-    'over-bridge',
     'over-brimming',
-    'over-broked',
-    'over-browning',
-    'over-brusque',
-    'over-bundled',
-    'over-burdensome',
-    'over-bureaucratization',
-    'over-burgeoning',
-    'over-buy',
-    'over-buying',
-    'over-call',
-    'over-canvased',
-    'over-capitalised',
-    'over-capitalization',
-    'over-carbonated',
-    'over-carefully',
     'over-carpeted',
-    'over-cautioned',
-    'over-cautiously',
-    'over-celebrated',
-    'over-celebrating',
-    'over-censorious',
-    'over-centre',
-    'over-cerebral',
-    'over-challenged',
-    'over-charge',
-    'over-charging',
-    'over-chastisement',
-    'over-chatty',
-    'over-check',
-    'over-chill',
-    'over-chummy',
     'over-circuitous',
-    'over-clad',
-    'over-clarity',
-    'over-clear',
-    'over-close',
-    'over-clubbed',
-    'over-clubbing',
-    'over-clubs',
-    'over-clumsy',
-    'over-coat',
-    'over-coated',
-    'over-coating',
-    'over-coats',
-    'over-cohesive',
-    'over-cohesiveness',
-    'over-collateralization',
     'over-collectivized',
-    'over-coloured',
-    'over-commercialisation',
-    'over-compassionate',
-    'over-complexity',
-    'over-complication',
-    'over-concentrate',
-    'over-concentrating',
-    'over-conceptual',
-    'over-conditioning',
-    'over-congested',
-    'over-consideration',
-    'over-consolidated',
-    'over-consolidation',
-    'over-conspicuous',
-    'over-contentious',
     'over-contrast',
-    'over-contributions',
-    'over-controlled',
-    'over-cooks',
-    'over-cooling',
-    'over-cooperative',
-    'over-copied',
-    'over-correct',
-    'over-correction',
-    'over-cosy',
-    'over-count',
-    'over-criticism',
-    'over-daubed',
-    'over-decentralized',
-    'over-declamatory',
-    'over-decoration',
     'over-defined',
-    'over-definition',
-    'over-deliberate',
-    'over-delivered',
-    'over-densify',
-    'over-dependency',
-    'over-deployed',
-    'over-deployment',
-    'over-design',
-    'over-designed',
-    'over-determines',
-    'over-develop',
-    'over-developing',
-    'over-diagnosed',
-    'over-diagrammatic',
-    'over-disclosing',
     'over-disclosure',
-    'over-discount',
-    'over-distension',
-    'over-distortion',
-    'over-distributed',
-    'over-dogmatic',
-    'over-door',
-    'over-doses',
-    'over-dramatised',
-    'over-dramatizes',
-    'over-dramatizing',
-    'over-drawing',
-    'over-drawn',
-    'over-dress',
-    'over-dressing',
-    'over-drivers',
     'over-dry',
-    'over-drying',
-    'over-due',
-    'over-duplication',
-    'over-earnest',
-    'over-earnestly',
-    'over-ears',
-    'over-easy',
-    'over-eaters',
-    'over-eatin\'',
-    'over-edited',
-    'over-educate',
-    'over-efficient',
-    'over-effusive',
-    'over-eighties',
-    'over-eloquent',
     'over-embalmed',
-    'over-embalming',
-    'over-embellishment',
-    'over-embroidered',
-    'over-embroiders',
-    'over-emphases',
-    'over-emphasizes',
-    'over-emphasizing',
-    'over-emphatically',
-    'over-employing',
-    'over-energetic',
-    'over-energized',
-    'over-engage',
-    'over-enriched',
-    'over-enthusing',
-    'over-exaggerating',
     'over-excitability',
-    'over-exciting',
-    'over-exercise',
-    'over-exercised',
-    'over-exerted',
-    'over-exhausted',
-    'over-exhaustion',
-    'over-exhuberance',
-    'over-expand',
-    'over-expansive',
-    'over-explicit',
-    'over-exploitive',
-    'over-expose',
-    'over-expressed',
-    'over-extends',
-    'over-extensions',
     'over-extreme',
-    'over-fashionable',
-    'over-fastidiousness',
-    'over-fatigue',
-    'over-fatness',
-    'over-featured',
-    'over-fertilise',
-    'over-fill',
-    'over-fills',
-    'over-filmed',
-    'over-fine',
-    'over-fitness',
-    'over-fitted',
-    'over-fives',
-    'over-flattering',
-    'over-fleshed',
     'over-flourished',
-    'over-flowed',
-    'over-flying',
-    'over-focusing',
-    'over-fondness',
-    'over-forcibly',
-    'over-formulaic',
-    'over-fragmentation',
-    'over-frequent',
-    'over-fresh',
-    'over-gearing',
-    'over-general',
-    'over-generalises',
-    'over-generalization',
-    'over-generalizing',
-    'over-generated',
     'over-generation',
-    'over-generously',
-    'over-gentle',
-    'over-gown',
-    'over-granulating',
-    'over-greasy',
-    'over-green',
-    'over-groomed',
-    'over-grow',
-    'over-growing',
-    'over-hand',
-    'over-handling',
-    'over-harsh',
-    'over-harvested',
-    'over-haul',
-    'over-hearing',
     'over-heavily',
-    'over-hedged',
-    'over-hype',
-    'over-i',
-    'over-ideologisation',
-    'over-imagination',
-    'over-imbibed',
-    'over-impress',
-    'over-impulsive',
-    'over-in-love',
-    'over-indebted',
-    'over-indebtedness',
-    'over-index',
-    'over-indexation',
-    'over-indexed',
-    'over-indexing',
     'over-industrialised',
-    'over-inflammable',
-    'over-inflation',
-    'over-influence',
-    'over-inquisitive',
-    'over-insisted',
-    'over-insistence',
-    'over-insistent',
-    'over-institutional',
-    'over-insurable',
-    'over-integrating',
-    'over-intellectual',
-    'over-intense',
-    'over-intensive',
-    'over-interested',
-    'over-interfere',
     'over-interpretation',
-    'over-interpreted',
-    'over-interprets',
-    'over-intrusive',
-    'over-invention',
-    'over-invoice',
-    'over-invoicing',
-    'over-irritable',
-    'over-issued',
-    'over-judicial',
-    'over-kind',
-    'over-kind-hearted',
-    'over-kindly',
-    'over-knead',
-    'over-knee',
-    'over-laden',
     'over-lapped',
-    'over-layered',
-    'over-leaning',
-    'over-legislating',
-    'over-leisurely',
-    'over-leveraging',
-    'over-liberal',
-    'over-liberalism',
-    'over-liberalization',
-    'over-life-sized',
-    'over-light',
-    'over-lightly',
-    'over-literalness',
-    'over-liveried',
-    'over-load',
-    'over-loading',
     'over-logical',
-    'over-lords',
-    'over-lordship',
-    'over-loudly',
-    'over-loyal',
-    'over-lunch',
-    'over-luxuriant',
-    'over-makes',
-    'over-managed',
-    'over-mannered',
-    'over-many',
-    'over-mapping',
-    'over-marked',
-    'over-mascara',
-    'over-match',
-    'over-matey',
     'over-maturity',
-    'over-mauled',
-    'over-maximization',
-    'over-metallised',
-    'over-meticulousness',
-    'over-mineralization',
-    'over-modelled',
-    'over-modulated',
-    'over-morphinisation',
-    'over-naive',
-    'over-naively',
-    'over-negative',
-    'over-nor',
-    'over-obsequious',
-    'over-obsessed',
-    'over-obsession',
     'over-occupies',
-    'over-officered',
-    'over-officiousness',
-    'over-oil',
-    'over-ordered',
-    'over-ordering',
-    'over-orderly',
-    'over-organising',
-    'over-ornate.',
-    'over-packaged',
-    'over-packaging',
-    'over-packed',
-    'over-painting',
-    'over-pampered',
-    'over-pan-fried',
-    'over-parameterised',
     'over-passes',
-    'over-paternalized',
-    'over-pedalled',
-    'over-perfectly',
-    'over-permissive',
-    'over-persistent',
-    'over-personal',
-    'over-persuaded',
-    'over-persuading',
-    'over-petted',
-    'over-physical',
-    'over-piety',
-    'over-pitched',
-    'over-planted',
-    'over-plush',
-    'over-polite/over-apologetic/over-subservient',
     'over-politicised',
-    'over-pompous',
-    'over-ponderously',
-    'over-popular',
-    'over-positive',
-    'over-pot',
-    'over-powdered',
-    'over-praising',
-    'over-precepted',
-    'over-precipitate',
-    'over-predation',
-    'over-predicts',
-    'over-preoccupation',
-    'over-preoccupied',
-    'over-preparation',
-    'over-prepared',
     'over-prescribed',
-    'over-prescribing',
-    'over-pressurized',
-    'over-pressurizing',
-    'over-prim',
-    'over-privileging',
-    'over-prized',
-    'over-process',
-    'over-processing',
-    'over-produce',
-    'over-professionalised',
-    'over-profitability',
-    'over-profitable',
-    'over-proliferation',
-    'over-pronators',
-    'over-prone',
     'over-proofed',
-    'over-prosperous',
-    'over-proud',
-    'over-provided-for',
-    'over-psychologization',
-    'over-pumping',
-    'over-pursuit',
-    'over-quantification',
-    'over-r-r-rl',
-    'over-racing',
-    'over-radical',
-    'over-rarefied',
-    'over-rationalistic',
-    'over-record',
-    'over-refined',
-    'over-refinement',
     'over-regarded',
-    'over-regularisation',
-    'over-regularize',
-    'over-regulatory',
-    'over-relaxed',
-    'over-reliable',
-    'over-religiosity',
-    'over-reporting',
-    'over-representative',
-    'over-reputable',
-    'over-rescued',
-    'over-resonantly',
-    'over-resourced',
-    'over-respectful',
-    'over-rested',
-    'over-restoration',
     'over-restored',
-    'over-restoring',
-    'over-restraining',
-    'over-retention',
-    'over-revved',
-    'over-rewarded',
-    'over-ribboned',
-    'over-ridingly',
-    'over-rim',
-    'over-ringing',
-    'over-risky',
-    'over-rivet',
-    'over-rolling',
-    'over-romantic',
-    'over-romanticise',
-    'over-romanticised',
     'over-romanticized',
-    'over-roofing',
-    'over-rouged',
-    'over-rudder',
-    'over-rugs',
-    'over-ruling',
-    'over-salinated',
-    'over-salting',
-    'over-sampled',
-    'over-sanctioned',
-    'over-sanguine',
-    'over-sanitised',
-    'over-sauced',
-    'over-saving',
-    'over-saw',
-    'over-scale',
     'over-scaled',
-    'over-scattered',
-    'over-schematic',
-    'over-scientific',
-    'over-scrawled',
-    'over-scripted',
-    'over-scrupulous',
-    'over-sea',
-    'over-secretive',
-    'over-selection',
-    'over-sensationalised',
-    'over-sensibility',
-    'over-sentencing',
-    'over-seventies',
-    'over-severe',
-    'over-sexiness',
     'over-shadow',
-    'over-sharing',
-    'over-shirt',
-    'over-shoulder-high',
-    'over-shrewd',
-    'over-sixty',
-    'over-sizing',
-    'over-slowly',
-    'over-smooth',
-    'over-snow',
-    'over-soaking',
-    'over-soaping',
-    'over-socialised',
-    'over-soft',
-    'over-softening',
-    'over-sold',
     'over-solicitousness',
-    'over-soon',
-    'over-specialisation',
-    'over-specialization',
-    'over-specialized',
-    'over-speeding',
-    'over-spendings',
-    'over-spiced',
-    'over-spiritualized',
-    'over-splendid',
-    'over-spraying',
-    'over-square',
-    'over-staffing',
-    'over-stamped',
-    'over-standardisation',
-    'over-stark',
     'over-states',
-    'over-stepped',
-    'over-stimulate',
-    'over-stimulating',
-    'over-stimulus',
-    'over-strain',
-    'over-strenuous',
-    'over-stretches',
-    'over-strict',
-    'over-stringent',
-    'over-structured',
-    'over-structuring',
-    'over-strung',
-    'over-study',
-    'over-stuffing',
-    'over-styled',
     'over-stylised',
-    'over-subjective',
-    'over-subsidise',
-    'over-supination',
-    'over-supplemented',
-    'over-support',
-    'over-suppression',
-    'over-suspension',
-    'over-swaddled',
-    'over-sweet-anemone',
-    'over-sweetness',
-    'over-swing',
-    'over-swinging',
-    'over-sympathetically',
-    'over-systematic',
-    'over-tailored',
     'over-taking',
-    'over-talking',
-    'over-taxation',
-    'over-technical',
-    'over-tensed',
-    'over-that',
-    'over-the-air',
-    'over-the-benny-hill',
-    'over-the-calf',
-    'over-the-desk',
-    'over-the-glasses',
-    'over-the-horizon',
-    'over-the-moon',
-    'over-the-neck',
-    'over-the-phone',
-    'over-the-telephone',
     'over-the-topness',
-    'over-the-weekend',
-    'over-theoretical',
-    'over-thetop',
-    'over-thickening',
-    'over-thinning',
-    'over-threes',
-    'over-thrown',
-    'over-thrust',
-    'over-tidy',
-    'over-tipped',
-    'over-tipping',
-    'over-tiredness',
-    'over-titillated',
-    'over-tones',
-    'over-topping',
     'over-trading',
-    'over-trained',
-    'over-treatment',
-    'over-trebly',
-    'over-tried',
-    'over-trumped',
-    'over-trusting',
-    'over-turn',
-    'over-turning',
-    'over-twangy',
-    'over-uses',
-    'over-utilisation',
-    'over-varnished',
-    'over-venturesome',
-    'over-verbose',
-    'over-vigilance',
     'over-vigorously',
-    'over-violent',
-    'over-visible',
-    'over-washed',
-    'over-weak',
-    'over-wealthy',
-    'over-weening',
-    'over-weighted',
-    'over-willing',
-    'over-winters',
-    'over-work',
-    'over-wrap',
-    'over-wrapping',
-    'over-writing',
-    'over-wrote',
-    'over-yssel',
     'over-zealously',
-    'over-zealousness',
-    'over.estimate',
-    'over.popularity',
-    'over.qualified',
-    'over.selling',
-    'over/gloucester',
-    'over/student',
-    'over/underspend',
-    'over150',
-    'over_,_over_there',
-    'over_because',
-    'over_each',
-    'overa',
-    'overacidity',
-    'overact',
     'overacted',
-    'overactivate',
-    'overactivation',
-    'overacts',
-    'overadorned',
-    'overaged',
-    'overall&mdash;but',
-    'overall-activity',
-    'overall-that',
-    'overall/apron',
-    'overamplified',
-    'overanxiety',
-    'overapologetic',
-    'overarticulate',
-    'overate',
-    'overath',
     'overattentive',
-    'overawes',
-    'overawing',
-    'overbanked',
-    'overbar',
-    'overbears',
-    'overbecks',
-    'overbelieve',
-    'overbend',
-    'overbidders',
-    'overbig',
-    'overbleeding',
-    'overboiled',
-    'overboiling',
-    'overbold',
-    'overbolting',
     'overborrowing',
-    'overbreak',
-    'overbreathed',
-    'overbreathing',
-    'overbrown',
-    'overbudget',
-    'overbuild',
-    'overbureaucratization',
-    'overbusy',
-    'overcalculates',
-    'overcall',
-    'overcalls',
-    'overcards',
-    'overcareful',
-    'overcarried',
-    'overcentralized',
     'overcharitable',
-    'overchurch',
-    'overclaimed',
-    'overcleaved',
-    'overcliff',
-    'overclothing',
-    'overco',
-    'overcoat-clad',
-    'overcollection',
-    'overcoloured',
-    'overcom',
-    'overcome-competing',
-    'overcompetent',
-    'overcomplex',
-    'overconcentrated',
-    'overconcerned',
     'overconfidently',
-    'overconscious',
-    'overconsiderate',
-    'overconsumptionism',
-    'overcontrol',
-    'overcontrolled',
-    'overcooling',
-    'overcorrect',
-    'overcowding',
-    'overcrapped',
-    'overcreative',
-    'overcritical',
-    'overcrowding.',
-    'overcultivation',
-    'overcumbersome',
-    'overcut',
     'overdeepened',
-    'overdeepening',
-    'overdefinition',
-    'overdependency',
-    'overdepth',
-    'overdetailed',
-    'overdetermine',
-    'overdevelopments',
-    'overdiagnosed',
-    'overdiagnosis',
-    'overdiscussed',
-    'overdraft*',
-    'overdramatic',
-    'overdramatise',
-    'overdramatising',
-    'overdramatize',
     'overdrawer',
-    'overdrawn.',
-    'overdrew',
-    'overdrink',
-    'overdrive/distortion',
-    'overdry',
-    'overdub',
-    'overdyed',
-    'overearnestness',
-    'overeats',
-    'overeducated',
-    'overemotionally',
-    'overemphatic',
-    'overemphatically',
-    'overenthusiasm',
-    'overequipped',
     'overetching',
-    'overevaluate',
-    'overexaggerated',
-    'overexcitable',
-    'overexcite',
-    'overexciting',
-    'overexercising',
-    'overexerting',
-    'overexpanded',
-    'overexpose',
-    'overexposition',
-    'overfall',
-    'overfeed/overstock',
-    'overfertilization',
-    'overfloor',
-    'overflooring',
     'overfloppy',
-    'overfloweth',
-    'overflowin\'',
-    'overforcing',
-    'overfriendly',
-    'overfrow',
-    'overfunded',
-    'overfurnished',
-    'overgarment',
-    'overgeneralisations',
-    'overgeneralise',
-    'overgeneralised',
-    'overgeneralises',
-    'overgeneralization',
-    'overgeneralizing',
-    'overgenerate',
     'overgo',
-    'overgovernability',
-    'overgrounds',
-    'overhall',
-    'overhanding',
-    'overhandle',
-    'overhang&rehy;ing',
-    'overhang-capped',
-    'overhard',
-    'overharsh',
-    'overhatted',
-    'overhaused',
-    'overhead-camshaft-per-cylinder-bank',
-    'overhead-line',
-    'overhead-projector',
-    'overhead-scrolling',
     'overheads.',
-    'overheards',
-    'overhereoverthere',
-    'overhot',
-    'overhunting',
-    'overhydration',
-    'overian',
-    'overidentification',
-    'overiding',
-    'overimpressed',
-    'overindividuated',
-    'overindulge',
-    'overinflating',
-    'overinflation',
-    'overinfluenced',
-    'overinformed',
     'overinsterpretation',
-    'overintellectualize',
-    'overinterpreted',
-    'overinvesting',
-    'overinvestment',
-    'overissuing',
-    'overjacket',
-    'overjackets',
-    'overkeen',
-    'overkind',
-    'overlanders',
-    'overlay-stroke-emblem',
-    'overlayed',
-    'overlayered',
-    'overlayering',
-    'overleaf-mentioned',
     'overleap',
-    'overleaped',
-    'overleigh',
-    'overlending',
-    'overlighting',
-    'overline',
-    'overlocking',
-    'overloking',
-    'overlooked.',
-    'overloooking',
-    'overloud',
-    'overlowed',
-    'overloyal',
-    'overly-concerned',
-    'overly-didactic',
-    'overly-effective',
     'overly-loud',
-    'overly-protective',
-    'overly-sensitive',
-    'overmagnanimous',
-    'overmanaged',
-    'overmanaging',
-    'overmantel.',
-    'overmantels',
-    'overmark',
-    'overmarking',
-    'overmars',
-    'overmatter',
-    'overmechanized',
-    'overmedicating',
-    'overmitts',
-    'overmonolithic',
     'overmorphinisation',
-    'overmouth',
-    'overni',
-    'overnight.',
-    'overnight/weekend',
-    'overnighted',
-    'overnighter',
-    'overnighters',
-    'overnighting',
-    'overnourished-looking',
-    'overoptimistically',
-    'overpage',
-    'overpark',
-    'overpasses',
-    'overpast',
-    'overpayed',
     'overperformance',
-    'overperformed',
-    'overpersonalised',
-    'overpitched.',
-    'overplant',
-    'overplayed\'',
-    'overplayful',
-    'overplays',
-    'overpleased',
-    'overplotted',
-    'overploughing',
-    'overpo&rehy;pulated',
-    'overpoliticised',
-    'overpollute',
-    'overpopular',
-    'overpopulating',
     'overport',
-    'overpow',
-    'overpowdered',
-    'overpraises',
-    'overpraising',
-    'overprecise',
-    'overpressure',
-    'overprice',
-    'overprices',
-    'overpriecd',
-    'overprints',
-    'overprocessed',
-    'overprocessing',
-    'overproduce',
-    'overproducers',
-    'overproduces',
     'overpronator',
-    'overpronators',
-    'overproof',
-    'overprotected',
-    'overprove',
-    'overpubbed',
-    'overrates',
-    'overreaches',
-    'overreacts',
-    'overrecorded',
-    'overregularizations',
-    'overregulated',
-    'overrepresents',
-    'overreverent',
-    'overreverential',
-    'overridings',
     'overruler',
-    'overs-a-day',
-    'overs-a-side',
-    'overs=a',
-    'oversail',
-    'oversailed',
-    'oversalting',
-    'oversampled',
-    'overscored',
-    'overscores',
-    'overscripted',
-    'overscrupulous',
-    'overscrupulousness',
-    'overscrutinised',
-    'overseas-based',
-    'overseas-darkie-star',
     'overseas-player',
-    'overseas/european',
-    'oversecretion',
-    'overserious',
-    'oversh',
-    'overshaded',
-    'oversharpened',
-    'oversheeted',
-    'overshipments',
-    'overshoe',
-    'overshopped',
-    'overshortness',
-    'overside',
-    'oversighted',
-    'overskin',
-    'oversleepers',
     'oversleeps',
-    'oversophisticated',
-    'overspaciousness',
-    'overspeaking',
-    'overspecialized',
-    'overspecify',
-    'overspeculated',
-    'overspend.',
-    'overspills',
-    'overspraying',
-    'overstaff',
-    'overstamp',
-    'oversteepening',
-    'oversteer.',
-    'overstepping/onlapping',
-    'overstocks',
     'overstressed.',
-    'overstrict',
-    'overstruck',
-    'overstructure',
-    'overstuffing',
-    'oversubsidised',
-    'oversupinator',
-    'oversupinators',
-    'oversweetness',
-    'overswill',
-    'overswinging',
-    'oversympathise',
-    'oversystematising',
-    'overt\'',
-    'overtakin\'',
-    'overtaking.',
     'overtalkativeness',
-    'overtank',
-    'overtaxes',
-    'overteaching',
-    'overthickened',
-    'overthorpe',
-    'overthrow.',
-    'overthrow/glazier',
-    'overthrown.',
-    'overtight',
-    'overtime.',
-    'overtiredness',
-    'overton-on-dee',
-    'overtowering',
-    'overtreat',
-    'overtrick',
     'overtunic',
-    'overture\'',
-    'overturneth',
-    'overurbanisation',
-    'overvaluations',
-    'overview-discovering',
-    'overviewed',
-    'overvoltage',
-    'overwarm',
-    'overwart',
-    'overwash',
-    'overwatch',
-    'overwatches',
-    'overweaning',
-    'overweighs',
-    'overwetting',
     'overwhelm&rehy;ing',
-    'overwhelmed&mdash;send',
-    'overwhelmimg',
-    'overwhelmin',
-    'overwhelming-sexual-urges',
-    'overwhelminly',
-    'overwhelmned',
-    'overwhite',
-    'overwilling',
-    'overwind',
-    'overworkers',
-    'overworks',
-    'overworlding',
-    'overwrapped',
-    'overwrapping',
-    'overzealously',
     'overzealousness',
-    'ovesissi',
-    'ovette',
-    'ovetts',
-    'ovewhelming',
-    'ovewr',
-    'oviatt',
-    'oviatt-ham/spastics',
-    'ovicide',
-    'ovidian',
-    'ovidiu',
-    'oviferae',
-    'oviform',
-    'ovillers',
-    'ovini',
-    'ovinity',
     'oviposit',
-    'oviposited',
-    'ovipositing',
-    'oviscapt',
-    'ovisco',
-    'ovitkov',
-    'ovits',
-    'ovlyakuli',
-    'ovoca',
-    'ovoids',
-    'ovomaltine',
-    'ovonrramwen',
-    'ovoyaykov',
-    'ovrenewton',
-    'ovtchinnikov',
-    'ovular',
     'ovulates',
-    'ovulatory',
-    'ovulum',
-    'ovva',
-    'ow-ri-ku-lar-ta',
-    'ow-w-w',
-    'owais',
-    'owal-ow',
-    'oway',
-    'owed.',
-    'owen-smith',
-    'owen-smith/oxfordshire',
-    'owen/head',
-    'owen/wildfowl',
-    'owens-ish',
-    'owens-style',
     'owens/general',
-    'owens/reporting',
-    'owerri',
-    'owever',
-    'owi',
-    'owin\'',
-    'owinyi',
-    'owk-owk-owk',
-    'owl\'',
-    'owl\'-like',
-    'owl-and-lark',
-    'owl-call',
-    'owl-gut',
-    'owl-headed',
-    'owl-hole',
-    'owl-holes',
     'owl-hoot',
-    'owl-hooting',
-    'owl-in-exile',
-    'owl-pellets',
-    'owl-ring',
-    'owl-season',
-    'owl-sized',
-    'owl-vision',
-    'owld',
-    'owled',
-    'owletts',
-    'owling',
-    'owlness',
-    'owloholic',
-    'owlsace',
-    'owlsmoor',
     'owlstone',
-    'owmen',
-    'own&rehy;goal',
-    'own-account',
-    'own-chances',
-    'own-country',
-    'own-design',
-    'own-door',
-    'own-especially',
-    'own-fairbrother',
-    'own-name',
-    'own-yway',
-    'own.counterfeit',
-    'own/he',
-    'own/life',
-    'owned.',
     'owner&rehy;editor',
-    'owner&rehy;manager',
-    'owner&rehy;occupation',
-    'owner&rehy;occupied',
-    'owner\'s/operator',
-    'owner-',
-    'owner-breeders',
-    'owner-dog',
-    'owner-driver.',
-    'owner-farmer',
-    'owner-manager',
-    'owner-members',
-    'owner-nations',
-    'owner-operator',
-    'owner-operators',
-    'owner-pilot',
     'owner-pilots',
-    'owner-skipper',
-    'owner-trainers',
-    'owner/developers',
-    'owner/director',
-    'owner/driver',
-    'owner/entrepreneur',
-    'owner/headmaster',
-    'owner/managing',
-    'owner/occupancy',
-    'owner/occupier/tenant',
-    'owner/operator',
-    'owner/pilot',
-    'owner:delete',
-    'ownerhip',
-    'owneroccupation',
     'owneroccupier',
-    'ownerriders',
-    'owners\'/managers',
-    'owners-they',
-    'owners.',
-    'owners/',
-    'owners/employers',
-    'owners/managers',
-    'owners/occupiers',
-    'ownership\'',
-    'ownership-of',
-    'ownershipmay',
-    'owning-up',
-    'ownio',
-    'ownself',
-    'ownsworth',
     'owny-oh',
-    'owps',
-    'owsin',
-    'owte',
-    'owtram',
-    'owusu',
-    'owusu-agyei',
-    'oww',
-    'owwwww',
-    'owzeeeyaaaah',
-    'ox&deg',
-    'ox&rehy;carts',
-    'ox&rehy;goads',
-    'ox-45',
-    'ox-blood',
-    'ox-bows',
     'ox-bridge',
-    'ox-driver',
-    'ox-farm',
-    'ox-feast',
-    'ox-head',
-    'ox-hide/hurdle',
-    'ox-walking',
-    'ox.bsa',
-    'ox6',
-    'oxa',
-    'oxa-1164',
-    'oxa-3214',
-    'oxa-3215',
-    'oxalates',
-    'oxaloacetic',
-    'oxapampa',
     'oxazine',
-    'oxberry',
-    'oxberry.',
-    'oxbode',
-    'oxborrow/student',
-    'oxbows',
-    'oxcart',
-    'oxcarts',
-    'oxed',
-    'oxel&ouml;sund',
-    'oxen-drawn',
-    'oxen-width',
-    'oxenbrege',
-    'oxenden',
-    'oxenfoord',
-    'oxenforde',
     'oxenham',
-    'oxenheath',
-    'oxenhlome',
-    'oxenhope-carlisle',
-    'oxeotope',
-    'oxf',
-    'oxfam-backed',
-    'oxfam-reject',
-    'oxfohhd',
-    'oxford-',
-    'oxford-accented',
-    'oxford-and-cambridge',
-    'oxford-arels',
-    'oxford-bicester',
-    'oxford-cambridge',
-    'oxford-cradley',
     'oxford-london',
-    'oxford-style',
-    'oxford-trained',
-    'oxford-york',
-    'oxford.in',
-    'oxford.it',
-    'oxford.just',
-    'oxford/leeds',
-    'oxford/rook',
-    'oxford/university',
-    'oxford/woodstock',
-    'oxfordshire.ian',
-    'oxfordshsire',
-    'oxforf',
-    'oxforsshire',
-    'oxheart',
     'oxhide',
-    'oxi',
-    'oxicam',
-    'oxidated',
-    'oxidation-reduction',
-    'oxidations',
-    'oxide-fuel',
-    'oxide-that',
-    'oxide/zinc',
-    'oxidization',
-    'oxlade',
-    'oxley-kingswinsford',
-    'oxlynch',
-    'oxmantown',
-    'oxnageo',
-    'oxney',
     'oxo\'s.',
-    'oxoanion',
-    'oxonians',
-    'oxoniensia',
-    'oxoniensis',
-    'oxoniensium',
-    'oxpasture',
-    'oxpeckers',
-    'oxpentifylline',
-    'oxshott',
-    'oxspring',
-    'oxtails',
-    'oxterguff',
-    'oxton-based',
-    'oxw',
-    'oxxtrained',
     'oxy-content',
-    'oxy-hemocyanin',
-    'oxy-hydrogen',
-    'oxy-nitride',
-    'oxy.',
-    'oxybelus',
-    'oxychilus',
-    'oxyfilter',
-    'oxyfluoride',
-    'oxyfluorides',
-    'oxygem',
-    'oxygen-17',
-    'oxygen-18',
-    'oxygen-based',
-    'oxygen-bearing',
-    'oxygen-binding',
     'oxygen-breathing',
-    'oxygen-concentration',
-    'oxygen-hating',
-    'oxygen-intake',
-    'oxygen-loving',
-    'oxygen-making',
-    'oxygen-mediating',
-    'oxygen-oriented',
-    'oxygen-producing',
-    'oxygen-starved',
-    'oxygen/air',
-    'oxygen/carbon',
-    'oxygenates',
-    'oxygenator',
-    'oxygene\'-style',
-    'oxygenic',
     'oxyinoronic',
-    'oxyntomodulin',
-    'oxypetalum',
-    'oxyradical',
-    'oxyrhynchos',
-    'oxyrynchus',
-    'oxystegus',
-    'oxytetracyclin',
-    'oxytricha',
-    'oxyuris',
-    'oy-als',
-    'oy-gevalts',
-    'oy-oy',
-    'oy-oy-oy',
-    'oy-oys',
-    'oyarzun',
     'oyash',
-    'oydovyn',
-    'oyelowo',
-    'oyhanarte',
-    'oyigoua',
-    'oyigouwafinance',
-    'oyite-ojok',
-    'oykle',
-    'oyonnax',
-    'oyono-aba\'a',
-    'oyovbaire',
-    'oyr.',
-    'oys',
-    'oysley',
-    'oysten',
-    'oyster-beds',
     'oyster-catcher',
-    'oyster-coloured',
-    'oyster-doubter',
-    'oyster-dredgers',
-    'oyster-fishing',
-    'oyster-like',
-    'oyster-pink',
-    'oyster-shells',
-    'oystercatcher-like',
-    'oysterloan',
-    'oystershell',
-    'oysth',
-    'oyus',
-    'oyvind',
-    'oyw',
-    'oz.gruy&egrave;re',
     'oz/1&amp',
-    'oz/100ml',
-    'oz/102ml',
-    'oz/125m',
-    'oz/180g',
-    'oz/227g',
-    'oz/28g',
-    'oz/350ml',
-    'oz/35g',
-    'oz/400ml',
-    'oz/5',
-    'oz/600ml',
-    'oz/yd',
-    'oz13',
-    'oz17',
-    'oz18',
     'oz22',
-    'oz23',
-    'ozalid',
-    'ozalland',
-    'ozals',
-    'ozarks',
-    'ozarslan',
-    'ozato',
-    'ozbourne',
-    'ozd',
-    'ozean',
-    'ozeanien',
-    'ozeanographie',
-    'ozenfant',
-    'ozerkow',
-    'ozgur',
     'ozherelev',
-    'ozi',
-    'ozite',
-    'ozleworth',
-    'ozois',
-    'ozolas',
-    'ozoloins',
-    'ozonation',
-    'ozone-',
-    'ozone-damaged',
-    'ozone-degrading',
-    'ozone-depleter',
-    'ozone-destroyer',
-    'ozone-forming',
-    'ozone-gobbling',
-    'ozone-harming',
     'ozone-hole',
-    'ozone-layer',
-    'ozone-negotiations',
-    'ozone-poor',
-    'ozone-sage',
-    'ozone-xxxx',
-    'ozonefriendly',
-    'ozones',
-    'ozonesonde',
-    'ozoniser',
-    'ozun',
-    'ozymandian',
-    'ozyrev',
-    'ozzer',
-    'ozzers',
-    'ozzi',
     'ozzies',
-    'p%-1',
-    'p%-2',
-    'p&aacute;ez',
-    'p&aacute;gina/12',
-    'p&aacute;le&nacute;i&ccaron;ek\'s',
-    'p&aacute;los',
-    'p&aacute;nek',
-    'p&aacute;ramos',
-    'p&aacute;rnes',
-    'p&abreve;th',
-    'p&acirc;r',
-    'p&acirc;t&check;e',
-    'p&acirc;t&eacute;es',
-    'p&acirc;tis',
-    'p&acirc;tisseries',
     'p&acirc;tissier',
-    'p&amp;d',
-    'p&amp;hs',
-    'p&amp;o/bi',
-    'p&amp;t',
-    'p&atilde;o-por-deus',
-    'p&auml&auml;t&ouml;s',
-    'p&auml;dagogium',
-    'p&auml;te1',
-    'p&eacute;age',
-    'p&eacute;cuc&eacute;t',
-    'p&eacute;cule',
-    'p&eacute;digr&eacute;e',
-    'p&eacute;guy',
-    'p&eacute;lerinage',
-    'p&eacute;lissier',
     'p&eacute;ll&eacute;as',
-    'p&eacute;n&eacute;lope',
-    'p&eacute;n&eacute;trer',
-    'p&eacute;pin',
-    'p&eacute;r&eacute;z',
-    'p&eacute;richole',
-    'p&eacute;rigordian',
-    'p&eacute;rigordine',
-    'p&eacute;rim&eacute;es',
-    'p&eacute;riode',
-    'p&eacute;riph&eacute;rique',
-    'p&eacute;rotin',
-    'p&eacute;t&eacute',
-    'p&eacute;tainist',
-    'p&eacute;tains',
-    'p&eacute;tanque',
     'p&eacute;tion-ville',
-    'p&eacute;trarque',
-    'p&eacute;trobras',
-    'p&eacute;tursd&ouml;ttir',
-    'p&eacute;w&eacute',
-    'p&ecirc;che',
-    'p&ecirc;le-m&ecirc;le',
-    'p&egrave;dre',
-    'p&egrave;gra',
-    'p&egrave;gue',
-    'p&egrave;lerin',
-    'p&egrave;rigord',
-    'p&equals;0.0000',
-    'p&ge;0.005',
-    'p&gt;0.005',
-    'p&gt;0.10',
     'p&gt;0.2',
-    'p&gt;0.25',
-    'p&gt;0.3',
-    'p&gt;0.4',
-    'p&le;0.001',
-    'p&lsqb;almerston&rsqb',
-    'p&lsqb;arish&rsqb',
-    'p&lsqb;assengers&rsqb',
-    'p&lsqb;laying',
-    'p&lsqb;resident',
-    'p&lsqb;riest&rsqb',
-    'p&lt',
-    'p&lt;-10.05',
-    'p&lt;0.00&ndash;1',
-    'p&lt;0.000001',
-    'p&lt;0.0005',
     'p&lt;0.006',
-    'p&lt;0.008',
-    'p&lt;0.009',
-    'p&lt;0.01%',
-    'p&lt;0.010',
-    'p&lt;0.029',
-    'p&lt;0.046',
-    'p&lt;0.08',
-    'p&lt;0.25',
-    'p&lt;0.5',
-    'p&lt;0.75',
-    'p&lt=0.05',
-    'p&ndash;3',
-    'p&ndash;36s',
-    'p&ndash;38j',
-    'p&ndash;39/p&ndash;63',
     'p&ndash;39s',
-    'p&ndash;40e',
-    'p&ndash;40es',
-    'p&ndash;47',
-    'p&ndash;5',
-    'p&ndash;51h',
-    'p&ndash;59b&ndash;1&ndash;be',
-    'p&ndash;59s',
-    'p&ndash;63',
-    'p&ndash;63a',
-    'p&oacute;lya',
-    'p&oacute;rr',
-    'p&ocirc;le',
-    'p&ograve;hl',
-    'p&ouml;tting',
-    'p&pound',
     'p&pound;150',
-    'p&pound;300',
-    'p&pound;35',
-    'p&pound;4,000',
-    'p&pound;40',
-    'p&pound;400',
-    'p&pound;4000',
-    'p&pound;480',
-    'p&pound;6250',
-    'p&pound;control',
-    'p&rcaron;ehorovsk&yacute',
-    'p&times;q',
-    'p&uacute;r',
-    'p&ucirc;kel-men',
-    'p&uuml;ckler',
-    'p&uuml;nder',
     'p\'.',
-    'p\'ao',
-    'p\'connor',
-    'p\'daytaism',
-    'p\'eng',
-    'p\'int',
-    'p\'ip\'a',
-    'p\'jalst',
-    'p\'s.',
-    'p\'t',
-    'p\'vestrannyoi',
-    'p\'weet',
-    'p(&pgr)',
-    'p(16)',
-    'p(8)',
-    'p(a)=0.68',
     'p(a)=0.75',
-    'p(assuum)',
-    'p(c)',
-    'p(fr1)jp-i',
-    'p(genotype/disease)',
-    'p(hb3)',
-    'p(k)',
-    'p(l)',
-    'p(q)',
-    'p(r)',
-    'p(ublica)',
-    'p(w)',
-    'p(y)',
-    'p***',
-    'p*****',
-    'p***y',
     'p**t',
-    'p-&ggr;-atp',
-    'p-----',
-    'p-10',
-    'p-1067',
-    'p-177',
-    'p-1q',
-    'p-2250',
-    'p-26&mdash;which',
-    'p-312',
-    'p-35',
-    'p-39',
-    'p-3c',
-    'p-40e',
-    'p-450iiia',
-    'p-47s',
     'p-490',
-    'p-5\'',
-    'p-63',
-    'p-63cs',
-    'p-63e',
-    'p-7',
-    'p-a-r-e-n-t-s',
-    'p-adic',
-    'p-b',
-    'p-basses',
-    'p-bridge',
-    'p-celtic',
-    'p-component',
-    'p-creb',
-    'p-datp',
-    'p-dcb',
     'p-dctp.',
-    'p-e-i',
-    'p-e-iii',
-    'p-ers',
-    'p-f',
-    'p-face',
-    'p-factor',
-    'p-fimbriated',
-    'p-glycoprotein',
-    'p-i-n',
-    'p-i-t-c-h-l',
-    'p-j',
-    'p-labeling',
-    'p-labelling',
-    'p-level',
-    'p-loop',
     'p-m.',
-    'p-methoxyphenyl',
-    'p-nitrophenyl-phosphate',
-    'p-o-p-c-o-r-n',
-    'p-orbital',
-    'p-orbitals',
-    'p-p-p-ower',
-    'p-p-p-poor',
-    'p-p-part',
-    'p-p-perfect',
-    'p-p-pick',
-    'p-p-plaits',
-    'p-p-please',
-    'p-p-plummeted',
-    'p-p-prove',
-    'p-people',
     'p-peter',
-    'p-phenylene',
-    'p-pictures',
-    'p-plant',
-    'p-plate',
-    'p-politics',
-    'p-polly',
-    'p-polo',
-    'p-posted',
-    'p-powers',
-    'p-promised',
-    'p-propose',
-    'p-put',
-    'p-r-o-g-r-a-m-m-e-d',
-    'p-receptor',
-    'p-reincubation',
     'p-selectins',
-    'p-style',
-    'p-t',
-    'p-t-c',
-    'p-t-t',
-    'p-tex',
-    'p-u',
-    'p-x',
-    'p.&num',
-    'p.-b',
-    'p.-b.',
-    'p.101',
-    'p.105',
-    'p.107',
-    'p.108',
-    'p.1098',
     'p.110',
-    'p.113',
-    'p.113,1.19',
-    'p.115',
-    'p.116',
-    'p.118',
-    'p.120',
-    'p.1216',
-    'p.1218',
-    'p.129',
-    'p.131',
-    'p.131ff',
-    'p.135',
-    'p.1356',
-    'p.141',
-    'p.146',
     'p.147',
-    'p.148',
-    'p.153',
-    'p.154',
-    'p.155',
-    'p.159',
-    'p.160',
-    'p.167',
-    'p.169',
-    'p.171',
-    'p.172a',
-    'p.179',
-    'p.180&ndash;181',
-    'p.182',
-    'p.183',
-    'p.188',
     'p.1906',
-    'p.197',
-    'p.199',
-    'p.200',
-    'p.200&ndash;201',
-    'p.204',
-    'p.209',
-    'p.212',
-    'p.215',
-    'p.218&ndash;219',
-    'p.220',
-    'p.222',
-    'p.228',
-    'p.230',
-    'p.231',
-    'p.233',
     'p.239',
-    'p.247',
-    'p.248',
-    'p.251',
-    'p.256',
-    'p.260',
-    'p.261',
-    'p.263',
-    'p.264',
-    'p.266',
-    'p.268',
-    'p.269',
-    'p.273',
-    'p.274',
-    'p.280',
-    'p.281',
     'p.283',
-    'p.291',
-    'p.293',
-    'p.297',
-    'p.299',
-    'p.2d.',
-    'p.3&ndash;4',
-    'p.3.8',
-    'p.300',
-    'p.301',
-    'p.305',
-    'p.308',
-    'p.311',
-    'p.320',
-    'p.324',
-    'p.325',
     'p.326',
-    'p.33010',
-    'p.331',
-    'p.332',
-    'p.333',
-    'p.33401',
-    'p.33533',
-    'p.338',
-    'p.339',
-    'p.3436',
-    'p.3439',
-    'p.345',
-    'p.357',
-    'p.359',
-    'p.361',
-    'p.362',
     'p.363',
-    'p.36613',
-    'p.36779',
-    'p.37245',
-    'p.37309',
-    'p.37549',
-    'p.37592',
-    'p.376',
-    'p.37639-40',
-    'p.37652',
-    'p.37708',
-    'p.378',
-    'p.37859',
-    'p.380',
-    'p.38156',
-    'p.38214',
     'p.38344',
-    'p.386',
-    'p.388',
-    'p.395',
-    'p.4.',
-    'p.400',
-    'p.40s',
-    'p.420',
-    'p.424',
-    'p.425',
-    'p.434',
-    'p.440',
-    'p.442',
-    'p.443',
-    'p.444',
-    'p.446',
     'p.447',
-    'p.448',
-    'p.453',
-    'p.458',
-    'p.459',
-    'p.471',
-    'p.483',
-    'p.486',
-    'p.487',
-    'p.494',
-    'p.498',
-    'p.503',
-    'p.505',
-    'p.511',
-    'p.515',
-    'p.523',
     'p.532',
-    'p.537',
-    'p.543',
-    'p.550',
-    'p.552',
-    'p.554',
-    'p.563',
-    'p.571',
-    'p.573',
-    'p.577',
-    'p.612',
-    'p.63,64',
-    'p.657',
-    'p.669',
-    'p.687',
-    'p.696',
     'p.697',
-    'p.706',
-    'p.709',
-    'p.711',
-    'p.715',
-    'p.726',
-    'p.732',
-    'p.750',
-    'p.802',
-    'p.818',
-    'p.819',
-    'p.826',
-    'p.834',
-    'p.848',
-    'p.850',
-    'p.89ff',
     'p.92',
-    'p.923',
-    'p.94',
-    'p.949',
-    'p.959',
-    'p.a.d',
-    'p.a.s.s.i.o.n.',
-    'p.a.t',
-    'p.a.y.e.',
-    'p.b.o\'meara',
-    'p.c.\'',
-    'p.c.s.',
-    'p.carringtonii',
-    'p.clxviii',
-    'p.coronopus',
-    'p.cxxiii',
     'p.d.a.e.s.',
-    'p.d.j.',
-    'p.d.n.h.a.s.',
-    'p.d.s',
-    'p.e./music',
-    'p.e.g',
-    'p.e.g.',
-    'p.g.a.h.',
-    'p.g.h',
-    'p.g.h.',
-    'p.g.s.',
-    'p.g.w.',
-    'p.gibbiceps',
-    'p.gordon',
-    'p.grant',
-    'p.h.d',
     'p.h.t.',
-    'p.head&frac12',
-    'p.i.v',
-    'p.i.v.',
-    'p.j.a.',
-    'p.j.b.',
-    'p.j.h.',
-    'p.j.s.',
-    'p.l.g.bateman',
-    'p.l.jordan',
-    'p.l.n.',
-    'p.l.r.',
-    'p.l5',
-    'p.l68',
-    'p.lawn',
-    'p.little',
     'p.lviii',
-    'p.m.4',
-    'p.m.b.',
-    'p.m.company',
-    'p.m.on',
-    'p.m.or',
-    'p.m.pratt',
-    'p.m.s.',
-    'p.maritima',
-    'p.mm.',
-    'p.n.g.',
-    'p.newbould',
-    'p.o.d.',
-    'p.o.s',
-    'p.o.w.n.',
-    'p.p',
     'p.p.b.v',
-    'p.p.h.f.c.',
-    'p.p.l.tam',
-    'p.p.p.s',
-    'p.p.p.s.',
-    'p.q.',
-    'p.ramirezi',
-    'p.roberts',
-    'p.s.i.a.',
-    'p.s.o.',
-    'p.s.r.',
-    'p.s.u.',
-    'p.stott',
-    'p.t.f.e.',
-    'p.t.o',
-    'p.t.o.',
     'p.t.s.d',
-    'p.thank',
-    'p.u.',
-    'p.u.m.p.',
-    'p.v',
-    'p.v.c',
-    'p.vermiculata',
-    'p.vi',
-    'p.viii',
-    'p.vittata',
-    'p.w.g.',
-    'p.x',
-    'p.xxii',
-    'p.xxx',
-    'p.y.',
-    'p/20/116',
     'p/20/14',
-    'p/20/16',
-    'p/20/50',
-    'p/20/52',
-    'p/20/58',
-    'p/35/23',
-    'p/36/01',
-    'p/36/21',
-    'p/6&ndash;1',
-    'p/91/414',
-    'p/a',
-    'p/g',
-    'p/j',
-    'p/os',
-    'p/ppa/ld/246',
-    'p/q',
     'p/rt',
-    'p/s/b',
-    'p/x',
-    'p0',
-    'p0&middot;125',
-    'p0&middot;25',
-    'p0&middot;5',
-    'p0&middot;75',
-    'p0&middot;875',
-    'p0.005',
-    'p0.10',
-    'p0.125',
-    'p0.2',
-    'p0.25',
-    'p0.5',
-    'p0.75',
     'p0.875',
-    'p07',
-    'p1&ndash;3',
-    'p1*/lp1',
-    'p1,000',
-    'p1,286',
-    'p1,357',
-    'p1-p5',
-    'p1-p9',
-    'p1.',
-    'p1/t7',
-    'p1/t8',
-    'p1/ti',
-    'p10.5',
-    'p101',
-    'p101/',
     'p102j',
-    'p104.',
-    'p107-associated',
-    'p107-drtf1/e2f',
-    'p108/',
-    'p109/',
-    'p109n',
-    'p10s',
-    'p11\'s',
-    'p11.2',
-    'p110',
-    'p111/',
-    'p112/',
-    'p1120',
-    'p1127',
-    'p113d',
     'p113s',
-    'p114b',
-    'p114x',
-    'p115l',
-    'p116x',
-    'p117i',
-    'p1184',
-    'p118i',
-    'p11ds',
-    'p11s',
-    'p12/',
-    'p120-gap',
-    'p121',
-    'p121i',
-    'p122',
-    'p122l',
     'p122n',
-    'p124',
-    'p124l',
-    'p126&ndash;22',
-    'p1267',
-    'p128',
-    'p1286',
-    'p13-152',
-    'p130',
-    'p132',
-    'p135',
-    'p1358',
-    'p138',
-    'p139',
-    'p13s',
-    'p140bt',
     'p143',
-    'p1431',
-    'p144/d6',
-    'p147',
-    'p149',
-    'p14s',
-    'p15(e)',
-    'p15/',
-    'p150',
-    'p150/95',
-    'p151',
-    'p154',
-    'p155',
-    'p157',
-    'p157e',
-    'p1585',
     'p16-17',
-    'p164',
-    'p165',
-    'p166',
-    'p1800',
-    'p183',
-    'p184',
-    'p189',
-    'p191',
-    'p192',
-    'p195',
-    'p1ab',
-    'p1ac',
-    'p1d6',
-    'p2(c)',
-    'p2,899',
     'p2-06',
-    'p20&ndash;22',
-    'p200',
-    'p2000',
-    'p206',
-    'p209',
-    'p213',
-    'p215',
-    'p216',
-    'p217',
-    'p218',
-    'p220.2',
-    'p220.2tc',
-    'p225,000,000',
-    'p226',
-    'p228.',
     'p23/',
-    'p231a',
-    'p238',
-    'p23ac',
-    'p23dd',
-    'p24/',
-    'p246',
-    'p247',
-    'p25\'s',
-    'p252',
-    'p26&ndash;27',
-    'p260',
-    'p262',
-    'p263',
-    'p2645',
-    'p2653',
     'p2700',
-    'p276',
-    'p280',
-    'p282,500,000',
-    'p285',
-    'p289',
-    'p294',
-    'p3,318',
-    'p3.x63',
-    'p3/ns-1/1-ag-4.1',
-    'p3/ns-1/1-ag.4',
-    'p3/x63.653',
-    'p30/',
-    'p304',
-    'p306',
-    'p308,400',
     'p309',
-    'p310kjmol',
-    'p314',
-    'p317',
-    'p334',
-    'p335',
-    'p337',
-    'p339',
-    'p3400',
-    'p345',
-    'p349',
-    'p3554',
-    'p36/',
-    'p3655',
-    'p37',
-    'p37,700',
     'p37/',
-    'p370',
-    'p371',
-    'p372',
-    'p3733',
-    'p37333',
-    'p378',
-    'p37g&mdash;h',
-    'p38-39',
-    'p38/',
-    'p39-49',
-    'p394',
-    'p395',
-    'p3x63',
-    'p3x63/ag',
-    'p4/34',
     'p4/5',
-    'p40&ndash;42',
-    'p400ps',
-    'p405c',
-    'p4065',
-    'p408',
-    'p41&ndash;41',
-    'p413',
-    'p415',
-    'p419',
-    'p419,000,000',
-    'p42,100',
-    'p42/',
-    'p4232',
-    'p425',
-    'p426',
     'p430',
-    'p436',
-    'p44&ndash;54',
-    'p447',
-    'p449',
-    'p45/',
-    'p450iie1',
-    'p457',
-    'p457e',
-    'p464',
-    'p466icx',
-    'p466ii',
-    'p466is',
-    'p468a',
-    'p474(h)',
-    'p475',
     'p48&mdash;55',
-    'p483&mdash;4',
-    'p489',
-    'p49/',
-    'p494',
-    'p499',
-    'p49a',
-    'p4g9',
-    'p5-aka-pentium',
-    'p5-specific',
-    'p501',
-    'p523',
-    'p524',
-    'p529',
-    'p53/dcc',
-    'p531',
     'p54&ndash;55',
-    'p540',
-    'p541',
-    'p54c',
-    'p54cm',
-    'p55&ndash;20',
-    'p554&ndash;5',
-    'p555',
-    'p56&ndash;57',
-    'p56/',
-    'p565',
-    'p58-1',
-    'p58/',
-    'p591',
-    'p59a',
-    'p5rk',
     'p5rt',
-    'p6&ndash;32',
-    'p6/7',
-    'p6/p7',
-    'p6/t1',
-    'p60/',
-    'p600s',
-    'p601',
-    'p603',
-    'p61/',
-    'p611',
-    'p617',
-    'p621',
-    'p623',
-    'p627',
-    'p638',
     'p64&ndash;67',
-    'p641',
-    'p65/',
-    'p653',
-    'p653,000,000',
-    'p655',
-    'p661',
-    'p673',
-    'p675',
-    'p678-54',
-    'p68',
-    'p682',
-    'p684',
-    'p685',
-    'p687',
-    'p69/',
     'p699',
-    'p7\'',
-    'p7/s1',
-    'p70/',
-    'p701',
-    'p72/',
-    'p74',
-    'p744',
-    'p75&ndash;80',
-    'p751',
-    'p755',
-    'p75a',
-    'p76.',
-    'p769,000,000',
-    'p77&ndash;83',
-    'p793',
     'p796',
-    'p798',
-    'p7s',
-    'p80',
-    'p802',
-    'p8023',
-    'p809',
-    'p81',
-    'p81/',
-    'p813',
-    'p814',
-    'p818990',
-    'p824',
-    'p83',
-    'p830a-b',
-    'p846b',
     'p849',
-    'p85',
-    'p851',
-    'p86&ndash;93',
-    'p873',
-    'p88',
-    'p888',
-    'p89',
-    'p895',
-    'p9&ndash;j',
-    'p9.1',
-    'p9.2',
-    'p90\'s',
-    'p90/no750/0',
-    'p91/len/1336',
-    'p92/',
     'p925',
-    'p93&ndash;5',
-    'p935',
-    'p941',
-    'p95.',
-    'p957',
-    'p9600',
-    'p97',
-    'p989',
-    'p994',
-    'p=&lt;0.0001',
-    'p=&lt;0.001',
-    'p=&lt;0.05',
-    'p=0.0000',
-    'p=0.00001',
-    'p=0.00003',
     'p=0.00004',
-    'p=0.00016',
-    'p=0.0004',
-    'p=0.0005',
-    'p=0.0006',
-    'p=0.0007',
-    'p=0.0008',
-    'p=0.0010',
-    'p=0.0012',
-    'p=0.0031',
-    'p=0.0034',
-    'p=0.0039',
-    'p=0.0041',
-    'p=0.0046',
-    'p=0.0070',
-    'p=0.0087',
     'p=0.0102',
-    'p=0.0143',
-    'p=0.016',
-    'p=0.0176',
-    'p=0.018',
-    'p=0.030',
-    'p=0.031',
-    'p=0.032',
-    'p=0.033',
-    'p=0.0355',
-    'p=0.037',
-    'p=0.042',
-    'p=0.046',
-    'p=0.0469',
-    'p=0.047',
-    'p=0.051',
     'p=0.054',
-    'p=0.055',
-    'p=0.057',
-    'p=0.062',
-    'p=0.070',
-    'p=0.071',
-    'p=0.076',
-    'p=0.0809',
-    'p=0.085',
-    'p=0.10',
-    'p=0.13',
-    'p=0.145',
-    'p=0.173',
-    'p=0.213',
-    'p=0.23',
-    'p=0.2613',
     'p=0.29',
-    'p=0.30',
-    'p=0.302',
-    'p=0.31',
-    'p=0.324',
-    'p=0.33',
-    'p=0.3546',
-    'p=0.36',
-    'p=0.37',
-    'p=0.3785',
-    'p=0.39',
-    'p=0.42',
-    'p=0.43',
-    'p=0.44',
-    'p=0.4447',
-    'p=0.464',
     'p=0.47',
-    'p=0.48',
-    'p=0.53',
-    'p=0.54',
-    'p=0.55',
-    'p=0.56',
-    'p=0.57',
-    'p=0.58',
-    'p=0.59',
-    'p=0.66',
-    'p=0.67',
-    'p=0.68',
-    'p=0.698',
-    'p=0.70',
-    'p=0.7299',
-    'p=0.74',
     'p=0.7526',
-    'p=0.80',
-    'p=0.8092',
-    'p=0.82',
-    'p=0.8454',
-    'p=0.86',
-    'p=0.863',
-    'p=0.87',
-    'p=0.9004',
-    'p=0.94',
-    'p=0.98',
-    'p=0.984',
-    'p=0.996',
-    'p=1',
-    'p=1.0',
-    'p=50',
     'p=bonk',
-    'p=p\'',
-    'pa&amp;s',
-    'pa&iacute;z',
-    'pa&iuml;ens',
-    'pa&ndash;12',
-    'pa&ndash;18&ndash;125',
-    'pa&ndash;18&ndash;150',
-    'pa&ndash;22&ndash;160',
-    'pa&ndash;28',
-    'pa&scaron;alik',
-    'pa&scaron;trovi&cacute;i',
-    'pa\'gellu',
-    'pa(&formula)q',
-    'pa-18-150/180',
-    'pa-20',
     'pa-23&ndash;235s',
-    'pa-24',
-    'pa-28',
-    'pa-28&ndash;140',
-    'pa-28/181',
-    'pa-32',
-    'pa-32r',
-    'pa-34',
-    'pa-46',
-    'pa-architecture',
-    'pa-gel',
-    'pa-ki-ja-ne',
-    'pa-oct-11',
-    'pa-of-two-planned-nippers',
-    'pa-risc-based',
-    'pa/1ros',
     'pa/guitar',
-    'pa/pf',
-    'pa01c',
-    'pa01s',
-    'pa05b',
-    'pa10',
-    'pa100&ndash;rz999',
-    'pa1002',
-    'pa28',
-    'pa39',
-    'pa9814.413.322,705',
-    'paaaarty',
-    'paak',
-    'paal',
-    'paarl',
-    'paarlberg',
     'paarshin',
-    'paasban',
-    'paasvvp16',
-    'paata',
-    'paatashvili',
-    'paateleinen',
-    'paban',
-    'pabell&oacute;n',
-    'pabloite',
-    'pabouche',
-    'pabx-like',
-    'pac-a-mac',
-    'pac-o-macs',
-    'pacab4.vp2/vp6/ns1/vp7',
-    'pacab4.vp3/vp2/vp7/vp5',
-    'pacal',
     'pacare',
-    'pacatian',
-    'paccar',
-    'paccaud',
-    'paccione',
-    'pace&rehy;setter',
-    'pace&rehy;setting',
-    'pace\'',
-    'pace-dominated',
-    'pace-egging',
-    'pace-maker',
-    'pace-makers',
-    'pace-terminable',
-    'pace.the',
-    'pace/md/headgear',
-    'pace/organisation',
     'pacebo',
-    'paced=',
-    'pacer(s)',
-    'pacesetter',
-    'pacetti',
-    'pacey/ncis',
-    'pach&oacute;n',
-    'pachano',
-    'pachas',
-    'pachauri',
-    'pachecho',
-    'pachlitsani',
-    'pachmann',
-    'pachnicke',
-    'pachnuik',
-    'pacho',
     'pachonski',
-    'pacht',
-    'pachter',
-    'pachucho',
-    'pachuko',
-    'pachyammos',
-    'pachyauro',
-    'pachycephalosaurs',
-    'pachyderm',
-    'pachydermal',
-    'pachydermatous',
-    'pachydermic',
-    'pachygyria',
-    'pachyptila',
-    'pachyscelis',
-    'pachysima',
     'pacient',
-    'pacier',
-    'pacific-crime',
-    'pacific-north',
-    'pacificatory',
-    'pacifici',
-    'pacificism',
-    'pacificorp',
-    'pacifiers',
-    'pacifies',
-    'pacifist-like',
-    'pacifist-minded',
-    'pacifists2',
-    'pacini',
-    'pacinos',
-    'pacitti',
     'pack-\'em-in',
-    'pack-bridge',
-    'pack-man',
-    'pack-size',
-    'pack-trail',
-    'packability',
-    'packable',
-    'package&gt',
-    'package&mdash',
-    'package&mdash;a',
-    'package-bleaching',
-    'package/2',
-    'package/module',
-    'package/package',
-    'package/packages',
-    'package/product/source/foreign',
     'packaged-food',
-    'packaged-goods',
-    'packagees',
-    'packager',
-    'packages.',
-    'packages.health-care',
-    'packagin\'',
-    'packaging-to-adhesives',
-    'packard-merlin',
-    'packards',
-    'packbag',
-    'packed-lunch',
-    'packed-pixel',
-    'packed-pixl',
-    'packed-to-capacity',
-    'packer-goldsmith',
     'packer/technicians',
-    'packer/village',
-    'packet-',
-    'packet-boat',
-    'packet-sized',
-    'packet-steamer',
-    'packet7',
-    'packeting',
-    'packetised',
-    'packety',
-    'packham.',
-    'packhorse-bridge',
-    'packhouse',
-    'packin',
-    'packing-paper',
-    'packlemerton',
     'packman-type',
-    'packmate',
-    'packmates',
-    'packmoor',
-    'packmybagswithfivedozenextraliquorjugs',
-    'packrat',
-    'packshaw',
-    'packsizes',
-    'packy',
-    'paclan/x',
-    'pacman',
-    'pacnews',
-    'pacplas',
-    'pacques',
-    'pact-sponsored',
-    'pactice',
     'pactolus',
-    'pad&gt',
-    'pad&gt;call',
-    'pad&gt;login',
-    'pad-batting',
-    'pad-eye',
-    'pad-like',
-    'pad-mounted',
-    'pad/bat',
-    'padam',
-    'padanaram',
-    'padarm',
-    'padavatton',
-    'padbury',
-    'padded-room',
-    'padded-up',
     'padded-velvet',
-    'paddee',
-    'padder',
-    'paddings',
-    'paddington&ndash;slough',
-    'paddington-heathrow',
-    'paddington-oxford',
-    'paddiography',
-    'paddiwak',
-    'paddle-boat',
-    'paddle-less',
-    'paddle-powered',
-    'paddleboat',
-    'paddleless',
-    'paddlin\'',
-    'paddock-grazing',
     'paddox',
-    'paddy-field',
-    'paddy-the-lover',
-    'paddy-the-spy',
-    'paddy-the-warrior',
-    'paddy-wagons',
-    'paddywards',
-    'padee',
-    'padegs',
-    'padel',
-    'pademba',
-    'paderwski',
-    'padestowe',
-    'padfield/farmer',
-    'padfields',
-    'padfoot',
     'padgem',
-    'padget',
-    'padgug',
-    'padhame',
-    'padibe',
-    'padillaeducation',
-    'padimbe',
-    'padl',
-    'padloc',
-    'padlowski',
-    'padm&amacr;ra',
-    'padmanabh',
-    'padmanathan',
-    'padmapani',
-    'padmarks',
-    'padmobusono',
     'padome',
-    'padoudji-yadjoua',
-    'padr&oacute;n',
-    'padric',
-    'padron',
-    'pads.',
-    'padsdown',
-    'paduak-capped',
-    'paducah',
-    'padula',
-    'padus',
-    'paeder',
-    'paederastic',
-    'paediatrican',
-    'paedophiliacs',
-    'paeffgen',
     'paehlke',
-    'paellas',
-    'paeon',
-    'paeonias',
-    'paeons',
-    'paeony',
-    'paeony-shaped',
-    'paepecke',
-    'paesbrugghe',
-    'paet',
-    'paez',
-    'paez\'',
-    'paffenbarger',
-    'pafmeca',
-    'pafs',
-    'pag-acs',
     'pagado',
-    'pagadroma',
-    'pagaentry',
-    'pagally',
-    'pagan&ndash;mandalay',
-    'paganelii',
-    'paganinian',
-    'paganinni',
-    'paganised',
-    'paganismus',
-    'paganus',
-    'paganuzzi',
-    'pagasaian',
-    'pagb',
-    'pagbaiavyn',
-    'pagbajavyn',
     'page&mdash;headings',
-    'page-built',
-    'page-by-page',
-    'page-headings',
-    'page-number',
-    'page-of-honour',
-    'page-pile',
-    'page-references',
-    'page-running',
-    'page-sds',
-    'page-size',
-    'page-style',
-    'page-type',
-    'page-waits',
-    'page/cherwell',
-    'page/daily',
     'page/featured',
-    'page/kenward',
-    'page/main',
-    'page/of',
-    'page/olivia',
-    'page/reporter',
-    'page/robert',
-    'page/station',
-    'page128',
-    'page145',
-    'page3',
-    'page34',
-    'page38',
-    'page:120',
-    'pageant-masters',
-    'pageful',
     'pageless',
-    'pagell',
-    'pagemaker&mdash;though',
-    'pagemaking',
-    'pagenses',
-    'pagenumbers',
-    'pageprinter',
-    'pagerungan',
-    'pages/half',
-    'pageses',
-    'paggi',
-    'pagid',
-    'pagina',
-    'paginas',
-    'paginate',
-    'pagination.',
     'pagings',
-    'pagini',
-    'pagliano',
-    'pagliaruio',
-    'pagoaga',
-    'pagoda&rehy;topped',
-    'pagoda-land',
-    'pagoda-shaped',
-    'pagoda-topped',
-    'pagodas.',
-    'pagodes',
-    'pagophila',
-    'pagothenia',
-    'pagram',
-    'pagvajavyn',
-    'pahari',
     'pahinuis',
-    'pahit',
-    'pahkatos',
-    'pahlen',
-    'pahlevi',
-    'pahls',
-    'pahoa',
-    'pahsien',
-    'pahud',
-    'paian',
-    'paiawon',
-    'paiba',
-    'paice/hulke/verney',
-    'paichitr',
-    'paid\'',
-    'paid-for-sex',
     'paid-outs',
-    'paid/received',
-    'paidagogos',
-    'paideia',
-    'paie',
-    'paiens',
-    'paigen',
-    'paihamainspection',
-    'paihia',
-    'paijoanes',
-    'pail-like',
-    'pailful',
-    'pailhas',
-    'paillards',
-    'paillat',
-    'paille',
     'pailsful',
-    'paimpol',
-    'pain\'-measuring',
-    'pain-ah-hee',
-    'pain-ascription',
-    'pain-avoiding',
-    'pain-bearer',
-    'pain-behaviour',
-    'pain-clouded',
-    'pain-consuming',
-    'pain-controlling',
-    'pain-crying',
-    'pain-dominant',
-    'pain-freaking',
-    'pain-in-the-arse',
-    'pain-inflicting',
     'pain-infliction',
-    'pain-level',
-    'pain-lines',
-    'pain-memory',
-    'pain-meters',
-    'pain-ometer',
-    'pain-provoking',
-    'pain-response',
-    'pain-ridden',
-    'pain-scarred',
-    'pain-scorched',
-    'pain/because',
-    'pain/cough/girl',
-    'pain_at',
-    'paine/eyewitness',
-    'paine/senior',
     'painell',
-    'painfree',
-    'painful-looking',
-    'painglove',
-    'painlessness',
-    'pains.',
-    'pains/are',
-    'painstaker',
-    'painstakingly&mdash',
-    'painsthorpe',
-    'painstyled',
-    'painswick/gloucestershire',
-    'paint&amp;create',
-    'paint&mdash',
-    'paint&rehy;manufacturing',
-    'paint-and-play',
     'paint-as-surface',
-    'paint-bespattered',
-    'paint-blistered',
-    'paint-blotched',
-    'paint-bombed',
-    'paint-by-number',
-    'paint-conserving',
-    'paint-daubed',
-    'paint-frame',
-    'paint-guns',
-    'paint-handling',
-    'paint-related',
-    'paint-remover',
-    'paint-roller',
-    'paint-room',
-    'paint-schemes',
     'paint-scraped',
-    'paint-shop',
-    'paint-smart',
-    'paint-soaked',
-    'paint-splashed',
-    'paint-sprayer',
-    'paint-spraying',
-    'paint-stripper',
-    'paint-stripping',
-    'paint-thinner',
-    'paint-throwing',
-    'paint-type',
-    'paint-up',
-    'paint/wallpaper',
-    'paintability',
-    'paintal',
     'paintbrush/frieze',
-    'painted-in',
-    'painted-on-both-sides',
-    'painted-shut',
-    'painted-up',
-    'painter&mdash',
-    'painter-architects',
-    'painter-etchers',
-    'painter-family',
-    'painter-husband',
-    'painter-sculptors',
-    'painter-signatures',
-    'painter-travellers',
-    'painter-wife',
-    'painter/decorator',
-    'painters-printers',
     'painters.',
-    'painti',
-    'painting\'',
-    'painting-book',
-    'painting-books',
-    'painting-how',
-    'painting-in',
-    'painting-size',
-    'painting/ex-smoker',
-    'painting/fish',
-    'painting/object',
-    'paintings.1',
-    'paintings/photographs',
-    'paintings/prints',
-    'paintjob',
-    'paintless',
     'painton',
-    'paintpot-at-the-wall',
-    'paintstick',
-    'paipety',
-    'pair&rehy;purchasers',
-    'pair-bonded',
-    'pair-bonds',
-    'pair-formation',
-    'pair-plasma',
-    'pair-trawling',
-    'pair/baby',
-    'pair/exchange',
-    'pairaudeau',
-    'paired-up',
-    'pairi',
-    'pairic',
     'pairoj',
-    'pairs/bring',
-    'pairt&iacute',
-    'paise',
-    'paisey',
-    'paisiellists',
-    'paisley&rehy;patterned',
-    'paisley-based',
-    'paisley-o\'neill',
-    'paisley-shirted',
-    'paisley/valerie',
-    'paisleys',
-    'paispamba',
-    'paiste',
-    'paisword',
-    'paita',
     'paithnick',
-    'paiutiids',
-    'paivio',
-    'pajah',
-    'pajama',
-    'pajara',
-    'pajares',
-    'pajari',
-    'pajarito',
-    'pajero',
-    'pajkic',
-    'pajkovic',
-    'pajoca',
-    'pajou',
-    'pakalniskis',
-    'pakaraima',
     'pakastani',
-    'pakehas',
-    'pakeman',
-    'pakeniho',
-    'pakhtunwali',
-    'pakiewicz',
-    'pakington',
-    'pakistan-american',
-    'pakistan-bangladesh',
-    'pakistan-occupied',
-    'pakistan-sri',
-    'pakistan-trained',
-    'pakistan.',
-    'pakistani-',
-    'pakistani-dominated',
-    'pakistani-iranian',
     'pakistanis/bangladeshis',
-    'pakistanis/kashmiri',
-    'pakki',
-    'paknam',
-    'pakok',
-    'pakoku',
-    'pakoras',
-    'pakua',
-    'pakubuono',
-    'pal&acirc;cio',
-    'pal&eacute',
-    'pal&eacute;ar',
-    'pal&eacute;ontologie',
-    'pal\'',
-    'pal-a-mine',
-    'pal-oos-tris',
     'pal/secam',
-    'pal33v16',
-    'palace-based',
-    'palace-brighton',
-    'palace-church',
-    'palace-complex',
-    'palace-dominated',
-    'palace-gate',
-    'palace-guards',
-    'palace-negotiated',
-    'palace-organisation',
-    'palace-picture',
-    'palace-prison',
-    'palace-swindon',
-    'palace-watford',
-    'palace.kinnear',
     'palace/oxfordshire',
-    'palack&yacute',
-    'palacky',
-    'palaczky',
-    'palade',
-    'palaearctic',
-    'palaeo-biological',
-    'palaeo-europe',
-    'palaeo-geographical',
-    'palaeo-rockies',
-    'palaeo-tethys',
-    'palaeo.',
-    'palaeoanthropological',
-    'palaeoanthropologists',
-    'palaeoasiatic',
-    'palaeobiogeographic',
     'palaeobiologists',
-    'palaeobotanists',
-    'palaeoceanographic',
-    'palaeoceanography',
-    'palaeoclimates',
-    'palaeoclimatologists',
-    'palaeocoma',
-    'palaeoecologically',
-    'palaeoecologist',
-    'palaeoecologists',
-    'palaeoeconomy',
-    'palaeoenvironment',
-    'palaeogeographical',
-    'palaeogeographies',
-    'palaeographic',
-    'palaeohydrology',
     'palaeohydrology-river',
-    'palaeoindians',
-    'palaeokarst',
-    'palaeolimnological',
-    'palaeolimnology',
-    'palaeomagnetically',
-    'palaeomagnetist',
-    'palaeomagnetists',
-    'palaeoniscus',
-    'palaeontographical',
-    'palaeopathology',
-    'palaeopteran',
-    'palaeornis',
-    'palaeoscolecidans.',
-    'palaeosecular',
-    'palaeosmilia',
     'palaeosols',
-    'palaeosome',
-    'palaeotherium',
-    'palaeotologist',
-    'palaeotropical',
-    'palaeozoic-early',
-    'palaeozoic/early',
-    'palaeozoic/mesozoic',
-    'palaephatus',
-    'palafrenieri',
-    'palagi',
-    'palagio',
-    'palago',
-    'palaimon',
-    'palaiomilo',
-    'palaious',
     'palais-royal',
-    'palaly',
-    'palamadez',
-    'palamas',
-    'palamino',
-    'palamut',
-    'palances',
-    'palanchok',
-    'palanji',
-    'palanquin\'',
-    'palantirs',
-    'palanza',
-    'palare',
-    'palasade',
-    'palasm',
-    'palaster',
     'palasthotel',
-    'palastina-ver.',
-    'palatalisation',
-    'palatally',
-    'palate-stimulator',
-    'palate.',
-    'palatially',
-    'palatinar',
-    'palatium',
-    'palatna',
-    'palato-alveolar',
-    'palavers',
-    'palavicino',
-    'palazols',
-    'palazzese',
-    'palazzis',
     'palc&aacute;tu',
-    'palca',
-    'palce22v10',
-    'palchok',
-    'palciauskas',
-    'pale&rehy;blue',
-    'pale&rehy;faced',
-    'pale-auburn',
-    'pale-bellied',
-    'pale-cheeked',
-    'pale-coated',
-    'pale-complexioned',
-    'pale-fletched',
-    'pale-glistening',
-    'pale-honey',
-    'pale-ish',
     'pale-jones',
-    'pale-knuckled',
-    'pale-lilac',
-    'pale-mauve',
-    'pale-orange',
-    'pale-panelled',
-    'pale-parchment',
-    'pale-ringed',
-    'pale-toned',
-    'pale.although',
-    'palea',
-    'palearctic',
-    'palemque',
-    'palene',
-    'paleo',
-    'paleo-equator',
     'paleo-indians',
-    'paleoanthropologists',
-    'paleobiology',
-    'paleochem',
-    'paleokastritsa',
-    'paleologa',
-    'paleologus',
-    'paleomagnetic',
-    'paleoniscoid',
-    'paleopathologist',
-    'paleozoics',
-    'paler-toned',
-    'palera',
-    'palestinains',
-    'palestinan',
-    'palestinc',
     'palestine-israel-jordan',
-    'palestinian-arab',
-    'palestinian-born',
-    'palestinian-lebanese',
-    'palestinian-managed',
-    'palestinian-us',
-    'palestininan',
-    'palestrena',
-    'palestrinian',
-    'palette&rehy;animated',
-    'palette-shaped',
-    'palex',
-    'palffys',
-    'palfreyman',
-    'palheiros',
-    'pali&rehy;mony',
     'paliamentary',
-    'palika',
-    'palimpsests',
-    'palin-for',
-    'palin/traveller',
-    'palindromedary',
-    'palingenesis',
-    'palinn',
-    'palinode',
-    'palinuro',
-    'palish',
-    'palissy',
-    'palito',
-    'palk/becky',
-    'palka',
-    'pallace',
     'palladian-style',
-    'palladiana',
-    'palladin',
-    'palladium-enriched',
-    'palladium-rich',
-    'pallady',
-    'pallagi',
-    'pallam',
-    'pallasite',
-    'pallaskenry',
-    'pallatyne',
-    'pallava',
-    'pallaviccino',
-    'pallavicini',
-    'pallayev',
-    'pallene',
     'pallens',
-    'palles',
-    'pallet-wood',
-    'palleted',
-    'palletisation',
-    'pallett/eyewitness',
-    'palliards',
-    'palliata',
-    'palliating',
-    'palliatus',
-    'pallidus',
-    'pallie',
-    'pallig',
-    'pallisadoes',
-    'pallistar',
-    'pallister/bruce',
     'pallisters',
-    'pallisteur',
-    'palloni',
-    'pallotine',
-    'pallottino',
-    'pallucchini',
-    'palm&rehy;court',
-    'palm-',
-    'palm-bark',
-    'palm-branches',
-    'palm-court',
-    'palm-down',
-    'palm-fronded',
-    'palm-greasing',
-    'palm-grove',
-    'palm-hand',
     'palm-print',
-    'palm-printed',
-    'palm-prints',
-    'palm-reader',
-    'palm-readers',
-    'palm-readings',
-    'palm-recognition',
-    'palm-sized',
-    'palm-sticks',
-    'palm-strewn',
-    'palm-tattoo',
-    'palm-top',
-    'palm-tops',
-    'palm-up',
-    'palm-upwards',
-    'palmanova',
     'palmason',
-    'palmaturn',
-    'palmcorders',
-    'palmdos',
-    'palmer+worthington',
-    'palmer-tomkinsons',
-    'palmer/allied',
-    'palmer/director',
-    'palmer/founder',
-    'palmer/hunt',
-    'palmer/husband',
-    'palmer/owner',
-    'palmer/severn',
-    'palmera',
-    'palmeria',
-    'palmerians',
     'palmerie',
-    'palmette-finial',
-    'palmetto',
-    'palmezzano',
-    'palmfronds',
-    'palmful',
-    'palmguist',
-    'palmi',
-    'palmieri',
-    'palmira',
-    'palmiro',
-    'palmitoylstearoyl',
-    'palmo',
-    'palmoti&cacute;s',
-    'palmprints',
-    'palms.',
     'palmtop-to-datacentre',
-    'palmtree',
-    'palmus',
-    'palnatoke',
-    'palojame',
-    'palomides',
-    'palooka',
-    'palookas',
-    'palopo',
-    'palous',
-    'palpa',
-    'palpiger',
-    'palping',
-    'palpitati',
-    'palsely',
-    'palsey',
     'palshid',
-    'palsies',
-    'palstaves',
-    'palsy-walsy',
-    'paltronieri',
-    'paltz',
-    'paluccis',
-    'paludicola',
-    'palumbus',
-    'palustria',
-    'palyer',
-    'palying',
-    'palynofloral',
-    'palynomorph',
-    'palynomorphs',
-    'palynostratigraphical',
     'pam-crash',
-    'pam-stamp',
-    'pamaquin',
-    'pamasonic',
-    'pamber',
-    'pambies',
-    'pambio',
-    'pambotadai',
-    'pamela:has',
-    'pamell',
-    'pamiers',
-    'pamino',
-    'pammelia',
-    'pamment',
-    'pammeter',
-    'pamoana',
     'pampanga',
-    'pamperampam',
-    'pampered-looking',
-    'pamphlet-reading',
-    'pamphlet-writer',
-    'pamphlett',
-    'pamphylian',
-    'pamplemousse',
-    'pamporovo',
-    'pampos',
-    'pampus',
-    'pampying',
-    'pams',
-    'pamyat\'',
-    'pamyet',
-    'pan&eacute',
     'pan&iacute',
-    'pan&rehy;indonesia',
-    'pan-12',
-    'pan-52',
-    'pan-africanism',
-    'pan-arabism',
-    'pan-arabist',
-    'pan-arctic',
-    'pan-biogeographic',
-    'pan-caribbean',
-    'pan-class',
-    'pan-colitis',
-    'pan-culture',
-    'pan-dimensional',
-    'pan-ec',
-    'pan-encephalitis',
     'pan-europeanism',
-    'pan-faced',
-    'pan-haggis',
-    'pan-handlers',
-    'pan-head',
-    'pan-hysterics',
-    'pan-iku-lar-toos',
-    'pan-imperial',
-    'pan-indochina',
-    'pan-industry',
-    'pan-intestinal',
-    'pan-ish',
-    'pan-islamists',
-    'pan-leucocyte/monocyte',
-    'pan-leukocytic',
-    'pan-malayan',
     'pan-montoko',
-    'pan-nationalism',
-    'pan-nordic',
-    'pan-pacific',
-    'pan-presbyterian',
-    'pan-protestantism',
-    'pan-prussian',
-    'pan-regional',
-    'pan-s',
-    'pan-scandinavian',
-    'pan-scourers',
-    'pan-serb',
-    'pan-shine',
-    'pan-slav',
-    'pan-slavism',
-    'pan-tcr-',
     'pan-tribal',
-    'pan-turkish',
-    'pan-unionist',
-    'pan-yugoslav',
-    'pan/daphnis',
-    'panabokke',
-    'panaches',
-    'panacide',
-    'panad&eacute;s',
-    'panadura',
-    'panafax',
-    'panafrican',
-    'panafu',
-    'panama-based',
-    'panama-registered',
-    'panama-see',
     'panamamian',
-    'panamanain',
-    'panamanian-controlled',
-    'panamanian-led',
-    'panamerican',
-    'panaques',
-    'panarea',
-    'panasonic-lwt',
-    'panasonics',
-    'panastation',
-    'panatella',
-    'panathanaikos',
-    'panathanikos',
-    'panathenaia',
-    'panatrope',
-    'panau',
     'panavic',
-    'panavision',
-    'panayi',
-    'panayia',
-    'panayides',
-    'panayiotiou',
-    'pancake-shaped',
-    'pancatantra',
-    'pancea',
-    'pancetta',
-    'pancha',
-    'panchal',
-    'panchali',
-    'panchatantra',
-    'panchaud',
-    'panchayats',
     'panche',
-    'panchgani',
-    'panciatichi',
-    'pancoast',
-    'pancole',
-    'pancolic',
-    'pancolonoscopy',
-    'pancrace',
-    'pancras&ndash;bedford',
-    'pancras-in-the-fields',
-    'pancreaic',
-    'pancreas-piercing',
-    'pancreata',
-    'pancreatectomies',
-    'pancreatectomy',
-    'pancreaticoduodenectomy',
     'pancreaticojejunostomies',
-    'pancreatograms',
-    'pancreatographic',
-    'pancreatotoxic',
-    'pancreatotropin',
-    'pancreattis',
-    'pancretic',
-    'pancying',
-    'pancytopenia',
-    'pancytoplasmatic',
-    'panda-branded',
-    'panda-briefs',
-    'panda-loving',
-    'pandaceae',
-    'pandang',
-    'pandans',
     'pandar',
-    'pandazis',
-    'pande',
-    'pandecta',
-    'pandeli',
-    'pandemics',
-    'pandemonious',
-    'panderman',
-    'pandey',
-    'pandick',
-    'pandies',
-    'pandionidae',
-    'pandits',
-    'pando',
-    'pandoli',
-    'pandour',
     'pandp',
-    'pandr\'a',
-    'pandura',
-    'pandynamic',
-    'paneas',
-    'panecan',
-    'paneer',
-    'paneg',
-    'panegyri',
-    'panegyrica',
-    'panegyrist',
-    'panel-accent',
-    'panel-beaters',
-    'panel-proposed',
-    'panelbeater',
-    'paneless',
     'panelinha',
-    'panelinhas',
-    'panelize',
-    'panell',
-    'panella',
-    'panelma',
-    'panemones',
-    'panencephalitis',
-    'panettoni',
-    'panevor',
-    'panezai',
-    'panfinancial',
-    'panfuls',
-    'pang.',
-    'panga-knife',
-    'pangaed',
     'pangalactic',
-    'pangamate',
-    'pangas',
-    'pangasinan',
-    'pangbourne/berkshire',
-    'pangburn',
-    'pangerland',
-    'pangie',
-    'pangkalan',
-    'pangkor',
-    'pangma',
-    'pangu-led',
-    'pangue',
-    'panhandlers',
-    'panhandlin\'',
-    'panhandling',
     'pani',
-    'panial',
-    'panic\'',
-    'panic-attack',
-    'panic-buying',
-    'panic-driven',
-    'panic-induced',
-    'panic-merchants',
-    'panic.stricken',
-    'panic.the',
-    'panicipation',
-    'panickers',
-    'panicky-wheeling',
-    'panico',
-    'panicos',
-    'panicular',
     'paniculate',
-    'paniculatus',
-    'panicum-',
-    'panier',
-    'paniers',
-    'panigarola',
-    'panigraphi',
-    'panima',
-    'paninaro',
-    'panipat',
-    'panique',
-    'panir',
-    'paniscus',
-    'panisperna',
-    'panitia',
-    'panizza',
     'panizza/music',
-    'panjab',
-    'panjaitan',
-    'panjaithan',
-    'pankanj',
-    'pankhurst-led',
-    'pankota',
-    'pankrath',
-    'pankration',
-    'panks',
-    'pankymoor',
-    'panloaf',
-    'panlogism',
-    'panloy',
-    'panmictic',
-    'panmixia',
     'pann',
-    'pannable',
-    'pannacea',
-    'pannage.',
-    'pannai',
-    'panneau',
-    'panneels',
-    'pannel',
-    'pannells',
-    'pannier-man',
-    'panogena',
-    'panolog',
-    'panolpy',
-    'panoplied',
-    'panor',
-    'panoramically',
     'panormos',
-    'panorpa',
-    'panorpoids',
-    'panoutsos',
-    'panovariohysterectomy',
-    'panovarious',
-    'panovulational',
-    'panproctocolitis',
-    'panpsychism',
-    'panpsychist',
-    'panry',
-    'pans.',
-    'pansere',
-    'panses',
-    'pansexual',
-    'pansexuality',
     'pansky',
-    'panslavs',
-    'pansocratic',
-    'pansticked',
-    'pansy-brain',
-    'pansying',
-    'pansyism',
-    'pant-hooting',
-    'pant-leg',
-    'pant-moistening',
-    'pantacrator',
-    'pantages',
-    'pantall',
-    'pantall/wingwalker',
-    'pantalon',
-    'pantalons',
     'pantalooned',
-    'pantano',
-    'pantastic',
-    'pantea',
-    'panted.',
-    'panteleimon',
-    'panteleyev',
-    'panteli',
-    'panteutonism',
-    'panthalassic',
-    'pantheologus',
-    'pantherish',
-    'panticapaeum',
-    'panticosa',
-    'pantied',
-    'pantikapaion',
     'pantino',
-    'pantins',
-    'pantisocrat',
-    'pantja',
-    'pantlcosa',
-    'pantler',
-    'pantomime-like',
-    'pantomimicry',
-    'pantomiming',
-    'pantomimists',
-    'pantouflage',
-    'pantouflent',
-    'pantoufles',
-    'pantridge',
-    'pantry-boy',
-    'pantrymen',
     'pants-cacking',
-    'pants-down',
-    'pantsuit',
-    'pantsuits',
-    'pantuhoff',
-    'pantulf',
-    'panty-girdle',
-    'panty-lines',
-    'panty-waist',
-    'pantyboda',
-    'pantycelyn',
-    'panufnik',
-    'pany',
-    'panyarachunprime',
-    'panz&eacute;ra',
-    'panzani',
     'panzar',
-    'panzerboy',
-    'panzerfaust',
-    'panzergrenadier',
-    'paoan',
-    'paoh',
-    'paolino',
-    'paolis',
-    'paolozzis',
-    'paon',
-    'paoostyc',
-    'paor',
-    'paosgraf',
-    'papa\'',
-    'papacostas',
-    'papadimitriou',
     'papadimitropolous',
-    'papadongonas',
-    'papaduka',
-    'papagallo',
-    'papagayo',
-    'papagena',
-    'papageorghiou',
-    'papai',
-    'papaia',
-    'papajorgi',
-    'papakonstantinou',
-    'papal-oriented',
-    'papale',
-    'papanicoloau',
-    'papapizza',
-    'papar',
     'papard',
-    'paparemborde/fouroux/lepasset',
-    'paparonis',
-    'papastavrou',
-    'papataxiarchis',
-    'papaw',
-    'papaws',
-    'papay.',
-    'papcastle',
-    'papcun',
-    'papelaco',
-    'papelitas',
-    'paper&mdash;but',
-    'paper&mdash;the',
-    'paper&ndash',
-    'paper&rehy;chase',
     'paper&rehy;like',
-    'paper&rehy;until',
-    'paper*',
-    'paper-\'i',
-    'paper-and-ink',
-    'paper-ash',
-    'paper-back',
-    'paper-backs',
-    'paper-bags',
-    'paper-boys',
-    'paper-cap',
-    'paper-chain',
-    'paper-changing',
-    'paper-cheap',
-    'paper-collection',
-    'paper-consumption',
     'paper-cup',
-    'paper-cutouts',
-    'paper-driven',
-    'paper-faced',
-    'paper-fine',
-    'paper-flower-hawking',
-    'paper-group',
-    'paper-hatted',
-    'paper-intensive',
-    'paper-less',
-    'paper-like',
-    'paper-lined',
-    'paper-lover',
-    'paper-loving',
-    'paper-m&acirc;ch&eacute',
-    'paper-makers',
     'paper-masked',
-    'paper-mills',
-    'paper-money',
-    'paper-mulberry',
-    'paper-panel',
-    'paper-person',
-    'paper-plane',
-    'paper-plates-and-pasta',
-    'paper-pulp',
-    'paper-rack',
-    'paper-ruling',
-    'paper-seller',
-    'paper-sellers',
-    'paper-shop',
-    'paper-shuttles',
-    'paper-sizes',
     'paper-stainer',
-    'paper-stock',
-    'paper-store',
-    'paper-strewn',
-    'paper-strippers',
-    'paper-thin-leaved',
-    'paper-thinness',
-    'paper-towel',
-    'paper-towels',
-    'paper-types',
-    'paper-use',
-    'paper-wasp',
-    'paper-weights',
-    'paper-world',
-    'paper.',
-    'paper.anything',
     'paper/conducting',
-    'paper/discussion',
-    'paper/foil/cling',
-    'paper/microfilm',
-    'paper/print',
-    'paperback/&pound;25',
-    'paperbarks',
-    'paperbeating',
-    'paperboard',
-    'paperchains',
-    'paperclipped',
-    'paperhangers',
-    'paperhanging',
-    'paperholics',
-    'paperites',
-    'paperlace',
     'papermac.',
-    'paperman',
-    'papermaster',
-    'papermills',
-    'paperout',
-    'papers.just',
-    'papers/commentaries',
-    'papers/documents',
-    'papers/research',
-    'papertalk',
-    'papertowels',
-    'papertype',
-    'papery-fine',
-    'papery-thin',
-    'papeterie',
-    'paphian',
     'papi&eacute;r_m&acirc;ch&eacute',
-    'papier-',
-    'papier_m&acirc;che',
-    'papier_mach&eacute',
-    'papieri',
-    'papilichromis',
-    'papiliones',
-    'papilionoidea',
-    'papilionoideae',
-    'papilla-form',
-    'papillia',
-    'papillo-oedema',
-    'papilloedema',
-    'papillomatous',
-    'papillosum',
-    'papillosus',
     'papineau-couture',
-    'papini',
-    'papior',
-    'papis',
-    'papistical',
-    'papistry',
-    'papke/spelly',
-    'papo',
-    'papooshes',
-    'papoura',
-    'pappacieri',
-    'pappei',
-    'pappin',
-    'papple',
-    'papps/dog',
-    'paprika-coloured',
     'paprika.',
-    'paprika/copper',
-    'paprocki',
-    'paproski',
-    'paproth',
-    'paps',
-    'papsturkunden',
-    'papua.',
-    'papuan-based',
-    'papudo',
-    'papuensis',
-    'papular',
-    'papule',
-    'papusoiu',
-    'papy',
-    'papyfifera',
     'papyreia',
-    'papyrorum',
-    'papyrostory',
-    'papyrus&rehy;chest',
-    'papyruses',
-    'paque',
-    'paques',
-    'paquetes',
-    'par&eacute;age',
-    'par&formula',
-    'par&rehy;liament',
-    'par-4in',
-    'par-71',
-    'par-baked',
-    'par-boil',
-    'par-boiled',
     'par-ee',
-    'par-fect',
-    'par-fried',
-    'par-or-better',
-    'par-priced',
-    'par-threes',
-    'par-vee-foe-li-yum',
-    'para&iacute;ba',
-    'para&icirc;tre',
-    'para&ndash;phrasing',
-    'para&rehy;military',
-    'para&rehy;synonymy',
-    'para\'',
-    'para-amidophenol',
-    'para-amino-salicylic',
-    'para-aminosalicylic',
     'para-clerics',
-    'para-crystalline',
-    'para-curricular',
-    'para-dichlorobenzene',
-    'para-dise',
-    'para-gliders',
-    'para-graphs',
-    'para-hyponyms',
-    'para-incompatibles',
-    'para-legals',
-    'para-literary',
-    'para-literature',
-    'para-llel',
-    'para-militaries',
-    'para-nirvana',
-    'para-oesophageal',
     'para-oriented',
-    'para-phenylenediamine-oxidase',
-    'para-profession',
-    'para-psychologists',
-    'para-psychology',
-    'para-psychoses',
-    'para-public',
-    'para-sailing',
-    'para-social',
-    'para-space',
-    'para-tex',
-    'para-transit',
-    'para-xylene',
-    'para.10',
-    'para.104',
-    'para.12(5)',
     'para.2',
-    'para.2.',
-    'para.2.03',
-    'para.2.10',
-    'para.2.11',
-    'para.2.17',
-    'para.2.19',
-    'para.2.3',
-    'para.2d',
-    'para.3.14&ndash;3.16',
-    'para.3.8',
-    'para.4.',
-    'para.40',
-    'para.professionals',
-    'para/analyzer',
-    'para/designer',
     'para/programmer',
-    'para27&mdash;322',
-    'para27&mdash;323',
-    'parab&egrave;re',
-    'parabaun',
-    'parabears',
-    'parabiago',
-    'parable\'',
-    'parabolically',
-    'paraboot',
-    'parabosco',
-    'paracas',
-    'paracels',
-    'paracententesis',
-    'paracheirodon',
-    'parachute-harness',
     'parachute-jumping',
-    'parachute-training',
-    'parachutes.senior',
-    'paracohlrophenoxy',
-    'paracommandos',
-    'paracomp',
-    'paracone',
-    'paracooperia',
-    'paracortical',
-    'paracuting',
-    'parada',
-    'paradebugger',
-    'paradeground',
-    'paradeisoi',
-    'paradeplatz',
-    'paradeyou',
     'paradiagnostics',
-    'paradichlorobenzine',
-    'paradigm.',
-    'paradigma',
-    'paradigmatical',
-    'paradine',
-    'paradisaeidae',
-    'paradisial',
-    'paradisical',
-    'paradismatic',
-    'paradjik',
-    'paradores',
-    'paradors',
-    'paradoxe',
-    'paradoxic',
-    'paradropper',
     'paradroppers',
-    'paradropping',
-    'paradrops',
-    'paradyne',
-    'paradyse',
-    'paraesthesias',
-    'paraffin-burning',
-    'paraffin-filled',
-    'paraffin-fumed',
-    'paraffin-lamps',
-    'paraffin.',
-    'parafilm',
-    'parafin',
-    'paraflex',
-    'paraformaldehyde-fixed',
-    'paragenesis',
     'paragenetic',
-    'paraglossa',
-    'paragneiss',
-    'paragominas',
-    'paragraph-initial',
-    'paragraph/section',
-    'paragraph/sentence',
-    'paragraphed',
-    'paragraphist\'',
-    'paraguaipoa',
-    'paraguay&ndash;france',
-    'paraguay&ndash;usa',
-    'paraguay-paran&aacute',
-    'paraguayano',
-    'paraguayo',
-    'parahaemolyticus',
     'paraka&ntilde;a',
-    'parakl&emacr;sis',
-    'paraklesis',
-    'paralell',
-    'paralic',
-    'paralipomena',
-    'parall&egrave;le',
-    'parall&egrave;les',
-    'parallaxes',
-    'parallel\'',
-    'parallel-clamp',
-    'parallel-distributed',
-    'parallel-enable',
-    'parallel-port',
-    'parallel-resonant',
-    'parallel-threaded',
     'parallel/series',
-    'parallelepipeds',
-    'parallelisable',
-    'parallelizing',
-    'parallelly',
-    'parallelmake',
-    'parallels-in-negative',
-    'parallelware',
-    'parallelware/80860',
-    'parallex',
-    'paralogically',
-    'paralogy',
-    'paralux',
-    'paralysis.',
-    'paralytically',
-    'paralyzes',
     'paraman',
-    'paramatman',
-    'paramatta',
-    'paramedia',
-    'paramedically',
-    'paramedicals',
-    'paramedics/and',
-    'parameta.a',
-    'parameter/edit',
-    'parameteres',
-    'parameterise',
-    'parameterised',
-    'parameters.',
-    'parameters/',
-    'parametrically',
-    'parametrically.',
     'parametrics',
-    'parametrize',
-    'parametrized',
-    'paramilitants',
-    'paramilitarised',
-    'paramiltaries',
-    'paramoa',
-    'paramor',
-    'paramos',
-    'paramount-uip',
-    'paramount/lido',
-    'paramountly',
-    'paramus',
-    'paramuthion',
-    'paramyxoviruses',
-    'paran',
     'paran&aacute;-paraguay',
-    'paranapanema',
-    'paranapiacaba',
-    'paranaque',
-    'paranasal',
-    'paranet',
-    'parangon',
-    'paranoia\'',
-    'paranoia-ravaged',
-    'paranoia/homophobia',
-    'paranoiacally',
-    'paranoias',
-    'paranoics',
-    'paranoid-schizophrenic',
-    'paranoidly',
-    'paranthan',
     'paraodic',
-    'paraonline',
-    'parapacking',
-    'parapacks',
-    'parapet-deck',
-    'parapharyngeal',
-    'paraphernalia-dirty',
-    'paraphone',
-    'paraphrasability',
-    'parapluie',
-    'parapluies',
-    'parapocryptes',
-    'parapraxes',
-    'parapsid',
-    'parapsids',
-    'parapsychic',
     'paraptera',
-    'paraqua',
-    'paraquat-wielding',
-    'paraquay',
-    'pararan',
-    'pararge',
-    'pararnali',
-    'paras.12,15',
-    'paras.2.6',
-    'parasail',
-    'parascariasis',
-    'parascender',
-    'parascience',
-    'paraserianthes',
-    'parashites',
-    'parasitaemic',
     'parasite-blooms',
-    'parasite-hose',
-    'parasite-inflicted',
-    'parasite-specific',
-    'parasites/pathogens',
-    'parasitization',
-    'parasitizing',
-    'parasitological',
-    'parasitologists',
-    'paraskevas',
-    'paraskevi',
-    'parasoft',
-    'parasol-holder',
-    'parasoled',
-    'paraspinal',
-    'parasram',
     'parasternal',
-    'parastipes',
-    'parasuicides',
-    'parata',
-    'paratactic',
-    'paratactical',
-    'paratactically',
-    'paratectonic',
-    'paratex',
-    'parathormone',
-    'parathyroidectomy',
-    'paratone-boundary',
-    'paratone-final',
-    'paratype',
-    'parauaca',
-    'parauchenipterus',
     'paravane',
-    'parawings',
-    'paraxis',
-    'paray/detroit',
-    'parayno',
-    'parazoanthus',
-    'parbold',
-    'parbury',
-    'parc-le-breos',
-    'parcel-porters',
-    'parcel-post',
-    'parcel-string',
-    'parcel-tape',
-    'parcelforce/j',
-    'parceliza',
-    'parcellated',
     'parcellings-out',
-    'parcellis',
-    'parcellization',
-    'parcells',
-    'parcente',
-    'parched-looking',
-    'parchement',
-    'parches',
-    'parchine',
-    'parchman',
-    'parchmarque',
-    'parchment-knife',
-    'parchment-maker',
-    'parchment-makers',
-    'parchment-sellers',
-    'parchment-skinned',
     'parchment/paper',
-    'parchute',
-    'parchym',
-    'parcial',
-    'parciau',
-    'parclose',
-    'parcplac',
-    'parctical',
-    'parczew',
-    'pardalote',
-    'pardee',
-    'pardeep',
-    'parden',
-    'pardes',
-    'pardesi',
-    'pardessus',
     'pardiac',
-    'pardini',
-    'pardox',
-    'parease',
-    'parece',
-    'pareille',
-    'pareital',
-    'pareja',
-    'parejo',
-    'parelaphostrongylus',
-    'parellada',
-    'parellel',
-    'paren',
-    'parenateral',
-    'parencyhmal',
-    'parent&eacute',
     'parent&ndash;state',
-    'parent&rehy;support',
-    'parent-and-baby',
-    'parent-authorisation',
-    'parent-bank',
-    'parent-completed',
-    'parent-friendliness',
-    'parent-governments',
-    'parent-governor',
-    'parent-offspring',
-    'parent-oriented',
-    'parent-party',
-    'parent-speak',
-    'parent-staff',
-    'parent-subsidiary',
-    'parent-substitute',
     'parent-teacher-student',
-    'parent-with-custody',
-    'parent/governor',
-    'parent/s',
-    'parent/s.',
-    'parent/school',
-    'parent/staff',
-    'parent/student',
-    'parental-authority',
-    'parental-leave',
-    'parental/family',
-    'parental/teacher',
-    'parentfriendly',
-    'parentis',
-    'parentline',
-    'parentr',
     'parentral',
-    'parents&mdash;he',
-    'parents-out-of-law',
-    'parents.',
-    'parents.they',
-    'parents/lonely',
-    'parentship',
-    'parer',
-    'parere',
-    'paresse',
-    'paresthesias',
-    'paret',
-    'pareto-improvement',
-    'pareto-optimal',
-    'paretsky',
-    'paretti',
     'parfaitement',
-    'parfect',
-    'parfitts',
-    'parfum&eacute',
-    'parfumed',
-    'parfumeur',
-    'parfyonov',
-    'parfytours',
-    'parg',
-    'pargeted',
-    'pargiter',
-    'pargny-les-reims',
-    'pargo',
-    'paria',
-    'pariament',
-    'paribas/clerical',
     'paricard',
-    'paricularly',
-    'paried',
-    'parient',
-    'pariente',
-    'parients',
-    'parietals',
-    'parietaria',
-    'parietina',
-    'parification',
-    'parikh',
-    'parilia',
-    'paringaud',
-    'pario',
-    'paripalanai',
-    'paris&mdash',
     'paris&mdash;bonn',
-    'paris&ndash;orl&eacute;ans',
-    'paris&ndash;rouen',
-    'paris-\'that',
-    'paris-amsterdam-paris',
-    'paris-bercy',
-    'paris-bestiaux',
-    'paris-brussels-cologne-amsterdam-london',
-    'paris-built',
-    'paris-chauny',
-    'paris-educated',
-    'paris-fontenay',
-    'paris-lyon-marseille',
-    'paris-messageries',
-    'paris-moscow',
-    'paris-mus&eacute;e',
     'paris-mutuel',
-    'paris-normandie',
-    'paris-oriented',
-    'paris-orl&eacute;ans',
-    'paris-set',
-    'paris-soir',
-    'paris-style',
-    'paris-turf',
-    'paris-type',
-    'paris/amsterdam',
-    'paris/dacs',
-    'paris/london',
-    'paris/reading',
-    'paris/singer',
-    'paris/vienna/berlin',
-    'parise',
     'parisee',
-    'pariser',
-    'parish-register',
-    'parish-union',
-    'parish/area',
-    'parish/group/school',
-    'parished',
-    'parishenors',
-    'parishes.',
-    'parisian-born',
-    'parisian-style',
-    'parisiensis',
-    'parisis',
-    'parison',
-    'pariss',
-    'parit',
     'parit&auml;tischer',
-    'paritcular',
-    'paritions',
-    'paritns',
-    'paritors',
-    'paritsa',
-    'parity-violation',
-    'park&mdash',
-    'park&mdash;and',
-    'park&mdash;out',
-    'park&ndash;las',
-    'park&ndash;san',
-    'park&rehy;ing',
-    'park-and-culture',
-    'park-bred',
-    'park-fence',
     'park-going',
-    'park-land',
-    'park-style',
-    'park-type',
-    'park.picture',
-    'park/and',
-    'park/bath',
-    'park/car',
-    'park/leeds',
-    'park/navigator',
-    'park/oxford',
-    'park/retail',
-    'park/wheatley/oxfordshire',
-    'parkability',
-    'parkable',
-    'parkam',
     'parke-davies',
-    'parke/father',
-    'parke/mother',
-    'parked_over',
-    'parkengue',
-    'parker/campaign',
-    'parker/care',
-    'parker/corbett',
-    'parker/dental',
-    'parker/england',
-    'parker/insurance',
-    'parker/lumberjill',
-    'parker/resident',
-    'parker/southern',
-    'parker/usa',
-    'parker/vet',
     'parkerbowles',
-    'parkeriaceae',
-    'parkering',
-    'parkertex',
-    'parkes-hobart',
-    'parkes-tidbinbilla',
-    'parkes/thames',
-    'parkgrove',
-    'parkhave',
-    'parkhomenko',
-    'parkhouse/british',
-    'parkin\'',
-    'parking-area',
-    'parking-ground',
-    'parking-meters',
-    'parking-place',
     'parking-ramp',
-    'parking-spaces',
-    'parking-ticket',
-    'parking-time',
-    'parking-token',
-    'parkinson-hardman',
-    'parkinsoni',
-    'parkit',
-    'parkkred',
-    'parklea',
-    'parklike',
-    'parknasilla',
-    'parkright',
-    'parkroyal',
-    'parks-cramer',
-    'parks.the',
     'parks/conservation',
-    'parks/forest',
-    'parkstrasse',
-    'parkus',
-    'parkway-mandale',
-    'parkwell',
-    'parky-starn',
-    'parl.',
-    'parla',
-    'parlamentarischer',
-    'parlaphone',
-    'parlaying',
-    'parlby',
-    'parle/thames',
-    'parleg',
-    'parlementaire',
     'parlent',
-    'parlers',
-    'parleys',
-    'parlez-moi',
-    'parlezvousfrancais',
-    'parli',
-    'parliament&mdash;described',
-    'parliament&mdash;the',
-    'parliament-forty',
-    'parliament-government',
-    'parliament-labour',
-    'parliament-made',
-    'parliament/3',
-    'parliamentalis',
-    'parliamentarian:a',
-    'parliamentarism',
     'parliamentarization',
-    'parliamentary-division',
-    'parliamentary-electoral',
-    'parliamentary-level',
-    'parliamentary-wise',
-    'parliamentum',
-    'parlian',
-    'parlimentarian',
-    'parlington',
-    'parlors',
-    'parlour&mdash',
-    'parlour-car',
-    'parlour-game',
-    'parlour-game-and-flower-arranging',
-    'parlour-like',
-    'parlour-maid',
     'parlour-so',
-    'parlour-trick',
-    'parlt',
-    'parma.',
-    'parmalat',
-    'parmara',
-    'parmas',
-    'parmastoon',
-    'parmazzone',
-    'parmeliopsis',
-    'parmesans',
-    'parmet',
-    'parmi',
-    'parmigiane',
-    'parmigiano-jewish',
-    'parminder',
     'parmolive',
-    'parnassi',
-    'parnassia',
-    'parnassum',
-    'parnel',
-    'parnell/family',
-    'parning',
-    'parnon',
-    'paro',
-    'paroccipital',
-    'parochials',
-    'parochlus',
-    'parodiable',
-    'parodiae',
-    'parodic-travestying',
-    'parodistically',
     'parodists',
-    'parodius',
-    'parody-hymn',
-    'parody-mass',
-    'parody-young',
-    'parody_in',
-    'parois',
-    'parole-breakers',
-    'paroletta',
-    'parolfactorius',
-    'paronomasia',
-    'paronymically',
-    'paropsonemids',
-    'parotic',
-    'parotta',
-    'parouty',
     'parovshchikov',
-    'paroxysmally',
-    'paroxystic',
-    'parozzo',
-    'parp-parp.',
-    'parped',
-    'parping',
-    'parques',
-    'parr-i',
-    'parragon',
-    'parrakeets',
-    'parrallel',
-    'parralo',
-    'parravonese',
-    'parraxtut',
-    'parrel',
     'parri',
-    'parris/political',
-    'parris/times',
-    'parrish/father',
-    'parrish/mother',
-    'parriss/managing',
-    'parriss/transport',
-    'parritch',
-    'parrokeet',
-    'parroquets',
-    'parrot-',
-    'parrot-cage',
-    'parrot-crested',
-    'parrot-hoot',
-    'parrot-in-the-chimney',
-    'parrot-napped',
     'parrot-sickness',
-    'parrot-speak',
-    'parrot-type',
-    'parrotspitze',
-    'parrott/taverner',
-    'parroy',
-    'parrr-dy',
-    'parry&rehy;wingfield',
-    'parry/traditional',
-    'parsable',
-    'parser-grammars',
-    'parsifals',
-    'parsis',
-    'parsley-sprigged',
-    'parsley.',
-    'parson&ndash;naturalists',
     'parsona',
-    'parsonage-house',
-    'parsonical',
-    'parsonn',
-    'parsons-white',
-    'parsons/cheltenham',
-    'parsons/director',
-    'parsons/entertainer',
-    'parsons/former',
-    'parsons/widow',
-    'parsooraman',
-    'parss',
-    'parsy',
-    'parsystec',
-    'part&mdash;employment',
-    'part&mdash;retirement',
     'part&mdash;time',
-    'part(s)',
-    'part-18th',
-    'part-aboriginal',
-    'part-active',
-    'part-and',
-    'part-and-parcel',
-    'part-animated',
-    'part-apache.',
-    'part-apology',
-    'part-arab',
-    'part-arabian',
-    'part-autobiographical',
-    'part-baked',
-    'part-bank',
-    'part-basque',
     'part-belgian',
-    'part-blackout',
-    'part-braided',
-    'part-built',
-    'part-buy',
-    'part-cash',
-    'part-comedy',
-    'part-communist',
-    'part-concealed',
-    'part-contribution',
-    'part-copyist',
-    'part-covered',
-    'part-cut',
-    'part-defiance',
-    'part-deiran',
-    'part-develop',
     'part-dragging',
-    'part-dried',
-    'part-drunken',
-    'part-educationists_for',
-    'part-embedded',
-    'part-empty',
-    'part-english',
-    'part-exchanged',
-    'part-excitement',
-    'part-familiar',
-    'part-feigned',
-    'part-filled',
-    'part-finished',
-    'part-flexed',
-    'part-founded',
-    'part-fraternity',
     'part-french',
-    'part-fund',
-    'part-funding',
-    'part-georgian',
-    'part-goat',
-    'part-han',
-    'part-heard',
-    'part-hidden',
-    'part-history',
-    'part-horror',
-    'part-ideological',
-    'part-improvised',
-    'part-indian',
-    'part-instinctual',
-    'part-intended',
-    'part-issues',
     'part-kentish',
-    'part-kitten',
-    'part-load',
-    'part-lonesome',
-    'part-machine',
-    'part-man',
-    'part-manufactured',
-    'part-maori',
-    'part-mathematicians',
-    'part-miracle',
-    'part-models',
-    'part-modern',
-    'part-mystery',
-    'part-mystical',
-    'part-named',
-    'part-native',
     'part-object',
-    'part-obscured',
-    'part-organic',
-    'part-orgies',
-    'part-oriented',
-    'part-originator',
-    'part-pack',
-    'part-passive',
-    'part-payments',
-    'part-polymerized',
-    'part-privately',
-    'part-proposed',
-    'part-prose',
-    'part-qualified',
-    'part-question',
-    'part-raised',
     'part-random',
-    'part-rational',
-    'part-recorded',
-    'part-reds',
-    'part-review',
-    'part-revised',
-    'part-rime',
-    'part-ruined',
-    'part-russian',
-    'part-sell',
-    'part-settlement',
-    'part-settler',
-    'part-share',
-    'part-silk',
-    'part-singing',
-    'part-social',
     'part-spatial',
-    'part-specification',
-    'part-sponsored',
-    'part-statement',
-    'part-stone',
-    'part-structure',
-    'part-task',
-    'part-technical',
-    'part-thawing',
-    'part-the',
-    'part-thriller',
-    'part-time/distance',
-    'part-timeness',
-    'part-timing',
-    'part-titles',
-    'part-tudor',
     'part-two',
-    'part-used',
-    'part-verse',
-    'part-victorian',
-    'part-victory',
-    'part-volumes',
-    'part-we',
-    'part-week',
-    'part-which',
-    'part-work',
-    'part-workers',
-    'part-wren',
-    'part.it',
-    'part.that',
-    'part/i',
-    'part_as',
     'partable-with',
-    'partag&eacute',
-    'partaker',
-    'partamian',
-    'partan',
-    'partanen',
-    'partbooks',
-    'partbraddan',
-    'partch',
-    'partcular',
-    'partech',
-    'parted-off',
-    'parteien',
-    'parteienstaat',
-    'partement',
-    'parter',
     'parternity',
-    'parternship',
-    'parters',
-    'partes.',
-    'partesius',
-    'partfinanced',
-    'parth',
-    'parthenocissus',
-    'parthenogensis',
-    'parthenon-building',
-    'partholan',
-    'parti&rehy;cular',
-    'partial-hearing',
-    'partial-rom',
-    'partial-sightedness',
-    'partial1',
     'partialled',
-    'partially-aroused',
-    'partially-collapsed',
-    'partially-damaged',
-    'partially-democratic',
-    'partially-draped',
-    'partially-eaten',
-    'partially-excluded',
-    'partially-executed',
-    'partially-exempt',
-    'partially-filled',
-    'partially-open',
-    'partially-pedestrianised',
-    'partic\'ly',
-    'partic-ular',
-    'particals',
     'partici',
-    'participal',
-    'participant-analyses',
-    'participant-as-observer',
-    'participant-observers',
-    'participant-oriented',
-    'participants-asquith',
-    'participants/bodies',
-    'participate\'',
-    'participate.',
-    'participating.',
-    'participation&mdash;full',
-    'participation-minded',
-    'participation/activity',
-    'participer',
-    'participlan',
     'partickhill',
-    'particl',
-    'particlar',
-    'particlarly',
-    'particle(s)',
-    'particle-concentration',
-    'particle-induced',
-    'particle-laden',
-    'particle-shaped',
-    'particle-size',
-    'particle-to',
-    'particlely',
-    'particles.',
-    'particluarly',
-    'particolare',
-    'particualrly',
     'particuary',
-    'particul',
-    'particular-',
-    'particularily',
-    'particularis',
-    'particularises',
-    'particularisme',
-    'particularists',
-    'particularizing',
-    'particularlisms',
-    'particularly&mdash',
-    'particularly_in',
-    'particularly_with',
-    'particularly_with_regard',
-    'particuler',
-    'particuli&egrave;res',
     'partida',
-    'partidas',
-    'partidura',
-    'parties&mdash;except',
-    'parties&mdash;should',
-    'parties&mdash;the',
-    'parties-',
-    'parties-labour',
-    'parties-leaving',
-    'parties-lloyd',
-    'parties.',
-    'parties/4',
-    'parties_from_time_to',
-    'partiescalled',
-    'partin\'',
-    'parting-gift',
     'partingtons',
-    'partir&ograve',
-    'partisanly',
-    'partisanships',
-    'partish',
-    'partisian',
-    'partition(s)',
-    'partitional',
-    'partitionist',
-    'partitipated',
-    'partitition',
-    'partiya',
-    'partlet/neighbour',
-    'partly-completed',
-    'partly-constructed',
-    'partly-demolished',
     'partly-driven',
-    'partly-elected',
-    'partly-enclosed',
-    'partly-european',
-    'partly-finished',
-    'partly-folded',
-    'partly-formed',
-    'partly-gilt',
-    'partly-liquid',
-    'partly-made',
-    'partly-open',
-    'partly-open-to-the',
-    'partly-opened',
-    'partly-paralysed',
-    'partly-restored',
-    'partly-saline',
     'partly-sighted',
-    'partly_because',
-    'partner-in&rehy;residence',
-    'partner-in-mission',
-    'partner-swapping',
-    'partner/employee',
-    'partner/friend',
-    'partner/lover',
-    'partner/s',
-    'partner/senior',
-    'partner/workhorse',
-    'partners&mdash;for',
-    'partners&mdash;many',
-    'partners/32',
-    'partners/competitors',
-    'partners/families',
     'partners/managers',
-    'partners/the',
-    'partnersee',
-    'partnership\'',
-    'partnership.',
-    'partnership/recognised',
-    'partnerships.',
-    'partnerswhether',
-    'partos/rural',
-    'partout',
-    'partriarchal',
-    'partridge-sized',
-    'partridge/owner',
-    'partridge/pilot',
-    'partridge/transport',
-    'partrilineal',
     'partrimony',
-    'partrych',
-    'parts-and-labour',
-    'parts-each',
-    'parts-of-speech',
-    'parts-only',
-    'parts-per-billion',
-    'parts-suppliers',
-    'parts-to',
-    'parts.',
-    'partsfile',
-    'partspck',
-    'parttested',
-    'parttiled',
-    'parttim',
-    'partty',
     'parturitions',
-    'partus',
-    'partworks',
-    'party&mdash;cp',
-    'party&mdash;ip',
-    'party&mdash;islamic',
-    'party&mdash;just',
-    'party&mdash;mlp',
-    'party&mdash;pp',
-    'party&mdash;pte',
-    'party&mdash;renamed',
-    'party&mdash;sdp',
-    'party&mdash;see',
-    'party&mdash;the',
-    'party*',
-    'party-20th',
     'party-austen',
-    'party-backed',
-    'party-building',
-    'party-changing',
-    'party-coloured',
-    'party-communists',
-    'party-cum-discussion',
-    'party-defined',
-    'party-eating',
-    'party-game',
-    'party-givers',
-    'party-giving',
-    'party-hater',
-    'party-hoppers',
-    'party-iranian',
-    'party-like',
     'party-linked',
-    'party-lovers',
-    'party-managers',
-    'party-member',
-    'party-national',
-    'party-new',
-    'party-or-die',
-    'party-organized',
-    'party-owned',
-    'party-pieces',
-    'party-point',
-    'party-politics',
-    'party-popper',
-    'party-poppers',
-    'party-rp',
-    'party-run',
     'party-seven',
-    'party-solidarity',
-    'party-sophisticate',
-    'party-spirit',
-    'party-splitting',
-    'party-stopper',
-    'party-style',
-    'party-the',
-    'party-thrower',
-    'party-throwers',
-    'party-turns',
-    'party-type',
-    'party-union',
-    'party-unity',
-    'party-vested',
-    'party-wall-parapet',
     'party-wide',
-    'party-wise',
-    'party-within-a-party',
-    'party-worker',
-    'party-wrecker',
-    'party-youth',
-    'party.',
-    'party.38',
-    'party/african',
-    'party/enterprise',
-    'party/government',
-    'party/group',
-    'party/union',
-    'party2',
-    'party35',
-    'party5',
     'party6',
-    'party69',
-    'party:meghalaya',
-    'partyaziz',
-    'partyette',
-    'partyin\'',
-    'partymudber',
-    'partyocracy',
-    'partyrassoul',
-    'partysami',
-    'partywear',
-    'paruir',
-    'parun/knight',
-    'paruri&egrave;re',
-    'paruyr',
-    'parvalues',
     'parvats',
-    'parvenue',
-    'parvez',
-    'parvifolium',
-    'parville',
-    'parving',
-    'parvipontanus',
-    'parvitas',
-    'parvoleta',
-    'parvoviruses',
-    'parwez',
-    'parystec',
-    'parzival',
-    'parzynski',
-    'pas&oacute',
-    'pas-ce-soir',
     'pasaje',
-    'pasanggrahan',
-    'pasante',
-    'pasar&aacute;n',
-    'pasarell',
-    'pasargadear',
-    'pascalian',
-    'pascaline',
-    'pascalis',
-    'pascals',
-    'pascendi',
-    'paschali',
-    'paschalis',
-    'paschasius',
-    'paschi',
-    'paschke',
     'pascin',
-    'pasdar',
-    'pasdaran-e-enqelab-e-eslami',
-    'pasdas',
-    'pases',
-    'pasewalk',
-    'pashane',
-    'pashewar',
-    'pashion',
-    'pashka',
-    'pashu',
-    'pashukanis',
-    'pasikale',
-    'pasino',
-    'pasiphae',
-    'pasjes',
     'paskett',
-    'pasley',
-    'paslick',
-    'pasoh',
-    'pasok&mdash;panhellenic',
-    'pasolinis',
-    'pasqual',
-    'pasqualino',
-    'pasquil',
-    'pasquinade',
-    'pasquini',
-    'pasquirolo',
-    'pass&eacute;io',
-    'pass&eacute;s',
-    'pass&egrave;rent',
-    'pass-band',
     'pass-by',
-    'pass-card',
-    'pass-codes',
-    'pass-lists',
-    'pass-mark',
-    'pass-or-fail',
-    'pass-out',
-    'pass-the-parcel',
-    'pass-the-press',
-    'pass-walk',
-    'pass-words',
-    'pass.i',
-    'passacrassana',
-    'passade',
-    'passage-graves',
-    'passage-money',
     'passage-ways',
-    'passage-work.',
-    'passagem',
-    'passagenwerk',
-    'passaging',
-    'passagings',
-    'passaloecus',
-    'passang',
-    'passant',
-    'passap/pfaff.',
-    'passaro',
-    'passauer',
-    'passback',
-    'passburg',
-    'passco',
-    'passcode',
     'passed-by',
-    'passed.the',
-    'passega',
-    'passeggiate',
-    'passeggiati',
-    'passel',
-    'passen&rehy;ger',
-    'passeng',
-    'passenger(s)',
-    'passenger-',
-    'passenger-boat',
-    'passenger-carried',
-    'passenger-jet',
-    'passenger-level',
-    'passenger-liability',
-    'passenger-side',
     'passenger-space',
-    'passenger-steamship',
-    'passenger-to-be',
-    'passenger-tube',
-    'passenger/freight',
-    'passengerless',
-    'passengerrailway',
-    'passengers/escape',
-    'passengers_on',
-    'passenges',
-    'passerelle',
-    'passeres',
-    'passeri',
-    'passeries',
-    'passerinum',
-    'passeront',
     'passers-',
-    'passers-through',
-    'passers.by',
-    'passes.',
-    'passetoutgrain',
-    'passey',
-    'passibe',
-    'passibus',
-    'passic',
-    'passievaart',
-    'passignano',
-    'passing-bell',
-    'passing-motorist',
-    'passing-notes',
-    'passing-out-parade',
-    'passing-place',
     'passing_out',
-    'passingham',
-    'passingham/graham',
-    'passinontide',
-    'passion-exuding',
-    'passion-filled',
-    'passion-flowers',
-    'passion-hemisphere',
-    'passion-less',
-    'passion-merchant',
-    'passion-mind',
-    'passion-packed',
-    'passion-ridden',
-    'passion-settings',
-    'passional',
-    'passionate-looking',
     'passionateness.',
-    'passionels',
-    'passionflower',
-    'passionfruit',
-    'passive-like',
-    'passive-matrix',
-    'passive-obedience',
-    'passive-oral',
-    'passive/aggressive/assertive',
-    'passive/female',
-    'passivize',
-    'passivized',
-    'passman',
-    'passmores',
-    'passnegers',
-    'passnidge',
     'passnip',
-    'passotho',
-    'passout',
-    'passover-time',
-    'passow',
-    'passpic',
-    'passport-photo-booth',
-    'passport-reading',
-    'passport-style',
-    'passport-type',
-    'passport.',
-    'passport/tickets',
-    'passported',
-    'passsages',
-    'passthe',
-    'passway',
     'password-protected',
-    'past&mdash;not',
-    'past-and-future-catastrophe',
-    'past-apart',
-    'past-few',
-    'past-history',
-    'past-it',
-    'past-master',
-    'past-participant',
-    'past-scratch',
-    'past-the',
-    'past.he',
-    'past/present',
-    'pasta-eating',
-    'pasta-loading',
-    'pasta-loving',
     'pasta-plonkers',
-    'paste-like',
-    'pasteable',
-    'pasted-up',
-    'pastel-blue',
-    'pastel-brown',
-    'pastel-hued',
-    'pastel-jacketed',
-    'pastel-pink',
-    'pastel-tinted',
-    'pastelike',
-    'pastelle',
-    'pastelled',
-    'pastely',
-    'pastemate',
-    'pasters',
     'pasteup',
-    'pasteur-lyon',
-    'pasteur-merieux',
-    'pasteurising',
-    'pasteurizing',
-    'pasti',
-    'pasticci',
-    'pastiche-like',
-    'pastiched',
-    'pastides',
-    'pastilla',
-    'pastin\'',
-    'pastinaca',
-    'pastino',
-    'pasto',
-    'pastoor/teacher',
     'pastor-father',
-    'pastor-type',
-    'pastora',
-    'pastoral-academic',
-    'pastoral-agricultural',
-    'pastoralisation',
-    'pastorelli',
-    'pastorie',
-    'pastorino',
-    'pastoris',
-    'pastorius',
-    'pastose',
-    'pastrami-free',
-    'pastrano',
-    'pastranu',
-    'pastras',
     'pastries_in',
-    'pastroudis',
-    'pastruccio',
-    'pastry-based',
-    'pastry-board',
-    'pastry-cutting',
-    'pastry-shop',
-    'pastrycutters',
-    'pastrymen',
-    'pastrywork',
-    'pastten',
-    'pastukhov',
-    'pasture-farming',
-    'pasture-flowers',
-    'pasture-lands',
-    'pasture-reared',
     'pastures.just',
-    'pastures/meadows',
-    'pasty-coloured',
-    'pasty-list',
-    'pasty-looking',
-    'pasty-skinned',
-    'pasty-white',
-    'pasu',
-    'pasundan',
-    'pasvol',
-    'paswan',
-    'pasztor',
-    'paszynski',
-    'pat&eacute;e',
-    'pat-ball',
-    'pat-pat',
     'pat-pat-pat-pat-pat-pat-pat',
-    'pat744',
-    'patagia',
-    'patagon',
-    'patagones',
-    'patagonica',
-    'pataila',
-    'patak',
-    'patallel',
-    'patane',
-    'patara',
-    'patarine',
-    'pataudi',
-    'patay',
-    'patch-covered',
-    'patch-hall',
     'patch-owner',
-    'patch-pipette',
-    'patch-through',
-    'patch.',
-    'patcha-mama',
-    'patchcoks',
-    'patchcord',
-    'patched-in',
-    'patched-together',
-    'patchell',
-    'patches-on-the-elbow',
-    'patches.',
-    'patchet',
-    'patcheu',
-    'patchier',
-    'patching-up',
     'patchings',
-    'patchog',
-    'patchwork-quilt',
-    'pate-job',
-    'pate/upon',
-    'patefield',
-    'patel/banbury',
-    'patel/booker',
-    'patel/henley-on-thames/oxfordshire',
-    'patel/northampton',
-    'patel/stoke',
-    'patelisio',
-    'patella-tibia',
-    'patellar',
-    'patence',
-    'patency/occlusion',
     'patency/pcclusion',
-    'patent&rehy;pending',
-    'patent-ability',
-    'patent-applied-for',
-    'patent-based',
-    'patent-holder',
-    'patent-holders',
-    'patent-pending',
-    'patentright',
-    'patera',
-    'paterae',
-    'paterases',
-    'paterculus',
-    'paternalism/maternalism',
-    'paternalist\'',
-    'paternalist-collectivist',
     'paternalistic/maternalistic',
-    'paternally-caring',
-    'paterra',
-    'paters',
-    'patesians',
-    'patet',
-    'path&eacute;-fr&egrave;res',
-    'path&gt',
-    'path-',
-    'path-based',
-    'path-clamp',
-    'path-clearing',
-    'path-counting',
-    'path-edging',
-    'path-finder',
-    'path-finders',
     'path-length',
-    'path-node',
-    'path-side',
-    'path-smothering',
-    'path-way',
-    'path=c',
-    'pathah.',
-    'pathay',
-    'pathbreaking',
-    'pathed',
-    'pathephone',
-    'pather',
-    'pathes',
-    'patheticness',
-    'pathetics',
-    'pathfind',
     'pathhnders',
-    'pathia',
-    'pathirane',
-    'pathklear',
-    'pathlength',
-    'pathnames',
+)
+
+blocks_63 = (
+    '$#mer#"ed$!l$#nda$$ries$"st#%ibile$!d$"ss$#tor%!t#!s"<s&aacute;ggy&uuml;l&eacute;s#"e.$!s',
+    '#+ini-colonna$$ppos#!k$"ov#!o$"ni##ted$"on#;z&aacute;gg&uuml;l&eacute;s$%aghaz"*t&iacute;n#(a&ccedil##eil$#lli$!r',
+    '#$hids$*o-chemical%%ceras&#ide&#one&$reme%+diagnostics&\'ontists\'"ox\'*x-catholic)\'science(,/rationalist(!i("y\'&!x',
+    '&%neiss+"es&(onalises*!s&$rade%\'keraten%#mat&&orphic+"sm%*paedically*"st&%eadic\'$dics&)hosphates+$oric',
+    '&$tist%)quartzite%\'thecium&%ropic#$igia$"z-&)navarrete&&patino#$lieb##man#%odoxo$$lani$&nesque%!y$\'thecium',
+    '#"us##wed#$ygia"%usese##val"#val#"id$!s"#wel%,l&rehy;blair&&/waugh&,ian-sounding+$peak&!s##ood',
+    '"!x")yctolagus#)ol-gryazi##xes#"za"<z&aacute;ggy&uuml;l&eacute;s#)el/sister!#s-2##900#!n#&offset"".2##61h"&/2-lan%,presentation',
+    '#$9000#"nd"!2"&=1.060"(a-offset#$dchy#$fune#(georange#"ki##mah$!u##nna##rio&$/age#$suna',
+    '$$ston#$erht%"to#"om$*rne-mendel\'!/(\'anthony)%uthor(&jockey($ward\'!s%$ough$%urnby\'*e-produced(&/clerk',
+    '"-car-accoladed&%night\'&ominee&\'proofed%$less#)hersleben#*illations/&,oscope-style#$opic#!r#\'ulating\'#ory$%ridad&(t&agrave"#dae',
+    '#!e$!n##ney$$gell$$tons#!p##tia&"ns#"va#"ye")f-derived$(endorsed$#usl#*/1-for-ace&(on-alpha',
+    '&+ultrix-open%".0&!2$!2$!l$"ui#!1##ers#!i"%godby$%thorp"#hac$!p$%rovka$"wa',
+    '##ige$#mai%%ensis$%vello#$ogbo#$tava",i-compatible$&tcp/ip#$/tcp#$bisa#!c#!i#+jek/croatia#"mo#"os',
+    '%,s-isis-horus\'&shaped$"us#$tive"-jaagriculture"(karshamn"$land#$eset$!y#"in$$zlok#\'o-based$%fjord"$mace$#n\'s',
+    '%$thus#!c#$enia$$rley#&icated$!n%$gton$\'um-poor#!o$&meters$(nd/local\'&thames$#sin$\'therapy#$unda',
+    '&$ueck"%ofsky#"go#"me#!n#\'stowicz##zly"#p-1#$ring"$saia#%emens$#ous$&rvanti$!t%,e-controlled',
+    '.$etia#$iach%#tuc$%fying##ola%%inski$"ms#&uaries$%lston"\'t-fjord#$anes$!r%\'beiters$$shek#+bataillonen',
+    '#)challenge#)eichthyes$!l$(n-sacken%%daise&!e%\'ecrosis%!s&"am&/ible/mainstream&#ory$(o-pontin%)arthrosis%*chondritis&#yte',
+    '%"id%&lepsis&&ogists&$ysis%(necrotic%%penia%/sarcoma-derived&%perma&&tracan%&tomies$\'porosis$%rburg%$c(f)%$feed&$ield',
+    '%$mann%!n%(oporosis%)reichring&$ieth%$tags&$orte$%uropa#0fr&auml;nkischen#*hausmuseum$(motherly#!i$!g$$oles$#tis',
+    '#\'landers$!e#*oji&cacute$"my$$rius#*r&oacute;w$*aciontidae\'#ses&"od(!e)"rm%"ea%-kism&oacute;s\'"zo&"on',
+    '$+ea-gryphaea$\'ich-egg(,head-in-sand(%sized%!n$!o%$goth%$leka%$umov%$wksi#!s$\'chliefe#!t#$yaks"#ulf',
+    '#!n#!s"\'valdova#,oboditelnaya$$enie"%walds\'&tonian&-twis&rehy;tle#+estry-based#%iecim##old"!x#!.!,t&aacute;vio"(-ay-liya',
+    '#$ined#!r$!d##vio")chiwitchi%#zna"#der"$eiza#!n$$tial#!r$"ey$!s#!y#!z',
+    '""ha$!m$%pedic#"ea$!l%\'lo-like$\'r&mdash+";a&.rehy;socialism++worldliness%"\'s%***003.12.9%(-centred&\'dialect&#end',
+    '&$much&$name&(oriented&\'people-(%rhaps&#sex\'0ide-of-the-world\'!o&0than-spectacular("ey&&wordly)%ldish%!.&#and&"of',
+    '(!t&\'similar%-013.14.44,905%-_,_other_than&*other_than%-appropriately%+departments%"es%#ing&"se(!d%%local%2ness-across-gender)!.%"on',
+    '&!\'&!+&!-\'$this\'%v-eli&#.59\'#she\'#the&-1,30014.018.7&(2.32.600&$3740%%wares&,ise&mdash;it)!-*%clean',
+    '$!t#"gr#$mani&"li%!r%"yr#$niel#$odox$%lites$!n%#ial$&tenies"-ididae-oddity##lia#"on',
+    '#)s/parsons"&jihase"!k"#let##ier"%night#(osheniia"$ocom$#yon##kar#.laryngological.#sts$%ogist##mar$%yinae',
+    '##pen#3rhinolaryngologists2!y#(toxicity"&ricoli#\'okovice"#sar#!u"(t&oacute##ama$"vo$/wa&ndash;orilla#&enburg%!s$&r-skin',
+    '&"ur%$hill%"lo%%sdorf&#kin%&vanger&#ein$#sen#$hard#%inger&#ham%!o#(o-crepin%(of-roses$&beuren',
+    '$"ia$2man&mdash;habsburg\'\'-mamluk\'#ize%$ised%$ores$#nel&"um%\'iirolia$$rino$!s$(wa-based&!y#(ronin\'ny#$ways',
+    '#\'inowski"!x"!z!&uabain#%chita##dda$%raogo%$igam#\'ngraoua##rka#$tara"(banguien*&-parti#!c#$ilin',
+    '""ca#"hy#"in#$nilc",d-loosdrecht#\'enaarde&"rd$%rkerk"$eddi$!s#(enshithe#$lett#+n-les-docks#"ry##sso',
+    '"!f"!g#$enia##ht\'%!-&+bindingness&/to-be-condemned%&ershaw&"st%$ness%\'rington%"ta##ier#)odogoland$#ure',
+    '$"re")houmoudou""ir##set""ka##sel""l\'#!g#$ines##ook#$ston")m-el-rbia#\'aldaaya$,n&ccedil;off#\'umbered',
+    '$\'es.pets&\'/gallon#"ds#$sted"\'ologuem"#put""r-$#own$%story$&wildly#!/$"my#%agons$)ng-outang%)opithecus',
+    '#"ed##ier#%jills#$land#&oboros$\'riginal#%ranch#"s.$"_a$"el&!s%!n%$vles$#ian%!n',
+    '$$tory"(s-minded#%e-ure$$gate#$sera%!t#$ters"-t&mdash;about*%dated*$your$$rehy(&;dated*#oor)\'guessed))manoevred',
+    '*$oded)%of-it)\'patient*&ointed)&spoken)$wash#"\'a%"rd#&-\'live$*accelerate-#ing&#ted%$live%0nd-out-all-round,)royalists',
+    '%\'t-elbow$\'baskets%\'landish&#uff)"ed%#oot&#und&"wl&#xed%$reak&#ibe$*chattering%$limb%(ommuting%#rop',
+    '&\'umpling&!y$+departments&%viate%\'imbleby&(stancing%$oors%$rank&#ink)#ing\'$ving&#ove$#eat%(nglished%&volved',
+    '(!s&#xed%%enced%$ield)!s&$shed%#low(!s&#ung&#ynn%"or&!x$*generalled%$lare%%oings',
+    ')!s$&handle%$ikes%%ouses(#ing$!i%)nspection&%vests%%sland$$just$$lean%$ived%$obby&"ud%$ying',
+    '&*noeuvering+#res,#ing&#rio\'%riage%(igrating$$ness%\'iggered%%umber*#ing&%rsing$1of&rehy;condition&\'-action((lignment\'$cell',
+    '(#ity(&ountry\'$door\'%gauge(#ear\'(hearings\'"it\'\'keeping)!y\'$laws(#ine($oves\'$mind\'\'oneself\'(position',
+    '\'(sessions($tock(&ubject(#ync+!h\'(the-norm+.practical-swim+%usual+&wayish,$orld*#box(1ouch-with-reality)$wner-!s(#rim',
+    '\'-work-donation\'=your-heads-is-the-place-to-be&\'towners%!r&\'ganized%(ttomaned$%paced\'#ing&$rish\'"ty&%yment%%edant&(nsioners&*rformanced%&lanned',
+    '%\'ointing&$lled&"rt&#sed%$rice&&oduces\'$mise\'&spered%%ulled&!t\'#ted$-quarterbacked$$race&"nk("le',
+    '&,spectability%%idden\'!e&#ght%&unning$$sang%\'ervants(#ing%$hoot\'%uting%%kirts%$mart%&ourced%#pin&#oke',
+    '&&rinted*#ing%(quealing\'#int%%trips&$yled%$wing)"er+!s$$talk("ed&%ntrum%"he\'"re)$ness',
+    '&&-lunch%%raded\'"ys&!o%%urned%#wee$(victored%#ote$%weigh\'"rd%$hich&!o%(intering%(oodstock$&yields',
+    '$\'picture$)qualities$\'richard$%simon%#uch$$that&!e&#ree$)wimbledon#+/distribute%)o/provide$\'managed$#put$$thru#\'1/scale',
+    '$!5#"37#"42#"85$!7#2_,_i_got_it_out_of&.took_me_out_of$!a%\'nything%!s&%_well$&erm_of$)no_matter$"on#(balances',
+    '$$last%%uffed$+oard-facing)*motor-free%$und.%"wl%#xed$%reath$,urst_because&"ts#!c$#amp%&st.the$%entre$"ha',
+    '$*idence-for*".1$&lasses$&ome(s)\'&-based\'!.&$ings&"ne%&njured$&ropped&$ssed#)distances$,oor-clothing(&minded(&reared',
+    '\'$smen$$rawn%#eam%#ive\'#ing%#ove#!e$!d$*r-covering&#gap(&rments&,metropolitan&&office&$ring&&suburb',
+    '%$coat%%graff%%lying#%faces%&x-been&"ed\'!s$\'ielders(#ing%&ghting%"ll%"t.$%lanks%&ooding%!y',
+    '$"ox&#ing#\'girthed$%raded%%ossed(#ing&"wm$$uess("ed(#ing%%nning#\'hitting$&ousing##in\'%!e',
+    '$$side#&jabbed$&umping%%tting#!l$#aid%$ndos%$wed.%)y/pricing$&eaning&#ped%#nds%-ts/take-aways$#ife%$ned.',
+    '$$ook.##man&&eouvre&)oeuvreing\'\'uevring%\'rtyring%#tch(#ing$&igrate#*of-the-way$)utweighed#(pandered$,ersonoeuvred$%laced$$oint',
+    '%\'uchings$$rice(!d%&oduces$"ts$"ur%,t&mdash;more&!\'&#(s)&&-basal*"ed\'#led\'\'related\'\'setting(%ignal',
+    '\'#the\'+utilization&\'/buried\'\'capital\'(employee\'&person\')standards&23,270,00037.1%6.5%&0878,00018.9%3.5%#$quip#!r$$age\'\'--at-intrusion\'+/dissonance\'%d-of-',
+    '*%ly-by%$mped$&eached%$mer\'$%ights%!m$\'ollings$#ule#$s(u)$!.$\'alaried%"ng$#eam%%rving$\'hadowed',
+    '%$oots&"ts&"ut(#ing$"id&\'e&mdash\')-cylinder0"ed($from(%level(#out\'&r-hack($hood&"fe%$nned',
+    '$\'ketched%#irt("er$$lide$$niff$,pan-wielding\'#ned%#end%%layed%$rint)"ed$%tares&$ying%(retching$#ung',
+    '%"im#\'terside$&hought$"tt#&ukumpo#$vied#$wale%#rd-((directed(\'opening)\'riented(\'sainted)&eeming)\'lanting\'+ly-directed',
+    '%#tch$%eight%"nt$%orker&"ld(!s#%yield("ed""ur"$vert&!e&!s&#ure#$rage\'!s',
+    '$+i&egrave;re%!e&"re\'!s"!w"#zon$!u!$v-10".a-enthusiastic#-l&rehy;shaped$&-ended%&headed%\'planned%\'section$!e',
+    '%!s$#oid$%tinie##mbo#%ngkol%"ol#2odvykdgxdekrvmoggs#"ta$)ion-based$\'oscutum"\'ejector#$n(s)$(-cleaner&&ontrol%%dried',
+    '%%fresh%&gloved*!s%#pot&$roof%(roasting%\'scourer$".i$$bird$$dale$#ell$&lights$$room#.r&mdash;riding%)ndash;50s',
+    '%\'pound;6%$rehy)$;50s*#65s**absorbency+#ged+(mbitious+\'nalysis*$came,%ution+*ontrolling*)developed+(ominated*,enthusiastic+&xalted',
+    '*&flowed*(generous+&razing,&inding*\'hanging*(indexing-\'ulgence,&flated,)tegration*)literally*$paid+\'ersuade+\'owering+)roduction*(reactive',
+    '++omanticised+$uled-#ing*(shadowed0#ing+.implifications,"ze.!d+%tated/$ment,(ructured+)ubscribed*%taken*+upholstered*(whelming',
+    '$!\'%&-taxed$)-&pound;2%//under-spending%"12\'!s&!4\'!s&!8%"21&!6%"60%$80s.&!5\'*-year-olds',
+    '%(abrasive\'&sorbed(%tract-$ions\'&undant&)ccustomed\'%hieve,!r+#ing\'#ted(#ion&\'djusted\',ministration\')venturous&)ggressive',
+    '&$ller(\'ocation/!s(!s\'&truism&(mbitions&,naesthetised(&lysing\'\'d-under\'%other\'(ticipate\'\'xiously&&pplied)!y()reciation',
+    ')\'obation&&roused\'&ranged&!s\'\'serting,"ve.$ness(&isting&\'ttached(&ention,"ve&(udacious&&verage%(balances&(earingly',
+    '\'&nefits&(leaching($ssed&%oiled\'"ld)"ly)$ness\'\'mbarded\'$oked\'$rrow\'#und&%reath+#ing(!d\'$idge',
+    '\'$oked(%wning\'%usque&&undled\'(rdensome(.eaucratization(\'geoning\'!y(#ing%$call\'&nvased\')pitalised-&zation\'(rbonated(&efully',
+    '\'\'utioned+$usly&)elebrated-#ing\'(nsorious(#tre\'&rebral&)hallenged(#rge*#ing()stisement(#tty\'#eck\'#ill\'$ummy',
+    '&#lad($rity\'#ear\'#ose\'%ubbed*#ing)!s(#msy&#oat)"ed)#ing)!s\'&hesive-$ness\'/llateralization',
+    '(%oured\'/mmercialisation(*passionate)&lexity*\'ication\')ncentrate/#ing*%ptual()ditioning(&gested(*sideration)(olidated/#ion)\'picuous((tentious',
+    '*(ibutions*%olled\'#oks($ling((perative\'$pied\'%rrect,#ion\'"sy\'#unt&(riticism%&daubed&,ecentralized((lamatory(\'oration',
+    '*%ition\'(liberate)%vered\'%nsify\'(pendency(%loyed+$ment\'$sign+"ed\'(termines\'%velop,#ing&(iagnosed)(rammatic\'(sclosing',
+    ')$ount(\'tension)&ortion)\'ributed&\'ogmatic\'"or\'#ses&)ramatised,#zes-#ing($wing)!n\'#ess*#ing\'%ivers',
+    '(#ing&"ue\')plication%\'earnest,"ly(!s\'"sy\'$ters(#in\'&%dited\'%ucate&(fficient(%usive&\'ighties&\'loquent',
+    '+#ing(*ellishment((roidered.!s\'&phases+$izes-#ing*\'tically(&loying&(nergetic*$ized\'$gage\'&riched\'\'thusing&+xaggerating',
+    '*#ing\'&ercise-!d)#ted\'\'hausted,#ion((uberance\'$pand*$sive(%licit)&oitive(#ose(&ressed\'%tends*%sions',
+    '%+fashionable(+tidiousness\'%tigue($ness&\'eatured\'\'rtilise&#ill)!s(#med\'"ne\'%tness(#ted\'#ves&)lattering\'%eshed',
+    '(#wed\'$ying&\'ocusing\'&ndness\'&rcibly(&mulaic&,ragmentation\'&equent("sh%\'gearing\'%neral,$ises-&zation.#ing+#ted',
+    '*%ously(#tle&#own&*ranulating\'$easy("en\'%oomed(!w)#ing%$hand)$ling\'#rsh(&vested\'"ul&&earing',
+    '\'$dged&#ype%!i&-deologisation&*magination\'%bibed\'%press(&ulsive&&n-love\'&debted-$ness)!x*%ation*"ed*#ing',
+    '\')flammable*$tion)%uence\')quisitive\'&sisted,#nce-!t(*titutional(&urable\')tegrating)(llectual)#nse+#ive)&rested*$fere',
+    '."ed.!s(&rusive\'\'vention($oice+#ing&(rritable&%ssued%(judicial%$kind)(-hearted)"ly&$nead(!e%%laden',
+    '\'%yered&&eaning\')gislating\'\'isurely\'(veraging&&iberal,#ism-&zation\'(fe-sized\'#ght*"ly\')teralness\'&veried&#oad)#ing',
+    '\'#rds*#hip\'$udly\'#yal&$unch\'\'xuriant%%makes\'%naged(%nered(!y\'%pping\'$rked\'%scara\'#tch("ey',
+    '\'$uled\'*ximization&)etallised(+iculousness&-ineralization&\'odelled(&ulated\',rphinisation%%naive*"ly&\'egative&"or%*obsequious)$ssed+#ion',
+    '&(fficered*(iousness&"il&&rdered*#ing*"ly\'(ganising\'%nate.%(packaged+#ing)"ed\'&inting\'&mpered\'\'n-fried\'+rameterised',
+    '\'*ternalized&\'edalled\'\'rfectly(\'missive(\'sistent)$onal)%uaded,#ing\'$tted&\'hysical&$iety\'%tched&&lanted\'#ush&Folite/over-apologetic/over-subservient',
+    '\'%mpous\')nderously\'%pular\'&sitive\'!t\'&wdered&\'raising\'\'ecepted)\'ipitate(&dation)$icts(*occupation-#ied((paration+"ed',
+    '-#ing)\'surized.#ing\'"im((vileging(#zed\'%ocess,#ing($duce(-fessionalised))itability-"le(*liferation(&nators)!e',
+    '(\'sperous("ud()vided-for&/sychologization&&umping\'%rsuit%.quantification%&r-r-rl&%acing\'%dical\'&refied\'+tionalistic&%ecord\'%fined+$ment',
+    '(+ularisation-"ze+$tory\'%laxed(%iable)\'giosity\'\'porting(+resentative(&utable\'%scued(\'onantly)%urced(\'pectful(#ted)\'oration',
+    '+#ing)\'raining\'\'tention\'$vved\'&warded&\'ibboned\'&dingly\'!m\'%nging\'#sky\'#vet&&olling\'&mantic-#ise0!d',
+    '\'%ofing\'$uged&%udder\'"gs\'$ling%)salinated($ting\'%mpled\'(nctioned(%guine(&itised\'$uced\'$ving\'!w&$cale',
+    '(&ttered\'\'hematic\'(ientific\'&rawled(%ipted(\'upulous&"ea\'\'cretive\'\'lection\'-nsationalised)\'ibility(\'tencing\'\'venties)"re\'&xiness',
+    '($ring\'#irt\'+oulder-high\'$rewd&$ixty\'$zing&%lowly&%mooth&#now&&oaking($ping\'(cialised\'"ft)%ening\'"ld',
+    '\'"on&-pecialisation-&zation."ed(%eding(&ndings\'$iced(*ritualized\'&lendid\'&raying&%quare&\'taffing($mped(,ndardisation("rk',
+    '\'%epped\'\'imulate-#ing+"us\'$rain(&enuous)%tches(#ict)%ngent(\'uctured-#ing)"ng\'#udy(%ffing\'$yled',
+    '&)ubjective(&sidise\'(pination()plemented)#ort)\'ression\'(spension&\'waddled\'+eet-anemone*$ness\'#ing*#ing&.ympathetically\'(stematic%(tailored',
+    '\'%lking\'&xation&(echnical\'$nsed&#hat\'%e-air)*benny-hill)$calf)$desk)\'glasses)\'horizon)$moon)$neck)%phone))telephone',
+    ')\'weekend((oretical(#top\'(ickening(%nning\'$rees(#own(#ust&#idy\'$pped)#ing\'\'redness\'(tillated&$ones\'%pping',
+    '($ined\'\'eatment(#bly\'#ied\'%umped(%sting&#urn)#ing&%wangy%$uses&*tilisation%)varnished&*enturesome\'%rbose&(igilance',
+    '\'%olent\'%sible%&washed&#eak($lthy\'%ening\'&ighted&&illing\'%nters&#ork&#rap)$ping\'%iting\'#ote%%yssel',
+    ',$ness$).estimate%*popularity%)qualified%\'selling$+/gloucester%\'student%*underspend$#150$-_,_over_there%\'because%$each$!a%&cidity&!t',
+    '\'%ivate+#ion\'!s%&dorned%#ged%,ll&mdash;but\')-activity($that\'&/apron%(mplified%&nxiety%)pologetic%)rticulate%"te&!h',
+    '%#wes&#ing$&banked&!r%$ears&#cks&%lieve&"nd%&idders&!g%\'leeding%%oiled(#ing&"ld\'$ting',
+    '%$reak($thed*#ing&#own%%udget&#ild&/reaucratization&"sy$*calculates\'!l(!s&#rds\'$eful\'$ried%*entralized',
+    '&$urch%&laimed&%eaved&#iff&&othing%!o&\'at-clad&(llection\'%oured&!m\'+e-competing\'&petent(#lex&*ncentrated)$rned',
+    '\'&scious(\'iderate(*umptionism\'$trol+#led&%oling&%rrect&%wding%&rapped&&eative&&itical&\'owding.%*ultivation&(mbersome&!t',
+    '*#ing&(finition&(pendency\'"th&&tailed\'&ermine&*velopments%(iagnosed+"is&\'scussed%%raft*\'%matic+"se,#ing+"ze',
+    '("n.&"ew&#ink\'-ve/distortion&!y%"ub%#yed$+earnestness&"ts%\'ducated%*motionally&&phatic,$ally%)nthusiasm%\'quipped',
+    '%\'valuate%*xaggerated&\'citable)!e)#ing&(ercising($ting&&panded\'#ose)%ition$$fall%-eed/overstock&+rtilization%$loor)#ing',
+    '\'$weth(#in\'%&orcing%\'riendly&"ow%%unded&\'rnished$\'garment%.eneralisations-!e.!d.!s,&zation-#ing*"te',
+    '&+vernability%&rounds$$hall&%nding("le\'*g&rehy;ing(\'-capped&"rd\'"sh&$tted&$used%>ead-camshaft-per-cylinder-bank)$line))projector))scrolling',
+    '\'#rds&+reoverthere%"ot%&unting%(ydration$#ian%-dentification&#ing%(mpressed%+ndividuated\'$ulge&\'flating+"on(&uenced\'%ormed',
+    '&-tellectualize(\'rpreted&\'vesting*$ment%&ssuing$&jacket*!s$$keen%#ind$\'landers&/y-stroke-emblem\'"ed(#red)#ing%-eaf-mentioned',
+    '("ed&#igh&%nding%\'ighting&"ne%&ocking&$king&%oked.\'%oking&"ud&#wed&#yal%+y-concerned\'(didactic\')effective',
+    '\'*protective\')sensitive$+magnanimous&%naged)#ing\'$tel.*!s&"rk(#ing\'!s&$tter%)echanized&(dicating%$itts%)onolithic',
+    '&#uth$"ni&$ght.)(/weekend)"ed*!r+!s)#ing%0ourished-looking$.optimistically$$page&"rk&$sses\'!t&#yed',
+    '+"ed\')sonalised%\'itched.%$lant\'$yed\'(#ful(!s&%eased&%otted\'&ughing%.o&rehy;pulated&)liticised\'$lute&%pular*$ting',
+    '&!w\'%dered%&raises)#ing&%ecise\'%ssure&#ice)!s\'#ecd\'#nts&\'ocessed+#ing\'$duce+"rs+!s',
+    ',!s\'"of\'&tected\'"ve%%ubbed$%rates%&eaches("ts&&corded&-gularizations*#ted&(presents&&verent,#ial%&idings',
+    '$\'s-a-day($side%"=a%#ail("ed&%lting&%mpled%%cored)!s&&ripted\'\'upulous.$ness(\'tinised%)eas-based)+darkie-star',
+    '()/european&\'cretion&%rious%!h&$aded\'&rpened&%eeted&\'ipments&"oe\'$pped\'&rtness%#ide&%ghted%#kin%\'leepers',
+    '%,ophisticated%+paciousness&&eaking\'(cialized)"fy(&ulated\'#nd.&$ills&&raying%$taff\'"mp&(eepening("r.\'/pping/onlapping&$ocks',
+    '\'#ict\'#uck)$ture&&uffing%)ubsidised&\'pinator-!s%(weetness&#ill\'%nging%)ympathise&+stematising$"t\'%%akin\')"g.',
+    '&"nk&#xes%\'eaching%(hickened&$orpe&$row.)(/glazier)"n.%$ight&#me.&\'redness%)on-on-dee&&wering%$reat&#ick',
+    '&#re\'\'$neth$,urbanisation$*valuations%/iew-discovering("ed%&oltage$$warm\'!t&"sh&#tch)"es%&eaning&$ighs&%tting',
+    ')-ed&mdash;send)#img*!n+.g-sexual-urges+"ly)#ned&#ite%&illing&"nd%&orkers(!s\'%lding%&rapped)#ing$)zealously',
+    '#%sissi##tte%!s#(whelming$!r"$iatt&--ham/spastics#$cide#$dian%!u#%ferae$#orm#%llers#"ni%"ty',
+    '("ed(#ing#%scapt%!o#$tkov$!s"\'lyakuli"#oca##ids#\'maltine#(nrramwen#&yaykov"(renewton"*tchinnikov"$ular',
+    '&#ory$"um""va!.w-ri-ku-lar-ta##w-w"#ais#$l-ow#!y"#ed.#\'n-smith*,/oxfordshire$%/head%(wildfowl$%s-ish&%style',
+    '&)reporting##rri##ver"!i#"n\'$"yi")k-owk-owk""l\'$%-like#)-and-lark$$call$#gut$&headed%#ole(!s',
+    '(#ing$(in-exile$\'pellets$$ring$&season%$ized$&vision#!d#"ed$#tts##ing#$ness#&oholic#$sace$$moor',
+    '"#men"+n&rehy;goal#(-account$\'chances%&ountry$&design%#oor$*especially$+fairbrother$$name$$yway#,.counterfeit##/he$$life##ed.',
+    '+\'manager+*occupation0#ied%+\'s/operator%!-&(breeders&#dog\'&river.&&farmer&\'manager\'&embers&\'nations&(operator.!s&%pilot',
+    '&\'skipper&(trainers%+/developers\'\'irector\'%river&,entrepreneur&*headmaster&(managing&)occupancy+*ier/tenant\'\'perator&%pilot%\':delete%#hip%*occupation',
+    '%&riders%+s\'/managers&%-they&!.&!/\')employers\'(managers\')occupiers&$hip\')#-of)#may#&ing-up$!o#$self$%worth',
+    '""ps"#sin""te##ram"#usu%&-agyei"!w##www"*zeeeyaaaah!%x&deg#*rehy;carts(%goads"#-45#%blood$#ows',
+    '#&driver#$farm$$east#$head$*ide/hurdle#\'walking"$.bsa"!6"!a#%-1164$$3214\'!5#%lates$\'oacetic#%pampa',
+    '"%berry\'!.##ode$,rrow/student$"ws"$cart&!s""ed#+l&ouml;sund#\'n-drawn%%width$%brege$#den$%foord&#rde',
+    '%$eath%$lome%,ope-carlisle#%otope"!f#)am-backed&&reject#$ohhd$#rd-\'(accented(,nd-cambridge($rels\'(bicester\')cambridge(&radley',
+    '\'%style\'\'trained\'$york&#.in(!t\'$just&&/leeds\'$rook\'*university\')woodstock&)shire.ian($sire%!f%&sshire"%heart',
+    '"!i##cam#%dated&-ion-reduction)!s$&e-fuel&$that%%/zinc$\'ization"$lade#0ey-kingswinsford#$ynch"\'mantown"%nageo#"ey',
+    '#%anion#%nians%%ensia)!s)"um"\'pasture#&eckers$*ntifylline"%shott#%pring"%tails#&erguff#(on-based"!w"(xtrained',
+    '$*hemocyanin%\'ydrogen$\'nitride#!.#%belus#&chilus#&filter$\'luoride+!s##gem%$n-17(!8\'%based(&earing(&inding',
+    '\'-concentration\'&hating\'&intake\'&loving\'&making((ediating\'(oriented\')producing\'\'starved&$/air\'&carbon&$ates("or&(e\'-style&"ic',
+    '#*ntomodulin#\'petalum#\'radical$\'hynchos$&ynchus#&stegus#+tetracyclin$%richa#$uris!%y-als#\'gevalts#"oy%#-oy%!s"%arzun',
+    '"%dovyn"%elowo"\'hanarte"%igoua&)wafinance#\'te-ojok"#kle"%onnax$\'o-aba\'a#&vbaire""r."!s##ley##ten%&r-beds',
+    '(\'oloured\'\'doubter(\'redgers\'\'fishing\'$like\'$pink\'&shells&,catcher-like&$loan&%shell$!h""us"$vind"!w!0z.gruy&egrave;re',
+    '$$00ml%#2ml$#25m$#80g#$227g$"8g#%350ml%!g#%400ml#!5#%600ml#"yd""13#!7#!8',
+    '#!3"$alid$$land$!s##rks$$slan#"to"&bourne"!d"#ean%#ien%(ographie#%nfant#$rkow"#gur',
+    '"!i#"te"\'leworth"#ois##las$$oins#&nation$"e-&\'damaged\'(egrading(&pleter(\'stroyer&\'forming&(gobbling&\'harming',
+    '&%layer&,negotiations&$poor&$sage&$xxxx%(friendly%!s&$onde$$iser""un"(ymandian##rev"#zer%!s#!i',
+    ' $p%-1#!2!*&aacute;ez)\'gina/12)7le&nacute;i&ccaron;ek\'s*"os)#nek)%ramos*#nes#(breve;th#&circ;r()t&check;e*)eacute;es)"is+&series',
+    '#$mp;d&"hs&$o/bi&!t#0tilde;o-por-deus#1uml&auml;t&ouml;s&);dagogium\'#te1"*eacute;age),cuc&eacute;t+"le)-digr&eacute;e)#guy)(lerinage*&issier',
+    ')-n&eacute;lope2$trer)#pin)*r&eacute;z*&ichole+\'gordian0"ne++m&eacute;es+#ode+/ph&eacute;rique*$otin)(t&eacute*&ainist-!s+$nque',
+    '*&rarque+%obras*.ursd&ouml;ttir)(w&eacute#(circ;che(-le-m&ecirc;le#)grave;dre)#gra*"ue)%lerin)&rigord#,quals;0.0000"(ge;0.005#\'t;0.005\'"10',
+    '(!5\'!3\'!4"(le;0.001#2sqb;almerston&rsqb()rish&rsqb(-ssengers&rsqb\'&laying\'(resident()iest&rsqb#!t$\';-10.05%,0.00&ndash;1)$0001*!5',
+    ')!8)!9("1%)!0("29("46(!8\'"25\'!5\'"75$%=0.05"\'ndash;3)"6s)"8j),9/p&ndash;63',
+    '(#40e+!s)!7(!5)"1h)39b&ndash;1&ndash;be*!s("63*!a"*oacute;lya)"rr#\'circ;le#(grave;hl#)uml;tting"%pound',
+    '(#300)!5(%4,000)!0*!0+!0)"80($6250(\'control"6rcaron;ehorovsk&yacute"\'times;q"(uacute;r#,circ;kel-men#)uml;ckler\'$nder',
+    '""ao"&connor"(daytaism"#eng"#int##p\'a"%jalst""s."!t"+vestrannyoi"$weet!&(&pgr)"#16)""8)"\'a)=0.68',
+    '#&ssuum)""c)"(fr1)jp-i"1genotype/disease)"$hb3)""k)""l)""q)""r)"\'ublica)""w)""y)!#***$"**$!y',
+    '!*-&ggr;-atp"$----""10$"67#"77#!q"$2250#-6&mdash;which"#312#!5#!9#!c"#40e#&50iiia#"7s',
+    '""5\'""63$"cs$!e"!7"+a-r-e-n-t-s##dic"!b#%asses#%ridge"&celtic#(omponent##reb"$datp#"cb',
+    '"#e-i%"ii#"rs"!f##ace%#tor#)imbriated",glycoprotein"#i-n$\'t-c-h-l"!j"(labeling\'$ling#$evel##oop',
+    '#,ethoxyphenyl"5nitrophenyl-phosphate"+o-p-c-o-r-n#&rbital)!s"(p-p-ower&$poor%#art%&erfect%#ick%%laits&$ease&\'ummeted%$rove#%eople',
+    '#(henylene#\'ictures#$lant%"te#\'olitics%"ly%!o$$sted$$wers#\'romised%$pose#"ut"1r-o-g-r-a-m-m-e-d#\'eceptor$*incubation',
+    '#$tyle"!t#"-c$!t#"ex"!u"!x!%.&num""-b$!."#101$!5$!7$!8$"98',
+    '$!3%%,1.19$!5$!6$!8#"20$"16%!8$!9#"31%"ff$!5%!6#"41$!6',
+    '$!8#"53$!4$!5$!9#"60$!7$!9#"71$"2a$!9#,80&ndash;181$!2$!3$!8',
+    '$!7$!9"#200%*&ndash;201$!4$!9#"12$!5$+8&ndash;219#"20$!2$!8#"30$!1$!3',
+    '#"47$!8#"51$!6#"60$!1$!3$!4$!6$!8$!9#"73$!4#"80$!1',
+    '#"91$!3$!7$!9#"d.")3&ndash;4#".8#"00$!1$!5$!8#"11#"20$!4$!5',
+    '#$3010$!1$!2$!3$#401$#533$!8$!9##436%!9$!5#"57$!9#"61$!2',
+    '$#613$#779#$7245$#309$#549%"92$!6%%39-40%"52$#708$!8%"59#"80$#156$#214',
+    '$!6$!8#"95""4.#"00$!s#"20$!4$!5#"34#"40$!2$!3$!4$!6',
+    '$!8#"53$!8$!9#"71#"83$!6$!7#"94$!8"#503$!5#"11$!5#"23',
+    '$!7#"43#"50$!2$!4#"63#"71$!3$!7"#612#$3,64#"57#"69#"87#"96',
+    '"#706$!9#"11$!5#"26#"32#"50"#802#"18$!9#"26#"34#"48#"50##9ff',
+    '$!3#!4$!9#"59"#a.d$*s.s.i.o.n.$!t$$y.e.")b.o\'meara"#c.\'$"s.#+arringtonii#&lxviii#(oronopus#%xxiii',
+    '$"j.$(n.h.a.s.$!s"(e./music$!g%!."&g.a.h.$!h%!.$"s.$"w.#(ibbiceps#%ordon#$rant"#h.d',
+    '#*ead&frac12"#i.v%!."$j.a.$"b.$"h.$"s."+l.g.bateman$&jordan$"n.$"r.#!5#"68##awn#%ittle',
+    '"#m.4$"b.$\'company$"on%!r$%pratt$"s.#\'aritima#"m."$n.g.#\'ewbould"$o.d.$!s$$w.n."!p',
+    '$&h.f.c.$%l.tam$#p.s\'!.""q."(ramirezi#&oberts"&s.i.a.$"o.$"r.$"u.#$tott"&t.f.e.$!o%!.',
+    '#$hank""u.$$m.p."!v#".c#*ermiculata#!i$"ii$%ttata"$w.g."!x##xii$!x""y.!\'/20/116',
+    '&!6%"50&!2&!8"%35/23#$6/01%"21")6&ndash;1"&91/414"!a"!g"!j""os"*ppa/ld/246"!q',
+    '"#s/b"!x!!0"+&middot;125*"25*!5*"75*#875"$.005#"10$"25#!2$!5#!5#"75',
+    '"!7!)1&ndash;3"%*/lp1"$,000##286##357"#-p5$!9"!."#/t7$!8$!i"#0.5#!1$!/',
+    '#"4.#,7-associated%)drtf1/e2f#"8/#"9/$!n#!s"#1\'s#".2#!0#"1/#"2/$!0$!7#"3d',
+    '#"4b$!x#"5l#"6x#"7i#"84$!i#"ds#!s""2/#%0-gap#!1$!i#!2$!l',
+    '#!4$!l#*6&ndash;22$!7#!8$!6"%3-152#!0#!2#!5$!8#!8#!9#!s"$40bt',
+    '$!1#$4/d6#!7#!9#!s"$5(e)#!/#!0$#/95#!1#!4#!5#!7$!e#"85',
+    '#!4#!5#!6"#800#!3#!4#!9""91#!2#!5""ab#!c""d6!$2(c)"$,899',
+    '"*0&ndash;22#!0$!0#!6#!9""13#!5#!6#!7#!8"$20.2&"tc#)5,000,000#!6#"8.',
+    '#"1a#!8#"ac#"dd""4/#!6#!7"#5\'s#!2"*6&ndash;27#!0#!2#!3#"45#"53',
+    '#!6""80#)2,500,000#!5#!9""94!%3,318"$.x63"./ns-1/1-ag-4.1,".4#\'x63.653""0/#!4#!6#%8,400',
+    '"\'10kjmol#!4#!7""34#!5#!7#!9"#400#!5#!9"#554""6/#"55"!7#$,700',
+    '#!0#!1#!2#"33%!3#!8#)g&mdash;h"$8-39#!/"$9-49#!4#!5"#x63%#/ag!$4/34',
+    '"*0&ndash;42##0ps#"5c#"65#!8"*1&ndash;41#!3#!5#!9$(,000,000"%2,100#!/#"32#!5#!6',
+    '#!6"*4&ndash;54#!7#!9""5/#%0iie1#!7$!e""64#$6icx%!i%!s#"8a"%74(h)#!5',
+    '#)3&mdash;4#!9""9/#!4#!9#!a""g9!-5-aka-pentium#(specific""01""23#!4#!9"%3/dcc#!1',
+    '#!0#!1#!c$!m"*5&ndash;20#)4&ndash;5#!5"*6&ndash;57#!/#!5"#8-1#!/""91#!a""rk',
+    '!*6&ndash;32""/7#"p7#"t1""0/#"0s#!1#!3""1/#!1#!7""21#!3#!7""38',
+    '#!1""5/#!3$(,000,000#!5""61""73#!5#$8-54"!8#!2#!4#!5#!7""9/',
+    '!"7\'"#/s1""0/#!1""2/"!4#!4"*5&ndash;80#!1#!5#!a""6.#)9,000,000"*7&ndash;83""93',
+    '#!8"!s!"80#!2$!3#!9"!1#!/#!3#!4#$8990""24"!3#$0a-b"#46b',
+    '"!5#!1"*6&ndash;93""73"!8#!8"!9#!5!)9&ndash;j"".1#!2"#0\'s#(/no750/0"*1/len/1336""2/',
+    '")3&ndash;5#!5""41""5.#!7"#600"!7""89""94!+=&lt;0.0001*!1)!5"&0.0000(!1(!3',
+    '\'"16\'!4\'!5\'!6\'!7\'!8&"10\'!2&"31\'!4\'!9&"41\'!6&"70&"87',
+    '&"43&!6&"76&!8%"30&!1&!2&!3&"55&!7%"42&!6\'!9&!7%"51',
+    '&!5&!7%"62%"70&!1&!6%#809&!5$"10%!3%"45%"73$#213%!3%#613',
+    '$"30&!2%!1%"24%!3%#546%!6%!7&"85%!9$"42%!3%!4&"47%"64',
+    '%!8$"53%!4%!5%!6%!7%!8%!9$"66%!7%!8%"98$"70%#299%!4',
+    '$"80&"92%!2%#454%!6&!3%!7$$9004%!4%!8&!4%"96"!1#".0""50',
+    '""p\'!\'a&amp;s#(iacute;z$\'uml;ens#(ndash;12*+8&ndash;1253"50),22&ndash;160*!8#+scaron;alik*.trovi&cacute;i"&\'gellu"+(&formula)q"+-18-150/180#"20',
+    '$!4$!8%*&ndash;140%$/181#"32%!r$!4#"46#,architecture##gel#(ki-ja-ne#&oct-11$5f-two-planned-nippers#*risc-based"%/1ros',
+    '#"pf"#01c$!s#"5b""10$-0&ndash;rz999%!2""28""39"09814.413.322,705"&aaarty#!k#!l#"rl%$berg',
+    '#$sban$%vvp16#"ta%&shvili$\'eleinen"#ban#,ell&oacute;n#%loite#%ouche#&x-like"\'c-a-mac$&o-macs#3ab4.vp2/vp6/ns1/vp7)-3/vp2/vp7/vp5$!l',
+    '$$tian##car%"ud$$ione#-e&rehy;setter.#ing$!\'$*-dominated%&egging%%maker*!s%*terminable$$.the$,/md/headgear%,organisation',
+    '$"d=$$r(s)$&setter$#tti$&y/ncis#*h&oacute;n$#ano%!s%#uri$$echo$\'litsani$$mann$%nicke%#uik$!o',
+    '$!t%"er$$ucho%"ko$&yammos&#uro%,cephalosaurs%$derm)"al*$tous)"ic%%gyria%%ptila%&scelis&#ima',
+    '%!r$)fic-crime(%north\'%atory\'!i("sm\'#orp&#ers\'!s&\'st-like)&minded("s2$"ni%"os$#tti',
+    '%&bridge%#man%$size%%trail$\'ability&"le%%ge&gt(%mdash-";a\'*-bleaching\'"/2(&module(\'package/!s)5roduct/source/foreign',
+    ')%goods\'"es\'!r\'"s.)+health-care&#in\'(.g-to-adhesives%)rd-merlin\'!s$#bag$(ed-lunch\'%pixel*!l\'+to-capacity%+r-goldsmith',
+    '\'\'village%"t-\'$boat\'%sized(&teamer&!7&#ing\'#sed&!y$$ham.%+orse-bridge&#use$"in&\'g-paper$(lemerton',
+    '&"te(!s%#oor%Aybagswithfivedozenextraliquorjugs$#rat$$shaw%$izes$!y#%lan/x##man#$news#$plas#$ques#+t-sponsored$#ice',
+    '"$d&gt&%;call\'%login#(-batting$#eye$$like$\'mounted#$/bat#"am$%naram$"rm$&vatton#$bury#(ded-room\'"up',
+    '%!e%!r$$ings\'0ton&ndash;slough*)-heathrow+&oxford%\'ography%#wak$\'le-boat\'$less\'\'powered&$boat&$less%#in\'$+ock-grazing',
+    '$\'y-field&)the-lover*#spy*\'warrior&&wagons%%wards#"ee$"gs$!l$#mba$%rwski$%stowe#,field/farmer(!s$#oot',
+    '%!t$"ug#$hame##ibe$,llaeducation$#mbe#!l$"oc%$wski#*m&amacr;ra$%anabh\'$than%$pani%#rks$\'obusono',
+    '$,udji-yadjoua#*r&oacute;n$"ic$"on#"s.$$down#*uak-capped$#cah$"la$!s"$eder&%astic$(iatrican$)ophiliacs#%ffgen',
+    '#$llas#"on%#ias%!s%!y&\'-shaped#%pecke#(sbrugghe#!t#!z$!\'"*ffenbarger#$meca#!s"%g-acs',
+    '%$roma$%entry$#lly$0n&ndash;mandalay%$elii%%inian\'"ni&#sed\'#mus%"us&#zzi$%saian#!b$&aiavyn%%javyn',
+    '$&-built&&y-page%(headings%&number%)of-honour%$pile%*references&&unning%#sds&#ize&$tyle%$type%%waits$)/cherwell%%daily',
+    '%\'kenward%$main%"of&%livia%(reporter&%obert%\'station$#128%"45$!3%!4%!8$$:120$+ant-masters$#ful',
+    '%!l$2maker&mdash;though\'#ing$$nses%&umbers$\'printer$&rungan$&s/half%"es#"gi#"id$"na&!s&"te\'$ion.',
+    '%!i#%liano&$ruio#$oaga$.da&rehy;topped&%-land\'&shaped\'&topped&"s.%"es$%phila$&thenia##ram#\'vajavyn"$hari',
+    '$!t#%katos##len%"vi$!s#"oa#$sien#"ud"#ian$#won#"ba#/ce/hulke/verney$$hitr#"d\'$(-for-sex',
+    '$)/received$&agogos$#eia#!e$"ns##gen#.hamainspection$"ia#&joanes#&l-like$#ful$#has$%lards&!t%!e',
+    '#$mpol#,n\'-measuring$\'-ah-hee&)scription&\'voiding%&bearer\'\'haviour%\'clouded&(onsuming((trolling&%rying%(dominant%(freaking%+in-the-arse\'(flicting',
+    '%%level&$ines%&memory\'$ters%&ometer%)provoking%(response&%idden%\'scarred\'&orched$(/because%*cough/girl$#_at$,e/eyewitness&&senior',
+    '$$free%*ul-looking$%glove$(lessness$"s.%$/are%%taker(+ingly&mdash&%horpe&$yled%4wick/gloucestershire$,t&amp;create&%mdash&2rehy;manufacturing%)-and-play',
+    '&+bespattered\'(listered(&otched\'%ombed\'(y-number&*conserving&&daubed&%frame&$guns&(handling&\'related(%mover\'%oller("om&\'schemes',
+    '\'#hop\'$mart\'%oaked\'\'plashed(%rayer+#ing\'\'tripper,#ing&\'thinner(&rowing\'#ype&"up%*/wallpaper%\'ability&!l',
+    '%%ed-in(-on-both-sides($shut("up&\'r&mdash\'+-architects(\'etchers(&family(\'husband()sculptors))ignatures(*travellers($wife\'*/decorator\'*s-printers',
+    '%!i&#ng\'(%-book-!s)#how)"in)$size(*/ex-smoker)$fish)&object(#s.1),/photographs+%rints%#job%$less',
+    '%/pot-at-the-wall%%stick#$pety#1r&rehy;purchasers$\'-bonded)!s%)formation%&plasma%(trawling$%/baby%(exchange$&audeau$%ed-up$!i%!c',
+    '$\'s/bring$(t&iacute#"se%!y$(iellists$2ley&rehy;patterned\'&-based(\'o\'neill(\'shirted\'(/valerie\'!s$%pamba$"te$$word#"ta',
+    '#&utiids##vio"#jah$"ma$"ra%"es%!i&"to##ero##kic$$ovic##oca$!u")kalniskis$%raima',
+    '#$ehas$#man$$niho#(htunwali#&iewicz$%ngton$-stan-american)*bangladesh)(occupied)#sri)\'trained(!.("i-*)dominated*\'iranian',
+    '+(kashmiri#"ki##nam#"ok%!u$#ras#"ua$%buono"+l&acirc;cio$&eacute*#;ar+)ontologie#!\'#\'-a-mine$(oos-tris',
+    '#%33v16#)ace-based(\'righton\'&church(&omplex\')dominated\'$gate(%uards\'*negotiated\',organisation\'\'picture(%rison\'\'swindon\'\'watford&(.kinnear',
+    '%(k&yacute&!y%#zky$"de$\'earctic%,o-biological\'&europe\',geographical\'\'rockies\'&tethys&!.&/anthropological2#sts\'&siatic&-biogeographic',
+    '\'(otanists&,ceanographic0!y\'\'limates,(ologists\'#oma&,ecologically-"st/!s)$nomy\'*nvironment&,geographical/"es\'&raphic&)hydrology',
+    '&\'indians&%karst&,limnological.!y&,magnetically-"st/!s&&niscus\'+tographical&)pathology\'%teran&$rnis&,scolecidans.\'&ecular\'%milia',
+    '("me&\'therium\'\'ologist\'\'ropical&*zoic-early*&/early+(mesozoic%&phatus$(frenieri$"gi&!o%!o$$imon%%omilo&"us',
+    '$"ly$%madez&!s%#ino%"ut$$nces&#hok%"ji%%quin\'%$tirs%"za$"re$$sade%!m%#ter',
+    '&(ina-ver.$*talisation\'"ly%,e-stimulator&!.%%ially&#nar&"um%"na%*o-alveolar$$vers%%icino$$zols%$zese&"is',
+    '$!a$&e22v10$#hok$\'iauskas#+e&rehy;blue*%faced$\'-auburn%\'bellied%\'cheeked&%oated\'*mplexioned%(fletched%*glistening%%honey%#ish',
+    '%(knuckled%%lilac%%mauve%&orange%(panelled\'\'rchment%&ringed%%toned$).although$!a%%rctic$$mque$"ne$!o%(-equator',
+    '%/anthropologists%\'biology%$chem%)kastritsa%$loga("us%(magnetic%\'niscoid%+pathologist%%zoics$\'r-toned%!a$(stinains)!n(!c',
+    '((ian-arab,$born,(lebanese,\'managed,"us)#nan&$rena\'%inian$1tte&rehy;animated\'\'-shaped$!x#$ffys$&reyman#&heiros#+i&rehy;mony',
+    '$"ka$\'mpsests$%n-for%*/traveller%)dromedary%\'genesis%!n%#ode%#uro$"sh%"sy$"to#\'k/becky$!a#$lace',
+    ')!a\'!n\'+um-enriched*$rich&!y%"gi%!m%$site&%kenry%$tyne%"va&&iccino(#ini%#yev$#ene',
+    '%!s%&t-wood&"ed&\'isation&,t/eyewitness$%iards&"ta\'#ing\'"us%#dus%!e%!g%&sadoes&#tar\'(er/bruce',
+    '("ur$#oni%$tine&$tino$\'ucchini#,m&rehy;court$!-%$bark&\'ranches%%court%$down%\'fronded%(greasing\'#ove%$hand',
+    '*"ed*!s%&reader+!s)$ings\')cognition%%sized&%ticks\'$rewn%&tattoo&"op(!s%"up\'%wards$%anova',
+    '%$turn$\'corders$#dos$.er+worthington&+-tomkinsons&\'/allied\'(director\'\'founder\'$hunt)%sband\'%owner\'&severn&!a&"ia("ns',
+    '%*tte-finial\'!o%%zzano$&fronds%"ul$%guist$!i%#eri%"ra&!o%,toylstearoyl$!o%+ti&cacute;s$&prints$"s.',
+    '%#ree$"us#&natoke#%ojame$%mides$#oka\'!s$"po$"us#"pa$$iger%"ng%$tati#$sely%!y',
+    '$#ies$%taves$\'y-walsy#(tronieri$!z#%uccis$&dicola$$mbus$%stria##yer$#ing$(nofloral&%morph+!s&/stratigraphical',
+    '$%stamp#%aquin$%sonic##ber$#ies%!o$&otadai#\'ela:has%!l#$iers$"no#%melia%"nt%#ter#$oana',
+    '$\'erampam&*ed-looking$,hlet-reading)&writer(!t%%ylian$(lemousse$%orovo%!s$"us$$ying#!s#$yat\'$"et"(n&eacute',
+    '$.rehy;indonesia##-12$"52$*africanism%&rabism*!t&$ctic$-biogeographic$)caribbean%$lass%&olitis%&ulture$+dimensional$"ec%+ncephalitis',
+    '$%faced$&haggis&&ndlers%#ead%(ysterics$,iku-lar-toos%\'mperial%(ndochina\'%ustry&(testinal%"sh&\'lamists$2leucocyte/monocyte\'\'kocytic$\'malayan',
+    '$+nationalism%%ordic$\'pacific%+resbyterian&+otestantism&&ussian$(regional$!s%+candinavian&&ourers%#erb%$hine%#lav(#ism$$tcr-',
+    '%&urkish$(unionist$(yugoslav#(/daphnis#&abokke$$ches%#ide$*d&eacute;s%#ura$#fax%%rican%!u$(ma-based\'*registered\'#see',
+    '&$nain\'.ian-controlled+#led%&erican$$ques$#rea$)sonic-lwt)!s%&tation$%tella%(hanaikos($ikos&%enaia%$rope$!u',
+    '&$sion$"yi&!a&#des&%otiou#+cake-shaped%&tantra$"ea%#tta$"ha&!l\'!i&&tantra&"ud&$yats',
+    '%$gani$\'iatichi$$oast%"le&"ic&(onoscopy$$race&/s&ndash;bedford\'.-in-the-fields%$eaic\'*s-piercing\'"ta((ectomies-!y(/icoduodenectomy',
+    '(&ograms,$phic)%toxic*%ropin(#tis&#tic$$ying%\'topenia((lasmatic#*da-branded($iefs&&loving%$ceae%"ng&!s',
+    '%#zis$!e%#cta%"li%$mics&&onious%$rman%!y$#ick%"es%&onidae%"ts$!o%"li%"ur',
+    '$#r\'a$#ura$&ynamic##eas$#can$"er$!g%#yri("ca("st$(l-accent&\'beaters&(proposed%&beater%#ess',
+    ')!s&"ze%!l&!a%"ma$%mones$+ncephalitis$%ttoni$#vor$#zai#)financial$#uls#"g.$\'a-knife%"ed',
+    '%$mate%!s&$inan$0bourne/berkshire%#urn$&erland$"ie$%kalan%"or$"ma$%u-led%!e#(handlers(#in\'*!g',
+    '$"al$"c\'%\'-attack&&buying&&driven&\'induced&)merchants%).stricken&#the%\'ipation%$kers&*y-wheeling%!o&!s%$ular',
+    ')"us&"m-$"er&!s$&garola%%raphi$"ma$$naro$#pat$#que$!r$$scus%%perna$#tia$#zza',
+    '##jab%$itan\'#han#$kanj$)hurst-led$#ota$$rath\'#ion$!s$%ymoor#$loaf%$gism%!y#&mictic%#xia',
+    '$$able%#cea%#ge.%!i$#eau%#els%!l&"ls$\'ier-man#%ogena$#log%"py$%plied$!r%(amically',
+    '%"pa&$oids$%utsos$1variohysterectomy)"us%)ulational#-proctocolitis$\'sychism*!t#"ry#"s.$#ere%!s%$xual)#ity',
+    '$$lavs$\'ocratic$&ticked$\'y-brain%#ing&"sm#)t-hooting%#leg%*moistening$\'acrator%#ges%"ll\'+/wingwalker&"on(!s',
+    '%"no%$stic$"ea%"d.%&leimon\'#yev&!i%\'utonism$(halassic%\'eologus&$rish$(icapaeum&#osa%"ed%\'kapaion',
+    '&!s%&socrat$"ja$%lcosa%"er$*omime-like($icry)"ng)#sts%&uflage(#ent)!s$%ridge%%y-boy&#men',
+    '&$down%#uit(!s$%uhoff%"lf$(y-girdle&%lines&%waist%$boda%%celyn#%ufnik#!y$,arachunprime#+z&eacute;ra$#ani',
+    '$%erboy&%faust&)grenadier"#oan#!h#$lino%!s$%ozzis#!n#%ostyc#!r#%sgraf"#pa\'$&costas$)dimitriou',
+    '%\'ongonas%#uka$%gallo&"yo%#ena&\'orghiou$!i%!a$%jorgi$,konstantinou$*l-oriented%!e$(nicoloau$%pizza$!r',
+    '%8emborde/fouroux/lepasset%$onis$\'stavrou$*taxiarchis$!w%!s$"y.#&castle$"un#%elaco%$itas$+r&mdash;but,#the&%ndash&*rehy;chase',
+    '+%until%!*%#-\'i&\'and-ink\'"sh&$back*!s("gs\'#oys&#cap\'$hain)%nging(#eap\')ollection()nsumption',
+    '(%touts&&driven&%faced\'#ine\'-lower-hawking&%group&&hatted&)intensive&$less\'#ike(#ned\'$over)#ing&1m&acirc;ch&eacute\'%akers',
+    '\'$ills\'$oney\'\'ulberry&%panel\'%erson\'$lane)-tes-and-pasta\'#ulp&$rack\'%uling&&seller,!s\'#hop(&uttles\'$izes',
+    '(#ock)"re($rewn)&ippers&+thin-leaved*$ness\'$owel+!s\'$ypes&#use&$wasp\'&eights\'$orld%!.&(anything',
+    '&*discussion&*foil/cling&)microfilm&%print%.back/&pound;25\'#rks&&eating&$oard%&chains&&lipped%\'hangers)#ing&%olics%$ites%$lace',
+    '\'!n\'$ster&$ills%#out%&s.just&-/commentaries\')documents\'(research%$talk&%owels&#ype%&y-fine\'$thin$%terie#$hian',
+    '$#er-&,_m&acirc;che(*ach&eacute&!i$)lichromis&$ones(%oidea-!e%\'la-form&"ia&(o-oedema\'%edema\'&matous\'#sum)!s',
+    '%!i$"or$!s%%tical&"ry#)ke/spelly#!o$%oshes$#ura#\'pacieri$"ei$"in$"le$%s/dog#-rika-coloured',
+    '\'\'/copper$$ocki%#ski%"th#!s$)turkunden##ua.%\'n-based$"do$%ensis$#lar%!e$$soiu#!y$&fifera',
+    '%$orum&%story%-us&rehy;chest\'"es"#que%!s%#tes",r&eacute;age$\'formula$,rehy;liament#$-4in$"71$%baked%#oil("ed',
+    '$$fect%$ried$)or-better$&priced$&threes$.vee-foe-li-yum#+a&iacute;ba&(circ;tre%.ndash;phrasing%-rehy;military*(synonymy$!\'$,-amidophenol(,no-salicylic*)salicylic',
+    '&*rystalline&)urricular%/dichlorobenzene\'"se%\'gliders&%raphs%(hyponyms%-incompatibles%&legals&\'iterary+$ture&#lel%*militaries%\'nirvana%+oesophageal',
+    '%8phenylenediamine-oxidase&)rofession&,sychologists.!y+#ses&%ublic%\'sailing&%ocial&$pace%#tex&&ransit%&xylene$#.10\'!4&$2(5)',
+    '&!.\'"03\'"10(!1(!7(!9\'!3&!d%/3.14&ndash;3.16\'!8%"4.&!0%-professionals$)/analyzer%(designer',
+    '$,27&mdash;322/!3$+b&egrave;re%#aun%$ears%$iago%#le\'%(olically&"ot&#sco$#cas%#els&)ntentesis%(heirodon&+ute-harness',
+    '*(training)(s.senior%,ohlrophenoxy&\'mmandos\'!p&"ne&&operia&&rtical%%uting$"da%\'ebugger&&ground&$isoi&%platz&#you',
+    '&-chlorobenzine&#gm.(!a)%tical&"ne&\'saeidae\'#ial(#cal\'%matic%#jik%$ores\'!s&"xe\'"ic%&ropper',
+    ')#ing(!s%#yne&"se$)esthesias$,ffin-burning)&filled*$umed)%lamps(!.%#ilm&!n%#lex%1ormaldehyde-fixed$\'genesis',
+    '%%lossa%%neiss%&ominas%,raph-initial)(/section,&ntence)"ed)$ist\'%&uaipoa\'.y&ndash;france/#usa(--paran&aacute(#ano(!o$,haemolyticus',
+    '%+l&emacr;sis&$esis$$lell%"ic&&pomena%+l&egrave;le0!s&$axes&#el\'(&-clamp)+distributed)&enable)$port)(resonant)(threaded',
+    '(\'epipeds(&isable)$zing("ly($make(-s-in-negative($ware,&/80860\'!x%(ogically\'!y%"ux%%ysis.&\'tically&#zes',
+    '&$tman\'"ta%$edia(%cally+!s)%s/and&$ta.a\'\'er/edit)"es)#ise,!d)"s.*!/\'\'rically.!.',
+    ')"ze+!d%(ilitants*%rised\'&taries%"oa&!r&!s&\'unt-uip)%/lido)"ly%"us&%thion%*yxoviruses$!n',
+    '%\'apanema\'&iacaba&#que&#sal%"et%#gon%$oia\'((-ravaged(+/homophobia(%cally(!s\'"cs\'/d-schizophrenic("ly%$than',
+    '%%nline$\'packing(!s%\'et-deck%)haryngeal&-ernalia-dirty&#one&*rasability%$luie)!s%(ocryptes%%raxes%#sid(!s&%ychic',
+    '$#qua\'*t-wielding\'!y$#ran%"ge%$nali$\'s.12,15&#2.6%#ail%(cariasis&%ender&%ience%)erianthes%%hites%\'itaemic',
+    ')$hose))inflicted)(specific(+s/pathogens\'\'ization)#ing\'(ological,#sts%%kevas(!i%#oft&(l-holder\'"ed%%pinal%#ram',
+    '&$ipes%\'uicides$"ta&$ctic*"al,"ly%\'ectonic&!x%\'hormone&+yroidectomy%,one-boundary)%final%#ype$$uaca%+chenipterus',
+    '$%wings$#xis$)y/detroit%"no$(zoanthus#$bold$#ury#*c-le-breos$*el-porters)"st\'&string\'$tape&\'force/j&#iza&%lated',
+    '(!s(&zation\'!s%#nte$+hed-looking&$ment&!s%#ine%#man\'$rque&)ent-knife*%maker/!s*\'sellers+&kinned',
+    '%#ute%"ym$#ial&!u$$lose$$plac$%tical$#zew#&dalote$"ee&!p%!n%!s&!i&#sus',
+    '%"ni$"ox#$ease$"ce$$ille%#tal$"ja%!o$/laphostrongylus%$lada&"el$!n%&ateral%&cyhmal%(t&eacute',
+    '\',rehy;support&)-and-baby(,uthorisation\'$bank\')completed\',friendliness\'+governments-"or\')offspring(\'riented\'%party\'%speak($taff()ubsidiary+&titute',
+    '\',with-custody&)/governor\'!s(!.(%chool($taff)%udent&,al-authority)%leave(\'/family)\'teacher&(friendly&"is&$line&!r',
+    '&*s&mdash;he\'+-out-of-law\'!.($they\'\'/lonely\'#hip$!r%!e$#sse%\'thesias$!t%-o-improvement\'\'optimal%#sky%"ti',
+    '$#ect$$itts$)um&eacute&"ed\'"ur$%yonov%%tours#!g$$eted$$iter$,ny-les-reims$!o#"ia%$ment$,bas/clerical',
+    '%&ularly$"ed%"nt\'!e\'!s%$tals\'#ria&#ina$(fication$"kh$#lia$%ngaud$!o$\'palanai$\'s&mdash',
+    '&4ndash;orl&eacute;ans,%rouen%&-\'that&/amsterdam-paris&%bercy(&stiaux\'@russels-cologne-amsterdam-london\'$uilt&&chauny&(educated&(fontenay&.lyon-marseille&+messageries\'%oscow\'+us&eacute;e',
+    '&)normandie&(oriented(,l&eacute;ans&#set\'#oir\'$tyle&$turf\'#ype%*/amsterdam&$dacs&&london&\'reading&&singer&-vienna/berlin%!e',
+    '&!r%*h-register\'%union&%/area\',group/school&"ed\'$nors\'"s.%(ian-born)%style&%ensis&!s%"on%!s$!t',
+    '%%cular%$ions%"ns%#ors%"sa%+y-violation#\'k&mdash*$;and+#out%)ndash;las+#san%(rehy;ing$,-and-culture%$bred%%fence',
+    '%$land%%style%$type$(.picture$$/and%$bath%#car%%leeds%)navigator%&oxford%&retail%4wheatley/oxfordshire$\'ability&"le%!m',
+    '%\'/father&&mother%&d_over%$ngue%*r/campaign)"re(&orbett\'&dental\'\'england\')insurance\'*lumberjill\'(resident\'(southern\'#usa\'#vet',
+    '&&iaceae\'"ng&#tex%(s-hobart\'+tidbinbilla&\'/thames$%grove$$have%&omenko&+use/british$#in\'&&g-area(&ground(&meters(%place',
+    '(&spaces(&ticket*"me)$oken&+son-hardman)!i%!t$$kred$#lea%#ike$\'nasilla$%right%$oyal$(s-cramer%$.the',
+    '&&forest%&trasse$"us$+way-mandale%#ell$\'y-starn#"l.$!a%,mentarischer%%phone%$ying$"by$(e/thames%!g%(mentaire',
+    '%"rs%"ys%%z-moi&,vousfrancais$!i%5ament&mdash;described1#the*&-forty+*government+&labour+$made*"/3*$alis+&rian:a-"sm',
+    ',*y-division.)electoral.%level.$wise*"um&!n%)mentarian%%ngton$#ors%(ur&mdash\'$-car($game,5-and-flower-arranging($like($maid',
+    '(%trick$!t##ma.%#lat%"ra%!s&$toon%%zzone$(eliopsis%$sans%!t$!i%%giane)(o-jewish%$nder',
+    '#%nassi(!a\'"um$"el&(l/family$#ing$"on#!o$(ccipital%%hials&#lus$&diable\'!e&-c-travestying&(stically',
+    '&"us%&y-hymn\'$mass\'%young&#_in$"is$+le-breakers&#tta%)factorius$\'nomasia%(ymically$)psonemids$#tic%"ta$#uty',
+    '$(xysmally\'#tic$#zzo#\'p-parp.$"ed$#ing#$ques##r-i$$agon%%keets%$llel&!o%&vonese%$xtut$"el',
+    '%+s/political\'%times&(h/father(&mother&*s/managing()transport%#tch$%okeet%%quets%"t-\'$cage(&rested\'$hoot\'.in-the-chimney\'&napped',
+    '($peak\'$type&&spitze&*t/taverner%!y$$r-dy$0y&rehy;wingfield%,/traditional#%sable$+er-grammars$%ifals%!s$,ley-sprigged\'!.$4on&ndash;naturalists',
+    '\'(ge-house&$ical&!n&\'s-white\'+/cheltenham((director(+entertainer(&former(%widow%&oraman$!s$!y%$stec#2t&mdash;employment+*retirement',
+    '$#(s)$%-18th%*aboriginal&%ctive&"nd(\'-parcel\'&imated&&pache.\'%ology&#rab)#ian&/utobiographical%%baked\'"nk\'$sque',
+    '&\'lackout&&raided&$uilt\'!y%$cash&%omedy(&munist\'\'ncealed()tribution\'%pyist\'%vered&"ut%(defiance\'$iran\'%velop',
+    '\'#ied\'%unken%1educationists_for&\'mbedded\'#pty&&nglish&(xchanged(\'itement%(familiar&&eigned&%illed\'&nished&%lexed&&ounded&)raternity',
+    '&#und)#ing%(georgian&#oat%#han&$eard&%idden\'%story&%orror%+ideological&)mprovised&%ndian\')stinctual\'&tended&%ssues',
+    '&%itten%$load\'&nesome%\'machine\'!n()ufactured\'#ori\',thematicians&&iracle&%odels)"rn&&ystery)$ical%%named\'$tive',
+    '\'&scured&&rganic(#ies\'&iented(\'ginator%$pack\'%ssive\'&yments&*olymerized&(rivately\'&oposed("se%)qualified\'&estion%&raised',
+    '\'&tional&\'ecorded\'"ds\'$view)#sed&#ime&%uined\'%ssian%$sell\'(ttlement+!r&$hare&#ilk\'%nging&%ocial',
+    '\'+ecification\'\'onsored&(tatement\'#one\'\'ructure%$task&(echnical&&hawing\'!e\'&riller&,ime/distance)$ness(#ing\'$tles&$udor',
+    '%$used%%verse&(ictorian+!y&&olumes%"we\'"ek&$hich&#ork)#ers&#ren$#.it%$that$"/i$#_as',
+    '%(g&eacute%#ker%$mian%!n&"en$%books%&raddan$"ch%$ular$#ech%%d-off%#ien(%staat%$ment%!r',
+    '\'$ship&!s%"s.&#ius$(financed$!h%)enocissus(&gensis(*n-building%$olan$,i&rehy;cular%*al-hearing(#rom(+sightedness\'!1',
+    '()y-aroused*)collapsed*\'damaged+)emocratic+%raped*%eaten+\'xcluded,&ecuted-#mpt*&filled*$open*.pedestrianised%$c\'ly&%-ular&#als',
+    '\'#pal)+nt-analyses-*s-observer,)observers-\'riented+)s-asquith,\'/bodies)#te\'+!.*$ing.+-on&mdash;full-\'-minded-)/activity("er(#lan',
+    '&!l\'"ar)"ly\'$e(s)(.-concentration)\'induced)%laden)&shaped*#ize)"to("ly("s.\'%uarly&%olare&&ualrly',
+    '\'!l(#ar-*#ily+!s,"es,"me,"ts+$zing*%lisms+\'y&mdash,#_in-$with1\'_regard("er(,i&egrave;res',
+    '\'!s&#ura%/es&mdash;except.&should.#the\'!-(&labour)&eaving)$loyd\'!.\'"/4\'-_from_time_to\'&called%"n\'&&g-gift',
+    '%(r&ograve%%sanly(%ships&!h&#ian%\'tion(s))"al)#ist\'%pated\'$tion%"ya$-let/neighbour%+y-completed))nstructed\'*demolished',
+    '\'\'elected(\'nclosed(\'uropean\'(finished(%olded)$rmed\'$gilt\'&liquid\'$made\'$open+\'-to-the+"ed\')paralysed\'(restored\'&saline',
+    '&(_because$5ner-in&rehy;residence*(-mission((swapping\')/employee(&friend(%lover(!s)%enior()workhorse\'+s&mdash;for/$many(#/32)+competitors)(families',
+    ')#the("ee($hip\'+!.++/recognised+"s.(\'whether$(os/rural%"ut$(riarchal&)dge-sized)&/owner*%pilot*)transport&&lineal',
+    '%#ych$,s-and-labour&$each&)of-speech\'#nly&+per-billion&)suppliers&"to%!.%$file%#pck$&tested%$iled&!m%!y',
+    '%!s$%works$*y&mdash;cp,"ip-&slamic,$just,#mlp,"pp-"te,\'renamed,#sdp-"ee,#the%!*%%-20th',
+    '&&backed\'\'uilding&(changing\'\'oloured((mmunists\'-um-discussion&\'defined&&eating&$game\'%ivers)#ing&%hater\'&oppers&\'iranian&$like',
+    '\'%overs&(managers\'%ember&(national\'"ew&&or-die(\'ganized\'$wned&&pieces\'$oint(&litics($pper,!s&"rp\'"un',
+    '\')olidarity(*phisticate\'%pirit(\'litting\'&topper(#yle&#the(%rower-!s\'$urns\'#ype&%union)"ty&&vested&,wall-parapet',
+    '("se(,thin-a-party\'%orker\'&recker&%youth%!.&"38%(/african&*enterprise&*government\'$roup&%union%!2%"35%!5',
+    '&!9%*:meghalaya%$aziz%$ette%#in\'%&mudber%&ocracy%\'rassoul%$sami%$wear##uir$(n/knight$,ri&egrave;re$"yr#&values',
+    '$$enue%!z$\'ifolium%#lle%"ng%(pontanus%#tas$%oleta%\'viruses##wez#%ystec#%zival$%ynski"(s&oacute#(-ce-soir',
+    '$(nggrahan%"te$*r&aacute;n%#ell%&gadear#&calian\'"ne\'!s&!s$$endi$$hali(!s&$sius%!i%"ke',
+    '##dar&5an-e-enqelab-e-eslami%!s#"es$$walk#$hane$$ewar$#ion$"ka$!u%%kanis#%ikale$"no$$phae##jes',
+    '##ley$#ick#"oh$3k&mdash;panhellenic$%linis#$qual\'#ino%"il&$nade\'!i&$rolo#+s&eacute;io,!s&*grave;rent$%-band',
+    '%$card&$odes%%lists%$mark%\'or-fail&"ut%*the-parcel*$ress%$walk&$ords$".i$)acrassana%"de%)ge-graves(%money',
+    ')$ork.\'!m\'%nwerk&#ing)!s%&loecus%"ng&!t%(p/pfaff.%"ro%#uer$$back%#urg$"co&"de',
+    '&$.the%"ga&%giate*!i%!l%*n&rehy;ger&!g\'%er(s))!-*$boat*\'carried*#jet*%level+(iability*$side',
+    '+(teamship*%to-be+#ube)(/freight)$less)\'railway)(s/escape*#_on(!s%%relle\'!s&!i\'"es\'#num&#ont',
+    '(\'through\'#.by%"s.%)toutgrain%!y$#ibe&"us%!c%&evaart%%gnano%\'ng-bell((motorist(%notes(*out-parade(%place',
+    '\'#ham*\'/graham&&ontide%*on-exuding(&filled)&lowers(*hemisphere($less((merchant)#ind(&packed(&ridden((settings\'"al(*te-looking',
+    '\'#els\'&flower($ruit%\'ve-like(&matrix()obedience)#ral\'5/aggressive/assertive(&female&#ize)!d$#man%$ores$&negers%$idge',
+    '$$otho%"ut%(ver-time%!w$#pic%/ort-photo-booth)\'reading)%style)$type(!.((/tickets("ed$%sages$#the$#way',
+    '#+t&mdash;not$7-and-future-catastrophe&$part%#few%\'history%"it%&master%+participant%\'scratch%#the$#.he$(/present$(a-eating&\'loading($ving',
+    '$&e-like%$able%$d-up%&l-blue($rown\'$hued\'(jacketed\'$pink\'&tinted&#ike&"le(!d&!y%$mate%"rs',
+    '&&r-lyon(\'merieux\'%ising($zing$!i%#cci&\'he-like(!d%#des%#lla%"n\'&#aca&!o$!o%*or/teacher',
+    '\'$type&!a\'*l-academic*+gricultural(\'isation&$elli&"ie\'"no\'!s\'"us%"se$)rami-free&"no\'!u&!s',
+    '%%oudis%%uccio%\'y-based($oard\'\'cutting\'$shop&\'cutters&#men&$work$#ten$%ukhov%*re-farming)&lowers(%lands(&reared',
+    '((/meadows$*y-coloured&$list\'&ooking&\'skinned&%white#!u$$ndan##vol##wan#$ztor$%ynski"*t&eacute;e#%-ball$#pat',
+    '##744#$agia%"on\'"es\'#ica$#ila$!k$$llel$"ne$"ra%#ine$#udi$!y#*ch-covered&$hall',
+    '&\'pipette&\'through%!.%&a-mama%$coks\'"rd%%ed-in((together&"ll&.s-on-the-elbow\'!.&!t&!u%#ier&%ng-up',
+    '%"og%*work-quilt#%e-job$%/upon$%field$)l/banbury\'%ooker&<henley-on-thames/oxfordshire&+northampton&%stoke%$isio%(la-tibia\'!r$#nce&+y/occlusion',
+    '%.t&rehy;pending&(-ability(*pplied-for\'%based\'&holder-!s\'\'pending&%right$"ra&!e&#ses%%culus%2nalism/maternalism*"t\'+--collectivist',
+    '()ly-caring%"ra%!s$%sians$!t#7h&eacute;-fr&egrave;res%"gt$!-%%based%%clamp\'&earing&\'ounting%&edging%&finder+!s',
+    '%$node%$side&)mothering%#way$"=c$#ah.%!y$(breaking$"ed%%phone%!r%!s%\'ticness(!s$$find',
+    '$"ia%$rane$%klear$&length$%names!-lump-softness',
 )
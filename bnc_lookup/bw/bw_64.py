@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_64 = (
+count_64 = 6694
+
+heads_64 = (
     'nonappearing',
-    'nonassociative',
-    'nonbiological',
-    'nonbook',
-    'nonbudget-holding',
-    'noncash',
-    'noncatalytic',
-    'nonce-words',
-    'noncey',
-    'nonchalent',
-    'nonchev',
-    'nonchurch',
-    'nonclassical',
-    'noncleaved',
-    'nonclinically',
-    'nonco-operation',
     'noncoding',
-    'noncohabitation',
-    'noncom',
-    'noncomittally',
-    'noncommunicating',
-    'noncomp&lsqb;liance&rsqb',
-    'noncomparable',
-    'noncomplacent',
-    'noncomprehension',
-    'noncomputer-related',
-    'nonconformiste',
-    'nonconsciousness',
-    'nonconservative',
-    'nonconstitutionally',
-    'noncontestable',
-    'noncontradiction',
     'noncontributory',
-    'noncontrol',
-    'nonconventional',
-    'noncovalently',
-    'noncrack',
-    'noncutaneous',
-    'noncyclic',
-    'nondecaying',
-    'nondenaturing',
-    'nondepartmental',
-    'nondepressed',
-    'nondescript-looking',
-    'nondestruction',
-    'nondhaburi',
-    'nondiabetic',
-    'nondisposable',
     'nondistribution',
-    'nondivergent',
-    'nondrinker',
-    'nondrip',
-    'nondurable',
-    'none&rehy;theless',
-    'none-atall',
-    'none-compact',
-    'none-core',
-    'none-more-black',
-    'none-smoking',
-    'none-specialist',
-    'none-such',
-    'none-too',
-    'none-too-agile',
-    'none-too-bright',
     'none-too-cheap',
-    'none-too-creditable',
-    'none-too-easy',
-    'none-too-generous',
-    'none-too-glamorous',
-    'none-too-impressive',
-    'none-too-mild',
-    'none-too-safe',
-    'none-too-steady',
-    'none-too-straightforward',
-    'none-too-white',
-    'none_at',
-    'nonely',
-    'nonempiricist',
-    'nonempty',
-    'nonenity',
     'nonentrepreneur',
-    'nonequilibrium',
-    'nonesense',
-    'nonet',
-    'nonethereal',
-    'noneventful',
-    'nonfamily',
-    'nonfast',
-    'nonfatal',
-    'nonferrous',
-    'nonfigurative',
-    'nonfirst-class',
-    'nonflammable',
-    'nonflicker',
-    'nonfortuitous',
-    'nonfulfilment',
     'nonfunctional',
-    'nonfunding',
-    'nongenotoxic',
-    'nonglacial',
-    'nongovernmental',
-    'nongraduates',
-    'nongreasy',
-    'nonhazardous',
-    'nonhegemon',
-    'nonheinous',
-    'nonhem',
-    'nonhierarchically',
-    'nonhomosexual',
-    'nonhydrogen',
-    'nonident',
-    'nonidet-p40',
     'nonie',
-    'nonimplementable',
-    'nonindividualistic',
-    'noninjurious',
-    'noninteger',
-    'nonintellectual',
-    'noninterference',
-    'nonintervention',
-    'noninterventionist',
-    'nonintimate',
-    'nonionics',
-    'nonis',
-    'nonjudgementally',
-    'nonjudgmental',
-    'nonjurism',
-    'nonjury',
     'nonkin',
-    'nonlactating',
-    'nonlanded',
-    'nonlanguage',
-    'nonlegal',
-    'nonlegalistic',
-    'nonlethal',
-    'nonlife-threatening',
-    'nonlinguist',
-    'nonliteral',
-    'nonliterary',
-    'nonlogic',
-    'nonlogical',
-    'nonmarried',
-    'nonmaterial',
-    'nonmonotic',
     'nonnaming',
-    'nonnebakken',
-    'nono-iodinated',
-    'nonobedience',
-    'nonoc',
-    'nonoise',
-    'nonometres',
-    'nonornamental',
-    'nonoverlapping',
-    'nonovyn',
-    'nonoxinol',
-    'nonoxinol-9',
-    'nonpas',
-    'nonpaying',
-    'nonpeasant',
-    'nonperformance',
     'nonpermissive',
-    'nonphotosynthetic',
-    'nonphysical',
-    'nonplaying',
-    'nonplus',
-    'nonplused',
-    'nonplussing',
-    'nonpolar',
-    'nonpollutingozoneplugginggreenseeminggreenhousesaving',
-    'nonpossessors',
-    'nonproducers',
-    'nonprofessionals',
-    'nonprofit-making',
-    'nonprogressive',
-    'nonproliferating',
-    'nonpublication',
     'nonradiogenic',
-    'nonrandomised',
-    'nonrealist',
-    'nonreconstructionism',
-    'nonredundant',
-    'nonrenormalizable',
-    'nonrepresentational',
-    'nonresidence',
-    'nonresidential',
-    'nonresidents',
-    'nonresonant',
-    'nonrhythmic',
-    'nonrigorous',
-    'nonrising',
-    'nonrivalrous',
-    'nonroutine',
     'nonruminants',
-    'nons',
-    'nonsatisfaction',
-    'nonsavers',
-    'nonscientist',
-    'nonsectarian',
-    'nonsemiological',
-    'nonsense&gt',
-    'nonsense&mdash;they',
-    'nonsense-',
-    'nonsense-languages',
-    'nonsense-maker',
-    'nonsense-rhyme',
-    'nonsense-word',
-    'nonsense.d',
-    'nonsensed',
     'nonsensicality',
-    'nonserious',
-    'nonsexual',
-    'nonsignificant',
-    'nonsmokers.',
-    'nonspecialists',
-    'nonstarter',
-    'nonstatic',
-    'nonstatutory',
-    'nonstochastic',
-    'nonstop-class',
-    'nonstopping',
-    'nonstops',
-    'nonsublimated',
-    'nonsuiting',
-    'nontarget',
     'nonteaching',
-    'nontechnical',
-    'nontemplate',
-    'nonterminated',
-    'nonthaburi',
-    'nontoxic',
-    'nontraditional',
-    'nontransfected',
-    'nonturbulent',
-    'nonuniformities',
-    'nonuniformity',
-    'nonunion',
-    'nonuniversity',
-    'nonurban',
-    'nonusers',
-    'nonvanishing',
     'nonvatable',
-    'nonviable',
-    'nonviewers',
-    'nonvolatile',
-    'nonword',
-    'nonworking',
-    'nonwovens',
-    'nooble',
-    'noodle-like',
-    'noodled',
-    'noodleheads',
-    'noods',
-    'noon&ndash;2.30',
-    'noon&ndash;3',
-    'noon&ndash;6pm',
-    'noon-5.30pm',
     'noon-midnight',
-    'noonpakdiinterior',
-    'noons',
-    'nooooo',
-    'noooooooooooooooooo',
-    'noorani',
-    'noorbanu',
-    'noord',
-    'noordhoff',
-    'noordover',
-    'noorduyn&rehy;designed',
-    'noordwijkerhout-camerino',
-    'noort',
-    'noort.',
-    'noortman',
-    'noorwijkerhout',
     'noose-mark',
-    'noosphere',
-    'nooteboom',
-    'nootka',
-    'nop/',
-    'nop/oet',
-    'nopaline',
-    'nops',
-    'nopt',
-    'nopw',
-    'nor&rehy;mandy',
-    'nor&rehy;wich-based',
-    'nor\'',
-    'nor\'-easters',
-    'nor\'-nor\'-westerly',
-    'nor\'lock',
     'nor\'wester',
-    'nor-easter',
-    'nor-pas-de-calais',
-    'nora-minc',
-    'nora-mine',
-    'noradrenalin',
-    'noralla',
-    'noramidopyrin',
-    'noranda',
-    'norandakerr',
-    'norank',
-    'noranside',
-    'norantea',
-    'norasia',
-    'norasing',
-    'noravjav',
     'norberg',
-    'norbington',
-    'norbiton',
-    'norborough',
-    'norbulinka',
-    'norcliff',
-    'norcliffe',
-    'norcontrol',
-    'norcott',
-    'norcove',
-    'norcroft',
-    'norcros',
-    'nord-pas',
-    'nord-pas-de',
-    'nordangens',
-    'nordanstad-skarstedt',
     'nordau',
-    'nordausque-marck',
-    'nordbayrischer',
-    'norddeutsche',
-    'norddeutschen',
-    'nordell',
-    'nordensk&ouml;ld',
-    'nordenstadt-skarsted',
-    'nordenstam',
-    'norderhaug',
-    'norderney',
-    'nordestino',
-    'nordestinos',
-    'nordgren',
-    'nordgrove',
-    'nordhal',
     'nordheim',
-    'nordhoff',
-    'nordic-looking',
-    'nordica',
-    'nordie',
-    'nordien',
-    'nordischer',
-    'nordjyllands',
-    'nordlandsfe',
-    'nordlund',
-    'nordmanni',
-    'nordobert',
-    'nordoy',
-    'nordpolitik',
-    'nordqua',
-    'nordrhein-jestfalan',
     'nordrhein-westphalia',
-    'nordrheinwestfalen',
-    'nordsewerke',
-    'nordstern',
-    'nordstrom-style',
-    'norduin',
-    'nordwestdeutsches',
-    'nordwijk',
-    'noreens',
-    'norelco',
-    'noreng',
-    'norfolk-born',
-    'norfolk-class',
-    'norfolk-related',
-    'norfolkese',
-    'norfolkish',
     'norfolks',
-    'norfrigge',
-    'norgat',
-    'norgate/gloucestershire',
-    'norges',
-    'norgestrel',
-    'norglen',
-    'norgreen',
-    'norgyal',
-    'norheys',
-    'noribic',
-    'norica',
-    'norican',
-    'noriega-approved',
-    'noriko',
-    'norilsk',
     'norin',
-    'norina',
-    'noristerat',
-    'norit',
-    'noritaki',
-    'norite',
-    'norjac',
-    'norjan',
-    'nork',
-    'norkies',
-    'norkopping',
-    'norlan',
-    'norlander',
-    'norlanders',
-    'norlands',
-    'norm&aelig',
     'norm(s)',
-    'norm-',
-    'norm-and-deviation',
-    'norm-based',
-    'norm-group',
-    'normac/rnaa',
-    'normal&lt;150',
-    'normal&rehy;coloured',
-    'normal\'',
-    'normal-pace',
-    'normal-precision',
-    'normal-sighted',
-    'normal-size',
-    'normal-to-dry',
-    'normal-to-reverse',
-    'normal.dot',
     'normal.however',
-    'normal.the',
-    'normal/dry',
-    'normal/oily',
-    'normal=0',
-    'normala',
-    'normalair-garrett',
-    'normalement',
-    'normales',
-    'normalisability',
-    'normalism',
-    'normalities',
-    'normality\'',
-    'normall',
-    'normally-dominant',
-    'normally-gets',
     'normally-packed',
-    'normally-pigmented',
-    'normally-quoted',
-    'normally-reared',
-    'normally-stony',
-    'normalski',
-    'normaly',
-    'norman-bashing',
-    'norman-speaking',
-    'norman/farmer',
-    'norman/head',
-    'norman/stunt',
-    'normanbrook',
-    'normandes',
-    'normandy-style',
-    'normandy-type',
     'normanised',
-    'normannicus',
-    'normansell',
-    'normark',
-    'normasol',
-    'normative/moral',
-    'normativeness',
-    'normead',
-    'normes',
-    'normie',
-    'normier',
-    'normiger',
-    'normkontrol-leverfahren',
-    'normkontrolleverfahren',
-    'normo',
-    'normously',
     'normski/lift',
-    'normskis',
-    'normura',
-    'normyle',
-    'norns',
-    'norobyn',
-    'noronhianum',
-    'norov',
-    'norpac',
-    'norredine',
-    'norris/branch',
-    'norris/sportsworld',
-    'norris/thames',
-    'norristom',
-    'norrona',
-    'norroy',
     'norsad',
-    'norse/medieval',
-    'norsec',
-    'norselapsis',
-    'norskes',
-    'norsman',
-    'norstadt',
-    'norstar',
-    'norstock',
-    'norsun',
-    'norsys',
-    'nort',
-    'nort-east',
-    'norte/word',
-    'norteamericano',
-    'nortec',
     'north&mdash;south',
-    'north&ndash;euston',
-    'north&ndash;south',
-    'north&rehy;easterners',
-    'north&rehy;south',
-    'north-african',
-    'north-amptonshire',
-    'north-and-south',
-    'north-atlantic',
-    'north-before',
-    'north-carolina',
-    'north-countryman',
-    'north-east-south-west',
-    'north-easter',
-    'north-easterns',
-    'north-easters',
     'north-flowing',
-    'north-for-president',
-    'north-german',
-    'north-humbrian',
-    'north-lit',
-    'north-north',
-    'north-north-eastwards',
-    'north-northwest',
-    'north-of-the-border',
-    'north-sea',
-    'north-southkorea',
-    'north-up',
-    'north-wales',
-    'north-west/south-east',
-    'north.',
-    'north/',
     'north/contra/cbn',
-    'north/frank',
-    'north/vice-chancellor',
-    'north:south',
-    'north:west',
-    'northabout',
-    'northallerton-based',
-    'northalleton',
-    'northamp&rehy;tonshire',
-    'northamptom',
-    'northampton-born',
-    'northampton/',
-    'northampton9',
-    'northamptonians',
-    'northamptons',
-    'northamptonshire-buckinghamshire',
     'northamptonshiremen',
-    'northamptyon',
-    'northan',
-    'northantonshire',
-    'northaven',
-    'northbourne',
-    'northbridge',
-    'northbrook/oxfordshire',
-    'northburgh',
-    'northcote/swindon',
-    'northeast-bound',
-    'northeast-facing',
-    'northeast/southwest',
-    'northeaster',
-    'northeasterns',
-    'northeim',
     'northella',
-    'northelm',
-    'northendon',
-    'northerley',
-    'northern-andean',
-    'northern-born',
-    'northern-hemisphere',
-    'northern-ireland',
-    'northern-led',
-    'northern-sounding',
-    'northern-style',
-    'northern-trained',
-    'northernish',
-    'northewethel',
-    'northeye',
-    'northfield-coalgate',
     'northforeland',
-    'northgang',
-    'northgate/gloucestershire',
-    'northings',
-    'northington',
-    'northism',
-    'northlea',
-    'northlite',
-    'northload',
-    'northmace',
-    'northman',
-    'northmost',
-    'northowram',
-    'northrop-frye-style',
-    'northrup',
-    'northshore',
     'northside/interstella',
-    'northslope',
-    'northsound',
-    'northstead',
-    'norththrop',
-    'northumberlanders',
-    'northumberlands',
-    'northumbian',
-    'northumbrian127-1328.913.4',
-    'northvale',
-    'northville',
-    'northward-bound',
-    'northward-pointing',
-    'northwest-facing',
-    'northwest/',
-    'northwich-based',
     'northwich-winsford',
-    'northwold',
-    'nortolk',
-    'norton-by-twycross',
-    'norton-le-clay',
-    'norton/selsey',
-    'nortronic',
-    'nortumbrian',
-    'norvak',
-    'norvegienne',
-    'norvegium',
-    'norvicase',
-    'norvins',
-    'norw.players',
-    'norway-based',
-    'norway-poland',
     'norwegains',
-    'norwegian-americans',
-    'norwegian-maltese',
-    'norwegian-wooded',
-    'norweign',
-    'norweigy',
-    'norwich-baiting',
-    'norwich-birmingham',
-    'norwich-born',
-    'norwich-coventry',
-    'norwich-trained',
-    'norwich/nottm',
-    'norwich0',
-    'norwick',
-    'norwood-born',
-    'nory',
     'noryl',
-    'nos.1',
-    'nos.119',
-    'nos.12',
-    'nos.20',
-    'nos.27',
-    'nos.42',
-    'noscitur',
-    'nose-',
-    'nose-artist',
-    'nose-bags',
-    'nose-band',
-    'nose-bashing',
-    'nose-bleeds',
-    'nose-cap',
-    'nose-drops',
     'nose-first',
-    'nose-gay',
-    'nose-guard',
-    'nose-heavy',
-    'nose-holding',
-    'nose-in-the-air',
-    'nose-irritating',
-    'nose-low',
-    'nose-pickin\'',
-    'nose-piercing',
-    'nose-pin',
-    'nose-powderings',
-    'nose-ring',
-    'nose-shaped',
-    'nose-stroking',
-    'nose-tickling',
     'nose-tingling',
-    'nose-to-bumper',
-    'nose-wheelie',
-    'nose-wrinkling',
-    'nosebags',
-    'nosecaps',
-    'noseclip',
-    'nosecone',
-    'nosecones',
-    'nosedraggers',
-    'noseful',
-    'noseguards',
-    'nosejob',
-    'noseless/chinless',
-    'nosenraum',
-    'nosepick',
     'nosepicking',
-    'nosepiece',
-    'noser',
-    'nosers',
-    'noses.',
-    'nosette',
-    'nosewheels',
-    'nosey-parkers',
-    'noseyed',
-    'noshery',
-    'nosing-around',
-    'noske',
-    'nosopoetic',
-    'nossen',
-    'nossin',
-    'nosso',
     'nostaglic',
-    'nostalgia-lovers',
-    'nostalgia-soaked',
-    'nostalgia-trip',
-    'nostalgists',
-    'nostei',
-    'nostestosteron',
-    'nostics',
-    'nostil',
-    'nostitz',
-    'nostra/ibi',
-    'nostradamus-like',
-    'nostramo',
-    'nostratic',
-    'nostre',
-    'nostredame',
     'nostrification',
-    'nostrilling',
-    'nostris',
-    'nostro/vostro',
-    'nostrorum',
-    'nostros',
-    'noswaith',
-    'not&iacute;cias',
-    'not&mdash;so&mdash;young',
-    'not&rehy;so-classics',
-    'not(+1)',
-    'not*',
-    'not-a',
-    'not-a-lot-happening',
-    'not-a-present.',
-    'not-all-that-stout',
     'not-altogether',
-    'not-at-home-department',
-    'not-beautiful',
-    'not-being-committed',
-    'not-books',
-    'not-ceiling',
-    'not-cheap',
-    'not-committing',
-    'not-dissimilar',
-    'not-do',
-    'not-doable',
-    'not-especially-musical',
-    'not-every-day',
-    'not-exactly-stunning',
-    'not-exist',
-    'not-existing',
     'not-f',
-    'not-far-distant',
-    'not-floor',
-    'not-for-sale',
-    'not-fully-late',
-    'not-god',
-    'not-half-cheeky',
-    'not-hawk',
-    'not-hess',
-    'not-in',
-    'not-in-front-of-the-children',
-    'not-infrequent',
-    'not-just',
-    'not-knowing',
-    'not-knowing-immediately',
-    'not-lamented',
     'not-long-ago',
-    'not-looking',
-    'not-masculine',
-    'not-much-bigger',
-    'not-much-more',
-    'not-much-reported',
-    'not-not',
-    'not-only',
-    'not-outrageous',
-    'not-p',
-    'not-particularly-modest',
-    'not-quite-',
-    'not-quite-accidentally',
-    'not-quite-blonde',
-    'not-quite-cleanness',
-    'not-quite-concealed',
     'not-quite-definable',
-    'not-quite-finished',
-    'not-quite-grown-up',
-    'not-quite-human',
-    'not-quite-nice',
-    'not-quite-raeburns',
-    'not-quite-redeemed',
-    'not-quite-so-innocent',
-    'not-quite-so-intrepid',
-    'not-quite-so-top',
-    'not-quite-so-traditional',
-    'not-quite-velvet',
-    'not-really-an-aunt',
-    'not-remembering',
-    'not-shot',
-    'not-smoking',
     'not-so-ancient',
-    'not-so-contained',
-    'not-so-covert',
-    'not-so-crazy',
-    'not-so-dearest',
-    'not-so-decent',
-    'not-so-dour',
-    'not-so-dry',
-    'not-so-dumb-broads',
-    'not-so-elected',
-    'not-so-eminent',
-    'not-so-experienced',
-    'not-so-free',
-    'not-so-ginger',
-    'not-so-glorious',
-    'not-so-good-looking',
     'not-so-great',
-    'not-so-hidden',
-    'not-so-humble',
-    'not-so-irrational',
-    'not-so-lazy',
-    'not-so-light',
-    'not-so-little',
-    'not-so-mystery',
-    'not-so-nasty',
-    'not-so-ordinary',
-    'not-so-primed',
-    'not-so-primrosy',
-    'not-so-prodigal',
-    'not-so-radical',
-    'not-so-recent',
-    'not-so-secret',
     'not-so-self-explanatory',
-    'not-so-simple',
-    'not-so-slight',
-    'not-so-small',
-    'not-so-snow-white',
-    'not-so-splendid',
-    'not-so-sweet',
-    'not-so-very',
-    'not-sogoods',
-    'not-subject',
-    'not-surprising',
-    'not-terribly-poor',
-    'not-that',
-    'not-to-be',
-    'not-to-be-relied-upon',
-    'not-to-be-trusted',
     'not-to-keen',
-    'not-too',
-    'not-too-bright',
-    'not-too-daunting',
-    'not-too-deep',
-    'not-too-difficult',
-    'not-too-enquiring',
-    'not-too-exhaustive',
-    'not-too-far-distant',
-    'not-too-gentle',
-    'not-too-high',
-    'not-too-marvellous',
-    'not-too-responsible',
-    'not-too-sound',
-    'not-too-terrible',
-    'not-too-well',
     'not-unattractive',
-    'not-unfounded',
-    'not-unknown',
-    'not-us',
-    'not-utterly-familiar',
-    'not-very-careful',
-    'not-very-complicated',
-    'not-very-covert',
-    'not-very-easy',
-    'not-very-exciting',
-    'not-very-firmly-sealed',
-    'not-very-old',
-    'not-very-political',
-    'not-very-precisely',
-    'not-very-rich',
-    'not-very-secret',
     'not-very-serious',
-    'not-very-standard',
-    'not-wall',
-    'not-was',
-    'not-whole',
-    'not-wholly-unexpected',
-    'not-withstanding',
-    'not-women',
-    'not-would',
-    'not-y',
-    'not-yet',
-    'not-yet-class',
-    'not-z',
-    'not.38',
-    'not.7&mdash;is',
-    'not.fit',
     'not.if',
-    'not/',
-    'not/desire',
-    'not/do',
-    'not/must',
-    'not/ought',
-    'not9',
-    'not_a',
-    'not_as_far',
-    'not_brand',
-    'not_vice',
-    'notabile',
-    'notable\'',
-    'notai',
-    'notalion',
-    'notalways',
     'notam-',
-    'notar',
-    'notari',
-    'notarie',
-    'notaris',
-    'notarisation',
-    'notarise',
-    'notarius',
-    'notarized',
-    'notate',
-    'notation(s)',
-    'notcher',
-    'notches-on-the-bedhead',
-    'note&aacute',
-    'note&rehy;anything',
-    'note&rehy;worthy',
     'note-\'have',
-    'note-cell',
-    'note-change',
-    'note-changes',
-    'note-chewing',
-    'note-combination',
-    'note-conflict',
-    'note-doctoring',
-    'note-dotted',
-    'note-file',
-    'note-form',
-    'note-format',
-    'note-group',
-    'note-inspired',
-    'note-keeping',
-    'note-length',
     'note-lengths',
-    'note-pads',
-    'note-page',
-    'note-playing',
-    'note-rate',
-    'note-relationships',
-    'note-scribblers/pocket',
-    'note-sequence',
-    'note-spinning',
-    'note-structure',
-    'note-succession',
-    'note-systems',
-    'note-the',
-    'note-this',
-    'note-variety',
-    'note-worthy',
     'note.',
-    'note.conduct',
-    'note/delivery',
-    'note:if',
-    'notebook-type',
-    'notebook/xe',
-    'notecard',
-    'notemaking',
-    'noteosuchus',
-    'notepapers',
-    'noters',
-    'notes&rehy;and',
-    'notes.the',
-    'notes/',
-    'notes/charts/prescription',
-    'notes/reading',
     'notespinning',
-    'noteth',
-    'noteworthiness',
-    'notewriters',
-    'notey',
-    'notez',
-    'notghing',
-    'noth-',
-    'nothern',
-    'nothertheless',
-    'nothin\'goat',
-    'nothing-',
-    'nothing-certainly',
-    'nothing-gift',
-    'nothing-happens',
-    'nothing-nothing',
     'nothing-only',
-    'nothing-some',
-    'nothing-to-be-said',
-    'nothing-unless',
-    'nothing.to',
-    'nothing/no-one',
-    'nothing:police',
-    'nothing_so_much',
-    'nothingness-as-art',
-    'nothings.picture',
-    'nothingth',
-    'nothingy',
-    'nothink',
-    'nothyng',
-    'notice-',
-    'notice/advertisement',
     'notice/advice',
-    'noticeable-bank',
-    'noticeable_in',
-    'noticed-pascoe',
-    'notices.',
-    'noticias-el',
-    'notif',
-    'notificatin',
-    'notification/certification',
-    'notin',
-    'noting.',
-    'notins',
-    'notiocypridopsis',
-    'notion.',
-    'notizia',
-    'notnotnot',
     'notonly',
-    'notopocorystes',
-    'notorious.teacher',
-    'notorization',
-    'notors',
-    'notpmd',
-    'notprovide',
-    'notra',
-    'notranjsko',
-    'notre&rehy;dame-de-paris',
-    'notre-dame-des-fleurs',
-    'notropsis',
-    'nott-boyer',
-    'nottage/author',
-    'nottage/jane',
-    'nottidge',
     'nottigham',
-    'notting-ham',
-    'nottingham-darlington',
-    'nottingham-derby',
-    'nottingham-marylebone',
-    'nottingham/derby/leicester',
-    'nottingham18',
-    'nottingham34',
-    'nottinghamsis',
-    'nottinghill',
-    'nottingley',
-    'nottinhgam',
-    'nottle',
-    'notton',
-    'notts-based',
-    'notturnos',
     'notwengide',
-    'notwith&rehy;standing',
-    'notwithstandingfor',
-    'notyp',
-    'nouackchott',
-    'nouakshott',
-    'nouby',
-    'nouch',
-    'nouchi',
-    'nougat-sellers',
-    'nougats',
-    'noughth',
-    'nougzar',
-    'nouioua',
-    'noum&eacute;a',
-    'noumazalay',
     'noumenon',
-    'noun-adjective',
-    'noun-based',
-    'noun-expressions',
-    'noun-name',
-    'noun-per-word',
-    'noun-phrases',
-    'noun-with-name',
-    'noun/adjectival',
-    'noun/name',
-    'noune',
-    'nounphrase',
-    'nounphrases',
-    'noureddin',
-    'nourish&rehy;ment',
-    'nourishingly',
     'nourrice',
-    'nourriche',
-    'nourry',
-    'nouste',
-    'nouv',
-    'nouveau-riches',
-    'nouveau-rural',
-    'nouveauish',
-    'nouvelliste',
-    'nouwen',
-    'nouy',
-    'nov&aacute;k',
-    'nov&eacute',
-    'nov-ember',
-    'nov-feb',
-    'nov-march',
     'nov-novaloft',
-    'nov-provisional',
-    'nov.1',
-    'nov.12',
-    'nov.19',
-    'nov23/dec21',
-    'nova-hunting',
-    'nova-patrol',
-    'nova-t',
-    'nova/magalluf',
-    'nova/tavener',
-    'novacastra',
-    'novacento',
-    'novaco',
-    'novaculichthys',
-    'novacushion',
     'novae-angliae',
-    'novaeangliae',
-    'novaes',
-    'novaeseelandiae',
-    'novafeltria',
-    'novagard',
-    'novakowski',
-    'novamont',
-    'novantaquattro',
-    'novara-curat',
-    'novare',
-    'novark',
-    'novaro',
-    'novarro-vallas',
-    'novarupta',
-    'novatian',
     'novating',
-    'novbember',
-    'noveau',
-    'novecento.',
-    'novel\'',
-    'novel-in-a-box',
-    'novel-readers',
-    'novel-reading',
-    'novel-text',
-    'novel.',
-    'novel/poem',
-    'novelist-television-arts-person',
-    'novelization',
-    'novelize',
-    'novell-authorised',
-    'novell-buys-unix',
     'novell-killer',
-    'novell-usl',
-    'novell/at&amp;t',
-    'novell/solaris-on-intel',
-    'novelle',
-    'novellist',
-    'novellus',
-    'novelois',
-    'novels/biographies',
-    'november&mdash;friday',
-    'november&ndash;20',
-    'november&ndash;monday',
-    'november&ndash;wednesday',
-    'november-',
-    'november-10',
-    'november-13',
     'november-14',
-    'november-16',
-    'november-18',
-    'november-19',
-    'november-20',
-    'november-22',
-    'november-24',
-    'november-29',
-    'november-30',
-    'november-4',
-    'november-6',
-    'november-9',
-    'november-june',
-    'november-may',
-    'november1993',
-    'november1994&ndash;12',
     'novembergruppe',
-    'novemeber',
-    'novemebr',
-    'novemver',
-    'novespace',
-    'novex',
-    'novgorodsev',
-    'novia',
-    'novice-mistress',
-    'novice-monk',
-    'novices-rowdies-town',
-    'novices.',
-    'noviceship',
-    'noviciates',
-    'novik',
-    'novine',
     'novinex',
-    'novio',
-    'noviomagus',
-    'novis',
-    'novit',
-    'novitate',
-    'novitiates',
-    'novo-nordisk',
-    'novo-ogarevo',
-    'novodevichi',
-    'novodor',
-    'novograd',
-    'novogrodek',
-    'novolak',
-    'novorossisk',
-    'novorossysk',
     'novosibirsk-based',
-    'novosiltsev',
-    'novotex',
-    'novotny',
-    'novotour',
-    'novre',
-    'novska',
-    'novum',
-    'novx',
-    'now&bull',
-    'now&mdash',
-    'now&ndash',
-    'now&rehy;adays',
-    'now\'\'',
-    'now\'n',
-    'now-\'i',
     'now-a',
-    'now-abed',
-    'now-abundant',
-    'now-accepted',
-    'now-ailing',
-    'now-as',
-    'now-banned',
-    'now-biddable',
-    'now-blushing',
-    'now-bottom',
-    'now-celebrated',
-    'now-classic',
-    'now-collapsed',
-    'now-complex',
-    'now-conventional',
-    'now-crimson',
     'now-deleted',
-    'now-derelict',
-    'now-destroyed',
-    'now-disintegrating',
-    'now-dispersed',
-    'now-dissolved',
-    'now-distant',
-    'now-drowned',
-    'now-emerging',
-    'now-expected',
-    'now-fabled',
-    'now-giggling',
-    'now-gone',
-    'now-hushed',
-    'now-identified',
-    'now-illegal',
     'now-inactive',
-    'now-moonless',
-    'now-now',
-    'now-obligatory',
-    'now-obvious',
-    'now-or-never',
-    'now-pop',
-    'now-rare',
-    'now-realized',
-    'now-regulation',
-    'now-revolutionary',
-    'now-rotating',
-    'now-ruined',
-    'now-sensitised',
-    'now-sophisticated',
-    'now-sovereign',
     'now-stagnant',
-    'now-standard',
-    'now-substantial',
-    'now-sullied',
-    'now-superior',
-    'now-they-work-and-now-they-don\'t',
-    'now-trademark',
-    'now-traditional',
-    'now-tragic',
-    'now-unfashionable',
-    'now-universal',
-    'now-visible',
-    'now-wetted',
-    'now-withdrawn',
-    'now-you',
-    'now-you-do',
     'now-you-see-it',
-    'now-you-see-me-now-you-don\'t',
-    'now/&commat',
-    'now/i',
-    'now/in',
-    'now/with',
-    'now_,_now_that',
-    'now_erm_that',
-    'nowanda',
-    'nowe',
-    'nowehere',
-    'nowelis',
-    'nowell-smith',
-    'nowerland',
-    'nowhere-he',
-    'nowhere.',
     'nowhere/',
-    'nowich',
-    'nowick',
-    'nowickienvironmental',
-    'nowjoined',
-    'nowlan',
-    'nowlegendary',
-    'nowosielski',
-    'nowotny',
-    'nowr',
-    'nowseem',
-    'nowshera',
-    'nowsimply',
-    'nowsud',
-    'nowty',
-    'nox-belching',
     'nox-output',
-    'nox/particulate',
-    'noxiour',
-    'noxious-smelling',
-    'noy',
-    'noyabrsk',
-    'noyau',
-    'noyous',
-    'noyses',
-    'noz',
-    'nozac',
-    'nozi&egrave;res',
-    'nozickian',
-    'nozomi',
-    'nozrim',
-    'nozzi',
     'nozzle-beam',
-    'nozzle.',
-    'np/75/88',
-    'np1',
-    'np228',
-    'np27',
-    'np44',
-    'np9&gt',
-    'npd*',
-    'npd***',
-    'npfl-led',
-    'npg-gma',
-    'nph',
-    'npn-controlled',
-    'npn-ruled',
-    'npn-supporting',
     'npo/barbirolli',
-    'nppf',
-    'npr',
-    'npsr',
-    'npup',
-    'nqaba',
-    'nqojane',
-    'nqvs',
-    'nqw',
-    'nr.936206',
-    'nr/2',
-    'nr1313',
-    'nr14',
-    'nr208639',
-    'nr21',
-    'nr2100',
     'nr215566',
-    'nr26',
-    'nr272732',
-    'nr289745',
-    'nr3',
-    'nr307652',
-    'nr4',
-    'nr49v',
-    'nr64',
-    'nr718l',
-    'nrbl',
-    'nrc6096kkk',
-    'nre',
-    'nrg',
-    'nrh',
-    'nrht',
     'nrls',
-    'nrpb-r135',
-    'nrs16,890',
-    'nrs2,080',
-    'nrs26,600',
-    'nrv',
-    'nrx',
-    'ns-e100',
-    'ns.20a(a)',
-    'ns.20a(b)',
-    'ns/290',
-    'ns/nns',
-    'ns2a',
-    'ns32000-based',
-    'ns80',
-    'nsabimana',
     'nsad',
-    'nsc/4',
-    'nsd',
-    'nsdap-danzig',
-    'nsds',
-    'nsekalije',
-    'nselling',
-    'nseng',
-    'nsengumuremyi',
-    'nsf-dec.',
-    'nsgi',
-    'nshg',
-    'nsiad',
-    'nsibandze',
-    'nsing',
-    'nsinga',
     'nsls',
-    'nsongo',
-    'nspcc.',
-    'nsppc',
-    'nspss',
-    'nsse',
-    'nstc',
-    'nsu-contacts',
-    'nsugbe/paul',
-    'nsungu',
-    'nswlr',
-    'nt&amp;t',
-    'nt&dollar;50million',
-    'nt-capamips-based',
-    'nt-killer',
-    'nt-on-i860',
     'nt-on-mips',
-    'nt-on-pentium',
-    'nt-run',
-    'nt-suitable',
-    'nt/',
-    'nt/andrew',
-    'nt/smp',
-    'nt15',
-    'nta',
-    'ntagazwa',
-    'ntahuga',
-    'ntahugajustice',
-    'ntbr',
-    'ntcheu',
-    'ntda',
-    'ntecedent',
     'ntg',
-    'nthato',
-    'nti',
-    'nti-lactoferrin',
-    'ntietsa',
-    'ntimana',
-    'ntimba',
-    'ntlakyapamuk',
-    'ntm',
-    'ntmaga',
-    'ntolo',
-    'ntombi',
-    'ntombifuti',
-    'ntp',
-    'ntsanwisi',
-    'ntsc/pal',
     'ntso',
-    'ntssb',
-    'ntsundu',
-    'nttf',
-    'ntuli',
-    'ntumaza',
-    'ntumazah',
-    'ntz101',
-    'nu&eacute;es',
-    'nu&ntilde;oa',
-    'nu\'auli\'itia',
-    'nu\'ual\'itia',
-    'nu\'uali\'itia',
-    'nu-groove',
-    'nu-line',
-    'nu-matic',
     'nu-nu-nursery',
-    'nu-plex',
-    'nu:an',
-    'nuada',
-    'nuage',
-    'nuamrimol',
-    'nuance-rich',
-    'nuancing',
-    'nuane',
-    'nuanetsi',
-    'nubas',
-    'nubbins',
-    'nubbly',
-    'nubeach.dib',
-    'nubeneham',
-    'nubicus',
     'nubin',
-    'nubuck',
-    'nuc.',
-    'nuce',
-    'nuce1la',
-    'nucelophilic',
-    'nucifera',
-    'nuckell',
-    'nucl&eacute;aires',
-    'nuclear-accounting',
-    'nuclear-alert',
-    'nuclear-capable',
-    'nuclear-defence',
-    'nuclear-dependent',
-    'nuclear-deterrence',
-    'nuclear-engineering',
     'nuclear-explosive',
-    'nuclear-like',
-    'nuclear-non',
-    'nuclear-power-plant',
-    'nuclear-submarine',
-    'nuclear-test',
-    'nuclear-testing',
-    'nuclear-warhead',
-    'nuclear-waste-repository',
-    'nuclear-weapon',
-    'nuclear-weapons-carrying',
-    'nuclear/non-nuclear',
-    'nuclearwaste',
-    'nuclearweapons',
-    'nucleases',
-    'nucleations',
     'nucleids',
-    'nucleo',
-    'nucleo-cytoplasmic',
-    'nucleoids',
-    'nucleolus',
-    'nucleon-to-electron',
-    'nucleonic',
-    'nucleonics',
-    'nucleopcapid',
-    'nucleopore',
-    'nucleoproteins',
-    'nucleosome-free',
-    'nucleotide-binding',
-    'nucleotide/mg',
-    'nucloeitde',
-    'nucoeotide',
     'nucor',
-    'nucula',
-    'nucus',
-    'nuda',
-    'nuddea',
-    'nudderwar',
-    'nude-magazines',
-    'nudel',
-    'nuder',
-    'nudgings',
-    'nudicaule',
-    'nudie',
-    'nudiflora',
-    'nudism',
-    'nudist.',
-    'nudnik',
     'nudson',
-    'nudy',
-    'nue',
-    'nuestro',
-    'nuewirth',
-    'nufeibeh/surgeon',
-    'nuffield/schools',
-    'nuffin',
-    'nuffinks',
-    'nuffsaid',
-    'nuforms',
-    'nugahiro',
-    'nugai',
-    'nugdalla',
-    'nugent-scott',
-    'nuggeted',
     'nugmanov',
-    'nugs',
-    'nugteren',
-    'nugueymat',
-    'nuh',
-    'nuhomes',
-    'nuict',
-    'nuisance-free',
-    'nuisance.a',
-    'nuisence',
-    'nujol',
-    'nuk',
-    'nuki',
-    'nukraine',
-    'nuku',
-    'nulg.lgpmmgimms',
     'nulg.lgpmmgimms2',
-    'nulg.lgpmmgims3',
-    'null-sense',
-    'nullabor',
-    'nulli',
-    'nullport=none',
-    'nulls',
-    'nullum',
-    'nultifocal',
-    'nulty',
-    'num-nums',
-    'num-sponsored',
-    'numac',
-    'numan/stevie',
-    'numantia',
-    'numbe',
     'number%',
-    'number&amp',
-    'number&gt',
-    'number+conditional',
-    'number+the',
-    'number+unconditional',
-    'number-coded',
-    'number-cruncher',
-    'number-density',
-    'number-five',
-    'number-one-with-the-people',
-    'number-packed',
-    'number-sequence',
-    'number-shufflers',
-    'number-site',
-    'number-taking',
     'number/civil',
-    'number/continuation',
-    'number/creation',
-    'number/cross-',
-    'number/dictionary',
-    'number/first',
-    'number/id',
-    'number/print',
-    'number/psn/lemmatised',
-    'number/sense',
-    'number/sequence',
-    'number/text',
-    'number2tongue',
-    'number:472-0621-2',
-    'numberonetongues',
-    'numberous',
     'numbers&mdash;and',
-    'numbers(23)',
-    'numbers-of',
-    'numbers/growth',
-    'numbing-his',
-    'numbr',
-    'numerable',
-    'numeracy&amp;sup3',
-    'numerals&mdash',
-    'numerian',
-    'numeric/editing',
-    'numerically-controlled',
-    'numerically-quantifiable',
-    'numerique',
-    'numerologists',
-    'numerosa',
     'numerous/many',
-    'numia',
-    'numida',
-    'numidia',
-    'numidius',
-    'numidus',
-    'numismatica',
-    'nummularium',
-    'nummulitic',
-    'nummulitiche',
-    'numnahs',
-    'numnber',
-    'numorous',
-    'nums',
-    'numskull',
-    'numwords',
     'nun-arbitrary',
-    'nun-cum-critic-cum-tv-star',
-    'nun-drama',
-    'nun-sense',
-    'nun/chapeleyne',
-    'nunatak',
-    'nunawading',
-    'nunburnholme',
-    'nunchaku',
-    'nuncheon',
-    'nunciate',
-    'nuncupatum',
-    'nundred',
-    'nunes-by-ipswich',
-    'nunezovari',
-    'nung',
     'nunhead',
-    'nuniads',
-    'nunkton',
-    'nunley',
-    'nunna',
-    'nunnally',
-    'nunquam',
-    'nunraw',
-    'nuns-and-donkeys',
-    'nunus',
-    'nunwick',
-    'nunyerry',
-    'nuovi',
-    'nuovissino',
-    'nup-controlled',
-    'nupen',
     'nuper',
-    'nupkins',
-    'nuptia',
-    'nuptial-night',
-    'nuptias',
-    'nurabagambetov',
-    'nural',
-    'nuraxi',
-    'nurburg',
-    'nurden',
-    'nurds',
-    'nure',
-    'nureg',
-    'nureg-0600',
-    'nuremburgs',
-    'nurenburg',
     'nureyeved',
-    'nureyevs',
-    'nurgis',
-    'nurglesque',
-    'nurhan',
-    'nurina',
-    'nuristanis',
-    'nurk',
-    'nurkse',
-    'nurls',
-    'nurminen',
-    'nurnburg',
-    'nurofin',
-    'nurrungar',
-    'nurs',
-    'nurse-crammed',
     'nurse-cum-mother',
-    'nurse-keeping',
-    'nurse-to-patient',
-    'nurse-training',
-    'nurse/midwife',
-    'nurseless',
-    'nursery-book',
-    'nursery-cum-workroom',
-    'nursery-garden',
-    'nursery-man',
-    'nursery-quarters',
-    'nursery-rhymes',
-    'nursery-users',
-    'nursery.those',
-    'nursery/early',
-    'nursery/first',
     'nursery/playroom',
-    'nurseryland',
-    'nurserys',
-    'nurses/midwives',
-    'nurses/mothers',
-    'nursin\'',
-    'nursing-oriented',
-    'nursing-related',
-    'nursing/institutional',
-    'nursing/teaching/ballet/ice-skating/',
-    'nurton',
-    'nurturance-',
-    'nurture-unit',
-    'nurullo',
-    'nurzay',
-    'nus/ub40',
     'nusantara',
-    'nusarat',
-    'nusaybin',
-    'nusbaum',
-    'nusbaumer',
-    'nuseibeh',
-    'nusfj&ouml;rd',
-    'nusiance',
-    'nusplingen',
-    'nussbaum',
-    'nusseibah',
-    'nusseirat',
-    'nussex',
-    'nussey',
-    'nust',
-    'nustafa',
     'nusviodon',
-    'nut-and-bolt',
-    'nut-brown-haired',
-    'nut-bushes',
-    'nut-case.',
-    'nut-chewing',
-    'nut-cracker',
-    'nut-crackers',
-    'nut-hoards',
-    'nut-like',
-    'nut-milk',
-    'nut-sellers',
-    'nut-shell',
-    'nuta',
-    'nutacon',
-    'nutans',
     'nutbag',
-    'nutbrook',
-    'nutcombe-quicke',
-    'nutcrackery',
-    'nutella',
-    'nutgw',
-    'nuthampstead',
-    'nuthurst',
-    'nutiritionally',
-    'nutmeg-flavoured',
-    'nutmeg-scented',
-    'nutmegged',
-    'nutmegs.',
-    'nuto',
-    'nutr',
-    'nutra',
     'nutramigen',
-    'nutrasome',
-    'nutrasweet-sponsored',
-    'nutrents',
-    'nutrient-conservation',
-    'nutrient-cycling',
-    'nutrient-sodium',
-    'nutrition.',
-    'nutrition/hydration',
-    'nutritionalists',
-    'nutritionally-based',
-    'nutritionally-disordered',
-    'nutritiously',
-    'nuts/string-guides',
-    'nutsedge',
-    'nutshells',
     'nutt/dept',
-    'nuttall/shop',
-    'nutted',
-    'nutten',
-    'nuttey',
-    'nuttos',
-    'nutty-slag',
-    'nuttycore',
-    'nuture',
-    'nutured',
-    'nutus',
-    'nutvu',
-    'nutw',
-    'nuuuummmmineeeeahh',
-    'nuvan',
-    'nuvellist',
     'nuvin',
-    'nuvoc',
-    'nuvoe',
-    'nuvolone',
-    'nuwara',
-    'nuwe',
-    'nuyf',
-    'nuys',
-    'nuytten',
-    'nv-a850',
-    'nv-nylon/viscose',
-    'nva&mdash;the',
-    'nvax',
-    'nvcq',
-    'nver',
-    'nvestigation',
     'nvg',
-    'nvocc-service',
-    'nvp-led',
-    'nvpp',
-    'nvq.',
-    'nvq/svq',
-    'nvqers',
-    'nvqs/svqs',
-    'nvu',
-    'nvumba',
-    'nw&ndash;se',
-    'nw-se',
-    'nw/se',
-    'nw8.',
-    'nwa-style',
-    'nwanza',
     'nwapo',
-    'nwce',
-    'nwcta',
-    'nwe',
-    'nwest',
-    'nwn',
-    'nwoboshi',
-    'nwoke',
-    'nwokobia',
-    'nwpss',
-    'nws-3150',
-    'nws-5000',
-    'nws5000tf',
-    'nwsf',
-    'nwukanma',
-    'nwwt',
     'nwyvre',
-    'nx1337a',
-    'nx1337a.',
-    'nx2',
-    'nx20sf',
-    'nx2491',
-    'nx3145x',
-    'nx41964',
-    'nx55nj',
-    'nx67hp',
-    'nx749dp',
-    'nxc',
-    'nxc3',
-    'nxd2',
-    'nxe3',
-    'nxe4.',
     'nxe6+&verbar&verbar;qxe6&verbar&verbar',
-    'nxf7',
-    'nxg4',
-    'ny-based',
-    'ny913701',
-    'nyaaah',
-    'nyaboya',
-    'nyagah',
-    'nyageh',
-    'nyahururu',
-    'nyakana',
-    'nyakatale',
-    'nyambura',
-    'nyamdavas',
-    'nyams',
-    'nyamwezi',
     'nyamwisi',
-    'nyamwizi',
-    'nyang\'anyi',
-    'nyanna',
-    'nyantren',
-    'nyanya',
-    'nyanzapithecus',
-    'nyarlathotep',
-    'nyassanus',
-    'nyaung-ngu',
-    'nyawspepper',
-    'nyaya-vaiseka',
-    'nycanthes',
-    'nycb',
-    'nyce',
-    'nyclopone',
     'nyctaginaceae',
-    'nycthemera',
-    'nyegaard',
-    'nyeht',
-    'nyemba',
-    'nyemwezi',
-    'nyemyets',
-    'nyereri',
-    'nyezavisimikh',
-    'nyffenegger',
-    'nyflex',
-    'nygaar',
-    'nyggin',
-    'nyhavn',
-    'nyiff',
-    'nyiregyhaza',
     'nyiro',
-    'nyiwa',
-    'nyjinksy',
-    'nyk&ouml;ping',
-    'nykland',
-    'nykredit',
-    'nylar',
-    'nylon-7,7',
-    'nylon-bristle',
-    'nylon-coated',
-    'nylon-covered',
-    'nylon-for-acrylics',
-    'nylon-reinforced',
-    'nylon-type',
-    'nylon-weave',
-    'nylon/10%',
     'nylon/aluminium',
-    'nylon/lycra',
-    'nylon/synthetic',
-    'nylstroom',
-    'nym&aring;nen',
-    'nymansensis',
-    'nymph-ravaging',
-    'nympha',
-    'nympheaceae',
-    'nymphomane',
-    'nymphomaniacal',
-    'nymphon',
-    'nymphos',
-    'nymphs.',
-    'nymphsfield',
-    'nymphsfield/gloucestershire',
     'nympilaea',
-    'nymr',
-    'nynas',
-    'nyne',
-    'nynex-hitrail',
-    'nynorsk',
-    'nyns-us',
-    'nyoman',
-    'nyonsais',
-    'nypo',
-    'nypo/bernstein',
-    'nypo/masur',
-    'nyrup-rasmussen',
-    'nysa-scythopolis',
-    'nyse-listed',
-    'nyss',
     'nystadt',
-    'nyt',
-    'nyte',
-    'nyth-bran',
-    'nytim',
-    'nytorv',
-    'nyugati',
-    'nyum-nyumming',
-    'nyundo',
-    'nyx',
-    'nz&dollar;0.002bn',
-    'nz&dollar;0.428bn',
-    'nz&dollar;0.507bn',
-    'nz&dollar;0.9bn',
-    'nz&dollar;1,400',
-    'nz&dollar;1,739',
     'nz&dollar;1.3',
-    'nz&dollar;1.5bn',
-    'nz&dollar;1.7bn',
-    'nz&dollar;1.8bn',
-    'nz&dollar;10.6bn',
-    'nz&dollar;120',
-    'nz&dollar;13bn',
-    'nz&dollar;15,000,000',
-    'nz&dollar;15.1bn',
-    'nz&dollar;150',
-    'nz&dollar;2,370',
-    'nz&dollar;2,500',
-    'nz&dollar;2.00',
-    'nz&dollar;2.021bn',
-    'nz&dollar;2.528bn',
-    'nz&dollar;20.1bn',
     'nz&dollar;20.3bn',
-    'nz&dollar;27.3bn',
-    'nz&dollar;3',
-    'nz&dollar;3,000',
-    'nz&dollar;3,218',
-    'nz&dollar;3,700',
-    'nz&dollar;3.00',
-    'nz&dollar;3.049bn',
-    'nz&dollar;3.3bn',
-    'nz&dollar;3.4bn',
-    'nz&dollar;39',
-    'nz&dollar;4,200',
-    'nz&dollar;4,250',
-    'nz&dollar;4,500',
-    'nz&dollar;4.6bn',
-    'nz&dollar;42.2bn',
     'nz&dollar;440',
-    'nz&dollar;46.7bn',
-    'nz&dollar;5,000,000',
-    'nz&dollar;5,200',
-    'nz&dollar;5.00',
-    'nz&dollar;5.3bn',
-    'nz&dollar;500',
-    'nz&dollar;528',
-    'nz&dollar;5bn',
-    'nz&dollar;6',
-    'nz&dollar;601',
-    'nz&dollar;61,075',
-    'nz&dollar;63,805',
-    'nz&dollar;7,000',
-    'nz&dollar;750',
-    'nz&dollar;7bn',
     'nz&dollar;8.8bn',
-    'nz&dollar;80',
-    'nz&dollar;89',
-    'nz&pound;14',
-    'nz&pound;297.10',
-    'nz&pound;9.12',
-    'nz-based',
-    'nz-made',
-    'nz-type',
-    'nz1075/vh-',
-    'nz2518',
-    'nz5648',
-    'nzambo',
-    'nzanda',
-    'nzang',
-    'nzcc',
     'nzd',
-    'nzdp',
-    'nze',
-    'nze-emane',
-    'nzeogu',
-    'nzirorera',
-    'nzita',
-    'nzlr',
-    'nzraf',
-    'nzs',
-    'nztv',
-    'o&amp;k',
-    'o&ccaron;ko',
-    'o&deg;c',
-    'o&dollar&dollar',
-    'o&euml;r&oacute&euml',
     'o&ndash',
-    'o&ndash;320',
-    'o&ndash;5',
-    'o&ndash;pressed',
-    'o&ndash;ten',
-    'o&ndash;the',
-    'o&oacute;3in',
-    'o&ouml;genesis',
-    'o&pound;conjure',
-    'o&rarr;ch',
-    'o\'-levels',
-    'o\'amiss',
-    'o\'balgownie',
-    'o\'bear',
-    'o\'beath',
-    'o\'beugh',
     'o\'bleary',
-    'o\'booze',
-    'o\'bowl',
-    'o\'bree/',
-    'o\'brien-busteed',
-    'o\'brien-synge',
-    'o\'brien/',
-    'o\'brien/harryhausen',
-    'o\'brien/ireland',
-    'o\'bryan',
-    'o\'bryne',
-    'o\'buachalla',
-    'o\'business',
-    'o\'carolan',
-    'o\'clcock',
-    'o\'cleary',
     'o\'clo',
-    'o\'clock-ish',
-    'o\'clyne',
-    'o\'cold',
-    'o\'connell/family',
-    'o\'connells',
-    'o\'connnor',
-    'o\'connor-haters',
-    'o\'connor-hosted',
-    'o\'connor.',
-    'o\'connor/sugarcubes',
-    'o\'cosworth',
-    'o\'culshaw',
-    'o\'dandy',
-    'o\'dee',
-    'o\'dell/resident',
     'o\'donn',
-    'o\'donnell-welcoming',
-    'o\'donnell/award',
-    'o\'donnell/father',
-    'o\'donnell/tara',
-    'o\'donohue',
-    'o\'dowd/northants',
-    'o\'dubayn',
-    'o\'dubhghaill',
-    'o\'dubhthaigh',
-    'o\'ed',
-    'o\'er-green',
-    'o\'er-parted',
-    'o\'er/to',
-    'o\'erburdened',
-    'o\'ereaten',
     'o\'erflowing',
-    'o\'erraught',
-    'o\'erslack',
-    'o\'erspread',
-    'o\'erstretched',
-    'o\'ertake',
-    'o\'ertop',
-    'o\'erworn',
-    'o\'ferguson',
-    'o\'ferrall',
-    'o\'ferrell',
-    'o\'fiach',
-    'o\'fourman',
-    'o\'freal',
-    'o\'friel',
-    'o\'gowan',
     'o\'grady/hiv',
-    'o\'gram',
-    'o\'groats.ken',
-    'o\'gynist',
-    'o\'hagans',
-    'o\'hagarty',
-    'o\'hagen',
-    'o\'hair',
-    'o\'hara-designed',
-    'o\'heads-down',
-    'o\'hehir',
-    'o\'hehir/racing',
-    'o\'heiher',
-    'o\'heiner',
-    'o\'hunt',
-    'o\'jay',
     'o\'k',
-    'o\'keefe/galileo',
-    'o\'ketch',
-    'o\'larey',
-    'o\'laughlin',
-    'o\'leary/',
-    'o\'level',
-    'o\'liver',
-    'o\'london',
-    'o\'lone/anthony',
-    'o\'lone/don',
-    'o\'loughlins',
-    'o\'mahon',
-    'o\'mallon',
-    'o\'mally',
-    'o\'man',
     'o\'marde',
-    'o\'mardehome',
-    'o\'marley',
-    'o\'meara/acting',
-    'o\'mine',
-    'o\'moran',
-    'o\'moray',
-    'o\'muck',
-    'o\'muircheartaigh',
-    'o\'murphy',
-    'o\'mutton',
-    'o\'n',
-    'o\'neil/animal',
-    'o\'neil/jockey',
-    'o\'neill-pen',
-    'o\'neill/age',
     'o\'neill/caesarean',
-    'o\'neill/development',
-    'o\'neill/dumbarton',
-    'o\'neill/hibernian',
-    'o\'neill/labour',
-    'o\'neillite',
-    'o\'neillites',
-    'o\'niell',
-    'o\'night',
-    'o\'priwileges',
-    'o\'rafferty',
-    'o\'rahilly',
-    'o\'reilly/malvern',
-    'o\'reilly/rothman',
-    'o\'reilly/speed',
-    'o\'reillys',
     'o\'riada',
-    'o\'rieda',
-    'o\'riordain',
-    'o\'ryan',
-    'o\'shaughnessey',
-    'o\'shaugnessy',
-    'o\'shea/wiltshire',
-    'o\'shotts',
-    'o\'snodaigh',
-    'o\'stickle',
-    'o\'stout',
-    'o\'sullivan/acting',
-    'o\'sullivan/sandoz',
-    'o\'sullivan/steeple',
-    'o\'sullivans',
-    'o\'th\'',
     'o\'th\'coxcomb',
-    'o\'thello',
-    'o\'toole-ewald',
-    'o\'tuathaig',
-    'o\'vino',
-    'o\'yore',
-    'o(n3)',
-    'o(nk)',
-    'o(x)',
-    'o(x)/',
-    'o*e-sided',
-    'o+r+c',
-    'o+t',
-    'o-1',
-    'o-2',
-    'o-235',
     'o-2a',
-    'o-300',
-    'o-360-a1a',
-    'o-50',
-    'o-7fpk',
-    'o-a',
-    'o-acetylated',
-    'o-b-i-t-r-y',
-    'o-birthday',
-    'o-bournemouth',
-    'o-cedar',
-    'o-dianisidine',
-    'o-e',
-    'o-en',
-    'o-eru',
-    'o-fish-al',
     'o-five',
-    'o-four-one',
-    'o-grades',
-    'o-h-m',
-    'o-hay',
-    'o-kay',
-    'o-labelled',
-    'o-levels.',
-    'o-methyldeoxy-guanosine',
-    'o-negative',
-    'o-nine-tails',
-    'o-no',
-    'o-o-o-h',
-    'o-octyl-&bgr;-d-glucopyranoside',
-    'o-phenanthroline',
-    'o-pin-ion',
     'o-quinones',
-    'o-scz',
-    'o-stars',
-    'o-three',
-    'o-type',
-    'o-ver',
-    'o-wa',
-    'o-wait',
-    'o-x',
-    'o-zone',
-    'o.3g/s/m&amp;sup2',
-    'o.5-mm',
-    'o.55',
-    'o.56',
-    'o.75bn',
-    'o.86',
     'o.a',
-    'o.a.17.',
-    'o.a.p.s',
-    'o.a.s.',
-    'o.berteriana',
-    'o.c.d.p.',
-    'o.carl',
-    'o.civelli',
-    'o.e.e.c.',
-    'o.f',
-    'o.h',
-    'o.h.c',
-    'o.h.m.s',
-    'o.h.m.s.',
-    'o.henry',
-    'o.j.',
     'o.l.',
-    'o.m.',
-    'o.m.i.',
-    'o.o',
-    'o.p.e.c.',
-    'o.p.p',
-    'o.r.',
-    'o.t.t.',
-    'o.u.',
-    'o.v.',
-    'o/40',
-    'o/bi',
-    'o/c',
-    'o/h',
-    'o/predicates',
-    'o/s/gcse',
     'o/winding',
-    'o00',
-    'o0ver',
-    'o1\'-endo',
-    'o16',
-    'o1a',
-    'o2(g)',
-    'o2look',
-    'o2look.',
-    'o2su',
-    'o3',
-    'o4',
-    'o50s',
-    'o55',
-    'o7',
-    'o8',
     'o9',
-    'o:dowex-50w',
-    'o:rwed',
-    'o=only',
-    'oa60009094',
-    'oa60009545',
-    'oa9x20f',
-    'oaaah',
-    'oaas',
-    'oad',
-    'oadf(f)',
-    'oadfs',
-    'oadg',
-    'oading',
-    'oaed',
-    'oaes',
     'oaes&amp;sup*',
-    'oaf-twit-blockhead',
-    'oaff',
-    'oafishly',
-    'oafishness',
-    'oak-and-steel',
-    'oak-apple',
-    'oak-block',
-    'oak-faced',
-    'oak-framed',
-    'oak-fronted',
-    'oak-grove',
-    'oak-hard',
-    'oak-leaf-encrusted',
-    'oak-leaves',
-    'oak-lined',
     'oak-look',
-    'oak-planked',
-    'oak-railed',
-    'oak-soft',
-    'oak-wood',
-    'oak-woods',
-    'oakapples',
-    'oakbaraton',
-    'oakdeane',
-    'oakden',
-    'oakeleys',
-    'oakely',
-    'oakengates',
-    'oakensen',
-    'oakenshott',
-    'oakes/boatbuilder',
     'oakeshott/john',
-    'oakey/sculptor',
-    'oakey/tony',
-    'oakford',
-    'oakheads',
-    'oakhouse',
-    'oaking',
-    'oaklea',
-    'oakley/ucca',
-    'oakmeeds',
-    'oakmont',
-    'oakmount',
-    'oakpanelled',
-    'oaktree',
-    'oaky-smokey',
-    'oaldle',
     'oalf',
-    'oalistach',
-    'oamaru',
-    'oamuru',
-    'oany',
-    'oanythin\'',
-    'oanywhere',
-    'oanywy',
-    'oao221f',
-    'oap\'s',
-    'oap-packed',
-    'oapart',
-    'oar-inspiring',
-    'oar-like',
-    'oar-powered',
-    'oared',
     'oarless',
-    'oarlocks',
-    'oars.',
-    'oarspersons',
-    'oarswoman',
-    'oas-mediated',
-    'oas-supervised',
-    'oasa',
-    'oasal',
-    'oasthouse.',
-    'oasthouses',
-    'oat-flour',
-    'oat-topped',
-    'oatbran',
-    'oatcake',
-    'oates-like',
     'oatgrass',
-    'oath-helpers',
-    'oathbreakers',
-    'oathbreaking',
-    'oathing',
-    'oathmongering',
-    'oathworthy',
-    'oatmeal-covered',
-    'oatmeal-white',
-    'oatmealy',
-    'oau.',
-    'oaxters',
-    'oay',
-    'oaz',
-    'ob&eacute;ir',
-    'ob+1',
     'ob-ab-aa-eb1-eb2-ea',
-    'ob10',
-    'obad',
-    'obad.',
-    'obadina',
-    'obaid',
-    'obair*',
-    'obama',
-    'obami',
-    'oban/lismore',
-    'obandoned',
-    'obb',
-    'obbedire',
-    'obbia',
-    'obbligati',
-    'obbligatos',
     'obbs',
-    'obcenities',
-    'obdc',
-    'obdef',
-    'obdt.sert',
-    'obdulio',
-    'obebe',
-    'obecni',
-    'obect',
-    'obedi&rehy;ent',
-    'obedience-trained',
-    'obediences',
-    'obediency',
-    'obeidat',
-    'obeidi',
-    'obel',
     'obeliskshaped',
-    'obelkevich',
-    'obenault',
-    'oberaargau',
-    'oberbaum',
-    'oberdorfer',
-    'obere',
-    'oberei',
-    'oberergraben',
-    'oberf&ouml;hringerstrasse',
-    'oberg',
-    'obergr&uuml;ppenf&uuml;hrer',
-    'obergricht',
-    'obergruppen-fuehrer',
-    'oberharz',
-    'oberhauser',
     'oberhttfen',
-    'oberia',
-    'oberkarbon',
-    'oberkochen',
-    'oberkommand',
-    'oberkommando',
-    'oberl&auml;nder',
-    'oberlander',
-    'oberleforestry',
-    'oberleitner',
-    'oberleut\'nants',
-    'obermachtal',
-    'obermaschinist',
-    'obermeister',
-    'obermeyer',
-    'oberon/theseus',
     'obersee',
-    'oberstar/manager',
-    'oberstdorf',
-    'obertass',
-    'obertenghi',
-    'obertor',
-    'oberursal',
-    'oberwelt',
-    'obery',
-    'oberzell',
-    'obese-a-weight',
-    'obesterreichissche',
-    'obey-',
-    'obfuscators',
-    'obfw',
-    'obhayashi',
     'obidiah',
-    'obidos',
-    'obiit',
-    'obiliary',
-    'obilitas',
-    'obina',
-    'obiquitous',
-    'obituary:rev',
-    'obituaryws29',
-    'obituaryws33',
-    'obituaryws39',
-    'obiturary',
-    'obizzi',
-    'obj',
-    'obj&eacute;t_d\'art',
-    'objec',
     'object&rehy;a',
-    'object-',
-    'object-categories',
-    'object-cathexes',
-    'object-code',
-    'object-concepts',
-    'object-discourses',
-    'object-discoveries',
-    'object-enabled',
-    'object-enabling',
-    'object-identity',
-    'object-language',
-    'object-lesson',
-    'object-level',
-    'object-management',
-    'object-notion',
     'object-oriented.',
-    'object-passing',
-    'object-processing',
-    'object-recognizing',
-    'object-relationship',
-    'object-term',
-    'object-text',
-    'object-topic',
-    'object-topics',
-    'object-transcending',
-    'object-types',
-    'object-words',
-    'object/db',
-    'object/man',
-    'object/model',
-    'object/relational',
     'object/subject',
-    'object/woman',
-    'objectbuilder/c++',
-    'objected-oriented',
-    'objected.',
-    'objection-that',
-    'objectionableness',
-    'objections-general',
-    'objections.',
-    'objectism',
-    'objective\'',
-    'objective-eyepiece',
-    'objective-test',
-    'objective.this',
-    'objective/',
-    'objective/clear',
     'objective/structural',
-    'objective/subjective',
-    'objectively&mdash;the',
-    'objectively-arrived-at',
-    'objectives-based',
-    'objectives-related',
-    'objectives-setting',
-    'objectives.this',
-    'objectives/skills',
-    'objectivisation',
-    'objectivities',
-    'objectkit/c++',
-    'objectpal',
-    'objectuality',
-    'objectually',
-    'objectview',
     'objectviews',
-    'objectvision',
-    'objets/reliefs',
-    'objurgations',
-    'oblastniki',
-    'oblateness',
-    'oblationary',
-    'oblatz',
-    'oble',
-    'obler',
-    'obli',
-    'oblidged',
-    'obliga&rehy;tion',
-    'obligation&mdash;so',
-    'obligational-type',
-    'obligationes',
     'obligations.',
-    'obligationstrictly',
-    'obligatoriness-making',
-    'obligatory\'',
-    'obligatos',
-    'obligement',
-    'obliquely-striking',
-    'obliquum',
-    'obliterative',
-    'obliv',
-    'oblivion\'',
-    'oblivions',
-    'obliviousness',
-    'obloha',
-    'oblong-leaved',
-    'obman',
     'obmanilovich',
-    'obn',
-    'obod',
-    'oboe-led',
-    'oboe-playing',
-    'oboe-reed',
-    'oboeist',
-    'obok',
-    'obolenskii',
-    'obols',
-    'obong',
-    'oborknez',
-    'obous',
-    'obra',
-    'obradoiro',
-    'obrador',
     'obradovi&cacute',
-    'obradovic',
-    'obratitsia',
-    'obrazova',
-    'obreg&oacute;n',
-    'obreros',
-    'obrok',
-    'obruchev',
-    'obs-pepper',
-    'obs.',
-    'obs/1',
-    'obsceneness',
-    'obschestvo',
-    'obscurant',
-    'obscuras',
-    'obscure-looking',
     'obscurest',
-    'obscuresville',
-    'obscurisms',
-    'obscurity.',
-    'obscurusfio',
-    'obselete',
-    'obser',
-    'obser-vatory',
-    'obsert',
-    'observ',
-    'observa',
-    'observa&rehy;tions',
-    'observance.21',
-    'observancies',
-    'observantia',
-    'observat',
     'observat&oacute;rio',
-    'observation\'',
-    'observation-',
-    'observation-posts',
-    'observationality',
-    'observationer',
-    'observations_in_respect_,',
-    'observations_in_respect_of',
-    'observatoire',
-    'observatorium',
-    'observaveris',
-    'observe\'',
-    'observe-only',
-    'observe-the',
-    'observe/control',
-    'observed-to',
     'observed.most',
-    'observeddistribution',
-    'observer&lt',
-    'observer-as-participant',
-    'observer-effect',
-    'observer-guardian-style',
-    'observer.',
-    'observer/commentator',
-    'observer/engineer',
-    'observers/interviewers',
-    'obserwator',
-    'obses&rehy;sional',
-    'obsessional-rigid',
-    'obsessionality',
-    'obshchaya',
-    'obshchestvennoe',
     'obshchestvennyi',
-    'obsidian-carapaced',
-    'obsidians',
-    'obsolesce',
-    'obsolescing',
-    'obsoleta',
-    'obsolete.double',
-    'obsoleteness',
-    'obsoleting',
-    'obsolute',
-    'obssessive',
-    'obstacle-filled',
-    'obstacle-race',
-    'obstacle.',
-    'obstacle/assault',
-    'obstantial',
     'obstensively',
-    'obstetrically',
-    'obstinate/obstructions',
-    'obstreperously',
-    'obstructers',
-    'obstructin\'',
-    'obstruction-of-justice',
-    'obstruction.',
-    'obstructionists',
-    'obstructive.',
-    'obstructiveairways',
-    'obstructively',
-    'obstructor',
-    'obtain\'',
-    'obtainedthough',
-    'obtainin\'',
     'obtaining/increasing',
-    'obtainings',
-    'obtainment',
-    'obteyning',
-    'obtimates',
-    'obtrusiveness',
-    'obtunema',
-    'obturator',
-    'obtusa',
-    'obtuse-angled',
-    'obtusely',
-    'obukauskas',
-    'obukhov',
-    'obuzuni',
-    'obversely',
-    'obviosly',
     'obviosuly',
-    'obviou',
-    'obvioulsy',
-    'obvious.',
-    'obviously-apparent',
-    'obvously',
-    'obyns',
-    'obywatelski-akcja',
-    'oc&amp;c',
-    'oc&eacute;anienne',
-    'oc&eacute;aniens',
-    'oc&rehy;casional',
-    'oc-07',
-    'oc-12',
-    'oc-3',
-    'oc-48',
     'oc.',
-    'oc2',
-    'oca-cola',
-    'ocadu',
-    'ocampojustice',
-    'ocao',
-    'ocarinas',
-    'ocasek',
-    'ocassion',
-    'occa',
-    'occab&eacute',
-    'occam.',
-    'occas',
-    'occasion&mdash;over',
-    'occasion&rehy;the',
-    'occasional-breeding',
     'occasional/part.',
-    'occasionalism',
-    'occasionally-',
-    'occasionally-used',
-    'occasioneth',
-    'occasions-and',
-    'occassionally',
-    'occassions',
-    'occcasional',
-    'occhetto&mdash;see',
-    'occhionero',
-    'occi',
-    'occi-mizoki',
-    'occidentals',
-    'occidentation',
-    'occipitalis',
     'occipito-parietal',
-    'occipito-temporal',
-    'occipitofrontal',
-    'occitania',
-    'occitanus',
-    'occlestone',
-    'occluder',
-    'occluders',
-    'occu&rehy;pying',
-    'occulobe-enhanced',
-    'occulta',
-    'occultated',
-    'occultations',
-    'occultic',
-    'occulting',
-    'occupa',
     'occupacioun',
-    'occupancy/bed',
-    'occupation-based',
-    'occupation-initiated',
-    'occupation-related',
-    'occupation-specific',
-    'occupation.the',
-    'occupation/industry/sex/part-time',
-    'occupation/participation',
-    'occupational-pension',
-    'occupational-pensions',
-    'occupationally-based',
-    'occupationary',
-    'occupied-i',
-    'occupied-territories',
-    'occupier-trespasser',
     'occupier/occupant',
-    'occuptation',
-    'occuption',
-    'occupyed',
-    'occur&mdash;not',
-    'occur-see',
-    'occur_from',
-    'occure',
-    'occurence.',
-    'occures',
-    'occurred-but',
-    'occurred-or',
-    'occurred-these',
-    'occurred-which',
-    'occurred.',
-    'occurred.h',
     'occurrence/',
-    'occurrent',
-    'occurring/has',
-    'occurs-but',
-    'occurs_from',
-    'occysts',
-    'occzim',
-    'ocdna',
-    'oce-van',
-    'ocean-circulation',
-    'ocean-climate',
-    'ocean-covered',
-    'ocean-deep',
-    'ocean-depth',
-    'ocean-dwelling',
-    'ocean-front',
     'ocean-like',
-    'ocean-lurking',
-    'ocean-mining',
-    'ocean-striding',
-    'ocean-wide',
-    'ocean/atmosphere',
-    'oceana',
-    'oceanaria',
-    'oceanfront',
-    'oceani',
-    'oceanic-island-basalt',
-    'oceanic-ridge-basalt',
-    'oceanic.',
-    'oceanica',
-    'oceanics',
-    'oceanites',
     'oceanmaster',
-    'oceano',
-    'oceanologique',
-    'oceanology',
-    'oceanos',
-    'oceanroutes',
-    'oceans-and-mountains',
-    'oceanworld',
-    'ocelicauda',
-    'ocelotl',
-    'ocelus',
-    'ocenebra',
-    'oceonics',
-    'ocha',
-    'ochamchire',
-    'ochdamh',
     'ochetto',
-    'ochiela',
-    'ochim',
-    'ochman',
-    'ochota',
-    'ochra',
-    'ochracea',
-    'ochre&rehy;coloured',
-    'ochre-brown',
-    'ochre-liveried',
-    'ochre-mining',
-    'ochre-red',
-    'ochre-tinted',
-    'ochre-tipped',
-    'ochre-washed',
-    'ochreish',
     'ochrocarpa',
-    'ochroma',
-    'ochromonas',
-    'ochropus',
-    'ochrous',
-    'ochsenkun',
-    'ochterveldt',
-    'ochumba',
-    'ociam',
-    'ocic-al',
-    'ocicat',
-    'ockay',
-    'ockeghem',
-    'ocken',
-    'ockhamite',
-    'ockold',
     'oclo',
-    'ocmp-abi',
-    'oco',
-    'ococingo',
-    'ocora',
-    'ocotal',
-    'ocotepeque',
-    'ocsg',
-    'ocsian',
-    'oct&ndash;nov',
-    'oct-10',
-    'oct-3',
-    'oct-5',
-    'oct-6/scip/tst-1',
-    'oct-60',
-    'oct-91',
     'oct-factor',
-    'oct-nov',
-    'oct-protein',
-    'oct-protein(s)',
-    'oct-proteins',
-    'oct.1',
-    'oct.20',
-    'oct.30.',
-    'oct/dec',
-    'oct24/nov22',
-    'oct2a',
-    'octadecyl',
-    'octadecysilane',
-    'octaeteris',
-    'octahedra',
-    'octahedrons',
     'octals',
-    'octamer-containing',
-    'octamer-dependent',
-    'octamer-dna',
-    'octamer-taatga-',
-    'octamer-taatganat',
-    'octamer-taatgatat',
-    'octamer/nf1',
-    'octane-soaked',
-    'octanoate',
-    'octant',
-    'octarsier',
-    'octastyle',
-    'octave-and-a-half',
-    'octave-blend',
-    'octave-combination',
     'octave-hopping',
-    'octave-raising',
-    'octavi',
-    'octavionics',
-    'octavo-size',
-    'octavo-sized',
-    'octels',
-    'octette',
-    'octo',
-    'octo-',
-    'octob',
-    'october&mdash;november',
-    'october&ndash;1',
-    'october&ndash;18',
-    'october&ndash;26',
-    'october&ndash;28',
     'october&ndash;4',
-    'october&ndash;december',
-    'october&ndash;july',
-    'october-11',
-    'october-12',
-    'october-13',
-    'october-2',
-    'october-23',
-    'october-27',
-    'october-28',
-    'october-29',
-    'october-3',
-    'october-4',
-    'october-7',
-    'october-8',
-    'october-february',
     'october-like',
-    'october-march',
-    'october-scheduled',
-    'october.',
-    'october/december',
-    'october/early',
-    'octobrachiatus',
-    'octocinclus',
-    'octocoralia',
-    'octogen',
-    'octogesima',
-    'octomeles',
-    'octomitus',
-    'octomore',
-    'octon-cum-octon',
-    'octonions',
     'octopetala',
-    'octopoid',
-    'octopole',
-    'octopus-style',
-    'octovullin',
-    'octreotide/24',
-    'octu',
-    'octyl',
-    'oculi',
-    'oculo-antennal',
-    'oculo-genital',
-    'oculocerebrorenal',
-    'oculto',
-    'ocumar&eacute',
-    'ocupied',
-    'ocupyd',
     'ocurring',
-    'ocurrs',
-    'ocxides',
-    'ocymifolia',
-    'ocypeta',
-    'od&aacute;insakr',
-    'od&eacute;n',
-    'od&eacute;on',
-    'od\'d-on-heroin',
-    'od\'ing',
-    'od\'rous',
-    'od-2',
-    'od-ing',
-    'od.',
-    'od1.0',
-    'oda-related',
     'odacir',
-    'odaline',
-    'odalisques',
-    'odam',
-    'odansentron',
-    'odarich',
-    'odas',
-    'odawara',
-    'odazzi',
-    'odbc-compliant',
-    'odberht',
-    'odberht/eadberht',
-    'odboy',
-    'odbs',
-    'odcie',
-    'odd-',
     'odd-bribe',
-    'odd-coloured',
-    'odd-even',
-    'odd-eyed',
-    'odd-jeaned',
-    'odd-jobbers',
-    'odd-jobs',
-    'odd-legged',
-    'odd-length',
-    'odd-like',
-    'odd-man-out',
-    'odd-or-even',
-    'odd-order',
-    'odd-player',
-    'odd-sized',
-    'odd-smelling',
     'odd-speaker',
-    'odd-toed',
-    'odd-toes',
-    'odd/even',
-    'odda',
-    'oddas',
-    'oddds',
-    'oddest-shaped',
-    'oddfacts',
-    'oddie/roman',
-    'oddies',
-    'oddish',
-    'oddity\'/',
-    'oddity-value',
-    'oddjobbing',
-    'oddjobs',
     'oddly-curved',
-    'oddly-cut',
-    'oddly-titled',
-    'oddment',
-    'oddny',
-    'oddrunn',
-    'odds&mdash',
-    'odds-against',
-    'odds-and-ends',
-    'odds-and-sods',
-    'odds-maker',
-    'oddson',
-    'oddvar',
-    'oddysseys',
-    'odeca',
-    'odedra',
     'odell-foster',
-    'odels',
-    'odenbach',
-    'odendaal',
-    'odens',
-    'odenwald',
-    'odeon-fronted',
-    'odeon-like',
-    'odermatt-cazeau',
-    'odete',
-    'odeum',
-    'odeurs',
-    'odey/banned',
-    'odf.',
-    'odge',
-    'odgers',
     'odia',
-    'odic',
-    'odie',
-    'odies',
-    'odizor',
-    'odkolek',
-    'odlum',
-    'odly',
-    'odm',
-    'odno',
-    'odnowa',
-    'odoardo',
-    'ododo',
-    'odoline',
-    'odontella',
-    'odontites',
     'odontoceta',
-    'odontoceti',
-    'odontochirurgical',
-    'odontopleurid',
-    'odor',
-    'odorant-induced',
-    'odoratissimum',
-    'odoric',
-    'odorizer',
-    'odorless',
-    'odors',
-    'odour-absorbent',
-    'odour-bearing',
-    'odourful',
-    'odreman',
-    'odrodek',
     'odrodzenie',
-    'ods2',
-    'odsbodykins',
-    'odstock',
-    'odt-mt',
-    'odyle',
-    'odyssean',
-    'odysseys',
-    'odyssies',
-    'odzak',
-    'oe27056455',
-    'oebel',
-    'oec',
-    'oecd.',
-    'oecd/',
-    'oecd/iea',
     'oechslein',
-    'oechslin',
-    'oecologie',
-    'oecumenici',
-    'oecus',
-    'oed/supplement',
-    'oedc',
-    'oedicnemus',
-    'oedipally',
-    'oedipus-complex',
-    'oedogonium',
-    'oef',
-    'oehlschlaeger',
-    'oehmiga',
-    'oei',
-    'oeil',
     'oekonomische',
-    'oelde',
-    'oeldrid',
-    'oele',
-    'oelf',
-    'oelfwine',
-    'oelic',
-    'oelkers',
-    'oelschig',
-    'oem\'ing',
-    'oem-specific',
-    'oem/isv',
-    'oem/rebadge',
-    'oeming',
-    'oena',
-    'oenas',
     'oenghus',
-    'oeningensis',
-    'oenological',
-    'oenologists',
-    'oenology',
-    'oenotheraceae',
-    'oeotea',
-    'oep',
-    'oeq7026379',
-    'oeq7029124',
-    'oerlikon-buhrle',
-    'oescinga',
-    'oesopagus',
-    'oesophageal-ph',
-    'oesophagel',
-    'oesophagela',
     'oesophagis',
-    'oesophagitis.',
-    'oesophago-gastric',
-    'oesophagocolic',
-    'oesophagosalivary',
-    'oesophagostomiasis',
-    'oesophagous',
-    'oesophagus.',
-    'oesophogoscopy',
-    'oesphageal-gastric',
-    'oesten',
-    'oesteochondritis',
-    'oestergaard',
-    'oestraderm',
-    'oestral',
-    'oestriol',
     'oestrogen-containing',
-    'oestrogen-dependent',
-    'oestrone',
-    'oet',
-    'oethelred',
-    'oetlinger',
-    'oettinger',
-    'oever',
-    'oexophagitis',
-    'oeynhausen',
-    'of&amp;et',
-    'of&dollar;9.6',
-    'of&formula',
-    'of&lsqb;f&rsqb',
-    'of&mdash;the',
-    'of&pound;1',
     'of&pound;125',
-    'of&pound;140,000',
-    'of&pound;250,000',
-    'of&pound;3',
-    'of&pound;3.2',
-    'of&pound;33.20',
-    'of&pound;400',
-    'of&pound;5,800',
-    'of&pound;9.75',
-    'of&rehy;view',
-    'of\'em',
-    'of\'obbligato\'',
-    'of\'spillovers',
-    'of\'surintendent',
-    'of\'war',
-    'of(2)',
     'of(3)',
-    'of(4)',
-    'of(40)',
-    'of(5)',
-    'of-&frac12',
-    'of-3.7bn',
-    'of-adjunct',
-    'of-agitation',
-    'of-antoine',
-    'of-aphrodite',
-    'of-c&eacute;zanne',
-    'of-city',
-    'of-date-stock',
-    'of-death',
-    'of-demand',
-    'of-dogs',
     'of-eight',
-    'of-exquisite',
-    'of-f-f-fff',
-    'of-formation',
-    'of-he',
-    'of-how',
-    'of-it',
-    'of-kosovo',
-    'of-of',
-    'of-oh',
-    'of-real',
-    'of-rosin',
-    'of-science',
-    'of-sound',
-    'of-street',
-    'of-surprisingly-reminiscence',
     'of-ten',
-    'of-tenderness',
-    'of-the-being-of-the-breeze',
-    'of-the-century',
-    'of-the-moment',
-    'of-the-wall',
-    'of-their',
-    'of-wait',
-    'of-way',
-    'of-well',
-    'of.65',
-    'of.far',
-    'of.having',
-    'of.his',
-    'of.it',
-    'of.length',
     'of.others',
-    'of.public',
-    'of.things',
-    'of/',
-    'of/&egr/',
-    'of/18th',
-    'of/american',
-    'of/ct',
-    'of/despise',
-    'of/earning',
-    'of/flt',
-    'of/former',
-    'of/glasgow',
-    'of/health',
-    'of/mixing',
-    'of/murdering',
     'of/p/',
-    'of/royal',
-    'of/rural',
-    'of/temporary',
-    'of/the',
-    'of/through/under/over',
-    'of/under-16',
-    'of0&ndash;8',
-    'of10',
-    'of175,000',
-    'of1993',
-    'of1994',
-    'of325,000',
-    'of44&times;10',
-    'of5.6',
-    'of6-mp',
     'of60&ndash;100',
-    'of:manufacture',
-    'of_,_that\'s_of_course',
-    'of_date',
-    'of_fact',
-    'of_up',
-    'of_whether',
-    'ofarim',
-    'ofas',
-    'ofbroth',
-    'ofbus',
-    'ofbyronic',
-    'ofchina',
-    'ofcourse',
-    'ofd',
-    'ofdietary',
     'ofdismantling',
-    'ofe500s',
-    'ofellius',
-    'ofered',
-    'off&ins',
-    'off&mdash',
-    'off&rehy;broadway',
-    'off&rehy;course',
-    'off&rehy;driving',
-    'off&rehy;moments',
-    'off&rehy;shore',
-    'off&rehy;the-cuff',
-    'off&rehy;white',
-    'off-/farm',
-    'off-again',
-    'off-again-on-again',
     'off-and-on',
-    'off-bail',
-    'off-beats',
-    'off-bike',
-    'off-black',
-    'off-bounds',
-    'off-break',
-    'off-breaker',
-    'off-by-heart',
-    'off-carved',
-    'off-chock',
-    'off-comed',
-    'off-comed-un',
-    'off-comed-uns',
-    'off-cream',
-    'off-cutter',
     'off-cutters',
-    'off-days',
-    'off-diary',
-    'off-drove',
-    'off-dry',
-    'off-earth',
-    'off-floor',
-    'off-frame',
-    'off-games',
-    'off-glided',
-    'off-his-food',
-    'off-host',
-    'off-idle',
-    'off-licencee',
-    'off-licences.',
-    'off-license',
     'off-line-reader',
-    'off-lines',
-    'off-lying',
-    'off-moment',
-    'off-mood',
-    'off-motorway',
-    'off-night',
-    'off-not',
-    'off-patent',
-    'off-phasings',
-    'off-print',
-    'off-protocol',
-    'off-quoted',
-    'off-resonance',
-    'off-river',
-    'off-road-holding',
     'off-roll',
-    'off-scale',
-    'off-scouring',
-    'off-scourings',
-    'off-seasons',
-    'off-sets',
-    'off-shift',
-    'off-shoulder',
-    'off-spec',
-    'off-specification',
-    'off-straight',
-    'off-structure',
-    'off-territory',
-    'off-the&rehy;cuff',
-    'off-the&rehy;pet',
-    'off-the&rehy;rails',
     'off-the-air',
-    'off-the-boat',
-    'off-the-equilibrium-path',
-    'off-the-face',
-    'off-the-farm',
-    'off-the-hook',
-    'off-the-line',
-    'off-the-lip',
-    'off-the-payroll',
-    'off-the-puck',
-    'off-the-rack',
-    'off-the-roll',
-    'off-the-staff',
-    'off-the-table',
-    'off-the-wrist',
-    'off-the.job',
     'off-there',
-    'off-tune',
-    'off-well',
-    'off-what',
-    'off-wirral',
-    'off.',
-    'off.i',
-    'off/where',
-    'off_,_off_guard',
-    'off_,_off_of',
-    'off_any',
-    'off_even',
-    'off_in_er',
-    'off_up',
-    'offace',
-    'offal-burning',
     'offal-flies',
-    'offals',
-    'offbalance',
-    'offchurch',
-    'offcivers',
-    'offcome',
-    'offcourse',
-    'offcutters',
-    'offczors',
-    'offduty',
-    'offeciers-van',
-    'offenbarungspositivismus',
-    'offence\'',
-    'offence-related',
-    'offence-representation',
-    'offence-retribution',
     'offence-specific',
-    'offence-vengeance',
-    'offence.since',
-    'offenced',
-    'offences.joyce',
-    'offencmes',
-    'offender-profiling',
-    'offender/offence',
-    'offenders.',
-    'offenhouser',
-    'offensives-cgto',
-    'offer\'',
-    'offer-bid',
-    'offer-documents',
-    'offer-to-bid',
-    'offer/chase',
     'offer/competition',
-    'offer/conal',
-    'offer/concessions',
-    'offer/counter',
-    'offerees',
-    'offeror.',
-    'offerred',
-    'offerring',
-    'offers.',
-    'offers/takers',
-    'offert',
-    'offet',
-    'offficers',
-    'offficial',
-    'offgas',
-    'offham',
     'offhandness',
-    'office&mdash;a',
-    'office&mdash;form',
-    'office&rehy;directors',
-    'office\'',
-    'office-',
-    'office-automation',
-    'office-backed',
-    'office-blocks',
-    'office-bound',
-    'office-boy',
-    'office-cum',
-    'office-cum-shop',
-    'office-cum-spare',
-    'office-from-office',
-    'office-holder.',
     'office-houses',
-    'office-led',
-    'office-like',
-    'office-manager',
-    'office-political',
-    'office-speak',
-    'office-staff',
-    'office-studios',
-    'office-supply',
-    'office-trained',
-    'office-vacancy',
-    'office-wallah',
-    'office-worker',
-    'office.i',
-    'office.trade',
-    'office/',
     'office/army',
-    'office/bed',
-    'office/commercial',
-    'office/eagle',
-    'office/position',
-    'office/refreshment',
-    'office/secretarial',
-    'office/teacher',
-    'office/utility',
-    'office_as_well',
-    'officeful',
-    'officegate',
-    'officein',
-    'officeland',
-    'officepower-on-sco',
-    'officer&ndash;councillor',
     'officer\'',
-    'officer-and-gentlemanly',
-    'officer-council',
-    'officer-designate',
-    'officer-led',
-    'officer-member',
-    'officer-of-the-watch',
-    'officer-to-be',
-    'officer-training',
-    'officer/',
-    'officer/administrator',
-    'officer/agricultural',
-    'officer/anthropologist',
-    'officer/gloucestershire',
-    'officer/manager',
-    'officer/oxfordshire',
     'officer/oxon',
-    'officer/receptionist',
-    'officer/trading',
-    'officer/warden',
-    'officering',
-    'officers&mdash;provoked',
-    'officers-in-charge',
-    'officers-of-the-watch',
-    'officers/senior',
-    'offices-kadiliks',
-    'offices/',
-    'offices/studios',
-    'officevision',
-    'officewards',
-    'official&num',
-    'official-minded',
     'official-player',
-    'official-rate',
-    'official-steward',
-    'official/judicial',
-    'official/nonconformist',
-    'officialised',
-    'officialism',
-    'officialist',
-    'officializing',
-    'officially&rehy;recognised',
-    'officially-backed',
-    'officially-controlled',
-    'officially-generated',
-    'officially-induced',
-    'officially-inspired',
-    'officially-instigated',
     'officially-organised',
-    'officially-produced',
-    'officially-species',
-    'officially.',
-    'officials-only',
-    'officials.have',
-    'officianardos',
-    'officiariorum',
-    'officinatis',
-    'offin',
-    'offinicalis',
-    'offiside',
-    'offkey',
-    'offline&mdash;workspace',
-    'offlines',
-    'offour-hourly',
     'offprint',
-    'offramp',
-    'offrandes',
-    'offs.',
-    'offsale',
-    'offscourings',
-    'offset=o',
-    'offshoot-band',
-    'offshoot-cum-hobby',
-    'offshore-equivalent',
-    'offshore-industry',
-    'offspotulates',
-    'offtackle',
-    'offwat',
-    'offwhite',
-    'offwide',
     'offwind',
-    'offy',
-    'ofg',
-    'ofgloucestershire',
-    'ofhistory',
-    'ofhomeworkers',
-    'oficiales',
-    'oficialillos',
-    'oficiana',
-    'oficina',
-    'ofigonucleotides',
-    'ofisi',
-    'ofits',
-    'ofjob',
-    'ofjust',
-    'oflags',
     'oflicers',
-    'ofloxacin',
-    'ofluxury',
-    'ofm',
-    'ofmen',
-    'ofn',
-    'ofnuclear',
-    'ofodrugs',
-    'ofos',
-    'ofpra',
-    'ofrten',
-    'ofs',
-    'ofssmcntl',
-    'oft-approved',
-    'oft-declared',
-    'oft-discussed',
     'oft-disproven',
-    'oft-embattled',
-    'oft-exploded',
-    'oft-malevolent',
-    'oft-manifested',
-    'oft-perceived',
-    'oft-proclaimed',
-    'oft-promised',
-    'oft-reproduced',
-    'oft-resuscitated',
-    'oft-revised',
-    'oft-thwarted',
-    'oft-times',
-    'oft-warring',
-    'oft/',
-    'oft_times',
     'oftahis',
-    'ofte',
-    'often&mdash;still',
-    'often&mdash;that',
-    'often&rehy;heard',
-    'often&rehy;skewed',
-    'often-analysed',
-    'often-associated',
-    'often-baffling',
-    'often-changing',
-    'often-dared',
-    'often-dead',
-    'often-difficult',
-    'often-dismissed',
-    'often-employed',
-    'often-fatal',
     'often-forgotten',
-    'often-illiterate',
-    'often-iterated',
-    'often-meagre',
-    'often-more',
-    'often-neglected',
-    'often-noticed',
-    'often-ordinalized',
-    'often-pretentious',
-    'often-remarked',
-    'often-revised',
-    'often-uncomfortable',
-    'often-when',
-    'often.',
-    'oftenest',
-    'oftens',
     'oftfor',
-    'ofthem',
-    'ofthis',
-    'oftner',
-    'oftwenty-one',
-    'oftwo',
-    'ofverberg',
-    'ofw',
-    'ofwhich',
-    'ogadeni',
-    'ogallala',
-    'ogams',
-    'ogard',
-    'ogato',
-    'ogawayama',
-    'ogba',
     'ogborne',
-    'ogburu',
-    'ogdens',
-    'ogdoad',
-    'ogering',
-    'oggersheim',
-    'oggin',
-    'oggled',
-    'oghani',
-    'ogilesby',
-    'ogilvey',
-    'ogilveys',
-    'ogilvies',
-    'ogilvy-shepherd',
-    'ogilvy/aircraft',
-    'ogilvy/historic',
     'ogilvy/managing',
-    'ogino',
-    'ogival',
-    'ogiwara',
-    'oglada',
-    'ogler',
-    'oglers',
-    'ogles',
-    'ogletree',
-    'ogley/windmill',
-    'oglings',
-    'oglio',
-    'oglivy',
-    'ogn\'hor',
-    'ognell',
-    'ognisko',
     'ognjen',
-    'ognon',
-    'ogofau',
-    'ogon/common',
-    'ogooue',
-    'ogopogo',
-    'ogre-cop',
-    'ogre-figure',
-    'ogridge',
-    'ogrosky',
-    'ogsawara',
-    'oguibe',
-    'ogundimu',
-    'ogunlade',
-    'ogwuguwu',
-    'ogyebre',
     'oh&mdash',
-    'oh&mdash;yes',
-    'oh+ho',
-    'oh-58',
-    'oh-ah',
-    'oh-cook-cook-oo-oo',
-    'oh-dave-you-silly',
-    'oh-five',
-    'oh-for-god\'s-sake',
-    'oh-four',
-    'oh-h-h',
-    'oh-he-looks-a-bit-stiff',
-    'oh-ho-ho-ho',
-    'oh-it-will-never-happen-here',
-    'oh-la-la',
-    'oh-my-gawd',
     'oh-my-god',
-    'oh-no-they-ca',
-    'oh-nothing',
-    'oh-oh-oooh-oh',
-    'oh-shit-don\'t-tell-me',
-    'oh-so-artlessly',
-    'oh-so-careful',
-    'oh-so-cautious',
-    'oh-so-clever-oh-so-knowing-but-oh',
-    'oh-so-close',
-    'oh-so-desperate',
-    'oh-so-discreet',
-    'oh-so-dominant',
-    'oh-so-efficient',
-    'oh-so-egalitarian',
-    'oh-so-helpful',
     'oh-so-perfect',
-    'oh-so-reassuring',
-    'oh-so-secure',
-    'oh-so-true',
-    'oh-so-very-gently',
-    'oh-three',
-    'oh-yes-they-can',
-    'oh-yesss',
-    'oh.',
-    'oh.hcl',
-    'oh_._a_carrot_.',
-    'oh_no',
-    'ohakea',
-    'ohal',
-    'ohana',
-    'ohau',
     'ohaus',
-    'ohayu',
-    'ohb+0.9cohb',
-    'ohbayashi',
-    'ohen',
-    'ohene-kwapong',
-    'ohfuckinhell',
-    'ohhhhh',
-    'ohhhhhh',
-    'ohhm\'',
-    'ohin',
-    'ohio-valley',
-    'ohioans',
-    'ohiya',
-    'ohkawa',
-    'ohki',
     'ohmannized',
-    'ohmigod',
-    'ohmmeters',
-    'ohms.',
-    'ohmygodherheadwastouchingtheceiling',
-    'ohngren',
-    'ohno',
-    'ohoho',
-    'oholm',
-    'ohotnikov',
-    'ohrdruf',
-    'ohrfeigen',
-    'ohs',
-    'ohshimai',
-    'ohsumi',
-    'ohtsuka',
     'ohv',
-    'oi-vey',
-    'oia&lowbar;011207.tmp',
-    'oib-morb',
-    'oibs',
-    'oiche',
-    'oicks',
-    'oidd',
-    'oidhche',
-    'oids',
-    'oige',
-    'oignon',
-    'oih',
-    'oikeia',
-    'oikodome&omacr',
-    'oiky',
     'oikya',
-    'oil(s)',
-    'oil-absorbent',
-    'oil-and-parts',
-    'oil-backed',
-    'oil-bath',
-    'oil-bedaubed',
-    'oil-bird',
-    'oil-blackened',
-    'oil-blood',
-    'oil-boom',
-    'oil-burn',
-    'oil-burner',
-    'oil-cake',
-    'oil-choked',
-    'oil-cloth-covered',
     'oil-contaminated',
-    'oil-covered',
-    'oil-damped',
-    'oil-devourers',
-    'oil-dispersing',
-    'oil-drenched',
-    'oil-endowed',
-    'oil-extraction',
-    'oil-field',
-    'oil-fields',
-    'oil-film',
-    'oil-filmed',
-    'oil-filter',
-    'oil-for-arms',
-    'oil-for-weapons',
-    'oil-gathering',
     'oil-generating',
-    'oil-grained',
-    'oil-heaters',
-    'oil-hit',
-    'oil-immersed',
-    'oil-immersion',
-    'oil-in-water',
-    'oil-laden',
-    'oil-leaks',
-    'oil-less',
-    'oil-line',
-    'oil-linked',
-    'oil-loading',
-    'oil-milling',
-    'oil-on-canvas',
-    'oil-on-leather',
     'oil-overturned',
-    'oil-painted',
-    'oil-paints',
-    'oil-palms',
-    'oil-perfumed',
-    'oil-plus-parts',
-    'oil-poisoned',
-    'oil-pollution',
-    'oil-poor',
-    'oil-presser',
-    'oil-processing',
-    'oil-prone',
-    'oil-refrigerant',
-    'oil-repellent',
-    'oil-resource',
-    'oil-rigger',
     'oil-sector',
-    'oil-service',
-    'oil-shales',
-    'oil-sharing',
-    'oil-side',
-    'oil-slicks',
-    'oil-spilling',
-    'oil-spills',
-    'oil-spoon',
-    'oil-stain',
-    'oil-starved',
-    'oil-storage',
-    'oil-tanker',
-    'oil-tarnished',
-    'oil-temperature',
-    'oil-tempered',
     'oil-terminal',
-    'oil-these',
-    'oil-tig',
-    'oil-topped',
-    'oil-tossed',
-    'oil-transmission',
-    'oil-workers',
-    'oil.if',
-    'oil.l',
-    'oil.this',
-    'oil/gas-fired',
-    'oil/petrol',
-    'oil/urethane',
-    'oil145',
-    'oilatum',
-    'oilcakes',
     'oildevelopments',
-    'oildoms',
-    'oildrum',
-    'oile',
-    'oiled-up',
-    'oilette',
-    'oiliest',
-    'oilily',
-    'oill',
-    'oilness',
-    'oilpipe',
-    'oils/fats',
-    'oilseal',
-    'oilslide\'n\'light',
-    'oilstain',
-    'oilstained',
     'oilstains',
-    'oilstove',
-    'oilstoves',
-    'oilwat/gaswat',
-    'oilworkers',
-    'oily-haired',
-    'oily-handed',
-    'oily-pawed',
-    'oily-pelted',
-    'oily-rag',
-    'oily-smooth',
-    'oily/problem',
-    'oimyakon',
-    'oined',
-    'oinoe',
-    'oinomaos',
     'oinonen',
-    'oint',
-    'ointment-like',
-    'oip',
-    'oiratianus',
-    'oirish',
-    'oirishness',
-    'oishi',
-    'oistrakhs',
-    'oita',
-    'oiteagan',
-    'oithona',
-    'oithonia',
-    'oito',
-    'ojeda',
-    'ojeks',
     'ojha',
-    'ojibway',
-    'ojjeh',
-    'ojl',
-    'ojocs',
-    'ojos',
-    'ojuel',
-    'ojutiku',
-    'ojwanga',
-    'ok-ish',
-    'ok-let\'s-discuss-this-together',
-    'ok-tan-dra',
-    'okabe',
-    'okaidjah',
-    'okamoto',
-    'okamura',
     'okanogan',
-    'okapi-skin',
-    'okataina',
-    'okatu',
-    'okay.',
-    'okay.erm',
-    'okay.how',
-    'okay.i',
-    'okay.the',
-    'okazaki-ward',
-    'oke-cornes',
-    'okeh',
-    'oken',
-    'okeover',
-    'okes',
-    'okey-doke.',
     'okey-dokes.',
-    'okeydoke',
-    'okeyo',
-    'okh',
-    'okhudzhava',
-    'okies',
-    'okin',
-    'okinawan-te',
-    'okinawans',
-    'okinawante',
-    'okis',
-    'okk',
-    'okko',
-    'oklahi',
-    'okochi',
-    'okodi',
     'okoko',
-    'okon',
-    'okong\'o',
-    'okonkwo',
-    'okopyan',
-    'okosan',
-    'okoshechko',
-    'okoth',
-    'okp-the',
-    'okpe',
-    'okpomo',
-    'okras',
-    'oktoberfest',
-    'oktyabr',
-    'oku',
-    'okulick',
     'okum',
-    'okuno',
-    'okurut',
-    'okusanya',
-    'okw',
-    'okyere',
-    'ol&eacute;in\'',
-    'ol\'blackbreath',
-    'ol\'del',
-    'ol-q',
-    'ol1918',
-    'ol410',
-    'ol8',
-    'olaba',
-    'olaecbea',
-    'olagunju',
     'olajide',
-    'olam',
-    'olaman',
-    'olan',
-    'olandese',
-    'olar',
-    'olara',
-    'olari',
-    'olaria',
-    'olarte',
-    'olate',
-    'olatunji',
-    'olaudah',
-    'olavarria',
-    'olavi',
-    'olavinlinna',
     'olavio',
-    'olayan',
-    'olayide',
-    'olayiwola',
-    'olazaball',
-    'olbas',
-    'olbiil',
-    'olbil',
-    'olbreehts-tyteca',
-    'olbricht',
-    'old&mdash;it',
-    'old&rehy;flame',
-    'old&rehy;testament-inspired',
-    'old\'is',
-    'old(er)',
-    'old(ish)',
     'old-age-oriented',
-    'old-and-modern',
-    'old-avestan',
-    'old-boys',
-    'old-bufferism',
-    'old-clothes',
-    'old-days',
-    'old-english',
-    'old-etonian',
-    'old-fascination',
-    'old-fashioned-looking',
-    'old-fashionedness',
-    'old-fogey',
-    'old-folk',
-    'old-generation',
-    'old-headed',
     'old-key',
-    'old-left',
-    'old-line',
-    'old-look',
-    'old-maidish',
-    'old-maids',
-    'old-man',
-    'old-mannish',
-    'old-mastered',
-    'old-masterish',
-    'old-model',
-    'old-old',
-    'old-ones-are-the-best-ones',
-    'old-pais',
-    'old-peoples',
-    'old-red',
     'old-school-ness',
-    'old-shape',
-    'old-soldier',
-    'old-soldiers',
-    'old-sounding',
-    'old-stage',
-    'old-stager',
-    'old-town',
-    'old-winger',
-    'old-wives',
-    'old-womaning',
-    'old-worth',
-    'old/',
-    'old/is',
-    'old/savagely',
-    'old/young',
     'old/young/weak/unskilled',
-    'old_,_old_fashioned',
-    'oldbourne',
-    'oldbridge',
-    'oldbrook/milton',
-    'oldbugger',
-    'oldbuy',
-    'oldcambus',
-    'oldcoates',
-    'oldcommonwealth-pals',
-    'olde&rehy;english',
-    'oldenborgh',
-    'oldendorf',
-    'oldenzaal',
-    'older&rehy;style',
-    'older-brother',
     'older-established',
-    'older-fashioned',
-    'older-generation',
-    'older-girl',
-    'older-looking',
-    'older-working-age',
-    'older.',
-    'older/younger',
-    'oldest+',
-    'oldest-ever',
-    'oldford',
-    'oldgang',
-    'oldham.',
-    'oldham/liquidator',
-    'oldham5',
-    'oldhamite',
     'oldish-looking',
-    'oldmanuscript',
-    'oldmixon',
-    'oldrado',
-    'oldradus',
-    'oldrey/strathclyde',
-    'oldrid',
-    'oldridge',
-    'olds.an',
-    'oldsmobiles',
-    'oldspeak',
-    'oldsquaw',
-    'oldstyle-western',
-    'oldtimer',
-    'oldtimers',
-    'oldwomanish',
     'oldwood',
-    'oldy',
-    'ole-compliant',
-    'olea',
-    'oleaceae',
-    'oleander-and-silk-cotton-lined',
-    'oleander-lined',
-    'oleander-worship',
-    'oleanolic',
-    'olearia',
-    'olearias',
-    'olearus',
-    'oleas',
-    'olefin',
-    'olefins',
-    'oleifolia',
     'oleinik',
-    'olej=oil',
-    'olejniczak',
-    'olejovka',
-    'oleo-pneumatic',
-    'oleochemical',
-    'oleograph',
-    'oleopasto',
-    'oleoresins',
-    'oleosa',
-    'olepasto',
-    'oleracea',
-    'oleron',
-    'olesen',
-    'oleta',
-    'olev',
     'oley',
-    'oleya',
-    'oleyl',
-    'oleynik',
-    'olfactometer',
-    'olford',
-    'olgiati',
-    'olhebrews',
-    'olhovskiy',
-    'oliand',
-    'olic',
-    'olice',
-    'olid',
-    'oliefabriker',
-    'oligaemic',
-    'oligo(dt)-primed',
     'oligo-t',
-    'oligo=',
-    'oligochaete',
-    'oligodeoxyribonucleotide',
-    'oligodon',
-    'oligolabelling',
-    'oligolepis',
-    'oligomer-',
-    'oligomer-polymer',
-    'oligomerisation',
-    'oligonucleotide-directed',
-    'oligonucleotide-mediated',
-    'oligonucleotide-protein',
-    'oligopeptide',
-    'oligosaccharode',
-    'oligosacharides',
     'oligospermia',
-    'oligosynaptic',
-    'oligotrophication',
-    'oliguric',
-    'olimov',
-    'olimpa',
-    'olion',
-    'oliphant-fraser',
-    'oliphants',
-    'oliphaunt',
-    'olisa',
-    'oliua',
-    'oliv',
-    'olivarius',
-    'olive-backed',
-    'olive-bread',
     'olive-clad',
-    'olive-coloured',
-    'olive-complexioned',
-    'olive-dark',
-    'olive-grove',
-    'olive-growing',
-    'olive-grown',
-    'olive-mill',
-    'olive-oil',
-    'olive-oil-based',
-    'olive-scattered',
-    'olive-shaded',
-    'olive-shaped',
-    'olive-tanned',
-    'olive-tinged',
-    'olive-tinted',
     'olive-twig',
-    'olive/black',
-    'olive/yellow/grey',
-    'oliveiras',
-    'oliver-jones',
-    'oliver/bulmers',
-    'oliver/cpre',
-    'oliver/manager',
-    'oliver/milton',
-    'oliver:san',
-    'olivero/slatkin',
-    'olivett',
-    'olivia.and',
-    'olivias',
-    'olivier/leigh',
-    'olivier/swet',
     'oliviero',
-    'oliviers',
-    'olivy',
-    'olja',
-    'olk',
-    'ollard',
-    'ollcott',
-    'ollerenshaw',
-    'ollerhead',
-    'ollersett',
-    'ollett',
-    'ollevant',
-    'ollied',
-    'ollieing',
-    'ollieish',
-    'ollionles',
     'ollivierre',
-    'olloman',
-    'ollsson',
-    'ollywood',
-    'olma',
-    'olmeda',
-    'olmedo',
-    'olmex',
-    'olmo',
-    'olmpyic',
-    'olner',
-    'olney/buckinghamshire',
-    'olnyk',
-    'olofson',
-    'ologies',
-    'ologonucleotides',
     'oloman',
-    'olonkho',
-    'olos',
-    'olpal',
-    'olphert',
-    'olpin',
-    'olpin/meningitis',
-    'olschienen',
-    'olsens',
-    'olso',
-    'olssons',
-    'olszewzski',
-    'olsziewski',
-    'olszowski',
-    'olt',
-    'oltan',
     'olten/',
-    'oltmanns',
-    'olts',
-    'oluluyha',
-    'olum',
-    'olup',
-    'olusatrum',
-    'olvera',
-    'olvidados',
-    'olving',
-    'olwig',
-    'olwiz',
-    'olympe',
-    'olympia-stadion',
-    'olympiade',
-    'olympianism',
     'olympianly',
-    'olympiastadion',
-    'olympic-proportion',
-    'olympic-standard',
-    'olympic10,000m',
-    'olympitis',
-    'olympiysky',
-    'olympus-engined',
-    'olypmics',
-    'om&aacute&ccaron;kou',
-    'om&rehy;nicompetence',
-    'om/s',
-    'om28',
-    'omac',
-    'omachi',
-    'omagamon',
     'omagh&mdash;gortin',
-    'omagh-cookstown',
-    'omallys',
-    'omament',
-    'oman-biyik',
-    'oman/yemen',
-    'omanadze',
-    'omanga',
-    'omanidze',
-    'omanju',
-    'omanos',
-    'omarakana',
-    'omarama',
-    'omardin',
-    'ombler',
-    'ombo&ndash;edfu',
     'ombo&ndash;edfu&ndash;esna&ndash;luxor',
-    'ombos',
-    'ombr&eacute',
-    'ombu',
-    'ombudman',
-    'ombudsfan',
-    'ombudsman-it',
-    'ombudsman-like',
-    'ombudsmansays',
-    'ombudsperson',
-    'ombudswomen',
-    'omd',
-    'omdas',
-    'omeara',
-    'omegamon/400',
-    'omegaview/400',
     'omelianiuk',
-    'omell',
-    'omenn',
-    'omeprazole/amoxicillin',
-    'omgus',
-    'omidjoy',
-    'omikami',
-    'omina',
-    'ominor',
-    'ominum',
-    'omis&rehy;sion',
-    'omission/commission',
-    'omissions.',
-    'omited',
-    'omitted.',
-    'omitted/illustration',
     'omk-pokal',
-    'omlac',
-    'ommadawn',
-    'ommatidial',
-    'ommayad',
-    'ommer',
-    'omming',
-    'ommins',
-    'ommision',
-    'ommission',
-    'ommissions',
-    'ommmmmm',
-    'ommochrome',
-    'ommonwealth',
-    'ommunity',
-    'omnem',
     'omni-experienced',
-    'omni-pair',
-    'omni-players',
-    'omni-presence',
-    'omni-reader',
-    'omniback/link',
-    'omnibreck',
-    'omnicoach',
-    'omnicognizance',
-    'omnidimensional',
-    'omnifluor',
-    'omnipotens',
-    'omnipotently',
-    'omnipowerful',
-    'omnipresently',
-    'omnipure',
     'omnis/crystal',
-    'omnisport',
-    'omnisports',
-    'omnivorously',
-    'omnivory',
-    'omodeo',
-    'omojola',
-    'omojudi',
-    'omokoko',
-    'omonia**325',
-    'omoo',
-    'omov',
-    'omphale',
-    'ompholos',
-    'omplications',
-    'ompppase',
     'omrah',
-    'omrak',
-    'omrich',
-    'omt.',
-    'omu-3',
-    'omu3',
-    'omul',
-    'omura',
-    'omvaree',
-    'omvg',
-    'omya',
-    'omyniad',
-    'omytted',
-    'on&eacute;simo',
-    'on&lsqb;e&rsqb',
-    'on&mdash',
     'on&mdash;and',
-    'on&mdash;i',
-    'on&ndash;y',
-    'on&rehy;screen',
-    'on-again',
-    'on-and',
-    'on-and-a-half-stones',
-    'on-any',
-    'on-are',
-    'on-bar',
-    'on-beam',
-    'on-beat',
-    'on-broadway',
-    'on-card',
-    'on-carriage',
-    'on-column',
     'on-complete',
-    'on-counter',
-    'on-cue',
-    'on-deserves',
-    'on-driven',
-    'on-exchange.',
-    'on-full',
-    'on-green',
-    'on-growing',
-    'on-guard',
-    'on-guess',
-    'on-hands',
-    'on-heat',
-    'on-high',
-    'on-iapx-86',
-    'on-in',
     'on-ion.',
-    'on-ish',
-    'on-it',
-    'on-itis',
-    'on-lapping',
-    'on-lead',
-    'on-lent',
-    'on-linehelp',
-    'on-location',
-    'on-looker',
-    'on-negative',
-    'on-or-off',
-    'on-premises-only',
-    'on-profs',
-    'on-ramp',
-    'on-record',
     'on-roll',
-    'on-scene',
-    'on-screen/off-screen',
-    'on-ship',
-    'on-show',
-    'on-sights',
-    'on-site/on-the-job',
-    'on-sized',
-    'on-spot',
-    'on-squadron',
-    'on-style',
-    'on-substrate',
-    'on-susan',
-    'on-table',
-    'on-television',
-    'on-the&rehy;spot',
     'on-the-',
-    'on-the-block',
-    'on-the-box',
-    'on-the-case',
-    'on-the-edge',
-    'on-the-fence',
-    'on-the-hoof',
-    'on-the-hour',
-    'on-the-job/individual',
-    'on-the-job/off-the-job',
-    'on-the-run',
-    'on-the-tarmac',
-    'on-the-wall',
-    'on-them',
-    'on-this',
-    'on-to-one',
     'on-trent',
-    'on-vehicle',
-    'on-wye',
-    'on-you',
-    'on.7',
-    'on.all',
-    'on.defence',
-    'on.during',
-    'on.going',
-    'on.he',
-    'on.i',
-    'on.it',
-    'on.rails',
-    'on/domestic',
-    'on/half',
-    'on/not',
     'on/offline',
-    'on/requirements',
-    'on/she',
-    'on/stephanie',
-    'on/switch',
-    'on1',
-    'on18',
-    'on2',
-    'on25',
-    'on_,_i_will_pass_it_on_to',
-    'on_,_on_to',
-    'on_,_on_top_,_top_of',
-    'on_a',
-    'on_and',
-    'on_average',
-    'on_behalf_on_behalf_of',
     'on_each',
-    'on_erm_to',
-    'on_in',
-    'on_on_to',
-    'on_on_top_of',
-    'on_to_anything',
-    'onagraceae',
-    'onak',
-    'onam',
-    'onambwe',
-    'onania',
-    'onanist',
-    'onanists',
-    'onatas',
-    'onawa',
-    'onaway',
     'onboat',
-    'onbuildings',
-    'onc-a-month',
-    'onc/nfs',
-    'once&mdash;catch',
-    'once&mdash;one',
-    'once&rehy;and-for-all',
-    'once&rehy;derided',
-    'once&rehy;golden',
-    'once&rehy;unthinkable',
-    'once-',
-    'once-a&rehy;week',
-    'once-a-century',
-    'once-a-decade',
-    'once-a-fortnight',
-    'once-a-fortnight-whether-i-need-it-or-not',
     'once-aboard-the-lugger-and-the-maid-is-mine',
-    'once-abundant',
-    'once-again-teetering',
-    'once-and-forall',
-    'once-banned',
-    'once-beautiful',
-    'once-blind',
-    'once-blonde',
-    'once-breathing',
-    'once-bright',
-    'once-broken',
-    'once-brutal',
-    'once-bumbling',
-    'once-chic',
-    'once-classy',
-    'once-communist',
     'once-condemned',
-    'once-continuous',
-    'once-credible',
-    'once-crocus-yellow',
-    'once-crushing',
-    'once-daunting',
-    'once-derelict',
-    'once-discredited',
-    'once-dogmatic',
-    'once-dusty',
-    'once-eminent',
-    'once-faithful',
-    'once-fine',
-    'once-fitted',
-    'once-formidable',
-    'once-genteel',
     'once-glamorous',
-    'once-glossy',
-    'once-gravelled',
-    'once-green',
-    'once-guaranteed',
-    'once-hated',
-    'once-hooligan',
-    'once-idealistic',
-    'once-immaculate',
-    'once-important',
-    'once-in-a-year',
-    'once-in-my-lifetime',
-    'once-innovative',
-    'once-intended',
-    'once-lagged',
-    'once-macmillan',
     'once-monthly',
-    'once-neatly-assembled',
-    'once-neglected',
-    'once-numerous',
-    'once-on-a-lifetime',
-    'once-once',
-    'once-opposed',
-    'once-painted',
-    'once-passionate',
-    'once-ploughed',
-    'once-praised',
-    'once-precious',
-    'once-prime',
-    'once-prosperous',
-    'once-pure',
-    'once-quiet',
     'once-revealing',
-    'once-rich',
-    'once-rounded',
-    'once-ruined',
-    'once-scarlet',
-    'once-separate',
-    'once-smooth',
-    'once-snobby',
-    'once-sterling',
-    'once-struggling',
-    'once-stuffy',
-    'once-thick',
-    'once-traditional',
-    'once-trendy',
-    'once-troubled',
-    'once-unavailable',
     'once-unified',
-    'once-unthinkable',
-    'once-used',
-    'once-useful',
-    'once-vaunted',
-    'once-vexed',
-    'once-vibrant',
-    'once-wandering',
-    'once-wayward',
-    'once-were',
-    'once-yearly',
-    'once-young',
-    'once=calm',
-    'once_and_once_and_for_all',
-    'oncein-a-while',
-    'oncham',
     'onchocera',
-    'onchopeltus',
-    'onchophorus',
-    'oncomouse',
-    'oncopeltus',
-    'oncoproteins',
-    'oncost',
-    'oncostatin',
-    'oncques',
-    'ondegardo',
-    'onderwijs',
-    'ondilian',
-    'ondorodiau',
-    'ondras',
-    'ondriven',
-    'ondule',
     'one&lsqb',
-    'one&mdash;but',
-    'one&mdash;ibid',
-    'one&mdash;or',
-    'one&mdash;she',
-    'one&ndash;hour',
-    'one&ndash;man',
-    'one&ndash;off',
-    'one&ndash;six',
-    'one&ndash;three',
-    'one&rehy;and-a-half',
-    'one&rehy;armed',
-    'one&rehy;day-a-week',
-    'one&rehy;fifth',
-    'one&rehy;fourteenth',
-    'one&rehy;half',
     'one&rehy;inch',
-    'one&rehy;innings',
-    'one&rehy;man',
-    'one&rehy;quarter',
-    'one&rehy;sided',
-    'one&rehy;twoness',
-    'one&rehy;way',
-    'one\'ud',
-    'one-\'tawno',
-    'one-a-day',
-    'one-a-minute',
-    'one-a-side',
-    'one-acter',
-    'one-action',
-    'one-against-all',
-    'one-against-ones',
     'one-album',
-    'one-and',
-    'one-and-',
-    'one-and-a',
-    'one-and-a&rehy;half',
-    'one-and-a-half-',
-    'one-and-a-half-hours',
-    'one-and-a-half-legged',
-    'one-and-a-half-litre',
-    'one-and-a-half-mile',
-    'one-and-a-half-page',
-    'one-and-a-half-storey-high',
-    'one-and-a-third',
-    'one-and-eightpence',
-    'one-and-half',
-    'one-and-nines',
     'one-and-six',
-    'one-and-threepenny',
-    'one-answer',
-    'one-artist',
-    'one-atom',
-    'one-band-per-month',
-    'one-bed',
-    'one-beer',
-    'one-board',
-    'one-bomber',
-    'one-bone',
-    'one-bouncer',
-    'one-bouncer-per-over-per-batsman',
-    'one-branch',
-    'one-breasted',
-    'one-but',
     'one-calorie',
-    'one-carrier',
-    'one-case',
-    'one-category',
-    'one-cell',
-    'one-cent',
-    'one-centre',
-    'one-chamber',
-    'one-chance',
-    'one-channel',
-    'one-character',
-    'one-charlie',
-    'one-click',
-    'one-company',
-    'one-concept',
-    'one-conditional',
     'one-consonant',
-    'one-country',
-    'one-court',
-    'one-crop',
-    'one-day-game',
-    'one-degree',
-    'one-derful',
-    'one-dominant',
-    'one-donkey',
-    'one-door',
-    'one-dozen',
-    'one-drachma-out-of-every-17',
-    'one-driver',
-    'one-earner',
-    'one-eightieth',
-    'one-elbowed',
     'one-else',
-    'one-explicit',
-    'one-face',
-    'one-factor',
-    'one-fifith',
-    'one-fifty-',
-    'one-fight',
-    'one-figure',
-    'one-fingered',
-    'one-five-zero',
-    'one-foot',
-    'one-foot-deep',
-    'one-for-10',
-    'one-for-20',
-    'one-for-277',
-    'one-for-ten',
     'one-for-threes',
-    'one-form-one-meaning',
-    'one-forty-eight',
-    'one-forty-five',
-    'one-four',
-    'one-four-eight',
-    'one-four-five',
-    'one-four-four',
-    'one-four-nine',
-    'one-four-seven',
-    'one-four-six',
-    'one-four-three',
-    'one-four-two',
-    'one-four-zero',
-    'one-fourteenth',
-    'one-frame-at-a-time',
     'one-fuel-pump-per-cylinder',
-    'one-function-per-button',
-    'one-game-a-month',
-    'one-gear',
-    'one-gee',
-    'one-girl',
-    'one-god',
-    'one-good',
-    'one-guinea',
-    'one-gun',
-    'one-hand',
-    'one-handicapper',
-    'one-handled',
-    'one-hit-one-kill',
-    'one-hit-wonders',
-    'one-hour-a-week',
     'one-hundred-and-eighty-degree',
-    'one-hundred-and-fifty-year-old',
-    'one-hundred-and-thirty-rouble',
-    'one-hundred-and-twenty-hour',
-    'one-hundred-and-twenty-odd-mile',
-    'one-hundred-pound',
-    'one-hundred-seat',
-    'one-hundred-year-old',
-    'one-hundredths',
-    'one-idea',
-    'one-implicit',
-    'one-in-1&frac14',
-    'one-in-3',
-    'one-in-328',
-    'one-in-50,000',
-    'one-in-500',
     'one-in-64',
-    'one-in-a-thousand',
-    'one-in-seven',
-    'one-in-six',
-    'one-in-the-eye',
-    'one-inch-long',
-    'one-inch-to-one-mile',
-    'one-industry',
-    'one-iron',
-    'one-itis',
-    'one-jump',
-    'one-junction',
-    'one-keyed',
-    'one-kilometre-wide',
-    'one-last-pushers',
-    'one-leg',
     'one-leggers',
-    'one-letter',
-    'one-level',
-    'one-listed',
-    'one-litre',
-    'one-major',
-    'one-make',
-    'one-man-bands',
-    'one-man-power',
-    'one-manoeuvre',
-    'one-manys',
-    'one-market',
-    'one-member-one-vote',
-    'one-metre-bore',
-    'one-metre-wide',
-    'one-million',
     'one-million-dollar',
-    'one-million-franc',
-    'one-millionth',
-    'one-milliontonne',
-    'one-miss',
-    'one-more',
-    'one-movement',
-    'one-must-not',
-    'one-ness',
-    'one-net',
-    'one-night-standin\'',
-    'one-night-standing',
-    'one-nine-six-seven',
-    'one-o-three',
-    'one-o-two',
-    'one-object',
     'one-of-a-kind',
-    'one-off-data-gathering',
-    'one-offish',
-    'one-oh-four',
-    'one-oh-two-one',
-    'one-ounce',
-    'one-out',
-    'one-over-one',
-    'one-owner',
-    'one-pace',
-    'one-paragraph',
-    'one-parents',
-    'one-partyism',
-    'one-per-cent',
-    'one-per-person',
-    'one-per-room',
     'one-person-only',
-    'one-person-operated',
-    'one-pieces',
-    'one-pint',
-    'one-platformed',
-    'one-play',
-    'one-plus-two',
-    'one-pointedly',
-    'one-pound-notes',
-    'one-pounder',
-    'one-price',
-    'one-pulse.per.step',
-    'one-putt',
-    'one-question',
-    'one-reel',
-    'one-ring',
     'one-round-the-corner',
-    'one-route',
-    'one-same',
-    'one-season-sealed',
-    'one-self',
-    'one-serving-size',
-    'one-set',
-    'one-setter',
-    'one-sex',
-    'one-ship',
-    'one-shoe',
-    'one-shots',
-    'one-side',
-    'one-sign',
-    'one-sinewed',
-    'one-single',
     'one-site',
-    'one-size-fits-all',
-    'one-slab',
-    'one-son-apiece',
-    'one-song',
-    'one-speeder',
-    'one-square-kilometre',
-    'one-station',
-    'one-step-at-a-time',
-    'one-stitch',
-    'one-stop-shopping',
-    'one-storied',
-    'one-story',
-    'one-stride',
-    'one-studio',
-    'one-supplier',
     'one-surface',
-    'one-tank',
-    'one-tanker',
-    'one-tattwa',
-    'one-terminal',
-    'one-that',
-    'one-thirteenth',
-    'one-thousand-two-hundred',
-    'one-three-beta-one-one-triple-k',
-    'one-three-eight',
-    'one-three-nine',
-    'one-three-one',
-    'one-tiered',
-    'one-to',
-    'one-to-10',
-    'one-to-24',
     'one-to-a-page',
-    'one-to-eight',
-    'one-to-eight-processor',
-    'one-tonners',
-    'one-tooth-apiece',
-    'one-toothed',
-    'one-town-a-day',
-    'one-tree',
-    'one-trick',
-    'one-twitching',
-    'one-two-oh-four',
-    'one-two-one',
-    'one-two-three-four',
-    'one-type',
-    'one-under',
-    'one-under-par',
     'one-use',
-    'one-user',
-    'one-wall',
-    'one-wave',
-    'one-way-deal',
-    'one-wheel',
-    'one-wheeled',
-    'one-who-dearly-loved-her-people',
-    'one-winged',
-    'one-woman-against-the-world',
-    'one-word-answerable',
-    'one-year-contract',
-    'one-year-off',
-    'one-year-on',
-    'one.phase.on',
-    'one.side',
     'one.then',
-    'one.way',
-    'one/four',
-    'one/ninety',
-    'one/several',
-    'one/third',
-    'one/twenty',
-    'one/two/more',
-    'one_by',
-    'one_one_one_one_one_another',
-    'one_over',
-    'oneand',
-    'onece',
-    'onega',
-    'onehundredpercentus',
-    'oneiric',
     'oneirically',
-    'oneirocritica',
-    'onelie',
-    'onematch',
-    'onen',
-    'onenil',
-    'oneoak',
-    'oneof',
-    'oner-fiver',
-    'onersiphorous',
-    'ones-',
-    'ones-for',
-    'ones.0',
-    'ones.two',
-    'ones3',
-    'ones_in',
     'oneself\'',
-    'oneself-a',
-    'oneself-as-object',
-    'oneself-better',
-    'oneself/asking',
-    'onesimus',
-    'onesin',
-    'onestop',
-    'onethird',
-    'oneupmanship',
-    'onewa',
-    'oneway',
-    'oneywey',
-    'ongaro',
-    'onge-lukkige',
-    'ongeri',
     'ongjin',
-    'onglaze',
-    'ongle-bongle-boodle-boodle-boodle',
-    'ongle-bongle-boodle-giggle-giggle',
-    'onglethorpe',
-    'ongleys',
-    'ongoingly',
-    'ongoingness',
-    'ongstanding',
-    'ongwakebi',
-    'onh',
-    'oni=ongoing',
-    'onians',
-    'onich',
-    'onigohydromo',
-    'onigohydromonous',
     'onio',
-    'onion-dome',
-    'onion-holes',
-    'onion-rings',
-    'onion-tainted',
-    'onis',
-    'oniscus',
-    'onishi',
-    'onist',
-    'onites',
-    'onizuka',
-    'onkaparinga',
-    'onkelinx',
-    'onkerzele',
-    'onkey',
-    'onkom',
     'onlap/\'pinch-out\'',
-    'onlapped',
-    'onlapping',
-    'onlay',
-    'onle',
-    'onleeee',
-    'onley',
-    'onlf',
-    'onli',
-    'online/secure',
-    'onlt',
-    'onluy',
-    'only&mdash',
-    'only-',
-    'only-be',
-    'only-black',
     'only-childhood',
-    'only-groups',
-    'only-just',
-    'only-known',
-    'only-possible',
-    'only-the',
-    'only-their',
-    'only.h',
-    'only.to',
-    'only/the',
-    'only6',
-    'onlyan',
-    'onlydeepened',
-    'onlywey',
-    'onlywomen',
-    'onmod.qry',
     'onochromed',
-    'onodaga',
-    'onoe',
-    'onoesophageal',
-    'onomakritos',
-    'onomastic',
-    'onomatologists',
-    'onomatopeia',
-    'onon',
-    'onondaga',
-    'ononono',
-    'onopordum',
-    'onoufriou',
-    'onrdinary',
-    'onsen',
-    'onsequences',
     'onsetter',
-    'onsh',
-    'onsidering',
-    'onsistent',
-    'onstenk',
-    'onstimulation',
-    'onswitching',
-    'onta',
-    'ontarians',
-    'ontel',
-    'ontic',
-    'ontinues',
-    'onto/into',
-    'ontogeneis',
-    'ontogenically',
-    'ontologies',
     'ontologisation',
-    'ontologization',
-    'ontorio',
-    'ontransfer',
-    'onty',
-    'onu',
-    'onuven',
-    'onventing',
-    'onvolved',
-    'onw',
-    'onward&rehy;flight',
-    'onward-beating',
-    'onward-moving',
-    'onward-speeding',
-    'onward-surging',
-    'onwardness',
     'onwards-dragging',
-    'onwe',
-    'onwis',
-    'onwurah',
-    'onychiopsis',
-    'onychocrinus',
-    'onychophora',
-    'onycophorans',
-    'onye',
-    'onyembe',
-    'onymous',
-    'onyonka',
-    'onyrhythm',
-    'onywey',
-    'onyx-ectomy',
-    'onyxectomy',
     'onz',
-    'oo&ndash;niq',
-    'oo-hu',
-    'oo-joa',
-    'oo-la-la',
-    'oo-oo-m',
-    'oo-oo-oh',
-    'oo.oo',
-    'ooam',
-    'oob',
-    'oobs',
-    'oochi',
-    'oocysts',
-    'ood',
-    'ooda',
-    'oods',
     'ooearry',
-    'oogamyflip',
-    'oogerly',
-    'ooghy',
-    'oogie',
-    'oogies',
-    'oogifibs',
-    'ooh-aah',
-    'ooh-la-la',
-    'ooh-three',
-    'oohed',
-    'oohhing',
-    'oohooh',
-    'ooidal',
-    'oojamaflop',
-    'oojeinensis',
     'ookle',
-    'ooky',
-    'ool.',
-    'oolie',
-    'oolitic-barrier',
-    'oom-pah',
-    'oom-pah-pah',
-    'oomafama',
-    'oomalamaa',
-    'oomed',
-    'oommen',
-    'oomp-ooo-oo',
-    'oompah-ed',
-    'oompah-oompah',
-    'oompah-pah',
-    'oompahing',
     'ooo-aarr',
-    'oooaaah',
-    'oood',
-    'ooof',
-    'ooohed',
-    'ooohh',
-    'ooohohooo-o-o',
-    'ooomph',
-    'oooo',
-    'oooold',
-    'ooooo',
-    'oooooch',
-    'ooooogh',
-    'ooooohhhhh',
-    'oooooo-weooo',
-    'ooooooo',
     'oooooooh',
-    'oooooooo',
-    'ooooooooooooooooh',
-    'oooooooooooooooohh',
-    'oooooos',
-    'oooowwww.',
-    'ooosh',
-    'ooperation',
-    'oopla',
-    'ooppt',
-    'oopsie-doopsie',
-    'oorain',
-    'oorsels',
-    'oost-1',
-    'oosterbeek',
-    'oostmalle',
     'oosttaverne',
-    'ootacamund',
-    'ootacumund',
-    'ootburg',
-    'oouchi',
-    'ooutright',
-    'ooutukumpu',
-    'oover',
-    'oow',
-    'oowt',
-    'oozer',
-    'oozey',
-    'oozingly',
-    'op&eacute;ra-',
-    'op&eacute;ras',
-    'op&eacute;rations',
     'op&lowbar;flag',
-    'op&mdash;it',
-    'op&rehy;portunity',
-    'op&rehy;pression',
-    'op-',
-    'op-24',
-    'op-amp',
-    'op-amps',
-    'op-code',
-    'op-ed',
-    'op-position',
-    'op-ra',
-    'op-sized',
-    'op-wolf',
-    'op-x',
-    'op-x/v',
     'op.17',
-    'op.23',
-    'op.30',
-    'op.cit',
-    'op/air',
-    'op1',
-    'op105',
-    'op12',
-    'op2',
-    'op84',
-    'op94',
-    'op_',
-    'opacified',
-    'opacifying',
-    'opacity\'',
-    'opah',
     'opal-free',
-    'opal-mining',
-    'opaldce',
-    'opale',
-    'opalesque',
-    'opalka',
-    'opanal',
-    'opango',
-    'opava',
-    'opax',
-    'opco',
-    'opcode',
-    'opcs-defined',
-    'opcs/hmso',
-    'opcs4',
-    'ope\'',
     'opearting',
-    'oped',
-    'opel/vauxhall',
-    'opeleika',
-    'opella',
-    'open&amp;d',
-    'open&mdash;air',
-    'open&ndash;minded',
-    'open&rehy',
-    'open&rehy;ended',
-    'open&rehy;market',
-    'open&rehy;mouthed',
-    'open&rehy;plan',
-    'open-',
-    'open-age',
-    'open-aisle',
     'open-architecture',
-    'open-areas',
-    'open-armed',
-    'open-artery',
-    'open-balcony',
-    'open-bill',
-    'open-bored',
-    'open-caste',
-    'open-casting',
-    'open-centre',
-    'open-ceremonial',
-    'open-chest',
-    'open-chested',
-    'open-class',
-    'open-decision',
-    'open-endedly',
     'open-entry',
-    'open-ers',
-    'open-events',
-    'open-fisted',
-    'open-flanked',
-    'open-flued',
-    'open-form',
-    'open-freeze',
-    'open-government',
-    'open-grained',
-    'open-hand',
-    'open-is',
-    'open-jointed',
-    'open-leaf',
-    'open-leg',
-    'open-marriage',
     'open-meeting',
-    'open-mike',
-    'open-mindedly',
-    'open-mouth',
-    'open-out',
-    'open-outcry',
-    'open-outlet',
-    'open-pan',
-    'open-play',
-    'open-razor',
-    'open-riser',
-    'open-sandwich',
-    'open-seat',
-    'open-shelf',
-    'open-shore',
-    'open-shut',
     'open-space',
-    'open-sprinkler',
-    'open-string',
-    'open-strip',
-    'open-throated',
-    'open-to-suggestions',
-    'open-to-the-sky',
-    'open-valley',
-    'open-were',
-    'open-windowed',
-    'open-winner',
-    'open-wound',
-    'open-year',
-    'open.canines',
-    'open.tests',
-    'open/gateway-snagate',
     'open/shut',
-    'open=plan',
-    'open_in_front',
-    'open_minded',
-    'openbacked',
-    'openbook',
-    'opencase/toolbus',
-    'openconnect',
-    'opendesktop',
-    'opendoor',
-    'opened-out',
-    'opened_up',
-    'openframemwork',
-    'openfronted',
-    'openg',
-    'opengl',
     'openheartedness',
-    'opening-bat',
-    'opening-credits',
-    'opening-night',
-    'opening-out',
-    'opening.turtle',
-    'opening/manning',
-    'opening/previewing',
-    'opening/sorting',
-    'openlimits',
-    'openlink',
-    'openly-admitted',
-    'openo',
-    'opens.',
-    'opensides',
-    'opensoftware',
     'openspool',
-    'openspool/link',
-    'openvms-based',
-    'openvue',
-    'openware/motif',
-    'oper-ish',
-    'oper.res',
-    'opera-bastille',
-    'opera-ish',
-    'opera-lover',
-    'opera-lovers',
-    'opera-nut',
-    'opera-pantomime',
-    'opera-singer',
-    'opera-singers',
-    'opera-star',
     'opera/concert',
-    'opera/ferro',
-    'opera/the',
-    'operagors',
-    'operai',
-    'operanda',
-    'operandi',
-    'operarios',
-    'operasi',
-    'operat',
-    'operatate',
-    'operate\'',
-    'operate-the',
-    'operate.6',
-    'operatic-style',
-    'operatics',
     'operating-system',
-    'operating-type',
-    'operation-and',
-    'operation-scarred',
-    'operation.',
-    'operation.locals',
-    'operation.of',
-    'operation.this',
-    'operation/activity',
-    'operation/maintenance',
-    'operation/performance',
-    'operational/non-managerial',
-    'operationalisation',
-    'operationalizable',
-    'operationalizing',
-    'operationally-independent',
     'operationed',
-    'operations*',
-    'operations-london',
-    'operations.under',
-    'operations/divisions',
-    'operations/management',
-    'operations/second',
-    'operations5',
-    'operative-sense',
-    'operatively',
-    'operatons',
-    'operator-bar',
-    'operator-fragment',
-    'operator-led',
-    'operator-tree',
-    'operator/air',
     'operator/restorers',
-    'operator/worker',
-    'operators/drivers',
-    'operatorships',
-    'operazione',
-    'operculums',
-    'operentsia',
-    'operis',
-    'opernball',
-    'operon(s)',
-    'operophtera',
-    'opersation',
-    'operstions',
-    'opertion',
-    'opery',
-    'opfelchammer',
     'opfer/eure',
-    'opg',
-    'ophacantha',
-    'opheltes',
-    'ophiacanthella',
-    'ophiacanthid',
-    'ophiactidae',
-    'ophiactids',
-    'ophicantha',
-    'ophicanthella',
-    'ophicanthidae',
-    'ophidian',
-    'ophioblenn',
-    'ophioblenna',
-    'ophiocopa',
-    'ophiocten.',
     'ophiodictys',
-    'ophiogema',
-    'ophiogona',
-    'ophioleuce',
-    'ophioleucinae.',
-    'ophiolycus',
-    'ophiomusium',
-    'ophiomytis',
-    'ophiomyxid',
-    'ophiomyxidae',
-    'ophiopholis',
-    'ophiopleura',
-    'ophioplinthaca-ophionytis',
-    'ophiostriatus',
-    'ophiothamnus-ophiurothamnus',
-    'ophiotominid',
     'ophioxhonseua',
-    'ophipristis',
-    'ophir/rowing',
-    'ophis',
-    'ophiura.',
-    'ophiurae',
-    'ophiurids',
-    'ophiurinids',
-    'ophiurithamnus',
-    'ophiuroglypha',
-    'ophomyces',
-    'ophotominae',
-    'ophraelin',
-    'ophthalamagist',
-    'ophthalmoscopist',
-    'ophthalmoscopy',
     'opiate-eater',
-    'opics',
-    'opin',
-    'opinel',
-    'opinion&mdash;for',
-    'opinion&mdash;hunting',
-    'opinion&rehy;he',
-    'opinion*',
-    'opinion-assisted',
-    'opinion-based',
-    'opinion-gathering',
-    'opinion-influencing',
-    'opinion-leaders',
-    'opinion-making',
-    'opinion-mongers',
-    'opinion-moving',
     'opinion-polls',
-    'opinion-sampling',
-    'opinion-sounding',
-    'opinion-surveys',
-    'opinion-swings',
-    'opinion/attitude',
-    'opinionformers',
-    'opinionize',
-    'opinions.',
-    'opinis',
-    'opinon',
-    'opinons',
-    'opisthognathous',
-    'opisthotonos',
-    'opit',
-    'opium-addict',
     'opium-based',
-    'opium-den',
-    'opium-dependent',
-    'opium-eater',
-    'opium-eating',
-    'opium-induced',
-    'opium-inspired',
-    'opium-like',
-    'opium-planting',
-    'opium-producing',
-    'opium-traders',
-    'opium.',
-    'oplatky',
-    'ople',
-    'oplontis',
-    'opned',
     'opo-one',
-    'opochniks',
-    'opoeis',
-    'opon',
-    'opoortuneity',
-    'opopanax',
-    'oportunitat',
-    'oportunity',
-    'oposers',
-    'oposi&ccedil;ao',
-    'opous',
-    'opp&eacute;de-le-vieux',
-    'opp.1-5',
-    'opped',
-    'oppede',
-    'oppenau',
     'oppenehiem',
-    'oppenheimer-barnes',
-    'oppenheimer-teller-super',
-    'oppenheimer-volkoff',
-    'oppenhoff',
-    'opper',
-    'opperate',
-    'opperes',
-    'oppida',
-    'oppies',
-    'oppilative',
-    'oppin',
-    'oppin\'',
-    'oppoisite',
-    'oppor',
-    'opporotunity',
     'opport',
-    'opportu',
-    'opportun&rehy;ists',
-    'opportunely-timed',
-    'opportuni',
-    'opportunis',
-    'opportunities/options',
-    'opportunity\'',
-    'opportunity-seeking',
-    'opportunity-thinking',
-    'opportunity-to-create',
-    'opportunityby',
-    'opportunityfor',
-    'oppos.',
-    'opposer',
-    'opposit.',
     'opposite*',
-    'oppositely-directed',
-    'oppositie',
-    'oppositifolius',
-    'opposition-2',
-    'opposition-baiting',
-    'opposition-induced',
-    'opposition-inspired',
-    'opposition-organized',
-    'opposition.',
-    'opposition.the',
-    'oppositional/',
-    'oppositional/adversarial',
-    'oppositionalism',
-    'oppositionally',
-    'oppositorum',
     'oppostion',
-    'oppponents',
-    'oppportunity',
-    'oppressed-minority',
-    'oppression.',
-    'opprobriously',
-    'opps',
-    'opresi&oacute;n',
-    'oprichniks',
-    'ops.pre',
-    'ops.s01',
-    'ops.s02',
-    'ops.s03',
-    'ops.s04',
-    'ops.s05',
-    'ops.s06',
     'ops.s07',
-    'opseth',
-    'opsimath',
-    'opsin',
-    'opsonic',
-    'opsonisation',
-    'opstaele',
-    'opt&rehy;out',
-    'opt/servo',
-    'opt7',
-    'opt_out',
-    'opta',
-    'optal-mechanical',
-    'optative',
-    'optatives',
-    'optek',
     'optere',
-    'opters',
-    'opters-out',
-    'optex',
-    'opthalmology',
-    'optibase',
-    'optic-glasses',
-    'optical-glass',
-    'optical-illusion',
-    'optical-microscope',
-    'optical-parts',
-    'optical-quality',
-    'optical-reconnaissance',
-    'optical-storage',
-    'optically-active',
-    'optick-glasses',
     'optico-olfactory',
-    'opticram',
-    'optika',
-    'optiks',
-    'optilux',
-    'optim',
-    'optimal-case',
-    'optimaster',
-    'optimates',
-    'optimem',
-    'optimific',
-    'optimisations',
-    'optimisic',
-    'optimisitc',
-    'optimisitic',
-    'optimism.',
     'optimism.balloonist',
-    'optimism/pessimism',
-    'optimism108',
-    'optimist.',
-    'optimist/pessimist',
-    'optimista',
-    'optimun',
-    'optina',
-    'opting-in',
-    'optins',
-    'option(s)',
-    'option-owners',
-    'option-writers',
-    'option.but',
-    'option111&mdash;pi.log',
-    'option113&mdash;pi.log',
     'option151&mdash;pi.log',
-    'option152&mdash;pi.log',
-    'option153&mdash;pi.log',
-    'option171&mdash;pi.log',
-    'option180&mdash;pi.log',
-    'option211&mdash;pi.log',
-    'option212&mdash;pi.log',
-    'option213&mdash;pi.log',
-    'option220&mdash;pi.log',
-    'option240&mdash;pi.log',
-    'option281&mdash;pi.log',
-    'option282&mdash;pi.log',
-    'option283&mdash;pi.log',
-    'optional/additional',
-    'optionistic',
-    'options/routes',
     'options/solutions',
-    'optiphot',
-    'optipure',
-    'optis',
-    'optisk',
-    'optivite',
-    'opto-electrical',
-    'optomax',
-    'optomotor',
-    'optonics',
-    'optophot',
-    'optout',
-    'optulit',
-    'opu\'u',
-    'opulence/corpulence',
-    'opulent-looking',
     'opuntia',
-    'opus-for-openness',
-    'opuscula',
-    'opusfs',
-    'oputu',
-    'opy',
-    'oq&ndash;h',
-    'oq.',
-    'oqb',
-    'oqp',
-    'or&euml;l',
-    'or&mdash;and',
-    'or&mdash;this',
-    'or&pound;37,500',
-    'or&thorn;ancum',
-    'or\'',
     'or\'94',
-    'or+the',
-    'or-',
-    'or-1989',
-    'or-by',
-    'or-else',
-    'or-er-like',
-    'or-other',
-    'or-to',
-    'or.not',
-    'or.so',
-    'or.the',
-    'or/acceptable',
-    'or/not',
-    'or120',
-    'or:the',
     'or_anything',
-    'or_away',
-    'or_by',
-    'or_in',
-    'ora&scaron;ac',
-    'orabase',
-    'orac',
-    'oraciones',
-    'oracle&gt',
-    'oracle-expert',
-    'oracle-interpretation',
-    'oracle-optimised',
-    'oracle-related',
-    'oracle-running',
-    'oracleaccount',
-    'oracleins',
     'oraculaire',
-    'oracularly',
-    'orad',
-    'oradour-sur-glane',
-    'oraflex',
-    'orageuse',
-    'oragna',
-    'orahovac',
-    'orakwue',
-    'oral-aggressive-anal-retentive-come-and-see-me-five-times-a-week-for-years-at-vast-expense-or-how-do-i-know-you\'re-really-committed',
-    'oral-epic',
-    'oral-facial-palatal',
-    'oral-only',
-    'oral-onlyism',
-    'oral-way-of-life',
-    'oraldene',
     'orale',
-    'orally-active',
-    'orally-administered',
-    'orally-educated',
-    'oram/boat',
-    'orams',
-    'orang-outang/',
-    'orang-utan.',
-    'orang-utang',
-    'orange&ndash;green',
-    'orange&rehy;coloured',
-    'orange(s)',
-    'orange-and-green',
-    'orange-and-lemon',
-    'orange-and-shocking-pink',
-    'orange-badged',
     'orange-berried',
-    'orange-black',
-    'orange-blessed',
-    'orange-boxes',
-    'orange-chestnut',
-    'orange-crate',
-    'orange-date',
-    'orange-flavoured',
-    'orange-furred',
-    'orange-gold',
-    'orange-grey',
-    'orange-grove',
-    'orange-growing',
-    'orange-haired',
-    'orange-hued',
-    'orange-liveried',
     'orange-lodge',
-    'orange-on-black',
-    'orange-painted',
-    'orange-pink',
-    'orange-scented',
-    'orange-sellers',
-    'orange-showered',
-    'orange-skinned',
-    'orange-stained',
-    'orange-stick',
-    'orange-streaked',
-    'orange-tinted',
-    'orange-tip',
-    'orange-white',
-    'orange-winged',
-    'orange/black',
     'orange/brown',
-    'orange/matamp',
-    'orangeady',
-    'orangeand',
-    'orangebox',
-    'oranged',
-    'orangeflower',
-    'orangejuice',
-    'orangeries',
-    'oranges-and-lemons',
-    'oranges-hooray',
-    'oranges.',
-    'orangetip',
-    'orangey-brown',
-    'orangey-pink',
-    'orangey-red',
     'orangina',
-    'orangist',
-    'orangists',
-    'orangy-red',
-    'orangy-yellow',
-    'oranienburgerstrasse',
-    'orant',
-    'orao',
-    'oraon',
-    'orap',
-    'oraque',
-    'orasid',
-    'orasje',
-    'orasure',
-    'orat',
-    'orates',
     'orating',
-    'oration.',
-    'oratoire',
-    'oratore',
-    'oratorial',
-    'oratorians',
-    'oratorically',
-    'oratory-style',
-    'oratouris',
-    'orauser.com',
-    'orb&aacute;n',
-    'orb-arresting',
-    'orb-like',
-    'orb-shaped',
-    'orbat',
-    'orbath',
     'orbathol',
-    'orbec',
-    'orbegozo',
-    'orbem',
-    'orbenin',
-    'orbfield',
-    'orbicom',
-    'orbifolds',
-    'orbignya',
-    'orbinson',
-    'orbiston',
-    'orbita',
-    'orbital-engined',
-    'orbitally-paced',
-    'orbitarium',
-    'orbitor',
     'orbitron',
-    'orbits.',
-    'orbits/min',
-    'orbivirus',
-    'orbro',
-    'orc-blade',
-    'orc-men',
-    'orcadia',
-    'orcale7',
-    'orcbane',
-    'orcdom',
-    'orceau',
-    'orcein',
-    'orch',
-    'orch&eacute;sographie',
-    'orchard-garden',
     'orchard/gloucestershire',
-    'orchard/station',
-    'orchardleigh',
-    'orchards.they',
-    'orchards_in',
-    'orchardstown',
-    'orchart',
-    'orcherd',
-    'orchesella',
-    'orchestra-first',
-    'orchestra-pit',
-    'orchestra/bernard',
-    'orchestra/film',
-    'orchestra/gardelli',
-    'orchestra/mackerras',
-    'orchestra/nelson',
     'orchestra/ross',
-    'orchestras/chamber',
-    'orchestrions',
-    'orchid-collectors',
-    'orchid-is',
-    'orchid-like',
-    'orchid-loving',
-    'orchidectomised',
-    'orchidectomy',
-    'orchidhouse',
-    'orchiectomy',
-    'orchill',
-    'orciano',
-    'orcinus',
-    'orcs/goblins',
-    'orcus',
     'orczy',
-    'ord-hume',
-    'ord.53',
-    'orda',
-    'orde-browne',
-    'ordenewitz',
-    'ordenours',
-    'ordensdores',
-    'order&mdash;a',
-    'order&mdash;no',
-    'order&mdash;telephoning',
-    'order-',
-    'order-.',
-    'order-are',
-    'order-based',
-    'order-brotherhood',
     'order-entry',
-    'order-form',
-    'order-in-council',
-    'order-keeper',
-    'order-line\'',
-    'order-made',
-    'order-makers',
-    'order-only',
-    'order-paper',
-    'order-picking',
-    'order-taking',
-    'order-violation',
-    'order-wardens',
-    'order.',
-    'order.i',
-    'order/',
     'order/contested',
-    'order/electronic',
-    'order/office',
-    'order/purchasing',
-    'order/sentence/finding',
-    'ordered-off',
-    'orderer',
-    'orderers',
-    'ordering-off',
-    'orderline',
-    'orderlye',
-    'orderofavg',
-    'orders-of-magnitude',
-    'orders.a',
-    'orders.between',
-    'orders/',
     'orders_in',
-    'ordeshook',
-    'ordeynd',
-    'ordie',
-    'ordinaciones',
-    'ordinaires',
-    'ordinall',
-    'ordinanceto',
-    'ordinarie',
-    'ordinary&rehy;looking',
-    'ordinary&rehy;quality',
-    'ordinary-seeming',
-    'ordinary-size',
-    'ordinary-sized',
-    'ordinating',
-    'ordination.',
     'ordinators',
-    'ordinavit',
-    'ordines',
-    'ordini',
-    'ordizia',
-    'ordnance.survey',
-    'ordnanceman',
-    'ordnances',
-    'ordora',
-    'ordos',
-    'ordovician-silurian',
-    'ordres',
-    'ordri',
-    'ordrop',
-    'ords',
-    'ordsall',
     'ordu',
-    'ordyn-nashchokin',
-    'ordynaunce',
-    'ore-body',
-    'ore-carrying',
-    'ore-dresser',
-    'ore-grade',
-    'ore-passes',
-    'ore-sorter',
-    'ore-treatment',
-    'ore/gangue',
-    'oreades',
-    'oreamnos',
-    'oreamuno',
-    'orebo',
-    'oredr',
     'oregan',
-    'oregon-base',
-    'oregon-r',
-    'oregon-washington',
-    'oregonians',
-    'oregons',
-    'oregonwheat',
-    'oreh',
-    'oreilles',
-    'orejinegro',
-    'orel',
-    'oreleans',
-    'orell',
-    'oremus',
-    'orenda',
-    'orenhancement',
     'oreopteris',
-    'orerry',
-    'oreships',
-    'oresteia',
-    'orf\'ly',
-    'orfanotrofio',
-    'orfedd',
-    'orfes',
-    'orfila',
-    'orfilat',
-    'orfilat-nizan',
-    'orfoleddus',
-    'orft',
-    'orften',
-    'org-chart',
-    'orgaaniser',
     'orgainiser',
-    'orgainisers',
-    'orgainsed',
-    'orgainser',
-    'orgainsers',
-    'orgamisms',
-    'organ\'',
-    'organ-blower',
-    'organ-builder',
-    'organ-donors',
-    'organ-driven',
-    'organ-ic',
-    'organ-ization',
-    'organ-men',
-    'organ-pipe',
-    'organ-pipes',
     'organ-player',
-    'organ-pleasures',
-    'organ-shutters',
-    'organ-stops',
-    'organ-toned',
-    'organ-transplant',
-    'organ-works',
-    'organ-writing',
-    'organ/thames',
-    'organaire',
-    'organdy',
-    'organells',
-    'organic-',
-    'organic-based',
-    'organic-fed',
-    'organic-looking',
     'organic-matter',
-    'organic-only',
-    'organic-poor',
-    'organic-stained',
-    'organic-walled',
-    'organica',
-    'organically-managed',
-    'organically-produced',
-    'organicism.',
-    'organick',
-    'organiers',
-    'organifarming',
-    'organigram',
-    'organis',
-    'organisable',
-    'organisacion',
     'organisasi',
-    'organisation&mdash;she',
-    'organisation-international',
-    'organisation-oriented',
-    'organisation-tree',
-    'organisation.hard',
-    'organisation/azerbaijani',
-    'organisation/lobby',
-    'organisations.8',
-    'organisations/churches',
-    'organise&ndash;l',
-    'organise-it-yourself',
-    'organised.it',
-    'organiser.',
-    'organiser/guide',
-    'organiser/notepad/time',
     'organisimos',
-    'organisin\'',
-    'organising-tutor',
-    'organism-crunching',
-    'organismal',
-    'organismy',
-    'organissed',
-    'organist-conductor',
-    'organistations',
-    'organix',
-    'organiz',
-    'organiza&rehy;tions',
-    'organizadora',
-    'organization&rehy;level',
-    'organization\'',
-    'organization-',
     'organization-based',
-    'organization-for-itself',
-    'organization-view',
-    'organization/lean-ness/intensifica&rehy;tion/efficiency/closures/redundancies/relocation',
-    'organization/open',
-    'organizational-loyalties',
-    'organizations&mdash;ceoe',
-    'organizations--this',
-    'organize/co-ordinate',
-    'organizer(s)',
-    'organizer/activist/motivator',
-    'organo-',
-    'organo-chlorines',
-    'organo-mercury',
-    'organo-nitrate',
-    'organo-phos',
     'organo-phospho',
-    'organo-phosphorus',
-    'organo-silica',
-    'organo-silicon',
-    'organo-sulphur',
-    'organochloride',
-    'organochlorines.',
-    'organocholorines',
-    'organoiron',
-    'organoleptic',
-    'organological',
-    'organology',
-    'organometallics',
-    'organosoluble',
-    'organosulfur',
-    'organs&mdash;was',
     'organs.',
-    'organsation',
-    'organsisation',
-    'organsstreitigkeiten',
-    'orgar',
-    'orgasamed',
-    'orgasmic-goal',
-    'orgasming',
-    'orgasmo',
-    'orgasmus',
-    'orgastic',
-    'orge',
-    'orgenetically',
-    'orgh',
-    'orgia',
-    'orgiast',
     'orgiastically',
-    'orgiasts',
-    'orginates',
-    'orginial',
-    'orgionated',
-    'orgnanisations',
-    'orgoglio',
-    'orgolini',
-    'orgreaves',
-    'orgues',
-    'orgulous',
-    'orgy.',
-    'orh',
-    'orhestra',
-    'orhoit',
-    'orholm',
     'orhon',
-    'oria',
-    'oriachovitza',
-    'oriahovitza',
-    'orial',
-    'oribasos',
-    'oribatid',
-    'orien',
-    'oriens',
-    'orienta',
-    'orientacion',
-    'oriental-art',
-    'oriental-cut',
-    'oriental-looking',
-    'oriental-megalomaniac',
-    'oriental-oriented',
     'oriental-patterned',
-    'oriental-seeming',
-    'oriental-type',
-    'oriental/islamic',
-    'orientalische',
-    'orientalised',
-    'orientation-a',
-    'orientationally',
-    'orienteer',
-    'orientis',
-    'orifice-stuffing',
-    'orig&rehy;inals',
-    'orig.',
-    'origanisation',
-    'origeniosity',
-    'origin&rehy;als',
     'origin-',
-    'origin-destination',
-    'origin/destination',
-    'origin/electronic',
-    'origin/mindscape',
-    'origin24',
-    'origina',
-    'original&mdash;it',
-    'original\'s',
-    'original-design',
-    'original-especially',
-    'original-looking',
-    'original.horse-drawn',
-    'original/innovative',
-    'originales',
-    'originali',
     'originalia',
-    'originality.',
-    'originality/invention',
-    'originall',
-    'originally-proposed',
-    'originat&rehy;ing',
-    'originated.',
-    'originator(s)',
-    'originator/recipient',
-    'origins-the',
-    'origionally',
-    'origionaly',
-    'origiyn',
-    'orign.cl',
-    'orignal',
-    'origninal',
     'orihuela',
-    'orijuela',
-    'orilla&ndash;niagara',
-    'orillac',
-    'orillia',
-    'orington',
-    'orinteering',
-    'orio',
-    'orione',
-    'orionesque',
-    'orionii',
-    'oris/esquire',
-    'oritt',
-    'orka',
-    'orkheisthai',
-    'orkin',
     'orkingford',
-    'orkish',
-    'orkney-bound',
-    'orl&eacute;anism',
-    'orl&eacute;ans&ndash;bordeaux',
-    'orl&eacute;ans&ndash;tours',
-    'orl&eacute;ans-bragan&ccedil;a',
-    'orl&eacute;ans-panthi&egrave;vre',
-    'orl&egrave;ans',
-    'orlaith',
-    'orlando/kissimmee',
-    'orlandos',
-    'orlansky',
-    'orleanist',
-    'orleans-',
-    'orleans-based',
     'orledge/sun',
-    'orliaunce',
-    'orlik',
-    'orllwyn',
-    'orlogge',
-    'orlov-vitebsk',
-    'orlowetsky',
-    'orlowski',
-    'ormachea',
-    'ormal',
-    'ormand',
-    'ormandroyd',
-    'ormandy/philadelphia',
-    'ormantayev',
-    'ormat',
-    'ormaza',
     'ormeay',
-    'ormed',
-    'ormena',
-    'ormena/coal',
-    'ormer',
-    'ormerod/managing',
-    'ormerods',
-    'ormesbsy',
-    'ormisher',
-    'ormiston-chant',
-    'ormoc',
-    'ormolu&ndash;mounted',
-    'ormolu-and-wedgwood',
-    'ormolu-cased',
-    'ormolu-inlaid',
-    'ormondes',
     'ormones',
-    'ormous',
-    'ormside',
-    'ormslee',
-    'ormston',
-    'ormulu',
-    'ormus/ormuzd',
-    'ormusa',
-    'ornally',
-    'ornamenta',
-    'ornamentality',
-    'ornamentations',
-    'ornance',
-    'ornans',
-    'ornate/lucid/vigorous/colloquial',
-    'ornatippinis',
     'orneau',
-    'ornelli',
-    'ornellus',
-    'orneryness',
-    'ornes',
-    'ornest',
-    'ornithine',
-    'ornithischosus',
-    'ornithogalum',
-    'ornithogenic',
-    'ornithologically-minded',
-    'ornithology.',
-    'ornithology/basf',
-    'ornithophilous',
-    'ornithophily',
-    'ornithoptera',
     'ornithorhynchus',
-    'ornois',
-    'ornot',
-    'ornsay',
-    'oro-genital',
-    'oroarctic',
-    'oroch',
-    'orodruin',
-    'orogen-related',
-    'orogenis',
-    'orogenital',
-    'orogeny/regression',
-    'orohai',
-    'orohemiarctic',
-    'orologio',
-    'oromaner',
     'oromia',
-    'oronooko',
-    'oronya',
-    'oroogu',
-    'oropharyngolarynx',
-    'oropos',
-    'oropou',
-    'oros',
-    'oros.',
-    'oroszlany',
-    'orotundity',
-    'oround',
-    'oroville',
-    'oroxylum',
-    'oroya',
-    'orp',
     'orpa',
-    'orpahns',
-    'orperation',
-    'orph&eacute;nica',
-    'orphan-like',
-    'orphan-maker',
-    'orphaneers',
-    'orpharion',
-    'orphas',
-    'orphean',
-    'orphee',
-    'orphelinat',
-    'orpherian',
-    'orphistes',
-    'orphius',
-    'orpiere',
     'orpin/driving',
-    'orpington-based',
-    'orpingtons',
-    'orpoagation',
-    'orr/mental',
-    'orr/strathclyde',
+)
+
+blocks_64 = (
+    '$*ssociative#*biological$#ook$-udget-holding#$cash%\'talytic$\'e-words%!y$&halent%"ev%$urch$(lassical%%eaved%(inically$+o-operation',
+    '%*habitation%!m&\'ittally&*municating&2p&lsqb;liance&rsqb\'&arable\'&lacent\')rehension\',uter-related%)nformiste&*sciousness\'(ervative\',titutionally&(testable\')radiction',
+    '("ol&)ventional%(valently$$rack$(utaneous$%yclic#(decaying%(naturing%*partmental&&ressed%.script-looking&(truction$&haburi$\'iabetic%(sposable',
+    '%\'vergent$&rinker&!p$&urable#.e&rehy;theless$&-atall%\'compact\'"re%*more-black%\'smoking&)pecialist&#uch%#too(&-agile)&bright',
+    '*)reditable)$easy)(generous*(lamorous)*impressive)$mild)$safe*%teady+-raightforward)%white$#_at$"ly$)mpiricist&"ty$$nity',
+    '$*quilibrium$%sense$!t%&hereal$\'ventful#&family%"st%#tal$&errous$)igurative%)rst-class$(lammable%%icker$)ortuitous$)ulfilment',
+    '&$ding#)genotoxic$&lacial$+overnmental$(raduates%$easy#)hazardous$&egemon%%inous%!m$-ierarchically$)omosexual$\'ydrogen#%ident&%t-p40',
+    '$,mplementable$.ndividualistic%\'jurious%%teger\'(llectual\'(rference(\'vention/#ist&%imate$%onics$!s#-judgementally\'&mental%$rism&!y',
+    '#)lactating%$nded&%guage$$egal(%istic%$thal$/ife-threatening%&nguist%%teral)"ry$$ogic("al#\'married%&terial$&onotic',
+    '$\'ebakken#+o-iodinated$(bedience$!c$#ise$&metres$)rnamental$*verlapping%"yn$%xinol)"-9##pas%$ying$&easant%)rformance',
+    '$-hotosynthetic%&ysical$&laying%"us\'"ed\'$sing$$olar&Olutingozoneplugginggreenseeminggreenhousesaving%(ssessors$(roducers&*fessionals\')it-making&(gressive&*liferating$*ublication',
+    '%(ndomised$&ealist%/constructionism%\'dundant%,normalizable%.presentational%\'sidence*$tial+!s&%onant$\'hythmic$\'igorous%$sing%\'valrous$&outine',
+    '#!s$+atisfaction%$vers$(cientist$(ectarian%*miological%&nse&gt)*mdash;they(!-))languages)%maker)%rhyme)$word(".d(!d',
+    '%%rious%$xual$*ignificant$\'mokers.$*pecialists$&tarter&#tic\'%utory%(ochastic&\'p-class\'$ping\'!s$)ublimated%%iting#&target',
+    '%\'chnical%&mplate%(rminated$&haburi$$oxic$*raditional&(nsfected$(urbulent#,uniformities,!y&"on&\'versity$$rban$$sers#)vanishing',
+    '$%iable%%ewers$\'olatile#$word&$king%$vens"$oble#(dle-like&!d&%heads$!s#,n&ndash;2.30+!3+#6pm$\'-5.30pm',
+    '$-pakdiinterior$!s##ooo&-ooooooooooooo#$rani$$banu$!d%$hoff%$over%1uyn&rehy;designed%3wijkerhout-camerino$!t%!.%#man$*wijkerhout',
+    '$%phere#&teboom$"ka""p/$#oet#%aline#!s#!t#!w",r&rehy;mandy)*wich-based#!\'$(-easters%-nor\'-westerly$$lock',
+    '#\'-easter$-pas-de-calais#&a-minc(!e$(drenalin$#lla$)midopyrin$#nda\'$kerr%!k%$side%#tea$#sia&"ng$$vjav',
+    '$&ington%#ton$&orough$&ulinka#%cliff(!e$&ontrol%"tt%"ve$$roft&!s#%d-pas(#-de$&angens&.stad-skarstedt',
+    '&*sque-marck$*bayrischer$(deutsche,!n$#ell%+nsk&ouml;ld\'-tadt-skarsted)!m%%rhaug&#ney%%stino*!s$$gren&#ove$#hal',
+    '%#off$*ic-looking&!a%!e&!n%%scher$(jyllands$\'landsfe%#und$%manni$%obert%!y$\'politik$#qua$/rhein-jestfalan',
+    '))westfalen$\'sewerke%$tern&)rom-style$#uin$-westdeutsches%#ijk#$eens$#lco$"ng#)folk-born(%class(\'related\'#ese\'#ish',
+    '$%rigge##gat&1e/gloucestershire$"es&$trel$#len$$reen$#yal#$heys#$ibic$"ca&!n$,ega-approved$"ko$#lsk',
+    '%!a$&sterat$!t%#aki%!e##jac%!n#!k$#ies$&opping##lan&#der)!s\'!s#\'m&aelig',
+    '$!-%-and-deviation%%based%%group$\'ac/rnaa%(l&lt;150\'-rehy;coloured&!\'&%-pace((recision\'\'sighted)"ze\'&to-dry*\'reverse&$.dot',
+    '\'#the&$/dry\'$oily&"=0&!a\'*ir-garrett&%ement\'!s&)isability(!m\'$ties("y\'&!l\'*y-dominant)$gets',
+    '*(igmented)&quoted)&reared)%stony&#ski&!y%)n-bashing\'(speaking&\'/farmer\'$head\'%stunt&%brook&#des\'\'y-style)$type',
+    '&%nicus&$sell%"rk%#sol%*tive/moral)$ness$#ead%!s$"ie&!r%#ger$3kontrol-leverfahren++leverfahren$!o%$usly',
+    '\'!s$#ura$#yle#"ns#$obyn$\'nhianum$!v##pac#&redine$)is/branch\'+sportsworld\'&thames&#tom$#ona%!y',
+    '$*e/medieval%!c%&lapsis$#kes$#man$$tadt&!r%#ock$"un$"ys#!t$%-east$&e/word%)americano%!c',
+    '&,ndash;euston,%south&/rehy;easterners+%south%(-african\'*mptonshire\'(nd-south\'\'tlantic&&before&(carolina\')ountryman&/east-south-west*"er,"ns,!s',
+    '\',or-president&&german&(humbrian&#lit&%north+*-eastwards+$west&-of-the-border&#sea\')outhkorea&"up&%wales\'.est/south-east%!.%!/',
+    '&%frank&/vice-chancellor%&:south&$west%%about&-llerton-based)#ton&0mp&rehy;tonshire(#tom*&n-born+!/+!9+$ians+!s,4hire-buckinghamshire',
+    ')#yon&!n\'(tonshire&#ven%&bourne&%ridge\'/ook/oxfordshire&$urgh%,cote/swindon%*east-bound*&facing)*/southwest)"er+"ns&"im',
+    '\'!m&$ndon&$rley\'(n-andean)$born)*hemisphere)\'ireland)#led)(sounding*$tyle)\'trained(#ish&&wethel&"ye%.field-coalgate',
+    '%$gang\'2te/gloucestershire%$ings(#ton&"sm%#lea&#ite&#oad%$mace\'!n&#ost%%owram%.rop-frye-style&"up%%shore',
+    '&$lope&$ound&$tead%%throp%,umberlanders.!s(#ian(2rian127-1328.913.4%$vale&$ille%*ward-bound*(pointing&*est-facing)!/&)ich-based',
+    '&#old$#olk%-n-by-twycross\'\'le-clay&\'/selsey$%ronic$\'umbrian##vak$\'egienne\'"um$%icase%"ns#)w.players$(ay-based\'&poland',
+    '&-ian-americans*\'maltese*&wooded%#ign\'!y$+ich-baiting))irmingham)#orn((coventry(\'trained\'&/nottm\'!0&!k$(ood-born#!y',
+    '"#s.1%"19%!2$"20%!7$"42#%citur#"e-%&artist%$bags\'"nd\'%shing&%leeds%#cap%%drops',
+    '%#gay&$uard%%heavy&&olding%*in-the-air&)rritating%#low%\'pickin\'\'&ercing\'!n&)owderings%$ring%&shaped&\'troking%(tickling',
+    '&(o-bumper%\'wheelie&(rinkling$$bags$$caps%#lip%#one(!s$(draggers$#ful$&guards$#job$-less/chinless$%nraum$$pick',
+    '&#ece$!r%!s$"s.$#tte$&wheels$)y-parkers%"ed#$hery#*ing-around#"ke#\'opoetic##sen$"in$!o',
+    '%+lgia-lovers*&soaked*$trip(#sts$"ei%)stosteron$#ics%!l%"tz$&ra/ibi&*damus-like&"mo&#tic%!e&$dame',
+    '&%lling&!s%(o/vostro&#rum&!s#%waith"-t&iacute;cias$4mdash;so&mdash;young$0rehy;so-classics#$(+1)#!*#"-a%.-lot-happening&(present.%-ll-that-stout',
+    '%1t-home-department$)beautiful&-ing-committed%$ooks$\'ceiling%$heap%)ommitting$*dissimilar%!o&$able$2especially-musical%(very-day%/xactly-stunning&#ist)#ing',
+    '%*ar-distant%$loor%\'or-sale%)ully-late$#god$+half-cheeky&"wk%#ess$"in&6-front-of-the-children&(frequent$$just$\'knowing+,-immediately$(lamented',
+    '&%oking$)masculine%*uch-bigger)$more)(reported$#not$$only%)utrageous$!p%2articularly-modest$&quite-*,accidentally*&blonde*)cleanness+(oncealed',
+    '*(finished*(grown-up*%human*$nice*(raeburns+\'edeemed*+so-innocent/&trepid-#top.*raditional*&velvet$.really-an-aunt&)membering$$shot%&moking',
+    '\')contained)$vert($razy\'\'dearest)$cent(#our("ry(*umb-broads\'\'elected(&minent(*xperienced\'$free\'&ginger(\'lorious(+ood-looking',
+    '\'&hidden(%umble\'*irrational\'$lazy($ight)$ttle\'\'mystery\'%nasty\'(ordinary\'&primed+$rosy)&odigal\'\'radical(%ecent\'&secret',
+    '(%imple(%light($mall()now-white(\'plendid($weet\'$very&%goods%&ubject&(rprising$-terribly-poor%#hat%$o-be),-relied-upon*\'trusted',
+    '&!o\'\'-bright((daunting)#eep)(ifficult()enquiring))xhaustive(+far-distant(&gentle($high(*marvellous(+responsible(%sound((terrible($well',
+    '&\'founded&%known%!s%/tterly-familiar$,very-careful**omplicated+$vert)$easy*\'xciting)-firmly-sealed)#old))political*(recisely)$rich)&secret',
+    '*\'tandard$$wall&!s%$hole(-ly-unexpected%+ithstanding%$omen&#uld$!y%"et\'&-class$!z##.38$*7&mdash;is$#fit',
+    '#!/$&desire%!o$$must$%ought#!9#"_a%%s_far$%brand$$vice#%abile%#le\'$!i$$lion%$ways',
+    '$!r%!i&!e&!s\'%ation\'!e&"us&#zed$"te%&ion(s)#$cher&0s-on-the-bedhead#(e&aacute%-rehy;anything*&worthy',
+    '%$cell&%hange+!s\'%ewing&*ombination\'&nflict%)doctoring\'$tted%$file&#orm)"at%%group%(inspired%\'keeping%&length',
+    '%$pads\'"ge&&laying%$rate&,elationships%1scribblers/pocket&\'equence&\'pinning&(tructure&)uccession&&ystems%#the\'"is%\'variety%&worthy',
+    '%\'conduct$)/delivery$#:if$)book-type(#/xe$$card$&making$\'osuchus$&papers$"rs$*s&rehy;and%$.the%!/&3charts/prescription&\'reading',
+    '$"th$*worthiness%&riters$!y$!z#%ghing#"h-$#ern&\'theless$\'in\'goat&"g-()certainly($gift(\'happens(\'nothing',
+    '($some(*to-be-said(&unless\'#.to\'\'/no-one\'\':police\'(_so_much\'+ness-as-art\')s.picture\'"th\'!y&!k$#yng#$ice-&./advertisement',
+    '&)able-bank*#_in&(d-pascoe&"s.%&ias-el$!f%&icatin*0on/certification$!n%"g.%!s$,ocypridopsis%"n.$#zia#&notnot',
+    '$*pocorystes$-rious.teacher&&zation%!s##pmd$&rovide#"ra%%njsko$4e&rehy;dame-de-paris%0-dame-des-fleurs$%opsis#\'t-boyer$*age/author($jane$$idge',
+    '%&ng-ham\'.ham-darlington,$erby+*marylebone*0/derby/leicester*"18*"34*#sis(#ill\'#ley&$hgam$"le$"on$\'s-based$%urnos',
+    '$1ith&rehy;standing\'+standingfor#"yp")uackchott$&kshott#"by#"ch%!i#+gat-sellers&!s$#hth$#zar#$ioua#*m&eacute;a$&azalay',
+    '#+n-adjective%%based%+expressions%$name%(per-word&&hrases%)with-name$+/adjectival%$name$!e$&phrase*!s#&reddin$-ish&rehy;ment\'%ingly',
+    '\'"he%!y##ste#!v$*eau-riches)$ural\'#ish%&lliste##wen#!y"*v&aacute;k$&eacute#&-ember$#feb$%march',
+    '$+provisional#".1%!2%!9#(23/dec21#)a-hunting%&patrol%!t$)/magalluf%\'tavener$&castra%$ento%!o%)ulichthys&%shion',
+    '%\'angliae%!s&)eelandiae$\'feltria$$gard$&kowski$$mont$*ntaquattro$(ra-curat%!e%!k%!o%)ro-vallas%$upta$$tian',
+    '#&bember##eau$&cento.$"l\'%)-in-a-box&\'readers*#ing&$text%!.%%/poem%:ist-television-arts-person&&zation\'!e%,l-authorised\')buys-unix',
+    '\'#usl&)/at&amp;t\'0solaris-on-intel&!e&#ist&"us%#ois%-s/biographies$1mber&mdash;friday)(ndash;20/&monday/)wednesday(!-)"10*!3',
+    '*!6*!8*!9)"20*!2*!4*!9)"30)!4)!6)!9)$june)#may($1993+*4&ndash;12',
+    '%$eber\'!r%#ver$%space$!x#(gorodsev#"ia$+ce-mistress(#onk&.s-rowdies-town\'!.\'#hip%%iates$!k$"ne',
+    '$!o%%magus$!s$!t%#ate%%iates#)o-nordisk%\'ogarevo$\'devichi%"or$$grad&$odek$#lak$\'rossisk(#ysk',
+    '&%ltsev$#tex%"ny%#our#"re##ska#"um#!x"&w&bull$%mdash$%ndash$*rehy;adays#"\'\'$!n##-\'i',
+    '%#bed&&undant%\'ccepted%%iling%!s$&banned%\'iddable%\'lushing%%ottom$*celebrated%&lassic%(ollapsed&%mplex&*nventional%&rimson',
+    '&&relict&\'stroyed%-isintegrating\'&persed\'&solved\'$tant%&rowned$(emerging%\'xpected$&fabled$(giggling%#one$&hushed$*identified%&llegal',
+    '$(moonless$#now$*obligatory&%vious%\'r-never$#pop$$rare%\'ealized&(gulation&+volutionary%\'otating%%uined$*sensitised%,ophisticated&\'vereign',
+    '\'%ndard%*ubstantial&%llied&&perior$<they-work-and-now-they-don\'t%(rademark(\'itional\'#gic$-unfashionable&\'iversal$\'visible$&wetted%(ithdrawn$#you\'#-do',
+    ',0me-now-you-don\'t#(/&commat$!i%!n$$with#+_,_now_that$(erm_that#$anda#!e$$here$#lis%\'l-smith$%rland#\'here-he\'!.',
+    '##ich%!k&.ienvironmental#&joined##lan$(egendary#(osielski$#tny#!r#$seem$$hera$%imply$"ud#"ty"*x-belching',
+    '#,/particulate#$iour&*s-smelling"!y#%abrsk$!u##ous##ses"!z#"ac#,i&egrave;res$%ckian##omi##rim#"zi',
+    '&!.!\'p/75/88"!1"#228#!7""44"$9&gt""d*$"**"&fl-led"%g-gma"!h",n-controlled$%ruled$*supporting',
+    '""pf"!r""sr""up!$qaba"%ojane""vs"!w!(r.936206""/2"$1313#!4"&208639#!1$"00',
+    '#!6#%72732#%89745"!3#%07652"!4#"9v""64"$718l""bl"(c6096kkk"!e"!g"!h#!t',
+    '"\'pb-r135"\'s16,890#%2,080$%6,600"!v"!x!&s-e100"\'.20a(a)\'"b)"$/290##nns""2a"+32000-based""80"\'abimana',
+    '"#c/4"!d#)ap-danzig#!s"\'ekalije#%lling#"ng%(umuremyi"&f-dec.""gi""hg"#iad#&bandze#"ng%!a',
+    '"$ongo"$pcc.#"pc#"ss""se""tc"*u-contacts#(gbe/paul##ngu"#wlr!\'t&amp;t#0dollar;50million"/-capamips-based#&killer#\'on-i860',
+    '&\'pentium##run#(suitable"!/#&andrew##smp""15"!a#%gazwa#$huga\'\'justice""br"$cheu""da"\'ecedent',
+    '"$hato"!i#,-lactoferrin#$etsa#$mana$"ba"*lakyapamuk"!m##aga"#olo##mbi&$futi"!p"\'sanwisi#%c/pal',
+    '#"sb#$undu""tf"#uli#$maza\'!h"$z101!+u&eacute;es#)ntilde;oa"*\'auli\'itia#(ual\'itia&&i\'itia"\'-groove#$line#%matic',
+    '#$plex"#:an"#ada#"ge#&mrimol#(nce-rich%#ing$!e%#tsi"#bas#$bins$"ly#(each.dib$%neham#$icus',
+    '##uck""c.#!e$#1la$(lophilic#%ifera#$kell#.l&eacute;aires$.ear-accounting)$lert(\'capable(\'defence*\'pendent*(terrence(+engineering',
+    '($like(#non(+power-plant()submarine($test,#ing(\'warhead*.ste-repository)%eapon.*s-carrying\',/non-nuclear\'%waste(&eapons&#ses&%tions',
+    '%!o&,-cytoplasmic&#ids&#lus&-n-to-electron\'"ic)!s&&pcapid\'#ore\'\'roteins&)some-free&,tide-binding*#/mg$&oeitde#\'oeotide',
+    '##ula$!s""da##dea%$rwar#+e-magazines$!l$!r#%gings#&icaule$!e$%flora$"sm%"t.##nik',
+    '#!y"!e#$stro#%wirth".feibeh/surgeon#-field/schools%!n&"ks$$said#$orms"&gahiro$!i#%dalla#)ent-scott#%geted',
+    '#!s#%teren#&ueymat"!h#$omes"#ict#*sance-free(".a$$ence"#jol"!k#!i#%raine#!u"-lg.lgpmmgimms',
+    '-"s3#\'l-sense$$abor$!i$)port=none$!s$"um#\'tifocal$!y"&m-nums$)sponsored#"ac$(n/stevie%#tia#"be',
+    '&$&amp\'"gt&,+conditional\'#the\'-unconditional&&-coded(\'runcher\'\'density\'$five\'3one-with-the-people\'&packed\'(sequence((hufflers(#ite\'&taking',
+    '(+ontinuation(\'reation)$oss-\'*dictionary\'%first\'"id\'%print(-sn/lemmatised\'%sense)&quence\'$text&\'2tongue&+:472-0621-2&*onetongues\'"us',
+    '\'$(23)\'#-of\'\'/growth$\'ing-his$!r#&erable&+cy&amp;sup3&(ls&mdash%#ian&)c/editing\'/ally-controlled,,quantifiable&#que%(ologists&"sa',
+    '#"ia$"da%"ia&"us%"us$\'smatica#(mularium&$itic*"he#$nahs$#ber#%orous#!s$$kull#%words',
+    '$6cum-critic-cum-tv-star$%drama$%sense#+/chapeleyne#$atak$&wading#)burnholme#%chaku%#eon$$iate$&upatum#$dred#-es-by-ipswich$&zovari#!g',
+    '#$iads#$kton##ley#"na%#lly#$quam##raw#-s-and-donkeys#"us#$wick#%yerry"#ovi%%ssino",p-controlled#"en',
+    '#$kins##tia&\'l-night&!s",rabagambetov$!l$"xi#$burg##den$!s#!e$!g%%-0600$&mburgs$%nburg',
+    '\'!s##gis$&lesque##han##ina$&stanis#!k$"se#"ls#%minen#%nburg#$ofin#&rungar#!s$)e-crammed',
+    '&\'keeping&*to-patient\'\'raining%(/midwife%$less%\'ry-book(,cum-workroom(&garden(#man((quarters(&rhymes(%users\'&.those\'&/early(%first',
+    '\'$land\'!s%*s/midwives(&others$#in\'&*g-oriented(\'related\'./institutional(<teaching/ballet/ice-skating/##ton$\'urance-&&e-unit#$ullo##zay"&s/ub40',
+    '$#rat$$ybin#$baum\'"er#%eibeh#*fj&ouml;rd#%iance#\'plingen#%sbaum$%eibah&#rat%!x%!y#!t$#afa',
+    '"*t-and-bolt$,brown-haired%%ushes$%case.%&hewing%&racker+!s$&hoards$$like$$milk$\'sellers%$hell#!a$#con$"ns',
+    '$$rook#,combe-quicke$\'rackery#$ella#"gw#)hampstead$$urst#+iritionally#-meg-flavoured\'\'scented&#ged&"s.#!o#!r$!a',
+    '%$some&.weet-sponsored$$ents$1ient-conservation*&ycling)&sodium%%tion.)*/hydration)&alists+(ly-based.*disordered($usly#/s/string-guides$$edge$%hells',
+    '$(all/shop$"ed%!n%!y$"os$&y-slag%$core##ure&!d$!s#"vu#!w"0uuummmmineeeeahh"#van#&ellist',
+    '#"oc$!e$$lone"$wara#!e""yf#!s#$tten!&v-a850#-nylon/viscose"+a&mdash;the#!x""cq""er#)stigation',
+    '"+occ-service"%p-led#!p""q.#$/svq##ers#&s/svqs"!u##mba!*w&ndash;se"#-se"#/se""8."\'a-style##nza',
+    '""ce#"ta"!e#"st"!n"&oboshi#"ke$$obia"#pss"&s-3150$$5000#&5000tf#!f"&ukanma""wt',
+    '!&x1337a\'!."!2##0sf##491"%3145x"%41964"$55nj"$67hp"%749dp"!c#!3""d2""e3#"4.',
+    '""f7""g4!\'y-based"&913701"$aaah#$boya##gah$"eh#&hururu#$kana%$tale#%mbura$%davas$!s$$wezi',
+    '&"zi#\'ng\'anyi$"na$$tren$"ya$*zapithecus#)rlathotep#&ssanus#\'ung-ngu#(wspepper#*ya-vaiseka"\'canthes#!b#!e#&lopone',
+    '$&hemera"&egaard#"ht##mba$$wezi$$yets#$reri#*zavisimikh")ffenegger##lex"$gaar##gin"$havn"#iff#(regyhaza',
+    '#"wa"&jinksy"+k&ouml;ping#$land#%redit"#lar#&on-7,7&\'bristle&&coated(%vered&,for-acrylics&*reinforced&$type&%weave%$/10%',
+    '&%lycra&)synthetic#&stroom"+m&aring;nen#(ansensis#+ph-ravaging%!a%&eaceae%%omane)%iacal&!n&!s%"s.&%field+0/gloucestershire',
+    '#!r"#nas#!e$)x-hitrail#$orsk#$s-us"$oman#%nsais""po$*/bernstein%%masur"-rup-rasmussen".sa-scythopolis#(e-listed#!s',
+    '"!t#!e#&h-bran#"im##orv"%ugati#*m-nyumming##ndo"!x!0z&dollar;0.002bn,%428bn,%507bn,#9bn*%1,400,#739',
+    ',#5bn,#7bn,#8bn+%0.6bn+"20+#3bn+)5,000,000,$.1bn,!0*%2,370,#500+#.00-$21bn,%528bn+%0.1bn',
+    '+%7.3bn*!3+$,000,#218,#700+#.00-$49bn,#3bn,#4bn+!9*%4,200-"50,#500+$.6bn+%2.2bn',
+    '+%6.7bn*)5,000,000,#200+#.00,#3bn+"00+"28+"bn*!6+"01+%1,075+%3,805*%7,000+"50+"bn',
+    '+!0+!9#(pound;14)&297.10)$9.12"&-based#$made#$type"(1075/vh-"$2518"$5648"$ambo##nda$!g""cc',
+    '#!p"!e#&-emane##ogu"\'irorera#"ta""lr"#raf"!s""tv \'o&amp;k")ccaron;ko"%deg;c#,ollar&dollar"2euml;r&oacute&euml',
+    '\'$;320(!5(\'pressed(#ten)"he"*oacute;3in#+uml;genesis"-pound;conjure"\'rarr;ch!(\'-levels"%amiss")balgownie##ear%"th$#ugh',
+    '#$ooze$"wl#$ree/$+ien-busteed(%synge\'!/(+harryhausen(\'ireland$#yan%"ne#(uachalla$&siness"\'carolan#%lcock$$eary',
+    '%&ck-ish$#yne##old$,nnell/family)!s&#nor&)or-haters*%osted(!.(+/sugarcubes$&sworth#&ulshaw"%dandy#"ee$+ll/resident',
+    '&-ell-welcoming)&/award*&father*$tara%$ohue$,wd/northants#%ubayn%\'hghaill&&thaigh""ed#\'r-green%&parted$#/to$(burdened$%eaten',
+    '$&raught$%slack%%pread%(tretched$$take%"op$$worn"(ferguson%$rall&#ell#$iach#&ourman#$real$#iel"%gowan',
+    '%!m$(oats.ken#%ynist"&hagans&#rty%"en$"ir$+ra-designed#)eads-down$#hir\'\'/racing$$iher%#ner##unt"#jay',
+    '#,eefe/galileo$#tch"%larey$&ughlin#%eary/$#vel#$iver#%ondon%)e/anthony\'#don$\'ughlins"%mahon$$llon&!y$!n',
+    '\'$home%#ley#+eara/acting##ine#$oran&!y##uck$,ircheartaigh$$rphy$$tton"!n#*eil/animal\'&jockey&%l-pen\'$/age',
+    '(+development)(umbarton()hibernian(&labour\'#ite*!s#$iell$#ght"*priwileges"(rafferty$%hilly#-eilly/malvern)\'rothman)%speed(!s',
+    '$#eda$&ordain##yan",shaughnessey\'%nessy$,ea/wiltshire$$otts#\'nodaigh#&tickle$#out#.ullivan/acting+&sandoz,&teeple*!s"#th\'',
+    '$$ello#*oole-ewald#\'uathaig"$vino"$yore!$(n3)#"k)""x)$!/!(*e-sided!$+r+c"!t!"-1"!2#"35',
+    '"#300#&60-a1a""50"$7fpk"!a#)cetylated")b-i-t-r-y#\'irthday#*ournemouth"%cedar"+dianisidine"!e#!n#"ru"\'fish-al',
+    '#\'our-one"&grades"#h-m#"ay"#kay"(labelled#&evels."5methyldeoxy-guanosine"(negative#)ine-tails#!o"%o-o-h#<ctyl-&bgr;-d-glucopyranoside".phenanthroline#&in-ion',
+    '"#scz#$tars"%three##ype"#ver""wa$"it"!x"$zone!0.3g/s/m&amp;sup2"$5-mm#!5#!6"$75bn""86',
+    '#$.17.$#p.s$"s."*berteriana"&c.d.p.##arl#&ivelli"&e.e.c."!f"!h#".c$#m.s\'!.#$enry""j.',
+    '""m.$"i."!o"&p.e.c.$!p""r."$t.t.""u.""v.!#/40""bi"!c"!h"*predicates"&s/gcse',
+    '!"00"#ver!\'1\'-endo"!6"!a!$2(g)"$look&!.""su!!3!!4!#50s"!5!!7!!8',
+    '!*:dowex-50w"$rwed!%=only!)a60009094\'#545"%9x20f"#aah#!s"!d#$f(f)$!s#!g##ing""ed#!s',
+    '"0f-twit-blockhead#!f#%ishly&$ness"+k-and-steel%$pple$%block$%faced%%ramed&%onted$%grove$$hard$.leaf-encrusted\'#ves%$ined',
+    '$\'planked$&railed$$soft$$wood(!s#&apples#\'baraton#%deane%!n#%eleys%!y$&ngates%#sen&$hott$-s/boatbuilder',
+    '$*y/sculptor&$tony#$ford#%heads$$ouse##ing##lea%&y/ucca#%meeds$#ont%#unt#(panelled#$tree#(y-smokey"$ldle',
+    '#&istach"$maru##uru""ny$%thin\'$%where%!y"%o221f"#p\'s#\'-packed##art"+r-inspiring$$like$\'powered#"ed',
+    '$$ocks#"s.$\'persons$%woman"*s-mediated$*supervised#!a$!l#\'thouse.)!s"\'t-flour$&topped#$bran#$cake#\'es-like',
+    '#)h-helpers$(breakers)#ing$#ing$)mongering$&worthy#,meal-covered(%white\'!y""u."%xters"!y"!z!+b&eacute;ir""+1',
+    '""10""ad$!.$#ina#"id$"r*#"ma$!i#)n/lismore$%doned"!b#%edire#"ia#&ligati("os',
+    '"(cenities""dc#"ef#&t.sert#$ulio"#ebe##cni$!t#+di&rehy;ent%,ence-trained)!s(!y#$idat%!i#!l',
+    '$&kevich#%nault#\'raargau$$baum$&dorfer$!e%!i%\'rgraben$5f&ouml;hringerstrasse$!g%6r&uuml;ppenf&uuml;hrer&$icht&-uppen-fuehrer$$harz&$user',
+    '$"ia$&karbon%%ochen&%mmand+!o$+l&auml;nder%%ander%)eforestry&%itner&(ut\'nants$\'machtal&(schinist%&eister&#yer$*on/theseus',
+    '%+tar/manager&$dorf$$tass%%enghi%"or$%ursal$$welt$!y$$zell#+se-a-weight$.terreichissche#"y-")fuscators#!w"\'hayashi',
+    '$"os#"it#%liary%#tas#"na#\'quitous#)tuary:rev($ws29*"33+!9%$rary##zzi"!j#/&eacute;t_d\'art#"ec',
+    '&!-\'*categories*%hexes(#ode)&ncepts\'*discourses,&veries\'\'enabled,#ing\'(identity\'(language(%esson)#vel\'*management\'&notion',
+    '\'\'passing()rocessing\'+recognizing)*lationship\'$term)"xt($opic,!s(+ranscending($ypes\'%words&#/db\'#man($odel\'*relational',
+    '\'%woman&+builder/c++&+ed-oriented(!.&(ion-that)(ableness))s-general*!.\'"sm\'#ve\'))-eyepiece*$test)%.this)!/*%clear',
+    '+)ubjective),ly&mdash;the++-arrived-at)\'s-based+\'related+\'setting*%.this*\'/skills(\'isation)$ties&\'kit/c++&#pal&&uality)"ly&$view',
+    '($sion$*ts/reliefs#)urgations"(lastniki$&teness%&ionary%!z#!e$!r#!i$$dged$,ga&rehy;tion&-tion&mdash;so*\'al-type*"es',
+    '+\'trictly\'.oriness-making)"y\'(!s%%ement$.quely-striking&"um$(terative$!v%$ion\'(!s\'&usness##oha$)ng-leaved"#man',
+    '"!n""od#%e-led%\'playing%$reed$#ist#!k#\'lenskii$!s#"ng#%rknez#"us""ra$%doiro&!r',
+    '(!c$&titsia$$zova#+eg&oacute;n$#ros#"ok#%uchev"(s-pepper#!.#"/1#(ceneness$&hestvo$%urant\'!s&)e-looking',
+    '(%ville&$isms\'#ty.&%usfio#%elete$!r%\'-vatory%!t%!v&!a\'+&rehy;tions\'&nce.21)#ies(#tia\'!t',
+    '($ion\'+!-,%posts+%ality+"er+.s_in_respect_,8"of($oire)$rium\'%veris&"e\'\'%-only(#the\'(/control\'$d-to',
+    '(,distribution\'$r&lt(/-as-participant)&effect).guardian-style(!.(,/commentator)(engineer(.s/interviewers%%wator$-s&rehy;sional%,sional-rigid+#ity#&hchaya&)estvennoe',
+    '#/idian-carapaced(!s#&olesce(#ing&"ta\'(e.double($ness\'#ing%#ute#\'sessive#,tacle-filled)$race(!.((/assault%%ntial',
+    '%(trically$2inate/obstructions$*reperously%&ucters(#in\')-on-of-justice+!.+$ists)#ve.+\'airways+"ly("or"%tain\'&(edthough&#in\'',
+    ')!s&$ment#&eyning#&imates#*rusiveness#%unema$%rator$"sa%(e-angled&"ly"(ukauskas$#hov#$zuni"\'versely#%iosly',
+    '%!u&#lsy&"s.\'+ly-apparent#%ously"#yns#.watelski-akcja!\'c&amp;c#.eacute;anienne/!s#-rehy;casional"#-07#"12#!3#"48',
+    '"!2"&a-cola#"du#*mpojustice#!o#%rinas##sek$$sion""ca$(b&eacute$"m.$!s%.ion&mdash;over)(rehy;the(+al-breeding',
+    '*#ism*#ly--$used(#eth(%s-and%(sionally)!s#(casional#/hetto&mdash;see$&ionero#!i$\'-mizoki$\'dentals)$tion$\'pitalis',
+    ')(temporal(\'frontal$%tania\'"us#\'lestone$$uder(!s#,u&rehy;pying$-lobe-enhanced%"ta\'#ted($ions&"ic\'"ng$"pa',
+    '&\'ncy/bed&*tion-based+)initiated+\'related+(specific*$.the*7/industry/sex/part-time+-participation**al-pension4!s,(ly-based+"ry%%ied-i)+territories\',r-trespasser',
+    '%&tation&#ion%#yed$+r&mdash;not%$-see%%_from%!e&$nce.&!s%\'red-but)"or)%these)%which(!.)!h',
+    '(!t&\'ing/has%%s-but&%_from#$ysts##zim"#dna"%e-van#.an-circulation\'&limate\'&overed&$deep(#pth\'\'welling&%front',
+    '\'&urking&&mining&(striding&$wide%+/atmosphere%!a&#ria%%front%!i&/c-island-basalt(,ridge-basalt\'!.\'!a\'!s&#tes',
+    '%!o&\'logique)!y&!s%&routes%/s-and-mountains%%world#\'licauda$#otl$"us#%nebra#%onics""ha$&mchire#$damh',
+    '#$iela$!m##man##ota#"ra%#cea$/e&rehy;coloured%&-brown&(liveried&&mining&#red&&tinted($pped&&washed%#ish',
+    '%"ma&$onas%#pus%"us#&senkun#(terveldt#$umba"#iam#$c-al$"at"#kay#%eghem$!n#&hamite##old',
+    '"&mp-abi"!o#%cingo#"ra##tal$&epeque""sg##ian"+t&ndash;nov##-10$!3$!5$,6/scip/tst-1%!0$"91',
+    '$#nov$\'protein+#(s)+!s#".1$"20$#30.#$/dec#(24/nov22$!a#&adecyl(&silane$&eteris$%hedra(#ons',
+    '$.mer-containing()dependent)"na(\'taatga-.#nat.#tat\'$/nf1$)ne-soaked%$oate%!t$%rsier$%style$-ve-and-a-half\'%blend\'+combination',
+    '\'\'raising%!i&%onics%&o-size+!d##els$#tte#!o$!-$!b%1er&mdash;november(\'ndash;1/!8."26/!8',
+    '.(december.$july\'#-11)!2)!3(!2)!3)!7)!8)!9(!3(!4(!7(!8((february',
+    '(%march()scheduled\'!.\')/december(%early%)rachiatus$\'cinclus%&oralia$#gen&$sima$%meles%$itus%#ore$+n-cum-octon%$ions',
+    '%#oid&"le%(us-style$&vullin#*reotide/24#!u#"yl"#uli$*o-antennal&\'genital%,cerebrorenal$"to#*mar&eacute#$pied$"yd',
+    '%!s"%xides"(ymifolia#$peta!/d&aacute;insakr#(eacute;n*"on",\'d-on-heroin##ing#$rous""-2##ing"!."#1.0")a-related',
+    '#$line%%sques#!m#(nsentron#$rich#!s#$wara##zzi",bc-compliant#$erht\')/eadberht#"oy#!s"#cie""d-',
+    '$(coloured$$even%#yed$&jeaned%&obbers\'!s$&legged&$ngth%#ike$\'man-out$\'or-even&#der$&player$%sized%\'melling',
+    '$$toed\'!s#%/even#!a$!s#"ds#*est-shaped#%facts#(ie/roman%!s$"sh$$ty\'/&&-value#\'jobbing&!s',
+    '(!t&&titled#$ment#"ny#$runn#\'s&mdash$(-against&\'nd-ends)$sods%%maker$"on##var#&ysseys"#eca##dra',
+    '$!s#%nbach$$daal$!s$$wald#*on-fronted&$like#,rmatt-cazeau#"te#"um$"rs#(y/banned""f.""ge$"rs',
+    '#!c#!e$!s##zor"%kolek"#lum#!y"!m""no$"wa"%oardo#"do#$line#&ntella%$ites',
+    ')!i\'*hirurgical&\'pleurid#!r$+ant-induced%(tissimum$"ic%#zer$$less$!s#,ur-absorbent&\'bearing%#ful"%reman#$odek',
+    '""s2#(bodykins#$tock"$t-mt"#yle#%ssean&"ys%#ies"#zak!)e27056455"#bel"!c#"d.$!/%#iea',
+    '&"in#&ologie#\'umenici$!s",d/supplement#!c#\'icnemus$%pally%*us-complex#\'ogonium"!f"+hlschlaeger#$miga"!i#!l',
+    '"#lde$#rid#!e#!f$$wine#"ic#$kers#%schig"%m\'ing#)-specific#$/isv$\'rebadge##ing""na$!s',
+    '#(ingensis#(ological(#sts\'!y$)theraceae"$otea"!p"(q7026379&$9124"-rlikon-buhrle"&scinga#&opagus%)hageal-ph)!l*!a',
+    ')$tis.()o-gastric)%colic)(salivary*(tomiasis)"us(#us.&(ogoscopy#/phageal-gastric##ten%+ochondritis%&rgaard$&raderm&!l%#iol',
+    '*)dependent&"ne"!t#&helred#&linger#&tinger"#ver"*xophagitis"(ynhausen!(f&amp;et#*dollar;9.6#\'formula#+lsqb;f&rsqb#)mdash;the#\'pound;1',
+    '*&40,000)\'250,000)!3*".2*$3.20)#400)%5,800)$9.75#)rehy;view"#\'em#*obbligato\'#*spillovers$+urintendent##war"#(2)',
+    '#"4)$"0)#"5)"(-&frac12#%3.7bn#\'adjunct$(gitation$&ntoine$(phrodite#.c&eacute;zanne$#ity#*date-stock$$eath%$mand$#ogs',
+    '$(xquisite#\'f-f-fff$(ormation#"he$"ow#"it#&kosovo#"of$!h#$real$$osin#\'science$$ound$%treet$8urprisingly-reminiscence',
+    '&\'derness$6he-being-of-the-breeze\'\'century\'&moment\'$wall&"ir#$wait%!y$#ell"#.65##far#&having$"is#"it#&length',
+    '#&public#&things"!/#%&egr/#$18th#(american#"ct#\'despise#\'earning##flt$%ormer#\'glasgow#&health#&mixing$(urdering',
+    '#%royal$$ural#)temporary$"he%0rough/under/over#(under-16")0&ndash;8""10#&75,000##993%!4"\'325,000"+44&times;10"#5.6"$6-mp',
+    '",:manufacture"3_,_that\'s_of_course#$date#$fact#"up#\'whether"$arim#!s"%broth#"us#&yronic"%china#%ourse"!d#&ietary',
+    '"%e500s#%llius##red"%f&ins$%mdash$-rehy;broadway)&course)\'driving)\'moments)%shore)(the-cuff)%white#&-/farm$%again))-on-again',
+    '$$bail%$eats%#ike%$lack%%ounds%$reak)"er%\'y-heart$&carved%$hock%$omed)#-un,!s%$ream%%utter',
+    '$$days%$iary%$rove&!y$%earth$%floor%$rame$%games%%lided$(his-food%#ost$$idle$(licencee+"s.)"se',
+    '(!s%$ying$&moment&"od&&torway$%night%"ot$&patent%\'hasings%$rint&&otocol$&quoted$)resonance%$iver%+oad-holding',
+    '$%scale&&ouring,!s%&easons&"ts%$hift&&oulder%#pec()ification%\'traight\'&ucture$)territory%,he&rehy;cuff-#pet-%rails',
+    '($boat(0equilibrium-path($face*"rm($hook($line*!p(\'payroll)#uck($rack)#oll(%staff(%table(%wrist\'$.job',
+    '%#une$$well%#hat%%irral#!.$!i#&/where#,_,_off_guard*"of$#any$$even$%in_er$"up##ace$)l-burning',
+    '%!s#\'balance#&church$%ivers$#ome%$urse$&utters$$zors#$duty#*eciers-van$4nbarungspositivismus%#ce\'\'(-related*,presentation*)tribution',
+    '()vengeance\'&.since\'!d\'\'s.joyce&#mes%-der-profiling((/offence("s.%&houser%*sives-cgto$"r\'%$-bid&)documents&&to-bid%&/chase',
+    '(#nal)(cessions(%unter%#ees%#or.%#red&#ing%"s.&\'/takers%!t$!t#&ficers&#ial##gas##ham',
+    '#+ice&mdash;a-$form\'.rehy;directors&!\'&!-\'*automation\'&backed(%locks($ound)!y\'#cum*%-shop,$pare\'+from-office\'\'holder.',
+    '\'#led(#ike\'\'manager\')political\'%speak($taff)%udios(%upply\'\'trained\'\'vacancy\'&wallah(%orker&".i\'%trade&!/',
+    '\'#bed\'*commercial\'%eagle\'(position\'+refreshment\'+secretarial\'\'teacher\'\'utility&(_as_well&#ful&$gate&"in&$land&,power-on-sco&2r&ndash;councillor',
+    '\'0-and-gentlemanly(\'council()designate(#led(&member(,of-the-watch(%to-be)\'raining\'!/(-administrator)+gricultural)-nthropologist(/gloucestershire(\'manager(+oxfordshire',
+    '(,receptionist(\'trading(&warden\'#ing\'0s&mdash;provoked(*-in-charge),of-the-watch(\'/senior&*s-kadiliks\'!/(\'studios&&vision&%wards%\'ial&num(\'-minded',
+    ')$rate)\'steward()/judicial)-nonconformist($ised*!m*!t)$zing(2ly&rehy;recognised*\'-backed+*controlled+)generated+\'induced-&spired.\'tigated',
+    '+(produced+\'species*!.(&s-only)%.have\'&nardos\'&riorum&%natis$!n%&icalis$$side##key#4line&mdash;workspace\'!s#*our-hourly',
+    '#$ramp%$ndes#"s.$#ale$(courings$$et=o$)hoot-band))cum-hobby&-re-equivalent)(industry$)potulates#&tackle##wat$$hite$#ide',
+    '#!y"!g#.loucestershire"\'history#*omeworkers"\'iciales\'%illos&"na%"na#-gonucleotides#"si#"ts"#job##ust"$lags',
+    '#&oxacin#%uxury"!m#"en"!n#&uclear"&odrugs#!s"#pra"$rten"!s#&smcntl"*t-approved$(declared%(iscussed',
+    '$)embattled%\'xploded$*malevolent&(nifested$)perceived%)roclaimed\'%mised$*reproduced&*suscitated&%vised$(thwarted%$imes$\'warring#!/#&_times',
+    '#!e$-n&mdash;still,$that&*rehy;heard+&skewed%)-analysed\')ssociated&(baffling&(changing&%dared\'#ead\'(ifficult(\'smissed&(employed&%fatal',
+    '&*illiterate\'\'terated&&meagre\'#ore&)neglected\'&oticed&+ordinalized&+pretentious&(remarked(%vised&-uncomfortable&$when%!.%#est%!s',
+    '##hem$"is##ner#)wenty-one$!o"\'verberg"!w#$hich!&gadeni#%llala#"ms#"rd#"to#&wayama""ba',
+    '##uru"$dens##oad"%ering"(gersheim#"in##led"$hani"&ilesby$#vey\'!s%#ies%*y-shepherd&)/aircraft\'(historic',
+    '#"no##val#$wara"$lada#"er%!s$!s$$tree$*y/windmill#$ings$!o$"vy"%n\'hor##ell#$isko',
+    '#"on"$ofau#(n/common##oue#$pogo"&re-cop%&figure#$idge#$osky"&sawara"$uibe#%ndimu$$lade"&wuguwu"%yebre',
+    '($;yes"#+ho"#-58#"ah#/cook-cook-oo-oo#.dave-you-silly#$five$-or-god\'s-sake%"ur##h-h$3e-looks-a-bit-stiff$\'o-ho-ho#9it-will-never-happen-here#%la-la#\'my-gawd',
+    '#*no-they-ca%%thing#*oh-oooh-oh#2shit-don\'t-tell-me$+o-artlessly&\'careful(&utious\':lever-oh-so-knowing-but-oh(#ose&)desperate\'\'iscreet\'\'ominant&)efficient\'*galitarian&\'helpful',
+    '&*reassuring&&secure&$true&+very-gently#%three#,yes-they-can&"ss"!.##hcl"-_._a_carrot_.#"no"$akea#!l#"na#!u',
+    '#"yu")b+0.9cohb#&ayashi""en$)e-kwapong"*fuckinhell"$hhhh&!h#"m\'""in#(o-valley$#ans#"ya"$kawa#!i',
+    '#$igod#&meters#"s.#@ygodherheadwastouchingtheceiling"%ngren#!o"#oho#"lm#&tnikov"%rdruf#&feigen"!s#%himai##umi"%tsuka',
+    '!%i-vey"3a&lowbar;011207.tmp"&b-morb#!s"#che#"ks""dd#$hche#!s""ge##non"!h"$keia#+odome&omacr#!y',
+    '"$l(s)#*-absorbent%(nd-parts$&backed&"th%\'edaubed%#ird%(lackened&#ood%#oom%#urn("er$$cake%%hoked%,loth-covered',
+    '&%vered$&damped%(evourers%)ispersing%\'renched$\'endowed%)xtraction$%field)!s&"lm("ed\'#ter%\'or-arms(\'weapons$)gathering',
+    '%&rained$\'heaters%"it$(immersed*#ion%\'n-water$%laden%$eaks&"ss%#ine\'#ked%&oading$\'milling$)on-canvas\'\'leather',
+    '$\'painted)!s&#lms%\'erfumed%)lus-parts%\'oisoned&\'llution&"or%&resser&(ocessing\'"ne$+refrigerant&\'pellent&&source%%igger',
+    '&%rvice%%hales\'$ring%#ide%%licks%\'pilling)!s&#oon%$tain\'$rved&%orage$&tanker&\'rnished%*emperature*"ed',
+    '%$hese%"ig%%opped&$ssed%+ransmission$\'workers##.if$!l$$this#*/gas-fired$&petrol$(urethane##145#$atum#%cakes',
+    '$#oms$#rum#!e$$d-up$#tte#$iest$"ly#!l#$ness#$pipe#&s/fats$#eal$,lide\'n\'light$$tain("ed',
+    '%#ove(!s#*wat/gaswat$&orkers#(y-haired\'$nded%%pawed&%elted%#rag%&smooth$(/problem"&myakon"#ned#"oe$$maos',
+    '#!t$)ment-like"!p"(ratianus##ish&$ness"#shi#&trakhs""ta#%eagan#$hona&"ia#!o!$jeda#"ks',
+    '"%ibway"#jeh"!l"#ocs#!s"#uel#$tiku"%wanga!%k-ish#;let\'s-discuss-this-together#\'tan-dra"#abe#%idjah#$moto$#ura',
+    '#\'pi-skin#%taina$!u#"y.%#erm%#how%!i%#the#)zaki-ward"(e-cornes#!h#!n#$over#!s#\'y-doke.',
+    '$$doke$!o"!h#\'udzhava"#ies#!n$\'awan-te(!s("te#!s"!k#!o"$lahi"$ochi#"di',
+    '#!n$#g\'o$#kwo#$pyan##san$&hechko#"th"%p-the#!e##omo"#ras")toberfest#$yabr"!u#$lick',
+    '#"no##rut#%sanya"!w"$yere!,l&eacute;in\'",\'blackbreath##del""-q"$1918"#410"!8"#aba#%ecbea#%gunju',
+    '#!m$"an#!n$$dese#!r$!a$!i%!a$"te#"te$$unji#$udah#&varria$!i%&nlinna',
+    '##yan$#ide%$wola#&zaball"#bas##iil$!l#-reehts-tyteca$$icht"*d&mdash;it$*rehy;flame)2testament-inspired##\'is#$(er)$$ish)',
+    '%)nd-modern%&vestan$$boys%(ufferism$\'clothes$$days$\'english%&tonian$+fascination\'.hioned-looking-$ness%$ogey&"lk$*generation$&headed',
+    '$$left%#ine%#ook$\'maidish(!s&!n\'$nish&&stered*#ish%$odel$#old%5nes-are-the-best-ones$$pais%&eoples$#red',
+    '%$hape%&oldier+!s&&unding%$tage)!r$$town$&winger&#ves%\'omaning&#rth#!/$"is$(savagely$%young',
+    '#0_,_old_fashioned#&bourne$%ridge%*ook/milton$%ugger%!y#&cambus$%oates%/mmonwealth-pals#.e&rehy;english$&nborgh%$dorf%$zaal$,r&rehy;style%(-brother',
+    '&)fashioned&*generation\'#irl&\'looking&+working-age%!.%(/younger$#st+&%-ever#$ford#$gang#$ham.&+/liquidator&!5&#ite',
+    '#*manuscript$$ixon#$rado&"us$.ey/strathclyde$"id&"ge#$s.an$\'mobiles$$peak$$quaw$,tyle-western#%timer(!s#(womanish',
+    '#!y"+e-compliant#!a$$ceae$:nder-and-silk-cotton-lined)%lined)\'worship%$olic$#ria\'!s%"us$!s##fin&!s#&ifolia',
+    '#%j=oil$&niczak$$ovka#+o-pneumatic$(chemical$%graph$%pasto$&resins$"sa#%pasto#%racea$"on##sen#"ta#!v',
+    '$!a$!l$#nik"*factometer##ord"%giati"\'hebrews#&ovskiy"$iand#!c$!e#!d#)efabriker#&gaemic$,o(dt)-primed',
+    '%!=%&chaete%3deoxyribonucleotide&"on%)labelling&$epis%$mer-)\'polymer(\'isation%3nucleotide-directed0(mediated0\'protein%\'peptide%*saccharode(\'harides',
+    '&\'ynaptic%,trophication$$uric##mov$"pa#"on#,phant-fraser(!s&#unt#"sa#"ua#!v$%arius$(e-backed\'$read',
+    '\'\'oloured(*mplexioned&$dark&%grove)$wing*!n&$mill&#oil)&-based&)scattered\'%haded)#ped&&tanned\'%inged)#ted',
+    '%&/black&+yellow/grey%$iras%\'r-jones&(/bulmers\'$cpre\'\'manager(%ilton&$:san&)o/slatkin%"tt$&ia.and&!s%(er/leigh($swet',
+    '\'!s$!y""ja"!k"$lard#$cott#(erenshaw%$head%$sett$"tt$$vant##ied%#ing&"sh$%onles',
+    '#$oman#$sson#%ywood""ma##eda%!o$!x#!o#$pyic"#ner$1y/buckinghamshire#"yk"%ofson#$gies$,onucleotides',
+    '#$nkho#!s"#pal#$hert#"in%+/meningitis"(schienen##ens#!o#$sons#\'zewzski$&iewski$%owski"!t#"an',
+    '#%manns#!s"&uluyha#!m#!p#&satrum"$vera#&idados$"ng"#wig$!z"$ympe%*ia-stadion\'"de\'$nism',
+    '\'\'stadion&,c-proportion((standard\'\'10,000m&#tis&$ysky%*us-engined#%pmics!3m&aacute&ccaron;kou#1rehy;nicompetence""/s""28""ac$"hi#%gamon',
+    '%*-cookstown#$llys#$ment#\'n-biyik$&/yemen$$adze$"ga$$idze$"ju$"os#&rakana%"ma$#din"$bler#,o&ndash;edfu',
+    '$!s#(r&eacute#!u$$dman%$sfan&&man-it*$like)$says&&person&%women"!d#"as"$eara#)gamon/400%(view/400',
+    '$!l#"nn#3prazole/amoxicillin"#gus"%idjoy#$kami#"na$"or$"um#+s&rehy;sion$/sion/commission("s.##ted$$ted.\'-/illustration',
+    '"#lac"&madawn$&tidial$#yad#"er##ing%!s$$sion%$sion)!s#$mmmm#\'ochrome$\'nwealth#%unity"#nem',
+    '%$pair&&layers&\'resence%&reader$)back/link%$reck$%coach&(gnizance$+dimensional$%fluor$&potens)#tly&&werful%(resently%#ure',
+    '%$port)!s$(vorously\'!y"$odeo#$jola$#udi#$koko#(nia**325#!o#!v"%phale$$olos#)lications#%ppase',
+    '$!k##ich""t."#u-3#!3#!l#"ra"%varee#!g""ya#$niad#$tted!-n&eacute;simo#+lsqb;e&rsqb#%mdash',
+    ')!i#\'ndash;y#+rehy;screen"&-again$"nd&.-a-half-stones%!y$"re##bar$#eam&!t$\'roadway#$card&%riage$%olumn',
+    '%%unter$"ue#(deserves$%riven#)exchange.#$full#%green%%owing$$uard%#ess#%hands$#eat$#igh#\'iapx-86$!n',
+    '$"sh$!t%"is#\'lapping$#ead%"nt$\'inehelp$\'ocation%$oker#(negative#&or-off#-premises-only%#ofs#$ramp$%ecord',
+    '#%scene%/reen/off-screen$#hip%"ow$%ights%-te/on-the-job%#zed$#pot$\'quadron$$tyle$(ubstrate%#san#%table$)elevision$,he&rehy;spot',
+    '\'%block("ox\'$case\'$edge\'%fence\'$hoof)"ur\'.job/individual++off-the-job\'#run\'&tarmac\'$wall&!m%"is$%o-one',
+    '#\'vehicle##wye##you"".7##all#\'defence$%uring#%going#"he#!i$!t#%rails")/domestic#$half##not',
+    '#,requirements##she$(tephanie$%witch"!1#!8"!2#!5"7_,_i_will_pass_it_on_to%%on_to**p_,_top_of#!a$"nd$&verage#3behalf_on_behalf_of',
+    '$%rm_to#"in#%on_to($p_of#+to_anything"(agraceae#!k#!m$#bwe##nia%"st\'!s##tas#"wa%!y',
+    '#(uildings")c-a-month#$/nfs#-e&mdash;catch+#one%0rehy;and-for-all*\'derided*&golden*+unthinkable$!-%+a&rehy;week&(-century\'&decade\')fortnight09-whether-i-need-it-or-not',
+    '\'&undant&.gain-teetering&)nd-forall%&banned&(eautiful&$lind\'$onde&(reathing\'$ight\'$oken\'$utal&\'umbling%$chic&%lassy&(ommunist',
+    '(\'tinuous&\'redible\'+ocus-yellow\'&ushing%(daunting&\'erelict&*iscredited&\'ogmatic&$usty%\'eminent%(faithful&#ine\'$tted&)ormidable%\'genteel',
+    '\'$ossy&(ravelled\'#een&)uaranteed%%hated&\'ooligan%*idealistic&)mmaculate\'\'portant&(n-a-year(+my-lifetime\'(novative\'&tended%&lagged%)macmillan',
+    '%0neatly-assembled\'\'glected&\'umerous%-on-a-lifetime\'"ce&&pposed%\'painted\'(ssionate&\'loughed&&raised\'&ecious\'#ime\'(osperous&#ure%%quiet',
+    '&#ich&&ounded&%uined%\'scarlet&\'eparate&%mooth&%nobby&\'terling\'(ruggling\'$uffy%%thick&*raditional\'$endy\'&oubled%+unavailable',
+    '\')thinkable&#sed(#ful%\'vaunted&$exed&&ibrant%)wandering\'%yward&#ere%&yearly&$oung$%=calm$5_and_once_and_for_all$*in-a-while##ham',
+    '%&peltus&%horus#&omouse$&peltus%\'roteins$"st&$atin#$ques"\'degardo$%rwijs#%ilian#\'orodiau##ras$$iven##ule',
+    '$)mdash;but*$ibid*"or*#she$*ndash;hour*#man*#off*#six*%three$/rehy;and-a-half*$rmed)*day-a-week)%fifth*)ourteenth)$half',
+    '+%nings)#man)\'quarter)%sided)\'twoness)#way##\'ud#\'-\'tawno$%a-day&&minute&$side%$cter\'#ion%*gainst-all,$ones',
+    '%"nd\'!-(!a)*&rehy;half)&-half-/%hours/&legged0$itre/$mile/$page/+storey-high*%third(*eightpence($half(%nines',
+    '(*threepenny&$swer%%rtist%#tom$.band-per-month%"ed&"er%$oard&$mber&"ne&%uncer+5-per-over-per-batsman%%ranch&&easted%"ut',
+    '&%rrier&"se&&tegory%#ell&"nt("re%&hamber\'#nce(#nel\'&racter(#lie%$lick%&ompany&%ncept\'(ditional',
+    '&%untry\'"rt%#rop$(day-game%%egree&$rful%\'ominant&$nkey&"or&#zen%6rachma-out-of-every-17&$iver$&earner%(ightieth%&lbowed',
+    '%\'xplicit$$face\'#tor%%ifith\'#ty-&#ght\'#ure&&ngered&\'ve-zero%#oot(%-deep&$r-10("20)"77(#ten',
+    '\'-m-one-meaning\'(ty-eight*$five&"ur(&-eight)$five*#our)$nine)%seven*"ix)%three*"wo)$zero(&teenth%.rame-at-a-time',
+    '&1nction-per-button$,game-a-month%#ear&!e%#irl%"od&"od%%uinea&!n$$hand(\'icapper(#led%+it-one-kill(\'wonders%*our-a-week',
+    '0.fifty-year-old0-thirty-rouble1*wenty-hour7(odd-mile,%pound,$seat,(year-old+#ths$$idea%\'mplicit%*n-1&frac14\'!3("28\'&50,000)!0',
+    '\'*a-thousand\'%seven("ix\'\'the-eye&\'ch-long)+to-one-mile&&dustry%#ron%#tis$$jump&&nction$%keyed%-ilometre-wide$,last-pushers%"eg',
+    '&$tter&#vel%%isted&#tre$%major&"ke&\'n-bands(%power\'&oeuvre\'"ys&$rket%.ember-one-vote&(tre-bore*$wide%&illion',
+    ',%franc+"th,$onne&"ss%#ore&&vement%\'ust-not$$ness&!t%-ight-standin\'1!g&,ne-six-seven$\'o-three\'"wo%%bject',
+    '&0f-data-gathering\'#ish%&h-four\'\'two-one%$unce&!t%\'ver-one%$wner$$pace&\'ragraph\'$ents\'%tyism%\'er-cent(&person($room',
+    ',\'perated%%ieces&"nt%)latformed\'!y&&us-two%(ointedly&)und-notes)"er%$rice%-ulse.per.step&"tt$(question$$reel%#ing',
+    '\'"te$$same%,eason-sealed&"lf&*rving-size&!t\'#ter&!x%#hip&"oe\'"ts%#ide&"gn&%newed\'#gle',
+    '&+ze-fits-all%#lab%)on-apiece\'!g%&peeder%/quare-kilometre%&tation&,ep-at-a-time&$itch&+op-shopping\'$ried(!y&$ride&$udio%\'upplier',
+    '$$tank("er&$ttwa%\'erminal%#hat&(irteenth&2ousand-two-hundred&9ree-beta-one-one-triple-k*%eight*$nine*#one%%iered%!o&#-10\'"24',
+    '\'%eight,*-processor&%nners&*oth-apiece)"ed&(wn-a-day%#ree&#ick%(witching&)o-oh-four)"ne(*three-four%#ype$%under)$-par',
+    '\'!r$$wall&"ve&&y-deal%$heel)"ed&9o-dearly-loved-her-people%%inged%6oman-against-the-world&-rd-answerable$-year-contract)#off*!n#).phase.on$$side',
+    '$#way#%/four$&ninety$\'several$%third%%wenty&&o/more##_by$7one_one_one_one_another%#ver##and#"ce#"ga#0hundredpercentus#$iric',
+    '%(ocritica##lie#%match#!n$"il##oak$!f#\'r-fiver$)siphorous#"s-%#for$".0%#two$!3$#_in',
+    '\'"-a)(s-object(&better\'\'/asking$$imus%!n$#top#%third#)upmanship#"wa%!y#$ywey"$garo#)e-lukkige$"ri',
+    '#$laze$=e-bongle-boodle-boodle-boodle4-giggle-giggle%&thorpe%"ys#&oingly\'$ness#(standing#&wakebi"!h")i=ongoing##ans#"ch#)gohydromo,$nous',
+    '$&n-dome&%holes&%rings&\'tainted#!s$#cus$"hi$!t##tes#$zuka")kaparinga#%elinx$%rzele$!y#"om',
+    '%#ped&#ing$!y#!e$#eee$!y#!f#!i$)ne/secure#!t#"uy#\'y&mdash$!-%"be&$lack',
+    '%&groups%$just%%known%(possible%#the("ir$".h%"to$$/the$!6$"an$(deepened$#wey%$omen"\'mod.qry',
+    '#$daga#!e$)sophageal#(makritos%$stic%)tologists\'$peia#!n$$daga$#ono#&pordum#&ufriou"\'rdinary"#sen$\'quences',
+    '#!h#\'idering$%stent#$tenk$)imulation#(witching""ta$%rians#"el#"ic$$nues#&o/into$&geneis\'&ically$&logies',
+    '(&zation$#rio#\'ransfer#!y"!u##ven"\'venting#%olved"!w#/ard&rehy;flight&(-beating\'&moving\'(speeding(&urging&$ness',
+    '#!e#"is#$urah")ychiopsis%\'ocrinus&%phora$(ophorans#!e$#mbe#$mous#$onka#&rhythm##wey#(x-ectomy$&ectomy',
+    '!+o&ndash;niq"#-hu##joa#%la-la#$oo-m&"oh"#.oo""am"!b#!s"#chi#$ysts"!d#!a#!s',
+    '"(gamyflip#$erly#"hy#"ie%!s$$fibs"%h-aah$%la-la$%three#"ed#$hing##ooh"$idal"(jamaflop#(einensis',
+    '#!y""l.#"ie$+tic-barrier"%m-pah\'$-pah#%afama$%lamaa#"ed##men#(p-ooo-oo$%ah-ed\'&oompah\'#pah&#ing',
+    '#$aaah#!d#!f##hed$!h$)ohooo-o-o##mph#!o$"ld$!o%"ch%"gh%%hhhhh%\'o-weooo&!o',
+    '\'!o()ooooooooh1!h&!s$%wwww.#"sh"(peration#"la#"pt#+sie-doopsie"$rain#$sels"$st-1$&erbeek$%malle',
+    '"(tacamund%%umund#$burg"$uchi#&tright$&ukumpu"#ver"!w#!t"#zer$!y#%ingly!,p&eacute;ra-,!s,%tions',
+    '#(mdash;it#.rehy;portunity)\'ression"!-#"24##amp&!s#$code#"ed#(position#"ra#%sized#$wolf#!x$"/v',
+    '#"23#"30##cit"$/air"!1#"05#!2"!2""84""94"!_"\'acified&$ying%#ty\'#!h',
+    '%&mining$#dce$!e%$sque$"ka##nal$"go#"va#!x""co$"de#)s-defined$%/hmso$!4""e\'',
+    '#!d#*l/vauxhall$$eika$"la#\'n&amp;d%)mdash;air%,ndash;minded%$rehy)&;ended*&market+&outhed*$plan$!-%#age&$isle',
+    '\'#eas\'#med\'$tery%\'balcony&#ill&$ored%%caste)#ing&%entre\'(remonial&$hest*"ed&$lass%(decision%\'endedly',
+    '&"rs&%vents%&fisted&&lanked\'#ued&#orm&%reeze%*government&&rained%$hand%"is%\'jointed%$leaf\'!g%(marriage',
+    '&#ike\'&ndedly&$outh%#out(#cry(#let%#pan&#lay%%razor&$iser%(sandwich&#eat&$helf\'#ore\'"ut',
+    '\'\'rinkler&%tring)!p%(throated&-o-suggestions(\'the-sky%&valley%$were&\'indowed(#ner&$ound%$year$(.canines%%tests$0/gateway-snagate',
+    '$%=plan$)_in_front%&minded$&backed%#ook$,case/toolbus%&onnect$\'desktop%#oor$&ed-out&#_up$*framemwork&%onted$!g%!l',
+    '$\'ing-bat(\'credits(%night(#out\'\'.turtle\'(/manning(*previewing(\'sorting$&limits&"nk%*y-admitted$!o$"s.%$ides%\'oftware',
+    ')%/link$)vms-based%"ue$*ware/motif#%r-ish$$.res$*a-bastille&#ish&%lover+!s&#nut&)pantomime&&singer,!s\'#tar',
+    '&%ferro&#the%$gors%!i%#nda\'!i%$rios%"si%!t&#ate&"e\'\'$-the\'".6&(ic-style(!s',
+    '*$type\'&on-and*\'scarred)!.*&locals*"of*$this))/activity*+maintenance*+performance)1al/non-managerial+\'isation,%zable-#ing+.ly-independent',
+    ')"s**\'-london*&.under**/divisions+*management+&second*!5\'(ve-sense)"ly&#ons\'%r-bar)(fragment)#led)$tree($/air',
+    ')&worker()s/drivers)$hips%%zione$&culums$&entsia$"is$%nball$%on(s)%&phtera$&sation%%tions$$tion$!y"*felchammer',
+    '"!g"(hacantha#%eltes#+iacanthella*"id&%tidae)!s$&cantha)$ella)$idae$$dian$&oblenn*!a%$copa&$ten.',
+    '%$gema&#ona%%leuce)%inae.&$ycus%&musium&$ytis\'#xid*"ae%&pholis&%leura\'2inthaca-ophionytis%(striatus%6thamnus-ophiurothamnus&&ominid',
+    '$\'pristis$(r/rowing$!s$$ura.\'!e&#ids\'$nids\'\'thamnus&\'oglypha#&omyces$\'tominae#&raelin#+thalamagist\')moscopist-!y',
+    '#"cs#!n$"el$-ion&mdash;for.\'hunting(\'rehy;he\'!*\')-assisted(%based()gathering(+influencing(\'leaders(&making)&ongers*$ving',
+    '((sampling)\'ounding)&urveys)%wings\')/attitude\'\'formers\'#ize\'"s.%!s$"on&!s#,sthognathous\'%tonos#!t#)um-addict',
+    '&#den(\'pendent&%eater)#ing&\'induced(&spired&$like&(planting\'(roducing&\'traders%!."%latky#!e#%ontis"#ned',
+    '#&chniks##eis#!n#)ortuneity#%panax#(rtunitat)!y#$sers$+i&ccedil;ao#"us"4p&eacute;de-le-vieux#$.1-5#"ed%!e$#nau',
+    '%-heimer-barnes,,teller-super,\'volkoff&#off$!r%#ate%"es##ida$"es$&lative$!n%!\'#&oisite$!r%\'otunity',
+    '&!u\'+n&rehy;ists()ely-timed(!i)!s),ties/options*"y\'+(-seeking,(thinking-(o-create+"by+#for$"s.%"er%#it.',
+    '(+ly-directed\'"ie(&folius($on-2+\'baiting+\'induced-&spired+)organized*!.+#the*#al/-+adversarial,#ism,"ly\'$orum',
+    '#\'ponents%\'rtunity#/ressed-minority\'$ion.$)obriously#!s"-resi&oacute;n#\'ichniks"%s.pre$#s01&!2&!3&!4&!5&!6',
+    '##eth#%imath$!n#$onic&&sation#%taele"*t&rehy;out#&/servo#!7#$_out#!a$,l-mechanical$$tive(!s#"ek',
+    '%!s&$-out$!x#)halmology#%ibase$)c-glasses%(al-glass((illusion(*microscope(%parts(\'quality(.reconnaissance(\'storage\')ly-active%)k-glasses',
+    '%#ram$"ka%!s$#lux$!m%\'al-case&$ster&#tes%"em%$ific&\'sations\'"ic("tc)"ic\'"m.',
+    '(*/pessimism(#108\'"t.(*/pessimist(!a%"un$"na%$g-in%!s$%on(s)&\'-owners\'\'writers&$.but&0111&mdash;pi.log(.3&mdash;pi.log',
+    '(.2&mdash;pi.log(.3&mdash;pi.log\'/71&mdash;pi.log\'/80&mdash;pi.log&0211&mdash;pi.log(.2&mdash;pi.log(.3&mdash;pi.log\'/20&mdash;pi.log\'/40&mdash;pi.log\'/81&mdash;pi.log(.2&mdash;pi.log(.3&mdash;pi.log&-al/additional&%istic&(s/routes',
+    '$$phot%#ure$!s%!k$$vite#,o-electrical$#max%$otor$$nics$$phot$"ut#$ulit"#u\'u#0lence/corpulence&)t-looking',
+    '#.s-for-openness$$cula$"fs#"tu"!y!)q&ndash;h"!."!b"!p!(r&euml;l#)mdash;and)$this#,pound;37,500#+thorn;ancum"!\'',
+    '"$+the"!-#$1989#"by#$else$&r-like#%other#"to"$.not#"so##the"+/acceptable##not"#120"$:the',
+    '$#way#"by#"in"+a&scaron;ac#$base#!c$%iones$%le&gt&\'-expert\'.interpretation\')optimised\'\'related(&unning&\'account&#ins',
+    '\'#rly#!d$-our-sur-glane#$flex#%geuse$"na#%hovac#$kwue#\xa0l-aggressive-anal-retentive-come-and-see-me-five-times-a-week-for-years-at-vast-expense-or-how-do-i-know-you\'re-really-committed%$epic%.facial-palatal%$only)#ism%+way-of-life$$dene',
+    '$)ly-active(+dministered\'(educated#&m/boat$!s#*ng-outang/&%utan.*!g%-e&ndash;green\'-rehy;coloured&#(s)&*-and-green+%lemon+-shocking-pink\'&badged',
+    '($lack)%essed($oxes\'(chestnut($rate\'$date\')flavoured(%urred\'$gold(#rey)#ove*$wing\'&haired(#ued\'(liveried',
+    '\'(on-black\'\'painted(#ink\'\'scented(&ellers(\'howered(&kinned(&tained)#ick)&reaked\'&tinted)!p\'%white(%inged&&/black',
+    '\'&matamp&#ady\'"nd&#box&!d&&flower&%juice&$ries&,s-and-lemons(&hooray\'!.&#tip&\'y-brown($pink(#red',
+    '&"st(!s%%y-red\'&yellow$0ienburgerstrasse$!t#!o$!n#!p##que##sid$"je$#ure#!t$"es',
+    '%#on.$$oire%"re&#ial("ns\'%cally&\'y-style%$uris#(user.com"*b&aacute;n#*-arresting$$like$&shaped#"at%!h',
+    '#"ec$$gozo$!m$#nin#%field#$icom$%folds$$gnya$$nson$$ston$"ta&)l-engined\'(ly-paced&$rium%"or',
+    '%"s.&$/min$%virus#"ro"\'c-blade$#men#$adia$#le7#$bane##dom##eau$"in#!h$1&eacute;sographie$*ard-garden',
+    '(\'station\'%leigh\'&s.they(#_in($town&!t$#erd%%sella&)tra-first*#pit)(/bernard*$film*(gardelli*)mackerras*&nelson',
+    '))s/chamber($ions$-id-collectors\'"is\'$like(%oving&)ectomised+!y&%house%&ectomy%"ll#$iano$#nus#)s/goblins#"us',
+    '"&d-hume##.53#!a#(e-browne$&newitz%$ours%&sdores$)r&mdash;a,"no,+telephoning%!-&!.&#are&%based\'*rotherhood',
+    '&$form&*in-council&&keeper&%line\'&$made($kers&$only&%paper\'&icking&&taking&)violation&\'wardens%!.&!i%!/',
+    '&*electronic&&office&*purchasing&0sentence/finding%&ed-off&!r\'!s%\'ing-off%$line&"ye%%ofavg%.s-of-magnitude&".a\'\'between&!/',
+    '$%shook$#ynd#"ie$(naciones&$ires&"ll&%nceto&#rie\'.y&rehy;looking.\'quality((-seeming*#ize-!d&$ting(#on.',
+    '&#vit%"es%!i$#zia#,nance.survey(#man(!s##ora$!s$/vician-silurian##res$!i$"op#!s$#all',
+    '#-yn-nashchokin%%aunce"&e-body$(carrying$\'dresser$%grade$&passes$&sorter$)treatment#\'/gangue#$ades$$mnos%#uno#"bo#"dr',
+    '$\'on-base\'!r\'*washington&$ians&!s&%wheat#!h#%illes#\'jinegro#!l$$eans$!l##mus##nda$)hancement',
+    '##rry#%ships$$teia"$f\'ly#)anotrofio##edd$!s##ila&!t\'&-nizan#\'oleddus#!t$"en"\'g-chart#\'aaniser',
+    '*!s&#sed(!r)!s$%misms$"n\'%\'-blower\'&uilder&&donors\'%riven&"ic\'&zation&#men&$pipe*!s',
+    '(\'easures&(shutters\'$tops&%toned\')ransplant&%works\'&riting%\'/thames%$aire%"dy%$ells%#ic-(%based(#fed(\'looking',
+    '($only($poor(\'stained(&walled\'!a(+lly-managed,(produced\'$ism.\'!k&#ers&\'farming&$gram&!s\'$able($cion',
+    '(.tion&mdash;she,.-international-(oriented-$tree,%.hard,,/azerbaijani-%lobby,#s.8-)/churches\')e&ndash;l(,-it-yourself($d.it("r.)&/guide*,notepad/time',
+    '("n\')\'g-tutor\'+m-crunching("al(!y\'#sed\'+t-conductor(&ations&!x&!z\',a&rehy;tions($dora(/tion&rehy;level,!\',!-',
+    '-*for-itself-$view,l/lean-ness/intensifica&rehy;tion/efficiency/closures/redundancies/relocation-$open,,al-loyalties,,s&mdash;ceoe-&--this\'-e/co-ordinate($r(s))3/activist/motivator%"o-\')chlorines\'\'mercury\'\'nitrate\'$phos',
+    '.#rus\'&silica,"on(&ulphur&(chloride,$nes.((olorines&$iron&&leptic\'&ogical)!y&)metallics&\'soluble\'%ulfur%+s&mdash;was',
+    '&%ation&\'isation&.streitigkeiten$!r$%samed%(mic-goal\'"ng&!o&"us%#tic#!e$)netically#!h#"ia%"st',
+    '\'!s$%nates%#ial$&onated#+nanisations#%oglio$$lini#&reaves##ues$$lous#"y."!h#%estra##oit$"lm',
+    '""ia$(chovitza$\'hovitza$!l#%basos%#tid#"en%!s%"ta\'$cion\'%l-art)#cut)\'looking),megalomaniac)(oriented',
+    ')\'seeming)$type((/islamic(%ische*"ed\'&tion-a+$ally&#eer&"is#-fice-stuffing#,g&rehy;inals$!.$)anisation$(eniosity$+in&rehy;als',
+    '\'+destination&,/destination\'*electronic\')mindscape&"24&!a\'*l&mdash;it("\'s(\'-design)*especially)\'looking(,.horse-drawn(+/innovative("es(!i',
+    ')#ty.+*/invention(!l)*y-proposed\'*t&rehy;ing(#ed.(%or(s)**/recipient&%s-the%&onally)!y%"yn$$n.cl%"al%$inal',
+    '#%juela#1lla&ndash;niagara&!c%"ia#%ngton$\'teering#!o$"ne&$sque%"ii#)s/esquire#"tt""ka#(heisthai#"in',
+    '$"sh#)ney-bound".l&eacute;anism-0s&ndash;bordeaux5%tours.0-bragan&ccedil;a/1panthi&egrave;vre%)grave;ans#$aith$-ndo/kissimmee\'!s%#sky#&eanist&"s-(%based',
+    '#&iaunce$!k#$lwyn#$ogge$)v-vitebsk$&wetsky%#ski"&machea$!l$"nd&$royd&.y/philadelphia%%tayev$!t$"za',
+    '$!d$"na&%/coal$!r%+od/managing\'!s$$sbsy#%isher%)ton-chant#"oc$0lu&ndash;mounted&--and-wedgwood\'%cased\'&inlaid$$ndes',
+    '$"us#$side$#lee$#ton##ulu$(s/ormuzd%!a"%nally$%menta)$lity)%tions$#nce%!s$<te/lucid/vigorous/colloquial%\'ippinis',
+    '$#lli&"us$&ryness$!s%!t#&ithine\'\'schosus&&ogalum($enic\'0logically-minded*"y.+%/basf\'\'philous+!y($tera',
+    '##ois$!t##say")o-genital#&arctic#"ch#%druin#+gen-related&"is\'#tal&,y/regression##hai$)emiarctic#%logio#%maner',
+    '#%nooko$"ya##ogu#.pharyngolarynx$"os%!u#!s$!.$%zlany#\'tundity##und#%ville#%xylum#"ya"!p',
+    '$#hns#\'eration#-h&eacute;nica$\'an-like\'%maker&$eers%$rion%!s$#ean%!e%%linat%$rian$%istes%"us#$iere',
+    '%*gton-based)!s#(oagation"(r/mental$+strathclyde',
 )
@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_65 = (
+count_65 = 6694
+
+heads_65 = (
     'nargothrond',
-    'nari',
-    'nariman',
-    'narino',
-    'narins',
-    'narjes',
-    'narker',
-    'narkily',
-    'narkin\'',
-    'narkomindel',
-    'narlikar',
-    'narmakhonmadi',
-    'narn',
-    'narnia-esque',
-    'narnian',
-    'narocz',
     'naroda',
-    'narodichi',
-    'narodnie',
-    'narodno-trudovoi',
-    'narodny-karabakh',
-    'narodo',
-    'narodu',
-    'narodwe',
-    'narog',
-    'naroshilenko',
-    'narowing',
-    'narowly',
-    'narragansett',
-    'narrare',
-    'narratable',
-    'narratie',
     'narratisation',
-    'narrative&mdash;dramatic',
-    'narrative-cum-worldview',
-    'narrative-discourse-paragraph&rehy;introductory-particle',
-    'narrative-purely',
-    'narratively',
-    'narratives-within-narratives',
-    'narrativization',
-    'narrativizes',
-    'narratized',
-    'narratologically',
-    'narrator-author',
-    'narrator-hero',
-    'narrator-pilgrim',
-    'narrator-reader',
-    'narratorless',
     'narres',
-    'narro',
-    'narrow&ndash;bodied',
-    'narrow&rehy;brimmed',
-    'narrow&rehy;gauge',
-    'narrow&rehy;minded',
-    'narrow-angle',
-    'narrow-backed',
-    'narrow-bodied',
-    'narrow-diameter',
-    'narrow-focus',
-    'narrow-front',
-    'narrow-go-wides',
-    'narrow-headed',
-    'narrow-ish',
-    'narrow-leg',
     'narrow-mouthed',
-    'narrow-ranging',
-    'narrow-room',
-    'narrow-ruled',
-    'narrow-set',
-    'narrow-sided',
-    'narrow-sighted',
-    'narrow-souled',
-    'narrow-stetch',
-    'narrow-stile',
-    'narrow-straight',
-    'narrow-targeted',
-    'narrow-thighed',
-    'narrow-thinking',
-    'narrow-toed',
-    'narrow-tubed',
     'narrow-vision',
-    'narrow-winged',
-    'narrowband',
-    'narrowboat.as',
-    'narrowboating',
-    'narrowly-averted',
-    'narrowly-focussed',
-    'narrowmindedness',
-    'narrows-probably',
-    'narrowshouldered',
-    'narry',
-    'nart',
-    'narte',
-    'narthecium',
-    'narthices',
-    'nartuby',
     'narudon',
-    'naruhito',
-    'naruke',
-    'narula',
-    'narutowicza',
-    'narvekar',
-    'narwal',
-    'narzullo',
-    'nas-based',
-    'nasa-ames',
-    'nasa-owned',
-    'nasa/cnes',
-    'nasa/esa',
-    'nasa/jpl',
-    'nasal-gastric',
-    'nasal-raising',
     'nasal-sounding',
-    'nasal-voiced',
-    'nasal/m',
-    'nasally-unchallenged',
-    'nasariyah',
-    'nasau',
-    'nasch',
-    'nascimur',
-    'nasdim',
-    'naseby-dominated',
-    'naseby.',
-    'nasem',
-    'naseous',
-    'naseriyah',
-    'nasery',
-    'nasgastric',
     'nash\'',
-    'nash-trained',
-    'nash/buckinghamshire',
-    'nash/hereford',
-    'nash/mother-in-law',
-    'nash/orchid',
-    'nash/wife',
-    'nasha',
-    'nashdom',
-    'nashes',
-    'nashishibis',
-    'nashreen',
-    'nashs',
-    'nashta',
-    'nashville-based',
-    'nashy',
     'nasi',
-    'nasicola',
-    'nasif',
-    'nasim&rehy;ul-ghani',
-    'nasiria',
-    'nasirullah',
-    'nasis',
-    'nasium',
-    'nasjonalgalleriet',
-    'nasmu',
-    'naso',
-    'naso&rehy;gastric',
-    'nasotemporal',
-    'naspetti',
-    'nasr-ed-din',
-    'nasralla',
     'nasri',
-    'nasrids',
-    'nass',
-    'nassaburgh',
-    'nassar',
-    'nassau-style',
-    'nassau-weilburg',
-    'nassauvia',
-    'nassb',
-    'nasseef',
-    'nasser-type',
-    'nasserein',
-    'nasserists',
-    'nassfeld',
-    'nassif',
-    'nassington',
     'nassirim',
-    'nassma',
-    'naste',
-    'nastenko',
-    'nasty-minded',
-    'nasty-pasty',
-    'nasty-piece-of-work',
-    'nasty-sounding',
-    'nasty-tempered',
-    'nasty-tongued',
-    'nastybation',
-    'nasuta',
-    'nasw',
-    'naswe',
-    'nat&uuml;rlich',
-    'nat\'ral',
     'nat-west',
-    'nat.mur.',
-    'nat0',
-    'nataatmaja',
-    'natachaba',
-    'natale',
-    'natalekin',
-    'natales',
-    'natalie-jane',
-    'natalit',
-    'nataniel',
-    'natator',
-    'natatorial',
-    'natchez-on-the-hill',
-    'natel',
-    'nath-an',
     'natha',
-    'nathan\'',
-    'nathan-rogers',
-    'nathanial',
-    'nathaniell',
-    'nathansohn',
-    'nathanya',
-    'natherton',
-    'nathwani',
-    'nati',
-    'nating',
-    'natioanl',
-    'nation&mdash;state',
-    'nation-not',
-    'nation-serving',
-    'nation.',
     'nation/oxford',
-    'nation/third',
-    'nation/two',
-    'national-adorned',
-    'national-bound',
-    'national-cultural',
-    'national-international',
-    'national-local',
-    'national-minded',
-    'national-newspaper',
-    'national-oriented',
-    'national-patriot',
-    'national-patriots',
-    'national-security',
-    'national-state',
-    'national-style',
     'national-syndicalist',
-    'national-television',
-    'national-type',
-    'national-unity',
-    'national/cornerstone',
-    'national/cultural',
-    'national/lea',
-    'national/local',
-    'national_up',
-    'nationalan',
-    'nationalbank',
-    'nationale-fln',
-    'nationalis',
-    'nationalism.',
-    'nationalism/national',
-    'nationalist-particularist',
     'nationalist-ruled',
-    'nationalist/unionist',
-    'nationaliste',
-    'nationalistes',
-    'nationalistically-minded',
-    'nationality-based',
-    'nationally-agreed',
-    'nationally-approved',
-    'nationally-centred',
-    'nationally-coordinated',
-    'nationally-defined',
-    'nationally-devised',
-    'nationally-established',
-    'nationally-headquartered',
-    'nationally-minded',
-    'nationally-organised',
     'nationally-organized',
-    'nationally-owned',
-    'nationally-ranked',
-    'nationally.',
-    'nationalpower',
-    'nationalrat&mdash;lower',
-    'nationals.',
-    'nationalsgen',
-    'nationalzeitung',
-    'nationchoice',
-    'nationgalerie',
-    'nationhd',
-    'nations-brokered',
-    'nations-led',
-    'nations-like',
-    'nations-states',
     'nations-to',
-    'nations.change',
-    'nations/united',
-    'nationsbank*',
-    'nationstates',
-    'nationwide-firm',
-    'nationwides',
-    'natitia',
-    'natitingou',
-    'native-indian',
-    'native-language',
-    'native-like',
-    'native-speaking',
-    'native-style',
-    'native-white',
-    'native/non-native',
     'nativeness',
-    'natives.',
-    'nativised',
-    'natland',
-    'natmags',
-    'natmauk',
-    'nato-backed',
-    'nato-europe',
-    'nato-warsaw',
-    'natra',
-    'natrel',
-    'natron-cellulose',
-    'natronatum',
-    'natsagiyn',
-    'natsional\'',
-    'natsuka',
     'natsur',
-    'natterer',
-    'nattheim',
-    'nattie',
-    'nattinger',
-    'natton',
-    'natts',
-    'nattukottai',
-    'natur&rehy;ally',
-    'natur-ally',
-    'natural&rehy;do',
-    'natural\'',
-    'natural-born',
-    'natural-coloured',
-    'natural-enough',
-    'natural-feel',
     'natural-fibre',
-    'natural-fibres',
-    'natural-finished',
-    'natural-law',
-    'natural-like',
-    'natural-resources',
-    'natural/grey',
-    'naturaleza',
-    'naturali',
-    'naturalia',
-    'naturalises',
-    'naturalist-explorer',
-    'naturalist-explorers',
-    'naturalist-passenger',
-    'naturalistic/realistic',
-    'naturalists.orford',
     'naturalizations',
-    'naturally-',
-    'naturally-harmonious',
-    'naturally-lit',
-    'naturally-occuring',
-    'naturally-reared',
-    'naturally-regenerating',
-    'naturalmente',
-    'naturam',
-    'naturans',
-    'naturata',
-    'nature&mdash;secondly&mdash;whether',
-    'nature&rehy;god',
-    'nature-',
-    'nature-coloured',
-    'nature-given',
     'nature-hating',
-    'nature-hong',
-    'nature-identical',
-    'nature-lovers',
-    'nature-made',
-    'nature-malaysia',
-    'nature-printed',
-    'nature-spirits',
-    'nature-study',
-    'nature-trail',
-    'nature-uk',
-    'nature-versus-culture',
-    'nature-writer',
-    'nature-xxxx',
-    'nature/culture',
-    'naturelles',
     'naturels',
-    'naturgeschichte',
-    'naturopath',
-    'naturselbstdruck',
-    'naturvei',
-    'naturwissenschaft',
-    'natus',
-    'natzins',
-    'natzweiler',
-    'nauchny',
-    'nauck',
-    'nauder',
-    'naudi',
-    'naufragar',
-    'nauges',
-    'naught-excluding',
     'naughty-but-nice',
-    'naughty-word',
-    'naughty.',
-    'naughty_in_terms',
-    'nauheim',
-    'naukratis',
-    'naullses',
-    'naumov',
-    'naunet',
-    'naupactus',
-    'naupaktos',
-    'nauplion',
-    'nauroz',
-    'nausating',
-    'nauseate',
-    'nauseates',
     'nauseation',
-    'nauseously',
-    'naushad',
-    'naushki',
-    'nausikaa',
-    'naut',
-    'nautae',
-    'nautic',
-    'nautical-style',
-    'nauticalia',
-    'nautically',
-    'nautika',
-    'nautilused',
-    'nautiluses',
-    'nautt',
-    'nauwara-eliya',
     'nav&mdash;chapter',
-    'nav-aid',
-    'nav-com',
-    'nav-sat',
-    'nav.',
-    'nav/observer',
-    'nav/plotter',
-    'navaar',
-    'navahos',
-    'naval-air',
-    'naval-base',
-    'naval-looking',
-    'navalapitiya',
-    'navalis',
-    'navalist',
-    'navapasham',
     'navaratnam',
-    'navarese',
-    'navarette',
-    'navarious',
-    'navarkhon',
-    'navarrette',
-    'navas',
-    'navcom/autopilot',
-    'nave-ristorante',
-    'nave-roof',
-    'naveen',
-    'naveh',
-    'navel-defluffers',
-    'navel-ill',
-    'navel-lint',
-    'naveli',
     'navenby',
-    'navette',
-    'navexs',
-    'navi',
-    'naviazenya',
-    'navicula',
-    'navigating/surveying',
-    'navigator/bomb-aimer',
-    'navigator/plotter',
-    'navigator/radar',
-    'navigatorium',
-    'navistar',
-    'navli',
-    'navon',
-    'navr&aacute;til',
-    'navratan',
     'navratil',
-    'navroop',
-    'navunisaravi',
-    'navuth',
-    'navvie',
-    'navvy-style',
-    'navy\'',
-    'navy-air',
-    'navy-brat',
-    'navy-coloured',
-    'navy-ink',
-    'navy-run',
-    'navy-schemed',
-    'navy-stores',
-    'navy-trimmed',
-    'navy/marines',
     'navy/scarlet/yellow',
-    'navy1n/a',
-    'navyblue',
-    'naw.',
-    'nawabkot',
-    'nawabzadi',
-    'nawala',
-    'nawch',
-    'nawdc',
-    'nawddach',
-    'nawr',
-    'nawrocki',
-    'nawroz',
-    'nawwaf',
-    'naxers',
-    'naxiades',
     'naxians',
-    'nay-sayers',
-    'nayacakalou',
-    'nayakkar',
-    'nayee',
-    'nayer',
-    'nayera',
-    'nayika',
-    'nayla',
-    'nayle',
-    'naylors',
-    'naypcas',
-    'naypic',
-    'nayuguhora',
-    'naz',
-    'nazar&eacute',
     'nazara',
-    'nazarbayev&lt&dollar',
-    'nazare',
-    'nazareno',
-    'nazaret',
-    'nazarev',
-    'nazarine',
-    'nazario',
-    'nazarite',
-    'nazarvayev',
-    'nazeem',
-    'nazelden',
-    'nazg&uacute;l',
-    'nazgul',
-    'nazi-approved',
-    'nazi-dominated',
     'nazi-hating',
-    'nazi-imposed',
-    'nazi-inspired',
-    'nazi-ism',
-    'nazi-supporters',
-    'nazi-sympathiser',
-    'nazi-type',
-    'nazianzen',
-    'nazify',
-    'naziism',
-    'nazionali',
-    'nazipov',
-    'naziunali',
-    'naziur',
-    'nazli',
-    'nazmir',
     'nazmudin',
-    'nazriyev',
-    'nazti',
-    'nazzareno',
-    'nazzie',
-    'nazzjonalista',
-    'nb.',
-    'nb090143',
-    'nb7',
-    'nbaa',
-    'nbamed',
-    'nbd7',
-    'nbl',
-    'nbot',
-    'nbrf-pir',
-    'nbthere',
     'nbthis',
-    'nbx',
-    'nbx840',
-    'nby',
-    'nc/cnc',
-    'nc1',
-    'nc11043',
-    'nc13347',
-    'nc14932',
-    'nc17368',
-    'nc19904',
-    'nc3&verbar&verbar;a6&verbar&verbar',
-    'nc3458e',
-    'nc4',
-    'nc46v',
-    'nc49v',
     'nc54',
-    'nc54kc',
-    'nc855y',
-    'nc856y',
-    'nc98648',
-    'ncacss',
-    'ncams',
-    'ncb11',
-    'ncbi',
-    'ncc.',
-    'ncc/',
-    'ncc/esrc',
-    'ncca',
-    'nccn',
-    'nccop',
-    'nccp',
     'nccvd',
-    'ncd14c',
-    'ncd15b',
-    'ncd15r',
-    'ncd19c',
-    'ncdt',
-    'nce4',
-    'ncephalitis',
-    'ncet-administered',
-    'ncgs',
-    'nchip',
-    'nchs',
-    'nci-fcrdc',
-    'nci=0.68',
-    'ncia',
-    'ncilchenich',
     'ncindughlassie',
-    'nck',
-    'ncle/baal',
-    'ncmd-affiliated',
-    'ncna',
-    'ncnamara',
-    'ncoi-bamhi',
-    'ncoi-pvuii',
-    'ncoi/saci',
-    'ncoic',
-    'nconclusive',
-    'ncopf',
-    'ncp12',
-    'ncp7:in',
-    'ncp7:rna',
-    'ncp7:template',
     'ncpea',
-    'ncr/adds',
-    'ncrc',
-    'ncss',
-    'ncsy/orthodox',
-    'nct/amway',
-    'nctc2062',
-    'ncts',
-    'ncvoand',
-    'ncvq/scotvec',
-    'nd-isotope',
-    'nd1-nd5',
-    'nd2',
-    'nd3',
-    'nd=0.7219',
-    'ndadaye',
     'ndalatando',
-    'ndarihoranye',
-    'ndaruzaniye',
-    'ndaruzaniyeprimary',
-    'ndaw',
-    'ndayiragije',
-    'ndebele',
-    'ndegwa',
-    'nder',
-    'ndev',
-    'ndia',
-    'ndikumanawomen',
-    'ndioroa',
-    'ndis-',
-    'ndl',
-    'ndlovus',
     'ndluvou',
-    'ndn',
-    'ndn&ndash;1t',
-    'ndoto',
-    'ndow',
-    'ndown',
-    'ndr',
-    'ndragheta',
-    'ndrso/schmidt-isserstedt',
-    'ndsc',
-    'ndsp',
-    'ndsz',
-    'nduka',
-    'ndume',
-    'ndutu',
-    'nduwayo',
     'nduwimanaland',
-    'ndwandwe',
-    'ne&ndash;130',
-    'ne&ndash;sw',
-    'ne&plus',
-    'ne\'erdy',
-    'ne\'ertheless',
-    'ne\'r',
-    'ne+',
-    'ne-',
-    'ne-er',
-    'ne-ne',
-    'ne-neidhart',
-    'ne-sw',
-    'ne/3e',
-    'ne1000',
     'ne11',
-    'ne19',
-    'ne2',
-    'ne26',
-    'ne3',
-    'ne37',
-    'ne39',
-    'ne4&verbar&verbar;bd5&verbar&verbar',
-    'ne49',
-    'ne6+',
-    'ne8',
-    'nea-free',
-    'nea-supported',
-    'neacail',
-    'neacra',
-    'neacsa',
     'neadalla',
-    'neafsey',
-    'neagle-starring',
-    'neagoe',
-    'neagu',
-    'neagus',
-    'neal/hms',
-    'neale/flat',
-    'neale/gp',
-    'neale/president/student',
-    'neale/wye',
-    'neall',
-    'neally',
-    'neamp',
-    'neanderthal-like',
-    'neanderthalensis',
     'neapolitanen',
-    'near&mdash;market',
-    'near&rehy',
-    'near&rehy;despair',
-    'near&rehy;disaster',
-    'near&rehy;disastrous',
-    'near&rehy;duties',
-    'near&rehy;foetal',
-    'near&rehy;revolutionary',
-    'near&rehy;synonym',
-    'near&rehy;synonyms',
-    'near&rehy;unbearable',
-    'near&rehy;unique',
-    'near\'\'',
-    'near-&pound;1',
-    'near-&pound;1.5',
     'near-&pound;1.8',
-    'near-&pound;1m',
-    'near-&pound;5',
-    'near-13',
-    'near-14',
-    'near-15,000',
-    'near-20%',
-    'near-200',
-    'near-24',
-    'near-3',
-    'near-30',
-    'near-34pc',
-    'near-40,000',
-    'near-5',
-    'near-abortion',
-    'near-absence',
     'near-academic',
-    'near-accident',
-    'near-and',
-    'near-antiques',
-    'near-apocalyptic',
-    'near-apoplexy',
-    'near-appropriate',
-    'near-arithmetical',
-    'near-as-damn-it',
-    'near-at-hand',
-    'near-autonomy',
-    'near-bank',
-    'near-basilectal',
-    'near-blackness',
-    'near-blind',
-    'near-blindness',
     'near-boom',
-    'near-breakdown',
-    'near-bribery',
-    'near-brilliance',
-    'near-cadavers',
-    'near-canonical',
-    'near-cash',
-    'near-catastrophic',
-    'near-certainties',
-    'near-chaos',
-    'near-clean',
-    'near-coastal',
-    'near-comprehension',
-    'near-contemporaries',
-    'near-continent',
-    'near-crash',
     'near-daily',
-    'near-darwinist',
-    'near-death-',
-    'near-definitive',
-    'near-degenerate',
-    'near-deification',
-    'near-deified',
-    'near-delirious',
-    'near-demented',
-    'near-demonic',
-    'near-dictatorial',
-    'near-dipolar',
-    'near-disintegration',
-    'near-dismissal',
-    'near-distance',
-    'near-distant',
     'near-dormitory',
-    'near-drought',
-    'near-drowned',
-    'near-drownings',
-    'near-endemic',
-    'near-equals',
-    'near-equi-status',
-    'near-equity',
-    'near-equivalence',
-    'near-equivalent',
-    'near-escape',
-    'near-establishment',
-    'near-excellent',
-    'near-exclusive',
-    'near-extinct',
-    'near-fainting',
     'near-family',
-    'near-famous',
-    'near-farcical',
-    'near-feudal',
-    'near-fluorescent',
-    'near-flush',
-    'near-foreleg',
-    'near-forgiving',
-    'near-fourfold',
-    'near-foveal',
-    'near-frantic',
-    'near-fratricidal',
-    'near-front',
-    'near-geometric',
-    'near-ghetto',
-    'near-hagiography',
     'near-handsomeness',
-    'near-heroic',
-    'near-homicidal',
-    'near-homophone',
-    'near-horizon',
-    'near-horizontal',
-    'near-hysteria',
-    'near-identity',
-    'near-idleness',
-    'near-images',
-    'near-immortal',
-    'near-impassable',
-    'near-impenetrable',
-    'near-inarticulate',
-    'near-incarceration',
-    'near-incoherent',
     'near-incredulity',
-    'near-independent',
-    'near-indian',
-    'near-indifference',
-    'near-industrial',
-    'near-inedible',
-    'near-inextricable',
-    'near-inflationary',
-    'near-instant',
-    'near-instantaneous',
-    'near-integrity',
-    'near-interminable',
-    'near-invincible',
-    'near-invisibility',
-    'near-invisible',
-    'near-irreverent',
     'near-knackered',
-    'near-landlocked',
-    'near-legendary',
-    'near-level',
-    'near-line',
-    'near-linear',
-    'near-linearity',
-    'near-literal',
-    'near-live',
-    'near-magical',
-    'near-marxist',
-    'near-masterpiece',
-    'near-maximal',
-    'near-mediterranean',
-    'near-meeting',
-    'near-metamorphic',
     'near-monastic',
-    'near-monominerallic',
-    'near-monospecific',
-    'near-monster',
-    'near-net',
-    'near-nightmare',
-    'near-novels',
-    'near-nuclear',
-    'near-obscurity',
-    'near-optimum',
-    'near-pacifist',
-    'near-parental',
-    'near-passion',
-    'near-pathological',
-    'near-peak',
-    'near-permanent',
     'near-perpendicular',
-    'near-persecution',
-    'near-pink',
-    'near-priceless',
-    'near-printing',
-    'near-profile',
-    'near-puppet',
-    'near-pure',
-    'near-quarrel',
-    'near-rebellion',
-    'near-relation',
-    'near-relative',
-    'near-replica',
-    'near-residual',
-    'near-restriction',
-    'near-reunion',
     'near-reverence',
-    'near-revolutionary',
-    'near-room-temperature',
-    'near-ruin',
-    'near-ruined',
-    'near-ruins',
-    'near-sacred',
-    'near-sacrilege',
-    'near-saints',
-    'near-satanic',
-    'near-senile',
-    'near-sensational',
-    'near-shapeless',
-    'near-shaven',
-    'near-silent',
-    'near-similar',
     'near-simultaneity',
-    'near-site',
-    'near-six',
-    'near-smile',
-    'near-sobbing',
-    'near-solitude',
-    'near-space',
-    'near-specific',
-    'near-spherical',
-    'near-square',
-    'near-stagnant',
-    'near-stagnation',
-    'near-standard',
-    'near-still',
-    'near-straight',
-    'near-stranger',
     'near-strangling',
-    'near-submission',
-    'near-suburban',
-    'near-suicidal',
-    'near-supporting',
-    'near-synonyms',
-    'near-teenage',
-    'near-tender',
-    'near-terrorist',
-    'near-the-knuckle',
-    'near-threshold',
-    'near-to',
-    'near-to-hand',
-    'near-to-the-soil',
-    'near-toothless',
-    'near-top',
     'near-touchable',
-    'near-transparent',
-    'near-triggering',
-    'near-tropical',
-    'near-twice',
-    'near-two',
-    'near-typeset',
-    'near-ultraviolet',
-    'near-unanimity',
-    'near-unconscious',
-    'near-universality',
-    'near-upright',
-    'near-vagrancy',
-    'near-victim',
-    'near-victory',
-    'near-virgin',
     'near-wagnerian',
-    'near-war',
-    'near-wellbore',
-    'near-worthless',
-    'near-zero',
-    'near/far',
-    'nearer_,_nearer_to',
-    'neargrounds',
-    'neari',
-    'nearin\'',
-    'nearl',
-    'nearly-bald',
-    'nearly-black',
-    'nearly-clothed',
-    'nearly-complete',
-    'nearly-completed',
     'nearly-elegant',
-    'nearly-exposed',
-    'nearly-flying',
-    'nearly-full',
-    'nearly-invisible',
-    'nearly-kiss',
-    'nearly-legendary',
-    'nearly-pure',
-    'nearly-right',
-    'nearly-silence',
-    'nearly-silences',
-    'nearly-square',
-    'nearly-steaming',
-    'nearly-total',
-    'nearmonopoly',
-    'nearnesses',
     'nearsightedly',
-    'neartime',
-    'nearula',
-    'nearverbatim',
-    'neason',
-    'neat-boned',
-    'neat-cut',
-    'neat-growing',
-    'neat-houses',
-    'neat-safe-looking',
-    'neat-trimmed',
-    'neate-stidson',
-    'neatening',
-    'neath-based',
-    'neath-born',
-    'neath/pontrhydyfen',
     'neath/tonna',
-    'neath34',
-    'neatly&rehy;clipped',
-    'neatly&rehy;set',
-    'neatly-belted',
-    'neatly-bound',
-    'neatly-brushed',
-    'neatly-buttoned',
-    'neatly-chopped',
-    'neatly-coiffed',
-    'neatly-dovetailed',
-    'neatly-featured',
-    'neatly-kept',
-    'neatly-pressed',
-    'neatly-stacked',
-    'neatly-taken',
     'neatly-trimmed',
-    'neatly-typed',
-    'neatly-worked',
-    'neatly-written',
-    'neats',
-    'neats-foot',
-    'neatwork',
-    'neau',
-    'neaufles',
-    'neaum',
-    'neauphle-le-ch&acirc;teau',
-    'neave/medical',
-    'neaves',
-    'nebbishes',
-    'nebeker',
-    'nebel',
     'nebeng&ouml;tter',
-    'neblagonadezhnye',
-    'neblett',
-    'nebmare',
-    'nebout',
-    'nebphetyre',
-    'nebraska-born',
-    'nebraskan',
-    'nebss',
-    'nebuchadnezzer.',
-    'nebuchanezzar',
-    'nebuhaler',
-    'nebulance',
-    'nebularia',
-    'nebulas',
-    'nebulee.',
     'nebulisation',
-    'nebulisers',
-    'nebulising',
-    'nebulizer',
-    'nebulosities',
-    'nebulousness',
-    'nec-funded',
-    'nec-manufactured',
-    'nec.',
-    'nec/birmingham',
-    'nec/mips',
-    'nec/oai',
-    'neca',
-    'necare',
-    'necarne',
-    'necati',
     'neccessitate',
-    'neccessity',
-    'necchi-ghiri/unemployed',
-    'necci',
-    'neccriminal',
-    'neccssytyes',
-    'neces-sary',
-    'necessar',
-    'necessaree',
-    'necessarily&ndash;literally',
-    'necessarily_in',
-    'necessarium',
-    'necessary-and',
-    'necessary.',
-    'necessaryin',
-    'necessement',
     'necessi&rehy;tate',
-    'necessitat&lsqb;ed&rsqb',
-    'necessitated.',
-    'necessities.',
-    'necessity-relations',
-    'necessity.',
-    'necetur',
-    'nechacv',
-    'nechansky',
-    'nechayev-maltsev',
-    'nechiporenko',
-    'nechirvan',
-    'nechtain',
-    'necip',
-    'neck&rehy;ghostly',
-    'neck-amphorae',
     'neck-aways',
-    'neck-band',
-    'neck-binding',
-    'neck-bone',
-    'neck-bow',
-    'neck-breaking',
-    'neck-chain',
-    'neck-chains',
-    'neck-cloths',
-    'neck-edging',
-    'neck-fur',
-    'neck-hairs',
-    'neck-lock',
-    'neck-mounted',
-    'neck-muscles',
-    'neck-ornaments',
     'neck-plate',
-    'neck-reining',
-    'neck-ruff',
-    'neck-shaft',
-    'neck-side',
-    'neck-strain',
-    'neck-strap',
-    'neck-stretching',
-    'neck-stump',
-    'neck-support',
-    'neck-thrusting',
-    'neck-ties',
-    'neck-to-ankle',
-    'neck-to-headstock',
-    'neck-to-nothing',
-    'neck-top',
     'neck-up',
-    'neck-veins',
-    'neck.',
-    'neck.with',
-    'neck/action',
-    'neck/chin',
-    'neck/throat',
-    'neckam',
-    'neckarstadion',
-    'neckarwestheim',
-    'neckbrace',
-    'neckcare',
-    'neckchain',
-    'neckchains',
-    'neckchops',
-    'neckcloths',
     'necke',
-    'necked-down',
-    'neckf&mdash;ers',
-    'neckful',
-    'neckfur',
-    'neckhole',
-    'necklace\'',
-    'necklacing',
-    'neckroll',
-    'neckstrap',
-    'neckverse',
-    'neckweed',
-    'necligence',
-    'necpwa',
-    'necro-cannibal',
-    'necro-sadism',
     'necrolysis',
-    'necronomon',
-    'necrophaga',
-    'necrophile',
-    'necrophilic',
-    'necrophilically',
-    'necropolistic',
-    'necropsy-proven',
-    'necrosanct',
-    'necroscope',
-    'necrotoxic',
-    'necrotoxin',
-    'necrotrivia',
-    'nect\'rins',
-    'necta',
-    'nectar-',
     'nectar-and-pollen',
-    'nectar-collecting',
-    'nectar-eating',
-    'nectar-laden',
-    'nectar-robbers',
-    'nectar-seeking',
-    'nectar-spurs',
-    'nectar-thieves',
-    'nectar.filled',
-    'nectared',
-    'nectarinia',
-    'nectaroscordum',
-    'nectary',
-    'nectocariids',
-    'nectophrynoides',
-    'nector',
     'nectorines',
-    'nectosis',
-    'neculai',
-    'nedbank',
-    'nederburg',
-    'nederhutte',
-    'nederkoorn',
-    'nederland&mdash;cpn',
-    'nederlanden',
-    'nedermolen',
-    'nedev',
-    'nedith',
-    'nedjelja',
-    'nedjeljna',
-    'nedo/msc/bim',
-    'nedrick',
     'neds-by-numbers',
-    'neds-ish',
-    'neds/mc4',
-    'nedwick',
-    'nee-',
-    'neebin',
-    'neebor',
-    'neebors',
-    'neecct',
-    'need\'st',
-    'need\'t',
-    'need-',
-    'need-assessor',
-    'need-driven',
-    'need-fire',
-    'need-food',
     'need-meeters',
-    'need-meeting',
-    'need-of',
-    'need-orientated',
-    'need-oriented',
-    'need-reducing',
-    'need-related',
-    'need-to-be-paid',
-    'need-to-have',
-    'need/dare',
-    'need/luxury',
-    'need/want',
-    'need_a',
-    'need_at',
-    'needabed',
-    'needed&mdash;see',
     'needham/roller',
-    'needhams',
-    'neediness',
-    'needle&rehy;like',
-    'needle-beds',
-    'needle-case',
-    'needle-fine',
-    'needle-grass',
-    'needle-heads',
-    'needle-knofe',
-    'needle-leaves',
-    'needle-pistol',
-    'needle-pointed',
-    'needle-shaped',
-    'needle-sharing',
-    'needle-slim',
     'needle-tailed',
-    'needle-thins',
-    'needle-tips',
-    'needle-type',
-    'needle-weed',
-    'needle-work',
-    'needlepoints',
-    'needlepunch',
-    'needles.',
-    'needles.aids',
-    'needlessness',
-    'needlestripe',
-    'needleworker',
-    'needn',
-    'needna\'',
-    'needs-',
     'needs-analysis',
-    'needs-focused',
-    'needs-meeting',
-    'needs-oriented',
-    'needs-related',
-    'needs.9',
-    'needs/abilities',
-    'needs/access',
-    'needs/goals',
-    'needs/problems',
-    'needs/who',
-    'needs:the',
-    'neeeeeedddd',
-    'neef',
-    'neek',
-    'neels',
     'neem-based',
-    'neeman',
-    'neemrana',
-    'neenht',
-    'neered',
-    'neerhout',
-    'neerijsen',
-    'neeruam',
-    'nees',
-    'neesden',
-    'neesha',
-    'neesick',
-    'neeskens',
-    'neesons',
-    'neete',
-    'neev',
     'neeva',
-    'neez',
-    'nefa-c',
-    'nefamostat',
-    'nefanda',
-    'nefandi',
-    'nefertite',
-    'nefo',
-    'nefos',
-    'nefs',
-    'nefyews',
-    'nefzawi',
-    'neg-like',
-    'neg.i',
-    'nega-volt',
-    'negadi',
     'negale',
-    'negarty',
-    'negat',
-    'negateable',
-    'negative-energy',
-    'negative-g',
-    'negative-reinforcement',
-    'negative-sloping',
-    'negative-work-hours',
-    'negative/',
-    'negative/unfavourable',
-    'negative_in',
-    'negatives&mdash;yellow',
-    'negativity.',
-    'negator',
-    'negatory',
     'negawatts',
-    'negentropic',
-    'negere',
-    'neghme',
-    'negible',
-    'negidal',
-    'negidals',
-    'negigence',
-    'negitable',
-    'neglected-looking',
-    'neglected.',
-    'neglection',
-    'negli',
-    'negliable',
-    'neglible',
-    'neglig&eacute',
     'negligable',
-    'negligence-latent',
-    'negligence-personal',
-    'negligence-structural',
-    'negligence.clauses',
-    'negligence.decisions',
-    'negligence.in',
-    'negligences',
-    'negligent.',
-    'negligent.the',
-    'negligibility',
-    'negligible&mdash;and',
-    'negm',
-    'nego',
-    'negociants',
-    'negociate',
     'negociated',
-    'negociation',
-    'negocios',
-    'negotating',
-    'negotiat',
-    'negotiated.',
-    'negotiatins',
-    'negotiation&mdash;even',
-    'negotiations-wise',
-    'negotiatior',
-    'negotiator/',
-    'negotiator/interpreter',
-    'negotium',
-    'negovanovic',
-    'negram',
-    'negreiros',
     'negreni',
-    'negres',
-    'negresse',
-    'negret',
-    'negrete',
-    'negrito',
-    'negritoiu',
-    'negro-quiagara',
-    'negrophobe',
-    'negros-based',
-    'negru',
-    'negue',
-    'neguib',
-    'neguibe',
-    'negus/union',
-    'neguse',
     'negys',
-    'neh.',
-    'nehari',
-    'nehemial',
-    'neher',
-    'nei/abb',
-    'neibel',
-    'neice',
-    'neider',
-    'neidhardt',
-    'neifer',
-    'neigbours',
-    'neigh&rehy;bourhood',
-    'neighbour&rehy;liness',
-    'neighbour\'s',
-    'neighbour-joining',
     'neighbour-ocean',
-    'neighbour-states',
-    'neighbour/cousin/friend',
-    'neighbourhood-',
-    'neighbourhood-council',
-    'neighbourhood-level',
-    'neighbourhood-thanks',
-    'neighbourhood-watch',
-    'neighbouring-group',
-    'neighbours/pwl',
-    'neighbours/square',
-    'neighbourship',
-    'neighbr',
-    'neight',
-    'neigther',
-    'neilan',
     'neilands',
-    'neild/water',
-    'neill/chief',
-    'neill/worker',
-    'neills',
-    'neilly',
-    'neilsen/clean',
-    'neilsen/oxford',
-    'neilson-tivoli',
-    'neilson/clean',
-    'neilsons',
-    'neilstown',
-    'neily',
-    'neimark',
-    'neish',
-    'neish/glasgow',
     'neisseriae',
-    'neisserian',
-    'neitrophils',
-    'neitsa',
-    'neiva',
-    'neizvestnyy',
-    'nejat',
-    'nejia',
-    'nek',
-    'nekeer',
-    'nekemte',
-    'nekrassov',
-    'nekropolis',
-    'nektar',
-    'nekyon',
-    'nekzad',
     'nel/neu',
-    'nelder',
-    'nelder/gloucestershire',
-    'neldoreth',
-    'nelida',
-    'neligan',
-    'neligh',
-    'nelion-batian',
-    'nelkar',
-    'nell\'arte',
-    'nell\'infarcto',
-    'nell\'italia',
-    'nell-breuning',
-    'nell.',
-    'nellee',
-    'nelles',
     'nellie-know-all',
-    'nellie.',
-    'nelligan',
-    'nello',
-    'nellore',
-    'nelme',
-    'nelmes/father',
-    'nelmes/mother',
-    'nelmes/speeding',
-    'nelp',
-    'nelsey',
-    'nelson-smith',
-    'nelson/aea',
-    'nelson/producer',
-    'nelson/publisher',
-    'nelson/renzi',
     'nelsonian',
-    'neltino',
-    'nemain',
-    'nemanthias',
-    'nematicides',
-    'nematobrycon',
-    'nematode-infested',
-    'nematollah',
-    'nematomorphs',
-    'nematzadeh',
-    'neme',
-    'nemea',
-    'nemerocallis',
-    'nemerous',
-    'nemerov',
-    'nemertean',
     'nemerteans',
-    'nemertine',
-    'nemesia',
-    'nemesias',
-    'nemesius',
-    'nemesk&uuml;rty',
-    'nemestrinae',
-    'nemetin',
-    'nemi-like',
-    'nemica',
-    'nemin',
-    'nemine',
-    'nemitsas',
-    'nemois',
-    'nemone',
-    'nemophila',
     'nemoralis',
-    'nemorosa',
-    'nempnett',
-    'nemus',
-    'nemzet',
-    'nence',
-    'nenda',
-    'nendick',
-    'nenet',
-    'nenia',
-    'nennen',
-    'nennie',
-    'nennius',
-    'nensey',
-    'nensorb',
-    'nent',
     'nenthorn',
-    'nentori',
-    'nenuphars',
-    'neo&rehy;natal',
-    'neo&rehy;platonic',
-    'neo-agrarians',
-    'neo-alpine',
-    'neo-angular',
-    'neo-aristotelians',
-    'neo-basque',
-    'neo-behaviourist',
-    'neo-benjaminian',
-    'neo-biblical',
-    'neo-bolshevik',
-    'neo-bolshevism',
-    'neo-capitalist',
     'neo-celtic',
-    'neo-celticism',
-    'neo-chinese',
-    'neo-classicists',
-    'neo-colonialists',
-    'neo-colour',
-    'neo-confucianism',
-    'neo-constructivist',
-    'neo-corinthian',
-    'neo-corporatist',
-    'neo-dadaism',
-    'neo-dadaist',
-    'neo-darwinist',
-    'neo-demagogues',
-    'neo-dictatorship',
-    'neo-disco',
     'neo-doric',
-    'neo-duvalierist',
-    'neo-edwardian',
-    'neo-egyptian',
-    'neo-elizabethan',
-    'neo-europes',
-    'neo-evolutionist',
-    'neo-expressionists',
-    'neo-fascim',
-    'neo-functionalism',
-    'neo-functionalist',
-    'neo-fundamentalism',
-    'neo-georgians',
-    'neo-gothicized',
-    'neo-grammarian',
-    'neo-grammarians',
     'neo-grammatical',
-    'neo-grecian',
-    'neo-greek',
-    'neo-hardcore',
-    'neo-hasidic',
-    'neo-hegelism',
-    'neo-hittite',
-    'neo-imperial',
-    'neo-impressionists',
-    'neo-industrial',
-    'neo-internationalist',
-    'neo-isolationists',
-    'neo-janis',
-    'neo-kantian',
-    'neo-kantianism',
-    'neo-keynesians',
     'neo-liberals',
-    'neo-magrittian',
-    'neo-malthusians',
-    'neo-manichaean',
-    'neo-marxian',
-    'neo-mccarthyite',
-    'neo-modal',
-    'neo-modern',
-    'neo-modernists',
-    'neo-mughal',
-    'neo-mythic',
-    'neo-nashville',
-    'neo-nationalism',
-    'neo-nationalist',
-    'neo-nativity',
-    'neo-nazarean',
     'neo-nazi/skinhead',
-    'neo-neo',
-    'neo-neo-realist',
-    'neo-nineteenth',
-    'neo-opera',
-    'neo-orthodox',
-    'neo-orweliian',
-    'neo-palatial',
-    'neo-petrarchan',
-    'neo-plasticism',
-    'neo-platonic',
-    'neo-platonist',
-    'neo-pluralism',
-    'neo-programming',
-    'neo-psychedelic',
-    'neo-psychoanalytic',
     'neo-punks',
-    'neo-ravel/poulencian',
-    'neo-realist',
-    'neo-reptiles',
-    'neo-roman',
-    'neo-scholastic',
-    'neo-scholastique',
-    'neo-seder',
-    'neo-sinecure',
-    'neo-skinhead',
-    'neo-socialism',
-    'neo-stravinskian',
-    'neo-suedehead',
-    'neo-surrealist',
-    'neo-thominst',
-    'neo-thomism',
     'neo-thomist',
-    'neo-thug',
-    'neo-traditionalists',
-    'neo-tyrolean',
-    'neo-universal',
-    'neo-utilitarian',
-    'neo-velikovskians',
-    'neo-walarasian',
-    'neo-walrasian',
-    'neo-weberians',
-    'neo-xxxx',
-    'neo-yuppie',
-    'neo-zionism',
-    'neo-zionists',
-    'neoadjuvant',
-    'neoarsphenamine',
     'neoascaris',
-    'neobouillabaisse',
-    'neocapitalist',
-    'neocatastrophism',
-    'neocatastrophist',
-    'neochromis',
-    'neoclassic',
-    'neoclassicismo',
-    'neocolony',
-    'neocolors',
-    'neoconservatism',
-    'neocortices',
-    'neodamodeis',
-    'neodymium-143',
-    'neoelitism',
-    'neofascist',
     'neofelis',
-    'neogel',
-    'neogrammarian',
-    'neogrowth',
-    'neogtiated',
-    'neoliberalism',
-    'neoliberals',
-    'neolie',
-    'neomarxist',
-    'neomorphic',
-    'neomorphosed',
-    'neomucisa',
-    'neomucosa',
-    'neon-bright',
-    'neon-pink',
-    'neon-shrouded',
     'neon-sign',
-    'neon-signs',
-    'neon-tinted',
-    'neonatologist',
-    'neonatologists',
-    'neonatology',
-    'neonfair',
-    'neonomianism',
-    'neontic',
-    'neopastel',
-    'neopathetisches',
-    'neopentenyl-glycolsuccinate',
-    'neopetrolistes',
-    'neophobic',
-    'neophron',
-    'neoplasticism',
     'neopostdeconstructionism',
-    'neoprene-clad',
-    'neoprene/lycra',
-    'neoprine',
-    'neoptolemus',
-    'neorealism',
-    'neorectum',
-    'neos',
-    'neosilicates',
-    'neosphere',
-    'neostrongylus',
-    'neostructural',
-    'neostymine',
-    'neotenic',
-    'neoteropi&iuml;a',
-    'neovascularization',
     'neovasculature',
-    'nepal-india',
-    'nepal-pakistan',
-    'nepal.after',
-    'nepantha',
-    'nepatali',
-    'nepatic',
-    'nepenthe',
-    'nepenthes',
-    'nepenthicola',
-    'nepenthics',
-    'nepetas',
-    'neph',
-    'nephelauxetic',
-    'nephele',
-    'nephew-made-good',
     'nephrite.26',
-    'nephritic',
-    'nephroid',
-    'neplyuev',
-    'nepo-idols',
-    'nepotistically',
-    'nepp-plus',
-    'neppe',
-    'nepstadion',
-    'neptunes',
-    'neptunians',
-    'neqrita',
-    'nequissimum',
-    'ner&oacute',
-    'nerabus',
-    'nerbudda',
     'nerc/serc',
-    'nerckenrath',
-    'nerd-speak',
-    'nerdo',
-    'nerdrum',
-    'nereabolls',
-    'nered',
-    'nereditski',
-    'nereo',
-    'neretljani',
-    'neretvanski',
-    'nerfs',
-    'nerg',
-    'nergina',
-    'nerida',
-    'nerines',
     'nerja',
-    'nerk',
-    'nermeen',
-    'nernstian',
-    'nero\'',
-    'nero/thabor',
-    'neroc',
-    'neronianum',
-    'neronic',
-    'nertchinsk',
-    'nerts',
-    'nervaux',
-    'nerve&rehy;centre',
-    'nerve&rehy;racking',
-    'nerve-blocker',
-    'nerve-breaking',
     'nerve-cell',
-    'nerve-cells',
-    'nerve-cluster',
-    'nerve-convulsing',
-    'nerve-damaging',
-    'nerve-eating',
-    'nerve-ends-shredded-into-mulch',
-    'nerve-fraying',
-    'nerve-frazzled',
-    'nerve-free',
-    'nerve-grating',
-    'nerve-muscle',
-    'nerve-nets',
-    'nerve-points',
-    'nerve-racked',
-    'nerve-rackingly',
     'nerve-rasping',
-    'nerve-root',
-    'nerve-shatteringly',
-    'nerve-shredder',
-    'nerve-shredding',
-    'nerve-specific',
-    'nerve-stimulators',
-    'nerve-storming',
-    'nerve-tearing',
-    'nerve-tips',
-    'nerve-tree',
-    'nerve-wasting',
-    'nerve-wracked',
-    'nerve-wrecking',
-    'nervebreakers',
-    'nerveglove',
     'nerves&mdash',
-    'nerves.',
-    'nervetonine',
-    'nervewracking.',
-    'nervi',
-    'nervii',
-    'nerviness',
-    'nervo',
-    'nervous-making',
-    'nervous-system',
-    'nervous-systems',
-    'nervous/alluring/self-obsessed',
-    'nervous/excited',
-    'nervous/hiding',
-    'nervoused',
-    'nervously\'',
     'nervousness.',
-    'nervus',
-    'nerw',
-    'nesaf',
-    'nesbitt-dufort',
-    'nesbitt/oxford',
-    'nesbyen',
-    'nescessarie',
-    'nesciendi',
-    'nesciens',
-    'nese',
-    'neser/organiser',
-    'nesham',
-    'neshat',
-    'nesin',
-    'nesitanebasher',
     'nesjar',
-    'nesko',
-    'nespray',
-    'nesquick',
-    'nessameiek',
-    'nessessary',
-    'nessiephant',
-    'nessiteras',
-    'nesslau',
-    'nessler',
-    'nessuno',
-    'nessus-shirt',
-    'nest&lsqb;s&rsqb',
-    'nest&rehy;building',
-    'nest&rehy;cleaning',
-    'nest-',
     'nest-bound',
-    'nest-cup',
-    'nest-eggs',
-    'nest-feathering',
-    'nest-holes',
-    'nest-keeping',
-    'nest-owner',
-    'nest-to-be',
-    'nest/kobe',
-    'nestbox',
-    'nestbox.',
-    'nestbreeding',
-    'nestbuilding',
-    'nestegg',
-    'nestel',
-    'nester.',
     'nesting-boxes',
-    'nestl',
-    'nestl&eacute/rowntree',
-    'nestle-rowntree',
-    'nestle-rowntrees',
-    'nestle/1',
-    'nestled_near',
-    'nestmate',
-    'nestorianism',
-    'nestorians',
-    'nests.',
-    'nesty',
-    'net-',
-    'net-asset',
-    'net-bound',
-    'net-catching',
     'net-caught',
-    'net-cord',
-    'net-coverings',
-    'net-cubed',
-    'net-curtain',
-    'net-curtained',
-    'net-infested',
-    'net-men',
-    'net-of-benefit',
-    'net-pc',
-    'net-time',
-    'net-to',
-    'net-widening',
-    'net-working',
-    'net-works',
-    'net/master',
     'net/pod',
-    'netanya',
-    'netasinghe',
-    'netbench',
-    'netbios-compliant',
-    'netbioses',
-    'netbulletin',
-    'netclass',
-    'netdirector/vna',
-    'nete',
-    'netflex',
-    'netgateway',
-    'netgroup',
-    'neth',
-    'nethalide',
-    'nether-regions',
     'nether-ward',
-    'nether-world',
-    'netheravon',
-    'nethercoat/rspb',
-    'nethercot',
-    'nethercott/cherwell',
-    'netherhose',
-    'netherlands--each',
-    'netherlands-chaired',
-    'netherlands-led',
-    'netherlends',
-    'nethermill',
-    'netherne',
-    'nethers',
-    'netherseale',
-    'netherthong',
     'netherthwaite',
-    'netherud',
-    'netherwaite',
-    'netherwent',
-    'netifa',
-    'netka',
-    'netlab/manager',
-    'netlib',
-    'netmake',
-    'netman',
-    'netminder',
-    'netoeducation',
-    'netol',
-    'netport',
-    'netprint',
-    'netrasess',
     'netrenderman',
-    'netrix',
-    'netrope',
-    'netsai',
-    'netsky',
-    'netsman',
-    'netsmen',
-    'netsova',
-    'netstation',
-    'netsukes',
-    'nettas',
-    'netties',
-    'nettingall',
-    'nettings',
-    'nettle-clearing',
-    'nettle-rash(urticaria)',
     'nettle-stings',
-    'nettle/tractor',
-    'nettlebed/oxfordshire',
-    'nettleford',
-    'nettlesome',
-    'nettlestead',
-    'nettletup',
-    'nettows',
-    'nettwork',
-    'netview/pc',
-    'netware-ready',
-    'netware-to-lon',
-    'netware/flex',
-    'netwise-sun',
-    'netwise/sun',
-    'network-affiliated',
     'network-and',
-    'network-building',
-    'network-centric',
-    'network-enabled',
-    'network-enabling',
-    'network-fed',
-    'network-formation',
-    'network-layer',
-    'network-operators',
-    'network-specific',
-    'network-to-pabx',
-    'network.e/c',
-    'network.so',
-    'network/',
-    'network/transport',
-    'networkable',
     'networkers',
-    'networkfiles',
-    'networking.windows',
-    'networking/cohesion/coordination',
-    'networks-which',
-    'networks.microsoft',
-    'networks.the',
-    'networks/relarn',
-    'networkstation',
-    'networky',
-    'netwware',
-    'netzarim',
-    'netze',
-    'netzler',
-    'netzleragriculture',
-    'neu-isenburg',
     'neubarth',
-    'neubaten',
-    'neubau',
-    'neucleus',
-    'neue-galerie',
-    'neuengamme',
-    'neufahrn',
-    'neufahrwasser',
-    'neufchatel',
-    'neuflize',
-    'neugekr&ouml;nten',
-    'neugraben',
-    'neugroschel',
-    'neuhys',
-    'neuilly/seine',
-    'neukolln',
     'neukom',
-    'neuman',
-    'neumanns',
-    'neumark',
-    'neums',
-    'neunherze',
-    'neunten',
-    'neuraker',
-    'neural-',
-    'neural-driven',
-    'neural-specific',
-    'neural-tube',
-    'neuralgias',
-    'neurally',
-    'neurectoderm',
-    'neuregulin',
     'neurere',
-    'neurite',
-    'neuro-',
-    'neuro-anatomical',
-    'neuro-consciousness',
-    'neuro-degenerative',
-    'neuro-disruptor',
-    'neuro-electrical',
-    'neuro-linguistic',
-    'neuro-muscular',
-    'neuro-physiology',
-    'neuro-psychiatric',
-    'neuro-radiologist',
-    'neuro-sciences',
-    'neuro-surgical',
-    'neuro-symbolic',
     'neuro-toxin',
-    'neuro-transmission',
-    'neuroanatomists',
-    'neurobiologies',
-    'neuroblast',
-    'neuroblasts',
-    'neurochemist',
-    'neurochemistry/neurophysiology/neuropharmacology',
-    'neurocranker',
-    'neurodepressant',
-    'neurodevelopmental',
-    'neuroectoderm-derived',
-    'neuroelectric',
-    'neuroens',
-    'neurofibromas',
-    'neurofibromatosis',
     'neurofilaments',
-    'neurohaemal',
-    'neuroimmune',
-    'neuroinvasiveness',
-    'neuroligists',
-    'neurolinguistic',
-    'neuromas',
-    'neuromast',
-    'neuromodulation',
-    'neuron&mdash',
-    'neuron-free',
-    'neuron-friendly',
-    'neuron-glial',
-    'neuron-line',
-    'neuronally',
-    'neuropathogenesis',
     'neuropathological',
-    'neuropathologically',
-    'neuropathologist',
-    'neuropaths',
-    'neuropharmacologic',
-    'neuropharmacological',
-    'neurophil',
-    'neurophysical',
-    'neuropilar',
-    'neuropogon',
-    'neuroprotective',
-    'neuropsychologically',
-    'neuropsychologist',
-    'neuroptera',
-    'neuropteris',
-    'neuroregulatory',
     'neurosecretory',
-    'neurot',
-    'neuroticus',
-    'neurotoxicological',
-    'neurotrope',
-    'neurovascular',
-    'neurtophils',
-    'neuse',
-    'neusidler',
-    'neusiedel',
-    'neusiedl',
-    'neuste',
-    'neustettin',
-    'neustift',
-    'neususs',
-    'neut.',
     'neutered.',
-    'neuterism',
-    'neuthere',
-    'neuto',
-    'neutragena',
-    'neutragone',
-    'neutral-current',
-    'neutral-flavoured',
-    'neutral-free',
-    'neutral-umpire',
-    'neutralisation-provocation',
-    'neutralistion',
-    'neutrality&mdash;is',
-    'neutralizations',
-    'neutrally-minded',
-    'neutre',
     'neutrient',
-    'neutrik',
-    'neutrino-catching',
-    'neutrino.',
-    'neutrionor',
-    'neutromed',
-    'neutron-',
-    'neutron.',
-    'neutronium',
-    'neutrons-o',
-    'neutrons-supposedly',
-    'neutrotransmitter',
-    'neuva',
-    'neuville-de-poitou',
-    'neuvillette',
-    'neuyen',
     'nevadan',
-    'nevadas',
-    'nevanas',
-    'nevatia',
-    'neve-rending',
-    'neveer',
-    'never&ndash;mind',
-    'never-absent',
-    'never-before',
-    'never-before-heard',
-    'never-bettered',
-    'never-changing',
-    'never-clarified',
-    'never-consummated',
-    'never-discussed',
-    'never-disheartened',
     'never-do-a-minute-of-overtime',
-    'never-do-well',
-    'never-easing',
-    'never-endingness',
-    'never-flagging',
-    'never-green',
-    'never-happening',
-    'never-implemented',
-    'never-in-a-lifetime',
-    'never-marrying',
-    'never-mind',
-    'never-nazi',
-    'never-never-lands',
-    'never-on-sunday',
-    'never-ordained',
-    'never-pardon',
     'never-photographed',
-    'never-properly-seen',
-    'never-quite-finished',
-    'never-quite-healed',
-    'never-quite-known',
-    'never-quite-stated',
-    'never-rans',
-    'never-referred-to',
-    'never-released',
-    'never-satisfied',
-    'never-say-die-ishness',
-    'never-seen-before',
-    'never-setting',
-    'never-sleeping',
-    'never-slow-on-the-uptake',
-    'never-smokers',
     'never-stop',
-    'never-stopping',
-    'never-to-be',
-    'never-to-be-completed',
-    'never-to-be-suppressed',
-    'never-to-be-written',
-    'never-touch-earth',
-    'never-touch-woman',
-    'never-very-alert',
-    'never-very-fetching',
-    'never-was',
-    'never-was-been',
-    'never-weary',
-    'never_a_great',
-    'never_even',
-    'neverbeens',
     'neverbend',
-    'nevermans',
-    'nevern',
-    'neverra',
-    'nevers-autun',
-    'neverth',
-    'neverthe',
-    'neverthelss',
-    'neves',
-    'neves/stephan',
-    'nevesky',
-    'nevia',
-    'nevica',
-    'nevil-lee-ee',
-    'neville/breeder',
-    'nevilli',
     'nevins',
-    'nevirapine',
-    'nevis/glencoe',
-    'nevisian',
-    'neviskya',
-    'nevissi',
-    'nevozmozhno',
-    'nevros',
-    'nevruz',
-    'nevsehir',
-    'nevsetovic',
-    'nevys',
-    'nevzat',
-    'new&rehy;ball',
-    'new&rehy;fangled',
-    'new\'s-letter',
     'new(ish)',
-    'new-angle',
-    'new-baked',
-    'new-bathed',
-    'new-boat',
-    'new-born-looking',
-    'new-bought',
-    'new-boys',
-    'new-bursting',
-    'new-business',
-    'new-car',
-    'new-college',
-    'new-comer',
-    'new-created',
-    'new-cut',
-    'new-dead',
     'new-dealer',
-    'new-dialect',
-    'new-discovered',
-    'new-engaged',
-    'new-enterprise',
-    'new-era',
-    'new-europe',
-    'new-fallen',
-    'new-fashioned',
-    'new-fiction',
-    'new-fledged',
-    'new-formed',
-    'new-gnarled',
-    'new-green',
-    'new-invented',
-    'new-ish',
     'new-jersey-based',
-    'new-key',
-    'new-kids-',
-    'new-killed',
-    'new-loom',
-    'new-man',
-    'new-manager',
-    'new-market',
-    'new-membership',
-    'new-money',
-    'new-moon',
-    'new-opening',
-    'new-peeled',
-    'new-pencil',
-    'new-pin',
-    'new-ploughed',
     'new-price',
-    'new-products',
-    'new-property',
-    'new-releases',
-    'new-round',
-    'new-route',
-    'new-router',
-    'new-seeing',
-    'new-shaped',
-    'new-sightedness',
-    'new-signing',
-    'new-slain',
-    'new-spun',
-    'new-starter',
-    'new-styled',
-    'new-tangled',
     'new-to-',
-    'new-towns',
-    'new-turned',
-    'new-visioned',
-    'new-washed',
-    'new-world',
-    'new-worldliness',
-    'new-yeares-gift',
-    'new-zealand-born',
-    'new.',
-    'new.by',
-    'new.group',
-    'new.l',
-    'new.mown',
-    'new/modern',
-    'new/modified',
     'new/ongoing/discontinued',
-    'new/renewed',
-    'new/secondhand',
-    'new/sheep',
-    'new/synthetic',
-    'new/unfamiliar',
-    'newacstle',
-    'newadd',
-    'neward',
-    'newark-upon-trent',
-    'newark/cancer',
-    'newarke',
-    'newarkshire',
-    'newarm',
-    'newart',
-    'newbeats',
     'newbeggin-in-teesdale',
-    'newberg',
-    'newbiggen',
-    'newbiggin-by',
-    'newbiggin-in-teesdale',
-    'newborn-size',
-    'newbottle',
-    'newbridge21pts',
-    'newbuildings',
-    'newburghs',
-    'newbury-based',
-    'newbury/garden',
-    'newbury/thames',
-    'newbus',
-    'newby-fraser',
-    'newc',
     'newca',
-    'newcal',
-    'newcast',
-    'newcastel',
-    'newcastle&ndash;carlisle',
-    'newcastle&ndash;liverpool',
-    'newcastle-born',
-    'newcastle-carlisle',
-    'newcastle-liverpoo',
-    'newcastle-on-tyne-based',
-    'newcastle-scum',
-    'newcastle-sunderland',
-    'newcastle-type',
-    'newcastle-under-lyne',
-    'newcastle-upon-tyne.',
-    'newcastle.upon-tyne',
     'newcastle/',
-    'newcastle/arse/leeds',
-    'newcastle/chelsea/west',
-    'newcastle/gosforth',
-    'newcastle/leeds-cardiff/plymouth',
-    'newcastle2',
-    'newcastlebased',
-    'newcatle',
-    'newcey',
-    'newco.',
-    'newco/management',
-    'newcode',
-    'newcombe/russell-cairns',
-    'newcombers',
-    'newcomers-gossip',
-    'newcomers-locals',
     'newcomers-versus-locals',
-    'newcomers.',
-    'newdust-up',
-    'newell/115',
-    'newell/gallagher',
-    'newell/gloucs',
-    'newell/grendon',
-    'newell/grendon-springhill',
-    'newell/volunteer',
-    'newely',
-    'newenden',
-    'newer-ending',
-    'newerday',
-    'newfarmer',
-    'newfast',
-    'newgate-sequestered',
     'newgateway',
-    'newgeat',
-    'newgraph',
-    'newhaven&ndash;crewe',
-    'newhaven&ndash;leith',
-    'newhaven&ndash;seafield',
-    'newheed',
-    'newhill',
-    'newhnam-on-severn/gloucestershire',
-    'newhouse/glosters',
-    'newington/oxfordshire',
-    'newint',
-    'newis',
-    'newitt/mbe',
-    'newitt/sergeant',
-    'newleaf',
     'newley/scrooge',
-    'newline',
-    'newlow',
-    'newly&rehy;cosmopolitan',
-    'newly&rehy;merged',
-    'newly&rehy;released',
-    'newly&rehy;retired',
-    'newly-acquainted',
-    'newly-admitted',
-    'newly-announced',
-    'newly-arrived-at',
-    'newly-arriving',
-    'newly-associated',
-    'newly-attributed',
-    'newly-autonomous',
-    'newly-beloved',
     'newly-bereaved',
-    'newly-bestowed',
-    'newly-betrothed',
-    'newly-blazed',
-    'newly-carved',
-    'newly-christened',
-    'newly-coined',
-    'newly-combined',
-    'newly-conceded',
-    'newly-configured',
-    'newly-connected',
-    'newly-constructed',
-    'newly-converted',
-    'newly-decorated',
-    'newly-democratized',
-    'newly-derationed',
     'newly-derived',
-    'newly-described',
-    'newly-designated',
-    'newly-diagnosed',
-    'newly-disembodied',
-    'newly-displayed',
-    'newly-emergent',
-    'newly-employed',
-    'newly-empowered',
-    'newly-engined',
-    'newly-enhanced',
-    'newly-enthusiastic',
-    'newly-equipped',
-    'newly-erected',
-    'newly-evolved',
-    'newly-excited',
     'newly-exhumed',
-    'newly-expanded',
-    'newly-fashionable',
-    'newly-fermented',
-    'newly-fledged',
-    'newly-floated',
-    'newly-flooded',
-    'newly-flown',
-    'newly-forged',
-    'newly-forming',
-    'newly-formulated',
-    'newly-frozen',
-    'newly-gained',
-    'newly-glazed',
-    'newly-glued-together',
-    'newly-ground',
     'newly-growing',
-    'newly-honed',
-    'newly-hung',
-    'newly-illegal',
-    'newly-important',
-    'newly-incorporated',
-    'newly-indigent',
-    'newly-industrialised',
-    'newly-infected',
-    'newly-integrated',
-    'newly-joined',
-    'newly-knighted',
-    'newly-laundered',
-    'newly-licensed',
-    'newly-lifted',
-    'newly-manufactured',
     'newly-marketed',
-    'newly-matched',
-    'newly-mated',
-    'newly-matured',
-    'newly-mixed',
-    'newly-modernized',
-    'newly-mowed',
-    'newly-organised',
-    'newly-organized',
-    'newly-patented',
-    'newly-penned',
-    'newly-placed',
-    'newly-planned',
-    'newly-plastered',
-    'newly-ploughed',
-    'newly-poor',
     'newly-popular',
-    'newly-powerful',
-    'newly-producing',
-    'newly-projected',
-    'newly-quarried',
-    'newly-raised',
-    'newly-rebuilt',
-    'newly-reclaimed',
-    'newly-refitted',
-    'newly-regained',
-    'newly-relegated',
-    'newly-renamed',
-    'newly-renovated',
-    'newly-retired',
-    'newly-reunited',
-    'newly-revealed',
     'newly-shaven',
-    'newly-sheeted',
-    'newly-slain',
-    'newly-sold',
-    'newly-stirred',
-    'newly-stocked',
-    'newly-styled',
-    'newly-tested',
-    'newly-thatcherising',
-    'newly-trained',
-    'newly-typed',
-    'newly-united',
-    'newly-urbanized',
-    'newly-wedded',
-    'newly-widowed',
-    'newly-worded',
     'newly-xxxx',
-    'newlyfired',
-    'newlyinstalled',
-    'newlywed',
-    'newmade',
-    'newman(reprise)',
-    'newman-carl',
-    'newman/',
-    'newman/county',
-    'newman/race',
-    'newmanager',
-    'newmanite',
-    'newmans',
-    'newmark.',
-    'newmarket-trained',
-    'newment',
     'newmeyer',
-    'newnam',
-    'newnham-on-severn',
-    'newnham/gloucestershire',
-    'newns',
-    'newoed1&ndash;newoed2',
-    'newoed1&ndash;newoed6',
-    'newoed3',
-    'newoed3&ndash;newoed7',
-    'newoed4',
-    'newoed5',
-    'newoed6',
-    'newoed7',
-    'newound',
-    'newpainted',
-    'newphew',
     'newport-coventry',
-    'newport-crewe',
-    'newport-gresham',
-    'newport-to-bermuda',
-    'newport/gwent',
-    'newport3',
-    'newport9',
-    'newport9pts',
-    'newroses',
-    'newry-based',
-    'newry-to-dundalk',
-    'news&rehy;gathering',
-    'news&rehy;papers/amalgamated',
-    'news-agency',
-    'news-agents',
-    'news-bulletin',
     'news-consumption',
-    'news-desk',
-    'news-event',
-    'news-features',
-    'news-from-peshawar',
-    'news-gatherers',
-    'news-hustler',
-    'news-in-brief',
-    'news-leaks',
-    'news-letters',
-    'news-magazine',
-    'news-maker',
-    'news-management',
-    'news-os4.2',
-    'news-pictorial',
-    'news-presenting',
     'news-production',
-    'news-programme',
-    'news-providers',
-    'news-reading',
-    'news-reels',
-    'news-seeking',
-    'news-sellers',
-    'news-service',
-    'news-shot',
-    'news-style',
-    'news-time',
-    'news-trained',
-    'news-worth',
-    'news-worthy',
-    'news.papers',
-    'news.still',
     'news/bad',
-    'news/chat',
-    'news/informal',
-    'news/media',
-    'news/sports',
-    'news/wall',
-    'news5000tg',
-    'newsagencies',
-    'newsagent-cum-sweet-shop',
-    'newsagent/tobacconists',
-    'newsbills',
-    'newsbrief',
-    'newsbytes',
-    'newsclipping',
-    'newsclips',
-    'newsfax',
     'newsfaxes',
-    'newsfilm',
-    'newsfromnowhere(1889)',
-    'newsgatherer',
-    'newsheets',
-    'newshot',
-    'newshour',
-    'newsier',
-    'newsies',
-    'newsless',
-    'newsletter/magazine',
-    'newsletter/paper',
-    'newslife',
-    'newsline/041',
-    'newsmarket',
-    'newsnet',
     'newsome-davis',
-    'newsome-lukic',
-    'newsome-newsome',
-    'newsome-on-keeper',
-    'newsome-wetherall',
-    'newson(1953)',
-    'newson/fan',
-    'newson/nicola',
-    'newspaper-buying',
-    'newspaper-research',
-    'newspaper-stands',
-    'newspaper-to',
-    'newspaper-type',
-    'newspaper-worthy',
-    'newspaper-wrapped',
-    'newspaper/s',
     'newspaperboy',
-    'newspaperperson',
-    'newspapers/books',
-    'newspapers/radio/tv',
-    'newsphotos',
-    'newspoint',
-    'newsreading',
-    'newsrevue',
-    'newssrrelmax',
-    'newsteads',
-    'newstel',
-    'newstime',
-    'newswrite',
-    'newswriter',
-    'newsws10-12',
-    'newsws13-16',
     'newsws14-16',
-    'newsws15-17',
-    'newsws2',
-    'newsws6-10',
-    'newt-mating',
-    'newtie',
-    'newtoft',
-    'newton-compatible',
-    'newton-dunn',
-    'newton-lowry',
-    'newton-on-ouse',
-    'newton-on-the-hill',
-    'newton-on-the-moor',
-    'newton-smith',
-    'newton-under-roseberry',
-    'newton/115',
     'newton/father',
-    'newton/mother',
-    'newton/parker',
-    'newton/physiotherapist',
-    'newton/romanian',
-    'newton/royal',
-    'newton/widower',
-    'newtonabbey',
-    'newtonbutler',
-    'newtoner',
-    'newtonianism',
-    'newtonite',
-    'newtons/',
-    'newtonstewart',
-    'newtown-based',
-    'newtownbutler',
     'newtownkennedy',
-    'newtry',
-    'newtware',
-    'newvar',
-    'newvector',
-    'newview',
-    'newviews',
-    'newy',
-    'newyddiannu',
-    'newzam',
-    'newzealand-based',
-    'nexcd',
-    'next-',
-    'next-best',
-    'next-bottom',
-    'next-but-one',
     'next-door-but-one',
-    'next-door-to-crying',
-    'next-dr',
-    'next-higher',
-    'next-instruction',
-    'next-largest',
-    'next-longest',
-    'next-near',
-    'next-preference',
-    'next-to-impossible',
-    'next-to-last',
-    'next-to-lowest',
-    'next-to-nothingness',
-    'next-to-the-skin',
-    'next-very',
-    'nextage',
     'nextbase',
-    'nextjob',
-    'nextstations',
-    'nextstep-for-intel',
-    'nexuses',
-    'neycho',
-    'neylan',
-    'neylin',
-    'neyther',
-    'nezar',
-    'nezemmut',
-    'nezhad-hosseinian',
-    'nezih',
-    'nezintombi',
-    'nezu',
-    'nezval',
     'nf-',
-    'nf-a3',
-    'nf-at',
-    'nf-environnement',
-    'nf-il2a',
-    'nf-k&bgr',
-    'nf.12',
-    'nf.14',
-    'nf.4',
-    'nf.5',
-    'nf.ii',
-    'nf.iihj711',
-    'nf.iis',
-    'nf.is',
-    'nf/bnp',
-    'nf200c/s',
     'nf21',
-    'nf214',
-    'nf250c/s',
-    'nf3',
-    'nf3&verbar&verbar;nc6&verbar&verbar;18',
-    'nf400c/s',
-    'nf4061',
-    'nf4065',
-    'nf4076',
-    'nf450c/s',
-    'nf6-h7',
-    'nf6504',
-    'nf7007',
-    'nf910',
-    'nf9283',
-    'nfb',
     'nfcd',
-    'nfer/scdc',
-    'nfi-type',
-    'nfil',
-    'nfmead',
-    'nfol/care',
-    'nfor',
-    'nfrn',
-    'nfs-run',
-    'nfss',
-    'nfsu',
-    'nfv',
-    'nfyfc',
-    'nfz',
-    'ng\'weno',
-    'ng.',
     'ng.mo',
-    'ng/&micro;l.',
-    'ng/d',
-    'ng/h',
-    'ng/nl',
-    'ng1',
-    'ng10',
-    'ng12',
-    'ng13',
-    'ng24',
-    'ng5',
-    'ng6',
-    'ng617207',
-    'ng7',
-    'ng8',
-    'ngael',
     'ngah',
-    'ngakane',
-    'ngala',
-    'ngalo',
-    'ngami',
-    'ngana',
-    'nganasan',
-    'nganga',
-    'ngangala',
-    'ngango',
-    'ngaound&eacute;r&eacute',
-    'ngarba',
-    'ngarbaye',
-    'ngardoum',
-    'ngariman',
-    'ngarnayal',
     'ngaru',
-    'ngarukiyintwali',
-    'ngati',
-    'ngatia',
-    'ngatoroirangi',
-    'ngawethu',
-    'ngbaka',
-    'ngbase',
-    'ngc253',
-    'ngc3079',
-    'ngc4535',
-    'ngc6814',
-    'ngcobo',
-    'ngd',
-    'ngdc',
-    'nge2',
     'ngee',
-    'ngei',
-    'ngele',
-    'ngema',
-    'ngendabanyikwa',
-    'ngendabanyikwapublic',
-    'ngendayhoyo',
-    'ngenzebuhoro',
-    'ngenzebuhorocommunication',
-    'ngernmuen',
-    'nghetinhensis',
-    'nghon',
-    'ngirabatware',
-    'ngiriye',
-    'ngiriyelabour',
-    'ngiro',
     'ngirumpatse',
-    'ngk',
-    'ngl-based',
-    'ngo-managed',
-    'ngo-supported',
-    'ngo/un',
-    'ngoma',
-    'ngoma-foutou',
-    'ngong',
-    'ngongo',
-    'ngonya',
-    'ngora',
-    'ngororo',
-    'ngotheeconomy',
-    'ngotho',
-    'ngoua',
     'ngozion',
-    'ngqika',
-    'ngr',
-    'ngt',
-    'nguesso',
-    'nguez',
-    'ngulia',
-    'ngum',
-    'ngumba',
-    'ngumbe',
-    'nguni',
-    'nguoi',
-    'nguti',
-    'ngvs.',
-    'ngweno',
-    'nh/ala2(co)',
     'nh8',
-    'nh904',
-    'nhadau',
-    'nhangar',
-    'nhanh',
-    'nhc',
-    'nhe',
-    'nhek',
-    'nhel',
-    'nhem337',
-    'nhf',
-    'nhlanhla',
-    'nhlpa',
-    'nhon',
-    'nhpcc',
-    'nhs-funded',
     'nhs-lc-biotin',
-    'nhs-run',
-    'nhs-speak',
-    'nhs.',
-    'nhs/deprive',
-    'nhs/dhss',
-    'nhsta',
-    'nhuong',
-    'ni&ccedil;ois',
-    'ni&ntilde;os',
-    'ni&ntilde;show',
-    'ni-br',
-    'ni-cad',
-    'ni-ight',
-    'ni-men',
-    'ni-p',
     'ni-produced',
-    'ni/boe',
-    'ni106',
-    'ni13',
-    'ni211',
-    'ni9.',
-    'ni:ce',
-    'niaff',
-    'niagaran',
-    'niagre',
-    'nialson',
-    'niam',
-    'niamanto',
-    'nianakoro',
-    'niang',
-    'nianias',
     'nianlong',
-    'niar',
-    'niaruna',
-    'niarunas',
-    'niasami',
-    'niat',
-    'niaz',
-    'nibbed',
-    'nibbio',
-    'nibbler\'',
-    'nibby',
-    'nibelung',
-    'nibelungs',
-    'niblets',
-    'niblicks',
-    'nibus',
     'nicabate',
-    'nicademus',
-    'nicander',
-    'nicandros',
-    'nicanor',
-    'nicaragua297',
-    'nicaraguanos',
-    'nicardipine',
-    'nicas',
-    'nicasio',
-    'nicastrol',
-    'nicc&ograve;lo',
-    'nicco',
-    'niccolino',
-    'niccolls/west',
-    'nice&rehy;looking',
     'nice\'n\'stinky',
-    'nice-c&ocirc;te',
-    'nice-girl',
-    'nice-like',
-    'nice-minded',
-    'nice-quiet-guy-who-lives-next-door',
-    'nice-to-have',
-    'nice-to-know',
-    'nice_but',
-    'niceanile',
-    'niceguy',
-    'nicein',
-    'nicely-brought-up',
-    'nicely-made',
-    'nicely-painted',
-    'nicely-rounded',
     'nicely-sized',
-    'nicely.',
-    'nicely_but_if_i_asked_them_for_anything_it_was_as_though',
-    'nicens',
-    'nicephore',
-    'nicer-looking',
-    'nicest/nastiest',
-    'nich',
-    'niche&rehy;marketed',
-    'niche-audience',
-    'niche-marketing',
-    'niche-specific',
-    'nichely',
-    'nichibutsu',
-    'nichicon',
-    'nichilas',
     'nichitean',
-    'nichoals',
-    'nichol/browning',
-    'nicholae',
-    'nicholas&mdash',
-    'nicholas&mdash;alison&mdash;absolon',
-    'nicholas-creaney',
-    'nicholas-jacques',
-    'nicholas.saints',
-    'nicholas/barnum',
-    'nicholas/fairbairn',
-    'nicholas/principal',
-    'nicholas/pt',
-    'nicholashayne',
-    'nicholf',
-    'nicholl/browning',
     'nicholl/milton',
-    'nicholls-palmer',
-    'nicholls/asbestos',
-    'nicholls/avon',
-    'nichols/headmaster',
-    'nicholson-lailey/sickle',
-    'nicholson-style',
-    'nicholson-trained',
-    'nicholson.',
-    'nicholson/provost',
-    'nicholson/rspb',
-    'nichopoulos',
-    'nichtabstimmbar',
-    'nichtig',
-    'nichtraucher',
-    'niciciana',
     'nicish',
-    'nick&rehy;named',
-    'nick-farr',
-    'nick-nack',
-    'nick-names',
-    'nick-naming',
-    'nick-nicked',
-    'nick-of&rehy;time',
-    'nick-picky-wickety-pingle-pang',
-    'nicke',
-    'nickel-cobalt-iron',
-    'nickel-poor',
-    'nickel-silver',
-    'nickel-sized',
-    'nickel-smelting',
-    'nickel/cadmium',
     'nickel/iron',
-    'nickel/retired',
-    'nickelfucker',
-    'nickelfucker.',
-    'nickells',
-    'nickers',
-    'nickey',
-    'nickhame',
-    'nickick',
-    'nickies',
-    'nickin\'',
-    'nicklas',
-    'nicklebys',
-    'nicklo',
-    'nicknackery',
-    'nickolas',
     'nickoll',
-    'nickstream',
-    'nicky-picky-diddle-poo-poo',
-    'nicl',
-    'nico-esque',
-    'nicodim',
-    'nicoise',
-    'nicol&ograve',
-    'nicol-don',
-    'nicol/harrier',
-    'nicolaes',
-    'nicolaisen',
-    'nicolaos',
-    'nicolarde',
-    'nicolas-quinibert',
-    'nicolashayne',
     'nicolau',
-    'nicolay',
-    'nicolayev',
-    'nicoleau',
-    'nicolene',
-    'nicolet/siemens',
-    'nicoleyva',
-    'nicoli',
-    'nicolotte',
-    'nicomachus',
-    'nicopolis',
-    'nicotania',
-    'nicotianias',
-    'nicotine-dosed',
-    'nicotine-laden',
-    'nicotine/lower',
     'nicotinell',
-    'nicrophorus',
-    'nicrowells',
-    'nicta',
-    'nictation',
-    'nictus',
-    'niculescu',
-    'niculescu-mazil',
-    'niddk',
-    'niddmen',
-    'niddrie/bingham',
-    'niddrie/brunstane',
-    'niddy',
-    'nidecker',
-    'nideffer',
-    'nidhi',
     'nidhogg',
-    'nidmen',
-    'nido-carboranes',
-    'nidri-levkas',
-    'niduari',
-    'nidulans',
-    'nie-clair',
-    'niebelungen',
-    'niebelungenlied',
-    'niebuhrs',
-    'niece/ward',
-    'niederau',
-    'niedermaier',
-    'niedersachen',
-    'niederschmiedeberg',
-    'niedzica',
     'niehans',
-    'niehof',
-    'niehuis',
-    'niekerkagriculture',
-    'niekirk',
-    'niell',
-    'niello-inlaid',
-    'nielsen/koch',
-    'nielson-jones',
-    'nielson/team',
-    'niema',
-    'nieman',
-    'nieman-marcus',
-    'niemax',
-    'niemayer',
-    'niemetschek',
     'niemeyers',
-    'nieo',
-    'niepce',
-    'niepel',
-    'niepodleglej',
-    'niepodlegtno&sacute&cacute',
-    'nier',
-    'nierc',
-    'niersteiner',
-    'niert',
-    'nies.',
-    'nieswand',
-    'nietroudovyie',
-    'niets',
-    'nietszche',
-    'nietzschian',
     'nieuports',
-    'nieuw',
-    'nieuwegein',
-    'nieuwendorp',
-    'nieuwenhove',
-    'nieuwenhuis',
-    'nieuwenhuyse',
-    'nieux',
-    'nievergelt',
-    'nieves',
-    'niezabitowska',
-    'nifc',
-    'nife',
-    'nifedepine',
-    'niffy',
-    'nifties',
     'nifto',
-    'nifty-serve',
-    'nigah',
-    'nigal',
-    'nigam',
-    'nigel-constantine',
-    'nigels',
-    'niger&ndash;benue',
-    'nigeria/cameroon',
-    'nigeria/germany',
-    'nigerian-mediated',
-    'nigerian-owned',
-    'nigerian-south',
-    'nigericin',
-    'nigerien/rassemblement',
-    'niget',
     'nigga',
-    'niggard',
-    'niggas',
-    'niggaz',
-    'niggenkopf',
-    'niggerati',
-    'nigggggah',
-    'niggle-niggle-niggle',
-    'niggler',
-    'nigglers',
-    'nigh/',
-    'nighclubs',
-    'nighean',
-    'nighingale',
-    'night&mdash;it',
-    'night&mdash;so',
     'night&rehy;flying',
-    'night&rehy;workers',
-    'night(mare)',
-    'night(s)',
-    'night-and-day',
-    'night-anglers',
-    'night-attack',
-    'night-attire',
-    'night-before-christmas',
-    'night-blanket',
-    'night-bloom',
-    'night-bombing',
-    'night-burning',
-    'night-cap.',
-    'night-caps',
-    'night-classes',
     'night-cleaner',
-    'night-clubbers',
-    'night-clubby',
-    'night-crows',
-    'night-darkness',
-    'night-day',
-    'night-desert',
-    'night-dresses',
-    'night-fighters',
-    'night-fish',
-    'night-fishing',
-    'night-flight',
-    'night-flower',
-    'night-foxes',
-    'night-glass',
-    'night-gowned',
     'night-grey',
-    'night-hours',
-    'night-houses',
-    'night-hunt',
-    'night-hunting',
-    'night-images',
-    'night-joseph',
-    'night-letter',
-    'night-lifers',
-    'night-locks',
-    'night-mair',
-    'night-mares',
-    'night-marish',
-    'night-moor',
-    'night-moths',
-    'night-nursing',
     'night-only',
-    'night-orientated',
-    'night-out',
-    'night-person',
-    'night-piece',
-    'night-pot',
-    'night-prowling',
-    'night-purple',
-    'night-rainbows',
-    'night-really',
-    'night-recording',
-    'night-ride',
-    'night-riding',
-    'night-run',
-    'night-scenes',
-    'night-screws',
     'night-set',
-    'night-shapes',
-    'night-shifts',
-    'night-sight',
-    'night-sights',
-    'night-sounds',
-    'night-spinning',
-    'night-spots',
-    'night-stands',
-    'night-sun',
-    'night-sweated',
-    'night-sweats',
-    'night-telephonist',
-    'night-there',
-    'night-tide',
-    'night-town',
     'night-trip',
-    'night-tripper',
-    'night-tripping',
-    'night-waking',
-    'night-walk',
-    'night-warmth',
-    'night-wear',
-    'night-woatchman',
-    'night.but',
-    'night.he',
-    'night.it',
-    'night/',
-    'night/disco',
-    'night/given',
-    'night/old',
-    'night/ride',
     'night/thursday',
-    'night/twin',
-    'night/where',
-    'nightbeg',
-    'nightcapped',
-    'nightclub-cum-concert',
-    'nightclub-restaurant',
-    'nightclub-wise',
-    'nightclubber',
-    'nightclubs.',
-    'nightdream',
-    'nightdress-case',
-    'nighter',
-    'nightfishing',
-    'nightflying',
-    'nightglow',
     'nightgowned',
-    'nighthorse',
-    'nightie-clad',
-    'nightin\'gown',
-    'nightingale.',
-    'nightjar-like',
-    'nightlife-',
-    'nightlife-wise',
-    'nightlike',
-    'nightlines',
-    'nightmap',
-    'nightmarch',
-    'nightmare-blur',
-    'nightmare-drowning',
-    'nightmare-free',
-    'nightmare-paradigms',
     'nightmare-plagued',
-    'nightmare-range',
-    'nightmare.',
-    'nightnoise',
-    'nightown',
-    'nightrain',
-    'nightrunners',
-    'nights-most',
-    'nightscene',
-    'nightschools',
-    'nightscope',
-    'nightshades',
-    'nightshelters',
-    'nightspace',
-    'nightstaff',
-    'nightstar',
     'nightstop',
-    'nighttown',
-    'nighttrace',
-    'nightwatchmen',
-    'nightwaves',
-    'nightwork',
-    'nightworkers',
-    'nighty',
-    'nighty-night',
-    'nighy',
-    'nigram',
-    'nigrescent',
-    'nigri',
-    'nigriceps',
-    'nigricollis',
-    'nigritana',
     'nigs',
-    'nih44&ndash;1',
-    'nih44&ndash;1-immunoreactive',
-    'nihali',
-    'nihia',
-    'nihil\'',
-    'nihilist-reactionary',
-    'nihilistically',
-    'nihira',
-    'nihon-nukite',
-    'niinamesai',
-    'niitaka',
-    'niitaka-yama',
-    'nija',
-    'nijhout',
-    'nijinksy',
     'nijinskys',
-    'nijkamp',
-    'nijni',
-    'nijournalists',
-    'nijsen',
-    'nijssen',
-    'nik&scaron;i&cacute',
-    'nik-nik',
-    'nikam',
-    'nike-akroterion',
-    'nikica',
-    'nikis',
-    'nikitas',
-    'nikiteas',
-    'nikiyas',
-    'nikkari',
     'nikkeiren',
-    'nikky',
-    'niklin',
-    'nikoi',
-    'nikolaas',
-    'nikolaenko',
-    'nikolaevsk',
-    'nikolaieva',
-    'nikolaj',
-    'nikolas',
-    'nikolayenko',
-    'nikolenka',
-    'nikolsky',
-    'nikomachos',
-    'nikomedeia',
-    'nikto',
     'nikunau',
-    'nil-apartheid',
-    'nil-assessments',
-    'nil-paid',
-    'nil-promotion',
-    'nil-rate',
-    'nil.there',
-    'nilambar',
-    'nilames',
-    'nile-god',
-    'nilete',
-    'nilgiri',
-    'nilgiris',
-    'nilis',
-    'nilly-willy',
-    'nilmini',
     'nilnil',
-    'nilotica',
-    'nils-udo',
-    'nilsen&amp;pedersen',
-    'nilson/pensioner',
-    'nilssoni',
-    'nim-fee-ar',
-    'nim-fee-foe-lee-oos',
-    'nim-foi-fays',
-    'nim6000',
-    'nima',
-    'nimach',
-    'nimagasocial',
-    'nimat',
-    'nimbas',
-    'nimbies',
     'nimble-limbed',
-    'nimble-looted',
-    'nimbled',
-    'nimblefingered',
-    'nimblest-fingered',
-    'nimbley',
-    'nimbo-stratus',
-    'nimbosa',
-    'nimby-fied',
-    'nimbyism',
-    'nimeiri',
-    'nimet',
-    'nimipu',
-    'nimit',
-    'nimitz',
-    'nimmanhemin',
     'nimminee-pimminee',
-    'nimmo-smith',
-    'nimocks',
-    'nimoda',
-    'nimph',
-    'nimphes',
-    'nimr',
-    'nimrudi',
-    'nimtech',
-    'nimtoo',
-    'nimzo',
-    'nin-o',
-    'nina-anne',
-    'nina-note',
-    'nincds-adrda',
-    'ninckley',
     'nincompoop',
-    'nine&mdash;year&mdash;old',
-    'nine&rehy;fifteen',
-    'nine&rehy;horse',
-    'nine&rehy;tenths',
-    'nine&rehy;thirty',
-    'nine&rehy;year-old',
-    'nine-\'o-clock',
-    'nine-11',
-    'nine-and-a-half-day',
-    'nine-and-ninety',
-    'nine-ball',
-    'nine-band',
-    'nine-bar',
-    'nine-barrelled',
-    'nine-bay',
     'nine-bedroom',
-    'nine-bedroomed',
-    'nine-birdie',
-    'nine-boy',
-    'nine-column',
-    'nine-cup',
-    'nine-day-old',
-    'nine-eighteen',
-    'nine-end',
-    'nine-feeder',
-    'nine-fifty',
-    'nine-five',
-    'nine-floor',
-    'nine-foot-long',
-    'nine-four',
-    'nine-gallon',
     'nine-game',
-    'nine-gened',
-    'nine-headed',
-    'nine-high',
-    'nine-holer',
-    'nine-hourly',
-    'nine-hundred-day',
-    'nine-hundred-odd',
-    'nine-item',
-    'nine-lane',
-    'nine-letter',
-    'nine-lined',
-    'nine-medal',
-    'nine-men\'s-morris',
-    'nine-metre',
-    'nine-mile-long',
     'nine-millimetre',
-    'nine-million-dollar',
-    'nine-model',
-    'nine-months',
-    'nine-months-old',
-    'nine-ounce',
-    'nine-over-par',
-    'nine-pan',
-    'nine-panels',
-    'nine-part',
-    'nine-party',
-    'nine-pin',
-    'nine-pins',
-    'nine-pounders',
-    'nine-power',
-    'nine-quart',
     'nine-row',
-    'nine-runner',
-    'nine-slot',
-    'nine-stroke',
-    'nine-tailed',
-    'nine-term',
-    'nine-three-five',
-    'nine-til-five',
-    'nine-tile',
-    'nine-to-fivers',
-    'nine-to-fiving',
-    'nine-to-four',
-    'nine-to-three',
-    'nine-twenty-five',
-    'nine-two',
-    'nine-under',
     'nine-volt',
-    'nine-weeks-at-the-top',
-    'nine-year&rehy;old',
-    'nine.thirty',
-    'nine.tim',
-    'nine:part',
-    'nine_per',
-    'ninebarrow',
-    'nineham',
-    'ninel',
-    'nineteen&rehy;sixty',
-    'nineteen-carat',
-    'nineteen-eighties',
-    'nineteen-eighty-nine',
-    'nineteen-eighty-six',
-    'nineteen-eighty-two',
     'nineteen-fifty',
-    'nineteen-fifty-eight',
-    'nineteen-fifty-five',
-    'nineteen-fifty-one',
-    'nineteen-fifty-six',
-    'nineteen-forty-nine',
-    'nineteen-fourteen',
-    'nineteen-month-old',
-    'nineteen-nineties',
-    'nineteen-ninety-',
-    'nineteen-ninety-four',
-    'nineteen-ninety-one',
-    'nineteen-ninety-six',
-    'nineteen-page',
-    'nineteen-seventeen',
-    'nineteen-seventy-five',
     'nineteen-seventy-three',
-    'nineteen-six',
-    'nineteen-sixty',
-    'nineteen-stone',
-    'nineteen-thirty-six',
-    'nineteen-track',
-    'nineteen-twenties-it',
-    'nineteen-twenty-four',
-    'nineteen-twenty-nine',
-    'nineteen-year-olds',
-    'nineteenth&ndash;century',
-    'nineteenth-billed',
-    'nineteeth',
-    'nineth',
-    'nineties-style',
-    'ninetimes',
     'ninetry',
-    'ninety&rehy;four',
-    'ninety&rehy;nine',
-    'ninety&rehy;two',
-    'ninety-acre',
-    'ninety-channel',
-    'ninety-eighth',
-    'ninety-f',
-    'ninety-fifth',
-    'ninety-first',
-    'ninety-five-year',
-    'ninety-four-man',
-    'ninety-four-year-old',
-    'ninety-fourth',
-    'ninety-horsepower',
-    'ninety-mile-an-hour',
     'ninety-nine-point-nine',
-    'ninety-nine-pound',
-    'ninety-ninth-rate',
-    'ninety-one-year-old',
-    'ninety-per-cent',
-    'ninety-plus',
-    'ninety-pound',
-    'ninety-seven-piece',
-    'ninety-thousand-seater',
-    'ninety-three-',
-    'ninety-two-three',
-    'ninety-year',
-    'ninety-year-olds',
-    'ninety/ninety',
-    'ninety=four',
-    'ninevah',
     'ninfa',
-    'ningbo',
-    'ningependa',
-    'ningkun',
-    'ningsanondpublic',
-    'ningxia',
-    'ninib',
-    'ninion',
-    'ninish',
-    'ninkov',
-    'ninky',
-    'ninmakh',
-    'ninn',
-    'ninnin',
-    'ninnins',
-    'ninnins.',
     'ninos',
-    'ninosu',
-    'ninotchka',
-    'ninous',
-    'ninove',
-    'ninsun',
-    'ninteenth-century',
-    'nintendo-style',
-    'nintety',
-    'ninth-floor',
-    'ninth-grade',
-    'ninth-minute',
-    'ninth-placed',
-    'ninthly',
-    'ninti',
-    'ninty-nine',
     'ninty-one',
-    'ninty-six',
-    'niny',
-    'nio(s)',
-    'niobium-95',
-    'niobium-titanium',
-    'niodini',
-    'nione',
-    'niord',
-    'niorin',
-    'niosomes',
-    'nip-bsa',
-    'nip-caproate-o-succinimide',
-    'nip-derivatised',
-    'nip-inside',
-    'nip.bsa-agglutinated',
     'nip.bsa-binding',
-    'niphredil',
-    'nipkow',
-    'nippan',
-    'nippier',
-    'nippies',
-    'nipple-ceiling',
-    'nipple-gazing',
-    'nipple-pink',
-    'nipponbashi',
-    'nipro',
-    'nipt',
-    'niqula',
-    'nir&rehy;g&aacute;l',
-    'nirali',
-    'niranjan',
     'nirayani',
-    'nirdel',
-    'niri',
-    'nirm',
-    'nirs',
-    'nirvana-like',
-    'nirvana-related',
-    'nirvs',
-    'nisa/today',
-    'nisab',
-    'nisad',
-    'nisbet-smith',
-    'nisbit',
-    'niseac',
-    'nisei',
-    'nisfan',
     'nishanov',
-    'nishapur',
-    'nishcheta',
-    'nishett',
-    'nishi-waseda',
-    'nishigaki',
-    'nishikikoi',
-    'nishinari',
-    'nishioka',
-    'nishiwaki',
-    'nisia',
-    'nisibis',
-    'niskanen-type',
-    'nissan.',
-    'nissay',
-    'nissen-hut',
     'nissi',
-    'nissly',
-    'nissui',
-    'nista',
-    'nistro',
-    'nisubscriber',
-    'nisw/',
-    'niswander',
-    'nit&eacute',
-    'nit&eacute;-grit&eacute',
-    'nit-wit',
-    'nitakes',
-    'nitb',
-    'nitech',
-    'niteclub',
-    'nited',
     'nitelife',
-    'nitespot',
-    'nitesun',
-    'nith',
-    'nithbank',
-    'nito',
-    'nitopi',
-    'nitorgen',
-    'nitra',
-    'nitrasafe',
-    'nitrate-ammonium',
-    'nitrate-based',
-    'nitrate-bearing',
-    'nitrate-fuel',
-    'nitrate-produced',
-    'nitrate-removal',
     'nitrate-removing',
-    'nitrate-rich',
-    'nitrate-sensitive',
-    'nitrazepam',
-    'nitre',
-    'nitrene',
-    'nitriding',
-    'nitrigen',
-    'nitrigin',
-    'nitrilotriacetic',
-    'nitro-',
-    'nitro-injectors',
-    'nitro-organic',
-    'nitroanilide',
-    'nitrobacter',
-    'nitrobenzene/water',
     'nitrocellulose-bound',
-    'nitrofurantoin',
-    'nitrogen-bearing',
-    'nitrogen-containing',
-    'nitrogen-filled',
-    'nitrogen-fixer',
-    'nitrogen-fixers',
-    'nitrogen-loving',
-    'nitrogen-mediated',
-    'nitrogen-methane',
-    'nitrogen-oxide',
-    'nitrogen-processing',
-    'nitrogen-sparing',
-    'nitrogen-xxxx',
-    'nitrogen/phosphorus',
-    'nitrogen:phosphorus',
     'nitrokemia',
-    'nitron',
-    'nitrophenol',
-    'nitrophenyl',
-    'nitrosamine',
-    'nitrosation',
-    'nitroso-compounds',
-    'nitrosoguanidine',
-    'nitrosyl',
-    'nitroxynil',
-    'nitsan',
-    'nitsch',
-    'nitsche',
-    'nitti',
-    'nitto-albion',
-    'nituchha',
     'nitzanim',
-    'nitzsche',
-    'nitzschia',
-    'niu',
-    'niueans',
-    'nius',
-    'nivas',
-    'nivasher',
-    'nivc',
-    'nivel',
-    'nivenskowe',
-    'nivingston',
-    'nivir',
-    'nivison',
-    'niviv',
-    'nivola',
     'nivvor',
-    'nix/organiser',
-    'nixes',
-    'nixi',
-    'nixies',
-    'nixon&rehy;built',
-    'nixon-agnew',
-    'nixon-ford',
-    'nixon/kennedy',
-    'nixon/photographer',
-    'nixonian',
-    'niyariwallah',
-    'niyibigirafinance',
-    'niyonkuru',
-    'nizam-i',
-    'nizam-i-mustafa',
     'nizami/oxford',
-    'nizan-orfilat',
-    'nizan-sartre',
-    'nizan.33',
-    'nizharadze',
-    'nizhnevartovskneftegas',
-    'nizhnivgorod',
-    'nizniy',
-    'nizoral',
-    'nizzen',
-    'nj71sw',
-    'njacwer',
-    'njalsgade',
-    'njau',
-    'njcbi',
-    'njected',
     'njema',
-    'njenga',
-    'njg3',
-    'njie',
-    'njoka',
-    'njoman',
-    'njszt',
-    'nk-like',
-    'nk11as',
-    'nk1r',
-    'nk2',
-    'nk9l&ndash;l',
-    'nka',
-    'nkama',
-    'nkanga',
-    'nkcd',
     'nkew',
-    'nkgb',
-    'nkhoma',
-    'nkhotakota',
-    'nkifenji',
-    'nkodia',
-    'nkoghe',
-    'nkohla',
-    'nkole',
-    'nkomo/mugabe',
-    'nkosana',
-    'nkosi',
-    'nkoua',
-    'nkr1,000',
-    'nkr1.5',
-    'nkr1.6bn',
     'nkr10,000',
-    'nkr11',
-    'nkr11,000',
-    'nkr11,500',
-    'nkr11.5',
-    'nkr19,200',
-    'nkr2.8',
-    'nkr24,200',
-    'nkr3.4',
-    'nkr3.6',
-    'nkr4,500',
-    'nkr4.7',
-    'nkr450,900',
-    'nkr5,000',
-    'nkr56,700',
-    'nkr6,000',
     'nkr65,000',
-    'nkr7,200',
-    'nkrf/',
-    'nkroful',
-    'nkrohl',
-    'nkt',
-    'nkuebe',
-    'nkundabagenzi',
-    'nkwain',
-    'nkweto',
-    'nkxd',
-    'nl-1200',
-    'nl25c',
-    'nl65',
-    'nlab',
-    'nlcs',
     'nld-slorc',
-    'nleya',
-    'nli',
-    'nlms',
-    'nlr',
-    'nltr',
-    'nlz/897246',
-    'nlz/897247',
-    'nm-8l',
-    'nm-cambio-90',
-    'nm.',
-    'nm/380',
-    'nmade',
-    'nmbj',
-    'nmc-kenmore',
-    'nmccl',
     'nmda-',
-    'nme\'ers',
-    'nmgnbaytdfccvd',
-    'nmj.',
-    'nmol/',
-    'nmol/h-&micro;g',
-    'nmol/h/',
-    'nmol/l/',
-    'nmol/l/h',
-    'nmol/rabbit',
-    'nmos',
-    'nms-like',
-    'nms3000',
-    'nmts',
-    'nn\'',
-    'nn-nn-',
     'nn11',
-    'nn13',
-    'nn17',
-    'nn3',
-    'nn4',
-    'nn59',
-    'nnaa',
-    'nncos',
-    'nndp',
-    'nndy',
-    'nne-trending',
-    'nnebs',
-    'nnection',
-    'nnf',
-    'nngthssnngst',
-    'nni&mdash;gross',
     'nnlc',
-    'nnpc',
-    'nnt',
-    'nntk',
-    'nnuh',
-    'no&amp;sub3/n',
-    'no&dollar',
-    'no&eacute',
-    'no&ecirc;l',
-    'no&mdash;growth',
-    'no&mdash;no',
-    'no&rehy;conscription',
-    'no+no',
-    'no-abort',
-    'no-actors',
-    'no-alcohol/low-alcohol',
     'no-barracking',
-    'no-big-deal',
-    'no-blacks',
-    'no-blame',
-    'no-body',
-    'no-bodyline',
-    'no-brainer',
-    'no-brand',
-    'no-brow',
-    'no-bull',
-    'no-bullshit',
-    'no-buy',
-    'no-car',
-    'no-career',
-    'no-cgmp',
-    'no-change',
     'no-check',
-    'no-clone',
-    'no-clothes',
-    'no-commentary',
-    'no-compensation',
-    'no-conscription',
-    'no-contract',
-    'no-costs',
-    'no-cycling',
-    'no-debt',
-    'no-decision',
-    'no-defective',
-    'no-dictatorship',
-    'no-difference',
-    'no-dig',
-    'no-discrimination',
     'no-do',
-    'no-effect',
-    'no-energy',
-    'no-expense-spared',
-    'no-felling',
-    'no-finds',
-    'no-first-strike',
-    'no-fishing',
-    'no-fix',
-    'no-flake',
-    'no-fly-zone',
-    'no-gap',
-    'no-go-alone',
-    'no-go-go',
-    'no-goer',
-    'no-going-back',
     'no-good-crying-over-spilt-milk',
-    'no-good-jobs',
-    'no-gooder',
-    'no-gooders',
-    'no-gos',
-    'no-grav',
-    'no-great-rush',
-    'no-hair',
-    'no-handed',
-    'no-hassle',
-    'no-heads',
-    'no-horse',
-    'no-how',
-    'no-interest',
-    'no-involvement',
-    'no-iron',
     'no-joy',
-    'no-kids',
-    'no-kill',
-    'no-laughing',
-    'no-laws-no-redress',
-    'no-less',
-    'no-less-a-weapon',
-    'no-licence-required',
-    'no-light',
-    'no-like',
-    'no-line',
-    'no-loan',
-    'no-longer-news',
-    'no-longer-wanted',
-    'no-lose',
-    'no-man\'s-counter',
     'no-mans',
-    'no-marking-to-market',
-    'no-marks',
-    'no-mean-city',
-    'no-memory',
-    'no-men',
-    'no-money',
-    'no-more-writing',
-    'no-names',
-    'no-neck',
-    'no-need-to-clear-mask',
-    'no-need-to-soak',
-    'no-negligence',
-    'no-neutrino',
-    'no-new-nuclear',
-    'no-new-taxes',
     'no-no-no',
-    'no-o-o-o',
-    'no-of-hours',
-    'no-of-staff',
-    'no-of-times-given',
-    'no-one-ever-knows-what',
-    'no-oner',
-    'no-paperwork',
-    'no-parking',
-    'no-parking-at-any-time',
-    'no-parole',
-    'no-pay',
-    'no-penalty',
-    'no-piece',
-    'no-poaching',
-    'no-popery',
     'no-pro',
-    'no-product-yet',
-    'no-promotion',
-    'no-prospects',
-    'no-protection',
-    'no-questions-asked',
-    'no-restraint',
-    'no-return',
-    'no-rights',
-    'no-rub',
-    'no-sacred-cows',
-    'no-script',
-    'no-see-ums',
-    'no-service',
-    'no-shame',
-    'no-shit',
     'no-short',
-    'no-sign',
-    'no-singing',
-    'no-slice',
-    'no-so-public',
-    'no-soak',
-    'no-speaks',
-    'no-supply',
-    'no-surcharge',
-    'no-tackling',
-    'no-talcum',
-    'no-thanks',
-    'no-thing',
-    'no-through-branch',
-    'no-time-to-diet',
-    'no-time.',
     'no-toll',
-    'no-tonal',
-    'no-tox',
-    'no-trains',
-    'no-treatment',
-    'no-trouble',
-    'no-trump',
-    'no-truths',
-    'no-union',
-    'no-verb',
-    'no-voters',
-    'no-wait',
-    'no-way',
-    'no-weed',
-    'no-weeks',
-    'no-wind',
     'no-with-doubts',
-    'no-woman',
-    'no.0&middot;5',
-    'no.03069',
-    'no.1/1992',
-    'no.1001',
-    'no.101',
-    'no.102',
-    'no.104',
-    'no.107',
-    'no.1089',
-    'no.112',
-    'no.1157',
-    'no.1160',
-    'no.145979',
-    'no.168',
     'no.1s',
-    'no.2.',
-    'no.2133',
-    'no.23',
-    'no.24/74',
-    'no.253',
-    'no.255',
-    'no.264',
-    'no.2g',
-    'no.331',
-    'no.3601',
-    'no.3605',
-    'no.3822',
-    'no.39',
-    'no.41',
-    'no.42',
     'no.44',
-    'no.4498',
-    'no.51',
-    'no.52',
-    'no.5317-v6.0',
-    'no.559',
-    'no.565',
-    'no.62',
-    'no.62-ed',
-    'no.6498',
-    'no.6s',
-    'no.707',
-    'no.72',
-    'no.72/91',
-    'no.78',
-    'no.7c',
     'no.80',
-    'no.87',
-    'no.8s',
-    'no.94',
-    'no.99',
-    'no.d9539',
-    'no.d9553',
-    'no.g',
-    'no.l',
-    'no.you',
-    'no11',
-    'no16',
-    'no1dno1s',
-    'no21',
-    'no2ntno4h',
-    'no49',
     'no4snono',
-    'no62',
-    'no63',
-    'no85',
-    'no9',
-    'no:7,065',
-    'no_',
-    'no_,_no_,_no_matter_where',
-    'no_,_no_,_no_one',
-    'no_,_no_longer',
-    'no_,_no_matter_which',
-    'no_,_you_no_longer',
-    'no_a',
-    'no_because_no_one',
-    'no_er_no_one',
-    'no_matter_whom',
     'no_no',
-    'no_no_matter_how',
-    'no_no_no_no_,_no_one',
-    'no_there\'s_no_one',
-    'noa',
-    'noach',
-    'noachi',
-    'noachian',
-    'noades-inspired',
-    'noah/',
-    'noakes-style',
-    'noakes.',
-    'noakesy',
-    'noamana',
-    'noan',
-    'noate',
     'nob.',
-    'nobbery',
-    'nobbies',
-    'nobbler',
-    'nobbles',
-    'nobel-prize-winning',
-    'noberto',
-    'nobeyama',
-    'nobeyana',
-    'nobi',
-    'nobiles',
-    'nobilia',
-    'nobiliaire',
-    'nobiliores',
-    'nobilissima',
-    'nobilissime',
     'nobilitate',
-    'nobiliter',
-    'nobinul',
-    'noblat',
-    'noble&rehy;man',
-    'noble&rehy;women',
-    'noble-dominated',
-    'noble-hearted',
-    'noble-nosed',
-    'noble-rollin',
-    'noble-savage',
-    'noble/enthusiast',
-    'noble/heart',
-    'noblement',
-    'noblemente',
-    'nobler-blooded',
     'noblett',
-    'noblette',
-    'noblin',
-    'nobly-born',
-    'nobody\'s-friend',
-    'nobottle',
-    'nobq',
-    'nobriga',
-    'nobrophonos',
-    'nobu',
-    'nobuku',
-    'nobunaga',
-    'nobuo',
-    'nobury',
-    'nobutoshi',
-    'noc',
     'nocami',
-    'nocebos',
-    'nocella',
-    'nocent',
-    'nocenzis',
-    'noceto',
-    'noch',
-    'nochid',
-    'nochmal',
-    'noci',
-    'nock/victim',
-    'nockemorf',
-    'nocker',
-    'nockold',
-    'nocodazole',
-    'noctamid',
     'nocte',
-    'noctem',
-    'noctium',
-    'nocturna',
-    'nocturnal.',
-    'nocturnally-active',
-    'nocturnum',
-    'nod-down',
-    'nod-nod',
-    'nod-on',
-    'nodac',
-    'nodal-pointing',
-    'nodd',
-    'nodded-through',
-    'noddindog',
-    'noddles',
     'node.',
-    'nodeco',
-    'nodename',
-    'nodens',
-    'noderunner',
-    'nodes.',
-    'nodge',
-    'nodle',
-    'nodo',
-    'nodosaurs',
-    'nodulating',
-    'nodulosa',
-    'noehr',
-    'noel-johnson',
-    'noeleen',
-    'noels',
     'noelyne',
-    'noemi',
-    'noemol',
-    'noems',
-    'noesis',
-    'noeterminal',
-    'noetherian',
-    'noetic',
-    'nof',
-    'noffink',
-    'nofilia',
-    'nofl',
-    'nogal',
-    'nogat',
-    'nogent-sur-oise',
-    'noggs',
     'nogoli',
-    'nogos',
-    'nogs',
-    'noh-masks',
-    'nohalmdun',
-    'nohc',
-    'nohem&iacute',
-    'nohis',
-    'nohmal',
-    'noho',
-    'nohon',
-    'nohoval',
-    'nohow',
-    'nohr',
-    'noia',
-    'noibr&iacute',
     'noic',
-    'noice',
-    'noilly-prat',
-    'noinghamshire',
-    'noir/chardonnay',
-    'noirin',
-    'noirmont/reuter',
-    'noirmoutier',
-    'noise-abatement',
-    'noise-abating',
-    'noise-annoys',
-    'noise-as-threat',
-    'noise-bar',
-    'noise-bars',
-    'noise-blast',
-    'noise-for-noise',
     'noise-grunge-new-wave-of-alternative-corporate-underground-anarcho-core-punk',
-    'noise-induced',
-    'noise-maker',
-    'noise-making',
-    'noise-outs',
-    'noise-polluted',
-    'noise-pop',
-    'noise-sensitive',
-    'noise-shaping',
-    'noise-shock',
-    'noise-storms',
-    'noise/',
-    'noise/female',
-    'noise/quiet',
-    'noisemakers',
-    'noisemaking',
     'noisemaster',
-    'noisenik',
-    'noisepop',
-    'noises-off',
-    'noises-puppy',
-    'noisesome',
-    'noisly',
-    'noisom',
-    'noiss',
-    'noisy-fridge',
-    'noix',
-    'nok110',
-    'nokie',
-    'nokka',
-    'nokunonu',
-    'nokuru',
     'nolan/british',
-    'nolan/foster',
-    'nolan/parent',
-    'nolana',
-    'nolens',
-    'nolin',
-    'nolla',
-    'noller-namitscheva',
-    'noload',
-    'nom-de-peintre',
-    'noma-fila',
-    'nomada',
-    'nomadic-style',
-    'nomadically',
-    'nomal',
-    'nomansland',
     'nomarski',
-    'nomas',
-    'nomatodes',
-    'nome-like',
-    'nomehandling',
-    'nomenclature-rely',
-    'nomgaana',
-    'nomich',
-    'nomikos',
-    'nomimated',
-    'nomin&rehy;ated',
-    'nomina&rehy;tions',
-    'nominal/issued',
-    'nominalisations',
-    'nominalised',
-    'nominalist&mdash;realist',
     'nominandum',
-    'nominate&lsqb;d&rsqb',
-    'nomination(s)',
-    'nomination-for',
-    'nominee-presumptive',
-    'nominis',
-    'nomino&euml',
-    'nomman',
-    'nomocratic',
-    'nomodule',
-    'nomogenesis',
-    'nomonhan',
-    'nomothetic',
-    'noms-du-disque',
-    'non&mdash;advanced',
-    'non&mdash;examinable',
     'non&mdash;renewable',
-    'non&ndash;degree',
-    'non&ndash;payment',
-    'non&ndash;specialists',
-    'non&ndash;stop',
-    'non&ndash;traditional',
-    'non&ndash;urgent',
-    'non&rehy;accidental',
-    'non&rehy;accountable',
-    'non&rehy;aggressive',
-    'non&rehy;agricultural',
-    'non&rehy;alcoholic',
-    'non&rehy;analytical',
-    'non&rehy;appearance',
-    'non&rehy;aristocratic',
-    'non&rehy;arrival',
     'non&rehy;assessed',
-    'non&rehy;attendance',
-    'non&rehy;attentiveness',
-    'non&rehy;availability',
-    'non&rehy;band',
-    'non&rehy;beneficial',
-    'non&rehy;blacks',
-    'non&rehy;bodily',
-    'non&rehy;breathable',
-    'non&rehy;british',
-    'non&rehy;canonical',
-    'non&rehy;career',
-    'non&rehy;catholics',
-    'non&rehy;causal',
-    'non&rehy;chargeable',
-    'non&rehy;church',
     'non&rehy;circularly',
-    'non&rehy;combatant',
-    'non&rehy;comedogenic',
-    'non&rehy;commissioned',
-    'non&rehy;commonwealth',
-    'non&rehy;communication',
-    'non&rehy;compatibility',
-    'non&rehy;compliance',
-    'non&rehy;conscripted',
-    'non&rehy;contingent',
-    'non&rehy;contracting',
-    'non&rehy;contractual',
-    'non&rehy;criminalising',
-    'non&rehy;democratic',
-    'non&rehy;depreciation',
-    'non&rehy;deviants',
     'non&rehy;discriminatory',
-    'non&rehy;electrical',
-    'non&rehy;emblematic',
-    'non&rehy;emergency',
-    'non&rehy;equilibrium',
-    'non&rehy;executive',
-    'non&rehy;feminist',
-    'non&rehy;governmental',
-    'non&rehy;graduate',
-    'non&rehy;health',
-    'non&rehy;housing',
-    'non&rehy;identical',
-    'non&rehy;imitated',
-    'non&rehy;immediate',
-    'non&rehy;individualist',
-    'non&rehy;intellectual',
     'non&rehy;interference',
-    'non&rehy;invertible',
-    'non&rehy;marital',
-    'non&rehy;military',
-    'non&rehy;mineral',
-    'non&rehy;modular',
-    'non&rehy;nutritive',
-    'non&rehy;observable',
-    'non&rehy;offenders',
-    'non&rehy;parliamentary',
-    'non&rehy;physiological',
-    'non&rehy;political',
-    'non&rehy;practising',
-    'non&rehy;psychologists',
-    'non&rehy;quality',
-    'non&rehy;quantifiable',
     'non&rehy;readers',
-    'non&rehy;renewable',
-    'non&rehy;retired',
-    'non&rehy;selective',
-    'non&rehy;severable',
-    'non&rehy;smudge',
-    'non&rehy;specialists',
-    'non&rehy;spouses',
-    'non&rehy;starter',
-    'non&rehy;statutory',
-    'non&rehy;tax',
-    'non&rehy;threatening',
-    'non&rehy;traditional',
-    'non&rehy;vinyls',
-    'non&rehy;voting',
-    'non&rehy;women',
     'non&rehy;work',
-    'non+nuclear',
-    'non-&eacute;litist',
-    'non-&eacute;v&eacute;nement',
-    'non-&formula',
-    'non-&formula;-periodic',
-    'non-&ggr;-interferon',
-    'non-\'cats',
-    'non-(market)',
-    'non-ability',
-    'non-abolitionists',
-    'non-aboriginal',
-    'non-aboriginals',
-    'non-aborigines',
-    'non-absorbed',
-    'non-abused',
     'non-academically',
-    'non-accelerated',
-    'non-accell',
-    'non-acceptable',
-    'non-acceptance.',
-    'non-accepting',
-    'non-accessibility',
-    'non-accountant',
-    'non-accounts',
-    'non-accumulative',
-    'non-accusatory',
-    'non-achievers',
-    'non-acidic',
-    'non-acidity',
-    'non-acoustic',
-    'non-acoustical',
     'non-acquired',
-    'non-act',
-    'non-action-man',
-    'non-actualised',
-    'non-actualizing',
-    'non-actuarial',
-    'non-adaptable',
-    'non-adaptation',
-    'non-adapted',
-    'non-addicts',
-    'non-addressed',
-    'non-adenocarcinoma',
-    'non-adenoidectomy',
-    'non-adjacent',
-    'non-adjectival',
-    'non-adjusted',
     'non-adjusting',
-    'non-admissible',
-    'non-adoption',
-    'non-adrenaline',
-    'non-adulthood',
-    'non-adults',
-    'non-advance',
-    'non-adversarial',
-    'non-advertising',
-    'non-aerated',
-    'non-aerospace',
-    'non-affiliated',
-    'non-affirmation',
-    'non-afforested',
-    'non-african',
-    'non-ageist',
     'non-agenda',
-    'non-aggregative',
-    'non-aggresive',
-    'non-aggressor',
-    'non-agriculture',
-    'non-agta',
-    'non-air',
-    'non-alcholic',
-    'non-alcohol-related',
-    'non-alcoholics',
-    'non-alienation',
-    'non-alliterative',
-    'non-allowable',
-    'non-alp',
-    'non-altruistic',
-    'non-amateur',
     'non-ambiguous',
-    'non-ambulant',
-    'non-ambulatory',
-    'non-amharaness',
-    'non-ammanites',
-    'non-ammonia',
-    'non-anabantoids',
-    'non-anaesthetists',
-    'non-analogous',
-    'non-analysts',
-    'non-angler',
-    'non-animal-tested',
-    'non-answer',
-    'non-answers',
-    'non-antibiotic',
-    'non-antibody',
     'non-antigen-driven',
-    'non-antigen-specific',
-    'non-antral',
-    'non-apnoeic',
-    'non-apostolic',
-    'non-apparent',
-    'non-appliance',
-    'non-applicable',
-    'non-apprenticed',
-    'non-appropriate',
-    'non-approvable',
-    'non-apraxic',
-    'non-aquarium',
-    'non-aquatic',
-    'non-arabic',
-    'non-arable',
     'non-arabs',
-    'non-arctic',
-    'non-argentine',
-    'non-aristotelian',
-    'non-arm\'s-length',
-    'non-armenian',
-    'non-aroused',
-    'non-arousing',
-    'non-arrivals',
-    'non-ascriptive',
-    'non-asean',
-    'non-assembly',
-    'non-assenting',
-    'non-asserted',
-    'non-assertively',
-    'non-assessed',
     'non-asset',
-    'non-assignable',
-    'non-assigned',
-    'non-assist',
-    'non-assistance',
-    'non-association',
-    'non-asylum',
-    'non-athenian',
-    'non-athenians',
-    'non-atol',
-    'non-attending',
-    'non-audio',
-    'non-auratic',
-    'non-auriferous',
-    'non-austro-german',
-    'non-authentic',
     'non-authority',
-    'non-authorization',
-    'non-authorized',
-    'non-autistic',
-    'non-autopsied',
-    'non-awareness',
-    'non-ayer-hare',
-    'non-babt',
-    'non-baby',
-    'non-back',
-    'non-baconian',
-    'non-bacterial',
-    'non-bagshaws',
-    'non-banker',
-    'non-baptized',
-    'non-bar',
     'non-barclays',
-    'non-baronial',
-    'non-barred',
-    'non-basaltic',
-    'non-bass',
-    'non-basw',
-    'non-bbc',
-    'non-bc',
-    'non-beer',
-    'non-behavioural',
-    'non-behaviourist',
-    'non-behaviourists',
-    'non-belligerence',
-    'non-belongers',
-    'non-bengalis',
-    'non-bereaved',
     'non-bes',
-    'non-bgq',
-    'non-biasing',
-    'non-bile',
-    'non-biliary',
-    'non-bio-degradable',
-    'non-bioavailable',
-    'non-biochemists',
-    'non-biologist',
-    'non-biologists',
-    'non-biomedical',
-    'non-biotinylated',
-    'non-birthday',
-    'non-blacks',
-    'non-bliss',
-    'non-blondes',
     'non-bnf',
-    'non-body',
-    'non-boisterous',
-    'non-bolting',
-    'non-bonus',
-    'non-book-buying',
-    'non-bougainvilleans',
-    'non-boussinesq',
-    'non-bowling',
-    'non-boxing',
-    'non-brahmins',
-    'non-bran',
-    'non-brand',
-    'non-breakable',
-    'non-breaking',
-    'non-brecchia',
     'non-brewed',
-    'non-brewery',
-    'non-brewing',
-    'non-bridging',
-    'non-brittle',
-    'non-bsp',
-    'non-bt',
-    'non-bt-',
-    'non-buckle',
-    'non-budget-holding',
-    'non-bulbed',
-    'non-bulgarian',
-    'non-bull',
-    'non-burden',
-    'non-bureaucratized',
-    'non-burman',
     'non-burrowing',
-    'non-bursate',
-    'non-caching',
-    'non-cad',
-    'non-calcite',
-    'non-calligraphers',
-    'non-caloric',
-    'non-calvinist',
-    'non-camp',
-    'non-campaign',
-    'non-campaigning',
-    'non-cancellable',
-    'non-cancer',
-    'non-cancerous',
-    'non-cannibalistic',
-    'non-canonic',
     'non-cap',
-    'non-capped',
-    'non-captive',
-    'non-car',
-    'non-car-owning',
-    'non-carcinogenic',
-    'non-card',
-    'non-cardioselective',
-    'non-carer',
-    'non-caribbean',
-    'non-caricom',
-    'non-carriers',
-    'non-cartographers',
-    'non-cartographic',
-    'non-cases',
-    'non-catalan',
     'non-catalysed',
-    'non-catalytic',
-    'non-catastrophically',
-    'non-categorial',
-    'non-catenary',
-    'non-catfish',
-    'non-caucasian',
-    'non-causality',
-    'non-causating',
-    'non-causes',
-    'non-causing',
-    'non-ceb',
-    'non-celebrity',
-    'non-cellular',
-    'non-cellulosic',
-    'non-censorship',
     'non-centralised',
-    'non-centralized',
-    'non-cerebral',
-    'non-certifiable',
-    'non-certificate',
-    'non-certificated',
-    'non-certification',
-    'non-cf',
-    'non-chain\'',
-    'non-challenging',
-    'non-charity',
-    'non-charms',
-    'non-chart',
-    'non-charter',
-    'non-chemists',
-    'non-chic',
     'non-chicken',
-    'non-cholera',
-    'non-cholestatic',
-    'non-cholinergie',
-    'non-chooser',
-    'non-chordal',
-    'non-chorus',
-    'non-chromosome-15',
-    'non-church-goers',
-    'non-cichlid',
-    'non-citations',
-    'non-claimants',
-    'non-clash',
-    'non-classic',
-    'non-classification',
-    'non-classroom',
     'non-clausal',
-    'non-clearer',
-    'non-climber',
-    'non-climbers',
-    'non-clinic',
-    'non-clogging',
-    'non-closure',
-    'non-clownfish',
-    'non-cluster',
-    'non-clustered',
-    'non-cmea',
-    'non-co-operatively',
-    'non-coach',
-    'non-coalfield',
-    'non-coalition',
-    'non-cobalt',
     'non-cockney',
-    'non-codified',
-    'non-coerced',
-    'non-coffee',
-    'non-cognitivism',
-    'non-coherent',
-    'non-cold',
-    'non-colitic',
-    'non-collaborative',
-    'non-collector',
-    'non-collectors',
-    'non-colloquial',
-    'non-collusively',
-    'non-coloured',
-    'non-comedies',
-    'non-comformist',
     'non-comfortable',
-    'non-comittally',
-    'non-commensurate',
-    'non-commercialised',
-    'non-commissionable',
-    'non-committee',
-    'non-commodity-form',
-    'non-commonsensical',
-    'non-commonwealth',
-    'non-communicating',
-    'non-communicators',
-    'non-community-charge-paying',
-    'non-comparability',
-    'non-compassionate',
-    'non-compatible',
-    'non-competence',
     'non-competent',
-    'non-competitively',
-    'non-competitiveness',
-    'non-complaining',
-    'non-completable',
-    'non-compounders',
-    'non-comprehending',
-    'non-compressed',
-    'non-compromise',
-    'non-computational',
-    'non-computer-literate',
-    'non-computer-related',
-    'non-computerised',
-    'non-computers',
-    'non-computing',
-    'non-concealed',
     'non-concept-dependent',
-    'non-concurrence',
-    'non-condensing',
-    'non-conditionally',
-    'non-conference',
-    'non-confident',
-    'non-conflict',
-    'non-conformance\'',
-    'non-conformer',
-    'non-conformers',
-    'non-conformism',
-    'non-confounding',
-    'non-congressmen',
-    'non-congruent',
-    'non-consciousness',
-    'non-consequential',
     'non-conserver',
-    'non-conservers',
-    'non-conspiracy',
-    'non-conspiratorial',
-    'non-constituent',
-    'non-constitutionally',
-    'non-consular',
-    'non-consultants',
-    'non-consumer.',
-    'non-consuming',
-    'non-contaminated',
-    'non-contaminating',
-    'non-contender',
-    'non-contest',
-    'non-context-dependent',
-    'non-contingently',
     'non-continuing',
-    'non-continuous',
-    'non-contraceptors',
-    'non-contractile',
-    'non-contributing',
-    'non-contribution',
-    'non-contributory/partial',
-    'non-convecting',
-    'non-convention',
-    'non-convergence',
-    'non-convergent',
-    'non-conversation',
-    'non-conversational',
-    'non-converted',
-    'non-conveyancing',
-    'non-cooking',
     'non-cooperating',
-    'non-cooperatively',
-    'non-cooperativeness',
-    'non-copernicans',
-    'non-cornishmen',
-    'non-coronal',
-    'non-corridor',
-    'non-corrodable',
-    'non-corrodible',
-    'non-corroding',
-    'non-corrosiveness',
-    'non-cose',
-    'non-cosmological',
-    'non-cosmopolitan',
-    'non-cost',
-    'non-cotectic',
     'non-counting',
-    'non-court',
-    'non-courtaulds',
-    'non-coverage',
-    'non-cpders',
-    'non-cpv',
-    'non-crack',
-    'non-craft',
-    'non-creation',
-    'non-creole-influenced',
-    'non-cricket',
-    'non-cricket-loving',
-    'non-crimes',
-    'non-crisis',
-    'non-crohn',
-    'non-crop',
     'non-crystallisation',
-    'non-cuddly',
-    'non-culinary',
-    'non-culpable',
-    'non-culturable',
-    'non-cuprate',
-    'non-curfew',
-    'non-currency',
-    'non-curriculum',
-    'non-custodially',
-    'non-custody',
-    'non-custom',
-    'non-cycle',
-    'non-cyclic',
-    'non-cyclosporin',
-    'non-cytotoxic',
     'non-dairy',
-    'non-damaged',
-    'non-damaging',
-    'non-dangerous',
-    'non-danuese',
-    'non-deadly',
-    'non-deaf',
-    'non-decimal',
-    'non-decision-taking',
-    'non-declared',
-    'non-decomposable',
-    'non-decompression',
-    'non-decremental',
-    'non-defeasibility',
-    'non-defection',
-    'non-defensive',
     'non-defensively',
-    'non-definition',
-    'non-definitional',
-    'non-degeneracy',
-    'non-delayed',
-    'non-delegate',
-    'non-deleted',
-    'non-deliberately',
-    'non-delivery.',
-    'non-democracy',
-    'non-demographic',
-    'non-demonstrable',
-    'non-demonstrative',
-    'non-demonstratively',
-    'non-dense',
-    'non-department',
     'non-dependants',
-    'non-deposit',
-    'non-deposit-taking',
-    'non-depositional',
-    'non-depreciating',
-    'non-depressed',
-    'non-derivative',
-    'non-derridean',
-    'non-described',
-    'non-description',
-    'non-descriptor',
-    'non-deserving',
-    'non-destructively',
-    'non-destructiveness',
-    'non-detection',
-    'non-detections',
     'non-detector',
-    'non-detroit',
-    'non-developers',
-    'non-dextrals',
-    'non-diabetes',
-    'non-dialectal',
-    'non-diatonic',
-    'non-dictatorial',
-    'non-differentiable',
-    'non-differentiation',
-    'non-diglossic',
-    'non-diminutive',
-    'non-diocesan',
-    'non-dip',
-    'non-diplomats',
-    'non-dipole',
     'non-disapproval',
-    'non-disapproving',
-    'non-discardable',
-    'non-disciplinarian',
-    'non-disciplinary',
-    'non-disclosure/use',
-    'non-discounted',
-    'non-discoveries',
-    'non-discriminating',
-    'non-disease',
-    'non-disintegration',
-    'non-disjunction',
-    'non-dismissals',
-    'non-dispersing',
-    'non-disruptive',
-    'non-dissenting',
     'non-distinctiveness',
-    'non-distortionary',
-    'non-disturbance',
-    'non-dividend',
-    'non-dividend-paying',
-    'non-division',
-    'non-divisional',
-    'non-divorce',
-    'non-dna',
-    'non-dna-binding',
-    'non-dock',
-    'non-document',
-    'non-documented',
-    'non-documents',
-    'non-doers',
-    'non-dorian',
     'non-dp',
-    'non-drainable',
-    'non-dreaming',
-    'non-drive-in',
-    'non-drop',
-    'non-drought',
-    'non-drugs',
-    'non-dubbable',
-    'non-dwelling',
-    'non-dyke',
-    'non-dynamic',
-    'non-e.e.c',
-    'non-e.e.c.',
-    'non-earnings',
-    'non-eastern',
-    'non-eaters',
     'non-eccludability',
-    'non-economist',
-    'non-ectothermic',
-    'non-eddy',
-    'non-education',
-    'non-effects',
-    'non-efl',
-    'non-egyptians',
-    'non-elasticated',
-    'non-electorial',
-    'non-electrified',
-    'non-electrolyte',
-    'non-electrolyte-mediated',
-    'non-elemental',
-    'non-elf',
-    'non-eligible',
     'non-eligibles',
-    'non-elites',
-    'non-elitist',
-    'non-emergence',
-    'non-emergencies',
-    'non-emphatic',
-    'non-employee',
-    'non-empowerment',
-    'non-emptiness',
-    'non-end',
-    'non-endemics',
-    'non-ending',
-    'non-endocrine',
-    'non-endorsable',
-    'non-endorsed',
-    'non-endothermic',
     'non-energy',
-    'non-engagement',
-    'non-english-language',
-    'non-english-qualified',
-    'non-english-speakers',
-    'non-englishness',
-    'non-entailing',
-    'non-enterotoxigenic',
-    'non-entertainment',
-    'non-enthusiasts',
-    'non-entities',
-    'non-entitled',
-    'non-entitlement',
-    'non-entrepreneurial',
-    'non-environment-friendly',
-    'non-environmentally',
     'non-envy',
-    'non-ephemeral',
-    'non-episcopal',
-    'non-episcopalian',
-    'non-epsilon-toxin-producing',
-    'non-equality',
-    'non-equatorial',
-    'non-eradicated',
-    'non-ericaceous',
-    'non-eritreans',
-    'non-erotic',
-    'non-erupting',
-    'non-erythroid',
-    'non-esrc',
-    'non-establishment',
-    'non-ethereal',
     'non-ethernet',
-    'non-ethiopian',
-    'non-euclidian',
-    'non-evaluable',
-    'non-even',
-    'non-eviction',
-    'non-evident',
-    'non-evolutionary',
-    'non-exam',
-    'non-exchangable',
-    'non-excluded',
-    'non-exclusively',
-    'non-exclusivity',
-    'non-exeat',
-    'non-executable',
-    'non-execute',
     'non-exemplars',
-    'non-exercise',
-    'non-exhibition',
-    'non-expandable',
-    'non-expansion',
-    'non-expansionist',
-    'non-expelled',
-    'non-expenditure',
-    'non-experience',
-    'non-experienced',
-    'non-experiments',
-    'non-explanation',
-    'non-exporters',
-    'non-exporting',
-    'non-exposed',
-    'non-extendable',
     'non-extended',
-    'non-extendedness',
-    'non-extensible',
-    'non-extradition',
-    'non-factives',
-    'non-factory',
-    'non-fade',
-    'non-fallacious',
-    'non-falsifiability',
-    'non-falsifiable',
-    'non-familiar',
-    'non-familiarity',
-    'non-fan',
-    'non-fanciful',
-    'non-fantasy',
-    'non-farm/on-farm',
     'non-farmstead',
-    'non-faroese',
-    'non-fascist',
-    'non-fascists',
-    'non-fast',
-    'non-fasting',
-    'non-fathers',
-    'non-fattening',
-    'non-fault-tolerant',
-    'non-features',
-    'non-federal',
-    'non-federalists',
-    'non-fee',
-    'non-feeble',
-    'non-feedback',
-    'non-feeding',
     'non-femininity',
-    'non-fermented',
-    'non-fiata',
-    'non-fibre',
-    'non-fiery',
-    'non-fifties',
-    'non-fight',
-    'non-fighters',
-    'non-figuration',
-    'non-financially',
-    'non-fine',
-    'non-finishers',
-    'non-fire',
-    'non-fire-propagating',
-    'non-first',
-    'non-first-class',
     'non-fishing',
-    'non-fishy',
-    'non-fissionable',
-    'non-fixed',
-    'non-flag',
-    'non-flexibility',
-    'non-fln',
-    'non-floating',
-    'non-flowing',
-    'non-fluency',
-    'non-fluffy',
-    'non-flushing',
-    'non-fly',
-    'non-flyer',
-    'non-foliating',
-    'non-food-bingeing',
     'non-forensic',
-    'non-foreseeable',
-    'non-forest',
-    'non-forester',
-    'non-form',
-    'non-formative',
-    'non-formed',
-    'non-formers',
-    'non-formulaic',
-    'non-forward-looking',
-    'non-fossil-fuel',
-    'non-foundationalist',
-    'non-fracced',
-    'non-fractal',
-    'non-fragmenting',
-    'non-fragrant',
     'non-franchised',
-    'non-fraternisation',
-    'non-fraudulent',
-    'non-fray',
-    'non-free-draining',
-    'non-freemen',
-    'non-freezing',
-    'non-french-speaking',
-    'non-frequent',
-    'non-friction',
-    'non-fried',
-    'non-frightening',
-    'non-frontal',
-    'non-fsa',
-    'non-full',
-    'non-fund',
     'non-fungal',
-    'non-fussy',
-    'non-gaelic',
-    'non-gall',
-    'non-games',
-    'non-gas',
-    'non-gascon',
-    'non-gascons',
-    'non-gaseous',
-    'non-gastroenterological',
-    'non-gatt',
-    'non-gaullist',
-    'non-gaussian',
-    'non-gav',
-    'non-gays',
-    'non-gc',
     'non-gender-related',
-    'non-gender-stereotyped',
-    'non-gendered',
-    'non-genital',
-    'non-genitive',
-    'non-genomic',
-    'non-gentlemen',
-    'non-gentry',
-    'non-geographers',
-    'non-germ-line',
-    'non-german-speaking',
-    'non-germinal',
-    'non-gestural',
-    'non-gesture',
-    'non-gilbert',
-    'non-glacial',
     'non-glaciated',
-    'non-glare',
-    'non-glass',
-    'non-global',
-    'non-glutitive',
-    'non-glycosylated',
-    'non-golfer',
-    'non-golfing',
-    'non-gothic',
-    'non-governmentalorganisations',
-    'non-goyigamas',
-    'non-gpc',
-    'non-gradable',
-    'non-grain',
-    'non-grant-aidable',
-    'non-granular',
     'non-graphical',
-    'non-graphitic',
-    'non-grass',
-    'non-grassed',
-    'non-grease',
-    'non-greedy',
-    'non-groups',
-    'non-growing',
-    'non-gti',
-    'non-gui',
-    'non-guitar',
-    'non-gun',
-    'non-h',
-    'non-habit-forming',
-    'non-habitable',
-    'non-haematopoietic',
     'non-haemolytic',
-    'non-haemorrhagic',
-    'non-hagiographer',
-    'non-hard',
-    'non-hard-wearing',
-    'non-harmonic',
-    'non-harmonization',
-    'non-heads',
-    'non-hearing',
-    'non-hearting',
-    'non-heating',
-    'non-hebbian',
-    'non-hegemonic',
-    'non-heinous',
-    'non-heli',
-    'non-hepatotoxic',
     'non-heritable',
-    'non-hewlett-packard',
-    'non-hex',
-    'non-hierarchic',
-    'non-hierarchized',
-    'non-high-speed',
-    'non-higher',
-    'non-hill-walking',
-    'non-hindi',
-    'non-hindi-speaking',
-    'non-hippies',
-    'non-hippy',
-    'non-histological',
-    'non-histone',
-    'non-historians',
-    'non-hla',
     'non-hmc',
-    'non-hodgkins',
-    'non-hold',
-    'non-holistic',
-    'non-hollywood',
-    'non-home',
-    'non-homeowners',
-    'non-homogenously',
-    'non-homophones',
-    'non-homophonic',
-    'non-homosexuals',
-    'non-hooked',
-    'non-hormonal',
-    'non-horsey',
-    'non-horsy',
-    'non-hostility',
     'non-house',
-    'non-human-animals',
-    'non-humanistic',
-    'non-humanity',
-    'non-hungarian',
-    'non-hungarian-speaking',
-    'non-hungry',
-    'non-hybrid',
-    'non-hybridisation',
-    'non-hydrogen-bonded',
-    'non-hydroxylated',
-    'non-hypnagogic',
-    'non-hypnotised',
-    'non-hypocrisy',
-    'non-hypoglycaemia',
-    'non-iata',
     'non-iatrogenic',
-    'non-icco',
-    'non-idealist',
-    'non-identities',
-    'non-ideology',
-    'non-ige-mediated',
-    'non-illness',
-    'non-illusion',
-    'non-image',
-    'non-imageable',
-    'non-imbricating',
-    'non-immunity',
-    'non-immunocompromised',
-    'non-immunogenic',
-    'non-imperial',
-    'non-imprisonable',
     'non-imputed',
-    'non-incision',
-    'non-incontinent',
-    'non-incremental',
-    'non-incrimination',
-    'non-indecent',
-    'non-indicative',
-    'non-indigenes',
-    'non-individual-human',
-    'non-inducements',
-    'non-inducible',
-    'non-industrialised',
-    'non-industries',
-    'non-inertial',
-    'non-inertness',
-    'non-infantry',
     'non-infarct',
-    'non-infarcted',
-    'non-infinitesimal',
-    'non-inflamed',
-    'non-inflammable',
-    'non-informative',
-    'non-infrastructure',
-    'non-ingres',
-    'non-inhabitable',
-    'non-inhaler',
-    'non-inheritance',
-    'non-inheriting',
-    'non-inhibition',
-    'non-injac',
-    'non-injectable',
-    'non-innervated',
     'non-inpatient',
-    'non-insider',
-    'non-instinctual',
-    'non-institutionalised',
-    'non-insular',
-    'non-insulin-treated',
-    'non-insurance',
-    'non-insured',
-    'non-integrationist',
-    'non-integrin/integrin',
-    'non-intellectuals',
-    'non-intended',
-    'non-intensification',
-    'non-interest-earning',
-    'non-internationalist',
-    'non-internetworking',
     'non-interpretation',
-    'non-intersection',
-    'non-intervened-in',
-    'non-interventional',
-    'non-interventionalist',
-    'non-intimate',
-    'non-intimates',
-    'non-intoxicating',
-    'non-intra-aortic',
-    'non-intrusively',
-    'non-intuitive',
-    'non-invariance',
-    'non-invasively',
-    'non-ionised',
-    'non-ior',
-    'non-irradiated',
     'non-irrigated',
-    'non-irritating',
-    'non-irritative',
-    'non-islet',
-    'non-isomorphism',
-    'non-isotropic',
-    'non-israeli',
-    'non-israelite',
-    'non-israelites',
-    'non-issue.',
-    'non-itn',
-    'non-jaa',
-    'non-jacobites',
-    'non-jamaican',
-    'non-jar',
-    'non-jargon-using',
     'non-jargonistic',
-    'non-jealous',
-    'non-jettisonable',
-    'non-job',
-    'non-joinder',
-    'non-joiners',
-    'non-joining',
-    'non-jordanian',
-    'non-journalist',
-    'non-judaic',
-    'non-judaistic',
-    'non-judgementally',
-    'non-judgmentally',
-    'non-junkies',
-    'non-juring',
-    'non-kashmiris',
     'non-kentish',
-    'non-keyboard',
-    'non-keynesians',
-    'non-kikuyu',
-    'non-killing',
-    'non-kinetic',
-    'non-kingsman',
-    'non-kinsman',
-    'non-knightly',
-    'non-knitting',
-    'non-koreans',
-    'non-kosher',
-    'non-kuwaiti',
-    'non-kuwaitis',
-    'non-laboratory',
-    'non-lambertian',
     'non-landed',
-    'non-landing',
-    'non-landowner',
-    'non-lapps',
-    'non-latvians',
-    'non-laudian',
-    'non-lawful',
-    'non-lawlike',
-    'non-leaague',
-    'non-leached',
-    'non-leaders',
-    'non-leaf',
-    'non-leagues',
-    'non-lecture',
-    'non-legato',
-    'non-legitimate',
     'non-leicestershire',
-    'non-lesbian',
-    'non-lesioned',
-    'non-letter',
-    'non-levelness',
-    'non-lexically',
-    'non-lfa',
-    'non-libyan',
-    'non-libyans',
-    'non-licensed',
-    'non-life-insurance',
-    'non-liffe',
-    'non-liganding',
-    'non-lily',
-    'non-limerick',
-    'non-linguistically',
     'non-lire',
-    'non-list',
-    'non-listed',
-    'non-literally',
-    'non-literates',
-    'non-litigated',
-    'non-litigious',
-    'non-localized',
-    'non-locally',
-    'non-locals',
-    'non-location',
-    'non-location-specific',
-    'non-locational',
-    'non-lockable',
-    'non-logician',
-    'non-looking',
     'non-loving',
-    'non-lucid',
-    'non-luxembourg',
-    'non-lymphocytic',
-    'non-lyrics',
-    'non-m&amp;a',
-    'non-m&eacute;thode',
-    'non-machine',
-    'non-machinery',
-    'non-macintosh',
-    'non-magyar',
-    'non-mainframe',
-    'non-major',
-    'non-makers',
-    'non-malay',
-    'non-malays',
     'non-malden',
-    'non-males',
-    'non-malevolent',
-    'non-manacled',
-    'non-managerial',
-    'non-manic',
-    'non-manifest',
-    'non-manual/industrial',
-    'non-manual/manual',
-    'non-manual/salaried',
-    'non-manuals',
-    'non-manufactures',
-    'non-maoris',
-    'non-marchers',
-    'non-marginal',
-    'non-margined',
     'non-maritime',
-    'non-markers',
-    'non-marqu&eacute',
-    'non-marrieds',
-    'non-marzipan',
-    'non-mas',
-    'non-mass',
-    'non-massively',
-    'non-matched',
-    'non-material.',
-    'non-materialist',
-    'non-materialistic',
-    'non-materialization',
-    'non-math',
-    'non-mathematically',
-    'non-mathematicians',
     'non-maths',
-    'non-matriculated',
-    'non-matter',
-    'non-maximising',
-    'non-maximizing',
-    'non-meaningful',
-    'non-means&rehy;tested',
-    'non-mediated',
-    'non-mediterranean',
-    'non-meek',
-    'non-meeting',
-    'non-men',
-    'non-mercantile',
-    'non-mercenary',
-    'non-merger',
-    'non-merging',
     'non-mesenchymal',
-    'non-met',
-    'non-metabolic',
-    'non-metabolizable',
-    'non-metabolized',
-    'non-metallics',
-    'non-metaphorical',
-    'non-metered',
-    'non-method',
-    'non-metrical',
-    'non-micro',
-    'non-microprocessor',
-    'non-microsparc/non-supersparc',
-    'non-microwave-orientated',
-    'non-midlands',
-    'non-migrants',
     'non-milk',
-    'non-millenarian',
-    'non-miraculous',
-    'non-mirrored',
-    'non-misogynist',
-    'non-missile',
-    'non-mistical',
-    'non-mitochondrial',
-    'non-modal',
-    'non-modernized',
-    'non-modified',
-    'non-modulating',
-    'non-moldavian',
-    'non-molecular',
-    'non-monetarist',
-    'non-monetarists',
     'non-monogamist',
-    'non-monogamists',
-    'non-monogamy',
-    'non-monopolies',
-    'non-monotonicity',
-    'non-monstrous',
-    'non-moonies',
-    'non-mortal',
-    'non-mortgage',
-    'non-mosley',
-    'non-motile',
-    'non-motoring',
-    'non-mountaineer',
-    'non-mountaineering',
-    'non-mountaineers',
-    'non-movements',
     'non-moz',
-    'non-mozartian',
-    'non-mprp',
-    'non-msc',
-    'non-muddy',
-    'non-multiple',
-    'non-munro',
-    'non-muppet',
-    'non-muppets',
-    'non-museal',
-    'non-mutated',
-    'non-nationalist',
-    'non-natives',
-    'non-naturalist',
-    'non-naturalists',
-    'non-naturalized',
     'non-naturally',
-    'non-naturalness',
-    'non-neanderthal',
-    'non-neath',
-    'non-necessity',
-    'non-necrotising',
-    'non-negligibility',
-    'non-negotiability',
-    'non-negotiated',
-    'non-negrito',
-    'non-nervous',
-    'non-neutralising',
-    'non-news',
-    'non-newspaper',
-    'non-nicam',
-    'non-niche',
     'non-nodal',
-    'non-nodulating',
-    'non-non-heinous',
-    'non-nonconformist',
-    'non-nordic',
-    'non-normality',
-    'non-norman',
-    'non-north',
-    'non-northumbrian',
-    'non-nosocomial',
-    'non-notification',
-    'non-noun',
-    'non-npn',
-    'non-nsf',
-    'non-nucleoside',
-    'non-nurse',
     'non-nursery',
-    'non-nurses',
-    'non-nurturant',
-    'non-nutrients',
-    'non-nvasive',
-    'non-objectively',
-    'non-objectivity',
-    'non-obligate',
-    'non-obstetric',
-    'non-obstructed',
-    'non-obvious',
-    'non-occluded',
-    'non-occupant',
-    'non-occupation',
-    'non-ocular',
-    'non-oedipal',
     'non-oesophageal',
-    'non-offence-related',
-    'non-offending',
-    'non-officers',
-    'non-oil-related',
-    'non-oilseed',
-    'non-one',
-    'non-one\'s',
-    'non-onomatopoeic',
-    'non-operatic',
-    'non-operator',
-    'non-optimizing',
-    'non-oral',
-    'non-orcadians',
-    'non-ord.',
-    'non-organ',
     'non-organised',
-    'non-organization',
-    'non-organizational',
-    'non-orgasmic',
-    'non-oriented',
-    'non-originating',
-    'non-overlap',
-    'non-overseas',
-    'non-overt',
-    'non-overweight',
-    'non-ovimbundu',
-    'non-own',
-    'non-owner-occupied',
-    'non-oxford',
-    'non-oxidative',
-    'non-oxynit',
     'non-ozone',
-    'non-ozone-damaging',
-    'non-pacific',
-    'non-package',
-    'non-painterly',
-    'non-papal',
-    'non-paper',
-    'non-parachute-trained',
-    'non-paradoxical',
-    'non-parallelistic',
-    'non-pareilles',
-    'non-parenchymal',
-    'non-parental',
-    'non-parenteral',
-    'non-parenthetical',
-    'non-paris-club',
     'non-parishioners',
-    'non-parliamentarian',
-    'non-parochial',
-    'non-partial',
-    'non-partials',
-    'non-participative',
-    'non-participators',
-    'non-particulateness',
-    'non-partitional',
-    'non-pashtun',
-    'non-pashtuns',
-    'non-pasteurised',
-    'non-pasture',
-    'non-pathologised',
-    'non-patients',
-    'non-patriots',
     'non-patronising',
-    'non-pattern',
-    'non-patterned',
-    'non-pauperizing',
-    'non-pause',
-    'non-pay',
-    'non-payable',
-    'non-payees',
-    'non-pdpa',
-    'non-peak',
-    'non-peat',
-    'non-peerage',
-    'non-peers',
-    'non-pelagic',
-    'non-peps',
-    'non-perfused',
     'non-perfusion',
-    'non-period',
-    'non-periodical',
-    'non-permeability',
-    'non-permissible',
-    'non-permit',
-    'non-permutability',
-    'non-pernicious',
-    'non-peroxide',
-    'non-personhood',
-    'non-pertinence',
-    'non-perturbed',
-    'non-pharmaceutical',
-    'non-philanthropic',
-    'non-photosynthesizers',
-    'non-physicality',
     'non-physicist',
-    'non-physiologic',
-    'non-pigmented',
-    'non-pilots',
-    'non-pipe',
-    'non-pirate',
-    'non-plan',
-    'non-planned',
-    'non-plant',
-    'non-plateds',
-    'non-platonically',
-    'non-plenipotentiary',
-    'non-pleuritic',
-    'non-pluralist',
-    'non-poetry',
-    'non-point',
     'non-polarizable',
-    'non-poles',
-    'non-polio',
-    'non-polish',
-    'non-politician',
-    'non-poll',
-    'non-pollution',
-    'non-polo',
-    'non-polymeric',
-    'non-polymorphism',
-    'non-polypoid',
-    'non-polytechnics',
-    'non-pontificating',
-    'non-popular',
-    'non-porphyrin',
-    'non-porsche',
     'non-portable',
-    'non-positive',
-    'non-positivist',
-    'non-possessive',
-    'non-possumus',
-    'non-poverty',
-    'non-power',
-    'non-practices',
-    'non-pre-emptive',
-    'non-preachy',
-    'non-precision',
-    'non-predators',
-    'non-predestinarian',
-    'non-predictive',
-    'non-pregnancy',
-    'non-prejudiced',
     'non-preordinate',
-    'non-prescriptive',
-    'non-presidential',
-    'non-pressurised',
-    'non-prestige',
-    'non-pretentious',
-    'non-pri',
-    'non-priestly',
-    'non-primates',
-    'non-priming',
-    'non-printable',
-    'non-privatisation',
-    'non-privatised',
-    'non-prize-winning',
-    'non-pro',
-    'non-probability',
     'non-problems',
-    'non-process',
-    'non-product',
-    'non-profit-maximising',
-    'non-profit-oriented',
-    'non-profit-sharing',
-    'non-projectile',
-    'non-projection',
-    'non-projective',
-    'non-proletarian',
-    'non-prompted',
-    'non-propagatd',
-    'non-propagating',
-    'non-property',
-    'non-property-owners',
-    'non-prosecuted',
     'non-protectable',
-    'non-protection',
-    'non-protectionist',
-    'non-protective',
-    'non-protein',
-    'non-protestants',
-    'non-provable',
-    'non-provincial',
-    'non-provision',
-    'non-proximal',
-    'non-prussian',
-    'non-psc',
-    'non-psychiatrists',
-    'non-psychoanalytic',
-    'non-public-school',
-    'non-publishers',
     'non-pulsatile',
-    'non-pumped',
-    'non-punching',
-    'non-pupil',
-    'non-purposeful',
-    'non-q-wave',
-    'non-qts',
-    'non-quadratic',
-    'non-quaker',
-    'non-qualitative',
-    'non-question',
-    'non-question-begging',
-    'non-r',
-    'non-racing',
-    'non-racists',
-    'non-radiated',
     'non-radio',
-    'non-radiogenic',
-    'non-radiological',
-    'non-railway',
-    'non-rainy',
-    'non-rancid',
-    'non-randomized',
-    'non-rationalist',
-    'non-reactors',
-    'non-readmitted',
-    'non-rebellious',
-    'non-rebels',
-    'non-receptor-selective',
-    'non-receptors',
-    'non-recessed',
-    'non-recession',
     'non-reciprocating',
-    'non-recognised',
-    'non-recognized',
-    'non-recoil',
-    'non-recommendatory',
-    'non-reconciled',
-    'non-recording',
-    'non-recoupable',
-    'non-recruitment',
-    'non-rectangles',
-    'non-recuperable',
-    'non-reductionist',
-    'non-reductive',
-    'non-reductivist',
-    'non-referral',
-    'non-referring',
     'non-reflecting',
-    'non-reflectives',
-    'non-reform',
-    'non-reformer',
-    'non-refrigerated',
-    'non-refugees',
-    'non-refusenik',
-    'non-regicides',
-    'non-registering',
-    'non-registers',
-    'non-regrettable',
-    'non-regular',
-    'non-regularity',
-    'non-rejection',
-    'non-rejectionist',
-    'non-relation',
     'non-relationship',
-    'non-relativist',
-    'non-release',
-    'non-relenting',
-    'non-relevant/relevant',
-    'non-reliance',
-    'non-reliant',
-    'non-religion',
-    'non-remission',
-    'non-remote-sensing',
-    'non-reneging',
-    'non-renounceable',
-    'non-renting',
-    'non-rentokil',
-    'non-reparation',
-    'non-repatriation',
     'non-repayment',
-    'non-repeating',
-    'non-repetitive',
-    'non-replacing',
-    'non-replicative',
-    'non-replix',
-    'non-repre',
-    'non-representatives',
-    'non-represented',
-    'non-reproduced',
-    'non-reptilian',
-    'non-republicanism',
-    'non-researcher',
-    'non-researching',
-    'non-reserve',
-    'non-reset',
     'non-residency',
-    'non-residents.',
-    'non-resistants',
-    'non-resisters',
-    'non-resolved',
-    'non-respect',
-    'non-responsible',
-    'non-responsiveness',
-    'non-restoring',
-    'non-restrictable',
-    'non-restrictively',
-    'non-retired',
-    'non-retractable',
-    'non-retractility',
-    'non-returning',
-    'non-reusable',
     'non-revenue-earning',
-    'non-reverential',
-    'non-reverse',
-    'non-revivable',
-    'non-rewirable',
-    'non-rheumatic',
-    'non-rhotic',
-    'non-rhyming',
-    'non-rhythmic',
-    'non-riding',
-    'non-right-wing',
-    'non-rigorist',
-    'non-risc',
-    'non-ritualism',
-    'non-rivalry',
-    'non-riven',
     'non-riverfront',
-    'non-robbed',
-    'non-robotic',
-    'non-rocky',
-    'non-rolling',
-    'non-romance',
-    'non-romanian',
-    'non-romanist',
-    'non-romans',
-    'non-room-sealed',
-    'non-roomsealed',
-    'non-rounded',
-    'non-routable',
-    'non-rowing',
-    'non-royalty',
-    'non-rp',
     'non-rules',
-    'non-rural',
-    'non-ruskin',
-    'non-s',
-    'non-sacred',
-    'non-safety',
-    'non-saintly',
-    'non-sales',
-    'non-salient',
-    'non-saline',
-    'non-salt',
-    'non-santa',
-    'non-sap',
-    'non-sapphic',
-    'non-satellite',
-    'non-save',
     'non-scar',
-    'non-scenic',
-    'non-scented',
-    'non-sceptical',
-    'non-schedule',
-    'non-school-based',
-    'non-school-type',
-    'non-sci',
-    'non-scoop',
-    'non-scot',
-    'non-scratch',
-    'non-scre',
-    'non-scripta',
-    'non-scuttle',
-    'non-sea-going',
-    'non-seam',
     'non-search-using',
-    'non-secretable',
-    'non-secreted',
-    'non-sectional',
-    'non-secured',
-    'non-sedative',
-    'non-sedentary',
-    'non-sedimentary',
-    'non-segmented',
-    'non-segregated',
-    'non-self-regulatory',
-    'non-selfish',
-    'non-selfstarting',
-    'non-sematic',
-    'non-semitic',
-    'non-sensational',
     'non-senses',
-    'non-sensible',
-    'non-sensical',
-    'non-sensitive',
-    'non-separable',
-    'non-separation',
-    'non-separatist',
-    'non-separative',
-    'non-sequestered',
-    'non-serf-owning',
-    'non-series',
-    'non-serrated',
-    'non-servile',
-    'non-settlement',
-    'non-severe',
-    'non-sex',
     'non-sexism',
-    'non-sexists',
-    'non-sexually',
-    'non-sgml',
-    'non-shift',
-    'non-shocked',
-    'non-shoe',
-    'non-si',
-    'non-significantly',
-    'non-silicate',
-    'non-silicon',
-    'non-sindhi',
-    'non-singer',
-    'non-singular.',
-    'non-skier',
-    'non-skiers',
     'non-skins',
-    'non-slalom',
-    'non-slave',
-    'non-slavic',
-    'non-slide',
-    'non-slippery',
-    'non-slum',
-    'non-small',
-    'non-smell',
-    'non-smile',
-    'non-smiths',
-    'non-smokers.',
-    'non-sociable',
-    'non-socialisation',
-    'non-sociologists',
-    'non-socket',
     'non-soldier',
-    'non-solidarity',
-    'non-soluble',
-    'non-solution',
-    'non-somervillians',
-    'non-song',
-    'non-songwriters',
-    'non-songwriting',
-    'non-soothing',
-    'non-sophistication',
-    'non-soundproof',
-    'non-south',
-    'non-southern',
-    'non-sovietized',
-    'non-sparse',
-    'non-spatiality',
     'non-special',
-    'non-specificity',
-    'non-specified',
-    'non-specimen-bearing',
-    'non-spectator',
-    'non-specularizable',
-    'non-speenhamland',
-    'non-spenders',
-    'non-sphincteric',
-    'non-spiny',
-    'non-sponsored',
-    'non-sport',
-    'non-sporty',
-    'non-spouses',
-    'non-spreading',
-    'non-spurious',
     'non-sql-based',
-    'non-staining',
-    'non-staking',
-    'non-stalk',
-    'non-standards',
-    'non-staple',
-    'non-star',
-    'non-stardent',
-    'non-start',
-    'non-statal',
-    'non-state-of-the-art',
-    'non-states',
-    'non-static',
-    'non-statist',
-    'non-statistically',
-    'non-steamcharter',
     'non-stereo',
-    'non-sterilisation',
-    'non-stigmatized',
-    'non-stigmatizing',
-    'non-storable',
-    'non-story',
-    'non-strangers',
-    'non-strat-shaped',
-    'non-stratified',
-    'non-streaming',
-    'non-strenuous',
-    'non-stressful',
-    'non-stricturing',
-    'non-strikers',
-    'non-structuralist',
-    'non-subject',
     'non-subject-specific',
-    'non-subjective',
-    'non-subjects',
-    'non-subjunctive',
-    'non-subordinate',
-    'non-subsidiaries',
-    'non-subsidised',
-    'non-subsidized',
-    'non-subsistence',
-    'non-substance',
-    'non-substantial',
-    'non-substantiality',
-    'non-substantive',
-    'non-substitute&rehy;ability',
-    'non-substitution',
-    'non-substrate',
     'non-sudden',
-    'non-suggestible',
-    'non-suit',
-    'non-suited',
-    'non-sulphur',
-    'non-summer',
-    'non-sunday',
-    'non-supercharged',
-    'non-superficial',
-    'non-superimposed',
-    'non-superscalar',
-    'non-supplying',
-    'non-support',
-    'non-suppressed',
-    'non-supranational',
-    'non-surfing',
     'non-survivors',
-    'non-suspendable',
-    'non-sustainability',
-    'non-svq',
-    'non-swapo',
-    'non-swazi',
-    'non-swedish',
-    'non-swelling',
-    'non-swimmer',
-    'non-swimming',
-    'non-symbiotic',
-    'non-symptomatic',
-    'non-synaptic',
-    'non-synchromesh',
-    'non-syndicate',
-    'non-syntactic',
     'non-syntactical',
-    'non-synth&eacute;tique',
-    'non-syphilitic',
-    'non-tabloid',
-    'non-tack',
-    'non-tactical',
-    'non-tainting',
-    'non-tajiks',
-    'non-take-up',
-    'non-takers',
-    'non-talking',
-    'non-tangible',
-    'non-tanu',
-    'non-tanzanians',
-    'non-targeted',
-    'non-tarnishing',
     'non-task-related',
-    'non-tatars',
-    'non-tautologous',
-    'non-tautologousness',
-    'non-taxonomist',
-    'non-teacher',
-    'non-tear',
-    'non-techies',
-    'non-telepaths',
-    'non-telescopic',
-    'non-tennis',
-    'non-tenor',
-    'non-terminals',
-    'non-terminating',
-    'non-termination',
-    'non-terrorist',
     'non-testability',
-    'non-testamentary',
-    'non-textile',
-    'non-thatcher',
-    'non-thematic',
-    'non-theologically',
-    'non-thermostatically',
-    'non-thespians',
-    'non-thinking',
-    'non-thoractomy',
-    'non-threatening.',
-    'non-thrombogenic',
-    'non-tigreans',
-    'non-timeous',
-    'non-timetabled',
-    'non-tinkering',
     'non-togolese',
-    'non-toleration',
-    'non-tonality',
-    'non-tone',
-    'non-too-friendly',
-    'non-too-gifted',
-    'non-topic',
-    'non-topographic',
-    'non-tories',
-    'non-totalitarian',
-    'non-totalized',
-    'non-touch',
-    'non-tourists',
-    'non-tournament',
-    'non-toxicity',
-    'non-tps',
     'non-trade-distorting',
-    'non-trader',
-    'non-traders/buyers/users',
-    'non-train',
-    'non-training',
-    'non-trainload',
-    'non-tranquillised',
-    'non-transferability',
-    'non-transferred',
-    'non-transfers',
-    'non-transgeneic',
-    'non-transitional',
-    'non-transitive',
-    'non-transmissible',
-    'non-transmission',
-    'non-transmitted',
     'non-transparency',
-    'non-transplant',
-    'non-transport',
-    'non-traumatised',
-    'non-travellers',
-    'non-travelling',
-    'non-traversable',
-    'non-treasury',
-    'non-treatable',
-    'non-treated',
-    'non-tree',
-    'non-tree-hugging',
-    'non-trees',
-    'non-tremolo',
-    'non-trier',
-    'non-trier\'',
     'non-trivially',
-    'non-troglodytes',
-    'non-trust',
-    'non-truth',
-    'non-try',
-    'non-tsr',
-    'non-tuberculous',
-    'non-tumultuous',
-    'non-turbo-charged',
-    'non-turk',
-    'non-turners',
-    'non-tv',
-    'non-tvei',
-    'non-typhoid',
-    'non-typist',
-    'non-u.s.a',
     'non-uae',
-    'non-ufc',
-    'non-ugandan',
-    'non-ultimate',
-    'non-un',
-    'non-understanding',
-    'non-underwritten',
-    'non-unep',
-    'non-unified',
-    'non-union-regulated',
-    'non-unisql',
-    'non-unisys',
-    'non-united',
-    'non-units',
-    'non-universal',
-    'non-upgradable',
     'non-uplifting',
-    'non-ureamic',
-    'non-urenco',
-    'non-usable',
-    'non-using',
-    'non-usl',
-    'non-usurious',
-    'non-utopian',
-    'non-vacant',
-    'non-vacuum',
-    'non-vagal',
-    'non-validated',
-    'non-values',
-    'non-variational',
-    'non-varicose',
-    'non-vector',
     'non-vegetarian',
-    'non-vegetated',
-    'non-venereally',
-    'non-verbal/verbal',
-    'non-verbals',
-    'non-verifiable',
-    'non-vernacular',
-    'non-vertebrate',
-    'non-vesiculated',
-    'non-vessel',
-    'non-veteran',
-    'non-veterinarians',
-    'non-veterinary',
-    'non-vibratory',
-    'non-victimization',
-    'non-victuallers',
     'non-violation',
-    'non-violently',
-    'non-violinist',
-    'non-visualisation',
-    'non-vitality',
-    'non-vocational/vocational',
-    'non-voice',
-    'non-vor',
-    'non-waders',
-    'non-walkers',
-    'non-warping',
-    'non-warring',
-    'non-wasp',
-    'non-watchers',
-    'non-water',
-    'non-weight',
     'non-welcome',
-    'non-welfare',
-    'non-west-indian',
-    'non-wet',
-    'non-weu',
-    'non-wheat',
-    'non-whirling',
-    'non-whitbread',
-    'non-white-skinned',
-    'non-wildlife',
-    'non-wilfridian',
-    'non-will-based',
-    'non-windsurfers',
-    'non-winner',
-    'non-winter',
-    'non-with-profits',
     'non-wood',
-    'non-woody',
-    'non-word-monitoring',
-    'non-work-time',
-    'non-world',
-    'non-worth',
-    'non-wounding',
-    'non-wovens',
-    'non-wrinkle',
-    'non-write-through',
-    'non-xenophobic',
-    'non-yahwistic',
-    'non-yeast',
-    'non-yorkshiremen',
-    'non-you',
-    'non-zero-sum',
     'non-zero/non-unit',
-    'non-zionist',
-    'non-zulu',
-    'non-zuwaya',
-    'non.competing',
-    'non.engineering',
-    'non.professional',
-    'non.verbally',
-    'non=conformist',
-    'non_compos_mentis',
-    'nonabsorbent',
-    'nonabstract',
-    'nonaccountants',
-    'nonadaptive',
-    'nonadherent',
-    'nonaerosol',
     'nonage',
-    'nonaggressive',
-    'nonaka',
-    'nonaligned',
-    'nonamers',
-    'nonanimal',
-    'nonantola',
+)
+
+blocks_65 = (
+    '#!i$#man$"no%!s##jes##ker$#ily%"n\'$\'omindel#%likar#*makhonmadi#!n$(ia-esque&!n##ocz',
+    '%$ichi%#nie&*o-trudovoi&*y-karabakh%!o%!u%"we$!g$(shilenko$$wing%"ly#)ragansett%"re%%table&"ie',
+    '\'1ve&mdash;dramatic).-cum-worldview*Ndiscourse-paragraph&rehy;introductory-particle*&purely)"ly)3s-within-narratives(\'ization*"es\'#zed&*ologically\'(r-author)$hero)\'pilgrim)&reader($less',
+    '$!o%.w&ndash;bodied\',rehy;brimmed,%gauge,&minded&&-angle\'&backed(%odied\'(diameter\'%focus($ront\'(go-wides\'&headed\'#ish\'#leg',
+    '\'\'ranging(#oom($uled\'#set($ided)%ghted(%ouled(%tetch)#ile)&raight\'(targeted(&highed*%nking(#oed($ubed',
+    '\'&winged&$band\'&oat.as*#ing&*ly-averted)(focussed&*mindedness&*s-probably\')houldered$!y#!t$!e$&hecium%$ices$#uby',
+    '$$hito$"ke$"la$\'towicza#%vekar##wal#%zullo"\'s-based#&a-ames%%owned$%/cnes%#esa%#jpl$)l-gastric&\'raising',
+    '&&voiced%"/m%/ly-unchallenged$%riyah$!u#"ch$$imur##dim#-eby-dominated&!.$!m$#ous$%riyah%!y#\'gastric',
+    '$(-trained$0/buckinghamshire%(hereford%-mother-in-law%&orchid%$wife$!a$#dom$"es$\'ishibis$$reen$!s$"ta$+ville-based$!y',
+    '$$cola$!f$/m&rehy;ul-ghani$#ria%%ullah$!s$"um#.jonalgalleriet#"mu#!o$-&rehy;gastric$(temporal#%petti#(r-ed-din$$alla',
+    '%"ds#!s$&aburgh%!r%\'u-style\'(weilburg&#via$!b$#eef%&r-type&#ein&$ists$$feld$"if%%ngton',
+    '$"ma#"te%#nko$(y-minded&%pasty\',iece-of-work&(sounding&(tempered\'&ongued%&bation##uta#!w$!e",t&uuml;rlich#$\'ral',
+    '#%.mur.#!0#\'aatmaja$%chaba$"le&#kin&!s%\'ie-jane&!t$$niel$#tor\'#ial#0chez-on-the-hill#"el#$h-an',
+    '%"n\'&\'-rogers&#ial\'#ell&$sohn&"ya$%erton$$wani#!i$"ng$$oanl%-n&mdash;state&$-not\'\'serving&!.',
+    '\'%third("wo&*al-adorned)%bound)(cultural)-international)%local)&minded))newspaper)(oriented)\'patriot0!s)(security*$tate+#yle',
+    ')*television*#ype)%unity(,/cornerstone*\'ultural)#lea*$ocal(#_up("an($bank(%e-fln("is*"m.+)/national*/t-particularist',
+    '+)/unionist+!e,!s+-ically-minded)(ty-based()ly-agreed,\'pproved+\'centred,*oordinated+\'defined-%vised++established+-headquartered+&minded+)organised',
+    ',$wned+&ranked*!.(%power(/rat&mdash;lower("s.)#gen(\'zeitung&&choice&\'galerie&"hd&*s-brokered(#led)#ike(&states',
+    '\'\'.change\'\'/united\'%bank*\'%tates&)wide-firm*!s$#tia&$ngou$)ve-indian\'(language(#ike\'(speaking($tyle\'%white&+/non-native',
+    '&"s.%$ised#$land#$mags%"uk#(o-backed%&europe%&warsaw#"ra$"el$,on-cellulose&$atum#&sagiyn$&ional\'$#uka',
+    '#%terer$$heim$"ie%$nger$"on$!s$\'ukottai#,ur&rehy;ally%%-ally%*al&rehy;do\'!\'\'%-born((coloured(&enough($feel',
+    '-!s*&nished(#law)#ike()resources\'%/grey\'#eza\'!i(!a(#ses)*t-explorer3!s+)passenger*,ic/realistic*(s.orford',
+    '\'#ly-**harmonious*#lit*(occuring*&reared,*generating\'%mente&!m&"ns&"ta%>e&mdash;secondly&mdash;whether\'(rehy;god&!-\'(coloured\'%given',
+    '(#ong\')identical\'&lovers\'$made)&laysia\'\'printed\'\'spirits($tudy\'%trail\'"uk\'.versus-culture\'&writer\'$xxxx&(/culture&$lles',
+    '%*geschichte%%opath%+selbstdruck%#vei%,wissenschaft$!s#$zins$&weiler"%uchny$!k##der$!i#&fragar##ges$,ht-excluding',
+    '($word\'!.\')_in_terms#$heim#&kratis#%llses##mov##net#&pactus%$ktos$$lion##roz#&sating$$eate(!s',
+    '%%ously$#had%"ki$$ikaa#!t$"ae$"ic&(al-style("ia("ly%"ka%%lused)!s$!t#*wara-eliya',
+    '#$-aid$#com$#sat#!.#)/observer$\'plotter##aar$#hos$%l-air&$base&\'looking%\'apitiya%"is\'!t$&pasham',
+    '%#ese&#tte%$ious%$khon%%rette$!s#-com/autopilot#,e-ristorante&#oof$"en$!h$,l-defluffers&#ill&$lint%!i',
+    '$#tte$"xs#!i$&azenya$$cula$0gating/surveying\'-or/bomb-aimer*\'plotter*%radar)#ium$$star#"li#"on#,r&aacute;til$$atan',
+    '$#oop#)unisaravi$"th##vie$\'y-style#"y\'$$-air%$brat%(coloured%#ink%#run%\'schemed&%tores%\'trimmed$(/marines',
+    '$$1n/a$$blue""w.#%abkot%$zadi$"la#"ch#"dc$$dach#!r$$ocki%!z##waf"$xers#%iades',
+    '"(y-sayers#(acakalou$$kkar#"ee$!r%!a##ika#"la$!e$#ors#$pcas$"ic#\'uguhora"!z#)ar&eacute',
+    '%/bayev&lt&dollar%!e&"no&!t&!v%#ine&!o&"te%%vayev##eem$$lden#*g&uacute;l$"ul#*i-approved%)dominated',
+    '%\'imposed&\'nspired&"sm%*supporters&*ympathiser%$type$%anzen$"fy$#ism$%onali$#pov$%unali%!r#"li##mir',
+    '#%riyev#"ti#&zareno$"ie$)jonalista!"b."&090143"!7""aa##med""d7"!l""ot"&rf-pir"%there',
+    '"!x##840"!y!%c/cnc"!1#$1043#$3347#$4932#$7368#$9904"@3&verbar&verbar;a6&verbar&verbar#$458e"!4#"6v#"9v',
+    '$"kc"$855y$"6y"%98648"$acss#"ms"#b11#!i""c.#!/$$esrc#!a#!n#"op#!p',
+    '"$d14c$"5b%!r$"9c#!t""e4#(phalitis#.t-administered""gs"#hip#!s"\'i-fcrdc#%=0.68#!a#(lchenich',
+    '"!k"\'le/baal"-md-affiliated""na$$mara"(oi-bamhi%%pvuii$%/saci$!c#(nclusive#"pf"#p12#$7:in%#rna%(template',
+    '"&r/adds#!c""ss#*y/orthodox"\'t/amway#%c2062#!s"%voand#)q/scotvec!)d-isotope"%1-nd5"!2"!3"\'=0.7219"%adaye',
+    '#)rihoranye$\'uzaniye+\'primary#!w#(yiragije"%ebele##gwa#!r#!v""ia#+kumanawomen#$oroa#"s-"!l#$ovus',
+    '"!n#)&ndash;1t"#oto#!w$!n"!r#&agheta#5so/schmidt-isserstedt""sc#!p#!z"#uka#"me#"tu#$wayo',
+    '"&wandwe!+e&ndash;130)"sw#$plus"%\'erdy%\'theless#!r"!+"!-#"er#"ne%&idhart#"sw"#/3e"$1000',
+    '#!9"!2#!6"!3#!7#!9"A4&verbar&verbar;bd5&verbar&verbar#!9""6+"!8"&a-free$)supported#$cail$"ra$"sa',
+    '#$fsey#,gle-starring$"oe$!u%!s#%l/hms$&e/flat&"gp&1president/student&#wye$!l%!y#"mp#-nderthal-like+%ensis',
+    '#.r&mdash;market%$rehy)(;despair+\'isaster0$rous+%uties*&foetal*-revolutionary*\'synonym1!s**unbearable,$ique$"\'\'$)-&pound;1-".5',
+    '-!m,!5%"13&!4&%5,000%#20%\'!0&!4%!3&!0&#4pc%&40,000%!5%(abortion\'%sence',
+    '\'&cident&"nd\'&tiques&*pocalyptic(%plexy\')propriate&+rithmetical&)s-damn-it&&t-hand&\'utonomy%$bank\'(silectal&(lackness\'#ind*$ness',
+    '&(reakdown\'%ibery(\'lliance%(cadavers\'\'nonical\'"sh\'*tastrophic&*ertainties&$haos&$lean&&oastal\'+mprehension\',ntemporaries)%inent&$rash',
+    '\'\'rwinist&%eath-\'(finitive\'(generate\')ification*"ed\'\'lirious\'&mented($onic&*ictatorial\'%polar\',sintegration(&missal(%tance+!t',
+    '&&rought($wned*$ings%\'endemic&%quals((i-status)"ty)\'valence.!t&%scape\'+tablishment&(xcellent(&lusive\'%tinct%(fainting',
+    '(#ous\'&rcical&%eudal&*luorescent("sh&&oreleg(&giving\'&urfold\'$veal&&rantic((tricidal\'#ont%)geometric&%hetto%+hagiography',
+    '&%eroic&(omicidal(&ophone\'%rizon,#tal&\'ysteria%(identity\'&leness&%mages\'&mortal\'(passable()enetrable&+narticulate\'+carceration(\'oherent',
+    '\')dependent(#ian)(fference(\'ustrial\'&edible()xtricable\'*flationary\'%stant,&aneous\'\'tegrity)(rminable\'(vincible)(sibility,"le&)rreverent',
+    '%*landlocked&(egendary\'#vel&#ine)"ar+#ity\'%teral\'"ve%\'magical\'%rxist\')sterpiece\'%ximal&,editerranean\'%eting\')tamorphic',
+    '(+ominerallic)(specific($ster%#net&(ightmare&%ovels&&uclear%)obscurity&&ptimum%(pacifist\'&rental\'%ssion\'*thological&#eak\'\'rmanent',
+    '((secution&#ink&(riceless(%nting\'%ofile&%uppet\'"re%\'quarrel%)rebellion\'&lation+"ve\'%plica\'&sidual((triction\'%union',
+    '(*olutionary&/oom-temperature&#uin)"ed)!s%&sacred)%ilege\'$ints\'%tanic&%enile((sational&(hapeless(#ven&%ilent\'%milar',
+    '\'"te\'!x&$mile&&obbing\'&litude&$pace\'&ecific\'\'herical&%quare&\'tagnant+$tion(%ndard\'#ill\'&raight)$nger',
+    '&)ubmission(%urban\'&icidal\'(pporting&\'ynonyms%\'teenage\'$nder\'\'rrorist&*he-knuckle\'\'reshold&!o\'%-hand((the-soil\'\'othless\'!p',
+    '&*ransparent\'(iggering\'&opical&$wice\'!o&&ypeset%+ultraviolet&(nanimity\')conscious\'*iversality&&pright%(vagrancy&%ictim)#ory\'$rgin',
+    '\'!r&\'ellbore&(orthless%$zero$$/far$.er_,_nearer_to$\'grounds$!i%"n\'$!l%&y-bald($lack\'\'clothed(\'omplete/!d',
+    '(&xposed\'&flying(#ull\')invisible\'$kiss\')legendary\'$pure\'%right\'\'silence.!s(%quare(\'teaming\'%total$(monopoly$&nesses',
+    '$$time$#ula$(verbatim##son#\'t-boned%#cut%\'growing%&houses%,safe-looking%\'trimmed$)e-stidson%$ning$\'h-based\'#orn%-/pontrhydyfen',
+    '%"34$/ly&rehy;clipped,#set&\'-belted($ound(&rushed(\'uttoned\'\'chopped(&oiffed\'*dovetailed\'(featured\'$kept\'\'pressed\'\'stacked\'%taken',
+    '($yped\'&worked(&ritten$!s%%-foot$$work#!u$$fles$!m$5phle-le-ch&acirc;teau#*ve/medical%!s"\'bbishes#$eker$!l',
+    '#-lagonadezhnye$#ett#$mare##out#\'phetyre#*raska-born(!n#"ss#,uchadnezzer.\'&nezzar$%haler$%lance&#ria&!s%#ee.',
+    '\'#ers\'#ing&#zer%\'osities&&usness"(c-funded$,manufactured#!.#+/birmingham$$mips$#oai#!a$"re%"ne$"ti',
+    ')!y$3hi-ghiri/unemployed$!i$\'riminal$\'ssytyes#\'es-sary%#sar("ee(3ily&ndash;literally+#_in)"um(%y-and)!.)"in&%ement',
+    '\'0tat&lsqb;ed&rsqb*#ed.($ies.(+y-relations)!.$#tur#$hacv%$nsky%+yev-maltsev$(iporenko%$rvan$$tain#"ip#.k&rehy;ghostly$)-amphorae',
+    '%$band&&inding&#one\'!w&\'reaking%%chain*!s&%loths%&edging%#fur%%hairs%$lock%\'mounted&&uscles%)ornaments',
+    '%\'reining&#uff%%shaft&#ide&%train)!p(\'etching\'#ump&&upport%)thrusting&#ies&\'o-ankle()headstock(\'nothing\'!p',
+    '%%veins$!.%$with$\'/action%$chin%&throat$"am%(rstadion&(westheim$%brace$$care%$hain)!s&#ops%%loths',
+    '%&d-down$+f&mdash;ers%"ul&!r$$hole$%lace\'\'#ing$$roll$%strap$%verse$$weed#\'ligence##pwa#+ro-cannibal&&sadism',
+    '%%nomon%%phaga\'#ile)"ic+$ally&\'olistic&)sy-proven%%sanct&$cope%%toxic)!n&%rivia#&t\'rins$!a%"r-',
+    '\'*collecting\'&eating\'%laden\'\'robbers\'\'seeking($purs\'\'thieves&\'.filled&"ed&$inia&(oscordum&!y$(ocariids%*phrynoides%!r',
+    '%#sis#$ulai"%dbank#&erburg%%hutte%%koorn%.land&mdash;cpn)"en%%molen$!v##ith#%jelja\'"na#)o/msc/bim#$rick',
+    '%#ish$$/mc4#$wick""e-##bin$"or&!s##cct#$d\'st%!t$!-%(assessor%&driven%$fire&#ood',
+    ')#ing%"of&)rientated+"ed%(reducing\'%lated%*to-be-paid($have$%/dare%&luxury%$want$"_a&!t$$abed$,ed&mdash;see',
+    '\'!s$%iness$,le&rehy;like&%-beds\'$case\'$fine\'%grass\'%heads\'%knofe\'&leaves\'&pistol(&ointed\'&shaped*$ring(#lim',
+    '($hins(#ips(#ype\'$weed(#ork&&points\'$unch&"s.($aids\'%sness\'%tripe&&worker$!n%"a\'$"s-',
+    '&\'focused&\'meeting&(oriented&\'related%".9%*/abilities\'%ccess&%goals&(problems&#who%$:the#(eeeedddd#!f#!k#"ls',
+    '$"an$$rana##nht##red$$hout$%ijsen$#uam#!s$#den$"ha$#ick$$kens$#ons#"te#!v',
+    '#!z"$fa-c$&mostat$#nda&!i#&ertite#!o$!s#!s#$yews#$zawi"&g-like#".i#&a-volt$"di',
+    '$#rty$!t%%eable%*ive-energy)!g)-reinforcement)\'sloping)*work-hours(!/),unfavourable(#_in(.s&mdash;yellow\'$ity.%"or\'!y',
+    '#(entropic$"re##hme#$ible$#dal\'!s$%gence$%table#.lected-looking)!.\'#ion$!i%$able%#ble%(g&eacute',
+    '&+ence-latent+(personal+*structural*(.clauses+)decisions+"in*!s("t.*#the&\'ibility(,le&mdash;and#!m#!o$&ciants\'"te',
+    '(#ion&"os$&tating%#iat(#ed.(#ins)-on&mdash;even+&s-wise*!r(#or/++interpreter&"um$\'vanovic##ram$%eiros',
+    '%!s&"se%!t&!e$#ito\'"iu$*o-quiagara%%phobe%\'s-based$!u#"ue$"ib&!e$\'s/union%!e',
+    '""h.##ari#%emial$!r"%i/abb##bel#"ce##der$%hardt##fer#&gbours$/h&rehy;bourhood%0bour&rehy;liness)"\'s)(-joining',
+    '*&states)./cousin/friend)%hood-.\'council.%level.&thanks.%watch))ing-group)%s/pwl+&square*#hip&!r%!t$$ther##lan',
+    '$\'d/water$\'l/chief&&worker%!s%!y$)sen/clean(&oxford%)on-tivoli\'&/clean\'!s%$town$!y#$mark#"sh%(/glasgow',
+    ')!n#(trophils$"sa#"va#(zvestnyy"#jat#"ia"!k##eer$#mte#&rassov$&opolis##tar##yon##zad',
+    '##der&0/gloucestershire$%oreth##ida$#gan%!h$)on-batian##kar#&l\'arte%(infarcto&%talia$)-breuning$!.$"ee%!s',
+    '&!.%#gan$!o%"re#"me%(s/father\'&mother\'(speeding#!p##sey$(on-smith&$/aea\'(producer((ublisher\'%renzi',
+    '#$tino"$main$&nthias$\'ticides%\'obrycon&+de-infested&$llah&&morphs%%zadeh#!e$!a$(rocallis&"us&!v%$tean',
+    '&#ine$#sia\'!s&"us%*k&uuml;rty%&trinae$#tin#&i-like$"ca$!n%!e$$tsas##ois$"ne$%phila',
+    '%#osa#%pnett#"us##zet"#nce#"da$#ick#"et#"ia##nen$"ie%"us##sey$#orb#!t',
+    '$#ori#&uphars",o&rehy;natal)(platonic#*-agrarians%%lpine%&ngular%,ristotelians$&basque%+ehaviourist&)njaminian%\'iblical%(olshevik,"sm$*capitalist',
+    '*#ism%&hinese%*lassicists%+olonialists("ur&*nfucianism\'+structivist&(rinthian\'(poratist$\'dadaism*!t&\'rwinist%)emagogues%+ictatorship&#sco',
+    '%*uvalierist$)edwardian%\'gyptian%*lizabethan%&uropes%+volutionist%-xpressionists$&fascim%,unctionalism0!t\'+damentalism$)georgians%)othicized%)rammarian.!s',
+    '&%ecian\'"ek$(hardcore&%sidic%\'egelism%&ittite$(imperial\'+ressionists%)ndustrial&.ternationalist%,solationists$%janis$\'kantian+#ism%)eynesians',
+    '$*magrittian&)lthusians&(nichaean&%rxian%*ccarthyite%$odal\'#ern*$ists%%ughal%%ythic$)nashville&)tionalism.!t($vity&&zarean',
+    '%"eo\'(-realist%)ineteenth$%opera%\'rthodox&\'weliian$(palatial%)etrarchan%)lasticism\'%tonic+"st&\'uralism%*rogramming%*sychedelic))oanalytic',
+    '$0ravel/poulencian%&ealist&&ptiles%$oman$*scholastic-#que%$eder%\'inecure%\'kinhead%(ocialism%+travinskian%(uedehead&(rrealist$(thominst)"sm',
+    '&"ug%.raditionalists%\'yrolean$)universal%*tilitarian$-velikovskians$*walarasian\'&rasian%(eberians$$xxxx$&yuppie$\'zionism*"ts#(adjuvant$+rsphenamine',
+    '#-bouillabaisse#*capitalist%+tastrophism/!t$&hromis$&lassic*$ismo$%olony\'"rs%*nservatism%&rtices#(damodeis$)ymium-143#\'elitism#\'fascist',
+    '##gel$)rammarian%$owth$&tiated#*liberalism*!s%!e#\'marxist$&orphic($osed$%ucisa&#osa#(n-bright%$pink%(shrouded',
+    ')!s%&tinted$)atologist-!s*!y$$fair$(omianism$#tic#&pastel%*thetisches$7entenyl-glycolsuccinate%)trolistes$%hobic%#ron$)lasticism',
+    '$)rene-clad(&/lycra%#ine$\'tolemus#\'realism%$ctum#!s$(ilicates$%phere$)trongylus&\'uctural%%ymine#%tenic%+ropi&iuml;a#/vascularization',
+    '")pal-india&(pakistan%&.after$$ntha$$tali%"ic#%enthe(!s\'%icola)!s$#tas#!h$)elauxetic&!e%+w-made-good',
+    '\'"ic%#oid#%lyuev#\'o-idols$*tistically#&p-plus$!e#\'stadion#%tunes&$ians"%qrita#(uissimum"(r&oacute#$abus#%budda',
+    '$\'kenrath#\'d-speak$!o$#rum#\'eabolls$!d%%itski$!o$&tljani%&vanski#"fs#!g$#ina##ida$#nes',
+    '#!k#$meen#&nstian#"o\'$\'/thabor$!c$&nianum&!c#\'tchinsk$!s#$vaux$-e&rehy;centre+\'racking%(-blocker\'\'reaking',
+    '*!s\'&luster\')onvulsing&(damaging&&eating\'7nds-shredded-into-mulch&\'fraying)%zzled("ee&\'grating&&muscle&$nets&&points&&racked*%ingly',
+    '\'#oot&,shatteringly(&redder,#ing\'\'pecific\'*timulators(&orming&\'tearing\'#ips\'#ree&\'wasting\'&racked(&ecking%(breakers%%glove',
+    '&!.%&tonine%)wracking.$!i%!i%$ness$!o%)us-making(&system.!s\'7/alluring/self-obsessed(\'excited(&hiding\'"ed\'#ly\'',
+    '$"us#!w"#saf#+bitt-dufort\'\'/oxford$#yen#(cessarie$%iendi\'!s#!e$+r/organiser##ham%!t#"in$*tanebasher',
+    '#"ko#$pray#%quick#\'sameiek$&essary$\'iephant%%teras$#lau%"er$#uno%\'s-shirt#-t&lsqb;s&rsqb%-rehy;building*(cleaning$!-',
+    '%#cup%$eggs%*feathering%%holes%\'keeping%%owner%%to-be$%/kobe$#box\'!.%\'reeding%\'uilding$#egg%!l%"r.',
+    '$!l%0&eacute/rowntree%*e-rowntree/!s&"/1&&d_near$$mate$(orianism)!s$"s.$!y""t-$%asset$%bound$(catching',
+    '%#ord&\'verings%$ubed&%rtain+"ed$(infested$#men$*of-benefit$"pc$$time%!o$(widening%&orking(!s#\'/master',
+    '#$anya$&singhe#%bench$-ios-compliant\'"es$\'ulletin#%class#,director/vna#!e#$flex#\'gateway$$roup#!h$%alide$*er-regions',
+    '($orld&$avon&)coat/rspb(!t)*t/cherwell&$hose&+lands--each,\'chaired,#led\'$ends&$mill&"ne&!s\'$eale&%thong',
+    '&"ud&%waite\'#ent##ifa#"ka#+lab/manager$"ib#$make%!n$%inder#*oeducation$!l#$port$$rint#&rasess',
+    '$"ix$#ope##sai$"ky$#man%"en$#ova$&tation$$ukes##tas$#ies%%ngall\'!s$+le-clearing\'/rash(urticaria)',
+    '&(/tractor&/bed/oxfordshire&$ford&$some\'$tead&#tup$#ows$$work#\'view/pc#*ware-ready(&to-lon\'%/flex$\'ise-sun\'$/sun$.ork-affiliated',
+    '((building(\'centric(\'enabled-#ing(#fed)(ormation(%layer()operators((specific(\'to-pabx\'$.e/c("so\'!/()transport\'$able',
+    '\'%files\'+ing.windows*6/cohesion/coordination\'\'s-which(*.microsoft)#the(\'/relarn(&tation\'!y$$ware#%zarim$!e$#ler\'+agriculture"*u-isenburg',
+    '%#ten%!u#%cleus#)e-galerie$&ngamme#%fahrn\'&wasser$&chatel$$lize#.gekr&ouml;nten$%raben%&oschel##hys#*illy/seine#%kolln',
+    '##man&"ns%"rk$!s#&nherze$#ten#%raker%"l-\'&driven\'(specific\'$tube&$gias&"ly$(ectoderm%%gulin',
+    '$#ite$"o-&*anatomical&-consciousness&,degenerative\'(isruptor&*electrical&*linguistic&(muscular&*physiology\'*sychiatric&+radiologist&(sciences\'\'urgical\'\'ymbolic',
+    '\'+ransmission%*anatomists%)biologies&$last*!s%\'chemist,Dry/neurophysiology/neuropharmacology&&ranker%*depressant\'+velopmental%0ectoderm-derived&\'lectric&"ns%(fibromas,%tosis',
+    '%&haemal%&immune&+nvasiveness%\'ligists\'(nguistic%#mas(!t&)odulation%\'n&mdash&%-free)&iendly\'%glial\'$line&$ally%,pathogenesis',
+    '1"ly."st)!s&,harmacologic2"al\'"il\'&ysical&$ilar&$ogon&)rotective&.sychologically/"st&$tera)"is%*regulatory',
+    '%!t&$icus&,oxicological&$rope%(vascular$\'tophils#"se$%idler%$edel\'!l$"te&$ttin%#ift$#uss#"t.',
+    '&#ism$$here$!o$&ragena\'#one&)l-current()flavoured)#ree(&umpire\'3isation-provocation)$tion(+ty&mdash;is(\'zations\')ly-minded%!e',
+    '&!k&+no-catching(!.&$onor%$omed&"n-\'!.\'#ium\'#s-o)*supposedly&+transmitter#"va$.ille-de-poitou(#tte##yen',
+    '&!s$#nas$#tia#)e-rending$"er$,r&ndash;mind%\'-absent&&before,&-heard(&ttered&(changing\'(larified\'*onsummated&)discussed))heartened',
+    ')$well&&easing\')ndingness&(flagging&%green&)happening&+implemented\',n-a-lifetime&(marrying\'#ind&$nazi\'*ever-lands&)on-sunday\'\'rdained&&pardon',
+    '\',roperly-seen&.quite-finished,&healed,%known,&stated&$rans\'*eferred-to(&leased&)satisfied(-y-die-ishness\'*een-before(%tting\'\'leeping(0ow-on-the-uptake\'&mokers',
+    '*$ping&%to-be+*-completed,*suppressed,\'written()uch-earth,%woman&*very-alert+(fetching&#was)%-been\'$eary%(_a_great&$even%%beens',
+    '%$mans%!n%"ra%\'s-autun%"th\'!e(#lss$!s%(/stephan%"ky#"ia$"ca$(l-lee-ee%*le/breeder&!i',
+    '$&rapine$)s/glencoe%#ian%#kya%"si#(ozmozhno##ros$"uz#%sehir%%tovic#"ys##zat"+w&rehy;ball)\'fangled#)\'s-letter',
+    '#&-angle$%baked&$thed%#oat&*rn-looking&$ught&"ys%\'ursting&&siness$#car%&ollege&#mer%&reated%"ut$$dead',
+    '%&ialect&(scovered$\'engaged&(terprise%"ra%%urope$&fallen&\'shioned%&iction%&ledged%%ormed$\'gnarled%$reen$(invented%"sh',
+    '$#key%$ids-&$lled$$loom$#man\'$ager&$rket%)embership%$oney&"on$\'opening$&peeled&$ncil%"in%\'loughed',
+    '&&oducts\'%perty$(releases%$ound\'"te)!r$&seeing%%haped%*ightedness\'$ning%$lain%#pun%&tarter&$yled$\'tangled',
+    '&#wns%%urned$(visioned$&washed%$orld)&liness$+yeares-gift$,zealand-born#!.$"by$%group$!l$$mown#\'/modern\'%ified',
+    '$\'renewed$*secondhand%$heep%(ynthetic$*unfamiliar#&acstle$"dd$"rd%,k-upon-trent&\'/cancer&!e&%shire%!m%!t#%beats',
+    '%"rg$%iggen\'%in-by*+in-teesdale$(orn-size%$ttle$*ridge21pts$(uildings%$rghs&\'y-based\'\'/garden(&thames%!s$(y-fraser#!c',
+    '%!l%"st\'"el\'1le&ndash;carlisle0)liverpool)%-born*(carlisle*(liverpoo*-on-tyne-based*$scum+)underland*$type**under-lyne+)pon-tyne.)*.upon-tyne',
+    '**arse/leeds*,chelsea/west*(gosforth*6leeds-cardiff/plymouth)!2)%based%#tle$"ey$"o.%+/management%"de%2mbe/russell-cairns("rs&*ers-gossip*&locals',
+    ')!.#\'dust-up#\'ell/115\')gallagher(%loucs(&rendon.+-springhill\')volunteer%!y$$nden$(r-ending%#day#&farmer%"st#0gate-sequestered',
+    '$#eat$$raph#1haven&ndash;crewe/%leith/(seafield$#eed$#ill$=nam-on-severn/gloucestershire$-ouse/glosters#2ington/oxfordshire%!t$!s$&tt/mbe\'(sergeant#$leaf',
+    '$#ine$"ow$3y&rehy;cosmopolitan+&merged+(released-%tired%+-acquainted\'\'dmitted\'(nnounced\')rrived-at+#ing\')ssociated\')ttributed\')utonomous&\'beloved',
+    '(&stowed(\'trothed\'%lazed&&carved\')hristened\'%oined(&mbined(&nceded)\'figured)&nected)(structed)&verted&)decorated(*mocratized((rationed',
+    '(\'scribed)\'ignated\'(iagnosed()sembodied)&played&(emergent(&ployed)&owered\'&ngined(&hanced(*thusiastic\'\'quipped\'&rected\'&volved\'&xcited',
+    '(&panded&+fashionable\'(ermented\'&ledged(%oated)$oded)"wn\'%orged)$ming*&ulated\'%rozen&&gained\'%lazed(,ued-together\'%round',
+    '&%honed\'#ung&\'illegal\'(mportant\'+ncorporated(&digent)+ustrialised(&fected((tegrated&&joined&(knighted&)laundered\'\'icensed($fted&,manufactured',
+    '(%tched)"ed)$ured\'$ixed\')odernized(#wed&)organised,#zed&(patented\'%enned\'%laced)$nned)&stered(&oughed\'#oor',
+    '(&werful\'(roducing)&jected&(quarried&&raised\'&ebuilt(\'claimed(&fitted(&gained(\'legated(%named)&ovated(%tired(&united(&vealed',
+    '(%eeted\'$lain\'#old\'&tirred(%ocked($yled&&tested\',hatcherising\'&rained\'$yped&&united\'(rbanized&&wedded\'&idowed\'%orded',
+    '%%fired%)installed%#wed#$made%*n(reprise)&%-carl&!/\'&county\'$race&$ager&#ite&!s%#rk.\'*et-trained$#ent',
+    '##nam$-ham-on-severn\'0/gloucestershire$!s#2oed1&ndash;newoed24!6&!3\'.&ndash;newoed7&!4&!5&!6&!7$#und#\'painted$#hew',
+    ')$rewe(\'gresham(*to-bermuda\'&/gwent\'!3\'!9(#pts#%roses$\'y-based&*to-dundalk#0s&rehy;gathering*2papers/amalgamated$\'-agency)"ts%(bulletin',
+    '%$desk%%event%(features&,rom-peshawar%)gatherers%\'hustler%(in-brief%%leaks\'%tters%(magazine\'#ker\'(nagement%%os4.2%)pictorial&)resenting',
+    '(&gramme(&viders%\'reading\'#els%\'seeking\'%llers\'%rvice&#hot&$tyle%$time&&rained%%worth*!y$\'.papers%%still',
+    '%$chat%(informal%%media%&sports%$wall$&5000tg$(agencies(0t-cum-sweet-shop)-/tobacconists$%bills%$rief%$ytes$(clipping(!s$#fax',
+    '%#ilm%0romnowhere(1889)$(gatherer$%heets%"ot&"ur$#ier&!s$$less&-tter/magazine+%paper%#ife&&ne/041$&market$#net',
+    '(%lukic(\'newsome()on-keeper()wetherall%\'n(1953)&$/fan\'&nicola$,paper-buying*(research*&stands*"to+#ype*&worthy+&rapped)"/s',
+    ')&person)\'s/books+(radio/tv%%hotos%$oint$\'reading&#vue$(srrelmax$%teads&!l%#ime$%write)!r%&s10-12\'$3-16',
+    '\'$5-17&!2&$6-10#(t-mating$"ie$#oft%,n-compatible\'$dunn\'%lowry\'\'on-ouse*(the-hill.$moor\'%smith\'/under-roseberry&$/115',
+    '\'&mother\'&parker(.hysiotherapist\'(romanian)#yal\'\'widower&%abbey&&butler&"er&&ianism\'"te&"s/\'&tewart%(wn-based\'&butler',
+    '$"ry$$ware##var$%ector$#iew\'!s#!y$\'ddiannu##zam$,ealand-based"#xcd#"t-%$best&%ottom&&ut-one',
+    '*)to-crying&!r%&higher%+instruction%\'largest&&ongest%$near%*preference%-to-impossible($last)%owest(+nothingness((the-skin%$very$#age',
+    '$#job$(stations&,ep-for-intel#$uses"$ycho##lan$"in#$ther"#zar#%emmut#.had-hosseinian#"ih$&ntombi#!u##val',
+    '#"a3$!t#-environnement#$il2a#%k&bgr"#.12$!4#!4#!5#"ii%%hj711%!s$!s"$/bnp"&200c/s',
+    '$!4#%50c/s"!3#C&verbar&verbar;nc6&verbar&verbar;18"&400c/s$"61%!5$"76#%50c/s"$6-h7##504"$7007"#910##283"!b',
+    '"\'er/scdc"&i-type#!l"$mead"\'ol/care#!r""rn"%s-run#!s#!u"!v"#yfc"!z!&g\'weno"!.',
+    '"*/&micro;l.#!d#!h#"nl"!1#!0#!2#!3""24"!5"!6#%17207"!7"!8"#ael',
+    '#$kane#"la$!o#"mi#"na%#san$"ga&"la%!o#4ound&eacute;r&eacute##rba&"ye$$doum$$iman$%nayal',
+    '%*kiyintwali#"ti%!a$)oroirangi#%wethu"$baka$"se"$c253#$3079#$4535#$6814##obo"!d#!c""e2',
+    '#!i#"le#"ma#+ndabanyikwa.&public&%yhoyo$(zebuhoro,-communication#&rnmuen"+hetinhensis#"on"*irabatware$#iye\'&labour$!o',
+    '"!k"\'l-based")o-managed$)supported##/un#"ma%\'-foutou#"ng%!o$"ya#"ra$#oro#*theeconomy%!o#"ua',
+    '"$qika"!r"!t"%uesso$!z##lia#!m$"ba%!e#"ni#"oi#"ti"#vs."$weno!*h/ala2(co)',
+    '"#904"$adau#$ngar$!h"!c"!e#!k#!l#$m337"!f"&lanhla#"pa""on"#pcc"(s-funded',
+    '$#run$%speak#!.#(/deprive%#hss#"ta"$uong!,i&ccedil;ois#)ntilde;os*$show"#-br##cad#$ight##men#!p',
+    '"$/boe"#106#!3"#211""9."#:ce"#aff#%garan$"re#$lson#!m$$anto#&nakoro$!g$#ias',
+    '#!r$#una\'!s#$sami#!t#!z"$bbed$"io$$ler\'$!y#%elung(!s#$lets$$icks#"us',
+    '$%demus$$nder&#ros%"or$(ragua297)#nos%&dipine$!s%"io%$trol#+c&ograve;lo$!o%$lino&\'ls/west#.e&rehy;looking',
+    '$+-c&ocirc;te%$girl%$like%&minded%=quiet-guy-who-lives-next-door%\'to-have($know$$_but$%anile$#guy$"in$-ly-brought-up\'$made\'\'painted\'\'rounded',
+    '&!.&R_but_if_i_asked_them_for_anything_it_was_as_though$"ns$%phore$)r-looking$+st/nastiest#!h$/e&rehy;marketed%)-audience&)marketing&(specific%"ly$&ibutsu%#con%#las',
+    '$$oals%*l/browning&"ae\'\'s&mdash.5;alison&mdash;absolon((-creaney)\'jacques(\'.saints(\'/barnum))fairbairn))principal*!t(%hayne&!f&*l/browning',
+    '\'(s-palmer()/asbestos*#von&,s/headmaster\'0on-lailey/sickle*%style*\'trained)!.)(/provost*$rspb%&poulos$+tabstimmbar%"ig%\'raucher#&iciana',
+    '#,k&rehy;named$%-farr%$nack\'#mes(#ing&%icked%,of&rehy;time%9picky-wickety-pingle-pang$!e%-l-cobalt-iron\'$poor\'&silver)#zed(\'melting&(/cadmium',
+    '\'\'retired&&fucker,!.&"ls%"rs%!y$$hame$#ick%"es%"n\'$#las%$ebys%!o$\'nackery$$olas',
+    '$&stream$6y-picky-diddle-poo-poo#!l#\'o-esque$#dim$#ise$(l&ograve%$-don%(/harrier%#aes&$isen&"os&#rde&+s-quinibert\'%hayne',
+    '&!y\'"ev%#eau&"ne&)t/siemens&#yva%!i%$otte$&machus$%polis$%tania%&ianias&(ne-dosed)%laden(&/lower',
+    '#(rophorus%%wells#"ta%$tion$"us#&ulescu)&-mazil"#ddk$#men$+rie/bingham)(runstane$!y#%ecker$$ffer#"hi',
+    '##men#,o-carboranes#)ri-levkas#$uari$$lans"\'e-clair#(belungen+$lied$$uhrs#\'ce/ward#%derau&%maier&&sachen\'+chmiedeberg$$zica',
+    '$"of$#uis#/kerkagriculture$#irk#"ll%(o-inlaid$(sen/koch%(on-jones\'%/team#"ma%!n&\'-marcus%!x%#yer$\'etschek',
+    '#!o##pce$"el$(odleglej)1tno&sacute&cacute#!r$!c$\'steiner$!t#"s.$$wand#*troudovyie$!s%$zche$\'zschian',
+    '$!w%%egein&%ndorp\'$hove(#uis)#yse$!x#\'vergelt%!s#*zabitowska""fc#!e$&depine#"fy#$ties',
+    '$\'y-serve"#gah$!l$!m#.el-constantine%!s$-r&ndash;benue%+ia/cameroon(\'germany\'*n-mediated)%owned)%south&#cin&0en/rassemblement$!t',
+    '%"rd%!s%!z$&enkopf%$rati$%gggah$0le-niggle-niggle&!r\'!s#"h/$%clubs$#ean$&ingale$*t&mdash;it,"so',
+    '+\'workers%&(mare)&"s)%(-and-day(%glers\'%ttack)#ire&0before-christmas\'&lanket(#oom\'&ombing\'&urning&$cap.)!s\'&lasses',
+    '(&ubbers+!y\'$rows&(darkness(!y\'%esert\'&resses&(fighters("sh*#ing\'%light($ower\'$oxes&%glass\'%owned',
+    '&%hours)#ses\'#unt*#ing&&images&&joseph&&letter\'%ifers\'$ocks&$mair(#res)#ish\'#oor(#ths&\'nursing',
+    '\')rientated\'"ut&&person\'$iece\'"ot\'\'rowling\'%urple&(rainbows\'%eally(\'cording\'#ide)#ing\'"un&&scenes($rews',
+    '\'%hapes($ifts\'$ight+!s\'%ounds\'\'pinning(#ots\'%tands\'"un\'&weated+!s&+telephonist\'$here\'#ide\'#own',
+    '*#per+#ing&&waking("lk($rmth\'#ear\'(oatchman%$.but&"he&"it%!/&%disco&%given&#old&$ride',
+    '\'#win&%where%#beg%&capped&/lub-cum-concert**restaurant*$wise)#ber)"s.%%dream(\'ss-case%"er%\'fishing&%lying%$glow',
+    '%%horse%\'ie-clad&&n\'gown\'%gale.%(jar-like%%life-*$wise\'"ke\'#nes%#map\'#rch(&e-blur*(drowning*$free*)paradigms',
+    '*%range)!.%%noise%#own%$rain&&unners%&s-most&$cene\'%hools\'#ope&%hades\'&elters&$pace&$taff(!r',
+    '%$town&$race%(watchmen\'#ves&#ork)#ers%!y&&-night$!y##ram$&escent$!i%$ceps&%ollis%$tana',
+    '"+h44&ndash;1-/-immunoreactive##ali#"ia$"l\'%/ist-reactionary(&ically$"ra#)on-nukite"(inamesai#$taka\'%-yama""ja#$hout#%inksy',
+    '#$kamp#"ni#*ournalists##sen$#sen"1k&scaron;i&cacute#$-nik#"am#,e-akroterion##ica$!s$#tas%#eas$#yas#$kari',
+    '$!y##lin#"oi$$laas&$enko\'#vsk&$ieva&!j&!s&%yenko%$enka%#sky$&machos%%edeia#"to',
+    '"+l-apartheid%*ssessments$$paid%(romotion$$rate#&.there#%ambar%"es#%e-god$"te#$giri\'!s#"is#(ly-willy#$mini',
+    '#%otica#%s-udo$/en&amp;pedersen$,on/pensioner$$soni"(m-fee-ar(+foe-lee-oos%\'oi-fays#$6000#!a$"ch$(gasocial$!t##bas$#ies',
+    '(%ooted&!d&(fingered&+st-fingered&!y$)o-stratus%"sa$&y-fied%#ism#$eiri$!t##ipu$!t%!z#(manhemin',
+    '$\'o-smith#$ocks$"da#"ph%"es#!r$#udi#$tech$"oo#"zo"#n-o#&a-anne%$note#)cds-adrda$$kley',
+    '#6e&mdash;year&mdash;old%,rehy;fifteen*%horse*&tenths+%hirty*(year-old$)-\'o-clock%"11%.and-a-half-day)&ninety%$ball\'"nd\'!r(&relled\'!y',
+    ',"ed&%irdie&"oy%&column&"up%\'day-old%(eighteen&"nd%&feeder&$ifty\'"ve&$loor&(oot-long\'"ur%&gallon',
+    '&$ened%&headed&#igh&$oler\'$urly&*undred-day-#odd%$item%$lane&%etter&$ined%%medal\'*n\'s-morris\'#tre&(ile-long',
+    '*)on-dollar&$odel\'$nths+$-old%%ounce&\'ver-par%#pan(#els\'"rt)!y&"in(!s&\'ounders\'#wer%%quart',
+    '&%unner%$slot&%troke%&tailed&#erm&)hree-five&\'il-five(!e&(o-fivers+#ing)#our(%three&*wenty-five\'!o%%under',
+    '%0weeks-at-the-top%-year&rehy;old$\'.thirty&"im$%:part$$_per$&barrow$#ham$!l$/teen&rehy;sixty(&-carat)(eighties.&y-nine0#six0#two',
+    '.&-eight/$five/#one/#six*)orty-nine+&urteen))month-old)(nineties."y-0$four0#one0#six)$page))seventeen/&y-five',
+    '*"ix,"ty*$tone)*thirty-six*$rack**wenties-it.&y-four0$nine))year-olds(0th&ndash;century*\'-billed\'"th%!h%)ies-style&#mes',
+    '%+y&rehy;four,$nine,#two&%-acre\'\'channel\'&eighth\'!f($ifth)#rst)\'ve-year(\'our-man,(year-old+"th\'*horsepower\',mile-an-hour',
+    '.#und*\'th-rate\',one-year-old\'(per-cent(#lus($ound\'+seven-piece\'/thousand-seater)$ree-((wo-three\'$year+%-olds&\'/ninety&%=four$#vah',
+    '##gbo$&ependa$#kun$,sanondpublic$#xia#"ib$"on$"sh##kov$!y#$makh#!n$"in&!s\'!.',
+    '%!u$%tchka$"us$"ve##sun#.teenth-century%)ndo-style%"ty$\'h-floor&%grade&&minute&&placed%"ly$!i$&y-nine',
+    '&#six#!y"$o(s)#\'bium-95((titanium#$dini#"ne#"rd$"in#%somes"%p-bsa$6caproate-o-succinimide$+derivatised$&inside#1.bsa-agglutinated',
+    '#&hredil##kow##pan$#ier&!s$*le-ceiling\'&gazing\'$pink$\'onbashi#"ro#!t"$qula"1r&rehy;g&aacute;l##ali$$njan',
+    '##del#!i#!m#!s#)vana-like(\'related$!s"(sa/today$!b$!d#)bet-smith$"it##eac$!i##fan',
+    '%#pur$%cheta$#ett$(i-waseda%$gaki%%kikoi%$nari%#oka%$waki#"ia$#bis#*kanen-type#$san.%!y$&en-hut',
+    '$"ly$"ui#"ta$"ro#)ubscriber#"w/$%ander"(t&eacute*-;-grit&eacute#$-wit#$akes#!b##ech%#lub$!d',
+    '$$spot%"un#!h$$bank#!o$"pi$$rgen#"ra%$safe%+te-ammonium(%based)&earing($fuel((produced(\'removal',
+    ')#ich()sensitive%%zepam$!e%"ne$%iding%#gen&"in%+lotriacetic$"o-&)injectors&\'organic%\'anilide%&bacter&,enzene/water',
+    '%)furantoin%+gen-bearing)*containing)&filled+#xer.!s)&loving)(mediated+%thane)%oxide)*processing)\'sparing)$xxxx(+/phosphorus(+:phosphorus',
+    '%!n%&phenol)"yl%&samine\'$tion&+o-compounds\')guanidine&"yl%%xynil##san$"ch&!e#"ti$(o-albion#%uchha',
+    '$$sche\'"ia"!u#$eans#!s"#vas%#her#!c#"el$&nskowe#\'ingston$!r$#son$!v##ola',
+    '"+x/organiser#"es#!i$"es#-on&rehy;built%&-agnew&$ford%(/kennedy&,photographer%#ian"*yariwallah#.ibigirafinance#&onkuru"%zam-i\'(-mustafa',
+    '$)n-orfilat&&sartre%#.33#\'haradze$2nevartovskneftegas%\'ivgorod##niy#$oral##zen!%j71sw"%acwer#&lsgade#!u"#cbi"%ected',
+    '##nga""g3""ie"#oka##man"#szt!&k-like"$11as#!r"!2"*9l&ndash;l"!a#"ma##nga""cd',
+    '""gb"$homa$&takota"&ifenji"$odia##ghe##hla#"le#)mo/mugabe#$sana$!i#"ua"&r1,000$".5%#6bn',
+    '$!1%$,000&#500%".5$%9,200##2.8$%4,200##3.4%!6#%4,500$".7$&50,900#%5,000$%6,700#%6,000',
+    '#%7,200#"f/#$oful$"hl"!t"$uebe#*ndabagenzi"$wain##eto""xd!&l-1200"#25c""65""ab""cs',
+    '"#eya"!i""ms"!r""tr"(z/897246)!7!$m-8l#)cambio-90"!."$/380"#ade""bj")c-kenmore#"cl',
+    '"%e\'ers",gnbaytdfccvd""j."#ol/%*h-&micro;g&!/%"l/\'!h%&rabbit#!s"&s-like#$3000""ts!"n\'"$-nn-',
+    '#!3#!7"!3"!4""59""aa"#cos""dp#!y"*e-trending#"bs#%ction"!f"*gthssnngst"-i&mdash;gross',
+    '""pc"!t#!k""uh!,o&amp;sub3/n#&dollar#&eacute$&circ;l#,mdash;growth)"no#1rehy;conscription"#+no"&-abort$%ctors$2lcohol/low-alcohol',
+    '$\'ig-deal$%lacks&"me$#ody\'$line$&rainer&"nd%"ow$#ull\'$shit%!y##car&#eer$#gmp$%hange',
+    '$$lone&$thes$)ommentary&)pensation%*nscription&%tract%#sts$&ycling#$debt%&cision%\'fective$+ictatorship%(fference%!g%,scrimination',
+    '#&effect$%nergy$-xpense-spared#\'felling$$inds%*rst-strike%%shing%!x$$lake%&y-zone##gap$\'o-alone&"go%"er%(ing-back',
+    '($jobs\'"er)!s%!s$#rav%(eat-rush#$hair%$nded%$ssle$$eads$$orse%!w#(interest%)volvement$#ron',
+    '#$kids%"ll#(laughing%-ws-no-redress$#ess\')-a-weapon$/icence-required%#ght%"ke%"ne$#oan%)nger-news*&wanted%"se#-man\'s-counter',
+    '%/rking-to-market\'!s$(ean-city%$mory%!n$$oney%*re-writing#%names$#eck%0ed-to-clear-mask+$soak%(gligence%&utrino%)w-nuclear\'%taxes',
+    '#%o-o-o$\'f-hours&%staff&+times-given$2ne-ever-knows-what&!r#)paperwork%%rking*,-at-any-time&#ole%!y$&enalty$$iece$\'oaching%$pery',
+    '&(duct-yet&&motion&&spects&\'tection#/questions-asked#)restraint%$turn$%ights$"ub#+sacred-cows$%cript$&ee-ums%%rvice$$hame%"it',
+    '$#ign%%nging$$lice$(o-public%"ak$%peaks$%upply%\'rcharge#(tackling%$lcum$%hanks%#ing%,rough-branch$+ime-to-diet\'!.',
+    '%#nal%!x$%rains%\'eatment%%ouble%#ump&#ths#%union#$verb$%oters#$wait%!y$#eed&"ks$#ind',
+    '$$oman"+.0&middot;5$$3069#&1/1992$#001%!1%!2%!4%!7%"89$"12%"57%"60$%45979$"68',
+    '#"2.$#133$!3$$4/74$"53%!5$"64$!g##331$#601&!5$#822$!9#"41$!2',
+    '%"98#"51$!2$(317-v6.0$"59$"65#"62%#-ed$#498$!s##707$!2%#/91$!8$!c',
+    '$!7$!s#"94$!9#%d9539&"53#!g#!l##you""11#!6#%dno1s""21#&ntno4h""49',
+    '""62#!3""85"!9"&:7,065"!_#6,_no_,_no_matter_where-#one(&longer(,matter_which%-you_no_longer#!a#.because_no_one#)er_no_one#+matter_whom',
+    '%+_matter_how&.no_no_,_no_one#.there\'s_no_one"!a#"ch%!i&"an#,des-inspired#"h/#)kes-style&!.&!y#$mana#!n#"te',
+    '#$bery$#ies$#ler&!s#0el-prize-winning$#rto$$yama&"na#!i$#les%"ia\'#ire&$ores&%ssima*!e',
+    '\'"er$#nul##lat$*e&rehy;man+%women%*-dominated&\'hearted&%nosed&&rollin&&savage%+/enthusiast&%heart%$ment)!e%)r-blooded',
+    '\'!e$"in$&y-born#,ody\'s-friend$$ttle#!q#$riga$\'ophonos#!u$"ku$$naga$!o$"ry$%toshi"!c',
+    '#$ebos$#lla$"nt%#zis$"to#!h$"id$#mal#!i#(k/victim$%emorf%!r$#old#\'odazole#%tamid',
+    '%!m$#ium$$urna("l.))ly-active\'"um"&d-down$#nod$"on#"ac$*l-pointing#!d$*ed-through$%indog$#les',
+    '$"co$$name%!s$&runner$"s.#"ge#"le#!o$%saurs#\'ulating%#osa"#ehr#)l-johnson$#een$!s',
+    '#"mi$"ol$!s##sis#(terminal$&herian$"ic"!f#$fink#$ilia#!l"#gal$!t#,ent-sur-oise#"gs',
+    '$!s#!s"\'h-masks#&almdun#!c#)em&iacute#"is##mal#!o$!n$#val$!w#!r""ia#)br&iacute',
+    '$!e#(lly-prat#*nghamshire#,r/chardonnay$"in$+mont/reuter&%utier#,se-abatement*#ing\'%nnoys\'(s-threat&#bar)!s\'$last&)for-noise',
+    '&\'induced&%maker)#ing&$outs&(polluted(!p&)sensitive\'&haping(#ock\'%torms%!/&&female&%quiet%&makers(#ing',
+    '%#nik%#pop%%s-off\'%puppy&#ome$"ly$"om$!s$(y-fridge#!x"$k110#"ie#"ka#%unonu$"ru',
+    '&&foster&&parent%!a##ens#"in#"la$.er-namitscheva##oad",m-de-peintre#&a-fila$"da%(ic-style\'$ally$!l$&nsland',
+    '$!s$%todes#&e-like$(handling$-nclature-rely#%gaana##ich$#kos$%mated$+n&rehy;ated%,a&rehy;tions&(l/issued\'(isations)"ed)/t&mdash;realist',
+    '&.te&lsqb;d&rsqb\'&ion(s)*$-for%.ee-presumptive%"is%&o&euml##man#\'ocratic$$dule$\'genesis$$nhan$&thetic#+s-du-disque"0n&mdash;advanced**examinable',
+    '$,ndash;degree*\'payment*+specialists+#top*+traditional*&urgent$/rehy;accidental,(ountable*)ggressive+*ricultural*(lcoholic*)nalytical*)ppearance*+ristocratic+%rival',
+    '*)ttendance.(tiveness*+vailability)$band*)eneficial*%lacks*%odily*)reathable+%itish))canonical+$reer+\'tholics+$usal*)hargeable+$urch',
+    '*(ombatant,(edogenic,)missioned-(onwealth-)unication,*patibility-&liance+)nscripted,\'tingent-\'racting1#ual*,riminalising)*democratic+*preciation+&viants',
+    ')*electrical*)mblematic+\'ergency**quilibrium*(xecutive)(feminist),governmental*\'raduate)&health*&ousing))identical*\'mitated+\'mediate*,ndividualist+*tellectual',
+    '+(vertible)\'marital*\'ilitary+%neral*&odular))nutritive)*observable*(ffenders)-parliamentary*,hysiological*(olitical*)ractising*,sychologists)\'quality,)ntifiable',
+    '+\'newable+%tired))selective+\'verable*%mudge**pecialists+%ouses*&tarter,&tutory)#tax**hreatening**raditional)&vinyls*%oting)%women',
+    '#(+nuclear#/-&eacute;litist,/v&eacute;nement%\'formula,*;-periodic%/ggr;-interferon$%\'cats$((market)$\'ability&+olitionists\'\'riginal.!s,"es&&sorbed&$used',
+    '&)celerated)!l(&ptable+$nce.*#ing()ssibility\'\'ountant+!s\')umulative(&satory&\'hievers&$idic)"ty&&oustic,"al',
+    '&!t\'\'ion-man\'\'ualised+$zing)$rial%(daptable*$tion)"ed&%dicts\'&ressed&,enocarcinoma)(idectomy&&jacent\'\'ectival\'%usted',
+    '&(missible&&option&(renaline&\'ulthood)!s&%vance\'(ersarial)&tising%&erated\'&ospace%)ffiliated(\'rmation\'\'orested&%rican%%geist',
+    '&)gregative)$sive*#sor&)riculture&"ta%"ir%\'lcholic\',ohol-related+#ics&(ienation&*literative\'&owable&!p&(truistic%&mateur',
+    '\'%ulant*$tory&(haraness&\'manites\'$onia%*nabantoids\'*esthetists\'&logous($ysts&$gler&+imal-tested&$swer*!s&(tibiotic)#ody',
+    ',(specific\'#ral%&pnoeic&\'ostolic&&parent\'&liance)%cable\'(renticed(\'opriate)%vable&%raxic%\'quarium(#tic%%rabic("le',
+    '&$ctic&\'gentine&*istotelian&*m\'s-length\'%enian&%oused)#ing&&rivals%)scriptive&#ean&&sembly(%nting($rted*%ively($ssed',
+    '\'\'ignable*"ed("st*$ance\'(ociation&$ylum%\'thenian,!s&"ol&\'tending%$udio&%ratic\'\'iferous&+stro-german&\'thentic',
+    '+&zation,"ed\'%istic\'&opsied%(wareness%(yer-hare$$babt\'!y&"ck\'%onian\'&terial&&gshaws&$nker&&ptized&!r',
+    '\'%onial\'#red&&saltic\'!s\'!w%"bc%!c%#eer&)havioural-#ist0!s&*lligerence\'&ongers&&ngalis&&reaved',
+    '%"gq%&iasing&"le\'$iary&,o-degradable\')available\'(chemists\'&logist-!s\'\'medical\')tinylated&&rthday%%lacks&#iss&%ondes',
+    '%#ody&(isterous&%lting&#nus&)ok-buying&-ugainvilleans\'\'ssinesq&%wling&$xing%\'rahmins\'!n(!d&\'eakable)#ing\'%cchia',
+    ')"ry(#ing&&idging\'$ttle%"sp%!t&!-%%uckle&,dget-holding&$lbed\'&garian\'!l&$rden\'+eaucratized\'#man',
+    '\'$sate$\'caching&!d&%lcite\'*ligraphers\'$oric\'&vinist&"mp($aign,#ing&)ncellable)!r*#ous\'*nibalistic\'$onic',
+    '\'#ped\'$tive&!r\'\'-owning\')cinogenic\'!d(+ioselective\'"er\'&ibbean(#com\'%riers\'*tographers."ic&#ses&%talan',
+    '*#tic(,strophically\'\'egorial($nary\'$fish&\'ucasian\'&sality)$ting("es(#ing%"eb&\'lebrity\'%lular*$osic&(nsorship',
+    ',#zed&&rebral\'(tifiable+$cate/!d.#ion%!f%%hain\'\'(llenging\'$rity("ms(!t)"er&&emists&"ic',
+    '&%olera)&static(\'inergie\'$oser\'$rdal("us&+romosome-15&*urch-goers%&ichlid&\'tations%(laimants\'"sh(#sic*(fication)$room',
+    '&%earer&%imber+!s\'#nic&&ogging\'$sure\'&wnfish&%uster+"ed%#mea%-o-operatively&#ach\'&lfield(%ition&$balt',
+    '&&dified&%erced&$ffee&)gnitivism&&herent&"ld\'$itic\'*laborative(%ector-!s(&oquial(\'usively\'%oured&&medies\'\'formist',
+    '\'\'ittally\')mensurate))rcialised(*issionable)$ttee(*odity-form))nsensical*&wealth()unicating.#ors+0ty-charge-paying\'*parability)(ssionate)%tible(&etence',
+    '*\'itively/$ness(\'laining)&etable(\'ounders()rehending*$ssed)%omise()utational*+er-literate-\'related,$ised,!s*#ing&\'ncealed',
+    '(\'urrence\'\'densing()itionally\'\'ference(%ident($lict((ormance\'+"er-!s+#ism)&unding\'(gressmen)$uent\'*sciousness()equential',
+    '-!s(&piracy,&torial(\'tituent,(tionally($ular*%tants)$mer.*#ing\')taminated.#ing(%ender)"st),xt-dependent((ingently',
+    '+#ous()raceptors+$tile)\'ibuting."on-+ory/partial\'\'vecting)%ntion)&rgence-!t*&sation0"al*#ted)\'yancing&%oking',
+    '-$vely/$ness&)pernicans&(rnishmen\'$onal\'%ridor(&odable*$ible+"ng)(siveness&"se\')mological)\'politan\'!t&&tectic',
+    '\'"rt)%aulds&&verage%%pders&!v%$rack\'"ft&&eation\'.ole-influenced&%icket+\'-loving\'#mes\'#sis&#ohn\'!p',
+    '%%uddly&&linary\'%pable\'\'turable&%prate&$rfew\'%rency(&iculum&)stodially*!y)!m%$ycle("ic(\'osporin&\'totoxic',
+    '&%maged)#ing&\'ngerous\'$uese%%eadly\'!f&%cimal(+sion-taking\'%lared\')omposable*\'ression\'(remental&+feasibility(%ction(%nsive',
+    '\'\'inition."al&(generacy&%layed\'%egate(#ted\')iberately(%very.&\'mocracy(\'graphic((nstrable-$tive1"ly&#nse&(partment',
+    '\'$osit+\'-taking+%ional\')reciating)$ssed&(rivative\'&ridean&\'scribed*%ption,"or\'&erving\'*tructively/$ness&\'tection-!s',
+    '\'$roit&(velopers&&xtrals%\'iabetes\'&lectal\'%tonic&)ctatorial&,fferentiable/$tion&\'glossic&(minutive&&ocesan&!p\'&lomats\'#ole',
+    '-#ing\'(cardable(*iplinarian/!y(*losure/use(&ounted)&veries(*riminating\'$ease\'+integration\'(junction\'\'missals\'\'persing\'\'ruptive\'\'senting',
+    '()ortionary(\'urbance&&vidend,\'-paying($sion,"al\'$orce%"na\'(-binding%#ock\'%ument,"ed,!s&#ers&$rian',
+    '%(rainable&&eaming&&ive-in&"op\'$ught&#ugs%\'ubbable%\'welling%#yke&%namic$%e.e.c)!.%\'arnings&%stern&$ters',
+    '&\'onomist&)tothermic%#ddy&\'ucation%&ffects&!l%(gyptians%*lasticated&(ectorial)&rified*%olyte/)-mediated\'&mental&!f&&igible',
+    '\'#tes(#ist%(mergence,#ies&&phatic\'%loyee\'(owerment\'&tiness%"nd\'%emics\'#ing\'&ocrine(&rsable*"ed(\'thermic',
+    '&(gagement\'-lish-language,)qualified,(speakers+$ness&\'tailing\',erotoxigenic)(tainment\'(husiasts\'%ities)#led+$ment\',repreneurial&2vironment-friendly/$ally',
+    '%(phemeral&\'iscopal-#ian&5silon-toxin-producing%\'quality(&torial%)radicated&(icaceous\'&treans&$otic&&upting&\'ythroid%#src&+tablishment%\'thereal',
+    '\'&iopian%(uclidian%(valuable&"en&&iction\'$dent&*olutionary%#xam&)changable\'%luded)&sively,#ity&#eat\'\'cutable*!e',
+    '\'%rcise&(hibition&(pandable)$sion-#ist\'%elled(\'nditure(&rience.!d*%ments\'(lanation\'&orters*#ing(#sed&(tendable',
+    ',$ness)%sible\'(radition$(factives(#ory&"de&(llacious\'+sifiability-"le&&miliar,#ity&!n\'%ciful\'$tasy&*rm/on-farm',
+    '\'$oese&%scist+!s\'!t(#ing&%thers\'&tening&,ult-tolerant%\'eatures&%deral+$ists&!e\'#ble\'%dback(#ing',
+    '&\'rmented%$iata&#bre&#ery&%fties&#ght)#ers\'\'uration&)nancially\'!e\'&ishers&"re(,-propagating\'"st)&-class',
+    '(!y\'(sionable&#xed%#lag&)exibility&!n&&oating\'$wing&%uency\'#ffy\'%shing&!y\'"er%(oliating&+od-bingeing',
+    '(\'seeable)!t*"er\'!m(%ative("ed)"rs(%ulaic\',ward-looking&)ssil-fuel&-undationalist%&racced(#tal\'(gmenting($rant',
+    '\'+ternisation\'\'udulent\'!y&+ee-draining(#men($zing\',nch-speaking\'%quent&&iction\'"ed\'(ghtening&%ontal%"sa%#ull&"nd',
+    '&#ssy$&gaelic&"ll&#mes&!s\'#con*!s\'$eous\'0troenterological&"tt&&ullist\'%ssian&!v&"ys%!c',
+    '++stereotyped*"ed\'$ital)#ive\'$omic\'&tlemen("ry&)ographers&\'rm-line(+an-speaking($inal&&stural*!e%&ilbert%&lacial',
+    '\'"re\'"ss&$obal&\'utitive&*ycosylated%%olfer(#ing&$thic&7vernmentalorganisations&\'yigamas%"pc%\'radable\'"in\'*nt-aidable($ular',
+    '*#tic\'"ss)"ed&$ease\'#edy&$oups\'$wing%"ti%"ui\'#tar&!n$!h%,abit-forming)$able&,ematopoietic',
+    ')\'rrhagic&*giographer&"rd((-wearing\'%monic+&zation%$eads\'$ring($ting\'$ting&%bbian&\'gemonic&%inous&"li&)patotoxic',
+    '&-wlett-packard&!x%)ierarchic-#zed&(gh-speed("er&*ll-walking&#ndi))-speaking&%ppies(!y&*stological)"ne)%rians%"la',
+    '%\'odgkins&"ld\'%istic\'&lywood&"me(&owners\')ogenously(&phones,"ic(\'sexuals&$oked&&rmonal\'#sey(!y&\'stility',
+    '%,uman-animals)%istic*"ty&\'ngarian-)-speaking("ry%%ybrid*\'isation&-drogen-bonded)\'xylated&(pnagogic(&otised\'&ocrisy()glycaemia$$iata',
+    '%#cco%\'dealist\'\'ntities\'%ology%+ge-mediated%&llness\'%usion%$mage)$able&)bricating&&munity),ocompromised*%genic&&perial\')risonable',
+    '%\'ncision\'(ontinent\'(remental()imination&&decent\'\'icative(%genes(,vidual-human\'(ucements)$ible(*strialised,"es&&ertial)$ness&&fantry',
+    '+"ed\'*initesimal\'%lamed*%mable\'(ormative\'+rastructure&$gres&)habitable(#ler\'(eritance+#ing\'\'ibition&#jac\'\'ectable&(nervated',
+    '&%sider\'(tinctual),tutionalised\'$ular)*in-treated(%rance)"ed&,tegrationist*+in/integrin()llectuals($nded)*sification(,rest-earning)+nationalist*)etworking',
+    ')\'section)(vened-in,&tional2#ist\'%imate,!s\')oxicating\')ra-aortic(\'usively\'&uitive&(variance(&sively%&onised&!r%)rradiated',
+    '(&tating,"ve%$slet&)omorphism\'&tropic&%raeli+"te-!s&$sue.%"tn$#jaa&\'cobites&&maican&!r\')gon-using',
+    '%&ealous&*ttisonable%"ob&%inder(#ers(#ing&\'rdanian&(urnalist%%udaic)$stic\'*gementally((mentally&%nkies&$ring$)kashmiris',
+    '&&yboard\'\'nesians%%ikuyu&%lling&%netic\'%gsman\'$sman%\'nightly\'%tting%&oreans&$sher%&uwaiti+!s$*laboratory&(mbertian',
+    '(#ing(%owner&#pps&&tvians&%udian&$wful\'$like%&eaague\'$ched\'$ders\'!f\'$gues&%cture&$gato\'\'itimate',
+    '&%sbian\'%ioned&$tter&\'velness&\'xically%"fa%%ibyan*!s&&censed&,fe-insurance\'"fe&\'ganding&"ly&&merick&,nguistically',
+    '&"st("ed&\'terally*#tes\'&igated)$ious%(ocalized)"ly)!s($tion,)-specific,"al\'%kable&&gician&%oking',
+    '%$ucid&(xembourg%*ymphocytic&$rics$\'m&amp;a&,eacute;thode%&achine+"ry\'&intosh&$gyar&\'inframe&#jor&$kers&#lay)!s',
+    '\'"es(&volent&&nacled(&gerial\'"ic($fest\'.ual/industrial+&manual+(salaried*!s((factures&$oris&&rchers\'%ginal*"ed',
+    '\'$kers\')qu&eacute\'%rieds\'%zipan&!s\'!s(%ively&%tched\'&erial.,#ist/"ic-&zation\'!h(*ematically.$ians',
+    '\')riculated\'#ter&(ximising*$zing%)eaningful(-s&rehy;tested&&diated()terranean&"ek\'$ting&!n&(rcantile(%enary\'#ger(#ing',
+    '&!t\'&abolic,%zable-"ed(%llics((phorical\'$ered\'#hod\'%rical%$icro))processor)4sparc/non-supersparc)/wave-orientated&&dlands&&grants',
+    '\'(lenarian&(raculous\'%rored&(sogynist\'$sile\'%tical&+tochondrial%$odal\'\'ernized\'%ified\'\'ulating&\'ldavian\'&ecular&(netarist.!s',
+    '.!s+!y(&polies((tonicity\'&strous&%onies&$rtal($gage&$sley&$tile\'%oring&)untaineer/#ing/!s&\'vements',
+    '\'&artian%#prp%"sc%$uddy&&ltiple&#nro&$ppet*!s&$seal&%tated$+nationalist(#ves\'\'uralist.!s,#zed',
+    '+$ness%*eanderthal\'"th&\'cessity\'(rotising&+gligibility\'*otiability+#ted\'$rito&%rvous&*utralising&"ws(%paper%$icam\'"he',
+    '\'\'ulating&)n-heinous\'*conformist&$rdic\'&mality)!n\'"th)\'umbrian&(socomial&*tification&"un%"pn%"sf%)ucleoside&#rse',
+    ')!s\'&turant&\'trients%&vasive$+objectively,#ity&&ligate&\'stetric(&ructed&%vious%\'ccluded\'%upant*$tion&$ular%&edipal',
+    '%.ffence-related)$ding\'%icers%*il-related\'$seed%"ne\'"\'s&*omatopoeic%\'peratic*"or&(timizing%#ral&\'cadians&"d.&#gan',
+    '*&zation0"al($smic&&iented\'(ginating%&verlap($seas(!t(&weight&\'imbundu%"wn\'+er-occupied%%xford&\'idative&$ynit',
+    '))-damaging$\'pacific\'$kage&\'interly&#pal\'"er&/rachute-trained(\'doxical()llelistic\'&eilles(\'nchymal)#tal*$eral*\'hetical\'\'is-club',
+    '\',liamentarian\'&ochial\'$tial+!s)(cipative.#ors*)ulateness)&tional&%shtun+!s\'(teurised(#ure&*thologised\'%ients\'%riots',
+    '\'$tern+"ed&)uperizing\'"se&!y\'$able\'#ees%#dpa%#eak\'!t&%erage(!s&%lagic&"ps&&rfused',
+    '\'#iod*$ical\')meability(\'issible)!t()utability\'\'nicious\'%oxide\'\'sonhood\'\'tinence(%urbed%-harmaceutical&+ilanthropic&/otosynthesizers&)ysicality',
+    ')&ologic%(igmented&$lots&"pe&$rate%#lan(#ned(!t\'$teds((onically&-enipotentiary\'&uritic&\'uralist%%oetry&#int',
+    '\'"es\'"io("sh(&tician\'!l(%ution\'!o\'&ymeric)\'orphism($poid((technics&+ntificating&%pular&\'rphyrin\'$sche',
+    '&&sitive+#ist\'\'sessive($umus&%verty&#wer%(ractices&)e-emptive\'$achy\'&cision\'&dators(*estinarian(&ictive\'&gnancy\'\'judiced',
+    '\')scriptive((idential(\'surised($tige\'(tentious&!i\'%estly\'%mates(#ing\'&ntable\'*vatisation,"ed\'*ze-winning&!o\'(bability',
+    '\'$cess\'$duct\'.fit-maximising+(oriented+\'sharing\'\'jectile,"on,"ve\'(letarian\'%mpted\'&pagatd,#ing($erty,\'-owners\'\'secuted',
+    '+#ion.#ist,"ve)"in)&stants\'%vable(&incial)$sion\'%ximal&&ussian%"sc&+ychiatrists))oanalytic%,ublic-school)%shers',
+    '&$mped&&nching&#pil&(rposeful$&q-wave%"ts%(uadratic\'#ker\'(litative&&estion,(-begging$!r%%acing(#sts&&diated',
+    ')%genic)\'logical&%ilway\'"ny&$ncid\'\'domized&)tionalist%\'eactors\'\'dmitted&(bellious)!s&0ceptor-selective,!s($ssed*#ion',
+    '\'\'ognised+#zed("il(*mmendatory(&nciled(%rding(&upable\'(ruitment\'\'tangles\'(uperable&*ductionist+"ve,#ist&&ferral*#ing',
+    ',#ves\'#orm*"er\')rigerated\'%ugees(%senik&\'gicides(\'stering,!s\'(rettable\'$ular+#ity&\'jection-#ist&&lation',
+    '*$vist\'$ease(%nting(-vant/relevant\'%iance*!t($gion&\'mission\'+ote-sensing&&neging\')ounceable\'$ting($okil&(paration((triation',
+    '\'&eating(&titive\'&lacing(\'icative)!x\'"re)*sentatives-"ed(&oduced\'&tilian\'*ublicanism&(searcher,#ing(#rve(!t',
+    '+#ts.(&stants*#ers\'%olved\'$pect(\'onsible,&veness\'&toring((rictable,%ively&%tired\'(ractable+%ility\'&urning&&usable',
+    '(\'rential)"se\'&ivable&\'wirable%(heumatic&$otic&%yming\'%thmic%%iding&(ght-wing\'%orist&"sc&\'tualism&%valry\'"en',
+    '%%obbed\'$otic&#cky&%lling&%mance)#ian*"st)!s&)om-sealed(&sealed&%unded\'%table&$wing&%yalty%!p',
+    '&#ral&$skin$!s%%acred&$fety&%intly&#les\'$ient("ne\'!t&#nta&!p\'$phic&\'tellite&"ve',
+    '&$enic(#ted\'&ptical&&hedule\')ool-based+$type&!i&#oop\'!t&%ratch\'!e\'$ipta&%uttle%(ea-going\'!m',
+    '&(cretable*"ed\'&tional\'$ured&&dative\'&entary\'(imentary&\'gmented\'\'regated&-lf-regulatory(#ish((starting&%matic\'$itic&)nsational',
+    '($ible)#cal)$tive&\'parable*$tion,"st,"ve&)questered&)rf-owning\'#ies\'%rated\'$vile&(ttlement&$vere&!x',
+    ')"ts\'%ually%#gml%$hift&%ocked\'!e%!i&+gnificantly&&licate)"on&$ndhi\'#ger(%ular.%$kier)!s',
+    '%%lalom\'"ve("ic&#ide\'%ppery&"um%$mall&#ell&#ile\'#ths&&okers.%\'ociable)(lisation((ologists\'#ket',
+    '\'\'idarity\'$uble($tion&+mervillians&"ng(\'writers,#ing&&othing&,phistication&(undproof\'"th)#ern&(vietized%%parse\'\'tiality',
+    ')&ficity+"ed)+men-bearing(%tator(*ularizable\')enhamland\'%nders&)hincteric&#iny&\'onsored\'"rt)!y\'$uses&\'reading&&urious',
+    '%\'taining\'$king\'"lk\'&ndards\'#ple\'!r($dent(!t\'#tal(,e-of-the-art)!s("ic)"st+&ically&*eamcharter',
+    '()ilisation&)igmatized-#ing&&orable(!y&\'rangers((t-shaped)%ified\'&eaming(%nuous(%ssful\'(icturing($kers\'*ucturalist%&ubject',
+    '+#ive+!s(\'unctive\'(ordinate\')sidiaries+#sed+#zed)&stence(%tance+$tial/#ity-"ve)2itute&rehy;ability-#ion)$rate',
+    '&)ggestible&"it("ed&%lphur&$mmer&$nday&*percharged)&ficial)\'imposed)&scalar\'&plying(#ort(&ressed\'*ranational&%rfing',
+    '&)spendable\'+tainability%"vq%$wapo\'"zi&%edish\'%lling&%immer)#ing%(ymbiotic\'(ptomatic&&naptic\'(chromesh\'&dicate\'&tactic',
+    '(.h&eacute;tique&(philitic$\'tabloid&"ck\'%tical&&inting&$jiks&%ke-up("rs&%lking&&ngible\'!u\'\'zanians&&rgeted\'\'nishing',
+    '&$tars&)utologous/$ness&(xonomist%&eacher\'!r&%chies&\'lepaths(&scopic&$nnis\'"or&\'rminals+$ting-"on\'&rorist',
+    ')\'mentary&%xtile%\'hatcher&&ematic\'*ologically\'-rmostatically\'&spians&&inking&(oractomy&*reatening.\')ombogenic%\'igreans&%meous(&tabled&\'nkering',
+    '&(leration&&nality\'!e&*o-friendly(&gifted&#pic\'(ographic&$ries&*talitarian*#zed&#uch\'%rists(&nament&&xicity%"ps',
+    ')!r*.s/buyers/users\'"in)#ing)$load\'*nquillised(+sferability,#red,!s)&geneic)\'itional,"ve)(missible."on+$tted',
+    '*$lant*#ort\'(umatised\'\'vellers+#ing)&rsable&&easury(%table)"ed\'!e((-hugging(!s\'$molo&#ier)!\'',
+    '&)oglodytes&#ust\'"th&!y%"sr%*uberculous&(multuous&+rbo-charged\'!k\'$ners%!v&"ei%&yphoid\'#ist$%u.s.a',
+    '%"fc%&gandan%\'ltimate%!n&+derstanding)\'written&"ep&%ified\',on-regulated\'#sql("ys\'#ted(!s\'&versal%)pgradable',
+    '%&reamic\'#nco%%sable&#ing&!l&&urious%&topian$&vacant\'#uum&#gal&\'lidated\'#ues&)riational($cose%%ector',
+    '*#ted&(nereally&+rbal/verbal*!s\'\'ifiable\'\'nacular\'\'tebrate&)siculated\'#sel&%teran)(inarians-!y%(ibratory&+ctimization(\'uallers',
+    '(%ently(%inist&+sualisation&&tality%4ocational/vocational&#ice&!r$&waders&%lkers&%rping\'$ring&"sp&&tchers\'"er%%eight',
+    '\'$fare&)st-indian&!t&!u%$heat&&irling\'&tbread()e-skinned%\'ildlife\'\'fridian\'\'l-based&)ndsurfers\'#ner\'#ter&*th-profits',
+    '(!y&-rd-monitoring\'&k-time\'"ld\'"th&&unding&$vens%&rinkle\'*te-through$*xenophobic$)yahwistic%$east%+orkshiremen&!u$(zero-sum',
+    '%&ionist%#ulu&$waya#*.competing$+engineering$,professional$(verbally#+=conformist#._compos_mentis#)absorbent&%tract$*ccountants$\'daptive%&herent$&erosol',
+    '%(gressive$"ka$&ligned$$mers$%nimal',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_66 = (
+count_66 = 6694
+
+heads_66 = (
     'mlita',
-    'mljet',
-    'mll',
-    'mln/fan',
-    'mlntec',
-    'mlnute',
-    'mlodych',
-    'mlokosiewiczi',
-    'mlongoti',
-    'mlp/lh',
-    'mls/filter',
-    'mlso1',
-    'mlt=12hr',
-    'mltl',
-    'mlud',
-    'mluleki',
     'mlungisi',
-    'mlv',
-    'mlvi',
-    'mlyn',
-    'mm&amp;sup2',
-    'mm&times;5',
-    'mm&times;5.5',
-    'mm&times;6',
-    'mm&times;75',
-    'mm\'a',
-    'mm-',
-    'mm-1',
-    'mm-calibre',
-    'mm-diameter',
-    'mm-hum',
-    'mm-ing',
     'mm-mmm',
-    'mm.',
-    'mm.1d,7',
-    'mm.follow',
-    'mm.i',
-    'mm.mm',
-    'mm/hour',
-    'mm/hr',
-    'mm/m',
-    'mm53211/bapc',
-    'mm54099',
-    'mm70019',
-    'mmc-see',
-    'mmds',
-    'mmegi',
-    'mmembers',
     'mmeting',
-    'mmm\'',
-    'mmmf',
-    'mmmf-ow',
-    'mmmff',
-    'mmmm-mm',
-    'mmmmmmmm',
-    'mmmmmmmmmmmmmmmmmmm',
-    'mmmnn',
-    'mmnumnumnumm',
-    'mmol.day',
-    'mmol/',
-    'mmol/1',
-    'mmol/15',
-    'mmol/hr',
-    'mmph',
     'mmpinganjira',
-    'mmr2',
-    'mmta',
-    'mmu',
-    'mmu/cache',
-    'mmuh',
-    'mmunch',
-    'mmuno-deficiency',
-    'mmus/diploma',
-    'mn&amp;n',
-    'mn&eacute;0sicles',
-    'mn/3dr/10',
-    'mn1203',
-    'mn1500',
-    'mn3101',
-    'mn3103',
     'mn7',
-    'mnam-cci',
-    'mnaseas',
-    'mnccl',
-    'mnchener',
-    'mndp',
-    'mnemba',
-    'mnemonically',
-    'mnesarchaea',
-    'mnesarchos',
-    'mnf',
-    'mnf-bsp',
-    'mnfl',
-    'mnichovo',
-    'mnissing',
-    'mnisterial',
     'mnohokr&aacute;t',
-    'mnoment',
-    'mnp2-5',
-    'mnp4',
-    'mnp4/&rehy;v42',
-    'mnp5',
-    'mnp5/v42bis',
-    'mnso',
-    'mnthpndn',
-    'mntrse',
-    'mnungi/lindi',
-    'mnvii',
-    'mnw',
-    'mo&ccedil;ambicana',
-    'mo&ccedil;ambique',
-    'mo&euml;t-hennessy-louis-vuitton',
     'mo&iuml;ses',
-    'mo&ndash;art',
-    'mo&rehy;dules',
-    'mo\'amera',
-    'mo\'g',
-    'mo\'joe',
-    'mo\'ther',
-    'mo-dean',
-    'mo-dettes',
-    'mo-lu-hwa',
-    'mo-pedestrian',
-    'mo.st',
-    'mo99',
-    'moabi',
-    'moakes',
-    'moal',
     'moanie',
-    'moanjam',
-    'moapa',
-    'moat-holiday',
-    'moat-site',
-    'moathouse',
-    'moating',
-    'mob-capped',
-    'mob-caps',
-    'mob-noise',
-    'mob-raped',
-    'mob-situation',
-    'mobbery',
-    'mobbs/banbury',
-    'mobbs/friends',
-    'mobbs/owner',
     'mobbydor',
-    'moben',
-    'mobergellids',
-    'mobil/badger',
-    'mobil/top',
-    'mobile-launched',
-    'mobile/moveable',
-    'mobile93',
-    'mobilecom',
-    'mobileware',
-    'mobili',
-    'mobili&aacute;rios',
-    'mobiliary',
-    'mobilisation-orders',
-    'mobilitas',
-    'mobility\'',
     'mobility-based',
-    'mobility-shift',
-    'mobility.',
-    'mobility/change',
-    'mobilkom',
-    'mobium',
-    'moblebani',
-    'mobley/tenant',
-    'mobocracy',
-    'mobutism',
-    'mocapra',
-    'mocassin',
-    'moccasin\'',
-    'moccasined',
-    'moccia',
-    'mocenigo',
     'mocha-filled',
-    'mocha-java',
-    'mocha-mysore',
-    'mochan',
-    'mocharb',
-    'mocheck',
-    'mochi',
-    'mochnant',
-    'mochokidae',
-    'mochokiella',
-    'mochrum',
-    'mochta',
-    'mochtar',
-    'mochudi',
-    'mock&rehy;learned',
-    'mock&rehy;marbled',
     'mock&rehy;modesty',
-    'mock-abasement',
-    'mock-alarm',
-    'mock-apologetic',
-    'mock-apologia',
-    'mock-astonishment',
-    'mock-attacks',
-    'mock-battles',
-    'mock-boxing',
-    'mock-boy',
-    'mock-classical',
-    'mock-clerical',
-    'mock-combatants',
-    'mock-comfort',
-    'mock-compliments',
-    'mock-concern',
     'mock-conspiratorially',
-    'mock-consternation',
-    'mock-courtly',
-    'mock-dead',
-    'mock-deference',
-    'mock-disabled',
-    'mock-disgusting',
-    'mock-disneyland',
-    'mock-dodged',
-    'mock-doric',
-    'mock-election',
-    'mock-elevated',
-    'mock-emperors',
-    'mock-engagements',
-    'mock-exam',
-    'mock-exasperation',
     'mock-ferocious',
-    'mock-ferocity',
-    'mock-flesh',
-    'mock-french',
-    'mock-funeral',
-    'mock-georgian',
-    'mock-gratitude',
-    'mock-gravity',
-    'mock-hippy',
-    'mock-horrified',
-    'mock-horror',
-    'mock-humble',
-    'mock-ingratiatingly',
-    'mock-innocence',
-    'mock-innocently',
-    'mock-jacobean',
     'mock-lecherous',
-    'mock-leer',
-    'mock-lightly',
-    'mock-macho',
-    'mock-mahogany',
-    'mock-male',
-    'mock-mediaeval',
-    'mock-miracle',
-    'mock-modest',
-    'mock-oedipal',
-    'mock-orange',
-    'mock-orgasm',
-    'mock-outrage',
-    'mock-palazzo',
-    'mock-penis',
-    'mock-pocket',
     'mock-polite',
-    'mock-protest',
-    'mock-punches',
-    'mock-raping',
-    'mock-reality',
-    'mock-rejection',
-    'mock-reproach',
-    'mock-reproachful',
-    'mock-respect',
-    'mock-romance',
-    'mock-romanesque',
-    'mock-severe',
-    'mock-severely',
-    'mock-sheepskin',
-    'mock-simpleton',
-    'mock-solemnity',
     'mock-soviet',
-    'mock-sternly',
-    'mock-temple',
-    'mock-textbook',
-    'mock-thirties-liner',
-    'mock-tortoiseshell',
-    'mock-transfection',
-    'mock-treated',
-    'mock-useful',
-    'mock-victorian',
-    'mock-wembley',
-    'mock-wooden',
-    'mock-working',
-    'mock/the',
-    'mockery.',
-    'mockings',
     'mockney',
-    'mockreality',
-    'mockridge',
-    'mockup',
-    'mocoyouth',
-    'mocquard',
-    'mocroscope',
-    'mod&eacute;r&eacute',
-    'mod&eacute;rateur',
-    'mod&rehy;ifying',
-    'mod\'rate',
-    'mod-dun',
-    'mod-funded',
-    'mod-ish',
-    'mod-revival',
-    'mod.tech.',
     'mod/lwm',
-    'modal-analysis',
-    'modalties',
-    'modaressi',
-    'modart',
-    'modbury',
-    'modded',
-    'modderbee',
-    'mode-based',
-    'mode-change',
-    'mode-changing',
-    'mode-locked',
-    'mode-pulling',
-    'mode/led',
-    'mode/natural',
-    'mode/scroll',
     'model&mdash;details',
-    'model-act',
-    'model-by-model',
-    'model-consistent',
-    'model-dependent',
-    'model-engineering',
-    'model-numbering',
-    'model-painting',
-    'model-predicted',
-    'model-railway',
-    'model-sized',
-    'model-speak',
-    'model-t',
-    'model-t-ford-type',
-    'model-to-view',
-    'model-turned-photographer',
     'model-type',
-    'model-year',
-    'model/15',
-    'model/ideal',
-    'model/singer',
-    'modele',
-    'modeles',
-    'modelet',
-    'modelica',
-    'modell',
-    'modellin\'',
-    'modelling-clay',
-    'modelling/design/simulation',
-    'modelling/forming',
-    'modelling/planning',
-    'modelling/what',
     'modello',
-    'modelly',
-    'models.',
-    'models/friends',
-    'modelski',
-    'modem/fax',
-    'modem/fax/answering',
-    'modemisations',
-    'modena-lamborghini',
-    'modena/driver',
-    'modenda',
-    'modeno',
-    'modeo',
-    'moderata',
-    'moderate-conservative',
-    'moderate-income',
     'moderate-to-fresh',
-    'moderate-to-long',
-    'moderate=2',
-    'moderate=moderate',
-    'moderately-stocked',
-    'moderation-he',
-    'modern&rehy;looking',
-    'modern\'',
-    'modern(ist)',
-    'modern-art',
-    'modern-dance',
-    'modern-design',
-    'modern-instrument',
-    'modern-manners',
-    'modern-styled',
-    'modern-thinking',
     'modern-year',
-    'modern/technical',
-    'moderne-centre',
-    'modernen',
-    'modernises',
-    'modernisings',
-    'modernism/modernization',
-    'modernist-palladian',
-    'modernist-style',
-    'modernist-type',
-    'modernista',
-    'modernities',
-    'modernity/postmodernity',
-    'modernization/diversification',
-    'modernizations',
-    'modernsing',
     'moders&ouml;hn',
-    'modes-talking',
-    'modes.',
-    'modesco',
-    'modest-looking',
-    'modestest',
-    'modesties',
-    'modestine',
-    'modestly-equipped',
-    'modestly-titled',
-    'modesty.',
-    'modeulate',
-    'modico',
-    'modifiability-by-design',
-    'modifica&rehy;tion',
-    'modifica&rehy;tions',
     'modifications-records',
-    'modifications/improvements',
-    'modified/tested',
-    'modifiy',
-    'modifyng',
-    'modillion',
-    'modin',
-    'modine',
-    'modishness',
-    'modistes',
-    'modities',
-    'modkowski',
-    'modlen',
-    'modles',
-    'modlinger',
-    'modmonsters',
     'modo-english',
-    'modom',
-    'modood',
-    'modoos',
-    'modpck.qry',
-    'modrcin',
-    'modren',
-    'modrica',
-    'modrone',
-    'modrzewski',
-    'modset.fil',
-    'modsports',
-    'moduels',
-    'modugna',
-    'modulable',
-    'modular-based',
     'modular-credit',
-    'modular/portfolio',
-    'modularis',
-    'modularise',
-    'modulator-demodulator',
-    'module&mdash;details',
-    'module-based',
-    'module-number',
-    'module-subtype-is',
-    'module/issue',
-    'module/packages',
-    'module/short',
-    'module/unit',
-    'module7',
-    'module9',
-    'module=module',
     'modules/issues',
-    'modules/short',
-    'modulised',
-    'modulist',
-    'modulor',
-    'modulus/density',
-    'modulyo',
-    'modwen',
-    'mody',
-    'modyacrylic',
-    'modyokerto',
-    'moehne',
-    'moeities',
-    'moeity',
-    'moelchert',
-    'moelfre',
     'moelles',
-    'moelleux',
-    'moema',
-    'moengo',
-    'moenich',
-    'moenkhausia',
-    'moenkopi',
-    'moeover',
-    'moera',
-    'moeran',
-    'moesenlechner',
-    'moet-chandon',
-    'mofeli',
-    'moffat/aged',
-    'moffatt/thamesdown',
-    'moffen',
     'mofgat',
-    'mofo',
-    'mofs',
-    'mofu',
-    'mofugger',
-    'moga',
-    'mogachoirb',
-    'mogadishu&mdash;uarsciek',
-    'mogadishu-gen',
-    'mogambo',
-    'mogaung-myitkyina',
-    'mogen',
-    'mogensen',
-    'mogey',
-    'mogford',
-    'mogg-davidson',
     'moggan',
-    'mogger',
-    'moggs',
-    'moghadassi',
-    'moghan',
-    'moghni',
-    'mogiro',
-    'mogok',
-    'mogue',
-    'moguled',
-    'mogulfield',
-    'mogulof',
-    'moh&eacute;li',
-    'mohabat',
-    'mohacs',
-    'mohairs',
     'mohali',
-    'mohamed-salih',
-    'mohammadamin',
-    'mohammadan',
-    'mohammed\'s',
-    'mohammedanism',
-    'mohamoud',
-    'mohand',
-    'mohato',
-    'mohawke',
-    'mohay',
-    'mohd',
-    'mohenjo-daro',
-    'moher',
-    'mohib',
-    'mohican-hair-piece',
     'mohicanned',
-    'mohiddin',
-    'mohiedine',
-    'mohinuddinpur',
-    'mohist',
-    'mohists',
-    'mohlala',
-    'mohlala/swindon',
-    'mohlalefi',
-    'mohler',
-    'mohmammed',
-    'mohmar',
-    'mohmood/colleague',
-    'mohn',
-    'mohocles',
-    'mohri',
     'mohseni',
-    'mohter',
-    'mohum',
-    'mohuns',
-    'mohve',
-    'mohyeddin/bb',
-    'moiane',
-    'moichiro',
-    'moigua',
-    'moikeha',
-    'moil',
-    'moilies',
-    'moilings',
-    'moily',
-    'moimoi',
-    'moinlam',
     'moins',
-    'moiola',
-    'moione',
-    'moiphebi',
-    'moir&eacute;s',
-    'moira-based',
-    'moires',
-    'moirpeth',
-    'mois&egrave',
-    'moisan',
-    'moiseiwitsch',
-    'moiser',
-    'moisley',
-    'moist-looking',
-    'moist-sounding',
-    'moistura',
     'moisture-absorbent',
-    'moisture-conserving',
-    'moisture-laden',
-    'moisture-levels',
-    'moisture-prevention',
-    'moisture-proof',
-    'moisture-retaining',
-    'moisture-smeared',
-    'moistureresistant',
-    'moisturisers.',
-    'moisturising/conditioning',
-    'moitel',
-    'moitesserie',
-    'moitinho',
-    'moiun',
-    'moiving',
     'moizer',
-    'moja',
-    'mojaddedi',
-    'mokaba',
-    'mokaf&eacute',
-    'mokes',
-    'mokete',
-    'mokhanto',
-    'mokni',
-    'mokoko',
-    'mokoni',
-    'mokoro',
-    'mokoroane',
-    'mokretsov',
-    'mokri',
-    'mokrice',
     'moktar',
-    'mokuba',
-    'mokume',
-    'mokyr',
-    'mol&eacute;son',
-    'mol/kg',
-    'molacek',
-    'molai',
-    'molality=mca',
-    'moland',
-    'molasse-detritus',
-    'molasses-type',
-    'molcad',
-    'mold-based',
-    'mold/pilot',
-    'moldava&mdash;although',
     'moldavia-romania',
-    'moldi',
-    'moldic',
-    'moldovans',
-    'moldpro',
-    'moldvay',
-    'moldy',
-    'mole-brown',
-    'mole-catcher',
-    'mole-catchers',
-    'mole-coloured',
-    'mole-dark',
-    'mole-hill',
-    'mole-hunting',
-    'mole-like',
-    'mole-mode',
     'mole-nest',
-    'mole-rats',
-    'mole-run',
-    'mole-snouted',
-    'mole-style',
-    'mole_of',
-    'molecu-prints',
-    'molecu-tech',
-    'molecublade',
-    'molecular&rehy;genetic',
-    'molecular-hydrogen',
-    'molecular-ring',
-    'molecular-sized',
-    'molecular-weight',
-    'molecularly-rapid',
-    'molecule&ndash',
     'molecule-like',
-    'molecule-mind',
-    'molecule-thin',
-    'moleculecm',
-    'moleculescm',
-    'moledat',
-    'moledina',
-    'molefe',
-    'molefi',
-    'molehunts',
-    'moleiro',
-    'molend',
-    'molenschot',
-    'moler',
-    'moleskin\'',
-    'moleskins',
     'molesly',
-    'molesta',
-    'molestations',
-    'molesterer',
-    'molestum',
-    'moletsane',
-    'molette',
-    'moleweeks',
-    'molfino',
-    'molien',
-    'molignengo',
-    'molina-annett',
-    'molina/spain',
-    'molinaannett',
-    'molinaire',
-    'molinas-campos',
     'moling/boring',
-    'molinier',
-    'molinological',
-    'molipaxin',
-    'molish',
-    'molkerei-zentrale',
-    'mollekin',
-    'mollenhauer',
-    'mollica',
-    'mollichaff',
-    'mollickin\'',
-    'mollicking',
-    'mollied',
-    'mollien',
-    'mollinedo',
-    'mollosus',
     'molloys',
-    'mollusc-crushing',
-    'mollusc-feeding',
-    'mollusc-like',
-    'molluscans',
-    'molluscicide',
-    'molluscicides',
-    'molluscivores',
-    'molluscs-annelids-brachiopods-pogonophorans',
-    'mollusk-shaped',
-    'molly-coddled',
-    'molly-coddling',
-    'mollyish',
-    'mollymauks',
-    'mollymawk',
-    'mollys',
     'molndal',
-    'molne',
-    'molo',
-    'moloch&verbar',
-    'molochian',
-    'molodetchno',
-    'molodezhnaya',
-    'molom',
-    'molongua',
-    'molossian',
-    'molotov-ribentropp',
-    'molotov-von',
-    'molotovs',
-    'molsey',
-    'molsheim',
-    'molstad',
     'molten-salt',
-    'moltenly',
-    'molti',
-    'moltkean',
-    'molua',
-    'moluccana',
-    'moluccans',
-    'moluscas',
-    'molybdenite',
-    'molye',
-    'molyenuex',
-    'molyn/polish',
-    'molynx',
-    'molyvos',
-    'molza',
-    'momart',
     'mombaerts',
-    'mombassa',
-    'momberger',
-    'mombet',
-    'momburg',
-    'mombuti',
-    'momegictiture',
-    'momemtum',
-    'moment\'',
-    'moment(s)',
-    'moment-',
-    'moment-as',
-    'moment-efficiency',
-    'moment-we',
-    'moment.',
-    'moment.it',
     'moment_of',
-    'momentary&mdash',
-    'momentictiture',
-    'momentum.',
-    'momersfield',
-    'momim',
-    'momji',
-    'momme',
-    'mommies',
-    'momodou',
-    'momodu',
-    'momoh&gt',
-    'momopolymers',
-    'momorandum',
-    'momorangi',
-    'momote',
     'momrosier',
-    'momus',
-    'momzer',
-    'momzers',
-    'mon&ndash;6.00',
-    'mon&ndash;wed',
-    'mon-ay',
-    'mon-thu',
-    'mon-thurs',
-    'mon-wed',
-    'mon.',
-    'mon/',
-    'mon/arch',
-    'monacco',
-    'monachesi',
-    'monachi',
     'monachus',
-    'monaco-based',
-    'monaghan/ali',
-    'monaghan/factory',
-    'monal',
-    'monalis',
-    'monance',
-    'monar&rehy;chies',
-    'monaragala',
-    'monarch-of-the-people',
-    'monarch.',
-    'monarchidae',
-    'monarchist/liberal',
-    'monarchs.',
-    'monarchy-church',
-    'monarchy-soaked',
     'monarchy.',
-    'monarda',
-    'monardas',
-    'monasterevin',
-    'monasterie',
-    'monasterio',
-    'monasterium',
-    'monastery-turned-parador',
-    'monastery/costa',
-    'monastic-foundation',
-    'monastic-like',
-    'monastic-looking',
-    'monastic-style',
-    'monasticon',
-    'monastir',
-    'monastiraki',
     'monastiriako',
-    'monastyrskaya',
-    'monat',
-    'monate',
-    'monaurally',
-    'monaveen',
-    'monbeig',
-    'monbiot/environmentalist',
-    'monbiot/oxford',
-    'monbusho',
-    'moncale',
-    'monceau',
-    'moncer',
-    'moncharmin',
-    'monchaux',
-    'monchauzet\'',
     'monchelsea',
-    'monching',
-    'monchio',
-    'monchiquite',
-    'monchs',
-    'moncion',
-    'monckland',
-    'moncontour',
-    'moncrief',
-    'moncytes',
-    'mond&rehy;nickel',
-    'mond-turner',
-    'monda',
-    'mondaine',
-    'mondal',
-    'monday-friday',
     'monday-fridays',
-    'monday-morning-like',
-    'monday.meanwhile',
-    'monday/hereford',
-    'mondaysaturday',
-    'mondego',
-    'mondiales',
-    'mondiali',
-    'mondlane',
-    'mondo-food',
-    'mondoliedo',
-    'mondolkiri',
-    'mondon',
-    'mondonico/torino',
-    'mondonville',
-    'mondrag&oacute;n',
     'mondriaan',
-    'mondrian-inspired',
-    'mone&rehy;tarization',
-    'monegros',
-    'monell',
-    'monelli',
-    'monemvasia',
-    'moneny',
-    'monera',
-    'monerville',
-    'mones',
-    'monet-monoxide',
-    'monet-style',
-    'monetaria',
-    'monetarist/new',
-    'monetarists/new',
     'monetarium',
-    'monetary-credit',
-    'monetgo',
-    'monetique',
-    'monets',
-    'monetta',
-    'money&mdash;it',
-    'money&mdash;the',
-    'money&rehy;changers',
-    'money&rehy;spinner',
-    'money(950,000)',
-    'money-boys',
-    'money-bringer',
-    'money-broking',
-    'money-carrier',
-    'money-centred',
     'money-changing',
-    'money-compartment',
-    'money-coutts',
-    'money-dominated',
-    'money-earning',
-    'money-for-nothing',
-    'money-forms',
-    'money-generating',
-    'money-grabber',
-    'money-grants',
-    'money-grubbers',
-    'money-harvesters',
-    'money-harvesting',
-    'money-hate',
-    'money-hungry',
-    'money-hunter',
     'money-hyped',
-    'money-in-the&rehy;bank',
-    'money-interest',
-    'money-is-the-only',
-    'money-jobbing',
-    'money-list',
-    'money-lovers',
-    'money-machine',
-    'money-matters',
-    'money-mongers',
-    'money-motivated',
-    'money-order',
-    'money-pouch',
-    'money-powerful',
-    'money-rents',
-    'money-saver',
     'money-scarcely',
-    'money-sign',
-    'money-spenders',
-    'money-spending',
-    'money-spinner.',
-    'money-talks',
-    'money-to-spare',
-    'money-traders',
-    'money-using',
-    'money-weighted',
-    'money-winning',
-    'money-worshipping',
-    'money.education',
-    'money/a',
-    'money/builder',
-    'money/goods',
     'money/had',
-    'money/leaves',
-    'money/reputation',
-    'money/valuables',
-    'money8',
-    'money_as',
-    'money_out',
-    'moneyan',
-    'moneyback',
-    'moneybag',
-    'moneygoods',
-    'moneyline',
-    'moneymore',
-    'moneyneaney',
-    'moneypersons',
-    'moneysee',
     'moneysmith',
-    'moneyspyder',
-    'moneystone',
-    'moneytalk',
-    'moneywealth',
-    'moneywinners',
-    'moneywort',
-    'monferrato',
-    'monflanquin',
-    'monflaur',
-    'monfs',
-    'mongalla',
-    'mongella',
-    'mongelli',
-    'mongi',
-    'mongiardino',
     'monging',
-    'mongkok',
-    'mongkolnavin',
-    'mongkut',
-    'monglet',
-    'mongletpublic',
-    'mongockodji',
-    'mongokodji',
-    'mongol-british',
-    'mongol-speaking',
-    'mongolbank',
-    'mongolian-chinese',
-    'mongolian-language',
-    'mongolica',
-    'mongolicus',
-    'mongolimpex',
     'mongolization',
-    'mongolus',
-    'mongrel-looking',
-    'mongrel-packs',
-    'mongrelization',
-    'mongrelized',
-    'mongu',
-    'monguls',
-    'mongy',
-    'monhdorjiyn',
-    'monhede',
-    'monial',
-    'monic',
-    'monic*',
-    'monickers',
-    'monier-williams',
     'monilia',
-    'monima-k',
-    'monimints',
-    'monin-obukhov',
-    'monistrol',
-    'monitel',
-    'monitered',
-    'monitering',
-    'moniters',
-    'monitor-evaluator',
-    'monitor-signal',
-    'monitor-specific',
-    'monitor.the',
-    'monitor/audit',
-    'monitor/evaluator',
-    'monitoring.',
     'monitoring/diary',
-    'monitoring/evaluation',
-    'monitoring/evaluation/reporting',
-    'monitory',
-    'moniuszko',
-    'monjack',
-    'monje',
-    'monjo',
-    'monk\'s-hood',
-    'monk-bishop',
-    'monk-goldsmith',
-    'monk-knights',
-    'monk-robed',
-    'monk/williams',
-    'monka',
-    'monken',
     'monket',
-    'monkey-clever',
-    'monkey-climb',
-    'monkey-fashion',
-    'monkey-features',
-    'monkey-glander',
-    'monkey-nimble',
-    'monkey-nut',
-    'monkey-plainness',
-    'monkey-sized',
-    'monkeybeck',
-    'monkeyed',
-    'monkeyish',
-    'monkeypuzzle',
-    'monkeys-hominoid',
-    'monkeys.',
     'monkeysqueak',
-    'monkeywrenching',
-    'monkhood',
-    'monkhouse/car',
-    'monkhousian',
-    'monkishness',
-    'monkland',
-    'monklike',
-    'monkman',
-    'monkman/trader',
-    'monkshill',
-    'monkstadt',
-    'monkstone',
-    'monkton-northwich',
-    'monku',
-    'monkwell',
     'monlam',
-    'monmonier',
-    'monmousseau',
-    'monmouth/gwent',
-    'monn',
-    'monnartz',
-    'monnery',
-    'monnieri',
-    'monnoyer',
-    'monnum',
-    'mono&rehy;elite',
-    'mono&rehy;syllabic',
-    'mono-casual',
-    'mono-causal',
-    'mono-control',
-    'mono-crop',
     'mono-crystalline',
-    'mono-culture',
-    'mono-filament',
-    'mono-hierarchical',
-    'mono-iodinated',
-    'mono-n-chloramine',
-    'mono-organizational',
-    'mono-phonetiea',
-    'mono-pitch',
-    'mono-polies',
-    'mono-reproduction',
-    'mono-ski',
-    'mono-skiing',
-    'mono-subject',
-    'mono-substituted',
-    'mono:bis',
     'monoacid',
-    'monoamines',
-    'monoanion',
-    'monoantibiotic',
-    'monobon',
-    'monobuoy',
-    'monochord',
-    'monochromaticism',
-    'monochromaticity',
-    'monochromators',
-    'monochromed',
-    'monocle-and-green-face-powder',
-    'monoclongla',
-    'monoco',
-    'monocoloured',
-    'monocomponent',
     'monocompositional',
-    'monocorus',
-    'monocristant',
-    'monocrop',
-    'monocropping',
-    'monocrotophos',
-    'monocrystant',
-    'monoculturalism',
-    'monocyte-rich',
-    'monocyte/macrophage',
-    'monocytes/',
-    'monocytic/macrophage',
-    'monod-cassidy',
-    'monod-fontaine',
-    'monodentate',
-    'monodies',
     'monodisciplinary',
-    'monodontidae',
-    'monodrama',
-    'monoethylene',
-    'monofluoroacetate',
-    'monogastric',
-    'monogenists',
-    'monogeny',
-    'monogerm',
-    'monogrammed-slippers',
-    'monogrammist',
-    'monographer',
-    'monographics',
-    'monographs.',
-    'monograptids',
-    'monograptus',
     'monogue',
-    'monogynum',
-    'monohull',
-    'monoia',
-    'monoiodo-glucagon',
-    'monoiodo-pyy',
-    'monokines',
-    'monokomana',
-    'monolena',
-    'monolinguist',
-    'monologists',
-    'monomatapa',
-    'monomedia',
-    'monomer(s)',
-    'monomer-based',
-    'monometic',
     'monometric',
-    'monometry',
-    'monomict',
-    'monomineralic',
-    'monominerallic',
-    'monomorium',
-    'monomutapa',
-    'monona',
-    'mononculear',
-    'mononen',
-    'mononitrate',
-    'mononucleosis-like',
-    'mononucleotides',
-    'mononulcear',
-    'monophones',
-    'monophthalmus',
     'monophysites',
-    'monophysitism',
-    'monoplacophoran',
-    'monoplies',
-    'monopods',
-    'monopol',
-    'monopolies-ibid.',
-    'monopolistic/oligopolistic',
-    'monopolizing.',
-    'monopoly\'',
-    'monopoly-ridden',
-    'monopoly/non-monopoly',
-    'monoprinting',
-    'monoprix',
-    'monoprofessional',
-    'monopsonist',
     'monorhythmic',
-    'monosaccaride',
-    'monosaccates',
-    'monosaccharide',
-    'monosaturate',
-    'monosaturated',
-    'monosaturates',
-    'monoskiing',
-    'monospace',
-    'monospars',
-    'monostachyus',
-    'monostatos',
-    'monostearate',
-    'monostroma',
-    'monosubstituted',
-    'monosulphate',
     'monosybils',
-    'monosynaptically',
-    'monothematic',
-    'monothioacetate',
-    'monotonies',
-    'monotransitive',
-    'monotreme',
-    'monotremes',
-    'monotrope',
-    'monotropes',
-    'monotrysian',
-    'monotyping',
-    'monounsaturates',
-    'monoux',
-    'monovalent',
-    'monoversation',
     'monoxided',
-    'monoxygotic',
-    'monoxyla',
-    'monr&eacute;al',
-    'monreal',
-    'monref',
-    'monring',
-    'monro-baggers',
-    'monro-davies',
-    'monroe/kennedy',
-    'monroy',
-    'mons-bouberc',
-    'monsall',
-    'monsalve',
-    'monsei',
-    'monseiur',
     'monsell',
-    'monsenor',
-    'monserato',
-    'monshe',
-    'monsi',
-    'monsignori',
-    'monsigny',
-    'monsoon-like',
-    'monsoon-soaked',
-    'monsoon/mitzi',
-    'monspar',
-    'monsted',
-    'monster&mdash',
-    'monster-from-the-blue-lagoon',
-    'monster-gore',
-    'monster-legend',
     'monster-loving',
-    'monster-maker',
-    'monster-making',
-    'monster-rat',
-    'monster-watchers',
-    'monstering',
-    'monsterish',
-    'monsters.',
-    'monstruos',
-    'monsue',
-    'monsummano-terme',
-    'mont&eacute;es',
-    'mont&egrave;s',
-    'mont-',
-    'mont-aim&eacute',
-    'mont-arme',
     'mont-de-marsan',
-    'mont-rachet',
-    'mont-st-michel',
-    'monta&ntilde;a',
-    'monta&ntilde;as',
-    'monta&ntilde;eros',
-    'monta&ntilde;eses',
-    'montabaur',
-    'montage-like',
-    'montage-style',
-    'montaged',
-    'montagna',
-    'montagne.',
-    'montagnes',
-    'montagu-harris',
-    'montagu/headmaster',
     'montagu/oxford',
-    'montagua',
-    'montague-capulet',
-    'montague-dawson',
-    'montague/headmaster',
-    'montalb&aacute;n',
-    'montalba',
-    'montalbo',
-    'montalcini',
-    'montalcino',
-    'montalvo',
-    'montana-vermala',
-    'montanelli',
-    'montanha',
-    'montanta',
-    'montanum',
     'montara',
-    'montargil',
-    'montargis',
-    'montarsolo',
-    'montary',
-    'montazels',
-    'montbarey',
-    'montblancs',
-    'montbron',
-    'montcada',
-    'montchanin',
-    'montchemin',
-    'montclar-d\'agenais',
-    'montdidier',
-    'monte&rehy;catini',
-    'monte-napoleone',
     'monteagudo',
-    'montecarlo',
-    'montecassino',
-    'montecativi',
-    'montecchi',
-    'montecitorio',
-    'montecucculi',
-    'montefiascone',
-    'montefioralle',
-    'montegna',
-    'montegre',
-    'monteleone',
-    'montellana-coronil',
-    'montelungo',
-    'montemaggiore',
-    'montemarte',
     'montenegran',
-    'montenegrin-albanian',
-    'montepequehealth',
-    'montepulcianesi',
-    'monteray',
-    'monterecchio',
-    'monteriggioni',
-    'monterrat',
-    'monterrey&rehy;huh',
-    'montesago',
-    'monteses',
-    'montesquiou',
-    'montesquiou-d\'artagnan',
-    'monteverde',
-    'monteverdian',
-    'montez',
     'montfalcon',
-    'montfermeil',
-    'montferrat',
-    'montfitchet',
-    'montfleury',
-    'montford',
-    'montfortists',
-    'montforts',
-    'montgen&egrave;vre',
-    'montgolfier-style',
-    'montgomerie-led',
-    'montgomery/raid',
-    'montgomeryensis',
-    'montgomnerie',
-    'montgoris',
-    'montgueux',
     'month&lsqb;1&rsqb',
-    'month\'',
-    'month(s)',
-    'month-',
-    'month-and-a-half',
-    'month-but',
-    'month/year',
-    'monthan',
-    'monthelon',
-    'montherlant',
-    'monthermer',
-    'monthgoing',
-    'monthira',
-    'monthlong',
-    'monthly-but',
-    'monthly-paid',
     'monthly/four-weekly',
-    'monthlyish',
-    'monthlywelcomes',
-    'monthon',
-    'months&mdash;costed',
-    'months&mdash;you',
-    'months&ndash;3',
-    'months&ndash;6',
-    'months-',
-    'months-14',
-    'months-28',
-    'months-by',
-    'months-long',
-    'months-old',
-    'months-worth',
-    'months.it',
     'months.the',
-    'months.there',
-    'months/unlimited',
-    'months/year',
-    'monthyon',
-    'montiaghisms',
-    'montibus',
-    'montiel',
-    'montierender',
-    'montifiore',
-    'montig&rehy;nac',
-    'montigny-en-vexin',
-    'montjoies',
-    'montmatre',
-    'montmirel',
-    'montmollin',
     'montmorillionite',
-    'montmorillon',
-    'montolieu',
-    'montolif',
-    'montona',
-    'montonhall',
-    'montonic',
-    'montorfano',
-    'montorgueil',
-    'montoyer',
-    'montpasset',
-    'montreal&ndash;ottawa&ndash',
-    'montreal&ndash;quebec',
-    'montrealer',
-    'montrealers',
-    'montreuils',
     'montrichardia',
-    'montroig',
-    'montrose/miraculous/female',
-    'montsegur',
-    'montsho',
-    'montsoreau',
-    'montsweag',
-    'montu',
-    'montvale',
-    'montzalee',
-    'monu',
-    'monu&rehy;ments',
-    'monument*',
-    'monumental-size',
-    'monumentalised',
-    'monuments/ordnance',
     'monviel',
-    'monwara',
-    'mony-ay-ree',
-    'monyhull',
-    'monyma',
-    'monypenny',
-    'monzi',
-    'monzur',
-    'moo-nited',
-    'moo-oo',
-    'moo-ooooo',
-    'moo-sic',
-    'moo-teng-genay',
-    'moo-ving',
-    'mooa',
-    'moochers',
     'mooches',
-    'moochie',
-    'mood-and-mind',
-    'mood-change',
-    'mood-controlling',
-    'mood-elevating',
-    'mood-led',
-    'mood-painting',
-    'mood-pictures',
-    'mood-piece',
-    'mood-shifting',
-    'mood-signalling',
-    'mood-signals',
-    'mood-spinning',
-    'mood-stabilizing',
-    'mood-stimulating',
     'mood-swing',
-    'mood.altering',
-    'moodies',
-    'moodiesburn',
-    'moodiest',
-    'moodified',
-    'moodless',
-    'moodscapes',
-    'moodster',
-    'moodswing',
-    'moody-sankey',
-    'moody/marsden',
-    'moody/scope',
-    'moody/tenant',
-    'mooiwana',
-    'mookerjee',
     'moolds',
-    'moolgewante',
-    'mooltan',
-    'moominpappa',
-    'moomintroll',
-    'moon**',
-    'moon-associated',
-    'moon-based',
-    'moon-bath',
-    'moon-beam',
-    'moon-blanched',
-    'moon-booted',
-    'moon-bright',
-    'moon-burnished',
-    'moon-children',
-    'moon-colonies',
     'moon-coloured',
-    'moon-daisy',
-    'moon-day',
-    'moon-dusted',
-    'moon-dwellers',
-    'moon-flecked',
-    'moon-fragments',
-    'moon-ghost',
-    'moon-girl',
-    'moon-glossed',
-    'moon-glow',
-    'moon-grey',
-    'moon-head',
-    'moon-horned',
-    'moon-in',
-    'moon-landing',
     'moon-landings',
-    'moon-less',
-    'moon-lighting',
-    'moon-made',
-    'moon-mouth',
-    'moon-mouthed',
-    'moon-music',
-    'moon-myths',
-    'moon-probes',
-    'moon-queens',
-    'moon-rock',
-    'moon-rocket',
-    'moon-shadowed',
-    'moon-shapes',
-    'moon-shot',
-    'moon-sickle',
     'moon-splashed',
-    'moon-struck',
-    'moon-version',
-    'moon-walkers',
-    'moon-walks',
-    'moon-washed',
-    'moon-wheel',
-    'moon/sun',
-    'moonboot',
-    'moonbuggy',
-    'mooncake',
-    'mooncalf',
-    'mooncalves',
-    'moonchildren',
-    'moondah',
-    'moondark',
     'moondirt',
-    'moondreams',
-    'moondust',
-    'moonen',
-    'mooney/dog',
-    'moonfaced',
-    'moongleam',
-    'moonglow',
-    'moonie-like',
-    'moonie-type',
-    'moonlet',
-    'moonlicht',
-    'moonlight-blond',
-    'moonlight-encrusted',
-    'moonlighter',
-    'moonlights',
     'moonling',
-    'moonlit/sunlit',
-    'moonmen',
-    'moonquakes',
-    'moonrays',
-    'moonrock',
-    'moonshiners',
-    'moonshot',
-    'moonstaff',
-    'moonstomp',
-    'moonstrike',
-    'moonswept',
-    'moontouched',
-    'mooo',
-    'moooonstompin',
-    'mooooonnn',
     'mooould',
-    'moor&eacute',
-    'moor-edge',
-    'moor-evil',
-    'moor-hen',
-    'moor-hey',
-    'moor-lake',
-    'moor-or',
-    'moor-penny',
-    'moor-top',
-    'moor-tops',
-    'mooratoogs',
-    'moorbridge',
-    'moorcraft',
-    'moordale',
-    'moore-collyer',
     'moore-colyer',
-    'moore-ish/beck-ish/clapton-ish',
-    'moore/accident',
-    'moore/brockweir',
-    'moore/candy',
-    'moore/chalford',
-    'moore/charlton',
-    'moore/cirencester',
-    'moore/cricketer',
-    'moore/department',
-    'moore/devizes',
-    'moore/dorton',
-    'moore/former',
-    'moore/fundraiser0',
-    'moore/milton',
-    'moore/pilot',
     'moore/rodborough',
-    'moore/roker',
-    'moore/shrivenham',
-    'moore/stadium',
-    'moore/swindon',
-    'moore/the',
-    'moore/trader',
-    'moore/widow',
-    'moore/winslow/buckinghamshire',
-    'moore/worcester',
-    'mooreman',
-    'moorewood',
-    'moorfoot',
-    'moorglen',
-    'moorii',
-    'mooring-up',
     'mooring/location',
-    'moorland-covered',
-    'moorland.',
-    'moorland/',
-    'moorland/rough',
-    'moorland_in_search',
-    'moorlight',
-    'moorloch',
-    'moorly',
-    'moorstone',
-    'moortop',
-    'moortown/ardboe',
-    'moorwood',
-    'moosa',
-    'moosai',
-    'moosbruggstrasse',
     'moose-hunting',
-    'moose-like',
-    'moosejaw',
-    'mooserboden',
-    'mooses',
-    'moosomin',
-    'moostakali',
-    'moot-hill',
-    'mooter',
-    'moothams',
-    'mooths',
-    'mootty',
-    'mooulding',
-    'mooun',
-    'moowk',
-    'mop-heads',
     'mop-top',
-    'moped-riders',
-    'mopey',
-    'mopheads',
-    'mopish',
-    'mopishness',
-    'mopof',
-    'moppers-up',
-    'moppin\'',
-    'mopple',
-    'mopsuestia',
-    'mopsy',
-    'moptop',
-    'moquettes',
-    'moquini',
-    'moraal',
     'moraff',
-    'moraga',
-    'moraich',
-    'morajela',
-    'moral&mdash;allegorical',
-    'moral-at-the-end',
-    'moral-based',
-    'moral-fibre',
-    'moral-philosophical',
-    'moral-practical',
-    'moral-religious',
-    'moral-scientific',
-    'moral/ethical',
-    'moral/social',
-    'morale-builder',
-    'morale-building',
     'morale.',
-    'moralebuilding',
-    'morales-olivas',
-    'moralia',
-    'moralice',
-    'moralis&eacute',
-    'moralisation',
-    'moralisers',
-    'moralises',
-    'moralisings',
-    'moralisms',
-    'moralist&mdash',
-    'moralistically',
-    'morality\'',
-    'morality-\'who',
-    'morality-religion',
     'morality-religions',
-    'morality-while',
-    'morality.',
-    'moralizations',
-    'moralizers',
-    'morally-decent',
-    'morally-sound',
-    'morals-positively',
-    'moran/socialist',
-    'morandini',
-    'morando-attendolo-bolognini',
-    'morangis',
-    'moranhood',
-    'moranion',
-    'morante',
-    'morantel',
     'moras',
-    'morasses',
-    'morasso',
-    'morat&iacute;n',
-    'moratal',
-    'morates',
-    'moratuwa',
-    'morava-vardar',
-    'moravia-silesian',
-    'moravian-silesian',
-    'moravsky',
-    'morawski',
-    'moray-buchan',
-    'morays',
-    'morazn',
-    'morazo',
     'morb-oib',
-    'morb-type',
-    'morbey/former',
-    'morbey/mayor',
-    'morbi',
-    'morbidezza',
-    'morbids',
-    'morbius',
-    'morbry',
-    'morbs',
-    'morby',
-    'morcant',
-    'morcar',
-    'morcenx-arjuzanx',
-    'morchard',
-    'morcoast',
     'mord',
-    'morda',
-    'mordabito',
-    'mordancy',
-    'mordanted',
-    'mordaunt-short',
-    'mordauntt',
-    'mordbity',
-    'mordechair',
-    'mordents',
-    'mordern/sutton',
-    'mordialloc',
-    'mordiford',
-    'mordington',
-    'mordkommission',
-    'mordlinger',
     'mordo',
-    'mordor-bushes',
-    'mordor-flies',
-    'mordor-made',
-    'mordor-spell',
-    'mordt',
-    'mordvinov',
-    'more&gt',
-    'more&mdash;and',
-    'more&rehy;or-less-equal',
-    'more&rehy;over',
-    'more*',
-    'more-attractive',
-    'more-cost',
-    'more-densely',
-    'more-distant',
     'more-educated',
-    'more-established',
-    'more-experienced',
-    'more-famous',
-    'more-feared',
-    'more-frequent',
-    'more-important',
-    'more-is-more',
-    'more-lightly',
-    'more-members',
-    'more-obvious',
-    'more-or',
-    'more-qualified',
-    'more-recently',
-    'more-senior',
-    'more-sophisticated',
     'more-tasteful-than-average',
-    'more-than&rehy;literary',
-    'more-than-300',
-    'more-than-adequate',
-    'more-than-average',
-    'more-than-circumspect',
-    'more-than-doubled',
-    'more-than-generous',
-    'more-than-half',
-    'more-than-one-place',
-    'more-than-religious',
-    'more-than-useful',
-    'more-than-usual',
-    'more-than-usually',
-    'more-than-usually-complete',
-    'more-than-when-they-started',
     'more-to-be-pitied',
-    'more-up-beat',
-    'more.16',
-    'more.is',
-    'more.sparing',
-    'more/',
-    'more/splinters',
-    'more/than',
-    'more/to',
-    'more/turn',
-    'more=4',
-    'more_,_you\'re_more_than',
-    'more_in_line',
-    'morecambe-',
-    'morecombe.',
-    'morefonts',
     'moregreen',
-    'morehen',
-    'morel-mushroom',
-    'morelands',
-    'morells',
-    'morelly',
-    'morena-b&ucirc;cherons',
-    'morena-original',
-    'morenas',
-    'morenho',
-    'morente',
-    'moreruela',
-    'mores-they',
-    'moresche',
-    'moreschi',
-    'morescombe',
     'morese',
-    'moresque',
-    'moreton/oxfordshire',
-    'morette',
-    'moretus',
-    'morever',
-    'moreville',
-    'moreways',
-    'morewood',
-    'morfeld',
-    'morfelden',
-    'morfit',
-    'morfitt',
-    'morflot',
-    'morford',
-    'morfydd',
     'morgaine',
-    'morgan(1818&ndash;81)',
-    'morgan-bzw',
-    'morgan-grampian',
-    'morgan-grenfell',
-    'morgan-jones',
-    'morgan-owen',
-    'morgan/bandmaster',
-    'morgan/contestant',
-    'morgan/garage',
-    'morgan/gloucestershire',
-    'morgan/organic',
-    'morgan/rover',
-    'morgan/vicar',
-    'morgan/victim',
-    'morgan/villager',
     'morgan/ward',
-    'morganae',
-    'morganatically',
-    'morganites',
-    'morganmoore',
-    'morgantown',
-    'morganza',
-    'morgarten',
-    'morgenl&auml;ndischen',
-    'morgenlied',
-    'morgensavisen',
-    'morglay',
-    'morgrim',
-    'morguard',
-    'morhall',
-    'morhange',
     'morhange-sarrebourg',
-    'morhenn',
-    'morhogenesis',
-    'moriarity',
-    'moriartys',
-    'morias',
-    'moriatou',
-    'moriaty',
-    'moribundity',
-    'moricizine',
-    'moriconium',
-    'moriendi',
-    'morier',
-    'morifing',
-    'morihei',
-    'morihiro',
     'morilena',
-    'morimoto',
-    'morimur',
-    'moringa',
-    'morins',
-    'morio',
-    'morioka',
-    'morion',
-    'morior',
-    'morir',
-    'morisawa',
-    'morisco',
-    'moriscos',
-    'morishima',
-    'moritura',
-    'moriyoshi',
     'moriz&egrave;s',
-    'morizot',
-    'morkin2',
-    'morkunas',
-    'morl/world',
-    'morlai',
-    'morlais',
-    'morlanmd',
-    'morle/husband',
-    'morle/wife',
-    'morley-minto',
-    'morley/bass',
-    'morley/central',
-    'morley/penman',
-    'morley/programme',
-    'morley/thames',
     'morlotti',
-    'morman',
-    'mormaor',
-    'mormark',
-    'mormesnil',
-    'mormorar',
-    'mormyrid',
-    'morn&rehy',
-    'morner',
-    'mornin\'s',
-    'morning&rehy;room',
-    'morning-about',
-    'morning-coated',
-    'morning-dressed',
-    'morning-it',
-    'morning-peak',
     'morning-she',
-    'morning-star',
-    'morning-that',
-    'morning-time',
-    'morning-tuesday',
-    'morning.6',
-    'morning/',
-    'morning/afternoon&mdash',
-    'morning/afternoon/evening',
-    'morning/evening',
-    'morning/friday',
-    'morning/granada',
-    'morning/hitch',
-    'morninge',
-    'mornings/ploughman',
-    'morningsuit',
     'morningtide',
-    'mornng',
-    'moroccan-occupied',
-    'moroccan-sponsored',
-    'moroccan-type',
-    'morocco-portugal',
-    'moroccos',
-    'morococha',
-    'moroever',
-    'morokvasic',
-    'morolity',
-    'moron-free',
-    'moron/',
-    'moronov',
-    'moros',
-    'morose-looking',
     'morosit&eacute',
-    'morosov',
-    'morosus',
-    'morou',
-    'morozkin',
-    'morperth',
-    'morpeth-',
-    'morpeth-bedlington-ashington',
-    'morpfee',
-    'morph-evidenced',
-    'morphadate',
-    'morphe',
-    'morpheme-based',
-    'morpheme-final',
-    'morphets',
-    'morphinae',
     'morphine-6-glucuronide',
-    'morphine-requiring',
-    'morphnoides',
-    'morpho-syntactical',
-    'morphogenetically',
-    'morphohistological',
-    'morphologically-based',
-    'morphologically-different',
-    'morphomat',
-    'morphophonemic',
-    'morphospace',
-    'morphotectonic',
-    'morphy-schrufer',
-    'morporkian',
-    'morra',
-    'morrab',
     'morrell-pollock',
-    'morrell/managing',
-    'morren',
-    'morrin',
-    'morrinsville',
-    'morris&ndash;jenson',
-    'morris-jones',
-    'morris-like',
-    'morris-men',
-    'morris-type',
-    'morris/author',
-    'morris/bodenham',
-    'morris/e',
-    'morris/farmer',
-    'morris/general',
-    'morris/jockey',
     'morris/landscape',
-    'morris/narcolepsy',
-    'morris/piano',
-    'morris/punter',
-    'morris/richard',
-    'morris/sspca',
-    'morris/staunton',
-    'morris/zoologist',
-    'morrisburg',
-    'morrises',
-    'morrisey/british',
-    'morrish',
-    'morrisman',
-    'morrismen',
-    'morrison&mdash;stated',
-    'morrison-bell',
     'morrison-low',
-    'morrison/breeder',
-    'morrison/nuffield',
-    'morrison/roger',
-    'morrisonesque',
-    'morrissey-marr',
-    'morrissey-style',
-    'morrissey-worshipping',
-    'morrocan',
-    'morrows',
-    'morrsleib',
-    'morrys',
-    'morsa',
-    'morsburg',
-    'morse/boatbuilder',
-    'morseaholic',
     'morseled-out',
-    'morses',
-    'morsey',
-    'morsey.',
-    'morshead',
-    'morsite',
-    'morso',
-    'morsoleum',
-    'morss',
-    'mort-safes',
-    'mortagages',
-    'mortali\'',
-    'mortalia',
-    'mortalitie',
-    'mortality-rate',
-    'mortar-bearing',
     'mortar-bombed',
-    'mortar-flashes',
-    'mortar-rich',
-    'mortara-cardiodata',
-    'mortarboard',
-    'mortarless',
-    'mortarman',
-    'mortarmen',
-    'mortars.',
-    'mortars/etc',
-    'mortary',
-    'mortcloth',
-    'mortella',
-    'mortels',
-    'mortemart',
-    'mortenes',
     'mortens',
-    'morter',
-    'mortgage-free',
-    'mortgage-holder',
-    'mortgage-lender',
-    'mortgage-lending',
-    'mortgage-payers',
-    'mortgage-paying',
-    'mortgage-property',
-    'mortgage-rate',
-    'mortgage-servicing',
-    'mortgage-sharing',
-    'mortgageable',
-    'mortgaged&mdash;the',
-    'mortgagee/litigant',
-    'mortgages-to-rents',
     'mortgages.',
-    'mortgageware',
-    'mortgagor(s)',
-    'mortgate',
-    'mortham',
-    'morthwaite',
-    'mortice-key',
-    'mortician-embalmer',
-    'mortician/beautician',
-    'mortier',
-    'mortility',
-    'mortlock/oxfordshire',
-    'mortlock/road',
-    'mortmain\'',
-    'morton-in-marsh',
-    'morton/barrus',
     'morton/children',
-    'morton/do-it-all',
-    'mortonesque',
-    'mortorcycle',
-    'mortuary-complex',
-    'mortuary-complexes',
-    'mortuum',
-    'moruisg/ceannaichean',
-    'morum',
-    'moruna',
-    'moruzzi',
-    'morveau',
-    'morvern-cabrach',
-    'morvillo',
-    'morvina',
-    'morweiler',
     'morwell',
-    'morwen',
-    'morwena',
-    'morwood',
-    'mory-tnte',
-    'morysse',
-    'morze',
-    'morzem',
-    'mos\'ly',
-    'mosa',
-    'mosaic-',
-    'mosaic-based',
-    'mosaic-covered',
-    'mosaic-faced',
-    'mosaic-like',
-    'mosaic-this',
     'mosaic/mosaicists',
-    'mosaicism',
-    'mosaicist(s)',
-    'mosaicked',
-    'mosaics.',
-    'mosandrum',
-    'mosat',
-    'mosca.if',
-    'moscaryi',
-    'moschaia',
-    'moschini',
-    'moschino-style',
-    'moschoi',
-    'moscom',
-    'mosconi',
-    'moscoso',
     'moscovite',
-    'moscovy',
-    'moscow&mdash',
-    'moscow-controlled',
-    'moscow-on-the-hudson',
-    'moscow-paris',
-    'moscow-smolensk',
-    'moscow/st',
-    'moscow0',
-    'moscowa',
-    'moseh',
-    'moseism',
-    'moseley/prisoner',
-    'moseley47pts',
-    'moseling',
-    'mosella',
     'moses-compliant',
-    'moseslike',
-    'moseying',
-    'moseys',
-    'mosgladh',
-    'mosh-pit',
-    'moshanu',
-    'mosharraf',
-    'moshin',
-    'moshkids',
-    'moshood',
-    'mosht',
-    'mosi',
-    'mosiac',
-    'mosiacs',
-    'mosimanns',
     'mosissa',
-    'mosjo',
-    'moskalenko',
-    'moskalik',
-    'moskenes&ouml;y',
-    'moskinsky',
-    'moskos',
-    'moskovicy',
-    'moskowitz',
-    'moskvitch',
-    'mosle',
-    'moslem-',
-    'moslem-based',
-    'moslem-dominated',
-    'moslem-influenced',
-    'moslem-inhabited',
     'moslem-inspired',
-    'moslem-led',
-    'moslem-occupied',
-    'moslem-populated',
-    'mosleyite',
-    'mosmol',
-    'mosolov',
-    'mosonmagyar&oacute;v&aacute;r',
-    'mosor',
-    'mosotho',
-    'mosow',
-    'mosque-burners',
-    'mosque-cap',
-    'mosque-caps',
-    'mosquin',
-    'mosquito\'',
     'mosquito-bitten',
-    'mosquito-bolts',
-    'mosquito-net',
-    'mosquito-netted',
-    'mosquitofish',
-    'mosquitoinfested',
-    'moss&rehy;covered',
-    'moss-bedecked',
-    'moss-blob',
-    'moss-campions',
-    'moss-clad',
-    'moss-coated',
-    'moss-feather-and-shit-covered',
-    'moss-garden',
-    'moss-heath',
-    'moss-hung',
     'moss-slimed',
-    'moss-stained',
-    'moss-veiled',
-    'moss-woven',
-    'moss/',
-    'moss/chairman/dover',
-    'moss/daughter',
-    'moss/department',
-    'moss/former',
-    'moss/gloucestershire',
-    'moss/oxfordshire',
-    'moss/pascale',
-    'moss/race',
-    'moss/transport',
-    'mossadeqs',
-    'mossades',
     'mossadesq',
-    'mossadew',
-    'mossaitbeh',
-    'mossat',
-    'mossballs',
-    'mossbank',
-    'mossborough',
-    'mosscroft',
-    'mosselmans',
-    'mosselmarkt',
-    'mossend&ndash;severn',
-    'mossett',
-    'mosseveld',
-    'mossgate',
-    'mossgrove',
-    'mossi',
     'mossily',
-    'mosslands',
-    'mosson/glasgow',
-    'mosstodloch',
-    'mosstrooper',
-    'most-affected',
-    'most-cited',
-    'most-common',
-    'most-commonly',
-    'most-deprived',
-    'most-easily',
-    'most-effectively',
-    'most-feared',
-    'most-hated',
-    'most-if',
-    'most-important',
     'most-likely-to-be-concentrated-on',
-    'most-likely-to-succeed',
-    'most-loved',
-    'most-photographed',
-    'most-played',
-    'most-polite',
-    'most-popular',
-    'most-readily',
-    'most-recently',
-    'most-talented',
-    'most-two',
-    'most-up-to-date',
-    'most-wanted',
-    'most-widely',
-    'most/fewest',
-    'mostaard',
     'mostafavi',
-    'mostaganem',
-    'mostagedda',
-    'mostaig',
-    'mostarda',
-    'mostbank',
-    'mostefa',
-    'mostek',
-    'mosters',
-    'mostfaculties',
-    'mostini',
-    'mostle',
-    'mostly-christian',
-    'mostly-developing',
-    'mostly-eaten',
-    'mostly-foreign',
     'mostly-ignored',
-    'mostly-zulu',
-    'mostly.',
-    'mostovoy',
-    'moswin',
-    'mot&ouml;rhead',
-    'mot-type',
-    'mot-while-u-wait-garage',
-    'motaball',
-    'motability-registered',
-    'motacillidae.',
-    'motador',
-    'motaguense',
-    'motala',
-    'motaparts',
-    'motar',
     'motasse',
-    'motat',
-    'mote-like',
-    'motej',
-    'motel-supermarket-hamburger',
-    'moten',
-    'moter',
-    'moteram',
-    'motet-like',
-    'motet-passion',
-    'motet-settings',
-    'motet-type',
-    'motet-wise',
-    'motetti',
-    'motetz',
-    'moth-ball',
     'moth-balls',
-    'moth-holes',
-    'moth-mauve',
-    'moth-pollinated',
-    'moth-proof',
-    'moth-proofer',
-    'moth-wing',
-    'mothbattled',
-    'mothecome',
-    'mother&ndash;and&ndash;baby',
-    'mother&rehy;fornicating',
-    'mother&rehy;of-three',
-    'mother-a',
-    'mother-album',
-    'mother-and-child-on-beach',
-    'mother-anything',
     'mother-as-obstacle',
-    'mother-bird',
-    'mother-deaf',
-    'mother-dominated',
-    'mother-f&mdash;ing',
-    'mother-father-child',
-    'mother-fixated',
-    'mother-fixations',
-    'mother-flesh',
-    'mother-foal',
-    'mother-foetal',
-    'mother-god',
-    'mother-have',
-    'mother-humper',
-    'mother-image',
-    'mother-in-law/daughter-in-law',
     'mother-in-law/son-in-law',
-    'mother-in-waiting',
-    'mother-instinct',
-    'mother-is',
-    'mother-knitted',
-    'mother-naked',
-    'mother-of-3',
-    'mother-of-nine',
-    'mother-of-pear',
-    'mother-of-pearl-lined',
-    'mother-of-pearled',
-    'mother-of-pearls',
-    'mother-of-six',
-    'mother-of-so-many',
-    'mother-of-the-bride',
-    'mother-offspring',
     'mother-on-law',
-    'mother-out-law',
-    'mother-she',
-    'mother-sitters',
-    'mother-subject',
-    'mother-tandana',
-    'mother-to-baby',
-    'mother-to-be.',
-    'mother-to-child',
-    'mother-type',
-    'mother-wit',
-    'mother-worshipper',
-    'mother-worshipping',
-    'mother/foetus',
-    'mother/infant',
-    'mother/virgin',
     'mother6',
-    'motherboard.',
-    'mothercomplex',
-    'mothercountry',
-    'motherers',
-    'motherf&mdash',
-    'motherf&mdash;ers',
-    'motherfucker-in',
-    'motherfuckin\'',
-    'motherfunkers',
-    'motherhoods',
-    'motherhouse',
-    'motherin-law',
-    'motherlode',
-    'motherly/sisterly',
-    'mothers-in',
     'mothers.',
-    'mothersdill',
-    'mothertongue',
-    'motherwell0',
-    'mothibeli',
-    'mothly',
-    'mothproof',
-    'mothproofed',
-    'mothra',
-    'motier',
-    'motif-centres',
-    'motif-grounded',
-    'motif-run',
-    'motif-specific',
-    'motif-style',
-    'motif.',
     'motif/open',
-    'motif/unix',
-    'motif/x',
-    'motilities',
-    'motility.',
-    'motion-control',
-    'motion-pictures',
-    'motion-sickness',
-    'motion-work',
-    'motionhouse',
-    'motionlessly',
-    'motis',
-    'motiue',
-    'motiv',
-    'motival',
-    'motivatin\'',
     'motivation-arousal',
-    'motivation-the',
-    'motivation.',
-    'motivation/commitment',
-    'motivationally',
-    'motive-hunting',
-    'motive-power',
-    'motiveless:anger',
-    'motives/goals',
-    'motl',
-    'motlana',
-    'motley-haired',
-    'motley-panelled',
-    'motleyana',
-    'motleyed',
-    'moto-',
     'moto-perpetuo',
-    'motob&eacute;cane',
-    'motoji',
-    'motokoa',
-    'moton',
-    'motonautique',
-    'motoo',
-    'motor&pound',
-    'motor-',
-    'motor-activity',
-    'motor-bike-riding',
-    'motor-buses',
-    'motor-cicles',
-    'motor-coach',
-    'motor-coaches',
-    'motor-crazy',
     'motor-dependent',
-    'motor-drives',
-    'motor-engineering',
-    'motor-force',
-    'motor-glider',
-    'motor-gliders',
-    'motor-habit',
-    'motor-habits',
-    'motor-homed',
-    'motor-homes',
-    'motor-industry',
-    'motor-lorries',
-    'motor-madness',
-    'motor-mechanic',
-    'motor-moths',
-    'motor-mouth',
     'motor-mowers',
-    'motor-oil',
-    'motor-pump',
-    'motor-school',
-    'motor-sensory',
-    'motor-sport',
-    'motor-taxis',
-    'motor-tyre',
-    'motor-tyres',
-    'motor-van',
-    'motor-vation',
-    'motor-vehicles',
-    'motor-was',
-    'motor-way',
-    'motor/blade',
-    'motor/lead',
     'motor/load/housing',
-    'motor/pump',
-    'motor9',
-    'motora',
-    'motorbike-riding',
-    'motorbility',
-    'motorcaded',
-    'motorcamper',
-    'motorcar-mountain',
-    'motorcaravan',
-    'motorcaravans',
-    'motorcity',
-    'motorcylcists',
-    'motorcyling',
-    'motorcylist',
-    'motordrive',
     'motoren-und-turbinen-union',
-    'motori',
-    'motorial',
-    'motoric-gestural',
-    'motorine',
-    'motoring.',
-    'motoring/ferry',
-    'motorist.',
-    'motorist/3',
-    'motorists/glasgow/',
-    'motorizada',
-    'motorization',
-    'motorless',
-    'motorlet',
-    'motorola-ibm',
-    'motorola/ibm',
     'motorparts',
-    'motors-cycle',
-    'motors-toyota',
-    'motorsailed',
-    'motorscooter',
-    'motorshow',
-    'motorsists',
-    'motorspeeder.',
-    'motorwagon',
-    'motorway-users',
-    'motorways.but',
-    'motorways.police',
-    'motorways/highways',
-    'motorweek',
-    'motorwomen',
-    'motoryway',
     'motos',
-    'motosaledi',
-    'mototrist',
-    'mototrola',
-    'motown-fuelled',
-    'motril',
-    'motsamai',
-    'motson-style',
-    'mott/concert',
-    'mottaret',
-    'mottarone',
-    'motte-and-bailey',
-    'motte-bossut',
-    'mottects',
-    'mottely',
-    'motter',
     'motteroz',
-    'mottershead',
-    'mottes',
-    'mottetz',
-    'mottistone',
-    'mottl',
-    'mottle-faced',
-    'mottle-leaved',
-    'mottled-green',
-    'mottled-hued',
-    'mottled-stone',
-    'mottles',
-    'mottling.',
-    'mottlings',
-    'motto-theme',
-    'motts',
     'motty',
-    'motueka',
-    'mouaffak',
-    'mouat',
-    'mouayad',
-    'moubandjo',
-    'moucani',
-    'moucharte',
-    'moucher',
-    'mouclade',
-    'moucure',
-    'mouderris',
-    'moudour',
-    'mouer',
-    'mouffetard',
-    'mouflant',
     'mouflon',
-    'moufti',
-    'mougeotia',
-    'moughal',
-    'mouhamed',
-    'mouhroussine',
-    'mouill&eacute',
-    'moujik',
-    'moukhtara',
-    'moulainville',
-    'moulas',
-    'mould-',
-    'mould-boards',
-    'mould-boxes',
-    'mould-encrusted',
-    'mould-fronted',
     'mould-pieces',
-    'mould-spattered',
-    'mould-taste',
-    'mouldable',
-    'mouldboard',
-    'mouldcast',
-    'moulded-plastic',
-    'mouldes',
-    'mouldiest',
-    'mouldiness',
-    'moulding-power',
-    'mouldings.',
-    'mouldiwarp',
-    'mouldy-looking',
-    'mouldy-smelling',
-    'mouldywarp',
     'moulescoomb',
-    'moulham',
-    'moulhams',
-    'mouli&eacute',
-    'moulineuf',
-    'moulinexs',
-    'moulini&eacute',
-    'moulmein-ye',
-    'moulmeingyun',
-    'moulsdale',
-    'moulsey',
-    'moulsford',
-    'moult-sites',
-    'moun&mdash',
-    'mouna',
-    'mounan',
     'mounatins',
-    'mouncher',
-    'mound-building',
-    'mound-folk',
-    'mound-like',
-    'mound-shaped',
-    'mound.',
-    'moundiness',
-    'moune',
-    'mounier',
-    'mounment',
-    'mounqid',
-    'mounseys',
-    'mount-temple',
-    'mount/charlton',
-    'mountai',
     'mountain&lsqb;s&rsqb',
-    'mountain-brook',
-    'mountain-builders',
-    'mountain-caused',
-    'mountain-designer',
-    'mountain-designers',
-    'mountain-designing',
-    'mountain-dwelling',
-    'mountain-fold',
-    'mountain-fringed',
-    'mountain-giant',
-    'mountain-girdled',
-    'mountain-girt',
-    'mountain-hiking',
-    'mountain-like',
-    'mountain-peaks',
     'mountain-postroad',
-    'mountain-range',
-    'mountain-side',
-    'mountain-spur',
-    'mountain-streams',
-    'mountain-walking',
-    'mountain.although',
-    'mountain.as',
-    'mountain/in',
-    'mountainbikers',
-    'mountaincall',
-    'mountained',
-    'mountains.',
-    'mountaintown',
-    'mountainwalking',
-    'mountainwest',
     'mountathos',
-    'mountbatten-windsor',
-    'mountbenger',
-    'mountboard',
-    'mountboards',
-    'mountbriand',
-    'mountcharles',
-    'mountcollyer',
-    'mounted\'',
-    'mounteney',
-    'mounters',
-    'mountevans',
-    'mountfern',
-    'mountfichet',
-    'mountfitchet',
-    'mountford/social',
     'mountifield',
-    'mounting-steps',
-    'mountingblock',
-    'mountive',
-    'mountjoys',
-    'mountmellick',
-    'mountmichael',
-    'mountpottinger',
-    'mounts.',
-    'mountsey',
-    'mountshannon',
-    'mountstewart',
-    'mountvernon',
-    'mountview',
-    'mourie',
-    'mouries',
     'mourillan',
-    'mouriri',
-    'mourjane',
-    'mournacre',
-    'mourner-in-chief',
-    'mournerless',
-    'mournings',
-    'mournyng',
-    'mourton',
-    'mousaios',
-    'mousavi',
-    'mousawi',
-    'mouse&rehy;driven',
-    'mouse\'',
-    'mouse-',
-    'mouse-alert',
     'mouse-and-icons',
-    'mouse-and-windows',
-    'mouse-based',
-    'mouse-cell',
-    'mouse-controlled',
-    'mouse-ear',
-    'mouse-eaten',
-    'mouse-faced',
-    'mouse-grey',
-    'mouse-human',
-    'mouse-in-a-blender',
-    'mouse-mats',
-    'mouse-operated',
-    'mouse-related',
-    'mouse-sensitive',
-    'mouse-sized',
     'mouse-tests',
-    'mouse-worth',
-    'mouse/long-eared',
-    'mousehold',
-    'mouseorganist',
-    'mousequeteer',
-    'mousetail',
-    'mousetricht',
-    'mousey-brown',
-    'mousey-coloured',
-    'moushourgi',
-    'mousie',
-    'mousiness',
-    'mousing',
-    'mouskouri',
-    'mouslah',
     'mousouris',
-    'moussalli',
-    'moussant',
-    'moussavi-ardebli',
-    'moussawi',
-    'mousse-pink',
-    'mousse_for',
-    'mousseaux',
-    'moussed',
-    'moussed-up',
-    'moussel',
-    'mousselines-de-soie',
-    'moussette',
-    'moussoro',
-    'moussy',
-    'moustacio',
     'moustiers',
-    'mousy-grey',
-    'moutan',
-    'moutardier',
-    'mouth&ndash',
-    'mouth&rehy;organ',
-    'mouth&rehy;piece',
-    'mouth&rehy;waterin\'',
-    'mouth\'',
-    'mouth-',
-    'mouth-breathing',
-    'mouth-bred',
-    'mouth-brooding',
-    'mouth-coating',
-    'mouth-corners',
-    'mouth-count',
     'mouth-drying',
-    'mouth-fed',
-    'mouth-filling',
-    'mouth-flash',
-    'mouth-full-of-marbles',
-    'mouth-held',
-    'mouth-in',
-    'mouth-melting',
-    'mouth-microphone',
-    'mouth-organs',
-    'mouth-piece',
-    'mouth-pieces',
-    'mouth-pulling',
-    'mouth-to-genital',
-    'mouth-tusks',
-    'mouth-walk',
     'mouth-wash',
-    'mouth-widening',
-    'mouth:estuary',
-    'mouth:source',
-    'mouth:then',
-    'mouthbreather',
-    'mouthfeel',
-    'mouthin\'',
-    'mouthlock',
-    'mouths.',
-    'mouthwateringly',
-    'moutome',
-    'mouvemens',
-    'mouvement&eacute',
-    'mouyabi',
-    'mov.',
     'movably',
-    'movahed',
-    'movatnet',
-    'move&mdash',
-    'move\'',
-    'move-by-move',
-    'move-ons',
-    'move-up',
-    'move-when',
-    'move.',
-    'move.i',
-    'move/we',
-    'move_a',
-    'move_away',
-    'move_over',
-    'moved.as',
     'moveless',
-    'movement-centred',
-    'movement-dance-fashion',
-    'movement-democratic',
-    'movement-fatah',
-    'movement-performer',
-    'movement-types',
-    'movement.',
-    'movement.during',
-    'movement/birth',
-    'movement/dance',
-    'movementist',
-    'movements&mdash;filip',
-    'movements/day',
-    'moverly',
-    'moves.',
     'moves.the',
-    'movie-acting',
-    'movie-bred',
-    'movie-buffish',
-    'movie-camera',
-    'movie-choosing',
-    'movie-drama',
-    'movie-engineered',
-    'movie-goer',
-    'movie-halls',
-    'movie-made',
-    'movie-person',
-    'movie-publicity',
-    'movie-screen',
-    'movie-stealing',
-    'movie-studio',
     'movie-world',
-    'moviedrome',
-    'moviegoing',
-    'movieline',
-    'moviemaker',
-    'moviemaking',
-    'moviemiento',
-    'movies-on-demand',
-    'movies/popular',
-    'moviescreen',
-    'moviest',
-    'moviestar',
-    'movietown',
-    'moving-',
-    'moving-average',
-    'moving-but',
     'moving-out',
-    'moving-picture',
-    'moving-pictures',
-    'moving-still',
-    'moving-water',
-    'movingi',
-    'moviola',
-    'movistar',
-    'movita',
-    'movment',
-    'movmod.fil',
-    'mowaffik',
-    'mowbray/celtic',
-    'mowbrey',
-    'mowcher',
-    'mower-conditioner',
     'moweshayl',
-    'mowhawk',
-    'mowhawks',
-    'mowing-miles',
-    'mowlana',
-    'mowline',
-    'mowmows',
-    'mown-tine',
-    'mowrning',
-    'mowrnyng',
-    'mox-burning',
-    'moxa',
-    'moxey',
-    'moxey/friend',
-    'moxon/club',
-    'moxxi',
     'moyani',
-    'moycullen',
-    'moydog',
-    'moyens',
-    'moyers',
-    'moygashel',
-    'moyheddin',
-    'moyhun',
-    'moyl',
-    'moylan/millar/davies',
-    'moyle/victim',
-    'moylena',
-    'moyn',
-    'moyne/gloucestershire',
-    'moyses',
-    'moytura',
     'moyun',
-    'mozaffar',
-    'mozart-an',
-    'mozart-ausgabe',
-    'mozart-connection',
-    'mozart-czerny',
-    'mozart-loving',
-    'mozart-year',
-    'mozartblick',
-    'mozarteans',
-    'mozarteum/vegh',
-    'mozartiana',
-    'mozartkugeln',
-    'mozdok',
-    'mozes',
-    'mozkin',
     'mozolowski',
-    'mozza',
-    'mozzarellas',
-    'mozzery',
-    'mozzie',
-    'mp-1s',
-    'mp.the',
-    'mp/',
-    'mp/arts',
-    'mp/barrister/had',
-    'mp/bill',
-    'mp/chairman',
-    'mp/chairman/social',
-    'mp/committee',
-    'mp/food',
-    'mp/general',
     'mp/gloucester',
-    'mp/higher',
-    'mp/lib-dem',
-    'mp/libdem',
-    'mp/nacro',
-    'mp/north-east',
-    'mp/pc',
-    'mp/scottish',
-    'mp/society',
-    'mp/space',
-    'mp/technology',
-    'mp4',
-    'mp4/8',
-    'mp425',
-    'mp:112&gt',
-    'mpaiac',
     'mpashi',
-    'mpb',
-    'mpc-e',
-    'mpdl',
-    'mpeg-compatible',
-    'mpeg-encoded',
-    'mpelela',
-    'mpende',
-    'mpg&mdash;ecology',
-    'mpg3',
-    'mpgi',
-    'mph-plus',
-    'mph.',
-    'mph/kts.',
-    'mphil/msc/diploma',
-    'mphils',
     'mpho',
-    'mpla-unita',
-    'mpld',
-    'mplot',
-    'mpmg',
-    'mppda',
-    'mppo/ppe',
-    'mpsa',
-    'mpsc',
-    'mpsd',
-    'mpsk',
-    'mpstat',
-    'mpsv',
-    'mpt-based',
-    'mptf',
-    'mpushini',
     'mq10',
-    'mqp',
-    'mqs',
-    'mr&aacute&ccaron;e',
-    'mr.2c',
-    'mr.a.south',
-    'mr.and',
-    'mr.andrew',
-    'mr.b-',
-    'mr.bleasdale',
-    'mr.colin',
-    'mr.cormack',
-    'mr.gibbs',
-    'mr.green',
-    'mr.groves',
-    'mr.j',
     'mr.j.l',
-    'mr.julius',
-    'mr.justice',
-    'mr.knopfler',
-    'mr.logan',
-    'mr.madstart',
-    'mr.rifkind',
-    'mr.speaker',
-    'mr.tony',
-    'mr/miss',
-    'mr/miss.',
-    'mr/mrs/miss/mr',
-    'mr/ms',
-    'mr22',
-    'mr24',
-    'mr26/8cc11/e6/c12',
     'mr4',
-    'mr8220',
-    'mrad',
-    'mraes',
-    'mrap',
-    'mrass',
-    'mravak',
-    'mrazek',
-    'mrazkova',
-    'mrb',
-    'mrb200',
-    'mrbi',
-    'mrc-600',
-    'mrcc',
-    'mrcgp',
-    'mrcog',
     'mrcpe',
-    'mrcped',
-    'mrdp',
-    'mre',
-    'mreasured',
-    'mrg&mdash;left',
-    'mrgins',
-    'mrisc',
-    'mrkela',
-    'mrkonjic',
-    'mrl',
-    'mrlang',
-    'mrls',
-    'mrna-derived',
-    'mrna.',
-    'mrnjav&ccaron;evi&cacute',
     'mroe',
-    'mrow',
-    'mrp-14',
-    'mrp-8',
-    'mrpharms',
-    'mrr',
-    'mrs-peters',
-    'mrs.mcnaughtan',
-    'mrs.saunders',
-    'mrs/mr',
-    'mrsa',
-    'mrsas/pa',
-    'mrss',
-    'mrtlakatla',
-    'mrtp',
-    'mrtva&ccaron;ki',
     'mrtyr',
-    'mrtyson',
-    'mru',
-    'mrvs',
-    'mrx',
-    'mrx2120',
-    'ms&prime',
-    'ms(s)',
-    'ms-4',
-    'ms-80',
-    'ms-dos-style',
-    'ms-dos-to-unix',
-    'ms-dos/dr-dos',
-    'ms-doses',
-    'ms-windows-based',
-    'ms.733',
     'ms.wl',
-    'ms/dos',
-    'ms/mrs/mr',
-    'ms/w/166',
-    'ms1',
-    'ms10',
-    'ms20',
-    'ms222',
-    'ms283',
-    'ms43',
-    'ms5',
-    'ms84',
-    'msa-aa',
-    'msa/itw',
-    'msans',
-    'msboro',
     'msbs',
-    'msc/postgraduate',
-    'msc/ta',
-    'mscs',
-    'msd/sms',
-    'msde',
-    'msdf',
-    'msdos.sys',
-    'msdos/hardware',
-    'msdos1.pcx',
-    'msec/hg',
-    'msecs.',
-    'mseitw',
-    'msfl',
-    'msg&ndash;3',
-    'msg-free',
     'msg.doc',
-    'msgs',
-    'msgsize',
-    'msh17&ndash;41',
-    'msi-dn&mdash;italian',
-    'msi.',
-    'msida',
-    'msika',
-    'msimulizi',
-    'msm-labour',
-    'msm-mlp-backed',
-    'msmp',
-    'msnd',
-    'msomi',
-    'msonthi',
-    'msos1',
     'msp-9000',
-    'mspd',
-    'mss4-mss7',
-    'mstic',
-    'mstind',
-    'msup2',
-    'msv/hour',
-    'msvibm',
-    'msx',
-    'mszdp',
-    'mszmp',
-    'mt+1',
-    'mt+3',
-    'mt-86',
-    'mt.herbert',
-    'mt1',
     'mt1x',
-    'mt719',
-    'mt8',
-    'mt80',
-    'mta1',
-    'mtare',
-    'mtbf',
-    'mtbs',
-    'mtcp',
-    'mtdna/nuc.dna',
-    'mtdna/nuclear',
-    'mtef1',
-    'mtef1-13',
-    'mtef1-20',
-    'mtensk',
-    'mteromedia',
     'mtg',
-    'mtgfele',
-    'mtgfpg',
-    'mtgfpglqefelaptm',
-    'mtgft',
-    'mtgftmg',
-    'mth/msc',
-    'mthakathi',
-    'mthth',
-    'mtikila',
-    'mtk',
-    'mtl',
-    'mtlg',
-    'mtlsurrna',
-    'mtolo',
-    'mtos',
     'mtoto',
-    'mtssurrna',
-    'mtv-approved',
-    'mtv-friendly',
-    'mtv-rock',
-    'mtv-unfriendly',
-    'mu&amp;sup1',
-    'mu&circ;nchausen',
-    'mu&scaron;i&ccaron;ki',
-    'mu\'ajjiz',
-    'mu\'allim',
-    'mu\'asher',
-    'mu\'ayyadiyya',
-    'mu\'lud',
-    'mu-2',
-    'mu-negotiated',
     'mu/kg/min',
-    'mu/ml',
-    'muangchai',
-    'muangundu',
-    'muar',
-    'muasher',
-    'muave',
-    'muawiya',
-    'muayad',
-    'mubadir',
-    'mubako',
-    'mubaraklabour',
-    'muc18',
-    'muccioli',
-    'mucels',
-    'mucg',
     'much&rehy;expected',
-    'much&rehy;loved',
-    'much&rehy;or',
-    'much&rehy;plagarized',
-    'much&rehy;ridiculed',
-    'much-abridged',
-    'much-adapted',
-    'much-amended',
-    'much-and',
-    'much-ballyhoo',
-    'much-bigger',
-    'much-branched',
-    'much-branching',
-    'much-bruited',
-    'much-buttoned',
-    'much-cared',
     'much-caressed',
-    'much-celebrated',
-    'much-chewed',
-    'much-collected',
-    'much-copied',
-    'much-covered',
-    'much-coveted',
-    'much-craved',
-    'much-creased',
-    'much-danced',
-    'much-detailed',
-    'much-diminished',
-    'much-disarmed',
-    'much-disliked',
-    'much-disputed',
-    'much-divided',
     'much-employed',
-    'much-enhanced',
-    'much-enjoyed',
-    'much-esteemed',
-    'much-excoriated',
-    'much-expanded',
-    'much-folded',
-    'much-fostered',
-    'much-hated',
-    'much-hoped-for',
-    'much-improved-but-still-trashy',
-    'much-in-demand',
-    'much-including',
-    'much-investigated',
-    'much-less',
-    'much-lived',
     'much-lived-in',
-    'much-logged',
-    'much-mentioned',
-    'much-misunderstood',
-    'much-mixed',
-    'much-mocked',
-    'much-more-than-food',
-    'much-neglected',
-    'much-noted',
-    'much-operated-on',
-    'much-ornamented',
-    'much-overrated',
-    'much-parodied',
-    'much-parroted',
-    'much-partitioned',
-    'much-persecuted',
     'much-played',
-    'much-practised',
-    'much-prescribed',
-    'much-pressed',
-    'much-previewed',
-    'much-pro-japanese',
-    'much-puffed',
-    'much-qualified',
-    'much-raced',
-    'much-recognised',
-    'much-recorded',
-    'much-reformed',
-    'much-rehearsed',
-    'much-remarked',
-    'much-remembered',
-    'much-repaired',
     'much-reported',
-    'much-reprinted',
-    'much-resented',
-    'much-revised',
-    'much-ridden',
-    'much-ridiculed',
-    'much-rubbed',
-    'much-ruffled',
-    'much-salted',
-    'much-sighted',
-    'much-signed',
-    'much-so',
-    'much-sought',
-    'much-sought-after',
-    'much-spoken-of',
-    'much-stated',
     'much-talked-of',
-    'much-tested',
-    'much-the-same',
-    'much-thought-of',
-    'much-threatened',
-    'much-tippexed',
-    'much-told',
-    'much-trampled',
-    'much-transferred',
-    'much-treasured',
-    'much-trusted',
-    'much-vexed',
-    'much-vilified',
-    'much-washed',
-    'much-weakened',
-    'much-wiped',
     'much-wooed',
-    'much-worshipped',
-    'much-xxxx',
-    'much.',
-    'much.they',
-    'much/avoiding',
-    'much/i',
-    'much_as',
-    'much_due',
-    'much_sort',
-    'muchacho',
-    'muchachos',
-    'muchame',
-    'muchamore',
-    'muchangos',
-    'muchemwa',
     'muchene',
-    'muchly',
-    'muchnick',
-    'muchos',
-    'muchuri',
-    'muci',
-    'mucianus',
-    'mucis',
-    'mucisa',
-    'muck-',
-    'muck-and-bullets',
-    'muck-carts',
-    'muck-encrusted',
-    'muck-out',
-    'muck-rakers',
-    'muckamucks',
     'mucked-in',
-    'mucked-up',
-    'muckery',
-    'muckily',
-    'muckish',
-    'muckla',
-    'muckland',
-    'mucklebackit',
-    'muckleberries',
-    'muckmore',
-    'muckraker',
-    'muckrik',
-    'muckspreading',
-    'muckton',
-    'mucky-looking',
-    'muckyard',
     'mucle',
-    'muclei',
-    'muco',
-    'mucocoeles',
-    'mucogel',
-    'mucolysis',
-    'mucolytic',
-    'mucoproteins',
-    'mucopurulent',
-    'mucose',
-    'mucousy',
-    'mucranoid',
-    'mucronata',
-    'mucus-coated',
-    'mucus-filled',
-    'mucus-mopping',
     'mucus-secreting',
-    'mucus-shedding',
-    'mucus/bile',
-    'mucusal',
-    'mud&rehy;caked',
-    'mud&rehy;dle',
-    'mud&rehy;glide',
-    'mud&rehy;spattered',
-    'mud&rehy;walled',
-    'mud-',
-    'mud-baked',
-    'mud-bars',
-    'mud-based',
-    'mud-bath',
-    'mud-bespattered',
-    'mud-blooms',
     'mud-bottomed',
-    'mud-brained',
-    'mud-bricked',
-    'mud-builders',
-    'mud-channel',
-    'mud-curdling',
-    'mud-dwelling',
-    'mud-flat',
-    'mud-floored',
-    'mud-fringed',
-    'mud-frozen',
-    'mud-holes',
-    'mud-hoppers',
-    'mud-huts',
-    'mud-lane',
-    'mud-line',
     'mud-maker',
-    'mud-man',
-    'mud-mask',
-    'mud-patched',
-    'mud-pen',
-    'mud-probing',
-    'mud-scathed',
-    'mud-slick',
-    'mud-slimy',
-    'mud-sling',
-    'mud-sodden',
-    'mud-splashed',
-    'mud-splattered',
-    'mud-streaked',
-    'mud-supported',
-    'mud-tracks',
     'mud-trodden',
-    'mud-wedge',
-    'mudaffar',
-    'mudale',
-    'mudane',
-    'mudassar',
-    'mudavadi',
-    'mudbound',
-    'mudbugs',
-    'mudcake',
-    'mudcloud',
-    'mudcracked',
-    'muddiford',
-    'muddin',
-    'muddle\'splans',
-    'muddled-headed',
     'muddled-up',
-    'muddleheaded',
-    'muddleton',
-    'muddling-through',
-    'muddus',
-    'muddy-',
-    'muddy-boots',
-    'muddy-bottomed',
-    'muddy-coloured',
-    'muddy-looking',
-    'muddy-water',
-    'muddying-up',
-    'mudejar',
-    'muder',
-    'muderrises-those',
-    'muderrisliks',
     'muderriss',
-    'mudfingered',
-    'mudflaps',
-    'mudflat',
-    'mudgley',
-    'mudheap',
-    'mudhoney/flaming',
-    'mudi',
-    'mudie-smith',
-    'mudjicks',
-    'mudlarkers',
-    'mudline',
-    'mudogas',
-    'mudpond',
-    'mudpools',
-    'mudspattered',
     'mudspill',
-    'mudstone/siltstone/sandstone',
-    'mudthir',
-    'muduuli',
-    'mudwater-medicine',
-    'mudway/landlady',
-    'mudwimmen',
-    'mudwort',
-    'mudwrestler',
-    'muecke',
-    'muehlen',
-    'muehlstr',
-    'muelas',
-    'mueller.',
-    'muellerious',
-    'muendo',
     'muenzer',
-    'muenzinger',
-    'muerto',
-    'muesli-belt',
-    'muesli-mix',
-    'mueslis',
-    'muetsa',
-    'mufakose',
-    'muffin\'',
-    'muffled.',
-    'muffledly',
-    'muffleton',
-    'muffy',
-    'mufical',
-    'mufiosi',
-    'mufson',
     'mufti-perhaps',
-    'muftic',
-    'muftileri',
-    'muftilik-essentially',
-    'muftilik-he',
-    'muftis-give',
-    'mufundis',
-    'mug&rehy;govertski',
-    'mug-and-snatch',
-    'mug-houses',
-    'mug-photoed',
-    'mug-punters',
-    'mug-shots',
-    'mug.ruthie',
-    'muga',
-    'mugal',
     'mugdockbank',
-    'mugearites',
-    'mugendo',
-    'mugerwa',
-    'mugford',
-    'mugge',
-    'mugged-up',
-    'muggerhanger',
-    'muggeridges',
-    'muggies',
-    'mugginess',
-    'mugging.victim',
-    'mugginton',
-    'mugglesby',
-    'mugglestone',
-    'muggridge',
     'mughal-style',
-    'mughan',
-    'mughar',
-    'mughla',
-    'mughul',
-    'mugiraneza',
-    'mugmate',
-    'mugmer',
-    'mugney',
-    'mugnoz',
-    'mugot',
-    'mugrabi',
-    'mugraby',
-    'mugronensis',
-    'mugs/5',
-    'mugs/6',
     'mugu',
-    'mugwump',
-    'mugwumpery',
-    'muh',
-    'muhabura',
-    'muhadi',
-    'muhaiminul',
-    'muhajir-populated',
-    'muhamed',
-    'muhammadu',
-    'muhammed-rafiq',
-    'muharnmad',
-    'muharram-rabi',
-    'muhayaa',
-    'muheim',
-    'muhiddin',
     'muhilal',
-    'muhl',
-    'muhlbauer',
-    'muhlfeld',
-    'muhri',
-    'muhyiddin',
-    'muice',
-    'muiderberg',
-    'muiderpoort',
-    'muil',
-    'muilenburg',
-    'muiler',
-    'muinane',
-    'muinish',
-    'muinzer',
-    'muir/victim',
     'muirburn',
-    'muirden',
-    'muirheads',
-    'muirhevnamor',
-    'muirhouse/animal',
-    'muirkirk/strathaven',
-    'muiron',
-    'muirshield',
-    'muirton',
-    'muitinationals',
-    'muito',
-    'muizenburg',
-    'muj&eacute;dar',
-    'mujadedi',
-    'mujahadin',
-    'mujaheddin-controlled',
     'mujaheddin-e',
-    'mujaheddin-held',
-    'mujaheddin-occupied',
-    'mujaheddinsaid',
-    'mujahedin\'',
-    'mujahidun',
-    'mujeres',
-    'mujezinovic',
-    'mujica',
-    'mujico',
-    'mujjahedin',
-    'mujtahids',
-    'mukalay',
-    'mukela',
-    'mukerjee',
-    'mukesh',
     'mukhammed',
-    'mukhida',
-    'mukhortov',
-    'mukhriddin',
-    'mukhtara',
-    'mukis',
-    'mukoko',
-    'muktananda',
-    'muktuk',
-    'mula',
-    'mulago',
-    'mularkey',
-    'mulatov',
-    'mulatresse',
-    'mulattas',
-    'mulazemets',
     'mulbarton',
-    'mulberry-almond-bread',
-    'mulberry-black',
-    'mulberry-eyed',
-    'mulberry-red',
-    'mulberry.',
-    'mulberrys',
-    'mulbooma',
-    'mulbridge',
-    'mulcare',
-    'mulch.',
-    'mulchy',
-    'mulcts',
-    'muldaur',
-    'mulde',
-    'muldergate',
     'muldoanich',
-    'muldoons',
-    'muldova',
-    'mule\'',
-    'mule-headed',
-    'mule-kick',
-    'mule-lines',
-    'mule-spinners',
-    'mule-track',
-    'muleback',
-    'mulekewe',
-    'mulemba',
-    'mulenga',
-    'mules.',
-    'mulespinner',
-    'mulet',
     'muleta',
-    'muletrain',
-    'muletrap',
-    'muley',
-    'mulga',
-    'mulgara',
-    'mulguy',
-    'mulhaupt',
-    'mulhearn',
-    'mulheran',
-    'mulherne',
-    'mulhooleys',
-    'mulhous',
-    'mulican',
-    'mulier-lyer',
-    'mulieri',
     'mulieris',
-    'mulikai',
-    'mulimba',
-    'mulino',
-    'mulitilateral',
-    'mulitmedia',
-    'mulitonovic',
-    'mulk',
-    'mulkearns',
-    'mulkerrins',
-    'mulladry',
-    'mullagh',
-    'mullaghbawn',
-    'mullaghbrack',
-    'mullaghfad',
-    'mullaghmore',
     'mullalley',
-    'mullaly',
-    'mullane',
-    'mullaney',
-    'mullany',
-    'mullappally',
-    'mullardoch',
-    'mullarkey',
-    'mullarney',
-    'mullavilly',
-    'mulldonoch',
-    'mulled-wine',
-    'mulleins',
-    'mullenbach',
-    'mullenheim-rechberg',
-    'muller-hansen',
     'muller-lyer',
-    'muller-thurgau',
-    'muller/stroud',
-    'mullers',
-    'mullertii',
-    'mullets',
-    'mullhil',
-    'mullholland',
-    'mullicking',
-    'mullin/hungarian',
-    'mullingar/limerick/cork',
-    'mullner',
-    'mulloney',
-    'mulluscan',
-    'mullycar',
-    'mulot',
     'mulrone',
-    'mulroneyprime',
-    'mulrooney',
-    'mulsh',
-    'mulsim',
-    'mult',
-    'multalin',
-    'multatuli',
-    'multhampt',
-    'multi&rehy;collared',
-    'multi&rehy;flowered',
-    'multi&rehy;fuel',
-    'multi&rehy;functional',
-    'multi&rehy;generation',
-    'multi&rehy;media',
-    'multi&rehy;plicity',
     'multi&rehy;transplant',
-    'multi&rehy;volt',
-    'multi-80486',
-    'multi-aa',
-    'multi-adjustable',
-    'multi-aid',
-    'multi-aisled',
-    'multi-angled',
-    'multi-antibody',
-    'multi-arched',
-    'multi-architecture',
-    'multi-arm',
-    'multi-arts',
-    'multi-atom',
-    'multi-atomic',
-    'multi-award',
     'multi-band',
-    'multi-barrel',
-    'multi-battery',
-    'multi-beam',
-    'multi-bedded',
-    'multi-bet',
-    'multi-billionaires',
-    'multi-billions',
-    'multi-births',
-    'multi-bloody-storey',
-    'multi-boat',
-    'multi-boot',
-    'multi-bracketed',
-    'multi-bus',
-    'multi-buy',
-    'multi-buys',
     'multi-byte',
-    'multi-c',
-    'multi-cache',
-    'multi-campus',
-    'multi-capable',
-    'multi-caste',
-    'multi-causality',
-    'multi-cel',
-    'multi-cell',
-    'multi-century',
-    'multi-chamber',
-    'multi-channelled',
-    'multi-chapelled',
-    'multi-chargers',
-    'multi-chips',
-    'multi-circuit',
     'multi-client',
-    'multi-coach',
-    'multi-coated',
-    'multi-code',
-    'multi-columned',
-    'multi-communal',
-    'multi-commune',
-    'multi-compartment',
-    'multi-confessional',
-    'multi-contractor',
-    'multi-council',
-    'multi-crew',
-    'multi-culturalist',
-    'multi-cylinder',
-    'multi-debugger',
-    'multi-decadal',
     'multi-determined',
-    'multi-device',
-    'multi-dialled',
-    'multi-dibber',
-    'multi-die',
-    'multi-directed',
-    'multi-disciplinary/inter-disciplinary',
-    'multi-disciplined',
-    'multi-divided',
-    'multi-document',
-    'multi-dog',
-    'multi-dome',
-    'multi-drawer',
-    'multi-drops',
-    'multi-drug',
-    'multi-drum',
     'multi-dumb-bell',
-    'multi-electron',
-    'multi-energy',
-    'multi-engined',
-    'multi-entranced',
-    'multi-establishment',
-    'multi-european',
-    'multi-event',
-    'multi-executioners',
-    'multi-exposure',
-    'multi-eyeballed',
-    'multi-facetted',
-    'multi-farious',
-    'multi-feed',
-    'multi-fingered',
-    'multi-finned',
     'multi-firm',
-    'multi-flange',
-    'multi-floor',
-    'multi-fly-overed',
-    'multi-focused',
-    'multi-fold',
-    'multi-font',
-    'multi-format',
-    'multi-front',
-    'multi-gas',
-    'multi-gene',
-    'multi-grain',
-    'multi-grammy-winning',
-    'multi-guess',
-    'multi-handed',
-    'multi-hooded',
     'multi-horse',
-    'multi-host',
-    'multi-household',
-    'multi-hulls',
-    'multi-hundred',
-    'multi-hundred-million-dollar',
-    'multi-i/o',
-    'multi-income',
-    'multi-infarc',
-    'multi-injection',
-    'multi-instrument',
-    'multi-international',
-    'multi-interpretability',
-    'multi-interpretable',
-    'multi-interval',
-    'multi-issued',
     'multi-jointed',
-    'multi-jurisdictional',
-    'multi-key',
-    'multi-keyword',
-    'multi-killer',
-    'multi-kilo',
-    'multi-kilogram',
-    'multi-kleenex',
-    'multi-lamellar',
-    'multi-laminate',
-    'multi-laned',
-    'multi-languages',
-    'multi-laterally',
-    'multi-launcher',
-    'multi-layers',
-    'multi-let',
     'multi-light',
-    'multi-linearity',
-    'multi-load',
-    'multi-loading',
-    'multi-location',
-    'multi-locking',
-    'multi-lung',
-    'multi-market',
-    'multi-marketing',
-    'multi-material',
-    'multi-megawatt',
-    'multi-melta',
-    'multi-million-selling',
-    'multi-mind',
-    'multi-mirror',
-    'multi-model',
     'multi-modem',
-    'multi-module',
-    'multi-monitor',
-    'multi-multi-millionaire',
-    'multi-nat',
-    'multi-nationally',
-    'multi-neck',
-    'multi-needled',
-    'multi-nucleated',
-    'multi-occupy',
-    'multi-octopus',
-    'multi-opposition',
-    'multi-orgasmic',
-    'multi-orgasms',
-    'multi-outlets',
-    'multi-output',
     'multi-packs',
-    'multi-paned',
-    'multi-parameter',
-    'multi-parcel',
-    'multi-partite',
-    'multi-path',
-    'multi-pc',
-    'multi-pentium',
-    'multi-petalled',
-    'multi-petticoated',
-    'multi-phased',
-    'multi-phasic',
-    'multi-piece',
-    'multi-pin',
-    'multi-pitched',
-    'multi-pitchers',
     'multi-plaintiff',
-    'multi-play',
-    'multi-plex',
-    'multi-ply',
-    'multi-pointed',
-    'multi-points',
-    'multi-polar',
-    'multi-portion',
-    'multi-practice',
-    'multi-prescription',
-    'multi-process',
-    'multi-processer',
-    'multi-protection',
-    'multi-question',
-    'multi-ra',
-    'multi-racialist',
     'multi-rasp',
-    'multi-regional',
-    'multi-regulating',
-    'multi-religious',
-    'multi-researcher',
-    'multi-rhyming',
-    'multi-rhythmed',
-    'multi-ribbon',
-    'multi-ring',
-    'multi-roofed',
-    'multi-room',
-    'multi-row',
-    'multi-sailed',
-    'multi-save',
-    'multi-sbu',
-    'multi-school',
     'multi-search',
-    'multi-season',
-    'multi-seasonal',
-    'multi-segmented',
-    'multi-server',
-    'multi-servo',
-    'multi-set',
-    'multi-sexual',
-    'multi-shaded',
-    'multi-shaped',
-    'multi-shot',
-    'multi-sided',
-    'multi-signal-scrambling-decoder',
-    'multi-signals',
-    'multi-signs',
-    'multi-skill',
     'multi-skinned',
-    'multi-socket',
-    'multi-source',
-    'multi-sourced',
-    'multi-sources',
-    'multi-sourcing',
-    'multi-spectral',
-    'multi-speed',
-    'multi-spindle',
-    'multi-splendoured',
-    'multi-sponsor',
-    'multi-sponsored',
-    'multi-spouted',
-    'multi-spread',
-    'multi-sprouting',
-    'multi-state',
     'multi-stemmed',
-    'multi-stone',
-    'multi-storeys',
-    'multi-story',
-    'multi-stranded',
-    'multi-stress',
-    'multi-string',
-    'multi-striped',
-    'multi-student',
-    'multi-studio',
-    'multi-style',
-    'multi-suckler',
-    'multi-switching',
-    'multi-syllabic',
-    'multi-syllable',
-    'multi-sync',
     'multi-tap',
-    'multi-tasker',
-    'multi-technology',
-    'multi-tenanted',
-    'multi-tenure',
-    'multi-terminal',
-    'multi-terrain',
-    'multi-texted',
-    'multi-textural',
-    'multi-textured',
-    'multi-timbrality',
-    'multi-tinted',
-    'multi-toothed',
-    'multi-tracks',
-    'multi-training',
-    'multi-treatments',
     'multi-triangulated',
-    'multi-tribal',
-    'multi-trillion-dollar',
-    'multi-trip',
-    'multi-twigged',
-    'multi-users',
-    'multi-value',
-    'multi-variable',
-    'multi-variate',
-    'multi-venin\'',
-    'multi-vision',
-    'multi-vitamin/multi-mineral',
-    'multi-voiced',
-    'multi-voltage',
-    'multi-volumed',
-    'multi-wave',
     'multi-wavelength',
-    'multi-wings',
-    'multi-wire',
-    'multi-work',
-    'multi-x',
-    'multi-zig-zag',
-    'multi-zipped',
-    'multi-zonal',
-    'multi=sensory',
-    'multiacinar',
-    'multiactivity',
-    'multianalyte',
-    'multiannual',
-    'multiaxial',
-    'multiball',
-    'multibanco',
     'multibarrel',
-    'multibase',
-    'multibeam',
-    'multibillion-dollar',
-    'multibillionaire',
-    'multiblade',
-    'multiblooms',
-    'multibranched',
-    'multibusiness',
-    'multicatalytic',
-    'multicategorical',
-    'multicaulis',
-    'multicausal',
-    'multicelled',
-    'multicentred',
-    'multicephalous',
     'multichamber',
-    'multicluster',
-    'multicoding',
-    'multicollector',
-    'multicolored',
-    'multicolours',
-    'multicolumn',
-    'multicompost',
-    'multiconglomerates',
-    'multiconstituency',
-    'multicontact',
-    'multicore',
-    'multicorporation',
-    'multicountry',
-    'multicover',
-    'multicultural/antiracist',
     'multiculturalism.in',
-    'multiculturalisms',
-    'multiculturated',
-    'multiculture',
-    'multicultured',
-    'multicursal',
-    'multicyano',
-    'multicycled',
-    'multidatabase',
-    'multidigit',
-    'multidirectional',
-    'multidisciplinarity',
-    'multidrop',
-    'multidrug-resistance',
-    'multidynamic',
-    'multienzyme',
     'multievents',
-    'multiface',
-    'multifacetted',
-    'multifariousness',
-    'multifasciata',
-    'multifasteners',
-    'multifenestrated',
-    'multifid',
-    'multifile',
-    'multifiliis',
-    'multifit',
-    'multiflex',
-    'multifloras',
-    'multiformity',
-    'multifuel',
-    'multigamma',
     'multigrain',
-    'multigram',
-    'multihulled',
-    'multiinfarct',
-    'multijurisdictional',
-    'multilabel',
-    'multilaterist',
-    'multilayers',
-    'multilex',
-    'multilocal',
-    'multilpe',
-    'multimalformed',
-    'multimarket',
-    'multimedia-enabled',
-    'multimelta',
-    'multimeltas',
     'multimeters',
-    'multimethod',
-    'multimicro',
-    'multimicroprocessor',
-    'multimod',
-    'multimolecular',
-    'multimower',
-    'multinat',
-    'multinationalism',
-    'multing',
-    'multinodular',
-    'multinotch',
-    'multinuclear',
-    'multinucleate',
-    'multiorgan',
-    'multip',
     'multipack',
-    'multipag',
-    'multiparas',
-    'multiparasitized',
-    'multipartner',
-    'multipath',
-    'multipathogen',
-    'multipedals',
-    'multiperiod',
-    'multipersonality',
-    'multiphasic',
-    'multiphoton',
-    'multiplaintiff',
-    'multiplay',
-    'multiple-aspect',
-    'multiple-barrelled',
     'multiple-car',
-    'multiple-cell',
-    'multiple-criterion',
-    'multiple-ditched',
-    'multiple-earning',
-    'multiple-file',
-    'multiple-host',
-    'multiple-instruction',
-    'multiple-launch',
-    'multiple-link',
-    'multiple-locus',
-    'multiple-node',
-    'multiple-occupied',
-    'multiple-ostinato',
-    'multiple-outcome',
-    'multiple-person',
     'multiple-precision',
-    'multiple-principal-single-',
-    'multiple-reel',
-    'multiple-scenario',
-    'multiple-session',
-    'multiple-shots-to-kill',
-    'multiple-source',
-    'multiple-sourced',
-    'multiple-step',
-    'multiple-stream',
-    'multiple-stress',
-    'multiple-stresses',
-    'multiple-threads',
-    'multiple-units',
-    'multiple-use',
-    'multiple-view',
     'multiple-width',
-    'multiple.choice',
-    'multipled',
-    'multiples/net',
-    'multiplesclerosis',
-    'multiplicate',
-    'multiplication_and',
-    'multiplier-quotient',
-    'multiply-ambiguous',
-    'multiply-deprived',
-    'multipoe',
-    'multipolarity',
-    'multiports',
-    'multipotentiality',
-    'multiprocessing-on-the-desktop',
-    'multiprogrammability',
     'multipronged',
-    'multipule',
-    'multirail',
-    'multireflective',
-    'multiresistant',
-    'multisavas',
-    'multiscreen',
-    'multiserver',
-    'multisigns',
-    'multisources',
-    'multispeaker',
-    'multispecies',
-    'multispin',
-    'multispindle',
-    'multispinosa',
-    'multistandard',
     'multistep',
-    'multistone',
-    'multistranded',
-    'multistripe',
-    'multitalk',
-    'multitiered',
-    'multitool',
-    'multitubular/watertube',
-    'multitudinousness',
-    'multitufted',
-    'multiuniversity',
-    'multivariant',
-    'multivarious',
-    'multivatiate',
-    'multivibrators',
-    'multiviews',
     'multivision',
-    'multivitamins',
-    'multivocal',
-    'multiware',
-    'multiway',
-    'multiwire',
-    'multiworks',
-    'multlnational',
-    'multocida',
-    'multphasic',
-    'multpile',
-    'multprocessing',
-    'multscher',
-    'multure',
-    'multyn',
-    'mulungushi',
     'muluzi',
-    'muluzui',
-    'mulvaine',
-    'mulville',
-    'mulwell',
-    'mum&rehy;ble',
-    'mum-in-the-mud',
-    'mum-of-one',
-    'mum-of-six',
-    'mum-of-three',
-    'mumbai',
-    'mumber',
-    'mumbi',
-    'mumble-mumble',
-    'mumblemumble',
-    'mumbler',
     'mumblingly',
-    'mumf',
-    'mumias',
-    'mumir',
-    'mumiya',
-    'mummee',
-    'mummeeee',
-    'mummersett',
-    'mummify',
-    'mummm',
-    'mummmy',
-    'mummummummum',
-    'mummy&mdash;you',
-    'mummy&rehy;shaped',
-    'mummy-beads',
-    'mummy-cases',
     'mummy-in-law',
-    'mummy-shaped',
-    'mummyish',
-    'mumon',
-    'mums-the-worders',
-    'mumsie',
-    'mumured',
-    'mun.',
-    'muna',
-    'munajjid',
-    'munavvarsho',
-    'munawir',
-    'munch\'d.',
-    'munchable',
-    'munchency',
-    'munchengladback',
     'munchi-chip',
-    'munchi-chipz',
-    'munchie',
-    'munchings',
-    'munchinhampton',
-    'munchis',
-    'munchister',
-    'munchkinland',
-    'munchmallows',
-    'munchmates',
-    'muncro',
-    'mund',
-    'munde',
-    'mundee',
-    'mundell-fleming',
-    'mundells',
     'munderic',
-    'mundford',
-    'mundham',
-    'mundhir',
-    'mundhiriya',
-    'mundia',
-    'mundugamor',
-    'mundugamore',
-    'mundula',
-    'muneeb',
-    'munemitsu',
-    'muneo',
-    'muness',
-    'mungala',
-    'mungers',
-    'mungindi',
     'mungret',
-    'mungrisdale',
-    'munhepe',
-    'munhill',
-    'muni-mimickers',
-    'munia',
-    'munications',
-    'munichhausen',
-    'munichoodappa',
-    'munichre',
-    'municipal-tiled',
-    'municipaldec.',
-    'municipalising',
-    'municipalist',
-    'municipalized',
-    'municipally-employed',
     'municipally-owned',
-    'municipally-provided',
-    'municipes',
-    'municipia',
-    'municpal',
-    'munier',
-    'munimenta',
-    'munir',
-    'munitions.',
-    'munkar',
-    'munkavallaloi',
-    'munkberry',
-    'munkedal',
-    'munkejord',
-    'munkejord(h&ouml;yre)',
-    'munkley',
     'munlochy',
-    'munn/clerk',
-    'munni',
-    'munning',
-    'munnot',
-    'munol',
-    'munro&rehy;swopping',
-    'munro-bagging',
-    'munro.',
-    'munroes',
-    'munsell',
-    'munsen',
-    'munshids',
-    'munsingen',
-    'munslow',
-    'munsterberg',
     'munstergasse',
-    'munsterlager',
-    'munsterman',
-    'munsterwalde',
-    'muntasser',
-    'muntingh',
-    'muntins',
-    'muntz',
-    'munuel',
-    'munumun',
-    'munzing',
-    'munzinger',
-    'muokkeris',
-    'muon-catalysed',
-    'muon-fusion',
-    'muong',
     'muotathal',
-    'muotome',
-    'mupanga',
-    'mupata',
-    'mupc',
-    'muppet-creator',
-    'muppet-style',
-    'muqbil',
-    'muquwama',
-    'mur&rehy;muring',
-    'muradiye',
-    'muraki',
-    'mural-sized',
-    'murango',
-    'muraoka',
-    'muraour',
     'murar',
-    'murasad',
-    'muraschko',
-    'murashu',
-    'murasoli',
-    'murati',
-    'muratorian',
-    'muravev-amurskii',
-    'muraviev',
-    'muravshi',
-    'muravyev',
-    'murawski',
-    'muray',
-    'murayama',
-    'murazzi',
-    'murbarak',
     'murchan',
-    'murchertach',
-    'murchinson',
-    'murcian',
-    'murco',
-    'murcott/oxfordshire',
-    'murcray',
-    'murdar',
-    'murder-let',
-    'murder-manslaughter',
-    'murder-more',
-    'murder-sites',
-    'murder-solving',
-    'murder-then',
-    'murder-trap',
-    'murder/robbery',
     'murder/suicide',
-    'murder:jury',
-    'murder:was',
-    'murdered.',
-    'murdered.parents',
-    'murdered/german',
-    'murderee',
-    'murderer.',
-    'murderous-looking',
-    'murdhuacha',
-    'murdin',
-    'murdo-foolish',
-    'murdoch-bought',
-    'murdochs',
-    'murdocks',
-    'murdostoun',
     'murdre',
-    'murdres',
-    'murdy',
-    'muregi',
-    'murena',
-    'murer',
-    'muresan',
-    'muretto',
-    'murfield',
-    'murfin',
-    'murfitt',
-    'murg',
-    'murgatroid',
-    'murgatroyd/flu',
-    'murghetto',
-    'murghhh',
     'murgi',
-    'muri',
-    'murialdo',
-    'muricacea',
-    'muricacean',
-    'muricaceans',
-    'muricata',
-    'muricidae',
-    'muricina',
-    'muriel-ae',
-    'murin',
-    'muriqui',
-    'murison',
-    'murkeyside',
-    'murks',
-    'murlaggan',
     'murle',
-    'murless',
-    'murlis',
-    'murlone',
-    'murman',
-    'murmistrova',
-    'murmours',
-    'murmur.',
-    'murmures',
-    'murmuringly',
-    'murmurously',
-    'murnay',
-    'murney',
-    'muro',
-    'muroculous',
-    'murphey-corb',
     'murphies',
-    'murphy-gibb',
-    'murphy-v-bradford',
-    'murpratomo',
-    'murqanas',
-    'murram',
-    'murrant',
-    'murraval',
-    'murray-browne',
-    'murray-leslie',
-    'murray-smith',
-    'murray/cancer',
-    'murray/eyewitness',
-    'murray/manager',
-    'murray/mercer',
-    'murray/mother',
     'murray/teacher',
-    'murray/west',
-    'murraygovernment',
-    'murre',
-    'murrick',
-    'murrid',
-    'murrion',
-    'murro',
-    'murrow',
-    'murrumbidgee',
-    'murrysville',
-    'murs',
-    'mursells',
-    'murshidabad',
-    'mursley',
-    'murst',
     'murtala',
-    'murtaz',
-    'murter',
-    'murther',
-    'murtherer',
-    'murthering',
-    'murtonpark',
-    'murtra',
-    'murtschenstock',
-    'murtwick',
-    'murua',
-    'murviedo',
-    'murwillumbah',
-    'muryans',
-    'murzi',
-    'mus&eacute;e-galerie',
     'mus&rehy;tard',
-    'mus.bac.',
-    'musachi',
-    'musaffah',
-    'musafirkhana',
-    'musaka',
-    'musale',
-    'musalia',
-    'musanadam',
-    'musandam',
-    'musannifek',
-    'musas',
-    'musashi',
-    'musavat',
-    'muscadelle',
-    'muscadets',
     'muscamp',
-    'muscaris',
-    'muscarl',
-    'muscatelli',
-    'muschamp/driver',
-    'muscianship',
-    'muscle-boosting',
-    'muscle-brains',
-    'muscle-corded',
-    'muscle-flexing',
-    'muscle-forming',
-    'muscle-free',
-    'muscle-grass',
-    'muscle-hugging',
-    'muscle-men',
-    'muscle-packed',
     'muscle-pulls',
-    'muscle-roped',
-    'muscle-spasm',
-    'muscle-strengthening',
-    'muscle-stretching',
-    'muscle-tensing',
-    'muscle-tone',
-    'muscle-withering',
-    'muscle-wrenching',
-    'muscle.',
-    'muscle/nervous',
-    'muscle/skeleto',
-    'muscleboy',
-    'muscledom',
-    'muscles.',
-    'muscoli',
     'muscon',
-    'muscoviscidose',
-    'muscu',
-    'muscular-glandular',
-    'muscular-skeletal',
-    'muscularized',
-    'musculatory',
-    'musculoelastic',
-    'muse&eacute',
-    'muse-based',
-    'muse/1e',
-    'museale',
-    'musealisation',
-    'museau',
-    'mused.',
-    'museli',
     'musella',
-    'musen-lust',
-    'musensohn',
-    'museographic',
-    'museologically',
-    'museu',
-    'museum-oriented',
-    'museum-piece',
-    'museum-room',
-    'museum-world',
-    'museum.behind',
-    'museum/london',
-    'museum/northern',
-    'museum/planes',
-    'museumization',
-    'museumlike',
     'museums.',
-    'museumsbilder',
-    'museumsbund',
-    'museumship',
-    'museumsinsel',
-    'mushala',
-    'musham',
-    'mushega',
-    'mushies',
-    'mushiness',
-    'mushir',
-    'mushirul',
-    'mushkat',
-    'mushrome',
-    'mushroom&rehy;coloured',
-    'mushroom-and-tofu',
     'mushroom-cream',
-    'mushroom-filled',
-    'mushroom-flavoured',
-    'mushroom-hunting',
-    'mushroom-painted',
-    'mushroom-shape',
-    'mushroom-style',
-    'mushroom/ham',
-    'mushroomm',
-    'mushroomy',
-    'mushrow',
-    'mushtq',
-    'mushvig',
-    'musi-technical',
-    'musial',
-    'musialela',
     'music&rehy',
-    'music\'',
-    'music-book',
-    'music-boxes',
-    'music-industrial',
-    'music-industry',
-    'music-king/new',
-    'music-lesson',
-    'music-madded',
-    'music-makers',
-    'music-making.there',
-    'music-mingled',
-    'music-parrott/taverner',
-    'music-political',
-    'music-printers',
-    'music-school',
     'music-sheets',
-    'music-shop',
-    'music-stool',
-    'music-theatrical',
-    'music-to-lighting',
-    'music-types',
-    'music-wise',
-    'music-xxxx',
-    'music.debbie',
-    'music.panic',
-    'music/drama',
-    'music/drama/art/design',
-    'music/hymns',
-    'music/mca',
-    'music/movement',
-    'music/music',
     'music/queen',
-    'music/risque',
-    'music/visual',
-    'music/warner',
-    'music:classical',
-    'musical-chairs',
-    'musical-comedy',
-    'musicalia',
-    'musicalischer',
-    'musicalisches',
-    'musicalised',
-    'musicalishche',
-    'musicalized',
-    'musically-skilled',
-    'musicassette',
-    'musicaulx',
     'musicaux',
-    'musicbank',
-    'musicbiz',
-    'musichall',
-    'musichips',
-    'musician-fingers',
-    'musician-in-ordinary',
-    'musician-pianists',
-    'musician/businessman',
-    'musician/dreamer',
-    'musician/poet',
-    'musicianis',
-    'musicians-producers',
-    'musicians.',
-    'musicians/singers',
-    'musiciens/',
     'musicke/anthony',
-    'musicke/rooley',
-    'musickie',
-    'musicks',
-    'musicl',
-    'musicly',
-    'musicmakers',
-    'musicmaster',
-    'musico-liturgical',
-    'musico-political',
-    'musico-theatrical',
-    'musicroom',
-    'musidiscs',
-    'musigny',
-    'musikalischer',
-    'musikalisches',
     'musikforschung',
-    'musikpraxis',
-    'musikvereinsaal',
-    'musimbi',
-    'musitek',
-    'musk-and-amber',
-    'musk-based',
-    'musk-hunter.',
-    'musk-oxen',
-    'muskau',
-    'muskerry',
-    'musket-balls',
-    'muskett',
-    'muskier',
-    'muskogee',
-    'musky-scented',
     'muslab',
-    'muslce',
-    'muslem',
-    'musli',
-    'muslim&ndash',
-    'muslim&ndash;maronite',
-    'muslim&rehy;burmese',
-    'muslim-born',
-    'muslim-christian',
-    'muslim-croat',
-    'muslim-dominated',
-    'muslim-headed',
-    'muslim-jewish-christian',
-    'muslim-minority',
-    'muslim-owned',
-    'muslim-sounding',
     'muslim/christian',
-    'muslimedia',
-    'muslims.',
-    'muslims/christians',
-    'muslims/israelis',
-    'muslin-curtained',
-    'muslin-draped',
-    'muslin-thin',
-    'muslin-trimmed',
-    'muslin-white',
-    'musmandy',
-    'muso-isms',
-    'musokotwane',
-    'musque',
-    'musqueteers',
-    'musquetoons',
     'muss-juss-gair-nah-dring',
-    'mussallamiyah',
-    'mussau',
-    'mussawi',
-    'mussayib',
-    'mussel-shells',
-    'mussel.',
-    'musseldyke',
-    'musselm&auml;nner',
-    'musselman',
-    'mussels-for',
-    'mussels.',
-    'musselwick',
-    'mussett',
-    'mussi',
-    'mussie',
     'mussle',
-    'mussolimini',
-    'mussolini-meets-foghorn',
-    'mussolinis',
-    'mussoorie',
-    'mussorgksy',
-    'mussorgskian',
-    'mussourie',
-    'mussy-sur-seine',
-    'must-make-money',
-    'must-not',
-    'must-see-at-least-twice',
-    'must-signs',
-    'must-try',
-    'mustaches',
-    'mustadd',
     'mustaffa',
-    'mustagh',
-    'mustahil',
-    'mustajew',
-    'mustajews',
-    'mustakil',
-    'mustakov',
-    'mustaq',
-    'mustaqbal',
-    'mustaqim',
-    'mustaqipeople',
-    'mustard-based',
-    'mustard-gold',
-    'mustard-plaster',
-    'mustard-to-shoe',
-    'mustard-yellow',
     'mustard.',
-    'mustarded',
-    'mustardly',
-    'muste',
-    'mustelae',
-    'muster-point',
-    'muster-roll',
-    'muster-signal',
-    'mustered-out',
-    'mustery',
-    'musthaveaswig',
-    'mustiest',
-    'mustill/marengo',
-    'mustily',
-    'mustine',
-    'mustn\'a',
     'mustn\'ts',
-    'musty-sweet',
-    'musuem',
-    'musulman',
-    'musurus',
-    'muswellbrook',
-    'musyoka',
-    'mut(il)ation',
-    'mutabilis',
-    'mutabilities',
-    'mutabilov',
-    'mutagensis',
-    'mutah',
-    'mutalism',
-    'mutamin',
-    'mutant-to-wild',
     'mutant.',
-    'mutant:dna',
-    'mutara',
-    'mutaradin',
-    'mutaret',
-    'mutasim',
-    'mutation-rates',
-    'mutative',
-    'mutator',
-    'mutawa\'een',
-    'mutawalli',
-    'mutaween',
-    'mutch/swindon',
-    'mute&ndash',
-    'mute-medline',
-    'mute/electra',
     'mutebi',
-    'mutedly',
-    'muteka',
-    'mutely.',
-    'mutemba',
-    'mutenye',
-    'muterahejuru',
-    'mutevelli',
-    'muth',
-    'muthaf&mdash;er',
-    'muthaland',
-    'muthannatransport',
-    'mutharika',
-    'muthena',
-    'muthuvel',
-    'mutica',
     'muticoloured',
-    'mutie',
-    'mutien',
-    'muties',
-    'mutilators',
-    'mutiliated',
-    'mutillidae',
-    'mutimer',
-    'mutinal',
-    'mutini',
-    'mutinying',
-    'mutirai',
-    'mutius',
-    'mutla',
-    'mutlah',
-    'mutli-effects',
     'mutli-million',
-    'mutloe',
-    'mutlu',
-    'mutnodjmet',
-    'mutogens',
-    'mutoh',
-    'mutoid',
-    'mutola',
-    'mutronics',
-    'mutry',
-    'mutsamudu',
-    'mutskin',
-    'mutsu',
-    'mutsuo',
-    'mutta',
-    'muttawa',
     'muttered-against',
-    'muttered.',
-    'mutterrecht',
-    'muttiah',
-    'mutton-chopped',
-    'mutton-chops',
-    'mutton-headed',
-    'mutton-ish',
-    'mutton-tops',
-    'muttonchop',
-    'muttons',
-    'muttrah',
-    'mutts',
-    'muttured',
-    'mutual-aid',
-    'mutual-assistance',
     'mutual-help',
-    'mutual-support',
-    'mutualisation',
-    'mutualise',
-    'mutualised',
-    'mutualism\'',
-    'mutuality-equal',
-    'mutually-agreed',
-    'mutually-assured',
-    'mutually-inconsistent',
-    'mutuations',
-    'mutue',
-    'mutuo',
-    'mutziger',
-    'muv',
-    'muvin',
     'muvingi',
-    'muvumba',
-    'muvverfuckah',
-    'muxlow',
-    'muyabo',
-    'muyabu',
-    'muyaka',
-    'muyangandu',
-    'muyden',
-    'muyembe',
-    'muyinga',
-    'muyongo',
-    'muyser',
-    'muzafar',
-    'muzeiktheater',
-    'muziek',
     'muzny',
-    'muzowera',
-    'muztag',
-    'muzungu',
-    'muzungus',
-    'muzz',
-    'muzzafar',
-    'muzzer',
-    'muzziness',
-    'muzzle-flames',
-    'muzzle-flash',
-    'muzzle-free',
-    'muzzle-loaded',
-    'muzzle-loaders',
-    'mv.11',
-    'mv1190',
     'mv262',
-    'mvb',
-    'mvd-mgb',
-    'mvm',
-    'mvm-starpoint',
-    'mvme187',
-    'mvme197',
-    'mvoement',
-    'mvoements',
-    'mvopl',
-    'mvouba',
-    'mvs-os/2',
-    'mvs-run',
-    'mvs-to-unix',
-    'mvs.',
-    'mvs/cics',
     'mvv',
-    'mw(th)',
-    'mw-1',
-    'mw.',
-    'mw45',
-    'mw6',
-    'mwah',
-    'mwale',
-    'mwalimu',
-    'mwamunga',
-    'mwana',
-    'mwanamwalye',
-    'mwanang\'onze',
-    'mwari',
-    'mwat',
-    'mwc',
     'mwco',
-    'mweelrea',
-    'mwigwithania',
-    'mwila',
-    'mwldan',
-    'mwm',
-    'mwnt',
-    'mwr',
-    'mws',
-    'mws-5900',
-    'mx300',
-    'mx300i',
-    'mx860',
-    'mxs',
-    'mxu',
-    'mxv2',
     'mxxvi',
-    'mxxxi',
-    'mxy6',
-    'mxy7',
-    'my&mdash',
-    'my&ndash;backside',
-    'my&rehy;bod&rehy;y-in-the-midst-of-the-world',
-    'my-body-as-it-is-for-me',
-    'my-dear-abberley',
-    'my-flies-must-be-open',
-    'my-man-once-made-this-pass-at-her-at-a-party-but',
-    'my-ness',
-    'my-newspaper',
-    'my-own-good',
-    'my-sake',
-    'my-sterious',
     'my-tie',
-    'my/hystery',
-    'my750',
-    'myanma-thai',
-    'myatavyn',
-    'myatt',
-    'myatt/association',
-    'myatt/licensee',
-    'myatyalyay',
-    'myaungmya',
-    'mybagswithfivedozen',
-    'myc+myc',
-    'myc-myc',
-    'myc73-',
-    'myc92-',
-    'mycarta',
     'mycelia',
-    'mycelial',
-    'mychell',
-    'myclomas',
-    'myco-bacterial',
-    'myco-protein',
-    'mycobacteriaceae',
-    'mycobacteriology',
-    'mycock',
-    'mycocrisin',
-    'mycodenz',
-    'mycolic',
-    'mycologia',
-    'mycophenolic',
-    'mycoplasma-free',
-    'mycoprotein&reg',
     'mycoproteins',
-    'mycotaxon',
-    'mycteria',
-    'myddleton',
-    'mydir',
-    'mydriasis',
-    'mydriatics',
-    'myectomy',
-    'myelinate',
-    'myelinisation',
-    'myelitis',
-    'myeloblastic',
-    'myeloblastosis',
-    'myelocytomatosis',
-    'myelodyspastic',
-    'myelodysplastic',
     'myeloma-associated',
-    'myelomatosis',
-    'myelomeningocele',
-    'myelopoiesis',
-    'myelosuppression',
-    'myers-written',
-    'myftiu&mdash;had',
-    'myfyrdodau',
-    'myhamet',
-    'myhras',
-    'myinge',
-    'myingyan',
-    'myint*',
-    'myitkya',
-    'mykel',
-    'mykerinus',
     'mykinesh&oacute;lmur',
-    'mykinesholmur',
-    'mykosowska/interpreter',
-    'mykotronx',
-    'mylae',
-    'mylapore',
-    'mylayne',
-    'mylesand',
-    'mylia',
-    'mylius',
-    'myllin',
-    'mylling',
-    'mylnes',
-    'mylonite&rehy;bearing',
-    'mylward',
-    'myma',
     'mymensingh',
-    'mymo',
-    'mynas',
-    'myndmill',
-    'mynedd',
-    'myners',
-    'mynetere',
-    'mynom',
-    'mynos',
-    'myo-feedback',
-    'myoblast',
-    'myocarde',
-    'myocardialinfarction',
-    'myocardio',
-    'myocardiopathy',
-    'myocrisin',
     'myod',
-    'myod-1',
-    'myod1',
-    'myoepithelium',
-    'myofibrillae',
-    'myofibrils',
-    'myofibroblast-like',
-    'myoglobins',
-    'myoglobinuria',
-    'myological',
-    'myology',
-    'myometrial',
-    'myometrium',
-    'myongdong',
-    'myool',
-    'myopathies',
     'myope',
-    'myopeptides',
-    'myopes',
-    'myopically-therapeutic',
-    'myoscolexids',
-    'myosphere',
-    'myoto',
-    'myotomy',
-    'myotonia',
-    'mypro',
-    'myraid',
-    'myrcha',
-    'myrecord',
-    'myremecology',
-    'myremocystus',
-    'myresjo',
     'myretoun',
-    'myrfyn',
-    'myriad-coloured',
-    'myriad-headed',
-    'myriadic',
-    'myril',
-    'myris',
-    'myristica',
-    'myrmec',
-    'myrmecodia',
-    'myrmecophiles',
-    'myrmecophytic',
-    'myrmeleon',
-    'myrmex',
-    'myrmicacin',
-    'myrmidon',
     'myrosin',
-    'myrrh-scented',
-    'myrrour',
-    'myrsinaceae',
-    'myrth',
-    'myrtho',
-    'myrtifolia',
-    'myrtillo',
-    'myrto',
-    'myrton',
-    'myse',
-    'mysel',
-    'mysel\'',
-    'myself&mdash;a',
-    'myself-',
-    'myself-as-child-and-adolescent',
     'myself-as-mortal',
-    'myself-as-sexual-being',
-    'myself-i',
-    'myself-king',
-    'myself-knew',
-    'myself-that',
-    'myself-to',
-    'myself-was',
-    'myself-who',
-    'myself_a_little',
-    'myself_rather',
-    'myshkin',
-    'mysia',
-    'mysians',
-    'mysids',
-    'mysov',
     'myst&eacute;rieuses',
-    'myst&egrave;re/falcon',
-    'mystacalis',
-    'mystagogy',
-    'mystai',
-    'mysterians',
-    'mysterie',
-    'mysterio',
-    'mysteriously-found',
-    'mysteris',
-    'mystero',
-    'mysterously',
-    'mystery-',
-    'mystery-mechanism',
-    'mystery_out',
-    'mystic-priest-saint',
     'mystical-marxism',
-    'mystical-sounding',
-    'mysticeta',
-    'mysticeti',
-    'mysticetus',
-    'mystico&rehy;intellectual',
-    'mystico-technological',
-    'mystras',
-    'mystre',
-    'mystrops',
-    'mytelka',
-    'myth&rehy;and',
-    'myth\'',
-    'myth-1',
-    'myth-2',
-    'myth-3',
     'myth-creating',
-    'myth-detecting',
-    'myth-exploding',
-    'myth-like',
-    'myth-of-mental-illness',
-    'myth-shrouded',
-    'myth-woven',
-    'mythago-flesh',
-    'mythago-genesis',
-    'mythagoscape',
-    'mythbuilder',
-    'mythemes',
-    'mythen',
-    'mythical-sounding',
-    'mythiciser',
-    'mythicizers',
     'mythmaker',
-    'mytho',
-    'mythogenic',
-    'mythologers',
-    'mythological-cosmological',
-    'mythologically',
-    'mythologisation',
-    'mythologist',
-    'mythologists',
-    'mythologizes',
-    'mythology&gt',
-    'mytholoqies',
-    'mythomania',
-    'mythomanic',
-    'mythopoeist',
-    'mythopoetic',
     'myths.',
-    'mythspent',
-    'mytilene',
-    'myton',
-    'myungji',
-    'myunyazesa',
-    'myurella',
-    'myverygoodfriend',
-    'myxomatosis-infected',
-    'myzithra',
-    'mz2',
-    'mz250s',
-    'mza',
-    'mzali',
-    'mzi',
-    'mzimba',
     'mzwai',
-    'n&aacute;b&rcaron;e&zcaron&iacute',
-    'n&aacute;m&ecaron;sti',
-    'n&aacute;m&euml;st&iacute',
-    'n&aacute;mafjall',
-    'n&aacute;me&ccaron;sti',
-    'n&aacute;me&scaron;t&iacute',
-    'n&acirc;jera',
-    'n&amp;a',
-    'n&amp;q',
-    'n&auml;ively',
-    'n&eacute;aoutyine',
-    'n&eacute;bouzan',
-    'n&eacute;cessairement',
-    'n&eacute;cessit&eacute;s',
-    'n&eacute;gation',
     'n&eacute;gre',
-    'n&eacute;o',
-    'n&eacute;roli',
-    'n&eacute;ry',
-    'n&ecirc;e',
-    'n&egrave;gres',
-    'n&egrave;ike',
-    'n&emacr;re&iuml;ds',
-    'n&formula;n',
-    'n&gt;10',
-    'n&gt;2',
-    'n&lsqb;a&rsqb;ck',
-    'n&lt;0.09',
-    'n&lt;1',
-    'n&lt;1%',
-    'n&lt;1.0',
     'n&lt;1.0%',
-    'n&lt;1.20',
-    'n&lt;10',
-    'n&lt;300',
-    'n&mdash',
-    'n&ndash;500',
-    'n&ndash;s',
-    'n&ndash;y',
-    'n&oacute;s',
-    'n&ocirc;tre-dame',
-    'n&ouml;rmiger',
-    'n&plus;1',
-    'n&uacute;menoreans',
-    'n&uacute;pscatla',
-    'n&uacute;pur',
-    'n&uacute;pur.',
     'n&ucirc;menor',
-    'n&uuml;remburg',
-    'n\'&ecirc;tes',
-    'n\'-methylenbisacrylamide',
-    'n\'-terminus',
-    'n\'appuyez',
-    'n\'avons',
-    'n\'breda',
-    'n\'castle',
-    'n\'class',
-    'n\'czuan',
-    'n\'dayan',
-    'n\'dea',
-    'n\'dula',
-    'n\'est-ce-pas',
-    'n\'estimons',
     'n\'etes',
-    'n\'eurent',
-    'n\'gbanda',
-    'n\'gender',
-    'n\'gollo',
-    'n\'gurad',
-    'n\'heed',
-    'n\'importe',
-    'n\'iras',
-    'n\'kai',
-    'n\'low',
-    'n\'mix',
-    'n\'ont',
-    'n\'sasse',
-    'n\'sont',
-    'n\'t\'all',
     'n\'t_as_good',
-    'n\'t_as_good_as_good',
-    'n\'t_at',
-    'n\'t_sort',
-    'n\'th',
-    'n\'zer&eacute;kor&eacute',
-    'n(+t)',
-    'n(1,2)',
-    'n(2,3)',
-    'n(3,4)',
-    'n(63,3)',
-    'n(63,4)',
-    'n(ch3oh)',
-    'n(h2o)',
-    'n(n-1)/2',
-    'n(t2)',
     'n(w)',
-    'n(x)',
-    'n*/n&times;100',
-    'n*n-1',
-    'n+1',
-    'n+2',
-    'n+l',
-    'n+m&ge',
-    'n+t',
-    'n-0183',
-    'n-10',
-    'n-2',
-    'n-200',
-    'n-5007',
-    'n-7',
-    'n-92t',
     'n-acetylaminosalicylic',
-    'n-acetyldopamine',
-    'n-acetylgalactosamine',
-    'n-acetylgalactoseaminyltransferase',
-    'n-acetylprocainamide',
-    'n-alkanes',
-    'n-atom',
-    'n-band',
-    'n-body',
-    'n-butanol',
-    'n-butilbromuro',
-    'n-butyl',
-    'n-cadherin',
-    'n-cam',
-    'n-caps',
-    'n-channel',
     'n-dad',
-    'n-di-methyl-2(1-phenylethyl',
-    'n-e-r-v-o-u-s',
-    'n-east',
-    'n-enriched',
-    'n-ethylmaleimide',
-    'n-ethylmalimide',
-    'n-fold',
-    'n-gon',
-    'n-h',
-    'n-i-x-o-n',
-    'n-ice',
-    'n-l',
-    'n-levels',
-    'n-love',
-    'n-methy-n-nitro-n-nitrosoguanidine',
     'n-methy-n-nitroso-p-toluenesulphonamide',
-    'n-methyl',
-    'n-methyl-d',
-    'n-methyl-d-aspartate',
-    'n-methyl-d-aspartic',
-    'n-n-n-n-no',
-    'n-name',
-    'n-nations',
-    'n-navigation',
-    'n-need',
-    'n-never',
-    'n-nice',
-    'n-nitrosamides',
-    'n-nitrosamines',
-    'n-nobody',
-    'n-non-bonding',
     'n-norway',
-    'n-notice',
-    'n-now',
-    'n-numbered',
-    'n-nylon',
-    'n-o',
-    'n-o-o',
-    'n-oct-5',
-    'n-oct-5a',
-    'n-order',
-    'n-point',
-    'n-pole',
-    'n-power',
-    'n-promise',
-    'n-r',
-    'n-registered',
     'n-sections',
-    'n-shaped',
-    'n-sided',
-    'n-space',
-    'n-symbol',
-    'n-t',
-    'n-ter',
-    'n-terminal-specific',
-    'n-termins',
-    'n-tests',
-    'n-tg',
-    'n-version',
-    'n-w',
-    'n-west',
-    'n.1',
-    'n.11',
     'n.1b',
-    'n.2',
-    'n.20',
-    'n.283',
-    'n.3',
-    'n.32',
-    'n.a.f.a.s.',
-    'n.a.l.c.',
-    'n.a.s.u.w.t',
-    'n.a.t.d.',
-    'n.afri.',
-    'n.b.g.',
-    'n.b.l.t',
-    'n.b.l.t.',
-    'n.b.m.',
-    'n.b.r.',
     'n.bloom',
-    'n.bohling',
-    'n.bonner',
-    'n.c.b.',
-    'n.c.c.l.',
-    'n.c.n.b.',
-    'n.c.o./soldier',
-    'n.c.os',
-    'n.connor',
-    'n.d\'a.',
-    'n.e',
-    'n.e.2d.',
-    'n.e.b.',
-    'n.e.b.s.m.',
-    'n.e.c',
-    'n.e.h.',
     'n.e.l.',
-    'n.emarginata',
-    'n.f.l.',
-    'n.g.b.',
-    'n.houghton',
-    'n.i.238f',
-    'n.i.a.p.a.',
-    'n.i.i.',
-    'n.i.o.',
-    'n.i.s.b.i.',
-    'n.j.w.',
-    'n.k.jones',
-    'n.l.d.',
-    'n.l.s.',
-    'n.lamellosa',
-    'n.m.e.',
     'n.n',
-    'n.n.r.',
-    'n.n.w.-s.s.e',
-    'n.p.l.',
-    'n.p.n.',
-    'n.p.w.',
-    'n.r.g.',
-    'n.r.p.b.',
-    'n.s',
-    'n.s.p.p.c.',
-    'n.u.j',
-    'n.u.m.',
-    'n.u.p.e.',
-    'n.u.s.',
-    'n.v.',
-    'n.v.q.',
     'n.w.a.',
-    'n.w.r.',
-    'n.y.m.r.',
-    'n.z.&dollar;5,000',
-    'n/',
-    'n/2n+3',
-    'n/2n+3+',
-    'n/2p',
-    'n/5',
-    'n/fe4',
-    'n/fxg4',
-    'n/gx',
-    'n/ml',
-    'n/svq',
-    'n/v',
-    'n/vd',
     'n0.',
-    'n01',
-    'n011020043',
-    'n02',
-    'n03',
-    'n04',
-    'n08',
-    'n09',
-    'n0t',
-    'n1-based',
-    'n1.17a',
-    'n101lm',
-    'n1027b',
-    'n102ap',
-    'n1042b',
-    'n10pc',
     'n115',
-    'n12,883',
-    'n120',
-    'n121ef',
-    'n122',
-    'n12380',
-    'n125',
-    'n128ps/146270',
-    'n13',
-    'n1303k',
-    'n138&deg;e',
-    'n13910',
-    'n13ga',
-    'n13stp',
-    'n140',
-    'n141&deg;e',
     'n1456',
-    'n1489k',
-    'n150',
-    'n151rk',
-    'n152js',
-    'n15798',
-    'n1592v',
-    'n166rs',
-    'n17223',
-    'n175',
-    'n1799aa',
-    'n17pc',
-    'n18',
-    'n18548',
-    'n1867q',
-    'n190dh',
     'n191sc',
-    'n1937s',
-    'n195',
-    'n1994',
-    'n1d',
-    'n2-1o',
-    'n2/n2+1',
-    'n2/x',
-    'n201&mdash;204',
-    'n204',
-    'n205',
-    'n209',
-    'n21',
-    'n2157c',
-    'n219d-nylon',
-    'n236',
     'n238',
-    'n240ca',
-    'n246',
-    'n25y',
-    'n2673',
-    'n27(1)',
-    'n27(2)',
-    'n2715',
-    'n281l',
-    'n2980',
-    'n29931',
-    'n2l',
-    'n2s-5',
-    'n3.',
-    'n3/25v',
-    'n300',
     'n3006e',
-    'n3025',
-    'n3104u',
-    'n312',
-    'n312316',
-    'n327uw',
-    'n3406',
-    'n34920',
-    'n3493e',
-    'n3509g',
-    'n3609k',
-    'n36sf',
-    'n37570',
-    'n37611',
-    'n376pa',
-    'n3831y',
     'n386',
-    'n4000b',
-    'n400nc',
-    'n40ft',
-    'n41702',
-    'n4172',
-    'n4389',
-    'n4390f',
-    'n4461c',
-    'n451df',
-    'n45gd',
-    'n4904e',
-    'n5&mdash;6',
-    'n5/40',
-    'n5000e',
-    'n500ln',
     'n5193g',
-    'n51rr',
-    'n55',
-    'n555',
-    'n555sl',
-    'n55ca',
-    'n56028',
-    'n5726',
-    'n58wh',
-    'n6/20',
-    'n6108',
-    'n621l',
-    'n62433',
-    'n625cl',
-    'n64,000',
-    'n6452',
     'n67151',
-    'n68,730',
-    'n6827c',
-    'n68jr',
-    'n6937c',
-    'n6966d',
-    'n7/4',
-    'n7004u',
-    'n7057c',
-    'n7079g',
-    'n71',
-    'n718y',
-    'n71ft',
-    'n720',
-    'n7227c',
-    'n740',
     'n746bj',
-    'n747bn',
-    'n75',
-    'n752',
-    'n7584',
-    'n77',
-    'n7750k',
-    'n7825c',
-    'n8(1)',
-    'n8044',
-    'n805f',
-    'n848d',
-    'n86359',
-    'n86952',
-    'n873h',
-    'n87966',
     'n88689',
-    'n88t',
-    'n89nw',
-    'n9',
-    'n9,240',
-    'n9028',
-    'n9049',
-    'n9053r',
-    'n905d',
-    'n91108',
-    'n9142h',
-    'n9150',
-    'n940',
-    'n94385',
-    'n94459',
-    'n94bl',
     'n95bl',
-    'n95jb',
-    'n9650n',
-    'n9689h',
-    'n96ca',
-    'n96nc',
-    'n97',
-    'n97915',
-    'n990l',
-    'n9962n',
-    'n9a',
-    'n9a&mdash;admission/statement',
-    'n9b&mdash;defence',
-    'n:18',
-    'n:2',
-    'n:40',
     'n=1,076',
-    'n=100',
-    'n=1035',
-    'n=104',
-    'n=1151',
-    'n=118',
-    'n=121',
-    'n=124',
-    'n=130',
-    'n=135',
-    'n=137',
-    'n=152',
-    'n=153',
-    'n=16/treatment',
-    'n=168',
-    'n=171',
     'n=173',
-    'n=184',
-    'n=187',
-    'n=2.2',
-    'n=200',
-    'n=211',
-    'n=215',
-    'n=221',
-    'n=224',
-    'n=26',
-    'n=263',
-    'n=274',
-    'n=276',
-    'n=299',
-    'n=310',
-    'n=321',
     'n=34',
-    'n=35',
-    'n=38',
-    'n=39',
-    'n=43',
-    'n=433',
-    'n=44',
-    'n=49',
-    'n=542',
-    'n=54207',
-    'n=58198',
-    'n=59',
-    'n=610',
-    'n=62',
-    'n=62&ndash;78',
-    'n=66',
     'n=67',
-    'n=683',
-    'n=70',
-    'n=733',
-    'n=742',
-    'n=76',
-    'n=77',
-    'n=78',
-    'n=79',
-    'n=80',
-    'n=82',
-    'n=86',
-    'n=87',
-    'n=888',
-    'n=89',
-    'n=9&ndash;18',
     'n=93',
-    'n=950',
-    'n=a+',
-    'n=a+b/c-d',
-    'n=a/b+c/d',
-    'n=c',
-    'n=eight',
-    'n=five',
-    'n=nadir',
-    'n=neb/h',
-    'n=six',
-    'n_',
-    'na&icirc;vet&eacute',
-    'na&icirc;vet&eacute;s',
-    'na&iuml;f',
-    'na&iuml;ive',
     'na&iuml;v&eacute;t&eacute',
-    'na&iuml;ves',
-    'na&iuml;vete',
-    'na&iuml;veties',
-    'na&plus',
-    'na&rehy;tionally',
-    'na\'-lu',
-    'na\'am',
-    'na\'im',
-    'na\'then',
-    'na(hh)aew',
-    'na-1',
-    'na-259',
-    'na-albite',
-    'na-cobaltinitrate',
-    'na-khi',
     'na-na-na-na-na',
-    'na-nazi',
-    'na-pe-re-wa',
-    'na/1',
-    'na/k-atpase',
-    'na20',
-    'na2hpo4',
-    'na2o',
-    'na4',
-    'na45',
-    'na6',
-    'na=',
-    'naaacp',
-    'naac',
-    'naacal',
-    'naad/lyre',
     'naafi-style',
-    'naafo',
-    'naag',
-    'naam',
-    'naamah',
-    'naamathite',
-    'naameh',
-    'naans',
-    'naar',
-    'nab-led',
-    'naba',
-    'nabaa',
-    'nabadingi',
-    'nabaglo',
-    'nabataea',
-    'nabataeans',
     'nabataen',
-    'nabatchikov',
-    'nabatean',
-    'nabatiya',
-    'nabatiyah',
-    'nabbie',
-    'nabbin\'',
-    'nabbled',
-    'nabeel',
-    'naber',
-    'nabeshima',
-    'nabeul',
-    'nabie',
-    'nabis-period',
-    'nabisco/',
-    'naboho',
     'nabokov-wilson',
-    'nabokovs',
-    'nabore',
-    'nabucco',
-    'nabushakkari',
-    'nabwera',
-    'naby',
-    'nac-the',
-    'nac.',
-    'nacae',
-    'nacajuca',
-    'nace-yon',
-    'nacels',
-    'nacett',
-    'naceur',
-    'nachal\'niki',
     'nachar',
-    'nachinaet',
-    'nachla&szlig',
-    'nachlass',
-    'nachna-kuthara',
-    'nachr-like',
-    'nachrichtenabteilung',
-    'nachschlagewerk',
-    'nachtasyl',
-    'nachtklag',
-    'nachtmann',
-    'nachtrichten',
-    'nachtweih',
-    'naci',
-    'nacional-sindicalista',
-    'nacka',
     'nacks',
-    'nacl(s)',
-    'nacl-0.5%',
-    'nacl-12.5',
-    'nacl-tris',
-    'nacm',
-    'naco',
-    'nacogdoches',
-    'nacrolepsy',
-    'nacss',
-    'nad4',
-    'nadab',
-    'nadal',
-    'nadareyshvili',
-    'nadaud',
-    'naddair',
     'nadelgrat',
-    'nadelhofer',
-    'nadelman',
-    'nadelmann',
-    'nadelson',
-    'nadena',
-    'nadh-dehydrogenase',
-    'nadira',
-    'nadiradize',
-    'nadiri',
-    'nadirs',
-    'nadja',
-    'nadlac',
-    'nadler',
-    'nadmidyn',
-    'nadp/gmts',
     'nadv',
-    'nadya',
-    'nadzab',
-    'nae-user',
-    'naebody',
-    'naei',
-    'nael',
-    'naena',
-    'naesyerugiau',
-    'naethin',
-    'naevae',
-    'naewhere',
-    'naf-naf',
-    'naf/alcl',
-    'nafd/bie/cfsma/bifd/',
-    'naff-all',
     'naff-seventiesness',
-    'naffah',
-    'naffin',
-    'naffs',
-    'nafissa',
-    'nafl96.8',
-    'nafnaf',
-    'nafooey',
-    'nafr',
-    'naft',
-    'nag/',
-    'nag/creatine',
-    'naga-ni',
-    'nagan',
-    'nagana',
-    'nagaraj',
     'nagarik',
-    'nagarjuna',
-    'nagarjunan',
-    'nagasawa',
-    'nagase',
-    'nagasue',
-    'nagaswaram',
-    'nagatani',
-    'nagaul',
-    'nagement',
-    'nagendra',
-    'nagengast',
-    'nager',
-    'nagger',
-    'naggers',
-    'naggin\'',
     'naggings',
-    'naggs',
-    'naggy',
-    'nagines',
-    'nagire',
-    'nagle-produced',
-    'nagle/area',
-    'nagle/ram-raid',
-    'nagle/royal',
-    'nagona',
-    'nagoreti',
-    'nagorny-karahakh',
-    'nagoyqatsi',
-    'nagrafax',
-    'nagschmid',
-    'nagu&egrave;re',
     'nagy.',
-    'nagybanya',
-    'nagylak',
-    'nagymar&oacute;s',
-    'nagymaros',
-    'nah-achlaise',
-    'nah-een',
-    'nah2po4',
-    'nahalie',
-    'nahalin',
-    'nahant',
-    'nahashion',
-    'nahautl',
-    'nahayan',
-    'nahayo',
-    'nahayohandicrafts',
     'nahdha',
-    'nahdlatul',
-    'nahema',
-    'nahgettin',
-    'nahida',
-    'nahke',
-    'nahor',
-    'nahpo',
-    'nahr-i-bihisht',
-    'nahtan',
-    'nahtral',
-    'nahuatl',
-    'nahuel',
-    'nai&die;ve',
-    'nai&die;vet&eacute',
-    'nai&uml;ve',
     'nai(tl)',
-    'nai-ha',
-    'naiadaceae',
-    'naidex\'93',
-    'naidios',
-    'naie',
-    'naiea',
-    'naifs',
-    'naifu',
-    'naigow',
-    'nail-bed',
-    'nail-bitingly',
-    'nail-brush',
-    'nail-care',
-    'nail-clipper',
-    'nail-clipping',
     'nail-clippings',
-    'nail-cutting-out',
-    'nail-files',
-    'nail-fixed',
-    'nail-head',
-    'nail-heads',
-    'nail-holes',
-    'nail-like',
-    'nail-makers',
-    'nail-marks',
-    'nail-parings',
-    'nail-polish',
-    'nail-rods',
-    'nail-scissored',
-    'nail-tail',
-    'nail-varnished',
     'nailbiter',
-    'nailbombs',
-    'nailer-farmers',
-    'nailery',
-    'nailham',
-    'nailheads',
-    'nailmaker',
-    'nailmaker-farmer',
-    'nailors',
-    'nails-hard',
-    'nails.',
-    'nailsishness',
-    'naiman',
-    'naingngan',
-    'nains',
-    'naipospos',
     'nairab',
-    'nairn-based',
-    'nairobi&ndash;treetops',
-    'nairobi.',
-    'nairules',
-    'nairus',
-    'nairver',
-    'naish/gloucestershire',
-    'naissance',
-    'naissent',
-    'nait',
-    'naith',
-    'naive-political',
-    'naively.',
-    'naiveties',
-    'naizet',
     'naja',
-    'najaf.',
-    'najafian',
-    'najand',
-    'najara',
-    'najd',
-    'najin',
-    'najjar',
-    'najm',
-    'najmoddin',
-    'najork',
-    'najrane',
-    'naka',
-    'nakabayashi',
-    'nakadai',
-    'nakagawa',
     'nakaguchi',
-    'nakai',
-    'nakaku',
-    'nakamaru',
-    'nakamatsu',
-    'nakanodo',
-    'nakanokuchi',
-    'naked-heeler',
-    'naked-looking',
-    'naked-on-the-bed',
-    'naked-seeming',
-    'nakedness.a',
-    'nakeds',
-    'nakell',
-    'nakhasatien',
-    'nakhla',
     'nakhle',
-    'nakibulesraf',
-    'nakoda',
-    'nakryn',
-    'nakte',
-    'naktog',
-    'naktong',
-    'nakugen',
-    'nalanda',
-    'nalco',
-    'nalder/transport',
-    'nalec',
-    'naledi',
-    'nalevich',
-    'nalini',
-    'nalkylene',
     'nalrwu',
-    'nalumino',
-    'nalusanga',
-    'nam-chun',
-    'nam-set',
-    'nam.typ',
-    'nam2.typ',
-    'namaaz',
-    'namadra',
-    'namagiri',
-    'namalwa',
-    'namanga',
-    'namar',
-    'namara',
-    'namarroi',
-    'namas/nbs',
     'namaste',
-    'namath',
-    'namatjira',
-    'namba',
-    'nambia',
-    'nambikwara',
-    'namby-pambies',
-    'namdar',
-    'namdi',
-    'name&dollar',
-    'name&gt;-module',
-    'name&gt;.com',
-    'name&mdash',
-    'name&mdash;conveyance',
-    'name&mdash;indeed',
-    'name&rehy;droppers',
     'name(a20)',
-    'name-',
-    'name-a&rehy;plane',
-    'name-board',
-    'name-boards',
-    'name-called',
-    'name-cards',
-    'name-check',
-    'name-checked',
-    'name-checks',
-    'name-disclosing',
-    'name-discussion',
-    'name-drop',
-    'name-guests',
-    'name-labels',
-    'name-linked',
     'name-mapping',
-    'name-matching',
-    'name-may',
-    'name-name',
-    'name-noun',
-    'name-plaque',
-    'name-recognition',
-    'name-saint',
-    'name-sake',
-    'name-stamped',
-    'name-swapping',
-    'name-tagged',
-    'name-tags',
-    'name-vase',
-    'name-words',
-    'name-your-own-price',
     'name-your-price',
-    'name.and',
-    'name.i',
-    'name.just',
-    'name.version',
-    'name/',
-    'name/model',
-    'name/noun',
-    'name/number',
-    'name:atlanta',
-    'name:billie',
-    'name:eliza',
-    'name:georgia',
-    'name:james',
-    'name:john',
-    'name:louis',
     'name:renee',
-    'name_now',
-    'nameaphasia',
-    'namebar',
-    'nameboard',
-    'nameboards',
-    'namecheck',
-    'namechecks',
-    'named-character',
-    'named/new',
-    'nameday',
-    'nameless/autumn',
-    'namelessly',
-    'namelessness',
-    'namely&mdash',
-    'namers',
     'names&dollar;.',
-    'names&mdash;conveyance',
-    'names-in-a-frame',
-    'names-particularly',
-    'names-suspect',
-    'names/addresses',
-    'names/addresses/phone',
-    'names/kits',
-    'names/numbers',
-    'names/titles',
-    'names=infmosrt',
-    'namesti',
-    'nametag',
-    'nametags',
-    'namib',
-    'namibair',
     'namibia/angola',
-    'namibiensis',
-    'namings',
-    'namiq',
-    'namjim',
-    'namkeens',
-    'namly',
-    'namoore',
-    'namorado',
-    'namoree',
-    'namron',
-    'namsraijavyn',
-    'namsrain',
-    'namti-mogaung',
-    'namurian/dinantian',
-    'namys',
     'nan-shan',
-    'nan-ung',
-    'nanais',
-    'nanapublic',
-    'nanasipau\'u',
-    'nanbai',
-    'nanbrynmawr',
-    'nanchukas',
-    'nancie',
-    'nancies',
-    'nancified',
-    'nanclares',
-    'nancy-boys',
-    'nandalbayan',
-    'nandkumar',
-    'nandmuri',
     'nandyal',
-    'nangrahar',
-    'nangreave',
-    'nanie',
-    'naniel',
-    'nanino',
-    'nanjil',
-    'nanka',
-    'nankani',
-    'nankervis',
-    'nankypoo',
-    'nann',
-    'nannacara',
-    'nannick',
-    'nannied',
-    'nannofossil-bearing',
     'nannofossil-diatom',
-    'nannofossils',
-    'nannopsittaca',
-    'nannucci',
-    'nanny-giraffe',
-    'nanny-goat',
-    'nanny-thin',
-    'nanny-users',
-    'nanny/housekeeper',
-    'nano-second',
-    'nano/democracy',
-    'nano3',
-    'nanoceph',
-    'nanocephs',
-    'nanochair',
-    'nanoclusters',
     'nanocomposites',
-    'nanoconstruction',
-    'nanogram',
-    'nanometer',
-    'nanomoles',
-    'nanoparticles',
-    'nanoplankton',
-    'nanoskirt',
-    'nanpean',
-    'nansallas',
-    'nansie-wards',
-    'nanstallon',
-    'nant-y-derw',
-    'nant-y-glyn',
-    'nanticoke',
-    'nantmor',
     'nantong',
-    'nantpose',
-    'nantygarth',
-    'nantyronen',
-    'nanum',
-    'nanuoya',
-    'nanura',
-    'nanven',
-    'nanyang',
-    'nanyo',
-    'naoac',
-    'naogar',
-    'naoh(aq)',
-    'naoh-soluble',
-    'naoh.',
-    'naoh/0.1',
     'naom',
-    'naoma',
-    'naomichi',
-    'naomieducation',
-    'naomis',
-    'naosuke',
-    'naow',
-    'naoya',
-    'naoyuki',
-    'nap-1/',
-    'nap-5',
-    'nap-hand',
-    'nap.',
-    'napak',
-    'napalmed',
-    'napang',
     'naparstek',
-    'nape-hair',
-    'naphill',
-    'naphtali',
-    'naphtha/oil',
-    'naphthylamine',
-    'napier-railton',
-    'napiers',
-    'napirasu',
-    'napkin-swathed',
-    'napkin-wrapping',
-    'napl',
-    'naples-',
-    'naples-born',
-    'naples-milan',
-    'naples-on-hudson',
     'naples-yellow',
-    'napol&eacute;oniennes',
-    'napoleana',
-    'napoleon&ndash;s',
-    'napoleon-jerome',
-    'napoleonism',
-    'napolitain',
-    'napoule',
-    'napper/thames',
-    'nappie',
-    'nappied',
-    'nappiness',
-    'nappy-changer',
-    'nappy-changing',
-    'nappy-making',
-    'nappy-rash',
     'naprocin',
-    'napsa',
-    'napsac',
-    'napthol',
-    'napton',
-    'naqada',
-    'naqd',
-    'naqourra',
-    'naqqoura',
-    'naquarah',
-    'naquen',
-    'nar-tans',
-    'nar-tarns',
-    'naragansett',
-    'naraine',
-    'naranco',
     'naranjas',
-    'naranson',
-    'narasimhan',
-    'narayal',
-    'narayana',
-    'narazel',
-    'narbekovis',
-    'narbonnais',
-    'narbra',
-    'narc',
-    'narciso',
-    'narcissism.',
-    'narcissism/doubt',
-    'narcissists',
-    'narcissus-like',
-    'narcite',
     'narcize',
-    'narco-politics',
-    'narcotic-laced',
-    'narcoticists',
-    'narcoticizers',
-    'narcotize',
-    'narcs',
-    'nard&iacute;z',
-    'nardin',
-    'nardini',
-    'nardo',
-    'nardoo',
-    'nardy',
-    'narea',
-    'narelle',
-    'naren',
     'narendhra',
-    'narew',
-    'narex',
-    'narghils',
-    'nargirin',
-    'nargis',
+)
+
+blocks_66 = (
+    '"#jet"!l"%n/fan##tec##ute"%odych#*kosiewiczi#%ngoti"$p/lh"(s/filter#"o1"&t=12hr#!l""ud#$leki',
+    '"!v#!i""yn!*m&amp;sup2#\'times;5*".5)!6)"75""\'a"!-#!1#\'calibre#(diameter##hum##ing',
+    '"!.#$1d,7#&follow#!i#"mm"%/hour$!r#!m"*53211/bapc#$4099"%70019"%c-see""ds"#egi#%mbers',
+    '""m\'#!f$#-ow$!f#$m-mm$$mmmm(+mmmmmmmmmmm#"nn"*numnumnumm"&ol.day$!/%!1&!5%"hr""ph',
+    '""r2""ta"!u#&/cache#!h##nch$,o-deficiency#)s/diploma!\'n&amp;n#.eacute;0sicles"\'/3dr/10"$1203##500"$3101%!3',
+    '"&am-cci#$seas"#ccl#%hener""dp"$emba$(onically#(sarchaea("os"!f#$-bsp#!l"&ichovo#%ssing$&terial',
+    '#$ment"$p2-5#!4$*/&rehy;v42#!5$\'/v42bis""so"&thpndn##rse"*ungi/lindi"#vii"!w!1o&ccedil;ambicana.#que#=euml;t-hennessy-louis-vuitton',
+    '#)ndash;art#*rehy;dules"&\'amera#!g##joe#$ther"%-dean%$ttes#&lu-hwa#*pedestrian"#.st""99"#abi##kes#!l',
+    '$#jam#"pa#)t-holiday%$site$%house$#ing"(b-capped\'!s$%noise$%raped$)situation#$bery$)s/banbury&\'friends&%owner',
+    '#"en$(rgellids#)il/badger&#top%*e-launched&)/moveable&"93&#com&$ware%!i&,&aacute;rios&#ary&-sation-orders&#tas\'"y\'',
+    ')%shift(!.(\'/change%#kom$"um#&lebani%(y/tenant#&ocracy#%utism"%capra$$ssin#&casin\'("ed$"ia#%enigo',
+    '&$java&&mysore%!n%"rb$#eck$!i$$nant$&okidae\'$ella$#rum$"ta&!r$#udi#.k&rehy;learned*\'marbled',
+    '$*-abasement&$larm&)pologetic+"ia&+stonishment&&ttacks%\'battles&%oxing\'!y%)classical\'&erical&)ombatants($fort((pliments\'%ncern',
+    '))ternation\'%urtly%$dead\'\'ference&\'isabled(\'gusting(\'neyland&%odged\'#ric%(election(%vated&\'mperors&*ngagements&#xam()speration',
+    '+"ty&$lesh&%rench&&uneral%(georgian&(ratitude($vity%%hippy&(orrified)"or&%umble%.ingratiatingly\'\'nocence,#tly%(jacobean',
+    '\'"er&&ightly%%macho\'&hogany\'"le&(ediaeval&&iracle&%odest%\'oedipal&%range\'$gasm&&utrage%\'palazzo&$enis&%ocket',
+    '&&rotest&&unches%&raping&&eality\'\'jection\'&proach-#ful\'%spect&&omance*%esque%&severe+"ly&(heepskin&(impleton&(olemnity',
+    '&&ternly%&temple\'&xtbook&-hirties-liner&,ortoiseshell&+ransfection\'%eated%&useful%)victorian%\'wembley&%ooden\'%rking$$/the$$ery.$$ings',
+    '$\'reality%$idge$"up#&oyouth#%quard#\'roscope"1d&eacute;r&eacute,%ateur$+rehy;ifying#%\'rate#$-dun$&funded$#ish$\'revival#&.tech.',
+    '#+al-analysis%$ties$%ressi%!t#$bury##ded%$rbee#\'e-based%&change*#ing%&locked%\'pulling$$/led%\'natural%&scroll',
+    '%$-act&(by-model&*consistent&)dependent&+engineering&)numbering&(painting\'(redicted&\'railway&%sized\'$peak&!t\'*-ford-type\'&o-view\'2urned-photographer',
+    '&$year%#/15&%ideal&&singer%!e&!s&!t%#ica%!l&#in\'(&g-clay)2/design/simulation*\'forming*(planning*$what',
+    '&!y%"s.&(/friends&"ki$%m/fax)*/answering%(isations$.na-lamborghini&\'/driver%"da%!o$!o$$rata\'.e-conservative)&income',
+    ',$long("=2)(moderate(*ly-stocked\'&ion-he%.n&rehy;looking&!\'&%(ist)&$-art\'%dance(%esign\'*instrument\'\'manners\'&styled\'(thinking',
+    '&*/technical&(e-centre\'!n&$ises($ings(/m/modernization(+t-palladian*%style*$type)!a\'$ties(/y/postmodernity\'6zation/diversification-!s&$sing',
+    '$)s-talking%!.%"co%)t-looking&#est&#ies\'"ne&+ly-equipped)&titled&"y.$%ulate##ico$3fiability-by-design&,ca&rehy;tion2!s',
+    '--/improvements&)ed/tested&!y%#yng$%llion$!n%!e$&shness%#tes$$ties#&kowski##len%!s$%inger#(monsters',
+    '$!m$"od%!s#\'pck.qry#$rcin$"en$#ica$#one$&zewski#\'set.fil$%ports#$uels$#gna$%lable&\'r-based',
+    '\'*/portfolio\'"is)!e&/tor-demodulator%/e&mdash;details&&-based\'&number\'*subtype-is&&/issue\'(packages\'%short\'$unit&!7&!9&\'=module',
+    '(%short%$ised\'!t%"or%*us/density%"yo##wen#!y$\'acrylic$&okerto"$ehne#%ities%!y#&lchert$#fre',
+    '&"ux#"ma##ngo$#ich$\'khausia%#opi#$over#"ra%!n#*senlechner#)t-chandon"$feli#(fat/aged&,t/thamesdown$"en',
+    '#!o#!s#!u$$gger""ga$&choirb$4dishu&mdash;uarsciek)$-gen$#mbo$-ung-myitkyina#"en%#sen$!y#$ford#*g-davidson',
+    '$"er$!s#\'hadassi%!n$"ni##iro#"ok#"ue$#led%%field%"of"+h&eacute;li#$abat$"cs$#irs',
+    '$)med-salih%\'madamin)!n&$ed\'s(%anism%#oud$"nd$"to$#wke$!y#!d#)enjo-daro$!r#"ib$.can-hair-piece',
+    '$$ddin$%edine$)nuddinpur$"st&!s#$lala\'(/swindon&#efi$"er#&mammed%!r$-ood/colleague#!n#%ocles#"ri',
+    '##ter#"um$"ns#"ve#)yeddin/bb"$iane#%chiro##gua#$keha#!l$#ies%#ngs$!y##moi#$nlam',
+    '##ola$"ne#%phebi#*r&eacute;s$\'a-based$"es$$peth#(s&egrave$"an$(eiwitsch%!r$#ley$)t-looking&(sounding%#ura',
+    ')*conserving)%laden*%evels)*prevention+#oof))retaining)\'smeared()resistant\'&isers.)0ing/conditioning##tel%&sserie$$inho#"un#$ving',
+    '""ja$%ddedi"$kaba$(f&eacute#"es$"te#%hanto#"ni##oko$"ni$"ro&#ane#&retsov$!i%"ce',
+    '##uba$"me#"yr",l&eacute;son##/kg#$acek$!i$(lity=mca$"nd$,sse-detritus\'&s-type##cad#\'d-based$&/pilot$2ava&mdash;although',
+    '$!i%!c$%ovans$#pro$#vay$!y#\'e-brown%\'catcher,!s&\'oloured%$dark%$hill&&unting%$like%$mode',
+    '%$rats&"un%\'snouted&$tyle$#_of$)cu-prints\'$tech&%blade&0lar&rehy;genetic))-hydrogen*$ring*%sized*&weight)(ly-rapid\'\'e&ndash',
+    ')$mind)$thin("cm(#scm$#dat%#ina$"fe%!i$%hunts$#iro$"nd%%schot$!r$%skin\'(!s',
+    '%"ta\'%tions&$erer&"um$%tsane%"te$%weeks#$fino##ien$&gnengo$)na-annett&&/spain&&annett&#ire&(s-campos',
+    '%#ier%(ological$%paxin$"sh#.kerei-zentrale#%lekin%&nhauer$#ica&$haff&$kin\')!g%"ed&!n%$nedo$$osus',
+    '$,usc-crushing(\'feeding($like\'#ans\'%icide,!s(%vores\'Ds-annelids-brachiopods-pogonophorans&(k-shaped$)y-coddled+#ing%#ish%%mauks\'"wk%!s',
+    '$!e#!o$)ch&verbar&#ian$\'detchno&&zhnaya$!m$$ngua$%ssian$.tov-ribentropp(#von\'!s##sey$$heim$#tad',
+    '&"ly$!i$$kean#"ua$%ccana(!s$$scas#(ybdenite$!e%$nuex$(n/polish%!x$#vos#"za"$mart',
+    '%#ssa$%erger%!t$#urg%"ti#*egictiture$$mtum$#nt\'&#(s)&!-\'"as\'*efficiency\'"we&!.\'"it',
+    '&)ary&mdash&(ictiture&#um.$\'rsfield#"im#"ji#"me$#ies#$odou%!u$$h&gt$(polymers$&randum\'"gi$"te',
+    '#"us##zer&!s",n&ndash;6.00*#wed##-ay$#thu\'"rs$#wed#!.#!/$$arch#$acco%$hesi&!i',
+    '%\'o-based$(ghan/ali)\'factory$!l%"is$#nce$,r&rehy;chies%%agala%0ch-of-the-people\'!.\'$idae(*st/liberal\'"s.\'(y-church)&soaked',
+    '%"da\'!s$(sterevin("ie)!o)"um(0y-turned-parador)&/costa&-ic-foundation)$like*&ooking)%style("on\'!r(#aki',
+    '&\'yrskaya$!t%!e$&urally$$veen#$beig$4iot/environmentalist(&oxford$$usho#$cale$#eau%!r$&harmin&"ux\'$zet\'',
+    '%#ing&!o&%quite%!s$#ion$%kland$&ontour$$rief$$ytes#-d&rehy;nickel$\'-turner$!a%#ine%!l%(y-friday',
+    '\',morning-like&*.meanwhile&)/hereford&(saturday$#ego$%iales\'!i$$lane$&o-food%%liedo&$kiri%!n&*ico/torino&%ville$,rag&oacute;n',
+    '\'*n-inspired#1e&rehy;tarization$$gros$"ll&!i$&mvasia$"ny$"ra%%ville$!s$*t-monoxide&%style%$aria(&st/new*%s/new',
+    '\'(y-credit%"go%$ique%!s%"ta$*y&mdash;it,#the&-rehy;changers+\'spinner%)(950,000)%%-boys\'&ringer(%oking&\'carrier\'&entred',
+    '\'*ompartment($utts&)dominated&\'earning&+for-nothing)"ms&*generating\'&rabber)#nts(&ubbers&*harvesters-#ing("te\'%ungry)#ter',
+    '&0in-the&rehy;bank(&terest\'*s-the-only&\'jobbing&$list\'%overs&\'machine(%tters\'&ongers(\'tivated&%order&%pouch(&werful&%rents&%saver',
+    '\'#ign\'\'penders+#ing(&inner.&%talks\'\'o-spare\'&raders&%using&(weighted\'&inning\'*orshipping%*.education%"/a&\'builder&%goods',
+    '&&leaves&*reputation&)valuables%!8%#_as&#out%"an%$back\'!g%%goods%$line%$more%&neaney%\'persons%#see',
+    '&%pyder&$tone%$talk%&wealth&&inners&#ort#\'ferrato$\'lanquin&"ur$!s#%galla$$ella\'!i$!i%&ardino',
+    '$#kok&&lnavin%"ut$#let\'&public$\'ockodji%%kodji%)l-british\'(speaking&$bank&+ian-chinese*(language\'"ca("us\'$mpex',
+    '&"us$+rel-looking(%packs\'\'ization)"ed$!u%"ls$!y#(hdorjiyn$#ede##ial$!c%!*%$kers$+er-williams',
+    '$$ma-k%$ints$)n-obukhov$%strol$#tel&#red\'#ing\'!s%,or-evaluator(&signal)\'pecific\'$.the\'&/audit()evaluator\'$ing.',
+    '+*evaluation5*/reporting\'!y$%uszko#$jack$!e$!o#(k\'s-hood$\'-bishop%)goldsmith%\'knights%%robed$)/williams$!a$"en',
+    '%(y-clever)#imb\'\'fashion(\'eatures\'\'glander\'&nimble("ut\')plainness\'%sized&$beck&"ed&#ish&&puzzle&*s-hominoid\'!.',
+    '&)wrenching$$hood&\'use/car(#ian$\'ishness$$land%#ike$#man\'\'/trader$%shill%$tadt&#one$-ton-northwich$!u$$well',
+    '#&monier%&usseau&(th/gwent#!n$$artz$#ery$$ieri$$oyer$"um#,o&rehy;elite*(syllabic$\'-casual\'$usal&&ontrol&#rop',
+    '&&ulture%(filament%,hierarchical%)iodinated%,n-chloramine%.organizational%)phonetiea&$itch&%olies%,reproduction%#ski(#ing&&ubject((stituted$$:bis',
+    '%%mines%$nion&(tibiotic$#bon%#uoy$%chord&*romaticism."ty+#ors)"ed%8le-and-green-face-powder&%ongla%!o&&loured&\'mponent',
+    '&#rus%\'ristant&"op($ping\'&tophos&&ystant%*ulturalism%(yte-rich(+/macrophage("s/\'-ic/macrophage$)d-cassidy&(fontaine%&entate%#ies',
+    '%\'ontidae%$rama$(ethylene$-fluoroacetate$\'gastric%&enists\'!y&"rm%/rammed-slippers)#ist\'$pher)#ics)"s.($tids)"us',
+    '%$ynum$$hull$"ia%,odo-glucagon)#pyy$%kines%%omana$$lena%\'inguist%&ogists$&matapa%$edia&$r(s)\'&-based&#tic',
+    '(!y%#ict&\'neralic+#lic%%orium%%utapa$"na%&culear%"en%&itrate%-ucleosis-like*%tides&%lcear$&phones&\'thalmus',
+    '*#ism%*lacophoran&#ies%#ods&!l\')ies-ibid.(2stic/oligopolistic(%zing.\'"y\'(\'-ridden(-/non-monopoly%\'rinting\'!x&*ofessional%&sonist',
+    '$)saccaride)#tes(&haride&&turate,!d,!s%%kiing%$pace\'"rs%\'tachyus\'#tos&&earate&$roma%*ubstituted&&lphate',
+    '&*naptically$(thematic&)ioacetate%%onies%)ransitive&#eme)!s&#ope)!s&%ysian%%yping$+unsaturates%!x$&valent%(ersation',
+    '%&ygotic&"la#+r&eacute;al$#eal%!f$#ing$)o-baggers&&davies%)e/kennedy%!y#)s-bouberc$#all&"ve$"ei&"ur',
+    '%#nor%$rato$"he$!i%%gnori\'!y$(oon-like(&soaked\'&/mitzi$#par$#ted&\'r&mdash\'5-from-the-blue-lagoon($gore(&legend',
+    '(%maker+#ing(#rat((watchers\'#ing("sh\'"s.%$ruos$"ue%+mmano-terme#+t&eacute;es&\'grave;s$!-%*aim&eacute&#rme',
+    '%&rachet%)st-michel$*a&ntilde;a.!s-$eros.#ses%$baur%\'ge-like(%style\'!d&"na\'"e.(!s&(u-harris\'+/headmaster',
+    '\'!a\')e-capulet)&dawson(+/headmaster%+lb&aacute;n\'!a\'!o&$cini)!o&"vo%*na-vermala&$elli&"ha&"ta&"um',
+    '&#gil(!s&$solo&!y%$zels$%barey%%lancs%#ron$$cada%%hanin&$emin%-lar-d\'agenais$&didier$-e&rehy;catini%*-napoleone',
+    '%%carlo\'%ssino\'$tivi&#chi&&itorio&&ucculi%(fiascone\'&oralle%#gna&"re%%leone&,lana-coronil&$ungo%(maggiore\'#rte',
+    ')+in-albanian%+pequehealth&)ulcianesi%#ray&&ecchio&\'iggioni&#rat\'+ey&rehy;huh%$sago&"es&%quiou++-d\'artagnan%%verde)#ian%!z',
+    '%&ermeil\'#rat%&itchet%%leury%#ord\'%tists(!s$.gen&egrave;vre%,olfier-style&)merie-led)&y/raid*%ensis\'%nerie&#ris%$ueux',
+    '%!\'%#(s)%!-&*and-a-half&#but%%/year%"an%$elon&%rlant\'#mer%%going%#ira%$long&%y-but($paid',
+    '\'#ish\'(welcomes%"on%.s&mdash;costed-#you\'\'ndash;3-!6&!-\'"14\'"28\'"by\'$long\'#old\'%worth&#.it',
+    '*"re&*/unlimited\'$year%#yon$(iaghisms%#bus%"el&&render%%fiore%*g&rehy;nac&+ny-en-vexin$%joies$%matre%$irel%%ollin',
+    '*"on$%olieu\'!f%"na&$hall&"ic%%rfano&%gueil%#yer$&passet$7real&ndash;ottawa&ndash/&quebec("er*!s&$uils',
+    '%#oig&4se/miraculous/female$%segur%"ho%%oreau%$weag$!u$$vale$%zalee#!u$+&rehy;ments$%ment*(\'al-size*$ised(*s/ordnance',
+    '#$wara#(y-ay-ree$$hull$"ma$%penny#"zi$"ur"\'o-nited$"oo&#ooo$#sic$*teng-genay$$ving#!a#%chers',
+    '%"ie#*d-and-mind%&change&*ontrolling%)elevating%#led%(painting&\'ictures\'#ece%(shifting&)ignalling+!s&\'pinning&*tabilizing\')imulating',
+    '$).altering$#ies\'$burn\'!t%$fied$$less$&scapes%#ter%$wing$(y-sankey%(/marsden&%scope&&tenant#%iwana#&kerjee',
+    '$\'gewante$#tan#(minpappa&%troll##n**$+-associated%%based\'"th&#eam&\'lanched&%ooted&%right&(urnished%(children&\'olonies',
+    '%%daisy\'!y&%usted&\'wellers%\'flecked&(ragments%%ghost&#irl&&lossed(!w&#rey%$head&%orned%"in%\'landing',
+    '&#ess&\'ighting%$made&$outh*"ed&$usic&$yths%&probes%&queens%$rock)"et%(shadowed(#pes\'"ot&%ickle',
+    '&%truck%\'version%\'walkers)!s\'$shed&$heel$$/sun$$boot%$uggy$$cake&"lf\'#ves%\'hildren$#dah&"rk',
+    '%%reams%#ust$"en%%y/dog$%faced$%gleam&"ow$\'ie-like\'$type$#let%$icht&)ght-blond*)encrusted)"er)!s',
+    '&(t/sunlit$#men$&quakes$$rays%#ock$\'shiners&"ot%$taff&#omp&$rike%$wept$\'touched#!o$)onstompin%$onnn',
+    '#(r&eacute$%-edge&#vil%#hen\'!y%$lake%"or%%penny%#top(!s$&atoogs$&bridge$%craft$$dale$)e-collyer',
+    '&8ish/beck-ish/clapton-ish%)/accident&)brockweir&%candy\'\'halford)%rlton\'*irencester\'(ricketer&*department(%vizes\'%orton&&former\'*undraiser0&&milton&%pilot',
+    '(#ker&*shrivenham\'&tadium\'&windon&#the\'%rader&%widow(5nslow/buckinghamshire\'(orcester%#man%$wood$$foot$$glen$"ii%%ng-up',
+    '$,land-covered(!.(!/)%rough(*_in_search%$ight%#och%!y$%stone$#top&)wn/ardboe$$wood#"sa%!i$,bruggstrasse',
+    '&$like%#jaw%&rboden%!s$$omin$&takali#&t-hill$"er$$hams%!s$"ty#&ulding$!n#"wk"\'p-heads',
+    '#)ed-riders$!y#%heads##ish&$ness#"of#\'pers-up$#in\'$"le#\'suestia$!y##top"\'quettes$#ini"$raal',
+    '$"ga$#ich$$jela$3l&mdash;allegorical%+-at-the-end&%based&%fibre&-philosophical\'(ractical&)religious&*scientific%(/ethical&&social%)e-builder,#ing',
+    '&(building&(s-olivas%"ia&"ce&(s&eacute\'%ation\'#ers(!s\'$ings\'"ms\'\'t&mdash(&ically&#ty\'(%-\'who)(religion',
+    ')%while(!.&\'zations\'#ers%)ly-decent(%sound%,s-positively$+n/socialist%$dini&5o-attendolo-bolognini%#gis%$hood%#ion%"te\'!l',
+    '%#ses&!o$*t&iacute;n%"al%"es%#uwa$)va-vardar%+ia-silesian\'*n-silesian%#sky$$wski$(y-buchan%!s$"zn%!o',
+    '%$type$)ey/former\'%mayor$!i%%dezza&!s%"us$"ry$!s$!y#$cant%!r$,enx-arjuzanx$$hard$$oast',
+    '$!a%$bito%#ncy&#ted%)unt-short(!t$$bity$&echair%#nts%)rn/sutton$&ialloc%$ford%%ngton$*kommission$&linger',
+    '%(r-bushes\'%flies\'$made\'%spell$!t$%vinov#$e&gt%)mdash;and%2rehy;or-less-equal+#ver$!*$+-attractive%$cost%\'densely&&istant',
+    '&*stablished&*xperienced%&famous&%eared&\'requent%)important&&s-more%\'lightly%\'members%\'obvious&!r%)qualified%(recently%&senior&,ophisticated',
+    '&1han&rehy;literary)$-300*(adequate+&verage*+circumspect*\'doubled*(generous*$half*)one-place*)religious*&useful,#ual/"ly1)-complete*1when-they-started',
+    '%\'up-beat$#.16%"is%\'sparing$!/%)splinters%$than&!o&#urn$"=4$3_,_you\'re_more_than%\'in_line$&cambe-%%ombe.$%fonts',
+    '$#hen$*l-mushroom%$ands%"ls&!y$2na-b&ucirc;cherons\'(original&!s%"ho%"te$%ruela$&s-they%#che\'!i&$ombe',
+    '%#que$/ton/oxfordshire%"te%"us$#ver%$ille$$ways%#ood#$feld\'"en$"it&!t$#lot$#ord$#ydd',
+    '%0n(1818&ndash;81)&$-bzw\'(grampian)&enfell\'%jones\'$owen&+/bandmaster\'*contestant\'&garage(.loucestershire\'\'organic\'%rover\'%vicar*#tim)&llager',
+    '&"ae\'\'tically&$ites&%moore&$town&"za%$rten$1enl&auml;ndischen\'#ied&\'savisen$#lay$#rim$$uard#$hall%#nge',
+    '$#enn$(ogenesis#&iarity&#tys%!s%#tou&!y$\'bundity$&cizine%%onium$$endi%!r$$fing$#hei%#iro',
+    '$$moto%"ur$#nga%!s$!o%"ka%!n%!r$!r$$sawa%"co\'!s%$hima$$tura$%yoshi',
+    '%"ot#$kin2$$unas#\'l/world$"ai&!s%#nmd$)e/husband&$wife%\'y-minto&%/bass\'\'central\'&penman((rogramme\'&thames',
+    '##man%"or%"rk$%esnil$$orar$$yrid#&n&rehy$"er$$in\'s&+g&rehy;room\'&-about(&coated(\'dressed("it($peak',
+    ')#tar($that)#ime)&uesday\'".6\'!/(/afternoon&mdash1(/evening(\'evening(&friday(\'granada(%hitch\'!e\'+s/ploughman(#uit',
+    '$"ng#.occan-occupied))sponsored)$type&*o-portugal\'!s%$ocha$$ever$&kvasic$$lity$&n-free%!/%"ov$!s%)e-looking',
+    '%"ov%"us$!u$$zkin#%perth%#th-(4bedlington-ashington$#fee$+h-evidenced%%adate%!e&(me-based)%final&"ts%$inae',
+    '))requiring%&noides%-o-syntactical&+genetically&,histological&/logically-based0)different&#mat&(phonemic&%space&(tectonic%*y-schrufer$&orkian#"ra%!b',
+    '\')/managing%!n$"in&&sville%.s&ndash;jenson&&-jones\'$like\'#men\'$type&\'/author\'(bodenham\'!e\'&farmer\'\'general\'&jockey',
+    '\'*narcolepsy\'%piano(%unter\'\'richard\'%sspca(\'taunton\')zoologist&$burg&"es\')y/british&!h&#man\'"en&/on&mdash;stated(%-bell',
+    '((/breeder)(nuffield)%roger(%esque&(sey-marr*%style*+worshipping$$ocan%"ws$%sleib$"ys#"sa$$burg$-e/boatbuilder%&aholic',
+    '%!s%!y&!.$$head$#ite$!o%$leum$!s#\'t-safes$&agages%#li\'\'!a\'#tie(&y-rate%)r-bearing',
+    '\'\'flashes\'$rich&,a-cardiodata&%board&$less&#man\'"en&"s.\'$/etc&!y$%cloth$$ella&!s%$mart%#nes',
+    '%!r$)gage-free)&holder)&lender-#ing)&payers,#ing*\'roperty)$rate))servicing*&haring($able(+d&mdash;the(*e/litigant(*s-to-rents',
+    '($ware\'%or(s)&"te$#ham%%waite$\'ice-key&,ian-embalmer)+/beautician%"er%$lity$0lock/oxfordshire)$road$%main\'$+on-in-marsh&\'/barrus',
+    '\')do-it-all&%esque%&rcycle$,uary-complex0"es%"um#1uisg/ceannaichean$!m$"na$#zzi#$veau%*rn-cabrach$$illo%"na#&weiler',
+    '%!n&!a$#ood#&y-tnte$#sse#"ze%!m"$s\'ly#!a$#ic-\'%based\'\'covered\'%faced\'$like\'$this',
+    '&#ism($t(s)&#ked&"s.$%ndrum$!t#%ca.if%#ryi$$haia%#ini\'\'o-style%"oi$"om%"ni%"so',
+    '&!y%\'w&mdash&+-controlled\'-on-the-hudson\'%paris\'(smolensk&#/st&!0&!a#"eh$#ism$,ley/prisoner\'%47pts%#ing%"la',
+    '%$like$$ying%!s#%gladh#%h-pit$#anu%$rraf$"in$$kids$#ood$!t#!i$"ac&!s$%manns',
+    '#"jo#\'kalenko&"ik$+enes&ouml;y$%insky$"os%$vicy%$witz$%vitch#"le%"m-\'%based\')dominated\'*influenced)\'habited',
+    '\'#led\'(occupied\')populated%$yite##mol#$olov$9nmagyar&oacute;v&aacute;r$!r$#tho$!w#+que-burners\'#cap*!s%"in&#to\'',
+    '*$olts)#net,#ted($fish((infested#.s&rehy;covered$)-bedecked&#lob%(campions&#lad&%oated%8feather-and-shit-covered%&garden%%heath&#ung',
+    '&&tained%&veiled%%woven$!/%.chairman/dover%(daughter&)epartment%&former%/gloucestershire%+oxfordshire%\'pascale%$race%)transport$%adeqs\'!s',
+    '\'!w%%itbeh%!t$%balls&"nk%&orough$%croft$&elmans(#rkt%/nd&ndash;severn%"tt%$veld$$gate%$rove$!i',
+    '$%lands$*on/glasgow$\'todloch%&rooper#*t-affected%%cited&%ommon+"ly%(deprived%&easily&*ffectively%&feared%%hated%"if&(mportant',
+    '/\'succeed&$oved%,photographed&%layed&%olite\'%pular%\'readily\'&cently%(talented&"wo%*up-to-date%&wanted&%idely$\'/fewest$$aard',
+    '%%ganem&$edda%"ig%#rda$$bank$#efa%!k%"rs$)faculties$#ini$"le%+y-christian\'*developing\'%eaten\'\'foreign',
+    '\'$zulu&!.$$ovoy##win",t&ouml;rhead#%-type$3while-u-wait-garage#%aball%0ility-registered$)cillidae.$#dor$&guense$"la$%parts$!r',
+    '$!t#&e-like$!j$7l-supermarket-hamburger$!n$!r%"am$&t-like&\'passion&(settings&$type&$wise%"ti%!z#&h-ball',
+    '%%holes%%mauve%*pollinated&$roof*"er%$wing$\'battled$%ecome%6r&ndash;and&ndash;baby\'0rehy;fornicating,(of-three&"-a($lbum(1nd-child-on-beach)&ything',
+    '\'$bird\'$deaf((ominated\'+f&mdash;ing(+ather-child(&ixated,$ions($lesh(#oal)$etal\'#god\'$have(%umper\'%image(5n-law/daughter-in-law',
+    '*\'waiting)&stinct(!s\'\'knitted\'%naked\'$of-3*$nine*$pear.\'l-lined/"ed/!s*#six+&o-many*)the-bride)\'fspring',
+    '(&ut-law\'#she(&itters(&ubject\'\'tandana(&o-baby+"e.*%child(#ype\'#wit()orshipper/#ing&\'/foetus\'&infant\'&virgin',
+    '&&board.&\'complex(%untry&#ers&\'f&mdash-$;ers\'(ucker-in*#in\'(%nkers&%hoods(#use&&in-law&$lode\'*y/sisterly&$s-in',
+    '\'$dill&&tongue&%well0$%ibeli$"ly$%proof)"ed$"ra##ier$)f-centres&(grounded&#run&(specific\'$tyle%!.',
+    '&$unix&!x$&lities\'"y.$*on-control\'(pictures\'(sickness\'$work&%house&&lessly$!s$"ue$!v%"al&$tin\'',
+    '+#the*!.*+/commitment*$ally%)e-hunting\'%power&*less:anger&\'s/goals#!l$#ana$)ey-haired\'(panelled&#ana&"ed#"o-',
+    '$-b&eacute;cane$"ji$#koa$!n%\'autique$!o$\'r&pound%!-&(activity&+bike-riding\'$uses&&cicles\'$oach+"es\'$razy',
+    '\'%rives&+engineering&%force&&glider,!s&%habit+!s\'$omed*!s&(industry&\'lorries&\'madness\'\'echanic\'$oths(#uth',
+    '&#oil&$pump&&school\'&ensory\'$port&%taxis\'#yre*!s&#van($tion\'\'ehicles&#was(!y%&/blade&$lead',
+    '&$pump%!9%!a%+bike-riding\'$lity%%caded\'$mper\'*r-mountain($avan,!s&#ity&\'ylcists(#ing)"st%%drive',
+    '%!i&"al&*c-gestural&"ne\'"g.(&/ferry&#st.("/3(*s/glasgow/&$zada($tion%$less\'!t%\'ola-ibm($/ibm',
+    '%\'s-cycle\'&toyota&%ailed&&cooter&#how&$ists&\'peeder.%%wagon\'\'y-users(%s.but*&police))/highways&#eek&$omen%$yway',
+    '%%aledi$%trist&#ola$*wn-fuelled##ril#%samai$(on-style#)t/concert$$aret&#one$,e-and-bailey&&bossut%#cts%"ly%!r',
+    '&%shead%!s%"tz$&istone$!l%\'e-faced\'&leaved&\'d-green($hued(%stone&!s%$ing.(!s$\'o-theme$!s',
+    '#$ueka"&uaffak$!t$#yad#&bandjo#$cani$%harte%"er$$lade$#ure#&derris$#our#"er#\'ffetard$$lant',
+    '$"ti#&geotia$#hal#%hamed$(roussine#*ill&eacute##jik#&khtara#)lainville%!s$"d-&&boards(#xes&)encrusted&\'fronted',
+    '&)spattered&%taste%$able%%board%$cast%*ed-plastic&!s%$iest&$ness\'\'g-power("s.&$warp%)y-looking\'(smelling&$warp',
+    '$#ham\'!s$(i&eacute%$neuf\'"xs&(i&eacute$\'mein-ye($gyun$%sdale%"ey%$ford$\'t-sites#\'n&mdash$!a%!n',
+    '$$cher$*d-building&$folk&$like&&shaped%!.%%iness$!e$#ier$$ment$#qid$$seys$(t-temple%)/charlton%"ai',
+    '(&-brook*\'uilders)&caused)(designer1!s/#ing*\'welling)$fold*&ringed)%giant+%rdled,!t)&hiking)$like)%peaks',
+    ')%range)$side*#pur*&treams)\'walking().although*!s(#/in(&bikers($call("ed("s.($town(\'walking)#est',
+    '%.batten-windsor&%enger&$oard*!s&%riand%\'charles&&ollyer%#ed\'&#ney&"rs&$vans%$fern&%ichet\'%tchet&*ord/social',
+    '&(ng-steps(%block&"ve%$joys%\'mellick&&ichael%)pottinger%"s.&"ey&&hannon&&tewart%&vernon&#iew##rie&!s',
+    '%"ri$$jane$%nacre%+er-in-chief\'$less%$ings%#yng$#ton#%saios%"vi%"wi$-e&rehy;driven%!\'%!-&%alert',
+    '*\'windows&%based&$cell\')ontrolled&#ear(#ten&%faced&$grey&%human&,in-a-blender&$mats&(operated&\'related&)sensitive\'$ized',
+    '&%worth%+/long-eared%$hold%(organist%\'queteer%$tail&%richt%\'y-brown\'(coloured$&hourgi$"ie%$ness&!g$%kouri$#lah',
+    '$%salli&"nt&*vi-ardebli&"wi%&e-pink&$_for&#aux&!d\'#-up&!l\',ines-de-soie&#tte%#oro%!y$%tacio',
+    '$&y-grey##tan%%rdier$\'h&ndash&*rehy;organ+%piece+(waterin\'%!\'%!-&)breathing)!d(&ooding&\'coating(%rners(#unt',
+    '&#fed\'&illing\'$lash\'.ull-of-marbles&$held&"in&\'melting\')icrophone&&organs&%piece+!s\'&ulling&*to-genital\'$usks&$walk',
+    '\'\'idening%(:estuary&&source&$then%(breather%$feel%#in\'%$lock%"s.%*wateringly$#ome#&vemens((t&eacute#$yabi""v.',
+    '$#hed$$tnet#\'e&mdash$!\'$(-by-move%#ons%"up%$when$!.%!i$#/we$"_a&#way%$over$$d.as',
+    '$,ment-centred)-dance-fashion*)emocratic)%fatah))performer)%types(!.)&during(&/birth)%dance(#ist(-s&mdash;filip)$/day$#rly$"s.',
+    '#)ie-acting&$bred\'&uffish&&camera\'\'hoosing&%drama&*engineered&$goer&%halls&$made&&person\'(ublicity&&screen\'\'tealing($udio',
+    '%%drome%%going%$line%%maker(#ing&%iento%+s-on-demand&(/popular&%creen&!t\'"ar%$town$#ng-\'\'average\'#but',
+    '\'\'picture.!s\'%still\'%water&!i$#ola$$star$"ta#$ment$&od.fil"&waffik#+bray/celtic%"ey#$cher#.er-conditioner',
+    '#$hawk\'!s#)ing-miles#$lana$#ine#$mows#&n-tine#%rning%#yng")x-burning#!a#"ey%\'/friend#\'on/club#"xi',
+    '#&cullen##dog##ens$"rs#&gashel#&heddin$"un#!l$0an/millar/davies$(e/victim%"na#!n$1e/gloucestershire##ses#$tura',
+    '"&zaffar$%rt-an(&usgabe\'*connection(%zerny\'&loving\'$year&%blick&$eans\'\'um/vegh&$iana&&kugeln##dok#"es##kin',
+    '#"za%&rellas$#ery$"ie!$p-1s"$.the"!/#$arts#-barrister/had$#ill#(chairman+\'/social$(ommittee#$food#\'general',
+    '#&higher#\'lib-dem&#dem#%nacro$)orth-east#"pc#(scottish$&ociety$$pace#*technology"!4#"/8#"25"\':112&gt"$aiac',
+    '"!b"#c-e""dl"-eg-compatible%\'encoded#$lela##nde"/g&mdash;ecology#!3#!i"&h-plus#!.#%/kts.#.il/msc/diploma%!s',
+    '"(la-unita#!d#"ot""mg"#pda#%o/ppe""sa#!c#!d#!k##tat#!v"\'t-based#!f"&ushini',
+    '"!p"!s!1r&aacute&ccaron;e"#.2c#\'a.south$"nd&#rew#"b-$(leasdale#%colin%%rmack#%gibbs$$reen%$oves#!j',
+    '$%ulius%%stice#(knopfler#%logan#(madstart#\'rifkind#\'speaker#$tony"%/miss\'!.$*rs/miss/mr$!s""22#!4#.6/8cc11/e6/c12',
+    '"$8220""ad#"es#!p#"ss##vak##zek$$kova"!b##200#!i"%c-600#!c#"gp#"og',
+    '%!d""dp"!e#&asured",g&mdash;left##ins"#isc"$kela#%onjic"!l##ang#!s"*na-derived$!.#5jav&ccaron;evi&cacute',
+    '#!w"$p-14$!8#%harms"!r"(s-peters#+.mcnaughtan$(saunders##/mr#!a$$s/pa#!s"(tlakatla#!p#,va&ccaron;ki',
+    '$#son"!u""vs"!x#$2120!\'s&prime"#(s)""-4#"80#)dos-style\'\'to-unix&\'/dr-dos&"es#-windows-based"$.733',
+    '"$/dos#&mrs/mr#%w/166"!1#!0""20#"22#"83""43"!5""84"$a-aa#$/itw#"ns"$boro',
+    '".c/postgraduate$"ta#!s"%d/sms#!e#!f#&os.sys%)/hardware%%1.pcx"%ec/hg$"s.##itw""fl")g&ndash;3#%-free',
+    '#!s$#ize",h17&ndash;41"2i-dn&mdash;italian#!.#"da#"ka#&mulizi"(m-labour$*mlp-backed#!p""nd"#omi#$nthi#"s1',
+    '#!d"\'s4-mss7"#tic$"nd"#up2"&v/hour##ibm"!x"#zdp#"mp!#t+1#!3"#-86"(.herbert"!1',
+    '"#719"!8#!0""a1#"re""bf#!s""cp"+dna/nuc.dna)$lear"#ef1%#-13&"20##nsk#\'romedia',
+    '#$fele$"pg&*lqefelaptm$!t%"mg"%h/msc#&akathi#"th"%ikila"!k"!l#!g#&surrna"#olo#!s',
+    '"\'ssurrna"*v-approved$(friendly$$rock$*unfriendly!*u&amp;sup1#-circ;nchausen#2scaron;i&ccaron;ki"&\'ajjiz$$llim$$sher$(yyadiyya##lud""-2#*negotiated',
+    '#"ml"\'angchai%$undu#!r#$sher#"ve#$wiya##yad"%badir$"ko$)raklabour"#c18#%cioli##els#!g',
+    '*%loved*"or**plagarized*)ridiculed$)-abridged&&dapted&&mended&"nd%(ballyhoo&%igger&\'ranched+#ing\'%uited&\'uttoned%%cared',
+    '&)elebrated&%hewed&(ollected\'$pied\'%vered)#ted&%raved\'%eased%&danced&\'etailed&)iminished\'&sarmed(%liked(%puted\'%vided',
+    '&\'nhanced\'%joyed&\'steemed&)xcoriated\'&panded%&folded\'&stered%%hated&(oped-for%9improved-but-still-trashy&(n-demand\'\'cluding\'*vestigated%$less&$ived',
+    '&%ogged%)mentioned&,isunderstood\'#xed&%ocked\',re-than-food%)neglected&$oted%+operated-on&)rnamented&(verrated%(parodied(%roted((titioned&)ersecuted',
+    '&(ractised\'(escribed)#sed(&viewed\'*o-japanese&%uffed%)qualified%%raced&)ecognised)$rded\'&formed\'\'hearsed\'&marked(\'embered\'&paired',
+    '(&rinted\'&sented\'%vised&%idden(&iculed&%ubbed\'%ffled%&salted&&ighted(#ned&!o\'$ught+&-after&(poken-of&%tated',
+    '&%ested&\'he-same\'(ought-of\'(reatened&\'ippexed&#old&\'rampled((nsferred\'\'easured\'%usted%%vexed&\'ilified%&washed&\'eakened&$iped',
+    '\'(rshipped%$xxxx$!.%$they$)/avoiding%!i$#_as%#due%$sort$$acho(!s%"me&#ore%$ngos$$emwa',
+    '$"ly$$nick$"os$#uri#!i$$anus$!s%!a#"k-%+and-bullets%%carts%)encrusted%#out%&rakers$&amucks',
+    '\'"up%"ry$#ily%"sh$"la&"nd%\'ebackit\'&erries$$more$%raker%"ik$)spreading$#ton$)y-looking%#ard',
+    '%!i#!o$&coeles$#gel$%lysis&#tic$(proteins%\'urulent$"se$#usy#&ranoid$%onata#)us-coated&&filled&\'mopping',
+    '\'\'hedding%%/bile%"al",d&rehy;caked)#dle)%glide))spattered)&walled#!-$%baked&"rs&#sed&"th%*espattered%%looms',
+    '%&rained&%icked%\'uilders$\'channel%\'urdling$(dwelling$$flat&%oored%&ringed&$ozen$%holes&%ppers%#uts$$lane%#ine',
+    '&!n&"sk$\'patched%"en%&robing$\'scathed%$lick\'"my\'"ng%%odden%\'plashed(&ttered%\'treaked%(upported$&tracks',
+    '$%wedge#%affar$"le$"ne$$ssar$$vadi#%bound$#ugs#$cake$$loud$&racked#&diford%!n$)le\'splans&(d-headed',
+    '&&headed&#ton%+ing-through$"us$"y-&%boots(&ttomed&(coloured&\'looking&%water%&ing-up#$ejar$!r%+rises-those($liks',
+    '#(fingered$$laps&!t#$gley#$heap$,oney/flaming#!i$\'e-smith#%jicks#\'larkers$#ine#$ogas#$pond%#ols#)spattered',
+    '$8tone/siltstone/sandstone#$thir#$uuli#.water-medicine%*y/landlady$%immen$#ort$\'restler"$ecke#$hlen%#str##las$$ler.\'$ious##ndo',
+    '%%inger##rto#(sli-belt\'#mix&!s##tsa"&fakose#$fin\'$$led.\'"ly&#ton$!y#$ical$#osi##son',
+    '%!c%$leri&.ik-essentially)"he%&s-give#%undis"0g&rehy;govertski#+-and-snatch$&houses$\'photoed%&unters$%shots#\'.ruthie#!a$!l',
+    '#\'earites$#ndo$#rwa#$ford#"ge%$d-up%\'rhanger&%idges$#ies%$ness&(g.victim&#ton$%lesby\'$tone$%ridge',
+    '%!n%!r$"la$"ul#\'iraneza#$mate$"er##ney$"oz#"ot#$rabi&!y$\'onensis##s/5%!6',
+    '#$wump\'#ery"!h#%abura$"di$&iminul$-jir-populated$#med%$madu&(ed-rafiq$%rnmad%(ram-rabi$#yaa##eim#%iddin',
+    '#!l$%bauer$$feld#"ri#&yiddin"#ice#\'derberg&%poort#!l$&enburg%!r#$nane$#ish$#zer#(r/victim',
+    '$#den$%heads&&vnamor%+ouse/animal$/kirk/strathaven$"on$&shield$#ton#+tinationals$!o#\'zenburg",j&eacute;dar#%adedi$%hadin%0eddin-controlled',
+    '+$held+(occupied*$said\'#in\'%$idun#$eres$\'zinovic##ica%!o#\'jahedin#&tahids"%kalay##ela$$rjee$"sh',
+    '$#ida$%ortov$&riddin$$tara#"is##oko#\'tananda$"uk""la$"go$$rkey$#tov%%resse%#tas$&zemets',
+    '$1erry-almond-bread)%black)$eyed)#red(!.(!s$$ooma$%ridge#$care$"h.%!y$"ts#$daur$!e%%rgate',
+    '%#ons%"va#"e\'$\'-headed%$kick%%lines%(spinners%%track$$back$$kewe$#mba$#nga$"s.%&pinner$!t',
+    '%$rain\'!p$!y#"ga%"ra$"uy#%haupt$$earn%#ran&"ne$&ooleys%"us#$ican$\'er-lyer&!i',
+    '$#kai$#mba$"no$)tilateral%%media%&onovic#!k$%earns%%rrins#%ladry%"gh\'$bawn($rack\'#fad\'$more',
+    '&!y%"ne\'!y&!y%&ppally%%rdoch&#key&#ney%%villy$&donoch$\'ed-wine%#ins%%nbach&-heim-rechberg%(r-hansen',
+    '\'\'thurgau&\'/stroud&!s&#tii%"ts$#hil%&olland$&icking%+n/hungarian&1gar/limerick/cork$#ner$$oney$%uscan$$ycar#"ot',
+    '\'&yprime%$oney#"sh$"im#!t$$alin%$tuli$%hampt$/i&rehy;collared+(flowered,#uel-(nctional+*generation+%media+\'plicity',
+    '+$volt%&-80486&"aa\')djustable\'"id($sled\'%ngled(&tibody\'%rched*(itecture(!m("ts\'#tom*"ic\'$ward',
+    '($rrel(%ttery\'#eam($dded(!t\'+illionaires-!s($rths\',loody-storey\'#oat("ot\'(racketed\'"us(!y)!s',
+    '&!c\'$ache($mpus(%pable(#ste(\'usality\'"el)!l(%ntury\'&hamber)\'nnelled)&pelled)%rgers(#ips\'&ircuit',
+    '\'$oach)#ted("de(&lumned(&mmunal,!e)(partment(*nfessional)\'tractor(%uncil\'#rew\'*ulturalist\'\'ylinder&(debugger(%cadal',
+    '($vice\'&ialled($bber(!e(&rected(=sciplinary/inter-disciplinary/"ed(%vided\'\'ocument(!g("me\'%rawer(#ops("ug)!m',
+    '&(electron\'%nergy(%gined(\'tranced\',stablishment\'\'uropean\'$vent\'+xecutioners(&posure\'(yeballed&(facetted(%rious\'#eed\'\'ingered)#ned',
+    '\'%lange(#oor((y-overed\'&ocused("ld("nt($rmat\'$ront&#gas\'#ene\'$rain)+mmy-winning\'$uess&&handed\'%ooded',
+    '("st(\'usehold\'$ulls(%ndred-/-million-dollar&#i/o\'%ncome($farc(\'jection((strument(+ternational++pretability1"le+#val\'%ssued',
+    '\'-urisdictional&#key)$word\'%iller)!o*$gram\'&leenex&(lamellar)%inate(#ned)&guages(\'terally(&uncher($yers\'"et',
+    '(\'nearity\'#oad*#ing(&cation)$king\'#ung&&market,#ing(&terial\'\'egawatt(#lta\'.illion-selling("nd($rror\'$odel',
+    ')#ule(%nitor\'0ulti-millionaire&#nat)\'ionally\'#eck(%edled\'(ucleated&&occupy(%topus\')pposition\'\'rgasmic,!s\'&utlets)#put',
+    '(#ned(\'rameter)#cel)$tite("th\'!c\'&entium(&talled)(ticoated\'%hased*"ic\'$iece(!n(%tched,"rs',
+    ')!y("ex(!y\'&ointed+!s(#lar(%rtion\'\'ractice(*escription(%ocess-"er)\'tection&(question&"ra(\'cialist',
+    '\'\'egional)\'ulating(\'ligious((searcher\'&hyming)%thmed\'%ibbon("ng\'%oofed)!m(!w&&sailed("ve\'"bu\'%chool',
+    ')#son,"al(\'gmented($rver*!o(!t($xual\'%haded)#ped("ot\'$ided(7gnal-scrambling-decoder,!s*!s\'$kill',
+    '\'%ocket($urce,!d,!s+#ing\'\'pectral)"ed(%indle()lendoured(%onsor-"ed)$uted($read)&outing\'$tate',
+    '(#one)$reys*!y(&randed)#ess)#ing*#ped(%udent*"io(#yle\'&uckler\'(witching\'\'yllabic,"le("nc',
+    '($sker\')echnology(&nanted)#ure(&rminal)$rain($xted*$ural,"ed\')imbrality($nted\'&oothed\'%racks)%ining((eatments',
+    ')#bal),llion-dollar)!p\'&wigged&%users&%value(&riable+"te\'%enin\'\'%ision(3tamin/multi-mineral\'%oiced(%ltage)$umed&$wave',
+    '\'$ings("re\'#ork&!x&\'zig-zag($pped\'$onal%(=sensory%&acinar\'&tivity&&nalyte\'$nual&$xial%$ball\'#nco',
+    '\'"se&#eam&-illion-dollar,$aire&$lade\'$ooms&\'ranched&\'usiness%)catalytic((egorical\'$ulis(#sal&%elled\'%ntred\'\'phalous',
+    '&&luster&%oding\'\'llector($ored)#urs(#umn\'%mpost\'+nglomerates()stituency($tact\'"re((poration\'%untry\'#ver&2ultural/antiracist',
+    '0!s,#ted+!e,!d\'$rsal&$yano\'$cled%(database&$igit\')rectional\',sciplinarity&#rop\'-ug-resistance&&ynamic%&enzyme',
+    '%$face)$tted\')riousness\'&sciata(&teners&*enestrated&"id\'"le(#iis\'!t&#lex\'$oras&&ormity&#uel%%gamma',
+    '(!m%&hulled%\'infarct%.jurisdictional%%label\'&terist\'$yers&"ex&$ocal&"pe%)malformed\'$rket&,edia-enabled\'#lta*!s',
+    '(#hod&$icro*)processor&"od\'\'lecular\'#wer%#nat((ionalism&!g&&odular\'#tch&&uclear+"te%%organ%!p',
+    '\'!g\'#ras*&itized($tner\'"th)$ogen&%edals\'$riod((sonality&%hasic\'$oton&(laintiff(!y\'(e-aspect))barrelled',
+    '*#ell*(riterion)\'ditched)\'earning)$file)$host)+instruction)&launch*#ink*$ocus)$node)(occupied*\'stinato*&utcome)&person',
+    '+/incipal-single-)$reel)(scenario*&ession*,hots-to-kill*%ource/!d*#tep+$ream-"ss/"es)\'threads)%units*"se)$view',
+    '(\'.choice(!d(%s/net)(clerosis\'%icate+\'ion_and(+er-quotient\'+y-ambiguous)(deprived&"oe\'&larity\'#rts\'*tentiality&8rocessing-on-the-desktop(,grammability',
+    '&#ule%$rail&)eflective\'\'sistant%%savas&%creen&%erver&$igns&&ources&&peaker($cies\'"in)#dle)#osa&\'tandard',
+    '\'#one\'&randed(#ipe%$talk&%iered&#ool&0ubular/watertube\'*dinousness\'$fted%*university%\'variant)#ous\'%tiate&(ibrators\'#ews',
+    '\'&tamins&$ocal%$ware\'!y&#ire&$orks$)lnational$%ocida$&phasic%#ile%)rocessing$%scher$#ure$"yn#\'ungushi',
+    '%"ui#%vaine$$ille#$well"*m&rehy;ble#+-in-the-mud$&of-one\'#six\'%three##bai$"er$!i$)le-mumble&&mumble&!r',
+    '#!f##ias$!r$"ya##mee&"ee%%rsett$#ify$!m%!y$(ummummum$+y&mdash;you&+rehy;shaped%&-beads&%cases',
+    '&&shaped%#ish#"on#-s-the-worders$"ie#$ured""n.#!a$$jjid$\'vvarsho$#wir#%ch\'d.%$able%$ency\'(gladback',
+    '+!z&!e&#ngs\'\'hampton&!s\'#ter%\'kinland%\'mallows\'#tes$"ro#!d$!e%!e%*ll-fleming\'!s',
+    '$$ford$#ham%"ir\'#iya$"ia$&ugamor*!e%"la##eeb$%mitsu$!o$"ss#$gala$#ers$$indi',
+    '%&isdale#$hepe$#ill#+i-mimickers$!a$\'cations%\'hhausen&\'oodappa&"re%*ipal-tiled)$dec.)%ising+!t*#zed)+ly-employed',
+    ',(provided\'"es\'"ia%#pal$"er$%menta$!r$&tions.##kar%(vallaloi$%berry$$edal%$jord),(h&ouml;yre)$#ley',
+    '#\'n/clerk$!i%"ng$"ot#"ol#0ro&rehy;swopping%(-bagging%!.%"es#$sell%!n$$hids$%ingen$#low$\'terberg',
+    '\'%lager\'#man\'%walde#&tasser$$ingh&!s$!z##uel$#mun#$zing\'"er"\'okkeris#+n-catalysed%&fusion$!g',
+    '$#ome"%panga$"ta#!c#+pet-creator\'%style"$qbil#%uwama"-r&rehy;muring#%adiye$"ki$\'l-sized$#ngo$#oka%"ur',
+    '$#sad%$chko%"hu%#oli$"ti%%orian$,vev-amurskii%#iev%#shi%#yev$$wski$!y%#ama$#zzi#%barak',
+    '%&ertach%%inson$#ian$!o%.tt/oxfordshire$#ray##dar$&er-let\',manslaughter(#ore\'%sites(&olving\'$then(#rap&(/robbery',
+    '&%:jury\'#was&#ed.)\'parents(\'/german\'!e\'"r.&+ous-looking$&huacha$"in$)o-foolish%)ch-bought\'!s&"ks%%stoun',
+    '&!s$!y##egi$"na$!r$#san$#tto#%field%!n%"tt#!g$&atroid(&yd/flu$%hetto%"hh',
+    '#!i$$aldo$%cacea)!n*!s&"ta%$idae&"na$%el-ae$!n$#qui$#son#\'keyside$!s#&laggan',
+    '%"ss$"is$#one##man$\'istrova$$ours$#ur.&"es&%ingly&%ously##nay$"ey#!o$&culous#)phey-corb',
+    '%&y-gibb\'*v-bradford$&ratomo#%qanas##ram%"nt%#val%(y-browne\'&leslie\'%smith&\'/cancer\'*eyewitness\'\'manager(%ercer(%other',
+    '\'$west&*government$!e$#ick%!d%"on$!o%!w$(umbidgee$\'ysville#!s$$ells$\'hidabad$#ley$!t',
+    '%!z$"er$#her\'"er\'#ing$&onpark$"ra$*schenstock$$wick#"ua#%viedo#)willumbah#$yans#"zi"2s&eacute;e-galerie',
+    '#%.bac.#$achi$$ffah%\'irkhana$"ka$"le%"ia$%nadam%#dam%%nifek$!s%"hi$#vat#\'cadelle\'"ts',
+    '%#ris&!l%%telli$+hamp/driver$\'ianship$+le-boosting(%rains\'&corded\'\'flexing(&orming(#ree\'%grass\'\'hugging\'#men\'&packed',
+    '\'%roped\'%spasm(,trengthening+&tching\'\'tensing(#one\')withering((renching&!.&(/nervous\'\'skeleto&#boy&#dom&"s.$#oli',
+    '%)viscidose$!u%-lar-glandular)(skeletal($ized\'$tory&(oelastic#(e&eacute$&-based$#/1e$#ale&\'isation%!u$"d.$"li',
+    '$&n-lust%$sohn$(ographic%)logically$!u%*m-oriented\'%piece\'$room\'%world&\'.behind&\'/london\'(northern\'&planes&\'ization&$like',
+    '\'&bilder(#und\'#hip\'%insel#$hala%!m$#ega$#ies%$ness%!r&"ul$#kat$$rome&0om&rehy;coloured()-and-tofu',
+    ')&filled*(lavoured)\'hunting)\'painted)%shape*$tyle($/ham(!m(!y&!w$"tq$#vig#+i-technical$"al&#ela',
+    '%!\'%%-book(#xes&*industrial-!y&(king/new&&lesson&&madded($kers))ing.there\'&ingled&0parrott/taverner\'(olitical\'\'rinters&&school',
+    '("op\'$tool&*theatrical\'*o-lighting\'$ypes&$wise&$xxxx%\'.debbie&%panic%&/drama++/art/design&%hymns&#mca\'\'ovement\'$usic',
+    '&&risque&&visual&&warner%*:classical%)al-chairs)%omedy\'"ia(%scher,!s)"ed)$hche(#zed\'*ly-skilled&&ssette&#ulx',
+    '%$bank&"iz%$hall&#ips%+ian-fingers)+in-ordinary)(pianists(,/businessman)\'dreamer)$poet("is(+s-producers)!.)(/singers&$ens/',
+    '(&rooley&"ie&!s%!l&!y%&makers\'$ster%,o-liturgical\')political\'*theatrical%$room$%discs$#gny$)kalischer,!s',
+    '%&praxis%*vereinsaal$#mbi$#tek#+k-and-amber%%based%\'hunter.%$oxen$"au$$erry%\'t-balls&!t$#ier$$ogee$)y-scented',
+    '$"ce$"em$!i%\'m&ndash,);maronite\',rehy;burmese&%-born\')christian($roat\')dominated\'&headed\'0jewish-christian\'(minority\'%owned\'(sounding',
+    '&$edia&"s.\'+/christians((israelis%+n-curtained\'&draped\'$thin(&rimmed\'%white#%mandy#&o-isms$\'kotwane##que&%teers\'$oons',
+    '$)allamiyah%!u%"wi%#yib$)el-shells&!.&$dyke&+m&auml;nner\'"an&%s-for\'!.&$wick%"tt$!i%!e',
+    '$\'olimini\'0ni-meets-foghorn)!s%$orie%%rgksy\'%skian%$urie$+y-sur-seine#,t-make-money%#not%2see-at-least-twice&$igns%#try$%aches%"dd',
+    '%"gh%#hil%#jew(!s%#kil&"ov%!q&#bal&"im\'&people%(rd-based($gold(\'plaster(\'to-shoe(&yellow',
+    '\'"ed\'"ly$!e%#lae%\'r-point\'$roll\'&signal&&ed-out&!y$)haveaswig$$iest%*ll/marengo&!y%"ne$#n\'a',
+    '$\'y-sweet##uem$$lman$#rus#)wellbrook#$yoka"*t(il)ation#&abilis($ties\'"ov$&gensis$!h$$lism$#min$*nt-to-wild',
+    '&$:dna$"ra&#din%"et$#sim$*tion-rates&"ve%"or$&wa\'een&#lli%#een#*ch/swindon#\'e&ndash$(-medline$(/electra',
+    '$#dly$"ka$#ly.$#mba$#nye$(rahejuru$%velli#!h$+af&mdash;er%$land%,nnatransport%$rika$#ena$$uvel##ica',
+    '$!e%!n%!s$&lators%%iated%%lidae$#mer$#nal%!i%$ying$#rai$"us#"la%!h$)i-effects',
+    '$"oe$!u#\'nodjmet#%ogens$!h$"id$"la#&ronics$!y#&samudu$#kin$!u%!o#"ta%"wa',
+    '(!.&%recht$#iah$*on-chopped+!s\'&headed\'#ish\'$tops&$chop&!s$#rah$!s$$ured#\'ual-aid()ssistance',
+    '\'\'support&\'isation(!e)!d("m\'\'(ty-equal&)ly-agreed*&ssured),inconsistent%%tions$!e$!o#%ziger"!v#"in',
+    '#$umba#)verfuckah"$xlow"$yabo%!u$"ka$&ngandu##den#$embe#$inga#$ongo##ser"%zafar#*eiktheater##iek',
+    '#%owera##tag#$ungu\'!s#!z$$afar$"er$%iness$)le-flames*"sh(#ree\'&loaded,"rs!$v.11"$1190',
+    '"!b"%d-mgb"!m#*-starpoint#$e187%"97"&oement(!s#"pl##uba"&s-os/2$#run$\'to-unix#!.#%/cics',
+    '!%w(th)""-1"!.""45"!6""ah#"le$#imu#%munga#"na%&mwalye%\'ng\'onze#"ri#!t"!c',
+    '"&eelrea"*igwithania#"la"$ldan"!m""nt"!r"!s#%-5900!$x300%!i"#860"!s"!u""v2',
+    '#"xi""y6#!7!\'y&mdash#.ndash;backside#Irehy;bod&rehy;y-in-the-midst-of-the-world"5-body-as-it-is-for-me#-dear-abberley#2flies-must-be-open#Mman-once-made-this-pass-at-her-at-a-party-but#$ness%\'wspaper#(own-good#$sake$\'terious',
+    '"(/hystery"#750")anma-thai#%tavyn$!t%,/association&(licensee$&yalyay#&ungmya"1bagswithfivedozen"%c+myc#$-myc##73-##92-#$arta',
+    '\'!l#$hell#%lomas#+o-bacterial%\'protein$,bacteriaceae+%ology$"ck%%risin$$denz$#lic%$ogia$(phenolic%*lasma-free%*rotein&reg',
+    '$%taxon#%teria"\'ddleton#"ir#&riasis&$tics"&ectomy#&linate&\'isation%#tis$(oblastic*$osis%+cytomatosis%)dyspastic)&lastic',
+    '\'%tosis&*eningocele%\'poiesis%+suppression#*rs-written".ftiu&mdash;had#\'yrdodau"%hamet##ras"$inge%#yan$"t*#$tkya"#kel$%rinus',
+    '(%olmur#3osowska/interpreter$%tronx"#lae$$pore$#yne#%esand#"ia$"us##lin&!g##nes#2onite&rehy;bearing#$ward""ma',
+    '#!o"#nas#%dmill##edd$"rs$$tere#"om$!s"*o-feedback#%blast#%carde\'-ialinfarction(!o)%pathy$%risin',
+    '$"-1$!1#*epithelium#)fibrillae)!s\'+oblast-like#\'globins)$uria#\'logical&!y#\'metrial("um#&ngdong#"ol#\'pathies',
+    '%&ptides%!s$2ically-therapeutic#)scolexids$%phere#"to%"my%#nia"#pro"$raid##cha#%ecord$(mecology%\'ocystus$#sjo',
+    '##fyn#,iad-coloured\'&headed&"ic$!l$!s%$tica##mec&$odia\'&philes)$ytic%$leon%!x$&icacin%#don',
+    '#*rh-scented$#our#(sinaceae#"th%!o$&ifolia%#llo$!o%!n""se$!l%!\'%)f&mdash;a&!-\'7as-child-and-adolescent',
+    '*,sexual-being\'!i\'$king(#new\'$that(!o\'#was("ho&)_a_little\'&rather#$hkin#"ia%"ns$"ds#"ov',
+    '&/grave;re/falcon$&acalis%$gogy%!i$&erians\'!e\'!o(*usly-found\'!s&!o\'$usly&"y-()mechanism\'$_out$/ic-priest-saint',
+    ')(sounding&#eta(!i("us&3o&rehy;intellectual\'.-technological$#ras%!e%#ops"%telka#*h&rehy;and$!\'$"-1%!2%!3',
+    '%)detecting%)exploding%$like%1of-mental-illness%(shrouded%%woven$)ago-flesh(\'genesis\'%scape$\'builder$$emes%!n$-ical-sounding&$iser\'$zers',
+    '$!o%%genic%&logers(1ical-cosmological,"ly)&sation*!t+!s)#zes($y&gt\'$qies%%mania)!c%&poeist(#tic',
+    '%$pent#%ilene#"on"%ungji$&yazesa#%rella".verygoodfriend"2xomatosis-infected"&zithra!"z2##50s"!a#"li"!i##mba',
+    ' An&aacute;b&rcaron;e&zcaron&iacute),m&ecaron;sti,-uml;st&iacute*&afjall*,e&ccaron;sti,/scaron;t&iacute#)circ;jera#$mp;a&!q#)uml;ively"/eacute;aoutyine)&bouzan),cessairement-+it&eacute;s)&gation',
+    ')!o)$roli*!y#&circ;e#*grave;gres)#ike#/macr;re&iuml;ds")formula;n"%gt;10%!2".lsqb;a&rsqb;ck#&t;0.09%!1&!%&".0',
+    '\'"20&!0%#300"%mdash")ndash;500(!s(!y"(oacute;s#-circ;tre-dame#*uml;rmiger"&plus;1"0uacute;menoreans)\'pscatla*"ur,!.',
+    '#+uml;remburg!+\'&ecirc;tes"6-methylenbisacrylamide#(terminus"\'appuyez#$vons"%breda"&castle#$lass#$zuan"%dayan#"ea##ula"*est-ce-pas%%imons',
+    '#%urent"&gbanda#%ender#$ollo#$urad"$heed"\'importe##ras"#kai"#low"#mix"#ont"%sasse##ont"%t\'all',
+    '+(_as_good%!t$$sort#!h"5zer&eacute;kor&eacute!$(+t)"$1,2)"$2,3)"$3,4)"%63,3)%"4)"&ch3oh)"$h2o)"&n-1)/2"#t2)',
+    '""x)!-*/n&times;100"#n-1!"+1"!2"!l"$m&ge"!t!%-0183""10"!2#"00"$5007"!7"#92t',
+    '((dopamine(-galactosamine02eaminyltransferase(,procainamide#&lkanes##tom"$band##ody#&utanol%)ilbromuro%"yl"(cadherin$!m$"ps#&hannel',
+    '#8i-methyl-2(1-phenylethyl"+e-r-v-o-u-s##ast#\'nriched#-thylmaleimide*%imide"$fold"#gon"!h"\'i-x-o-n#"ce"!l#%evels##ove"@methy-n-nitro-n-nitrosoguanidine',
+    '\'!l("-d**-aspartate1"ic"(n-n-n-no##ame$%tions$(vigation##eed$#ver##ice$*trosamides+#nes#%obody$)n-bonding',
+    '$$tice$!w#\'umbered#$ylon"!o#"-o#$ct-5\'!a#$rder"%point$"le$#wer#&romise"!r#)egistered',
+    '#%haped#$ided#$pace#%ymbol"!t#"er%.minal-specific(!s$#sts#!g"\'version"!w##est!".1#!1',
+    '"!2#!0#"83"!3#!2"(a.f.a.s.$$l.c.$\'s.u.w.t$$t.d.#$fri."$b.g.$#l.t\'!.$"m.$"r.',
+    '#&ohling$$nner"$c.b.$$c.l.$$n.b.$*o./soldier%!s#%onnor"$d\'a."!e#$.2d.$"b.&$s.m.$!c$"h.',
+    '#)marginata"$f.l."$g.b."(houghton"&i.238f$&a.p.a.$"i.$"o.$&s.b.i."$j.w."\'k.jones"$l.d.$"s.#(amellosa"$m.e.',
+    '##.r.$(w.-s.s.e"$p.l.$"n.$"w."$r.g.$$p.b."!s#\'.p.p.c."#u.j$"m.$$p.e.$"s.""v.$"q.',
+    '$"r."&y.m.r."/z.&dollar;5,000!!/"$2n+3&!+#!p"!5"#fe4##xg4""gx""ml"#svq"!v#!d',
+    '"!1#\'1020043"!2"!3"!4"!8"!9"!t!\'1-based"$.17a"$01lm##27b$"ap##42b#"pc',
+    '"%2,883#!0##1ef#!2##380#!5#*8ps/146270"!3##03k#\'8&deg;e##910#"ga##stp""40#\'1&deg;e',
+    '##89k""50##1rk##2js##798##92v"$66rs"$7223#!5#$99aa#"pc"!8##548##67q"$90dh',
+    '##37s#!5#"94"!d!$2-1o"%/n2+1#!x",01&mdash;204#!4#!5#!9"!1##57c#(9d-nylon""36',
+    '"$40ca#!6""5y"#673"$7(1)$"2)#"15"#81l"#980##931"!l"#s-5!"3."$/25v""00',
+    '#"25"$104u#!2$#316"$27uw"#406##920$"3e"$509g"$609k#"sf"$7570##611$"pa"$831y',
+    '!%4000b$"nc#"ft"$1702$!2"#389##90f"$461c"$51df#"gd"$904e!)5&mdash;6"#/40"$000e$"ln',
+    '#"rr"!5#!5$"sl#"ca"$6028"#726"#8wh!$6/20"#108"#21l##433##5cl"%4,000#"52',
+    '"%8,730##27c#"jr"$937c##66d!#7/4"$004u##57c##79g"!1#"8y#"ft""20##27c""40',
+    '##7bn"!5#!2#"84"!7##50k"$825c!$8(1)"#044#"5f"#48d"$6359##952"#73h##966',
+    '#!t"#9nw!!9"$,240"#028#"49##53r$!d"$1108##42h#"50""40##385##459#"bl',
+    '#"jb"$650n##89h#"ca#"nc"!7##915"#90l##62n"!a#:&mdash;admission/statement"/b&mdash;defence!#:18"!2""40',
+    '#"00$"35$!4##151$!8#"21$!4#"30$!5$!7#"52$!3#+6/treatment$!8#"71',
+    '#"84$!7"#2.2#"00#"11$!5#"21$!4#!6$!3#"74$!6#"99"#310#"21',
+    '#!5#!8#!9""43$!3#!4#!9"#542%"07#$8198#!9"#610#!2$)&ndash;78#!6',
+    '#"83""70#"33#"42#!6#!7#!8#!9""80#!2#!6#!7#"88#!9"*9&ndash;18',
+    '#"50""a+$%b/c-d#&/b+c/d"!c"%eight"$five"%nadir#$eb/h"#six!!_!2a&icirc;vet&eacute3";s$%uml;f(#ive',
+    ')"es*"te+#ies#$plus#-rehy;tionally"$\'-lu#"am#"im#$then"\'(hh)aew""-1##259#&albite#.cobaltinitrate##khi',
+    '%"zi#(pe-re-wa""/1#(k-atpase""20#$hpo4#!o"!4#!5"!6"!="$aacp#!c$"al#&d/lyre',
+    '$!o#!g#!m$"ah%%thite$"eh#"ns#!r"%b-led#!a$!a$%dingi$#glo$$taea("ns',
+    '%&chikov%#ean%#iya(!h##bie%"n\'$#led##eel$!r$%shima$"ul#"ie$(s-period%#co/##oho',
+    '\'!s$"re#$ucco$(shakkari#$wera#!y"%c-the#!.#"ae$$juca#%e-yon$"ls$"tt$"ur#(hal\'niki',
+    '$%inaet$(la&szlig&"ss$*na-kuthara$&r-like%/ichtenabteilung$+schlagewerk$%tasyl%$klag%$mann%\'richten%$weih#!i$1onal-sindicalista#"ka',
+    '#$l(s)$%-0.5%%$12.5%$tris#!m#!o$\'gdoches#\'rolepsy#"ss""d4#"ab$!l$)reyshvili$"ud#$dair',
+    '%%hofer%#man(!n%#son$"na#/h-dehydrogenase##ira&$dize%!i%!s#"ja##lac$"er#%midyn#&p/gmts',
+    '#"ya##zab"&e-user#$body#!i#!l#"na#)syerugiau#$thin##vae#%where"%f-naf#%/alcl#1d/bie/cfsma/bifd/#%f-all',
+    '$"ah$"in$!s#$issa#%l96.8##naf#$ooey#!r#!t""g/$(creatine#$a-ni$!n%!a$#raj',
+    '%$juna)!n$$sawa%!e%"ue%%waram$$tani$"ul#%ement$$ndra%$gast$!r##ger&!s$#in\'',
+    '$!s$!y#$ines$"re#+le-produced%%/area&(ram-raid\'$oyal##ona$$reti%+ny-karahakh$&yqatsi#%rafax#&schmid#+u&egrave;re',
+    '$%banya$#lak$,mar&oacute;s\'"os"*h-achlaise$#een#$2po4#$alie&!n$"nt$%shion$#utl$#yan%!o&+handicrafts',
+    '$%latul##ema#&gettin##ida#"ke#"or#"po#+r-i-bihisht##tan$#ral#$uatl$"el"(i&die;ve*(t&eacute$&uml;ve',
+    '##-ha#\'adaceae#&dex\'93$#ios#!e$!a#"fs$!u##gow#%l-bed&\'itingly&$rush%$care&&lipper*#ing',
+    '&*utting-out%%files\'#xed%$head)!s&$oles%$like%&makers\'#rks%\'parings&%olish%$rods%)scissored%$tail%)varnished',
+    '%$ombs$*er-farmers&!y$#ham%$eads$%maker)\'-farmer$#ors$&s-hard%!.%\'ishness##man#&ngngan$!s#&pospos',
+    '$\'n-based$2obi&ndash;treetops\'!.$$ules%!s$#ver#2sh/gloucestershire$%sance%#ent#!t$!h#,ve-political%#ly.%$ties##zet',
+    '$"f.%#ian$"nd$"ra#!d#"in##jar#!m$%oddin##ork#$rane""ka$\'bayashi$#dai$$gawa',
+    '$!i$"ku$$maru&#tsu$$nodo&%kuchi#)ed-heeler&\'looking&*on-the-bed&\'seeming%&ness.a%!s$"ll#(hasatien$"la',
+    '#)ibulesraf##oda##ryn#"te$"og%"ng#$ugen"%landa#"co#-der/transport#"ec$"di$$vich##ini#&kylene',
+    '#%umino$%sanga"&m-chun$#set#$.typ#%2.typ##aaz$#dra$$giri$#lwa$#nga$!r%!a%#roi$%s/nbs',
+    '$"th%$jira#"ba$"ia%%kwara$)y-pambies##dar$!i#(e&dollar%*gt;-module($.com%%mdash*+;conveyance+&indeed%-rehy;droppers',
+    '$!-%,a&rehy;plane%%board*!s%&called\'#rds&$heck*"ed*!s%*disclosing)&ussion&#rop%&guests%&labels&%inked',
+    '\'&tching\'!y%$name&#oun%&plaque%+recognition%%saint\'"ke&&tamped&\'wapping%&tagged(!s%$vase%%words%.your-own-price',
+    '$$.and%!i%$just%\'version$!/%%model%$noun&%umber$(:atlanta%&billie%%eliza%\'georgia%%james&#ohn%%louis',
+    '$$_now$\'aphasia$#bar%$oard)!s$%check)!s$+d-character%$/new%"ay$+less/autumn("ly($ness%\'y&mdash$"rs',
+    '&0mdash;conveyance%+-in-a-frame&,particularly&\'suspect%*/addresses/&/phone&$kits&\'numbers&&titles%)=infmosrt%"ti$#tag\'!s#"ib%#air',
+    '&%ensis$#ngs$!q##jim#%keens#"ly#$oore$$rado%"ee##ron#)sraijavyn\'!n#*ti-mogaung#/urian/dinantian#"ys',
+    '$#ung##ais$&public$\'sipau\'u##bai$\'rynmawr#&chukas$"ie&!s%$fied$%lares$&y-boys#(dalbayan$%kumar$$muri',
+    '#&grahar%$eave#"ie%!l$"no##jil#"ka%"ni$%ervis$$ypoo#!n$%acara$#ick%"ed$/ofossil-bearing',
+    '+!s%(psittaca$$ucci$)y-giraffe\'#oat&$thin&%users%,/housekeeper#(o-second$*/democracy$!3$$ceph(!s%$hair%\'lusters',
+    '&*nstruction$$gram$%meter%$oles$)particles%\'lankton$%skirt#$pean#&sallas$(ie-wards$&tallon#(t-y-derw\'$glyn$%icoke$#mor',
+    '$$pose$&ygarth%%ronen#"um$#oya$"ra##ven#$yang$!o"#oac##gar#%h(aq)$(-soluble$!.$$/0.1',
+    '$!a$$ichi%)education%!s#$suke#!w#"ya$#uki"$p-1/$!5$$hand#!.#"ak$$lmed$"ng',
+    '#&e-hair#$hill$$tali%&ha/oil&\'ylamine#+ier-railton&!s$$rasu#+kin-swathed\'(wrapping#!l$#es-\'$born\'%milan\')on-hudson',
+    '#2ol&eacute;oniennes%$eana&*on&ndash;s(\'-jerome(#ism%%itain$#ule#*per/thames$"ie&!d%$ness$)y-changer+#ing&&making&$rash',
+    '#"sa%!c#$thol$"on"$qada#!d#%ourra#%qoura#%uarah$"en"&r-tans&#rns#(agansett$#ine$#nco',
+    '%#son$&simhan$#yal&"na$#zel#\'bekovis$&onnais$"ra#!c$#iso&%sism.*&/doubt)"ts\'\'us-like%"te',
+    '$*o-politics%)tic-laced($ists)$zers\'"ze$!s#*d&iacute;z$"in&!i$!o%!o$!y#"ea$#lle$!n',
+    '$!w$!x#%ghils$$irin!(onantola',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_67 = (
+count_67 = 6694
+
+heads_67 = (
     'mccarrigal',
-    'mccarry',
-    'mccarta',
-    'mccarthey',
-    'mccarthur',
-    'mccarthy-era',
-    'mccarthy/',
-    'mccarthyites',
-    'mccartney-esque',
-    'mccartneyish',
-    'mccartneys',
-    'mccash',
-    'mccaskill',
-    'mccauleys',
-    'mccauls',
-    'mccauslands',
     'mccavanagh',
-    'mccavery',
-    'mccaw/lin',
-    'mcccc',
-    'mcccclxxxvijth',
-    'mcchord/leader',
-    'mcciarnon/duke',
-    'mcclacklan',
-    'mcclafferty',
-    'mcclaine',
-    'mcclairs',
-    'mcclanahan',
-    'mcclaren',
-    'mcclatcheys',
-    'mcclatchie',
-    'mcclaughlin',
     'mcclay',
-    'mccleaney/yard',
-    'mcclear',
-    'mccleave',
-    'mcclellan/amy',
-    'mcclellend',
-    'mcclenahan',
-    'mccleods',
-    'mcclimon',
-    'mcclockerty',
-    'mccluskey/studio',
-    'mccoey',
-    'mccoist/rangers',
-    'mccol',
-    'mccolgans',
-    'mccollough',
     'mccombe',
-    'mccomiskey',
-    'mccomnick',
-    'mcconnachie',
-    'mcconnely',
-    'mcconvill',
-    'mccoo',
-    'mccorkindale',
-    'mccormach',
-    'mccormack/windsurfer',
-    'mccormicks',
-    'mccosh',
-    'mccosker',
-    'mccotter',
-    'mccouaig',
-    'mccourt/prison',
     'mccowen/edward',
-    'mccowey',
-    'mccown',
-    'mccrae/mother',
-    'mccraken',
-    'mccran',
-    'mccrane',
-    'mccrann',
-    'mccreamer',
-    'mccree',
-    'mccreeth',
-    'mccreevy',
-    'mccresh',
-    'mccrhystal',
-    'mccright',
-    'mccrillock',
     'mccrimmon',
-    'mccrimmons',
-    'mccriskin',
-    'mccrostie',
-    'mccrudden/scotland',
-    'mccruden/buckinghamshire',
-    'mccruders',
-    'mccuan',
-    'mccudden',
-    'mccue/parent',
-    'mccullaugh',
-    'mccullie',
-    'mcculloch\'',
-    'mccurley',
-    'mccurry',
-    'mccutheon',
     'mccxxxiii',
-    'mcd\'s',
-    'mcd250',
-    'mcd260',
-    'mcdaids',
-    'mcdata',
-    'mcdavitt',
-    'mcdb-153',
-    'mcddi',
-    'mcdemott',
-    'mcdermidminister',
-    'mcdermitt',
-    'mcdermott-scotland',
-    'mcdermottroe',
-    'mcdicken',
-    'mcdonald-kaley',
     'mcdonald.',
-    'mcdonald/department',
-    'mcdonalds-like',
-    'mcdonaugh',
-    'mcdougallexternal',
-    'mcdoughall',
-    'mcduhrie',
-    'mcdyer',
-    'mce975w',
-    'mceachan',
-    'mceachran',
-    'mceachreon',
-    'mcelderry',
-    'mcelhatton/national',
-    'mcelhone',
-    'mcelligot',
     'mcellistrim',
-    'mcelwaine',
-    'mcendoo',
-    'mceneaney',
-    'mcenroic',
-    'mcentegart',
-    'mcentire',
-    'mceoin',
-    'mcevedy',
-    'mceveily',
-    'mcevoyh',
-    'mcewan/parents',
-    'mcewan/pupil',
-    'mcfadgeon',
-    'mcfarlance',
-    'mcfarlane/devlin',
     'mcfarlane/joyride',
-    'mcfd',
-    'mcfeat',
-    'mcferran',
-    'mcfly',
-    'mcfrederick',
-    'mcg/kg',
-    'mcg6071',
-    'mcgahie',
-    'mcgar',
-    'mcgarrat',
-    'mcgarrigan',
-    'mcgarry/rail',
-    'mcgarva',
-    'mcgarvie',
-    'mcgaskill',
     'mcgaugh',
-    'mcgay',
-    'mcgeachie',
-    'mcgeady',
-    'mcgeath',
-    'mcgeever',
-    'mcgeoch',
-    'mcgeogh',
-    'mcgeogh/oxford',
-    'mcgeough/chairman',
-    'mcgere',
-    'mcgetchin',
-    'mcghan',
-    'mcghee/carer',
-    'mcghie',
-    'mcghurkin-squirter',
     'mcgill-based',
-    'mcgill/student',
-    'mcgillivary',
-    'mcgilvary',
-    'mcginity',
-    'mcginniss',
-    'mcgirt',
-    'mcgivney',
-    'mcglade',
-    'mcglasshan',
-    'mcgleave',
-    'mcglennon',
-    'mcglincy',
-    'mcgloghlin',
-    'mcglone/glos',
-    'mcglone/gloucestershire',
     'mcglone/nature',
-    'mcgloshan',
-    'mcgolderick',
-    'mcgonagall',
-    'mcgonigle',
-    'mcgoolies',
-    'mcgorry',
-    'mcgouch',
-    'mcgoughs',
-    'mcgowne',
-    'mcgowran',
-    'mcgranaghan',
-    'mcgranaghans',
-    'mcgrath/gloucestershire',
-    'mcgrath/oxfam',
-    'mcgratten',
     'mcgraw-hill.',
-    'mcgredy',
-    'mcgreggor',
-    'mcgregor-robertson',
-    'mcgregor/college',
-    'mcgregor/fat',
-    'mcgrigor',
-    'mcgrillan',
-    'mcgriskin',
-    'mcgrother',
-    'mcgroush',
-    'mcgue',
-    'mcgugan',
-    'mcguillion',
-    'mcguin',
-    'mcguire/students',
     'mcguire/swansea',
-    'mcgurie',
-    'mcgurkin',
-    'mcgurks',
-    'mcgurn',
-    'mcgwire',
-    'mchardy/patient',
-    'mchattie/radiographer',
-    'mci/ml',
-    'mci/mmol',
-    'mci/mol',
-    'mcildoon',
-    'mcileree',
-    'mcilhatton',
-    'mcilheney',
-    'mcilhenny',
     'mcilheron',
-    'mcillwaine',
-    'mcilraith',
-    'mcilroys',
-    'mcilvaney',
-    'mcilvory',
-    'mcilwainian',
-    'mcilwane',
-    'mcilwrath',
-    'mcinery',
-    'mcing',
-    'mcinroy',
-    'mcintegart',
-    'mcintosh/napier',
-    'mcintost',
-    'mcirdy',
     'mcirvine',
-    'mcit',
-    'mcivanney',
-    'mciverney',
-    'mcivory',
-    'mcjones',
-    'mckay-watson',
-    'mckay/classic',
-    'mckay/joint',
-    'mckay/tayside',
-    'mckeand',
-    'mckeane',
-    'mckeans',
-    'mckearney',
-    'mckeatling',
-    'mckechnies',
     'mckeehan',
-    'mckegg',
-    'mckell',
-    'mckemsley/father',
-    'mckemsley/mother',
-    'mckemsley/pilot',
-    'mckendry',
-    'mckenn',
-    'mckenna/vet',
-    'mckennell',
-    'mckenney/mother',
-    'mckenzie-hill',
-    'mckenzie.',
-    'mckenzie/father',
-    'mckenzie/mother',
-    'mckenzies',
     'mckeone',
-    'mckeowen',
-    'mckerchar/camra',
-    'mckercher/campaign',
-    'mckerr',
-    'mckerrel',
-    'mckerrows',
-    'mckettrick',
-    'mckevitt',
-    'mckie/joint',
-    'mckie/master',
-    'mckight',
-    'mckilligan',
-    'mckilligin',
-    'mckillop-mash',
-    'mckinley/nrpb',
     'mckinnie',
-    'mckinny',
-    'mckintosh',
-    'mckirgan',
-    'mckissoch',
-    'mckloskey',
-    'mcknaught',
-    'mcknightagriculture',
-    'mckowchar/campaign',
-    'mcl5ean',
-    'mclachlans',
-    'mclane',
-    'mclardy-smith/surgeon',
-    'mclaren-tian',
-    'mclaren/honda',
-    'mclaren/westwood',
     'mclauchlans',
-    'mclauglin',
-    'mclaus',
-    'mclaversly',
-    'mclea',
-    'mclean/crash',
-    'mclean/hands',
-    'mclean/strathclyde',
-    'mcleaney/union',
-    'mcleans',
-    'mcleish/aberdeen',
-    'mcleister',
-    'mclellan/king',
-    'mclellan/st',
-    'mclellans',
-    'mclemore',
     'mcleod-crossley',
-    'mcleods',
-    'mclernan',
-    'mclernon',
-    'mclevey',
-    'mclewin',
-    'mcliam',
-    'mclinden',
-    'mclindon',
-    'mclister',
-    'mcllelland',
-    'mcloon',
-    'mclorman',
-    'mcloskey',
-    'mcloughlin/anaesthetist',
-    'mcluckie',
     'mcluggage',
-    'mcluhanism',
-    'mcluhanite',
-    'mcmahon/pub',
-    'mcmahon/showjumper',
-    'mcmamara',
-    'mcmanamann',
-    'mcmasteri',
-    'mcmath',
-    'mcmaugh',
-    'mcmay',
-    'mcmecca',
-    'mcmeeking/bursar',
-    'mcmichael/oxford',
-    'mcmillan/nitto',
-    'mcmillin',
     'mcmlii',
-    'mcmonnies',
-    'mcmoran',
-    'mcms',
-    'mcmuffin',
-    'mcmullin/blackwells',
-    'mcmurty',
-    'mcmvs',
-    'mcnab/author',
-    'mcnabe',
-    'mcnabs',
-    'mcnairn',
-    'mcnally/trainer',
-    'mcnary',
-    'mcnaugh',
-    'mcnaught-davis',
     'mcnaught-davis/judge',
-    'mcnaught/fertility',
-    'mcnaughting',
-    'mcnaughtry',
-    'mcnaugton',
-    'mcneally',
-    'mcnealy-on-nt',
-    'mcneece',
-    'mcneillie',
-    'mcneir',
-    'mcnellis',
-    'mcnelly',
-    'mcnerney',
-    'mcnevin',
-    'mcnichols',
-    'mcniell',
     'mcnivens',
-    'mcnugget',
-    'mcnulties',
-    'mcnulty.',
-    'mcnurlan',
-    'mcnutt',
-    'mco',
-    'mcomish',
-    'mcoueen',
-    'mcowan/catholic',
-    'mcp-40',
-    'mcp-milliyetci',
-    'mcp/as',
-    'mcpa',
-    'mcpadden',
-    'mcpartland/st',
     'mcpaul',
-    'mcphearson',
-    'mcpherson/cheltenham',
-    'mcpherson/gp',
-    'mcq',
-    'mcqmcquire',
-    'mcqueen/friends',
-    'mcquigg',
-    'mcquilkin',
-    'mcquillam',
-    'mcquilling',
-    'mcquire',
-    'mcquitty',
-    'mcrae/walker',
-    'mcraes',
-    'mcrandall',
     'mcreadie',
-    'mcritchie',
-    'mcrostie',
-    'mcshine',
-    'mcsimon',
-    'mcsod',
-    'mcsquirt',
-    'mcstay/celtic',
-    'mcswan',
-    'mcsweeny',
-    'mctaggaet',
-    'mctaminey',
-    'mcteague',
-    'mctear\'s/widow',
-    'mcthing',
-    'mctier',
     'mctoddy',
-    'mctr',
-    'mcturk',
-    'mctwists',
-    'mcv/mch/hct',
-    'mcvay',
-    'mcveigh/friends',
-    'mcverry',
-    'mcvities/united',
-    'mcvix',
-    'mcvorran',
-    'mcwatters',
-    'mcwattie',
-    'mcwc',
-    'mcweeney',
-    'mcweirdo',
     'mcwhirter-he',
-    'mcwhirter/friend',
-    'mcwiliams',
-    'mcx',
-    'mcx1',
-    'mcx14',
-    'mcx15',
-    'mcx17',
-    'md-2000',
-    'md-80',
-    'md-83',
-    'md-bi',
-    'md-ii',
-    'md-il',
-    'md/112',
-    'md10',
     'md3-16-',
-    'md5',
-    'md500',
-    'md500e',
-    'md9,500',
-    'mdap',
-    'mdc7890',
-    'mdck',
-    'mdels',
-    'mdg',
-    'mdl',
-    'mdlalose',
-    'mdldmnls',
-    'mdme',
-    'mdol',
-    'mdoya',
     'mdpssee',
-    'mdrec',
-    'mds2000',
-    'mdt',
-    'mdv',
-    'mdvs',
-    'mdx',
-    'me&dstrok;3adulur',
-    'me&mdash;about',
-    'me&mdash;he',
-    'me&mdash;oh',
-    'me&mdash;you',
-    'me&ndash',
-    'me&rehy;nial',
-    'me&rehy;the',
-    'me&scaron;trovi&cacute\'s',
     'me\'self',
-    'me-a',
-    'me-after',
-    'me-consciousness',
-    'me-decade',
-    'me-first',
-    'me-in',
-    'me-ing',
-    'me-l&aacute;m-bi',
-    'me-myself-i',
-    'me-neither',
-    'me-that',
-    'me-the',
-    'me-za-na',
-    'me.163',
-    'me.262',
     'me.264',
-    'me.i',
-    'me.when',
-    'me/death',
-    'me/gave',
-    'me/how',
-    'me/is',
-    'me/my',
-    'me/useless',
-    'me1',
-    'me109',
-    'me13',
-    'me16',
-    'me2',
-    'me3000',
-    'me4',
     'me_away',
-    'me_in',
-    'me_now',
-    'me_up',
-    'mea&rehy;gre',
-    'meaasge',
-    'meacher-haigh',
-    'meachers',
-    'mead-drinking',
-    'mead/gloucestershire',
-    'mead/inventor',
-    'mead/social',
-    'meadand',
-    'meadapproaches',
-    'meade-fetherstonhaugh',
-    'meade-king',
     'meade/horse',
-    'meade/trainer',
-    'meade/vicar',
-    'meadean',
-    'meadfoot',
-    'meadhall',
-    'meadhides',
-    'meadholds',
-    'meadie',
-    'meading',
-    'meadjoins',
-    'meadon',
-    'meador',
-    'meadow-blooms',
-    'meadow-grasses',
-    'meadow-land',
     'meadow-like',
-    'meadow-pipit',
-    'meadow-pipit-like',
-    'meadow-pool',
-    'meadow.sweet',
-    'meadow/oxford',
-    'meadowcroft/store',
-    'meadowcup',
-    'meadowes',
-    'meadowfoam',
-    'meadowings',
-    'meadows/gloucester',
-    'meadows/hereford',
-    'meadowside',
-    'meadox',
-    'meadrealm',
     'meads/rector',
-    'meadsman',
-    'meadwoke',
-    'meagles',
-    'meah',
-    'meaham',
-    'meak',
-    'meaken',
-    'meakin/nottingham',
-    'meakins',
-    'meal-break',
-    'meal-in-a-glass',
-    'meal-moth',
-    'meal-offering',
-    'meal-stimulated',
-    'meal-taking',
     'meal-ticket',
-    'meal-tub',
-    'meal/refreshment',
-    'meala',
-    'meala6',
-    'mealda',
-    'mealey',
-    'mealiest',
-    'mealin',
-    'mealing',
-    'mealmen',
-    'meals-inclusive',
-    'meals.journey',
-    'meals/care',
-    'meals/snacks',
-    'mealticket',
     'mealworms',
-    'mealy-mouthedness',
-    'mealy-xxxx',
-    'mean&mdash;but',
-    'mean-1.e.',
-    'mean-like',
-    'mean-preserving',
-    'mean-street',
-    'mean-tested',
-    'mean-time',
-    'mean/',
-    'mean/would',
-    'mean=',
-    'mean=0.24',
-    'mean=0.47s',
-    'mean=0.48',
     'mean=0.612s',
-    'mean=1.2',
-    'mean=1.5',
-    'mean=1.84s',
-    'mean=2.15',
-    'mean=3.5',
-    'mean=3.66',
-    'mean_a',
-    'mean_apart',
-    'mean_even',
-    'mean_in',
-    'mean_in_terms',
-    'meander.',
-    'meaned',
-    'meaner\'n',
-    'meanguera',
     'meanguerita',
-    'meanhwile',
-    'meani',
-    'meanin',
-    'meaning&mdash',
-    'meaning&rehy;establishing',
-    'meaning&rehy;fully',
-    'meaning\'\'',
-    'meaning-altering',
-    'meaning-bearing',
-    'meaning-content',
-    'meaning-driven',
-    'meaning-fully',
-    'meaning-getting',
-    'meaning-in-context',
-    'meaning-maker',
     'meaning-of-life',
-    'meaning-oriented',
-    'meaning-preserving',
-    'meaning-related',
-    'meaning-similarity',
-    'meaning-specifications',
-    'meaning-to-sound',
-    'meaning-words',
-    'meaning.content',
-    'meaning.nn',
-    'meaningful/meaningless',
-    'meaningful/non-meaningful',
-    'meaningfull',
-    'means&rehy;tested',
-    'means&rehy;testing',
-    'means-ends',
     'means-tests',
-    'means-this',
-    'means/standard',
-    'means/to',
-    'meanspirited',
-    'meanst',
-    'meanstested',
-    'meant-which',
-    'meanti',
-    'meantine',
-    'meap',
-    'mear',
-    'mearc',
-    'mearig',
-    'mearin',
-    'mearing-smith',
     'mearne',
-    'mears/son-in-law',
-    'measles/mumps/rubella',
-    'meason',
-    'meastro',
-    'measued',
-    'measure&rehy;ment',
-    'measure-for-measure',
-    'measure-valued',
-    'measure.',
-    'measure_in_terms',
-    'measureby',
-    'measurement&ndash;kilobytes',
-    'measurement.',
-    'measurementof',
-    'measures&mdash;and',
     'measures/specific',
-    'measurin\'',
-    'measuring-stick',
-    'measutement',
-    'meat-alternatives',
-    'meat-and-potato',
-    'meat-and-potatoes',
-    'meat-and-two-veg',
-    'meat-animals',
-    'meat-axe',
-    'meat-balling',
-    'meat-cauldron',
-    'meat-crumbs',
-    'meat-cut',
-    'meat-cutter',
-    'meat-filled',
     'meat-flavoured',
-    'meat-giver',
-    'meat-head',
-    'meat-heap',
-    'meat-inspection',
-    'meat-pie',
-    'meat-processing',
-    'meat-rationing',
-    'meat-sharing',
-    'meat-stuffed',
-    'meat-traders',
-    'meat.however',
-    'meat/mete/meet',
-    'meat_in_front',
-    'meatal',
-    'meatbones',
     'meatboy',
-    'meate',
-    'meatform',
-    'meatiness',
-    'meating',
-    'meatmaster',
-    'meatoid',
-    'meatpacking',
-    'meatres',
-    'meatsafe',
-    'meatyards',
-    'meaulnes=domestic',
-    'meaure',
-    'meautys',
-    'meazles',
-    'meb.it',
     'mebes',
-    'mebiame',
-    'mebmt1',
-    'mebmt1(co)',
-    'mebumal',
-    'meca',
-    'mecair',
-    'mecanica',
-    'mecanno',
-    'mecas',
-    'mecatecno',
-    'meccanico',
-    'meccanotecnica',
-    'mecenazgo',
-    'mech.eng.',
-    'mecha',
     'mecha-tronics',
-    'mechai',
-    'mechan',
-    'mechancally',
-    'mechanical-looking',
-    'mechanical-typewriter',
-    'mechanical.electrical',
-    'mechanical/aeronautical',
-    'mechanical/production',
-    'mechanically-aided',
-    'mechanically-loaded',
-    'mechanically-powered',
-    'mechanically-propelled',
-    'mechanically-tuned',
-    'mechanicalness',
-    'mechanick',
     'mechanico-archaeological',
-    'mechanicus',
-    'mechanising',
-    'mechanism&rehy;based',
-    'mechanism-type',
-    'mechanism.',
-    'mechaniz',
-    'mechanization-indeed',
-    'mechara',
-    'mechata',
-    'mechatons',
-    'mechatronic',
-    'meche',
-    'mechenophilus',
-    'mechie',
-    'mechonoid',
     'mechons',
-    'mechpro',
-    'mechs',
-    'mecias',
-    'mecken',
-    'meckenheim',
-    'meckleburg',
-    'mecklenburg-',
-    'mecklenburg-vorpommern',
-    'meckling',
-    'mecky',
-    'mecoprop',
-    'mecums',
-    'med\'cin',
-    'med\'cine',
-    'med-icine',
     'med-type',
-    'med.',
-    'med/200&deg',
-    'medact',
-    'medadalur',
-    'medaglie',
-    'medai',
-    'medal-encrusted',
-    'medal-hope',
-    'medale',
-    'medalists',
-    'medalle',
-    'medalled',
-    'medalling',
-    'medallion-like',
-    'medallioned',
     'medames',
-    'medanite',
-    'medard',
-    'medata',
-    'medau-time',
-    'medau/keep',
-    'medauhalf',
-    'medawachchiya',
-    'medbh',
-    'medchuana',
-    'medchuarta',
-    'medcof',
-    'medd.',
-    'meddelelser',
-    'medden',
-    'meddi',
     'meddick',
-    'medding',
-    'meddis',
-    'meddle-aged',
-    'meddlings',
-    'meddow',
-    'meddyg',
-    'meddyliol',
-    'medecine',
-    'medecines',
-    'medecyne',
-    'meded',
-    'medell&iacute&euml',
-    'medella',
-    'meden',
-    'medenine',
     'medequate',
-    'mederos',
-    'medfac',
-    'medfield',
-    'medgysey',
-    'medi-back',
-    'medi-care',
-    'medi-strips',
-    'medi-tech',
-    'media&rehy;tion',
-    'media\'',
-    'media-and-politician',
-    'media-buying',
-    'media-centredness',
-    'media-conscious',
-    'media-conte',
     'media-coop',
-    'media-encouraged',
-    'media-exploitation',
-    'media-exposed',
-    'media-generated',
-    'media-grown',
-    'media-highlighted',
-    'media-hype',
-    'media-indignation',
-    'media-influenced',
-    'media-intensive',
-    'media-kings',
-    'media-literate',
-    'media-munching',
-    'media-only',
-    'media-orientated',
     'media-relations',
-    'media-rich',
-    'media-shy',
-    'media-smart',
-    'media-star',
-    'media-suckled',
-    'media-television',
-    'media-watchers',
-    'media-wise',
-    'media/campaign',
-    'media/communication',
-    'media/cultural/trivial/not',
-    'media/information',
-    'media/overall',
-    'mediagenic',
-    'mediaid',
     'medialab',
-    'medially-stopped',
-    'mediamen',
-    'median-interquartile',
-    'median-to-high',
-    'median/hanned',
-    'median=5.5',
-    'median=95',
-    'mediana',
-    'medianly',
-    'mediascape',
-    'mediaschlock',
-    'mediasourcery',
-    'mediastinitis',
-    'mediastrinum',
-    'mediatheque',
     'mediatisation',
-    'mediative',
-    'mediatized',
-    'mediators&mdash;the',
-    'mediators.1',
-    'mediatron-multimedia',
-    'mediayob',
-    'medic-alert',
-    'medicaea',
-    'medicago',
-    'medicagofalcata',
-    'medical&rehy;style',
-    'medical\'',
-    'medical-athletic',
-    'medical-bed',
-    'medical-benefit',
     'medical-diagnostic',
-    'medical-moral',
-    'medical-nursing',
-    'medical-pharmaceutical',
-    'medical/',
-    'medical/emergency',
-    'medical/geriatric',
-    'medical/nursing/social',
-    'medical/science',
-    'medical/surgical',
-    'medical/technical',
-    'medicalert',
-    'medically-circumscribed',
-    'medically-supported',
-    'medically-undesirable',
-    'medicamen',
     'medicament',
-    'medicamentorum',
-    'medicas',
-    'medicash-insured',
-    'medicates',
-    'medication.',
-    'medication/inhaler',
-    'medicators',
-    'medicea',
-    'medicean',
-    'medicell',
-    'medicentre',
-    'medices',
-    'medici-riccardi',
-    'medicial',
-    'medicina',
     'medicinal\'',
-    'medicine&mdash;which',
-    'medicine*',
-    'medicine-chest',
-    'medicine-men',
-    'medicine-shop',
-    'medicine/geriatric',
-    'medicine/oxford',
-    'medicine/therapy.',
-    'medicines&mdash;that',
-    'medicines-to-sports',
-    'medicines.',
-    'medicining',
-    'medicins',
-    'medicins_sans_frontieres',
-    'medico-chemical',
     'medico-chirurgical',
-    'medico-magnetico-musico-electrical',
-    'medico-pedagogical',
-    'medico-pharmaceutical',
-    'medico-religious',
-    'medico-technical',
-    'medico/actuarial',
-    'medicoal',
-    'medicochirurgical',
-    'medicolegally',
-    'medida',
-    'medien',
-    'medietis',
-    'medieval/renaissance',
-    'medievalizing',
-    'medievally',
     'medigo',
-    'medilline',
-    'medimnoi',
-    'medina-sidonia',
-    'medina/aged',
-    'medinas',
-    'medinnus',
-    'medio-cubital',
-    'mediobanca',
-    'mediocracy',
-    'mediocres',
-    'medioevo',
-    'mediolani',
-    'mediomatrices',
-    'medirios',
-    'mediscan',
     'medit',
-    'meditacion',
-    'meditation-become-poem',
-    'meditation/relaxation',
-    'mediteran',
-    'mediterr&aacute;neo',
-    'mediterra&rehy;nean',
-    'mediterranea',
-    'mediterranean-based',
-    'mediterranean-type',
-    'mediterranean/tethys',
-    'mediterranee',
-    'mediterraneity',
-    'meditive',
-    'meditsinskaya',
-    'medium&mdash',
     'medium&mdash;and',
-    'medium&rehy;grade',
-    'medium&rehy;paced',
-    'medium&rehy;size',
-    'medium&rehy;sized',
-    'medium&rehy;term',
-    'medium\'',
-    'medium-acting',
-    'medium-angle',
-    'medium-bodied',
-    'medium-built',
-    'medium-capacity',
-    'medium-chain',
-    'medium-cost',
-    'medium-curved',
-    'medium-cut',
     'medium-dark',
-    'medium-deep',
-    'medium-developed',
-    'medium-distance',
-    'medium-fat',
-    'medium-fierce',
-    'medium-gilt',
-    'medium-grade',
-    'medium-grained',
-    'medium-hard',
-    'medium-haul',
-    'medium-hold',
-    'medium-if',
-    'medium-intensity',
-    'medium-large',
-    'medium-light',
     'medium-pace-all-rounders',
-    'medium-poor',
-    'medium-profile',
-    'medium-ranks',
-    'medium-resolution',
-    'medium-risk',
-    'medium-side-of-sweet',
-    'medium-sweet',
-    'medium-termism',
-    'medium-to-lightweight',
-    'medium-to-low',
-    'medium-to-poor',
-    'medium-toned',
-    'medium-use',
-    'medium-volatile',
-    'medium-volume',
     'medium/extended',
-    'medium/light',
-    'medium/long-term',
-    'medium/low',
-    'medium/private',
-    'medium/short-scale',
-    'medium/small',
-    'medium/soft',
-    'mediumd',
-    'mediumpace',
-    'mediumsized',
-    'medizing',
-    'medkits',
-    'medkov&agrave',
-    'medlawa',
-    'medlearn',
     'medlen',
-    'medleycott',
-    'medline-medlars',
-    'medlo',
-    'medonca',
-    'meds',
-    'medsi',
-    'medstick',
-    'medu',
-    'medua',
-    'medugorje',
-    'meduium-term',
-    'medusa-threads',
-    'medusiform',
-    'medusiforms',
-    'medvedeva',
     'medwen',
-    'mee-hawl',
-    'mee/gwr',
-    'meeching',
-    'meee',
-    'meeeeee',
-    'meeeeeee',
-    'meeeting',
-    'meegaeren',
-    'meehan\'',
-    'meeja',
-    'meek-eyed',
-    'meek/brother',
-    'meek/trainer',
-    'meekers',
-    'meekes',
     'meeki',
-    'meekings',
-    'meekl',
-    'meekrahs',
-    'meeks/swindon',
-    'meeks/wiltshire',
-    'meelbeg',
-    'meelmore',
-    'meely',
-    'meen',
-    'meenagh',
-    'meenaleck',
-    'meenan',
-    'meenglas',
-    'meenglass',
-    'meenit',
     'meenlas',
-    'meention',
-    'meep',
-    'meerbeck',
-    'meeresforschung',
-    'meerly',
-    'meerm&auml;dchen',
-    'meerschaums',
-    'meert',
-    'meesis',
-    'meester-demeyer',
-    'meet&rehy;ing',
-    'meet-a-mother',
-    'meet-the-buyer',
-    'meet-the-press',
-    'meet/meat/mate',
     'meet/mete/meat',
-    'meet_each',
-    'meetable',
-    'meeted',
-    'meeteetsee',
-    'meetes',
-    'meetest',
-    'meetham',
-    'meethinks',
-    'meeting-',
-    'meeting-at',
-    'meeting-chamber',
-    'meeting-cute',
-    'meeting-goers',
-    'meeting-ground',
-    'meeting-hall',
     'meeting-on',
-    'meeting-points',
-    'meeting-spiel',
-    'meeting-up',
-    'meeting.tim',
-    'meeting/',
-    'meeting/disco',
-    'meeting/effective',
-    'meeting/liaison',
-    'meeting/speech',
-    'meetinghouse',
-    'meetingphotograph',
-    'meetings.any',
-    'meetings.there',
-    'meetings/courses',
-    'meetings/outings',
     'meetings/special',
-    'meetingware',
-    'meewen',
-    'mefalle',
-    'mefem',
-    'mefile',
-    'mega&rehy;bucks',
-    'mega&rehy;stock',
-    'mega&rehy;walker',
-    'mega-adjustable',
-    'mega-airlines',
-    'mega-band',
-    'mega-bids',
-    'mega-brain',
-    'mega-cash',
-    'mega-chad',
     'mega-chefs',
-    'mega-chessboard',
-    'mega-city',
-    'mega-cluster',
-    'mega-complex',
-    'mega-conglomerates',
-    'mega-deal',
-    'mega-deaths',
-    'mega-debtor',
-    'mega-decibels',
-    'mega-dirt',
-    'mega-diverse',
-    'mega-double',
-    'mega-dumb',
-    'mega-feeding',
-    'mega-firms',
     'mega-flops',
-    'mega-fortune',
-    'mega-gig',
-    'mega-gloss',
-    'mega-good',
-    'mega-grunge',
-    'mega-gutted',
-    'mega-high',
-    'mega-hit',
-    'mega-hype',
-    'mega-important',
-    'mega-interesting',
-    'mega-jam',
-    'mega-law',
-    'mega-lumps',
-    'mega-massive',
     'mega-mechanization',
-    'mega-media',
-    'mega-meetings',
-    'mega-microscope',
-    'mega-millions',
-    'mega-mineral',
-    'mega-mix',
-    'mega-moan',
-    'mega-money',
-    'mega-pc',
-    'mega-pills',
-    'mega-profitable',
-    'mega-project',
-    'mega-report',
-    'mega-selling',
-    'mega-sized',
     'mega-skrag',
-    'mega-snort',
-    'mega-speed',
-    'mega-sports',
-    'mega-stonking',
-    'mega-store',
-    'mega-stores',
-    'mega-successful',
-    'mega-theme',
-    'mega-thousands',
-    'mega-ton',
-    'mega-tour',
-    'mega-turnaround',
-    'mega-violence',
-    'mega-volume',
-    'mega-watt',
     'mega-weak',
-    'mega-wealth',
-    'mega-whoppers',
-    'megabar',
-    'megabars',
-    'megabase',
-    'megabates',
-    'megabeans',
-    'megabecquerels',
-    'megabid',
-    'megabooks',
-    'megabossgod',
-    'megabytten',
-    'megabyxoi',
-    'megacarriers',
-    'megaceros',
     'megachiroptera',
-    'megacity-size',
-    'megaconference',
-    'megacounties',
-    'megacryst',
-    'megadeal',
-    'megadeaths',
-    'megadisc',
-    'megadog',
-    'megafabulously',
-    'megafirms',
-    'megaflops',
-    'megageomorphology',
-    'megaglob',
-    'megahits',
-    'megahub',
     'megahy',
-    'megaira',
-    'megajoules',
-    'megalaugh',
-    'megalencephaly',
-    'megali',
-    'megaliner',
-    'megalithism',
-    'megalithomaniac',
-    'megalodons',
-    'megalomaniacal',
-    'megalomartyr',
-    'megalomedia',
-    'megalosauruses',
-    'megalosphaeric',
-    'megalotis',
     'megamillions',
-    'megamoney',
-    'megamouth',
-    'megamum',
-    'megamuseum',
-    'meganumbers',
-    'megapanos',
-    'megapascals',
-    'megapc',
-    'megaphone-wielding',
-    'megaphoned',
-    'megaphonic',
-    'megaphoto',
-    'megapixel',
-    'megapolitics',
-    'megaponticum',
     'megaprogramming',
-    'megaptera',
-    'megaron',
-    'megarrell',
-    'megascuttle',
-    'megaseller',
-    'megasellers',
-    'megaship',
-    'megashivers',
-    'megaspores',
-    'megastate',
-    'megastream',
-    'megatastic',
-    'megaterium',
-    'megatherium',
-    'megathrash',
     'megatonnage',
-    'megatonne',
-    'megatooth',
-    'megatop',
-    'megatraverses',
-    'megatrend',
-    'megavessel',
-    'megawatt-generating',
-    'megawatt/hours',
-    'megaweapons',
-    'megawhale',
-    'megazone',
-    'megditure',
-    'megee',
-    'megel',
-    'megellus',
     'megert',
-    'megeve',
-    'meggan',
-    'meggeson',
-    'meggett',
-    'meggitts',
-    'meghir',
-    'meghna',
-    'meghnad',
-    'megin',
-    'megionneftegaz',
-    'megisserie',
-    'megiture',
-    'meglio',
-    'meglomaniac',
-    'megonius',
     'megrel-abkhazian',
-    'megrim',
-    'megstone',
-    'megumu',
-    'meh',
-    'mehaignerie',
-    'mehain',
-    'mehal',
-    'mehale',
-    'meher-homji',
-    'mehetabelle',
-    'mehfil',
-    'mehico',
-    'mehigan',
-    'mehill',
-    'mehinaku',
     'mehitabel',
-    'mehitema',
-    'mehlhorns',
-    'mehlman',
-    'mehmed-i',
-    'meho',
-    'mehras',
-    'mehretu',
-    'meht',
-    'mei-gook',
-    'meidensha',
-    'meiendorf',
-    'meier-scupin',
-    'meierturm',
-    'meigant',
-    'meigh-andrews',
     'meighen',
-    'meigs',
-    'meihle',
-    'meildrum',
-    'meiler',
-    'meilhac',
-    'meiling',
-    'meillerie',
-    'meilleure',
-    'meillo',
-    'meillon',
-    'meils',
-    'meindl',
-    'meinem',
-    'meinenbourg',
-    'meinertzhagen/georgina',
     'meines',
-    'meinetzhargen',
-    'meing',
-    'meinhard',
-    'meinholf',
-    'meinhoof',
-    'meinich',
-    'meinie',
-    'meinig',
-    'meiningen',
-    'meinkopt',
-    'meinong',
-    'meinsohn',
-    'meireles',
-    'meirelles',
-    'meirer',
     'meirheath',
-    'meiring',
-    'meiringen',
-    'meirionnydd-based',
-    'meirt',
-    'meisa',
-    'meise',
-    'meiselas',
-    'meishi',
-    'meism',
-    'meison',
-    'meisonnier',
-    'meiss',
-    'meissener',
-    'meisterwerk',
-    'meith',
     'meith-had',
-    'meiths',
-    'meitner-graf',
-    'meiwen',
-    'meizer',
-    'mej&iacute;as',
-    'mejdani',
-    'mejia',
-    'mejicanos',
-    'mejor',
-    'mejores',
-    'mekbib',
-    'mekhedrioni',
-    'mekhloufi',
-    'mekin',
-    'mekin\'',
     'meking',
-    'mekle',
-    'meknassi',
-    'mekon',
-    'mekonen',
-    'mekonyocivil',
-    'mel&oacute;n',
-    'mel\'chior',
-    'mela-bocca',
-    'melachrino',
-    'melachrino-type',
-    'melachromic',
-    'melalap',
-    'melami',
-    'melamine-coated',
-    'melamine-type',
     'melamis',
-    'melampous',
-    'melampyrum',
-    'melancholiac',
-    'melancholias',
-    'melancholie',
-    'melancholike',
-    'melancholily',
-    'melanchollie',
-    'melancholly',
-    'melancholy-then-strident',
-    'melanchromic',
-    'melancolia',
-    'melancolica',
-    'melandra',
-    'melanesian-controlled',
     'melanesien',
-    'melanges',
-    'melangin',
-    'melani',
-    'melanin-like',
-    'melanion',
-    'melanism-fluid',
-    'melanization',
-    'melanocephala',
-    'melanocephalus',
-    'melanocercus',
-    'melanocyte-specific',
-    'melanocytic',
-    'melanoleuca',
-    'melanolophia',
-    'melanomain',
     'melanosis',
-    'melanosomal',
-    'melanospermus',
-    'melanosterna',
-    'melanotaenia',
-    'melanotos',
-    'melanovski',
-    'melantis',
-    'melantius',
-    'melantrichova',
-    'melanzane',
-    'melao',
-    'melara',
-    'melastoma',
-    'melathron',
-    'melatonin-rich',
     'melby-erskine',
-    'melchbourne',
-    'melchite',
-    'melchites',
-    'melchizedec',
-    'melderman',
-    'meldina',
-    'meldinls',
-    'meldol-meduli&cacute',
-    'meldon',
-    'melds',
-    'meleagridis',
-    'meleagrou',
-    'melechi',
-    'melencholy',
-    'melescanu',
     'meleu-10',
-    'meleu-4',
-    'meleu-9',
-    'meleu4',
-    'meleu9',
-    'meleu9(co)',
-    'melf',
-    'melfi',
-    'melfoot',
-    'melford-stevenson',
-    'melform',
-    'melfyn',
-    'melga',
-    'melgar',
-    'melgund',
-    'melhuish-weisbrod',
     'meliaceous',
-    'melian',
-    'melians',
-    'meliboia',
-    'melibur',
-    'melica',
-    'melichar',
-    'melicopicine',
-    'melicopidine',
-    'melicopine',
-    'melida',
-    'meliden',
-    'melierax',
-    'melih',
-    'melik',
-    'melikyan',
     'melili',
-    'melillia',
-    'melillo',
-    'melincrythan',
-    'melinex',
-    'melinno',
-    'melinte',
-    'melion',
-    'melioration',
-    'meliorism',
-    'melipones',
-    'melismata',
-    'melismatic',
-    'melissani',
-    'melita',
-    'melitensis',
     'melito',
-    'melitus',
-    'melitz',
-    'melk',
-    'melkweg',
-    'mellancamp',
-    'mellaril',
-    'mellen',
-    'meller',
-    'mellerary',
-    'mellerick',
-    'mellers',
-    'mellersh',
-    'mellerstain',
-    'mellery',
-    'mellie',
     'mellies',
-    'mellifluence',
-    'mellifluent',
-    'mellin-olsen',
-    'mellingen',
-    'mellinger',
-    'mellini',
-    'mellink',
-    'mellisuga',
-    'mellits',
-    'mellone',
-    'mellonie',
-    'mellor-drama',
-    'mellora',
-    'mellotlie',
-    'mellotron',
     'mellottie',
-    'mellowly',
-    'mellows-facer',
-    'melluci',
-    'mellum',
-    'melmon',
-    'melmount',
-    'melo9s',
-    'melocomic',
-    'melodiam',
-    'melodic/harmonic',
-    'melodic/lyric',
-    'melodies-and-basses',
-    'melodions',
-    'melodramatics',
-    'melodramatised',
     'melodramatized',
-    'melody-building',
-    'melody/accompaniment',
-    'melody/fingerstyle',
-    'meloe',
-    'melolontha',
-    'melon-baller',
-    'melon-wedge',
-    'meloni',
-    'melorivicish',
-    'melorose',
-    'melosh',
-    'melottie',
-    'meloy',
-    'melozzo',
-    'melpash',
     'melphalan/prednisolone',
-    'melphor',
-    'melraw',
-    'melrose-drover',
-    'mels',
-    'melsa',
-    'melsh',
-    'melshed',
-    'melshorn',
-    'melt-glued',
-    'melt-of-the-heart',
-    'melt-out',
-    'melt-through',
-    'melta',
-    'melta-bombs',
-    'melted-down',
     'melted-tar',
-    'meltern',
-    'melters/present',
-    'melthane',
-    'melting-point',
-    'melting-points',
-    'meltis',
-    'meltonian',
-    'meltonian-white',
-    'meltonin',
-    'meltwaters',
-    'meltz',
-    'meltzoff',
-    'melucco',
-    'meluha',
-    'melusine',
     'melvern',
-    'melvile',
-    'melvill',
-    'melvin/publican',
-    'melwani',
-    'melwert',
-    'melyd',
-    'melyn',
-    'melzak',
-    'melzer',
-    'mem.',
-    'mem.exe',
-    'mem/hepes',
-    'memani/south',
-    'memb',
-    'membas',
     'membe',
-    'membeer',
-    'member&mdash;and',
-    'member-clutchers',
-    'member-country',
-    'member-directors',
-    'member-international',
-    'member-only',
-    'member-satisfaction',
-    'member-set',
-    'member-societies',
-    'member-suppliers',
-    'member-to-member',
-    'member.after',
-    'member/any',
-    'member/society',
     'member/voter',
-    'membered',
-    'membering',
-    'members&mdash;see',
-    'members&mdash;who',
-    'members-',
-    'members--who',
-    'members-a',
-    'members-but',
-    'members-only',
-    'members-to',
-    'members.ce',
-    'members.ps',
-    'members.the',
-    'members/players',
-    'members/supporters',
     'members55',
-    'membership&mdash;market',
-    'membership\'',
-    'membership-card.',
-    'membership-driven',
-    'membership-owned',
-    'membership.e',
-    'membership.e/c',
-    'membership/staff',
-    'membership:51',
-    'membership:burkina',
-    'memberts',
-    'membland',
-    'membracids',
-    'membranbe',
-    'membrance',
     'membrane-attached',
-    'membrane-encased',
-    'membrane-mimicking',
-    'membrane-osmometers',
-    'membrane-thin',
-    'membrane-transducing',
-    'membrane-type',
-    'membrane.',
-    'membrane.at',
-    'membraneous',
-    'membre&ntilde;o',
-    'membres',
-    'membrum',
-    'memc',
-    'memchaoui',
-    'memcor',
     'memduh',
-    'meme-pool',
-    'memeber',
-    'memec',
-    'memecyloideae',
-    'memeticist',
-    'memically',
-    'memlinc',
-    'memmott',
-    'memo-matic',
-    'memo-pad',
-    'memoir-writers',
-    'memoires',
-    'memoirs-in-progress',
-    'memoirs.',
-    'memopark',
     'memoranda/investment',
-    'memorandising',
-    'memorex\'',
-    'memoriae',
-    'memorielle',
-    'memorium',
-    'memorization',
-    'memorizer',
-    'memory&mdash;resident',
-    'memory&rehy;image',
-    'memory\'',
-    'memory-aid',
-    'memory-album',
-    'memory-based',
-    'memory-boosting',
-    'memory-deficient',
     'memory-discs',
-    'memory-enhancing',
-    'memory-failure',
-    'memory-how',
-    'memory-image',
-    'memory-laden',
-    'memory-like',
-    'memory-making',
-    'memory-management',
-    'memory-mapped',
-    'memory-packed',
-    'memory-rapacious',
-    'memory-recordings',
-    'memory-residues',
-    'memory-size',
-    'memory-slate',
     'memory-snatching',
-    'memory-taperecorder',
-    'memory-test',
-    'memory-tickling',
-    'memory-toss',
-    'memory-training',
-    'memory-trigger',
-    'memory-turned-myth',
-    'memory/256',
-    'memory/behaviour',
-    'memory/still',
-    'memory:ray',
-    'memoyres',
-    'memsys',
-    'memtek',
-    'men&ccaron;eti&cacute',
     'men&ndash;s',
-    'men&rehy;tioned',
-    'men-about-chelsea',
-    'men-an-tol',
-    'men-and',
-    'men-are',
-    'men-centered',
-    'men-dominated',
-    'men-haters',
-    'men-hungry',
-    'men-o-war',
-    'men-on-the-spot',
-    'men-shaped',
-    'men.5',
-    'men.the',
-    'men/10',
     'men/the',
-    'men/work',
-    'men:a',
-    'menace(scram)',
-    'menace-filled',
-    'menace-laden',
-    'menace.was',
-    'menachim',
-    'menacingly.',
-    'menage-a-trois',
-    'menahcem',
-    'menail',
-    'menair',
-    'menanced',
-    'menar',
-    'menas',
     'menasco',
-    'menashe',
-    'menatep',
-    'menaul',
-    'mence',
-    'menchel',
-    'mencius',
-    'menck',
-    'mencl',
-    'mend-and-make-do',
-    'mendable',
-    'mendana',
-    'mendations',
-    'mendelevich',
-    'mendelising',
-    'mendell',
     'mendelson.',
-    'mendelsshon',
-    'mendelssohn-bruch',
-    'mendelssohnian',
-    'menden',
-    'mendenall',
-    'mendes&lsqb;see',
-    'mendes-france',
-    'mendez-who',
-    'mendies',
-    'mendieta*',
-    'mendin\'',
-    'mendini',
-    'mendips.',
-    'mendive',
-    'mendiz',
     'mendiz&aacute;bal',
-    'mendizabal',
-    'mendlesohn',
-    'mendlessohn',
-    'mendleton',
-    'mendlsham',
-    'mendona',
-    'mendoubita',
-    'mendoza/friends',
-    'mendum',
-    'menear',
-    'menees',
-    'menegon-bidi',
-    'meneguel',
-    'menehould',
-    'menemista',
     'menenius',
-    'menephta',
-    'menerbi',
-    'menergy',
-    'menerva',
-    'menetrier',
-    'menga',
-    'mengal',
-    'mengelburg',
-    'mengenlehre',
-    'menger',
-    'menghin',
-    'menghini',
-    'menghua',
-    'mengkapan',
-    'menguistu',
     'menhir-shaped',
-    'menially',
-    'menigitis',
-    'menignos',
-    'meningeal',
-    'meninges',
-    'meningitis.',
-    'meningococcus',
-    'menini',
-    'meninigitipitus',
-    'menino',
-    'menioned',
-    'menippean',
-    'menise',
-    'menjamim',
-    'menjou',
     'menke',
-    'menkes',
-    'menley',
-    'menn',
-    'mennea',
-    'mennecey',
-    'mennell',
-    'mennin',
-    'mennis',
-    'meno',
-    'menodge',
-    'menodotus',
-    'menologion',
-    'menominee',
-    'menor',
-    'menora',
     'menorah',
-    'menours',
-    'menown',
-    'menpes',
-    'mens&aelig',
-    'mensa-a-table',
-    'mensa-man',
-    'menschenaffen',
-    'menschenrechte',
-    'mensching',
-    'menschlicher',
-    'mense',
-    'menses.',
-    'mensford',
-    'mensforth',
-    'menshes',
     'mensheskeit',
-    'menshevism',
-    'mensile',
-    'mensinga',
-    'menslaws',
-    'mensonge',
-    'mensonges',
-    'menston',
-    'menstralis',
-    'menstries',
-    'menstrual/childbirth',
-    'menstruations',
-    'mensuel',
-    'mensur',
-    'mensurabilis',
-    'mensurans',
     'mentadent',
-    'mentaility',
-    'mental-art-scientists',
-    'mental-behavioural',
-    'mental-disorder',
-    'mental-handicap',
-    'mental-hospital',
-    'mental/',
-    'mental/aural',
-    'mental/behavioural',
-    'mental/physical/sensory',
-    'mental/spiritual',
-    'mentalistically',
-    'mentalit&eacute',
-    'mentality\'',
-    'mentalizes',
     'mentally-damaging',
-    'mentally-deficient',
-    'mentally-disabled',
-    'mentally.',
-    'mentalness',
-    'mente',
-    'mentec',
-    'mentem',
-    'menten',
-    'menteri',
-    'mentholated',
-    'mentholyptus',
-    'menthorpe',
-    'menti',
-    'mention-in-despatches',
-    'mentioned&rehy;in-the-text',
     'mentioned-is',
-    'mentioned/bragged/gloated',
-    'mentioned_now',
-    'mentionisque',
-    'mentionn&eacute',
-    'mentirola',
-    'mentle/pybus',
-    'mentlewicz',
-    'mentmore/buckinghamshire',
-    'mentor-girls',
-    'mentor/coach',
-    'mentorn',
-    'mentouri',
-    'ments',
-    'mentwater',
-    'mentzelopoulos',
     'menu&ndash;driven',
-    'menu-like',
-    'menu-makers',
-    'menu-planning',
-    'menu.exe',
-    'menu.tif',
-    'menu/windowing',
-    'menued',
-    'menuhin.',
-    'menuhin/concert',
-    'menuing',
-    'menus.',
-    'menzieses',
-    'meol',
-    'meoooww',
-    'mep/',
     'mephibosheth',
-    'mephiste',
-    'mephistophelian',
-    'mephistopholean',
-    'mepkins',
-    'meppem',
-    'meptid',
-    'meq/l',
-    'mer-doll',
-    'mer-people',
-    'mer/29',
-    'mer=danseuse',
-    'merab',
-    'merabello',
-    'meralomas',
-    'meramec',
     'merapi',
-    'merbau',
-    'merca',
-    'mercad&eacute',
-    'mercadona',
-    'mercados',
-    'mercante',
-    'mercantil',
-    'mercaptoacetate',
-    'mercaptobutyrate',
-    'mercatorfonds',
-    'mercatoria',
-    'merceaux-descloux',
-    'merced',
-    'mercedes-owner',
-    'mercedeses',
     'mercenaries-between',
-    'mercenariness',
-    'mercer-like',
-    'mercer/glosters',
-    'mercerie',
-    'merces',
-    'merch&aacute;n',
-    'merchand',
-    'merchandiseable',
-    'merchandises',
-    'merchandize',
-    'merchandizing',
-    'merchanged',
-    'merchant-bank',
-    'merchant-banker',
-    'merchant-bankers',
     'merchant-capitalist',
-    'merchant-navy',
-    'merchant-princes',
-    'merchant-ship',
-    'merchant-shipper',
-    'merchanteable',
-    'merchantry',
-    'merchants/d-i-y',
-    'merche',
-    'merchel',
-    'merci&rehy;less',
-    'mercia-northumbria',
-    'mercia/sekers',
-    'merciables',
-    'mercian-welsh',
-    'mercie',
     'mercied',
-    'mercilessness',
-    'merciorum',
-    'mercis',
-    'merck-darmstadt',
-    'mercker',
-    'merco',
-    'mercounand',
-    'mercurialis',
-    'mercury-arc',
-    'mercury-contaminated',
-    'mercury-fulminate',
-    'mercury-gilded',
-    'mercury-gilding',
-    'mercury-hydride',
-    'mercury-poisoned',
     'mercury-townsend',
-    'mercury-us',
-    'mercury/water',
-    'mercurycards',
-    'mercy-full',
-    'mercy-killer',
-    'mercy-seat',
-    'mercy-truth',
-    'merdeaux',
-    'mere-existence',
-    'mere-pose',
-    'mere-smear',
-    'mereato',
-    'merebank',
-    'merebrook',
-    'meredaen',
     'meredith\'',
-    'meredith-lees',
-    'meredith/construction',
-    'meredydd',
-    'mereiles',
-    'merekesh',
-    'merels',
-    'merely-secular',
-    'merena',
-    'mereness',
-    'merensky',
-    'merer',
-    'meresyside',
-    'mereth',
-    'meretta',
-    'merevale',
     'mereway',
-    'mereworth',
-    'mergellina',
-    'mergence',
-    'mergency',
-    'merger-and-acquisition',
-    'merger-mad',
-    'merger-mania',
-    'merger/approximation',
-    'merger/demerger',
-    'mergh',
-    'meria',
-    'meriadoc-peregrin-fredegar-type',
-    'merian',
-    'meriana',
-    'meric',
     'merid',
-    'merideth',
-    'meridew',
-    'meridians.',
-    'meridiennes',
-    'meridyth',
-    'merie',
-    'merifield',
-    'merignac',
-    'merigomish',
-    'merikas',
-    'merily',
-    'merina',
-    'meringer',
-    'merisel-dns',
-    'meriski',
     'merismus',
-    'merissa',
-    'meristems',
-    'merit-based',
-    'merit-free',
-    'merit-order',
-    'merit-pay',
-    'merit-ratings',
-    'merit.47',
-    'merite',
-    'meritina',
-    'meritocracies',
-    'meritocratically',
-    'meritoracy',
-    'merits/demerits',
-    'meritus',
     'merkadal',
-    'merkava',
-    'merkaz-shinui',
-    'merkels',
-    'merkers',
-    'merkez',
-    'merkhets',
-    'merkis',
-    'merkland',
-    'merkusii',
-    'merlane',
-    'merleau-ponty\'',
-    'merlin-engined',
-    'merlin-gerin',
-    'merlin-powered',
-    'merlin-vision',
     'merlina',
-    'merlino',
-    'merlis',
-    'merlo',
-    'merlon',
-    'mermaid-like',
-    'mermann',
-    'mermans',
-    'mermelstein',
-    'mermet',
-    'mermis',
-    'mermy',
-    'mernie',
-    'merofled',
-    'meroitic',
-    'meronymously',
     'meropenem',
-    'meropidae',
-    'merostomes',
-    'meroz',
-    'merpins',
-    'merq',
-    'merr.',
-    'merrell/brother',
-    'merret',
-    'merribell',
-    'merrick/ex-conservator',
-    'merrid',
-    'merrill-lynch',
-    'merriness',
-    'merriott',
-    'merripen',
     'merrit',
-    'merrith',
-    'merrithewveterans',
-    'merritots',
-    'merriwell',
-    'merriwether',
-    'merron',
-    'merry&ndash;go&ndash;round',
-    'merry-coloured',
-    'merry-eyed',
-    'merry-go',
-    'merry-go-world',
-    'merry-goround',
-    'merry-looking',
-    'merry-makers',
-    'merryat',
     'merrycrest',
-    'merrycroft',
-    'merryfields',
-    'merryhill',
-    'merrykirk',
-    'merryland',
-    'merrylegs',
-    'merrymount',
-    'merryvale',
-    'merryville',
-    'mersault',
-    'merschell',
-    'merseburg-leuna',
-    'merser',
-    'mersery',
-    'mersey-based',
     'mersey-beaty',
-    'merseyide',
-    'merseylink',
-    'merseyman',
-    'merseyside-built',
-    'merseyside-inspired',
-    'merseysideborn',
-    'merseysippi',
-    'mersham-marsham',
-    'mersin&ccedil;ik',
-    'mersin&ccedil;k',
-    'mersky',
-    'merso-meagalla',
-    'mersyebus',
-    'mersyside',
-    'mertel',
     'mertens',
-    'mertensia',
-    'mertensio-atriplicetum',
-    'mertes',
-    'merthiolate',
-    'mertin',
-    'mertle',
-    'mertonian',
-    'mertoun',
-    'mertz-fairhurst',
-    'meruere',
-    'merule',
-    'mervayle',
-    'mervia',
-    'merwin',
-    'merwyn',
     'meryon',
-    'meryvn',
-    'merz\'',
-    'merzenich',
-    'merzey',
-    'merzifon',
-    'mes&rehy',
-    'mesabi',
-    'mesach',
-    'mesad',
-    'mesago',
-    'mesalazine=0.91',
-    'mesalazine=132',
-    'mesalazine=187',
-    'mesalazine=7.4',
-    'mesalazine=90',
     'mesangium',
-    'mesarovic',
-    'mesarovich',
-    'mesarteam',
-    'mescalero',
-    'mescan',
-    'mescede',
-    'meschino',
-    'mescit',
-    'mesclatz',
-    'mesclum',
-    'mescus',
-    'mesel',
-    'mesel\'',
-    'mesembryanthemum',
-    'mesen-',
     'mesencephalic',
-    'mesens',
-    'mesenterial',
-    'mesenterica',
-    'mesenteries',
-    'mesepimeron',
-    'meses',
-    'meseyside',
-    'mesh-length',
-    'mesh-lengths',
-    'mesha',
-    'meshach',
-    'meshech',
-    'meshfoil',
-    'meshix',
-    'meshketians',
     'meshkini',
-    'meshorer',
-    'meshri',
-    'meshuggas',
-    'meshugge',
-    'meshuggeh',
-    'meshuggenah',
-    'meshuggener',
-    'meshuginer',
-    'mesi',
-    'mesiodistally',
-    'meskhetian-run',
-    'meskhi',
-    'meskito',
-    'mesko',
-    'meslay',
     'meslier-but',
-    'meslin',
-    'mesmerically',
-    'mesmeriser',
-    'mesmorph',
-    'meso-american',
-    'meso-and',
-    'meso-economy',
-    'meso-europe',
-    'meso-organization',
-    'mesobiliverdin',
-    'mesocuticle',
-    'mesodapedon',
-    'mesogenetic',
-    'mesolimulus',
-    'mesolongion',
     'mesomedes',
-    'mesomorphs',
-    'mesophilic',
-    'mesophytic',
-    'mesoplodon',
-    'mesopotamla',
-    'mesorectum',
-    'mesoscope',
-    'mesosphere',
-    'mesosternum',
-    'mesosuchus',
-    'mesotheliomas',
-    'mesothelium',
-    'mesotherapy',
-    'mesotidal',
-    'mesozoic-tertiary',
     'mespilus',
-    'mespl&eacute',
-    'mesrepresentation',
-    'mesrine',
-    'mess&rehy;ages',
-    'mess-clearer',
-    'mess-deck',
-    'mess-hall',
-    'mess-mates',
-    'mess-up',
-    'mess-ups',
-    'mess.',
-    'mess/message',
-    'mess/messing',
-    'messac',
-    'message-bearing',
     'message-box',
-    'message-directed',
-    'message-driven',
-    'message-self',
-    'message-switching',
-    'message.and',
-    'message/department',
-    'message/medium',
-    'message/talking',
-    'messagecentral400',
-    'messaged',
-    'messageq',
-    'messager/wagner',
-    'messageries',
-    'messages.',
-    'messages/call',
     'messageway',
-    'messagi',
-    'messaien',
-    'messaih',
-    'messalina-like',
-    'messaoudi',
-    'messapic',
-    'messdeck',
-    'messell',
-    'messenger&mdash;well',
-    'messenger-boy',
-    'messenger-operated',
-    'messenger-pigeons',
-    'messenian',
-    'messenmensch',
-    'messensee',
     'messerli',
-    'messerschmidt-b&ouml;lkow-blohm',
-    'messerschmits',
-    'messeturm',
-    'messgaes',
-    'messiaen.',
-    'messiah-like',
-    'messiasgeheimnis',
-    'messiest',
-    'messin',
-    'messines-wytschaete',
-    'messire',
-    'messmates',
-    'messmer',
-    'messo',
-    'messon',
     'messores',
-    'messr',
-    'messrooms',
-    'messtechnic',
-    'messtechnik',
-    'messy-eating',
-    'mest',
-    'mesta.',
-    'mestdagh',
-    'mestier',
-    'mestiza',
-    'mestizo&rehy;looking',
-    'mestrino',
-    'mesulam',
-    'mesuree',
-    'mesurees',
     'mesurements',
-    'meswick',
-    'mesyats',
-    'met-31',
-    'met-a-mor-fohsis',
-    'met-courage',
-    'met-curzon',
-    'met-does',
-    'met-enkephalin',
-    'met-style',
-    'met-thr-glu',
-    'met-with',
-    'met/in',
-    'met1',
-    'met100(co)',
-    'met163',
     'met95',
-    'meta-',
-    'meta-anorthosite',
-    'meta-deductions',
-    'meta-epic',
-    'meta-experiment',
-    'meta-fiction',
-    'meta-filter',
-    'meta-grammatical',
-    'meta-igneous',
-    'meta-knowledge',
-    'meta-legal',
-    'meta-levels',
-    'meta-metal',
-    'meta-music',
-    'meta-numerical',
     'meta-party',
-    'meta-phenylene',
-    'meta-phosphate',
-    'meta-policy',
-    'meta-procedure',
-    'meta-procedures',
-    'meta-programming',
-    'meta-reality',
-    'meta-sediments',
-    'meta-social',
-    'meta/gartner',
-    'metabasic',
-    'metabates',
-    'metabisulphate',
-    'metabisulphites',
-    'metabolisable',
     'metabolism-temperature',
-    'metabolities',
-    'metaborate',
-    'metacarpals',
-    'metacarpus',
-    'metacognitive',
-    'metacommentary',
-    'metacommunication',
-    'metaconid',
-    'metacurare',
-    'metadiscourse',
-    'metadolerites',
-    'metaethics',
-    'metafile',
-    'metagabbro',
-    'metagama',
     'metagenesis',
-    'metagenic',
-    'metagenis',
-    'metaglyphix',
-    'metahistorical',
-    'metaiodobenzylguanidine',
-    'metair',
-    'metairie',
-    'metal&rehy;working',
-    'metal&uacute;rgicos',
-    'metal*',
-    'metal-and-leathery',
-    'metal-and-light',
-    'metal-backed',
-    'metal-barred',
-    'metal-bashers',
     'metal-bearing',
-    'metal-boned',
-    'metal-bucketed',
-    'metal-cased',
-    'metal-casting',
-    'metal-catalysed',
-    'metal-chased',
-    'metal-clipped',
-    'metal-co',
-    'metal-coated',
-    'metal-contaminated',
-    'metal-contamination',
-    'metal-cutters',
-    'metal-d',
-    'metal-depleted',
-    'metal-detectors',
     'metal-finishing',
-    'metal-glass',
-    'metal-grey',
-    'metal-grinding',
-    'metal-hard',
-    'metal-headed',
-    'metal-hip',
-    'metal-insulator-metal',
-    'metal-insulator-semiconductor',
-    'metal-ion',
-    'metal-legged',
-    'metal-making',
-    'metal-mania',
-    'metal-oxide',
-    'metal-polyethylene',
-    'metal-production',
     'metal-puzzle',
-    'metal-ring',
-    'metal-rod',
-    'metal-roofed',
-    'metal-sided',
-    'metal-skinned',
-    'metal-sparkling',
-    'metal-stud',
-    'metal-tasting',
-    'metal-to-metal',
-    'metal-walled',
-    'metal-winged',
-    'metal-wire',
-    'metal-worker',
-    'metal/alloy',
-    'metal/ceramic',
     'metal/cheese',
-    'metal/glam',
-    'metal/jazz',
-    'metal/plastic',
-    'metal/rock',
-    'metalanguages',
-    'metaldehyde',
-    'metalepsis',
-    'metalflake',
-    'metalinguistically',
-    'metalinguistics',
-    'metalious',
-    'metaliser',
-    'metaller',
-    'metallic-based',
-    'metallic-funky',
     'metallic-looking',
-    'metallic-sounding',
-    'metallic-type',
-    'metallica-esque',
-    'metallica-scale',
-    'metallica/gn\'r',
-    'metallireducens',
-    'metallisation',
-    'metallist',
-    'metallocenes',
-    'metallochrome',
-    'metallochromic',
-    'metalloenzymes',
-    'metallogenesis',
-    'metallogenic/economic',
-    'metallogeny',
     'metallognic',
-    'metallography',
-    'metalloproteinase-1',
-    'metallothionein',
-    'metallothionin-1',
-    'metallurgic',
-    'metally',
-    'metalogicon',
-    'metaloxide',
-    'metalpoints',
-    'metals-processing',
-    'metalscape',
-    'metalurjic',
-    'metalwoods',
-    'metalworker-farmers',
-    'metalworth',
     'metameres',
-    'metamorphis',
-    'metamorphise',
-    'metamorphizing',
-    'metamorphosist',
-    'metamorphosized',
-    'metanauplii',
-    'metanodianone',
-    'metanorite',
-    'metaphor&aacute',
-    'metaphor(s)',
-    'metaphorein',
-    'metaphorizes',
-    'metaphosphate',
-    'metaphosphoric',
-    'metaphosphoric/0.5%',
     'metaphyical',
-    'metaphysical\'',
-    'metaphysical-flavoured',
-    'metaphysical/political',
-    'metaphysique',
-    'metaplasia.',
-    'metaplasic',
-    'metapleural',
-    'metapodials/phalanges',
-    'metapolitico',
-    'metapontion',
-    'metar',
-    'metars',
-    'metasediment-derived',
-    'metasediments-locally',
-    'metasequoia',
     'metasequoiaglyptostroboides',
-    'metastasize',
-    'metastasized',
-    'metastatis',
-    'metastrongyloidea',
-    'metastrongyloids',
-    'metasyn',
-    'metasystox',
-    'metat',
-    'metatarsophalangeal',
-    'metatarsus',
-    'metatextual',
-    'metatheoretical',
-    'metatheories',
-    'metatheria',
-    'metatherian',
     'metatherians',
-    'metathorax.',
-    'metaurus',
-    'metavolcanics',
-    'metavolcanosedimentary',
-    'metazoans.',
-    'metburys',
-    'metcalfe/friends',
-    'metcalfe/mother',
-    'metce',
-    'metclafe',
-    'metcom',
-    'metelic',
-    'meteloides',
-    'metempsychotic',
-    'meteor-observing',
     'meteor-riddled',
-    'meteoreolgia',
-    'meteorically',
-    'meteoritical',
-    'meteoriticist',
-    'meteoritics',
-    'meteorizomai',
-    'meteorlogical',
-    'meteoroids',
-    'meteorolgy',
-    'meter-feeding',
-    'meter-setting',
-    'meter_as_well',
-    'meterage',
-    'metereological',
-    'metermaid',
     'metermarism',
-    'meterorolgists',
-    'meterzone',
-    'metf\'-lacz',
-    'metfab',
-    'meth&rehy;odologically',
-    'methacryl-substituted',
-    'methacrylic',
-    'metham',
-    'methamphetamine',
-    'methanation',
-    'methane-gas',
-    'methane-poor',
-    'methane/air',
-    'methanes',
-    'methanobrevibacter',
     'methanoic',
-    'methanol-based',
-    'methanol-ethyl',
-    'methanol-fuelled',
-    'methanol/5%',
-    'methanol/hydrogen',
-    'methanol:water',
-    'metharam',
-    'methel',
-    'methersgate',
-    'methicillin',
-    'methings',
-    'methiocarb',
-    'methiodine',
-    'methionine-containing',
-    'methionine-requiring',
     'methionines',
-    'methisazone',
-    'methist&emacr;mi',
-    'methley',
-    'methlick',
-    'methly',
-    'methlyphenidate',
-    'metho',
-    'method-1',
-    'method-ists',
-    'method-oriented',
-    'method.a',
-    'methodenstreite',
-    'methodi',
-    'methodic',
-    'methodies',
     'methodist-like',
-    'methodistiaid',
-    'methodo',
-    'methodolog',
-    'methodological-individualistic',
-    'methodologies/case',
-    'methodologized',
-    'methodology.',
-    'methodone',
-    'methods-time-measurement',
-    'methods.dii',
-    'methods.electrical',
-    'methods.glial',
-    'methods.yac',
-    'methods/approaches/techniques',
-    'methodsfor',
     'methof',
-    'methoklone',
-    'methoni',
-    'methonium',
-    'methoprene',
-    'methotyrexate',
-    'methought/the',
-    'methow',
-    'meths/gas',
-    'methuen:1982',
-    'methuselahs',
-    'methwold',
-    'methyl-',
-    'methyl-2-methylpropenoate',
-    'methyl-cellulose',
-    'methylanthranilate-coated',
     'methylation-sensitive',
-    'methylbutane',
-    'methyleblue',
-    'methylenblue',
-    'methylether',
-    'methylhydroperoxide',
-    'methylisocyanate',
-    'methylophilus',
-    'methylotrophus',
-    'methylphosphinothioic',
-    'methylphosphonic',
-    'methylsergide',
-    'methylsilane',
-    'methylterbutylether',
-    'methyltransferase(s)',
-    'methylumbelliferone',
     'methyr',
-    'methysricum',
-    'methysticum',
-    'meticulously-applied',
-    'meticulously-honed',
-    'meticulously-researched',
-    'meticulously.',
-    'metiers',
-    'metin',
-    'metinae',
-    'metingham',
-    'metis',
-    'metisization',
-    'metj185am',
-    'metkovic',
-    'metlife',
     'meto',
-    'metodo',
-    'metonomy',
-    'metonym',
-    'metoponorthus',
-    'metour/nizan',
-    'metr',
-    'metraphone',
-    'metre(s)',
-    'metre-bound',
-    'metre-diameter',
-    'metre-governed',
-    'metre-square',
-    'metre-steps',
-    'metre.this',
-    'metrein',
     'metres-high',
-    'metres-square',
-    'metres.so',
-    'metric-minded',
-    'metric_apart',
-    'metrica',
-    'metricationists',
-    'metridia',
-    'metrios',
-    'metris',
-    'metritis',
-    'metrizamide',
-    'metrizoate',
-    'metro&ndash;cammel',
-    'metro&rehy;land',
-    'metro-gauge',
     'metro-goldwyn-mayer',
-    'metro-goldwyn-meyer',
-    'metro-news',
-    'metrode',
-    'metrodorus',
-    'metrolands',
-    'metrolight',
-    'metromex',
-    'metronomically-recited',
-    'metropia',
-    'metrople',
-    'metroplises',
-    'metropoli-tan',
-    'metropolis-frontier',
-    'metropolis/satellite',
-    'metropolitaine',
     'metropolitan-based',
-    'metropolitan-immigrant',
-    'metropolitan-minded',
-    'metropolitan-vickers',
-    'metropolitan/watneys',
-    'metropolitana',
-    'metropoltan',
-    'metroprolol',
-    'metroset',
-    'metrosoft',
-    'metrotracks',
-    'metrovic',
-    'metrovick',
-    'metroxylon',
-    'metsys',
-    'mettall',
     'mettassler',
-    'mette',
-    'metternich-like',
-    'metterwang',
-    'metteur',
-    'metteya',
-    'mettle.',
-    'metton',
-    'mettrick',
-    'mettych&uring',
-    'metulla',
-    'metusalem',
-    'metwali',
-    'metwand',
-    'metyard',
-    'metzgerhunt',
     'metzkers',
-    'meubles-magazin',
-    'meudun',
-    'meugan',
-    'meulenaere',
-    'meuleng',
-    'meulent',
-    'meuli',
-    'meulon',
-    'meurant',
-    'meuric',
-    'meurling',
-    'meuser',
-    'meusien',
-    'meute',
-    'mev&rehy;energy',
     'meva\'a',
-    'mevanian',
-    'mevius',
-    'mevlida',
-    'mevo',
-    'mevryn',
-    'mew-tater',
-    'mewanwhile',
-    'mewar',
-    'mewhort',
-    'mewitt',
-    'mewl',
-    'mewnni',
-    'mewow',
-    'mewson',
-    'mex-spanish',
     'mexandeau',
-    'mexica',
-    'mexican-americans',
-    'mexican-born',
-    'mexican-built',
-    'mexican-led',
-    'mexican-type',
-    'mexican-us',
-    'mexican/irish',
-    'mexican/u.s.',
-    'mexicans\'long',
-    'mexicas',
-    'mexicas/aztecs',
-    'mexico&ndash;australia',
-    'mexicoland',
-    'meximum',
     'mexiteria',
-    'mextech',
-    'mexx',
-    'meyat',
-    'meye',
-    'meyer-rochow',
-    'meyerhold',
-    'meyerowitz',
-    'meyfarth',
-    'meyir',
-    'meyler',
-    'meymac',
-    'meymott',
-    'meynard',
-    'meyrin',
-    'meysner',
     'meyssac',
-    'meytens',
-    'mezaepiplanar',
-    'mezcal',
-    'mezen',
-    'mezera',
-    'mezeritzer',
-    'mezerville',
-    'mezezo',
-    'mezhdunarodanaya',
-    'mezhdunarodnaya',
-    'mezhdunarodnye',
-    'mezheb',
-    'meziane',
-    'mezini',
-    'meziniindustry',
     'mezo',
-    'mezur&eacute;s',
-    'mezy',
-    'mezzacorona',
-    'mezzanine-level',
-    'mezzanines',
-    'mezzich',
-    'mezzo-piano',
-    'mezzo-sop',
-    'mezzo-sopranos',
-    'mezzotinting',
-    'mf.c',
-    'mf1200pw',
-    'mf3200db',
-    'mf4',
-    'mfa-governed',
     'mfa-see',
-    'mfanya',
-    'mfg/pro',
-    'mfhp2',
-    'mfi=33',
-    'mfid',
-    'mfl',
-    'mfm-type',
-    'mfm/mft',
-    'mfsb',
-    'mfwangano',
-    'mfy',
-    'mg++',
-    'mg-104',
-    'mg-atp',
-    'mg-based',
     'mg-kg',
-    'mg.h',
-    'mg.it',
-    'mg/100',
-    'mg/5',
-    'mg/cm',
-    'mg/day/kgbw',
-    'mg/h',
-    'mg/hour',
-    'mg/kd/',
-    'mg/kd/day',
-    'mg/kg/h',
-    'mg/kg/min',
-    'mg/kg/minute',
-    'mg/liter',
-    'mg/mi',
     'mg/week',
-    'mg2+-free',
-    'mga',
-    'mgac',
-    'mgal',
-    'mgala',
-    'mgc',
-    'mgc.',
-    'mgc/v&amp;a',
-    'mgc1',
-    'mgcl1',
-    'mgflops',
-    'mgg',
-    'mgh',
-    'mgi-1',
-    'mgis-3d',
     'mgl',
-    'mgl-1',
-    'mglur1',
-    'mgonja',
-    'mgso',
-    'mgts',
-    'mgulu',
-    'mgumia',
-    'mgw',
-    'mh&amp;jr',
-    'mh-434',
-    'mh-mm',
-    'mh1081',
-    'mh16',
-    'mh28',
-    'mhadaidh',
     'mhail',
-    'mhaith',
-    'mhala',
-    'mhangami',
-    'mhango',
-    'mhaol-doraidh',
-    'mhaonaigh',
-    'mhc.',
-    'mhcs',
-    'mhd',
-    'mheall',
-    'mhedrioni',
-    'mhenni',
-    'mhg',
-    'mhhngaahou',
-    'mhic\'ille',
     'mhk',
-    'mhlabunzima',
-    'mhlawuli',
-    'mhlg',
-    'mhlongo',
-    'mhm5',
-    'mhmood',
-    'mhoir',
-    'mhongo',
-    'mhow',
-    'mhr59',
-    'mhrhrhrn-naaaahooouuu',
-    'mhrhrnaaaahou',
-    'mhuilinn-ghaoith&mdash;windmill',
-    'mhuire',
-    'mi&nacute;o',
     'mi&ncaron;o',
-    'mi&ndash;2',
-    'mi&ndash;ht',
-    'mi&scaron;e&ncaron;sk&aacute',
-    'mi\'laddo',
-    'mi\'s',
-    'mi(r)',
-    'mi(s)',
-    'mi-1',
-    'mi-2',
-    'mi-402',
-    'mi-506',
-    'mi-6',
-    'mi-8',
-    'mi-8t',
-    'mi-allaqa',
     'mi-ari',
-    'mi-blunt',
-    'mi-fah-soh-lah-tee-doh',
-    'mi-hi-hi-hinkeeeeee',
-    'mi-ind/you',
-    'mi-microsoft',
-    'mi-rio-fil-oom',
-    'mi-rio-fill-oom',
-    'mi-teinte',
-    'mi.',
-    'mi16',
-    'mi16i',
-    'mi5\'',
-    'mi5-type',
-    'mi5/mi6',
-    'mi5/sas',
     'mia-pow',
-    'mia-such',
-    'miachael',
-    'miah/co-owner',
-    'miah/robbery',
-    'miaja',
-    'miale',
-    'mialster',
-    'miami-caribbean-london',
-    'miami-vice',
-    'miamisburg',
-    'miao',
-    'miaojin',
-    'miaou',
-    'miaoued',
-    'miaouing',
     'miaranarivo',
-    'miark',
-    'miasmal',
-    'miatchine',
-    'miau',
-    'miaus&eacute;e',
-    'mib-ii',
-    'mibei',
-    'mibiol',
-    'mic-level',
-    'mic-stand',
-    'mica-amphibole-rutile-ilmenite-diopside',
-    'mica-rich',
-    'micad',
-    'micadia',
-    'micado',
     'mical',
-    'micaleff',
-    'micawber-like',
-    'micawbers',
-    'mice-damage',
-    'mice-ridden',
-    'mice/m2',
-    'mich.',
-    'micha&lstrok',
-    'michabo',
-    'michael\'',
-    'michael-in-the-hamlet',
-    'michael-le-belfry',
-    'michael-martin',
-    'michael.',
-    'michael.mr',
     'michael/max',
-    'michael/wham',
-    'michaele-andrea',
-    'michaeledes',
-    'michaelham',
-    'michaelled',
-    'michai',
-    'michailovich',
-    'michalczeski',
-    'michalet',
-    'michalovic',
-    'michalowski',
-    'michals',
-    'michalski',
-    'michau',
-    'michaud',
     'michaux',
-    'michavila',
-    'miche',
-    'miche&aacute;l',
-    'micheas',
-    'michel-ange',
-    'michel-lug&egrave;ne',
-    'michela',
-    'michelagniolo',
-    'michelangelesque',
-    'micheldever',
-    'micheldever&ndash;ripple',
-    'michelena',
-    'micheler',
-    'micheli',
-    'micheliano',
     'michelin-man',
-    'michelin-star',
-    'michella',
-    'michelotti',
-    'michels/america',
-    'michelsen',
-    'michelsian',
-    'michelson-morley',
-    'michelsons',
-    'michelstadt',
-    'micheltrade',
-    'micheson',
-    'michi',
-    'michibata',
-    'michiel',
-    'michievously',
     'michm',
-    'michniks',
-    'michopoulos',
-    'micia',
-    'mick\'n\'keef',
-    'mick(19)',
-    'mickelgate',
-    'mickels',
-    'mickey-take',
-    'mickey-takers',
-    'mickey.',
-    'mickleden',
-    'mickledore',
-    'mickleover',
-    'micklethorpe',
-    'micklethwait',
     'micklethwaite',
-    'micklethwaites',
-    'mickleton/gloucestershire',
-    'micklow',
-    'micko',
-    'mickoleit',
-    'micotronx',
-    'micou',
-    'micr',
-    'micral',
-    'micralax',
-    'micram',
-    'micrarter',
-    'micrascan',
-    'micraversion',
-    'micrite',
     'micritic',
-    'micro&rehy;filament',
-    'micro&rehy;level',
-    'micro&rehy;surgery',
-    'micro-amps',
-    'micro-analysis',
-    'micro-anatomical',
-    'micro-aquaria',
-    'micro-biology',
-    'micro-brewers',
-    'micro-budget',
-    'micro-budgetary',
-    'micro-bug',
-    'micro-business',
-    'micro-camera',
-    'micro-capsules',
     'micro-cassette',
-    'micro-cellular',
-    'micro-channel-based',
-    'micro-circuit',
-    'micro-circuitry',
-    'micro-colony',
-    'micro-commission',
-    'micro-computer-based',
-    'micro-controller',
-    'micro-copies',
-    'micro-corporatism',
-    'micro-cosmic',
-    'micro-culture',
-    'micro-decisions',
-    'micro-densitometer',
-    'micro-devaluations',
     'micro-differentiation',
-    'micro-diffuser',
-    'micro-dissected',
-    'micro-driven',
-    'micro-econoic',
-    'micro-effects',
-    'micro-einsteins',
-    'micro-electric',
-    'micro-electrics',
-    'micro-electrode',
-    'micro-encapsulated',
-    'micro-engineers',
-    'micro-entrapped',
-    'micro-environmental',
-    'micro-evolution',
-    'micro-eyesight',
     'micro-fascism',
-    'micro-fibre',
-    'micro-fibres',
-    'micro-filmed',
-    'micro-fine',
-    'micro-fissures',
-    'micro-flocculation',
-    'micro-fossil',
-    'micro-functions',
-    'micro-grams',
-    'micro-gravitation',
-    'micro-gyros',
-    'micro-habitats',
-    'micro-historian',
-    'micro-hub',
-    'micro-injected',
     'micro-kelvins',
-    'micro-kernels',
-    'micro-lab',
-    'micro-layer',
-    'micro-light',
-    'micro-liner',
-    'micro-linked',
-    'micro-mainframe',
-    'micro-manage',
-    'micro-mapping',
-    'micro-meteorology',
-    'micro-mexico',
-    'micro-mini',
-    'micro-miniaturized',
-    'micro-minis',
-    'micro-modules',
     'micro-mold',
-    'micro-molecule',
-    'micro-monsters',
-    'micro-nationalism',
-    'micro-observations',
-    'micro-ocp',
-    'micro-operations',
-    'micro-orgamisms',
-    'micro-ovulo-gemmation',
-    'micro-penis',
-    'micro-phone',
-    'micro-plates',
-    'micro-prix',
-    'micro-pro',
-    'micro-program',
-    'micro-programmed',
     'micro-programming',
-    'micro-proof',
-    'micro-readers',
-    'micro-refrigerators',
-    'micro-resistances',
-    'micro-robotic',
-    'micro-roller',
-    'micro-route',
-    'micro-routes',
-    'micro-sanding',
-    'micro-scales',
-    'micro-scavengers',
-    'micro-select',
-    'micro-signals',
-    'micro-skirted',
-    'micro-skirts',
     'micro-so-ri-oom',
-    'micro-sociological',
-    'micro-soft-compatible',
-    'micro-species',
-    'micro-sponge',
-    'micro-studies',
-    'micro-systems',
-    'micro-testing',
-    'micro-thin',
-    'micro-thinly',
-    'micro-to',
-    'micro-tonal',
-    'micro-tools',
-    'micro-transceivers',
-    'micro-transmitter',
-    'micro-trauma',
     'micro-vascularity',
-    'micro-vax',
-    'micro-vessel',
-    'micro/macro',
-    'micro/ultrafiltration',
-    'micro2000',
-    'microaerobically',
-    'microaerophil',
-    'microamperes',
-    'microamps',
-    'microanalytical',
-    'microanalytics',
-    'microaneurysms',
-    'microangiopathic',
-    'microapps',
-    'microbarograph',
     'microbars',
-    'microbeam',
-    'microbetter',
-    'microbial-mat',
-    'microbially',
-    'microbio&rehy;logy',
-    'microbioclastic',
-    'microbiolgoical',
-    'microbiologic',
-    'microbiologically',
-    'microbiologie',
-    'microbiology/biotechnology',
-    'microbite',
-    'microblaise',
-    'microbore',
-    'microbrain',
     'microbrewing',
-    'microbridges',
-    'microburner',
-    'microcalanus',
-    'microcapsule',
-    'microcarcinoids',
-    'microcarpa',
-    'microcassettes',
-    'microcellector',
-    'microcentrifugation',
-    'microcentrifuge',
-    'microchannel-based',
-    'microcheck',
-    'microchef',
-    'microchemical',
-    'microchemotaxis',
     'microchi',
-    'microchip-controlled',
-    'microchip-production',
-    'microchrome',
-    'microclimatological',
-    'microcline',
-    'micrococci',
-    'microcoded',
-    'microcolonies',
-    'microcolumns',
-    'microcomputer-assisted',
-    'microcomputer-controlled',
-    'microcomputer-style',
-    'microconcentrators',
-    'microcontinents',
-    'microcorporatism',
     'microcosmography',
-    'microcracks',
-    'microculture',
-    'microcurie',
-    'microcystin-r',
-    'microcystis',
-    'microcytic',
-    'microcytotoxicity',
-    'microdealions',
-    'microdeletion',
-    'microdensitometry',
-    'microdeposits',
-    'microdiagnostics',
-    'microdialysates',
-    'microdictyon',
-    'microdiet',
     'microdigitrapper',
-    'microdistribution',
-    'microdolomites',
-    'microdroplet',
-    'microeconometric',
-    'microeconomic-motivated',
-    'microedge',
-    'microelec&rehy;tronics',
-    'microelectric',
-    'microelectronically',
-    'microelectronics-controlled',
-    'microemboli',
-    'microemulsions',
-    'microencapsulation',
-    'microengineering',
-    'microenvironments',
     'microfabrication',
-    'microfarads',
-    'microfaunae',
-    'microfeed',
-    'microfeeders',
-    'microfibre/fleece',
-    'microfiching',
-    'microfilament-disrupting',
-    'microfilamentous',
-    'microfilm/fiche',
-    'microfilm/microfiche',
-    'microfilmer',
-    'microfingers',
-    'microfirms',
-    'microflagellates',
-    'microfoundations',
     'microfractures',
-    'microfunctions',
-    'microglanis',
-    'microglobe',
-    'micrografix',
-    'micrograms/',
-    'microgranite',
-    'microgranulomas',
-    'micrographically',
-    'microgravimetric',
-    'microgravimetry',
-    'microgroove',
-    'microhelios',
-    'microinjections',
-    'microinstruction',
-    'microinventory',
     'microkelvin',
-    'microkids',
-    'microlepidoptera',
-    'microlepsis',
-    'microlight-under',
-    'microlighters',
-    'microlites',
-    'microlithography',
-    'microliths',
-    'microliting',
-    'microlytics',
-    'micromanagement',
-    'micromania',
-    'micromanipulation',
-    'micromat',
-    'micromation',
     'micromechanical',
-    'micromechanics',
-    'micromeric',
-    'micrometeorite',
-    'microminiature',
-    'micromorphic',
-    'micron-sized',
-    'micronauts',
-    'microneedles',
-    'micronic',
-    'micronisation',
-    'micronization',
-    'micronodular',
-    'micronuclear',
-    'micronut',
-    'micronutrient',
     'microorgansisms',
-    'micropack',
-    'micropage',
-    'micropalaeontology',
-    'micropalama',
-    'microparticle',
-    'microphagous',
-    'microphar',
-    'microphenomenological',
-    'microphiura',
-    'microphorus',
-    'microphot',
-    'microphotograph',
-    'microphthalmic',
-    'microphyllus',
-    'microphysical',
     'microplane',
-    'microplanning',
-    'microplasmas',
-    'microplepis',
-    'micropolar',
-    'microporasil',
-    'micropores',
-    'microporus',
-    'micropower',
-    'micropowers',
-    'micropro',
-    'microprocedure',
-    'microprocessor(s)',
-    'microprocessor-',
-    'microprocessor-controlled',
-    'microprocessor-tuned',
     'microprocessor.',
-    'microprocessor.generated',
-    'microprocessor/motor',
-    'microprocessor/stepping',
-    'microprocssor-based',
-    'microprofessors',
-    'microprogrammer',
-    'micropropagated',
-    'micropross',
-    'micropublishing',
-    'micropulsations',
-    'microrefrigerators',
-    'microscanner',
-    'microscope-binocular-compass',
-    'microscope-borne',
-    'microscope-like',
     'microscope-maker',
-    'microscope.if',
-    'microscopick',
-    'microscoping',
-    'microscopium',
-    'microscpy',
-    'microscript',
-    'microseeding',
-    'microsemi',
-    'microsense',
-    'microsentinel',
-    'microsentinelux',
-    'microsites',
-    'microsof',
-    'microsoft&mdash;a',
-    'microsoft-3com',
     'microsoft-controlled',
-    'microsoft-insignia',
-    'microsoft-intel',
-    'microsoft-led',
-    'microsoft/insignia',
-    'microsoft/sympatex',
-    'micrososft',
-    'microsoystems',
-    'microspacing',
-    'microspeciation',
-    'microspecies',
-    'microspectral',
-    'microspectrophotometry',
-    'microsphaeric',
-    'microspores',
-    'microsporidians',
     'microstones',
-    'microstructures',
-    'microstylolite',
-    'microsurium',
-    'microsystemsinc',
-    'microtech',
-    'microthought',
-    'microthrombi',
-    'microthrombia',
-    'microthrombosis',
-    'microthrombus',
-    'microtidal',
-    'microtization',
-    'microtones',
-    'microtopographical',
-    'microtopography',
     'microtouch',
-    'microtransfusions',
-    'microtron',
-    'microtronic',
-    'microtwin',
-    'microtympanometry',
-    'microvasculature',
-    'microvax-2',
-    'microvaxs',
-    'microverb',
-    'microvesicles',
-    'microvesicular',
-    'microvideo',
-    'microviewdata/viewdata',
-    'microviewer',
-    'microvillate',
     'microvolume',
-    'microvp',
-    'microwave-friendly',
-    'microwave-packed',
-    'microwaveable',
-    'microweave',
-    'microwell',
-    'microworms',
-    'microwrite',
-    'microwriters',
-    'microwriting',
-    'micrprocessors',
-    'mictlan',
-    'micturate',
-    'mid&amp',
-    'mid&mdash;1017',
     'mid&mdash;1800s',
-    'mid&rehy;1860s',
-    'mid&rehy;1880s',
-    'mid&rehy;1945',
-    'mid&rehy;1950s',
-    'mid&rehy;1960s',
-    'mid&rehy;1980s',
-    'mid&rehy;20th',
-    'mid&rehy;afternoon',
-    'mid&rehy;blue',
-    'mid&rehy;day',
-    'mid&rehy;down',
-    'mid&rehy;essex',
-    'mid&rehy;hants',
-    'mid&rehy;life',
-    'mid&rehy;line',
     'mid&rehy;or',
-    'mid&rehy;priced',
-    'mid&rehy;step',
-    'mid&rehy;stream',
-    'mid&rehy;twentieth-century',
-    'mid&rehy;victorian',
-    'mid&rehy;western',
-    'mid&rehy;wing',
-    'mid\'',
-    'mid\'71',
-    'mid-&dollar;50s',
-    'mid-\'30s',
-    'mid-\'forties',
-    'mid-\'seventies',
-    'mid-\'thirties',
-    'mid-1',
     'mid-1006',
-    'mid-1017',
-    'mid-1250s',
-    'mid-1290s',
-    'mid-12th',
-    'mid-1360s',
-    'mid-1430s',
-    'mid-1440s',
-    'mid-1470s',
-    'mid-1530s',
-    'mid-1580s',
-    'mid-1590s',
-    'mid-15c',
-    'mid-15th',
-    'mid-1600s',
-    'mid-1650s',
     'mid-1658',
-    'mid-1680s',
-    'mid-1720s',
-    'mid-1730s',
-    'mid-1740s',
-    'mid-1750s',
-    'mid-1754',
-    'mid-1770s',
-    'mid-1780s',
-    'mid-17c',
-    'mid-17th-century',
-    'mid-1834',
-    'mid-1840',
-    'mid-1863',
-    'mid-1912',
-    'mid-1916',
     'mid-1919',
-    'mid-1920',
-    'mid-1921',
-    'mid-1925',
-    'mid-1931',
-    'mid-1937',
-    'mid-1938',
-    'mid-193os',
-    'mid-1952&ndash;53',
-    'mid-1953',
-    'mid-1955',
-    'mid-1958',
-    'mid-195os',
-    'mid-1960s.there',
-    'mid-1964',
-    'mid-1966',
     'mid-19705',
-    'mid-1972',
-    'mid-1974',
-    'mid-1976',
-    'mid-1990\'s',
-    'mid-1994.',
-    'mid-1997',
-    'mid-20',
-    'mid-30-year-old',
-    'mid-40',
-    'mid-520s',
-    'mid-570s',
-    'mid-5th',
-    'mid-620s',
-    'mid-6o',
-    'mid-70&deg;f',
     'mid-705',
-    'mid-760s',
-    'mid-770s',
-    'mid-80',
-    'mid-820s',
-    'mid-830s',
-    'mid-850s',
-    'mid-878/autumn',
-    'mid-893',
-    'mid-895',
-    'mid-act',
-    'mid-adolescence',
-    'mid-affair',
-    'mid-afternoons',
-    'mid-aged',
-    'mid-altitude',
     'mid-american',
-    'mid-anecdote',
-    'mid-annandale',
-    'mid-apricot',
-    'mid-argyll',
-    'mid-arm',
-    'mid-bar',
-    'mid-baroque',
-    'mid-based',
-    'mid-battle',
-    'mid-beat',
-    'mid-beaufort',
-    'mid-biased',
-    'mid-bite',
-    'mid-blistering',
-    'mid-buckinghamshire',
     'mid-bucks',
-    'mid-burst',
-    'mid-calder',
-    'mid-calf-length',
-    'mid-calves',
-    'mid-canterbury',
-    'mid-careers',
-    'mid-cbd',
-    'mid-chase',
-    'mid-cheek',
-    'mid-chest',
-    'mid-chew',
-    'mid-classicism',
-    'mid-clavicular',
-    'mid-click',
-    'mid-cold',
     'mid-com',
-    'mid-concern',
-    'mid-conversation',
-    'mid-cost',
-    'mid-cred',
-    'mid-crisis',
-    'mid-deal',
-    'mid-deb',
-    'mid-december.',
-    'mid-decorated',
-    'mid-depth',
-    'mid-depths',
-    'mid-devonian',
-    'mid-distance',
-    'mid-distant',
-    'mid-donegall',
     'mid-dorsal',
-    'mid-downs',
-    'mid-eastern',
-    'mid-eightie',
-    'mid-eocene',
-    'mid-escape',
-    'mid-estimate',
-    'mid-estuary',
-    'mid-europe',
-    'mid-explanation',
-    'mid-feb',
-    'mid-feb.',
-    'mid-field/upfront/wings',
-    'mid-fifth-century',
-    'mid-filed',
-    'mid-floor',
     'mid-flourish',
-    'mid-forenoon',
-    'mid-france',
-    'mid-frequencies',
-    'mid-friday',
-    'mid-fury',
-    'mid-gestation',
-    'mid-gloster',
-    'mid-grapple',
-    'mid-greater',
-    'mid-grey/black',
-    'mid-grope',
-    'mid-gulf',
-    'mid-gwent',
-    'mid-gybe',
-    'mid-gyre',
     'mid-gyre.',
-    'mid-holocene',
-    'mid-hour',
-    'mid-hundreds',
-    'mid-innings',
-    'mid-ir',
-    'mid-irons',
-    'mid-jejunal',
-    'mid-jerk',
-    'mid-jump',
-    'mid-l960s',
-    'mid-lake',
-    'mid-lancashire',
-    'mid-later',
-    'mid-launch',
-    'mid-leicestershire',
     'mid-lengths',
-    'mid-letter',
-    'mid-levels',
-    'mid-lobular',
-    'mid-londonderry',
-    'mid-markets',
-    'mid-massacre',
-    'mid-match',
-    'mid-meal',
-    'mid-melody',
-    'mid-metaphase',
-    'mid-middle',
-    'mid-moan',
-    'mid-module',
-    'mid-monthly',
-    'mid-morrissey',
     'mid-motion',
-    'mid-mouthful',
-    'mid-movement',
-    'mid-muharram',
-    'mid-nervous',
-    'mid-nineteen-fifties',
-    'mid-nineteen-nineties',
-    'mid-nineteen-seventies',
-    'mid-ninth-century',
-    'mid-norway',
-    'mid-oceans',
-    'mid-october.',
-    'mid-oesophagus',
-    'mid-off.',
-    'mid-ordovician',
-    'mid-oxfordshire',
     'mid-pace',
-    'mid-pacific',
-    'mid-palaeozoic',
-    'mid-paragraph',
-    'mid-parallelism',
-    'mid-parts',
-    'mid-passage',
-    'mid-patrol',
-    'mid-performance',
-    'mid-plane',
-    'mid-plastron',
-    'mid-plunge',
-    'mid-postglacial',
-    'mid-prices',
-    'mid-production',
-    'mid-prowl',
     'mid-purple',
-    'mid-pyraniki',
-    'mid-quack',
-    'mid-quaternary',
-    'mid-race',
-    'mid-reach',
-    'mid-recitative',
-    'mid-region',
-    'mid-rehearsal',
-    'mid-renaissance',
-    'mid-rh&ocirc;ne',
-    'mid-rib',
-    'mid-ricochet',
-    'mid-rock',
-    'mid-row',
-    'mid-satisfaction',
     'mid-saturday',
-    'mid-sava',
-    'mid-saxons',
-    'mid-scene',
-    'mid-scream',
-    'mid-sea',
-    'mid-search',
-    'mid-seasons',
-    'mid-seminar',
-    'mid-series',
-    'mid-setting',
-    'mid-seventeenth-centuries',
-    'mid-shelves',
-    'mid-shift',
-    'mid-shine',
-    'mid-shires',
     'mid-shots',
-    'mid-shout',
-    'mid-shudder',
-    'mid-sicily',
-    'mid-slam',
-    'mid-sleep',
-    'mid-slither',
-    'mid-slopes',
-    'mid-slouch',
-    'mid-soles',
-    'mid-south',
-    'mid-southern',
-    'mid-spangle',
-    'mid-spasm',
-    'mid-spate',
-    'mid-staffs',
     'mid-stage',
-    'mid-stalls',
-    'mid-step',
-    'mid-sternum',
-    'mid-story',
-    'mid-stratospheric',
-    'mid-strike',
-    'mid-stroke',
-    'mid-suede',
-    'mid-suffolk',
-    'mid-summers',
-    'mid-swallow',
-    'mid-syllable',
-    'mid-tale',
-    'mid-tariff',
-    'mid-tasman',
     'mid-tech',
-    'mid-terrace',
-    'mid-thatcher',
-    'mid-thigh-length',
-    'mid-thighs',
-    'mid-thought',
-    'mid-thrust',
-    'mid-tide',
-    'mid-to-date',
-    'mid-to-senior',
-    'mid-tokugawa',
-    'mid-tones',
-    'mid-transfer',
-    'mid-tread',
-    'mid-trill',
-    'mid-trimester',
     'mid-tune',
-    'mid-tweed',
-    'mid-twenty-first',
-    'mid-twenty-fourth',
-    'mid-value',
-    'mid-victorianese',
-    'mid-victorians',
-    'mid-volume',
-    'mid-vomit',
-    'mid-voyage',
-    'mid-war',
-    'mid-wars',
-    'mid-waters',
-    'mid-weights',
-    'mid-whinny',
-    'mid-wifery',
     'mid-winged',
-    'mid.',
-    'mid/and',
-    'mid/class',
-    'mid/early',
-    'mid/high',
-    'mid/late',
-    'mid/south',
-    'mid/top',
-    'mid=brown',
-    'midas-like',
-    'midases',
-    'midatlantic',
-    'midbrain.',
-    'midbrain/forebrain',
-    'midcdo',
     'midcentrics',
-    'midclass-unique',
-    'midclasses',
-    'midcourt',
-    'midd\'bro',
-    'midd-larf',
-    'middangeard',
-    'midday-to-7pm',
-    'middele',
-    'middell',
-    'midden-field',
-    'middendorf',
-    'middendorfi',
-    'middenstansbank',
-    'midder',
-    'middesbrough',
     'middest',
-    'middie',
-    'middies',
-    'middiman',
-    'middle&rehy;and',
-    'middle&rehy;period',
-    'middle&rehy;rank',
-    'middle\'n\'bridge',
-    'middle\'un',
-    'middle-aged-to-elderly',
-    'middle-ages',
-    'middle-back',
-    'middle-belt',
-    'middle-biased',
-    'middle-bracket',
-    'middle-class-dominated',
     'middle-class-people',
-    'middle-class-prison',
-    'middle-class-tinted',
-    'middle-coat',
-    'middle-cut',
-    'middle-deemed-secondary',
-    'middle-demand',
-    'middle-distant',
-    'middle-earner',
-    'middle-earth&rehy;or',
-    'middle-eights',
-    'middle-england',
-    'middle-europe',
-    'middle-finger',
-    'middle-grade',
-    'middle-grader',
     'middle-jumper',
-    'middle-land',
-    'middle-lower-middle',
-    'middle-manager',
-    'middle-march',
-    'middle-of-nowhere',
-    'middle-of-the',
-    'middle-of-the-',
-    'middle-of-the-nightish',
-    'middle-of-the-table',
-    'middle-persons',
-    'middle-pocket',
-    'middle-power',
-    'middle-priced',
-    'middle-right',
-    'middle-scale',
     'middle-sector',
-    'middle-sixties',
-    'middle-size',
-    'middle-stage',
-    'middle-stratum',
-    'middle-strength',
-    'middle-terraced',
-    'middle-to-low',
-    'middle-to-ruling',
-    'middle-water',
-    'middle-with',
-    'middle-women',
-    'middle.',
-    'middle.class',
-    'middle/',
-    'middle/edges',
     'middle/operational',
-    'middle/working-class',
-    'middlebie',
-    'middlebrooks',
-    'middlebrough',
-    'middledorp',
-    'middlefield',
-    'middlefields',
-    'middlehams',
-    'middlemanagers',
-    'middleness',
-    'middlepass',
-    'middler',
-    'middleranking',
-    'middles-brough',
-    'middlesborough-born',
     'middlesbrogh',
-    'middlesbrough-manchester',
-    'middlesbrough-masvingo',
-    'middlesbrough/stockton',
-    'middlesbroughwrought',
-    'middlesbrouhgh',
-    'middlesex.',
-    'middlesfield',
-    'middleshrough',
-    'middlesmass',
-    'middlesmoor',
-    'middleton-by-wirksworth',
-    'middleton-l',
-    'middleton-one-row',
-    'middleton/hunt',
-    'middleton/pro',
     'middleway',
-    'middleweights',
-    'middlewhich',
-    'middlewomen',
-    'middlewood',
-    'middleyard/gloucestershire',
-    'middling-middle',
-    'middling-rank',
-    'middling-sized',
-    'middling.prosperous',
-    'middx/leics',
-    'mideighteenth-century',
-    'midende',
-    'midendehigher',
-    'mideplan',
-    'midextreme',
     'midfacial',
-    'midfendic',
-    'midfield/striker',
-    'midfield/up',
-    'midfielder/attacker',
-    'midfielder/winger',
-    'midfieldplayer',
-    'midfifties',
-    'midfiled',
-    'midforties',
-    'midgard',
-    'midge&rehy;collecting',
-    'midge-infested',
-    'midge-like',
-    'midge-repellent',
-    'midgeod',
     'midgies',
-    'midgy',
-    'midheight',
-    'midi\'ed',
-    'midi-able',
-    'midi-based',
-    'midi-literate',
-    'midi-mapper',
-    'midi-mod',
-    'midi-only',
-    'midi-programmable',
-    'midi-pyrenees',
-    'midi-rugby',
-    'midi-sized',
-    'midi-skirt',
-    'midi-system',
     'midi-users',
-    'midi/fsk',
-    'midibuses',
-    'midinette',
-    'midinettes',
-    'midisized',
-    'midiverb',
-    'midjet',
-    'midla',
-    'midland-based',
-    'midland-bred',
-    'midland-montagu',
-    'midland-owned',
-    'midlands-born',
-    'midlands-north',
-    'midlands-shrewsbury',
     'midlands-tinged',
-    'midlands/ambulance',
-    'midlands/east',
-    'midlands/wales',
-    'midlandton',
-    'midlantic',
-    'midleading',
-    'midleweight',
-    'midlfield',
-    'midnight&ndash;7am',
-    'midnight-fog',
-    'midnight.and',
-    'midnighters',
-    'midnighticeskating',
-    'midnightish',
-    'midnites',
     'midocean',
-    'midoesophagus',
-    'midpiece',
-    'midprices',
-    'midquartile',
-    'midquotes',
-    'midradically',
-    'midrange-but-still-pricey',
-    'midrange/tweeter',
-    'midrashic',
-    'midrespiratory',
-    'midribs',
-    'midriffs',
-    'midrinovic',
-    'midrush',
-    'midseason',
     'midsections',
-    'midseventies',
-    'midsole.',
-    'midsoled',
-    'midsomers',
-    'midsommer',
-    'midspmn',
-    'midstride',
-    'midsum&rehy;mer',
-    'midsummer-night',
-    'midsummers',
-    'midtour',
-    'midventrally',
-    'midwales',
-    'midwaters',
-    'midways',
     'midweek-futba',
-    'midweights',
-    'midwickets',
-    'midwinter.',
-    'midwinters',
-    'midwintry',
-    'midwive',
-    'midy',
-    'mie&lsqb;u&rsqb;x',
-    'miebach',
-    'mieczysaw',
-    'miedziarek',
-    'miegroet',
-    'miegs',
-    'miehle',
-    'mielan',
     'mields',
-    'mielec',
-    'mieli',
-    'mielies',
-    'mienne',
-    'mieo',
-    'mierassa',
-    'mierda',
-    'mierlo',
-    'mieska',
-    'miessen',
-    'mieszko',
-    'mietpalaste',
-    'mietskasernen',
-    'mifbach',
-    'mifford',
     'miffy',
-    'mifta',
-    'miftah',
-    'mig&ndash;15',
-    'mig&ndash;21',
-    'mig&ndash;21s',
-    'mig&ndash;9',
-    'mig&rehy;31',
-    'mig-15uti',
-    'mig-23bn',
-    'mig-23s',
-    'mig-27',
-    'mig-2s',
-    'mig-31',
-    'mig21f',
-    'migan',
     'migas',
-    'migawd',
-    'migda',
-    'migdal',
-    'migeod',
-    'migeon',
-    'migeot',
-    'miggins',
-    'might&mdash',
-    'might\'',
-    'might\'nt',
-    'might-',
-    'might-potentially-have',
-    'might-time',
-    'might.have',
-    'mighty-vanned',
     'migliavacca',
-    'migliorini',
-    'migmatisation',
-    'migmatite',
-    'mignard',
-    'mignardises',
-    'mignards',
-    'mignedd',
-    'mignonne',
-    'mignonnette',
-    'mignons',
-    'mignott',
-    'migraine&rehy;vice',
-    'migraine-associated',
-    'migraine-diseases',
-    'migraine-induced',
     'migraine-inducing',
-    'migraine-specific',
-    'migrainee',
-    'migraineurs',
-    'migrainous',
-    'migraleves',
-    'migranes',
-    'migrat',
-    'migratable',
-    'migration.hthis',
-    'migration/',
-    'migrations.',
-    'migrative',
-    'migrator',
-    'migratoria',
-    'migratorius',
     'migrer',
-    'migril',
-    'migros',
-    'migu&eacute',
-    'migud',
-    'miguel.',
-    'mihailo',
-    'mihailov',
-    'mihailovi&cacute',
-    'mihajlo',
-    'mihajlovi&cacute',
-    'mihalis',
-    'mihalj',
-    'mihaljovic',
-    'mihi',
-    'mihiel',
     'mihoub',
-    'mihrimah',
-    'miii',
-    'mij',
-    'mijanou',
-    'mijarna',
-    'mijic',
-    'mijnssen',
-    'mik&oacute',
-    'mik-roe-don',
-    'mikaela',
-    'mikamo',
-    'mikasa',
-    'mike\'s',
-    'mike(3)',
-    'mike-positioning',
     'mike-stand',
-    'mike/prisoner',
-    'miked-up',
-    'mikehe',
-    'mikeladze',
-    'mikellides/architectural',
-    'mikeover',
-    'mikesell',
-    'mikestand',
-    'mikestands',
-    'miket',
-    'miketi',
-    'mikha\'il-galerie',
-    'mikhael',
-    'mikhailechenko',
-    'mikhaylov',
     'mikhaylovgrad',
-    'mikhlal',
-    'mikie',
-    'mikk',
-    'mikke',
-    'mikkelsen&lsqb;1985&rsqb',
-    'mikko',
-    'mikl&ograve;s',
-    'miklo&scaron;i&cacute',
-    'mikolas',
-    'mikos',
-    'mikrans',
-    'mikrocomputer',
-    'mikron',
-    'mikul&aacute&scaron',
-    'mikulas',
     'mil&iacute&ccaron',
-    'mil-05t',
-    'mil-1op',
-    'mil-3000',
-    'mil-spec',
-    'milac',
-    'milad',
-    'milais',
-    'milam',
-    'milan-born',
-    'milan-san',
-    'milan/lazio',
-    'milana',
-    'milanaise',
-    'milandu',
-    'milanes',
     'milanesi',
-    'milani',
-    'milanofiore',
-    'milans',
-    'milanuzzi',
-    'milap',
-    'milar/kevlar',
-    'milax',
-    'milbah',
-    'milbanke',
-    'milborne',
-    'milbourn',
-    'milbrook',
-    'milburgh',
-    'milburns',
-    'milbury',
     'milc',
-    'milcanowski',
-    'milch-mother',
-    'milchem',
-    'milchkontor',
-    'milcombe/oxfordshire',
-    'milcovs',
-    'milcreek',
-    'mild-eyed',
-    'mild-frost-hardy',
-    'mild-looking',
-    'mild-manneredness',
-    'mild-natured',
-    'mild-scented',
-    'mild-seeming',
-    'mild-steel',
     'mild/everyday/once-in-a-while/not-much-to-bother-about',
-    'mild/moderate',
-    'mild/severe',
-    'mild=12',
-    'mild=no',
-    'mildburh',
-    'milden',
-    'mildeneye',
-    'mildenstein',
-    'mildew-infested',
-    'mildewing',
-    'mildish',
-    'mildly-contaminated',
-    'mildly-explosive',
-    'mildred-i',
-    'mildrith',
     'mile&mdash;stones',
-    'mile&rehy;you',
-    'mile\'-which',
-    'mile-castle',
-    'mile-deep',
-    'mile-eater',
-    'mile-mark',
-    'mile-marks',
-    'mile-savers',
-    'mile-thick',
-    'mile.then',
-    'mile/0.25',
-    'mile/100',
-    'mile/kilometre',
-    'mile/mark',
-    'mile_away',
     'mileage.',
-    'milebush',
-    'milenko',
-    'mileoak',
-    'miler-turned-european',
-    'miles-',
-    'miles-an-hour',
-    'miles/1000rpm',
-    'miles/central',
-    'miles/community',
-    'miles/designer',
-    'miles/event',
-    'miles/father',
-    'miles/friends',
-    'miles/milton',
-    'miles/mother',
     'miles/radon',
-    'miles_away',
-    'milesmark',
-    'milestoned',
-    'miletich',
-    'miletopolis',
-    'milford-on-sea',
-    'milfs',
-    'milhauser',
-    'mili',
-    'milicent',
-    'milices',
-    'milici',
-    'milifinil-il',
-    'mililitre',
-    'milimetres',
     'miliolid',
-    'milis',
-    'milit&auml;rischer',
-    'milit&auml;rphilosophie',
-    'militancy\'',
-    'militant-dominated',
-    'militant-in-control',
-    'militant-related',
-    'militare',
-    'militarem',
-    'militarily-attractive',
-    'militarily-dominant',
-    'militarise',
-    'militarising',
-    'militarism.',
-    'militarization.remains',
     'militarkommandantur',
-    'military-aircraft',
-    'military-authoritarian',
-    'military-directed',
-    'military-educational',
-    'military-equipment',
-    'military-established',
-    'military-feudal',
-    'military-free',
-    'military-government',
-    'military-historian',
-    'military-intelligence',
-    'military-led',
-    'military-naval',
-    'military-oriented',
-    'military-ruled',
     'military-run',
-    'military-security',
-    'military-sounding',
-    'military-specification',
-    'military-trained',
-    'military-useful',
-    'military/',
-    'military/airline-style',
-    'military/civil',
-    'military/diplomatic',
-    'military/political',
-    'militarywithdrawal',
-    'militello',
-    'militia-controlled',
-    'militia-operated',
-    'militiae',
     'militiyev',
-    'milium',
-    'milivoj',
-    'miliyel',
-    'miliyel*',
-    'milj&ouml;partiet',
-    'miljacka',
-    'milk&rehy;van',
-    'milk-and',
-    'milk-and-blood',
-    'milk-bank',
-    'milk-bar',
-    'milk-based',
-    'milk-borne',
-    'milk-break',
-    'milk-brother',
     'milk-cans',
-    'milk-cart',
-    'milk-chocolate',
-    'milk-clotting',
-    'milk-cows',
-    'milk-derivative',
-    'milk-distribution',
-    'milk-drinking',
-    'milk-farmers',
-    'milk-fermenting',
-    'milk-girl',
-    'milk-glass',
-    'milk-green',
-    'milk-horses',
-    'milk-like',
-    'milk-making',
     'milk-manufacturers',
-    'milk-meats',
-    'milk-mother',
-    'milk-mug',
-    'milk-nuts',
-    'milk-pails',
-    'milk-pale',
-    'milk-powder',
-    'milk-processing',
-    'milk-producers',
-    'milk-production',
-    'milk-ration',
-    'milk-recorded',
-    'milk-round',
-    'milk-sated',
-    'milk-sensitive',
     'milk-shakes',
-    'milk-snatcher',
-    'milk-soaked',
-    'milk-sops',
-    'milk-specific',
-    'milk-vat',
-    'milk-with-soya',
-    'milk-withholding',
-    'milk/meat',
-    'milkana',
-    'milkbar',
-    'milkbottles',
-    'milkfed',
-    'milkflower',
-    'milkhouse',
-    'milkin',
     'milking-side',
-    'milkline',
-    'milklion',
-    'milkman-designed',
-    'milknut-meal',
-    'milksops',
-    'milkstar',
-    'milktime',
-    'milkweeds',
-    'milkwoman',
-    'milkwomen',
-    'milkwood',
-    'milky-blue',
-    'milky-eyed',
-    'milky-looking',
-    'milky-smelling',
     'milky-soft',
-    'milky-to-cheesy',
-    'mill&pound;-man',
-    'mill\'',
-    'mill-bern',
-    'mill-bills',
-    'mill-buildings',
-    'mill-cottages',
-    'mill-designing',
-    'mill-employed',
-    'mill-girl',
-    'mill-hand',
-    'mill-house',
-    'mill-hut',
-    'mill-manager',
-    'mill-master',
     'mill-masters',
-    'mill-owning',
-    'mill-oxen',
-    'mill-servant',
-    'mill-stone',
-    'mill-stream-and',
-    'mill-wall',
-    'mill-wheels',
-    'mill-wrights',
-    'mill-yard',
-    'mill.',
-    'mill/rousseau',
-    'millar.',
-    'millar/northamptonshire',
-    'millardair',
-    'millards',
     'millary',
-    'millbrae',
-    'millbridge',
-    'millbuie',
-    'millcroft',
-    'mille-feuilles',
-    'mille-foil',
-    'mille-quatre-cents-quatre-vingts-deux',
-    'millean',
-    'millecolonnes',
-    'milledge',
-    'milleens',
-    'millegranosa',
-    'millenarians',
-    'millendreath',
-    'millenial',
     'millenium/electronic',
-    'millenius',
-    'millennio',
-    'milleone',
-    'millepedes',
-    'miller-dollard',
-    'miller-nordenhake',
-    'miller/auctioneer',
-    'miller/champion',
-    'miller/dee',
-    'miller/gloucestershire',
-    'miller/mother',
-    'miller/nurse',
-    'miller/rics',
-    'miller/sotheby',
-    'millere',
     'millerfield',
-    'millerhall',
-    'millerites',
-    'millerston',
-    'millerus',
-    'millesimovsk&yacute',
-    'millet-like',
-    'milleton',
-    'millfield-educated',
-    'millgarth',
-    'millham_et',
-    'millhand',
-    'milli-',
-    'milli-electronvolts',
-    'milli-kelvin',
-    'milli-kelvins',
     'milli-light-second',
-    'milli-seconds',
-    'millia',
-    'milliammeter',
-    'milliamphours',
-    'milliband',
-    'millicent/wiltshire',
-    'millichamp',
-    'millichope',
-    'millidarcy',
-    'millidegrees',
-    'millidyne',
-    'millie/yvonne/mme',
-    'milliegrey',
-    'milliemes',
-    'milliequivalents',
     'millieu',
-    'milligan/rolls',
-    'milligham',
-    'milligramme',
-    'millihertz',
-    'millikin/vulcan',
-    'milliman',
-    'millime',
-    'millimeter',
-    'millimeters',
-    'millimetr&eacute;es',
-    'millimetre-bedded',
-    'millimetre-shallow',
-    'millimetre-thin',
-    'millimetre-wave',
-    'millimicrons',
     'millinchip',
-    'millington-hawes/researcher',
-    'millington-smythe',
-    'millingtons',
-    'millinocet',
-    'millio',
-    'million\'',
-    'million-&dollar;100,000',
-    'million-&dollar;5,000',
-    'million-&dollar;7,000',
-    'million-100,000',
-    'million-2,500',
-    'million-3,577',
-    'million-30,000',
-    'million-500',
-    'million-80',
     'million-a-week',
-    'million-acre',
-    'million-deal',
-    'million-dollar-a-film-dudley',
-    'million-fold',
-    'million-g195',
-    'million-hour',
-    'million-line',
-    'million-millionth',
-    'million-murdering',
-    'million-sesterce',
-    'million-token',
-    'million-ton-per-year',
-    'million-tonnes',
-    'million-transistor',
-    'million-us&dollar;50,000',
     'million-volt',
-    'million-year',
-    'million.that',
-    'million.yesterday',
-    'million/100m',
-    'million1',
-    'millionaire-',
-    'millionaire-in-fact',
-    'millionaire-to-be',
-    'millionaires-to-be',
-    'millionaires/journalists/crazed',
-    'millionairesses',
-    'millionare',
-    'millionincreaseincrease',
-    'millionish',
-    'millionnaire',
     'millions-of-years-old',
-    'millions-strong',
-    'millions.',
-    'millions.but',
-    'millipore-filtered',
-    'millipore-waters',
-    'milliprime',
-    'millis',
-    'millisec.',
-    'milliskirt',
-    'milliuon',
-    'millook',
-    'millor',
-    'milloraine',
-    'milloshi',
-    'millowners',
     'millponds',
-    'millpools',
-    'millrinds',
-    'mills/ap',
-    'mills/brother',
-    'mills/gary',
-    'mills/gwr',
-    'mills/mother',
-    'millsom',
-    'millsy',
-    'millton',
-    'milltowns',
-    'millview',
-    'millwall/arsenal',
-    'millward-sadler/southampton',
-    'millward/stevens',
     'millworker',
-    'milman',
-    'miln',
-    'milna',
-    'milner&ndash;holland',
-    'milner-barry',
-    'milnerite',
-    'milnerites',
-    'milnes-gaskell',
-    'milnor',
-    'milnthorpe',
-    'milo&scaron;-marasli',
-    'milon',
-    'milorad',
-    'milosrod',
-    'milou',
     'milovice',
-    'milovidov',
-    'milovy',
-    'milp',
-    'milpar',
-    'milquetoast',
-    'milroy-type',
-    'milsch',
-    'milsom.',
-    'milspec',
-    'milsted',
-    'milstone',
-    'miltary',
-    'milthorpe',
-    'miltiadis',
-    'milton-humberside',
     'milton-keynes',
-    'milton-under-wychwood',
-    'miltonisms',
-    'miltons',
-    'miltoun',
-    'miluk',
-    'milun',
-    'milupan',
-    'milutinovic',
-    'milvio',
-    'milwaukee-based',
-    'milway',
-    'milwukee',
-    'mimachal',
-    'mimagreement',
-    'mimar',
     'mimatsu',
-    'mime-show',
-    'mimeche',
-    'mimeo',
-    'mimeograph',
-    'mimers',
-    'mimeses',
-    'mimetically',
-    'mimiambi',
-    'mimiced',
-    'mimicks',
-    'mimicries',
-    'mimicry-memorization',
-    'mimicus',
-    'mimieux',
-    'miminal',
     'miminum',
-    'mimir',
-    'mimpow',
-    'mimran',
-    'mimsing',
-    'mimura',
-    'min&eacute',
-    'min-assembler',
-    'min-buses',
-    'min-ha-to',
-    'min-peak',
-    'min-y-don',
-    'min.40',
-    'min/max',
-    'min7',
-    'minaccia',
     'minack',
-    'minadeo',
-    'minale',
-    'minami',
-    'minamino',
-    'minaret-like',
-    'minareted',
-    'minaretted',
-    'mination',
-    'minato-ku',
-    'minatome',
-    'minatorily',
-    'minature',
-    'mincassian',
-    'mince-pie',
-    'mince-stained',
     'minced-meat',
-    'minced-up',
-    'minced.',
-    'mincefish',
-    'mincers',
-    'minceur',
-    'minchem',
-    'mincin\'',
-    'mincingly',
-    'minckes',
-    'minckiewicz',
-    'mincy',
-    'mind&mdash;that',
-    'mind&rehy;altering',
-    'mind&rehy;blowing',
-    'mind&rehy;numbing',
     'mind&rehy;numbingly',
-    'mind&rehy;s',
-    'mind\'',
-    'mind-\'i',
-    'mind-again',
-    'mind-and-eye-boggling',
-    'mind-benders',
-    'mind-bendingly',
-    'mind-blasted',
-    'mind-boggler',
-    'mind-brain',
-    'mind-breaking',
-    'mind-catcher',
-    'mind-chains',
-    'mind-changing',
-    'mind-crushingly',
     'mind-deadening',
-    'mind-destroying',
-    'mind-dizzying',
-    'mind-down',
-    'mind-expansion',
-    'mind-fazing',
-    'mind-filter',
-    'mind-forg',
-    'mind-fuck',
-    'mind-games',
-    'mind-guards',
-    'mind-jolting',
-    'mind-lessening',
-    'mind-manipulators',
-    'mind-map',
-    'mind-maps',
     'mind-movie',
-    'mind-moving',
-    'mind-mushing',
-    'mind-nature',
-    'mind-opening',
-    'mind-picture',
-    'mind-pounding',
-    'mind-pulverising',
-    'mind-sap',
-    'mind-saving',
-    'mind-screams',
-    'mind-searing',
-    'mind-seeds',
-    'mind-shatteringly',
-    'mind-slaved',
-    'mind-slaves',
     'mind-stopping',
-    'mind-stunning',
-    'mind-tech',
-    'mind-to-mind',
-    'mind-transforming',
-    'mind-trip',
-    'mind-widening',
-    'mind-you',
-    'mind-your-own-business',
-    'mind.2',
-    'mind.it',
-    'mind.united',
-    'mind/matter',
-    'mind_even',
-    'mindbending',
-    'mindbendingly-dull',
     'mindblank',
-    'mindcraft/microprose',
-    'minder-speak',
-    'minder/presenter',
-    'mindfully',
-    'mindgames',
-    'mindgames-in-the-desert',
-    'mindin',
-    'minding&rehy;this',
-    'mindlocked',
-    'mindolluin',
-    'mindon',
-    'mindowyergo',
-    'mindphaser',
-    'minds/admit',
-    'minds/conditioned',
     'mindscaping',
-    'mindsets',
-    'mindshare',
-    'mindstorms',
-    'mindstyle',
-    'mindsucker',
-    'mindtrap',
-    'mindus',
-    'mindwalker',
-    'mindwiping',
-    'mine&rehy;field',
-    'mine&rehy;lofty',
-    'mine\'',
-    'mine-and-your-social',
-    'mine-detecting',
-    'mine-detector',
     'mine-field',
-    'mine-free',
-    'mine-head',
-    'mine-hunters',
-    'mine-layer',
-    'mine-leaching',
-    'mine-managers',
-    'mine-mouth',
-    'mine-owning',
-    'mine-prodder',
-    'mine-sweepers',
-    'mine-tailings',
-    'mine-workings',
-    'mine/quarry',
-    'mine_for',
-    'minebea',
     'mineiro',
-    'minelayer',
-    'minelaying',
-    'minella',
-    'mineminemine',
-    'minenwerfers',
-    'mineowner',
-    'mineowners',
-    'mineral-containing',
-    'mineral-exploration',
-    'mineral-extracting',
-    'mineral-extraction',
-    'mineral-laden',
-    'mineral-loving',
-    'mineral-occurrence',
-    'mineral-only',
     'mineral-poor',
-    'mineral-processing',
-    'minerale',
-    'mineralimportexport',
-    'mineralist',
-    'mineralizes',
-    'mineralizing',
-    'minerall',
-    'mineralocorticoid',
-    'mineralogic',
-    'mineroper&uacute',
-    'mineroperu',
-    'mineros',
-    'miners.',
-    'minerv\'a',
-    'minestra',
     'mineswept',
-    'minetown',
-    'minette',
-    'mineurs',
-    'mineva',
-    'minewatch',
-    'minewatching',
-    'minexp',
-    'minfu',
-    'ming-chien',
-    'ming-dynasty',
-    'ming-hui',
-    'ming-min',
-    'ming-porcelain',
-    'ming/qing',
-    'mingana',
     'minginish.',
-    'mingograf',
-    'mingograph',
-    'mingos',
-    'mingqi',
-    'minheer',
-    'mini&rehy;classic',
-    'mini&rehy;trunking',
-    'mini-acoustical',
-    'mini-advertising',
-    'mini-agricultural',
-    'mini-ailerons',
-    'mini-airliner',
-    'mini-apartheid',
-    'mini-aquaria',
-    'mini-articles',
     'mini-assault',
-    'mini-audit',
-    'mini-australian',
-    'mini-bank',
-    'mini-basket',
-    'mini-bazaar',
-    'mini-bead',
-    'mini-beasts',
-    'mini-bins',
-    'mini-biographies',
-    'mini-bites',
-    'mini-blazer',
-    'mini-blazers',
-    'mini-blob',
-    'mini-booms',
-    'mini-brain',
     'mini-bridal',
-    'mini-budgets',
-    'mini-buffet',
-    'mini-buffets',
-    'mini-buttons',
-    'mini-buying',
-    'mini-cabbing',
-    'mini-campaign',
-    'mini-captain',
-    'mini-car',
-    'mini-cassette',
-    'mini-castors',
-    'mini-catalogue',
-    'mini-cathedral',
-    'mini-celebrations',
-    'mini-cells',
     'mini-cement',
-    'mini-chitted',
-    'mini-chromosomes',
-    'mini-cities',
-    'mini-city',
-    'mini-civil',
-    'mini-classes',
-    'mini-clinics',
-    'mini-clubman',
-    'mini-coach',
-    'mini-collapse',
-    'mini-collections',
-    'mini-comm',
-    'mini-commandments',
-    'mini-compendium',
-    'mini-computing',
     'mini-concordat',
-    'mini-conference',
-    'mini-conglomerates',
-    'mini-congress',
-    'mini-console',
-    'mini-convention',
-    'mini-corporations',
-    'mini-costa',
-    'mini-country',
-    'mini-courses',
-    'mini-cow',
-    'mini-crane',
-    'mini-crime',
-    'mini-daffodils',
-    'mini-debate',
-    'mini-depression',
     'mini-devices',
-    'mini-dictionaries',
-    'mini-diesel',
-    'mini-digger',
-    'mini-din',
-    'mini-disasters',
-    'mini-discs',
-    'mini-disneyland',
-    'mini-docklands',
-    'mini-documentary',
-    'mini-dots',
-    'mini-dramas',
-    'mini-earth',
-    'mini-earthquakes',
-    'mini-electric',
-    'mini-emperor',
     'mini-epidemic',
-    'mini-er',
-    'mini-est',
-    'mini-estate',
-    'mini-ethnic',
-    'mini-exams',
-    'mini-exon',
-    'mini-fad',
-    'mini-fair',
-    'mini-fan',
-    'mini-farm',
-    'mini-feeder',
-    'mini-festival',
-    'mini-festivals',
-    'mini-figure',
-    'mini-file',
     'mini-films',
-    'mini-fits',
-    'mini-flock',
-    'mini-flower',
-    'mini-flutter',
-    'mini-forest',
-    'mini-format',
-    'mini-freezer',
-    'mini-gasometers',
-    'mini-gear',
-    'mini-general',
-    'mini-genocide',
-    'mini-goals',
-    'mini-goose',
-    'mini-grand',
-    'mini-greatest',
     'mini-grenade',
-    'mini-grenades',
-    'mini-grinder',
-    'mini-group',
-    'mini-guides',
-    'mini-gun',
-    'mini-gymnasia',
-    'mini-hansard',
-    'mini-headphones',
-    'mini-heater',
-    'mini-history',
-    'mini-hms',
-    'mini-holiday',
-    'mini-humbuckers',
-    'mini-hydro',
-    'mini-hypermarket',
     'mini-incisions',
-    'mini-industry',
-    'mini-institution',
-    'mini-instruments',
-    'mini-interview',
-    'mini-jack',
-    'mini-jacuzzi',
-    'mini-laboratory',
-    'mini-lagoons',
-    'mini-lake',
-    'mini-language',
-    'mini-launch',
-    'mini-lecture',
-    'mini-length',
-    'mini-limousine',
-    'mini-mail',
     'mini-majors',
-    'mini-malham',
-    'mini-map',
-    'mini-marrakech',
-    'mini-mass',
-    'mini-masters',
-    'mini-mattresses',
-    'mini-measures',
-    'mini-micro',
-    'mini-mills',
-    'mini-mixer',
-    'mini-mohican',
-    'mini-monologues',
-    'mini-monster',
-    'mini-mosque',
-    'mini-nation',
     'mini-note',
-    'mini-offices',
-    'mini-opera',
-    'mini-options',
-    'mini-orgy',
-    'mini-parade',
-    'mini-parliament',
-    'mini-performance',
-    'mini-pitch',
-    'mini-police',
-    'mini-politics',
-    'mini-portable',
-    'mini-prairies',
-    'mini-prints',
-    'mini-prisons',
-    'mini-prize',
     'mini-proof',
-    'mini-publication',
-    'mini-pupillages',
-    'mini-qualification',
-    'mini-quiz',
-    'mini-raid',
-    'mini-ramp',
-    'mini-rating',
-    'mini-rebellion',
-    'mini-recording',
-    'mini-region',
-    'mini-renaissance',
-    'mini-retrieval',
-    'mini-ridley',
-    'mini-royal',
-    'mini-rush',
     'mini-safari',
-    'mini-safe',
-    'mini-sailing',
-    'mini-scan',
-    'mini-scandal',
-    'mini-schaller',
-    'mini-scrambler',
-    'mini-screen',
-    'mini-season',
-    'mini-seasons',
-    'mini-section',
-    'mini-seed',
-    'mini-shampoo',
-    'mini-sharpening',
-    'mini-sheath',
-    'mini-shed',
     'mini-shellsuit',
-    'mini-shows',
-    'mini-sites',
-    'mini-sized',
-    'mini-skip',
-    'mini-slabs',
-    'mini-sleeper',
-    'mini-slump',
-    'mini-soap',
-    'mini-society',
-    'mini-spa',
-    'mini-spasm',
-    'mini-spot',
-    'mini-stack',
-    'mini-stage',
-    'mini-stages',
     'mini-states',
-    'mini-stegs',
-    'mini-strokes',
-    'mini-studio',
-    'mini-suite',
-    'mini-suites',
-    'mini-summa',
-    'mini-supercomputers',
-    'mini-supply',
-    'mini-surveys',
-    'mini-swimming',
-    'mini-swimming-pool',
-    'mini-tab',
-    'mini-talks',
-    'mini-temple',
-    'mini-test',
     'mini-textbook',
-    'mini-theatre',
-    'mini-theories',
-    'mini-theory',
-    'mini-thesis',
-    'mini-timbered',
-    'mini-tin',
-    'mini-toggle',
-    'mini-tournaments',
-    'mini-tours',
-    'mini-tractors',
-    'mini-train',
-    'mini-trampoline',
-    'mini-trampolines',
-    'mini-transceiver',
-    'mini-treaty',
     'mini-trespass',
-    'mini-tripod',
-    'mini-tripods',
-    'mini-trips',
-    'mini-twelfth',
-    'mini-unconformity',
-    'mini-uzis',
-    'mini-vegetables',
-    'mini-venues',
-    'mini-villages',
-    'mini-violin',
-    'mini-volcano',
-    'mini-wars',
-    'mini-watergate',
-    'mini-welfare-state',
-    'mini-windscale',
     'mini-woodland',
-    'mini-wurlitzer',
-    'mini/mainframe',
-    'mini/man',
-    'minia',
-    'miniate',
-    'miniature-like',
-    'miniaturise',
-    'miniaturising',
-    'miniaturism',
-    'minibead',
-    'minibrewery/pub',
-    'minibrute',
-    'minicars',
-    'minicell',
-    'minicells.',
     'minichiello',
-    'minichips',
-    'minicholecystostomy',
-    'minichrom',
-    'miniclubs',
-    'miniconglomerate',
-    'miniconstitutional',
-    'minicraft',
-    'minicruise',
-    'miniculares',
-    'minidictionaries',
-    'minidictionary',
-    'minidigger',
-    'minidisc',
-    'minidisk',
-    'miniepidemics',
     'miniextracts',
-    'minifex',
-    'minigas',
-    'minigrip',
-    'minigun',
-    'minihawks',
-    'minihomes',
-    'minijeeps',
-    'minilink',
-    'minim=32',
-    'minim=41',
-    'minim=60',
-    'minim=72',
-    'minim=g3',
-    'minimal-competency',
-    'minimalist/formal',
     'minimality',
-    'minimalized',
-    'minimalizing',
-    'minimally-furnished',
-    'minimally-sized',
-    'minimap',
-    'minimaxed',
-    'minimemoirs',
-    'minimills',
-    'minimiracle',
-    'minimissile',
-    'minimized.',
-    'minimse',
-    'minimu',
-    'minimum-efficiency',
-    'minimum-price',
     'minimum-spanning',
-    'minimum-to-minimum',
-    'minimum=o',
-    'minin',
-    'mininal',
-    'mining-and-steel',
-    'mining-timber',
-    'mining-to-manufacturing',
-    'mining-trucks',
-    'mining-were',
-    'mining/miro',
-    'mininote',
-    'mininum',
-    'miniott',
-    'minipig',
-    'minipigs',
     'miniprint',
-    'miniprinter',
-    'miniprotean',
-    'minipuls',
-    'minipump',
-    'minireefs',
-    'minires',
-    'minireviews',
-    'minirhizotron',
-    'minisatellite',
-    'minisatellites',
-    'minisaw',
-    'miniscalchi',
-    'miniscreamer',
-    'miniscribes',
-    'miniser',
     'minisis',
-    'miniskirted',
-    'minisleepers',
-    'minist&eacute;rial',
-    'minist&eacute;riels',
-    'ministates',
-    'ministe',
-    'ministeps',
-    'minister\'',
-    'minister-but',
-    'minister-civil',
-    'minister-councillor',
-    'minister-elect',
-    'minister-governor',
-    'minister-in-charge',
-    'minister-in-government',
     'minister-it',
-    'minister-level',
-    'minister-secretary',
-    'minister-wife',
-    'minister-with-the-film-star',
-    'minister.and',
-    'minister.he',
-    'minister/',
-    'minister/leader',
-    'minister/over',
-    'minister/person',
-    'minister/president',
-    'minister:shaikh',
-    'ministeres',
-    'ministerial-rank',
-    'ministerialb&uuml;rokratie',
     'ministerielle',
-    'ministerio',
-    'ministerium',
-    'ministers&mdash;not',
-    'ministers*',
-    'ministers-',
-    'ministers-resident',
-    'ministers/deputy',
-    'ministers/senior',
-    'ministers:ekrem',
-    'ministers:mohammed',
-    'ministersn',
-    'ministi&egrave;re',
-    'ministr&lt;ies&gt',
-    'ministrae',
-    'ministrate',
     'ministration',
-    'ministros',
-    'ministry&lt;ies&gt',
-    'ministry-fixated',
-    'ministry.',
-    'ministry/board',
-    'ministry/jourgensen',
-    'ministwy',
-    'minitanker',
-    'minitape',
-    'minite',
-    'minitech',
-    'minitrams',
-    'minitrunking',
-    'miniuscula',
-    'miniutes',
     'minix',
-    'minizen',
-    'minjelkiev',
-    'mink-coat',
-    'mink-coloured',
-    'mink-farm',
-    'mink-handled',
-    'mink-watcher',
-    'minka',
-    'minkler',
-    'minko',
-    'minko-phile',
-    'minkoff',
-    'minley',
-    'minllyn',
-    'minnas',
     'minneaoplis',
-    'minneapolis/st',
-    'minneapolitan',
-    'minnellian',
-    'minneola',
-    'minnesota*',
-    'minnessota',
-    'minney',
-    'minnich',
-    'minnie\'',
-    'minnigrey',
-    'minnions',
-    'minnoch',
-    'minnow-sized',
-    'minoan-style',
-    'minocytes',
     'minogue-free',
-    'minois',
-    'minol',
-    'minor&mdash',
-    'minor-b&flat',
-    'minor-c',
-    'minor-category',
-    'minor-f',
-    'minor-f7-e7',
-    'minor-g',
-    'minor-legend',
-    'minor-ninth',
-    'minor-public-school',
-    'minor-quantity',
-    'minoresses',
-    'minorettes',
     'minorial',
-    'minoritie',
-    'minorities/the',
-    'minority&rehy;reverted',
-    'minority-backed',
-    'minority-carrier',
-    'minority-dominated',
-    'minority-led',
-    'minority-orientated',
-    'minority-related',
-    'minority-ruled',
-    'minority.',
-    'minority/so-called',
-    'minorum',
-    'minotaur.',
-    'minotauro',
     'minow-pinkney',
-    'minox',
-    'minqi',
-    'mins/1989/colour/cert',
-    'minself',
-    'minshull-',
-    'minshull-beech',
-    'minsiet',
-    'minsker',
-    'minsmere-walberswick',
-    'minster-on-sea',
-    'minster-on-thanet',
-    'minstero',
-    'minstrel\'-style',
-    'minstry',
-    'mint(s)',
     'mint-fresh',
-    'mint/ammonia',
-    'mintage',
-    'mintbush',
-    'mintec.',
-    'mintel.',
-    'minterne',
-    'minters',
-    'minthe',
-    'mintlaw',
-    'minto-life',
-    'mintoe',
-    'mintoes',
-    'minton/oxford',
-    'minton/work',
-    'mintonesque',
     'mintons',
-    'mintrim',
-    'mintues',
-    'minty/neighbourhood',
-    'minuetto',
-    'minus-twenty-five',
-    'minusses',
-    'minut',
-    'minuta',
-    'minute-book',
-    'minute-books',
-    'minute-in',
-    'minute-man-3',
-    'minute-timer',
-    'minutehand',
-    'minutely-decorated',
     'minutely-remembered',
-    'minutes-hands-on',
-    'minutes/',
-    'minutes/appearance',
-    'minutes/decisions',
-    'minutes/mg',
-    'minutes=',
-    'minutes=four',
-    'minutesplus',
-    'minutilla',
-    'minutio',
-    'minutoides',
-    'minuts',
-    'minuty',
-    'miny-don',
-    'minzatu',
     'minzhang',
-    'mio\'',
-    'miocardico',
-    'miocene-aquitanian',
-    'miocene/pliocene',
-    'miocenic',
-    'miocenics',
-    'miochol',
-    'miodowicz',
-    'miogeosynclinal',
-    'miolnir',
-    'miomir',
-    'miond',
-    'miospores',
-    'miossens',
-    'miosson',
     'mip-',
-    'mips-compatible',
-    'mips-killer',
-    'mips-only',
-    'mips-osf/1',
-    'mips-sgi',
-    'mips-ultrix',
-    'mips/200',
-    'mips/5.3',
-    'mips/advanced',
-    'mips/silicon',
-    'mipstations',
-    'miquaman',
-    'mir&aacute',
-    'mir&oacute;-dalmau-gasch',
-    'mir&ograve',
     'mir&ouml',
-    'mir-adn',
-    'mir-eta',
-    'mir-i-boteh',
-    'mirabelle',
-    'mirabili',
-    'mirabilia',
-    'mirabilib',
-    'mirac',
-    'miracidia',
-    'miracle-making',
-    'miracle-man',
-    'miracles/',
-    'miracu&rehy;lously',
-    'miraculousloy',
-    'miracuously',
     'miracykiyskt',
-    'miradors',
-    'miraging',
-    'miragliano',
-    'miram',
-    'mirambo',
-    'miranda.',
-    'mirandais',
-    'mirandola',
-    'mirandula',
-    'miranov',
-    'mirant',
-    'miraphone',
-    'mirar',
-    'miraris',
-    'mirbach',
     'mirbel',
-    'mirca',
-    'mircale',
-    'mirchandani',
-    'mircho',
-    'mircon',
-    'mircosoft',
-    'mird',
-    'mirdita',
-    'mirehouse',
-    'mirela',
-    'mirelda',
-    'mirex',
-    'mirey',
-    'mirfin',
-    'mirfyn',
     'miriad',
-    'miriad-mind',
-    'miriad-minded',
-    'miriadminded',
-    'miriam:soto',
-    'miriam:that',
-    'miriam:they',
-    'miriam:we',
-    'miriam:what',
-    'miric',
-    'mirijana',
-    'mirimar',
-    'mirinda',
-    'mirista',
-    'mirizzi',
-    'mirj',
     'mirjam',
-    'mirjana',
-    'mirjanic',
-    'mirk',
-    'mirkin',
-    'mirknen',
-    'miroc',
-    'mironenko',
-    'mirontschuk',
-    'mirophar',
-    'miroton',
-    'mirounga',
-    'mirovaia',
-    'mirowski',
-    'mirren0',
-    'mirren:battle',
     'mirrie',
-    'mirrin',
-    'mirro',
-    'mirror&rehy;fronted',
-    'mirror&rehy;like',
-    'mirror-',
-    'mirror-anya',
-    'mirror-back',
-    'mirror-cabinet',
-    'mirror-calm',
-    'mirror-case',
-    'mirror-domed',
-    'mirror-door',
-    'mirror-eye',
-    'mirror-flat',
-    'mirror-frame',
     'mirror-frog',
-    'mirror-fronted',
-    'mirror-fusion',
-    'mirror-gloss',
-    'mirror-handles',
-    'mirror-helen',
-    'mirror-imaged',
-    'mirror-lensed',
-    'mirror-lined',
-    'mirror-match',
-    'mirror-meeting',
-    'mirror-of-nature',
-    'mirror-on-stand',
-    'mirror-plated',
-    'mirror-polished',
-    'mirror-posed',
     'mirror-practice',
-    'mirror-room',
-    'mirror-shiny',
-    'mirror-tiled',
-    'mirror-topped',
-    'mirror-work',
-    'mirror-world',
-    'mirror/picture',
-    'mirrorless',
-    'mirrorlike',
-    'mirrors/windows/sunroof',
-    'mirrorwork',
-    'mirrour',
-    'mirrours',
-    'mirryland',
-    'mirshani',
     'mirth-factor',
-    'mirth-making',
-    'mirthmaker',
-    'mirum',
-    'miruts',
-    'mirvic/speaking',
-    'mirville',
-    'mirving',
-    'mirvish',
-    'mirys',
-    'mirzabekov',
-    'mirzo',
-    'mis&ndash;matches',
-    'mis&rehy;calculation',
-    'mis&rehy;demeanour',
-    'mis&rehy;filed',
     'mis&rehy;leadingly',
-    'mis&rehy;match',
-    'mis&rehy;representation',
-    'mis&rehy;tresses',
-    'mis\'employ',
-    'mis-12es',
-    'mis-1es',
-    'mis-2es',
-    'mis-4es',
-    'mis-aim',
-    'mis-aligned',
-    'mis-allocation',
-    'mis-application',
-    'mis-applied',
-    'mis-appropriation',
-    'mis-assessment',
     'mis-attributes',
-    'mis-called',
-    'mis-catalogued',
-    'mis-changed',
-    'mis-classifying',
-    'mis-clubbing',
-    'mis-conduct',
-    'mis-contextualization',
-    'mis-dealings',
-    'mis-designed',
-    'mis-development',
-    'mis-dialled',
-    'mis-direction',
-    'mis-drafted',
-    'mis-estimation',
-    'mis-experiment',
     'mis-feeds',
-    'mis-filed',
-    'mis-filing',
-    'mis-fire',
-    'mis-firing',
-    'mis-fit',
-    'mis-formed',
-    'mis-fortune',
-    'mis-guessed',
-    'mis-guided',
-    'mis-hear',
-    'mis-hearings',
-    'mis-hooking',
-    'mis-informed',
-    'mis-interpreted',
-    'mis-judged',
     'mis-judgements',
-    'mis-keying',
-    'mis-led',
-    'mis-move',
-    'mis-observation',
-    'mis-oriented',
-    'mis-parking',
-    'mis-patterning',
-    'mis-perception',
-    'mis-placed',
-    'mis-pronounce',
-    'mis-pronunciation',
-    'mis-quote',
-    'mis-reading',
-    'mis-remembered',
-    'mis-routing',
     'mis-rule',
-    'mis-selection',
-    'mis-selling',
-    'mis-setting',
-    'mis-shapes',
-    'mis-shaven',
-    'mis-sion',
-    'mis-speaking',
-    'mis-spend',
-    'mis-spoken',
-    'mis-step',
-    'mis-stretched',
-    'mis-strike',
-    'mis-ter',
-    'mis-time',
-    'mis-timed',
     'mis-tracking',
-    'mis-translations',
-    'mis-tuning',
-    'mis-typed',
-    'mis-understandings',
-    'mis-written',
-    'misacknowledgements',
-    'misailides',
-    'misake',
-    'misaki',
-    'misanalysed',
-    'misanin',
-    'misanthropical-looking',
-    'misanthropist',
-    'misanthropomorphic',
-    'misapplications',
     'misapplies',
-    'misapply',
-    'misappropriates',
-    'misappropriations',
-    'misassessment',
-    'misattribute',
-    'misattributes',
-    'misbehavin',
-    'misbehavior',
-    'misbehaviour-.',
-    'misbehaviours',
-    'misbelief',
-    'misbeliever',
-    'misbranded',
-    'miscalculator',
-    'miscaptions',
     'miscare',
-    'miscarriage.',
-    'miscarried.',
-    'miscarries',
-    'miscegenate',
-    'miscegenated',
-    'miscellaneously',
-    'miscelle',
-    'miscerique',
-    'misch-masch',
-    'mischannelled',
-    'mischecked',
-    'mischief-\'you',
-    'mischief.',
-    'mischiefing',
-    'mischiefmakers',
     'mischieful',
-    'mischiefuous',
-    'mischosen',
-    'mischtschenkoana',
-    'misclassifying',
-    'miscoloured',
-    'miscommunicating',
-    'miscomprehend',
-    'miscon&rehy;ception',
-    'misconceives',
-    'misconduct/offence',
-    'misconducts',
-    'misconnected',
-    'misconnection',
-    'miscontrol',
-    'miscopy',
     'miscopyings',
-    'miscroscope',
-    'misdate',
-    'misdating',
-    'misdealings',
-    'misdeameanours',
-    'misdelivered',
-    'misdescribe',
-    'misdiagnose',
-    'misdiagnosedive',
-    'misdial',
-    'misdoings',
-    'misdoubt',
-    'misdoubts',
-    'miseducated',
-    'miseducating',
     'miselaneus',
-    'misely',
-    'misenum',
-    'misera',
-    'miserabili',
-    'miserablest',
-    'miserablish',
-    'miserably.',
-    'miserare',
-    'misere',
-    'misereatur',
-    'miseri',
-    'miserias',
-    'miserior',
-    'miseris',
-    'misermatic',
     'miserorum',
-    'misery-guts',
-    'miserygobs',
-    'miseryguts',
-    'miserywhip',
-    'misevicius',
-    'misfeasance/nonfeasance',
-    'misfiling',
-    'misfortunate',
-    'misfortunates',
-    'misfortuned',
-    'misgivingly',
-    'misgoverned',
-    'misgovernments',
-    'misgrief',
-    'misguardedly',
     'misguidance',
-    'mish-mashes',
-    'mish-take',
-    'mishab',
-    'mishael',
-    'mishak',
-    'mishake',
-    'mishandles',
-    'mishear',
-    'mishearings',
-    'misheck',
-    'mishish',
-    'mishka',
-    'mishmar',
-    'mishmeh',
-    'misho',
     'mishooks',
-    'misi&oacute;n',
-    'misick',
-    'misidentifies',
-    'misiewicz',
-    'misindica',
-    'misinformations',
-    'misintegration',
-    'misintepretation',
-    'misinterpretability',
-    'misiones',
-    'misir',
-    'misjoinder',
-    'misjustice',
-    'miskatonic',
-    'miskick',
     'miskicks',
-    'miskiewicz',
-    'miskin/graduate',
-    'miskine',
-    'misknitting',
-    'misknowledge',
-    'miskovic',
-    'misl-ed',
-    'mislays',
-    'misle',
-    'misleader',
-    'misleading-intermediate',
-    'misleading.14',
-    'misletoe',
-    'misliked',
-    'misling',
     'mismanage.',
-    'mismanagement.',
-    'mismanagers',
-    'mismated',
-    'mismeasure',
-    'mismo',
-    'misname',
-    'misnames',
-    'misner',
-    'misogynos',
-    'misonne',
-    'misoperation',
-    'misorient',
-    'misos',
-    'misouri',
-    'mispending',
     'misperceive',
-    'misperceiving',
-    'misperton',
-    'misplayed',
-    'mispresentation',
-    'misprinted',
-    'misprized',
-    'misproofs',
-    'mispunched',
-    'misquamacus',
-    'misr&aelig;d',
-    'misra/arifa',
-    'misrach',
-    'misrahi',
-    'misratis',
-    'misread-.ings',
     'misreckonings',
-    'misrecognising',
-    'misrecognizable',
-    'misrecognizes',
-    'misrecorded',
-    'misreports',
-    'misrepresentation&mdash;ss',
-    'misrepresentational',
-    'misrouted',
-    'misry',
-    'miss&mdash;give',
-    'miss\'t',
-    'miss-heard',
-    'miss-hit',
-    'miss-ish',
-    'miss-nothing',
     'miss-of-the-manor',
-    'miss-pass',
-    'miss-spelt',
-    'miss.',
-    'miss/ms/mrs/mr',
-    'missailidis',
-    'missakoulis',
-    'missambo',
-    'missarum',
-    'missarzhevksy.',
-    'missaticum',
-    'missed.',
-    'misselbrook',
-    'misselthwaite',
-    'missers',
-    'misserver',
     'misshaped',
-    'misshelved',
-    'missile-based',
-    'missile-bearing',
-    'missile-camp',
-    'missile-carrying',
-    'missile-gap',
-    'missile-guidance',
-    'missile-launchers',
-    'missile-maker',
-    'missilery',
-    'missilry',
-    'missimix',
-    'missimo',
-    'missing-',
-    'missing-link',
     'missing-person',
-    'missing-toothed',
-    'missing.joyce',
-    'missing/captured3723+',
-    'missing/captured500+n/a',
-    'missiological',
-    'mission&rehy;just',
-    'mission-bleeding-impossible',
-    'mission-committed',
-    'mission-critiques',
-    'mission-minded',
-    'mission-place',
-    'mission-sponsored',
-    'mission-station',
-    'mission-territories',
-    'mission.this',
     'mission/prophecy/witness',
-    'missionaries-by-force',
-    'missionaries.',
-    'missionary-minded',
-    'missionary-planted',
-    'missiones',
-    'missioning',
-    'missionis',
-    'missionising',
-    'missionize',
-    'missionized',
-    'missionizers',
-    'missionwissenschaft',
-    'mississipi',
-    'mississippi-alabama',
-    'mississuaga',
     'missle',
-    'missour',
-    'missouri-based',
-    'missouri-born',
-    'missouri-st',
-    'misspeaking',
-    'misspecified',
-    'misspeller',
-    'misspending',
-    'misspends',
-    'misssing',
-    'misstate',
-    'mist-beaded',
-    'mist-blue',
-    'mist-filtered',
-    'mist-laden',
     'mist-like',
-    'mist-producing',
-    'mist-shadow',
-    'mist-skeined',
-    'mist-snagged',
-    'mist-softened',
-    'mist-sprayed',
-    'mist-workings',
-    'mist-wraithed',
-    'mist.',
-    'mist/drizzle',
-    'mistah',
-    'mistaikes',
-    'mistakable',
-    'mistake&mdash',
-    'mistake&mdash;oh',
     'mistake\'',
-    'mistake-plagued',
-    'mistake-related',
-    'mistake.56',
-    'mistake/failing/looking',
-    'mistakeable',
-    'mistakenness',
-    'mistakes.',
-    'mistakes/dangers',
-    'mistakin\'',
-    'mistelback',
-    'mister-righted',
-    'misteries',
-    'misterioso',
-    'mistero',
-    'misterrrrr',
     'misters',
-    'mistervicepresident',
-    'mistery',
-    'misther',
-    'mistic',
-    'mistin\'',
-    'misting-up',
-    'mistinguett',
-    'mistinguette',
-    'mistitled',
-    'mistivoj',
-    'mistlethrush',
-    'mistlethrush-like',
-    'mistletoe-that',
-    'mistlin',
-    'mistral-20',
     'mistral-torn',
-    'mistral/ski-surf',
-    'mistranscribes',
-    'mistranslate',
-    'mistranslates',
-    'mistress-driven',
-    'mistressed',
-    'mistressmind',
-    'mistrials',
-    'mistris-faerie',
-    'mistry',
-    'mistubishi',
-    'mistur',
-    'mistwraith',
-    'misty-sounding',
-    'misty-white',
     'mistype',
-    'mistypings',
-    'misu',
-    'misuc',
-    'misumenops',
-    'misumi',
-    'misunderstand&rehy;ing',
-    'misunderstandig',
-    'misunderstandin\'',
-    'misurina',
-    'miswell',
-    'misyats',
-    'mitar',
-    'mitau',
-    'mitbewerber',
-    'mitcham/sutton',
     'mitched',
-    'mitchelham',
-    'mitchell-kernan',
-    'mitchell-moore',
-    'mitchell-pen',
-    'mitchell-rossdale',
-    'mitchell/child',
-    'mitchell/conservative',
-    'mitchell/county',
-    'mitchell/designer',
-    'mitchell/engineers',
-    'mitchell/fitness',
-    'mitchell/paediatrician',
-    'mitchell/pensioner',
-    'mitchell/playground',
-    'mitchell/station',
     'mitchell/swindon',
-    'mitchell/vehicle',
-    'mitchelton',
-    'mitchener',
-    'mitchenham',
-    'mitcheson',
-    'mitchie',
-    'mitchum-mania',
-    'mite.',
-    'miteb',
-    'mitek',
-    'miteyspice',
-    'mitglieder',
-    'mithai',
-    'mithans',
-    'mithileshwar',
     'mithl',
-    'mithos',
-    'mithranee',
-    'mithrim',
-    'mitigator',
-    'mitja',
-    'mitjaneta',
-    'mitjorn',
-    'mitkov',
-    'mitnick',
-    'mito',
-    'mitochondrially',
-    'mitochrondria',
-    'mitomycin',
-    'mitoses',
-    'mitossis',
     'mitoxine',
-    'mitraas',
-    'mitraillettes',
-    'mitral-valve',
-    'mitre-joints',
-    'mitredale',
-    'mitreing',
-    'mitrochondrial',
-    'mitrowitz',
-    'mitsingen',
-    'mitsiwa',
-    'mitsopoulos',
-    'mitsou',
-    'mitsouko',
-    'mitsu',
-    'mitsubishi-honda',
     'mitsubishi-related',
-    'mitsuhiko',
-    'mitsuibishi',
-    'mitsuko',
-    'mitsunori',
-    'mitsuru',
-    'mitsy',
-    'mittel-land',
-    'mittelalterlichen',
-    'mitteland&mdash;except',
-    'mittelegi',
-    'mitteleurop',
-    'mitteleuropean',
-    'mittellegi',
-    'mittelrhein-museum',
-    'mittelstaedt',
     'mittelzell',
-    'mitten/former',
-    'mittendorf',
-    'mittenwald',
-    'mitterramses',
-    'mitterrand-bush',
-    'mitterrand-kohl',
-    'mitterrandist',
-    'mittersill',
-    'mittful',
-    'mitting',
-    'mittleeuropa',
-    'mittoo',
-    'mittyisms',
-    'mitubishi',
-    'mitus',
     'mitverwandte',
-    'mityana',
-    'mitylene',
-    'mitze',
-    'mitzel',
-    'mitzman',
-    'mitzvah',
-    'miu',
-    'miunutes',
-    'mivaki',
-    'mivaky',
-    'mivec',
-    'mivimbio',
-    'miviombio',
-    'mivvycorp',
-    'miwacles',
     'miwurdz',
-    'mix\'',
-    'mix-\'n\'-match',
-    'mix-on-the-spot',
-    'mix-transfers',
-    'mix/balance',
-    'mix/dry',
-    'mix/squatter',
-    'mixalloy',
-    'mixed&rehy;farming',
-    'mixed&rehy;religion',
-    'mixed&rehy;sex',
-    'mixed-alkali',
-    'mixed-chain',
-    'mixed-code',
-    'mixed-cropping',
     'mixed-culture',
-    'mixed-density',
-    'mixed-descriptions',
-    'mixed-economy',
-    'mixed-farming',
-    'mixed-handers',
-    'mixed-in',
-    'mixed-income',
-    'mixed-manning',
-    'mixed-medium',
-    'mixed-metal',
-    'mixed-metals',
-    'mixed-mode',
-    'mixed-nationality',
-    'mixed-origin',
-    'mixed-owner',
     'mixed-oxide',
-    'mixed-pairs',
-    'mixed-parentage',
-    'mixed-property',
-    'mixed-purpose',
-    'mixed-religion',
-    'mixed-sector',
-    'mixed-use',
-    'mixed-value',
-    'mixed-voice',
-    'mixed-wood',
-    'mixed/pastoral',
-    'mixedness',
-    'mixer-feeder',
-    'mixerman',
-    'mixifoam',
     'mixin\'',
-    'mixing-room',
-    'mixing/amnesia',
-    'mixings',
-    'mixmag',
-    'mixoldian',
-    'mixolydian/schmidt',
-    'mixolydianb2b6',
-    'mixon',
-    'mixt',
-    'mixta',
-    'mixtura',
-    'mixture-of-normals',
-    'mixture-rich',
-    'mixture-that',
-    'mixture-timing',
     'mixture.',
-    'mixtures-that',
-    'miya',
-    'miyago',
-    'miyakawa',
-    'miyakou',
-    'miyamae&ndash;ku',
-    'miyan',
-    'miyanda',
-    'miyares',
-    'miyazawaon',
-    'mizaaya',
-    'mizanur',
-    'mizar-alcor',
-    'mizban',
-    'mizfortune',
     'mizo',
-    'mizoguchi',
-    'mizon',
-    'mizuna',
-    'mizutani',
-    'mizuwari',
-    'mizzas',
-    'mizzen-mast.',
-    'mizzen-sail',
-    'mizzenmast',
-    'mizzle',
-    'mizzling',
-    'mj2501',
-    'mj3001',
-    'mj35',
-    'mj730/g-hfix',
     'mjalkov',
-    'mjcosa',
-    'mjelde',
-    'mjf',
-    'mjl',
-    'mjor',
-    'mjr',
-    'mk\'kur\'qa',
-    'mk-ad',
-    'mk-d6',
-    'mk.1',
-    'mk.2',
-    'mk.iic',
-    'mk.x',
-    'mk.xiv',
-    'mk.xvi',
     'mk.xviii',
-    'mk/plfa',
-    'mk111',
-    'mk111c',
-    'mk14',
-    'mk2as',
-    'mk35',
-    'mk3s',
-    'mk4&ndash;styled',
-    'mk40',
-    'mk41',
-    'mk42',
-    'mk45',
-    'mk4s',
-    'mk9a',
-    'mkb',
     'mkd6',
-    'mkhahle',
-    'mkhonta',
-    'mkhonto',
-    'mkhwanazi',
-    'mkiiis',
-    'mkm.',
-    'mkt',
-    'mkt-ability',
-    'mkukumkuku',
-    'mkvi',
-    'mkwapatira',
-    'ml&yacute;nsk&aacute',
-    'ml.',
-    'ml/&frac12',
-    'ml/&frac12;pint',
     'ml/&frac34',
-    'ml/100',
-    'ml/12',
-    'ml/120',
-    'ml/16fl',
-    'ml/s',
-    'ml/tbsp',
-    'ml/tsp',
-    'ml11',
-    'ml2',
-    'ml3',
-    'ml407',
-    'ml6s',
-    'mlaen',
-    'mlambala',
-    'mlanenko',
     'mlas',
-    'mld/esn',
-    'mlenga',
-    'mlg',
-    'mlib',
-    'mlink-5000s',
+)
+
+blocks_67 = (
+    '&!y%"ta&#hey\'"ur\'%y-era(!/($ites&)ney-esque)#ish)!s$"sh%$kill$%uleys&!s%&slands',
+    '%#ery$%w/lin#"cc%)lxxxvijth#+hord/leader#+iarnon/duke#\'lacklan%&fferty%#ine&"rs%%nahan%#ren%&tcheys("ie%&ughlin',
+    '$*eaney/yard&!r&"ve%(llan/amy\'#end%%nahan%#ods$$imon$\'ockerty$,uskey/studio##oey$+ist/rangers$!l%$gans%%lough',
+    '%%iskey%$nick$\'nnachie&#ely%$vill$!o$(rkindale%$mach(,k/windsurfer&$icks$"sh%#ker$$tter$$uaig%)rt/prison',
+    '&!y%!n#*rae/mother%#ken%!n&!e&!n$%eamer%!e&"th&"vy%"sh$&hystal$$ight%%llock',
+    ')!s%$skin$%ostie$.udden/scotland&2en/buckinghamshire\'"rs##uan$$dden$(e/parent$&llaugh&"ie&$och\'$$rley%"ry$%theon',
+    '"#d\'s##250$"60#$aids$"ta$$vitt#%b-153#"di#%emott$,rmidminister\'"tt&,ott-scotland)#roe#%icken#+onald-kaley',
+    '(+/department(&s-like&#ugh$-ugallexternal&$hall#%uhrie##yer"%e975w#%achan&#ran\'#eon#&lderry$/hatton/national%#one$%ligot',
+    '$%waine#$ndoo$%eaney$$roic$&tegart%#ire##oin#$vedy%#ily$#oyh#+wan/parents($upil"\'fadgeon$&rlance((e/devlin',
+    '#!d##eat$$rran#"ly#(rederick"$g/kg#$6071#$ahie$!r%#rat&$igan&&y/rail%"va&"ie$%skill',
+    '$!y#&eachie%"dy%"th$$ever$#och%"gh\'\'/oxford%,ugh/chairman$"re$%tchin##han$(ee/carer$"ie$.urkin-squirter',
+    '&(/student&%ivary%$vary$$nity%$niss$"rt$$vney#$lade%%sshan$$eave%$nnon$$incy$&oghlin%\'ne/glos+,ucestershire',
+    '%$shan#(olderick$&nagall%$igle$%olies$#rry$#uch%#ghs$#wne%#ran#(ranaghan+!s%2th/gloucestershire(%oxfam&#ten',
+    '$#edy%$ggor&,or-robertson((/college)#fat$$igor%$llan%$skin$%other%#ush#"ue$#gan$&illion%!n%+re/students',
+    '$#rie%#kin&!s%!n#$wire"-hardy/patient$1ttie/radiographer"$i/ml%#mol%"ol#%ldoon$$eree$&hatton%$eney\'"ny',
+    '$&lwaine$%raith%#oys$%vaney%#ory$\'wainian&"ne%$rath#$nery$!g$#roy$&tegart%*osh/napier\'!t##rdy',
+    '#!t#&vanney$%erney$#ory"%jones"*kay-watson%(/classic&%joint&\'tayside#$eand&!e&!s%$rney%%tling$&chnies',
+    '$"gg$"ll$,msley/father*&mother*%pilot$$ndry%!n&%a/vet&#ell\'(y/mother%(zie-hill(!.(\'/father)&mother(!s',
+    '%#wen$+rchar/camra\'+er/campaign%!r&"el&#ows$&ttrick$$vitt#(ie/joint&&master$#ght$&lligan("in&\'op-mash$)nley/nrpb',
+    '&!y%$tosh$$rgan$%ssoch#&loskey#&naught$/ightagriculture#/owchar/campaign"%l5ean#\'achlans$"ne$1rdy-smith/surgeon%\'en-tian\'&/honda((westwood',
+    '%$glin%!s$&versly#"ea%\'n/crash\'%hands\'+strathclyde&(ey/union&!s$,ish/aberdeen&#ter$)llan/king)"st(!s$$more',
+    '&!s$$rnan&"on$#vey$#win##iam$$nden&"on$$ster#\'lelland##oon$$rman$$skey$3ughlin/anaesthetist#%uckie',
+    '$&hanism("te")mahon/pub(*showjumper$$mara$&namann$%steri$"th$#ugh$!y#$ecca$,eking/bursar#-ichael/oxford$*llan/nitto&"in',
+    '#&onnies$#ran#!s#%uffin$/llin/blackwells$#rty#"vs"*nab/author%!e%!s$#irn$+lly/trainer$"ry$#ugh\'\'t-davis',
+    '(*/fertility(#ing("ry&#ton#%eally&\'y-on-nt$#ece$%illie%!r$$llis&!y$$rney$#vin#&ichols$#ell',
+    '#%ugget$%lties&"y.$$rlan$"tt"!o#$mish#$ueen#,wan/catholic"$p-40$*milliyetci##/as#!a$$dden$)rtland/st',
+    '#\'hearson%/rson/cheltenham*"gp"!q#\'mcquire#,ueen/friends$#igg%$lkin&#lam\'#ing%"re%#tty"*rae/walker%!s$%ndall',
+    '#&itchie#%ostie"%shine#$imon#"od#%quirt#*tay/celtic##wan$$eeny"\'taggaet$%miney#%eague%)r\'s/widow#$hing##ier',
+    '#!r##urk#%wists")v/mch/hct#"ay#,eigh/friends$#rry#,ities/united$!x#%orran"\'watters&"ie#!c#%eeney$$irdo',
+    ')\'/friend#&iliams"!x#!1$!4$!5$!7!&d-2000#"80$!3#"bi#"ii$!l"$/112""10',
+    '"!5#"00%!e"%9,500""ap"%c7890#!k"#els"!g"!l#%alose#%dmnls""me""ol#"ya',
+    '"#rec"%s2000"!t"!v#!s"!x!0e&dstrok;3adulur#+mdash;about)"he)"oh)#you#%ndash#)rehy;nial(#the#5scaron;trovi&cacute\'s',
+    '""-a$$fter#-consciousness#&decade#%first#"in%!g#-l&aacute;m-bi#(myself-i#\'neither#$that%!e#%za-na"$.163##262',
+    '#!i#$when"&/death#$gave##how#"is#"my#\'useless"!1#"09#!3#!6"!2"$3000"!4',
+    '#"in##now#"up"*a&rehy;gre#$asge#*cher-haigh\'!s#*d-drinking$0/gloucestershire%(inventor%&social$#and%)pproaches$1e-fetherstonhaugh&$king',
+    '&\'trainer&%vicar%"an$$foot$$hall%$ides%$olds$"ie%"ng$%joins$"on%!r%(w-blooms\'\'grasses\'$land',
+    '\'%pipit,%-like(#ool&&.sweet&\'/oxford&+croft/store\'"up&"es&$foam&$ings&,s/gloucester((hereford\'#ide%!x$%realm',
+    '%#man$$woke#$gles#!h$"am#!k$"en$-in/nottingham&!s#\'l-break%*in-a-glass%$moth%(offering%*stimulated%&taking',
+    '&"ub$,/refreshment$!a%!6$"da$"ey$$iest%!n&!g$#men$+s-inclusive%(.journey%%/care&&snacks$&ticket',
+    '$-y-mouthedness&$xxxx#+n&mdash;but$%-1.e.%$like%*preserving%&street%&tested&#ime$!/%%would$!=%$0.24\'#47s(!8',
+    '%#1.2\'!5\'#84s%$2.15%#3.5\'"66$"_a&$part%$even%"in\'&_terms$$der.$"ed%#r\'n$%guera',
+    '$%hwile$!i%!n&\'g&mdash(1rehy;establishing-%fully\'"\'\'\')-altering(\'bearing(\'content(&driven(%fully(\'getting(*in-context(%maker',
+    ')\'riented(*preserving(\'related(*similarity)-pecifications((to-sound(%words\'(.content("nn\'/ful/meaningless+.non-meaningful*!l$-s&rehy;tested/#ing%%-ends',
+    '\'#his%)/standard&"to%\'pirited%!t&%ested$\'t-which%!i&"ne#!p#!r$!c$"ig%!n&\'g-smith',
+    '$,s/son-in-law#2sles/mumps/rubella$"on$#tro$#ued%,re&rehy;ment\',-for-measure(&valued\'!.\')_in_terms\'"by\'4ment&ndash;kilobytes+!.+"of\'+s&mdash;and',
+    '&#in\'(\'g-stick%&tement#.t-alternatives&)nd-potato/"es)\'two-veg\'%imals&"xe%\'balling%(cauldron&%rumbs&"ut(#ter%&filled',
+    '%%giver%$head(!p%*inspection%#pie&)rocessing%)rationing%\'sharing&&tuffed%\'traders$(.however$*/mete/meet$)_in_front$"al$%bones',
+    '$!e$$form$%iness&!g$&master$#oid$\'packing$#res$$safe$%yards#.ulnes=domestic$"re$#tys#$zles"$b.it',
+    '#$iame##mt1&$(co)#$umal""ca$"ir$$nica%"no$!s$%tecno#&canico&(otecnica#&enazgo#&h.eng.$!a',
+    '%!i%!n&%cally&,ical-looking+*typewriter*+.electrical*-/aeronautical+*production*(ly-aided-&loaded-\'powered.(ropelled-%tuned*$ness(!k',
+    '("us\'$sing(,m&rehy;based)%-type)!.\'!z(,ation-indeed%"ra%"ta&#ons&%ronic$!e%(nophilus$"ie$%onoid',
+    '$#pro$!s##ias##ken&$heim$&leburg&&nburg-,*vorpommern%#ing$!y#%oprop##ums"%d\'cin\'!e#&-icine',
+    '#!.#(/200&deg##act$%dalur$$glie$!i$+l-encrusted&$hope%!e%$ists%"le\'!d&#ing\'\'on-like)"ed',
+    '$$nite$"rd$"ta$&u-time%%/keep%$half$)wachchiya#"bh#&chuana\'#rta$"of#"d.$\'elelser%!n$!i',
+    '%"ng%!s$\'le-aged%$ings$"ow$"yg%$liol#%ecine(!s%#yne$!d$.ll&iacute&euml&!a$!n%#ine',
+    '$#ros##fac$$ield#%gysey#&i-back%$care%&strips%$tech$+a&rehy;tion%!\'%/-and-politician&&buying&+centredness\'(onscious)"te',
+    '&*encouraged\'+xploitation)$osed&)generated\'$rown&+highlighted\'#ype&+indignation((fluenced(\'tensive&%kings&(literate&(munching&$only\')rientated',
+    '\'#ich&#shy\'$mart\'#tar\'&uckled&*television&(watchers\'#ise%)/campaign\',ommunication\'3ultural/trivial/not&+information&\'overall%%genic%"id',
+    '&*ly-stopped%#men%/n-interquartile\'\'to-high&\'/hanned&$=5.5\'"95&!a&"ly%%scape\'%hlock&\'ourcery&\'tinitis\'%rinum%&theque',
+    '\'"ve\'#zed&-ors&mdash;the)".1&.ron-multimedia%#yob$\'c-alert%#aea&"go(\'falcata&,l&rehy;style\'!\'\')-athletic(#bed*%nefit',
+    '(%moral(\'nursing(.pharmaceutical\'!/()emergency()geriatric(.nursing/social(\'science)\'urgical()technical\'#ert\'0ly-circumscribed*)supported*+undesirable&#men',
+    '*$orum&!s\')h-insured&#tes\'$ion.*(/inhaler\'#ors%"ea\'!n&"ll&$ntre&!s%*i-riccardi&"al&"na',
+    '\'-e&mdash;which(!*(&-chest)#men)$shop(*/geriatric)&oxford)(therapy.(,s&mdash;that)*-to-sports)!.\'#ing\'!s(0_sans_frontieres%*o-chemical',
+    '\';magnetico-musico-electrical\'+pedagogical(-harmaceutical\')religious\')technical&*/actuarial&"al&+chirurgical&\'legally$"da$"en%#tis%/val/renaissance(%izing("ly',
+    '$%lline$$mnoi$*na-sidonia&%/aged&!s%#nus$)o-cubital%%banca%%cracy\'"es%#evo%$lani%(matrices$$rios$$scan',
+    '%%acion&0tion-become-poem*+/relaxation%$eran\',r&aacute;neo(+a&rehy;nean)#nea,\'n-based.$type-\'/tethys+!e+#ity%#ive%(sinskaya$(um&mdash',
+    '\'*rehy;grade,%paced,$size0!d,$term&!\'&\'-acting($ngle\'&bodied($uilt\'(capacity($hain(#ost(%urved)!t',
+    '(#eep)\'veloped(\'istance\'#fat(%ierce\'$gilt($rade*$ined\'$hard)"ul(#old\'"if((ntensity\'%large($ight',
+    '(#oor(&rofile\'%ranks()esolution(#isk\'-side-of-sweet($weet\'\'termism(-o-lightweight+"ow*$poor)#ned\'#use\'(volatile*#ume',
+    '\'%light((ong-term)!w\'\'private\'+short-scale($mall(#oft&!d&$pace&%sized$$zing#$kits$)ov&agrave#$lawa$$earn',
+    '%%ycott$+ine-medlars$!o#$onca#!s$!i$$tick#!u$!a$%gorje$(ium-term$*sa-threads%%iform*!s#&vedeva',
+    '"&e-hawl#$/gwr#%ching#!e$#eee\'!e$$ting#&gaeren#$han\'#"ja#&k-eyed$(/brother%\'trainer$#ers%!s',
+    '%#ngs$!l$$rahs$)s/swindon&)wiltshire#$lbeg$$more$!y#!n$#agh%$leck%!n$$glas(!s$"it',
+    '$$tion#!p#%rbeck$+esforschung$"ly$,m&auml;dchen$\'schaums$!t##sis$+ter-demeyer#*t&rehy;ing$)-a-mother%)the-buyer)%press$*/meat/mate',
+    '$%_each$$able$"ed%%etsee%!s&!t$#ham%$inks$$ing-("at(\'chamber)#ute(%goers)%round($hall',
+    '(&points(%spiel("up\'$.tim\'!/(%disco()effective(\'liaison(&speech\'%house\'*photograph\'%s.any)%there((/courses)\'outings',
+    '\'$ware##wen"%falle#"em##ile"-ga&rehy;bucks*%stock*&walker$+-adjustable&\'irlines%$band&#ids&$rain%$cash&#had',
+    '(\'ssboard&#ity&&luster&&omplex\'+nglomerates%$deal(#ths\'$btor\'&cibels&#irt\'%verse&%ouble&#umb%\'feeding&$irms',
+    '&&ortune%#gig&$loss&#ood&%runge&%utted%$high\'!t&#ype%)important&*nteresting%#jam%#law&$umps%\'massive',
+    '\'#dia\'&etings&)icroscope\'&llions\'%neral\'!x&#oan\'#ney%"pc&$ills&)rofitable($ject%&report%\'selling&$ized',
+    '&$nort&$peed\'$orts&\'tonking("re*!s&)uccessful%%theme\'\'ousands&"on\'"ur&)urnaround%(violence&%olume%$watt',
+    '(#lth&\'hoppers$#bar\'!s&"se&#tes%$eans&(cquerels%"id%$ooks&%ssgod%%ytten&#xoi$(carriers%$eros',
+    '%(ity-size%)onference&&unties%$ryst$$deal\'#ths%#isc%"og$*fabulously%$irms%$lops$-geomorphology%#lob$$hits%"ub',
+    '$#ira$&joules$%laugh%)encephaly%!i&#ner&%thism(\'omaniac%%odons&(maniacal($rtyr\'$edia&(sauruses\'\'phaeric&#tis',
+    '%$oney&#uth%"um&$seum$\'numbers$%panos&%scals%!c%-hone-wielding)!d("ic\'"to%$ixel%\'olitics&&nticum',
+    '%$tera$#ron%$rell$\'scuttle%%eller*!s%#hip\'$vers%%pores%$tate&$ream$&tastic%%erium%&herium&$rash',
+    '(!e&#oth&!p%(raverses&#end$&vessel$/watt-generating(&/hours%&eapons%$hale$$zone#&diture#"ee$!l%#lus',
+    '$"ve##gan$$eson%"tt$$itts##hir$"na&!d#"in$*onneftegaz$&sserie$$ture##lio$\'omaniac#%onius',
+    '$"im#%stone##umu"!h#(aignerie%!n$!l%!e#(er-homji$\'tabelle##fil##ico$#gan$"ll$$naku',
+    '%#ema#&lhorns$#man#%med-i#!o##ras$#etu#!t"&i-gook#&densha#&endorf$(r-scupin%$turm#$gant$)h-andrews',
+    '$!s##hle#%ldrum$"er$#hac$#ing$%lerie&#ure%!o&!n$!s##ndl$"em%&nbourg%1rtzhagen/georgina',
+    '%(tzhargen$!g$$hard%#olf&"of$#ich%!e%!g%$ngen$$kopt$#ong$$sohn#%reles&#les%!r',
+    '$#ing\'"en%,onnydd-based$!t#"sa$!e%#las$"hi$!m$"on&$nier$!s%$ener$\'terwerk#"th',
+    '%!s$(ner-graf##wen##zer"+j&iacute;as#$dani#"ia$%canos#"or%"es"$kbib#(hedrioni$%loufi#"in%!\'',
+    '#"le#%nassi#"on%"en%\'yocivil"*l&oacute;n#&\'chior#\'a-bocca$&chrino*%-type\'$omic$#lap$"mi&)ne-coated)$type',
+    '%$pous&$yrum$(ncholiac+!s*!e*"ke*"ly)#lie*!y)/y-then-strident\'%romic&$olia)"ca%#dra%0esian-controlled',
+    '%#ges&"in%!i&&n-like&"on&(sm-fluid&&zation%(ocephala,"us($rcus\',yte-specific)"ic&%leuca\'%ophia&$main',
+    '\'$omal\'&permus\'%terna&&taenia\'"os&$vski%#tis\'"us&\'richova%$zane$!o$"ra$%stoma$%thron%)onin-rich',
+    '#(chbourne%#ite(!s&%zedec#&derman$#ina&"ls$0ol-meduli&cacute%!n$!s#(eagridis\'"ou$#chi$&ncholy$%scanu',
+    '&!4&!9%!4%!9&$(co)#!f$!i$#oot%,rd-stevenson&!m$"yn#"ga%!r$#und#.huish-weisbrod',
+    '%!n&!s$$boia%"ur$"ca%#har%\'opicine($dine("ne$"da%"en$$erax$!h$!k%#yan',
+    '%#lia&!o$(ncrythan%"ex%"no%"te$"on%&ration&#ism$%pones$%smata("ic%$sani$"ta%%ensis',
+    '%"us%!z#!k$#weg#\'lancamp%#ril$"en%!r&#ary&#ick&!s\'!h\'$tain&!y$"ie',
+    '%\'fluence*!t%\'n-olsen&#gen(!r&!i&!k%$suga%"ts$#one&"ie%\'r-drama&!a%$tlie&#ron',
+    '%#wly&\'s-facer$#uci%!m##mon%#unt##o9s$%comic$$diam&*c/harmonic(%lyric&-es-and-basses&#ons%(ramatics+#sed',
+    '%*y-building&./accompaniment\'+fingerstyle$!e$&lontha$(n-baller&%wedge%!i$(rivicish%#ose$"sh$$ttie$!y$#zzo#$pash',
+    '%"or##raw$*ose-drover#!s$!a$!h%"ed%#orn#\'t-glued%,of-the-heart&"ut%\'through$!a%&-bombs$\'ed-down',
+    '%"rn&)s/present$$hane$)ing-point-!s%!s$%onian)&-white\'!n$&waters$!z%#off#$ucco$"ha$$sine',
+    '$#ile&!l%*n/publican#$wani$#ert#"yd$!n##zak$"er""m.$#exe#&/hepes#)ani/south#!b$"as',
+    '%"er%+r&mdash;and&*-clutchers(&ountry\')directors\'-international\'$only\',satisfaction("et((ocieties((uppliers\')to-member&&.after&$/any\'\'society',
+    '&"ed&#ing&+s&mdash;see.#who\'!-($-who(!a(#but($only("to\'#.ce("ps(#the\'(/players(*supporters',
+    '\'0hip&mdash;market*!\'*&-card.+&driven+%owned*".e,"/c*&/staff*#:51+\'burkina&"ts$$land$&racids&#nbe\'"ce',
+    ')\'encased))mimicking)*osmometers)$thin**ransducing*#ype(!.)"at(#ous%*e&ntilde;o&!s%"um#!c$%haoui$"or',
+    '#&e-pool$#ber$!c%(yloideae$&ticist#&ically#$linc#$mott#\'o-matic%#pad$*ir-writers&"es&-s-in-progress\'!.$$park',
+    '(%ising%#ex\'%#iae&$elle&"um&&zation\'"er%0y&mdash;resident\'*rehy;image&!\'&$-aid($lbum\'%based(\'oosting\')deficient',
+    '\')enhancing\'\'failure\'#how\'%image\'%laden(#ike\'&making)(nagement)$pped\'&packed\')rapacious()ecordings)&sidues\'$size($late',
+    '\',taperecorder(#est(\'ickling(#oss(\'raining)%igger(*urned-myth&$/256\')behaviour\'%still&$:ray$$yres##sys##tek"3n&ccaron;eti&cacute',
+    '$+rehy;tioned#.-about-chelsea%%n-tol&!d%"re$(centered$)dominated$&haters%%ungry$%o-war%*n-the-spot$&shaped#".5$#the##/10',
+    '$$work#":a#*ace(scram)&\'-filled\'%laden&$.was%#him%&ingly.$*ge-a-trois$$hcem$"il%!r$$nced$!r$!s',
+    '%"he$#tep$"ul#"ce$#hel$#ius$!k$!l#-d-and-make-do$$able%"na%%tions$\'elevich&%ising&!l',
+    '\'$shon()ohn-bruch+#ian%!n&#all%*s&lsqb;see&\'-france%%z-who$#ies&#ta*%"n\'&!i%#ps.%"ve%!z',
+    '&$abal$&lesohn\'$sohn&#ton%$sham$#ona%%ubita%*za/friends$"um##ear$"es$(gon-bidi%#uel$%hould$%mista',
+    '$$phta$#rbi%"gy%"va$%trier#"ga%!l$&elburg%&nlehre%!r$#hin\'!i%"ua$%kapan$%uistu',
+    '#%ially$%gitis%#nos$%ngeal\'!s&%itis.&\'ococcus%!i&)gitipitus%!o$$oned$%ppean$"se#%jamim$"ou',
+    '%!s##ley#!n$"ea%#cey%"ll$"in%!s#!o$#dge%$otus$&logion$%minee$!r%!a',
+    '$#urs$"wn##pes#\'s&aelig$)a-a-table&#man$)chenaffen(&rechte&#ing&&licher$!e%"s.$$ford\'"th$#hes',
+    '&$vism$#ile%#nga$$laws$$onge(!s$#ton%%ralis&#ies&.ual/childbirth(%tions$#uel%!r&&abilis\'"ns',
+    '%%ility%0l-art-scientists\'+behavioural\'(disorder\'(handicap(\'ospital&!/\'%aural\'+behavioural\'0physical/sensory\')spiritual&)istically\'(t&eacute("y\'\'#zes',
+    '*(eficient*\'isabled(!.&$ness$!e%!c%!m%!n%"ri$\'holated\'%yptus&#rpe$!i%0on-in-despatches\'3ed&rehy;in-the-text',
+    ')0/bragged/gloated)$_now\'%isque\'(n&eacute%$rola$(le/pybus&$wicz$4more/buckinghamshire$(or-girls&&/coach&!n%#uri$!s$%water$*zelopoulos',
+    '$%-like%&makers%(planning$$.exe%#tif$*/windowing$"ed$$hin.\'(/concert$#ing$"s.#&zieses""ol#$ooww""p/',
+    '%#ste\'(ophelian*%olean#$kins##pem##tid"#q/l"&r-doll$&people##/29#)=danseuse#"ab%$ello$%lomas$#mec',
+    '##bau#"ca%(d&eacute&#ona\'!s%#nte\'"il%*ptoacetate((butyrate%(torfonds("ia$-eaux-descloux%!d&(es-owner("es',
+    ')$ness%&r-like&)/glosters&"ie%!s$*h&aacute;n%#and(\'iseable+!s)"ze*#ing\'#ged\'&t-bank-"er/!s',
+    ')$navy)\'princes)$ship-#per(%eable("ry(\'s/d-i-y%!e&!l$+i&rehy;less%-a-northumbria&\'/sekers&$bles&\'n-welsh%!e',
+    '%(lessness%$orum%!s$+k-darmstadt%"er$!o%%unand$\'urialis&%y-arc(,contaminated()fulminate(&gilded,#ing(\'hydride((poisoned',
+    '("us\'&/water\'%cards$&y-full&&killer&$seat&%truth#%deaux#+e-existence%$pose%%smear$#ato$$bank%$rook$$daen',
+    '(%-lees(-/construction%#ydd$$iles$$kesh$"ls%)y-secular$"na%#ess%#sky$!r$&syside$"th%"ta$$vale',
+    '%$orth#\'gellina%#nce\'!y%1r-and-acquisition\'#mad)#nia&./approximation\'(demerger$!h#"ia%:doc-peregrin-fredegar-type%!n&!a$!c',
+    '%#eth&!w%%ians.&%ennes%#yth$!e$%field$$gnac%%omish$#kas$"ly$"na%#ger$\'sel-dns%"ki',
+    '%"sa%$tems$\'t-based&$free&%order&#pay&\'ratings%#.47%!e%#ina%(ocracies)\'tically&$racy%*s/demerits%"us',
+    '%"va%(z-shinui$#els%"rs%!z$$hets$"is$$land$$usii#$lane$*eau-ponty\'$*in-engined\'%gerin\'\'powered\'&vision',
+    '&!o%!s$!o%!n#)maid-like%"nn&!s$\'elstein%!t$"is$!y##nie#%ofled$$itic$(nymously',
+    '%$idae$&stomes$!z#$pins#!q#"r.$+ell/brother%!t$%ibell%1ck/ex-conservator%!d%(ll-lynch%$ness%#ott%#pen',
+    '&!h\'*ewveterans&#ots%$well\'$ther$"on$6y&ndash;go&ndash;round%)-coloured&$eyed&"go(&-world(%round&\'looking&&makers%"at',
+    '\'#oft%&fields%$hill%$kirk%$land&#egs%%mount%$vale&$ille#%sault$%chell$+eburg-leuna%!r&!y%\'y-based',
+    '&#ide&$link&#man&*side-built+(inspired*$born(#ppi$+ham-marsham$,in&ccedil;ik.!k$"ky$*o-meagalla$%yebus%$side##tel',
+    '\'"ia(.o-atriplicetum%!s$\'hiolate$"in$"le$%onian%"un$+z-fairhurst#$uere$"le#%vayle$"ia##win$"yn',
+    '$"vn#"z\'$%enich%!y$$ifon"&s&rehy##abi$"ch$!d$"go$+lazine=0.91+#132,"87+#7.4+"90',
+    '$%rovic)!h%$team#&calero%!n$#ede$$hino$"it$$latz%"um$"us#"el%!\'$,mbryanthemum$"n-',
+    '%!s%&terial)"ca)"es$\'pimeron$!s$%yside#(h-length+!s$!a%"ch$#ech$$foil$"ix$\'ketians',
+    '$$orer$"ri$%uggas\'!e(!h(#nah)"er&$iner#!i$)odistally#+khetian-run%!i$#ito$!o##lay',
+    '%!n#)merically\'#ser$$orph#*o-american&"nd%\'economy&%urope%,organization$*biliverdin$\'cuticle$\'dapedon$\'genetic$\'limulus%&ongion',
+    '%%orphs$&philic&$ytic%%lodon%&otamla$&rectum$%scope%%phere%&ternum%%uchus$)theliomas)"um\'$rapy%$idal$-zoic-tertiary',
+    '$(l&eacute#.representation$#ine#+s&rehy;ages$(-clearer%$deck%$hall%%mates%"up\'!s$!.$(/message)#ing$"ac%*ge-bearing',
+    '((directed)%riven($self)(witching\'$.and\'+/department(&medium(\'talking\'*central400\'!d\'!q\'(r/wagner(#ies\'"s.(%/call',
+    '&!i%#ien&!h%)lina-like%$oudi%#pic$$deck$#ell%/nger&mdash;well)$-boy*(operated*\'pigeons&#ian&&mensch&#see',
+    '&9schmidt-b&ouml;lkow-blohm+"ts%$turm$$gaes$%iaen.&&h-like&*sgeheimnis%#est%!n&-es-wytschaete%"re$%mates%"er$!o%!n',
+    '$!r%$ooms$\'technic*!k$(y-eating#!t$"a.$$dagh$#ier%"za&.o&rehy;looking$$rino#$ulam$#ree\'!s',
+    '#$wick#$yats"$t-31$,a-mor-fohsis$\'courage%%urzon$$does$*enkephalin$%style$\'thr-glu$$with##/in#!1$&00(co)$"63',
+    '#"a-%+anorthosite%*deductions%$epic&)xperiment%\'fiction\'$lter%+grammatical%\'igneous%)knowledge%%legal\'$vels%%metal&$usic%)numerical',
+    '&(henylene\'\'osphate&%olicy&(rocedure.!s((gramming%\'reality%)sediments&%ocial$(/gartner$%basic&#tes%)isulphate+$ites%(olisable',
+    '($ties&$rate$\'carpals("us%(ognitive&(mmentary()unication&#nid%%urare$)discourse%(olerites$&ethics$$file$&gabbro&"ma',
+    '\'"ic(!s%&lyphix$*historical$3iodobenzylguanidine%!r&"ie$.l&rehy;working&-uacute;rgicos%!*%--and-leathery+$ight&&backed($rred(%shers',
+    '\'$oned\'\'ucketed&%cased)$ting(\'talysed\'%hased\'&lipped\'!o($ated(*ntaminated0#ion\'&utters&!d\'\'epleted(\'tectors',
+    '&%glass\'#rey(&inding&$hard\'%eaded\'"ip&/insulator-metal0-semiconductor\'"on&&legged&&making(#nia&%oxide&,polyethylene\')roduction',
+    '&$ring\'"od($ofed&%sided\'&kinned\'(parkling\'#tud&\'tasting\'\'o-metal&&walled\'%inged("re\'%orker%&/alloy&\'ceramic',
+    '&$glam&$jazz&\'plastic&$rock%(anguages%&dehyde%%epsis%%flake%-inguistically.!s&#ous&#ser%#ler&(ic-based)%funky',
+    ')(sounding)$type(\'a-esque*%scale)%/gn\'r\'(reducens\'&sation(!t&&ocenes(%hrome,"ic\'\'enzymes\'\'genesis*+ic/economic*!y',
+    '(%raphy\',proteinase-1\'(thionein,$in-1&%urgic&!y%&ogicon&$xide%&points%,s-processing&$cape%%urjic%%woods\',rker-farmers("th',
+    '%&orphis+!e*$zing)%osist,#zed$\'nauplii%(odianone&$rite$+phor&aacute(#(s)(#ein($izes\'&sphate*$oric.%/0.5%',
+    '\'&sical\',*-flavoured,*/political)#que%&lasia.)!c&%eural%0odials/phalanges&&litico&%ntion$!r%!s$0sediment-derived,)s-locally&%quoia',
+    '%&tasize+!d\'#tis&+rongyloidea/!s%"yn&$stox$!t%.arsophalangeal("us%&extual%*heoretical)#ies\'#ria*!n',
+    '&%orax.$$urus$)volcanics*,osedimentary$&zoans.#%burys#-calfe/friends)&mother$!e$$lafe$"om#$elic%%oides$*mpsychotic$,or-observing',
+    '&&eolgia&&ically\'%tical*#ist*!s\'%zomai&\'logical&$oids\'#lgy$)r-feeding&\'setting%(_as_well%#age%)eological%$maid',
+    '%)orolgists%$zone#\'f\'-lacz$"ab#3h&rehy;odologically$1acryl-substituted)"ic%!m&)phetamine%&nation&%e-gas($poor\'$/air\'!s&,obrevibacter',
+    '\'\'l-based)%ethyl)\'fuelled(#/5%)(hydrogen(&:water%#ram$"el%&rsgate$\'icillin%#ngs%%ocarb&$dine&/nine-containing+)requiring',
+    '%&sazone&*t&emacr;mi$#ley%#ick%!y&)phenidate$!o%#d-1\'$ists\'(oriented&".a&)enstreite&!i\'!c\'"es',
+    ')$iaid&!o\'#log*4ical-individualistic+\'es/case+#zed*"y.\'"ne&2s-time-measurement\'$.dii(*electrical(%glial(#yac\'6/approaches/techniques\'#for',
+    '%%klone%"ni\'"um%%prene%(tyrexate%(ught/the%!w$%s/gas$(uen:1982%&selahs$$wold$#yl-\'22-methylpropenoate\')cellulose&3anthranilate-coated',
+    '&&butane&%eblue\'%nblue\'$ther&-hydroperoxide&*isocyanate&\'ophilus\'\'trophus&/phosphinothioic,$onic&\'sergide\'%ilane&-terbutylether\'-ransferase(s)&-umbelliferone',
+    '%&sricum&%ticum#1iculously-applied-%honed-*researched,!.$#ers$!n%"ae%$gham$!s%\'ization#&j185am#%kovic#$life',
+    '$"do$$nomy%"ym$)ponorthus$(ur/nizan#!r$&aphone$$e(s)%&-bound&(diameter&(governed&&square\'$teps%%.this%"in',
+    '\'&square&#.so$)ic-minded&&_apart&!a\'(tionists%#dia%"os%!s%#tis%&zamide&$oate$.o&ndash;cammel&)rehy;land%&-gauge',
+    '/$eyer&$news%"de&$orus%%lands&$ight%#mex%1nomically-recited%#pia&"le\'$ises&\'oli-tan)*s-frontier**/satellite)%taine',
+    '-)immigrant-&minded-\'vickers,(/watneys,!a(#tan&%rolol%#set&#oft%&tracks%#vic(!k%%xylon##sys#$tall',
+    '$!e%*rnich-like&$wang%"ur%"ya$#le.$"on$$rick$)ych&uring#$ulla$%salem#$wali%"nd#$yard#(zgerhunt',
+    '"-ubles-magazin##dun##gan#\'lenaere&!g&!t$!i$"on#$rant$"ic$$ling##ser$#ien#"te"-v&rehy;energy',
+    '$$nian##ius#$lida#!o##ryn"\'w-tater#\'anwhile$!r#$hort##itt#!l##nni#"ow##son")x-spanish',
+    '##ica&+n-americans($born)$uilt(#led($type("us\'&/irish($u.s.\'&s\'long&!s\'\'/aztecs%1o&ndash;australia&$land$#mum',
+    '#$tech#!x"#yat#!e$(r-rochow%$hold%%owitz#%farth#"ir##ler##mac$#ott#$nard##rin#$sner',
+    '#$tens"+zaepiplanar##cal#"en$"ra%%itzer%%ville$"zo#-hdunarodanaya+$naya,"ye$"eb#$iane$"ni&(industry',
+    '#+ur&eacute;s#!y#(zacorona%*nine-level)!s$#ich$\'o-piano&#sop)%ranos%\'tinting!#f.c"&1200pw"&3200db"!4"*a-governed',
+    '##nya"%g/pro"#hp2"$i=33#!d"!l"&m-type#$/mft""sb"\'wangano"!y!#g++"$-104##atp#%based',
+    '"".h#"it"$/100#!5#"cm#(day/kgbw#!h$#our##kd/&#day$#g/h&#min)#ute#%liter#"mi',
+    '"\'2+-free"!a#!c#!l$!a"!c#!.#(/v&amp;a#!1#"l1"%flops"!g"!h"#i-1#$s-3d',
+    '#"-1##ur1"$onja""so""ts"#ulu##mia"!w!(h&amp;jr"$-434#"mm"$1081#!6""28"&adaidh',
+    '$"th#"la#%ngami%!o#*ol-doraidh$%naigh""c.#!s"!d"$eall#&drioni##nni"!g"(hngaahou"\'ic\'ille',
+    '")labunzima$$wuli#!g#$ongo""m5##ood"#oir##ngo#!w"#r59#2hrhrn-naaaahooouuu%(naaaahou"=uilinn-ghaoith&mdash;windmill$"re!*i&nacute;o',
+    '$&dash;2)"ht#9scaron;e&ncaron;sk&aacute"&\'laddo#!s"#(r)#"s)""-1#!2##402##506#!6#!8$!t#&allaqa',
+    '#%blunt#3fah-soh-lah-tee-doh#0hi-hi-hinkeeeeee#\'ind/you#)microsoft#+rio-fil-oom*%l-oom#&teinte"!.""16$!i""5\'#%-type#$/mi6$#sas',
+    '$$such#%chael#*h/co-owner%\'robbery#"ja#"le$$ster#3mi-caribbean-london&$vice%%sburg#!o$#jin$!u%"ed%#ing',
+    '$!k#$smal#&tchine#!u$*s&eacute;e"$b-ii#"ei##iol"\'c-level$%stand#Da-amphibole-rutile-ilmenite-diopside%$rich$!d%"ia%!o',
+    '%#eff$)wber-like(!s#(e-damage%&ridden$#/m2#"h.$(a&lstrok%"bo%#el\'\'.-in-the-hamlet()le-belfry(&martin\'!.("mr',
+    '($wham\'(e-andrea(#des\'#ham\'#led%!i&&lovich%\'lczeski&"et&$ovic\'$wski&!s\'"ki%!u&!d',
+    '%$vila$!e%)&aacute;l%"as%&l-ange\'-lug&egrave;ne&!a\'&gniolo\')ngelesque&%dever+-&ndash;ripple&#ena\'!r&!i\'#ano',
+    ')$star&"la&$otti&)s/america\'"en\'#ian\')on-morley)!s\'$tadt&%trade%#son$!i%$bata%"el&&vously',
+    '$$niks$\'opoulos#"ia#(k\'n\'keef$$(19)$&elgate&!s%&y-take+"rs&!.$%leden\'#ore&$over&&thorpe($wait',
+    '-!s\'2on/gloucestershire%"ow$!o%$leit#&otronx$!u#!r$"al&"ax%!m%$rter%$scan%\'version$#ite',
+    '$/o&rehy;filament+%level+\'surgery%%-amps\'\'nalysis)\'tomical\'&quaria&\'biology\'&rewers\'%udget,#ary(!g(&siness&&camera(&psules',
+    '\'\'ellular\',hannel-based\'&ircuit-"ry\'%olony((mmission)+puter-based((ntroller($pies()rporatism($smic\'&ulture&)decisions(*nsitometer(*valuations',
+    '*$user(\'ssected\'%riven&\'econoic\'&ffects\'(insteins\'\'lectric.!s,#ode\'+ncapsulated(\'gineers(\'trapped(+vironmental\'(volution\'\'yesight',
+    '\'$ibre+!s($lmed("ne(&ssures\'+locculation\'%ossil\'(unctions&%grams)(vitation\'$yros&(habitats\'(istorian\'"ub&(injected',
+    '(%rnels&#lab(#yer\'$ight(#ner)#ked&)mainframe($nage(%pping\'*eteorology($xico\'#ini*(aturized*!s\'&odules',
+    ')%ecule(&nsters&+nationalism&,observations\'"cp\')perations\'(rgamisms\'.vulo-gemmation&%penis\'$hone\'%lates\'#rix(!o)$gram-#med',
+    ')"of&\'readers(+frigerators()sistances\'&obotic($ller(#ute+!s&\'sanding\'%cales)\'vengers\'%elect\'&ignals\'&kirted+!s',
+    '(*ciological(-ft-compatible\'&pecies($onge\'&tudies\'&ystems&\'testing\'#hin*"ly\'!o(#nal(#ols\'+ransceivers+&mitter)#uma',
+    '(!x\'%essel%&/macro&/ultrafiltration%$2000%+aerobically)$phil&&mperes(!s&)nalytical-!s\'\'eurysms\')giopathic&#pps%)barograph',
+    '&#eam\'$tter&\'ial-mat)"ly\'+o&rehy;logy(\'clastic(\'lgoical)$ogic-$ally,!e+/y/biotechnology\'"te&%laise&#ore&$rain',
+    '\'%idges&%urner%\'calanus\'%psule\'(rcinoids("pa\'\'ssettes&(ellector\',ntrifugation.!e&,hannel-based\'#eck(!f(%mical)&otaxis',
+    '(,p-controlled**production\'$rome&-limatological("ne&$occi\'#ded\'&lonies($umns\'/mputer-assisted.*controlled.%style\'+ncentrators(\'tinents\')rporatism',
+    '&%racks&&ulture\'#rie&\'ystin-r*!s\'#tic()otoxicity%(dealions\'&letion\'*nsitometry\'&posits&*iagnostics(\'lysates\'%ctyon\'"et',
+    '\'*stribution&(olomites&&roplet%+econometric+,ic-motivated&#dge&0lec&rehy;tronics)$tric+(onically/,s-controlled&%mboli\'\'ulsions&,ncapsulation\')gineering\'*vironments',
+    '\'$rads\'$unae&#eed)#ers&+ibre/fleece\'%ching\'1lament-disrupting-#ous(\'m/fiche**microfiche)"er\'%ngers\'#rms&*lagellates&*oundations',
+    '&(unctions%&glanis\'#obe&%rafix(#ms/($nite)&ulomas((phically((vimetric.!y\'$oove%&helios%*injections\')struction\'\'ventory',
+    '&#ids%+lepidoptera(#sis&*ight-under*#ers\'#tes((hography)!s(#ing&%ytics%*management("ia)(pulation\'!t(#ion',
+    '-!s\'#ric\'\'teorite&(iniature&&orphic%\'n-sized&$auts&&eedles&"ic\'&sation\'&zation&&odular&&uclear\'!t(%rient',
+    '%$pack\'"ge\'+laeontology)"ma\'&rticle&&hagous(!r\'.enomenological\'$iura\'$orus(!t)&ograph\'\'thalmic\'%yllus(%sical',
+    ')$ning($smas\'$epis&$olar\'%rasil("es("us\'#wer*!s&"ro(&cedure*\'ssor(s).!-/*controlled/%tuned',
+    '/)generated.&/motor/(stepping)*ssor-based(\'fessors(\'grammer(\'pagated("ss&)ublishing\'(lsations%-refrigerators%\'scanner\'5ope-binocular-compass,$orne+$like',
+    '*#.if)#ick*"ng*"um\'"py\'$ript&&eeding\'"mi\'#nse(%tinel-"ux&$ites&"of()t&mdash;a)%-3com',
+    '*(insignia,#tel*#led))/insignia*(sympatex\'#sft\'&ystems&&pacing\'(eciation*"es)$tral++ophotometry\'&haeric\'$ores)&idians',
+    '\'(ructures\'\'ylolite&%urium&)ystemsinc%$tech&&hought\'%rombi,!a+$osis+"us&$idal\'&zation&$ones\'+pographical.!y',
+    '&+ransfusions\'"on)"ic&#win&+ympanometry%+vasculature\'#x-2(!s&#erb\'&sicles*$ular&$ideo\'/ewdata/viewdata)"er\'%llate',
+    '&!p%-wave-friendly*&packed)$able&$eave\'"ll&$orms&$rite*"rs)#ing$*processors#$tlan$%urate"%d&amp$*mdash;1017',
+    '$*rehy;1860s+#80s*#945+#50s+#60s+#80s)$20th))afternoon)$blue)#day*#own)%essex)%hants)$life+"ne',
+    ')&priced)$step+$ream)1twentieth-century))victorian)\'western*#ing#!\'$"71#,-&dollar;50s$$\'30s%\'forties%)seventies%(thirties$!1',
+    '&"17%$250s&#90s&"th%$360s%$430s&#40s&#70s%$530s&#80s&#90s&!c&"th%$600s&#50s',
+    '&#80s%$720s&#30s&#40s&#50s\'!4&#70s&#80s&!c&*th-century%#834&"40&"63%#912\'!6',
+    '&"20\'!1\'!5&"31\'!7\'!8\'"os&+52&ndash;53\'!3\'!5\'!8\'"os&)60s.there\'!4\'!6',
+    '\'!2\'!4\'!6&$90\'s\'"4.\'!7$"20$+30-year-old$"40$$520s%#70s%"th$$620s%!o$(70&deg;f',
+    '%#60s%#70s$"80%#20s%#30s%#50s%)78/autumn%"93&!5$#act%*dolescence%%ffair&(ternoons%#ged%\'ltitude',
+    '%\'necdote&\'nandale%&pricot%%rgyll&!m$#bar\'$oque&#sed&$ttle%#eat\'%ufort%%iased&"te%)listering%.uckinghamshire',
+    '&#rst$&calder\'(f-length\'#ves&(nterbury&%reers%"bd%$hase&#eek\'"st\'!w%)lassicism\'\'vicular&#ick%#old',
+    '&%ncern\')versation&"st%#red&$isis$$deal&!b&\'cember.\'&orated&#pth)!s&&vonian%\'istance*!t%\'onegall',
+    '&#wns$\'eastern%&ightie%%ocene%%scape&&timate\'$uary%%urope%*xplanation$#feb\'!.%2ield/upfront/wings&+fth-century&#led%$loor',
+    '%\'orenoon%%rance&)equencies&$iday%#ury$)gestation%&loster%&rapple&%eater\'\'y/black&#ope%#ulf%$went%#ybe&"re',
+    '$(holocene&"ur%\'undreds$\'innings%!r&#ons$\'jejunal&"rk%#ump$%l960s%#ake&(ncashire&#ter&$unch%-eicestershire',
+    '&$tter&$vels%&obular&)ndonderry$\'markets&&ssacre&#tch%#eal&$lody&\'taphase%%iddle%#oan&$dule&%nthly&\'rrissey',
+    '&&uthful&&vement%\'uharram$\'nervous%/ineteen-fifties-(nineties-)seventies\'*th-century%%orway$&oceans&&tober.%)esophagus%#ff.%)rdovician%*xfordshire',
+    '\'$ific&(laeozoic&\'ragraph(\'llelism\'"ts&%ssage&$trol%*erformance%$lane\'%stron&$unge%*ostglacial%%rices&(oduction\'"wl',
+    '%\'yraniki$%quack\'\'ternary$$race%$each&(citative&$gion&\'hearsal&)naissance%*h&ocirc;ne%"ib&&cochet%#ock&!w$,satisfaction',
+    '&"va&$xons%$cene&$ream%"ea\'#rch\'$sons&%minar&$ries&%tting&3venteenth-centuries%&helves&#ift\'"ne\'#res',
+    '\'"ut&%udder%%icily%#lam&#eep&%ither&$opes\'#uch%$oles&#uth)#ern%&pangle\'"sm\'"te%%taffs',
+    '\'#lls&"ep\'$rnum&#ory&+ratospheric\'#ike\'#oke%$uede&%ffolk&%mmers%&wallow%\'yllable$$tale&$riff&$sman',
+    '&%rrace%\'hatcher&*igh-length)!s&%ought&$rust%#ide%&o-date\'&senior&&kugawa&#nes%\'ransfer&#ead&#ill\'&mester',
+    '%$weed\')nty-first,%ourth$%value%+ictorianese-!s%%olume&#mit&$yage$#war\'!s&$ters%&eights%%hinny%%ifery',
+    '#!.#$/and$%class$%early$$high$$late$%south$#top#&=brown#\'as-like%"es$\'tlantic#&brain.(*/forebrain##cdo',
+    '$+lass-unique("es$$ourt#%d\'bro$%-larf$\'angeard%(y-to-7pm$#ele&!l%\'n-field&$dorf*!i&)stansbank%!r%\'sbrough',
+    '$"ie&!s%#man$+le&rehy;and,&period,$rank&)\'n\'bridge\'"un&0-aged-to-elderly*!s\'$back(#elt(%iased(&racket\'/class-dominated',
+    '.%rison-&tinted(#oat("ut\'0deemed-secondary)$mand(&istant\'&earner**th&rehy;or(%ights(&ngland(%urope\'&finger\'%grade,!r',
+    '\'$land(+ower-middle\'\'manager)#rch\'*of-nowhere*#the-!-.(nightish.%table\'\'persons(%ocket)#wer(%riced\'%right\'%scale',
+    '(&ixties)"ze($tage)%ratum*%ength\'(terraced(%o-low*&ruling\'%water(#ith($omen&!.\'%class&!/\'%edges',
+    '\'-working-class&#bie\'%rooks)#ugh&$dorp&%field+!s&$hams&(managers&$ness&$pass&!r\'&anking&(s-brough\',borough-born',
+    '*.ugh-manchester0&svingo-)/stockton-\'wrought+#hgh\'#ex.\'%field\'&hrough\'$mass(#oor&1ton-by-wirksworth*!l*\'one-row)%/hunt*#pro',
+    '\'&eights\'$hich\'$omen("od&4yard/gloucestershire%*ing-middle)$rank)%sized(+.prosperous$\'x/leics#2eighteenth-century$#nde\'&higher$$plan$&xtreme',
+    '$%endic$,ield/striker)"up(+er/attacker+&winger(&player%%fties%#led$&orties#$gard$1e&rehy;collecting%)-infested&$like&)repellent%"od',
+    '$!y#&height#$i\'ed$%-able%%based%(literate%&mapper&"od%$only%,programmable&\'yrenees%%rugby%%sized&$kirt&%ystem',
+    '$$/fsk$%buses$%nette)!s$%sized$$verb##jet#"la%(nd-based)#red(\'montagu(%owned\'&s-born)%north)*shrewsbury',
+    '(*/ambulance)$east)%wales\'#ton&#tic$&eading%&weight$%field#/night&ndash;7am($-fog($.and(#ers(*iceskating)"sh%#tes',
+    '$)esophagus#%piece$%rices#(quartile%$otes#)radically%4nge-but-still-pricey((/tweeter%$shic$*espiratory$#ibs%#ffs%%novic$#ush#&season',
+    '%\'venties$$ole.\'!d%$mers&#mer$#pmn$%tride$+um&rehy;mer&)mer-night)!s#$tour#)ventrally#%wales%$ters%"ys',
+    '%%ights$&ickets%%nter.)!s\'"ry%"ve#!y"/e&lsqb;u&rsqb;x#$bach#&czysaw#\'dziarek#%groet$!s##hle##lan',
+    '$"ec$!i%"es##nne#!o#%rassa$"da$"lo##ska$#sen$#zko#(tpalaste$)skasernen"%fbach#$ford',
+    '#"ta%!h"*g&ndash;15*"21,!s*!9$\'rehy;31#&-15uti$$23bn&!s%!7%!s$"31##21f#"an',
+    '$"wd#"da%!l##eod%!n%!t#$gins#(ht&mdash%!\'&"nt%!-&0potentially-have&$time%%.have%(y-vanned',
+    '%%orini#*matisation\'"te#$nard\'$ises\'!s$#edd$$onne(#tte&!s%"tt#/raine&rehy;vice(+-associated)(diseases)\'induced',
+    ')(specific(!e(#urs\'#ous%%leves%#nes%!t&$able&)ion.hthis)!/)"s.\'"ve&"or("ia)"us',
+    '$"il$"os#(u&eacute$!d$#el."%hailo\'!v((i&cacute$#jlo\')vi&cacute$#lis%!j&$ovic#!i$"el',
+    '#%rimah""ii"!j#$anou$#rna#"ic#%nssen"(k&oacute#(-roe-don#$aela$"mo$"sa##e\'s$#(3)$,-positioning',
+    '$)/prisoner$$d-up$"he$%ladze%3lides/architectural$$over$$sell%$tand)!s$!t%!i#-ha\'il-galerie%"el%)ilechenko%$ylov',
+    '$#lal#"ie#!k$!e%3lsen&lsqb;1985&rsqb$!o#*l&ograve;s$1o&scaron;i&cacute#$olas$!s#$rans$)ocomputer%!n#0ul&aacute&scaron%"as',
+    '#$-05t$#1op$$3000$$spec#"ac$!d$"is$!m$&n-born&#san%&/lazio%!a&#ise%"du%"es',
+    '%!i%&ofiore%!s%$uzzi$!p$(r/kevlar$!x##bah%#nke$$orne%#urn$$rook$$urgh&"ns&!y',
+    '$\'anowski$(h-mother%"em%&kontor$0ombe/oxfordshire%"vs$$reek#&d-eyed%+frost-hardy%\'looking%,manneredness%\'natured%\'scented&&eeming&$teel',
+    '%(moderate%&severe$#=12%"no$$burh$"en&#eye&%stein%*w-infested&#ing$#ish$/ly-contaminated\')explosive$%red-i%#ith',
+    '%(rehy;you$\'\'-which$\'-castle%$deep%%eater%$mark)!s%&savers%%thick$%.then$%/0.25%#100%)kilometre%$mark$%_away',
+    '$$bush$#nko$#oak$1r-turned-european$"s-&\'an-hour%(/1000rpm&\'central\'(ommunity&(designer&%event&&father\'&riends&&milton\'%other',
+    '%%_away%$mark%%toned$$tich%&opolis#+ford-on-sea$!s#&hauser#!i$$cent&!s%!i$(finil-il$%litre$&metres',
+    '$!s$.t&auml;rischer,+philosophie%%ancy\'\'+t-dominated)*in-control)\'related&"re(!m\'.ily-attractive+(dominant("se)#ing)"m.(.zation.remains',
+    '\'*y-aircraft*,uthoritarian)(directed)+educational*(quipment**stablished)&feudal*#ree)*government))historian),intelligence)#led)%naval)(oriented)%ruled',
+    ')(security*\'ounding*,pecification)\'trained)&useful(!/)-airline-style)%civil)*diplomatic))political(*withdrawal%$ello%-ia-controlled((operated\'!e',
+    '$"um$#voj$#yel\'!*#.j&ouml;partiet$$acka#*k&rehy;van$$-and(&-blood%$bank\'!r\'#sed&$orne&$reak\'%other',
+    '\'"rt&(hocolate&\'lotting&#ows%*derivative&+istribution&\'rinking%\'farmers&)ermenting%$girl&$lass&$reen%&horses%$like%&making',
+    '&$eats&%other&"ug%$nuts%%pails\'"le&%owder&)rocessing(&ducers+$tion%&ration&\'ecorded&$ound%%sated&(ensitive',
+    '&\'natcher&%oaked\'"ps&\'pecific%#vat%)with-soya)\'holding$%/meat$#ana$#bar%&ottles$#fed%%lower$%house$"in',
+    '$$line&"on$,man-designed$(nut-meal$$sops%#tar$$time$%weeds%$oman\'"en&"od$&y-blue&$eyed&\'looking&(smelling',
+    '&)to-cheesy#,l&pound;-man$!\'$%-bern&$ills&(uildings%(cottages%)designing%(employed%$girl%$hand&$ouse&"ut%\'manager\'$ster',
+    '%&owning&#xen%\'servant&$tone\'(ream-and%$wall&%heels&&rights%$yard$!.$)/rousseau$#ar.&1/northamptonshire&$dair\'!s',
+    '$$brae&$idge%#uie$%croft$*e-feuilles\'#oil&?quatre-cents-quatre-vingts-deux%"an%(colonnes%#dge%#ens%\'granosa%\'narians&&dreath&#ial',
+    '(!s&#nio%#one%%pedes%)r-dollard\'*nordenhake&+/auctioneer\'(champion\'#dee\'/gloucestershire\'&mother\'%nurse\'$rics\'\'sotheby&!e',
+    '&$hall&$ites&$ston&"us%.simovsk&yacute%&t-like&"on$.field-educated$%garth$&ham_et&"nd$"i-&-electronvolts&&kelvin,!s',
+    '&\'seconds%!a&&mmeter\'&phours%$band%.cent/wiltshire&$hamp\'#ope%%darcy&&egrees&#yne%,e/yvonne/mme&$grey&#mes&*quivalents',
+    '%)gan/rolls&#ham&%ramme%%hertz%*kin/vulcan%#man&!e\'#ter*!s(+r&eacute;es)(e-bedded+\'shallow+$thin+$wave&&icrons',
+    '&5gton-hawes/researcher+&smythe*!s&$ocet%!o&"n\'\'0-&dollar;100,0000%5,0000%7,000(\'100,000(%2,500(%3,577)%0,000(#500("80',
+    ')#cre($deal)3ollar-a-film-dudley($fold($g195($hour($line()millionth)(urdering((sesterce(%token**n-per-year+#nes))ransistor(0us&dollar;50,000',
+    '($year\'%.that()yesterday\'%/100m\'!1\'%aire-,\'in-fact,%to-be+\'s-to-be,3/journalists/crazed,#ses("re\'0increaseincrease("sh\'%naire',
+    ')&strong(!.)#but%-pore-filtered*&waters&$rime%!s&#ec.&$kirt%#uon$#ook%!r&$aine%#shi%%wners',
+    '&#ols$%rinds$$s/ap&\'brother&$gary\'"wr&&mother%"om%!y$#ton&#wns$$view$,wall/arsenal&5rd-sadler/southampton((/stevens',
+    '##man#!n$!a$0er&ndash;holland&&-barry&#ite)!s%)s-gaskell$"or$&thorpe#1o&scaron;-marasli$!n$#rad$$srod$!u',
+    '&#dov%!y#!p$"ar#(quetoast#(roy-type##sch$#om.$#pec$#ted%#one#$tary$%horpe$%iadis$-on-humberside',
+    '\'.under-wychwood&$isms&!s%"un#"uk$!n$#pan$\'tinovic##vio#,waukee-based%!y$$ukee"&machal$(greement$!r',
+    '#&e-show$#che$!o%%graph$"rs$#ses$\'tically#%iambi$#ced%"ks%$ries&.y-memorization%"us$#eux$#nal',
+    '$!r##pow##ran#$sing##ura"(n&eacute#*-assembler$%buses$%ha-to$$peak$%y-don##.40#$/max#!7#%accia',
+    '$#deo$"le$"mi&"no$(ret-like\'"ed\'#ted$$tion%$o-ku&"me&$rily%#ure#\'cassian$%e-pie&\'stained',
+    '\'"up&!.%$fish%"rs%"ur$#hem$#in\'&#gly$#kes%&iewicz$!y#,d&mdash;that%-rehy;altering*\'blowing*\'numbing',
+    '*!s$!\'$#-\'i%%again&/nd-eye-boggling%\'benders)%ingly&&lasted&&oggler&$rain\'&eaking%\'catcher&%hains(%nging&)rushingly',
+    '\'(stroying&\'izzying&#own%)expansion%&fazing&%ilter&#org&#uck%%games&%uards%\'jolting%)lessening%,manipulators\'!p(!s',
+    ')"ng&&ushing%&nature%\'opening%\'picture&\'ounding&*ulverising%#sap\'$ving&&creams&&earing\'#eds&+hatteringly&%laved*!s',
+    '\'&unning%$tech&&o-mind&+ransforming\'"ip%(widening%#you(.r-own-business$".2%"it%&united$\'/matter$%_even$\'bending+\'ly-dull',
+    '$0craft/microprose$(er-speak&*/presenter$%fully$%games).-in-the-desert$"in&+g&rehy;this$&locked$&olluin%!n%&wyergo$&phaser$\'s/admit&+conditioned',
+    '%#ets%$hare%%torms&#yle%%ucker$$trap$"us$&walker%%iping#,e&rehy;field*%lofty$!\'$0-and-your-social%)detecting+"or',
+    '&#ree%$head&&unters%%layer&\'eaching%(managers&$outh%&owning%\'prodder%(sweepers%(tailings%(workings$\'/quarry$$_for$#bea',
+    '$%layer\'#ing%"la$(minemine$(nwerfers$%owner)!s$.ral-containing(+exploration*(tracting0"on(%laden)%oving(*occurrence)#nly',
+    '))rocessing\'!e\',importexport("st(#zes)#ing\'!l\'*ocorticoid(#gic%+oper&uacute)!u&!s%"s.%#v\'a$$stra',
+    '$$town%"te$#urs$"va$%watch)#ing$"xp#"fu#\'g-chien%\'dynasty%#hui%#min%)porcelain$%/qing$#ana',
+    '$%ograf("ph%!s$"qi#$heer#.i&rehy;classic*(trunking$+-acoustical&*dvertising&+gricultural&\'ilerons\'&rliner&(partheid&&quaria&\'rticles',
+    '&$udit\'(stralian%$bank\'$sket\'$zaar&#ead(#sts&#ins\')ographies\'#tes&%lazer+!s\'"ob&$ooms&$rain',
+    '&&udgets\'$ffet+!s\'%ttons\'$ying%\'cabbing\'&mpaign\'%ptain\'!r\'&ssette($tors\'\'talogue(&hedral&+elebrations("ls',
+    '&&hitted\')romosomes&%ities(!y\'#vil&&lasses\'%inics\'%ubman&$oach\'&llapse)\'ections\'"mm)(andments(\'pendium)%uting',
+    '(\'ference(*glomerates)$ress($sole(\'vention\'*rporations\'#sta\'%untry($rses\'!w&$rane\'#ime%)daffodils&%ebate\'(pression',
+    '&+ictionaries\'$esel\'$gger\'!n\'\'sasters("cs(\'neyland&(ocklands((umentary\'"ts&%ramas%%earth*&quakes&\'lectric&&mperor',
+    '&!r&"st(#ate&%thnic&$xams\'"on%#fad\'"ir\'!n\'"rm&%eeder\'&stival-!s&%igure\'"le',
+    '\'"ts&$lock(#wer\'%utter&%orest(#mat&&reezer%*gasometers&#ear\'%neral(%ocide&$oals\'#ose&$rand\'&eatest',
+    ',!s\'%inder\'#oup&%uides\'!n&\'ymnasia%\'hansard&)eadphones(#ter&&istory&"ms&&oliday&)umbuckers&$ydro\')permarket',
+    '\'&dustry\')stitution)\'ruments\'\'terview%$jack($uzzi%*laboratory\'%goons\'"ke\'&nguage\'$unch&&ecture\'$ngth&(imousine%$mail',
+    '\'$lham\'!p\'\'rrakech\'"ss($ters\'(ttresses&\'easures&$icro\'#lls\'#xer&&ohican\'(nologues($ster\'$sque%&nation',
+    '%\'offices&$pera\'%tions&#rgy%&parade(\'liament&*erformance&$itch&%olice)$tics\'&rtable&\'rairies\'$ints($sons("ze',
+    '&*ublication\'(pillages%-qualification\'"iz%$raid\'"mp\'$ting&(ebellion\'\'cording\'$gion\')naissance\'\'trieval&%idley&$oyal&#ush',
+    '(!e\'%iling&#can)#dal\'&haller\'\'rambler(#een&%eason+!s\'%ction\'"ed&&hampoo(\'rpening\'$eath(!d',
+    '\'#ows&$ites\'#zed&#kip&$labs\'%eeper\'#ump&#oap\'%ciety&"pa("sm\'"ot&$tack("ge*!s',
+    '\'#egs\'%rokes\'$udio&$uite*!s\'#mma\',percomputers(#ply\'%rveys&\'wimming-%-pool%#tab\'#lks&%emple\'"st',
+    '&&heatre(%ories*!y(#sis&\'imbered\'!n&%oggle\')urnaments)!s&\'ractors("in(\'mpoline/!s((nsceiver\'$eaty',
+    '\'$ipod+!s)!s&&welfth%,unconformity&#zis%*vegetables\'$nues&\'illages\'$olin&&olcano%$wars\'\'tergate&,elfare-state&(indscale',
+    '&(urlitzer$*/mainframe\'!n$!a%"te&(ure-like(#ise*#ing*!m$$bead%*rewery/pub&#ute$$cars%#ell("s.',
+    '\'"ps&-olecystostomy&#rom%$lubs%+onglomerate\'+stitutional%$raft&$uise%&ulares$,dictionaries-!y&$gger&"sc\'!k$)epidemics',
+    '$#fex$#gas%#rip%"un$%hawks%$omes$%jeeps$$link$$m=32&"41&"60&"72&"g3%-al-competency\'*ist/formal',
+    '(#zed)#ing\',ly-furnished*%sized&!p&#xed%&emoirs%$ills&%racle&%ssile&$zed.%"se%!u&,m-efficiency(%price',
+    '(*to-minimum\'"=o$!n%"al%+g-and-steel\'&timber(/o-manufacturing(%rucks\'$were&%/miro%#ote%"um$#ott$#pig\'!s',
+    ')"er&%otean%#uls&"mp$%reefs&!s&%views%(hizotron$)satellite-!s&!w%&calchi&&reamer\'$ibes%"er',
+    '%&kirted%\'leepers%-t&eacute;rial0#els&$ates&!e\'"ps\'"r\'($-but)%civil*)ouncillor)%elect)(governor))in-charge,*government',
+    ')%level))secretary)$wife+0th-the-film-star($.and)"he(!/)&leader)$over)&person*(resident(\':shaikh("es((ial-rank+/b&uuml;rokratie',
+    ')!o)"um(+s&mdash;not)!*)!-*(resident)\'/deputy*&senior)&:ekrem*(mohammed)!n&+i&egrave;re&+r&lt;ies&gt\'"ae("te',
+    '\'"os\'+y&lt;ies&gt((-fixated(!.(&/board)*jourgensen&"wy$&tanker&"pe%!e&"ch%$rams&&unking$&uscula%#tes',
+    '$#zen#\'jelkiev#&k-coat\'&loured%$farm%\'handled%\'watcher$!a$#ler$!o%&-phile%"ff##ley$#lyn##nas',
+    '&(polis/st*#tan%%llian%#ola%%sota*&$sota%!y$#ich%"e\'%$grey%#ons$#och%\'w-sized#)oan-style$%cytes',
+    '$"is$!l$\'r&mdash%\'-b&flat&!c\'\'ategory&!f\'$7-e7&!g&&legend&%ninth&-public-school&(quantity%%esses&$ttes',
+    '&#tie)%s/the\'/y&rehy;reverted(\'-backed)\'carrier))dominated)#led)*orientated)\'related*$uled(!.(*/so-called%"um$%taur.(!o',
+    '$!x#"qi#2s/1989/colour/cert$#elf$%hull-)%beech$#iet$#ker$0mere-walberswick$*ter-on-sea+&thanet\'!o%*rel\'-style&!y#$t(s)',
+    '$(/ammonia$#age$$bush$#ec.%"l.%#rne&!s$"he$#law$&o-life%!e&!s%(n/oxford\'$work&%esque',
+    '$#rim$#ues$/y/neighbourhood#%uetto$-s-twenty-five%#ses$!t%!a%&e-book+!s\'"in\'%man-3\'%timer&$hand&,ly-decorated',
+    '&*s-hands-on\'!/(*appearance()decisions("mg\'!=($four\'$plus%$illa&!o%%oides%!s%!y#%y-don#$zatu',
+    '""o\'#\'cardico$.ene-aquitanian\')/pliocene&"ic(!s$#hol#&dowicz#,geosynclinal#$lnir##mir#"nd#&spores$$sens%"on',
+    '#,s-compatible%&killer%$only&$sf/1%#sgi%&ultrix$$/200%#5.3%(advanced%\'silicon$\'tations"&quaman"(r&aacute$4oacute;-dalmau-gasch%%grave',
+    '#$-adn$#eta$\'i-boteh#&abelle%#ili(!a(!b$!c%$idia%)le-making*!n\'"s/%-u&rehy;lously&\'lousloy&%ously',
+    '$$dors$$ging%%liano$!m%"bo$$nda.\'"is&#ola&#ula%"ov%!t$%phone$!r%"is#$bach',
+    '#"ca%"le$\'handani%!o$"on%$soft#!d$#ita#&ehouse$"la%"da$!x$!y##fin$"yn',
+    '&%-mind+"ed&&minded%&m:soto\'$that)"ey\'"we(#hat$!c$$jana$#mar$#nda$#sta$#zzi#!j',
+    '%"na&"ic#!k$"in$#nen#"oc$%nenko%&tschuk$$phar$#ton$$unga$$vaia$$wski#$ren0&\':battle',
+    '%!n$!o%.r&rehy;fronted,$like&!-\'$anya\'$back\'\'cabinet)"lm)"se\'%domed)"or\'#eye\'$flat($rame',
+    '*$nted(%usion\'%gloss\'\'handles($elen\'&imaged\'&lensed($ined\'%match(&eeting\')of-nature(\'n-stand\'&plated(\'olished)#sed',
+    '\'$room\'%shiny\'%tiled(%opped\'$work*"ld&(/picture&$less\'#ike&1s/windows/sunroof&$work%"ur\'!s$%yland#%shani',
+    '&&making%%maker#"um$"ts#,vic/speaking%#lle%"ng%"sh#"ys#\'zabekov$!o"/s&ndash;matches$0rehy;calculation))demeanour)%filed',
+    ')%match).representation)\'tresses#\'\'employ#%-12es%"es$#2es$#4es$#aim%&ligned&(location%*pplication)"ed\'*ropriation%)ssessment',
+    '$&called&(talogued%&hanged%*lassifying&&ubbing%&onduct\'.textualization$(dealings&&signed&)velopment%&ialled&\'rection%&rafted$*estimation%)xperiment',
+    '%$iled\'#ing&"re\'#ing&!t%%ormed\'$tune$\'guessed&$ided$$hear($ings%&ooking$(informed&)terpreted$&judged',
+    '$&keying$#led$$move$+observation%\'riented$\'parking&(tterning%)erception%%laced%(ronounce()unciation$%quote$\'reading&(membered%&outing',
+    '$)selection\'$ling&%tting%%hapes\'#ven%#ion%\'peaking\'"nd&$oken%#tep&\'retched\'#ike$#ter%#ime(!d',
+    '\')nslations%%uning%$yped$.understandings$\'written#0acknowledgements$&ilides$"ke%!i$\'nalysed%"in%1thropical-looking+"st*(omorphic$+pplications',
+    '\'!y&)ropriates-$ions$)ssessment$(ttribute,!s#\'behavin)"or*$ur-.,!s%$lief(#ver$&randed#*calculator%&ptions',
+    '&&riage.(#ed.)!s$\'egenate+!d%*llaneously\'!e%%rique$\'h-masch%(annelled%%ecked%(ief-\'you(!.(#ing(&makers',
+    ')#ous%$osen%+tschenkoana$*lassifying$\'oloured%+mmunicating&\'prehend%.n&rehy;ception&&ceives&,duct/offence*!s&&nected*#ion&$trol%"py',
+    '$\'roscope#$date&#ing$\'ealings&(meanours%\'livered%&scribe$\'iagnose+$dive&!l$%oings%#ubt(!s#(educated)#ing',
+    '%!y$#num$"ra&$bili\'$lest(#ish("y.&"re%!e&$atur%!i&"as&"or&!s%%matic',
+    '%&y-guts&$gobs\'#uts&$whip$&vicius#4feasance/nonfeasance$%iling$(ortunate,!s)"ed#(givingly$\'overned)%ments$$rief$(uardedly',
+    '#(h-mashes%$take$"ab%"el%!k&!e%%ndles$#ear\'$ings%"ck$#ish$"ka$#mar%"eh$!o',
+    '#*i&oacute;n$"ck$)dentifies$%ewicz$%ndica%*formations%)tegration\')pretation\',rpretability$$ones$!r#\'joinder$&ustice#\'katonic$#ick',
+    '%%ewicz%*n/graduate&!e$\'nitting%\'owledge$$ovic#$l-ed$#ays$!e%$ader\'0ing-intermediate*#.14%#toe$$iked%"ng',
+    ')%ment.)"rs%#ted$&easure$!o#$name\'!s$"er#&ogynos$#nne$(peration$%rient$!s$#uri#\'pending',
+    '*#ing&#ton$%layed$+resentation%%inted&#zed%$oofs$&unched#(quamacus#)r&aelig;d$\'a/arifa%"ch%"hi%#tis$)ead-.ings',
+    '&(ognising*%zable+"es\'$rded%%ports&4resentation&mdash;ss1"al$%outed$!y#,s&mdash;give$"\'t$&-heard&"it%#ish%\'nothing',
+    '%$pass%%spelt$!.$*/ms/mrs/mr$\'ailidis%&koulis%#mbo%#rum&(zhevksy.%%ticum$#ed.%&lbrook&\'thwaite%"rs&#ver',
+    '%%elved$)ile-based)&earing($camp*&rrying(#gap)\'uidance()launchers(%maker\'"ry&"ry%#mix&!o%#ng-($link',
+    '(\'toothed\'&.joyce\'./captured3723+0\'500+n/a%(ological&+n&rehy;just\'4-bleeding-impossible()committed)(ritiques(&minded(%place()sponsored)&tation(+territories\'%.this',
+    '\'.aries-by-force,!.)(y-minded+\'planted\'"es\'#ing(!s)#ing("ze*!d*"rs\',wissenschaft%%ssipi)*pi-alabama\'$uaga',
+    '$#our\'\'i-based*#orn)"st$\'peaking&&cified&$ller&%nding(!s$$sing$$tate#(t-beaded&#lue%(filtered%%laden',
+    '%)producing%&shadow&&keined&&nagged&\'oftened&&prayed%(workings&\'raithed$!.$(/drizzle$"ah%$ikes%%kable&\'e&mdash-#;oh',
+    '\'(-plagued(\'related\'#.56\'0/failing/looking\'$able\'%nness\'"s.((/dangers&#in\'$&elback%)r-righted&#ies\'#oso&!o&$rrrr',
+    '&-vicepresident&!y$#her$"ic%"n\'&$g-up\'$uett+!e%$tled%#voj$(lethrush,%-like\'\'oe-that%"in$&ral-20',
+    '\')/ski-surf&(nscribes($late,!s%*ess-driven("ed($mind%$ials&(s-faerie%!y$&ubishi%!r$&wraith$*y-sounding&%white',
+    '&$ings#!u$!c$&menops%!i$2nderstand&rehy;ing-"ig."n\'$$rina#$well#$yats"#tar$!u#(bewerber#+cham/sutton',
+    '&$lham\'(l-kernan)%moore)#pen)(rossdale(&/child*+onservative+$unty)(designer))engineers)\'fitness)-paediatrician*(ensioner*)layground)\'station',
+    ')\'vehicle\'#ton&#ner\'#ham&#son%"ie%(um-mania#"e.$!b$!k$&yspice#\'glieder##hai%"ns$(ileshwar',
+    '$"os$%ranee%"im#&igator#"ja%$neta$#orn##kov#$nick#!o$+chondrially&\'rondria$%mycin$#ses%#sis',
+    '#$raas%(illettes%\'l-valve$(e-joints%$dale%#ing$*ochondrial%$witz#&singen%"wa$\'opoulos%!u&"ko$!u%+bishi-honda',
+    '%$hiko%&ibishi%"ko%$nori%"ru$!y#(tel-land&+alterlichen\'/nd&mdash;except&#egi\'$urop+#ean&$legi&,rhein-museum&&staedt',
+    '%(n/former&$dorf&$wald%\'rramses(\'nd-bush+$kohl*#ist&$sill$#ful$#ing$(leeuropa$"oo$%yisms#&ubishi$!s',
+    '#$yana$$lene#"ze%!l$#man$#vah"!u#%nutes"$vaki%!y#"ec#%imbio$%ombio#&vycorp"&wacles',
+    '""x\'#*-\'n\'-match$+on-the-spot$)transfers#(/balance$#dry$(squatter#%alloy#/ed&rehy;farming+(religion+#sex%\'-alkali&%chain\'#ode\'\'ropping',
+    '&\'density(*scriptions&\'economy&\'farming&\'handers&"in($come&\'manning\'%edium(#tal+!s\'#ode&+nationality&&origin\'$wner',
+    '&%pairs(\'rentage\'\'roperty\'&urpose&(religion&&sector&#use&%value\'$oice&$wood%)/pastoral%$ness$(r-feeder%#man#%ifoam',
+    '%&g-room&(/amnesia&!s##mag#&oldian%-ydian/schmidt*$b2b6$!n#!t$!a$#ura&,e-of-normals($rich($that)%iming',
+    '\'&s-that""ya$"go$$kawa%"ou$,mae&ndash;ku$!n%"da$#res$&zawaon"%zaaya$#nur$\'r-alcor##ban#\'fortune',
+    '$%guchi$!n##una$$tani$$wari##zas$(en-mast.\'$sail&$mast$"le%#ing!%j2501"$3001#!5"*730/g-hfix',
+    '"$cosa"$elde"!f"!l""or"!r!(k\'kur\'qa"#-ad#"d6"".1#!2##iic#!x$"iv$"vi',
+    '"%/plfa"#111%!c#!4"#2as""35#!s".4&ndash;styled#!0#!1#!2#!5#!s""9a"!b',
+    '"%hahle#$onta&!o#&wanazi"$iiis""m."!t#(-ability"(ukumkuku""vi"(wapatira!3l&yacute;nsk&aacute"!."(/&frac12*%;pint',
+    '##100$!2%!0$#6fl#!s#$tbsp$"sp""11"!2"!3"#407""6s"#aen#%mbala#%nenko',
+    '"%d/esn"$enga"!g""ib &nargis',
 )
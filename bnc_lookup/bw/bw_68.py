@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_68 = (
+count_68 = 6694
+
+heads_68 = (
     'ltd-hosted',
-    'ltd-made',
-    'ltd/anderson',
-    'ltd/de',
-    'ltds',
-    'lte/286',
-    'lth',
-    'ltp-related',
-    'ltp1&ndash;3',
-    'ltte-controlled',
-    'lty',
-    'lu&igrave;s',
-    'lu&zcaron;ick&eacute;ho',
-    'lu2',
-    'lu3',
-    'luachraich',
     'luaka',
-    'luane',
-    'luanisone',
-    'luarasi',
-    'luarasiminister',
-    'luarca',
-    'luaus',
-    'lub&eacute;ron',
-    'lubango',
-    'lubavitchers',
-    'lubbenau',
-    'lubberkins',
-    'lubbocki',
-    'lubbyns',
-    'lubchenko',
-    'lubellin',
     'lubelski',
-    'lubetkin',
-    'lubicon',
-    'lubie',
-    'lubimov',
-    'lubitsch',
-    'lubke',
-    'lubkert',
-    'lubkowski',
-    'lublin-maidanek',
-    'lublina',
-    'lubnaig',
-    'lubner',
-    'lubomirski',
-    'lubota',
-    'lubrications',
     'lubritrak',
-    'lubtchansky',
-    'lubuski',
-    'luc&iacute;a',
-    'lucan-like',
-    'lucano',
-    'lucanus',
-    'lucarne',
-    'lucarno',
-    'lucas-arts/us',
-    'lucas-tooth',
-    'lucas/green',
-    'lucases',
-    'lucasproof',
-    'luccan',
-    'lucco',
     'luceafarul',
-    'lucem',
-    'lucena',
-    'lucence',
-    'lucentio',
-    'lucernese',
-    'lucette',
-    'lucevan',
-    'luchenzo',
-    'lucheti',
-    'luchian',
-    'luchnikov',
-    'luchon',
-    'lucht',
-    'luchtvaart',
-    'luchvaart',
     'lucibello',
-    'lucic',
-    'lucidae',
-    'lucidryl',
-    'lucientes',
-    'luciers',
-    'luciferin',
-    'lucilia',
-    'luciliae',
-    'lucilla',
-    'lucillus',
-    'lucina',
-    'lucindian',
-    'lucino',
-    'lucite',
-    'lucjan',
     'luck&mdash;the',
-    'luck-bringer',
-    'luck-of-the-draw',
-    'luck-that',
-    'luck/gloucestershire',
-    'luck/knack',
-    'lucked',
-    'luckenbach',
-    'luckets',
-    'luckhaus',
-    'luckie',
-    'lucking',
-    'luckington',
-    'lucklustre',
-    'luckman',
-    'lucknam',
     'lucknext',
-    'lucks',
-    'lucky/bad',
-    'lucky/lucky',
-    'lucocephalia',
-    'lucraft',
-    'lucrecia',
-    'luctians',
-    'luctus',
-    'lucubrations',
-    'lucy-o',
-    'lucy/matthew',
-    'lucys',
-    'luczak',
-    'lud-o-vi-co',
-    'ludabelle',
     'ludburgh',
-    'luddenden',
-    'luddendenfoot',
-    'luddesdowne',
-    'luden',
-    'ludenhof',
-    'luderitz',
-    'ludholf',
-    'ludicrus',
-    'ludloff',
-    'ludlow-clee',
-    'ludlow/shorpshire',
-    'ludman',
-    'ludovica',
-    'ludovici',
-    'ludovick',
     'ludovina',
-    'ludowe',
-    'ludowe-solidarnosc',
-    'ludowick',
-    'ludship',
-    'ludshott',
-    'ludvik',
-    'ludvingsen',
-    'ludwell',
-    'ludwick',
-    'ludwidge',
-    'ludwigi',
-    'ludwigs',
-    'ludwigshafen-based',
-    'ludwigshohe',
-    'ludwigslust',
     'luehdofia',
-    'luehea',
-    'luelling',
-    'luemba',
-    'luembe',
-    'luer',
-    'luessonhop',
-    'luest',
-    'luet',
-    'lufand',
-    'lufelyst',
-    'lufen',
-    'lufengensis',
-    'lufengpithecus',
-    'luffed',
-    'lufkens',
     'luft-am-meer',
-    'luftansa',
-    'luftfahrt',
-    'luftikus',
-    'luftschutzraum',
-    'luftullah',
-    'lufwaffe',
-    'lufyng',
-    'lug-worm',
-    'lugage',
-    'lugal',
-    'lugan',
-    'lugano-based',
-    'lugendbaron',
-    'luger-toting',
-    'lugg/herefordshire',
     'luggables',
-    'luggage&mdash',
-    'luggage-minders',
-    'luggage-racks',
-    'luggage-trolley',
-    'luggage-van',
-    'luggage.',
-    'luggaged',
-    'luggnuggians',
-    'luggs',
-    'luggsury',
-    'lughan',
-    'lughmas',
-    'lugi',
-    'lugmag',
-    'lugny',
     'lugo',
-    'lugoj',
-    'lugossi',
-    'lugsail',
-    'lugubriousness',
-    'luguvalos',
-    'luhan',
-    'luhke',
-    'luhring-augustine',
-    'luhta',
-    'luhya',
-    'luichart',
-    'luick',
-    'luigo',
-    'luirc',
-    'luirgean',
     'luisant',
-    'luisella',
-    'luisenlund',
-    'luisinho',
-    'luisito',
-    'luit',
-    'luitel',
-    'luj&aacute;n',
-    'lujinovoc',
-    'lujo',
-    'luk&aacute&scaron',
-    'luk&aacute;cian',
-    'luk&aacute;s',
-    'lukacsian',
-    'lukamba',
-    'lukanima',
     'lukavac',
-    'luke-crazed',
-    'luke-do-it-all-denner',
-    'luke-perfect-crawford',
-    'lukeheads',
-    'lukeji',
-    'lukes-collins',
-    'lukevics',
-    'lukewarmth',
-    'lukhansa',
-    'luki',
-    'lukian',
-    'lukics',
-    'lukim',
-    'lukk',
-    'lukked',
     'lukkin',
-    'lukkin\'',
-    'lukks',
-    'lukoff',
-    'lukoji',
-    'lukoschus',
-    'luksic',
-    'lulab',
-    'lulabelle',
-    'lulas',
-    'lule',
-    'lulea',
-    'lulic',
-    'luling',
-    'lulla-buys',
-    'lulling-stone',
     'lullingly',
-    'lullingston',
-    'lullula',
-    'luloff',
-    'lulton',
-    'lulus',
-    'lumba',
-    'lumbatologist',
-    'lumbe',
-    'lumber-house',
-    'lumber-mill',
-    'lumber-shirts',
-    'lumber-town',
-    'lumberjacket',
-    'lumberjacking',
-    'lumberjill',
     'lumbermill',
-    'lumbershirts',
-    'lumbersome',
-    'lumbo',
-    'lumbricidae',
-    'lumen-dwelling',
-    'luminal/',
-    'luminally',
-    'luminaries.a',
-    'luminarja',
-    'lumination',
-    'luminelle',
-    'luminescing',
-    'luminist',
-    'luminometer',
-    'luminousness',
     'lumizip',
-    'lumleian',
-    'lumleys',
-    'lummie',
-    'lummis',
-    'lummock',
-    'lummy',
-    'lump-bellied',
-    'lump-sums',
-    'lumpa',
-    'lumpen-knot',
-    'lumpenbourgeoisie',
-    'lumpenization',
-    'lumpenpack',
-    'lumpenprole',
-    'lumphanan',
     'lumpia',
-    'lumpini',
-    'lumpishly',
-    'lumpishness',
-    'lumpsucker',
-    'lumpus',
-    'lumpy-smooth',
-    'lums',
-    'lumsbury',
-    'lumsden/founder',
-    'lumsden/oxford',
-    'lumsley',
-    'lunacharskii',
-    'lunachicks',
-    'lunala',
-    'lunan',
     'lunanspach',
-    'lunar-tick',
-    'lunardi',
-    'lunare',
-    'lunate',
-    'lunatic-',
-    'lunatic-sounding',
-    'lunations',
-    'lunb',
-    'lunb/test',
-    'lunceford',
-    'lunch-',
-    'lunch-basket',
-    'lunch-breaks',
-    'lunch-counter',
-    'lunch-date',
     'lunch-laden',
-    'lunch-parties',
-    'lunch-room',
-    'lunch-rooms',
-    'lunch-spattered',
-    'lunch-stop',
-    'lunch-to-tea',
-    'lunch.',
-    'lunch/25/10/93/',
-    'lunch/25/10/93/cde',
-    'lunch/a',
-    'lunch/assist',
-    'lunch/zmu/1/11/93',
-    'lunch/zmu/2/11/93',
-    'lunch/zmu/20/10/93',
-    'lunch/zmu/25/10/93',
     'lunch/zmu/26/10/93',
-    'lunch/zmu/27/10/93',
-    'lunch/zmu/28/10/93',
-    'lunch/zmu/29/10/93',
-    'lunchbreaks',
-    'lunchdate',
-    'luncheon-parties',
-    'luncheon-party',
-    'luncheon-takers',
-    'luncheon-train',
-    'luncheon_table',
-    'luncheonette',
-    'lunches.',
-    'lunching.',
-    'lunchroom',
-    'lunchtable',
     'lunchtime/zmu/21/10/93',
-    'lunchtime/zmu/3/11/93',
-    'luncthime',
-    'luncus',
-    'lunda-bululu',
-    'lundaijancan',
-    'lundaland',
-    'lundbaek',
-    'lundbeck',
-    'lundburg',
-    'lundby',
-    'lundenwic',
-    'lundergaard/sandling',
-    'lunderners',
-    'lunderquist',
-    'lundhag',
     'lundies',
-    'lundin',
-    'lundstr&ouml;m',
-    'lundstrom',
-    'lundtofte',
-    'lundvall',
-    'lundye',
-    'luneberg',
-    'luned',
-    'luneville',
-    'lung\'arno',
-    'lung-and-a-half-full',
-    'lung-bladder',
-    'lung-cage',
-    'lung-carrying',
-    'lung-crushing',
     'lung-damaging',
-    'lung-imaging',
-    'lung-opener',
-    'lung-puncturing',
-    'lung-sac',
-    'lung-tissue',
-    'lungawater',
-    'lungers',
-    'lungfishes',
-    'lunghnasa',
-    'lungi',
-    'lungis+',
-    'lungless',
-    'lungsful',
-    'lungshan',
-    'lungworts',
     'lunik',
-    'lunk',
-    'lunked',
-    'lunken',
-    'lunkhead',
-    'lunn/chairman',
-    'lunn/st',
-    'lunnan',
-    'lunndaidh',
-    'lunnen',
-    'lunnis',
-    'lunnon',
-    'lunns/tag',
-    'lunnun',
-    'luntshire',
-    'lunule',
     'luny',
-    'lunyegova',
-    'lunzjata',
-    'luo-land',
-    'luoghi',
-    'luogo',
-    'luoops',
-    'luos',
-    'luoshu',
-    'lupa',
-    'lupalupa',
-    'lupara',
-    'lupas',
-    'lupecci',
-    'lupeli',
-    'lupeol',
     'lupercalia',
-    'luperfoy',
-    'lupescoo',
-    'lupesku',
-    'lupetta',
-    'lupetz',
-    'lupfer',
-    'lupicinus',
-    'lupine',
-    'lupinization',
-    'lupio',
-    'lupow',
-    'lupunga',
-    'lupus/cad&eacute;ac',
-    'luqman',
-    'luque',
     'lurana',
-    'lurch-riff',
-    'lurchin\'',
-    'lurchy',
-    'lurcott',
-    'luredur',
-    'lureiro',
-    'lurex-cellent',
-    'lurex-decked',
-    'lurexed',
-    'lurgainn',
-    'lurgan\'',
-    'lurida',
-    'luridly-coloured',
-    'lurker',
-    'lurkin\'',
     'lurking-tetanus',
-    'lurleen',
-    'lurmark',
-    'lurning',
-    'lurrve',
-    'lurrves',
-    'lurvaine',
-    'lurves',
-    'lusaka-based',
-    'lusatian',
-    'lusby',
-    'lusciousness',
-    'luserna',
-    'lush&rehy;green',
-    'lushaj',
-    'lushes',
     'lushest',
-    'lushun',
-    'lusiad',
-    'lusiads',
-    'lusignan-struck',
-    'lusinghier',
-    'lusitanian',
-    'lusitano',
-    'lusk',
-    'lusk-harbison-jones',
-    'luska',
-    'luskin',
-    'lusophone',
-    'lussey',
-    'lust-gleam',
-    'lust-in-denim',
     'lust-in-the-saddle',
-    'lust-inspired',
-    'lust-ridden',
-    'lusta',
-    'lusters',
-    'lustfully',
-    'lustige',
-    'lustinaca',
-    'lustless',
-    'lustrations',
-    'lustril',
-    'lustrousness',
-    'lustrum',
-    'lustworthy',
-    'lusty/parish',
-    'lusulas',
     'lusy',
-    'lut.',
-    'lutaria',
-    'lutatius',
-    'lutcher',
-    'lute-books',
-    'lute-bridge',
-    'lute-like',
-    'lute-maker',
-    'lute-making',
-    'lute-manuscript',
-    'lute-music',
-    'lute-playing',
-    'lute-stop',
-    'lutealudlowii',
-    'lutece',
     'luted',
-    'lutein',
-    'luteinisation',
-    'lutelessons',
-    'luteola',
-    'luterells',
-    'luterman',
-    'lutero',
-    'lutfi',
-    'lutfur',
-    'luth',
-    'luthce',
-    'lutheran-hymn-like',
-    'lutherature',
-    'luthers',
-    'luthiery',
     'lutist',
-    'lutken',
-    'lutkevich',
-    'luto',
-    'luton&ndash;brighton',
-    'luton-dunstable',
-    'luton/bedfordshire',
-    'luton1',
-    'lutrensis',
-    'lutschine',
-    'lutsk',
-    'lutterel',
-    'lutterodt',
-    'luttichau',
-    'luttman',
-    'luttrel',
     'lutudarum',
-    'lutus',
-    'lutwidge',
-    'lutwyche',
-    'lutwyche/cotswold',
-    'lutyens-jekyll',
-    'lutzelburger',
-    'lutzhoft',
-    'lutzke',
-    'lutzow',
-    'luuurve',
-    'luv\'ly',
-    'luvable',
-    'luvely',
-    'luvey',
-    'luvian',
     'luvin',
-    'luvsabjav',
-    'luvsandambyn',
-    'luvunga',
-    'luvva',
-    'luvver',
-    'luvvly',
-    'luwai',
-    'luwen',
-    'luweru',
-    'luwum',
-    'lux&mdash',
-    'lux.',
-    'luxan',
-    'luxating',
-    'luxemberg',
     'luxembourg-belgian',
-    'luxembourg-listed',
-    'luxembourg-registered',
-    'luxembourgs',
-    'luxemburg-registered',
-    'luxemburgers',
-    'luxemburgs',
-    'luxenbourg',
-    'luxfer',
-    'luxford/villager',
-    'luxicars',
-    'luxipelt',
-    'luxiurious',
-    'luxmoore-mays',
-    'luxor&ndash;aswan',
-    'luxor&ndash;cairo',
     'luxor&ndash;denderah&ndash;luxor',
-    'luxor&ndash;west',
-    'luxuria',
-    'luxuriously-appointed',
-    'luxuriously-upholstered',
-    'luxury-inventions',
-    'luxury-living',
-    'luxury-wallowing',
-    'luxury.it',
-    'luxuryrest',
-    'luycks',
-    'luyen',
-    'luys',
-    'luz&oacute;n',
-    'luz-ardiden',
-    'luz-saint-sauveur',
     'luzar',
-    'luzem',
-    'luzerner',
-    'luzhin',
-    'luzia',
-    'luzii',
-    'luzira',
-    'luzma',
-    'luzuriaga',
-    'luzzasco',
-    'luzzu',
-    'lvg',
-    'lvi.',
-    'lving',
-    'lvls',
-    'lvo',
     'lw-30',
-    'lwbnotupb',
-    'lwc/mwc/uwc',
-    'lwgr',
-    'lwis',
-    'lwithout',
-    'lwowski',
-    'lwra',
-    'lwrs',
-    'lws-25',
-    'lws-40',
-    'lws-40gx',
-    'lwt-down',
-    'lwth',
-    'lwyd',
-    'lwydawc',
     'lwyn',
-    'lwytgoed',
-    'lx&ndash;dkt',
-    'lx&ndash;lxi',
-    'lx-550',
-    'lx-6',
-    'lx-85',
-    'lx-86',
-    'lx-x',
-    'lx1200',
-    'lx200g',
-    'lx300b',
-    'lx32m',
-    'lx400',
-    'lx800',
-    'lx90',
     'lxiii&ndash;lxv',
-    'lxvii',
-    'lxxiiii',
-    'lxxviia',
-    'lxxx',
-    'lxxxiii',
-    'lxxxiv',
-    'lxxxvi',
-    'lxxxvii-viii',
-    'ly\'',
-    'ly-ra-ta',
-    'lyaenidae',
-    'lyall-smith',
-    'lyan',
-    'lyanne',
-    'lyas',
     'lyaschenko',
-    'lybardde',
-    'lybbarde',
-    'lybelle',
-    'lybrand/cork',
-    'lyburn',
-    'lycabettos',
-    'lycabettus',
-    'lycaenids',
-    'lycan',
-    'lycensed',
-    'lych-folk',
-    'lychee-flavoured',
-    'lychnidus',
-    'lycius',
-    'lyclear',
     'lycoming-engined',
-    'lycopene',
-    'lycopersica',
-    'lycophyta',
-    'lycopodiates',
-    'lycopsis',
-    'lycoptera',
-    'lycorea',
-    'lycorys',
-    'lycosidae',
-    'lycosidae/pisauridae',
-    'lycra-control',
-    'lycra-mix',
-    'lycra-top',
-    'lydan/burglary',
-    'lydbrook/forest',
     'lyddiard',
-    'lydekker',
-    'lydian&amp;sharp',
-    'lydiard.',
-    'lydite',
-    'lye-kook',
-    'lyefouk',
-    'lyells',
-    'lyer',
-    'lyes',
-    'lyewood',
-    'lyf',
-    'lyff',
-    'lyght',
-    'lying-',
-    'lying-down',
     'lying-low',
-    'lying_on',
-    'lykabettos',
-    'lykeio',
-    'lykewise',
-    'lykken',
-    'lykourgos',
-    'lyktos',
-    'lyl',
-    'lylehaven',
-    'lylehill',
-    'lyles/coach',
-    'lylsland',
-    'lym',
-    'lyme-disease-carrying',
-    'lymestock',
     'lymhocytes',
-    'lyminge',
-    'lymington-based',
-    'lymington-yarmouth',
-    'lymnaea',
-    'lymnocryptes',
-    'lymphadenectomy',
-    'lymphees',
-    'lympho-granuloma',
-    'lympho-paque',
-    'lympho-reticular',
-    'lymphoctye',
-    'lymphocyte-activation',
-    'lymphocyte/lymphocyte',
-    'lymphocyte/phagocyte',
-    'lymphocyter',
     'lymphocytotoxic',
-    'lymphocytotoxicity',
-    'lymphoedemas',
-    'lymphoedematous',
-    'lymphoma-bearing',
-    'lymphomaniac',
-    'lymphomes',
-    'lymphona',
-    'lympus',
-    'lyn-boss',
-    'lyn-players',
-    'lynall',
-    'lynas/student',
-    'lynce',
-    'lynch-bages',
-    'lynch-blosse',
     'lynch-owned',
-    'lynchborough',
-    'lynchburg',
-    'lynchers',
-    'lynchet',
-    'lynchgate',
-    'lynchian',
-    'lynching-party',
-    'lynchmob',
-    'lyncombe',
-    'lyndah',
-    'lynden-bell',
-    'lyndewode',
-    'lyndo',
-    'lyndon-skeggs',
-    'lyndon/david',
     'lyndwood',
-    'lyneburn',
-    'lynedoch',
-    'lynen',
-    'lynesack',
-    'lyngdal',
-    'lyngsjons',
-    'lynham',
-    'lynhurst',
-    'lynley',
-    'lynmart',
-    'lynn/festival',
-    'lynn/organiser',
-    'lynnes',
-    'lynnfield',
-    'lynnie',
     'lynns',
-    'lynsted',
-    'lynwoods',
-    'lyobands',
-    'lyon&ndash;geneva',
-    'lyon/invest',
-    'lyonesse',
-    'lyonn',
-    'lyonnesse',
-    'lyons-based',
-    'lyons/amateur',
-    'lyons/oxfordshire',
-    'lyonshall/herefordshire',
-    'lyophilate',
-    'lyophilisation',
-    'lyosha',
     'lyphomed',
-    'lyppiatt',
-    'lyrae',
-    'lyre-backed',
-    'lyre-player',
-    'lyre-string',
-    'lyretailed',
-    'lyric-skimming',
-    'lyric-style',
-    'lyric-writers',
-    'lyricae',
-    'lyrical/aria',
-    'lyricized',
-    'lyrico-philosophical',
-    'lyrico-xxxx',
-    'lyrics-on-cards',
     'lyrnan',
-    'lys-his-arg-arg',
-    'lys.',
-    'lys188',
-    'lys197',
-    'lys23\'',
-    'lys52',
-    'lys78',
-    'lysak',
-    'lysanders',
-    'lysarides',
-    'lysdexia',
-    'lysegus',
-    'lyseight',
-    'lysenkoist',
-    'lysergische',
     'lysg',
-    'lysichitum',
-    'lysikles',
-    'lysimachia',
-    'lysine-to-arginine',
-    'lysistrates',
-    'lysocompounds',
-    'lysosome-like',
-    'lysteria',
-    'lysyl',
-    'lysyl-proline',
-    'lysys',
-    'lytchett',
-    'lytes',
-    'lythcott',
-    'lythraceae',
     'lyticus',
-    'lytigius',
-    'lytles',
-    'lytons',
-    'lytteltons',
-    'lyttleeton',
-    'lyttles',
-    'lyttons',
-    'lyttyl',
-    'lyubimov',
-    'lyublyn',
-    'lyublyu',
-    'lyudov',
-    'lyus/in-car',
-    'lyveden',
-    'lyven',
     'lyver',
-    'lywillingun',
-    'lz.95',
-    'lz130',
-    'lzap',
-    'lzh',
-    'lzs',
-    'm&aacute',
-    'm&aacute;c',
-    'm&aacute;irt&iacute;n',
-    'm&aacute;nes',
-    'm&aacute;ori/aperahama',
-    'm&aacute;s',
-    'm&acirc;ch&eacute\'',
-    'm&acirc;che',
-    'm&acirc;cunnais',
     'm&acirc;itresse',
-    'm&agrave;connais',
-    'm&amacr;n&amacr;s',
-    'm&amacr;thichaur',
-    'm&amp;j',
-    'm&amp;r',
-    'm&amp;tis',
-    'm&atilde;e',
-    'm&auml;dler',
-    'm&auml;kel&auml',
-    'm&auml;ki',
-    'm&auml;rchen',
-    'm&auml;rtha',
-    'm&commat;keller',
-    'm&divide;p',
-    'm&dollar',
     'm&dollar;15.54',
-    'm&dollar;25.00',
-    'm&dollar;5.00',
-    'm&eacute',
-    'm&eacute;biame',
-    'm&eacute;d&eacute;cins',
-    'm&eacute;decine',
-    'm&eacute;decins_sans_fronti&egrave;res',
-    'm&eacute;di&eacute;vale',
-    'm&eacute;dia',
-    'm&eacute;diath&egrave;que',
-    'm&eacute;dico',
-    'm&eacute;diocre',
-    'm&eacute;ditations',
-    'm&eacute;diterran&eacute;e\'s',
-    'm&eacute;dous',
     'm&eacute;dusa',
-    'm&eacute;e',
-    'm&eacute;edi&eacute;vale',
-    'm&eacute;erbes',
-    'm&eacute;gret',
-    'm&eacute;haignerie',
-    'm&eacute;haingerie',
-    'm&eacute;langes',
-    'm&eacute;line',
-    'm&eacute;lodie',
-    'm&eacute;morandum',
-    'm&eacute;morial',
-    'm&eacute;n&eacute;hould',
-    'm&eacute;nages',
-    'm&eacute;naka',
-    'm&eacute;nier',
     'm&eacute;nigon',
-    'm&eacute;nilmontant',
-    'm&eacute;pris',
-    'm&eacute;r&eacute;ville-cuckmere',
-    'm&eacute;re',
-    'm&eacute;ribel',
-    'm&eacute;ricourt',
-    'm&eacute;rieux',
-    'm&eacute;taboles',
-    'm&eacute;talanguage',
-    'm&eacute;tamechaniques',
-    'm&eacute;tecine',
-    'm&eacute;teo',
-    'm&eacute;tier.',
-    'm&eacute;tiers',
-    'm&eacute;traux',
     'm&eacute;tronomique',
-    'm&eacute;tropole',
-    'm&eacute;zenc',
-    'm&eacute;zidon',
-    'm&ecaron;ln&iacute;k',
-    'm&ecirc;l&ecirc;e',
-    'm&egrave;tais',
-    'm&iacute&scaron;e&ncaron;sk&aacute',
-    'm&iacute;a',
-    'm&iacute;che&aacute;l',
-    'm&iacute;guez',
-    'm&iacute;le',
-    'm&lsqb;ust&rsqb',
-    'm&mdash;f',
-    'm&mdash;moderate',
-    'm&mdash;n',
     'm&mgr',
-    'm&ndash;10',
-    'm&ndash;de',
-    'm&ndash;n',
-    'm&ndash;y',
-    'm&oacute;squera',
-    'm&oacute;t',
-    'm&ogr',
-    'm&ograve;nica',
-    'm&ograve;r',
-    'm&oslash;re',
-    'm&ouml;glich',
-    'm&ouml;hne',
-    'm&ouml;llendorf',
-    'm&ouml;lzer',
-    'm&ouml;nchen',
     'm&ouml;nchen-gladbach',
-    'm&ouml;nchengladbach',
-    'm&ouml;nchsberg',
-    'm&ouml;ser',
-    'm&ouml;tley',
-    'm&ouml;we-class',
-    'm&sup2',
-    'm&times',
-    'm&uacute&ntilde;oz',
-    'm&uacute;gica',
-    'm&uacute;mia',
-    'm&uacute;sica',
-    'm&ucirc;r',
-    'm&uml;ller',
-    'm&uuml;cke',
-    'm&uuml;eller',
     'm&uuml;ggelheim',
-    'm&uuml;ggelsee',
-    'm&uuml;hlenstube',
-    'm&uuml;hlh&auml;usler',
-    'm&uuml;hlheim',
-    'm&uuml;hltalperle',
-    'm&uuml;koi',
-    'm&uuml;lheimer',
-    'm&uuml;ller-hermann',
-    'm&uuml;ller-ruinart',
-    'm&uuml;nchen-frg',
-    'm&uuml;nchinger',
-    'm&uuml;nich',
-    'm&uuml;nsterplatz',
-    'm&uuml;nzberger',
-    'm&uuml;ssen',
     'm&uuml;tter',
-    'm&yacute;atn',
-    'm&yacute;vatns&ouml;r&aelig;fi',
-    'm&yuml;vatn',
-    'm\'&egrave;st',
-    'm\'a',
-    'm\'accompagner',
-    'm\'affretto',
-    'm\'alister',
-    'm\'ama',
-    'm\'arde',
-    'm\'as-tu-vu',
-    'm\'avez',
-    'm\'ba',
-    'm\'baiki',
-    'm\'bala',
     'm\'beri',
-    'm\'boom',
-    'm\'caig',
-    'm\'car',
-    'm\'cortnick',
-    'm\'dame',
-    'm\'darlin\'',
-    'm\'donald',
-    'm\'eboutou',
-    'm\'ecuse',
-    'm\'excusez',
-    'm\'george',
-    'm\'gimpsey',
-    'm\'gladbach',
-    'm\'guel',
-    'm\'hencha',
     'm\'henni',
-    'm\'hidi',
-    'm\'interrompit',
-    'm\'jn',
-    'm\'konochie',
-    'm\'lady.',
-    'm\'laren',
-    'm\'lords',
-    'm\'love',
-    'm\'m-h',
-    'm\'madzulo',
-    'm\'mukindia',
-    'm\'mwereria',
-    'm\'nicoll',
-    'm\'odiate',
-    'm\'old',
     'm\'reen',
-    'm\'saion',
-    'm\'sieurs',
-    'm\'sleeve',
-    'm\'tavish',
-    'm\'tronix',
-    'm\'uccida',
-    'm\'wife',
-    'm\'y',
-    'm(5)b',
-    'm(chandrasekhar)',
-    'm(di1/dt)',
-    'm(e)',
-    'm(erciorvm)',
-    'm(ille)',
-    'm(issions)',
     'm(m=t)',
-    'm(x-a)',
-    'm********r',
-    'm*a*s*h/everything',
-    'm+5',
-    'm+6',
-    'm+ajor',
-    'm+m',
-    'm-10',
-    'm-101',
-    'm-111',
-    'm-17',
-    'm-19-led',
-    'm-1a2',
-    'm-20',
-    'm-29s',
     'm-3',
-    'm-30',
-    'm-45',
-    'm-47',
-    'm-5',
-    'm-6',
-    'm-60s',
-    'm-700',
-    'm-79',
-    'm-88',
-    'm-9',
-    'm-9s',
-    'm-ary',
-    'm-bits',
-    'm-cresol',
-    'm-cu',
     'm-d',
-    'm-ed',
-    'm-f',
-    'm-f-i',
-    'm-f3690',
-    'm-fix',
-    'm-future',
-    'm-g-j',
-    'm-hm',
-    'm-iii',
-    'm-l-c-k-e-y',
-    'm-laws',
-    'm-m',
-    'm-m-m-m-m-m&mdash',
-    'm-m-m-mandy',
-    'm-m-m-orrissey',
     'm-m-machine',
-    'm-m-matthew',
-    'm-m-mind',
-    'm-m-miss',
-    'm-m-misunderstood',
-    'm-m-movie',
-    'm-m-much',
-    'm-m-must',
-    'm-manners',
-    'm-married',
-    'm-marvellous',
-    'm-memory',
-    'm-met',
-    'm-microlight',
-    'm-monstrous',
-    'm-month',
     'm-more',
-    'm-most',
-    'm-motion',
-    'm-much',
-    'm-net',
-    'm-nf-h',
-    'm-o',
-    'm-o-u-s-e',
-    'm-o-w-s-e',
-    'm-oct-11',
-    'm-oct-2',
-    'm-original',
-    'm-ph',
-    'm-phase',
-    'm-phenylene',
-    'm-power',
     'm-shape',
-    'm-sig',
-    'm-some',
-    'm-state',
-    'm-tenseless',
-    'm-tenses',
-    'm-three',
-    'm-twenty-five',
-    'm-two',
-    'm-u-m',
-    'm-ways',
-    'm-words',
-    'm-x',
-    'm-y',
-    'm-y-y-y',
-    'm-z',
     'm.1c',
-    'm.23d',
-    'm.40',
-    'm.50',
-    'm.6&ndash;235c',
-    'm.a./ed',
-    'm.a.a.f.',
-    'm.a.b.',
-    'm.a.d',
-    'm.a.m',
-    'm.a.r.r.s.',
-    'm.a.s',
-    'm.a.s.h',
-    'm.b.h',
-    'm.bateson',
-    'm.blake',
     'm.c.r./s.c.r.',
-    'm.c.s.p.',
-    'm.c.u.',
-    'm.cazeneuve',
-    'm.chir.',
-    'm.d.j.',
-    'm.d.s',
-    'm.derhalli',
-    'm.dixon',
-    'm.e.d.',
-    'm.e.h.q.',
-    'm.e.t',
-    'm.eng.',
-    'm.exasperatus',
-    'm.f.',
-    'm.f.p.h.m.',
     'm.g.m.',
-    'm.h.',
-    'm.h.k.',
-    'm.hayton',
-    'm.i.\'s',
-    'm.i.6',
-    'm.i.c.k',
-    'm.i.e.e.',
-    'm.i.h.t.',
-    'm.i.l.',
-    'm.i.m.m.',
-    'm.i.m.s.',
-    'm.i.r.a.s.',
-    'm.inst.p.s.',
-    'm.j.a.r.a.',
-    'm.j.s.',
     'm.jean',
-    'm.juris.',
-    'm.l.forster',
-    'm.m',
-    'm.m.p.i.',
-    'm.minot',
-    'm.morgner',
-    'm.o',
-    'm.o.d',
-    'm.o.d.',
-    'm.o.i.',
-    'm.o.match',
-    'm.o.s',
-    'm.o.s.e.',
-    'm.o.t.',
-    'm.o.ts',
     'm.p.a.',
-    'm.p.s.',
-    'm.patel',
-    'm.phil/dip.',
-    'm.pollard',
-    'm.ps',
-    'm.ptashne',
-    'm.r',
-    'm.r.c.p.',
-    'm.r.c.s.',
-    'm.r.d.',
-    'm.r.j.',
-    'm.r.m.',
-    'm.r.t.',
-    'm.s',
-    'm.s.i.l',
     'm.s.i.l.',
-    'm.s.p.',
-    'm.s.r.f.',
-    'm.s.u.',
-    'm.s.w.',
-    'm.sharwood',
-    'm.smith',
-    'm.spicala',
-    'm.st',
-    'm.steed',
-    'm.steinmetz',
-    'm.t.d.',
-    'm.tardieu',
-    'm.v',
-    'm.v.o.',
-    'm.weedall',
     'm.williams',
-    'm.x',
-    'm/',
-    'm/101',
-    'm/2',
-    'm/and',
-    'm/f/h',
-    'm/ft',
-    'm/hr',
-    'm/sec',
-    'm03',
-    'm1&ndash;9',
-    'm1-a1',
-    'm1/70/15/11/5/hl',
-    'm1/a52',
-    'm100()',
     'm1001',
-    'm1020',
-    'm107',
-    'm111',
-    'm116',
-    'm11=hackney',
-    'm12001',
-    'm1219',
-    'm126',
-    'm133',
-    'm13ko7',
-    'm13mp10',
-    'm1500',
-    'm155',
-    'm160',
-    'm162',
     'm165',
-    'm166',
-    'm180',
-    'm1880',
-    'm1889',
-    'm189',
-    'm19-democratic',
-    'm1a2',
-    'm1ne',
-    'm1r',
-    'm2/m2',
-    'm20(uk)',
-    'm200x',
-    'm202',
-    'm20a',
-    'm214',
     'm23/a23',
-    'm25\'s',
-    'm25/m23',
-    'm257',
-    'm268',
-    'm271',
-    'm29',
-    'm2d',
-    'm3030',
-    'm314dd',
-    'm320',
-    'm34839',
-    'm3r',
-    'm4-corridor',
-    'm4-s',
-    'm4/5',
     'm4/berkshire',
-    'm4/m40',
-    'm4/swindon/wiltshire',
-    'm40/m4',
-    'm40/warwickshire',
-    'm4031',
-    'm40c',
-    'm418',
-    'm432',
-    'm44',
-    'm49',
-    'm494tw',
-    'm4plus',
-    'm4pm',
-    'm4t',
-    'm4y',
     'm5(i)',
-    'm5/03',
-    'm5/114',
-    'm5/114.15.12',
-    'm5/50',
-    'm5/m6',
-    'm5/m6/m40',
-    'm50/gloucestershire',
-    'm510',
-    'm51959',
-    'm52062',
-    'm5222',
-    'm55&ndash;73',
-    'm58',
-    'm5j',
-    'm5s',
     'm6-440',
-    'm6-460',
-    'm6/m56',
-    'm60269',
-    'm60s',
-    'm6101',
-    'm6103',
-    'm6105',
-    'm6107',
-    'm6109',
-    'm62-a1',
-    'm64',
-    'm65s',
-    'm6a1',
-    'm7&flat;5',
-    'm7/m6',
     'm70',
-    'm70/m71',
-    'm7b9',
-    'm81326',
-    'm84088',
-    'm85328',
-    'm90s',
-    'm930',
-    'm9303',
-    'm93123',
-    'm94',
-    'm99',
-    'm995',
-    'm99564',
-    'm997',
-    'm=',
     'm=&amp;12345678',
-    'm=0.3',
-    'm=make',
-    'm=motion',
-    'm=t',
-    'm_as_it',
-    'ma&ccaron;va',
-    'ma&dollar;ana',
-    'ma&iacute;lson',
-    'ma&icirc;tresse',
-    'ma&icirc;tris&eacute;e',
-    'ma&racute;thy',
-    'ma\'a',
-    'ma\'aden',
-    'ma\'afu',
-    'ma\'alim',
     'ma\'ams',
-    'ma\'an',
-    'ma\'ase',
-    'ma\'dan',
-    'ma\'dow',
-    'ma\'es',
-    'ma\'lul',
-    'ma\'salaama',
-    'ma(ed)s',
-    'ma-am',
-    'ma-j',
-    'ma-jor',
-    'ma-ray',
-    'ma-y',
-    'ma1',
-    'ma2',
     'maaa-aaaaaaad',
-    'maaaan',
-    'maaaarzipan',
-    'maaargh',
-    'maaarvellous',
-    'maack',
-    'maaike',
-    'maakin',
-    'maale',
-    'maalim',
-    'maamar',
-    'maamen',
-    'maamtrasna',
-    'maan/strathclyde',
-    'maanchessterr',
-    'maars',
     'maartens',
-    'maasberg',
-    'maasey',
-    'maasia',
-    'maass',
-    'maassen',
-    'maassi',
-    'maastricht-friendly',
-    'maastricken',
-    'maasum',
-    'maats',
-    'maazel/emi',
-    'maazel/french',
-    'maazelian',
-    'mab13',
-    'mab419',
     'maban',
-    'mabanaft',
-    'mabb',
-    'mabberley',
-    'mabbot',
-    'mabbs/flood',
-    'mabelingwe',
-    'mabella',
-    'mabelys',
-    'maben',
-    'mabena',
-    'mabgate',
-    'mabie',
-    'mabila',
-    'mabilais',
-    'mabille',
     'mabilles',
-    'mabledon',
-    'maboko/nachola',
-    'mabote',
-    'mabou',
-    'mabp',
-    'mabro',
-    'mabrouk',
-    'mabson',
-    'mabsy',
-    'mabthul',
-    'mabus',
-    'mabuse',
-    'mabuza',
-    'maby',
-    'mac&eacute;doine',
     'mac&rehy;farlane',
-    'mac-',
-    'mac-fan',
-    'mac-gregor',
-    'mac-in-a-box',
-    'mac-leod',
-    'mac-on-unixes',
-    'mac-using',
-    'mac/next',
-    'mac/pc',
-    'mac386',
-    'mac650',
-    'mac659',
-    'maca',
-    'maca-skill',
-    'macabe',
     'macabee',
-    'macaber',
-    'macabrely',
-    'macabrery',
-    'macadams',
-    'macaig',
-    'macaldon',
-    'macaleister',
-    'macalisters',
-    'macallen',
-    'macalpine-downie',
-    'macam',
-    'macanally',
-    'macander',
-    'macanlicada',
-    'macapagal',
     'macapp-based',
-    'macardles',
-    'macari/speaking',
-    'macarie',
-    'macaris',
-    'macaron',
-    'macaronesia',
-    'macaronesian-tropical',
-    'macaronic',
-    'macaronis',
-    'macarr',
-    'macarten',
-    'macarthur/tax',
-    'macarthyism/librarianship',
-    'macas',
-    'macaskills',
     'macau-based',
-    'macaulay\'',
-    'macaulayish',
-    'macavity',
-    'macbeath',
-    'macbeoden',
-    'macbraynes',
-    'macbrides',
-    'macca(2.2)',
-    'macca/speed',
-    'maccalmans',
-    'maccam',
-    'maccartie',
-    'maccartney',
-    'maccassar',
-    'maccavity',
     'maccherozzi',
-    'macchiavelli',
-    'macchis',
-    'macclaren',
-    'maccleod',
-    'macclesfield-born',
-    'macclim',
-    'macconkey',
-    'macconlomaire',
-    'macconnachie',
-    'macconnal',
-    'macconnochie',
-    'macconochie',
-    'maccorkindale',
-    'maccormicki',
-    'maccorquindale',
     'maccready',
-    'maccreanor',
-    'maccresin',
-    'maccullochi',
-    'maccullum',
-    'maccumal',
-    'maccunn',
-    'maccurrencies',
-    'maccutchin',
-    'macd615',
-    'macdill',
-    'macdoland',
-    'macdonaid',
-    'macdonald-ross',
-    'macdonald-the',
-    'macdonald-wright',
     'macdonald/jarryd',
-    'macdonald/labour',
-    'macdonald/office',
-    'macdonald/oxford',
-    'macdonaldite',
-    'macdondald',
-    'macdowal',
-    'macdraft',
-    'macdubhacon',
-    'macduffs',
-    'mace-bearers',
-    'mace-like',
-    'mace/carer',
-    'maceachen',
-    'maceda',
-    'macedoine',
     'macedonia&mdash;presented',
-    'macedonia-slovenia',
-    'macedoniensis',
-    'macedonio',
-    'macedos',
-    'macelli',
-    'macelveen',
-    'macenglish',
-    'macenroe',
-    'maceo',
-    'macerate',
-    'maceration',
-    'macerc',
-    'macevoy',
-    'maceys',
-    'macfadden',
     'macfadyen&mdash;obviously',
-    'macfarland',
-    'macfarlane/author',
-    'macfarlane/oxford',
-    'macfarlene/paediatrician/radcliffe',
-    'macfayden',
-    'macfin',
-    'macfinall',
-    'macfisheries',
-    'macfoy',
-    'macg',
-    'macgabhan',
-    'macgeagh',
-    'macgilchrist',
-    'macgill-eain/sorley',
-    'macgillycuddy',
     'macglone',
-    'macgoldberg',
-    'macgonagall',
-    'macgregor-hunting',
-    'macgregor.',
-    'macgregor/finance',
-    'macgreigor',
-    'mach\'',
-    'mach-70',
-    'mach-for-macs',
-    'mach-on-mac',
-    'mach-u',
-    'mach.70',
-    'mach110',
-    'mach32',
-    'mach355',
     'machair-land',
-    'machakos',
-    'machale',
-    'machali',
-    'machalik',
-    'machamudo',
-    'machas',
-    'machava',
-    'macheen',
-    'machej',
-    'macher',
-    'machester',
-    'machet',
-    'machevo',
-    'machguenga',
-    'machhapuchhare',
     'machiavellians',
-    'machiavellis',
-    'machicolated',
-    'machie',
-    'machien',
-    'machik',
-    'machilid',
-    'machim',
-    'machinability',
-    'machinator',
-    'machine&rehy;like',
-    'machine(s)',
-    'machine-aided',
-    'machine-breaker',
-    'machine-breakers',
-    'machine-chisel',
     'machine-dictated',
-    'machine-drawn',
-    'machine-dug',
-    'machine-feeding',
-    'machine-filling',
-    'machine-finished',
-    'machine-fitter',
-    'machine-independence',
-    'machine-industry',
-    'machine-jostled',
-    'machine-level',
-    'machine-man',
-    'machine-marked',
-    'machine-masters',
-    'machine-nature',
-    'machine-operator',
     'machine-oriented',
-    'machine-paced',
-    'machine-pacing',
-    'machine-pressed',
-    'machine-producing',
-    'machine-room',
-    'machine-selected',
-    'machine-set',
-    'machine-setting',
-    'machine-shop',
-    'machine-smashing',
-    'machine-stitching',
-    'machine-stored',
-    'machine-sustained',
-    'machine-teeth',
-    'machine-tending',
     'machine-time',
-    'machine-tooled',
-    'machine-tutor',
-    'machine-usable',
-    'machine-user',
-    'machine-using',
-    'machine-wave',
-    'machine-with-a-difference',
-    'machine-works',
-    'machine/faxes',
-    'machine/fitness',
-    'machine/system',
-    'machineman',
-    'machinerie',
-    'machinery.',
-    'machinery/equipment',
     'machines.l',
-    'machines/hardware',
-    'machinian',
-    'machino-facture',
-    'machinofacture',
-    'machinological',
-    'machira',
-    'machismo-oriented',
-    'machmeter',
-    'machmud',
-    'machness',
-    'machnik',
-    'machno',
-    'macho-culture',
-    'macho-debunking',
-    'macho-mean-streets',
     'macho-methods',
-    'machobane',
-    'machoman',
-    'machomisogyny',
-    'machon',
-    'machpelah',
-    'machrahanish',
-    'machree',
-    'machs',
-    'macht-wagen',
-    'machteld',
-    'machtmensch',
-    'machwe',
-    'machxl',
-    'macia',
-    'macias',
     'macie',
-    'macierra',
-    'maciet',
-    'macii',
-    'macilroy',
-    'macimo',
-    'macindeor',
-    'macindoe',
-    'macinnes/phoenix',
-    'macintosh&mdash;despite',
-    'macintosh&mdash;sadly',
-    'macintosh&ndash;quadra',
-    'macintosh-compatible',
-    'macintosh-novell',
-    'macintoshs',
-    'macintyre/thames',
     'macintyres',
-    'maciulevicius',
-    'maciunas',
-    'macivor',
-    'macizo',
-    'mackaii',
-    'mackal',
-    'mackaness',
-    'mackay/dennis',
-    'mackay/royal',
-    'mackaye',
-    'mackaypublic',
-    'macked',
-    'mackee',
-    'mackeith/campsfield',
-    'mackems',
     'mackenrode',
-    'mackenzie&ndash',
-    'mackenzie-style',
-    'mackenzie/asylum',
-    'mackenzie/consultant',
-    'mackenzie/solicitor',
-    'mackenzie/women',
-    'mackerdhuj',
-    'mackerel-fishing',
-    'mackerelled',
-    'mackereth',
-    'mackerrell',
-    'mackersey',
-    'mackeson-a',
-    'mackeyi',
-    'mackfaden',
     'mackhurst',
-    'mackid',
-    'mackie/british',
-    'mackie/hereford',
-    'mackinlays',
-    'mackintosh-generics',
-    'mackintosh-ish',
-    'mackintosh-overcoat',
-    'mackintosh/barnardos',
-    'mackintosh/historian',
-    'mackleworth',
-    'macknay',
-    'mackness',
-    'mackney',
-    'macknobb',
-    'macko',
     'mackonochie',
-    'mackowiack',
-    'mackowiak',
-    'mackuandji',
-    'macky',
-    'maclachlans',
-    'maclagan/emeritus',
-    'maclaggan',
-    'maclaines',
-    'macland',
-    'maclane\'s&ndash',
-    'maclane-daine',
-    'maclaren/bushley',
-    'maclaren/crickleyhill',
-    'maclaren/fairford',
-    'maclaren/gloucester',
     'maclaren/mitcheldean',
-    'maclaren/mortimer',
-    'maclaren/silverstone',
-    'maclaren/snowshill',
-    'maclaren/tetbury',
-    'maclaren/ullenwood',
-    'maclaren/wavendon',
-    'maclaren/wollaston',
-    'maclareni',
-    'maclarens',
-    'maclaughlan',
-    'maclaughlin',
-    'maclauren',
-    'maclaverty',
-    'maclayne',
-    'maclays',
     'macle&ograve;id',
-    'maclean/against',
-    'maclean/home',
-    'macleary',
-    'macleavy',
-    'macleish\'',
-    'maclennan/crew',
-    'macleod-clark',
-    'macleod/tewkesbury',
-    'macleodganj',
-    'macliammoir',
-    'maclou',
-    'macloughlin',
-    'maclura',
-    'maclver',
-    'maclyvie',
     'macmahanon',
-    'macmahons',
-    'macmanamon',
-    'macmarneymum',
-    'macmenemy',
-    'macmillan-style',
-    'macmillan.',
-    'macmillanesque',
-    'macmillen',
-    'macmillian',
-    'macmurdo',
-    'macnaghton',
-    'macnair',
-    'macnair-wilson',
-    'macnamee',
-    'macnaughtan',
     'macneal',
-    'macneal-schwendler',
-    'macnessa',
-    'macnissi',
-    'macnott',
-    'macnow-inspired',
-    'macnuggets',
-    'macnuggetts',
-    'macnulties',
-    'maconchy',
-    'macophages',
-    'macoris',
-    'macouba',
-    'macpack',
-    'macpage',
-    'macpheal',
     'macphisto',
-    'macporrit',
-    'macquarrie',
-    'macracanthum',
-    'macracarpa',
-    'macraild',
-    'macrandra',
-    'macreadophile',
-    'macri',
-    'macritchie/president',
-    'macro-approach',
-    'macro-as',
-    'macro-budgetary',
-    'macro-circulation',
-    'macro-concept',
-    'macro-concern',
     'macro-connection',
-    'macro-connectionism',
-    'macro-cycles',
-    'macro-decisions',
-    'macro-effects',
-    'macro-environment',
-    'macro-environmental',
-    'macro-explanation',
-    'macro-geomorphology',
-    'macro-historical',
-    'macro-institutional',
-    'macro-intellectual',
-    'macro-issues',
-    'macro-language',
-    'macro-languages',
-    'macro-management',
     'macro-modules',
-    'macro-molecule',
-    'macro-national',
-    'macro-organization',
-    'macro-oriented',
-    'macro-perspective',
-    'macro-photography',
-    'macro-planning',
-    'macro-policies',
-    'macro-rather',
-    'macro-redistributive',
-    'macro-reductive',
-    'macro-regional',
-    'macro-scenario',
-    'macro-social',
-    'macro-solutions',
     'macro-structural',
-    'macro-structures',
-    'macro-theories',
-    'macro-theory',
-    'macro-to-micro',
-    'macro-world',
-    'macro/micro',
-    'macro/microfungi',
-    'macroalbuminuria',
-    'macrobertson',
-    'macrobicyclic',
-    'macrobrachium',
-    'macrocanthorhyncus',
-    'macrocapacity',
-    'macrocarpa',
-    'macrochirus',
     'macrocoelia',
-    'macrocosms',
-    'macrocycle',
-    'macrocycles',
-    'macrocyles',
-    'macrocystis',
-    'macrocytic',
-    'macrodon',
-    'macrodonia',
-    'macroeconomic/econometric',
-    'macroeconomically',
-    'macroeconomist',
-    'macroeconomlc',
-    'macrofaunas',
-    'macroflora',
-    'macrogenitosomia',
     'macrogeomorphological',
-    'macrognathus',
-    'macrogolum',
-    'macroinvertebrate',
-    'macrolichen',
-    'macroloba',
-    'macromedia',
-    'macromeric',
-    'macromind/paracomp',
-    'macromodel',
-    'macron',
-    'macronectes',
-    'macronis',
-    'macronix',
-    'macronodules',
-    'macronuclear',
     'macroom',
-    'macropalaeontology',
-    'macrophage-colony',
-    'macrophage-like',
-    'macrophage-type',
-    'macrophagesand',
-    'macrophagy',
-    'macrophysiological',
-    'macrophytes',
-    'macrophytic',
-    'macropipus',
-    'macropodidae',
-    'macropolitical',
-    'macroporosity',
-    'macroptera',
-    'macropus',
     'macrorhynchus',
-    'macrorrhizum',
-    'macroscale',
-    'macroscopic-microscopic',
-    'macrosiphuym',
-    'macrosomia',
-    'macrostoma',
-    'macrostructures',
-    'macrosty',
-    'macrosystem',
-    'macrothrix',
-    'macrotidal',
-    'macrourus',
-    'macrovariable',
-    'macrovision-component',
-    'macruari',
     'macruaris',
-    'macruby',
-    'macrura',
-    'macrurus',
-    'macsmythurs',
-    'macspaunday',
-    'macsween',
-    'macswiney',
-    'mactaggert',
-    'mactay',
-    'mactec',
-    'macterin',
-    'macthomais',
-    'macthrifty',
-    'mactophage',
-    'mactro',
     'macuba',
-    'macugnaga',
-    'macularia',
-    'maculinea',
-    'maculipennis',
-    'macumba',
-    'macumeran',
-    'macurdy',
-    'macuser',
-    'macuspana',
-    'macvan',
-    'macvean',
-    'macvey',
-    'macvinish',
-    'macvurrich',
-    'macvyn',
     'macweirdo',
-    'macwhinney',
-    'macwilliam',
-    'mad&eacute;casses',
-    'mad&mdash;i',
-    'mad-dictator',
-    'mad-innocent',
-    'mad-keen',
-    'mad-max',
-    'mad-panic',
-    'mad-scene',
-    'mad-woman',
-    'madaba-dhiban',
-    'madabcd',
-    'madadayo',
-    'madadh',
     'madagasikara',
-    'madagaskira',
-    'madaleen',
-    'madaleine',
-    'madam/sir',
-    'madamba',
-    'madame-',
-    'madamoiselle',
-    'madaule',
-    'madawaska',
-    'madawaska-victoria',
-    'madbouli',
-    'madc',
-    'maddala',
-    'maddan',
-    'madde',
     'madden/folly',
-    'madder-coloured',
-    'maddermarket',
-    'maddern',
-    'maddern/gloucestershire',
-    'madderty',
-    'maddess',
-    'maddies',
-    'maddle',
-    'maddors',
-    'made&mdash;a',
-    'made&mdash;it',
-    'made&mdash;see',
-    'made-easy',
-    'made-for-fittipaldi',
-    'made-for-industry',
     'made-for-television',
-    'made-for-tv',
-    'made-in-england',
-    'made-in-japan',
-    'made-in-the-fifties',
-    'made-over',
-    'made-to',
-    'made-to-moore',
-    'made-wines',
-    'made.n',
-    'made.they',
-    'made/',
-    'made/repaired',
-    'made/surcharges',
-    'made:him',
-    'made_a',
     'made_out',
-    'madecasses',
-    'madechie',
-    'madeirense',
-    'madeiros',
-    'madejski',
-    'madelade',
-    'madeleines',
-    'madelene',
-    'madellin',
-    'mademosielle',
-    'maderaner',
-    'maderna',
-    'maderno',
-    'madest',
-    'madeth',
     'madezhda',
-    'madgalen',
-    'madhubani',
-    'madhuc',
-    'madi-gras',
-    'madida',
-    'madiera',
-    'madigan/un',
-    'madigbe',
-    'madikizela',
-    'madill',
-    'madinah',
-    'madinika',
-    'madinka',
-    'madiran',
-    'madision',
     'madisonian',
-    'madjber',
-    'madjleyoun',
-    'madkeen',
-    'madley/herefordshire',
-    'madm',
-    'madmans',
-    'madmarston',
-    'madness.',
-    'madness/finsbury',
-    'madnesses',
-    'madnick',
-    'madok',
-    'madonna-whore',
-    'madonna/',
-    'madonna/magdalene',
     'madonna/prince',
-    'madonna/warren',
-    'madood',
-    'madorsky',
-    'madoura',
-    'madras-checked',
-    'madrasah',
-    'madrasahs',
-    'madrea',
-    'madregali',
-    'madreporite',
-    'madres',
-    'madresfield',
-    'madri&ntilde&aacute;n',
-    'madrick',
-    'madrid&mdash;valencia',
     'madrid-cordoba-seville',
-    'madrid-la',
-    'madrid-oviedo',
-    'madrid-palencia',
-    'madrid-saragossa-barcelona-french',
-    'madrid-seville',
-    'madrid-valencia',
-    'madrigal-wise',
-    'madrigalicon',
-    'madrigalien',
-    'madrigalisms',
-    'madrigalistico',
-    'madril&egrave;ne',
-    'madrile&ntilde;o',
-    'madrile&ntilde;os',
-    'madrilenos',
     'madriz',
-    'madron',
-    'madsebakke',
-    'madurese',
-    'madya',
-    'madzi',
-    'mae\'n',
-    'mae\'r',
-    'mae-geri',
-    'mae-west',
-    'maea',
-    'maeander',
-    'maeanders',
-    'maecenas',
-    'maecenas-like',
-    'maef',
     'maek',
-    'maekawa',
-    'maekhong',
-    'maelduin',
-    'maelkar',
-    'maelmichael',
-    'maelmore',
-    'maelstroms',
-    'maenadism',
-    'maenas',
-    'maendy',
-    'maenol',
-    'maenor',
-    'maenus',
-    'maenwhile',
-    'maerdref',
     'maerdy',
-    'maere',
-    'maerten',
-    'maertens',
-    'maese',
-    'maeslaan',
-    'maesmawr',
-    'maesnewydd',
-    'maest',
-    'maestag',
-    'maestas',
-    'maestlin',
-    'maestranza',
-    'maestrazgo',
-    'maestricht',
-    'maestrino',
     'maestrone',
-    'maesyrhandir',
-    'maet',
-    'maeyer',
-    'maff-approved',
-    'maff-drawn',
-    'maff-supported',
-    'maffey',
-    'maffick',
-    'mafficking',
-    'mafi',
-    'mafia-busting',
-    'mafia-controlled',
-    'mafia-infested',
-    'mafia-land',
-    'mafia-run',
     'mafia-type',
-    'mafiaintersecting',
-    'mafier',
-    'mafole',
-    'mafrash',
-    'maftir',
-    'mag&eacute',
-    'mag&oacute;n',
-    'mag.ct',
-    'maga&ntilde;a',
-    'maga-',
-    'magadi',
-    'magaine',
-    'magalaes',
-    'magaldi',
-    'magalh&atilde;es',
     'magalkande',
-    'magaly',
-    'magan',
-    'magana',
-    'magangue',
-    'maganja',
-    'magar',
-    'magaret',
-    'magary',
-    'magasin.',
-    'magat',
-    'magatama',
-    'magazine&rehy;so',
-    'magazine-level',
-    'magazine-pages',
-    'magazine.txt',
     'magazine/alfresco',
-    'magazine/good',
-    'magazine/national',
-    'magazine/newspaper',
-    'magazine/sports',
-    'magazineland',
-    'magazines-',
-    'magbag',
-    'magd',
-    'magda-len-sis',
-    'magdalenism',
-    'magdalens',
-    'magdalensburg',
-    'magdalensis',
-    'magdelaine',
-    'magdelenian',
     'maged',
-    'magellanes',
-    'magellanica',
-    'magenis',
-    'magenta-bladed',
-    'magenta-pink',
-    'magenta-splashed',
-    'magerramov',
-    'mageship',
-    'maggay',
-    'maggie.anger',
-    'magginas',
-    'maggiora',
-    'maggot-bearing',
-    'maggot-eater',
-    'maggot-infested',
     'maggot-like',
-    'maggot-tempted',
-    'maggsy',
-    'maghaberry',
-    'magharbi',
-    'maghaweer',
-    'magheramourne',
-    'magheru',
-    'maghn&eacute;eh',
-    'magho',
-    'maghrebi',
-    'maghrebian',
-    'maghrebins',
-    'maghrebis',
-    'maghribi',
-    'magi-blue',
     'magi-glue',
-    'magia',
-    'magic\'',
-    'magic-2',
-    'magic-holder',
-    'magic-man',
-    'magic-rich',
-    'magic-wielding',
-    'magic-wipe',
-    'magic/supernatural',
-    'magicaally',
-    'magical-mythical',
-    'magical-religious',
-    'magicalized',
-    'magically-animated',
-    'magically-induced',
     'magically-sustained',
-    'magically-transparent',
-    'magicalrrealist',
-    'magiced',
-    'magician-like',
-    'magician/',
-    'magicienne',
-    'magiciens',
-    'magicker',
-    'magico',
-    'magico-medical',
-    'magicstation',
-    'magicuts',
-    'magie',
-    'magificent',
-    'magige',
     'magiglo',
-    'magil',
-    'magilton/oxford',
-    'magimix',
-    'magique',
-    'magisch',
-    'magische',
-    'magist',
-    'magistates',
-    'magistrale',
-    'magistrat',
-    'magistrate-father',
-    'magistratura',
-    'magistreates',
-    'magistres',
-    'magistris',
     'magitronic',
-    'maglaj',
-    'maglen',
-    'maglic',
-    'maglione',
-    'magma-chamber',
-    'magma-filled',
-    'magma-like',
-    'magmastatic',
-    'magmoed',
-    'magn&uacute;s',
-    'magn&uacute;ss',
-    'magna-ficent',
-    'magna-series',
-    'magnae',
-    'magnago',
     'magnalia',
-    'magnan',
-    'magnaphall',
-    'magnaphone',
-    'magnard',
-    'magnates/communist',
-    'magnatic',
-    'magnavox',
-    'magnedon',
-    'magner',
-    'magnesia/kg',
-    'magnesians',
-    'magnesite-bound',
-    'magnesium/aluminium',
-    'magnesiums',
-    'magness',
     'magnet-making',
-    'magnet.',
-    'magnetarium',
-    'magnetes',
-    'magneti',
-    'magnetic-field',
-    'magnetic-force',
-    'magnetic-levitation',
-    'magnetic-pickup',
-    'magnetic-spectrometer',
-    'magnetic-spin',
-    'magnetic-storage',
-    'magnetic-strip',
-    'magnetically-confined',
-    'magnetiser',
-    'magnetism.',
     'magnetites',
-    'magnetizer',
-    'magneto-deposition',
-    'magneto-resistive',
-    'magneto-telluric',
-    'magnetograph',
-    'magnetohydrodynamic',
-    'magnetometrics',
-    'magnetoresistive',
-    'magnets-pole',
-    'magnette',
-    'magni-freighters',
-    'magnie',
-    'magnier',
-    'magnification.',
-    'magnifice',
     'magnificenciae',
-    'magnificent-brain',
-    'magnificiently',
-    'magnificus',
-    'magnilens',
-    'magnilenses',
-    'magniloquently',
-    'magniny',
-    'magnis',
-    'magnitogorsk',
-    'magnitudine',
-    'magno',
-    'magnoclamps',
-    'magnoelectricity',
-    'magnolia-painted',
-    'magnovox',
     'magnusson/robert',
-    'magnusstrasse',
-    'mago',
-    'magoda',
-    'magonia',
-    'magoo-like',
-    'magorie',
-    'magowans',
-    'magrar',
-    'magree',
-    'magret',
-    'magrew',
-    'magricalistico',
-    'magrill',
-    'magris',
-    'magritte-like',
     'magritte-type',
-    'magrittian',
-    'magrutsch',
-    'magsi',
-    'maguelone',
-    'maguey',
-    'maguina',
-    'maguindanao',
-    'maguinness',
-    'maguire/chairman/environmental',
-    'maguire/gloucestershire',
-    'maguiresbridge',
-    'magull',
-    'magura',
-    'maguy',
-    'magyan',
     'magyardom',
-    'magyarisation',
-    'magyarok',
-    'magyarpolany',
-    'mah-rye-yah',
-    'maha-yana',
-    'mahabalipuram',
-    'mahabir',
-    'mahabouddha',
-    'mahadeva',
-    'mahadevan',
-    'mahadhi',
-    'mahajan',
-    'mahajan.',
-    'mahajanga',
-    'mahakala',
     'mahale',
-    'mahali',
-    'mahals',
-    'mahamadou',
-    'mahamar',
-    'mahanagar',
-    'maharaj/oxford',
-    'maharajh',
-    'maharan',
-    'maharashta',
-    'mahasangha',
-    'mahatir',
-    'mahatmas',
-    'mahavihar',
-    'mahavir',
-    'mahawk',
     'mahaynodin',
-    'mahaz-i-melli-i-islami',
-    'mahbobollah',
-    'mahboob',
-    'mahbubollah',
-    'mahdav',
-    'mahdi-al-kalisi',
-    'mahdis',
-    'mahdist',
-    'mahele',
-    'mahender',
-    'maheshkali',
-    'maheshwore',
-    'mahia',
-    'mahida',
-    'mahidol',
     'mahimachi',
-    'mahina',
-    'mahinda',
-    'mahir',
-    'mahiro',
-    'mahiyangana',
-    'mahjongg',
-    'mahjub',
-    'mahl',
-    'mahlalengangeni',
-    'mahlathini',
-    'mahlim',
-    'mahlke',
-    'mahlmann',
-    'mahloji',
-    'mahlzeit',
     'mahmah',
-    'mahmedov',
-    'mahmuda',
-    'mahmudiya',
-    'maho',
-    'mahogany-bodied',
-    'mahogany-brown',
-    'mahogany-cased',
-    'mahogany-finish',
-    'mahogany-like',
-    'mahogany-panelled',
-    'mahogany-reinforced',
-    'mahogany-stained',
-    'mahogany-stiffened',
-    'mahogany-there',
-    'mahogany-veneered',
     'mahogany/maple',
-    'mahomeds',
-    'mahometan',
-    'mahommed',
-    'mahommedan',
-    'mahon/united',
-    'mahon/us',
-    'mahone',
-    'mahoney/',
-    'mahonis',
-    'mahood',
-    'mahor',
-    'mahorais',
-    'mahosky',
-    'mahotella',
-    'mahoune',
     'mahr',
-    'mahratta',
-    'mahrattas',
-    'mahrer',
-    'mahroof',
-    'mahrs',
-    'maht',
-    'mahtani',
-    'mahuad',
-    'mahumed',
-    'mahuwa',
-    'mahwali',
-    'mahyendrah',
-    'mai&iuml;stro',
-    'mai&ndash;chiang',
-    'mai&ndash;meo',
     'maia-assisted',
-    'maiano',
-    'maiar',
-    'maibai',
-    'maid-child',
-    'maid-cum-housekeeper',
-    'maid-of-all-work-cum-nursemaid',
-    'maid-turned-chanteuse',
-    'maid/companion',
-    'maidan',
-    'maidbury',
-    'maidcroft',
-    'maiden-aunt',
-    'maiden-head',
-    'maiden-mother',
-    'maidenbower',
     'maidencraig',
-    'maidenform',
-    'maidenform-bra-moulded',
-    'maidenhair-trees',
-    'maidenhead-based',
-    'maidenhead/berkshire',
-    'maidenhead/windsor',
-    'maidenheads',
-    'maidenliness',
-    'maidford-charwelton',
-    'maiding',
-    'maidique',
-    'maidment/champion',
-    'maidment/hit',
-    'maidment/hit-and-run',
-    'maids-in-waiting',
     'maidstone-ashford',
-    'maidstone-based',
-    'maidstone-hastings',
-    'maidstoner',
-    'maidstonian',
-    'maier-maercker',
-    'maiesty',
-    'maif',
-    'maigrait',
-    'maigre',
-    'maigrin',
-    'maijstral',
-    'maiken',
-    'maikovskis',
-    'mail\'',
-    'mail-armoured',
     'mail-bomb',
-    'mail-box',
-    'mail-clad',
-    'mail-enabling',
-    'mail-fisted',
-    'mail-in-offers',
-    'mail-interception',
-    'mail-ordering',
-    'mail-room',
-    'mail-trader',
-    'mail-vans',
-    'mail/e-mail',
-    'mail/marketing',
-    'mail/the',
-    'mailboy',
-    'mailerism',
     'mailes/butcher',
-    'mailes/villager',
-    'mailing:2',
-    'maillac',
-    'maille',
-    'maillefer',
-    'maillet',
-    'maillezais',
-    'mailmen',
-    'mailorder',
-    'mailservers',
-    'mailshotting',
-    'mailsorted',
-    'mailtrain',
-    'mailu',
-    'mailworkspace',
     'maiman',
-    'maimers',
-    'maimings',
-    'maimonudes',
-    'maimorable',
-    'maimouna',
-    'maimuna',
-    'main&rehy;tenance',
-    'main+subsidiary',
-    'main-cabin',
-    'main-chancer',
-    'main-clean',
-    'main-danube',
-    'main-floor',
-    'main-house',
-    'main-memory',
     'main-professional-grade',
-    'main-props',
-    'main-river',
-    'main-stay',
-    'main-store-resident',
-    'main-wheel',
-    'main/former',
-    'mainace',
-    'mainatined',
-    'mainbeam',
-    'mainboard',
-    'mainbochers',
-    'mainbranch',
-    'maincourse',
-    'maindiff',
-    'maines',
     'mainflame',
-    'mainframe-3270',
-    'mainframe-capacity',
-    'mainframe-compatible',
-    'mainframe-computer',
-    'mainframe-driven',
-    'mainframe-esque',
-    'mainframe-killing',
-    'mainframe-oriented',
-    'mainframe-related',
-    'mainframe-specific',
-    'mainframe-type',
-    'mainguet',
-    'mainichi',
-    'mainier',
-    'mainifestations',
     'mainin',
-    'mainland-backed',
-    'mainland-based',
-    'mainlands',
-    'mainliner',
-    'mainlines',
-    'mainly-black',
-    'mainly-muslim',
-    'mainly_because',
-    'mainly_in',
-    'mainmen',
-    'mainobstacle',
-    'mainreachan',
-    'mains\'l',
-    'mains-borne',
-    'mains-communications',
     'mains-connecting',
-    'mains-data-line',
-    'mains-derived',
-    'mains-frequency',
-    'mainsets',
-    'mainsheets',
-    'mainshet',
-    'mainslink',
-    'mainstone',
-    'mainstream-car',
-    'mainstreamer',
-    'mainstreamers',
-    'maintain/improve',
-    'maintainability',
-    'maintaine',
-    'maintained-school',
     'maintenanace',
-    'maintenance&mdash;such',
-    'maintenance-centred',
-    'maintenance-only',
-    'maintenance/',
-    'maintenance/carpenters',
-    'maintenance/inspection',
-    'maintenance/lubrication',
-    'maintenance/odd-job',
-    'maintenance/repair',
-    'maintenance/service',
-    'maintenance/water',
-    'maintence',
-    'maintenir',
-    'maintenue',
-    'maintheme',
     'mainville',
-    'mainwheel',
-    'mainwood',
-    'mainy',
-    'mainz-kastell',
-    'mainz-neustadt',
-    'maion',
-    'maionchi',
-    'maiorano',
-    'maiorem',
-    'maiorescu',
-    'maiori',
-    'maiorum',
-    'maipo',
-    'mairah',
-    'mairian',
     'mairion',
-    'mairoescu',
-    'mairwen',
-    'maisang',
-    'maisby',
-    'maisel',
-    'maishofen',
-    'maiskogel',
-    'maison-fortes',
-    'maisonfort',
-    'maisonrouge',
-    'maisons-',
-    'maisouk',
-    'maisters',
-    'maistlins',
-    'maisto',
     'maitenance',
-    'maitres',
-    'maitrika',
-    'maiwa',
-    'maiweisse',
-    'maize-',
-    'maize-based',
-    'maize-coloured',
-    'maize-growing',
-    'maize-stalks',
-    'maizels',
-    'maizlish',
-    'maizon',
-    'maj-lis',
-    'maj.-general',
-    'maj.gen',
     'maj7&amp;sharp',
-    'maj9',
-    'majacca',
-    'majahual',
-    'majda/polish',
-    'majdanek',
-    'majed',
-    'majel',
-    'majello',
-    'majers',
-    'majestatis',
-    'majeste',
-    'majestical',
-    'majestick',
-    'majestics',
-    'majeure',
     'majewskiinternal',
-    'majhi',
-    'majhola',
-    'majirel',
-    'majirouge',
-    'majithia',
-    'majjal',
-    'majlis-i',
-    'majlisro&gt',
-    'majma-ye',
-    'majmua-ul-baharain',
-    'majo',
-    'majola',
-    'majolo',
-    'major&rehy;domo',
-    'major-',
     'major-cable',
-    'major-category',
-    'major-element',
-    'major-f',
-    'major-g',
-    'major-like',
-    'major-must-go',
-    'major-reynolds',
-    'major-selling',
-    'major-winner',
-    'major-wrecks',
-    'major_cause',
-    'majorcan-style',
-    'majorish',
-    'majorit&eacute',
-    'majoritarian-consensual',
     'majority&rehy;owned',
-    'majority\'',
-    'majority-change-90',
-    'majority-muslim',
-    'majority-ruled',
-    'majority-serbian',
-    'majority423',
-    'majorwatch',
-    'majstey',
-    'majuscules',
-    'mak\'',
-    'maka-b',
-    'makabansa',
-    'makaiwa',
-    'makajima',
-    'makakopi',
     'makala',
-    'makale',
-    'makalla',
-    'makame',
-    'makanji',
-    'makapansget',
-    'makarczyk',
-    'makarezos',
-    'makarii',
-    'makaroupides',
-    'makars',
-    'makarsk&aacute',
-    'makartatos',
-    'makasthien',
-    'makau',
-    'makaweli',
     'makdougall',
-    'make&lsqb;s&rsqb',
-    'make&rehy;or-break',
-    'make\'',
-    'make(s)',
-    'make-\'ere',
-    'make-and-break',
-    'make-and-mend',
-    'make-believing',
-    'make-from',
-    'make-haste-slowly',
-    'make-it-big-quick',
-    'make-it-up-as-you-go-along',
-    'make-itself',
-    'make-the-best-of-it',
-    'make-up-free',
     'make-up-less',
-    'make-up-stained',
-    'make-up-the-numbers',
-    'make-weight',
-    'make-your-mind-up',
-    'make-your-own-cards',
-    'make-your-own-revolution',
-    'make/buy',
-    'make/sell',
-    'make/supply',
-    'make_a',
-    'makecd',
-    'maked',
-    'makedisc',
-    'makedonci',
-    'makedones',
     'makeend',
-    'makel.',
-    'maker-break',
-    'maker/les',
-    'makere',
-    'makerek',
-    'makes/debut',
-    'makest',
-    'makeweights',
-    'makey',
-    'makghatho',
-    'makhachkala',
-    'makhalina',
-    'makhatini',
-    'makhilas',
-    'makhostive',
     'makhou',
-    'makhov',
-    'makilwaine',
-    'makinda',
-    'makindye',
-    'making&rehy;up',
-    'making-do',
-    'making-plans',
-    'making-robots',
-    'making-sniffable',
-    'making/mend',
-    'making/taking',
-    'making_a',
-    'makink',
-    'makkabaerbuch',
-    'makkah',
     'maklakov',
-    'makoff',
-    'makossa',
-    'makouti',
-    'makovsk&yacute',
-    'makowecz',
-    'makowski',
-    'makram-ebeid',
-    'makramallah',
-    'makri',
-    'makridakis',
-    'makrigialos',
-    'makromolekulare',
-    'makron',
-    'makroteichos',
-    'maks',
     'maksimov',
-    'maksimych',
-    'maktowm',
-    'maktowms',
-    'makueni',
-    'makulla',
-    'makum',
-    'makura',
-    'makut',
-    'makuti',
-    'makweto',
-    'makyng',
-    'mal&iacute&rcaron&uring',
-    'mal-administration',
-    'mal-de-mer',
-    'mal-practice',
     'mala-bloody-ga',
-    'mala-fantasies',
-    'malaba',
-    'malabaricus',
-    'malabars',
-    'malacaang',
-    'malaccans',
-    'malaccensis',
-    'malachians',
-    'malacoides',
-    'malacological',
-    'malacology',
-    'maladjustive',
-    'maladministrations',
-    'maladoum',
-    'maladroitly',
     'malag&oacute;n',
-    'malagasy/monima',
-    'malahat',
-    'malai-issue',
-    'malaianus',
-    'malainine',
-    'malaita',
-    'malakai',
-    'malakoff',
-    'malaleuca',
-    'malandra',
-    'malandro',
-    'malangs',
-    'malanszak',
-    'malapowski',
-    'malapropic',
     'malapterurus',
-    'malaret',
-    'malaria-infected',
-    'malaria-related',
-    'malaria-transmitting',
-    'malaria/aids',
-    'malarian',
-    'malariological',
-    'malariologist',
-    'malarmie',
-    'malartan',
-    'malas',
-    'malashenko',
-    'malathion-resistant',
-    'malay-dominated',
-    'malay-korean',
     'malayer',
-    'malaysia/singapore',
-    'malaysian-born',
-    'malaysian-built',
-    'malaysian-french',
-    'malaysian-korean',
-    'malaysian-made',
-    'malaysian-yugoslav',
-    'malbak',
-    'malbern',
-    'malbou',
-    'malby',
-    'malcase',
-    'malchus',
-    'malcic',
-    'malcky',
     'malcolm/racial',
-    'malcolmm',
-    'malcom/director',
-    'malcoms',
-    'malconditions',
-    'malcontented',
-    'malcorps',
-    'malcovich',
-    'malcy',
-    'malderton',
-    'maldevelopment',
-    'maldin',
-    'maldistributed',
-    'maldives/sri',
-    'maldivica',
-    'maldoum',
     'maldoun',
-    'maldred',
-    'maldredssons',
-    'male&rehy;dominated',
-    'male&rehy;female',
-    'male\'s',
-    'male-appropriate',
-    'male-as-norm',
-    'male-audience',
-    'male-bashing',
-    'male-brooding',
-    'male-chauvinist',
-    'male-chauvinistic',
-    'male-controlled',
-    'male-counterpart',
-    'male-derived',
     'male-domination',
-    'male-employing',
-    'male-formulated',
-    'male-friendly',
-    'male-group',
-    'male-headed',
-    'male-inspired',
-    'male-line',
-    'male-mediated',
-    'male-pattern',
-    'male-rich',
-    'male-servicing',
-    'male-sounding',
-    'male-supervised',
-    'male-supremacist',
-    'male-talk',
     'male-type',
-    'male-worked',
-    'male-y-chromosome',
-    'male/public',
-    'male/white',
-    'maleate',
-    'malecki',
-    'maleckis',
-    'malecon',
-    'maleczek',
-    'maledetta',
-    'maledetto',
-    'maledicta',
-    'malee',
-    'malefaction',
-    'malefactions',
     'malefactoribus',
-    'maleffect',
-    'malefica',
-    'malefices',
-    'malefijt',
-    'malegato',
-    'maleic',
-    'malejovsk&yacute',
-    'malekat',
-    'maleldil',
-    'malenbaum',
-    'malene',
-    'malenko',
-    'maler',
-    'malereachly',
-    'malerische',
     'malers',
-    'males(18-23)',
-    'males:females',
-    'maleski',
-    'maleta',
-    'maletable',
-    'maletar',
-    'malevolance',
-    'malevolen',
-    'malevolences',
-    'malew',
-    'malfeasances',
-    'malfiance',
-    'malfin',
-    'malfomation',
-    'malford',
     'malg',
-    'malgas',
-    'malgonkar',
-    'malgood',
-    'malgorzata',
-    'malgosian',
-    'malgre',
-    'malgudi',
-    'malhabile',
-    'malhal',
-    'malham-dale',
-    'malherbes',
-    'malherbie',
-    'mali-niger-libya',
-    'malibonlwe',
-    'malic',
     'malice-rating',
-    'malices',
-    'malich',
-    'malicious-looking',
-    'malicious.',
-    'malielegaoifinance',
-    'maligalig',
-    'maligawa',
-    'malignent',
-    'malignly',
-    'malik-noor',
-    'maliki',
-    'malinche',
-    'malinee',
-    'malini',
-    'malinin',
     'malinoff',
-    'malinovskiy',
-    'malinow',
-    'malinowshi',
-    'malinowskian',
-    'malinski',
-    'malita',
-    'maliza',
-    'maljers',
-    'malk',
-    'malkele',
-    'malkin/rhodes',
-    'malkit',
-    'malkowich',
-    'malla',
-    'mallabar',
     'mallampati',
-    'mallaret',
-    'mallarm',
-    'mallart',
-    'mallee-root',
-    'maller',
-    'mallerin',
-    'mallery',
-    'mallet-prevost',
-    'mallet-stevens',
-    'mallet.',
-    'malletier',
-    'malleting',
-    'malliaris',
-    'mallic',
-    'mallica',
     'mallika',
-    'mallikarjun',
-    'mallimarachchi',
-    'mallinckrodt',
-    'mallinson/glider',
-    'mallinson/pharmaceutical',
-    'mallobaudes',
-    'malloreddus',
-    'malloum',
-    'mallya',
-    'malm&eacute;dy',
-    'malman',
-    'malmberget',
-    'malmesbury/wiltshire',
-    'malmgreen',
-    'malmsheim',
     'malmsten',
-    'malocclusion',
-    'malodialdehyde',
-    'malodorants',
-    'maloja-on',
-    'malolitrazowych',
-    'maloma',
-    'malonamide',
-    'malones',
-    'maloney/manager',
-    'malonovski',
-    'maloprim',
-    'malory-like',
-    'malory-towers-swallows-and-amazons',
-    'malosse',
-    'malostransk&yacute',
     'malous',
-    'maloy',
-    'malpensa',
-    'malperformance',
-    'malphighian',
-    'malpigi',
-    'malsain',
-    'malsomething',
-    'malt-loaf',
-    'malt-milling',
-    'malt-sacks',
-    'malt-vats',
-    'malta&ndash;gibraltar',
-    'malta-based',
-    'malta-destined',
-    'maltas',
     'maltase',
-    'maltby.',
-    'maltbyish',
-    'malteaser',
-    'malted-milk',
-    'malter',
-    'maltese-owned',
-    'malthouses',
-    'malties',
-    'maltin',
-    'maltings.',
-    'maltlake',
-    'maltodextrin',
-    'malton-based',
-    'maltose',
-    'maltpacker/cleaners',
     'maltreating',
-    'malty-sour',
-    'maltzman',
-    'maluf',
-    'malukutila',
-    'malva',
-    'malvaceae',
-    'malvagna',
-    'malvern-based',
-    'malvern.over',
-    'malvernian',
-    'malviflorum',
-    'malvillan',
-    'malvolti',
-    'malyali',
-    'malynkis',
     'malzacher',
-    'malzard',
-    'mam&aacute',
-    'mam\'zelle',
-    'mama\'',
-    'mama-terribly',
-    'mamadayez',
-    'mamadon',
-    'mamah',
-    'mamakaslos',
-    'mamalik-ul-amsar',
-    'mamaluna',
-    'mamame',
-    'mamand',
-    'mamarev',
-    'mamatsashvili',
     'mambila',
-    'mambour',
-    'mamdou',
-    'mamdudur',
-    'mame',
-    'mamelles',
-    'mameluks',
-    'mamertina',
-    'mametz',
-    'mameys',
-    'mamiko',
-    'mamillary',
-    'mamillius',
-    'maminski',
-    'mamita',
-    'mammae',
     'mammal-reptiles',
-    'mammalogists',
-    'mammals(2)',
-    'mammari',
-    'mammas',
-    'mammele',
-    'mammen',
-    'mammerial',
-    'mammern',
-    'mammie',
-    'mammillary',
-    'mammisi',
-    'mammology',
-    'mammonite',
-    'mammoth-hunter',
-    'mammoth-length',
     'mammut',
-    'mammuthus',
-    'mammy\'',
-    'mamn',
-    'mamoh',
-    'mamona',
-    'mamor',
-    'mamoties',
-    'mamou',
-    'mamphela',
-    'mampy',
-    'mamrak',
-    'mamy',
-    'man&eacute;-er-hroek',
-    'man&mdash',
-    'man&mdash;he',
     'man&mdash;looked',
-    'man&ndash;ape',
-    'man&ndash;machine',
-    'man&rehy;power',
-    'man&rehy;snake',
-    'man\'ger',
-    'man\'s-style',
-    'man-\'scared',
-    'man-21',
-    'man-about',
-    'man-aged',
-    'man-air',
-    'man-altered',
-    'man-and&rehy;child',
-    'man-and-dog',
-    'man-bats',
     'man-bird',
-    'man-bound',
-    'man-bull',
-    'man-centred',
-    'man-centredness',
-    'man-centuries',
-    'man-chester',
-    'man-children',
-    'man-crazy',
-    'man-created',
-    'man-damaged',
-    'man-decades',
-    'man-dog',
-    'man-enough',
-    'man-faced',
-    'man-freely',
     'man-friday-print',
-    'man-friend',
-    'man-gathered',
-    'man-gets-girl',
-    'man-godhood',
-    'man-greedy',
-    'man-haters',
-    'man-hattan',
-    'man-he',
-    'man-high',
-    'man-holes',
-    'man-horse',
-    'man-horses',
-    'man-hours/days',
-    'man-in-a-pub',
-    'man-in-charge',
     'man-in-him',
-    'man-in-the-middle',
-    'man-in-the-moon',
-    'man-infestation',
-    'man-inspired',
-    'man-invented',
-    'man-killing',
-    'man-less',
-    'man-lifting',
-    'man-manage',
-    'man-manager',
-    'man-manipulated',
-    'man-marked',
-    'man-marker',
-    'man-midwife',
-    'man-milliners',
     'man-ness',
-    'man-of-straw',
-    'man-of-the-pre-match',
-    'man-of-the-series',
-    'man-of-today',
-    'man-on-man',
-    'man-on-the-go',
-    'man-orientated',
-    'man-oriented',
-    'man-owned',
-    'man-pleaser',
-    'man-powered',
-    'man-proof',
-    'man-prowl',
-    'man-rem',
-    'man-s',
     'man-scent',
-    'man-servants',
-    'man-set',
-    'man-shadow',
-    'man-show',
-    'man-slayer',
-    'man-smelling',
-    'man-stalker',
-    'man-stealer',
-    'man-stealing',
-    'man-subduing',
-    'man-the',
-    'man-the-instrument',
-    'man-traps',
-    'man-trundling',
-    'man-type',
     'man-up',
-    'man-was',
-    'man-welcoming',
-    'man-witch',
-    'man-worship',
-    'man.and',
-    'man.but',
-    'man.hovis',
-    'man.i',
-    'man.no',
-    'man.the',
-    'man.who',
-    'man/89/141',
-    'man/89/157',
-    'man/and',
-    'man/ape',
     'man/bridesmaids',
-    'man/chimpanzee',
-    'man/cliff-from-',
-    'man/computer',
-    'man/dolphin',
-    'man/environment',
-    'man/fertile/infertile/a',
-    'man/hard',
-    'man/loose',
-    'man/madman',
-    'man/mankind',
-    'man/shift',
-    'man/who',
-    'man/years',
-    'man:new',
-    'man=author',
     'manacca',
-    'manacling',
-    'manades',
-    'manadgement',
-    'manadon',
-    'manafi',
-    'manafucturing',
-    'manag&rehy;ing-director',
-    'managament',
-    'manage\'',
-    'manage-',
-    'manage-touts',
-    'managed.',
-    'managed_a',
-    'managem',
-    'management*',
     'management-',
-    'management-babble',
-    'management-biased',
-    'management-board',
-    'management-brainwashed',
-    'management-by-agreement',
-    'management-care',
-    'management-consultancy',
-    'management-controlled',
-    'management-development',
-    'management-information',
-    'management-minded',
-    'management-remuneration',
-    'management-swindling',
-    'management-to-minerals',
-    'management-workforce',
     'management.employee',
-    'management.examination',
-    'management.they',
-    'management/',
-    'management/administration',
-    'management/arcade',
-    'management/archives',
-    'management/artist',
-    'management/career',
-    'management/control',
-    'management/designing',
-    'management/finance',
-    'management/organisational',
-    'management/personnel',
-    'management/union',
-    'management/worker',
     'managemental',
-    'managemnet',
-    'manager\'',
-    'manager\'ud',
-    'manager+',
-    'manager-bureaucrats',
-    'manager-entrepreneurs',
-    'manager-in-chief',
-    'manager-international',
-    'manager-only',
-    'manager-owner',
-    'manager-team',
-    'manager-to-manager',
-    'manager-type',
-    'manager.but',
-    'manager/archivist',
     'manager/artist',
-    'manager/calendar',
-    'manager/chairman',
-    'manager/coach',
-    'manager/cook',
-    'manager/employer',
-    'manager/honda',
-    'manager/key',
-    'manager/man',
-    'manager/manageress',
-    'manager/mvs',
-    'manager/my',
-    'manager/nominated',
-    'manager/oxfam',
-    'manager/partner',
-    'manager/principal&ndash;employee/agent',
     'manager/proprietors',
-    'manager/randolph',
-    'manager/researcher',
-    'manager/shareholders',
-    'manager/warden',
-    'manager0',
-    'manager_at',
-    'manager_in',
-    'manageress0',
-    'managerial/',
-    'managerial/specialist',
-    'managerially-directed',
-    'managerials',
-    'managering',
-    'managerless',
-    'managers-get',
     'managers-in-the-making',
-    'managers/employers',
-    'managers/owners',
-    'managers/supervisors',
-    'managh',
-    'managin\'',
-    'managing&rehy;director',
-    'managing-owner',
-    'manahans',
-    'manaia',
-    'manal',
-    'manalula',
-    'manam',
-    'manandhar',
-    'manange',
-    'mananger',
     'manangers',
-    'mananny',
-    'manants',
-    'manaresi',
-    'manarov',
-    'manasa',
-    'manases',
-    'manasevich',
-    'manasik',
-    'manasir',
-    'manaso',
-    'manasse',
-    'manasses',
-    'manasty',
-    'manat=10',
-    'manavendra',
     'manavi',
-    'manayenkov',
-    'manbaa',
-    'manbu',
-    'manburon',
-    'manc-y',
-    'manc/arse/pool',
-    'manc/baggy',
-    'mancehster',
-    'mancetter-hartshill',
-    'manch',
-    'manchago',
-    'mancheng',
-    'manches',
-    'manchester-blackpool',
-    'manchester-bury',
     'manchester-crewe',
-    'manchester-london',
-    'manchester-salford',
-    'manchester-sheffield',
-    'manchester-sheffield/wath',
-    'manchester-southport',
-    'manchester/',
-    'manchester/acid/rave',
-    'manchester/paris',
-    'manchestered',
-    'manchesterism',
-    'manchesters',
-    'manchete',
-    'manchicourt',
-    'manchip',
-    'mancino',
     'mancipia',
-    'manclark',
-    'mancowitz',
-    'mancsters',
-    'mancub',
-    'mandalay&ndash;heho&ndash;taunggyi',
-    'mandalong',
-    'mandan-hidatsa',
-    'mandani',
-    'mandanus',
-    'mandarin-collar',
-    'mandarin-like',
-    'mandarin-speaking',
-    'mandarinfish',
-    'mandat',
-    'mandat-grancey',
     'mandataires',
-    'mandate.',
-    'mandativu',
-    'mandatoriness',
-    'mandays',
-    'mandaza',
-    'mandeans',
-    'mandela-buthelezi',
-    'mandelay',
-    'mandelbrot-plotting',
-    'mandelbrote',
-    'mandelieu-la',
-    'mandelker',
-    'mandelkern',
-    'mandements',
-    'mander/drama',
     'mandera',
-    'mandera/kenya',
-    'manderson/age',
-    'manderson/mother',
-    'mandevelle',
-    'mandevill',
-    'mandeville.',
-    'mandeville/aylesbury',
-    'mandeville/northamptonshire',
-    'mandible-like',
-    'mandich',
-    'mandie',
-    'mandikova',
-    'mandinka',
-    'mandjak',
-    'mandji',
     'mandlate',
-    'mandlebrot-plotting',
-    'mandocellos',
-    'mandola',
-    'mandolin.',
-    'mandolina',
-    'mandolines',
-    'mandora',
-    'mandrakes',
-    'mandraki',
-    'mandrax',
-    'mandrels',
-    'mandrian',
-    'mandril',
-    'mandrill',
-    'mandrills',
     'mandu',
-    'manduca',
-    'manduell',
-    'mandys',
-    'mane-like',
-    'maneaters',
-    'maneating',
-    'manechildis',
-    'manege',
-    'manekbai',
-    'manelis',
-    'manent',
-    'maneouvres',
-    'maneouvrings',
-    'maneoverability',
-    'maneovre',
     'maner',
-    'maners',
-    'manesse',
-    'manetti',
-    'maneuverability',
-    'maneuvered',
-    'maney',
-    'manfalut',
-    'manford',
-    'manfredi',
-    'manfredonia',
-    'manfrini',
-    'mangaing',
-    'manganate',
-    'manganese(ii)',
-    'manganese-',
     'manganese-53',
-    'manganese-aluminium-carbon',
-    'manganiferous',
-    'mangazeyev',
-    'mangeant',
-    'mangel-wurzel',
-    'mangelwurzels',
-    'manger.',
-    'mangership',
-    'mangersta',
-    'manghutt',
-    'mangiamo',
-    'mangifera',
-    'mangione',
-    'mangkalaviraj',
-    'mangler',
     'manglish',
-    'manglou',
-    'mangly',
-    'mangoldt',
-    'mangole',
-    'mangone',
-    'mangos',
-    'mangoustine',
-    'mangraphique',
-    'mangrove-bound',
-    'mangueira',
-    'mangurian',
-    'mangwana',
-    'mangwane',
-    'manhandles',
-    'manhasset',
     'manhattan-based',
-    'manhattan-english',
-    'manhattan-hartsdale',
-    'manhattan-like',
-    'manhattanisation',
-    'manhattanites',
-    'manhattans',
-    'manhattanville',
-    'manhede',
-    'manhica',
-    'manhilad',
-    'manhire',
-    'manhold',
-    'manhole-covers',
-    'manhood\'',
-    'manhoods',
     'manhour',
-    'manhunts',
-    'maniac\'',
-    'maniac-haunted',
-    'maniakis',
-    'maniatt',
-    'manic-satyric',
-    'manicamp',
-    'manichaeans',
-    'manichaeus',
-    'manichees',
-    'manichordions',
-    'manickpore',
-    'manicou',
-    'maniculatus',
-    'manicure/pedicure',
     'manicurist.',
-    'manie',
-    'manier',
-    'manifattura',
-    'manifest_in',
-    'manifolding',
-    'manifoldness',
-    'manika',
-    'manikas',
-    'manikins.',
-    'manilan',
-    'manilius',
-    'manilla-bound',
-    'manillas',
-    'manin',
-    'manina',
     'maningning',
-    'maninique',
-    'maninski',
-    'maniola',
-    'manion',
-    'maniot',
-    'maniots',
-    'maniovskaya',
-    'manip',
-    'manip&rehy;ulated',
-    'maniple',
-    'manipogo',
-    'manipulatives',
-    'manipuri',
-    'manis',
-    'manitarian',
     'manitas',
-    'manitoban',
-    'manitui',
-    'manix',
-    'manja',
-    'manjack',
-    'manjantja',
-    'manjil',
-    'manjit',
-    'mankaba',
-    'mankan',
-    'mankelow',
-    'mankey',
-    'mankiller',
-    'mankind-s',
-    'mankinen',
     'manktelow',
-    'mankuba',
-    'mankwe',
-    'manlaughter',
-    'manless',
-    'manley/stud',
-    'manlier',
-    'manlift',
-    'manlis',
-    'manly-sized',
-    'manmetric',
-    'manmountain',
-    'mann-whitney-white',
-    'mann/chairman',
-    'mann/mother',
-    'mann/speaking',
     'mann/staff',
-    'mann/west',
-    'mannafields',
-    'mannager',
-    'mannamead',
-    'mannan',
-    'mannari',
-    'mannekin',
-    'manner&mdash;in',
-    'manner--prompting',
-    'manner-in',
-    'manner-of-being',
-    'manner-to-be',
-    'manner7',
-    'mannerians',
-    'mannerless',
     'mannerlessly',
-    'manners.',
-    'manners/director',
-    'manners/warden',
-    'mannesi',
-    'manneville',
-    'mannhardt',
-    'mannheim-paris',
-    'manniagment',
-    'mannikizing',
-    'mannin',
-    'manning/oxfordshire',
-    'manning/team',
-    'mannish-acting',
-    'mannishness',
-    'mannix',
     'mannlicher',
-    'manno',
-    'mannon',
-    'mannoni',
-    'mannose-resistant',
-    'mannosylation',
-    'mannosylq',
-    'mannotched',
-    'mannucci',
-    'mannunda',
-    'mannys',
-    'mano&eacute;4uvres',
-    'manoah',
-    'manobhai',
-    'manodopera',
-    'manoeuverability',
     'manoeuverable',
-    'manoeuvering',
-    'manoeuvr&rehy;ability',
-    'manoeuvres-the',
-    'manoeuvres.',
-    'manoeuvring-the',
-    'manoevrings',
-    'manoevroes',
-    'manogaran',
-    'manoirs',
-    'manoji',
-    'manole',
-    'manoli',
-    'manometers',
-    'manometrical',
-    'manorcunningham',
     'manordock',
-    'manorhamilton',
-    'manorialization',
-    'manorians',
-    'manorlet',
-    'manosque',
-    'manouchar',
-    'manouche',
-    'manoucher',
-    'manouevre',
-    'manouvering',
-    'manphibian',
-    'manpie',
-    'manpower-intensive',
-    'manpower/patient',
-    'manprop',
     'manq',
-    'manqu&eacute;s',
-    'manquement',
-    'mans-racer-style',
-    'mans-winning',
-    'mans.',
-    'mansaka',
-    'mansarde',
-    'mansell-mania',
-    'mansell-moullin',
-    'mansell/david',
-    'mansell/herefordshire',
-    'mansell/parents',
-    'manselle',
-    'mansellmania',
-    'manseng',
     'mansers',
-    'mansfeld-fondi',
-    'mansfelds',
-    'mansfield/travel',
-    'mansfields',
-    'mansford',
-    'manshaped',
-    'manshead',
-    'mansheed',
-    'mansheit',
-    'manshops',
-    'mansing',
-    'mansion&rehy;type',
-    'mansion\'',
-    'mansion-block',
-    'mansion-like',
     'mansion-studded',
-    'mansion.',
-    'mansionses',
-    'mansit',
-    'manslaute',
-    'manslughter',
-    'manso',
-    'mansolu',
-    'manson/',
-    'manson/family',
-    'manstein',
-    'manstowe',
-    'mansuri-yah',
-    'mantalinis',
-    'mantanuku',
-    'mantaring',
     'mantchester',
-    'manteaux',
-    'mantegazzianum',
-    'mantegnas',
-    'manteigas',
-    'mantel-clock',
-    'mantel-haenszel-peto',
-    'mantel-heinzel',
-    'mantel-shelf',
-    'mantelclock',
-    'mantelli',
-    'mantelow',
-    'mantels',
-    'mantelshelves',
-    'mantenimiento',
-    'manthorpe/principal',
     'mantidae',
-    'mantiger',
-    'mantikroz',
-    'mantiri',
-    'mantis-green',
-    'mantis-like',
-    'mantispidae',
-    'mantix',
-    'mantle-boxes',
-    'mantle-crust',
-    'mantle-like',
-    'mantle-melt',
-    'mantle-mines',
-    'mantlepieces',
-    'mantong',
-    'mantrah',
     'mantree',
-    'mantronik',
-    'mantua-maker',
-    'mantua-making',
-    'mantuamakers',
-    'manu&rehy;facture',
-    'manu&rehy;factured',
-    'manual&mdash;or',
-    'manual\'/',
-    'manual(s)',
-    'manual-job',
-    'manual-response',
-    'manual.doc',
-    'manual/',
-    'manual/computer',
-    'manuale',
     'manualist',
-    'manually-adjusted',
-    'manually-digitized',
-    'manually-drawn',
-    'manually-produced',
-    'manubhai',
-    'manueli',
-    'manueline-style',
-    'manuelito',
-    'manuella',
-    'manuelle',
-    'manufac',
-    'manufac&rehy;turer',
-    'manufact',
-    'manufactorys',
-    'manufactuers',
     'manufactur&rehy;ing',
-    'manufacturability',
-    'manufactured-goods',
-    'manufacturer&mdash;and',
-    'manufacturer\'',
-    'manufacturer-cheap',
-    'manufacturer-meets-customer',
-    'manufacturer-retailer',
-    'manufacturer-supplied',
-    'manufacturer-trained',
-    'manufacturer.',
-    'manufacturer/publisher',
-    'manufacturer/supplier',
-    'manufacturers/retailers',
-    'manufacturers/wholesalers',
-    'manufactureys',
     'manufacturing-cum-service',
-    'manufacturing-development',
-    'manufacturing-led',
-    'manufacturing-related',
-    'manufacturing-service',
-    'manufacturing.',
-    'manufacturing/assembly',
-    'manufacturing/office/storage',
-    'manufacturing/service',
-    'manufactury',
-    'manufaktur',
-    'manufatcturers',
-    'manuilski',
-    'manuilskii',
-    'manuilsky',
-    'manuka',
     'manumittat',
-    'manunsure',
-    'manure-encrusted',
-    'manure-spreading',
-    'manuscript&rehy;script',
-    'manuscript(s)',
-    'manuscrit',
-    'manushi',
-    'manuy',
-    'manv',
-    'manvantara',
-    'manville\'s-lips',
-    'manweeks',
-    'manwood',
-    'manx-registered',
-    'manxman',
     'manxome',
-    'many&rehy;sidedness',
-    'many-arched',
-    'many-body',
-    'many-centred',
-    'many-coated',
-    'many-dimensioned',
-    'many-eyed',
-    'many-faced',
-    'many-finned',
-    'many-fold',
-    'many-formed',
-    'many-hued',
-    'many-hundred',
-    'many-legged',
-    'many-levelled',
     'many-mirrored',
-    'many-ones',
-    'many-partedness',
-    'many-party',
-    'many-personed',
-    'many-petalled',
-    'many-pocketed',
-    'many-segmented',
-    'many-shaped',
-    'many-sidedness',
-    'many-steepled',
-    'many-stranded',
-    'many-tailed',
-    'many-tasting',
-    'many-tentacled',
-    'many-tiered',
     'many-times',
-    'many-times-great',
-    'many-times-severed',
-    'many-to-',
-    'many-valued',
-    'many-worlds',
-    'many.in',
-    'many/few',
-    'manyara&ndash;serengeti',
-    'manycopies',
-    'manyeli',
-    'manyika',
-    'manykay',
-    'manyo',
-    'manyoni',
-    'manythings',
     'manz&oacute',
-    'manz&uacute',
-    'manzanares',
-    'manzanita',
-    'manzer',
-    'manziken',
-    'manzikert',
-    'manzinilla',
-    'manzonian',
-    'manzouri',
-    'mao-ist',
-    'mao-style',
-    'mao-suited',
-    'mao-tse-tung',
-    'maoisms',
-    'maoist-style',
     'maoista',
-    'maolle',
-    'maos',
-    'maoten',
-    'maou-ching-we',
-    'maouri',
-    'maowm',
-    'maown',
-    'map-2',
-    'map-based',
-    'map-case',
-    'map-cases',
-    'map-compatible',
-    'map-covered',
-    'map-engraver',
-    'map-guided',
     'map-ml',
-    'map-out',
-    'map-pins',
-    'map-plotting',
-    'map-pocket',
-    'map-pouches',
-    'map-printers',
-    'map-rap',
-    'map-read',
-    'map-reading.',
-    'map-reference',
-    'map-scale-dependent',
-    'map-seller',
-    'map-sheets',
-    'map-stretch',
-    'map-table',
     'map-to-image',
-    'map-to-read',
-    'map-users',
-    'map-using',
-    'map123',
-    'map2',
-    'mapai',
-    'mapangou',
-    'mapantsula',
-    'mapbasic',
-    'mapcon',
-    'mapdry',
-    'mapeldre',
-    'mapelson',
-    'mapena',
-    'mapered',
     'maperton',
-    'mapfumo',
-    'mapgies',
-    'mapheleba',
-    'maphis',
-    'maphumulo',
-    'mapi-compliant',
-    'mapie',
-    'maple-boarded',
-    'maple-necked',
-    'maple-strewn',
-    'maple-top',
-    'maple-topped',
-    'maple-veneered',
-    'maple-wood',
-    'maple/half',
     'mapled',
-    'mapleson',
-    'maplesone',
-    'maplestead',
-    'maplesyrup',
-    'maplet',
-    'maplins',
-    'mapmaking',
-    'mapole',
-    'mapoma',
-    'maponus',
-    'mapopa',
-    'mapped&rehy;out',
-    'mapping/',
-    'mapping/mutational',
-    'mapplebeck',
     'mapplebreck',
-    'mappy',
-    'maproa',
-    'maps.k.64.34',
-    'maps/route',
-    'mapsellers',
-    'mapsize',
-    'mapsize=25,25',
-    'mapunduzi',
-    'mapunit',
-    'mapusa',
-    'maputaland',
-    'maqam',
-    'maqbool',
-    'maqo',
-    'maqsako',
     'maqsood',
-    'maqsud',
-    'maquarin',
-    'maquereau',
-    'maquereaux',
-    'maquerel',
-    'maquicontrole',
-    'maquina',
-    'maquinistas',
-    'maquisards',
-    'mar&aacute;lio',
-    'mar&eacute;chal-g&eacute;n&eacute;ral',
-    'mar&eacute;chale',
-    'mar&eacute;e',
-    'mar&iacute;in',
-    'mar&iacute;o',
     'mar&iacute;sela',
-    'mar&ndash;11',
-    'mar&ndash;25apr',
-    'mar&ndash;28',
-    'mar&ndash;5',
-    'mar&ndash;7',
-    'mar&ndash;s',
-    'mar&rehy;quisate',
-    'mar-25',
-    'mar-ee-a',
-    'mar-may',
-    'mar-research',
-    'mar-tee-ee',
-    'mar.91',
-    'mar/cmg/jmb',
-    'mar21/apr20',
     'mara&icirc;ch&egrave;re',
-    'mara&ndash;nairobi',
-    'mara-helen',
-    'marabou-trimmed',
-    'maraboutic',
-    'marabunta',
-    'marac',
-    'maraccas',
-    'maradi',
-    'maradona/or',
-    'marae',
-    'maragall',
-    'maragaret',
-    'maragert',
-    'maraging',
-    'maragos',
     'marai',
-    'maraistrade',
-    'maraj',
-    'marajo',
-    'marakir',
-    'marakwet',
-    'maraldi',
-    'maralinga',
-    'maramau',
-    'marambio',
-    'maranan',
-    'marandel',
-    'marandet',
-    'marango',
-    'maranite',
-    'marans',
     'maraqueo',
-    'mararios',
-    'marasali',
-    'marasius',
-    'marat-sur-nive',
-    'marath&oacute;n',
-    'marathas',
-    'marathon-champion',
-    'marathon/other',
-    'marathon/touring',
-    'marathoner.',
-    'maravaig',
-    'maravall',
-    'maravedis',
-    'maraya',
-    'marayland',
     'marazan',
-    'marb',
-    'marb&eacute',
-    'marbachegg',
-    'marbeck',
-    'marbelised',
-    'marbell',
-    'marben',
-    'marble-carving',
-    'marble-cutters',
-    'marble-effect',
-    'marble-eyed',
-    'marble-flaked',
-    'marble-fronted',
-    'marble-in-throat',
-    'marble-lined',
     'marble-paved',
-    'marble-pillared',
-    'marble-polisher',
-    'marble-shaped',
-    'marble-top',
-    'marble-veined',
-    'marble-worker',
-    'marble-working',
-    'marble.',
-    'marbled-effect',
-    'marbleized',
-    'marbline',
-    'marbling-by-numbers',
-    'marblings',
-    'marbly',
-    'marbode',
     'marbor&eacute;s',
-    'marboreal',
-    'marboua',
-    'marbouaminister',
-    'marbrack',
-    'marbre-bronze',
-    'marc\'',
-    'marc-andr&eacute',
-    'marc-antoine',
-    'marc-henri',
-    'marc-yvan',
-    'marca',
-    'marcabru',
-    'marcaccio',
-    'marcaroni',
-    'marcato',
     'marcel-albertine',
-    'marcelled',
-    'marcenello',
-    'marcet',
-    'marcgraviaceae',
-    'march&aacute;an',
-    'march&ndash;2',
-    'march&ndash;31st',
-    'march&ndash;7',
-    'march&rehy;2',
-    'march-10th',
-    'march-18',
-    'march-25',
-    'march-29',
-    'march-4',
-    'march-5',
     'march-december',
-    'march-discipline',
-    'march-hardened',
-    'march-may',
-    'march-monday',
-    'march/',
-    'march/1',
-    'march/aviation',
-    'marcha',
-    'marchadour',
-    'marchak',
-    'marchalite',
-    'marchall',
-    'marchands',
-    'marchands-merciers',
-    'marchant/alice',
     'marchants',
-    'marchaunt',
-    'marchell',
-    'marchenwald',
-    'marcheschi',
-    'marcheselli',
-    'marchesi',
-    'marchesinia',
-    'marchette',
-    'marchigiana',
-    'marching-pace',
-    'marching-song',
-    'marchio',
-    'marchis',
-    'marchment',
-    'marchomir',
     'marcht',
-    'marcial',
-    'marcigny',
-    'marcinkevicius',
-    'marcinkus',
-    'marck',
-    'marckill',
-    'marcks',
-    'marcle/herefordshire',
-    'marcogliese',
-    'marcom',
-    'marcomer',
-    'marconda',
-    'marconis',
-    'marcopille',
-    'marcoussis',
     'marcoux',
-    'marcovefa',
-    'marcoville',
-    'marcroft',
-    'marcucci',
-    'marculescu',
-    'marculf',
-    'marcuses',
-    'marcussen',
-    'marcyl\'',
-    'mardas',
-    'mardi*',
-    'mardian',
-    'mardike',
-    'mardinsyah',
-    'mardochee',
     'mardol',
-    'mardy-baby',
-    'mardyke',
-    'mare\'s-nests',
-    'mare\'s-tails',
-    'mare-collecting',
-    'mare/stallion',
-    'mareb',
-    'marecchia',
-    'marefair',
-    'maregarege',
-    'mareham-le-fen',
-    'marematlou',
-    'marenco',
-    'marenholtz',
-    'marenka',
     'marennes',
-    'marer',
-    'maresciallo',
-    'maresfield',
-    'marett/resident',
-    'mareuil-sur-belle',
-    'mareye-a',
-    'mareys',
-    'marfan',
-    'marfans',
-    'marfunin',
-    'marg-note-xref',
-    'margadale',
-    'margalef',
-    'margalit',
-    'margalita',
     'margallen',
-    'margarat',
-    'margarde',
-    'margaret\'s',
-    'margaret\'s-on-thames',
-    'margaret-nora',
-    'margaret/swindon',
-    'margarettes',
-    'margaria',
-    'margarinefabrieken',
-    'margart',
-    'margary',
-    'margent',
-    'margerete',
-    'margerison',
-    'margerita',
     'marget',
-    'margeurite',
-    'margged',
-    'marghanita',
-    'marghita',
-    'margibi',
-    'margin-rich',
-    'marginal_in',
-    'marginalians',
-    'marginalis',
-    'marginalism',
-    'marginalist',
-    'marginatum',
-    'marginless',
-    'margis',
-    'margisson',
     'margit-sziget',
-    'margolies',
-    'margoliouth',
-    'margosan-o',
-    'margoth',
-    'margoyles',
-    'margravate',
-    'margraves',
-    'margreet',
-    'margretta',
-    'margrie',
-    'marguet',
-    'margulies',
-    'marguns',
-    'marhaen',
-    'marhaenism',
     'marhaens',
-    'marharaja',
-    'marhcing',
-    'mari&aacute',
-    'mari-ann',
-    'maria-helena',
-    'maria-hilfstrasse',
-    'maria-rosa',
-    'maria-theresa',
-    'maria-therese',
-    'mariaberg',
-    'mariachis',
-    'mariae',
-    'mariahilferstrasse',
-    'mariahilfstrasse',
-    'mariakerke',
     'marian-centred',
-    'mariane',
-    'mariani',
-    'mariann',
-    'marianne.',
-    'marians',
-    'mariansk&eacute',
-    'mariansleigh',
-    'marianum',
-    'mariapocs',
-    'mariazell',
-    'maribarbola',
-    'maribou',
-    'maric',
-    'marica',
-    'marichal-margr&eacute;ve',
     'maricic',
-    'maricica',
-    'mariclare',
-    'mariculture',
-    'marid-forming',
-    'marid-type',
-    'maridor',
-    'maridunum',
-    'marie&rehy;ang&egrave;le\'s',
-    'marie&rehy;antoinette',
-    'marie-alexandre',
-    'marie-am&eacute;lie',
-    'marie-ang&eacute;le',
-    'marie-astrid',
-    'marie-catherine',
-    'marie-claude-beaud',
     'marie-dominique',
-    'marie-elisabeth',
-    'marie-france',
-    'marie-h&eacute;l&egrave;ne\'s',
-    'marie-hel&egrave;ne',
-    'marie-jeanne',
-    'marie-joe',
-    'marie-laurence',
-    'marie-michel',
-    'marie-sophie',
-    'marie-there',
-    'marie-therese',
-    'marie-type',
-    'maried',
-    'mariela',
-    'marielouise',
     'marien',
-    'marienaltar',
-    'marienborn',
-    'marienburgers',
-    'mariendorf',
-    'marienkirche-zur-wiese',
-    'marienski',
-    'marienstrasse',
-    'marieschi',
-    'mariesii',
-    'mariestad',
-    'mariez',
-    'marifarms',
-    'marig',
-    'marighela',
-    'marignola',
     'marigny',
-    'marigo',
-    'marigold-orange',
-    'marigun',
-    'mariinsk',
-    'marija',
-    'marijuana-cum-motorbikes',
-    'marilisa',
-    'marillionauts',
-    'marilynne',
-    'marimbas',
-    'marimon',
-    'marin&eacute;s',
-    'marina-related',
-    'marina.',
-    'marinair',
     'marinaro',
-    'marination',
-    'marind',
-    'marine-',
-    'marine-colours',
-    'marine-cut',
-    'marine-engine',
-    'marine-grade',
-    'marine-mammal',
-    'marine-ness',
-    'marine-store',
-    'marinecall',
-    'marinehood',
-    'marineline',
-    'mariner-(1809&ndash;1839)',
-    'mariner-like',
     'mariner/tarried',
-    'marinero',
-    'marines/others1212',
-    'marinha',
-    'marinieres',
-    'marinised',
-    'marinists',
-    'marinker',
-    'marinna',
-    'marinoomed',
-    'marinov',
-    'marinov/stojanov',
-    'marinova',
-    'marinum',
-    'marinvs',
-    'mario-andreas',
     'mario-mania',
-    'mario-type',
-    'mariography',
-    'marioland',
-    'mariology',
-    'mariosardara',
-    'marisco',
-    'marisela',
-    'marisha',
-    'marishes',
-    'marismas',
-    'maritally',
-    'marith&eacute',
-    'maritial',
-    'maritima-honkenya',
-    'maritime-configured',
     'maritime-related',
-    'maritime/continental',
-    'maritum',
-    'maritzas',
-    'maritzburg',
-    'mariumpol',
-    'mariusz',
-    'marivaux',
-    'marivent',
-    'marixx.ds',
-    'marixx.dt',
-    'mariya',
-    'marizndyni',
-    'marja',
-    'marja-liisa',
-    'marjan',
     'marjanne',
-    'marjerie',
-    'marjolin',
-    'marjon',
-    'marjoribanks',
-    'marjut',
-    'mark&lsqb;et&rsqb;s',
-    'mark&rehy;downs',
-    'mark\'s',
-    'mark-',
-    'mark-and-release',
-    'mark-books',
-    'mark-clumps',
-    'mark-getting',
-    'mark-recapture',
-    'mark-the-spot',
     'mark-up.',
-    'mark-ups/input',
-    'mark.but',
-    'mark/elvis',
-    'mark/peseta',
-    'mark/prisoner',
-    'mark2',
-    'markdown',
-    'markeat',
-    'marked*&gt',
-    'marked-off',
-    'marked-you',
-    'marked.',
-    'markeen',
-    'markek',
-    'markenham',
     'marker(s)',
-    'marker-poor',
-    'marker-version',
-    'marker.',
-    'marker/creatinine',
-    'markers&times;h',
-    'markert',
-    'markes',
-    'market&lsqb;s&rsqb',
-    'market&mdash',
-    'market&mdash;for',
-    'market&rehy;style',
-    'market&rehy;type',
-    'market--lord',
-    'market-after',
-    'market-attractiveness',
     'market-basket',
-    'market-boast',
-    'market-centre',
-    'market-clearing',
-    'market-commodity',
-    'market-control',
-    'market-defined',
-    'market-dominant',
-    'market-focused',
-    'market-focussed',
-    'market-forces',
-    'market-forecasters',
-    'market-friendly',
-    'market-growth',
-    'market-hall',
-    'market-ignorance',
     'market-induced',
-    'market-inspectors',
-    'market-level',
-    'market-liberalization',
-    'market-linked',
-    'market-mapping',
-    'market-matched',
-    'market-men',
-    'market-opening',
-    'market-originated',
-    'market-porter',
-    'market-porters',
-    'market-power',
-    'market-quotations',
-    'market-ready',
-    'market-relationship',
     'market-research-led',
-    'market-researcher',
-    'market-rigging',
-    'market-road',
-    'market-roads',
-    'market-share/experience',
-    'market-square',
-    'market-stall',
-    'market-stallholder',
-    'market-tested',
-    'market-theory',
-    'market-to-book',
-    'market-towns',
-    'market-valuation',
-    'market-value',
-    'market-wary',
     'market-weighted',
-    'market-woman',
-    'market.',
-    'market.3',
-    'market.participating',
-    'market.place',
-    'market/industry',
-    'market/island',
-    'market/user',
-    'marketh',
-    'marketing\'',
-    'marketing-',
-    'marketing-by-deception',
-    'marketing-centred',
-    'marketing-led',
-    'marketing-wise',
     'marketing.oriented',
-    'marketing/advertising',
-    'marketing/engineering',
-    'marketing/manpower',
-    'marketing/operations',
-    'marketing/pr',
-    'marketing/promotional',
-    'marketists',
-    'marketr',
-    'markets-where',
-    'marketshare',
-    'marketthorpe',
-    'marketwide',
-    'marketwomen',
-    'markham-smith',
-    'markhof',
     'markieviczs',
-    'marking-tape',
-    'markist',
-    'markl',
-    'markland',
-    'markless',
-    'markly',
-    'markmaking',
-    'markofdistinction',
-    'markovich',
-    'markovn',
-    'markowski',
-    'marks-',
-    'marks-to-market',
-    'markse',
-    'marksheet',
     'markswomen',
-    'markup-based',
-    'markups',
-    'markushegy',
-    'markwood',
-    'marl&egrave;ne',
-    'marl-hole',
-    'marlandwe',
-    'marlar',
-    'marlborian',
-    'marlboro-mclaren',
-    'marlboro-mclaren-honda',
-    'marlbrough',
-    'marlburian',
-    'marlcliffe',
-    'marle',
     'marleau',
-    'marlee',
-    'marleigh',
-    'marlena',
-    'marlenheim',
-    'marlesford',
-    'marlet',
-    'marlex',
-    'marleyised',
-    'marlfield',
-    'marli',
-    'marlia',
-    'marlin-spike',
-    'marlingham',
-    'marlings',
-    'marlins',
     'marlovian',
-    'marlow-based',
-    'marlowes',
-    'marlpits',
-    'marlpool',
-    'marly-le-roi',
-    'marm',
-    'marmalade-like',
-    'marmaratis',
-    'marmeladey',
-    'marmeleiros',
-    'marmellata',
-    'marmelukes',
-    'marment',
-    'marmier',
-    'marming',
     'marmitako',
-    'marmite-stained',
-    'marmites',
-    'marmo',
-    'marmol',
-    'marmorarii',
-    'marmosudjono',
-    'marmottan',
-    'marmoura',
-    'marn',
-    'marne-la-valee',
-    'marne-la-vall&eacute;e',
-    'marnela-vall&eacute;e',
-    'marner.',
-    'marnes',
-    'marneys',
     'marnhull',
-    'marning',
-    'marnocks',
-    'maroantsetra',
-    'marocain',
-    'marocains',
-    'maroilles',
-    'marojama',
-    'maron',
-    'marong',
-    'marongiu',
-    'maroni',
-    'maronii',
-    'maronique',
-    'maronite-dominated',
-    'maronitisme',
     'marons',
-    'maroon-bordered',
-    'maroon-edged',
-    'maroon-leather',
-    'maroon-silk',
-    'maroon/white',
-    'marooni',
-    'maroonings',
-    'marostica',
-    'marot-beze',
-    'maroua',
-    'marouez',
-    'marounouchi',
-    'marovic',
-    'maroviv',
-    'marpol',
     'marqu&eacute',
-    'marquadt',
-    'marquandite',
-    'marquart',
-    'marquees_and',
-    'marquetry-style',
-    'marquette',
-    'marquina',
-    'marquisate',
-    'marquises',
-    'marr-ed',
-    'marrad',
-    'marraige',
-    'marraine',
-    'marraines',
-    'marram-fastened',
     'marrams',
-    'marrancini',
-    'marriag',
-    'marriage&mdash;you',
-    'marriage\'',
-    'marriage-alliances',
-    'marriage-at',
-    'marriage-avoiding',
-    'marriage-bed',
-    'marriage-contract',
-    'marriage-dance',
-    'marriage-guidance',
-    'marriage-like',
-    'marriage-makers',
-    'marriage-offer',
-    'marriage-partners',
     'marriage-rules',
-    'marriage-split',
-    'marriage-tie',
-    'marriage-vows',
-    'marriage-wrecking',
-    'marriage.45',
-    'marriage.their',
-    'marriage/home/work',
-    'marriage/of',
-    'marriage_in',
-    'marriagist',
-    'marrian',
-    'marric',
-    'marrick',
-    'married&mdash;from',
-    'married&mdash;he',
     'married-couple',
-    'married-quarter',
-    'married-type',
-    'married-while',
-    'married/single',
-    'married:to',
-    'marriet',
-    'marrietta',
-    'marrimen',
-    'marrina',
-    'marrion',
-    'marriott/trading',
-    'marrival',
-    'marros',
-    'marrou',
-    'marrow-bones',
     'marrow-chilled',
-    'marrow-stemmed',
-    'marrow.',
-    'marrowbones',
-    'marrowfat',
-    'marrried',
-    'marry&mdash;if',
-    'marry-a',
-    'marry-up',
-    'marryat\'',
-    'marryshow',
-    'mars&mdash',
-    'mars-like',
-    'mars-made',
-    'mars-tanned',
-    'marsabit',
     'marsaxlokk',
-    'marschalek',
-    'marschalk',
-    'marschall',
-    'marscham',
-    'marsden/actor',
-    'marsden/daughter',
-    'marsden/ex-husband',
-    'marse',
-    'marsei',
-    'marseillais',
-    'marseillaisc',
-    'marseille6',
-    'marsella',
-    'marsey',
-    'marsh-birds',
     'marsh-dwellers',
-    'marsh-grass',
-    'marsh-lands',
-    'marsh-lights',
-    'marsh-lovers',
-    'marsh-men',
-    'marsh-mickle',
-    'marsh-mist',
-    'marsh-people',
-    'marsh-tolerant',
-    'marsh.',
-    'marsh/centre',
-    'marsh/gloucester',
-    'marsh/social',
-    'marshack',
-    'marshal&ndash;basset',
     'marshal-unit',
-    'marshalea',
-    'marshalek',
-    'marshall\'st',
-    'marshall-aid',
-    'marshall/benetton',
-    'marshall/celestion',
-    'marshall/company',
-    'marshall/earth',
-    'marshall/earthfirst',
-    'marshall/factories',
-    'marshall/gloucestershire',
-    'marshall/health',
-    'marshall/helper',
-    'marshall/project',
-    'marshall/west',
     'marshallese',
-    'marshalling-yard',
-    'marshalling-yards',
-    'marshallion',
-    'marshallsay',
-    'marshals.',
-    'marshand',
-    'marshbanks',
-    'marshend',
-    'marshender',
-    'marshes.john',
-    'marshlander',
-    'marshlight',
-    'marshmallow-size',
-    'marshmallow-white',
-    'marshmallowy-soft',
     'marshmen',
-    'marshrats',
-    'marshwiggle',
-    'marsia',
-    'marsiksii',
-    'marsileaceae',
-    'marsili',
-    'marsillius',
-    'marsina',
-    'marsinah',
-    'marske-based',
-    'marske-by-sea',
-    'marske-by-the-sea',
-    'marske-in-swaledale',
-    'marski',
-    'marsland.',
     'marsonair',
-    'marsquake',
-    'marsteller',
-    'marstetten',
-    'marsting',
-    'marston-moor',
-    'marston-smith',
-    'marston/herefordshire',
-    'marsupites',
-    'marsurin',
-    'mart&iacute;nez**',
-    'mart&iacute;nezlabour',
-    'marteau',
-    'martedi',
-    'martelet',
-    'martell-sponsored',
     'martell/oxen',
-    'martellato',
-    'martellis',
-    'martenflies',
-    'marter',
-    'martereau',
-    'martesana',
-    'martgins',
-    'martial-arts',
-    'martials',
-    'martiana',
-    'martiem',
-    'marties',
-    'martim',
-    'martin\'s-in-the',
-    'martin(1)',
     'martin-bowers',
-    'martin-chauffier',
-    'martin-clarke',
-    'martin-eloy',
-    'martin-harvey',
-    'martin-in',
-    'martin-in-the',
-    'martin-in-the&rehy;fields',
-    'martin-le-grand',
-    'martin-like',
-    'martin-scott',
-    'martin-vasquez',
-    'martin-von-wagner',
-    'martin/accident',
-    'martin/age',
-    'martin/automobile',
     'martin/butcher',
-    'martin/creditor',
-    'martin/father',
-    'martin/gordon',
-    'martin/pensioner',
-    'martin/snake',
-    'martin/thames',
-    'martinao',
-    'martinaro',
-    'martinborough',
-    'martindales',
-    'martineaus',
-    'martinek',
-    'martinelli/tibbett',
-    'martinette',
-    'martineu',
     'martinez-brawley',
-    'martinez-bujanda',
-    'martinez-due&ntilde;as',
-    'martinez/may',
-    'martinez/reuter',
-    'martinica',
-    'martinican',
-    'martinicans',
-    'martiniquaise',
-    'martiniquians',
-    'martinkenas',
-    'martinminister',
-    'martinoni',
-    'martinovich',
-    'martinpuich',
-    'martins-developed',
     'martins-le-grand',
-    'martinsee',
-    'martinsk&aacute',
-    'martinsson',
-    'martinstown',
-    'martinville',
-    'martio-barbulus',
-    'martire',
-    'martires',
-    'martiros',
-    'martland',
-    'martles',
-    'martlet',
-    'martley',
-    'marto',
-    'marton-le-moor',
     'martons',
-    'martos',
-    'martovs',
-    'martshall',
-    'martyal',
-    'martyn/pensioner',
-    'martynas',
-    'martyns',
-    'martyr\'s',
-    'martyr-king',
-    'martyr.7',
-    'martyrdom/unsung',
-    'martyre',
-    'martyred-looking',
-    'martyria',
-    'martyrial',
     'martyring',
-    'martyrs.',
-    'maruan',
-    'marucello',
-    'maruja',
-    'marukhyan',
-    'marulanga',
-    'maruschka',
-    'marusin',
-    'maruyama',
-    'marvejols',
-    'marvel-ous',
-    'marvel.we',
-    'marvelettes',
-    'marvellbridegroom\'sous',
-    'marvellous-looking',
     'marvellous=',
-    'marville',
-    'marvo',
-    'marwa',
-    'marwant',
-    'marwidk',
-    'marx\'',
-    'marx-imising',
-    'marx-influenced',
-    'marx-ism',
-    'marxism-leninism-mao',
-    'marxism-leninist',
-    'marxism/bolshevism',
-    'marxist&ndash;leninists',
-    'marxist-dominated',
-    'marxist-existentialism',
     'marxist-feminist',
-    'marxist-feminists',
-    'marxist-gramscian',
-    'marxist-inclined',
-    'marxist-inflected',
-    'marxist-nationalist',
-    'marxist-structuralist',
-    'marxist-trotskyist',
-    'marxista-leninista',
-    'marxomanni',
-    'mary\'',
-    'mary\'s-by-the-sea',
-    'mary-',
-    'mary-chapin',
-    'mary-claire',
-    'mary-in',
     'mary-jeanne',
-    'mary-jo',
-    'mary-lander',
-    'mary-no',
-    'mary-on-the-rock',
-    'mary-rose',
-    'mary-whitehouse-approved',
-    'mary.',
-    'mary/motherwell',
-    'maryburgh',
-    'marye',
-    'maryen',
-    'marygreen',
-    'maryknoll',
-    'marylandiad',
-    'marylin',
     'marylyn',
-    'marymount',
-    'maryneer',
-    'marysville',
-    'maryvale',
-    'maryville',
-    'marza',
-    'marzillian',
-    'marzimedici',
-    'marzipan-filled',
-    'marzipanned',
-    'marzocco',
-    'marzouki',
-    'mas&iacute;a',
-    'mas.s',
-    'masa-idahdeputy',
     'masad',
-    'masae',
-    'masafumi',
-    'masage',
-    'masai-astic',
-    'masai-itis',
-    'masai-loving',
-    'masaichi',
-    'masajuro',
-    'masakuni',
-    'masalha',
-    'masaliev',
-    'masalik-ul-absar',
-    'masalla',
-    'masanao',
-    'masani',
     'masanorum',
-    'masaru',
-    'masashi',
-    'masatake',
-    'masatatsu',
-    'masatoshi',
-    'masayrek',
-    'masbaha',
-    'masbate',
-    'masc.',
-    'mascara-darkened',
-    'mascara-ed',
-    'mascara-heavy',
-    'mascara-laden',
-    'mascarades',
-    'mascarell',
     'mascaret',
-    'mascarons',
-    'mascherini',
-    'maschinenbau',
-    'maschino',
-    'maschotrometers',
-    'maschsee',
-    'maschwitz',
-    'masciave',
-    'mascimal',
-    'mascinploxyrhanophyhaninide',
-    'mascio',
-    'mascles',
-    'mascot-muse-mannequin',
-    'masculin',
-    'masculine\'',
     'masculine-looking',
-    'masculine-minded',
-    'masculine-seeming',
-    'masculine-sounding',
-    'masculine/',
-    'masculine/homosexual',
-    'masculinisation',
-    'masculinised',
-    'masculinity-as-activity',
-    'masden',
-    'masegne',
-    'maself',
-    'maserati-engined',
-    'masetti',
-    'mash-style',
-    'mash-tun',
     'mashaikh',
-    'mashaqibah',
-    'mashed-potato',
-    'mashed-up',
-    'masheens',
-    'mashiach',
-    'mashie-shot',
-    'mashima',
-    'mashiter',
-    'mashkarin',
-    'mashood',
-    'mashrabiya',
-    'mashribiya',
-    'mashwi',
-    'masia',
-    'masik',
     'masiku',
-    'masila',
-    'masiura',
-    'masiye',
-    'masjid-dwarfed',
-    'masjid-i-suleiman',
-    'masjid-ram',
-    'mask-and-glove',
-    'mask-fire',
-    'mask-like.',
-    'mask-mounted',
-    'mask-toting',
-    'mask-work',
-    'maska',
-    'maskarade',
-    'maskel',
     'maskens',
-    'maskin',
-    'maskin(1989)',
-    'masking&rehy;tape',
-    'masking-taped',
-    'maskless',
-    'maskwork',
-    'maslah',
-    'maslenica',
-    'maslennikov',
-    'maslinovoj',
-    'maslonikov',
-    'masnaa',
-    'masnadieri',
-    'masnmr',
-    'maso',
     'masochist/rape',
-    'masoke',
-    'masoko',
-    'masolini',
-    'masoma',
-    'mason&ndash;dixon',
-    'mason-architect',
-    'mason-architects',
-    'mason-like',
-    'mason-overseer',
-    'mason-watcher',
-    'mason-watchers',
-    'mason/author',
-    'mason/director',
-    'mason/ex-rally',
-    'mason/manager',
     'mason/morton',
-    'mason/priest',
-    'mason/ryan',
-    'mason/steeple',
-    'mason/thames',
-    'mason/town',
-    'mason/upper',
-    'masondo',
-    'masoned',
-    'masoniana',
-    'masonic&mdash;communist',
-    'masonics',
-    'masonries',
-    'masonry-bridges',
-    'masonry-built',
-    'masonry:special',
     'masovers',
-    'masoz',
-    'maspalomas',
-    'masqu&eacute',
-    'masque/opera',
-    'masquers',
-    'masquing',
-    'masroor',
-    'mass&eacute',
-    'mass&mdash',
-    'mass-afforestation',
-    'mass-assessment',
-    'mass-audience',
-    'mass-baptisms',
-    'mass-brain',
-    'mass-bred',
     'mass-communicators',
-    'mass-consciousness',
-    'mass-consumption',
-    'mass-cooked',
-    'mass-dependent',
-    'mass-destruction',
-    'mass-disciplined',
-    'mass-distribution',
-    'mass-energy',
-    'mass-everything',
-    'mass-executions',
-    'mass-flow',
-    'mass-flowering',
-    'mass-grown',
-    'mass-ification',
-    'mass-imagery',
     'mass-industrial',
-    'mass-instruction',
-    'mass-killing',
-    'mass-killings',
-    'mass-less',
-    'mass-loss',
-    'mass-majority',
-    'mass-makers',
-    'mass-political',
-    'mass-priest',
-    'mass-privatisation',
-    'mass-rearing',
-    'mass-related',
-    'mass-reproduction',
-    'mass-revolutionary',
-    'mass-sale',
     'mass-selected',
-    'mass-slaughter',
-    'mass-spectrometer',
-    'mass-tourism',
-    'mass-transit',
-    'mass/charge',
-    'massa&rehy;chusetts',
-    'massachusetts-base',
-    'massachussets',
-    'massacio',
-    'massacree',
-    'massage-room',
-    'massage/fitness',
-    'massaino',
-    'massalah',
-    'massallam',
     'massaman',
-    'massanaise',
-    'massane',
-    'massanga',
-    'massaquoi',
-    'massari',
-    'massau',
-    'massedefence',
-    'masseme',
-    'massemployment',
-    'massengale',
-    'massenutinae',
-    'masses/charges',
-    'masset',
-    'masseur-cum-dietician',
-    'massevacuation',
     'massey-harris',
-    'massgoers',
-    'massia',
-    'massias',
-    'massieu',
-    'massified',
-    'massika',
-    'massilia',
-    'massiliensium',
-    'massillon',
-    'massimino',
-    'massination',
-    'massine-berlioz',
-    'massinghams',
-    'massingir',
-    'massings',
     'massively-expanded',
-    'masslab',
-    'massonde',
-    'massoni',
-    'massoretes',
-    'massoretic',
-    'massoth',
-    'massouleh',
-    'masster',
-    'masstricht',
-    'masstyle',
-    'massuh',
-    'massynger',
-    'massys',
-    'mast-',
-    'mast-breaking',
     'mast-fruiting',
-    'mast-heads',
-    'mast-mounted',
-    'mast-stepping',
-    'mast-stripping',
-    'mastac',
-    'mastacembelidae',
-    'mastas',
-    'mastcembelus',
-    'mastcheck',
-    'mastectomy.',
-    'masted-yachts',
-    'mastellar',
-    'master-a',
-    'master-and-servant',
-    'master-baker',
     'master-blaster',
-    'master-builders',
-    'master-buyer',
-    'master-classes',
-    'master-conspirators',
-    'master-copy',
-    'master-courtier',
-    'master-craftsmen',
-    'master-disc',
-    'master-faker',
-    'master-lacquer',
-    'master-lacquers',
-    'master-man',
-    'master-manipulators',
-    'master-mariner',
-    'master-minding',
     'master-minds',
-    'master-miner',
-    'master-peece',
-    'master-pianists',
-    'master-piece',
-    'master-pieces',
-    'master-planner',
-    'master-plans',
-    'master-politician',
-    'master-principle',
-    'master-pupil',
-    'master-race',
-    'master-sculptor',
-    'master-sergeant',
-    'master-skills',
-    'master-smith',
     'master-spy',
-    'master-strategist',
-    'master-strokes',
-    'master-sweep',
-    'master-table',
-    'master-tailor',
-    'master-tanner',
-    'master-to-man',
-    'master-trope',
-    'master-wax',
-    'master/',
-    'master/apprentice',
-    'master/district',
-    'master/master',
-    'master/masters',
-    'master:servant',
     'masteraccount',
-    'masterbanking',
-    'masterbate',
-    'masterblaster',
-    'masterblower',
-    'mastercard/eurocard',
-    'mastercards',
-    'mastercharge',
-    'mastercontrol',
-    'mastercover',
-    'mastercraft',
-    'masterfile',
-    'masterfit',
-    'masterfly',
-    'masterfry',
-    'mastergardener',
     'masterglider',
-    'masterkey',
-    'masterlead',
-    'mastermatrices',
-    'mastermined',
-    'mastermould',
-    'masteroff',
-    'masters/diploma',
-    'masters/northamptonshire',
-    'masters/tour',
-    'masters/wilts',
-    'mastersmith',
-    'mastersport',
-    'masterspy',
-    'masterston',
-    'mastersystem',
     'mastertape',
-    'mastfoot.',
-    'mastfoot/universal',
-    'masthead-rigged',
-    'masticates',
-    'mastin',
-    'mastington',
-    'mastitis-control',
-    'mastman',
-    'masto',
-    'mastodon-like',
-    'mastodonts',
-    'mastoids',
-    'mastoparan',
-    'mastophora',
-    'mastr',
     'mastricht',
-    'mastroianni',
-    'mastsarge',
-    'masturbat&rehy;ing',
-    'masu',
-    'masucci',
-    'masuhara',
-    'masum',
-    'masun',
-    'masuno',
-    'masurel',
-    'masurenallee',
-    'masuria',
-    'masurier',
-    'masution',
-    'masutti',
     'masyarakat',
-    'mat&agrave;cic',
-    'mat&eacute;riau',
-    'mat&mdash;a',
-    'mat&ndash;riel',
-    'mat-covered',
-    'mat-erials',
-    'mat-grass',
-    'mat-making',
-    'mat-roofed',
-    'mat39',
-    'mata\'afa',
-    'mata-aho',
-    'mata-kuching',
-    'mata-utu',
-    'matadi',
     'matador-style',
-    'matador2',
-    'matadored',
-    'matagouri',
-    'matahari',
-    'matakohe',
-    'matala',
-    'matalino',
-    'matano',
-    'matanzima',
-    'matapang',
-    'matar&oacute',
-    'matara-hambantota',
-    'matarangi',
-    'matarella',
-    'matas',
     'matausioc',
-    'matazo',
-    'matb1',
-    'match-',
-    'match-award',
-    'match-awardwinning',
-    'match-boarded',
-    'match-boxes',
-    'match-days',
-    'match-facts',
-    'match-fee',
-    'match-finder',
-    'match-fished',
-    'match-flame',
-    'match-girl',
-    'match-girls',
     'match-going',
-    'match-holland',
-    'match-long',
-    'match-make',
-    'match-practice',
-    'match-racing',
-    'match-resistant',
-    'match-riddled',
-    'match-rigging',
-    'match-sellers',
-    'match-slip',
-    'match-slips',
-    'match-stick',
-    'match-sticks',
-    'match-summariser',
-    'match-wise',
     'match-workers',
-    'match.due',
-    'match.leyhill',
-    'matchams',
-    'matchborough',
-    'matchbox-houses',
-    'matchbox-maker',
-    'matchbox-size',
-    'matchboxmaking',
-    'matchcad',
-    'matchdays',
-    'matchends',
-    'matches.as',
-    'matches/seasons',
-    'matchet',
-    'matcheth',
     'matchgroup',
-    'matchhead',
-    'matchin\'',
-    'matching-funds',
-    'matching/repair/replacement',
-    'matchland',
-    'matchline',
-    'matchmail',
-    'matchmake',
-    'matchmaker-',
-    'matchs',
-    'matchsaving',
-    'matchseller',
-    'matchstick-sized',
-    'matchwinners',
-    'mate-hunting',
     'mate-selection',
-    'mate-swapping',
-    'mateable',
-    'matebeleland',
-    'matecumbe',
-    'mateic',
-    'matejko',
-    'matelote',
-    'matelotes',
-    'matengo',
-    'mater-ial',
-    'materalised',
-    'materalizing',
-    'materiae',
-    'material&mdash;it',
-    'material(s)',
     'material-dg',
-    'material-in',
-    'material-ismo',
-    'material-portraits',
-    'material-spiritual',
-    'material-technical',
-    'material-type',
-    'material/device',
-    'material/ideological',
-    'material_rather',
-    'materialisations',
-    'materialise.',
-    'materialism\'',
-    'materialist-oriented',
-    'materialistes',
-    'materialities',
     'materialpr&uuml;fung',
-    'materials-both',
-    'materials-handling',
-    'materials-type',
-    'materials-wood',
-    'materials/our',
-    'materials/work',
-    'materials_as',
-    'materical',
-    'maternal-dependency',
-    'maternal-uncle',
-    'maternit&eacute',
-    'maternity-home',
-    'maternity-wear',
-    'maternity.what',
-    'materpieces',
     'materson',
-    'mates.now',
-    'matey-blokes-next-door',
-    'mateys',
-    'mateysek',
-    'mateysys',
-    'matfen',
-    'matfield',
-    'matgigic',
-    'matgigic/restaurateur',
-    'mathaking',
-    'mathausen',
-    'mathealira',
-    'mathefelon',
-    'mathematical-navigation',
-    'mathematical/scientific',
     'mathematically-based',
-    'mathematically-convenient',
-    'mathematically-insufferable',
-    'mathematically-minded',
-    'mathematically-respectable',
-    'mathematicalness',
-    'mathematician-to-be',
-    'mathematician/philosophers',
-    'mathematicized',
-    'mathematics-like',
-    'mathematics/science',
-    'mathematics/scientific',
-    'mathematisation',
-    'mathematisch-naturwissenschaftlichen',
-    'mathematische',
-    'mathematize',
     'mather/starmaker',
-    'matheuss',
-    'mathewmarklukeandjohn',
-    'mathews/tugmaster',
-    'mathias/dvla',
-    'mathics',
-    'mathieu-favier',
-    'mathiot',
-    'mathisen',
-    'mathmatical',
-    'mathnawi',
-    'mathon',
-    'mathonwy',
-    'maths-blind',
-    'maths.',
-    'maths/non-maths',
     'maths/science',
-    'maths/science-based',
-    'mathys',
-    'mati&egrave;re',
-    'mati&egrave;res',
-    'matia',
-    'matiabe',
-    'matianas',
-    'matiasevich',
-    'maties',
-    'matinchev',
-    'matinct',
-    'matine',
-    'mating-calls',
-    'mating-like',
-    'mating-position',
     'matinique',
-    'matinox',
-    'matisse-influenced',
-    'matisse-inspired',
-    'matisse-like',
-    'matius',
-    'mativ',
-    'matkinson',
-    'matkovic',
-    'matlala',
-    'matlala/may',
-    'matlashewski',
-    'matlelima',
-    'matloubi',
-    'matmada',
-    'matmalamo',
     'matmata',
-    'matmos',
-    'matoes',
-    'matoka',
-    'matonna',
-    'matons',
-    'mator',
-    'matorell',
-    'matouka',
-    'matr',
-    'matra-ford',
-    'matri',
-    'matri-archal',
-    'matriarch/',
-    'matriarchical',
-    'matric.',
     'matricula',
-    'matriculants',
-    'matriline',
-    'matrilocal',
-    'matrimonal',
-    'matrimoniale',
-    'matrioshki',
-    'matrisciana',
-    'matrist',
-    'matrix&rehy;management',
-    'matrix-addressed',
-    'matrix-format',
-    'matrix-initiated',
-    'matrix-integrin',
-    'matrix-links',
-    'matrix-management',
     'matrix-specific',
-    'matrix-supported',
-    'matrix-switched',
-    'matrix.',
-    'matrixed',
-    'matrixial',
-    'matronalia',
-    'matroniano',
-    'matronymics',
-    'matrouh',
-    'matryoshka',
-    'matsa',
-    'matsumi',
-    'matsumiya',
-    'matsuri',
-    'matsutake',
     'matsutakes',
-    'matsuya',
-    'matsuyama',
-    'matsuzawa',
-    'matsuzuka',
-    'matt-bodied',
-    'matt-finishing',
-    'matt-looking',
-    'matt.1:18&ndash;25',
-    'matt.1:23',
-    'matt.28',
-    'matt.2:1&ndash;23',
-    'matt.8:23&ndash;27',
-    'matt.8:26',
-    'matta-clark',
-    'mattama',
     'mattan/race',
-    'mattana',
-    'mattarella',
-    'mattathias',
-    'mattazz',
-    'matteawan',
-    'matteis',
-    'matter&mdash;but',
-    'matter\'',
-    'matter-',
-    'matter-are',
-    'matter-bleaching',
-    'matter-dominated',
-    'matter-of&rehy;factly',
-    'matter-of-course',
-    'matter-of-face',
     'matter-of-fact-ness',
-    'matter-off-act',
-    'matter-or-fact',
-    'matter-she',
-    'matter-then',
-    'matter-would',
-    'matter/clay',
-    'matter/defeated.',
-    'matter/energy/interactions',
-    'matter/unit',
-    'matter_of_er_er_fact',
-    'matterdale',
-    'mattered.',
-    'matterhorns',
-    'matterless',
-    'matters&mdash;consisting',
     'matters--are',
-    'matters.l',
-    'matters:at',
-    'matters_such',
-    'matteuzzi',
-    'mattewos',
-    'matth',
-    'matthaisson',
-    'matthew/head',
-    'matthewman',
-    'matthews*',
-    'matthews/base',
-    'matthews/health',
-    'matthews/learning',
-    'matthews/oxford',
-    'matthews/prince',
     'matthews/student',
-    'matthijs',
-    'matthioli',
-    'mattick',
-    'mattielli',
-    'mattieson',
-    'mattimoe',
-    'mattinata',
-    'mattingley',
-    'mattingly/automobile',
-    'mattingy',
-    'mattis',
-    'mattishall',
-    'mattle',
-    'mattmat',
-    'mattock/rose',
     'matton',
-    'mattox/washington',
-    'mattress-like',
-    'matu',
-    'matu-nte',
-    'matua',
-    'matuika',
-    'matulka',
-    'matupa',
-    'matura',
-    'maturaca',
-    'maturation-related',
-    'maturation.',
-    'maturationally',
-    'maturations',
-    'maturazeugnis',
     'mature-stage',
-    'maturiing',
-    'maturitatszeugnis',
-    'maturity.feare',
-    'maturo',
-    'matus',
-    'matusalem',
-    'matuschka',
-    'matussiere',
-    'matuta',
-    'matutina',
-    'matutinal',
-    'matuyama',
-    'matvey',
-    'matvienko',
-    'maty&aacute&scaron;e',
     'maty&aacute;s',
-    'matyam',
-    'matyns',
-    'matys',
-    'matzenauer',
-    'matzoh-ball',
-    'matzs',
-    'mau-mau',
-    'maubisse',
-    'maubuisson',
-    'mauch',
-    'mauclerc',
-    'maud\'huy',
-    'maud-evelyn',
-    'maudits',
-    'maudlins',
     'maudslays',
-    'maudsley/conservative',
-    'maue',
-    'maug&eacute',
-    'maugan',
-    'mauge',
-    'maugis',
-    'maukala',
-    'maul&eacute;on-licharre',
-    'maulawi',
-    'maulbertsch',
-    'mauleon',
-    'maulings',
-    'maulkin',
-    'maulpertsch',
-    'maulstick',
     'mault',
-    'mault/new',
-    'maulvis',
-    'maumere',
-    'maumoon',
-    'maunder/gloucestershire',
-    'maunds',
-    'maunfacturers',
-    'maung*',
-    'maunganui',
-    'maunsell-designed',
-    'maupaul',
-    'maurauding',
-    'maure',
-    'maurean',
-    'maureen\'s',
     'maureene',
-    'maurerische',
-    'mauretanian',
-    'maurice/resident',
-    'mauricewood',
-    'mauriel',
-    'mauries',
-    'maurinus',
-    'mauritania-senegal',
-    'mauritaniens',
-    'mauritian-indian',
-    'mauritians',
-    'mauritius*',
-    'mauritius/seychelles',
-    'mauritzhuis',
-    'maursen',
     'mauru',
-    'mauru/kiribati',
-    'maurwood',
-    'mause',
-    'mauseolopsis',
-    'mausers',
-    'mausoleum/chapel',
-    'mauteby',
-    'mauter',
-    'mauthausen',
-    'mautner',
-    'mauvais',
-    'mauvarre',
-    'mauve-black',
-    'mauve-coloured',
-    'mauve-fleshed',
     'mauve-ish',
-    'mauve-sprigged',
-    'mauve-tinted',
-    'mauve-washed',
-    'mauve/pink',
-    'mauveine',
-    'mauvely',
-    'mauvey-pink',
-    'mauvey-red',
-    'mauvezin',
-    'mauvis',
-    'mauvy',
-    'mauzoni',
-    'mavasia',
-    'mave',
-    'maver',
     'maverick/warner',
-    'mavonia',
-    'mavor',
-    'mavra/zagreb',
-    'mavro-michaelis',
-    'mavrodaphne',
-    'mavrodieva',
-    'mavromati',
-    'mawashi',
-    'mawatha',
-    'mawatte',
-    'mawdach',
-    'mawenzi',
-    'mawere',
-    'mawford',
-    'mawgan-wroughton',
     'mawhood',
-    'mawish',
-    'mawj-i',
-    'mawker',
-    'mawkin',
-    'mawlana',
-    'mawley',
-    'mawpers',
-    'mawrey',
-    'mawry',
-    'mawsley',
-    'mawther',
-    'max-can',
-    'max-joseph',
-    'max-muller',
-    'max-planck-institute',
     'max232',
-    'max72-encoding',
-    'maxam-',
-    'maxam/gingerbread',
-    'maxaman',
-    'maxbox',
-    'maxcompress',
-    'maxed',
-    'maxes',
-    'maxet',
-    'maxexp',
-    'maxfern',
-    'maxi&rehy;mization',
-    'maxi-break',
-    'maxi-endowment',
-    'maxi-mum',
     'maxi-prep',
-    'maxi-rater',
-    'maxi-sloops',
-    'maxicamera',
-    'maxies',
-    'maxilink',
-    'maxilla-facial',
-    'maxilla-like',
-    'maxillaris',
-    'maxim&ndash;nordenfelt',
-    'maxim&ndash;s',
-    'maxim\'',
-    'maxim-type',
-    'maximalists',
-    'maximands',
-    'maximi',
     'maximianus',
-    'maximili&aacute;n',
-    'maximiliane',
-    'maximiliano',
-    'maximilianstrasse',
-    'maximilla',
-    'maximinus',
-    'maximisability',
-    'maximite',
-    'maximizer',
-    'maximov',
-    'maximum-to-maximum',
-    'maximumweight',
-    'maximun',
-    'maxing',
-    'maxinova',
     'maxint',
-    'maxiscreamers',
-    'maxistore',
-    'maxium',
-    'maxlow-tomlinson',
-    'maxmum',
-    'maxonians',
-    'maxstoke',
-    'maxtech',
-    'maxwell-controlled',
-    'maxwell-hudson',
-    'maxwell-type',
-    'maxwell/rangers',
-    'maxwell/speaking',
-    'maxwellhouse',
-    'maxwelliana',
     'may&mdash;june',
-    'may&ndash;11',
-    'may&ndash;19',
-    'may&ndash;2',
-    'may&ndash;3',
-    'may&ndash;6',
-    'may&ndash;7',
-    'may&ndash;8',
-    'may&ndash;august',
-    'may&ndash;october',
-    'may&ndash;sept',
-    'may&rehy;august',
-    'may-',
-    'may-1',
-    'may-10',
-    'may-16',
     'may-18',
-    'may-24',
-    'may-26',
-    'may-29',
-    'may-brick',
-    'may-care',
-    'may-early',
-    'may-grunwald',
-    'may-gurney',
-    'may-july',
-    'may-morning',
-    'may-november',
-    'may-october',
-    'may-poled',
-    'may-poles',
-    'may-time',
     'may-weggen',
-    'may.',
-    'may.24',
-    'may.be',
-    'may.but',
-    'may/british',
-    'may/could',
-    'may/early',
-    'may/mid',
-    'may/raid',
-    'may/tanya',
-    'may/tony',
-    'may/will',
-    'may22/june21',
-    'may_of',
-    'mayaka',
     'mayaki',
-    'mayakovskovo',
-    'mayall-ish',
-    'mayall/conservative',
-    'mayassi',
-    'mayatt',
-    'maybach',
-    'maybeck',
-    'maybees',
-    'maybellenes',
-    'maybloom',
-    'mayblossom',
-    'maybray-king',
-    'maybrook',
-    'maybud',
-    'maycock/reporting',
     'mayde',
-    'maydels',
-    'mayden',
-    'maydes',
-    'mayeedul',
-    'mayegun',
-    'mayenknecht',
-    'mayenne',
-    'mayer-hasselwander',
-    'mayer/council',
-    'mayer/leader/thamesdown',
-    'mayerhofen',
-    'mayerl',
-    'mayerling_pas',
-    'mayero',
-    'mayerwestern',
     'mayeur',
-    'mayeux',
-    'mayfair-based',
-    'mayfair/commercial',
-    'mayflowering',
-    'maygrove',
-    'mayhew-like',
-    'mayhew-mccrimmon',
-    'mayhew/gloucester',
-    'mayhews',
-    'mayhodin',
-    'mayland',
-    'maylandia',
-    'maylase',
-    'maylin',
-    'maynard/friends',
     'maynards',
-    'mayner/cork',
-    'maynes',
-    'maynetenance',
-    'maynot',
-    'maynteynors',
-    'mayntz',
-    'mayol',
-    'mayon-white/community',
-    'mayon-white/consultant',
-    'mayon-white/oxfordshire',
-    'mayonnaise-based',
-    'mayonnaise-bound',
-    'mayonnaise.',
-    'mayonnaises',
-    'mayonnaisey',
     'mayoralities',
-    'mayorality',
-    'mayormaking',
-    'mayorquine',
-    'mayos',
-    'mayott',
-    'mayou',
-    'mayou/consultant',
-    'maypole-raising',
-    'mayra',
-    'mayrieres',
-    'mayrnyo',
-    'maysan',
-    'maysent',
-    'mayst',
-    'maytham',
     'maythorne',
-    'maytide',
-    'mayto',
-    'mayugi',
-    'mayuree',
-    'mayyu',
-    'mazagan',
-    'mazak',
-    'mazankowskideputy',
-    'mazas',
-    'mazatl&aacute;n',
-    'mazatzal',
-    'mazboudi',
-    'mazbout',
-    'mazdas',
-    'mazdoor',
     'mazduryar',
-    'maze-bright',
-    'maze-builders',
-    'maze-dull',
-    'maze-learning',
-    'maze-runner',
-    'maze-shapes',
-    'mazel',
-    'mazeltovs',
-    'mazenod',
-    'mazer',
-    'mazeres',
-    'mazhar',
-    'mazharul',
-    'mazheikas',
-    'mazilu*',
     'mazis',
-    'mazmoor',
-    'mazor',
-    'mazoud',
-    'mazowia',
-    'mazowiescki',
-    'mazuchi',
-    'mazuelo',
-    'mazunovs',
-    'mazuraan',
-    'mazurak',
-    'mazure',
-    'mazuri',
-    'mazurki',
-    'mazursky',
-    'mazury',
     'mazy-patterned',
-    'mazz&oacute;n',
-    'mazzard',
-    'mazzetta',
-    'mazzinghi',
-    'mazzinian',
-    'mazzol&agrave',
-    'mazzolini',
-    'mazzone',
-    'mazzuoli',
-    'mazzy',
-    'mb-120',
-    'mb-5',
-    'mb-mda-231',
-    'mb-tracs',
-    'mb/second',
     'mb1',
-    'mb2',
-    'mb649',
-    'mb7',
-    'mb86930',
-    'mba-obame',
-    'mba-think',
-    'mbailem',
-    'mballa',
-    'mbalya',
-    'mban',
-    'mbandaka',
-    'mbangula',
-    'mbaqanga',
-    'mbarnoti',
-    'mbaya',
     'mbbs',
-    'mbd',
-    'mbe/st',
-    'mbede',
-    'mbep',
-    'mbershi',
-    'mbila',
-    'mbit/s',
-    'mbitikon',
-    'mbitikontourism',
-    'mbits/s',
-    'mbiyu',
-    'mbna',
-    'mboamaji',
-    'mboepd',
-    'mbomio',
     'mbonampeka',
-    'mbongeni',
-    'mbonimpaexternal',
-    'mbopo',
-    'mboso',
-    'mboumbou',
-    'mboumbou-miyakou',
-    'mboyi',
-    'mbpm',
-    'mbr-200',
-    'mbuild',
-    'mbulelo',
-    'mbuna-keeping',
-    'mbus-compatible',
-    'mbus-to-sbus',
-    'mbus/sbus',
     'mbuti',
-    'mbw',
-    'mc&rehy;isaac',
-    'mc\'',
-    'mc.osborne',
-    'mc2966',
-    'mc4',
-    'mc50',
-    'mc60+',
-    'mc68020',
-    'mc68030',
-    'mc68040-based',
-    'mc68160',
-    'mc73',
-    'mc88100',
-    'mca/irs',
     'mcactear',
-    'mcadie',
-    'mcadoo',
-    'mcaister',
-    'mcal',
-    'mcalaney',
-    'mcalary',
-    'mcaleenan',
-    'mcalevey',
-    'mcallan',
-    'mcalliog',
-    'mcallistair',
-    'mcallister\'',
-    'mcallister/hibernian',
-    'mcalllister',
-    'mcalmans',
     'mcalmon',
-    'mcaloone/student',
-    'mcanailly',
-    'mcanallen',
-    'mcanenay',
-    'mcans',
-    'mcas',
-    'mcaskill',
-    'mcatee',
-    'mcauley/wardrobe',
-    'mcaulisse',
-    'mcausland',
-    'mcavan',
-    'mcavley',
-    'mcavoy/',
-    'mcbeath/photographer',
     'mcbeth',
-    'mcbeth/shop',
-    'mcbracken',
-    'mcbrady',
-    'mcbrain',
-    'mcbratney',
-    'mcbrayne',
-    'mcbride.falmouth',
-    'mcbride/scotland',
-    'mcbrier',
-    'mcbrierty',
-    'mcbrines',
-    'mcbryan',
-    'mcbs',
-    'mcc\'s',
-    'mcc.',
     'mcc/apc',
-    'mcca',
-    'mccaherty',
-    'mccall-judson',
-    'mccall/east',
-    'mccallam',
-    'mccallion',
-    'mccallisters',
-    'mccalls',
-    'mccallum/producer',
-    'mccambridge',
-    'mccamey',
-    'mccamman',
-    'mccammick',
-    'mccammont',
-    'mccann/civil',
     'mccann/murray',
-    'mccanna',
-    'mccanse',
-    'mccarie',
-    'mccarran',
-    'mccarren',
+)
+
+blocks_68 = (
+    '$$made#)/anderson$"de#!s"%e/286"!h")p-related#)1&ndash;3"-te-controlled"!y!*u&igrave;s#4zcaron;ick&eacute;ho"!2"!3"(achraich',
+    '#"ne$%isone#$rasi\'(minister$"ca#"us",b&eacute;ron#$ango$(vitchers#%benau%%rkins$$ocki$#yns#&chenko#%ellin',
+    '$$tkin#$icon$!e$#mov$$tsch#"ke%"rt$%owski#,lin-maidanek&!a#$naig$"er#\'omirski$"ta#)rications',
+    '#(tchansky#$uski"*c&iacute;a#\'an-like%!o%"us$#rne&!o$)s-arts/us&%tooth%&/green%"es%%proof##can$!o',
+    '$!m$"na%"ce%#tio$%rnese$#tte$#van#%henzo%"ti$#ian$%nikov$"on$!t%%vaart$%vaart',
+    '$!c$#dae%#ryl$%entes%"rs$%ferin$#lia\'!e%"la&"us$"na%$dian%!o$"te##jan',
+    '$(-bringer%+of-the-draw%$that$0/gloucestershire%%knack$"ed%%nbach%"ts$$haus$"ie%"ng\'#ton$&lustre$#man$#nam',
+    '$!s$%y/bad&%lucky#)ocephalia#$raft$$ecia#%tians$"us#)ubrations##y-o$(/matthew$!s##zak")d-o-vi-co#&abelle',
+    '#&denden)$foot%&sdowne#"en%#hof$$ritz#$holf#%icrus#$loff%&w-clee&+/shorpshire##man#%ovica\'!i\'!k',
+    '$"we&,-solidarnosc%#ick#$ship%#ott##vik%%ngsen#$well$#ick%#dge%"gi&!s\'+hafen-based(#ohe\'$lust',
+    '$"ea#%lling##mba%!e#!r#\'ssonhop$!t#!t"$fand#%elyst$!n%&gensis&(pithecus##fed#$kens',
+    '$$ansa$%fahrt$$ikus$*schutzraum$%ullah#%waffe##yng"&g-worm##age$!l$!n%\'o-based#(endbaron$(r-toting#/g/herefordshire',
+    '%(ge&mdash\'(-minders(%racks(\'trolley(#van\'!.\'!d$(nuggians$!s%#ury##han$#mas#!i##mag#"ny',
+    '$!j$#ssi#$sail#+ubriousness$%valos"#han#"ke#.ring-augustine#"ta#"ya"&ichart$!k#"go#"rc$$gean',
+    '$$ella%%nlund$$inho%"to#!t$"el"*j&aacute;n#&inovoc#!o"/k&aacute&scaron*%;cian+!s#&acsian$#mba$$nima',
+    '#(e-crazed%0do-it-all-denner%0perfect-crawford$%heads$"ji$)s-collins$$vics$&warmth#%hansa#!i$"an$"cs$!m#!k$"ed',
+    '&!\'$!s##off$"ji$%schus##sic"#lab%$elle$!s#!e$!a#"ic$"ng#\'la-buys$)ing-stone',
+    '\'$ston$#ula##off##ton#"us"#mba%(tologist$!e%\'r-house\'$mill\'&shirts\'$town&&jacket*#ing\'#ill',
+    '&&shirts\'#ome$!o$\'ricidae#+en-dwelling#%inal/\'"ly&&ries.a\'"ja&$tion%$elle&%scing%#ist%&ometer&&usness',
+    '#%leian%"ys##mie%!s$#ock$!y#)p-bellied%$sums$!a$\'en-knot&+bourgeoisie&\'ization&$pack\'$role$%hanan',
+    '%"ni%$shly\'$ness$&sucker$"us$(y-smooth#!s$$bury$+den/founder(&oxford$#ley"*nacharskii&$icks$"la$!n',
+    '$&r-tick%"di%!e$"te%#ic-((sounding&#ons#!b$%/test#&ceford$"h-&&basket\'%reaks&\'counter&$date',
+    '&\'parties&$room*!s&)spattered\'#top&&to-tea%!.%*/25/10/93//#cde&!a\'%ssist&+zmu/1/11/93*\'2/11/93+\'0/10/93+\'5/10/93',
+    '+\'7/10/93+\'8/10/93+\'9/10/93%&breaks%$date%+eon-parties-!y)&takers*$rain(&_table($ette&"s.%$ing.%$room%%table',
+    '.\'3/11/93$%thime$"us#)da-bululu%\'ijancan%$land$$baek%#eck%#urg%!y$%enwic%/rgaard/sandling&$ners&%quist$#hag',
+    '%!n$*str&ouml;m\'"om$%tofte$$vall$"ye#%eberg$!d$%ville#&g\'arno$0-and-a-half-full%\'bladder%$cage\'&rrying&\'rushing',
+    '%\'imaging%&opener%*puncturing%#sac%&tissue$&awater$#ers$&fishes$%hnasa$!i%"s+$$less$$sful%#han$%worts',
+    '#!k$"ed%!n$$head#*n/chairman%"st$"an$%daidh$"en$"is$"on$%s/tag$"un#&tshire##ule',
+    '$%egova#%zjata"&o-land##ghi$!o##ops#!s$"hu""pa$$lupa$"ra$!s#$ecci$"li$"ol',
+    '%#foy$$scoo%"ku$#tta%!z##fer#&icinus$"ne%\'ization$!o#"ow#$unga$/s/cad&eacute;ac"$qman#"ue',
+    '#\'ch-riff%#in\'%!y$#ott#$edur$#iro$)x-cellent&&decked%"ed#%gainn%"n\'##ida%+ly-coloured##ker$#in\'',
+    '#$leen#$mark#$ning##rve&!s#%vaine$"es"*saka-based$$tian#"by#)ciousness#$erna#,h&rehy;green$"aj$"es',
+    '$"un##iad&!s$+gnan-struck$&nghier$&tanian\'!o#!k$/-harbison-jones$!a$"in#&ophone##sey#\'t-gleam%(in-denim',
+    '\'&spired%&ridden$!a$#ers$%fully$#ige%$naca$$less$\'rations%"il%\'ousness%"um$&worthy$(y/parish#$ulas',
+    '""t.#$aria$$tius#$cher#\'e-books&%ridge%$like%%maker(#ing\'(nuscript&$usic%\'playing%$stop$)aludlowii$"ce',
+    '$"in&\'isation$\'lessons$#ola$%rells%#man%!o#"fi$"ur#!h$"ce$.eran-hymn-like\'$ture&!s$$iery',
+    '##ken%$vich#!o$0n&ndash;brighton%*-dunstable%-/bedfordshire%!1#&rensis#&schine$!k#%terel&#odt$%ichau$#man$#rel',
+    '$!s#%widge$$yche()/cotswold#+yens-jekyll#)zelburger$$hoft$"ke$"ow"%uurve"$v\'ly#$able##ely$!y##ian',
+    '#&sabjav%\'ndambyn#$unga#"va$"er$"ly"#wai#"en$"ru#"um"\'x&mdash#!.#"an$$ting#&emberg',
+    '+&listed+*registered*!s&.urg-registered)#ers)!s$&nbourg##fer$,ord/villager#%icars$$pelt$&urious#*moore-mays#.or&ndash;aswan,%cairo',
+    ',$west#$uria&/ously-appointed,+upholstered%,y-inventions\'&living\')wallowing&#.it&$rest"$ycks#"en#!s"*z&oacute;n#(-ardiden$-saint-sauveur',
+    '#"em$$rner##hin#"ia$!i$"ra#"ma#&uriaga#%zasco$!u!"vg""i.#"ng""ls"!o',
+    '"\'bnotupb")c/mwc/uwc""gr""is#%thout"%owski""ra#!s"$s-25$"40&"gx"&t-down#!h""yd$#awc',
+    '#%tgoed!+x&ndash;dkt)#lxi"$-550#!6#"85$!6#!x"$1200"$200g"$300b#"2m"#400"#800""90',
+    '"#vii"%xiiii#$viia#!x$#iii%!v$"vi&&i-viii!"y\'"&-ra-ta"\'aenidae#(ll-smith#!n$"ne#!s',
+    '"&bardde#%barde#$elle#)rand/cork##urn"(cabettos("us$%enids$!n#%ensed#&h-folk$,ee-flavoured$%nidus##ius#$lear',
+    '$$pene&%rsica%$hyta%\'odiates%#sis%$tera$#rea%"ys$%sidae)+/pisauridae#*ra-control&#mix&#top",dan/burglary#,brook/forest',
+    '#%ekker#-ian&amp;sharp%#rd.$"te"&e-kook#$fouk##lls#!r#!s#$wood"!f#!f"#ght"$ing-&$down',
+    '%#_on"(kabettos##eio$$wise##ken#&ourgos##tos"!l#&ehaven%#ill$\'s/coach#%sland"!m#2e-disease-carrying$%stock',
+    '#$inge&)ton-based*(yarmouth#$naea$(ocryptes#,phadenectomy%#ees%+o-granuloma\'%paque\')reticular&$ctye\'.yte-activation*+/lymphocyte+)phagocyte*!r',
+    '/#ity&&edemas+$tous&*ma-bearing($niac\'"es&"na$"us"&n-boss$\'players##all$)s/student#"ce$\'h-bages\'%losse',
+    '%\'borough&#urg%#ers&!t%$gate%#ian&(ng-party%#mob$$ombe##dah$\'en-bell%$wode$!o%(n-skeggs&&/david',
+    '#%eburn$$doch$!n$$sack#$gdal$%sjons##ham$$urst##ley#$mart#*n/festival%)organiser$"es$%field$"ie',
+    '#$sted#%woods"&obands#.n&ndash;geneva$\'/invest$$esse$!n%$esse$\'s-based%(/amateur&+oxfordshire%2hall/herefordshire#\'philate\'\'isation##sha',
+    '#%piatt"#rae#(e-backed%&player%&string$&tailed#+ic-skimming\'$tyle&\'writers%"ae&&l/aria%$ized%/o-philosophical\'$xxxx%*s-on-cards',
+    '"-s-his-arg-arg#!.##188$"97##23\'#"52#"78#"ak$%nders$%rides#%dexia#$egus$$ight$&nkoist$\'rgische',
+    '#\'ichitum$$kles$&machia$.ne-to-arginine$\'strates#*ocompounds$)some-like#%teria#"yl%(-proline$!s"&tchett#"es#%hcott$&raceae',
+    '$$gius##les##ons#\'teltons$&leeton&!s$#ons$"yl"&ubimov$#lyn&!u##dov#(s/in-car"%veden$!n',
+    '")willingun!$z.95"#130""ap"!h"!s (m&aacute(";c),irt&iacute;n)#nes)-ori/aperahama)!s#/circ;ch&eacute\'*!e)&unnais',
+    '#-grave;connais#.macr;n&amacr;s((thichaur$#p;j&!r&#tis#\'tilde;e#(uml;dler\'(kel&auml(!i\'%rchen(#tha"-commat;keller"(divide;p#%ollar',
+    ')%25.00)$5.00"&eacute(&;biame)-d&eacute;cins*%ecine.8s_sans_fronti&egrave;res*-i&eacute;vale+!a,-th&egrave;que+"co+$ocre+\'tations,0erran&eacute;e\'s*#ous',
+    ')!e*.di&eacute;vale*$rbes)$gret))haignerie,&ngerie)&langes*#ine*$odie)(morandum,#ial).n&eacute;hould*$ages+"ka*#ier',
+    '+(lmontant)$pris)7r&eacute;ville-cuckmere*!e*$ibel+%court+#eux)\'taboles+(language++mechaniques*%ecine+!o*$ier.-!s*$raux',
+    ',$pole)$zenc*$idon#1caron;ln&iacute;k$-irc;l&ecirc;e#*grave;tais"@iacute&scaron;e&ncaron;sk&aacute(";a),che&aacute;l)$guez)"le"-lsqb;ust&rsqb"\'mdash;f((moderate(!n',
+    '"(ndash;10("de(!n(!y"-oacute;squera)!t#"gr%(ave;nica)!r#(slash;re#)uml;glich\'#hne\'(llendorf(#zer\'%nchen',
+    ',(gladbach*%sberg\'#ser\'$tley\'(we-class"$sup2"%times"0uacute&ntilde;oz(%;gica)#mia)$sica#&circ;r#\'ml;ller#\'uml;cke\'%eller',
+    '+#see\')hlenstube),h&auml;usler*#eim)(talperle\'#koi\'\'lheimer(+ler-hermann,\'ruinart\')nchen-frg*%inger(#ich()sterplatz(\'zberger\'$ssen',
+    '"*yacute;atn)5vatns&ouml;r&aelig;fi#(uml;vatn!+\'&egrave;st"!a#*ccompagner#\'ffretto#&lister#"ma##rde#\'s-tu-vu##vez""ba$#iki$"la',
+    '##oom"$caig$!r#\'ortnick"$dame$%rlin\'#%onald"\'eboutou#$cuse#&xcusez"&george#&impsey#\'ladbach##uel"&hencha',
+    '##idi"+interrompit""jn"(konochie"%lady.$#ren#$ords$"ve"#m-h#&adzulo#\'ukindia#\'wereria"&nicoll"&odiate#"ld',
+    '"%saion#%ieurs#%leeve"&tavish#%ronix"&uccida"$wife"!y!$(5)b".chandrasekhar)"\'di1/dt)""e)#(rciorvm)"%ille)#\'ssions)',
+    '"$x-a)!)********r"0a*s*h/everything!"+5"!6"$ajor"!m!#-10$!1#"11#!7#%9-led#"a2""20#"9s',
+    '#!0""45#!7"!5"!6#"0s"#700#!9""88"!9#!s"#ary"$bits"&cresol#!u',
+    '""ed"!f#"-i#$3690#"ix#%uture"#g-j""hm"#iii")l-c-k-e-y##aws"!m#.-m-m-m-m&mdash\'$andy&(orrissey',
+    '&%tthew%#ind&"ss\'*understood%$ovie%#uch&"st#&anners$%rried%\'vellous#%emory$!t#)icrolight#(onstrous%"th',
+    '$"st$$tion##uch"#net##f-h"!o#&-u-s-e$%w-s-e#%ct-11&!2#\'riginal""ph$#ase$\'enylene#$ower',
+    '#"ig##ome#$tate")tenseless\'!s#$hree#*wenty-five$!o"#u-m"$ways#$ords"!x"!y#$-y-y"!z',
+    '"#23d""40""50",6&ndash;235c"%a./ed$$a.f.$"b.$!d$!m$&r.r.s.$!s%".h"#b.h#&ateson#$lake',
+    '$$s.p.$"u.#(azeneuve#$hir."$d.j.$!s#\'erhalli#$ixon"$e.d.$$h.q.$!t##ng.#*xasperatus""f.$&p.h.m.',
+    '""h.$"k.#%ayton"$i.\'s$!6$#c.k$$e.e.$$h.t.$"l.$$m.m.&"s.$&r.a.s.#(nst.p.s."(j.a.r.a.$"s.',
+    '#%uris.")l.forster"!m#%.p.i.#$inot#&orgner"!o#".d%!.$"i.$%match$!s%#.e.$"t.%!s',
+    '$"s.#$atel#(hil/dip.#&ollard#!s#&tashne"!r#%.c.p.&"s.$"d.$"j.$"m.$"t."!s#$.i.l',
+    '$"p.$$r.f.$"u.$"w.#\'harwood#$mith#&picala#!t$#eed%&inmetz"$t.d.#&ardieu"!v##.o."\'weedall',
+    '"!x!!/"#101"!2"#and"#f/h#!t""hr"#sec!"03!)1&ndash;9"#-a1"./70/15/11/5/hl##a52"$00()',
+    '#"20#!7""11#!6#(=hackney"$2001#"19#!6""33##ko7#$mp10"#500#!5""60#!2',
+    '#!6""80#"80$!9#!9",9-democratic""a2""ne"!r!$2/m2"%0(uk)#"0x#!2#!a""14',
+    '"#5\'s#$/m23#!7""68""71"!9"!d!$3030"$14dd""20"$4839"!r!*4-corridor#!s""/5',
+    '##m40#1swindon/wiltshire"$0/m4$,warwickshire#"31#!c""18""32"!4"!9##4tw"$plus#!m"!t"!y',
+    '"#/03##114&&.15.12#"50#"m6%$/m40"10/gloucestershire""10##959"$2062#"22"*5&ndash;73"!8"!j"!s',
+    '$"60"$/m56"$0269#!s"#101$!3$!5$!7$!9"$2-a1"!4""5s""a1!(7&flat;5"#/m6',
+    '#$/m71""b9!%81326"$4088"$5328!#90s""30$!3##123"!4"!9#!5$"64#!7!!=',
+    '"#0.3"$make#%otion"!t!&_as_it!+a&ccaron;va#*dollar;ana#+iacute;lson$+circ;tresse++is&eacute;e#*racute;thy""\'a$#den$"fu$#lim',
+    '$!n$"se##dan$"ow#"es##lul#\'salaama"%(ed)s"#-am#!j$"or##ray#!y"!1"!2',
+    '$"an%&rzipan$#rgh%\'vellous#"ck##ike##kin#"le$"im##mar$"en$&trasna#-n/strathclyde$)chessterr#"rs',
+    '#%sberg$"ey$"ia$!s%"en%!i$/tricht-friendly(#ken$"um#"ts#\'zel/emi\'&french&#ian"#b13##419',
+    '%#aft#!b$%erley$"ot$\'s/flood#\'elingwe%"la%"ys$!n%!a#$gate#"ie$"la&"is%"le',
+    '#%ledon#+oko/nachola$"te$!u#!p#"ro%"uk##son$!y#$thul#"us%!e$"za#!y".c&eacute;doine',
+    '#!-$#fan$&gregor$(in-a-box$$leod$)on-unixes$%using#%/next$"pc##386##650%!9#!a$&-skill$"be',
+    '&!r%$rely\'"ry$$dams$"ig$$ldon%&eister%&isters%#len%+pine-downie$!m$%nally%#der%&licada$%pagal',
+    '$%rdles%*i/speaking&!e&!s%"on\'$esia+*n-tropical\'"ic(!s%!r%#ten&\'hur/tax\'2yism/librarianship$!s%%kills',
+    '%$lay\'(#ish$$vity#%beath%$oden$&raynes%$ides#\'ca(2.2)%&/speed%%lmans%!m%$rtie\'#ney%$ssar%$vity',
+    '%\'iavelli&!s$%laren%#eod&+sfield-born%"im$%onkey&\'lomaire&&nachie(!l\'%ochie&%ochie%(rkindale&%micki&(quindale',
+    '\'#nor&#sin$\'ullochi\'"um%#mal%"nn%(rrencies%%tchin#$d615$#ill$%oland%$naid\'\'ld-ross*#the*&wright',
+    '*&labour*&office+%xford)#ite&$dald%#wal$$raft$\'ubhacon%#ffs#)e-bearers%$like$&/carer$%achen$"da%$oine',
+    '))-slovenia(%ensis(!o&!s$#lli%$veen$&nglish%#roe$!o$$rate\'#ion%!c$#voy$"ys#&fadden',
+    '%%rland)(e/author+&oxford\';ene/paediatrician/radcliffe%$yden$"in&#all%\'sheries$"oy#!g$%abhan$$eagh$(ilchrist&-l-eain/sorley\'&ycuddy',
+    '$\'oldberg%&nagall$-regor-hunting)!.)(/finance&$igor#"h\'$#-70%(for-macs%&on-mac%!u$#.70$#110$"32%"55',
+    '%#kos%"le&!i\'!k%$mudo%!s%"va$#een%!j%!r%$ster%!t%"vo$&guenga$*hapuchhare',
+    '+!s%\'colated%!e&!n%!k%#lid%!m%(nability\'#tor&+e&rehy;like\'#(s)\'&-aided(\'breaker/!s(&chisel',
+    ')$rawn)"ug(\'feeding)&illing*&nished*$tter(,independence+%ustry(\'jostled(%level(#man*$rked*%sters(&nature((operator',
+    '(%paced+#ing)&ressed*\'oducing($room((selected*!t+$ting)#hop)\'mashing)(titching*$ored)(ustained(%teeth*%nding',
+    ')%ooled)$utor(&usable*"er*#ing($wave)0ith-a-difference)$orks\'&/faxes)&itness(&system\'#man\'#rie("y.)*/equipment',
+    '()/hardware&#ian&)o-facture\'\'facture\'\'logical%"ra%,smo-oriented$%meter%"ud$$ness%"ik%!o$)o-culture&)debunking&,mean-streets',
+    '%$bane%#man&\'isogyny%!n$%pelah$(rahanish%"ee$!s$\'t-wagen%#eld%&mensch$"we$"xl#"ia%!s',
+    '%#rra%!t$!i$$lroy$"mo$%ndeor&"oe%+nes/phoenix%2tosh&mdash;despite0%sadly*,ndash;quadra)+-compatible*&novell)!s&*yre/thames',
+    '$)ulevicius%#nas$#vor$"zo#$kaii%!l%$ness%(y/dennis\'%royal&!e&&public$"ed%!e%.ith/campsfield%"ms',
+    '&)zie&ndash)&-style)\'/asylum**consultant*)solicitor*%women%%rdhuj&*el-fishing(#led\'"th&$rell&#sey%%son-a%"yi$%faden',
+    '$"id%)e/british\'(hereford%%nlays&-tosh-generics+#ish+(overcoat**/barnardos+)historian$\'leworth$#nay%#ess&!y%#obb$!o',
+    '%%wiack(!k$&uandji$!y#(lachlans%,gan/emeritus&#gan%$ines%"nd&)e\'s&ndash\'&-daine%+ren/bushley),crickleyhill)(fairford)*gloucester',
+    '*\'ortimer)+silverstone*(nowshill)\'tetbury))ullenwood)(wavendon*(ollaston(!i(!s%&ughlan)"in&#ren%%verty%#yne&!s',
+    '%*an/against($home&"ry&"vy%$ish\'%)nnan/crew%(od-clark\'+/tewkesbury\'$ganj$\'iammoir$"ou&%ghlin$#ura$#ver$$yvie',
+    '&#ons%%namon%\'rneymum$%enemy$+illan-style)!.)%esque\'"en\'#ian$$urdo#\'naghton%"ir\'\'-wilson%#mee%&ughtan',
+    '\'+-schwendler%#ssa$$issi$#ott%*w-inspired$&uggets)"ts%%lties#%onchy$&phages$#ris$#uba#$pack%"ge$$heal',
+    '$%orrit#\'quarrie#)racanthum\'#rpa%#ild%$ndra$)eadophile$!i%/tchie/president$*o-approach\'!s&)budgetary&+circulation\'&oncept+"rn',
+    '0#ism\'%ycles&)decisions&\'effects\'*nvironment1"al\'*xplanation&-geomorphology&*historical&-institutional(*tellectual\'%ssues&(language.!s&*management',
+    '(&lecule&(national&,organization(&iented&+perspective\'*hotography\'\'lanning\'\'olicies&&rather\'-edistributive)&uctive(&gional&(scenario\'%ocial(\'lutions',
+    '."es&(theories+!y\'\'o-micro&%world%&/micro+%fungi%+albuminuria%\'bertson&\'icyclic&\'rachium%-canthorhyncus\'&pacity\'#rpa&%hirus',
+    '\'#sms&$ycle*!s\'#les\'$stis\'#tic%#don("ia%4economic/econometric-$ally,"st+"lc%&faunas&$lora%+genitosomia',
+    '&&nathus&$olum%,invertebrate%&lichen&#oba%%media\'#ric&,ind/paracomp&$odel%!n&%ectes&"is\'!x&&odules&&uclear',
+    '%-palaeontology&+hage-colony+$like+$type*$sand)!y\'+ysiological(#tes)"ic&$ipus&&odidae\'\'litical\'&rosity&$tera&"us',
+    '&&rhizum%%scale\'0opic-microscopic&&iphuym&$omia&$toma\'(ructures\'!y&%ystem%%thrix&$idal%$urus%(variable&/ision-component$$uari',
+    '%"by%"ra&"us#(smythurs$\'paunday$$ween%$iney#\'taggert%!y$"ec%#rin$&homais%%rifty$&ophage$"ro',
+    '$%gnaga$%laria%$inea&&pennis$#mba%$eran$#rdy$#ser%$pana##van$#ean%!y$%inish$&urrich$"yn',
+    '$&hinney$&illiam"/d&eacute;casses$\'mdash;i#)-dictator$(innocent$$keen$#max$%panic$%scene$%woman#*aba-dhiban%"cd$$dayo%!h',
+    '\'$kira$$leen&#ine$%m/sir%"ba%"e-%\'oiselle$#ule$%waska))-victoria#%bouli#!c#$dala%!n$!e',
+    '%*r-coloured&&market&!n\'0/gloucestershire&"ty%"ss$#ies$"le$#ors#)e&mdash;a+"it+#see$%-easy%.for-fittipaldi)(industry',
+    '*!v%*in-england(%japan(+the-fifties%$over%"to\'&-moore%%wines$".n%$they$!/%(repaired%*surcharges$$:him$"_a',
+    '$&casses%#hie$&irense&"os$$jski$$lade%%eines&"ne%#lin$(mosielle$%raner%"na&!o$"st$"th',
+    '#%galen#&hubani%!c#&i-gras$"da$#era$&gan/un%"be$&kizela$"ll$#nah%#ika%"ka$#ran$$sion',
+    '#$jber$&leyoun#$keen#1ley/herefordshire#!m$#ans%%rston#%ness.\')/finsbury\'"es$#ick#"ok$)nna-whore\'!/()magdalene',
+    '(&warren$"od$$rsky$#ura#+ras-checked&"ah(!s$"ea%$gali%&porite%!s&%field$1i&ntilde&aacute;n%"ck%0d&mdash;valencia',
+    '\'"la\'&oviedo\'(palencia\':saragossa-barcelona-french(&eville\'(valencia%(gal-wise($icon)"en)#sms*$tico%+l&egrave;ne&*e&ntilde;o0!s\'#nos',
+    '$"on#\'sebakke#%urese#"ya#"zi"#e\'n$!r#%-geri$$west#!a$$nder(!s#%cenas(%-like#!f',
+    '$#awa$$hong#%lduin$#kar$\'michael%#ore$&stroms#&nadism%!s$"dy$"ol%!r$"us$%while#%rdref',
+    '$!e$#ten\'!s#"se$$laan$$mawr$&newydd$!t%"ag&!s%#lin%%ranza\'#zgo&$icht\'"no',
+    '$(yrhandir#!t##yer"+ff-approved%%drawn%)supported$"ey$#ick\'#ing#!i$)a-busting&*controlled&(infested&$land&#run',
+    '%,intersecting$"er##ole#$rash##tir"(g&eacute$(oacute;n##.ct#*a&ntilde;a$!-$"di$#ine$$laes%"di%+h&atilde;es',
+    '%!y$!n%!a%#gue%"ja$!r%"et%!y$$sin.$!t%#ama$,zine&rehy;so(&-level)%pages($.txt',
+    ')$good)(national*(ewspaper)&sports($land("s-##bag#!d$)a-len-sis%&lenism(!s)$burg)"is$&elaine&%enian',
+    '$&llanes(#ica$#nis%)ta-bladed($pink((splashed$&rramov$$ship##gay$(ie.anger%#nas%#ora$*ot-bearing\'%eater\'(infested',
+    '\'\'tempted$"sy#\'haberry%#rbi%$weer$)eramourne&!u$+n&eacute;eh$!o$$rebi("an("ns(!s%#ibi#&i-blue',
+    '$!a$"c\'%"-2&&holder&#man&$rich&(wielding("pe%-/supernatural%%aally&*l-mythical()religious\'$ized\'+ly-animated*\'induced',
+    '*+transparent\'(rrealist%"ed%(ian-like(!/&$enne(!s%#ker%!o&(-medical%\'station%#uts$!e$&ficent$"ge',
+    '$!l%*ton/oxford$#mix$#que$#sch\'!e%!t&$ates&$rale(!t)(e-father)#ura\'%eates(!s\'"is',
+    '##laj$"en$"ic%#one#*ma-chamber&&filled&$like%&static$#oed#*n&uacute;s-!s$(a-ficent&&series%!e%"go',
+    '%!n%%phall\'#one%"rd%-tes/communist&"ic%#vox$$edon%!r%&sia/kg("ns\'(te-bound\',um/aluminium)!s&!s',
+    '&!.&%arium&"es&!i\'\'c-field*$orce)*levitation)&pickup),spectrometer+"in*&torage+#rip(-ally-confined\'#ser("m.',
+    '\'#zer&,o-deposition()resistive((telluric\'%graph\',hydrodynamic\'\'metrics\')resistive&&s-pole&"te$,i-freighters%!e&!r%)fication.(!e',
+    '*\'t-brain(&iently("us%$lens)"es&(oquently%"ny%!s%\'togorsk&%udine$!o%&clamps%+electricity%+lia-painted%#vox',
+    '\'&trasse#!o$"da$#nia$&o-like$#rie$$wans##rar$"ee%!t%!w$*icalistico%"ll%!s%(tte-like',
+    '\'#ian$%utsch#"si#&uelone%!y$#ina&%danao&$ness%9re/chairman/environmental(/gloucestershire\'\'sbridge$"ll$"ra$!y##yan',
+    '&\'isation&"ok&&polany")h-rye-yah#&a-yana$)balipuram%"ir%&ouddha$$deva(!n%"hi$#jan\'!.\'"ga$$kala',
+    '%!i%!s$%madou&!r$%nagar$*raj/oxford\'!h&!n&$shta$&sangha$#tir%#mas$%vihar&!r$"wk',
+    '$2z-i-melli-i-islami#(bobollah%"ob$\'ubollah##dav$+i-al-kalisi%!s&!t##ele$$nder$&shkali&$wore#"ia$"da%"ol',
+    '$"na%"da$!r%!o$\'yangana#%jongg$"ub#!l$+alengangeni%%thini$"im$"ke$$mann$#oji$$zeit',
+    '$$edov$#uda&#iya#!o$+gany-bodied*$rown)%cased)&finish)$like)(panelled)*reinforced)\'stained+\'iffened)%there)(veneered',
+    '$$meds&#tan%#med("an$(n/united\'!s%!e&"y/%"is$"od$!r%#ais$#sky$%tella$#une',
+    '$$atta(!s$"er$#oof$!s#!t$#ani##uad$#med$"wa#$wali#\'yendrah"+i&iuml;stro$,ndash;chiang*#meo',
+    '$"no$!r##bai#\'d-child&.um-housekeeper%9of-all-work-cum-nursemaid%0turned-chanteuse$*/companion$"an$$bury$%croft$\'en-aunt\'$head\'&mother&%bower',
+    '&$form*,-bra-moulded&*hair-trees\')ead-based**/berkshire+\'windsor*!s&&liness$/ford-charwelton$#ing%#que$-ment/champion)#hit,(-and-run$,s-in-waiting',
+    '*%based*(hastings)!r(#ian#+er-maercker$#sty#!f#%grait%!e%"in#&jstral##ken$&ovskis#"l\'$)-armoured',
+    '\'!x%$clad%(enabling%&fisted%)in-offers\'*terception%(ordering%$room%&trader%$vans$\'/e-mail%)marketing%#the$#boy$%erism',
+    '\'(villager$%ing:2$#lac%!e&#fer&!t&$zais$#men$%order$\'servers%\'hotting%%orted$%train$!u$)workspace',
+    '$#ers$$ings$&onudes%%rable%#una$#una#.n&rehy;tenance$++subsidiary$&-cabin&&hancer&$lean%&danube%%floor%%house%&memory',
+    '("ps%%river%$stay\',ore-resident%%wheel$\'/former$#ace%%tined$$beam%$oard&%chers%%ranch$&course$$diff$"es',
+    '%)rame-3270*(capacity+)ompatible.$uter*&driven*%esque*\'killing*(oriented*\'related*(specific*$type$$guet$$ichi%"er%*festations',
+    '$+land-backed+#sed(!s%$iner(!s%\'y-black\'&muslim&(_because\'"in$#men$(obstacle$\'reachan$#s\'l%&-borne&.communications',
+    '&)data-line\'&erived&)frequency%#ets%%heets\'!t%$link%$tone&(ream-car*"er,!s$,tain/improve(\'ability(!e)(d-school',
+    ')-ce&mdash;such+(-centred,$only+!/,*carpenters,*inspection,+lubrication,\'odd-job,&repair,\'service,%water\'"ce\'"ir\'"ue%$heme',
+    '$%wheel%#ood$!y$)z-kastell&(neustadt#"on%#chi$$rano%"em&#scu%!i%"um#"po##rah$#ian',
+    '$%oescu$#wen#$sang$"by$"el$%hofen$%kogel$)on-fortes&$fort&%rouge&"s-%"uk$$ters%$lins%!o',
+    '$#res%#ika#"wa$%eisse##ze-&%based&(coloured&\'growing&&stalks%"ls$$lish$"on"%j-lis#).-general$#gen',
+    '#!9#$acca$$hual#)da/polish%#nek#"ed$!l%"lo$"rs$&statis&!e&$ical(!k(!s$#ure',
+    '#"hi$#ola#$irel%$ouge$$thia##jal#%lis-i&%ro&gt#%ma-ye$.ua-ul-baharain#!o$"la%!o$+r&rehy;domo%!-',
+    '(&tegory&\'element&!f&!g&$like&\'must-go&(reynolds&\'selling&&winner\'%recks%&_cause%)can-style%#ish&(t&eacute\'0arian-consensual',
+    '(!\'(*-change-90)&muslim)%ruled)\'serbian(#423%%watch#$stey#\'uscules""k\'##a-b$%bansa$#iwa$$jima$$kopi',
+    '%!e%"la$"me$#nji$\'pansget$%rczyk%$ezos%"ii%\'oupides%!s&(k&aacute%%tatos$&sthien$!u$$weli',
+    '#-e&lsqb;s&rsqb%-rehy;or-break$!\'$#(s)$%-\'ere%)and-break)$mend%)believing%$from%,haste-slowly%,it-big-quick(2up-as-you-go-along\'$self%.the-best-of-it%\'up-free',
+    '(\'stained(+the-numbers%&weight%,your-mind-up*)own-cards.*revolution$$/buy%$sell&%upply$"_a$"cd$!d%#isc%$onci\'"es',
+    '$"l.$\'r-break%$/les%!e&!k$\'s/debut%!t$\'weights$!y#&ghatho#(hachkala%$lina%$tini$$ilas$&ostive',
+    '%!v#\'ilwaine$#nda&"ye%)g&rehy;up&#-do\'%plans\'&robots\')sniffable&%/mend\'&taking&"_a%!k#*kabaerbuch%!h',
+    '##off$#ssa$#uti$*vsk&yacute$$wecz%#ski#)ram-ebeid&%allah$!i%%dakis%&gialos$+omolekulare%!n%\'teichos#!s',
+    '&#ych#$towm\'!s#$ueni$#lla$!m$"ra$!t%!i#$weto##yng"5l&iacute&rcaron&uring#/-administration$&de-mer$(practice',
+    '%)fantasies$"ba&%ricus\'!s$%caang%$cans&%ensis%%hians%%oides&\'logical)!y$(djustive%-ministrations%#oum%&roitly',
+    '%*asy/monima$#hat$\'i-issue%$anus%$nine%"ta$#kai%#off$%leuca$$ndra\'!o%"gs%$szak$&powski%%ropic',
+    '$#ret%+ia-infected(\'related(,transmitting\'%/aids\'!n&(ological+"st%#mie%#tan$!s%%henko$/thion-resistant$+y-dominated&&korean',
+    '%-sia/singapore(&n-born+$uilt*&french*&korean*$made*(yugoslav##bak$#ern$"ou$!y#$case$#hus$"ic$"ky',
+    '\'!m%*m/director&!s%(nditions&&tented%#rps%$vich$!y#&derton%)velopment$"in%)stributed%\'ves/sri&#ica$#oum',
+    '$#red\'%ssons#0e&rehy;dominated*&female$"\'s$,-appropriate&&s-norm&\'udience%\'bashing&\'rooding%*chauvinist/"ic&)ontrolled\')unterpart%\'derived',
+    '%)employing%*formulated&\'riendly%%group%&headed%(inspired%$line%(mediated%\'pattern%$rich%)servicing&\'ounding&)upervised((remacist%$talk',
+    '%&worked%,y-chromosome$\'/public%%white$#ate$#cki\'!s%"on%#zek$%detta(!o%$icta$!e$\'faction+!s',
+    '%$fect%#ica\'"es&"jt$$gato$"ic$,jovsk&yacute$#kat$$ldil$%nbaum%!e%"ko$!r%&eachly%%ische',
+    '$(s(18-23)%(:females%"ki$"ta&#ble&!r$\'volance\'"en)#ces$!w#)feasances$%iance%!n$\'omation%"rd',
+    '$"as$%onkar%"od%%rzata%$sian$"re$#udi#&habile%!l%&m-dale$%erbes\'"ie#-i-niger-libya$&bonlwe$!c',
+    '&!s%!h%,ious-looking)!.$.elegaoifinance$%galig&"wa%$nent&"ly$&k-noor%!i$$nche%"ee%!i&!n',
+    '&%vskiy&!w\'#shi($kian%#ski$"ta$"za#$jers#!k$#ele$)in/rhodes%!t$%owich#"la%#bar',
+    '%#ret&!m&!t$\'ee-root%!r&"in&!y%)t-prevost\'\'stevens&!.&#ier\'"ng$%iaris%!c&!a',
+    '\'$rjun%)marachchi%\'nckrodt&*son/glider*.pharmaceutical$\'obaudes%&reddus%"um$"ya#+m&eacute;dy$"an$&berget$0esbury/wiltshire$%green$%sheim',
+    '#)occlusion$*dialdehyde%&orants$%ja-on$+litrazowych$"ma$&namide%"es&)y/manager%%ovski$$prim$\'ry-like\';towers-swallows-and-amazons$#sse%-transk&yacute',
+    '$!y#%pensa%)rformance$\'highian$#igi#$sain$(omething#&t-loaf%\'milling%%sacks%$vats$1a&ndash;gibraltar%&-based&(destined%!s',
+    '$#by.&#ish$%easer%&d-milk%!r%(se-owned$&houses$#ies%!n&#gs.$$lake$(odextrin%\'n-based%"se$/packer/cleaners',
+    '$&y-sour$$zman#"uf$&kutila#"va%$ceae%#gna$)ern-based\'%.over\'#ian$\'iflorum%$llan$$olti#$yali$$nkis',
+    '%"rd"(m&aacute#&\'zelle#"a\'$)-terribly$%dayez%"on$!h$&kaslos$,lik-ul-amsar%#una$"me$"nd$#rev$)tsashvili',
+    '$#our##dou$$udur#!e$$lles%#uks$%rtina$"tz$"ys##iko$%llary&#ius$$nski$"ta##mae',
+    '&&ogists&$s(2)%"ri%!s$#ele%!n%$rial&!n$"ie%%llary%"si$%ology%$nite%)th-hunter(&length',
+    '&#hus$"y\'#!n#"oh$"na$!r$$ties$!u#%phela$!y##rak#!y"2n&eacute;-er-hroek$%mdash)#;he',
+    '$)ndash;ape*\'machine$*rehy;power)%snake#$\'ger$\'s-style#(-\'scared$"21$%about%#ged%"ir%&ltered%-nd&rehy;child\'$-dog$$bats',
+    '%$ound%#ull$\'centred+$ness(%uries%&hester&&ildren%$razy&%eated$\'damaged%&ecades%"og$&enough$%faced%%reely',
+    '\'#end$(gathered%(ets-girl%&odhood%%reedy$&haters\'#tan%!e%#igh%$oles&#rse)!s&(urs/days$(in-a-pub\'&charge',
+    '\'*the-middle,#oon&)festation&&spired&&vented$\'killing$$less%&ifting$&manage*!r\'(ipulated&$rked)!r%&idwife&\'lliners',
+    '$(of-straw\'-the-pre-match+&series($oday%%n-man\'&the-go%)rientated*"ed%$wned$\'pleaser%&owered%$roof\'"wl$#rem$!s',
+    '%\'ervants&!t%%hadow&"ow%%layer%\'melling%&talker&%ealer)#ing%\'ubduing$#the\'+-instrument%$raps&\'undling%#ype',
+    '$#was%(elcoming%$itch%&orship#$.and$#but$%hovis$!i$"no$#the$#who#\'/89/141("57$#and%"pe',
+    '$*chimpanzee%*liff-from-%\'omputer$\'dolphin$+environment$3fertile/infertile/a$$hard$%loose$&madman&%nkind$%shift$#who$%years#$:new#\'=author',
+    '%$ling$#des%&gement%"on$"fi%(ucturing$3g&rehy;ing-director%%ament%"e\'&!-\'%touts&"d.\'"_a&!m\'$ent*',
+    '+&babble,%iased,$oard,*rainwashed,+y-agreement+$care,*onsultancy.\'trolled++development++information+&minded+,remuneration+)swindling++to-minerals+)workforce',
+    ',*xamination+$they*!/+.administration,%rcade.%hives-$tist+&career,&ontrol+)designing+\'finance+.organisational+)personnel+%union+&worker',
+    '\'#net&"r\'("ud\'!+\',-bureaucrats(-entrepreneurs((in-chief*+ternational($only)$wner($team))o-manager)#ype\'$.but\'*/archivist',
+    '((calendar)\'hairman)$oach*"ok((employer(%honda(#key(#man+\'ageress)"vs)!y()nominated(%oxfam(\'partner)=rincipal&ndash;employee/agent',
+    '((randolph))esearcher(,shareholders(&warden\'!0\'#_at("in\'$ess0\'$ial/+*specialist*+ly-directed*!s("ng\'$less\'%s-get',
+    '(*/employers)&owners)+supervisors%!h%#in\'\'/g&rehy;director(&-owner$$hans$"ia$!l%#ula$!m$%ndhar%"ge\'!r',
+    '%"ny%"ts$$resi%"ov$"sa%"es&$vich%"ik&!r%!o%"se\'!s%"ty$$t=10$&vendra',
+    '$&yenkov##baa$!u%#ron##c-y$*/arse/pool%%baggy$&ehster%.tter-hartshill$!h%#ago%#eng&!s\'-ter-blackpool,#ury',
+    '+&london+\'salford,(heffield4%/wath,(outhport*!/+)acid/rave+%paris*"ed*#ism*!s&"te%&icourt&!p$#ino',
+    '$$lark$%owitz$%sters$"ub#?dalay&ndash;heho&ndash;taunggyi&#ong%)n-hidatsa&!i&"us%*rin-collar)$like)(speaking($fish%!t&(-grancey',
+    '&"e.&#ivu&\'oriness%"ys%"za$$eans%,la-buthelezi\'!y&-brot-plotting*!e&&ieu-la&#ker)!n%%ments%\'r/drama',
+    '\'&/kenya&\'son/age*&mother%%velle&#ill)"e.**/aylesbury+0northamptonshire$)ible-like%"ch%!e%$kova%#nka$#jak%!i',
+    '%.ebrot-plotting$\'ocellos%"la&#in.(!a("es%"ra$%rakes\'!i&!x%#els%#ian&!l\'!l(!s',
+    '%"ca%#ell$"ys#&e-like$%aters&#ing$\'childis$"ge$$kbai$#lis$"nt$&ouvres($ings%*verability&"re',
+    '%!s$#sse$#tti$+uverability("ed$!y#%falut$#ord$$redi\'$onia%#ini#%gaing%$nate&\'ese(ii))!-',
+    '*0aluminium-carbon&\'iferous%%zeyev$$eant%(l-wurzel&\'wurzels%"r.&$ship\'"ta$$hutt$$iamo%$fera%#one$)kalaviraj$#ler',
+    '%"ou%!y$$oldt&!e%"ne%!s%&ustine$(raphique%)ove-bound$%ueira%$rian$$wana\'!e#\'handles%$sset',
+    '*\'english*)hartsdale*$like)\'isation*#tes)!s)%ville$#ede$#ica%#lad%"re$#old&(e-covers%#od\'\'!s',
+    '$$unts#$iac\'&(-haunted%#kis%"tt$)c-satyric%#amp%&haeans("us&#ees&\'ordions%%kpore%"ou%&ulatus&+re/pedicure',
+    '$!e%!r$\'fattura%&est_in%&olding($ness$"ka&!s%$ins.$#lan%#ius%(la-bound\'!s$!n%!a',
+    '%$ique%#ski$#ola%!n%!t&!s%&vskaya$!p%,&rehy;ulated%"le%#ogo%(ulatives&"ri$!s$&tarian',
+    '%$oban%"ui$!x#"ja%"ck%$ntja$"il%!t#$kaba%!n$$elow%!y$%iller%$nd-s&"en',
+    '$#uba$"we#(laughter$#ess%&y/stud$#ier%"ft%!s$\'y-sized#&metric$\'ountain#/n-whitney-white$)/chairman%&mother%(speaking',
+    '%$west$\'afields%#ger%$mead%!n%"ri$$ekin%*r&mdash;in&+--prompting\'"in\'(of-being\'%to-be&!7&$ians&$less',
+    '&"s.\')/director(&warden%"si%%ville$%hardt%)eim-paris$\'iagment%&kizing%!n&-g/oxfordshire($team%)sh-acting\'$ness%!x',
+    '$!o%!n&!i%,se-resistant&\'ylation(!q%%tched$$ucci%#nda$"ys#/o&eacute;4uvres$"ah$$bhai$&dopera$,euverability',
+    ')#ing\'.r&rehy;ability(&es-the*!.(\'ing-the%&vrings\'#oes$%garan$#irs$"ji$"le%!i$&meters\'%rical$+rcunningham',
+    '%(hamilton%*ialization\'"ns%#let$$sque$%uchar\'!e(!r%$evre%&vering#\'phibian$"ie$.ower-intensive((/patient$#rop',
+    '$*u&eacute;s%%ement#-s-racer-style%\'winning$!.$#aka%#rde$)ell-mania)&oullin\'&/david(-herefordshire(\'parents\'!e\'%mania%"ng',
+    '$*feld-fondi(!s%+ield/travel)!s%#ord$%haped%#ead&"ed&"it%#ops$#ing%,on&rehy;type\'!\'\'&-block($like',
+    '\'!.\'#ses%!t$%laute%&ughter$!o%"lu%"n/\'&family$$tein%#owe$\'uri-yah#\'talinis%$nuku%$ring',
+    '$$eaux%)gazzianum&#nas%$igas%\'l-clock\'-haenszel-peto(&einzel\'%shelf&%clock&"li&"ow&!s\'&helves%(nimiento$/horpe/principal',
+    '%#ger%$kroz%"ri%\'s-green\'$like&%pidae%!x$(le-boxes\'%crust\'$like\'$melt($ines&&pieces$#ong$#rah',
+    '%$onik$(ua-maker*#ing&&makers#.u&rehy;facture1!d$+al&mdash;or&"\'/&#(s)&$-job\'(response&$.doc&!/\'(computer&!e',
+    '&+ly-adjusted))digitized*$rawn)(produced$$bhai$#eli\'(ne-style\'"to&"la\'!e$#fac\'+&rehy;turer\'!t($orys($uers',
+    '*\'ability*(ed-goods++r&mdash;and,!\',&-cheap-.meets-customer-(retailer-(supplied-\'trained,!.,*/publisher-(supplier,+s/retailers.+wholesalers+"ys',
+    '.+development.#led.\'related.\'service-!.-)/assembly..office/storage.\'service*!y&$ktur&(tcturers$%ilski)!i(!y$"ka',
+    '$%nsure$,re-encrusted\')spreading$2script&rehy;script*#(s)(!t%"hi$!y#!v$&antara$+ille\'s-lips#%weeks$#ood#,x-registered$#man',
+    '#0y&rehy;sidedness$\'-arched%$body%\'centred&%oated%+dimensioned%$eyed%%faced&%inned&#old\'$rmed%$hued\'%ndred%&legged\'&velled',
+    '%$ones%*partedness)!y&\'ersoned\'&talled&\'ocketed%)segmented&%haped&(idedness&\'teepled\'&randed%&tailed\'%sting&(entacled&%iered',
+    '*&-great+\'severed&"o-%&valued%&worlds$#.in$$/few$3ara&ndash;serengeti$&copies$#eli$#ika$#kay$!o%"ni$&things',
+    '%&uacute$&anares&#ita$"er$$iken\'"rt%%nilla$%onian%#uri"%o-ist$%style%%uited$(tse-tung#$isms%\'t-style',
+    '##lle#!s##ten#*u-ching-we$"ri#"wm$!n"#p-2$%based$$case(!s%)ompatible&%vered$(engraver$&guided',
+    '$#out$$pins%\'lotting%%ocket&%uches%\'rinters$#rap%#ead($ing.&\'ference$/scale-dependent%%eller%%heets%&tretch$%table',
+    '\'$read$%users&#ing##123#!2#"ai$$ngou%%tsula#%basic##con##dry#%eldre%#son$"na$#red',
+    '#$fumo#$gies#&heleba$"is$%umulo#+i-compliant$!e#*le-boarded&&necked&&strewn&#top)#ped&(veneered&$wood%%/half',
+    '%#son(!e&$tead&$yrup%!t$#ins#&making##ole$"ma$#nus$"pa#,ped&rehy;out$$ing/(*mutational$&lebeck',
+    '$!y##roa#)s.k.64.34$&/route$&ellers$#ize\'&=25,25#&unduzi%"it$"sa$&taland"#qam#$bool#!o#$sako',
+    '$"ud#%uarin$%ereau)!x\'!l$)icontrole%"na&%istas%%sards",r&aacute;lio$Aeacute;chal-g&eacute;n&eacute;ral/!e+!e$)iacute;in+!o',
+    '$(ndash;11*%25apr+!8*!5*!7*!s$,rehy;quisate##-25$$ee-a$#may$(research$&tee-ee##.91#(/cmg/jmb#(21/apr20',
+    '%-ndash;nairobi$&-helen$+bou-trimmed\'#tic%$unta$!c%#cas$"di%&ona/or$!e$$gall&#ret%#ert%#ing%"os',
+    '%&strade$!j%!o$#kir%#wet$#ldi%$inga$#mau%#bio$#nan%#del\'!t%"go%#ite%!s',
+    '$$rios$$sali%#ius$*t-sur-nive%*h&oacute;n&"as&+on-champion(&/other)\'touring(#er.$$vaig&"ll%$edis$"ya%$land',
+    '#!b$\'&eacute$&achegg$#eck%%lised&!l%!n$*le-carving(&utters\'&effect(#yed\'&flaked(&ronted\')in-throat\'%lined',
+    '(\'illared(\'olisher\'&shaped\'#top\'&veined\'&worker+#ing&!.&(d-effect&$ized%#ine\',g-by-numbers(!s%!y$#ode',
+    '&#eal%"ua\'(minister$$rack%(e-bronze#"c\'$,-andr&eacute\'%toine%%henri%$yvan$!a%#bru%$ccio%$roni%"to',
+    '&#led%%nello%!t$*graviaceae$+h&aacute;an&\'ndash;2,$31st,!7&&rehy;2%%-10th\'!8&"25\'!9&!4&!5',
+    '\')iscipline&(hardened&#may\'%onday%!/&!1&(aviation%!a&$dour&!k&$lite\'!l&#nds))-merciers\'\'t/alice',
+    '&#unt%#ell&%nwald&$schi\'$elli\'!i(#nia&#tte%&igiana&\'ng-pace)$song&!o&!s%$ment%$omir',
+    '$#ial%#gny%)nkevicius\'"us$!k%#ill%!s$0le/herefordshire$\'ogliese%!m&"er%#nda&"is%%pille%%ussis',
+    '%$vefa&$ille$$roft$$ucci%%lescu&!f%#ses&#sen$#yl\'##das$"i*%"an%"ke%%nsyah$%ochee',
+    '$&y-baby%"ke#)e\'s-nests\'%tails$+-collecting$)/stallion$!b$%cchia$$fair$&garege$*ham-le-fen$&matlou$#nco%%holtz%"ka',
+    '$!r$\'sciallo%%field$+tt/resident$-uil-sur-belle$$ye-a%!s##fan&!s$$unin#+g-note-xref$%adale%#lef&"it(!a',
+    '%#rat&"de&$et\'s**-on-thames(%-nora((/swindon(#tes&"ia\'+nefabrieken&!t&!y$#ent%$rete&$ison\'"ta',
+    '%%urite$#ged$&hanita%#ita$#ibi%&n-rich&%al_in($ians)!s*!m*!t\'#tum&$less%!s&#son',
+    '$%olies\'$outh%%san-o%"th%$yles$&ravate\'"es%#eet&#tta%"ie$#uet%$lies%"ns#$haen\'#ism',
+    '%$raja$$cing#(i&aacute$$-ann$(a-helena\'*ilfstrasse&$rosa&\'theresa,!e%$berg%$chis%!e%-hilferstrasse)\'strasse%%kerke',
+    '&!e&!i&!n\'"e.&!s\'(k&eacute\'%leigh&"um%$pocs%$zell$\'barbola%"ou$!c%!a%3hal-margr&eacute;ve',
+    '\'!a%$lare%&ulture$)d-forming&$type%"or%$unum$6e&rehy;ang&egrave;le\'s-(toinette%*-alexandre\',m&eacute;lie\',ng&eacute;le\'%strid&)catherine\'+laude-beaud',
+    '&)elisabeth&&france&6h&eacute;l&egrave;ne\'s\',el&egrave;ne&&jeanne\'"oe&(laurence&&michel&&sophie&%there+"se\'#ype%!d%"la&%ouise',
+    '&%altar&$born\'&urgers&$dorf&0kirche-zur-wiese&#ski\'&trasse%$schi&"ii&#tad%!z$%farms$!g%$hela%$nola',
+    '%!o&)ld-orange%"un$$insk$"ja%3uana-cum-motorbikes$$lisa%(lionauts%$ynne$$mbas%"on$*n&eacute;s%)a-related&!.&"ir',
+    '&$tion%!d%"e-\'\'colours("ut\'&engine\'%grade\'&mammal\'$ness\'%store&$call&$hood&$line&3r-(1809&ndash;1839)($like',
+    '\'!o&,s/others1212%"ha%%ieres&#sed\'"ts%#ker%"na%%oomed&!v\')/stojanov\'!a%"um%"vs$)o-andreas',
+    '&$type%&graphy%$land&#ogy%\'sardara$#sco%#ela%"ha&"es%#mas$%tally%(h&eacute%#ial&+ma-honkenya\',e-configured',
+    '(,/continental%"um%#zas&$burg$%umpol%"sz$$vaux%#ent$%xx.ds(!t$"ya$&zndyni#"ja%&-liisa%!n',
+    '$$erie$$olin%!n%\'ribanks$"ut#0k&lsqb;et&rsqb;s%*rehy;downs$"\'s$!-%+and-release%%books%&clumps%\'getting%)recapture%(the-spot',
+    '\'\'s/input$$.but$&/elvis%&peseta&\'risoner$!2$$down$#eat%%d*&gt&$-off\'#you&!.%"en%!k%$nham',
+    '&%-poor\'\'version&!.&+/creatinine&)s&times;h&!t%!s%-t&lsqb;s&rsqb\'%mdash,$;for\'*rehy;style,$type&&--lord\'%after(-ttractiveness',
+    '($oast\'&centre(\'learing((ommodity)%ntrol\'\'defined(\'ominant\'\'focused,#sed)$rces*(ecasters(\'riendly\'&growth\'$hall\')ignorance',
+    ')(spectors\'%level(-iberalization)$nked\'\'mapping)%tched("en\'\'opening()riginated\'&porter-!s)#wer\'*quotations\'%ready)*lationship',
+    '/"er(&igging(#oad+!s\'0share/experience(%quare($tall,&holder\'&tested(%heory(&o-book)#wns\')valuation+!e\'$wary',
+    '($oman&!.\'!3\'-participating($lace&)/industry(%sland\'$user&!h&$ing\')!-*,by-deception*\'centred*#led*$wise',
+    '),/advertising*+engineering*(manpower**operations*"pr,)omotional\'#sts&!r&\'s-where\'$hare&&thorpe&$wide\'$omen$)ham-smith%"of',
+    '%\'ng-tape%"st$!l%#and%#ess%!y$&making$-ofdistinction%$vich&!n%$wski$"s-&)to-market%!e%$heet',
+    '$(up-based&!s%%shegy$$wood#+l&egrave;ne$%-hole$%andwe%!r$&borian\')o-mclaren0&-honda%%rough%%urian$&cliffe$!e',
+    '%!e%#igh%"na&$heim%%sford%!t%!x%%yised$%field$!i%!a%\'n-spike&$gham\'!s&!s',
+    '%\'w-based&"es$$pits%#ool$(y-le-roi#!m$*alade-like%%ratis$&eladey&%eiros&$lata&$ukes%"nt$#ier%"ng',
+    '&)e-stained\'!s$!o%!l%%rarii%\'sudjono%$ttan%#ura#!n$*e-la-valee,*l&eacute;e%0la-vall&eacute;e%"r.%!s%"ys',
+    '$#ing$$ocks#)oantsetra$$cain(!s$%illes$$jama$!n%!g&"iu%!i&!i&#que&,te-dominated\'$isme',
+    '$+on-bordered\'%edged\'\'leather\'$silk&&/white&!i\'#ngs$%stica$&t-beze$"ua%"ez%&nouchi$#vic&!v##pol',
+    '%#adt&%ndite&"rt%\'ees_and&)try-style\'"te%#ina&$sate\'"es#$r-ed$"ad%#ige&"ne(!s%*m-fastened',
+    '%%ncini$#iag\'+e&mdash;you(!\'(*-alliances*!t*\'voiding)#bed)(contract)%dance)(guidance)$like)&makers)%offer)(partners',
+    ')%split)#tie)$vows)(wrecking(#.45)%their(*/home/work)"of(#_in\'#ist&!n%!c&!k%-ed&mdash;from."he',
+    '(\'quarter($type(%while\'\'/single\'#:to&!t\'"ta%#men%"na%"on&*tt/trading%#val$"os%!u%\'w-bones',
+    '\'\'stemmed&!.&%bones&#fat$$ried$*y&mdash;if%"-a&"up%#at\'%$show#\'s&mdash$%-like%$made%&tanned$$abit',
+    '$&chalek(!k(!l\'!m$)den/actor((daughter(*ex-husband$!e%!i&%llais+!c("e6%#lla%!y$\'h-birds',
+    '&%grass&%lands\'%ights\'%overs&#men\'%ickle("st&&people&(tolerant%!.%\'/centre&*gloucester&&social%#ack&.l&ndash;basset',
+    '\'"ea(!k\'$l\'st($-aid()/benetton))celestion*&ompany)%earth.%first))factories)/gloucestershire)&health+$lper)\'project)$west',
+    '((ing-yard0!s)"on(#say\'"s.&"nd%%banks%#end("er&&s.john%&lander&$ight%+mallow-size,%white+&y-soft',
+    '%$rats%&wiggle$"ia%$ksii%\'leaceae&!i&$lius%"na\'!h$(ke-based(%y-sea*\'the-sea\',in-swaledale%!i$%land.',
+    '$%quake$&teller&$tten%#ing%\'on-moor(%smith\'./herefordshire$&upites%#rin#.t&iacute;nez**/&labour$#eau%"di%#let&+l-sponsored',
+    '\'#ato\'"is%&nflies%!r&#eau%$sana$$gins$(ial-arts\'!s&"na%"em&!s%!m%*n\'s-in-the&#(1)',
+    '\')chauffier(%larke\'$eloy\'&harvey\'"in)$-the-,&rehy;fields\'(le-grand(#ike\'%scott\'\'vasquez()on-wagner&)/accident("ge()utomobile',
+    '\'(creditor\'&father\'&gordon\')pensioner\'%snake\'&thames&"ao\'"ro&\'borough&%dales&$eaus\'!k\'+lli/tibbett\'#tte\'!u',
+    '*&ujanda)-due&ntilde;as($/may)&reuter&#ica)!n*!s\'&quaise)$ians&%kenas&(minister&#oni\'$vich&%puich&+s-developed',
+    '\'"ee\'(k&aacute\'#son\'$town&%ville%*o-barbulus%"re\'!s&"os$$land%"es&!t&!y$!o%)n-le-moor',
+    '%!s%"vs$%shall$#yal%+n/pensioner&"as&!s%#r\'s&%-king&".7&*dom/unsung&!e\')d-looking&"ia(!l',
+    '&"s.##uan$%cello$"ja$%khyan$%langa$%schka%"in$$yama#&vejols%%l-ous&#.we&%ettes&0lbridegroom\'sous\'+ous-looking',
+    '$$ille$!o#"wa%"nt$#idk#"x\'$(-imising&)nfluenced&"sm$0ism-leninism-mao/!t\'+/bolshevism&1t&ndash;leninists\'*-dominated(.existentialism',
+    '0!s()gramscian((inclined*\'flected(+nationalist(-structuralist(*trotskyist\'+a-leninista$&omanni#"y\'%,s-by-the-sea$!-%&chapin&%laire%"in',
+    '&!o%&lander%"no%+on-the-rock%$rose%3whitehouse-approved$!.$+/motherwell$%burgh$!e%!n$%green$%knoll$\'landiad%"in',
+    '$%mount$$neer$&sville$$vale%$ille#"za$&illian%&medici%*pan-filled(#ned$$occo%#uki"*s&iacute;a#".s#,a-idahdeputy',
+    '$!e$$fumi$"ge$\'i-astic&$itis&&loving%#chi$$juro$$kuni$#lha%#iev&*k-ul-absar%"la$#nao%!i',
+    '$"ru$#shi$$take&#tsu%$oshi$$yrek#$baha%"te#"c.$,ara-darkened("ed(%heavy(%laden\'#des&#ell',
+    '&#ons$&herini%\'inenbau\'!o%*otrometers%#see%$witz$$iave%#mal%6nploxyrhanophyhaninide%!o$#les$1ot-muse-mannequin$$ulin("e\'',
+    '*&minded*\'seeming+\'ounding)!/**homosexual(\'isation*"ed).ty-as-activity##den#$egne$"lf$,rati-engined$#tti#\'h-style%#tun',
+    '%%qibah$)ed-potato\'"up%#ens$$iach%&e-shot%"ma%#ter$%karin$#ood$&rabiya%%ibiya$"wi#"ia$!k',
+    '$"la$#ura$"ye#+jid-dwarfed\'*i-suleiman\'#ram#+k-and-glove%$fire%%like.%\'mounted%&toting%$work$!a%$rade$"el',
+    '$"in&&(1989)&+g&rehy;tape\'&-taped$$less$$work##lah$%enica&%nikov$&inovoj$&onikov##naa%%dieri$"mr#!o',
+    '$"ke%!o$$lini$"ma$-n&ndash;dixon%*-architect/!s&$like&(overseer&\'watcher-!s%\'/author&(director&(ex-rally&\'manager',
+    '&&priest&$ryan&\'steeple&&thames\'#own&%upper%"do%"ed%$iana&1c&mdash;communist\'!s%$ries&)y-bridges)$uilt\'(:special',
+    '$!z#\'palomas#)qu&eacute%\'e/opera&"rs%#ing#$roor#(s&eacute%%mdash$.-afforestation&)ssessment&\'udience%(baptisms&$rain\'"ed',
+    '\'+nsciousness)\'umption\'$oked%)dependent\')struction&*isciplined()tribution%&energy&)verything&)xecutions%$flow)%ering%%grown%)ification&&magery',
+    '\')struction%\'killing,!s%$less&#oss%(majority\'$kers%)political&%riest(*vatisation%\'rearing\'%lated\'*production\'+volutionary%$sale',
+    '&(laughter&+pectrometer%\'tourism&&ransit$\'/charge$/a&rehy;chusetts%-chusetts-base)$sets&"io&#ree%\'ge-room\'(/fitness%#ino%#lah&#lam',
+    '%%naise&!e&"ga%$quoi%"ri%!u$(edefence%"me&(ployment%%ngale&&utinae%)s/charges%!t%0ur-cum-dietician%)vacuation',
+    '$%goers$"ia&!s%"eu%$fied%"ka%#lia\'&ensium&#lon%$mino%&nation&)e-berlioz&%ghams\'"ir\'!s',
+    '$#lab$$onde&!i%%retes("ic%"th%$uleh$#ter%%richt%#yle$"uh$%ynger%!s#"t-%(breaking',
+    '%%heads%\'mounted%(stepping\'\'ripping$"ac&)embelidae%!s$(cembelus%$heck$\'ectomy.%(d-yachts%$llar%#r-a(*nd-servant\'%baker',
+    '(\'uilders)#yer\'\'classes(+onspirators)"py)&urtier((raftsmen\'$disc\'%faker\'\'lacquer.!s\'#man*)ipulators)%riner(&inding',
+    '*"er\'%peece(\'ianists)#ece,!s(&lanner+!s()olitician((rinciple($upil\'$race\'(sculptor(\'ergeant(%kills($mith',
+    '()trategist*$okes($weep\'%table)$ilor)$nner(%o-man($rope\'#wax&!/\'*apprentice\'(district\'&master-!s&(:servant',
+    '&\'banking("te\'&laster($ower&-card/eurocard*!s\'%harge\'&ontrol(#ver\'$raft&$file(!t\'"ly\'"ry&(gardener',
+    '&#key&$lead&(matrices\'$ined\'$ould&#off&)s/diploma(0northamptonshire($tour(%wilts\'$mith\'$port(!y\'#ton\'%ystem',
+    '$%foot.(*/universal$+head-rigged$&icates%!n&$gton%+tis-control$#man$!o%(don-like("ts%#ids%%paran&$hora$!r',
+    '%&oianni$%sarge$.urbat&rehy;ing#!u$#cci$$hara$!m$!n%!o$#rel&&nallee%"ia&"er$$tion%"ti',
+    '",t&agrave;cic$+eacute;riau$\'mdash;a$*ndash;riel#(-covered$&erials$%grass$&making$&roofed#"39#%a\'afa$$-aho%\'kuching%#utu$"di',
+    '\'!2\'"ed$%gouri$$hari$$kohe$"la%#ino$"no%$zima$$pang$(r&oacute%,a-hambantota&#ngi%$ella$!s',
+    '$"zo#"b1##ch-&%award+\'winning&\'boarded(#xes&$days&%facts\'"ee\'%inder($shed\'$lame&$girl*!s',
+    '&\'holland&$long&$make&(practice&&racing\'(esistant\'&iddled(%gging&\'sellers\'#lip*!s\'$tick+!s\')ummariser&$wise',
+    '%$.due&\'leyhill%#ams%\'borough\'(x-houses)%maker)$size(&making%#cad%$days%$ends&$s.as\'(/seasons&!t\'!h',
+    '%$head%#in\'\'\'g-funds(3/repair/replacement%$land&#ine%$mail\'"ke)"r-%!s&%aving&%eller&*tick-sized%\'winners#)e-hunting',
+    '&\'wapping$$able$(beleland$%cumbe$"ic$#jko$$lote(!s$#ngo$%r-ial%&alised($zing%#iae\'*l&mdash;it(#(s)',
+    ')"in*#smo))portraits))spiritual))technical*#ype(\'/device)+ideological(\'_rather((isations*"e.*"m\'**t-oriented+"es)$ties',
+    '(&s-both*(handling*$type*$wood)$/our*$work)#_as&#cal%.nal-dependency)%uncle&)it&eacute(&y-home*$wear)%.what%&pieces',
+    '$%s.now$2y-blokes-next-door%!s&"ek&"ys##fen$$ield#%gigic(-/restaurateur#&haking%$usen$&ealira%%felon%2matical-navigation,+/scientific',
+    '/*convenient/,insufferable/&minded/+respectable,$ness*)ian-to-be--/philosophers+#zed*&s-like+(/science1%tific)&sation*:ch-naturwissenschaftlichen,!e)"ze',
+    '%#uss%0wmarklukeandjohn&+s/tugmaster$(ias/dvla%"cs%)eu-favier%"ot%#sen$\'matical$$nawi$"on&"wy$\'s-blind%!.%*/non-maths',
+    '-&-based$"ys#+i&egrave;re.!s$!a%"be%#nas%&sevich$"es$%nchev&!t%!e%\'g-calls\'$like\'(position',
+    '%"ox$.sse-influenced*&spired($like$"us$!v#&kinson$$ovic#$lala\'$/may%\'shewski$%elima$$oubi#$mada%$lamo',
+    '$"os##oes$"ka$#nna%!s$!r%#ell$#uka#!r$&a-ford$!i%\'-archal%%arch/)$ical%"c.',
+    ')#nts%$line&$ocal%%monal($iale%%oshki%&sciana&!t%1x&rehy;management&*-addressed\'&format\')initiated)&tegrin\'%links\'*management',
+    '((upported(\'witched&!.&"ed&#ial$&onalia&$iano&%ymics%"uh$&yoshka#"sa$#umi\'"ya%"ri%$take',
+    '%"ya\'"ma%$zawa&#uka#(t-bodied%)finishing%\'looking$..1:18&ndash;25\'"23%"28&+:1&ndash;23%-8:23&ndash;27(!6$\'a-clark%"ma',
+    '&!a%%rella%%thias%"zz$%eawan%"is%+r&mdash;but&!\'&!-\'#are\')bleaching\')dominated\'.of&rehy;factly)\'-course*$face',
+    ')%f-act(&r-fact\'#she\'$then\'%would&%/clay\')defeated.\'3energy/interactions\'$unit&._of_er_er_fact&$dale&#ed.&%horns&$less&2s&mdash;consisting',
+    '\'".l\'#:at\'%_such%$uzzi%#wos$!h%&aisson%\'ew/head\'#man\'"s*(%/base)&health)(learning)&oxford)&prince',
+    '%#ijs&#oli$#ick%$elli&#son%#moe%$nata&$gley(,y/automobile\'!y%!s&$hall$"le$#mat$(ock/rose',
+    '%,x/washington$)ress-like#!u$$-nte$!a$#ika$#lka$"pa$"ra&"ca&,tion-related*!.*$ally*!s&\'zeugnis',
+    '%$iing&+tatszeugnis\'\'y.feare%!o$!s%$alem%$chka%%siere$"ta%#ina(!l$$yama##vey$%ienko#1y&aacute&scaron;e',
+    '$"am$"ns$!s#\'zenauer$\'oh-ball$!s"%u-mau#%bisse$&uisson#"ch$$lerc#%d\'huy$\'-evelyn$#its$$lins',
+    '&/ey/conservative#!e#(g&eacute$"an$!e$"is#$kala#4l&eacute;on-licharre$#awi$\'bertsch$#eon$$ings$#kin$\'pertsch$%stick',
+    '%$/new$#vis#$mere$#oon#4nder/gloucestershire%!s$)facturers$"g*%$anui$-sell-designed#$paul#\'rauding$!e%"an%$en\'s',
+    '%&rische%&tanian$,ice/resident\'$wood%"el&!s%#nus%-tania-senegal)#ens&*ian-indian)!s\'#us*)+/seychelles&%zhuis$#sen',
+    '%)/kiribati$$wood#"se%\'olopsis%"rs$,oleum/chapel#$teby%!r$&hausen$#ner#$vais%#rre$\'e-black&(coloured&\'fleshed',
+    '&(sprigged&&tinted&&washed%%/pink%#ine%"ly%&y-pink\'#red%#zin$"is$!y#$zoni"%vasia#!e$!r',
+    '#$onia$!r#)ra/zagreb$+o-michaelis%&daphne&$ieva%$mati"%washi$#tha%"te#$dach#$enzi$"re#$ford#-gan-wroughton',
+    '##ish##j-i##ker$"in#$lana$"ey#$pers##rey$!y#$sley#$ther"%x-can$&joseph$&muller$0planck-institute',
+    '#+72-encoding##am-%,/gingerbread%"an##box#(compress#"ed$!s$!t$"xp#$fern#/i&rehy;mization$&-break%)endowment%#mum',
+    '%%rater%&sloops$&camera$"es$$link%)la-facial($like\'#ris$2m&ndash;nordenfelt,!s%!\'%%-type%&alists&#nds%!i',
+    '&+li&aacute;n(#ane*!o*\'strasse\'"la&#nus&(sability&"te&#zer%"ov%-um-to-maximum\'&weight&!n$"ng%#ova',
+    '$)screamers%$tore$"um#-low-tomlinson##mum#&onians#%stoke#$tech#/well-controlled(&hudson($type\'(/rangers((speaking\'%house\'$iana',
+    '$(ndash;11+!9*!2*!3*!6*!7*!8*&august*\'october*$sept$+rehy;august#!-$!1%!0%!6',
+    '$"24%!6%!9$%brick$$care$%early$(grunwald%%urney$$july$\'morning$(november$\'october$%poled(!s$$time',
+    '#!.$"24$"be%"ut#(/british$%could$%early$#mid$$raid$%tanya%#ony$$will#)22/june21##_of##aka',
+    '%\'ovskovo$&ll-ish&-/conservative$#ssi$"tt#$bach$#eck%"es%&llenes$$loom&$ssom$(ray-king%#ook$"ud#.cock/reporting',
+    '%"ls%!n%!s#%eedul$#gun$\'nknecht%"ne$.r-hasselwander%(/council&1leader/thamesdown%%hofen%!l&\'ing_pas%!o%\'western',
+    '%!x#*fair-based\'+/commercial$(lowering#%grove#(hew-like\')mccrimmon&+/gloucester&!s$$odin#$land\'"ia%"se$"in#,nard/friends',
+    '$\'er/cork%!s%\'tenance$"ot$\'teynors%!z#"ol$1n-white/community.(nsultant,+oxfordshire%+naise-based,$ound*!.*!s*!y',
+    ')!y%&making%%quine$!s$"tt$!u%+/consultant#,pole-raising#"ra$%ieres$#nyo##san$#ent$!t#$tham',
+    '$#ide$!o##ugi$#ree#"yu"%zagan$!k$-nkowskideputy$!s$+tl&aacute;n%#zal#%boudi&!t##das$#oor',
+    '#(e-bright&\'uilders%$dull%(learning%&runner%&shapes$!l%$tovs$#nod$!r%"es##har&"ul$%eikas#$ilu*',
+    '#$moor#"or$"ud$#wia&%escki#$uchi$#elo$$novs$$raan&!k%!e%!i%"ki%#sky%!y',
+    '#*z&oacute;n$#ard$$etta$%inghi&#ian$)ol&agrave&#ini%"ne$$uoli$!y!%b-120#!5#\'mda-231#%tracs"\'/second',
+    '"!2"#649"!7"%86930"\'a-obame$%think#$ilem##lla$"ya#!n$$daka$$gula#%qanga#%rnoti#"ya',
+    '"!d"$e/st#"de#!p#$rshi"#ila##t/s$$ikon(\'tourism$#s/s#"yu""na"&oamaji##epd##mio',
+    '$$geni$,impaexternal#"po#"so#%umbou((-miyakou#"yi""pm"%r-200"$uild#$lelo#*na-keeping#,s-compatible%\'to-sbus$%/sbus',
+    '"!w!,c&rehy;isaac"!\'"(.osborne"$2966"!4""50"#60+#$8020%"30%(40-based$#160""73"%88100"%a/irs',
+    '##die$"oo#%ister#!l$$aney%"ry$%eenan%#vey$#lan%#iog&%stair(#er\'**/hibernian%&lister$$mans',
+    '$,oone/student#&nailly%$llen$$enay$!s#!s$$kill##tee#-uley/wardrobe%$isse$%sland##van$#ley$#oy/"2beath/photographer',
+    '&%/shop#&racken%"dy%"in%$tney%#yne$,ide.falmouth\')/scotland%"er\'"ty%#nes$#yan#!s"#c\'s#!.',
+    '#!a$%herty$)ll-judson&%/east&"am&#ion\'%sters&!s&+um/producer$\'mbridge%"ey%#man&#ick&#ont$(nn/civil',
+    '&!a%"se$#rie%#ran!*link-5000s',
 )
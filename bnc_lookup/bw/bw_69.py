@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_69 = (
+count_69 = 6695
+
+heads_69 = (
     'leadam',
-    'leade',
-    'leaded-light',
-    'leaden-armed',
-    'leaden-grey',
-    'leadenham',
-    'leadening',
-    'leader(s)',
-    'leader-bereft',
-    'leader-board',
-    'leader-cum-manager',
-    'leader-democracy',
-    'leader-dependent',
-    'leader-in-exile',
-    'leader-in-reserve',
-    'leader-independent',
     'leader-oriented',
-    'leader-page',
-    'leader-williams',
-    'leader-writer',
-    'leader/follower',
-    'leader/manager',
-    'leader/social',
-    'leader/thamesdown',
-    'leaderman',
-    'leaders&mdash;then',
-    'leaders/managers',
-    'leadersh',
-    'leadership\'',
-    'leadership-based',
-    'leadership-style',
-    'leadership/deputy',
     'leaderspeak',
-    'leadeur',
-    'leadill',
-    'leadin\'',
-    'leading&mdash;we',
-    'leading-edges',
-    'leading-note',
-    'leading-role',
-    'leading/managing',
-    'leadlight',
-    'leadmill-hosted',
-    'leadming',
-    'leadouts',
-    'leads.',
-    'leadtime',
-    'leadworks',
     'leaf\'',
-    'leaf-bare',
-    'leaf-base',
-    'leaf-bases',
-    'leaf-clad',
-    'leaf-colour',
-    'leaf-cover',
-    'leaf-cuttings',
-    'leaf-dappled',
-    'leaf-embossed',
-    'leaf-filled',
-    'leaf-folding',
-    'leaf-form',
-    'leaf-fringed',
-    'leaf-gilding',
-    'leaf-heads',
     'leaf-jade',
-    'leaf-lifter',
-    'leaf-littered',
-    'leaf-loss',
-    'leaf-margins',
-    'leaf-mining',
-    'leaf-mouldering',
-    'leaf-nibbling',
-    'leaf-producing',
-    'leaf-roller',
-    'leaf-rosettes',
-    'leaf-rumours',
-    'leaf-scales',
-    'leaf-scars',
-    'leaf-scattered',
-    'leaf-shape',
     'leaf-spring',
-    'leaf-taking',
-    'leaf-tentacles',
-    'leaf-thatched',
-    'leaf-the',
-    'leaf-thin',
-    'leaf-tissue',
-    'leaf-to-air',
-    'leaf-trembling',
-    'leaf-washes',
-    'leaf-yeast',
-    'leafcaster',
-    'leafcurl',
-    'leafcutter',
-    'leafe',
-    'leafed-in',
     'leafelet',
-    'leafhopper',
-    'leafhopper-borne',
-    'leafhoppers',
-    'leafiness',
-    'leaflands',
-    'leaflet\'',
-    'leaflet-racks',
-    'leafleter',
-    'leaflets/booklets',
-    'leaflets/catalogues',
-    'leaflets/information',
-    'leaflets/prospectuses',
-    'leafletting',
-    'leaflike',
-    'leafminer',
     'leafmonkey',
-    'leafsmoke',
-    'leafstalk',
-    'leagaue',
-    'league-brokered',
-    'league-ifa',
-    'league-leading',
-    'league-tables',
-    'league-un',
-    'league.now',
-    'league.the',
-    'league/',
-    'league/international',
-    'league/milk/littlewoods/whatever',
-    'league/sp',
-    'league84',
     'league:benllech',
-    'leaguetableitis',
-    'leaholm',
-    'leak-fix',
-    'leak-proofed',
-    'leak-sealants',
-    'leaker',
-    'leakings',
-    'leala',
-    'lealholm.',
-    'lealman',
-    'lealtad',
-    'leamas',
-    'leamington&rehy;born',
-    'leamon',
-    'lean&mdash;coward',
     'lean-',
-    'lean-back-and-enjoy',
-    'lean-bodied',
-    'lean-flanked',
-    'lean-forward',
-    'lean-line',
-    'lean-muscled',
-    'lean-nox',
-    'lean-pierre',
-    'lean-shanked',
-    'lean-visaged',
-    'lean.',
-    'lean/and',
-    'leanachan',
-    'leancharn',
-    'leanders',
     'leandro',
-    'leandros',
-    'leaners',
-    'leanfaced',
-    'leanline',
-    'leannan',
-    'leannne',
-    'leanse',
-    'leap*',
-    'leap.',
-    'leapeth',
-    'leappin\'',
-    'leaque',
-    'leaques',
-    'lear-fan',
-    'lear-like',
     'lear-spirit',
-    'lear/hamlet/othello',
-    'lear/national',
-    'leard',
-    'learing',
-    'learjets',
-    'learmont',
-    'learn-as-they-go',
-    'learn-to-ski',
-    'learn.the',
-    'learned-everything',
-    'learnedness',
-    'learner&rehy;training',
-    'learner-driver',
-    'learner-learner',
-    'learner-pilot',
     'learner.',
-    'learners.',
-    'learning\'',
-    'learning-',
-    'learning-bobo',
-    'learning-by-rote',
-    'learning-curves',
-    'learning-disabilities',
-    'learning-experience-curve',
-    'learning-facilitating',
-    'learning-for-the-test',
-    'learning-for-work',
-    'learning-from-the&rehy;japanese',
-    'learning-impaired',
-    'learning-network',
-    'learning-on-the-job',
     'learning-process',
-    'learning-resources',
-    'learning-situations',
-    'learning-teaching',
-    'learning-through-doing',
-    'learning-time',
-    'learning/action',
-    'learning/conditioning',
-    'learning/study',
-    'learnmt',
-    'learnng',
-    'learny',
-    'learstar',
-    'learsy',
-    'learwise',
-    'leas*',
     'leasd',
-    'lease&mdash;licence',
-    'lease-buy',
-    'lease-hold',
-    'lease-owners',
-    'lease/lease-back',
-    'leased-line',
-    'leasemongers',
-    'leaseplan',
-    'leasers',
-    'leashman',
-    'leasing-and-factoring',
-    'leasing-out',
-    'leasing/northamptonshire',
-    'leasings',
-    'leasors',
     'leasows',
-    'least\'',
-    'least-',
-    'least-able',
-    'least-able-to-speak',
-    'least-bad',
-    'least-because',
-    'least-common-denominator',
-    'least-considered',
-    'least-educated',
-    'least-favourite',
-    'least-loved',
-    'least-pretty',
-    'least-profitable',
-    'least-quoted',
-    'least-read',
     'least-regulated',
-    'least-soft',
-    'least-that',
-    'least-threatened',
-    'least-trained',
-    'least-unionised',
-    'least-vulnerable',
-    'least.significant',
-    'least1',
-    'least4',
-    'leastest',
-    'leastsquares',
-    'leatg',
-    'leathaid',
-    'leathain',
-    'leathann',
     'leathar',
-    'leathemand',
-    'leather&rehy;gloved',
-    'leather-',
-    'leather-breeches',
-    'leather-brown',
-    'leather-button',
-    'leather-chaired',
-    'leather-cheeked',
-    'leather-cloth',
-    'leather-coated',
-    'leather-curing',
-    'leather-curtained',
-    'leather-dressers',
-    'leather-edged',
-    'leather-elbowed',
     'leather-gaitered',
-    'leather-gripped',
-    'leather-hard',
-    'leather-harnessed',
-    'leather-heeled',
-    'leather-scented',
-    'leather-skinned',
-    'leather-skirted',
-    'leather-smell',
-    'leather-soled',
-    'leather-strap',
-    'leather-strapped',
-    'leather-thonged',
-    'leather-togged',
-    'leather-tongued',
-    'leather-tough',
     'leather-workers',
-    'leather-wrapped',
-    'leather/cambrelle',
-    'leather/cotton',
-    'leather/wood',
-    'leather_and',
-    'leatherado',
-    'leatherboys',
-    'leathercloth',
-    'leatherette-and-wooden',
-    'leatherland',
-    'leatherstocking',
-    'leatherworking',
-    'leathery-faced',
-    'leathery-skinned',
-    'leathery-voiced',
     'leathley',
-    'leathwaite',
-    'leathwood/tgwu',
-    'leathwoods',
-    'leavasa',
-    'leavce',
-    'leave&mdash',
-    'leave&mdash;not',
-    'leave-men',
-    'leave-them-alone',
-    'leave.',
-    'leave/flexi&ndash;leave',
-    'leave/pay',
-    'leave_no',
-    'leavell',
-    'leavens',
     'leaves/petals',
-    'leavett',
-    'leaving-home',
-    'leaving_a',
-    'leavises',
-    'leavism',
-    'leaway',
-    'leawood',
-    'leaze',
-    'leb',
-    'leba',
-    'leban',
-    'lebanese&ndash',
-    'lebanese-based',
-    'lebanese-controlled',
-    'lebanese-israeli',
     'lebanisation',
-    'lebanization',
-    'lebanon-based',
-    'lebar',
-    'lebars',
-    'lebaume',
-    'lebeau',
-    'lebedkin/pianist',
-    'leben-jesu',
-    'lebena',
-    'leberknodel',
-    'leberwurst',
-    'lebia',
-    'leblanc-process',
-    'lebons',
-    'lebor',
     'lebovic',
-    'lebowa/kangwane',
-    'lebowitz',
-    'leboyer',
-    'lebp',
-    'lebransky',
-    'lebrecht',
-    'lebruns',
-    'lebzelter',
-    'lec3.2.8.1',
-    'lecanopteris',
-    'lecanora',
-    'lecanvey',
-    'lecaros',
-    'lecat',
-    'lecc',
     'lecca',
-    'leccese',
-    'leccese-spriith',
-    'lecerf',
-    'lechdale',
-    'lecher-wire',
-    'lechesa',
-    'lechet',
-    'lechlade/gloucestershire',
-    'lechmann',
-    'lechon',
-    'lechte',
-    'lechur',
-    'lechuza',
-    'lechwe',
-    'lechy',
     'lecithin/ml',
-    'lecithinase',
-    'leckernby',
-    'leckhampstead',
-    'leckhamstead',
-    'lecklitner',
-    'leckonby',
-    'leckpatick',
-    'leckwirth',
-    'leclercs',
-    'leclerq',
-    'lecoat',
-    'lecomber',
-    'lecorriere',
-    'lecours',
-    'lecouvreur',
     'lecraw',
-    'lect/dem.',
-    'lecteur',
-    'lectin-like',
-    'lectin-resistant',
-    'lections',
-    'lector-priest',
-    'lectoris',
-    'lectr',
-    'lectric',
-    'lectu',
-    'lecture\'',
-    'lecture-course',
-    'lecture-cum-sermon',
-    'lecture-hall',
-    'lecture-series',
     'lecture-textbook-assignment-grade',
-    'lecture/dem.',
-    'lecture/dems',
-    'lecture/discussion',
-    'lecture/laboratory',
-    'lecture/seminar',
-    'lecture/video',
-    'lecturer-in-charge',
-    'lecturer-name=',
-    'lecturer-number',
-    'lecturer-student',
-    'lecturer.5',
-    'lecturer/advisory',
-    'lecturer/lecturer',
-    'lecturer/lecturers',
-    'lecturettes',
     'lecturing/teaching',
-    'lecumberry',
-    'led-lit',
-    'ledaig',
-    'ledcreich',
-    'leddin',
-    'leder-hosened',
-    'lederberg',
-    'lederhosen-slapping',
-    'ledgard',
-    'ledge.',
-    'ledger-like',
-    'ledgering',
-    'ledgerline',
-    'leding',
-    'ledit',
     'ledler',
-    'ledlow',
-    'ledmore',
-    'ledoux-like',
-    'ledwidge',
-    'ledworowskiforeign',
-    'ledyen',
-    'lee-andersson',
-    'lee-faulkner',
-    'lee-gitimate',
-    'lee-harwood',
-    'lee-in-this-house-lee',
-    'lee-like',
-    'lee-milne',
-    'lee-potter',
-    'lee-richards',
     'lee-shore',
-    'lee-teng',
-    'lee-tin',
-    'lee-wright(earthscan)',
-    'lee.',
-    'lee/festival',
-    'lee/friend',
-    'lee/mother',
-    'lee/oxford',
-    'lee/rowan',
-    'lee/shannon',
-    'lee/strathclyde',
-    'lee/tara',
-    'lee/w',
-    'leeb',
-    'leeboard',
     'leeboards',
-    'leebotwood',
-    'leech&rehy;woman',
-    'leech(1969)ch6.',
-    'leech-battened',
-    'leech-gatherers',
-    'leech-like',
-    'leech-pluckers',
-    'leech/steam',
-    'leecloths',
-    'leeders',
-    'leedes',
-    'leedex',
-    'leeds&ndash;bradford',
-    'leeds&ndash;carlisle',
-    'leeds&ndash;morecambe',
     'leeds-',
-    'leeds-arsenal',
-    'leeds-chelsea',
-    'leeds-crewe',
-    'leeds-fans',
-    'leeds-king',
-    'leeds-listing',
-    'leeds-lourdes',
-    'leeds-manchester-stoke',
-    'leeds-rejects',
-    'leeds-settle-carlisle',
-    'leeds-stuff',
-    'leeds-supporter',
-    'leeds/aire',
-    'leeds/liverpool',
-    'leeds0',
     'leeds1',
-    'leeds2.gif',
-    'leeds3',
-    'leeeeches',
-    'leeeee',
-    'leeettt',
-    'leef',
-    'leeft',
-    'leehey',
-    'leeholme',
-    'leek-and-potato',
-    'leek-based',
-    'leekam',
-    'leekbrook',
-    'leelachalima',
-    'leene',
     'leengate',
-    'leeona',
-    'leeping',
-    'leerers',
-    'leerie',
-    'leeries',
-    'leeriness',
-    'leerling',
-    'lees/father',
-    'lees/parcel',
-    'leesas',
-    'leesburg',
-    'leesen',
-    'leesons',
-    'leeste',
-    'leestemaker',
     'leesville',
-    'leet-judson-kauffman',
-    'leetham',
-    'leettle',
-    'leeuwarden',
-    'leeuwen',
-    'leeuwenhorst',
-    'leeves',
-    'lef&eacute;bure',
-    'lef&egrave;vre-pontalis',
-    'lef/gref',
-    'lefaucheux',
-    'lefaux',
-    'lefcoe',
-    'lefcourt',
-    'lefebre',
     'lefebvres',
-    'lefever',
-    'lefevre-identified',
-    'lefkada',
-    'lefnol',
-    'lefranc',
-    'lefroy',
-    'left&rehy;of-centre',
-    'left\'',
-    'left\'authorities',
-    'left-\'and',
-    'left-alone',
-    'left-and-a-right',
-    'left-backs',
-    'left-bank',
-    'left-booted',
     'left-bounding',
-    'left-brain-dominated',
-    'left-brainers',
-    'left-controlled',
-    'left-dislocated',
-    'left-engine-out',
-    'left-flank',
-    'left-footer',
-    'left-front',
-    'left-hand-corner',
-    'left-hand-only',
-    'left-hand-side',
-    'left-hold',
-    'left-hooker',
-    'left-is-right',
-    'left-labour-controlled',
     'left-leg',
-    'left-liberals',
-    'left-of-field',
-    'left-orientated',
-    'left-radical',
-    'left-right-fire',
-    'left-side-only',
-    'left-smashing',
-    'left-socialist',
-    'left-thinking',
-    'left-versus-right',
-    'left-wing/right-wing',
-    'left-wingery',
-    'left.1',
-    'left.what',
-    'left/centre',
     'left/go',
-    'left/marxist',
-    'left/paid/made',
-    'left/right/up/down',
-    'left:this',
-    'left_off',
-    'leftarm',
-    'lefter',
-    'lefthanders',
-    'leftist-populist',
-    'leftist/liberal',
-    'lefton',
-    'leftwards-and-rightwards',
-    'lefuel',
-    'leg&rehy;bye',
-    'leg\'s-eleven',
     'leg-and-an-arm',
-    'leg-armour',
-    'leg-bones',
-    'leg-break',
-    'leg-bye',
-    'leg-cutter',
-    'leg-elbow',
-    'leg-feathers',
-    'leg-frame',
-    'leg-gripper',
-    'leg-guards',
-    'leg-in-plastered',
-    'leg-lock',
-    'leg-loop',
-    'leg-o\'-mutton',
-    'leg-overs',
     'leg-pads',
-    'leg-power',
-    'leg-puller',
-    'leg-ribbons',
-    'leg-rowing',
-    'leg-rubbing',
-    'leg-sleeve',
-    'leg-spin-and',
-    'leg-straps',
-    'leg-stretching',
-    'leg-theory',
-    'leg-veins',
-    'leg-warmer',
-    'leg-warmers',
-    'leg-yield',
-    'leg-yielding',
     'leg.ad',
-    'legache',
-    'legacurry',
-    'legal&rehy;judgments',
-    'legal-constitutionalists',
-    'legal-democratic',
-    'legal-eagle',
-    'legal-formal',
-    'legal-looking',
-    'legal-size',
-    'legal-specific',
-    'legal-style',
-    'legal-theoretical',
-    'legal/administrative',
-    'legal/moral',
-    'legalframework',
     'legali',
-    'legalistically.',
-    'legalizes',
-    'legally-acquired',
-    'legally-culled',
-    'legally-defined',
-    'legally-enforceable',
-    'legally-learned',
-    'legally-qualified',
-    'legally-sensitive',
-    'legaly',
-    'legananny',
-    'leganes',
-    'legaspi',
-    'legastat',
-    'legat',
     'legator',
-    'legatorum',
-    'legatus',
-    'legavero',
-    'legavi',
-    'legazpi',
-    'legbreaks',
-    'legco.',
-    'legcutters',
-    'lege',
-    'legeat',
-    'legend-full',
-    'legendary/literary',
-    'legened',
-    'legentibus',
-    'legentil',
     'leger-stop',
-    'legere',
-    'legetet',
-    'legful',
-    'legg/conservative',
-    'leggada',
-    'leggers',
-    'legget',
-    'leggett/executive',
-    'leggevamo',
-    'leggie',
-    'leggier',
-    'leggiero',
-    'leggin',
-    'leggiuno',
-    'leggott',
     'leggykelly',
-    'leggys',
-    'legh-jones',
-    'leghari',
-    'leghs',
-    'legi',
-    'legian',
-    'legibus',
-    'legila',
-    'legilay',
-    'legimitacy',
-    'legion-meets-dessert-storm',
-    'legionaria',
-    'legione',
-    'legionella-laden',
-    'legionellosis',
     'legionellossi',
-    'legionnaie',
-    'legionnaire-style',
-    'legislation*',
-    'legislation-here',
-    'legislation/health',
-    'legislation/intervention',
-    'legislation/regulation',
-    'legislationp',
-    'legislationsee',
-    'legislative-executive',
-    'legislaton',
-    'legit&rehy;imate',
-    'legit.',
-    'legiti&rehy;mations',
-    'legitimatizing',
     'legitime',
-    'legitimist-dynastic',
-    'legitimiti',
-    'legitimum',
-    'legits',
-    'legl',
-    'leglisation',
-    'legmania',
-    'legnice',
-    'lego-legged',
-    'legoda',
-    'legomenon',
-    'legon',
-    'legrendre',
-    'legrest',
-    'legris',
     'legs-apart',
-    'legs-man',
-    'legs/',
-    'legs_in_front',
-    'legspinners',
-    'legstraps',
-    'leguay',
-    'leguia',
-    'legum',
-    'legume-rich',
-    'leguminosarum',
-    'legwax',
-    'lehan',
-    'lehave',
-    'lehendakari',
-    'lehiste',
     'lehlohonolo',
-    'lehmanns',
-    'lehmbrucks',
-    'lehmkuhl',
-    'lehna',
-    'lehner',
-    'lehnert',
-    'lehohla',
-    'lehovec',
-    'lehrain',
-    'lehrathghan',
-    'lehrbuch',
-    'lehrgemeinschaft',
-    'lehrplan-verwaltung',
-    'lehti',
-    'lei-cee-ter',
     'lei-cester',
-    'leialala',
-    'leiasamaivao',
-    'leib',
-    'leibbrand',
-    'leiberman',
-    'leibfraumilch',
-    'leibing',
-    'leibnizian',
-    'leibowitz/candyass',
-    'leibrock',
-    'leibstandarte',
-    'leic',
-    'leica-in-hand',
-    'leicaflex',
-    'leicas',
     'leices',
-    'leiceser',
-    'leicester-born',
-    'leicester-finch',
-    'leicester/leicestershire',
-    'leicester/northants',
-    'leicesterfields',
-    'leicestershire-lincolnshire',
-    'leicestershire-south',
-    'leichhardt',
-    'leicht',
-    'leichtenstein',
-    'leichtensteinklamm',
-    'leics/warks',
-    'leidecker',
-    'leiderdorp',
     'leidschendam',
-    'leidsebuurt',
-    'leidsplein',
-    'leidt',
-    'leidthorp',
-    'leifchild',
-    'leiger',
-    'leigers',
-    'leiges',
-    'leigh-born',
-    'leigh-fermor',
-    'leigh-ho',
-    'leigh-pemberton/old',
-    'leigh-style',
-    'leigh-way',
-    'leigh/british',
     'leigh/oxfordshire',
-    'leighbridge',
-    'leighinmohr',
-    'leighterton',
-    'leighton-boyce',
-    'leighton-jones',
-    'leighton-pope',
-    'leilane',
-    'leils',
-    'lein',
-    'leinen/mother',
-    'leiner',
-    'leinsdorf',
-    'leintwardine/herefordshire',
-    'leiocassis',
-    'leiolepis',
     'leiomyoma',
-    'leiomyomata',
-    'leiomyosarcoma',
-    'leipe',
-    'leiper/daughter',
-    'leipoa',
-    'leipzigers',
-    'leipzigerstrasse',
-    'leipzigstrasse',
-    'leir',
-    'leira',
-    'leiravay',
-    'leireag',
-    'leirens',
-    'leirner',
-    'leisl',
     'leiss',
-    'leissner',
-    'leister',
-    'leistner',
-    'leiston-based',
-    'leisurama',
-    'leisure\'',
-    'leisure*',
-    'leisure-agent',
-    'leisure-centre',
-    'leisure-class',
-    'leisure-image',
-    'leisure-orientated',
-    'leisure-park',
-    'leisure-preferring',
-    'leisure-products',
     'leisure-software',
-    'leisure-type',
-    'leisure/',
-    'leisure/cultural',
-    'leisure/delinquent',
-    'leisure/hobbies',
-    'leisure/interests',
-    'leisure/poseur',
-    'leisure/recreational',
-    'leisureco',
-    'leisurely-paced',
-    'leisures',
-    'leisuretown',
-    'leisz',
-    'leitende',
-    'leiter',
     'leith-newcastle-hull',
-    'leith-ross',
-    'leithauser',
-    'leithe',
-    'leithe-jasper',
-    'leithead',
-    'leithers',
-    'leitstelle',
-    'leitzegrund',
-    'leix',
-    'leixit',
-    'leizen',
-    'leizer',
-    'lekarski',
-    'lekh',
-    'leknes',
     'lekovic',
-    'lektorin',
-    'lekythoi',
-    'lela',
-    'lelan',
-    'leland-daf',
-    'leleatta',
-    'lelei',
-    'leli&egrave;vre',
-    'lelia',
-    'lelio',
-    'leliveld',
-    'lellan',
-    'lelley',
-    'lelli',
-    'lelliott',
     'lellouche',
-    'lelooskin',
-    'lelystad',
-    'lema&icirc;tre',
-    'lemagnen',
-    'lemagrut',
-    'lemande',
-    'lemarchand-clement',
-    'lemarchands',
-    'lemayev',
-    'lembeke',
-    'lembit',
-    'lemelstrich',
-    'lement',
-    'lemercier',
-    'lemes',
     'lemeur',
-    'lemine',
-    'leminkainen',
-    'lemire',
-    'lemkuhl',
-    'lemmenjoki',
-    'lemmer',
-    'lemmie',
-    'lemming.',
-    'lemmington',
-    'lemmo',
-    'lemnalarry',
-    'lemnian',
-    'lemniscal',
-    'lemniscus',
-    'lemoinei',
     'lemoisne',
-    'lemon-and-white',
-    'lemon-blue',
-    'lemon-colored',
-    'lemon-cutting',
-    'lemon-green',
-    'lemon-musk',
-    'lemon-orange',
-    'lemon-shape',
-    'lemon-shaped',
-    'lemon-squeezer',
-    'lemon-type',
-    'lemon-whiteness',
-    'lemon-zest',
-    'lemonade-sellers',
-    'lemonade/orangeade',
     'lemoned',
-    'lemoniz',
-    'lemonnier',
-    'lemons.',
-    'lemoses',
-    'lemoui',
-    'lempa',
-    'lempdes',
-    'lempel',
-    'lemper',
-    'lempert',
-    'lempri&egrave;e',
-    'lempri&egrave;re',
-    'lempriere',
-    'lemrick',
-    'lemsford',
     'lemster',
-    'lemur-like',
-    'lemwig',
-    'len\'',
-    'lenaghan',
-    'lenahan',
-    'lenamore',
-    'lenana',
-    'lenander',
-    'lenare',
-    'lenau',
-    'lenche',
-    'lenches',
-    'lenchmob',
-    'lencho',
-    'lenclos',
     'lendas',
-    'lendauerli',
-    'lender-clients',
-    'lender-to-be',
-    'lendes',
-    'lending-library',
-    'lendinienses',
-    'lendon',
-    'lendvay',
-    'lener',
-    'lenesta',
-    'lenfest',
-    'lenfestey',
-    'lenfesty',
-    'leng-1',
-    'lengeh',
     'lenger',
-    'lengerer',
-    'lenghthen',
-    'lenghty',
-    'length-and-a-half.',
-    'length-and-ahalf',
-    'length-brown',
-    'length-in',
-    'length-mark',
-    'length-time',
-    'length-to-radius',
-    'length-ways',
-    'length-width',
-    'length-wise',
-    'length/',
-    'length/time',
     'length=90/p',
-    'lengthmen',
-    'lengthofbeak(sparrow)',
-    'lengthofbeak(x)',
-    'lengthsman',
-    'lengua',
-    'lenh',
-    'lenhert',
-    'lenienty',
-    'lenihan/husband',
-    'lenin&mdash;perhaps',
-    'lenin\'-had',
-    'lening',
-    'leningraders',
-    'leningradskaya',
-    'leningradski',
     'leningradsky',
-    'leninist-clausewitzian',
-    'leninist-stalinist',
-    'lenios',
-    'lenition',
-    'lenkhanya',
-    'lenm',
-    'lennartz',
-    'lenne',
-    'lennick',
-    'lennon-esque',
-    'lennon-style',
-    'lennon-trained',
-    'lennon/countryside',
-    'lennonesque',
-    'lenoci',
     'lenore',
-    'lenormand-bacot',
-    'lenox-hill',
-    'lens-aperture',
-    'lens-based',
-    'lens-cap',
-    'lens-clip',
-    'lens-clips',
-    'lens-down',
-    'lens-eye',
-    'lens-friendly',
-    'lens-like',
-    'lens-maker',
-    'lens-making',
-    'lens-system',
-    'lens-to-film',
     'lens/air',
-    'lenscrafters',
-    'lense',
-    'lensperson',
-    'lensth',
-    'lental',
-    'lenteild',
-    'lentenin',
-    'lenterman',
-    'lentfer',
-    'lenth&eacute;ric',
-    'lentheric',
-    'lentia',
-    'lentices',
-    'lenticularity',
-    'lenticules',
     'lentiform',
-    'lentiginosus',
-    'lentignosum',
-    'lentil-shaped',
-    'lentilburger',
-    'lentilles',
-    'lentinis',
-    'lentiscus',
-    'lentissimo',
-    'lentiviruses',
-    'lentoid',
-    'lentor',
-    'lentulov',
-    'lentz',
-    'lenyenye',
-    'lenygon',
     'lenyon',
-    'lenzing',
-    'lenzner',
-    'leo-like',
-    'leobert',
-    'leod',
-    'leodgeld',
-    'leodiensians',
-    'leodiensis',
-    'leodnik',
-    'leoffl&aelig;d',
-    'leofgar',
-    'leofsine',
-    'leogangerhof',
-    'leolin',
-    'leominster-prepared',
     'leon.',
-    'leonard\'s',
-    'leonard/photographer',
-    'leonard/the',
-    'leonardo-de',
-    'leonardslee',
-    'leonardus',
-    'leonas',
-    'leonato',
-    'leonberger',
-    'leoncavallo',
-    'leondre',
-    'leone-born',
-    'leonello',
-    'leonidas-prophet',
-    'leonide',
     'leonidik',
-    'leonidovna',
-    'leonila',
-    'leonova',
-    'leonowens',
-    'leons',
-    'leontieff',
-    'leontine',
-    'leontinoi',
-    'leonty',
-    'leopard-1',
-    'leopard-hunt',
-    'leopard-print',
-    'leopard-sized',
-    'leopardel',
-    'leopardine',
     'leopardskin-clad',
-    'leopardstown-cheltenham',
-    'leopardtown',
-    'leopoldian',
-    'leopoulis',
-    'leoppky',
-    'leoprepes',
-    'leora',
-    'leoribus',
-    'leotta',
-    'leovic',
-    'lep&euml;shki',
-    'lepasset',
-    'lepcha',
-    'lepen',
-    'leper-cloths',
     'leper-complex',
-    'lepera',
-    'lepere',
-    'lepers.',
-    'lepestone',
-    'lepidocyclina',
-    'lepidopteral',
-    'lepiota',
-    'lepismatids',
-    'lepoidevin',
-    'leporacanthicus',
-    'leppien',
-    'leppings',
-    'leprehorn',
-    'leprosaria',
-    'leprosy-infected',
     'lept',
-    'leptic',
-    'leptis',
-    'leptodora',
-    'leptogeosynclines',
-    'leptonychotes',
-    'leptoptilos',
-    'leptoseris',
-    'leptosomia',
-    'leptospermum',
-    'leptospira',
-    'leptospirillum',
-    'leptotene',
-    'leptothorax',
-    'leptus',
-    'lequemia',
     'leravoe',
-    'leren',
-    'leri',
-    'lerman',
-    'lermooserhof',
-    'lerned',
-    'leroghis',
-    'lerotholi',
-    'lerotic',
-    'lerry',
-    'lerry/specialist',
-    'lerste',
-    'lert',
-    'lerv',
-    'lerved',
-    'lerwell',
     'lesa',
-    'lesapt',
-    'lesbia',
-    'lesbian-centred',
-    'lesbian-feminist',
-    'lesbian-jewish-nazi-transvestite',
-    'lesbian-loving',
-    'lesbian-orientated',
-    'lesbianas',
-    'lesbianly',
-    'lesbians.',
-    'lesbierotic',
-    'lesc',
-    'lescek',
-    'lesch-nyhan',
-    'leschallas',
     'lesche',
-    'leschenaultii',
-    'lescher',
-    'lescht',
-    'lescouezec',
-    'lese-majeste',
-    'lese-mjaests',
-    'lesedi',
-    'lesel',
-    'leselidze',
-    'leseth',
-    'leshana',
-    'lesie',
-    'lesion-induced',
-    'lesional',
-    'lesioning',
     'leskean',
-    'leski',
-    'lesle',
-    'lesley-ann',
-    'lesley-green/david',
-    'lesley/leslie',
-    'leslie&mdash;silver',
-    'leslie&ndash',
-    'lesly',
-    'lesne',
-    'lesnes',
-    'lesnik',
-    'leson',
-    'lesotho*',
-    'lesozavad',
-    'lesponne',
     'less&rehy;than-fully-established',
-    'less&rehy;than-majority',
-    'less&rehy;understand',
-    'less\'n',
-    'less-accountable',
-    'less-adoring',
-    'less-advantaged',
-    'less-anxious',
-    'less-artificial',
-    'less-boring',
-    'less-busy',
-    'less-celebrated',
-    'less-chart-more-chat',
-    'less-committed',
-    'less-complex',
-    'less-congested',
     'less-costly',
-    'less-deep',
-    'less-digestible',
-    'less-dramatic',
-    'less-easily',
-    'less-ebullient',
-    'less-efficient',
-    'less-energetic',
-    'less-enlightened',
-    'less-exotic',
-    'less-explosive',
-    'less-exposed',
-    'less-fashionable',
-    'less-financially',
-    'less-focal',
-    'less-fortunately-placed',
     'less-frequented',
-    'less-gender-segregated',
-    'less-glamourous',
-    'less-hallowed',
-    'less-hardy',
-    'less-harmful',
-    'less-hierarchical',
-    'less-ideal',
-    'less-important',
-    'less-lofted',
-    'less-lovely',
-    'less-obvious',
-    'less-often',
-    'less-palatial',
-    'less-performing',
-    'less-perishable',
     'less-permeable',
-    'less-policed',
-    'less-precise',
-    'less-predictable',
-    'less-processed',
-    'less-prominent',
-    'less-promising',
-    'less-pronounced',
-    'less-quantified',
-    'less-rare',
-    'less-reputable',
-    'less-resigned',
-    'less-restricted',
-    'less-rigid',
-    'less-risky',
-    'less-safe',
     'less-saline',
-    'less-salubrious',
-    'less-segregated',
-    'less-serious',
-    'less-sickly',
-    'less-solid',
-    'less-standard',
-    'less-stereotyped',
-    'less-sticky',
-    'less-striking',
-    'less-structured',
-    'less-studied',
-    'less-symmetrical',
-    'less-talented',
-    'less-technical',
-    'less-than&rehy;accommodating',
     'less-than-adequate',
-    'less-than-advertised',
-    'less-than-apocalyptic',
-    'less-than-brash',
-    'less-than-bright',
-    'less-than-cautious',
-    'less-than-chivalrous',
-    'less-than-convincing',
-    'less-than-distinguished',
-    'less-than-earth-shaking',
-    'less-than-easy',
-    'less-than-enchanting',
-    'less-than-equal',
-    'less-than-expected',
-    'less-than-fashionable',
-    'less-than-firmly-established',
     'less-than-generous',
-    'less-than-glowing',
-    'less-than-hallowed',
-    'less-than-ideal',
-    'less-than-immaculate',
-    'less-than-inspiring',
-    'less-than-linear',
-    'less-than-optimal',
-    'less-than-poetic',
-    'less-than-proper',
-    'less-than-reliable',
-    'less-than-respectable',
-    'less-than-rigorous',
-    'less-than-ringing',
-    'less-than-state-of-the-art',
-    'less-than-successful',
     'less-than-suitable',
-    'less-than-tactful',
-    'less-than-the-dust',
-    'less-than-willow',
-    'less-trafficked',
-    'less-urbanized',
-    'less-visited',
-    'less-wasteful',
-    'less-welcome',
-    'less-well',
-    'less-well-off',
-    'less-wooded',
-    'less-worn',
-    'less.k7',
-    'less/turn',
-    'less_,_less_than',
     'less_erm_than',
-    'lessa',
-    'lessard',
-    'lessees/trustees',
-    'lessees/trustees.',
-    'lesseligibility',
-    'lessem',
-    'lessen&rehy;ing',
-    'lessen-stress',
-    'lesser-crested',
-    'lesser-disciplined',
-    'lesser-grade',
-    'lesser-paid',
-    'lesser-priority',
-    'lesser-quality',
-    'lesser-ranking',
     'lesser-rated',
-    'lesser-spotted',
-    'lessers',
-    'lesseur',
-    'lessie',
-    'lessiovski',
-    'lessl',
-    'lessnoff',
-    'lessof',
-    'lesson\'',
-    'lesson-a-week',
-    'lesson-book',
-    'lesson-books',
-    'lesson.',
-    'lesson.i',
-    'lesson/',
     'lessons/lectures',
-    'lessonsetc',
-    'lessoued',
-    'lessways',
-    'lester/butcher',
-    'lestrade',
-    'lestranges',
-    'lestzten',
-    'lesueur',
-    'lesvos',
-    'leszczy&nacute;ski',
-    'let&egrave',
-    'let&formula',
-    'let&iacute;cia',
-    'let&mdash;down',
-    'let\'',
     'let\'s-all-be-friends-there\'s-no-problem',
-    'let\'s-destroy-the-party-from-within',
-    'let\'s-get-down-to-real-business',
-    'let\'s-have-a-show',
-    'let\'s-hear-it-for-galilee-purify-your-heart',
-    'let\'s-stay-poor-together',
-    'let\'s-talk-about-this',
-    'let-me-through',
-    'let_er_let\'s',
-    'let_out',
-    'leta',
-    'letanovce',
-    'letches',
-    'letchlade',
-    'letchworth/hitchin',
-    'lete-foho',
     'leteleir',
-    'letellier',
-    'letgen',
-    'lethaby',
-    'lethaia',
-    'lethal&rehy;looking',
-    'lethal-pop-edge',
-    'lethal-versus',
-    'lethane',
-    'lethean',
-    'lether',
-    'lethersich',
-    'lethi&egrave;re',
-    'lethnot',
-    'letica',
-    'leticia',
     'letley',
-    'letloan.doc',
-    'letn&aacute',
-    'letna',
-    'leto',
-    'letoul',
-    'letourneau',
-    'letowska',
-    'letrasetted',
-    'letslink',
-    'lett.',
-    'lettario',
-    'lette',
-    'letted',
-    'letter&rehy;boxes',
-    'letter&rehy;writing',
     'letter-based',
-    'letter-bombers',
-    'letter-bombing',
-    'letter-bombs',
-    'letter-books',
-    'letter-cage',
-    'letter-card',
-    'letter-cards',
-    'letter-carrier',
-    'letter-code',
-    'letter-cutter',
-    'letter-cutters',
-    'letter-flap',
-    'letter-forms',
-    'letter-head',
-    'letter-heading',
     'letter-high',
-    'letter-hole',
-    'letter-lashing',
-    'letter-leprosy',
-    'letter-level',
-    'letter-like',
-    'letter-mail',
-    'letter-of-the-law',
-    'letter-opener',
-    'letter-ornamented',
-    'letter-pair',
-    'letter-post',
-    'letter-press',
-    'letter-segment',
-    'letter-sequence',
-    'letter-spacing',
     'letter-tray',
-    'letter-unless',
-    'letter-writings',
-    'letter/letter',
-    'letter/phone',
-    'letter3',
-    'letterbooks',
-    'letterboxing',
-    'letterbugs',
-    'letterd',
-    'letterheadings',
-    'letterings',
-    'letterio',
-    'letterpaper',
-    'letterplate',
-    'letters&mdash',
     'letters\'&mdash',
-    'letters-',
-    'letters-me-right',
-    'letters-patent',
-    'letters/articles',
-    'letters/comments',
-    'letters/numbers',
-    'letters/two',
-    'letters_in',
-    'letterset',
-    'letterspacing',
-    'letterston',
-    'letterz',
-    'letting-your-hair-down',
-    'lettis',
-    'lettner',
     'letton',
-    'lettristes',
-    'letts/camra',
-    'lettuce-chewing',
-    'lettuce-flavoured',
-    'lettuce-garden',
-    'lettuce-green',
-    'lettuce-stealing',
-    'lettyse',
-    'letzeburg',
-    'letzten',
-    'leu-try',
-    'leu-val',
-    'leu122',
-    'leu15',
-    'leu516',
     'leu652',
-    'leu70',
-    'leu81',
-    'leu95',
-    'leuaosis',
-    'leucadia',
-    'leucaenea',
-    'leucanthamella',
-    'leucas',
-    'leuchand',
-    'leuchorchis',
-    'leuchostachys',
-    'leuchtenberg',
-    'leucine-co',
-    'leucistic',
-    'leuckert',
     'leuckisporites',
-    'leucocratic',
-    'leucocyte/endothelial',
-    'leucocytic',
-    'leucoencephalopathy',
-    'leucogeranus',
-    'leucono&egrave',
-    'leucophthalmus',
-    'leucoplakia',
-    'leucoptera',
-    'leucopterus',
-    'leucorhoa',
-    'leucorrhoa',
-    'leucoryphus',
-    'leucoryx',
-    'leucosis',
     'leucostachys',
-    'leucotomy',
-    'leucotos',
-    'leucotrienes',
-    'leuctra',
-    'leucurus',
-    'leuga',
-    'leugering',
-    'leukeamia',
-    'leukemans',
-    'leukemic',
-    'leukios',
-    'leukocyte-epithelial',
-    'leukocytic',
-    'leukolinon',
-    'leukon',
     'leukopenia',
-    'leukoplakic',
-    'leukortienes',
-    'leukotrien',
-    'leukotriones',
-    'leule',
-    'leun',
-    'leuna',
-    'leupena',
-    'leurbost',
-    'leurve',
-    'leutasch',
-    'leutry',
-    'leutze',
-    'leuu',
-    'leuvenhaven',
     'leuw',
-    'leuxe',
-    'lev&eacute;e-en-masse',
-    'lev&eacute;s',
-    'lev&yacute',
-    'lev-els',
-    'levada-trekking',
-    'levadeiro',
-    'levadia',
-    'levaghery',
-    'levaillanti',
-    'levak-svajger',
-    'levanti&egrave;re',
-    'levantiere',
-    'levar',
-    'levassor',
     'levaton',
-    'levavasseur',
-    'level*',
-    'level-\'professional\'',
-    'level-7',
-    'level-aggregate',
-    'level-based',
-    'level-by',
-    'level-crossings',
-    'level-none',
-    'level-of&rehy;understanding',
-    'level-of-explanation',
-    'level-the',
-    'level-top',
-    'level-units',
-    'level.8',
     'level/',
-    'level/gcse',
-    'level=',
-    'level=10.2',
-    'levelled-down',
-    'levelling-out',
-    'levelmaster',
-    'levels-rural',
-    'levels/changed',
-    'levels/opened',
-    'levels/took',
-    'levelspakistanis',
-    'levelt',
-    'levenham',
-    'levenside',
-    'leventhorpes',
     'levenwick',
-    'lever(s)',
-    'lever-arm',
-    'lever-controlled',
-    'lever-pulling',
-    'lever-to-cover',
-    'lever-to-passenger',
-    'leverage-increasing',
-    'leverages',
-    'leverenz',
-    'leveret',
-    'leverhulme-funded',
-    'leveringham',
-    'leverite',
-    'leverkeusen',
-    'leverkuehn',
     'leverkuhne',
-    'leversedge',
-    'leversha',
-    'leversons',
-    'leverton/save',
-    'levertov',
-    'levesque',
-    'levi-clad',
-    'levi-like',
-    'levi-shevardnadze',
-    'levi-strauss-style',
-    'levi-straussian',
-    'leviable',
-    'levich',
-    'leviers',
-    'levikin',
     'leville',
-    'levine-meyer',
-    'levinger',
-    'levinsall',
-    'levinton',
-    'levita',
-    'levitas',
-    'levitationists',
-    'levitatious',
-    'levitators',
-    'levitoff',
-    'levitor',
-    'levitron',
-    'levitski',
-    'levitsky',
-    'levittowners',
     'levittowns',
-    'levkas/nidri',
-    'levo',
-    'levodopa/benserazide',
-    'levodopain',
-    'levonian',
-    'levorphanol',
-    'levoyah',
-    'levrette',
-    'levuka',
-    'levver',
-    'levy-agresti',
-    'levy-bruhl',
-    'levy-marchal',
-    'levy-paying',
-    'lewandowskiownership',
     'lewchuk',
-    'lewd-sounding',
-    'lewde',
-    'lewdnesse',
-    'lewds',
-    'lewednesse',
-    'lewedon',
-    'lewellen',
-    'lewellyn',
-    'lewendon',
-    'lewenstein',
-    'lewer',
-    'lewes-born',
-    'lewin/northants',
-    'lewinsohn',
-    'lewis-ashley',
     'lewis-frank',
-    'lewis-like',
-    'lewis-razor',
-    'lewis-tony',
-    'lewis/all',
-    'lewis/baptist',
-    'lewis/british',
-    'lewis/director',
-    'lewis/landlady',
-    'lewis/mcalpine',
-    'lewis/national',
-    'lewis/north',
-    'lewis/nra',
-    'lewis/prison',
-    'lewis/research',
-    'lewis/student',
     'lewis/uist/barra',
-    'lewis/veterinary',
-    'lewis/wbc',
-    'lewisagriculture',
-    'lewisburn',
-    'lewishamborn',
-    'lewisi',
-    'lewisia',
-    'lewisified',
-    'lewisman',
-    'lewismen',
-    'lewisohn',
-    'lewissolicitor',
-    'lewisward',
-    'lewites',
-    'lewknor/oxford',
     'lewthwaites',
-    'lexa',
-    'lexa-myc',
-    'lexan',
-    'lexander',
-    'lexell',
-    'lexey',
-    'lexgroup',
-    'lexias',
-    'lexical-functional',
-    'lexical-semantic',
-    'lexical/grammatical',
-    'lexical:syntax:semantics',
-    'lexicalisation',
-    'lexicalization',
-    'lexicalized',
     'lexico-semantic',
-    'lexico-syntactic',
-    'lexicographically',
-    'lexicologically',
-    'lexicon-building',
-    'lexicon-grammar',
-    'lexicon1',
-    'lexicon2',
-    'lexicus',
-    'lexifiers',
-    'lexigram',
-    'lexiphanic',
-    'lexir',
-    'lexis/grammar',
-    'lexis/nexis',
-    'lexmeks',
     'lexomat',
-    'lexon',
-    'lexton',
-    'ley-hunter',
-    'ley-line',
-    'ley-matrix',
-    'leyanum',
-    'leyasu',
-    'leyborne-popham',
-    'leyden-period',
-    'leye',
-    'leyenaar',
-    'leyer',
-    'leyhill/gloucestershire',
-    'leyland/brel',
-    'leyland/lancashire',
     'leyland/rover',
-    'leyland/volvo',
-    'leylandi',
-    'leylands',
-    'leylines',
-    'leymarie',
-    'leymoor',
-    'leys/adventure',
-    'leysen',
-    'leyshon/victim',
-    'leysian',
-    'leytons',
-    'leytonstode',
-    'lez',
-    'lezardrieux',
-    'lezh&euml',
     'lezhina',
-    'lezo',
-    'lezzypal',
-    'lf-you-really-loved-me-you\'d-love-my-failure-too',
-    'lf/aoun',
-    'lf0020',
-    'lf58,400',
-    'lfa-1-expressing',
-    'lfa-2',
-    'lfa3',
-    'lfat',
-    'lfe',
-    'lfg',
-    'lfmc',
-    'lfpack2',
-    'lfr240,990',
     'lfr261,000',
-    'lft',
-    'lg.64',
-    'lga',
-    'lgd',
-    'lge',
-    'lgiu',
-    'lgium',
-    'lgj',
-    'lgk',
-    'lgp',
-    'lgpmmgimms1',
-    'lgr/wnk',
-    'lgsm',
-    'lgss',
-    'lgtb',
     'lgu',
-    'lgvs',
-    'lgw',
-    'lh-20',
-    'lh-jetronic',
-    'lh-rh',
-    'lh200',
-    'lhagvagyn',
-    'lhagvajabyn',
-    'lhamo',
-    'lhamsuren',
-    'lhamyn',
-    'lhanbryde',
-    'lharc',
-    'lhea',
-    'lhermet',
     'lherzolite',
-    'lhevinne',
-    'lhf',
-    'lhh',
-    'lhiannon-shee',
-    'lhiattee',
-    'lhooq',
-    'lhose',
-    'lhota',
-    'lhoyd',
-    'lhrw',
-    'li&eacute',
-    'li&eacute;ge',
-    'li&eacute;geoise',
-    'li&eacute;vano',
-    'li&eacute;vre',
     'li&ndash',
-    'li&ntilde;o',
-    'li&scaron;on',
-    'li\'l\'',
-    'li-',
-    'li-1',
-    'li-cheng-i',
-    'li-fa',
-    'li-fraumeni',
-    'li.g.',
-    'li3100',
-    'li4',
-    'li=ts/tt',
-    'liabes',
-    'liabilities.',
-    'liability&mdash;for',
     'liability-corporate',
-    'liability.in',
-    'liability.it',
-    'liability/asset',
-    'liabl',
-    'liablewhether',
-    'liablity',
-    'liacopoulous',
-    'liadett',
-    'liadin',
-    'liadov',
-    'liailities',
-    'liaised.',
-    'liaision',
-    'liaison/advisory',
-    'liaison/coordination',
     'liaisons-',
-    'liana-webbed',
-    'liangsiriprasert',
-    'liani',
-    'lianna',
-    'lianoid',
-    'lianozovo',
-    'liaotung',
-    'liapis',
-    'liar.',
-    'liardet',
-    'liaskas',
-    'liass',
-    'liatach',
-    'liazos',
-    'lib&eacute;chov',
     'lib&eacute;r&eacute',
-    'lib&eacute;ration-nord',
-    'lib&rehy;dem',
-    'lib\'',
-    'lib-con',
-    'lib-eral',
-    'lib-theological',
-    'lib/c',
-    'libanaises',
-    'libani',
-    'libanius',
-    'libanka',
-    'libanon',
-    'libation-bearers',
-    'libaude',
-    'libavius',
     'libbaton',
-    'libbey',
-    'libearty',
-    'libeccio',
-    'libel-free',
-    'libel.',
-    'libelling',
-    'libellus',
-    'libelously',
-    'liben',
-    'libensk&yacute',
-    'libera&ccedil;ao',
-    'liberaalinen',
-    'liberaci&oacute;n-cinchonero',
-    'liberaci&oacute;n-farabundo',
-    'liberal\'',
     'liberal-bourgeois',
-    'liberal-conservative-social-democratic-rural',
-    'liberal-constitutional',
-    'liberal-constitutionalist',
-    'liberal-idealism',
-    'liberal-inspired',
-    'liberal-internationalists',
-    'liberal-irish',
-    'liberal-leaning',
-    'liberal-left',
-    'liberal-middle',
-    'liberal-nationals',
-    'liberal-non-liberal',
-    'liberal-parliamentary',
-    'liberal-pluralist',
-    'liberal-racist',
     'liberal-studies',
-    'liberal-unionist',
-    'liberal/academic',
-    'liberal/authoritarian',
-    'liberal/catholic/evangelical',
-    'liberal/conservative',
-    'liberal/interventionist',
-    'liberal/labour',
-    'liberal/left',
-    'liberal/progressive',
-    'liberal/secular',
-    'liberaldemocrat',
-    'liberaldom',
-    'liberaliser',
-    'liberalises',
-    'liberalism/',
     'liberalism/radical',
-    'liberalistic',
-    'liberalizers',
-    'liberalle',
-    'liberally-educated',
-    'liberally-illustrated',
-    'liberally-minded',
-    'liberalno-demokratyczny',
-    'liberals-joining',
-    'liberals.',
-    'liberals/tories',
-    'liberandum',
-    'liberans',
-    'liberating\'',
-    'liberation\'',
-    'liberation-causes-crime-in-women',
     'liberational',
-    'liberationalists',
-    'liberations',
-    'liberatory',
-    'liberatyion',
-    'libercourt',
-    'liberec',
-    'liberian-flag',
-    'liberica',
-    'liberistic',
-    'libern',
-    'liberorum',
-    'liberorumque',
-    'liberos',
-    'liberta',
-    'liberta&ccedil&aacute;o',
     'libertadora',
-    'libertarian\'/',
-    'libertarian-individualist',
-    'libertarian-oriented',
-    'libertarian/social',
-    'libertarianism\'',
-    'libertate',
-    'libertates',
-    'liberti',
-    'libertina',
-    'liberto',
-    'libertus',
-    'liberty-authority',
-    'liberty-curtained',
-    'liberty-pattern',
-    'liberty-style',
     'libidinized',
-    'libidinously',
-    'libido-less',
-    'libido-quarterback',
-    'libidos',
-    'libman',
-    'liboi',
-    'libor-related',
-    'liborious',
-    'libr',
-    'libr.',
-    'libra-drinking',
-    'librair',
-    'libraire',
-    'libram',
-    'librare',
     'libraria',
-    'librarian-aide',
-    'librarian-disposer',
-    'librarian/coordinator',
-    'librarian/oxfordshire',
-    'librarians.',
-    'librarians/',
-    'librarianship/information',
-    'librariesarchives',
-    'library-by-library',
-    'library-focused',
-    'library-living',
-    'library-oriented',
-    'library-related',
-    'library-sponsored',
-    'library-trained',
     'library-type',
-    'library/',
-    'library/architecture',
-    'library/arts',
-    'library/book',
-    'library/faculty',
-    'library/martin',
-    'library/nick',
-    'library/paul',
-    'library/student',
-    'library/study',
-    'library/tv',
-    'libraryless',
-    'libras',
-    'librate',
-    'librates',
     'librazhdi',
-    'libreros',
-    'libris',
-    'libry',
-    'libu&scaron;e',
-    'libuda',
-    'liburan',
-    'liburnica',
-    'libya-even',
-    'libya-lockerbie',
-    'libya-venice',
-    'libyan-based',
-    'libyan-born',
-    'libyan-financed',
-    'libyan-inspired',
-    'libyan-made',
     'libyan-trained',
-    'libyan/air',
-    'libyes',
-    'lic1',
-    'lic3',
-    'liccy',
-    'lice-bags',
-    'lice-brained',
-    'lice-filled',
-    'lice-killing',
-    'lice-pickers',
-    'licea',
-    'licence&rehy;payers',
-    'licence-built',
-    'licence-fee',
-    'licence-free',
     'licence-holder.',
-    'licence-losing',
-    'licence-money',
-    'licence-payers',
-    'licence-to-bore',
-    'licence-to-kill',
-    'licence.in',
-    'licence.richard',
-    'licence.the',
-    'licence/rental',
-    'licencekey',
-    'licences&mdash',
-    'licences-general',
-    'licences/documentation',
-    'licenceware',
-    'licens',
     'licensability',
-    'license/husband',
-    'license/son',
-    'licensing\'',
-    'licensing.',
-    'licenza',
-    'licerius',
-    'liceu',
-    'lich-gate',
-    'lichal',
-    'lichas',
-    'lichedom',
-    'lichen-clad',
-    'lichen-dapple',
-    'lichen-dappled',
-    'lichen-eating',
     'lichen-encrusted',
-    'lichen-grey',
-    'lichen-like',
-    'lichen-silent',
-    'lichen-stains',
-    'lichenologist',
-    'lichenology',
-    'lichenometry',
-    'liches',
-    'lichine',
-    'lichrospher',
-    'lichtblick',
-    'lichten',
-    'lichtenberger',
-    'lichtenhagen',
-    'lichtenstein-type',
     'lichtensteinii',
-    'lichtiger',
-    'lichtwer',
-    'licinian-sextian',
-    'licino',
-    'lick-nicking',
-    'licketty-split',
-    'lickey',
-    'lickin\'-spittin\'',
-    'lickings',
-    'lickorish',
-    'lickrish',
-    'licky',
-    'licmophora',
-    'licoflavonol',
-    'licona',
     'licoreria',
-    'licorice-straps',
-    'licoricone',
-    'lictor',
-    'licua',
-    'lid-corners',
-    'lid/frying',
-    'lid/splashback',
-    'lidar',
-    'lidbrook',
-    'lidbury',
-    'liddell-grainger',
-    'liddelow',
-    'lidden',
-    'liddiat',
-    'lidding',
     'lidell',
-    'lider',
-    'lidgard',
-    'lidgate',
-    'lidget',
-    'lidi',
-    'lidingoloppet',
-    'lidl',
-    'lidmi',
-    'lidmouth',
-    'lidos',
-    'lids:food',
-    'lidstrom',
-    'lidtrap',
-    'lidu',
-    'lie-',
     'lie-a-bed',
-    'lie-detecting',
-    'lie-don',
-    'lie-up',
-    'lieb-hirmer',
-    'liebebotschaft',
-    'lieben',
-    'lieberkuhn',
-    'liebermans',
-    'liebeslied',
-    'liebeslieder-walzer',
-    'liebesliederwalzer',
-    'liebestr&auml;um',
-    'liebfrauen',
-    'liebfrauenberg',
-    'liebigite',
     'liebing',
-    'liebish',
-    'liebman',
-    'liebovitz',
-    'liebowitz-15',
-    'liebriech',
-    'liebrow',
-    'liebschen',
-    'liebstein',
-    'liebster',
-    'liebstod',
-    'liechtensteiners',
-    'liechtensteinklamm',
-    'liedelein',
-    'lieden',
-    'liederabend',
     'liederene',
-    'liederkreis',
-    'lieds',
-    'lieg\'',
-    'liege-lord',
-    'liegelordship',
-    'liegemen',
-    'lieh',
-    'liekly',
-    'liell',
-    'liener',
-    'lieng',
-    'liens/encumbrances',
-    'lientenant',
-    'lienunculus',
-    'liepa',
     'lierop',
-    'lies&mdash',
-    'lies-in-wait',
-    'lieschen',
-    'lieselotte',
-    'liesse',
-    'liestal',
-    'lieta',
-    'lieto',
-    'lietuvai',
-    'lietzke',
-    'lieut.-colonel',
-    'lieutant',
-    'lieutenant-colonelcy',
-    'lieutenant-colonels',
-    'lieutenant-governors',
     'lieutentant-colonel',
-    'lieuw',
-    'lieux',
-    'lieve',
-    'lievens',
-    'lievore',
-    'life&mdash;all',
-    'life&mdash;chances',
-    'life&mdash;expectancy',
-    'life&mdash;rome',
-    'life&rehy;boat',
-    'life&rehy;cycle',
-    'life&rehy;devoted',
-    'life&rehy;expectancy',
-    'life&rehy;giving',
-    'life&rehy;style',
     'life&rehy;styles',
-    'life&rehy;support',
-    'life&rehy;time',
-    'life(w)',
-    'life-activity',
-    'life-affecting',
-    'life-after-strach',
-    'life-against-logic',
-    'life-ambition',
-    'life-area',
-    'life-areas',
-    'life-attitude',
-    'life-based',
-    'life-bearing',
-    'life-bestowing',
-    'life-boatmen',
     'life-buffeted',
-    'life-capsule',
-    'life-choice',
-    'life-circumstance',
-    'life-class',
-    'life-commenced',
-    'life-commencement',
-    'life-consuming',
-    'life-courses',
-    'life-cover',
-    'life-crisis',
-    'life-curve',
-    'life-dated',
-    'life-death',
-    'life-deforming',
-    'life-denial',
     'life-denying',
-    'life-destroying',
-    'life-direction',
-    'life-elevating',
-    'life-endeavours',
-    'life-enhancer',
-    'life-enrichment',
-    'life-equipment',
-    'life-expanding',
-    'life-expectation',
-    'life-experiences',
-    'life-extend',
-    'life-field',
-    'life-filled',
-    'life-formation',
-    'life-fulfilling',
     'life-functions',
-    'life-givers',
-    'life-givingness',
-    'life-he',
-    'life-in-death',
-    'life-instincts',
-    'life-is-a-bitch',
-    'life-is-a-party',
-    'life-jerk',
-    'life-journey',
-    'life-labours',
-    'life-lease',
-    'life-lived-since',
-    'life-loving',
-    'life-matches',
-    'life-mate',
     'life-modalities',
-    'life-model',
-    'life-nurturing',
-    'life-orders',
-    'life-oriented',
-    'life-our',
-    'life-path',
-    'life-peer',
-    'life-peerage',
-    'life-peers',
-    'life-plan',
-    'life-plans',
-    'life-precursing',
-    'life-preparation',
-    'life-prisoners',
-    'life-problem',
     'life-producing',
-    'life-protective',
-    'life-pump',
-    'life-respecting',
-    'life-restoring',
-    'life-robe',
-    'life-scale',
-    'life-science',
-    'life-scorning',
-    'life-sense',
-    'life-serving',
-    'life-setting',
-    'life-shortening',
-    'life-situation',
-    'life-situations',
-    'life-soiled',
     'life-source',
-    'life-sponsored',
-    'life-stages',
-    'life-state',
-    'life-stature',
-    'life-study',
-    'life-table',
-    'life-tenant',
-    'life-term',
-    'life-themes',
-    'life-threads',
-    'life-threatened',
-    'life-threats',
-    'life-time.',
-    'life-to-life',
-    'life-trajectory',
     'life-transformation',
-    'life-water',
-    'life-without-parole',
-    'life-worlds',
-    'life-years',
-    'life-yielding',
-    'life.style',
-    'life.threatening',
-    'life/',
-    'life/at',
-    'life/because',
-    'life/cost',
-    'life/daily',
-    'life/is',
-    'life/just',
-    'life/non-life',
     'life/personal',
-    'life/thought',
-    'life:woolwich',
-    'life_in_terms',
-    'lifeboathouse',
-    'lifeboy',
-    'lifebuilder',
-    'lifebuoys',
-    'lifegiver',
-    'lifegiving',
-    'lifeguarding',
-    'lifeholds',
-    'lifelands',
-    'lifeless-sounding',
-    'lifeless.',
-    'lifelikeness',
     'lifeplan',
-    'lifesaver\'',
-    'lifesavers',
-    'lifeshield',
-    'lifesign',
-    'lifeson',
-    'lifespan&mdash;login.com',
-    'lifespan&mdash;pmr',
-    'lifespan&mdash;pmr.log',
-    'lifespan&mdash;router',
-    'lifespan&mdash;router.com',
-    'lifespan-able',
-    'lifespan-pmr',
-    'lifespan-to-lifespan',
-    'lifespan.dir',
-    'lifespan.flb',
     'lifespan.hlp',
-    'lifespan.lstrain',
-    'lifespanformslibrary',
-    'lifespanversion',
-    'lifespeed',
-    'lifestages',
-    'lifestance',
-    'lifestule',
-    'lifestyle-building',
-    'lifestyle-oriented',
-    'lifestyle/',
-    'lifetables',
-    'lifetime-best',
-    'lifetime-broadened',
-    'lifetime.after',
-    'lifewas',
     'lifewith',
-    'lifewo',
-    'liffeforce',
-    'liffespan',
-    'liffey-soused',
-    'liffoe',
-    'lifolf',
-    'lift&rehy;right-leg',
-    'lift-boy',
-    'lift-cage',
-    'lift-down',
-    'lift-for',
-    'lift-making',
-    'lift-man',
-    'lift-offs',
-    'lift-on/',
     'lift-operator',
-    'lift-phobic',
-    'lift-sharing',
-    'lift-straps',
-    'lift/load',
-    'lift/lower',
-    'liftand',
-    'lifti',
-    'liftime',
-    'lifting-gear',
-    'lifting.',
-    'lifting/lowering',
-    'liftings',
-    'liftlines',
-    'lifts.',
-    'liftshaft',
     'liftup',
-    'ligamentous',
-    'ligan',
-    'ligand-based',
-    'ligand-gated',
-    'ligand-induced',
-    'ligand-integrin',
-    'ligand-metal',
-    'ligand-receptor',
-    'liganded',
-    'liganding',
-    'ligases',
-    'ligate',
-    'ligation-sites',
-    'ligations',
-    'ligatures&mdash;they',
     'ligeia',
-    'liger',
-    'ligertwood',
-    'ligetian',
-    'liggat',
-    'ligger',
-    'liggts',
-    'ligh',
-    'lighlty',
-    'light&mdash;manufacturing',
-    'light&mdash;phototypesetting',
-    'light&rehy;blanched',
-    'light&rehy;coloured',
-    'light&rehy;day',
-    'light&rehy;headed',
-    'light&rehy;hearted',
     'light&rehy;reflecting',
-    'light&rehy;wear',
-    'light&rehy;welterweight',
-    'light\'/\'classical',
-    'light-action',
-    'light-admitting',
-    'light-air',
-    'light-amplifying',
-    'light-and-bitter',
-    'light-and-power',
-    'light-anti-aircraft',
-    'light-atom',
-    'light-based',
-    'light-bodied',
-    'light-boned',
-    'light-bottomed',
     'light-brackets',
-    'light-brained',
-    'light-but',
-    'light-catching',
-    'light-collecting',
-    'light-comedy',
-    'light-cord',
-    'light-cruiser',
-    'light-curve',
-    'light-curves',
-    'light-demanding',
-    'light-detecting',
-    'light-driven',
-    'light-engine',
-    'light-engineering',
-    'light-fantastic',
     'light-fast',
-    'light-filter',
-    'light-flashing',
-    'light-flex',
-    'light-flight',
-    'light-fly',
-    'light-flyweight',
-    'light-footedness',
-    'light-gathering',
-    'light-gemmed',
-    'light-giving',
-    'light-grey',
-    'light-gun',
-    'light-haired',
-    'light-harvesting',
-    'light-heavyweights',
     'light-heavywight',
-    'light-hold',
-    'light-holding',
-    'light-hours',
-    'light-houses',
-    'light-hungry',
-    'light-industrial',
-    'light-load',
-    'light-lock',
-    'light-loving',
-    'light-lozenges',
-    'light-mahogany',
-    'light-manufacturing',
-    'light-metal',
-    'light-microscopy',
-    'light-middleweights',
     'light-minded',
-    'light-mindedness',
-    'light-minutes',
-    'light-opera',
-    'light-out',
-    'light-panels',
-    'light-particles',
-    'light-path',
-    'light-pipe',
-    'light-plus-colour',
-    'light-sabres',
-    'light-saddle',
-    'light-seconds',
-    'light-seeming',
-    'light-sensitivity',
-    'light-shaded',
     'light-shades',
-    'light-shafted',
-    'light-shows',
-    'light-shunning',
-    'light-socket',
-    'light-soil',
-    'light-soiled',
-    'light-starred',
-    'light-stepping',
-    'light-streams',
-    'light-stressed',
-    'light-switches',
-    'light-swollen',
-    'light-textured',
-    'light-time',
-    'light-to-electric',
     'light-treated',
-    'light-use',
-    'light-valve',
-    'light-water-cooled',
-    'light-weapon',
-    'light-weather',
-    'light-weeks',
-    'light-welters',
-    'light-wight',
-    'light/',
-    'light/cakes',
-    'light/casual',
-    'light/mid-weight',
-    'light/moving',
-    'light14.1',
-    'light:dark',
     'lightbourne',
-    'lightbowne',
-    'lightbulb-nosed',
-    'lightcliffe',
-    'lighteners',
-    'lightenings',
-    'lighter-brown',
-    'lighter-camera',
-    'lighter-clad',
-    'lighter-coated',
-    'lighter-coloured',
-    'lighter-socket',
-    'lighter-used',
-    'lighter/heavier',
-    'lightercoloured',
-    'lighteth',
     'lightface',
-    'lightfitting',
-    'lightflite',
-    'lightfood',
-    'lightfoot/organiser',
-    'lightfooted',
-    'lightfootedness',
-    'lightgraphix',
-    'lightgun',
-    'lightheadedness',
-    'lighthill',
-    'lighthorne',
-    'lighthorseman',
-    'lighthousc',
-    'lighthouseman',
-    'lighthousemen',
     'lighting-cameraman',
-    'lighting-conditions',
-    'lighting-fast',
-    'lighting-fuel',
-    'lighting-rehearsals',
-    'lighting-spread',
-    'lightkeeper',
-    'lightley',
-    'lightly&rehy;stocked',
-    'lightly-boiled',
-    'lightly-buttered',
-    'lightly-contaminated',
-    'lightly-cooked',
-    'lightly-drawn',
-    'lightly-gelled',
-    'lightly-greased',
     'lightly-laden',
-    'lightly-milled',
-    'lightly-oiled',
-    'lightly-padded',
-    'lightly-populated',
-    'lightly-pressed',
-    'lightly-stocked',
-    'lightly-strung',
-    'lightly-strutted',
-    'lightly-tanned',
-    'lightmindedness',
-    'lightnesses',
-    'lightning&rehy;flashed',
-    'lightning-blasted',
-    'lightning-conductor-like',
-    'lightning-faced',
     'lightning-flashes',
-    'lightning-flashings',
-    'lightning-like',
-    'lightning-paced',
-    'lightning-sharp',
-    'lightning-spark',
-    'lightning-spattered',
-    'lightning-split',
-    'lightning-swift',
-    'lightning.police',
-    'lightoler',
-    'lightpath',
-    'lightpencil',
-    'lightpens',
-    'lightpole',
-    'lightproof',
     'lights\'\'',
-    'lightstepping',
-    'lightsticks',
-    'lightstring',
-    'lightup',
-    'lightwing',
-    'lightwriter',
-    'lightyear',
-    'ligicharf',
-    'ligier-lamborghini',
-    'lignaform',
-    'ligneous',
-    'lignereux',
-    'ligni',
-    'lignification',
-    'lignins',
     'lignum-cassie',
-    'ligon',
-    'ligoniel',
-    'ligorio',
-    'ligresti',
-    'ligterink',
-    'ligtu',
-    'liguans',
-    'ligueur',
-    'liguory',
-    'ligures',
-    'ligustica',
-    'ligustri',
-    'lihir',
-    'lihou/mainstream',
-    'liiiike',
     'liikanen',
-    'lijoie',
-    'lik&amp',
-    'likasi',
-    'like&rehy;minded',
-    'like\'ell',
-    'like-',
-    'like-as-not',
-    'like-charged',
-    'like-could',
-    'like-faced',
-    'like-feathered',
-    'like-for',
-    'like-i',
-    'like-it-is',
-    'like-mindedness',
     'like-minds',
-    'like-sexed',
-    'like-sounding',
-    'like-spending',
-    'like-to',
-    'like-unlike',
-    'like-what',
-    'like-with-like',
-    'like-you',
-    'like.',
-    'like.it',
-    'like/',
-    'like/di:j/',
-    'like/different',
-    'like/do',
-    'like/it',
     'like_seeing',
-    'like_such',
-    'likeaaa',
-    'liked&mdash;a',
-    'liked.it',
-    'likelies',
-    'likelihood=-132.894',
-    'likelihoods-\'publishing',
-    'likelyhood',
-    'likeminded',
-    'liker',
-    'likerous',
-    'likert-style',
-    'likes-',
-    'likethat',
-    'liketo',
     'likewide',
-    'likewise.',
-    'likhovtseva',
-    'liki',
-    'liking-auntie-kate',
-    'likle',
-    'likliest',
-    'likud-dominated',
-    'likud-leaning',
-    'likyng',
-    'lilac-black',
-    'lilacina',
-    'lilburn',
-    'lilburnes',
-    'lile',
-    'lilets',
     'liliales',
-    'liliboy',
-    'lilibulero',
-    'lilico',
-    'lilied',
-    'liliiformis',
-    'liliuokalani',
-    'liljeqist',
-    'liljequist',
-    'lillan',
-    'lillands',
-    'lillee/australia',
-    'lillemoe',
-    'lilles',
-    'lillestrom',
-    'lillet',
     'lilley/social',
-    'lilley/student',
-    'lilley/victim',
-    'lilleygarth',
-    'lilleys',
-    'lillibullero',
-    'lilliburlero',
-    'lilliesleaf',
-    'lillig',
-    'lillingstone',
-    'lillington',
-    'lilliputianism',
-    'lillo',
-    'lillooet',
-    'lillye',
-    'lillystone',
     'lillyvick',
-    'lillyvicks',
-    'lilo-emptying',
-    'lilongue',
-    'lilongwe-based',
-    'lilooet',
-    'lilos',
-    'lils',
-    'lily\'',
-    'lily-coloured',
-    'lily-contoured',
-    'lily-filled',
-    'lily-fingered',
-    'lily-flowers',
-    'lily-gilding',
-    'lily-leaved',
     'lily-pad',
-    'lily-pads',
-    'lily-roots',
-    'lily-skinned',
-    'lily-trotter',
-    'lily-trotters',
-    'lilypad',
-    'lilywhite',
-    'lim&oacute;n-covenas',
-    'lim&oacute;n-puerto',
-    'lim-wood',
-    'lima-callao',
-    'limacon',
-    'limagne',
-    'limagraine',
-    'limal',
     'limavady&mdash;claudy',
-    'limay',
-    'limb&eacute',
-    'limb-aching',
-    'limb-base',
-    'limb-biting',
-    'limb-breaking',
-    'limb-bud',
-    'limb-flinging',
-    'limb-jerking',
-    'limb-joint',
-    'limb-loosening',
-    'limb-twitching',
-    'limb/royal',
-    'limbassa',
-    'limbaugh',
     'limbeers',
-    'limbergstollen',
-    'limbhood',
-    'limbkins',
-    'limbo-land',
-    'limbo-line',
-    'limbos',
-    'limbourg',
-    'limbrick/gloucestershire',
-    'limburger',
-    'limbus',
-    'lime&ntilde;o',
-    'lime&ntilde;os',
-    'lime&rehy;green',
-    'lime-and-lemon',
-    'lime-burner',
     'lime-burners',
-    'lime-encrusted',
-    'lime-induced',
-    'lime-juice',
-    'lime-light',
-    'lime-scale',
-    'lime-shaded',
-    'lime-squash',
-    'lime-topped',
-    'lime-wood',
-    'limeburners',
-    'limed-oak',
-    'limehurst',
-    'limelight.',
-    'limenios',
-    'limer',
     'limerick.',
-    'limerstone',
-    'limesticks',
-    'limestone-producing',
-    'limestone-shale',
-    'limestone/gypsum',
-    'limewoods',
-    'limid',
-    'limimited',
-    'liminary',
-    'limington',
-    'liminii',
-    'limit&eacute',
-    'limit(s)',
-    'limit*',
-    'limit-cycle',
     'limit-free',
-    'limit-order',
-    'limit-setting',
-    'limit/infinity',
-    'limitations.',
-    'limitations/size',
-    'limited-ammo',
-    'limited-iron',
-    'limited-menu',
-    'limited-period',
-    'limited-run',
-    'limited-scale',
-    'limited-slip',
-    'limited-stop',
-    'limited-term',
-    'limited-thinking',
     'limited.where',
-    'limited/ambassador',
-    'limitedly',
-    'limitedover',
-    'limiteds',
-    'limiter-like',
-    'limities',
-    'limitlessly',
-    'limitrophe',
-    'limits.in',
-    'limitsit',
-    'limmers',
-    'limmy',
-    'limn',
-    'limnaea',
-    'limnanth',
     'limning',
-    'limnititzk',
-    'limnological',
-    'limnophilia',
-    'limnopithecus',
-    'limnorid',
-    'limoed',
-    'limog&eacute',
-    'limoge',
-    'limogeage',
-    'limon-peel',
-    'limongi',
-    'limonoids',
-    'limorent',
-    'limousin-quercy',
-    'limousine-comfort',
     'limousine-landaulet',
-    'limousins',
-    'limp-brimmed',
-    'limp-dicked',
-    'limp-limbed',
-    'limpac',
-    'limpest',
-    'limpet-crusted',
-    'limpet-stuck',
-    'limpide',
-    'limpin\'',
-    'limpsfeld',
-    'limpus',
-    'limstone',
-    'limusate',
-    'lin&eacute;aires',
     'linac-injected',
-    'linacs',
-    'linal',
-    'linare',
-    'linarescentral',
-    'linaria',
-    'linarias',
-    'linas',
-    'linberg',
-    'lince',
-    'lincean',
-    'lincestis',
-    'linch-pin',
-    'linch-pins',
-    'lincki',
-    'linclines',
     'linclonshire',
-    'lincluden',
-    'linco',
-    'lincoln-jefferson-washington',
-    'lincoln-washington',
-    'lincolne',
-    'lincolnian',
-    'lincolnshire-born',
-    'linconshire',
-    'lincstone',
-    'linctus-like',
-    'linda/glasgow',
-    'lindal',
-    'lindal-in-furness',
-    'lindard',
-    'linday',
     'lindbear',
-    'lindbeck',
-    'lindbergh-like',
-    'lindburg',
-    'lindegaard',
-    'lindegren',
-    'lindel',
-    'linden-museum',
-    'linden-scented',
-    'lindenau',
-    'lindenbaum',
-    'lindenberg',
-    'lindenmann',
-    'lindens',
-    'lindenstein',
-    'lindenstrasse',
     'lindentree',
-    'linders',
-    'lindesberg',
-    'lindesfara',
-    'lindh',
-    'lindia',
-    'lindigo',
-    'lindinferetc',
-    'lindores',
-    'lindorm',
-    'lindoro',
-    'lindors',
-    'lindorus',
-    'lindowski',
-    'lindsay/asv',
-    'lindsay/director',
     'lindsay/raf',
-    'lindsay/rector',
-    'lindsey/warwickshire',
-    'lindsley',
-    'lindsleys',
-    'lindstrand',
-    'lindsy',
-    'lindt',
-    'lindum',
-    'lindy-hop',
-    'lindzey',
-    'lindzi',
-    'line&mdash;number',
-    'line&rehy;segments',
-    'line\'3',
-    'line-\'if',
     'line-1',
-    'line-and-wash',
-    'line-art',
-    'line-backer',
-    'line-breaks',
-    'line-count',
-    'line-divider',
-    'line-drawn',
-    'line-drivers',
-    'line-editing',
-    'line-elements',
-    'line-end',
-    'line-engraver',
-    'line-etched',
-    'line-filler',
-    'line-fillers',
     'line-fitting',
-    'line-follower',
-    'line-following',
-    'line-for-line',
-    'line-free',
-    'line-hut',
-    'line-ins',
-    'line-laying',
-    'line-learning',
-    'line-length',
-    'line-less',
-    'line-like',
-    'line-managers',
-    'line-of-business',
-    'line-of-flight',
-    'line-of-packet',
     'line-of-withdrawal',
-    'line-out.',
-    'line-over-line',
-    'line-read',
-    'line-readings',
-    'line-scanning',
-    'line-shading',
-    'line-sharing',
-    'line-side',
-    'line-spectra',
-    'line-speed',
-    'line-spinning',
-    'line-to-line',
-    'line-toeing',
-    'line-type',
-    'line-up-outside-the-door-and-you-can\'t-come-in-until-you\'re-quiet',
     'line-usage',
-    'line-whitened',
-    'line-width',
-    'line-working',
-    'line.',
-    'line.ben',
-    'line.brundle',
-    'line.hunters',
-    'line/',
-    'line/031',
-    'line/041',
-    'line/double-stop',
-    'line/le',
-    'line/mic',
-    'line/table',
-    'line/vent',
     'lineage-based',
-    'lineamented',
-    'lineaments.',
-    'linearise',
-    'linearising',
-    'linearizing',
-    'lineful',
-    'linehall',
-    'linekars',
-    'lineker-level',
-    'linelevel',
-    'linemen',
-    'linement',
-    'linen-and-silver',
-    'linen-bound',
-    'linen-box',
     'linen-drapers',
-    'linen-drapery',
-    'linen-is',
-    'linen-look',
-    'linen-lycra',
-    'linen-mending',
-    'linen-mix',
-    'linen-panelled',
-    'linen-room',
-    'linen-type',
-    'linen/cotton',
-    'linen/cotton/silk',
-    'linen/polyester',
-    'linen/viscose',
-    'linenhire',
-    'linenweavers',
     'liner-covered',
-    'liner-notes',
-    'liner.',
-    'lines(c)',
-    'lines-but',
-    'lines-out',
-    'lines/farmer',
-    'lines/last',
-    'lineseman',
-    'linesmans',
-    'linesmen/refs',
-    'linette',
-    'lineups',
-    'lineweaver-burk',
-    'linework',
-    'linfield-glentoran-portadown-glenavon-cliftonville',
     'linfordettes',
-    'ling-and-bracken',
-    'ling-ling',
-    'ling-temco-vought',
-    'ling/player',
-    'lingam',
-    'lingama-toleque',
-    'lingams',
-    'lingan',
-    'lingara',
-    'lingarabay',
-    'lingburgh',
-    'lingby',
-    'linge',
-    'lingenauber',
-    'lingerer',
     'lingerie-clad',
-    'lingerie-in-rock',
-    'lingeries',
-    'linghade',
-    'linghams',
-    'lingholm',
-    'lingholme',
-    'lingla',
-    'lingmore',
-    'lingoism',
-    'lingola',
-    'lingoteras',
-    'lingraves',
-    'lingsberg',
-    'linguae',
-    'linguafranca',
     'linguis',
-    'linguisism',
-    'linguistic-based',
-    'linguistic-literary',
-    'linguistic-representational',
-    'linguistic/',
-    'linguistic/literary',
-    'linguistic/logical',
-    'linguistically-',
-    'linguistically-based',
-    'linguistically-challenged',
-    'linguistically-informed',
-    'linguistically-relevant',
-    'linguistically-represented',
-    'linguistically/physically',
-    'linguistician',
     'linguistics-related',
-    'linguistics/mcgill',
-    'linguistiques',
-    'lingulid',
-    'lingwood',
-    'linha',
-    'linham',
-    'linham/organizer',
-    'linhart',
-    'linhof',
-    'linhouse',
-    'linieres',
-    'linii',
-    'liniments',
-    'linin&ndash',
-    'lininecarn',
     'lininess',
-    'lining-out',
-    'lining-side',
-    'link-boy',
-    'link-editing',
-    'link-legering',
-    'link-line',
-    'link-person',
-    'link-persons',
-    'link-type',
-    'link-wire',
-    'link-worker',
-    'link.but',
-    'link/plus',
-    'linkagriculture',
-    'linkboy',
     'linked/under-insurance',
-    'linkends',
-    'linkhall',
-    'linkhand',
-    'linkhaven',
-    'linkia',
-    'linkin',
-    'linkitis',
-    'linkline',
-    'linknames',
-    'linkpin',
-    'linkping',
-    'links-where',
-    'linkside',
-    'linksland',
-    'linkum',
     'linkup',
-    'linlake',
-    'linley-xxxx',
-    'linlithgowshire',
-    'linmack',
-    'linnane',
-    'linnarrat',
-    'linnchurping',
-    'linndeman',
-    'linne',
-    'linneaus',
-    'linneman',
-    'linnena',
-    'linnendraper',
-    'linnet\'s&mdash',
-    'linnet-like',
     'linneus',
-    'linning',
-    'lino-cut',
-    'lino-floored',
-    'linocut',
-    'linoey',
-    'linoleoyl',
-    'linoleum-covered',
-    'linoleum-infested',
-    'linoleum-like',
-    'linoleum-topped',
-    'linoleumed',
-    'linom',
-    'linos',
-    'linotype-printing',
-    'linpack',
     'linpoh',
-    'lins',
-    'linsang',
-    'linsbauer',
-    'linscott/somerville',
-    'linsdell',
-    'linse',
-    'linsell/nursing',
-    'linsenmair',
-    'linsey-woolsy',
-    'linslade.',
-    'linson',
-    'linster',
-    'lint-bandage',
-    'lint-filled',
-    'lint-haired',
     'lintek',
-    'lintell',
-    'linters',
-    'linthal-ziegelbrucke',
-    'linthouse',
-    'linthwaite',
-    'lintners',
-    'lintock',
-    'lintom-orman',
-    'lintrethen',
-    'lintvalve',
-    'linval',
-    'linview',
-    'linyphiids',
-    'linyun',
-    'linzen',
     'linzer',
-    'linzie/edinburgh',
-    'liocarcinus',
-    'liod',
-    'lioh',
-    'lion\'s-share',
-    'lion\'s-teeth',
-    'lion\'s-tooth',
-    'lion-body',
-    'lion-cachet',
-    'lion-cubs',
-    'lion-goddesses',
-    'lion-gold',
-    'lion-head',
-    'lion-hunt',
-    'lion-infested',
     'lion-masked',
-    'lion-mouth',
-    'lion-neck',
-    'lion-surmounted',
-    'lion-watchers',
-    'lional',
-    'lioncare',
-    'lioncover',
-    'lione',
-    'lioneljohnson',
-    'lionhart',
-    'lionhope',
-    'lionis',
-    'lionisation',
-    'lionises',
-    'lionish',
     'lionising',
-    'lionization',
-    'lionking',
-    'liono',
-    'lionshare',
-    'lionskin',
-    'liontail',
-    'lionweld',
-    'liony',
-    'liopleurodon',
-    'lioretograph',
-    'lioretographs',
-    'liouville',
-    'liozno',
-    'lip-biting',
-    'lip-curling',
     'lip-first',
-    'lip-flesh',
-    'lip-glossed',
-    'lip-licking',
-    'lip-line',
-    'lip-lock',
-    'lip-o-sections',
-    'lip-readers',
-    'lip-removal',
-    'lip-smackin',
-    'lip-spoken',
-    'lip-synched',
-    'lip-synching',
-    'lip/plh',
-    'lipalian',
-    'lipalike',
     'lipara',
-    'lipase-colipase',
-    'lipases',
-    'lipcote',
-    'lipectomy',
-    'lipetsk',
-    'lipetz',
-    'lipex',
-    'liphook&ndash;alton',
-    'liphool',
-    'lipid-',
-    'lipid-coated',
-    'lipid-containing',
-    'lipid-induced',
-    'lipid-metabolizing',
-    'lipid-storing',
     'lipid-water',
-    'lipid/',
-    'lipid/ml',
-    'lipidologists',
-    'lipietz\'',
-    'lipif',
-    'liping',
-    'lipinski',
-    'lipip',
-    'liplines',
-    'lipo-oxygenase',
-    'lipoarabinomannan',
-    'lipodystrophy',
-    'lipofection',
-    'lipogenesis',
-    'lipolysed',
     'lipomata',
-    'lipophilicity',
-    'lipoproteic',
-    'lipos',
-    'liposomal',
-    'liposome-mediated',
-    'liposome-system',
-    'lipov&scaron;ek',
-    'lipovecheja',
-    'lippekonow',
-    'lippenin',
-    'lippert',
-    'lippett',
-    'lippetts',
-    'lippily',
-    'lippisch',
     'lippits',
-    'lippitts',
-    'lippstadt',
-    'lippuner',
-    'lipreader',
-    'lips-based',
-    'lips/eugenius',
-    'lipschutz',
-    'lipscomb/moreton',
-    'lipscombes',
-    'lipsedge',
-    'lipservice',
-    'lipsitz',
-    'lipsmackin',
-    'lipsmacking',
-    'lipsmackingly',
     'lipson',
-    'lipstick-smeared',
-    'lipstick-stained',
-    'lipstick-tube',
-    'lipstick.',
-    'lipsync',
-    'lipsynca',
-    'liptinite',
-    'liptinite-rich',
-    'liptint',
-    'liptrot',
-    'lipu',
-    'lipulin',
-    'lipunan',
-    'liputin',
-    'lipvinoff',
     'lipyatt',
-    'lipztik',
-    'liqing',
-    'liquafruta',
-    'liquamen',
-    'liqueur-maker',
-    'liqueur-sized',
-    'liquid-',
-    'liquid-based',
-    'liquid-drop',
-    'liquid-level',
-    'liquid-like',
-    'liquid-lunch-from-hell',
-    'liquid-natural-gas',
-    'liquid-polymer',
-    'liquid-solid',
     'liquid-vapour',
-    'liquid/gas',
-    'liquid=2',
-    'liquidation/bankruptcy',
-    'liquidationist',
-    'liquidator-awaiting',
-    'liquidem',
-    'liquidi',
-    'liquidiating',
-    'liquidiation',
-    'liquidised',
-    'liquidized',
-    'liquidizing',
-    'liquidy',
-    'liquipak',
-    'liquipaks',
     'liquisil',
-    'liquissia',
-    'liquitrak',
-    'liquor-loosened',
-    'liquor-smells',
-    'liquor-store',
-    'liquored-up',
-    'liquorice-coloured',
-    'liquorice-tasting',
-    'liquorices',
-    'liquorish',
-    'liquorites',
-    'liquourice',
-    'lira-laden',
-    'liras',
-    'lire-laden',
     'lirg',
-    'liria',
-    'liriano',
-    'lirio',
-    'liris',
-    'liroff',
-    'liron',
-    'lirrechur',
-    'lis&rehy;teners',
-    'lisa-jane',
-    'lisa-x',
-    'lisandrello',
-    'lisanelly',
-    'lisanne',
-    'lisas',
-    'lisbay',
     'lisbjerg',
-    'lisbofin',
-    'lisburne',
-    'liscahane',
-    'liscano',
-    'liscences',
-    'liscia',
-    'liscomb',
-    'liscombe',
-    'liseanne',
-    'liseberg',
-    'lisef',
-    'lisences',
-    'lisens',
-    'lisette',
-    'liseuse',
     'lisiewicz',
-    'lisinski',
-    'liskamm',
-    'liskov',
-    'lisle/oxfordshire',
-    'lisles',
-    'lisnagelvin',
-    'lisnaskea-newtonbutler',
-    'lisners',
-    'lisniskey',
-    'lisos',
-    'lisov',
-    'lisp-machine',
-    'lispector',
-    'lispings',
-    'lissack',
     'lissamine',
-    'lissek',
-    'lisselle',
-    'lissett',
-    'lissie',
-    'lissitzky',
-    'lissons',
-    'lissy',
-    'list&dstrok;3urinn',
-    'list&mdash;all',
-    'list&mdash;buyer',
-    'list&mdash;of&mdash;dc&mdash;package',
-    'list&mdash;seller',
-    'list**',
-    'list-form',
-    'list-is',
     'list-swapping',
-    'list/is',
-    'listad',
-    'listed/quoted',
-    'listed/regulated',
-    'listel',
-    'listen&mdash;otherwise',
-    'listen-',
-    'listen-in',
-    'listen-to-me',
-    'listenability',
-    'listened.',
-    'listened_at',
-    'listener-blaming',
-    'listener-narrator',
-    'listener-related',
     'listenin',
-    'listening-',
-    'listening-conditions',
-    'listening-devices',
-    'listening-level',
-    'listening-posts',
-    'listening.',
-    'listening/answering',
-    'lister-hooded',
-    'lister-kaye',
-    'lister-petter',
-    'listerine',
-    'listeriosis',
-    'listica',
-    'listing&rehy;that',
-    'listing.',
     'listingsws26',
-    'listingsws30',
-    'listingsws36',
-    'listloaning',
-    'listnership',
-    'liston-patterson',
-    'listos',
-    'listrel.lis',
-    'listress',
-    'lists.keith',
-    'listserver.',
-    'listvyanka',
-    'lisvesly',
-    'liszt-thalberg',
-    'lisztomania',
-    'lit&rehy;ter',
     'litaize',
-    'litan',
-    'litaniae',
-    'litchborough',
-    'litchdon',
-    'litchet',
-    'litchfields',
-    'litchurch',
-    'lite-metal',
-    'lite/25c',
-    'liteis',
-    'litelines',
-    'literacy/numeracy',
-    'literalise',
-    'literalised',
-    'literalising',
     'literality',
-    'literalizes',
-    'literalizing',
-    'literall',
-    'literally\'',
-    'literalminding',
-    'literarily',
-    'literary-based',
-    'literary-cum-public-affairs',
-    'literary-establishment',
-    'literary-intellectual',
-    'literary-minded',
-    'literary-sleuth',
-    'literary-theoretical',
-    'literary/linguistic',
-    'literary/political',
     'literas',
-    'literat',
-    'literate/pre-literate',
-    'literately',
-    'literature-',
-    'literature-based',
-    'literature-nucella',
-    'literature-search',
-    'literature-searching',
-    'literature.a',
-    'literature/derrida/philosophy',
-    'literature/material',
-    'literature/publications',
-    'literaturgeschichte',
-    'litererry',
-    'lites',
     'litesome',
-    'litfest',
-    'lith',
-    'lithafest',
-    'litharge',
-    'litheness',
-    'lither',
-    'litherland-born',
-    'lithest',
-    'lithgows',
-    'lithiasis',
-    'lithiomethane',
-    'lithionite',
-    'lithistid',
-    'lithium-bearing',
-    'lithium-calcium',
     'lithium-strontium',
-    'lithiums',
-    'litho-',
-    'litho-printing',
-    'litho/porosity',
-    'lithobius',
-    'lithodora',
-    'lithofunction',
-    'lithogeochemical',
-    'lithographe',
-    'lithographers',
-    'lithographics',
-    'lithographs.',
-    'lithographus',
-    'lithol',
-    'lithola',
     'litholigies',
-    'lithologic',
-    'lithologically',
-    'lithonia',
-    'lithophile-element-enriched',
-    'lithophones',
-    'lithophyllum',
-    'lithosiderites',
-    'lithosomes',
-    'lithostatic',
-    'lithoto',
-    'lithotripters',
-    'lithping',
-    'lithrig',
-    'liths',
-    'lithuanian-born',
     'lithuanian-byelorussian',
-    'lithuanian-polish',
-    'lithuanian-run',
-    'lithuanian-russian',
-    'lithuanian-soviet',
-    'lithuanian.',
-    'litigation-dodging',
-    'litigation-dominated',
-    'litigation-hungry',
-    'litigation-related',
-    'litigation-style',
-    'litigation-type',
-    'litigators&mdash;particularly',
-    'litigiousness-inappropriate',
-    'litil',
-    'litill',
     'litimpex',
-    'lititz',
-    'litla',
-    'litmus-paper',
-    'lito',
-    'litoptems',
-    'litoptern',
-    'litoria',
-    'litotes',
-    'litotrite',
-    'litovchenko',
-    'litovel',
-    'litre-carton',
-    'litre-sized',
-    'litre.mol',
-    'litre/',
     'litre/1&frac34',
-    'litre/2',
-    'litre/2&frac12',
-    'litre/2pt/4&frac12',
-    'litre/2pt/5',
-    'litre/3pt/7&amp',
-    'litre/4',
-    'litres-worth',
-    'litres.',
-    'litres/2&frac12',
-    'litres/2.5',
-    'litres/220',
-    'litres/h',
-    'litres/had',
-    'litres/hectare',
-    'litres/metre',
     'litt&eacute;raires',
-    'litt.',
-    'littain',
-    'littaur',
-    'littbarski',
-    'litte',
-    'littelwoods',
-    'litter&auml;ra',
-    'litter-a-chewer',
-    'litter-based',
-    'litter-bearers',
-    'litter-blown',
-    'litter-box',
-    'litter-choked',
-    'litter-clutter',
-    'litter-disposal',
     'litter-feeding',
-    'litter-lout',
-    'litterateurs',
-    'litterer',
-    'litterfall',
-    'litteris',
-    'litterpool',
-    'litterstrewn',
-    'littl\'uns',
-    'little&mdash',
-    'little\'',
-    'little\'n',
-    'little-\'un',
-    'little-aired',
-    'little-associations',
-    'little-bit-of',
     'little-bit-of-bread-and-no-cheeeeese',
-    'little-black',
-    'little-boy-lost',
-    'little-crested',
-    'little-developed',
-    'little-englandism',
-    'little-extra',
-    'little-frequented',
-    'little-heard-of',
-    'little-heralded',
-    'little-knowns',
-    'little-light',
-    'little-loved',
-    'little-magazine',
-    'little-miss-never-forgets',
-    'little-noted',
     'little-old-lady',
-    'little-or',
-    'little-practised',
-    'little-publicised',
-    'little-publicized',
-    'little-remembered',
-    'little-researched',
-    'little-shown',
-    'little-taught',
-    'little-tested',
-    'little-tried',
-    'little/homeless',
-    'little/leicester',
-    'little/no',
-    'little/oxford',
-    'little/recruitment/',
     'little/sixth',
-    'littlebank',
-    'littlebredy',
-    'littlechester',
-    'littlecotes',
-    'littledean',
-    'littledean/gloucestershire',
-    'littlefeather',
-    'littlegate',
-    'littleham',
-    'littlehey',
-    'littleknown',
-    'littlemore/oxfordshire',
-    'littlepage',
-    'littletons',
-    'littletown',
     'littleuns',
-    'littleweeds',
-    'littlewood/nasuwt',
-    'littly',
-    'littmannen',
-    'littora',
-    'littoria',
-    'lituratus',
-    'liturgical-musical',
-    'liturgiological',
-    'lituya',
-    'litvaks',
-    'litvonov',
-    'litynski',
-    'litzmannstadt',
-    'litzmannstadter',
     'liu/ning/wang/wen',
-    'liubimov',
-    'liuchow',
-    'liudger',
-    'liudi',
-    'liue',
-    'liuerie',
-    'liuski',
-    'liuti',
-    'liutizi',
-    'liuto',
-    'liv\'ry',
-    'livaccari',
-    'livadi&agrave',
-    'livadia',
-    'live&lsqb;s&rsqb',
     'live\'',
-    'live-aboard',
-    'live-aid',
-    'live-axle',
-    'live-effect',
-    'live-firing',
-    'live-for-the-day',
-    'live-long',
-    'live-now-pay-later',
-    'live-section',
-    'live-span',
-    'live-stock',
-    'live-virus',
-    'live-weight',
-    'live.',
-    'live.s',
     'live/gargy',
-    'live/tv',
-    'liveability',
-    'livebearing',
-    'lived\'',
-    'lived-happily-ever-after',
-    'lived.here',
-    'lived_up',
-    'liveish',
-    'livelihood-jobs',
-    'livelines',
-    'lively-eyed',
-    'lively-looking',
-    'lively-minded',
-    'lively-sprig',
-    'liveners',
     'liveon-a-tightrope',
-    'liver*',
-    'liver-',
-    'liver-and-bacon',
-    'liver-and-wine-roll',
-    'liver-brown',
-    'liver-cancer-causing',
-    'liver-eating',
-    'liver-fluke',
-    'liver-function',
-    'liver-marked',
-    'liver-rot',
-    'liveras',
-    'liverishly',
-    'liverman',
-    'liveron',
     'liverpool&ndash;newton',
-    'liverpool-',
-    'liverpool-centred',
-    'liverpool-euston',
-    'liverpool-everton',
-    'liverpool-kirby',
-    'liverpool-newcastle',
-    'liverpool.thus',
-    'liverpool/',
-    'liverpool/spurs/hendon',
-    'liverpool1',
-    'liverpoolborn',
-    'liverpoolportsmouth',
-    'liverpools',
-    'liverpoolthe',
-    'livers-in-sin',
     'liverseed',
-    'liversidges',
-    'liversuch',
-    'livery-porters',
-    'lives-in',
-    'lives/in',
-    'livesey-hawarth',
-    'livesley',
-    'livestock&rehy;rearing',
-    'livestock-rearing',
-    'livestock-with-grass',
-    'livestock.',
-    'livestock/early',
-    'liveware\'',
-    'livi-bacci',
-    'livigno',
     'livin\'-room',
-    'living&rehy;rooms',
-    'living-',
-    'living-but-dead',
-    'living-chamber',
-    'living-come-dining',
-    'living-conditions',
-    'living-cum-bedroom',
-    'living-cum-dining',
-    'living-dining',
-    'living-dining-room',
-    'living-flame',
-    'living-kitchen',
-    'living-spaces',
-    'living-through',
-    'living-together',
     'living-with-it',
-    'living/dining-room/kitchen',
-    'living/dining/cooking',
-    'living/neck',
-    'living/working/studying',
-    'livingi-room',
-    'livingston-based',
-    'livingstonian',
-    'livinia',
-    'livng',
-    'livno',
-    'livock',
-    'livolsi',
-    'livorne',
-    'livornese',
-    'livradois-forez',
     'livre-objet',
-    'livvy',
-    'livweight',
-    'lixin',
-    'lixivia',
-    'lixiviating',
-    'lixouri',
-    'lixs',
-    'liyange',
-    'liyeko',
-    'liyun',
-    'liz\'',
-    'liz\'s',
-    'liz-beth',
-    'lizard-bites',
-    'lizard-clad',
     'lizard-eating',
-    'lizard-grease',
-    'lizard-tailed',
-    'lizardess',
-    'lizardo',
-    'lizardy',
-    'lizars',
-    'lizs',
-    'lizti',
-    'lizz',
-    'lizzie&mdash',
-    'lizzio',
-    'lj-c',
-    'lj.',
-    'ljacic',
-    'ljacii',
     'ljacil',
-    'ljack',
-    'ljacli',
-    'ljacll',
-    'ljb',
-    'ljc',
-    'ljiljana',
-    'ljkb',
-    'ljotic',
-    'ljp',
-    'ljubic',
-    'ljubitza',
-    'ljubliana',
-    'ljubov',
-    'ljuic-mijatovic',
-    'ljungh',
     'ljungqvist',
-    'lkdhgryuiepkdsiwlgorrmfilekmd',
-    'lkj',
-    'lkong',
-    'lkot',
-    'lkp',
-    'lkp&mdash;liberal',
-    'lkprincipal',
-    'lkw-montagsgesellschaft',
-    'll&ecirc;n',
-    'll&uacute;vatar',
-    'll.3oam',
-    'll.d',
-    'll/pc',
-    'll11',
-    'll13',
     'll20',
-    'll24',
-    'll26',
-    'll53',
-    'll55',
-    'lla',
-    'llach',
-    'llad&oacute',
-    'lladro',
-    'llaethog',
-    'llaf',
-    'llagonne',
-    'llais',
-    'llallagua',
-    'llan-beder-dyffryn-clwyd',
-    'llan-fawr',
     'llanaber',
-    'llanadeilo',
-    'llanaelhaearn',
-    'llanarthney',
-    'llanberris',
-    'llanboidy',
-    'llanbydder',
-    'llandanwg',
-    'llanddaniel',
-    'llanddoged',
-    'llanddona',
-    'llanddowror',
-    'llanddwyn',
-    'llandegfan',
-    'llandegfed',
-    'llandegla',
     'llandeloy',
-    'llanderfel',
-    'llandewi',
-    'llandidlo',
-    'llandidloes',
-    'llandoger',
-    'llandough',
-    'llandovery-carmarthen',
-    'llandridnod',
-    'llandrindod-llandeilo',
-    'llandrog',
-    'llandsyl',
-    'llandulas',
-    'llandybie',
-    'llandynan',
-    'llandyrnog',
     'llandysul',
-    'llanelli-born',
-    'llanengan',
-    'llanerchgoediog',
-    'llanerfyl',
-    'llaneros',
-    'llanes',
-    'llanfair-yn-neubwll',
-    'llanfairfeshan',
-    'llanfairpwllgwyngyllgogerychwyrndrobwllllantysiliogogogoch',
-    'llanferres',
-    'llanfighangel',
-    'llanfraith',
-    'llanfranco',
-    'llanfynydd',
-    'llangadod',
     'llangain',
-    'llangan',
-    'llangathen',
-    'llangatwg',
-    'llangedwyn',
-    'llangefny',
-    'llangeitho',
-    'llangennech',
-    'llangernyw-based',
-    'llangian',
-    'llangloffan',
-    'llangorse',
-    'llangower',
-    'llangranog',
-    'llangwnnadl',
-    'llangwyfan.',
     'llangwylan',
-    'llangybi',
-    'llangynhafal',
-    'llangynidir',
-    'llangywneth',
-    'llanherne',
-    'llanidloes-',
-    'llanishen',
-    'llanivaloes',
-    'llanllwchaiarn',
-    'llanllwni',
-    'llanonig',
-    'llanpadrig',
-    'llanrhaedr-ym-mochnant',
-    'llanrhaiadr',
-    'llanrothal',
     'llansadwrn',
-    'llansamlet',
-    'llansanfraid',
-    'llansannan',
-    'llantada',
-    'llantysilio',
-    'llanunwas',
-    'llanvillin',
-    'llanwddyn',
-    'llanwenog',
-    'llanwnda',
-    'llanwrda',
-    'llanwrin',
-    'llanwrst',
-    'llanwst',
-    'llanwyrtyd',
     'llanyblodwel',
-    'llanymawddwy',
-    'llata',
-    'llawer',
-    'llawhaden',
-    'llawrybetws',
-    'llawryetws',
-    'llawryglyn',
-    'llawysgrif',
-    'llc',
-    'llcg',
-    'llcm',
-    'llebar',
-    'llecen-fylliad',
-    'llecheiddior',
-    'llechryd',
     'llechwan',
-    'llechwen',
-    'lledo',
-    'llegadas',
-    'llelliot',
-    'llenarasas',
-    'lleras',
-    'llerena',
-    'llers',
-    'lleshi',
-    'llethyr',
-    'lleven',
-    'llewela',
-    'llewellyn-davies',
-    'llewellyn-jones/space',
-    'llewellyn-smith/st',
     'llewellyn/holiday',
-    'llewellyns',
-    'llf',
-    'llford',
-    'llgc',
-    'lli',
-    'llica',
-    'llipi',
-    'llldldllll',
-    'lllu',
-    'lln',
-    'llobateres',
-    'llobera',
-    'llodio',
-    'lloer',
-    'lloffion',
     'llog',
-    'lloll',
-    'llompart',
-    'llong',
-    'llopy',
-    'lloral',
-    'lloredo',
-    'llorente-evans',
-    'llowarch',
-    'lloyd&rehy;jones',
-    'lloyd-davis/doctor',
-    'lloyd-foxe',
-    'lloyd-owen',
-    'lloyd-still',
-    'lloyd-webber-adapted',
-    'lloyd-webber/appeal',
     'lloyd/automobile',
-    'lloyd/gloucestershire',
-    'lloyd/gulf',
-    'lloyd/parent',
-    'lloyd/rachel',
-    'lloyd/slater',
-    'lloyd/witness',
-    'lloydia',
-    'lloyds-barclays',
-    'lloyds-midland',
-    'lloyds.he',
-    'lloydy',
-    'llp1521',
-    'llr',
-    'llud-nuatha',
-    'lluisa',
     'llusg',
-    'llwybr',
-    'llwyndyrys',
-    'llwyngwril',
-    'llwynmadoc',
-    'llwynowern',
-    'llyarch',
-    'llyfr',
-    'llyfrau',
-    'llyfryddiaeth',
-    'llyftyn',
-    'llygad-dyst',
-    'llyn-y-fan',
-    'llyr',
-    'llys-y-fr&acirc;n',
-    'llysfaen',
     'llystyn',
-    'llywarch',
-    'llywelyn-williams',
-    'lm\'',
-    'lm/',
-    'lm/x',
-    'lm1.50',
-    'lm10(f2)',
-    'lm308a',
-    'lm32900',
-    'lm3915n',
-    'lm50',
-    'lm6',
-    'lm8',
-    'lm_',
-    'lmc/mmc',
     'lmcdrains',
-    'lmediated',
-    'lmh',
-    'lmi',
-    'lmk',
-    'lmmlsclble',
-    'lmn',
-    'lmpa',
-    'lmportant',
-    'lms.',
-    'lmsgsize',
-    'lmsr-built',
-    'lmvh',
-    'ln(&formula)',
-    'ln-foe',
-    'ln2',
     'ln4',
-    'lndeed',
-    'lndn',
-    'lne',
-    'lnfanticide',
-    'lnn',
-    'lnr',
-    'lnterlaken',
-    'lnternational',
-    'lnternationalism',
-    'lnternationals',
-    'lntifada',
-    'lnts',
-    'lnwr-boilerhouse-private',
-    'lo!s',
-    'lo&iuml;c',
     'lo&lsqb;rd&rsqb',
-    'lo&lsqb;rdshi&rsqb;p',
-    'lo&ndash',
-    'lo&ndash;e',
-    'lo&ndash;g',
-    'lo-and-behold',
-    'lo-bay-lia',
-    'lo-cal',
-    'lo-cal-ity',
-    'lo-cost',
-    'lo-fi',
-    'lo-han',
-    'lo-i',
-    'lo-lo',
-    'lo-nd',
-    'lo-price',
     'lo-pro',
-    'lo-rent',
-    'lo-ves',
-    'lo-yang',
-    'lo-yi',
-    'lo/',
-    'lo/lo',
-    'load-bearer',
-    'load-bearers',
-    'load-changes',
-    'load-discharge',
-    'load-factor',
-    'load-independent',
-    'load-it',
-    'load-line',
-    'load-restricting',
     'load-up',
-    'load-using',
-    'load/elongation',
-    'load/project',
-    'load/speed',
-    'loadbearing.',
-    'loaded/mavis',
-    'loaden',
-    'loader-mounted',
-    'loader/leveller',
-    'loader/levellers',
-    'loadfix',
-    'loading-doors',
-    'loading/unloading',
-    'loadpot',
-    'loads-of-geeks-crapping-away',
     'loadsagoals',
-    'loadsashares',
-    'loadsaswearwords',
-    'loadstone',
-    'loaf-sized',
-    'loaf-sugar',
-    'loam-laden',
-    'loan&mdash;see',
-    'loan(s)',
-    'loan-accounts',
-    'loan-book',
-    'loan-buying',
-    'loan-chest',
-    'loan-deal',
-    'loan-financed',
-    'loan-granting',
     'loan-guarantee',
-    'loan-related',
-    'loan-shark',
-    'loan-sharks',
-    'loan-tied',
-    'loan-word',
-    'loan/',
-    'loan/rental',
-    'loan/supply',
-    'loanee',
-    'loanon',
-    'loans-based',
-    'loans.',
-    'loans/photocopies',
-    'loasby',
-    'loasdamoney',
     'loasses',
-    'loat',
-    'loathesome-on-sea',
-    'loathesomeness',
-    'loathings',
-    'loathsomeness',
-    'loaves-and-fishes',
-    'lob-h',
-    'lob-medallions',
-    'loba',
-    'lobal',
-    'loban',
-    'lobanov-rostovsky',
-    'lobao',
-    'lobaria',
-    'lobation',
     'lobatus',
-    'lobb.',
-    'lobban/',
-    'lobbs',
-    'lobby\'&rehy;adding',
-    'lobby-bar',
-    'lobby-dosser',
-    'lobby-force',
-    'lobby-level',
-    'lobby-press',
-    'lobe-ended',
-    'lobel',
-    'lobel-page',
-    'lobeliaceae',
-    'lobelioids',
-    'lobengula',
     'lobetal',
-    'lobita',
-    'loblaw',
-    'lobopod-like',
-    'lobopods',
-    'lobos-penned',
-    'lobotes',
-    'lobothyris',
-    'lobotidae',
-    'lobotomies',
-    'lobotomise',
-    'lobotomising',
-    'lobotomized',
-    'lobster-claw',
-    'lobster-coloured',
-    'lobster-fishing',
     'lobster-like',
-    'lobster-pot',
-    'lobster-red',
-    'lobsterdor',
-    'lobsterman',
-    'lobulated',
-    'lobus',
-    'loc-ated',
-    'loc.',
-    'loc.cit.',
-    'locabail',
-    'locahn',
-    'local-',
-    'local-area',
-    'local-authority-wide',
-    'local-boy',
     'local-bus',
-    'local-education',
-    'local-local',
-    'local-party',
-    'local-planning',
-    'local-rate',
-    'local-sounding',
-    'local-storyteller',
-    'local-tax',
-    'local-telephone',
-    'local/community',
-    'local/individual',
-    'local/national',
-    'local/occupational',
-    'local/regional',
-    'local/school',
     'local/specialist',
-    'local/standard',
-    'local2',
-    'locale\'',
-    'localelli',
-    'localisers',
-    'localistic',
-    'localists',
-    'localitatea',
-    'locality-oriented',
-    'locality/habitat',
-    'locally-administered',
-    'locally-applied',
-    'locally-appropriate',
-    'locally-available',
-    'locally-bottled',
     'locally-brewed',
-    'locally-constructed',
-    'locally-determined',
-    'locally-developed',
-    'locally-driven',
-    'locally-financed',
-    'locally-free',
-    'locally-generated',
-    'locally-identified',
-    'locally-killed',
-    'locally-made',
-    'locally-offered',
-    'locally-organised',
-    'locally-oriented',
-    'locally-resident',
-    'locally-transmitted',
     'locally-written',
-    'locan',
-    'locants',
-    'located/created',
-    'locating/creating',
-    'location-based',
-    'location-obviously',
-    'location-shoot',
-    'location.',
-    'location/hardship',
-    'location/speed',
-    'locavacances',
-    'locc.',
-    'loch-end',
-    'lochan-speckled',
-    'locharbriggs',
     'lochard',
-    'lochay',
-    'lochbridge',
-    'lochbuie',
-    'lochdochart',
-    'lochead',
-    'lochfyne',
-    'lochgelly',
-    'lochium',
-    'lochluichart',
-    'lochmallen',
-    'lochnagar-glen',
-    'lochnell',
-    'lochovsky',
-    'lochow',
-    'lochowski',
     'lochrosqua',
-    'lochrosque',
-    'lochryan',
-    'lochsen',
-    'lochwinnoch',
-    'locjs',
-    'lock&rehy;outs',
-    'lock\'n',
-    'lock\'n\'loll',
-    'lock-gates',
-    'lock-house',
-    'lock-jaws',
-    'lock-keepers',
-    'lock-knit',
-    'lock-making',
-    'lock-manufacturer',
     'lock-obers',
-    'lock-pickers',
-    'lock-sets',
-    'lock-shop',
-    'lock-stitch',
-    'lock-swivel',
-    'lock-together',
-    'lock-turn',
-    'lock-up-your-daughters',
-    'lock/evening',
-    'lock/social',
-    'locke\'',
-    'locked-down',
-    'locked-out',
-    'locker-key',
-    'locker-lined',
     'locker-rooms',
-    'lockerbie-trained',
-    'lockerbie-type',
-    'lockerbies',
-    'lockermen',
-    'lockfast',
-    'lockgate',
-    'lockgates',
-    'lockharts',
-    'lockhead',
-    'lockheed-boeing-general',
-    'lockheed-california',
-    'lockheed-led',
-    'locking-bar',
-    'locking-catch',
-    'locking-in',
     'locking-unlocking',
-    'lockinge/oxfordshire',
-    'lockings',
-    'lockinver',
-    'lockjawed',
-    'lockkeeper',
-    'locklaven',
-    'locklear',
-    'locklees',
-    'lockless',
-    'lockleys',
-    'lockmaking',
-    'lockplate',
-    'locks.',
-    'locksbrook',
-    'lockstep',
     'lockup',
-    'lockview',
-    'lockwell',
-    'lockwood&mdash;how',
-    'lockwoods',
-    'lockyer/daughter',
-    'lockyer/debtor',
-    'lockyer/managing',
-    'lockyers',
-    'locl',
-    'loco-hauling',
-    'loco-pull',
-    'loco-starved',
-    'locombe-stapleford',
-    'locomen',
-    'locomotif',
     'locomotion.',
-    'locomotive-manufacturing',
-    'locomotive-testing',
-    'locorriere',
-    'locorriere/singer',
-    'locost',
-    'locrian&amp;sharp',
-    'loctite',
-    'locum_tenens',
-    'locurto',
-    'locuses',
-    'locust-infested',
-    'locust-shaped',
-    'locust-shells',
-    'locutionary',
-    'lod&eacute;on',
     'lodable',
-    'lodberries',
-    'lodd',
-    'lodder',
-    'lode-gold',
-    'lodekka',
-    'loden-green',
-    'lodestars',
-    'lodestones',
-    'lodgaard',
-    'lodge&ndash;muirhead',
-    'lodge-building',
-    'lodgebury',
-    'lodgement/deformation',
-    'lodgements',
-    'lodgemoore',
     'lodger-stroke-offspring',
-    'lodgest',
-    'lodgin\'',
-    'lodging-houses-for-single-men',
-    'lodgings/digs',
-    'lodmoor',
-    'lodo',
-    'lodoicea',
-    'lodoli',
-    'lodose',
-    'lodowyck',
-    'lodron',
-    'lodrons',
-    'loeak',
-    'loean',
-    'loebl',
     'loebneri',
-    'loedemel',
-    'loei',
-    'loek',
-    'loenfjord',
-    'loening-baucke',
-    'loerincz',
-    'loesch',
-    'loeselii',
-    'loessic',
-    'loewensberg',
-    'loewenson',
-    'loewy',
-    'loewyne',
-    'lof',
-    'lofa',
     'loffreda',
-    'lofotens',
-    'lofrans',
-    'loft-ladder',
-    'loftb',
-    'lofters',
-    'loftheim',
-    'lofthouses',
-    'lofton',
-    'lofts.',
-    'lofty-spired',
-    'loftye',
-    'log(f)',
-    'log(y)',
-    'log-and-stone',
-    'log-boats',
     'log-built',
-    'log-burning',
-    'log-cabin\'',
-    'log-cabin-',
-    'log-chinking',
-    'log-exporting',
-    'log-flume',
-    'log-ins',
-    'log-jammed',
-    'log-laden',
-    'log-likelihood',
-    'log-periodogram',
-    'log-pile',
-    'log-power',
-    'log-sawing-like',
-    'log-walking',
     'log-whip',
-    'log/',
-    'log/linear',
-    'log10',
-    'log20',
-    'log2n',
-    'logan/thames',
-    'loganlea',
-    'logans',
-    'logar',
-    'logarithmotechnia',
-    'logarythmic',
-    'logdon',
-    'logermann',
-    'logfile',
-    'logge',
     'logged-on',
-    'logged-out',
-    'loggen',
-    'loggenberg',
-    'logger-heads',
-    'loggerenberg',
-    'loggerhead-1',
-    'logging-in',
-    'logging-while-drilling',
-    'loggionni',
-    'loggs',
-    'loggy',
-    'logi',
-    'logiblocks',
-    'logic-free',
-    'logic-induced',
     'logic-type',
-    'logic/modelling/transmission',
-    'logica-data',
-    'logicae',
-    'logical\'/',
-    'logical/illogical',
-    'logical/physical',
-    'logically-planned',
-    'logically-sequenced',
-    'logically_prior',
-    'logico-mathematical',
-    'logico-truth-conditional',
-    'login&gt',
-    'login.sql',
-    'logist',
-    'logisticians',
     'logo-bearing',
-    'logo-ed',
-    'logo-sporting',
-    'logo/status/money',
-    'logocentrism-',
-    'logodaedalus',
-    'logographic',
-    'logokwa',
-    'logomachist',
-    'logothetis',
-    'logotypes',
-    'logrank',
-    'logs.',
-    'logsdail/consultant',
-    'logteren',
-    'logweed',
     'loh',
-    'lohali',
-    'lohani',
-    'loharu',
-    'lohaus',
-    'lohe',
-    'loheit',
-    'lohest',
-    'lohf',
-    'lohman',
-    'lohoues',
-    'loi-aut&eacute',
-    'loike',
-    'loin\'',
-    'loin-cloths',
-    'loin-death',
     'loincloth.',
-    'loined',
-    'loinheart',
-    'loins.',
-    'loinshendale',
-    'loinskin',
-    'lointain',
-    'lointaine',
-    'loire-style',
-    'loisaida',
-    'loisellepresident',
-    'loisirs',
-    'loiterin\'',
-    'loja',
-    'lojack',
-    'lojacono',
     'lojo',
-    'lok-language',
-    'lok-style',
-    'lokamaya',
-    'loken',
-    'lokeren',
-    'lokes',
-    'lokinap',
-    'lokki-lines',
-    'lokking',
-    'lokkys',
-    'lokoja',
-    'lokole',
-    'lokomotiv',
-    'lokono',
-    'lokrian',
     'lokrum',
-    'loks',
-    'lokshen',
-    'lola-ford',
-    'lola-mugen',
-    'lolani',
-    'lolini',
-    'loliondo',
-    'lolland',
-    'lollapalooza-type',
-    'lollapaloozas',
-    'lollar',
-    'lolley',
-    'lolli',
-    'lolli-hop',
-    'lolli-pops',
     'lollibrigida',
-    'lollilop',
-    'lolling-tongued',
-    'lollipop-shaped',
-    'lollipop-sucking',
-    'lollo.',
-    'lollobrigida',
-    'lollop',
-    'lollopalong',
-    'lolloper',
-    'lollopped',
-    'lollops',
-    'lollover',
-    'lolly-stick',
-    'lollypops',
-    'loloni',
     'lolotique',
-    'lolworth',
-    'lom2',
-    'lomar',
-    'lomas/msfu',
-    'lomas/student',
-    'lomatils',
-    'lomawa',
-    'lomaxes',
-    'lomba',
-    'lombar',
-    'lombard/german',
-    'lombardoni',
-    'lombattini',
-    'lombeye',
-    'lombilo',
     'lomelino',
-    'lomet',
-    'lomg',
-    'lomi',
-    'lomisa',
-    'lomnica',
-    'lomnicy',
-    'lomonds',
-    'lomponda',
-    'lon&rehy',
-    'lon/1990/1702',
-    'lon/90/1702',
-    'lon/91/1370',
-    'lon/91/1990',
-    'lon/92/220y',
-    'lonban',
     'lonbay',
-    'lonc',
-    'loncle',
-    'londen',
-    'londino-batavae',
-    'londinologia',
-    'london&mdash;9',
-    'london&mdash;leningrad',
-    'london&mdash;reading&mdash;didcot-bristol',
-    'london&ndash;aswan',
-    'london&ndash;cairo',
-    'london&ndash;calgary',
-    'london&ndash;holyhead',
-    'london&ndash;melbourne',
-    'london&ndash;new',
-    'london&ndash;paris&ndash;venice&ndash;vienna&ndash;budapest',
     'london&ndash;seattle&ndash;anchorage',
-    'london&ndash;toronto',
-    'london&rehy;jeweller',
-    'london\'',
-    'london-',
-    'london-accented',
-    'london-area',
-    'london-auckland',
-    'london-bath',
-    'london-belfast',
-    'london-brussels-paris',
-    'london-commuter-belt',
-    'london-dublin',
-    'london-edited',
-    'london-employment',
-    'london-evacuated-to-cambridge',
     'london-his',
-    'london-like',
-    'london-listed',
-    'london-manchester-london',
-    'london-out-of-town',
-    'london-owned',
-    'london-oxford',
-    'london-portsmouth',
-    'london-prague',
-    'london-scotland',
-    'london-tan',
-    'london-to-aberdeen',
-    'london-to-dublin',
-    'london-to-inverness',
-    'london-to-new',
-    'london-to-oxford',
     'london-to-paris',
-    'london-to-penzance',
-    'london.',
-    'london.stephen',
-    'london.this',
-    'london/',
-    'london/berne',
-    'london/bradford',
-    'london/charing',
-    'london/ffrr',
-    'london/glasgow',
-    'london/glasgow/cardiff',
-    'london/hong',
-    'london/leningrad',
-    'london/mitcham',
-    'london/overseas',
     'london/paris',
-    'london/south',
-    'london/southern',
-    'london/symphony',
-    'london/up',
-    'london/vienna',
-    'london/welsh',
-    'london/with',
-    'londonborn',
-    'londonderry/dublin',
-    'londoners&rehy;traditional',
-    'londonish',
-    'londonism',
-    'londono',
-    'londonwic',
-    'londoun',
     'londra',
-    'londviniv',
-    'londy/milton',
-    'lone-fight',
-    'lone-mother',
-    'lone-pair',
-    'lone-pairs',
-    'lone-raider',
-    'lone-star',
-    'lonegren',
-    'loneliness.',
-    'lonely-heart',
-    'lonely-hearts',
-    'lonely-nights',
-    'loner-but',
-    'loner/drifter',
     'lonesomeness',
-    'long&mdash',
-    'long&mdash;miss',
-    'long&mdash;term',
-    'long&ndash;term',
-    'long&rehy',
-    'long&rehy;abandoned',
-    'long&rehy;faced',
-    'long&rehy;haired',
-    'long&rehy;promised',
-    'long&rehy;running',
-    'long&rehy;spouted',
-    'long\'',
-    'long(s)',
-    'long-a',
-    'long-abolished',
     'long-accepted',
-    'long-accumulated',
-    'long-ago-days',
-    'long-ago-real-ward',
-    'long-agreed',
-    'long-ailing',
-    'long-and-heavily',
-    'long-and-severe',
-    'long-and-short',
-    'long-aproned',
-    'long-arched',
-    'long-arm',
-    'long-armed',
-    'long-arranged',
-    'long-assumed',
-    'long-awaiting',
     'long-axis',
-    'long-backed',
-    'long-beaked',
-    'long-bearded',
-    'long-believed',
-    'long-boarded',
-    'long-boat',
-    'long-boiler',
-    'long-bone',
-    'long-boned',
-    'long-bones',
-    'long-bows',
-    'long-brewed',
-    'long-brewing',
-    'long-bristled',
-    'long-broken',
     'long-cairn',
-    'long-carriage',
-    'long-christianised',
-    'long-committed',
-    'long-concealed',
-    'long-course',
-    'long-crested',
-    'long-criticised',
-    'long-cultivated',
-    'long-current',
-    'long-dash',
-    'long-decayed',
-    'long-deferred',
-    'long-detainees',
-    'long-developed',
-    'long-discredited',
     'long-dispersed',
-    'long-disputed',
-    'long-dominant',
-    'long-drained',
-    'long-dreaded',
-    'long-end',
-    'long-esteemed',
-    'long-estestablished',
-    'long-estranged',
-    'long-expired',
-    'long-exposed',
-    'long-expressed',
-    'long-extending',
-    'long-eyed',
-    'long-faded',
-    'long-fallow',
     'long-famed',
-    'long-favoured',
-    'long-fibre',
-    'long-field',
-    'long-filled',
-    'long-firmers',
-    'long-flavoured',
-    'long-floated',
-    'long-flowering',
-    'long-format',
-    'long-founded',
-    'long-frozen',
-    'long-fused',
-    'long-gingering',
-    'long-grained',
-    'long-grass',
     'long-hallowed',
-    'long-hardened',
-    'long-haulers',
-    'long-hidden',
-    'long-hoarded',
-    'long-i',
-    'long-i-cow-da',
-    'long-i-foe-li-a',
-    'long-i-stil-is',
-    'long-ignored',
-    'long-imagined',
-    'long-imprisoned',
-    'long-inbred',
-    'long-incarcerated',
-    'long-ingrained',
-    'long-iron',
     'long-ish',
-    'long-isolated',
-    'long-john',
-    'long-jumper',
-    'long-last',
-    'long-lead',
-    'long-leafed',
-    'long-leasehold',
-    'long-leases',
-    'long-leaved',
-    'long-leggity',
-    'long-legs',
-    'long-lingered',
-    'long-lining',
-    'long-linked',
-    'long-lipped',
     'long-living',
-    'long-looking',
-    'long-looped',
-    'long-loved',
-    'long-maintained',
-    'long-meditated',
-    'long-memoried',
-    'long-missed',
-    'long-mocked',
-    'long-needed',
-    'long-needled',
-    'long-nose',
-    'long-noted',
-    'long-nurtured',
-    'long-obsolete',
-    'long-ordered',
     'long-outgrown',
-    'long-oval',
-    'long-paced',
-    'long-passed',
-    'long-passed-by',
-    'long-path',
-    'long-pile',
-    'long-players',
-    'long-pointed',
-    'long-pondered',
-    'long-popular',
-    'long-postponed',
-    'long-priced',
-    'long-profiles',
-    'long-profitable',
-    'long-rate',
     'long-rather',
-    'long-redundant',
-    'long-renowned',
-    'long-repeated',
-    'long-repressed',
-    'long-resident',
-    'long-returned',
-    'long-rod',
-    'long-rotted',
-    'long-ruling',
-    'long-rumoured',
-    'long-scale',
-    'long-scales',
-    'long-scheduled',
-    'long-sentence',
-    'long-server',
     'long-settled',
-    'long-shackled',
-    'long-shadowed',
-    'long-sheltered',
-    'long-shield',
-    'long-shining',
-    'long-shore',
-    'long-shots',
-    'long-sided',
-    'long-silenced',
-    'long-simmering',
-    'long-since-departed',
-    'long-sit',
-    'long-sitting',
-    'long-skirted',
-    'long-smouldering',
     'long-snouted',
-    'long-sought-after',
-    'long-spade.',
-    'long-span',
-    'long-stage',
-    'long-stayers',
-    'long-stirruped',
-    'long-stored',
-    'long-streamered',
-    'long-striped',
-    'long-surviving',
-    'long-sustained',
-    'long-ta',
-    'long-tern',
-    'long-throated',
-    'long-time-not-see',
     'long-tined',
-    'long-tolerated',
-    'long-trained',
-    'long-treasured',
-    'long-tried',
-    'long-troubled',
-    'long-tubed',
-    'long-turbulent',
-    'long-tusked',
-    'long-unmarried',
-    'long-uns',
-    'long-unseen',
-    'long-urged',
-    'long-wavelength',
-    'long-wavists',
-    'long-wedged',
     'long-windedness',
-    'long-windowed',
-    'long-worked',
-    'long-xxxx',
-    'long-yearned-for',
-    'long-yoke',
-    'long.standing',
-    'long/director',
-    'long/head',
-    'long/short',
-    'long/short/just',
-    'long/thick/glossy',
-    'long:walking',
-    'long_at',
-    'longaevi',
-    'longaker',
     'longam',
-    'longan',
-    'longanesi',
-    'longara',
-    'longback',
-    'longball',
-    'longbase',
-    'longbay',
-    'longbeach',
-    'longbeck',
-    'longbeen',
-    'longbones',
-    'longborough',
-    'longbottom/organiser',
-    'longbourne',
-    'longbranch',
     'longbridge-built',
-    'longcased',
-    'longchamps',
-    'longclose',
-    'longcrofts',
-    'longdale',
-    'longdon-upon-tern',
-    'longdrawn',
-    'longeaton.',
-    'longer&mdash;lasting',
-    'longer&mdash;would',
-    'longer-against',
-    'longer-billed',
-    'longer-bodied',
-    'longer-in-the-tooth',
-    'longer-length',
     'longer-life',
-    'longer-line',
-    'longer-playing',
-    'longer-running',
-    'longer-scale',
-    'longer-stay',
-    'longer-than-ever',
-    'longer-than-usual',
-    'longer-winged',
-    'longerestablished',
-    'longerterm',
-    'longesp&eacute;e',
-    'longespee',
-    'longest-cultivated',
-    'longest-dated',
-    'longest-haired',
     'longest-held',
-    'longest-legged',
-    'longest-range',
-    'longest-reigning',
-    'longest-standing',
-    'longest-staying',
-    'longest-tailed',
-    'longest-used',
-    'longest:shortest',
-    'longestablished',
-    'longeth',
-    'longeurs',
-    'longfire',
-    'longford-westmeath',
-    'longforgan',
-    'longformacus',
     'longforth',
-    'longhairies',
-    'longham',
-    'longhandled',
-    'longhi/italian',
-    'longholme',
-    'longhorne',
-    'longhoughton',
-    'longhurst/author',
-    'longhut',
-    'longi&rehy;tudinal',
-    'longialata',
-    'longicaudatum',
-    'longicorn',
-    'longies',
-    'longiflora',
     'longifrons',
-    'longijolia',
-    'longines-olivetti',
-    'longispicularis',
-    'longisquamata',
-    'longitudinally-banded',
-    'longjumper',
-    'longlevens',
-    'longlife',
-    'longmoore',
-    'longmynd',
-    'longnecked',
-    'longnose',
-    'longnosed',
-    'longobarda',
-    'longpigs',
     'longport',
-    'longpr&eacute',
-    'longqing',
-    'longqt',
-    'longriddry',
-    'longrigg',
-    'longriggend',
-    'longrow',
-    'longroyd',
-    'longsett',
-    'longshanks',
-    'longshaw',
-    'longshaw/diabetic',
-    'longshoreman',
-    'longsighted',
-    'longslade',
     'longstaffe',
-    'longstandingly',
-    'longston',
-    'longstratton',
-    'longstrip',
-    'longsufferingly',
-    'longt',
-    'longtail',
-    'longtailed',
-    'longtails',
-    'longthorn',
-    'longthorp/home',
-    'longthwaite',
-    'longtitudinal',
-    'longuement',
-    'longues',
     'longum',
-    'longval',
-    'longvalley',
-    'longwich',
-    'longwools',
-    'longworms',
-    'longyd',
-    'longyi',
-    'lonie',
-    'lonka',
-    'lonley-heart',
-    'lonmdon',
-    'lonnan',
-    'lonnbergii',
-    'lonnen',
-    'lonner',
     'lonng',
-    'lonnies',
-    'lonnin',
-    'lonning',
-    'lonny',
-    'lonrho-owned',
-    'lonrho/house',
-    'lonsborough',
-    'lonsbrough',
-    'lonsdaleite-heating',
-    'lonsdeen',
-    'lonsdene',
-    'loo&ndash;ed',
-    'loo-flushing',
-    'loo-is',
-    'loo-kens',
     'loo-paper',
-    'loo-roll',
-    'loo-ser',
-    'loo-sha',
-    'loo-tay-a',
-    'loo-ti-yoom',
-    'loob',
-    'loobyns',
-    'looey',
-    'loogoo',
-    'looh',
-    'looies',
-    'looing',
-    'look&mdash;the',
-    'look&ndash;out',
-    'look&rehy;out',
     'look-',
-    'look-after-your-own',
-    'look-ahead',
-    'look-at-me-now',
-    'look-at-you',
-    'look-back',
-    'look-behind-you',
-    'look-down',
-    'look-downers-on-others',
-    'look-here-this-sort-of-thing-won\'t-do-at-all-you-know',
-    'look-nice',
-    'look-no-a-bit-like',
-    'look-no-hands',
-    'look-terrific',
-    'look-that',
-    'look-through',
     'look-till',
-    'look.',
-    'look.at',
-    'look/object/look',
-    'look/sit',
-    'look/sparc-based',
-    'look_a',
-    'look_at',
-    'look_ever',
-    'look_over',
-    'look_up',
-    'lookahead',
-    'looke',
-    'looked-up',
-    'looked/up',
-    'looked_as',
     'looked_away',
-    'lookee',
-    'lookers-through',
-    'looketh',
-    'lookie',
-    'looking\'',
-    'looking-',
-    'looking-after',
-    'looking-at-the-pictures',
-    'looking-elsewhere',
-    'looking-tired',
-    'looking.',
-    'looking/cleverer/',
-    'looking/cleverer/more',
-    'looking/more',
-    'looking_out',
     'lookingforarainbow',
-    'lookingglasses',
-    'lookings',
-    'lookm',
-    'looks-booster',
-    'looks-like-abstract-art',
-    'looks_a',
-    'looks_as',
-    'looks_at',
-    'looksism',
-    'looky-looky-looky',
-    'loom-shuttles',
-    'loom-work',
-    'loom.',
-    'loomba',
-    'loompanics',
     'loomstate',
-    'looniness',
-    'looning',
-    'loony-left',
-    'loony/party',
-    'loonyland',
-    'looo-ees',
-    'loooks',
-    'loop-end',
-    'loop-film',
-    'loop-hole',
-    'loop-o-plane',
-    'loop-stitch',
-    'loop-stitched',
-    'loop-stitching',
-    'loop-streets',
     'loop-the-loops',
-    'loop/',
-    'loop/stem',
-    'loopback',
-    'looper',
-    'loopier',
-    'loopiest',
-    'loopily',
-    'loopsala',
-    'loopstitch',
-    'loore',
-    'loosdrecht',
-    'loose-',
-    'loose-armed',
-    'loose-coupled',
-    'loose-covers',
     'loose-cut',
-    'loose-feed',
-    'loose-growing',
-    'loose-heads',
-    'loose-horned',
-    'loose-inserted',
-    'loose-jointed',
-    'loose-laid',
-    'loose-leafed',
-    'loose-leaved',
-    'loose-legged',
-    'loose-linked',
-    'loose-liver',
-    'loose-livers',
-    'loose-lying',
-    'loose-riding',
     'loose-rolled',
-    'loose-set',
-    'loose-shouldered',
-    'loose-tongued',
-    'loose-trousered',
-    'loose-weave',
-    'loose-wristed',
-    'loose/tight',
-    'looseboxes',
-    'loosed.',
-    'loosefeed',
-    'looseheads',
-    'looselaid',
-    'loosely\'',
-    'loosely-bound',
-    'loosely-disguised',
     'loosely-enclosed',
-    'loosely-fitted',
-    'loosely-held',
-    'loosely-hung',
-    'loosely-made',
-    'loosely-organized',
-    'loosely-regulated',
-    'loosemindedness',
-    'loosemoore',
-    'loosemore/founder/atalanta',
-    'loosen-up',
-    'looseness-of-link',
-    'loosers',
-    'loot-crammed',
-    'lootings',
-    'loots',
     'lootz',
-    'loovis',
-    'loovul',
-    'looza',
-    'lopburi',
-    'lopera',
-    'loperamide-oxide',
-    'lopez-style',
-    'lopez-willshaw',
-    'lophanthae',
-    'lophii',
-    'lophocolea',
-    'lophortyx',
-    'loplop',
-    'lopm',
-    'lopocarium',
     'lopoliths',
-    'lopon',
-    'lopped-off',
-    'loquats',
-    'loquens',
-    'lor&eacute;al',
-    'lor\'n\'order',
-    'lor-or-ord',
-    'lorag',
-    'loran-c',
-    'lorand',
-    'lorans',
-    'loranthaceous',
-    'loranthus',
-    'lorayne',
-    'lorc&aacute;in',
     'lorcomb',
-    'lord\'s',
-    'lord\'s-days',
-    'lord\'s.',
-    'lord-a-mercy',
-    'lord-alge',
-    'lord-almighty',
-    'lord-and-master',
-    'lord-lieutenancy',
-    'lord/lady',
-    'lord/landlady',
-    'lordahl',
-    'lordes',
-    'lordliest',
-    'lordore',
-    'lords&mdash;he',
     'lords&rehy;of',
-    'lords-and-ladies',
-    'lords-lieutenant',
-    'lords.the',
-    'lords.they',
-    'lords/commons',
-    'lordship.',
-    'lore\'n',
-    'loren/sister',
-    'lorenese',
-    'lorengar',
-    'lorenge',
-    'lorentzson',
-    'lorenz-model',
-    'lorenzaccio',
-    'lorenzino',
     'lorenzital',
-    'lorenzkirche',
-    'lorenzo-fuori-le-mura',
-    'lorenzo-goer',
-    'lorenzoni',
-    'loret&aacute;nsk&aacute',
-    'loreus',
-    'lorexane',
-    'lorian',
-    'loricarid',
-    'loriciferans',
-    'lorien',
-    'lorientais',
-    'lorigan',
-    'lorikeet',
-    'loriley',
     'lorimar',
-    'lorimer/driver',
-    'lorina',
-    'lorinda',
-    'loriniti',
-    'loripes',
-    'loris&rehy;melikov',
-    'loriston',
-    'lorkovic',
-    'lormaison',
-    'lorne-caduta',
-    'lornes',
-    'lorraine-saar&rehy;luxembourg',
-    'lorrains',
-    'lorrazo',
-    'lorreta',
     'lorri',
-    'lorrin',
-    'lorrum',
-    'lorry-and-train',
-    'lorry-axles',
-    'lorry-from',
-    'lorry-ridden',
-    'lorry-route',
-    'lorry/bus',
-    'lors',
-    'lorsont',
-    'lorsque',
-    'lorst',
-    'los-angeles',
-    'losada',
-    'losantos',
     'losbruch',
-    'losch',
-    'loschmidt',
-    'loschy',
-    'loscious',
-    'lose-fitting',
-    'lose-lose',
-    'loseby',
-    'losec',
-    'losemere',
-    'losey-pinter',
-    'losinga',
-    'losiolo',
-    'loskutoff',
-    'losli',
-    'losos',
     'losowsky',
-    'loss&mdash;can',
-    'loss&mdash;indeed',
-    'loss&mdash;property',
-    'loss-absorbing',
-    'loss-adjuster',
-    'loss-adjusters',
-    'loss-all',
-    'loss-buying',
-    'loss-causing',
-    'loss-factor/',
-    'loss-leaders',
-    'loss-leading',
-    'loss-minimizing',
-    'loss-of-self',
-    'loss-plagued',
     'loss-sharing',
-    'loss-stricken',
-    'loss.oxford',
-    'loss/damage/',
-    'loss/special',
-    'lossed',
-    'losser',
-    'losses&mdash;12',
-    'losses-on-disposal',
-    'lossing',
-    'lossky',
-    'lossmaker',
-    'lossmakers',
-    'lossou',
-    'lost&mdash;the',
-    'lost-',
     'lost-bottle',
-    'lost-even',
-    'lost-in-house',
-    'lost-in-my-muse',
-    'lost-in-the-wood',
-    'lost-looking',
-    'lost-macmillan',
-    'lost-ness',
-    'lost-property',
-    'lost/',
-    'lost/at',
-    'lost/damaged',
-    'lost/found',
-    'lost3-2',
-    'lostby',
-    'losted',
     'lostsaid',
-    'lot\'sa',
-    'lot-depending',
-    'lot-et-garonne',
-    'lot-oriel',
-    'lot/',
-    'lotbiniere',
-    'lotem',
-    'loten',
-    'lotery',
-    'lotes',
-    'lothain',
-    'lothaire',
-    'lotharian',
-    'lotharingian',
-    'lothersdale',
     'lothesomenes',
-    'lothiah',
-    'lothianbun',
-    'lothingland',
-    'lothman',
-    'lothrop',
-    'lotion/method',
-    'lotioned',
-    'loto',
-    'loto-quebec',
-    'lotoka',
-    'lotoman',
-    'lotomanjustice',
-    'lotschental',
-    'lotted',
-    'lottenberg',
     'lotterby',
-    'lotterer',
-    'lottery-ticket',
-    'lotting',
-    'lotto-type',
-    'lottocash',
-    'lotum',
-    'lotus-badged',
-    'lotus-choked',
-    'lotus-columns',
-    'lotus-compatible',
-    'lotus-cosworth',
-    'lotus-eater',
-    'lotus-eyed',
-    'lotus-festina',
-    'lotus-intel-microsoft',
     'lotus-like',
-    'lotus-shaped',
-    'lotus-sleep',
-    'lotus-stemmed',
-    'lotus-style',
-    'lotuses',
-    'lotuswindows',
-    'lotusworks',
-    'lou&eacute',
-    'lou-garou',
-    'loua',
-    'loubenov/slavov',
-    'loubet',
-    'loucher',
-    'louchnje',
-    'loucks',
     'loud-',
-    'loud-mouthing',
-    'loud-mouths',
-    'loud-shirts-and-checked-trousers',
-    'loud.then',
-    'loud/',
-    'loude',
-    'loudenings',
-    'loudenslager',
-    'louder/hits',
-    'loudest&mdash;er',
-    'loudish',
-    'loudly-voiced',
-    'loudmouthed',
-    'loudspeaker/headphones',
-    'loudspeaker/room',
     'loudspeakered',
-    'loudspeakering',
-    'loudspeaking',
-    'loudy',
-    'louella',
-    'louen',
-    'loues',
-    'louganis',
-    'lough-side',
-    'loughanmore',
-    'loughborough/leicestershire',
-    'loughermore',
-    'loughgall-style',
-    'loughgalls',
-    'loughhead',
-    'loughland/villager',
     'loughnane',
-    'loughor',
-    'loughry',
-    'loughs.',
-    'loughshinny',
-    'louhossoa',
-    'louis-antoine',
-    'louis-claude',
-    'louis-dreyfuss',
-    'louis-fran&ccedil;ois',
-    'louis-joseph',
-    'louis-michel',
-    'louis-nicolas',
-    'louis-paul',
-    'louis-philog&egrave;ne',
-    'louis-sylvestre',
     'louis/los',
-    'louisa&mdash;my',
-    'louisburg',
-    'louise-elisabeth',
-    'louise/edinburgh',
-    'louisella',
-    'louiserick',
-    'louises',
-    'louisette',
-    'louisiana-born',
-    'louisville-based',
-    'louix',
-    'loukopoulos',
-    'loule',
-    'loulou&mdash;tell',
-    'louloudis',
     'loum',
-    'loumansky',
-    'loun',
-    'loundres',
-    'loundside',
-    'lounel',
-    'lounga',
-    'lounge-car',
-    'lounge-cum-dining',
-    'lounge-cum-television',
-    'lounge-diner',
-    'lounge-lizard',
-    'lounge-room',
-    'lounge-suited',
-    'lounge-you',
-    'lounge.',
     'lounge/breakfast',
-    'lounge/cocktail',
-    'lounge/pilothouse',
-    'lounge/reception',
-    'lounges/bars',
-    'lounging-chairs',
-    'lounova',
-    'lounsbury',
-    'loupin\'-on',
-    'louping',
-    'lour',
-    'lourd',
-    'lourdios',
-    'loureiro',
-    'lourencin',
-    'lourens',
     'loures',
-    'louris',
-    'louron',
-    'louros',
-    'lours',
-    'lousadas',
-    'louse-infested',
-    'louse-ridden',
-    'louseworts',
-    'loushe',
-    'lousiane',
-    'lousians',
-    'lousier',
-    'lousily',
-    'lousiness',
-    'loussier',
     'loussiere',
-    'loutf',
-    'louth-born',
-    'loutherbourg',
-    'louthesk',
-    'louting',
-    'loutside',
-    'louvet',
-    'louvette',
-    'louvettes',
-    'louvi',
-    'louvia',
-    'louvre-fronted',
-    'louvre-organised',
-    'louvre/met',
-    'louvri',
     'loux',
-    'louyngton',
-    'louys',
-    'lovability',
-    'lovable\'',
-    'lovaine',
-    'love&mdash',
-    'love&rehy;of-his-life',
-    'love\'un',
-    'love-',
-    'love-apple',
-    'love-bites',
-    'love-blimps',
-    'love-call',
-    'love-children',
-    'love-dazed',
     'love-drenched',
-    'love-dungeon',
-    'love-feasts',
-    'love-fest',
-    'love-filled',
-    'love-gift',
-    'love-handle',
-    'love-handles',
-    'love-hostility',
-    'love-hotels',
-    'love-hungry',
-    'love-i',
-    'love-in-idleness',
-    'love-in-the-mist',
-    'love-inducing',
-    'love-intrigues',
     'love-is-on-the-air',
-    'love-it-or-loathe-it',
-    'love-juice',
-    'love-light',
-    'love-locked',
-    'love-machine',
-    'love-making/relationships',
-    'love-makings',
-    'love-marriage',
-    'love-mask',
-    'love-me',
-    'love-missive',
-    'love-notes',
-    'love-objects',
-    'love-one',
-    'love-or-hate',
     'love-potions',
-    'love-rhyme',
-    'love-rock',
-    'love-ruined',
-    'love-scenes',
-    'love-seat',
-    'love-shriek',
-    'love-sickness',
-    'love-situations',
-    'love-starved',
-    'love-stories',
-    'love-stricken',
-    'love-suicide',
-    'love-swollen',
-    'love-talk',
-    'love-tapes',
     'love-that-lies-bleeding',
-    'love-them-and-leave-them',
-    'love-theme',
-    'love-token',
-    'love-torn',
-    'love-tragedy',
-    'love-trauma',
-    'love-triangle',
-    'love-tricks',
-    'love-tug',
-    'love-voice',
-    'love-wounded',
-    'love/',
-    'love/cooking',
-    'love/cowboy',
-    'love/crash',
     'love/dread',
-    'love/father',
-    'love/people',
-    'love/respect',
-    'love/security',
-    'love/sister',
-    'love_as_it',
-    'love_each',
-    'loveableness',
-    'lovebooks',
-    'lovecarriage',
-    'loved-one\'s',
-    'loved-ones',
-    'loved-up',
-    'loved/admired',
-    'loved_each',
     'lovedays',
-    'lovedee',
-    'lovedogs',
-    'lovedoll',
-    'lovegreen',
-    'lovegrove/village',
-    'lovegroves',
-    'lovejoys',
-    'lovelaces',
-    'lovelady',
-    'lovelee',
-    'lovelessness',
-    'lovelife',
-    'lovell-badge',
-    'lovell-davis',
-    'lovell-pank',
     'lovells',
-    'lovelorn-lads',
-    'lovely-looking',
-    'lovemake',
-    'lovenduski',
-    'lovenest',
-    'lovenskiold',
-    'lovepot',
-    'lovepump',
-    'lover\'',
-    'lover\'s-knots',
-    'lover-author',
-    'lover-giant',
-    'lover-knight',
-    'lover.',
-    'lover/lovers',
     'loverd',
-    'loveren',
-    'loverings',
-    'loverks',
-    'loverly',
-    'loverman',
-    'loverrrrrrleeeee',
-    'lovers-knots',
-    'loverseed',
-    'loves.',
-    'loves/understands',
-    'loves/wants',
-    'lovescapes',
-    'loveseat',
-    'lovesex',
-    'loveslife-brown',
     'lovespoons',
-    'lovetts',
-    'lovey_dovey',
-    'loveydovey',
-    'loveyness',
-    'lovi',
-    'lovin',
-    'loving-',
-    'loving-cup',
-    'loving-father',
-    'loving-heartedness',
-    'lovingly-detailed',
-    'lovingly-observed',
-    'lovingly-restored',
-    'lovingness',
-    'lovings',
     'lovosice',
-    'lovre',
-    'lovynge',
-    'low&ndash;and',
-    'low&rehy',
-    'low&rehy;achieving',
-    'low&rehy;angle',
-    'low&rehy;budget',
-    'low&rehy;cut',
-    'low&rehy;density',
-    'low&rehy;grade',
-    'low&rehy;level',
-    'low&rehy;profile',
-    'low&rehy;waged',
-    'low&rehy;wattage',
-    'low\'',
     'low\'r',
-    'low\'ring',
-    'low(0.05mm)-calcium-containing',
-    'low+',
-    'low-achieving',
-    'low-action',
-    'low-activity',
-    'low-addiction',
-    'low-alc',
-    'low-alcohol/alcohol-free',
-    'low-alcoholic',
-    'low-alkalinity',
-    'low-ball',
-    'low-balling',
-    'low-barrelage',
-    'low-blink-rate',
     'low-boiling',
-    'low-bottom',
-    'low-bouncing',
-    'low-breasted',
-    'low-bridge',
-    'low-brimmed',
-    'low-burnt',
-    'low-calibre',
-    'low-caloric',
-    'low-calorie/low-fat',
-    'low-capacity',
-    'low-carat',
-    'low-clouded',
-    'low-co',
-    'low-communication',
-    'low-conductivity',
     'low-consumption',
-    'low-context',
-    'low-contrast',
-    'low-copy',
-    'low-cost/high-volume',
-    'low-credibility',
-    'low-cross',
-    'low-damage',
-    'low-damping',
-    'low-decibel',
-    'low-dependency',
-    'low-distortion',
-    'low-dwellers',
-    'low-earners',
-    'low-earth',
-    'low-emissions',
     'low-end/high-volume',
-    'low-end/low-cost',
-    'low-enriched',
-    'low-fare',
-    'low-feeding',
-    'low-finesse',
-    'low-flier',
-    'low-fluid',
-    'low-flush',
-    'low-friction',
-    'low-gabled',
-    'low-gain',
-    'low-glare',
-    'low-ground-pressure',
-    'low-grower',
-    'low-grown',
     'low-handicap',
-    'low-heel',
-    'low-heels',
-    'low-hour',
-    'low-impact',
-    'low-income-level',
-    'low-inductance',
-    'low-inflationary',
-    'low-information',
-    'low-input/low-output',
-    'low-intensive',
-    'low-interest-rate',
-    'low-intermediate',
-    'low-inventory',
-    'low-investment',
-    'low-ish',
     'low-labelling',
-    'low-latency',
-    'low-latitudes',
-    'low-left',
-    'low-levels',
-    'low-lifer',
-    'low-lifers',
-    'low-lifes',
-    'low-low-low',
-    'low-magnification',
-    'low-maintenance',
-    'low-manpower',
-    'low-meat',
-    'low-melt-fraction',
-    'low-melting',
-    'low-molecular',
     'low-molecular-weight',
-    'low-multiplier',
-    'low-nitrogen',
-    'low-normal',
-    'low-nox',
-    'low-oestrogen',
-    'low-or',
-    'low-order',
-    'low-output',
-    'low-paying-jobs',
-    'low-percentage',
-    'low-performance',
-    'low-performanced',
-    'low-point',
-    'low-power/low-cost',
-    'low-prevalence',
     'low-print-run',
-    'low-profiling',
-    'low-profit',
-    'low-rainfall',
-    'low-rank',
-    'low-ratio',
-    'low-reliefs',
-    'low-rev',
-    'low-revs',
-    'low-revving',
-    'low-roi',
-    'low-rumped',
-    'low-salaried',
-    'low-silled',
-    'low-sized',
-    'low-skills',
     'low-sm/nd',
-    'low-solvent',
-    'low-speed/high-gear',
-    'low-spending',
-    'low-spoken',
-    'low-spreading',
-    'low-standard',
-    'low-standing',
-    'low-storied',
-    'low-stretch',
-    'low-supervision',
-    'low-symmetry',
-    'low-tack',
-    'low-taxation',
-    'low-throated',
-    'low-tides',
     'low-to',
-    'low-toned',
-    'low-trajectory',
-    'low-tune',
-    'low-turnout',
-    'low-u',
-    'low-unemployment',
-    'low-user',
-    'low-valued',
-    'low-visibility',
-    'low-viz',
-    'low-voltage-drop',
-    'low-water-content',
-    'low-watt',
-    'low-wattage',
-    'low-xxxx',
     'low.pass',
-    'low/inadequate',
-    'low/medium',
-    'low/mid-range',
-    'lowads',
-    'lowand',
-    'lowara',
-    'lowcalorie',
-    'lowcost',
-    'lowcut',
-    'lowd\'st',
-    'lowden-esque',
-    'lowden-style',
-    'lowder',
-    'lowdose',
-    'lowdown-down-diggerydown',
     'lowe-bell',
-    'lowe/director/oxford',
-    'lowe/manager',
-    'lowe/mother',
-    'lowe/prison',
-    'lowen',
-    'lowen/milton',
-    'lowenburg',
-    'lowenfeld',
-    'lowensohn',
-    'lowenstrasse',
-    'lowenthals',
-    'lower&rehy;achieving',
-    'lower-ability',
-    'lower-attainers',
-    'lower-born',
     'lower-bound',
-    'lower-budget',
-    'lower-built',
-    'lower-calories',
-    'lower-cut',
-    'lower-damping',
-    'lower-denomination',
-    'lower-dimensional',
-    'lower-earnings',
-    'lower-earnings-related',
-    'lower-east-side',
-    'lower-elevation',
-    'lower-fertility',
-    'lower-gear',
-    'lower-hab',
-    'lower-half',
     'lower-house',
-    'lower-in',
-    'lower-input',
-    'lower-key',
-    'lower-latitude',
-    'lower-layer',
-    'lower-limb',
-    'lower-lip-to-top-teeth',
-    'lower-management',
-    'lower-manual',
-    'lower-mass',
-    'lower-middle-middle',
-    'lower-offs',
-    'lower-performance',
-    'lower-priority',
-    'lower-range',
     'lower-ranked',
-    'lower-rate',
-    'lower-resolution',
-    'lower-risk',
-    'lower-security',
-    'lower-sixth-form',
-    'lower-spec',
-    'lower-stratospheric',
-    'lower-string',
-    'lower-tech',
-    'lower-than-anticipated',
-    'lower-to',
-    'lower-to-higher',
-    'lower-tonnage',
-    'lower-valued',
-    'lower-volume',
     'lower-yielding',
-    'lower.preference',
-    'lower.quality',
-    'lower/middle',
-    'lower/middle/',
-    'lower/middle/upper',
-    'lowerers',
-    'lowerick',
-    'lowering.',
-    'lowerstein',
-    'lowest&rehy;cost',
-    'lowest-',
-    'lowest-caloried',
-    'lowest-energy',
-    'lowest-grade',
-    'lowest-houred',
     'lowest-performing',
-    'lowest-priced',
-    'lowest-quality',
-    'lowest-spending',
-    'lowest-stressed',
-    'lowest-taxed',
-    'lowestock',
-    'lowestoft/suffolk',
-    'lowestoftians',
-    'lowfat',
-    'lowflying',
-    'lowgrade',
-    'lowgrowing',
-    'lowhanging',
-    'lowii',
-    'lowings',
     'lowish-tech',
-    'lowist',
-    'lowit',
-    'lowith',
-    'lowkey',
-    'lowlevel',
-    'lowlifes',
-    'lowliness.',
-    'lowly-rated',
-    'lowmoor',
-    'lown',
-    'lowna',
-    'lowndean',
-    'lowndes/photographer',
-    'lowne/transport',
-    'lownie',
     'lownsborough',
-    'lowr',
-    'lowranking',
-    'lowrieson',
-    'lowrise',
-    'lowry-ish',
-    'lowryi',
-    'lowsa',
-    'lowsley-williams',
-    'lowswater',
-    'lowtemperature',
-    'lowtherstown',
-    'lowuse',
-    'lowy',
-    'lowys',
-    'lox',
     'loxam',
-    'loxbridge',
-    'loxod',
-    'loxodromes',
-    'loxtidine',
-    'loyal\'',
-    'loyal.',
-    'loyalisms',
-    'loyalistus',
-    'loyalty-factor',
-    'loyalty.',
-    'loyalty_as_far',
-    'loye',
-    'loyer',
-    'loyley',
-    'loyment',
     'loyrette',
-    'loys-breaker',
-    'loyset',
-    'loz&egrave;re',
-    'lozaraitis',
-    'lozenge-sectioned',
-    'lozenge.',
-    'lozere',
-    'lozle',
-    'loznica',
-    'lozovskii',
-    'lozovsky',
-    'lp-28',
-    'lp-length',
-    'lp.the',
-    'lp/',
     'lp0',
-    'lp040',
-    'lp10',
-    'lp1001',
-    'lp11',
-    'lp15',
-    'lp3',
-    'lp400',
-    'lp5',
-    'lp6',
-    'lp600',
-    'lp9',
-    'lpas',
-    'lpase',
-    'lpejkdnfklruhfllsmjcgbqktdlri',
-    'lperamide-n-oxide',
     'lpez',
-    'lpfs',
-    'lpg-laden',
-    'lpm',
-    'lpo/concertgebouw/van',
-    'lpo/handley',
-    'lpo/rlpo/handley',
-    'lpocytes',
-    'lpr',
-    'lpr-lpd-lp',
-    'lps/pls&mdash;liberal',
-    'lpsa',
-    'lpt',
-    'lpt2',
-    'lpt3',
-    'lq-500',
     'lq-510',
-    'lq-570',
-    'lq1170',
-    'lq2500',
-    'lq400',
-    'lq550',
-    'lq850',
-    'lquid',
-    'lqw',
-    'lr-10',
-    'lr0',
-    'lr1',
-    'lr165',
-    'lr33020',
-    'lrac',
-    'lraqi',
     'lrchd',
-    'lrf',
-    'lrg',
-    'lrge',
-    'lrsm',
-    'lru',
-    'lrus',
-    'ls&mdash;integrity',
-    'ls-20',
-    'ls-50b',
-    'ls-5605',
-    'ls.0d.',
-    'ls.train',
-    'ls0003',
-    'ls0004',
-    'ls10',
     'ls1084',
-    'ls12',
-    'ls16',
-    'ls27',
-    'ls3',
-    'ls400',
-    'ls7',
-    'lsap',
-    'lsc',
-    'lsd.',
-    'lse-11',
-    'lsf',
-    'lsh',
-    'lshaped',
-    'lsi/sbus-based',
-    'lsions',
     'lsk',
-    'lslay',
-    'lsleten',
-    'lslington',
-    'lslive.dat',
-    'lsls',
-    'lsmr.l',
-    'lsmru.eu',
-    'lsms',
-    'lso/abbado',
-    'lso/barbiroli',
-    'lso/kapszyk',
-    'lso/krips',
-    'lso/previn',
-    'lso/rca',
-    'lso/rostropovich',
     'lso/sargent',
-    'lso/tilson',
-    'lspan.database',
-    'lspr',
-    'lsq',
-    'lsrdbiinst',
-    'lsrnd',
-    'lsstop.com',
-    'lstch',
-    'lstrain&mdash;cc0001',
-    'lstrain.p',
-    'lstraincc0001',
-    'lsungen',
-    'lswer',
-    'lswlike',
-    'lt-cmdr',
     'lt-co1',
-    'lt-commander',
-    'lt.-cdr.',
-    'lt.-colonel',
-    'lt.col',
-    'lt.gen',
-    'lt.willi',
-    'lt/control',
-    'lt0001',
-    'lt0002',
-    'lt230t',
-    'lt29s',
-    'lta-approved',
-    'lta-rated',
-    'ltake',
-    'ltalienne',
     'ltcb',
-    'ltcl',
-    'ltd\'',
-    'ltd-backed',
-    'ltd-derived',
-    'ltd-endorsed',
+)
+
+blocks_69 = (
+    '$!e%\'d-light%\'n-armed\'$grey&#ham&#ing%$r(s)&\'-bereft($oard\'+cum-manager\')democracy)\'pendent\'(in-exile*\'reserve))dependent',
+    '\'$page\'(williams(%riter&)/follower\'\'manager\'&social\'*thamesdown&#man&,s&mdash;then\')/managers\'!h(#ip\'*&-based+%style*\'/deputy',
+    '%"ur$#ill%"n\'&*g&mdash;we\'&-edges($note($role\')/managing$%light$+mill-hosted&"ng$$outs$"s.$$time$%works',
+    '$%-bare\'"se)!s%$clad&%olour\'#ver&\'uttings%\'dappled%(embossed%&filled&&olding\'"rm&&ringed%\'gilding%%heads',
+    '%&lifter\'&ttered&#oss%\'margins&%ining&)ouldering%(nibbling%)producing%&roller\'&settes&&umours%&scales("rs(&ttered&$hape',
+    '%&taking&(entacles&\'hatched\'!e\'"in&%issue&%o-air&(rembling%&washes%%yeast$&caster%#url&$tter$!e%$d-in',
+    '$&hopper*&-borne*!s$%iness$%lands%#et\'\'&-racks\'"er\'*s/booklets)*catalogues)+information),prospectuses\'$ting%#ike$%miner',
+    '$%smoke%$talk#$gaue$+ue-brokered\'#ifa\'\'leading\'&tables\'"un&$.now\'#the&!/\'-international\'9milk/littlewoods/whatever\'"sp&"84',
+    '&)tableitis#$holm#%k-fix%\'proofed%(sealants$"er$$ings#"la$%holm.$#man$#tad##mas$0ington&rehy;born$"on#.n&mdash;coward',
+    '%.back-and-enjoy&%odied%\'flanked&&orward%$line%\'muscled%#nox%&pierre%\'shanked%\'visaged$!.$$/and$%achan$%charn$$ders',
+    '\'!s$#ers$%faced$$line$#nan%"ne$"se#"p*$!.$#eth$$pin\'##que&!s#%r-fan%$like',
+    '$//hamlet/othello%(national$!d$#ing$$jets$$mont$,n-as-they-go&&to-ski%$.the%-ed-everything\'$ness&/r&rehy;training\'\'-driver(\'learner(%pilot',
+    '\'"s.%$ing\'(!-)$bobo*&y-rote)&curves),disabilities)0experience-curve),facilitating*+or-the-test-$work*5rom-the&rehy;japanese)(impaired)\'network)*on-the-job',
+    '))resources)*situations)(teaching*,hrough-doing*#ime(\'/action),conditioning)%study%"mt%"ng%!y$$star%!y$$wise#"s*',
+    '$/e&mdash;licence%$-buy&$hold&&owners%+/lease-back%&d-line%\'mongers%$plan%"rs$$hman$1ing-and-factoring(#out\'1/northamptonshire\'!s$#ors',
+    '$"t\'%!-&$able*)-to-speak&#bad\'&ecause&2common-denominator((nsidered&(educated&)favourite&%loved&&pretty((ofitable&&quoted&$read',
+    '&$soft&$that((reatened\'&rained&)unionised&*vulnerable%,.significant%!1%!4%#est%\'squares#"tg$$haid\'!n&"nn',
+    '%%emand&-r&rehy;gloved\'!-((breeches*#own)%utton(\'chaired*%eeked)$loth)%oated)%uring+&tained((dressers(%edged)&lbowed',
+    ')&ripped($hard+&nessed)%eeled(\'scented)&kinned+$rted)$mell)$oled)$trap-#ped(\'thonged)%ogged*%ngued*#ugh',
+    ')&rapped\'*/cambrelle)%otton($wood\'$_and\'#ado\'$boys\'%cloth\'/ette-and-wooden\'$land\'(stocking\'\'working\'\'y-faced)\'skinned)&voiced',
+    '%%waite&(ood/tgwu)!s#$vasa$"ce$\'e&mdash+$;not%$-men&*them-alone%!.%2/flexi&ndash;leave&#pay%#_no%"ll%"ns',
+    '%"tt$(ing-home\'"_a%#ses&!m##way$#ood#"ze"!b#!a$!n%)ese&ndash(&-based)*controlled)\'israeli',
+    '&&zation%(on-based$!r%!s$#ume##eau$,dkin/pianist$&n-jesu%!a$\'rknodel%%wurst#"ia#,lanc-process##ons$!r',
+    '$+wa/kangwane%#itz$#yer#!p#&ransky$$echt$#uns#&zelter"(c3.2.8.1#)anopteris&"ra%#vey$#ros$!t#!c',
+    '$#ese\'(-spriith##erf#%hdale$\'er-wire%"sa%!t$4lade/gloucestershire$$mann$"on$"te$"ur%"za$"we$!y',
+    '(#ase#&kernby$)hampstead\'%stead$&litner$$onby$&patick$%wirth#%lercs&!q##oat$$mber$&rriere$#urs%%vreur',
+    '#&t/dem.$#eur$\'in-like\')resistant%#ons$)or-priest&"is$!r%"ic$!u%#re\'\'\'-course))um-sermon($hall(&series',
+    '\'%/dem.+!s))iscussion(*laboratory(\'seminar(%video\'+r-in-charge)%name=*%umber)\'student(".5()/advisory)(lecturer1!s\'$ttes',
+    '#\'umberry"%d-lit##aig#&creich##din#*er-hosened%$berg%.hosen-slapping#$gard$"e.%&r-like&#ing&$line##ing$!t',
+    '$"ow#$more#(oux-like#%widge$.orowskiforeign##yen"+e-andersson$(faulkner$(gitimate$\'harwood$1in-this-house-lee$$like$%milne$&potter$(richards',
+    '$$teng%"in$1wright(earthscan)#!.#)/festival%%riend$&mother$&oxford$%rowan$\'shannon%*trathclyde$$tara$!w#!b$$oard',
+    '%%twood#-ch&rehy;woman%*(1969)ch6.%)-battened&)gatherers&$like&(pluckers%&/steam$%loths#$ders%!s%!x$0s&ndash;bradford,(carlisle,)morecambe',
+    '&\'arsenal&\'chelsea\'$rewe&$fans&$king&\'listing\'&ourdes&0manchester-stoke&\'rejects&/settle-carlisle\'$tuff\'(upporter%%/aire&)liverpool%!0',
+    '%%2.gif%!3#&eeches%!e$#ttt#!f$!t##hey$$olme#,k-and-potato%%based$"am$%brook#)lachalima#"ne',
+    '##ona#$ping#$rers$"ie&!s%$ness$$ling#(s/father%&parcel$"as$$burg$"en$#ons$"te&%maker',
+    '#1t-judson-kauffman$#ham$#tle#\'uwarden%"en\'%horst##ves"-f&eacute;bure%2grave;vre-pontalis#%/gref#\'aucheux%!x##coe%#urt#$ebre',
+    '$#ver%-re-identified#$kada##nol#$ranc$"oy#0t&rehy;of-centre$!\'%+authorities$%-\'and%%alone&*nd-a-right%%backs\'"nk&%ooted',
+    '&.rain-dominated*#ers%*controlled%*dislocated%*engine-out%%flank&%ooter&$ront%+hand-corner*$only*$side&#old\'$oker%(is-right%1labour-controlled',
+    '&\'iberals%(of-field&)rientated%\'radical&)ight-fire%)side-only&\'mashing&(ocialist%(thinking%,versus-right%/wing/right-wing)#ery$".1%$what$\'/centre',
+    '%\'marxist%)paid/made%-right/up/down$%:this$$_off$#arm$"er$\'handers$,ist-populist\'(/liberal$"on$4wards-and-rightwards##uel"*g&rehy;bye#)\'s-eleven',
+    '%%rmour$%bones%$reak%"ye$&cutter$%elbow$(feathers%$rame$\'gripper%%uards$,in-plastered$$lock&"op$)o\'-mutton%$vers',
+    '%$ower%%uller$\'ribbons%%owing%&ubbing$&sleeve%\'pin-and%%traps\'\'etching$&theory$%veins$&warmer*!s$%yield)#ing',
+    '#$ache%$urry$0l&rehy;judgments%3-constitutionalists&*democratic&%eagle&&formal&\'looking&$size\'\'pecific\'$tyle&+theoretical%//administrative&%moral%)framework',
+    '&)stically.&#zes%+ly-acquired(&culled(\'defined(+enforceable(\'learned()qualified()sensitive%!y$%nanny%"es$#spi%#tat$!t',
+    '\'"um%"us$$vero%!i$#zpi#&breaks##co.$&utters#!e$"at$\'nd-full&,ary/literary%"ed%%tibus\'!l',
+    '%!e$#tet##ful#.g/conservative$#ada$#ers%!t&+t/executive%$vamo$"ie&!r\'!o%!n%#uno$#ott',
+    '%!s#\'h-jones$#ari$!s#!i$"an$#bus$"la&!y$&mitacy$6on-meets-dessert-storm&$aria&!e\')lla-laden)$osis',
+    '&$naie)(re-style$(slation*+%-here+\'/health,,intervention,*regulation+!p+#see),ve-executive("on$,t&rehy;imate%!.%.i&rehy;mations&(matizing',
+    '\',ist-dynastic("ti\'"um%!s#!l$\'isation#%mania#$nice#(o-legged$"da$%menon$!n#&rendre%"st$"is',
+    '%#man$!/$)_in_front$\'pinners$%traps##uay$"ia$!m%&e-rich%(inosarum##wax"#han$"ve#(endakari#$iste',
+    '#%manns$&brucks$$kuhl#"na$"er&!t#$ohla$#vec#$rain%&thghan$$buch$,gemeinschaft$/plan-verwaltung#"ti")i-cee-ter',
+    '#%alala$(samaivao#!b$%brand$%erman$)fraumilch$#ing$&nizian$.owitz/candyass$$rock$)standarte#!c$)a-in-hand%$flex%!s',
+    '&"er&(ter-born*%finch)//leicestershire*)northants)&fields)2shire-lincolnshire/%south$&hhardt%!t&\'enstein-%klamm$\'s/warks#&decker%%rdorp',
+    '%&ebuurt%%plein$!t%$horp#&fchild##ger&!s%!s$&h-born&&fermor&"ho&-pemberton/old&%style&#way%(/british',
+    '%&bridge%&inmohr%&terton&(on-boyce)%jones)$pope#$lane$!s#!n$)en/mother%!r$%sdorf$6twardine/herefordshire#\'ocassis$%lepis',
+    ')"ta\'\'sarcoma#"pe%*r/daughter$"oa$&zigers*&trasse\'\'strasse#!r$!a%#vay$#eag%"ns$#ner#"sl',
+    '%#ner$#ter%#ner%(on-based$%urama&"e\'\'!*\'&-agent(&centre)$lass(%image(*orientated($park))referring*&oducts',
+    '($type\'!/((cultural(*delinquent(\'hobbies()interests(&poseur(,recreational\'"co\'(ly-paced\'!s\'$town$!z#%tende%!r',
+    '&$ross%%auser%!e&\'-jasper&"ad&"rs$&stelle$\'zegrund#!x$"it##zen%!r"&karski#!h##nes',
+    '#%torin#%ythoi""la$!n%%d-daf#%eatta$!i#,i&egrave;vre$!a$!o$$veld##lan$"ey$!i%#ott',
+    '#&ooskin#%ystad",ma&icirc;tre$$gnen%#rut$#nde$.rchand-clement*!s$#yev#$beke$"it#(elstrich$"nt$%rcier$!s',
+    '##ine%&kainen$"re#$kuhl#\'menjoki%!r$"ie%#ng.\'#ton$!o#\'nalarry$#ian%$scal\'"us#%oinei',
+    '$+n-and-white&$blue&\'colored\'&utting&%green&$musk&&orange&%shape+!d\'\'queezer&$type&)whiteness&$zest%+ade-sellers(*/orangeade',
+    '%"iz%$nier%"s.$#ses$"ui#"pa$#des$"el%!r&!t$+ri&egrave;e."re&#ere#$rick#%sford',
+    '#\'ur-like##wig""n\'#%aghan$#han$$more$"na%#der$"re$!u##che&!s%#mob%!o$#los',
+    '%%uerli$*er-clients\'%to-be%!s$+ing-library&&ienses$"on$#vay#"er$#sta#$fest\'"ey\'!y##g-1$"eh',
+    '&"er$%hthen&!y$.th-and-a-half.,$half\'%brown\'"in\'$mark\'$time((o-radius\'$ways($idth)"se&!/\'$time',
+    '&#men&/ofbeak(sparrow)-"x)&$sman$"ua#!h$#ert#%ienty$+han/husband$/n&mdash;perhaps%%\'-had%!g&&raders)%skaya+!i',
+    '%1ist-clausewitzian))stalinist$"os$$tion#&khanya#!m#%nartz$!e$#ick$(on-esque\'%style\'\'trained&,/countryside&%esque##oci',
+    '%*mand-bacot$&x-hill#*s-aperture%%based%#cap&#lip)!s%$down%#eye%(friendly%$like%%maker(#ing%&system%\'to-film',
+    '$(crafters$!e$&person$"th##tal$$eild%#nin%$rman$#fer$,h&eacute;ric%$eric$"ia%#ces&\'ularity("es',
+    '%\'ginosus&%nosum%(l-shaped&&burger&#les%#nis%$scus&$simo%\'viruses$#oid%!r$$ulov$!z#%yenye$#gon',
+    '#$zing$#ner"&o-like#$bert#!d$$geld$(iensians)!s$#nik#+ffl&aelig;d$#gar$$sine#)gangerhof##lin#0minster-prepared',
+    '$%ard\'s\'-/photographer(#the\'$o-de\'$slee\'"us%!s%"to$&berger$\'cavallo$#dre$&e-born%#llo$,idas-prophet&!e',
+    '&$ovna%"la$#ova%$wens$!s$%tieff&"ne\'"oi%!y#&pard-1($hunt(%print(%sized\'"el\'#ine',
+    '(/town-cheltenham\'$town$&oldian%$ulis$#pky$%repes#"ra$$ibus##tta##vic"+p&euml;shki#%asset##cha#"en$(r-cloths',
+    '%!a%!e%"s.$%stone#*idocyclina&&pteral$#ota$\'smatids#\'oidevin$+racanthicus#$pien%#ngs#&rehorn$&osaria&*y-infected',
+    '$"ic%!s$%odora%,geosynclines%(nychotes%&ptilos%%seris&$omia&&permum\'#ira)%illum%$tene&%horax$"us"&quemia',
+    '#"en#!i##man$(ooserhof##ned#%oghis$%tholi%"ic#"ry%+/specialist##ste#!t#!v$"ed#$well',
+    '$"pt##bia&)n-centred((feminist(8jewish-nazi-transvestite(&loving(*orientated\'"as\'"ly\'"s.%&erotic#!c$"ek$\'h-nyhan%%allas',
+    '&\'naultii&!r%!t$&ouezec#)e-majeste&&jaests$"di$!l%$idze$"th#$hana#"ie$*on-induced&"al&#ing',
+    '$!i#"le%%y-ann\'+green/david&\'/leslie$/ie&mdash;silver\'%ndash$!y#"ne%!s$"ik#"on$$tho*$%zavad#%ponne',
+    '/(majority**understand$"\'n$,-accountable&&doring\'(vantaged&&nxious&)rtificial%&boring&#usy%*celebrated&.hart-more-chat&(ommitted($plex\'\'ngested',
+    '%$deep&)igestible&\'ramatic%&easily&(bullient&(fficient&(nergetic\')lightened&%xotic\'\'plosive($osed%+fashionable&*inancially&$ocal\'0rtunately-placed',
+    '%1gender-segregated&)lamourous%(hallowed\'#rdy($mful&+ierarchical%%ideal&(mportant%&lofted\'$vely%\'obvious&$ften%(palatial&)erforming(\'ishable',
+    '&&oliced&&recise((dictable\'\'ocessed(&minent*$sing(\'nounced%*quantified%$rare&(eputable\'&signed(\'tricted&$igid\'#sky%$safe',
+    '(\'ubrious&)egregated\'%rious&%ickly&$olid&\'tandard\')ereotyped\'$icky\'&riking(\'uctured\'%udied&*ymmetrical%(talented&(echnical&6han&rehy;accommodating',
+    ',(vertised+*pocalyptic*%brash,$ight*(cautious+)hivalrous+)onvincing*-distinguished*-earth-shaking,"sy+)nchanting+$qual+\'xpected*+fashionable+1irmly-established',
+    '+&lowing*(hallowed*%ideal+)mmaculate+(nspiring*&linear*\'optimal*&poetic+%roper*(reliable,)spectable+\'igorous,%nging*0state-of-the-art+)uccessful',
+    '*\'tactful+\'he-dust*&willow&)rafficked%)urbanized%\'visited%(wasteful&&elcome(!l)$-off&%ooded\'"rn$#.k7$%/turn$,_,_less_than',
+    '$!a%"rd$,ees/trustees0!.%*ligibility%!m%*n&rehy;ing&\'-stress%)r-crested\'+disciplined\'%grade\'$paid(\'riority\'\'quality\'\'ranking',
+    '\'\'spotted&!s%"ur$"ie%%ovski$!l$$noff$"of%"n\'&\'-a-week\'$book+!s&!.\'!i&!/',
+    '\'#etc%#ued$$ways#+ter/butcher$$rade&$nges$$zten#$ueur##vos#/zczy&nacute;ski"(t&egrave$\'formula$*iacute;cia$*mdash;down#!\'',
+    '&=destroy-the-party-from-within&9get-down-to-real-business&+have-a-show\'Dear-it-for-galilee-purify-your-heart&2stay-poor-together&/talk-about-this#+-me-through#)_er_let\'s$#out#!a$%novce#$ches%$lade%-worth/hitchin#&e-foho',
+    '%$lier##gen#$haby%"ia%.l&rehy;looking&)-pop-edge\'&versus%"ne$#ean%!r&$sich$+i&egrave;re$#not##ica%"ia',
+    '$\'oan.doc#(n&aacute$!a#!o$"ul%%rneau$$wska#(rasetted#%slink#"t.$$ario$!e%!d%,r&rehy;boxes,\'writing',
+    '(&ombers+#ing+!s)#oks\'$cage)"rd+!s*$rier(#ode(%utter-!s\'$flap($orms\'$head+#ing',
+    '(#ole\'\'lashing(&eprosy)#vel(#ike\'$mail\'*of-the-law(%pener()rnamented\'$pair(#ost($ress\'\'segment)&quence(&pacing',
+    '\'&unless\'(writings&\'/letter\'%phone&!3&%books($xing\'#ugs&!d&(headings&$ings\'!o&%paper\'$late&\'s&mdash',
+    '\'!-((me-right(&patent\')/articles((comments(\'numbers(#two\'#_in\'"et\'&pacing\'#ton&!z$2ing-your-hair-down%!s$#ner',
+    '$&ristes$\'s/camra$+uce-chewing()flavoured(&garden)$reen((stealing$#yse#&zeburg$#ten"%u-try$#val##122$!5##516',
+    '#"70#"81#"95#%aosis#%cadia%$enea%)nthamella%!s$$hand%&orchis&\'stachys%\'tenberg$&ine-co%$stic$$kert',
+    '$\'ocratic&/yte/endothelial("ic%.encephalopathy%\'geranus%)no&egrave%)phthalmus&%lakia&$tera)"us%$rhoa&$rhoa&%yphus\'!x%#sis',
+    '%$tomy\'!s&&rienes$#tra$$urus#"ga$%ering#&keamia%$mans&"ic$#ios$0ocyte-epithelial("ic%%linon%!n',
+    '&%lakic%\'rtienes%%trien($ones#"le#!n$!a#$pena#%rbost$"ve#%tasch$"ry$"ze#!u#(venhaven',
+    '#"xe"3v&eacute;e-en-masse+!s$&yacute#$-els#,ada-trekking%$eiro%"ia$%ghery$\'illanti$)k-svajger$-nti&egrave;re\'#ere$!r$$ssor',
+    '$\'vasseur##el*%/-\'professional\'&!7&)aggregate&%based\'!y&)crossings&$none&5of&rehy;understanding(,-explanation&#the\'"op&%units%".8',
+    '&$gcse%!=&$10.2%(led-down&\'ing-out%&master%\'s-rural&(/changed\'&opened\'$took&*pakistanis%!t$$nham%$side%\'thorpes',
+    '$$r(s)%$-arm&*controlled&\'pulling&(to-cover))passenger%.age-increasing(!s%#enz&!t%,hulme-funded%&ingham&"te%&keusen&$uehn',
+    '%%sedge&"ha&#ons%(ton/save\'!v$$sque#&i-clad%$like%,shevardnadze&,trauss-style,#ian$$able$"ch$#ers$#kin',
+    '$(ne-meyer%#ger%$sall%#ton$"ta&!s&(tionists)"us\'#ors%#off&!r%#ron%#ski\'!y%\'towners',
+    '#)kas/nidri#!o$0dopa/benserazide("in$$nian$\'rphanol$#yah#%rette##uka##ver#)y-agresti%%bruhl%\'marchal%&paying"2wandowskiownership',
+    '#*d-sounding$!e$%nesse$!s#\'ednesse%"on$$llen&"yn$$ndon%%stein$!r$&s-born#,in/northants%$sohn$(s-ashley',
+    '&$like&%razor&$tony%$/all&\'baptist\'&ritish&(director&(landlady&(mcalpine&(national\'$orth\'"ra&&prison&(research&\'student',
+    '&*veterinary&#wbc%+agriculture%$burn%\'hamborn%!i&!a&$fied%#man&"en%#ohn%)solicitor%$ward$#tes#+knor/oxford',
+    '""xa$$-myc$!n%#der##ell$!y#%group##ias$.cal-functional((semantic\',/grammatical\'1:syntax:semantics\'\'isation(&zation)"ed',
+    '((yntactic&+graphically&)logically&*n-building(\'grammar\'!1\'!2%"us$%fiers$$gram$&phanic$!r$)s/grammar&%nexis#$meks',
+    '$!n##ton"(y-hunter$$line$&matrix#$anum$"su#,borne-popham#*den-period#!e$$naar$!r#4hill/gloucestershire#)land/brel(*lancashire',
+    '(%volvo\'!i\'!s$$ines#%marie$#oor#+s/adventure$"en$*hon/victim$#ian#$tons\'$tode"!z#(ardrieux#&h&euml',
+    '#!o#%zypal!Of-you-really-loved-me-you\'d-love-my-failure-too"%/aoun"$0020"&58,400".a-1-expressing$!2#!3#!t"!e"!g""mc"%pack2"(r240,990',
+    '"!t!$g.64"!a"!d"!e""iu$!m"!j"!k"!p#(mmgimms1"%r/wnk""sm#!s""tb',
+    '""vs"!w!$h-20#(jetronic#"rh"#200"\'agvagyn&%jabyn#"mo$%suren$"yn#&nbryde#"rc""ea#$rmet',
+    '#%vinne"!f"!h"+iannon-shee$$ttee"#ooq#"se#"ta#"yd""rw!(i&eacute)#;ge,$oise*$vano+"re',
+    '$\'tilde;o#)scaron;on"#\'l\'"!-#!1#\'cheng-i#"fa$\'raumeni"#.g."$3100"!4"&=ts/tt"$abes$(ilities.(+y&mdash;for',
+    ')#.in+!t)&/asset$!l%(ewhether%#ity#)copoulous#$dett$"in$"ov#\'ilities$$sed.%#ion%+on/advisory(,coordination',
+    '#)na-webbed$,gsiriprasert$!i$"na$#oid%$zovo#%otung##pis#"r.$#det#$skas$!s#$tach##zos"-b&eacute;chov',
+    ',*ation-nord$(rehy;dem#!\'#$-con$$eral$+theological#"/c#\'anaises%!i&"us%"ka%"on$,tion-bearers$#ude$$vius',
+    '$"ey#%earty$$ccio$&l-free%!.%$ling&"us%%ously$!n%)sk&yacute$,ra&ccedil;ao&&alinen&6ci&oacute;n-cinchonero2)farabundo&"l\'',
+    '(Dconservative-social-democratic-rural,*titutional6#ist((idealism)\'nspired*/ternationalists)$rish(\'leaning*"ft(&middle()nationals)*on-liberal(-parliamentary)(luralist(&racist',
+    '((unionist\')/academic),uthoritarian(4catholic/evangelical)+onservative(/interventionist(&labour)#eft(+progressive(\'secular\'(democrat("om\'$iser*!s)"m/',
+    ')#tic($zers\'"le(*y-educated*+illustrated*&minded\'0no-demokratyczny\')s-joining(!.(\'/tories&$ndum\'!s&%ting\'(#on\'*6-causes-crime-in-women',
+    ',$ists*!s\'#ory\'$yion%%court%"ec%(ian-flag&"ca&$stic%!n%$orum)#que&!s%"ta\'0&ccedil&aacute;o',
+    '\'&rian\'/+.-individualist,(oriented+\'/social+$ism\'\'"te)!s&!i\'"na&!o&"us&+y-authority()curtained(\'pattern(%style',
+    '\'%ously%&o-less\'+quarterback&!s##man#"oi$)r-related%$ious#!r$!.$*a-drinking%"ir\'!e%!m%"re',
+    '(&n-aide*(disposer),/coordinator*+oxfordshire)"s.*!/*/hip/information\'*esarchives&,y-by-library(\'focused(&living((oriented(\'related()sponsored(\'trained',
+    '\'!/(,architecture*"ts($book(\'faculty(&martin($nick($paul(\'student,!y("tv\'$less%!s%"te\'!s',
+    '$$eros$"is$!y#*u&scaron;e$"da$#ran%$nica#\'ya-even&)lockerbie&&venice%\'n-based(#orn\'(financed\'(inspired\'$made',
+    '&$/air$"es""c1#!3#"cy#&e-bags&&rained%&filled%\'killing%\'pickers$!a$/nce&rehy;payers\'&-built(#fee)#ree',
+    '(&losing(%money(&payers(\'to-bore+$kill\'#.in(\'richard(#the\'\'/rental\'#key\'\'s&mdash((-general(./documentation\'$ware%!s',
+    '&)e/husband(#son&$ing\')!.%"za$$rius$!u#&h-gate$"al%!s$$edom%&n-clad\'&dapple-!d\'&eating',
+    '\'$grey\'$like\'&silent(%tains&\'ologist*!y\'%metry%!s$#ine$\'rospher$&tblick%"en\'&berger\'%hagen\'*stein-type',
+    '%$iger%#wer#-inian-sextian%!o#)k-nicking$*etty-split%!y$,in\'-spittin\'&"gs$%orish$$rish$!y#\'mophora#)oflavonol$"na',
+    '%*ice-straps\'#one##tor#"ua")d-corners#\'/frying$*splashback#"ar#%brook$#ury#-dell-grainger&"ow%!n$#iat%"ng',
+    '$!r#$gard%"te$"et#!i$)ngoloppet#!l#"mi$$outh#"os#&s:food$$trom#$trap#!u""e-',
+    '$)detecting%"on$"up#(b-hirmer$*ebotschaft%!n%%rkuhn&$mans%%slied*)er-walzer,&walzer&*tr&auml;um$&frauen*$berg$%igite',
+    '%"sh$#man$%ovitz%\'witz-15$%riech%"ow$%schen%$tein\'!r&"od#-chtensteiners-%klamm#&delein%!n%&rabend',
+    '&%kreis$!s#"g\'$&e-lord%(lordship%#men#!h##kly#"ll##ner$!g$.s/encumbrances$&tenant$\'unculus#"pa',
+    '#\'s&mdash$(-in-wait$$chen$&elotte$"se$#tal#"ta$!o$$uvai$#zke#+ut.-colonel%#ant%/enant-colonelcy2!s+)governors',
+    '$!w$!x#"ve%"ns$#ore",fe&mdash;all+\'chances+*expectancy+$rome%)rehy;boat*%cycle*\'devoted**expectancy*&giving*%style',
+    '+&upport*$time$#(w)$)-activity&(ffecting\'*ter-strach&,gainst-logic&\'mbition&#rea)!s&\'ttitude%%based&&earing\'\'stowing&&oatmen',
+    '%\'capsule&%hoice&+ircumstance&$lass&(ommenced-$ment\'\'nsuming\'%urses\'#ver&%risis&$urve%%dated&$eath\'\'forming\'$nial',
+    '\'(stroying&(irection%)elevating&)ndeavours\'&hancer\'(richment&(quipment&(xpanding((ectation)\'riences\'$tend%%field\'$lled&(ormation&)ulfilling',
+    '%&givers(\'ingness%"he%(in-death\'\'stincts&)s-a-bitch*%party%$jerk&&ourney%\'labours&$ease&*ived-since&%oving%\'matches(!e',
+    '("el%)nurturing%&orders\'&iented&"ur%$path&#eer)#age)!s&#lan)!s&)recursing((paration\'\'isoners\'%oblem',
+    '(\'tective&#ump%*respecting(&toring&#obe%%scale\'%ience\'&orning&$ense\'%rving\'%tting&)hortening&(ituation.!s&%oiled',
+    '&(ponsored&%tages("te)#ure\'#udy%%table&%enant\'"rm&%hemes\'%reads*%tened+!s&$ime.&&o-life&)rajectory',
+    '%%water&-ithout-parole&%orlds%%years&\'ielding$&.style%+threatening$!/%"at%\'because%$cost%%daily%"is%$just%(non-life',
+    '%\'thought$):woolwich$)_in_terms$)boathouse&!y%&uilder&#oys$%giver\'#ing%\'uarding$%holds$%lands%,ess-sounding(!.%\'ikeness',
+    '$&saver\')!s%%hield%#ign%"on%3pan&mdash;login.com/#pmr2$.log/&router5$.com(%-able)#pmr)+to-lifespan($.dir)#flb',
+    ')\'lstrain(,formslibrary(\'version&#eed%%tages\'#nce&#ule&,yle-building*(oriented)!/$&tables%(ime-best*(roadened(&.after$#was',
+    '%!o#\'feforce%$span%(y-soused$"oe##olf#0t&rehy;right-leg$$-boy%$cage%$down%#for%&making\'!n%$offs&"n/',
+    '%&phobic%\'sharing&%traps$%/load\'#wer$#and$!i%"me%\'ng-gear\'!.\')/lowering\'!s$%lines$"s.%$haft',
+    '")gamentous$!n%\'d-based\'%gated\'\'induced)&tegrin\'%metal\'(receptor&"ed&#ing$#ses$"te%)ion-sites(!s%/ures&mdash;they',
+    '$!r%%twood$$tian##gat$"er$"ts#!h$#lty$5t&mdash;manufacturing,0phototypesetting&-rehy;blanched+(coloured+#day+&headed.$rted',
+    '+$wear-*lterweight%,\'/\'classical%\'-action\'(dmitting\'"ir\')mplifying\')nd-bitter*%power(+ti-aircraft\'#tom&%based\'%odied(#ned(&ttomed',
+    ')$ined\'"ut&(catching\')ollecting($medy("rd\'&ruiser\'$urve+!s&)demanding(\'tecting\'%riven&&engine,%ering&)fantastic',
+    '\'%ilter\'\'lashing("ex($ight(!y)&weight\')ootedness&)gathering\'%emmed\'%iving\'#rey\'"un&&haired((rvesting\'+eavyweights',
+    '\'#old*#ing(#urs)#ses\'%ungry&*industrial&$load("ck($ving(&zenges&(mahogany(+nufacturing\'$etal\')icroscopy(+ddleweights',
+    ',$ness)$utes&%opera\'"ut&&panels(\'rticles("th\'#ipe\'*lus-colour&&sabres($ddle\'&econds(%eming()nsitivity\'%haded',
+    ')$fted(#ows(&unning\'%ocket("il*"ed\'&tarred(&epping(%reams*$ssed\'\'witches(%ollen&(textured\'#ime\'*o-electric',
+    '&#use&%valve&,water-cooled\'%eapon)$ther(#eks(%lters\'$ight%!/&%cakes($sual&*mid-weight\'%oving%$14.1%%:dark',
+    '\'#wne&)ulb-nosed%&cliffe%%eners\'$ings&\'r-brown(&camera)#lad)%oated*&loured(&socket($used\'(/heavier\'(coloured&"th',
+    '&&itting&$lite&#ood(+t/organiser)"ed+$ness%\'graphix&"un%*headedness&#ill&$orne(%seman\'#usc)$eman+"en',
+    '*)onditions)$fast*#uel)*rehearsals)&spread%&keeper%#ley&.y&rehy;stocked\'\'-boiled)\'uttered(,contaminated*$oked(%drawn(&gelled)&reased',
+    '(&milled(%oiled(&padded)(opulated)&ressed(\'stocked*$rung,$tted(&tanned%*mindedness%&nesses&0ing&rehy;flashed)(-blasted*.conductor-like*%faced',
+    '/$ings*$like*%paced*%sharp+$park-&ttered,#lit+$wift)\'.police%$oler%$path&%encil(!s&#ole&$roof',
+    '&\'tepping\'$icks\'$ring%"up%$wing&%riter%$year#&icharf$.er-lamborghini#&naform$$eous%$reux$!i%(fication%"ns',
+    '#"on%#iel$#rio#%resti#&terink$!u#$uans$#eur$#ory$#res$%stica&"ri"#hir#-ou/mainstream"%iiike',
+    '"$joie"%k&amp##asi#-e&rehy;minded$$\'ell$!-%&as-not%\'charged&$ould%%faced&(eathered&"or%!i&$t-is%*mindedness',
+    '%%sexed&\'ounding&\'pending%"to%&unlike%$what&(ith-like%#you$!.%"it$!/%%di:j/\'\'fferent&!o%"it',
+    '&#uch$#aaa$)d&mdash;a%#.it$$lies&-hood=-132.894*-s-\'publishing%%yhood$&minded$!r%#ous%\'t-style$"s-$$that%!o',
+    '&#se.#(hovtseva#!i$.ng-auntie-kate#"le$$iest#,ud-dominated&\'leaning##yng")lac-black%#ina#$burn\'"es#!e$"ts',
+    '$#boy%%ulero$"co$"ed$\'iformis$(uokalani#&jeqist&$uist##lan&"ds$,ee/australia%#moe%!s&$trom%!t',
+    '(&tudent\'&victim&%garth&!s$(ibullero\'%rlero%&esleaf%!g%\'ngstone\'#ton%)putianism$!o%#oet$"ye%%stone',
+    ')!s#*o-emptying$$ngue&(we-based$#oet$!s#!s#"y\'$)-coloured\'\'ntoured%&filled\'&ngered&&lowers%\'gilding%&leaved',
+    '(!s%%roots%\'skinned%\'trotter,!s$#pad$%white"2m&oacute;n-covenas-&puerto#%-wood#(a-callao$#con$#gne%%raine$!l',
+    '$!y#(b&eacute$\'-aching%$base&%iting&\'reaking&"ud%(flinging%\'jerking&$oint%)loosening%)twitching$&/royal$$assa%#ugh',
+    '%)rgstollen$$hood$$kins$&o-land\'#ine%!s%#urg$4rick/gloucestershire$%urger%!s#*e&ntilde;o-!s%*rehy;green$*-and-lemon%&burner',
+    '%)encrusted%\'induced%%juice%%light%%scale&%haded&%quash%&topped%$wood$\'burners$%d-oak$%hurst$&light.$$nios$!r',
+    '%%stone$&sticks&-one-producing*%shale)\'/gypsum$%woods#"id$%mited$$nary%$gton%"ii$(t&eacute%#(s)%!*%&-cycle',
+    '&%order&\'setting%)/infinity%\'ations.+%/size%\'ed-ammo($iron($menu(&period(#run(%scale)#lip)#top($term)\'hinking',
+    '\'+/ambassador\'"ly\'$over\'!s&&r-like%#ies%&lessly%%rophe%$s.in&"it#$mers$!y#!n$#aea%#nth',
+    '%%titzk$(ological%&philia&\'ithecus%#rid##oed$(g&eacute%!e&#age$&n-peel%"gi%$oids$$rent$+usin-quercy()e-comfort',
+    '(!s#)p-brimmed%&dicked%&limbed$"ac$#est%)t-crusted\'%stuck$#ide%"n\'$%sfeld$"us#%stone#%usate".n&eacute;aires',
+    '%!s$!l$"re&(scentral%"ia\'!s$!s#$berg#"ce%"an%$stis$%h-pin)!s$"ki$%lines',
+    '%$uden$!o%7ln-jefferson-washington(*washington\'!e\'#ian\'*shire-born%&nshire$%stone$(tus-like#*da/glasgow%!l&+-in-furness%"rd%!y',
+    '&"ck&(rgh-like%#urg$&egaard&#ren%!l%(n-museum\'\'scented&"au&$baum\'#erg&$mann&!s\'$tein(%rasse',
+    '%"rs%%sberg&$fara$!h$"ia%"go%\'nferetc$$ores&!m&!o&!s&"us%$wski$\'say/asv((director',
+    ')%ector%/ey/warwickshire%#ley(!s%%trand%!y$!t$"um$%y-hop$#zey%!i#.e&mdash;number%-rehy;segments$"\'3$$-\'if',
+    '%(and-wash&"rt%&backer&%reaks%%count%\'divider&$rawn\'%ivers%\'editing&\'lements&"nd\'&graver&%tched%&filler+!s',
+    '&\'ollower+#ing\'&r-line&#ree%#hut%#ins%&laying&\'earning\'$ngth\'"ss&#ike%(managers%+of-business(&flight(&packet',
+    '&#ut.&(ver-line%$read)$ings%(scanning&&hading($ring&#ide&&pectra("ed\'&inning%\'to-line\'$eing&#ype%\\up-outside-the-door-and-you-can\'t-come-in-until-you\'re-quiet',
+    '%(whitened&$idth&&orking$!.%#ben&&rundle%\'hunters$!/%#031&"41%+double-stop%"le%#mic%%table%$vent',
+    '%&mented)"s.%$rise(#ing\'$zing$#ful$$hall$$kars%(er-level$%level$#men\'!t$,n-and-silver&%bound(!x',
+    ',!y&"is&$look\'$ycra&\'mending\'"ix&(panelled&$room&$type%\'/cotton,%/silk&)polyester&\'viscose%$hire%\'weavers',
+    '&%notes%!.$$s(c)%$-but&#out%\'/farmer&$last%$eman%$mans&\'en/refs$#tte$#ups$+weaver-burk%#ork#Ofield-glentoran-portadown-glenavon-cliftonville',
+    '#-g-and-bracken%$ling%,temco-vought$\'/player$"am&)a-toleque&!s%!n%"ra\'#bay$%burgh%!y$!e%&nauber%#rer',
+    ')\'in-rock(!s$$hade&"ms%#olm(!e$"la$$more$$oism%"la%%teras$%raves$%sberg$#uae&&franca',
+    '\'#ism\')tic-based+(literary+0representational*!/+(literary,&ogical*%ally-/%based/*challenged/(informed/(relevant1)presented.+/physically*#ian',
+    '+\'/mcgill)$ques%#lid$$wood#"ha%!m&*/organizer%"rt$"of%#use#%ieres$!i$%ments$\'n&ndash%%ecarn',
+    '%%g-out\'$side#%k-boy%\'editing%(legering&#ine%&person+!s%$type%$wire&%orker$$.but$%/plus$+agriculture$#boy',
+    '%#nds$$hall&"nd&#ven$"ia%!n%#tis$$line$%names$#pin\'!g$\'s-where%#ide%$land$"um',
+    '#$lake$\'ey-xxxx$+ithgowshire#$mack#$nane%$rrat$(churping$%deman$!e%#aus%#man%"na&&draper%)t\'s&mdash&%-like',
+    '$#ing#%o-cut%\'floored$#cut$"ey$%leoyl&*um-covered)(infested)$like)&topped("ed$!m$!s$-type-printing#$pack',
+    '#!s$#ang$%bauer$/cott/somerville$$dell$!e%*ll/nursing%%nmair%(y-woolsy$%lade.$"on$#ter#)t-bandage%&filled%&haired',
+    '%"ll%"rs$0hal-ziegelbrucke%$ouse%%waite$$ners$#ock%\'m-orman$&rethen$%valve##val$#iew#\'yphiids$"un##zen',
+    '$,ie/edinburgh")ocarcinus#!d#!h#)n\'s-share\'%teeth($ooth$%-body%&cachet&#ubs%)goddesses\'"ld%$head&#unt%(infested',
+    '&$outh%$neck%*surmounted%(watchers$"al$$care%$over$!e%(ljohnson$$hart%#ope$"is&%ation&"es&!h',
+    '%&zation$$king$!o$%share%#kin$$tail$$weld$!y#)pleurodon#)retograph,!s#&uville##zno"(p-biting$\'curling',
+    '%$lesh$\'glossed$\'licking&"ne%#ock$*o-sections$\'readers&%moval$\'smackin%%poken%&ynched)#ing#$/plh#%alian&"ke',
+    '$+se-colipase&!s#$cote#&ectomy$#tsk%!z$!x#0hook&ndash;alton&!l##id-&&coated((ntaining&\'induced&,metabolizing&\'storing',
+    '%!/&"ml%(ologists$$etz\'$!f$"ng%#ski$!p#%lines#+o-oxygenase$-arabinomannan$)dystrophy$\'fection$\'genesis$%lysed',
+    '$)philicity%&roteic$!s%$omal\'*e-mediated)&system$+v&scaron;ek%&echeja#\'pekonow%#nin%"rt%"tt\'!s$#ily%#sch',
+    '&"ts$%stadt$$uner#&reader#\'s-based$)/eugenius$%chutz%+omb/moreton("es$$edge%%rvice$#itz$&mackin*!g+"ly',
+    '$,tick-smeared*&tained)$tube(!.$#ync\'!a#&tinite)%-rich&!t$#rot#!u$#lin$#nan$#tin#&vinoff',
+    '#$ztik"$qing#\'uafruta%#men$)eur-maker(%sized$#id-\'%based\'$drop\'%level(#ike(.unch-from-hell\'+natural-gas\'\'polymer\'%solid',
+    '&$/gas&"=2&0ation/bankruptcy+#ist(+or-awaiting&"em&!i\'%ating*"on\'#sed\'#zed(#ing&!y%#pak(!s',
+    '&#sia%$trak$+or-loosened\'&smells($tore&%ed-up&,ice-coloured*\'tasting)!s\'"sh\'#tes%%urice"(ra-laden$!s#\'e-laden',
+    '#"ia%"no$!o$!s##off$!n#&rechur"-s&rehy;teners#&a-jane%!x$\'ndrello%$elly%"ne$!s##bay',
+    '$$ofin$$urne#&cahane%"no$%ences$"ia$#omb\'!e#%eanne$$berg$!f$$nces%!s$#tte$#use',
+    '$$nski#$kamm$"ov#.le/oxfordshire%!s#(nagelvin%1skea-newtonbutler$#ers$%iskey#"os$!v#)p-machine$%ector$$ings#$sack',
+    '$"ek%#lle%"tt$"ie%$tzky$#ons$!y#/t&dstrok;3urinn%)mdash;all+%buyer+9of&mdash;dc&mdash;package+&seller$"**$%-form%"is',
+    '$#/is$"ad$)ed/quoted\')regulated%!l%1n&mdash;otherwise&!-\'"in\'%to-me&\'ability&#ed.(#_at\')r-blaming)(narrator)\'related',
+    '("g-**conditions*\'devices*%level*%posts)!.)*/answering%(r-hooded\'$kaye\'&petter&#ine\'$osis$#ica%,ng&rehy;that\'!.',
+    '*"30+!6$\'loaning$\'nership$,on-patterson%!s$\'rel.lis&"ss$\'s.keith%&erver.$&vyanka#%vesly#+zt-thalberg%&omania"*t&rehy;ter',
+    '$!n%#iae#)chborough%#don%"et%&fields%$urch#\'e-metal$$/25c$"is$%lines$-racy/numeracy&$lise*!d)#ing',
+    '(#zes)#ing\'!l("y\'\'\'minding&$rily\'\'y-based)2cum-public-affairs)-establishment),intellectual)&minded)&sleuth)+theoretical(+/linguistic))political',
+    '&!t\'.e/pre-literate("ly\'$ure-+%based+\'nucella+&search1#ing*".a*3/derrida/philosophy+(material+,publications)*geschichte%$erry$!s',
+    '#$fest#!h$%afest%#rge$%eness%!r&)land-born%"st$$gows$%iasis%(omethane&$nite%$stid%*um-bearing(\'calcium',
+    '\'!s$"o-&(printing%)/porosity%$bius%$dora%(function%+geochemical&%raphe+"rs*#ics*"s.*"us%!l&!a',
+    '&$ogic*$ally%#nia%6phile-element-enriched\'$ones\'%yllum%)siderites&$omes&%tatic%"to&\'ripters$$ping$#rig$!s$+uanian-born',
+    '+&polish+#run-%ssian+&soviet*!.#/igation-dodging-\'minated+&hungry+\'related+%style+$type\'6ors&mdash;particularly%6iousness-inappropriate$!l%!l',
+    '$"tz#"la#)mus-paper#!o$%ptems\'"rn$#ria$#tes%$rite$\'vchenko%"el#)re-carton&%sized%$.mol%!/',
+    '&!2\'\'&frac12\'+pt/4&frac12*!5&)3pt/7&amp&!4%\'s-worth&!.&)/2&frac12(".5("20\'!h("ad(&ectare\'%metre',
+    '$!.$#ain%"ur$&barski$!e%&lwoods%)r&auml;ra&)-a-chewer\'%based(&earers($lown("ox\'&choked(&lutter\'(disposal',
+    '\'$lout&&ateurs&"er&$fall&"is&$pool&&strewn$%l\'uns%\'e&mdash&!\'\'!n&$-\'un\'%aired(+ssociations\'&bit-of',
+    '($lack(\'oy-lost\'\'crested\')developed\'*englandism($xtra\'*frequented\'(heard-of)&ralded\'&knowns\'%light($oved\'(magazine(1iss-never-forgets\'%noted',
+    '(!r\')practised()ublicised.#zed\'*remembered)(searched\'%shown\'&taught(%ested($ried&)/homeless\')leicester\'"no\'&oxford\',recruitment/',
+    '&$bank\'$redy&\'chester\'$otes&$dean*0/gloucestershire&\'feather&$gate&#ham\'"ey&%known&0more/oxfordshire&$page&$tons("wn',
+    '&%weeds\'*ood/nasuwt%!y$&mannen$#ora&"ia#&uratus%-gical-musical\'(ological$"ya#$vaks$$onov#%ynski#*zmannstadt-"er',
+    '#%bimov#$chow#$dger$!i#!e$#rie##ski#"ti%"zi$!o"$v\'ry#&accari$)di&agrave&!a#-e&lsqb;s&rsqb',
+    '$\'-aboard&"id&#xle%&effect%&firing&*or-the-day%$long%-now-pay-later%\'section&#pan&$tock%%virus%&weight$!.%!s',
+    '%"tv$\'ability$\'bearing$"d\'%3-happily-ever-after%%.here%#_up$#ish$+lihood-jobs&#nes%&y-eyed\'\'looking\'&minded\'%sprig$$ners',
+    '$"r*%!-&)and-bacon*)wine-roll&%brown&.cancer-causing&&eating&%fluke\'\'unction&&marked&#rot%"as%%ishly%#man%"on',
+    ')!-*\'centred*&euston+&verton*%kirby*)newcastle)%.thus)!/*,spurs/hendon)!1)$born)*portsmouth)!s)#the%(s-in-sin',
+    '&%idges&#uch%)y-porters$$s-in%#/in%*ey-hawarth%#ley%1tock&rehy;rearing)(-rearing**with-grass)!.)&/early$%ware\'#\'i-bacci$#gno',
+    '%,g&rehy;rooms&!-\'(but-dead\'\'chamber(*ome-dining)(nditions(*um-bedroom+&dining\'&dining-%-room\'%flame\'\'kitchen\'&spaces\'\'through(\'ogether',
+    '&4/dining-room/kitchen-(/cooking\'$neck\'0working/studying&&i-room&*ston-based*#ian%"ia#"ng$!o##ock$#lsi$#rne\'"se#,radois-forez',
+    '#"vy#&weight"#xin$#via\'$ting#$ouri#!s"%yange##eko#"un""z\'$!s#%-beth#)ard-bites\'$clad',
+    '\'&grease\'&tailed&#ess&!o&!y%!s#!s#"ti#!z$(ie&mdash%!o!#j-c"!."$acic%!i',
+    '$!k$"li%!l"!b"!c"&iljana""kb"$otic"!p"$ubic%#tza$%liana$"ov#,ic-mijatovic##ngh',
+    '!<kdhgryuiepkdsiwlgorrmfilekmd"!j"#ong#!t"!p#.&mdash;liberal#(rincipal"5w-montagsgesellschaft!)l&ecirc;n#,uacute;vatar"%.3oam#!d"#/pc""11#!3',
+    '#!4#!6""53#!5"!a#"ch#(d&oacute$"ro#%ethog#!f#%gonne#"is#&llagua#5n-beder-dyffryn-clwyd%$fawr',
+    '%%deilo%(elhaearn%&rthney$&berris%$oidy%%ydder$%danwg%&daniel&$oged\'"na\'$wror&#wyn%%egfan("ed\'"la',
+    '&$rfel&"wi%$idlo)"es%$oger&#ugh&/very-carmarthen%&ridnod\'.ndod-llandeilo&"og%#syl%$ulas%$ybie&#nan&$rnog',
+    '$)elli-born%$ngan%*rchgoediog&#fyl&"os%!s$/fair-yn-neubwll(&feshan(Rpwllgwyngyllgogerychwyrndrobwllllantysiliogogogoch%%erres%(ighangel%%raith\'#nco%%ynydd$%gadod',
+    '&!n&$then\'"wg%%edwyn&#fny&$itho&%nnech&*rnyw-based%#ian%&loffan%$orse&#wer%%ranog%&wnnadl&%yfan.',
+    '%#ybi&&nhafal\'$idir&%wneth$%herne$\'idloes-%$shen%&valoes$*llwchaiarn\'"ni$$onig$&padrig$2rhaedr-ym-mochnant\'$iadr%%othal',
+    '&$mlet&&nfraid\'#nan$$tada%&ysilio$%unwas$&villin$%wddyn%$enog%#nda%#rda&"in&"st%"st%%yrtyd',
+    '%\'mawddwy#"ta##wer$%haden$\'rybetws&$etws&$glyn$&ysgrif"!c#!g#!m"$ebar#+cen-fylliad$(heiddior%#ryd',
+    '&"en#"do#%gadas#%lliot#\'narasas##ras$#ena$!s##shi#$thyr##ven#$wela&*lyn-davies*+jones/space*(smith/st',
+    ')!s"!f##ord""gc"!i#"ca#"pi"(ldldllll#!u"!n"(obateres$#era##dio#"er#%ffion',
+    '#"ll#%mpart#"ng#"py##ral$#edo%)nte-evans#%warch#-yd&rehy;jones%--davis/doctor&$foxe&$owen&%still&.webber-adapted,\'/appeal',
+    '&/gloucestershire\'#ulf&&parent&&rachel&&slater&\'witness%"ia%*s-barclays\'\'midland&#.he%!y"%p1521"!r")ud-nuatha##isa',
+    '"$wybr$&ndyrys%%gwril%%madoc%%owern"%yarch#"fr%"au%(yddiaeth$#tyn#(gad-dyst#\'n-y-fan#!r#.s-y-fr&acirc;n$$faen',
+    '#%warch$-elyn-williams!"m\'"!/#!x"$1.50#%0(f2)"$308a#$2900#$915n""50"!6"!8"!_"%c/mmc',
+    '"\'ediated"!h"!i"!k"(mlsclble"!n""pa#&ortant""s.#%gsize#\'r-built""vh!+n(&formula)"$-foe"!2',
+    '"$deed#!n"!e")fanticide"!n"!r"(terlaken%(national-#ism-!s#%ifada#!s"6wr-boilerhouse-private!#o!s"\'&iuml;c',
+    '**shi&rsqb;p#%ndash(";e)!g"+-and-behold#\'bay-lia##cal&$-ity$#ost#"fi##han#!i#"lo#"nd#%price',
+    '#$rent##ves#$yang$!i"!/#"lo")ad-bearer+!s%\'changes%)discharge%&factor%+independent&!t%$line%+restricting',
+    '&$sing$+/elongation%\'project%%speed$(bearing.$(ed/mavis%!n%)r-mounted&)/leveller/!s$#fix$)ing-doors\'*/unloading$#pot$8s-of-geeks-crapping-away',
+    '&&shares\')wearwords%$tone#\'f-sized&$ugar#\'m-laden#+n&mdash;see$#(s)$)-accounts%$book&%uying%%chest%$deal%(financed%(granting',
+    '%\'related%%shark*!s%$tied%$word$!/%&rental%&supply$"ee$"on$\'s-based%!.%,/photocopies##sby$\'damoney',
+    '#!t$-hesome-on-sea*$ness%$ings%(someness#.ves-and-fishes"#b-h$*medallions#!a$!l$!n%,ov-rostovsky$!o$#ria$$tion',
+    '#"b.$#an/$!s$.y\'&rehy;adding%$-bar&&dosser&%force&%level&%press#\'e-ended$!l%%-page%&iaceae&$oids$%ngula',
+    '##ita##law#)opod-like\'!s$(s-penned$#tes%%hyris%$idae%%omies("se)#ing(#zed#)ster-claw)\'oloured(\'fishing',
+    '(#pot(#red\'#dor\'#man#&ulated$!s"&c-ated#!.$$cit.#%abail$"hn$"l-&$area\'-uthority-wide&#boy',
+    '&)education&%local&%party\'\'lanning&$rate&(sounding\'*toryteller&#tax\'(elephone%*/community&*individual&(national&,occupational&(regional&&school',
+    '\'\'tandard%!2%"e\'&#lli%%isers\'#tic(!s&%tatea\'*y-oriented((/habitat%/ly-administered)&pplied+(ropriate)(vailable(\'bottled',
+    '(+constructed(*determined*\'veloped)%riven((financed)#ree()generated(*identified(&killed($made(\'offered)(rganised*&iented((resident(+transmitted',
+    '$!n%"ts$+ted/created%,ing/creating&(on-based))obviously)%shoot(!.()/hardship)%speed$(vacances#"c.#%h-end$+an-speckled%\'rbriggs',
+    '%!y$&bridge%#uie$\'dochart$#ead$$fyne$%gelly$#ium$(luichart$&mallen$*nagar-glen%#ell$%ovsky%!w&#ski',
+    ')!e%#yan$#sen$\'winnoch#"js#+k&rehy;outs$"\'n&%\'loll$&-gates%%house%$jaws%\'keepers&#nit%&making\'*nufacturer',
+    '%\'pickers%$sets&#hop&%titch&%wivel%(together&#urn%1up-your-daughters$(/evening%&social$"e\'%&d-down\'#out%%r-key\'%lined',
+    '&+bie-trained+#ype)!s&#men$$fast$$gate(!s$%harts%#ead&1ed-boeing-general)*california)#led$\'ing-bar(%catch("in',
+    '\'-e/oxfordshire\'!s&#ver$%jawed$&keeper$%laven%#ear&"es&"ss&"ys$&making$%plate$"s.%%brook%#tep',
+    '$$view$$well%-ood&mdash;how(!s$,yer/daughter)%ebtor((managing\'!s#!l#)o-hauling%$pull%\'starved$.mbe-stapleford%"en%$otif',
+    '(0ve-manufacturing+\'testing$&rriere*\'/singer$"st#.rian&amp;sharp#$tite#)um_tenens$#rto$#ses%*t-infested\'&shaped)$ells$\'tionary"+d&eacute;on',
+    '#\'berries#!d$"er#&e-gold$#kka$\'n-green$%stars&$ones#%gaard$0e&ndash;muirhead%)-building%$bury%0ment/deformation)!s&$oore',
+    '%"st$#in\'&7g-houses-for-single-men\'&s/digs#$moor#!o$$icea$"li$"se$$wyck##ron&!s"#eak$!n#"bl',
+    '#%demel#!i#!k#&nfjord$*ing-baucke#%rincz##sch$$elii$#sic#(wensberg\'"on$!y%"ne"!f#!a',
+    '#%otens#$rans#(t-ladder$!b$#ers$$heim%%ouses$"on$"s.$(y-spired%!e"$g(f)$"y)#*-and-stone$%boats',
+    '&%rning$&cabin\')!-%\'hinking$)exporting$%flume$#ins$&jammed$%laden%)ikelihood$+periodogram%#ile%$ower$+sawing-like$\'walking',
+    '#!/$&linear#"10#"20$!n#)an/thames%#lea%!s$!r%,ithmotechnia%&ythmic##don#&ermann#$file#"ge',
+    '("ut%!n&$berg%\'r-heads&&enberg&&head-1$&ing-in(.while-drilling%$onni$!s$!y#!i$&blocks$&c-free&\'induced',
+    '%7/modelling/transmission%&a-data&!e&#l\'/\'*/illogical((physical\'*ly-planned*)sequenced)&_prior%.o-mathematical\'1truth-conditional$$n&gt%$.sql$"st&&icians',
+    '%"ed%(sporting$-/status/money$)centrism-$(daedalus$\'graphic$#kwa$\'machist$&thetis%$ypes#$rank#"s.$/dail/consultant#%teren#$weed',
+    '##ali$"ni$"ru$"us#!e$"it$"st#!f##man#$oues",i-aut&eacute#"ke#"n\'$\'-cloths%%death',
+    '$"ed$%heart$"s.%\'hendale%#kin$$tain(!e#(re-style#%saida$-ellepresident$#irs#&terin\'""ja$"ck%#ono',
+    '"*k-language$%style#%amaya#"en$#ren$!s#$inap#(ki-lines%"ng$"ys##oja$"le$%motiv$"no#$rian',
+    '#!s$#hen"\'la-ford%%mugen$"ni##ini$$ondo#$land%,palooza-type,!s%!r$"ey$!i%$-hop&$pops',
+    '%#lop%*ng-tongued%*pop-shaped*&ucking$"o.%\'brigida%!p&%along&"er&#ped&!s%#ver$\'y-stick%$pops##oni',
+    '#%worth""m2#"ar$&s/msfu&\'student$$tils$"wa$#xes#"ba%!r&(d/german\'#oni%%ttini$#eye$#ilo',
+    '$!t#!g#!i$"sa#$nica&!y#$onds#%ponda"&n&rehy#*/1990/1702$\'90/1702%&1/1370(#990%&2/220y##ban',
+    '#!c$"le##den$+ino-batavae\'%logia$*on&mdash;9-)leningrad-<reading&mdash;didcot-bristol\'+ndash;aswan-%cairo/%lgary-(holyhead-)melbourne-#new-Nparis&ndash;venice&ndash;vienna&ndash;budapest',
+    '-\'toronto\'-rehy;jeweller&!\'&!-\'(accented(#rea(\'uckland\'$bath(&elfast(-russels-paris\'-commuter-belt\'&dublin\'&edited()mployment(5vacuated-to-cambridge',
+    '\'$like)$sted\'1manchester-london\'+out-of-town($wned(%xford\'*portsmouth(%rague\'(scotland\'#tan(*o-aberdeen*&dublin*)inverness*#new*&oxford',
+    '+\'enzance&!.\'\'stephen\'$this&!/\'%berne(\'radford\'\'charing\'$ffrr\'\'glasgow.(/cardiff\'$hong\')leningrad\'\'mitcham\'(overseas',
+    '\'%south,#ern(\'ymphony\'"up\'&vienna\'%welsh(#ith&$born&,derry/dublin&4ers&rehy;traditional&#ish(!m&!o&#wic%"un',
+    '$%viniv$(y/milton#\'e-fight%&mother%$pair)!s%&raider%$star$$gren$\'liness.%\'y-heart,!s\'&nights$%r-but%(/drifter',
+    '#\'g&mdash*%;miss+$term%*ndash;term%$rehy)*;abandoned*%faced*&haired*(promised*\'running*\'spouted$!\'$#(s)$"-a&(bolished',
+    '((umulated&\'go-days))real-ward\'$reed&%iling&*nd-heavily)&severe*$hort&&proned&%rched\'!m("ed\'&ranged&&ssumed&\'waiting',
+    '%&backed&%eaked($rded\'&lieved&&oarded(!t\'$iler\'"ne)!d)!s\'"ws&%rewed)#ing\'&istled\'$oken',
+    '\'&rriage&,hristianised&(ommitted\'\'ncealed\'$urse&&rested\'(iticised&)ultivated\'%rrent%$dash&&ecayed\'&ferred\'\'tainees\'\'veloped&*iscredited',
+    ')$uted&\'ominant&&rained\'%eaded%#end&\'steemed)*stablished(&ranged&&xpired($osed(&ressed\'\'tending&#yed%%faded\'$llow',
+    '\'&voured&$ibre\'#eld\'$lled\'%rmers&(lavoured\'%oated(&wering&%ormat\'%unded&%rozen&$used%)gingering&&rained("ss',
+    '\'&rdened\'%ulers&%idden&&oarded%!i&\'-cow-da\'(foe-li-a\'\'stil-is&&gnored&\'magined\'(prisoned&%nbred\'*carcerated\'\'grained&#ron',
+    '\'&olated%$john&%umper%$last&#ead(#fed(&sehold*!s(#ved\'%ggity(!s&\'ingered(#ing(#ked\'$pped',
+    '&&ooking(#ped\'#ved%*maintained&(editated\'&moried&%issed&%ocked%&needed)#led&#ose\'#ted&\'urtured%(obsolete&&rdered',
+    '&#val%%paced\'$ssed+#-by\'"th&#ile&&layers&&ointed\'&ndered\'%pular\'\'stponed&%riced\'&ofiles*%table%$rate',
+    '&(edundant\'&nowned\'&peated(&ressed\'&sident\'&turned&"od\'$tted&%uling\'&moured%%scale*!s\'\'heduled&\'entence\'$rver',
+    '&\'hackled(%dowed\'\'eltered\'$ield($ning\'#ore("ts&$ided\'&lenced\'\'mmering\',nce-departed\'!t($ting&&kirted&*mouldering',
+    '&+ought-after&%pade.(!n&$tage($yers\'\'irruped\'$ored\'(reamered($iped&(urviving\'\'stained%"ta&#ern&\'hroated&+ime-not-see',
+    '&(olerated&&rained\'\'easured\'#ied\'&oubled&$ubed\'\'rbulent\'$sked%)unmarried\'!s(#een&$rged%*wavelength($ists&%edged',
+    ')$owed&%orked%$xxxx%+yearned-for&#oke$).standing$)/director%$head%%short*%/just%,thick/glossy$(:walking$#_at$$aevi%#ker',
+    '%!n&#esi%"ra$$back&"ll&"se&!y%$each&"ck&"en%$ones&%rough&.ttom/organiser&$urne%%ranch',
+    '$%cased%%hamps%$lose%%rofts$$dale%,on-upon-tern%$rawn$&eaton.%/r&mdash;lasting-%would&(-against\'&billed(%odied\',in-the-tooth\'&length',
+    ')"ne\'\'playing\'\'running\'%scale(#tay\')than-ever,%usual\'&winged&+established&$term%+sp&eacute;e\'"ee&,t-cultivated(%dated(&haired',
+    '(&legged(%range)\'eigning((standing+$ying(&tailed($used\'):shortest\'(ablished%"th%#urs$$fire%-ord-westmeath\'#gan\'%macus',
+    '$\'hairies&!m&%ndled%)i/italian%$olme&#rne&&ughton%+urst/author&!t$.i&rehy;tudinal%%alata%(caudatum&#orn%"es%%flora',
+    '%%jolia%,nes-olivetti%*spicularis&\'quamata%0tudinally-banded$&jumper$&levens%#ife$%moore%#ynd$&necked%#ose(!d$&obarda$$pigs',
+    '%(r&eacute$$qing%!t$&riddry&"gg(#end%"ow&"yd$$sett%%hanks\'!w()/diabetic&&oreman%&ighted%$lade',
+    '\'\'ndingly&"on&&ratton\'"ip%*ufferingly$!t%#ail("ed(!s%$horn(&p/home&%waite%(itudinal$&uement&!s',
+    '$#val\'#ley$$wich%$ools&#rms$"yd%!i#"ie#"ka#)ley-heart#$mdon##nan$&bergii$"en%!r',
+    '$#ies%!n&!g$!y#)rho-owned&&/house#(sborough%%rough$/daleite-heating%#een&"ne"*o&ndash;ed#)-flushing$"is$$kens',
+    '$$roll$#ser%"ha$%tay-a%&i-yoom#!b$#yns#"ey##goo#!h##ies$"ng#+k&mdash;the%)ndash;out%(rehy;out',
+    '%.after-your-own&$head&(t-me-now(#you%$back&)ehind-you%$down)-ers-on-others%Phere-this-sort-of-thing-won\'t-do-at-all-you-know%$nice&,o-a-bit-like(%hands%(terrific&#hat\'%rough',
+    '$!.%"at$,/object/look%#sit&*parc-based$"_a&!t%$ever%$over%"up$%ahead$!e%$d-up&#/up&#_as',
+    '%!e%*rs-through%"th$"ie%#ng\'\'!-(%after).t-the-pictures()elsewhere(%tired\'!.\'*/cleverer/1$more($more\'$_out',
+    '\'\'glasses\'!s$!m$)s-booster&1like-abstract-art%"_a\'!s\'!t%#ism$-y-looky-looky#*m-shuttles%$work$!.$"ba$&panics',
+    '#&niness&!g$&y-left%&/party%$land#%o-ees$"ks#%p-end%$film%$hole%\'o-plane%&stitch+"ed+#ing\'%reets',
+    '$!/%$stem$$back$"er$#ier&"st%"ly$$sala%%titch#"re#\'sdrecht$"e-&%armed&\'coupled($vers',
+    '&$feed&\'growing&%heads\'%orned&(inserted&\'jointed&$laid\'%eafed)#ved($gged\'%inked(#ver+!s\'$ying&&riding',
+    '&#set\')houldered&\'tongued\'(rousered&%weave\'&risted%&/tight%%boxes%"d.%$feed%%heads%$laid&"y\'\'&-bound()disguised',
+    '(&fitted($held)#ung($made()organized()regulated%*mindedness&$oore\'3re/founder/atalanta%$n-up&+ess-of-link%"rs#)t-crammed$$ings$!s',
+    '##vis$"ul#"za"%pburi##era&*mide-oxide$\'z-style&(willshaw#\'hanthae$"ii$&ocolea%$rtyx##lop#!m#\'ocarium',
+    '$!n#\'ped-off"%quats$#ens"+r&eacute;al#(\'n\'order#\'-or-ord#"ag$#n-c%!d%!s%(thaceous\'"us$#yne#+c&aacute;in',
+    '##d\'s&%-days&!.$(-a-mercy&#lge\'&mighty&)nd-master%+lieutenancy$%/lady\'&ndlady$#ahl$"es$%liest$#ore$*s&mdash;he',
+    '%+-and-ladies&*lieutenant%$.the)!y%(/commons%$hip.##e\'n$(n/sister%#ese%#gar&!e%%tzson%\'z-model&%accio&#ino',
+    '&&kirche&/o-fuori-le-mura($goer\'"ni$3t&aacute;nsk&aacute$"us$$xane##ian$%carid%\'iferans$"en&$tais$#gan$$keet$#ley',
+    '%)er/driver$"na%"da%#iti$#pes$.s&rehy;melikov%#ton#%kovic#&maison#)ne-caduta%!s#:raine-saar&rehy;luxembourg\'!s%"zo$#eta',
+    '%!n$"um$+y-and-train\'$xles&$from&&ridden\'$oute%$/bus#!s$#ont$#que$!t")s-angeles##ada$$ntos',
+    '#"ch%$midt%!y$$ious#)e-fitting%$lose$"by$!c$$mere$(y-pinter#$inga$#olo#&kutoff#"li#"os',
+    '#+s&mdash;can+&indeed+(property$*-absorbing&\'djuster-!s&"ll%&buying%\'causing%\'factor/%\'leaders)#ing%*minimizing%\'of-self%\'plagued',
+    '&\'tricken$\'.oxford$(/damage/%\'special$"ed%!r%*s&mdash;12&,-on-disposal$#ing$"ky$%maker)!s$"ou#+t&mdash;the$!-',
+    '%$even%(in-house(\'my-muse((the-wood%\'looking%)macmillan%$ness%(property$!/%"at%\'damaged%%found$#3-2$"by$"ed',
+    '"$t\'sa#*-depending$*et-garonne$%oriel#!/#\'biniere#"em$!n$"ry$!s#$hain&"re%$rian\'%ngian$\'ersdale',
+    '$#iah&$nbun%&ngland$#man$#rop#*ion/method&"ed#!o$\'-quebec$"ka$#man\'\'justice#(schental##ted%%nberg',
+    '&"er&(y-ticket$#ing$&o-type%$cash#"um$(s-badged&&choked\'&olumns((mpatible(&sworth&%eater\'#yed&\'festina&/intel-microsoft',
+    '&&shaped\'$leep\'&temmed(#yle%"es%\'windows&$orks"(u&eacute#&-garou#!a#,benov/slavov%!t#$cher%#nje$"ks',
+    '%(mouthing*!s%;shirts-and-checked-trousers$%.then$!/$!e%%nings&&slager%&r/hits%+st&mdash;er$#ish$)ly-voiced$\'mouthed$2speaker/headphones,$room',
+    '+#ing)#ing$!y#$ella$!n$!s#%ganis$&h-side%&anmore%6borough/leicestershire%&ermore%*gall-style)!s%$head%-land/villager',
+    '%"or%"ry%"s.&%hinny#&hossoa#*is-antoine&&claude&(dreyfuss&/fran&ccedil;ois&&joseph&&michel&\'nicolas&$paul\'/hilog&egrave;ne&)sylvestre',
+    '%*a&mdash;my%$burg%+e-elisabeth&*/edinburgh&#lla&$rick&!s&#tte%)iana-born%+ville-based$!x#(kopoulos#"le$-ou&mdash;tell&#dis',
+    '$%ansky#!n$$dres%$side$"el$"ga%%e-car()um-dining+*television\'%diner\'&lizard\'$room\'&suited\'#you&!.',
+    '\'(cocktail\'*pilothouse\')reception&&s/bars%*ing-chairs$#ova$%sbury#\'pin\'-on&!g#!r$!d%#ios$$eiro%$ncin&!s',
+    '$"is$"on%!s$!s#%sadas$*e-infested&&ridden%%worts$"he$$iane\'!s%"er%"ly%$ness$$sier',
+    '#"tf$&h-born%\'erbourg&"sk$#ing$$side##vet&"te(!s$!i%!a$*re-fronted\')organised&$/met%!i',
+    '#&yngton$!s"(vability%#le\'$#ine#\'e&mdash%0rehy;of-his-life$#\'un$!-%%apple%%bites&%limps%$call&\'hildren%%dazed',
+    '&&ungeon%&feasts\'"st&%illed%$gift%&handle+!s&(ostility\'$tels&%ungry%!i&*n-idleness((the-mist\'&ducing\'\'trigues',
+    '&.t-or-loathe-it%%juice%%light&%ocked%\'machine\'2king/relationships+!s\'&rriage\'"sk&!e&&issive%%notes%\'objects&"ne&&r-hate',
+    '%%rhyme&#ock&%uined%&scenes&#eat&%hriek&\'ickness\'(tuations&&tarved\'%ories\'&ricken&&uicide&&wollen%$talk\'#pes',
+    '\'1em-and-leave-them)!e&$oken\'"rn&&ragedy(#uma\'&iangle(#cks&"ug%%voice%\'wounded$!/%\'cooking\'$wboy&$rash',
+    '%&father%&people%\'respect%(security&%ister$&_as_it%$each$(ableness$%books$(carriage$\'d-one\'s)!s&"up%(/admired%%_each',
+    '%"ee%#ogs&"ll$%green&+ove/village)!s$$joys$%laces&"dy%"ee&&ssness%#ife%\'l-badge\'%davis\'$pank',
+    '%(orn-lads%)y-looking$$make$&nduski%#est%&skiold$#pot%#ump$"r\'&\'s-knots%\'-author&%giant&&knight%!.%\'/lovers',
+    '%"en%$ings%"ks%"ly%#man%+rrrrrleeeee%\'s-knots&#eed$"s.%,/understands&%wants%%capes%#eat&!x%*life-brown',
+    '$#tts$\'y_dovey%%dovey%$ness#!i$!n%"g-\'#cup\'&father\'+heartedness&+ly-detailed)(observed)(restored&$ness&!s',
+    '#"re#$ynge"+w&ndash;and$$rehy(*;achieving*$ngle)&budget)#cut)\'density)%grade)%level)\'profile)%waged+%ttage#!\'',
+    '%#ing#;(0.05mm)-calcium-containing#!+#*-achieving&$tion($vity%(ddiction%"lc\'1ohol/alcohol-free+"ic&(kalinity$$ball(#ing&\'rrelage%)link-rate',
+    '&$ttom&&uncing%\'reasted&$idge\'$mmed%$urnt$\'calibre\'$oric*)e/low-fat&&pacity&#rat%&louded%!o&+mmunication&*nductivity',
+    '\'$text($rast&"py&.st/high-volume%*redibility&#oss$&damage\'$ping%&ecibel&(pendency%)istortion%\'wellers$\'earners\'"th%(missions',
+    '((low-cost&&riched$$fare%&eeding%&inesse%$lier&#uid\'"sh%\'riction$&gabled&"in%$lare%.round-pressure\'#wer(!n',
+    '%#eel(!s%#our$&impact%+ncome-level&(ductance&*flationary\'(ormation&.put/low-output&\'tensive()rest-rate)\'mediate&\'ventory(&stment%"sh',
+    '&%tency\'&itudes%#eft&$vels%$ifer)!s(!s%&ow-low$-magnification&)intenance&&npower%#eat&+lt-fraction(#ing%(olecular',
+    '%)ultiplier$(nitrogen%%ormal&!x$)oestrogen%!r&#der%%utput$+paying-jobs%)ercentage\'(formance/!d%$oint&,wer/low-cost%)revalence',
+    '&\'ofiling)!t$(rainfall&"nk&#tio%&eliefs&!v\'!s\'$ving%"oi%%umped$(salaried%%illed&#zed%%kills',
+    '%&olvent%.peed/high-gear\'%nding&$oken&\'reading%\'tandard)#ing&%oried&%retch%*upervision%\'ymmetry$$tack&&xation%\'hroated%$ides',
+    '&#ned%)rajectory%#une&%rnout$!u%+nemployment%#ser$&valued%)isibility&!z%+oltage-drop$-water-content\'!t(#age$$xxxx',
+    '#+/inadequate$&medium%(id-range##ads$"nd$"ra#\'calorie$#ost$"ut#$d\'st$(en-esque\'%style%!r$#ose%3wn-down-diggerydown',
+    '$0/director/oxford%\'manager&%other%&prison$!n%\'/milton%$burg%$feld%$sohn&&trasse%%thals$0r&rehy;achieving%(-ability\'(ttainers&$born',
+    '\'%udget(#ilt&(calories\'"ut&\'damping\'+enomination\'*imensional&(earnings.(-related(\'st-side\'(levation&)fertility&$gear&#hab("lf',
+    '&"in(#put&#key&(latitude(#yer\'#imb(.p-to-top-teeth&*management)#ual("ss\',iddle-middle&$offs&+performance\'\'riority&%range',
+    '("te\')esolution\'#isk&(security\')ixth-form\'#pec\',tratospheric)#ing&$tech\'/han-anticipated\'!o(\'-higher(%nnage&&valued\'%olume',
+    '%+.preference&\'quality%\'/middle,!/-%upper%#ers%#ick&#ng.%%stein$,st&rehy;cost&!-\'(caloried\'&energy\'%grade\'&houred',
+    '(%riced\'\'quality\'(spending(\'tressed\'%taxed&#ock\'*ft/suffolk)$ians##fat$%lying#%grade%%owing#\'hanging#"ii$#ngs',
+    '%!t$!t%!h##key#%level$$ifes%%ness.$\'y-rated#$moor#!n$!a$$dean&.s/photographer$+e/transport$"ie',
+    '#!r$&anking$%ieson%"se$%y-ish%!i#"sa$,ley-williams$%water#+temperature$(herstown##use#!y$!s"!x',
+    '#&bridge#"od%%romes#&tidine"$yal\'%!.%$isms\'#tus%)ty-factor\'!.\'\'_as_far#!e$!r##ley#$ment',
+    '#)s-breaker$"et"+z&egrave;re#\'araitis#.enge-sectioned\'!.$"re#"le#$nica#&ovskii\'!y!$p-28#&length"$.the"!/',
+    '#"40""10$"01#!1#!5"!3"#400"!5"!6#"00"!9""as$!e";ejkdnfklruhfllsmjcgbqktdlri#.ramide-n-oxide',
+    '""fs"\'g-laden"!m"3o/concertgebouw/van$\'handley$,rlpo/handley#%cytes"!r#\'-lpd-lp"3s/pls&mdash;liberal#!a"!t#!2#!3!%q-500',
+    '$"70"$1170"$2500"#400"#550"#850"#uid"!w!$r-10"!0"!1#"65"%33020""ac#"qi',
+    '"!f"!g#!e""sm"!u#!s!1s&mdash;integrity"#-20##50b$#605"$.0d.#%train"$0003%!4""10',
+    '#!2#!6""27"!3"#400"!7""ap"!c""d."$e-11"!f"!h#$aped",i/sbus-based##ons',
+    '"#lay#$eten#&ington$&ve.dat#!s"$mr.l$$u.eu#!s"(o/abbado$)barbiroli$\'kapszyk%$rips$&previn$#rca%+ostropovich',
+    '$&tilson",pan.database#!r"!q"(rdbiinst#"nd"(stop.com"#tch#1rain&mdash;cc0001\'".p\'&cc0001"%ungen"#wer#$like!&t-cmdr',
+    '%\'mmander"&.-cdr.%&olonel##col##gen#%willi"(/control"$0001%!2"$230t#"9s"*a-approved$%rated#"ke#&lienne',
+    '#!l""d\'#\'-backed$\'derived$(endorsed (mccarren',
 )
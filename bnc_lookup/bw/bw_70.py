@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_70 = (
+count_70 = 6694
+
+heads_70 = (
     'kiauchau',
-    'kibah',
-    'kibbentrop',
-    'kibbih',
-    'kibbler/national',
-    'kibee',
-    'kibet',
-    'kibir',
-    'kibirango',
-    'kibitzing',
-    'kibria',
-    'kibrik',
-    'kibundu',
-    'kibuye',
-    'kich',
-    'kichik',
     'kichisaburo',
-    'kick-about',
-    'kick-and-chase',
-    'kick-and-run',
-    'kick-around',
-    'kick-board',
-    'kick-carcass',
-    'kick-down',
-    'kick-off-',
-    'kick-the',
-    'kick-through',
-    'kick-up',
-    'kicked\'',
-    'kicked-back',
-    'kicked-in',
-    'kicked-t',
     'kickedly',
-    'kicken',
-    'kicker-out-of-loads',
-    'kicking-plates',
-    'kickle',
-    'kickmaster',
-    'kickpoint',
-    'kickshaws',
-    'kicksies',
-    'kicksssssssssssssssss',
-    'kickstarting',
-    'kickstarts',
-    'kicky',
-    'kid-filled',
-    'kid-gloved',
-    'kid-gloves',
     'kid-leather',
-    'kidact',
-    'kidalton',
-    'kidbrook',
-    'kidbury',
-    'kidby',
-    'kidby/oxford',
-    'kidcafe',
-    'kidd.',
-    'kiddell',
-    'kidderminster/worcestershire',
-    'kiddi',
-    'kiddi-proof',
-    'kiddi-sale',
-    'kiddibitz',
-    'kiddie-sized',
     'kiddiewinks',
-    'kiddin',
-    'kiddish',
-    'kiddiswop',
-    'kiddushin',
-    'kiddy-fied',
-    'kiddy-trailer',
-    'kiddykarrier',
-    'kideksha',
-    'kidflesh',
-    'kidge',
-    'kidgell',
-    'kidger',
-    'kidhow',
-    'kidlington-based',
-    'kidmore',
     'kidnaped',
-    'kidnaping',
-    'kidnapped.',
-    'kidney-machine',
-    'kidney-stone',
-    'kidney.it',
-    'kidneyectomy',
-    'kidny',
-    'kidolgy',
-    'kidongoi',
-    'kidron',
-    'kids-92',
-    'kidscrobe',
-    'kidsports',
-    'kidsty',
-    'kidswear',
     'kiduff',
-    'kidwell',
-    'kidwingira',
-    'kidza',
-    'kieboom',
-    'kiechel',
-    'kiefers',
-    'kiekeben',
-    'kiekei',
-    'kiel&ndash;altona',
-    'kielder/northumberland',
-    'kienholzes',
-    'kieninger',
-    'kier-boil-hypochlorite',
-    'kiernnan',
-    'kierson',
     'kierstenson',
-    'kiervasili',
-    'kiescraper',
-    'kiesebrandt',
-    'kieselgel',
-    'kieseritzky',
-    'kiev-born',
-    'kieves',
-    'kievf',
-    'kiewiet',
-    'kiff.',
-    'kiff/',
-    'kiff/oxford',
-    'kiff/witney/oxfordshire',
-    'kiffa',
-    'kifri',
     'kigali.',
-    'kiganda',
-    'kigawa',
-    'kigerianization',
-    'kigozi',
-    'kihon',
-    'kihoro',
-    'kiikkuniemi',
-    'kij&eacute',
-    'kij&uacute;r&oacute',
-    'kijang',
-    'kijik',
-    'kijiner',
-    'kijkduin',
-    'kijumwa',
-    'kik-kik',
     'kik-wit',
-    'kike',
-    'kiken',
-    'kiker',
-    'kikkup',
-    'kiko\'',
-    'kikoine',
-    'kikozi',
-    'kiku-shidare',
-    'kikuko',
-    'kikuo',
-    'kikwete',
-    'kil&rehy;len',
-    'kilarney',
-    'kilarow',
-    'kilauean',
     'kilbaha',
-    'kilbane',
-    'kilbeggan',
-    'kilberry',
-    'kilbest',
-    'kilbey',
-    'kilbourns',
-    'kilbranan',
-    'kilbreck',
-    'kilbride-based',
-    'kilbroney',
-    'kilbryde',
-    'kilcast',
-    'kilchrenan',
-    'kilclief',
-    'kilcloney',
     'kilcoran',
-    'kilcork',
-    'kilcran',
-    'kilcranny',
-    'kildall',
-    'kildan',
-    'kildangan',
-    'kildeer',
-    'kilderkins',
-    'kildonan',
-    'kildray',
-    'kildwick',
-    'kiled',
-    'kilen',
-    'kileo',
-    'kilfeckler',
     'kilfoil',
-    'kilgallen',
-    'kilgeddin',
-    'kilgerran',
-    'kilgour-christie',
-    'kilgrammie',
-    'kilgraston',
-    'kilhallon',
-    'kili-ar-ta',
-    'kiliminster',
-    'kilimite',
-    'kilims',
-    'kiljimock',
-    'kilkcaldy',
-    'kilkee',
-    'kilkern',
     'kilkhampton',
-    'kill-dee',
-    'kill-joy',
-    'kill-joys',
-    'kill-off',
-    'kill-the-rat',
-    'kill-your-own-mother',
-    'kill.police',
-    'kill/',
-    'killakee',
-    'killawarra',
-    'killcross',
-    'killcully',
-    'killdroids',
-    'killeady',
-    'killeavy',
     'killebree',
-    'killed-off',
-    'killed-virus',
-    'killedeas',
-    'killeen/right',
-    'killegray',
-    'killegrew',
-    'killellan',
-    'killer\'',
-    'killer-ships',
-    'killer-type',
-    'killer-were',
-    'killer.',
-    'killer.but',
-    'killermont',
-    'killesby',
     'killester',
-    'killewarrs',
-    'killey',
-    'killi-keepers',
-    'killicks',
-    'killiehuimen',
-    'killigrews',
-    'killilea',
-    'killinallan',
-    'killinan',
-    'killing\'',
-    'killing-bottle',
-    'killing-floor',
-    'killing-ground',
-    'killing-groups',
-    'killing-off',
     'killing-out',
-    'killing-room',
-    'killing.',
-    'killing.ken',
-    'killing.the',
-    'killing/',
-    'killingly',
-    'killingsworth',
-    'killingworth.',
-    'killinochni',
-    'killoan',
-    'killoe',
-    'killom',
-    'killough',
-    'killpower',
-    'kills_a',
     'killshot',
-    'killum',
-    'killundine',
-    'killuney',
-    'killvorow',
-    'killycarn',
-    'killycoogan',
-    'killyhoy',
-    'killymaddy',
-    'killymoon',
-    'killymount',
-    'killymurris',
-    'kilma',
-    'kilmacthomas',
-    'kilmalcolm',
-    'kilmanock',
     'kilmararty',
-    'kilmarney',
-    'kilmeaden',
-    'kilmersdon',
-    'kilmington',
-    'kilmont',
-    'kilmoray',
-    'kilmory',
-    'kilmun',
-    'kiln-bricks',
-    'kiln-burnt',
-    'kiln-chamber',
-    'kiln-dried',
-    'kiln-firer',
-    'kiln-pricking',
-    'kiln-seasoned',
     'kilnaster',
-    'kilnaughtan',
-    'kilnaughton.',
-    'kilndown',
-    'kilner-type',
-    'kilning',
-    'kilnmen',
-    'kilnochchi',
-    'kilnstown',
-    'kilnwith',
-    'kilo-calories',
-    'kiloamps',
-    'kilobasepair',
-    'kilobasepairs',
-    'kilobear',
-    'kilobits',
     'kiloblaster',
-    'kilobocals',
-    'kilocuddles',
-    'kilodaltons',
-    'kiloelectron',
-    'kiloelectronvolt',
-    'kilogauss',
-    'kilom',
-    'kilometre-wide',
-    'kilometre.',
-    'kiloparsec-scale',
-    'kiloran',
-    'kilovolt',
-    'kilow',
-    'kilowat',
-    'kilpack',
     'kilpacks',
-    'kilpartrick',
-    'kilpisj&auml;rvi',
-    'kilrenny',
-    'kilronan',
-    'kilroy-silk.',
-    'kilroy-silk/sir',
-    'kilroys',
-    'kilsch',
-    'kilson',
-    'kilsyth-born',
-    'kilt-deep',
-    'kilt/skirt',
-    'kiltackey',
-    'kilty',
-    'kilusan',
     'kilversley',
-    'kilveston',
-    'kilvey',
-    'kilvington',
-    'kilwa',
-    'kilwarlin',
-    'kilwaughter',
-    'kim&ndash;s',
-    'kim-lien',
-    'kimani',
-    'kimario',
-    'kimasi',
-    'kimbanguist',
-    'kimberella',
-    'kimberley-clark',
-    'kimberleys',
     'kimberlite-derived',
-    'kimberlite-transported',
-    'kimble/buckinghamshire',
-    'kimbly',
-    'kimbo',
-    'kimchi',
-    'kimeridge',
-    'kimika',
-    'kiminto',
-    'kimm',
-    'kimmage',
-    'kimmeens',
-    'kimmelman',
-    'kimmie',
-    'kimmis',
-    'kimmitt',
     'kimome',
-    'kimono-clad',
-    'kimpel',
-    'kimper',
-    'kimpese',
-    'kimpton-nye',
-    'kimsey',
-    'kimshe',
-    'kimto',
-    'kimuras',
-    'kimwipes',
-    'kimyan',
-    'kin-held',
-    'kin-oriented',
-    'kin-related',
-    'kin-selection',
     'kin-tie',
-    'kin-ties',
-    'kin-village',
-    'kina=&dollar;1.0493',
-    'kina=us&dollar;1.1631',
-    'kinabalue',
-    'kinabatangan',
-    'kinadon',
-    'kinaesthesia.',
-    'kinaesthetically',
-    'kinallen',
-    'kinariwala',
-    'kinase-independent',
-    'kinase-induced',
-    'kinasing',
-    'kinaston',
     'kinayatn',
-    'kinayatyn',
-    'kinbane',
-    'kincairney',
-    'kincardshire',
-    'kinchasa',
-    'kinchin',
-    'kinchinjunga',
-    'kinckhuysen',
-    'kincl',
-    'kinclochewe',
-    'kind&mdash;both',
-    'kind&mdash;loss',
-    'kind&mdash;time',
-    'kind-eyed',
-    'kind-hearted.',
     'kind-natured',
-    'kind-of',
-    'kind-of-casual-but-vamp',
-    'kind-on-the-pocket',
-    'kind-uncled',
-    'kind-voiced',
-    'kind/',
-    'kind/nature',
-    'kinda-folk',
-    'kinda-high-life',
-    'kindenesse',
-    'kinder\'',
-    'kinder-freundlich',
-    'kinderbunker',
-    'kindercare',
-    'kindergarden',
     'kindergartener',
-    'kinderhilp',
-    'kinderman/wiltshire',
-    'kindermann',
-    'kinderparadies',
-    'kinderscenen',
-    'kindersly',
-    'kindes',
-    'kindess',
-    'kindest-hearted',
-    'kindeys',
-    'kindgom',
-    'kindia',
-    'kindleth',
-    'kindley',
-    'kindman',
     'kindness.',
-    'kindon',
-    'kindrochid',
-    'kindron',
-    'kindy',
-    'kineff',
-    'kinell',
-    'kinemacolor',
-    'kinematically',
-    'kines',
-    'kineses',
-    'kinesic',
-    'kinesiology',
-    'kinetochore',
-    'kineton',
-    'kineton/warwickshire',
     'kinetoplast',
-    'kinfauns',
-    'kinflicks',
-    'king&mdash',
-    'king&rehy;lake',
-    'king&rehy;ship',
-    'king&rehy;size',
-    'king*',
-    'king-',
-    'king-\'a',
-    'king-at-arms',
-    'king-boogie',
-    'king-consort',
-    'king-in-exile',
-    'king-killing',
-    'king-lewis',
     'king-magee',
-    'king-of-the-road',
-    'king-pins',
-    'king-priest',
-    'king-smith/parish',
-    'king-talent',
-    'king-that',
-    'king-thing',
-    'king-times',
-    'king-to-be',
-    'king-v-south',
-    'king-witness',
-    'king.',
-    'king.s',
-    'king/',
-    'king/british',
     'king/cranfield',
-    'king/defence',
-    'king/former',
-    'king/freelance',
-    'king/gerry',
-    'king/landlord',
-    'king/priest',
-    'king/refugee',
-    'king/rescuer',
-    'king/resident',
-    'king/servant',
-    'king/whose',
-    'king/worcester',
-    'king_as',
-    'kingaby',
-    'kingattorney',
     'kingbury',
-    'kingcobras',
-    'kingcraft',
-    'kingdom*',
-    'kingdom**',
-    'kingdom-brabant',
-    'kingdom-dioceses',
-    'kingdom-led',
-    'kingdom-linked',
-    'kingdom-nepalese',
-    'kingdom-owned',
-    'kingdom-states',
-    'kingdom-trained',
-    'kingdom/dutch',
-    'kingdom/spain',
-    'kingee-ee',
     'kingery',
-    'kingfield',
-    'kingfisher-clear',
-    'kingfisher-plus-dixons',
-    'kinghouse',
-    'kingi',
-    'kingii',
-    'kinginrin',
-    'kingkabs',
-    'kingklip',
-    'kinglake',
-    'kingland',
-    'kinglas',
-    'kingle',
-    'kinglike',
-    'kingofthehill',
     'kingp',
-    'kingpin\'',
-    'kingpost',
-    'kings.',
-    'kings/queens',
-    'kingsbere-sub-greenhill',
-    'kingschase',
-    'kingsclere-burghfield',
-    'kingscott',
-    'kingscott/bass',
-    'kingscroft',
-    'kingsditch',
-    'kingsely',
-    'kingsheath',
-    'kingshill/buckinghamshire',
-    'kingship.',
     'kingshott',
-    'kingsknowe',
-    'kingsland/adventurer',
-    'kingsland/herefordshire',
-    'kingslane',
-    'kingsman/biochemistry',
-    'kingsmeadow',
-    'kingsmen',
-    'kingsmill-stocker',
-    'kingsmoor',
-    'kingsmore',
-    'kingsnorth/editor',
-    'kingsor',
-    'kingston&ndash;montreal',
-    'kingston-on&rehy;thames',
-    'kingston-on-thames',
     'kingston/lambeth',
-    'kingswood-gk',
-    'kingswood/oxfordshire',
-    'kingy',
-    'kingzett',
-    'kinh',
-    'kinich',
-    'kinigi',
-    'kinima',
-    'kininmonth',
-    'kinjacka',
-    'kinji',
-    'kinkade',
-    'kinkajou',
-    'kinkanja',
-    'kinki',
     'kinkiness',
-    'kinks-y',
-    'kinl',
-    'kinloss.',
-    'kinm',
-    'kinman',
-    'kinmen',
-    'kinmouth',
-    'kinmuires',
-    'kinnaber-brechin',
-    'kinnahaird',
-    'kinnard',
-    'kinneger',
-    'kinneret',
-    'kinnermit',
-    'kinnersley-chitre',
     'kinnevik',
-    'kinnick',
-    'kinninvie',
-    'kinnis',
-    'kinnnock',
-    'kinnock&rehy;style',
-    'kinnock-basher',
-    'kinnock-hattersley',
-    'kinnock-led',
-    'kinnock/labour',
-    'kinnockathons',
-    'kinnon',
-    'kinns',
-    'kinorhynchs',
-    'kinpont',
-    'kinrade',
     'kinrossie',
-    'kins-men',
-    'kinsai.',
-    'kinsail',
-    'kinsangani',
-    'kinsani',
-    'kinsbury',
-    'kinsellas',
-    'kinsey-backed',
-    'kinseys',
-    'kinshasha',
-    'kinship-systems',
-    'kinship.',
-    'kinships',
-    'kinsk&yacute;s',
-    'kinslaying',
     'kinsman/neighbour',
-    'kinsman/non-kinsman',
-    'kinston',
-    'kinstonian',
-    'kinsy',
-    'kinta',
-    'kinte',
-    'kinte-cloth',
-    'kintex',
-    'kintgen',
-    'kintradwell',
-    'kintraw',
-    'kintrea',
-    'kinuffa',
-    'kinunda',
-    'kinvig',
     'kinz',
-    'kinzig',
-    'kinzoku',
-    'kiosk-pushers',
-    'kiosk.',
-    'kipak',
-    'kiparsky',
-    'kipas',
-    'kipathon',
-    'kipling-cakes-to-bisto-giant',
-    'kipling-to-bisto',
-    'kipling-to-hovis',
-    'kiplingscote',
-    'kippelstein',
-    'kipperers',
-    'kippering',
     'kippin\'',
-    'kippis',
-    'kipple',
-    'kippy-o',
-    'kipsigies',
-    'kiragu',
-    'kirala',
-    'kirata',
-    'kirby-in-ashfield',
-    'kirby-warrick',
-    'kirby/author-the',
-    'kirby/dialysis',
-    'kirby/farm',
-    'kirby/maxwell',
-    'kirbye',
-    'kirchberg-fleckalm',
     'kirchberg/kitzbuhel',
-    'kircheim-bolanden',
-    'kirchener',
-    'kirchenges&auml;ng',
-    'kirchenkampf',
-    'kirchental',
-    'kircher-s',
-    'kirckmann',
-    'kircubbin',
-    'kirdar',
-    'kirdford',
-    'kirdoff',
-    'kirengeshoma',
-    'kirey',
-    'kirghistan',
-    'kirghizistan',
     'kirgiz-kaisaks',
-    'kirgiztan',
-    'kiriath-jearim',
-    'kirie',
-    'kirik',
-    'kirilenko',
-    'kirili',
-    'kiriliov',
-    'kirill-belozerskiy',
-    'kiriri',
-    'kirk-duncan',
-    'kirk-going',
-    'kirk-hudson',
-    'kirk-othmer',
-    'kirk-style',
-    'kirk/british',
     'kirk/chairman',
-    'kirk/rover',
-    'kirkahm',
-    'kirkby/former',
-    'kirkby/maxwell',
-    'kirkdake',
-    'kirker',
-    'kirkgunzeon',
-    'kirkhall',
-    'kirkharl',
-    'kirki',
-    'kirkland/driver',
-    'kirklands',
-    'kirkleys',
-    'kirklinton',
-    'kirkliston.',
     'kirklund',
-    'kirkmabreck',
-    'kirknettle',
-    'kirkop',
-    'kirkpatricks',
-    'kirkports',
-    'kirkptrick',
-    'kirksandle',
-    'kirksen',
-    'kirkston',
-    'kirkthorpe',
-    'kirktonhill',
-    'kirkwallian',
-    'kirl',
-    'kirland',
-    'kirlichliche',
     'kirmington',
-    'kirni',
-    'kirodimal',
-    'kirov-trained',
-    'kirovsky',
-    'kirp',
-    'kirr-whit\'',
-    'kirrick',
-    'kirsan',
-    'kirschwasser',
-    'kirsta',
-    'kirstenson',
-    'kirstine',
-    'kirsty-lee',
-    'kirsty/kathleen',
-    'kirtinidhi',
     'kirtles',
-    'kirtons',
-    'kirtos',
-    'kirtschen',
-    'kirub',
-    'kiruga',
-    'kirui',
-    'kirupakaran',
-    'kirvor',
-    'kirya',
-    'kirynteeb',
-    'kirzner',
-    'kisan',
-    'kisanga',
-    'kisber',
-    'kisburn',
     'kisby',
-    'kisch',
-    'kisco',
-    'kiscoe',
-    'kiselevsk',
-    'kiser',
-    'kishi',
-    'kishies',
-    'kishiro',
-    'kishofer',
-    'kishore',
-    'kishtwar',
-    'kishvar',
-    'kiskorosh',
-    'kiskunhalas',
-    'kislodovsk',
     'kislovodsk',
-    'kislyuk',
-    'kismetophiles',
-    'kisongo',
-    'kiss-',
-    'kiss-a-glam',
-    'kiss-and-make-up',
-    'kiss-curl',
-    'kiss-fired',
-    'kiss-of-death',
-    'kissavos',
-    'kisscurl',
-    'kissell',
-    'kissess',
-    'kissett',
-    'kissi',
     'kissians',
-    'kissimee',
-    'kissinger-bass',
-    'kissinger-like',
-    'kissings',
-    'kissling',
-    'kissogrammed',
-    'kissograms',
-    'kissomatic',
-    'kissov',
-    'kissss',
-    'kistasami',
-    'kistler',
-    'kistna',
-    'kists',
-    'kisty',
     'kisumu-cairo-karachi',
-    'kisurisstugan',
-    'kiszcko',
-    'kiszewskie',
-    'kit-car',
-    'kit-house',
-    'kit-list',
-    'kit-see',
-    'kit.',
-    'kit/meter',
-    'kita-san',
-    'kitab',
-    'kitaben',
-    'kitaeva',
-    'kitagawa',
-    'kitaigorodskii',
     'kitajenko',
-    'kitanga',
-    'kitashiretoko',
-    'kitashiro',
-    'kitaw',
-    'kitchen\'-made',
-    'kitchen-bathing',
-    'kitchen-breakfast',
-    'kitchen-chairs',
-    'kitchen-cum-living',
-    'kitchen-dining',
-    'kitchen-dining-room',
-    'kitchen-furniture',
-    'kitchen-installation',
-    'kitchen-living',
-    'kitchen-maids',
     'kitchen-planning',
-    'kitchen-roll',
-    'kitchen-staff',
-    'kitchen-table',
-    'kitchen-towel',
-    'kitchen-type',
-    'kitchen-wise',
-    'kitchen-workers',
-    'kitchen/bathroom',
-    'kitchen/breakfast-room',
-    'kitchen/dining-room',
-    'kitchen/dining/living',
-    'kitchen/dining/sitting-room',
-    'kitchen/living-room',
-    'kitchen/living/family',
-    'kitchen/morning',
     'kitchen/restaurants',
-    'kitchen/servery',
-    'kitchener-waterloo',
-    'kitcheners',
-    'kitchenette/bathroom',
-    'kitchenless',
-    'kitchenmaid-cum-parlourmaid-cum-everything',
-    'kitchens.',
-    'kitcheny',
-    'kitchiner',
-    'kite-balloon',
-    'kite-balloons',
-    'kite-bug',
-    'kite-mark',
-    'kite-marked',
-    'kite-pattern',
     'kite-thinking',
-    'kite-view',
-    'kite.',
-    'kitehawks',
-    'kitele',
-    'kitely',
-    'kitemakers',
-    'kitemarks',
-    'kitemaster',
-    'kitenge',
-    'kiters',
-    'kitezh',
-    'kitfox',
-    'kithairon-parnes',
-    'kithouse',
-    'kitione',
     'kititit',
-    'kitley',
-    'kitney',
-    'kito',
-    'kitrina',
-    'kits-nevis-anguilla',
-    'kitsap',
-    'kitsinger/lentils',
-    'kitson-mayer',
-    'kitson-meyers',
-    'kitson-still',
-    'kitson/chairman',
-    'kitsos',
-    'kitsukas',
-    'kitsuse',
-    'kitt-ee-wayke',
     'kittani',
-    'kitte',
-    'kitten-in',
-    'kitten-killers',
-    'kitten-love',
-    'kitten-sized',
-    'kittened',
-    'kittenishly',
-    'kittens-mother',
-    'kittens.',
-    'kitterbells',
-    'kittermaster',
-    'kittic',
-    'kittikasem',
-    'kittim',
-    'kitting-out',
     'kittirplanning',
-    'kittiwake-like',
-    'kittle-drum',
-    'kittleman',
-    'kittlitz',
-    'kitton',
-    'kittrell',
-    'kittsbeil',
-    'kittsbeile',
-    'kittu',
-    'kitty-kitty-kitty',
-    'kitty.gareth',
-    'kittybombers',
-    'kittykat',
-    'kittywake',
-    'kitz',
     'kitzb&uuml;hl',
-    'kitzbuhelerhorn',
-    'kitzbuhl',
-    'kitzbuhler',
-    'kitzinger/childbirth',
-    'kiu/',
-    'kiu/ml',
-    'kiula',
-    'kiumars',
-    'kiumarsi',
-    'kiv',
-    'kivanagh',
-    'kiveli',
-    'kivells',
-    'kivered',
-    'kiverton',
     'kivlin',
-    'kivy',
-    'kiwanis',
-    'kiwanuka',
-    'kiwi-led',
-    'kixx-produced',
-    'kiy',
-    'kiya',
-    'kiyonori',
-    'kiz',
-    'kiz/land',
-    'kizer',
-    'kizhin',
-    'kizilay',
-    'kizilinmak',
-    'kizislu',
     'kizrbeg',
-    'kizu',
-    'kj/cu.m',
-    'kj863',
-    'kja:r',
-    'kjaer',
-    'kjaerem',
-    'kjat',
-    'kjekshus',
-    'kjellberg',
-    'kjellmer',
-    'kjellstrand',
-    'kjetil-andre',
-    'kjv',
-    'kke-external&mdash;communist',
-    'kkeerr',
     'kkg',
-    'kkiiiddddddssss',
-    'kkl',
-    'kknow',
-    'kl&aacute;rov',
-    'kl&oacute&scaron;ter',
-    'kl&ouml;ckner-werke',
-    'kl-43',
-    'kl-femme',
-    'kl-homme',
-    'kl116',
-    'kl830',
-    'klaas',
-    'klaatu',
-    'klack',
-    'kladderadatsch',
     'klaebisch',
-    'klaffke',
-    'klagen',
-    'klagsbrun',
-    'klaipeda',
-    'klaipicla',
-    'klak',
-    'klamer',
-    'klamin',
-    'klamp',
-    'klangfarbe',
-    'klanswoman',
-    'klanwatch',
-    'klapheck',
-    'klapp',
-    'klapper',
     'klappert',
-    'klappholz',
-    'klar',
-    'klar&auml;lven',
-    'klarbar',
-    'klare',
-    'klarsfeld',
-    'klas',
-    'klasp',
-    'klasse',
-    'klassiker',
-    'klassische',
-    'klassovikh',
-    'klatches',
-    'klatter',
-    'klauber',
     'klauhs',
-    'klauke',
-    'klaus-jurgen',
-    'klausenburg',
-    'klausenpass',
-    'klavan',
-    'klavier&uuml;bung',
-    'klaw',
-    'klawitter',
-    'klax',
-    'klaxoning',
-    'klay',
-    'kld&mdash;liberal',
-    'kle&iacute;farvatn',
-    'klea-134a',
-    'klean',
     'kleandridas',
-    'kleanthous',
-    'klebanoff',
-    'kleber',
-    'klebsormidium',
-    'kleczkowski',
-    'kleding',
-    'klee-klee-klee-klee',
-    'kleeep',
-    'kleeli/hairflair',
-    'kleeman',
-    'kleenex-vagabond',
-    'kleerebezem',
-    'klees',
-    'kleetie',
-    'kleetra',
     'kleihues',
-    'kleihues-designed',
-    'kleinberg',
-    'kleinberger',
-    'kleineman',
-    'kleinfelter',
-    'kleinian-influenced',
-    'kleinkircheim',
-    'kleinl',
-    'kleinmeister',
-    'kleinschmidt',
-    'kleintjes',
-    'kleinubing',
-    'kleiny',
-    'kleiser',
-    'kleisthenean',
     'kleisthenic-type',
-    'kleitarchos',
-    'kleitos',
-    'klemble',
-    'klemens',
-    'klemetsen',
-    'klemperer/beecham',
-    'klenke',
-    'kleobis',
-    'kleonymos',
-    'kleopatra',
-    'kleophon',
-    'klepac',
-    'kleptogamy',
-    'kleptomanis',
-    'klerenbesem',
     'klerksdorp',
-    'klesges',
-    'kleth',
-    'klettenberg',
-    'kletz',
-    'kletzmer',
-    'kleuznick',
-    'kleve',
-    'kleveland',
-    'klevorick',
-    'klevtsov',
-    'kleymenov',
-    'klf-sponsored',
-    'klf-style',
-    'klibansky',
-    'klic',
     'klickitat',
-    'klier',
-    'kligman',
-    'klik',
-    'klima\'',
-    'klima-genetische',
-    'klimas',
-    'klinck',
-    'klineberg',
-    'klingchua',
-    'klinge',
-    'klingel',
-    'klingelh&ouml;ller',
-    'klingenfuss',
-    'klingensmith',
-    'klingenzell',
     'klingerstrasse',
-    'klinipath',
-    'klinitsky',
-    'klinprathoom',
-    'klinprathum',
-    'klioisan',
-    'klip',
-    'klippe',
-    'klipschorn',
-    'klipspringer',
-    'kliskey',
-    'klisz',
-    'kliuns',
-    'klive',
-    'kljuc',
-    'kljujic',
     'kljusev',
-    'klller',
-    'klodzinski',
-    'kloeckner',
-    'klogo',
-    'klok',
-    'klokeda',
-    'klon',
-    'klondikers',
-    'klondyke-style',
-    'klong',
-    'klongs',
-    'klonks',
-    'klontal',
-    'klooit',
-    'kloos',
     'klootwijk',
-    'klootzak',
-    'klopas',
-    'klopeks',
-    'kloppers',
-    'klos',
-    'klosiewicz',
-    'klossowski',
-    'kloster',
-    'klosterheim',
-    'klosterkemper',
-    'klosterkirche',
-    'klosterplan',
-    'kloten',
-    'klothes',
-    'klovan',
     'kloveniersburgwal',
-    'klovi&cacute',
-    'kloyd',
-    'klp',
-    'kludges',
-    'klueznick',
-    'klukoff',
-    'klukva',
-    'kluson-style',
-    'klut',
-    'klutzes',
-    'kluwin',
-    'klyazma',
-    'klykylo',
-    'klymchak',
-    'klymko',
     'klynton',
-    'klynveld',
-    'klystrons',
-    'klyuchevskaya',
-    'klyuchevskii',
-    'km-4',
-    'km-5',
-    'km-wide',
-    'km/hour',
-    'km132',
-    'km19/psti',
-    'km700',
-    'km_',
-    'kmg',
-    'kmi',
-    'kms.',
     'kmx',
-    'kn&mdash',
-    'kn&ouml;del',
-    'kn-know',
-    'kn.',
-    'knaak',
-    'knab',
-    'knack/byron',
-    'knackatory',
-    'knacked',
-    'knacker-yard',
-    'knackermeat',
-    'knackwursts',
-    'knafler',
-    'knag',
-    'knagsfield',
     'knakkr',
-    'knallratten',
-    'knap.',
-    'knaphill',
-    'knapic-fijalkowska',
-    'knapkins',
-    'knapman/baby',
-    'knapman/father',
-    'knapman/mother',
-    'knapp/general',
-    'knapp/transport',
-    'knappertsbush',
-    'knapping',
-    'knaps',
-    'knapwell',
-    'knareborough',
     'knaresborough.',
-    'knarly',
-    'knattspryrnufelagio',
-    'knaus',
-    'knaveries',
-    'knc',
-    'kndst',
-    'kne2100',
-    'kneadable',
-    'kneale/organising',
-    'knecht',
-    'kneck',
-    'knee&rehy;deep',
-    'knee-banded',
-    'knee-bar',
-    'knee-bending',
     'knee-bends',
-    'knee-bent',
-    'knee-boot',
-    'knee-buckling',
-    'knee-bucklingly',
-    'knee-buskins',
-    'knee-crackle',
-    'knee-crookers',
-    'knee-d',
-    'knee-flexing',
-    'knee-friendly',
-    'knee-height',
-    'knee-hole',
-    'knee-joints',
-    'knee-ligament',
-    'knee-or',
     'knee-pounding',
-    'knee-reaching',
-    'knee-room',
-    'knee-run',
-    'knee-sock',
-    'knee-sockets',
-    'knee-spaces',
-    'knee-thrust',
-    'knee-tremblers',
-    'knee-work',
-    'knee-wrenching',
-    'kneebones',
-    'kneeboots',
-    'kneedeep',
-    'kneejoints',
-    'kneelength',
     'kneeling-down',
-    'kneeling-knuckle',
-    'kneepads',
-    'kneeroom',
-    'knees-bent',
-    'knees-up-muvver-brown',
-    'knees-upping',
-    'knees-ups',
-    'knees/bent',
-    'knefel',
-    'kneidlech',
-    'kneiffii',
-    'kneip',
-    'knelled',
-    'knelles',
-    'knelling',
     'knells',
-    'knese',
-    'knew\'\'',
-    'knew.why',
-    'knew/a',
-    'knez\'',
-    'knezes',
-    'knezevic',
-    'knezine',
-    'kngdom',
-    'kngri',
-    'knickaires',
-    'knicker-blinds',
-    'knicker-bocker',
-    'knicker-deep',
-    'knicker-frills',
     'knicker-trophies',
-    'knicker-wetting',
-    'knickerboxes',
-    'knickered',
-    'knickers-off',
-    'knickers/ex-julie',
-    'knicknacks',
-    'knieen',
-    'kniephof',
-    'knife-attack',
-    'knife-block',
-    'knife-carrier',
-    'knife-cleaning',
-    'knife-cut',
-    'knife-faced',
-    'knife-fights',
     'knife-handle',
-    'knife-hunting',
-    'knife-juggling',
-    'knife-keen',
-    'knife-love',
-    'knife-man',
-    'knife-our',
-    'knife-points',
-    'knife-proof',
-    'knife-rack',
-    'knife-shaped',
-    'knife-sharpener',
-    'knife-sharpening',
-    'knife-swallower',
-    'knife-swinging',
-    'knife-thrusts',
     'knife-twist',
-    'knife-twisting',
-    'knife-wielder',
-    'knife.nurse',
-    'knife/',
-    'knife/fork',
-    'knifeblades',
-    'knifebox',
-    'knifecuts',
-    'knifehilt',
-    'knifemen',
-    'knifesman',
-    'knifewielding',
-    'knifewoman',
-    'knifey-knives',
-    'kniffen',
     'knifie',
-    'kniga',
-    'knight-bachelor',
-    'knight-deputy',
-    'knight-editor',
-    'knight-in-shining-armour',
-    'knight-service',
-    'knight/campaign',
-    'knight/community',
-    'knight/maxwell',
-    'knight/model',
-    'knight/new',
-    'knight/oxford',
-    'knight/print',
-    'knight/printers',
-    'knight/sales',
     'knight/thames',
-    'knight/walter',
-    'knight:tips',
-    'knightcote',
-    'knightingale',
-    'knightleys',
-    'knightly-brown',
-    'knightly-brown/parent',
-    'knightly-seneschals',
-    'knightmare',
-    'knightons',
-    'knights-bachelor',
-    'knights-baneret',
-    'knights-companions-at-arms',
-    'knights-wood',
-    'knightson',
     'knightwick',
-    'knit-denim',
-    'knit-ins',
-    'knit-stockings',
-    'knitability',
-    'knitbone',
-    'knitcontour',
-    'knitmates',
-    'knitpieces',
-    'knitradars',
-    'knitted-in',
-    'knitted.',
-    'knittedness',
-    'knittel',
-    'knittel/volunteer',
-    'knitting-patterns',
     'knitting-stickers',
-    'knitting/watching',
-    'knittings',
-    'knittle',
-    'knitwear/textile',
-    'knitwise',
-    'kniues',
-    'knmg',
-    'knob-faced',
-    'knob-head',
-    'knob-headed',
-    'knobache',
-    'knobbing',
-    'knobble',
-    'knobble-nosed',
-    'knobbling',
     'knobbly-kneed',
-    'knobby-faced',
-    'knobheads',
-    'knobless',
-    'knoblessness',
-    'knobsessed',
-    'knobson',
-    'knobsticks',
-    'knoc',
-    'knochma',
-    'knock&rehy;on',
-    'knock-offs',
-    'knock-on-effect',
-    'knock-tee',
-    'knock-you-down',
-    'knock.',
     'knock/against',
-    'knockabouts',
-    'knockagh',
-    'knockarvie',
-    'knockdara',
-    'knockdon',
-    'knocke',
-    'knocked-back',
-    'knocked-down',
-    'knocked-through',
-    'knocked-together',
-    'knocker-about',
-    'knockeross',
-    'knocketh',
-    'knockfarrel',
-    'knockholt',
     'knocking-around',
-    'knocking-it-down',
-    'knocking-up',
-    'knockmany',
-    'knockmurran',
-    'knocknamocally',
-    'knocknan',
-    'knockoff',
-    'knockraw',
-    'knockrin',
-    'knocks-down',
-    'knockshannoch',
-    'knockshinnoch-ayr',
-    'knockshinnock',
-    'knockwood',
-    'knodishall',
     'knoell',
-    'knofe',
-    'knoflicek',
-    'knokke-zoute',
-    'knokvergence',
-    'knolled',
-    'knoller',
-    'knollsea',
-    'knoop',
-    'knop',
-    'knopfler-type',
-    'knopfs',
-    'knopp/eyewitness',
-    'knopped-lid',
-    'knoppel',
-    'knopps',
     'knossus',
-    'knot-county',
-    'knot-eyes',
-    'knot-free',
-    'knot-holes',
-    'knot-like',
-    'knot-strength',
-    'knot-weed',
-    'knotgrass',
-    'knotholes',
-    'knotless',
-    'knottedness',
-    'knotter',
-    'knottily',
-    'knotting.',
-    'knottingley-based',
     'knotweeds',
-    'knoutberries',
-    'knoutberry',
-    'know&mdash;and',
-    'know&mdash;i',
-    'know&mdash;that',
-    'know&mdash;the',
-    'know-forder',
-    'know-hanky',
-    'know-ke-mulla',
-    'know-ledge',
-    'know-note',
-    'know-the',
-    'know-whether',
-    'know-your-customer',
-    'know.and',
     'know.how',
-    'know.in',
-    'know.thank',
-    'know.there',
-    'know.they',
-    'know/knew',
-    'know/prefer',
-    'know/understand',
-    'know_a',
-    'know_a_good',
-    'know_all',
-    'know_each',
-    'know_whether',
-    'knowalls',
-    'knoware',
-    'knowehead',
     'knowesouth-',
-    'knowing-practice',
-    'knowing:you',
-    'knowingness.',
-    'knowitall',
-    'knowk',
-    'knowledgaebly',
-    'knowledge&rehy;able',
-    'knowledge\'',
-    'knowledge-',
-    'knowledge-affair',
-    'knowledge-as-a-good-in-itself',
-    'knowledge-as-curriculum',
-    'knowledge-as-practice',
-    'knowledge-as-research',
-    'knowledge-bases',
     'knowledge-bearing',
-    'knowledge-claims',
-    'knowledge-driven',
-    'knowledge-filled',
-    'knowledge-flows',
-    'knowledge-for-its-own-sake',
-    'knowledge-gathering',
-    'knowledge-getting',
-    'knowledge-holders',
-    'knowledge-how',
-    'knowledge-level',
-    'knowledge-minus',
-    'knowledge-plus',
-    'knowledge-power',
-    'knowledge-referenced',
-    'knowledge-seeking',
     'knowledge-sharing',
-    'knowledge-specific',
-    'knowledge-texts',
-    'knowledge-that',
-    'knowledge-with-doubt',
-    'knowledge.1',
-    'knowledge/consciousness/ideology',
-    'knowledge/experience',
-    'knowledge/expertise',
-    'knowledge/ideology',
-    'knowledge/power',
-    'knowledgeman',
-    'knowledgepro',
-    'knowledgeworks',
-    'knowles/landlord',
-    'knowles/malmesbury',
     'knowls',
-    'knowlys',
-    'known-age',
-    'known-name',
-    'known.wentworth',
-    'known/issue',
-    'known/the',
-    'known/wrong',
-    'knowne',
-    'knowone',
-    'knowsly',
-    'knowst',
-    'knox&rehy;johnston',
-    'knoxall',
-    'knoyles',
-    'knp',
     'kns',
-    'knubbled',
-    'knubbly',
-    'knucklas',
-    'knuckle-biting',
-    'knuckle-blow',
-    'knuckle-bone',
-    'knuckle-cracking',
-    'knuckle-rapping',
-    'knuckle-shapes',
-    'knuckle-swollen',
-    'knuckle-walking',
-    'knucklebone-containers',
-    'knucklehead',
-    'knuckleheadedness',
-    'knuckleheads',
     'knuckles.',
-    'knuckley',
-    'knuckly',
-    'knucks',
-    'knumdrum',
-    'knupffer',
-    'knuston',
-    'knute',
-    'knutenborg',
-    'knutford',
-    'knutsbridge',
-    'knutsen',
-    'knutsford-based',
-    'knutsson',
-    'knutt',
-    'knw',
     'knwo',
-    'knyazev',
-    'knyff',
-    'knyght',
-    'knyghtes',
-    'knyghteton',
-    'knypersley',
-    'knyves',
-    'ko&ccaron;evje',
-    'ko&ccedil;u',
-    'ko&sacute;cierzyna',
-    'ko&sacute;ciuszko',
-    'ko&scaron;i&rcaron;e',
-    'ko&scaron;ice',
-    'ko&zcaron;eluh',
-    'ko-kee',
     'ko7',
-    'koa-faced',
-    'koa-wood',
-    'koang',
-    'koassi',
-    'kob',
-    'kobain',
-    'kobal',
-    'kobar',
-    'kobba',
-    'kobell',
-    'kobenhavn',
-    'kobi',
-    'kobischanov',
-    'kobjagla',
-    'koblenz/waldshut',
     'kobler',
-    'koblernigh',
-    'koblet',
-    'koboid',
-    'kobuki',
-    'kobylarz',
-    'kocak',
-    'koch/k',
-    'kochanowski',
-    'kocharyan',
-    'kocheisen',
-    'kochergih',
-    'kochergin',
-    'kocherscheidt',
-    'kochi',
-    'kochia',
     'kochin',
-    'kochins',
-    'kocie&nacute;ski',
-    'kock-petersen',
-    'kocka',
-    'kockeis',
-    'kockiff',
-    'kockums',
-    'kodaikanal',
-    'kodak-xomat-s',
-    'kodak/photorail',
-    'kodalith&reg',
-    'kodama',
-    'kodansha',
-    'koder',
-    'kodesh',
     'kodex',
-    'kodilinye',
-    'koding',
-    'kodo',
-    'kodro',
-    'kodru',
-    'koeberg',
-    'koebner',
-    'koech',
-    'koeleman',
-    'koeleria',
-    'koelliker',
-    'koels',
-    'koenen',
-    'koenig-designed',
-    'koenige',
     'koenigsberg',
-    'koenigstein',
-    'koepel',
-    'koepnick',
-    'koetjape',
-    'koevert',
-    'koezoua',
-    'koffijberg',
-    'koffman/consultant',
-    'koffman/kidney',
-    'kofra',
-    'koftan',
-    'koganei-city',
-    'kogel',
-    'kogi',
-    'kogl',
     'kogler',
-    'kogo',
-    'kogon',
-    'koh-sumai',
-    'kohaku-like',
-    'kohaku/sanke/ogon',
-    'kohde-',
-    'kohen',
-    'kohl-black',
-    'kohl-brush',
-    'kohl-bush',
-    'kohl-eyed',
-    'kohl-lined',
-    'kohl-pot',
-    'kohl-rimmed',
-    'kohl/gorbachev',
     'kohla',
-    'kohled',
-    'kohlepfennig',
-    'kohlhagen',
-    'kohlizt',
-    'kohlrausch-williams-watts',
-    'kohlstyler',
-    'kohm',
-    'kohms',
-    'kohn-speyer',
-    'kohner',
-    'kohnstamm',
-    'kohr/burglary',
-    'kohtla-jarve',
-    'kohukohu',
-    'koi&rehy;keeper',
     'koi-dealer',
-    'koi-shaped',
-    'koibal',
-    'koibla',
-    'koidl',
-    'koies',
-    'koilocytosis',
-    'koin&eacute;ization',
-    'koinange',
-    'koines',
-    'koiralaprime',
-    'koirsakoff',
-    'koiso',
-    'koivistoinen',
-    'koivupuro',
-    'koj&egrave;ve',
     'kojecky',
-    'kojevnikov',
-    'kojien',
-    'kok&mdash;national',
-    'kok-kok-kok',
-    'kokabi',
-    'kokalos',
-    'kokciede',
-    'kokes',
-    'koki',
-    'kokkadichcholai',
-    'kokkalis',
-    'kokkevi',
-    'koklova',
-    'kokmen',
-    'kokodia',
     'kokoi',
-    'kokolia',
-    'kokonational',
-    'kokonya',
-    'kokoomus19.323.14053',
-    'kokopo',
-    'kokoschkas',
-    'kokoshniki',
-    'kokotaylo',
-    'kokotsu',
-    'kokouvi',
-    'kokov',
-    'kokovtsev',
-    'kokovtsov',
-    'kokowska',
-    'kokstad',
     'kokushkin',
-    'kol&aacute&ccaron',
-    'kol&iacute;n',
-    'kol\'skiy',
-    'kolbassia',
-    'kolbovsky',
-    'kolchida',
-    'kolchis',
-    'kolderie',
-    'koldon',
-    'koldt',
-    'kolega',
-    'kolekole',
-    'kolen',
-    'kolfor',
-    'kolhapur',
     'kolhberg',
-    'koli',
-    'kolibarov',
-    'koljevi&cacute',
-    'kolker',
-    'kolkhozniki',
-    'kolkwitzia',
-    'kolland',
-    'kollatr',
-    'kollowitz',
-    'kollsman',
-    'kollytos',
-    'kolmogorov-smirnov',
-    'kolner',
-    'kolodeje',
-    'kolodov',
     'kolodziejczyknational',
-    'kolok',
-    'kolokoi',
-    'kolokol',
-    'kolokotronis',
-    'kololo',
-    'kolomenskoye',
-    'kolomikta',
-    'kolonji',
-    'kolov',
-    'kolozsv&aacute;r',
-    'kolsaas',
-    'kolsek',
-    'kolshin',
-    'kolsson',
-    'kolstad',
     'koltun',
-    'kolymsky',
-    'kolyvan',
-    'kolyvano-kuznetsk',
-    'kom&aacute;rov',
-    'koma',
-    'komai',
-    'komaleh',
-    'komandorsklye',
-    'komanya',
-    'komar&ccaron;a',
-    'komarchs',
-    'komarno',
-    'komarom-esztergom',
-    'komatiites',
-    'komba',
     'kombat',
-    'kombinats',
-    'kombruk',
-    'komech',
-    'komeito159186',
-    'komelova',
-    'komenchi',
-    'komercni',
-    'komets',
-    'komhyr',
-    'komics',
-    'komin',
-    'komisarjevsky',
-    'komische',
-    'komiya',
-    'komla',
     'komlos',
-    'komma-ethniki',
-    'kommandantur',
-    'komment',
-    'kommerzienrat',
-    'kommunication',
-    'kommunikativen',
-    'kommunis',
-    'kommunisterna&mdash;vpk',
-    'kommunisterne',
-    'kommunistesch',
-    'kommunisticheskaya',
-    'komo',
-    'komodoensis',
-    'komosol',
-    'komotau',
     'komrower',
-    'komsomoljskai',
-    'komy',
-    'kon&eacute',
-    'kon-chan',
-    'kon-rads',
-    'konable',
-    'konalyck',
-    'konami',
-    'konami/imageworks',
-    'konar',
-    'konarev',
-    'konarpki',
-    'konarski',
-    'konate',
-    'konavli',
     'konchak',
-    'kondeyne',
-    'konditorei',
-    'kondogeorgios',
-    'kondor',
-    'kondoro',
-    'kondoyannopoulos',
-    'kondrat',
-    'kondratyev',
-    'kondre',
-    'konduz',
-    'konecny',
-    'koneski',
-    'konfederacja',
-    'konfliktpartnerschaft',
-    'kong-born',
     'kong-bound',
-    'kong-china',
-    'kong-controlled',
-    'kong-financed',
-    'kong-led',
-    'kong-listed',
-    'kong-quoted',
-    'kong-registered',
-    'kong-style',
-    'kong.',
-    'kong/macao',
-    'kongens',
-    'kongers',
-    'kongit',
-    'kongres',
-    'kongresi\'ni',
     'kongresowa',
-    'kongress&mdash;was',
-    'kongresshalle',
-    'kongsberg',
-    'kongsfjorden',
-    'kongsi',
-    'kongskilde',
-    'kongur',
-    'konh',
-    'koni',
-    'konichi-wah',
-    'konietzko',
-    'konigin',
-    'konigsfelden',
-    'koning',
-    'koningen',
     'koninklijke/shell',
-    'konishi',
-    'konitron',
-    'konitsa',
-    'konje',
-    'konkani-speaking',
-    'konkret',
-    'konkretes',
-    'konner',
-    'konni',
-    'konoe',
-    'konolfingen',
-    'konopi&scaron;t&ecaron',
-    'konopkastrasse/main',
-    'konosuke',
-    'konouta',
     'konpfler',
-    'konsepsi',
-    'konsequent',
-    'konserwacji',
-    'konserwatywno-liberalna',
-    'konspiracy',
-    'konstadinos',
-    'konstaninos',
-    'konstantino',
-    'konstantins',
-    'konstantyn',
-    'konstyantin',
-    'konsulthuset',
-    'konsyanza',
-    'kontacta',
-    'konte',
     'kontiki',
-    'kontite',
-    'kontoyiannopoulos',
-    'kontradmiral',
-    'konttinen',
-    'kontur',
-    'konukman',
-    'konyi',
-    'konyvterjeszto',
-    'konzintsev',
-    'koo-ee',
-    'koo-kool-larta',
-    'koo-krr-oo',
-    'koob',
-    'koochi',
-    'kooee',
     'kooiman',
-    'kook',
-    'kook-aid',
-    'kook-kook-kook-ka-ka-ka',
-    'kookaburras',
-    'kookie',
-    'koolatron',
-    'koolau',
-    'koolhaas',
-    'koomen',
-    'koompassia',
-    'koonamore',
-    'kooper',
-    'kooperativa',
-    'koornmarkt',
-    'koorosh',
     'kooskia',
-    'kooskooske',
-    'koot',
-    'kootchie',
-    'kootenae',
-    'kootenay',
-    'kooyk',
-    'kooymans',
-    'kop-end',
-    'kopac',
-    'kopais',
-    'kopaonik',
-    'kopay',
-    'kopcke',
-    'kopec',
-    'kopechne',
     'kopekov',
-    'kopelar',
-    'kopelev',
-    'kopernickerstrasse',
-    'kopex',
-    'kopfstein',
-    'kopietz',
-    'kopilov',
-    'kopite',
-    'kopitz',
-    'kopje',
-    'kopliku',
-    'koporo',
-    'kopparberg',
-    'kopped',
-    'koppenaal',
     'koppers-totzek',
-    'kopreckocaika',
-    'kopriva',
-    'koprowski',
-    'koptev',
-    'koptos',
-    'kor&egrave',
-    'kor-di-foe-lee-oos',
-    'kor-kok',
-    'kora-kora',
-    'korablev',
-    'korablov',
-    'koradrel',
-    'koralek',
-    'koralya',
-    'koramic',
     'korangi',
-    'korat',
-    'korban',
-    'korbeciforeign',
-    'korchanis',
-    'kord-ar-ta',
-    'kordenbusch',
-    'kordestan',
-    'kordi',
-    'kordic',
-    'kordik',
-    'kordin',
-    'kordun',
-    'kordus',
-    'kordy',
-    'kore-pose',
     'kore-type',
-    'korea-based',
-    'korea-china',
-    'korea-soviet',
-    'korea-united',
-    'korea.',
-    'korean-american',
-    'korean-backed',
-    'korean-based',
-    'korean-issue',
-    'korean-manufactured',
-    'korean-owned',
-    'korean-run',
-    'korean-soviet',
-    'korean-trained',
-    'koreana',
     'koreanisation',
-    'koreatown',
-    'korejustice',
-    'korenica',
-    'korfball',
-    'korff',
-    'korhandir',
-    'korhian',
-    'korhogo',
-    'kori',
-    'korine',
-    'korinkova',
-    'korinna',
-    'korinthiakos',
-    'korkut',
-    'kormartin',
     'kormell',
-    'kormos',
-    'korn/',
-    'kornai',
-    'kornati',
-    'kornblee',
-    'kornblith',
-    'kornbrot',
-    'kornei',
-    'korneliussen',
-    'korneliussen.',
-    'kornfeld',
-    'kornicki',
-    'kornienko',
-    'korniev',
-    'kornik',
     'kornjaca',
-    'kornnelia',
-    'korns',
-    'kornwolf',
-    'korobeinikov',
-    'korobkin',
-    'koroda',
-    'korolyev',
-    'koromex',
-    'koromo',
-    'korona',
-    'korone',
-    'koroneia',
-    'koroni',
-    'koroniti',
-    'korosec',
     'korotkoff',
-    'korovan',
-    'korpse',
-    'korred',
-    'korresia',
-    'korsaga',
-    'korsakov',
-    'korsfjord',
-    'korsh',
-    'korshunov',
-    'korsika',
-    'korsman',
-    'korsmeyer',
-    'kortrijk',
-    'kortun',
-    'kortunov',
     'korumel',
-    'koruny',
-    'korving',
-    'korwin-mikke',
-    'koryak',
-    'korzeniowski',
-    'kosary',
-    'kosb',
-    'kosbar',
-    'kosberg',
-    'kosciusko',
-    'kosciuszko',
-    'kosgoda',
-    'kosher-approved',
-    'kosher-style',
-    'koshered',
     'koshi',
-    'koshihara',
-    'koshim',
-    'koshion',
-    'koshkodan',
-    'koshtan',
-    'kosiak',
-    'kosiana',
-    'kosie',
-    'kosiniak-kamysz',
-    'kosinski',
-    'kositos',
-    'koskela',
-    'koskinos',
-    'kosleck',
-    'kosmin',
     'kosmoceras',
-    'kosmopoulos',
-    'kosok',
-    'kosovan',
-    'kosovo-methohija',
-    'kosovo-metohija&mdash;under',
-    'kosovska',
-    'kossacks',
-    'kossof',
-    'kossoff-ish',
-    'kossov',
-    'kossut',
-    'kost-ar-ta',
-    'kostakis',
-    'kostash',
-    'kostbare',
     'koste&ccaron;n&aacute',
-    'kostelka',
-    'kostenko',
-    'kostev',
-    'kostick',
-    'kostienki',
-    'kostika',
-    'kostner',
-    'kostrikhin',
-    'kostrovwitzki',
-    'kosutic',
-    'kosutnik',
-    'kosy',
-    'kosygin-brezhnev',
-    'kosyrev',
-    'koszalin',
     'kotadia',
-    'kotah',
-    'kotakakura',
-    'kotalawala',
-    'kotalawalas',
-    'kotaparcha',
-    'kotari',
-    'kotch',
-    'kotcheff',
-    'kotelchuck',
-    'kotelo',
-    'kotenev',
-    'kothari',
-    'kothary',
-    'kothmann',
-    'kotick',
     'kotiga',
-    'kotkin',
-    'kotler',
-    'koto',
-    'kotok',
-    'kotowaza',
-    'kotra',
-    'kottbusser',
-    'kotte',
-    'kottewski',
-    'kottke',
-    'kottler',
-    'kotto',
-    'kotzebue',
-    'kotzen',
-    'kotzsch',
     'kou',
-    'kouanda',
-    'kouandi',
-    'koufonisis',
-    'koufos',
-    'kougblenou',
-    'kougjolou',
-    'koukiadhis',
-    'koul',
-    'koula',
-    'koulebiaca',
-    'koulouba',
-    'kouloura',
-    'kouma',
-    'koumakoye',
-    'koumba',
     'koumbaria',
-    'koumbologi',
-    'koumjian',
-    'koummoue',
-    'kouomegni',
-    'koupetschesky',
-    'kourabi',
-    'kourabi&egrave;des',
-    'kourosh',
-    'kourtaliotiko',
-    'koury',
-    'kousa',
-    'kousokuya',
-    'koutoubia',
-    'kouwenhoven',
-    'kouyate',
     'kouyomdjian',
-    'kov&aacute&rcaron',
-    'kovalcheck',
-    'kovalchuk',
-    'kovalesky',
-    'kovalev',
-    'kovalevskii',
-    'kovalevsky',
-    'kovic',
-    'kovics',
-    'koviljaca',
-    'koviljko',
-    'kovpotina.',
-    'kow-kow-kow',
-    'kow-lyow',
-    'kow-towed',
     'kow-towing',
-    'kow-tows',
-    'kow-yow',
-    'kowa',
-    'kowabunga',
-    'kowabunga-mutant-ninja-turtle-most-unfortunately-named-clothing-company-of-the-century',
-    'kowal',
-    'kowaleski',
-    'kowaleski-wallace',
-    'kowk',
-    'kowkabi',
-    'kowloon-side',
-    'kowski',
-    'kowtows',
-    'kox-defined',
-    'kox-related',
     'kox19-hybridising',
-    'kox31-derived',
-    'koy-ye',
-    'koyabashi',
-    'koyadia',
-    'koyagialo',
-    'koyaguchi',
-    'koyanisqaatsi',
-    'koyli',
-    'koyuktolik',
-    'kozacioglu',
-    'kozani',
-    'kozara',
-    'kozaruk',
-    'koziarski',
-    'kozik',
     'kozinc',
-    'kozinski',
-    'kozjak',
-    'kozloff',
-    'kozponti',
-    'kp/w',
-    'kp63',
-    'kp72',
-    'kpakra',
-    'kpandja',
-    'kpdp',
-    'kpf',
-    'kpn&mdash;confederation',
-    'kpni-hpai',
-    'kpni-noti(blunt)',
-    'kpolleh',
     'kpotivi',
-    'kpwoka',
-    'kq6',
-    'kqbps',
-    'kqed',
-    'kr&aacute;lodvorsk&aacute',
-    'kr&lt;24,000,000',
-    'kr&oacute;lik',
-    'kr&oslash;yer',
-    'kr&uuml;ppel',
-    'kr900',
-    'kraah',
-    'kraai',
-    'kraaij',
-    'kraan',
-    'kraapa',
     'krabi',
-    'krabs',
-    'krachai',
-    'krackers',
-    'kracun',
-    'krads',
-    'kraemers',
-    'kraeplin',
-    'kraetz',
-    'krafchik',
-    'krafla',
-    'kraftwerke',
-    'kraftwerkian',
-    'kragh',
-    'krahe',
-    'kraig',
     'krain',
-    'kraiss',
-    'krajin',
-    'krajina.',
-    'krajinas',
-    'krajna',
-    'krak',
-    'kraka',
-    'krakatao',
-    'krakatoan',
-    'krakauer',
-    'krakens',
-    'krakowa',
-    'krakowska',
-    'kralis',
-    'kraljeva',
     'kraljicamira',
-    'kralleralm',
-    'kram',
-    'krama',
-    'kramarsky',
-    'kramberger',
-    'krameri',
-    'kramerius',
-    'kramitz',
-    'kraml/charles',
-    'kramlich',
-    'kramm',
-    'kramnik',
-    'krampe',
-    'kramsu',
-    'kranenborg',
     'kranenburg',
-    'kranjc',
-    'kranji',
-    'krankenkassen',
-    'krankl',
-    'kranko',
-    'krankoors',
-    'krankovitz',
-    'krankovsky',
-    'krankwinkl',
-    'krannon',
-    'krapayoon',
-    'krapp',
-    'krarnarae',
-    'kras-si-pays',
-    'krasavin',
     'krash',
-    'krashaar',
-    'krasikov',
-    'krasnopevtsev',
-    'krasnoselkup',
-    'krasnow',
-    'krasnyy',
-    'krass',
-    'krathong',
-    'krathwohl',
-    'kratitz',
-    'kratolsov',
-    'kratschmer',
-    'kratschull',
-    'kratzer',
-    'kratzert',
     'krauer',
-    'krauly',
-    'kraurosis',
-    'krauser',
-    'kraushar',
-    'krauss-maffei',
-    'krauter',
-    'krauthammer',
-    'krautish',
-    'krautrockers',
-    'kravchenko-like',
-    'kravchuck',
-    'kravchuk/soprano',
-    'krawczuk',
-    'krawisz',
-    'kray/crow',
     'krayenbuehl',
-    'krazzy',
-    'krbava',
-    'krca-tv',
-    'krcho',
-    'kre-kre-kre',
-    'kreb',
-    'krebbs',
-    'krebsforschungszentrum',
-    'krebsgasse',
-    'kreditkasse',
-    'kredytowy',
-    'kreee',
-    'kreen',
-    'kreepy',
-    'krefelt',
     'kregan',
-    'kregel',
-    'kreimer',
-    'kreischer',
-    'kreisel',
-    'kreisleriana',
-    'kreiss',
-    'krek',
-    'kreka',
-    'krekel-aalberse',
-    'kreller',
-    'kremasti',
-    'kremer/bernstein',
-    'kremlin-watchers',
-    'kremlinising',
-    'kremlinologists',
     'kremlinology',
-    'kremlyova',
-    'kremnitz',
-    'krempel',
-    'krengiel',
-    'krenner',
-    'krenwinkiel',
-    'kreosotum',
-    'krepkaya',
-    'kreposti',
-    'kressbronner',
-    'krest\'ianskaia',
-    'kresta',
-    'krestyanskaya',
-    'kretan',
-    'krete',
     'kretzshmar',
-    'kreuning',
-    'kreutz',
-    'kreuzgasse',
-    'kreuzkirche',
-    'kreuztor',
-    'kreuzweg',
-    'krew',
-    'krew\'',
-    'kreyszig',
-    'krichefsky',
-    'krick',
-    'kricka',
-    'kriegers',
-    'kriegsakademie',
-    'kriegsgefangenen',
     'kriegskommissariat',
-    'kriegslok',
-    'kriegstein',
-    'kriegzeit',
-    'kriengkamol',
-    'kriger',
-    'kriging',
-    'krii-krii',
-    'kriizli',
-    'krikalev',
-    'krikalyov',
-    'krikelas',
-    'krilich',
-    'krill-based',
-    'krill-catching',
-    'krillstick',
     'krim',
-    'kriminalrat',
-    'krimmies',
-    'kringle-type',
-    'krinzinger',
-    'krio',
-    'kripalani',
-    'krisanna',
-    'krisberg',
-    'krische',
-    'krises',
-    'krishak',
-    'krishnakumar',
-    'krishnamachari',
-    'krishnamurhty',
-    'krisis',
     'krislov',
-    'kriss-kross',
-    'krist',
-    'kristallphysik',
-    'kristdemokratiska',
-    'kristeller',
-    'kristenson',
-    'kristensson',
-    'kristi',
-    'kristi&aacute;n',
-    'kristian.',
-    'kristianstad',
-    'kristiene',
-    'kristiina',
-    'kristilliinen',
-    'kristina',
     'kristinart&iacute;ndar',
-    'kristo',
-    'kristos',
-    'kristov',
-    'kritalla',
-    'krite',
-    'krithia',
-    'kritik',
-    'kritikon',
-    'kritsanachandefence',
-    'kritseligt',
-    'krivak',
-    'krivoy',
-    'kriz',
-    'krle&zcaron;a',
-    'kroagnon',
     'krobo',
-    'kroc',
-    'kroch',
-    'krock',
-    'kroeske',
-    'kroetz',
-    'kroff',
-    'krogers',
-    'krogh',
-    'krogman',
-    'kroisos',
-    'kroker',
-    'krokonose',
-    'krolikowski',
-    'kroll-oper',
-    'kromah',
     'kromaton',
-    'krombeck',
-    'kromer',
-    'kromi/pilot',
-    'krommer',
-    'krommyon',
-    'krona/ecu',
-    'kronar',
-    'kronas',
-    'kronawitter',
-    'kronborg',
-    'krondel',
-    'kronengasse',
-    'kronenplatz',
-    'kroner-less',
-    'kronfli',
     'kronfli/student',
-    'kronitex',
-    'kronoberg',
-    'kronprinzen-palais',
-    'kronquists',
-    'krontiris',
-    'krooh',
-    'krook-lo',
-    'krook-lok',
-    'kroom',
-    'kroons',
-    'kroonstad',
-    'kropfl',
-    'kropiwnicki',
-    'kropotnik',
-    'krotki',
     'kroto',
-    'krotonian',
-    'kroupa',
-    'kroutvor',
-    'krovetz',
-    'kroy',
-    'kroyer',
-    'kroz',
-    'krr',
-    'krs1',
-    'krscanska',
-    'krstulovic',
-    'krsty',
-    'kru&scaron;evac',
-    'krucker',
-    'krud',
     'kruis',
-    'kruisstraat',
-    'kruitsberg',
-    'krumel',
-    'krumfettmahanamanahulamoranosecanosemahanaritiraoosalalaramalapalapapopapopobaalacataltootoochepereelong',
-    'krumlauf',
-    'krumme',
-    'krunch',
-    'krunchies',
-    'krungggg',
-    'krupka',
-    'krupnick',
-    'krusche',
-    'krusenbaum',
-    'krusevo',
-    'krush',
     'kruskall-wallisone',
-    'kruskic',
-    'krusne',
-    'krust',
-    'krustenova',
-    'krusty',
-    'kruszwica',
-    'kruszyna',
-    'kruszynski',
-    'krutch',
-    'krutov',
-    'krv',
-    'kry',
-    'kryazh',
-    'krym',
-    'krynine',
     'krypton-shafted',
-    'krystal',
-    'krystalflex',
-    'krystian',
-    'krysztof',
-    'kryuchina',
-    'krzanowski',
-    'krzemieniec',
-    'krzsztof',
-    'krzysztos',
-    'krzywanek',
-    'krzyztof',
-    'ks+',
-    'ks/sk',
-    'ks1000l',
-    'ks100l',
     'ks100t',
-    'ks16b/406',
-    'ks901',
-    'ksa&rehy;consumercare',
-    'ksa-consumercare',
-    'ksaveriyev',
-    'ksb-3',
-    'kscm',
-    'ksh1,402',
-    'ksh1.90',
-    'ksh18,442',
-    'ksh3.00',
-    'ksh30,636',
-    'ksh48,560',
-    'ksh49,456',
-    'ksh57,996',
     'ksh600,000,000',
-    'ksh641,000,000',
-    'ksh69,300',
-    'ksh79,196',
-    'ksp',
-    'ksr1&ndash;1088',
-    'ksrc',
-    'ksri',
-    'kss-kor',
-    'kst',
-    'kstj',
-    'ksudach',
-    'kt-r6',
-    'kt1026',
-    'kt12',
-    'kt15',
     'kt16',
-    'kt19',
-    'kt2',
-    'kt21',
-    'kt24',
-    'kt3301s',
-    'kt8',
-    'kt9',
-    'ktaeb',
-    'ktc',
-    'ktesias',
-    'ktholo',
-    'ktn',
-    'kto-kogo',
-    'kts.',
-    'ku&ccaron;a',
     'ku&ccaron;era',
-    'ku-band',
-    'ku-damm',
-    'ku-jikijila',
-    'ku-klux-klan-type',
-    'kuah',
-    'kuanda',
-    'kuang-shun',
-    'kuangtung',
-    'kubach',
-    'kubasiak',
-    'kubati',
-    'kubatlin',
-    'kubbet',
-    'kubecka',
-    'kubelik/bavarian',
     'kubelka',
-    'kubelka-munk',
-    'kubereka',
-    'kubi&eacute;na',
-    'kubiak',
-    'kubicke',
-    'kubicki',
-    'kubin',
-    'kubinski',
-    'kubis',
-    'kubitschek',
-    'kublaikansky',
-    'kubler-ross',
-    'kubo',
-    'kubuabola',
-    'kucharyk',
     'kuchino',
-    'kuchlibari',
-    'kuchuk-kainardji',
-    'kucinski',
-    'kucker',
-    'kucklestane',
-    'kuczaj',
-    'kud',
-    'kudamm',
-    'kudan',
-    'kudayyir',
-    'kuder',
-    'kudo',
-    'kudoh',
-    'kudos/kevin',
-    'kudos/morley',
     'kudos/notoriety',
-    'kudred',
-    'kudriatsev',
-    'kudz',
-    'kuen',
-    'kueneman',
-    'kuerti',
-    'kuevi',
-    'kufahanu',
-    'kuffer',
-    'kufic',
-    'kuflik',
-    'kufncd',
-    'kufpec',
-    'kufr',
-    'kufta',
     'kuganov',
-    'kugapakori',
-    'kugelhopf',
-    'kuggle',
-    'kugle',
-    'kuh',
-    'kuhammad',
-    'kuhfield',
-    'kuhio',
-    'kuhli',
-    'kuhlman',
-    'kuhnle',
-    'kuhns',
-    'kuia',
-    'kuibysheva',
-    'kuichi',
     'kuijpers',
-    'kuik',
-    'kuile',
-    'kuils',
-    'kuini',
-    'kuirata',
-    'kuisany',
-    'kuitca',
-    'kuito',
-    'kujacku',
-    'kujawa',
-    'kujawiak',
-    'kuk',
-    'kukacka',
-    'kukai',
-    'kukanis/thames',
     'kukes',
-    'kuki',
-    'kukkiwon',
-    'kukla',
-    'kukoi',
-    'kukorelli',
-    'kukreja',
-    'kukrit',
-    'kukuckza',
-    'kukui',
-    'kukul',
-    'kukulcan',
-    'kul',
-    'kul-',
-    'kulak\'',
-    'kulaki',
     'kulakov',
-    'kulasingham',
-    'kulbir',
-    'kulcs&aacute;r',
-    'kulcsar',
-    'kulfik',
-    'kulick',
-    'kulig',
-    'kulikowski',
-    'kulit',
-    'kulkarni',
-    'kulkarni/report',
-    'kulkarni/working',
-    'kulkompani',
-    'kulkov',
-    'kullab',
     'kullakita',
-    'kullander',
-    'kullavanijaya',
-    'kulle',
-    'kullig',
-    'kulman',
-    'kulmann',
-    'kulmbach',
-    'kulmie',
-    'kulo',
-    'kulta/esquire',
-    'kultur-kampf',
-    'kulturen',
-    'kulturinstitut',
-    'kulturmuhle',
-    'kulturna',
     'kulturphilister',
-    'kulturprotestantismus',
-    'kulturreferentin',
-    'kulturwissenschaft',
-    'kulumbegov',
-    'kulungu',
-    'kulvinder',
-    'kuly',
-    'kulygin',
-    'kumagai',
-    'kumai',
-    'kumakawa',
-    'kumalli',
-    'kumamoto',
-    'kumandintsy',
-    'kumaramangalam',
     'kumaran',
-    'kumaresan',
-    'kumatakenin',
-    'kumayri',
-    'kumba',
-    'kume',
-    'kumel',
-    'kumfi',
-    'kumfy',
-    'kumho',
-    'kumin',
-    'kumite',
-    'kumla',
-    'kummar',
-    'kumonryu',
-    'kumpt',
     'kumud',
-    'kun&scaron;t&aacute;t',
-    'kun-yeu',
-    'kunakh',
-    'kunale',
-    'kunamoto',
-    'kunan',
-    'kunanurra',
-    'kunavi',
-    'kunchok',
-    'kunden',
-    'kunder',
-    'kundera\'',
-    'kundig',
-    'kundous',
-    'kundulum',
     'kundy',
-    'kunes',
-    'kunev',
-    'kung-kung',
-    'kuniaki',
-    'kunigund',
-    'kunihiko',
-    'kunii',
-    'kunisada',
-    'kuniyoshi',
-    'kunkin',
-    'kunne',
-    'kunnin',
-    'kunnskapsforlaget',
-    'kunst-und-ausstellungshalle',
-    'kunstakademies',
     'kunstat',
-    'kunstauktionen',
-    'kunstausstellung',
-    'kunstbezit',
-    'kunsten',
-    'kunstforschung',
-    'kunstgenossenschaft',
-    'kunstgewerbeschule',
-    'kunsthalle-style',
-    'kunsthalles',
-    'kunsthochschulen',
-    'kunstinsel',
-    'kunstlandschaften',
-    'kunstlerbund',
-    'kunstlerinnen',
-    'kunstraum',
     'kunstschau',
-    'kunstverh&auml;ltnisse',
-    'kunstverlag',
-    'kunstwerk',
-    'kunstwollen',
-    'kunt',
-    'kunta',
-    'kuntang',
-    'kunter',
-    'kuntilet',
-    'kuntsevo',
-    'kuntz',
-    'kunwar',
-    'kunz/gate',
-    'kunzle',
-    'kunzler',
     'kuo-ch\'ing',
-    'kuo-min',
-    'kuo-ting',
-    'kuo-tung',
-    'kuoi',
-    'kuok',
-    'kuomegni',
-    'kupenda',
-    'kuperard',
-    'kupferberg',
-    'kupho',
-    'kupona',
-    'kupony',
-    'kuptsev',
-    'kupyaukyi',
-    'kurah',
     'kurakins',
-    'kurat',
-    'kurata',
-    'kurau',
-    'kurczbrak',
-    'kurdhish',
-    'kurdish-backed',
-    'kurdish-dominated',
-    'kurdish-held',
-    'kurdishautonomy',
-    'kurdjali',
-    'kurdlsh',
-    'kurdna',
-    'kurdt',
-    'kuresa',
-    'kuretake',
     'kuretes',
-    'kurf&ucirc;rstendamm',
-    'kurfiarstendamm',
-    'kurfurstendam',
-    'kurfurstentums',
-    'kuriansky',
-    'kurien',
-    'kurilo',
-    'kurious',
-    'kurish',
-    'kuristica',
-    'kuriwa',
-    'kurjehin',
-    'kurji',
-    'kurkigarth',
-    'kurkigert',
     'kurkova',
-    'kurlin',
-    'kurma',
-    'kurminsky',
-    'kurnandan',
-    'kurniawan',
-    'kurnous',
-    'kurokujira',
-    'kurort',
-    'kurosaki',
-    'kuroshio',
-    'kuroshioboshi',
-    'kurotchkina',
-    'kuroyanagi',
-    'kurpark',
-    'kurssnerin',
     'kurstein',
-    'kurt-cesar',
-    'kurtahs',
-    'kurtat',
-    'kurtaxe',
-    'kurtheater',
-    'kurts',
-    'kurtulus',
-    'kurtwood',
-    'kurtzig',
-    'kurtzman',
-    'kurtzweilige',
-    'kurultay',
-    'kuruppu',
-    'kurusaqila',
-    'kurwenal',
     'kuryachev',
-    'kuryakin',
-    'kurys',
-    'kurzgeschichten',
-    'kurzhals',
-    'kurzlehrgang',
-    'kurzon',
-    'kusadasi',
-    'kusamo',
-    'kushal',
-    'kushbaloo',
-    'kushmann',
-    'kusimanse',
-    'kuska',
-    'kuskokwim',
-    'kuskovo',
     'kusno',
-    'kuss',
-    'kussi',
-    'kustar',
-    'kustarnyi',
-    'kustary',
-    'kustera',
-    'kusu',
-    'kusumaatmadja',
-    'kutai',
-    'kutani',
-    'kutb',
-    'kutchuk',
-    'kutchuk&mdash;kainardji',
-    'kutchuk-kainardji',
-    'kutenyov/russian',
     'kuthodaw',
-    'kuti-bass',
-    'kutner',
-    'kuts',
-    'kutsuki',
-    'kutsurogi',
-    'kutubdia',
-    'kutuk',
-    'kutum',
-    'kutuzovsky',
-    'kutz',
-    'kutzalls',
-    'kutzner',
-    'kuui',
-    'kuvitt',
-    'kuvlum',
     'kuwabra',
-    'kuwait-saudi-arabian',
-    'kuwait-sized',
-    'kuwaiti-commissioned',
-    'kuwaiti-iraqi',
-    'kuwaiti/iraq',
-    'kuwaiti1',
-    'kuyas',
-    'kuyateh',
-    'kuykendahl',
-    'kuyodo',
-    'kuysanjag',
-    'kuzah',
-    'kuzari',
-    'kuzichin',
-    'kuziriv',
     'kuzma',
-    'kuzmack',
-    'kval&ouml;y',
-    'kvalsund',
-    'kvalsvoll',
-    'kvanti',
-    'kvarner',
-    'kvartir-nik',
-    'kvennalista',
-    'kverneland',
-    'kvietik',
-    'kviliataya',
-    'kvinn',
-    'kvist/press',
-    'kvitsinski',
-    'kvitsinsky',
     'kvittel',
-    'kvktlkaqnselastanmlreqvaqlkqk',
-    'kvn/vd',
-    'kvzak',
-    'kw&eacute;y&ograve;l',
-    'kw14',
-    'kw14.8',
-    'kw1rs',
-    'kwaan',
-    'kwabo',
-    'kwachas',
-    'kwadar',
-    'kwala',
-    'kwaluseni',
-    'kwan-do',
-    'kwanda',
     'kwandbele',
-    'kwanggu',
-    'kwangtung',
-    'kwantreng',
-    'kwantung',
-    'kwao',
-    'kwaouvi',
-    'kwaovi',
-    'kwarara',
-    'kwart',
-    'kwasi',
-    'kwathema',
-    'kwavalskie',
-    'kwayana',
-    'kwegyir',
-    'kweilin',
     'kweol',
-    'kweol-language',
-    'kwex',
-    'kwhs',
-    'kwiasnewski',
-    'kwiatek',
-    'kwicksave',
-    'kwidini',
-    'kwiek',
-    'kwiet',
-    'kwik-cricket',
-    'kwikbuk',
-    'kwikclene',
-    'kwintner',
-    'kwirs2',
-    'kwiss',
     'kwl',
-    'kwlrs',
-    'kwo',
-    'kwondo',
-    'kwu',
-    'kwvrps',
-    'kwx',
-    'kx-',
-    'kx-260',
-    'kx-360',
-    'kx-p1124',
-    'kx-p2123',
-    'kx-w362',
-    'kxc1',
-    'kxc4',
-    'kxf8',
     'kxg2',
-    'kxg6',
-    'kxh4',
-    'kxinawa',
-    'ky15',
-    'ky16',
-    'kya',
-    'kyag',
-    'kyakhta',
-    'kyan',
-    'kyanite-magnetite',
-    'kyatt',
-    'kyauu-kyauu-kyau',
-    'kyaw*',
-    'kyber',
-    'kybergs',
     'kybner',
-    'kyburgers',
-    'kyempin',
-    'kyereme',
-    'kyese',
-    'kyesimira',
-    'kying-hoon',
-    'kyizom',
-    'kyjoyama',
-    'kyke',
-    'kykes',
-    'kykko',
-    'kylchap',
-    'kyle-dingwall',
-    'kyle/plockton/glenelg',
-    'kylene',
     'kylie-esque',
-    'kylie-recommended',
-    'kylies',
-    'kyll&auml',
-    'kyllachy',
-    'kyllo',
-    'kylo',
-    'kyloe',
-    'kylonian',
-    'kylsant',
-    'kyme/victim',
-    'kymograph',
-    'kyn',
-    'kynagarry',
-    'kynch',
-    'kyncl',
     'kynsal',
-    'kynurenine',
-    'kyobashi',
-    'kyodo-inspired',
-    'kyogunge',
-    'kyonggi',
-    'kyongji',
-    'kyorucha',
-    'kyosho',
-    'kyow',
-    'kyowa-saitama',
-    'kyphos',
-    'kyphosis',
-    'kypovis',
-    'kyprou',
-    'kypselids',
     'kypselos',
-    'kyr&ouml;nsalmi',
-    'kyra',
-    'kyrandia',
-    'kyriale',
-    'kyrie-christe',
-    'kyrie_eleison',
-    'kyrkekvarn',
-    'kyrrhestes',
-    'kyse',
-    'kysee',
-    'kytaiton',
-    'kyteon',
-    'kytherans',
-    'kytherodikes',
-    'kytsons',
     'kyuranov.',
-    'kywe',
-    'kywords',
-    'kyzikos',
-    'kyzyl',
-    'l&aacute;sl&oacute',
-    'l&aacute;zaro',
-    'l&aacute;zni',
-    'l&agrave;-bas',
-    'l&amacr;b&omacr',
-    'l&amp;d',
-    'l&amp;m',
-    'l&amp;nwr',
-    'l&amp;s',
-    'l&amp;sup2',
-    'l&amp;t',
     'l&aogon;cka',
-    'l&aring;ddej&aring;kk&aring;stugana',
-    'l&atilde',
-    'l&auml;cherlich',
-    'l&auml;der',
-    'l&auml;nd',
-    'l&auml;nde',
-    'l&auml;nder.',
-    'l&auml;nderrat',
-    'l&auml;ngst',
-    'l&auml;nsi-suomalainen',
-    'l&auml;rbro',
-    'l&auml;romedel',
-    'l&auml;roplan',
-    'l&eacute;0th&eacute;0',
-    'l&eacute;a',
     'l&eacute;andre',
-    'l&eacute;aud',
-    'l&eacute;beny',
-    'l&eacute;ch&eacute',
-    'l&eacute;g&egrave;re',
-    'l&eacute;gionnaires',
-    'l&eacute;gislation',
-    'l&eacute;gumes',
-    'l&eacute;gumiers',
-    'l&eacute;mery',
-    'l&eacute;on-g&oacute;mez',
-    'l&eacute;on-joseph',
-    'l&eacute;onore',
-    'l&eacute;opoldine',
-    'l&eacute;opoldville',
-    'l&eacute;oville',
     'l&eacute;oville-barton',
-    'l&eacute;svos',
-    'l&eacute;vi&rehy;strauss',
-    'l&ecirc;gion',
-    'l&egrave;g&egrave;re',
-    'l&egrave;ve',
-    'l&frac12;in',
-    'l&frac14',
-    'l&gt;a',
-    'l&iacute;ber',
-    'l&iacute;nea',
-    'l&iacute;neas',
-    'l&lsqb;loyd&rsqb',
-    'l&lsqb;or&rsqb;d',
-    'l&lsqb;ord&rsqb',
-    'l&lsqb;scene',
     'l&ndash;100',
-    'l&ndash;16/j&ndash;31',
-    'l&ndash;4',
-    'l&ndash;4h',
-    'l&ndash;4s',
-    'l&ndash;749',
-    'l&ndash;749/vc&ndash;12n',
-    'l&ndash;a',
-    'l&ndash;new',
-    'l&ndash;now',
-    'l&ndash;rood',
-    'l&oacute;bago',
-    'l&oacute;d&zacute',
-    'l&ocirc;wen',
-    'l&ograve;pez',
-    'l&oslash;dingen',
     'l&oslash;gumkloster',
-    'l&oslash;pet',
-    'l&ouml&ouml;w',
-    'l&ouml;derup',
-    'l&ouml;ffelholtz',
-    'l&ouml;ffler',
-    'l&ouml;fgren',
-    'l&ouml;hr',
-    'l&ouml;nnqvist',
-    'l&ouml;nnrot',
-    'l&ouml;schenkohl',
-    'l&ouml;tschberg',
-    'l&ouml;vborg',
-    'l&ouml;wenherz',
-    'l&ouml;yttyj&auml;rvi',
-    'l&percnt',
     'l&pound;210,000',
-    'l&pound;597,000',
-    'l&pound;million',
-    'l&ucirc;hr',
-    'l&ucirc;thien',
-    'l&uuml;bbe-grothues',
-    'l&uuml;ftl',
-    'l&uuml;n',
-    'l&uuml;neburg',
-    'l&uuml;rssen',
-    'l&uuml;scher',
-    'l&uuml;scherian',
-    'l&uuml;thi',
-    'l&uuml;thy',
-    'l&uuml;tken',
-    'l&uuml;tkenhorst',
     'l&uuml;tzen',
-    'l\'&eacute;conomie',
-    'l\'&eacute;ducation',
-    'l\'&eacute;glise',
-    'l\'&eacute;nergie',
-    'l\'&eacute;nonc&eacute\'',
-    'l\'&eacute;poque',
-    'l\'&eacute;puration',
-    'l\'&eacute;sthetique',
-    'l\'&eacute;toile',
-    'l\'a&icirc;n&eacute',
-    'l\'abbaye-aux-dames',
-    'l\'abbaye-aux-hommes',
-    'l\'abeilly',
-    'l\'abolition',
-    'l\'absente',
     'l\'absinthe',
-    'l\'acacia',
-    'l\'acad&eacute;mie',
-    'l\'academie',
-    'l\'actant',
-    'l\'acteur',
-    'l\'action',
-    'l\'actualit&eacute',
-    'l\'adventure',
-    'l\'aero',
-    'l\'affilard',
-    'l\'africana',
-    'l\'afrika',
-    'l\'age',
-    'l\'agenoise',
-    'l\'aiglon',
     'l\'aiguilhe',
-    'l\'ail',
-    'l\'aire',
-    'l\'alberta',
-    'l\'alessi',
-    'l\'alg&eacute;rie',
-    'l\'alimentation',
-    'l\'allemagne',
-    'l\'alsacienne',
-    'l\'alternative',
-    'l\'altipiano',
-    'l\'altissimo',
-    'l\'amateur',
-    'l\'ambassadeur',
-    'l\'americano',
-    'l\'amerique',
     'l\'amico',
-    'l\'amor',
-    'l\'analyse',
-    'l\'ancien',
-    'l\'andorre',
-    'l\'angle',
-    'l\'anime',
-    'l\'ann&eacute;e',
-    'l\'anniversaire',
-    'l\'anthracine',
-    'l\'anti-tradizione',
-    'l\'antiquite',
-    'l\'anza',
-    'l\'aperitif',
-    'l\'apocryphe',
-    'l\'apothicairerie',
     'l\'app&eacute;tit',
-    'l\'apr&egrave;smidi',
-    'l\'apres-midi',
-    'l\'aquastion',
-    'l\'aquitaine',
-    'l\'arceau',
-    'l\'archet',
-    'l\'archipel',
-    'l\'architecture',
-    'l\'architettura',
-    'l\'ard&egrave;che',
-    'l\'arlesienne',
-    'l\'arm&eacute;e',
-    'l\'armament',
-    'l\'armee',
-    'l\'arri&egrave;re-montparnasse',
     'l\'arsenal',
-    'l\'arsenale',
-    'l\'arte',
-    'l\'artemisia',
-    'l\'artisan',
-    'l\'as',
-    'l\'ascension',
-    'l\'assommoir',
-    'l\'astr&eacute;e',
-    'l\'astragale',
-    'l\'astre',
-    'l\'atalante',
-    'l\'attache',
-    'l\'attention',
-    'l\'aubesier',
-    'l\'auteur',
     'l\'autocyclette',
-    'l\'automobile',
-    'l\'autorit&eacute',
-    'l\'autrier',
-    'l\'auxerrois',
-    'l\'avait',
-    'l\'avance',
-    'l\'avant',
-    'l\'avare',
-    'l\'avenir',
-    'l\'aventura',
-    'l\'aventure',
-    'l\'aveugle',
-    'l\'avez',
-    'l\'avocat',
-    'l\'ecart',
     'l\'ecluse',
-    'l\'ecran',
-    'l\'ecu',
-    'l\'effet',
-    'l\'egisto',
-    'l\'eglise',
-    'l\'egyptienne',
-    'l\'elys&eacute;e',
-    'l\'embarquement',
-    'l\'endroit',
-    'l\'engendrement',
-    'l\'englois',
-    'l\'enjeu',
-    'l\'ennemi',
-    'l\'enrichissement',
-    'l\'entraide',
     'l\'entre',
-    'l\'environment',
-    'l\'epoque',
-    'l\'erma',
-    'l\'errant',
-    'l\'erreur',
-    'l\'escalade',
-    'l\'escarpolette',
-    'l\'escoufle',
-    'l\'esercisio',
-    'l\'esercizino',
-    'l\'esparcette',
-    'l\'esperance',
-    'l\'espirit',
-    'l\'espoir',
-    'l\'essence',
     'l\'estocart',
-    'l\'estragon',
-    'l\'etac',
-    'l\'eternel',
-    'l\'eternelle',
-    'l\'europ&eacute;en',
-    'l\'europeo',
-    'l\'evenement',
-    'l\'exil',
-    'l\'exp&eacute;rience',
-    'l\'expo',
-    'l\'expr&egrave;s',
-    'l\'expression',
-    'l\'expressionisme',
-    'l\'ext&eacute;rieur',
-    'l\'extase',
     'l\'h&eacute;ritage',
-    'l\'h&ocirc;pital',
-    'l\'ha&yuml',
-    'l\'habitat',
-    'l\'hallucin&eacute',
-    'l\'hassa',
-    'l\'heritier',
-    'l\'hermitage',
-    'l\'hermitte',
-    'l\'heureux-dub&eacute',
-    'l\'hippodrome',
-    'l\'hirondelle',
-    'l\'historien',
-    'l\'hoest',
-    'l\'homme-fusil',
-    'l\'hopital',
     'l\'hospitalier',
-    'l\'hotel',
-    'l\'huile&mdash;cuisine',
-    'l\'humanisme',
-    'l\'hygi&egrave;ne',
-    'l\'idiot',
-    'l\'idole',
-    'l\'illustration',
-    'l\'imaginaire',
-    'l\'imitation',
-    'l\'immense',
-    'l\'imp&eacute;ratice',
-    'l\'imperatore',
-    'l\'impero',
-    'l\'important',
-    'l\'imposition',
     'l\'imprimerie',
-    'l\'incontro',
-    'l\'incurable',
-    'l\'independance',
-    'l\'indienne',
-    'l\'indifferent',
-    'l\'indo-chine',
-    'l\'infarctus',
-    'l\'information',
-    'l\'initiatif',
-    'l\'innocence',
-    'l\'inseguitore',
-    'l\'instruction',
-    'l\'int&eacute;r&ecirc;t',
-    'l\'intelligence',
-    'l\'intelligibilit&eacute',
     'l\'inter-dit',
-    'l\'interdit',
-    'l\'internationale',
-    'l\'intra-dit',
-    'l\'intrans&iuml;geant',
-    'l\'intransigeant',
-    'l\'introduction',
-    'l\'inventario',
-    'l\'iseran',
-    'l\'islam',
-    'l\'islamisme',
-    'l\'isle-adam',
-    'l\'isola',
-    'l\'italia',
-    'l\'italiano',
-    'l\'italienne',
     'l\'lndochine',
-    'l\'lnfante',
-    'l\'n',
-    'l\'oblig&egrave;rent',
-    'l\'observation',
-    'l\'oc&eacute;an',
-    'l\'od&eacute;on',
-    'l\'oeuil',
-    'l\'office',
-    'l\'officier',
-    'l\'officina',
-    'l\'oie',
-    'l\'om&eacute',
-    'l\'on',
-    'l\'onde',
-    'l\'opinion',
     'l\'opposition',
-    'l\'organo',
-    'l\'orient-le',
-    'l\'original',
-    'l\'orimonte',
-    'l\'orne',
-    'l\'orphisme',
-    'l\'ortolan',
-    'l\'oseille',
-    'l\'oubli',
-    'l\'overture',
-    'l\'pool',
-    'l\'stands',
-    'l\'ultimo',
-    'l\'un',
-    'l\'unesco',
     'l\'unison',
-    'l\'unit&eacute',
-    'l\'uranie',
-    'l\'uranium',
-    'l\'vov',
-    'l\'woods',
-    'l(a)',
-    'l(a)451',
-    'l(d)',
-    'l(t)',
-    'l****r',
-    'l+f+',
-    'l+r',
-    'l,000gn',
-    'l,400gns',
-    'l,500',
     'l-&lsqb;1-c&rsqb',
-    'l-&lsqb;1-c&rsqb;leucine',
-    'l-&lsqb;u-',
-    'l-100',
-    'l-100s',
-    'l-1049',
-    'l-2',
-    'l-3',
-    'l-35',
-    'l-364,718',
-    'l-4',
-    'l-4-30',
-    'l-50',
-    'l-59',
-    'l-9',
-    'l-a-c-e',
     'l-ap4',
-    'l-arginine-nitric',
-    'l-armla',
-    'l-bend',
-    'l-c-r',
-    'l-c-r.',
-    'l-cys',
-    'l-day',
-    'l-din',
-    'l-direction',
-    'l-drivers',
-    'l-e',
-    'l-f-',
-    'l-force',
-    'l-future',
-    'l-future-tenses',
     'l-glutamate-induced',
-    'l-glutamate.',
-    'l-held',
-    'l-his',
-    'l-in',
-    'l-instructors',
-    'l-ish',
-    'l-k',
-    'l-l',
-    'l-l-like',
-    'l-l-lodsworth',
-    'l-l-lunch',
-    'l-lactoperoxidase',
-    'l-left',
-    'l-licence',
-    'l-life',
     'l-like',
-    'l-lord',
-    'l-love',
-    'l-lovers',
-    'l-m',
-    'l-marriage',
-    'l-n-monomethyl',
-    'l-nitroarginine',
-    'l-o-g',
-    'l-o-r-i',
-    'l-o-ve',
-    'l-peters',
-    'l-present',
-    'l-rail',
-    'l-registered',
-    'l-s',
     'l-selectin',
-    'l-serine',
-    'l-shapes',
-    'l-shooting',
-    'l-tensed',
-    'l-term',
-    'l-tester',
-    'l-tests',
-    'l-valine',
-    'l.0.4',
-    'l.1049g-82-81',
-    'l.20',
-    'l.4',
-    'l.5',
-    'l.5000',
-    'l.5m',
     'l.6',
-    'l.8',
-    'l.a',
-    'l.a./',
-    'l.a.o.s.',
-    'l.autumnalis',
-    'l.b',
-    'l.b.s.c.',
-    'l.b.w.',
-    'l.buck',
-    'l.c',
-    'l.c.f.a.',
-    'l.c.m',
-    'l.caeruleus',
-    'l.d.c.',
-    'l.d.s.',
     'l.d.v.',
-    'l.davies',
-    'l.g.\'',
-    'l.g.c.',
-    'l.g.j.',
-    'l.g.m.',
-    'l.g.o.c',
-    'l.game',
-    'l.ii',
-    'l.ii.',
-    'l.j.c.p.',
-    'l.j.r.',
-    'l.l.d.',
-    'l.l.f.e.',
-    'l.ll.lll',
-    'l.m',
     'l.m.f.',
-    'l.m.g.',
-    'l.m.r.',
-    'l.module',
-    'l.n.e.r.',
-    'l.no-of-weeks',
-    'l.o.1',
-    'l.o.s',
-    'l.p.e',
-    'l.p.g.',
-    'l.p.t',
-    'l.papi',
-    'l.r.9c.p',
-    'l.r.a.m.',
-    'l.r.s.',
-    'l.s.d.',
     'l.s.l.',
-    'l.s.lowry',
-    'l.s.m.',
-    'l.scoticum',
-    'l.t',
-    'l.they',
-    'l.u.t',
-    'l.w.',
-    'l/&ndash',
-    'l/&pound;r',
-    'l/2&ins',
-    'l/3',
-    'l/303/25/3002',
-    'l/306/25/3005',
-    'l/4in',
-    'l/500',
     'l/60th',
-    'l/ap',
-    'l/britag',
-    'l/jg',
-    'l/l',
-    'l/n',
-    'l/s',
-    'l/si',
-    'l/st.g',
-    'l/z',
-    'l0,000',
-    'l00,000',
-    'l00ks',
-    'l00mph',
-    'l02882',
-    'l02883',
     'l02885',
-    'l02887',
-    'l02888',
-    'l04',
-    'l05',
-    'l07126',
-    'l0cm',
-    'l0ff.',
-    'l0lb',
-    'l1+bh',
-    'l1+cm',
-    'l1,000',
-    'l1,310,000,000',
-    'l1,450',
-    'l1,500',
-    'l1,650',
     'l1,750',
-    'l1-4p',
-    'l1.5',
-    'l1/vc1',
-    'l10',
-    'l10,000',
-    'l100&ndash;120',
-    'l100,000',
-    'l1011',
-    'l11',
-    'l11,750,000',
-    'l110,000',
-    'l120&ndash;150',
-    'l120,000',
-    'l12259&ndash;61',
-    'l12304',
     'l125,000',
-    'l135,600,000',
-    'l14,104,000',
-    'l14,200,000',
-    'l140,000',
-    'l140,000,000',
-    'l141,000,000',
-    'l142,000,000',
-    'l147,000,000',
-    'l15',
-    'l15,000',
-    'l150',
-    'l16,000',
-    'l160,000,000',
-    'l17',
-    'l17,075,000',
     'l17.95',
-    'l18',
-    'l180',
-    'l190',
-    'l1a',
-    'l1b',
-    'l2\'s',
-    'l2,100',
-    'l2,800,000',
-    'l2-sr',
-    'l2.6',
-    'l20',
-    'l20,000,000',
-    'l2000',
-    'l200bn',
-    'l203,618,000',
     'l217,722,000',
-    'l23',
-    'l230,000',
-    'l24:4:7',
-    'l25',
-    'l250,000',
-    'l278',
-    'l2p',
-    'l2r2',
-    'l3%',
-    'l3,702',
-    'l3.13.2',
-    'l3.30',
-    'l30&deg;c',
-    'l3007',
-    'l31',
     'l32',
-    'l333',
-    'l364',
-    'l37',
-    'l38cs',
-    'l39c',
-    'l39s',
-    'l3l',
-    'l4&ndash;5',
-    'l4,200,000',
-    'l4.25',
-    'l40,000,000',
-    'l400bc',
-    'l42',
-    'l436,700,000',
-    'l440',
     'l47',
-    'l475',
-    'l48,000,000',
-    'l4y',
-    'l5&ndash;2',
-    'l5,050,000',
-    'l50&ndash;70',
-    'l50&ndash;80',
-    'l533',
-    'l533&ndash;1000',
-    'l55',
-    'l560',
-    'l569,700,000',
-    'l59',
-    'l592-l655',
-    'l5ces',
     'l5cm',
-    'l6,700,000',
-    'l60',
-    'l60&ndash;80',
-    'l64831',
-    'l65',
-    'l655',
-    'l66ds',
-    'l6eds',
-    'l7\'s',
-    'l70&ndash;90',
-    'l70,000,000',
-    'l703605',
-    'l7038-l7043',
-    'l722',
-    'l737&ndash;l806',
     'l765.4=dm1.00',
-    'l7689',
-    'l786-l8l6',
-    'l7th',
-    'l8,100,000',
-    'l80',
-    'l80,000',
-    'l808',
-    'l835',
-    'l858',
-    'l86th',
-    'l896',
-    'l8e',
-    'l8th',
-    'l8ver',
-    'l9%',
     'l9.95',
-    'l906',
-    'l90p',
-    'l918',
-    'l919',
-    'l93,000,000',
-    'l930s',
-    'l937',
-    'l945',
-    'l949',
-    'l95',
-    'l959&ndash;61',
-    'l963&ndash;7',
-    'l966',
-    'l967',
-    'l970',
     'l974',
-    'l977',
-    'l979',
-    'l989',
-    'l990',
-    'l990s',
-    'l993',
-    'l996',
-    'l999',
-    'l9th-century',
-    'l9xl',
-    'l:4:7',
-    'l:7',
-    'l:and-out',
-    'l:iii',
-    'l:l:2',
     'l=-96&deg',
-    'l=0.1&deg',
-    'l=0.1&ndash;6l',
-    'l=109',
-    'l=342.5&deg',
-    'l=5000',
-    'l=96&deg',
-    'l=flexes',
-    'l=let',
-    'la&iacute;nfiesta',
-    'la&iacute;no',
-    'la&zcaron;ansk&yacute',
-    'la\'',
-    'la-along',
-    'la-de-da-accent',
-    'la-de-das',
     'la-di-dah',
-    'la-mi',
-    'la-roche',
-    'la-roche-sur-yon',
-    'la-tour-du-pin',
-    'la-ver-lee',
-    'la.',
-    'la.true',
-    'la/92',
-    'la/c',
-    'la/ncet',
-    'la/une',
-    'la23',
-    'la3+',
-    'la3amon',
-    'la8',
     'la_mode',
-    'laaa',
-    'laakin',
-    'laanjarv',
-    'laaptac',
-    'laarbruch',
-    'laavin',
-    'lab&eacute',
-    'lab-coats',
-    'lab-ouring',
-    'lab-plant',
-    'lab-work',
-    'lab/ux',
-    'labadi',
-    'labant',
-    'labarbera',
     'labarca',
-    'labarre',
-    'labarte',
-    'labat',
-    'labauvie',
-    'labaye',
-    'labban',
-    'labbe',
-    'labbi',
-    'labbra',
-    'labbu',
-    'labcoat',
-    'labden',
-    'labedan',
-    'label-an',
-    'label-mates',
     'label-surround',
-    'label.the',
-    'label/packaging/advertisements',
-    'label/product',
-    'labeldom',
-    'labeller',
-    'labelless',
-    'labelling.',
-    'labelmate',
-    'labels.the',
-    'labem',
-    'laben',
-    'labeotropheus',
-    'labex',
-    'labi',
-    'labia-like',
     'labialis',
-    'labidocera',
-    'labied',
-    'labille-guiard',
-    'labio-dental',
-    'labirintus',
-    'labisia',
-    'lablatae',
-    'lablogic',
-    'labmaster',
-    'laboa',
-    'labor-force',
-    'labora',
-    'laboratiies',
-    'laboratories-developed',
-    'laboratorio',
     'laboratory-country',
-    'laboratory-equipment',
-    'laboratory-oriented',
-    'laboratory-reared',
-    'laborde/director',
-    'laborem',
-    'laborinho',
-    'laborista',
-    'laboristic',
-    'laboro',
-    'labortory',
-    'labouch&egrave;re',
-    'laboulbenilales',
-    'labour&mdash;consumption',
-    'labour&mdash;pla',
-    'labour&rehy;fianna',
     'labour\'s/shadow',
-    'labour\'very',
-    'labour-(c)',
-    'labour-ashdown',
-    'labour-by',
-    'labour-camp',
-    'labour-cnd',
-    'labour-communist',
-    'labour-component',
-    'labour-costs',
-    'labour-creating',
-    'labour-displacing',
-    'labour-dividing',
-    'labour-effective',
-    'labour-encouraged',
-    'labour-especially',
     'labour-forces',
-    'labour-hoarding',
-    'labour-ite',
-    'labour-law',
-    'labour-left',
-    'labour-lib',
-    'labour-market-clearing',
-    'labour-migration',
-    'labour-protection',
-    'labour-recruiting',
-    'labour-scarcity',
-    'labour-shedding',
-    'labour-style',
-    'labour-supply',
-    'labour-teams',
-    'labour-tory-labour-tory',
     'labour-union',
-    'labour-unionist',
-    'labour-winnable',
-    'labour-won',
-    'labour/conservative',
-    'labour/management',
-    'labour47109522',
-    'laboured-',
-    'labourez',
-    'labouring-boy',
-    'labouring-class',
-    'labourists',
-    'labouroriented',
-    'labourslost',
-    'labourt',
-    'labouti',
     'labovian',
-    'labowit',
-    'labpure',
-    'labra-dormas',
-    'labrador-cross',
-    'labrador-retrievers',
-    'labrador-type',
-    'labrador/boxer',
-    'labradorian',
-    'labradorica',
-    'labridens',
-    'labriola',
-    'labrit',
-    'labro-frontal',
-    'labrok',
-    'labroke',
     'labrus',
-    'labs-derived',
-    'labs-designed',
-    'labs/tivoli',
-    'labs/unix',
-    'labsure',
-    'labsystems',
-    'labtse',
-    'labun',
-    'laburnham',
-    'laburnums',
-    'labuschange',
-    'labyr',
-    'labyrinth-like',
-    'labyrinth-ridged',
-    'labyrinthiformis',
     'labyrinthodont',
-    'lac(91)112',
-    'lac(91)12',
-    'lacaba',
-    'lacandon',
-    'lacanian-influenced',
-    'lacanian-informed',
-    'lacanism',
-    'lacanism\'',
-    'lacayos',
-    'lacaze',
-    'laccadive',
-    'laccaic',
-    'lacco',
-    'laccohee',
-    'laccoliths',
     'lace&rehy;up',
-    'lace-bark',
-    'lace-bordered',
-    'lace-collared',
-    'lace-cover',
-    'lace-covered',
-    'lace-cuffed',
-    'lace-fringed',
-    'lace-fronted',
-    'lace-gushed',
-    'lace-makers',
-    'lace-patterned',
-    'lace-ruffed',
-    'lace-schools',
-    'lace-top',
-    'lace-wing',
     'lace.',
-    'lacecap',
-    'laceless',
-    'lacelike',
-    'lacerbal',
-    'lacerda',
-    'lacerna',
-    'lacertae',
-    'lacessit',
-    'lacetableclothed',
-    'lacewood',
-    'lacey-thompson',
-    'lacey-topped',
-    'lacey/driving',
-    'lach.0/1',
-    'lachana',
     'lachapelle',
-    'lachasse',
-    'lachaud',
-    'lachen',
-    'lachenal',
-    'laches',
-    'lachish',
-    'lachrimatory',
-    'lachrymal',
-    'lachrymans',
-    'lachrymosa',
-    'lachtain',
-    'lacie',
-    'lacies',
-    'lacily',
-    'lacinia.',
     'laciniatae',
-    'laciniated',
-    'laciniatum',
-    'laciniatum/perfoliatum',
-    'laciride',
-    'lack-a-daisy',
-    'lack-a-day',
-    'lack-love',
-    'lack-of',
-    'lack-of-civilisation',
-    'lack-of-closure',
-    'lack-of-conviction',
-    'lack-of-petrol',
-    'lack-of-pulse',
-    'lack-of-pulses',
-    'lack-of-transfer',
     'lack.they',
-    'lack/award',
-    'lack/mother',
-    'lack/rector',
-    'lackadaisicalness',
-    'lackan',
-    'lackawanna',
-    'lacke',
-    'lackenbacher',
-    'lackenby-picton',
-    'lacker',
-    'lackham',
-    'lackies',
-    'lackings',
-    'lackluster',
-    'lackwinder',
     'lackwit',
-    'lacl',
-    'laclaire',
-    'lacle',
-    'laco',
-    'lacome',
-    'lacoude',
-    'lacour-durfort',
-    'lacp',
-    'lacp1',
-    'lacquer-mounted',
-    'lacquer-sprayed',
-    'lacquer-work',
-    'lacquerers',
-    'lacquerwork',
-    'lacretelle',
     'lacrima',
-    'lacrirnae',
-    'lacroixs',
-    'lacrosse-playing',
-    'lacryma',
-    'lacrymal',
-    'lacson',
-    'lactarium',
-    'lacteus',
-    'lactifundio',
-    'lacto',
-    'lacto-ovo-vegetarian',
-    'lactodorum',
-    'lactoferrin-coated',
-    'lactoferrin/anti-lactoferrin',
-    'lactogenic',
     'lactogerrin',
-    'lactor',
-    'lactos',
-    'lactose-free',
-    'lactrile',
-    'lactuca',
-    'lactulose/',
-    'lactulsoe',
-    'lacunaire',
-    'lacustrine-dominated',
-    'lacustrine/marsh',
-    'lacw',
-    'lacy-look',
-    'lacy-patterned',
-    'lacys',
-    'lacz&dgr',
     'laczkowski',
-    'lad-princess',
-    'lad/lass',
-    'ladakhis',
-    'ladbrook',
-    'ladbrooke',
-    'ladder-back',
-    'ladder-bound',
-    'ladder-bridge',
-    'ladder-frame',
-    'ladder-stile.',
-    'ladder-vein',
-    'ladder-way',
-    'ladderlock',
-    'ladderman',
-    'laddermen',
     'ladderway',
-    'laddh',
-    'laddiebuck',
-    'ladeees',
-    'ladeeez',
-    'ladejinsky',
-    'ladened',
-    'lader',
-    'ladetto',
-    'ladeur',
-    'ladeveze',
-    'ladford',
-    'ladh',
-    'ladhope',
-    'ladies-wear',
-    'ladies.p',
     'ladiesware',
-    'ladieswear',
-    'lading-letter',
-    'ladings',
-    'ladispoli',
-    'ladji',
-    'ladle-handle',
-    'ladock',
-    'lados',
-    'ladro',
-    'ladson',
-    'ladusaw',
-    'lady&rehy;wrestler',
-    'lady\'',
-    'lady-boarders',
-    'lady-bug',
     'lady-cleaner',
-    'lady-hypnotist',
-    'lady-mass',
-    'lady-who-does-in-the-garden',
-    'lady-writer',
-    'lady/your',
-    'ladyboyfriend',
-    'ladyboys',
-    'ladybug',
-    'ladyburn',
-    'ladyes',
-    'ladyfoot',
-    'ladygrove',
-    'ladyish',
-    'ladyki',
-    'ladykillies',
     'ladylikeness',
-    'ladys',
-    'ladysmock',
-    'ladysmocks',
-    'ladz',
-    'laeders',
-    'laeger',
-    'laelaps',
-    'laelius',
-    'laemle',
-    'laemmle',
-    'laensar',
-    'laepol',
-    'laeq',
-    'laer',
-    'laert.',
     'laetacaras',
-    'laetae',
-    'laetas',
-    'laetificat',
-    'laevi',
-    'laevigator',
-    'laeviyata',
-    'laevo',
-    'lafan',
-    'lafcadio',
-    'laff-factor',
-    'laff-hungry',
-    'laff-riot',
-    'laffar',
-    'laffargue',
-    'laffert',
     'lafferty/bagendon',
-    'lafferty/bibury',
-    'lafferty/birdlip',
-    'lafferty/blakeney',
-    'lafferty/burghill',
-    'lafferty/burleigh',
-    'lafferty/cirencester',
-    'lafferty/coleford',
-    'lafferty/colwall',
-    'lafferty/corse',
-    'lafferty/dursley',
-    'lafferty/dymock',
-    'lafferty/forest',
-    'lafferty/frampton',
-    'lafferty/innsworth',
-    'lafferty/leominster',
     'lafferty/london',
-    'lafferty/longlevens',
-    'lafferty/lower',
-    'lafferty/madley',
-    'lafferty/malvern/worcestershire',
-    'lafferty/mombasa',
-    'lafferty/moreton-in-marsh',
-    'lafferty/nursing',
-    'lafferty/orleans',
-    'lafferty/paradise',
-    'lafferty/pershore',
-    'lafferty/quedgeley',
-    'lafferty/seven',
-    'lafferty/slad',
-    'lafferty/tidenham',
-    'lafferty/upton',
     'lafferty/wigmore',
-    'laffety',
-    'laffit',
-    'lafis',
-    'lafitau',
-    'laflamme',
-    'lafont',
-    'lafoucri&egrave;re',
-    'lafranca',
-    'lafrance',
-    'lafreniere',
-    'lafta',
-    'lafuma',
-    'lag-ships',
-    'laga',
-    'lagache',
     'lagadec',
-    'lagaillarde',
-    'lagani&egrave;re',
-    'laganiere',
-    'laganisde',
-    'laganon',
-    'lagar',
-    'lagaras',
-    'lagastrella',
-    'lagastrello',
-    'lagavarra',
-    'lagenaria',
-    'lager-and-shouting',
-    'lager-type',
-    'lager/kellys',
-    'lagere',
     'lagerfeld/chanel',
-    'lagergren',
-    'lagerlags',
-    'lagerland',
-    'lagerlout',
-    'lagers.',
-    'lagerung',
-    'lagesse',
-    'lagg',
-    'laggans',
-    'lagh',
-    'laghari',
-    'laghetto',
-    'laghnimi',
-    'laghout',
-    'lagisquet',
     'lagivulin.',
-    'lagjag',
-    'lagle',
-    'lagmore',
-    'lagnano',
-    'lagner&ograve',
-    'lagness',
-    'lagniappe',
-    'lagnier',
-    'lagnuages',
-    'lagny',
-    'lagobolon',
-    'lagodechiana',
-    'lagonda-bentley',
-    'lagoon-style',
-    'lagoonward',
     'lagourgue',
-    'lagrangian',
-    'laguado',
-    'lagubalium',
-    'lague',
-    'laguerre',
-    'lagueruela',
-    'laguiole',
-    'lagumdzija',
-    'lagunes',
-    'lagurus',
-    'lagus',
-    'lagwell',
-    'lah-di-dah',
-    'lahah',
-    'lahana',
     'lahanier',
-    'lahens',
-    'lahiguera',
-    'lahlou',
-    'lahma',
-    'lahmeyer',
-    'lahn',
-    'lahna',
-    'lahofer',
-    'lahore.',
-    'lahoud',
-    'lahual',
-    'lai-fook',
-    'laibach-trieste',
-    'laible',
-    'laibons',
     'laici',
-    'laicize',
-    'laid&mdash;when',
-    'laid-in',
-    'laidlaw-thompson',
-    'laidlaw/oxfordshire',
-    'laidley',
-    'laidlow',
-    'laidon',
-    'laie',
-    'laigap',
-    'laikin',
-    'laikipiak',
-    'lailat',
-    'lailati',
-    'laime/project',
     'laimer',
-    'laimins',
-    'laimonis',
-    'lain-out',
-    'laina',
-    'laine-dempsey',
-    'laines',
-    'laingian',
-    'laingians',
-    'laini',
-    'lainsbury',
-    'lainton',
-    'lainyamok',
-    'laique',
-    'lair.',
-    'laira&ndash;based',
     'lairage',
-    'lairages',
-    'lairigs',
-    'lairiness',
-    'lairn',
-    'lairs-hairv-lunch-vair-soo',
-    'laiss&eacute;s',
-    'laisse',
-    'laisser',
-    'laissez&rehy;faire',
-    'laissez-',
-    'laissez-aller',
-    'laissez-passer',
-    'laissezfaire',
-    'laisteridge',
-    'laiston',
     'laiterie',
-    'laitetti',
-    'laithwaite/ram-raid',
-    'laitiers',
-    'laitues',
-    'laj',
-    'lajeunesse',
-    'laka',
-    'lakato',
-    'lake-arm',
-    'lake-calm',
-    'lake-catchment',
-    'lake-cattle',
-    'lake-edge',
-    'lake-fresh',
-    'lake-sediment',
     'lake/',
-    'lakebound',
-    'lakecomers',
-    'lakedaimonion',
-    'lakedaimonios',
-    'lakehouse',
-    'lakelady',
-    'lakeland/british',
-    'lakelander',
-    'lakelord',
-    'lakelords',
-    'lakemba',
-    'lakenvelders',
-    'lakesmere',
-    'lakh',
-    'lakhani/newsagent',
     'lakhdari',
-    'lakhear',
-    'lakhs',
-    'lakkolith',
-    'lakm&eacute',
-    'lakme',
-    'lakoffian',
-    'lakonian',
-    'lakonians',
-    'lakrivikirana',
-    'lakrori',
-    'lakshman',
-    'lakshme',
-    'lakshminarayanan',
-    'laksmi',
-    'lakspray',
     'laky',
-    'lakya',
-    'lalain',
-    'lalaing',
-    'lalang',
-    'lalanier',
-    'lalatta',
-    'lalaua',
-    'laldenga',
-    'lalika',
-    'lalinde',
-    'lalit',
-    'lalitha',
-    'lalla',
-    'lallans',
-    'lalliam',
     'lallie',
-    'lalls',
-    'lally&rehy;tollendal',
-    'lallygagging',
-    'lalo',
-    'laloux',
-    'lalovi&cacute',
-    'lals',
-    'lalsingh',
-    'lalume',
-    'lam&eacute;-ed',
-    'lam&eacute;-shirted',
-    'lam&eacute;s',
-    'lam&ndash',
-    'lam-1/mel-14',
-    'lama/a',
     'lamacq-style',
-    'lamade',
-    'lamair',
-    'lamaison',
-    'lamalie',
-    'lamarack',
-    'lamarckenis',
-    'lamarclusm',
-    'lamaria',
-    'lamarkian',
-    'lamarov&aacute',
-    'lamaze',
-    'lamb&mdash;so',
-    'lamb\'s-wool-sweatered',
-    'lamb-barrel',
-    'lamb-production',
     'lamb-stealing',
-    'lamb-to-lamb',
-    'lamb-wool',
-    'lamb/christies',
-    'lamb/colin',
-    'lamb/gloucestershire',
-    'lamb/ha',
-    'lambard',
-    'lambarene',
-    'lambart',
-    'lambaste',
-    'lambasts',
-    'lambayeque',
-    'lambchop',
-    'lambda-mu',
-    'lambda-phage',
     'lambda/m13',
-    'lambden',
-    'lambdoid',
-    'lambe/wyvern',
-    'lambeck',
-    'lambeg',
-    'lambently',
-    'lambert-',
-    'lambert-way',
-    'lambert/bentley',
-    'lambert/former',
-    'lambesc',
-    'lambeths',
-    'lambhill',
-    'lambin',
-    'lamblike',
     'lambo',
-    'lambodar',
-    'lamboitepetroleum',
-    'lambok',
-    'lambourghini',
-    'lambourginis',
-    'lambourn-based',
-    'lambourne/system',
-    'lambrate',
-    'lambrecht',
-    'lambrigg',
-    'lambs.john',
-    'lambshill',
-    'lambskins',
-    'lambswater',
-    'lamdin',
     'lamebrain',
-    'lameck',
-    'lamed-vov',
-    'lameere',
-    'lameko',
-    'lamel',
-    'lamelie',
-    'lamellar-like',
-    'lamellibranch',
-    'lamellibranchs',
-    'lamellicorn',
-    'lamen',
-    'lameness&mdash;a',
-    'lamentacions',
-    'lamentationes',
-    'lamentez',
     'lamenti',
-    'lamentin',
-    'lamesley',
-    'lamford',
-    'lamiae',
-    'lamias',
-    'lamiastrum',
-    'lamidey',
-    'lamile',
-    'laminas',
-    'laminate/overlay',
-    'laming&lsqb;00&rsqb',
-    'lamington',
-    'lamininin',
-    'lamins',
-    'laml',
     'lamley',
-    'lammar',
-    'lammergeirs',
-    'lammergeyers',
-    'lammerside',
-    'lammlisbrunnenstrasse',
-    'lamont-brown',
-    'lamont-doherty',
-    'lamont-gregory/inventor',
-    'lamont/chairperson',
-    'lamontable',
-    'lamonte',
-    'lamorall',
-    'lamorisse',
-    'lamorna',
-    'lamot',
     'lamoura',
-    'lamoure',
-    'lamp-boats',
-    'lamp-brackets',
-    'lamp-fishermen',
-    'lamp-holder',
-    'lamp-holders',
-    'lamp-housing',
-    'lamp-man',
-    'lamp-oil',
-    'lamp-pendant',
-    'lamp-shells',
-    'lamp-smudges',
-    'lamp-standard',
-    'lamp-trimmer',
-    'lamp.',
     'lampa',
-    'lampadrio',
-    'lampake',
-    'lampang&ndash;chiang',
-    'lamparski',
-    'lampass',
-    'lampbases',
-    'lampblack',
-    'lampbrush',
-    'lampe',
-    'lamperti',
-    'lampes',
-    'lampeter/liverpool',
-    'lampett',
-    'lampholes',
-    'lampiao',
     'lampl-de-groot',
-    'lamplaugh',
-    'lampless',
-    'lamplighting',
-    'lamplughs',
-    'lampo',
-    'lampodetonmiocenic',
-    'lampon',
-    'lampong',
-    'lamports',
-    'lamppost.',
-    'lamprecht',
-    'lamprell',
-    'lampridius',
-    'lamproitic',
-    'lampromyia',
     'lamprophyres',
-    'lamps-tail',
-    'lamptrai',
-    'lampue',
-    'lampuki',
-    'lamrock',
-    'lamstor',
-    'lamumba',
-    'lamuni&egrave;re',
-    'lamworth',
-    'lan&rehy;caster',
-    'lan&rehy;kan-born',
-    'lan\'lord',
-    'lan-attached',
-    'lan-specific',
-    'lan-station',
     'lan/man',
-    'lan/wan',
-    'lanacka',
-    'lanae',
-    'lanagan',
-    'lanaken',
-    'lanao',
-    'lanaquarelle140lb',
-    'lanarkshire-based',
-    'lanarkshire.',
-    'lanarkshire/ayrshire',
-    'lanaud',
-    'lanavoi',
-    'lancarfan',
-    'lancashire-accented',
-    'lancashire-north-of-the-sands',
     'lancashire-yorkshire',
-    'lancashire/wildfowl',
-    'lancashireness',
-    'lancashshire',
-    'lancaster\'',
-    'lancaster-',
-    'lancaster-easegill',
-    'lancaster-leeds',
-    'lancaster-oslo/bergen',
-    'lancaster/oslo-bergen',
-    'lancasterian',
-    'lancastienses',
-    'lancaston',
-    'lancastria',
-    'lancastrian-in-exile',
-    'lance-length',
     'lance-throwing',
-    'lance/corporal',
-    'lancehead',
-    'lancelet-like',
-    'lancelet-shape',
-    'lanceloata',
-    'lancelot&mdash;guinevere',
-    'lancelott',
-    'lancet&rehy;pointed',
-    'lancet-arched',
-    'lancet/',
-    'lancewood',
-    'lanchashire',
-    'lancheck',
-    'lancher',
-    'lanches',
     'lanchner',
-    'lanchonete',
-    'lancia-ferrari',
-    'lancia.',
-    'lancien',
-    'lancity',
-    'lancker',
-    'lancro',
-    'lancs-railway',
-    'land&aacute;zuri',
-    'land&mdash;adjudication',
-    'land&mdash;application',
-    'land&rehy;lords',
-    'land&rehy;mark',
-    'land&rehy;owning',
-    'land&rehy;slipping',
     'land-acquisition',
-    'land-air',
-    'land-allocation',
-    'land-and-air',
-    'land-and-water',
-    'land-animals',
-    'land-art',
-    'land-assembly',
-    'land-bird',
-    'land-breeze',
-    'land-claim',
-    'land-conflict',
-    'land-controlling',
-    'land-crab',
-    'land-crabs',
-    'land-dealers',
     'land-distribution',
-    'land-drains',
-    'land-dues',
-    'land-exploring',
-    'land-fills',
-    'land-forming',
-    'land-forms',
-    'land-going',
-    'land-grab',
-    'land-grabs',
-    'land-grass',
-    'land-hoarder',
-    'land-improvement',
-    'land-intensive',
-    'land-leases',
-    'land-line',
     'land-lubber',
-    'land-mapping',
-    'land-market',
-    'land-mined',
-    'land-miss',
-    'land-mobile',
-    'land-occupation',
-    'land-occupations',
-    'land-of-the-free',
-    'land-officers',
-    'land-prepared',
-    'land-quality',
-    'land-reclaimer.',
-    'land-reclaimers',
-    'land-reclamation',
-    'land-redistribution',
     'land-reform',
-    'land-requiring',
-    'land-rights',
-    'land-sales',
-    'land-sea',
-    'land-settling',
-    'land-shortage',
-    'land-snatch',
-    'land-surfaces',
-    'land-survey',
-    'land-tax',
-    'land-the',
-    'land-usage',
-    'land-weathered',
-    'land-workers',
-    'land-working',
     'land.',
-    'land.l',
-    'land.the',
-    'land/4m',
-    'land/building',
-    'land/buildings',
-    'land/open',
-    'land/range',
-    'land/unhcr',
-    'landale',
-    'landbeach',
-    'landbirds',
-    'landborne',
-    'landbound',
-    'landcorp',
-    'landed-as',
     'landed.',
-    'landegfahr',
-    'landelijke',
-    'landels',
-    'landen',
-    'landenbau',
-    'landercy',
-    'landesarbeitsamt',
-    'landesgericht',
-    'landesgerniende',
-    'landeshauptmann',
-    'landesk/openview',
-    'landeskarte',
-    'landesmann',
-    'landesring',
-    'landessender',
     'landeur',
-    'landfight',
-    'landfill.',
-    'landful',
-    'landgasthof',
-    'landgericht',
-    'landgraaf',
-    'landgraf',
-    'landhurst',
-    'landie',
-    'landies',
-    'landim',
-    'landing-',
-    'landing-craft',
-    'landing-fees',
-    'landing-gear',
     'landing-pier',
-    'landing-points',
-    'landing-ramp',
-    'landini',
-    'landivar',
-    'landl',
-    'landlady/lodger',
-    'landler',
-    'landlocking',
-    'landlor',
-    'landlord&mdash;peasant',
-    'landlord&mdash;serf',
-    'landlord&mdash;tenant',
-    'landlord-citizens',
-    'landlord-entrepreneurs',
-    'landlord-influence',
     'landlord-led',
-    'landlord-peasants',
-    'landlord.',
-    'landlord/',
-    'landlord/developer',
-    'landlords/',
-    'landlords/commission',
-    'landlords/landladies',
-    'landlordship',
-    'landlower',
-    'landlubbing',
-    'landman',
-    'landmann',
-    'landmarket',
-    'landmarking',
-    'landmarks&mdash',
     'landorin',
-    'landover',
-    'landowers',
-    'landowner-peasant',
-    'landowner.we',
-    'landowners&mdash',
-    'landowners&mdash;of',
-    'landowners/occupiers',
-    'landport',
-    'landr&auml;te',
-    'landrangers',
-    'landrum-griffin',
-    'landryexternal',
-    'lands-berger',
-    'lands-next-door-making-a-racket',
-    'lands.',
     'landsacapes',
-    'landsale',
-    'landsat-1',
-    'landsat-5',
-    'landsbank',
-    'landsberger',
-    'landsborough',
-    'landscape&mdash;it',
-    'landscape-abstractionists',
-    'landscape-as-real-estate',
-    'landscape-conscious',
-    'landscape-forming',
-    'landscape-gardening',
-    'landscape-inspired',
-    'landscape-mode',
-    'landscape-movement',
     'landscape-orientated',
-    'landscape-sensitive',
-    'landscape-space',
-    'landscape-this',
-    'landscape/nature',
-    'landscapes-oils',
-    'landscapes-pastels',
-    'landscapes.',
-    'landscapes/',
-    'landscapey',
-    'landschape',
-    'landseers',
-    'landsend',
-    'landsford',
-    'landsgemeinde&mdash',
-    'landships',
     'landsknecht',
-    'landsliding',
-    'landsmen',
-    'landsorganisasjonen',
-    'landsorganisationen',
-    'landsports',
-    'landsstryrid',
-    'landsstyrid',
-    'landsteiner-levine',
-    'landsturm',
-    'landsurfer',
-    'landthe',
-    'landu',
-    'landudno',
-    'landwaiters',
-    'landwirtschaftskammer',
     'lane-dodging',
-    'lane-end',
-    'lane-ends',
-    'lane-fox',
-    'lane/',
-    'lane/consultant',
-    'lane/cowards',
-    'lane/strawberry',
-    'lane/taxi',
-    'lane/ultra',
-    'lane/work',
-    'lane1',
-    'lane11',
-    'lanecrossing',
-    'lanerchymedd',
-    'lanerossi',
     'lanes.6',
-    'lanes1&ndash;4',
-    'lanethorpe',
-    'lanfairpwll',
-    'lanfill',
-    'langabrugh',
-    'langanes',
-    'langanky',
-    'langara',
-    'langard',
-    'langauage',
-    'langauages',
-    'langbaine',
-    'langbaugh',
-    'langburgh',
-    'langcaster',
     'langchao',
-    'langcombe',
-    'langdon-fox',
-    'langdon/actor',
-    'langdon/tandy',
-    'langeais',
-    'langee',
-    'langelegh',
-    'langella',
-    'langenau',
-    'langenbrink',
-    'langenderfer',
-    'langendries',
-    'langenkamp',
-    'langenmantel',
-    'langensalza',
     'langereche',
-    'langes',
-    'langestraat',
-    'langete',
-    'langewj',
-    'langford/cyclist',
-    'langford/gloucestershire',
-    'langford/peggy',
-    'langhame',
-    'langhan',
-    'langhans',
-    'langhans\'-type',
-    'langhill',
-    'langholtz',
-    'langj&ouml;kull',
-    'langlade',
     'langloan',
-    'langnau-im-emmental',
-    'langnitschke',
-    'langobards',
-    'langoiran',
-    'langold',
-    'langon',
-    'langoor',
-    'langorous',
-    'langoustine-flavoured',
-    'langrand',
-    'langrange',
-    'langreder',
-    'langrenn',
-    'langrex',
-    'langrick',
     'langrish',
-    'langsale',
-    'langsett',
-    'langsfords',
-    'langshanks',
-    'langskaill',
-    'langsley',
-    'langstaff',
-    'langstaff/head',
-    'langstaffe',
-    'langstrasse',
-    'langstrothdale',
-    'langtang',
-    'langthorn',
-    'langtom',
-    'langtry-langton',
     'language&mdash;but',
-    'language&mdash;for',
-    'language&rehy;users',
-    'language&rehy;utterance',
-    'language(pmdl)',
-    'language-\'the',
-    'language-95%',
-    'language-collecting',
-    'language-crossing',
-    'language-cum-posture',
-    'language-delayed',
-    'language-disordered',
-    'language-export',
-    'language-family',
-    'language-focussed',
-    'language-groups',
     'language-in-use',
-    'language-learner',
-    'language-material',
-    'language-mediated',
-    'language-mixing',
-    'language-or',
-    'language-orientated',
-    'language-oriented',
-    'language-planning',
-    'language-producers',
-    'language-strata',
-    'language-structure',
-    'language-talk',
-    'language-teacher',
-    'language-transmitted',
-    'language-work',
     'language/ethnicity',
-    'language/presentation',
-    'language/script',
-    'language_at',
-    'languages:dutch',
-    'languages:english',
-    'languageusing',
-    'languedoc-roussillon',
-    'languedoc/roussillon',
-    'languedocian',
-    'languedocians',
-    'languir',
-    'languysch',
-    'langwood',
-    'langwyth',
-    'langyng',
     'lanhowell',
-    'lanigan',
-    'lanigerum',
-    'lanika',
-    'lanino',
-    'lanistes-dwellers',
-    'lanistes-dwelling',
-    'lanivet',
-    'lank-haired',
-    'lanka&rehy;born',
-    'lanka\'',
-    'lanka/maldives',
-    'lankcombe',
-    'lankelly',
-    'lankheit',
-    'lankily',
     'lankreijer',
-    'lanks',
-    'lanlivery',
-    'lanlord',
-    'lanly',
-    'lanmanager',
-    'lannan',
-    'lanne',
-    'lannea',
-    'lannes',
-    'lannet',
-    'lanney/daughter',
-    'lanning/civil',
-    'lannog',
-    'lannoy',
-    'lannoye',
     'lanntair',
-    'lano',
-    'lanquest',
-    'lanre',
-    'lansa',
-    'lansallos',
-    'lansbergis',
-    'lansbury.',
-    'lansburys',
-    'lansdale',
-    'lansdell',
-    'lanseh',
-    'lanser',
-    'lansight',
-    'lansium',
-    'lanskey',
     'lanso',
-    'lanssa',
-    'lanstastic',
-    'lanstation',
-    'lanstreamer',
-    'lantbert',
-    'lanter',
-    'lantern-horns',
-    'lantern-illuminated',
-    'lantern-light',
-    'lantern-lit',
-    'lanternist',
-    'lanternists',
-    'lanterns/floodlights',
-    'lanting',
-    'lantonment',
     'lantor',
-    'lantos',
-    'lantyan',
-    'lanuf',
-    'lanum',
-    'lanworkplace',
-    'lanxade',
-    'lany',
-    'lanzas',
-    'lanze',
-    'lanzear',
-    'lanzenhof',
-    'lanzhou.',
-    'lanzi',
-    'lanzin',
-    'lao-tze',
     'lao-us',
-    'laoder',
-    'laodicea',
-    'laodikeia',
-    'laogai',
-    'laogh',
-    'laoghal',
-    'laoghire',
-    'laohapairojn',
-    'laoirinn',
-    'laokay',
-    'laoli',
-    'laomaye',
-    'laon-reims',
-    'laore',
-    'laoretti',
     'laos-thailand',
-    'laou',
-    'laoual',
-    'laouali',
-    'laoussine',
-    'laow',
-    'lap&rehy;dogs',
-    'lap-boarding',
-    'lap-by-lap',
-    'lap-lap-lap',
-    'lap-link',
-    'lap-m',
-    'lap-of-luxury',
-    'lap-slide',
-    'lap-tops',
-    'lap-type',
     'lap/split',
-    'lapacoho',
-    'lapalme',
-    'lapang',
-    'laparoscopies',
-    'laparotmy',
-    'laparotomies',
-    'lapathum',
-    'lapel-badges',
-    'lapers',
-    'lapeyra',
-    'lapful',
-    'lapi&eacute;rouse',
-    'lapicero',
-    'lapicidae',
-    'lapidaric',
     'lapidaris',
-    'lapidarium',
-    'lapidarius',
-    'lapidarizing',
-    'lapidated',
-    'lapidaverunt',
-    'lapies',
-    'lapillius',
-    'lapillus.',
-    'lapine',
-    'lapiner',
-    'lapis-lazuli',
-    'lapithae',
-    'lapkin',
-    'laplagrene',
-    'laplanche',
     'laplante',
-    'lapley',
-    'laplinking',
-    'laporoscopy',
-    'laporte-forbidden',
-    'laportea',
-    'lappaj&acirc;rvi',
-    'lappel',
-    'lappers',
-    'lappingford',
-    'lappings',
-    'lapr',
-    'laprimaudaye',
-    'laproscropes',
-    'lapse-rates',
-    'lapsecure',
     'lapsus',
-    'lapsy',
-    'lapthorne',
-    'lapuerta',
-    'lapurdum',
-    'lapwing-like',
-    'lapwings.',
-    'lapworth/director',
-    'lapworth/technical',
-    'lapyx',
-    'laquelle',
-    'larachantivore',
-    'larad',
-    'laramide',
-    'larbash',
-    'larbeit',
     'larboard',
-    'larby',
-    'larcenous',
-    'larchlap',
-    'larcker',
-    'larcom',
-    'larcombe',
-    'lard-coloured',
-    'lard-like',
-    'lard-rock',
-    'lard-slice',
-    'lardbuckets',
-    'lardeau',
-    'larded-on',
-    'larder&mdash;let',
-    'larder-work',
     'lardiness',
-    'lardizabal',
-    'lardner-bruke',
-    'lardong',
-    'lare/es',
-    'laredello',
-    'larege',
-    'larende',
-    'larens',
-    'larentiu',
-    'larenty',
-    'larf',
-    'larg',
-    'largactyl',
-    'largalinny',
-    'large&mdash;if',
     'large&ndash;print',
-    'large&rehy;angled',
-    'large&rehy;sized',
-    'large-area',
-    'large-armchair',
-    'large-bellied',
-    'large-bodied',
-    'large-brimmed',
-    'large-circulation',
-    'large-core',
-    'large-eared',
-    'large-faced',
-    'large-field',
-    'large-footed',
-    'large-frame',
-    'large-gauge',
     'large-hearted',
-    'large-ish',
-    'large-leafed',
-    'large-leaved',
-    'large-limbed',
-    'large-memory',
-    'large-mouthed',
-    'large-necked',
-    'large-nosed',
-    'large-or',
-    'large-ranching',
-    'large-range',
-    'large-sale',
-    'large-scaled',
-    'large-seeded',
-    'large-sounding',
     'large-surfaced',
-    'large-town',
-    'large-type',
-    'large-village',
-    'large-vocabulary',
-    'large-wheeled',
-    'large-windowed',
-    'large.',
-    'largehole',
-    'largeish',
-    'largely-aborted',
-    'largely-attended',
-    'largely-conscious',
-    'largely-departed',
-    'largely-hidden',
-    'largely-illiterate',
     'largely-oxbridge',
-    'largely-quantitative',
-    'largely-rural',
-    'largely-separate',
-    'largely-urban',
-    'largened',
-    'larger-sample',
-    'larger-share',
-    'larger-than-life-sized',
-    'larger-than-natural',
-    'larger-than-normal',
-    'larger-than-screen',
-    'larger/more',
-    'largesce',
-    'largesse-money',
-    'largesses',
     'largest-brained',
-    'largest-capacity',
-    'largest-fanged',
-    'largest-is-smallest',
-    'largest-known',
-    'largest-remaining',
-    'largestsubunit',
-    'larget',
-    'largets',
-    'largie',
-    'largilli&egrave;re',
-    'largilliere',
-    'largs-based',
-    'largs-bound',
-    'lariboisi&egrave;re',
-    'laridae.',
     'larijani',
-    'larin',
-    'larinae',
-    'larine',
-    'larissae',
-    'larive',
-    'larivi&egrave;re',
-    'larix',
-    'lark\'-like',
-    'lark-peaks',
-    'larke',
-    'larkham',
-    'larkham/formerly',
-    'larkin/hoople',
-    'larkin/meteors',
-    'larkmead',
     'larkscliff',
-    'larksdenne',
-    'larksong',
-    'larling',
-    'larly',
-    'larman',
-    'larminat',
-    'larming',
-    'larne&ndash;stranraer',
-    'larne-belfast',
-    'larne-cairnryan',
-    'larning',
-    'larochfoucauld',
-    'larose',
-    'larosse',
-    'larouge',
     'laroya',
-    'larpool',
-    'larra',
-    'larracoechea',
-    'larrad',
-    'larragy',
-    'larraona',
-    'larrazabal',
-    'larretta',
-    'larretxea',
-    'larrie',
-    'larrikinism',
-    'larriston',
-    'larrousse-lola',
-    'larrson',
-    'larrue',
     'larruped',
-    'larrys',
-    'lars-boerje',
-    'larschla',
-    'larsen-freeman',
-    'larsen/jensen',
-    'larssen',
-    'larssons',
-    'larswerner',
-    'lartin/worcestshire',
-    'larua',
-    'larval-stage',
-    'larvatus',
-    'larvicides',
-    'larvik',
-    'larwoods',
     'larx',
-    'larygeus',
-    'laryngography',
-    'laryngoscopic',
-    'laryngostomy',
-    'larzac',
-    'las-cannon',
-    'las-pulses',
-    'lasagnas',
-    'lasantha',
-    'lasaulx',
-    'lasbeams',
-    'lascaigh',
-    'lascannon',
-    'lascari',
-    'lascaris',
     'lasce',
-    'lascivissimo',
-    'lasco',
-    'lased',
-    'lasegue',
-    'laser-beams',
-    'laser-blue',
-    'laser-engraved',
-    'laser-etched',
-    'laser-fried',
-    'laser-light',
-    'laser-lights',
-    'laser-painted',
-    'laser-programmed',
-    'laser-quality',
-    'laser-ranging',
     'laser-read',
-    'laser-rifle',
-    'laser-scan',
-    'laser-scattering',
-    'laser-style',
-    'laser-tissue',
-    'laser.',
-    'laseraze',
-    'laserbolt',
-    'laserboost',
-    'laserboot',
-    'lasercel',
-    'laserdisc',
-    'laserfair',
-    'lasergo',
-    'laseria',
     'laserlove',
-    'lasermedia',
-    'laserna',
-    'laserprinter',
-    'laserpro',
-    'laserscan',
-    'lasersharp',
-    'lasershooting',
-    'lasest',
-    'lasestein',
-    'lasgo',
-    'lash-out',
-    'lash-stitched',
-    'lash-ups',
-    'lashan',
-    'lashbuilding',
     'lashed-up',
-    'lashing.',
-    'lashkari',
-    'lashmere',
-    'lasht',
-    'lashthickening',
-    'lashworm',
-    'lasing.',
-    'lasinio',
-    'lasiocarpa',
-    'lasiocarpus',
-    'lasiommata',
-    'lasiommosta',
-    'laskill',
-    'laskin',
-    'laskovo',
     'laskys',
-    'laslett/chairman',
-    'lasm',
-    'lasmacs',
-    'lasmas-iresco-cnrs',
-    'lasmo-backed',
-    'lasmo-operated',
-    'lasmo1s',
-    'lasocarpium',
-    'lasok',
-    'lasooed',
-    'lass&egrave;re',
-    'lassaigne',
-    'lassale',
-    'lassane',
-    'lassarat',
     'lassavette',
-    'lassberg',
-    'lassegueinformation',
-    'lassia',
-    'lassiter.',
-    'lasson',
-    'lassoo',
-    'lassooed',
-    'lassoon',
-    'lassou',
-    'lassu',
-    'lasswellian',
-    'lassy',
-    'last&mdash',
-    'last&rehy;wicket',
-    'last\'',
     'last-act',
-    'last-among-equals',
-    'last-ball',
-    'last-breath-of-a-dying',
-    'last-century',
-    'last-comers',
-    'last-day-of-peace',
-    'last-eight',
-    'last-end',
-    'last-flight',
-    'last-four',
-    'last-gate',
-    'last-grasp',
-    'last-in',
-    'last-kick',
-    'last-known',
     'last-lap',
-    'last-leg',
-    'last-lick',
-    'last-like',
-    'last-making',
-    'last-match',
-    'last-moment',
-    'last-move',
-    'last-named\'',
-    'last-night-of-the-prommers',
-    'last-of-the-summer-wine',
-    'last-period',
-    'last-race',
-    'last-received',
-    'last-reel',
-    'last-six-colours',
     'last-swimming',
-    'last-time',
-    'last-time-leave',
-    'last-to-be-colonized',
-    'last-to-first',
-    'last-year',
-    'last.crash',
-    'last/director',
-    'last/pace',
-    'lastable',
-    'laste',
-    'lastes',
-    'lastest',
-    'lastilaivan',
-    'lasting.',
-    'lastingness',
     'lastmonday',
-    'lastours',
-    'lastovka',
-    'lastovo',
-    'lasts&mdash;or',
-    'lasya',
-    'lat-ent',
-    'lat.53&deg;20\'n',
-    'lat/long-lop',
-    'latadas',
-    'latapie-flurin',
-    'latasha',
-    'latasi',
-    'latc',
-    'latch-like',
-    'latchcords',
     'latchet',
-    'latchstring',
-    'late&ndash;night',
-    'late&rehy;morning',
-    'late-\'70s',
-    'late-\'75',
-    'late-\'76',
-    'late-15th',
-    'late-17th-century',
-    'late-1935',
-    'late-1940s',
-    'late-1950s',
-    'late-1970',
-    'late-1977',
-    'late-1980',
-    'late-1988',
     'late-19th',
-    'late-antique',
-    'late-arriving',
-    'late-august',
-    'late-autumn',
-    'late-baroque',
-    'late-beethoven',
-    'late-blooming',
-    'late-booking',
-    'late-braking',
-    'late-business',
-    'late-caledonian',
-    'late-capitalist',
-    'late-career',
-    'late-classical',
-    'late-club',
     'late-coming',
-    'late-cycle',
-    'late-developer',
-    'late-developers',
-    'late-developing',
-    'late-devensian',
-    'late-eleventh',
-    'late-eleventh-century',
-    'late-elizabethan',
-    'late-era',
-    'late-feudal',
-    'late-fifteenth-century',
-    'late-fifth-',
-    'late-fifties',
-    'late-fifties/early-sixties',
-    'late-fifties/sixties',
     'late-filing',
-    'late-formed',
-    'late-fourteenth-century',
-    'late-fourth-',
-    'late-hitting',
-    'late-hour',
-    'late-imperial',
-    'late-in-the-day',
-    'late-industrial',
-    'late-july',
-    'late-june/july',
-    'late-landed',
-    'late-leaching',
-    'late-march',
-    'late-marrying',
-    'late-middle',
     'late-miocene',
-    'late-moving',
-    'late-nineteenth-and',
-    'late-offer',
-    'late-order',
-    'late-paying',
-    'late-payment',
-    'late-post-glacial',
-    'late-returning',
-    'late-ripening',
-    'late-rococo',
-    'late-romanticism',
-    'late-secondary',
-    'late-seventeenth-century',
-    'late-shift',
-    'late-starter',
     'late-starters',
-    'late-sunday',
-    'late-tackled',
-    'late-tackling',
-    'late-teens',
-    'late-tenth-century',
-    'late-term',
-    'late-third/early-fourth',
-    'late-triassic',
-    'late-turner',
-    'late-type',
-    'late-week',
-    'late/early',
-    'late/go',
-    'late1960s',
-    'late1980s',
     'latebooking',
-    'latecome',
-    'latecoming',
-    'lated',
-    'lateen-sail',
-    'lateglacial',
-    'lateish',
-    'latelamented',
-    'latelier',
-    'laten',
-    'latency.',
-    'latent-learning',
-    'lateorder',
-    'later&mdash;the',
-    'later\'',
-    'later-',
     'later-1980s',
-    'later-canonised',
-    'later-day',
-    'later-developing',
-    'later-drilled',
-    'later-eighteenth',
-    'later-formed',
-    'later-learned',
-    'later-life',
-    'later-notorious',
-    'later-occurring',
-    'later-probably',
-    'later-second',
-    'later-several',
-    'later-successional',
-    'later-that',
     'later.and',
-    'later.the',
-    'lateral-line',
-    'lateral-thinking',
-    'lateralization',
-    'laterally-continuous',
-    'laterally-growing',
-    'lateranense',
-    'laterano',
-    'latere',
-    'laterilisation',
-    'lateritic',
-    'lateritised',
-    'laterlie',
-    'laterly',
-    'latero',
     'laterolog/micro-spherically',
-    'laterosternites',
-    'latesaver',
-    'latest-issue-in-file&lsqb;file',
-    'lateste',
-    'latex-backed',
-    'latex-coated',
-    'lateyn',
-    'latfwala',
-    'lath-back',
-    'latha',
-    'lathallan',
-    'lathams',
-    'lathan',
-    'lathbury',
-    'lathe-turned',
     'lathe-turner',
-    'lathe.i',
-    'lather-up',
-    'latherham',
-    'lathery',
-    'lathi',
-    'lathis',
-    'lathkilldale',
-    'lathlean',
-    'lathrop',
-    'lati&lsqb;tude&rsqb',
-    'laticework',
-    'latifola',
-    'latifolius',
-    'latifundios',
-    'latifundists',
     'latimor',
-    'latin\'',
-    'latin-',
-    'latin-america',
-    'latin-celtic',
-    'latin-derived',
-    'latin-ethnic-rock',
-    'latin-influenced',
-    'latin-lovers',
-    'latin-ness',
-    'latin-speakers',
-    'latin-texted',
-    'latines',
-    'latinisms',
-    'latinization',
-    'latinize',
     'latino-americano',
-    'latino-anglo',
-    'latinoamericana',
-    'latinskaia',
-    'latior',
-    'latirel',
-    'latitudes.the',
-    'lative',
-    'latkis',
-    'latkowski/novice',
-    'latkowsky',
-    'latlogan',
-    'latona',
-    'latorre',
-    'latouche',
-    'latouka',
     'latour-maubourg',
-    'latow',
-    'latrabjarg',
-    'latrodectism',
-    'latrogenic',
-    'latrone',
-    'latronic',
-    'latsami',
-    'latt',
-    'latt.',
-    'lattakia',
-    'latter-they',
-    'latter.60',
-    'latterbarrow',
-    'lattes',
-    'latti',
     'lattice-frame',
-    'lattice-frameworks',
-    'lattice-print',
-    'lattice-theoretic',
-    'lattisbeaudire',
-    'lattishub',
-    'lattisring',
-    'lattisviews',
-    'latvia&mdash;latvijas',
-    'latvia&mdash;recognized',
-    'latvian-recruited',
-    'latyne',
-    'latzelberger',
-    'lauan',
-    'laubade',
-    'laubrich',
     'lauchlane',
-    'lauck',
-    'lauda-air',
-    'lauda-singing',
-    'laudamus',
-    'laudese',
-    'laudesman',
-    'laudianism',
-    'laudibus',
-    'laudnum',
-    'laue-langevin',
-    'laue-paul',
-    'lauenberg',
-    'laufbahngruppen',
-    'laufen',
-    'laufs',
     'laugardagr',
-    'laugerson',
-    'laugesen',
-    'laugeson',
-    'laugh-',
-    'laugh-a-second',
-    'laugh-behind-your-hands',
-    'laugh-hole',
-    'laugh-on',
-    'laugham',
-    'laughaminute',
-    'laughing-dislikes',
-    'laughing-eyed',
-    'laughing-with',
-    'laughingstock',
-    'laughingstocks',
     'laught',
-    'laughter&mdash',
-    'laughter-freezingly',
-    'laughter-line',
-    'laughter-lined',
-    'laughter-maker',
-    'laughter-stimulation',
-    'laughter-wise',
-    'laughter/',
-    'laughter/explosions',
-    'laughter/jokes/laughter/jokes',
-    'laughterless',
-    'laughtermaker',
-    'laughy',
-    'lauingen',
-    'lauitzer',
     'lauka',
-    'lauko',
-    'lauloa',
-    'laun',
-    'launch-aid',
-    'launch-and-leave',
-    'launchd',
-    'launched/after',
-    'launching/landing',
-    'launde',
-    'laundromatte',
-    'laundry-steam',
-    'laundry/boiler',
-    'laundrywork',
-    'launey',
-    'launjrette',
     'laupacis',
-    'laur&eacute;n',
-    'laur-prunella',
-    'laura\'a',
-    'laurana',
-    'laurasi',
-    'laureano',
-    'laurel-black',
-    'lauren&ccedil;o',
-    'laurencekrik',
-    'laurencetown',
-    'laurencinus',
-    'laurencio',
-    'laurenson',
-    'laurent-',
-    'laurent-designed',
     'laurent-ploemel',
-    'laurent.',
-    'laurenti',
-    'laurentia',
-    'laurentians',
-    'laurentii',
-    'laurentiis',
-    'lauresheim',
-    'lauret',
-    'laureus',
-    'laurhibar',
-    'lauria',
-    'lauricatus',
-    'laurien',
-    'lauriergracht',
-    'lauries',
     'laurin-guilloux-buffetaud-tailleur',
-    'laurina',
-    'laurinda',
-    'lauriot',
-    'lauris',
-    'lauritzen',
-    'lauritzsen',
-    'laurium',
-    'laurocerasus',
-    'laursen',
-    'laurustines',
-    'lauryldimethyl',
-    'lausanne-trained',
-    'lauson',
-    'laustsen',
-    'lautenbach',
     'lautensack',
-    'lautern',
-    'lauterwasser',
-    'lautreamontesque',
-    'lautrecs',
-    'lauwersoog',
-    'laux',
-    'lauzeta',
-    'lauzier',
-    'lav&eacute;ra',
-    'lava-carved',
-    'lava-filled',
-    'lava-strewn',
-    'lavabo',
-    'lavaforms',
-    'laval-like',
     'lavalas',
-    'lavale',
-    'lavals',
-    'lavamat',
-    'lavandaia',
-    'lavande',
-    'lavandou',
-    'lavandula',
-    'lavandulaceus',
-    'lavarsi',
-    'lavasseur',
-    'lavastre',
-    'lavatch',
-    'lavatory-gothic',
-    'lavatory-legs',
-    'lavatory-pan',
     'lavault',
-    'lavazza',
-    'lave-net',
-    'lave-nettin\'',
-    'lavedan',
-    'laveissiere',
-    'lavelanet',
-    'laveleye',
-    'laven',
-    'lavender-and-white-striped',
-    'lavender-flowered',
-    'lavender-green',
-    'lavender-grey',
-    'lavender-scented',
-    'lavendered',
-    'lavendery',
     'lavengro',
-    'lavera',
-    'laverack',
-    'laveran',
-    'laverick',
-    'lavering',
-    'lavern',
-    'laverse',
-    'laverys',
-    'lavinium',
-    'lavis',
-    'lavishly-endowed',
-    'lavishly-packaged',
-    'lavishly-produced',
-    'lavorato',
-    'lavoslav',
     'lavradores',
-    'lavranchuk',
-    'lavris',
-    'lavrovsky',
-    'lavrushinsky',
-    'lavski',
-    'lavu',
-    'lavyne',
-    'law&lsqb;y&rsqb;er',
-    'law&mdash;the',
-    'law(s)',
-    'law-80',
-    'law-abiders',
-    'law-abidingly',
-    'law-abidingness',
-    'law-adjudication',
     'law-based',
-    'law-bender',
-    'law-books',
-    'law-bound',
-    'law-case',
-    'law-changing',
-    'law-confinement',
-    'law-creating',
-    'law-creation',
-    'law-dominated',
-    'law-economics',
-    'law-enforcing',
-    'law-free',
-    'law-implementation',
-    'law-machine',
-    'law-maintenance',
     'law-namely',
-    'law-oriented',
-    'law-reform',
-    'law-related',
-    'law-school',
-    'law-village',
-    'law.150&mdash;in',
-    'law.2',
-    'law.it',
-    'law/outlaw',
-    'law/oxford',
-    'law/parish',
-    'law/son',
-    'law533',
-    'lawagetas',
-    'lawal',
     'lawcourt',
-    'lawday',
-    'lawefield',
-    'lawenham',
-    'lawfeldt',
-    'lawfully-established',
-    'lawfyl',
-    'lawgivers',
-    'lawgiving',
-    'lawhead',
-    'lawheads',
-    'lawick',
-    'lawji',
-    'lawley/kenny',
-    'lawn-adornment',
-    'lawn-meadow',
     'lawn-sprinkler',
-    'lawn-sprinkling',
-    'lawn-watering',
-    'lawnet',
-    'lawnmakers',
-    'lawnrake',
-    'lawpoint',
-    'lawrance/raf',
-    'lawrel',
-    'lawrence\'',
-    'lawrence-great',
-    'lawrence-price',
-    'lawrence/british',
-    'lawrence/england',
-    'lawrence/fast',
-    'lawrence/mother',
     'lawrence/neighbour',
-    'lawrence/oxford',
-    'lawrence/retired',
-    'lawrence/tccb',
-    'lawrence/test',
-    'lawrencefield',
-    'lawrenceson',
-    'lawrencian',
-    'lawrinson',
-    'lawrnce',
-    'laws\'',
-    'laws-giver',
-    'laws.the',
-    'lawsaffecting',
-    'lawson(1980)',
-    'lawson-made',
     'lawson/greens',
-    'lawsonia',
-    'lawsoniana',
-    'lawsonii',
-    'lawsuit.',
-    'lawtex',
-    'lawthorne',
-    'lawton-mijatovi&cacute',
-    'lawtons',
-    'lawyer&rehy;freeholder',
-    'lawyer-freeholders',
-    'lawyer-influenced',
-    'lawyer-like',
-    'lawyer-manager',
-    'lawyer-mps',
-    'lawyer-priest',
     'lawyer-psychiatrist',
-    'lawyer-seneschals',
-    'lawyer-statesman',
-    'lawyer-stood',
-    'lawyer-turned-journalist',
-    'lawyer/economist',
-    'lawyer/witness',
-    'lawyerism',
-    'lawyers-turned-smallholders',
-    'lawyers/stephenson',
-    'laxa&rehy;tives',
-    'laxdaela',
-    'laxenburg',
-    'laxenoxen',
-    'laxing',
-    'laxley',
     'laxoberon',
-    'laxolt',
-    'laxtons',
-    'lay&rehy;out',
-    'lay-away',
-    'lay-back',
-    'lay-brother',
-    'lay-down',
-    'lay-economist',
-    'lay-et',
-    'lay-flat',
-    'lay-in',
-    'lay-man',
-    'lay-managers',
-    'lay-missioner',
-    'lay-on',
     'lay-oriented',
-    'lay-people',
-    'lay-person',
-    'lay-preacher',
-    'lay-visiting',
-    'lay-woman',
-    'lay-women',
-    'lay.on',
-    'lay_for',
-    'layarion',
-    'laybourne',
-    'laybrothers',
-    'layburn',
-    'laydeker',
-    'laydekeri',
-    'laydown',
     'laydy',
-    'layedh',
-    'layer-de-la-haye',
-    'layer-dressing',
-    'layer-free',
-    'layer-out',
-    'layerings',
-    'layers.',
-    'layflat',
-    'laygal',
-    'laying-bare',
-    'laying-in',
-    'laykin',
-    'laykold',
-    'laymans',
-    'laymore',
     'laynez',
-    'layolle',
-    'layon',
-    'layoun',
-    'layout&mdash;but',
-    'layout/lighting',
-    'laysecahealth',
-    'layshaft',
-    'laystalls',
-    'layston',
-    'layton/father',
-    'layton/mother',
-    'layton/pilot',
-    'laytown',
-    'layup',
-    'laywer',
     'layworkers',
-    'laza',
-    'lazaire',
-    'lazalle',
-    'lazar-like',
-    'lazard\'s',
-    'lazareff',
-    'lazarene',
-    'lazarevic',
-    'lazaridis',
-    'lazaris.',
-    'lazartique',
-    'lazarus-like',
-    'lazarus/',
-    'lazda',
-    'laze-rock',
     'lazell',
-    'lazer-loving',
-    'lazerdale',
-    'lazers',
-    'lazertype',
-    'laziali',
-    'lazily-written',
-    'lazo',
-    'lazrus',
-    'lazslo',
-    'lazurite',
-    'lazy-bed',
-    'lazy-cow',
-    'lazy-daisy',
-    'lazy-lidded',
-    'lazy-sounding',
     'lazzaro',
-    'lazzarone',
-    'lazzlo',
-    'lb&amp;sc',
-    'lb(455&ndash;570g)',
-    'lb-plus',
-    'lb/4',
-    'lb/ft',
-    'lb=1',
-    'lb=16',
-    'lb=454',
-    'lbarra',
-    'lbd',
-    'lbes',
-    'lbf/in',
-    'lbga',
     'lbgas',
-    'lbl',
-    'lbm',
-    'lbp',
-    'lbp-8',
-    'lbp8ii',
-    'lbs/ft',
-    'lbs/head',
-    'lbt',
-    'lbtc',
-    'lbuklod',
-    'lbut',
-    'lbv',
-    'lby',
-    'lc-6a',
-    'lc-900',
     'lc-derived',
-    'lc-keratinocyte',
-    'lc-lec',
-    'lc-my&mdash;communist',
-    'lc.',
-    'lc/sd',
-    'lc3200d',
-    'lc580',
-    'lcat',
-    'lcb',
-    'lcbc',
-    'lcc-subsidized',
-    'lcci-appointed',
-    'lccs',
-    'lcd-screen',
-    'lcfga',
     'lcg/pcv',
-    'lch-based',
-    'lci(l)',
-    'lciii',
-    'lcis',
-    'lcl',
-    'lcm',
-    'lcp/norrington',
-    'lcr200s',
-    'lcsts',
-    'lcu',
-    'ld1',
-    'ld3',
-    'lda-01',
-    'lda-500',
-    'ldc278',
     'lddc-led',
-    'lddc/ggt',
-    'lde',
-    'ldf',
-    'ldlp',
-    'ldmts',
-    'ldos',
-    'ldp-komeito-dsp',
-    'ldp-laban',
-    'ldp-sponsored',
-    'ldp-supported',
-    'ldr.',
-    'ldt',
-    'ldu/adi&mdash;alliance',
-    'ldvp',
-    'le&ccedil;ons',
     'le&oacute;n-castile',
-    'le&oacute;ng&oacute;mez',
-    'le&ograve;r',
-    'le(s)',
-    'le-',
-    'le-breche',
-    'le-eft',
-    'le-grand',
-    'le-mail',
-    'le-sars',
-    'le-whatever',
-    'le/rp',
-    'le1',
-    'le110',
-    'le12,009',
-    'le125',
     'le15',
-    'le2',
-    'le250',
-    'le3',
-    'le66',
-    'le7',
-    'le720,000,000',
-    'le8',
-    'le8,650',
-    'le99',
-    'lea-appointed',
-    'lea-close',
-    'lea-francis',
-    'lea-funded',
-    'lea-inspired',
-    'lea-maintained',
     'lea-provided',
-    'lea/des',
-    'lea/reading',
-    'leabridge',
-    'leachates',
-    'leached-away',
-    'leachfield',
-    'leacocks',
-    'leacon',
-    'lead-as-tripwire',
-    'lead-butler',
-    'lead-chamber',
-    'lead-coloured',
-    'lead-containing',
-    'lead-contaminated',
-    'lead-core',
     'lead-covered',
-    'lead-glass',
-    'lead-glazed',
-    'lead-grey',
-    'lead-guzzling',
-    'lead-he',
-    'lead-in-petrol',
-    'lead-indium-gold',
-    'lead-induced',
-    'lead-keeled',
-    'lead-laden',
-    'lead-light',
-    'lead-like',
-    'lead-organisation',
-    'lead-out\'',
-    'lead-painted',
     'lead-piped',
-    'lead-playing',
-    'lead-poisoning',
-    'lead-polluted',
-    'lead-screened',
-    'lead-singer',
-    'lead-soled',
-    'lead-stories',
-    'lead-stripping',
-    'lead-tainted',
-    'lead-times',
-    'lead-tin',
-    'lead-to',
-    'lead-underwrite',
-    'lead-workings',
-    'lead-zinc',
     'lead-zinc-copper',
-    'lead-zinc-silver',
-    'lead/bass',
-    'lead/tin',
-    'lead:complex',
-    'leada',
+)
+
+blocks_70 = (
+    '"#bah#\'bentrop$"ih$,ler/national#"ee$!t#"ir%$ango$%tzing##ria%!k#$undu$"ye""ch$"ik',
+    '#\'k-about&(nd-chase)#run&%round%%board%\'carcass%$down%$off-%#the\'%rough%"up$#ed\'&%-back\'"in\'!t',
+    '%!n%.r-out-of-loads$*ing-plates$"le$&master$%point$%shaws%#ies%0ssssssssssssssss%\'tarting)!s$!y"(d-filled$&gloved)!s',
+    '##act$$lton#%brook$#ury$!y%\'/oxford#$cafe#"d.$#ell%7rminster/worcestershire$!i%&-proof&$sale%$bitz%\'e-sized',
+    '%!n%"sh&#wop$%ushin$&y-fied&\'trailer%\'karrier#%eksha#%flesh#"ge%"ll%!r##how#-lington-based#$more',
+    '&#ing&$ped.$*ey-machine\'%stone&#.it&&ectomy$!y#$olgy$$ngoi##ron#$s-92$%crobe$%ports$"ty$$wear',
+    '#$well$&ingira#"za"%eboom#$chel#$fers#%keben%!i#.l&ndash;altona$2der/northumberland#\'nholzes$%inger#3r-boil-hypochlorite$$nnan$#son',
+    '$&vasili#\'scraper$\'ebrandt%$lgel%&ritzky#&v-born$"es$!f#$wiet"#ff.$!/%&oxford%2witney/oxfordshire$!a#"ri',
+    '$#nda$"wa#,erianization##ozi"#hon$"ro")ikkuniemi"(j&eacute$/uacute;r&oacute##ang#"ik$#ner#%kduin#$umwa"%k-kik',
+    '#!e$!n$!r##kup#"o\'$#ine$"zi#)u-shidare$"ko$!o#$wete"*l&rehy;len#%arney%"ow$$uean',
+    '%"ne$%eggan%#rry%"st%!y$%ourns$%ranan%#eck%)ide-based%$oney%#yde#$cast$&hrenan$$lief%$oney',
+    '&!k$#ran\'"ny#$dall%!n&#gan$#eer%%rkins$$onan$#ray$$wick#"ed$!n$!o#\'feckler',
+    '#&gallen$%eddin%$rran$,our-christie$&rammie&$ston#&hallon#\'i-ar-ta$\'minster&"te%!s#&jimock#&kcaldy$"ee%"rn',
+    '#%l-dee%#joy(!s%#off%\'the-rat%/your-own-mother$\'.police$!/$$akee%%warra$%cross%$ully$&droids$$eady&"vy',
+    '%%d-off\'%virus&#eas%(en/right%$gray\'"ew%$llan%"r\'&&-ships\'$type\'$were&!.\'#but&$mont%#sby',
+    '%%warrs%!y$)i-keepers%#cks%\'ehuimen%%grews%#lea%&nallan\'!n&"g\'\'\'-bottle(%floor(&ground,"ps(#off',
+    '($room\'!.(#ken(#the\'!/\'"ly\'&sworth\'&worth.&%ochni$#oan%!e%!m%#ugh$%power$#s_a',
+    '$"um%%ndine&"ey$%vorow$%ycarn&%oogan%#hoy%%maddy&#oon\'#unt&%urris#"ma%\'cthomas%%lcolm%$nock',
+    '&#ney$%eaden%%rsdon$&ington$#ont%#ray&!y$"un#(n-bricks&$urnt%\'chamber%%dried%%firer%(pricking%(seasoned',
+    '%&ughtan)#on.$$down$\'er-type$#ing$#men$&ochchi$%stown$$with#*o-calories$$amps$(basepair,!s%#ear%#its',
+    '%%ocals$\'cuddles$\'daltons$(electron,$volt$%gauss$!m%)etre-wide)!.$,parsec-scale$#ran$$volt$!w%"at#$pack',
+    '%&rtrick$,isj&auml;rvi#%renny$$onan%\'y-silk.+$/sir&!s##sch$"on$(yth-born#&t-deep$&/skirt$%ackey$!y#$usan',
+    '%$ston%!y$&ington#"wa%$rlin%&ughter")m&ndash;s#%-lien##ani$#rio$"si#(banguist$&erella&)ley-clark)!s',
+    '++transported$2le/buckinghamshire%!y$!o##chi#&eridge##ika$#nto#!m$#age$$eens%$lman$"ie%!s%"tt',
+    '$\'no-clad##pel%!r%"se$\'ton-nye##sey$"he#"to#$uras#%wipes##yan"&n-held$(oriented$\'related$)selection',
+    '\'!s$\'village#0a=&dollar;1.0493%0us&dollar;1.1631$%balue&&tangan$#don$)esthesia.)\'tically$$llen$&riwala$.se-independent*$uced%#ing%#ton',
+    '\'"yn#$bane#\'cairney%\'rdshire$$hasa%"in\'%junga$\'khuysen$!l%&ochewe#,d&mdash;both+$loss+$time$%-eyed%(hearted.',
+    '%"of\'0-casual-but-vamp&,n-the-pocket%&uncled%&voiced$!/%&nature$&a-folk&)high-life$&enesse%"r\'&+-freundlich&&bunker&$care&&garden',
+    '&$hilp&-man/wiltshire)!n&(paradies&&scenen\'"ly%!s&!s&)t-hearted%"ys$#gom$"ia$$leth&!y$#man',
+    '$"on$&rochid&!n$!y##eff$"ll$\'macolor&\'tically$!s%"es%"ic&%ology$\'tochore&!n\'-/warwickshire',
+    '#%fauns$%licks#\'g&mdash%)rehy;lake*$ship+#ize$!*$!-%"\'a%\'at-arms%&boogie%\'consort%(in-exile%\'killing%%lewis',
+    '%+of-the-road%$pins&%riest%,smith/parish%&talent&#hat\'#ing&$imes&$o-be%\'v-south%\'witness$!.%!s$!/%\'british',
+    '%\'defence%&former&(reelance%%gerry%(landlord%&priest%\'refugee\'%scuer(%ident%\'servant%%whose&(orcester$#_as$#aby%\'ttorney',
+    '$&cobras%$raft$$dom*(!*\'(-brabant((dioceses(#led)%inked((nepalese(%owned(&states(\'trained\'&/dutch(%spain$%ee-ee',
+    '$%field&*sher-clear++plus-dixons$%house$!i%!i%$nrin$$kabs%#lip$$lake&"nd&!s%!e%#ike$)ofthehill',
+    '%#in\'%#ost$"s.%\'/queens%2bere-sub-greenhill%%chase&/lere-burghfield&#ott)%/bass&$roft%%ditch%#ely%%heath&3ill/buckinghamshire\'"p.',
+    '%%knowe%/land/adventurer*-herefordshire(!e%0man/biochemistry&%eadow\'!n&+ill-stocker&#oor\'"re%,north/editor%"or%2ton&ndash;montreal(/-on&rehy;thames+\'-thames',
+    '%\'wood-gk),/oxfordshire$!y$$zett#!h##ich$"gi$"ma$&nmonth#%jacka$!i#$kade%#jou%#nja$!i',
+    '$#s-y#!l$$oss.#!m$"an$"en$$outh$%uires#-naber-brechin%%haird%"rd$$eger%#ret&#mit&+sley-chitre',
+    '$#ick%$nvie%!s$$nock$.ock&rehy;style\'\'-basher(*hattersley(#led\'\'/labour\'&athons%!n$!s#(orhynchs#$pont#$rade',
+    '#%s-men$#ai.&!l%%ngani&!i$$bury$%ellas%(y-backed&!s$%hasha%*ip-systems\'!.\'!s$*k&yacute;s$&laying',
+    ')*on-kinsman$#ton\'#ian$!y#"ta$!e%&-cloth%!x$#gen$\'radwell&!w%"ea#$uffa$#nda##vig',
+    '$"ig$#oku"+osk-pushers%!."#pak$$rsky$!s$$thon#9ling-cakes-to-bisto-giant((to-bisto+%hovis\'%scote#(pelstein%$rers&#ing',
+    '%!s$"le$#y-o#&sigies"$ragu$"la$"ta#.by-in-ashfield&\'warrick%+/author-the&(dialysis&$farm&\'maxwell%!e#/chberg-fleckalm',
+    '%,eim-bolanden&#ner\'+ges&auml;ng\'%kampf\'#tal&#r-s$%kmann$%ubbin##dar$$ford$#off#)engeshoma$!y#\'ghistan&&zistan',
+    '&#tan#+iath-jearim$!e$!k$%lenko%!i&"ov%-l-belozerskiy$"ri#(k-duncan%%going%&hudson%&othmer%%style$(/british',
+    '%%rover$#ahm$)by/former\'\'maxwell$$dake$"er$\'gunzeon$$hall&"rl$!i$+land/driver(!s%#eys%%inton&%ston.',
+    '$\'mabreck$&nettle$"op$(patricks%$orts%%trick$&sandle%"en%#ton$&thorpe%&onhill$\'wallian#!l$#and$(ichliche',
+    '#"ni#&odimal$)v-trained%#sky#!p#\'r-whit\'$#ick##san$(chwasser$"ta%%enson%#ine%%y-lee&)/kathleen#\'tinidhi',
+    '$#ons%!s$%schen#"ub$"ga$!i$\'pakaran##vor#"ya$%nteeb#$zner"#san%"ga##ber$#urn',
+    '#"ch$!o%!e#&elevsk$!r#"hi%"es%"ro$$ofer%"re$$twar$#var#&korosh$\'unhalas#\'lodovsk',
+    '$#yuk#*metophiles#$ongo#"s-%&a-glam&*nd-make-up%$curl%%fired%(of-death$$avos$$curl$#ell%"ss%"tt$!i',
+    '%#mee%)nger-bass*$like\'!s$$ling$(ogrammed)!s%%matic%!v$"ss#&tasami$#ler$"na$!s$!y',
+    '$)risstugan#$zcko$&ewskie"%t-car$%house$$list$#see#!.#&/meter#%a-san$!b%"en$#eva$$gawa$*igorodskii',
+    '$#nga$)shiretoko(!o$!w#*chen\'-made\'(-bathing)(reakfast(&chairs))um-living(&dining.%-room()furniture(,installation(&living(%maids',
+    '($roll(%staff(%table)$owel)#ype($wise)&orkers\')/bathroom)-reakfast-room(+dining-room.\'/living/,sitting-room(+living-room.\'/family(\'morning',
+    '(\'servery\'+er-waterloo)!s(,tte/bathroom\'$less\'Cmaid-cum-parlourmaid-cum-everything\'"s.\'!y%$iner#)e-balloon,!s&"ug%$mark)"ed%\'pattern',
+    '%$view$!.$%hawks$"le%!y$&makers&#rks&$ster$#nge$"rs$"zh##fox#-hairon-parnes$$ouse#$ione',
+    '##ley##ney#!o#$rina#0s-nevis-anguilla$"ap$-inger/lentils$(on-mayer(%eyers\'%still&)/chairman%!s$$ukas%"se#*t-ee-wayke',
+    '$!e%$n-in\'\'killers\'$love\'%sized&"ed&%ishly&(s-mother\'!.%&rbells&&master$"ic%%kasem%!m%&ng-out',
+    '%)wake-like$\'le-drum&#man%#itz$"on$$rell$%sbeil)!e$!u$-y-kitty-kitty%\'.gareth%\'bombers%#kat%$wake#!z',
+    '%*uhelerhorn\'!l("er$0inger/childbirth""u/$"ml#"la#$mars\'!i"!v#%anagh##eli%"ls$#red%#ton',
+    '#!y"%wanis%#uka#%i-led"+xx-produced"!y#!a#%onori"!z#%/land#"er##hin#$ilay%%inmak$#slu',
+    '#!u!&j/cu.m"#863"#a:r#"er%"em#!t"&ekshus#&llberg%#mer%&strand#)til-andre"!v!;ke-external&mdash;communist##err',
+    '"-iiiddddddssss"!l"#now!,l&aacute;rov#1oacute&scaron;ter$/uml;ckner-werke"#-43#%femme#%homme"#116"#830"#aas$"tu#"ck#+dderadatsch',
+    '#$ffke##gen$%sbrun#%ipeda%$icla#!k##mer$"in$!p#\'ngfarbe$&swoman$%watch#%pheck$!p%"er',
+    '%$holz#!r$*&auml;lven$#bar$!e$%sfeld#!s$!p$"se%$iker&$sche%%ovikh#%tches$#ter#$uber',
+    '$"ke$(s-jurgen%&enburg\'$pass##van$-ier&uuml;bung#!w$%itter#!x$%oning#!y"/d&mdash;liberal"0e&iacute;farvatn#&a-134a$!n',
+    '%%thous#&banoff$"er$)sormidium#(czkowski#$ding#0e-klee-klee-klee$"ep$,li/hairflair$#man$,nex-vagabond$\'rebezem$!s$#tie%"ra',
+    '()-designed$%nberg)"er%$eman%&felter%.ian-influenced%(kircheim%!l%\'meister%\'schmidt%$tjes%%ubing%!y$#ser%\'thenean',
+    '$\'tarchos%"os#$mble$#ens%$tsen$-perer/beecham##nke#$obis$%nymos$%patra%#hon##pac$&togamy&%manis#(renbesem',
+    '#$sges#"th$\'tenberg$!z%#mer#&uznick#"ve%$land$%orick$$tsov#&ymenov"+f-sponsored%$tyle"\'ibansky#!c',
+    '#"er#$gman#!k##ma\'%+-genetische%!s##nck$%eberg$%gchua%!e&!l\'+h&ouml;ller&%nfuss\'%smith\'$zell',
+    '$%ipath%$tsky$(prathoom)"um#%oisan#!p$"pe$&schorn%\'pringer#$skey$!z##uns#"ve"#juc$#jic',
+    '"$ller"(odzinski#&eckner#"go#!k$#eda#!n$&dikers%)yke-style$!g%!s$"ks$#tal##oit$!s',
+    '%#zak##pas$#eks$$pers#!s$&iewicz$&sowski$#ter\'$heim\'&kemper(%irche\'$plan##ten$#hes##van',
+    '$(i&cacute#"yd"!p"%udges#&eznick#$koff$"va#)son-style#!t$#zes##win"%yazma#$kylo#%mchak$"ko',
+    '$$veld#&strons#*uchevskaya*"ii!#m-4#!5#$wide"%/hour"#132#&9/psti"#700"!_"!g"!i""s.',
+    '!\'n&mdash#(ouml;del"%-know"!."#aak#!b#(ck/byron%%atory%"ed&&r-yard\'$meat%&wursts#$fler#!g$&sfield',
+    '#(llratten#"p.$$hill$.ic-fijalkowska$$kins$(man/baby(&father(&mother$)p/general&)transport%(ertsbush%#ing$!s$$well#)reborough',
+    '$"ly#0ttspryrnufelagio#"us#&veries"!c"#dst"%e2100#&adable$-le/organising##cht$!k#+e&rehy;deep$\'-banded\'!r&&ending',
+    '(!t&#oot&\'uckling-"ly\'%skins%\'crackle\'&ookers%!d%\'flexing&\'riendly%&height&#ole%&joints%(ligament%"or',
+    '%(reaching&#oom&"un%$sock)#ets&%paces%&thrust&(remblers%$work&(renching$%bones&#ots$$deep$&joints$&length',
+    ')\'knuckle$$pads$$room$&s-bent&/up-muvver-brown($ping(!s%%/bent##fel#&idlech$$ffii$!p#$lled&!s%#ing',
+    '#"se##w\'\'$$.why$"/a#"z\'$"es%#vic$#ine"$gdom#"ri"(ickaires%)er-blinds)%ocker($deep(&frills',
+    '(\'wetting\'%boxes\'"ed\'%s-off()/ex-julie%%nacks##een$$phof#)fe-attack&%block&\'carrier\'\'leaning\'"ut&%faced\'%ights',
+    '\'&unting&(juggling&$keen&$love&#man&#our&&points\'$roof&$rack&&shaped)&rpener-#ing\'(wallower(&inging&\'thrusts',
+    '+#ing&\'wielder%&.nurse%!/&$fork%&blades&"ox%$cuts%$hilt%#men%$sman%(wielding&$oman%(y-knives$#fen',
+    '#"ga$+ht-bachelor\'&deputy\'&editor\'1in-shining-armour\'\'service&)/campaign((ommunity\'\'maxwell($odel\'#new\'&oxford\'%print,#ers\'%sales',
+    '\'&walter&%:tips&$cote&&ingale&$leys\'\'y-brown.\'/parent)*seneschals&$mare&#ons&*s-bachelor*%neret(2companions-at-arms($wood\'"on',
+    '#\'t-denim%#ins%)stockings$\'ability$$bone$\'contour$%mates$&pieces$&radars$&ted-in\'!.\'$ness&!l\'*/volunteer%,ing-patterns',
+    '()/watching(!s%"le$,wear/textile%#ise##ues""mg"(ob-faced%$head)"ed$$ache$$bing%"le\'&-nosed&#ing',
+    '%\'y-faced$%heads$$less($ness$&sessed%"on%%ticks#!c$#hma$)k&rehy;on%%-offs\'(n-effect&#tee&(you-down%!.',
+    '%&abouts&"gh&$rvie%$dara&"on%!e&&d-back($down(\'through)\'ogether&\'r-about\'#oss&"th%&farrel%$holt',
+    ')\'it-down)"up%$many&%urran%)namocally\'!n%#off%#raw&"in%&s-down&\'hannoch\'*innoch-ayr,!k%$wood#\'dishall',
+    '#"fe$%licek#)kke-zoute$(vergence#$lled&!r%#sea#"op#!p$)fler-type%!s$,p/eyewitness%&ed-lid&!l%!s',
+    '#(t-county%$eyes%$free%%holes%$like%(strength%$weed$%grass$%holes$$less$\'tedness&!r%#ily&#ng.()ley-based',
+    '#)utberries)!y#+w&mdash;and+!i+$that-!e$\'-forder%%hanky%(ke-mulla%%ledge%$note%#the%\'whether%-your-customer$$.and',
+    '%"in%%thank\'#ere(!y$%/knew%&prefer%*understand$"_a&%_good&"ll%$each%\'whether$$alls%"re$%ehead',
+    '$,ing-practice\'$:you\'%ness.%$tall$!k$)ledgaebly(+e&rehy;able)!\')!-*&affair+2s-a-good-in-itself-*curriculum-(practice-(research*%bases',
+    '*&claims*&driven*&filled+$lows+/or-its-own-sake*)gathering+&etting*\'holders,!w*%level*%minus*$plus+$ower**referenced*\'seeking',
+    '+\'pecific*%texts+#hat**with-doubt)".1)7/consciousness/ideology**experience/$tise*(ideology*%power)#man)#pro)%works&*s/landlord(*malmesbury',
+    '%"ys$%n-age&$name%*.wentworth%&/issue&#the&%wrong%!e$#one$#sly%!t#/x&rehy;johnston$#all#$yles"!p',
+    '"&ubbled&!y#%cklas&(e-biting)#low)#one((cracking(\'rapping(&shapes)&wollen(\'walking\'/bone-containers\'$head+&edness+!s',
+    '\'!y&!y%!s#%mdrum#%pffer#$ston#"te%%nborg$$ford$\'sbridge%"en%*ford-based%#son$!t"!w',
+    '"%yazev#"ff##ght&"es\'#ton#\'persley##ves!-o&ccaron;evje%&edil;u#/sacute;cierzyna,%uszko$0caron;i&rcaron;e+"ce#+zcaron;eluh"$-kee',
+    '"\'a-faced$$wood#"ng##ssi"!b##ain$!l$!r#"ba##ell$%nhavn#!i$\'schanov#%jagla#-lenz/waldshut',
+    '&$nigh%!t##oid##uki#%ylarz"#cak##h/k$\'anowski%$ryan$%eisen%$rgih(!n&\'scheidt$!i%!a',
+    '&!s#-ie&nacute;ski#*k-petersen$!a$#eis$#iff$#ums"(daikanal$)k-xomat-s%*/photorail$(lith&reg$"ma$$nsha#"er$"sh',
+    '#&ilinye$"ng#!o#"ro$!u"%eberg$#ner#"ch#%leman%#ria$%liker$!s##nen$+ig-designed&!e',
+    '\'$tein##pel$$nick#%tjape#$vert#$zoua"(ffijberg$.man/consultant(&kidney#"ra##tan"*ganei-city#"el#!i#!l',
+    '#!o$!n"\'h-sumai#(aku-like&+/sanke/ogon##de-#"en#\'l-black&$rush&#ush%$eyed%%lined%#pot%&rimmed$*/gorbachev',
+    '$"ed%\'pfennig$%hagen$#izt$5rausch-williams-watts$&styler#!m$!s#(n-speyer$"er$%stamm#*r/burglary#)tla-jarve#%ukohu"-i&rehy;keeper',
+    '$&shaped##bal$"la#"dl#"es#)locytosis#0n&eacute;ization$$ange$"es#)ralaprime$&sakoff#"so#)vistoinen$%upuro"+j&egrave;ve',
+    '$&vnikov##ien"0k&mdash;national#(-kok-kok##abi$#los#%ciede#"es#!i#,kadichcholai%#lis$#evi#$lova##men#$odia',
+    '$#lia$(national%"ya$0omus19.323.14053$"po$&schkas%%hniki$%taylo%"su$#uvi$!v%$tsev\'"ov$$wska#$stad',
+    '"/l&aacute&ccaron$(iacute;n#%\'skiy#&bassia$%ovsky#%chida&!s#%derie$"on$!t##ega$$kole$!n##for#%hapur',
+    '#!i$%barov#+jevi&cacute##ker$\'hozniki$&witzia#$land%"tr$%owitz$$sman$$ytos#/mogorov-smirnov##ner#%odeje%"ov',
+    '$!k%"oi&!l&&tronis$"lo$(menskoye%$ikta$#nji$!v$,zsv&aacute;r#$saas$"ek$#hin$#son$#tad',
+    '#%ymsky$#van\'*o-kuznetsk",m&aacute;rov#!a$!i$#leh$)ndorsklye%"ya$*r&ccaron;a%#chs%"no%,om-esztergom$&tiites#"ba',
+    '$%inats$#ruk##ech$)ito159186$$lova$$nchi$$rcni$"ts##hyr##ics$!n$)sarjevsky%#che$"ya#"la',
+    '#*ma-ethniki%\'ndantur$#ent%(rzienrat$)unication\'\'kativen\'!s(/terna&mdash;vpk,!e*#sch))icheskaya#!o$\'doensis$#sol$#tau',
+    '#*somoljskai#!y"(n&eacute#%-chan$$rads#$able$$lyck$"mi&+/imageworks$!r%"ev%#pki%#ski$"te$#vli',
+    '#%deyne$&itorei$)ogeorgios%!r&!o%+yannopoulos$#rat\'#yev%!e$"uz#$ecny$#ski#)federacja$1liktpartnerschaft#&g-born',
+    '%%china&)ontrolled%(financed%#led&%isted%&quoted%*registered%%style$!.$&/macao$#ens%"rs$"it$#res\'$i\'ni',
+    '\'+s&mdash;was(%halle$%sberg%\'fjorden%!i%%kilde$"ur#!h#!i$\'chi-wah$%etzko$#gin%\'sfelden$"ng&"en',
+    '$#shi$$tron%"sa#"je#-kani-speaking$#ret\'"es##ner$!i#"oe$\'lfingen$2pi&scaron;t&ecaron%.kastrasse/main$$suke$#uta',
+    '#%sepsi%%quent%&rwacji(/tywno-liberalna$&piracy$\'tadinos&%ninos\'$tino*!s("yn%&yantin$(ulthuset$%yanza#%tacta$!e',
+    '%"te$-oyiannopoulos$(radmiral$%tinen$"ur#%ukman#"yi$*vterjeszto#\'zintsev"$o-ee$*kool-larta%%rr-oo#!b##chi#"ee',
+    '#!k$$-aid%2kook-kook-ka-ka-ka$\'aburras$"ie#&latron%!u$$haas##men$&passia#&namore##per&%ativa#\'rnmarkt$#osh',
+    '%%ooske#!t$$chie$$enae\'!y#"yk$$mans"%p-end#"ac$"is$$onik$!y##cke#"ec%#hne',
+    '$#lar%"ev$.rnickerstrasse$!x#&fstein#$ietz$#lov$"te%!z#"je#$liku##oro#\'parberg$"ed%$naal',
+    '#*reckocaika$#iva$%owski##tev$"os"(r&egrave#/-di-foe-lee-oos$#kok#&a-kora$$blev&"ov$$drel$#lek%"ya$#mic',
+    '$!t##ban$*eciforeign#&chanis#\'d-ar-ta$\'enbusch%$stan$!i%!c%!k%!n$"un%!s$!y#&e-pose',
+    '$\'a-based&%china&&soviet&&united%!.%*n-american\'&backed)#sed\'%issue\',manufactured\'%owned\'#run\'&soviet\'\'trained&!a',
+    '%$town$\'justice$$nica#%fball$!f#&handir$#ian$#ogo#!i$"ne%$kova%"na%\'thiakos##kut#&martin',
+    '$"os#"n/$"ai%"ti$$blee&#ith%#rot$"ei%\'liussen,!.$$feld$$icki%$enko&!v%!k',
+    '$%nelia$!s$$wolf#)obeinikov%#kin$"da$$lyev$#mex%!o$"na%!e&"ia%!i&"ti$#sec',
+    '$#van##pse##red%#sia#$saga%#kov$%fjord$!h%$unov$#ika$#man%$eyer#%trijk$"un&"ov',
+    '$"ny#$ving#)win-mikke##yak#)zeniowski"$sary#!b$"ar$#erg#&ciusko\'#zko#$goda#,her-approved\'%style&"ed',
+    '%$hara%!m%"on$%kodan$#tan##iak%"na$!e$+niak-kamysz%#ski$#tos#$kela$$inos#$leck##min',
+    '%&poulos#"ok$#van%+o-methohija*1ohija&mdash;under%#ska#%sacks$"of&%f-ish%!v$"ut#\'t-ar-ta$$akis%"sh$$bare',
+    '%#lka%#nko%!v$#ick%$enki%"ka$#ner$&rikhin%(ovwitzki#$utic%#nik#!y$,gin-brezhnev$#rev#%zalin',
+    '$!h$&kakura$&lawala*!s$&parcha$"ri#"ch%#eff#\'elchuck%!o$#nev#$hari&!y$$mann##ick',
+    '##kin##ler#!o$!k$$waza#"ra#\'tbusser$!e%$wski$"ke$#ler$!o#%zebue%!n$#sch',
+    '#$anda&!i#\'fonisis%!s#\'gblenou$%jolou#\'kiadhis#!l$!a$&ebiaca$$ouba&"ra#"ma%$koye$"ba',
+    '%%ologi$$jian$$moue#&omegni#*petschesky#$rabi\'+&egrave;des$#osh$)taliotiko$!y#"sa$%okuya#&toubia#(wenhoven#$yate',
+    '"/v&aacute&rcaron#\'alcheck\'"uk%$esky&!v\'$skii)!y#"ic%!s$%ljaca&"ko#\'potina.")w-kow-kow$$lyow$%towed',
+    '\'!s$#yow#!a$%bunga)m-mutant-ninja-turtle-most-unfortunately-named-clothing-company-of-the-century$!l%$eski)(-wallace#!k$#abi#)loon-side##ski#$tows")x-defined$\'related',
+    '#*31-derived"$y-ye#&abashi$#dia$%gialo%$uchi$)nisqaatsi#"li#\'uktolik"(zacioglu$"ni$"ra%"uk#&iarski$!k',
+    '%#ski##jak#$loff#%ponti!#p/w""63""72"$akra#$ndja""dp"!f"5n&mdash;confederation#&i-hpai%+noti(blunt)"%olleh',
+    '"$woka!"q6"#bps""ed!8r&aacute;lodvorsk&aacute#-lt;24,000,000#*oacute;lik$)slash;yer#)uuml;ppel"#900"#aah$!i%!j$!n$"pa',
+    '$!s#$chai$$kers$"un#"ds#%emers$$plin$"tz#%fchik$"la$&twerke)#ian#"gh#"he#"ig',
+    '$"ss##jin&"a.\'!s$"na#!k$!a%#tao&#oan%#uer$#ens$#owa&#ska##lis$$jeva',
+    '$&leralm#!m$!a%$rsky$&berger$#eri\'"us$#itz$)l/charles%#ich$!m$#nik$"pe$"su#\'nenborg',
+    '$"jc%!i$)kenkassen%!l%!o&#ors&$vitz\'#sky%%winkl$#non#&payoon$!p#&rnarae#)s-si-pays$$avin',
+    '%#aar$$ikov$)nopevtsev&&selkup&!w%"yy$!s#%thong%$wohl$#itz$%olsov$&schmer\'#ull$#zer\'!t',
+    '$"ly$%rosis$#ser%#har%(s-maffei$#ter%&hammer%#ish%\'rockers#,vchenko-like&#uck\')k/soprano#%wczuk$#isz#&y/crow',
+    '##zzy"$bava"%ca-tv#"ho")e-kre-kre#!b$"bs$2sforschungszentrum%%gasse#(ditkasse$%ytowy#"ee$!n$"py#$felt',
+    '$"el#$imer$%scher%"el%\'leriana%!s#!k$!a$+el-aalberse#$ller#%masti$,er/bernstein$,lin-watchers\'%ising\'(ologists',
+    '%$yova$$nitz$#pel#%ngiel$#ner$\'winkiel#&osotum#%pkaya$$osti#)ssbronner$*t\'ianskaia%!a%(yanskaya##tan$!e',
+    '#%uning$"tz$&zgasse%&kirche%#tor%#weg#!w$!\'#%yszig"(ichefsky$!k%!a#%egers%)sakademie&*gefangenen',
+    '&#lok&$tein%$zeit$\'ngkamol##ger$#ing#&i-krii$#zli#%kalev&#yov$$elas#$lich$\'l-based&(catching%%stick',
+    '$\'inalrat$$mies#)ngle-type$&zinger#!o#&palani#%sanna$$berg$#che$"es$#hak%\'nakumar\'\'machari(%urhty$"is',
+    '$\'s-kross$!t%)allphysik%,demokratiska%%eller&$nson(#son%!i&)&aacute;n&#an.($stad&#ene&#ina&\'lliinen&"na',
+    '%!o&!s&!v#%talla$!e$#hia$"ik&"on$/sanachandefence%%eligt##vak$"oy#!z"+le&zcaron;a"&oagnon',
+    '#!c$!h$!k#$eske$"tz#"ff#$gers$!h$#man#$isos##ker$%onose#(likowski$&l-oper##mah',
+    '$$beck$"er$\'i/pilot$#mer%#yon#&na/ecu%!r%!s%&witter$$borg$#del$\'engasse&%platz%&r-less$#fli',
+    '$$itex$%oberg$.prinzen-palais$&quists$%tiris#"oh$$k-lo(!k$!m$"ns&#tad##pfl$\'iwnicki$%otnik##tki',
+    '%$nian##upa$$tvor#$vetz#!y$"er#!z"!r""s1#&canska#\'tulovic$!y"-u&scaron;evac#$cker#!d',
+    '%&straat$&tsberg##mel$\x84fettmahanamanahulamoranosecanosemahanaritiraoosalalaramalapalapapopapopobaalacataltootoochepereelong$$lauf$"me##nch&#ies$$gggg##pka$$nick#$sche$&enbaum%"vo$!h',
+    '%"ic$"ne$!t%%enova%!y$%zwica%#yna\'#ski##tch$"ov"!v"!y##azh#!m#$nine',
+    '#$stal\'$flex%#ian$$ztof#&uchina"(zanowski#(emieniec#%sztof#&ysztos$%wanek$$ztof!"s+"#/sk"%1000l%!l',
+    '#&6b/406"#901"3a&rehy;consumercare#--consumercare#\'veriyev"#b-3""cm"&h1,402$#.90$%8,442#$3.00$%0,636#&48,560$%9,456#&57,996',
+    '$*41,000,000$%9,300#&79,196"!p"-r1&ndash;1088#!c#!i"%s-kor"!t#!j"%udach!$t-r6"$1026#!2#!5',
+    '#!9"!2#!1#!4"%3301s"!8"!9"#aeb"!c"%esias"$holo"!n"&o-kogo""s.!*u&ccaron;a',
+    '"%-band#$damm#(jikijila#.klux-klan-type""ah##nda$&g-shun%$tung"$bach$$siak$"ti%#lin##bet#$ecka$,lik/bavarian',
+    '\'%-munk$$reka#+i&eacute;na$"ak$#cke&!i$!n%#ski$!s$&tschek#)laikansky$\'er-ross#!o#&uabola"&charyk',
+    '$&libari$,uk-kainardji#%inski##ker$\'lestane##zaj"!d##amm$!n$$yyir#"er#!o$!h$\'s/kevin&&morley',
+    '##red$&iatsev#!z""en$$eman##rti#"vi"&fahanu##fer#"ic##lik##ncd##pec#!r#"ta',
+    '$&pakori#&elhopf##gle#"le"!h#%ammad#%field#"io#"li$#man##nle$!s""ia#\'bysheva##chi',
+    '#!k#"le$!s#"ni#$rata#$sany##tca$!o"%jacku$"wa%#iak"!k#$acka$!i$*nis/thames',
+    '#!i#%kiwon#"la#"oi$%relli#$reja$"it#%uckza$!i$!l%#can"!l#!-##ak\'%!i',
+    '$\'singham##bir#+cs&aacute;r%"ar##fik##ick$!g$&kowski$!t#%karni(\'/report)\'working$&ompani%!v##lab',
+    '%$nder%(vanijaya$!e$"ig##man&!n$$bach$"ie#!o#*ta/esquire$(ur-kampf&"en&(institut&%muhle&"na',
+    '\'.rotestantismus&*referentin&,wissenschaft#\'umbegov$#ngu#&vinder#!y$#gin"%magai$!i$$kawa$#lli$$moto$\'ndintsy$*ramangalam',
+    '%$esan$\'takenin$#yri#"ba#!e$!l#"fi$!y#"ho#"in$"te#"la##mar#%onryu#"pt',
+    '"3n&scaron;t&aacute;t#$-yeu##akh$"le$$moto$!n%$urra$"vi#$chok##den%!r&"a\'$"ig$#ous$$ulum',
+    '#"es$!v#&g-kung#$iaki$$gund$$hiko$!i$$sada$%yoshi##kin#"ne$"in$-skapsforlaget#8st-und-ausstellungshalle%)akademies',
+    '&(uktionen\')sstellung%%bezit%"en%)forschung%.genossenschaft\'+werbeschule%+halle-style*!s&*ochschulen%%insel%,landschaften&&erbund(%innen%$raum',
+    '%1verh&auml;ltnisse(#lag%$werk&%ollen#!t$!a%"ng$"er$$ilet$$sevo$!z##war#&z/gate$"le&!r',
+    '$#min$$ting%#ung#!i#!k#%megni"%penda$$rard#\'ferberg#"ho##ona%!y#$tsev#&yaukyi"#rah',
+    '$!t%!a$!u#&czbrak#%dhish$*ish-backed()dominated($held\'(autonomy$$jali$#lsh$"na$!t##esa$$take',
+    '#1f&ucirc;rstendamm$+iarstendamm$)urstendam*$tums#&iansky$"en$"lo$#ous$"sh%$tica$"wa#%jehin$!i#\'kigarth&#ert',
+    '##lin#"ma$%insky#&nandan$%iawan$#ous#\'okujira$"rt$$saki%#hio(%boshi$\'tchkina$&yanagi#$park#\'ssnerin',
+    '#\'t-cesar$#ahs%!t%"xe$&heater$!s$$ulus$$wood$#zig%#man%\'weilige#%ultay$#ppu$&saqila#%wenal',
+    '%#kin$!s#,zgeschichten$$hals$(lehrgang$"on"&sadasi$"mo##hal$%baloo$$mann#&imanse#"ka$%okwim%"vo',
+    '#!s$!i##tar&#nyi&!y$#era#!u$)maatmadja"#tai$"ni#!b#$chuk\'0&mdash;kainardji\'*-kainardji#-enyov/russian',
+    '#&i-bass##ner#!s$#uki%$rogi#%ubdia$!k$!m$&zovsky#!z$$alls$#ner""ui"$vitt##lum',
+    '$0it-saudi-arabian($ized&.i-commissioned(%iraqi\'%/iraq\'!1"#yas$#teh#\'kendahl##odo#&sanjag"#zah$"ri#%ichin$#riv',
+    '%"ck!*val&ouml;y$$sund%$voll##nti#$rner$\'tir-nik")ennalista#\'rneland"%ietik#\'liataya#"nn#(st/press#\'tsinski)!y',
+    '";ktlkaqnselastanmlreqvaqlkqk"$n/vd"#zak!3w&eacute;y&ograve;l""14$".8#"rs"#aan#"bo#$chas##dar#"la$%useni#$n-do$"da',
+    '$#ggu%$tung$%treng%#ung#!o$#uvi$"vi#$rara$!t#"si#%thema#\'valskie#$yana"%egyir#$ilin',
+    '%)-language#!x""hs")iasnewski$#tek#&cksave#$dini#"ek$!t#)k-cricket$#buk$%clene#%ntner##rs2#"ss',
+    '#"rs"!o##ndo"!u"$vrps"!x!"x-##260##360#%p1124$$2123#$w362""c1#!4""f8',
+    '#!6""h4"%inawa!#y15#!6"!a#!g#$khta#!n$-ite-magnetite#"tt#-uu-kyauu-kyau#"w*"#ber%"gs',
+    '#&urgers"%empin#$reme#"se$%imira"(ing-hoon##zom"&joyama""ke$!s#"ko"%lchap#*e-dingwall$1/plockton/glenelg$"ne',
+    '&+recommended%!s#&l&auml$$achy$!o#!o$!e$$nian#$sant")me/victim#&ograph"!n#&agarry#"ch$!l',
+    '#\'urenine"&obashi#+do-inspired#%gunge#$nggi%"ji#%rucha##sho#!w$)a-saitama"$phos&"is#$ovis##rou#&selids',
+    '"-r&ouml;nsalmi#!a$$ndia#$iale$)e-christe%(_eleison#\'kekvarn#\'rhestes""se$!e"&taiton##eon#&herans&&odikes#$sons',
+    '""we#$ords"%zikos#"yl 2l&aacute;sl&oacute)$zaro*"ni#*grave;-bas#,macr;b&omacr$#p;d&!m&#nwr&!s\'#up2&!t',
+    '#@ring;ddej&aring;kk&aring;stugana#%tilde#,uml;cherlich\'#der\'"nd)!e*"r.+#rat(#gst(.si-suomalainen\'$rbro(&omedel)$plan"3eacute;0th&eacute;0)!a',
+    '*"ud)$beny))ch&eacute)+g&egrave;re*)ionnaires+\'slation*$umes,$iers)$mery)/on-g&oacute;mez,&joseph+#ore*\'poldine.%ville*%ville',
+    ')$svos)/vi&rehy;strauss#)circ;gion#1grave;g&egrave;re)"ve")frac12;in\'!4"$gt;a"*iacute;ber)#nea,!s".lsqb;loyd&rsqb\')or&rsqb;d)&d&rsqb\'%scene',
+    '),6/j&ndash;31(!4)!h)!s(#749+-/vc&ndash;12n(!a(#new)"ow($rood"+oacute;bago)(d&zacute#(circ;wen#)grave;pez#,slash;dingen',
+    ')#pet#*uml&ouml;w&&;derup\')ffelholtz)#ler($gren\'"hr\'\'nnqvist)#rot\')schenkohl\'(tschberg\'%vborg\'\'wenherz\'.yttyj&auml;rvi"&percnt',
+    '(\'597,000(\'million"(ucirc;hr(%thien#0uml;bbe-grothues\'#ftl\'!n(%eburg\'%rssen\'%scher,#ian\'#thi)!y(#ken+%horst',
+    '!0\'&eacute;conomie*(ducation*%glise*&nergie++onc&eacute\'*%poque+\'uration*)sthetique*%toile"0a&icirc;n&eacute#/bbaye-aux-dames-&hommes$%eilly$\'olition$%sente',
+    '#%cacia%,d&eacute;mie&$emie$$tant%#eur%#ion%,ualit&eacute#(dventure##ero#\'ffilard$&ricana&"ka#"ge%%noise#%iglon',
+    '$!l$"re#&lberta$$essi$,g&eacute;rie$*imentation$\'lemagne$(sacienne$)ternative%&ipiano&%ssimo#&mateur$)bassadeur$\'ericano\'#que',
+    '$"or#&nalyse$$cien$%dorre$#gle$#ime$*n&eacute;e%)iversaire$(thracine%,i-tradizione&%quite$"za#\'peritif$\'ocryphe%+thicairerie',
+    '$.r&egrave;smidi%\'es-midi#(quastion%&itaine#%rceau%#het&$ipel\'\'tecture)%ttura$,d&egrave;che$(lesienne$*m&eacute;e%%ament%"ee$9ri&egrave;re-montparnasse',
+    ')!e$"te&%misia%$isan#!s$\'cension$\'sommoir$+tr&eacute;e&%agale&!e#\'talante$%tache%&ention#\'ubesier$$teur',
+    '&&mobile&*rit&eacute%$rier$\'xerrois#$vait%#nce&!t%"re$$enir&$tura)!e%$ugle%!z$$ocat"%ecart',
+    '$#ran$!u#$ffet#%gisto$$lise$(yptienne#,lys&eacute;e#+mbarquement#&ndroit$*gendrement%$lois$#jeu$$nemi$,richissement$&traide',
+    '$)vironment#%poque##rma$$rant%#eur#\'scalade&(rpolette%%oufle$\'ercisio($zino$(parcette%&erance%$irit%#oir$%sence',
+    '%%ragon##tac$%ernel)"le#.urop&eacute;en\'"eo#(venement##xil$/p&eacute;rience%!o%*r&egrave;s&&ession,$isme$.t&eacute;rieur%#ase',
+    '$+ocirc;pital#&a&yuml$%bitat$-llucin&eacute$#ssa#\'eritier%&mitage("te$0ureux-dub&eacute#)ippodrome$(rondelle$\'storien#$oest$)mme-fusil$%pital',
+    '$#tel#2uile&mdash;cuisine$\'manisme#-ygi&egrave;ne"%idiot$#ole#+llustration#)maginaire$\'itation$%mense$/p&eacute;ratice%\'eratore\'!o%&ortant&&sition',
+    '#\'ncontro%&urable$*dependance%%ienne&\'fferent%\'o-chine$\'farctus%(ormation$\'itiatif$\'nocence$)seguitore%(truction$2t&eacute;r&ecirc;t%)elligence*-ibilit&eacute',
+    '\'#dit\')nationale%&ra-dit\'-ns&iuml;geant)&igeant&(oduction$(ventario#%seran$#lam\'$isme%&e-adam$#ola#%talia("no\'$enne',
+    '$%fante"!n"1oblig&egrave;rent$)servation#+c&eacute;an#+d&eacute;on#$euil#%ffice\'#ier("na#"ie#(m&eacute#!n$"de#&pinion',
+    '#%rgano$\'ient-le%%ginal%%monte$"ne$&phisme$%tolan#&seille#$ubli#\'verture"$pool"&stands"&ultimo#!n$$esco',
+    '%(t&eacute#%ranie\'"um"#vov"%woods!#(a)$#451""d)""t)!%****r!#+f+"!r!&,000gn"&400gns"#500',
+    '0(;leucine("u-"#100%!s$"49"!2"!3#!5#&64,718"!4##-30""50#!9"!9"%a-c-e',
+    '#.rginine-nitric$#mla"$bend"#c-r%!.#"ys"#day#"in$\'rection#&rivers"!e""f-#$orce#%uture(\'-tenses',
+    '+!."$held#"is""in$)structors#"sh"!k"!l#%-like%(odsworth%$unch#.actoperoxidase##eft#&icence$"fe',
+    '##ord$"ve&"rs"!m#\'arriage",n-monomethyl#,itroarginine"#o-g$#r-i$"ve"&peters#&resent"$rail#)egistered"!s',
+    '$$rine#%hapes$&ooting"&tensed$"rm$$ster&!s"&valine!$.0.4"+1049g-82-81""20"!4"!5##000#!m',
+    '"!8"!a#"./$$o.s.#)utumnalis"!b#%.s.c.$"w.##uck"!c#%.f.a.$!m#(aeruleus"$d.c.$"s.',
+    '#%avies"#g.\'$"c.$"j.$"m.$#o.c##ame""ii$!."&j.c.p.$"r."$l.d.$$f.e.#%l.lll"!m',
+    '$"g.$"r.#%odule"&n.e.r.#*o-of-weeks"#o.1$!s"#p.e$"g.$!t##api"&r.9c.p$$a.m.$"s."$s.d.',
+    '%$owry$"m.#\'coticum"!t##hey"#u.t""w.!\'/&ndash#\'pound;r"%2&ins"!3#*03/25/3002$)6/25/3005"#4in"#500',
+    '""ap"&britag""jg"!l"!n"!s#!i##t.g"!z!%0,000"%0,000#"ks##mph"$2882%!3',
+    '%!7%!8"!4"!5"$7126""cm"#ff.""lb!$1+bh#"cm"$,000#+310,000,000##450##500##650',
+    '"#-4p"".5"$/vc1"!0#$,000#+0&ndash;120$$,000#"11"!1#(,750,000#%0,000",20&ndash;150$$,000#,259&ndash;61##304',
+    '"*35,600,000")4,104,000$\'200,000#%0,000($,000#)1,000,000#)2,000,000#)7,000,000"!5#$,000#!0"%6,000#)0,000,000"!7#(,075,000',
+    '"!8#!0""90"!a"!b!#2\'s"$,100#\'800,000"#-sr"".6"!0#(,000,000#"00$"bn#)3,618,000',
+    '"!3#%0,000"%4:4:7"!5#%0,000""78"!p""r2!"3%"$,702"%.13.2#"30"\'0&deg;c#"07"!1',
+    '""33""64"!7"#8cs""9c#!s"!l!)4&ndash;5"(,200,000"#.25")0,000,000##0bc"!2"*36,700,000""40',
+    '#!5")8,000,000"!y!)5&ndash;2"(,050,000"*0&ndash;70*"80""33$+&ndash;1000"!5""60#)9,700,000"!9#&2-l655"#ces',
+    '!)6,700,000"!0#)&ndash;80"$4831"!5#!5"#6ds"#eds!#7\'s"*0&ndash;90#(,000,000#$3605$\'8-l7043""22"-37&ndash;l806',
+    '#"89"\'86-l8l6""th!)8,100,000"!0#$,000#!8""35""58"#6th""96"!e""th"#ver!"9%',
+    '""06#!p""18#!9")3,000,000#"0s#!7""45#!9"!5#*9&ndash;61"*63&ndash;7#!6#!7""70',
+    '#!7#!9""89""90$!s#!3#!6#!9"*th-century""xl!$:4:7"!7"\'and-out"#iii"#l:2',
+    '"\'0.1&deg&(ndash;6l"#109")342.5&deg"$5000"&96&deg"&flexes"#let!0a&iacute;nfiesta+!o#2zcaron;ansk&yacute"!\'"&-along#,de-da-accent(!s',
+    '#"mi#%roche((-sur-yon#+tour-du-pin#\'ver-lee"!.#$true"#/92#!c#$ncet##une""23""3+#$amon"!8',
+    '""aa##kin#%njarv#$ptac#&rbruch##vin"(b&eacute#&-coats$&ouring$%plant$$work##/ux##adi$"nt$%rbera',
+    '%"re%"te$!t$$uvie$"ye##ban$!e$!i$"ra$!u#$coat##den#$edan$$l-an&%mates',
+    '%$.the%9/packaging/advertisements\'&roduct%#dom%#ler\'"ss&$ing.%$mate%%s.the$!m$!n$)otropheus$!x#!i$&a-like',
+    '$&docera$"ed$*lle-guiard$(o-dental$&rintus$#sia#%latae$$ogic#&master#"oa$\'r-force%!a&%tiies\'/ories-developed*!o',
+    '+)equipment+(oriented+&reared%+de/director%"em%$inho&#sta("ic%!o%$tory$-uch&egrave;re%*lbenilales%3r&mdash;consumption-#pla\'+rehy;fianna',
+    '\'$very&$-(c)\'\'ashdown\'"by\'$camp("nd((ommunist*&ponent)#sts(\'reating\'*displacing)&viding\')effective()ncouraged()specially',
+    '\'(hoarding\'#ite\'#law(#eft("ib\'/market-clearing((igration\'*protection\'*recruiting\'(scarcity(\'hedding($tyle(%upply\'%teams(/ory-labour-tory',
+    ',#ist\'(winnable("on&-/conservative\'*management&(47109522&#ed-\'!z&\'ing-boy*%class\'#sts&(oriented&%slost&!t%"ti',
+    '$#wit#$pure#)ra-dormas%)dor-cross)*retrievers)$type(&/boxer(#ian)"ca$%idens%#ola%!t$)o-frontal%!k&!e',
+    '#)s-derived\'&signed$\'/tivoli%$unix$#ure$&ystems##tse#"un$%rnham&#ums$\'schange#"yr%)inth-like*&ridged)\'iformis',
+    '"(c(91)112(!2##aba$$ndon%.ian-influenced,%ormed&"sm(!\'$#yos$"ze#&cadive%"ic$!o%#hee%%liths',
+    '$%-bark&\'ordered%(collared\'#ver*"ed&%uffed%\'fringed\'%onted%&gushed%&makers%)patterned%&ruffed%\'schools%#top%$wing',
+    '$#cap$$less%#ike$$rbal%"da%"na%#tae$$ssit$,tableclothed$$wood$*y-thompson\'%opped%(/driving#%h.0/1$#ana',
+    '%#sse%"ud$"en&"al%!s$#ish$(rimatory%$ymal("ns\'#osa$$tain#"ie%!s$"ly$$nia.',
+    '("ed("um*,/perfoliatum$$ride#)k-a-daisy)!y%$love%"of\'--civilisation)&losure))onviction(&petrol)$ulse-!s((transfer',
+    '$&/award%&mother%&rector$-adaisicalness%!n%%wanna$!e%\'nbacher\'(y-picton%!r$#ham$#ies%#ngs$&luster$&winder',
+    '#!l$$aire$!e#!o$"me$#ude%)r-durfort#!p$!1#,quer-mounted(\'sprayed($work\'#ers\'$work#\'retelle',
+    '%$rnae$$oixs%+sse-playing$#yma\'!l##son#&tarium$#eus$\'ifundio$!o%/-ovo-vegetarian%%dorum%-ferrin-coated+1/anti-lactoferrin%%genic',
+    '%!r%!s&&e-free$$rile$#uca%%lose/&#soe#&unaire$0strine-dominated*&/marsh#!w#&y-look%)patterned$!s#%z&dgr',
+    '"*d-princess#%/lass#%akhis#%brook(!e#(der-back($ound(%ridge\'%frame\'&stile.\'$vein\'#way&$lock&#man\'"en',
+    '$!h$&iebuck#$eees&!z$&jinsky$#ned$!r$#tto$"ur$$veze#$ford#!h$#ope#(ies-wear&".p',
+    '\'#ear$)ng-letter&!s$%spoli#"ji#)le-handle##ock$!s#"ro##son#$usaw#/y&rehy;wrestler$!\'$)-boarders&"ug',
+    '%)hypnotist%$mass%6who-does-in-the-garden&%riter$%/your$)boyfriend\'!s%"ug&"rn$"es$$foot$%grove$#ish$"ki&%llies',
+    '$!s%$mock)!s#!z"%eders##ger#$laps$#ius##mle$#mle#$nsar##pol#!q#!r$"t.',
+    '%!e%!s$&ificat#"vi%%gator%$yata$!o"#fan#%cadio#(f-factor%&hungry%$riot$"ar&#gue$#ert',
+    '*%ibury+%rdlip*\'lakeney*\'urghill,%leigh)+cirencester*\'oleford,$wall+#rse)\'dursley*%ymock)&forest*\'rampton))innsworth)*leominster',
+    ',\'glevens+#wer)&madley+4lvern/worcestershire*&ombasa+.reton-in-marsh)\'nursing)\'orleans)(paradise*\'ershore))quedgeley)%seven*#lad)(tidenham)%upton',
+    '%"ty$"it#"is$#tau#%lamme##ont$.ucri&egrave;re#%ranca\'!e$&eniere#"ta##uma"\'g-ships#!a$#che',
+    '$\'illarde$,ni&egrave;re&#ere&#sde%"on$!r%"as$\'strella*!o$%varra#&enaria$.r-and-shouting&$type%\'/kellys%!e',
+    '%$gren%$lags\'"nd&#out%"s.%#ung$#sse#!g$#ans#!h$#ari$$etto$$nimi$#out#&isquet',
+    '##jag#"le#$more#$nano$)er&ograve%"ss$%iappe%"er$%uages$!y#&obolon$(dechiana$+nda-bentley$(on-style&$ward',
+    '#\'rangian#$uado$&balium$!e%#rre&$uela$$iole$&mdzija$#nes$#rus$!s#$well"(h-di-dah#"ah$"na',
+    '##ens#&iguera##lou#"ma$$eyer#!n$!a#$ofer$#re.$"ud##ual"&i-fook#,bach-trieste$"le$#ons',
+    '%"ze#,d&mdash;when$#-in$,law-thompson\',/oxfordshire%"ey%"ow$"on#!e##gap##kin%$piak##lat&!i#*me/project',
+    '$#ins$$onis#%n-out$!a$)e-dempsey%!s$$gian(!s$!i$%sbury$#ton$%yamok##que#"r.$-a&ndash;based',
+    '\'!s$#igs%$ness$!n$6s-hairv-lunch-vair-soo#+ss&eacute;s%!e&!r&,z&rehy;faire\'!-(%aller(&passer\'%faire$\'teridge%"on',
+    '%#tti$/hwaite/ram-raid$$iers$#ues"!j#\'eunesse""ka$"to#%e-arm%$calm\'\'tchment(#tle%$edge%%fresh%(sediment',
+    '$%bound$&comers$)daimonion,!s$%house$$lady&*nd/british("er%#ord(!s$#mba$(nvelders$%smere#!h$-ani/newsagent',
+    '$#ear$!s#&kolith#(m&eacute$!e#&offian$$nian(!s#*rivikirana$#ori#%shman&!e&*inarayanan$"mi$$pray',
+    '$!a"$lain&!g$"ng%#ier$#tta$"ua#%denga##ika$#nde$!t%"ha#"la%"ns$#iam',
+    '$!s$0y&rehy;tollendal%\'gagging#!o$"ux$)vi&cacute#!s$$ingh##ume",m&eacute;-ed,\'shirted+!s$%ndash#)-1/mel-14##a/a',
+    '$"de$"ir%#son$#lie$$rack%&ckenis&$lusm%"ia%$kian%)ov&aacute$"ze#*b&mdash;so$1\'s-wool-sweatered$\'-barrel%*production',
+    '%\'to-lamb%$wool$*/christies&$olin%/gloucestershire%"ha$#ard&#ene&!t%#ste\'!s%%yeque$$chop$%da-mu\'%phage',
+    '%"en%#oid$(e/wyvern%"ck%!g%$ntly%#rt-(#way\'(/bentley(&former%"sc%#ths$$hill$"in$$like',
+    '%#dar%,itepetroleum%!k%\'urghini($inis\'\'n-based((e/system$$rate%$echt%#igg$&s.john%$hill%$kins%%water##din',
+    '$"ck$%d-vov$#ere$"ko$!l%"ie%(lar-like&\'ibranch-!s\'$corn$!n%+ess&mdash;a%\'tacions\'&tiones&"ez',
+    '\'!n$$sley#$ford##iae%!s&$trum$#dey$"le$#nas&*te/overlay%.g&lsqb;00&rsqb&#ton%$inin%!s#!l',
+    '##mar$\'ergeirs($yers&$side$1lisbrunnenstrasse#)ont-brown\'\'doherty\'0gregory/inventor&,/chairperson&$able&!e$$rall%$isse%"na$!t',
+    '&!e#\'p-boats&\'rackets%)fishermen%&holder+!s\'%using%#man%#oil%\'pendant%&shells&&mudges&\'tandard%\'trimmer$!.',
+    '%$drio%"ke%/ng&ndash;chiang%$rski%"ss$%bases%$lack%$rush$!e%#rti%!s%-ter/liverpool&!t$%holes$#iao',
+    '%$augh%#ess%\'ighting%$ughs$!o%-detonmiocenic%!n&!g%#rts$%post.$%recht&"ll%%idius%%oitic&$myia',
+    '$&s-tail$$trai$"ue%"ki#$rock#$stor#$umba$,ni&egrave;re#%worth"-n&rehy;caster)(kan-born#%\'lord#)-attached$(specific%&tation',
+    '$#wan#$acka$!e$#gan$#ken$!o$-quarelle140lb$-rkshire-based+!.+)/ayrshire$"ud$#voi#&carfan%.shire-accented+2north-of-the-sands',
+    '*)/wildfowl*$ness\'%shire&$ter\')!-*(easegill*%leeds*+oslo/bergen),/oslo-bergen)#ian\'&ienses\'"on\'#ria**n-in-exile$(e-length',
+    '%)/corporal%$head%(let-like)%shape&$oata\'1t&mdash;guinevere(!t%.t&rehy;pointed&\'-arched&!/%$wood$\'hashire%#eck&!r&!s',
+    '%%onete$*ia-ferrari&!.%"en%"ty$#ker$"ro$)s-railway#-d&aacute;zuri%2mdash;adjudication,*pplication%*rehy;lords*$mark*&owning*(slipping',
+    '&"ir&)llocation&&nd-air)%water\'%imals&"rt&\'ssembly%$bird&%reeze%%claim&\'onflict((trolling&#rab)!s%\'dealers',
+    '&%rains&#ues%)exploring%%fills&&orming)!s%%going&#rab)!s("ss%\'hoarder%+improvement&(ntensive%&leases&#ine',
+    '%\'mapping\'$rket&$ined\'"ss&%obile%*occupation/!s&*f-the-free\'&ficers%(prepared%\'quality%*reclaimer..!s*&mation\',distribution',
+    '\'\'quiring&%ights%%sales&"ea\'&ttling&\'hortage&%natch&\'urfaces(#vey%#tax&"he%%usage%)weathered&&orkers)#ing',
+    '%!l%#the$#/4m%(building-!s%$open%%range%%unhcr$#ale$%beach%$irds%$orne&#und$$corp$%ed-as',
+    '%%gfahr%%lijke&!s%!n&#bau%#rcy%+sarbeitsamt&\'gericht)&niende&)hauptmann&*k/openview\'$arte&$mann&$ring&&sender',
+    '$%fight&#ll.%"ul$\'gasthof%&ericht%$raaf\'!f$%hurst$"ie&!s%!m%#ng-(%craft($fees($gear',
+    ')%oints($ramp&!i%#var$!l%*ady/lodger%"er%&ocking&!r\'/d&mdash;peasant/$serf/&tenant()-citizens)-entrepreneurs))influence',
+    ')(peasants(!.(!/))developer("s/**commission**landladies)#hip&#wer%&ubbing$#man\'!n&$rket(#ing(\'s&mdash',
+    '%#ver%$wers&+ner-peasant)#.we)\'s&mdash0#;of**/occupiers$$port$)r&auml;te%&angers%*um-griffin%)yexternal$(s-berger&9next-door-making-a-racket%!.',
+    '&"le&#t-1(!5%$bank&%erger&&orough%-cape&mdash;it)0-abstractionists+-s-real-estate*)conscious*\'forming*)gardening*(inspired*$mode,&vement',
+    '*)sensitive+$pace*$this)\'/nature)&s-oils+\'pastels*!.*!/)!y&$hape%$eers&"nd%$ford%.gemeinde&mdash%$hips',
+    '%&liding%#men%.organisasjonen-&tionen%%ports%\'stryrid\'$yrid%-teiner-levine&#urm%%urfer$#the$!u%#dno$\'waiters%0irtschaftskammer',
+    '%#end(!s%#fox$!/%*consultant\'%wards%*strawberry%$taxi%%ultra%$work$!1%!1$(crossing$(rchymedd%$ossi',
+    '%)1&ndash;4$&thorpe#(fairpwll$#ill#\'gabrugh%#nes&"ky%"ra&!d%$uage)!s$%baine&#ugh%$urgh$&caster',
+    '%$ombe$\'don-fox\'&/actor(%tandy$$eais%!e%$legh&"la%#nau&%brink&&derfer\'$ries&$kamp&&mantel&%salza',
+    '%!s&%traat%"te%"wj$,ford/cyclist)/gloucestershire)%peggy$$hame&!n\'!s(&\'-type%#ill%$oltz$+j&ouml;kull$$lade',
+    '$/nau-im-emmental%\'itschke$&obards%$iran%"ld%!n%"or%$rous%0ustine-flavoured$$rand\'"ge%$eder&"nn&!x%#ick',
+    '$$sale%#ett%%fords%%hanks%%kaill%#ley%$taff)%/head)!e&%rasse\'\'othdale$$tang%$horn%"om%*ry-langton',
+    '/#for)*rehy;users/(tterance(&(pmdl)(%-\'the)#95%)*collecting*\'rossing**um-posture)\'delayed*)isordered)&export)&family*\'ocussed)&groups',
+    ')\'learner)(material*\'ediated*%ixing)"or+(ientated/"ed)(planning*(roducers)&strata,&ucture)$talk*&eacher**ransmitted)$work',
+    '),presentation)&script(#_at(\'s:dutch*\'english(%using%/edoc-roussillon)+/roussillon)#ian,!s%"ir%$ysch$$wood%#yth$#yng',
+    '#$igan%$erum$"ka$"no$-stes-dwellers.#ing$#vet#(k-haired$+a&rehy;born%!\'%)/maldives$%combe$$elly$$heit$#ily',
+    '$!s#&livery$#ord$!y#\'manager##nan$!e%!a%!s%!t%*y/daughter$)ing/civil$"og%!y&!e',
+    '#!o#%quest#"re#"sa%$llos$&bergis%$ury.(!s$$dale%#ell$"eh%!r$$ight%"um$#key',
+    '$"sa$&tastic&$tion%&reamer#%tbert$"er&\'n-horns(+illuminated(%light*!t\'#ist*!s\'-s/floodlights$#ing$&onment',
+    '%!s$#yan#"uf$!m#)workplace#$xade#!y##zas$!e%"ar%$nhof$$hou.$!i%!n"%o-tze',
+    '##der$$icea%$keia##gai$!h%"al%#ire#)hapairojn#%irinn##kay#"li#$maye#\'n-reims#"re%#tti',
+    '#!u$"al&!i$%ssine#!w"+p&rehy;dogs#)-boarding%%y-lap$\'lap-lap%#ink$!m$)of-luxury$%slide$$tops%#ype',
+    '#%acoho$#lme$"ng$)roscopies&#tmy\'%omies$$thum#)el-badges$"rs$#yra##ful#.i&eacute;rouse$$cero%$idae$%daric',
+    '("um)!s($zing&#ted&&verunt$"es$%llius&#us.$"ne&!r$(s-lazuli$$thae##kin#\'lagrene%$nche',
+    '$"ey$&inking#(oroscopy%,te-forbidden\'!a#-paj&acirc;rvi$"el%"rs$\'ingford\'!s#!r$(imaudaye$(oscropes#(se-rates%$cure',
+    '$!y#&thorne#%uerta$$rdum#)wing-like\'"s.$-orth/director))technical#"yx"&quelle",rachantivore$!d$$mide#$bash$#eit',
+    '$!y#&cenous$$hlap$#ker$"om&"be#*d-coloured%$like%$rock%%slice$\'buckets$#eau%$d-on%+r&mdash;let&%-work',
+    '%%zabal$)ner-bruke$#ong#$e/es$%dello$"ge$#nde%!s%#tiu&!y#!f#!g$%actyl%%linny$*e&mdash;if',
+    '&+rehy;angled+%sized%%-area(&mchair&\'bellied\'%odied\'&rimmed&+circulation\'#ore&%eared&%faced\'$ield\'%ooted\'$rame&%gauge',
+    '&#ish&&leafed)#ved\'%imbed&&memory\'&outhed&&necked\'$osed&"or&(ranching)"ge&$sale\'%caled\'%eeded\'\'ounding',
+    '&$town\'#ype&\'village\')ocabulary&\'wheeled\'\'indowed%!.%$hole%#ish%*ly-aborted)\'ttended()conscious((departed(&hidden(*illiterate',
+    '(,quantitative(%rural((separate(%urban%#ned%(r-sample($hare\'/than-life-sized,\'natural-%ormal,&screen&%/more%#sce&(se-money(!s',
+    '((capacity(&fanged(+is-smallest(%known()remaining\'\'subunit%!t&!s$"ie%-lli&egrave;re(#ere$\'s-based\'$ound#0iboisi&egrave;re$$dae.',
+    '$!n%"ae%!e$$ssae$"ve%+i&egrave;re$!x#\'k\'-like$&-peaks$!e$#ham\')/formerly$)in/hoople\'\'meteors$$mead',
+    '%%denne%#ong#$ling$!y##man$$inat&!g#2ne&ndash;stranraer%(-belfast&)cairnryan$#ing#+ochfoucauld$"se%"se$#uge',
+    '#$pool#"ra%\'coechea%!d%"gy%#ona%%zabal$$etta&#xea$"ie%&kinism%$ston$*ousse-lola$#son$"ue',
+    '$"ys#(s-boerje$$chla$*en-freeman&\'/jensen$#sen%#ons$&werner#0tin/worcestshire#"ua#)val-stage%#tus$&icides%!k#%woods',
+    '#%ygeus$)ngography\'&scopic($tomy##zac"(s-cannon$&pulses#%agnas$$ntha$#ulx#%beams#%caigh%$nnon%"ri\'!s',
+    '$(ivissimo$!o#"ed$#gue$\'r-beams\'#lue&(engraved\'%tched&%fried&%light+!s&\'painted\')rogrammed&\'quality&\'ranging',
+    '\'$ifle&$scan)\'ttering\'$tyle&&tissue%!.%#aze%$bolt\'#ost(!t%#cel%$disc%$fair%"go%"ia',
+    '%%media%"na%\'printer\'!o%$scan&$harp\'&ooting$"st&#ein#"go#%h-out%(stitched%#ups$"an$(building',
+    '$$ing.$$kari$$mere$!t%)hickening$$worm#$ing.%"io$&ocarpa)"us%%mmata\'$osta#$kill%!n$#ovo',
+    '#-lett/chairman#!m$#acs%-s-iresco-cnrs$(o-backed&(operated%"1s#(ocarpium$!k$#oed#+s&egrave;re$%aigne%"le%"ne%#rat',
+    '$$berg$/egueinformation$"ia%$ter.$"on%!o&"ed&!n%!u$!u$\'wellian$!y#\'t&mdash%+rehy;wicket$!\'',
+    '&+mong-equals%$ball&0reath-of-a-dying%\'century&%omers%,day-of-peace%%eight&"nd%&flight&#our%$gate&$rasp%"in%$kick&$nown',
+    '&"eg&#ick\'"ke%&making\'#tch&%oment\'"ve%&named\'&4ight-of-the-prommers%2of-the-summer-wine%&period%$race&\'eceived\'"el%+six-colours',
+    '%$time)&-leave&.o-be-colonized(%first%$year$&.crash$)/director%$pace$$able$!e%!s&!t$\'ilaivan%#ng.\'$ness',
+    '$$ours%#vka&!o$*s&mdash;or#"ya"%t-ent#,.53&deg;20\'n#)/long-lop#$adas$*pie-flurin$#sha%!i#!c$&h-like%%cords',
+    '%&string#-e&ndash;night%,rehy;morning$%-\'70s\'!5\'!6%$15th&+7th-century&#935\'#40s\'#50s\'"70(!7\'"80(!8',
+    '%\'antique&\'rriving&%ugust\'$tumn%\'baroque&(eethoven&\'looming&&ooking&&raking&\'usiness%*caledonian\'(pitalist\'$reer&(lassical\'"ub',
+    '&$ycle%)developer.!s,#ing)%nsian%(eleventh-(-century\')izabethan&"ra%&feudal&0ifteenth-century)"h-)#ies,./early-sixties-\'sixties',
+    '&%ormed\'0urteenth-century*"h-%\'hitting&#our%(imperial&)n-the-day\'(dustrial%$july\'\'ne/july%&landed&\'eaching%%march(%rying&%iddle',
+    '&%oving%.nineteenth-and%%offer&$rder%&paying($ment&+ost-glacial%)returning&\'ipening&%ococo\')manticism%)secondary\'1venteenth-century&$hift&&tarter',
+    '&%unday%\'tackled*#ing&$eens\'+nth-century\'"rm&1hird/early-fourth&\'riassic&%urner&#ype%$week$&/early%"go$%1960s&#80s',
+    '$$come\'#ing$!d$\'en-sail$\'glacial$#ish$(lamented%#ier$!n%#cy.%*t-learning$%order$+r&mdash;the%!\'%!-',
+    '&)canonised&#day\')eveloping\'&rilled&*eighteenth&&formed&\'learned\'#ife&)notorious&)occurring&(probably&&second(%veral\'+uccessional&$that',
+    '&#the%\'al-line((thinking\'\'ization\'-ly-continuous*\'growing&%nense\'!o%!e%)ilisation&#tic(#sed%#lie&!y%!o',
+    '&)sternites$%saver%9t-issue-in-file&lsqb;file&!e$(x-backed&&coated$"yn#%fwala#&h-back$!a%$llan%"ms%!n$$bury$(e-turned',
+    '%".i%$r-up&#ham&!y$!i%!s$(killdale$$lean$#rop#0i&lsqb;tude&rsqb$&cework$$fola\'#ius%&undios)#sts',
+    '$"n\'%!-&\'america&&celtic&\'derived&+ethnic-rock&*influenced&&lovers&$ness&(speakers&&texted%"es%$isms&&zation\'!e',
+    '($nglo&)americana%%skaia$"or$#rel$)tudes.the$"ve##kis$,owski/novice(!y#%logan##ona$#rre$$uche%"ka',
+    '$!w#\'rabjarg$(odectism%%genic%"ne&"ic#$sami#!t$!.$$akia$\'er-they&#.60&&barrow%!s$!i',
+    '-%works(%print()theoretic%)sbeaudire&#hub&$ring&%views#2via&mdash;latvijas-*recognized&+n-recruited##yne#)zelberger"#uan#$bade$$rich',
+    '$!k#&da-air&\'singing%#mus$#ese&#man$&ianism%#bus$#num#*e-langevin%$paul$%nberg#,fbahngruppen$"en$!s',
+    '$%erson%#sen&"on$"h-&(a-second&1behind-your-hands&$hole&"on%"am\'%inute%,ing-dislikes)$eyed)$with(%stock-!s',
+    '&(er&mdash(+-freezingly)$line-!d)%maker)+stimulation)$wise(!/)*explosions)4jokes/laughter/jokes($less(%maker%!y#%ingen$$tzer',
+    '$!o##loa#!n$&ch-aid((nd-leave&!d&(ed/after&+ing/landing$"de%\'romatte&\'y-steam\'\'/boiler\'$work$"ey$&jrette',
+    '#*r&eacute;n$)-prunella$#a\'a%"na%"si$$eano%\'l-black%*n&ccedil;o&&cekrik($town\'$inus(!o&#son&"t-((designed',
+    '\'!.\'!i(!a)"ns(!i)!s%%sheim%!t%"us$%hibar$"ia%%catus%"en&\'rgracht&!s',
+    '&!a&"da%"ot%!s%$tzen\'#sen%"um$(ocerasus$#sen$\'ustines$*yldimethyl#-sanne-trained$"on$$tsen#\'tenbach',
+    '%"rn&&wasser$,reamontesque&"cs#\'wersoog#!x#$zeta$#ier"+v&eacute;ra#(a-carved%&filled%&strewn$"bo$%forms$&l-like',
+    '%!e%!s$#mat$%ndaia&!e&"ou&#ula)$ceus$#rsi$%sseur%#tre$#tch%*ory-gothic)$legs)#pan',
+    '$#zza#%e-net($tin\'$#dan$\'issiere$%lanet%#eye$!n%5der-and-white-striped)(flowered)%green,!y)\'scented("ed(!y',
+    '$"ra&"ck&!n%#ick&"ng%!n%"se%"ys#%inium$!s%+hly-endowed)(packaged*\'roduced#%orato$$slav',
+    '%%nchuk$"is$%ovsky$(ushinsky##ski#!u##yne"0w&lsqb;y&rsqb;er$)mdash;the##(s)##-80$\'abiders(%ingly+$ness%+djudication',
+    '%%ender%$ooks&#und$$case%\'hanging%*onfinement%\'reating*"on$)dominated$)economics%(nforcing$$free$.implementation$\'machine&)intenance',
+    '$(oriented$&reform&%lated$&school$\'village#-.150&mdash;in$!2$"it#\'/outlaw%%xford$&parish$#son##533#&agetas$!l',
+    '##day#&efield$$nham#%feldt$0ully-established$"yl#&givers&#ing#$head\'!s##ick#"ji#)ley/kenny#+n-adornment%&meadow',
+    ',#ing%(watering$"et$&makers$$rake#%point#)rance/raf$"el%$nce\'(&-great)%price((/british)\'england)$fast)&mother',
+    ')&oxford)\'retired)$tccb*#est(%field(#son\'#ian$%inson$#nce#"s\'$&-giver$$.the$)affecting$(on(1980)&%-made',
+    '&"ia("na\'!i$$uit.##tex$%horne$2on-mijatovi&cacute&!s#3yer&rehy;freeholder&,-freeholders\'*influenced\'$like\'\'manager("ps\'&priest',
+    '\'*seneschals((tatesman)#ood\'1turned-journalist&*/economist\'\'witness&#ism&5s-turned-smallholders\'+/stephenson"-xa&rehy;tives#%daela#&enburg%$oxen##ing##ley',
+    '$"lt#$tons"*y&rehy;out#%-away$$back%&rother$$down$)economist%!t$$flat$"in$#man\'%agers%(issioner$"on',
+    '$&people&$rson%\'reacher$(visiting$%woman\'"en##.on#$_for#%arion#&bourne$\'rothers$#urn#%deker(!i$#own',
+    '##edh$,r-de-la-haye\'\'ressing&$free&#out%$ings%"s.#$flat##gal#(ing-bare\'"in##kin$#old#$mans$#ore',
+    '#$olle$!n$"un%+t&mdash;but&)/lighting#*secahealth$$haft$%talls%"on#*ton/father\'&mother\'%pilot%"wn#"up##wer',
+    '""za$#ire$#lle$&r-like%#d\'s%#eff&"ne&#vic%$idis&"s.%%tique%\'us-like\'!/#"da#&e-rock',
+    '$(r-loving%$dale%!s%$type#$iali$*ly-written#!o##rus##slo#%urite#%y-bed%#cow%%daisy%&lidded%(sounding',
+    '\'"ne$"lo!(b&amp;sc"0(455&ndash;570g)"%-plus""/4#"ft""=1$!6##454"$arra"!d""es"$f/in""ga',
+    '"!l"!m"!p#"-8##8ii"$s/ft$$head"!t#!c"%uklod#!t"!v"!y!$c-6a##900',
+    '#,keratinocyte##lec#2my&mdash;communist"!."#/sd"%3200d"#580""at"!b#!c",c-subsidized#+i-appointed#!s"(d-screen"#fga',
+    '"\'h-based"$i(l)#"ii#!s"!l"!m",p/norrington"%r200s"#sts"!u!"d1"!3"$a-01$#500"$c278',
+    '$$/ggt"!e"!f""lp"#mts""os"-p-komeito-dsp$%laban$)sponsored%(upported""r."!t"4u/adi&mdash;alliance""vp!,e&ccedil;ons',
+    '+,g&oacute;mez$\'grave;r"#(s)"!-#&breche##eft#%grand#$mail#$sars#(whatever"#/rp"!1#"10#%2,009$!5',
+    '"!2#"50"!3""66"!7#*20,000,000"!8#$,650""99"+a-appointed$%close$\'francis%%unded$(inspired$*maintained',
+    '#$/des$\'reading#&bridge#&chates%\'ed-away%%field$$ocks%!n#-d-as-tripwire%&butler%\'chamber&\'oloured\'(ntaining*\'minated\'"re',
+    '%%glass(#zed&#rey&\'uzzling%"he%)in-petrol\')dium-gold($uced%&keeled%%laden&$ight\'"ke%,organisation&#ut\'%\'painted',
+    '&&laying&(oisoning\'&lluted%(screened&%inger&$oled&&tories\'\'ripping%\'tainted&$imes\'!n&!o%*underwrite%(workings%$zinc',
+    '*&silver$%/bass%#tin$(:complex$!a',
 )
@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_71 = (
+count_71 = 6694
+
+heads_71 = (
     'isambert',
-    'isandhlwana',
-    'isandlwana',
-    'isangi',
-    'isapm',
-    'isar',
-    'isas4',
-    'isatis',
-    'isatvan',
-    'isb',
-    'isba',
-    'isblike',
-    'isbns',
-    'isbrandtsen-moller',
-    'isc-ufc',
-    'iscador',
     'iscandri',
-    'iscd',
-    'ischenoos',
-    'ischgl',
-    'ischigualastia',
-    'ischigualasto-villa',
-    'ischio-pubic',
-    'ischium-pubis',
-    'ischnosiphon',
-    'iscia',
-    'iscussion',
-    'isdata',
-    'isdn-based',
-    'isdn-linked',
-    'isdn-type',
-    'ise-majandav',
     'isec',
-    'isee',
-    'iseler',
-    'iselham',
-    'iselin',
-    'isenberg',
-    'isenburg',
-    'isenthal',
-    'iseo',
-    'isere',
-    'iserlohn',
-    'iseveryone',
-    'isfaham',
-    'isfahans',
-    'isfet',
-    'isfets',
     'isfjorden',
-    'isflurane',
-    'isfrank',
-    'ishamel',
-    'isherwood/new',
-    'ishikawajima',
-    'ishin',
-    'ishitu',
-    'ishkal',
-    'ishkent',
-    'ishkoonee',
-    'ishlam',
-    'ishmaeli',
-    'ishmaels',
-    'ishmail',
-    'ishoulder',
     'ishpeming',
-    'ishtiaq',
-    'isi60a',
-    'isiah',
-    'isiboro',
-    'isic',
-    'iside',
-    'isil-kul',
-    'isin',
-    'ising',
-    'isireli',
-    'isis-osiris',
-    'isis2',
-    'isjlike',
-    'iskandria',
-    'iskra-2',
     'iskras',
-    'iskumtselauk',
-    'iskusstvoznaniye',
-    'isl2,500',
-    'islad.',
-    'islagiatt',
-    'islam-oriented',
-    'islambouli',
-    'islamic-based',
-    'islamica',
-    'islamicised',
-    'islamicized',
-    'islamics',
-    'islamieducation',
-    'islamische',
-    'islamism',
     'islamologists',
-    'islamovic',
-    'islan',
-    'island\'s',
-    'island(s)',
-    'island-branded',
-    'island-bred',
-    'island-clad',
-    'island-compatible',
-    'island-dwellers',
-    'island-empire',
-    'island-full',
-    'island-groups',
-    'island-hoppers',
-    'island-lovers',
-    'island-princess',
     'island-studded',
-    'island-style',
-    'island/underpass',
-    'islanding',
-    'islandmagee',
-    'islands&mdash;the',
-    'islands-based',
-    'islands/scotland',
-    'islandshires',
-    'islay-ballycastle',
-    'islds.',
-    'isleham',
-    'isleornsay',
-    'isles-i',
-    'isles.',
-    'islikely',
     'islimi',
-    'islington-white',
-    'islington.',
-    'islingtonwards',
-    'islywn',
-    'ismand',
-    'ismat',
-    'ismatullayev',
-    'ismet-duygu',
-    'ismoil',
-    'ismp',
-    'isn\'t&mdash;and',
-    'isn\'t-',
-    'isn\'t-everything-a-drag-smile',
-    'isn\'t.',
-    'isna',
     'isna\'',
-    'isnik',
-    'isnot',
-    'isnow',
-    'iso&rehy;lationism',
-    'iso-17-carbon-monoenic',
-    'iso-17-carbon-monoenoic',
-    'iso-compliant',
-    'iso-concentration',
-    'iso-electric',
-    'iso-line',
-    'iso-osmolar',
-    'iso-osmotic',
-    'iso-quinolone',
-    'iso-reflectances',
-    'iso/dsa',
     'iso6937',
-    'iso879',
-    'iso9000&ndash;3',
-    'iso9001-guidelines',
-    'iso9002/bs5750',
-    'iso901',
-    'isoamylalcohol',
-    'isobar',
-    'isobutyl',
-    'isobutyl-2-cyanoacrylate',
-    'isobutylmethlxanthine',
-    'isobutylmethylxanthine',
-    'isobutyraldehyde',
-    'isobutyric',
-    'isocar',
-    'isochores',
     'isocolic',
-    'isocolon',
-    'isocost',
-    'isocyantes',
-    'isoda',
-    'isodore',
-    'isodorus',
-    'isodrin',
-    'isoethionates',
-    'isoflurance',
-    'isoform.',
-    'isogloss',
-    'isoglucose',
-    'isogonal',
-    'isohexane',
-    'isohookana-asunmaa',
     'isohyet',
-    'isoimmunised',
-    'isok.',
-    'isokrateian',
-    'isolable',
-    'isolated-word',
-    'isolatedfrom',
-    'isolation-rearing',
-    'isolation-unit',
-    'isolation.',
-    'isolatory',
-    'isoldes',
-    'isoline',
-    'isolino',
-    'isolt',
-    'isomass',
     'isomeric',
-    'isomerizes',
-    'isometrically',
-    'isometrix',
-    'isomil',
-    'isomorph',
-    'isomune-ck',
-    'isonazid',
-    'isonomia',
-    'isop',
-    'isopachous',
-    'isoperistaltic',
-    'isophorone',
-    'isophotes',
-    'isophthalic',
-    'isopod',
     'isopora',
-    'isoprenaline',
-    'isoprenoxyl',
-    'isopropyl-',
-    'isopropyl-&bgr;-sd-thiogalactopyranoside',
-    'isopropylthio-&bgr;-d-galactoside',
-    'isopterists',
-    'isorhythmic',
-    'isorohu',
-    'isos',
-    'isosaki',
-    'isosorbide',
-    'isosporiasis',
-    'isotachic',
-    'isothalic',
-    'isothermally',
     'isothermic',
-    'isothiocyanate-',
-    'isothiocynate',
-    'isothiocynate/cesium',
-    'isotopically-substituted',
-    'isotretinoin',
-    'isotropically',
-    'isou',
-    'isould',
-    'isovaleric',
-    'isoview',
-    'isovitalex',
-    'isoxanthopterin',
-    'isoxsuprine',
-    'isoxymogens',
-    'isozaki/james',
     'isozymogen',
-    'ispaghula',
-    'isparion',
-    'isparta',
-    'ispbx',
-    'ispc/860',
-    'ispersuaded',
-    'ispo',
-    'isporock',
-    'ispwich',
-    'isra&euml;ls',
-    'israel-british',
-    'israel-hezbollah',
-    'israel-palestine',
-    'israel-palestinians',
-    'israel-us',
     'israel/france',
-    'israel/germany',
-    'israel/occupied',
-    'israeli&ndash;lebanese',
-    'israeli-administered',
-    'israeli-allied',
-    'israeli-american',
-    'israeli-armed',
-    'israeli-born',
-    'israeli-iranian',
-    'israeli-made',
-    'israeli-managed',
-    'israeli-produced',
-    'israeli-proxy',
-    'israeli-sla',
-    'israeli-trained',
     'israeli4n/a',
-    'israelian',
-    'israelis\'',
-    'israelis.',
-    'israelitish',
-    'isredit',
-    'isro',
-    'iss-ues',
-    'issaf',
-    'issah',
-    'issajenko',
-    'issake',
-    'issangar',
-    'issaq-dominated',
-    'isse',
-    'issed',
     'isserre',
-    'issever',
-    'isshiki',
-    'isshu',
-    'issiac',
-    'issimos',
-    'issing',
-    'issittrup-partii',
-    'isslike',
-    'issloin',
-    'issobel',
-    'issor',
-    'issouf',
-    'isss',
-    'isssued',
-    'issue&rehy;also',
     'issue(s)',
-    'issue-agenda',
-    'issue-mongers',
-    'issue.s',
-    'issue/end',
-    'issue/topic',
-    'issue/topic/',
-    'issued-based',
-    'issued.in',
-    'issued_by_the',
-    'issueis',
-    'issues-domestic',
-    'issues-the',
-    'issues.',
-    'issues/techniques/work',
-    'issuses',
     'issyk-koul',
-    'issyk-kul',
-    'issyl-kum',
-    'issyvoo',
-    'ista',
-    'istanbul-ankara',
-    'istanbul-based',
-    'istap',
-    'istarted',
-    'istavan',
-    'istd',
-    'iste',
-    'iste\'',
-    'isteri',
-    'istid',
-    'istituzioni',
     'isto',
-    'istochnik',
-    'istok',
-    'istres',
-    'istromenti',
-    'istructe',
-    'istruttore',
-    'istruzione',
-    'isue',
-    'isued',
-    'isuele',
-    'isuggest',
-    'isurium',
-    'isvar',
-    'iswallow',
-    'iswari',
     'iswi',
-    'iswprke',
-    'isyn',
-    'iszvestiya',
-    'it&auml;-suomalainen',
-    'it&lsqb;s',
-    'it&mdash;anna',
-    'it&mdash;at',
-    'it&mdash;he',
-    'it&mdash;the',
-    'it&mdash;there',
-    'it&mdash;this',
-    'it&ndash',
-    'it&rehy;his',
-    'it\'s',
-    'it\'s-a-knockout',
     'it\'s-christopher',
-    'it\'s-four-o\'clock-so-i-must-want-a-biscuit',
-    'it\'s-only-your-age',
-    'it\'s-so',
-    'it\'s_a_bit',
-    'it\'scaused',
-    'it\'sh',
-    'it\'sss',
-    'it\'th',
-    'it-an',
-    'it-and',
-    'it-as',
-    'it-aware',
-    'it-baldwin',
-    'it-clefts',
-    'it-col',
     'it-colonel',
-    'it-dominated',
-    'it-except',
-    'it-feminine',
-    'it-he',
-    'it-it',
-    'it-it-it',
-    'it-mean',
-    'it-might',
-    'it-modern',
-    'it-must-be-something-we-eat',
-    'it-of',
-    'it-painfully',
-    'it-pious',
-    'it-s',
-    'it-smaller',
     'it-some',
-    'it-they',
-    'it.1',
-    'it.5',
-    'it.and',
-    'it.can',
-    'it.erm',
-    'it.ii',
-    'it.in',
-    'it.indeed',
-    'it.l',
-    'it.one',
-    'it.pc',
-    'it.s',
-    'it.sheff',
-    'it.starred',
     'it.supports',
-    'it.there',
-    'it.within',
-    'it.you',
-    'it/i',
-    'it/its/itself',
-    'it/lob',
-    'it/place',
-    'it/s',
-    'it/you',
-    'it1',
-    'it2000',
-    'it26',
-    'it3',
-    'it32',
-    'it33',
     'it50',
-    'it51',
-    'it56',
-    'it_all',
-    'it_all_the',
-    'it_and',
-    'it_as',
-    'it_as_it',
-    'it_because',
-    'it_just',
-    'it_no',
-    'it_over',
-    'it_so',
-    'it_sort',
-    'it_up',
-    'ita&rehy;initiated',
     'itabira',
-    'itae',
-    'itaip&uacute',
-    'ital.',
-    'itala',
-    'itale',
-    'italgas',
-    'italia-bound',
-    'italian-albanian',
-    'italian-american',
-    'italian-austrian',
-    'italian-benelux',
-    'italian-bound',
-    'italian-british',
-    'italian-built',
-    'italian-controlled',
     'italian-cut',
-    'italian-educated',
-    'italian-english',
-    'italian-french',
-    'italian-german',
-    'italian-gone-la',
-    'italian-held',
-    'italian-influenced',
-    'italian-iranian',
-    'italian-irish',
-    'italian-language',
-    'italian-lookin\'',
-    'italian-mannered',
-    'italian-occupied',
-    'italian-operated',
-    'italian-orientated',
     'italian-printed',
-    'italian-produced',
-    'italian-related',
-    'italian-restaurant',
-    'italian-sausage',
-    'italian-soviet',
-    'italian-spanish',
-    'italian-swiss',
-    'italian/german',
-    'italian/new',
-    'italian/swiss',
-    'italian1',
-    'italianato',
-    'italiane',
-    'italianers',
-    'italianised',
     'italianness',
-    'italians-but',
-    'italicarum',
-    'italicisation',
-    'italicizes',
-    'italienische',
-    'italienischen',
-    'italies',
-    'italinate',
-    'italinskii',
-    'itallabout',
-    'italo-abyssinian',
-    'italo-albanese',
-    'italo-american',
-    'italo-argentine',
-    'italo-austrian',
     'italo-celtic',
-    'italo-ethiopian',
-    'italo-french',
-    'italo-geometric',
-    'italo-german',
-    'italo-spanish',
-    'italplanning',
-    'itals',
-    'italsolar',
-    'italstat',
-    'italvital',
-    'italy**',
-    'italy-bound',
-    'italy-brazil',
-    'italy.and',
-    'italyin',
     'italys',
-    'itang',
-    'itap&eacute',
-    'itaparica',
-    'itat',
-    'itaya',
-    'itchiest',
-    'itchy-footed',
-    'itd/dti',
-    'itdg',
-    'itela',
-    'itelf',
-    'itelligible',
-    'item-of-service',
-    'item-specific',
-    'item-that',
     'item/mass',
-    'itemed',
-    'itemimized',
-    'itemizes',
-    'itemm',
-    'itemries',
-    'items1102.6',
-    'iten',
-    'itenary',
-    'itends',
-    'itens',
-    'iterable',
-    'iterates',
-    'iteratives',
-    'iteroparous',
-    'iterpolated',
     'ites',
-    'itfalls',
-    'ith&oacute;0me',
-    'ithana',
-    'ithink',
-    'ithna',
-    'ithominae',
-    'ithongo',
-    'ithoot',
-    'itie',
-    'ities',
-    'itinerancy',
-    'itinerarium',
-    'itinerating',
-    'itineray',
-    'itinery',
     'ition',
-    'itjiswhrzrez',
-    'itler',
-    'itmad-ud-daula',
-    'itmar',
-    'itn/harris',
-    'itohara',
-    'itosu',
-    'itou',
-    'itria',
-    'itrian',
-    'itron',
-    'itroun',
-    'its-final',
-    'its-nose',
-    'its/his',
     'its_far',
-    'itself&mdash;for',
-    'itself&mdash;there',
-    'itself-',
-    'itself-\'not',
-    'itself-all',
-    'itself-could',
-    'itself-had',
-    'itself-in',
-    'itself-of',
-    'itself-slipped',
-    'itself-stirred',
-    'itself-supply',
-    'itself-two',
-    'itself.',
-    'itself.4',
     'itself.there',
-    'itsi',
-    'itsibitsi',
-    'itsinvolvement',
-    'itslef',
-    'itsmembers',
-    'itsu-itd6a',
-    'itsukushima',
-    'itt-alcatel',
-    'ittala',
-    'itte',
-    'itted',
-    'ittefaq',
-    'ittehad-e-islami',
-    'ittehad-iji',
-    'itterbeck/escape',
     'ittihad',
-    'ittingen',
-    'itu90',
-    'ituation',
-    'itumeleng',
-    'ituni',
-    'ituraea',
-    'iturbe',
-    'iturbes',
-    'iturbi',
-    'iturmendi',
-    'iturriaga',
-    'itv/bbc1',
-    'itz&aacute',
-    'itza',
-    'itzanotherpurla',
     'itzshak',
-    'itzt',
-    'iu*',
-    'iu.o',
-    'iu/',
-    'iu359100329',
-    'iubebunt',
-    'iubeoque',
-    'iubere',
-    'iucds',
-    'iudaei',
-    'iudeum',
-    'iudgements',
-    'iudicis',
-    'iudin',
-    'iugerum',
     'iuhhair',
-    'iuk',
-    'iul',
-    'iumportance',
-    'iuncta',
-    'iuorie',
-    'iup',
-    'iupd',
-    'iurarunt',
-    'iust',
-    'iusta',
-    'iustitia',
-    'iut',
-    'iuvdt',
-    'iuventus',
-    'iv&ndash;vi',
     'iv&ndash;x',
-    'iv\'e',
-    'iv(1)',
-    'iv+v',
-    'iv-v',
-    'iv.1',
-    'iv.1.a',
-    'iv.1.b',
-    'iv.1.c',
-    'iv.1.e',
-    'iv.102',
-    'iv.108',
-    'iv.161',
-    'iv.164',
-    'iv.16ff.',
-    'iv.2.4',
     'iv.2.e',
-    'iv.20',
-    'iv.29.8',
-    'iv.35',
-    'iv.36',
-    'iv.42',
-    'iv.50',
-    'iv.57ff',
-    'iv.6',
-    'iv.80',
-    'iv.83',
-    'iv.86&ndash;160',
-    'iv.i.',
-    'iv.i.1',
-    'iv.i.120',
-    'iv.i.23ff',
     'iv.i.254ff.',
-    'iv.i.30f.',
-    'iv.i.35&ndash;63',
-    'iv.i.45',
-    'iv.i.54f.',
-    'iv.i.69ff.',
-    'iv.ii.',
-    'iv.ii.17ff',
-    'iv.ii.228ff',
-    'iv.ii.31',
-    'iv.ii.31ff',
-    'iv.ii.49ff.',
-    'iv.ii.64&ndash;6',
-    'iv.ii.71ff',
-    'iv.iii.',
-    'iv.iii.69',
     'iv.iv',
-    'iv.iv.199&ndash;430',
-    'iv.iv.745ff',
-    'iv.v.20ff',
-    'iv.vi.227&ndash;80',
-    'iv.vi.51ff.',
-    'iv.vii.55&ndash;118',
-    'iv.viii.20ff',
-    'iv.viii.24&ndash;72',
-    'iv/4',
-    'iv/njg2',
-    'iv12',
-    'iv2',
-    'iv36',
-    'iv49',
-    'iv55',
     'iv:81',
-    'iv:the',
-    'iva-impuesto',
-    'ivalace',
-    'ivanenko',
-    'ivanisovic',
-    'ivano-frankovsk',
-    'ivanovna',
-    'ivanovskoy',
-    'ivanovsky',
-    'ivc1/ivd',
-    'ivc2',
-    'ivcl',
-    'ivco',
-    'ivean',
-    'ivere',
     'iverest',
-    'iverley',
-    'iverne',
-    'iverybody',
-    'ives/british',
-    'ivesian',
-    'iveson',
-    'iveston',
-    'ivf-',
-    'ivfs',
-    'ivhs',
-    'ivi',
-    'iviato',
-    'ivic',
-    'ivin/bell-hanger',
-    'ivings/landowner',
     'ivins',
-    'ivison',
-    'ivities',
-    'ivkovic',
-    'ivoire',
-    'ivoirienne',
-    'ivolving',
-    'ivorienne',
-    'ivorine',
-    'ivory&amp;sime',
-    'ivory-carver',
-    'ivory-covered',
-    'ivory-framed',
-    'ivory-like',
-    'ivory-silk',
-    'ivory-skulled',
     'ivory-smooth',
-    'ivory-white',
-    'ivory-workers',
-    'ivory/producer',
-    'ivre',
-    'ivrea-based',
-    'ivver',
-    'ivvery',
-    'ivy-infested',
-    'ivy-jack',
-    'ivy-scroll',
-    'ivy-wreath',
-    'ivybri',
-    'ivyisms',
-    'ivyleaze',
-    'ivyleigh',
     'iwaa',
-    'iwaba',
-    'iwade',
-    'iwak',
-    'iwaniec',
-    'iwao',
-    'iwasg',
-    'iwasuge',
-    'iwatsuki',
-    'iwd',
-    'iwe',
-    'iwent',
-    'iwi',
-    'iwish',
-    'iwm/shuttleworth',
-    'iwona',
     'iwonder',
-    'iwonka',
-    'iwrachia',
-    'iwsra',
-    'ix-xieni',
-    'ix-xiv',
-    'ix.105',
-    'ix.22',
-    'ix.6',
-    'ix.76f.',
-    'ix.93',
-    'ix32m',
-    'ixbuild.',
-    'ixc&aacute;n',
-    'ixe',
-    'ixibatae',
     'ixil',
-    'ixix',
-    'ixl/allied',
-    'ixmariters',
-    'ixobrychus',
-    'ixodes',
-    'ixtra',
-    'ixx',
-    'iyakachchi',
-    'iyambo',
-    'iye',
-    'iyiguven',
-    'iys',
-    'iyuguven',
-    'iywaan',
-    'iza',
     'izaac',
-    'izabela',
-    'izabella',
-    'izamar',
-    'izania',
-    'izari',
-    'izatullo',
-    'izdrevle',
-    'izenours',
-    'izetbegovic-gligorov',
-    'izett/con',
-    'izett/conservative',
-    'izett/gloucestershire',
-    'izett/resources',
-    'izett/tory',
-    'izgrev',
     'izhar',
-    'iziah',
-    'izingari',
-    'izmailov',
-    'izmailovsky',
-    'iznalloz',
-    'izniki-zade',
-    'izon/chief',
-    'izquierdo',
-    'iztaccihuatl',
-    'izvekov',
-    'izvestya',
-    'izviestia',
-    'izvineetye',
-    'izvolskii',
-    'izvsetiya',
     'izzard/tory',
-    'izzet',
-    'izzi',
-    'izziedin',
-    'izziedininformation',
-    'izzys',
-    'izzz',
-    'j&aacute;chymova',
-    'j&aacute;k',
-    'j&aacute;nich',
-    'j&aacute;nsk&yacute',
-    'j&amp;jw',
-    'j&amp;w',
-    'j&auml;ndo',
-    'j&auml;nner',
-    'j&auml;rvi/chandos',
     'j&auml;ykk&auml',
-    'j&dollar;17,000',
-    'j&dollar;3,522,800,000',
-    'j&dollar;3,523',
-    'j&eacute;car',
-    'j&eacute;r&eacute;mie',
-    'j&eacute;rusalem',
-    'j&eacute;sus-christ',
-    'j&gt;k',
-    'j&iacute;menez',
-    'j&lsqb;ames&rsqb',
-    'j&lsqb;elly&rsqb',
-    'j&mdash;hawk',
-    'j&ndash;1102',
-    'j&ndash;1140',
-    'j&ndash;85',
     'j&ndash;g',
-    'j&ndash;hiv',
-    'j&oacute;0i',
-    'j&oacute;0kei',
-    'j&oacute;hanna',
-    'j&oacute;se',
-    'j&oacute;szef',
-    'j&oacute;zef',
-    'j&oacute;zefa',
-    'j&ocirc;ke',
-    'j&ocirc;rg',
-    'j&oslash;rgen',
-    'j&ouml;kuls&aacute;rglj&uacute;fur',
-    'j&ouml;kuls&aacute;rl&oacute;n',
-    'j&ouml;rgen',
-    'j&rehy;shaped',
     'j&uacute;caro',
-    'j&uacute;li&uacute;s',
-    'j&uacute;lius',
-    'j&uuml;nge',
-    'j&uuml;nschke',
-    'j&uuml;rg',
-    'j\'adore',
-    'j\'apporterai',
-    'j\'avais',
-    'j\'eusse',
-    'j\'m\'en',
-    'j\'n\'sais',
-    'j-1146',
-    'j-185',
-    'j-24',
-    'j-3100s/vx',
     'j-3100vs',
-    'j-34',
-    'j-36',
-    'j-40m',
-    'j-boat',
-    'j-c',
-    'j-c-b',
-    'j-cloths',
-    'j-f',
-    'j-gate',
-    'j-j-j-judas',
-    'j-japan',
-    'j-jolly',
-    'j-just',
-    'j-justified',
-    'j-model',
     'j-n',
-    'j-o-k-e',
-    'j-pouch-anal',
-    'j-registered',
-    'j-survey',
-    'j-type',
-    'j-types',
-    'j.-c',
-    'j.-f',
-    'j.-h',
-    'j.-k',
-    'j.-l',
-    'j.-m',
-    'j.-n',
-    'j.-p',
-    'j.1',
     'j.2',
-    'j.4',
-    'j.9',
-    'j.a.f.',
-    'j.a.h.',
-    'j.a.prestwick',
-    'j.a.ranish',
-    'j.a.s.',
-    'j.a.saner',
-    'j.addison',
-    'j.am.chem.soc',
-    'j.arlandis',
-    'j.b',
-    'j.b.c.f.',
-    'j.b.j.',
-    'j.b.losos',
     'j.bygraves',
-    'j.c.5',
-    'j.c.h.r.',
-    'j.c.k.',
-    'j.c.l.marine',
-    'j.c.trewin',
-    'j.c.v.',
-    'j.clerk',
-    'j.d.brook',
-    'j.d.salinger',
-    'j.danforth',
-    'j.davidson',
-    'j.e.d',
-    'j.e.g.',
-    'j.e.h.',
-    'j.e.m.s.',
     'j.eadie',
-    'j.f.e.t.',
-    'j.f.fleigel',
-    'j.f.herring',
-    'j.f.p.',
-    'j.f.r.o.',
-    'j.f.rodr&iacute;guez',
-    'j.g.l.',
-    'j.g.m.',
-    'j.g.s.',
-    'j.g.v.',
-    'j.g.v.a',
-    'j.h.m.',
-    'j.hallard',
-    'j.hons',
-    'j.j.s.',
     'j.jaynes',
-    'j.jeffreys',
-    'j.kershaw',
-    'j.kettle-williams',
-    'j.kumlien',
-    'j.kwok',
-    'j.l.campbell',
-    'j.league',
-    'j.linton',
-    'j.lloyd',
-    'j.m.f.',
-    'j.m.j.',
-    'j.m.m.cunningham',
-    'j.m.richards',
-    'j.m.rodr&iacute;guez',
-    'j.m.w.turner',
     'j.marples',
-    'j.marsh',
-    'j.mmurry',
-    'j.n.p.',
-    'j.o\'brien',
-    'j.o\'connor',
-    'j.p.-the',
-    'j.p.d.',
-    'j.p.g.',
-    'j.p.h.',
-    'j.p.r.',
-    'j.paul',
-    'j.pemberton',
-    'j.r.c.',
-    'j.r.j.',
-    'j.r.macey',
     'j.r.s.',
-    'j.r.t.',
-    'j.s',
-    'j.s.g.',
-    'j.s.miller',
-    'j.s.parkinson',
-    'j.sheward',
-    'j.smith',
-    'j.sutherland',
-    'j.t.barraclough',
-    'j.t.d.',
-    'j.t.wawn',
-    'j.w.f.',
-    'j.w.k.',
-    'j.william',
-    'j.woodbridge',
     'j.y.',
-    'j/',
-    'j/1',
-    'j/1n',
-    'j/2',
-    'j/24s',
-    'j/cals',
-    'j/cm',
-    'j/day',
-    'j/j',
-    'j/m7sup2',
-    'j/mc',
-    'j/n2',
-    'j0',
-    'j01',
-    'j02128',
     'j0437-4715',
-    'j1000',
-    'j199',
-    'j1x4mr',
-    'j21r',
-    'j2371a',
-    'j2372a',
-    'j2373a',
-    'j2374a',
-    'j2383a',
-    'j2384a',
-    'j24',
-    'j25',
-    'j3',
-    'j3/j4',
-    'j3c-65',
     'j4',
-    'j45',
-    'j45s',
-    'j5',
-    'j50-m',
-    'j5on',
-    'j6',
-    'j69',
-    'j763',
-    'j8',
-    'j9+bh',
-    'j9+ch',
-    'j9+ck',
-    'j9+cl',
-    'j9+gl',
-    'j9+jh',
     'j9+yl',
-    'j9+zl',
-    'j92-c',
-    'j92c',
-    'j964',
-    'j9n1',
-    'j=',
-    'j=0.945',
-    'j=6',
-    'j=just',
-    'j_j\'s',
-    'ja\'farfinance',
-    'ja-kki',
-    'ja11',
-    'ja3.2',
-    'ja8118',
     'jaa-wide',
-    'jaafarpur',
-    'jaana',
-    'jaar',
-    'jaarbeurs',
-    'jaarsbeursplein',
-    'jaazim',
-    'jabaar',
-    'jabach',
-    'jabale',
-    'jabale/abbot',
-    'jabaliya',
-    'jabalpore',
-    'jabalya',
-    'jabang',
-    'jabar',
     'jabba',
-    'jabbers',
-    'jabberwockies',
-    'jabberwocks',
-    'jabbie',
-    'jaberi',
-    'jabier',
-    'jabiri',
-    'jabirn',
-    'jabirs',
-    'jabiru',
-    'jabisco',
-    'jable',
-    'jaborandi',
-    'jabulelwe',
-    'jabuni',
     'jaburi',
-    'jac.',
-    'jacada',
-    'jacare',
-    'jacarezinha',
-    'jacarezinho',
-    'jacas',
-    'jacci',
-    'jacey',
-    'jacha',
-    'jachet',
-    'jachymov',
-    'jacinth',
-    'jack-and-the-beanstalk',
-    'jack-boots',
-    'jack-by-the-hedge',
     'jack-cap',
-    'jack-easy',
-    'jack-frost',
-    'jack-hazel',
-    'jack-in-the',
-    'jack-in-the&rehy;box',
-    'jack-in-the-boxes',
-    'jack-in-the-green',
-    'jack-lanterns',
-    'jack-o\'-greens',
-    'jack-o\'-lanterns',
-    'jack-of-all-aeronautical-trades',
-    'jack-on',
-    'jack-plate',
-    'jack-plug',
-    'jack-pot',
     'jack-pots',
-    'jack-swigging',
-    'jack-waving',
-    'jack/home',
-    'jack/lumiere',
-    'jack/xlr',
-    'jacka-',
-    'jackal-creature',
-    'jackal-headed',
-    'jackal-tigers',
-    'jackamos',
-    'jackanese',
-    'jackaranda',
-    'jackassery',
-    'jackboot-black',
-    'jackeen',
     'jackelen',
-    'jacket\'',
-    'jacket-clad',
-    'jacket-cum-coat',
-    'jacket-length',
-    'jacket-posters',
-    'jacket-straining',
-    'jacket.',
-    'jackety',
-    'jackhammers',
-    'jackin',
-    'jackknife',
-    'jackline',
-    'jackmans',
-    'jacknifes',
-    'jacko-esque',
     'jackobstein',
-    'jackomania',
-    'jackou',
-    'jackowski',
-    'jackrocks',
-    'jacksdale',
-    'jacksey',
-    'jackson&rehy;style',
-    'jackson\'',
-    'jackson-based',
-    'jackson-kelly',
-    'jackson-smith',
-    'jackson-stamped',
-    'jackson-type',
-    'jackson/british',
-    'jackson/charvel',
     'jackson/church',
-    'jackson/cross-channel',
-    'jackson/farmer',
-    'jackson/friend',
-    'jackson/glos',
-    'jackson/gloucestershire',
-    'jackson/hibernian',
-    'jackson/husband',
-    'jackson/school',
-    'jackson/trialist',
-    'jackson:brave',
-    'jacksonne',
-    'jackstands',
-    'jackstones',
-    'jacksuit',
-    'jackup',
     'jaco',
-    'jacob/',
-    'jacob/dept',
-    'jacoba',
-    'jacobean-style',
-    'jacobean/tartan',
-    'jacobethan',
-    'jacobina',
-    'jacobine',
-    'jacobinian',
-    'jacoboea',
-    'jacobs-suchard',
-    'jacobsdr.',
-    'jacobsons',
-    'jacobssen',
-    'jacobstein',
     'jacobyini',
-    'jacolet',
-    'jacopi',
-    'jacopino',
-    'jacot',
-    'jacq.',
-    'jacqes',
-    'jacqu&egrave;re',
-    'jacqualine',
-    'jacquard&rehy;weaving',
-    'jacqueline/cumbernauld',
-    'jacqueling',
-    'jacquelyn',
-    'jacquemart',
-    'jacquerie',
-    'jacques-&eacute;mile',
     'jacques-antoine',
-    'jacques-ass',
-    'jacques-augustin-catherine',
-    'jacques-laurent',
-    'jacques-marie',
-    'jacques-solomon',
-    'jacquesson',
-    'jacquot',
-    'jacta',
-    'jaculator',
-    'jacuzzi-style',
-    'jacvket',
-    'jadaavpur',
-    'jaddoo',
-    'jaddukuha',
-    'jade-boned',
     'jade-carvers',
-    'jade-studded',
-    'jade-worker',
-    'jaded-looking',
-    'jadedness',
-    'jader',
-    'jadesmith',
-    'jadeworking',
-    'jadidh',
-    'jadie',
-    'jadro',
-    'jaegar',
-    'jaeger-style',
-    'jaemsri',
-    'jaen',
-    'jaenberthus',
     'jaenike',
-    'jaenisch',
-    'jafarey',
-    'jaff',
-    'jaffa&ndash;jerusalem',
-    'jaffe/reunite',
-    'jafferjee',
-    'jafferpore',
-    'jaffet',
-    'jaffna-based',
-    'jaffrey',
-    'jafr',
-    'jafta',
-    'jag-shakti',
-    'jag.',
-    'jag/jazzmaster-type',
     'jagatais',
-    'jagdeschwader',
-    'jagdev',
-    'jagdis',
-    'jagdlied',
-    'jagdstaffel',
-    'jagdtiger',
-    'jagellonian',
-    'jagellonians',
-    'jagerstatter',
-    'jagg&egrave;d',
-    'jaggards',
-    'jagge',
-    'jaggedness',
-    'jagger-financed',
-    'jaggings',
     'jagie&lstrok&lstrok;o',
-    'jagiellonians',
-    'jagielo',
-    'jagir',
-    'jagland',
-    'jagoe',
-    'jagt',
-    'jagu-aaargh',
-    'jaguar-designed',
-    'jaguar-gm',
-    'jaguar-like',
-    'jaguar/gm',
-    'jaguare',
-    'jaguer',
-    'jahore',
-    'jahrbucher',
     'jahren',
-    'jahrhundert',
-    'jahsaxa\'',
-    'jahwohl',
-    'jaico',
-    'jaikie',
-    'jaikit',
-    'jail&rehy;writers',
-    'jail-birds',
-    'jail-house',
-    'jail-like',
-    'jail.at',
-    'jailings',
-    'jailsbeing',
-    'jailside',
-    'jaim',
     'jaimal',
-    'jaimefinance',
-    'jaimeni',
-    'jaimes',
-    'jaimz',
-    'jainarayan',
-    'jaite',
-    'jaji',
-    'jajo',
-    'jajouka',
-    'jakata',
-    'jakdo',
-    'jake-wallah',
-    'jakeman',
-    'jaketa',
-    'jakhrani',
     'jakimiuk',
-    'jakins',
-    'jakita',
-    'jakob-rost',
-    'jakobsohn',
-    'jakobsohns',
-    'jakobsonian',
-    'jakobstad',
-    'jakobstrasse',
-    'jakoby/law',
-    'jakubac',
-    'jakubinsky',
-    'jakubisko',
-    'jakubovics/daughter',
-    'jakubowski',
-    'jakutia',
     'jal/jjh',
-    'jalal-zade',
-    'jalaloddin',
-    'jalaludin',
-    'jalan',
-    'jalape&ntilde;os',
-    'jalboots',
-    'jalbut',
-    'jalcatoria',
-    'jaled',
-    'jaleh',
-    'jalics',
-    'jalilabad',
-    'jalingo',
-    'jaljoulihealth',
-    'jalla',
     'jallegonska',
-    'jallul',
-    'jalna',
-    'jalousies',
-    'jalousy',
-    'jalpari',
-    'jam&ndash;s',
-    'jam-',
-    'jam-bottling',
-    'jam-esque',
-    'jam-grin',
-    'jam-or-honey',
-    'jam-pots',
-    'jam-sandwich',
-    'jam-up',
-    'jam.use',
     'jam/party',
-    'jam_on',
-    'jama\'at-i-islami',
-    'jamaat-e',
-    'jamaat-i-islami18',
-    'jamaat-ul',
-    'jamaats',
-    'jamacia',
-    'jamahiriyah',
-    'jamaica-born',
-    'jamaica-bound',
-    'jamaican\'',
-    'jamaican-accented',
-    'jamaican-canadian',
-    'jamaican-derived',
-    'jamaicas',
     'jamaila',
-    'jamal-warner',
-    'jamalski',
-    'jamaluddin',
-    'jamaludin',
-    'jamangile',
-    'jamaran',
-    'jamarj',
-    'jambi',
-    'jambia',
-    'jamblichus',
-    'jambol',
-    'jamdani',
-    'jamdet',
-    'jameat',
-    'jameh-ye',
     'jameie',
-    'jameos',
-    'jamerson-influenced',
-    'james\'/',
-    'james(1977)',
-    'james-smiths',
-    'james-took',
-    'james/addict',
-    'james/aviation',
-    'james/award',
-    'james/barrhead',
-    'james/chairman',
-    'james/community',
-    'james/district',
-    'james/helicopter',
-    'james/mother',
     'james/stores',
-    'james/unemployed',
-    'james/walls',
-    'jamesfield',
-    'jamesy',
-    'jamia',
-    'jamiat-e-ulema-i-pakistan',
-    'jamiat-e-ulema-islam',
-    'jamiat-ulama-i-islam',
-    'jamies',
-    'jamieson/head',
-    'jamiesons',
-    'jamieston',
-    'jamil-al-jumayyil',
-    'jamilla',
-    'jamilur',
     'jamiroquay',
-    'jammat-i-islami',
-    'jammed-up',
-    'jammed.',
-    'jammerskjold',
-    'jammet',
-    'jamming-avoidance',
-    'jamming/gigs',
-    'jammu-kashmir',
-    'jamnagar',
-    'jamnicky',
-    'jamnitzers',
-    'jamoca',
-    'jampshedpu',
-    'jamrack',
-    'jamset',
     'jamsetjee',
-    'jamshed',
-    'jamshedput',
-    'jamsrangiyn',
-    'jamsranjav',
-    'jamtlands',
-    'jamun',
-    'jan&aacute&ccaron;ekian',
-    'jan&aacute;c&ccaron;ek',
-    'jan&aacute;k',
-    'jan&agrave&ccaron;ek',
-    'jan&ndash;dec',
-    'jan&ndash;fri',
-    'jan&zacute&ccaron;ek',
-    'jan-12',
-    'jan-2',
     'jan-28',
-    'jan-5',
-    'jan-jun',
-    'jan-june',
-    'jan-march',
-    'jan-oct',
-    'jan.1',
-    'jan/march',
-    'jan21/feb19',
-    'jan26',
-    'janak',
-    'janakpur',
-    'jananne',
-    'janasaviya',
-    'janasen',
-    'janbaz',
     'janbicca',
-    'jancik',
-    'jancis',
-    'janco',
-    'janda',
-    'jando',
-    'jandu',
-    'jane&ndash;urged',
-    'jane\'',
-    'jane\'s',
-    'jane-tanner',
-    'jane/andrew',
-    'jane/edinburgh',
-    'jane/mount',
-    'jane3',
-    'janeene',
     'janela',
-    'janelands',
-    'janelar',
-    'janene',
-    'janet-reger-ites',
-    'janet/glasgow',
-    'janeth',
-    'janetstown',
-    'janett',
-    'janety',
-    'janetzki',
-    'jang-lim',
-    'jang-soon',
-    'jangali',
-    'janglepop',
-    'jangler',
     'jangley',
-    'janglings',
-    'jangwattana',
-    'janice-may',
-    'janicki',
-    'janiculum',
-    'janiero',
-    'janigro',
-    'janik',
-    'janinet',
-    'janise',
-    'janitor/caretaker',
-    'janitore',
-    'janitors-but',
-    'janiurek/project',
-    'janja',
     'janke',
-    'jankipersadsing',
-    'jankopiti',
-    'jankowski',
-    'jankyn',
-    'janl',
-    'janlori',
-    'janmaat',
-    'janmabhoomi-babri',
-    'jannah',
-    'jannatie',
-    'jannaway',
-    'janne',
-    'janneau-sait-quoi',
-    'jannequin',
-    'janners',
     'janney',
-    'jannike',
-    'jannine',
-    'jannink',
-    'jannis/jannis',
-    'jannocks',
-    'jannu',
-    'jano',
-    'janoff',
-    'janoli',
-    'janonis',
-    'janowich',
-    'janowitz\'',
-    'janowitz/dg',
-    'jansch',
-    'janschwalde',
     'jansenistic',
-    'jansens',
-    'jansonius',
-    'jansport',
-    'jantos',
-    'januallatos',
-    'januarie',
-    'january&mdash;p.',
-    'january&ndash;12',
-    'january&ndash;13',
-    'january&ndash;14',
-    'january&ndash;28',
-    'january&ndash;3',
-    'january&ndash;30',
-    'january&ndash;30th',
-    'january&ndash;april',
     'january&ndash;may',
-    'january&ndash;thursday',
-    'january*',
-    'january-1',
-    'january-12',
-    'january-13',
-    'january-18',
-    'january-1st',
-    'january-21',
-    'january-30',
-    'january-4',
-    'january-6',
-    'january-8',
-    'january-august',
-    'january-july',
-    'january-may',
     'january-october',
-    'january-sown',
-    'january/',
-    'january/gloucester',
-    'january_',
-    'janus-face',
-    'januska',
-    'januslike',
-    'janvier',
-    'janvrin',
-    'janyn',
-    'jaona',
-    'jaonli',
-    'jap&lsqb;an&rsqb;s&lsqb;e&rsqb',
-    'jap-j99',
-    'japa',
     'japan*',
-    'japan-backed',
-    'japan-bashing',
-    'japan-bound',
-    'japan-china',
-    'japan-crazy',
-    'japan-friendly',
-    'japan-scottish',
-    'japan-soviet',
-    'japan-united',
-    'japan-were',
-    'japan.',
-    'japan.7',
-    'japan.the',
-    'japan/italy',
-    'japane',
     'japaner',
-    'japanese&rehy;equipped',
-    'japanese-brand',
-    'japanese-built',
-    'japanese-cum-impressionist',
-    'japanese-derived',
-    'japanese-designed',
-    'japanese-english',
-    'japanese-held',
-    'japanese-iranian',
-    'japanese-like',
-    'japanese-mandated',
-    'japanese-new',
-    'japanese-north',
-    'japanese-run',
-    'japanese-smooth',
     'japanese-speaking',
-    'japanese-thai',
-    'japanese-type',
-    'japanese.',
-    'japanese.richard',
-    'japanese/source',
-    'japanese/us',
-    'japanesery',
-    'japanica',
-    'japanism',
-    'japanization',
-    'japanning',
-    'japanologists',
-    'japanophobia',
-    'japanse',
-    'japantown',
     'japcorp',
-    'jape\'',
-    'japek',
-    'japester',
-    'japheth',
-    'japie',
-    'japing',
-    'japon',
-    'japonais',
-    'japonsime',
-    'japweed',
-    'japygidae',
-    'jaquard',
-    'jaquarello',
-    'jaque',
-    'jaquemin',
     'jaquet',
-    'jaquier',
-    'jaquin',
-    'jar.',
-    'jaradah',
-    'jarbou',
-    'jardanafinance',
-    'jardaneh',
-    'jardeir',
-    'jardex',
-    'jardine-matheson',
-    'jardinerie',
-    'jardox',
-    'jaren',
-    'jaret',
-    'jarful',
     'jargeau',
-    'jarges',
-    'jargon-filled',
-    'jargon-junkies',
-    'jargon-laden',
-    'jargon-perfect',
-    'jargon-smith',
-    'jargonel',
-    'jargoning',
-    'jargonised',
-    'jargonish',
-    'jargony',
-    'jarisch-herxheimer',
-    'jarizinho',
-    'jarjis',
-    'jarjoun',
     'jarlask&aacute;ld',
-    'jarlett',
-    'jarlsgatan',
-    'jarma',
-    'jarmers',
-    'jarmies',
-    'jarmon',
-    'jarmuschs',
-    'jarmy',
-    'jarnac',
-    'jarnail',
-    'jarnell',
-    'jarniewicz',
-    'jaro&scaron',
-    'jaros',
-    'jarosch',
     'jaroszewicz',
-    'jarpa',
-    'jarps',
-    'jarra',
-    'jarret',
-    'jarretier',
-    'jarrettchecks',
-    'jarrettoutlines',
-    'jarrie',
-    'jarrott',
-    'jarrow-based',
-    'jarry-esque',
-    'jars/tins',
-    'jarse',
-    'jartley',
-    'jaruga',
     'jaruman',
-    'jaruzelski.',
-    'jarver',
-    'jarveys',
-    'jarvies',
-    'jarvis-andersen',
-    'jarvis/head',
-    'jarvis/jockey',
-    'jarvis/technical',
-    'jarzembowski',
-    'jas/demewi',
-    'jasbir',
-    'jasco',
-    'jash',
-    'jashav',
-    'jashbhai',
     'jasic',
-    'jasir',
-    'jasmine-covered',
-    'jasminium',
-    'jason/actor',
-    'jaspars',
-    'jasper&ndash;kamloops',
-    'jasper/west',
-    'jasperware',
-    'jassar',
-    'jassick',
-    'jastkowic',
-    'jastrun',
-    'jastrzembski',
-    'jaswinder',
-    'jate',
     'jatene',
-    'jathuk',
-    'jatin',
-    'jatindur',
-    'jatiyabadi',
-    'jatiyatabadi',
-    'jatrox',
-    'jats',
-    'jatun',
-    'jauary',
-    'jaudon',
-    'jauffrett',
-    'jaufr&eacute',
-    'jaundice_as',
-    'jaundices',
-    'jaundicing',
     'jaunes',
-    'jaunlatgale',
-    'jaunt-ette',
-    'jaunted',
-    'jaunting',
-    'jaunty-peaked',
-    'jaure',
-    'jauregui',
-    'jaus',
-    'jausovec',
-    'javadi',
-    'javal',
-    'javalet/regatta',
-    'javana',
-    'javas',
-    'jave',
     'javea',
-    'javelin*',
-    'javelin-men',
-    'javelin-throwers',
-    'javelinmen',
-    'javelle',
-    'javeriana',
-    'javert',
-    'javetta',
-    'javitses',
-    'javols',
-    'javorina',
-    'javvier',
-    'jaw&rehy;lines',
-    'jaw-ache',
-    'jaw-achers',
     'jaw-bone',
-    'jaw-busted',
-    'jaw-cracking',
-    'jaw-jaw',
-    'jaw-jutting',
-    'jaw-lock',
-    'jaw-locking',
-    'jaw-splitting',
-    'jaw-strake',
-    'jaw.',
-    'jawagal',
-    'jawari',
-    'jawbreaker',
-    'jawbroken',
-    'jawdat',
-    'jawdropping',
     'jaweed',
-    'jawfish',
-    'jawid',
-    'jawlock',
-    'jawlowski',
-    'jawohl',
-    'jawoyn',
-    'jawoyns',
-    'jax-oh-in',
-    'jay-four',
-    'jay-in-love-with-lucy',
-    'jay-walk',
-    'jayahen',
-    'jayant',
-    'jayaratne',
-    'jayasinha',
     'jayavarman',
-    'jayawardena',
-    'jayawardenapura',
-    'jaycee',
-    'jayen',
-    'jayl',
-    'jaynettes',
-    'jayni',
-    'jaytee',
-    'jaze',
-    'jazi',
-    'jazia',
-    'jazuli',
-    'jazz&rehy;rap',
-    'jazz-age',
-    'jazz-babe',
     'jazz-blues',
-    'jazz-club',
-    'jazz-derived',
-    'jazz-for-dancing',
-    'jazz-heads',
-    'jazz-heavy',
-    'jazz-inflected',
-    'jazz-inspired',
-    'jazz-junkie',
-    'jazz-like',
-    'jazz-lover',
-    'jazz-loving',
-    'jazz-modern',
-    'jazz-pianist',
-    'jazz-players',
-    'jazz-poetry',
     'jazz-pop',
-    'jazz-swing',
-    'jazz-tinged',
-    'jazz-tinted',
-    'jazz/american',
-    'jazz/big',
-    'jazz/country',
-    'jazz/dance',
-    'jazz/folk',
-    'jazz/funk',
-    'jazz/pop',
-    'jazz/rock',
-    'jazzband',
-    'jazzbie',
-    'jazzbo',
-    'jazzercise',
     'jazzfunk',
-    'jazzing',
-    'jazzmasters',
-    'jazzniks',
-    'jazzoetry',
-    'jazzorola',
-    'jazzy-combo',
-    'jb-4',
-    'jb1',
-    'jb250',
-    'jbb',
-    'jbcns',
-    'jbeil',
-    'jberians',
-    'jbls',
-    'jbtv',
     'jbw',
-    'jbw/your',
-    'jc/je',
-    'jc120',
-    'jc120s',
-    'jc5088',
-    'jc:reluctant',
-    'jcamp-dx',
-    'jcc-designed',
-    'jccs',
-    'jcd',
-    'jcf',
-    'jci\'',
-    'jcis',
-    'jcrl',
-    'jcts',
     'jcu',
-    'jcw',
-    'jd1,106',
-    'jd120,000,000',
-    'jd324',
-    'jd906,700,000',
-    'jdavies',
-    'jdc',
-    'jdh',
-    'jdl',
-    'jdn-fed',
-    'jdsalinger',
-    'jdv',
-    'je&ucirc;ne',
-    'jeal',
-    'jealosy',
     'jealously-guarded',
-    'jean-bernard',
-    'jean-blaise',
-    'jean-cut',
-    'jean-edern',
-    'jean-efflam',
-    'jean-emile',
-    'jean-etienne',
-    'jean-eug&egrave;ne',
-    'jean-gabriel',
-    'jean-genet-like',
-    'jean-georges',
-    'jean-herve',
-    'jean-hilippe',
-    'jean-honor&eacute',
-    'jean-huges',
     'jean-jaques',
-    'jean-joseph',
-    'jean-louis-ernest',
-    'jean-louisforeign',
-    'jean-michael',
-    'jean-n&ouml;el',
-    'jean-patrick',
-    'jean-polak',
-    'jean-remy',
-    'jean-ren&eacute',
-    'jean-richard',
-    'jean-roger',
-    'jean-victor',
-    'jeananne',
-    'jeaned',
-    'jeanettes',
     'jeanius',
-    'jeanmaire*',
-    'jeanneaus',
-    'jeannel',
-    'jeanneret',
-    'jeanneton',
-    'jeannin',
-    'jeanniot',
-    'jeanpr&ecirc;tre',
-    'jeans-and-leather-jacket',
-    'jeans-and-sweater',
-    'jeans-buying',
-    'jeans-maker',
-    'jeans-to-cosmetics',
-    'jeanselme',
-    'jeansson',
     'jeanswear',
-    'jeanuius',
-    'jeanwear',
-    'jeaurat',
-    'jebba',
-    'jebbett/designer',
-    'jebbit',
-    'jebbit/flood',
-    'jebco',
-    'jebels',
-    'jebir',
-    'jeboda',
-    'jebreel',
-    'jebril',
-    'jebsal',
-    'jebusites',
     'jecentho',
-    'jechan',
-    'jeckle',
-    'jeckyl',
-    'jeckyll',
-    'ject',
-    'jed-forest11',
-    'jedd',
-    'jedediah',
-    'jedir',
-    'jedlinski',
-    'jeds',
-    'jedsa',
-    'jedsons',
-    'jeebl',
-    'jeeeesus',
     'jeejeebhoy',
-    'jeenay',
-    'jeeoos',
-    'jeep-driver',
-    'jeep-lurch',
-    'jeep-mounted',
-    'jeep-ride',
-    'jeep-type',
-    'jeepster',
-    'jeepy',
-    'jeera',
-    'jees',
-    'jeesus',
-    'jeevanjee',
-    'jeeves-on-wheels',
-    'jeevesian',
     'jeevons',
-    'jefcoat',
-    'jeffares',
-    'jeffcote',
-    'jeffcote/aeeu',
-    'jeffcott',
-    'jefferay',
-    'jefferies/works',
-    'jefferis',
-    'jefferson-smurfit',
-    'jeffes',
-    'jeffey',
-    'jeffo',
-    'jeffords',
-    'jeffree',
-    'jeffrey/father',
     'jeffrey/managing',
-    'jeffrey/marc',
-    'jeffrey/mother',
-    'jeffrey/speaking',
-    'jeffries/works',
-    'jegado',
-    'jegerische',
-    'jego',
-    'jego-query',
-    'jegs',
-    'jehan-georges',
-    'jehingir',
-    'jeho',
-    'jehoash',
-    'jehoiakin',
-    'jehoshaphat',
     'jehovahkill',
-    'jehovan',
-    'jejunectomy',
-    'jejunem',
-    'jejunoileal',
-    'jejunoileum',
-    'jek',
-    'jekell',
-    'jekyll&rehy;and-hyde',
-    'jekyll-inspired',
-    'jelata',
-    'jelen&iacute;ho',
-    'jelf/runner-up',
-    'jelf/winner',
-    'jelian',
-    'jelina',
     'jelincic',
-    'jelineknational',
-    'jelinger',
-    'jelko',
-    'jellabas',
-    'jellaby',
-    'jelle',
-    'jellie',
-    'jellied-eel',
-    'jellinek',
-    'jellneck',
-    'jelloid',
-    'jelloshots',
-    'jelly-babies',
-    'jelly-heap',
-    'jelly-livered',
     'jelly-muslin',
-    'jellybean',
-    'jellybeans',
-    'jellyfish-infested',
-    'jellyfish-like',
-    'jellyfish-remains',
-    'jellyfishes',
-    'jellypop',
-    'jellys',
-    'jeltz',
-    'jelutong',
-    'jelz',
-    'jem-1200',
-    'jem-boy',
-    'jem100cx',
-    'jemathang',
     'jemayl',
-    'jemayl/jemmel',
-    'jemdanee',
-    'jemison',
-    'jemmie',
-    'jemmied',
-    'jemmies',
-    'jemphrey',
-    'jemps-dungarvan',
-    'jemshyd',
-    'jen-hu',
-    'jena-weimar',
-    'jenajaroen',
-    'jenbach',
-    'jencra',
-    'jending',
     'jendyk',
-    'jenesis',
-    'jenevein',
-    'jenever',
-    'jeng',
-    'jenga',
-    'jenings',
-    'jenis',
-    'jenkins-burton',
-    'jenkins/father-in-law',
-    'jenkins/leicester',
-    'jenkins/scientists',
-    'jenkinson/farmer',
-    'jennalou',
-    'jennefer',
-    'jennekens',
     'jennequin',
-    'jennifergate',
-    'jennifers',
-    'jenning',
-    'jennings/race',
-    'jennings/trader',
-    'jenny\'s',
-    'jenny-dealings',
-    'jenny-love',
-    'jennyfields',
-    'jeno',
-    'jenrenaud',
-    'jens-peter',
-    'jensema',
-    'jensen-healey',
-    'jenskies',
     'jenssen',
-    'jensson/denmark',
-    'jenstein',
-    'jentris',
-    'jenufa',
-    'jenway',
-    'jeoffry',
-    'jeoire',
-    'jeopardite',
-    'jephcott',
-    'jepp',
-    'jepperson',
-    'jeppy',
-    'jeps',
-    'jepsons',
-    'jepthe',
     'jerach',
-    'jerai',
-    'jeraj',
-    'jerakeen',
-    'jerard',
-    'jerboas',
-    'jerem',
-    'jerem.',
-    'jeremey',
-    'jeremiad',
-    'jeremiads',
-    'jeremy/peter/danny',
-    'jerger',
-    'jerh',
-    'jericho-jerusalem',
-    'jericho-like',
     'jerilynn',
-    'jerk-off',
-    'jerk-offs',
-    'jerked-up',
-    'jerkers',
-    'jerkier',
-    'jerking-off',
-    'jerkings',
-    'jerko',
-    'jerky-jump',
-    'jerma',
-    'jermanis',
-    'jermiah',
-    'jerms',
-    'jernaeus',
-    'jernej',
     'jerobaum',
-    'jeroboam-like',
-    'jeroboams',
-    'jerod',
-    'jerold',
-    'jerom',
-    'jeromack',
-    'jerrak',
-    'jerred',
-    'jerricurl',
-    'jerry-bashers',
-    'jerry-builder',
-    'jerry-building',
-    'jerrybuilder',
-    'jerrycan',
-    'jerrys',
     'jersey-dress',
-    'jersey-knit',
-    'jersey-pull',
-    'jersey-registered',
-    'jersey-wool',
-    'jersey/coin',
-    'jersiaise',
-    'jerusalem\'',
-    'jerusalmi',
-    'jerushalom',
-    'jervas',
-    'jerzees',
-    'jes&rehy;sie',
-    'jesch',
-    'jesen&iacute;k',
-    'jeshajahu',
     'jesi',
-    'jesie',
-    'jeslyn',
-    'jesmines',
-    'jessa-',
-    'jessa-myn',
-    'jessavala',
-    'jessen',
-    'jesser',
-    'jessified',
-    'jesslyn',
-    'jessmer',
-    'jesson/central',
-    'jessop/thames',
-    'jessoppe',
-    'jesssie',
     'jessup_in',
-    'jessups',
-    'jest-book',
-    'jested',
-    'jester-king',
-    'jestingly',
-    'jestings',
-    'jesuit-run',
-    'jesuites',
-    'jesuitism',
-    'jesuitisme',
-    'jesum',
-    'jesuology',
-    'jesus-christus',
-    'jesus-esque',
-    'jesus-figure',
     'jesus-time',
-    'jesus.jesus',
-    'jesuslabour',
-    'jesusmary&rehy;andallthesaints',
-    'jet&eacute',
-    'jet&rehy;engines',
-    'jet-assisted',
-    'jet-boat',
-    'jet-buttoned',
-    'jet-cleaning',
-    'jet-cloud',
-    'jet-copter',
-    'jet-craftsman',
-    'jet-driven',
-    'jet-dry',
-    'jet-eye',
     'jet-flood',
-    'jet-handled',
-    'jet-man',
-    'jet-milled',
-    'jet-pack',
-    'jet-powered',
-    'jet-qualified',
-    'jet-rated',
-    'jet-settish',
-    'jet-skied',
-    'jet-skis',
-    'jet-star',
-    'jet-streams',
-    'jet-trail',
-    'jet-travel',
-    'jet-trikes',
     'jetboat',
-    'jete',
-    'jeter',
-    'jetes',
-    'jetfins',
-    'jetform',
-    'jetless',
-    'jetlink',
-    'jetronic',
-    'jets.',
-    'jetsetters',
-    'jetskier',
-    'jetstars',
-    'jetstone',
-    'jettair',
-    'jettas',
     'jette',
-    'jetter',
-    'jettisonable',
-    'jettisoundz',
-    'jetton',
-    'jetwave',
-    'jetwing',
-    'jetzt',
-    'jeudi',
-    'jeumont-1',
-    'jeuniaux',
-    'jevan',
-    'jevans',
-    'jever',
-    'jevon',
-    'jevric',
     'jew&egrave;s',
-    'jew-baiter',
-    'jew-baiters',
-    'jew-face',
-    'jew-free',
-    'jew-hater',
-    'jew-hating',
-    'jew-infested',
-    'jewalition',
-    'jewarna',
-    'jewbaiting',
-    'jewboys',
-    'jewel-cases',
-    'jewel-embossed',
-    'jewel-firm',
-    'jewel-green',
     'jewel-hard',
-    'jewel-house',
-    'jewel-in-the-crown',
-    'jewel-thonged',
-    'jewel-tipped',
-    'jewel-trading',
-    'jewel.',
-    'jewelbox',
-    'jewelle',
-    'jeweller-cum-collector',
-    'jewellery-stall',
-    'jewellery-trading',
-    'jewellery/carpets',
-    'jewels/the',
-    'jewes',
-    'jewish&ndash;christian',
     'jewish-bolshevik',
-    'jewish-bolshevist-imperialist',
-    'jewish-christian',
-    'jewish-christian-islamic',
-    'jewish-dominated',
-    'jewish-egyptian',
-    'jewish-greek',
-    'jewish-islamic-christian',
-    'jewish-mother',
-    'jewish-owned',
-    'jewish-provoked',
-    'jewish-run',
-    'jewish/yiddish',
-    'jewllers',
-    'jewnion',
-    'jewontin',
     'jews.',
-    'jewsons',
-    'jexreel',
-    'jeyaraj',
-    'jeydid',
-    'jeykell',
-    'jezebelis',
-    'jezebels',
-    'jezek',
-    'jezzard',
-    'jf-it10',
-    'jfd',
-    'jfit10',
-    'jfk/i',
-    'jfp',
-    'jfs',
     'jfv10',
-    'jg2',
-    'jg27',
-    'jger',
-    'jhal',
-    'jhaleh',
-    'jhana',
-    'jhanas',
-    'jhang',
-    'jhansi',
-    'jhapa',
-    'jhaveri',
-    'jheels',
-    'jheni',
-    'jheri-curls',
-    'jhesu-warde',
     'jhf',
-    'jhg',
-    'jhopadpatties',
-    'ji&ccaron&iacute;n',
-    'ji&rcaron;sk&aacute',
-    'jiamil',
-    'jiangchuan',
-    'jianxi',
-    'jiao',
-    'jiaotong',
-    'jiaozi',
-    'jiaozi-guotie',
-    'jiaxi',
-    'jib-boom',
-    'jibber-jabbered',
-    'jibbered',
     'jibchit',
-    'jibrail',
-    'jibrils',
-    'jic(g)',
-    'jick',
-    'jictar',
-    'jien',
-    'jieqiong',
-    'jiffy-bag',
-    'jig-',
-    'jig-a-jigged',
-    'jig2',
-    'jigcar',
-    'jigga',
-    'jiggens',
-    'jiggery',
     'jiggery-',
-    'jiggety',
-    'jiggle-rock',
-    'jigglers',
-    'jigglier',
-    'jiggly',
-    'jigjidsurengiyn',
-    'jigoku',
-    'jigsaw-fashion',
-    'jigsaw-like',
-    'jigsaw-shaped',
-    'jihur',
-    'jii',
-    'jijel',
-    'jijena',
-    'jiji',
     'jijiga',
-    'jik',
-    'jilani',
-    'jilbab',
-    'jile',
-    'jilj&iacute',
-    'jill-in-the-box',
-    'jilted-architect',
-    'jily',
-    'jim&mdash;who',
-    'jim\'&pound;s',
-    'jim-the-bus-driver',
-    'jim/homeless',
-    'jim/new-age',
-    'jimbardsley',
-    'jimbos',
     'jimfer',
-    'jimi-heat',
-    'jimibelia',
-    'jiminycricket',
-    'jimmabibi',
-    'jimmmy',
-    'jimmy-jams',
-    'jimmy-one-arm',
-    'jimmy-said',
-    'jimson',
-    'jin-dong',
-    'jin-janda',
-    'jind&rcaron;ich',
-    'jinghua',
-    'jinging',
-    'jingji',
     'jingjie',
-    'jingle-like',
-    'jinglers',
-    'jingly',
-    'jingo-outpourings',
-    'jingshan',
-    'jingshen',
-    'jingwei',
-    'jingzhe',
-    'jinicil',
-    'jininya',
-    'jinjin',
-    'jink-backed',
-    'jinmu',
-    'jinno',
-    'jinpei',
     'jinshan',
-    'jinshou',
-    'jinx-jet',
-    'jip-jip-jip',
-    'jipping',
-    'jipy',
-    'jir&iacute',
-    'jirarote',
-    'jirayer',
-    'jirdan',
-    'jireh',
-    'jires',
-    'jirghum',
-    'jishe',
-    'jishi',
-    'jism',
     'jisui',
-    'jitendra',
-    'jith',
-    'jitneys',
-    'jitter-bug',
-    'jitterbugs',
-    'jitteriness',
-    'jiulong-1',
-    'jive-talking',
-    'jivers',
-    'jiwan',
-    'jix',
-    'jix4mr',
-    'jiye',
-    'jizah',
-    'jizzane',
     'jizzling',
-    'jjcb',
-    'jjd',
-    'jjda',
-    'jjkauizmzi',
-    'jjkkllmm',
-    'jk-1mol-1',
-    'jk1',
-    'jk2',
-    'jk808',
-    'jka',
-    'jkd',
-    'jke',
-    'jklm',
-    'jknc',
-    'jknc-farooq',
     'jlaser',
-    'jld',
-    'jle-compatible',
-    'jlf',
-    'jlh',
-    'jlj',
-    'jlm',
-    'jlsig',
-    'jluli',
-    'jm-2',
-    'jm02e&ndash;14',
-    'jm1',
-    'jm4pm',
-    'jmbarrie',
-    'jmd/s',
-    'jmes',
     'jmj',
-    'jmls',
-    'jmmt',
-    'jmob/telecom',
-    'jmp-100',
-    'jmp900',
-    'jms',
-    'jmu/institute',
-    'jmw',
-    'jn-4',
-    'jna-croatian',
-    'jna/serbian',
-    'jnan',
-    'jnhetc',
-    'jnina',
-    'jnl',
     'jnto',
-    'jo&acirc;o',
-    'jo&atilde;s',
-    'jo&euml;l-marie',
-    'jo(f2)',
-    'jo-flo',
-    'jo-ho-ren-sis',
-    'jo-ohn',
-    'jo-u',
-    'jo:fi:bse',
-    'joab',
-    'joachain',
-    'joachimides',
-    'joachimism',
-    'joachin',
-    'joahanna',
     'joakimides',
-    'joan/chair',
-    'joana',
-    'joann',
-    'joanna-stompin\'',
-    'joannah',
-    'joanne/erskine',
-    'joanner',
-    'joannie',
-    'joanning',
-    'joanowski',
-    'joaqu&iacute;m',
-    'joarna',
-    'joash',
-    'joass',
-    'job&ndash;security',
     'job&rehy;hopping',
-    'job&rehy;relevant',
-    'job&rehy;sharers',
-    'job-',
-    'job-acquisition',
-    'job-attitude',
-    'job-bob',
-    'job-built',
-    'job-by-job',
-    'job-centre',
-    'job-control',
-    'job-controls',
-    'job-counselling',
-    'job-descriptions',
-    'job-destructive',
-    'job-displacement',
     'job-holders',
-    'job-holding',
-    'job-hunt',
-    'job-hunter',
-    'job-hunters',
-    'job-knocking',
-    'job-like',
-    'job-link',
-    'job-losing',
-    'job-losses',
-    'job-maker',
-    'job-market',
-    'job-oriented',
-    'job-process',
-    'job-protection',
-    'job-qualification',
     'job-release',
-    'job-rotation',
-    'job-satisfaction',
-    'job-saving',
-    'job-searchers',
-    'job-searching',
-    'job-share/part-time',
-    'job-sharers',
-    'job-shares',
-    'job-specification',
-    'job-specificity',
-    'job-spinning',
-    'job-substitute',
-    'job-taker',
-    'job-title',
-    'job-weighting',
     'job.but',
-    'job/career',
-    'job/hereford',
-    'job/income',
-    'job/marriage',
-    'job/new',
-    'job/salary',
-    'job_for',
-    'jobacct.',
-    'jobar',
-    'jobbing-shop',
-    'jobbing/sub-contracting',
-    'jobble',
-    'jobclub',
-    'jobclubs/jobsearch',
-    'jobert',
     'jobholder',
-    'jobholding',
-    'jobhunt.pcx',
-    'jobhunters',
-    'jobin',
-    'joblink',
-    'jobmaster',
-    'jobner',
-    'jobs&mdash;and',
-    'jobs--how',
-    'jobs-as',
-    'jobs-first',
-    'jobs-for-life',
-    'jobs-for-the-boys',
-    'jobs-only',
-    'jobs-rich',
     'jobs-to-come',
-    'jobs.but',
-    'jobs.tim',
-    'jobs_for',
-    'jobs_rather',
-    'jobsharing',
-    'jobson/bardsley',
-    'jobspecification',
-    'jobst/clinical',
-    'jobstart',
-    'jobtel',
-    'jobwatch',
-    'jocem',
-    'joch',
-    'jochade',
-    'jochanan',
     'jochberg-pass',
-    'jochem',
-    'jochens',
-    'jochim.',
-    'jochimsen',
-    'jock\'',
-    'jock-straps',
-    'jocke',
-    'jockey-sized',
-    'jockeyings',
-    'jockeyship',
-    'jocklyn',
-    'jockpot',
-    'jocks.',
-    'joconde',
-    'joculatores',
     'joddies',
-    'jode',
-    'jodee',
-    'joden',
-    'jodensavanne',
-    'jodhpur-slim',
-    'jodhpur-style',
-    'jodoin',
-    'jods',
-    'joe-boy',
-    'joe-soon',
-    'joel-marie',
-    'joeleen',
-    'joels',
-    'joensu',
-    'joensuu',
     'joeski',
-    'joesph',
-    'joest',
-    'joeys',
-    'joezer',
-    'joffied',
-    'jog-along',
-    'jogaila',
-    'jogeesvaran',
-    'jogen',
-    'jogezai',
-    'jogg-er-ling',
-    'jogger-thronged',
-    'joggery',
-    'joggin\'',
-    'jogging-pants',
     'jogging-suit',
-    'joggles',
-    'jogiches',
-    'joginder',
-    'jogsuits',
-    'joh\'burg',
-    'johannesburg-based',
-    'johannesburg-bound',
-    'johannite',
-    'johannwerner',
-    'johans',
-    'johansson-hedberg',
-    'johar',
-    'johhny',
-    'johi',
-    'john(4)',
     'john(8)',
-    'john-',
-    'john-andrew',
-    'john-charles',
-    'john-davies',
-    'john-ga',
-    'john-harrison',
-    'john-majorish',
-    'john-mildmay',
-    'john-subject',
-    'john-the-baptists',
-    'john-willie',
-    'john-wilson',
-    'john.',
-    'john/aged',
-    'john/oxfordshire',
     'johncock',
-    'johnes\'s.',
-    'johnie',
-    'johnish',
-    'johnmajor',
-    'johnn',
-    'johnne',
-    'johnnesburg',
-    'johnniemac',
-    'johnny-head-in-airing',
-    'johnny-passing-throughs',
-    'johnroe',
-    'johns-manville',
-    'johns/ambulance',
-    'johns/creepers',
-    'johns/forest',
     'johns/joneses/patels',
-    'johns0n',
-    'johnsburn',
-    'johnsgrove',
-    'johnson&amp;johnson',
-    'johnson\'s-health',
-    'johnson\'s.',
-    'johnson-hill/rspca',
-    'johnson-marshall',
-    'johnson/chief',
-    'johnson/club',
-    'johnson/countryside',
-    'johnson/eyewitness',
-    'johnson/figure',
-    'johnson/forest',
-    'johnson/gchq',
     'johnson/isadore',
-    'johnson/managing',
-    'johnson/meteorologist',
-    'johnson/panas',
-    'johnson/parent',
-    'johnson/principal',
-    'johnsone',
-    'johnsonn',
-    'johnstae',
-    'johnsted',
-    'johnston-allan',
-    'johnston-allen',
-    'johnston/amnesty',
-    'johnston/opera',
-    'johnston/oxford',
-    'johnston/race',
     'johnstone-hill',
-    'johnstone-white',
-    'johnstone/ross-on-wye',
-    'johnstone0',
-    'johnstounburn',
-    'johorensis',
-    'johs',
-    'joicy',
-    'joie-de-vivre',
-    'joiesle',
-    'join-in',
-    'join-the-club',
-    'join-the-dots',
-    'join-up-the-dots',
-    'joined.a',
-    'joinering',
     'joinin\'',
-    'joins.',
-    'joint-authored',
-    'joint-bidder',
-    'joint-buying',
-    'joint-chairman',
-    'joint-champions',
-    'joint-collectorship',
-    'joint-collectorships',
-    'joint-cost',
-    'joint-development',
-    'joint-elite',
-    'joint-enterprise',
-    'joint-evaluation',
-    'joint-exploitation',
-    'joint-favourite',
     'joint-government',
-    'joint-ownership',
-    'joint-planning',
-    'joint-president',
-    'joint-projects',
-    'joint-purchasing',
-    'joint-responsibility',
-    'joint-rule',
-    'joint-smoking',
-    'joint-top',
-    'joint-treasurer',
-    'joint-vignette',
-    'joint-work',
-    'joint.stock',
-    'jointed-legged',
-    'jointers',
     'jointings',
-    'jointless',
-    'jointly&mdash;lord',
-    'jointly-funded',
-    'jointly-these',
-    'joinvilles',
-    'joir',
-    'joiret',
-    'joist-hanger',
-    'joji',
-    'jok',
-    'jokari',
-    'joke-count',
-    'joke-figure',
-    'joke-hero',
-    'joke-night',
     'joke-offering',
-    'joke-production',
-    'joke-themes',
-    'joke-tie',
-    'joke.',
-    'jokebooks',
-    'joked\'',
-    'joked.a',
-    'jokeless',
-    'joker-in-chief',
-    'jokes-wetting',
-    'jokes/anecdotes/stories',
-    'joki',
-    'jokier',
-    'jokiest',
-    'jokioisten',
     'jokkmokk',
-    'joktan',
-    'jokulhlaup',
-    'jol-ly',
-    'joldwynds',
-    'jole',
-    'jolene',
-    'jolibois',
-    'jolif',
-    'joline',
-    'joliot',
-    'jolle',
-    'jolleys',
-    'jolliginki',
-    'jollitude',
-    'jollyer',
     'jollypops',
-    'jollyville',
-    'jolson-caricatures',
-    'joltingly',
-    'joly/yves',
-    'jomhori',
-    'jomhouri',
-    'jomhuri-e-eslami',
-    'jomhuriye',
-    'jommelli',
-    'jon-ee-than',
-    'jon-paul',
-    'jon-tex',
-    'jonadab.',
-    'jonassen/bouge',
-    'jonasson',
     'jonathanj',
-    'jonava',
-    'jonches',
-    'jonckheere',
-    'joned',
-    'jones+brother',
-    'jones-',
-    'jones-connelly',
-    'jones-davies',
-    'jones-lee',
-    'jones-the',
-    'jones-the-milk',
-    'jones-walker',
-    'jones-world',
-    'jones/',
-    'jones/alan',
     'jones/argyll',
-    'jones/arnie',
-    'jones/british',
-    'jones/brunel',
-    'jones/business',
-    'jones/campaigner',
-    'jones/chairman/local',
-    'jones/christine',
-    'jones/course',
-    'jones/daughter',
-    'jones/developer',
-    'jones/environmental',
-    'jones/fire',
-    'jones/headmaster/picklenash',
-    'jones/householder',
-    'jones/hunt',
     'jones/hydro',
-    'jones/judge',
-    'jones/laser',
-    'jones/malvern',
-    'jones/music',
-    'jones/national',
-    'jones/orbicom',
-    'jones/oxford',
-    'jones/patient',
-    'jones/pilot',
-    'jones/plant',
-    'jones/props',
-    'jones/resident',
-    'jones/reuter',
-    'jones/ross',
-    'jones/singer',
     'jones/social',
-    'jones/thames',
-    'jones/throttle',
-    'jones/unemployed',
-    'jonesavitch',
-    'jonesi',
-    'jonesport',
-    'joneswarning',
-    'jong-il',
-    'jong-koo',
-    'jongkind',
-    'jonglei',
-    'jongsma',
-    'jonh',
-    'jonides',
-    'jonjoli',
     'jonk',
-    'jonkers',
-    'jonkheere',
-    'jonnifer',
-    'jonnson',
-    'jonor',
-    'jonquils',
-    'jonsil',
-    'jonsonian',
-    'jonsonn',
-    'jonssoen',
-    'jonstolen',
-    'jony',
-    'joo-sung',
-    'joodha',
-    'joodjee',
     'joolz/rev',
-    'joompah',
-    'joone',
-    'joosten',
-    'jopint',
-    'jopplety',
-    'jopson',
-    'jor&eacute;di&eacute',
-    'jor-el',
-    'joram',
-    'joray',
-    'jord',
-    'jordan-hart',
-    'jordan-style',
-    'jordan-yamaha',
-    'jordan/heart',
     'jordan/lorry',
-    'jordan/saudi',
-    'jordan/wife',
-    'jordani',
-    'jordanian-based',
-    'jordanian-sponsored',
-    'jordanons',
-    'jordanov',
-    'jordanus',
-    'jordanwatch',
-    'jordonova',
-    'jores/matthew',
-    'jorgenson',
-    'jorges',
-    'jorghino',
-    'jorma',
     'jorn/debord',
-    'jorrand',
-    'jorunal',
-    'jorund',
-    'jorvick',
-    'jos&eacute;-luis',
-    'jos&eacute;mar&iacute;a',
-    'jos&eacute;phine',
-    'jos&egrave',
-    'jos\'e',
-    'josaf',
-    'josaia',
-    'josaphat',
-    'joscelyne',
-    'joscina',
-    'jose-manuel',
     'jose-marie',
-    'joseba',
-    'josefin',
-    'josefino',
-    'josefowitz',
-    'josefsk&aacute',
-    'joseland',
-    'josemaria',
-    'josenaldo',
-    'joseph-charles',
-    'joseph/transport',
-    'josephea',
-    'josephfinance',
-    'josephinae',
-    'josevate',
-    'josh-house',
     'joshagan',
-    'joshed',
-    'joshieducation',
-    'joshipura',
-    'joshu',
-    'josie-maria',
-    'josipovici',
-    'josl',
-    'joslin/chief',
-    'jospeh',
-    'jospehites',
-    'josquinian',
-    'joss&rehy;sticks',
-    'joss-stick-scented',
-    'joss-sticky',
-    'joss/consultant',
     'josstick',
-    'jossua',
-    'jossvenglos',
-    'jostedalsbre',
-    'jostens',
-    'jostlings',
-    'josua',
-    'jot&ndash;re',
-    'jotangia',
-    'jote1',
-    'jotenheim',
-    'jotnian',
-    'jotul',
-    'jotunheimen',
-    'jou&euml;t',
-    'jouanne',
     'joubran',
-    'jouderville',
-    'jouen',
-    'jouennes',
-    'joueur',
-    'joueurs',
-    'jougler',
-    'jougs',
-    'jouhaud',
-    'joujoux',
-    'jouke',
-    'jouko',
-    'joule-seconds',
-    'jour&rehy;nalistic',
-    'jourdain-durance',
-    'jourgensen-stand',
     'jourmand',
-    'journ&eacute;es',
-    'journa',
-    'journal-a',
-    'journal/magazine',
-    'journal/nbc',
-    'journal/serial',
-    'journaled',
-    'journalism.',
-    'journalist\'',
-    'journalist-historians',
-    'journalist-tormentors',
-    'journalists/printers/newsagents',
-    'journalizes',
-    'journalizing',
-    'journalology',
     'journals.',
-    'journals_such',
-    'journaux',
-    'journee',
-    'journel',
-    'journeman',
-    'journey&mdash',
-    'journey*',
-    'journey-matching',
-    'journey-proud',
-    'journey-tale',
-    'journey-times',
-    'journey-women',
-    'journey.then',
-    'journey/adventure/exploration',
-    'journey/expedition',
     'journeyers',
-    'journeys&ndash',
-    'journeywork',
-    'journgensen',
-    'journies',
-    'journolists',
-    'journos-turned-media',
-    'jousting-helm',
-    'joustings',
-    'joustra/macintyre',
-    'jouv&iacute;n',
-    'jouvence',
-    'jouvenel',
-    'jouvenet',
-    'jouventin',
-    'jouvincourt',
     'jouy-en-josas',
-    'jouy-les-reims',
-    'jovinian',
-    'jovinianum',
-    'jow',
-    'jowan',
-    'jowett\'',
-    'jowl-shaking',
-    'jowl-wobbling',
-    'jowling',
-    'jowlings',
-    'jowlswipe',
-    'jowly-looking',
-    'jowster',
-    'joy&rehy;it',
-    'joy\'',
     'joy-boy',
-    'joy-rider',
-    'joy-ridin\'',
-    'joy-stained',
-    'joyb',
-    'joybringer',
-    'joyce&rehy;style',
-    'joyce-leon',
-    'joyce-loebl',
-    'joyce-worshippers',
-    'joyce/opthalmic',
-    'joycelyn',
-    'joycentenary',
-    'joye-killer',
-    'joyest',
-    'joykilling',
     'joyn&rehy;son',
-    'joynsons',
-    'joyport',
-    'joyridden',
-    'joyrided',
-    'joyriders/we',
-    'joysey',
-    'joysprick',
-    'joystick-and-cursor',
-    'joystrings',
-    'jozefff',
-    'jozel',
-    'jozeph',
-    'jozsa',
-    'jp-233',
-    'jp250',
     'jp760',
-    'jpdp',
-    'jpf',
-    'jpl.',
-    'jpm',
-    'jpp',
-    'jprs',
-    'jq',
-    'jrb-4',
-    'jrbg',
-    'jrfalla',
-    'jrflla',
-    'jrfu',
-    'jrr',
-    'js(1)',
-    'js1s',
     'jsam',
-    'jsb5',
-    'jse',
-    'jse/bse',
-    'jsn',
-    'jsp-led',
-    'jspcd',
-    'jsprs',
-    'jsr',
-    'jss',
-    'jsut',
-    'jt-12a-8',
-    'jt-60',
-    'jtb',
-    'jtl',
-    'jtls',
     'jtm-45',
-    'jtps',
-    'ju&aacute;n',
-    'ju&iacute;zo',
-    'ju\'i',
-    'ju-',
-    'ju-52',
-    'ju-88',
-    'ju-jujubes',
-    'ju-jus',
-    'ju-kwa',
-    'ju188',
-    'ju52',
-    'ju52/3m',
-    'ju52s',
-    'ju87b',
     'ju87bs',
-    'ju88a',
-    'juan-les-pins',
-    'juan-manual',
-    'juan-manuel',
-    'juancho',
-    'juanjorge',
-    'jubatus',
-    'jubayl',
-    'jubbergate',
-    'jubilance',
-    'jubilations',
-    'jubilatory',
-    'jubileo',
-    'jubilloo',
-    'jubilus',
     'jubjub',
-    'juby',
-    'juche',
-    'jucntion',
-    'juctions',
-    'judaens',
-    'judaeorum',
-    'judaeus',
-    'judah/israel',
-    'judaic&rehy;christian',
-    'judaic-christian',
-    'judaicae',
-    'judaicarum',
-    'judaicum',
-    'judaistic',
-    'judaization',
     'judaized',
-    'judaizing',
-    'judan',
-    'judas-like',
-    'judases',
-    'judd-powered',
-    'judds',
-    'jude\'s',
-    'judel/vrolijk',
-    'juden-theater',
-    'judenburg',
-    'judendaitsch',
-    'judenk&uuml;nig',
-    'judenrein',
-    'judenstaat',
-    'judeo-',
     'judeo-masonic&mdash;communist',
-    'judeo-masonic-communist-occult',
-    'judeo-nazis',
-    'judet',
-    'judetul',
-    'judg&rehy;ment',
-    'judge&rehy;ment',
-    'judge\'',
-    'judge-arbitrator',
-    'judge-arbitrators',
-    'judge-in-chambers',
-    'judge-power',
-    'judge/malvern',
-    'judge/sheriff',
-    'judge/united',
-    'judgemanship',
     'judgemen',
-    'judgement-free',
-    'judgement_as',
-    'judgementally',
-    'judgements.',
-    'judges.',
-    'judgmentally',
-    'judical',
-    'judicator',
-    'judicatory',
-    'judicial-review',
-    'judicial/administrative',
-    'judicialized',
-    'judiciary.',
-    'judisch-bolschewistischen',
-    'judische',
     'judita',
-    'judith-chalmers-ly',
-    'judivious',
-    'judoc',
-    'judrin',
-    'judson/local',
-    'judy-styled',
-    'judy/joanne',
-    'jueces',
-    'juel',
-    'jufer',
-    'jufuker',
-    'jug-band',
-    'jug-hauling',
-    'jug-jug-jugs',
-    'jug-money',
     'jug-pull',
-    'jugannath',
-    'jugband',
-    'jugement',
-    'jugendamt',
-    'jugendbewegung',
-    'jugendgef&auml;hrende',
-    'jugendherberge',
-    'jugendhilfe',
-    'jugfuls',
-    'juggins/parent',
-    'juggle-in',
-    'juggler-comedienne',
-    'juggling/conjuring',
-    'jugi',
-    'juglone',
     'jugneegiyn',
-    'jugo-slavia',
-    'jugoplastika',
-    'jugoslavije',
-    'jugular-red',
-    'jugulovenous',
-    'jugurtha',
-    'juhel',
-    'juhu',
-    'juice-stained',
-    'juice-tice',
-    'juice:plasma',
-    'juices.that',
-    'juicey',
-    'juicings',
-    'juicy-ripe',
     'juiliets',
-    'juillerat',
-    'juiverie',
-    'juives',
-    'juji',
-    'jujujujuja',
-    'jujus',
-    'juke-joint',
-    'juke/eyewitness',
-    'jukebox-come-end',
-    'jukebox-management',
-    'jukebox-ready',
-    'jukic',
-    'juktki',
-    'juku',
-    'jukun',
     'jul&ndash;2',
-    'jul&ndash;22',
-    'jul&ndash;4',
-    'jul&ndash;9',
-    'juler',
-    'jules-rosette',
-    'julesz',
-    'juley',
-    'juli',
-    'juli&aacute',
-    'julia-and-alastair',
-    'julia-if',
-    'juliana.the',
-    'juliano',
-    'julienas',
-    'juliers',
     'juliete',
-    'julin',
-    'julio-claudian',
-    'juliott',
-    'jull',
-    'julli',
-    'jullian',
-    'julliet',
-    'juls',
-    'july&mdash;30',
-    'july&mdash;august',
-    'july&ndash;15',
-    'july&ndash;20',
-    'july&ndash;22',
-    'july&ndash;29',
-    'july&ndash;30',
     'july&ndash;9',
-    'july&ndash;december',
-    'july&ndash;september',
-    'july*',
-    'july-1',
-    'july-10',
-    'july-15',
-    'july-2',
-    'july-20',
-    'july-21',
-    'july-6',
-    'july-aug',
-    'july-flowers',
-    'july-june',
-    'july-november',
-    'july-sept',
     'july-sown',
-    'july/aug',
-    'july/chief',
-    'july2',
-    'july24/aug23',
-    'july31/august',
-    'julyara',
-    'julz/effie',
-    'jumaale',
-    'jumadeen',
-    'jumar',
-    'jumaring',
-    'jumble-filled',
-    'jumblie',
-    'jumbo-cumbo',
-    'jumbo-ised',
     'jumbo-jumbo',
-    'jumbo-shaped',
-    'jumbo-size',
-    'jumby',
-    'jumeau',
-    'jumhoori',
-    'jumhuriya',
-    'jumhuriyah',
-    'jumi&eacute;ges',
-    'juminez',
-    'jump(s)',
-    'jump-and-turn',
-    'jump-jet',
-    'jump-jets',
-    'jump-offs',
-    'jump-rammed',
     'jump-shot',
-    'jump-starting',
-    'jump-starts',
-    'jump-suit',
-    'jump-to',
-    'jump-ups',
-    'jump/fly',
-    'jumpbox',
-    'jumpcats',
-    'jumped-up-gentleman',
-    'jumper-fiddler',
-    'jumper.',
-    'jumper/cardigan',
-    'jumpered',
-    'jumpers-on',
-    'jumping-about',
     'jumping-cage',
-    'jumping-hole',
-    'jumping-jack',
-    'jumping-on-to-parked-cars',
-    'jumpjet',
-    'jumps\'/',
-    'jumpship',
-    'jumpster',
-    'jun&ndash;12',
-    'jun&ndash;15',
-    'jun&ndash;4',
-    'jun&ndash;8',
-    'jun-air',
-    'jun-ap-1-binding',
-    'jun-binding',
-    'jun-dna',
     'jun/8&ndash;10',
-    'jun/dna',
-    'jun/jul',
-    'jun1-193',
-    'junankar',
-    'junb',
-    'juncal',
-    'junction&ndash;coltbridge',
-    'junction&ndash;pilton',
-    'junction-croxley',
-    'junctions/lateral',
-    'juncture.',
-    'jund',
-    'jundishapur',
-    'jundu',
-    'june&mdash;ibid.',
     'june&ndash;15',
-    'june&ndash;16',
-    'june&ndash;19',
-    'june&ndash;20',
-    'june&ndash;7',
-    'june-10',
-    'june-15',
-    'june-19',
-    'june-20',
-    'june-21',
-    'june-23',
-    'june-24',
-    'june-26',
-    'june-30',
-    'june-4',
-    'june-march',
     'june-november',
-    'june-sept',
-    'june/culham/oxfordshire',
-    'june/early',
-    'june/july/august',
-    'june1993',
-    'june22/july23',
-    'junes',
-    'junette',
-    'jung-chieh',
-    'jung-lette',
-    'jungen',
-    'jungeren',
-    'junges',
-    'jungfern',
-    'jungfrauenmaschine',
     'jungfraw',
-    'junggrammatiker',
-    'jungh&auml;nel',
-    'jungi',
-    'jungianism',
-    'jungians',
-    'jungipoor',
-    'jungk',
-    'jungle-&amp;-junkie-headed',
-    'jungle-beasts',
-    'jungle-boots',
-    'jungle-born',
-    'jungle-dense',
-    'jungle-drummed',
-    'jungle-dumb',
-    'jungle-gym',
     'jungle-living',
-    'jungle-skirmish',
-    'jungle-slugs',
-    'jungle-smart',
-    'jungle.',
-    'jungle/ghetto',
-    'jungli',
-    'jungling',
-    'jungly-atmosphere',
-    'jungly-type',
-    'jungm&auml;delschaft',
-    'jungr',
-    'juniac',
-    'junie',
-    'junieh',
-    'junior-secondary',
     'junior-sized',
-    'junior-staff',
-    'junior/first',
-    'junior/melody',
-    'junior/mini',
-    'junior/secondary',
-    'junior/senior',
-    'junipall',
-    'juniper-berry',
-    'juniper-covered',
-    'junk-bonds',
-    'junk-bondster',
-    'junk-chute',
-    'junk-culture',
-    'junk-default',
-    'junk-food-laden',
     'junk-funk',
-    'junk-words',
-    'junk-yard',
-    'junk-yards',
-    'junker-dominated',
-    'junker-middle-class',
-    'junkie-ascent',
-    'junkish',
-    'junkova',
-    'junkroom',
-    'junkus',
-    'junne',
-    'junoniae',
-    'junonius',
-    'junot',
-    'junper',
     'junr',
-    'junshen',
-    'junxia',
-    'junya',
-    'jupe-culotte',
-    'jupiter-bound',
-    'jupiter-grazing',
-    'jupiter-ruled',
-    'jupiterian',
-    'jupiters',
-    'juquin',
-    'jurabek',
-    'jurados',
-    'jurady',
-    'jural-political',
-    'juranc',
     'juranon',
-    'jurapari',
-    'juraque',
-    'jurassienne',
-    'jurca',
-    'jurczak',
-    'jurdy',
-    'jurek',
-    'jurg',
-    'jurgenson',
-    'jurgis',
-    'jurica',
-    'jurick',
-    'juridical-political',
-    'juridico',
-    'juridiction',
     'juripa',
-    'jurisconsult/general',
-    'jurisdiction(s)',
-    'jurisdiction-fishing',
-    'jurisdiction.exceptions',
-    'jurisdictionable',
-    'jurisdictional/non-jurisdictional',
-    'jurisdictionals',
-    'jurisdictions.',
-    'jurisiction',
-    'jurisidiction',
-    'jurisprudent',
-    'jurisprudentialists',
-    'juristenmonopol',
-    'jurjevic',
-    'jurmala',
     'jurminus',
-    'jurnalis',
-    'juropolitical',
-    'jurtina',
-    'jurugua',
-    'jurulatih',
-    'jurusdiction',
-    'jury-courts',
-    'jury-men',
-    'jury-rig',
-    'jury-rigged',
-    'jury-rigging',
-    'jury-trial',
-    'juryeff',
-    'jurys',
-    'jus&rehy;tify',
     'jus\'',
-    'jusi',
-    'jusify',
-    'jusk',
-    'juskevicius',
-    'juss',
-    'juss-goh-ha-pee',
-    'jussell',
-    'jussive',
-    'jusstified',
-    'just-a',
-    'just-announced',
-    'just-arrived',
-    'just-beheaded',
-    'just-between-us',
-    'just-boiled',
     'just-born',
-    'just-built',
-    'just-butchered',
-    'just-cancelled',
-    'just-children',
-    'just-discovered',
-    'just-divorced',
-    'just-elected',
-    'just-ended',
-    'just-enough',
-    'just-finished',
-    'just-fitted',
-    'just-formed',
-    'just-gargled-with-port-wine',
-    'just-he',
-    'just-in-out-of-the-cold',
     'just-in-penwith',
-    'just-in-roseland',
-    'just-introduced',
-    'just-like',
-    'just-maybe',
-    'just-melted',
-    'just-molten',
-    'just-opened',
-    'just-out-of-the-nest',
-    'just-past-pubescence',
-    'just-right',
-    'just-rouged',
-    'just-savaged',
-    'just-seven-year-old',
-    'just-sizeable',
-    'just-slightly-strange',
     'just-squeezed',
-    'just-too-distant',
-    'just-turned-30',
-    'just-understandable',
-    'just-warm',
-    'just-well',
-    'just.johnston',
-    'just/precisely/exactly',
-    'just=',
-    'just_a_little',
-    'just_as_,',
-    'just_as_well',
-    'just_for',
-    'just_in_case',
-    'just_just_about',
-    'just_just_just_about',
     'just_near',
-    'justanook',
-    'juste.',
-    'justerini',
-    'justi',
-    'justica',
-    'justicar',
-    'justice-maker',
-    'justice-room',
-    'justice.david',
-    'justice/london',
-    'justice/procedural',
-    'justices/swindon',
-    'justicialists',
-    'justiciars',
-    'justicie',
     'justifably',
-    'justifi',
-    'justifi&rehy;cations',
-    'justifiers',
-    'justinas',
-    'justinho',
-    'justinianic',
-    'justinlees',
-    'justinus',
-    'justis',
-    'justos',
-    'justs',
-    'justtook',
-    'justy',
-    'jut-jawed',
-    'jutaposed',
     'jute-backed',
-    'jute-working',
-    'jutikulminister',
-    'jutland.',
-    'jutlands',
-    'jutson',
-    'jutsum',
-    'juttin\'',
-    'jutz',
-    'juvantibus',
-    'juvat',
-    'juve&rehy;nile',
-    'juvenile-seeming',
-    'juvenni',
-    'juventi',
-    'juventous',
     'juventus.',
-    'juventus3',
-    'juventutem',
-    'juventutibus',
-    'juvescence',
-    'juvos',
-    'jux',
-    'juxes',
-    'juxta-articular',
-    'juxtamucosal',
-    'juxtapositional',
-    'juy',
-    'juzdbasic',
-    'juzgado',
-    'juzgo',
-    'jvs',
     'jw27e',
-    'jw63t',
-    'jw64u',
-    'jw65v',
-    'jwp/businessland',
-    'jya',
-    'jyan',
-    'jydsk',
-    'jyll',
-    'jyllands',
-    'jynx',
-    'jz',
-    'k&aacute',
-    'k&amacr;i',
-    'k&amacr;ma',
-    'k&amacr;mi',
     'k&amp;wvr',
-    'k&auml;llgren',
-    'k&auml;mp',
-    'k&auml;ndel',
-    'k&auml;ndler',
-    'k&auml;p',
-    'k&auml;rkevagge',
-    'k&auml;rnten',
-    'k&auml;rntnerstrasse',
-    'k&auml;rtnerstrasse',
-    'k&auml;semann',
-    'k&auml;ser-glanzmann',
-    'k&dgr;k',
-    'k&eacute;k&eacute',
-    'k&eacute;v&eacute',
-    'k&egr;b',
     'k&egr;p',
-    'k&egr;rt',
-    'k&gt;0',
-    'k&lsqb;br2&rsqb',
-    'k&lsqb;ing&rsqb',
-    'k&lt',
-    'k&lt;0',
-    'k&lt;1',
-    'k&oacute;0kan',
-    'k&oacute;in',
-    'k&ocirc;nig',
-    'k&ouml;chels',
-    'k&ouml;cki',
-    'k&ouml;cki\'',
-    'k&ouml;hl',
-    'k&ouml;keritz',
     'k&ouml;llmann',
-    'k&ouml;ln/goebel',
-    'k&ouml;lner=stadt-anzeiger',
-    'k&ouml;lnischer',
-    'k&ouml;ltzsch',
-    'k&ouml;nberg',
-    'k&ouml;nigin',
-    'k&ouml;niginnen',
-    'k&ouml;nigshofen',
-    'k&ouml;nigsl&uuml;tter',
-    'k&ouml;nigsm&uuml;nster',
-    'k&ouml;nigsmark',
-    'k&ouml;nigsplatz',
-    'k&ouml;nigsschlosser',
-    'k&ouml;nigssee',
-    'k&ouml;nigsviertel',
     'k&ouml;nitz',
-    'k&ouml;pckestrasse',
-    'k&ouml;r&ouml;sy',
-    'k&ouml;rperschaft',
-    'k&ouml;slin',
-    'k&ouml;y',
-    'k&plus',
-    'k&prime&prime',
-    'k&prime;c',
-    'k&rcaron;i&zcaron;ovnick&aacute',
-    'k&times;h7',
-    'k&uuml;c&uuml;k',
-    'k&uuml;hnen',
-    'k&uuml;ltepe',
-    'k&uuml;nstler',
-    'k&uuml;sse',
     'k&uuml;ssel',
-    'k\'',
-    'k\'ang',
-    'k\'ombudo',
-    'k\'un',
-    'k\'vass',
-    'k\'yow',
-    'k\'yow\'',
-    'k(2)',
-    'k*c',
-    'k+',
-    'k-158',
-    'k-5',
-    'k-562',
-    'k-67',
-    'k-atpase',
     'k-b',
-    'k-car',
-    'k-chell',
-    'k-class',
-    'k-club',
-    'k-co',
-    'k-creative',
-    'k-dependent',
-    'k-edge',
-    'k-factors',
-    'k-fold',
-    'k-g-b',
-    'k-i-c-k',
-    'k-j',
-    'k-k-k-katy',
-    'k-keen',
     'k-korea',
-    'k-l',
-    'k-mesons',
-    'k-modification',
-    'k-motronic',
-    'k-n',
-    'k-paul',
-    'k-post',
-    'k-promoted',
-    'k-r-y-t-r-o-n',
-    'k-razy',
-    'k-rhodizonate',
-    'k-rich',
-    'k-richterite',
-    'k-richterites',
-    'k-s-h',
     'k-space',
-    'k-spool',
-    'k-stars',
-    'k-statistic',
-    'k-surface',
-    'k-tables',
-    'k-telestar',
-    'k-tuples',
-    'k-two',
-    'k-y',
-    'k.001',
-    'k.1(1)',
-    'k.135',
-    'k.136',
-    'k.137',
-    'k.162',
     'k.165',
-    'k.168&ndash;73',
-    'k.168-k.173',
-    'k.172',
-    'k.174',
-    'k.181',
-    'k.182/173da',
-    'k.183',
-    'k.192',
-    'k.199/161b',
-    'k.2',
-    'k.20',
-    'k.200/189k',
-    'k.201',
-    'k.202/186b',
-    'k.204',
     'k.22',
-    'k.239',
-    'k.262',
-    'k.271',
-    'k.284a',
-    'k.299',
-    'k.3',
-    'k.301-k.306',
-    'k.310',
-    'k.310/300d',
-    'k.317',
-    'k.318',
-    'k.321',
-    'k.331',
-    'k.337',
-    'k.339',
     'k.35',
-    'k.361',
-    'k.365',
-    'k.375',
-    'k.388',
-    'k.396/300g',
-    'k.4',
-    'k.40',
-    'k.413',
-    'k.413&ndash;5',
-    'k.414',
-    'k.427/417a',
-    'k.450',
-    'k.451',
-    'k.453',
-    'k.454',
     'k.457',
-    'k.458',
-    'k.459',
-    'k.464',
-    'k.465',
-    'k.475',
-    'k.477',
-    'k.482',
-    'k.504',
-    'k.515',
-    'k.516',
-    'k.525',
-    'k.526',
-    'k.543',
-    'k.546',
-    'k.551',
     'k.575',
-    'k.581',
-    'k.589',
-    'k.590',
-    'k.593',
-    'k.595',
-    'k.6',
-    'k.6&amp;7',
-    'k.6&ndash;9',
-    'k.614',
-    'k.623',
-    'k.66',
-    'k.69',
-    'k.7',
-    'k.72',
-    'k.8',
     'k.87/74a',
-    'k.b.107',
-    'k.b.c.-19',
-    'k.c.a.',
-    'k.c.e.c.',
-    'k.c.m.g.',
-    'k.f.a.',
-    'k.g',
-    'k.g.a.',
-    'k.hz',
-    'k.i.',
-    'k.j.l',
-    'k.k',
-    'k.l.m.',
-    'k.m.i.january',
-    'k.o.cup',
     'k.o.s.',
-    'k.o.y.l.i',
-    'k.p.e.',
-    'k.p.s.',
-    'k.r.',
-    'k.s.',
-    'k.s.p.',
-    'k.w',
-    'k.zinn',
-    'k/',
-    'k/2',
-    'k/ar',
-    'k/k',
-    'k/s',
-    'k0',
-    'k0\'s',
     'k07',
-    'k1&mdash;k2',
-    'k1,200',
-    'k1,600',
-    'k100,000',
-    'k100s',
-    'k102,000,000',
-    'k11&mdash;fee',
-    'k11fee',
-    'k136',
-    'k13fee',
-    'k150,000,000',
-    'k155',
-    'k155&ndash;9',
-    'k156',
-    'k168&ndash;71',
     'k174',
-    'k190',
-    'k190/186e',
-    'k19a',
-    'k19b',
-    'k1g',
-    'k2&ndash;100',
-    'k201',
-    'k21',
-    'k216/k218',
-    'k21for',
-    'k21nest',
-    'k22r',
-    'k231',
-    'k23r',
-    'k24,000',
     'k24,000,000',
-    'k24,500',
-    'k242',
-    'k24e',
-    'k25',
-    'k251',
-    'k261',
-    'k28',
-    'k3&mdash;k4',
-    'k32y6031-cd',
-    'k331',
-    'k333',
-    'k358',
-    'k358/186c',
-    'k36,000',
-    'k362,000,000',
     'k364',
-    'k364/k320.',
-    'k381',
-    'k384a/388',
-    'k387',
-    'k412,000,000',
-    'k420',
-    'k426',
-    'k448',
-    'k449',
-    'k450',
-    'k452',
-    'k453',
-    'k454',
-    'k464',
-    'k488',
     'k491',
-    'k50,100',
-    'k503',
-    'k504',
-    'k514,000,000',
-    'k516',
-    'k5257',
-    'k5257-k5263',
-    'k526',
-    'k52n',
-    'k537,000',
-    'k542',
-    'k548',
-    'k550',
-    'k551',
-    'k564',
     'k575',
-    'k5910',
-    'k5911',
-    'k5939',
-    'k595',
-    'k5980-k5913',
-    'k606',
-    'k6927',
-    'k6927-k6932',
-    'k6cr',
-    'k7',
-    'k7555',
-    'k9682-k9686',
-    'k9926',
-    'k9j',
-    'k=0&middot;41',
     'k=1',
-    'k=4r2c1',
-    'k=ca',
-    'k_',
-    'k_as',
-    'ka\'ba',
-    'ka\'u',
-    'ka-62',
-    'ka-aaow',
-    'ka-gool',
-    'ka-ka-ka',
-    'ka-on',
-    'ka-prap',
-    'ka.b',
-    'ka8210',
-    'ka8300',
     'ka8310',
-    'ka881',
-    'kaa\'',
-    'kaa-arr-arrr',
-    'kaa-uh',
-    'kaaa',
-    'kaaay',
-    'kaaba',
-    'kaah',
-    'kaambi',
-    'kaan',
-    'kaanapali',
-    'kaarina',
-    'kaars',
-    'kaasdoop',
-    'kaatje',
     'kab',
-    'kabajani',
-    'kabaka-to-be',
-    'kabalevskian',
-    'kabalevsky',
-    'kabanova',
-    'kabardino-balkar',
-    'kabarett',
-    'kabariti',
-    'kabarti',
-    'kabbaj',
-    'kabbala',
-    'kabbani',
-    'kabbous',
-    'kabeho',
-    'kabelitz',
     'kabelv&aring;g',
-    'kabelwa',
-    'kaber',
-    'kaberu',
-    'kabhri',
-    'kabi-pharmacia',
-    'kabia',
-    'kabichoosa',
-    'kabiga',
-    'kabil',
-    'kabinet',
-    'kabinets-kanzlei',
-    'kabinette',
-    'kabinettsbefragung',
-    'kabinettsprinzip',
-    'kabingu',
     'kabiri',
-    'kabita',
-    'kabivitrum',
-    'kabo',
-    'kaboo',
-    'kabooz',
-    'kabor&eacute',
-    'kabou',
-    'kaboulu',
-    'kaboutermannikins',
-    'kabouters',
-    'kabr',
-    'kabrikha',
-    'kabrisky',
-    'kabrru',
-    'kabue',
     'kabuli',
-    'kabun',
-    'kaburaki',
-    'kaburdian',
-    'kabwegyere',
-    'kabyle',
-    'kacanik',
-    'kachan',
-    'kachel',
-    'kachemire',
-    'kachenend',
-    'kachidza',
-    'kachina',
-    'kack',
-    'kacker',
-    'kacperska',
     'kaczorowski',
-    'kada',
-    'kada&ncaron',
-    'kadai',
-    'kadamy',
-    'kadanwari-1',
-    'kadar-gravning',
-    'kadarism',
-    'kadavulava',
-    'kadazan',
-    'kadazan-dusun',
-    'kadett',
-    'kadhima',
-    'kadiliks-the',
-    'kadin',
-    'kadirkamanathan',
     'kadizade',
-    'kadmonites',
-    'kadoorie',
-    'kadrepublic',
-    'kaduna-based',
-    'kadushin',
-    'kadviserg',
-    'kadzielski',
-    'kae',
-    'kaebling',
-    'kaedi',
-    'kaekwae',
-    'kaendly',
-    'kaeng',
-    'kaeo',
-    'kaeon',
     'kaepa',
-    'kaeppler',
-    'kaernhachii',
-    'kaese',
-    'kaeseberg',
-    'kaet',
-    'kaf',
-    'kaf&eacute;s',
-    'kafadar',
-    'kafan',
-    'kafarabad',
-    'kafarnihan',
-    'kafco',
-    'kaferberg',
-    'kaferkasten',
-    'kaffen-und-kucken',
     'kaffmann',
-    'kafiluddin',
-    'kafirs',
-    'kafity',
-    'kafka-esque',
-    'kafkaesqueness',
-    'kafkazi',
-    'kafsikas',
-    'kaftaned',
-    'kagambi',
-    'kagawa',
-    'kagehide',
-    'kagera',
-    'kagimbi',
-    'kagimbisecretary',
-    'kagiri-nishiki',
     'kagnew',
-    'kagnoff',
-    'kagonyera',
-    'kagool',
-    'kagools',
-    'kagrant',
-    'kags',
-    'kah-gega-gah-bowh',
-    'kahanamokus',
-    'kaher',
-    'kahikatea',
-    'kahiki',
-    'kahin',
-    'kahiyeh',
-    'kahk',
-    'kahle',
     'kahlid',
-    'kahloesque',
-    'kahlua',
-    'kahlua\'n',
-    'kahneman',
-    'kahnesatake',
-    'kahnoh',
-    'kahns',
-    'kahr',
-    'kahraman',
-    'kahsnitz',
-    'kahukiwa',
-    'kahunas',
-    'kahuta',
-    'kai-chah',
-    'kaibel',
     'kaifas',
-    'kaiga',
-    'kaige',
-    'kaihatsu',
-    'kaihsienkung',
-    'kaiju',
-    'kaikhosru',
-    'kaikoura',
-    'kailas',
-    'kailish',
-    'kailzee',
-    'kaim-caudle',
-    'kaimak',
-    'kaimei',
-    'kaimoncho',
-    'kaimowitz',
     'kainardzhi',
-    'kainen',
-    'kaingli',
-    'kainos',
-    'kaiparowits',
-    'kaiping',
-    'kair&oacute;s',
-    'kairallah',
-    'kaisarani',
-    'kaiser-friedrich',
-    'kaiser-permanente',
-    'kaiserblick',
-    'kaiserhof',
-    'kaiseria',
-    'kaiserin',
-    'kaiserjaeger',
     'kaiserlauten',
-    'kaiserlautern',
-    'kaiserman',
-    'kaisers',
-    'kaisersteinbruch',
-    'kaiserstejn',
-    'kaiserstuhl',
-    'kaisertreu',
-    'kaiserworth',
-    'kaisho',
-    'kaitaake',
-    'kaitaia',
-    'kaitarma',
-    'kaitchuck',
-    'kaiteie',
-    'kaitiaki',
     'kaitlin',
-    'kaitouni',
-    'kaitung',
-    'kaiulani',
-    'kaivalya',
-    'kaiyidine',
-    'kaiyo',
-    'kaiyo-maru',
-    'kaizer',
-    'kaizo',
-    'kajabi',
-    'kajala',
-    'kajanoja',
-    'kajdomcaj',
-    'kajfez',
-    'kajkavski',
     'kajokaji',
-    'kajoyo',
-    'kajubi',
-    'kajura',
-    'kak-kak-kak',
-    'kakabadse',
-    'kakala',
-    'kakami',
-    'kakatuwa',
-    'kakavije',
-    'kake',
-    'kakelik',
-    'kakemono',
-    'kaketani',
-    'kaketsuken',
-    'kakfui',
     'kakhonak',
-    'kakitumba',
-    'kakizawa',
-    'kako',
-    'kakolewnica',
-    'kakorinya',
-    'kakoulidou',
-    'kakutani',
-    'kakutaro',
-    'kalabar',
-    'kalaben',
-    'kalabu',
-    'kalachakra',
-    'kalafani',
-    'kalaheo',
-    'kalak',
     'kalalae',
-    'kalalah',
-    'kalamachka',
-    'kalamakis',
-    'kalamaraiki',
-    'kalamari',
-    'kalambay',
-    'kalami',
-    'kalamunda',
-    'kalan',
-    'kalangula',
-    'kalantari',
-    'kalar',
-    'kalaschnike',
-    'kalash',
-    'kalashakra',
     'kalashnikov-wielding',
-    'kalatara',
-    'kalatzakos',
-    'kalauria',
-    'kalavada',
-    'kalaw&ndash;rangoon',
-    'kalay',
-    'kalayaan',
-    'kaldex',
-    'kaldezeit',
-    'kaldfjorden',
-    'kaldorian',
-    'kaleb',
-    'kalechofsky',
-    'kaledon',
-    'kaleido&rehy;scopic',
     'kalemegdan',
-    'kalend',
-    'kalendarum',
-    'kalender',
-    'kalenge',
-    'kalenji',
-    'kales',
-    'kalessi',
-    'kaletsky',
-    'kalewa',
-    'kalgoorlie.',
-    'kalgorlie',
-    'kalharachi',
-    'kali-anne',
-    'kali-chemical',
-    'kali-film',
     'kalibari',
-    'kalich',
-    'kalicharan',
-    'kalied',
-    'kalija',
-    'kalikow',
-    'kalikutta',
-    'kalili',
-    'kalilombe',
-    'kalilu',
-    'kalima',
-    'kalimera',
-    'kalimpong',
-    'kalinauskas',
-    'kalinichenko',
-    'kalinichta',
     'kalinigrad',
-    'kalininchenko',
-    'kalinka',
-    'kalinke',
-    'kalinowsky',
-    'kalinska',
-    'kalinske',
-    'kalinta',
-    'kalintha',
-    'kalis',
-    'kalispel',
-    'kalispera',
-    'kalk',
-    'kalkini',
-    'kalla',
-    'kallab',
     'kallagna',
-    'kallah',
-    'kallala',
-    'kallas',
-    'kallenberger',
-    'kallestad',
-    'kallikrein-kinin',
-    'kallipolis',
-    'kallir',
-    'kallischarran',
-    'kallu',
-    'kalme',
-    'kalmer',
-    'kalmyksn',
-    'kalo',
-    'kalochroma',
     'kalodirr',
-    'kaloi',
-    'kalon',
-    'kalonia',
-    'kalonji',
-    'kalonyme',
-    'kalonzo',
-    'kalooki',
-    'kalorkoti',
-    'kalotermes',
-    'kalou',
-    'kaloude',
-    'kalowet',
-    'kaloxilos',
-    'kalpana-designed',
-    'kalpaqi',
     'kalpna',
-    'kalpnath',
-    'kalpokass',
-    'kalsbeek',
-    'kalt/heim',
-    'kaltbad',
-    'kaltenbach',
-    'kaltenborn',
-    'kalu',
-    'kalugin/russian',
-    'kaluki',
-    'kalundberg',
-    'kalundborg',
-    'kaluskar',
-    'kalvaitis',
-    'kalvariskii',
     'kalvi',
-    'kalydor',
-    'kamaal',
-    'kamai',
-    'kamaing-mogaung',
-    'kamakasi',
-    'kamaleai',
-    'kamali',
-    'kamalia',
-    'kamaluddin',
-    'kaman-i',
-    'kamanda',
-    'kamanice',
-    'kamarina',
-    'kamarov/russian',
-    'kamas',
     'kamasutra',
-    'kamati',
-    'kamaz',
-    'kamazu',
-    'kambay',
-    'kambou',
-    'kamchatcka',
-    'kamchatkan',
-    'kamchatkans',
-    'kamdiesel',
-    'kame',
-    'kamehameha',
-    'kamelesan',
-    'kameltreiber',
-    'kamenets-podolskiy',
-    'kamerad',
     'kameraden',
-    'kamerbeck',
-    'kamerling',
-    'kamerman',
-    'kamerun',
-    'kamet',
-    'kamien',
-    'kamiguchi',
-    'kamik',
-    'kamikaze-style',
-    'kamikazeed',
-    'kamikazi',
-    'kamikazis',
-    'kamiladin',
-    'kamilindustry',
-    'kamille',
     'kamina',
-    'kaminaga',
-    'kaminskaya',
-    'kamira',
-    'kamla',
-    'kamlan-ek',
-    'kamlish',
-    'kamloops&ndash;whistler',
-    'kammern',
-    'kammhuber',
-    'kammies',
-    'kamni&scaron;ki',
-    'kamod',
-    'kampflugzeug',
-    'kampfrath',
-    'kamphaeng',
     'kampmann',
-    'kampongs',
-    'kampuchea&mdash;vonadek',
-    'kampuchean/thai',
-    'kamrock',
-    'kamsing',
-    'kamsky',
-    'kamtschaticum',
-    'kamu',
-    'kamuku',
-    'kamus',
-    'kamuza',
-    'kan\'',
-    'kan-krushers',
-    'kana-to-kanji',
-    'kanabi',
     'kanael',
-    'kanaf',
-    'kanaka',
-    'kanaks',
-    'kanaky',
-    'kanan',
-    'kanaoka',
-    'kanashimiwa',
-    'kanbach',
-    'kanchanaburi',
-    'kancheli',
-    'kanchelski',
-    'kandalar',
-    'kandalia',
-    'kandalnaya',
-    'kandani',
     'kandari',
-    'kandhari',
-    'kandi-cutie',
-    'kandinski',
-    'kandinskys',
-    'kandiyali',
-    'kandiye',
-    'kane\'',
-    'kane/labour',
-    'kaneamari',
-    'kanel.',
-    'kanellakis',
-    'kanemara',
-    'kanemaru/takeshita',
-    'kaneohe',
-    'kanesh',
     'kanevsky',
-    'kanezo',
-    'kang-lu',
-    'kang-so',
-    'kangalas',
-    'kangaroo&rehy;hopped',
-    'kangaroo-hopped',
-    'kangas-saarela',
-    'kangerdlugssuaq',
-    'kangols',
-    'kangra',
-    'kangris',
-    'kangru',
-    'kanguru',
-    'kangxi',
-    'kanha',
     'kanharith',
-    'kani',
-    'kanidoua',
-    'kanifinolhu',
-    'kaniga',
-    'kanimai',
-    'kanimainjit',
-    'kanj&oacute',
-    'kanjii',
-    'kanjikudichi',
-    'kanju',
-    'kankan',
-    'kankkunnen',
-    'kannchelsk',
-    'kannekens',
-    'kanner',
     'kannia',
-    'kannna',
-    'kannout',
-    'kanof',
-    'kanonkop',
-    'kanoun',
-    'kanowski/forestry',
-    'kanrith',
-    'kanryo',
-    'kans',
-    'kansaii',
-    'kansan',
-    'kansanpuolue',
-    'kansas-born',
-    'kansasii',
-    'kansei',
     'kanshi',
-    'kansk*',
-    'kant\'s',
-    'kant.',
-    'kanta',
-    'kantara',
-    'kantari',
-    'kantarjian',
-    'kantelis',
-    'kantha',
-    'kanthack',
-    'kantharos',
-    'kantianism',
-    'kantionalsatz',
-    'kantjil',
-    'kantons',
     'kantonsapotheke',
-    'kantorei',
-    'kants',
-    'kantsler',
-    'kantsler_et',
-    'kanturek',
-    'kanungo',
-    'kanvas',
-    'kanyakumari',
-    'kanyeihamba',
-    'kanyerengwe',
-    'kanyon',
-    'kanyoro',
-    'kanyosha',
-    'kanzas',
-    'kanzleramt',
     'kanzlerprinzip',
-    'kanzo',
-    'kanzou',
-    'kao-cheng',
-    'kao-wen',
-    'kaohsiun',
-    'kaokoland',
-    'kaolin-free',
-    'kaoline',
-    'kaolini',
-    'kaolinisation',
-    'kaolinised',
-    'kaolinite-illite',
-    'kaolinititic',
-    'kaon',
-    'kaona',
     'kap',
-    'kapa',
-    'kapadia',
-    'kapalabhati',
-    'kapalu',
-    'kapar',
-    'kapasluoppal',
-    'kapek',
-    'kapellan',
-    'kapelnoes',
-    'kapelwa',
-    'kapeno',
-    'kapheneion',
-    'kaphereus',
-    'kapielsky',
-    'kapilarii',
     'kapilow',
-    'kapisa',
-    'kapit&auml;n',
-    'kapla',
-    'kaplan-type',
-    'kaplans',
-    'kapllaniforeign',
-    'kaplow',
-    'kaplowitz',
-    'kapnist',
-    'kapok-filled',
-    'kapon',
-    'kapoors',
-    'kapp/high',
-    'kappa-float',
-    'kappa-pc',
     'kappel',
-    'kappeler',
-    'kappeller',
-    'kappenburg',
-    'kaprayoon',
-    'kaprova',
-    'kapsch',
-    'kapskaps',
-    'kapteeni',
-    'kapula',
-    'kapuni',
-    'kapurala',
-    'kapuschinski',
-    'kara-goyi',
-    'kara-on',
-    'karabashev',
     'karabkah',
-    'karabulut',
-    'karacan',
-    'karachaevo-cherkessk',
-    'karachaganak',
-    'karadji',
-    'karadjordjevi&cacute',
-    'karadjordjevic',
-    'karadzhov',
-    'karadzik',
-    'karain&ccedil;ir',
-    'karaiskou',
-    'karaitivu',
-    'karaj',
-    'karajan\'',
-    'karajan-like',
     'karajan/',
-    'karajan/decca',
-    'karajanesque',
-    'karajeanesque',
-    'karaka',
-    'karakacias',
-    'karakalpakia',
-    'karakushi',
-    'karalius',
-    'karamajong',
-    'karamanids',
-    'karamanis',
-    'karamanmaras',
-    'karambo',
-    'karamuko',
-    'karamzin',
     'karanduwa',
-    'karang',
-    'karanga',
-    'karangwa',
-    'karanos',
-    'karaokes',
-    'karaosmanoglu',
-    'karar',
-    'karas',
-    'karasjok',
-    'karass',
-    'karat',
-    'karatas',
-    'karataviense',
-    'karate-chopped',
-    'karate-chopping',
     'karate-dispensing',
-    'karate-ka',
-    'karate-style',
-    'karatedo',
-    'karatekas',
-    'karati',
-    'karaula',
-    'karaulov',
-    'karavajevs',
-    'karavan',
-    'karavanserai',
-    'karawya',
-    'karazija',
-    'karbalnov',
-    'karbide',
-    'karbovanets',
     'karcher',
-    'karcsa',
-    'karczenski',
-    'karczmiska',
-    'karda-mine',
-    'kardadzic',
-    'kardelj',
-    'kardin',
-    'kardofan',
-    'kardoma',
-    'kardomah-like',
-    'kardon',
-    'kareene',
-    'karelya',
-    'karfarnihan',
-    'karfonas',
     'karge',
-    'karges',
-    'kargin',
-    'karhu',
-    'kari-anne',
-    'kari-otto',
-    'karie',
-    'kariels',
-    'karikurubu',
-    'karikurubucivil',
-    'karima',
-    'karimanzima',
-    'karimjee',
-    'karintina',
-    'karinya',
-    'karioke',
     'karipo',
-    'karita',
-    'karite',
-    'karkade',
-    'karkar',
-    'karkazon',
-    'karkut',
-    'karl&eacute;n',
-    'karl&rehy;marx-strasse',
-    'karl&scaron;tejn',
-    'karl&uring;v',
-    'karl-ernst',
-    'karl-gunnar',
-    'karl-gustav',
-    'karl-hermann',
-    'karl-hinrich',
     'karl-horst',
-    'karl-marx',
-    'karl-marx-',
-    'karlefors',
-    'karlen',
-    'karlene',
-    'karlowitz',
-    'karlplatz',
-    'karlshamns',
-    'karlshof',
-    'karlsplatz',
-    'karlstein-aschaffenburg',
-    'karlstor',
-    'karman',
-    'karmas',
-    'karmayogin',
     'karmen',
-    'karmi',
-    'karmokolias',
-    'karmuta',
-    'karna',
-    'karnad',
-    'karnasuta',
-    'karnchatka',
-    'karnchatkan',
-    'karndal',
-    'karndol',
-    'karndoli',
-    'karner',
-    'karnival',
-    'karny',
-    'karochooq',
     'karoli',
-    'karolingischen',
-    'karolinum',
-    'karoliny',
-    'karolj',
-    'karolyev',
-    'karomemphites',
-    'karonga',
-    'karotu',
-    'karozzin',
-    'karp',
-    'karpathi',
-    'karpati',
-    'karpinski',
-    'karpov&mdash;kasparov',
-    'karpovian',
     'karras',
-    'karriem',
-    'karrimat',
-    'karrimore',
-    'karroo',
-    'karrrimore',
-    'karrrr',
-    'karry',
-    'karsa',
-    'karsan',
-    'karsberg',
-    'karshenas',
-    'karsino',
-    'karskoe',
-    'karslon',
-    'karst-like',
     'karswell',
-    'kart-breaking',
-    'karta',
-    'kartal',
-    'karte',
-    'kartel',
-    'karters',
-    'karthaus',
-    'kartidg',
-    'kartika',
-    'kartparts',
-    'kartsch',
-    'kartvedt',
-    'karun',
-    'karunanayake',
-    'karunatilake',
     'karunen',
-    'karunyavanij',
-    'karussell',
-    'karvellis',
-    'karven',
-    'karweil',
-    'karyophillon',
-    'karyotypic',
-    'karystonikos',
-    'karzay',
-    'kasabian',
-    'kasambala',
-    'kasamuk',
-    'kasanof',
-    'kasarda',
-    'kasatanov',
     'kascade',
-    'kasels',
-    'kasemann',
-    'kasemsriminister',
-    'kasenally',
-    'kasenga',
-    'kaserne',
-    'kasevich',
-    'kash',
-    'kashafotdinov',
-    'kasham',
-    'kashan-style',
-    'kashans',
-    'kashapov',
-    'kashfi',
-    'kashga\'i',
     'kashgay',
-    'kashima',
-    'kashita',
-    'kashkin',
-    'kashmere',
-    'kashmira',
-    'kashmiri/pakistani',
-    'kashmirs',
-    'kashyap',
-    'kasi',
-    'kasia',
-    'kasiena',
-    'kasih',
-    'kasim',
-    'kasimirov',
-    'kasio',
     'kasiopi',
-    'kasise',
-    'kasitah',
-    'kask&amacr',
-    'kaskade',
-    'kaske',
-    'kaslain',
-    'kasliwal',
-    'kasoma',
-    'kasos',
-    'kasparov\'',
-    'kaspars',
-    'kasperoff',
-    'kasprowicz',
-    'kasprzyk',
-    'kasr',
     'kasrawan',
-    'kassabzade',
-    'kassala',
-    'kassamali',
-    'kasse',
-    'kassiopi',
-    'kassire',
-    'kassite',
-    'kassmaul',
-    'kassof',
-    'kassomatransport',
-    'kassubischer',
-    'kassum',
-    'kast',
-    'kastamonu',
-    'kastanienallee',
     'kastanienbaum',
-    'kastantiana',
-    'kastar',
-    'kastell',
-    'kasten',
-    'kastenmeier',
-    'kastenpuck',
-    'kaster',
-    'kasterman',
-    'kasting',
-    'kastollos',
-    'kastor',
-    'kastrou',
-    'kastrup',
-    'kastva',
-    'kasule',
     'kasuma',
-    'kasurinen',
-    'kasurstan',
-    'kasuso',
-    'kaszubian-owned',
-    'kaszubska',
-    'kaszuby',
-    'kat&oacute',
-    'kat-ta',
-    'katabarwa',
-    'katabolic',
-    'katabtic',
-    'katafs',
-    'katahdin',
-    'kataib',
-    'katakolon',
     'kataky',
-    'katalin',
-    'katallassein',
-    'katalog',
-    'katan',
-    'katane',
-    'katangole',
-    'kataoka/sharp',
-    'katara',
-    'kataragama',
-    'katase',
-    'kataya',
-    'katayama',
-    'katch',
-    'katch-22',
-    'katchen',
     'katchi',
-    'kate&rcaron;ina',
-    'kate\'',
-    'kate-bar-the-door',
-    'katemfe',
-    'katena',
-    'katepimeron',
-    'katepisternum',
-    'kater',
-    'katergon',
-    'katerinberg',
-    'katestrepsanto',
-    'katew',
-    'katey',
-    'kath&rehy;leen',
-    'kath.m',
     'katha-naba-bhamo',
-    'kathaarens',
-    'kathangu',
-    'katharinenkirche',
-    'katharsis',
-    'kathchild',
-    'katheaton',
-    'kathekonzos',
-    'katherein',
-    'katherines',
-    'kathiawar',
-    'kathle',
-    'kathlehong',
-    'kathlyn',
-    'kathmandu&ndash;delhi',
-    'kathmandu&ndash;delhi&ndash;london',
     'kathmandu&ndash;pokhara',
-    'kathmandu-pokhara',
-    'kathmandu/nepal',
-    'katholeike',
-    'katholieke',
-    'kathpress',
-    'kathrin',
-    'kathys',
-    'katibat',
-    'katies',
-    'katiyar',
-    'katjza',
-    'katkoff',
-    'katmandhu',
-    'katna',
-    'katner',
     'katnot',
-    'katomerion',
-    'katond',
-    'katopola',
-    'katorgu',
-    'katri',
-    'katrivanos',
-    'katrusya',
-    'katryna',
-    'katsambis',
-    'katsamunski',
-    'katsikis',
-    'katsutaro',
-    'katsutsugu',
-    'katsuya',
-    'kattankudy',
     'katugampola',
-    'katuka',
-    'katupotha',
-    'katures',
-    'katwere',
-    'katy.',
-    'katydid',
-    'katyrev',
-    'katz-oz',
-    'katz/ex-refugee',
-    'katzan',
-    'katzenbach',
-    'katzenberg',
-    'katzenstein',
-    'katznelson',
-    'katzner',
     'kau',
-    'kau-kau',
-    'kau-kau-kyau',
-    'kauber',
-    'kaubitzsch',
-    'kauf',
-    'kaufer',
-    'kaufhold',
-    'kaufmanns',
-    'kaula',
-    'kaumbi-saleh',
-    'kaumi',
-    'kaunitz-rietberg',
-    'kaupas',
-    'kaupen-haas',
-    'kaurava',
     'kauravas',
-    'kauris',
-    'kausar',
-    'kausel',
-    'kauser',
-    'kaustos',
-    'kausu',
-    'kautilya',
-    'kautokeino',
-    'kautskly',
-    'kautsky\'',
-    'kav&aacute;lla',
-    'kavag',
-    'kavaje',
-    'kavalali',
-    'kavalski',
     'kavana',
-    'kavanaghs',
-    'kavane',
-    'kavangoland',
-    'kavant-2',
-    'kavara/pub',
-    'kavas',
-    'kavavaev',
-    'kaveh/abbey',
-    'kavindele',
-    'kaviyani',
-    'kavo',
-    'kavousi',
-    'kavtaradze',
-    'kaw-calling',
-    'kawa',
     'kawabe',
-    'kawain',
-    'kawakami/president',
-    'kawamata',
-    'kawamato',
-    'kawamebari',
-    'kawamoto',
-    'kawamoto/president',
-    'kawanishi',
-    'kawasakai',
-    'kawatetsu',
-    'kawaz',
-    'kawiani',
-    'kawimbe',
-    'kawkareik',
-    'kay-kay',
     'kay-shuttleworth',
-    'kay-shuttleworth/graham',
-    'kay/friend',
-    'kayaked',
-    'kayaku',
-    'kayaky',
-    'kayalar',
-    'kayama',
-    'kayanza',
-    'kayastha',
-    'kayathiri',
-    'kaybosh',
-    'kaydee',
-    'kaydet',
-    'kaye/actor',
-    'kayenne',
     'kayersbridge',
-    'kayholm',
-    'kayingham',
-    'kaylayaan',
-    'kayleth',
-    'kaylie',
-    'kaylor',
-    'kaylor/licensed',
-    'kaylor/radio',
-    'kaynak',
-    'kaynarca',
-    'kaynitro',
-    'kayreddin',
-    'kaysens',
-    'kayser-bondor',
-    'kayserias',
     'kaytak',
-    'kayumba',
-    'kayyal',
-    'kazahkstanskaya',
-    'kazak-grade',
-    'kazakh-german',
-    'kazakh-kirghiz',
-    'kazakhstan.',
-    'kazakhstani',
-    'kazakhstanis',
-    'kazakhsthan',
-    'kazakov',
-    'kazaks',
-    'kazanchi',
-    'kazandijan',
-    'kazankina',
     'kazansky',
-    'kazantzis',
-    'kazatsa',
-    'kazatzki',
-    'kazbegi',
-    'kazeem',
-    'kazek',
-    'kazerooni',
-    'kazeruni',
-    'kazhagam-janata',
-    'kazhaks',
-    'kaziende',
-    'kazimah',
-    'kazkahstan',
-    'kazkh',
-    'kazkhstan',
     'kazmi',
-    'kazmierczak',
-    'kazoos',
-    'kaztag',
-    'kazuaki',
-    'kazuhiko',
-    'kazuhiku',
-    'kazuko',
-    'kazuma',
-    'kazunobu',
-    'kazuya',
-    'kazuyoshi',
-    'kb+nc',
-    'kb-100',
-    'kb6',
-    'kb889',
     'kbit',
-    'kbit/s',
-    'kbpad3',
-    'kbps',
-    'kbus-based',
-    'kbw',
-    'kbyte',
-    'kc&ndash;135',
-    'kc(m)',
-    'kc-40',
-    'kc-p1124',
-    'kc135',
-    'kc486/66',
-    'kc70-v',
-    'kcal/hour',
-    'kcalories/kjoules',
     'kcc',
-    'kcelwey',
-    'kcie',
-    'kclo',
-    'kclo4',
-    'kcm',
-    'kcs1,000',
-    'kcs1,035',
-    'kcs1,700',
-    'kcs134,700',
-    'kcs3,300',
-    'kcs3,500,000',
-    'kcs5,000',
-    'kcs60,000',
-    'kcsi',
-    'kd1,200',
     'kd1,318,600,000',
-    'kd10,000',
-    'kd2,230,500,000',
-    'kd2,400',
-    'kd20,000',
-    'kd25,000',
-    'kd3,549,100,000',
-    'kd3,600',
-    'kd4',
-    'kd431',
-    'kdaltons',
-    'kdd',
-    'kdei',
-    'kdel',
-    'kdip',
-    'kdka',
     'kdr',
-    'kds&mdash;christian',
-    'ke-ke-ke',
-    'ke1-5',
-    'ke100',
-    'ke1200',
-    'ke4',
-    'keage',
-    'kealaikahiki',
-    'kealakekua',
-    'kealoha',
-    'kealy',
-    'keamanan',
-    'keamann',
-    'keane-ish',
-    'keane/plant',
     'keanekickmaster',
-    'keanophile',
-    'kear/gloucester',
-    'kearey',
-    'keari',
-    'kearin',
-    'kearsarge',
-    'keartons',
-    'keas',
-    'keasse',
-    'keast/trader',
-    'keates/barmaid',
-    'keating/centre',
-    'keatinge',
-    'keatlemang',
-    'keatonesque',
     'keatons',
-    'keats-',
-    'keattch',
-    'keaveny',
-    'keavney',
-    'keay/moseley',
-    'keba',
-    'kebab.',
-    'kebabbed',
-    'kebabed',
-    'kebangsaan',
-    'kebatlamang',
-    'kebbe',
-    'kebbie',
-    'kebby',
-    'kebebu',
     'kebele',
-    'kebick',
-    'kebih',
-    'kebili',
-    'kecal',
-    'kechak',
-    'keck-handed',
-    'kecmanovic',
-    'keco',
-    'kedar',
-    'keddieaddress',
-    'keddiepleads',
-    'keddies',
-    'keddietries',
-    'keddleston',
-    'kedges',
     'kedikilwe',
-    'kedington',
-    'kedlestone',
-    'kee-a',
-    'kee-eel',
-    'kee-er',
-    'kee-kee-kee',
-    'kee-kwa',
-    'kee-scott',
-    'kee-ya',
-    'kee-yow',
-    'keebles',
-    'keeerree',
-    'keef/engineer',
-    'keeffe',
-    'keegan.',
     'keegan/brother',
-    'keegan/newcastle',
-    'keegand',
-    'keeganmania',
-    'keeh',
-    'keek-keek-keek',
-    'keeked',
-    'keeker',
-    'keekorok',
-    'keel-hauling',
-    'keel-marks',
-    'keel-scraping',
-    'keelakekula',
-    'keeler-type',
-    'keeley/road',
-    'keelhauled',
     'keelie',
-    'keeling/reporting',
-    'keeling/upton',
-    'keelled',
-    'keelmen',
-    'keelwell',
-    'keen-minded',
-    'keen-sensed',
-    'keen-tempered',
-    'keen-witted',
-    'keenair',
-    'keend',
-    'keene/fiance',
-    'keener-eyed',
-    'keenest-sighted',
-    'keeney',
     'keenings',
-    'keenleyside',
-    'keenly-awaited',
-    'keenly-fought',
-    'keenly-priced',
-    'keenly-sought',
-    'keeow-keeow-keeow-keeow',
-    'keep&rehy;fit',
-    'keep\'',
-    'keep\'t',
-    'keep-ball',
-    'keep-fit-to-music',
-    'keep-keep-keep',
-    'keep-out',
-    'keep-the-nosewheel-up',
-    'keep-you-guessing',
     'keep-yourself-fit',
-    'keep/get',
-    'keeped',
-    'keeper-batsmen',
-    'keeper-clothes',
-    'keeper-cum-commercial',
-    'keeper-keeping-keep',
-    'keeper-up',
-    'keeper-uppers',
-    'keeper/defenders',
-    'keepers.',
-    'keeperships',
-    'keepfit',
-    'keepi',
-    'keepie',
-    'keeping-place',
     'keeping-stores',
-    'keeping_with',
-    'keepings',
-    'keepit',
-    'keepsakes.',
-    'keept',
-    'keerie',
-    'keers',
-    'keersplosh',
-    'keese',
-    'keesings',
-    'keetch',
-    'keetley',
-    'keetly',
-    'keetmanshoep',
-    'keev',
     'keev-it',
-    'keeves',
-    'keeyah',
-    'kef-crazed',
-    'kefaah',
-    'kefala',
-    'kefali',
-    'kefaloyiannis',
-    'kefauver',
-    'kefelegn',
-    'kefevi',
-    'kefford',
-    'kefridian',
-    'keftedes',
-    'keftiu',
-    'kefuffle',
     'kegans',
-    'kegelstadt',
-    'kegg',
-    'kegging',
-    'keglet',
-    'keglike',
-    'keh',
-    'kehama',
-    'kehheler',
-    'kehl',
-    'kehrwiederspitze',
-    'keidon',
-    'keig',
-    'keighlty',
-    'keighly',
-    'keighron',
     'keihakutansoka',
-    'keihei',
-    'keijiro',
-    'keiko',
-    'keilberth',
-    'keiley',
-    'keill',
-    'keily/sales',
-    'keinig',
-    'keininger',
-    'keinmeyer',
-    'keiren',
-    'keirn',
-    'keirs/neighbour',
-    'keise',
-    'keiser',
     'keiserud',
-    'keishiro',
-    'keisse',
-    'keisure',
-    'keithie',
-    'keithley',
-    'keizers',
-    'keizerskroon',
-    'kek-ke-ke',
-    'kek-kek-kek-kek-kek-kek',
-    'kekchi',
-    'keker',
-    'keket',
-    'keki',
-    'kekki',
-    'kekko',
     'kekoura',
-    'kekrops',
-    'kekryphaleia',
-    'kekus',
-    'kela',
-    'kelafo',
-    'kelb',
-    'kelburn',
-    'kelbus',
-    'kelch',
-    'kelco',
-    'kelda',
-    'keldby',
-    'keldy',
-    'keleher',
-    'keles',
     'keleti',
-    'keli',
-    'kelibia',
-    'kelihues',
-    'kelk',
-    'kellaher',
-    'kellam',
-    'kelland',
-    'kellands',
-    'kellars',
-    'kellas',
-    'kellaway/the',
-    'kellein',
-    'kellen',
-    'kellenberger',
-    'keller-type',
     'kellerkrebs',
-    'kellet-bowman',
-    'kelley.',
-    'kelley/oxon',
-    'kellgren',
-    'kellian',
-    'kelliher',
-    'kelling/campaigner',
-    'kellistown',
-    'kellmer-pringle',
-    'kellti',
-    'kelly(2.1)',
-    'kelly/castlemorton/worcestershire',
-    'kelly/chairman',
-    'kelly/director',
-    'kelly/emergency',
     'kelly/environmental',
-    'kelly/labour',
-    'kelly/prostitute',
-    'kellydonald',
-    'kellynch-hall',
-    'kelmarsh',
-    'kelmperer',
-    'kelmscot',
-    'kelmscotts',
-    'kelner',
-    'kelping',
-    'kelpy',
-    'kelsae',
-    'kelsdale',
-    'kelsey-fry',
-    'kelsey/recycling',
     'kelshaw',
-    'kelson',
-    'keltner',
-    'keltosova',
-    'keltrol',
-    'kelty',
-    'kelvan',
-    'kelvedel',
-    'kelvey/automobile',
-    'kelvin-voigt',
-    'kelway',
-    'kelways',
-    'kelynack',
-    'kemajoran',
-    'kemakeza',
-    'kemali',
     'kemalist',
-    'keman',
-    'kembles',
-    'kemel',
-    'kemerdekaan',
-    'kemerevo',
-    'kemerovo',
-    'kemerton',
-    'kemfri',
-    'kemi',
-    'kemlyn',
-    'kemmeriboden',
-    'kemmett',
-    'kemmy',
-    'kemnay',
-    'kemo',
     'kemour',
-    'kemp-welch',
-    'kemp/',
-    'kemp/former',
-    'kemp/pub',
-    'kempeitai',
-    'kempen',
-    'kempenaar/finance',
-    'kemperplatz',
-    'kempi',
-    'kempken',
-    'kemplah',
-    'kempler',
-    'kempshots',
-    'kempshott',
-    'kempson/author',
     'kempthorne',
-    'ken&rehy;dal',
-    'kenaf',
-    'kenal',
-    'kenardington',
-    'kenareh',
-    'kenawa',
-    'kenblas',
-    'kencast',
-    'kenchreai',
-    'kencot',
-    'kendalians',
-    'kendall/co-writer',
-    'kendalli',
-    'kendel',
-    'kenderick',
     'kendim',
-    'kendix',
-    'kendray',
-    'kendrick-jones',
-    'kendrick/land',
-    'keneba',
-    'kenelme',
-    'kenema',
-    'kenenth',
-    'kenesh',
-    'keneth',
-    'kenge',
-    'kengroms',
-    'kenhard',
-    'keni',
-    'kenickie',
     'kenidjack',
-    'kenifed',
-    'kenilworth-parkside',
-    'kenites',
-    'kenix',
-    'kenix-based',
-    'kenizzites',
-    'kenjo',
-    'kenka-dako',
-    'kenkelba',
-    'kenkyujo',
-    'kenlow',
-    'kenmir',
-    'kenmont',
-    'kenmore.',
-    'kennair',
     'kennaugh',
-    'kennealy',
-    'kenned',
-    'kennedy-era',
-    'kennedy-johnson',
-    'kennedy-nixon',
-    'kennedy-onassis',
-    'kennedy-skipton',
-    'kennedy-style',
-    'kennedy/macmillan',
-    'kennedy/nixon',
-    'kennedy/video',
-    'kennedys-style',
-    'kennel-kept',
-    'kennel-like',
-    'kennel.',
     'kenneling',
-    'kennelix',
-    'kennelt',
-    'kennelwood',
-    'kennemann',
-    'kennemer',
-    'kennesaw',
-    'kennetside',
-    'kennett-avon',
-    'kennett/transport',
-    'kennetts',
-    'kenningham/headmaster',
-    'kennington/oxfordshire',
-    'kennish',
-    'kenny/dairy',
-    'kenny/edinburgh',
     'kennys',
-    'kenobus',
-    'kenour',
-    'kenpshot',
-    'kenrick/gypsy',
-    'kenricks',
-    'kenry',
-    'kensaku',
-    'kensaleyre',
-    'kensett',
-    'kenshole',
-    'kent-born',
-    'kent-smith',
-    'kent/employee',
-    'kent/labour',
-    'kent/patient',
     'kent/senior',
-    'kent/sussex',
-    'kent/thamesdown',
-    'kent/victim',
-    'kent/video',
-    'kent/villager',
-    'kent_in',
-    'kentaru',
-    'kentie',
-    'kentigern-oatridge',
-    'kentish-controlled',
-    'kentish-east',
-    'kentishman',
-    'kentner',
-    'kentriodontids',
-    'kentuckians',
     'kentucky\'n\'chips',
-    'kentucky-epsom',
-    'kentuckyans',
-    'kentville',
-    'kenulph',
-    'kenwa',
-    'kenwigs',
-    'kenwyn',
-    'kenya/seychelles',
-    'kenya/tanzania',
-    'kenyah',
-    'kenyan-based',
-    'kenyan-somali',
-    'kenyapithecins',
-    'kenyon-jones',
-    'kenyon/catherine',
     'kenyon/competition',
-    'kenyons',
-    'kenzan',
-    'kenzian',
-    'keoboualapha*',
-    'keogan',
-    'keokuk',
-    'keoladeo',
-    'keols',
-    'keone',
-    'keonjhar',
-    'kep\'',
-    'kepes',
-    'kephalonia',
-    'kephisos',
-    'keping',
     'kepinge',
-    'kepley',
-    'kepner-tregoe',
-    'kepplestone',
-    'kepplewhite',
-    'kept-were',
-    'ker-draanngg',
-    'ker-honk',
-    'ker-llanggg',
-    'ker-nockers',
-    'kera-top-ter-is',
-    'keracil',
-    'keramat',
-    'kerans',
-    'kerasous',
-    'keratectomy',
     'keraterm',
-    'keratin-1',
-    'keratinocyte-specific',
-    'keratinoxyte',
-    'keratoid',
-    'keratophyres',
-    'kerawski',
-    'kerb-crawler',
-    'kerbed',
-    'kerbing',
-    'kerblaying',
-    'kerbola',
-    'kerbsides',
-    'kerchache',
-    'kerckring',
-    'kerei',
     'kereke',
-    'kerem',
-    'kerempuha',
-    'kerengas',
-    'kerenskys',
-    'kerepia',
-    'keresely',
-    'keresey',
-    'kereskedelmi',
-    'keretapi',
-    'kerf-guide',
-    'kerfalla',
-    'kerfante',
-    'kerfed',
-    'kerfield',
-    'kerfs',
     'kergorlay',
-    'kergueien',
-    'kerible',
-    'kericho',
-    'kerigan',
-    'kerim',
-    'kerioth',
-    'kerkade',
-    'kerkham',
-    'kerkrade',
-    'kerley',
-    'kerlinger',
-    'kerma',
-    'kermabon',
-    'kermans',
-    'kermes',
     'kermesic',
-    'kermesina',
-    'kermesses',
-    'kermey',
-    'kermit-like',
-    'kermococcus',
-    'kermuffle',
-    'kernals',
-    'kernberg',
-    'kerned',
-    'kernel-based',
-    'kernel-pms',
-    'kernemet',
-    'kerner/kerning',
-    'kerngrove',
-    'kernig',
     'kernn-larsen',
-    'kernochan',
-    'keron',
-    'kerosene-based',
-    'kerosene-guzzling',
-    'kerosene-laced',
-    'kerplonk',
-    'kerr-dineen',
-    'kerr-mcgee',
-    'kerr-nut',
-    'kerr-stewart',
-    'kerr/bulmers',
-    'kerr/father',
-    'kerr/ms',
-    'kerr/scottish',
-    'kerramiks',
     'kerrera',
-    'kerri-lisa',
-    'kerridgean',
-    'kerridges',
-    'kerrisdale',
-    'kerrith',
-    'kerrville',
-    'kerry-anne',
-    'kerry-born',
-    'kerry/traveller',
-    'kerrygold',
-    'kersaint',
-    'kerseymere',
-    'kerseymeres',
-    'kersie',
-    'kersik',
     'kerslake/full-back',
-    'kersmack',
-    'kersplat',
-    'kerstein',
-    'kert&eacute;sz/decca',
-    'kerted',
-    'kertsman',
-    'kervaire',
-    'kervern',
-    'kervorkian',
-    'kesarinski',
-    'kesatuan',
-    'keshet',
-    'keshishian',
-    'keshvar',
-    'kesiya',
     'kesk&mdash;centre',
-    'kesk24.817.65540',
-    'keskusta',
-    'kessack',
-    'kessar',
-    'kesselly',
-    'kesselreicher',
-    'kessi',
-    'kessie',
-    'kessner',
-    'kessock',
-    'kesson',
-    'kest',
-    'kestelli',
-    'kestelman',
-    'kestner',
     'kestner-gesellschaft',
-    'kestrel-eyed',
-    'keswich',
-    'keswicks',
-    'ketambe',
-    'ketara',
-    'ketchell',
-    'ketchup-holder',
-    'ketchup-stained',
-    'ketchup-type',
-    'ketchup.',
-    'kethavy',
-    'kether',
-    'kethro',
-    'ketjap',
-    'ketkanok',
     'ketn',
-    'ketoacid',
-    'ketoff',
-    'ketomine',
-    'keton-etone-methyl-tri-di-meta-post-oxy-chlorane',
-    'ketone-free',
-    'ketotic',
-    'ketsela',
-    'kett',
-    'kettalkpoosmin',
-    'ketteman',
-    'ketterer',
-    'ketteridge/insurance',
-    'kettering-based',
-    'kettering-made',
-    'kettering/northamptonshire',
     'ketti',
-    'kettil',
-    'kettle-',
-    'kettle-boiling',
-    'kettle-drum',
-    'kettle-out-of-tin-can-makers',
-    'kettle-williams',
-    'kettle/stroud',
-    'kettlebrig',
-    'kettleby',
-    'kettled',
-    'kettless',
-    'kettlethorpe',
-    'kettley',
-    'kettly',
-    'kettridge',
     'kettring',
-    'ketubbot',
-    'ketudatindustry',
-    'ketupa',
-    'ketut',
-    'keulemans',
-    'keuller',
-    'keumann',
-    'keure',
-    'keuschnigg',
-    'keussen',
-    'kev.',
-    'keva',
-    'keven',
-    'kevin(10)',
-    'kevin/michael/little',
     'kevinmour',
-    'kevlar-coned',
-    'kevlar-impregnated',
-    'kevvin',
-    'kew-based',
-    'kew-ee',
-    'kew-kew-kew-kew-kew',
-    'kew/thames',
-    'kewdale',
-    'kewick-kewick',
-    'kewill-omicron',
-    'kewishs',
-    'kewk',
-    'key\'',
-    'key-board-based',
-    'key-case',
     'key-code',
-    'key-codes',
-    'key-combination',
-    'key-concepts',
-    'key-cutter',
-    'key-dip',
-    'key-driven',
-    'key-fobs',
-    'key-holders',
-    'key-holes',
-    'key-keeper',
-    'key-noter',
-    'key-noters',
-    'key-of-the-door',
-    'key-pattern',
-    'key-patterned',
     'key-person',
-    'key-phones',
-    'key-place',
-    'key-press',
-    'key-presses',
-    'key-repeats',
-    'key-retainer',
-    'key-role',
-    'key-stage',
-    'key-stane',
-    'key-stone',
-    'key-tapping',
-    'key-term',
-    'key-to-disk',
-    'key-types',
-    'key/clinical',
     'key/fairmile',
-    'key/metre',
-    'key/position',
-    'keyboar',
-    'keyboard-accompanied',
-    'keyboard-phobes',
-    'keyboard-player',
-    'keyboard-playing',
-    'keyboard/computer',
-    'keyboarders',
-    'keyboardist/bass',
-    'keyboardists',
-    'keyboardspeed=31',
-    'keychains',
-    'keycorp',
-    'keycutters',
     'keyfobs',
-    'keyford',
-    'keygasse',
-    'keyham',
-    'keyhold',
-    'keyhole-shaped',
-    'keyholeful',
-    'keying-in',
-    'keyit',
-    'keyknow',
-    'keylock/thames',
-    'keymar',
-    'keymat',
-    'keyname=value',
-    'keynes.unconfirmed',
-    'keynes/buckinghamshire/',
     'keynes/gloucestershire',
-    'keynes/wiltshire',
-    'keynes0',
-    'keynesian-type',
-    'keynesian/monetarist',
-    'keynesianism\'',
-    'keynesians-at',
-    'keynoter',
-    'keyphone',
-    'keyphones',
-    'keypress-by-keypress',
-    'keypunch',
-    'keys()',
-    'keysan',
-    'keysham',
-    'keystone-moment',
     'keystor',
-    'keyswitches',
-    'keytop',
-    'keywood',
-    'keyword-based',
-    'keyword-type',
-    'keyword/stem',
-    'keywording',
-    'keywords.',
-    'keyworkers',
-    'keyzer',
-    'kezar',
-    'kezbers',
-    'kezer',
-    'kezzivot',
-    'kf&amp;r',
     'kf3',
-    'kf6',
-    'kfar',
-    'kfar-roumann',
-    'kfg',
-    'kfgf',
-    'kfki',
-    'kfoury',
-    'kg&amp;sup-1',
-    'kg-1',
-    'kg/',
-    'kg/24',
-    'kg/hour',
-    'kg/km',
-    'kg/m3',
-    'kg/week',
     'kg100',
-    'kg2',
-    'kg32',
-    'kg6',
-    'kg89',
-    'kgabo',
-    'kgb-influenced',
-    'kgb-trained',
-    'kgeisje',
-    'kgf',
-    'kgn',
-    'kgotla',
-    'kh&ocirc;l',
-    'kh-11',
-    'kh1',
-    'kh230',
     'kh5',
-    'kh588',
-    'kh8',
-    'kh900',
-    'kh965',
-    'kha&iuml;f',
-    'khabra',
-    'khabul',
-    'khac',
-    'khachaturyan',
-    'khachiashvili',
-    'khachonprasat',
-    'khachornprasat',
-    'khadak',
-    'khadam',
-    'khadiga',
     'khadijah',
-    'khadjia',
-    'khadkapublic',
-    'khadraji',
-    'khadzhiolov',
-    'khaela-mensha-khaine',
-    'khaeng',
-    'khafajah',
-    'khafirs',
-    'khafra',
-    'khagrachbari',
-    'khahaliq',
-    'khaidama',
-    'khaindrava',
-    'khair',
-    'khaireh',
     'khairule',
-    'khairulyn',
-    'khaisar',
-    'khajuraho&ndash;veranasi',
-    'khajuri',
-    'khakai',
-    'khakass',
-    'khakassia',
-    'khaketla',
-    'khakhar',
-    'khaki-brown',
-    'khaki-painted',
-    'khal',
-    'khalaftourism',
-    'khaldah',
-    'khaldun',
     'khaleeli',
-    'khalefa',
-    'khalefahjustice',
-    'khalfan',
-    'khalidi',
-    'khalif',
-    'khalifal',
-    'khalin',
-    'khalkh',
-    'khalkhiin',
-    'khals',
-    'khalturin',
-    'kham',
-    'khamaizi',
-    'khamanei',
-    'khamariah',
     'khambula',
-    'khameneie',
-    'khamidov',
-    'khamidulin',
-    'khamphan',
-    'khamseen',
-    'khamsin',
-    'khamton',
-    'khan-cheema',
-    'khan-queen',
-    'khan-queens',
-    'khan/shoba',
-    'khan/taxi',
-    'khanabad',
-    'khanal',
-    'khanamirian',
     'khanaqin',
-    'khandas',
-    'khanel',
-    'khanga',
-    'khanindustry',
-    'khanoum',
-    'khant',
-    'khantawong',
-    'khantyn',
-    'khanum',
-    'khaparde',
-    'khapkhaponimi',
-    'khar',
-    'khar\'kov',
-    'kharafi',
-    'kharakter',
     'kharazi',
-    'kharborovsk',
-    'khardung',
-    'khareghani',
-    'kharg-sirri',
-    'kharg/northwest',
-    'kharg/rotterdam',
-    'khargpur',
-    'kharif',
-    'kharina',
-    'kharitinov',
-    'kharkhov',
-    'kharkov/sevastopol',
-    'kharkuk',
-    'kharubi',
-    'kharusan',
     'khashinke',
-    'khashm',
-    'khashort',
-    'khaskovo',
-    'khata',
-    'khatchik',
-    'khathmandu',
-    'khatib-zade',
-    'khatibusecond',
-    'khatir',
-    'khatmandu',
-    'khatori',
-    'khattak',
-    'khatti-gna**',
-    'khatwani',
-    'khaw',
     'khawafi',
-    'khawaja',
-    'khawarizm',
-    'khawass',
-    'khaya',
-    'khayam',
-    'khaydara',
-    'khayyam-like',
-    'khazad-d&ucirc;m',
-    'khazar',
-    'khazari',
-    'khazars',
-    'khazipit',
-    'khazraji',
-    'khbb',
-    'khc',
     'khc820a',
-    'khebir',
-    'kheda',
-    'kheddis',
-    'khediri',
-    'kheftyu',
-    'khel',
-    'khempo',
-    'khenj',
-    'khentamentiu',
-    'khephren',
-    'khepi',
-    'kher',
-    'khersifron',
-    'khestov',
-    'khetsuriani',
     'khidar',
-    'khiem',
-    'khilkov',
-    'khin*',
-    'khirokitia',
-    'khit',
-    'khitran',
-    'khizar',
-    'khjan',
-    'khlystov',
-    'khlystun',
-    'khmelnitsky',
-    'khn',
-    'khnopff',
-    'khobar',
-    'khobi',
     'khodabandehloo',
-    'khodabux',
-    'khodad',
-    'khodashinskii',
-    'khodaydad',
-    'khodja',
-    'khodzhaly',
-    'khoele',
-    'khoeniha',
-    'khoihlovs',
-    'khojakov',
-    'khojand',
-    'khol',
-    'kholashi',
-    'kholer',
-    'khomeini-like',
     'khomeini.i',
-    'khomenei',
-    'khomeyniites',
-    'khomieths',
-    'khoneinis',
-    'khonsari',
-    'khoo',
-    'khoperski',
-    'khordjin',
-    'khoren',
-    'khormaksa',
-    'khornate',
-    'khorne-worshipping',
-    'khoros',
-    'khorramabad',
-    'khorrambad',
     'khorsandi',
-    'khoshafian',
-    'khosravivafa/iranian',
-    'khote',
-    'khotin',
-    'khou',
-    'khouna',
-    'khow',
-    'khozraschet\'',
-    'khrab',
-    'khrahl',
-    'khrapaty',
-    'khrayr',
-    'khristoradnov',
-    'khrrr',
-    'khrrrrr',
     'khrunichev',
-    'khrus',
-    'khrushchevan',
-    'khrushchevism',
-    'khshayarsha',
-    'khubar',
-    'khudayyirforeign',
-    'khuddayir',
-    'khudian',
-    'khudonazarov',
-    'khufu',
-    'khujali',
-    'khul',
-    'khulayfat',
-    'khulna',
-    'khum',
     'khumba',
-    'khumjung',
-    'khuninshahr',
-    'khunrath',
-    'khuri',
-    'khurmal',
-    'khurmatu',
-    'khurram',
-    'khursheed',
-    'khurtan',
-    'khushcadam',
-    'khushro',
-    'khushwant',
-    'khutba',
-    'khuvaidullayev',
-    'khuwaiter',
     'khwaia',
-    'khwaja-zade',
-    'khwand',
-    'khylrea',
-    'khymer',
-    'khzam',
-    'ki&mdash',
-    'ki&ndash;115s',
-    'ki&ndash;43',
-    'ki-keee',
-    'ki-ki-ki',
-    'ki.107b',
-    'ki.107c',
-    'ki1',
-    'ki67',
-    'kia-ora',
     'kiambere',
-    'kiangsi',
-    'kiaora',
-    'kiaou',
-    'kiapo',
-    'kiatara',
-    'kiathas',
+)
+
+blocks_71 = (
+    '#(ndhlwana%%lwana$"gi#"pm#!r#"s4##tis$#van"!b#!a#$like#"ns#/randtsen-moller"%c-ufc#$ador',
+    '#!d#&henoos$"gl$*igualastia,\'o-villa%\'o-pubic%(um-pubis$(nosiphon#"ia#&ussion"$data#\'n-based%&linked%$type"*e-majandav',
+    '#!e##ler$#ham$"in#%nberg%#urg$$thal#!o#"re$$lohn#\'veryone"%faham&"ns#"et%!s',
+    '#&lurane#$rank"%hamel#*erwood/new#)ikawajima$!n$"tu##kal$#ent$%oonee##lam#%maeli\'!s%"il#&oulder',
+    '#$tiaq"$i60a#"ah#$boro#!c#"de#%l-kul#!n$!g#$reli#(s-osiris$!2"%jlike"\'kandria#$ra-2',
+    '#)umtselauk$,sstvoznaniye"&l2,500##ad.$%giatt$*m-oriented%%bouli%(ic-based\'!a\'$ised(#zed\'!s&)education&$sche\'!m',
+    '&#vic$!n%#d\'s&#(s)&(-branded)"ed\'$clad()ompatible\'(dwellers\'&empire\'$full\'&groups\'\'hoppers\'&lovers\'(princess',
+    ')#yle&*/underpass&#ing&%magee&+s&mdash;the\'&-based\')/scotland\'%hires$-y-ballycastle##ds.#$eham$&ornsay$#s-i%!.#%ikely',
+    '$+ngton-white)!.)%wards##ywn"$mand$!t%\'ullayev#(et-duygu##oil#!p"-n\'t&mdash;and%!-&7everything-a-drag-smile%!.#!a',
+    '#"ik#"ot$!w"0o&rehy;lationism#3-17-carbon-monoenic4#oic$)compliant&+ncentration$(electric$$line$\'osmolar(#tic$)quinolone$,reflectances#$/dsa',
+    '##879#,9000&ndash;3&,1-guidelines&(2/bs5750%!1#+amylalcohol##bar$$utyl(0-2-cyanoacrylate(-methlxanthine,*ylxanthine\')raldehyde("ic##car$%hores',
+    '&"on%"st$&yantes#"da$#ore&"us$#rin#*ethionates#(flurance$$orm.#%gloss%%ucose$$onal#&hexane$.ookana-asunmaa',
+    '#)immunised#"k.$\'rateian#%lable%(ted-word($from&+ion-rearing*$unit)!.&#ory$#des$#ine&!o$!t#$mass',
+    '\'#zes%(trically(!x$"il$$orph$&une-ck#%nazid$$omia#!p$&achous$*eristaltic$&horone&#tes%&thalic$"od',
+    '$(renaline\'$oxyl%%opyl-*>&bgr;-sd-thiogalactopyranoside)8thio-&bgr;-d-galactoside$\'terists#(rhythmic$#ohu#!s$#aki$&orbide$(poriasis#&tachic$%halic%\'ermally',
+    '%*iocyanate-)$nate-\'/cesium$4opically-substituted$(retinoin%(opically#!u$"ld#\'valeric$#iew%%talex#,xanthopterin$\'suprine$\'ymogens#*zaki/james',
+    '"\'paghula$$rion%"ta#"bx#%c/860#(ersuaded#!o$$rock#$wich"*ra&euml;ls$*el-british\')hezbollah\')palestine/$ians\'"us',
+    '\'\'germany\'(occupied&0i&ndash;lebanese\'--administered)%llied)\'merican)$rmed($born(\'iranian($made*%naged((produced+"xy(#sla(\'trained',
+    '\'"an\'"s\'(!.\'$tish#$edit#!o"%s-ues#"af$!h$%jenko$"ke$$ngar$+q-dominated#!e$!d',
+    '$#ver#$hiki$!u##iac$#mos$"ng$,ttrup-partii#$like$#oin#$obel$!r$"uf#!s$#ued#,ue&rehy;also',
+    '%\'-agenda&\'mongers%".s%$/end&%topic+!/%\'d-based&#.in&\'_by_the%"is%*s-domestic\'#the&!.&0/techniques/work$#ses',
+    '\'"ul$%l-kum$#voo""ta$+nbul-ankara)%based$!p$$rted$#van#!d#!e$!\'$"ri#"id$\'tuzioni',
+    '$%chnik$!k##res$&omenti$$ucte%%ttore%%zione""ue$!d$"le#%ggest#$rium"#var"&wallow$"ri',
+    '#$prke""yn"(zvestiya!3t&auml;-suomalainen#&lsqb;s#*mdash;anna*!t)"he)#the,"re+"is#%ndash#(rehy;his""\'s$+-a-knockout',
+    '%Efour-o\'clock-so-i-must-want-a-biscuit%-only-your-age%"so$&_a_bit$&caused$!h$"ss#"th"#-an%!d$!s$$ware#\'baldwin#&clefts$"ol',
+    '#)dominated#&except#(feminine#"he#"it%#-it#$mean$$ight$%odern$7ust-be-something-we-eat#"of#)painfully$$ious#!s$&maller',
+    '#$they"".1#!5##and##can##erm#"ii$!n%$deed#!l##one#"pc#!s$$heff$&tarred',
+    '#%there#&within##you""/i$)ts/itself##lob#%place#!s##you"!1"$2000#!6"!3#!2#!3',
+    '#!1#!6"$_all&$_the$"nd$!s%#_it#\'because#$just#"no#$over#"so%"rt#"up"0a&rehy;initiated',
+    '#!e#)ip&uacute#"l.$!a$!e$#gas$(ia-bound&*n-albanian)\'merican)\'ustrian(\'benelux)$ound)&ritish)$uilt(*controlled',
+    '((educated)&nglish(&french(&german)&one-la($held(*influenced)&ranian*#ish((language)&ookin\'((mannered((occupied)\'perated))rientated',
+    '*&oduced(\'related*(staurant(\'sausage)%oviet)&panish)$wiss\'\'/german(#new(%swiss\'!1\'#ato\'!e("rs\'$ised',
+    '\'%s-but%%carum&\'isation\'#zes%\'enische,!n&!s%$nate&$skii$&labout$,o-abyssinian\'\'lbanese\'\'merican\'(rgentine\'\'ustrian',
+    '&)ethiopian&&french&)geometric($rman&\'spanish$(planning$!s%$olar%#tat$%vital$#y**%&-bound\'%razil%$.and%"in',
+    '#"ng#(p&eacute$%arica#!t#"ya"&chiest$(y-footed"%d/dti#!g"#ela$!f$\'ligible#,m-of-service%(specific%$that',
+    '$"ed$&imized%#zes$!m$$ries$\'s1102.6#!n$#ary$"ds$!s#%rable%#tes&$ives$\'oparous$\'polated',
+    '"%falls",h&oacute;0me##ana##ink#"na#&ominae$#ngo$"ot""ie$!s#\'nerancy\'$rium\'$ting\'!y&!y',
+    '"*jiswhrzrez"#ler",mad-ud-daula$!r"(n/harris"%ohara#"su#!u"#ria%!n#"on$"un"\'s-final$$nose#$/his',
+    '#-elf&mdash;for-%there&!-\'$\'not\'#all\'%could\'#had\'"in\'"of\'\'slipped(&tirred(%upply\'#two&!.\'!4',
+    '#!i$%bitsi$*nvolvement##lef#\'members#\'u-itd6a$\'kushima")t-alcatel##ala#!e$!d$#faq$,had-e-islami(#iji$,rbeck/escape',
+    '$$ngen"#u90#%ation#&meleng#"ni#$raea$"be&!s%!i$%mendi$%riaga"&v/bbc1"(z&aacute#!a$+notherpurla',
+    '#!t!"u*"".o"!/")359100329"&bebunt$$oque$"re"#cds"$daei##eum#\'gements#$icis$!n"%gerum',
+    '"!k"!l")mportance"$ncta"$orie"!p#!d"&rarunt""st$!a$$itia"!t"#vdt#%entus!*v&ndash;vi',
+    '""\'e"#(1)""+v""-v"".1$".a%!b%!c%!e$"02%!8$"61%!4%#ff.##2.4',
+    '$!0$#9.8#"35$!6#"42#"50$#7ff#!6#"80$!3$+6&ndash;160#"i.%!1&"20%$23ff',
+    '%$30f.&*5&ndash;63%"45%$54f.%%69ff.$"i.&$17ff&%228ff&"31("ff&%49ff.&*64&ndash;6&$71ff%"i.\'"69',
+    '%..199&ndash;430&%745ff#&v.20ff$.i.227&ndash;80&%51ff.%.i.55&ndash;118&&i.20ff)*4&ndash;72""/4#$njg2""12"!2""36""49""55',
+    '##the"*a-impuesto#$lace#%nenko$&isovic$+o-frankovsk%#vna&$skoy(!y"&c1/ivd#!2#!l#!o"#ean#"re',
+    '$#ley$"ne$%ybody#)s/british$#ian$"on$#ton""f-#!s""hs"!i##ato#!c#-n/bell-hanger$,gs/landowner',
+    '##son#$ties"%kovic"$oire%%ienne#%lving#&rienne%"ne$*y&amp;sime%\'-carver\'&overed&&framed&$like&$silk\'&kulled',
+    '&%white\'&orkers%)/producer""re$\'a-based"#ver%!y"*y-infested$$jack$&scroll$&wreath##bri#$isms#%leaze%#igh',
+    '#"ba#"de#!k#$niec#!o#"sg$#uge#%tsuki"!d"!e#"nt"!i#"sh".m/shuttleworth"#ona',
+    '$"ka"&rachia"#sra!\'x-xieni%!v"$.105#"22#!6#$76f.#"93"#32m"&build."*c&aacute;n"!e"&ibatae',
+    '#!x"(l/allied"(mariters"(obrychus##des"#tra"!x!)yakachchi##mbo"!e"&iguven"!s"&uguven"$waan!"za',
+    '#$bela&"la##mar##nia#"ri#%tullo"&drevle"&enours#1tbegovic-gligorov$%t/con))servative&/gloucestershire&)resources&$tory"$grev',
+    '"#iah#%ngari"&mailov(#sky"&nalloz#(iki-zade"(on/chief"\'quierdo"*taccihuatl"%vekov$$stya#&iestia$&neetye#&olskii#&setiya',
+    '#"et#!i$$edin(+information#"ys#!z 0j&aacute;chymova)!k)$nich*)sk&yacute#%mp;jw&!w#\'uml;ndo(#ner\'+rvi/chandos',
+    '"-dollar;17,000)-3,522,800,000-!3"*eacute;car),r&eacute;mie*&usalem)*sus-christ"$gt;k",iacute;menez".lsqb;ames&rsqb\')elly&rsqb"*mdash;hawk"*ndash;1102*"40("85',
+    '(#hiv")oacute;0i*#kei)%hanna)"se*#zef)#zef,!a#\'circ;ke("rg#*slash;rgen#?uml;kuls&aacute;rglj&uacute;fur4*l&oacute;n\'$rgen"+rehy;shaped',
+    ')+li&uacute;s+"us#\'uml;nge(%schke\'"rg!&\'adore#)pporterai#$vais"%eusse"$m\'en"&n\'sais!%-1146#"85""24"(3100s/vx',
+    '#!4#!6"#40m"$boat"!c#"-b#%loths"!f"$gate")j-j-judas#$apan#$olly##ust&%ified"%model',
+    '"%o-k-e"*pouch-anal"*registered"&survey"$type&!s!#.-c#!f#!h#!k#!l#!m#!n#!p"!1',
+    '"!4"!9"$a.f.$"h.$)prestwick$&ranish$"s.%$aner#&ddison#*m.chem.soc#\'rlandis"!b#%.c.f.$"j.$%losos',
+    '"#c.5$$h.r.$"k.$(l.marine$&trewin$"v.#$lerk"\'d.brook$(salinger#\'anforth$&vidson"#e.d$"g.$"h.$$m.s.',
+    '"&f.e.t.$\'fleigel$\'herring$"p.$$r.o.%/odr&iacute;guez"$g.l.$"m.$"s.$"v.&!a"$h.m.#&allard##ons"$j.s.',
+    '#\'effreys"\'kershaw$-ttle-williams#&umlien##wok"*l.campbell#%eague#%inton#$loyd"$m.f.$"j.$,m.cunningham$(richards%/odr&iacute;guez$(w.turner',
+    '%"sh#%murry"$n.p."\'o\'brien$&connor"&p.-the$"d.$"g.$"h.$"r.##aul#(emberton"$r.c.$"j.$%macey',
+    '$"t."!s##.g.$&miller$)parkinson#&heward#$mith#)utherland"-t.barraclough$"d.$$wawn"$w.f.$"k.#&illiam#)oodbridge',
+    '!!/"!1#!n"!2#"4s"$cals#!m"#day"!j"&m7sup2#!c""n2!!0"!1"$2128',
+    '!$1000""99"$x4mr!#21r"$371a$"2a$"3a$"4a##83a$"4a"!4"!5!!3"#/j4"$c-65',
+    '"!5#!s!!5"#0-m""on!!6"!9!#763!!8!$9+bh#"ch$!k$!l#"gl#"jh',
+    '#"zl"#2-c#!c""64""n1!!="%0.945"!6"$just!$_j\'s!,a\'farfinance"$-kki""11"#3.2"$8118',
+    '#&farpur#"na#!r$%beurs$+sbeursplein##zim"$baar$"ch$"le&&/abbot%#iya%$pore%"ya$"ng$!r',
+    '$#ers&\'wockies*!s$"ie##eri##ier$"ri%!n%!s%!u$#sco#"le#&orandi#&ulelwe$"ni',
+    '""c.##ada$"re&%zinha*!o$!s#"ci#"ey#"ha$"et$$ymov#$inth#3k-and-the-beanstalk%%boots&+y-the-hedge',
+    '%$easy%%frost%%hazel%&in-the+)&rehy;box+&-boxes,%green%(lanterns%)o\'-greens((lanterns&9f-all-aeronautical-trades&!n%%plate\'"ug&"ot',
+    '%(swigging%&waving$%/home%\'lumiere%#xlr$"a-%*l-creature\'&headed\'&tigers%#mos%$nese%%randa%%ssery$*boot-black$#een',
+    '%"t\'&%-clad(\'um-coat\'&length\'\'posters\')straining&!.&!y$\'hammers$"in$%knife$$line$$mans$%nifes$\'o-esque',
+    '%%mania%!u%$wski$%rocks$%sdale%"ey%-on&rehy;style\'!\'\'&-based(%kelly(%smith)&tamped($type\'(/british(\'charvel',
+    '),ross-channel(&farmer)%riend($glos+,ucestershire()hibernian)&usband(&school((trialist\'&:brave\'"ne%%tands&$ones%#uit$"up',
+    '$"b/&$dept%!a%)ean-style(\'/tartan&$than%#ina\'!e\'#ian%#oea%)s-suchard&#dr.&#ons&#sen&$tein',
+    '$#let$"pi&"no$!t#"q.$"es$+u&egrave;re%%aline&/rd&rehy;weaving%1eline/cumbernauld)!g\'"yn&$mart&#rie&.s-&eacute;mile',
+    ')"ss)1ugustin-catherine(\'laurent(%marie(\'solomon\'#son%"ot#"ta#&ulator$)zzi-style#$vket"\'daavpur##doo$%ukuha#\'e-boned',
+    '%\'studded%&worker$)d-looking%$ness$!r$%smith$\'working##idh$!e#"ro"$egar$(er-style#$msri#!n$\'berthus',
+    '%#sch"%farey#!f$1a&ndash;jerusalem$)e/reunite%$rjee&$pore%!t$(na-based$#rey#!r#"ta"(g-shakti#!.#0/jazzmaster-type',
+    '#*deschwader%!v$"is$$lied$\'staffel$%tiger#(ellonian+!s$(rstatter#*g&egrave;d$$ards$!e%%dness%*r-financed$$ings',
+    '%(llonians&!o$!r#$land#"oe#!t#(u-aaargh$+ar-designed\'"gm\'$like&#/gm&!e$"er"$hore#\'rbucher',
+    '$\'hundert#%saxa\'#$wohl"#ico##kie%!t#.l&rehy;writers$&-birds%%house%$like$#.at$$ings$&sbeing%#ide#!m',
+    '$(efinance%"ni%!s$!z#\'narayan#"te""ji#!o$#uka"$kata#"do#(e-wallah$#man$"ta#%hrani',
+    '$"ns$"ta#\'ob-rost%$sohn)!s\'$nian&#tad\'%rasse%%y/law#$ubac%%insky&#sko%.ovics/daughter&$wski$#tia',
+    '#\'al-zade%%oddin%$udin$!n$,pe&ntilde;os#%boots$"ut#\'catoria#"ed$!h##ics$%labad$#ngo#+joulihealth#"la',
+    '$"ul#"na#&ousies&!y#$pari")m&ndash;s#!-$(bottling$%esque$$grin$(or-honey$$pots$(sandwich$"up#$.use',
+    '##_on#-a\'at-i-islami$$at-e\'*i-islami18\'"ul&!s$#cia$\'hiriyah$(ica-born*#und\'"n\'()-accented)(canadian)\'derived\'!s',
+    '$(l-warner%#ski%%uddin\'"in$%ngile$#ran%!j#"bi%!a$&lichus$"ol#$dani$"et##eat$$h-ye',
+    '$"os$/rson-influenced$#s\'/%&(1977)%\'-smiths&$took%\'/addict\'\'viation\'$ward&(barrhead&(chairman\'(ommunity&(district&*helicopter&&mother',
+    '&*unemployed&%walls%%field%!y#"ia%4t-e-ulema-i-pakistan0$slam\'-ulama-i-islam$"es&\'on/head(!s&#ton$-l-al-jumayyil%"la%"ur',
+    '#,mat-i-islami$%ed-up&!.%\'rskjold%!t$-ing-avoidance\'%/gigs$)u-kashmir#%nagar$$icky%%tzers##oca#\'pshedpu#$rack##set',
+    '$#hed\'#put$\'rangiyn\'#jav#&tlands#"un"5n&aacute&ccaron;ekian*,;c&ccaron;ek+!k%/grave&ccaron;ek$)ndash;dec*#fri$0zacute&ccaron;ek##-12$!2',
+    '$!5$#jun\'!e$%march$#oct#".1#&/march#(21/feb19$!6#"ak%#pur$#nne$&saviya%"en##baz',
+    '##cik%!s$!o#"da$!o$!u#-e&ndash;urged$!\'%!s$\'-tanner$\'/andrew%)edinburgh%%mount$!3$#ene',
+    '&#nds&!r$"ne$,t-reger-ites%(/glasgow%!h%%stown%!t%!y%#zki#%g-lim%$soon$#ali$%lepop&!r',
+    '%$ings$\'wattana#\'ice-may%"ki%$ulum$#ero$#gro$!k$#net$"se$-tor/caretaker\'!e\'%s-but$,urek/project#"ja',
+    '$+ipersadsing$%opiti%$wski$"yn#!l$#ori#$maat%,bhoomi-babri##nah%#tie%#way$!e%,au-sait-quoi%$quin%"rs',
+    '$#ike%"ne&!k%(s/jannis$$ocks$!u#!o$"ff$"li$#nis$$wich&#tz\'(#/dg##sch&%walde',
+    '&!s$%onius$$port##tos#(uallatos%#rie&*y&mdash;p.((ndash;12/!3/!4."28.!3/!00"th.%april',
+    '.(thursday\'!*\'"-1)!2)!3)!8)"st("21("30(!4(!6(!8(&august($july(#may',
+    '($sown\'!/(*gloucester\'!_$&s-face%"ka%$like#$vier$#rin#"yn"#ona$"li"<p&lsqb;an&rsqb;s&lsqb;e&rsqb#$-j99#!a',
+    '%\'-backed(%shing\'$ound&%china\'$razy&(friendly&(scottish\'%oviet&&united&$were%!.&!7&#the%&/italy%!e',
+    '&0se&rehy;equipped(&-brand*$uilt)1cum-impressionist)\'derived+&signed)\'english)$held)\'iranian)$like)(mandated)#new*$orth)#run)&smooth',
+    ')$thai*#ype(!.)\'richard(\'/source)"us("ry%#ica&"sm&&zation%$ning%(ologists&&phobia%"se%$town',
+    '#"e\'$!k$$ster#$heth#"ie$"ng#"on%#ais%$sime#$weed#&ygidae"%quard&$ello$!e%#min',
+    '$#ier%!n""r.#$adah##bou#+danafinance&"eh$#eir%!x$,ine-matheson\'#rie$"ox#"en$!t##ful',
+    '%!s$)on-filled\'\'junkies\'%laden\'\'perfect\'%smith&"el&#ing\'#sed(!h&!y#/isch-herxheimer$%zinho##jis$#oun',
+    '$#ett$&sgatan#"ma$#ers$#ies$"on$%uschs$!y##nac%"il$#ell$&iewicz#(o&scaron$!s%"ch',
+    '#"pa$!s#"ra$"et&#ier&\'tchecks\'(outlines$"ie$#ott%\'w-based$\'y-esque#&s/tins$!e#$tley##uga',
+    '$\'zelski.##ver%"ys$#ies%*s-andersen&%/head\'&jockey\')technical#)zembowski"(s/demewi##bir#"co#!h$"av$$bhai',
+    '$!r#,mine-covered&#ium#(on/actor#$pars$1er&ndash;kamloops&%/west&$ware##sar$#ick#&tkowic$#run%\'zembski#&winder""te',
+    '##huk#"in%#dur$&yabadi&&tabadi##rox#!s#"un"$uary##don#&ffrett$(r&eacute#(ndice_as(!s\'#ing',
+    '$\'latgale$&t-ette%"ed%#ing%(y-peaked#"re%#gui#!s$$ovec"$vadi$!l%*et/regatta$"na$!s#!e',
+    '$$lin*\'$-men((throwers\'#men%"le$%riana%!t$#tta#%itses##ols$$rina#$vier",w&rehy;lines#%-ache("rs',
+    '%%usted$(cracking$#jaw%&utting$$lock(#ing$)splitting%%trake#!.#$agal$"ri#\'breaker%$oken##dat$\'ropping',
+    '#$fish#"id#$lock%$wski##ohl$"yn&!s"\'x-oh-in"&y-four$1in-love-with-lucy$$walk#$ahen$"nt$%ratne$%sinha',
+    '$\'wardena+$pura##cee#"en#!l#&nettes$!i##tee""ze#!i$!a##uli#*z&rehy;rap$$-age%$babe',
+    '%$club%\'derived%+for-dancing%%heads("vy%)inflected\'&spired%&junkie%$like&$over(#ing%&modern%\'pianist&&layers&%oetry',
+    '%%swing%&tinged(#ted$)/american%#big%\'country%%dance%$folk&#unk%#pop%$rock$$band%"ie%!o$&ercise',
+    '$#ing$\'masters$$niks$%oetry%$rola$\'y-combo!#b-4"!1"#250"!b"#cns"#eil#%rians""ls""tv',
+    '#%/your!$c/je"#120%!s"$5088"*:reluctant"&amp-dx"*c-designed#!s"!d"!f""i\'#!s""rl""ts',
+    '"!w!&d1,106#*20,000,000"#324"+906,700,000"%avies"!c"!h"!l"%n-fed"(salinger"!v!*e&ucirc;ne""al$#osy',
+    '#)n-bernard&%laise%#cut%%edern&%fflam&$mile&&tienne&,ug&egrave;ne%\'gabriel&)enet-like\'%orges%%herve&&ilippe&+onor&eacute&$uges',
+    '&%oseph%,louis-ernest*\'foreign%\'michael%)n&ouml;el%\'patrick&$olak%$remy\'(n&eacute&&ichard&$oger%&victor$$anne$"ed%$ttes',
+    '$&maire*$%neaus&!l&#ret&#ton%"in&"ot$,pr&ecirc;tre$4s-and-leather-jacket*\'sweater&&buying&%maker&,to-cosmetics%$elme%#son',
+    '$$uius$$wear#$urat"#bba$,ett/designer$"it&&/flood#"co##els#"ir##oda#$reel$"il##sal#&usites',
+    '##han##kle$"yl&!l#!t"*d-forest11#!d#%ediah#"ir#&linski#!s$!a$#ons"#ebl#%eesus',
+    '##nay##oos#(p-driver%%lurch%\'mounted%$ride%$type$$ster$!y#"ra#!s$"us#&vanjee$,es-on-wheels&#ian',
+    '"%fcoat#%fares$$cote(%/aeeu\'!t$$eray&)ies/works\'!s&+son-smurfit%!s%!y$!o%#rds$#ree&(y/father',
+    '*"rc)%other((speaking%)ies/works"$gado#\'erische#!o$&-query#!s"+han-georges#%ingir#!o$#ash$%iakin$\'shaphat',
+    '&!n")junectomy&!m%&oileal)"um"!k##ell#1yll&rehy;and-hyde&)-inspired"$lata#,en&iacute;ho#+f/runner-up%&winner##ian$"na',
+    '%*eknational%#ger#"ko#%labas&!y$!e$"ie&%d-eel%#nek$$neck$#oid%%shots$(y-babies&$heap&\'livered',
+    '%$bean)!s%-fish-infested*$like*\'remains)"es%#pop%!s#"tz#%utong#!z"&m-1200$#boy#%100cx#&athang',
+    '&\'/jemmel#%danee#$ison##mie&!d&!s#%phrey$+s-dungarvan#$shyd"$n-hu#(a-weimar$&jaroen#$bach##cra#$ding',
+    '#$esis$$vein&!r#!g$!a#$ings$!s#+kins-burton\'./father-in-law()leicester(*scientists\')on/farmer#%nalou$$efer%$kens',
+    '$(ifergate(!s%"ng\'&s/race)&trader$#y\'s%)-dealings&$love%&fields#!o#&renaud#\'s-peter$#ema%(n-healey$$kies',
+    '%*on/denmark$$tein#$tris##ufa##way"%offry##ire#\'pardite"&phcott#!p$%erson$!y#!s$#ons##the',
+    '$!i$!j$$keen$"rd#$boas#"em%!.%"ey%#iad(!s%-y/peter/danny##ger#!h#.icho-jerusalem($like',
+    '#%k-off(!s$%ed-up%"rs$#ier%&ng-off\'!s$!o$&y-jump#"ma%#nis$#iah$!s#%naeus$"ej',
+    '%(oam-like(!s$!d$"ld$!m%#ack##rak$"ed$%icurl$)y-bashers\'&uilder+#ing%\'builder%#can%!s',
+    '\'$knit\'$pull\'*registered\'$wool&%/coin$%iaise#\'usalem\'\'"mi%%halom##vas#$zees"*s&rehy;sie#"ch#+en&iacute;k#&hajahu',
+    '$!e##lyn#%mines##sa-&#myn%$vala$"en%!r$%ified$#lyn$#mer$*on/central%(p/thames&"pe$#sie',
+    '&!s#&t-book$"ed%&r-king$%ingly\'!s#\'uit-run&"es&#ism)!e$!m$%ology$*s-christus&%esque&&figure',
+    '%&.jesus%&labour%9mary&rehy;andallthesaints"(t&eacute$,rehy;engines#)-assisted$$boat%\'uttoned$(cleaning&#oud%%opter%(raftsman$&driven&!y$#eye',
+    '$\'handled$#man%%illed$$pack%&owered$)qualified$%rated$\'settish%$kied\'!s%#tar&%reams$%trail\'#vel&$ikes',
+    '#!e$!r$!s#$fins$#orm#$less$#ink#%ronic#"s.$&etters$$kier$$tars%#one#$tair%!s',
+    '%!r$(isonable\'$undz$"on#$wave$#ing#"zt"#udi#&mont-1#%niaux"#van%!s#"er#"on##ric',
+    '#\'-baiter*!s$$face%#ree$%hater\'#ing$(infested#\'alition$#rna#\'baiting$#oys#(el-cases&(embossed&$firm&%green',
+    '\'$ouse&,in-the-crown&\'thonged\'%ipped\'&rading%!.%#box%"le\'/r-cum-collector(\'y-stall*\'trading)(/carpets%%s/the$!s#3ish&ndash;christian',
+    '/.st-imperialist\')christian0(-islamic\')dominated\'(egyptian\'%greek\'1islamic-christian\'&mother\'%owned\'(provoked\'#run&(/yiddish#%llers#$nion#%ontin',
+    '$#ons"%xreel"%yaraj##did#$kell"\'zebelis\'!s$!k#$zard!&f-it10"!d"$it10"#k/i"!p"!s',
+    '!"g2#!7""er!#hal$"eh#"na%!s$!g$"si#"pa#$veri"$eels#"ni#(ri-curls#(su-warde',
+    '"!g"+opadpatties!1i&ccaron&iacute;n#0rcaron;sk&aacute"$amil#\'ngchuan$"xi#!o$$tong$"zi&\'-guotie#"xi"&b-boom#,ber-jabbered&"ed',
+    '#$rail$#ils"$c(g)#!k##tar""en#%qiong"\'ffy-bag""g-$(a-jigged#!2##car#"ga$#ens%"ry',
+    '%"ty$\'le-rock&"rs%#ier%!y#,jidsurengiyn##oku#+saw-fashion\'$like\'&shaped"#hur"!i"#jel$"na#!i',
+    '"!k"$lani##bab#!e#(j&iacute#,l-in-the-box#-ted-architect#!y"+m&mdash;who#)\'&pound;s#/-the-bus-driver#)/homeless$\'new-age#(bardsley$"os',
+    '#&i-heat$%belia$)nycricket#&mabibi$"my$&y-jams&\'one-arm&$said##son"&n-dong$%janda#,d&rcaron;ich#$ghua$#ing$"ji',
+    '$\'le-like&"rs%!y$-o-outpourings$$shan&"en$#wei$#zhe#$icil$#nya##jin#(k-backed#"mu#"no##pei',
+    '%"ou#%x-jet")p-jip-jip#$ping#!y"(r&iacute#%arote$#yer##dan#"eh$!s#$ghum"#she$!i#!m',
+    '"&tendra#!h#$neys#\'ter-bug&$bugs&%iness"\'ulong-1"*ve-talking$"rs"#wan"!x##4mr""ye"#zah#$zane',
+    '!#jcb"!d#!a"(kauizmzi#%kllmm!(k-1mol-1"!1"!2"#808"!a"!d"!e""lm""nc$\'-farooq',
+    '"!d",e-compatible"!f"!h"!j"!m"#sig"#uli!#m-2",02e&ndash;14"!1"#4pm"&barrie"#d/s""es',
+    '""ls""mt"*ob/telecom"%p-100##900"!s"+u/institute"!w!#n-4"*a-croatian#(/serbian#!n"$hetc"#ina"!l',
+    '!)o&acirc;o$\'tilde;s#,euml;l-marie"$(f2)"$-flo#*ho-ren-sis##ohn#!u"\':fi:bse""ab#%chain%&imides("sm&!n#%hanna',
+    '#\'n/chair$!a$!n%*a-stompin\'&!h%)e/erskine&!r%"ie&"ng$%owski#+qu&iacute;m##rna#"sh$!s"0b&ndash;security',
+    ')(relevant)\'sharers#!-$+acquisition%\'ttitude$#bob%$uilt%%y-job$&centre%&ontrol+!s&)unselling$,descriptions\'(tructive%+isplacement',
+    '(#ing%#unt("er*!s$(knocking$$like&"nk%%osing\'#ses$%maker&$rket$(oriented$\'process\'\'tection$-qualification',
+    '%\'otation$,satisfaction&$ving%(earchers*#ing%.hare/part-time)"rs)!s%,pecification,#ity&&inning%)ubstitute$%taker%$itle$)weighting',
+    '#\'/career$(hereford$&income$(marriage$#new$&salary#$_for#%acct.$!r#)bing-shop\'0/sub-contracting$"le#$club\'+s/jobsearch##ert',
+    '\'#ing$\'unt.pcx\'#ers#"in#$link#&master##ner#+s&mdash;and$%--how%"as%%first&\'or-life)(the-boys%$only%$rich',
+    '$$.but%#tim$$_for%&rather$&haring$+on/bardsley$,pecification$*t/clinical%#art##tel#%watch"#cem#!h$#ade%#nan',
+    '$"em%"ns$#im.&#sen#"k\'$\'-straps$!e%\'y-sized&$ings&$ship$#lyn$#pot$"s.#$onde#(ulatores',
+    '#!e$!e$!n%\'savanne#)hpur-slim)$tyle##oin#!s"%e-boy$$soon#\'l-marie$#een$!s##nsu&!u',
+    '$"ph$!t#"ys##zer"%ffied"\'g-along#$aila#(eesvaran$!n$#zai#)g-er-ling$+er-thronged&!y$#in\'&\'g-pants',
+    '$#les#%iches$$nder#%suits"&h\'burg#/annesburg-based.$ound&#ite&&werner%!s&+son-hedberg$!r##hny#!i#$n(4)',
+    '$!-%&andrew%\'charles%&davies%"ga%(harrison%(majorish&&ildmay%\'subject%,the-baptists%&willie(#son$!.$%/aged%+oxfordshire',
+    '$%es\'s.$"ie%"sh$%major$!n%!e&%sburg%%iemac%0y-head-in-airing\'0passing-throughs$#roe$*s-manville%*/ambulance&(creepers&&forest',
+    '%"0n%$burn%%grove%.on&amp;johnson\')\'s-health)!.\'+-hill/rspca((marshall\'&/chief)#lub)*ountryside(*eyewitness(&figure)%orest($gchq',
+    '((managing),eteorologist(%panas*$rent)(rincipal\'!e\'!n%#tae&"ed&(on-allan,"en((/amnesty)%opera*%xford)$race',
+    '*%white),/ross-on-wye)!0\'&unburn#\'orensis#!s"#icy#*e-de-vivre$#sle#$n-in%(the-club)$dots%+up-the-dots$$ed.a%$ring',
+    '$"s.$*t-authored&&bidder\'%uying&(chairman)&mpions\',ollectorship3!s("st&+development&%elite\')nterprise\')valuation\'+xploitation&)favourite',
+    '&)ownership&(planning\'(resident(&ojects\')urchasing&.responsibility\'#ule&\'smoking&#top\'(reasurer&(vignette&$work%&.stock%)ed-legged&"rs',
+    '%$less&,y&mdash;lord\'\'-funded(%these$&villes#!r$"et#)st-hanger""ji"!k##ari#\'e-count%&figure%$hero%%night',
+    '%*production%&themes&"ie$!.$%books$"d\'%".a$$less$*r-in-chief$)s-wetting%2/anecdotes/stories#!i$"er%"st$&oisten',
+    '##tan#\'ulhlaup"$l-ly#&dwynds#!e$"ne#%ibois$!f$"ne$"ot#"le%"ys$&iginki%$tude$#yer',
+    '%%ville#/son-caricatures#&tingly#&y/yves"%mhori%#uri$,uri-e-eslami\'"ye#%melli")n-ee-than$$paul$#tex#%adab.$*ssen/bouge&"on',
+    '$"va#$ches$&kheere#"ed$)s+brother%!-&(connelly&&davies&#lee&#the)%-milk&&walker\'$orld%!/&$alan',
+    '(#nie&\'british($unel\'\'usiness&*campaigner\'-hairman/local(\'ristine\'%ourse&(daughter\'(eveloper&-environmental&$fire&5headmaster/picklenash\'*ouseholder\'#unt',
+    '&%judge&%laser&\'malvern\'$usic&(national&\'orbicom\'%xford&\'patient\'$ilot\'$lant\'$rops&(resident($uter\'#oss&&singer',
+    '&&thames(&rottle&*unemployed%&avitch%!i%$port%\'warning#$g-il%#koo$$kind$#lei$#sma#!h#$ides#$joli',
+    '$#ers$%heere#%nifer$#son#"or#%quils##sil$%onian&!n$$soen$%tolen#!y"&o-sung##dha$#jee',
+    '#$mpah#"ne#$sten"$pint#%plety##son"2r&eacute;di&eacute##-el#"am$!y#!d$\'an-hart\'%style\'&yamaha&&/heart',
+    '\'%saudi\'$wife&!i\'(an-based*)sponsored&#ons\'!v&"us&%watch$%onova#*es/matthew#&genson%!s$$hino#"ma',
+    '#$rand#$unal%!d#$vick".s&eacute;-luis+,mar&iacute;a+%phine%%grave#"\'e#"af$"ia$$phat#&celyne$#ina#(e-manuel',
+    '$"ba$#fin\'!o%%owitz%)sk&aacute$$land$%maria$%naldo$*ph-charles&*/transport&"ea&\'finance&$inae$$vate#\'h-house',
+    '$"ed$*ieducation%$pura$!u#(ie-maria$&povici#!l$(in/chief##peh&$ites#\'quinian#-s&rehy;sticks$.-stick-scented*!y$+/consultant',
+    '$"ua$\'venglos#)tedalsbre%"ns$%lings#"ua"*t&ndash;re#%angia#"e1$%nheim#$nian#"ul$\'nheimen"(u&euml;t#$anne',
+    '#(derville#"en%#nes$"ur&!s#$gler$!s#$haud#$joux#"ke$!o#*le-seconds#/r&rehy;nalistic$,dain-durance$,gensen-stand',
+    '$+n&eacute;es%!a&#l-a\')/magazine(#nbc(&serial\'"ed\'$ism.)"t\'*+-historians+*tormentors*5s/printers/newsagents(#zes)#ing\'%ology',
+    '(%_such&"ux%"ee&!l&#man&\'y&mdash\'!*\')-matching(%proud($tale)$imes(%women\'%.then\'6/adventure/exploration(*expedition',
+    '\'\'s&ndash\'$work%&gensen%#ies%&olists&.s-turned-media#*sting-helm(!s%,ra/macintyre#*v&iacute;n$$ence&"el\'!t&#tin$\'incourt',
+    '%)les-reims"&vinian("um"!w#"an#$ett\'#)l-shaking%(wobbling$#ing\'!s$%swipe$)y-looking#$ster")y&rehy;it#!\'',
+    '$%rider\'#in\'$\'stained#!b$&ringer#-ce&rehy;style%%-leon\'$oebl&+worshippers%*/opthalmic%#lyn%\'ntenary#(e-killer$"st#\'killing',
+    '$$sons#$port#&ridden&"ed\'%rs/we##sey$%prick$/tick-and-cursor%%rings"%zefff$!l$"ph#"sa!%p-233"#250',
+    '""dp"!f""l."!m"!p""rs!!q!$rb-4#!g"%falla##lla#!u"!r!$s(1)""1s',
+    '""b5"!e#$/bse"!n"%p-led#"cd#"rs"!r"!s""ut!\'t-12a-8#"60"!b"!l#!s',
+    '""ps!*u&aacute;n#)iacute;zo""\'i"!-#"52#"88#\'jujubes%!s##kwa"#188""52$#/3m$!s"#87b',
+    '#"8a"+an-les-pins%&manual)"el$#cho$%jorge"%batus$"yl#\'bergate#&ilance&%tions\'#ory%"eo%#loo%"us',
+    '#!y"#che#%ntion#%tions"%daens%$orum%"us$(h/israel$1ic&rehy;christian&*-christian&"ae\'#rum&"um%$stic%&zation',
+    '&#ing$!n$&s-like%"es#)d-powered$!s##e\'s$)l/vrolijk$)n-theater%$burg%\'daitsch%*k&uuml;nig%$rein%%staat$"o-',
+    '-1-communist-occult&%nazis$!t%"ul#+g&rehy;ment$+e&rehy;ment%!\'%+-arbitrator0!s&+in-chambers&%power%(/malvern&\'sheriff&&united%\'manship',
+    '(&t-free)#_as)$ally)"s.%"s.$(mentally#$ical&#tor)!y%*ial-review(//administrative($ized\'#ry.$5sch-bolschewistischen\'!e',
+    '%-h-chalmers-ly$%vious#"oc##rin#)son/local#(y-styled$\'/joanne"$eces#!l"#fer#$uker"&g-band$\'hauling$(jug-jugs$%money',
+    '#&annath#$band#%ement$%ndamt&(bewegung&/gef&auml;hrende&(herberge\'$ilfe#$fuls#+gins/parent$%le-in&,r-comedienne%-ing/conjuring#!i#$lone',
+    '#(o-slavia$(plastika$\'slavije#(ular-red%\'ovenous$$rtha"#hel#!u"+ice-stained&$tice%\':plasma%&s.that%!y$$ings$&y-ripe',
+    '$%lerat#%verie%!s""ji#\'ujujuja$!s"(ke-joint$+/eyewitness$,box-come-end(*management(%ready#"ic##tki#!u$!n',
+    '+!2*!4*!9#"er$)s-rosette%!z$!y#!i$\'&aacute$.a-and-alastair&"if%&na.the&!o$$enas%"rs',
+    '$!n$*o-claudian%"tt#!l$!i%"an%"et#!s#*y&mdash;30+&august%(ndash;15+"20,!2,!9+"30',
+    '+(december+)september$!*$"-1&!0&!5%!2&!0&!1%!6%#aug%\'flowers%$june%(november%$sept',
+    '$$/aug%%chief$!2%\'4/aug23$)31/august$#ara#\'z/effie"%maale$$deen$!r%#ing#*ble-filled%"ie$\'o-cumbo&$ised',
+    '&&shaped\'#ize$!y##eau#%hoori$%uriya)!h#,i&eacute;ges$#nez#$p(s)$)-and-turn%#jet(!s%$offs%&rammed',
+    '&\'tarting*!s&#uit%"to%#ups$$/fly$#box$$cats$/ed-up-gentleman%)r-fiddler&!.&)/cardigan&"ed&$s-on$)ing-about',
+    '($hole($jack(1on-to-parked-cars$#jet$#s\'/%#hip%#ter"*n&ndash;12+!5*!4*!8#$-air%+p-1-binding$\'binding$#dna',
+    '$#dna$#jul#%1-193#%ankar#!b##cal$5tion&ndash;coltbridge/&pilton((-croxley()s/lateral%$ure.#!d$\'ishapur$!u#-e&mdash;ibid.',
+    ',!6,!9+"20+!7$#-10&!5&!9%"20&!1&!3&!4&!6%"30%!4%%march',
+    '%$sept$3/culham/oxfordshire%%early%+july/august$$1993$)22/july23$!s$#tte#\'g-chieh%%lette$"en%#ren%!s$$fern%-rauenmaschine',
+    '$+grammatiker$*h&auml;nel$!i%%anism\'!s%$poor$!k$6le-&amp;-junkie-headed\'&beasts($oots)"rn\'%dense(&rummed(#umb\'#gym',
+    '\'(skirmish($lugs($mart&!.&\'/ghetto%!i&"ng%,y-atmosphere\'$type$0m&auml;delschaft$!r##iac$!e%!h$,or-secondary',
+    '($taff&&/first\'&melody(#ini\')secondary)$nior$$pall%(er-berry(\'covered#\'k-bonds*#ter%%chute&&ulture%\'default%*food-laden',
+    '%%words%$yard)!s$,er-dominated\',middle-class$)ie-ascent%"sh$#ova$$room$"us#"ne#%oniae&"us$!t##per',
+    '#$shen##xia#"ya"*pe-culotte#*iter-bound(\'grazing(%ruled\'#ian\'!s"$quin"%rabek$#dos%!y$+l-political$"nc',
+    '$$pari$#que$\'ssienne#"ca$#zak#"dy#"ek#!g$%enson$"is##ica%!k$/dical-political\'!o\'$tion',
+    '$0sconsult/general%*diction(s),(-fishing,+.exceptions,$able-4l/non-jurisdictional.!s,"s.%&iction&\'diction%\'prudent,\'ialists%*tenmonopol#%jevic#$mala',
+    '#%nalis#*opolitical#$tina#$ugua$%latih$(sdiction#(y-courts%#men%#rig(#ged)#ing%%trial$#eff$!s"+s&rehy;tify',
+    '#!i$"fy#!k$\'evicius#!s$+-goh-ha-pee$#ell$#ive$&tified##t-a&(nnounced&&rrived%(beheaded\'(tween-us&%oiled',
+    '&$uilt\'\'tchered%)cancelled&\'hildren%*discovered\'&vorced%\'elected&$nded\'$ough%(finished\'$tted&%ormed%6gargled-with-port-wine%"he%2in-out-of-the-cold',
+    '((roseland\'(troduced%$like%%maybe&%elted&%olten%&opened&.ut-of-the-nest%/past-pubescence%%right&%ouged%\'savaged&-even-year-old&\'izeable&/lightly-strange',
+    '%+too-distant&(urned-30%.understandable%$warm&#ell$).johnston$2/precisely/exactly$!=$)_a_little&#s_,($well%#for%\'in_case%*just_about**just_about',
+    '$%anook$"e.%$rini$!i%"ca\'!r&\'e-maker($room\'&.david\'\'/london(*procedural\')s/swindon&\'ialists("rs\'!e',
+    '&!i\'-&rehy;cations\'#ers%#nas&"ho&%ianic&$lees&"us%!s$"os$!s$$took$!y"\'t-jawed#&aposed',
+    '%\'working#,ikulminister#%land.\'!s##son$"um#$tin\'#!z"(vantibus$!t#+e&rehy;nile$,nile-seeming%"ni%"ti&#ous',
+    '(!3\'#tem($ibus$&scence#"os"!x#"es#,ta-articular%\'mucosal%*positional"!y"\'zdbasic#$gado$!o!"vs',
+    '"#63t#"4u#"5v".p/businessland!"ya#!n"#dsk""ll$$ands""nx!!z (k&aacute#&macr;i("ma)!i',
+    '#*uml;llgren\'"mp\'$ndel)#ler\'!p\'(rkevagge($nten**nerstrasse(+tnerstrasse\'&semann)+r-glanzmann"%dgr;k"/eacute;k&eacute)(v&eacute#$gr;b',
+    '&"rt"$gt;0"-lsqb;br2&rsqb\'(ing&rsqb#!t$";0%!1"+oacute;0kan)"in#(circ;nig#)uml;chels("ki*!\'\'"hl\'&keritz',
+    '((n/goebel)1er=stadt-anzeiger)&ischer(%tzsch\'%nberg($igin,#nen*&shofen++l&uuml;tter+,m&uuml;nster,#ark+%platz+)schlosser,"ee+\'viertel',
+    '\'+pckestrasse\')r&ouml;sy()perschaft\'$slin\'!y"$plus#*rime&prime\'";c"=rcaron;i&zcaron;ovnick&aacute"(times;h7"-uuml;c&uuml;k\'$hnen\'%ltepe\'&nstler\'#sse',
+    '!!\'"#ang"&ombudo""un"$vass"#yow%!\'!#(2)!"*c!!+!$-158"!5#"62""67"&atpase',
+    '"#car#$hell#$lass$"ub#!o#\'reative")dependent"$edge"\'factors##old"#g-b"%i-c-k"!j"(k-k-katy##een',
+    '"!l"&mesons#+odification$&tronic"!n"$paul##ost#\'romoted"+r-y-t-r-o-n##azy#*hodizonate##ich&&terite,!s"#s-h',
+    '$#ool#$tars%&tistic#&urface"&tables#\'elestar#%uples#"wo"!y!$.001"$1(1)#"35$!6$!7#"62',
+    '$*8&ndash;73%&-k.173#"72$!4#"81$\'2/173da$!3#"92$&9/161b"!2#!0$&0/189k$!1$&2/186b$!4',
+    '#"39#"62#"71##84a#"99"!3#(01-k.306#"10%%/300d$!7$!8#"21#"31$!7$!9',
+    '#"61$!5#"75#"88#\'96/300g"!4#!0#"13%(&ndash;5$!4#\'27/417a#"50$!1$!3$!4',
+    '$!8$!9#"64$!5#"75$!7#"82"#504#"15$!6#"25$!6#"43$!6#"51',
+    '#"81$!9#"90$!3$!5"!6#&&amp;7$\'ndash;9#"14#"23#!6#!9"!7#!2"!8',
+    '"%b.107$%c.-19"$c.a.$$e.c.$$m.g."$f.a."!g##.a.""hz""i."#j.l"!k"$l.m."+m.i.january"%o.cup',
+    '$%y.l.i"$p.e.$"s.""r.""s.$"p."!w"$zinn!!/"!2""ar"!k"!s!!0""\'s',
+    '!*1&mdash;k2"$,200##600"&00,000$!s#)2,000,000"+1&mdash;fee##fee""36##fee"*50,000,000#!5$(&ndash;9#!6"+68&ndash;71',
+    '""90$%/186e#!a#!b"!g!+2&ndash;100""01"!1#&6/k218##for#$nest""2r""31#!r"%4,000',
+    '$#500#!2#!e"!5#!1""61"!8!*3&mdash;k4")2y6031-cd""31#!3""58$%/186c"%6,000#)2,000,000',
+    '$&/k320.""81#&4a/388#!7!+412,000,000""20#!6""48#!9""50#!2#!3#!4""64""88',
+    '!&50,100#!3#!4"*14,000,000#!6"#257%&-k5263#!6#!n"&37,000""42#!8""50#!1""64',
+    '"#910$!1#"39#!5#(80-k5913!#606"#927%&-k6932""cr!!7"#555!*9682-k9686"#926"!j!,=0&middot;41',
+    '"%4r2c1""ca!!_""as!$a\'ba#!u"#-62#$aaow#$gool#%ka-ka#"on#$prap"".b"$8210##300',
+    '#"81""a\'#)-arr-arrr$"uh#!a$!y#"ba#!h##mbi#!n$%apali#$rina$!s#%sdoop##tje',
+    '#%ajani$(ka-to-be$(levskian)!y$$nova$,rdino-balkar%#ett%#iti%"ti##baj%"la%"ni$#ous##eho$$litz',
+    '%"wa$!r%!u##hri#+i-pharmacia$!a$&choosa$"ga$!l$#net\')s-kanzlei\'"te(*sbefragung)\'prinzip%"gu',
+    '$"ta$&vitrum#!o$!o%!z$(r&eacute$!u%"lu%,termannikins(!s#!r$$ikha%#sky$"ru#"ue',
+    '$!n$$raki%$dian#\'wegyere##yle"%canik##han$"el%$mire%$nend$$idza%"na#!k$"er#&perska',
+    '""da$\'&ncaron$!i$"my$\'nwari-1$*r-gravning%#ism$&vulava$#zan\'&-dusun##ett#$hima#)iliks-the$!n$+rkamanathan',
+    '#\'monites#%oorie#(republic#)una-based$$shin#&viserg#\'zielski"!e#%bling#"di#$kwae#$ndly$!g#!o$!n',
+    '$$pler#(rnhachii#"se%$berg#!t"!f#)&eacute;s#$adar$!n$%rabad%%nihan#"co#&erberg%&kasten#.fen-und-kucken',
+    '#\'iluddin$"rs$"ty#(ka-esque%)esqueness%"zi#%sikas#%taned"%gambi$"wa#%ehide$"ra#$imbi\')secretary$*ri-nishiki',
+    '$#off#&onyera$"ol&!s#$rant#!s"/h-gega-gah-bowh#(anamokus#"er#&ikatea%!i$!n$#yeh#!k#"le',
+    '$&oesque$"ua&"\'n#%neman%&satake$"oh$!s#!r$$aman#%snitz#%ukiwa$#nas$"ta"&i-chah##bel',
+    '#"ga$!e#%hatsu$(sienkung#"ju#&khosru$$oura##las$#ish$#zee#(m-caudle$"ak$"ei$%oncho%$witz',
+    '$"en$#gli$"os#(parowits$#ing#*r&oacute;s$%allah#&sarani$,er-friedrich\'*permanente&%blick&#hof&"ia\'!n&&jaeger',
+    '+"rn&#man&!s\')teinbruch)"jn(#uhl&$treu&%worth$"ho#%taake%"ia%#rma$%chuck$#eie$$iaki',
+    '$$ouni$#ung#%ulani#%valya#&yidine$!o%%-maru##zer$!o"$jabi$"la$$noja#&domcaj##fez#&kavski',
+    '$"yo##ubi$"ra")k-kak-kak#&abadse$"la$"mi$$tuwa$$vije#!e$#lik$$mono$$tani%%suken##fui',
+    '#&itumba$$zawa#!o$\'lewnica$%rinya$&ulidou#%utani&"ro"%labar%"en%!u$&chakra$$fani$#heo$!k',
+    '&!h$&machka&#kis&%raiki\'!i%#bay%!i%$unda$!n%$gula%$tari$!r$\'schnike%!h&$akra',
+    '$$tara%%zakos$$uria$$vada$/w&ndash;rangoon$!y%#aan##dex%$zeit$\'fjorden$%orian#"eb$\'chofsky$#don$/ido&rehy;scopic',
+    '$"nd&$arum&"er%"ge%"ji$!s%"si$$tsky$"wa#(goorlie.%$rlie#\'harachi#&i-anne%(chemical%$film',
+    '$"ch&$aran$"ed$"ja$#kow%$utta$"li%$ombe%!u$"ma%#era%$pong$\'nauskas%\'ichenko("ta',
+    '&\'nchenko%"ka&!e%%owsky%#ska\'!e%"ta&"ha$!s%#pel\'"ra#!k$#ini#"la%!b',
+    '%!h%"la%!s$(enberger%$stad$,ikrein-kinin%%polis%!r%(scharran$!u#"me%!r$$yksn#!o$&chroma',
+    '$!i$!n%"ia%"ji%#yme%"zo$#oki$%rkoti$&termes$!u%"de$#wet$%xilos#-pana-designed%"qi',
+    '&"th$%okass#%sbeek#&t/heim$#bad$&enbach\'#orn#!u$+gin/russian$"ki$&ndberg\'#org$$skar#&vaitis%&riskii',
+    '#$ydor"$maal$!i%*ng-mogaung$$kasi$$leai%!i&!a%%uddin$#n-i%"da%#ice$$rina%*ov/russian$!s',
+    '$"ti$!z%!u##bay$"ou#\'chatcka\'#kan*!s#&diesel#!e$&hameha$%lesan%\'treiber$.nets-podolskiy$#rad',
+    '%$beck%$ling%#man%"un$!t##ien$%guchi$!k%)aze-style("ed\'!i(!s$%ladin%(industry%"le',
+    '&"ga%%skaya$"ra#"la%$n-ek$#ish$3oops&ndash;whistler#$mern$%huber$#ies#,ni&scaron;ki#"od#)pflugzeug%$rath$%haeng',
+    '$$ongs$3uchea&mdash;vonadek)&n/thai#$rock#$sing$"ky#*tschaticum#!u$"ku$!s$"za""n\'#)-krushers#*a-to-kanji$"bi',
+    '$!f$"ka%!s%!y$!n$#oka$\'shimiwa#$bach#)chanaburi%#eli\'#ski#%dalar&"ia&$naya%"ni',
+    '$$hari$\'i-cutie%$nski("ys%$yali&!e#"e\'$\'/labour$%amari$"l.%%lakis$$mara\'+u/takeshita$#ohe$"sh',
+    '$"zo#$g-lu%"so$$alas%/roo&rehy;hopped(\'-hopped%)s-saarela$+erdlugssuaq$#ols$"ra%"is%!u$#uru$"xi#"ha',
+    '#!i$$doua$\'finolhu$"ga$#mai\'$njit#(j&oacute$"ii%\'kudichi$!u##kan$&kunnen#\'nchelsk$%ekens%!r',
+    '$"na$#out#"of$$nkop$"un$-wski/forestry#$rith$"yo#!s$#aii%!n&&puolue%&s-born&"ii$"ei',
+    '$"k*##t\'s$!.$!a%"ra&!i&$jian$$elis$"ha&"ck&#ros$&ianism%(onalsatz$#jil$#ons',
+    '%#rei$!s%#ler(#_et$$urek#$ungo##vas#(yakumari$\'eihamba%&rengwe$"on%"ro%#sha##zas$&leramt',
+    '$!o%!u"\'o-cheng$#wen#%hsiun#&koland#(lin-free&!e&!i\'&sation("ed\')te-illite($itic#!n$!a',
+    '#!a$#dia$\'labhati%!u$!r$(sluoppal#"ek$$llan%$noes%"wa$"no#\'heneion%$reus#&ielsky$%larii',
+    '$"sa$(t&auml;n#"la%&n-type&!s$+laniforeign$"ow&#itz#$nist#)ok-filled$!n$#ors#&p/high$\'a-float&"pc',
+    '&"er&#ler%%nburg#&rayoon$#ova##sch$$kaps#%teeni##ula$"ni$$rala$(schinski"\'ra-goyi%"on$&bashev',
+    '%$ulut$#can%/haevo-cherkessk\'%ganak$#dji&.ordjevi&cacute-!c%$zhov&"ik$,in&ccedil;ir%$skou%$tivu$!j%#an\'\'%-like',
+    '(%decca\'%esque%(eanesque$"ka&$cias&&lpakia%$ushi$$lius$&majong&$nids(!s\'%maras%"bo%#uko%#zin',
+    '%!g&!a&"wa%"os$$okes%(smanoglu$!r$!s%#jok%!s$!t%"as&&viense%)e-chopped,#ing',
+    '\'"ka\'%style&"do&#kas%!i$#ula&"ov$&vajevs&!n\'%serai$#wya$$zija#&balnov$#ide$\'ovanets',
+    '$"sa$&zenski%%miska#\'da-mine%$dzic$#elj$"in$$ofan%"ma\'&h-like%!n#$eene$#lya#(farnihan$$onas',
+    '%!s$"in#"hu#&i-anne%$otto$!e%"ls$&kurubu*%civil$"ma&%nzima%#jee$%ntina%"ya$#oke',
+    '$"ta%!e#$kade%!r%#zon$"ut#*l&eacute;n%1rehy;marx-strasse%+scaron;tejn%\'uring;v$&-ernst%&gunnar\'$stav%\'hermann&&inrich',
+    '%$marx)!-$%efors%!n&!e$%owitz$%platz$&shamns&"of%%platz%2tein-aschaffenburg&"or##man%!s%%yogin',
+    '$!i$\'okolias$#uta#"na%!d%$suta$&chatka*!n$#dal%"ol\'!i$"er$$ival$!y#&ochooq',
+    '&(ngischen\'"um\'!y%!j%#yev$)memphites$#nga$"tu$$zzin#!p$$athi&!i$%inski$1ov&mdash;kasparov&#ian',
+    '$#iem%#mat&#ore$"oo$&rimore%!r$!y#"sa%!n$$berg$%henas$#ino$#koe$#lon$&t-like',
+    '#*t-breaking$!a%!l$!e%!l%"rs$$haus$#idg%"ka$%parts$#sch$$vedt#"un%\'anayake&&tilake',
+    '%\'yavanij$%ssell#&vellis%!n#$weil#)yophillon%%typic$(stonikos##zay"&sabian$%mbala%"uk$#nof$#rda$%tanov',
+    '##els$$mann%+sriminister$%nally%"ga$#rne$$vich#!h$)afotdinov%!m%\'n-style&!s%#pov$"fi$$ga\'i',
+    '$#ima%"ta$#kin$$mere%#ira\'+i/pakistani\'!s$#yap#!i$!a$#ena$!h$!m%$irov$!o',
+    '$"se$#tah#\'k&amacr$#ade$!e#$lain$$iwal##oma$!s#&parov\'&!s$%eroff$&rowicz%#zyk#!r',
+    '#\'sabzade%"la%$mali$!e$$iopi%"re%"te$$maul$"of%+matransport$(ubischer%!m#!t$%amonu%)nienallee',
+    '&%tiana%!r$#ell%!n&%meier&$puck%!r&#man$#ing$%ollos%!r$#rou%"up$"va##ule',
+    '$%rinen%$stan$"so#,zubian-owned&#ska&!y"(t&oacute##-ta#&abarwa%$olic%#tic$"fs$$hdin$"ib$%kolon',
+    '$#lin%\'lassein%"og$!n%!e%$gole$)oka/sharp$"ra&$gama$"se$"ya&"ma#"ch%#-22%"en',
+    '#,e&rcaron;ina$!\'$--bar-the-door$#mfe$"na$\'pimeron&\'sternum$!r%#gon%&inberg$*strepsanto$!w$!y#+h&rehy;leen$".m',
+    '%%arens%#ngu%+rinenkirche&#sis$%child$%eaton%&konzos%$rein&$ines$%iawar$"le&$hong%"yn$1mandu&ndash;delhi5-&ndash;london',
+    ')(-pokhara)&/nepal$&oleike&$ieke$%press$#rin$"ys#$ibat$"es$#yar##jza#$koff#&mandhu#"na$"er',
+    '#\'omerion$"nd$$pola$#rgu#"ri%%vanos$$usya$#yna#&sambis&%unski$$ikis$%utaro&$sugu%"ya#\'tankudy',
+    '$"ka$%potha$#res#$were#"y.$#did$#rev#$z-oz$+/ex-refugee$"an$&enbach\'#erg&%stein$&nelson&!r',
+    '#$-kau\'%-kyau##ber$&itzsch#!f$"er$$hold$%manns#"la#)mbi-saleh$!i#-nitz-rietberg##pas$\'en-haas#$rava',
+    '$"is##sar$"el%!r$#tos$!u#%tilya$&okeino$$skly&"y\'",v&aacute;lla#"ag$"je$$lali%#ski',
+    '&#ghs%!e%&goland%#t-2$&ra/pub$!s$$vaev#(eh/abbey#&indele$$yani#!o$#usi#\'taradze")w-calling#!a',
+    '$"in$.kami/president$$mata\'!o%%ebari%#oto(*/president$%nishi$%sakai$%tetsu$!z#$iani$#mbe#&kareik"%y-kay',
+    '0\'/graham#\'/friend#$aked%!u%!y$#lar$"ma$#nza$$stha$%thiri#$bosh##dee%!t#\'e/actor$#nne',
+    '#$holm#&ingham#&layaan$#eth$"ie$"or&)/licensed\'%radio##nak%#rca$$itro#&reddin#$sens%(r-bondor&#ias',
+    '#$umba##yal"-zahkstanskaya$\'k-grade%(h-german\'\'kirghiz&%stan.*!i+!s(#han%"ov%!s$$nchi%%dijan%$kina',
+    '%$tzis$#tsa%#zki#$begi##eem$!k$%rooni%#uni#,hagam-janata%"ks#%iende$#mah#\'kahstan$!h%$stan',
+    '%&erczak##oos##tag#$uaki$$hiko\'!u$"ko$"ma$$nobu$"ya%$oshi!$b+nc"$-100"!6"#889',
+    '$"/s"$pad3#!s"(us-based"!w"#yte!+c&ndash;135"#(m)"#-40#%p1124"#135"&486/66"$70-v"\'al/hour$-ories/kjoules',
+    '"%elwey""ie""lo$!4"!m"&s1,000&"35%#700$&34,700#%3,300%\'500,000#%5,000#&60,000#!i!&d1,200',
+    '#%0,000"-2,230,500,000$#400#%0,000#%5,000"-3,549,100,000$#600"!4#"31"&altons"!d""ei#!l""ip""ka',
+    '"1s&mdash;christian!\'e-ke-ke"#1-5#"00##200"!4"#age#)laikahiki%%kekua$#oha$!y#%manan&!n#&ne-ish%&/plant',
+    '$&ophile#,r/gloucester$"ey$!i%!n$%sarge$$tons#!s$"se$(t/trader#+tes/barmaid$*ing/centre\'!e$&lemang$\'onesque',
+    '$"s-$#tch#$veny$#ney#)y/moseley""ba$"b.%#bed%"ed$&ngsaan$\'tlamang#"be$"ie$!y##ebu',
+    '##ick$!h$"li"#cal##hak#(k-handed#\'manovic#!o"#dar#*dieaddress&&pleads&!s&%tries$&leston##ges',
+    '$%ngton#\'lestone"#e-a$#eel%!r$\'kee-kee%"wa$%scott$"ya%"ow#$bles#%erree#*f/engineer$"fe#$gan.',
+    '\')newcastle&!d&%mania#!h#+k-keek-keek$"ed%!r$$orok#)l-hauling%%marks%(scraping$\'akekula$\'er-type%&y/road$&hauled',
+    '%,ng/reporting(%upton$#led$#men$$well#(n-minded%&sensed%(tempered%&witted$#air$!d$(e/fiance%&r-eyed%*st-sighted%!y',
+    '$\'leyside%)y-awaited\'&fought\'&priced\'&sought#4ow-keeow-keeow-keeow#*p&rehy;fit$!\'%!t$%-ball%,fit-to-music%)keep-keep%#out%0the-nosewheel-up%,you-guessing',
+    '$$/get$"ed%)r-batsmen\'\'clothes(-um-commercial\',keeping-keep\'"up)$pers&*/defenders&"s.\'$hips$#fit$!i%!e%(ng-place',
+    '\'%_with\'!s%!t$&sakes.$!t##rie$!s%%plosh#"se$$ings##tch$#ley%!y$(manshoep#!v',
+    '$"es##yah"(f-crazed##aah$"la%!i%(oyiannis$$uver#%elegn$"vi#$ford#&ridian#%tedes$"iu#%uffle',
+    '#\'elstadt#!g$#ing##let$#ike"!h##ama#%heler#!l#-rwiederspitze"$idon#!g$$hlty&!y%#ron',
+    '$"ei#$jiro#"ko#&lberth$"ey$!l$\'y/sales##nig%$nger$%meyer##ren$!n$+s/neighbour#"se%!r',
+    '$$hiro$"se$#ure#$thie%#ley#$zers\'%kroon"\'k-ke-ke&1k-kek-kek-kek-kek##chi#"er$!t#!i#"ki$!o',
+    '#$rops$(yphaleia#"us""la$"fo#!b$#urn%!s#"ch$!o#"da$"by$!y#$eher$!s',
+    '#!i$#bia$$hues#!k#%laher%!m%"nd\'!s%"rs%!s%\'way/the$#ein%!n&&berger%&r-type',
+    '%(t-bowman%"y.&%/oxon$$gren$#ian%#her%-ng/campaigner%%stown$+mer-pringle$"ti$&y(2.1)%</castlemorton/worcestershire\'\'hairman&(director&)emergency',
+    '&&labour&*prostitute%&donald%(nch-hall#%marsh$%perer$$scot("ts##ner#$ping$!y##sae$$dale$&ey-fry&*/recycling',
+    '$"on#$tner$%osova$#rol$!y##van$$edel%,y/automobile$(in-voigt##way&!s#%ynack"\'majoran$$keza$"li',
+    '$!n#$bles#"el$\'rdekaan%#evo%#ovo%#ton##fri#!i##lyn#)meriboden%"tt$!y##nay#!o',
+    '#\'p-welch$!/%&former%#pub$%eitai%!n&+aar/finance%&rplatz$!i$#ken$#lah%"er$%shots(!t%)on/author',
+    '"*n&rehy;dal#"af$!l$(rdington%"eh$"wa#$blas#$cast$%hreai$"ot#\'dalians&+l/co-writer\'!i$"el%$rick',
+    '%!x$#ray%)ick-jones(%/land##eba$#lme$"ma$#nth$"sh$"th#"ge$$roms#$hard#!i$$ckie',
+    '$#fed$/lworth-parkside$#tes$!x%&-based$&zzites#"jo#\'ka-dako$$elba$$yujo##low##mir$#ont%#re.#$nair',
+    '$$ealy%!d&%y-era(\'johnson(%nixon(\'onassis(\'skipton)$tyle\'*/macmillan(%nixon(%video\'\'s-style%&l-kept\'$like&!.',
+    '\'!x&!t&$wood%$mann&"er%#saw%%tside&&t-avon\'*/transport\'!s$1ingham/headmaster\'/ton/oxfordshire%"sh$\'y/dairy&)edinburgh',
+    '#$obus$"ur#%pshot#*rick/gypsy\'!s$!y#$saku%%leyre$#ett$$hole#&t-born%%smith$)/employee%&labour%\'patient',
+    '&%ussex%*thamesdown%&victim\'#deo\'&llager$#_in$#aru$"ie%-gern-oatridge%-sh-controlled($east\'#man$#ner$*riodontids$\'uckians',
+    '(&-epsom(#ans$%ville#$ulph#"wa$#igs$"yn#-ya/seychelles&(tanzania%!h%\'n-based\'&somali%)pithecins$(on-jones&*/catherine',
+    '&!s##zan$#ian"+oboualapha*##gan##kuk#%ladeo$!s#"ne$$jhar""p\'#"es#\'halonia$$isos##ing',
+    '##ley#*ner-tregoe#(plestone&%white#&t-were"*r-draanngg$$honk$\'llanggg$\'nockers#,a-top-ter-is$#cil$#mat$"ns$$sous$\'tectomy',
+    '%$in-1\'.ocyte-specific($xyte%#oid&&phyres$$wski#)b-crawler$"ed$#ing$&laying$#ola$%sides#&chache$%kring#"ei',
+    '$!m%$puha$$ngas%$skys$#pia$$sely&!y%\'kedelmi$$tapi#\'f-guide$$alla%#nte$"ed$$ield$!s',
+    '$%ueien#$ible$#cho$#gan$!m$#oth#$kade$#ham$$rade##ley$%inger#"ma%#bon%"ns$"es',
+    '\'"na&#ses%!y$\'it-like$\'ococcus$%uffle#$nals$$berg$"ed%\'l-based\'#pms%#met%)r/kerning$%grove$"ig',
+    '$%ochan#"on$*sene-based)(guzzling)%laced#%plonk#(r-dineen%%mcgee%#nut%\'stewart$(/bulmers%&father%"ms%(scottish$%amiks',
+    '$&i-lisa%%dgean(!s%%sdale%"th$%ville$&y-anne&$born%*/traveller%$gold#%saint$&eymere*!s$"ie%!k',
+    '$$mack$$plat$$tein#1t&eacute;sz/decca$"ed$$sman#%vaire$#ern$&orkian"(sarinski$$tuan##het$&ishian$#var##iya',
+    '$,24.817.65540$$usta#$sack%!r$$elly&\'reicher$!i%!e$#ner$#ock%!n#!t$$elli&#man$#ner',
+    '$(rel-eyed#$wich&"ks"%tambe$"ra#%chell%)up-holder(\'stained($type\'!.#$havy$"er$"ro##jap#%kanok',
+    '#%oacid$"ff$$mine$Ln-etone-methyl-tri-di-meta-post-oxy-chlorane%&e-free$#tic#$sela#!t$*alkpoosmin$$eman%#rer&.idge/insurance\'(ng-based*$made)1/northamptonshire',
+    '%!l$#le-\'\'boiling\'$drum\'5out-of-tin-can-makers\'(williams&\'/stroud&$brig\'!y&!d&"ss&&thorpe&!y%!y$%ridge',
+    '#%ubbot$+datindustry$"pa$!t"\'ulemans$#ler#$mann#"re#\'schnigg$#sen""v.#!a#"en#&in(10)%//michael/little',
+    '#)lar-coned\'+impregnated##vin"\'w-based$"ee$/kew-kew-kew-kew#\'/thames#$dale#*ick-kewick$*ll-omicron$#shs#!k""y\'#,-board-based$$case',
+    '(!s&)mbination&&ncepts%%utter$#dip%%riven$$fobs$\'holders\'"es$&keeper$%noter)!s$+of-the-door$\'pattern+"ed',
+    '%%hones%$lace%$ress)"es$\'repeats&&tainer%#ole$%stage\'"ne&#one$\'tapping%#erm%&o-disk%$ypes#)/clinical',
+    '$%metre$(position#$boar\'-d-accompanied)&phobes*%layer-#ing()/computer(#ers((ist/bass+!s((speed=31#&chains$#orp$&utters',
+    '%"rd#%gasse##ham$#old&(e-shaped\'#ful#&ing-in$!t#$know#+lock/thames##mar%!t#*name=value$.es.unconfirmed&1/buckinghamshire/',
+    '\')wiltshire&!0&(ian-type)+/monetarist)$ism\')$s-at$$oter#%phone(!s$0ress-by-keypress$$unch##s()$"an$#ham$+tone-moment',
+    '$\'witches##top#$wood%(rd-based($type\'%/stem\'#ing\'"s.&$kers##zer"#zar#$bers#"er#%zivot!\'f&amp;r',
+    '"!6""ar$(-roumann"!g#!f""ki"$oury!+g&amp;sup-1""-1"!/#"24#$hour#"km#"m3#$week',
+    '"!2""32"!6""89"#abo",b-influenced$\'trained"%eisje"!f"!n"$otla!)h&ocirc;l"#-11"!1"#230',
+    '#"88"!8"#900#"65"(a&iuml;f##bra$"ul#!c$(haturyan%(iashvili%(onprasat&(rnprasat##dak%!m$#iga',
+    '$#jia$(kapublic$$raji$\'zhiolov#1ela-mensha-khaine$"ng#%fajah$#irs$"ra#)grachbari#%haliq#%idama$&ndrava$!r%"eh',
+    '\'"yn$#sar#5juraho&ndash;veranasi&!i##kai%"ss\'"ia$$etla$#har$\'i-brown&\'painted#!l$)aftourism$#dah%"un',
+    '%"fa\'(hjustice$#fan$#idi%!f&"al%!n$"kh&#iin$!s$%turin#!m$$aizi%#nei%$riah',
+    '$%eneie$$idov&$ulin$$phan$$seen%"in$#ton#(n-cheema%%queen*!s$&/shoba%$taxi$$abad%!l%&mirian',
+    '$#das$"el$"ga$(industry$#oum$!t%%awong%"yn$"um#%parde$)khaponimi#!r$$\'kov$#afi%$kter',
+    '$\'borovsk$$dung$&eghani$\'g-sirri%*/northwest&)rotterdam%#pur$"if%"na%%tinov$$khov%-ov/sevastopol%"uk$#ubi%#san',
+    '%!m%#ort$$kovo#"ta$$chik$&hmandu$\'ib-zade&\'usecond%!r$%mandu$#ori$#tak%\'i-gna**$$wani#!w',
+    '%"ja%$rizm%"ss#"ya%!m$$dara$(yam-like#-zad-d&ucirc;m%!r&!i&!s$$ipit$$raji""bb"!c',
+    '"$ebir#"da$#dis$#iri#$ftyu#!l##mpo#"nj$(tamentiu#%phren$!i#!r$&sifron#$stov#(tsuriani',
+    '#"em#$lkov#"n*#\'rokitia#!t$#ran##zar"#jan"&lystov&"un")melnitsky"!n#$opff"$obar$!i',
+    '&"ux%!d%(shinskii%$ydad$"ja$%zhaly##ele$$niha#&ihlovs#%jakov%"nd#!l$$ashi$"er#*meini-like',
+    '%#nei%\'yniites$%ieths#&neinis$$sari#!o#&perski#%rdjin$"en$%maksa$$nate%-e-worshipping$"os$\'ramabad\'#bad',
+    '#\'shafian$0ravivafa/iranian#"te$"in#!u$"na#!w#)zraschet\'"#rab$"hl$$paty$"yr#*istoradnov#"rr%"rr',
+    '$!s%\'hchevan*#ism")shayarsha"$ubar#-dayyirforeign$%dayir$#ian$(onazarov#"fu#$jali#!l$%ayfat$"na#!m',
+    '$$jung#(ninshahr$$rath#"ri$#mal&"tu$#ram$%sheed$#tan#\'shcadam%"ro%$want##tba#+vaidullayev#&waiter',
+    '$\'ja-zade$"nd"%ylrea##mer"#zam!\'i&mdash#*ndash;115s)"43"%-keee$$i-ki"%.107b&!c"!1""67"%a-ora',
+    '#$ngsi##ora$!u#"po#$tara',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_72 = (
+count_72 = 6694
+
+heads_72 = (
     'i&pound;25,000',
-    'i&pound;292m',
-    'i&pound;296m',
-    'i&pound;3.37m',
-    'i&pound;362,000',
-    'i&pound;4.8m',
-    'i&pound;400',
-    'i&pound;450',
-    'i&pound;47.6m',
-    'i&pound;5.3m',
-    'i&pound;509,000',
-    'i&pound;50m',
-    'i&pound;512',
-    'i&pound;6',
-    'i&pound;6,000',
-    'i&pound;7.02m',
     'i&pound;7.97m',
-    'i&pound;7.9m',
-    'i&pound;8,690',
-    'i&pound;8.25m',
-    'i&pound;8.8m',
-    'i&pound;950,000',
-    'i&rehy;thou',
-    'i&sacute;vara',
-    'i&sacute;wara',
-    'i&scirc;an',
-    'i&thgr',
-    'i\'actrice',
-    'i\'anson/miller',
-    'i\'chamus',
-    'i\'endeh',
-    'i\'ibis',
     'i\'l',
-    'i\'ll&mdash',
-    'i\'ll-be-reasonable-if-you\'ll-be-reasonable',
-    'i\'ll-pretend-i-didn\'t-hear-that',
-    'i\'ll-take-your-word-for-it',
-    'i\'llsay',
-    'i\'m-a-dealer-in-architectural-antiques',
-    'i\'m-alright-jacks',
-    'i\'m-certainly',
-    'i\'m-i',
-    'i\'m-just-an-ordinary-bloke-like-you',
-    'i\'m-on-your-side',
-    'i\'m-sir-john-and-i\'ve-got-a-spoon-and-seal-and-my-family-lies-at-kingsbere',
-    'i\'m-sorry',
-    'i\'m.',
-    'i\'m_a_little_bit',
     'i\'n\'it',
-    'i\'nt',
-    'i\'stead',
-    'i\'t\'dales',
-    'i\'the',
-    'i\'thought',
-    'i\'universite',
-    'i\'v',
-    'i\'ve-\'ad-far-too-much-to-boire',
-    'i(&formula)',
-    'i(c)',
-    'i(d)',
-    'i(e)',
-    'i(li)a',
-    'i(mpossible)',
-    'i+ii',
     'i+uk',
-    'i-1',
-    'i-2',
-    'i-45-30',
-    'i-5',
-    'i-860',
-    'i-95',
-    'i-abct',
-    'i-ad',
-    'i-ahrax',
-    'i-albumin',
-    'i-am-about-to-explode-in-front-of-your-very-eyes',
-    'i-am-morpurgo',
-    'i-am-not-really-dead-but-just-popped-out-for-a-packet-of-fags',
-    'i-am-the-greatest',
-    'i-b',
     'i-band',
-    'i-bands',
-    'i-believe',
-    'i-c-e',
-    'i-can-do-anything-i-want-any-time-i-want-and-make-you-like-it',
-    'i-care',
-    'i-cut',
-    'i-data',
-    'i-deas',
-    'i-deserve-it-all',
-    'i-direction',
-    'i-disks',
-    'i-don\'t-give-a-damn',
-    'i-don\'t-know-any-different',
-    'i-don\'t-know-how-many-years',
-    'i-don\'t-know-what-all',
     'i-e',
-    'i-forcibly-converted-the-world',
-    'i-girder',
-    'i-glutamate',
-    'i-going',
-    'i-have',
-    'i-hold-all-the-aces',
-    'i-hypersensitive',
-    'i-i-is',
-    'i-iia',
-    'i-iie',
-    'i-in-8',
-    'i-instruments',
-    'i-interpretation',
-    'i-iv-ii-iii',
-    'i-iv-iii-ii',
     'i-j',
-    'i-jibw',
-    'i-knew-the-great-man-personally',
-    'i-know-it-all',
-    'i-l-1',
-    'i-l-i-v-e',
-    'i-level',
-    'i-linked',
-    'i-listed',
-    'i-logix',
-    'i-love-her',
-    'i-mediated',
-    'i-menus',
-    'i-metaiodobenzylguanidine',
-    'i-n',
-    'i-narrators',
     'i-ness',
-    'i-never',
-    'i-not',
-    'i-now',
-    'i-o',
-    'i-only-paint',
-    'i-powered',
-    'i-preserve',
-    'i-preserves',
-    'i-pursue',
-    'i-pursues',
-    'i-radioimmunoassay',
-    'i-real',
-    'i-said',
-    'i-saw-it-all',
-    'i-show',
     'i-style',
-    'i-surface',
-    'i-sus',
-    'i-t',
-    'i-the',
-    'i-think',
-    'i-told-so-you-so',
-    'i-told-you-so',
-    'i-too',
-    'i-treated',
-    'i-tron',
-    'i-v-iv-iii',
-    'i-vi',
-    'i-vi-ii-v',
-    'i-view-you',
-    'i-wannabe-loved',
     'i-want-you-back',
-    'i-wb',
-    'i-will-do-anything-for-you',
-    'i-x',
-    'i-xiv',
-    'i-y',
-    'i-you',
-    'i.\'',
-    'i.-translation',
-    'i.0.0.0',
-    'i.1.2',
-    'i.112',
-    'i.114&ndash;15',
-    'i.115.1',
-    'i.13',
-    'i.138',
     'i.139',
-    'i.153',
-    'i.17',
-    'i.17.8',
-    'i.2-km',
-    'i.210',
-    'i.23',
-    'i.30',
-    'i.311',
-    'i.35',
-    'i.36',
-    'i.38',
-    'i.40',
-    'i.42',
-    'i.43',
-    'i.56',
     'i.58',
-    'i.5m',
-    'i.7',
-    'i.7.12',
-    'i.8',
-    'i.8.25',
-    'i.82',
-    'i.85',
-    'i.86',
-    'i.88',
-    'i._so',
-    'i.a.r.',
-    'i.a.s.b.',
-    'i.a.t',
-    'i.b.a.',
-    'i.b.e.c.',
     'i.b.s.c.',
-    'i.brierley',
-    'i.c.a.',
-    'i.c.c.',
-    'i.c.i.',
-    'i.c.l.',
-    'i.c.t.u.',
-    'i.d.c.',
-    'i.e&mdash;predicted',
-    'i.e-agricultural',
-    'i.e.&gt',
-    'i.e.&pound;21',
-    'i.e.1812.5',
-    'i.e.1825.0',
-    'i.e.30/40',
-    'i.e.two',
     'i.f.f.',
-    'i.f.p.',
-    'i.h',
-    'i.h.k.',
-    'i.i.',
-    'i.i.1',
-    'i.i.10',
-    'i.i.105&ndash;45',
-    'i.i.181',
-    'i.i.19&ndash;31',
-    'i.i.290ff',
-    'i.i.30&ndash;41',
-    'i.i.304ff.',
-    'i.i.48ff',
-    'i.ii.149',
-    'i.ii.195',
     'i.ii.281',
-    'i.ii.321ff.',
-    'i.ii.3ff',
-    'i.ii.65.66',
-    'i.iii.318ff.',
-    'i.iii.8&ndash;26',
-    'i.iv.13f',
-    'i.iv.47ff.',
-    'i.iv.9',
-    'i.j.',
-    'i.l.o.',
-    'i.m',
-    'i.m.16',
-    'i.m.2',
-    'i.m.5',
-    'i.m.f.',
     'i.m.s.',
-    'i.n.t.o',
-    'i.o.',
-    'i.o.b.',
-    'i.o.m.',
-    'i.o.w.',
-    'i.one',
-    'i.p',
-    'i.p.l.',
-    'i.redfern',
-    'i.s.a.',
-    'i.s.s.',
-    'i.sadowski',
-    'i.selvey',
-    'i.t.n.',
-    'i.the',
     'i.took',
-    'i.u.c.n.',
-    'i.u.d.',
-    'i.v.167ff',
-    'i.v.64ff',
-    'i/00/25/0001',
-    'i/00/26/0037',
-    'i/00/26/0052',
-    'i/01/23/0008',
-    'i/01/23/0010',
-    'i/01/23/0011',
-    'i/01/23/0012',
-    'i/01/23/0014',
-    'i/01/23/0015',
-    'i/01/23/0020',
-    'i/01/23/0021',
     'i/01/23/0026',
-    'i/2in',
-    'i/cs',
-    'i/ems',
-    'i/f',
-    'i/he',
-    'i/hpr',
-    'i/hydroxy',
-    'i/ii/iii',
-    'i/jg',
-    'i/kg',
-    'i/kpn',
-    'i/me',
-    'i/me/my',
-    'i/me/my/myself/mine',
-    'i/mpg',
     'i/ms',
-    'i/njg',
-    'i/r',
-    'i/s',
-    'i/she',
-    'i/shin',
-    'i/st.g',
-    'i/thou/she/he/',
-    'i/we/they',
-    'i/we/they/everybody',
-    'i/we/they/everybody/nobody',
-    'i00',
-    'i17',
-    'i17:1',
-    'i2128',
-    'i25,000',
     'i2c',
-    'i2r',
-    'i3,000',
-    'i3,800',
-    'i37',
-    'i4',
-    'i4,000',
-    'i44',
-    'i486sx',
-    'i4to',
-    'i50',
-    'i607',
-    'i7',
-    'i747',
-    'i750',
-    'i768',
     'i771',
-    'i775',
-    'i7ft',
-    'i7th',
-    'i820s',
-    'i860xp',
-    'i860xr-based',
-    'i87',
-    'i880\'s&mdash;two',
-    'i887',
-    'i890\'s',
-    'i892',
-    'i893',
-    'i8m',
-    'i8p',
-    'i906',
     'i908',
-    'i913',
-    'i930s',
-    'i935',
-    'i945',
-    'i948',
-    'i960-based',
-    'i960ca',
-    'i973',
-    'i976',
-    'i987',
-    'i993',
-    'i9s',
-    'i:27',
-    'i:30',
-    'i:58',
     'i:grain',
-    'i:x',
-    'i=1',
-    'i=160.0',
-    'i=e000-efff',
-    'i=if',
-    'i=in',
-    'i=n\'',
-    'i_',
-    'i_get_out_of',
-    'i_up',
-    'ia&scedil;i',
-    'iaa',
-    'iaaf/diet',
-    'iab',
-    'iabi',
     'iachr',
-    'iaco',
-    'iacomini',
-    'iacono',
-    'iacorossi',
-    'iacta',
-    'iaden',
-    'iades',
-    'iafc',
-    'iafei',
-    'iafrika',
-    'iaggard',
-    'iagifu-hedina',
-    'iahmandhas',
-    'iahs',
-    'iaian',
     'iak',
-    'ialia',
-    'ialign',
-    'iambus',
-    'iamids',
-    'iamos',
-    'iamperiales',
-    'ianatus',
-    'ianceolata',
-    'iane',
-    'ianke',
-    'iann',
-    'ianthi',
-    'ianugo',
-    'iao',
-    'iaokanann',
     'iap-66',
-    'iapi',
-    'iapx-',
-    'iapx-86-compatible',
-    'iapx-86-with-everything',
-    'iapx86-based',
-    'iapygians',
-    'iapyx',
-    'iarmarki',
-    'iaroslavl\'',
-    'iarrasen',
-    'iarreson',
-    'iarrived',
-    'ias/ras',
-    'iasc\'',
-    'iascone',
     'iata-sponsored',
-    'iate',
-    'iating',
-    'iatul',
-    'iau',
-    'iavoloha',
-    'ib&aacute&nacute;0ez',
-    'ib&aacute&ntilde;ez',
-    'iba&ntilde;ez-griffiths',
-    'iba-censored',
-    'ibag&eacute',
-    'iball/solicitor',
-    'ibambi',
-    'ibania',
-    'ibar',
-    'ibaragi',
     'ibas-at',
-    'ibayuense',
-    'ibberson',
-    'ibbo',
-    'ibbotdoghter',
-    'ibbott',
-    'ibby',
-    'ibdg',
-    'ibe',
-    'ibekwe',
-    'ibelieve',
-    'iberal-democracy',
-    'iberduero',
-    'ibereian',
-    'iberio&ndash;roman',
-    'ibeson',
     'ibew',
-    'ibfan',
-    'ibicenco',
-    'ibid.13',
-    'ibid.:106',
-    'ibid.:108',
-    'ibid.:1125',
-    'ibid.:199',
-    'ibid.:202',
-    'ibid.:204&ndash;5',
-    'ibid.:206',
-    'ibid.:207',
-    'ibid.:210&ndash;11',
-    'ibid.:211',
-    'ibid.:214&ndash;15',
-    'ibid.:231',
     'ibid.:237',
-    'ibid.:237&ndash;8',
-    'ibid.:239&ndash;40',
-    'ibid.:26',
-    'ibid.:260',
-    'ibid.:267',
-    'ibid.:28',
-    'ibid.:29',
-    'ibid.:317',
-    'ibid.:339',
-    'ibid.:39',
-    'ibid.:41',
-    'ibid.:43',
-    'ibid.:46',
-    'ibid.:51&ndash;2',
-    'ibid.:55',
     'ibid.:68&ndash;9',
-    'ibid.:70',
-    'ibid.:72',
-    'ibid.:74',
-    'ibid.:75',
-    'ibid.:8',
-    'ibid.:86',
-    'ibid.:90&ndash;1',
-    'ibid.p.25',
-    'ibizan',
-    'ibl',
-    'ible',
-    'ibm-apple-motorola',
-    'ibm-backed',
-    'ibm-based',
-    'ibm-blockbuster',
     'ibm-call',
-    'ibm-compatibles',
-    'ibm-dec-hewlett-packard',
-    'ibm-dedicated',
-    'ibm-designed',
-    'ibm-er',
-    'ibm-freak',
-    'ibm-hewlett',
-    'ibm-hp-sun',
-    'ibm-mitsubishi',
-    'ibm-only',
-    'ibm-oriented',
-    'ibm-powered',
-    'ibm-style',
-    'ibm-type',
-    'ibm/cms',
     'ibm/dec',
-    'ibm/hp',
-    'ibm/other',
-    'ibm/scottish',
-    'ibm1',
-    'ibmol',
-    'ibn\'',
-    'ibn-al-arabi',
-    'ibn-yussuf',
-    'ibo-land',
-    'ibold',
-    'ibotson',
-    'ibpf',
-    'ibragim',
-    'ibragimov',
-    'ibrahims',
     'ibrd&mdash;the',
-    'ibrehim',
-    'ibrillation',
-    'ibronectin',
-    'ibroxholm',
-    'ibsa',
-    'ibsey',
-    'ibt',
-    'ibuki',
-    'iburndale',
-    'ibusa',
-    'ibvm',
-    'ibw',
-    'ibx',
-    'ibykos',
-    'ibz',
     'ic-',
-    'ic08',
-    'ic125',
-    'ic3a',
-    'ic4a',
-    'ic4b',
-    'ic4c',
-    'ic4d',
-    'ica/mu',
-    'icable',
-    'icad/mx',
-    'ical',
-    'icam-1-',
-    'icam-1/lfa-1',
-    'icam-3-transfected',
-    'icam-igg1',
     'icapable',
-    'icarda-administered',
-    'icaricia',
-    'icarioides',
-    'icast',
-    'icazet',
-    'icbinb',
-    'icbt',
-    'icc-appointed',
-    'icc.',
-    'icc/rics',
-    'iccc',
-    'iccs',
-    'iccsa',
-    'icd7',
-    'icd9',
     'icdcs',
-    'ice&rehy;man',
-    'ice-ages',
-    'ice-and-rock',
-    'ice-balls',
-    'ice-bath',
-    'ice-block',
-    'ice-blocks',
-    'ice-boy',
-    'ice-breath',
-    'ice-brightness',
-    'ice-burned',
-    'ice-cave',
-    'ice-cavern',
-    'ice-caverns',
-    'ice-chilled',
     'ice-chips',
-    'ice-clear',
-    'ice-climbers',
-    'ice-coated',
-    'ice-container',
-    'ice-cores',
-    'ice-cracked',
-    'ice-cracking',
-    'ice-cream-seller',
-    'ice-creamer',
-    'ice-crystal',
-    'ice-cum-iron',
-    'ice-cut',
-    'ice-dagger',
-    'ice-dammed',
-    'ice-danced',
     'ice-dancer',
-    'ice-dancing',
-    'ice-dart',
-    'ice-drained',
-    'ice-eyed',
-    'ice-faces',
-    'ice-fall',
-    'ice-falls',
-    'ice-fisherman',
-    'ice-fishermen',
-    'ice-flow',
-    'ice-fluted',
-    'ice-ghosts',
-    'ice-glow',
-    'ice-green',
-    'ice-grey',
     'ice-gripped',
-    'ice-hard',
-    'ice-hardened',
-    'ice-induced',
-    'ice-infested',
-    'ice-layer',
-    'ice-legs',
-    'ice-lollies',
-    'ice-making',
-    'ice-margin',
-    'ice-melt',
-    'ice-melting',
-    'ice-of',
-    'ice-packed',
-    'ice-palace',
-    'ice-patrol',
     'ice-perfect',
-    'ice-pick-wielding',
-    'ice-piercing',
-    'ice-pudding',
-    'ice-racing',
-    'ice-rafted',
-    'ice-rimmed',
-    'ice-scratched',
-    'ice-shards',
-    'ice-sharp',
-    'ice-sheathed',
-    'ice-skaters',
-    'ice-skinned',
-    'ice-slick',
-    'ice-slicked',
-    'ice-storm',
     'ice-surrounded',
-    'ice-topped',
-    'ice-tv',
-    'ice-vellum',
-    'ice-wall',
-    'ice-water-steam',
-    'ice-water-water',
-    'ice-water.',
-    'ice-world',
-    'ice-wracked',
-    'iceberg-and-tombstone',
-    'iceberg-tip',
-    'iceblockbuster',
-    'icebreaking',
-    'icebreaking/getting',
-    'iceburgs',
     'icechim',
-    'icecore',
-    'icecube',
-    'iced-over',
-    'icefish',
-    'icefloe',
-    'icehouses',
-    'icelandic-knit',
-    'icelandics',
-    'icelands',
-    'icemen',
-    'icenian',
-    'iceniland',
-    'icepacks',
-    'icepick',
-    'icepick-wielding',
     'icerink',
-    'iceston',
-    'icetrax',
-    'iceworld',
-    'icey',
-    'icgb',
-    'ichabod\'',
-    'ichang',
-    'ichard',
-    'ichasel',
-    'ichbiah',
-    'icheme',
-    'ichihara',
-    'ichneumia',
-    'ichneumid',
-    'ichnofauna',
     'ichnographia',
-    'ichter',
-    'ichthyaetus',
-    'ichthyic',
-    'ichthyological',
-    'ichthyologists',
-    'ichthyosaurus',
-    'ichthyosauruses',
-    'ichthyostegid',
-    'ici\'s',
-    'ici-air',
-    'ici-developed',
-    'ici-farma',
-    'ici-manufactured',
-    'icic',
-    'icicle-festooned',
     'icif',
-    'icing-covered',
-    'icing-up',
-    'ickham',
-    'ickle-bitty',
-    'icl-based',
-    'icl-designed',
-    'icl-led',
-    'icl-owned',
-    'icl-siemens',
-    'icl-specific',
-    'icl-supplied',
-    'iclingas',
-    'icls',
-    'icmc',
-    'icoh',
     'icoms',
-    'icon-busting',
-    'icon-in-all-its-materiality',
-    'icon-like',
-    'icon-sized',
-    'icon-stencilled',
-    'icon-torching',
-    'icon/harpercollins',
-    'icon/mouse',
-    'icones',
-    'iconic-like',
-    'iconoclue',
-    'iconodulism',
-    'iconographies',
-    'iconography/mythology',
-    'iconophobes',
     'icontec',
-    'icorec',
-    'icosahedral',
-    'icp4-',
-    'icpc',
-    'icqs',
-    'icraf',
-    'icrf-yac',
-    'icrfcontig.tar.z',
-    'icrisat',
-    'icrp-26',
-    'icrp-29',
-    'ics205&ndash;930',
-    'icsh',
-    'icsis',
-    'icsltm',
     'icterids',
-    'icterohaemorrhagiae',
-    'icterus',
-    'icthyopthyirius',
-    'ictus',
-    'icuma',
-    'icut',
-    'icy-black',
-    'icy-blue',
-    'icy-cool',
-    'icy-eyed',
-    'icy-fresh',
-    'icy-handed',
-    'id&eacute;al',
-    'id&eacute;e',
-    'id&gt/continuous',
     'id\'',
-    'id-card',
-    'id-ego',
-    'id-ii',
-    'id-like',
-    'id/lp',
-    'id/product',
-    'id13,935,000',
-    'id14,704',
-    'id17,898',
-    'id1=us&dollar;1.4355',
-    'id4,000',
-    'id6,000',
-    'id6,600',
-    'id90',
-    'id=375s1',
     'ida.',
-    'ida820',
-    'idaea',
-    'idaeus',
-    'idag',
-    'idagnostic',
-    'idaian',
-    'idalian',
-    'idan',
-    'idar-oberstein',
-    'idas',
-    'idayu',
-    'idbf',
-    'idda',
-    'idder',
-    'iddesleigh',
     'iddles',
-    'iddon',
-    'iddy',
-    'ide/io',
-    'idea-centred',
-    'idea-finding',
-    'idea-hunts',
-    'idea-meme',
-    'idea-packed',
-    'idea-promotors',
-    'idea-rich',
-    'idea-seeking',
-    'idea-stimulating',
-    'idea-suppression',
-    'idea-thinking',
-    'idea/',
     'idea/judgement/conclusion',
-    'ideal-average',
-    'ideal-typically',
-    'idealisations',
-    'idealogically',
-    'idealogy',
-    'idealpolitik',
-    'ideaology',
-    'ideas-centred',
-    'ideas-controversies',
-    'ideas-factory',
-    'ideas-men',
-    'ideas-processors',
-    'ideas-related',
-    'ideas/experience',
-    'ideas/opinions',
     'idee_fixe',
-    'idelas',
-    'idella',
-    'idelnes',
-    'idely',
-    'idemnites',
-    'idempotent.',
-    'iden&rehy;tification',
-    'idendity',
-    'idenfied',
-    'idenitify',
-    'idenity',
-    'identi-kit',
-    'idential',
-    'identical-chain',
-    'identicals',
     'identics',
-    'identification-',
-    'identification/anticipation',
-    'identification/optimisation',
-    'identificationidentification',
-    'identified_by',
-    'identifiers.',
-    'identify&rehy;ing',
-    'identify/impose',
-    'identify/isolate',
-    'identify/optimise',
-    'identifyable',
-    'identifycorresponding',
-    'identique',
-    'identity-computation',
-    'identity-construction',
     'identity-crisis',
-    'identity-erasing',
-    'identity-perception',
-    'identity-shy',
-    'identity-the',
-    'identity/difference',
-    'identity_in',
-    'identityless',
-    'idents',
-    'identure',
-    'ideo-logic',
-    'ideog',
-    'ideologic',
-    'ideological-strategic',
-    'ideological/expressive',
-    'ideological/political',
     'ideological/psychological',
-    'ideological/symbolic',
-    'ideologically-armed',
-    'ideologically-based',
-    'ideologically-committed',
-    'ideologically-sound',
-    'ideologies/philosophies',
-    'ideologies/schemas',
-    'ideologised',
-    'ideologism',
-    'ideology\'',
-    'ideology-free',
-    'ideology-fulfilment',
-    'ideology-setting',
-    'ideology/',
-    'ideology/knowledge',
     'ideology/rational',
-    'ideots',
-    'ideval',
-    'idewe',
-    'idgah',
-    'idhaa',
-    'idhari',
-    'idi-their',
-    'idid',
-    'idiens',
-    'idignantly',
-    'idigo',
-    'idil',
-    'iding',
-    'idiographic',
-    'idiolects',
     'idiom-like',
-    'idioma',
-    'idiomatick',
-    'idiophones',
-    'idiosyncracy',
-    'idiosyncratic-',
-    'idiosyncreasy',
-    'idiot-proofing',
-    'idiota',
-    'idiotes',
-    'idiotic-sounding',
-    'idiotika',
-    'idiotism',
-    'idiotypes',
-    'idiq',
-    'idit',
     'idk',
-    'idle-itis',
-    'idle-seeming',
-    'idle-speed',
-    'idlenesse',
-    'idlike',
-    'idlitis',
-    'idmsx',
-    'idns',
-    'idoine',
-    'idol-adorned',
-    'idol-like',
-    'idol-loving',
-    'idol-manque',
-    'idolator',
-    'idolatrie',
     'idolatrously',
-    'idolisation',
-    'idolitus',
-    'idolo',
-    'idology',
-    'idoneus',
-    'idowa',
-    'idps',
-    'idress',
-    'idriart',
-    'idrigill',
-    'idrija',
-    'idrissi',
-    'idrissocial',
-    'idrocarburi&mdash;eni&mdash;national',
-    'idss',
     'idstal',
-    'idsworth',
-    'idu.kg',
-    'idul-zuha',
-    'idumean',
-    'idundun',
-    'iduns',
-    'idurd',
-    'idus.',
-    'idw',
-    'idyillic',
-    'idyl',
-    'idzhevan',
-    'ie-ei',
-    'ie-iie',
-    'ie.e.',
     'ie3',
-    'ieast',
-    'iec-17',
-    'iec-6',
-    'ieccs',
-    'ieee.488',
-    'ieee.tif',
-    'ield',
-    'ields',
-    'ienjoy',
-    'iep',
-    'iepg',
-    'ieprc',
-    'ieprosula',
-    'ier/insee',
-    'ierei',
     'ieru',
-    'ieruru',
-    'ierusalem-ward',
-    'iesum',
-    'ietto-gillies',
-    'iewa',
-    'if&mdash',
-    'if-clause',
-    'if-convincing',
-    'if-i',
-    'if-in',
-    'if-ness',
-    'if-they',
-    'if-we-sold-our-suburban-villa-we-could-buy-a-georgian-manor-house-in-the-country',
-    'if-you-don\'t-die-in-the-first-year-you\'ll-have-made-it',
-    'if-you-get-there-before-me-go-in-and-get-on-with-something',
     'if.',
-    'if/unless',
-    'if_at',
-    'if_instead',
-    'if_it\'s_more_than_a_few',
-    'ifaluk',
-    'ifano',
-    'ifapa',
-    'ifca',
-    'ifestos',
-    'iffa',
-    'ifference',
-    'iffiness',
-    'ifield.',
-    'ifill',
-    'ifis',
     'ifkairin',
-    'iflo',
-    'ifn-&bgr',
-    'ifn-&ggr;-mediated',
-    'ifn-&ggr;increased',
-    'ifn-2a',
-    'ifns',
-    'ifoam',
-    'ifold',
-    'ifop',
-    'ifp1',
-    'ifr-capable',
-    'ifremer',
-    'ifsa',
-    'ifsc',
-    'ifst',
     'ifthat',
-    'iftikar',
-    'ifton',
-    'iftr',
-    'ifut',
-    'ifx',
-    'ifzal',
-    'ig-c',
-    'ig-fl',
-    'ig/ebp',
-    'ig1',
-    'ig28',
-    'ig6',
-    'iga-ancas',
-    'iga-angigliadin',
-    'iga-antigliadin',
     'iga.',
-    'iga/g/m',
-    'igalo',
-    'igarashi',
-    'igartua',
-    'igation',
-    'igbineghu',
-    'igc:sipro',
-    'igedo',
-    'igen',
-    'iges',
-    'igf',
-    'igf-i/ml',
-    'igf1r',
-    'igfbp',
-    'igg+igm',
     'igg-binding',
-    'igg-cell',
-    'igg-producing',
-    'igg-sepharose',
-    'igg-subclass',
-    'iggfc',
-    'iggins',
-    'iggly',
-    'iggt',
-    'iggulden',
-    'iggy-mimicking',
-    'igla',
-    'iglau',
-    'iglesden',
-    'igloolik',
-    'iglu',
     'igluk',
-    'iglulik',
-    'iglut',
-    'igly',
-    'ignacy',
-    'ignalia',
-    'ignarro',
-    'ignas',
-    'ignatienko',
-    'ignatiev',
-    'ignatious',
-    'ignatov',
-    'ignatovicz',
-    'ignaty',
-    'ignenor',
-    'igneous-textured',
     'ignesti',
-    'ignigraphs',
-    'ignimbritic',
-    'ignita',
-    'ignitability',
-    'ignition-boosting',
-    'ignition.',
-    'ignitor',
-    'ignobility',
-    'ignominous',
-    'ignomminious',
-    'ignorance\'',
-    'ignorance.',
-    'ignorance/failure',
-    'ignorances',
-    'ignorant\'',
     'ignorant-sounding',
-    'ignorantia',
-    'ignorants',
-    'ignored.',
-    'ignored.this',
-    'ignorin\'',
-    'ignose',
-    'ignotum',
-    'ignu',
-    'igo',
-    'igorevich',
-    'igors',
-    'igr',
-    'igrayne',
-    'igried',
-    'igtham',
     'igu',
-    'igua&ccedil;u',
-    'iguales',
-    'iguana-like',
-    'iguanadon',
-    'iguanodons',
-    'iguanodontids',
-    'iguanoids',
-    'igx6',
-    'ih35',
-    'iham',
-    'ihan',
-    'iharour-lascagne',
-    'iharran',
-    'ihe',
-    'iheringi',
     'ihf',
-    'ihibit',
-    'ihigher',
-    'ihihe',
-    'ihnen',
-    'ihnto',
-    'iholdy',
-    'ihon',
-    'ihope',
-    'ihp',
-    'ihren',
-    'ihrer',
-    'ii&ndash;iii',
-    'ii\'',
-    'ii(a)',
-    'ii(b)',
     'ii(c)',
-    'ii(d)',
-    'ii(f)',
-    'ii(i)',
-    'ii(ii)',
-    'ii+',
-    'ii-',
-    'ii-103',
-    'ii-28',
-    'ii-62',
-    'ii-c',
-    'ii-compliant',
-    'ii-conforming',
-    'ii-depleted',
-    'ii-expressing',
-    'ii-ii-ii-ii',
     'ii-restricted',
-    'ii-type',
-    'ii-v',
-    'ii-v-i',
-    'ii-v-i-iv-vii-iii-vi-vi',
-    'ii-v-ii-v',
-    'ii.1&ndash;67',
-    'ii.129',
-    'ii.19',
-    'ii.2.a',
-    'ii.21',
-    'ii.3.36',
-    'ii.3.4',
-    'ii.30',
-    'ii.39',
-    'ii.4',
     'ii.4.30',
-    'ii.45',
-    'ii.50&ndash;60',
-    'ii.55',
-    'ii.6',
-    'ii.60',
-    'ii.61',
-    'ii.65',
-    'ii.7',
-    'ii.8',
-    'ii.97',
-    'ii.c.',
-    'ii.c.236',
-    'ii.i.107&ndash;16',
-    'ii.i.150',
-    'ii.i.245ff',
     'ii.i.261',
-    'ii.i.285ff',
-    'ii.i.2ff',
-    'ii.i.306',
-    'ii.i.45',
-    'ii.i.55f.',
-    'ii.i5',
-    'ii.ii.1&ndash;17',
-    'ii.ii.104ff.',
-    'ii.ii.189',
-    'ii.ii.43ff.',
-    'ii.ii.67f.',
-    'ii.iii',
-    'ii.iii.20',
-    'ii.iii.202f',
-    'ii.iii.332ff.',
     'ii.iii.48f.',
-    'ii.iii.58ff.',
-    'ii.iii.6',
-    'ii.iii.6&ndash;36',
-    'ii.iii.65',
-    'ii.iii.69f',
-    'ii.iii.86ff',
-    'ii.iii.9ff',
-    'ii.iv.260ff.',
-    'ii.iv.41ff',
-    'ii.iv.42',
-    'ii.iv.506',
-    'ii.iv.6f',
-    'ii.v.',
-    'ii/',
-    'ii/funky',
     'ii/marrakesh',
-    'ii/v',
-    'ii/vi',
-    'ii/viii',
-    'ii21204',
-    'ii514',
-    'ii:1',
-    'ii:20',
-    'ii:42',
-    'ii:disconformable',
-    'iia.1',
-    'iia.3',
-    'iia1',
-    'iiand',
-    'iic.1',
-    'iic.2',
     'iic.3',
-    'iic.4',
-    'iic.5',
-    'iic.6',
-    'iic.7',
-    'iicldn',
-    'iid',
-    'iifestyle',
-    'iifx',
-    'iii&ndash;iv',
-    'iii(a)',
-    'iii(e)',
-    'iii-',
-    'iii-depth',
-    'iii-like',
-    'iii-service',
     'iii-vi',
-    'iii-vs',
-    'iii.1',
-    'iii.11',
-    'iii.284',
-    'iii.3',
-    'iii.302',
-    'iii.41',
-    'iii.45.6',
-    'iii.55',
-    'iii.60',
-    'iii.82',
-    'iii.86ff',
-    'iii.89ff.',
-    'iii.91',
-    'iii.94',
     'iii.a.',
-    'iii.i',
-    'iii.i.11&ndash;38',
-    'iii.i.39f',
-    'iii.i.73&ndash;139',
-    'iii.i.90',
-    'iii.ii.10ff.',
-    'iii.ii.122&ndash;3',
-    'iii.ii.270',
-    'iii.ii.36&ndash;55',
-    'iii.ii.39&ndash;59',
-    'iii.ii.46',
-    'iii.iii',
-    'iii.iii.110ff',
-    'iii.iii.199ff.',
-    'iii.iii.320ff',
     'iii.iii.3ff.',
-    'iii.iv.',
-    'iii.iv.34',
-    'iii.iv.40ff',
-    'iii.iv.51',
-    'iii.iv.80',
-    'iii.iv.81ff',
-    'iii.v.',
-    'iii.v.2ff',
-    'iii.vi.20&ndash;60',
-    'iii.vi.78f.',
-    'iii.vi.92ff',
-    'iii.vii.6ff.',
-    'iii/6',
-    'iii/jg27.',
-    'iii/lg',
     'iii/st.g',
-    'iii:34',
-    'iiid',
-    'iiiia',
-    'iiiid.',
-    'iiijli',
-    'iiim3',
-    'iiis.',
-    'iijde',
-    'iino',
-    'iiq',
-    'iirs-recommended',
-    'iisaka',
-    'iisc',
-    'iisi',
-    'iittle',
     'iix',
-    'iixxx',
-    'ija',
-    'ija-mi',
-    'ijafen',
-    'ijape',
-    'ijaza',
-    'ijb',
-    'ije',
-    'ijebu',
-    'ijlal',
-    'ijo',
-    'ijssel',
-    'ijuin',
-    'ikaga',
-    'ikari',
     'ikaria',
-    'ikaros',
-    'ikatan',
-    'ikats',
-    'ikatus',
-    'ikb',
-    'ike-horn-nia',
-    'ikeda-type',
-    'ikeja',
-    'ikely',
-    'ikem',
-    'ikes',
-    'ikettes',
-    'ikeya-seki',
-    'ikhtiyar',
-    'ikhwan-e',
     'ikhwan-ul-muslameen',
-    'ikibin-e',
-    'ikimi',
-    'ikkan',
-    'ikke',
-    'ikkyu',
-    'ikl&eacute',
-    'ikontanyi',
-    'ikot',
-    'ikp',
-    'ikrikrrikrrrkrrr',
-    'ikt&iacute;0nos',
-    'iktinos-roof',
-    'ikts',
-    'ikuo',
-    'il&rehy;luminate',
     'il&rehy;sung',
-    'il-103s',
-    'il-11',
-    'il-29',
-    'il-3',
-    'il-6-dbp/nf-il6',
-    'il-6-dbp/nf-il6&bgr',
-    'il-6dbp-tag',
-    'il-6re-cat',
-    'il-76',
-    'il-bandu',
-    'il-maltija',
-    'il-parata',
-    'il-sing',
-    'il.00',
-    'il1',
     'il2r',
-    'il6',
-    'ila\'l-amam',
-    'ila-speaking',
-    'ilahi',
-    'ilake',
-    'ilako',
-    'ilal',
-    'ilala',
-    'ilamp',
-    'ilande',
-    'ilanga',
-    'ilantrisant',
-    'ilarrio',
-    'ilbarritz',
-    'ilborough',
     'ilcester',
-    'ildis/chapman',
-    'ildkjmsvskirgqnbxtyuollkhwtps',
-    'ile-compatible',
-    'ile/c400',
-    'ile/cobol',
-    'ile/rpg400',
-    'ile/val-his-cys-x-ala-gly-x-x-arg',
-    'ile57',
-    'ileapcl',
-    'ileilitis',
-    'ileitis/colitis',
-    'ilene',
-    'ileo',
-    'ileo-anal',
-    'ileoanastomosis',
     'ileocecal',
-    'ileocoecal',
-    'ileocolectomy',
-    'ileocolonoscopic',
-    'ileoscopy',
-    'ileosigmoidostomy',
-    'ileostom',
-    'ileostomists',
-    'ileotomy',
-    'ileovesical',
-    'ilersic',
-    'ilesostomy',
-    'ileu',
-    'ileum&gt;caecum&gt;distal',
-    'ileums',
-    'ilfc',
     'ilford/romford',
-    'ilfracombe.six',
-    'ilgfvftltv',
-    'ilham',
-    'ilhan',
-    'ilhu',
-    'iliads',
-    'ilias.',
-    'ilicis',
-    'iliction',
-    'ilien',
-    'iliev',
-    'ilijaz',
-    'ilim',
-    'ilion',
-    'ilirida',
     'ilissa',
-    'ilissus',
-    'ility',
-    'iliushin',
-    'ilivewithmyparentsandmylittlesistershe\'sonly',
-    'ilk\'',
-    'ilker',
-    'ilkere',
-    'ilketshall',
-    'ilkin',
-    'ilko',
-    'ilks',
-    'ill&rehy;defined',
-    'ill&rehy;dressed',
-    'ill&rehy;fed',
-    'ill&rehy;formed',
     'ill&rehy;health',
-    'ill&rehy;humour',
-    'ill&rehy;placed',
-    'ill&rehy;printed',
-    'ill&rehy;suited',
-    'ill&rehy;trained',
-    'ill-adjusted',
-    'ill-advice',
-    'ill-afforded',
-    'ill-aimed',
-    'ill-applied',
-    'ill-appreciated',
-    'ill-argued',
-    'ill-arranged',
-    'ill-assortedly',
-    'ill-assortment',
     'ill-at&rehy;ease',
-    'ill-becoming',
-    'ill-befits',
-    'ill-befitting',
-    'ill-built',
-    'ill-camouflaged',
-    'ill-centralised',
-    'ill-chartered',
-    'ill-colonized',
-    'ill-complexioned',
-    'ill-contained',
-    'ill-curtained',
-    'ill-cut',
-    'ill-decorated',
-    'ill-definedness',
-    'ill-deserved',
     'ill-documented',
-    'ill-done',
-    'ill-done-by',
-    'ill-earned',
-    'ill-ease',
-    'ill-endowed',
-    'ill-explained',
-    'ill-expressed',
-    'ill-fare',
-    'ill-favour',
-    'ill-feelings',
-    'ill-focussed',
-    'ill-formulated',
-    'ill-fortuned',
-    'ill-fortunes',
-    'ill-furnished',
     'ill-glimpsed',
-    'ill-groomed',
-    'ill-heath',
-    'ill-informedly',
-    'ill-justified',
-    'ill-life',
-    'ill-lighted',
-    'ill-lookingness',
-    'ill-looks',
-    'ill-loved',
-    'ill-managed',
-    'ill-manneredly',
-    'ill-matchedly',
-    'ill-named',
-    'ill-nature',
-    'ill-observed',
     'ill-omens',
-    'ill-ordered',
-    'ill-painted',
-    'ill-paved',
-    'ill-perforated',
-    'ill-performed',
-    'ill-planning',
-    'ill-powdered',
-    'ill-preparedness',
-    'ill-presented',
-    'ill-preserved',
-    'ill-programmed',
-    'ill-proportioned',
-    'ill-publicised',
-    'ill-punctuated',
-    'ill-rained',
     'ill-read',
-    'ill-reason',
-    'ill-recalled',
-    'ill-regarded',
-    'ill-rehearsed',
-    'ill-relationship',
-    'ill-remembered',
-    'ill-repair',
-    'ill-repaired',
-    'ill-reputation',
-    'ill-resourced',
-    'ill-secured',
-    'ill-seized',
-    'ill-shapen',
-    'ill-shapes',
-    'ill-shaved',
     'ill-shod',
-    'ill-sited',
-    'ill-sprung',
-    'ill-started',
-    'ill-structured',
-    'ill-supervised',
-    'ill-supplied',
-    'ill-temperedly',
-    'ill-tended',
-    'ill-termed',
-    'ill-tested',
-    'ill-tuned',
-    'ill-united',
-    'ill-usage',
-    'ill-wind',
-    'ill-writers',
     'ill/dying/dead/refusing',
-    'ill/suffering/too',
-    'ill/zg26',
-    'illah',
-    'illampu',
-    'illative',
-    'illau',
-    'illbred',
-    'illdoer',
-    'ille-et-vilaine',
-    'illeana',
-    'illegal-raves',
-    'illegality.',
-    'illegally-applied',
-    'illegally-felled',
-    'illegally-imported',
     'illegally-made',
-    'illegally-obtained',
-    'illegally-seized',
-    'illegally-smoked',
-    'illegally-sold',
-    'illegally.',
-    'illegibly',
-    'illegits',
-    'illescas',
-    'illest',
-    'illfitting',
-    'illfocused',
-    'illgill',
-    'illh&auml;usern',
-    'illhealth',
-    'illiad',
     'illiberally',
-    'illich-style',
-    'illicitness',
-    'illicits',
-    'illima',
-    'illimania',
-    'illingwoth',
-    'illinios',
-    'illions',
-    'illiquidous',
-    'illis',
-    'illite-chlorite-mixed',
-    'illite-smectites',
-    'illiterations',
-    'illites',
-    'illius',
     'illkeston',
-    'illlustrates',
-    'illmoka',
-    'illness(es)',
-    'illness-focused',
-    'illness-free',
-    'illness-proneness',
-    'illness.but',
-    'illocutions',
-    'illom',
-    'ills.',
-    'illsley/british',
-    'illsley/network',
-    'illu',
-    'illudere',
-    'illum',
     'illuminant',
-    'illuminants',
-    'illuminarc',
-    'illumination.this',
-    'illuminatus',
-    'illuminist',
-    'illuminous',
-    'illuminted',
-    'illus.11',
-    'illus.12,13',
-    'illus.13',
-    'illus.13,15',
-    'illus.14',
-    'illus.2,13',
-    'illus.2,3',
-    'illus.3a',
     'illus.3b',
-    'illus.3c',
-    'illus.4,6',
-    'illus.5a',
-    'illus.5b',
-    'illus.6',
-    'illus.7',
-    'illus.8',
-    'illus.9',
-    'illus.s',
-    'illusian',
-    'illusion\'',
-    'illusion-ridden',
-    'illusionary',
-    'illusioned',
-    'illusionisms',
     'illusions.',
-    'illusn',
-    'illusorily',
-    'illusoriness',
-    'illust.',
-    'illustra',
-    'illustra&rehy;tions',
-    'illustrate_in',
-    'illustrated.',
-    'illustration-birds',
-    'illustration.',
-    'illustrations.',
-    'illustrations/dick',
-    'illustrator-designer',
-    'illustribus',
-    'illustris',
     'illustrissimus',
-    'illuviated',
-    'illuyshin',
-    'illwritten',
-    'illy',
-    'illya',
-    'illych',
-    'illyriae',
-    'illyrian-greeks',
-    'ilmarinen',
-    'ilmatar',
-    'ilmenite-',
-    'ilmenites',
-    'ilmington',
-    'ilmiye',
-    'ilmo',
     'ilo-puerto',
-    'ilo/unctc',
-    'ilok',
-    'ilorin',
-    'ilors',
-    'ilosway',
-    'ilott/national',
-    'ilp.6',
-    'ils/dme',
-    'ils/elles',
-    'ilshat',
-    'ilso',
-    'iltifat',
-    'iltizam',
-    'ilton',
-    'iltr',
     'iltutmish',
-    'ilu/hectare',
-    'ilukamba',
-    'ilunga',
-    'iluro',
-    'ilustre',
-    'ilva',
-    'ilwiiin',
-    'ily',
-    'ilyichev',
-    'ilyitch',
-    'ilyocryptus',
-    'ilyukhin',
-    'ilyushin-14',
-    'ilyusoin',
-    'im&rehy;mediacy',
     'im&rehy;mediate',
-    'im&rehy;mediately',
-    'im&rehy;mersed',
-    'im&rehy;mersion',
-    'im&rehy;moveable',
-    'im&rehy;pending',
-    'im&rehy;permanent',
-    'im&rehy;poverished',
-    'im\'port',
-    'im\'porters',
-    'im-',
-    'im-imagine',
-    'im-ports',
-    'im0161',
-    'im9',
-    'imabol',
     'imachar',
-    'imacon',
-    'imaculate',
-    'imadi',
-    'imag',
-    'imag&rehy;inary',
-    'imag&rehy;ining',
-    'imag(in)e',
-    'imagaic',
-    'imagative',
-    'image-above-all-else',
-    'image-battering',
-    'image-blocker',
-    'image-breaker\'',
-    'image-breakers',
-    'image-breaking',
     'image-builder',
-    'image-concept',
-    'image-conjuring',
-    'image-construction',
-    'image-created',
-    'image-data',
-    'image-denting',
-    'image-enhanced',
-    'image-erected',
-    'image-generator',
-    'image-handling',
-    'image-led',
-    'image-music-text',
-    'image-producing',
-    'image-projection',
-    'image-projector',
     'image-ridden',
-    'image-sensor',
-    'image-songs',
-    'image-space',
-    'image-style',
-    'image-to-map',
-    'image-understanding',
-    'image/central',
-    'imagecd',
-    'imagemaker',
-    'imagemakers',
-    'imageries',
-    'images.h.h',
-    'images/',
-    'images/drawings',
-    'imagesoft',
     'imagesync',
-    'imagevideo',
-    'imagewise',
-    'imagina',
-    'imaginarius',
-    'imagination\'',
-    'imagination-an',
-    'imagination-but',
-    'imagination-content',
-    'imagination-free',
-    'imaginative/imitative',
-    'imaginatively-designed',
-    'imaginatively-named',
-    'imaginator',
-    'imagine-quite',
-    'imagined\'',
     'imagined-could',
-    'imagineer',
-    'imagineered',
-    'imagineering',
-    'imagineless',
-    'imaginery',
-    'imaging/forms',
-    'imagings',
-    'imagione',
-    'imagiste',
-    'imah',
-    'imaichi',
-    'imajical',
-    'imamate',
-    'imamura',
-    'imanage',
     'imanan',
-    'imani',
-    'imap',
-    'imapred',
-    'imara',
-    'imari',
-    'imass',
-    'imassable',
-    'imazapyr',
-    'imb&egrave;ciles',
-    'imb-pc',
-    'imbaba',
-    'imbalancing',
-    'imbalming',
-    'imbecilically',
-    'imbecilities',
     'imbecillus',
-    'imbed',
-    'imbedding',
-    'imbens',
-    'imbibes',
-    'imbibition',
-    'imbit',
-    'imbrication',
-    'imbricatum',
-    'imbrodered',
-    'imbros',
-    'imbrown',
-    'imbrute',
-    'imbuya',
-    'imcera',
-    'imcot',
     'imcumber',
-    'imcv',
-    'imd',
-    'imda',
-    'imeand',
-    'imede',
-    'imediately',
-    'imergence',
-    'imf-',
-    'imf-dictated',
-    'imf-inspired',
-    'imf-monitored',
-    'imf-sponsored',
-    'imflammatory',
-    'imgination',
-    'imgt',
     'imidazole-hcl',
-    'imidazoline',
-    'imigram',
-    'imin',
-    'imino-aromatic',
-    'imino-gh8',
-    'imipenem',
-    'imis',
-    'imisp',
-    'imitability',
-    'imitated/accommodated',
-    'imitatio',
-    'imitation-coal',
-    'imitation-leather',
-    'imitation-log',
-    'imitational',
     'imitationem',
-    'imitativeness',
-    'imitutio',
-    'imix',
-    'imix\'',
-    'imjin/south',
-    'iml-1',
-    'imladrik',
-    'imm&eacute;diats',
-    'immaculately-dressed',
-    'immaculately-jointed',
-    'immaculately-prepared',
-    'immaculately-trained',
-    'immaculateness',
-    'immanentist',
-    'immanu-all',
     'immanu-el',
-    'immanu-hell',
-    'immaterial.',
-    'immaterially',
-    'immatura',
-    'immdiate',
-    'immedately',
-    'immediacies',
-    'immediamente',
-    'immediat',
-    'immediate-interest',
-    'immediate-term',
-    'immediate-type',
-    'immediate/delayed',
-    'immediately-as',
-    'immediately-became',
     'immediately-obvious',
-    'immediately.',
-    'immediates',
-    'immediatist',
-    'immeding',
-    'immemorabilia',
-    'immemorably',
-    'immemorial-how',
-    'immendorff',
-    'immense-changes',
-    'immensee',
-    'immenseley',
-    'immensely-detailed',
-    'immenseness',
-    'immensley',
-    'immenstadt',
     'immerses',
-    'immersible',
-    'immersion-in-myth',
-    'immersions',
-    'immi&rehy;grants',
-    'immigrant-based',
-    'immigration.',
-    'immin-',
-    'imminence-awareness',
-    'imminent&mdash;if',
-    'imminents',
-    'immingham-based',
-    'immingrants',
-    'imminient',
-    'immiserated',
-    'immiserization',
     'immiserized',
-    'immiserizing',
-    'immmediate',
-    'immmediately',
-    'immnsely',
-    'immo',
-    'immobili',
-    'immobilieres',
-    'immobilisers',
-    'immobilistes',
-    'immobilizing',
-    'immoderation',
-    'immonoregulation',
-    'immonuments',
-    'immor',
-    'immoralism',
     'immoralists',
-    'immortale',
-    'immortalisation',
-    'immortalists',
-    'immortalitate',
-    'immortality/consumes',
-    'immortally-spoken',
-    'immortlaised',
-    'immotile',
-    'immoveables',
-    'immravax',
-    'immunage',
-    'immunblot',
-    'immunblotting',
-    'immune-based',
-    'immune-deficiency',
     'immune-directed',
-    'immune-driven',
-    'immune-mediated',
-    'immune-system',
-    'immunelytic',
-    'immuniser',
-    'immunities49',
-    'immunity.',
-    'immunizable',
-    'immuno-alkaline',
-    'immuno-histochemical',
-    'immuno-histochemistry',
-    'immuno-parasitology',
-    'immuno-precipitating',
-    'immuno-precipitations',
-    'immuno-suppressed',
     'immuno-suppression',
-    'immuno-suppressive',
-    'immunoabsorbants',
-    'immunoabsorbed',
-    'immunoabsorption',
-    'immunoadsorbant-purified',
-    'immunoalkaline-phosphatase',
-    'immunoallergic',
-    'immunobiology',
-    'immunoblastic',
-    'immunocompetence',
-    'immunocrossreactivity',
-    'immunocyochemistry',
-    'immunocyte',
-    'immunocytochemically',
-    'immunodeficiency-related',
     'immunodeficient',
-    'immunodeiciency',
-    'immunodepressants',
-    'immunodiagnostic',
-    'immunoeactivity',
-    'immunoefficiency',
-    'immunoelectrophoresis',
-    'immunofuorescence',
-    'immunohaematological',
-    'immunohaematology',
-    'immunohistochenically',
-    'immunologial',
-    'immunologically-important',
-    'immunometric',
-    'immunomodulator',
-    'immunonegative',
     'immunonuclear',
-    'immunopanning',
-    'immunopathogenesis',
-    'immunophenotype',
-    'immunophenotypes',
-    'immunophenotyping',
-    'immunophilin',
-    'immunoplates',
-    'immunoprecipiated',
-    'immunoprecipitating',
-    'immunoprecipitations',
-    'immunoradiometry',
-    'immunoreactively',
-    'immunoreactivities',
-    'immunoscintigraphy',
-    'immunosensing',
     'immunosobent',
-    'immunosorbant',
-    'immunospot',
-    'immunostimulation',
-    'immunosuppressive/cytotoxic',
-    'immunosupressant',
-    'immunoturbidimetric',
-    'immunouorescent',
-    'immurement',
-    'immuring',
-    'imnpact',
-    'imo&mdash;of',
-    'imodibie',
-    'imogene',
-    'imoli',
-    'imondi/cannon',
     'imosa',
-    'imossi',
-    'imosters',
-    'imouzzer-des-ida-ou-tanane',
-    'imp&eacute;ratives',
-    'imp&eacute;rial',
-    'imp&eacute;rieuse',
-    'imp&ocirc;t',
-    'imp.',
-    'impact&mdash;most',
-    'impact-',
-    'impact-analysis',
-    'impact-deterioration',
-    'impact-disruption',
-    'impact-fragments',
-    'impact-resistant',
     'impact/change',
-    'impactation',
-    'impactive',
-    'impairement',
-    'impairment-as-flaw',
-    'impairment/disability/handicap',
-    'impalas',
-    'impales',
-    'impanelling',
-    'impannelled',
-    'impark',
-    'imparked',
-    'impart.this',
-    'impartation',
-    'imparter',
-    'impartiality.',
     'impassionately',
-    'impavotoninvs-pius',
-    'impeachments',
-    'impec',
-    'impeccably-dressed',
-    'impeccably-mannered',
-    'impecunias',
-    'impedance-matching',
-    'impediment-free',
-    'impedimentae',
-    'impedimentia',
-    'impedit',
-    'impellent',
-    'impementations',
-    'impen',
-    'impeneterable',
     'impenitence',
-    'impenitently',
-    'impennis',
-    'impera',
-    'imperasset',
-    'imperatii',
-    'imperativeness',
-    'imperatore',
-    'imperatorii',
-    'imperatorum',
-    'imperatriz',
-    'imperceptiveness',
-    'impercipience',
-    'impercipient',
-    'imperfectionist-minded',
-    'imperfections.',
     'imperfective',
-    'imperfectness',
-    'imperforate',
-    'imperial-insular',
-    'imperial-metric',
-    'imperial-minded',
-    'imperial-provincial',
-    'imperiales',
-    'imperialis',
-    'imperialised',
-    'imperialized',
-    'imperialness',
-    'imperialorum',
-    'imperiled',
-    'imperio',
-    'imperious-looking',
     'imperishably',
-    'impermanently',
-    'impermeably',
-    'impersonalised',
-    'impersonalized',
-    'impertinencies',
-    'impet',
-    'impetiginosa',
-    'impetoygo',
-    'impetu',
-    'impetus&mdash;is',
-    'impetuses',
-    'impfen',
-    'impgoth',
-    'impianti',
-    'impington',
     'impire',
-    'impitoyables',
-    'impl',
-    'implant.',
-    'implant.the',
-    'implantations',
-    'implausible-sounding',
-    'imple&rehy;mentation',
-    'implemation',
-    'implement-maker',
-    'implementation&rehy;would',
-    'implementation(s)',
-    'implementation.',
-    'implementation.e',
-    'implementation/repair',
-    'implementaton',
     'implementiong',
-    'implemt',
-    'implication.',
-    'implicationally',
-    'implications.',
-    'implications_even',
-    'implicative',
-    'implicatory',
-    'implicit-versus-explicit',
-    'implima',
-    'implimenting',
-    'impliments',
-    'impliqu&eacute',
-    'implix',
-    'implorings',
-    'imployment',
     'impluvia',
-    'implye',
-    'implyin\'',
-    'impney',
-    'impoi',
-    'imponderous',
-    'impor-tant',
-    'imporant',
-    'imporoved',
-    'import-competing',
-    'import-demand',
-    'import-dependence',
-    'import-dependent',
-    'import-hostile',
-    'import-led',
-    'import-licensing',
     'import-limitation',
-    'import-replacing',
-    'import-sensitive',
-    'import-substitutes',
-    'import-substituting',
-    'import-target',
-    'import/editing',
-    'importable',
-    'important-',
-    'important--eg',
-    'important-if',
-    'important-ly',
-    'important-sounding',
-    'important/damaging',
-    'important/powerful',
-    'importantactors',
     'importantes',
-    'importanti',
-    'importer/distributor',
-    'importing.',
-    'importing/consuming',
-    'imports&mdash&dollar;3,200',
-    'importunacy',
-    'imporve',
-    'impos',
-    'imposer',
-    'imposers',
-    'imposing.',
-    'imposs',
-    'impossibilism',
-    'impossibilist',
-    'impossible&mdash;to',
     'impossible-looking',
-    'impossible-sounding',
-    'impossible-to-answer',
-    'impossible-to-be-otherwise',
-    'impossible-to-contemplate',
-    'impossible-to-define',
-    'impossible-to-ignore',
-    'impossible-to-stop-humming',
-    'impossible.',
-    'impossible.and',
-    'impossible/not',
-    'impossible:st',
-    'impossibly-balanced',
-    'impostant',
-    'impotant',
-    'impotence.he',
     'impots',
-    'impounds',
-    'impportant',
-    'impracticable&mdash;but',
-    'impracticable.',
-    'impracticably',
-    'impracticalities',
-    'impratical',
-    'impre',
-    'imprecated',
-    'imprecatives',
-    'impredictability',
-    'impregnates',
-    'impregnator',
-    'impresa',
-    'impresive',
     'impress-ship',
-    'impressario',
-    'impressarios',
-    'impressd',
-    'impressionableness',
-    'impressionisms',
-    'impressionist-dominated',
-    'impressionist-style',
-    'impressioun',
-    'impressively-dressed',
-    'impressively-mounted',
-    'impressively-named',
-    'imprevisable',
-    'impreza',
-    'imprim&eacute',
-    'imprimateur',
     'imprimature',
-    'imprimeries',
-    'imprimit',
-    'imprintable',
-    'impris&rehy;oned',
-    'imprisoned.',
-    'imprizoned',
-    'improbable-looking',
-    'improbables',
-    'improbably-garbed',
-    'improbity',
-    'impromtu',
-    'impromtue',
-    'improperly.',
-    'improperness',
-    'impropriated',
     'impropriety.',
-    'improtant',
-    'improuvd',
-    'improvable',
-    'improval',
-    'improvance',
-    'improved\'',
-    'improved-cage',
-    'improved/new',
-    'improvemenh',
-    'improvement&mdash;up',
-    'improvement-grant',
-    'improvement/small',
-    'improvement_in',
-    'improvements.',
-    'improvements/results',
     'improvide',
-    'improvidently',
-    'improvisation-based',
-    'improvisation/funnychappyness',
-    'improvisationally',
-    'improvisatrice',
-    'improvision',
-    'improviso',
-    'improvisors',
-    'improvisory',
-    'improvizations',
-    'improvizing',
-    'improvment',
-    'improvments',
-    'improvviso',
-    'impudicity',
     'impulse-buying',
-    'impulse-suit',
-    'impulse.but',
-    'impulsive-obsessive',
-    'impunitive',
-    'impuritatis',
-    'imput',
-    'impy',
-    'impyre',
-    'imr&eacute',
-    'imr90',
-    'imreie',
-    'imren',
-    'imrex',
-    'imrove',
-    'imrpove',
     'ims-based',
-    'ims/dc',
-    'imshied',
-    'imsi',
-    'imsoft',
-    'imsterschlucht',
-    'imtfe',
-    'imtimated',
-    'imto',
-    'imunde',
-    'imus',
-    'imvertashun',
-    'imw',
-    'imx',
-    'in&deg;c',
-    'in&eacute;dito',
     'in&eacute;dits',
-    'in&eacute;puisable',
-    'in&eacute;puisables',
-    'in&lsqb;life',
-    'in&mdash;very',
-    'in&ndash;.o',
-    'in&ndash;depth',
-    'in&ndash;e',
-    'in&ouml;nu',
-    'in&pound',
-    'in&rehy;and',
-    'in&rehy;built',
-    'in&rehy;coherent',
-    'in&rehy;company',
-    'in&rehy;corporating',
-    'in&rehy;difference',
     'in&rehy;herently',
-    'in&rehy;significant',
-    'in&rehy;toxication',
-    'in&rehy;truder',
-    'in&rehy;violate',
-    'in&times;7',
-    'in&uacute;til',
-    'in\'/',
-    'in\'69',
-    'in\'ard',
-    'in\'t\'e',
-    'in\'ya',
-    'in-/external',
-    'in-ability',
-    'in-all-circumstances',
-    'in-along',
     'in-and-money-out',
-    'in-antis',
-    'in-any',
-    'in-appropriate',
-    'in-arm',
-    'in-band',
-    'in-between-election-activity',
-    'in-bill',
-    'in-bloody-buggering-deed',
-    'in-body',
-    'in-boom',
-    'in-cabinet',
-    'in-cache',
-    'in-calf.',
-    'in-case-of-fire',
-    'in-classroom',
     'in-clear',
-    'in-clude',
-    'in-comers',
-    'in-concert',
-    'in-conveniently',
-    'in-corridor',
-    'in-course',
-    'in-court',
-    'in-credit',
-    'in-date',
-    'in-di',
-    'in-dika',
-    'in-dividual',
-    'in-efficiency',
-    'in-equality',
-    'in-expensive',
     'in-falling',
-    'in-family',
-    'in-feed/out-feed',
-    'in-fight',
-    'in-fighters',
-    'in-filled',
-    'in-flows',
-    'in-formation',
-    'in-from',
-    'in-gear',
-    'in-goal',
-    'in-high',
-    'in-home',
-    'in-hour',
-    'in-house-preferred',
-    'in-house/out-house',
     'in-instead',
-    'in-insul',
-    'in-itself',
-    'in-joking',
-    'in-juries',
-    'in-line-vee',
-    'in-market',
-    'in-motor',
-    'in-n-n-n',
-    'in-new-not-in-old',
-    'in-night',
-    'in-of',
-    'in-old-not-in-new',
-    'in-parish',
-    'in-people',
-    'in-phrase',
     'in-pig',
-    'in-pile',
-    'in-plant',
-    'in-pool',
-    'in-post',
-    'in-principle',
-    'in-pub',
-    'in-puts',
-    'in-ramping',
-    'in-reactor',
-    'in-relation-to-other-individuals',
-    'in-resistible',
-    'in-role',
-    'in-room',
-    'in-rushing',
-    'in-salah',
     'in-sequence',
-    'in-services',
-    'in-show',
-    'in-sight',
-    'in-spin',
-    'in-stadium',
-    'in-stall-ed',
-    'in-step',
-    'in-stream',
-    'in-streaming',
-    'in-studio',
-    'in-sufficient',
-    'in-surface',
-    'in-swinger',
-    'in-swinging',
-    'in-table',
     'in-take',
-    'in-talk',
-    'in-tank',
-    'in-tec',
-    'in-tech',
-    'in-the-field',
-    'in-the-flesh',
-    'in-the-foot-ness',
-    'in-the-know',
-    'in-the-metal',
-    'in-the-mix',
-    'in-the-room',
-    'in-the-slot',
-    'in-the-womb',
-    'in-thinking',
-    'in-tine',
     'in-tod',
-    'in-trade',
-    'in-trouble',
-    'in-tune',
-    'in-vehicle',
-    'in-vest-igations',
-    'in-vogue',
-    'in-waiting',
-    'in-washing',
-    'in-wear',
-    'in-whelp',
-    'in-wintering',
-    'in-withs',
-    'in-wood',
-    'in-yer-face',
-    'in.1922',
     'in._front_of',
-    'in._particular',
-    'in.england',
-    'in.guildhall',
-    'in.my',
-    'in.particular',
-    'in.public',
-    'in.what',
-    'in/12',
-    'in/2',
-    'in/20',
-    'in/about',
-    'in/and',
-    'in/b/',
-    'in/ct',
-    'in/desire',
     'in/england',
-    'in/first',
-    'in/melt',
-    'in/p/',
-    'in157',
-    'in1861',
-    'in1954',
-    'in1973',
-    'in1980',
-    'in1982',
-    'in1991',
-    'in7',
-    'in=incorporating',
-    'in_,_i_think_in_general',
-    'in_,_in_accordance_with',
-    'in_,_in_case',
     'in_,_in_front_,_in_front_of',
-    'in_,_in_light_of',
-    'in_,_in_line_with',
-    'in_,_in_public',
-    'in_,_in_so_far_as',
-    'in_,_in_view_of',
-    'in_accordance._with',
-    'in_all',
-    'in_anything',
-    'in_at',
-    'in_co.operation_with',
-    'in_each',
-    'in_er_conjunction_with',
-    'in_er_connection_with',
-    'in_er_in_terms_of',
-    'in_er_terms_of',
     'in_erm_private',
-    'in_every',
-    'in_fact',
-    'in_favour_in_favour_of',
-    'in_front_,_in_front_of',
-    'in_in_,_and_in_terms_of',
-    'in_in_case',
-    'in_in_front_of',
-    'in_in_need_of',
-    'in_in_order',
-    'in_in_place_of',
-    'in_in_respect_of',
-    'in_in_support_of',
-    'in_less',
-    'in_line_,_fish_in_line_with',
-    'in_line_erm_with',
     'in_near',
-    'in_per',
-    'in_relation_er_to',
-    'in_response_erm_to',
-    'in_so',
-    'in_so_in_so_far_as',
-    'in_the_in_the_light_of',
-    'in_turn',
-    'in_vivo.',
-    'in_whole',
-    'inabay',
-    'inaccessable',
-    'inaccessible.',
-    'inaccurable',
-    'inact',
-    'inactiva',
     'inacurrate',
-    'inacute',
-    'inadaptability',
-    'inadequa',
-    'inadequac',
-    'inadequate\'',
-    'inadequate-not',
-    'inadequately-clothed',
-    'inadequately-controlled',
-    'inadequately-trained',
-    'inadequateness',
-    'inadmissible.',
-    'inadquate',
-    'inadult',
-    'inadvert&rehy;ently',
-    'inadvertedly',
     'inaemia',
-    'inaequalis',
-    'inagawakai',
-    'inaging',
-    'inalienable\'',
-    'inalterable',
-    'inalterably',
-    'inaltruism',
-    'inamine',
-    'inamoratae',
-    'inamoratas',
-    'inamoratum',
-    'inanimacy',
-    'inantiamorse',
-    'inantipas',
-    'inany',
     'inappetency',
-    'inappetent',
-    'inappreciable',
-    'inappropriacy',
-    'inappropriately-named',
-    'inappropriately-treated',
-    'inapproriately',
-    'inaptitude',
-    'inar',
-    'inarck',
-    'inarcker',
-    'inaria',
-    'inarticulateness',
-    'inasia',
-    'inasys',
-    'inat',
     'inatio',
-    'inationto',
-    'inats',
-    'inauspiciousness',
-    'inavertently',
-    'inbaraj',
-    'inbeded',
-    'inbeing',
-    'inbet',
-    'inbetween.',
-    'inbile',
-    'inbord',
-    'inbreathed',
-    'inbreedings',
-    'inbtroduced',
-    'inbuild',
     'inc-(twi)',
-    'inc-derived',
-    'inc-fujitsu',
-    'inc-ixi',
-    'inc-matsushita',
-    'inc-mips',
-    'inc-motorola',
-    'inc-produced',
-    'inc-sun',
-    'inc-to-sparc',
-    'inc-unix',
-    'inc/bipa',
-    'inc/crazed',
-    'inc/dec',
-    'inc/destiny',
-    'inc/frank',
     'inc/george',
-    'inc/ibm',
-    'inc/mips',
-    'inc/sun',
-    'inc/univel',
-    'inc/us',
-    'inca-kola',
-    'inca-style',
-    'incaa',
-    'incadi',
-    'incadom',
-    'incafe',
-    'incal',
-    'incalcitrant',
-    'incalculability',
-    'incandesced',
     'incandescents',
-    'incandescing',
-    'incant-nonsense',
-    'incantator',
-    'incanting',
-    'incantrix',
-    'incap',
-    'incapabilities',
-    'incapsulation',
-    'incar',
-    'incar&rehy;ceration',
-    'incarceration.',
-    'incarcerations',
-    'incarna&ccedil&atilde;o',
-    'incarnadine',
-    'incarnadined',
     'incarnation.the',
-    'incarnationally',
-    'incarnatione',
-    'incarnationis',
-    'incarnato',
-    'incarotid',
-    'incarvillea',
-    'incases',
-    'incat',
-    'incatan',
-    'incaution',
-    'ince-based',
-    'ince-jones',
-    'ince.',
-    'inceased',
-    'incendi',
     'incendiariness',
-    'incendiary-cum-explosive',
-    'incendio',
-    'incendo',
-    'incendries',
-    'incense-braziers',
-    'incense-burning',
-    'incense-clocks',
-    'incense-fragrant',
-    'incense-heavy',
-    'incense-laden',
-    'incense-sticks',
-    'incense-tree',
-    'incensewood',
-    'incentive-compatible',
-    'incentive-oriented',
     'incentive-residual',
-    'incentives/deterrents',
-    'inception/renewal',
-    'inceptoris',
-    'inceram',
-    'incerta',
-    'incest-avoidance',
-    'incest-complex',
-    'incest-prohibitions',
-    'inch&mdash;sufficient',
-    'inch&mdash;the',
-    'inch-and-a-half',
-    'inch-and-a-half-long',
-    'inch-board',
-    'inch-deep',
-    'inch-of-pinch',
     'inch-pinch',
-    'inch-saving',
-    'inch-wide',
-    'inch=2.54',
-    'inch=2.54cm',
-    'inchape',
-    'inchard',
-    'inchbrakie',
-    'inchdairnie',
-    'inches-per-gallon',
-    'inches-wide',
-    'inches.i',
-    'inches/100mm',
-    'inches/20cm',
-    'inches/24cm',
-    'inchgarvie',
     'inchinnan',
-    'inchinor',
-    'inchiquin',
-    'inchkeith',
-    'inchkenneth',
-    'inchmahome',
-    'inchmarlo',
-    'inchoh',
-    'inchtuthil',
-    'inchuse',
-    'incidate',
-    'inciden',
-    'incidence-outcidence',
-    'incidencia',
-    'incident-free',
-    'incident-packed',
     'incident-reporting',
-    'incidental/personal',
-    'incidente',
-    'incidents-met',
-    'incidents.',
-    'incin-',
-    'incinerable',
-    'incinerary',
-    'incinerates',
-    'incipits',
-    'incirharmani',
-    'incisive.',
-    'incitation',
-    'incitin\'',
-    'incivil',
-    'incl-eases',
     'inclinations.',
-    'incline/decline',
-    'inclino',
-    'inclinometer',
-    'inclosed.',
-    'inclosing',
-    'include-social',
-    'included\'/',
-    'included.2',
-    'included/excluded',
-    'included106',
-    'includeed',
-    'includer',
-    'includes:free',
-    'includesben',
-    'including\'',
     'includng',
-    'inclusa',
-    'inclusion-poor',
-    'inclusionary-exclusionary',
-    'inclusions&mdash',
-    'inclusive/exclusive',
-    'inclusivism',
-    'inclusivity',
-    'inco',
-    'incog',
-    'incognisant',
-    'incognita',
-    'incognitos',
-    'incognoscenti',
-    'incohare',
-    'incoherencies',
     'incohesions',
-    'incolerent',
-    'incolving',
-    'incom',
-    'incom&rehy;patible',
-    'incom&rehy;petently',
-    'incom-municado',
-    'incombe',
-    'income&gt',
-    'income&mdash;he',
-    'income&mdash;is',
-    'income&mdash;schedule',
-    'income&rehy;earning',
-    'income&rehy;related',
-    'income\'',
-    'income*',
     'income-and',
-    'income-beneficiaries',
-    'income-beneficiary',
-    'income-guarantee',
-    'income-holding',
-    'income-housing',
-    'income-is',
-    'income-led',
-    'income-limit',
-    'income-optimising',
-    'income-orientated',
-    'income-quartile',
-    'income-raising',
-    'income-supplementing',
-    'income-support',
-    'income-type',
     'income-wealth',
-    'income.1',
-    'income/',
-    'income/consumption',
-    'income/minimise',
-    'income/net',
-    'income/population',
-    'income/wealth',
-    'income2.5***',
-    'income6.77.5',
-    'incomefrom',
-    'incomer-shetlander',
-    'incomers/shetlanders',
-    'incomesure',
-    'incomience',
-    'incoming/outgoing',
     'incommoding',
-    'incommodiousness',
-    'incommun&rehy;icado',
-    'incommunicative',
-    'incomparability',
-    'incomparables',
-    'incompatable',
-    'incompatible-element-enriched',
-    'incompatible-element-rich',
-    'incompetent.s',
-    'incompletor',
-    'incompoundable',
-    'incomprehen&rehy;sion',
-    'incomprehended',
-    'incomprehendingly',
-    'incomprehensible.',
     'incon&rehy;gruously',
-    'incon-',
-    'inconclusives',
-    'incongruently',
-    'inconnue',
-    'inconscient',
-    'inconsecutive',
-    'inconsequential.certainly',
-    'inconsequentialities',
-    'inconsiderateness',
-    'inconsise',
-    'inconsistancies',
-    'inconsisten&rehy;cies',
-    'inconsistence',
-    'inconsistency.',
-    'inconssstency',
     'inconstans',
-    'incontrast',
-    'inconvcnience',
-    'inconve',
-    'incoordinated',
-    'incoordination',
-    'incoronata',
-    'incorp.',
-    'incorporated&mdash;and',
-    'incorporator',
-    'incorrectly-placed',
-    'incorrects',
-    'incouradgement',
-    'incprorate',
-    'incr',
-    'incre',
     'increa',
-    'increas',
-    'increase\'',
-    'increase-in',
-    'increase.in',
-    'increase/',
-    'increase/in',
-    'increase_in',
-    'increase_so',
-    'increased--sparrowhawks',
-    'increased.',
-    'increases/decreases',
-    'increaseth',
-    'increasin',
-    'increasin\'',
-    'increasing/decreasing',
     'increasing/diversifying',
-    'increasingly-authoritarian',
-    'increasingly-complex',
-    'increasingly-expensive',
-    'increasingly-experienced',
-    'increasingly-important',
-    'increasingly/concerned',
-    'increasinglyseeking',
-    'incredibily',
-    'incredible-looking',
-    'incredible.',
-    'incremental/line-item',
-    'incrementalisms',
-    'incrementals',
-    'incrementic',
-    'increments/30',
     'incribed',
-    'incriminations',
-    'incroyable',
-    'incru',
-    'incrymynate',
-    'incs',
-    'incubared',
-    'incubatiion',
-    'incubator/growth',
-    'incubi:is',
-    'incubuses',
-    'incum&plusmn;bents',
-    'incumbants',
-    'incumbencies',
-    'incumbered',
-    'incumbrancesthe',
     'incunable',
-    'incunables',
-    'incunabulum',
-    'incurabili',
-    'incurability',
-    'incuring',
-    'incuriosity',
-    'incurred.',
-    'incurrence',
-    'incurrred',
-    'incurvate',
-    'incurved',
-    'incurving',
-    'incutter',
-    'incuvation',
-    'ind&eacute;pendamment',
     'ind&eacute;pendante',
-    'ind&eacute;pendantiste',
-    'ind-i-coom',
-    'ind/mgt',
-    'indaba',
-    'indadit',
-    'indagaci&oacute;n',
-    'indagini',
-    'indalecio',
-    'indamora',
-    'indaw-gwi',
-    'inde&rehy;cent',
-    'indean',
-    'indecipherably',
-    'indecomposable',
-    'indee',
     'indeed-my',
-    'indeed.9',
-    'indeede',
-    'indeedie',
-    'indeeds',
-    'indefeasibility',
-    'indefeasibly',
-    'indefensable',
-    'indefensible.',
-    'indefinables',
-    'indefinitely-forthcoming',
-    'indefinition',
-    'indefinitizing',
-    'indefintely',
-    'indegestion',
-    'indeks',
     'indelicately',
-    'indem',
-    'indemnities.',
-    'indemonstrable',
-    'indena',
-    'indeniably',
-    'indenter',
-    'indenterfy',
-    'indentical',
-    'indentifying',
-    'indentities',
-    'indentity',
-    'indep&eacute;ndencia',
-    'indepartyd',
-    'indepedent',
-    'indepen',
     'independantly',
-    'independence\'',
-    'independence\'-type',
-    'independence-seeking',
-    'independence-union',
-    'independent&mdash;justice',
-    'independent-but-dying-to-be-subservient',
-    'independent/private',
-    'independentista',
-    'independently-guided',
-    'independently-produced',
-    'independently-run',
-    'independently-targetable',
-    'independently-written',
-    'independently.',
-    'independentminded',
     'independents.',
-    'independents429397',
-    'indept.',
-    'inderal',
-    'inderdisciplinary',
-    'inderjeet',
-    'inderjit',
-    'indermuhle',
-    'inderson',
-    'indescrepancy',
-    'indescretion',
-    'indespensible',
-    'indet',
-    'indeterminacies',
-    'indeterminant',
-    'indetermine',
     'indeterminedness',
-    'indevo',
-    'index&mdash;an',
-    'index*',
-    'index-based',
-    'index-card',
-    'index-concentrates',
-    'index-tracking',
-    'indexes/records',
-    'indexing/abstracting',
-    'indexlinked',
-    'indhusophon',
-    'indi&rehy;cated',
-    'indi-genous',
-    'indi-koom',
-    'india-maldives',
     'india-marxist',
-    'india-nepal',
-    'india-sri',
-    'indiaannual',
-    'indian-asian',
-    'indian-backed',
-    'indian-blue',
-    'indian-controlled',
-    'indian-cotton',
-    'indian-dark',
-    'indian-dominated',
-    'indian-fashion',
-    'indian-hater',
-    'indian-hating',
-    'indian-looking',
-    'indian-made',
     'indian-occupied',
-    'indian-orientated',
-    'indian-raised',
-    'indian-ruled',
-    'indian-striped',
-    'indian-type',
-    'indian.tea',
-    'indian/british',
-    'indian/guyanese',
-    'indianapolis-based',
-    'indianism',
-    'indianist',
-    'indianization',
-    'indianized',
-    'indianopolis',
-    'indias',
     'indibum',
-    'indicans',
-    'indicart',
-    'indicat&rehy;ing',
-    'indicated*',
-    'indication.',
-    'indicative/informative',
-    'indicatively',
-    'indicator-dilution',
-    'indicci&oacute;n',
-    'indictability',
-    'indictio',
-    'indictment.',
-    'indide',
-    'indie-aspirants',
-    'indie-cred',
     'indie-danceisms',
-    'indie-friendly',
-    'indie-heads',
-    'indie-kid',
-    'indie-kids',
-    'indie-poppers',
-    'indien',
-    'indienne',
-    'indiennes',
-    'indietreggio',
-    'indiewhine',
-    'indifferencephotograph',
-    'indifferentism',
-    'indifferentist',
-    'indig&egrave;nes',
-    'indigenisation',
     'indigenism',
-    'indigenize',
-    'indigenos',
-    'indigens',
-    'indigents',
-    'indigestibility',
-    'indigestibles',
-    'indiget',
-    'indigital',
-    'indignance',
-    'indignantly.',
-    'indignatio',
-    'indignitate',
-    'indigo-black',
-    'indigo-grey',
-    'indigo-that',
     'indigotine',
-    'indike',
-    'indio',
-    'indir',
-    'indirect-speech',
-    'indirecti',
-    'indirectly&mdash;by',
-    'indirectly-connected',
-    'indirectly-known',
-    'indirectly-owned',
-    'indirectness&ndash',
-    'indis',
-    'indisc',
-    'indisc/33rpm',
-    'indische',
-    'indisciplinary',
     'indiscreet-tell',
-    'indiscretionary',
-    'indiscrimate',
-    'indiscrimately',
-    'indiscriminacy',
-    'indiscriminant',
-    'indiscriminateness',
-    'indiscriminating',
-    'indisgastuduva',
-    'indispensibility',
-    'indispose',
-    'indisputable&mdash;perhaps',
-    'indistinctness',
-    'indistinguishable.',
-    'inditement',
-    'indium-113m',
     'individ&ndash;al',
-    'individua1',
-    'individual\'',
-    'individual-centred',
-    'individual-consultant',
-    'individual-job',
-    'individual-minded',
-    'individual-project',
-    'individual-related',
-    'individual.15',
-    'individual/citizen/consumer',
-    'individual/environment',
-    'individual/home',
-    'individual/individual',
-    'individual/insider',
-    'individual/joint',
     'individual/sectional',
-    'individual/small',
-    'individual/teamcase',
-    'individual/traditional',
-    'individual6',
-    'individual7',
-    'individualist/regionalist',
-    'individualistic-minded',
-    'individualiy',
-    'individually\'',
-    'individually-known',
-    'individually-miked',
-    'individually-the',
-    'individually-voiced',
-    'individually-wired',
-    'individuals&mdash;sch30',
     'individuals\'/groups',
-    'individuals-',
-    'individuals.he',
-    'individuals/organisations',
-    'indivisib',
-    'indivisibles',
-    'indiviudal',
-    'indo-brazilian',
-    'indo-burmese',
-    'indo-europ&eacute;ennes',
-    'indo-fijians',
-    'indo-gangetic',
-    'indo-german',
-    'indo-germanic',
-    'indo-guyanese',
-    'indo-islamic',
     'indo-maldivian',
-    'indo-mauritian',
-    'indo-nepali',
-    'indo-portuguese',
-    'indo-trinidadians',
-    'indo-unionists',
-    'indoburman',
-    'indoc&rehy;trination',
-    'indoctri&rehy;nation',
-    'indoctrinates',
-    'indoctrinatory',
-    'indoctrines',
-    'indocued',
-    'indole',
-    'indologica',
-    'indomable',
     'indomethacin+cyclosporin',
-    'indomethacin-induced',
-    'indomitability',
-    'indonesia*',
-    'indonesia/',
-    'indonesia/malaysia',
-    'indonesian-annexed',
-    'indonesian-based',
-    'indonesian-owned',
-    'indonesian-registered',
-    'indonesianise',
-    'indoor-events',
-    'indoor-plants',
-    'indooroophilly',
-    'indopakistan',
-    'indoramin',
     'indorsement',
-    'indorses',
-    'indovina',
-    'indpeendent',
-    'indpendence',
-    'indra-pilly',
-    'indrajit',
-    'indral',
-    'indraw',
-    'indrawing',
-    'indrawings',
-    'indre',
-    'indreled',
-    'inds',
-    'indsigent',
-    'indubhai',
     'induc',
-    'inducate',
-    'inducation',
-    'inducing/procuring',
-    'inducive',
-    'inducker',
-    'inductees',
-    'inducting',
-    'induction.',
-    'induction/guidance',
-    'induction/introduction',
-    'induction/other',
-    'inductor-wise',
-    'indulg',
-    'indulger',
-    'indulgers',
     'indulgience',
-    'indulgient',
-    'indulgo-dilettante',
-    'indults',
-    'indupuytren',
-    'indusries',
-    'indusry',
-    'indust',
-    'indust-rialising',
-    'industrade',
-    'industralists',
-    'industre',
-    'industrelations',
-    'industria&rehy;lized',
-    'industrial-academic',
-    'industrial-age',
     'industrial-assurance',
-    'industrial-chemicals',
-    'industrial-commercial',
-    'industrial-commercial-imperial',
-    'industrial-development',
-    'industrial-feudal',
-    'industrial-improvement',
-    'industrial-military',
-    'industrial-minerals',
-    'industrial-policy',
-    'industrial-renewal',
-    'industrial-robot',
-    'industrial-sector',
-    'industrial-standard',
-    'industrial-tribunal',
-    'industrial/',
     'industrial/commercial/public',
-    'industrial/manufacturing',
-    'industrial/occupational',
-    'industrial/political',
-    'industrial/spatial',
-    'industrial/warehouse',
-    'industrialakering',
-    'industriales',
-    'industrialised-countries',
-    'industrialisers',
-    'industrialists.',
-    'industrialization.',
-    'industrialization/modernization',
-    'industrializers',
-    'industrially-based',
-    'industrially-funded',
     'industrially-orientated',
-    'industrialrrelations',
-    'industrie-norm',
-    'industrieklub',
-    'industrien',
-    'industries*',
-    'industries.',
-    'industries/city',
-    'industries/economies',
-    'industries/sectors',
-    'industriosissime',
-    'industrist',
-    'industry&mdash;gender&mdash;time',
-    'industry&mdash;stand',
-    'industry***',
-    'industry-',
     'industry--one',
-    'industry-attractiveness',
-    'industry-backed',
-    'industry-by-industry',
-    'industry-chart',
-    'industry-conscious',
-    'industry-consulting',
-    'industry-controlled',
-    'industry-could',
-    'industry-defined',
-    'industry-education',
-    'industry-falls',
-    'industry-first',
-    'industry-generated',
-    'industry-making',
-    'industry-mix',
     'industry-oriented',
-    'industry-relevant',
-    'industry-run',
-    'industry-science',
-    'industry-side',
-    'industry-supported',
-    'industry.ps/c',
-    'industry/',
-    'industry/business',
-    'industry/education',
-    'industry/employer',
-    'industry/firm',
-    'industry/product',
-    'industry/professional',
-    'industry/school',
-    'industry/science',
     'industry/sector',
-    'industry/teacher',
-    'industry53.9%9%',
-    'industry7.513.1',
-    'industryand',
-    'industrykiprono',
-    'indvidual',
-    'indwellers',
-    'indy-car',
-    'inebeg',
-    'inebriatedly',
-    'inebriating',
-    'inedependent',
-    'inedibility',
-    'inedibly',
-    'ineducables',
     'inefectual',
-    'ineffective-looking',
-    'inefficacious',
-    'inefficient-sounding',
-    'ineffusive',
-    'ineka',
-    'ineligibles',
-    'ineliminable',
-    'inell',
-    'inelligible',
-    'inema',
-    'inemin',
-    'inentiamorse',
-    'ineptitudes',
-    'ineptly-placed',
-    'ineptly-wrapped',
     'ineq',
-    'inequalis',
-    'inequalities.',
-    'inequalities_in',
-    'inequality-reducing',
-    'iner',
-    'ineractive',
-    'inerals',
-    'inerent',
-    'inert-gas',
-    'inertially',
-    'inertials',
-    'inertias',
-    'inertinite',
-    'inesti',
-    'inet',
     'inetd',
-    'ineum',
-    'inevi',
-    'ineviably',
-    'inevitible',
-    'inex',
-    'inexactitudes',
-    'inexactness',
-    'inexcludable',
-    'inexhausted',
-    'inexhaustible-seeming',
-    'inexhaustive',
-    'inexistence',
-    'inexistent',
-    'inexorabil',
-    'inexorabilities',
     'inexorableness',
-    'inexorably-middle&rehy;aged',
-    'inexorcizable',
-    'inexpansive',
-    'inexpediency',
-    'inexpendible',
-    'inexplicabilities',
-    'inexplicitly',
-    'inexpres&rehy;sible',
-    'inexpressibility',
-    'inexpressiveness',
-    'inextensible',
-    'inexusable',
-    'inf&eacute;rieur',
-    'inf&ggr',
-    'inf-&ggr',
     'infa',
-    'infa-riot',
-    'infactions',
-    'infalling',
-    'infamies',
-    'infamous-five',
-    'infancy/childhood/old',
-    'infant\'s',
-    'infant-breast',
-    'infant-parent',
-    'infant-theology',
-    'infant/junior',
-    'infanterie',
-    'infantilises',
-    'infantility',
-    'infantries',
     'infants&mdash;if',
-    'infants\'-school',
-    'infants/juniors',
-    'infarcation',
-    'infarction.',
-    'infarction.5',
-    'infarction/infection',
-    'infat',
-    'infathomable',
-    'infatuating',
-    'infaturated',
-    'infaturation',
-    'infe',
-    'infean',
-    'infectable',
-    'infected-food',
     'infection-free',
-    'infection.',
-    'infection/aids',
-    'infection/infestation',
-    'infectionafter',
-    'infections-often',
-    'infections.',
-    'infectiosum',
-    'infectious-disease',
-    'infectives',
-    'infectons',
-    'infelicitously',
-    'infelicity',
-    'infenestration',
-    'inference-type',
-    'inference.',
     'inferenziali',
-    'inferfaces',
-    'inferfere',
-    'inferior-feeling',
-    'inferior-quality',
-    'inferior-tasting',
-    'inferiori',
-    'inferiorities',
-    'infermiere',
-    'inferni',
-    'infertility\'',
-    'infestatation',
-    'infeudation',
-    'infibulated',
-    'inficorp',
-    'infidelity.',
     'infield/outfield',
-    'infields',
-    'infiltration.',
-    'infiltrationin',
-    'infiltrative/',
-    'infiltrative/ulcerative',
-    'infimary',
-    'infinately',
-    'infinitas',
-    'infinite-plate',
-    'infinitely-better-than-pearl',
-    'infinitudes',
-    'infinity:1',
-    'infinitys',
-    'infirma',
-    'infirmatory',
     'infirmay',
-    'infirmiry',
-    'infirmitas',
-    'infirmytie',
-    'infitration',
-    'infixes',
-    'inflaammatory',
-    'inflam',
-    'inflamable',
-    'inflammatory-',
-    'inflammatus',
-    'inflata',
-    'inflatables.',
-    'inflated/deflated',
-    'inflation-adjustment',
-    'inflation-beating',
     'inflation-breaking',
-    'inflation-employment',
-    'inflation-fevered',
-    'inflation-fighter',
-    'inflation-fighting',
-    'inflation-free',
-    'inflation-plus',
-    'inflation-plus-&pound;5',
-    'inflation-prone',
-    'inflation-protected',
-    'inflation-related',
-    'inflation-restriction-re-cession',
-    'inflation-sick',
-    'inflation-stoking',
-    'inflation-theory',
-    'inflation-wage',
     'inflation-wise',
-    'inflationery',
-    'inflatoplane',
-    'inflatory',
-    'inflectionless',
-    'inflexibilit&eacute',
-    'inflictions',
-    'inflictors',
-    'inflience',
-    'inflights',
-    'inflot',
-    'influ',
-    'influ.',
-    'influence(s)',
-    'influence-heavy',
-    'influence-spotting',
     'influence.l\'',
-    'influenceability',
-    'influenced&mdash;directly',
-    'influenced-societies',
-    'influenced.',
-    'influencess',
-    'influencialism',
-    'influent',
-    'influental',
-    'influentials',
-    'influenza.a',
-    'info\'',
-    'info-box',
-    'info-commercials',
-    'info-macmach+',
-    'info-newcastle',
     'info-world',
-    'info/opinions/lies/rubbish',
-    'infobites',
-    'infodata',
-    'infofile',
-    'infograms',
-    'infomat',
-    'infomation',
-    'infonavit',
-    'infoperspectives',
-    'infoplan',
-    'infopump',
-    'inforation',
-    'inforced',
-    'inform-',
-    'informacion',
     'informaciones',
-    'informagic',
-    'informal-sector',
-    'informal-seeming',
-    'informal.',
-    'informal/vocational',
-    'informally.',
-    'informant/potential',
-    'informants.',
-    'informants/cia',
-    'informap',
-    'informat',
-    'informati',
-    'informatic',
-    'informatii',
-    'informatin',
     'informatio',
-    'information&mdash;a',
-    'information&mdash;that',
-    'information&rehy;intensive',
-    'information\'',
-    'information**',
-    'information-age',
-    'information-base',
-    'information-broking',
-    'information-carrying',
-    'information-collecting',
-    'information-containing',
-    'information-content',
-    'information-controlling',
-    'information-crazed',
-    'information-dependent',
     'information-driven',
-    'information-expectancy',
-    'information-exploration',
-    'information-gap',
-    'information-givers',
-    'information-holding',
-    'information-laden',
-    'information-limitation',
-    'information-line',
-    'information-more',
-    'information-packs',
-    'information-poor',
-    'information-presented',
-    'information-processors',
-    'information-receiver',
-    'information-seekers',
     'information-selling',
-    'information-services',
-    'information-swopping',
-    'information-systems',
-    'information-that',
-    'information-this',
-    'information-transmission',
-    'information.cannot',
-    'information/',
-    'information/advice',
-    'information/advocacy',
-    'information/background',
-    'information/brochure',
-    'information/communication',
-    'information/data-based',
-    'information/ideas',
     'information/induction',
-    'information/navigation',
-    'information/open',
-    'information/permission',
-    'information/presentation/quality',
-    'information_in',
-    'information_with_respect',
-    'informationhe',
-    'informationisation',
-    'informationsdienste',
-    'informationssysteme.',
-    'informatisation',
-    'informative/meaningful',
-    'informativna',
-    'informatization',
-    'informatizatsiya',
     'informedness',
-    'informer.',
-    'informix-based',
-    'informix-esql/c',
-    'informix-net',
-    'informix-star',
-    'informix-storm',
-    'informix-tp/toolkit',
-    'informix/4gl',
-    'informixes',
-    'informkosmos',
-    'informoos',
-    'informrequest',
-    'inforserver',
-    'infoservers',
-    'infosheet',
     'infostructure',
-    'infotech',
-    'infoterra',
-    'infotrends',
-    'infovogue',
-    'infra&rehy;structure',
-    'infra&rehy;structure-related',
-    'infra-dig',
-    'infra-national',
-    'infra-order',
-    'infra-structural',
-    'infra-subsistence',
-    'infra-wave',
-    'infraclass',
-    'infracommunity',
-    'infradraw',
     'infrahepatic',
-    'infralogic',
-    'inframe',
-    'infrangible',
-    'infrantry',
-    'infrapattern',
-    'infrared-pulsating',
-    'infrared-sensing',
-    'infrared-visible',
-    'infrastracture',
-    'infrastructurally',
-    'infrastructure-building',
-    'infrastructure.',
-    'infratirea',
-    'infreqently',
-    'infrequent.',
     'infrigement',
-    'infringement.',
-    'infringments',
-    'infructescence',
-    'infsys',
-    'infunity',
-    'infurmarey',
-    'infuscatus',
-    'infusible',
-    'infusion.',
-    'infusorian',
-    'infusorians',
-    'infutec',
-    'ing&eacute;nieurs',
-    'ing&eacute;nues',
-    'ing&mdash;could',
     'ing&oacute;fsh&ouml;f&dstrok;3i',
-    'ing&oacute;lsh&ouml;f&dstrok;3i',
-    'ing-forms',
-    'ingaas',
-    'ingalo',
-    'ingard-stavanger',
-    'ingards',
-    'ingaselectric',
-    'ingastina',
-    'ingather',
-    'ingberman',
-    'ingebrigtsens',
-    'ingections',
-    'ingedients',
-    'ingegerd',
-    'ingegnere',
     'ingeld/ingjaldr',
-    'ingelfinger',
-    'ingelgerus',
-    'ingelram',
-    'ingelric',
-    'ingels',
-    'ingemisco',
-    'ingemuit',
-    'ingenerate',
-    'ingenieria',
-    'ingenierie',
-    'ingenieros',
-    'ingenieur-general',
-    'ingenieurs',
-    'ingenious.',
-    'ingenium',
     'ingenuas',
-    'ingenues',
-    'ingenuorum',
-    'ingeominas',
-    'ingeria',
-    'ingerman-wojenski',
-    'ingermann',
-    'ingerson',
-    'ingeslias',
-    'ingesson',
-    'ingestation',
-    'ingestions',
-    'ingestre',
-    'ingga',
-    'ingga-mi',
-    'inggeriss',
     'ingham/raf',
-    'inghinidhe',
-    'inghirami',
-    'ingild',
-    'ingitrude',
-    'ingjaldr',
-    'ingka',
-    'ingl&eacute;s',
-    'inglaze',
-    'ingle-nooks',
-    'ingleburn',
-    'ingledene',
-    'ingleesy',
-    'inglefield',
-    'inglehan',
-    'inglenooks',
     'inglenooky',
-    'inglesant\'',
-    'inglesfield',
-    'ingleside',
-    'inglestone',
-    'inglevert',
-    'inglind',
-    'inglis-moore',
-    'inglistan',
-    'ingoldmells',
-    'ingoldsbys',
-    'ingolfur',
-    'ingpen',
-    'ingrafted',
-    'ingrafting',
-    'ingram.',
     'ingram/aged',
-    'ingram/noreen',
-    'ingratiating-type',
-    'ingratiations',
-    'ingratiators',
-    'ingratiatory',
-    'ingratitudes',
-    'ingre',
-    'ingredients.',
-    'ingredients/supplies',
-    'ingres/net',
-    'ingres/windows4gl-tp',
-    'ingressions',
-    'ingroup',
-    'ingrowths',
-    'ingst',
     'ingtegrated',
-    'ingurgitation',
-    'ingvild',
-    'ingwell',
-    'ingwersen',
-    'inh',
-    'inhab',
-    'inhabitabts',
-    'inhabitancy',
-    'inhabitauntes',
-    'inhabitin\'',
-    'inhabitory',
-    'inhadi',
-    'inhalable',
-    'inhalational',
-    'inhalationsraum',
     'inhalatoriums',
-    'inhaled.',
-    'inhalent',
-    'inhalings',
-    'inhambane',
-    'inhe',
-    'inhelper',
-    'inherant',
-    'inheritant',
-    'inhes',
-    'inhibi',
-    'inhibitedly',
-    'inhibiter',
-    'inhibiters',
-    'inhibitible',
-    'inhibitleukotrienes',
     'inhibtion',
-    'inhirliest',
-    'inhobbok',
-    'inhomogeneously-broadened',
-    'inhomogenous',
-    'inhospitably',
-    'inhous',
-    'ini&rehy;tially',
-    'ini-owned',
-    'iniating',
-    'iniciativa',
-    'iniciativas',
-    'inicjatyw',
-    'inidividual',
-    'inifinite',
-    'iniguez',
     'inikoria',
-    'inimex',
-    'ininghams',
-    'iniquitates',
-    'iniquitatibus',
-    'iniquity/sometimes',
-    'iniscarn',
-    'inisfree',
-    'inishcrone',
-    'inishere',
-    'inisted',
-    'inital',
-    'initard',
-    'initating',
-    'initative',
-    'initia&rehy;tive',
     'initial(s)',
-    'initial-clause',
-    'initial-medial',
-    'initialisms',
-    'initializing',
-    'initially\'',
-    'initially-bewildering',
-    'initials/date',
-    'initials/sex',
-    'initials31',
-    'initiand',
-    'initiands',
-    'initiate/take',
-    'initiated/developed',
-    'initiating-structure',
-    'initiation&mdash',
     'initiation/investiture',
-    'initiativ',
-    'initiative-taking',
-    'initiative-which',
-    'initiative/staying',
-    'initiatives.',
-    'initio165',
-    'initio61',
-    'inititive',
-    'iniuria',
-    'iniuries',
-    'iniusta',
-    'iniut',
-    'inividuals',
-    'injac',
-    'injanuary',
     'injected-drug',
-    'injectible',
-    'injectin\'',
-    'injecting-drug',
-    'injectio',
-    'injim',
-    'injoining',
-    'injoyd',
-    'injruies',
-    'injuires',
-    'injuly',
-    'injun\'',
-    'injunction&mdash;injunction',
-    'injuns',
-    'injured-innocent',
-    'injured.tim',
     'injuries/transfers',
-    'injuriesd',
-    'injurted',
-    'injury&rehy;riddled',
-    'injury-affected',
-    'injury-curtailed',
-    'injury-decimated',
-    'injury-depleted',
-    'injury-detecting',
-    'injury-enforced',
-    'injury-list',
-    'injury-related',
-    'injury-released',
-    'injury-stricken',
-    'injury-torn',
-    'injury-weakened',
     'injury-wrecked',
-    'injury/extra',
-    'injury/sickness',
-    'injuryphotograph',
-    'injusticesthat',
-    'ink-abuser',
-    'ink-and-dead-trees',
-    'ink-bespattered',
-    'ink-block',
-    'ink-blotted',
-    'ink-blue',
-    'ink-chamber',
-    'ink-dark',
-    'ink-daubs',
-    'ink-exercise',
-    'ink-flavoured',
     'ink-green',
-    'ink-like',
-    'ink-pens',
-    'ink-resistant',
-    'ink-stain',
-    'ink-stones',
-    'ink/',
-    'inkariy',
-    'inkblots',
-    'inkborough',
-    'inked-on',
-    'inker',
-    'inkerman',
-    'inket',
-    'inkey(0)',
-    'inkey(o)',
     'inkies',
-    'inkilap',
-    'inkin',
-    'inklin\'',
-    'inkmun',
-    'inko',
-    'inkoo',
-    'inkpin',
-    'inkpot',
-    'inkpots',
-    'inkstained',
-    'inkstains',
-    'inkstone',
-    'inky-black',
-    'inky-blue',
-    'inky-fingered',
     'inlaws',
-    'inlcluding',
-    'inlcude',
-    'inle',
-    'inlet(s)',
-    'inlightned',
-    'inload',
-    'inludere',
-    'inluence',
-    'inlusio',
-    'inm=',
-    'inmac',
-    'inmate.',
-    'inmformation',
-    'inmil',
-    'inmmediatly',
     'inmucosal',
-    'inn&rehy;keeper',
-    'inn-fewer-ants',
-    'inn-hospital',
-    'inn-parlour',
-    'inn-sales',
-    'inn-sewer-ants-polly-sea',
-    'inn-sewered',
-    'innacurate',
-    'innard-freezing',
-    'innards-eaten',
-    'innatist',
-    'inned',
-    'inneffectually',
-    'innenarchitektur',
-    'inner-circle',
     'inner-cities.',
-    'inner-clock',
-    'inner-conurbation',
-    'inner-ear',
-    'inner-most',
-    'inner-oriented',
-    'inner-party',
-    'inner-space',
-    'inner-surface',
-    'inner-thighs',
-    'inner-tube',
-    'innercent',
-    'innere',
-    'innerlaken',
-    'innerrhoden',
-    'innersuit',
     'innertkirchen',
-    'innervating',
-    'innervations',
-    'innervisions',
-    'innerwear',
-    'innesi',
-    'inness',
-    'inni',
-    'inning-ending',
-    'innisfayle',
-    'innisfree-like',
-    'innishturk',
-    'inniskillin',
-    'inniskilling',
-    'inniskillings',
-    'inniss',
     'innnit',
-    'inno&rehy;cently',
-    'innocence/depravity',
-    'innocent.',
-    'innocent.anne',
-    'innocente',
-    'innocentes',
-    'innocentis',
-    'innocents-abroad',
-    'innocents.',
-    'innocenzi',
-    'innocenzi-delsol',
-    'innoculating',
-    'innominata',
-    'innotative',
-    'innotech',
     'innovate.hierarchies',
-    'innovation-inclined',
-    'innovation-weary',
-    'innovationists',
-    'innoxa',
-    'innsbruck-patch',
-    'innsstnngg',
-    'innsworth/gloucestershire',
-    'inntel',
-    'innvervated',
-    'inny',
-    'inocarpusfagifer',
-    'inocculation',
-    'inocent',
-    'inoceramus',
-    'inocula',
     'inoculan',
-    'inoculant',
-    'inocular',
-    'inoculates',
-    'inoculees',
-    'inodo',
-    'inodorous',
-    'inoffe',
-    'inoffensively',
-    'inoffensiveness',
-    'inoke',
-    'inoki',
-    'inolved',
-    'inombrable',
-    'inonga',
-    'inoperation',
     'inopportunely',
-    'inorganicism',
-    'inorganics',
-    'inosilicates',
-    'inositol(1,4,5)-trisphosphate',
-    'inosorro',
-    'inotropes',
-    'inotropism',
-    'inouk',
-    'inour',
-    'inov',
-    'inovatec',
-    'inovation',
-    'inovulation',
-    'inox',
-    'inp',
     'inpaired',
-    'inpairs',
-    'inpenetrable',
-    'inpetratus',
-    'inpex',
-    'inphase',
-    'inphormed',
-    'inplace',
-    'inplemented',
-    'inplot',
-    'inportable',
-    'inportant',
-    'inproved',
-    'input-arrays',
-    'input-one',
-    'input-out',
     'input-pairs',
-    'input-process',
-    'input-provision',
-    'input-signal',
-    'input-system',
-    'input-transformation-output',
-    'input-two',
-    'input/',
-    'input/central',
-    'input/income',
-    'input/preamp',
-    'input/tim',
-    'inputing',
-    'inputs.',
-    'inputs/data',
-    'inputs/outputs',
     'inputwholenumber',
-    'inqiries',
-    'inqua',
-    'inquestable',
-    'inquietudes',
-    'inquietum',
-    'inquiline',
-    'inquilines',
-    'inquirey',
-    'inquiry-',
-    'inquiry.drivers',
-    'inquiry.vets',
-    'inquiry/claims',
-    'inquiry/communicating',
-    'inquiry/communication',
-    'inquisicio',
     'inquisities',
-    'inquisition-and',
-    'inquisitional',
-    'inquisitive.',
-    'inquistive',
-    'inquries',
-    'inr',
-    'inreasingly',
-    'inri',
-    'inrs',
-    'inrushing',
-    'ins(u)',
-    'ins(uk)',
-    'ins-pector',
-    'ins.139(1)',
-    'insaf',
     'insalata',
-    'insane\'',
-    'insanity-inducing',
-    'insat-id',
-    'insatiabilis',
-    'insatiation',
-    'inscr',
-    'inscr.',
-    'inscriber',
-    'inscriptional',
-    'insculped',
-    'insecond',
-    'insect-bombarded',
-    'insect-busy',
-    'insect-carried',
-    'insect-eater',
     'insect-faced',
-    'insect-feeding',
-    'insect-freeing',
-    'insect-headed',
-    'insect-heads',
-    'insect-intent',
-    'insect-killers',
-    'insect-laden',
-    'insect-legs',
-    'insect-loud',
-    'insect-plant',
-    'insect-snapping',
-    'insect-specific',
-    'insect-trapping',
-    'insect-view',
-    'insecta',
     'insectaaaside',
-    'insected',
-    'insecticide-tolerant',
-    'insecticyanin',
-    'insectival',
-    'insectlike',
-    'insectoid',
-    'insectoverdin',
-    'insectoverdins',
-    'insecty',
-    'inseficus',
-    'inselberg',
-    'inself',
-    'insensiblement',
-    'insensitive-',
-    'insensitize',
     'insensitve',
-    'inseparable\'',
-    'inseparable.',
-    'inseparables',
-    'inseperabel',
-    'inseperable',
-    'inserted.',
-    'inserter',
-    'insertio',
-    'insertional',
-    'insertions.',
-    'insertive',
-    'inservire',
-    'inset.',
-    'inshallali',
-    'inshas',
     'inshelves',
-    'insherah',
-    'insicors',
-    'inside\'',
-    'inside-cylinder',
-    'inside-dealing',
-    'inside-lefts',
-    'inside-rear',
-    'inside-reared',
-    'inside-to',
-    'inside-to-out',
-    'inside-to-straight',
-    'inside-track',
-    'inside=outside',
-    'insider\'',
-    'insider-dealer',
     'insider-knowledge',
-    'insider-tipper',
-    'insider/fiduciaries',
-    'insider/outsider',
-    'insidious-a',
-    'insighters',
-    'insightful-prophetic',
-    'insights/what',
-    'insignificant-seeming',
-    'insignis',
-    'insignores',
-    'insigt',
-    'insinuates',
-    'insinuati',
-    'insinuendos',
-    'insiped',
     'insipidus',
-    'insist&mdash;or',
-    'insist.',
-    'insisted.',
-    'insistencies',
-    'insite',
-    'insititute',
-    'insitutions',
-    'insituto',
-    'insjon',
-    'inskip/wiltshire',
-    'insley',
-    'insock',
-    'insoft',
-    'insolent.that',
-    'insolites',
     'insoll',
-    'insolubilized',
-    'insolvent.',
-    'insolvenvcy',
-    'insom',
-    'insomnia.',
-    'insomnicide',
-    'insource',
-    'inspectable',
-    'inspected/maintained',
-    'inspection-',
-    'inspection-inspectorate',
-    'inspection.jane',
-    'inspection/repair',
-    'inspection/survey',
-    'inspector-generals',
     'inspector-of-something-or-other',
-    'inspectorate\'',
-    'inspectorate-general',
-    'inspectoring',
-    'inspectors/advisors',
-    'inspetor',
-    'inspira&rehy;tional',
-    'inspirationalism',
-    'inspiratory',
-    'inspire-extra',
-    'inspiredly',
-    'inspirers',
-    'inspirited',
-    'inspissated',
-    'inspissating',
-    'insprirational',
     'insprired',
-    'inspyred',
-    'insrance',
-    'inst-pump',
-    'inst.aa',
-    'inst.ab',
-    'inst.ac',
-    'inst.ad',
-    'inst.ae',
-    'inst.af',
-    'inst.ag',
-    'inst.ah',
-    'inst.pre',
-    'inst.res',
-    'inst.s01',
-    'inst.s02',
     'inst.s03',
-    'insta-seal',
-    'instable',
-    'instaed',
-    'instalaciones',
-    'instalation',
-    'install-and-forget',
-    'install-ations',
-    'installation-cum-excursion',
-    'installation/exhibition',
-    'installationist',
-    'installations/deinstallations',
-    'installed-base',
-    'instalment-payment',
-    'instalments.',
-    'instance.3',
     'instance/incident',
-    'instances-',
-    'instances.',
-    'instancia',
-    'instaneity',
-    'instant\'',
-    'instant-everything',
-    'instant-mix',
-    'instant-on',
-    'instantan&eacute;e',
-    'instantaneity',
-    'instantly-adjusting',
-    'instanz',
-    'instapage',
-    'instate',
-    'instating',
     'instaurator',
-    'instead.24',
-    'instead.there',
-    'insted',
-    'instematic',
-    'insthrope',
-    'instigatory',
-    'instillate',
-    'instillated',
-    'instinct\'',
-    'instinct-driven',
-    'instinct-in',
-    'instinct-style',
-    'instinctively.',
-    'instinctivists',
-    'instincts.',
     'instit',
-    'instit.',
-    'institition',
-    'instititional',
-    'instititution',
-    'instititutions',
-    'instits.',
-    'instituas',
-    'instituci&oacute;n',
-    'instituite',
-    'instituo',
-    'institure',
-    'institute/faculty',
-    'institute/hall/club',
-    'institutes/schools',
-    'institution&mdash;is',
     'institution&mdash;teaching',
-    'institution\'',
-    'institution(s)',
-    'institution-backed',
-    'institution-bound',
-    'institution-building',
-    'institution-wide',
-    'institution/asylum',
-    'institution/individual',
-    'institution/institution',
-    'institutional&rehy;ises',
-    'institutional-bureaucratic',
-    'institutionalists',
-    'institutionalizes',
-    'institutionally-based',
-    'institutionally-oriented',
     'institutionalmanagement',
-    'institutione',
-    'institutiones',
-    'institutions&mdash',
-    'institutions-hatfield',
-    'instituto-cultural',
-    'institutors',
-    'instituts',
-    'instiutute',
-    'instonian',
-    'instrom',
-    'instru',
-    'instructd',
-    'instructed.',
-    'instructed_in',
-    'instructees',
     'instruction&lsqb;s&rsqb',
-    'instruction-',
-    'instruction-level',
-    'instruction-orientation',
-    'instruction-related',
-    'instructioning',
-    'instructions/task',
-    'instructor-cum-british',
-    'instructor-led',
-    'instructor/demonstrator',
-    'instructor/supervisor',
-    'instructural',
-    'instrumenmts',
-    'instrument\'',
-    'instrument-enhanced',
-    'instrument-flying',
     'instrument-swapping',
-    'instrument-wise',
-    'instrument/avionics',
-    'instrumenta',
-    'instrumental-',
-    'instrumental-vocationalist',
-    'instrumentalities',
-    'instrumentalized',
-    'instrumentarium',
-    'instrumenten',
-    'instrumentes',
-    'instrumenting',
-    'instrumentis',
-    'instruments&mdash;oh',
-    'instruments/equipment',
-    'instruments/gauges/compass',
     'instruments/sun',
-    'instrumentum',
-    'instrumentz',
-    'instuments',
-    'instyle',
-    'insu&rehy;lates',
-    'insuance',
-    'insuber',
-    'insubordinated',
-    'insubordinates',
-    'insubstantial-looking',
-    'insuesco',
-    'insufficiencies',
-    'insufficient/incorrect',
-    'insufflated',
-    'insul',
     'insulant',
-    'insularis',
-    'insulatard',
-    'insulated&mdash;i',
-    'insulated/difficult',
-    'insulative',
-    'insulatory',
-    'insulin-',
-    'insulin-cell',
-    'insulin-deficiency',
-    'insulin-deficient',
-    'insulin-induced',
-    'insulin.',
-    'insuline',
-    'insulinoma',
-    'insulitis',
     'insull',
-    'insuloacinar',
-    'insult-chase-insult-chase',
-    'insult-trading',
-    'insult-words',
-    'insult.',
-    'insuperabel',
-    'insuperably',
-    'insupportable.',
-    'insupportably',
-    'insur&rehy;mountable',
-    'insurance&mdash;but',
-    'insurance&mdash;consequence',
-    'insurance&mdash;section',
-    'insurance-',
-    'insurance-broking',
     'insurance-client',
-    'insurance-risk',
-    'insurance-to-foods',
-    'insurance-type',
-    'insurance-watchers',
-    'insurance.',
-    'insurance.h',
-    'insurance/private',
-    'insurance4',
-    'insure.',
-    'insureds',
-    'insurees',
-    'insurers.',
-    'insurgent-guerilla',
-    'insurmountably',
-    'insurreccons',
     'insurrectionaries',
-    'insurrectionism',
-    'insuruance',
-    'insusceptibility',
-    'insusoft',
-    'int&eacute;grale',
-    'int&eacute;ress&eacute;s',
-    'int&eacute;rieur',
-    'int&eacute;rieurs',
-    'int\'',
-    'int\'nal',
-    'int-eresting',
-    'int92',
-    'int=sting',
-    'inta',
-    'intabolatura',
     'intabolature',
-    'intacta',
-    'intactae',
-    'intaflora',
-    'intag',
-    'intagli',
-    'intagliata',
-    'intaglioed',
-    'intake-as',
-    'intake/week',
-    'intaking',
-    'intangible-asset',
-    'intastella',
-    'intavolatura',
-    'intavolature',
-    'inte-',
     'intecsa',
-    'inteesting',
-    'intefere',
-    'intefering',
-    'integer-floating',
-    'integer/floating',
-    'integers.',
-    'integr&eacute;e',
-    'integrability',
-    'integraci&oacute;n',
-    'integradas',
-    'integral-with-time-of-absolute-error',
-    'integralism',
-    'integralist',
-    'integrated-systems',
-    'integrated/interdisciplinary',
     'integrating.',
-    'integration/collaboration',
-    'integrative/collaborative',
-    'integrator/6000',
-    'integrature',
-    'integre',
-    'integrin-ligand',
-    'integrin-mediated',
-    'integrists',
-    'integrities',
-    'integrity-loss',
-    'integrity-minded',
-    'integrity/mastery',
-    'integuments',
-    'intel/ibm',
-    'intel/motif',
     'intel/ms-dos',
-    'intel/sco',
-    'intel/svr4',
-    'intel386sx',
-    'inteligencia',
-    'intellec&rehy;tually',
-    'intellec-tual',
-    'intellectual-cum-practical',
-    'intellectual-led',
-    'intellectual-literary-reformist',
-    'intellectual-property',
-    'intellectual/cultural',
-    'intellectual/writer',
-    'intellectualised',
-    'intellectualising',
-    'intellectualizing',
     'intellectually-demanding',
-    'intellectually-minded',
-    'intellectuals/writers',
-    'intellectus',
-    'intellegentsia',
-    'intelletto',
-    'intelletual',
-    'intellex',
-    'intelli',
-    'intelli&rehy;gent',
-    'intelli-',
-    'intellifont',
-    'intelligance',
-    'intelligas',
-    'intelligen',
-    'intelligence-',
     'intelligence-influenced',
-    'intelligence-several',
-    'intelligence-wise',
-    'intelligence-work',
-    'intelligence.the',
-    'intelligence/range',
-    'intelligence=',
-    'intelligencia',
-    'intelligenetics',
-    'intelligenic',
-    'intelligent-metal',
-    'intelligent-seeming',
-    'intelligently-paced',
-    'intelligetis',
-    'intelligible/unintelligible',
-    'intellignce',
     'intellijet',
-    'intelliprint',
-    'intelliverse',
-    'intelliview',
-    'intellos',
-    'intelogic',
-    'intelsat-v',
-    'intemal',
-    'intemised',
-    'intemperately',
-    'intenable',
-    'intenational',
-    'intend/intended',
-    'intend/intention',
-    'intendant-general',
-    'intended_for_the_time',
     'intendencies',
-    'intendentes',
-    'intender',
-    'intenral',
-    'intense\'',
-    'intense-looking',
-    'intensely-cultivated',
-    'intenseness',
-    'intensifications',
-    'intensions',
-    'intensit&eacute;s',
-    'intensity-hue-saturation',
-    'intensity-ratio',
-    'intensity.',
-    'intensively-cultivated',
-    'intensively-farmed',
     'intensively-produced',
-    'intensively-researched',
-    'intensively-run',
-    'intensiveness',
-    'intensivity',
-    'intentially',
-    'intention/live',
-    'intention/result',
-    'intentionalism',
-    'intentionalist',
-    'intentions/hypotheses',
-    'intenzione',
-    'intepert',
-    'intepretation',
-    'inteq',
-    'inter&mdash;library',
     'inter&ndash;lending',
-    'inter&ndash;library',
-    'inter&rehy;allied',
-    'inter&rehy;changeability',
-    'inter&rehy;connections',
-    'inter&rehy;cultural',
-    'inter&rehy;denominational',
-    'inter&rehy;esting',
-    'inter&rehy;mediary',
-    'inter&rehy;nationalization',
-    'inter&rehy;pretation',
-    'inter&rehy;relations',
-    'inter&rehy;relationship',
-    'inter&rehy;relationships',
-    'inter&rehy;spersed',
-    'inter&rehy;stimulus',
     'inter&rehy;twined',
-    'inter&rehy;viewed',
-    'inter&rehy;views',
-    'inter&rehy;woven',
-    'inter-80',
-    'inter-acting',
-    'inter-african',
-    'inter-age-group',
-    'inter-agence',
-    'inter-aid',
-    'inter-air',
-    'inter-americana',
-    'inter-andean',
-    'inter-application',
-    'inter-asian',
-    'inter-assay',
     'inter-base-pair',
-    'inter-bloc',
-    'inter-bloody-fering',
-    'inter-bred',
-    'inter-breed',
-    'inter-breeding',
-    'inter-brewery',
-    'inter-brigade',
-    'inter-broker',
-    'inter-business',
-    'inter-capitalist',
-    'inter-caste',
-    'inter-cellular',
-    'inter-central-bank',
-    'inter-centre',
-    'inter-changeability',
     'inter-christian',
-    'inter-clubs',
-    'inter-coder',
-    'inter-college',
-    'inter-collegiate',
-    'inter-com',
-    'inter-command',
-    'inter-commonwealth',
-    'inter-communication',
-    'inter-communist',
-    'inter-companies',
-    'inter-company/related',
-    'inter-connect',
-    'inter-consultant',
-    'inter-convertible',
-    'inter-coopt',
     'inter-corporate',
-    'inter-cropped',
-    'inter-crumb',
-    'inter-crystal',
-    'inter-crystalline',
-    'inter-curricular',
-    'inter-cutting',
-    'inter-dept',
-    'inter-directory',
-    'inter-discipline',
-    'inter-document',
-    'inter-electoral',
-    'inter-electron',
-    'inter-elite',
-    'inter-employer',
-    'inter-establishment',
     'inter-eye',
-    'inter-face',
-    'inter-factional',
-    'inter-field',
-    'inter-file',
-    'inter-front',
-    'inter-gender',
-    'inter-generation',
-    'inter-glacials',
-    'inter-governental',
-    'inter-governmentalism',
-    'inter-headhunter',
-    'inter-human',
-    'inter-irish',
-    'inter-islands',
-    'inter-korea',
     'inter-labial',
-    'inter-laced',
-    'inter-ladies',
-    'inter-language',
-    'inter-legitimation',
-    'inter-line',
-    'inter-lined',
-    'inter-linking',
-    'inter-locked',
-    'inter-main-cities',
-    'inter-marrying',
-    'inter-mental',
-    'inter-mixed',
-    'inter-mixing',
-    'inter-model',
-    'inter-module',
     'inter-molecular',
-    'inter-motif',
-    'inter-muslim',
-    'inter-open',
-    'inter-operability',
-    'inter-p&lsqb;arty',
-    'inter-paradigm',
-    'inter-paramilitary',
-    'inter-parental',
-    'inter-pellation',
-    'inter-penetrating',
-    'inter-penetration',
-    'inter-personally',
-    'inter-phase',
-    'inter-port',
-    'inter-position',
     'inter-princely',
-    'inter-prison',
-    'inter-procedural',
-    'inter-process',
-    'inter-radial',
-    'inter-railers',
-    'inter-raters',
-    'inter-react',
-    'inter-reaction',
-    'inter-reactive',
-    'inter-reacts',
-    'inter-regionally',
-    'inter-related.',
-    'inter-relates',
-    'inter-relating',
-    'inter-republic',
     'inter-reservoir',
-    'inter-rositor',
-    'inter-satellite',
-    'inter-schools',
-    'inter-seasonal',
-    'inter-sectorial',
-    'inter-sentence',
-    'inter-shareholder',
-    'inter-sibling',
-    'inter-sign',
-    'inter-small-town',
-    'inter-society',
-    'inter-solicitor',
-    'inter-speaker',
-    'inter-species',
-    'inter-sports',
     'inter-staff',
-    'inter-stellar',
-    'inter-strike',
-    'inter-strip',
-    'inter-student',
-    'inter-surface',
-    'inter-system',
-    'inter-tel',
-    'inter-temporal',
-    'inter-testamental',
-    'inter-tester',
-    'inter-tetrad',
-    'inter-textual',
-    'inter-theatre',
-    'inter-titles',
-    'inter-transformable',
     'inter-twined',
-    'inter-unionist',
-    'inter-universities',
-    'inter-weave',
-    'inter-weaving',
-    'inter-window',
-    'inter-working',
-    'inter-works',
-    'inter-woven',
-    'inter-xxxx',
-    'inter-year',
-    'inter-zone',
-    'inter.departmental',
-    'inter.disciplinary',
-    'inter.exchange',
-    'inter/adv',
     'inter/sub',
-    'intera',
-    'interact.',
-    'interactionist\'-type',
-    'interactive-compensatory',
-    'interactive-cooperative',
-    'interactive-encoded',
-    'interactors',
-    'interalia',
-    'interallie',
-    'interamateur',
-    'interamerican',
-    'interanimation',
-    'interarc',
-    'interband',
-    'interbedding',
     'interbeds',
-    'interbelieve',
-    'interblending',
-    'interbold',
-    'interbranch',
-    'interbras',
-    'interbridge',
-    'interburst',
-    'intercal',
-    'intercal&eacute;e',
-    'intercalates',
-    'intercalator-tethered',
-    'intercalendrical',
-    'intercapillary',
-    'intercation',
-    'interceltic',
     'intercentros',
-    'interceptions.',
-    'interceptions/corrections',
-    'interceptory',
-    'interchangable',
-    'interchange&mdash;edi',
-    'interchangeableness',
-    'interchangees',
-    'interchi',
-    'intercim',
-    'intercity-style',
-    'interclonal',
-    'interclub',
-    'intercollated',
-    'intercollege',
-    'intercollegiate',
     'intercomedian',
-    'intercommissural',
-    'intercommoning',
-    'intercommunications',
-    'intercommunity',
-    'intercomparable',
-    'intercon',
-    'intercon&rehy;nected',
-    'intercongregational',
-    'interconnec&rehy;tions',
-    'interconnectialism',
-    'interconnection-compliant',
-    'interconnexion',
-    'interconnnection',
-    'interconsult',
-    'interconsultant',
     'intercontinentals',
-    'interconvention',
-    'interconverted',
-    'interconvertibility',
-    'interconverting',
-    'intercooling',
-    'intercorp',
-    'intercorrelated',
-    'intercorrellation',
-    'intercosmos',
-    'intercounties',
-    'intercountry',
-    'intercounty',
-    'intercourse.',
-    'intercourseable',
-    'intercranial',
     'intercrine\'/',
-    'intercropped',
-    'intercrosses',
-    'intercsting',
-    'intercuts',
-    'intercycle',
-    'interdeal',
-    'interdecadal',
-    'interdefecatory',
-    'interdefinable',
-    'interdefined',
-    'interdelivery',
-    'interdepartmentally',
-    'interdependent-the',
-    'interdependently',
-    'interdetermined',
     'interdictal',
-    'interdicting',
-    'interdigitated',
-    'interdigitates',
-    'interdisc',
-    'interdiscipliniary',
-    'interdisiplinarity',
-    'interdoc',
-    'intereference',
-    'interendothelial',
-    'interes&mdash',
-    'interes&rehy;sengemeinschaft',
-    'interesse',
-    'interest%',
-    'interest&mdash;eg',
-    'interest&mdash;mistresses',
     'interest&mdash;namely',
-    'interest&mdash;no',
-    'interest-',
-    'interest-bound',
-    'interest-freedom',
-    'interest-investment',
-    'interest-led',
-    'interest-maintenance',
-    'interest-paying',
-    'interest-rate-conscious',
-    'interest-rate-induced',
-    'interest-rate-sensitive',
-    'interest-related',
-    'interest-sensitive',
-    'interest-subsidy',
-    'interest-type',
     'interest/public',
-    'interest:queer',
-    'interest_other',
-    'interested-not',
-    'interested-the',
-    'interested.',
-    'interesting&rehy;an',
-    'interesting&rehy;looking',
-    'interesting/',
-    'interests&mdash;for',
-    'interests&mdash;p73',
-    'interests.',
-    'interests.175&mdash',
-    'interests/responsibilities',
-    'interests:architecture',
-    'interests:shopping',
     'interface-1',
-    'interface-compatible',
-    'interface-driven',
-    'interface-independent',
-    'interface-type',
-    'interfacers',
-    'interfemale',
-    'interference\'',
-    'interference-free',
-    'interferencing',
-    'interferent',
-    'interferer',
-    'interferers',
-    'interferewith',
-    'interferon-1',
-    'interferon-induced',
     'interferon-treated',
-    'interferon/week',
-    'interferring',
-    'interfers',
-    'interfertilization',
-    'interficere',
-    'interfill',
-    'interfirmlet',
-    'interflow',
-    'interflugs',
-    'interfluve',
-    'interfractile',
-    'interfusion',
-    'intergard',
-    'intergeneration',
-    'intergift',
     'intergovern-mental',
-    'intergovernment',
-    'intergovernmentalism',
-    'intergradation',
-    'intergrading',
-    'intergrating',
-    'intergrity',
-    'intergroups',
-    'intergrown',
-    'interhelical',
-    'interhemispheric',
-    'interhouse',
-    'interhuman',
-    'interictally',
-    'interieur',
-    'interieurs',
     'interior-',
-    'interior-decorating',
-    'interior-monologue',
-    'interiorise',
-    'interiorised',
-    'interiorising',
-    'interiorizing',
-    'interiors.',
-    'interjurisdictional',
-    'interknits',
-    'interlacings',
-    'interlaken-brunig-luzern',
-    'interlamellar',
-    'interlarding',
-    'interlards',
-    'interlayers',
     'interleasing',
-    'interleukin-10',
-    'interleukin-5',
-    'interliner',
-    'interlines',
-    'interlingual',
-    'interlinguistic',
-    'interlinkage',
-    'interlinkedness',
-    'interlinq',
-    'interlit',
-    'interlockings',
-    'interlocuters',
-    'interlocution',
-    'interlocutor(s)',
-    'interlooping',
     'interloped',
-    'interlubke',
-    'interlux',
-    'interm',
-    'interm&egrave;de',
-    'intermagnetics-agra',
-    'intermale',
-    'intermandibular',
-    'intermating',
-    'intermed',
-    'intermeddle',
-    'intermeddling',
-    'intermediacy',
-    'intermediaries.',
-    'intermediat',
-    'intermediate-mass',
     'intermediate-nuclear',
-    'intermediate-size',
-    'intermediate-sized',
-    'intermediately',
-    'intermediates.',
-    'intermediators',
-    'intermedium\'',
-    'intermentpolicy',
-    'intermeshes',
-    'intermicellar',
-    'intermicro',
-    'interminability',
-    'intermittant',
-    'intermittently-heard',
-    'intermix\'t',
-    'intermodular',
     'intermodulate',
-    'intermol',
-    'intermondiale',
-    'intermonth',
-    'intermtd',
-    'intermuscular',
-    'interna-tional',
-    'internal-distribution',
-    'internal-management',
-    'internal-security',
-    'internal-trade',
-    'internal.i',
-    'internal/',
-    'internal/self',
-    'internalisations',
-    'internalism/externalism',
     'internalists',
-    'internalities',
-    'internalizations',
-    'internall',
-    'internally-based',
-    'internally-generated',
-    'internally-oriented',
-    'internally-perceived',
-    'internally-run',
-    'internally-set',
-    'internally-silvered',
-    'internally.',
-    'internat-ional',
-    'internatinal',
-    'internatioal',
-    'international\'',
     'international-communications',
-    'international-equity',
-    'international-legal',
-    'international-share',
-    'international-standard',
-    'international-style',
-    'international/foreign',
-    'international/global',
-    'international/olympia',
-    'international/osf',
-    'international/world',
-    'internationalizing',
-    'internationally-based',
-    'internationally-binding',
-    'internationally-celebrated',
-    'internationally-experienced',
     'internationally-famed',
-    'internationally-harmonized',
-    'internationally-orientated',
-    'internationally-oriented',
-    'internationally-respected',
-    'internationally-strengthened',
-    'internationally-traded',
-    'internationalsuperstar',
-    'internationaux',
-    'internations',
-    'internments',
-    'interns',
-    'internships',
-    'interntional',
-    'internucleosomal',
-    'interoffice',
     'interoperabilty',
-    'interoperates',
-    'interoperating',
-    'interorbital',
-    'interorganizational',
-    'interp',
-    'interparticulate',
-    'interpatient',
-    'interperiod',
-    'interpersonal-organizational',
-    'interpetation',
-    'interpeter',
-    'interpharma',
-    'interplanetarily',
-    'interpleurites',
-    'interpol-style',
     'interpolationist',
-    'interpolationists',
-    'interpolatory',
-    'interpolis',
-    'interpositus',
-    'interpot',
-    'interpresentation',
-    'interpretant',
-    'interpretate',
-    'interpretation\'',
-    'interpretation-',
-    'interpretation-algorithms',
-    'interpretation-computation',
-    'interpretation-computations',
-    'interpretations.',
-    'interpretative/critical',
     'interpretative/explanatory',
-    'interpreter/guide',
-    'interpreters.',
-    'interpretership',
-    'interpretivism',
-    'interprocess',
-    'interprocessor',
-    'interprofessionnel',
-    'interpublic',
-    'interquadro',
-    'interraction',
-    'interrater',
-    'interreg',
-    'interregnums',
-    'interrelationship.',
-    'interrepublican',
     'interrogaciouns',
-    'interrogation-in-depth',
-    'interrogational',
-    'interrogatorily',
-    'interroutes',
-    'interruptability',
-    'interrupter-feedback',
-    'interruptibility',
-    'interruption.',
-    'inters',
-    'intersect.',
-    'intersectioning',
-    'intersegmentals',
-    'intersept',
-    'intersesting',
-    'intersexes',
     'intershield',
-    'intersind',
-    'intersindical',
-    'interskola',
-    'intersmooth',
-    'intersocial',
-    'intersolve',
-    'interspan',
-    'intersparsed',
-    'interspatial',
-    'intersperses',
-    'interspish',
-    'intersport',
-    'interstage',
-    'interstate-295',
-    'interstates',
     'intersterile',
-    'intersternites',
-    'interstimulus',
-    'intersting',
-    'interstitium',
-    'interstorey',
-    'interstructural',
-    'interstructure',
-    'intersubject',
-    'interswitch',
-    'intersystem',
-    'intertanko',
-    'intertergites',
-    'intertest',
-    'intertext',
-    'intertexts',
     'interthane',
-    'intertia',
-    'intertitles',
-    'intertool',
-    'intertrading',
-    'interuptions',
-    'interurbans',
-    'interuterine',
-    'interval-level',
-    'interval-playing',
-    'interval-time',
-    'interval=3.5&ndash;14.2',
-    'intervalla',
-    'intervalsfor',
-    'interveiwed',
-    'intervene.',
     'intervened-in',
-    'intervention.',
-    'interventionary',
-    'interventionist-imperialists',
-    'interventrally',
-    'interventu',
-    'interversion',
-    'intervierw',
-    'interview-but',
-    'interview-data',
-    'interview-driven',
-    'interview-forms',
-    'interview-portraits',
-    'interview-skills',
-    'interview-type',
-    'interview.he',
     'interview/',
-    'interview/alison',
-    'interview/chatshow',
-    'interview/hold',
-    'interview/overnight',
-    'interview/s',
-    'interviewed/janet',
-    'interviewer-researcher',
-    'interviewer/researchers',
-    'interviewese',
-    'interviewing-room',
-    'interviewing/',
-    'interviews-the',
-    'interviews/features',
-    'intervocalically',
-    'interwarring',
     'interworks',
-    'interworld',
-    'interzinc',
-    'interzonal',
-    'intest',
-    'intestaces',
-    'intesticular',
-    'intestinal-type',
-    'intestinalis',
-    'intestinalmucosal',
-    'intestine-strewn',
-    'intesting',
-    'intestinlam',
-    'intetah',
-    'intetinal',
-    'inthas',
     'intho-p',
-    'inthralenthropy',
-    'inti&rehy;mate',
-    'intially',
-    'intials',
-    'intiating',
-    'intiatives',
-    'intifadah',
-    'intimacy/the',
-    'intimate-like',
-    'intimate-scaled',
-    'intimate-sounding',
-    'intimately-in',
-    'intimately-related',
-    'intimately-so',
-    'intimida',
     'intimidation.',
-    'intimidation.6',
-    'intimist',
-    'intimiste',
-    'intimus',
-    'intirfire',
-    'intitelis',
-    'intitled',
-    'intituled',
-    'intiut',
-    'intl',
-    'into&mdash;and',
-    'into-',
-    'into-each',
-    'into-laughter',
-    'into-themselves',
     'into.the',
-    'into.three',
-    'into.two',
-    'into/out',
-    'into_,_into_line_with',
-    'into_each',
-    'intolerances.',
-    'intolleranza',
-    'intoner',
-    'intonings',
-    'intorivals',
-    'intorno',
-    'intouch',
-    'intoxicates',
-    'intoxicatingly',
-    'intpreted',
     'intra&rehy;mentally',
-    'intra&rehy;ocular',
-    'intra-agency',
-    'intra-anal',
-    'intra-and',
-    'intra-aortal',
-    'intra-aretrial',
-    'intra-as',
-    'intra-base-pair',
-    'intra-basis',
-    'intra-black',
-    'intra-bureaucratic',
-    'intra-carotid',
-    'intra-cerebral',
-    'intra-christian',
-    'intra-clan',
     'intra-collegial',
-    'intra-communal',
-    'intra-contractually',
-    'intra-country',
-    'intra-cratonic',
-    'intra-crystal',
-    'intra-crystalline',
-    'intra-cuticular',
-    'intra-day',
-    'intra-department',
-    'intra-determinacy',
-    'intra-discursively',
-    'intra-eec',
-    'intra-embryo',
-    'intra-empire',
-    'intra-europe',
     'intra-himalayan',
-    'intra-indu',
-    'intra-language',
-    'intra-linguistic',
-    'intra-male',
-    'intra-mandibular',
-    'intra-marital',
-    'intra-marxist',
-    'intra-molecular',
-    'intra-mujaheddin',
-    'intra-muscular',
-    'intra-muscularly',
-    'intra-nasally',
-    'intra-neighbourhood',
-    'intra-node',
-    'intra-not',
     'intra-ocular',
-    'intra-oecd',
-    'intra-organizationally',
-    'intra-parcham',
-    'intra-parliamentary',
-    'intra-rater',
-    'intra-reef',
-    'intra-reform',
-    'intra-secretariat',
-    'intra-sentential',
-    'intra-species',
-    'intra-specific',
-    'intra-staff',
-    'intra-temporal',
-    'intra-textually',
-    'intra-theatre',
     'intra-westphalian',
-    'intra-word',
-    'intrabloc',
-    'intracarotid',
-    'intracervical',
-    'intracisternal',
-    'intraclass',
-    'intracluster',
-    'intracongregational',
-    'intracrown',
-    'intracutaneously',
-    'intracystic',
-    'intracytoplasmatic',
-    'intradas',
-    'intradermally',
-    'intraductal',
     'intradural',
-    'intraenteric',
-    'intraface',
-    'intrafallopian',
-    'intrafamiliar',
-    'intrafollicular',
-    'intraformational',
-    'intragalactic',
-    'intragastic',
-    'intragatic',
-    'intrageneric',
-    'intralaboratory',
-    'intraleuminally',
-    'intralinguistic',
-    'intralipid',
-    'intralumina',
     'intraluminar',
-    'intramammary',
-    'intramedullary',
-    'intramembranous',
-    'intramolecularly',
-    'intramontane',
-    'intramucosally',
-    'intramusical',
-    'intranced',
-    'intransig',
-    'intransigency',
-    'intransigency.',
-    'intransigente',
-    'intransitively',
-    'intrant',
-    'intrants',
     'intranuclear',
-    'intraorganizational',
-    'intraosseous',
-    'intrap',
-    'intraparticle',
-    'intraparty',
-    'intrapithelial',
-    'intrapolation',
-    'intrapreneurs',
-    'intrapreneurship',
-    'intrapsychic\'',
-    'intrapulmonary',
-    'intrare',
-    'intrarectally',
-    'intrarenal',
-    'intraretinal',
     'intrascope',
-    'intrasegmental',
-    'intraskeletal',
-    'intraspinal',
-    'intrastromal',
-    'intrasubject',
-    'intrathymic',
-    'intratracheal',
-    'intraumoral',
-    'intravaginal',
-    'intravalence',
-    'intravascularly',
-    'intravenour',
-    'intraventricularily',
-    'intravesicular',
-    'intrawitanunt',
     'intray',
-    'intreate',
-    'intreated',
-    'intreating',
-    'intrepretation',
-    'intri',
-    'intricately-embroidered',
-    'intricately-moulded',
-    'intricating',
-    'intrication',
-    'intricatly',
-    'intriguing-sounding',
-    'intriguingly-named',
-    'intrinsecus',
-    'intrinsic/artificial',
-    'intrinsicaly',
     'intrinsick',
-    'intro&rehy;ductions',
-    'intro&rehy;spect',
-    'intro-european',
-    'intro-line',
-    'intro-uterine',
-    'intro.pre',
-    'intro.res',
-    'intro.s01',
-    'intro.s02',
-    'intro.s03',
-    'intro.s04',
-    'intro.s05',
-    'intro.s06',
-    'intro.s07',
-    'intro.s08',
     'intro.s09',
-    'intro.s10',
-    'introd-uced',
-    'introd.',
-    'introdu',
-    'introduc',
-    'introduc&rehy;ing',
-    'introduced&mdash;indeed',
-    'introduceing',
-    'introduction/job',
-    'introduction/john',
-    'introductory\'',
-    'introibo',
-    'introjects',
-    'intromission',
-    'intron-encoded',
     'intron-less',
-    'intron-loss',
-    'intronless',
-    'introspectably',
-    'introspecting',
-    'introspects',
-    'introspicio',
-    'introuvables',
-    'intruder(s)',
-    'intruder_because',
-    'intrusive/uninterested',
-    'intrvals',
-    'intsia',
-    'intstalls',
-    'intstinal',
-    'intueor',
     'intuitive-feeling',
-    'intuitive-thinking',
-    'intuits',
-    'intune',
-    'intus',
-    'intution',
-    'intv.he',
-    'inty',
-    'inu',
-    'inuagural',
-    'inuendo',
-    'inuest',
-    'inujurious',
-    'inuktituk',
-    'inunction',
-    'inundations',
     'inurned',
-    'inutiles',
-    'inutilis',
-    'inuvik',
-    'invadable',
-    'invaginates',
-    'invaginating',
-    'inval',
-    'invalid-care',
-    'invalid-ity',
-    'invalid-nursing',
-    'invalid-on-the-sickbed',
-    'invaliding',
-    'invaliditity',
-    'invalidly',
-    'invallyball',
     'invalproate-associated',
-    'invarably',
-    'invasio',
-    'invasion&mdash;and',
-    'invasion&mdash;has',
-    'invasion\'',
-    'invasion-fleet',
-    'invasions.',
-    'invasively',
-    'inve',
-    'invectif',
-    'invectiva',
-    'invenci&oacute;n',
-    'inveniendo',
-    'invenit',
-    'invent-solid',
     'inventalink',
-    'invented\'',
-    'inventer',
-    'inventid',
-    'inventio',
-    'inventione',
-    'inventorial',
-    'inventorium',
-    'inventory-keeping',
-    'inventorying',
-    'inventress',
-    'inveolvement',
-    'inverailort',
-    'inverchoran',
-    'inverek',
-    'invergarroch',
     'invergeldie',
-    'invergorden',
-    'invergowrie',
-    'inverhope',
-    'inverinate',
-    'inverleven',
-    'invermectin',
-    'invernaver',
-    'inverness-kyle',
-    'inverness-london',
-    'inverness-wick',
-    'invernesshire',
-    'invernessshire',
-    'inveroran',
-    'inverroy',
-    'inversander',
     'inverse-slope',
-    'inverse-square',
-    'inverse-video',
-    'inversion-related',
-    'inversnaid',
-    'invert-keeper',
-    'invertebrate-eating',
-    'inverted-pear-shaped',
-    'invertibrates',
-    'invertions',
-    'invervals',
-    'inves',
-    'inves&rehy;tigating',
-    'invesitigating',
-    'invest-igation',
-    'invest-tech',
     'investgations',
-    'investi',
-    'investicl',
-    'investiga&rehy;tions',
-    'investiga&rehy;tors',
-    'investigable',
-    'investigaciones',
-    'investigatatory',
-    'investigate.',
-    'investigate.the',
-    'investigateas',
-    'investigated.',
-    'investigating/research',
-    'investigationes',
-    'investigations-cheap',
-    'investigations/treatment',
     'investigaton',
-    'investigator-general',
-    'investigator-led',
-    'investigators.',
-    'investions',
-    'investment\'',
-    'investment-appraisal',
-    'investment-bank',
-    'investment-bankers-turned-ir',
-    'investment-based',
-    'investment-equivalent',
-    'investment-intensity',
-    'investment-linked',
-    'investment-management',
-    'investment-need',
-    'investment-people',
     'investment-promotion',
-    'investment-protection',
-    'investment-starved',
-    'investment-trust',
-    'investment/healthcare',
-    'investments.',
-    'investor(s)',
-    'investor-driven',
-    'investor-initiated',
-    'investor.',
-    'investor/developers',
-    'investor/owners',
-    'investors&mdash;fell',
-    'investors.',
-    'investors.the',
-    'investors/',
     'investors/fund',
-    'investtments',
-    'investygate',
-    'invetment',
-    'invetriata',
-    'invetsigations',
-    'invevitable',
-    'inviability',
-    'invidually',
-    'invierno',
-    'inview-understanding',
-    'invigilation/administration',
-    'invincible-class',
-    'invisi-block',
-    'invisibility-and',
-    'invisibilizing',
     'invisicalc',
-    'invistigated',
-    'invit',
-    'invitaion',
-    'invitation.',
-    'invitations.',
-    'invitations/service',
-    'invitatories',
-    'invited.',
-    'invited.the',
-    'inviting-looking',
-    'invitro',
-    'invo',
-    'invocatio',
-    'invoerrechten',
-    'invoi',
     'invoice-pad',
-    'invoice/statement',
-    'invoices/receipts',
-    'invokees',
-    'invoker',
-    'involed',
-    'involtini',
-    'involunt',
-    'involuntarism',
-    'involuntary-',
-    'involute',
-    'involutes',
-    'involved-and',
-    'involved/',
-    'involved/in',
-    'involved_',
     'involved_rather',
-    'involveme',
-    'involvement-calm',
-    'involvement.',
-    'invonvenient',
-    'invoved',
-    'inward-battering',
-    'inward-bound',
-    'inward-curving',
-    'inward-opening',
-    'inward-oriented',
-    'inward-seeing',
-    'inward-turning',
-    'inward/outward',
-    'inwardly-directed',
-    'inwaser',
     'inways',
-    'inwins',
-    'inwquest',
-    'inxs(style)',
-    'inxs-style',
-    'inyanza',
-    'inz',
-    'inzamam-ul&rehy;haq',
-    'inzamams',
-    'inzermito',
-    'io-720',
-    'io.sys',
-    'ioanian',
-    'ioaninna',
-    'ioannina',
-    'ioanthe',
     'iocational',
-    'iocu',
-    'iod=6.5cm',
-    'iodida',
-    'iodide-specific',
-    'iodide.',
-    'iodides',
-    'iodin',
-    'iodine-1.31',
-    'iodine-129',
-    'iodine-132',
-    'iodine-29',
-    'iodo-deoxyuridine',
-    'iodoacetamide',
-    'iodode',
-    'iodoform',
     'iodogen',
-    'iodometric',
-    'iodothalamate',
-    'iof',
-    'ioi',
-    'ioj',
-    'iolanta',
-    'iolas',
-    'iommelli',
-    'iompair',
-    'ion-assisted',
-    'ion-based',
-    'ion-deposition',
-    'ion-energy',
-    'ion-exchanges',
-    'ion-state',
     'ion-winds',
-    'ionaz',
-    'ionescoesque',
-    'ionescu-quintus',
-    'ionic-bombardment',
-    'ionic-type',
-    'ionisable',
-    'ionises',
-    'ionizers',
-    'ionizes',
-    'ionnes',
-    'ionomeric',
-    'ionomycin',
-    'ionophore-induced',
-    'ionopolis',
-    'ions.',
     'iontophoretic',
-    'iops',
-    'iordana',
-    'ioreth',
-    'iorio',
-    'ios3270',
-    'iosis',
-    'iotti',
-    'iotum',
-    'iouer',
-    'iouis',
-    'iounge',
-    'ioversol',
-    'iovetz-tereshchenko',
-    'ioviani',
-    'iowan',
     'iowme',
-    'ioxynil',
-    'ioy',
-    'ioyfull',
-    'ip&aacute;rhi',
-    'ip(lab)',
-    'ip(srs)',
-    'ip-1',
-    'ip-fakoum',
-    'ip-sdp',
-    'ip.',
-    'ip/mp',
-    'ip17',
-    'ip261838.627.260,826',
-    'ip3',
-    'ip30',
     'ip31',
-    'ip33',
-    'ip7',
-    'ipa/ipm',
-    'ipanima',
-    'ipatyev',
-    'ipc-based',
-    'ipcs/e',
-    'ipero',
-    'ipex',
-    'ipf1',
-    'ipf4',
-    'ipheion',
-    'iphig&eacute;nie',
-    'iphigenie',
-    'iphy',
     'ipico',
-    'ipil-ipil',
-    'ipk',
-    'iplb-sf21',
-    'ipma',
-    'ipn',
-    'ipoto',
-    'ippa',
-    'ippac',
-    'ippegrave',
-    'ippel',
-    'ippi',
-    'ippleden',
-    'ippleton',
-    'ippopotamo-vasca',
-    'ipratropium',
     'ips-360',
-    'ips/2',
-    'ipsa-1',
-    'ipsa-2',
-    'ipsa-2.6',
-    'ipsative',
-    'ipsc',
-    'ipsden/oxfordshire',
-    'ipser',
-    'ipsleigh',
-    'ipsophagy',
-    'ipsus',
-    'ipswich-born',
-    'ipswich-leeds',
-    'ipswich/norwich',
-    'ipswich0',
     'ipswich3',
-    'ipswichian',
-    'ipswichians',
-    'ipta',
-    'iptg-inducible',
-    'iput\'',
-    'ipx-compliant',
-    'ipx-type',
-    'ipx/stx',
-    'iq-',
-    'iq-iq',
-    'iqbo',
-    'iqilm',
-    'iqrs',
-    'iqtisad',
-    'ir&egrave;ne',
     'ir&pound;0.5m',
-    'ir&pound;1,772,100',
-    'ir&pound;1,940,852',
-    'ir&pound;1,950',
-    'ir&pound;1.04',
-    'ir&pound;1.06m',
-    'ir&pound;1.25m',
-    'ir&pound;1.28',
-    'ir&pound;1.2m',
-    'ir&pound;1.5',
-    'ir&pound;1.5m',
-    'ir&pound;1.6',
-    'ir&pound;10',
-    'ir&pound;10.3',
-    'ir&pound;10.99',
-    'ir&pound;107,000',
     'ir&pound;108m',
-    'ir&pound;10m',
-    'ir&pound;13.5m',
-    'ir&pound;14.99',
-    'ir&pound;150',
-    'ir&pound;150,000',
-    'ir&pound;150m',
-    'ir&pound;16.5',
-    'ir&pound;16.50',
-    'ir&pound;18.4',
-    'ir&pound;19',
-    'ir&pound;19.0',
-    'ir&pound;197.3',
-    'ir&pound;2,500&ndash;3,000',
-    'ir&pound;2.2',
-    'ir&pound;2.2m',
     'ir&pound;20',
-    'ir&pound;20,000',
-    'ir&pound;200,000',
-    'ir&pound;212,000',
-    'ir&pound;219.1',
-    'ir&pound;237m',
-    'ir&pound;240m',
-    'ir&pound;25,000',
-    'ir&pound;26.267',
-    'ir&pound;273.6',
-    'ir&pound;292.1',
-    'ir&pound;3,000',
-    'ir&pound;3.3',
-    'ir&pound;30',
-    'ir&pound;30&ndash;40,000',
-    'ir&pound;300',
     'ir&pound;31m',
-    'ir&pound;32.0',
-    'ir&pound;35.0',
-    'ir&pound;37.4',
-    'ir&pound;39.4',
-    'ir&pound;418,000',
-    'ir&pound;42,553,000',
-    'ir&pound;426,000',
-    'ir&pound;48.10m',
-    'ir&pound;5,000',
-    'ir&pound;5,292,000',
-    'ir&pound;5.7',
-    'ir&pound;512,000',
-    'ir&pound;54.6',
-    'ir&pound;6,742,000',
-    'ir&pound;6.5',
     'ir&pound;6.52m',
-    'ir&pound;6.6',
-    'ir&pound;6.9',
-    'ir&pound;64.7m',
-    'ir&pound;672,000',
-    'ir&pound;7.16m',
-    'ir&pound;7.235',
-    'ir&pound;71.4',
-    'ir&pound;73',
-    'ir&pound;731m',
-    'ir&pound;750,000',
-    'ir&pound;8.8',
-    'ir&pound;841m',
-    'ir&pound;853,000',
-    'ir&pound;873,000',
-    'ir&pound;91.6',
     'ir&pound;97.5',
-    'ir+r',
-    'ir-',
-    'ir-emitting',
-    'ir-r',
-    'ir/pol/soc',
-    'ir/raman',
-    'ir1,430,000',
-    'ir1,587,000',
-    'ir10.00',
-    'ir110',
-    'ir130p',
-    'ir16',
-    'ir20.5p',
-    'ir20p',
-    'ir25,000',
     'ir4,009,000',
-    'ir4,500,000',
-    'ir400,000',
-    'ir5,596,000',
-    'ir59.25p',
-    'ir600,000',
-    'ir73',
-    'ir81,000',
-    'ira-related',
-    'irachta',
-    'iragua',
-    'irai',
-    'irak',
-    'irakly',
-    'irala',
-    'iran*',
     'iran-arms',
-    'iran-backed',
-    'iran-bound',
-    'iran-india',
-    'iran-iraq-turkey',
-    'iran-new',
-    'iran-saudi',
-    'iran-uk',
-    'iran98n/a',
-    'iranair',
-    'iranamok',
-    'irani/medical',
-    'iranian-american',
-    'iranian-flag',
-    'iranian-iraqi',
-    'iranian-iraqi-icrc',
     'iranian-israeli',
-    'iranian-japanese',
-    'iranian-linked',
-    'iranian-organized',
-    'iranian-run',
-    'iranian-turkish',
-    'iranian-uk',
-    'iranica',
-    'iranis',
-    'irapuato',
-    'iraq&mdash;an',
-    'iraq-backed',
-    'iraq-gate',
-    'iraq-jordan',
-    'iraq-korea',
-    'iraq-related',
     'iraq-soviet',
-    'iraq/',
-    'iraq/iran',
-    'iraq/turkish',
-    'iraqi-backed',
-    'iraqi-born',
-    'iraqi-held',
-    'iraqi-iranian',
-    'iraqi-occupied',
-    'iraqi-registered',
-    'iraqi-saudi',
-    'iraqi178n/a',
-    'iraqi40+n/a',
-    'iraqi52n/a',
-    'iraqi55n/a',
-    'iraqin/a320',
     'iraqization',
-    'iraqshaikh',
-    'iras-araki-alcock',
-    'iray',
-    'irberger',
-    'irbid',
-    'irbm',
-    'irbms',
-    'irbus',
-    'irdas',
-    'irdial',
-    'irds',
-    'ire-based',
-    'iread',
-    'iredale/oxfordshire',
-    'iregret',
     'irela',
-    'irelan',
-    'ireland&mdash;where',
-    'ireland\'\'',
-    'ireland-born',
-    'ireland-german',
-    'ireland-italy',
-    'ireland-originating',
-    'ireland-registered',
-    'ireland.it',
-    'ireland17',
-    'ireland19',
-    'ireland2',
-    'irelandaises',
-    'irelander',
-    'irelli',
     'iren',
-    'irenea',
-    'ireneu',
-    'ireneusz',
-    'irex',
-    'irf740',
-    'irfon',
-    'irforme',
-    'irg',
-    'irh',
-    'iriandeses',
-    'irians',
-    'iriartea',
-    'iridae',
-    'iridani',
-    'iridesce',
     'iridiance',
-    'iridiscent',
-    'iridium/platinum',
-    'iridon',
-    'irie',
-    'irigarayan',
-    'irigoyenforeign',
-    'irimescu',
-    'irini',
-    'irio',
-    'irion',
-    'iriri',
-    'iris-breeding',
-    'iris-like',
-    'iris-roots',
-    'iris/gl',
     'irisches',
-    'irish-british',
-    'irish-built',
-    'irish-french',
-    'irish-generated',
-    'irish-origin',
-    'irish-scandinavian',
-    'irish-scottish',
-    'irish-sounding',
-    'irish-united',
-    'irish/anglo-irish',
-    'irish/gallic',
-    'irish/scots',
-    'irishwomen',
-    'irishy',
-    'irising',
     'irisis',
-    'irix\'',
-    'irkalla',
-    'irksomely',
-    'irksomeness',
-    'irkutsk-fairbanks',
-    'irkutsk.',
-    'irlam',
-    'irlanda',
-    'irleland',
-    'irmas',
-    'irmngard',
-    'irmo',
-    'irn&gt',
-    'irn-bru',
-    'irne',
     'irnerius',
-    'irobin',
-    'iroda',
-    'iroij',
-    'iron&rehy;smelting',
-    'iron(ii)-bleomycin',
-    'iron-and',
-    'iron-and-steel',
-    'iron-bed',
-    'iron-bladed',
-    'iron-casting',
-    'iron-centres',
-    'iron-clawed',
-    'iron-cold',
-    'iron-complex',
-    'iron-complexes.',
     'iron-coupled',
-    'iron-depleted',
-    'iron-derived',
-    'iron-dust',
-    'iron-edta',
-    'iron-fastened',
-    'iron-ferrous',
-    'iron-filing',
-    'iron-fist',
-    'iron-fronted',
-    'iron-frosted',
-    'iron-gall',
-    'iron-girder',
-    'iron-handed',
-    'iron-handled',
-    'iron-headed',
     'iron-hooped',
-    'iron-hulled',
-    'iron-hydroxide',
-    'iron-jawed',
-    'iron-laced',
-    'iron-making',
-    'iron-masters',
-    'iron-outlined',
-    'iron-panelled',
-    'iron-pierced',
-    'iron-pointed',
-    'iron-refining',
-    'iron-ring',
-    'iron-slitting',
-    'iron-smithing',
-    'iron-spiked',
     'iron-sprung',
-    'iron-to-copper',
-    'iron-tyred',
-    'iron-wheeled',
-    'iron-will',
-    'iron-work',
-    'iron-workers',
-    'iron/applewood',
-    'iron/oven/electric',
-    'iron/tannin',
-    'ironcrest',
-    'ironfounder',
-    'ironfounders',
-    'ironglaive',
-    'ironing-board-shaped',
-    'ironing-table',
     'ironique',
-    'ironisation',
-    'ironised',
-    'ironises',
-    'ironish',
-    'ironising',
-    'irons/trust',
-    'ironshod',
-    'ironside/co-trustee',
-    'ironton',
-    'irontown',
-    'ironville',
-    'ironware',
-    'ironweight',
-    'ironworker',
-    'ironworking',
     'irony-clad',
-    'irori',
-    'irous',
-    'irpc-hinton',
-    'irpinia',
-    'irps',
-    'irradiates',
-    'irradiationally',
-    'irradiations',
-    'irradification',
-    'irrational\'',
-    'irrational.',
-    'irrationale',
-    'irrationality.',
-    'irrationals',
-    'irrealism',
     'irrecon&rehy;cilable',
-    'irrecon&rehy;cilably',
-    'irreconcil&rehy;able',
-    'irrecoverability',
-    'irredeemables',
-    'irredenta',
-    'irredentism',
-    'irreducibilities',
-    'irrefutability',
-    'irregular-looking',
-    'irregular-sided',
-    'irregularites',
-    'irregularities.',
-    'irregulated',
-    'irrel',
-    'irrelation',
     'irrelative',
-    'irrelevant.4',
-    'irreligiousness',
-    'irremediability',
-    'irremovability',
-    'irrepeatable',
-    'irreplacable',
-    'irrepr',
-    'irreproducible',
-    'irresepective',
-    'irresistably',
-    'irreso-lution',
-    'irresolute.',
-    'irresponsible-',
-    'irresponsible.',
-    'irresponsive',
     'irrestistible',
-    'irrevelant',
-    'irreverant',
-    'irreverents',
-    'irreversibly.',
-    'irreversively',
-    'irriacs',
-    'irridenta',
-    'irridium',
-    'irrigational',
-    'irrigations',
-    'irriguous',
-    'irritabilities',
-    'irritable-looking',
-    'irritated/like',
-    'irritating/disappointing/unfortunate',
     'irritation.',
-    'irritative',
-    'irrorata',
-    'irrrelevant',
-    'irrs',
-    'irru',
-    'irrupting',
-    'irrupts',
-    'irs-1a',
-    'irs-1b',
-    'irsacae',
-    'irsigier',
-    'irta',
-    'irte',
-    'irthing',
-    'irthington',
     'iru',
-    'iruegas',
-    'iruka',
-    'irun',
-    'irun-hendaye',
-    'irureta',
-    'irus',
-    'irv',
-    'irv&uuml&uuml;dzijn',
-    'irvinebank',
-    'irving.in',
-    'irving/former',
-    'irving/historian',
-    'irvingites',
-    'irvingstown',
-    'irwan',
     'irwin/parker',
-    'irwinian',
-    'irwinii',
-    'irwins',
-    'is&amp;t',
-    'is&gt;0',
-    'is&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar',
-    'is&lt;0',
-    'is&mdash;and',
-    'is&mdash;because',
-    'is&mdash;can',
-    'is&mdash;tested&mdash;by',
-    'is&mdash;what',
-    'is&ndash',
-    'is&ndash;only',
-    'is&pound;650',
     'is\'****',
-    'is\'/',
-    'is\'nt',
-    'is-',
-    'is-24',
-    'is-a-bel',
-    'is-as',
-    'is-correct',
-    'is-isodry',
-    'is-israel',
-    'is-it',
-    'is-ness',
-    'is-on',
-    'is-she-or-isn\'t-she',
-    'is-that',
-    'is-that-a-he-or-a-she',
     'is-the',
-    'is-the-haddock-finnan',
-    'is-thought',
-    'is-what',
-    'is-where',
-    'is.2',
-    'is.even',
-    'is.generally',
-    'is.here',
-    'is.little',
-    'is.probably',
-    'is.rising',
-    'is.so',
-    'is/director',
-    'is/ought',
-    'is/to',
     'is/will',
-    'is/would',
-    'is/your',
-    'is0',
-    'is09660',
-    'is1',
-    'is10,600',
-    'is107,000',
-    'is110',
-    'is1151-like',
-    'is12,300',
-    'is199',
-    'is2.1888',
-    'is2.5522',
-    'is20',
-    'is21,000',
     'is220',
-    'is222,000,000',
-    'is32',
-    'is4,100',
-    'is4,300',
-    'is500,000,000',
-    'is6,700',
-    'is64,000',
-    'is66,500',
-    'is6packed',
-    'is9,000',
-    'is900-and',
-    'is902-based',
-    'is:l',
-    'is_a_great',
-    'is_all',
     'is_an_awful',
-    'is_as_long',
-    'is_at',
-    'is_because',
-    'is_in_spite',
-    'is_in_the_light',
-    'is_in_touch',
-    'is_out',
-    'is_over',
-    'is_sort',
-    'isa-based',
-    'isa/esa-bus',
-    'isaa',
-    'isaac-henry',
-    'isaach',
-    'isabel-line',
     'isabel-maria',
-    'isabel/edinburgh',
-    'isabel/glasgow',
-    'isabela',
-    'isabelia',
-    'isabell',
-    'isabellas',
-    'isabelline',
-    'isabellissima',
-    'isabellita',
-    'isachson',
-    'isack',
-    'isacks',
-    'isador',
-    'isaeus',
-    'isagree',
     'isahaya',
-    'isaias',
-    'isaios',
-    'isaka',
-    'isakovic',
-    'isamatec',
+)
+
+blocks_72 = (
+    ')#92m*"6m(%3.37m)&62,000($4.8m)"00)"50)$7.6m($5.3m)&09,000*!m)"12(!6)$,000(%7.02m',
+    '+!m(%8,690)$.25m*"8m(\'950,000")rehy;thou"+sacute;vara)$wara#\'circ;an"$thgr!(\'actrice#+nson/miller"&chamus"%endeh"$ibis',
+    '#\'l&mdash$F-be-reasonable-if-you\'ll-be-reasonable%:pretend-i-didn\'t-hear-that%5take-your-word-for-it$#say"Dm-a-dealer-in-architectural-antiques%,lright-jacks$)certainly$!i$?just-an-ordinary-bloke-like-you$,on-your-side$fsir-john-and-i\'ve-got-a-spoon-and-seal-and-my-family-lies-at-kingsbere%$orry#!.#-_a_little_bit',
+    '#!t"%stead"\'t\'dales#"he$%ought"*universite"!v#;e-\'ad-far-too-much-to-boire!*(&formula)""c)""d)""e)"$li)a"*mpossible)!#+ii',
+    '!"-1"!2"%45-30"!5"#860""95"$abct#!d#$hrax#&lbumin#Mm-about-to-explode-in-front-of-your-very-eyes%(morpurgo%Xnot-really-dead-but-just-popped-out-for-a-packet-of-fags%,the-greatest"!b',
+    '&!s#&elieve"#c-e#Zan-do-anything-i-want-any-time-i-want-and-make-you-like-it$"re#"ut"$data##eas$,serve-it-all#(irection$#sks#0on\'t-give-a-damn(2know-any-different-.how-many-years-(what-all',
+    '"<forcibly-converted-the-world"&girder#(lutamate#$oing"$have#0old-all-the-aces#-ypersensitive"$i-is#"ia$!e##n-8$)struments$,terpretation#(v-ii-iii\'$i-ii',
+    '##ibw"=knew-the-great-man-personally$)ow-it-all"#l-1$%i-v-e#$evel#%inked$$sted#$ogix$&ve-her"(mediated$#nus$5taiodobenzylguanidine"!n#(arrators',
+    '$#ver#"ot$!w"!o#)nly-paint"\'powered#\'reserve*!s#%ursue(!s"0radioimmunoassay##eal"$said$(w-it-all##how',
+    '#&urface$!s"!t#"he$#ink#-old-so-you-so\'&you-so$!o#&reated$"on"(v-iv-iii#!i$%-ii-v$&ew-you"-wannabe-loved',
+    '#!b#7ill-do-anything-for-you"!x#"iv"!y#"ou!".\'",-translation"%0.0.0"#1.2#"12$*4&ndash;15$#5.1#!3$!8',
+    '#"53#!7$".8"$2-km#"10#!3""30#"11#!5#!6#!8""40#!2#!3""56',
+    '#!m"!7##.12"!8##.25#!2#!5#!6#!8"#_so"$a.r.$$s.b.$!t"$b.a.$$e.c.',
+    '#\'rierley"$c.a.$"c.$"i.$"l.$$t.u."$d.c."1e&mdash;predicted#--agricultural#$.&gt%(pound;21$&1812.5&$25.0$%30/40$#two',
+    '$"p."!h##.k.""i.$!1%!0&*5&ndash;45%"81%*9&ndash;31$%290ff$+30&ndash;41&$4ff.$$48ff#%i.149&"95',
+    '%&321ff.&"ff%%65.66$(i.318ff.&*8&ndash;26#%v.13f%%47ff.%!9""j."$l.o."!m##.16$!2$!5$"f.',
+    '"%n.t.o""o.$"b.$"m.$"w.#"ne"!p##.l."\'redfern"$s.a.$"s.#\'adowski#%elvey"$t.n.#"he',
+    '"&u.c.n.$"d."\'v.167ff$$64ff!+/00/25/0001&&6/0037*"52#)1/23/0008*"10+!1+!2+!4+!5*"20+!1',
+    '"#2in""cs"#ems"!f""he#"pr#&ydroxy"&ii/iii""jg""kg#"pn""me$#/my\',/myself/mine#"pg',
+    '"#njg"!r"!s#"he$"in##t.g",thou/she/he/"\'we/they)*/everybody3\'/nobody!"00!"17#":1!$2128"%5,000',
+    '"!r!%3,000##800"!7!!4"$,000"!4"$86sx""to!"50!#607!!7""47""50""68',
+    '#!5""ft""th!$820s"$60xp%\'r-based"!7".80\'s&mdash;two#!7"$90\'s#!2#!3"!m"!p!#906',
+    '""13"#30s#!5""45#!8"(60-based$"ca""73#!6""87""93"!s!#:27""30""58',
+    '"!x!"=1#$60.0")e000-efff""if#!n""n\'!!_"*get_out_of""up!*a&scedil;i"!a#&f/diet"!b#!i',
+    '#!o$$mini$"no$%rossi#"ta"#den$!s""fc#"ei#$rika"%ggard#*ifu-hedina"(hmandhas#!s"#ian',
+    '"#lia$"gn"$mbus##ids#"os#(periales"%natus#\'ceolata#!e#"ke#!n##thi##ugo"!o#&kanann',
+    '#!i#"x-%-86-compatible(/with-everything$(86-based#&ygians$!x"&rmarki#\'oslavl\'#%rasen$$eson$$ived"%s/ras#"c\'$#one',
+    '#!e##ing#"ul"!u"&voloha!3b&aacute&nacute;0ez+(tilde;ez"5a&ntilde;ez-griffiths#)-censored#(g&eacute#,ll/solicitor##mbi##nia#!r$#agi',
+    '#&yuense"&berson#!o$(tdoghter%!t#!y""dg"!e##kwe#%lieve#-ral-democracy$%duero$$eian$.io&ndash;roman##son',
+    '"#fan"&icenco#$d.13%$:106(!8\'#125\'"99&#202()4&ndash;5(!6(!7\'+10&ndash;11(!1(*4&ndash;15\'"31',
+    ')(&ndash;8(*9&ndash;40\'!6(!0(!7\'!8\'!9&#317\'"39\'!9&"41\'!3\'!6&*51&ndash;2\'!5',
+    '&"70\'!2\'!4\'!5&!8\'!6&*90&ndash;1%$p.25##zan"!l#!e"0m-apple-motorola$&backed&#sed%*lockbuster',
+    '%*ompatibles$3dec-hewlett-packard&\'dicated&&signed$"er$%freak$\'hewlett%%p-sun$*mitsubishi$$only%\'riented$\'powered$%style$$type#$/cms',
+    '$"hp$%other$(scottish#!1#"ol""n\'#)-al-arabi$&yussuf"&o-land#"ld#$tson""pf"%ragim\'"ov$$hims',
+    '#$ehim#(illation#\'onectin$%xholm""sa#"ey"!t"#uki#&rndale#"sa""vm"!w"!x"$ykos"!z',
+    '""08"#125""3a""4a#!b#!c#!d"$a/mu##ble#$d/mx#!l#$m-1-&&/lfa-1%-3-transfected%$igg1',
+    '#0rda-administered$$icia%%oides#"st##zet"$binb#!t"+c-appointed#!.#%/rics#!c#!s$!a""d7#!9',
+    '"*e&rehy;man#%-ages%\'nd-rock$%balls&"th%$lock)!s%"oy%%reath&(ightness%%urned$$cave("rn*!s%&hilled',
+    '%$lear&&imbers%%oated&\'ntainer&#res%&racked)#ing&*eam-seller)"er&%ystal%\'um-iron&!t$&dagger&$mmed&$nced',
+    '(#ing&"rt%&rained$$eyed$%faces&"ll(!s%(isherman+"en%#low&$uted$&ghosts%#low%$reen\'!y',
+    '$$hard($ened$\'induced&&fested$%layer%#egs%&ollies$&making&$rgin%#elt(#ing$"of$&packed&$lace&$trol',
+    '%,ick-wielding&&ercing%&udding$&racing&$fted%%immed$)scratched%%hards(!p&&eathed%&katers&%inned%$lick)"ed%$torm',
+    '$&topped%!v$&vellum$$wall&)ter-steam*%water)!.%$orld%&racked#2berg-and-tombstone(#tip$*lockbuster$\'reaking+(/getting$$urgs',
+    '$#ore$#ube#&d-over#$fish$#loe#&houses#+landic-knit)!s\'!s##men#$nian%$land#%packs$#ick\')-wielding',
+    '#$ston#$trax#%world#!y""gb"&habod\'$"ng$"rd$#sel#$biah##eme#%ihara#&neumia(!d$&ofauna',
+    '##ter$\'hyaetus&"ic&(ological+#sts\'&saurus-"es(%tegid"#i\'s#$-air$)developed$%farma$,manufactured#!c$,le-festooned',
+    '#*ng-covered&"up"$kham#(le-bitty"\'l-based$(designed$#led$%owned$\'siemens%\'pecific%\'upplied#%ingas#!s""mc""oh',
+    '#)n-busting%6in-all-its-materiality%$like%%sized&)tencilled%(torching$./harpercollins%%mouse$"es$\'ic-like$%oclue%&dulism%(graphies*+y/mythology%&phobes',
+    '##rec#(sahedral"#p4-#!c""qs"#raf#%f-yac$,contig.tar.z#$isat#$p-26&!9".s205&ndash;930#!h#"is##ltm',
+    '%.ohaemorrhagiae%"us#,hyopthyirius#"us"#uma#!t"\'y-black&"ue$$cool$$eyed$%fresh$&handed!+d&eacute;al*!e#-gt/continuous',
+    '"%-card##ego#"ii#$like"#/lp#\'product"*13,935,000#%4,704#%7,898#1=us&dollar;1.4355"%4,000"%6,000$#600""90"&=375s1',
+    '##820#"ea$"us#!g$&nostic##ian#$lian#!n#+r-oberstein#!s#"yu""bf""da#"er$&sleigh',
+    '#"on#!y"$e/io#)a-centred%\'finding%%hunts%$meme%&packed&(romotors%$rich%\'seeking&*timulating&*uppression%(thinking$!/',
+    '$)l-average&)typically%(isations%(ogically\'!y%\'politik$%ology$)s-centred\',ontroversies&\'factory&#men&*processors&\'related%+/experience&(opinions',
+    '##las$"la$#nes$!y#&mnites$\'potent.#1n&rehy;tification$$dity$$fied$%itify&!y$&ti-kit&"al&)cal-chain)!s',
+    '&)fication-.-/anticipation/,optimisation..identification(%ed_by)#rs.\'*y&rehy;ing(\'/impose*&solate)(optimise($able(-corresponding&#que&.ty-computation+*nstruction',
+    ')\'erasing)*perception)#shy)#the(+/difference(#_in($less%!s%#ure#\'o-logic$!g$%logic),al-strategic++/expressive,)political',
+    ',(symbolic+(ly-armed.%based.)committed.%sound(/es/philosophies+\'schemas(#sed)!m\'"y\'(%-free*)ulfilment)\'setting(!/))knowledge',
+    '$"ts##val#"we"#gah"#haa$"ri"\'i-their#!d##ens#\'gnantly$!o#!l#"ng#(ographic$%lects',
+    '%!a&$tick$&phones$(syncracy*$tic-)$easy$*t-proofing%!a%"es%+ic-sounding&"ka&"sm%$ypes#!q#!t',
+    '"\'le-itis%\'seeming&$peed$%nesse##ike$#tis"#msx""ns"$oine#)l-adorned%$like&%oving%&manque$$ator&#rie',
+    '$\'isation%#tus$!o%"gy#$neus#"wa""ps"$ress#$iart$$gill$"ja$#ssi&%ocial#Aocarburi&mdash;eni&mdash;national""ss',
+    '#%worth"$u.kg#&l-zuha#$mean#$ndun$!s#"rd#"s."!w"&yillic#!l"&zhevan!$e-ei##iie"#.e.',
+    '"#ast"$c-17$!6#"cs"&ee.488%#tif""ld$!s"$njoy"!p#!g#"rc$%osula"\'r/insee#"ei',
+    '$"ru$*salem-ward"#sum"+tto-gillies""wa!\'f&mdash"\'-clause$)onvincing#!i$!n#$ness#$they#mwe-sold-our-suburban-villa-we-could-buy-a-georgian-manor-house-in-the-country#Syou-don\'t-die-in-the-first-year-you\'ll-have-made-it\'Sget-there-before-me-go-in-and-get-on-with-something',
+    '"\'/unless"#_at#\'instead$3t\'s_more_than_a_few"$aluk#"no#"pa""ca"%estos""fa#&erence#%iness"%ield.#"ll#!s',
+    '""lo"&n-&bgr%-ggr;-mediated))increased$"2a#!s"#oam#"ld#!p""p1")r-capable#$emer""sa#!c#!t',
+    '#$ikar#"on#!r""ut"!x"#zal!#g-c#"fl"$/ebp"!1""28"!6"\'a-ancas&)gigliadin&)tigliadin',
+    '#$/g/m#"lo#%rashi$#tua#$tion"\'bineghu"\'c:sipro"#edo#!n#!s"!f#%-i/ml#"1r#"bp"%g+igm',
+    '$$cell$)producing$)sepharose%\'ubclass#"fc##ins#"ly#!t#%ulden#+y-mimicking""la$!u#%esden#%oolik#!u',
+    '$#lik$!t#!y"$nacy$#lia$#rro$!s$&tienko\'!v&#ous%"ov\'#icz%!y#$enor$,ous-textured',
+    '#\'igraphs$\'mbritic$"ta&&bility%,ion-boosting(!.%"or#\'obility$&minous%\'minious$&rance\')!.)(/failure)!s\'"t\'',
+    '("ia(!s%#ed.($this%#in\'$"se$#tum#!u"!o#&revich$!s"!r#$ayne##ied"$tham',
+    '#*a&ccedil;u$#les$\'na-like&#don%%odons)$tids&#ids""x6!#h35""am#!n#-rour-lascagne$#ran"!e#%ringi',
+    '"$ibit#$gher#"he"#nen#"to"$oldy#!n#"pe"!p"#ren$!r!+i&ndash;iii"!\'"#(a)#"b)',
+    '#"d)#"f)#"i)$"i)"!+"!-##103#"28#"62#!c$(ompliant%(nforming#(depleted#*expressing#(ii-ii-ii',
+    '#$type#!v$"-i&1-iv-vii-iii-vi-vi&#i-v"+.1&ndash;67$"29$!9##2.a$!1#$3.36%!4$!0$!9#!4',
+    '$!5#+50&ndash;60$!5#!6$!0$!1$!5#!7#!8#"97#"c.%#236#.i.107&ndash;16&"50%%245ff',
+    '&$85ff&"ff%#306%"45%$55f.$!5$,i.1&ndash;17\'%04ff.\'"89&%43ff.&$67f.%!i&#.20)"2f\'&332ff.',
+    '\'%58ff.\'!6()&ndash;36(!5("9f\'$86ff\'#9ff$(v.260ff.&$41ff\'!2&#506&"6f#"v."!/#%funky',
+    '#!v$!i%"ii"%21204"#514"":1#"20#"42#.disconformable"#a.1$!3#!1#"nd"#c.1$!2',
+    '$!4$!5$!6$!7##ldn"!d"\'festyle#!x"*i&ndash;iv##(a)$"e)#!-$%depth$$like$\'service',
+    '%!s#".1%!1$#284$!3%"02$"41%#5.6$"55$"60$"82%#6ff%$9ff.$"91%!4',
+    '$!i%,.11&ndash;38&#39f&,73&ndash;139&"90%\'i.10ff.(*22&ndash;3\'#270\'+36&ndash;55(*9&ndash;59\'"46&!i\'&.110ff)%99ff.(%320ff',
+    '%"v.\'"34\'$40ff\'"51\'"80(#1ff$"v.&#2ff%-i.20&ndash;60\'$78f.\'$92ff&&i.6ff.#"/6$%jg27.$"lg',
+    '##:34#!d#"ia$"d.##jli#"m3#"s."#jde""no"!q".rs-recommended"$saka#!c#!i"$ttle',
+    '#"xx!"ja##-mi##fen#"pe#"za"!b"!e#"bu"#lal"!o"$ssel"#uin!$kaga#"ri',
+    '$"os##tan$!s$"us"!b"*e-horn-nia#\'da-type#"ja#"ly#!m#!s#$ttes#\'ya-seki"&htiyar#%wan-e',
+    '"&ibin-e#"mi"#kan#!e#"yu"(l&eacute"\'ontanyi#!t"!p".rikrrikrrrkrrr"-t&iacute;0nos#)inos-roof#!s""uo!/l&rehy;luminate',
+    '"%-103s$!1#"29#!3#,6-dbp/nf-il6/$&bgr$\'dbp-tag$&re-cat#"76#%bandu#\'maltija#&parata#$sing"#.00"!1',
+    '"!6"(a\'l-amam#)-speaking#"hi#"ke$!o#!l$!a#"mp##nde$"ga$\'trisant#$rrio"\'barritz#&orough',
+    '"+dis/chapman#:kjmsvskirgqnbxtyuollkhwtps",e-compatible#%/c400%$obol$&rpg400$=val-his-cys-x-ala-gly-x-x-arg#"57#$apcl#&ilitis$+tis/colitis#"ne#!o$%-anal$+anastomosis',
+    '%%oecal&\'lectomy\')onoscopic$%scopy%,igmoidostomy%#tom($ists$$tomy$\'vesical#$rsic#\'sostomy#!u$5m&gt;caecum&gt;distal%!s""fc',
+    '#+racombe.six"(gfvftltv"#ham$!n#!u"$iads$"s.##cis$$tion#"en$!v##jaz#!m#"on#$rida',
+    '%"us#"ty#%ushin#Ivewithmyparentsandmylittlesistershe\'sonly""k\'#"er%!e$&tshall#"in#!o#!s".l&rehy;defined*&ressed)#fed*%ormed',
+    '*%umour)&placed*&rinted)&suited)\'trained#)-adjusted&$vice%\'fforded%$imed%&pplied\'(reciated%%rgued&&ranged%)ssortedly*$ment',
+    '$(becoming&$fits)$ting%$uilt$+camouflaged%*entralised%(hartered%(olonized&*mplexioned&\'ntained%(urtained&!t$)decorated&)finedness&&served',
+    '&"ne(#-by$&earned&"se%&ndowed%(xplained\'&ressed$$fare&$vour%\'eelings%\'ocussed&(rmulated\'%tuned+!s%(urnished',
+    '%&roomed$%heath$*informedly$)justified$$life&%ghted%*ookingness(!s&#ved$\'managed\'\'neredly&\'tchedly$%named&$ture$(observed',
+    '%&rdered$\'painted&#ved%)erforated*#med%\'lanning%\'owdered%+reparedness\'&sented)$rved&(ogrammed\')portioned%)ublicised&(nctuated$&rained',
+    '\'#son&&called&&garded&\'hearsed&*lationship&(membered&$pair*"ed\'\'utation&\'sourced$\'secured&$ized%%hapen)!s\'#ved',
+    '%$ited%%prung%&tarted&(ructured%)upervised\'%plied$*temperedly&$nded&$rmed&$sted%$uned$&united%$sage$$wind%&riters',
+    '$-suffering/too$$zg26#"ah$#mpu$$tive$!u#$bred#$doer#,e-et-vilaine$#ana$)gal-raves\'$ity.\'*ly-applied*&felled*(imported',
+    '*(obtained*&seized+%moked+#old)!.%$ibly&"ts$$scas%!t#\'fitting$&ocused#$gill#,h&auml;usern$%ealth##iad',
+    '$(ch-style%&itness\'!s$"ma&#nia$&ngwoth%#ios$#ons$\'quidous$!s$1te-chlorite-mixed\')smectites&\'rations&!s$"us',
+    '#)lustrates#$moka#(ness(es)\'(-focused)#ree()proneness\'$.but#(ocutions$!m#"s.$+ley/british(\'network#!u$$dere$!m',
+    '*!s("rc()tion.this)"us\'#ist\'#ous\'#ted$$s.11\'$2,13\'!3(#,15\'!4&$2,13(!3&"3a',
+    '\'!c&#4,6&"5a\'!b&!6&!7&!8&!9&!s%#ian&#on\'(\'-ridden(#ary("ed($isms',
+    '%!n%%orily($ness%"t.&"ra(+&rehy;tions(%te_in*"d.))ion-birds,!.,"s.-%/dick)+or-designer\'$ibus(!s',
+    '$&viated$%yshin#\'written#!y$!a$"ch$$riae\'(n-greeks"\'marinen$#tar#&enite-(!s#&ington$"ye#!o',
+    '#&/unctc#!k##rin$!s#$sway#+tt/national"#p.6"%s/dme$%elles##hat#!o"%tifat$#zam#"on#!r',
+    '")u/hectare#%kamba##nga#"ro#$stre""va"%wiiin"!y#%ichev$#tch#(ocryptus#%ukhin$\'shin-14%#oin!.m&rehy;mediacy',
+    '/"ly*$rsed,#ion)\'oveable(\'pending*\'rmanent))overished"%\'port\'#ers"!-#\'imagine#%ports"$0161"!9"$abol',
+    '$"on$%ulate#"di#!g$+&rehy;inary,#ing$%(in)e$#aic%$tive$0e-above-all-else&)battering\'&locker\'\'reaker\'-!s+#ing',
+    '&\'concept)&juring))struction\'&reated&$data\'&enting&(enhanced\'&rected&)generator&(handling&#led&*music-text&)producing)\'jection-"or',
+    '&&sensor\'$ongs\'$pace\'$tyle&&to-map&-understanding%(/central%"cd%%maker*!s%$ries%%s.h.h&!/\'(drawings&#oft',
+    '%%video%$wise$#ina\'$rius\'%tion\'+#-an,#but,\'content,$free),ve/imitative++ly-designed.%named("or&\'e-quite\'"d\'',
+    '\'"er)"ed)#ing\'$less\'"ry&\'g/forms\'!s%#one%#ste#!h#$ichi#%jical#$mate$#ura#$nage',
+    '$!i#!p$#red#"ra$!i#"ss%$able#%zapyr".b&egrave;ciles##-pc##aba$\'lancing%$ming#*ecilically($ties',
+    '$!d%$ding$"ns#$ibes%%ition$!t#(rication("um$&odered%!s%"wn$#ute##uya"$cera#"ot',
+    '#!v"!d#!a"$eand#"de$&iately#&rgence""f-$(dictated$(inspired$)monitored$)sponsored#)lammatory"(gination#!t',
+    '(#ine#$gram#!n$*o-aromatic&#gh8#%penem#!s$!p#(tability%0ted/accommodated&"io(&n-coal*\'leather+"og)"al',
+    '\'&veness$$utio#!x$!\'")jin/south"#l-1#%adrik".m&eacute;diats#1aculately-dressed-\'jointed-(prepared-\'trained*$ness$\'nentist%%u-all',
+    '\'$hell$\'terial.*"ly%#ura#%diate#\'edately%&iacies\'%mente\'!t(*e-interest*$term+#ype)(/delayed)%ly-as,&became',
+    '+!.)!s(#ist&"ng$)morabilia)"ly\'\'ial-how$&ndorff%*se-changes\'!e\'#ley(*y-detailed\'$ness&#ley&$tadt',
+    '&$ible\'*on-in-myth)!s#-i&rehy;grants$+grant-based\'%tion.$"n-%.ence-awareness\'*t&mdash;if(!s%*gham-based&%rants%$ient$\'serated\'\'ization',
+    ')#ing#\'mediate*"ly#%nsely#!o$$bili($eres($sers)#tes($zing$(deration$,noregulation%&uments$!r%%alism',
+    '%$tale(\'isation*"ts)$tate**y/consumes()ly-spoken&&laised$$tile$\'veables#%ravax#%unage%$blot)$ting%\'e-based\'*deficiency',
+    '(%riven\'(mediated\'&system&%lytic%$iser&&ties49\'"y.&%zable%*o-alkaline\'-histochemical1$stry\',parasitology(,recipitating2#ons\'*suppressed',
+    '0"ve&*absorbants,"ed+%ption\'1dsorbant-purified\'3lkaline-phosphatase(&lergic&\'biology\'&lastic&*competence\'.rossreactivity\'+yochemistry("te)+ochemically&2deficiency-related',
+    '(\'iciency()pressants\')iagnostic&)eactivity\')fficiency\'.lectrophoresis&+fuorescence&.haematological0!y\'.istochenically&&logial*/cally-important&&metric\'(odulator&(negative',
+    '&\'panning(*thogenesis\'(henotype/!s.#ing($ilin\'%lates\'*recipiated-&tating1#ons&*radiometry\')eactively-%ities&,scintigraphy\'&ensing',
+    '(%rbant\'#pot\'*timulation\'4uppressive/cytotoxic)\'ressant&-turbidimetric&)uorescent$&rement%#ing"%npact"*o&mdash;of#%dibie#$gene#"li#*ndi/cannon',
+    '$"si$$ters#7uzzer-des-ida-ou-tanane"0p&eacute;ratives,#ial-$euse$\'ocirc;t#!.#.act&mdash;most&!-\'(analysis\'-deterioration()isruption\')fragments\')resistant',
+    '&%ation&#ive$\'irement&,ment-as-flaw*4/disability/handicap$#las%"es$\'nelling%&nelled$"rk&"ed%&t.this&%ation&"er&\'iality.',
+    '$.votoninvs-pius#)eachments$!c%-cably-dressed+(mannered%%unias$.dance-matching%*iment-free*"ae*"ia&!t$%llent$*mentations$!n%(eterable',
+    ')#tly%#nis$"ra&$sset&#tii(&veness\'#ore)"ii)"um\'#riz%+ceptiveness&\'ipience+!t%1fectionist-minded,"s.',
+    ')$ness&%orate%+ial-insular)&metric*%inded)*provincial("es("is*"ed)#zed($ness($orum&#led&!o\'*us-looking',
+    '%(manently&%eably%)sonalised+#zed%)tinencies$!t%\'iginosa%$oygo%!u&*s&mdash;is\'"es##fen#$goth#%ianti$%ngton',
+    '$(toyables#!l$$ant.(#the\'&ations%/usible-sounding$0e&rehy;mentation%&mation&)ent-maker)0ation&rehy;would.#(s).!./!e.\'/repair+"on',
+    '&!t$(ication.+$ally+"s.,%_even)"ve(#ory&2it-versus-explicit%"ma&&enting)!s%)qu&eacute%!x$&orings%%yment',
+    '$"ye%#in\'##ney#"oi$\'nderous$&r-tant%#ant%$oved%+t-competing\'&demand)(pendence/!t\'\'hostile\'#led((icensing',
+    '\')replacing\')sensitive(*ubstitutes0#ing\'&target&(/editing&$able\'#nt-*#-eg*"if*"ly*(sounding))/damaging*(powerful)&actors',
+    ')!i&.er/distributor&$ing.)*/consuming&4s&mdash&dollar;3,200&%unacy%"ve$!s%"er\'!s%$ing.%!s&\'ibilism,!t(+le&mdash;to',
+    '+(sounding+)to-answer.,be-otherwise.+contemplate.&define.&ignore.,stop-humming*!.+#and*$/not*#:st)*y-balanced%$tant$$tant%\'ence.he',
+    '$$unds#\'portant#4racticable&mdash;but-!.,!y*&lities%%tical$!e%%cated($ives%+dictability%&gnates)"or%"sa&#ive',
+    '\'$ario+!s\'!d\'+ionableness*$isms,+t-dominated.%style)"un(,vely-dressed-\'mounted-%named%\'visable%"za$)im&eacute&%ateur',
+    '&%eries&"it%&ntable%+s&rehy;oned&%oned.%%zoned$.obable-looking*!s)(y-garbed&#ity%#mtu(!e%&perly.($ness&&riated',
+    '%$tant%#uvd%%vable\'!l\'#nce&#ed\'(%-cage($/new\'$menh**t&mdash;up+&-grant+&/small+#_in+"s.,(/results',
+    ')$ntly\',sation-based-0/funnychappyness-$ally*$rice(#ion(!o)"rs*!y\'\'zations(#ing&$ment*!s&$viso#\'udicity',
+    '($suit\'$.but&-ive-obsessive$&nitive$\'ritatis$!t#!y$"re"(r&eacute#"90##eie$!n$!x##ove#$pove',
+    '##/dc#$hied#!i##oft#+terschlucht"#tfe#&imated#!o"$unde#!s")vertashun"!w"!x!\'n&deg;c#+eacute;dito',
+    '*(puisable2!s#)lsqb;life#*mdash;very#(ndash;.o)%depth)!e#\'ouml;nu#%pound#(rehy;and(%built((coherent*%mpany*)rporating(*difference',
+    '(+significant(*toxication)%ruder(\'violate#\'times;7#*uacute;til""\'/#"69##ard##t\'e#"ya"*-/external#\'ability$0ll-circumstances%#ong',
+    '%#tis%!y$*ppropriate$"rm#$band$8etween-election-activity$#ill$4loody-buggering-deed$#ody%"om#\'cabinet%#che%#lf.%*se-of-fire$(lassroom',
+    '%#ude$%omers%%ncert&)veniently%&rridor%$urse\'!t$%redit#$date$!i%"ka%&vidual#*efficiency$\'quality$(xpensive',
+    '%$mily$,eed/out-feed$$ight(#ers%$lled$$lows$(ormation$#rom#$gear$#oal#$high$#ome%"ur&,se-preferred(*/out-house',
+    '&"ul$%tself#&joking$%uries#(line-vee#&market$$otor#%n-n-n$-ew-not-in-old$$ight#"of$-ld-not-in-new#&parish$%eople$%hrase',
+    '%"le$$lant$#ool%"st$(rinciple$"ub%"ts#\'ramping$&eactor%;lation-to-other-individuals%(sistible$#ole%"om$&ushing#%salah',
+    '%&rvices$#how$$ight$#pin$&tadium&%ll-ed%"ep%$ream)#ing%$udio$)ufficient%%rface$&winger(#ing#%table',
+    '%"lk%"nk$"ec&!h$(he-field($lesh((oot-ness\'$know\'%metal("ix\'$room\'$slot\'$womb%&inking$#ine',
+    '$$rade%%ouble$#une#\'vehicle%+st-igations$$ogue#\'waiting%%shing$#ear$$help$(intering%#ths$#ood#(yer-face"%.1922',
+    '$*particular#\'england#)guildhall#"my#*particular$%ublic#$what"#/12#!2$!0#%about$"nd#"b/#"ct#&desire',
+    '#%first#$melt#"p/"#157##861##954$"73$"80%!2$"91"!7".=incorporating"5_,_i_think_in_general&1n_accordance_with($case',
+    '((light_of*\'ne_with(&public()so_far_as(\'view_of#0accordance._with$"ll$\'nything$!t#1co.operation_with#$each$2r_conjunction_with),nection_with&+in_terms_of&(terms_of',
+    '$$very#$fact%1vour_in_favour_of$2ront_,_in_front_of#4in_,_and_in_terms_of&$case&(front_of&\'need_of&%order&(place_of&*respect_of&*support_of#$less$7ine_,_fish_in_line_with((erm_with',
+    '##per#.relation_er_to%-sponse_erm_to#"so%-_in_so_far_as#3the_in_the_light_of$#urn#%vivo.#%whole"$abay#)ccessable(%ible.%&urable$!t%#iva',
+    '%"te#+daptability$$equa(!c(#te\'*$-not**ly-clothed.)ontrolled-\'trained*$ness$)missible.$%quate$#ult$/vert&rehy;ently($edly',
+    '$&qualis#\'gawakai$#ing#)lienable\'$\'terable*!y%%ruism#$mine$&oratae)!s("um#&nimacy$(tiamorse&#pas$!y',
+    ')!t%(reciable&\'opriacy+*tely-named0\'treated\'\'riately$&titude#!r$"ck&"er$"ia$,ticulateness##sia$"ys#!t',
+    '&#nto$!s#-uspiciousness#)vertently"%baraj#$eded$#ing$!t%%ween.##ile##ord#\'reathed%&edings#(troduced#$uild',
+    '$\'derived$\'fujitsu$#ixi$*matsushita%#ips%\'otorola$(produced$#sun$(to-sparc$$unix#%/bipa$&crazed$#dec&%stiny$%frank',
+    '$#ibm$$mips$#sun$&univel%!s#&a-kola%%style$!a$"di%"om$"fe$!l%\'citrant&)ulability$\'ndesced',
+    ')#ing%*t-nonsense&$ator&#ing&#rix$!p%)abilities%(sulation$!r%.&rehy;ceration%)ceration.-!s%2na&ccedil&atilde;o\'$dine+!d',
+    '+$ally+!e+"is(!o%$otid%&villea$#ses$!t%"an$%ution#\'e-based%%jones$!.$$ased$#ndi',
+    ')/y-cum-explosive\'!o&!o&$ries%+se-braziers)&urning(&clocks((fragrant(%heavy(%laden(&sticks($tree\'$wood%/tive-compatible*(oriented',
+    '),s/deterrents$-ption/renewal&$oris$#ram%"ta$,st-avoidance\'\'complex\',prohibitions#2h&mdash;sufficient+#the$+-and-a-half/%-long%%board%$deep%(of-pinch',
+    '%&saving%$wide$%=2.54)"cm$#ape%"rd$&brakie$\'dairnie$-es-per-gallon\'$wide&".i&&/100mm\'$20cm(#4cm$&garvie',
+    '&"or%$quin$%keith&%nneth$&mahome&#rlo$"oh$&tuthil$#use#%idate%"en\'-ce-outcidence("ia\'&t-free)&packed',
+    '(+al/personal(!e(%s-met)!.$"n-%&erable("ry(#tes$$pits$(rharmani$%sive.$&tation%#in\'$#vil#\'l-eases',
+    '&)e/decline&!o\'%meter$%osed.&#ing$*ude-social\'#d\'/(".2()/excluded(#106\'"ed\'!r\'&s:free(#ben&$ing\'',
+    '%"sa&(ion-poor)0ary-exclusionary)\'s&mdash\',ve/exclusive(#ism)"ty#!o$!g%&nisant\'"ta("os&\'oscenti$$hare%(erencies',
+    '$&lerent%$ving$!m%-&rehy;patible,\'etently%)-municado%"be%$e&gt\'(mdash;he-"is-(schedule\',rehy;earning,\'related&!\'&!*',
+    '\'-beneficiaries1!y\')guarantee\'\'holding)%using\'"is\'#led($imit\'*optimising()rientated\'(quartile\'\'raising\'-supplementing+#ort\'$type',
+    '&".1&!/\'+consumption\'(minimise\'#net\'*population\'&wealth&&2.5***&&6.77.5&$from&,r-shetlander\'-s/shetlanders&$sure%%ience&+ng/outgoing',
+    ')\'ousness&-un&rehy;icado(\'icative%*parability*#les\'%table(5ible-element-enriched5$rich&\'etent.s&%letor&(oundable&/rehen&rehy;sion+#ded,%ingly+&sible.',
+    '%!-%(clusives%(gruently%#nue%&scient&\'ecutive\'2quential.certainly/%ities&+iderateness\'"se(\'tancies),en&rehy;cies+"ce,"y.&\'sstency',
+    '%%trast%(vcnience&!e$)ordinated+#ion$&ronata%"p.&0orated&mdash;and*"or%-rectly-placed)!s$*uradgement#\'prorate#!r$!e',
+    '&!s\'"e\'(#-in(#.in(!/)"in(#_in)"so(/d--sparrowhawks)!.(+s/decreases("th\'"in)!\'),g/decreasing',
+    '*0ly-authoritarian-\'complex-)expensive1\'rienced-)important,*/concerned,\'seeking%&dibily(*le-looking*!.%0mental/line-item+$isms+!s)"ic)$s/30',
+    '%)minations$&oyable$!u$\'ymynate#!s#&ubared&%tiion\')or/growth%$i:is%$uses$.m&plusmn;bents%%bants&&encies\'#red&)rancesthe',
+    ')!s\'$ulum$&rabili*"ty%#ing&%osity%$red.\'#nce&#red%$vate&"ed&#ing$$tter$&vation"3d&eacute;pendamment',
+    '2$iste#\'-i-coom#$/mgt##aba$#dit$-gaci&oacute;n%#ini$%lecio$$mora$%w-gwi#+e&rehy;cent$"an$*cipherably%)omposable$!e',
+    '&".9&!e&"ie&!s$+feasibility*"ly&&nsable(%ible.%\'inables\'1itely-forthcoming)#ion*$zing\'$tely$\'gestion$"ks',
+    '$!m%\'nities.%)onstrable$"na%%iably%#ter("fy&$ical\'%fying\'$ties(!y$0p&eacute;ndencia%%artyd%%edent&!n',
+    '(%ence\'-%-type,(-seeking-%union*/t&mdash;justice+<-but-dying-to-be-subservient+(/private+$ista+)ly-guided.(produced.#run.*targetable.\'written-!.+&minded',
+    ',&429397%"t.$#ral%,disciplinary%$jeet&"it%%muhle%#son$)screpancy($tion%(pensible$!t%*erminacies+"nt*!e',
+    '$"vo$*x&mdash;an%!*%&-based&$card\'+oncentrates&(tracking%*es/records%/ing/abstracting%&linked#(husophon#,i&rehy;cated$\'-genous%$koom$*a-maldives',
+    '&%nepal&#sri%&annual%\'n-asian\'&backed(#lue\'*controlled)$tton\'$dark((ominated\'\'fashion\'%hater*#ing\'\'looking\'$made',
+    '()rientated\'&raised($uled\'\'striped\'$type&$.tea&(/british\'(guyanese&,apolis-based&#ism(!t\'&zation("ed&&opolis%!s',
+    '$$cans&"rt&*t&rehy;ing\'#ed*\'$ion.(.ve/informative*"ly\'+or-dilution%+ci&oacute;n%(tability&"io&%ment.$"de$+e-aspirants&$cred',
+    '&(friendly&%heads&#kid)!s&\'poppers%!n&"ne(!s%\'treggio%%whine$2fferencephotograph*$tism-!t$,g&egrave;nes%)enisation',
+    '("ze\'"os\'!s\'"ts&)stibility*#les&!t%$ital%%nance($tly.\'#tio&%itate%\'o-black\'$grey\'$that',
+    '$"ke$!o$!r%*ect-speech(!i(+ly&mdash;by**-connected+%known+%owned(*ness&ndash$!s%!c&&/33rpm&"he&(iplinary',
+    '(\'tionary\'%imate,"ly)%inacy,"nt,&teness-#ing%)gastuduva%+pensibility&#ose&4utable&mdash;perhaps%)tinctness(*guishable.$&tement$\'um-113m',
+    '\'#ua1)"l\'*(-centred,)onsultant+#job+&minded+\'project+\'related*#.15*1/citizen/consumer++environment+$home+*individual-%sider+%joint',
+    ',$mall+(teamcase,*raditional*!6*!7*/ist/regionalist-)ic-minded+!y*#ly\',&-known-%miked-#the-&voiced-%wired*-s&mdash;sch30',
+    '+!-+#.he+./organisations&#sib)#les&$udal#+o-brazilian&&urmese%2europ&eacute;ennes%\'fijians%(gangetic&%erman+"ic&\'uyanese%\'islamic',
+    '\'\'uritian%&nepali%*portuguese%,trinidadians%)unionists$&burman$0c&rehy;trination%/tri&rehy;nation(%nates+#ory)"es%#ued$"le%%ogica$%mable',
+    ',(-induced%)itability$&nesia*)!/*(malaysia))n-annexed+%based+%owned+*registered*#ise$)or-events\'&plants&(oophilly$(pakistan$%ramin',
+    '\'!s$$vina#(peendent%&ndence#(ra-pilly%#jit%!l%!w&#ing)!s$!e%#led#!s$%igent#%ubhai',
+    '%#ate\'#ion%-ing/procuring&"ve%#ker%$tees&#ing\'#on.))/guidance*,introduction*%other&\'or-wise$"lg&"er(!s',
+    ')!t&,o-dilettante%"ts$\'puytren$%sries&!y%!t&*-rialising&$rade(%lists\'!e(\'lations\'-ia&rehy;lized)*l-academic,"ge',
+    '+)chemicals,)ommercial5)-imperial++development+&feudal++improvement+(military-&nerals+&policy+\'renewal,$obot+&sector,\'tandard+(tribunal*!/',
+    '+-manufacturing+,occupational+)political+\'spatial+)warehouse*\'akering*"es*.ised-countries-"rs,#ts.+\'zation.1./modernization,#ers*(ly-based-&funded',
+    '**rrelations(&e-norm)$klub)!n)"s**!.*%/city+)economies+\'sectors((osissime("st\'9y&mdash;gender&mdash;time/%stand(#***(!-',
+    ').attractiveness)&backed**y-industry)%chart*(onscious-&ulting,\'trolled+#uld)\'defined))education)%falls*$irst))generated)&making*"ix',
+    ')(relevant*"un)\'science*#ide*(upported(%.ps/c(!/)(business))education*\'mployer)$firm)\'product,)fessional)&school+%ience',
+    ')\'teacher(\'53.9%9%(\'7.513.1(#and(\'kiprono#&vidual#\'wellers#%y-car"$ebeg$(riatedly(#ing#)dependent$\'ibility&"ly$\'ucables',
+    '$/fective-looking%(icacious\'-ient-sounding%%usive#"ka#(ligibles%\'minable$!l%&igible#"ma$"in#)ntiamorse#(ptitudes%)ly-placed(\'wrapped',
+    '$%ualis(%ties.,#_in)*y-reducing#!r$&active%"ls$#ent$%t-gas%%ially(!s\'!s&$nite##sti#!t',
+    '#"um#"vi%$ably%%tible#!x$)actitudes\'$ness$(cludable$\'hausted),ible-seeming*"ve$\'istence)!t$&orabil*%ities',
+    ')2y-middle&rehy;aged&\'cizable$\'pansive%\'ediency&&ndible%,licabilities($itly%.res&rehy;sible((sibility*&veness$(tensible$&usable".f&eacute;rieur$#ggr#%-&ggr',
+    '$%-riot$&ctions$%lling$$mies%(ous-five$1ncy/childhood/old%#t\'s&\'-breast\'&parent\'(theology&\'/junior&$erie&&ilises)"ty&$ries',
+    '\'(\'-school\'(/juniors$\'rcation&%tion.+!5**/infection$!t%\'homable%&uating&%rated)#ion#!e$"an$&ctable&\'ed-food',
+    ')!.)%/aids*+infestation)%after)\'s-often*!.(#sum(*us-disease\'#ves&#ons$*licitously)!y$*nestration$*rence-type)!.',
+    '%%faces&#ere%+ior-feeling)\'quality)\'tasting(!i)$ties%%miere%"ni%\'tility\'$)statation$\'udation#(ibulated$$corp$\'delity.',
+    '\'!s$)ltration.,"in*#ve/-*ulcerative$$mary$&nately%$itas\'\'e-plate(4ly-better-than-pearl\'$udes\'#y:1(!s$#rma\'$tory',
+    '&#iry\'#tas&$ytie$\'tration$#xes#*laammatory%!m&$able&\'matory-)"us%"ta\'%bles.&+ed/deflated&.ion-adjustment*\'beating',
+    '**employment*\'fevered+&ighter/#ing+#ree*$plus.)-&pound;5+$rone-&tected*\'related,4striction-re-cession*$sick+&toking*&theory*$wage',
+    ')#ery&&oplane\'"ry$*ectionless%.xibilit&eacute$\'ictions\'#ors%$ence%$ghts$"ot$!u%!.%\'ence(s))&-heavy*(spotting',
+    ')\'ability)0d&mdash;directly**-societies*!.)"ss(&ialism\'!t("al($ials\'$za.a#"o\'$$-box%+commercials%(macmach+%)newcastle',
+    '$6/opinions/lies/rubbish$%bites$$data$$file$%grams$#mat\'#ion$%navit$,perspectives%#lan%#ump$&ration%#ced%"m-&%acion',
+    '\'#gic\'(l-sector+%eming(!.(+/vocational(#ly.\',nt/potential)"s.*$/cia\'!p\'!t(!i)!c)!i)!n',
+    '*)n&mdash;a2$that,.rehy;intensive+!\'+"**+$-age,$base-&roking,(carrying-)ollecting.(ntaining0#ent0\'rolling-%razed,)dependent',
+    ',*expectancy/(loration,#gap-%ivers,\'holding,%laden-)imitation."ne,$more,%packs-#oor-(resented.(ocessors,(receiver,\'seekers',
+    '.&rvices-\'wopping-&ystems,$that."is-+ransmission+\'.cannot+!/,&advice/%ocacy,*background-\'rochure,-communication,*data-based,%ideas',
+    ',*navigation,$open,*permission-3resentation/quality+#_in,,with_respect+"he+\'isation+(sdienste,(systeme.)&sation)-ve/meaningful*"na)&zation,$siya',
+    '\'"r.&(ix-based)&esql/c)#net)$star+#orm)*tp/toolkit($/4gl("es&&kosmos&#oos&\'request%&server$\'servers%$heet',
+    '$$tech&#rra%%rends$%vogue#1ra&rehy;structure4(-related%$-dig&(national&%order&*structural\'*ubsistence&$wave%%class&(ommunity%$draw',
+    '%%logic%"me%&ngible&#try%\'pattern%-red-pulsating)\'sensing)\'visible%)stracture()ucturally-*e-building.!.%%tirea$\'eqently&%uent.',
+    '%(ngement.\'%ments$*uctescence##sys#%unity$&rmarey$&scatus%$ible&#on.%%orian*!s$#tec"/g&eacute;nieurs,#ues$+mdash;could',
+    '+4lsh&ouml;f&dstrok;3i#&-forms##aas$"lo$,rd-stavanger&!s$)selectric%$tina$$ther#&berman#*ebrigtsens$&ctions$&dients$$gerd%$nere',
+    '%&finger%%gerus%#ram&"ic%!s$%misco%#uit$&nerate%%ieria)!e("os\'*ur-general)!s&$ous.&"um',
+    '&"es&$orum$&ominas$#ria%,man-wojenski(!n%#son$%slias%#son%&tation&$ions&"re#"ga%#-mi$%eriss',
+    '$&inidhe%$rami##ild$%trude#%jaldr#"ka#*l&eacute;s$#aze$\'e-nooks%$burn%$dene%#esy%%field%#han%%nooks',
+    '%%sant\'&%field&#ide&$tone%$vert$#ind%\'s-moore&#tan#(oldmells&$sbys%#fur##pen#&rafted\'#ing%"m.',
+    '\'&noreen%,tiating-type*#ons)#ors+!y\'%tudes$!e%\'dients.+)/supplies%%s/net\'-windows4gl-tp&%sions$#oup%$wths#"st',
+    '#*urgitation#$vild#$well%$rsen"!h#"ab%&itabts(#ncy(%untes\'#in\'\'#ory$"di$%lable&&tional*%sraum',
+    '%#ed.&"nt%$ings$%mbane#!e$$lper$$rant%%itant$!s##ibi&%tedly(!r)!s\'$ible\',leukotrienes',
+    '$&rliest#%obbok$5mogeneously-broadened)#ous$(spitably$"us"-i&rehy;tially#&-owned#%ating#\'ciativa*!s$%jatyw#(dividual#&finite#$guez',
+    '##mex#&nghams#(quitates)$ibus\'+y/sometimes#%scarn$$free$&hcrone%#ere$#ted##tal%"rd%$ting\'"ve$,ia&rehy;tive',
+    '\'\'-clause(&medial\'$isms($zing\'#ly\'),-bewildering\'&s/date)#sex("31&"nd(!s&\'te/take(+d/developed\'-ing-structure((on&mdash',
+    '(!v)(e-taking+%which*(/staying*"s.%$o165&"61%$tive#$uria&"es$#sta$!t#\'viduals"#jac$%nuary',
+    '&$ible\'"n\'(&g-drug\'!o#"im#&oining$"yd#%ruies#%uires$"ly$"n\'%6ction&mdash;injunction%!s$,red-innocent\'$.tim',
+    '(!d%#ted%.y&rehy;riddled&)-affected\')curtailed\')decimated)&pleted)\'tecting\'(enforced\'$list\'\'related*%eased\'(stricken\'$torn\'(weakened',
+    '&&/extra\'(sickness&*photograph$*sticesthat"(k-abuser%-nd-dead-trees$+bespattered%$lock\'$tted&"ue$\'chamber$$dark&#ubs$(exercise$)flavoured',
+    '$$like$$pens$)resistant$%stain&$ones#!/#$ariy#%blots$&orough#%ed-on$!r%#man$!t$$y(0)&"o)',
+    '$#lap$!n#$lin\'##mun#!o$!o##pin$"ot&!s#\'stained(!s%#one#\'y-black\'"ue%(fingered',
+    '#\'cluding$#ude#!e$$t(s)#\'ightned##oad#%udere$$ence$#sio""m=#"ac$#te.#)formation#"il#(mediatly',
+    '"-n&rehy;keeper#+-fewer-ants$(hospital$\'parlour$%sales%3ewer-ants-polly-sea)"ed#\'acurate$+rd-freezing&\'s-eaten$$tist#"ed$*ffectually$,narchitektur$(r-circle',
+    '\'$lock\'*onurbation&#ear&$most&(oriented&%party&%space\'&urface&&thighs\'#ube%$cent%!e%%laken%&rhoden%$suit',
+    '%&vating)#ons&&isions%$wear$"si%!s#!i$)ng-ending$&sfayle&(ree-like%%hturk%&killin+!g,!s%!s',
+    '#-o&rehy;cently$/cence/depravity\'"t.)$anne(!e)!s("is((s-abroad)!.\'"zi)\'-delsol%\'ulating$&minata$&tative%#ech',
+    '\',ion-inclined+%weary*$ists$"xa#,sbruck-patch$&stnngg$5worth/gloucestershire##tel#(vervated#!y".ocarpusfagifer$(culation$#ent%%ramus$#ula',
+    '(!t\'!r\'#tes&#ees#"do%$rous##ffe&\'nsively+$ness#"ke$!i#$lved#\'mbrable##nga#(peration',
+    '#)rganicism)!s#)silicates%8tol(1,4,5)-trisphosphate$$orro#&tropes\'#ism#"uk$!r#!v$$atec&#ion$\'ulation#!x"!p',
+    '&!s#)enetrable$&tratus$!x#$hase$%ormed#$lace$\'emented$"ot#\'ortable\'"nt#%roved#)ut-arrays&#one\'"ut',
+    '\'&rocess)&vision&&signal\'%ystem&5transformation-output\'"wo%!/&\'central&&income&&preamp&#tim%#ing%"s.&%/data\'\'outputs',
+    '"&qiries#"ua$\'estable$\'ietudes(!m%$line)!s%#rey&"y-\'(.drivers($vets\'\'/claims),ommunicating3"on%%sicio',
+    ')&on-and+"al)#ve.&$tive$$ries"!r#(easingly#!i#!s#&ushing"$s(u)%"k)#\'-pector#\'.139(1)#"af',
+    '$#ne\'%,ity-inducing$$t-id%\'iabilis\'$tion#"cr%!.%$iber&\'ptional$%ulped#%econd%+t-bombarded(#usy\'\'carried\'%eater',
+    '(&eeding(&reeing\'&headed+!s\'&intent\'\'killers\'%laden(#egs(#oud\'%plant\'(snapping(\'pecific\'(trapping\'$view&!a',
+    '&"ed&.icide-tolerant(%yanin\'#val&$like&#oid\'&verdin-!s&!y$%ficus$%lberg%!f$*nsiblement\'%tive-)"ze',
+    '$(parable\'+!.+!s%&erabel)"le$%rted.\'!r&"io(#nal)"s.\'"ve%$vire$"t.#\'hallali%!s',
+    '%#rah#%icors$#de\'&)-cylinder\'\'dealing\'%lefts\'$rear+"ed\'"to)$-out*(straight($rack&(=outside&"r\'\'\'-dealer',
+    '(&tipper\',/fiduciaries((outsider%&ious-a$&ghters\'-ful-prophetic\'&s/what%0nificant-seeming\'!s&$ores%!t$&nuates(!i&%endos$#ped',
+    '$+st&mdash;or&!.&#ed.\'%ncies$"te%%itute%&utions\'!o##jon#-kip/wiltshire##ley##ock$"ft$)lent.that%$ites',
+    '%(ubilized%%vent.(#vcy$!m%$nia.\'$cide$$urce#(pectable\'-ed/maintained\'$ion-+,inspectorate*%.jane*\'/repair+&survey\'+or-generals',
+    ')$ate\',(-general)#ing)*s/advisors%#tor$/ira&rehy;tional\')tionalism(#ory&\'e-extra\'#dly\'"rs&$ited%&ssated)#ing$*rirational',
+    '$$yred#%rance#&t-pump$#.aa&!b&!c&!d&!e&!f&!g&!h%#pre%#res%#s01\'!2',
+    '$&a-seal%#ble%"ed%(laciones\'$tion&,l-and-forget)%tions\'3ation-cum-excursion,+/exhibition,#ist,1s/deinstallations\'\'ed-base&,ment-payment*"s.%%nce.3',
+    '("s-)!.\'"ia&$eity&"t\'\'+-everything(#mix("on\'+an&eacute;e)$eity\',ly-adjusting&!z%$page%"te&#ing',
+    '$&ead.24(%there%!d%%matic$%hrope$\'igatory%%llate*!d%$nct\'(\'-driven)"in)%style(&ively.*$ists("s.',
+    '&!.&%ition+"al(%ution-!s&"s.&#uas\'+ci&oacute;n\'#ite\'!o\'"re\'*te/faculty*)hall/club))s/schools(,ion&mdash;is',
+    '+!\'+#(s)+\'-backed-$ound-\'uilding,$wide+\'/asylum,*individual.)stitution+,al&rehy;ises---bureaucratic-$ists.#zes-(ly-based0(oriented',
+    '+!e,!s+\'s&mdash,)-hatfield(*o-cultural)"rs(!s%%utute$%onian$#rom%!u&#ctd(#ed.*#_in)"es',
+    '+!-,%level,+orientation,\'related+#ing+&s/task(.or-cum-british+#led*-/demonstrator+*supervisor($ural&&menmts)"t\'*)-enhanced+&flying',
+    '+$wise*)/avionics*!a+"l---vocationalist,%ities-#zed+$rium*"en+!s*#ing+!s**s&mdash;oh+*/equipment,.gauges/compass',
+    '*"um*!z$&uments$#yle#,u&rehy;lates$$ance$#ber%)ordinated-!s%0stantial-looking$$esco$+fficiencies++t/incorrect&%lated$!l',
+    '&#ris&$tard\'*ed&mdash;i)*/difficult\'#ive\'#ory%#in-($cell(*deficiency0!t(\'induced\'!.\'!e\'#oma&#tis',
+    '%\'oacinar%4t-chase-insult-chase\'\'trading\'%words&!.$\'perabel)"ly%)portable.,!y$0r&rehy;mountable%.ance&mdash;but0+consequence0\'section)!-*\'broking',
+    '*$risk*(to-foods+#ype*(watchers)!.*!h)(/private)!4%"e.&"ds&"es&#rs.%-gent-guerilla%)mountably%\'reccons',
+    ',#ism%%uance$,sceptibility%#oft".t&eacute;grale+-ress&eacute;s,$ieur0!s#!\'$#nal#)-eresting#"92#&=sting#!a$(bolatura',
+    '$#cta\'!e$%flora$!g%"li\'#ata\'#oed$%ke-as&%/week%#ing$,ngible-asset$&stella$(volatura+!e#"e-',
+    '$&esting$$fere\'#ing$,ger-floating\')/floating\'"s.%*r&eacute;e&\'ability\'+ci&oacute;n\'#das\'=l-with-time-of-absolute-error(#ism*!t\'+ted-systems*2/interdisciplinary',
+    ')0on/collaboration)0ve/collaborative(\'or/6000(#ure&!e&)in-ligand)(mediated\'#sts\'$ties(&y-loss*&minded)(/mastery%&uments$%l/ibm&%motif',
+    '&#sco\'#vr4%%386sx%\'igencia%/lec&rehy;tually(%-tual(2tual-cum-practical-#led.1iterary-reformist-(property,)/cultural-&writer,$ised.#ing-$zing',
+    '/&minded,)s/writers*!s\'\'gentsia\'#tto(#ual\'!x&!i\'*&rehy;gent\'!-\'$font\'%gance)!s("en*#ce-',
+    '-\'several-$wise.#ork,$.the,&/range,!=+"ia*%etics*"ic*\'t-metal,\'seeming+(ly-paced)#tis(3ible/unintelligible(#nce',
+    '\'%print\'%verse(#iew&"os%$ogic%%sat-v$#mal%$ised%(perately$%nable&&tional%*d/intended,$tion&+ant-general&/ed_for_the_time',
+    '(#tes\'!r%#ral%#se\'\'(-looking\'-ly-cultivated\'$ness&*ifications\'#ons\'*t&eacute;s(0y-hue-saturation*%ratio)!.\'/vely-cultivated,&farmed',
+    ',*researched-"un)$ness(#ity%&tially\'\'on/live*&result)%alism-!t),s/hypotheses%%zione$$pert%(retation$!q$/r&mdash;library',
+    '-&ibrary&+rehy;allied+-changeability,*onnections,\'ultural+.denominational+&esting+\'mediary+/nationalization+)pretation+)relations4#hip7!s+\'spersed,\'timulus',
+    '+&viewed/!s+%woven%#-80&&acting\'&frican\'(ge-group)#nce\'"id(!r\'(mericana\'%ndean\'*pplication\'$sian(#say',
+    '\'#loc)*ody-fering\'#red)"ed+#ing)$wery(%igade($oker\'\'usiness&*capitalist(#ste\'\'ellular(*ntral-bank+!e\',hangeability',
+    '\'$lubs\'$oder(%llege,$iate(!m)$mand*(onwealth*)unication-"st)&panies,)y/related(%nnect)\'sultant)(vertible(#opt',
+    '\'&ropped(#umb(%ystal-$line\')urricular(%tting&$dept\'(irectory((scipline\'\'ocument&)electoral+#ron(#ite\'\'mployer\',stablishment',
+    '&$face)&tional\'$ield("le\'$ront&&gender)\'eration\'\'lacials\'*overnental,)mentalism&*headhunter\'$uman&%irish\'&slands&%korea',
+    '(#ced($dies(&nguage\'+egitimation\'#ine*!d)$king\'%ocked&+main-cities(&rrying\'%ental\'$ixed)#ing\'$odel)#ule',
+    '(#tif\'%uslim&$open)(rability&+p&lsqb;arty\'\'aradigm*(military)%ental\'(ellation()netrating/"on((rsonally\'$hase\'#ort(&sition',
+    ')#son((ocedural+"ss&&radial(%ilers($ters\'$eact+#ion,"ve+!s((gionally(&lated.,!s+#ing(&public',
+    '\'&ositor&)satellite\'&chools\'\'easonal(\'ctorial(&ntence\'*hareholder\'&ibling("gn\')mall-town\'&ociety(\'licitor\'&peaker)$cies($orts',
+    '(%ellar($rike*!p(%udent\'&urface\'%ystem&#tel(&mporal()stamental*"er($trad(%xtual\'&heatre\'%itles\',ransformable',
+    '&(unionist))versities&%weave*#ing\'%indow\'&orking*!s(#ven&$xxxx&$year&$zone%-.departmental\'+isciplinary&(exchange%$/adv',
+    '%!a&#ct.(,ionist\'-type)/ve-compensatory.)operative,\'encoded(#ors&#lia\'#lie&&mateur\'&erican&(nimation&"rc%$band&&edding',
+    '\'%lieve&\'lending&#old&%ranch(!s\'$idge&$urst%#cal()&eacute;e($ates*+or-tethered((endrical\'\'pillary\'$tion&%eltic',
+    '\'\'ptions.-,/corrections)#ory&(hangable*+e&mdash;edi+(ableness+"es\'!i&"im\'(ty-style&%lonal\'"ub&\'ollated)#ege+$iate',
+    '((missural)%oning)*unications,"ty(\'parable\'!n(,&rehy;nected(+gregational(.nec&rehy;tions+\'tialism-,on-compliant*$xion)\'nection($sult,#ant',
+    '(\'vention*$rted,\'ibility-"ng\'%oling\'"rp(\'related+&lation\'$smos\'&unties*"ry*!y($rse.+$able&&ranial',
+    '\'%opped($sses&%sting&#uts&$ycle%$deal\'%cadal\'(fecatory(&inable*"ed\'&livery\',partmentally(*endent-the."ly\'(termined',
+    ')#ing\'\'gitated-!s\'"sc))ipliniary(*iplinarity&"oc%(eference&*ndothelial&\'s&mdash(4rehy;sengemeinschaft\'"se\'"t%()&mdash;eg/*mistresses',
+    '0!o(!-)%bound)\'freedom)*investment)#led)+maintenance)&paying).rate-conscious.\'induced.)sensitive*&elated))sensitive*&ubsidy)$type',
+    '(&:queer(&_other(&ed-not+#the*!.(+ing&rehy;an1\'looking+!/(+s&mdash;for0#p73)!.*)175&mdash)1/responsibilities)-:architecture*(shopping',
+    '**compatible*&driven*+independent*$type)"rs&%emale\'&rence\',%-free+#ing*!t)!r*!s)$with($on-1+\'induced',
+    '*%/week($ring(!s(*tilization&%icere\'"ll\'%rmlet&#low\'#ugs("ve&\'ractile&%usion%$gard&)eneration&#ift',
+    '+$ment/%alism&(radation)#ing($ting\'#ity\'$oups("wn%\'helical\')mispheric&$ouse&$uman%\'ictally&#eur)!s',
+    ')*decorating))monologue(#ise+!d*#ing)$zing("s.%.jurisdictional%%knits%\'lacings\'1ken-brunig-luzern\'&mellar\'%rding)!s\'$yers',
+    '\'\'ukin-10,!5&$iner)!s($gual*%istic($kage)&edness(!q\'!t&\'ockings(%uters*#ion*%or(s)\'%oping',
+    '&$ubke\'!x%!m&*&egrave;de&-agnetics-agra\'"le\'(ndibular\'$ting&"ed(#dle*#ing($iacy*%ries.*!t+&e-mass',
+    '-$size1!d,"ly,"s.+#ors)#um\'\'(ntpolicy\'$shes&\'icellar("ro\'(nability\'%ttant)+ently-heard\'#x\'t&&odular',
+    '\'!l\'&ndiale("th&"td&\'uscular%)na-tional\'.l-distribution)*management)(security)%trade(".i(!/)$self((isations*-m/externalism',
+    ')$ties)\'zations(!l)\'y-based+)generated+(oriented+)perceived+#run+#set,\'ilvered*!.\'\'t-ional($inal)#oal*$nal\'',
+    '.&equity.%legal.%share/\'tandard0#yle-(/foreign.&global.\'olympia/"sf.%world-%izing-(ly-based1&inding0*celebrated0+experienced',
+    '0*harmonized0*orientated6"ed0)respected0,strengthened0&traded-)superstar,"ux+!s&%ments&!s\'$hips&&tional&*ucleosomal%&office',
+    '*#tes+#ing&&rbital\',ganizational%!p&*articulate\'%tient&%eriod(4sonal-organizational\'&tation("er&%harma&*lanetarily\'\'eurites&(ol-style',
+    '0!s*#ory("is\'%situs\'!t&+resentation($tant*"te+$ion\'.!-/*algorithms/+computation:!s."s.,+ve/critical',
+    ')(er/guide+"s.,#hip)%ivism\'%ocess,"or(*fessionnel&%ublic%&quadro%\'raction\'#ter&"eg($nums\'+lationship.\'(publican',
+    ')-tion-in-depth-"al*%orily\'$utes&*uptability)+er-feedback)\'ibility*#on.%!s&$ect.)&ioning\'(gmentals\'"pt\'%sting\'#xes',
+    '&#ind)$ical&$kola&%mooth&%ocial\'#lve&#pan($rsed($tial\'%erses\'#ish\'#ort&$tage(&te-295*!s',
+    ')%nites\'&imulus("ng($tium\'$orey\'(ructural-!e&&ubject&%witch&%ystem%%tanko&\'ergites\'"st\'"xt)!s',
+    '&"ia\'$tles&#ool&&rading%\'uptions&%rbans&&terine%)val-level)\'playing)$time(/=3.5&ndash;14.2("la($sfor&%eiwed\'#ne.',
+    '(%tion.,#ary,0ist-imperialists)%rally)!u\'%rsion&$ierw(%w-but*$data+%riven*%forms*)portraits*&skills*$type)#.he',
+    '*&alison*(chatshow*$hold*)overnight*!s)(ed/janet*,r-researcher+,/researchers*"se)(ing-room,!/)%s-the*)/features&*ocalically%\'warring',
+    '("ld%$zinc&$onal$"st&$aces&&icular\'(nal-type*"is*\'mucosal((e-strewn(!g(#lam$#tah%$inal##has',
+    '$+ralenthropy#+i&rehy;mate$$ally&!s%$ting\'#ves$%fadah$(macy/the&\'te-like)&scaled*\'ounding(%ly-in+\'related+"so%#ida',
+    '-!6&"st(!e%"us$%rfire$%telis%#led%$uled$"ut#!l#+o&mdash;and$!-%$each%(laughter%*themselves',
+    '\'#ree&"wo$$/out$1_,_into_line_with%$each$)lerances.%\'leranza$#ner%$ings$&rivals%"no$#uch$\'xicates)%ingly#&preted',
+    '+&ocular%\'-agency\'#nal(!d\'%ortal\'\'retrial\'!s&)base-pair)"is\'$lack\'+ureaucratic&\'carotid\'\'erebral\'(hristian\'#lan',
+    '(&mmunal(+ntractually(%untry\'\'ratonic(%ystal-$line\'(uticular&#day\')epartment()terminacy\'+iscursively&#eec\'%mbryo($pire\'%urope',
+    '&$indu&(language\')inguistic&$male((ndibular(%rital)$xist\'(olecular\')ujaheddin(&scular."ly&\'nasally\',eighbourhood\'#ode(!t',
+    '\'#ecd\'/rganizationally&\'parcham)*liamentary&%rater\'#eef($form&+secretariat((ntential\'&pecies+#fic\'$taff&(temporal(\'xtually\'&heatre',
+    '\'#ord%$bloc%\'carotid&\'ervical&(isternal&$lass\'%uster&-ongregational&$rown&*utaneously&%ystic\'+toplasmatic%#das&\'ermally&%uctal',
+    '%\'enteric%$face\'\'llopian\'&miliar&)ollicular\')rmational%(galactic\'$stic\'#tic&&eneric%*laboratory&)euminally&)inguistic\'#pid&%umina',
+    '%\'mammary&(edullary\'(mbranous&*olecularly\'%ntane&(ucosally\'%sical%$nced&#sig)$ency-!.+"te(&tively&!t\'!s',
+    '%.organizational&&sseous%!p&\'article)!y&(ithelial&\'olation&\'reneurs-#hip&\'sychic\'&(ulmonary%"re\'&ctally\'#nal\'%tinal',
+    '&(egmental&\'keletal&%pinal&&tromal&&ubject%&thymic&\'racheal%&umoral%\'vaginal\'%lence\'(scularly&%enour(+tricularily\'\'sicular%(witanunt',
+    '$$eate(!d\'#ing%)pretation$!i%2cately-embroidered,\'moulded(#ing)"on("ly%.guing-sounding*(ly-named%&nsecus\'-ic/artificial)#aly',
+    '$/o&rehy;ductions+%spect%)-european&$line&\'uterine%$.pre&#res&#s01(!2(!3(!4(!5(!6(!7(!8',
+    '\'"10%&d-uced&!.&!u\'!c()&rehy;ing(/ed&mdash;indeed)#ing((tion/job/"hn)$ory\'%#ibo%%jects%\'mission%)n-encoded',
+    '(#oss&$less%)spectably*#ing*!s\'$icio%\'uvables$\'uder(s)((_because%1sive/uninterested$$vals##sia$%talls%$inal#$ueor',
+    '*(thinking&!s$"ne$!s$$tion#$v.he#!y"!u#&agural#$endo$"st#\'jurious#&ktituk#&nction$\'dations',
+    '#%tiles&"is##vik"\'vadable$\'ginates)#ing$!l%\'id-care(#ity(\'nursing(.on-the-sickbed\'#ing($tity\'"ly%&lyball',
+    '$%rably$#sio\'+n&mdash;and/#has(!\'(&-fleet("s.&$vely#!e$$ctif\'"va$,nci&oacute;n%%iendo&!t%\'t-solid',
+    '&#ed\'\'!r&"id\'!o("ne&%orial)"um()y-keeping)#ing&$ress$(olvement$\'railort%&choran%"ek%\'garroch',
+    '&%orden\'$wrie%$hope%%inate%%leven%&mectin%%naver&(ess-kyle*&london*$wick)$hire)%shire%$oran%#roy%&sander',
+    ')%quare(%video&+ion-related&$naid%(t-keeper&-ebrate-eating\'-d-pear-shaped&\'ibrates\'#ons%$vals$!s%.&rehy;tigating%)itigating%)t-igation\'$tech',
+    '&!i\'"cl\'-ga&rehy;tions0#ors)#ble)&ciones)&tatory*"e.,#the+"as+"d.*,ing/research+$ones-\'s-cheap.*/treatment',
+    '+)r-general-#led,"s.\'#ons&%ment\'**-appraisal+$bank/-ers-turned-ir-#sed+*equivalent+)intensity+&linked+*management+$need+&people',
+    '.\'tection+\'starved+%trust*+/healthcare*"s.&%or(s)(\'-driven))initiated(!.(+/developers)&owners(,s&mdash;fell)!.*#the)!/',
+    '&&tments&%ygate$%tment%%riata%)sigations$\'vitable#(iability$&dually$$erno%/w-understanding$7gilation/administration$,ncible-class$(si-block&*bility-and*$zing',
+    '%\'tigated$!t%$aion&%tion.*"s.+(/service\'%ories%#ed.(#the%+ing-looking%"ro#!o$%catio$)errechten$!i',
+    '\'*/statement\'*s/receipts$$kees&!r$#led%$tini%#unt(%arism*"y-&"te(!s%\'ved-and(!/)"in(!_',
+    '\'"me)\'nt-calm+!.$(nvenient$#ved".ward-battering($ound\'\'curving\'\'opening(\'riented\'&seeing\'\'turning&(/outward&+ly-directed$#ser',
+    '##ins#%quest")xs(style)$&-style"%yanza"!z#0amam-ul&rehy;haq\'!s#&ermito!%o-720"$.sys"%anian%#nna$$nina$#the',
+    '#!u"\'d=6.5cm##ida%*e-specific&!.&!s$!n%&e-1.31("29("32\'"29#.o-deoxyuridine$)acetamide$"de$$form',
+    '$&metric$)thalamate"!f"!i"!j"%lanta$!s"&mmelli#$pair"*n-assisted$%based$*deposition$&energy%(xchanges$%state',
+    '#"az#)escoesque&)u-quintus#.ic-bombardment&$type$%sable%"es$$zers&!s##nes#&omeric%$ycin$-phore-induced%$olis#"s.',
+    '""ps"%rdana##eth#"io"%s3270#"is"#tti#"um"#uer#"is##nge"&versol$/tz-tereshchenko#$iani"#wan',
+    '"%xynil"!y#$full!,p&aacute;rhi"%(lab)#$srs)""-1#&fakoum##sdp"!."#/mp""17"2261838.627.260,826"!3#!0',
+    '#!3"!7"%a/ipm#$nima#$tyev"\'c-based##s/e"#ero#!x""f1#!4"%heion#-ig&eacute;nie%$enie#!y',
+    '#&l-ipil"!k"\'lb-sf21""ma"!n"#oto""pa$!c#&egrave$!l#!i#%leden%#ton#-opotamo-vasca")ratropium',
+    '#"/2##a-1%!2&".6$$tive#!c#/den/oxfordshire#"er#%leigh#&ophagy#"us#)wich-born(%leeds\'(/norwich\'!0',
+    '\'#ian*!s""ta#+g-inducible"#ut\'"+x-compliant$$type#$/stx!"q-#"iq""bo"#ilm""rs"%tisad!+r&egrave;ne',
+    '))1,772,100+\'940,852,"50*#.04,"6m+#25m,!8,!m+!5,!m+!6*!0+".3,"99+%7,000',
+    '+!m*$3.5m*$4.99*"50,$,000,!m*#6.5-!0*#8.4*!9+".0+#7.3)12,500&ndash;3,000*".2,!m',
+    '+$,000+%0,000*&12,000+#9.1*#37m*#40m*%5,000*%6.267*$73.6*$92.1)%3,000*".3*!0+-&ndash;40,000+!0',
+    '*#2.0*#5.0*#7.4*#9.4)\'418,000*)2,553,000+%6,000*%8.10m)%5,000+\'292,000*".7*&12,000*#4.6))6,742,000*".5',
+    '+!6+!9*$4.7m*&72,000)%7.16m+#235*#1.4*!3+"1m*&50,000)#8.8*#41m*&53,000*&73,000)$91.6',
+    '""+r"!-#(emitting#!r"(/pol/soc#%raman")1,430,000$\'587,000#$0.00#"10##30p#!6"%20.5p$!p#%5,000',
+    '$\'500,000#&00,000")5,596,000#%9.25p"\'600,000""73"&81,000")a-related#$chta##gua#!i#!k$"ly#"la#"n*',
+    '%&backed&$ound%%india&*raq-turkey%#new%%saudi%"uk$%98n/a$#air%#mok$)i/medical%+an-american($flag(%iraqi-%-icrc',
+    '((japanese(&linked()organized(#run(\'turkish("uk%"ca%!s#%puato#*q&mdash;an$\'-backed%$gate%&jordan%%korea%\'related',
+    '$!/%$iran%\'turkish$(i-backed\'#orn&$held&\'iranian&(occupied&*registered&%saudi%&178n/a%&40+n/a%%52n/a&$5n/a%&n/a320',
+    '$&shaikh#.s-araki-alcock#!y"&berger#"id#!m$!s#"us"#das##ial#!s"\'e-based#"ad#0dale/oxfordshire#$gret',
+    '%!n&-d&mdash;where\'"\'\'\'%-born(&german(%italy(+originating(*registered\'#.it\'"17(!9\'!2\'%aises\'"er$"li',
+    '$"ea%!u&"sz#!x"$f740#"on$#rme"!g"!h"(iandeses%!s$$rtea##dae%"ni$$esce',
+    '%%scent%+um/platinum$"on#!e#\'garayan$+oyenforeign#%mescu#"ni#!o$!n#"ri#*s-breeding%$like%%roots$#/gl',
+    '$)h-british\'$uilt&&french&)generated&&origin&,scandinavian(&ottish\'\'ounding&&united%,/anglo-irish&&gallic&%scots%%women%!y$#ing',
+    '#"x\'"%kalla#&somely\'$ness#.utsk-fairbanks\'!."#lam$#nda#%eland"#mas#%ngard#!o"$n&gt#$-bru#!e',
+    '"$obin#"da#"ij#/n&rehy;smelting$.(ii)-bleomycin$$-and(&-steel%#bed&%laded%\'casting&&entres&%lawed&#old\'%mplex,#es.',
+    '%(depleted\'%rived&#ust%$edta%(fastened&&errous&%iling\'"st&&ronted($sted%$gall&%irder%&handed)#led&%eaded',
+    '&%ulled&(ydroxide%%jawed%%laced%&making\'%sters%(outlined%(panelled&&ierced&&ointed%(refining&#ing%(slitting&\'mithing&%piked',
+    '%)to-copper&$yred%\'wheeled&#ill&#ork)#ers$*/applewood%-oven/electric%&tannin$%crest$\'founder+!s$&glaive$0ing-board-shaped(%table',
+    '%&sation&"ed\'!s&!h&#ing$\'s/trust%#hod%.ide/co-trustee$#ton&"wn$%ville$$ware%%eight%%orker(#ing',
+    '#"ri#"us")pc-hinton#$inia#!s"(radiates(\'ionally+!s&(fication$\'tional\'*!.*!e*$ity.*!s#&ealism',
+    '3!y\'-cil&rehy;able&*verability$)deemables&#nta(#ism%+ucibilities$*futability$-gular-looking*%sided)$ites+$ies.(#ted$!l%%ation',
+    '%\'evant.4%*igiousness$+mediability%)ovability$(peatable%\'lacable%!r&(oducible$)sepective%\'istably%(o-lution&%lute.%)ponsible--!.*"ve',
+    '$&velant&$rant\'$ents\'&sibly.)$vely#$iacs$%denta%#ium$(gational*!s%$uous$*tabilities\'*le-looking&(ted/like\'=ing/disappointing/unfortunate',
+    '("ve#%orata#(relevant#!s#!u$%pting&!s"$s-1a%!b#$acae#%igier""ta#!e#$hing\'#ton',
+    '#$egas#"ka#!n$(-hendaye#$reta#!s"!v#0&uuml&uuml;dzijn#\'inebank%$g.in&\'/former\')historian&$ites&%stown"#wan',
+    '%#ian&!i%!s!\'s&amp;t#$gt;0#llowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar$#t;0#)mdash;and)\'because)#can)/tested&mdash;by)$what#%ndash(%;only#)pound;650',
+    '#!/#"nt"!-#"24#%a-bel$!s#\'correct#&isodry%$rael$!t#$ness#"on#0she-or-isn\'t-she#$that\'.-a-he-or-a-she',
+    '&/-haddock-finnan%%ought#$what%#ere"".2#$even#)generally#$here#&little#(probably#&rising#"so")/director#%ought#"to',
+    '$$ould#$your"!0#$9660"!1#%0,600$%7,000#"10$\'51-like#%2,300#"99"&2.1888$$5522#!0#%1,000',
+    '$)2,000,000""32"%4,100$#300"+500,000,000"%6,700#%4,000#%6,500#&packed"%9,000#&00-and$\'2-based"":l"(_a_great$"ll',
+    '$&s_long$!t#\'because#(in_spite&)the_light\'$ouch##out$#ver#$sort"\'a-based#(/esa-bus#!a$\'c-henry%!h#(bel-line',
+    '&*/edinburgh\'\'glasgow&!a&"ia&!l\'"as\'#ine(%ssima("ta#%chson$!k%!s##dor##eus#$gree',
+    '##ias$"os#"ka$$ovic \'kiathas',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_73 = (
+count_73 = 6694
+
+heads_73 = (
     'hempbearing',
-    'hempe',
-    'hempelier',
-    'hempenspun',
-    'hempenstall',
-    'hempnall',
-    'hemprichii',
-    'hempsall',
-    'hemsbach',
-    'hemsedal',
-    'hemsiphere',
-    'hemslojdens',
-    'hemslow',
-    'hemut',
-    'hemwood/street',
-    'hen&mdash',
     'hen&ndash;poured',
-    'hen\'s-legged',
-    'hen-coop',
-    'hen-coops',
-    'hen-kely-arn-oos',
-    'hen-pheasant-like',
-    'hen-stealing',
-    'hen-yard',
-    'henables',
-    'henares',
-    'hence&rehy;forward',
-    'hence\'',
-    'hence*',
-    'hencewith',
-    'henches',
-    'henchie',
     'henching',
-    'henchmoles',
-    'henckel',
-    'henckelianus',
-    'hencliff',
-    'hendawi',
-    'hendekovi&cacute',
-    'henden',
-    'henderon',
-    'henderson-russell',
-    'henderson.',
-    'henderson/actor',
-    'henderson/age',
-    'henderson/association',
-    'henderson/mother',
-    'henderson/raf',
     'henderson/rfu',
-    'henderson/station',
-    'henderson/tenant',
-    'hendersonville',
-    'hendi',
-    'hendo',
-    'hendon\'',
-    'hendon-based',
-    'hendrefoilan',
-    'hendregadredd',
-    'hendrey',
-    'hendrickson-lattman',
-    'hendricksons',
-    'hendrickz',
-    'hendring',
-    'hendrix-derived',
     'hendrix-stones-byrds',
-    'hendrix-y',
-    'hendrix/b.b.king',
-    'hendrixy',
-    'hendry/jobless',
-    'hene',
-    'heneker',
-    'henelik',
-    'henenhopher',
-    'henes',
-    'henessey',
-    'henesy',
-    'hengeli',
-    'henggao',
-    'hengl',
-    'hengrove',
     'hengstler',
-    'hengwrt',
-    'henham',
-    'henhouses.',
-    'henia',
-    'henigan',
-    'henige',
-    'henkan',
-    'henkell',
-    'henkin',
-    'henknowle',
-    'henlan',
-    'henleaze',
-    'henlein',
-    'henley-based',
-    'henley-on-thames/oxfordshire',
     'henley-upon-avon',
-    'henleys',
-    'henman/british',
-    'henman/farmer',
-    'henna-headed',
-    'henna-stained',
-    'hennah/maintenance',
-    'hennard',
-    'hennart',
-    'hennen',
-    'henneoo',
-    'hennery',
-    'hennessey/jubilee',
-    'hennessy/leisure',
-    'hennigan',
-    'hennigian',
     'hennigsdorf',
-    'hennin',
-    'hennings',
-    'henningsvaer',
-    'hennins',
-    'hennoch-sch&ouml;nleins',
-    'hennus',
-    'hennypenny',
-    'henon',
-    'henpeck',
-    'henquire',
-    'henr',
-    'henrad',
-    'henri-fabre',
-    'henri-irenee',
-    'henri-leonard',
     'henri-levy',
-    'henric',
-    'henrich',
-    'henrichson',
-    'henricis',
-    'henricks',
-    'henrico',
-    'henrikh',
-    'henriques/owner',
-    'henriqueta',
-    'henriquez',
-    'henry-',
-    'henry/fair',
-    'henry/northamptonshire',
-    'henryson',
-    'henryspublic',
     'hensall',
-    'hensbergen',
-    'henschil',
-    'hensels',
-    'henselt',
-    'henshaw/development',
-    'henshit',
-    'hensingham',
-    'hensler',
-    'henslowe',
-    'henson/rare',
-    'hensons',
-    'hensprawn',
-    'henstead',
-    'henstridge',
-    'henthusiasm',
     'hentin',
-    'henton',
-    'hentschel',
-    'henwick',
-    'heny',
-    'henyard',
-    'henzell',
-    'heogan',
-    'heol-y-brenin',
-    'heora',
-    'heos',
-    'hep-cats',
-    'hep-halkin',
-    'hepa',
-    'hepadnavirus',
-    'heparan-sulphate-proteoglycan',
     'heparin-bovine',
-    'heparin-bsa/vcam-1',
-    'heparin-like',
-    'heparin-treated',
-    'heparinas',
-    'heparitis',
-    'hepatectomized',
-    'hepatic-rich',
-    'hepaticojejunal',
-    'hepatioiminodiacetic',
-    'hepatitic',
-    'hepatitis-a',
-    'hepatitis-associated',
-    'hepatitis-b',
-    'hepatitus',
-    'hepatoblastoma',
     'hepatocyte-binding',
-    'hepatocytotoxic',
-    'hepatoencephalopathy',
-    'hepatofugal',
-    'hepatogastroenterology',
-    'hepatojugular',
-    'hepatologist',
-    'hepatopathy/hepatic',
-    'hepatopetal',
-    'hepatosplenomegaly',
-    'hepb',
-    'hepburn-style',
-    'hepburne-scott',
-    'hepcats',
-    'hepe',
-    'hepenstall',
     'hepes-koh',
-    'hepes-koh(7.7)',
-    'hephaestion',
-    'hephaestos',
-    'hephzibah',
-    'heping',
-    'heppard',
-    'heppell',
-    'hepplethwaite',
-    'hepta',
-    'heptachlor',
-    'heptad',
-    'heptafluorobutyryl',
-    'heptalobum',
-    'heptane',
-    'heptapeta',
     'heptateuch',
-    'heptateuchum',
-    'heptathlete',
-    'heptinstall',
-    'hepworths',
-    'hequi',
-    'her&mdash;aunt',
-    'her&mdash;that',
-    'her&mdash;they',
-    'her&mdash;what',
-    'her&rehy;it',
-    'her&rehy;the',
-    'her-\'we',
-    'her-2/neu',
-    'her-and',
-    'her-as',
     'her-awed',
-    'her-disability',
-    'her-hair',
-    'her-head',
-    'her-name',
-    'her-on',
-    'her-pampered',
-    'her-she',
-    'her-so',
-    'her-thank',
-    'her-that',
-    'her-to',
-    'her-today-gone-tomorrow',
-    'her-until',
-    'her-why',
-    'her.',
     'her.e',
-    'her.elbows',
-    'her.now',
-    'her.she',
-    'her.straight',
-    'her.their',
-    'her.they',
-    'her/columbia',
-    'her/dash',
-    'her_a',
-    'her_as',
-    'her_in_respect',
-    'her_on',
-    'her_so',
-    'hera-temple',
-    'heracla',
     'heraclitean',
-    'herad',
-    'heraeus',
-    'heraion',
-    'herakl&egrave;s',
-    'herakleid',
-    'herakleitian',
-    'heraklid',
-    'heraklides',
-    'heraklith-m-original',
-    'herald-at-arms',
-    'herald-painters',
-    'herald-sun',
-    'herald-tribune',
-    'heraldica',
-    'heraldicum',
     'heraldist',
-    'heraldos',
-    'heraline',
-    'herapath',
-    'herard',
-    'herastau',
-    'herati-design',
-    'heraty',
-    'herauscorritsehe',
-    'herawi',
-    'herb-eating',
-    'herb-flavoured',
-    'herb-gardens',
-    'herb-robert',
-    'herb-smelling',
-    'herb-steeped',
     'herba',
-    'herbal&rehy;ism',
-    'herbally-based',
-    'herbarium-library',
-    'herbarium/',
-    'herbart',
-    'herbary',
-    'herbenov&aacute',
-    'herber',
-    'herberg',
-    'herbert-gustar',
-    'herbert/father',
-    'herbert/racing',
-    'herbertshire',
-    'herbesthal',
-    'herbevois',
     'herbicide-',
-    'herbig',
-    'herbig-haro',
-    'herbivora',
-    'herblay',
-    'herblock',
-    'herbodeau',
-    'herboriser',
-    'herbvale',
-    'herceg-bosne',
-    'hercegovian',
-    'hercegovinians',
-    'herchel',
-    'hercology',
-    'herculanensis',
-    'herculiani',
     'hercy',
-    'hercynides',
-    'herd&rehy;management',
-    'herd-designed',
-    'herd-living',
-    'herd-mate',
-    'herd-mates',
-    'herd-of-sheep',
-    'herdboy',
-    'herdboys',
-    'herdson',
-    'herdspeople',
-    'herdswomen',
-    'herdubreid',
-    'herdwise',
-    'herdwyke',
     'herdwyks',
-    'here&mdash;upstairs&mdash;but',
-    'here&mdash;we',
-    'here&rehy;and-now',
-    'here-all',
-    'here-different',
-    'here-elements',
-    'here-no',
-    'here-the',
-    'here-under',
-    'here.if',
-    'here.now',
-    'here.nuclear',
-    'here/',
-    'here/amid',
-    'here/get',
     'here/go',
-    'here=',
-    'here_as',
-    'here_in',
-    'here_so',
-    'herebefore',
-    'herebert',
-    'heredem',
-    'herediacommunications',
-    'heredibus',
-    'hereditability',
-    'hereditable',
-    'hereditaire',
-    'hereditarianism',
-    'hereditas',
-    'hereditatem',
     'hereditatis',
-    'heredity/',
-    'hereford-shrewsbury-newport',
-    'hereford-worcester',
-    'hereford.at',
-    'hereford.bulmers',
-    'hereford.the',
-    'hereford/conservative',
-    'herefordian',
-    'herefordians',
-    'herefordshire.',
-    'herefordshire/wales',
-    'herefordshire/welsh',
-    'hereforshire',
-    'herefs.',
-    'heregeld',
     'heremon',
-    'herend',
-    'herengracht',
-    'herennium',
-    'hereric',
-    'hererocallis',
-    'heresam',
-    'heresiarch',
-    'heresiarchs',
-    'hereswith',
-    'heretere',
-    'heretically',
-    'heretord',
-    'heretuanga',
-    'hereu',
-    'herewi',
     'herf',
-    'herfindahl-hirschman',
-    'herfordshire',
-    'herfs',
-    'hergen',
-    'hergert',
-    'herget',
-    'hergig',
-    'hergott',
-    'herhard',
-    'herian',
-    'heriard-dubreuil',
-    'heribert',
-    'heric',
-    'herisau',
-    'heritability.',
     'heritable.',
-    'heritably',
-    'heritage.',
-    'heritage/repeat',
-    'herken',
-    'herkes',
-    'herks',
-    'herlev',
-    'herleva',
-    'herlevestorp',
-    'herlihy',
-    'herlin',
-    'herm&egrave;s-style',
-    'herm&iacute;nio',
-    'hermada',
-    'hermaeia',
     'hermand',
-    'hermanek',
-    'hermanfrid',
-    'hermanns',
-    'hermanowicz',
-    'hermans',
-    'hermansson',
-    'hermaphordits',
-    'hermaphroditum',
-    'hermas',
-    'herme&rehy;neutics',
-    'hermeneus',
-    'hermeneutically',
-    'herment',
-    'hermetica',
-    'hermeticizing',
     'hermeticum',
-    'hermetray',
-    'hermida',
-    'herminie',
-    'herminio',
-    'hermippus',
-    'hermitess',
-    'hermoa',
-    'hermodice',
-    'hermodorus',
-    'hermogenianus',
-    'hermon-hodge',
-    'hermon-taylor',
-    'hermon/barfly',
-    'hermopoulos',
-    'hermosilla',
     'hermoza',
-    'hermsprong',
-    'hern&aacute;ndez-piju&aacute;n',
-    'hernad',
-    'hernan',
-    'hernandez\'',
-    'hernerdon',
-    'herniae',
-    'herniate',
-    'herniated',
-    'herniation',
-    'hernieuwde',
-    'hernriksen',
-    'hero\'&dollar',
-    'hero-candidacy',
-    'hero-figure',
     'hero-gods',
-    'hero-kings',
-    'hero-literature',
-    'hero-making',
-    'hero-murderer',
-    'hero-pash',
-    'hero-policemen',
-    'hero-tribute',
-    'hero-victim',
-    'hero-worships',
-    'hero/chat',
-    'hero/columbia',
-    'hero/ine',
-    'hero/ines',
-    'hero/narrator',
-    'herobbed',
     'herod-like',
-    'herodians',
-    'herodicus',
-    'heroditus',
-    'herods',
-    'heroes-type',
-    'heroes.one',
-    'heroes/do',
-    'herograms',
-    'heroicks',
-    'heroilotus',
-    'heroin-addicted',
-    'heroin-addicts',
-    'heroin-dependent',
-    'heroin-induced',
-    'heroin-taking',
     'heroin.',
-    'heroina',
-    'heroine-',
-    'heroing',
-    'heroised',
-    'heroization',
-    'heron\'s-eye',
-    'heronbridge',
-    'heronim',
-    'heroslabour',
-    'herotilapia',
-    'herpatitis',
-    'herpesvirus',
-    'herpetalogists',
-    'herpex',
-    'herptile',
     'herptiles',
-    'herr&rehy;schaft',
-    'herrara',
-    'herrenberg',
-    'herrenhausen',
-    'herrenknecht',
-    'herrenstube',
-    'herrenweg',
-    'herrerasaurids',
-    'herrero',
-    'herreros',
-    'herres&aacute;nchez',
-    'herreshof',
-    'herrg&aring;rd',
-    'herricks',
-    'herrie-special',
     'herriman',
-    'herrin\'',
-    'herring-boat',
-    'herring-boats',
-    'herring-bone-brick',
-    'herring-boning',
-    'herring-boxes',
-    'herring-fishing',
-    'herring-gull',
-    'herring/surfer',
-    'herringbone-brick',
-    'herringbone-patterned',
-    'herringcote',
-    'herringstone',
-    'herringthorpe',
-    'herriot-watt',
     'herrison',
-    'herrity',
-    'herrlein\'',
-    'herrman',
-    'herrnstadt',
-    'herrs',
-    'herrtage',
-    'herryng',
-    'hersdman',
-    'herse',
-    'herseelf',
-    'herself&mdash;it',
-    'herself&mdash;people',
-    'herself&mdash;principles',
-    'herself-but',
-    'herselfas',
     'herselfness',
-    'herselfstarting',
-    'hersen',
-    'hersey/best',
-    'hershebar',
-    'hershel',
-    'hershelle',
-    'hershon',
-    'hersleth',
-    'herson/eyetalk',
-    'herspear',
-    'herst/stafford',
-    'herstmonceaux',
-    'herstmonceux/wartling',
-    'herstories',
-    'hertale',
     'hertenstein',
-    'herter',
-    'hertfordlythe',
-    'herthumbs',
-    'hertneck',
-    'herts-based',
-    'herts-beds-cambs',
-    'herts/south',
-    'hertv&iacute;k',
-    'hertwig',
-    'herty',
-    'hertzberg',
-    'hertziana',
-    'hertzl',
-    'hertzog',
-    'hertzsprung-russell',
     'herule',
-    'herules',
-    'herunga',
-    'hervert',
-    'herveys',
-    'hervo',
-    'hervovie',
-    'herwardi',
-    'herwarth',
-    'herye',
-    'herzeg-bosna',
-    'herzgewachse',
-    'herzi',
-    'herziana',
-    'herzlinger',
-    'herzliyya',
     'herzmark',
-    'herzogenaurach',
-    'herzogschloss',
-    'herzogstra&szlig;e',
-    'heschel',
-    'hesdin',
-    'hesdins',
-    'hese',
-    'hesees',
-    'heselden',
-    'heseltax',
-    'heseltine.',
-    'hesford',
-    'heshemite',
-    'hesi',
-    'hesi&rehy;tate',
     'hesistated',
-    'hesitancy.',
-    'hesitant/fluent',
-    'hesititation',
-    'heskeith',
-    'hesket',
-    'heskeths',
-    'heskins',
-    'heslegrave/conservator/forestry',
-    'heslin',
-    'heslip',
-    'hesltine',
-    'hesoun',
-    'hespan',
-    'hesper',
-    'hesperopithecus',
     'hesperornis',
-    'hesperos',
-    'hess-luttich',
-    'hessdalen',
-    'hesse-doflein',
-    'hesse-kassel',
-    'hessellberth',
-    'hessels',
-    'hesseltine',
-    'hesses',
-    'hessey',
-    'hessian-backed',
-    'hessian-screen',
-    'hessian-wrapped',
-    'hesston',
-    'hest&ouml;fjordur',
     'hester/headmaster',
-    'hesterberg',
-    'hestfj&ouml;rdur',
-    'hestor',
-    'hesworth',
-    'hesychius',
-    'het_up',
-    'hetaera',
-    'hetaerae',
-    'hetaira',
-    'hetairia',
-    'hetcher',
-    'hetebrij',
-    'hetep-heres',
-    'heterarchically',
-    'heteratopia',
     'hetermorphs',
-    'hetero-binuclear',
-    'hetero-dimeric',
-    'hetero-dithering',
-    'hetero-fila',
-    'hetero-homo-gay',
-    'heteroatomic',
-    'heteroatoms',
-    'heterocercal',
-    'heterochain',
-    'heterocycle',
-    'heterocycles',
-    'heterocyclics',
-    'heterodimerisation',
-    'heterodimerised',
-    'heterodimerize',
     'heterodoxy/orthodoxy',
-    'heteroduplexes',
-    'heterodymers',
-    'heterogametic',
-    'heterogeneity=',
-    'heteroglossic',
-    'heteroglot',
-    'heterojunction',
-    'heterojunctions',
-    'heteromorph',
-    'heteromorphic',
-    'heteronomously',
-    'heterophonic',
-    'heteropolymer',
-    'heteroscedastic',
-    'heteroscedasticity',
     'heterosexual/lesbian',
-    'heterosexuality\'',
-    'heterosexuality/homosexuality',
-    'heterospective',
-    'heterothermy',
-    'heterotis',
-    'heterotrimer',
-    'heterotypic',
-    'hetford',
-    'hethcote',
-    'hethersett',
-    'heti\'i',
-    'hetmans',
-    'hetoimaridas',
-    'hetroinura',
-    'hettangian',
     'hettstedt',
-    'heturi',
-    'hetzel',
-    'heuber',
-    'heuberg',
-    'heuchtar',
-    'heuchter',
-    'heudelotti',
-    'heuen',
-    'heuglini',
-    'heuhera',
-    'heulandite',
-    'heuliez-developed',
-    'heulog',
-    'heuneberg',
-    'heuneburg',
     'heung',
-    'heurigen',
-    'heuristic-based',
-    'heurt&eacute',
-    'heusinger',
-    'heussen',
-    'heuvel',
-    'heux',
-    'hevea',
-    'hevede',
-    'hevene',
-    'hevenly',
-    'heversham',
-    'heveryone',
-    'hevesi/anorexics',
-    'hevican',
     'hevidence',
-    'hevily',
-    'heving',
-    'hevron',
-    'hevy',
-    'hevyn',
-    'hevynesse',
-    'hewanorra',
-    'hewd',
-    'hewell',
-    'hewelsfield',
-    'hewett-packard',
-    'hewick',
-    'hewin',
-    'hewins/fireman',
-    'hewit',
     'hewitt/church',
-    'hewitt/penguin',
-    'hewitt/sara',
-    'hewkins',
-    'hewlett-',
-    'hewlett-packard/apollo',
-    'hewlings',
-    'hewlitt',
-    'hewo',
-    'hews',
-    'hewxham',
-    'hex&rehy;nodes',
-    'hex-section',
-    'hexa-ex',
-    'hexachloroantimonate',
-    'hexachlorobutadiene',
     'hexachlorometallate',
-    'hexachord',
-    'hexacorallia',
-    'hexactinellid',
-    'hexafluoroarsenate',
-    'hexagulaconulariids',
-    'hexameron',
-    'hexameter-lines',
-    'hexamethyldisilazine:trimethylchlorosilane',
-    'hexamitiasis',
-    'hexane:isopropanol',
-    'hexanoic',
-    'hexanucleotide',
-    'hexanucleotides',
-    'hexaplas',
-    'hexar',
     'hexateuch',
-    'hexatonic',
-    'hexed',
-    'hexham-alston',
-    'hexhamshire',
-    'hexi',
-    'hexley',
-    'hexnodes',
-    'hexokinase-phosphofructokinase',
-    'hexose-dominance',
-    'hexose-monophosphate',
-    'hexose-rich',
-    'hexosedominated',
-    'hexxus',
-    'hey-hey',
-    'hey-hey-hey',
     'hey-ho',
-    'hey-nonny-no',
-    'heyberd',
-    'heyde',
-    'heydebrand',
-    'heyderman',
-    'heyes-farringdon',
-    'heyfelder',
-    'heyford.eyewitnesses',
-    'heyhoe',
-    'heyi',
-    'heyl',
-    'heylen',
-    'heyling',
-    'heymeyer',
-    'heymouthians',
     'heyning',
-    'heynous',
-    'heyoom',
-    'heysi',
-    'heysing',
-    'heyslop',
-    'heythorp',
-    'heythorpe',
-    'heywood-lonsdale',
-    'hezarfenn',
-    'hezb-i',
-    'hezb-ul-mujahedeen',
-    'hezbollah-amal',
-    'hezbollah-controlled',
-    'hezbollah-palestine',
-    'hezbollahreleased',
     'hf&amp;f',
-    'hf\'',
-    'hf-h',
-    'hf-hollowfibre',
-    'hf225',
-    'hf6+',
-    'hf9',
-    'hfa',
-    'hfc-125',
-    'hfd',
-    'hfi',
-    'hfrh',
-    'hg&times;2',
-    'hg/s',
-    'hg5',
-    'hgca',
     'hgi',
-    'hgiher',
-    'hgj',
-    'hgmp',
-    'hgqm',
-    'hgscit',
-    'hgt1',
-    'hh&ndash;43',
-    'hh.mm',
-    'hh1/2',
-    'hhave',
-    'hhfd',
-    'hhh-train',
-    'hhhh',
-    'hhhhhssssuh',
-    'hhi',
     'hhk150',
-    'hhm',
-    'hhmi',
-    'hhnn',
-    'hholodnoi',
-    'hi&ndash',
-    'hi&ndash;her',
-    'hi&pgr;-issue',
-    'hi&rarr;ch',
-    'hi+',
-    'hi-599ct',
-    'hi-abrasion',
-    'hi-band',
-    'hi-c',
-    'hi-cal',
-    'hi-de-ho',
     'hi-de-yo-ho-ho',
-    'hi-decibelled',
-    'hi-desk',
-    'hi-do-ho',
-    'hi-energy',
-    'hi-falutin',
-    'hi-fat',
-    'hi-fi-vid',
-    'hi-fi/tv',
-    'hi-fidelity',
-    'hi-five',
-    'hi-fli',
-    'hi-frith',
-    'hi-grip',
-    'hi-hats',
-    'hi-head',
     'hi-heel',
-    'hi-hi-loft',
-    'hi-impact',
-    'hi-jackings',
-    'hi-linker',
-    'hi-lite',
-    'hi-lites',
-    'hi-lux',
-    'hi-marketing',
-    'hi-memory',
-    'hi-mid',
-    'hi-pass',
-    'hi-scorez',
-    'hi-shear',
-    'hi-shine',
-    'hi-spot',
     'hi-stak',
-    'hi-start',
-    'hi-tails',
-    'hi-tops',
-    'hi-volt',
-    'hi-voltage',
-    'hi-watts',
-    'hiaasen',
-    'hiab',
-    'hiace-type',
-    'hialeah',
-    'hiant',
-    'hiatel',
-    'hiatt-bring',
-    'hiatuses',
-    'hiatusplasty',
     'hib&commat;igc.org',
-    'hibar',
-    'hibberd/gloucestershire',
-    'hibbert-ware',
-    'hibbing',
-    'hibbins',
-    'hibbitt',
-    'hibbs/dancer',
-    'hibees',
-    'hibemating',
-    'hibernates',
-    'hibernatory',
-    'hiberniae',
-    'hibernians',
-    'hibernica',
-    'hibis',
     'hibiscrub',
-    'hibitane',
-    'hibiya',
-    'hibon',
-    'hibou',
-    'hibrn8.dat',
-    'hibs/last',
-    'hiccupy',
-    'hichcock',
-    'hickenlooper',
-    'hickey/british',
-    'hickford',
-    'hickie',
-    'hickies',
-    'hicking',
-    'hickl',
     'hickley',
-    'hickmet',
-    'hickory-smoked',
-    'hicks-mudd',
-    'hicks/border',
-    'hicks/businessman',
-    'hicks/hooper',
-    'hickses',
-    'hicksian',
-    'hicktown',
-    'hickwood',
-    'hicky',
-    'hicock',
-    'hicolour',
-    'hicon',
-    'hics',
     'hid-back',
-    'hida',
-    'hidaka',
-    'hidaldo',
-    'hidalgoes',
-    'hidatsa',
-    'hidb-assisted',
-    'hidb-sponsored',
-    'hidb.',
-    'hidd',
-    'hidded',
-    'hidden\'',
-    'hidden-away',
-    'hidden-line',
-    'hidden-surface',
-    'hidderley',
     'hiddiscoe',
-    'hide&rehy;away',
-    'hide-',
-    'hide-constructing',
-    'hide-faced',
-    'hide-slit',
-    'hide-your-head',
-    'hide.',
-    'hideharu',
-    'hidenori',
-    'hideosly',
-    'hideous.',
-    'hideously-hued',
-    'hideouts.',
-    'hidetada',
-    'hidetoshi',
     'hideyhole',
-    'hiding-by-staying-put-on-the-nest',
-    'hiding-to-nothing',
-    'hidingplaces',
-    'hidmost',
-    'hidradenitis',
-    'hidri',
-    'hidroel&eacute;ctrica',
-    'hidsoxyethylpiperazine-ethanesulphonic',
-    'hidy',
-    'hie-owned',
-    'hiedelberg',
-    'hieger',
-    'hieght',
-    'hieland',
-    'hielo',
     'hielpraktiker',
-    'hiems',
-    'hien',
-    'hienemann',
-    'hienes',
-    'hiep',
-    'hier&rehy;archies',
-    'hiera',
-    'hieraaetus',
-    'hierachical',
-    'hieraechical',
-    'hierar&rehy;chically',
-    'hierarch',
-    'hierarchial',
-    'hierarchical/control',
-    'hierarchical/satisfier/dissatisfier',
     'hierarchicality',
-    'hierarchists',
-    'hierarchized',
-    'hierarchy-he',
-    'hierarchy-rests',
-    'hierarchy.',
-    'hiermit',
-    'hierocles',
-    'hieron.',
-    'hieronymite',
-    'hierophantic',
-    'hieros',
-    'hierosyios',
-    'hierosylyma',
-    'hierpicra',
-    'hierro',
     'hiers',
-    'hies',
-    'hietamiki',
-    'hiett',
-    'hietzing',
-    'hifalutin',
-    'hifiying',
-    'hifrensa',
-    'higaturu',
-    'higbee',
-    'higbury',
-    'higden',
-    'higdon',
-    'hige',
-    'higg',
-    'higgenbottam',
     'higgery',
-    'higging',
-    'higgings',
-    'higgins/cystic',
-    'higgins/imperial',
-    'higgle',
-    'higgledy-piggly',
-    'higglering',
-    'higglers',
-    'higgling',
-    'higgott',
-    'higgs/care',
-    'higgses',
-    'high&mdash;and&mdash;mighty',
-    'high&mdash;handed',
-    'high&mdash;or',
     'high&mdash;skill',
-    'high&mdash;speed',
-    'high&mdash;tech',
-    'high&mdash;value&mdash;added',
-    'high&mdash;wage',
-    'high&ndash;capacity',
-    'high&ndash;intensity',
-    'high&rehy;dependency',
-    'high&rehy;end',
-    'high&rehy;fenced',
-    'high&rehy;flyer',
-    'high&rehy;flyers',
-    'high&rehy;grade',
-    'high&rehy;level',
-    'high&rehy;lighting',
-    'high&rehy;minded',
     'high&rehy;mindedness',
-    'high&rehy;output',
-    'high&rehy;performance',
-    'high&rehy;powered',
-    'high&rehy;priced',
-    'high&rehy;principled',
-    'high&rehy;profile',
-    'high&rehy;profiled',
-    'high&rehy;quality',
-    'high&rehy;rise',
-    'high&rehy;sounding',
-    'high&rehy;status',
-    'high&rehy;stepping',
-    'high&rehy;way',
-    'high&rehy;wing',
-    'high\'',
     'high\'n\'wide',
-    'high-200,000s',
-    'high-ability',
-    'high-absorbency',
-    'high-accuracy',
-    'high-achievement',
-    'high-adrenalin',
-    'high-aesthetic',
-    'high-alcohol',
-    'high-alpha',
-    'high-alumina',
-    'high-amperage',
-    'high-arching',
-    'high-arctic',
-    'high-assed',
-    'high-bailiff',
     'high-ball',
-    'high-banked',
-    'high-beamed',
-    'high-bodiced',
-    'high-boned',
-    'high-booted',
-    'high-bosomed',
-    'high-bourgeois',
-    'high-bred',
-    'high-brows',
-    'high-budget',
-    'high-bulk',
-    'high-bummed',
-    'high-buttocked',
-    'high-buttoning',
-    'high-candle',
     'high-capability',
-    'high-caped',
-    'high-capital',
-    'high-carbon',
-    'high-ceiling',
-    'high-cheeked',
-    'high-chinned',
-    'high-cholesterol',
-    'high-circulation',
-    'high-climbing',
-    'high-collar',
-    'high-colour',
-    'high-combustion',
-    'high-commission',
-    'high-competition',
-    'high-consumption',
     'high-containment',
-    'high-convenience',
-    'high-corrosion',
-    'high-crime',
-    'high-cruising',
-    'high-cultural',
-    'high-culture',
-    'high-currency',
-    'high-damping',
-    'high-decibel',
-    'high-demand',
-    'high-density-storage',
-    'high-dependency',
-    'high-die-hi',
-    'high-dirt',
-    'high-drag',
     'high-drama',
-    'high-dynamic',
-    'high-earner',
-    'high-edged',
-    'high-electron-mobility',
-    'high-employment',
-    'high-energy-using',
-    'high-expansion',
-    'high-explosives',
-    'high-falluting',
-    'high-falutin',
-    'high-faluting',
-    'high-fantastical',
-    'high-farmers',
-    'high-finance',
-    'high-flow',
     'high-force',
-    'high-friction',
-    'high-functionality',
-    'high-grease',
-    'high-growing',
-    'high-grown',
-    'high-head',
-    'high-heid',
-    'high-horse',
-    'high-hung',
-    'high-impedance',
-    'high-inclination',
-    'high-indeed',
-    'high-influence',
-    'high-insurance',
-    'high-involvement',
     'high-jacks',
-    'high-jumped',
-    'high-jumpers',
-    'high-k',
-    'high-kicked',
-    'high-king',
-    'high-kitsch',
-    'high-kneed',
-    'high-laced',
-    'high-lacing',
-    'high-lead',
-    'high-life-loving',
-    'high-light',
-    'high-limit',
-    'high-lived',
-    'high-liver',
     'high-lying',
-    'high-magnification',
-    'high-meat',
-    'high-mg',
-    'high-modulus',
-    'high-molecular-weight',
-    'high-momentum',
-    'high-multiplier',
-    'high-nitrate',
-    'high-nitrogen',
-    'high-noon',
-    'high-nosed',
-    'high-nuclear',
-    'high-offender',
-    'high-peak-season',
-    'high-peaked',
     'high-performace',
-    'high-permeability',
-    'high-pile',
-    'high-pitch',
-    'high-pitched/moaning',
-    'high-polluting',
-    'high-pollution',
-    'high-pooped',
-    'high-potency',
-    'high-pressured',
-    'high-pressuring',
-    'high-priestess',
-    'high-priestly',
-    'high-probability',
-    'high-prostitution',
-    'high-prowed',
     'high-publicity',
-    'high-quality-low-cost',
-    'high-rack',
-    'high-rafted',
-    'high-railed',
-    'high-rated',
-    'high-rating',
-    'high-reaching',
-    'high-readiness',
-    'high-recovery',
-    'high-recurrent',
-    'high-reliability',
-    'high-rent',
-    'high-rented',
-    'high-res',
-    'high-research-intensity',
     'high-resilience',
-    'high-resistivity',
-    'high-rev',
-    'high-risers',
-    'high-rising',
-    'high-rococo',
-    'high-rolling',
-    'high-salt',
-    'high-science',
-    'high-scudding',
-    'high-sensitivity',
-    'high-set',
-    'high-side',
-    'high-signal',
-    'high-skill',
-    'high-smelling',
     'high-solids',
-    'high-souled',
-    'high-spanish',
-    'high-spec',
-    'high-spender',
-    'high-spot',
-    'high-spots',
-    'high-stage',
-    'high-standard',
-    'high-standing',
-    'high-stemmed',
-    'high-stepped',
-    'high-striking',
-    'high-suction',
-    'high-swept',
-    'high-swung',
     'high-tack',
-    'high-tar',
-    'high-taxation',
-    'high-taxing',
-    'high-tech-based',
-    'high-technical',
-    'high-technology\'',
-    'high-technology-driven',
-    'high-technology/',
-    'high-tempo',
-    'high-theoretician',
-    'high-theory',
-    'high-throughout',
-    'high-ticket',
-    'high-tide',
-    'high-tome',
     'high-tops',
-    'high-tory',
-    'high-turnover',
-    'high-twist',
-    'high-vegetable',
-    'high-voiced',
-    'high-volatile',
-    'high-waged',
-    'high-wealth',
-    'high-wheeled',
-    'high-wind',
-    'high-z',
-    'high.next',
-    'high.quality',
-    'high.the',
-    'high/6ft',
     'high/popular',
-    'high/scope',
-    'high/st',
-    'highan',
-    'highbacked',
-    'highborn',
-    'highbrows',
-    'highbuild',
-    'highcalibre',
-    'highcliff',
-    'highcraig',
-    'highcross',
-    'highdays',
-    'highe',
-    'highely',
-    'higher&ndash;education',
     'higher&rehy;powered',
-    'higher\'',
-    'higher-altitude',
-    'higher-capacity',
-    'higher-caste',
-    'higher-decibel',
-    'higher-distillation-proof',
-    'higher-division',
-    'higher-educated',
-    'higher-educational',
-    'higher-energy',
-    'higher-estimated',
-    'higher-fare',
-    'higher-grade',
-    'higher-growing',
-    'higher-intensity',
     'higher-interest',
-    'higher-learning',
-    'higher-lever',
-    'higher-no',
-    'higher-potency',
-    'higher-pressure',
-    'higher-price',
-    'higher-productivity',
-    'higher-rank',
-    'higher-ranked',
-    'higher-scoring',
-    'higher-skilled',
-    'higher-spec',
-    'higher-sulphur',
-    'higher-tax-paying',
-    'higher-than',
     'higher-than-ambient',
-    'higher-than-equilibrium',
-    'higher-than-mid',
-    'higher-than-usual',
-    'higher-to-lower',
-    'higher-toned',
-    'higher-use',
-    'higher-value-added',
-    'higher-waged',
-    'higher-yield',
-    'higher.level',
-    'higher.order',
-    'higher/the',
-    'highers/a-levels',
-    'highes',
-    'highess',
     'highest-',
-    'highest-bidder',
-    'highest-calorie',
-    'highest-capacity',
-    'highest-cost',
-    'highest-filled',
-    'highest-flyers',
-    'highest-flying',
-    'highest-frequency',
-    'highest-g',
-    'highest-growing',
-    'highest-marked',
-    'highest-peering',
-    'highest-performance',
-    'highest-risk',
-    'highest-seeded',
     'highest-spending',
-    'highest-starred',
-    'highest-wage',
-    'highet',
-    'highett',
-    'highfab',
-    'highfashion',
-    'highfat/performance-type',
-    'highfern',
-    'highfidelity',
-    'highfield/bone',
-    'highfield/wife',
-    'highfill-burnim-langhans',
-    'highflow',
-    'highflown',
-    'highflyer',
     'highflyers',
-    'highflying',
-    'highfrequency',
-    'highfrith',
-    'highgate/the',
-    'highgreen',
-    'highhams',
-    'highhandedness',
-    'highhedged',
-    'highights',
-    'highjacking',
-    'highjump',
-    'highkicking',
-    'highkicks',
-    'highl',
-    'highland-born',
     'highland/fell/dales',
-    'highlandman',
-    'highlandmen',
-    'highlevel',
-    'highlevels',
-    'highli',
-    'highlight-clogged',
-    'highlighted&mdash;the',
-    'highlit',
-    'highlows',
-    'highly&mdash;skilled',
-    'highly&mdash;trained',
-    'highly&ndash;skilled',
-    'highly&rehy;dangerous',
-    'highly&rehy;devolved',
-    'highly&rehy;prized',
     'highly&rehy;theorised',
-    'highly&rehy;trained',
-    'highly-',
-    'highly-accurate',
-    'highly-appropriate',
-    'highly-athletic',
-    'highly-born',
-    'highly-carved',
-    'highly-centralised',
-    'highly-concentrated',
-    'highly-contaminated',
-    'highly-creditable',
-    'highly-critical',
-    'highly-detailed',
-    'highly-disturbed',
-    'highly-efficient',
     'highly-evolved',
-    'highly-explosive',
-    'highly-fancied',
-    'highly-finned',
-    'highly-focused',
-    'highly-honoured',
-    'highly-indebted',
-    'highly-inflammable',
-    'highly-influential',
-    'highly-mechanised',
-    'highly-misleading',
-    'highly-optimistic',
-    'highly-ordered',
-    'highly-organised',
-    'highly-original',
-    'highly-ornate',
     'highly-penetrating',
-    'highly-perfumed',
-    'highly-personalised',
-    'highly-persuasive',
-    'highly-prescriptive',
-    'highly-pressured',
-    'highly-principled',
-    'highly-publicised-',
-    'highly-publicized',
-    'highly-radioactive',
-    'highly-reactive',
-    'highly-readable',
-    'highly-recommended',
-    'highly-refined',
-    'highly-schooled',
-    'highly-secret',
     'highly-sexy',
-    'highly-specialist',
-    'highly-specified',
-    'highly-spiced',
-    'highly-sprung',
-    'highly-standardised',
-    'highly-stratified',
-    'highly-symbolic',
-    'highly-talented',
-    'highly-traditional',
-    'highly-valued',
-    'highly-visible',
-    'highlycharged',
-    'highlyprofitable',
-    'highlyskilled',
-    'highmead',
     'highmeadow',
-    'highnam/gloucestershire',
-    'highnecked',
-    'highpower',
-    'highpriced',
-    'highqqintertidal',
-    'highquality',
-    'highrises',
-    'highrisk',
-    'highroads',
-    'highrove',
-    'highschool',
-    'highsmith/leather',
-    'highspots',
-    'highstand',
-    'highsted',
     'hightails',
-    'highte',
-    'hightechnology',
-    'hightide',
-    'hightops',
-    'highty-tighty',
-    'highwaaae',
-    'highwalled',
-    'highway-man\'',
-    'highway-orientated',
-    'highway-pricing',
-    'highwaym',
-    'highwaymanship',
-    'highwayperson',
-    'higinbothams',
-    'higman.',
     'hignell',
-    'hignet',
-    'higoi',
-    'higonnet',
-    'higounet',
-    'higsby',
-    'higsons',
-    'higuchi',
-    'hii\'',
-    'hiibs',
-    'hiimself',
-    'hijab',
-    'hijacking.',
-    'hijaniro',
-    'hijas',
-    'hijinks',
     'hijo(s)',
-    'hijrah',
-    'hikari',
-    'hikey',
-    'hiking-boots',
-    'hikotani',
-    'hil-6',
-    'hilaires',
-    'hilali/charity',
-    'hilario',
-    'hilaritas',
-    'hilarius',
-    'hilary-joy',
-    'hilberman',
-    'hilbert\'s-mail',
-    'hilberts',
     'hilbery',
-    'hilbourne',
-    'hilciaz',
-    'hilcott',
-    'hildago',
-    'hildale',
-    'hildelith',
-    'hildersham',
-    'hilderstone',
-    'hildesonse',
-    'hildons',
-    'hildrew',
-    'hilendar',
-    'hilery',
-    'hilfiger',
-    'hilgenberg',
     'hilgendorff',
-    'hilgert',
-    'hiliary',
-    'hilken',
-    'hill-based',
-    'hill-born',
-    'hill-climb',
-    'hill-cupped',
-    'hill-easterside',
-    'hill-farming',
-    'hill-farms',
-    'hill-field',
-    'hill-figure',
-    'hill-folk',
-    'hill-foot',
-    'hill-forest',
     'hill-forms',
-    'hill-girt',
-    'hill-grind',
-    'hill-houses',
-    'hill-knowle',
-    'hill-land',
-    'hill-lovers',
-    'hill-peoples',
-    'hill-rotterdam',
-    'hill-running',
-    'hill-sides',
-    'hill-slopes',
-    'hill-station',
-    'hill-streets',
-    'hill-strongholds',
-    'hill-style',
     'hill-thomas',
-    'hill-track',
-    'hill-trevor',
-    'hill-walpole',
-    'hill-williams',
-    'hill.7',
-    'hill/',
-    'hill/birdland',
-    'hill/clarence',
-    'hill/elvis',
-    'hill/firework',
-    'hill/gloucester',
-    'hill/i',
-    'hill/john',
-    'hill/just',
-    'hill/malaria',
     'hill/milford',
-    'hill/mother',
-    'hill/neighbour',
-    'hill/protestor',
-    'hill/rampart',
-    'hill/ripped',
-    'hill/solicitor',
-    'hill/stunt',
-    'hill/thames',
-    'hill/trading',
-    'hill/wheelchair',
-    'hill/williams-renault',
-    'hill/wiltschinsky',
-    'hill/worcestershire',
-    'hill/world',
-    'hill_away',
     'hillaby-style',
-    'hillaire-marcel',
-    'hillaldam',
-    'hillam',
-    'hillan/staff',
-    'hillard',
-    'hillard/buyer',
-    'hillards',
-    'hillares',
-    'hillbeck',
-    'hillbillies-turned-entrepreneurs',
-    'hillbillies-type',
-    'hillbrow',
-    'hilldnep',
-    'hilldrop',
-    'hillebrandt',
     'hilled',
-    'hillenkoetter',
-    'hillerman',
-    'hillersland/gloucestershire',
-    'hillerslands',
-    'hillesley',
-    'hillevi',
-    'hillgoer',
-    'hillgoing',
-    'hillgrangels',
-    'hillhall',
-    'hillhead/former',
-    'hillheads',
-    'hilliers',
-    'hillman.',
-    'hills-and-bends',
     'hills-are-alive',
-    'hills/district',
-    'hills/stage',
-    'hills/worcestershire',
-    'hillsborough-style',
-    'hillsborugh',
-    'hillsbro',
-    'hillsburg',
-    'hillscape',
-    'hillsdon',
-    'hillsfoots',
-    'hillsham',
-    'hillshire',
-    'hillside.some',
-    'hillsiders',
-    'hillsons',
     'hillstead',
-    'hillsview',
-    'hilltowns',
-    'hillwash',
-    'hilly&rehy;ish',
-    'hillyards',
-    'hilmer',
-    'hilo',
-    'hilprecht',
-    'hilson',
-    'hilt-deep',
-    'hilted',
-    'hilti',
-    'hiltler',
-    'hilton/father',
-    'hiltoun',
     'hilus',
-    'hilux',
-    'hilvert',
-    'hilyard',
-    'him&amacr;l',
-    'him&mdash;an',
-    'him&mdash;and',
-    'him&mdash;good',
-    'him&mdash;i',
-    'him&mdash;matthew',
-    'him&mdash;she',
-    'him&mdash;that',
-    'him&mdash;the',
-    'him&mdash;there',
-    'him&rehy;and',
-    'him&rehy;at',
     'him-and',
-    'him-lawsuits',
-    'him-over',
-    'him-shaped',
-    'him-she',
-    'him-that',
-    'him.he',
-    'him.it',
-    'him/but',
-    'him/harm',
-    'him/her/it',
-    'him/that',
-    'him_in',
-    'hima',
-    'himalayan-tibetan',
-    'himalayense',
     'himalchuli',
-    'himba',
-    'himeji',
-    'himeslf',
-    'himler',
-    'himmaahimmahimm',
-    'himmahimmahimm',
-    'himmelbrau',
-    'himmels',
-    'himmelweit',
-    'himmler-eichmann',
-    'himms-hagen',
-    'himone',
-    'himsclf',
-    'himsee',
-    'himsel',
     'himself&mdash',
-    'himself&verbar',
-    'himself-a',
-    'himself-and',
-    'himself-as',
-    'himself-but',
-    'himself-he',
-    'himself-i',
-    'himself-obsessively',
-    'himself-reactions',
-    'himself-with',
-    'himself.',
-    'himself.he',
-    'himself_on_top',
-    'himselfe',
-    'himundher',
     'himyar',
-    'hin\'most',
-    'hin-mah-too-yah-lat-kekht',
-    'hina-bandi',
-    'hinari',
-    'hinassou',
-    'hinchliff',
-    'hinchly',
-    'hinckesman',
-    'hincks',
-    'hind-',
-    'hind-limb',
-    'hind-parts',
-    'hind-picked',
-    'hindavi-is',
-    'hindely',
     'hindemith-with-ribena',
-    'hinden',
-    'hindenliter',
-    'hinder-parts',
-    'hinderances',
-    'hinderparts',
-    'hinderstoisser',
-    'hindes',
-    'hindford',
-    'hindhaugh',
-    'hindi-urdu',
-    'hindiii-bamhi',
-    'hindio',
-    'hindless',
-    'hindlip',
-    'hindmarh',
     'hindneck',
-    'hindoos',
-    'hindostani',
-    'hindparts',
-    'hindshill',
-    'hindsight-honest',
-    'hindsighters',
-    'hindu&rehy;ism',
-    'hindu\'',
-    'hindu-backed',
-    'hindu-inspired',
-    'hindu-majority',
-    'hindu-sikh',
-    'hines/world',
-    'hiney',
-    'hingan',
     'hinge-creaking',
-    'hinge-like',
-    'hinge-top',
-    'hingeing',
-    'hingeless',
-    'hingeston-randolph',
-    'hingin',
-    'hingle',
-    'hings',
-    'hingsen',
-    'hinhibit',
-    'hinich',
-    'hinin',
-    'hinitroan',
-    'hinke',
-    'hinksey/oxfordshire',
     'hinlil',
-    'hinnebusch',
-    'hinnells/university',
-    'hinney',
-    'hinni',
-    'hinor',
-    'hinrichsen',
-    'hinsdale',
-    'hinsley/former',
-    'hinstock',
-    'hint-',
-    'hint-dropping',
-    'hint-of-tint',
-    'hint_in',
-    'hinted-at',
-    'hinter',
     'hinter-lands',
-    'hinterhof',
-    'hinterholzer',
-    'hinterland-enriched',
-    'hinterleiterner',
-    'hinterruptions',
-    'hinterstadt',
-    'hinterstoder',
-    'hintikka',
-    'hintingly',
-    'hintlesham',
-    'hinton-clifton',
-    'hinton-in-the',
-    'hinton-in-the-hedges',
-    'hinton-in-the-hedges/northamptonshire',
-    'hinton/barry',
     'hinton/cynthia',
-    'hinton/maxwell',
-    'hintree',
-    'hints.jeffrey',
-    'hints/q&amp;a',
-    'hinwick',
-    'hinwoods',
-    'hio',
-    'hiob',
-    'hiom',
-    'hiort',
-    'hioxyl',
-    'hip-bath',
-    'hip-baths',
-    'hip-belt',
-    'hip-consciousness',
     'hip-held',
-    'hip-hippy',
-    'hip-ho',
-    'hip-hop-styled',
-    'hip-hoppers',
-    'hip-hopping',
-    'hip-hugger',
-    'hip-intellects',
-    'hip-joints',
-    'hip-kick',
-    'hip-packs',
-    'hip-pads',
-    'hip-poo-roi-days',
-    'hip-priest',
-    'hip-replacement',
-    'hip-roofs',
     'hip-swaying',
-    'hip-swinging',
-    'hip-swivelling',
-    'hip-turn',
-    'hip-width',
-    'hiperpool',
-    'hipflask',
-    'hipflasking',
-    'hipgnosis',
-    'hipgnosis-styled',
-    'hipgrave',
-    'hiphil',
-    'hiphoprisy-style',
-    'hiphouse',
-    'hipkin',
-    'hipkins',
     'hipkiss/resident',
-    'hipmotism',
-    'hipner',
-    'hipotecario',
-    'hippeis',
-    'hipperholme',
-    'hippi-compatible',
-    'hippie-inspired',
-    'hippie-schmippie',
-    'hippie-style',
-    'hippie-type',
-    'hippies/americans',
-    'hippikes',
-    'hippiness',
-    'hippisley-smith',
-    'hippo-bath',
     'hippo-bath-day',
-    'hippocastanum',
-    'hippocentaurs',
-    'hippocras',
-    'hippocratics',
-    'hippodramas',
-    'hippoglossoides',
-    'hippogrif',
-    'hippokrates',
-    'hippolais',
-    'hippolito',
-    'hippomanic',
-    'hipponikos',
-    'hippophae',
-    'hippopotamus-bathtub',
-    'hippopotamus-hide',
     'hippurate',
-    'hippy-anarchist',
-    'hippy-freak',
-    'hippy.',
-    'hippychic',
-    'hippychick',
-    'hippychicks',
-    'hippyesque',
-    'hippyshit',
-    'hips.',
-    'hips.he',
-    'hips/tops',
-    'hipsburn',
-    'hipswinging',
-    'hiq8',
-    'hirac',
     'hirachand',
-    'hirad',
-    'hiraethog',
-    'hirai',
-    'hiraiwa',
-    'hirakana',
-    'hiraken',
-    'hiral',
-    'hirano',
-    'hiranya',
-    'hiraoka',
-    'hirata',
-    'hirazowicz',
-    'hirdre',
-    'hire\'',
-    'hire-cycle',
     'hire-em',
-    'hire-purchasers',
-    'hire-system',
-    'hired-\'and',
-    'hired-gun',
-    'hired-in-plant',
-    'hired.',
-    'hirer/buyer',
-    'hiri',
-    'hiridanum',
-    'hirin',
-    'hirmers',
-    'hirn',
-    'hirnself',
-    'hiroak',
-    'hiroki',
     'hiroko',
-    'hiromasa',
-    'hiromi',
-    'hiromitsu',
-    'hirondelles',
-    'hironen',
-    'hiroshima-based',
-    'hiroshimas',
-    'hirosi',
-    'hiroyuki',
-    'hirpled',
-    'hirpling',
-    'hirs',
-    'hirsau',
-    'hirschenplatz',
-    'hirschheim',
     'hirschleifer',
-    'hirschvogel',
-    'hirshkowitz',
-    'hirshsprung',
-    'hirsi',
-    'hirson',
-    'hirst/cystic',
-    'hirst/mother',
-    'hirstrigg',
-    'hirsuta-type',
-    'hirsuticorna',
-    'hirsutum',
-    'hirswowicz',
-    'hirtella',
-    'hirtenberger',
-    'hirtshals',
     'hirulog',
-    'hirundapus',
-    'hirundinidae',
-    'hirwani',
-    'hirwyn',
-    'hiryu',
-    'hirzel',
-    'his\'n',
-    'his\'n\'hers',
-    'his-and-hers',
-    'his-back',
-    'his-job',
-    'his-lofty',
-    'his-mother',
-    'his-purkinje',
-    'his-reputation',
     'his-tagged',
-    'his-tone',
-    'his-travels',
-    'his.age',
-    'his/brother',
-    'his/home',
-    'his/our',
-    'his/sergei',
-    'his15-ala16-arg17',
-    'his199',
-    'his241',
-    'his36th',
-    'his63',
-    'his_out',
-    'hisan',
-    'hisao',
     'hisbface',
-    'hisbul',
-    'hiscelia',
-    'hiself',
-    'hisex',
-    'hisgood',
-    'hishashi',
-    'hisinspection',
-    'hisking',
-    'hisley',
-    'hisown',
-    'hispana',
-    'hispanamericano',
-    'hispani',
-    'hispanicism',
-    'hispanized',
     'hispano&rehy;suiza',
-    'hispano-arabic',
-    'hispano-axis',
-    'hispano-flemish',
-    'hispano-german',
-    'hispano-italian',
-    'hispano-moresque',
-    'hispano-us',
-    'hispanophone',
-    'hispanorum',
-    'hispearian',
-    'hisperian',
-    'hispida',
-    'hispido',
-    'hispidum',
-    'hissar',
     'hissed.',
-    'hissing-hi-hat',
-    'hissingly',
-    'hissingly-hot',
-    'hissometer',
-    'hisssss',
-    'hist&oacute;ria',
-    'hist&oacute;rico',
-    'hist.',
-    'histamine/cimetidine',
-    'histamine/g',
-    'histamines',
-    'histead',
-    'histiaeus',
-    'histiaia',
-    'histiocytes',
     'histo-drama',
-    'histochemically',
-    'histocompatability',
-    'histocytoses',
-    'histoiry',
-    'histol0gical',
-    'histological/radiological',
-    'histolysis',
-    'histolyticum',
-    'histomoniasis',
-    'histone-h4',
-    'histone-like',
-    'histoplasmosis',
-    'histor',
-    'historesin',
-    'historial',
     'historian\'s-eye',
-    'historian-punter',
-    'historian/diplomat',
-    'historians.1',
-    'historical\'',
-    'historical-economic',
-    'historical-materialist',
-    'historical-political',
-    'historical-social',
-    'historical/',
-    'historical/autobiographical',
-    'historically&rehy;established',
-    'historically-',
-    'historically-based',
-    'historically-created',
-    'historically-dressed',
     'historically-eclectic',
-    'historically-evolved',
-    'historically-inclined',
-    'historically-minded',
-    'historically-rooted',
-    'historically-valued',
-    'historically.',
-    'historicals',
-    'historiche',
-    'historicised',
-    'historicisms',
-    'historicistic',
-    'historicization',
-    'historico-aesthetic',
-    'historico-political',
-    'historico-social',
     'historico-sociological',
-    'historico-topographical',
-    'historico-transcendental',
-    'historicum',
-    'historie/',
-    'historielag',
-    'histories.',
-    'historieta',
-    'historija',
-    'historiographically',
-    'historiometric',
-    'historisation',
-    'historischen',
-    'historishche',
-    'historogram',
-    'history&mdash',
     'history&mdash;i',
-    'history-after',
-    'history-book',
-    'history-caused',
-    'history-dirt',
-    'history-focused',
-    'history-in-pictures',
-    'history-kenneth',
-    'history-of-religions',
-    'history-on',
-    'history-oriented',
-    'history-painting',
-    'history-play',
-    'history-taking',
-    'history-teaching',
-    'history-wise',
     'history.',
-    'history.of',
-    'history.the',
-    'history/archeology',
-    'history/development',
-    'history/life',
-    'history/theory',
-    'historyless',
-    'histotype',
-    'histrio',
-    'histrio-mastix',
-    'histtory',
-    'hit&pound;50m',
-    'hit&rehy;man',
-    'hit\'er',
-    'hit-flick',
     'hit-gag',
-    'hit-in',
-    'hit-left',
-    'hit-machine',
-    'hit-money',
-    'hit-single',
-    'hit-song',
-    'hit-squads',
-    'hit-teams',
-    'hit-that-never',
-    'hit-the',
-    'hit-them',
-    'hit-wicket',
-    'hit.more',
-    'hit.picture',
-    'hit/cecomm',
     'hit/eurovision',
-    'hit_other',
-    'hita',
-    'hitachi-developed',
-    'hitachis',
-    'hitae',
-    'hitashwar',
-    'hitch-girl',
-    'hitch-girls',
-    'hitch-hikes',
-    'hitchams',
-    'hitchcock-type',
-    'hitchcocks',
-    'hitchhiker\'',
-    'hitchings/gloucestershire',
-    'hitchlock',
     'hitchock',
-    'hitcox',
-    'hitec',
-    'hitecc',
-    'hitel',
-    'hitfile',
-    'hither-and-thither',
-    'hitherto-accepted',
-    'hitherto-collected',
-    'hitherto-unknown',
-    'hitherto-unrecorded',
-    'hithi',
-    'hiti-harper',
-    'hitida',
-    'hitites',
-    'hitle',
     'hitler-papen-hugenberg',
-    'hitlerish',
-    'hitlerite',
-    'hitlerites',
-    'hitlerjugend',
-    'hitlist.',
-    'hits.',
-    'hitsel',
-    'hitself',
-    'hitsville',
-    'hitt',
-    'hittable',
-    'hitti',
-    'hitting-simon',
-    'hittleman',
-    'hitz',
     'hitzfeld',
-    'hitzfield',
-    'hiu',
-    'hiues',
-    'hiv-',
-    'hiv-1&rehy;infected',
-    'hiv-1-bound',
-    'hiv-1-negative',
-    'hiv-1-seropositive',
-    'hiv-1-uninfected',
-    'hiv-antibody',
-    'hiv-gag',
-    'hiv-induced',
-    'hiv-like',
-    'hiv-prevention',
-    'hiv-specific',
     'hiv-staff',
-    'hiva',
-    'hivas',
-    'hive-dwellers',
-    'hive-like',
-    'hive-race',
-    'hive-turned-fortress',
-    'hive.',
-    'hivemates',
-    'hiver',
-    'hivnae',
-    'hivolt',
-    'hiyan',
-    'hiyer',
-    'hiyyyyyy',
-    'hizb-i-islami',
     'hizb-ul-mujahideen',
-    'hizballah',
-    'hizbe',
-    'hizbul-mujahidin',
-    'hizen',
-    'hjaleh',
-    'hjalmarsson',
-    'hjartasson',
-    'hjelm-wall&eacute;n',
-    'hjermann',
-    'hjerstedt',
-    'hjorrow',
-    'hjort',
-    'hk&dollar;1',
-    'hk&dollar;1.3',
-    'hk&dollar;100m-300m',
     'hk&dollar;121,200',
-    'hk&dollar;126,200',
-    'hk&dollar;127bn',
-    'hk&dollar;13.8',
-    'hk&dollar;175,300',
-    'hk&dollar;2.12',
-    'hk&dollar;2.50',
-    'hk&dollar;20.60',
-    'hk&dollar;28',
-    'hk&dollar;3',
-    'hk&dollar;3.8bn',
-    'hk&dollar;350m',
-    'hk&dollar;39',
-    'hk&dollar;40.25',
-    'hk&dollar;400,000',
-    'hk&dollar;4bn',
     'hk&dollar;5,000',
-    'hk&dollar;50',
-    'hk&dollar;500,000',
-    'hk&dollar;52.7',
-    'hk&dollar;57m',
-    'hk&dollar;7',
-    'hk&dollar;71,600',
-    'hk&dollar;78',
-    'hk&dollar;8',
-    'hk&dollar;865,000',
-    'hk&dollar;91,000',
-    'hk&ndash;3511',
-    'hk&ndash;750',
-    'hk-1',
-    'hk-hong',
-    'hk0',
     'hkds',
-    'hkefg',
-    'hktel',
-    'hl&aacute;vka',
-    'hl&ouml;dr',
-    'hl-a',
-    'hl3',
-    'hl62',
-    'hl8e',
-    'hla-a11',
-    'hla-a2-binding',
-    'hla-a2.1-mediated',
-    'hla-antigen',
-    'hla-b',
-    'hla-b12',
-    'hla-b35-matched',
     'hla-b35-restricted',
-    'hla-b3501',
-    'hla-b51-binding',
-    'hla-b53.',
-    'hla-b7',
-    'hla-b8-dr3',
-    'hla-b8/dr3',
-    'hla-bw35',
-    'hla-cw3',
-    'hla-dr+',
-    'hla-dr-positive',
-    'hla-dr/cd3',
-    'hla-genotypically-identical',
-    'hla-matched',
-    'hla-restricted',
-    'hlagenfurt',
     'hlaing',
-    'hlalele',
-    'hlalolanang',
-    'hlauttvein',
-    'hlavackova',
-    'hlavn&iacute',
-    'hlc',
-    'hld',
-    'hlf/h',
-    'hlg-set',
-    'hlh-dna',
-    'hlmn',
-    'hlobane',
-    'hlobil',
-    'hlpg',
-    'hlt',
     'hlwg',
-    'hly',
-    'hm(65)77',
-    'hm.14',
-    'hm.14s',
-    'hm1000',
-    'hm14',
-    'hm293',
-    'hmas',
-    'hmav',
-    'hmci',
-    'hmcic',
-    'hmcs',
-    'hmd/joc.103',
-    'hmd/joc.105',
-    'hmf',
     'hmg/',
-    'hmg8622',
-    'hmgs',
-    'hmh',
-    'hmhm',
-    'hmi-lea',
-    'hmmmmm',
-    'hmmmmmmm',
-    'hmmmmmmmmmm',
-    'hmmmph',
-    'hmmphh',
-    'hmnn',
-    'hmp',
-    'hmr50',
-    'hmr51',
-    'hmr58',
     'hmrc',
-    'hmso.',
-    'hmt',
-    'hmv/emi',
-    'hmx',
-    'hmx290',
-    'hmy-b35',
-    'hn-5a',
-    'hnag',
-    'hnd/btech',
-    'hnd/hnc',
-    'hnekdir',
-    'hnf-4',
-    'hnu-hanby',
-    'ho&euml;l',
-    'ho&ndash;an',
     'ho\'',
-    'ho-',
-    'ho-chien',
-    'ho-de-ho',
-    'ho-hoings',
-    'ho-hollofil',
-    'ho-mo-sex-u-al',
-    'ho-v',
-    'ho/',
-    'ho/rt/1',
-    'ho=',
-    'hoabinhian',
-    'hoad/patient',
-    'hoadley',
-    'hoadley-',
-    'hoadley-maidment',
     'hoag',
-    'hoagie',
-    'hoagy',
-    'hoak',
-    'hoall',
-    'hoam',
-    'hoard&rehy;ing',
-    'hoard\'',
-    'hoarde',
-    'hoarded-up',
-    'hoardes',
-    'hoardings/outdoor',
-    'hoarier',
-    'hoars',
-    'hoarstones',
-    'hoarty',
     'hoarvey',
-    'hoatzin',
-    'hoaxers',
-    'hob-nails',
-    'hob-nobbed',
-    'hob-nobs',
-    'hobaiter',
-    'hobart\'',
-    'hobart-hampden/earl',
-    'hobart-to-sydney',
-    'hobb',
-    'hobbesian&rehy;rousseauan',
-    'hobbesians',
-    'hobbie',
-    'hobbied',
-    'hobbinol',
     'hobbiss',
-    'hobbists',
-    'hobbit&rehy;consciousness',
-    'hobbit-like',
-    'hobbit-nomenclature',
-    'hobbit-poetry',
-    'hobbit-powered',
-    'hobbit-songs',
-    'hobbitt',
-    'hobbs.',
-    'hobbs/cat',
-    'hobbs/howard',
-    'hobbs/mother',
-    'hobbs/rugby',
-    'hobbses',
-    'hobby-based',
     'hobby-electronics',
-    'hobby-like',
-    'hobbygames',
-    'hobbyhorses',
-    'hobbyism',
-    'hobdaying',
-    'hobe',
-    'hobelar',
-    'hoberman',
-    'hobgoblin\'',
-    'hobhold',
-    'hobhole',
-    'hobiba',
-    'hobman/county',
-    'hobmen',
-    'hobnobbed',
     'hobo-like',
-    'hoboes',
-    'hoboism',
-    'hobon',
-    'hobos',
-    'hobre',
-    'hobridge',
-    'hobsbawns',
-    'hobsley',
-    'hobson-west',
-    'hobstinate',
-    'hobstructin\'',
-    'hobstruction',
-    'hoburne',
-    'hobyah',
-    'hobys',
     'hoc-ery',
-    'hoca-zade',
-    'hochachtungsvoll',
-    'hochbichler',
-    'hochbrucker',
-    'hochdeutsch',
-    'hochgericht',
-    'hochhuser',
-    'hochlands',
-    'hochman',
-    'hochner',
-    'hochscgule',
-    'hochschulen',
-    'hochschulrahrnengesetz',
-    'hochschwarzwald',
-    'hochstetten',
     'hochstrasser',
-    'hocht',
-    'hockedy',
-    'hocken',
-    'hocketing',
-    'hockey-ball',
-    'hockey-match',
-    'hockey-playing',
-    'hockey-type',
-    'hockey/netball/gym',
-    'hockey/soccer',
-    'hockinminister',
-    'hockley/defence',
-    'hocknell',
-    'hockneyesque',
-    'hockston',
     'hockstrasser',
-    'hockwold',
-    'hockworthy',
-    'hoco',
-    'hocombe',
-    'hocquenghem',
-    'hocs',
-    'hocus-pocus-nomminy-domminy',
-    'hodder/francis',
-    'hoddinott',
-    'hoddis',
-    'hoddle/',
-    'hoddle/ardiles',
-    'hoddle/chelsea',
-    'hoddle/john',
-    'hoddle/player-manager',
     'hoddle/speaking',
-    'hoddlesque',
-    'hode',
-    'hodeida',
-    'hodeken',
-    'hodel',
-    'hodems',
-    'hodening',
-    'hodgart',
-    'hodge-podges',
-    'hodgeheg',
-    'hodgekiss',
-    'hodgeon',
-    'hodgepodge',
-    'hodgers',
-    'hodges/graham',
     'hodges/thames',
-    'hodgeson',
-    'hodgins',
-    'hodgins/painting',
-    'hodgman',
-    'hodgson/craftsman',
-    'hodgson/traveller',
-    'hodgsons',
-    'hodgy',
-    'hodierna',
-    'hodierne',
-    'hodins',
-    'hodler',
-    'hodolmor',
-    'hodsden',
-    'hodsgon',
     'hodson/wiltshire0',
-    'hoe-blades',
-    'hoe-lover',
-    'hoederer',
-    'hoefer',
-    'hoeff',
-    'hoefke',
-    'hoefslag',
-    'hoehn',
-    'hoeke',
-    'hoekstra',
-    'hoelderlin',
-    'hoell',
-    'hoeller',
-    'hoellering',
-    'hoemann',
     'hoenigmann-stovall',
-    'hoeppner',
-    'hoesch-krupp',
-    'hoeschst-behring',
-    'hoestra',
-    'hoetger',
-    'hoetker',
-    'hoeven',
-    'hoeyre&lt;ro',
-    'hofbauer',
-    'hofbibliothek',
-    'hofbrau',
-    'hoff-le',
-    'hoffaker',
-    'hoffiying',
-    'hoffmailn',
     'hoffman-laroche',
-    'hoffmani',
-    'hoffmann-designs',
-    'hoffmannsthal',
-    'hoffnungs',
-    'hoffrei',
-    'hoffs.',
-    'hofgeismar',
-    'hofhaimer',
-    'hofkanzlei',
-    'hofkapellmeister',
-    'hofkens',
-    'hofkriegsrath',
-    'hofkunst',
-    'hofland\'s',
-    'hofman',
     'hofman/student',
-    'hofmanns',
-    'hofmannsthal-bashing',
-    'hofmark',
-    'hofmeister',
-    'hofmuller',
-    'hofmusik',
-    'hofnagel-h&ouml;hle',
-    'hofweisen',
-    'hog-backed',
-    'hog-call',
-    'hog-calling',
-    'hog-many',
-    'hog-nosed',
-    'hog-roast',
-    'hog-stye',
     'hog-swine',
-    'hogan-warburg',
-    'hogan/first',
-    'hogarty',
-    'hogback',
-    'hogbrushes',
-    'hogcall',
-    'hogenes',
-    'hoges',
-    'hogeschool',
-    'hogey',
-    'hogezand',
-    'hogfreakers',
-    'hogfreakin\'',
-    'hoggan',
-    'hoggars',
     'hoggarts',
-    'hoggers',
-    'hoggery',
-    'hogges',
-    'hoggins',
-    'hoggle',
-    'hoggman',
-    'hoggy',
-    'hogh',
-    'hogmanays',
-    'hogmany',
-    'hogmen',
-    'hogs/',
-    'hogshaw',
-    'hogshire',
-    'hogspeuw',
     'hogtie',
-    'hogtied',
-    'hoguet',
-    'hoham',
-    'hohenaurern',
-    'hohenbr&uuml;cke',
-    'hohenem',
-    'hohenfels',
-    'hohengasse',
-    'hohenheim',
-    'hohenklingen',
-    'hohenkopetal',
-    'hohenlinden',
-    'hohenlohe-langenburg',
-    'hohenmedizinische',
-    'hohenschwangau',
     'hohenstaufenring',
-    'hohenstein',
-    'hohenzollern-hechingen',
-    'hoher',
-    'hoheria',
-    'hohfeld',
-    'hohgan',
-    'hohgant',
-    'hohlov',
-    'hohn',
-    'hohnlinden',
-    'hoho',
-    'hoi-sin',
-    'hoiberg',
-    'hoiby',
-    'hoicks',
     'hoid',
-    'hoidal',
-    'hoik',
-    'hoiks',
-    'hoilday',
-    'hoiliday',
-    'hoiping',
-    'hoipolloi',
-    'hoise',
-    'hoispital',
-    'hoity',
-    'hoiwood',
-    'hoiy',
-    'hoja',
-    'hojere',
-    'hoka',
     'hokasai',
-    'hokati',
-    'hokema',
-    'hokenson',
-    'hokey-pokey',
-    'hoki-koki',
-    'hokinga',
-    'hokitika',
-    'hokkans',
-    'hokku',
-    'hoklingen',
-    'hokokai',
-    'hokuriku',
-    'hokus',
-    'hol&ccedil;art&eacute',
-    'holah',
     'holannah',
-    'holbaek',
-    'holbeache',
-    'holbech',
-    'holbergs',
-    'holbert',
-    'holborne',
-    'holbornisation',
-    'holbrooke-jones',
-    'holbrooki',
-    'holbury',
-    'holc-0266',
-    'holcik',
-    'holcomb',
-    'holconius',
-    'holcot',
     'hold-backs',
-    'hold-door',
-    'hold-out',
-    'hold-the-nose',
-    'holdam',
-    'holdamatic',
-    'holdana',
-    'holdback',
-    'holdbacks',
-    'holdcr',
-    'holded',
-    'holden/announcer',
-    'holden/raf',
-    'holdenhurst',
-    'holder&lsqb;s&rsqb',
-    'holder/accepted',
     'holder/usaf',
-    'holderbaum',
-    'holdermann',
-    'holderness-roddam',
-    'holders.there',
-    'holdforth',
-    'holding\'',
-    'holding-camps',
-    'holding-cell',
-    'holding-notes',
-    'holding-out',
-    'holding-over',
-    'holding-together',
-    'holding-up',
-    'holding-yards',
-    'holding/investment',
     'holdingham',
-    'holdrish',
-    'holdstook',
-    'holdt',
-    'holdtrade',
-    'holdway',
-    'hole&ccaron;kova',
-    'hole-behind-the-eye',
-    'hole-burning',
-    'hole-by-hole',
-    'hole-filled',
-    'hole-filling',
-    'hole-free',
-    'hole-in-one-golfer',
-    'hole-in-the',
-    'hole-in-the-floor',
     'hole-in-wan',
-    'hole-int-wall',
-    'hole-istic',
-    'hole-nester.',
-    'hole-to-block',
-    'hole/twin',
-    'holeable',
-    'holec',
-    'holed-in-one',
-    'holeless',
-    'holemeal',
-    'holender',
-    'holes-in-one',
-    'holestone',
-    'holeton',
-    'holetown',
     'holfordian',
-    'holga',
-    'holgot',
-    'holgus',
-    'holi-ul-haq',
-    'holi-water',
-    'holid',
-    'holidasy',
-    'holiday&mdash;after',
-    'holiday\'',
-    'holiday-based',
-    'holiday-camp',
-    'holiday-camps',
-    'holiday-goer',
-    'holiday-houses',
-    'holiday-period',
     'holiday-relief',
-    'holiday-resort',
-    'holiday-task',
-    'holiday/flight/sailing',
-    'holiday/pilgrimage',
-    'holiday/tour',
-    'holidays.',
-    'holidays/',
-    'holidays/pensions/conditions',
-    'holidays/ski',
-    'holified',
-    'holigans',
-    'holildays',
-    'holincote',
-    'holinesses',
-    'holing-in-one',
     'holinwood',
-    'holism\'',
-    'holism-individualism',
-    'holistic-atomistic',
-    'holistic/intuitive',
-    'holistic/vitalistic',
-    'holivetti',
-    'holkam',
-    'holkema',
-    'holland-backed',
-    'holland-brown',
-    'holland-dozier-holland',
-    'holland-returned',
-    'holland-with-boston',
-    'holland.',
-    'holland/ap',
     'holland/auctioneer',
-    'holland/grandson',
-    'holland/south',
-    'hollanders',
-    'hollandon-sea',
-    'hollars',
-    'hollas',
-    'hollaus',
-    'holle-suppa',
-    'holleaux',
-    'holledge',
-    'hollein-designed',
-    'hollenbeck',
-    'hollenders',
-    'hollendon',
-    'hollensmark',
     'hollerback',
-    'hollerday',
-    'hollersbach',
-    'hollesly',
-    'hollevik',
-    'holley',
-    'holleyman',
-    'holli',
-    'hollicks',
-    'holliday/director',
-    'holliers',
-    'hollindale',
-    'hollingbourne',
-    'hollingsbee',
-    'hollingsbee/psychiatric',
-    'hollingworth/geologist',
     'hollingworth/un',
-    'hollinhey',
-    'hollinshead/cricketer',
-    'hollinshead/garage',
-    'hollinsworth',
-    'hollisae',
-    'holliss',
-    'hollnsteiner',
-    'holloch',
-    'hollocks',
-    'hollofibre',
-    'hollom',
-    'hollon',
-    'holloran',
-    'hollow&rehy;eyed',
-    'hollow&rehy;ground',
     'hollow-',
-    'hollow-bodied',
-    'hollow-body',
-    'hollow-ended',
-    'hollow-side',
-    'hollow-tined',
-    'hollow-tines',
-    'hollow-tube',
-    'hollow/but',
-    'holloway/former',
-    'holloway/red',
-    'holloway/wife',
-    'hollowcore',
-    'hollowfield',
-    'hollowmoor',
-    'hollowood',
     'hollrigl',
-    'hollweg',
-    'hollwyood',
-    'holly&rehy;wood',
-    'holly-decked',
-    'holly-design',
-    'holly-eyes',
-    'holly-leaves',
-    'holly-like',
-    'holly-marie',
-    'holly-pointed',
-    'holly-style',
-    'holly-tree',
-    'holly-wrapped',
-    'hollyberries',
-    'hollydays',
     'hollyear',
-    'hollyfield',
-    'hollyhogs',
-    'hollymoor',
-    'hollyn/scad',
-    'hollyswamp',
-    'hollywood-cute',
-    'hollywood-director',
-    'hollywood-flavoured',
-    'hollywood-inspired',
-    'hollywood-sized',
-    'hollywood-strangled',
-    'hollywood/broadway/tin',
-    'hollywoodification',
-    'hollywoood',
-    'holm-oaks',
     'holmatic',
-    'holmavik',
-    'holmberg',
-    'holmbush',
-    'holmbyre',
-    'holmdene',
-    'holme-on-spalding-moor',
-    'holme-on-the-wolds',
-    'holmefields',
-    'holmefirth',
-    'holmen',
-    'holmeon-spalding',
-    'holmepatrick',
-    'holmes-watson',
-    'holmes.',
-    'holmes/city',
     'holmes/daughter',
-    'holmes/jump',
-    'holmes/managing',
-    'holmes/oxford',
-    'holmeses',
-    'holmhurst',
-    'holmill',
-    'holmium',
-    'holmlands',
-    'holmquist',
-    'holmware',
-    'holmwys',
-    'holne',
-    'holo-bar',
-    'holo-camera',
-    'holo-movement',
     'holo-sign',
-    'holo-suit',
-    'holobyte',
-    'holocaust-like',
-    'holocausting',
-    'holographically',
-    'holomeister',
-    'holometabola',
-    'holometrix',
-    'holon',
-    'holophony',
-    'holophrase',
-    'holophrastic',
-    'holopic',
-    'holoprojector',
-    'holorama',
     'holovids',
-    'holoweye',
-    'holp',
-    'holquist',
-    'holroyde',
-    'holroyde/volunteer',
-    'hols.',
-    'holscher',
-    'holsgrove',
-    'holsoe',
-    'holspur',
-    'holst.',
-    'holstein-friesians',
-    'holston',
-    'holsworth',
-    'holsworthy',
     'holt-winters',
-    'holt/assault',
-    'holt/environmental',
-    'holt/weston',
-    'holtain',
-    'holtam',
-    'holtan',
-    'holthan/lorry',
-    'holthanger',
-    'holthusen',
-    'holtman',
-    'holtom',
-    'holton-le-moor',
-    'holtzmann',
-    'holwarda',
-    'holway',
     'holworth',
-    'holy-',
-    'holy-day',
-    'holy-roller',
-    'holy-sounding',
-    'holybrook',
-    'holyday',
-    'holye',
-    'holyfield-alex',
-    'holyhead-dun',
-    'holyland',
-    'holyoaks',
-    'holystoned',
-    'holytype',
-    'holzhandler',
-    'holzknecht',
     'holzzz',
-    'hom&oelig;opathists',
-    'hom(e)',
-    'hom(m)o-sexual',
-    'hom(m)osexual',
-    'homagars',
-    'homage-giving',
-    'homage-makers',
-    'homage-taking',
-    'homageous',
-    'homagers',
-    'homanton',
-    'homape',
-    'homberg',
-    'homco',
-    'home&mdash;i',
     'home&mdash;some',
-    'home&rehy;for',
-    'home&rehy;mover',
-    'home&rehy;owners',
-    'home(s)',
-    'home-\'but',
-    'home-and-away',
-    'home-and-carstle',
-    'home-appliance',
-    'home-applied',
-    'home-away',
-    'home-background',
-    'home-bases',
-    'home-beat',
-    'home-birth',
-    'home-boarder',
     'home-brewers',
-    'home-bringers',
-    'home-budgeting',
-    'home-build',
-    'home-by',
-    'home-cholesterol',
-    'home-churned',
-    'home-collection',
-    'home-comings',
-    'home-conditioning',
-    'home-construction',
-    'home-consumption',
-    'home-course',
-    'home-crafts',
-    'home-cum-office',
-    'home-drying',
     'home-economics',
-    'home-entertainment',
-    'home-erotic',
-    'home-farm',
-    'home-finders',
-    'home-fitted',
-    'home-free',
-    'home-front',
-    'home-frozen',
-    'home-furnishings',
-    'home-guard',
-    'home-gym',
-    'home-heating',
-    'home-helps',
-    'home-improvers',
-    'home-in',
     'home-in-one',
-    'home-interest',
-    'home-jazz',
-    'home-land',
-    'home-leave',
-    'home-listening',
-    'home-loans',
-    'home-loss',
-    'home-made-wills',
-    'home-management',
-    'home-minding',
-    'home-movies',
-    'home-now',
-    'home-of-the-weird',
-    'home-office',
-    'home-order',
     'home-orientated',
-    'home-permed',
-    'home-potted',
-    'home-preference',
-    'home-preserved',
-    'home-raised',
-    'home-reared',
-    'home-reference',
-    'home-remedy',
-    'home-responsibilities',
-    'home-rolled',
-    'home-room',
-    'home-rule',
-    'home-rulers',
-    'home-runs',
-    'home-saved',
     'home-school-child',
-    'home-school-community',
-    'home-sellers',
-    'home-sick',
-    'home-side',
-    'home-space',
-    'home-straight',
-    'home-stretch',
-    'home-students',
-    'home-teaching',
-    'home-team',
-    'home-territory',
-    'home-they',
-    'home-to',
-    'home-to-home',
-    'home-truths',
     'home-turn',
-    'home-video',
-    'home-videos',
-    'home-visiting',
-    'home-warmth',
-    'home-with-a-difference',
-    'home-workers',
-    'home-wrecking',
-    'home-written',
-    'home.',
-    'home.and',
-    'home.in',
-    'home/ar',
-    'home/eating',
-    'home/goblin',
-    'home/he',
     'home/liberal',
-    'home/motor',
-    'home/residential',
-    'home/shamrock',
-    'home/thomas',
-    'home/tintawn',
-    'home/vi-spring',
-    'home/work',
-    'home:amazing',
-    'home:highgrove',
-    'home:kensington',
-    'home_in',
-    'home_secretary',
-    'homebaked',
-    'homebar',
-    'homebases',
     'homebodies',
-    'homebound',
-    'homebrew.',
-    'homebrewers',
-    'homebuild',
-    'homebuilder',
-    'homebuilds',
-    'homebyres',
-    'homecare-for-the-elderly',
-    'homecomer',
-    'homecomin\'',
-    'homecooked',
-    'homecountry',
-    'homecrafts',
-    'homefast',
-    'homefields',
     'homegarden',
-    'homegroup',
-    'homegrowns',
-    'homeguards',
-    'homeland.',
-    'homeless:the',
-    'homelessness/housing',
-    'homelifts',
-    'homelink',
-    'homelover',
-    'homelsss',
-    'homelux',
-    'homely-looking',
-    'homemoving',
-    'homen',
-    'homenews',
     'homeobox-containing',
-    'homeoboxes',
-    'homeopathists',
-    'homeostat',
-    'homeotherm',
-    'homeplace',
-    'homeplan',
-    'homer-un',
-    'homer/english',
-    'homercare',
-    'homersham/local',
-    'homerun',
-    'homes-',
-    'homes/long-stay',
-    'homesale',
-    'homesexual',
     'homeside',
-    'homesit',
-    'homeslux',
-    'homesplan',
-    'homespun-white',
-    'homestudios',
-    'homesure',
-    'homeswap',
-    'homesworks',
-    'hometel(a10)',
-    'homeview',
-    'homeward/farmer',
-    'homewarm',
-    'homeways',
-    'homewood/farmer',
-    'homework.',
     'homeymoon',
-    'homfirth',
-    'homgenisation',
-    'homie',
-    'homies',
-    'homiez',
-    'homilees',
-    'homiletical',
-    'homilists',
-    'homin',
-    'homing-missile-firing',
-    'homini',
-    'homini-',
-    'hominibus',
-    'hominivorax',
-    'hominoid-type',
     'hominorum',
-    'homisgrinde',
-    'homkirk',
-    'homly',
-    'homm',
-    'hommages',
-    'homme-soupe',
-    'hommels',
-    'hommer',
-    'homnivorax',
-    'homo(oligonucleotide)',
-    'homo-and',
-    'homo-capacity',
-    'homo-eroticism',
-    'homo-taurocholic',
-    'homo/sexuals',
     'homoatomic',
-    'homobono',
-    'homocentric',
-    'homoceras',
-    'homocholic',
-    'homocide',
-    'homodimerize',
-    'homoeomorph',
-    'homoeomorphs',
-    'homoeomorphy',
-    'homoeostasis',
-    'homoeostatic',
-    'homoerotics',
-    'homogeneous.',
-    'homogenicity',
-    'homogenizations',
     'homogenizer',
-    'homography',
-    'homoiomerous',
-    'homoiothermic',
-    'homologues.',
-    'homolytically',
-    'homomorphism',
-    'homomorphisms',
-    'homonuclear',
-    'homonymy',
-    'homophile',
-    'homophobically',
-    'homophobics',
-    'homophone/non-homophone',
-    'homophonically',
-    'homophorically',
     'homopolymerisation',
-    'homopterans',
-    'homorganic',
-    'homorhythmic',
-    'homosapien',
-    'homosapiens',
-    'homosecual/bisexual',
-    'homosexual\'',
-    'homosexual-bashing',
-    'homosexual-looking',
-    'homosexual-related',
-    'homosexual/humanist/intellectual',
-    'homosexualist',
-    'homosexualities',
-    'homosexualization',
-    'homosexualized',
     'homosexually',
-    'homosexually-centred',
-    'homosexually-relevant',
-    'homosexuals/mid-way',
-    'homotheticity',
-    'homotopic',
-    'homotopy',
-    'homotransplants',
-    'homotypic',
-    'homours',
-    'homs',
-    'homstat-pybus',
-    'homuncular',
-    'homuncules',
-    'homy',
-    'hon-chung',
     'hon-ecker',
-    'hon.msc',
-    'hon.sec.',
-    'hon.secretary',
-    'honason',
-    'honbl',
-    'honda-derived',
-    'honda-honda',
-    'honda-powered',
-    'hondal',
-    'honday-mrkos-pajdusakova',
-    'honde',
-    'hondecoeter',
-    'hondoq',
-    'hondred',
-    'honduran-based',
     'hondurans',
-    'honduras-based',
-    'honduras-el',
-    'hondure&ntilde;o',
-    'hondurensis',
-    'honecker-like',
-    'honed-steel',
-    'honeff',
-    'honeker',
-    'honeoye',
-    'honer',
-    'honerable',
-    'honeret',
-    'honert',
-    'honesom',
-    'honest-jill-ordinary',
     'honest-joe',
-    'honest-speaking',
-    'honest-while',
-    'honest.',
-    'honest/dishonest',
-    'honeste',
-    'honestee',
-    'honester-',
-    'honesto',
-    'honesty-to',
-    'honesty.',
-    'honey-and-curd',
-    'honey-baked',
-    'honey-cakes',
-    'honey-cells',
-    'honey-coral',
     'honey-eater',
-    'honey-filled',
-    'honey-glazed',
-    'honey-glistening',
-    'honey-guide',
-    'honey-guides',
-    'honey-hunters',
-    'honey-laden',
-    'honey-lit',
-    'honey-making',
-    'honey-man',
-    'honey-moon',
-    'honey-pale',
-    'honey-phrased',
-    'honey-pot',
-    'honey-roasted',
     'honey-scent',
-    'honey-stoned',
-    'honey-strokes',
-    'honey-tan',
-    'honey-throated',
-    'honey-tongue',
-    'honey-trap',
-    'honey-traps',
-    'honey-whitish',
-    'honey/animal',
-    'honey/chief',
-    'honey/head',
-    'honeybeer',
-    'honeybell',
-    'honeybourne/worcestershire',
-    'honeyboy',
     'honeybun',
-    'honeybunch',
-    'honeycake',
-    'honeycombe',
-    'honeycreepers',
-    'honeycrock',
-    'honeycup',
-    'honeydon',
-    'honeyeater',
-    'honeyeaters',
-    'honeyguides',
-    'honeyman/landlord',
-    'honeymen',
-    'honeymoon/the',
-    'honeysgreen',
-    'honeysu',
     'honeysuckers',
-    'honeysucking',
-    'honeysuckle-filtered',
-    'honeysuckled',
-    'honeythunder',
-    'honeywill',
-    'honeywood',
-    'hong-kong-based',
-    'hong-shui',
-    'hong-tao',
-    'hongen',
-    'hongera',
-    'hongkongbank',
-    'hongmid',
-    'hongois',
-    'hongre',
     'hongs',
-    'hongsheng',
-    'hongue',
-    'hongwen',
-    'hongwu',
-    'hongzhang',
-    'honied',
-    'honikman',
-    'honingham',
-    'honjohn',
-    'honk-honks',
-    'honly',
-    'honnauer',
-    'honnecker',
-    'honnef',
-    'honnert',
     'honneur',
-    'honneurs',
-    'honningsvag',
-    'honny',
-    'honorably',
-    'honorands',
-    'honorariums',
-    'honorato',
-    'honoremus',
-    'honori',
-    'honorin&egrave',
-    'honorine',
-    'honoris',
-    'honour&rehy;able',
-    'honour-less',
-    'honour-seeker',
     'honour.',
-    'honour/fleming',
-    'honourships',
-    'honr',
-    'hons/meng',
-    'hontas',
-    'hontoir',
-    'honwana',
-    'hony-moon',
-    'honywood',
-    'honza/fiddle',
-    'honzontales',
-    'hoo-arn',
-    'hoo-doo',
-    'hoo-hee',
-    'hoo-hoo',
     'hoo-hoo-hoo',
-    'hoo-wee',
-    'hoobaka',
-    'hooble',
-    'hoochie',
-    'hood\'',
-    'hood-down',
-    'hood-dryer',
-    'hood-fitting',
-    'hood-like',
-    'hood-looking',
-    'hood-related',
-    'hood-slits',
-    'hood/fire',
-    'hooder',
-    'hoodlike',
     'hoodooed',
-    'hoodoos',
-    'hoodwinks',
-    'hoody',
-    'hooe',
-    'hooever',
-    'hoof-beat',
-    'hoof-like',
-    'hoof-pick',
-    'hoof-ploughed',
-    'hoof-print',
-    'hoof-prints',
-    'hoof-puddles',
-    'hoof-shaped',
-    'hoof.',
-    'hoofbeat',
     'hoofdorp',
-    'hoofers',
-    'hoofmarks',
-    'hoofprint',
-    'hoofstick',
-    'hooft',
-    'hoog',
-    'hoogenkamp',
-    'hoogovens',
-    'hoogsteen',
-    'hoohley',
-    'hooing',
-    'hook\'',
-    'hook-a-duck',
-    'hook-cum-uppercut',
-    'hook-ended',
     'hook-free',
-    'hook-handed',
-    'hook-length',
-    'hook-shaped',
-    'hook-worm',
-    'hook/glider',
-    'hook/release',
-    'hookbaits',
-    'hooked-back',
-    'hooked.',
-    'hooker.',
-    'hookham',
-    'hooking-up',
-    'hookless',
-    'hooklinks',
-    'hookos',
     'hookriggs',
-    'hooks-and-copperheads',
-    'hooktiers',
-    'hookworm-free',
-    'hoola',
-    'hooleys',
-    'hooliganesque',
-    'hooliganiana',
-    'hooliz',
-    'hoolywood',
-    'hoom-boom-boom',
-    'hoom-hoom',
-    'hoom-voom-boom',
-    'hoom-zoom-boom-foom',
-    'hoomey-sized',
-    'hoomey.',
     'hooned',
-    'hoong',
-    'hooning',
-    'hooo',
-    'hooome',
-    'hoooo',
-    'hoooom',
-    'hoooomm',
-    'hoooooooooommm',
-    'hoooooooooooommmmmwhop',
-    'hoop-back',
-    'hoop-item',
-    'hoop-petticoat',
-    'hoop-skirts',
-    'hoop-tiles',
-    'hoopdriver',
     'hooper-seated',
-    'hooper/castrol',
-    'hooper/health',
-    'hooper/pensioner',
-    'hooper/vet',
-    'hoopes',
-    'hoopi',
-    'hoopii',
-    'hoorahed',
-    'hooraydom',
-    'hoorded',
-    'hoorie',
-    'hoornik-bouhuys',
-    'hoors',
-    'hoos',
-    'hoost',
     'hoostes',
-    'hootenanny',
-    'hootinanny',
-    'hooty',
-    'hoovdzayn',
-    'hooved',
-    'hoovegeen',
-    'hoover-wielder',
-    'hooverful',
-    'hooverites',
-    'hoovermatic',
-    'hoovertical',
-    'hoovervilles',
-    'hooydonck',
-    'hop(s)',
-    'hop-back',
     'hop-kiln',
-    'hop-picker',
-    'hop-pickers',
-    'hop-scotching',
-    'hop/father',
-    'hop/house-',
-    'hopabout',
-    'hopak',
-    'hopalongcarcity',
-    'hopcraft/barman',
-    'hope-association',
-    'hope-filled',
-    'hope-for-the',
-    'hope-fully',
-    'hope-hawkins',
-    'hope-sykes',
     'hope-taylor',
-    'hope-wallace',
-    'hope/herefordshire',
-    'hope3ful',
-    'hopea',
-    'hopecroft',
-    'hoped&mdash;more',
-    'hopef',
-    'hopeful-looking',
-    'hopefulls',
-    'hopefuly',
-    'hopegill',
-    'hopei',
-    'hopeland',
-    'hopeless.',
-    'hopelessly-ill',
     'hopeprotested',
-    'hopes/store',
-    'hopes/they',
-    'hopes/widower',
-    'hopeside',
-    'hopesto',
-    'hopethings',
-    'hopeworths',
-    'hopffer',
-    'hopfgarten',
-    'hophoponmi',
-    'hopin\'',
-    'hoping/planning',
-    'hopis',
-    'hopital',
-    'hopkin-morris',
     'hopkins&ndash;thomas',
-    'hopkins/gloucestershire',
-    'hopkins/guide',
-    'hopkins/henry',
-    'hopkins/oxfordshire',
-    'hopkins/protestor',
-    'hopkinsons',
-    'hoploegynys',
-    'hopovo',
-    'hoppe-seyler',
-    'hoppegarten',
-    'hopper-disowned',
-    'hopper-shaped',
-    'hopper-vent',
-    'hoppin\'',
-    'hoppiness',
     'hoppity-skips',
-    'hoppled',
-    'hoppo',
-    'hoppoles',
-    'hoppum',
-    'hopsack',
-    'hopsack-look',
-    'hopscotched',
-    'hopson',
-    'hopson/shop',
-    'hoptastic',
-    'hoptonwood',
-    'hopwood/research',
-    'hopwood/save',
-    'hopwood/worcestershire',
-    'horabik',
     'horadam',
-    'horaitis',
-    'horary',
-    'horas',
-    'horation',
-    'horbar',
-    'horbys',
-    'horcal',
-    'horche',
-    'horcum',
-    'hord',
-    'horda',
-    'hordein',
-    'hordem',
-    'horders',
-    'hordies',
     'hordleys',
-    'horeau',
-    'horelick',
-    'horely',
-    'horen',
-    'horestes',
-    'horethorne',
-    'horewell',
-    'horge',
-    'horia',
-    'horific',
-    'horigome',
-    'horik',
-    'horikawa',
-    'horinouchi',
-    'horisk',
     'horiz',
-    'horizon&mdash',
-    'horizon&ndash;what',
-    'horizon-wide',
-    'horizon/',
-    'horizon/bass',
-    'horizons.',
-    'horizontale',
-    'horizontally-constrained',
-    'horizontally-opposed',
-    'horizontally-pivoting',
-    'horkesley',
-    'horkey',
-    'horl',
-    'horlicks-shaming',
-    'horlitz',
     'horloge',
-    'horloger',
-    'horman',
-    'hormann',
-    'hormaza',
-    'hormel',
-    'horminum',
-    'hormo',
-    'hormonal-type',
-    'hormone-aided',
-    'hormone-dependent',
-    'hormone-free',
-    'hormone-frenzy',
-    'hormone-like',
-    'hormone-sensitive',
-    'hormone.',
     'hormone.controlled',
-    'hormones/chemical',
-    'hormuzd',
-    'horn&rehy;maker',
-    'horn-balanced',
-    'horn-bearing',
-    'horn-blowing',
-    'horn-calls',
-    'horn-coloured',
-    'horn-cores',
-    'horn-effect',
-    'horn-led',
-    'horn-like',
-    'horn-notes',
-    'horn-riffed',
-    'horn-shaped',
     'horn-sounding',
-    'horn-tethered',
-    'horn/balloon',
-    'hornad',
-    'hornak',
-    'hornbaek',
-    'hornbeams',
-    'hornberg',
-    'hornblendes',
-    'hornbooks',
-    'hornby-size',
-    'hornby/owner',
-    'horncall',
-    'horne.',
-    'horne/driver',
-    'horne/royal',
     'horne/sleep',
-    'hornebolt',
-    'horned-moon',
-    'horned-stock',
-    'hornel',
-    'hornemanni',
-    'horners',
-    'hornet-like',
-    'horngren',
-    'hornick',
-    'hornier',
-    'hornified',
-    'hornigold',
-    'horniness',
-    'horningham',
-    'hornings',
     'horningtoft',
-    'hornist',
-    'hornito',
-    'hornitos',
-    'hornn',
-    'hornrims',
-    'hornsby-smith',
-    'hornsea-cum-riston',
-    'hornstrandir',
-    'hornton/oxfordshire',
-    'hornum',
-    'hornworm',
-    'horny\'',
-    'horny-clawed',
-    'horny-hatted',
-    'horologically',
     'horologii',
-    'horoscopy',
-    'horowitzian',
-    'horr&eacute;os',
-    'horreum',
-    'horreur',
-    'horrey',
-    'horribilus',
-    'horrible&mdash;and',
-    'horrible-long',
-    'horrible-looking',
-    'horrible-tasting',
-    'horrible.',
-    'horriblis',
-    'horribly-deformed',
-    'horriby',
     'horrid-looking',
-    'horrid-things',
-    'horrida',
-    'horrids',
-    'horrific-comic',
-    'horrific-looking',
-    'horrifyng',
-    'horris',
-    'horritt',
-    'horro',
-    'horrocks-taylor',
-    'horrockses',
-    'horror-comedy',
-    'horror-comic-from-the-\'50s',
-    'horror-of-it-all',
-    'horror-show',
     'horror-thriller',
-    'horror-tv',
-    'horror/',
-    'horror/sci-fi',
-    'horrors/miracle',
-    'horrorscope',
-    'horrorshow',
-    'horrorvid',
-    'horry',
-    'hors-champs',
-    'hors-d',
-    'hors-doeuvres',
-    'horscroft',
-    'horsd\'oeuvre',
-    'horse&rehy;chestnut',
-    'horse-and-buggy',
     'horse-and-hand',
-    'horse-bit',
-    'horse-blanket',
-    'horse-breaking',
-    'horse-buses',
-    'horse-cart',
-    'horse-chestnut-strong',
-    'horse-cloth',
-    'horse-copers',
-    'horse-country',
-    'horse-cult',
-    'horse-dealers',
-    'horse-dealing',
-    'horse-dope',
-    'horse-driven',
-    'horse-eating',
     'horse-face',
-    'horse-feed',
-    'horse-fights',
-    'horse-flesh',
-    'horse-flies',
-    'horse-furniture',
-    'horse-gob',
-    'horse-harness',
-    'horse-harnesses',
-    'horse-head',
-    'horse-heads',
-    'horse-held',
-    'horse-herd',
-    'horse-herds',
-    'horse-hoofs',
-    'horse-keepers',
     'horse-laughs',
-    'horse-leader',
-    'horse-leather',
-    'horse-lengths',
-    'horse-litters',
-    'horse-locks',
-    'horse-lords',
-    'horse-lovers',
-    'horse-loving',
-    'horse-meat',
-    'horse-mint',
-    'horse-mowing',
-    'horse-munched',
-    'horse-mushrooms',
-    'horse-partnership',
-    'horse-piss',
     'horse-ploughed',
-    'horse-raising',
-    'horse-rearing',
-    'horse-resembling',
-    'horse-ride',
-    'horse-show',
-    'horse-shrine',
-    'horse-smell',
-    'horse-stealers',
-    'horse-tackle',
-    'horse-tail',
-    'horse-theft',
-    'horse-thieves',
-    'horse-thieving',
-    'horse-trade',
-    'horse-traffic',
     'horse-tram',
-    'horse-troops',
-    'horse-van',
-    'horse-vet',
-    'horse-wheel',
-    'horse-wheels',
-    'horse-whip',
-    'horse-witches',
-    'horse-woman',
-    'horse-y',
-    'horse/',
-    'horse/human',
-    'horse/steed',
-    'horse=chestnut',
-    'horsebeach',
-    'horseblanket',
     'horseboss',
-    'horsebrass',
-    'horsebrasses',
-    'horsebreakers',
-    'horsebreeding',
-    'horsecart',
-    'horsecrusher',
-    'horsedung',
-    'horsefeathers',
-    'horsefeed',
-    'horsefields',
-    'horsefixers',
-    'horsehay',
-    'horsehead',
-    'horsehide',
-    'horsekeeper',
     'horseman/macintyre',
-    'horsemastership',
-    'horsenaile',
-    'horsens',
-    'horsepower-leap',
-    'horserider',
-    'horses&mdash;and',
-    'horses.4',
-    'horses/mules/donkeys',
-    'horses/ponies',
-    'horseshoe-necked',
-    'horseshoeshaped',
-    'horsetrough',
-    'horsewank',
-    'horseways',
-    'horsewear',
     'horsewhipped',
-    'horsewhipping',
-    'horseyculture',
-    'horsholm',
-    'horsie',
-    'horsley-hayling-pilger',
-    'horslips',
-    'horsnell/institute',
-    'horsophiles',
-    'horst-henning',
-    'horste',
-    'horstell',
-    'horsthemke',
-    'horstman',
-    'horswell',
-    'horte',
     'hortensio',
-    'hortherised',
-    'horticulturists.',
-    'hortillonages',
-    'hortis',
-    'hortmanowicz',
-    'horton-in-ribbledale',
-    'horton/ipsden',
-    'horton/managing',
-    'horton/manchester',
-    'horton/passenger',
-    'hortos',
-    'hortulan',
-    'hortulanus',
-    'hortulus',
-    'hortun',
     'horty',
-    'horun',
-    'horwell',
-    'horwiches',
-    'horwood.',
-    'horwood/liberal',
-    'horyn',
-    'hos-hospital',
-    'hos.',
-    'hosanna-ing',
-    'hosannah',
-    'hosayn',
-    'hosby',
-    'hose-cart',
-    'hose-in-hose',
-    'hose-jet',
     'hose-piping',
-    'hose-reel',
-    'hose-reels',
-    'hose/rope',
-    'hoseco',
-    'hosein',
-    'hosek',
-    'hoselock',
-    'hosenball',
-    'hosereel',
-    'hosetail',
-    'hosetails',
-    'hosetti',
-    'hoseyn',
-    'hosgood',
-    'hoshi',
     'hosing-out',
-    'hosker',
-    'hoskins.',
-    'hoskinson',
-    'hoskynsish',
-    'hoslabs',
-    'hosley',
-    'hosoe',
-    'hosoever',
-    'hosoi',
-    'hosover',
-    'hospental',
-    'hospers',
-    'hosphorylation',
-    'hospidaje',
-    'hospiscare',
     'hospit',
-    'hospital-',
-    'hospital-centred',
-    'hospital-clinic',
-    'hospital-like',
-    'hospital-related',
-    'hospital-run',
-    'hospital-style',
-    'hospital-to-general',
-    'hospital-type',
-    'hospital.adisa',
-    'hospital.after',
-    'hospital.he',
-    'hospital.his',
-    'hospital.ian',
-    'hospital.it',
     'hospital/bristol',
-    'hospital/following',
-    'hospital/in',
-    'hospital/jail',
-    'hospital/oxford',
-    'hospitalet',
-    'hospitalic',
-    'hospitalise',
-    'hospitalities',
-    'hospitality-packaged',
-    'hospitalizes',
-    'hospitally',
-    'hospitals.',
-    'hospitals/nursing',
-    'hospitals/specialties',
-    'hospitalthe',
     'hospitelli',
-    'hospitium',
-    'hosptal',
-    'hosptial.',
-    'hossam',
-    'hossan',
-    'host-bacterium',
-    'host-cuckoo',
-    'host-economy',
-    'host-government',
-    'host-mud',
-    'host-nation',
-    'host-plants',
-    'host-sediment',
-    'host-species',
-    'host-x',
     'host/',
-    'host:centre',
-    'host:institute',
-    'host:nordic',
-    'host:regional',
-    'host:royal',
-    'host:school',
-    'hostacylkin',
-    'hostage-holders',
-    'hostage-hour',
-    'hostage-taker',
-    'hostage-to-fortune',
-    'hostage/contra',
-    'hostaged',
-    'hostages-for-arms',
-    'hostages.',
     'hostal-pension',
-    'hostel-based',
-    'hostel-dwelling',
-    'hostel-type',
-    'hostell',
-    'hostels.',
-    'hostemque',
-    'hostess-bar',
-    'hostessed',
-    'hostessy',
-    'hostetler',
-    'hostiar',
-    'hostias',
-    'hostied',
-    'hosties',
-    'hostile-looking',
     'hostile/competitive',
-    'hostilicium',
-    'hostler',
-    'hostnode',
-    'hostvax',
-    'hot&mdash;in',
-    'hot&rehy;footed',
-    'hot&rehy;knife',
-    'hot-and-cold',
-    'hot-and-sweet',
-    'hot-application',
-    'hot-arsed',
-    'hot-band',
-    'hot-brush',
-    'hot-brushes',
-    'hot-button',
     'hot-cathode',
-    'hot-chocolate-drinking-chocolate',
-    'hot-climate',
-    'hot-cold',
-    'hot-day',
-    'hot-dip',
-    'hot-dogged',
-    'hot-doggers',
-    'hot-eyre',
-    'hot-fill',
-    'hot-flushed',
-    'hot-heated',
-    'hot-heavy',
-    'hot-housing',
-    'hot-jetters',
-    'hot-juiced',
     'hot-keys',
-    'hot-link',
-    'hot-milk',
-    'hot-oil',
-    'hot-pepper',
-    'hot-pie',
-    'hot-pink',
-    'hot-pluggable',
-    'hot-rodder',
-    'hot-room',
-    'hot-rooms',
-    'hot-seating',
-    'hot-seats',
-    'hot-setting',
-    'hot-shops',
-    'hot-sour',
     'hot-springs',
-    'hot-swappable',
-    'hot-taped',
-    'hot-tasting',
-    'hot-tip',
-    'hot-tongued',
-    'hot-tub',
-    'hot-water-and-coal',
-    'hot/',
-    'hotbrush-curling',
-    'hotch-potsh',
-    'hotchkiss/captain',
-    'hotcupboards',
-    'hotdog',
-    'hote',
-    'hotec',
     'hotel&mdash;as',
-    'hotel&rehy;keeping',
-    'hotel**',
-    'hotel-based',
-    'hotel-building',
-    'hotel-cum-clubhouse',
-    'hotel-cum-restaurant',
-    'hotel-guests',
-    'hotel-keepers',
-    'hotel-like',
-    'hotel-occupancy',
-    'hotel-schools',
-    'hotel-size',
-    'hotel-standard',
-    'hotel.details',
-    'hotel.the',
     'hotel.they',
-    'hotel/casinos',
-    'hotel/centre',
-    'hotel/country',
-    'hotel/theatre/art',
-    'hotel/transportation/holiday',
-    'hoteling',
-    'hotelkeeper/american',
-    'hotelling-downs',
-    'hotelroom',
-    'hotels-to-racing',
-    'hotels.',
-    'hotels/pensions',
-    'hotels2',
-    'hotelsville',
-    'hoteltech',
     'hothampton',
-    'hothar',
-    'hothfield',
-    'hothousing',
-    'hoti',
-    'hotiman',
-    'hotkeys',
-    'hotlips',
-    'hotly-coloured',
-    'hotly-debated',
-    'hotly-disputed',
-    'hotly-tongued',
-    'hotly.',
-    'hotokukai',
-    'hotpoints',
-    'hotpressed',
     'hotrails',
-    'hotrec',
-    'hotrods',
-    'hotscreen',
-    'hotsiest',
-    'hotsit',
-    'hotspurs',
-    'hotston',
-    'hotta',
-    'hotten',
-    'hottened',
-    'hotterotter',
-    'hotterrotter',
-    'hottish',
-    'hotwater',
-    'hotwave',
     'hotwire',
-    'hou-sen',
-    'houa',
-    'houae',
-    'houblon',
-    'houcine',
-    'houckgeest',
-    'houdinis',
-    'houffalize',
-    'hougaard',
-    'houghton-berry',
-    'houghton-le-springs',
-    'houghton/moredon',
-    'hougue',
-    'houiller',
-    'houilles',
     'houlden',
-    'houldin',
-    'houle',
-    'houlihans',
-    'houliston',
-    'houlson',
-    'houma',
-    'houmphanh',
-    'hound-dog',
-    'hound-like',
-    'hound-whelp',
-    'houndes',
-    'houndhill',
-    'houndrd',
-    'hounds-tooth',
-    'houndses',
     'houndsfish',
-    'houndslow',
-    'houndstooths',
-    'hounshell',
-    'hounslow/thames',
-    'hounsworth',
-    'houphou&euml;t',
-    'hour\'',
-    'hour\'s-worth',
-    'hour(s)',
-    'hour-after-hour',
-    'hour-an-a-half',
-    'hour-and-a-',
-    'hour-and-a-half\'s',
-    'hour-by-hour',
-    'hour-glassed',
     'hour-it',
-    'hour-scale',
-    'hour-to-hour',
-    'hour.it',
-    'hour/10',
-    'hour/day',
-    'hourahane/senior',
-    'hourand',
-    'houre',
-    'hourglass-shaped',
-    'hourglasses',
-    'houria',
-    'hourihan',
-    'hourlong',
-    'hourly-payed',
-    'hourly-rates',
     'hourly-updated',
-    'hourly/weekly/monthly',
-    'hours-a-day',
-    'hours-a-week',
-    'hours-building',
-    'hours-for',
-    'hours-long',
-    'hours-of',
-    'hours-worth',
-    'hours.4',
-    'hours.erika',
-    'hours.so',
-    'hours.the',
-    'hours.there',
-    'hours/day',
-    'hours:12',
     'hourstons',
-    'housane',
-    'houscham',
-    'house&mdash',
-    'house&mdash;most',
-    'house&mdash;see',
-    'house&rehy;keeping',
-    'house-agent',
-    'house-based',
-    'house-brampton',
-    'house-breakers',
-    'house-call',
-    'house-callers',
-    'house-care',
-    'house-chapel',
-    'house-cleaner',
     'house-cleansing',
-    'house-cow',
-    'house-cows',
-    'house-dog',
-    'house-dogs',
-    'house-dress',
-    'house-dust',
-    'house-estate',
-    'house-factor',
-    'house-fires',
-    'house-full',
-    'house-gown',
-    'house-groups',
-    'house-guest',
-    'house-hold',
-    'house-holder',
     'house-humped',
-    'house-hunter',
-    'house-hunts',
-    'house-huts',
-    'house-itis',
-    'house-laundering',
-    'house-lights-on',
-    'house-like',
-    'house-made',
-    'house-maid',
-    'house-maids',
-    'house-martin-like',
-    'house-mates',
-    'house-meeting',
-    'house-move',
-    'house-moves',
     'house-of-horrors',
-    'house-of-water',
-    'house-painters',
-    'house-painting',
-    'house-phone',
-    'house-planning',
-    'house-plant',
-    'house-plots',
-    'house-proudness',
-    'house-renovators',
-    'house-renting',
-    'house-repair',
-    'house-rules',
-    'house-searches',
-    'house-servant',
-    'house-shaped',
     'house-sharing',
-    'house-shell',
-    'house-sites',
-    'house-snake',
-    'house-soiling',
-    'house-spiders',
-    'house-spirit',
-    'house-steward',
-    'house-surgeons',
-    'house-sweeps',
-    'house-top',
-    'house-tops',
-    'house-wife',
-    'house-wifery',
-    'house-wise',
-    'house-yob',
     'house.',
-    'house.and',
-    'house.i',
-    'house.it',
-    'house.just',
-    'house.or',
-    'house.so',
-    'house.treasures',
-    'house/',
-    'house/apartment',
-    'house/arundel',
-    'house/at',
-    'house/bank',
-    'house/calorifier',
-    'house/changing',
-    'house/charlie',
     'house/flat',
-    'house/garage',
-    'house/jackson',
-    'house/northamptonshire',
-    'house/s',
-    'house/secker',
-    'house/times',
-    'housebreak',
-    'housebrick',
-    'housebricks',
-    'housebuyer',
-    'housecare',
-    'housecarles',
-    'housecat',
-    'housecleaner',
-    'housecleaning',
     'housecleanings',
-    'housecow',
-    'housecows',
-    'housed-the',
-    'housedress',
-    'housefather',
-    'housefrau',
-    'housegate',
-    'housegirl',
-    'houseguesting',
-    'houseguests',
-    'household-goods',
-    'household-humming',
-    'household-name',
-    'household-related',
-    'household-skin',
     'householder/houseowner',
-    'householding',
-    'househunters',
-    'houseing',
-    'housekeena',
-    'housekeeper-',
-    'housekeeper-woman',
-    'housekeeping.',
-    'housekeeps',
-    'houseleek',
-    'houseless',
-    'houseman/gp',
-    'housemastership',
-    'housemate',
-    'housent',
-    'housepainter',
     'housephone',
-    'housequake',
-    'houser',
-    'housers',
-    'houses\'new',
-    'houses/cottages',
-    'houses/flats',
-    'houses/no',
-    'houseshold',
-    'housesholds',
-    'housestaff',
-    'housestyles',
-    'houseswap',
-    'housetop',
-    'houseware',
-    'housewife&rehy;tormenting',
     'housewife-mother',
-    'housewife-technologist',
-    'housewife-turned-megastar',
-    'housewife-wife-mother',
-    'housewife/house-husband',
-    'housewife/houseworker',
-    'housewife/mother',
-    'housewife/mum/part-time',
-    'housewifes',
-    'housewifey',
-    'housewifish',
-    'housewifry',
-    'housewive',
-    'housewives-to-be',
-    'housewives.',
-    'housewoman',
     'housework-wise',
-    'housework.',
-    'housey',
-    'houseywife',
-    'housholds',
-    'housin',
-    'housing&mdash',
-    'housing\'',
-    'housing-based',
-    'housing-blocks',
-    'housing-building',
-    'housing-led',
-    'housing-state',
-    'housing/industrial',
-    'housing_per',
-    'housingrich',
     'housley',
-    'houssaies',
-    'housset',
-    'houssies',
-    'houst',
-    'housteads',
-    'houstin',
-    'houston/vicar',
-    'houstounianae',
-    'houtekins',
-    'houtris',
-    'houtris/restaurateur',
-    'houts',
-    'houtsize',
-    'houw',
-    'houwelingen',
     'houx',
-    'houyenga',
-    'houyhnhnm',
-    'houyse',
-    'hov&euml;v&iacute',
-    'hov\'ring',
-    'hove-actually',
-    'hove-bubble',
-    'hoveden',
-    'hovelled',
-    'hover-boots',
-    'hover-ferry',
-    'hover-mower',
-    'hover-searching',
-    'hover-speeder',
-    'hover-speeders',
     'hover-table',
-    'hoverbus',
-    'hoverer',
-    'hoveringham',
-    'hoverlloyd',
-    'hovertank',
-    'hovertrain',
-    'hovevei',
-    'hovig',
-    'hovils',
-    'hovis-type',
-    'hovland',
-    'hovmand',
-    'hovsep',
-    'how&mdash',
-    'how\'s-your-father',
     'how\'y',
-    'how\'ya',
-    'how-could-you-think-it-of-me',
-    'how-daft-can',
-    'how-do',
-    'how-do-i-get-home',
-    'how-do-you-say',
-    'how-ever',
-    'how-green-i-am',
-    'how-green-was-my-valley',
-    'how-heavy',
-    'how-i-conquered-my-bad-habits-and-became-a-normal-person',
-    'how-its-done',
-    'how-man',
-    'how-many',
-    'how-not-not-to',
     'how-on-earth-was-it-done',
-    'how-pupils',
-    'how-to-do',
-    'how-to-do-it',
-    'how-to-stop-them-laughing-on-the-beach',
-    'how-to-train',
-    'how-when',
-    'how-will-he-get-out-of-this',
-    'how-you-say',
-    'how.from',
-    'how/when',
-    'howaldstwerke-deutscheswerft',
-    'howaldtswerke',
-    'howandever',
-    'howard-black',
-    'howard-hall',
     'howard-like',
-    'howard-murphy',
-    'howard-williams',
-    'howard.once',
-    'howard/automobile',
-    'howard/european',
-    'howard/flowers',
-    'howard/former',
-    'howard/honda',
-    'howard/rspca',
-    'howarditic',
-    'howart',
-    'howarth/science',
-    'howatch',
-    'howatt',
-    'howbridge',
     'howcott',
-    'howd\'ya',
-    'howdahs',
-    'howdee',
-    'howden-le-wear',
-    'howdenshire',
-    'howdiedoodie',
-    'howdon',
-    'howdy-doody',
-    'howe\'er',
-    'howe/anthony',
-    'howe/dog',
-    'howe/student',
-    'howea',
-    'howeizah',
-    'howell-jones',
     'howells/householder',
-    'howells/mother',
-    'howells/wyedean',
-    'howers',
-    'howes/centre',
-    'howesia',
-    'howev',
-    'howeve',
-    'however&mdash',
-    'however\'',
-    'however-all',
-    'however/in',
-    'howeys',
-    'howffs',
-    'howie/thames',
-    'howiek',
     'howitzer-fire',
-    'howiya',
-    'howjudo',
-    'howk',
-    'howker',
-    'howl-in',
-    'howl-suppressing',
-    'howlaround',
-    'howlet',
-    'howlies',
-    'howlin/publican',
-    'howlis',
-    'howm',
-    'howmore',
-    'hownes',
-    'hownslow',
     'howondaland',
-    'howpett',
-    'howse/didcot',
-    'howsehold',
-    'howses',
-    'howshold',
-    'howsons',
-    'howstead',
-    'howthe',
-    'howzabout',
-    'howzat/umpire',
-    'hox-',
-    'hox-2',
-    'hox-2.8=hox-b2',
-    'hox-2.9',
-    'hox-2.9=hox-b1',
     'hox-4.6',
-    'hox-b2(hox-2.8)',
-    'hox-b2.',
-    'hox-b2/lacz',
-    'hoxd',
-    'hoxey',
-    'hoxford',
-    'hoxha-hitler',
-    'hoxja',
-    'hoy-taylor',
-    'hoya',
-    'hoyd',
-    'hoyek',
-    'hoyem/headmaster',
-    'hoyer-larsen',
-    'hoyer-millar',
     'hoyes',
-    'hoylake/bat',
-    'hoyle/gloucestershire',
-    'hoyle/wickramasinghe',
-    'hoyningen',
-    'hoysted',
-    'hoyt',
-    'hozier',
-    'hp\'',
-    'hp-42',
-    'hp-engined',
-    'hp-gl/2',
-    'hp-ish',
-    'hp-style',
-    'hp-us',
-    'hp-ux-based',
     'hp/9000/400',
-    'hp/apollo',
-    'hp/other',
-    'hp1',
-    'hp1000',
-    'hp1050',
-    'hp14',
-    'hp15',
-    'hp17',
-    'hp200',
-    'hp2372a',
-    'hp2604',
-    'hp2645a',
-    'hp4/5',
-    'hp4192',
-    'hp42s',
     'hp64000',
-    'hp7',
-    'hp7475a',
-    'hp81',
-    'hp95lx',
-    'hpa-ii',
-    'hpai',
-    'hpff',
-    'hpfh',
-    'hpg',
-    'hphi',
-    'hplc-fractionation',
-    'hplc-purification',
-    'hplc/fplc',
-    'hpp',
-    'hps',
     'hptlc',
-    'hptp',
-    'hpu',
-    'hpv-18',
-    'hpv-mediated',
-    'hpv11',
-    'hpvs',
-    'hq/m',
-    'hq/oxfordshire',
-    'hqyspy',
-    'hr&oacute;thg&aacute;r',
-    'hr-16',
-    'hr2113/2',
-    'hr2898',
-    'hr4289',
-    'hr7',
     'hr8360',
-    'hra&dcaron;cany',
-    'hrabovszky',
-    'hrabusice',
-    'hrachya',
-    'hradcanske',
-    'hradcany',
-    'hradec',
-    'hranolky',
-    'hrdli&ccaron;ka',
-    'hrdlicka',
-    'hrdy',
-    'hrebeljanovi&cacute',
-    'hregistered',
-    'hrensko',
-    'hrhduchess',
     'hringstan',
-    'hripsime',
-    'hristmas',
-    'hristro',
-    'hrivna',
-    'hrk',
-    'hrlm',
-    'hrms',
-    'hrolfur',
-    'hromada',
-    'hroof',
-    'hrose',
-    'hrossi',
-    'hrp-conjugated',
-    'hrp-labelled',
-    'hrrrm',
     'hrs/following',
-    'hruby',
-    'hrumph',
-    'hrumphed',
-    'hrushevsky',
-    'hrusov',
-    'hrut',
-    'hrvatske',
-    'hrvatski',
-    'hrynov',
-    'hs(g)70',
-    'hs.',
-    'hs.125&ndash;1/522',
-    'hs.125s',
-    'hs.59',
-    'hs.748',
     'hs100',
-    'hs3-6',
-    'hs554/c&ndash;gevs',
-    'hs6',
-    'hs601',
-    'hs654',
-    'hs662',
-    'hs681',
-    'hs975',
-    'hs980',
-    'hsac',
-    'hsaid',
-    'hsb',
-    'hsdd5',
-    'hsdr17',
-    'hse.',
     'hse/ec',
-    'hses',
-    'hsf',
-    'hsfr',
-    'hsg-si',
-    'hsg-vermogensverwaltungs',
-    'hsiao-tung',
-    'hsien-pin',
-    'hsin-chu',
-    'hsin-ling',
-    'hsinchu',
-    'hsindsheu',
-    'hsing-hsing',
-    'hsiu-hui',
-    'hsj',
-    'hsl3',
     'hslo',
-    'hsmorris',
-    'hso-pso',
-    'hso-spso',
-    'hsob15',
-    'hsp60',
-    'hspg',
-    'hsrii',
-    'hssag',
-    'hssein',
-    'hssrp1',
-    'hsssh',
-    'hsst',
-    'hst-1',
-    'hstamine',
-    'hstory',
     'hsuang',
-    'hsun',
-    'hsv-2',
-    'hsw',
-    'hswp/hsp',
-    'ht-33',
-    'ht-3451-g11',
-    'ht-5',
-    'ht.86cm',
-    'ht/111a',
-    'htc',
-    'htef1-38',
-    'htels',
-    'hter',
-    'htfiid',
-    'hth',
     'hti',
-    'htl/tour',
-    'htmet',
-    'htn',
-    'htnt',
-    'htoo',
-    'htoon',
-    'hts',
-    'htu',
-    'htun',
-    'htus',
-    'htvl',
-    'htx',
-    'hu&aacute;0n',
-    'hu&eacute',
-    'hu&iacute;la',
     'hu\'akavameiliku',
-    'hu-16',
-    'hu-16b',
-    'hu-opp',
-    'hu1',
-    'hu5',
-    'hu9',
-    'hua-peng',
-    'hua-taipei',
-    'huac',
-    'huaca',
-    'huaching',
-    'huaguang',
-    'huai',
-    'huaibin',
-    'hualca-hualca',
     'hualgayoc',
-    'huallpa',
-    'hualung',
-    'huam&aacute;n',
-    'huamanga',
-    'huamani',
-    'huancane',
-    'huandi',
-    'huang-he',
-    'huangchuan',
-    'huanjing',
-    'huanta',
-    'huanuco',
-    'huanuhuanu',
-    'huaorini',
-    'huapi',
     'huarai',
-    'huaraz',
-    'huari',
-    'huarina',
-    'huascaran',
-    'huasheng',
-    'huasta',
-    'huatay',
-    'huayhua',
-    'huayo',
-    'hub-braked',
-    'hub-city',
-    'huband',
-    'hubauer',
-    'hubbard-nietzsche',
-    'hubbard/royal',
     'hubbardy',
-    'hubbed',
-    'hubberholme',
-    'hubbi/hubbi',
-    'hubbins',
-    'hubble-bubble',
-    'hubbling',
-    'hubbly',
-    'hubbuch',
-    'hubeau',
-    'huben',
-    'huberd',
-    'hubert\'',
-    'huberto',
-    'hubf',
-    'hubicka',
     'hublet',
-    'hubley',
-    'hubmatic',
-    'hubris-tinted',
-    'hubristes',
-    'hubscher',
-    'hubward',
-    'huchette',
-    'huck/joint',
-    'hucke\'n\'roll',
-    'huckel',
-    'huckelhoven',
-    'hucker/trainee',
-    'huckerby/sheep',
-    'huckfield',
-    'huckg',
     'huckin',
-    'huckin/retained',
-    'hucknall-penned',
-    'hucknall-style',
-    'hucknell',
-    'huckster-style',
-    'huckstering',
-    'huckstet',
-    'huczymski',
-    'hudd/cancer',
-    'hudderfield',
-    'huddersfield-born',
-    'huddersfield/west',
-    'huddersield',
-    'huddert',
-    'huddgl',
     'huddinge',
-    'huddle-shawled',
-    'huddled-up',
-    'huddleson',
-    'huddleston/student',
-    'huddlestone/students',
-    'hudds',
-    'huddur',
-    'huddy',
-    'hudes',
-    'hudghton',
-    'hudibrastic',
-    'hudlick&yacute',
-    'hudnae',
-    'hudnall',
-    'hudpith',
     'hudsbeth',
-    'hudson&ndash;immelmann',
-    'hudson-evans',
-    'hudson/principal',
-    'hudsonian-ketilidian-laxfordian-svecofennian',
-    'hudsonicus',
-    'hue-dell-oty',
-    'hueco',
-    'hueffer',
-    'hueghan',
-    'huel',
-    'huelgas',
-    'huelqu&eacute;n',
-    'huelson',
-    'huen',
-    'huerin',
     'huers',
-    'huesca',
-    'huesos',
-    'hueston',
-    'huey\'',
-    'huezo',
-    'huffed-and-puffed',
-    'huffiness',
-    'huffled',
-    'huffon-martin/estate',
-    'hufnagel',
-    'hufoof',
-    'hufuf',
-    'hugary',
-    'huge-capacity',
-    'huge-eyed',
     'huge-flowered',
-    'huge-mouthed',
-    'huge-pocketed',
-    'huge-quiffed',
-    'huge-tusked',
-    'huge-tyred',
-    'hugely&rehy;successful',
-    'hugely-crowded',
-    'hugely-hyped',
-    'hugely-magnified',
-    'hugely-talented',
-    'hugely-topical',
-    'hugette',
-    'huggard',
-    'huggate',
-    'huggath',
     'huggered',
-    'huggies',
-    'huggin\'',
-    'huggings',
-    'huggins/friend',
-    'hugh-smith',
-    'hughea',
-    'hughes-coughlan',
-    'hughes-hallett',
-    'hughes-hartman',
-    'hughes-jones',
-    'hughes-less',
-    'hughes-ryan',
-    'hughes-sir',
-    'hughes-stanton',
-    'hughes/anarchist',
     'hughes/british',
-    'hughes/coach',
-    'hughes/editor',
-    'hughes/farmer',
-    'hughes/former',
-    'hughes/green',
-    'hughes/national',
-    'hughes/parents',
-    'hughes/re-solv',
-    'hughes/solicitor',
-    'hughes/somerville',
-    'hughes/thames',
-    'hughesdon',
-    'hughesy',
-    'hughf',
-    'hughill',
     'hughlett',
-    'hughly',
-    'hughs',
-    'hughs/royal',
-    'hughson',
-    'hugies',
-    'hugley',
-    'hugly',
-    'hugnet',
-    'hugo-cola',
-    'hugo/frederick',
-    'hugten',
-    'huguene',
-    'huhuhuhuhu',
-    'huhuhuhuhuhu',
-    'huia',
     'huibo',
-    'huichol',
-    'huie',
-    'huietinhamsted',
-    'huige',
-    'huijer',
-    'huilar',
-    'huile',
-    'huilin',
-    'huillca',
-    'huimin',
-    'huioeinhamsted',
-    'huip',
-    'huiraatira/rassemblement',
-    'huiskes',
-    'huisman',
     'huistra/rangers',
-    'huit-heures-bix',
-    'huiterie',
-    'huius',
-    'huizhong',
-    'hujredin',
-    'hujus',
-    'huka',
-    'hukawng',
-    'hukum',
-    'hukumdeo',
-    'hul&egrave',
-    'hula-hoop',
-    'huldre',
-    'hulett',
-    'hulk-like',
     'hulk-out',
-    'hulked',
-    'hulkham',
-    'hulkingly',
-    'hulky',
-    'hull&ndash;harwich',
-    'hull&ndash;rotterdam',
-    'hull&ndash;zeebrugge',
-    'hull-aw',
-    'hull-flange',
-    'hull-new',
-    'hull-shaped',
-    'hull/',
-    'hull/europoort',
-    'hull/museums',
-    'hull/paediatrician',
     'hull/zeebrugge',
-    'hullah',
-    'hulland',
-    'hullasey',
-    'hullaw',
-    'hullbridge',
-    'hulli',
-    'hullmandels',
-    'hullmann',
-    'hullock',
-    'hullone',
-    'hulluva',
-    'hulme-flint',
-    'hulmerist',
-    'hulot',
-    'hulsdoncks',
     'hulsean',
-    'hulshort',
-    'hultberg',
-    'hulterstad',
-    'hulterstr&ouml;m',
-    'hultgren/quilting',
-    'hulun',
-    'hulusi',
-    'hum-free',
-    'hum-line',
-    'hum-mans',
-    'hum.',
-    'hum/2',
-    'hum/mand',
-    'human&ndash;computer',
-    'human&rehy;computer',
     'human&rehy;rights',
-    'human\'',
-    'human-and-computer',
-    'human-birth',
-    'human-capital',
-    'human-centredness',
-    'human-diviner',
-    'human-dog',
-    'human-eating',
-    'human-form',
-    'human-hamster',
-    'human-hardy',
-    'human-heart-shaped',
-    'human-hungry',
-    'human-interaction',
-    'human-looking',
     'human-ness',
-    'human-powered',
-    'human-rainforest',
-    'human-related',
-    'human-relationships',
-    'human-resource',
-    'human-sacrifice',
-    'human-scientific',
-    'human-seeming',
-    'human-settled',
-    'human-shape',
-    'human-specific',
-    'human-stories',
-    'human-style',
-    'human-walking-on-to-planes',
-    'human-worth',
     'human/animal',
-    'human/e',
-    'human/economic',
-    'human/pork',
-    'human/robot',
-    'humanatarians',
-    'humanby',
-    'humane-looking',
-    'humane-sounding',
-    'humanifit',
-    'humanis',
-    'humanisme',
-    'humanista',
-    'humanistically',
-    'humanitaran',
-    'humanities-',
     'humanities-driven',
-    'humanities-trained',
-    'humanities/environmental',
-    'humanity\'',
-    'humanity/animality',
-    'humanized-ape',
-    'humankind.',
-    'humankind/',
-    'humanly-contrived',
-    'humano-demonoids',
-    'humans.',
-    'humayrim',
-    'humberclyde',
-    'humberger',
-    'humbers',
-    'humbersome',
     'humbert-droz',
-    'humberts',
-    'humble-hearted',
-    'humble-mannered',
-    'humblebaek',
-    'humblement',
-    'humboldt-stiftung',
-    'humbucker/single-coil/humbucker',
-    'humbug-detection',
-    'humdingers',
-    'hume&rehy;adams',
-    'hume-gerry',
-    'hume/retained',
-    'humebyres',
-    'humeleng',
-    'humeltone',
     'humerous',
-    'humfreys',
-    'humfridus',
-    'humid-tropical',
-    'humidex',
-    'humidification',
-    'humidis',
-    'humidity-',
-    'humidity-absorbent',
-    'humidity-lengthening',
-    'humidity-lovers',
-    'humidors',
-    'humihia',
-    'humil',
-    'humilacting',
-    'humiliation.',
     'humiliator',
-    'humilis.',
-    'humilitas',
-    'humilitie',
-    'humilty',
-    'humin',
-    'humko',
-    'humlants',
-    'humlies',
-    'humll.',
-    'humm',
-    'hummability',
-    'hummadruz',
-    'hummels',
-    'hummersea',
-    'humming-tops',
     'hummings',
-    'hummm',
-    'hummock-forming',
-    'hummocked',
-    'hummums',
-    'humnawa',
-    'humora',
-    'humoresques',
-    'humoriensis',
-    'humoring',
-    'humoristic',
-    'humorous-looking',
-    'humorousness',
-    'humors.',
-    'humose',
-    'humour-',
     'humour-inevitably',
-    'humour-informed',
-    'humour-style',
-    'humour/wit',
-    'humoural',
-    'humouristic',
-    'humourlessness',
-    'humourously',
-    'hump-headed',
-    'hump-like',
-    'hump-muscled',
-    'hump-necked',
-    'hump-shaped',
-    'humpable',
-    'humped-up',
-    'humper',
     'humpff',
-    'humpfrey',
-    'humphed',
-    'humpheries/gloucester',
-    'humpherson',
-    'humphrey/oxfordshire',
-    'humphreys-davies',
-    'humphreys-designed',
-    'humphreys/marengo',
-    'humphreysagriculture',
-    'humphries-pen',
-    'humphries/attack',
-    'humphries/banbury',
-    'humphries/gloucestershire',
-    'humphries/head',
-    'humphries/hunt',
     'humphries/victim',
-    'humpiness',
-    'humppe',
-    'humprecht',
-    'humpreys',
-    'humpshire',
-    'humroot',
-    'humshaugh',
-    'humungus',
-    'humus-based',
-    'humus-enriched',
-    'humus-stained',
-    'hun&rehy;grier',
-    'hun\'red',
-    'huna',
-    'hunang',
     'hunap&uacute',
-    'hunataway',
-    'hunawihr',
-    'hunch-back',
-    'hunch-kuddy-hunch',
-    'hunch-shouldered',
-    'hunchback-grandfather',
-    'hunched-over',
-    'hunday',
-    'hunde',
-    'hundedth',
-    'hunden',
-    'hundered',
-    'hunders',
-    'hundertmark',
-    'hundertwasser',
     'hundested',
-    'hundio',
-    'hundith',
-    'hundland',
-    'hundrd',
-    'hundre\'',
-    'hundred&rehy;weights',
-    'hundred-and-eighty-degree',
-    'hundred-and-eighty-sided',
-    'hundred-and-fifty',
-    'hundred-and-fifty-watt',
-    'hundred-and-fourteen-pound',
-    'hundred-fathom-stirrers',
-    'hundred-fifteen',
-    'hundred-franc',
-    'hundred-handed',
     'hundred-leaved',
-    'hundred-mark',
-    'hundred-mile-long',
-    'hundred-odd-mile',
-    'hundred-page',
-    'hundred-per',
-    'hundred-seat',
-    'hundred-span',
-    'hundred-square-foot',
-    'hundred-thousand',
-    'hundred-thousandth',
-    'hundred-word',
-    'hundred-yard',
-    'hundred-year-hold',
-    'hundred-year-sleep',
-    'hundred.',
     'hundred/a',
-    'hundredfold&mdash',
-    'hundreds&mdash',
-    'hundreds-and-thousands',
-    'hundredweights',
-    'hundren',
-    'hundt',
-    'hune',
-    'huneberg/owner',
-    'huneker',
-    'huneryager',
-    'hunframe',
-    'hung&rehy;over',
-    'hung-kuan',
-    'hung-overed',
-    'hungalu',
     'hungar',
-    'hungareeee',
-    'hungarian-',
-    'hungarian-american',
-    'hungarian-czechoslovakian',
-    'hungarian-french',
-    'hungarian-held',
-    'hungarian-owned',
-    'hungarian-polish-czechoslovakian',
-    'hungarian-speakers',
-    'hungarian-teaching',
-    'hungarian-type',
-    'hungarian-ukrainian',
-    'hungarian-west',
-    'hungarian.speakers',
-    'hungarian/uk',
     'hungarianism',
-    'hungarocamion',
-    'hungarum',
-    'hungary&mdash;a',
-    'hungary\'',
-    'hungary-czechoslovakia',
-    'hungary-first',
-    'hungary-vatican',
-    'hungary109',
-    'hunger-cowed',
-    'hunger-distended',
-    'hunger-driven',
-    'hunger-pinched',
-    'hunger-strikes',
-    'hunger-though',
-    'hunger-torn',
     'hunger-written',
-    'hungerb&uuml;hl',
-    'hungers-strike',
-    'hungerstriker',
-    'hungo',
-    'hungr',
-    'hungry-eyed',
-    'hungry-sounding',
-    'huniberto',
-    'huningue',
-    'hunix',
-    'hunkie',
-    'hunkier',
-    'hunkinde',
-    'hunky-',
-    'hunky-dunky',
     'hunnic',
-    'hunnicutt',
-    'hunnings',
-    'hunnington',
-    'hunnish',
-    'hunnybell',
-    'hunphries',
-    'hunsecker',
-    'hunsford',
-    'hunship',
-    'hunsingore',
-    'hunsinngore',
-    'hunslet-built',
-    'hunslete',
-    'hunsr&uuml;ck',
-    'hunt&mdash;she',
     'hunt-servants',
-    'hunt-terrier',
-    'hunt-the-fish',
-    'hunt-the-missing-french-horn-part',
-    'hunt-the-shunt',
-    'hunt-the-thimble',
-    'hunt-training',
-    'hunt/amalgamated',
-    'hunt/community',
-    'hunt/death',
-    'hunt/driver',
-    'hunt/farm',
-    'hunt/former',
-    'hunt/gloucs',
-    'hunt/mother',
-    'hunt/scrambler',
     'hunt/swindon',
-    'hunted-looking',
-    'hunten',
-    'hunter-chaser',
-    'hunter-conservationist',
-    'hunter-fisher',
-    'hunter-fishers',
-    'hunter-foragers',
-    'hunter-god',
-    'hunter-killer',
-    'hunter-killers',
-    'hunter-nomads',
-    'hunter-warriors',
-    'hunter-weston',
-    'hunter/',
-    'hunter/driver',
     'huntercomb',
-    'hunterhouse',
-    'hunterom',
-    'huntershaw',
-    'huntershill',
-    'hunterson',
-    'huntin',
-    'huntin\'-shootin\'-fishin\'',
-    'hunting&rehy;style',
-    'hunting-and-gathering',
-    'hunting-axes',
-    'hunting-box',
-    'hunting-brae',
-    'hunting-costume',
-    'hunting-dogs',
-    'hunting-fields',
     'hunting-flask',
-    'hunting-goddess',
-    'hunting-hounds',
-    'hunting-knife',
-    'hunting-park',
-    'hunting-party',
-    'hunting-pink',
-    'hunting-seats',
-    'hunting-shooting-and-fishing',
-    'hunting-type',
-    'hunting-wizardry',
-    'hunting/bishop',
-    'hunting/buying',
-    'huntingdale',
-    'huntingdon-based',
-    'huntings',
     'huntingwood',
-    'huntley/gloucestershire',
-    'huntleys',
-    'huntry',
-    'huntservants',
-    'huntuns',
-    'hunty',
-    'hunwreste',
-    'hunyak',
-    'hunziker',
-    'huo',
-    'huorns',
-    'hup&ndash;3s',
-    'hup2',
-    'hupeh',
-    'huperzia',
     'hupet',
-    'huppert',
-    'hupsets',
-    'hupsith',
-    'hur-hur-hur',
-    'hur.',
-    'huraches',
-    'huraibi',
-    'huray',
-    'hurcomb/mother',
-    'hurd/delegation',
-    'hurd/foreign',
-    'hurdian',
-    'hurdies',
-    'hurdle-burke',
-    'hurdles&ndash;in',
     'hurdles.dog',
-    'hurdwell',
-    'hure',
-    'hurel',
-    'hurford-porter',
-    'hurgh',
-    'hurgronje',
-    'huri',
-    'hurich',
-    'huried',
-    'hurke',
-    'hurlebusch',
-    'hurles',
-    'hurlestone',
-    'hurley/nuclear',
-    'hurley/thames',
     'hurleys',
-    'hurlford',
-    'hurlin',
-    'hurll',
-    'hurlston',
-    'hurneman',
-    'hurnscot',
-    'hurok',
-    'huronian',
-    'hurran/hatherley',
-    'hurray-for-the-medici',
-    'hurree',
-    'hurrel',
-    'hurricane-blasted',
-    'hurricane-fenced',
-    'hurricane-hit',
     'hurricane-lamp',
-    'hurricane-lashed',
-    'hurricane-stricken',
-    'hurricano',
-    'hurriedly-finished',
-    'hurriers',
-    'hurrite',
-    'hurrite-hittite',
-    'hurriya',
-    'hurriyet',
-    'hurrrah',
-    'hurrrttss',
-    'hurry\'',
-    'hurry-scurry',
-    'hurry.',
-    'hurs',
     'hursch',
-    'hurschell',
-    'hursey',
-    'hursid',
-    'hurst/ashton',
-    'hurst/birdlip',
-    'hurst/brockworth',
-    'hurst/forest',
-    'hurst/gloucestershire',
-    'hurst/hartpury',
-    'hurst/herefordshire',
-    'hurst/hillersland',
-    'hurst/kington',
-    'hurst/leakage',
-    'hurst/leominster',
-    'hurst/m5',
     'hurst/middleyard/gloucestershire',
-    'hurst/natton',
-    'hurst/northampton',
-    'hurst/over',
-    'hurst/park',
-    'hurst/ross',
-    'hurst/stroud',
-    'hurst/sufferer',
-    'hurst/tewkesbury',
-    'hurst/toddington',
-    'hurst/upton',
-    'hurst/warndon',
-    'hurst/wiltshire',
-    'hurstpier',
-    'hurstwood',
-    'hurt-filled',
     'hurt.meanwhile',
-    'hurtard',
-    'hurtcha',
-    'hurteau',
-    'hurted',
-    'hurtfealt',
-    'hurtibese',
-    'hurtig',
-    'hurtin\'',
-    'hurty',
-    'hurtya',
-    'hurworth.',
-    'hus&acirc;k',
-    'hus&eacute;n',
-    'husa',
-    'husam-zade',
     'husayn-arafat',
-    'husband&mdash',
-    'husband\'',
-    'husband\'s',
-    'husband\'s.',
-    'husband-hatred',
-    'husband-huntings',
-    'husband-kidnapper',
-    'husband-sponsored',
-    'husband/as',
-    'husband/director',
-    'husband/grannie/auntie',
-    'husband/john',
-    'husband/walks',
-    'husband/wife/mother/daughter/son/employee',
-    'husband/wife/parents/children',
     'husbandland',
-    'husbandlike',
-    'husbands/wives',
-    'husbandsee',
-    'husbender',
-    'husburne',
-    'husby',
-    'huschens',
-    'husebye',
-    'huseca',
-    'huselsenbeck',
-    'husen',
-    'huset',
-    'huseyin',
-    'hush-a-bye',
-    'hush-a-bye&rehy;baby',
     'hush-puppies',
-    'hushaby',
-    'hushabyes',
-    'hushand',
-    'hushkitting',
-    'huska',
-    'huskers',
-    'huskey',
-    'huskiest',
-    'huskinson',
-    'huskison',
-    'husky&rehy;bitchy',
-    'husky-drawn',
-    'husnae',
-    'husodo',
-    'husrev-bey',
     'hussaid',
-    'hussaini',
-    'hussan',
-    'hussand',
-    'hussayn',
-    'hussein-arafat',
-    'hussein-type',
-    'husseinagriculture',
-    'husseinis',
-    'hussell',
-    'hussenott',
-    'hussenstrasse',
-    'husserlian',
-    'hussey.',
-    'hussien',
-    'hust',
     'hustle-bustle',
-    'hustler-figure',
-    'hustler-hero',
-    'huston-miyamoto',
-    'hustons',
-    'hustwick',
-    'hustwitt',
-    'hut-books',
-    'hut-dwelling',
-    'hut-to-hut',
-    'hutaple',
-    'hutber',
-    'hutch-hearted',
-    'hutchcroft',
-    'hutched',
-    'hutchence/reporting',
     'hutchens',
-    'hutchenson',
-    'hutchesons',
-    'hutchesons/aloysians',
-    'hutching',
-    'hutchingson',
-    'hutchinson/crew',
-    'hutchinson/soren',
-    'hutchinson/vintage',
-    'hutchinsoni',
-    'hutchy',
-    'huth',
-    'hutin',
-    'hutley',
-    'hutment',
-    'hutmonts',
     'huton',
-    'hutone',
-    'huttenback',
-    'hutter',
-    'hutterites',
-    'huttly',
-    'hutton&rehy;le-hole',
-    'hutton-in-the',
-    'hutton-in-the-forest',
-    'hutton/oxford',
-    'hutton/victim',
-    'huttwirt',
-    'hutu-dominated',
-    'hutz',
-    'hutzpah',
-    'huub',
     'huuhtanen',
-    'huvin\'',
-    'huwerd',
-    'huwood',
-    'huworth',
-    'huxeley',
-    'huxelrube',
-    'huxelvaner',
-    'huxleys',
-    'huxter',
-    'huybrechtse',
-    'huyett',
-    'huygues',
-    'huyink/city',
-    'huyot',
-    'huysan',
     'huyserl',
-    'huysmanns',
-    'huzar',
-    'huzard',
-    'huzkey',
-    'huzzes',
-    'huzzy',
-    'hv4s',
-    'hvad',
-    'hvae',
-    'hvaler',
-    'hvalsbakur',
-    'hvannadalsh&uacute;kur',
-    'hvd',
-    'hve',
-    'hverager&eth;i',
     'hverfisfljot',
-    'hvs&ndash;e1',
-    'hvs\'s',
-    'hvs/e1',
-    'hvs5b',
-    'hvss',
-    'hw-101',
-    'hwal',
-    'hwi',
-    'hwich',
-    'hwita',
-    'hwitinghamsted',
-    'hwm',
-    'hwp',
-    'hwr',
-    'hws-s210',
     'hws-s310&ndash;30',
-    'hws-ss10&ndash;41',
-    'hwt',
-    'hwyrftum',
-    'hx-20',
-    'hx10l',
-    'hx6',
-    'hxg3',
-    'hxg5',
-    'hxl',
-    'hxt',
-    'hy&egrave;res',
-    'hy-2',
-    'hy-drill-a',
-    'hy-flo',
-    'hy7/1106/54',
     'hyab-type',
-    'hyacinth-like',
-    'hyacinthe',
-    'hyacinthine',
-    'hyacinthus',
-    'hyader',
-    'hyaenids',
-    'hyakunin',
-    'hyalase',
-    'hyalina',
-    'hyalophora',
-    'hyaluronan',
-    'hyamson',
-    'hyat',
-    'hyatt/79th',
-    'hyberbole',
     'hybond-n+',
-    'hybrid-type',
-    'hybridation',
-    'hybridisation-based',
-    'hybridisation-like',
-    'hybridiser',
-    'hybridist',
-    'hybridity',
-    'hybridon',
-    'hybridum',
-    'hybry',
-    'hycal',
-    'hydatius',
-    'hyde\'',
-    'hyde-chambers',
-    'hyde-lees',
     'hyde/burglary',
-    'hyden',
-    'hydepark',
-    'hydepursued',
-    'hydon',
-    'hydr',
-    'hydracals',
-    'hydralazine',
-    'hydramnios',
-    'hydramoist',
-    'hydrate/water',
-    'hydration.',
-    'hydrators',
-    'hydraulic-assisted',
-    'hydraulically-activated',
-    'hydraulically-driven',
     'hydraulically-fractured',
-    'hydraulically-lowered',
-    'hydrcolloid',
-    'hydria-shoulder',
-    'hydriai',
-    'hydribisation',
-    'hydric',
-    'hydride',
-    'hydridization',
-    'hydriotaphia',
-    'hydro&rehy;chemical',
-    'hydro&rehy;planes',
-    'hydro-',
-    'hydro-chain-reaction',
-    'hydro-congo',
-    'hydro-culture',
     'hydro-desulphurisation',
-    'hydro-electrical',
-    'hydro-electrically',
-    'hydro-electrics',
-    'hydro-geologist',
-    'hydro-kinetic',
-    'hydro-planing',
-    'hydro-project',
-    'hydro-soda',
-    'hydro-thermal',
-    'hydroboration',
-    'hydrobromochlorofluorocarbons',
-    'hydrocarbon-based',
-    'hydrocarbon-bearing',
-    'hydrocarbon-calcite-uraninite-polymetallic',
-    'hydrocarbon-insoluble',
     'hydrocarbons.',
-    'hydrocatalysis',
-    'hydrocephaly',
-    'hydrochemistry',
-    'hydrochloro-thiazide',
-    'hydrochloroflourocarbons',
-    'hydrochlorotiazide',
-    'hydrochlorthiazide',
-    'hydrocholeresis',
-    'hydrocolloid',
-    'hydrocracker',
-    'hydrocut',
-    'hydrocyclones',
-    'hydrodry',
-    'hydrodynamical',
-    'hydrofluorocarbon',
     'hydrogen\'',
-    'hydrogen-3',
-    'hydrogen-atom',
-    'hydrogen-chloride',
-    'hydrogen-containing',
-    'hydrogen-cooling',
-    'hydrogen-fusion',
-    'hydrogen-into-helium',
-    'hydrogen-ion',
-    'hydrogen-oxygen',
-    'hydrogen-palladium',
-    'hydrogen-potassium-atpase',
-    'hydrogen-producing',
-    'hydrogen-rich',
-    'hydrogen-sulphide',
-    'hydrogencarbonate',
     'hydrogenhydrocarbon',
-    'hydrogeochemistry',
-    'hydrogeochemists',
-    'hydrogeomorphology',
-    'hydroid',
-    'hydroisostasy',
-    'hydrolabs',
-    'hydrolith',
-    'hydrolock',
-    'hydrologically-related',
-    'hydrolytically',
-    'hydrolyzable',
-    'hydrolyzed',
-    'hydromel',
-    'hydrometeorology',
-    'hydromotion',
     'hydroneophrosis',
-    'hydroperoxidase',
-    'hydrophiiae',
-    'hydrophilicity',
-    'hydrophilidae',
-    'hydrophilids',
-    'hydrophonic',
-    'hydropic',
-    'hydropiper',
-    'hydroplastics',
-    'hydroponically',
-    'hydrosafe',
-    'hydroslide',
-    'hydrospheric',
-    'hydrostat',
-    'hydrostatically',
     'hydrotherapies',
-    'hydrovitalising',
-    'hydroxide/magnesium',
-    'hydroxy-dicarboxylic',
-    'hydroxy-silicates',
-    'hydroxyapatites',
-    'hydroxyarylcarboxylic',
-    'hydroxybenzonitrile',
-    'hydroxycarbene',
-    'hydroxychloroquine',
-    'hydroxycholecalcioferol',
-    'hydroxychoroquine',
-    'hydroxyephedrine',
-    'hydroxyethane',
-    'hydroxyethyl-methacrylate',
-    'hydroxyethylipiperazine-ethanesulphonic',
     'hydroxyethylpeperazine-ethanesulphonic',
-    'hydroxyl-radicals',
-    'hydroxylapatite',
-    'hydroxylases',
-    'hydroxylation',
-    'hydroxyldaunomycin',
-    'hydroxylradical',
-    'hydroxylysyl',
-    'hydroxyoctadecadienoic',
-    'hydroxytryptamine',
-    'hydroxyurea',
-    'hydrozoans',
-    'hye-on-wye',
-    'hye-young',
-    'hyemale',
-    'hyena-like',
     'hyepatocyte',
-    'hyfil',
-    'hygeine',
-    'hygel&aacute;c',
-    'hygelac',
-    'hygenic',
-    'hygenist',
-    'hygieia',
-    'hygiene-obsessed',
-    'hygiene-wise',
-    'hygiene/husbandry',
-    'hygienecourses',
-    'hygienic-looking',
-    'hygroma',
-    'hygrometric',
-    'hyhel-10',
     'hyking',
-    'hyl&eacute;0',
-    'hylaeus',
-    'hylda',
-    'hyle',
-    'hylidae',
-    'hylobatidae',
-    'hylochaeros',
-    'hylochoerus',
-    'hylson-smith/headmistress',
-    'hylsop',
-    'hylyshyyn',
-    'hymac',
-    'hymenocera',
-    'hymenolepis',
-    'hymenopterists',
     'hymens',
-    'hymerkaet',
-    'hymetusite',
-    'hymn&rehy;book',
-    'hymn-',
-    'hymn-book',
-    'hymn-compositions',
-    'hymn-melody',
-    'hymn-sandwich',
-    'hymn-singers',
-    'hymn-text',
-    'hymn-tunes',
-    'hymn-writers',
-    'hymnbooks',
-    'hymning',
-    'hymnologia',
     'hymnologist',
-    'hymnology',
-    'hymnsheet',
-    'hymnsinging',
-    'hymnwriters',
-    'hymophylus',
-    'hynafol',
-    'hyndeman',
-    'hyng',
-    'hynges',
-    'hynish',
-    'hyo',
-    'hyogenic',
-    'hyoliths',
-    'hyoscin-n-butyl',
-    'hyoscine-n-butylbromide',
     'hyoxaemic',
-    'hyoxocephalus',
-    'hyp',
-    'hyp&emacr;resia',
-    'hypalon',
-    'hypam',
-    'hypancistrus',
-    'hype-artist',
-    'hype-merchant',
-    'hype.',
-    'hype.mark',
-    'hype/stereotyping',
-    'hyped&rehy;up',
-    'hypelon',
-    'hypelon-manufacturing',
-    'hyper&rehy;cunning',
     'hyper&rehy;stressed',
-    'hyper-',
-    'hyper-activity',
-    'hyper-alkaline',
-    'hyper-arid',
-    'hyper-awareness',
-    'hyper-calvinism',
-    'hyper-cardioid',
-    'hyper-competitive',
-    'hyper-conscious',
-    'hyper-developed',
-    'hyper-edges',
-    'hyper-emotional',
-    'hyper-endemic',
-    'hyper-expensive',
-    'hyper-extended',
     'hyper-extension',
-    'hyper-fetishistic',
-    'hyper-flex',
-    'hyper-hyper-arrogant',
-    'hyper-hyper-intelligent',
-    'hyper-imaginative',
-    'hyper-individualist',
-    'hyper-inflated',
-    'hyper-intense',
-    'hyper-kinetics',
-    'hyper-knee',
-    'hyper-male',
-    'hyper-marts',
-    'hyper-micro',
-    'hyper-nationalism',
-    'hyper-nationalists',
     'hyper-organism',
-    'hyper-passionate',
-    'hyper-plasia',
-    'hyper-reactivity',
-    'hyper-realist',
-    'hyper-robusticity',
-    'hyper-sensitisation',
-    'hyper-ship',
-    'hyper-smart',
-    'hyper-space',
-    'hyper-tension',
-    'hyper-trailer',
-    'hyper-transfusion',
-    'hyper-tropical',
-    'hyper.0/1',
-    'hyper.0/6.',
     'hyperaccumulation',
-    'hyperacidity',
-    'hyperactively',
-    'hyperactivists',
-    'hyperadaptation',
-    'hyperaemic',
-    'hyperaesthetic',
-    'hyperalciuric',
-    'hyperaldosteronism',
-    'hyperalertness',
-    'hyperanthes',
-    'hyperathan',
-    'hyperbaric-oxygen',
-    'hyperbase',
-    'hyperbola.',
-    'hyperbolae',
     'hyperboreans',
-    'hyperbreeding',
-    'hyperbright',
-    'hyperbuzz',
-    'hypercalcaemic',
-    'hypercalciuria',
-    'hypercarbia',
-    'hypercarbon',
-    'hypercard-based',
-    'hypercard-like',
-    'hypercast',
-    'hyperchaos',
-    'hypercoagulable',
-    'hypercolumn',
-    'hypercompetitive',
-    'hyperconsumption',
     'hypercorrect',
-    'hypercorrections',
-    'hypercorrectly',
-    'hypercortisolism',
-    'hyperdense',
-    'hyperdensity',
-    'hyperdependent',
-    'hyperdermic',
-    'hyperdiploidy',
-    'hyperdrives',
-    'hyperdrome',
-    'hyperdrone',
-    'hyperechoic',
-    'hyperemesis',
-    'hyperemia',
-    'hypereutrophic',
     'hyperextension',
-    'hyperfaxes',
-    'hyperfertility',
-    'hyperfilm-&bgr;-max',
-    'hyperfluorescence',
-    'hypergamists',
-    'hypergammaglobulinaemia',
-    'hypergammaglobulinemia',
-    'hypergamous',
-    'hypergamy',
-    'hyperganglionosis',
-    'hypergastinaemia',
-    'hypergastinaemic',
-    'hypergastrinaemic',
-    'hypergastrinemia',
-    'hyperglued',
     'hyperglycarmia',
-    'hyperglyucaemia',
-    'hypergrog',
-    'hypericoides',
-    'hyperimmune',
-    'hyperinflationary',
-    'hyperinsulinaemic',
-    'hyperinsulinemia',
-    'hyperinsulinism',
-    'hyperjoyous',
-    'hyperkeratosis',
-    'hyperkinetics',
-    'hyperkites',
-    'hyperleucocytosis',
-    'hyperlipaemic',
-    'hyperlipasaemia',
     'hyperlogic',
-    'hyperlucid',
-    'hypermaket',
-    'hypermart',
-    'hypermedium',
-    'hypermetabolic',
-    'hypermetabolism',
-    'hypermodified',
-    'hypermoralistic',
-    'hypermotility',
-    'hypermotivation',
-    'hypernationalism',
-    'hypernatraemia',
-    'hypernormal',
-    'hyperoceanic',
-    'hyperoid',
     'hyperoodan',
-    'hyperoodon',
-    'hyperosmoregulation',
-    'hyperoxygenating',
-    'hyperparasites',
-    'hyperparasitic',
-    'hyperparasitism',
-    'hyperpepsinogaenemia',
-    'hyperper',
-    'hyperpermeability',
-    'hyperphagia',
-    'hyperphosphataemia',
-    'hyperpigmented',
-    'hyperplasias',
-    'hyperpolarizes',
-    'hyperrationality',
     'hyperreactive',
-    'hyperreactivity',
-    'hyperrealism',
-    'hyperreality',
-    'hyperscalar',
-    'hyperschmaltz',
-    'hypersecreton',
-    'hypersensitivities',
-    'hyperserotoninemia',
-    'hypersexual',
-    'hypersignal',
-    'hypersnow',
-    'hyperspheres',
-    'hypersplenic',
-    'hyperstimulus',
-    'hyperstores',
     'hyperstriatum',
-    'hypersusceptibility',
-    'hyperswitch',
-    'hypertense',
-    'hypertext-like',
-    'hypertext-on-line',
-    'hypertext-style',
-    'hypertextual',
-    'hypertextuality',
-    'hypertheological',
-    'hyperthermochemo-radiotherapy',
-    'hyperthyroid',
-    'hypertime',
-    'hypertonicity',
-    'hypertransaminasaemia',
-    'hypertrichosis',
     'hypertrophied',
-    'hyperunfaithful',
-    'hypervascular',
-    'hyperware',
-    'hyperwash',
-    'hyperwhatsit',
-    'hyphen-point',
-    'hyphenating',
-    'hyphenations',
-    'hyphened',
-    'hyphernation',
-    'hypmaniacal',
-    'hypnaceae',
-    'hypno-casques',
-    'hypno-city',
-    'hypno-helmet',
     'hypno-techniques',
-    'hypno-technological',
-    'hypnoamnesia',
-    'hypnodance',
-    'hypnoid',
-    'hypnoides',
-    'hypnopompic',
-    'hypnosedatives',
-    'hypnot&rehy;ized',
-    'hypnotherapeutic',
-    'hypnotic-type',
-    'hypnotically-aided',
-    'hypnotically-produced',
-    'hypnotics/the',
-    'hypnotisable',
-    'hypnotisin\'',
     'hypnotizes',
-    'hypnum',
-    'hypo-&ggr;-globulinaemia',
-    'hypo-allergenic*',
-    'hypo-bulb',
-    'hypo-converse',
-    'hypo-glycaemics',
-    'hypo-lipidaemic',
-    'hypo-oestrogenic',
-    'hypo-r',
-    'hypo/hypertension',
-    'hypoadrenalism',
-    'hypoalbuminaemic',
-    'hypoaldosteronism',
-    'hypoallergenicity',
-    'hypocalcemia',
     'hypocellular',
-    'hypocercal',
-    'hypochaeris',
-    'hypochloraemic',
-    'hypochlorite-based',
-    'hypocholesterolemia',
-    'hypochondriasis',
-    'hypochromic',
-    'hypochromicity',
-    'hypoclinea',
-    'hypocris',
-    'hypocrisis',
-    'hypocritarum',
-    'hypocrite.',
-    'hypocro',
-    'hypodense',
     'hypodermic-gun',
-    'hypoderrnics',
-    'hypoestes',
-    'hypogaea',
-    'hypogammaglobulinemia',
-    'hypoganglionosis',
-    'hypoglaecaemic',
-    'hypognathous',
-    'hypogun',
-    'hypohalide',
-    'hypoid',
-    'hypokalaemic',
-    'hypokinesis',
-    'hypolaetin-8-glucose',
-    'hypoleneus',
-    'hypoleucos',
     'hypolimnion',
-    'hypolipemiant',
-    'hypolithic',
-    'hypolobulated',
-    'hypomag',
-    'hypomagnasaemia',
-    'hypomaniacs',
-    'hypomethylation',
-    'hypomotility',
-    'hyponatraemic',
-    'hypoparathyroidism',
-    'hypopharyngeal',
-    'hypopigmentations',
-    'hyporegeneration',
-    'hyporegenerative',
-    'hyposecretion',
     'hypostases',
-    'hypostasised',
-    'hypostasizes',
-    'hypostasizing',
-    'hypostatical',
-    'hypostatising',
-    'hypostatize',
-    'hypostatized',
-    'hyposter',
-    'hyposthenuria',
-    'hyposulphite',
-    'hypot',
-    'hypotaxis',
-    'hypothalami',
-    'hypothalamic-pituitary-gonadal',
-    'hypothalamicpituitary',
     'hypothecary',
-    'hypothecate',
-    'hypotheken',
-    'hypothelamic',
-    'hypothenar',
-    'hypothesis-based',
-    'hypothesis-formation',
-    'hypothesis-generation',
-    'hypothesis-making',
-    'hypothesis-provoking',
-    'hypothesis.',
-    'hypothesize-and-test',
-    'hypothesizer',
-    'hypothetical-deductive',
-    'hypothetico-deductively',
-    'hypotheticodeductive',
     'hypothezised',
-    'hypotonicity',
-    'hypotonics',
-    'hypoxanthine',
-    'hypoxanthine-xanthine',
-    'hyprez',
-    'hyprocrisy',
-    'hypsilophodontids',
-    'hypsithermal',
-    'hypsodont',
-    'hypsos',
-    'hypthesised',
-    'hyrcanian',
-    'hyron',
-    'hyrst',
-    'hyrum',
     'hysing',
-    'hysni',
-    'hyssington',
-    'hyssollos',
-    'hyssope',
-    'hyssopus',
-    'hyster&mdash',
-    'hysterectom',
-    'hysteria.',
-    'hysterias',
-    'hysterical\'',
-    'hystericaly',
-    'hysterid',
-    'hysterietas',
-    'hysterisation',
-    'hysteroscopic',
     'hystrichospheres',
-    'hytane',
-    'hytec',
-    'hyter',
-    'hythe/eynsham/oxfordshire',
-    'hytime',
-    'hytril',
-    'hyudrophobic',
-    'hyuk',
-    'hyum',
-    'hyuman',
-    'hyung',
-    'hyv',
-    'hyvot',
-    'hywell',
-    'hz-10',
     'hz-ta3',
-    'hz.',
-    'hzds-dominated',
-    'hzqzdsfzihivphzpetpwvovpmzgf',
-    'i%',
-    'i&amp',
-    'i&amp;sup2',
-    'i&circ',
-    'i&dollar;1',
-    'i&dollar;8',
-    'i&eacute;na',
-    'i&hstrok',
-    'i&lsqb;lay&rsqb',
-    'i&mdash;iv',
-    'i&mdash;j&mdash;k&mdash;value',
-    'i&mdash;met',
     'i&ndash;c',
-    'i&ndash;here',
-    'i&ndash;iii',
-    'i&ndash;live',
-    'i&ndash;m',
-    'i&ndash;rho',
-    'i&ndash;spit',
-    'i&ntilde&eacute;s',
-    'i&pound;1',
-    'i&pound;1.2m',
-    'i&pound;12.8m',
-    'i&pound;16.2m',
-    'i&pound;17.7m',
-    'i&pound;17.9m',
-    'i&pound;18.4m',
-    'i&pound;180',
     'i&pound;2,088',
-    'i&pound;2.16m',
-    'i&pound;2.53m',
-    'i&pound;2.55m',
-    'i&pound;2.7m',
-    'i&pound;21.4m',
+)
+
+blocks_73 = (
+    '$!e%$lier%%nspun\'$tall$$nall$&richii$$sall#%sbach$$edal$&iphere$\'lojdens&!w#"ut#+wood/street"\'n&mdash',
+    '#)\'s-legged#%-coop(!s$,kely-arn-oos$-pheasant-like$(stealing$$yard#%ables$#res#/ce&rehy;forward%!\'%!*%$with$#hes%"ie',
+    '%%moles$#kel\'%ianus$$liff#$dawi$,ekovi&cacute%!n%#ron&+son-russell)!.)&/actor+"ge+*ssociation*&mother*#raf',
+    '*\'station*&tenant)%ville$!i$!o%"n\'&&-based$(refoilan&\'gadredd&!y%.ickson-lattman+!s(!z&"ng&)x-derived',
+    '(!y\')/b.b.king\'!y%)y/jobless#!e$#ker$#lik$\'nhopher$!s%#sey%!y#$geli$#gao$!l$$rove',
+    '$#wrt##ham$&ouses.#"ia$#gan%!e##kan$#ell$"in$%nowle##lan$$eaze%"in%\'y-based\'5on-thames/oxfordshire',
+    '&!s#+man/british\'&farmer#)na-headed&\'stained%-h/maintenance%"rd&!t$"en%"oo%"ry%,ssey/jubilee\')y/leisure$$igan&#ian',
+    '%!n&"gs($vaer&!s$3och-sch&ouml;nleins$"us$&ypenny#"on#$peck#%quire#!r$"ad$\'i-fabre&&irenee&\'leonard',
+    '%!c&!h\'#son&"is&"ks&!o%"kh%*ques/owner("ta(!z$"y-%%/fair&0northamptonshire%#son&&public',
+    '$&bergen$$chil$#els&!t$/haw/development%"it$&ingham$#ler%#owe$\'on/rare&!s$%prawn$$tead%%ridge#(thusiasm',
+    '$"on$%schel#$wick#!y$#ard#$zell"$ogan#*l-y-brenin#"ra#!s"&p-cats$&halkin#!a$(dnavirus$9ran-sulphate-proteoglycan',
+    '))sa/vcam-1($like(\'treated\'"as&#tis$*tectomized%\'ic-rich\'(ojejunal&.oiminodiacetic&#tic(#s-a+)ssociated*!b\'"us%)oblastoma',
+    ')&otoxic&.encephalopathy&%fugal&0gastroenterology&\'jugular&&logist&-pathy/hepatic\'$etal&,splenomegaly#!b$)urn-style\'\'e-scott#$cats#!e$&nstall',
+    ')%(7.7)#(haestion("os$%zibah##ing#$pard$#ell$)lethwaite#"ta%%chlor%!d%-fluorobutyryl%%lobum%"ne%$peta',
+    '*"um&%hlete$\'install#&worths"#qui",r&mdash;aunt*$that,"ey*$what$\'rehy;it)#the#$-\'we$%2/neu$#and%!s',
+    '$*disability$$hair%#ead$$name$"on$(pampered$#she%!o$%thank\'!t%!o&1day-gone-tomorrow$%until$#why#!.',
+    '%%lbows$#now$#she%\'traight$%their\'!y#)/columbia$$dash#"_a%!s$*in_respect$"on$"so#(a-temple$#cla',
+    '$!d$#eus$#ion$+kl&egrave;s&#eid($tian&"id("es\'-th-m-original$*ld-at-arms\'(painters\'#sun\'\'tribune&#ica("um',
+    '&"os%#ine$$path$"rd$$stau$)ti-design%!y$,uscorritsehe$"wi#(b-eating%)flavoured%\'gardens%&robert%(smelling&&teeped',
+    '%*l&rehy;ism&(ly-based%,rium-library)!/&!t&!y$+enov&aacute%!r&!g&(t-gustar\'\'/father(&racing\'%shire%%sthal%$vois',
+    '%!g&%-haro%$vora$#lay%#ock$%odeau%%riser$$vale#)ceg-bosne&%ovian)%nians$#hel$%ology$)ulanensis&$iani',
+    '%%nides#1d&rehy;management$)-designed%&living%$mate)!s%(of-sheep$#boy\'!s$#son%&people%%women$&ubreid$$wise%#yke',
+    '#:e&mdash;upstairs&mdash;but+"we%,rehy;and-now$$-all%)different%(elements%"no%#the%%under$#.if%#now&&uclear$!/%$amid%#get',
+    '$!=$#_as%"in%"so$&before&"rt$#dem%0iacommunications&#bus&(tability)"le(#ire(\'rianism(!s(#tem',
+    '\'"y/$7ford-shrewsbury-newport))worcester(#.at)\'bulmers)#the(-/conservative(#ian+!s(&shire.-&/wales/$elsh\'%shire%"s.$$geld',
+    '$"nd%&gracht%$nium$#ric%\'ocallis$#sam%%iarch*!s%$with$$tere%&ically%#ord%%uanga$!u$"wi',
+    '$0indahl-hirschman$(ordshire$!s##gen%"rt%!t$"ig$#ott#$hard##ian%+rd-dubreuil$$bert$!c$#sau$)tability.',
+    '(!y&#ge.(\'/repeat##ken%!s$!s##lev&!a&&estorp$#ihy%!n#0m&egrave;s-style%*iacute;nio$#ada%#eia',
+    '&"ek&$frid&"ns&%owicz&!s\'#son%(phordits\'\'roditum%!s$.e&rehy;neutics%$neus(\'tically&!t%$tica(%izing',
+    '&#ray$#ida%#nie\'!o%$ppus%$tess$"oa%$dice&$orus%(genianus%\'n-hodge\'&taylor&\'/barfly%&poulos%%silla',
+    '$&sprong#;n&aacute;ndez-piju&aacute;n$"ad%!n&$dez\'$%erdon$#iae&"te(!d\'#ion%%euwde$&riksen#)o\'&dollar$*-candidacy%&figure',
+    '%%kings%*literature%&making&\'urderer%$pash&(olicemen%\'tribute%&victim%(worships$%/chat&\'olumbia%#ine(!s%(narrator$$bbed',
+    '%$ians&#cus&#tus%!s$\'es-type&$.one&#/do$%grams$$icks%%lotus%*n-addicted-!s\')dependent\'\'induced\'&taking',
+    '&!a&"e-&!g%#sed%&zation$\'n\'s-eye%&bridge%"im$\'slabour$\'tilapia#\'patitis$\'esvirus%)talogists%!x$$tile',
+    '#-r&rehy;schaft$#ara$&enberg&&hausen&&knecht&%stube&#weg%)rasaurids&!o\'!s%.s&aacute;nchez&#hof$*g&aring;rd$$icks%)e-special',
+    '%"n\'&&g-boat,!s*(ne-brick+#ing*#xes(\'fishing($gull\'\'/surfer\'*bone-brick,)patterned\'$cote\'%stone\'&thorpe%\'ot-watt',
+    '%"ty$%lein\'$#man$&nstadt$!s$$tage$#yng#%sdman$!e%#elf%+lf&mdash;it.&people/)rinciples\'$-but\'"as',
+    '\'(starting%!n%&y/best$%hebar&!l\'"le%"on$$leth$*on/eyetalk$$pear$*t/stafford%(monceaux*+ux/wartling%%ories#$tale',
+    '%!r$)fordlythe$%humbs$$neck$\'s-based\')eds-cambs%&/south$*v&iacute;k$#wig$!y$%zberg%$iana%!l%"og%.sprung-russell',
+    '&!s$#nga#$vert%"ys$!o%#vie#%wardi&"th#"ye#)zeg-bosna$(gewachse$!i%#ana$&linger&#yya',
+    '$*ogenaurach&\'schloss\'+tra&szlig;e"%schel##din&!s#!e$"es$$lden%#tax&$ine.#$ford#&hemite#!i$*&rehy;tate',
+    '$&tancy.\'(t/fluent%\'itation#%keith%!t&"hs$#ins#<legrave/conservator/forestry$"in%!p$$tine##oun##pan$"er&)opithecus',
+    '\'!s#)s-luttich$%dalen$)e-doflein&&kassel%\'llberth&!s&$tine%!s%!y$*ian-backed(&screen(\'wrapped$#ton#.t&ouml;fjordur',
+    '&$berg$,fj&ouml;rdur$"or#%worth#&ychius"$t_up#$aera\'!e$#ira&"ia#$cher#%ebrij$\'p-heres$+rarchically&%topia',
+    '%+o-binuclear\'\'dimeric)\'thering\'$fila\'(homo-gay&&atomic*!s&&cercal\'$hain\'$ycle+!s*#ics&,dimerisation-"ed,"ze',
+    '\'\'uplexes\'%ymers&\'gametic\'\'eneity=\'&lossic)!t&(junction.!s&%morph+"ic&(nomously&&phonic\'&olymer&)scedastic/#ity',
+    ',$ity\'/./homosexuality\'\'pective&&thermy\'"is\'%rimer\'$ypic#$ford#%hcote$&ersett##i\'i#$mans#)oimaridas#\'roinura#\'tangian',
+    '##uri##zel"$uber&!g#%chtar&"er#\'delotti#"en#%glini#$hera#\'landite$-iez-developed$"og#&neberg&#urg',
+    '#%rigen%*stic-based$(t&eacute#&singer$#sen##vel#!x"#vea$"de$"ne%"ly$%rsham%$yone$,si/anorexics#$ican',
+    '$"ly$"ng##ron#!y$!n%$esse"\'wanorra#!d##ell%&sfield$*tt-packard##ick$!n%)s/fireman$!t',
+    '\'\'penguin\'$sara#$kins#%lett-(.packard/apollo$$ings%"tt#!o#!s#$xham",x&rehy;nodes#(-section#$a-ex$0chloroantimonate*)butadiene',
+    '&#ord%\'orallia%(tinellid$.fluoroarsenate$/gulaconulariids$%meron&)ter-lines\'Chyldisilazine:trimethylchlorosilane%\'itiasis$.ne:isopropanol%#oic%)ucleotide.!s$$plas$!r',
+    '%$onic#"ed#*ham-alston&%shire#!i##ley#%nodes#;okinase-phosphofructokinase$,se-dominance\'-monophosphate\'$rich&)dominated##xus"%y-hey\'$-hey',
+    '$(nonny-no#$berd#"de%%brand%$rman#-es-farringdon#&felder$0ord.eyewitnesses##hoe#!i#!l$"en$#ing#%meyer$(outhians',
+    '$#ous##oom#"si%"ng$#lop#%thorp(!e#-wood-lonsdale"\'zarfenn##b-i%-ul-mujahedeen$*ollah-amal**controlled*)palestine)(released',
+    '"!\'""-h$*ollowfibre"#225""6+"!9"!a"%c-125"!d"!i""rh!)g&times;2""/s"!5""ca',
+    '##her"!j""mp""qm"$scit""t1!*h&ndash;43"#.mm"#1/2"#ave""fd"\'h-train#!h$\'hssssuh"!i',
+    '"!m#!i""nn"\'olodnoi!\'i&ndash($;her#*pgr;-issue#\'rarr;ch"!+"&-599ct#(abrasion#$band#!c$"al#%de-ho',
+    '%(cibelled%"sk$$o-ho#&energy#\'falutin%!t$%i-vid%#/tv%&delity%"ve$"li$$rith#$grip#$hats$#ead',
+    '$&i-loft#&impact#(jackings#&linker%"te\'!s$"ux#)marketing$%emory$"id#$pass#&scorez$$hear%#ine$#pot',
+    '&"rt#%tails$#ops#$volt\'#age#%watts"%aasen#!b#\'ce-type#$leah#"nt##tel$\'t-bring$$uses&&plasty',
+    '#"ar#4berd/gloucestershire&&t-ware$#ing&!s%"tt$(s/dancer##ees$&mating$&rnates(#ory&#iae("ns\'"ca#"is',
+    '$$tane$"ya#"on$!u#\'rn8.dat#&s/last"%ccupy#%hcock#)kenlooper%)y/british$$ford$"ie&!s%"ng$!l',
+    '$#met$*ory-smoked$&s-mudd%\'/border\'*usinessman&&hooper%"es%#ian$$town$$wood$!y##ock$$lour$!n#!s',
+    '#!a$"ka$#ldo%$goes$#tsa#*b-assisted%)sponsored$!.#!d$"ed%"n\'&%-away\'$line\'\'surface%$rley',
+    '#+e&rehy;away$!-%,constructing%%faced%$slit%)your-head$!.$$haru$$nori$$osly%#us.\'\'ly-hued&#ts.$$tada%$oshi',
+    '#>ing-by-staying-put-on-the-nest\'*to-nothing&&places#$most#)radenitis$!i$1oel&eacute;ctrica#Csoxyethylpiperazine-ethanesulphonic#!y"\'e-owned#\'delberg##ger$"ht#$land$!o',
+    '#"ms#!n$%emann%!s#!p#.r&rehy;archies$!a%%aetus%&chical%\'echical%/r&rehy;chically&"ch(#ial)+cal/control-6satisfier/dissatisfier',
+    ')#sts)#zed($y-he*%rests)!.$#mit$%ocles%"n.&%ymite%\'phantic%!s&$yios\'$lyma$%picra$"ro',
+    '#!s#&tamiki$!t$$zing"\'falutin#%iying#%rensa"&gaturu##bee$#ury##den$"on#!e#!g$(enbottam',
+    '$#ing\'!s&(s/cystic((imperial$"le&)dy-piggly&$ring\'!s%#ing$#ott$&s/care%"es#8h&mdash;and&mdash;mighty+&handed+"or',
+    ',$peed+$tech+1value&mdash;added+$wage%.ndash;capacity+)intensity%/rehy;dependency*#end*&fenced+$lyer/!s*%grade*%level+\'ighting*&minded',
+    '*&output*+performance+&owered+%riced-\'ncipled,%ofile1!d*\'quality*$rise*(sounding+%tatus,&epping*#way+#ing$!\'',
+    '$)-200,000s%\'ability\'(sorbency&\'ccuracy\')hievement&(drenalin&(esthetic&&lcohol\'#pha\'%umina&\'mperage&&rching(#tic&$ssed%\'bailiff',
+    '\'$nked&%eamed&&odiced\'#ned\'$oted\'%somed\'\'urgeois&#red\'#ows&%udget\'"lk\'$mmed\'\'ttocked*$ning%&candle',
+    '("ed($ital\'$rbon&&eiling&&heeked\'%inned\')olesterol&*irculation&\'limbing&%ollar(#our\'(mbustion(\'mission((petition\')nsumption',
+    '((venience\'\'rrosion&$rime\'&uising&\'ultural+!e\'&rrency%\'damping&&ecibel\'$mand\'-nsity-storage\'(pendency&%ie-hi\'"rt&#rag',
+    '&&ynamic%&earner&$dged&0lectron-mobility&)mployment&+nergy-using&(xpansion(\'losives%)falluting($utin,!g\')ntastical\'%rmers&&inance&#low',
+    '&\'riction&,unctionality%&grease\'%owing)!n%$head\'"id&$orse&#ung%)impedance&*nclination\'$deed\'\'fluence\'\'surance\')volvement',
+    '&%umped*"rs%!k&%icked\'"ng\'$tsch&$need%%laced(#ing&#ead&*ife-loving\'#ght\'#mit\'#ved)!r',
+    '%-magnification&#eat&!g&&odulus\'.lecular-weight\'&mentum&)ultiplier%\'nitrate)$ogen&#oon\'#sed&&uclear%(offender%+peak-season)"ed',
+    '()meability&#ile\'#tch**ed/moaning&(olluting,"on\'$oped\'%tency&(ressured,#ing\'\'iestess+"ly\')obability()stitution(#wed',
+    '%0quality-low-cost%$rack\'$fted\'$iled\'#ted(#ing&\'eaching(&diness\'&covery(&urrent\')liability\'"nt)"ed\'!s(/earch-intensity',
+    ')\'stivity\'!v&%isers(#ing&%ococo\'%lling%$salt&&cience\'&udding&*ensitivity\'!t&#ide\'$gnal&$kill&\'melling',
+    '\'$uled&&panish\'"ec($nder\'"ot)!s&$tage(%ndard*#ing\'%emmed($pped\'&riking&&uction&$wept\'#ung',
+    '\'!r\'&xation(#ing&)ech-based)%nical*&ology\'/\'-driven/!/\'#mpo&+heoretician*!y\'(roughout&%icket\'"de&#ome',
+    '\'"ry&\'urnover&$wist%)vegetable&%oiced\'&latile%%waged&%ealth&&heeled&#ind%!z$%.next%\'quality%#the$$/6ft',
+    '%%scope&!t$"an$&backed%#orn%$rows%$uild$\'calibre%$liff%$raig&#oss$$days$!e%"ly%1r&ndash;education',
+    '&!\'&)-altitude\'(capacity)#ste\'\'decibel(1istillation-proof)&vision\'(educated-%ional(%nergy((stimated\'$fare\'%grade)%owing\')intensity',
+    '\'(learning)#ver\'"no\'\'potency(\'ressure)#ice)*oductivity\'$rank+"ed\'\'scoring(&killed(#pec(&ulphur\'*tax-paying(#han',
+    ',+equilibrium,#mid,%usual(\'o-lower)#ned\'#use\'+value-added\'%waged\'%yield&&.level\'%order&$/the&*s/a-levels%!s&!s',
+    '(&bidder(\'calorie*&pacity)#ost(&filled)%lyers+#ing)(requency(!g)&rowing(&marked(\'peering*)rformance($risk(&seeded',
+    ')&tarred($wage%!t&!t$#fab&%shion&2t/performance-type%#ern%\'idelity&(eld/bone*$wife&2ll-burnim-langhans%#low(!n&#yer',
+    '\'#ing%(requency&#ith$(gate/the%$reen$$hams&(ndedness%%edged$%ights$\'jacking%#ump$\'kicking(!s$!l%(and-born',
+    '(#man)"en%$evel)!s%!i&+ght-clogged),ed&mdash;the&!t%#ows%/y&mdash;skilled-\'trained\'-ndash;skilled\'.rehy;dangerous-\'evolved,&prized',
+    '-&rained&!-\'(accurate(*ppropriate(\'thletic\'$born\'&carved(*entralised(+oncentrated*)taminated()reditable)&itical\'(detailed((isturbed\')efficient',
+    '((xplosive\'\'fancied(%inned(&ocused\'(honoured\'(indebted))flammable+\'uential\'*mechanised()isleading\'*optimistic(&rdered)\'ganised)&iginal)$nate',
+    ')&rfumed*)sonalised+&uasive(+rescriptive+%sured)(incipled(*ublicised-.#zed\'+radioactive(\'eactive*%dable))commended)%fined\'(schooled(%ecret',
+    '()pecialist,$fied)$iced)$rung(+tandardised)(ratified(\'ymbolic\'(talented(*raditional\'&valued(&isible&\'charged&*profitable&\'skilled$$mead',
+    '$3nam/gloucestershire%%ecked$%power%%riced$,qqintertidal%&uality$%rises\'!k%$oads&"ve$&school%,mith/leather%$pots%$tand&"ed',
+    '%!e&(chnology%#ide%#ops%(y-tighty$%waaae&$lled&&y-man\'(*orientated(\'pricing\'!m(&anship\'&person#)inbothams#$man.',
+    '%!t#"oi$$nnet$$unet##sby$#ons#$uchi""i\'#"bs#%mself"#jab$&cking.$$niro$!s#$inks',
+    '##rah"$kari#"ey#)ing-boots#%otani"#l-6#%aires$*li/charity$#rio&#tas&"us%%y-joy#&berman&(t\'s-mail\'!s',
+    '$%ourne#$ciaz$#ott#$dago%"le$%elith%%rsham\'$tone%%sonse$#ons$#rew#%endar$"ry#%figer#\'genberg',
+    '%"rt#$iary##ken#\'l-based&#orn%%climb&%upped%*easterside%\'farming)!s&$ield\'$gure&#olk\'"ot\'$rest',
+    '%$girt&$rind%&houses%&knowle%$land&%overs%\'peoples%)rotterdam&&unning%%sides&%lopes&&tation\'%reets((ongholds\'#yle',
+    '&$rack\'$evor%\'walpole&\'illiams$".7$!/%(birdland%(clarence%%elvis%(firework%*gloucester%!i%$john&#ust%\'malaria',
+    '&%other%)neighbour%)protestor%\'rampart&%ipped%)solicitor&$tunt%&thames&&rading%*wheelchair&/illiams-renault()tschinsky&-orcestershire("ld$%_away',
+    '%*ire-marcel%$ldam%!m%\'n/staff%"rd\'&/buyer\'!s&"es$$beck%;illies-turned-entrepreneurs-#ype%#row$$dnep%#rop$\'ebrandt',
+    '%(nkoetter%$rman&5sland/gloucestershire+!s%$sley%"vi$$goer&#ing%\'rangels$$hall%*ead/former(!s$$iers$$man.$+s-and-bends',
+    '%)/district&%stage&.worcestershire%-borough-style(#ugh&"ro&#urg%$cape%#don%%foots%#ham&#ire%(ide.some("rs%#ons',
+    '%$view$%towns$$wash$*y&rehy;ish%$ards##mer#!o#&precht##son#&t-deep$"ed$!i$#ler$)on/father%"un',
+    '$!x#$vert#$yard")m&amacr;l$(mdash;an,!d*$good*!i*\'matthew*#she*$that,!e-"re$(rehy;and*!t',
+    '$(lawsuits$$over$&shaped&!e$$that##.he$"it#$/but$$harm%%er/it$$that##_in#!a$-layan-tibetan\'$ense',
+    '#"ba##eji$#slf##ler#,maahimmahimm%)himmahimm$&elbrau&!s&$weit$,ler-eichmann$\'s-hagen##one#$sclf$"ee%!l',
+    '(&verbar\'"-a)"nd)!s(#but("he(!i(+obsessively()reactions($with\'!.("he\'\'_on_top\'!e#&undher',
+    '"&n\'most#6-mah-too-yah-lat-kekht#\'a-bandi$"ri$$ssou#&chliff&!y$&kesman%!s#"d-%$limb%%parts&%icked$&avi-is$#ely',
+    '%!n&%liter%\'r-parts&%ances&%parts&(stoisser%!s$$ford$%haugh$&i-urdu%(ii-bamhi%!o$$less%"ip$$marh',
+    '$#oos%%stani$%parts$%shill%+ight-honest)#ers$*u&rehy;ism%!\'%\'-backed&(inspired&(majority&$sikh#(es/world$!y##gan',
+    '&$like&#top%#ing%$less%-ston-randolph$"in$"le$!s%"en#%hibit##ich$!n$%troan#"ke$/sey/oxfordshire',
+    '#\'nebusch%.lls/university%!y$!i#"or#\'richsen#%sdale$*ley/former$$tock#"t-%(dropping%\'of-tint$#_in$%ed-at%!r',
+    '&#hof($lzer&-land-enriched\'(eiterner&(ruptions&%stadt($oder$$ikka%$ngly$&lesham$*on-clifton\'&in-the-\'-hedges41/northamptonshire&&/barry',
+    '\'\'maxwell$#ree$)s.jeffrey%(/q&amp;a#$wick$$oods"!o#!b#!m#"rt##xyl"&p-bath(!s%#elt$-consciousness',
+    '%$ippy%!o&(p-styled\'$pers(#ing%%ugger$*intellects$&joints$$kick$%packs&"ds%+oo-roi-days%%riest$+replacement%$oofs',
+    '&&inging\'\'velling$$turn$%width#&erpool#%flask(#ing#&gnosis)\'-styled$$rave##hil$,oprisy-style%#use##kin&!s',
+    '#&motism##ner#(otecario#$peis%&rholme$,i-compatible%*e-inspired\')schmippie($tyle\'$type&+s/americans%#kes%$ness%*sley-smith$&o-bath',
+    '%(castanum&\'entaurs&#ras($tics%&dramas%*glossoides&#rif%&krates%$lais&#ito%%manic%%nikos%$phae&.otamus-bathtub-$hide',
+    '$+y-anarchist&%freak%!.%$chic)!k*!s%%esque%$shit#"s.%"he$%/tops$$burn$\'winging""q8"#rac',
+    '$!d$%ethog$!i%"wa$$kana%"en$!l$"no%"ya$#oka$"ta$&zowicz##dre#"e\'$&-cycle',
+    '%*purchasers%&system$&d-\'and&#gun&(in-plant%!.$\'r/buyer#!i$%danum$!n#$mers#!n$$self##oak$"ki',
+    '$$masa%!i&#tsu$\'ndelles%"en$+shima-based)!s%!i$$yuki#$pled%#ing#!s$"au$)chenplatz&$heim',
+    '&%vogel$\'hkowitz%&sprung$!i$"on$(t/cystic&&mother%$rigg$(uta-type&&icorna&"um$&wowicz#%tella%\'nberger$%shals',
+    '$&ndapus&&inidae#$wani$"yn#"yu##zel"#s\'n%%\'hers#)-and-hers$$back$#job$%lofty$&mother$(purkinje$*reputation',
+    '%#one%&ravels#$.age#(/brother$$home$#our$&sergei#.15-ala16-arg17$"99##241#$36th#"63#$_out#"an$!o',
+    '$"ul#%celia##elf$!x#$good#%hashi#*inspection#$king##ley##own#$pana\'(mericano&!i\'$cism\'#zed',
+    '\'\'-arabic)#xis(\'flemish(&german(\'italian((moresque("us\'%phone\'#rum$&earian%$rian$#ida&!o&"um##sar',
+    '$*ing-hi-hat\'"ly)$-hot$&ometer$#sss#,t&oacute;ria."co$!.$0amine/cimetidine*!g)!s$#ead$%iaeus&"ia%&ocytes',
+    '%*chemically&,ompatability&&ytoses%#iry%\'l0gical&3ogical/radiological&$ysis\'%ticum%(moniasis%%ne-h4($like%)plasmosis%!r&$esin&#ial',
+    ')\'-punter))/diplomat)#s.1\'$cal\'*)-economic++materialist+)political+&social*!/+0autobiographical*3ly&rehy;established,!--%based-\'created-\'dressed',
+    '.&volved-(inclined-&minded-&rooted-&valued,!.*!s("he($ised*"ms*#tic)&zation(+o-aesthetic*)political*&social',
+    '*-topographical+-ranscendental("um\'"e/(#lag("s.("ta\'"ja\',ographically(&metric\'&sation($chen($hche&%ogram&\'y&mdash',
+    '\'&-after($book(&caused($dirt(\'focused(+in-pictures(\'kenneth(,of-religions)!n)\'riented((painting)#lay(&taking)\'eaching($wise',
+    '("of(#the\'+/archeology(+development($life(&theory\'$less%$type$#rio\'\'-mastix$$tory"+t&pound;50m$(rehy;man##\'er#&-flick',
+    '$"in$$left$\'machine%$oney$&single%#ong%%quads$%teams%)hat-never&!e\'!m$&wicket#%.more$\'picture#\'/cecomm',
+    '#&_other#!a$-chi-developed\'!s$!e$%shwar#\'ch-girl*!s&%hikes%#ams%)cock-type)!s%&hiker\'%4ings/gloucestershire%$lock',
+    '$"ox#"ec%!c$!l#$file#/her-and-thither&+to-accepted))collected)\'unknown+(recorded$!i#(i-harper$"da$#tes#"le',
+    '&#ish\'"te)!s&&jugend$$ist.#"s.$"el&!f$%ville#!t$$able$!i%(ng-simon$%leman#!z',
+    '%$ield"!u#"es""v-$/1&rehy;infected%&-bound&(negative&,seropositive&*uninfected$(antibody$#gag$\'induced$$like$*prevention$(specific',
+    '#!a$!s#*e-dwellers%$like%$race%/turned-fortress$!.$%mates$!r##nae##olt"#yan#"er#%yyyyy"+zb-i-islami',
+    '$%allah$!e$,ul-mujahidin#"en!%jaleh$\'marsson#\'rtasson"1elm-wall&eacute;n#%rmann$%stedt"%orrow$!t!*k&dollar;1+".3+(00m-300m',
+    ',%6,200,#7bn+#3.8+&75,300*$2.12,"50+$0.60+!8*!3+$.8bn+#50m+!9*%40.25,%0,000+"bn',
+    '+!0,%0,000+#2.7+"7m*!7+%1,600+!8*!8+&65,000*&91,000#*ndash;3511)#750""-1#$hong"!0',
+    '"#efg"#tel!,l&aacute;vka#\'ouml;dr""-a"!3""62""8e"%a-a11%)2-binding&+.1-mediated%&ntigen$!b%"12%*35-matched',
+    '\'"01%*51-binding&"3.%!7%%8-dr3&$/dr3%#w35$#cw3$#dr+&)-positive&$/cd3$7genotypically-identical$\'matched$*restricted#\'genfurt',
+    '#$lele$\'olanang#\'uttvein#\'vackova$(n&iacute"!c"!d"#f/h"%g-set"%h-dna""mn"%obane$"il""pg"!t',
+    '"!y!\'m(65)77"#.14%!s"$1000#!4"#293""as#!v""ci$!c#!s")d/joc.103*!5"!f',
+    '#$8622#!s"!h#!m"%i-lea"$mmmm&"mm(#mmm$"ph##phh""nn"!p"#r50$!1$!8',
+    '"#so."!t"%v/emi"!x##290"%y-b35!$n-5a""ag"\'d/btech$#hnc"%ekdir"#f-4"\'u-hanby!(o&euml;l#(ndash;an',
+    '"!-#%chien#%de-ho#&hoings%&llofil#+mo-sex-u-al#!v"!/#$rt/1"!="(abinhian#)d/patient$#ley\'!-((maidment',
+    '$"ie$!y#!k#"ll#!m#+rd&rehy;ing%!\'%!e&$d-up&!s%,ings/outdoor$#ier$!s%%tones$"ty',
+    '#$tzin#$xers"\'b-nails%%obbed\'!s#%aiter$#rt\'&--hampden/earl\')to-sydney#!b$5esian&rehy;rousseauan)!s$"ie&!d%#nol',
+    '&"ts%4t&rehy;consciousness&%-like\',nomenclature\'&poetry)%wered\'%songs&!t$"s.%$/cat&&howard&&mother&%rugby%"es$\'y-based',
+    '&$like%%games%&horses%#ism#&daying#!e$#lar$$rman#\'goblin\'#$hold&!e##iba#*man/county$"en#&nobbed',
+    '$"es$#ism$!n$!s#"re$$idge#&sbawns$#ley$\'on-west$&tinate%\'ructin\'*"on#$urne##yah$!s',
+    '#&a-zade#-hachtungsvoll$\'bichler%&rucker$\'deutsch$\'gericht$%huser$%lands$#man$#ner$&scgule&%hulen)-rahrnengesetz\'(warzwald%&tetten',
+    '$!t#$kedy%!n%$ting%&y-ball\'%match\'\'playing\'$type&,/netball/gym\'&soccer$*inminister$+ley/defence$$nell&&yesque$$ston',
+    '$$wold&$rthy#!o$#mbe#(quenghem#!s#8us-pocus-nomminy-domminy",dder/francis$%inott%!s$#le/\'\'ardiles\'\'chelsea\'$john\'.player-manager',
+    '&$sque#!e$#ida$#ken$!l$"ms$$ning#$gart$(e-podges%#heg%$kiss%"on%%podge%"rs%(s/graham',
+    '&"on$#ins\')/painting$#man$-son/craftsman()traveller\'!s$!y#%ierna\'!e$"ns##ler#%olmor#$sden$#gon',
+    '"(e-blades$%lover#%derer##fer$!f$"ke$$slag#"hn#"ke$$stra#\'lderlin$!l%"er\'#ing#$mann',
+    '#%ppner#)sch-krupp&*st-behring$#tra#$tger$#ker##ven#)yre&lt;ro"&fbauer$)ibliothek$#rau#$f-le$$aker$%iying$%mailn',
+    '\'!i\')n-designs(%sthal$%nungs$#rei$"s.#\'geismar#&haimer#\'kanzlei%+pellmeister$#ens$)riegsrath$$unst#&land\'s##man',
+    '&"ns(,thal-bashing%"rk$&eister$%uller%#sik#0nagel-h&ouml;hle#&weisen"(g-backed$$call(#ing$$many$%nosed$%roast$$stye',
+    '#*an-warburg%&/first$#rty#$back$&rushes#$call#$enes$!s%%chool$!y$$zand#(freakers(#in\'##gan%"rs',
+    '$#ers&!y%!s$#ins$"le$#man$!y#!h#&manays&!y$"en#"s/$#haw%#ire$$peuw',
+    '&!d##uet"#ham#(enaurern%+br&uuml;cke%"em%$fels%%gasse%$heim%\'klingen&&opetal%&linden&.ohe-langenburg%,medizinische%)schwangau',
+    '\'#ein%1zollern-hechingen$!r%"ia#$feld##gan&!t##lov#!n$&linden#!o"%i-sin#$berg$!y##cks',
+    '$"al#!k$!s#$lday$$iday#$ping$%olloi#"se$%pital#"ty#$wood#!y""ja##ere""ka',
+    '$"ti##ema$$nson$\'y-pokey#&i-koki$#nga$$tika#$kans$!u#&lingen#$okai#%uriku$!s"3l&ccedil;art&eacute#"ah',
+    '#$baek$%eache%"ch%#rgs&!t$$orne\'\'isation$+rooke-jones(!i$#ury#&c-0266$"ik$#omb%$nius%!t',
+    '%$door%#out%(the-nose$"am&$atic%"na$$back(!s$"cr$"ed%+n/announcer\'#raf&%hurst%-r&lsqb;s&rsqb&)/accepted',
+    '&$baum&$mann&+ness-roddam&\'s.there$%forth$$ing\'\'&-camps)#ell(%notes(#out)#ver((together("up(%yards\'+/investment',
+    '$$rish$%stook$!t%$rade$#way#-e&ccaron;kova$/-behind-the-eye&&urning&&y-hole%&filled)#ing&#ree%-in-one-golfer(#the+&-floor',
+    '\'&t-wall&$stic%\'nester.%(to-block$%/twin$$able$!c$(d-in-one$$less$$meal$$nder$(s-in-one%$tone$#ton&"wn',
+    '#"ga$"ot$"us#(i-ul-haq%%water$!d%#asy&-y&mdash;after\'!\'\'&-based($camp,!s($goer(&houses(&period',
+    '*$sort($task\'//flight/sailing(*pilgrimage($tour\'"s.(!/)3pensions/conditions)#ski$$fied$$gans$%ldays$%ncote%%esses%(g-in-one',
+    '$#sm\'&.-individualism%-tic-atomistic(*/intuitive)*vitalistic$%vetti##kam$#ema#+land-backed)$rown(.dozier-holland((returned(+with-boston\'!.\'#/ap',
+    '((grandson(%south\'#ers\'&on-sea%"rs%!s%"us$\'e-suppa%#aux%#dge%+in-designed%%nbeck&$ders\'"on&%smark',
+    '&#day&%sbach%#sly%#vik%!y&#man$!i%#cks%,day/director%#ers%%ndale&\'gbourne\'$sbee+,/psychiatric\'/worth/geologist',
+    '&#hey&/shead/cricketer,&garage\'%worth%#sae&!s$(nsteiner$#och&"ks%%fibre%!m%!n%#ran%+w&rehy;eyed,&ground',
+    '\'&bodied*!y\'%ended\'$side\'%tined+!s(#ube&$/but&)ay/former)#red)$wife&$core&%field&$moor&#ood',
+    '$#weg%$yood$+y&rehy;wood%\'-decked($sign&$eyes&&leaves\'#ike&%marie&\'pointed&%style&$tree&\'wrapped%\'berries%$days',
+    '%%field%$hogs%$moor%&n/scad%%swamp%)wood-cute*(director*)flavoured*(inspired*%sized+(trangled)-/broadway/tin))ification("od#&m-oaks',
+    '%#vik$$berg%#ush%#yre$$dene$2e-on-spalding-moor))the-wolds%&fields\'#rth%!n%+on-spalding%\'patrick%(s-watson&!.&%/city',
+    '\'$jump\'(managing\'&oxford&"es$%hurst$#ill%"um$%lands$%quist$$ware%"ys#"ne#%o-bar%&camera%(movement',
+    '&#uit$$byte$*caust-like)#ing$+graphically$\'meister&&tabola\'#rix$!n$%phony&$rase)#tic%"ic%(rojector$$rama',
+    '$$weye#!p#%quist#%royde(*/volunteer#"s.$$cher$%grove$"oe$#pur$"t.%-ein-friesians%"on$%worth)!y',
+    '$(/assault%-environmental%&weston$#ain%!m%!n$)han/lorry\'#ger%$usen$#man$"om%)n-le-moor$%zmann#%warda%!y',
+    '#"y-%#day%&roller%(sounding$%brook$#day$!e$*field-alex$(head-dun$$land$$oaks$&stoned$$type#(zhandler$&knecht',
+    '"1m&oelig;opathists##(e)$*m)o-sexual\'&sexual#%agars%(e-giving\'&makers\'&taking&#ous&"rs$$nton$"pe#$berg#"co#)e&mdash;i',
+    '%(rehy;for*%mover*&owners$#(s)$%-\'but%(and-away)\'carstle&(ppliance*"ed&#way%*background\'#ses&#eat&$irth&&oarder',
+    '\'&ingers&(udgeting\'#ild&!y%+cholesterol\'%urned&)ollection\'%mings\'*nditioning()struction)\'umption\'$urse&%rafts&)um-office%&drying',
+    '&,ntertainment&%rotic%$farm&&inders\'$tted&#ree\'#ont(#zen&*urnishings%%guard&"ym%\'heating\'#lps%)improvers&!n',
+    '\'&terest%$jazz%$land&$eave&(istening&$oans\'"ss%*made-wills\'(nagement&&inding&%ovies%#now%,of-the-weird\'$fice&$rder',
+    '%&permed&%otted&)reference(&served%&raised&%eared\'\'ference\'$medy\'.sponsibilities&%olled\'"om&#ule)"rs\'"ns%%saved',
+    '-(ommunity&&ellers&#ick\'"de&$pace&\'traight($etch\'&udents%(teaching(!m\'\'rritory&#hey&!o\'%-home&%ruths',
+    '%%video*!s\'&siting%&warmth&0ith-a-difference&&orkers&\'recking\'%itten$!.%#and%"in$#/ar%&eating%&goblin%"he',
+    '%%motor%+residential%(shamrock%&thomas&&intawn%)vi-spring%$work$(:amazing%)highgrove%*kensington$#_in%)secretary$%baked&!r&#ses',
+    '&#und%$rew.(#ers%$uild)"er)!s%$yres$4care-for-the-elderly%$omer\'#in\'&$oked&%untry%%rafts$$fast%%ields',
+    '%$roup\'#wns%%uards$%land.%\'ess:the(,ness/housing%$ifts&"nk%$over%#sss%"ux%)y-looking$&moving$!n%#ews',
+    '("es%(pathists%$stat%%therm$%place\'!n$$r-un%(/english%$care%*sham/local%"un$"s-%*/long-stay%#ale%%exual',
+    '&!t%#lux%$plan&(un-white%&tudios%#ure%#wap&$orks$(tel(a10)$$view$+ward/farmer\'!m&"ys%*ood/farmer&#rk.',
+    '#%firth#*genisation#"ie%!s%!z$$lees&%tical%$ists$!n%0g-missile-firing%!i&!-&#bus&%vorax%(oid-type',
+    '$\'sgrinde#$kirk#"ly#!m$$ages$\'e-soupe%"ls%!r#\'nivorax#2o(oligonucleotide)$$-and%(capacity%)eroticism%+taurocholic$(/sexuals',
+    '$$bono$\'centric&#ras%%holic%#ide$(dimerize$\'eomorph+!s+!y&&stasis)#tic%&rotics$(geneous.\'%icity(\'zations',
+    '%%raphy$(iomerous&\'thermic$\'logues.%(ytically$(morphism,!s$\'nuclear%#ymy$%phile&(obically*!s\'0ne/non-homophone(&ically\'\'rically',
+    '%&terans$&rganic%\'hythmic$&sapien*!s%.ecual/bisexual&%xual\'*(-bashing+\'looking+\'related*6/humanist/intellectual*#ist+$ties+&zation,"ed',
+    ',(-centred-(relevant*)s/mid-way$)theticity%$opic\'!y%*ransplants%$ypic$#urs#!s$)tat-pybus#\'uncular("es#!y"\'n-chung',
+    '#$.msc$$sec.\'&retary#$ason#"bl#*da-derived&%honda&\'powered%!l%3y-mrkos-pajdusakova$!e%&coeter$"oq$#red$*uran-based',
+    '\'\'s-based)"el&*e&ntilde;o\'$nsis#*ecker-like$\'d-steel$"ff$#ker$#oye$!r%$able%"et%!t$#som%/t-jill-ordinary',
+    '\'(speaking\'%while&!.&*/dishonest&!e\'!e\'"r-&!o&$y-to\'!.$*y-and-curd&%baked&%cakes\'$ells\'$oral',
+    '&&filled&&glazed((istening\'$uide+!s&\'hunters&%laden\'"it&&making(!n\'#oon&$pale\'&hrased\'"ot&\'roasted',
+    '\'%toned(%rokes&#tan\'\'hroated\'%ongue\'#rap*!s&\'whitish%\'/animal&%chief&$head%$beer\'"ll&4ourne/worcestershire\'!y',
+    '("ch%$cake&$ombe&\'reepers\'#ock&"up%#don%%eater*!s%&guides%,man/landlord&"en&\'oon/the%&sgreen&!u',
+    ')#ing)+le-filtered+!d%\'thunder%$will&#ood#,g-kong-based%$shui%#tao$"en%"ra$(kongbank$#mid$#ois$"re',
+    '%$heng$"ue$#wen%!u$%zhang##ied$$kman$%ngham#$john#\'k-honks#"ly#%nauer$%ecker%!f%"rt',
+    '\'!s$\'ingsvag$!y#&orably&#nds&%riums&"to%$emus%!i&(n&egrave\'!e&!s$,ur&rehy;able&%-less\'&seeker',
+    '&(/fleming&%ships#!r#&s/meng##tas$#oir#$wana#&y-moon$$wood#)za/fiddle$\'ontales"%o-arn$#doo$#hee%"oo',
+    '$#wee#$baka$"le#$chie#"d\'$%-down&$ryer%\'fitting%$like&&ooking%\'related%%slits$%/fire$"er$$like',
+    '&!s$%winks$!y#!e$#ver#&f-beat%$like%$pick&\'loughed&$rint*!s&&uddles%&shaped$!.$$beat',
+    '$#ers$%marks$%print$%stick$!t#!g$&enkamp$%ovens$%steen#$hley##ing#"k\'$\'-a-duck%,cum-uppercut%%ended',
+    '%&handed%&length%&shaped%$worm$\'/glider%\'release$%baits$\'ed-back&!.%"r.$#ham$&ing-up$$less%$inks$"os',
+    '$1s-and-copperheads$%tiers$)worm-free#"la$#eys$)iganesque($iana%!z$%ywood#+m-boom-boom%$hoom%)voom-boom%.zoom-boom-foom$(ey-sized&!.',
+    '$!g$#ing#!o$"me$!o%!m&!m%)oooooommm++oommmmmwhop#&p-back%$item%)petticoat%&skirts%%tiles$&driver',
+    '&(/castrol\'&health\')pensioner\'#vet%!s$!i%!i#%rahed%$ydom$#ded$"ie$+nik-bouhuys$!s#!s$!t',
+    '#\'tenanny$&inanny$!y#&vdzayn$"ed%$geen%)r-wielder&#ful&$ites&%matic&%tical&&villes#&ydonck"$p(s)#%-back',
+    '$&picker*!s$)scotching#\'/father$&house-#%about$!k$+longcarcity#,craft/barman#-e-association%&filled&&or-the&$ully%\'hawkins%%sykes',
+    '%\'wallace$./herefordshire$$3ful$!a$%croft$,d&mdash;more$!f%*ul-looking\'"ls\'!y$$gill$!i$$land%$ess.(&ly-ill',
+    '$\'s/store&$they&\'widower%#ide%"to$&things$&worths#$ffer$&garten#\'hoponmi##in\'%*g/planning$!s$#tal#*kin-morris',
+    '\'0/gloucestershire)$uide(%henry(+oxfordshire()protestor\'#ons#(loegynys##ovo#)pe-seyler%&garten%*r-disowned\'&shaped\'$vent$#in\'&#ess',
+    '$#led$!o%#les$"um#$sack\'%-look$\'cotched$"on&%/shop#&tastic$&onwood#-wood/research($save(.worcestershire"%rabik',
+    '$$itis$"ry$!s$$tion##bar$"ys##cal$"he$"um#!d$!a$#ein%!m%"rs$#ies',
+    '##eau$$lick%!y$!n$$stes$&thorne$$well#"ge#"ia$#fic$$gome$!k%#awa$&nouchi$"sk',
+    '%(on&mdash(*ndash;what\'%-wide\'!/($bass\'"s.\'$tale*.ly-constrained-\'opposed-(pivoting#&kesley%!y#!l$,icks-shaming%"tz',
+    '\'!r##man&!n%"za$"el$$inum$!o%(nal-type&\'e-aided()dependent($free+#nzy($like()sensitive\'!.',
+    '\'*s/chemical$#uzd#,n&rehy;maker$)-balanced&&earing&&lowing%%calls&\'oloured\'#res%&effect%#led&#ike%%notes%&riffed%&shaped',
+    '%(tethered$(/balloon$"ad%!k$$baek%$eams&"rg%&lendes%$ooks%&y-size&&/owner$$call$"e.%\'/driver&%royal',
+    '%$bolt%&d-moon\'%stock%!l%%manni%"rs%&t-like$$gren$#ick%"er%$fied%$gold%$ness&$gham\'!s',
+    '%"st%"to\'!s$!n$$rims$)sby-smith%-ea-cum-riston%\'trandir$/ton/oxfordshire$"um$$worm$"y\'%\'-clawed&&hatted#*ologically',
+    '$%scopy$\'witzian#+r&eacute;os$#eum&!r%!y$&ibilus&,le&mdash;and(%-long+%oking)\'tasting(!.\'"is\'*y-deformed&!y',
+    '\'&things&!a&!s%)fic-comic)\'looking&#yng%!s%"tt$!o%*cks-taylor("es%(r-comedy*0ic-from-the-\'50s\')of-it-all\'$show',
+    '(!v&!/\'&sci-fi&)s/miracle\'$cope\'#how&#vid$!y#(s-champs%!d&\'oeuvres$%croft$(d\'oeuvre$/e&rehy;chestnut%*-and-buggy',
+    '&#bit\'&lanket\'\'reaking\'$uses&$cart\'.hestnut-strong\'$loth\'%opers(%untry\'#ult&\'dealers*#ing\'#ope\'%riven&&eating',
+    '\'#eed\'%ights\'$lesh(#ies\'(urniture&#gob&\'harness-"es\'#ead*!s("ld("rd*!s\'$oofs&\'keepers',
+    '\'%eader)$ther(%ngths\'&itters\'$ocks(#rds($vers)#ing&$meat\'#int\'%owing\'&unched(\'shrooms&+partnership\'#iss',
+    '&\'raising\'&earing((sembling\'#ide&$show($rine\'$mell\'\'tealers&&tackle("il\'$heft(%ieves+#ing\'$rade)$ffic',
+    '($oops&#van\'"et&%wheel+!s("ip\'&itches\'$oman&!y%!/&%human&%steed%)=chestnut%%beach&&lanket',
+    '&$rass*"es\'&eakers(%eding%$cart&&rusher%$dung%(feathers\'"ed&%ields\'$xers%#hay&#ead&#ide%&keeper',
+    '\'(stership%%naile&!s%*power-leap%%rider%+s&mdash;and&".4&./mules/donkeys\'&ponies&*hoe-necked)&shaped%&trough%$wank\'"ys&#ear',
+    '*#ing%(yculture$$holm$"ie$2ley-hayling-pilger%#ips$.nell/institute$\'ophiles$)t-henning%!e&"ll%%hemke%#man$$well#"te',
+    '$\'herised$,iculturists.%(llonages%!s$(manowicz$0on-in-ribbledale&\'/ipsden\'(managing*\'chester\')passenger%!s$$ulan("us&"us%!n',
+    '#"un#$well$%iches$$ood.\'(/liberal#"yn"*s-hospital#!.#(anna-ing\'!h$"yn#"by#&e-cart%\'in-hose%#jet',
+    '%$reel)!s$%/rope$"co$"in$!k$$lock$%nball$$reel$$tail(!s%"ti$"yn#$good#"hi',
+    '##ker$$ins.\'"on$&ynsish#$labs$"ey#"oe%#ver$!i$#ver#&pental%"rs$*horylation$%idaje%%scare',
+    '&#al-)\'centred*%linic)$like)\'related*"un)%style)*to-general*#ype(&.adisa*$fter)"he*"is)#ian*!t',
+    '))following)"in)$jail)&oxford("et("ic)"se)$ties**y-packaged)#zes("ly("s.)(/nursing*+specialties(#the',
+    '&#ium$#tal%$ial.##sam%!n#+t-bacterium%&cuckoo%\'economy%*government%#mud%&nation%&plants%(sediment&&pecies%!x',
+    '$\':centre%)institute%&nordic%(regional&$oyal%&school$\'acylkin%*ge-holders*"ur(%taker))o-fortune\'\'/contra\'!d\'*s-for-arms(!.',
+    '$(el-based\'(dwelling\'$type&!l&"s.%$mque%&ss-bar\'"ed\'!y%$tler$#iar&!s%"ed&!s%*le-looking',
+    '&%icium$#ler$$node$#vax"*t&mdash;in$+rehy;footed)%knife#)-and-cold(%sweet%*pplication%$rsed$$band%$rush)"es%%utton',
+    '%;hocolate-drinking-chocolate%&limate%#old$#day%"ip%%ogged)"rs$$eyre$$fill%&lushed$&heated\'"vy%&ousing$\'jetters%%uiced',
+    '$$link$$milk$#oil$&pepper%"ie&"nk%(luggable$&rodder&"om(!s$\'seating(!s&%tting%$hops%#our',
+    '%(wappable$%taped&%sting%"ip%&ongued%"ub$.water-and-coal#!/#-brush-curling#(ch-potsh%,kiss/captain$(upboards##dog#!e$!c',
+    '&,rehy;keeping%"**%&-based\'\'uilding&-cum-clubhouse**restaurant&&guests&\'keepers&$like&)occupancy&\'schools\'#ize\'\'tandard%(.details&#the',
+    '%(/casinos\'%entre\'&ountry&+theatre/art\'5ransportation/holiday%#ing%/keeper/american%*ling-downs%$room%+s-to-racing&!.&)/pensions&!2&%ville%$tech',
+    '%!r$%field$&ousing#!i$#man#$keys#$lips$*y-coloured&\'debated\'\'isputed&\'tongued%!.#&okukai#&points$&ressed',
+    '$"ec$#ods#&screen$$iest%!t$$purs$#ton#"ta$"en&"ed%&rotter&&rotter$#ish#%water%"ve',
+    '"%u-sen#!a$!e#$blon#$cine$&kgeest#%dinis#\'ffalize#%gaard$*hton-berry)*le-springs((/moredon$"ue#%iller\'!s',
+    '%"in$!e$%ihans%$ston$#son#"ma$%phanh#&nd-dog&$like&%whelp%"es%$hill%"rd%\'s-tooth&"es',
+    '&#low&&tooths$%shell%*low/thames%%worth#+phou&euml;t#"r\'%\'s-worth$#(s)$+-after-hour&(n-a-half\'$d-a-+&half\'s%\'by-hour%\'glassed',
+    '%%scale%\'to-hour$#.it$#/10%#day$,ahane/senior%"nd$!e$,glass-shaped)"es$"ia%#han$$long%\'y-payed\'%rates',
+    '&//weekly/monthly$\'s-a-day($week&(building&#for&$long&"of&%worth%".4&%erika&"so&#the)"re%$/day%#:12',
+    '#$sane$$cham$\'e&mdash+%;most,#see&,rehy;keeping%&-agent&%based\'\'rampton(&eakers&$call*#ers("re\'%hapel\'&leaner',
+    '\'"ow)!s&#dog)!s\'$ress\'#ust&&estate&&factor\'$ires\'#ull&$gown\'%roups\'$uest&$hold*"er',
+    '($nter*!s("ts&$itis&*laundering\'(ights-on("ke&$made("id*!s()rtin-like(#tes\'&eeting\'#ove*!s',
+    ')%water&(painters+#ing\'$hone\'\'lanning*!t(#ots\'(roudness&*renovators)$ting($pair\'$ules&(searches(%rvant\'%haped',
+    '(#ell\'$ites\'$nake\'&oiling\'&piders)#rit\'&teward\'\'urgeons\'%weeps&#top)!s&$wife*"ry("se&#yob',
+    '&#and&!i\'!t&$just&"or&"so&)treasures%!/&)apartment\'&rundel\'!t&$bank&*calorifier\'\'hanging)$rlie',
+    '&&garage&\'jackson&0northamptonshire&!s\'%ecker&%times%%break\'#ick*!s&$uyer%$care(#les\'!t&&leaner*#ing',
+    '&"ow(!s%%d-the&$ress%&father&#rau%$gate&#irl&\'uesting*!s%*hold-goods*\'humming*$name*\'related*$skin',
+    ')#ing&&unters%#ing%%keena($per-,%woman)$ing.)!s%$leek\'"ss%&man/gp\'(stership\'"te%"nt%\'painter',
+    '%%quake%!r&!s%%s\'new&)/cottages\'%flats\'"no&$hold*!s&$taff\'$yles&#wap%#top%$ware&3ife&rehy;tormenting',
+    '*,technologist+.urned-megastar*+wife-mother)./house-husband/&worker*&mother+,um/part-time)!s)!y(#ish("ry\'"ve)\'s-to-be*!.&$oman',
+    ')!.%!y&$wife$%holds$"in&\'g&mdash\'!\'\'&-based)%locks)\'uilding(#led(%state\'+/industrial\'$_per\'$rich',
+    '$%saies%"et%#ies$!t%$eads%"in%(on/vicar&\'unianae#&tekins$#ris\'-/restaurateur$!s%#ize#!w$\'elingen',
+    '#%yenga$%hnhnm$"se"/v&euml;v&iacute#%\'ring#*e-actually%&bubble$#den$$lled$\'r-boots&%ferry&%mower&)searching\'&peeder-!s',
+    '%#bus%"er%&ingham%%lloyd%$tank&$rain$#vei#"ig$"ls$&s-type#$land#$mand##sep"\'w&mdash#.\'s-your-father',
+    '%!a#9-could-you-think-it-of-me$(daft-can%!o&+-i-get-home\'\'you-say$$ever$*green-i-am*-was-my-valley$%heavy$Ti-conquered-my-bad-habits-and-became-a-normal-person%\'ts-done$#man\'!y$*not-not-to',
+    '$&pupils$%to-do)#-it\'?stop-them-laughing-on-the-beach\'%train$$when%6ill-he-get-out-of-this$\'you-say#%.from#%/when#9aldstwerke-deutscheswerft&\'tswerke$&ndever$(rd-black\'$hall',
+    '\'&murphy\'(williams&%.once&+/automobile\'(european\'\'flowers(%ormer\'%honda\'%rspca&$itic%!t&)h/science$#tch%!t#&bridge',
+    '#$d\'ya$#ahs$"ee%)n-le-wear&%shire$(iedoodie$"on$\'y-doody#$e\'er$(/anthony%#dog%\'student$!a$$izah$(ll-jones',
+    '(&mother(\'wyedean$"rs$(s/centre%"ia$!v%!e&\'r&mdash\'!\'\'$-all\'#/in$"ys##ffs#)ie/thames%!k',
+    '$"ya#$judo#!k$"er#$l-in%+suppressing$&around$"et$#ies%*n/publican%!s#!m$#ore##nes$$slow',
+    '#$pett#)se/didcot%$hold%!s$$hold$#ons$$tead##the#&zabout%(t/umpire""x-$!2%).8=hox-b2&!9\'\'=hox-b1',
+    '$+b2(hox-2.8)&!.&%/lacz#!d#"ey#$ford#)ha-hitler#"ja"(y-taylor#!a#!d#"ek$,m/headmaster$(r-larsen&&millar',
+    '#(lake/bat$1e/gloucestershire&.wickramasinghe#&ningen#$sted#!t"$zier!"p\'"#-42#\'engined#$gl/2##ish#%style#"us$\'x-based',
+    '#&apollo#%other"!1##000$"50#!4#!5#!7"#200#$372a##604$#45a"#4/5##192#"2s',
+    '"!7#$475a""81"$95lx"$a-ii#!i""ff#!h"!g""hi"0lc-fractionation%,purification$%/fplc"!p"!s',
+    '#!p"!u"$v-18$(mediated#"11#!s!#q/m#+oxfordshire"$yspy!5r&oacute;thg&aacute;r"#-16"&2113/2##898"$4289"!7',
+    '"-a&dcaron;cany#\'bovszky$%usice#$chya#\'dcanske\'!y$"ec#%nolky"-dli&ccaron;ka%#cka#!y"1ebeljanovi&cacute#(gistered#$nsko"(hduchess',
+    '#%psime#%stmas%"ro##vna"!k""lm""ms"%olfur#$mada#"of#"se$"si",p-conjugated$(labelled"#rrm',
+    '"#uby##mph&"ed#\'shevsky$"ov#!t"&vatske\'!i"$ynov!&s(g)70"!.#/125&ndash;1/522&!s#"59##748',
+    '"#3-6"0554/c&ndash;gevs"!6#"01#"54#"62#"81"#975#"80""ac#"id"!b"#dd5##r17""e.',
+    '#!s"!f#!r"$g-si$4vermogensverwaltungs"(iao-tung#&en-pin#%n-chu%$ling$#chu$%dsheu$\'g-hsing#%u-hui"!j""l3',
+    '"&morris"%o-pso$$spso##b15"#p60#!g"#rii"#sag##ein##rp1#"sh#!t"#t-1#%amine##ory',
+    '#!n"#v-2"!w#%p/hsp!$t-33$\'451-g11#!5"%.86cm"%/111a"!c"&ef1-38#"ls#!r"$fiid"!h',
+    '"&l/tour"#met"!n#!t""oo$!n"!s"!u#!n#!s""vl"!x!+u&aacute;0n#&eacute#)iacute;la',
+    '"#-16%!b##opp"!1"!5"!9"&a-peng$&taipei#!c$!a$$hing#%guang#!i$#bin#*lca-hualca',
+    '$#lpa$#ung#*m&aacute;n$$anga&!i#%ncane$"di$$g-he%%chuan$$jing$"ta$#uco%%huanu#%orini#"pi',
+    '%!z$!i%"na#&scaran$$heng$"ta##tay#$yhua$!o"(b-braked$$city##and$#uer#.bard-nietzsche\'&/royal',
+    '$"ed%&rholme$\'i/hubbi%"ns$)le-bubble%#ing%!y$#uch##eau$!n$"rd%"t\'&!o#!f#$icka',
+    '%!y#%matic#*ris-tinted&#tes#%scher#$ward"&chette#\'k/joint$(e\'n\'roll%!l&%hoven%)r/trainee&(by/sheep$%field$!g',
+    '&)/retained$+nall-penned)%style%#ell$*ster-style(#ing\'!t#&zymski")dd/cancer$\'erfield&+sfield-born,%/west\'$ield&!t$"gl',
+    '$*le-shawled&$d-up&#son\'+ton/student**e/students$!s$"ur$!y#"es#%ghton#(ibrastic#+lick&yacute##nae%"ll#$pith',
+    '$2on&ndash;immelmann&&-evans&*/principal&Fian-ketilidian-laxfordian-svecofennian\'#cus"*e-dell-oty#"co#$ffer#$ghan#!l$#gas$+qu&eacute;n$#son#!n##rin',
+    '##sca$"os$#ton#"y\'#"zo"/ffed-and-puffed$%iness$#led$0on-martin/estate#%nagel##oof#"uf"$gary#*e-capacity%$eyed',
+    '%\'mouthed%(pocketed%\'quiffed%&tusked&$yred$2ly&rehy;successful&(-crowded\'%hyped\')magnified\'(talented(&opical$#tte#$gard%"te&!h',
+    '$#ies%"n\'&"gs&(s/friend#\'h-smith$"ea%*s-coughlan\'\'hallett)%rtman\'%jones\'$less\'$ryan\'#sir(&tanton&*/anarchist',
+    '\'%coach\'&editor\'&farmer(%ormer\'%green\'(national\'\'parents\'\'re-solv\')solicitor)(merville\'&thames&#don&!y$!f$#ill',
+    '%!y$!s%&/royal%"on##ies##ley$!y##net#&o-cola$*/frederick##ten#$uene"(huhuhuhu*"hu""ia',
+    '#$chol#!e$*tinhamsted#"ge##jer##lar$!e$"in$#lca##min#+oeinhamsted#!p#5raatira/rassemblement#$skes$#man',
+    '#,t-heures-bix$$erie#"us#%zhong"&jredin#"us""ka$#wng#"um%#deo"(l&egrave#&a-hoop##dre##ett#&k-like',
+    '$"ed$#ham$%ingly$!y#/l&ndash;harwich+)rotterdam+)zeebrugge$#-aw%&flange%#new%&shaped$!/%)europoort%\'museums%-paediatrician',
+    '$"ah%"nd%#sey%!w$&bridge$!i$\'mandels\'!n$#ock%"ne$#uva#(me-flint%$rist#"ot#\'sdoncks',
+    '$$hort#%tberg$&erstad((r&ouml;m$-gren/quilting#"un$"si"&m-free$$line$$mans#!.#"/2$$mand#1an&ndash;computer&-rehy;computer',
+    '%!\'%--and-computer&%birth&\'capital\'*entredness&\'diviner\'"og&&eating&$form&\'hamster(#rdy\'+eart-shaped\'%ungry&+interaction&\'looking',
+    '&\'powered&*rainforest\'&elated+(ionships(&source&)sacrifice\')cientific\'&eeming(%ttled\'$hape\'\'pecific\'&tories(#yle&4walking-on-to-planes\'$orth',
+    '&!e\'\'conomic&$pork&%robot%(atarians%"by%)e-looking\'(sounding%$ifit&!s\'"me\'"ta(&ically&%taran\'$ies-',
+    '+\'trained*./environmental\'"y\'(*/animality&\'zed-ape%%kind.)!/%,ly-contrived%+o-demonoids%"s.$$yrim#(berclyde&#ger&!s\'#ome',
+    '\'!s$*le-hearted\'(mannered&$baek&$ment$-oldt-stiftung$;ucker/single-coil/humbucker%+g-detection#\'dingers#,e&rehy;adams$&-gerry$)/retained$%byres$$leng%$tone',
+    '#%freys%$idus#+id-tropical%"ex%)ification&!s&#ty-))absorbent)+lengthening*%overs%#ors$#hia$!l%&acting%\'iation.',
+    '&"s.&#tas\'"ie%"ty$!n#"ko#%lants$#ies$"l.#!m$\'ability%$druz$#els%$rsea$(ing-tops',
+    '$!m$+ock-forming\'"ed$#ums#$nawa##ora%&esques%&iensis&"ng&$stic%+ous-looking($ness%"s.$"se$#ur-',
+    ')&formed\'%style&$/wit&"al&%istic&(lessness&%ously#(p-headed%$like%\'muscled%&necked%&shaped$$able$%ed-up%!r',
+    '%#rey$#hed&/ries/gloucester\'#son%/rey/oxfordshire((s-davies+\'esigned)(/marengo)+agriculture&\'ies-pen)\'/attack*\'banbury*/gloucestershire*$head+#unt',
+    '$%iness$"pe$%recht&"ys$%shire#$root#&shaugh#%ungus$\'s-based&(enriched&\'stained",n&rehy;grier#$\'red#!a$"ng',
+    '$%taway$$wihr#\'ch-back&+kuddy-hunch&*shouldered%0back-grandfather%\'ed-over##day$!e%#dth%!n%#red&!s&%tmark\'&wasser',
+    '$"io%"th$$land$"rd%"e\'&.d&rehy;weights\'2-and-eighty-degree3%sided,%fifty1%-watt--ourteen-pound(/fathom-stirrers)&ifteen)$ranc(&handed',
+    '($mark)(ile-long((odd-mile($page)"er($seat)#pan)*quare-foot((thousand0"th($word($yard)(ear-hold-%sleep\'!.',
+    '\'*fold&mdash\'\'s&mdash(.-and-thousands\'\'weights&!n$!t#!e$*berg/owner$#ker$&ryager#%frame#+g&rehy;over$%-kuan%&overed$#alu',
+    '&$eeee&$ian-*(american*/czechoslovakian*&french*$held*%owned*6polish-czechoslovakian*(speakers*(teaching+#ype*)ukrainian*$west)).speakers)#/uk',
+    '&\'ocamion&"um&)y&mdash;a\'!\'\'/-czechoslovakia(%first(\'vatican\'#109$(er-cowed\')distended(%riven\'\'pinched\'\'strikes\'&though(#orn',
+    '&)b&uuml;hl&(s-strike\'&triker$!o$!r%&y-eyed\'(sounding#&iberto$$ngue$!x##kie&!r%#nde$"y-&%dunky',
+    '&#utt%#ngs\'#ton%"sh$%ybell#&phries#&secker$$ford$#hip$&ingore&%ngore$)let-built\'!e$)r&uuml;ck#+t&mdash;she',
+    '%\'terrier&\'he-fish)8missing-french-horn-part)%shunt)\'thimble&\'raining$,/amalgamated%)community%%death&%river%$farm&%ormer%&gloucs%&mother%)scrambler',
+    '$*ed-looking%!n%(r-chaser(.onservationist\'&fisher-!s(\'oragers\'#god\'&killer-!s\'&nomads\'(warriors(%eston&!/\'&driver',
+    '&%house&"om&$shaw(#ill\'"on$"in&2\'-shootin\'-fishin\'&,g&rehy;style\'.-and-gathering)#xes(#box)#rae(\'costume($dogs(&fields',
+    '(\'goddess(&hounds(%knife($park+"ty)#ink(%seats)3hooting-and-fishing($type((wizardry\'\'/bishop)%uying\'$dale((on-based\'!s',
+    '$3ley/gloucestershire\'!s$"ry$(servants$#uns$!y#&wreste##yak#%ziker"!o##rns"*p&ndash;3s#!2#"eh$$rzia',
+    '#$pert#$sets$#ith")r-hur-hur#!.#%aches$#ibi$!y#+comb/mother#,d/delegation%\'foreign$#ian%"es$(le-burke&*s&ndash;in',
+    '$$well#!e$!l#+ford-porter#"gh$%ronje#!i$"ch$"ed#"ke#\'lebusch%!s&$tone%)y/nuclear\'&thames',
+    '$$ford$"in$!l$$ston#%neman$$scot#"ok$$nian#-ran/hatherley%0y-for-the-medici$"ee%!l$-icane-blasted*&fenced*#hit',
+    ',$shed*(stricken(!o%-edly-finished&"rs%"te\'(-hittite%"ya&"et$#rah%$ttss$"y\'%\'-scurry%!.#!s',
+    '&#ell$"ey$"id$(t/ashton&\'birdlip\')rockworth&&forest&/gloucestershire&(hartpury\',erefordshire\'*illersland&\'kington&\'leakage((ominster&"m5',
+    '&&natton\'*orthampton&$over&$park&$ross&&stroud\'\'ufferer&*tewkesbury\')oddington&%upton&\'warndon\'(iltshire%$pier%$wood#(t-filled',
+    '$#ard$#cha$#eau%!d$%fealt$%ibese%!g%"n\'$!y%!a#&worth.")s&acirc;k$(eacute;n#!a$&m-zade',
+    '#*band&mdash\'!\'(!s)!.\'\'-hatred)\'untings()kidnapper()sponsored\'#/as((director(.grannie/auntie($john(%walks)@ife/mother/daughter/son/employee-0parents/children',
+    '(#ike\'\'s/wives("ee$%ender$$urne$!y#%chens#$ebye$"ca$(lsenbeck$!n$!t$#yin#\'h-a-bye**&rehy;baby',
+    '$#aby\'"es%"nd$\'kitting#"ka$#ers%!y$$iest%$nson%#son$-y&rehy;bitchy%&-drawn##nae##odo#\'rev-bey',
+    '&"ni%!n&!d%"yn$*ein-arafat($type\'+agriculture\'"is%"ll%$nott&\'strasse%%rlian%"y.$#ien#!t',
+    '&(r-figure($hero$+on-miyamoto&!s$$wick&"tt"\'t-books$(dwelling$&to-hut#$aple##ber#*ch-hearted%%croft%"ed&-nce/reporting',
+    '("on&$sons**/aloysians%#ing(#son\'(son/crew+%soren+\'vintage*!i%!y#!h#"in##ley#$ment$$onts',
+    '%!e#\'tenback%!r&$ites$"ly$/on&rehy;le-hole&\'-in-the-\'-forest&\'/oxford\'&victim$$wirt#+u-dominated#!z$#pah""ub',
+    '"$vin\'"$werd##ood$#rth"%xeley%$rube%%vaner#$leys##ter")ybrechtse##ett#$gues#(ink/city#"ot##san',
+    '$%manns"#zar%!d##key##zes$!y!#v4s""ad#!e##ler$&sbakur#3nnadalsh&uacute;kur"!d"!e#+rager&eth;i',
+    '"*s&ndash;e1#"\'s##/e1#"5b#!s!%w-101""al"!i#"ch#"ta$*inghamsted"!m"!p"!r"&s-s210',
+    '%,s10&ndash;41"!t"&yrftum!$x-20"#10l"!6""g3#!5"!l"!t!,y&egrave;res""-2#\'drill-a##flo")7/1106/54',
+    '#*cinth-like(!e(#ine("us##der#%enids#%kunin#$lase$#ina$&ophora$&uronan#$mson#!t$&t/79th"\'berbole',
+    '#(rid-type&%ation&-isation-based.$like("er(!t\'"ty&"on&"um$!y"#cal"&datius#"e\'$)-chambers%$lees',
+    '$!n$$park%&ursued#"on#!r$%acals%&lazine%%mnios&$oist%(te/water&$ion.&#ors%-ulic-assisted).ally-activated.&driven',
+    '.\'lowered$\'colloid$+ia-shoulder&!i%(bisation%!c%"de&\'ization%\'otaphia$/o&rehy;chemical+&planes%!-&.chain-reaction\'$ongo\'&ulture',
+    '&*electrical0"ly.!s&)geologist&\'kinetic&\'planing\'&roject&$soda&\'thermal%(boration&7romochlorofluorocarbons%,carbon-based-&earing,>calcite-uraninite-polymetallic,)insoluble',
+    '\'\'talysis&&ephaly&(hemistry\'-loro-thiazide+-flourocarbons+\'tiazide*(thiazide\'(oleresis&&olloid&&racker&"ut&\'yclones%#dry&(ynamical%,fluorocarbon',
+    '("-3)$atom)(chloride*)ontaining+%oling)&fusion)+into-helium*"on)&oxygen))palladium*/otassium-atpase*(roducing)$rich)(sulphide()carbonate',
+    '\'*ochemistry/!s(*morphology%"id&\'sostasy%$labs&#ith&#ock\'/gically-related&(ytically\'%zable("ed%#mel\')teorology&%otion',
+    '%*peroxidase&%hiiae(&licity*#dae+!s\'$onic&"ic\'#per&\'lastics&(onically%$safe&$lide&&pheric&#tat)&ically',
+    '%*vitalising%.xide/magnesium&.y-dicarboxylic()silicates\'(apatites(-rylcarboxylic\',benzonitrile\'\'carbene(*hloroquine).olecalcioferol*\'roquine\')ephedrine(%thane*/yl-methacrylate,;ipiperazine-ethanesulphonic',
+    '\'*l-radicals(\'apatite)#ses)$tion(*daunomycin(\'radical($ysyl\'/octadecadienoic\'*tryptamine\'$urea%%zoans"(e-on-wye$%young#$male#\'na-like',
+    '"#fil"%geine$*l&aacute;c%"ac$#nic&"st#$ieia%+ne-obsessed($wise\'*/husbandry\'\'courses&*ic-looking#$roma&%etric"&hel-10',
+    '"*l&eacute;0#$aeus#"da#!e#$idae#(obatidae$\'chaeros&%oerus#6son-smith/headmistress%!p#&yshyyn"#mac#\'enocera&%lepis&(pterists',
+    '$%rkaet$&tusite#+n&rehy;book$!-%$book%,compositions%&melody%(sandwich&&ingers%$text&$unes%\'writers$%books$#ing$&ologia',
+    '(!y$%sheet%&inging$\'writers#\'ophylus"%nafol#%deman#!g$"es##ish"!o#%genic#%liths#,scin-n-butyl\'0e-n-butylbromide',
+    '$)ocephalus"!p#,&emacr;resia#$alon$!m$(ncistrus#(e-artist%(merchant$!.%$mark$-/stereotyping$)d&rehy;up$#lon\'.-manufacturing$.r&rehy;cunning',
+    '%!-&(activity\'\'lkaline\'#rid\'(wareness&)calvinism(&rdioid\'*ompetitive(\'nscious&)developed&%edges\'(motional\'&ndemic\'(xpensive(&tended',
+    '&+fetishistic\'#lex&.hyper-arrogant,+intelligent&+imaginative\',ndividualist(&flated(%tense&(kinetics\'#nee&$male(#rts\'$icro&+nationalism0"ts',
+    '&*passionate\'%lasia&*reactivity)$list\'*obusticity&-sensitisation\'#hip\'$mart\'$pace&\'tension\'&railer)(nsfusion(&opical%$.0/1("6.',
+    '\'%idity\'&tively*$ists&)daptation&$emic\'\'sthetic&\'lciuric\'+dosteronism\'\'ertness&%nthes&$than%,baric-oxygen\'"se&$ola.)!e',
+    '&\'reeding\'$ight&#uzz%)calcaemic)%iuria\'$rbia)"on(\'d-based*$like\'"st&$haos&)oagulable\'$lumn\')mpetitive\')nsumption',
+    ',$ions,"ly((tisolism%%dense)#ity\'\'pendent\'$rmic&\'iploidy&%rives\'#ome("ne%&echoic&%mesis\'"ia&(utrophic',
+    '%%faxes&(ertility&-ilm-&bgr;-max&+luorescence%\'gamists(/maglobulinaemia2$emia(#ous(!y\'*nglionosis\')stinaemia/!c)(rinaemic,$emia&$lued',
+    '(\'ucaemia&#rog%\'icoides&%mmune&+nflationary\'*sulinaemic,$emia,#ism%&joyous%)keratosis&\'inetics\'#tes%,leucocytosis&\'ipaemic)&saemia',
+    '&$ucid%%maket\'"rt&%edium\'\'tabolic-"sm&\'odified\'(ralistic\'&tility)&vation%+nationalism(&raemia&%ormal%\'oceanic&"id',
+    '("on&-smoregulation&*xygenating%)parasites,"ic-"sm&.epsinogaenemia\'!r()meability&%hagia\'+osphataemia&(igmented&&lasias&(olarizes%+rationality',
+    ',#ity($lism*"ty%&scalar\'&hmaltz&\'ecreton\'+nsitivities\'+rotoninemia\'$xual&%ignal&#now&&pheres\'%lenic&\'timulus\'$ores',
+    '&-usceptibility&%witch%%tense\'\'xt-like*\'on-line*%style)#ual,#ity&*heological(5rmochemo-radiotherapy\'%yroid&#ime&\'onicity&/ransaminasaemia\'\'ichosis',
+    '%*unfaithful%(vascular%$ware\'"sh&&hatsit#)hen-point&%ating)#ons&"ed%\'rnation#(maniacal#&naceae$)o-casques\'#ity&&helmet',
+    '+(ological%\'amnesia%%dance%"id\'"es%&pompic%)sedatives%+t&rehy;ized&*herapeutic&\'ic-type(*ally-aided-(produced(%s/the\'%sable(#in\'',
+    '$"um#5o-&ggr;-globulinaemia%+allergenic*%$bulb%(converse%*glycaemics%*lipidaemic%+oestrogenic%!r$-/hypertension$*adrenalism%+lbuminaemic&+dosteronism&+lergenicity$(calcemia',
+    '&$rcal%&haeris&(loraemic))ite-based&-olesterolemia\'(ndriasis&%romic+#ity%%linea%#ris("is\'%tarum("e.&!o$%dense',
+    '\'%rnics$%estes$$gaea&/mmaglobulinemia&*nglionosis%)laecaemic%\'nathous%"un$&halide$"id$(kalaemic%&inesis$0laetin-8-glucose%%eneus&$ucos',
+    '&\'pemiant&$thic%(obulated$#mag\'(nasaemia&%niacs%*ethylation%\'otility$)natraemic$.parathyroidism%)haryngeal%,igmentations$,regeneration."ve$)secretion',
+    '($ised)#zes*#ing\'%tical)$sing)"ze+!d&"er&\'henuria%\'ulphite$!t%$axis%&halami+3c-pituitary-gonadal,)pituitary',
+    ')"te\'#ken\'%lamic\'#nar\')sis-based+)formation+*generation+&making+)provoking*!.)+ze-and-test+!r\'/tical-deductive*-o-deductively+)deductive',
+    '%\'onicity)!s$(xanthine,)-xanthine##rez$&ocrisy#.silophodontids%\'thermal$%odont%!s#(thesised"\'rcanian#"on#"st#"um',
+    '#"ni#\'sington$%ollos%"pe&"us#)ter&mdash&%ectom&#ia.(!s\'$cal\'*!y\'!d\'$etas\'&sation&\'oscopic',
+    '"$tane#"ec$!r#6he/eynsham/oxfordshire##ime##ril"*udrophobic#!k#!m$"an#"ng"!v#"ot"$well!$z-10',
+    '"!.",ds-dominated":qzdsfzihivphzpetpwvovpmzgf "i%!$&amp%%;sup2"$circ"(dollar;1)!8")eacute;na"&hstrok"-lsqb;lay&rsqb"(mdash;iv(5j&mdash;k&mdash;value(#met',
+    '($here(#iii($live(!m(#rho($spit#.tilde&eacute;s"\'pound;1)#.2m)$2.8m)$6.2m)$7.7m+"9m)$8.4m*!0',
+    ')$.16m*#53m+"5m*"7m!\'samatec',
 )
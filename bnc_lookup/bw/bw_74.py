@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_74 = (
+count_74 = 6694
+
+heads_74 = (
     'gtggaaaaatcttttacc',
-    'gti\'s',
-    'gtir',
-    'gtis',
-    'gto/dodge',
-    'gtp-binding',
-    'gtp-ras',
-    'gtr',
-    'gtriii',
-    'gtt',
-    'gtudu',
-    'gu&eacute;gan',
-    'gu&eacute;nin',
-    'gu&eacute;rande',
-    'gu&eacute;rigy',
-    'gu&eacute;rin',
     'gu&eacute;rite',
-    'gu&eacute;roult',
-    'gu&ecirc;pes',
-    'gu&ecirc;rande',
-    'gu&euml;i',
-    'gu1',
-    'gu10',
-    'gu11',
-    'gu12',
-    'gu14',
-    'gu15',
-    'gu22',
-    'gu35',
-    'gu3l',
-    'gu5',
-    'gu8',
     'guacamole-style',
-    'guacamoled',
-    'guacar&aacute;n',
-    'guadalfeo',
-    'guadalthat',
-    'guadalthis',
-    'guadalupensis',
-    'guadeloupe.',
-    'guadiana',
-    'guagara',
-    'guaging',
-    'guai',
-    'guaiaci',
-    'guajavas',
-    'guajira--see',
-    'gualco',
     'gualdo',
-    'gualter',
-    'gualtieri',
-    'guam&lsqb;seep.',
-    'guam-belau',
-    'guambian',
-    'guambino',
-    'guanajay',
-    'guanay',
-    'guangchang',
-    'guangdougen',
-    'guanghan',
-    'guangos',
-    'guangsi',
-    'guangyi',
-    'guangyuan',
     'guanica',
-    'guanidines',
-    'guanidino',
-    'guanidium',
-    'guanidoamino',
-    'guanine-nucleotide-releasing',
-    'guanjuato',
-    'guano-speckled',
-    'guans',
-    'guantalamera',
-    'guantanamera',
-    'guanylyltransferase',
-    'guanzil',
-    'guapa',
-    'guapor&eacute',
-    'guappo',
     'guaracara',
-    'guaran&rehy;teed',
-    'guaran&rehy;teeing',
-    'guaranteed*',
-    'guarantees-see',
-    'guarantees/consequential',
-    'guaranty1',
-    'guararapes',
-    'guard&ndash;operated',
-    'guard&rehy;dog',
-    'guard&rehy;sergeant',
-    'guard\'',
-    'guard-at-all-times',
-    'guard-awn',
-    'guard-book',
-    'guard-captain',
     'guard-chamber',
-    'guard-changing',
-    'guard-duty',
-    'guard-hostage',
-    'guard-manned',
-    'guard-post',
-    'guard-rails',
-    'guard-school',
-    'guard-style',
-    'guard/',
-    'guarda-costa',
-    'guardall',
-    'guardbridge',
-    'guardedness',
-    'guarders',
-    'guardian(s)',
     'guardian-baboon',
-    'guardian-in',
-    'guardian/aip',
-    'guardian/icm',
-    'guardian/nus',
-    'guardianfriday',
-    'guardianthursday',
-    'guardianws17',
-    'guardianws22',
-    'guardianws27',
-    'guardino',
-    'guardiola',
-    'guardists',
-    'guarducci',
-    'guarenteed',
-    'guareschi',
     'guariglia',
-    'guarir',
-    'guarisco',
-    'guarnacci',
-    'guaro&rehy;nam',
-    'guarrantee',
-    'guastalla',
-    'guatavita',
-    'guatemala\'',
-    'guatemalteco',
-    'guaternala',
-    'guavas.',
-    'guayaba',
-    'guayana',
-    'guaymas',
-    'guaymi',
     'guazu',
-    'gubay',
-    'gubbay',
-    'gubbay/marine',
-    'gubbed',
-    'gubble-gubble',
-    'gubemii',
-    'gubensee',
-    'gubernia',
-    'guberniia-',
-    'guberniya',
-    'gubersault',
-    'gubispolkom',
-    'gubispolkomy',
-    'gubpomgol',
-    'gubpomgoly',
     'gucci-shoed',
-    'guccis',
-    'gudea',
-    'guderian',
-    'gudgeons',
-    'gudmund',
-    'gudmundson',
-    'gudmunsen',
-    'gudnason',
-    'gudzhabidze',
-    'gue',
-    'guedaffia',
-    'gueden',
-    'gueguen',
-    'gueguen-dreyfus',
-    'gueld',
     'guelder&rehy;rose',
-    'gueldermasen',
-    'guelen',
-    'guelf',
-    'guell',
-    'guelma',
-    'guelta',
-    'guenage',
-    'guenaizia',
-    'gueneizia',
-    'guenon',
-    'guensburger',
-    'guenter',
-    'guentheri',
-    'guenthoer',
-    'guercinos',
     'guere',
-    'guere&ntilde;o',
-    'guerero',
-    'guerilla-style',
-    'guerilleras',
-    'guerina',
-    'guernesiaise',
-    'guernika',
-    'guernsey-sweatered',
-    'guernsey-to-dinard',
-    'gueron',
-    'guerre\'',
-    'guerrero-girke',
-    'guerres',
-    'guerri&egrave;re',
-    'guerriera',
     'guerriero',
-    'guerrilla-led',
-    'guerrilla-priest',
-    'guerrilleiro',
-    'guerrillera',
-    'guerrillero',
-    'guerrists',
-    'gueryr',
-    'gues',
-    'guess&rehy;work',
-    'guess-the-composer',
-    'guess-the-word',
-    'guess.',
-    'guessable',
-    'guessed-at',
-    'guessed.',
     'guessers',
-    'guessin\'',
-    'guessing&rehy;game',
-    'guesstimation',
-    'guest-artiste',
-    'guest-chef',
-    'guest-friendship',
-    'guest-hosting',
-    'guest-i',
-    'guest-line',
-    'guest-offering',
-    'guest-papamanoli',
-    'guest-speaker',
-    'guest-star',
-    'guest-starring',
-    'guest-workers',
     'guest/hereford',
-    'guestcard',
-    'guestes',
-    'guestimates',
-    'guestimating',
-    'guestling',
-    'guestlist',
-    'guestly',
-    'guestmaster',
-    'guestwick',
-    'guestworker',
-    'guetary',
-    'guetteur',
-    'gueule',
-    'gueuze',
-    'guevara-dreamers',
     'guevarists',
-    'gueye',
-    'guezo',
-    'gufarov',
-    'guffawingly',
-    'guffone',
-    'gug-gug-gug',
-    'gugelhupf',
-    'gugerbauer',
-    'guggenb&uuml;hl',
-    'guggenhurli',
-    'guggenmania',
-    'guggi',
-    'guggugguggugg',
-    'guggum',
-    'gugliemo',
     'gugushvili',
-    'guhirwa',
-    'gui-building',
-    'gui-eyed',
-    'gui-independent',
-    'gui-like',
-    'gui-ness',
-    'gui-shaped',
-    'gui-style',
-    'gui4',
-    'guiac',
-    'guianas',
-    'guianese',
-    'guibba',
-    'guibilini',
-    'guibourtia',
     'guibray',
-    'guiburn',
-    'guichets',
-    'guida',
-    'guidance.he',
-    'guidance/regulation',
-    'guidarelli',
-    'guide&acirc;ne',
-    'guide-',
-    'guide-dog',
-    'guide-lecturer',
-    'guide-like',
-    'guide-post',
-    'guide-rail',
-    'guide-ships',
-    'guide-to-life',
     'guide-writer',
-    'guide/courier',
-    'guide/explores',
-    'guide5.tif',
-    'guide8.tif',
-    'guideard',
-    'guidebooks/brochures',
-    'guided-missile',
-    'guided.',
-    'guideless',
-    'guidelines.',
-    'guidelines/criteria',
-    'guidelinesand',
-    'guidenotes',
-    'guideposts',
-    'guiderails',
     'guiderius',
-    'guides.',
-    'guidewheel',
-    'guidewriters',
-    'guidici',
-    'guidleines',
-    'guidlhall',
-    'guidonia',
-    'guidons',
-    'guidos',
-    'guidotti',
-    'guidova',
-    'guierez',
-    'guigal',
-    'guigma',
-    'guignard',
     'guigni',
-    'guignon',
-    'guiguet',
-    'guihua',
-    'guiidlines',
-    'guilala',
-    'guild-hall',
-    'guild-halls',
-    'guild-revival',
-    'guild/shopkeeper',
-    'guildae',
-    'guildenstern.',
-    'guildford-based',
-    'guildford-related',
-    'guildry',
-    'guilds/bec',
     'guilds/northern',
-    'guilefull',
-    'guilelma',
-    'guilemette',
-    'guiles',
-    'guilfoyle',
-    'guilio',
-    'guill&eacute;n',
-    'guillani',
-    'guillaud',
-    'guillaumat',
-    'guillaume-raymond',
-    'guillaume-sanche',
-    'guille',
-    'guillelmi',
-    'guillemard',
     'guillemaud',
-    'guillemont',
-    'guillemots.',
-    'guillerm',
-    'guillermus',
-    'guillevic',
-    'guillielmus',
-    'guillit',
-    'guillois',
-    'guillon-laffaille',
-    'guillot',
-    'guillotine-less',
-    'guilloting',
-    'guilo',
-    'guilt-',
-    'guilt-absolving',
     'guilt-anxiety-fear-anger',
-    'guilt-edged',
-    'guilt-laden',
-    'guilt-making',
-    'guilt-offerings',
-    'guilt-provoking',
-    'guilt-sodden',
-    'guilt-stricken',
-    'guilt/family',
-    'guilt/worry/anxiety',
-    'guiltiest',
-    'guiltiness',
-    'guilty.the',
-    'guimaras',
-    'guimet',
-    'guin&eacute;-bissau',
     'guin&eacute;ens',
-    'guinea-gold',
-    'guinea-savannah',
-    'guineaman',
-    'guineamen',
-    'guineapig',
-    'guineapigs',
-    'guineas-worth',
-    'guineensis',
-    'guineo',
-    'guinesss',
-    'guingand',
-    'guingona',
-    'guinicelli',
-    'guiniforte',
-    'guinness-drinkin\'',
     'guinness-fringed',
-    'guinness-sponsored',
-    'guinness/distillers',
-    'guinnessens',
-    'guinnion',
-    'guinnless',
-    'guinon',
-    'guinot',
-    'guip&acute;zcoa',
-    'guipure',
-    'guiraud-riviere',
-    'guiren',
-    'guisarme',
-    'guisborough-whitby',
-    'guisboroughskelton',
-    'guise-lorraine',
     'guisinger',
-    'guisto',
-    'guisuga',
-    'guitane',
-    'guitar-',
-    'guitar-amps-to-11',
-    'guitar-basher',
-    'guitar-bashing',
-    'guitar-crazy',
-    'guitar-dominated',
-    'guitar-drenched',
-    'guitar-drive',
-    'guitar-driven',
-    'guitar-fakers',
-    'guitar-fascinated',
-    'guitar-fired',
     'guitar-flailing',
-    'guitar-fuelled',
-    'guitar-gauge',
-    'guitar-induced',
-    'guitar-laced',
-    'guitar-laden',
-    'guitar-licks',
-    'guitar-mad',
-    'guitar-makers',
-    'guitar-nasty',
-    'guitar-oriented',
-    'guitar-played-as-bacon-slicer',
-    'guitar-player',
-    'guitar-players',
-    'guitar-shredding',
-    'guitar-smashing',
     'guitar-strummed',
-    'guitar-strumming',
-    'guitar-turned-bass',
-    'guitar-wise',
-    'guitar/amp',
-    'guitar/amp/effect',
-    'guitar/bass',
-    'guitar/drum',
-    'guitar/keyboard',
-    'guitar/mandolin/octave',
-    'guitar/octave',
-    'guitar/pickup/amp',
-    'guitar/pop',
-    'guitar/vocal',
-    'guitar/vocalist',
-    'guitarbasseddrumsvoice',
     'guitarcore',
-    'guitares',
-    'guitarist-to-watch',
-    'guitarist/backing',
-    'guitarist/founder',
-    'guitarist/singer',
-    'guitaristlast',
-    'guitaristmagazine',
-    'guitaristoffice',
-    'guitarless',
-    'guitars.',
-    'guitarstrings',
-    'guitart',
-    'guitarwank',
-    'guite',
-    'guitron',
     'guitry',
-    'guitsch',
-    'guitton',
-    'guiwenneth',
-    'guixian',
-    'guixols',
-    'guj116',
-    'gujaratis',
-    'gujarats',
-    'gujerati-speaking',
-    'gujrant',
-    'gujurat',
-    'guk',
-    'gul-like',
-    'gulabganj',
-    'gulai',
     'gulal',
-    'gulam',
-    'gulamali',
-    'gulamentum',
-    'gulayman',
-    'gulbai',
-    'gulbeddin',
-    'gulberk',
-    'gulbot',
-    'gulchakhra',
-    'gulcicek',
-    'gulda',
-    'guldberg',
-    'guldimann',
-    'guldmann',
-    'guldne',
     'gule',
-    'gulf-inflated',
-    'gulf-related',
-    'gulf-war',
-    'gulf-watchers',
-    'gulfo',
-    'gulfstream/sukhoisu-21gssbj',
-    'gulfwatch',
-    'gulg',
-    'gulgula',
-    'gulia',
-    'gulistan',
-    'guljaev',
-    'gull\'s-eye',
-    'gull-like.',
-    'gull-wings',
     'gulland',
-    'gulleen',
-    'gullen',
-    'gulleyed',
-    'gullfossburgers',
-    'gullibilities',
-    'gullible/mitre',
-    'gullich',
-    'gullikson',
-    'gullitt',
-    'gullmar',
-    'gullotti',
-    'gulls-in-waiting',
-    'gully-head',
-    'gully-riven',
-    'gulon',
     'gulonkerb',
-    'gulp-\'keep',
-    'gulp.',
-    'gulper',
-    'gulpers',
-    'gulsham',
-    'gulunay',
-    'gulyashchie',
-    'gulzar',
-    'gum-boot',
-    'gum-chewin\'',
-    'gum-digging',
-    'gum-erosion',
-    'gum-resin',
-    'gum-tree',
-    'gum-wads',
     'gumald',
-    'gumble',
-    'gumbolumbo',
-    'gumboro',
-    'gumburd',
-    'gumercindo',
-    'gumersindo',
-    'gumista',
-    'gummage',
-    'gummerburger',
-    'gummies',
-    'gummily',
-    'gumminess',
-    'gummow',
-    'gummunt',
-    'gumption-less',
     'gums-',
-    'gumshoes',
-    'gumstool',
-    'gumucio',
-    'gumushane',
-    'gumwood',
-    'gun&rehy;room',
-    'gun\'',
-    'gun-and-olive-branch',
-    'gun-battles',
-    'gun-bearer',
-    'gun-boat',
-    'gun-butt',
-    'gun-butts',
-    'gun-buyers',
-    'gun-camera',
     'gun-carrying',
-    'gun-conscious',
-    'gun-cotton',
-    'gun-crazy',
-    'gun-dealers',
-    'gun-dog',
-    'gun-embrasures',
-    'gun-emplacement',
-    'gun-emplacements',
-    'gun-flashes',
-    'gun-for-hire',
-    'gun-founding',
-    'gun-hand',
-    'gun-holster',
-    'gun-hungry',
-    'gun-killing',
     'gun-laying',
-    'gun-maker',
-    'gun-making',
-    'gun-microphone',
-    'gun-mikes',
-    'gun-ownership',
-    'gun-platform',
-    'gun-play',
-    'gun-port',
-    'gun-powder',
-    'gun-rack',
-    'gun-rights',
-    'gun-shy',
-    'gun-sight',
-    'gun-sites',
-    'gun-slits',
     'gun-smoke',
-    'gun-team',
-    'gun-teams',
-    'gun-tubes',
-    'gun-turret',
-    'gunawardene',
-    'gunaydin',
-    'gunbarrel',
-    'gunbattles',
-    'gunbearers',
-    'guncaps',
-    'guncelin',
-    'gunco',
-    'guncotton',
-    'guncrews',
-    'gunctions',
     'gundar',
-    'gundas',
-    'gunde',
-    'gundem',
-    'gundersen',
-    'gundle',
-    'gundobada',
-    'gundrun',
-    'gundry',
-    'gundu',
-    'gundula',
-    'gunes',
-    'gunfighters',
-    'gunfire.',
-    'gung&rehy;ho',
-    'gung-go',
     'gunga-din',
-    'gungadin',
-    'gungah',
-    'gunged',
-    'gungeing',
-    'gungey',
-    'gungha',
-    'gungung',
-    'gunhilde',
-    'gunhold',
-    'gunier',
-    'gunilda',
-    'gunilla',
-    'gunkhole',
-    'gunlayer',
-    'gunmaker',
     'gunmaking',
-    'gunmetal-coloured',
-    'gunmetal-grey',
-    'gunnarson',
-    'gunnel',
-    'gunnells',
-    'gunner/event',
-    'gunnersley',
-    'gunnesbury',
-    'gunnet',
-    'gunnii',
-    'gunnings',
-    'gunnison',
-    'gunnlaugsson',
-    'gunnleik',
-    'gunny',
     'gunny-sack',
-    'gunnysack',
-    'gunodorum',
-    'gunpat',
-    'gunpowder-propelled',
-    'gunpowdery',
-    'guns\'n',
-    'guns\'n\'poses',
-    'guns\'n\'roses',
-    'guns\'n\'roses-appetite',
-    'guns-for-butter',
-    'gunseikan',
-    'gunshy',
-    'gunslingers1',
-    'gunstocks',
-    'gunstone',
     'gunstrup',
-    'gunt',
-    'guntbold',
-    'gunterman',
-    'guntersville',
-    'guntley',
-    'gunto',
-    'guntoters',
-    'gunts',
-    'guntur',
-    'gunturrets',
-    'gunwalloe',
-    'gunyld',
-    'gunzenhausen',
-    'gunzerode',
-    'gunzler',
     'guobadia',
-    'guomindang',
-    'guomintang',
-    'guord',
-    'guot',
-    'guppie',
-    'guppies.they',
-    'gupps',
-    'gura',
-    'gurages',
-    'gurd',
-    'gurdeep',
-    'gurder.',
-    'gurel',
-    'gurg&rehy;ling',
-    'gurgaon',
     'gurgen',
-    'gurgle-croak',
-    'gurgly',
-    'gurgureh',
-    'guri',
-    'gurian',
-    'gurkha-style',
-    'gurkhaland',
-    'gurl',
-    'gurl-fren',
-    'gurley',
-    'gurlz',
-    'gurmack',
-    'gurman',
-    'gurmit',
-    'gurnan',
     'gurnards',
-    'gurnemanz',
-    'gurnet',
-    'gurnett',
-    'gurney-influenced',
-    'gurnis',
-    'gurov',
-    'gurpinar',
-    'gurreh',
-    'gurries',
-    'gurrs',
-    'gursawak',
-    'gursel',
-    'gurston',
-    'gurtin',
-    'gurtovoi',
     'guru-arm-worshippping',
-    'guru-economist',
-    'guru-led',
-    'guru-making',
-    'guru-oriented',
-    'guru-scale',
-    'guru-y',
-    'gurudev',
-    'gurusinha',
-    'guruwari',
-    'gurvitch',
-    'gurwen',
-    'gurzenich',
-    'gusak-grin',
-    'gusanos',
-    'gusau',
     'guschbauer',
-    'guse',
-    'guseva',
-    'gushings',
-    'gusle',
-    'guslyannikov',
-    'guss',
-    'gussago',
-    'gussin',
-    'gussow',
-    'gust&acirc;v',
-    'gust-free',
-    'gustafaspegren',
-    'gustaria',
-    'gustatio',
-    'gustavi',
     'gustibus',
-    'gustilo',
-    'gustloff',
-    'guston.',
-    'gustspeeds',
-    'gut&eacute;rres',
-    'gut&rehy;wrenching',
-    'gut-ache',
-    'gut-bucket',
-    'gut-busting',
-    'gut-churning',
-    'gut-dwelling',
-    'gut-father',
-    'gut-fear',
-    'gut-feelings',
-    'gut-grapping',
     'gut-gut',
-    'gut-lurch',
-    'gut-reaction',
-    'gut-rending',
-    'gut-rottingly',
-    'gut-shot',
-    'gut-slicing',
-    'gut-tearing',
-    'gut-twisting',
-    'gut-weight',
-    'gut-wrenchingly',
-    'gutbucket',
-    'gutcheon',
-    'gutehoffnungsh&uuml;tte',
-    'gutema',
-    'guterman',
     'gutesha',
-    'gutfucking',
-    'gutharc-ballin',
-    'guthlac-reputedly',
-    'guthmund',
-    'guthmundur',
-    'guti&egrave;rez',
-    'gutierez',
-    'guting',
-    'gutkind',
-    'gutlessness',
-    'guts&mdash',
-    'guts-spilling',
-    'gutsa',
-    'gutschmid',
-    'gutseley',
     'gutta&rehy;percha',
-    'guttag',
-    'guttair',
-    'guttata',
-    'gutte',
-    'gutted.',
-    'guttenberg',
-    'guttenbrunn',
-    'guttentags',
-    'gutter-borne',
-    'gutter-level',
-    'gutter-like',
-    'gutter-muck',
-    'gutter-spanish',
-    'gutter-weasels',
-    'gutteral',
     'gutterless',
-    'gutties',
-    'guttridge',
-    'guttulatum',
-    'gutturally',
-    'gutty',
-    'gutullapollenites',
-    'gutwinski',
-    'gutworms',
-    'gutz',
-    'guv\'nors',
-    'guvec',
-    'guvuryu',
-    'guwat',
-    'guy-fawkes',
-    'guy-fisher',
     'guy-geoffrey',
-    'guy/chick',
-    'guy/owner',
-    'guy/tony',
-    'guyanan-born',
-    'guyanas',
-    'guyard',
-    'guyatt',
-    'guybrush',
-    'guyenne',
-    'guyera',
-    'guylfstream',
-    'guymer',
-    'guynemers',
-    'guys&amp;girls',
-    'guys.',
     'guys/gals',
-    'guyt',
-    'guyther',
-    'guzelyurt',
-    'guzev',
-    'guzgogs',
-    'guzm&aacute',
-    'gvcac',
-    'gven',
-    'gvenhwyvar',
-    'gvero',
-    'gvf',
-    'gvh/g',
-    'gviao*6.711',
-    'gving',
-    'gvpg',
     'gvs',
-    'gw&ycirc;r',
-    'gw-basic',
-    'gw0fxa',
-    'gwadar',
-    'gwagwalada',
-    'gwaihir',
-    'gwaith',
-    'gwalch',
-    'gwallawg',
-    'gwan',
-    'gwandmuvver',
-    'gwang-sik',
-    'gwardia',
-    'gwari',
-    'gwarwyn-a-throt',
     'gwasanaethau',
-    'gwash',
-    'gwatkin',
-    'gwb',
-    'gwbasic',
-    'gwe/bw',
-    'gweek',
-    'gweilob',
-    'gwendolyn',
-    'gwenfro',
-    'gwenllian',
-    'gwenneth',
-    'gwennie',
-    'gweno',
-    'gwenyth',
-    'gwernaffield',
     'gwerngue',
-    'gwernhaylod',
-    'gwernog',
-    'gwfr',
-    'gwhrs',
-    'gwillam',
-    'gwillim',
-    'gwin',
-    'gwine',
-    'gwinn',
-    'gwinnett',
-    'gwinnutt',
-    'gwlad',
-    'gwladfa',
-    'gwm-oergwm',
-    'gwm/cmg',
     'gwr&ndash;liveried',
-    'gwr-designed',
-    'gwr-type',
-    'gwrach-y-rhibyn',
-    'gwrageth',
-    'gwryd',
-    'gwyane',
-    'gwyer',
-    'gwyl',
-    'gwyladys',
-    'gwylim',
-    'gwyllos',
-    'gwymrage',
-    'gwyne',
-    'gwynfynydd',
-    'gwynion',
     'gwynllwg',
-    'gwynne-jones',
-    'gwynne/west',
-    'gx+',
-    'gx/gx',
-    'gx/n',
-    'gx6',
-    'gxa',
-    'gxc-1',
-    'gxf3',
-    'gxh5&verbar&verbar;rxh5&verbar&verbar;10',
-    'gxi',
-    'gxu',
-    'gxx',
-    'gxxxxgk',
-    'gyaan',
     'gyaincain',
-    'gyainvain',
-    'gyak',
-    'gyaltsen',
-    'gyamfi',
-    'gyan',
-    'gyangz&ecirc',
-    'gyants',
-    'gyapong',
-    'gyb',
-    'gybed',
-    'gybi',
-    'gyeet',
-    'gyennadi',
-    'gyf',
-    'gyfan',
     'gyfes',
-    'gyfrwys',
-    'gyfun',
-    'gygaia',
-    'gyges',
-    'gyhll',
-    'gylbys',
-    'gyleview',
-    'gylfason',
-    'gyllenborg',
-    'gyllenhammer',
-    'gyllenship',
-    'gyllingvase',
-    'gylys',
-    'gym-slips',
-    'gym.',
     'gym/piano',
-    'gym/training',
-    'gymastics',
-    'gymbobs',
-    'gymer',
-    'gymmistress',
-    'gymnase',
-    'gymnasieskolan',
-    'gymnasium/health',
-    'gymnastical',
-    'gymnastickschule',
-    'gymnazium',
-    'gymnema',
-    'gymnemins',
-    'gymnocarpium',
-    'gymnocladus',
     'gymnocorymbus',
-    'gymnop&egrave;dies',
-    'gymnopedies',
-    'gymnosophist',
-    'gymnosperm',
-    'gymnosperms.',
-    'gymnure',
-    'gymnures',
-    'gymro',
-    'gymshoes',
-    'gymsoul',
-    'gyn',
-    'gynaecologically',
-    'gynandromorphs',
-    'gynandrous',
-    'gynecologic',
     'gynecology',
-    'gynesis',
-    'gynewell',
-    'gyngell/boy',
-    'gynnne',
-    'gyno',
-    'gynocentrically',
-    'gynocentrism',
-    'gynophobia',
-    'gyo',
-    'gyoezoe',
-    'gyongyos',
-    'gyorgyos',
-    'gyoza',
-    'gyozo',
-    'gypaetus',
     'gypcrete',
-    'gypcretes',
-    'gypglas',
-    'gyping',
-    'gypo',
-    'gyppo',
-    'gypps',
-    'gypsies&mdash;set',
-    'gypsiferous',
-    'gypsified',
-    'gypsohpila',
-    'gypsophilus',
-    'gypsum-fibreboards',
-    'gypsums',
-    'gypsy-eyed',
-    'gypsy-fashion',
     'gypsy-loving',
-    'gypsy-sailor',
-    'gypsy-style',
-    'gypsy-woman',
-    'gypsyfied',
-    'gypsys',
-    'gyr-falcon',
-    'gyra96',
-    'gyrator',
-    'gyratory',
-    'gyre-scale',
-    'gyrene',
-    'gyrinid',
-    'gyrinidae',
-    'gyrinocheilus',
-    'gyrinus',
     'gyro-operated',
-    'gyron',
-    'gyroney',
-    'gyrostabilisers',
-    'gyrotrons',
-    'gyrwe',
-    'gysin\'',
-    'gyspies',
-    'gytha',
-    'gyu',
-    'gyulafeh&eacute;rvar',
-    'gyulay/petervari',
-    'gyurme',
-    'gyursansky/nadasdi',
-    'gywneth',
-    'gywnoro',
     'gyymfit',
-    'gzhel',
-    'gziffra',
-    'h&aacute;lig-fyrgen',
-    'h&aacute;ma',
-    'h&aacute;rosi',
-    'h&abreve;f',
-    'h&acirc;fbach',
-    'h&aelig;di',
-    'h&aelig;v/',
-    'h&agr',
-    'h&amacr;tijaro',
-    'h&amp;k',
-    'h&amp;r',
-    'h&amp;sub2',
-    'h&amp;sub2bi',
     'h&amp;v',
-    'h&aring;kanson',
-    'h&auml;agen',
-    'h&auml;agen-',
-    'h&auml;agen-daz',
-    'h&auml;gg',
-    'h&auml;meenlinna',
-    'h&auml;nde',
-    'h&auml;ndel',
-    'h&auml;nden',
-    'h&auml;rkeberga',
-    'h&auml;rrakalou',
-    'h&auml;rtling',
-    'h&auml;sler',
-    'h&auml;ssler',
-    'h&auml;userer',
     'h&auml;ussler',
-    'h&eacute;0liaia',
-    'h&eacute;as',
-    'h&eacute;berg&eacute',
-    'h&eacute;bert',
-    'h&eacute;l&ouml;ise',
-    'h&eacute;las',
-    'h&eacute;liographique',
-    'h&eacute;ll&egrave;ne',
-    'h&eacute;risson',
-    'h&eacute;rodias',
-    'h&eacute;ros',
-    'h&eacute;roux_et',
-    'h&eacute;sione',
-    'h&eacute;verlore',
-    'h&gt;0',
     'h&gt;h',
-    'h&khgr',
-    'h&lt;h',
-    'h&ndash;1062',
-    'h&ndash;25a',
-    'h&ndash;51',
-    'h&ndash;d',
-    'h&ndash;f',
-    'h&oacute;lar',
-    'h&oacute;lmgj&oacute;gv',
-    'h&ocirc;pital',
-    'h&ocirc;ra',
-    'h&ocirc;teliere',
-    'h&ocirc;teliers',
-    'h&oslash;nning',
-    'h&oslash;nning-1',
     'h&oslash;rdaland',
-    'h&oslash;yre',
-    'h&ouml;cherl',
-    'h&ouml;egaarden',
-    'h&ouml;fners',
-    'h&ouml;fudlausn',
-    'h&ouml;lle',
-    'h&ouml;llental',
-    'h&ouml;ntugen',
-    'h&ouml;rigkeit',
-    'h&ouml;rnlund',
-    'h&ouml;roldt',
-    'h&ouml;t',
-    'h&ouml;y&uuml;k',
-    'h&rehy;larna',
-    'h&uuml',
     'h&uuml;derchuluun',
-    'h&uuml;ker',
-    'h&uuml;lstra',
-    'h&uuml;sch',
-    'h\'am',
-    'h\'answered',
-    'h\'as',
-    'h\'eye',
-    'h\'ford',
-    'h\'l',
-    'h\'mm',
-    'h\'rull',
-    'h\'self',
-    'h(start)',
-    'h+',
-    'h+10',
     'h+16',
-    'h+24',
-    'h+hr',
-    'h--h',
-    'h-0193gb+++at',
-    'h-1',
-    'h-1364',
-    'h-14',
-    'h-2k',
-    'h-4/hk-1',
-    'h-500',
-    'h-713',
-    'h-800',
-    'h-9',
-    'h-a',
-    'h-as',
     'h-atom',
-    'h-b',
-    'h-blocks',
-    'h-bomb/god',
-    'h-bombers',
-    'h-boys',
-    'h-cl',
-    'h-d',
-    'h-e-m',
-    'h-er',
-    'h-five',
-    'h-grades',
-    'h-h-a',
-    'h-h-h-h-',
-    'h-h-h-had',
-    'h-h-hair',
     'h-h-happier',
-    'h-h-hesitation',
-    'h-h-how',
-    'h-h-like',
-    'h-had',
-    'h-hands',
-    'h-harder',
-    'h-head',
-    'h-heavy',
-    'h-heels',
-    'h-hello',
-    'h-hope',
-    'h-hour',
-    'h-i',
-    'h-instability',
-    'h-jetty',
     'h-lolaire',
-    'h-m-s',
-    'h-methyl',
-    'h-n',
-    'h-numbers',
-    'h-o',
-    'h-o-w',
-    'h-oct-1',
-    'h-oct-2',
-    'h-oighe',
-    'h-omeprazole',
-    'h-pawn',
-    'h-pb',
-    'h-reg.',
-    'h-shape',
-    'h-thy1',
     'h-thymidine/ml',
-    'h-u-r-r-y',
-    'h-u-s-e-i-n',
-    'h-u-s-s-e-i-n',
-    'h-uridine',
-    'h-yrdn',
-    'h.-s.',
-    'h.2',
-    'h.4',
-    'h.5',
-    'h.57&ndash;597',
-    'h.6',
-    'h.a.p.p.y',
-    'h.bachmayer',
-    'h.c.beeching',
-    'h.c.f',
     'h.c.j.',
-    'h.c.p.t.',
-    'h.c.s',
-    'h.c.s.',
-    'h.cline',
-    'h.d.-4',
-    'h.d.b.',
-    'h.de',
-    'h.e.a.r.s',
-    'h.e.bates',
-    'h.e.o.',
-    'h.e.p',
-    'h.f.r.',
-    'h.g.t.',
-    'h.g.wells',
-    'h.girardet',
     'h.heumann',
-    'h.i.v.',
-    'h.iv',
-    'h.j',
-    'h.j.heinz',
-    'h.j.joel',
-    'h.j.s.',
-    'h.k.b.',
-    'h.l.c.',
-    'h.l.cas.',
-    'h.l.g.',
-    'h.m.f.',
-    'h.m.i.',
-    'h.m.i.5',
-    'h.m.i.s',
-    'h.m.is',
     'h.m.s.\'furious',
-    'h.m.s.0.',
-    'h.m.the',
-    'h.may',
-    'h.mclean',
-    'h.n.c.',
-    'h.o.u.s.e',
-    'h.p.i',
-    'h.p.l.',
-    'h.p.l.c.',
-    'h.p.s',
-    'h.perring',
-    'h.prem',
-    'h.s.e.',
-    'h.s.l.',
-    'h.s.t.',
     'h.sc',
-    'h.silver',
-    'h.sturm',
-    'h.swainson',
-    'h.t.-type',
-    'h.ts',
-    'h.u.a.c.',
-    'h.v.',
-    'h.v.s',
-    'h.w.f.',
-    'h/00/22/0003',
-    'h/00/22/2001',
-    'h/00/23/0006',
-    'h/00/23/0012',
-    'h/00/23/0015',
-    'h/00/23/0018',
     'h/00/23/0047',
-    'h/00/23/2002',
-    'h/00/23/2006',
-    'h/00/23/2010',
-    'h/00/23/2024',
-    'h/00/23/2031',
-    'h/00/23/2032',
-    'h/00/23/2035',
-    'h/00/23/2037',
-    'h/00/23/2038',
-    'h/00/23/2039',
-    'h/00/23/2044',
-    'h/00/23/2048',
-    'h/00/23/2050',
-    'h/00/23/2055',
-    'h/00/23/2058',
     'h/00/23/2063',
-    'h/00/23/2064',
-    'h/00/23/2070',
-    'h/00/23/2071',
-    'h/00/23/2073',
-    'h/00/23/2079',
-    'h/00/23/2082',
-    'h/00/24/2002',
-    'h/00/25/0005',
-    'h/00/25/0008',
-    'h/00/26/0038',
-    'h/00/28/0001',
-    'h/00/28/0062',
-    'h/01/05/0001-3',
-    'h/02/18/0001',
-    'h/02/28/0001',
     'h/11',
-    'h/11/25/0002',
-    'h/11/25/0005-1',
-    'h/11/25/0006',
-    'h/c',
-    'h/d',
-    'h/h',
-    'h/m',
-    'h/mc',
-    'h/ne2',
-    'h/rnas',
-    'h/she',
-    'h/v',
-    'h02',
-    'h04',
-    'h05',
     'h08',
-    'h09',
-    'h1\'-gh8',
-    'h1-box',
-    'h120-r',
-    'h13',
-    'h14',
-    'h15',
-    'h150',
-    'h159l',
-    'h167',
-    'h167\'s',
-    'h18',
-    'h197q',
-    'h1a',
-    'h2&gt',
     'h2(g)',
-    'h2+',
-    'h2.3a/taqi',
-    'h200/2000',
-    'h206',
-    'h207',
-    'h22',
-    'h25/3',
-    'h29',
-    'h2a',
-    'h2o(g)',
-    'h2off',
-    'h2receptors',
-    'h3\'-c3\'-o3\'-p',
-    'h3\'-p',
-    'h387',
     'h3n2',
-    'h4&verbar&verbar;nf6&verbar&verbar;6',
-    'h4\'',
-    'h4.',
-    'h40',
-    'h400d(3)',
-    'h443',
-    'h468',
-    'h47',
-    'h4g7',
-    'h4tf-2',
-    'h51',
-    'h52',
-    'h53',
-    'h553',
-    'h58',
     'h5s',
-    'h5s-',
-    'h5s-rna',
-    'h6++',
-    'h6281',
-    'h6312',
-    'h75',
-    'h814',
-    'h90',
-    'h91/369',
-    'h91/401',
-    'h91/403',
-    'h95a',
-    'h982',
-    'h99',
-    'h:o',
     'h=100',
-    'h=c/v',
-    'h=d',
-    'h=q=0',
-    'ha&amp;sup1',
-    'ha&iuml;tian',
-    'ha&lsqb;d&rsqb',
-    'ha&ndash;43',
-    'ha&ndash;re',
-    'ha&pound',
-    'ha&scaron;ek',
-    'ha&uuml;ynite',
-    'ha\'apai',
-    'ha\'aretz',
-    'ha\'chllt',
-    'ha\'hotel',
     'ha\'i',
-    'ha\'ik',
-    'ha\'ir',
-    'ha\'p\'oth',
-    'ha\'pennyworth',
-    'ha\'penth',
-    'ha\'peth',
-    'ha\'t',
-    'ha+',
-    'ha-bloody-ha',
-    'ha-chortle-ha',
-    'ha-emek',
-    'ha-er',
-    'ha-ha-haa-ha',
-    'ha-has',
-    'ha-hm',
     'ha-kohen',
-    'ha-m',
-    'ha-teley',
-    'ha-yoke-lesteck-cop-toke-chock',
-    'ha.i',
-    'ha.lt',
-    'ha/44',
-    'ha2',
-    'ha3',
-    'ha=a',
-    'haaaa',
-    'haaaooowwwaaaaooooww',
-    'haager',
-    'haags',
-    'haah',
-    'haala',
     'haalth',
-    'haand',
-    'haands',
-    'haapanen',
-    'haapens',
-    'haare',
-    'haarhot',
-    'haarhuis',
-    'haavelmo',
-    'haavio&rehy;mannila',
-    'haazen',
-    'hab\'',
-    'hab-level',
-    'habaa',
-    'habad',
-    'habanabakize',
     'habara',
-    'habarushaka',
-    'habashat',
-    'habberjam',
-    'habberley',
-    'habbers',
-    'habeas',
-    'habeatis',
-    'habectric',
-    'habegger',
-    'habeler',
-    'habemus',
-    'habeneck',
-    'habenera',
-    'habens',
-    'haberdasheries',
     'habere',
-    'haberfield',
-    'haberla',
-    'habermann',
-    'habershons',
-    'habes',
-    'habett',
-    'habeus',
-    'habibie',
-    'habiliment',
-    'habilitating',
-    'habimana',
-    'habinb',
-    'habingtake',
-    'habita&ccedil&atilde;o',
-    'habitaciones',
     'habitantibus',
-    'habitants',
-    'habitat-16',
-    'habitat-mothercare',
-    'habitat-mothercare-bhs',
-    'habitat-style',
-    'habitative',
-    'habitis',
-    'habitof',
-    'habitu&eacute;es',
-    'habitual/made-strange',
-    'habitual/usual',
-    'habitualized',
-    'habituall',
-    'habitues',
-    'habituses',
     'habiyakare',
-    'habla',
-    'hablas',
-    'hablo',
-    'habonim',
-    'habr&omacr;nichos',
-    'habronichos',
-    'habsburg&mdash;valois',
-    'habsburg-led',
-    'habsburg-lothringen',
-    'habsburg-ottoman',
-    'habt',
-    'haca',
-    'hacconby',
-    'haccp',
-    'hacendados',
     'hacer',
-    'hacettepe',
-    'hacha',
-    'hache',
-    'hachemi',
-    'hacheston',
-    'hachioji',
-    'hachured',
-    'hacidena',
-    'hacienda-friendly',
-    'hack-\'em-up',
-    'hack-produced',
-    'hack-written',
-    'hackbrett',
-    'hackbuts',
-    'hackbutters',
     'hackdom',
-    'hacked-about',
-    'hacked-off',
-    'hacked-out',
-    'hacked_out',
-    'hackens',
-    'hackergill',
-    'hackert',
-    'hackery',
-    'hackit',
-    'hackle',
-    'hackle-raising',
-    'hackleton',
-    'hackley',
-    'hackman/national',
-    'hackney-based',
     'hackney-born',
-    'hackney-islington-lambeth',
-    'hackney/general',
-    'hackneys',
-    'hackouts',
-    'hacksawed',
-    'hackt',
-    'hackthorn',
-    'hackwork',
-    'hacl',
-    'hacucho',
-    'had&zcaron;i-prodan',
-    'had-all',
-    'had-been',
-    'had-done',
-    'had-felt',
     'had-it-off',
-    'had-longer',
-    'had-married',
-    'had-no',
-    'had-working',
-    'had.anticipated',
-    'had/had',
-    'had/would',
-    'had_a_good',
-    'had_at',
-    'had_each',
-    'had_less',
-    'hada',
-    'hadad',
-    'hadamard',
-    'hadas',
     'hadashot',
-    'hadassah',
-    'haddaaj',
-    'haddaoui',
-    'haddaway',
-    'hadding',
-    'haddingtonshire',
-    'haddiscoe',
-    'haddlesey',
-    'haddock/stonemason',
-    'haddon/charlbury',
-    'haddonstone',
-    'haddows',
-    'hadebe',
-    'hadejia',
-    'hadengue',
     'hader',
-    'hadfelds',
-    'hadfield-manchester',
-    'hadgone',
-    'hadgraft',
-    'hadhams',
-    'hadhlamaut',
-    'hadhmaill',
-    'hadhramis',
-    'hadid',
-    'hading',
-    'hadington',
-    'hadj-slimane',
-    'hadjera',
-    'hadji',
-    'hadjibajric',
     'hadjigakis',
-    'hadjiloucas',
-    'hadjimatheou',
-    'hadjimichalis',
-    'hadjipaterases',
-    'hadjouannou',
-    'hadklu',
-    'hadlees',
-    'hadley/julian',
-    'hadlich',
-    'hadmaill',
-    'hadman',
-    'hadmire',
-    'hadn\'t.',
-    'hadna',
-    'hadnall',
     'hadno',
-    'hadnot',
-    'hadon',
-    'hadramat',
-    'hadrat',
-    'hadrianic&rehy;antonine',
-    'hadrians',
-    'hadright',
-    'hadrosaur',
-    'hadsignificantly',
-    'hadstock',
-    'hadston',
-    'hadvance',
-    'hadyn',
-    'hadzibegic',
-    'hadzibejic',
     'hadzinikolaou',
-    'hadziomerovic',
-    'haecceitas',
-    'haeck',
-    'haecker',
-    'haedrich',
-    'haehl',
-    'haeim',
-    'haekkerup',
-    'haem-binding',
-    'haema-dementia',
-    'haemacell',
-    'haemacytometer',
-    'haemal',
-    'haemanthus',
-    'haemastix',
     'haemastoma',
-    'haematemesis/or',
-    'haematinics',
-    'haematite/magnetite',
-    'haematite/siderite',
-    'haematites',
-    'haematobium',
-    'haematochylous',
-    'haematogenous',
-    'haematologist-hiv-coordinator',
-    'haematomata',
-    'haematopathological',
-    'haematophagic',
-    'haematopodidae',
-    'haematorcrit',
-    'haematospermia',
     'haematoxylin-eosin-safran',
-    'haematoxyline',
-    'haematoxyling',
-    'haematozoa',
-    'haemek',
-    'haemerythrin',
-    'haemic',
-    'haemig',
-    'haemmorhage',
-    'haemo',
-    'haemo-cheese',
-    'haemobilia',
-    'haemoblobin',
-    'haemocoele',
-    'haemocompatible',
-    'haemoconcentration',
     'haemoglobin\'',
-    'haemoglobin-carrying',
-    'haemoglobin-measuring',
-    'haemoglobin-plus',
-    'haemoglobin/creatinine',
-    'haemoglobion',
-    'haemolymph',
-    'haemolysin',
-    'haemolytic-uraemic',
-    'haemophagocytic',
-    'haemophilias',
-    'haemophilius',
-    'haemopoetic',
-    'haemorraging',
-    'haemorrhageic',
-    'haemorrhoidal',
     'haemosiderosis',
-    'haemosorption',
-    'haemostamen',
-    'haemothorax',
-    'haemotoxins',
-    'haena',
-    'haeney',
-    'haenlein',
-    'haenmastoma',
-    'haenzel',
-    'haeredes',
-    'haerem',
-    'haereses',
-    'haering',
-    'haerteliana',
-    'haes',
     'haesje',
-    'haessler',
-    'haev',
-    'hafar',
-    'hafaz',
-    'hafe',
-    'hafed',
-    'hafetz',
-    'haffen',
-    'haffenden',
-    'hafif',
-    'hafina',
-    'hafis',
-    'hafizlaw',
-    'hafizzollah',
-    'hafkin',
     'hafler',
-    'haflin',
-    'haflinger',
-    'hafnarfj&ouml;dur',
-    'hafner-devised',
-    'hafodgynfawr',
-    'hafr',
-    'hafto',
-    'hafton',
-    'haftorah',
-    'haftorot',
-    'haftvad',
-    'hag&rehy;ridden',
-    'hag-faced',
-    'hag-fish',
-    'hag-rides',
     'hag.',
-    'haganah',
-    'hagara',
-    'hagbourne',
-    'hagbourne/oxfordshire',
-    'hagdahl',
-    'hagdom',
-    'hagee',
-    'hagege',
-    'hageman',
-    'hagen-william',
-    'hagenaars',
-    'hagenia',
-    'hageray',
-    'hagere',
-    'hagersville',
     'hagerty',
-    'hagfish-like',
-    'haggadahs',
-    'haggadot',
-    'haggage',
-    'haggard-jelkes',
-    'haggard-looking',
-    'haggardly',
-    'haggart',
-    'haggarty',
-    'haggas',
-    'haggen',
-    'haggerleases',
-    'haggers',
-    'haggerty/dumbarton',
-    'haggin',
     'haggith',
-    'haggitt',
-    'hagglund',
-    'haggrieg',
-    'hagioi',
-    'hagioscope',
-    'hagitt',
-    'haglike',
-    'hagood',
-    'hagopian',
-    'hagrig',
-    'hagstom',
-    'hagstroms',
-    'hagt',
-    'hagte',
-    'hague/',
     'hah-hah',
-    'hah-ing',
-    'hah-up',
-    'hahaha.',
-    'hahahahahaaha',
-    'hahahahahahahaah',
-    'hahahahahahahaha',
-    'hahahahahahahahaaaaa',
-    'hahahahahahahahahahahahaha',
-    'hahahahahahahahahahahahahaha',
-    'hahahahahahahahahahahahahehehehehehehehehehehehehahahahahahahah',
-    'hahahhahah',
-    'hahainetsu',
-    'haham',
-    'hahas',
-    'hahhh',
     'hahhhh',
-    'hahnel',
-    'hahnemanns',
-    'hahtelekin',
-    'haibach',
-    'haibel',
-    'haifa1',
-    'haifa72-5166',
-    'haifa734',
-    'haig-haddow',
-    'haig.',
-    'haighway',
-    'haigs',
-    'haihe',
-    'haikett',
-    'haikings',
     'haikou',
-    'hail-and-ride',
-    'hail-storm',
-    'hail-type',
-    'hailebury',
-    'hailey-hailey',
-    'haileyburian',
-    'hailie',
-    'hailland',
-    'haille',
-    'hailp',
-    'hailsham/former',
-    'hailsowen',
-    'hailwood-liverpool',
-    'haiman',
-    'haimbe',
     'haimer',
-    'haimeric',
-    'haimes',
-    'haimson',
-    'haine/mother',
-    'haines-young',
-    'hainfeld',
-    'hainin',
-    'hainout',
-    'hainton',
-    'hair&rehy;pulling',
-    'hair\'',
-    'hair++',
-    'hair-',
-    'hair-bands',
-    'hair-brushes',
     'hair-carding',
-    'hair-clips',
-    'hair-cloth',
-    'hair-coarsened',
-    'hair-coated',
-    'hair-combs',
-    'hair-cord',
-    'hair-cream',
-    'hair-curlers',
-    'hair-cutted',
-    'hair-destroyer',
-    'hair-dotted',
-    'hair-dresser',
-    'hair-dressing',
-    'hair-dyeing',
-    'hair-enhancement',
     'hair-fine',
-    'hair-form',
-    'hair-fringes',
-    'hair-grips',
-    'hair-grooming',
-    'hair-havin\'',
-    'hair-lip',
-    'hair-lips',
-    'hair-lotions',
-    'hair-ornaments',
-    'hair-piece',
-    'hair-pieces',
-    'hair-pin',
-    'hair-plates',
-    'hair-raiser',
-    'hair-repair',
     'hair-restorer',
-    'hair-ribbon',
-    'hair-roots',
-    'hair-shaker',
-    'hair-shirt',
-    'hair-shirted',
-    'hair-slides',
-    'hair-splitters',
-    'hair-spray',
-    'hair-strewn',
-    'hair-stroking',
-    'hair-styling',
-    'hair-stylist',
-    'hair-tearer',
-    'hair-tearing',
-    'hair-tidy',
     'hair-tidying',
-    'hair-tipped',
-    'hair-weaves',
-    'hair-what',
-    'hair/',
-    'hair/making',
-    'hairaisers',
-    'hairbraiding',
-    'hairbrain',
-    'hairbrained',
-    'hairclip',
-    'haird',
-    'hairdre',
-    'hairdresser/poet',
-    'haire-sargeant',
-    'hairflair/a',
     'hairflair/babyliss',
-    'hairflair/clothes',
-    'hairflair/fresh',
-    'hairflair/hot',
-    'hairflair/macleans',
-    'hairflair/movie',
-    'hairflair/poly',
-    'hairflair/quickies',
-    'hairflair/rose',
-    'hairflair/supersoft',
-    'hairi',
-    'hairing',
-    'hairlessness',
-    'hairling',
-    'hairn',
-    'hairpin-shaped',
     'hairpit',
-    'hairshaft',
-    'hairsmell',
-    'hairsplitting',
-    'hairspring',
-    'hairst',
-    'hairstyler',
-    'hairstylers',
-    'hairstylists',
-    'hairsuits',
-    'hairv',
-    'hairway',
-    'hairworks',
-    'hairy-backed',
-    'hairy-faced',
-    'hairy-footed',
     'hairy-legged',
-    'hairy-leggedly',
-    'hairy-scary',
-    'hairy-toed',
-    'hairytale',
-    'haisthorpe',
-    'hait',
-    'haitfield',
-    'haitinck',
-    'haito',
-    'hajadi',
-    'hajadi-solomon',
-    'hajarden',
-    'hajducki',
-    'hajek',
-    'hajij',
     'hajjis',
-    'hajrullah',
-    'hajtos',
-    'hak-is',
-    'hakagawa',
-    'hakagawa-like',
-    'hakama',
-    'hakaridek',
-    'hakata',
-    'hakazawa.',
-    'hakea',
-    'hakeim',
-    'haken',
-    'hakenkreuz',
-    'hakhurk',
-    'haki',
     'hakija',
-    'hakikar',
-    'haking',
-    'hakka',
-    'hakkert',
-    'hakmana',
-    'hakonechloa',
-    'hakuna',
-    'hakweed',
-    'hal&aacute;nk&uring',
-    'hal&eacute;n',
-    'hal-marut',
-    'hal/3f',
-    'halaby',
-    'halaicu',
-    'halaman',
     'haland',
-    'halas',
-    'halata',
-    'halaucest',
-    'halbarad',
-    'halber&rehy;ton',
-    'halberg',
-    'halberstaedter-prowazek',
-    'halbish',
-    'halbisiana',
-    'halbouty',
-    'halbury',
-    'halcon',
-    'halcones',
-    'halcro',
-    'halcrows',
     'halcyons',
-    'halda',
-    'haldane-priestley',
-    'haldane-priestly',
-    'haldanean',
-    'haldanian',
-    'haldwani',
-    'hale-wood',
-    'hale/cheesemaker',
-    'hale/nurse',
-    'hale/thames',
-    'haleakala',
-    'halecombe',
-    'halefoglu',
-    'halepensis',
-    'halers',
     'hales/organiser',
-    'halesome',
-    'haleson',
-    'halevi',
-    'half&mdash;on',
-    'half&ndash;nay',
-    'half&rehy;an-hour',
-    'half&rehy;assimilation',
-    'half&rehy;believed',
-    'half&rehy;believing',
-    'half&rehy;century',
-    'half&rehy;closed',
-    'half&rehy;closing',
-    'half&rehy;decomposed',
-    'half&rehy;dropped',
-    'half&rehy;drowned',
     'half&rehy;educated',
-    'half&rehy;empty',
-    'half&rehy;exposed',
-    'half&rehy;full',
-    'half&rehy;glasses',
-    'half&rehy;hidden',
-    'half&rehy;intrigued',
-    'half&rehy;jokingly',
-    'half&rehy;listening',
-    'half&rehy;made',
-    'half&rehy;marathon',
-    'half&rehy;millennium',
-    'half&rehy;naked',
-    'half&rehy;page',
-    'half&rehy;promises',
-    'half&rehy;read',
     'half&rehy;seen',
-    'half&rehy;siblings',
-    'half&rehy;silenced',
-    'half&rehy;size',
-    'half&rehy;smoked',
-    'half&rehy;starved',
-    'half&rehy;sudanese',
-    'half&rehy;thousand',
-    'half&rehy;volley',
-    'half&rehy;way',
-    'half\'un',
-    'half(s)',
-    'half-a-',
-    'half-a-billion-dollar',
-    'half-a-bitter',
-    'half-a-brick',
     'half-a-cent',
-    'half-a-circuit',
-    'half-a-cup',
-    'half-a-day',
-    'half-a-dozen-of-the-other',
-    'half-a-man',
-    'half-a-persons',
-    'half-a-poster',
-    'half-a-pound',
-    'half-a-repeat',
-    'half-a-second',
-    'half-a-sixpence',
-    'half-a-thumb\'s-length',
-    'half-a-ton',
-    'half-a-winter',
-    'half-a-world',
     'half-abstracted',
-    'half-accepted',
-    'half-achieved',
-    'half-actorish',
-    'half-admired',
-    'half-admission',
-    'half-adozen',
-    'half-adult',
-    'half-african',
-    'half-aggressively',
-    'half-agonised',
-    'half-agricultural',
-    'half-alert',
-    'half-alternate',
-    'half-american',
-    'half-an-elephant',
     'half-analytical',
-    'half-anglicized',
-    'half-anniversary',
-    'half-answered',
-    'half-anticipation',
-    'half-apes',
-    'half-apologetically',
-    'half-apologising',
-    'half-apprehensive',
-    'half-arabic',
-    'half-arched',
-    'half-aroused',
-    'half-arranged',
-    'half-ascriptions',
-    'half-ashamed',
-    'half-askew',
     'half-assuaged',
-    'half-astonished',
-    'half-attending',
-    'half-attentive',
-    'half-attracted',
-    'half-aunt',
-    'half-aunts',
-    'half-awake.',
-    'half-b-b-bottle',
-    'half-ball',
-    'half-bar.',
-    'half-bared',
-    'half-bars',
-    'half-bastions',
-    'half-beard',
-    'half-beast',
     'half-believe',
-    'half-believer',
-    'half-belonged',
-    'half-belt',
-    'half-belted',
-    'half-best',
-    'half-billion',
-    'half-bitten',
-    'half-blown',
-    'half-board.',
-    'half-bodies',
-    'half-boiled',
-    'half-bolting',
-    'half-bond',
-    'half-boots',
-    'half-born',
     'half-boss',
-    'half-bowing',
-    'half-boys',
-    'half-break',
-    'half-breast',
-    'half-bred',
-    'half-breds',
-    'half-breedfishermen',
-    'half-bridge',
-    'half-brogue',
-    'half-brookside',
-    'half-brother-in-law',
-    'half-bucket',
-    'half-bull',
-    'half-buries',
-    'half-butt',
     'half-ca',
-    'half-cab',
-    'half-cabin',
-    'half-cake',
-    'half-canopies',
-    'half-capacity',
-    'half-carry',
-    'half-carved',
-    'half-catches',
-    'half-certain',
-    'half-channel',
-    'half-chant',
-    'half-chanted',
-    'half-charming',
-    'half-cheyenne',
-    'half-choking',
     'half-circular',
-    'half-civilization',
-    'half-clenched',
-    'half-cloak',
-    'half-clotted',
-    'half-clown',
-    'half-colonels',
-    'half-columns',
-    'half-combed',
-    'half-committed',
-    'half-complement',
-    'half-complete',
-    'half-complete-skeleton',
-    'half-concealing',
-    'half-concorde',
-    'half-concussed',
     'half-confirmations',
-    'half-controlled',
-    'half-cooked',
-    'half-course',
-    'half-cousins',
-    'half-cracked',
-    'half-cranked',
-    'half-crawling',
-    'half-crazy',
-    'half-cream',
-    'half-creatures',
-    'half-credit',
-    'half-crescent',
-    'half-cretan',
-    'half-critically',
-    'half-crouch',
     'half-crouched',
-    'half-crouching',
-    'half-curious',
-    'half-curled-up',
-    'half-curling',
-    'half-curtain',
-    'half-curtains',
-    'half-daft',
-    'half-damp',
-    'half-dance',
-    'half-darkened',
-    'half-dawn',
-    'half-decayed',
-    'half-decomposed',
-    'half-deflated',
-    'half-degree',
     'half-deity',
-    'half-delirious',
-    'half-delivered',
-    'half-demon',
-    'half-denials',
-    'half-despair',
-    'half-did',
-    'half-discharged',
-    'half-disgusted',
-    'half-dismantled',
-    'half-dismembered',
-    'half-disturbed',
-    'half-dived',
-    'half-diving',
-    'half-dog',
-    'half-doll',
     'half-dollar',
-    'half-dosed',
-    'half-doses',
-    'half-dozens',
-    'half-dozing',
-    'half-drafted',
-    'half-drag',
-    'half-dragging',
-    'half-dreaded',
-    'half-dreading',
-    'half-dreamily',
-    'half-dreaming',
-    'half-dreamy',
-    'half-drowsing',
-    'half-dug',
-    'half-dummies',
     'half-eagle',
-    'half-egyptian',
-    'half-eight',
-    'half-elated',
-    'half-ellipse',
-    'half-elliptic',
-    'half-embrace',
-    'half-emptied',
-    'half-encircling',
-    'half-enough',
-    'half-envied',
-    'half-erased',
-    'half-escaped',
-    'half-eskimo',
-    'half-esters',
-    'half-exasperated',
     'half-excepted',
-    'half-exception',
-    'half-exhilaration',
-    'half-existing',
-    'half-expectation',
-    'half-experienced',
-    'half-explained',
-    'half-extended',
-    'half-face',
-    'half-facelift',
-    'half-fact',
-    'half-fantasy',
-    'half-feared',
-    'half-feathered',
-    'half-fictional',
-    'half-filling',
     'half-firkin',
-    'half-fish',
-    'half-fish-half-insect',
-    'half-fish-half-insect-looking',
-    'half-flag',
-    'half-flirtatious',
-    'half-fluttered',
-    'half-focused',
-    'half-focusing',
-    'half-folded',
-    'half-forgetting',
-    'half-forgot-ten',
-    'half-forming',
-    'half-formulated',
-    'half-four',
-    'half-frame',
     'half-frames',
-    'half-free',
-    'half-freezing',
-    'half-fret',
-    'half-frustrated',
-    'half-fulfilled',
-    'half-funded',
-    'half-furled',
-    'half-furnished',
-    'half-gallon',
-    'half-garbled',
-    'half-garrison',
-    'half-gasp',
-    'half-gaze',
-    'half-ghetto',
-    'half-gigabyte',
     'half-glad',
-    'half-glance',
-    'half-glassed',
-    'half-globes',
-    'half-glow',
-    'half-goat',
-    'half-god',
-    'half-grandfather',
-    'half-grapefruit',
-    'half-grass',
-    'half-grassy',
-    'half-gratified',
-    'half-greek',
-    'half-green',
-    'half-greens',
-    'half-ground',
     'half-guessed-at',
-    'half-guilty',
-    'half-guinea',
-    'half-guineas',
-    'half-guttersnipe-half-muezzin',
-    'half-half',
-    'half-hand',
-    'half-hardies',
-    'half-head',
-    'half-healing',
-    'half-hedgehog',
-    'half-heeding',
-    'half-held',
-    'half-hibernate',
-    'half-hid',
-    'half-hipped',
     'half-hit',
-    'half-hitchcock',
-    'half-hitches',
-    'half-hoop',
-    'half-hopeful',
-    'half-hopes',
-    'half-hoping',
-    'half-hopped',
-    'half-houses',
-    'half-housing',
-    'half-hull',
-    'half-humorous',
-    'half-humour',
-    'half-hundred',
-    'half-hundredweight',
-    'half-hungry',
     'half-hunter',
-    'half-hypnotic',
-    'half-hysterical',
-    'half-i',
-    'half-ice',
-    'half-identify',
-    'half-idol',
-    'half-illegible',
-    'half-illicit',
-    'half-illusory',
-    'half-immersed',
-    'half-implies',
-    'half-improvised',
-    'half-in-half',
-    'half-incapacitated',
-    'half-inch-thick',
     'half-inclined',
-    'half-income',
-    'half-indignant',
-    'half-inflated',
-    'half-insane',
-    'half-inspired',
-    'half-intended',
-    'half-invented',
-    'half-ironically',
-    'half-issa',
-    'half-jocularly',
-    'half-jog',
-    'half-jumped',
-    'half-karian',
-    'half-kill',
-    'half-kilo',
     'half-kilogram',
-    'half-king',
-    'half-kislevite',
-    'half-knackered',
-    'half-kneeling',
-    'half-knew',
-    'half-knowable',
-    'half-knowing',
-    'half-knowingly',
-    'half-korean',
-    'half-labels',
-    'half-lace',
-    'half-laden',
-    'half-laid',
-    'half-land',
-    'half-lap',
     'half-laughed',
-    'half-leaning',
-    'half-learnt',
-    'half-left',
-    'half-lengths',
-    'half-les',
-    'half-levelled',
-    'half-lid',
-    'half-lids',
-    'half-lie',
-    'half-life=19',
-    'half-life=2',
-    'half-lifesize',
-    'half-lifting',
-    'half-litre',
-    'half-living',
     'half-loaf',
-    'half-loath',
-    'half-look',
-    'half-looking',
-    'half-loud',
-    'half-lowering',
-    'half-maimed',
-    'half-managed',
-    'half-manned',
-    'half-marching',
-    'half-married',
-    'half-mask',
-    'half-match-fee',
-    'half-matches',
-    'half-matrix',
-    'half-maximum',
     'half-meaning',
-    'half-meanings',
-    'half-melted',
-    'half-memories',
-    'half-memory',
-    'half-methylated',
-    'half-mile-high',
-    'half-mile-long',
-    'half-mill',
-    'half-millennium',
-    'half-millimetre',
-    'half-million-dollar',
-    'half-minded',
-    'half-mistrust',
-    'half-moans',
-    'half-molecules',
     'half-moon-crescent',
-    'half-moral',
-    'half-moribund',
-    'half-mourning',
-    'half-mouth',
-    'half-movement',
-    'half-musty',
-    'half-mutt',
-    'half-muttered',
-    'half-mythical',
-    'half-nail',
-    'half-negro',
-    'half-niece',
-    'half-nights',
-    'half-nod',
-    'half-nodding',
     'half-not',
-    'half-note',
-    'half-noticed',
-    'half-numbered',
-    'half-obscured',
-    'half-occupied',
-    'half-octave',
-    'half-offered',
-    'half-on',
-    'half-onto',
-    'half-organization',
-    'half-oriental',
-    'half-original',
-    'half-ostlander',
-    'half-ounces',
-    'half-outraged',
     'half-over',
-    'half-overheard',
-    'half-overhearing',
-    'half-owned',
-    'half-owner',
-    'half-paid',
-    'half-panelling',
-    'half-panted',
-    'half-parodic',
-    'half-past-bleedin\'-four',
-    'half-past-eight',
-    'half-past-one',
-    'half-past-six',
-    'half-pasted-up',
-    'half-pasteight',
-    'half-pattern',
     'half-pear-shaped',
-    'half-peeled',
-    'half-pennies',
-    'half-pennyworth',
-    'half-perceived',
-    'half-phantom',
-    'half-phi',
-    'half-philosophical',
-    'half-pictures',
-    'half-pilasters',
-    'half-pillars',
-    'half-pinhead',
-    'half-pitch',
-    'half-pitched',
-    'half-pitying',
-    'half-pivot',
     'half-plate',
-    'half-played',
-    'half-pleading',
-    'half-pleasurable',
-    'half-plucked',
-    'half-poet',
-    'half-poisoned',
-    'half-pot',
-    'half-pots',
-    'half-pounds',
-    'half-prepared',
-    'half-presentable',
-    'half-pretending',
-    'half-priced',
-    'half-priest',
-    'half-priestly',
     'half-private',
-    'half-promises',
-    'half-propped',
-    'half-protest',
-    'half-proud',
-    'half-pulling',
-    'half-pushed',
-    'half-quartern',
-    'half-question',
-    'half-quizzical',
-    'half-raising',
-    'half-rape',
-    'half-rated',
-    'half-reactions',
-    'half-ready',
-    'half-real',
     'half-realises',
-    'half-realized',
-    'half-rear',
-    'half-recalled',
-    'half-reclining',
-    'half-recognisable',
-    'half-recognised',
-    'half-recognized',
-    'half-recruit',
-    'half-refuelled',
-    'half-regretted',
-    'half-released',
-    'half-reliable',
-    'half-relief',
-    'half-relieved',
-    'half-reluctant',
     'half-replying',
-    'half-reproachfully',
-    'half-repulsed',
-    'half-resentful',
-    'half-resentfully',
-    'half-resolved',
-    'half-respectable',
-    'half-respected',
-    'half-restored',
-    'half-revolution',
-    'half-revolve',
-    'half-rhinu',
-    'half-ridden',
-    'half-rings',
-    'half-risen',
-    'half-rising',
     'half-roasted',
-    'half-robot',
-    'half-roll',
-    'half-rolled',
-    'half-roofed',
-    'half-room',
-    'half-rosettes',
-    'half-rotten',
-    'half-roundels',
-    'half-row',
-    'half-rubbed',
-    'half-rubbed-out',
-    'half-ruinous',
-    'half-running',
-    'half-russian',
-    'half-sad',
     'half-saint',
-    'half-saltires',
-    'half-salute',
-    'half-samoan',
-    'half-sang',
-    'half-saw',
-    'half-scholarly',
-    'half-scottish',
-    'half-scrambling',
-    'half-screamed',
-    'half-screwed',
-    'half-secret',
-    'half-seduction',
-    'half-seen-unseen',
-    'half-self',
-    'half-sensed',
     'half-sentence',
-    'half-serpent',
-    'half-set',
-    'half-severed',
-    'half-shaded',
-    'half-shadowed',
-    'half-shamefaced',
-    'half-shaped',
-    'half-shark',
-    'half-sharp',
-    'half-shaven',
-    'half-sheets',
-    'half-shell',
-    'half-shell/and',
-    'half-shocked',
-    'half-shoes',
     'half-shudder',
-    'half-shut-marble-eyed',
-    'half-sideways',
-    'half-sigh',
-    'half-significant',
-    'half-simulated',
-    'half-sister-in-law',
-    'half-sit',
-    'half-size.',
-    'half-sizes',
-    'half-skipping',
-    'half-skull',
-    'half-slave',
-    'half-slavery',
-    'half-sleeps',
-    'half-sleeves',
     'half-sliding',
-    'half-slipped',
-    'half-slumber',
-    'half-slumped',
-    'half-sly',
-    'half-smashed',
-    'half-smile/half-laugh',
-    'half-smudge',
-    'half-snake',
-    'half-snarl',
-    'half-soaked',
-    'half-sober',
-    'half-soft',
-    'half-solid',
-    'half-solved',
-    'half-somersault',
     'half-somersaults',
-    'half-sound',
-    'half-sour',
-    'half-sovereigns',
-    'half-space',
-    'half-spectacles',
-    'half-speech',
-    'half-spent',
-    'half-spilling',
-    'half-spoken',
-    'half-sprawled',
-    'half-stack',
-    'half-stacked',
-    'half-standard',
-    'half-starving',
-    'half-statement',
     'half-stirred',
-    'half-stone',
-    'half-stop',
-    'half-stoppered',
-    'half-strange',
-    'half-strangle',
-    'half-strangled',
-    'half-stratocaster',
-    'half-stuffed',
-    'half-stumbled',
-    'half-subdued',
-    'half-succeeding',
-    'half-success',
-    'half-successful',
-    'half-sunk',
-    'half-sunken',
     'half-supporting',
-    'half-suppressed',
-    'half-surrounded',
-    'half-surviving',
-    'half-suspected',
-    'half-suspended',
-    'half-swallowed',
-    'half-swam',
-    'half-swedish',
-    'half-syllabuses',
-    'half-sympathetic',
-    'half-synod',
-    'half-synods',
-    'half-taken',
-    'half-tapped',
-    'half-tartan',
     'half-taught',
-    'half-tearing',
-    'half-teaspoonful',
-    'half-tempted',
-    'half-tender',
-    'half-thing',
-    'half-thinking',
-    'half-thought',
-    'half-three',
-    'half-throttle',
-    'half-tickets',
-    'half-tiled',
-    'half-timbers',
-    'half-timer',
-    'half-timers',
-    'half-times',
     'half-tipsy',
-    'half-tiresome',
-    'half-told',
-    'half-tolerated',
-    'half-tonner',
-    'half-trot',
-    'half-trotskyite',
-    'half-trusted',
-    'half-tsimshian',
-    'half-tube',
-    'half-tucked',
-    'half-twist',
-    'half-two',
-    'half-unbuckled',
-    'half-unbuttoned',
-    'half-uncial',
     'half-uncles',
-    'half-unconscious',
-    'half-unconsciousness',
-    'half-units',
-    'half-up',
-    'half-vegetable',
-    'half-veil',
-    'half-villages',
-    'half-visible',
-    'half-voices',
-    'half-volunteer',
-    'half-wake',
-    'half-walk',
-    'half-walks-half-carries',
-    'half-wall',
-    'half-warily',
     'half-warning',
-    'half-watched',
-    'half-water',
-    'half-wayline',
-    'half-wedged',
-    'half-welfare',
-    'half-wellingtons',
-    'half-welsh',
-    'half-western',
-    'half-whicker',
-    'half-whore',
-    'half-winding',
-    'half-windows',
-    'half-wintry',
-    'half-wishes',
-    'half-wishing',
     'half-withdrawn',
-    'half-wittingly',
-    'half-worried',
-    'half-wrapped',
-    'half-yard',
-    'half-yardlander',
-    'half-yardlands',
-    'half-yawn',
-    'half-young-woman',
-    'half-zip',
-    'half.century',
-    'half.day',
-    'half.hard',
-    'half.liz',
-    'half.stepping',
-    'half.the',
     'half/one',
-    'halfasleep',
-    'halfbelieve',
-    'halfbreds',
-    'halfcaste',
-    'halfchances',
-    'halfdozen',
-    'halfed',
-    'halfehead',
-    'halfexpected',
-    'halffull',
-    'halfhand',
-    'halfheartedness',
-    'halfie',
-    'halfinvented',
-    'halflives',
     'halflong',
-    'halfmarathon',
-    'halfmooncrescent',
-    'halfoes',
-    'halfofa',
-    'halfpan',
-    'halfpence\'',
-    'halfpennys',
-    'halfpipes',
-    'halfpound',
-    'halfprepared',
-    'halfstar',
-    'halfterm',
-    'halftoning',
-    'halftruth',
-    'halftruths',
     'halfway-decent',
-    'halfways',
-    'halfways-intelligent',
-    'halfwidth',
-    'halfy',
-    'halfyear',
-    'halhill',
-    'halhoul',
-    'hali',
-    'haliae&euml;tus',
-    'haliam',
-    'halibin',
-    'halicarnassos',
-    'haliden',
-    'halidom',
-    'halieis',
     'halieus',
-    'halieutica',
-    'halieuticks',
-    'halifa',
-    'halife',
-    'halifirien',
-    'halimeter',
-    'halimifolium',
-    'halimione',
-    'haliotis',
-    'halit',
-    'halitosis-causing',
-    'halitotic',
-    'halkci',
-    'halkebi',
-    'halken',
     'halkins',
-    'halkola',
-    'halkon',
-    'hall&eacute/barbirolli',
-    'hall&eacute/pye',
-    'hall&rehy;patch',
-    'hall\'',
-    'hall-based',
-    'hall-chamber',
-    'hall-corridors',
-    'hall-floor',
-    'hall-house',
-    'hall-jones/conservators',
-    'hall-keep',
-    'hall-landing',
-    'hall-lessness',
     'hall-of-famer',
-    'hall-of-mirrors',
-    'hall-piece',
-    'hall-stool',
-    'hall-style',
-    'hall/acupuncturist',
-    'hall/ash',
-    'hall/blue',
-    'hall/deputy',
-    'hall/eyewitness',
-    'hall/gun',
-    'hall/hair-flair',
-    'hall/hangar',
-    'hall/hereford',
-    'hall/manager',
-    'hall/meeting',
     'hall/ministry',
-    'hall/oxford',
-    'hall/pub',
-    'hall/rambler',
-    'hall/reporting',
-    'hall/richard',
-    'hall/uk',
-    'hall/vegetarian',
-    'halladale',
-    'halladay',
-    'hallagather',
-    'hallager',
-    'hallaig',
-    'hallalhotsoot',
-    'hallam&lsqb;00&rsqb',
-    'hallaway',
     'hallberg',
-    'hallbut',
-    'hallcrest',
-    'halldoor',
-    'halle/barbirolli',
-    'halleck',
-    'hallenkirche',
-    'hallertau',
-    'hallesque',
-    'hallesthai',
-    'hallett/course',
-    'halleujah',
-    'halleys',
-    'hallgrimskirka',
-    'hallhouse',
-    'halliana',
     'halliard',
-    'halliards',
-    'halliday/car',
-    'halliday/protestor',
-    'hallidayan-style',
-    'hallidie',
-    'hallifax',
-    'hallikeld',
-    'hallim',
-    'hallingas',
-    'hallingdal',
-    'hallis',
-    'hallity',
-    'hallo-ed',
-    'hallorans',
-    'hallos',
     'hallow-fair',
-    'hallowbury',
-    'hallowed-out',
-    'halloweening',
-    'hallows-on-the-wall',
-    'hallpike',
-    'hallrooms',
-    'halls-run',
-    'hallside',
-    'hallstrom',
-    'halltourism',
-    'hallucination\'',
-    'hallucination.',
-    'hallucinations.the',
-    'hallucinogens.',
-    'hallvard',
     'hallwood',
-    'hallyday',
-    'hallynge',
-    'hallynges',
-    'halmahera',
-    'halmatite',
-    'halmo',
-    'halmos',
-    'halnaby',
-    'halnon',
-    'halo-bea',
-    'halo-pool',
-    'halo-spots',
-    'halo.',
-    'halobacteria',
-    'halogena',
     'halogenic',
-    'haloid',
-    'halons-1211',
-    'halophosphate',
-    'halophryn',
-    'halophytic',
-    'halorrhagidaceae',
-    'halova',
-    'halow',
-    'halozyfop',
-    'halp',
-    'halpen',
-    'halperin',
-    'halpert',
-    'halsall/assistant',
-    'halsband',
     'halser',
-    'halsetown',
-    'halsetown-vorvas',
-    'halske',
-    'halsmann',
-    'halsor',
-    'halspach',
-    'halstead-based',
-    'halsteads',
-    'halstensen',
-    'halsway',
-    'halswell',
-    'halswelle',
-    'halt.joseph',
-    'haltbar',
-    'haltenbanken',
     'halter-broke',
-    'halter-top',
-    'halter-tops',
-    'halticinae',
-    'halting-place',
-    'halton/buckinghamshire',
-    'halton/chief',
-    'haluk',
-    'halusi',
-    'haluva',
-    'halva',
-    'halvard/scand.',
-    'halverd',
-    'halvin',
-    'halwachi',
-    'halwachs',
     'halward',
-    'halways',
-    'halyday',
-    'halyness',
-    'halysites',
-    'ham-',
-    'ham-actor',
-    'ham-and-salad',
-    'ham-bone',
-    'ham-fistedness',
-    'ham-fists',
-    'ham-footed',
-    'ham-hands',
-    'ham-hocks',
-    'ham-hung',
-    'ham-operated',
     'ham/liverpool/scum',
-    'ham1',
-    'ham4',
-    'hama-dryad',
-    'hamaguchi',
-    'hamahamet',
-    'hamal',
-    'hamalayas',
-    'hamamatsu',
-    'hamand',
-    'hamarat',
-    'hamari',
-    'hamarlant',
-    'hamas-backed',
-    'hamatos',
-    'hamatsu',
     'hamatum',
-    'hamayadji',
-    'hambach',
-    'hambayi',
-    'hambisa',
-    'hamble-le-rice',
-    'hamborn',
-    'hamborough',
-    'hambourg',
-    'hambraeus',
-    'hambraugh',
-    'hambre',
-    'hambrey',
-    'hambrose',
-    'hambstrg',
-    'hamburg-america',
     'hamburg-based',
-    'hamburg-born',
-    'hamburg-munich',
-    'hamburger-flipper',
-    'hamburger-flipping',
-    'hamburger-shaped',
-    'hamburglar',
-    'hamby',
-    'hamda',
-    'hamdani',
-    'hamdard',
-    'hamdija',
-    'hamdilallah',
-    'hamdoon',
-    'hamdoun',
-    'hamdu',
     'hamed(1987)',
-    'hamedan',
-    'hameenlinan',
-    'hameh',
-    'hameknitted',
-    'hameldon',
-    'hamelyn',
-    'hamer-adopted',
-    'hamer/living',
-    'hamermesh',
-    'hamet',
-    'hameward',
-    'hamey',
-    'hamfistedly',
-    'hamford',
-    'hamgyong',
     'hami',
-    'hamida',
-    'hamidi',
-    'hamidou',
-    'hamiet',
-    'hamil',
-    'hamilford',
-    'hamilton-edwards',
-    'hamilton-gibbs',
-    'hamilton-gordon',
-    'hamilton-parsons',
-    'hamilton-russell',
-    'hamilton/dorgam',
-    'hamilton/penguin',
-    'hamiltonhill',
-    'hamiltoni',
     'hamiltonsbawn',
-    'hamiltonsis',
-    'hamim',
-    'hamirostra',
-    'hamisch',
-    'hamish-hamilton',
-    'hamishawari',
-    'hamites',
-    'hamiton',
-    'hamlet-like',
-    'hamletish',
-    'hamlike',
-    'hamlin/moseley',
-    'hamlisch',
-    'hamlyn-wright',
-    'hammack',
     'hammada',
-    'hammadiinformation',
-    'hammadiprime',
-    'hammamat',
-    'hammarbys',
-    'hammarskj&oslash;ld',
-    'hammarskj&ouml;ld',
-    'hammarsten',
-    'hammarstr&ocirc;m',
-    'hammarstrom',
-    'hammelis',
-    'hammell',
-    'hammer-and-anvil',
-    'hammer-and-saw',
-    'hammer-and-sickle',
-    'hammer-and-tongs',
     'hammer-beat',
-    'hammer-blows',
-    'hammer-ended',
-    'hammer-footed',
-    'hammer-hammer-hammer',
-    'hammer-he',
-    'hammer-headed',
-    'hammer-in',
-    'hammer-man',
-    'hammer-on/pull',
-    'hammer-on/pull-offs',
-    'hammer-pond',
-    'hammer-ponds',
-    'hammer-the-dispatch-box-major',
-    'hammer-throw',
-    'hammer-throwers',
     'hammer-timbered',
-    'hammer/eagles',
-    'hammerbeam',
-    'hammerblow',
-    'hammerclavier',
-    'hammered-on',
-    'hammered-out',
-    'hammering-on',
-    'hammering.the',
-    'hammerlock',
-    'hammermate',
-    'hammerskins',
-    'hammerskjold',
-    'hammerslough',
-    'hammersly',
-    'hammersmith-richmond',
     'hammerston',
-    'hammet',
-    'hammetschwand',
-    'hammick',
-    'hammid',
-    'hammie',
-    'hammier',
-    'hammily',
-    'hamminkeln',
-    'hammling',
-    'hammmers',
-    'hammmersmith',
-    'hammnet',
-    'hammock-breasted',
-    'hammock-nests',
-    'hammond-trained',
     'hammond/automotive',
-    'hammond/goalkeeper',
-    'hammondest',
-    'hammons-should',
-    'hammou',
-    'hammouda',
-    'hammudah',
-    'hamnish',
-    'hamnish/herefordshire',
-    'hamorrhage',
-    'hamoudah',
-    'hampas',
-    'hampden/buckinghamshire',
-    'hampden/oxfordshire',
-    'hampen',
-    'hampi',
     'hampikian',
-    'hamps',
-    'hampshire&rehy;based',
-    'hampshire-born',
-    'hampstead-in-the-city',
-    'hampstead-ish',
-    'hampton&mdash',
-    'hampton/leukaemia',
-    'hamptonshire',
-    'hamra',
-    'hamruer',
-    'hamsey',
-    'hamshire',
-    'hamslow',
-    'hamsphire',
-    'hamspon',
     'hamstation-1020',
-    'hamstation-1030',
-    'hamstation-1041',
-    'hamsted',
-    'hamstreet',
-    'hamstring-victim',
-    'hamstringing',
-    'hamsun',
-    'hamswell',
-    'hamtramck',
-    'hamtun',
-    'hamudava',
-    'hamulate',
-    'hamuli',
-    'hamunyela',
-    'hamworthy',
     'han-gook',
-    'han-overian',
-    'han-shan',
-    'han-yong',
-    'hanadib',
-    'hanae',
-    'hanalei',
-    'hananiah',
-    'hanape',
-    'hanapers',
-    'hanauer',
-    'hanavan',
-    'hanberry',
-    'hanbin',
-    'hanborough/oxfordshire',
-    'hanbrook/printer',
     'hanbury-erskine',
-    'hanc',
-    'hancher',
-    'hancock-beaulieu',
-    'hancock/peter',
-    'hancockian',
-    'hancocks',
-    'hancox-trained',
-    'hand&mdash;in&mdash;hand',
-    'hand&mdash;let',
-    'hand&rehy;colouring',
-    'hand&rehy;crafted',
-    'hand&rehy;cuffs',
-    'hand&rehy;me-downs',
-    'hand&rehy;modelling',
-    'hand&rehy;selected',
     'hand&rehy;shake',
-    'hand\'t',
-    'hand-and-arm',
-    'hand-and-foot',
-    'hand-applied',
-    'hand-appliqu&eacute;d',
-    'hand-assemble',
-    'hand-axe',
-    'hand-baggage',
-    'hand-bagging',
-    'hand-barrows',
-    'hand-basket',
-    'hand-bearing',
-    'hand-beaten',
-    'hand-bendable',
-    'hand-bills',
     'hand-bites',
-    'hand-bolted',
-    'hand-broom',
-    'hand-candlestick',
-    'hand-caned',
-    'hand-canter',
-    'hand-cases',
-    'hand-chalked',
-    'hand-checked',
-    'hand-churned',
-    'hand-clapped',
-    'hand-clasp',
-    'hand-clasping',
-    'hand-coated',
-    'hand-coded',
-    'hand-coding',
     'hand-colouring',
-    'hand-compass',
-    'hand-composition',
-    'hand-controlled',
-    'hand-coolers',
-    'hand-copied',
-    'hand-cranking',
-    'hand-cuff',
-    'hand-cuffed',
-    'hand-cuts',
-    'hand-cutting',
-    'hand-decorating',
-    'hand-directed',
-    'hand-distributed',
-    'hand-drier',
-    'hand-driers',
     'hand-driven',
-    'hand-drum',
-    'hand-dryer',
-    'hand-drying',
-    'hand-editing',
-    'hand-fast',
-    'hand-filed',
-    'hand-filing',
-    'hand-finish',
-    'hand-finishing',
-    'hand-fired',
-    'hand-fit',
-    'hand-flapping',
-    'hand-flash',
-    'hand-flown',
-    'hand-flying',
     'hand-gallop',
-    'hand-glazed',
-    'hand-grenades',
-    'hand-grips',
-    'hand-guard',
-    'hand-hammered',
-    'hand-harvested',
-    'hand-holds',
-    'hand-in-front',
-    'hand-in-pocket',
-    'hand-in-the-till',
-    'hand-job',
-    'hand-knits',
-    'hand-knitter',
-    'hand-labelling',
-    'hand-lace-making',
     'hand-laid',
-    'hand-lamp',
-    'hand-lantern',
-    'hand-launched',
-    'hand-lifted',
-    'hand-like',
-    'hand-looms',
-    'hand-magnifier',
-    'hand-maid',
-    'hand-maid-cum-companion',
-    'hand-maids',
-    'hand-maimed',
-    'hand-massage',
-    'hand-methods',
-    'hand-microphones',
-    'hand-milked',
     'hand-mill',
-    'hand-mirrors',
-    'hand-mitts',
-    'hand-mixed',
-    'hand-mouth',
-    'hand-mower',
-    'hand-numbered',
-    'hand-of-death',
-    'hand-of-god',
-    'hand-on',
-    'hand-on-knee',
-    'hand-out/worksheet',
-    'hand-paddle',
-    'hand-pads',
-    'hand-painting',
-    'hand-parsed',
     'hand-pattings',
-    'hand-penned',
-    'hand-picking',
-    'hand-piped',
-    'hand-placed',
-    'hand-plaited',
-    'hand-plough',
-    'hand-portable',
-    'hand-portable/car-phone',
-    'hand-ported',
-    'hand-postures',
-    'hand-powered',
-    'hand-press',
-    'hand-pressed',
-    'hand-print',
-    'hand-produced',
     'hand-prop',
-    'hand-propelled',
-    'hand-radio',
-    'hand-raised',
-    'hand-rakes',
-    'hand-rear',
-    'hand-relief',
-    'hand-rests',
-    'hand-rewriting',
-    'hand-roll',
-    'hand-rolling',
-    'hand-rope',
-    'hand-rubbed',
-    'hand-saw',
-    'hand-scouring',
-    'hand-scrawl',
     'hand-scrubbed',
-    'hand-sculpted',
-    'hand-search',
-    'hand-select',
-    'hand-shaped',
-    'hand-shunting',
-    'hand-side',
-    'hand-signal',
-    'hand-signalling',
-    'hand-size',
-    'hand-slapping',
-    'hand-sliced',
-    'hand-soldered',
-    'hand-some',
-    'hand-sorted',
-    'hand-spanned',
     'hand-spans',
-    'hand-speed',
-    'hand-spike',
-    'hand-stands',
-    'hand-strike',
-    'hand-strip',
-    'hand-stripped',
-    'hand-tamed',
-    'hand-threshing',
-    'hand-throttle',
-    'hand-tight',
-    'hand-towel',
-    'hand-towels',
-    'hand-transfer',
-    'hand-traverse',
-    'hand-trimmed',
     'hand-truck',
-    'hand-trucks',
-    'hand-typed',
-    'hand-up',
-    'hand-wag',
-    'hand-warmed',
-    'hand-washed',
-    'hand-wheel',
-    'hand-write',
-    'hand-wrote',
-    'hand-wroughtness',
-    'hand/',
-    'hand/eye',
-    'hand/forearm',
-    'hand/reshaped',
-    'hand_in',
     'hand_in_contact',
-    'handaxes',
-    'handbagged',
-    'handbasins',
-    'handbasket',
-    'handbendable',
-    'handbolted',
-    'handbones',
-    'handbook-brief',
-    'handbook/calendar',
-    'handborough',
-    'handbr',
-    'handbreadths',
-    'handbreak',
-    'handchimes',
-    'handciap',
     'handclapping',
-    'handclasps',
-    'handcolouring',
-    'handcrafting',
-    'handcraftmanship',
-    'handcreams',
-    'handcuff-cases',
-    'handcuffery',
-    'handcut',
-    'hande',
-    'handelians',
-    'handell',
-    'handelsbank',
-    'handelsblatt',
-    'handelseksamen',
-    'handelsges',
     'handelskwerkerij',
-    'handelsorganisation',
-    'handelsregister-verzeichnis',
-    'handerkechief',
-    'handershojkolen',
-    'handes',
-    'handesblatt',
-    'handeslh&oslash;yskolen',
-    'handfeeding',
-    'handform',
-    'handful&mdash;now',
-    'handi-capped',
-    'handiap',
-    'handicam',
-    'handicap.',
-    'handicap.7',
     'handicap_up',
-    'handicaper',
-    'handicapped.',
-    'handicapped.mrs',
-    'handicaps.',
-    'handicraft-workers',
-    'handicraftsman',
-    'handicraftswoman',
-    'handidate',
-    'handiest',
-    'handimates',
-    'handin',
-    'handin\'',
-    'handing-out',
-    'handjams',
-    'handjob.',
     'handk&auml;s',
-    'handkammer/managing',
-    'handkerchief-before',
-    'handkerchief-size',
-    'handkerchief.',
-    'handkerchiefpoint',
-    'handkies',
-    'handknit',
-    'handknitted',
-    'handknitting',
-    'handlacing',
-    'handle-bar',
-    'handle-bit',
-    'handle-free',
-    'handle-operated',
-    'handle-shaped',
     'handle-sliding',
-    'handle-width',
-    'handle/gut',
-    'handleable',
-    'handlebar-moustachioed',
-    'handled&rehy;vase',
-    'handled.38',
-    'handleless',
-    'handles/lines',
-    'handles/shafts',
-    'handley-page',
-    'handley-smiths',
-    'handley-taylor',
-    'handlight',
-    'handliners',
-    'handling-others',
     'handling.',
-    'handling/work',
-    'handmake',
-    'handmarbled',
-    'handmill',
-    'handmirror',
-    'handni',
-    'hando',
-    'handou',
-    'handouts/posters',
-    'handover/takeover',
-    'handpick',
-    'handplant',
-    'handportable',
-    'handpulls',
-    'handreared',
     'handrests',
-    'handrill',
-    'handrolling',
-    'handrope',
-    'hands-as',
-    'hands-flat-against-the-roof-of-the-car',
-    'hands-of',
-    'hands-on-hip',
-    'hands-on-hips',
-    'hands-on-plants',
-    'hands-on-regulator-and-shovel',
-    'hands-on-science',
-    'hands.photographs',
-    'hands/',
-    'hands/hotel',
-    'hands/they',
     'handsaker',
-    'handscrew',
-    'handsel',
-    'handsels',
-    'handset.',
-    'handsetting',
-    'handsew',
-    'handsewn',
-    'handshaken',
-    'handshaker',
-    'handshakings',
-    'handshapes',
-    'handslap',
-    'handsom',
-    'handsome-ugly',
-    'handsomely-coiffed',
     'handsomely-tooled',
-    'handsomes',
-    'handson',
-    'handspans',
-    'handspeed',
-    'handsshh',
-    'handsta',
-    'handstitch',
-    'handstitching',
-    'handstrap',
-    'handsturn',
-    'handsworth/soho/lozells',
-    'handt',
-    'handtapper',
-    'handthrown',
-    'handtool',
     'handtools',
-    'handtowels',
-    'handwarmer',
-    'handwashes',
-    'handworkers',
-    'handwound',
-    'handwringing',
-    'handwriting/drawing',
-    'handy-dandy',
-    'handy-helped',
-    'handy-to-get-at',
-    'handy/crime',
-    'handybanks',
-    'handysides',
-    'handywoman',
-    'hane',
     'haneish',
-    'hanfstaengel',
-    'hanful',
-    'hang&rehy;ing',
-    'hang-fire',
-    'hang-glinding',
-    'hang-in',
-    'hang-on-the-wall',
-    'hang-outs',
-    'hangable',
-    'hangabout',
-    'hangadaala',
-    'hangar-crash',
-    'hangar-sized',
-    'hangarette',
-    'hangartner',
     'hangd',
-    'hanger-full',
-    'hangers.',
-    'hanggliding',
-    'hanging\'',
-    'hanging-banana',
-    'hanging-space',
-    'hanging-straps',
-    'hanging.another',
-    'hangingge',
-    'hangings/posters',
-    'hangkow',
-    'hangle',
-    'hanglet',
-    'hangment',
-    'hangook',
     'hangyd',
-    'hangzhou',
-    'hanifa',
-    'hanifeet',
-    'hanifi',
-    'hanifin',
-    'hanim',
-    'hanina',
-    'hanisch',
-    'hanish',
-    'haniya',
-    'haniyeh',
-    'hanjin',
-    'hanked',
-    'hankei',
-    'hankerchiefs',
     'hankerer',
-    'hankerton',
-    'hankham',
-    'hanking',
-    'hankly',
-    'hanks-balanced',
-    'hankshaw',
-    'hanleybased',
-    'hanleys',
-    'hanlost',
-    'hanmare',
-    'hanmer-lloyd',
-    'hanmer/bishop',
-    'hann-byrd',
-    'hannabus',
-    'hannaford-smith',
     'hannaford/horse',
-    'hannah-barbra',
-    'hannah.',
-    'hannah/former',
-    'hannahstown',
-    'hannam/bloxham',
-    'hannam/chipping',
-    'hannam/culham',
-    'hannam/gloucester',
-    'hannam/marsh',
-    'hannam/milton',
-    'hannam/stowe',
-    'hannam/swindon',
-    'hannam/westminster',
-    'hannam/worcester',
-    'hannana',
     'hannant',
-    'hannant/headmaster',
-    'hannawora',
-    'hannebrother',
-    'hanned',
-    'hanneke',
-    'hannelfoot',
-    'hannell',
-    'hannelore',
-    'hanner',
-    'hannett',
-    'hannett-produced',
-    'hanney/oxfordshire',
-    'hanni-bal',
-    'hannibals',
-    'hanningfield',
     'hanno',
-    'hannover-to-london',
-    'hannoverian',
-    'hanomag',
-    'hanoun',
-    'hanoverhill',
-    'hanovers',
-    'hanovia',
-    'hanreck',
-    'hanry',
-    'hans-adam',
-    'hans-eberhard',
-    'hans-gerhard',
-    'hans-heinz',
-    'hans-hubert',
-    'hans-j&ouml;rg',
     'hans-jorg',
-    'hans-jorge',
-    'hans-juergen',
-    'hans-ludwig',
-    'hans-ruedi',
-    'hansa-taube',
-    'hanscomb',
-    'hansemann',
-    'hansen/second',
-    'hansenne',
-    'hansford-miller/historian',
-    'hansgert',
-    'hanshi',
-    'hanshin',
-    'hansil',
-    'hansj&ouml;rg',
     'hansjoachim',
-    'hansley',
-    'hanslow',
-    'hansma',
-    'hanson-lowe',
-    'hanson-style',
-    'hanson/oscar',
-    'hanson/pa',
-    'hansworth',
-    'hantish',
-    'hantle',
-    'hantrais',
-    'hantu',
-    'hantzsch',
-    'hanu&scaron',
-    'hanua',
     'hanukha-christmas',
-    'hanukkah',
-    'hanyang',
-    'hanything',
-    'hanze',
-    'hanzeli',
-    'hanzir',
-    'hanzira',
-    'hanzo',
-    'haobam',
-    'haouaria',
-    'haouas',
-    'hap&rehy;pened',
-    'hap-hazard',
-    'hap-p-p',
-    'haparanda',
     'hape\'orth',
-    'hapen',
-    'hapeslagh',
-    'haphazard-looking',
-    'haphazardness',
-    'hapi',
-    'hapily',
-    'hapke',
-    'hapland',
-    'haploids',
-    'haplotyoe',
-    'haplotype.',
-    'hapoalim',
-    'happart',
-    'happed',
-    'happended',
     'happending',
-    'happends',
-    'happened-yesterday',
-    'happened.anger',
-    'happened.meanwhile',
-    'happenedat',
-    'happeneing',
-    'happenend',
-    'happeneth',
-    'happening_even',
-    'happenings/events/',
-    'happens&mdash;the',
-    'happi',
-    'happi-coated',
-    'happies',
-    'happily-monied',
     'happily-with',
-    'happiness-',
-    'happisburgians',
-    'happoens',
-    'happpened',
-    'happy&rehy;looking',
-    'happy-',
-    'happy-everafter',
-    'happy-families',
-    'happy-go-luckiness',
-    'happy-go-spend',
-    'happy-golucky',
-    'happy-looking',
-    'happy-new-year',
-    'happy-snap',
-    'happy-snapping',
     'happy-with-a-secret',
-    'happy.',
-    'happy.i',
-    'happy.natured',
-    'happy/frivolous',
-    'happy_now',
-    'happyhansel',
-    'happyhol',
-    'haps',
-    'hapsford',
-    'hapsichord',
-    'hapsley',
-    'hapten-binding',
-    'haptens',
-    'haptic',
-    'haptics',
     'haptoglobins',
-    'haptotherapy',
-    'haqa\'iq',
-    'haqagriculture',
-    'haqani',
-    'haque',
-    'har-',
-    'har-r-r-ooo-m-m-f',
-    'har-r-r-r-r-o-o-o-o-m-m-m-f-f-f',
-    'har-r-room-mff',
-    'har-ro',
-    'har-tu',
-    'har.10',
-    'har.21',
-    'hara_kiri',
-    'harahap',
     'harakat-e',
-    'harakat-i-inqilab-i-islam',
-    'haraldo',
-    'haraldschullzi',
-    'haraldseth',
-    'haramboure',
-    'harang',
-    'haranguestress',
-    'harant',
-    'harantova',
-    'harapha',
-    'haraq',
-    'harardera',
-    'harasov',
-    'harassers',
-    'harassment.',
     'harato',
-    'harawanken',
-    'harb',
-    'harbajahn',
-    'harber/sculptor',
-    'harberler',
-    'harbezza',
-    'harbicht',
-    'harbinder',
-    'harboard',
-    'harbod',
-    'harbold/newton',
-    'harbord',
-    'harbord-hammond',
-    'harboring',
-    'harbour-moles',
     'harbour-wall',
-    'harbour-watching',
-    'harbour/thames',
-    'harbourage',
-    'harbourages',
-    'harbourhead',
-    'harbourmasters',
-    'harbourview',
-    'harbutts',
-    'harcas',
-    'harch-a',
-    'harcher',
-    'harcombe/west',
-    'harcostar',
-    'harcoun',
-    'harcross',
     'hard&mdash;forgive',
-    'hard&rehy;done-by',
-    'hard&rehy;headed',
-    'hard&rehy;hitter',
-    'hard&rehy;luck',
-    'hard&rehy;pressed',
-    'hard&rehy;ships',
-    'hard(e)st',
-    'hard+groovey',
-    'hard-act-to-follow',
-    'hard-as-a-board',
-    'hard-as-flint',
-    'hard-beaten',
-    'hard-blown',
-    'hard-blue',
-    'hard-board',
     'hard-bodied',
-    'hard-boiling',
-    'hard-breathing',
-    'hard-but-fair',
-    'hard-cash',
-    'hard-chasing',
-    'hard-chested',
-    'hard-climbing',
-    'hard-coded',
-    'hard-court',
-    'hard-currency-earning',
-    'hard-cuts',
-    'hard-discount',
-    'hard-disk',
-    'hard-disks',
-    'hard-drive',
     'hard-ecu',
-    'hard-filled',
-    'hard-fisted',
-    'hard-fletched',
-    'hard-fought-for',
-    'hard-grafting',
-    'hard-handed',
-    'hard-headedly',
-    'hard-heading',
-    'hard-heartedly',
-    'hard-hewn',
-    'hard-hit&rehy;ting',
-    'hard-knocks',
-    'hard-knotted',
-    'hard-knuckled',
-    'hard-labour',
     'hard-laboured',
-    'hard-learnt',
-    'hard-limbed',
-    'hard-lobbied',
-    'hard-lost',
-    'hard-made',
-    'hard-paved',
-    'hard-playing',
-    'hard-power',
-    'hard-programme',
-    'hard-programmed',
-    'hard-punching',
-    'hard-pushed',
-    'hard-reined',
-    'hard-ridden',
-    'hard-saved',
     'hard-saving',
-    'hard-science',
-    'hard-selling',
-    'hard-sliding',
-    'hard-slog',
-    'hard-smoking',
-    'hard-soled',
-    'hard-stretched',
-    'hard-stuff',
-    'hard-tail',
-    'hard-tailing',
-    'hard-taxing',
-    'hard-thinking',
-    'hard-to-achieve',
-    'hard-to-come-by',
-    'hard-to-defeat',
     'hard-to-get-along-with',
-    'hard-to-judge',
-    'hard-to-please',
-    'hard-to-pronounce',
-    'hard-to-prove',
-    'hard-to-read',
-    'hard-to-replace',
-    'hard-to-reverse',
-    'hard-to-sell',
-    'hard-walled',
-    'hard-winter',
-    'hard-wood',
-    'hard-work',
-    'hard-working/reliable/punctual',
-    'hard-yellow',
-    'hard/applied',
     'hard/close',
-    'hard/pure',
-    'hard/software',
-    'hard/something',
-    'hard=working',
-    'hardach',
-    'hardb-b-broom',
-    'hardb-broom',
-    'hardback.',
-    'hardbaked',
-    'hardball',
-    'hardboarded',
-    'hardboards',
-    'hardcache/esdi',
-    'hardcards',
-    'hardcases',
     'hardcastles',
-    'hardcore-crazy',
-    'hardcore.ram',
-    'hardcore/ragga&rehy;oriented',
-    'hardcore/techno',
-    'hardcovers',
-    'hardd',
-    'hardden',
-    'harddisks',
-    'hardecnudth',
-    'hardeley',
-    'harden-jones',
-    'hardenbeger',
-    'hardenberg',
-    'hardenbergher',
-    'hardened-steel',
     'hardened-up',
-    'hardener/preservatives',
-    'hardeners',
-    'hardening-off',
-    'harder&rehy;headed',
-    'harder&rehy;line',
-    'harder-fired',
-    'harder-hearted',
-    'harder-hitting',
-    'harder-to-realize',
-    'harder_because',
-    'hardest&rehy;pressed',
-    'hardest-boiled',
-    'hardest-hitting',
-    'hardest-to-bear',
-    'hardesty',
     'hardglaze',
-    'hardham',
-    'hardhat',
-    'hardhead',
-    'hardheadedness',
-    'hardhurst',
-    'hardi/gari',
-    'hardies',
-    'harding-newman',
-    'harding/businessman',
-    'harding/clock',
-    'hardington',
-    'hardish',
-    'hardknocks',
-    'hardl',
-    'hardley',
     'hardluck',
-    'hardly-used',
-    'hardman/chairman/swindon',
-    'hardman/professional',
-    'hardman/west',
-    'hardness.',
-    'hardnesses',
-    'hardnose',
-    'hardon',
-    'hardpack',
-    'hardpacked',
-    'hardpool',
-    'hardrada',
-    'hardsell',
-    'hardshaw',
-    'hardship.',
     'hardstaffs',
-    'hardstones',
-    'hardtime',
-    'hardup',
-    'hardware-and',
-    'hardware-considerations',
-    'hardware-dependent',
-    'hardware-development',
-    'hardware-dominated',
-    'hardware-enhanced',
-    'hardware-fault',
-    'hardware-wise',
-    'hardware.',
-    'hardware.based',
-    'hardware/',
-    'hardware/device',
     'hardware/dos/windows',
-    'hardwick/prisoner',
-    'hardwidge',
-    'hardworked',
-    'hardy\'',
-    'hardy-hybrid',
-    'hardy-looking',
-    'hardy-style',
-    'hardy/actor',
-    'hardy/gloucestershire',
-    'hardy/hostel',
-    'hare-coursers',
-    'hare-duke',
-    'hare-hare',
-    'hare-like',
-    'hare-niemeyer',
     'hare-raising',
-    'hare-traps',
-    'hare/jekyll',
-    'hareide',
-    'harel-bey',
-    'harelaw',
-    'harelegging',
-    'harelips',
-    'harell',
-    'harem-master',
-    'harem-shagging',
-    'harem-type',
-    'harem.',
-    'haremeare',
-    'hareng',
-    'harerge',
     'haresfield/gloucestershire',
-    'harewood-grown',
-    'harewoods',
-    'harey',
-    'harff',
-    'hargadon',
-    'hargarave',
-    'hargens',
-    'hargreaves&ndash;robinson',
-    'hargreaves-boothferry',
-    'hargreaves/britag',
-    'hargrim',
-    'harham',
-    'hari-george',
-    'hari-kiri',
-    'haria',
     'harib',
-    'haribul',
-    'harichandra',
-    'haricleia',
-    'harif',
-    'harilal',
-    'harima',
-    'harina',
-    'harings',
-    'harionville',
-    'hariot',
-    'haripoonchai',
-    'harishankher',
-    'harison',
-    'harissa',
-    'harith',
     'haritos-fatouras',
-    'harjinda',
-    'harjinder',
-    'harjit',
-    'harjo',
-    'harkavy',
-    'harkening',
-    'harker/we',
-    'harkhuf',
-    'harki',
-    'harkilees',
-    'harking-back',
-    'harkishanpura',
-    'harklie',
-    'harkus',
-    'harlaching',
     'harlakenden',
-    'harlan-olac',
-    'harlean',
-    'harled',
-    'harlemation',
-    'harlene',
-    'harleon',
-    'harlequin\'',
-    'harlequin-trousered',
-    'harlequin.',
-    'harlequins.',
-    'harlequins15',
-    'harlequins20',
-    'harles',
-    'harlos',
-    'harlot-nymphs',
     'harlotrie',
-    'harlotts',
-    'harlowbury',
-    'harlows',
-    'harlton',
-    'harm-doer',
-    'harmaliyah',
-    'harman/rspca',
-    'harmans',
-    'harmby',
-    'harmed.',
-    'harmelekopf',
-    'harmer/national',
-    'harmes',
-    'harmful.',
-    'harminder',
     'harmire',
-    'harmison',
-    'harmlessly-named',
-    'harmoglobin',
-    'harmohan',
-    'harmoko',
-    'harmon-martin',
-    'harmoni',
-    'harmonic-generation',
-    'harmonic/rhythmic',
-    'harmonica-playing',
-    'harmonically-conceived',
-    'harmonices',
-    'harmonicon',
-    'harmonicus',
-    'harmoniis',
     'harmoniousness',
-    'harmonisers',
-    'harmony.',
-    'harmonys',
-    'harmosts',
-    'harmoumou',
-    'harmscara',
-    'harmsworths',
-    'harmut',
-    'harnasie',
-    'harnby',
-    'harneses',
-    'harness-break',
-    'harness-makers',
-    'harness-work',
-    'harnessable',
     'harold-bond',
-    'harold-like',
-    'harold/environmental',
-    'haroldsway',
-    'haroldswick',
-    'harouma',
-    'harouna',
-    'haroutiounian',
-    'harovn&iacute;k',
-    'harp-harmonics',
-    'harp-like',
-    'harp-shaped',
-    'harpagodes',
-    'harpagophytum',
-    'harpalos',
-    'harpaque',
     'harpay',
-    'harpe',
-    'harpeden',
-    'harpeneden',
-    'harper-bill',
-    'harper/consultant',
-    'harper/father',
-    'harper/mother',
-    'harperig',
-    'harperland',
-    'harperperennial',
-    'harpi',
-    'harpignies',
-    'harpiness',
-    'harpley/worcestershire',
-    'harpoon-shaped',
     'harpooning',
-    'harpoonings',
-    'harpreet',
-    'harpstring',
-    'harpton',
-    'harptree',
-    'harpullia',
-    'harpur-crewe',
-    'harpy-like',
-    'harpy1',
-    'harquebuses',
-    'harquebusier',
-    'harrachor',
-    'harradine',
-    'harragan',
-    'harragin',
     'harragon',
-    'harrassing',
-    'harraughty',
-    'harress',
-    'harrester',
-    'harricana',
-    'harrierjets',
-    'harries/associate',
-    'harriet&rehy;meredith',
-    'harrington/non-fund',
-    'harrington/video',
-    'harris-born',
-    'harris-leeming',
-    'harris-style',
-    'harris-type',
-    'harris-warrick',
     'harris/actress',
-    'harris/beekeeper',
-    'harris/centre',
-    'harris/hospital',
-    'harris/imperial',
-    'harris/itn',
-    'harris/jaguar',
-    'harris/mobile',
-    'harris/oxford',
-    'harris/road',
-    'harris/secretary',
-    'harris/son',
-    'harris/wife',
-    'harris/wolves',
-    'harriseducation',
-    'harrison-like',
     'harrison.',
-    'harrison/gloucestershire',
-    'harrison/video',
-    'harrison/west',
-    'harriston',
-    'harro',
-    'harrock',
-    'harrod-domar',
-    'harrod-eagles',
-    'harrogate-born',
-    'harrogate/yorkshire',
-    'harroid',
-    'harroll',
-    'harrouchi',
-    'harroun',
-    'harrovians',
     'harrow&rehy;ing',
-    'harrow-on-the',
-    'harrower-peters',
-    'harrower/managing',
-    'harrowhouse',
-    'harrs',
-    'harrt',
-    'harrumph',
-    'harry-style',
-    'harrying.',
-    'harryson',
-    'harsd&ouml;rffer',
-    'harse',
-    'harselly',
-    'harsh-boned',
-    'harsh-leaved',
     'harshang',
-    'harshbarger',
-    'harshening',
-    'harshin',
-    'harshly-clipped',
-    'harshly-suppressed',
-    'harshnesses',
-    'harsiesis',
-    'harsley',
-    'harsnet.',
-    'harson',
-    'hart-brio',
-    'hart-davies',
-    'hart-fuller',
-    'hart-scott-rodino',
-    'hart/education',
     'hart/imperial',
-    'hart/it.',
-    'hart/local',
-    'hart/national',
-    'hartal',
-    'hartarto',
-    'hartbeespoort',
-    'hartberg',
-    'hartcup',
-    'hartebeesthoek',
-    'hartebeests',
-    'hartekamp',
-    'harten-ash',
-    'harten-oudijk',
-    'hartenfels',
-    'harter-craft',
     'hartest',
-    'hartewell',
-    'harthay',
-    'harthorn',
-    'hartie',
-    'hartishek',
-    'hartismere',
-    'hartkaiser',
-    'hartlepool-born',
-    'hartlepool7',
-    'hartlepudlians',
-    'hartless',
-    'hartlett/headteacher',
-    'hartley-russell/resident',
-    'hartley/car',
-    'hartley/swindon',
     'hartline',
-    'hartly',
-    'hartmanns',
-    'hartonclean',
-    'hartpury/gloucestershire',
-    'hartriett',
-    'hartriggs',
-    'hartshill-stockingford',
-    'hartside',
-    'harue',
-    'harumph',
-    'harun-al-rashid',
-    'harunda',
-    'harunori',
-    'haruo',
-    'haruspication',
     'haruyuki',
-    'harvard&ndash;boston',
-    'harvard-based',
-    'harvard-trained',
-    'harvel',
-    'harvell',
-    'harvest-fields',
-    'harvest/divest',
-    'harvestable',
-    'harvester.',
-    'harvesters.',
-    'harvesting.',
-    'harvesting_rather',
-    'harvestman',
-    'harvestmen',
-    'harvey-',
     'harvey-austin',
-    'harvey-jones/',
-    'harvey/victim',
-    'harvie-brown',
-    'harvinder',
-    'harvy',
-    'harway',
-    'harwell-based',
-    'harwell-led',
-    'harwich&ndash;hook',
-    'harwich-based',
-    'harwich-to-london',
-    'harwick',
-    'harwood/captain',
-    'harwood/captain/oxford',
-    'haryadi',
     'haryati',
-    'harzburgites',
-    'harzer',
-    'harzianopyridone',
-    'harzianum',
-    'harzquerbahn',
-    'has&rehy;had',
-    'has&rehy;oh',
-    'has\'nt',
-    'has\'t',
-    'has-beam',
-    'has-beans',
-    'has-bin',
-    'has.1',
-    'has.been',
-    'has/e',
     'has/had',
-    'has/have',
-    'has/u/',
-    'has/y/',
-    'hasaballah',
-    'hasanaginica',
-    'hasanali',
-    'hasani',
-    'hasans',
-    'hasawa',
-    'hasbaya',
-    'hasbi',
-    'hasbro-bradley',
-    'hasbury',
-    'haschke',
-    'haschmemann',
     'hasebe',
-    'hasek',
-    'haselaar/city',
-    'haseldine',
-    'haseler',
-    'haseley/oxfordshire',
-    'haselkorn',
-    'haselmeyer',
-    'hasely',
-    'hasenfuss',
-    'hasenstrauch',
-    'hasham',
-    'hashami',
-    'hashar',
-    'hashashin',
-    'hashavyahu',
     'hashemite-ruled',
-    'hashemiter',
-    'hashers',
-    'hashes',
-    'hashid',
-    'hashida',
-    'hashika',
-    'hashima',
-    'hashimite',
-    'hashin-shtrikman',
-    'hashing/descriptor-based',
-    'hashish-eaters',
-    'hashish-smoking',
-    'hashish.',
-    'hashmat',
-    'hashmi',
     'hashomayim',
-    'hashshash',
-    'hasib',
-    'hasid',
-    'hasilden',
-    'haskala',
-    'haskayne',
-    'haskil',
-    'haskin',
-    'haslam.',
-    'hasleden',
-    'haslett',
-    'hasli',
-    'haslingdon',
-    'haslingfield',
-    'haslum',
     'haslyn',
-    'hasmonean',
-    'hasn\'t',
-    'hasnae',
-    'hasnat',
-    'hasni',
-    'hasnip',
-    'hasnu',
-    'hasomer',
-    'hasps',
-    'hasrul',
-    'hass-klau',
-    'hassaballah',
-    'hassager',
-    'hassams',
-    'hassan&ndash;beni',
     'hassanaly',
-    'hassassa',
-    'hassawi',
-    'hasselblads',
-    'hasseled',
-    'hasselt',
-    'hassen',
-    'hasset*',
-    'hassex',
-    'hasshownmorereverencethanyou',
-    'hassi',
-    'hassiba',
-    'hassidim',
-    'hassinger',
-    'hasslehoff',
-    'hassoun',
     'hassuna',
-    'hasta',
-    'hasta_luego',
-    'haste-slowly',
-    'hastelow',
-    'hastie-smith/chaplin',
-    'hastier',
-    'hastiest',
-    'hastily-chosen',
-    'hastily-convened',
-    'hastily-drawn',
-    'hastily-dyed',
-    'hastily-erected',
-    'hastily-made',
-    'hastily-organised',
-    'hastily-seasoned',
     'hastily-written',
-    'hastily.',
-    'hastings-based',
-    'hastings-day',
-    'hastings/editor',
-    'hastingues',
-    'hastle',
-    'hastow',
-    'hastrup',
-    'hasty-pudding',
-    'hat&rehy;stand',
-    'hat+s',
-    'hat-',
-    'hat-blocking',
-    'hat-brims',
-    'hat-check',
     'hat-duck',
-    'hat-hurling',
-    'hat-maker',
-    'hat-pins',
-    'hat-rack',
-    'hat-roofed',
-    'hat-shop',
-    'hat-shops',
-    'hat-stands',
-    'hat-tipping',
-    'hat-wearing',
-    'hat/head/hair',
-    'hat/rabbit',
-    'hata-ozawa',
-    'hatada',
-    'hatakeyama',
     'hatan',
-    'hatao',
-    'hatboro',
-    'hatch-back',
-    'hatch.',
-    'hatchboard',
-    'hatchcock',
-    'hatched-out',
-    'hatchet-burying',
-    'hatchet-man',
-    'hatchet-men',
-    'hatchite',
-    'hatchling',
-    'hatchmates',
-    'hatchramp',
-    'hate&rehy;mongering',
     'hate-campaigns',
-    'hate-crime',
-    'hate-crimes',
-    'hate-curdled',
-    'hate-figure',
-    'hate-inspired',
-    'hate-theme',
-    'hateable',
-    'hatefulness',
-    'hateley/mccoist',
-    'hately',
-    'hatemongers',
-    'hatfull',
-    'hatha-wa',
-    'hathar',
-    'hathe',
     'hatherall',
-    'hatherely',
-    'hatherley/parish',
-    'hatherton',
-    'hathfertiti',
-    'hathorn',
-    'hathout',
-    'hathway',
-    'hatier',
-    'hatikvah',
-    'hatikwa',
-    'hatinhensis',
-    'hatip',
-    'hatje/cantz',
-    'hatleys',
-    'hatliff',
     'hatmakers',
-    'hato',
-    'hatora',
-    'hatoum',
-    'hatour',
-    'hatpattu',
-    'hatpegs',
-    'hatpins',
-    'hatra',
-    'hatston',
-    'hatt-i-sherif',
-    'hatta-girl',
-    'hattan',
-    'hattatts',
-    'hattersdallfjall',
-    'hattersley-smith',
     'hattersley/research',
-    'hattersley/shadow',
-    'hattfield',
-    'hattisburg',
-    'hatton-foston',
-    'hattractive',
-    'hattusili',
-    'hatun',
-    'hatungimana',
-    'hatungimanasecretary',
-    'hatvany',
-    'hatzikakis',
-    'hatzinikolaou',
-    'hatzopoulos',
-    'haua',
-    'haub',
     'hauben',
-    'haubois',
-    'haubrich',
-    'haucourt',
-    'hauf',
-    'haufield',
-    'haufler',
-    'hauger',
-    'haught',
-    'haughton(1987)*',
-    'haughty-looking',
-    'haugwitz',
-    'haukadalur',
-    'haukohl',
-    'haukriggs',
-    'haukur',
     'haulmark',
-    'haultain',
-    'haultech',
-    'haun',
-    'haunce',
-    'haunstetten',
-    'haunt&rehy;ing',
-    'haunted-house',
-    'haunting-place',
-    'haunts/of',
-    'hauptgasse',
-    'hauptman',
-    'hauptmann-schule',
-    'hauptmansburg',
-    'hauptstadt',
-    'hauptvertwaltung',
     'haur&eacute;au',
-    'haurus',
-    'haus&rehy;machtpolitik',
-    'haus-hof-und',
-    'hausa-',
-    'hausa-speaking',
-    'hausas',
-    'hausdorff',
-    'hause-bane',
-    'hauser-ernst',
-    'hauser/author',
-    'hausfater',
-    'hausfrau-style',
-    'hausfrauen',
-    'hausfraus',
-    'hausgeraete',
     'hausknecht',
-    'hausman-type',
-    'hausmann',
-    'hausse',
-    'hausser',
-    'haussherr',
-    'haussman',
-    'hausstock',
-    'haustellate',
-    'haut-bages-averous',
-    'haut-bourgeois',
-    'haut-poitou',
-    'hautacam',
-    'hautcharage',
-    'haute-bohemian',
-    'haute-bourgeoise',
     'haute-couture',
-    'haute-cuisine',
-    'haute-garonne',
-    'haute-montagne',
-    'hautes-',
-    'hautevilles',
-    'hautevilliers',
-    'hauteyn',
-    'hautpays',
-    'hauts',
-    'hautvilliers',
-    'haux',
-    'hauxley',
-    'hav\'na',
-    'havanaise',
-    'havannah',
     'havard-jones',
-    'havarstein',
-    'havasupai',
-    'havbe',
-    'havdalah',
-    'have&mdash;that',
-    'have&rehy;nots',
-    'have-a',
-    'have-a-nice-day',
-    'have-beens',
-    'have-buried',
-    'have-engaged',
-    'have-given',
-    'have-gun-will-travel',
-    'have-in',
-    'have-lesses',
     'have-nothing',
-    'have-nothings',
-    'have-we-any-choice',
-    'have.andy',
-    'have.been',
-    'have.so',
-    'have/am',
-    'have/get',
-    'have/my',
-    'have/put',
-    'have/y/',
-    'have4',
-    'have_a_a',
-    'have_a_little',
-    'have_no',
-    'have_of',
     'havea',
-    'haveagreed',
-    'haved',
-    'havels',
-    'havelsk&eacute',
-    'haven&mdash;or',
-    'haven\'t&mdash',
-    'havena\'',
-    'havenae',
-    'havenm\'t',
-    'haver',
-    'haverbecke',
-    'haverbeke',
-    'havercom',
-    'haverfield',
-    'haverfordwest/cardigan',
     'havergill',
-    'haverigg',
-    'haverings',
-    'haverlock',
-    'haversack-touting',
-    'haversacked',
-    'haverstraw',
-    'haverton',
-    'havet',
-    'havge',
-    'havi',
-    'havilah',
-    'havildar-major',
-    'having-somebody-crashed-on-your-sofa-for-three-months',
-    'havira',
-    'havire',
     'havishams',
-    'havlik',
-    'havna\'',
-    'havo',
-    'havoline',
-    'havre-paris',
-    'havvaher',
-    'havynge',
-    'haw&rehy;thorne',
-    'haw-haw-haw.',
-    'hawaii/california',
-    'hawaiian-style',
-    'hawaiian-tinged',
-    'hawaiianized',
-    'hawaiiiiiian',
-    'hawaiites',
     'hawajiss',
-    'hawala',
-    'hawd',
-    'hawel',
-    'hawera',
-    'hawes-leyburn',
-    'hawes/solicitor',
-    'haweswell',
-    'hawf',
-    'hawfell',
-    'hawfinches',
-    'hawford',
-    'hawgood',
-    'hawick-based',
-    'hawick/jedburgh/kelso',
-    'hawieh',
     'hawis',
-    'hawisia',
-    'hawk\'s-beard',
-    'hawk-',
-    'hawk-like.',
-    'hawk-moths',
-    'hawk-training',
-    'hawk-visaged',
-    'hawkear',
-    'hawkendon',
-    'hawker-siddeley',
-    'hawkeri',
-    'hawkes/neighbour',
-    'hawkesmoor',
-    'hawkestone',
-    'hawkeye-security',
     'hawkhill',
-    'hawkhope',
-    'hawkin',
-    'hawkins/brian',
-    'hawkins/co-producer',
-    'hawkins/neighbour',
-    'hawkins/operations',
-    'hawkridge/home',
-    'hawksbee',
-    'hawksborough',
-    'hawksian',
-    'hawksley/con',
-    'hawksnest',
-    'hawkswell',
-    'hawksworths',
-    'hawkweeds',
     'hawley-smoot',
-    'hawley/owner',
-    'hawleylondon',
-    'hawlicek',
-    'hawlinge',
-    'hawsfield',
-    'hawsizi',
-    'hawtah',
-    'hawthom',
-    'hawthordenden',
-    'hawthorn-hedged',
-    'hawthorn-like',
-    'hawthorne/bras',
-    'hawtin/former',
-    'hawtreys',
-    'hawtry',
     'haxhi',
-    'haxworth',
-    'hay-adams',
-    'hay-bale',
-    'hay-bales',
-    'hay-barn',
-    'hay-chomping',
-    'hay-coloured',
-    'hay-dealer',
-    'hay-dream',
-    'hay-drummond-hay',
-    'hay-feverish',
-    'hay-field',
-    'hay-gathering',
-    'hay-knife',
-    'hay-net',
     'hay-on',
-    'hay-on&rehy;wye',
-    'hay-on-wye/herefordshire',
-    'hay-pauncefoote',
-    'hay-smith',
-    'hay-straw',
-    'hay-time',
-    'hay-wagon',
-    'hay-zy',
-    'hay.leyhill',
-    'hay/briton',
-    'hayabusa',
-    'hayaf',
-    'hayar',
-    'hayboxes',
-    'haybridge',
     'hayburn',
-    'haycastle',
-    'hayco',
-    'haycombe',
-    'haycrust',
-    'hayd&eacute;e',
-    'hayda',
-    'haydalla',
-    'haydar-i',
-    'haydee',
-    'hayden-',
-    'hayden/competitor',
-    'hayden/uffington',
-    'haydn-hofstetter',
-    'haydn-lovers',
-    'haydn-niemecz',
     'haydn/mozart',
-    'haydnized',
-    'haydns',
-    'haydon&rehy;baillie',
-    'haydons',
-    'haye-du-puits',
-    'hayebox',
-    'hayek-friedman',
-    'hayes/chairman',
-    'hayes/chairman/aston',
-    'hayes/disabled',
-    'hayes/entertainer',
-    'hayes/father',
-    'hayes/gloucester',
-    'hayes/university',
-    'hayes:nd',
     'hayeswater',
-    'hayetzni',
-    'hayfever-type',
-    'hayfields.',
-    'haygar',
-    'haygrass',
-    'hayhoe',
-    'hayhook',
-    'haying',
-    'haylage',
-    'haylands',
-    'hayler',
-    'hayles',
-    'hayley-bell',
-    'haylick',
-    'haylli',
     'haylofts',
-    'haylor',
-    'haym',
-    'hayman-joyce',
-    'hayman/actress',
-    'hayman/burglary',
-    'hayman/organiser',
-    'haymann',
-    'haymanot',
-    'haymans',
-    'haymer/pilot',
-    'haymer/wife',
-    'haymerle',
-    'haymills',
-    'haymix',
-    'haynau',
     'haynes-dixon',
-    'haynes/oxford',
-    'haynes/thames',
-    'haynests',
-    'hayns',
-    'haypeter',
-    'haypot',
-    'hayrakasa',
-    'hayriders',
-    'hayrides',
-    'hayridge',
-    'hayrieye',
-    'haysaving',
-    'hayselden',
-    'haysi',
-    'hayslip',
     'haystack/hayrick',
-    'haystacked',
-    'haystacky',
-    'haystock',
-    'haystoun',
-    'hayter-hames',
-    'hayter/designer',
-    'hayter/former',
-    'haythorne',
-    'haythornthwaiter',
-    'hayton/sixth',
-    'hayton/speaking',
-    'hayzoos',
-    'hazair',
-    'hazaradous',
-    'hazard&rehy;ous',
     'hazard(s)',
-    'hazard-filled',
-    'hazard-prone',
-    'hazard.julie',
-    'hazareh',
-    'hazbiu',
-    'haze-softened',
-    'haze/pollution',
-    'hazel-crowded',
-    'hazel-stick',
-    'hazeleels',
-    'hazelehurst',
-    'hazelhead',
-    'hazelhen',
-    'hazelhen.',
-    'hazelhoff',
     'hazelhoft-roelfzema',
-    'hazelling',
-    'hazelside',
-    'hazeltine',
-    'hazemburk',
-    'hazers',
-    'hazeva',
-    'hazey',
-    'hazhal',
-    'hazier',
-    'hazlerigg',
-    'hazlitts',
-    'hazmat',
-    'hazometer',
-    'hazops',
-    'hazor',
     'hazri',
-    'hazud',
-    'hazza',
-    'hb-4',
-    'hb-united',
-    'hb-vap',
-    'hb/ccb',
-    'hb1',
-    'hb100%',
-    'hbai',
-    'hbcaa',
-    'hbcs',
-    'hbcu',
-    'hbd',
-    'hbdab',
-    'hbe',
     'hbfcs',
-    'hbtx',
-    'hc(89)5',
-    'hc(90)23/lassl(90)11',
-    'hc(fp)84',
-    'hc0',
-    'hc1100',
-    'hc2',
-    'hc216',
-    'hc4046',
-    'hc431',
-    'hcab',
-    'hcd',
-    'hce',
-    'hcem',
-    'hcformat',
     'hcformat.exe',
-    'hcha',
-    'hci-extractable',
-    'hci-uniformed',
-    'hcic=cci2',
-    'hcic=chci',
-    'hcima.',
-    'hcima/banks',
-    'hcima/city',
-    'hcimna',
-    'hcip',
-    'hcl/',
-    'hcl/naoh',
-    'hclas',
-    'hclo4(aq)',
-    'hcm',
     'hcmodule',
-    'hco-free',
-    'hcpu',
-    'hcr&mdash;the',
-    'hcsummary.log',
-    'hcu',
-    'hcverify.exe',
-    'hcvolume.fil',
-    'hcw',
-    'hd-100',
-    'hd-1000',
-    'hd-210',
-    'hd-doms-based',
-    'hd-doms-ready',
-    'hd-doms-to-objectstore',
-    'hd5-1',
     'hd8',
-    'hd8039.b3',
-    'hd8039.e5',
-    'hdab',
-    'hdb&mdash;croat',
-    'hdbk.',
-    'hdf-allied',
-    'hdg.',
-    'hdhead18,80,2',
-    'hdl-mediated',
-    'hdl3',
-    'hdll',
-    'hdln',
-    'hdmds',
-    'hdo',
-    'hdpe',
     'hds/secureware',
-    'hdsware',
-    'hdtv-based',
-    'hdz&mdash;croatian',
-    'he!p',
-    'he&mdash;my',
-    'he&ndash;fussiness',
-    'he\'l',
-    'he\'s/she',
-    'he\'th',
-    'he(iia)',
-    'he(interrupting)',
-    'he(savagely)',
-    'he(she)',
-    'he-ass',
-    'he-dog',
     'he-dryad',
-    'he-e-lp',
-    'he-in-us',
-    'he-is',
-    'he-knew',
-    'he-or-she',
-    'he-s',
-    'he-shes',
-    'he-stopped',
-    'he-thought',
-    'he-walked',
-    'he-was',
-    'he-would',
-    'he.',
-    'he.was',
-    'he/h',
     'he/him/his/himself',
-    'he/man',
-    'he/she/it/they',
-    'he/they',
-    'he/wan',
-    'he111p',
-    'he_as',
-    'he_no',
-    'heaberth',
-    'head&mdash;i',
-    'head&mdash;jenny',
-    'head&rehy;first',
-    'head&rehy;ing',
-    'head&rehy;ings',
-    'head&rehy;lamps',
-    'head&rehy;tennis',
     'head-',
-    'head-ach',
-    'head-achs',
-    'head-and-neck',
-    'head-and-shoulder',
-    'head-bands',
-    'head-bang',
-    'head-banged',
-    'head-banger',
-    'head-bangers',
-    'head-bangs',
-    'head-bean',
-    'head-bearer',
-    'head-blocker',
-    'head-board',
-    'head-boiler',
     'head-bowers',
-    'head-bowing',
-    'head-butts',
-    'head-cases',
-    'head-cloth',
-    'head-covering',
-    'head-covers',
-    'head-cushion',
-    'head-cutting',
-    'head-deformation',
-    'head-dressed',
-    'head-end',
-    'head-faked',
-    'head-finding',
-    'head-foot',
-    'head-girl-type',
     'head-guards',
-    'head-hammering',
-    'head-house',
-    'head-hunt',
-    'head-in-the-oven',
-    'head-in-the-sand',
-    'head-in-the-sands',
-    'head-jerk',
-    'head-jutting',
-    'head-keeper',
-    'head-kicking',
-    'head-knocking',
-    'head-lamp',
-    'head-laser',
-    'head-lease',
-    'head-lessor',
     'head-lock',
-    'head-lolling',
-    'head-long',
-    'head-mistress',
-    'head-neck',
-    'head-neck-body',
-    'head-nodding',
-    'head-of-family',
-    'head-on-heart',
-    'head-on-view',
-    'head-one',
-    'head-ornaments',
-    'head-part',
-    'head-phones',
-    'head-piece',
-    'head-pieces',
     'head-pincering',
-    'head-pincers',
-    'head-planting',
-    'head-protection',
-    'head-rent',
-    'head-rests',
-    'head-retention',
-    'head-room',
-    'head-scarfs',
-    'head-scarved',
-    'head-scratchings',
-    'head-screwing',
-    'head-set',
-    'head-severing',
-    'head-shake',
-    'head-shakings',
     'head-shaped',
-    'head-shattering',
-    'head-shaven',
-    'head-shaving',
-    'head-shot',
-    'head-shrinker',
-    'head-splitting',
-    'head-staff',
-    'head-state',
-    'head-stripes',
-    'head-stunt',
-    'head-tapped',
-    'head-teachers',
-    'head-thrust',
-    'head-thumper',
-    'head-to-foot',
     'head-to-torso',
-    'head-tossing',
-    'head-town',
-    'head-tracking',
-    'head-veil',
-    'head-winds',
-    'head-wobbling',
-    'head-work',
-    'head.that',
-    'head.the',
-    'head/',
-    'head/block',
-    'head/footrest',
-    'head/fundraiser',
-    'head/governing',
-    'head/heart',
     'head/isrotel/tennis',
-    'head/pretty',
-    'head/technical',
-    'head/wine',
-    'headache-ish',
-    'headachey',
-    'headachy',
-    'headbang',
-    'headboroughs',
-    'headbutters',
-    'headcabin',
-    'headcard',
-    'headcharge',
-    'headcloth',
-    'headcode',
-    'headcorn',
     'headcrunching',
-    'headen',
-    'header-tank',
-    'header.',
-    'header/flick',
-    'header/trailer',
-    'headers-off',
-    'headers/knock',
-    'headewr',
-    'headey',
-    'headfast',
-    'headfield',
-    'headfold',
-    'headfort',
-    'headguards',
-    'headhigh',
     'headhunt',
-    'headhuntlng',
-    'headhunts',
-    'headicar',
-    'headicar/oxford',
-    'headicraa',
-    'headie',
-    'headiness',
-    'heading(s)',
-    'heading-tape',
-    'heading-up',
-    'headingham',
-    'headings/subheadings',
-    'headlam&ndash;knox',
-    'headley/folly',
-    'headley/raf',
     'headline-catching',
-    'headline-grabber',
-    'headline-hugging',
-    'headline-hunters',
-    'headline-seizing',
-    'headlinese',
-    'headlingley',
-    'headlings',
-    'headload',
-    'headloaders',
-    'headlocks',
-    'headm&mdash',
-    'headmaster\'',
-    'headmaster.',
-    'headmistresship',
-    'headnodding',
     'headpaper',
-    'headplate',
-    'headquaters',
-    'headrent',
-    'headresses',
-    'headroom/compression',
-    'heads-and-bodies-and-tails',
-    'heads-down-take-no-nonsense-mindless-boogie',
-    'heads-together',
-    'heads.1',
-    'heads.chris',
-    'heads/governors',
-    'heads/leaves',
-    'heads/shower',
-    'headscan',
-    'headscarfs',
     'headscratching',
-    'headshaking',
-    'headshields',
-    'headshrink',
-    'headshy',
-    'headsize',
-    'headsizes',
-    'headsphotographs',
-    'headspinning',
-    'headsquare',
-    'headsquared',
-    'headsquares',
-    'headstack',
-    'headstanders',
-    'headstock-facing',
-    'headstock-grafting',
     'headstock/floyd-equipped',
-    'headstrap',
-    'headstreams',
-    'headstyle',
-    'headtorches',
-    'headwaiters',
-    'headwey',
-    'headword(s)',
-    'headwork',
-    'headwound',
-    'headwraps',
-    'heady-smell',
-    'heady-sweet',
-    'heaf',
-    'heafing',
-    'heagney',
     'heaithy',
-    'healable',
-    'healant',
-    'healants',
-    'healdsburg',
-    'heale/reporting',
-    'healer-god',
-    'healey-type',
-    'healey.',
-    'healis',
-    'heallgemot',
-    'healp',
-    'healper',
-    'healpfull',
-    'healsey',
-    'healter',
     'health&rehy;cure',
-    'health-and-money-conscious',
-    'health-and-safety',
-    'health-authority-run',
-    'health-aware',
-    'health-centre-based',
-    'health-consciousness',
-    'health-destroying',
-    'health-enhancement',
-    'health-enhancing',
-    'health-farm',
-    'health-inspectors',
-    'health-inspired',
-    'health-led',
-    'health-lobbying',
-    'health-obsessed',
     'health-restoring',
-    'health-seekers',
-    'health-social',
-    'health-tested',
-    'health-threatening',
-    'health-warning',
-    'health-watch',
-    'health.members',
-    'health.those',
-    'health/ill-health',
-    'health/leisure',
-    'health/services',
-    'health/toxic',
-    'health/utilities',
-    'health/vitality',
-    'healthcheck',
     'healthcheque',
-    'healtheir',
-    'healthers',
-    'healthfoods',
-    'healthhazards',
-    'healthly',
-    'healthpreserving',
-    'healthrite',
-    'healthroger',
-    'healthwatchers',
-    'healthworkers',
-    'healthworks',
-    'healthy\'',
-    'healthy-option',
-    'healthy-sized',
-    'healthy-style',
     'healthy/diseased',
-    'healton',
-    'healy/royal',
-    'heane',
-    'heaneys',
-    'heao-3',
-    'heap-leaching',
-    'heap.',
-    'heape',
-    'heaped-chairs',
-    'heapes',
-    'heapeth',
-    'hear&ndash;the',
-    'hear\'',
-    'hear-',
-    'hear-hears',
     'hear-how',
-    'hear-say',
-    'hear-shaped',
-    'hear-streak',
-    'hear-ted',
-    'hear/',
-    'hear/distinguish',
-    'hear_one',
-    'hearadh',
-    'hearbeat',
-    'hearby',
-    'heard-',
-    'heard-headed',
-    'heard-it-all-before',
-    'heard-was',
-    'heard/saw',
     'heard/seen/felt',
-    'hearde',
-    'hearder',
-    'heardst',
-    'heardthere',
-    'hearer\'',
-    'hearer-oriented',
-    'hearer-that',
-    'heares',
-    'hearfield',
-    'hearing&rehy;impaired',
-    'hearing(r6.24)',
-    'hearing/adjourned',
-    'hearing/partially',
-    'hearkeners',
-    'hearld',
     'hearley',
-    'hearn-managed',
-    'hearn/mothers',
-    'hearndon',
-    'hearseload',
-    'hearsey',
-    'hearsts',
-    'hearsum',
-    'heart&mdash;to',
-    'heart&rehy;breaker',
-    'heart&rehy;shaped',
-    'heart&rehy;stopper',
-    'heart&rehy;stopping',
-    'heart\'n\'soul',
-    'heart-affecting',
-    'heart-ambulance',
     'heart-and-liver',
-    'heart-and-soul',
-    'heart-banging',
-    'heart-break',
-    'heart-breaker',
-    'heart-burning',
-    'heart-bursting',
-    'heart-by&rehy;pass',
-    'heart-bypass',
-    'heart-chilling',
-    'heart-clenching',
-    'heart-clutching',
-    'heart-constraining',
-    'heart-constricting',
-    'heart-cut',
-    'heart-disease',
     'heart-eatingly',
-    'heart-fires',
-    'heart-first',
-    'heart-flutterings',
-    'heart-for',
-    'heart-height',
-    'heart-machine',
-    'heart-melting',
-    'heart-new',
-    'heart-of-gold',
-    'heart-of-oak',
-    'heart-on-sleeve',
-    'heart-op',
-    'heart-operation',
-    'heart-poacher',
-    'heart-pulling',
     'heart-racing',
-    'heart-related',
-    'heart-religion',
-    'heart-rendering',
-    'heart-rendin\'',
-    'heart-rendingly',
-    'heart-rocking',
-    'heart-schmaltzy',
-    'heart-shakingly',
-    'heart-sinkingly',
-    'heart-sluffed',
-    'heart-smit',
-    'heart-snaring',
-    'heart-start',
-    'heart-stirring',
-    'heart-stretching',
     'heart-sufferer',
-    'heart-swap',
-    'heart-swelling',
-    'heart-tearing',
-    'heart-thudding',
-    'heart-to-hearts',
-    'heart-touching',
-    'heart-transplant',
-    'heart-tugging',
-    'heart-turning',
-    'heart-tweaking',
-    'heart-valve',
-    'heart-winning',
-    'heart-wood',
-    'heart-work',
-    'heart-wrenchingly',
     'heart-yearning',
-    'heart.',
-    'heart.joyce',
-    'heart/pulse',
-    'heartattack',
-    'heartbangs',
-    'heartbeart',
-    'heartblood',
-    'heartcold',
-    'heartens',
-    'heartfailure',
-    'heartflower',
-    'heartful',
-    'hearth-fire',
-    'hearth-fires',
-    'hearth.',
     'hearthbrush',
-    'hearthed',
-    'hearthstones',
-    'hearthstoning',
-    'heartily.',
-    'heartlanders',
-    'heartly',
-    'heartrotting',
-    'hearts-and-minds',
-    'hearts-ease',
-    'hearts.',
-    'hearts0',
-    'heartsearching',
-    'heartsinking',
-    'heartsponge',
-    'heartwater',
     'heartworms',
-    'heasding',
-    'heasked',
-    'heat&rehy;labile',
-    'heat\'',
-    'heat-adhesive',
-    'heat-and',
-    'heat-and-',
-    'heat-and-dust',
-    'heat-beams',
-    'heat-boost',
-    'heat-but',
-    'heat-by',
-    'heat-coggled',
-    'heat-differential',
-    'heat-dissipating',
     'heat-dried',
-    'heat-driven',
-    'heat-dry',
-    'heat-efficient',
-    'heat-energy',
-    'heat-exchangers',
-    'heat-heavy',
-    'heat-holding',
-    'heat-hungry',
-    'heat-killed',
-    'heat-labile',
-    'heat-lamp',
-    'heat-light',
-    'heat-metered',
-    'heat-only',
-    'heat-patterns',
     'heat-profile',
-    'heat-ray',
-    'heat-recovery',
-    'heat-reflective',
-    'heat-retardant',
-    'heat-rise',
-    'heat-salt',
-    'heat-searching',
-    'heat-sensors',
-    'heat-setting',
-    'heat-shrunk',
-    'heat-soft',
-    'heat-stable',
-    'heat-stroke&mdash;rosette',
-    'heat-struck',
-    'heat-stupefied',
     'heat-styled',
-    'heat-suit',
-    'heat-transmitting',
-    'heat-transport',
-    'heat-trapping',
-    'heat-treating',
-    'heat-warped',
-    'heat/cold',
-    'heat/hot',
-    'heat/steam-raising',
-    'heat/vent/demisting',
-    'heate',
-    'heated-the',
-    'heated.',
-    'heater-cloak',
-    'heater/demister',
     'heater/thermostat',
-    'heaterset',
-    'heaterthermostat',
-    'heatfilter',
-    'heatflow',
-    'heath-land',
-    'heath-robinson',
-    'heath-robinson-like',
-    'heath-style',
-    'heath-walker',
-    'heath/accident',
-    'heath/science',
-    'heathcock',
-    'heathcote-amory',
-    'heathcote-type',
-    'heathendom',
     'heather&rehy;clad',
-    'heather-',
-    'heather-ale',
-    'heather-bell',
-    'heather-blue',
-    'heather-dominant',
-    'heather-filled',
-    'heather-mixture',
-    'heather-moors',
-    'heather-perfumed',
-    'heather-roots',
-    'heather-thick',
-    'heather/',
-    'heather/cotton',
-    'heather/sally',
-    'heatherbank',
     'heatherington-',
-    'heatherington-scotts',
-    'heatherlands',
-    'heatherley',
-    'heathington-scott',
-    'heathites',
-    'heathlike',
-    'heathline',
-    'heathmynd',
-    'heathpacks',
-    'heathrow-boston',
-    'heathrow-brussels',
-    'heathrow-gatwick',
-    'heathrow-leipzig',
-    'heathrow-palma',
-    'heathwaite',
     'heating-gratings',
-    'heating_on',
-    'heatlamp',
-    'heatpipes',
-    'heatring',
-    'heatwise',
-    'heauiness',
-    'heaume',
-    'heautontimorumenos',
-    'heauy',
-    'heav\'ns',
-    'heaven\'',
-    'heaven-and-hell',
-    'heaven-born',
-    'heaven-glitter',
-    'heaven-knows-anything-goes',
     'heaven-knows-what',
-    'heaven-knows-where',
-    'heaven-on-earth',
-    'heaven-touched',
-    'heaven-work',
-    'heaven.the',
-    'heaven/',
-    'heavenblock',
-    'heavenbound',
-    'heavenly-minded',
-    'heavenly-sent',
-    'heavens-earth',
-    'heavens.',
-    'heavens/vale',
-    'heavenstreet',
-    'heavie',
     'heavier-bodied',
-    'heavier-calibre',
-    'heavier-duty',
-    'heavier-gauge',
-    'heaviest-ever',
-    'heavily-backed',
-    'heavily-booked',
-    'heavily-chlorinated',
-    'heavily-clad',
-    'heavily-darted',
-    'heavily-defended',
-    'heavily-favoured',
-    'heavily-fed',
-    'heavily-foliaged',
-    'heavily-fortified',
-    'heavily-funded',
     'heavily-grassed',
-    'heavily-handicapped',
-    'heavily-illustrated',
-    'heavily-indebted',
-    'heavily-industrialized',
-    'heavily-labelled',
-    'heavily-layered',
-    'heavily-lined',
-    'heavily-loaded',
-    'heavily-loss-making',
-    'heavily-made-up',
-    'heavily-ornamented',
-    'heavily-patterned',
-    'heavily-pictured',
-    'heavily-polluted',
-    'heavily-pregnant',
     'heavily-promoted',
-    'heavily-publicised',
-    'heavily-rimmed',
-    'heavily-spinning',
-    'heavily-stitched',
-    'heavily-suited',
-    'heavily-thumbed',
-    'heavily-travelled',
-    'heavily-treading',
-    'heavily-unionized',
-    'heavily-veiled',
-    'heavily-waterlogged',
-    'heavily-wooded',
-    'heavily-worn',
-    'heavily.',
-    'heavily.dependent',
     'heaving-to',
-    'heaviosity',
-    'heavon',
-    'heavside',
-    'heavy&rehy;duty',
-    'heavy&rehy;fleshed',
-    'heavy&rehy;weights',
-    'heavy-',
-    'heavy-bladed',
-    'heavy-bodied',
-    'heavy-bomber',
-    'heavy-boned',
-    'heavy-booted',
-    'heavy-breasted',
-    'heavy-breathing',
-    'heavy-built',
     'heavy-carbon',
-    'heavy-chinned',
-    'heavy-cropping',
-    'heavy-curtained',
-    'heavy-flying',
-    'heavy-framed',
-    'heavy-gloved',
-    'heavy-grain',
-    'heavy-industry',
-    'heavy-jawed',
-    'heavy-knit',
-    'heavy-land',
-    'heavy-leafed',
-    'heavy-lipped',
-    'heavy-load',
-    'heavy-neutrino',
     'heavy-petted',
-    'heavy-raindrop',
-    'heavy-rimmed',
-    'heavy-rock',
-    'heavy-scaled',
-    'heavy-shadowed',
-    'heavy-shouldered',
-    'heavy-spending',
-    'heavy-tar',
-    'heavy-tongued',
-    'heavy-traffic',
-    'heavy-uddered',
-    'heavy-weights',
-    'heavy-wooded',
-    'heavy-yielding',
-    'heavy12.2',
     'heavyduty',
-    'heavyland',
-    'heavysoled',
-    'heavyweight-boxing',
-    'heavyweight-style',
-    'heavywweights',
-    'heaword',
-    'heayberd',
-    'heb-sed',
-    'hebbelthwaite',
-    'hebbert/headmistress',
-    'hebbess',
-    'hebbie',
-    'hebdenmike',
-    'hebdo',
-    'hebdominal',
     'hebean',
-    'hebephrenia',
-    'hebephrenic',
-    'heber-smith/former',
-    'hebner',
-    'hebraeorum',
-    'hebraic-christian',
-    'hebrew-syriac-egyptian',
-    'hebrideans',
-    'hebridear',
-    'hebridena',
-    'hebro',
-    'hebros',
-    'hebrus',
-    'heburn',
-    'hebuterne',
     'hec/ash',
-    'hecatomb',
-    'hecause',
-    'hechaluz',
-    'hechingen',
-    'hechler',
-    'hecketypecky',
-    'heckford',
-    'heckingbottom',
-    'heckler-in-chief',
-    'heckners',
-    'hecks',
-    'heckscher',
-    'heckstall-smith',
-    'heckyl',
-    'hecq',
     'hecst',
-    'hectanooga',
-    'hectate',
-    'hectic-stricken',
-    'hecticity',
-    'hectick',
-    'hectographic',
-    'hectolitre/7,500',
-    'hectometre',
-    'hectoringly',
-    'hedared',
-    'hedberg',
-    'hedblom',
-    'heddas',
-    'hedder-kowes',
-    'heddernheim',
     'hedders',
-    'heddington',
-    'heddles',
-    'heddow',
-    'heddwen',
-    'hedegrows',
-    'hedenham',
-    'hedensted',
-    'hedeoma',
-    'hederas',
-    'hederifolium',
-    'hederifolum',
-    'hederstrom',
-    'hederwick',
-    'hedfors',
-    'hedge-bank',
     'hedge-blind',
-    'hedge-bottom',
-    'hedge-bottoms',
-    'hedge-boughs',
-    'hedge-builders',
-    'hedge-cutter',
-    'hedge-cutters',
-    'hedge-gap',
-    'hedge-hog',
-    'hedge-hopped',
-    'hedge-leaping',
-    'hedge-line',
-    'hedge-lined',
-    'hedge-plant',
-    'hedge-planter',
-    'hedge-row',
     'hedge-sparrows',
-    'hedge-surrounded',
-    'hedge-thorn',
-    'hedge-top',
-    'hedge-tops',
-    'hedge-trimming',
-    'hedge-wizards',
-    'hedgebank',
-    'hedgebank.',
-    'hedgebote',
-    'hedgecock',
-    'hedgecoe',
-    'hedgehog-child',
-    'hedgehog-hunting',
-    'hedgehog-minded',
-    'hedgehog-related',
     'hedgehog-shaped',
-    'hedgehog-skin',
-    'hedgehog-spotting',
-    'hedgehog-tight',
-    'hedgehog/watchword',
-    'hedgehopping',
-    'hedgeland',
-    'hedgepig',
-    'hedgerow-ripened',
-    'hedgerowey',
-    'hedges.',
-    'hedges/british',
-    'hedges/carbon',
-    'hedges/thames',
-    'hedgesparrow',
-    'hedgetops',
     'hedgity&rehy;hog',
-    'hedgpeth',
-    'hediard',
-    'hedley-on-the-hill',
-    'hedman',
-    'hedmark',
-    'hednesford',
-    'hedorah',
-    'hedownstair',
-    'hedphelyn',
-    'hedrites',
-    'hedtoft',
-    'hedward',
-    'hedwig',
-    'hedworth',
-    'hee-hee',
     'hee-hee-hee',
-    'hee-ma',
-    'heebies',
-    'heebner',
-    'heeee-yooch',
-    'heeeeeeevvv',
-    'heeem',
-    'heel&rehy;clicking',
-    'heel-caps',
-    'heel-length',
-    'heel-less',
-    'heel-raise',
-    'heel-shaped',
-    'heel-stomp',
-    'heel-tapping',
-    'heel-toe',
     'heela',
-    'heelands',
-    'heelcaps',
-    'heeld',
-    'heeled-up',
-    'heelis',
-    'heels-up',
-    'heeltaps',
-    'heely',
-    'heemskerk',
-    'heeng',
-    'heerema',
-    'heereman',
-    'heerenveen',
-    'heery',
-    'heet',
     'heeuggh',
-    'heeven',
-    'hefc',
-    'hefe',
-    'heffalump',
-    'hefferon',
-    'heffner',
-    'hefford',
-    'heffter',
-    'heflame',
-    'heft-dispenser',
-    'heftiest',
-    'hefyn',
-    'hegde',
-    'hegel.',
-    'hegelianize',
     'hegels',
-    'hegemonising',
-    'hegemonistic',
-    'hegemonists',
-    'hegemony.',
-    'hegenbart',
-    'hegetorides',
-    'hegg',
-    'hegglun',
-    'heghest',
-    'hegnenbacher',
-    'hegyeshalom',
-    'hegyi',
-    'heh-heh',
-    'heh-heh-he',
-    'heh-heh-heh',
     'hehai',
-    'hehbelyk',
-    'hehe.',
-    'heheheheh',
-    'hehet',
-    'hehmeyer',
-    'hehner',
-    'heho',
-    'hei-hei',
-    'hei-led',
-    'hei/hey',
-    'heian',
-    'heibeck',
-    'heiberg',
-    'heidacker',
-    'heidbreder',
     'heideggerian',
-    'heideklostern',
-    'heidel',
-    'heidenkamp',
-    'heidenmoor',
-    'heidenreich',
-    'heiderich',
-    'heidi-postcard',
-    'heidie',
-    'heido',
-    'heidolph',
-    'heidrek',
-    'heidt/up',
-    'heidy',
-    'heiferman',
-    'heiff',
     'heighcliffe',
-    'heighened',
-    'heighes',
-    'heigho',
-    'height(s)',
-    'height-adjusting',
-    'height-adjustment',
-    'height-of-the-season',
-    'height-testing',
-    'height-weight',
-    'height-wise',
-    'height/',
-    'height/depth',
-    'height/width',
-    'height=+0.87',
-    'height=-1.94',
     'heightlington',
-    'heihachir&oacute;0',
-    'heiht',
-    'heijboer',
-    'heijbroek',
-    'heijningen',
-    'heikell',
-    'heikes',
-    'heikeshof',
-    'heikki',
-    'heil-ing',
-    'heilat',
-    'heilbroner',
-    'heilbronner',
-    'heile',
-    'heileman',
     'heilig',
-    'heiligblut',
-    'heiligen',
-    'heiligenborn',
-    'heilmann',
-    'heilmayr',
-    'heilmeier',
-    'heilprin',
-    'heilwig',
-    'heilwigstra&szlig;e',
-    'heimann',
-    'heimar',
-    'heimat/action',
-    'heimatschuss',
-    'heimatsmuseum',
-    'heimattouristen',
     'heimel',
-    'heimiveh',
-    'heimliche',
-    'heimowitz',
-    'heimskringla',
-    'heinderich',
-    'heine-medin',
-    'heine/cinema',
-    'heine/shark',
-    'heinekein',
-    'heinekin',
-    'heiner',
-    'heines',
-    'heinitz',
-    'heinmot',
-    'heinrich-heine-allee',
     'heinrich-heine-university',
-    'heintze',
-    'heintzman',
-    'heinze',
-    'heinzs',
-    'heir-at-law',
-    'heirarchial',
-    'heirless',
-    'heironimus',
-    'heirs-apparent',
-    'heirship',
-    'heisbourg',
-    'heising',
-    'heisman',
-    'heisst',
-    'heisted',
     'heister',
-    'heitiki',
-    'heitler',
-    'heitz',
-    'heizer',
-    'hejke',
-    'hekals',
-    'hekatomnid',
-    'hekken',
-    'hekla',
-    'hekmatyar-rabbani',
-    'hel&egrave;ne',
-    'hel-llo',
-    'hel-lo',
-    'helaf',
-    'helaine',
     'helan',
-    'helathirnum',
-    'helbronner',
-    'held-a',
-    'held-at',
-    'held-forward',
-    'held-in',
-    'held-out',
-    'held.',
-    'held_in',
-    'helde',
-    'helderman',
-    'heldge',
-    'helen&ndash',
-    'helen/former',
-    'helenecca',
     'helenenstrasse',
-    'heleniums',
-    'helens-sutton',
-    'helens18',
-    'helensborough',
-    'helfen',
-    'helgadottir',
-    'helgason',
-    'helgersen',
-    'helgo',
-    'helhoughton',
-    'heli-',
-    'heli-schnupper',
-    'heli-skier',
-    'heli-tech',
-    'heli-teles',
     'heli.',
-    'helia',
-    'heliaca',
-    'heliacally',
-    'heliand',
-    'helianor',
-    'helically-wound',
-    'helicase',
-    'helicat',
-    'helice',
-    'helichrysums',
-    'helico',
-    'helicobacter-like',
-    'heliconii',
-    'heliconiini',
-    'helicoper',
     'helicoplacoid',
-    'helicoplacoids',
-    'helicoplacus',
-    'helicopter-carrier',
-    'helicopter-like',
-    'helicopter-maker',
-    'helicopter.',
-    'helicopter/oxford',
-    'helicopter/pilot',
-    'helicopters.',
-    'helicopters.the',
-    'helictites',
-    'heligan',
-    'helijet',
-    'helikon',
-    'helimax',
     'helimax/\'jetranger\'',
-    'helinstedt',
-    'heliocentrism',
-    'heliodor',
-    'heliographic',
-    'heliographs',
-    'heliogravure',
-    'helios-made',
-    'helioscope',
-    'heliosphan',
-    'heliospheric',
-    'heliostat',
-    'heliothermic',
-    'heliotherms',
-    'heliothermy',
-    'heliotropium',
     'helipads',
-    'helipcoter',
-    'heliports',
-    'heliposis',
-    'heliroute',
-    'heliski',
-    'helium-5',
-    'helium-cooled',
-    'heliumfilled',
-    'helix-coil',
-    'helix-loop-helix-leucine',
-    'helixes',
-    'helj&auml',
-    'heljans',
-    'hell&eacute;nique',
-    'hell&iacute;n',
     'hell\'s-a-happening',
-    'hell-&ndash;re',
-    'hell-and-back',
-    'hell-disaster',
-    'hell-holes',
-    'hell-lit',
-    'hell-marriage',
-    'hell-of-a-fellows',
-    'hell-oh',
-    'hell-pit',
-    'hell-sent',
-    'hell-touched',
-    'hellabruni',
-    'hellaciously',
-    'helladic',
-    'helland',
     'hellbellies',
-    'hellberg',
-    'hellbrunn',
-    'hellcore',
-    'helldiver',
-    'helldorf',
-    'helleborines',
-    'hellenikon',
-    'hellenis',
-    'hellenistiques',
-    'hellenizer',
-    'hellenomemphites',
-    'hellenotamiai',
-    'helleri',
-    'hellesvean',
-    'hellevik',
     'hellewell',
-    'hellfire-spiced',
-    'hellfired',
-    'hellhag',
-    'hellich',
-    'hellidon',
-    'hellier/consultant',
-    'hellinger',
-    'hellion',
-    'hellip',
-    'hellis-setr',
-    'hellishly-shaven',
-    'helll',
-    'hellmuth',
-    'hellner',
-    'hello-and-goodbyes',
     'hello-o-o-o',
-    'hello/goodbye',
-    'helloee',
-    'helloey',
-    'helloo',
-    'hellot',
-    'helloween',
-    'hellspawn',
-    'hellsvik',
-    'hellte',
-    'hellthpawn',
-    'hellwig',
-    'hellwigianum',
-    'hellwind',
-    'helmet-buckle',
-    'helmet-crest',
     'helmet-plates',
-    'helmet-shaped',
-    'helmet-skull',
-    'helmetted',
-    'helmgart',
-    'helmi',
-    'helminth-infected',
-    'helminthiasis',
-    'helminthologist',
-    'helminthosis',
-    'helmshore',
-    'helmside',
-    'helmstedt',
-    'helno',
-    'helo',
-    'helocopter',
     'helogale',
-    'helonia',
-    'helou',
-    'help&lsqb;s&rsqb',
-    'help\'',
-    'help*&gt;help&mdash;index.help',
-    'help-forms',
-    'help-mate',
-    'help-seeking',
-    'help-wanted',
-    'help-yourself',
-    'help/cover',
-    'help/nanny',
-    'help/support',
-    'help3000',
-    'help:189',
     'helpage',
-    'helper/',
-    'helper/driver',
-    'helpers/support',
-    'helpes',
-    'helpeth',
-    'helpful-humorous',
-    'helpful.',
-    'helpfully.',
-    'helpfulnesses',
-    'helpin',
-    'helping-out',
-    'helpis',
-    'helpless-looking',
-    'helplessly.',
-    'helpmates',
     'helpmeets',
-    'helps-the',
-    'helps/farmer',
-    'helpstone',
-    'helpware',
-    'helpwith',
-    'helredale',
-    'helse',
-    'helsel',
-    'helsinborg',
-    'helsington',
-    'helsinki-based',
-    'heltai',
-    'helvering',
-    'helvetiae',
-    'helvoetfluys',
     'helvola',
-    'helwa',
-    'helwe',
-    'hem&aacute;ndez-pe&oacute;n',
-    'hem-hem',
-    'hem-stitch',
-    'hem-twinkling',
-    'heman',
-    'hemandanda',
-    'hemann',
-    'hematite-rich',
-    'hematolymphangioma',
-    'hematoporphyrin',
-    'hemba',
-    'hemblade',
-    'hemborough',
     'hembricht',
-    'hembry/gloucs',
-    'hembry/trading',
-    'hemdale',
-    'heme',
-    'hemedi',
-    'hemeistert',
-    'hemeling',
-    'hemely',
-    'hemelytra',
-    'hemendanda',
-    'hemene',
-    'hementin',
-    'hemenway',
-    'hemeon',
-    'hemesis',
     'hemi-circle',
-    'hemi-colectomy',
-    'hemi-cycles',
-    'hemi-decortication',
-    'hemianopic',
-    'hemicelluloses',
-    'hemicidaris',
-    'hemicrypt',
-    'hemicycle',
-    'hemidiaphragm',
-    'hemidoecus',
-    'hemigrammus',
-    'hemimetabolous',
-    'heminephrin',
-    'heminevrin',
-    'heming',
     'hemingborough',
-    'hemingbrough',
-    'hemingstone',
-    'hemington',
-    'hemingway/designer',
-    'hemiola',
-    'hemiolas',
-    'hemioliopterus',
-    'hemiolipterus',
-    'hemipelagic',
-    'hemipteran',
-    'hemiretina',
-    'hemiretinae',
-    'hemisegments',
-    'hemish',
-    'hemishphere',
     'hemisphaerica',
-    'hemisphere&mdash;for',
-    'hemisphere-specific',
-    'hemisphere.although',
-    'hemispherectomised',
-    'hemistichs',
-    'hemisuccinate',
-    'hemlock&rehy;leaves',
-    'hemlocks',
-    'hemmer/loose',
-    'hemmings/childrens',
-    'hemmingway',
-    'hemmo',
-    'hemodynamic',
-    'hemoglobin',
-    'hemophilia',
     'hemophilic',
-    'hemorrhoids',
-    'hemp-dressing',
-    'hemp-factory',
-    'hemp-fibre',
-    'hemp-seed',
+)
+
+blocks_74 = (
+    '"#i\'s#!r#!s"\'o/dodge")p-binding$#ras"!r##iii"!t"#udu!,u&eacute;gan*#nin*%rande+#igy,!n',
+    '+$oult$(circ;pes)%rande$%uml;i"!1#!0#!1#!2#!4#!5""22""35#!l"!5"!8',
+    ')!d%*r&aacute;n#&dalfeo&$that("is&\'upensis$\'eloupe.$$iana#$gara$#ing#!i$#aci#%javas$(ira--see##lco',
+    '$#ter%$ieri#,m&lsqb;seep.$&-belau$$bian&"no#%najay%!y$&gchang%&dougen%#han%"os%"si%"yi&#uan',
+    '%%dines(!o\'"um&&oamino%7ne-nucleotide-releasing$%juato$*o-speckled$!s$(talamera&&namera$/ylyltransferase$#zil#"pa$)or&eacute$"po',
+    '%+n&rehy;teed/#ing&%teed*)%s-see*./consequential\'"y1%%rapes$0d&ndash;operated&(rehy;dog+(sergeant%!\'%--at-all-times\'"wn&$book&\'captain',
+    ')%nging&$duty&\'hostage&&manned&$post&%rails&&school\'$tyle%!/%\'a-costa&"ll%&bridge%&edness&"rs%&ian(s)',
+    ')"in($/aip)#icm)#nus(&friday((thursday($ws17*"22+!7&"no&#ola&#sts%$ucci$&enteed%$schi',
+    '%!r%#sco$%nacci$*o&rehy;nam$&rantee#&stalla#&tavita$&emala\'($teco%%rnala#$vas.#$yaba%"na$#mas%!i',
+    '"#bay##bay&\'/marine$"ed$)le-gubble#$emii$$nsee$$rnia\'#ia-\'"ya%%sault#(ispolkom+!y#&pomgol)!y',
+    '%!s"#dea$$rian#%geons#$mund\'#son&#sen#%nason#(zhabidze"!e#&daffia$"en#$guen\'(-dreyfus#"ld',
+    '\'%masen$"en$!f$!l$"ma$"ta#$nage%$izia$%eizia$"on$\'sburger$#ter%$heri&#oer#&rcinos',
+    '%)&ntilde;o%"ro$*illa-style\'$eras%"na$(nesiaise%#ika%-sey-sweatered))to-dinard$"on$#re\'&(ro-girke&!s%+i&egrave;re&#era',
+    '&\'lla-led*&priest($eiro)"ra*!o&#sts$"yr#!s$+s&rehy;work%--the-composer*$word%!.%$able%%ed-at\'!.',
+    '%#in\'\'+g&rehy;game%(timation$)t-artiste&$chef&*friendship&\'hosting&!i&$line&(offering&*papamanoli&\'speaker\'#tar*$ring&\'workers',
+    '%$card%"es%&imates)#ing%$ling\'"st&!y%&master%$wick&%orker#$tary$$teur##ule$"ze#-vara-dreamers',
+    '#"ye#"zo"%farov#(fawingly$#one")g-gug-gug#&elhupf$&rbauer#,genb&uuml;hl&%hurli&%mania$!i$)ugguggugg%!m#%liemo',
+    '"%hirwa"*i-building$$eyed$+independent$$like$$ness$&shaped%$tyle#!4#"ac$#nas%#ese##bba$%ilini$&ourtia',
+    '$#urn#%chets#"da%&nce.he(+/regulation%%relli$*e&acirc;ne%!-&#dog&(lecturer\'#ike&$post&$rail&%ships&\'to-life',
+    '%(/courier&(explores%%5.tif%%8.tif%#ard%/books/brochures%)d-missile&!.%$less&%ines.*)/criteria*#and%%notes%%posts%%rails',
+    '%"s.%%wheel&&riters$#ici$&leines%$hall$$onia&!s%!s%#tti%"va#$erez##gal$"ma$$nard',
+    '%"on$#uet##hua#\'idlines#$lala$&d-hall*!s&\'revival%+/shopkeeper%"ae%(enstern.%*ford-based*\'related%"ry%%s/bec',
+    '$%efull%#lma%%mette%!s$%foyle$"io$*l&eacute;n%#ani&"ud\'#mat()e-raymond*&sanche%!e&#lmi&$mard',
+    '\'#ont(#ts.&"rm("us&#vic%&ielmus&!t%#ois&+n-laffaille&!t\'(ine-less)!g$!o$"t-&)absolving',
+    '&%edged&%laden&&making&)offerings&)provoking&&sodden\'\'tricken%\'/family&-worry/anxiety%$iest&$ness%%y.the#%maras$"et#0n&eacute;-bissau',
+    '$\'ea-gold\'(savannah&#man\'"en&#pig)!s&\'s-worth%%ensis%!o%#sss$$gand%#ona$&icelli%%forte$-ness-drinkin\'',
+    '))sponsored(+/distillers(#ens%#ion%$less$"on%!t#,p&acute;zcoa$#ure#,raud-riviere$"en#%sarme$.borough-whitby+\'skelton$*e-lorraine',
+    '$"to$#uga#$tane%"r-\'*amps-to-11\'&basher+#ing\'%crazy\')dominated(\'renched)#ive,!n\'&fakers)(scinated($ired',
+    '(&uelled\'%gauge\'\'induced\'%laced)#den($icks\'#mad)$kers\'%nasty\'(oriented\'6played-as-bacon-slicer,!r-!s\')shredding(\'mashing',
+    '-#ing\'+turned-bass\'$wise&$/amp*\'/effect\'$bass\'$drum\'(keyboard\'/mandolin/octave\'&octave\'*pickup/amp("op\'%vocal,#ist&0basseddrumsvoice',
+    '&"es&,ist-to-watch)(/backing*\'founder*&singer)$last)(magazine)&office&$less&"s.\'&trings&!t&$wank$!e$#ron',
+    '$#sch$#ton#\'wenneth#$xian$#ols"$j116#&aratis\'!s#.erati-speaking#$rant#$urat"!k"&l-like#&abganj$!i',
+    '$!m%#ali%%entum$$yman##bai$%eddin%"rk$"ot#\'chakhra$$icek#"da$$berg$%imann$$mann$"ne',
+    '#*f-inflated%\'related%#war\'&tchers$!o$7stream/sukhoisu-21gssbj$%watch#!g$#ula#"ia$$stan#$jaev#\'l\'s-eye$&-like.%%wings',
+    '$#een%!n%#yed$+fossburgers$)ibilities&(le/mitre%"ch%$kson%"tt$#mar$$otti$,s-in-waiting$&y-head&%riven#"on',
+    '#\'p-\'keep$!.$"er&!s#$sham#$unay#(yashchie##zar"&m-boot$\'chewin\'$\'digging$\'erosion$%resin$$tree$$wads',
+    '##ble$&olumbo%"ro$#urd#\'ercindo%%sindo#$ista#$mage$(erburger$#ies%"ly%$ness$"ow$#unt#*ption-less',
+    '$$hoes$$tool#$ucio$%shane#$wood"+n&rehy;room#!\'#1-and-olive-branch$\'battles%%earer%#oat%#utt(!s&$yers$&camera',
+    '%(onscious&$tton%$razy$\'dealers%"og$*embrasures&)placement/!s$\'flashes%\'or-hire&&unding$$hand%&olster%%ungry$\'killing',
+    '$%maker\'#ing%)icrophone&#kes$)ownership$(platform\'!y%#ort&$wder$$rack%%ights$#shy%$ight&#tes%$lits',
+    '$$team(!s%$ubes&$rret#(awardene$$ydin#&barrel%%ttles$&earers#$caps$$elin$!o%$tton$$rews$%tions',
+    '%!s$!e%!m%$rsen$"le$%obada$#run%!y$!u%"la#"es#(fighters%#re.#)g&rehy;ho$#-go',
+    '%#din%!h$"ed%#ing%!y$"ha$#ung#%hilde$#old##ier$#lda%"la#%khole#%layer#%maker',
+    '$-etal-coloured)$grey#&narson$"el&"ls%\'r/event&$sley%%sbury%!t$"ii%#ngs%#son$(laugsson%#eik$!y',
+    '%$sack#&odorum##pat$/owder-propelled)!y##s\'n&&\'poses\'%roses,)-appetite$+-for-butter$%eikan$"hy$(lingers1$%tocks&"ne',
+    '#!t$$bold$%erman&&sville$#ley$!o%$ters$!s$"ur&$rets#&walloe##yld#)zenhausen%$rode$#ler',
+    '#\'mindang&$tang#"rd#!t"$ppie&&s.they$!s""ra$#ges#!d$#eep%"r.#"el#+g&rehy;ling$#aon',
+    '$(le-croak%!y$$ureh#!i$"an#)kha-style&$land#!l$%-fren$"ey$!z#$mack%!n$"it##nan',
+    '$%emanz%!t&!t%,y-influenced$"is#"ov#%pinar##reh$#ies$!s#%sawak$"el$#ton##tin$$ovoi',
+    '%)economist%#led%&making%(oriented%%scale%!y$#dev$%sinha$$wari#%vitch##wen#&zenich"(sak-grin$#nos$!u',
+    '#!e$"va#%hings#"le$(yannikov#!s$#ago$"in$"ow#)t&acirc;v$%-free$*afaspegren%#ria%#tio%"vi',
+    '%"lo$$loff$#on.$&speeds"-t&eacute;rres$.rehy;wrenching#%-ache$&bucket&%sting$(churning$(dwelling$&father%#ear&&elings$(grapping',
+    '$%lurch$(reaction&%nding%(ottingly$$shot%&licing$\'tearing%\'wisting$&weight%*renchingly#&bucket#%cheon#4ehoffnungsh&uuml;tte$"ma$$rman',
+    '#\'fucking#+harc-ballin$-lac-reputedly$$mund("ur#,i&egrave;rez$$erez$"ng#$kind#(lessness#\'s&mdash$)-spilling$!a$%chmid$$eley',
+    '%!g%"ir%"ta$!e%"d.%%nberg\'$runn&$tags%\'r-borne\'%level(#ike\'$muck\'\'spanish\'\'weasels&"al',
+    '$#ies$%ridge$&ulatum%%rally$!y#.ullapollenites#&winski$$orms#!z"&v\'nors#"ec#$uryu"#wat"(y-fawkes%%isher',
+    '#&/chick$%owner$$tony#)anan-born&!s$"rd$"tt#%brush#$enne$"ra#(lfstream##mer#&nemers#+s&amp;girls$!.',
+    '#!t$#her"\'zelyurt$!v#$gogs#(m&aacute!$vcac""en$&hwyvar#"ro"!f"#h/g")iao*6.711#"ng""pg',
+    '!)w&ycirc;r"&-basic"$0fxa"$adar#\'gwalada#$ihir$"th##lch$$lawg#!n$\'dmuvver$%g-sik#$rdia$!i$+wyn-a-throt',
+    '$!h#$tkin"!b#$asic"$e/bw#"ek#$ilob#&ndolyn$#fro$%llian$$neth%"ie$!o$#yth#)rnaffield',
+    '%&haylod%"og""fr"#hrs"%illam%"im#!n$!e$!n%#ett%#utt"#lad%"fa"(m-oergwm#$/cmg',
+    '#)-designed$$type#,ach-y-rhibyn$$geth#"yd"$yane#"er#!l$$adys$"im$#los#%mrage#"ne$&fynydd$#ion',
+    '$(ne-jones&%/west!"x+"#/gx#!n"!6"!a"#c-1""f3"Fh5&verbar&verbar;rxh5&verbar&verbar;10"!i"!u"!x#$xxgk!$yaan',
+    '%$vain#!k#%ltsen##mfi#!n$(gz&ecirc$"ts#$pong"!b#"ed#!i"#eet#%nnadi"!f#"an',
+    '#$rwys#"un"$gaia#"es"#hll"$lbys#%eview#%fason#\'lenborg&&hammer&$ship$\'ingvase#"ys"\'m-slips#!.',
+    '$(training#&astics#$bobs#"er#(mistress#$nase&(ieskolan\')um/health&%tical)\'kschule%$zium$#ema&#ins$(ocarpium&%ladus',
+    '%-p&egrave;dies&%edies%\'sophist&$perm*"s.$#ure\'!s#"ro#%shoes$#oul"!n#-aecologically$*ndromorphs("us#(ecologic',
+    '$#sis$$well#(gell/boy##nne#!o$+centrically*"sm$&phobia"!o#$ezoe#%ngyos#%rgyos#"za$!o"&paetus',
+    '(!s#$glas##ing#!o#"po$!s#.sies&mdash;set%&ferous&#ied$&ohpila%&philus$.um-fibreboards&!s$&y-eyed&\'fashion',
+    '&&sailor\'$tyle&%woman%$fied%!s"(r-falcon##a96$#tor\'!y#\'e-scale$"ne#$inid\'"ae%(ocheilus%"us',
+    '$!n%"ey$+stabilisers$%trons#"we"$sin\'#$pies"#tha"!u#1lafeh&eacute;rvar%+y/petervari##rme$.sansky/nadasdi"%wneth$#oro',
+    '!$zhel"%iffra 3h&aacute;lig-fyrgen)"ma)$rosi#\'breve;f#*circ;fbach#\'elig;di("v/#"gr#+macr;tijaro$#p;k&!r&$sub2*"bi',
+    '#+ring;kanson#(uml;agen+!-,#daz\'"gg\')meenlinna\'#nde*!l*!n\'(rkeberga(\'rakalou(%tling\'$sler($sler\'&userer',
+    '"-eacute;0liaia)"as)+berg&eacute,!t)*l&ouml;ise*"as*+iographique*+l&egrave;ne)&risson*%odias+!s+%ux_et)%sione)\'verlore"$gt;0',
+    '"$khgr"$lt;h"*ndash;1062(#25a("51(!d(!f"*oacute;lar*-mgj&oacute;gv#*circ;pital("ra(\'teliere.!s#+slash;nning."-1',
+    ')#yre#)uml;cherl\'(egaarden\'%fners(\'udlausn\'#lle*$ntal\'&ntugen\'\'rigkeit(%nlund($oldt\'!t\'(y&uuml;k"*rehy;larna"$uuml',
+    '\'#ker\'%lstra\'#sch!#\'am#\'nswered#!s"#eye"$ford"!l""mm"$rull"$self!\'(start)!!+""10',
+    '""24""hr!#--h"+0193gb+++at"!1##364#!4""2k"&4/hk-1"#500"#713"#800"!9"!a#!s',
+    '"!b#%locks#\'omb/god&#ers$"ys""cl"!d"#e-m#!r"$five"&grades"#h-a$$h-h-\'"ad%#air',
+    '%)esitation%"ow$$like#"ad$#nds$$rder##ead%"vy$#els$#llo##ope$"ur"!i#*nstability"%jetty',
+    '"#m-s#%ethyl"!n#&umbers"!o#"-w#$ct-1&!2#$ighe#)meprazole"$pawn#!b"$reg."%shape"$thy1',
+    '"\'u-r-r-y$\'s-e-i-n&\'s-e-i-n#&ridine"$yrdn!$.-s."!2"!4"!5#+7&ndash;597"!6"\'a.p.p.y")bachmayer"*c.beeching$!f',
+    '$$p.t.$!s%!.#$line"$d.-4$"b.#!e"\'e.a.r.s$%bates$"o.$!p"$f.r."$g.t.$%wells#\'irardet',
+    '"$i.v.#!v"!j#&.heinz$$joel$"s."$k.b."$l.c.%#as.$"g."$m.f.$"i.&!5&!s%!s',
+    '&"0.$#the#"ay#%clean"$n.c."\'o.u.s.e"#p.i$"l.&"c.$!s#&erring##rem"$s.e.$"l.$"t.',
+    '#%ilver#$turm#\'wainson"\'t.-type#!s"&u.a.c.""v.$!s"$w.f.!+/00/22/0003($2001&&3/0006*"12+!5+!8',
+    '($2002+!6*"10*"24*"31+!2+!5+!7+!8+!9*"44+!8*"50+!5+!8',
+    '+!4*"70+!1+!3+!9*"82&&4/2002&&5/0005+!8&&6/0038&&8/0001*"62#+1/05/0001-3#)2/18/0001%\'28/0001',
+    '$(/25/0002+#5-1+!6"!c"!d"!h"!m#!c"#ne2"$rnas"#she"!v!"02"!4"!5',
+    '"!9!&1\'-gh8"$-box"$20-r"!3"!4"!5#!0#"9l""67$"\'s"!8"#97q"!a!$2&gt',
+    '"!+"(.3a/taqi"\'00/2000#!6#!7"!2"#5/3"!9"!a"$o(g)#"ff")receptors!,3\'-c3\'-o3\'-p$!p""87',
+    '!C4&verbar&verbar;nf6&verbar&verbar;6"!\'"!."!0#%0d(3)""43""68"!7""g7"$tf-2!"51"!2"!3""53"!8',
+    '#!-$#rna!#6++"#281"#312!"75!#814!"90"%1/369$#401&!3""5a""82"!9!":o',
+    '"#c/v"!d"#q=0!*a&amp;sup1#)iuml;tian#+lsqb;d&rsqb#(ndash;43)"re#%pound#)scaron;ek#*uuml;ynite"%\'apai$$retz#%chllt#%hotel',
+    '$!k$!r#%p\'oth$)ennyworth&"th%"th#!t"!+"*-bloody-ha#*chortle-ha#$emek$!r#)ha-haa-ha%!s$!m',
+    '#!m#%teley#;yoke-lesteck-cop-toke-chock"".i#"lt"#/44"!2"!3""=a"#aaa$0ooowwwaaaaooooww##ger$!s#!h#"la',
+    '#"nd%!s#%panen$#ens#"re$#hot%#uis#%velmo$/io&rehy;mannila##zen""b\'#&-level#"aa$!d$(nabakize',
+    '%&ushaka$$shat#&berjam&#ley&!s##eas%#tis$%ctric$$gger$#ler$#mus$$neck&"ra%!s$*rdasheries',
+    '%%field%"la%$mann%%shons$!s$"tt$"us#$ibie$&liment&&tating$$mana$"nb%%gtake$2ta&ccedil&atilde;o&&ciones',
+    '(!s&$t-16(*mothercare2$-bhs(%style\'#ive%"is%"of%+u&eacute;es&/al/made-strange)%usual($ized(!l&"es&#ses',
+    '#"la%!s$!o#$onim#.r&omacr;nichos$\'onichos#2sburg&mdash;valois($-led*)othringen)\'ottoman#!t""ca#%conby$!p#\'endados',
+    '$%ttepe#"ha$!e%"mi%$ston$$ioji$$ured#%idena$-enda-friendly#(k-\'em-up%(produced%\'written$%brett%#uts\'$ters',
+    '$(ed-about\'#off("ut&$_out%"ns%%rgill&!t&!y$"it$"le&(-raising&#ton&!y$,man/national$)ney-based',
+    '(1islington-lambeth\'(/general\'!s$$outs$%sawed$!t%$horn$$work#!l#$ucho"1d&zcaron;i-prodan#$-all$$been$$done$$felt',
+    '$&longer$\'married$"no$\'working#,.anticipated#$/had$%would#\'_a_good%!t$$each$$less#!a$!d$$mard$!s',
+    '%#sah#$daaj%#oui%#way$#ing\'(tonshire%$scoe$%lesey$.ock/stonemason%+n/charlbury&%stone%"ws##ebe$#jia$$ngue',
+    '#%felds$/ield-manchester#$gone$$raft#$hams$&lamaut$%maill$%ramis#"id$"ng&#ton#)j-slimane$#era$!i%&bajric',
+    '%&loucas%\'matheou&\'ichalis%)paterases$\'ouannou##klu#$lees%(y/julian$#ich#%maill%!n$#ire#$n\'t.$!a%"ll',
+    '%!t#"on#%ramat%!t$3ianic&rehy;antonine\'!s%#ght$%osaur#-significantly$$tock&!n#%vance#"yn#\'zibegic\'#jic',
+    '%(omerovic"(ecceitas$!k%"er#%drich#"hl#"im#&kkerup#)m-binding$*a-dementia%$cell&(ytometer%!l%%nthus%$stix',
+    '%*temesis/or&%inics\',te/magnetite*(siderite)!s&%obium\'\'chylous\'&genous\'6logist-hiv-coordinator\'$mata\',pathological(%hagic(&odidae\'%rcrit\'\'spermia',
+    ',!e,!g\'#zoa$"ek%\'rythrin$"ic%!g$\'morhage$!o%\'-cheese%%bilia&%lobin%%coele\'(mpatible\'+ncentration',
+    '+)-carrying,)measuring,$plus++/creatinine*"on%%lymph\'#sin\'+tic-uraemic%*phagocytic\'%ilias*"us&%oetic%\'rraging\'&hageic(%oidal',
+    '&\'orption&%tamen%&thorax&%oxins#"na$"ey$$lein$\'mastoma$#zel#%redes%!m%#ses$#ing$\'teliana#!s',
+    '$$sler#!v"#far$!z#!e$!d$"tz##fen&#den#"if$"na$!s$$zlaw%&zollah##kin',
+    '$"in&#ger#.narfj&ouml;dur$*er-devised#)odgynfawr#!r#"to%!n%#rah&"ot$#vad"-g&rehy;ridden#&-faced%#ish$%rides',
+    '#$anah$"ra#&bourne),/oxfordshire#$dahl$"om#"ee$"ge$#man$)n-william%$aars%"ia$#ray%!e%&sville',
+    '#)fish-like#&gadahs&"ot%"ge%)rd-jelkes(\'looking\'"ly&!t\'!y%!s$"en%\'rleases&!s&,ty/dumbarton$"in',
+    '&!t$$lund$$rieg##ioi%%scope$"tt#$like##ood$$pian##rig#$stom%$roms#!t$!e##ue/',
+    '$#ing$"up#$aha.&\'hahaaha*&hahaah."ha0$aaaa0*hahahahaha:"ha9Fehehehehehehehehehehehehahahahahahahah%%hahah$&inetsu$!m$!s#"hh',
+    '##nel%%manns#\'telekin"%ibach$"el##fa1%\'72-5166&"34#(g-haddow$!.$$hway$!s#"he#$kett$$ings',
+    '#*l-and-ride%%storm%$type$%ebury%(y-hailey&&burian$"ie$$land%!e$!p$+sham/former%$owen$.wood-liverpool##man$"be',
+    '&"ic%!s$#son#)ne/mother%\'s-young$$feld$"in$#out$#ton#.r&rehy;pulling$!\'$"++$!-%%bands&&rushes',
+    '&$lips\'#oth&(oarsened(#ted\'#mbs\'"rd&$ream&&urlers\'$tted%)destroyer&%otted&&resser*#ing&%yeing%+enhancement',
+    '&#orm&&ringes%%grips\'&ooming%&havin\'%#lip(!s&&otions%)ornaments%%piece*!s\'!n&%lates%&raiser&%epair',
+    '&%ibbon&$oots%&shaker\'#irt*"ed&%lides&(plitters\'#ray&%trewn(%oking\'%yling*"st%&tearer)#ing&#idy',
+    '\'$pped%&weaves&#hat$!/%&making$&aisers$(braiding(!n)"ed$$clip$!d%"re\')sser/poet$*e-sargeant$\'flair/a',
+    '*\'clothes*%fresh*#hot*(macleans+$ovie*$poly*(quickies*$rose*)supersoft$!i%"ng$(lessness%#ing$!n$*pin-shaped',
+    '$%shaft%$mell%(plitting&$ring%!t&$yler*!s($ists%$uits$!v$#way%$orks$(y-backed&%faced\'%ooted',
+    ',"ly&%scary&$toed%$tale#\'sthorpe#!t$%field$$inck$!o"$jadi&(-solomon$$rden#%ducki#"ek#"ij',
+    '#&rullah##tos"$k-is#%agawa(%-like$"ma$%ridek$"ta$%zawa.#"ea$"im$!n%%kreuz#$hurk#!i',
+    '$#kar$"ng#"ka$#ert#$mana#(onechloa##una#$weed"1l&aacute;nk&uring$(eacute;n#&-marut##/3f##aby$#icu$#man',
+    '$!s$"ta$%ucest#%barad$+er&rehy;ton&!g&1staedter-prowazek$#ish&$iana$$outy$#ury##con&"es$"ro&"ws',
+    '#"da%,ne-priestley/!y\'"an&#ian$$wani#&e-wood$,/cheesemaker%%nurse%&thames$%akala$%combe$%foglu$&pensis$"rs',
+    '%#ome&!n$"vi#*f&mdash;on%)ndash;nay%,rehy;an-hour++ssimilation*(believed0#ing*\'century+%losed.#ing**decomposed+&ropped-$wned',
+    '+$mpty+&xposed*$full*\'glasses*&hidden*)intrigued*(jokingly*)listening*$made,&rathon+)illennium*%naked*$page+\'romises*$read',
+    '+\'iblings,&lenced,"ze+%moked+&tarved+\'udanese*(thousand*&volley*#way$#\'un$#(s)$#-a-\'.billion-dollar)$tter($rick',
+    '(&ircuit("up\'#day(1ozen-of-the-other\'#man\'\'persons(%oster)#und\'&repeat\'&second(\'ixpence\'.thumb\'s-length("on\'&winter($orld',
+    '&\'ccepted\'&hieved\'&torish&&dmired)%ssion\'$ozen\'#ult&&frican&+ggressively\'&onised\'*ricultural&$lert\'\'ternate&\'merican&*n-elephant',
+    '\'(glicized\')niversary\'&swered\'*ticipation&#pes\',ologetically+%ising\'*prehensive&%rabic\'$ched\'%oused\'&ranged&*scriptions\'%hamed\'#kew',
+    '\'(tonished&(ttending*$tive(&racted&#unt)!s&%wake.%*b-b-bottle&#all\'"r.("ed(!s\'&stions&$eard("st',
+    ',!r(%onged(!t)"ed\'"st&&illion\'$tten&$lown&%oard.\'$dies\'$iled\'%lting\'"nd\'#ots\'"rn',
+    '\'$wing\'"ys&$reak)"st(!d)!s(+edfishermen\'$idge\'$ogue(&okside(+ther-in-law&%ucket\'"ll\'$ries\'"tt',
+    '\'!b("in\'"ke\'&nopies\'&pacity\'#rry(#ved\'%tches&&ertain&&hannel)!t*"ed(%rming\'&eyenne\'%oking',
+    '\'*vilization&\'lenched\'#oak($tted("wn&\'olonels($umns\'$mbed(&mitted(\'plement+"te-)-skeleton\'(ncealing)$orde)%ussed',
+    '(\'trolled\'$oked\'$urse($sins&&racked($nked(%wling("zy\'#eam)%tures(#dit(%scent(#tan\'(itically\'$ouch',
+    '+#ing&&urious(&led-up)#ing($tain,!s%$daft\'"mp\'#nce\'&rkened\'"wn&&ecayed(\'omposed\'&flated\'$gree',
+    '\'\'lirious)%vered\'#mon\'%nials\'%spair&"id\'(scharged(&gusted(\'mantled)\'embered(&turbed\'#ved(#ing&"og\'"ll',
+    '\'#sed)!s\'$zens(#ing&&rafted(!g)$ging\'%eaded*#ing)$mily+"ng*!y\'&owsing&"ug\'%mmies',
+    '&\'gyptian&$ight&%lated\'%lipse*#tic&&mbrace\'%ptied&)ncircling\'$ough\'$vied&%rased&&scaped\'$kimo\'$ters&*xasperated',
+    '+#ion\'*hilaration\'&isting\')pectation)\'rienced(&lained\'&tended%$face)$lift(!t\'%ntasy&%eared(&thered&(ictional\'%lling',
+    '\'"sh),-half-insect5(-looking&#lag\')irtatious\'\'uttered&&ocused*#ing\'$lded\'(rgetting)&ot-ten($ming)&ulated\'"ur&$rame',
+    '\'"ee)$zing(!t\'(ustrated&(ulfilled\'$nded\'$rled(&nished%&gallon\'%rbled(%rison\'"sp\'"ze&%hetto&\'igabyte',
+    '(#nce($ssed\'$obes(!w&#oat\'!d&*randfather(\'pefruit("ss*!y(&tified\'#eek)!n*!s\'$ound',
+    '\'$ilty(#nea+!s\'6ttersnipe-half-muezzin%$half\'"nd\'%rdies&#ead($ling\'&dgehog\'%eding\'"ld&(ibernate\'!d\'$pped',
+    '(&chcock*"es&#oop\'%peful)!s(#ing(#ped\'$uses)#ing&#ull\'&morous)"ur\'%ndred,&weight(#gry',
+    '&\'ypnotic\'(sterical%!i&"ce&\'dentify\'"ol&(llegible($icit(%usory&\'mmersed\'%plies(\'rovised&&n-half\'+capacitated(\'h-thick',
+    '(#ome\'\'dignant\'&flated\'$sane(%pired\'&tended\'&vented&)ronically&#ssa%)jocularly\'!g&%umped%&karian&#ill(!o',
+    '\'"ng\'\'slevite&(nackered\'&eeling(!w\'&owable)#ing,"ly&%orean%&labels\'"ce\'#den\'"id\'"nd\'!p',
+    '&&eaning(#rnt\'"ft\'%ngths\'!s\'&velled&"id(!s\'!e\'%fe=19*!2)$size($ting\'#tre\'$ving',
+    '("th\'"ok)#ing\'"ud\'&wering%&maimed\'%naged(#ned\'&rching($ried\'"sk\'\'tch-fee*"es(#rix\'%ximum',
+    ',!s\'$lted\'&mories*!y\'(thylated&(ile-high*$long(!l)&ennium)&imetre*)on-dollar\'$nded\'&strust&$oans\'\'lecules',
+    '\'#ral(%ibund\'&urning("th\'&vement&$usty\'"tt)$ered&\'ythical%$nail&$egro&$iece\'$ghts&"od($ding',
+    '(!e($iced&\'umbered%(obscured&\'ccupied\'$tave&&ffered&!n\'"to&+rganization\'&iental(%ginal&(stlander&%unces\'&traged',
+    ')%heard-#ing&$wned)!r%$paid\'\'nelling(#ted\'%rodic\'0st-bleedin\'-four*%eight*#one*#six)%ed-up*$ight\'%ttern',
+    '\'$eled\'%nnies)&yworth\'\'rceived&&hantom\'!i(*losophical&\'ictures\'\'lasters($lars\'%nhead\'#tch*"ed($ying\'#vot',
+    '(#yed\'&eading)\'surable\'%ucked&#oet\'&isoned\'!t(!s\'$unds&\'repared((sentable(\'tending\'$iced(#est+"ly',
+    '\'&omises($pped($test("ud&&ulling\'$shed%(quartern\'&estion\'\'izzical%\'raising\'"pe\'#ted&(eactions("dy(!l',
+    '*#zed(!r\'&called(&lining()ognisable-"ed,#zed($ruit\'\'fuelled\'\'gretted\'&leased(%iable)"ef*#ved(&uctant',
+    '(*roachfully(%ulsed\'\'sentful."ly(%olved((pectable,"ed(%tored\'(volution*"ve&$hinu&%idden\'#ngs\'#sen(#ing',
+    '\'#bot\'"ll)"ed\'$ofed(!m\'&settes\'$tten\'&undels\'!w&%ubbed+$-out\'%inous\'%nning\'%ssian%#sad',
+    '\'&ltires(#ute\'$moan\'"ng\'!w&(cholarly\'&ottish\'(rambling(%eamed)#wed&%ecret\'\'duction\')en-unseen\'"lf\'$nsed',
+    '\'%rpent\'!t\'%vered&%haded)$owed(\'mefaced(#ped("rk)!p(#ven\'$eets("ll*$/and\'%ocked("es',
+    '(-t-marble-eyed&\'ideways\'"gh((nificant\'\'mulated\'+ster-in-law\'!t\'#ze.)!s&\'kipping\'#ull&$lave*"ry\'$eeps)#ves',
+    '($pped\'%umber)#ped\'!y&&mashed\'.ile/half-laugh\'$udge&$nake("rl&%oaked\'#ber\'"ft\'#lid(#ved\'(mersault',
+    '\'#und(!r\'(vereigns&$pace\'(ectacles(#ech("nt\'&illing\'$oken\'&rawled&$tack*"ed(%ndard(%rving(&tement',
+    '\'#one(!p)%pered\'%range+"le-!d)(tocaster\'%uffed(%mbled&&ubdued\'(cceeding*"ss,#ful\'"nk)"en',
+    ')&ressed\'(rrounded(&viving\'\'spected*$nded&(wallowed(!m\'%edish&)yllabuses\')mpathetic\'#nod*!s%%taken\'$pped\'$rtan',
+    '&&earing((spoonful\'%mpted\'$nder&$hing)$king\'%ought\'#ree(%ottle&&ickets\'#led\'%mbers("er*!s)!s',
+    '\'&resome&#old(&erated\'$nner&#rot)&skyite\'%usted&(simshian&#ube\'$cked&$wist\'!o%)unbuckled)&ttoned\'$cial',
+    '((onscious0$ness\'#its&!p%)vegetable\'"il&\'illages\'%sible&%oices\'\'lunteer%$wake\'"lk).s-half-carries(!l\'$rily',
+    '\'%tched("er\'%yline&%edged\'%lfare((lingtons("sh\'%stern&&hicker\'#ore&&inding)#ows(#try\'$shes)#ing',
+    '(&tingly&&orried&&rapped%$yard)&lander-!s\'"wn&*oung-woman%#zip$(.century%#day%$hard%#liz%(stepping%#the',
+    '$&asleep$\'believe%$reds$%caste%&hances$%dozen$"ed%$head%\'xpected$$full$$hand%*eartedness$"ie%\'nvented$%lives',
+    '$(marathon%+ooncrescent$#oes%"fa$#pan%%ence\'\'#nys%$ipes%$ound%\'repared$$star$$term%%oning%$ruth)!s',
+    '\'!s(,-intelligent%$idth$!y%#ear#$hill$#oul#!i$+ae&euml;tus%!m$#bin$)carnassos$#den%"om$#eis',
+    '&$tica)"ks$"fa%!e%%irien$%meter%\'ifolium&#one$$otis$!t%,osis-causing&#tic##kci$#ebi%!n',
+    '$#ola%!n#3l&eacute/barbirolli,#pye%*rehy;patch$!\'$&-based%\'chamber&(orridors%%floor%%house%2jones/conservators%$keep%\'landing&\'essness',
+    '(\'mirrors%%piece%%stool\'#yle$./acupuncturist&"sh%$blue%&deputy%*eyewitness%#gun%*hair-flair\'$ngar&\'ereford%\'manager&&eeting',
+    '%&oxford%#pub%\'rambler&(eporting&&ichard%"uk%*vegetarian$%adale\'!y%&gather&"er%"ig%(lhotsoot%.m&lsqb;00&rsqb%#way',
+    '%"ut$%crest$$door$,e/barbirolli%"ck%\'nkirche%$rtau%$sque&$thai%)tt/course%$ujah%"ys$*grimskirka$%house$$iana',
+    '(!s%\'day/car))protestor((an-style&"ie%#fax%$keld%!m%$ngas\'#dal%!s%"ty$$o-ed%$rans%!s',
+    '&$bury&&ed-out\'%ening&-s-on-the-wall$$pike$%rooms$%s-run%#ide%$trom$\'tourism$*ucination\'-!.-%s.the(&ogens.$$vard',
+    '$$yday%#nge(!s#&mahera%$tite$!o%!s#$naby$"on#%o-bea%$pool%%spots$!.$(bacteria$$gena',
+    '$"id$\'ns-1211$)phosphate&#ryn&$ytic$,rrhagidaceae$"va$!w$%zyfop#!p$"en%#rin&!t#.sall/assistant$$band',
+    '%$town)\'-vorvas$"ke$$mann$"or$$pach$*tead-based(!s&$nsen$#way%#ell(!e#(t.joseph$#bar$(enbanken',
+    '\'#top*!s$&icinae%(ng-place$2on/buckinghamshire\'%chief#"uk$"si$"va#"va%)rd/scand.$#erd$"in#%wachi\'!s',
+    '%"ys#$yday$$ness$%sites""m-$%actor%(nd-salad$$bone$*fistedness(!s%%ooted$%hands%$ocks%#ung$(operated',
+    '#!1#!4#\'a-dryad$%guchi$%hamet$!l%$ayas$%matsu$"nd$#rat%!i%$lant$(s-backed$#tos%"su',
+    '$%yadji#$bach%"yi$#isa$*le-le-rice$#orn&$ough%#urg$%raeus&#ugh%!e&!y%#ose$$strg$+urg-america',
+    ')#orn(&munich\'*er-flipper/#ing*&shaped\'#lar$!y#"da%"ni%"rd$#ija%&lallah$#oon%"un$!u',
+    '%"an$\'enlinan$!h$\'knitted$$ldon%"yn$)r-adopted%\'/living%$mesh$!t$$ward$!y#(fistedly$#ord#%gyong',
+    '$"da%!i%"ou$"et$!l%$ford%+ton-edwards)%gibbs*%ordon)\'parsons)\'russell(\'/dorgam)\'penguin($hill(!i',
+    ')"is$!m$&rostra$#sch%*h-hamilton&%awari$#tes%"on#(let-like&#ish$#ike%)n/moseley%#sch$)yn-wright#$mack',
+    '&,iinformation\'%prime%#mat%$rbys&-skj&oslash;ld+&uml;ld\'#ten()r&ocirc;m)"om$$elis&!l%+r-and-anvil+#saw,%ickle+%tongs',
+    '($lows\'%ended\'&footed\'-hammer-hammer(!e)$aded\'"in\'#man\'\'on/pull.%-offs\'$pond+!s\'6the-dispatch-box-major)#row,#ers',
+    '&\'/eagles&$beam\'#low&\'clavier&%ed-on*"ut&&ing-on)$.the&$lock&$mate&%skins($jold\'%lough(!y\'-mith-richmond',
+    '%!t&\'schwand$#ick%!d%!e&!r%"ly%%nkeln$$ling$$mers($mith$#net$,ock-breasted(%nests%*nd-trained',
+    '(*goalkeeper\'#est&(s-should%!u&"da$$udah#$nish\'./herefordshire#\'orrhage$$udah##pas$3den/buckinghamshire(+oxfordshire$"en$!i',
+    '$!s%/hire&rehy;based)%-born%0tead-in-the-city+"sh$)ton&mdash\'*/leukaemia\'%shire#"ra$#uer##sey$$hire$#low$%phire%"on',
+    '-"30-"41%"ed%$reet&*ing-victim)#ing$"un$$well#&tramck$"un#%udava$$late%!i$%nyela#&worthy',
+    '$\'overian$$shan$$yong#$adib$!e$#lei$$niah$"pe&"rs$#uer$#van#%berry$"in$2orough/oxfordshire$,rook/printer',
+    '#!c$#her$,ock-beaulieu\'&/peter\'#ian\'!s%)x-trained#5d&mdash;in&mdash;hand+#let%.rehy;colouring+&rafted+$uffs*(me-downs+(odelling*(selected',
+    '$"\'t$(-and-arm)$foot&&pplied*+qu&eacute;d&\'ssemble&"xe%\'baggage)#ing\'%rrows\'$sket&&earing(#ten\'&ndable&$ills',
+    '&%olted&$room%+candlestick("ed(#ter\'#ses&&halked\'%ecked\'%urned&&lapped("sp*#ing&%oated\'#ded(#ing',
+    '\'%mpass)\'osition\'(ntrolled\'%olers\'$pied&\'ranking&#uff)"ed\'"ts($ting%*decorating&\'irected\')stributed&$rier*!s',
+    '\'"um\'#yer(#ing%\'editing%$fast&$iled(#ing\'$nish+#ing\'#red\'!t&\'lapping("sh\'#own\'$ying',
+    '&%lazed&\'renades\'#ips&$uard%(hammered\'\'rvested&$olds%(in-front(&pocket((the-till%#job%%knits)#ter%)labelling\')ce-making',
+    '\'"mp\'%ntern\'&unched&%ifted\'"ke&$ooms%)magnifier\'"id).-cum-companion)!s(#med\'%ssage&&ethods&*icrophones\'$lked',
+    '\'%rrors\'#tts\'#xed&$outh\'#wer%(numbered%(of-death(#god&!n\'%-knee&,ut/worksheet%&paddle(!s\'&inting\'$rsed',
+    '&%enned&&icking\'#ped&%laced($ited\'$ough&\'ortable-*/car-phone)"ed\'&stures\'%wered&$ress*"ed\'#int\'&oduced',
+    ')%elled%%radio\'$ised\'#kes&#ear\'$lief\'#sts\'\'writing&#oll)#ing\'"pe&%ubbed%#saw&\'couring\'$rawl',
+    '\'&ulpted&%earch\'$lect&%haped\'&unting&#ide\'$gnal+$ling\'"ze&\'lapping\'$iced&\'oldered\'"me\'$rted&&panned',
+    '\'#eed\'#ike&%tands\'$rike)!p*#ped%%tamed&(hreshing(%ottle&$ight&$owel*!s&\'ransfer(%verse\'%immed',
+    '*!s&$yped%"up%#wag\'$rmed\'$shed&$heel&$rite\'#ote((ughtness$!/%#eye%\'forearm%(reshaped$#_in',
+    '$$axes$&bagged&$sins\'#ket%\'endable%%olted&#nes&(ok-brief()/calendar&%rough%!r&&eadths(!k$&chimes%#iap',
+    '\'#sps%(olouring%\'rafting)\'manship&$eams%)uff-cases(#ery&!t$!e%%lians&!l&%sbank($latt\'\'eksamen\'#ges',
+    '\',organisation\'4register-verzeichnis%(rkechief&)shojkolen%!s&%blatt&1lh&oslash;yskolen$\'feeding%#orm%,ul&mdash;now$(i-capped%"ap%#cam\'"p.)!7',
+    '("er($ped.,#mrs("s.&,raft-workers*$sman+%woman%$date%#est%%mates%!n&!\'&%g-out$$jams%#ob.',
+    '%.ammer/managing%.erchief-before-$size,!.,%point%#ies%#nit(#ted)#ing$&lacing%%e-bar("it\'$free\'(operated\'&shaped',
+    '\'%width&$/gut&$able&0bar-moustachioed&+d&rehy;vase\'#.38&$less&\'s/lines(&shafts&&y-page(&smiths(&taylor%$ight&$ners\'(g-others',
+    '(%/work$$make&%rbled%#ill&$rror$"ni$!o%!u&*ts/posters%,ver/takeover$$pick%$lant%\'ortable%$ulls$&reared',
+    '%#ill%&olling&"pe$$s-as&@flat-against-the-roof-of-the-car&"of\'%n-hip,!s)&plants)4regulator-and-shovel)\'science%,.photographs%!/&%hotel&$they',
+    '%$crew%"el\'!s&"t.\'$ting&!w\'!n%%haken)!r($ings\'#pes%#lap%"om\'&e-ugly(*ly-coiffed',
+    '(!s&!n%$pans&#eed%#shh%"ta&$itch*#ing&#rap&#urn%2worth/soho/lozells$!t%%apper%%hrown%#ool',
+    '&$wels$&warmer&$shes%&orkers&#und%\'ringing\',ting/drawing$\'y-dandy&&helped&)to-get-at%&/crime%%banks%%sides%%woman#!e',
+    '#)fstaengel$"ul#*g&rehy;ing$%-fire%(glinding%"in%+on-the-wall&#uts$$able&#out%%daala%\'r-crash\'%sized&$ette&$tner',
+    '$\'er-full&"s.$\'gliding$$ing\'\'\'-banana(%space)%traps\'(.another\'"ge\')s/posters$#kow$"le&!t$$ment$#ook',
+    '$$zhou##ifa%#eet%!i&!n$!m$"na$#sch%!h$"ya%"eh##jin##ked%!i%\'rchiefs',
+    '&#ton$#ham$#ing$"ly$*s-balanced%#haw#(leybased&!s$#ost#$mare$(er-lloyd&\'/bishop#&n-byrd$$abus%*ford-smith',
+    '%(h-barbra&!.&\'/former&%stown%)m/bloxham\'(chipping(%ulham\'*gloucester\'%marsh(%ilton\'%stowe(&windon\'+westminster((orcester%"na',
+    '\'+/headmaster%$wora$(ebrother%!d%"ke%%lfoot&!l&#ore%!r%"tt\')-produced%-y/oxfordshire$%i-bal%$bals%\'ngfield',
+    '%-ver-to-london(#ian#$omag$"un$\'verhill\'!s%"ia#$reck$!y#&s-adam%(eberhard%\'gerhard%%heinz&%ubert%)j&ouml;rg',
+    ')!e&&uergen%&ludwig%%ruedi$\'a-taube$$comb$%emann%(n/second&"ne$5ford-miller/historian$$gert$"hi&!n$"il$)j&ouml;rg',
+    '$#ley%"ow$"ma$\'on-lowe\'%style&&/oscar\'"pa$%worth#$tish$"le$$rais$!u$$zsch#(u&scaron$!a',
+    '%#kah#$yang$%thing#"ze%"li$"ir&!a$!o"$obam#%uaria%!s",p&rehy;pened#\'-hazard$#p-p#&aranda',
+    '$!n$%slagh#.hazard-looking)$ness#!i$"ly#"ke#$land$$oids%$tyoe\'#pe.#%oalim#$part$"ed%$nded',
+    '\'!s&,ed-yesterday(&.anger))meanwhile("at\'#ing\'"nd\'"th&(ing_even))s/events/&+s&mdash;the$!i%\'-coated%"es%)ly-monied',
+    '%%ness-%)sburgians$$oens$%pened$.y&rehy;looking%!-&)everafter&(families&,go-luckiness)%spend(%lucky&\'looking&(new-year&$snap*$ping',
+    '%!.&!i&\'natured%*/frivolous%$_now%&hansel&"ol#!s$$ford$&ichord$#ley#+ten-binding&!s$"ic&!s',
+    '%\'therapy"%qa\'iq$*griculture$"ni#"ue""r-$-r-r-ooo-m-m-f(7r-r-o-o-o-o-m-m-m-f-f-f\'\'oom-mff%!o$"tu##.10$"21#&a_kiri$#hap',
+    '(1i-inqilab-i-islam$#ldo&(schullzi\'#eth$&mboure$"ng&(uestress%!t&#ova$#pha$!q$%rdera$#sov%$sers&%ment.',
+    '$&wanken#!b$%ajahn$+er/sculptor&#ler%#zza$$icht%$nder$$oard%!d%)ld/newton%"rd\'(-hammond&#ing%(ur-moles',
+    '*&tching\'\'/thames\'#age*!s\'$head\'\'masters\'$view$$utts##cas$#h-a%"er$)ombe/west%$star%"un$$ross',
+    '%,rehy;done-by*&headed+%itter*$luck*\'pressed*%ships$%(e)st$(+groovey$.-act-to-follow&)s-a-board(%flint%&beaten&$lown\'"ue&$oard',
+    '\'%iling&(reathing&\'ut-fair%$cash&&hasing\'%ested&\'limbing&$oded\'#urt&/urrency-earning\'"ts%(discount(!k)!s&$rive',
+    '%&filled\'$sted&\'letched&)ought-for%(grafting%&handed&\'eadedly)#ing(&rtedly\'"wn&,it&rehy;ting%&knocks($tted\'&uckled%&labour',
+    '&%earnt&%imbed&&obbied\'"st%$made%%paved&&laying&$ower&(rogramme.!d&\'unching\'$shed%&reined&%idden%%saved',
+    '&&cience&&elling&&liding\'"og&&moking&$oled&(tretched\'#uff%$tail)#ing\'$xing&\'hinking&)o-achieve(\'come-by(&defeat',
+    '(%judge(&please)(ronounce+"ve($read*%place*%verse($sell%&walled&%inter&#ood\'"rk)5ing/reliable/punctual%&yellow$(/applied',
+    '%$pure%(software\'\'mething$(=working$#ach$)b-b-broom\'$room%$ack.&#ked&"ll%&oarded)!s$*cache/esdi&#rds&#ses',
+    '%)ore-crazy($.ram(4/ragga&rehy;oriented)&techno&$vers$!d%"en%$isks$\'ecnudth%#ley%\'n-jones&%beger("rg*#her&(ed-steel',
+    '\'/r/preservatives(!s&\'ing-off%-r&rehy;headed,$line&&-fired\'\'hearted(&itting\'*to-realize&(_because%/st&rehy;pressed\'\'-boiled(\'hitting(\'to-bear\'!y',
+    '$#ham&!t%#ead(&edness%$urst$&i/gari%"es%)ng-newman\',/businessman(%clock\'#ton%"sh$&knocks$!l%"ey',
+    '%&y-used$4man/chairman/swindon(,professional($west$%ness.("es%#ose$"on$$pack("ed%#ool$$rada$$sell%#haw&#ip.',
+    '&$ones$$time$"up$(ware-and).considerations))dependent+)velopment*(ominated)(enhanced)%fault)$wise(!.)%based(!/)&device',
+    '%,ick/prisoner&#dge%%orked$"y\'%\'-hybrid&\'looking&%style%&/actor&/gloucestershire&&hostel#*e-coursers%$duke%$hare%$like%(niemeyer',
+    '%%traps$\'/jekyll$#ide$%l-bey%"aw%&egging%#ips%!l$(m-master&(shagging&$type%!.%$eare$"ng$#rge',
+    '$*wood-grown(!s$!y#"ff#%gadon%$rave$#ens$5reaves&ndash;robinson*+-boothferry*\'/britag%"im##ham#(i-george%$kiri$!a',
+    '%"ul$\'chandra%$leia$!f$#lal$"ma$"na%"gs$\'onville%!t$(poonchai$(shankher%"on%"sa$"th',
+    '#%jinda\'"er%!t$!o#$kavy$%ening%$r/we$#huf$!i%$lees%\'ng-back%(shanpura$#lie$"us#\'laching',
+    '%&n-olac$#ean%!d%&mation%"ne%"on%%quin\')*-trousered)!.)"s.*"15*"20%!s$"os%(t-nymphs',
+    '&"ts%%wbury&!s$#ton#&m-doer$&aliyah%\'n/rspca&!s$"by$#ed.%&lekopf%*r/national%!s$$ful.$%inder',
+    '%#son$,lessly-named$\'oglobin%#han%"ko%(n-martin&!i\',c-generation()/rhythmic()a-playing)-lly-conceived("es("on("us\'"is',
+    '\'$sers&"y.\'!s%#sts%$umou$%scara%&worths$"ut#%nasie$"by$$eses&\'s-break(&makers($work\'$able',
+    '\'$like&./environmental&$sway(#ick$#uma%"na%(tiounian$+vn&iacute;k#+p-harmonics%$like%&shaped$&agodes\'&phytum%#los%#que',
+    '$!e%#den%%neden%&r-bill&+/consultant\'&father\'&mother&"ig&$land&)perennial$!i%%gnies%$ness$2ley/worcestershire$*oon-shaped',
+    '*!s$$reet$&string$#ton%#ree$%ullia%\'r-crewe$&y-like%!1#(quebuses)#ier#&rachor%$dine%#gan&"in',
+    '%%ssing%%ughty$#ess&#ter$%icana%&erjets&+s/associate&/t&rehy;meredith%.ngton/non-fund+%video%&s-born\'\'leeming\'%style\'$type\'\'warrick',
+    '\')beekeeper\'&centre\'(hospital\'(imperial("tn\'&jaguar\'&mobile\'&oxford\'$road\')secretary("on\'$wife(%olves&)education&\'on-like',
+    '(0/gloucestershire)%video)$west&#ton$!o%"ck%\'d-domar\'&eagles%)gate-born)*/yorkshire%"id%"ll%$uchi&!n%%vians',
+    '&\'-on-the&)er-peters()/managing&%house$!s$!t$$umph$\'y-style%$ing.%#son#-sd&ouml;rffer$!e%#lly$\'h-boned&&leaved',
+    '%&barger%%ening%"in%*ly-clipped(*suppressed%&nesses$%iesis$#ley$$net.$"on#&t-brio%&davies%&fuller%,scott-rodino$*/education',
+    '&"t.%%local%(national$"al%#rto$)beespoort&"rg$#cup$*ebeesthoek*!s%$kamp%%n-ash\'&oudijk&$fels%\'r-craft',
+    '%$well$#hay%#orn$"ie%$shek&$mere$&kaiser$+lepool-born*!7\'\'udlians&"ss&.tt/headteacher&2y-russell/resident\'$/car(\'swindon',
+    '%!y$%manns$\'onclean$4pury/gloucestershire$%riett&#ggs$2shill-stockingford%#ide#"ue$#mph$+n-al-rashid%"da%#ori$!o$)spication',
+    '#1vard&ndash;boston\'&-based(\'trained$"el&!l%)st-fields\'\'/divest\'$able\'#er.)"s.\'$ing.*\'_rather\'#man("en%"y-',
+    '\'&jones/&\'/victim$(ie-brown%$nder$!y##way$)ell-based(#led$.ich&ndash;hook\'&-based()to-london&!k$+ood/captain/\'/oxford#$yadi',
+    '#)zburgites$"er$,ianopyridone\'"um$(querbahn"*s&rehy;had)"oh##\'nt$!t#%-beam\'"ns%"in#".1$$been#"/e',
+    '&"ve$"u/$"y/#\'aballah$(naginica&"li%!i%!s$"wa#$baya$!i$*ro-bradley$#ury#$chke%&memann',
+    '$!k$)laar/city%$dine%"er&-y/oxfordshire%$korn%%meyer%!y$%nfuss%\'strauch##ham&!i%!r%$shin%%vyahu',
+    ')!r%"rs%!s$"id&!a%"ka%"ma&#ite%+n-shtrikman&2g/descriptor-based%)sh-eaters(\'smoking\'!.$#mat%!i',
+    '$%shash#"ib$!d$$lden#$kala%#yne$"il%!n#$lam.$$eden%"tt$!i%%ngdon\'%field$"um',
+    '#&monean##n\'t$"ae%!t$!i%!p$!u#$omer#"ps##rul#&s-klau$\'aballah%#ger%"ms%,n&ndash;beni',
+    '%#ssa%"wi$\'elblads&"ed&!t%!n%"t*%!x$8hownmorereverencethanyou$!i%"ba%#dim%$nger$&lehoff$#oun',
+    '#"ta%&_luego$(e-slowly%#low$0ie-smith/chaplin&!r&"st%)ly-chosen)\'onvened(%drawn)#yed(\'erected($made()organised((seasoned',
+    '\'!.%)ngs-based)#day(\'/editor\'#ues$"le$"ow$#rup$)y-pudding",t&rehy;stand#"+s#!-$(blocking%$rims$%check',
+    '$\'hurling$%maker$$pins$$rack%%oofed$$shop(!s%%tands$\'tipping$\'wearing#*/head/hair$&rabbit#\'a-ozawa$"da$&keyama',
+    '$!o#$boro#\'ch-back%!.%%board%$cock%&ed-out&)t-burying(#man)"en%#ite%$ling%%mates%$ramp#0e&rehy;mongering',
+    '&$rime*!s&&urdled%&figure%(inspired%%theme$$able$\'fulness$+ley/mccoist%!y$\'mongers#$full#%ha-wa%!r$!e',
+    '&#ely&*ley/parish&#ton$\'fertiti$#orn%"ut$#way##ier$$kvah%"wa$\'nhensis$!p#(je/cantz#$leys$#iff',
+    '#!o$"ra$"um%!r#%pattu$#egs$#ins#"ra#$ston#*t-i-sherif$&a-girl%!n%#tts$,ersdallfjall\')ley-smith',
+    '+&shadow$%field$&isburg$)on-foston$\'ractive$%usili#"un%&gimana+)secretary#$vany#\'zikakis%(nikolaou$\'opoulos""ua#!b',
+    '$#ois$$rich#%court#!f$$ield$#ler##ger$"ht&)on(1987)*&)y-looking$$witz#\'kadalur$#ohl$%riggs$"ur',
+    '$$tain%#ech#!n$"ce$\'stetten$*t&rehy;ing%(ed-house%)ing-place%$s/of#\'ptgasse%#man((n-schule(%sburg%%stadt%+vertwaltung',
+    '$"us#3s&rehy;machtpolitik$(-hof-und$"a-&(speaking%!s$%dorff$&e-bane%\'r-ernst&\'/author$%fater%)rau-style("en(!s$\'geraete',
+    '$(man-type\'!n$"se&!r%$herr%#man%$tock$\'tellate#/t-bages-averous&(ourgeois%&poitou$$acam$\'charage$*e-bohemian((urgeoise',
+    '\'&uisine&\'garonne&(montagne%"s-%&villes)$iers%"yn$$pays$!s$(villiers#!x$#ley"$v\'na#&anaise%#nah',
+    '%%stein$%supai#"be#%dalah#,e&mdash;that%)rehy;nots$"-a&)-nice-day%%beens&%uried%\'engaged%%given&.un-will-travel%"in%&lesses',
+    ',!s%-we-any-choice$%.andy%$been%"so$#/am%#get%"my%#put%"y/$!4$$_a_a\'&little%"no%"of',
+    '%%greed$!d$"ls&(k&eacute$*n&mdash;or%(\'t&mdash%"a\'&!e%#m\'t$!r%%becke\'"ke%#com%%field&0ordwest/cardigan',
+    '%#igg&#ngs%$lock%,sack-touting)"ed&$traw%#ton$!t#"ge#!i$#lah%)dar-major$Qng-somebody-crashed-on-your-sofa-for-three-months$"ra%!e',
+    '##lik##na\'#!o$$line#(re-paris#%vaher#$ynge"-w&rehy;thorne#)-haw-haw.#.aii/california&(an-style)&tinged($ized&&iiiian&#tes',
+    '$"la#!d#"el$"ra$)s-leyburn%*/solicitor%$well#!f$#ell$&inches$#ord#$good#)ick-based&//jedburgh/kelso$"eh',
+    '%"ia#)k\'s-beard$!-%%like.%%moths%(training%\'visaged$#ear%$ndon%*r-siddeley&!i%+s/neighbour&$moor&$tone%+ye-security',
+    '%#ope$"in&\'s/brian(+co-producer()neighbour(*operations$*ridge/home$$sbee&&orough%#ian%\'ley/con%$nest%$well&%orths$%weeds',
+    '&&/owner&&london$$icek%#nge#&sfield$#izi##tah$#hom&\'rdenden\'(n-hedged)$like(&e/bras$)in/former$$reys%!y',
+    '#%worth"\'y-adams$$bale(!s&"rn$(chomping%\'oloured$&dealer%$ream&*ummond-hay$(feverish%$ield$)gathering$%knife$#net',
+    '&)&rehy;wye&2-wye/herefordshire$+pauncefoote$%smith%$traw$$time$%wagon$"zy#(.leyhill#\'/briton#%abusa$!f$!r#%boxes$%ridge',
+    '#&castle$!o%#mbe$$rust#*d&eacute;e$!a%#lla%#r-i$"ee%"n-&+/competitor\')uffington$,n-hofstetter&&lovers&\'niemecz',
+    '%$ized%!s$/on&rehy;baillie&!s#*e-du-puits$#box$*k-friedman$*s/chairman.&/aston&(disabled&+entertainer&&father&*gloucester&*university%#:nd',
+    '$$tzni#*fever-type$&ields.##gar$$rass##hoe%"ok##ing#$lage%#nds$"er%!s%&y-bell$#ick$"li',
+    '%!r#!m$(an-joyce&(/actress\'(burglary\')organiser&!n&"ot&!s$(er/pilot\'$wife&"le$$ills%!x##nau',
+    '&\'/oxford\'&thames&"ts$!s#%peter$"ot#&rakasa$%iders\'!s&"ge%#eye#&saving$%elden$!i$#lip',
+    '("ed(!y%#ock&"un#)ter-hames&)/designer\'&former$%horne((thwaiter$(on/sixth(\'peaking#$zoos"$zair$&radous%*d&rehy;ous',
+    '&\'-filled\'%prone&&.julie%"eh##biu#*e-softened$*/pollution$)l-crowded&%stick%$eels&%hurst%$head\'!n(!.&#off',
+    '%$ling%$side%$tine$%mburk$"rs$"va$!y##hal##ier#&lerigg$$itts##mat#&ometer$"ps$!r',
+    '#"ud#"za!#b-4#&united##vap"$/ccb"!1##00%""ai"#caa#!s#!u"!d#"ab"!e',
+    '""tx!&c(89)5#190)23/lassl(90)11#%fp)84"!0"$1100"!2#"16"$4046#"31""ab"!d"!e#!m"&format',
+    '""ha"-i-extractable$)uniformed#&c=cci2&#hci##ma.%&/banks&$city$"na#!p""l/$$naoh#"as#&o4(aq)"!m',
+    '"&o-free""pu"+r&mdash;the"+summary.log"!u"*verify.exe#)olume.fil"!w!%d-100&!0##210#*doms-based(%ready(.to-objectstore"#5-1',
+    '#&039.b3\'"e5""ab"-b&mdash;croat#"k."(f-allied""g."+head18,80,2"*l-mediated#!3#!l#!n"#mds"!o""pe',
+    '#$ware"(tv-based"0z&mdash;croatian!#e!p")&mdash;my#/ndash;fussiness""\'l#%s/she#"th"%(iia)$,nterrupting)#)savagely)$#he)"$-ass##dog',
+    '#$e-lp#%in-us$!s#$knew#&or-she#!s$#hes$&topped#\'thought#&walked%!s$$ould"!.##was""/h',
+    '##man#+she/it/they#$they##wan"$111p"#_as#"no"&aberth#)d&mdash;i+%jenny%*rehy;first*#ing-!s*%lamps*&tennis',
+    '%#ach(!s&\'nd-neck)(shoulder%%bands(!g)"ed*!r+!s)!s&#ean(#rer&&locker&$oard\'$iler',
+    '(#ing&$utts%%cases&$loth&\'overing*!s&&ushion\'%tting%+deformation&&ressed%#end%%faked&&inding&#oot%)girl-type',
+    '%)hammering&$ouse&#unt%+in-the-oven,$sand0!s%$jerk&&utting%&keeper&&icking&\'nocking%$lamp\'#ser&$ease\'$ssor',
+    '\'%lling\'"ng%(mistress%$neck)%-body&&odding%)of-family&\'n-heart($view\'!e&(rnaments%$part&%hones&$iece*!s',
+    '+!s&\'lanting&)rotection%$rent\'#sts\'\'tention&#oom%&scarfs)#ved\')ratchings(%ewing&"et\'&vering&$hake)$ings',
+    '(\'ttering(#ven)#ing\'"ot\'&rinker&(plitting&$taff("te\'%ripes\'#unt%&tapped&\'eachers&%hrust\'%umper&&o-foot',
+    '\'%ssing\'"wn&\'racking%$veil%%winds&\'obbling\'"rk$%.that\'!e$!/%%block%(footrest&)undraiser%)governing%%heart',
+    '%&pretty%)technical%$wine$(ache-ish(!y\'!y$$bang%\'oroughs%&utters$%cabin&"rd%%harge%$loth%#ode&"rn',
+    '$"en%&r-tank&!.&&/flick\'\'trailer&%s-off\'&/knock%"wr%!y$$fast%$ield%#old&"rt$&guards$$high',
+    '(#lng(!s$$icar(\'/oxford&#raa%!e%$ness&$g(s)\'%-tape("up\'#ham\'-s/subheadings$.lam&ndash;knox%(ey/folly(#raf',
+    ')\'grabber)\'hugging+%nters)\'seizing("se\'$gley(!s%#oad(#ers&#cks$\'m&mdash%&aster\'*!.%*istresship$\'nodding',
+    '%$late$\'quaters$$rent&$sses%/oom/compression$6s-and-bodies-and-tails&Edown-take-no-nonsense-mindless-boogie&(together%".1&%chris%*/governors&&leaves&&shower%#can\'#rfs',
+    '%&haking&%ields&$rink&!y%#ize(!s%+photographs&&inning%%quare*!d*!s%$tack\'%nders&*ock-facing*(grafting',
+    '&#rap\'$eams&#yle$\'torches$\'waiters%"ey%&ord(s)\'!k&#und%$raps$\'y-smell\'$weet#!f$#ing#$gney',
+    '#%lable%"nt\'!s$&dsburg$+e/reporting%%r-god%&y-type&!.$"is$&lgemot$!p%"er%$full$#sey$#ter',
+    '&4-and-money-conscious+&safety(,uthority-run($ware\',centre-based(,onsciousness\'*destroying\'+enhancement-#ing\'$farm\'*inspectors+$ired\'#led(\'obbying\'(obsessed',
+    '\'\'seekers(%ocial\'&tested(*hreatening\'\'warning)#tch&(.members\'%those&+/ill-health\'\'leisure\'(services\'%toxic\')utilities\'(vitality&%check',
+    '&#eir\'"rs&%foods&\'hazards&"ly&*preserving&$rite\'$oger&(watchers\'&orkers*!s&"y\'\'\'-option(%sized)$tyle',
+    '%"on$\'y/royal#"ne%"ys##o-3#*p-leaching$!.$!e%(d-chairs%!s%"th#+r&ndash;the$!\'$!-%%hears',
+    '%#say&%haped&%treak%#ted$!/%+distinguish$$_one$#adh$$beat%!y$"d-&&headed&-it-all-before&#was%$/saw',
+    '%!e&!r%"st%%there$#er\'&)-oriented\'$that%!s$%field$1ing&rehy;impaired\'\'(r6.24)\'*/adjourned()partially$&keners$"ld',
+    '$)n-managed%(/mothers%#don$&seload&!y%"ts%"um$*t&mdash;to&,rehy;breaker+&shaped,&topper0#ing%\'\'n\'soul%*-affecting\'(mbulance',
+    '*$soul&\'banging\'$reak+"er\'&urning)%sting\'+y&rehy;pass($pass&(chilling\'(lenching(\'utching\'+onstraining,&icting\'"ut&\'disease',
+    '&%fires)"st\'*lutterings\'"or&&height&\'machine\'&elting&#new&\'of-gold)#oak\'(n-sleeve\'!p(\'eration&\'poacher\'&ulling',
+    '\'&elated)%igion(\'ndering*#in\',#gly\'&ocking&)schmaltzy\'(hakingly\'(inkingly\'&luffed\'#mit\'&naring\'$tart(&irring((retching',
+    '\'#wap(&elling&\'tearing\'\'hudding\'(o-hearts(&uching\')ransplant\'&ugging(%rning\'\'weaking&%valve&\'winning\'#ood("rk\'*renchingly',
+    '%!.&%joyce%&/pulse%&attack%%bangs&$eart&$lood%$cold%#ens%\'failure&%lower&"ul%&h-fire+!s&!.',
+    '&"ed&&stones*#ing%$ily.%\'landers&!y%\'rotting%+s-and-minds\'$ease&!.&!0&(earching&&inking&%ponge%%water',
+    '#%sding$#ked#-t&rehy;labile$!\'$)-adhesive&"nd(!-)$dust%%beams&$oost&"ut&!y%\'coggled%,differential\')ssipating',
+    '(#ven\'!y%)efficient&%nergy&)xchangers%%heavy&&olding&%ungry%&killed%&labile\'"mp&$ight%\'metered%$only%(patterns',
+    '%#ray&\'ecovery\'(flective\'\'tardant&#ise%$salt&(earching\'%nsors\'%tting&%hrunk&#oft&%table\'2roke&mdash;rosette(#uck\'\'upefied',
+    '&#uit%,transmitting*$port(%pping\'&eating%&warped$%/cold%#hot%-steam-raising%.vent/demisting$!e%%d-the&!.%\'r-cloak&)/demister',
+    '&#set&*thermostat$&filter%#low$&h-land&(robinson.%-like&%style&&walker%)/accident&\'science%$cock\'(te-amory*$type%%endom',
+    '\'!-(#ale($bell)#lue((dominant(&filled(\'mixture)$oors((perfumed(%roots(%thick\'!/(&cotton(%sally\'$bank',
+    '.&scotts\'%lands("ey%,ington-scott&#tes%$like\'"ne%$mynd%%packs%*row-boston*\'russels)\'gatwick)\'leipzig)%palma%%waite',
+    '\'#_on$$lamp$%pipes$$ring$$wise#&uiness$"me$.tontimorumenos$!y#$v\'ns$#en\'&)-and-hell\'$born\'\'glitter\'3knows-anything-goes',
+    '/#ere\'(on-earth\'\'touched\'$work&$.the&!/&%block\'$ound&)ly-minded)$sent&\'s-earth\'!.\'%/vale\'%treet$"ie',
+    '(\'calibre($duty(%gauge&\'st-ever%)ly-backed)%ooked(+chlorinated)#lad(&darted)\'efended((favoured)"ed)\'oliaged*\'rtified)%unded',
+    '(+handicapped(+illustrated)\'ndebted++ustrialized((labelled*%yered)$ined)%oaded*)ss-making(\'made-up(*ornamented()patterned)\'ictured)\'olluted)\'regnant',
+    '))ublicised(&rimmed((spinning)\'titched)%uited(\'thumbed)(ravelled*&eading()unionized(&veiled(+waterlogged)%ooded*"rn\'!.()dependent',
+    '%%osity$"on$$side$+y&rehy;duty+\'fleshed+\'weights%!-&&bladed\'%odied($mber(#ned($oted\'\'reasted*%thing\'$uilt',
+    '\'&hinned\'\'ropping\'(urtained&&flying\'%ramed&&gloved\'$rain&(industry&%jawed&$knit&$land\'%eafed\'%ipped\'#oad&(neutrino',
+    '&(raindrop\'%immed\'#ock&&scaled\'\'hadowed((ouldered\'\'pending&#tar\'&ongued\'&raffic&\'uddered&\'weights\'%ooded&(yielding%$12.2',
+    '%$land%%soled%-weight-boxing,%style&\'weights#$word#%yberd"%b-sed#*belthwaite%/rt/headmistress%"ss$"ie#\'denmike$!o%%minal',
+    '$\'phrenia*!c$.r-smith/former##ner#\'raeorum%,ic-christian$2ew-syriac-egyptian$&ideans(!r\'"na$!o%!s$"us##urn$%terne',
+    '#%atomb$#use#%haluz$%ingen$#ler#)ketypecky$$ford$)ingbottom$,ler-in-chief$$ners$!s%$cher%*tall-smith$"yl#!q',
+    '#\'tanooga%"te$+ic-stricken&#ity&!k$(ographic%+litre/7,500%%metre%&ringly"%dared#$berg$#lom##das$(er-kowes&%nheim',
+    '$&ington$#les$"ow$#wen#&egrows$$nham%$sted$#oma$#ras%\'ifolium)"um%%strom%$wick#$fors#\'ge-bank',
+    '\'%ottom,!s($ughs\'\'uilders&&cutter,!s&#gap&#hog($pped&\'leaping\'#ine*!d&%plant+"er&#row',
+    '\')urrounded&%thorn\'"op)!s\'\'rimming&\'wizards%$bank)!.&#ote%$cock\'!e%)hog-child)\'hunting)&minded)\'related',
+    '*#kin*\'potting)%tight(*/watchword\'%pping%$land%#pig%+row-ripened("ey%"s.&(/british\'&carbon\'&thames&&parrow%$tops',
+    '$$peth#$iard#/ley-on-the-hill##man%"rk#\'nesford#$orah$\'wnstair#&phelyn#%rites#$toft#$ward$"ig$$orth"%e-hee',
+    '$"ma#$bies$#ner#(ee-yooch%&eeevvv$!m#/l&rehy;clicking$%-caps%&length\'"ss%%raise%&shaped&$tomp%\'tapping&"oe',
+    '%#nds$$caps$!d$%ed-up$"is$$s-up$$taps$!y#&mskerk#"ng#$rema\'!n%%nveen$!y#!t',
+    '##ven""fc#!e#&falump$$eron$#ner$#ord$#ter#$lame#+t-dispenser$$iest#"yn"#gde##el.%&ianize',
+    '$(monising)#tic*!s\'"y.$%nbart$\'torides#!g$#lun#$hest#)nenbacher#(yeshalom$!i"%h-heh\'#-he*!h',
+    '#%belyk#"e.$%heheh$!t#%meyer##ner#!o"%i-hei$#led#$/hey#"an#$beck%"rg#&dacker$&breder',
+    '%(klostern%!l%%nkamp&$moor&%reich%$rich$*i-postcard%!e$!o%#lph$#rek$$t/up$!y#&ferman$!f',
+    '%$ened&!s%!o%$t(s)&*-adjusting-$ment\'-of-the-season\'\'testing\'&weight(#ise&!/\'%depth\'%width&&=+0.87\'%-1.94',
+    '#/hachir&oacute;0$!t#%jboer%$roek$&ningen#$kell%!s&#hof$"ki#%l-ing$"at$&broner(#ner$!e%#man',
+    '&$blut&"en($born$$mann&"yr%$eier$$prin$#wig\',stra&szlig;e#$mann%!r%(t/action&&schuss\'&museum&)touristen',
+    '$$iveh$%liche$%owitz$(skringla#\'nderich$\'e-medin%\'/cinema&%shark%$kein&"in%!r%!s$#itz$#mot$0rich-heine-allee',
+    '$#tze&#man$"ze%!s#(r-at-law$\'archial$$less$&onimus$*s-apparent%#hip#&sbourg$#ing$#man$"st$#ted',
+    '#$tiki$#ler$!z##zer"#jke"$kals$&tomnid##ken#"la#.matyar-rabbani"+l&egrave;ne#$-llo%!o#"af$#ine',
+    '$\'thirnum#\'bronner##d-a&!t%\'forward%"in%#out$!.$#_in$!e%$rman$"ge#(en&ndash%\'/former%$ecca',
+    '%$iums%(s-sutton&"18&\'borough##fen#(gadottir%#son$%ersen$!o#(houghton#"i-%)schnupper&$kier%$tech\'#les',
+    '$!a%"ca\'#lly%"nd&"or$+cally-wound&"se&!t%!e%\'hrysums%!o&+bacter-like&#nii)"ni&#per',
+    '-!s*"us\'+ter-carrier+$like+%maker*!.*\'/oxford+%pilot*"s.,#the%%tites$#gan$#jet$#kon$#max',
+    '$&nstedt$)ocentrism%#dor%\'graphic*!s($vure%&s-made&$cope&$phan($eric&#tat%\'thermic*!s*!y&&ropium',
+    '%%coter%$orts&#sis$%route$#ski$$um-5\'&cooled&&filled$&x-coil&2loop-helix-leucine%"es#&j&auml$#ans#.l&eacute;nique%(iacute;n',
+    '$*-&ndash;re%(and-back%(disaster%%holes%#lit%(marriage%,of-a-fellows&!h%#pit%$sent%\'touched$&abruni%\'ciously%#dic%"nd',
+    '&"rg%$runn$$core$%diver%#orf$(eborines%%nikon\'!s(&tiques\'#zer&*omemphites\'&tamiai%"ri%%svean%#vik',
+    '$+fire-spiced(!d$#hag$#ich%#don%-er/consultant%$nger%"on%!p%&s-setr&*hly-shaven$!l$$muth$#ner$.o-and-goodbyes',
+    '%(/goodbye%"ee&!y%!o%!t%$ween$%spawn%#vik$"te%%hpawn$#wig\'%ianum&"nd#*met-buckle\'%crest',
+    '\'&shaped($kull&#ted$$gart$!i%,nth-infected(%iasis(\'ologist)#sis$%shore%#ide%$tedt#"no#!o$&copter',
+    '$#nia$!u#-p&lsqb;s&rsqb$!\'$:*&gt;help&mdash;index.help$&-forms%$mate%\'seeking%&wanted%(yourself$&/cover%%nanny%\'support$$3000$$:189',
+    '$#er/\'&driver&)s/support%!s%"th$,ful-humorous\'!.\'#ly.\'&nesses$"in&%g-out%!s$,less-looking(#ly.$%mates',
+    '$%s-the%\'/farmer%$tone$$ware%#ith#&redale#"se%!l$&inborg&$gton&(ki-based##tai#&vering%$tiae$(oetfluys',
+    '#"wa$!e"9m&aacute;ndez-pe&oacute;n#$-hem$&stitch$)twinkling#"an%%danda%!n$)tite-rich%-olymphangioma&)porphyrin#"ba$$lade$&orough',
+    '%(y/gloucs\'\'trading#$dale#!e$"di$&istert$$ling%!y&#tra$&ndanda%!e%#tin%#way$"on$#sis',
+    '&(olectomy&%ycles%-decortication$&anopic$*celluloses%&idaris%$rypt%$ycle$)diaphragm%%oecus$\'grammus$*metabolous$\'nephrin&$vrin%!g',
+    '\'%rough&%stone&#ton&,way/designer$#ola\'!s&(iopterus\'&pterus$\'pelagic%%teran$&retina*!e$(segments%!h&%phere',
+    '\'-ere&mdash;for*)-specific*).although*(ctomised%%tichs%(uccinate#0lock&rehy;leaves\'!s#)mer/loose$.ings/childrens\'#way$!o#(odynamic$&globin$&philia',
+    '$\'rrhoids#*p-dressing%\'factory&$ibre -i&pound;21.4m',
 )
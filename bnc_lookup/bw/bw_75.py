@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_75 = (
+count_75 = 6694
+
+heads_75 = (
     'gelau',
-    'gelber',
-    'gelbvieh',
-    'gelcoat',
-    'gelcoats',
-    'gelderblom',
-    'gelderland',
-    'geldhart',
-    'geldof(phonogram)',
-    'geldofs',
-    'geldorf',
-    'geldrop',
-    'gelds',
-    'geleen',
-    'geler',
-    'gelesthasis',
     'gelib',
-    'gelida',
-    'gelijkheid',
-    'gelims',
-    'geling',
-    'geliot',
-    'gell-man',
-    'gell-mann',
-    'gell/crime',
-    'geller-tellers',
-    'gellerdale',
-    'gellmann',
-    'gellon',
-    'gelmetti',
-    'gelnhauser',
-    'gelobet',
     'gelosia',
-    'gelous',
-    'gelperin',
-    'gelsey',
-    'geltzahler',
-    'gem&auml;ldesammlungen',
-    'gem&uuml;t',
-    'gem&uuml;tlichkeit',
-    'gem-class',
-    'gem-cutter',
-    'gem-engraver',
-    'gem-mining',
-    'gem-quality',
-    'gem-rock',
-    'gem-serpent',
-    'gem-setters',
     'gem-stones',
-    'gemacht',
-    'gemalde',
-    'gemaldegalerie',
-    'gematria',
-    'gemayels',
-    'gembloux',
-    'gemeente',
-    'gemeinden',
-    'gemeinschaftsf&auml;hig',
-    'gemeinwesen',
-    'gemer',
-    'gemerek',
-    'gemes',
-    'gemiler',
-    'geminata',
     'geminate',
-    'geminus',
-    'gemito',
-    'gemmatalis',
-    'gemmation',
-    'gemme',
-    'gemmed',
-    'gemmell-hutchinson',
-    'gemmill-o\'kane',
-    'gemmingen-homberg',
-    'gemmological',
-    'gemmologist',
-    'gemmologists',
-    'gemmulation',
-    'gemmy',
-    'gemot',
     'gemperlein',
-    'gemsbounder',
-    'gemsmith',
-    'gemsoft36',
-    'gen&egrave;ve-edinburgh-brugge-gen&egrave;ve',
-    'gen&rehy;tleman',
-    'gen\'rously',
-    'gen-locked',
-    'gen-u-ine',
-    'gen.6:7',
-    'genady',
-    'genae',
-    'genbank/embl',
-    'genbel',
-    'genboku',
-    'gencer',
     'gencies.',
-    'gendarmenmarkt',
-    'gender&rehy;constructing',
-    'gender-',
-    'gender-\'time\'',
-    'gender-appropriate',
-    'gender-conscious',
-    'gender-dichotomising',
-    'gender-divided',
-    'gender-drama',
-    'gender-expectations',
-    'gender-groupings',
-    'gender-indifferent',
-    'gender-marked',
-    'gender-opposite',
-    'gender-sensitive',
     'gender/women',
-    'genderlects',
-    'genderwatch',
-    'gendin',
-    'gendje',
-    'gendron',
-    'gene(i)',
-    'gene-1',
-    'gene-bearers',
-    'gene-centred',
-    'gene-clean',
-    'gene-cloning',
-    'gene-complexes',
-    'gene-dosage',
-    'gene-environment',
-    'gene-line',
     'gene-oriented',
-    'gene-pools',
-    'gene-screen',
-    'gene-seeds',
-    'gene-selected',
-    'gene-spliced',
-    'gene-switching',
-    'gene-tox',
-    'gene-transduced',
-    'gene-transplantation',
-    'gene.',
-    'gene.left',
-    'genealogy-based',
-    'geneassembler',
-    'geneen',
-    'geneeskunde',
     'genefa',
-    'geneglish',
-    'genei',
-    'geneina',
-    'genel',
-    'genelabs',
-    'geneleos',
-    'genelex',
-    'genemarkers',
-    'geneologists',
-    'gener',
-    'gener&rehy;ated',
-    'gener&rehy;ations',
-    'gener.',
-    'genera&ndash;on',
-    'generaci&oacute;n',
     'generacy',
-    'generacyon',
-    'general&rehy;purpose',
-    'general\'',
-    'general-',
-    'general-added',
-    'general-at-sea',
-    'general-dealer',
-    'general-duties',
-    'general-elect',
-    'general-human',
-    'general-including',
-    'general-law',
-    'general-manager',
-    'general-owned',
-    'general-practice',
     'general-purposes',
-    'general-secretaryship',
-    'general-to-specific',
-    'general.43',
-    'general.ext',
-    'general.purpose',
-    'general/foundation',
-    'general/research',
-    'general/scientific',
-    'general/simple',
-    'generaldirektor',
-    'generalhumans',
-    'generalibus',
-    'generalidad',
-    'generalise.',
-    'generalistic',
     'generalists--aware',
-    'generaliter',
-    'generalizability',
-    'generalizationship',
-    'generalklauseln',
-    'generallandesarchiv',
-    'generalli',
-    'generally-acceptable',
-    'generally-agreed',
-    'generally-applied',
-    'generally-available',
-    'generally-held',
-    'generally-in',
-    'generally-peaceful',
-    'generally-recent',
-    'generally-understood',
     'generalmusikdirektor',
-    'generals.see',
-    'generalsekret&auml;r',
-    'generaly',
-    'generated.',
-    'generation&mdash;as',
-    'generation&rehy;gap',
-    'generation(s)',
-    'generation-defining',
-    'generation-oriented',
-    'generation-skipping',
-    'generation/dumb',
-    'generation/transmission/distribution',
-    'generationally',
-    'generationes',
-    'generations.in',
     'generativity',
-    'generator/driver',
-    'genere',
-    'generic-specialist',
-    'generic-strategies',
-    'generical',
-    'generically-named',
-    'generose',
-    'generosities',
-    'generosity&mdash;it',
-    'generous-looking',
-    'generously-made',
-    'genertic',
-    'genery',
-    'genes.the',
-    'genes/multigene',
     'genese',
-    'genesee',
-    'geneses',
-    'genesio',
-    'genesis&mdash;the',
-    'genesmay',
-    'genestealer-infested',
-    'genetesque',
-    'genetic-manipulated',
-    'genetic-medicine',
-    'genetic-sweepstakes',
-    'geneticaetiologies',
-    'genetically-based',
-    'genetically-defined',
-    'genetically-distinct',
-    'genetically-linked',
     'genetically-manipulated',
-    'genetically-modified',
-    'genetically-shared',
-    'genetically-susceptible',
-    'genetics-supply',
-    'genetiva',
-    'geneva_in',
-    'geneve',
-    'genevieves',
-    'genevoise',
-    'genevora',
-    'genias/soundware',
-    'genichi',
-    'genin',
-    'genious',
-    'genital-shaving',
     'genital-stirring',
-    'genitalia-flaunting',
-    'genitalibus',
-    'genitally',
-    'genitalmen',
-    'genitives',
-    'genitor-lover',
-    'genius&rehy;and',
-    'genius-mathematicians',
-    'geniza',
-    'genji',
-    'genki',
-    'genlisea',
-    'genmic',
-    'genna',
-    'gennadii',
     'gennadios',
-    'gennanica',
-    'gennargentu',
-    'gennari',
-    'genner',
-    'gennesseaux',
-    'gennevillers',
-    'gennleman',
-    'gennoe',
-    'gennullmen',
-    'genoan',
-    'genocided',
-    'genoese-led',
-    'genome.',
-    'genossenschaft',
-    'genossenschaftsbank',
     'genotext',
-    'genotoxicity',
-    'genotropin',
-    'genotyped',
-    'genovefa',
-    'genpack',
-    'genrad',
-    'genral',
-    'genre-based',
-    'genre-bender',
-    'genre-hopping',
-    'genre-markers',
-    'genre-pictures',
-    'genre-pieces',
-    'genre-stomping',
-    'genre/influences',
     'gensac',
-    'genscher-dumas',
-    'genscher-like',
-    'gensho',
-    'genstat',
-    'gent-type',
-    'gent/vodafone',
-    'gentan',
-    'gentar&oacute;0',
-    'gentech-sponsored',
-    'genteel-type',
-    'genteelisms',
-    'genteely',
-    'gentem',
-    'genter',
-    'genthe',
     'gentian-blue',
-    'gentiana',
-    'gentianaceae',
-    'gentianoides',
-    'gentics',
-    'gentilesse',
-    'gentilini',
-    'gentilium',
-    'gentillesse',
-    'gentilly',
-    'gentilman',
-    'gentis',
-    'gentle&rehy',
-    'gentle-eyed',
-    'gentle-faced',
-    'gentle-folk',
     'gentle-landing',
-    'gentle-looking',
-    'gentle-persons',
-    'gentle/obsolescent',
-    'gentleman-commoner',
-    'gentleman-cricketers',
-    'gentleman-of-leisure',
-    'gentleman-poet',
-    'gentleman-publisher',
-    'gentleman-usher',
-    'gentlemanlike',
-    'gentlemans',
-    'gentlemen-amateurs',
-    'gentlemen-aristocratic',
-    'gentlemen-friends',
-    'gentlemen-ing',
     'gentlemen-pensioners',
-    'gentlemen-ushers',
-    'gentlemen.',
-    'gentlemen/animals',
-    'gently-curving',
-    'gently-inclined',
-    'gently-lapping',
-    'gently-moving',
-    'gently-not',
-    'gently-rising',
-    'gently-toned',
-    'gently.',
-    'gently_on',
-    'gentn',
-    'gentner',
-    'gento',
     'genton',
-    'gentoos',
-    'gentrifications',
-    'gentrifiers',
-    'gentry-patricians',
-    'gentry.',
-    'gents.',
-    'gentulmun',
-    'gentz',
-    'genu',
-    'genu&rehy;inely',
-    'genuflects',
-    'genuflex',
-    'genuflexions',
-    'genuilley',
-    'genuine-colonial',
     'genuine-the',
-    'genuis',
-    'genuit',
-    'genung',
-    'genus-species',
-    'genwise',
-    'genzac',
-    'genzen',
-    'genzi',
-    'genzken',
-    'geo-archaeological',
-    'geo-demo',
-    'geo-engineering',
-    'geo-related',
-    'geo-science',
-    'geo-spheres',
     'geo-stationary',
-    'geo-strategic',
-    'geo-syncline',
-    'geo.i.c.7',
-    'geo2:support',
-    'geoarchaeological',
-    'geobel',
-    'geobey',
-    'geobotanist',
-    'geocentrism',
-    'geochelone',
-    'geocybernetics',
-    'geodata',
-    'geodesic-designed',
-    'geodesically',
-    'geodh',
     'geoelectric',
-    'geoffrey-of',
-    'geoffreyi',
-    'geoffrion',
-    'geoffy',
-    'geogg',
-    'geogh',
-    'geoghiou',
-    'geogo',
-    'geogra',
-    'geografico',
-    'geographical-and',
-    'geographical-climatic',
-    'geographical/environmental',
-    'geographical/geological',
-    'geographical/physical',
     'geographical/time',
-    'geographically-and/or',
-    'geographically-concentrated',
-    'geographically-disparate',
-    'geographically-proximate',
-    'geographically-scattered',
-    'geographically-significant',
-    'geographicus',
-    'geography\'',
-    'geography-both',
-    'geography-student',
-    'geoidal',
-    'geol&oacute;gica',
-    'geologically-frustrating',
-    'geologically-promising',
-    'geologie',
     'geologies',
-    'geologist-oriented',
-    'geologist/',
-    'geology.',
-    'geomagnetists',
-    'geomant',
-    'geome',
-    'geometra',
-    'geometriae',
-    'geometric-types',
-    'geometrically-based',
-    'geometrically-shaped',
-    'geometricized',
-    'geometrid',
-    'geometrised',
-    'geometry-',
     'geometry-generating',
-    'geometry.',
-    'geomilitech',
-    'geominerals',
-    'geominero',
-    'geomodel',
-    'geomorphologically',
-    'geomorphologie',
-    'geon',
-    'geong',
-    'geonly',
-    'geopetal',
-    'geophone',
-    'geophysical/shell',
-    'geophysically',
-    'geophysically-produced',
     'geophysically-speaking',
-    'geophysician',
-    'geopoetry',
-    'geopolitically',
-    'geopolymer',
-    'geoponics',
-    'geopotential',
-    'geoprobe',
-    'geoquimica',
-    'geor&rehy;gian',
-    'geordie-irishmen',
-    'georgala',
-    'georganne',
-    'georgdi',
-    'george\'',
-    'george\'s-in-the-east',
     'george-v',
-    'george/author',
-    'george/domain',
-    'george/heart',
-    'george/neighbour',
-    'george/paramedic',
-    'george/the',
-    'georges-d\'esp&eacute;ranche',
-    'georges-pierre',
-    'georgescu',
-    'georgeson',
-    'georgesons',
-    'georghe',
-    'georgia&mdash;see',
-    'georgian-born',
-    'georgian-fronted',
     'georgian-russian',
-    'georgianized',
-    'georgic',
-    'georgica',
-    'georgical',
-    'georgiev',
-    'georgievka',
-    'georgievna',
-    'georgijev',
-    'georgivhili',
-    'georgiy',
-    'georgoi',
-    'georhge',
-    'georjan',
-    'geoscience/climatology',
-    'geoseismic',
     'geostationery',
-    'geosteered',
-    'geostrategic',
-    'geosynthetics',
-    'geotek',
-    'geotextiles',
-    'geotherm',
-    'geotraverse',
-    'gep2',
-    'gepgraphy',
-    'gepids',
-    'geplaces',
-    'gepp',
-    'geppert',
-    'ger&rehy;manophobia',
-    'ger\'',
     'ger\'off',
-    'ger-mankind',
-    'gerace',
-    'gerad',
-    'geraghty/action',
-    'geral',
-    'geraldene',
-    'geraldton',
-    'gerania',
-    'geraniol',
-    'geranium-scented',
-    'geranium-shaped',
-    'geranium-smothered',
-    'geraniums.',
-    'geranyl',
-    'gerarde',
     'gerardette',
-    'gerardia',
-    'gerardus',
-    'gerasenes',
-    'gerasimos',
-    'gerasimov\'',
-    'gerassi',
-    'gerbas',
-    'gerbeaux',
-    'gerberga',
-    'gerbermuhle',
-    'gerbrandy',
-    'gerdauen-allenburg-wehlau',
-    'gerde',
-    'gerderest',
-    'gerdes',
     'gerdts',
-    'gere-good',
-    'gereformeerd',
-    'gereformeerde',
-    'gereint',
-    'geremew',
-    'geremgbo',
-    'gerenuks',
-    'gereon',
-    'gereonswall',
-    'gergasites',
-    'gergatz',
-    'gergesene',
-    'gerhart',
-    'gerhoh',
-    'geria',
     'geriadur',
-    'geriatric-ing',
-    'geriatric/psychogeriatric',
-    'geriatrica',
-    'geriatricas',
-    'gerich',
-    'gerichtsstube',
-    'gericke',
-    'gerighty',
-    'gerin',
-    'gerjuoy',
-    'gerkang',
-    'gerl',
-    'gerlandine',
-    'gerlaud',
-    'gerling',
     'gerloch',
-    'germ-cells',
-    'germ-factory',
-    'germ-fighting',
-    'germ-laden',
-    'germ-proof',
-    'germain-des-pr&eacute;s',
-    'germaine-marie',
-    'germainie',
-    'germamy',
-    'german&oacute;filos',
-    'german\'',
-    'german-bohemian',
-    'german-bred',
-    'german-controlled',
-    'german-croat',
     'german-danish',
-    'german-designed',
-    'german-developed',
-    'german-dutch',
-    'german-educated',
-    'german-held',
-    'german-hungarian',
-    'german-hungarian-italian',
-    'german-induced',
-    'german-italian',
-    'german-japanese',
-    'german-looking',
-    'german-manufactured',
-    'german-ness',
-    'german-registered',
-    'german-roofed',
     'german-run',
-    'german-russian',
-    'german-specification',
-    'german-sponsored',
-    'german-strain',
-    'german-teuton',
-    'german-trained',
-    'german-uk',
-    'german-us',
-    'german/belgian',
-    'german/jewish',
-    'german/luxembourg',
-    'german/students',
-    'german/swiss',
-    'german/west',
-    'germana',
     'germanborn',
-    'germanez',
-    'germangerman',
-    'germani',
-    'germanic-speaking',
-    'germanically',
-    'germanicised',
-    'germanicisms',
-    'germaninspired',
-    'germanising',
-    'germanism',
-    'germanist',
-    'germanitatis',
-    'germanium-beryllium',
-    'germanium-gallium',
-    'germano-fascist',
     'germanophil',
-    'germanophiles',
-    'germanscher',
-    'germantown',
-    'germany&mdash;3.5',
-    'germany&mdash;democracy',
-    'germany&mdash;double',
-    'germany&mdash;including',
-    'germany&rehy;west',
-    'germany\'',
-    'germany\'s',
-    'germany\'senigma',
-    'germany-',
-    'germany-aloof',
-    'germany-centred',
-    'germany-first',
     'germany-focused',
-    'germany-listeners',
-    'germany-party',
-    'germany.',
-    'germany/1989/cert',
-    'germersheim/rhein',
-    'germidis',
-    'germigny-des-pr&egrave;s',
-    'germina',
-    'germinability',
-    'germins',
-    'germinvs',
-    'germiyan',
-    'germiyanids',
-    'germiyanoglu',
-    'germnan',
     'germolene',
-    'germont',
-    'germy',
-    'gern',
-    'gernert',
-    'gernie',
-    'gernot',
-    'gernrode',
-    'gernsbacher',
-    'gernsback',
-    'gernsheim',
-    'geroge',
-    'gerolamo',
-    'gerong',
-    'geronticus',
-    'gerontocracy-an',
     'gerontophiliac',
-    'gerontophobia',
-    'gerorge',
-    'gerota',
-    'gerraff',
-    'gerrand',
-    'gerrans',
-    'gerrardavit',
-    'gerrardo',
-    'gerrart-of-it',
-    'gerratt',
-    'gerrick',
-    'gerries',
-    'gerrin',
-    'gerring/sixth',
-    'gerrings',
     'gerrrroff',
-    'gerschenfeld',
-    'gerschenkron',
-    'gershom',
-    'gershwins',
-    'gersmehl',
-    'gerstenberg',
-    'gerstenberger',
-    'gerstenfeld',
-    'gerstenhaber',
-    'gersting',
-    'gerstmann',
-    'gerstmann-straussler',
-    'gerstner.',
-    'gerta',
-    'gertan',
     'gertcha',
-    'gerter',
-    'gerton',
-    'gertrudenstrasse',
-    'gertrudes',
-    'geruda',
-    'gerulot',
-    'gerund/gerundive',
-    'gerunds',
-    'gerusaleme',
-    'gervasius',
-    'gervat',
-    'gerven',
-    'gerveys',
-    'gervins',
-    'gervold',
     'gervys',
-    'gerwald',
-    'gerwin',
-    'gerzina',
-    'gerzinters',
-    'ges&uacute',
-    'ges&uuml',
-    'gesamt',
-    'gesamtausgabe',
-    'gesangb&uuml;chlein',
-    'gesangbuch',
-    'gesanges',
-    'gesangk',
-    'gesangsweis',
-    'geschaeftsbriefe',
-    'geschaftssache',
     'geschichtliche',
-    'geschwinde',
-    'geschwister-scholl',
-    'gesellen',
-    'gesellschafsthaus',
-    'gesellschaft-',
-    'geseng',
-    'gesetzbuch',
-    'gesetzbuch.',
-    'geshe',
-    'gesiegt.',
-    'gesing',
-    'gesipa',
-    'gesith',
-    'gesithcund',
-    'gesopholar',
     'gesopholis',
-    'gessaman',
-    'gessaria',
-    'gessel',
-    'gesselschaft',
-    'gesserent',
-    'gessilige',
-    'gessin',
-    'gessle',
-    'gessler',
-    'gestalten',
-    'gestapo&rehy;though',
-    'gestapo-style',
-    'gestated',
-    'gestates',
-    'gestations',
     'geste-style',
-    'gesteine',
-    'gestel',
-    'gesticulates',
-    'gestin',
-    'gestsson',
-    'gestum',
-    'gestural/auditive',
-    'gesture&rehy;then',
-    'gestured-to',
-    'gestyl',
-    'gesunder',
-    'get&uacute;lio',
-    'get\'em',
-    'get-acquainted',
-    'get-ahead',
     'get-at-able',
-    'get-away-from-only-a-bit-of-it',
-    'get-even',
-    'get-in-touch',
-    'get-like',
-    'get-on-with-it',
-    'get-our',
-    'get-out-of-me',
-    'get-out-of-my-way-i-haven\'t-a-moment-to-spare',
-    'get-outs',
-    'get-rich',
-    'get-the-beers-in',
-    'get-the-government-off-our-backs',
-    'get-up-and-jig',
-    'get-you-out-of-trouble',
-    'get.',
     'get.modern',
-    'get/but',
-    'get/get&dollar',
-    'get/gets&num',
-    'get_fed',
-    'get_in_contact',
-    'get_near',
-    'get_nearer',
-    'get_up',
-    'getalfe',
-    'getbulk',
-    'getchar',
-    'getech',
-    'getechew',
-    'getes',
-    'getframe',
     'getframe/gethalf',
-    'gethal',
-    'gethalf',
-    'gethe',
-    'gether',
-    'gethin',
-    'gethsemanes',
-    'gethsemani',
-    'geti',
-    'getihu',
-    'getnext',
-    'geto',
-    'getout',
-    'getpack',
-    'getrag',
-    'getreide',
     'gets_a',
-    'getsa',
-    'gett',
-    'gettable',
-    'getter-up',
-    'getters',
-    'getthe',
-    'gettier-type',
-    'getting-away-with-murder',
-    'getting-off',
-    'getting-ready',
-    'getting-rid-of.',
-    'getting-to-know-each-other',
-    'getting-to-know-the-neighbours',
-    'getting-to-know-you-period',
-    'getting-up-time',
     'gettinhg',
-    'gettleman',
-    'gettnau',
-    'gettogeddon',
-    'gettogether',
-    'gettoutahere',
-    'gettrup',
-    'gettum',
-    'getty-power',
-    'gettys',
-    'gettysburg&ndash;lancaster&ndash;washington',
-    'getulio',
-    'getwpdata',
-    'geula',
-    'geuna',
-    'geuvara',
     'gev.',
-    'gevaert',
-    'gevald',
-    'gever',
-    'geverkschaftsbund',
-    'gevrey',
-    'gevrey-chambertin',
-    'gew&uuml;rz',
-    'gew-gaws',
-    'gewalt',
-    'gewandhaus/masur',
-    'gewerbe',
-    'gewerkschaftsbund',
-    'gewerkschaftsbund&mdash;sgb',
-    'gewgaw',
-    'gewidmet',
     'gewirth',
-    'gewiss',
-    'gewissheit',
-    'geworden',
-    'geworfenheit',
-    'gewurz',
-    'gezda',
-    'geze',
-    'gezhouba',
-    'gf10,000,000',
-    'gf50',
-    'gf644,000',
-    'gf91/2',
-    'gfc',
-    'gfc16',
-    'gfd',
     'gfe',
-    'gfet',
-    'gffs',
-    'gfi',
-    'gflop',
-    'gformat.com',
-    'gfs',
-    'gfs100',
-    'gfsa',
-    'gfsc',
-    'gften',
-    'gftj',
-    'gg11',
-    'gg4',
-    'ggaagtcattctctgaga',
-    'ggac(nnnn)gtcc',
     'ggag(nnnn)ctcc',
-    'ggat',
-    'ggatcaaggaaagctctggcagctg-3\'',
-    'ggca/tgcc',
-    'ggcaaaatgtttcctatattcat',
-    'ggcg',
-    'ggcg/cgcc',
-    'ggct/agcc',
-    'gge',
-    'ggf-like',
-    'ggfbpp1&ndash;3',
-    'ggfbpp2',
-    'ggfhbs14',
-    'ggfhfb1-encoded',
-    'ggg.aat',
-    'gggctgattgatttgcatgtccag',
     'ggggcccc',
-    'gghb',
-    'ggl',
-    'ggr',
-    'ggs',
-    'ggt/lddc',
-    'ggtgacc',
-    'gh&eacute;on',
-    'gh-deficient',
-    'gh-ghosts',
-    'gh/garden',
-    'gh/kitchen',
-    'gh/natwest',
-    'gh1',
-    'gh16',
-    'gh5-dna',
     'gh5-gh5',
-    'gh657',
-    'gh8-ribose',
-    'ghaamprh',
-    'ghabbash',
-    'ghabhalach',
-    'ghabhar',
-    'ghadaffi',
-    'ghadanfar',
-    'ghaddafi',
-    'ghafoor',
-    'ghafurifard',
-    'ghaghara',
-    'ghairbh',
-    'ghajn',
-    'ghal-maraz',
     'ghalata',
-    'ghaleb',
-    'ghan',
-    'ghanahallah',
-    'ghanaian-swedish',
-    'ghanain',
-    'ghanaj',
-    'ghandi-like',
-    'ghandour',
-    'ghanian',
-    'ghanistan',
-    'ghanja',
-    'ghannejja',
-    'ghaoithe',
-    'ghari',
-    'gharials',
     'gharib',
-    'gharwal',
-    'ghasihusrev',
-    'ghasted',
-    'ghastliest',
-    'ghastly\'',
-    'ghastly-hued',
-    'ghatotkatcha',
-    'ghatowar',
-    'ghauri',
-    'ghavri',
-    'ghawshah',
-    'ghawsheh',
-    'ghazal',
-    'ghazala',
-    'ghazalah',
     'ghazals',
-    'ghazaui',
-    'ghaziabad',
-    'ghazna',
-    'ghazzah',
-    'ghedina',
-    'ghedras',
-    'gheest',
-    'gheewala',
-    'ghelew',
-    'ghellinck',
-    'gheluvelt-langemarck',
-    'ghenghis',
-    'ghent&ndash;bruges',
-    'gheorghescu',
-    'gheorgiu',
     'ghering',
-    'ghermazien',
-    'ghetto\'',
-    'ghetto-blasterette',
-    'ghetto-enterprise',
-    'ghetto-yid',
-    'ghettoblaster',
-    'ghettoizes',
-    'ghettology',
-    'ghi/liberty',
-    'ghi/panasonic',
-    'ghiaia',
-    'ghiaie',
-    'ghiasi',
-    'ghiaurov',
-    'ghidrah',
     'ghiglion-green',
-    'ghillebert',
-    'ghilo',
-    'ghinis',
-    'ghiolla',
-    'ghiotti',
-    'ghir',
-    'ghirardini',
-    'ghiringhelli',
-    'ghirlandina',
-    'ghirri',
-    'ghiselin',
-    'ghising',
-    'ghisolfi',
-    'ghiyas-ud-din',
-    'ghiz',
     'ghl',
-    'ghluasaid',
-    'gho',
-    'ghobi',
-    'ghodse',
-    'ghodssieh',
-    'ghoe',
-    'gholkar',
-    'ghorbanifar-engineered',
-    'ghosaini',
-    'ghosht',
-    'ghost-80',
-    'ghost-appears',
-    'ghost-bottlers',
-    'ghost-bottling',
-    'ghost-breakers',
     'ghost-crabs',
-    'ghost-desks',
-    'ghost-fleet',
-    'ghost-fleets',
-    'ghost-huntsmen',
-    'ghost-inhabited',
-    'ghost-life',
-    'ghost-negative',
-    'ghost-nipple',
-    'ghost-reasons',
-    'ghost-relic',
-    'ghost-ridden',
-    'ghost-riders',
-    'ghost-shrimp',
-    'ghost-story',
-    'ghost-train',
     'ghost-trussers',
-    'ghost-voice',
-    'ghost-world',
-    'ghost-writers',
-    'ghost-wrote',
-    'ghost.',
-    'ghostbusting',
-    'ghostchainrattling',
-    'ghosthood',
-    'ghosthunting',
-    'ghostie',
-    'ghostley',
-    'ghostlier',
-    'ghostlily',
-    'ghostliness',
-    'ghostly-like',
     'ghostly-white',
-    'ghosts.',
-    'ghostscapes',
-    'ghostshape',
-    'ghostvoice',
-    'ghostwatchers',
-    'ghosty',
-    'ghotbi',
-    'ghoti',
-    'ghoul&rehy;ish',
-    'ghoul-mask',
-    'ghq7094',
-    'ghra',
-    'ghu',
-    'ghuburrun',
-    'ghulabzoi',
     'ghulum',
-    'ghunaym',
-    'ghungroos',
-    'ghurburran',
-    'ghurka',
-    'ghuta',
-    'ghvdhgkt',
-    'ghyst',
-    'ghz/km',
-    'gi&ograve',
-    'gi-rl',
-    'gi0pcu',
-    'gi9',
-    'giac',
-    'giacarini',
-    'giacobazzi',
     'giacomini',
-    'giagnoni',
-    'gialli',
-    'giallo',
-    'giamilos',
-    'giampa',
-    'giampetro',
-    'gian-carlo',
-    'gian-franco',
-    'giandebiaggi',
-    'giangiacomo',
-    'gianluigis',
-    'giannadda',
-    'giannelli',
-    'giannia',
-    'giannicolo',
     'giannina',
-    'giannino',
-    'giannis',
-    'gianpiero',
-    'giant-dwarf',
-    'giant-fiend',
-    'giant-killed',
-    'giant-leaved',
-    'giant-like',
-    'giant-nina',
-    'giant-riven',
-    'giant-scaled',
-    'giant-stepped',
-    'giantish',
-    'giantists',
-    'giantkiller',
     'giants/supergiants',
-    'giaquinto',
-    'giarabub',
-    'giardello',
-    'giardina',
-    'giaretto',
-    'giat',
-    'giau',
-    'giavanni',
-    'gibaud',
-    'gibb/ice',
-    'gibbe',
-    'gibberellins',
-    'gibberingly',
-    'gibberings',
-    'gibbes',
     'gibbeson',
-    'gibbeting',
-    'gibbie',
-    'gibbings/cotswold',
-    'gibbison',
-    'gibbo',
-    'gibbonian',
-    'gibbons/coroner',
-    'gibbosum',
-    'gibbs-faberg&eacute',
-    'gibbs-heaviside',
-    'gibbs/owner',
-    'gibbses',
-    'gibco/brl',
-    'gibcobrl',
-    'gibeah',
     'gibet',
-    'gibichung',
-    'gibichungs',
-    'gibier',
-    'gibin',
-    'gibney',
-    'gibor',
-    'giboz/managing',
-    'gibralt',
-    'gibraltar-registered',
-    'gibris',
-    'gibsails',
-    'gibson-engraved',
-    'gibson-feeling',
-    'gibson-girl',
-    'gibson-lovers',
     'gibson-orientated',
-    'gibson-toting',
-    'gibson-user',
-    'gibson/daily',
-    'gibson/gretsch',
-    'gibson/homoeopathic',
-    'gibson/royal',
-    'gibson/where',
-    'gibsonian',
-    'gibt',
-    'gibtner',
-    'gibus',
-    'gica',
-    'gicquel',
-    'gid',
-    'gidacred',
     'gidada',
-    'giddie',
-    'giddier',
-    'giddyingly',
-    'giddyup',
-    'giding',
-    'gidion',
-    'gidman',
-    'gidom',
-    'gidri',
-    'gids',
-    'giduk',
-    'gie\'',
-    'giebe',
-    'giebel',
-    'giech',
     'giedd',
-    'giedion',
-    'giedraitis',
-    'giel',
-    'gielty',
-    'gienke',
-    'gierre',
-    'gierusalemme',
-    'gieseckite',
-    'giesela',
-    'gieskes',
-    'giesler',
-    'gieson',
-    'giessen-de',
-    'giessler',
-    'gieterveen',
     'gif-10',
-    'gif-q',
-    'gif-xq',
-    'gif-xq-10',
-    'giffin',
-    'gifford/rac',
-    'gifford/royal',
-    'gifford/winning',
-    'giffords',
-    'gift&mdash;no',
-    'gift-back',
-    'gift-buying',
-    'gift-days',
-    'gift-exchange',
-    'gift-givers',
-    'gift-horses',
     'gift-in-kind',
-    'gift-ridden',
-    'gift-set',
-    'gift-type',
-    'gift-which',
-    'gift.of',
-    'gift/donation',
-    'gifte',
-    'giftes',
-    'giftians',
-    'giftie',
-    'giftings',
-    'gifts/hospitality/entertainment',
-    'giftwrapping',
-    'gifucho',
-    'gig-going',
     'gig-lamps',
-    'gig-mill',
-    'gig-type',
-    'giga-connection',
-    'giga-electron-volt',
-    'giga-gutted',
-    'giga-tronics',
-    'gigacredits',
-    'gigadealions',
-    'gigaelectronvolt',
-    'gigaflop',
-    'gigaherz',
-    'gigajoules',
-    'gigalo',
-    'gigan-tia',
-    'gigantelope',
     'giganteus',
-    'giganti',
-    'giganticism',
-    'giganto',
-    'gigantochloa',
-    'gigantomachia',
-    'gigantopithecus',
-    'gigapack',
-    'gigaskirts',
-    'gigatons',
-    'gigayears',
-    'gigbags',
-    'gigero',
-    'gigge',
-    'giggled.',
-    'gigglemas',
     'gigglin\'',
-    'giggs.',
-    'giggs/rush/saunders/hughes/speed/',
-    'gigha',
-    'gigineishvili',
-    'gigio',
-    'gigo',
-    'gigon',
-    'gigou',
-    'gigs.',
-    'gigue',
-    'gih',
-    'giheno',
-    'giichi',
-    'giii',
-    'gikaku',
     'giklmour',
-    'gil-estel',
-    'gil-lian',
-    'gilan-e-gharb',
-    'gilardo',
-    'gilback',
-    'gilbad',
-    'gilbards',
-    'gilbert-and-sullivan',
-    'gilbert-arthur',
-    'gilbert-smith',
-    'gilbert/buccaneer',
-    'gilbert/pupil',
-    'gilbert/surgeon',
-    'gilbert/villager',
-    'gilbertese',
     'gilberthorpe/gloucester',
-    'gilberthorpe/libel',
-    'gilberti',
-    'gilbey.',
-    'gilbo',
-    'gilboa',
-    'gilbody',
-    'gilbreth',
-    'gilburne',
-    'gilcher',
-    'gilchrist-thomas',
-    'gilchrist/leyland',
-    'gilcock',
-    'gilden',
-    'gilder-dollar',
-    'gildergrids',
     'gildersome',
-    'gildings',
-    'gildoran',
-    'gildsmen',
-    'gileadite',
-    'gilel',
-    'gileras',
-    'giles-without-cripplegate',
-    'giles/anti-nazi',
-    'giles/landlady',
-    'giles/lone',
-    'giles/peter',
-    'giles/press',
-    'giles/step-father',
-    'giles/ward',
-    'giles/warwick',
     'giles/wiltshire',
-    'gilet',
-    'gilets',
-    'gilfallan',
-    'gilfore',
-    'gilgallon',
-    'gilgit',
-    'gilham',
-    'gilies',
-    'giljod',
-    'gilkes/mother',
-    'gilkicker',
-    'gill-covers',
-    'gill-like',
-    'gill-maggot',
-    'gill-netting',
     'gill-price',
-    'gill.',
-    'gill/ingleborough',
-    'gill/leyland',
-    'gillair',
-    'gillama',
-    'gillard/monster',
-    'gillborn',
-    'gilled',
-    'gillego',
-    'gillenders',
-    'gillener',
-    'gillercomb',
-    'gillercoom',
-    'gilles-du-gard',
-    'gilles-like',
     'gillespie/cheltenham',
-    'gillespie/course',
-    'gillespie/developer',
-    'gillespie/race',
-    'gillespies',
-    'gillettes',
-    'gillhead',
-    'gillhouse',
-    'gilliams',
-    'gilliatt-scripted',
-    'gilliemore',
-    'gillieses',
-    'gilliflowers',
-    'gilliland/breast',
-    'gillings',
-    'gillit',
     'gillmore/trader',
-    'gillmour',
-    'gillott',
-    'gillside',
-    'gillsides',
-    'gillson',
-    'gilluly',
-    'gillyan',
-    'gilmeister',
-    'gilmer',
-    'gilmiester',
-    'gilmoora',
-    'gilmore/pupil',
-    'gilmorehill',
-    'gilmour/paul',
-    'gilmours',
     'gilroes',
-    'gilroy-sense',
-    'gilstead',
-    'gilston',
-    'gilt-',
-    'gilt-and-gingerbread',
-    'gilt-and-velvet',
-    'gilt-backed',
-    'gilt-bronzes',
-    'gilt-covered',
-    'gilt-edge',
-    'gilt-edging',
-    'gilt-finished',
-    'gilt-japanned',
-    'gilt-laden',
-    'gilt-legged',
     'gilt-lettered',
-    'gilt-lidded',
-    'gilt-like',
-    'gilt-metal',
-    'gilt-mounted',
-    'gilt-painted',
-    'gilt-trimmed',
-    'giltaij',
-    'giltar',
-    'giltmetal',
-    'giltwork',
-    'gilyak',
-    'gimbels',
-    'gimble.',
-    'gimeno',
-    'gimer',
     'gimi',
-    'gimignano.',
-    'gimlet-like',
-    'gimmers',
-    'gimmez',
-    'gimmick-free',
-    'gimmicked',
-    'gimms-generated',
-    'gimoti',
-    'gimps',
-    'gin-addicted',
-    'gin-aholic',
-    'gin-and-lime',
-    'gin-drinking',
-    'gin-filled',
-    'gin-flames',
     'gin-guzzling',
-    'gin-inspired',
-    'gin-palace',
-    'gin-palaces',
-    'gin-rin',
-    'gin-soaked',
-    'gin-swilling',
-    'gin-thirsty',
-    'gin/tonic',
-    'ginadian',
-    'ginchy',
-    'gindin',
-    'ginepro',
-    'gineral',
-    'ginestet',
-    'ginestra',
     'ginga',
-    'gingarden',
-    'ginger-bread',
-    'ginger-clad',
-    'ginger-frizzed',
-    'ginger-glistening',
-    'ginger-mutant-she',
-    'ginger-nob',
-    'ginger-pop',
-    'ginger-pubes',
-    'ginger-red',
-    'ginger-root',
-    'ginger-suited',
-    'ginger-whiskered',
-    'ginger_of',
-    'gingerbread-men',
     'gingerbread-style',
-    'gingerich',
-    'gingernut',
-    'gingery-red',
-    'gingham-coiffed',
-    'gingingara',
-    'ginir',
-    'ginjas',
-    'ginkgo-biloba',
-    'ginkgoaceae',
-    'ginless',
-    'ginley',
-    'ginneken',
-    'ginnels',
-    'ginnindera',
-    'gino-f',
     'ginochetti',
-    'ginott',
-    'ginsberg&rehy;whose',
-    'ginschel',
-    'ginsen',
-    'ginseng-like',
-    'ginster',
-    'gintaras',
-    'gintonic',
-    'ginzburg-landau',
-    'gioa',
-    'gioacchino',
-    'gioas',
-    'giobernay',
-    'giocomini',
-    'giol',
     'giolfino',
-    'giolla',
-    'gionallo',
-    'giong',
-    'gions',
-    'giora',
-    'giordan',
-    'giorgetto',
-    'giorgia',
-    'giorgino',
-    'giorgione-titian-campagnola',
-    'giornata',
-    'giorusteggi',
-    'giosan',
-    'gioseppo',
-    'giottino',
     'gioura',
-    'giova',
-    'giovancili',
-    'giovannetti',
-    'giovanni-battista',
-    'giovanni-it',
-    'giovannitti',
-    'giovanno',
-    'giovenale',
-    'giovio',
-    'giowed',
-    'gip.',
-    'gipe',
-    'gipper',
-    'gippoes',
-    'gippsland',
     'gips',
-    'gipsies.',
-    'gipson',
-    'gipsoteca',
-    'gipsyings',
-    'gipsywort',
-    'gir&acirc;o',
-    'giradet',
-    'giraffe-headed',
-    'giraffe-like',
-    'giraffe-nosed',
-    'giraffish',
-    'girald',
-    'giralt-miracle',
-    'giran',
-    'girardet',
     'girardon',
-    'girardot',
-    'girardum',
-    'girarrosto',
-    'girassol',
-    'girating',
-    'girations',
-    'giraud-saunders/oxfordshire',
-    'girbauds',
-    'girdedst',
-    'girder-work',
-    'girdham',
-    'girdle-cakes',
-    'girdle-line',
-    'girdle.',
-    'girdleness',
     'girdler',
-    'girdler/garage',
-    'girdley',
-    'girenko',
-    'girf',
-    'girga',
-    'girgashites',
-    'giridih',
-    'girikola',
-    'girl&mdash;quite',
-    'girl-at-the-ball-coming-down-the-grand-staircase',
-    'girl-centred',
-    'girl-crazy',
-    'girl-cum-panto',
-    'girl-friday',
-    'girl-love',
     'girl-murder',
-    'girl-on-the-wing',
-    'girl-producing',
-    'girl-spy',
-    'girl-style',
-    'girl-thing',
-    'girl-who-fell-to-earth',
-    'girl-widow',
-    'girl-word',
-    'girl.',
-    'girl/boyfriend',
-    'girl/handsome',
-    'girl/thamesdown',
-    'girl/woman',
-    'girla',
-    'girle',
     'girlest',
-    'girlfirend',
-    'girlfrie',
-    'girlfriend/',
-    'girlfriendly',
-    'girlfriends/',
-    'girlfrienmd',
-    'girlie-girl',
-    'girlie-pictures',
-    'girlpower',
-    'girls&mdash',
-    'girls&mdash;her',
-    'girls-are-better-than-boys',
-    'girls-next-door',
-    'girls-on-the&rehy;wing',
-    'girls.',
     'girls/2',
-    'girls/boys',
-    'girls/women',
-    'girls:boys',
-    'girlz',
-    'girn',
-    'girned',
-    'girner',
-    'girnin\'',
-    'girnock',
-    'girod',
-    'girodet',
-    'giroflee',
-    'girometti',
-    'gironde-landes',
-    'girondo',
     'girone',
-    'girosi',
-    'giroud',
-    'girse',
-    'girth-shy',
-    'girth.',
-    'girthed',
-    'girukwigomba',
-    'girukwigombacommerce',
-    'girven/wiltshire',
-    'girvin',
-    'gis-based',
-    'gis-derived',
-    'gis-generated',
-    'gis-independent',
-    'gis-like',
     'gis-type',
-    'gisanga',
-    'gisarne',
-    'gisbertus',
-    'gisbourne',
-    'gisburn',
-    'gisburne',
-    'gischel',
-    'gischler',
-    'gisebelle',
-    'giselbert',
-    'gisenye',
-    'gisha',
-    'gishel',
-    'gislaved',
-    'gislebertus',
     'gislen',
-    'gislenus',
-    'gisli',
-    'gismo',
-    'gismondis',
-    'gismonti',
-    'gisoreux',
-    'gisselbrecht',
-    'gisselfeld',
-    'gissey',
-    'gissi-1',
-    'gissssa',
-    'gist-listening',
-    'gisudar',
-    'giswil',
-    'giswiler',
     'git/your',
-    'gitana',
-    'gitaned',
-    'gitanilla',
-    'gitaswara',
-    'gitch',
-    'gitelson',
-    'giterne',
-    'githago',
-    'githii',
-    'gitmanlike',
-    'gitschiner',
-    'gitsg',
-    'gitsie',
-    'gitt',
-    'gittel-plus-seven',
     'gittelspawn',
-    'gittens/breastfeeding',
-    'gittleman',
-    'gittler',
-    'gittus/british',
-    'gitty',
-    'giubhsachan',
-    'giubhsaich',
-    'giuda',
-    'giudi',
-    'giudia',
-    'giudiziaria',
-    'giudiziario',
-    'giudizio',
-    'giuffrida',
-    'giulianotti',
     'giulietti',
-    'giulinii',
-    'giulliano',
-    'giumiot',
-    'giunia',
-    'giuntallodi',
-    'giunti',
-    'giuoco',
-    'giurgola',
-    'giuseppina',
-    'giustiniane',
-    'giv&oacute;on',
-    'giv\'n',
-    'give-as-you-earn',
-    'give-it-to-me-now',
-    'give-up',
     'give-us-a-meal',
-    'give-us-our',
-    'give.in',
-    'give/for',
-    'give/get',
-    'gived',
-    'giveing',
-    'given&mdash;perhaps',
-    'given-before-new',
-    'given-birth',
-    'given-large-scale',
-    'given-new',
-    'given-set',
-    'given-up',
-    'given-wilson',
-    'given.i',
     'given_by',
-    'givens/neighbourhood',
-    'giver-in',
-    'givet',
-    'givin',
-    'giving/exchange',
-    'givings',
-    'givo/1n',
-    'givson',
-    'givus',
-    'gizaw',
-    'gizela',
-    'gizmology',
-    'gizz',
-    'gizzmo',
-    'gj',
     'gj&oslash;gv',
-    'gjelsvik',
-    'gjessing',
-    'gjinushi',
-    'gjoka',
-    'gjoni',
-    'gjr',
-    'gjre',
-    'gk1.5',
-    'gks-based',
-    'gkw',
-    'gl&aelig;dum',
-    'gl&auml;ser',
-    'gl&egr;s',
-    'gl&ouml;bke',
-    'gl&ouml;chner',
     'gl&uuml;cksbringer',
-    'gl&uuml;wein',
-    'gl12',
-    'gl20',
-    'gl3',
-    'gl50',
-    'gl52',
-    'gl56',
-    'gl7',
-    'glabellar',
-    'glabriolix',
-    'glaby',
-    'glac&eacute;e',
-    'glace/1',
-    'glacee',
-    'glaces',
     'glacial-to-interglacial',
-    'glacially-dammed',
-    'glacials',
-    'glacialus',
-    'glaciate',
-    'glacier-derived',
-    'glacier-dominated',
-    'glacier-fed',
-    'glacier-filled',
-    'glacier-like',
-    'glacier.',
-    'glacier.it',
-    'glacioisostasy',
-    'glaciotectonic',
-    'glack',
-    'glackin',
     'glad-handed',
-    'gladdening',
-    'gladewood',
-    'gladhand',
-    'gladhanding',
-    'gladiat-ors',
-    'gladiatori',
-    'gladiatots',
-    'gladiis',
-    'gladlove',
-    'gladnesses',
-    'glads',
-    'glae-eyed',
-    'glafkos',
-    'glage',
-    'glagol',
     'glagsow',
-    'glagstones',
-    'glah',
-    'glaholm/labour',
-    'glaholm/wiltshire',
-    'glairy',
-    'glais',
-    'glaisher',
-    'glaive-like',
-    'glaize',
-    'glam-drag',
-    'glam-tastic',
-    'glam-trash',
-    'glame',
-    'glammed',
-    'glammed-up',
     'glamo&ccaron;ko',
-    'glamorgan-gwent',
-    'glamorgancia',
-    'glamorization',
-    'glamorous-seeming',
-    'glamour-boy',
-    'glamour-oriented',
-    'glamour-pusses',
-    'glamour-stuffed',
-    'glamour.',
-    'glamourisation',
-    'glamourised',
-    'glamourises',
-    'glamourization',
-    'glamourpuss',
-    'glamourpusses',
     'glamrock',
-    'glams',
-    'glan-y-pwll',
-    'glanagans',
-    'glanberrys',
-    'glancer',
-    'gland-cell',
-    'gland.',
-    'glandasse',
-    'glandore',
-    'glandulifera',
-    'glangothwyn',
-    'glanmole',
-    'glannaventa',
-    'glanville-blackburn',
-    'glanvilles',
     'glanz',
-    'glanzer',
-    'glanzmann',
-    'glap',
-    'glapinskitown',
-    'glare-blind',
-    'glare-cry',
-    'glareolidae',
-    'glareshield',
-    'glarnisch',
-    'glarryford',
-    'glarus-klontal',
-    'glary',
-    'glas-put',
-    'glascarnoch',
-    'glascol',
     'glasdir',
-    'glase',
-    'glaserfeld',
-    'glasgay!s',
-    'glasgow&ndash;euston',
-    'glasgow*',
-    'glasgow-ayr/largs',
-    'glasgow-carlisle',
-    'glasgow-euston',
-    'glasgow-ites',
-    'glasgow-orkney-shetland',
-    'glasgow-style',
-    'glasgow/',
-    'glasgow/edinburgh-brighton',
-    'glasgow/edinburgh-poole',
-    'glasgowing',
     'glashans',
-    'glashtyn',
-    'glasier',
-    'glasing',
-    'glaskin',
-    'glasmalereien',
-    'glasman',
-    'glasman/women',
-    'glasner',
-    'glasney',
-    'glasovskaya',
-    'glasow',
-    'glasper',
-    'glass&mdash;she',
-    'glass&rehy;boned',
-    'glass&rehy;fronted',
     'glass&rehy;maker',
-    'glass-and-gilt',
-    'glass-and-steel',
-    'glass-and-wood',
-    'glass-animal',
-    'glass-bangle',
-    'glass-bead',
-    'glass-beaded',
-    'glass-blowing',
-    'glass-ceramic',
-    'glass-clad',
-    'glass-clear',
-    'glass-cloths',
-    'glass-covered',
-    'glass-cracking',
-    'glass-crested',
     'glass-cutter',
-    'glass-door',
-    'glass-doored',
-    'glass-drop',
-    'glass-encircled',
-    'glass-encrusted',
-    'glass-epoxy',
-    'glass-etched',
-    'glass-faced',
-    'glass-fibre-reinforced',
-    'glass-floored',
-    'glass-front',
-    'glass-green',
-    'glass-grinder',
-    'glass-happy',
-    'glass-jar',
     'glass-less',
-    'glass-lidded',
-    'glass-lined',
-    'glass-liquid',
-    'glass-made',
-    'glass-maker',
-    'glass-painting',
-    'glass-pane',
-    'glass-panel',
-    'glass-paste',
-    'glass-petalled',
-    'glass-polishing',
-    'glass-polyalkenoate',
-    'glass-screened',
-    'glass-shafted',
-    'glass-shaped',
     'glass-shined',
-    'glass-skinned',
-    'glass-stacked',
-    'glass-stands',
-    'glass-still',
-    'glass-strewn',
-    'glass-style',
-    'glass-tip',
-    'glass-triumphant',
-    'glass-tubing',
-    'glass-visored',
-    'glass-washing',
-    'glass-waving',
-    'glass-windowed',
-    'glass-working',
-    'glass.in',
     'glass/',
-    'glass/a',
-    'glass/box//box/glass',
-    'glass/can/bottle',
-    'glass/polyester',
-    'glass/raf',
-    'glass/resin',
-    'glass/rock',
-    'glassblower',
-    'glassborow',
-    'glassed-over',
-    'glasses-take',
-    'glasses-wearers',
-    'glasses/4',
-    'glasses/7',
-    'glassey',
     'glassfibres',
-    'glassfuls',
-    'glasshouse-grown',
-    'glasshouse-type',
-    'glassie-reconstructs',
-    'glassier',
-    'glassiest',
-    'glassine',
-    'glassing',
-    'glassite',
-    'glasslike',
-    'glassman',
-    'glassmill',
-    'glassteel',
-    'glasstone',
-    'glassware/perfect',
     'glasswear',
-    'glassworker',
-    'glassy-looking',
-    'glassy-smooth',
-    'glastenbury',
-    'glasto',
-    'glastonbury/somerset',
-    'glastonbury/take',
-    'glastullich',
-    'glaswegian-born',
-    'glasweigan',
-    'glatter',
-    'glatz',
-    'glauben',
-    'glaubenbuelen',
-    'glaucagon',
     'glaucia',
-    'glaucidium',
-    'glaucoides',
-    'glauconite',
-    'glaucophane',
-    'glaucously',
-    'glaucum',
-    'glaud',
-    'glaudia',
-    'glaut',
-    'glavany',
-    'glaviano',
-    'glavica',
-    'glavind',
-    'glavlit',
-    'glavnoye',
     'glawari',
-    'glaxie',
-    'glaxo-style',
-    'glaxochem',
-    'glaz',
-    'glazebrook',
-    'glazebury',
-    'glazed-brick',
-    'glazed-cotton',
-    'glazed-eyed',
-    'glazed-eyes',
-    'glazed-looking',
-    'glazedly',
-    'glazeguard',
-    'glazing-bar',
-    'glazioui',
     'glazkov',
-    'glazyev',
-    'glc-related',
-    'glc-style',
-    'glc-type',
-    'glcm',
-    'glcnac',
-    'glcs',
-    'gld',
-    'gldslvbze',
-    'gle',
-    'gleam-surges',
-    'gleam/glory',
-    'gleaming-booted',
-    'gleans',
-    'gleasure',
     'gleave.',
-    'gleaves',
-    'glebbeek',
-    'glebockinational',
-    'glechoma',
-    'gledhill/news',
-    'gleditsia',
-    'gledson',
-    'gledstane',
-    'gledy',
-    'gleeman',
-    'gleeper',
-    'glees/espionage',
-    'gleesome',
-    'gleghorn',
-    'glehn',
     'gleich',
-    'gleichschattung',
-    'gleik',
-    'gleipnir',
-    'gleiser',
-    'glek',
-    'glemm',
-    'glemsford',
-    'glen-arric',
-    'glen-gery',
-    'glen-man',
-    'glen/prisoner',
-    'glenad',
-    'glenalbyn',
-    'glenamaddy',
-    'glenamara',
     'glenann',
-    'glenanne',
-    'glenarmanton',
-    'glenarn',
-    'glenarriff',
-    'glenarthur',
-    'glenballeamon',
-    'glenbrien',
-    'glenbuck',
-    'glenburgh',
-    'glenbuterol',
-    'glencarse',
-    'glencase',
-    'glenchoma',
-    'glencogh',
-    'glencorp',
     'glencourse',
-    'glencoyn',
-    'glencregagh',
-    'glendairy',
-    'glendambo',
-    'glendarroch',
-    'glendell',
-    'glendenen.',
-    'glendevon',
-    'glendhill',
-    'glendhu',
-    'glendon',
-    'glendonald',
-    'glendor',
-    'glendronach',
-    'glendun',
     'gleneagle',
-    'glenegedale',
-    'glenesk',
-    'glenfillan',
-    'glenford',
-    'glenfrome',
-    'glengarnock',
-    'glengarrys',
-    'glengelt',
-    'glengomley',
-    'glengonnar',
-    'glengorne',
-    'glengowan',
-    'glengoyne',
-    'glengyle',
-    'glenholme',
     'glenice',
-    'glenigan',
-    'glenisle',
-    'glenkaveckia',
-    'glenleisure',
-    'glenlicht',
-    'glenlochar',
-    'glenlomond',
-    'glenluce',
-    'glenmac',
-    'glenmachrie',
-    'glenmanor',
-    'glenmarie',
-    'glenmavis',
-    'glenmollison',
-    'glenmorangies',
     'glenmoret',
-    'glenmorison',
-    'glennan',
-    'glennasheevar',
-    'glennick',
-    'glenoe',
-    'glenoids',
-    'glenoo',
-    'glenorchy',
-    'glenpointe',
-    'glenravel',
-    'glenriddell',
-    'glenrig',
-    'glenrobin',
-    'glenrossi',
-    'glenrothes-based',
     'glenroy',
-    'glenruthven',
-    'glenryck',
-    'glensax',
-    'glenshellach',
-    'glenshesk',
-    'glenstaghey',
-    'glentaise',
-    'glentaisie',
-    'glentanar',
-    'glentogher',
-    'glenton',
-    'glentrool',
-    'glenturk',
-    'glentype',
-    'glenuaig',
     'glenury-royal',
-    'glenvarigill',
-    'glenveagh',
-    'glenvinean',
-    'glenvon',
-    'glenys-style',
-    'glesga',
-    'glesni',
-    'gletsch',
-    'gletscherschlucht',
-    'glewed',
-    'glfs',
-    'glhb',
-    'gli&egrave;re',
-    'gliadin-antibody',
-    'glib-tongued',
     'glic',
-    'glicentin',
-    'glickum',
-    'gliddon',
-    'glide-approach',
-    'glide-out',
-    'glided.away',
-    'glider-',
-    'glider-borne',
-    'glider-flying',
-    'glider-towing',
-    'glider-tugging',
-    'glideren',
-    'gliders.',
-    'glidwell',
-    'glienecke',
     'glienicke',
-    'gligoric',
-    'glikstein',
-    'glimm\'ring',
-    'glimmering/shimmering',
-    'glimmery',
-    'glimore',
-    'glimotsky',
-    'glimpes',
-    'glimpsing-it',
-    'glin',
-    'gling',
-    'glinns',
-    'glins',
-    'glioblastomas',
-    'gliocladium',
     'gliogenesis',
-    'gliovirin',
-    'gliricidia',
-    'gliss.',
-    'glissant',
-    'glissements',
-    'glissez',
-    'glistenin',
-    'glistenin\'',
-    'glisteningly',
-    'glistenings',
-    'glitch-free',
-    'glitch-proof',
-    'glite',
-    'glitter-and-glass',
-    'glitter-bug',
     'glitter-free',
-    'glitter-loving',
-    'glitter-rock',
-    'glitter-silver',
-    'glitter-sox',
-    'glitter/black',
-    'glitterers',
-    'glitterhouse',
-    'glittering-tongued',
-    'glitteringly',
-    'glitterings',
-    'glitzers',
-    'glitzier',
-    'glitzies',
-    'glitzkrieg',
-    'gll',
     'glm',
-    'gln44',
-    'gln63',
-    'gln73',
-    'gln89',
-    'gloabl',
-    'gloamin\'',
-    'gloanec',
-    'gloar',
-    'gloat&gt',
-    'gloatings',
-    'globai',
-    'global-system',
-    'global/local',
-    'globalbank',
-    'globalement',
     'globalise',
-    'globalized',
-    'globally-aware',
-    'globally-based',
-    'globally-warmed',
-    'globalpex',
-    'globalx',
-    'globalxc',
-    'globalxg',
-    'globalxp',
-    'globe&rehy;trotting',
-    'globe-buttocked',
-    'globe-democrat',
-    'globe-maker',
-    'globe-scroller',
-    'globe-spanning',
     'globe-trot',
-    'globe-trotter',
-    'globe-trotters',
-    'globe.it',
-    'globespan',
-    'globetrot',
-    'globicephala',
-    'globicephalae',
-    'globigerinid',
-    'globocnik',
-    'globocop',
-    'globosa',
-    'globramine',
-    'globular-cluster',
-    'globular-eyed',
-    'globulator',
     'globulifera',
-    'globulin=8.4',
-    'globulins',
-    'glocestershire',
-    'glocestreshyre',
-    'glock',
-    'glockenturm',
-    'glocks',
-    'glocon',
-    'glodex',
-    'glofield',
-    'glogg',
-    'glogwyn',
-    'glomeruloneophritis',
-    'glomerulopathy',
-    'glomo',
     'glomozon',
-    'glonek',
-    'gloo-oo-my',
-    'gloogle',
-    'gloom-pamper',
-    'gloom-riff',
-    'gloomies',
-    'gloominess',
-    'gloomy-like',
-    'gloop-fest',
-    'gloop-gloop',
-    'glooping',
-    'glor',
-    'glora',
-    'gloriaaa',
-    'gloriaaaaaaa',
     'glorieuses',
-    'glorieux',
-    'gloriole',
-    'gloriosissimorum',
-    'glorious.',
-    'glorium',
-    'glory-chasing',
-    'glory-holes',
-    'glory-seekers',
-    'glory-seeking',
-    'glory.jobless',
-    'gloryberries',
-    'gloryberry',
-    'gloryhole',
-    'glosha',
-    'gloss-cream',
     'gloss-enamelled',
-    'gloss-finished',
-    'gloss-printed',
-    'gloss-throated',
-    'glossable',
-    'glossatella',
-    'glossed-over',
-    'glosser',
-    'glossoides',
-    'glosssed',
-    'glossy-black',
-    'glossy-floored',
-    'glossy-haired',
-    'glossy-leaved',
-    'glossy-lipped',
-    'glossy-looking',
     'glossy-magazine',
-    'glossy-new',
-    'glossy-roofed',
-    'glossy-surfaced.paper',
-    'glossy-text',
-    'glottal-stop',
-    'glottalization',
-    'glottogonic',
-    'gloucerstershire',
-    'gloucester&rehy;shire',
-    'gloucester-berkely',
-    'gloucester-holyhead',
-    'gloucester-ross',
-    'gloucester-sharpness',
-    'gloucester.she',
-    'gloucester.the',
     'gloucester/gloucestershire',
-    'gloucester18',
-    'gloucester18pts',
-    'gloucesterahire',
-    'gloucesterhire',
-    'gloucesterhsire/herofrodshire',
-    'gloucestershire-herefordshire',
-    'gloucestershire-worcestershire',
-    'gloucestershire/wiltshire',
-    'gloucestershirephotograph',
-    'gloucestershires',
-    'gloucestsershire',
-    'gloucster',
-    'glough',
-    'glounthaune',
-    'glouston',
     'glove-covered',
-    'glove-leather',
-    'glove-limp',
-    'glove-losers',
-    'glove-maker',
-    'glove-pocket',
-    'glove-prints',
-    'glove-stretchers',
-    'glove-tanned',
-    'glove-type',
-    'glove-wearing',
-    'gloveless',
-    'gloveprints',
-    'glover-james',
-    'glover/butterfly',
-    'gloverall',
     'glow-plugs',
-    'glow-strips',
-    'glowalla',
-    'glowglobe-lit',
-    'glowing-coloured',
-    'gloworm',
-    'glowpaws',
-    'glowstrip',
-    'gloxiniodes',
-    'gloyne',
-    'glro',
-    'glsh',
-    'glsi',
-    'glso',
-    'glssi',
-    'glt-thermal',
     'glts',
-    'glu-',
-    'glu-301',
-    'glu-374',
-    'glu-plasminogen',
-    'glu27',
-    'glu34',
-    'glu88',
-    'glub',
-    'glubbing',
-    'glubu',
-    'glucagonoma',
-    'glucanases',
-    'gluck/sgambati',
-    'gluckel-sarah',
-    'gluco-lyte',
     'glucocholic',
-    'glucocorticoid-induced',
-    'glucocorticosteroids',
-    'glucoheptonate',
-    'gluconeogenic',
-    'glucosaminidase',
-    'glucose-bicarbonate',
-    'glucose-electrolyte',
-    'glucose-h',
-    'glucose-intolerant',
-    'glucose/electrolyte',
-    'glucose/sodium',
-    'glucose/sugar',
-    'glucoseand',
-    'glucosidases',
-    'glucosides',
     'glucuronidation',
-    'glue&rehy;sniffing',
-    'glue-factory',
-    'glue-free',
-    'glue-like',
-    'glue-lines',
-    'glue-solid',
-    'glue-sprayed',
-    'glue-to',
-    'glueball',
-    'glued-neck',
-    'glued-up',
-    'glueman',
-    'glueware',
-    'glueworks',
-    'glueyness',
     'glug-glugging',
-    'gluggers',
-    'glugging',
-    'glugly',
-    'glulams',
-    'glummest',
-    'glummo',
-    'glummuttering',
-    'glupczynski',
-    'glur-2',
-    'glur1&ndash;4',
-    'glusburn',
-    'gluskin',
-    'glusman',
-    'glustered',
-    'glutamate-evoked',
     'glutamate-mediated',
-    'glutamate-receptor',
-    'glutamate/gaba',
-    'glutamines',
-    'glutanime',
-    'glutaraldehyde-osmium',
-    'glutarate',
-    'glutataldehyde-3-phosphate',
-    'glutathione-',
-    'glutathione-agarose',
-    'glutathione-s-transferase',
-    'glutathione-sepharose',
-    'glute',
-    'gluten/gliadin',
-    'gluteraldehyde',
-    'glutes',
     'gluteus',
-    'gluthathione',
-    'gluttoned',
-    'gluttonizes.',
-    'gluxstein',
-    'glvacosmos',
-    'glwyndwr',
-    'gly15',
-    'gly26',
-    'gly4',
-    'gly46',
-    'glycagon',
-    'glycan',
-    'glyceraldehyde',
-    'glyceria',
-    'glycerine-enriched',
     'glycerol/',
-    'glycerol/hcl',
-    'glycidyl',
-    'glycine/arginine',
-    'glycinoeclopin',
-    'glycobiology',
-    'glycochoic',
-    'glycoconjugates',
-    'glycoprotein-binding',
-    'glycosaminidase',
-    'glycosaminoglycan',
-    'glycosaminoglycan-binding',
-    'glycose',
-    'glycosylase',
-    'glycuronic',
-    'glycyrrhiza',
     'glycyrrhizen',
-    'glycyrrhizine',
-    'glyfada',
-    'glykola',
-    'glykos',
-    'glyme',
-    'glyn-owen',
-    'glynclydach',
-    'glyndreth',
-    'glynhafod',
-    'glynhill',
-    'glynn/patient',
-    'glynn/thames',
-    'glynneth',
-    'glynnis',
-    'glyntawe',
     'glyocholate',
-    'glyocogen',
-    'glyoxylate',
-    'glyphsate',
-    'glypressin',
-    'glypro',
-    'glyptic',
-    'glyptis',
-    'glyptodon',
-    'glyptodonts',
-    'glyptostoboides',
-    'glyptotek',
-    'glyrms',
-    'glytex',
-    'glytona',
-    'gm%',
     'gm&rehy;backed',
-    'gm-hughes',
-    'gm-owned',
-    'gm/c',
-    'gm/c2',
-    'gm/leyland',
-    'gm/opel',
-    'gm/r',
-    'gm03452',
-    'gm06135',
-    'gm1',
-    'gm2',
-    'gm3',
-    'gm701',
-    'gmac',
-    'gmap',
     'gmat',
-    'gmbh-kft',
-    'gmbtu',
-    'gmc.',
-    'gmelina',
-    'gmex',
-    'gmf',
-    'gmm',
-    'gmo',
-    'gmp-140',
-    'gmp.',
-    'gms/agecat',
-    'gmt+0100',
-    'gmtv/20/10/93/cde',
-    'gmtv/27/10/93/cde',
-    'gmtv25.10.93',
     'gmu',
-    'gmut',
-    'gmw',
-    'gmwu',
-    'gmyge',
-    'gn&amp;ge',
-    'gn&auml;diges',
-    'gn&omacr;m&emacr',
-    'gn\'r/metallica',
-    'gn-',
-    'gn-a',
-    'gnadenfrei',
-    'gnadenkapelle',
-    'gnadigste',
-    'gnako',
-    'gnangara',
     'gnaphosidae',
-    'gnarled-looking',
-    'gnarly-faced',
-    'gnashings',
-    'gnashy',
-    'gnassinbe',
-    'gnasssingbe',
-    'gnat-bite',
-    'gnat-crazed',
-    'gnat-god',
-    'gnat-psalm',
-    'gnat-ridden',
-    'gnat-whisp',
-    'gnatcatcher',
-    'gnathobases',
-    'gnathodynamometer',
     'gnathostome-type',
-    'gnawin\'',
-    'gnawn',
-    'gnctu',
-    'gneissic',
-    'gng',
-    'gngh',
-    'gnish',
-    'gnitteg',
-    'gnmp',
-    'gnoble',
-    'gnochetti',
-    'gnof',
-    'gnol&eacute;ba',
-    'gnoma',
-    'gnome-dotted',
     'gnome-et-rh&ocirc;ne',
-    'gnome-hat',
-    'gnome-snaffling',
-    'gnomebats',
-    'gnomed',
-    'gnomen',
-    'gnominsh',
-    'gnomish',
-    'gnor\'nt',
-    'gnossiennes',
-    'gnosticizing',
-    'gnostikoi',
-    'gnp-weighted',
-    'gnp7.57.8',
-    'gnrh',
-    'gnudi',
     'gnus',
-    'gnyss',
-    'go%',
-    'go&dstrok;3afoss',
-    'go&dstrok;afoss',
-    'go&mdash',
-    'go&ntilde;i',
-    'go&rehy;around',
-    'go&rehy;between',
-    'go&ucirc;ter',
-    'go\'',
-    'go\'n',
-    'go-a-',
-    'go-abroad',
-    'go-and-get-another-bit-of-moss',
-    'go-anywhere-anytime',
     'go-as-',
-    'go-at',
-    'go-between&mdash;cf.',
-    'go-between-god',
-    'go-by',
-    'go-carts',
-    'go-code',
-    'go-ed',
-    'go-ers',
-    'go-fast',
-    'go-for-broke',
-    'go-for-growth',
-    'go-for-it',
-    'go-for-the-jugular',
-    'go-get-\'em',
-    'go-goretex',
     'go-gos',
-    'go-head',
-    'go-into-groups-discuss-an-important-issue-and-find-a-dramatic-statement-for-us-to-discuss',
-    'go-lightly',
-    'go-lucky',
-    'go-man-go',
-    'go-mode',
-    'go-motion',
-    'go-od',
-    'go-please',
-    'go-sub-light',
-    'go-to-bed',
-    'go-video',
-    'go.',
-    'go.iv',
-    'go.od',
     'go.two',
-    'go/',
-    'go/no',
-    'go/no.go',
-    'go125007',
-    'go2',
-    'go:d',
-    'go_along',
-    'go_as',
-    'go_on',
-    'go_over',
-    'goad-class',
-    'goad.',
-    'goads',
-    'goajira',
-    'goal&mdash',
     'goal&rehy;keeper',
-    'goal&rehy;keeping',
-    'goal&rehy;oriented',
-    'goal&rehy;searching',
-    'goal-ace',
-    'goal-arousal',
-    'goal-average',
-    'goal-den',
-    'goal-differentials',
-    'goal-drought',
-    'goal-getters',
-    'goal-glut',
-    'goal-grabber',
-    'goal-greedy',
-    'goal-hungry',
-    'goal-kick',
     'goal-king',
-    'goal-laden',
-    'goal-lines',
-    'goal-of-the-century',
-    'goal-of-the-year',
-    'goal-poacher',
-    'goal-satisfaction',
-    'goal-side',
-    'goal-snapping',
-    'goal-specification',
-    'goal-state',
-    'goal-stopping',
-    'goal-tender',
-    'goal-ward',
-    'goal/organization',
-    'goal/task',
     'goal:to',
-    'goalby',
-    'goalconds',
-    'goaled',
-    'goaler',
-    'goalfields',
-    'goalgetter',
-    'goalhanger',
-    'goalher',
-    'goalkeeper-skipper',
-    'goalkepeer',
-    'goalminder',
-    'goalo',
-    'goalpost-shifting',
-    'goalpower',
-    'goals/assists',
     'goalsin',
-    'goalstart',
-    'goalstopper',
-    'goalward',
-    'goanna',
-    'goannas',
-    'goascor&aacute;n',
-    'goat\'s-milk',
-    'goat-',
-    'goat-antelope',
-    'goat-boy',
-    'goat-boy.',
-    'goat-breeding',
-    'goat-cart',
-    'goat-cow',
-    'goat-creature',
     'goat-drawn',
-    'goat-dung',
-    'goat-fashion',
-    'goat-foot',
-    'goat-headed',
-    'goat-hunting',
-    'goat-mad',
-    'goat-mask',
-    'goat-meat',
-    'goat-molesting',
-    'goat-skins',
-    'goat-suckers',
-    'goat-swallowing',
-    'goat-tracks',
-    'goat-trails',
-    'goat.',
     'goat/sheep',
-    'goate',
-    'goatee-herd',
-    'goatee-toting',
-    'goater',
-    'goatherds',
-    'goathouse',
-    'goatley',
-    'goatlike',
-    'goatling',
-    'goatlings',
-    'goatly',
-    'goatman',
-    'goatmeat',
-    'goats\'-cheese',
-    'goatshed',
     'goatsuckers',
-    'gob-gimmick',
-    'gob-like',
-    'gob-smacking',
-    'gob-stopper',
-    'gob-stoppers',
-    'goba',
-    'gobaholic',
-    'gobaith',
-    'gobar',
-    'gobargas',
-    'gobbit-boxes',
-    'gobbitt',
-    'gobble-eyed',
-    'gobble-gobble-gobble',
-    'gobbledegook.',
     'gobblin\'',
-    'gobbo',
-    'gobdaw',
-    'gobedjichvili',
-    'gobernador',
-    'gobey',
-    'gobey/guitarist',
-    'gobey/stroud',
-    'gobfuls',
-    'gobinda',
-    'gobins',
-    'gobion',
-    'gobiosoma',
-    'gobles',
-    'goblet-like',
-    'goblet-shaped',
     'goblin-held',
-    'gobnascale',
-    'gobot',
-    'gobrana',
-    'gobrot',
-    'gobseck',
-    'gobshites',
-    'gobsmackingly',
-    'gobsocket',
-    'gobtron',
-    'goburdhun',
-    'goby-like',
-    'goce',
-    'gocek',
-    'gochfeld',
-    'gochoogiya',
     'gock',
-    'god&mdash',
-    'god&rehy;fearing',
-    'god&rehy;given',
-    'god&rehy;imposed',
-    'god\'s-eye',
-    'god\'s-voice',
-    'god(s)',
-    'god-a-mercy',
-    'god-almighty',
-    'god-ancestor',
-    'god-answers',
-    'god-awfulness',
-    'god-based',
-    'god-blasted',
-    'god-botherer',
     'god-breathed',
-    'god-burden',
-    'god-carver',
-    'god-challenging',
-    'god-child',
-    'god-compelled',
-    'god-concepts',
-    'god-created',
-    'god-dammit-i\'m-an-artist',
-    'god-designed',
-    'god-dictator',
-    'god-dominated',
-    'god-fear',
-    'god-focused',
-    'god-forgotten',
-    'god-giant',
     'god-have-you-any-',
-    'god-head',
-    'god-hungry',
-    'god-hunt',
-    'god-idea',
-    'god-idol',
-    'god-in-a-box',
-    'god-in-nature',
-    'god-intoxicated',
-    'god-knows',
-    'god-knows-whatever-else',
-    'god-led',
-    'god-less',
-    'god-likeness',
-    'god-motivated',
-    'god-names',
     'god-natured',
-    'god-of-the-gaps',
-    'god-parents',
-    'god-please-be-kind-and-let-it-be-so',
-    'god-power',
-    'god-prince',
-    'god-realization',
-    'god-rotted',
-    'god-run',
-    'god-seeing',
-    'god-seeking',
-    'god-serpent',
-    'god-sized',
-    'god-speak',
-    'god-talk',
-    'god-tempting',
     'god-the-father',
-    'god-with-us',
-    'god.is',
-    'god.jesus',
-    'god.s',
-    'god/hero',
-    'god:i',
-    'goda',
-    'godaan',
-    'godalchan',
-    'godalmighty',
-    'godan',
-    'godards',
-    'godbert',
-    'godbless',
-    'godburn',
     'godda',
-    'goddag',
-    'goddamit',
-    'goddammed',
-    'goddamnit',
-    'goddamns',
-    'goddams',
-    'goddard/coach',
-    'goddard/villager',
-    'goddards',
-    'goddarned',
-    'goddart',
-    'goddawful',
-    'goddawmighty',
-    'goddb',
-    'godde',
     'goddess-cults',
-    'goddess-figure',
-    'goddess-given',
-    'goddess-idols',
-    'goddess-impersonator',
-    'goddess-like',
-    'goddess-spirit',
-    'goddess-worshipping',
-    'goddest',
-    'goddier',
-    'godefroid',
-    'godel',
-    'godelieve',
-    'godetias',
-    'godewind',
-    'godey',
     'godfather-like',
-    'godfatherly',
-    'godfearers',
-    'godford',
-    'godfree',
-    'godfrey/meditator',
-    'godfrey/thames',
-    'godfrey/villager',
-    'godfreys',
-    'godhede',
-    'godier',
-    'godinton',
-    'godis',
-    'godlee',
-    'godlet',
-    'godlets',
     'godlings',
-    'godlove',
-    'godmama',
-    'godman/abingdon',
-    'godmanstone',
-    'godmund',
-    'godmunddingaham',
-    'godnat',
-    'godness',
-    'godnesse',
-    'godney',
-    'godolla',
-    'godon',
-    'godounov',
-    'godowns',
-    'godowski',
     'godowskis',
-    'godparenthood',
-    'godrej',
-    'godron',
-    'godrotten',
-    'gods-and-men',
-    'godschall',
-    'godsfield',
-    'godshall',
-    'godson/gloucestershire',
-    'godt',
-    'godthaab',
-    'godward',
-    'godwatching',
-    'godwin-austen',
-    'godwinssons',
     'gody',
-    'goedel',
-    'goedhuis',
-    'goef',
-    'goehdeler',
-    'goehlert',
-    'goehr',
-    'goei',
-    'goel',
-    'goelets',
-    'goelz',
-    'goeneutte',
-    'goeppingen',
-    'goer-between',
-    'goeran',
-    'goeres',
     'goertz',
-    'goes&mdash;but',
-    'goes_a',
-    'goethalls',
-    'goeting',
-    'goettel',
-    'goetzee',
-    'goevrnement',
-    'goffer',
-    'goffering',
-    'goffering-iron',
-    'goffman-like',
-    'goffshock',
-    'gofors',
-    'goftar',
-    'gogarth-like',
     'gogen',
-    'gogetter',
-    'goggin',
-    'goggins',
-    'goggle-glasses',
-    'goggle-visor',
-    'goggles.',
-    'gogh\'',
-    'gogh-bonger',
-    'goghian',
-    'goghish',
-    'gogner',
-    'gogoi',
-    'goguadze',
-    'gogue',
-    'goguel',
     'gogulov',
-    'gogynfeirdd',
-    'gohin',
-    'gohner',
-    'goi&acirc;nia',
-    'goias',
-    'goicochea',
-    'goicoechea',
-    'goidelic',
-    'goil',
-    'goine',
-    'goines',
-    'going&ndash',
-    'going-beyond',
-    'going-on-holiday',
-    'going-steady',
     'going-through-the-motions',
-    'going-to-bed',
-    'going-to-dublin',
-    'going-train',
-    'going.it',
-    'going/to',
-    'going_as',
-    'going_out',
-    'goings-on\'',
-    'goins',
-    'goint',
-    'gointuh',
-    'goiporia',
-    'goitres',
-    'goiung',
-    'goiya',
     'gojas',
-    'gojkovics',
-    'gojobori',
-    'gokchai',
-    'gokhale',
-    'gokhan',
-    'gokul',
-    'gol&aacute;n',
-    'golafre',
-    'golas',
-    'golat',
-    'golau',
-    'golay',
-    'golberg',
-    'golby/open',
-    'gold&rehy;leafed',
     'gold&rehy;mounted',
-    'gold&rehy;painted',
-    'gold&rehy;rimmed',
-    'gold&rehy;tapped',
-    'gold-and-amber',
-    'gold-and-blue',
-    'gold-and-green',
-    'gold-and-silver',
-    'gold-backed',
-    'gold-black-striped',
-    'gold-bladed',
-    'gold-blue',
-    'gold-bound',
-    'gold-brick',
-    'gold-bright',
-    'gold-brocade-covered',
     'gold-bronze',
-    'gold-buttered',
-    'gold-buttoned',
-    'gold-capped',
-    'gold-centred',
-    'gold-chain',
-    'gold-crested',
-    'gold-crusted',
-    'gold-curtained',
-    'gold-dark',
-    'gold-domed',
-    'gold-dotted',
-    'gold-dust-sweet',
-    'gold-enamelled',
-    'gold-engraving',
-    'gold-faced',
     'gold-filled',
-    'gold-fished',
-    'gold-frame',
-    'gold-free',
-    'gold-frogged',
-    'gold-furnished',
-    'gold-futures',
-    'gold-glow',
-    'gold-handled',
-    'gold-hilted',
-    'gold-inclusion',
-    'gold-knobbed',
-    'gold-laced',
-    'gold-laden',
-    'gold-leaf-edged',
-    'gold-lettered',
     'gold-lidded',
-    'gold-loans',
-    'gold-lurex',
-    'gold-medallists',
-    'gold-mounted',
-    'gold-nugget',
-    'gold-orientated',
-    'gold-panning',
-    'gold-pillared',
-    'gold-piped',
-    'gold-plated\'',
-    'gold-price',
-    'gold-printed',
-    'gold-prospecting',
-    'gold-relief',
-    'gold-selling',
     'gold-shadowed',
-    'gold-shafted',
-    'gold-sheathed',
-    'gold-silver',
-    'gold-skinned',
-    'gold-speckled',
-    'gold-splintered',
-    'gold-standard',
-    'gold-star',
-    'gold-stone',
-    'gold-striped',
-    'gold-tipped',
-    'gold-tooled',
-    'gold-toothed',
-    'gold-tops',
-    'gold-twist',
     'gold-weight',
-    'gold-white',
-    'gold-wired',
-    'gold-yellow',
-    'gold.47',
-    'gold/brown',
-    'gold/or',
-    'gold/steel',
-    'gold/white',
-    'gold:silver:copper',
-    'goldacre',
-    'goldanskii',
-    'goldbach&ndash;rehage',
-    'goldbeating',
-    'goldblender',
-    'goldblum/rowan',
     'goldbourt',
-    'goldby',
-    'goldcastle',
-    'golddigger',
-    'goldecker',
-    'goldeleh',
-    'goldemburg',
-    'golden-banded',
-    'golden-beaked',
-    'golden-black',
-    'golden-blond',
-    'golden-blonde',
-    'golden-buff',
-    'golden-clad',
-    'golden-cream',
-    'golden-crusted',
     'golden-domed',
-    'golden-dressed',
-    'golden-egg-laying',
-    'golden-grey',
-    'golden-hearted',
-    'golden-mean',
-    'golden-oldies',
-    'golden-robed',
-    'golden-rod',
-    'golden-roofed',
-    'golden-shoe-stepped',
-    'golden-stoned',
-    'golden-streaked',
-    'golden-tailed',
-    'golden-tipped',
-    'golden-tongued',
     'golden-tressed',
-    'golden/grey',
-    'golden/orange',
-    'goldenburg',
-    'goldened',
-    'goldeneh',
-    'goldenweiser',
-    'goldern',
-    'goldert',
-    'goldeson',
-    'goldfine',
-    'goldfinks',
-    'goldflake',
-    'goldflame',
-    'goldfoot',
-    'goldgar',
     'goldhamer',
-    'goldhammer',
-    'goldhand',
-    'goldhead',
-    'goldhill',
-    'goldie-scot',
-    'goldie.',
-    'goldielands',
-    'goldin-meadow',
-    'golding/the',
-    'goldiwilstrasse',
-    'goldkowski',
-    'goldlees',
-    'goldmam',
-    'goldman-hodgkin-katz',
-    'goldmark',
     'goldmedal',
-    'goldor',
-    'goldpan',
-    'goldpanner',
-    'goldrein',
-    'goldrick',
-    'golds.',
-    'goldsack',
-    'goldsboro',
-    'goldsboroughs',
-    'goldseal',
-    'goldsmith\'s',
-    'goldsmith-cum-writing',
-    'goldsmith/engraver',
-    'goldsmith/highways',
-    'goldsmithery',
     'goldsmyths',
-    'goldsoll',
-    'goldson',
-    'goldspur',
-    'goldstrom',
-    'goldswain',
-    'goldthread',
-    'goldthwait',
-    'goldust',
-    'goldvarb',
-    'goldworking',
-    'goldworth',
-    'goldwyn-united',
-    'goldwynisms',
-    'gole',
-    'goleby',
     'goleby/producer',
-    'golechha',
-    'golema',
-    'golf\'',
-    'golf-balls',
-    'golf-based',
-    'golf-clubbing',
-    'golf-crazy',
-    'golf-cricketer',
-    'golf-driving',
-    'golf-equipment',
-    'golf-house',
-    'golf-links',
-    'golf-only',
-    'golf-playing',
-    'golf-writers',
     'golf/esquire',
-    'golf/fixing',
-    'golfaholics',
-    'golfballs',
-    'golfclub',
-    'golfe',
-    'golfhotel',
-    'golfing-designed',
-    'golfing-themed',
-    'golfnet',
-    'golfwise',
-    'golfworks',
-    'golgan',
-    'golgi-stained',
-    'golgo',
-    'goliadkin',
     'goliathgasse',
-    'goligher',
-    'golikov',
-    'golin/harris',
-    'golipur',
-    'golists',
-    'golitsyns',
-    'golke',
-    'golland',
-    'gollasch',
-    'golliwoggy',
-    'gollogly',
-    'gollops',
-    'gollut',
-    'gollywobbler',
-    'gologiques',
     'golomianka',
-    'goloshes',
-    'golowan',
-    'golpejera',
-    'golshmann',
-    'goltho',
-    'goltix',
-    'goltz-kinsk&yacute',
-    'goltzer',
-    'goluan',
-    'golubkov',
-    'golva',
-    'golz',
-    'golzen',
-    'golzern',
-    'gom2',
     'gomara',
-    'gomard',
-    'gombar',
-    'gombos&uuml;ren',
-    'gombosren',
-    'gombrowicz',
-    'gome',
-    'gomel\'sk',
-    'gomenkudasai',
-    'gomera',
-    'gomersal',
-    'gomershow',
-    'gomez-pe&ntilde;a',
-    'gomia',
-    'gomina-pampaliforeign',
-    'gomley',
     'gommage',
-    'gommecourt',
-    'gomorro/mexican',
-    'gomov',
-    'gompa',
-    'gompas',
-    'gompertz',
-    'gomphiocephalus',
-    'gomphocerippus',
-    'gomphotheres',
-    'gomringers',
-    'gomshall',
-    'gomulski',
-    'gon\'',
-    'gon-doh-lar',
-    'gona',
     'gonadotrophin-releasing',
-    'gonadotrophins',
-    'gonaives',
-    'gonave',
-    'gonbee',
-    'goncalo',
-    'goncharenko',
-    'goncz',
-    'gond',
-    'gond&oacute',
-    'gonder',
-    'gondola-like',
-    'gondolin\'',
-    'gondomar',
-    'gone-away',
-    'gone-out',
     'gone-to-seed',
-    'gone_out',
-    'gone_out_of',
-    'gone_so_far',
-    'gonelevu',
-    'goneness',
-    'goners',
-    'gonesse',
-    'gong-strokes',
-    'gong-yuh',
-    'gong/chinese',
-    'gong/island',
-    'gonging',
-    'gongs-and-pips',
-    'gonguzmos',
-    'gonial',
     'goniff',
-    'gonig',
-    'gonim',
-    'gonio',
-    'goniometric',
-    'gonja',
-    'gonky',
-    'gonn',
-    'gonna-be',
-    'gonnae',
-    'gonne-yeats',
-    'gonnes',
-    'gonnet',
-    'gonnos',
-    'gonophs',
-    'gonoplac',
     'gonopodium',
-    'gonorrhea',
-    'gonovii',
-    'gonsalves',
-    'gontaut-biron',
-    'gontier',
-    'gonystylus',
-    'gonz&aacute;lez-palacios',
-    'gonz&aacute;lezdefence',
-    'gonzala',
-    'gonzalaz',
-    'gonzales-falla',
-    'gonzalez-haba',
-    'gonzalez-torres',
-    'goo-go',
-    'goo-l',
     'goobledegook',
-    'gooch&ndash;micky',
-    'gooch-stewart',
-    'gooch.',
-    'goochies',
-    'good&rehy;contrast',
-    'good&rehy;humoured',
-    'good&rehy;womanhood',
-    'good\'n\'proper',
-    'good-and',
-    'good-and-bad-debt',
-    'good-at',
-    'good-boy',
-    'good-by',
-    'good-calibre',
-    'good-cause',
     'good-chris',
-    'good-condition',
-    'good-cop',
-    'good-digs',
-    'good-egg',
-    'good-fitting',
-    'good-form',
-    'good-girl',
-    'good-glass',
-    'good-ground',
-    'good-guy',
-    'good-housekeeping',
-    'good-humouredness',
-    'good-intentioned',
-    'good-living',
-    'good-lookers',
     'good-looking-the',
-    'good-mother',
-    'good-natur',
-    'good-naturedness',
-    'good-neighbour',
-    'good-old',
-    'good-ole-boy',
-    'good-riddance-to-quebec',
-    'good-sense',
-    'good-sister',
-    'good-size',
-    'good-son',
-    'good-sounding',
-    'good-standing',
-    'good-talk',
-    'good-temperedly',
     'good-the',
-    'good-thinking',
-    'good-timers',
-    'good-to-exceptional',
-    'good-torque',
-    'good-uns',
-    'good-vs-evil',
-    'good.and',
-    'good.cricketers',
-    'good/a',
-    'good/average',
-    'good/bad/funny/serious',
-    'good/big',
-    'good/convenient',
-    'good/father',
-    'good/it',
     'good/poor',
-    'good/resident',
-    'good/transplant',
-    'good_at',
-    'goodair',
-    'goodall/designer',
-    'goodamn',
-    'goodb',
-    'goodban',
-    'goodbrother',
-    'goodday',
-    'goodearl',
-    'goodebodies',
-    'goodee',
-    'goodeid',
-    'goodely',
     'goodenough/husband',
-    'goodenough/victim',
-    'gooderson',
-    'goodest',
-    'goodeve',
-    'goodexposure',
-    'goodfella',
-    'goodfellows',
-    'goodfood',
-    'goodguise',
-    'goodhall',
-    'goodhand/british',
-    'goodhart/liberal',
-    'goodhavens',
-    'goodheartedness',
-    'goodhill',
     'goodie-bags',
-    'goodie-goodie',
-    'goodier.',
-    'gooding-sanken',
-    'goodings/raf',
-    'goodirly',
-    'goodis',
-    'goodkin',
-    'goodland',
-    'goodluck',
-    'goodman/goodman',
-    'goodman/goodmans',
-    'goodmandsen',
-    'goodname',
-    'goodnatured',
-    'goodneighbourliness',
     'goodneighbourly',
-    'goodner',
-    'goodnes',
-    'goodness-knows-what',
-    'goodness.',
-    'goodni',
-    'goodnow',
-    'goodrich/gloucester',
-    'goodrich/gloucestershire',
-    'goodrum',
-    'goods&mdash',
-    'goods&mdash;and',
-    'goods&mdash;the',
-    'goods&mdash;was',
-    'goods--whichever',
-    'goods-based',
     'goods-for-goods',
-    'goods-inward',
-    'goods-producing',
-    'goods-related',
-    'goods-train',
-    'goods-yard',
-    'goods.sections',
-    'goods/ownership',
-    'goods/sub-assemblies',
-    'goodsell/patient',
-    'goodshaw',
-    'goodspeed',
-    'goodtime',
-    'goodum',
-    'goodwill.',
-    'goodwin\'',
     'goodwin/acton',
-    'goodwin/bath',
-    'goodwin/birdlip',
-    'goodwin/bristol',
-    'goodwin/brockworth/gloucestershire',
-    'goodwin/chairman',
-    'goodwin/charlton',
-    'goodwin/condicote',
-    'goodwin/durley',
-    'goodwin/elmstone',
-    'goodwin/forest',
-    'goodwin/gloucestershire',
-    'goodwin/guiting',
-    'goodwin/highgrove',
-    'goodwin/kemerton',
-    'goodwin/kingswood',
     'goodwin/leintwardine',
-    'goodwin/lydney',
-    'goodwin/m-50',
-    'goodwin/milton',
-    'goodwin/monmouth',
-    'goodwin/newent',
-    'goodwin/newnham',
-    'goodwin/newnham-on-severn',
-    'goodwin/newport',
-    'goodwin/prior',
-    'goodwin/rendcombe',
-    'goodwin/robinswood',
-    'goodwin/ross-on-wye',
-    'goodwin/south',
-    'goodwin/staunton',
-    'goodwin/stoke',
     'goodwin/swindon',
-    'goodwin/transport',
-    'goodwin/washbourne',
-    'goodwin/whitminster',
-    'goodwin/worcester',
-    'goodwives',
-    'goodwoods',
-    'goody-good',
-    'goody-goodies',
-    'goody-twoshoes',
-    'goody/villager',
-    'gooey-centred',
-    'goofer',
-    'goofey',
-    'goofiness',
-    'goofishly',
     'goofs',
-    'goofy-faced',
-    'goofys',
-    'googies',
-    'googlie',
-    'googoo',
-    'gooi',
-    'gooiest-looking',
-    'gooing',
-    'gook-speaking',
-    'gookin',
-    'gooks',
-    'gool',
-    'goolab',
-    'goolagong',
-    'goole/doncaster',
     'goolis',
-    'goom',
-    'goona',
-    'goonasekera',
-    'goonay',
-    'gooned',
-    'goonetileke',
-    'gooney',
-    'goonish',
-    'gooooaaaaa',
-    'goop',
-    'goore',
-    'goorookelle',
-    'goosberry',
-    'goose&mdash',
-    'goose&rehy;pimples',
     'goose-breast',
-    'goose-bumped',
-    'goose-down',
-    'goose-droppings',
-    'goose-oh',
-    'goose-pie',
-    'goose-quill',
-    'goose-quilled',
-    'goose-skin',
-    'goose-step',
-    'goose-stepped',
-    'gooseberry-bushes',
-    'gooseberry-like',
-    'goosefleshed',
-    'goosefoot',
-    'goosegirl',
     'goosegog',
-    'goosegrass',
-    'goosehill',
-    'gooselet',
-    'gooseneck-sunil',
-    'goosetree',
-    'goost',
-    'goosteli',
-    'goostepping',
-    'goostli',
-    'goostly',
-    'goostrey',
-    'gopher-wood',
-    'gophered',
-    'gopi',
-    'gopik',
     'gopinath',
-    'gopnik',
-    'goppingen',
-    'gopsill',
-    'gopsill/national',
-    'goq',
-    'gor\'all',
-    'gor\'it',
-    'gor-don',
-    'gor-may',
-    'gor-ray',
-    'goradze',
-    'gorain',
-    'gorane',
-    'gorane-zaghawa',
-    'gorani',
     'goras',
-    'gorbacharmed',
-    'gorbachev-kohl',
-    'gorbachev-maxwell',
-    'gorbachev-mitterrand',
-    'gorbachev-reagan',
-    'gorbachev-style',
-    'gorbachev.he',
-    'gorbachev/reagan',
-    'gorbachov/bush',
-    'gorbal',
-    'gorbalite',
-    'gorbalites',
-    'gorbanifar',
-    'gorbatoff',
-    'gorblimey-by-nite',
     'gorbunov',
-    'gorburdhun',
-    'gordes',
-    'gordienko',
-    'gordini',
-    'gordinis',
-    'gordon-duff',
-    'gordon-morgan',
-    'gordon-walker',
-    'gordon/dealer',
-    'gordon/solicitor',
-    'gordong',
-    'gordonia',
-    'gordonians',
-    'gordonprice',
-    'gordonvale',
     'gords',
-    'gore-',
-    'gore-browne',
-    'gore-drenched',
-    'gore-lust',
-    'gore-splattered',
-    'gore-starved',
-    'gore-xcr',
-    'goreau',
-    'gorecki',
-    'goree',
-    'gorefest',
-    'goreham',
-    'gorehounds',
-    'gorel',
-    'gorell-barnes',
     'goremarks',
-    'goremykin',
-    'goren-gothelf',
-    'goreside',
-    'goret-tex',
-    'gorfield',
-    'gorg',
-    'gorgan',
-    'gorge-like',
-    'gorge-ous',
-    'gorgeouses',
-    'gorgeously-coloured',
-    'gorgeously-illustrated',
-    'gorgeousness',
-    'gorgets',
-    'gorgie/dalry',
     'gorgings',
-    'gorgon-akroterion',
-    'gorgon-face',
-    'gorgon-like',
-    'gorgon-mask',
-    'gorgon-masks',
-    'gorgona',
-    'gorgonocephalidae',
-    'gorgonzolas',
-    'gorgos',
-    'gorgu',
-    'gorich',
-    'gorie/forum',
-    'gorig&amacr;u&nacute;4',
-    'gorilla-house',
-    'gorinchem',
     'goring-on-thames',
-    'goring/mill',
-    'gorings',
-    'gorini',
-    'goriot',
-    'goritskaia',
-    'gorj',
-    'gorja',
-    'gorka',
-    'gorke',
-    'gorkha',
-    'gorkham',
-    'gorkon',
-    'gorkova',
-    'gorl',
-    'gorlay',
     'gorleben',
-    'gorleston-on-sea',
-    'gorlich',
-    'gorllewin',
-    'gorlovka',
-    'gorman/assistant',
-    'gorman/coach',
-    'gormely',
-    'gormier',
-    'gormlessby',
-    'gormlessly',
-    'gormley/oxfam',
-    'gormsen',
-    'gorner',
-    'gorni',
-    'gornik',
     'gornja',
-    'gorno',
-    'gorno-badakhshan',
-    'gorobets',
-    'gorod',
-    'gorodishchi',
-    'gorodkin',
-    'gorohova',
-    'gorokhovaya',
-    'goron',
-    'gorostiaga',
-    'gorp',
-    'gorpin\'',
-    'gorping',
-    'gorran',
-    'gorrell',
     'gorrem',
-    'gorrer',
-    'gorrillas',
-    'gorringe/wiggly',
-    'gorris',
-    'gorritia',
-    'gorro',
-    'gorrod',
-    'gorse-bushes',
-    'gorse-covered',
-    'gorse-dotted',
-    'gorse-prickled',
-    'gorsedd',
-    'gorses',
-    'gorshkov',
-    'gorski',
     'gorsley',
-    'gorsse',
-    'gorstart',
-    'gorsucli',
-    'gortacare',
-    'gortakeegan',
-    'gortex-coated',
-    'gortindarragh',
-    'gortnagallon',
-    'gortnaglush',
-    'gortontoid',
-    'gortree',
-    'gortys',
-    'gortz',
-    'gortzacoff',
-    'gorup',
     'gorups',
-    'gorvie',
-    'goryacheva',
-    'goryszewski',
-    'gorzanis',
-    'gorze',
-    'gorze-trier',
-    'gosatomnadzor',
-    'gosau',
-    'gosbeck',
-    'gosbee/cousin',
-    'goschen/employment',
-    'goscombe',
-    'goscote',
-    'gosditch',
-    'gosein',
     'gosh-darn',
-    'gosh-key',
-    'gosha',
-    'goshal',
-    'goshdarn',
-    'goshen',
-    'gosho',
-    'gosht',
-    'gosio',
-    'gosip-compliant',
-    'goskomstat',
-    'goslett',
-    'gosling-whaddon',
-    'goslings/artist',
-    'goslyn',
-    'gosman',
     'gosnave',
-    'gosnell',
-    'gospa',
-    'gospatrick',
-    'gospel-based',
-    'gospel-book',
-    'gospel-books',
-    'gospel-chant',
-    'gospel-hardened',
-    'gospel-harmony',
-    'gospel-marriages',
-    'gospel-music',
-    'gospel-trained',
-    'gospel-truth',
-    'gospel-way',
-    'gospel.',
     'gospelized',
-    'gospellers',
-    'gospelly',
-    'gosplan-types',
-    'gosplanner',
-    'gospod',
-    'gospodarczych',
-    'goss/performer',
-    'goss/roger',
-    'gossaert',
-    'gossamer-fine',
-    'gossamer-like',
-    'gossamer-robed',
-    'gossamer-thin',
-    'gossards',
-    'gossel',
     'gossip\'',
-    'gossip-columnists',
-    'gossip-point',
-    'gossip/info',
-    'gossipee',
-    'gossipping',
-    'gossom',
-    'gossop',
-    'gosstroy',
-    'gossyplure',
-    'gossypol',
-    'gosta',
-    'goste',
-    'gostelradio',
-    'gostely',
-    'gostermers',
     'gosti',
-    'gostilna',
-    'gostling/dep',
-    'gostling/gallagher',
-    'gostwicke',
-    'gosubs',
-    'gosudarstvennoe',
-    'gosute',
-    'got-a',
-    'got-there-first',
-    'got_as',
-    'got_ever',
-    'got_together',
-    'got_up',
-    'gotama',
-    'gotari',
     'gotb',
-    'gotchas',
-    'gotcher',
-    'gote',
-    'goteborgs',
-    'goten',
-    'goter',
-    'goteyen',
-    'goth-laced',
-    'goth-loving',
-    'goth-style',
-    'gothards',
-    'gothas',
-    'gotherington',
-    'gothette',
-    'gothic-arch',
     'gothic-horror',
-    'gothic-looking',
-    'gothic-revival',
-    'gothic-rococo',
-    'gothic-shaped',
-    'gothic-sounding',
-    'gothic-victorian',
-    'gothic-whimsy',
-    'gothicise',
-    'gothicised',
-    'gothicism',
-    'gothicize',
-    'gothicizing',
-    'gothick-y',
-    'gothicks',
-    'gothicly',
     'gothin',
-    'gothique',
-    'gothorima',
-    'gothpunk',
-    'gothy',
-    'gotic',
-    'goticos',
-    'gotley',
-    'gotlieb',
-    'goto/gosub',
-    'gotoh-like',
-    'gotoh-type',
-    'gotos',
-    'gotown',
-    'gotsch',
-    'gotschalk',
     'gotse',
-    'gotsev',
-    'gotsiridze',
-    'gotsis',
-    'gotta-see-her',
-    'gottedammerung',
-    'gottem',
-    'gottenborg',
-    'gotthardstrasse',
-    'gotthelf-village',
-    'gottleb',
-    'gottleib',
-    'gottlieben',
-    'gottlif-stube',
-    'gottsched',
-    'gottschee',
     'goty',
-    'gouache-pastel-charcoal',
-    'gouara',
-    'goudar',
-    'goudeau',
-    'goudebour',
-    'gouden',
-    'goudys',
-    'gouernment',
-    'goug&eacute;re',
-    'gouge&rehy;like',
-    'gough-yates',
-    'gough/amateur',
-    'gougons',
-    'gougousse',
-    'goulash/bourguignon',
     'goulbourn',
-    'gould-davis',
-    'gould/art',
-    'gouldisms',
-    'gouldsbrough',
-    'goulet',
-    'goulimine',
-    'goulmy',
-    'goulomet',
-    'goulongana',
-    'goulue',
-    'goumarri',
-    'goumiers',
-    'goundrill',
-    'goundry',
-    'gounds',
     'gounod-like',
-    'goup',
-    'gouraud-shared',
-    'gourd-breasts',
-    'gourd-like',
-    'gourdie',
-    'gourdon',
-    'gourgazaud',
-    'gourgonnier',
-    'gourmandise',
-    'gourmands',
-    'gourmet&mdash;as',
-    'gourmets.',
-    'gourna',
-    'gournay',
-    'gournes',
     'gourock-dunoon',
-    'gourteney',
-    'gouted',
-    'gouthi&egrave;re',
-    'goutrage',
-    'gouttes',
-    'gouveia',
-    'gouverment',
-    'gouvernements',
-    'gouverneurs',
-    'gouzoules',
-    'gov\'ner',
-    'govanhill',
-    'gove',
-    'govenrment',
-    'gover/welfare',
     'goverenemnt',
-    'govermment',
-    'govern&rehy;ance',
-    'govern-ment',
-    'governance\'',
-    'governances',
-    'governatorato',
-    'governatore',
-    'governe',
-    'governement',
-    'governers',
-    'governess-companion',
-    'governessing',
-    'governey',
-    'governing-body',
-    'governmen\'',
     'government&mdash;on',
-    'government&rehy;assisted',
-    'government&rehy;to-government',
-    'government\'s',
-    'government(s)',
-    'government*',
-    'government-administered',
-    'government-aided',
-    'government-and-church',
-    'government-as',
-    'government-authorized',
-    'government-big',
-    'government-business',
-    'government-by-cabinet-committee',
-    'government-by-fear',
-    'government-by-veto',
     'government-censored',
-    'government-collected',
-    'government-connected',
-    'government-depoliticisation',
-    'government-designated',
-    'government-directed',
-    'government-donated',
-    'government-driven',
-    'government-employers',
-    'government-employers-trade',
-    'government-established',
-    'government-free',
-    'government-friendly',
-    'government-funding',
-    'government-generated',
-    'government-grant-aided',
     'government-group',
-    'government-hacked',
-    'government-issued',
-    'government-level',
-    'government-management',
-    'government-military',
-    'government-negotiated',
-    'government-opposition',
-    'government-ordered',
-    'government-pac',
-    'government-patrolled',
-    'government-perceived',
-    'government-reared',
-    'government-recommended',
-    'government-released',
-    'government-rigged',
     'government-sector',
-    'government-setting',
-    'government-shrinking',
-    'government-stamped',
-    'government-supervised',
-    'government-supplied',
-    'government-supporting',
-    'government-the',
-    'government-tnc',
-    'government-training',
-    'government-tuc',
-    'government-union',
-    'government.',
-    'government/',
-    'government/2',
-    'government/bsa',
     'government/imf',
-    'government/local',
-    'government/movement',
-    'government/opposition',
-    'government/organised',
-    'government/union/employer',
-    'governmental-cultural',
-    'governmentowned',
-    'governmentregulated',
-    'governments\'commitment',
-    'governments-',
-    'governments-conservative/liberal',
-    'governments-in-exile',
-    'governmentwants',
-    'governmment',
-    'governmnet',
     'governness',
-    'governor\'',
-    'governor-designate',
-    'governor-generals',
-    'governor-generalships',
-    'governor-in-chief',
-    'governor/governess',
-    'governor/horfield',
-    'governor/oxford',
-    'governors&bull;shoreline&bull;storm',
-    'governour',
-    'govidge',
-    'govier/alan',
-    'govier/former',
-    'govier/maxwell',
-    'govier/retired',
     'govindan',
-    'govts.',
-    'gow-mac',
-    'gowanloch',
-    'gowanside',
-    'goward',
-    'gowardhan',
-    'gowby',
-    'gowda',
-    'gowden',
-    'gowdie',
-    'gowe',
-    'gowens',
-    'gower-style',
-    'gower/gary',
-    'gower/national',
     'gower/nuclear',
-    'gowerlond',
-    'gowersor',
-    'gowerton',
-    'gowin',
-    'gowkarran',
-    'gowling',
-    'gowman',
-    'gown-shop',
-    'gown/bathrobe',
-    'gownsman',
-    'gowries',
-    'gowry',
-    'gowt',
-    'gowy',
-    'goya-like',
     'goyal',
-    'goyder',
-    'goyemide',
-    'goymer',
-    'goyogana',
-    'goyour',
-    'goys',
-    'goytisolo',
-    'goz-ok',
-    'goza',
-    'gozling',
-    'gozzard/class',
-    'gp+envam12',
-    'gp-16',
-    'gp-4',
-    'gp-8',
     'gp-elliott',
-    'gp-induced',
-    'gp-patient',
-    'gp/grievous',
-    'gp12',
-    'gp120-antibody',
-    'gp7',
-    'gpals',
-    'gpass',
-    'gpc-decoding',
-    'gpc-parliament',
-    'gpc-pronunciation',
-    'gpcs',
-    'gpfhs',
-    'gpib',
-    'gpib/ix',
     'gpk',
-    'gpn',
-    'gprf',
-    'gps&mdash',
-    'gps-black',
-    'gps-were',
-    'gps/pes&mdash;green',
-    'gpt&gt;gpa&gt&gt;gpg',
-    'gpu+atp',
-    'gpv',
-    'gpv&mdash;reformed',
-    'gpw',
-    'gpz6oo',
-    'gpz900r',
-    'gq3500',
-    'gqh',
     'gr&aacute',
-    'gr&aacute;fico',
-    'gr&aacute;we',
-    'gr&acirc;ce',
-    'gr&acirc;f',
-    'gr&atilde;o',
-    'gr&auml;fe',
-    'gr&auml;slund',
-    'gr&auml;tz',
-    'gr&eacute',
-    'gr&eacute;ber',
-    'gr&eacute;cy',
-    'gr&eacute;goire-how',
-    'gr&eacute;il',
-    'gr&eacute;visse',
-    'gr&egrave;s',
     'gr&iacute;ma',
-    'gr&iacute;shnakh',
-    'gr&lsqb;ace\'s&rsqb',
-    'gr&oslash;nfjorden',
-    'gr&oslash;vu',
-    'gr&ouml;nfors',
-    'gr&ouml;nroos',
-    'gr&ouml;ss',
-    'gr&ouml;sse',
-    'gr&uuml;ndgens/karajan',
-    'gr&uuml;nenthal',
-    'gr&uuml;ner',
-    'gr&uuml;nes',
-    'gr&uuml;nfeld',
-    'gr&uuml;ss',
-    'gr-100',
     'gr-300',
-    'gr-50/gk-2',
-    'gr-505',
-    'gr-700/g-707',
-    'gr-induced',
-    'gr.3s',
-    'gr.eat',
-    'gr100',
-    'gr3',
-    'gr5',
-    'gr50',
-    'gr55-00xla65',
-    'gr7',
-    'graafschap',
-    'graan',
-    'graaskamp',
     'grab&ndash',
-    'grab-a-grammy',
-    'grab-it-quick',
-    'grabau',
-    'grabbe',
-    'grabbin\'',
-    'grabe',
-    'grabed',
-    'graben-like',
-    'graber',
-    'grabrails',
-    'grabski',
-    'graburn',
-    'gracac',
-    'gracanica',
-    'gracas',
     'gracay',
-    'gracchus',
-    'grace-',
-    'grace-and-favour',
-    'grace-elder/journalist',
-    'grace-filled',
-    'grace-full',
-    'grace-given',
-    'grace/wretch',
-    'gracefully-designed',
-    'gracehill',
-    'gracewell',
-    'grachanitsa',
-    'grachav',
-    'gracheva',
-    'gracht',
     'graciano',
-    'graciarena',
-    'gracieux',
-    'gracillima',
-    'graciosa',
-    'gracioso',
-    'graciosos',
-    'gracious-lady',
-    'graciousspeech',
-    'graco',
-    'gradated',
-    'gradational',
-    'gradbach',
-    'graddol',
-    'graddy',
-    'grade&rehy;distribution',
     'grade-1.',
-    'grade-4',
-    'grade-5',
-    'grade-b',
-    'grade-i-listed',
-    'grade-iv',
-    'grade-level',
-    'grade-related',
-    'grade/spinal',
-    'grade0-taking',
-    'grade1',
-    'grade1-unable',
-    'grade2-can',
-    'grade3-can',
-    'grade4-unable',
-    'gradely',
     'grademount',
-    'gradfather',
-    'gradh',
-    'gradians',
-    'gradiants',
-    'gradidge',
-    'gradient/channel/rack',
-    'gradiente',
-    'gradierwerk',
-    'gradignan',
-    'grading/gradation',
-    'gradiometers',
-    'gradiometry',
-    'gradior',
-    'graditude',
-    'gradius',
     'gradobank',
-    'gradu&rehy;ally',
-    'gradually-operating',
-    'gradually.',
-    'graduate/alumni',
-    'graduate/post',
-    'graduates.4',
-    'graduatin',
-    'graduation.',
-    'graduations.',
-    'gradys',
-    'grae',
-    'graebner',
-    'graecae',
-    'graecarum',
-    'graece',
     'graeci',
-    'graeciae',
-    'graeco-gandharan',
-    'graeco-illyrian',
-    'graeco-judaic',
-    'graeco-latin',
-    'graeco-scottish',
-    'graeco-scythian',
-    'graeco-turkish',
-    'graef',
-    'graeff',
-    'graegos',
-    'graellsii',
-    'graeme-rab',
-    'graesser',
-    'graet',
     'graetzer',
-    'grafen',
-    'grafetti',
-    'grafficane',
-    'graffiti-daubed',
-    'graffiti-ed',
-    'graffiti-inspired',
-    'graffiti-proof',
-    'graffiti-splashed',
-    'graffiti-sprayed',
-    'graffitiing',
-    'graffitis',
-    'graffitist',
-    'graffitists',
-    'grafft',
-    'grafia',
     'grafix',
-    'grafonola',
-    'graft-rejection',
-    'graft-versus',
-    'grafted-on',
-    'gragonsly',
-    'grah',
-    'graham-',
-    'graham-based',
-    'graham-jones',
-    'graham-moon',
-    'graham-scott/northampton',
-    'graham-watson',
-    'graham-yooll',
-    'graham/farrans',
-    'graham/fire',
     'graham/inmate',
-    'graham/meningitis',
-    'graham/victim',
-    'grahame-smith',
-    'grahamly',
-    'grahamsbridge',
-    'grahan',
-    'grahnd',
-    'graiae',
-    'grail-legend',
-    'grail/grail',
-    'graily',
-    'grain-bearing',
-    'grain-belt',
-    'grain-carrying',
-    'grain-clipper',
     'grain-dealer',
-    'grain-deficit',
-    'grain-drier',
-    'grain-features',
-    'grain-free',
-    'grain-golden',
-    'grain-growers',
-    'grain-harvest',
-    'grain-importing',
-    'grain-milling',
-    'grain-oriented',
-    'grain-storage',
-    'grain-supported',
-    'grain/cement',
-    'grain445',
-    'grainfax',
     'grainfiller',
-    'grainfillers',
-    'graingeau',
-    'grainger.attendance',
-    'graingere',
-    'grainier',
-    'grainily',
-    'grainless',
-    'grainstones/packstones',
-    'grainstore',
-    'graite',
-    'grakhov',
-    'grakle',
-    'gralko',
-    'grall',
-    'gralloch',
     'grallochs',
-    'gram-molecule',
-    'gramacho',
-    'gramaphon',
-    'gramaphone',
-    'gramaphones',
-    'gramatically',
-    'grambo',
-    'gramby',
-    'grami',
-    'gramicidin',
-    'gramigni',
-    'graminae',
-    'graminearium',
-    'graminearum',
-    'gramineus',
     'graminis',
-    'graminivorous',
-    'grammalogues',
-    'grammanan',
-    'grammar\'',
-    'grammar-based',
-    'grammar-book',
-    'grammar-school.type',
-    'grammar-sensitive',
-    'grammar-the',
-    'grammar/kevin',
-    'grammar/linguistics',
-    'grammar/technical',
-    'grammar/translation',
-    'grammata',
-    'grammaticalizations',
     'grammatik',
-    'grammatization',
-    'grammatologist',
-    'grammercy',
-    'grammophon-polygram',
-    'grammy-grabber',
-    'grammy-winner',
-    'grammy-winning',
-    'gramo',
-    'gramophiles',
-    'gramophon',
-    'gramophonic',
-    'gramos',
-    'grampa',
-    'grampound',
-    'grampton',
     'grampy',
-    'grams.',
-    'grams/day',
-    'grams/litre',
-    'gramscians',
-    'gramshammer',
-    'gramulomatous',
-    'gran-gran',
-    'gran-pickney',
-    'gran-tastic',
-    'granada/visionhire',
-    'granagetown',
-    'granal',
-    'granatina',
-    'grancey',
-    'granchildren',
     'grand&rehy;parents',
-    'grand&rehy;son',
-    'grand&rehy;stand',
-    'grand\'m&egrave;re',
-    'grand-a-nighter',
-    'grand-costumed',
-    'grand-jury',
-    'grand-kids',
-    'grand-mal',
-    'grand-mother',
-    'grand-nephew',
-    'grand-old',
-    'grand-opera',
-    'grand-parent/grandchildren',
-    'grand-parenthood',
-    'grand-place',
     'grand-uncle',
-    'grandad-bashing',
-    'grandaddies',
-    'grandadology',
-    'grandal',
-    'grandather',
-    'granddam',
-    'granddaughter-in-law',
-    'grande-comore',
-    'grandf',
-    'grandfather&mdash;made',
-    'grandfather/grandmother',
-    'grandfathers/mothers',
-    'grandfilial',
-    'grandford',
-    'grandiere',
     'grandiflora.',
-    'grandiflorum',
-    'grandillon',
-    'grandio',
-    'grandma-noreen',
-    'grandma/father',
-    'grandmaisonites',
-    'grandman',
-    'grandmarina',
-    'grandmaternal',
-    'grandmet/watney',
-    'grandmo',
-    'grandmoth',
-    'grandmother&mdash;but',
-    'grandmother-footstepping',
-    'grandmother-in-law',
     'grandmother-tales',
-    'grandmother-who-was-not',
-    'grandmother/grandfather',
-    'grandmotherliness',
-    'grandmum',
-    'grandmums',
-    'grandniece',
-    'grando',
-    'grandos',
-    'grandp&egrave;re',
-    'grandparent\'',
-    'grandparent-friendly',
-    'grandpas',
-    'grandpaterfamilias',
-    'grandridge',
-    'grandselve',
     'grandstand/insurance',
-    'grandtully/strathtay',
-    'grandula',
-    'grandular',
-    'grandure',
-    'grandwean',
-    'grandweans',
-    'graneus',
-    'granfield',
-    'grange-over-',
-    'grangemouth-falkirk',
-    'granger-taylor',
-    'granger/wiltshire',
-    'grangerised',
-    'grangerized',
-    'grangetown-lazenby',
     'grangeville',
-    'grangewell',
-    'grangewood',
-    'granick',
-    'granicus',
-    'granifera',
-    'granilla',
-    'granillo',
-    'granite\'',
-    'granite-associated',
-    'granite-capped',
-    'granite-coloured',
-    'granite-edged',
-    'granite-granodiorite',
-    'granite-harsh',
-    'granite-ophiolite',
     'granite-quarry',
-    'granite-still',
-    'granite/glass',
-    'granite/killas',
-    'granitz',
-    'granivores',
-    'granivorous',
-    'granizo',
-    'grannoch',
-    'grannusch',
-    'granny\'s.',
-    'granny-flat',
-    'granny-murderers',
-    'granoogst',
-    'granophyre',
-    'granovskovo',
     'granparents',
-    'gransch',
-    'granscole',
-    'granston',
-    'grant\'',
-    'grant-',
-    'grant-adamson',
-    'grant-allocations',
-    'grant-based',
-    'grant-funding',
-    'grant-givers',
-    'grant-holders',
-    'grant-livingstone',
-    'grant-sterling',
-    'grant-supported',
-    'grant-you',
     'grant/',
-    'grant/historian',
-    'grant/victim',
-    'grantbridge',
-    'grantcha',
-    'granted/cross',
-    'grantham/gamston',
-    'granthamite',
-    'grantholder',
-    'grantie',
-    'granting/denying',
-    'granton&ndash;cramond',
-    'granton-on-spey',
-    'grants.',
-    'grants/to',
-    'granular-textured',
     'granulate',
-    'granulations',
-    'granule.',
-    'granule/ml',
-    'granule/tablespoon',
-    'granuled',
-    'granuley',
-    'granuliform',
-    'granulitic',
-    'granulocytic',
-    'granulocytosis',
-    'granulomatis',
-    'granulometer',
-    'granville-grossman',
-    'granvilles',
-    'grap',
     'grape-clutches',
-    'grape-green',
-    'grape-nuts',
-    'grape-pickers',
-    'grape-purple',
-    'grape-sized',
-    'grape-treading',
-    'grapefruity',
-    'grapejuice',
-    'grapenuts',
-    'grapey-fruity',
-    'graph-plotter',
-    'graph.1',
-    'graph.plotter',
-    'graph/table',
-    'graph/x',
     'graphaphone',
-    'grapheal',
-    'graphetics',
-    'graphia',
-    'graphic-based',
-    'graphic/photographic',
-    'graphicaly',
-    'graphicon',
-    'graphics-capable',
-    'graphics-intensive',
-    'graphics/drawing',
-    'graphics/motif',
-    'graphicspower',
-    'graphicy',
-    'graphio',
-    'graphiones',
     'graphique',
-    'graphiques',
-    'graphisoft',
-    'graphite-bearing',
-    'graphite-like',
-    'graphite-moderated',
-    'graphite-reinforced',
-    'graphite.',
-    'graphite/50%',
-    'graphite/70%',
-    'graphite/fibreglass',
-    'graphites',
-    'graphoderis',
-    'graphologie',
-    'graphologist',
-    'graphology/phonology',
     'graphpad',
-    'graphpaper',
-    'graphs.',
-    'graphtech',
-    'graphy',
-    'grapical',
-    'grapinel',
-    'grapiness',
-    'grapnels',
-    'grapo&mdash;see',
-    'grappa-laced',
-    'grapple-crazy',
-    'grapple-hooked',
-    'grappler',
-    'grappling-iron',
-    'grappling-irons',
     'graptolitic',
-    'graptoloid',
-    'graptoloidea',
-    'grar-min-ay-oos',
-    'grar-mini-ya',
-    'grarnd',
-    'grasar',
-    'grasbrun',
-    'grascroft',
-    'graseby-specac',
-    'graser',
-    'grashchenkov',
-    'grasiers',
-    'grasmoor',
-    'grason',
-    'grasp\'',
     'grasped&mdash;as',
-    'grasped-at',
-    'grasping/raking',
-    'grass&rehy;or',
-    'grass&rehy;the',
-    'grass-',
-    'grass-brushing',
-    'grass-burning',
-    'grass-cutters',
-    'grass-eaters',
-    'grass-fed',
-    'grass-germination',
-    'grass-grain-grass',
-    'grass-heads',
-    'grass-hoppers',
-    'grass-kept',
     'grass-let',
-    'grass-ley',
-    'grass-light',
-    'grass-mesh',
-    'grass-packed',
-    'grass-pollen',
-    'grass-rooters',
-    'grass-rosette',
-    'grass-seed',
-    'grass-seeded',
-    'grass-skirted',
-    'grass-smoking',
-    'grass-snake',
-    'grass-studded',
-    'grass-topped',
-    'grass-track',
     'grass-tufty',
-    'grass-verged',
-    'grass-widowed',
-    'grass-widowers',
-    'grass-wren',
-    'grass.roots',
-    'grass/cross-leaved',
-    'grass/deer',
-    'grassboxes',
-    'grassbrun',
-    'grassbrunn',
-    'grassby',
-    'grasscocke',
-    'grasselli',
-    'grasser',
-    'grasses.',
     'grassguards',
-    'grasshoff',
-    'grassholme',
-    'grasshoppered',
-    'grassick',
-    'grassie/mother',
-    'grassier',
-    'grassiest',
-    'grassily',
-    'grassland/',
-    'grassland/moorland',
-    'grassle',
-    'grasslot',
-    'grassmann',
-    'grassmere',
-    'grassrooted',
     'grassroots-level',
-    'grassroots/traditional',
-    'grasss',
-    'grasssroots',
-    'grasstrackers',
-    'grasswort',
-    'grassy-staged',
-    'grastle',
-    'grat',
-    'gratchova',
-    'grate-cleaning',
-    'gratefied',
-    'grateglow',
-    'grater/bicester',
-    'grater/peeler',
-    'grati',
     'grati&rehy;tude',
-    'graticules',
-    'gratien',
-    'gratin&eacute;e',
-    'gratin&eacute;s',
-    'gratinate',
-    'gratioloides',
-    'gration',
-    'gratiosa',
-    'gratitoode',
-    'gratitude.',
-    'grats',
-    'gratte',
-    'grattet',
-    'grattons',
-    'gratu&rehy;itously',
     'gratuitously-violent',
-    'gratuits',
-    'gratuituously',
-    'gratutitous',
-    'gratzel',
-    'gratzer',
-    'grau-du-roi',
-    'graudenz',
-    'graue',
-    'grauman',
-    'graun',
-    'graunched',
-    'graunching',
-    'graunde',
-    'graupius',
-    'graupner',
     'graurock',
-    'grausamkeit',
-    'grav&eacute',
-    'gravado',
-    'gravatom',
-    'grave&rehy;digging',
-    'grave&rehy;statues',
-    'grave-',
-    'grave-diggers.',
-    'grave-good',
-    'grave-marker',
-    'grave-markers',
-    'grave-robber',
-    'grave-sites',
-    'grave-statue',
-    'grave-stone',
     'grave-though',
-    'grave/acute',
-    'gravel-bottom-dwelling',
-    'gravel-dredging',
-    'gravel-faced',
-    'gravel-floored',
-    'gravel-pattern',
-    'gravel-pit',
-    'gravel-pits',
-    'gravel-rash',
-    'gravel-timbered',
-    'gravel-timbred',
-    'gravel-under-waves',
-    'graveld',
-    'graveley',
-    'gravelights',
     'gravell',
-    'gravelle/centre',
-    'gravelly-textured',
-    'gravelly-voiced',
-    'gravement',
-    'gravener',
-    'graveness',
-    'gravenhorst-mittelland',
-    'gravensteen',
-    'gravenstein',
-    'graverobbing',
-    'graveroot',
-    'graves-goods',
-    'gravesite',
-    'gravetithe',
-    'gravidas',
     'gravimetry',
-    'gravina',
-    'graviner',
-    'graviportal',
-    'graviscae',
-    'gravitatione',
-    'gravitations',
-    'gravitonos',
-    'gravity-',
-    'gravity-operated',
-    'gravity-opposing',
-    'gravity-percussion',
-    'gravity-shift',
-    'gravity=1',
-    'gravityless',
-    'gravy-brown',
     'gravy-coloured',
-    'gravy-greased',
-    'gravy-sodden',
-    'gravy:i',
-    'gray-and-white',
-    'gray-black',
-    'gray-flannel',
-    'gray-like',
-    'gray-white',
-    'gray/magdalen',
-    'grayburn',
-    'grayburn/farmer',
-    'grayful',
-    'grayg',
-    'grayhounds',
-    'grayly',
     'graynes',
-    'grayon',
-    'grayshotts',
-    'graystanes',
-    'graystone',
-    'graythorp',
-    'grazalema',
-    'grazebrook',
-    'grazing-fields',
-    'grazing-land',
-    'grazing.',
-    'grb2-mediated',
-    'grb2-sh3',
-    'grbavica',
-    'grbovic',
-    'grbs',
     'grc',
-    'grcs',
-    'grdt',
-    'gre-no-li',
-    'grea-based',
-    'greading',
-    'greally',
-    'greamsee',
-    'greaney',
-    'grease-absorbing',
-    'grease-ball',
-    'grease-blackened',
-    'grease-coated',
-    'grease-encrusted',
-    'grease-fingered',
-    'grease-infused',
     'grease-laden',
-    'grease-painting',
-    'grease-paints',
-    'grease-removing',
-    'grease-shining',
-    'grease-spot',
-    'grease-stains',
-    'grease-streaked',
-    'grease-swabber',
-    'grease-wagon',
-    'greaseband',
-    'greased-up',
-    'greaseproof-lined',
-    'greaseproof-paper',
-    'greasier',
-    'greasin',
     'greasin\'',
-    'greasy-wool',
-    'great&rehy;aunt',
-    'great&rehy;granddaughter',
-    'great\'un',
-    'great-beamed',
-    'great-breasted',
-    'great-crested',
-    'great-grand',
-    'great-grand-daughter',
-    'great-grand-daughters',
-    'great-grand-father',
-    'great-grand-son',
-    'great-grandchild',
-    'great-granddaddy',
-    'great-granddaughters',
     'great-grandfer',
-    'great-grandma',
-    'great-grandmas',
-    'great-grandpa',
-    'great-grandpapa',
-    'great-grandpas',
-    'great-grandsons',
-    'great-great-aunt',
-    'great-great-auntie',
-    'great-great-etcetera-grandmothers',
-    'great-great-gran',
-    'great-great-grandad',
-    'great-great-granddaughter',
-    'great-great-grandparents',
-    'great-great-great-grandfather\'s',
-    'great-great-great-grandmother',
     'great-great-great-grandson',
-    'great-great-great-great',
-    'great-great-great-great-grandfather',
-    'great-great-great-great-grandfather\'s',
-    'great-great-great-niece',
-    'great-great-great-uncle',
-    'great-great-uncle',
-    'great-greatgran',
-    'great-greatgranddaughter',
-    'great-handling',
-    'great-hearted',
-    'great-muscled',
-    'great-name',
-    'great-nephews',
-    'great-powerdom',
-    'great-rakes',
     'great-room',
-    'great-serbian',
-    'great-size',
-    'great-something-grandfather',
-    'great-tailed',
-    'great.track',
-    'greatbritain',
-    'greatcoated',
-    'greate',
-    'greater-making',
-    'greater-than-market-clearing',
-    'greater.whether',
-    'greaterefficacy',
-    'greaters',
-    'greatest&rehy;ever',
-    'greatest.',
     'greatests',
-    'greatetud',
-    'greatful',
-    'greatgrandmothers',
-    'greatheart',
-    'greatly-improved',
-    'greatly-respected',
-    'greatnephews',
-    'greatness.',
-    'greatniece',
-    'greatr',
-    'greatrex',
-    'greatrigg',
-    'greatrix',
-    'greatt',
-    'greavesdeputy',
     'greavesey',
-    'greaveshousing',
-    'greavsies',
-    'greazy',
-    'grebby',
-    'grebe-like',
-    'greco-iranian',
-    'greco-karian',
-    'greco-macedonian',
-    'greco-turkish',
-    'grecques',
-    'grecy',
-    'gredley',
-    'greeat',
-    'greece&mdash;something',
-    'greece\'',
     'greece*',
-    'greece-drachma',
-    'greece-rome-judaea',
-    'greece.if',
-    'greece/crete',
-    'greece/italy',
-    'greecebut',
-    'greeces',
-    'greed-crazed',
-    'greed.',
-    'greed/envy',
-    'greediguzzler',
-    'greeenest',
-    'greeff',
-    'greeham',
-    'greek-albanian',
     'greek-barbarian',
-    'greek-classical',
-    'greek-derived',
-    'greek-inspired',
-    'greek-led',
-    'greek-looking',
-    'greek-macedonian',
-    'greek-nato',
-    'greek-owned',
-    'greek-philosophers',
-    'greek-sounding',
-    'greek-speakers',
-    'greek-tragedy',
-    'greek-turkish-bulgarian',
-    'greekborn',
-    'greeke',
     'greeking',
-    'greements',
-    'green&amp',
-    'green&rehy;and-white',
-    'green&rehy;belt',
-    'green&rehy;grocer',
-    'green&rehy;topped',
-    'green&rehy;uniformed',
-    'green\'un',
-    'green\'uns',
-    'green-and-gold',
-    'green-and-gold-painted',
-    'green-and-magnolia',
-    'green-and-red',
-    'green-banked',
-    'green-bellied',
     'green-blonde',
-    'green-bodied',
-    'green-booted',
-    'green-bronze',
-    'green-check',
-    'green-clad',
-    'green-clean',
-    'green-eye',
-    'green-felt',
-    'green-flagged',
-    'green-flowered',
-    'green-fringed',
-    'green-glazed',
-    'green-gloved',
-    'green-gowned',
-    'green-grocers',
     'green-handled',
-    'green-hued',
-    'green-is-moreprofitable',
-    'green-keeping',
-    'green-lacquered',
-    'green-lawned',
-    'green-letter',
-    'green-lichened',
-    'green-lined',
-    'green-lizard-lidded',
-    'green-lobed',
-    'green-loden',
-    'green-of',
-    'green-oil-based',
-    'green-orange',
-    'green-orange-white',
     'green-paper',
-    'green-patterned',
-    'green-pepper',
-    'green-pigmented',
-    'green-pink',
-    'green-price',
-    'green-revolution',
-    'green-robed',
-    'green-roofed',
-    'green-scummed',
-    'green-shoots',
-    'green-slade',
-    'green-sleeves',
-    'green-slimed',
-    'green-speared',
-    'green-stemmed',
     'green-stoned',
-    'green-streaked',
-    'green-stuff',
-    'green-suited',
-    'green-swarded',
-    'green-sweepers',
-    'green-tiled',
-    'green-trellised',
-    'green-turbanned',
-    'green-typed',
-    'green-veined',
-    'green-walled',
-    'green-watered',
-    'green-wellie',
-    'green-wellied',
-    'green-welly',
     'green-white',
-    'green-woods',
-    'green-yellows',
-    'green/amber/red',
-    'green/black',
-    'green/blue',
-    'green/boatman',
-    'green/darts',
-    'green/gloucestershire',
-    'green/landlord',
-    'green/london',
-    'green/na&iuml;ve',
-    'green/navy',
-    'green/near',
-    'green/oxfordshire',
-    'green/president',
     'green/red',
-    'green/shropshire',
-    'green/silvery',
-    'green/wantage',
-    'green/wiltshire',
-    'green/winning',
-    'green/women',
-    'greena',
-    'greenacombe',
-    'greenamyer',
-    'greenanmore',
-    'greenaway/employee',
-    'greenbelt-eaters',
-    'greenbelt.',
-    'greenbelts.',
-    'greenbergian',
     'greenbrier',
-    'greenbul',
-    'greenbuls',
-    'greenburg',
-    'greenburgh',
-    'greencard',
-    'greencoat',
-    'greendykes',
-    'greene-ish',
-    'greene-land',
-    'greene/bddp',
-    'greene/border',
-    'greene/museums',
-    'greenen',
-    'greener-minded',
-    'greener-than-green',
     'greener-than-thou',
-    'greener/daily',
-    'greenereee',
-    'greenes',
-    'greenfile',
-    'greenfinch-like',
-    'greenfinger',
-    'greenfly-eating',
-    'greenford-chiswick',
-    'greengold',
-    'greengrass',
-    'greengrocer/manager',
-    'greengroceries',
-    'greenhalf',
-    'greenhamism',
-    'greenhaven',
     'greenhayes',
-    'greenheys',
-    'greenhillstairs',
-    'greenhithe',
-    'greenhllls',
-    'greenhoe',
-    'greenholme',
-    'greenhous',
-    'greenhouse-forcing-alone',
-    'greenhouse-grown',
-    'greenhouse-humid',
-    'greenhouse-related',
-    'greenhouse.',
-    'greenhouse.effect',
-    'greenhouse/cold',
-    'greenhousees',
     'greenhowe',
-    'greenhurn',
-    'greenhut',
-    'greenidge-haynes',
-    'greenings',
-    'greenish-gold',
-    'greenish-green',
-    'greenish-pink',
-    'greenish-purple',
-    'greenish-tan',
-    'greenkat',
-    'greenknowe',
-    'greenland-iceland-united',
-    'greenlandic',
-    'greenlaw',
-    'greenlee',
     'greenless',
-    'greenlight',
-    'greenline',
-    'greenlys',
-    'greenman',
-    'greeno',
-    'greenoch',
-    'greenockite',
-    'greenore',
-    'greenough/producer',
-    'greenpainted',
-    'greenpar',
-    'greenpeace-brazil',
-    'greenpeace-funded',
-    'greenpeace-style',
-    'greenpeace/',
     'greenpeace/wwf',
-    'greenprint',
-    'greens*',
-    'greens756.45.9',
-    'greenscape',
-    'greenschist',
-    'greenshirts',
-    'greensitt',
-    'greenslade\'s',
-    'greenslee',
-    'greensman/caddie',
-    'greensomes',
-    'greenspace',
-    'greenstained',
-    'greensted',
-    'greensted/author',
     'greenstuffs',
-    'greenup',
-    'greenvoe',
-    'greenwash',
-    'greenway/warehouse',
-    'greenwold',
-    'greenwood/swindon',
-    'greeny-grey-leaved',
-    'greeny-orange',
-    'greer/phoades',
-    'greers',
-    'greesy',
-    'greeters',
-    'greetin\'',
-    'greetings-cards',
-    'greevy',
     'greeze',
-    'greffe',
-    'greffier',
-    'greffs',
-    'greg-he',
-    'greganus',
-    'gregarious.',
-    'gregesche',
-    'gregg/flat',
-    'greggi',
-    'greggism',
-    'gregoriana',
-    'gregorians',
-    'gregoriev',
-    'gregorius',
-    'gregory-hood',
     'gregory/grinyer',
-    'gregory/resident',
-    'gregory/social',
-    'gregorys',
-    'gregson/british',
-    'gregsons',
-    'gregucci',
-    'grehan',
-    'greig-duncan',
-    'greigy',
-    'greil',
-    'greindl',
-    'greinton',
-    'greisa',
-    'greisenised',
-    'greisinger',
     'greit',
-    'greitest',
-    'greiving',
-    'greivous',
-    'grelette',
-    'grelhadas',
-    'grelot',
-    'gremicha',
-    'gremio',
-    'gremlin-plagued',
-    'gremmo',
-    'grenade-launcher',
-    'grenade-shaped',
-    'grenade-tossing',
-    'grenappe',
-    'grenate',
     'grenby',
-    'grenehurst',
-    'grenelefe',
-    'grenersen',
-    'grenfell-like',
-    'grenhill',
-    'grennock',
-    'greno',
-    'grenobloise',
-    'grenoside',
-    'grenson',
-    'grenville&ndash;fox',
-    'grenzg&auml;nger',
-    'grepo',
-    'grer',
-    'gresham/cs',
     'greslie',
-    'gresonnay',
-    'gresshop',
-    'gressier',
-    'gressingham',
-    'gressis',
-    'gressly',
-    'gressus',
-    'gressy-en-france',
-    'greswolde',
-    'gresy',
-    'grethen',
-    'gretl',
-    'gretschy',
-    'gretsky',
-    'grett',
     'gretz',
-    'greussen',
-    'greutzner-robins',
-    'greuze-like',
-    'grev&eacute',
-    'grevilia',
-    'greviously',
-    'grevisse',
-    'grevos',
-    'grevous',
-    'grew_out',
-    'grewe',
-    'grewelthorpe',
-    'grewer',
-    'grex',
-    'grey&rehy;black',
     'grey-and-brick',
-    'grey-and-gold',
-    'grey-and-white-striped',
-    'grey-ashed',
-    'grey-back',
-    'grey-backed',
-    'grey-blonde',
-    'grey-blotched',
-    'grey-browns',
-    'grey-cowled',
-    'grey-crusted',
-    'grey-dashed',
-    'grey-decorated',
-    'grey-dun',
-    'grey-flannelled',
-    'grey-form',
     'grey-furred',
-    'grey-greens',
-    'grey-ie',
-    'grey-importing',
-    'grey-lloyd',
-    'grey-lustred',
-    'grey-marble',
-    'grey-mindedness',
-    'grey-miniskirted',
-    'grey-necked',
-    'grey-peppered',
-    'grey-pink',
-    'grey-purple',
-    'grey-purples',
-    'grey-rimmed',
-    'grey-roofed',
     'grey-rumped',
-    'grey-sand',
-    'grey-silver',
-    'grey-suit',
-    'grey-templed',
-    'grey-tiled',
-    'grey-tinted',
-    'grey-toned',
-    'grey-topped',
-    'grey-whiskered',
-    'grey-wigged',
-    'grey-winged',
-    'grey/ash-laminate',
-    'grey/black/green',
-    'grey/blue/brown',
-    'grey/brown',
     'grey/indigo',
-    'grey/lilac',
-    'grey/thames',
-    'greybe',
-    'greybeck',
-    'greybrook',
-    'greycloak',
-    'greyers',
-    'greyest',
-    'greyey',
-    'greyfriary',
-    'greyhaired',
-    'greyhound-like',
-    'greyhound-style',
-    'greyie',
-    'greyish-coloured',
     'greyish-greeny-bluesy',
-    'greyish-pink',
-    'greyish-purple',
-    'greyish-silver',
-    'greylands',
-    'greylevel',
-    'greylorn',
-    'greypower',
-    'greys**',
-    'greyscales',
-    'greyshirts',
-    'greyskull',
-    'greysotne',
-    'greystock',
-    'greysuited',
-    'greytransom',
     'greywackesiltstone-shale',
-    'greywalls',
-    'greywoode',
-    'grffiths',
-    'gri&ntilde;an',
-    'griams',
-    'grianail',
-    'gribbon',
-    'gribeauval',
-    'gribin',
-    'griboyedov',
-    'gribsby',
-    'grice/customer',
-    'gricing',
-    'gricultural',
-    'grid-',
     'grid-connected',
-    'grid-generated',
-    'grid-locking',
-    'grid-plan',
-    'grid-reference',
-    'grid-reference-positive',
-    'grid-removal',
-    'grid-size',
-    'grid-system',
-    'grid-systems',
-    'gridding',
-    'griddled',
-    'griddling',
-    'gride',
-    'gridful',
-    'griding',
     'gridley/hereford',
-    'gridline',
-    'gridlines',
-    'gridlocks',
-    'gridmark',
-    'gridplan',
-    'grids-type',
-    'griebe',
-    'griebenschmaltz',
-    'griedrich',
-    'grief-maddened',
-    'grief-obsessed',
-    'grief-work',
-    'grief.stricken',
-    'griefen',
-    'griefless',
     'griefstricken',
-    'grieger',
-    'griem',
-    'griersons',
-    'gries',
-    'griesbaum',
-    'griesbeckerzell',
-    'griesinger',
-    'griest',
-    'grieuous',
-    'grieux',
-    'griev',
-    'grievance-handling',
-    'grievance-violence-remedy',
-    'grievance/disciplinary',
-    'grievances.',
     'grievences',
-    'grieves-cook',
-    'grievousness',
-    'grifel',
-    'griffens',
-    'griffi',
-    'griffier',
-    'griffin-head',
-    'griffin/editor/malvern',
-    'griffin/planning',
-    'griffis',
-    'griffith-ee-ee',
-    'griffiths/designer',
-    'griffiths/driver',
-    'griffiths/labour',
-    'griffiths/leaseholder',
     'griffiths/manager',
-    'griffiths/nhs',
-    'griffiths/orient',
-    'griffiths/pensioner',
-    'griffiths/potato',
-    'griffiths/sales',
-    'griffiths/squadron',
-    'griffiths/the',
-    'griffo',
-    'griffon-mounted',
-    'griffon-powered',
-    'grifiths',
-    'grifter',
-    'grig',
-    'griggs/doctor',
-    'griggs/managing',
     'griggs/thames',
-    'grigio',
-    'grignon',
-    'grigny',
-    'grigor\'yev',
-    'grigorescu',
-    'grigorevna',
-    'grigorii',
-    'grigorios',
-    'grigoris',
-    'grigoryan',
-    'grigs',
-    'griinderjahre',
-    'grikelis',
-    'grilapad',
-    'grill&eacute',
     'grill-and-serve',
-    'grill-bar',
-    'grill-pan',
-    'grill.',
-    'grill/microwave',
-    'grillapolis',
-    'grillers',
-    'grillet',
-    'grillmobil',
-    'grilse',
-    'grim&rehy;faced',
-    'grim-eyed',
-    'grim-featured',
-    'grim-lipped',
-    'grim-set',
-    'grim-toothed',
     'grim-voiced',
-    'grim-wah',
-    'grim.there',
-    'grimace.',
-    'grimaldo',
-    'grimani',
-    'grimaux',
-    'grimbles',
-    'grimboid',
-    'grime-covered',
-    'grime-grey',
-    'grime-sprayed',
-    'grime-streaked',
-    'grimek',
-    'grimeley',
-    'grimesby',
     'grimesrustington',
-    'grimethorp',
-    'grimetime',
-    'grimfaced',
-    'grimgrill',
-    'grimly-familiar',
-    'grimmia',
-    'grimmish',
-    'grimmond',
-    'grimod',
-    'grimoldby',
-    'grimpe',
-    'grimperel',
-    'grims',
-    'grimsby-based',
-    'grimsby-louth',
     'grimsby.the',
-    'grimsditch',
-    'grimsdon',
-    'grimsdyke',
-    'grimsell',
-    'grimsetter',
-    'grimshader',
-    'grimsley',
-    'grimsthorpe',
-    'grimus',
-    'grimwich',
-    'grimy-arse',
-    'grin-cracked',
-    'grinby',
-    'grinches',
-    'grincing',
     'grind/who',
-    'grindable',
-    'grindage',
-    'grindcob',
-    'grindea',
-    'grindeland',
-    'grindhouses',
-    'grinding-mills',
-    'grinding-stone',
-    'grinding-wheels',
-    'grindings',
-    'grindlay',
-    'grindlewoods',
-    'grindling',
-    'grindon',
-    'grinevsky',
     'gringa',
-    'gringo-hater',
-    'gringolandia',
-    'grinham',
-    'grining',
-    'grinjo',
-    'grinky',
-    'grinnell',
-    'grinner',
-    'grinnin\'',
-    'grinningly',
-    'grinnings',
-    'grinspoon',
-    'grint',
-    'grinter',
-    'grinyer',
     'griottes',
-    'grip-end',
-    'grip-it-and-rip-it',
-    'gripen',
-    'gripey',
-    'gripings-like',
-    'gripness',
-    'gripping.',
-    'grips/',
-    'gripsholm',
-    'griqualand',
-    'griquas',
-    'grisanowsky',
-    'grise',
-    'griseigena',
-    'griseldes',
     'griselinia',
-    'griseogularis',
-    'griserson',
-    'grisette',
-    'grishankov',
-    'grishinish',
-    'grishkin',
-    'grisiau',
-    'grislewings',
-    'grison',
-    'gristhorpe',
-    'gristwood',
-    'griswald',
-    'griswlinia',
-    'griswold',
-    'grit&eacute',
     'grit-encrusted',
-    'grit-flecked',
-    'grit-scoured',
-    'grit-speckled',
-    'gritella',
-    'grito',
-    'gritok',
-    'gritstone-style',
-    'gritstoners',
-    'gritter',
-    'grittiest',
-    'gritz',
-    'grive',
-    'griveously',
-    'grizabella',
-    'grizzle-bearded',
     'grizzle-headed',
-    'grizzles',
-    'grizzlier',
-    'grizzliest',
-    'grk',
-    'grlisefski',
-    'grlq',
-    'grmmm',
-    'gro&oslash;nland',
-    'gro&rehy;cery',
-    'gro&szlig',
-    'gro&szlig;stadt',
-    'gro-act',
-    'gro/mgsa',
-    'groam',
-    'groan-inducing',
     'groan-producing',
-    'groaningly',
-    'groathill',
-    'groaty',
-    'grobags',
-    'grobart',
-    'grobbelar',
-    'grobblebum',
-    'grober',
-    'grobstein',
-    'groc',
-    'grocer-tory',
-    'grocer/newsagent',
-    'grocery-bar',
-    'grocery-cum-delicatessen',
-    'grochan',
     'grocutt',
-    'grocyn',
-    'grodas',
-    'grodin',
-    'grodo',
-    'groel',
-    'groenendijk',
-    'groener',
-    'groenhof',
-    'groening',
-    'groes',
-    'groetjes',
-    'groframe',
-    'grogan-esque',
-    'groggan',
-    'grogna',
     'grogram-breeches',
-    'grograms',
-    'grogs',
-    'grogwynion',
-    'grohnde',
-    'groin-hauberks',
-    'groin-level',
-    'groin-poundin\'',
-    'groin-vaulted',
-    'groin-wrenching',
-    'groinal',
-    'groinby',
-    'grokware',
-    'grolle',
-    'grolnick',
-    'grommeted',
     'grondbait',
-    'gronden',
-    'grone',
-    'grones',
-    'grongar',
-    'groningen/eelde',
-    'groningens',
-    'groninger',
-    'gronivoe',
-    'gronky',
-    'gronland',
-    'gronnies',
-    'gronskin',
-    'gronwall',
-    'groo',
-    'groom-cum-coachman',
     'groom-willing',
-    'groom/wiltshire',
-    'groombridge/windmill',
-    'groomes',
-    'groomings',
-    'groomsbridge',
-    'grooscors',
-    'groote',
-    'grooteclaes',
-    'grootfontein',
-    'groovature',
-    'groove-locked',
-    'groove-only',
-    'groovefarm/yard',
-    'grooveless',
-    'grooveline',
     'grooveriders',
-    'groovey',
-    'grooveyard',
-    'groovies',
-    'grooviness',
-    'groovy-looking',
-    'gropat',
-    'grope&rehy;suit',
-    'gropeability',
-    'gropers',
-    'gropingly',
-    'groppel',
-    'groppi',
-    'groppis',
-    'gros-point',
-    'grosbeaks',
     'groschler',
-    'grosed',
-    'groseilles',
-    'grosgraine',
-    'grosholtz',
-    'grosovsky',
-    'gross-of-tax',
-    'grossbergers',
-    'grossel',
-    'grosseri',
-    'grossetestes',
-    'grosseto',
-    'grossetti',
-    'grossetto-pugna',
-    'grossheim',
-    'grosshirnsalto',
     'grossly-inflated',
-    'grossly-polluting',
-    'grossmith',
-    'grossmunsterplatz',
-    'grossular',
-    'grosu',
-    'grosveld',
-    'grosvener',
-    'grosvenors',
-    'groszy',
-    'grot-pop',
-    'grota',
-    'grotendorst',
-    'grotenhuis',
-    'grotesqueness',
-    'grotewohl',
     'grothe',
-    'groting',
-    'groton',
-    'grotophorst',
-    'grotoskew',
-    'grotowski',
-    'grots',
-    'grottaglie',
-    'grotten',
-    'grottenlava',
-    'grotti',
-    'grotto-garden',
-    'grotto/nymphaeum',
-    'grou',
-    'groucho-',
-    'grouchos',
     'groucutt',
-    'grouds',
-    'grouillard',
-    'grouillez-vous',
-    'grouin',
-    'ground&mdash;that',
-    'ground&rehy;fielding',
-    'ground(s)',
-    'ground-angle',
-    'ground-apple',
-    'ground-bearing',
-    'ground-borne',
-    'ground-bound',
-    'ground-breaker',
-    'ground-care',
-    'ground-collected',
     'ground-contact',
-    'ground-controlled',
-    'ground-doves',
-    'ground-dwellers',
-    'ground-feeders',
-    'ground-feeding',
-    'ground-firing',
-    'ground-flicker',
-    'ground-frame',
-    'ground-glass',
-    'ground-hugging/semi-trailing',
-    'ground-less',
-    'ground-lift',
-    'ground-lines',
-    'ground-looped',
-    'ground-losing',
     'ground-mass',
-    'ground-motif',
-    'ground-moving',
-    'ground-oriented',
-    'ground-plans',
-    'ground-planting',
-    'ground-related',
-    'ground-seeds',
-    'ground-shared',
-    'ground-sheets',
-    'ground-site',
-    'ground-snow',
-    'ground-staff',
-    'ground-standing',
-    'ground-station',
-    'ground-testing',
     'ground-the',
-    'ground-theme',
-    'ground-to-flour',
-    'ground-training',
-    'ground-travelling',
-    'ground-walking',
-    'ground-wandering',
-    'ground-watertable',
-    'ground-wound',
-    'ground.the',
-    'ground/',
-    'ground/oxford',
-    'ground/rapid',
-    'groundbaited',
-    'groundbase',
-    'groundbased',
     'groundbeans',
-    'grounde',
-    'groundeaters',
-    'grounder',
-    'groundfinch',
-    'groundfish',
-    'groundhandling',
-    'groundlift',
-    'groundplans',
-    'groundroots',
-    'grounds--it',
-    'grounds-that',
-    'grounds.of',
-    'grounds.the',
-    'groundscape',
-    'groundschool',
     'groundshare',
-    'groundstraps',
-    'groundstroke',
-    'groundward',
-    'groundwash',
-    'groundwater-pollution',
-    'groundworkers',
-    'groundworks',
-    'groundwound',
-    'group&gt',
-    'group&lsqb',
-    'group&rehy;building',
-    'group&rehy;captain',
-    'group&rehy;orientated',
-    'group-',
-    'group-19',
     'group-2',
-    'group-activity',
-    'group-as-context',
-    'group-as-instrument',
-    'group-b',
-    'group-buying',
-    'group-by-ear',
-    'group-by-visual',
-    'group-centredness',
-    'group-comparison',
-    'group-compatible',
-    'group-dwelling',
-    'group-formation',
-    'group-franche-manche',
-    'group-housing',
-    'group-identity',
     'group-instigated',
-    'group-it',
-    'group-jeopardy',
-    'group-leaders',
-    'group-learning',
-    'group-led',
-    'group-life',
-    'group-listening',
-    'group-loyalties',
-    'group-meetings',
-    'group-mindedness',
-    'group-of-3',
-    'group-of-seven',
-    'group-optimality',
-    'group-orientated',
-    'group-owned',
     'group-race',
-    'group-relievable',
-    'group-selectionist',
-    'group-standard',
-    'group-structured',
-    'group-structures',
-    'group-takers',
-    'group-teaching',
-    'group-the',
-    'group-theoretic',
-    'group-wise',
-    'group-workers',
-    'group-writing',
-    'group.being',
-    'group.individuals',
-    'group/',
     'group/active',
-    'group/centre',
-    'group/franche-manche',
-    'group/grande',
-    'group/group',
-    'group/how',
-    'group/individual',
-    'group/lexicographer',
-    'group/members',
-    'group/playgroup/nursery/school',
-    'group/rest',
-    'group/sector',
-    'group/sector/person',
-    'group/sector_rather',
-    'group/social',
-    'group/stand',
     'group/state',
-    'group/unit',
-    'groupage',
-    'groupb',
-    'groupements',
-    'groupes',
-    'grouping.',
-    'groupishness',
-    'groupism',
-    'grouplets',
-    'groupo',
-    'groups&mdash;including',
-    'groups&mdash;on',
-    'groups&mdash;the',
-    'groups--exert',
-    'groups-firstly',
     'groups/sectors',
-    'groups/stress',
-    'groups_on',
-    'groupsof',
-    'grouptext',
-    'groupuscular',
-    'groupuscules',
-    'groupworker',
-    'grouse-filled',
-    'grousebeater',
-    'grousebeaters',
-    'grousemoor',
-    'grousers',
-    'groussvenegiger',
-    'grout-filled',
-    'grouws',
     'grov-cap',
-    'grove-based',
-    'grove-palmer',
-    'grove-stephenson',
-    'grove/guitarist',
-    'groveland',
-    'groveling',
-    'groveller',
-    'grover/bentley',
-    'groveries',
-    'groves/families',
-    'groves/flood',
-    'groves/trader',
-    'groves/villager',
-    'grovesnor',
-    'grow-bags',
     'grow-up',
-    'growbox',
-    'growden',
-    'growe',
-    'growh',
-    'growing-points',
-    'growing-rules',
-    'growing-season',
-    'growing-together',
-    'growing/producing',
-    'growingly',
-    'growl-snort',
-    'growledge',
-    'growliest',
-    'growlingly',
-    'growlings',
     'growltiger',
-    'grown-in',
-    'grown-over',
-    'grown-up&mdash;though',
-    'grown-upness',
-    'growne',
-    'growpots',
-    'grows.',
-    'growth\'/\'share',
-    'growth-arrested',
-    'growth-based',
-    'growth-boosting',
-    'growth-by-acquisition',
-    'growth-control',
-    'growth-controlling',
-    'growth-deficiency',
     'growth-enabling',
-    'growth-first',
-    'growth-flake',
-    'growth-forms',
-    'growth-goaded',
-    'growth-hungry',
-    'growth-industry',
-    'growth-layers',
-    'growth-leader',
-    'growth-limiting',
-    'growth-motivated',
-    'growth-obsessed',
-    'growth-orientated',
-    'growth-oriented',
-    'growth-points',
-    'growth-promoted',
     'growth-promoters',
-    'growth-regions',
-    'growth-share',
-    'growth-steps',
-    'growth-stunting',
-    'growth-to',
-    'growth-type',
-    'growth.you',
-    'growth/high',
-    'growth/sexual',
-    'grozier',
-    'groznyy',
-    'grp-1',
-    'grpups',
-    'grr-eat',
-    'grreaat',
     'grrrrowth',
-    'grrrrrr',
-    'grrrrrrrrrrr',
-    'grsm',
-    'grtc',
-    'grtd',
-    'gru&zcaron',
-    'gruagachs',
-    'gruagaich',
-    'gruagaichean',
-    'gruaud',
-    'grub&mdash',
-    'grub-screws',
-    'grub-up',
-    'grubac',
-    'grubb/european',
     'grubb/feed',
-    'grubbers',
-    'grubbiest',
-    'grubbing-stick',
-    'grubbing-up',
-    'grubble',
-    'grubenhauser',
-    'grubhunting',
-    'grubl',
-    'grubscrew',
-    'gruchet-la-vallasse',
-    'gruco',
-    'grudgecore',
-    'grudgeon',
-    'grudger/friedman',
-    'grudgingly-sometimes-fun&rehy;in-a-terribly-boyish-sort-of-way',
     'grudie',
-    'grudin',
-    'grudingly',
-    'grudzi&aogon;dz',
-    'grueber',
-    'grued',
-    'grueling',
-    'gruelling.',
-    'gruellingly',
-    'gruellinng',
-    'gruelly',
-    'gruen',
-    'gruesome-looking',
-    'gruesomest',
-    'gruff-voiced',
-    'gruffer',
     'gruffily',
-    'gruffs',
-    'gruffudd',
-    'gruffy-looking',
-    'gruft',
-    'gruidae',
-    'gruis',
-    'gruishunya',
-    'gruk',
-    'gruman',
-    'grumbled\'',
-    'grumbler',
-    'grumblin\'',
-    'grumiaux',
-    'grummit-maker',
-    'grummitt',
     'grummond',
-    'grumore',
-    'grumous',
-    'grumpas',
-    'grumpy-boots',
-    'grunay',
-    'grunched',
-    'grunches',
-    'grundberg',
-    'grundle',
-    'grundlich',
-    'grundmann',
-    'grundon',
-    'grundrechte',
-    'grundriss',
-    'grundvertrag',
     'grundvoss',
-    'grunebaum',
-    'grunefeld',
-    'grunen',
-    'grunenberg',
-    'grunge-',
-    'grunge-brechtian',
-    'grunge-fest',
-    'grunge-funk',
-    'grunge-led',
-    'grunge-like',
-    'grunge-making',
-    'grunge-rock',
-    'grunge-rockers',
-    'grunged',
-    'grunged-out',
     'grungemeisters',
-    'grungeplay',
-    'grungier',
-    'gruninger',
-    'grunitzky',
-    'grunk',
-    'grunman',
-    'grunsven',
-    'grunt\'',
-    'grunt\'n\'groan',
-    'grunt-and-grind',
-    'grunt-like',
-    'gruntenblick',
-    'grunter',
-    'gruntfuttock',
-    'gruntlement',
     'gruntler',
-    'gruntless',
-    'gruntometers',
-    'grup',
-    'grupos',
-    'gruppa',
-    'gruppenkommandant',
-    'gruppenstab',
-    'gruppi',
-    'gruppi-which',
-    'grusin',
-    'grussa',
-    'gruszecki',
-    'grut',
-    'gruy&egrave;res',
-    'gruyter',
     'gruzino',
-    'gruzinov',
-    'grvous',
-    'gry',
-    'gryder',
-    'gryehounds',
-    'gryf',
-    'gryff',
-    'gryfin',
-    'grygar',
-    'grygor',
-    'gryke',
-    'gryllotalpidae',
-    'gryllus',
-    'gryphaea',
-    'gryphons',
     'gryphus',
-    'gryptight-thynne',
-    'gryspeerdt',
-    'grytviken',
-    'grzybowski',
-    'gs-15',
-    'gs-2',
-    'gs-400',
-    'gs-ana/p-anca',
-    'gs-anas',
-    'gs-d',
-    'gs-goose',
-    'gs2',
-    'gs2/3',
-    'gs3/ap2',
-    'gs300',
     'gs3600',
-    'gs5500fft92',
-    'gs6',
-    'gschwandtkopf',
-    'gseee',
-    'gsell',
-    'gsl',
-    'gso1',
-    'gsp-5',
-    'gst&mdash;10',
-    'gst-atf1',
-    'gst-c-ab1',
-    'gst-creb',
-    'gst-gal4',
-    'gst-gal4&lsqb;1-147&rsqb',
-    'gst-gal4&lsqb;1-147&rsqb;-jun',
     'gst-gata',
-    'gst-gata-1',
-    'gst-pa',
-    'gst-pou&lsqb;c&rsqb;-binding',
-    'gst-pou&lsqb;c&rsqb;-dna',
-    'gst.gal4',
-    'gst.gal4.jun1-193',
-    'gstalt',
-    'gstric',
-    'gsx-r750',
-    'gsz',
-    'gt&gt;ga&gt&gt;gg',
-    'gt-100',
-    'gt-8',
-    'gt-iic',
-    'gt-r',
     'gt.',
-    'gt/ac',
-    'gt11',
-    'gt16',
-    'gt2',
-    'gt3i',
-    'gt40s',
-    'gt6',
-    'gtaggcxcacgtgaccgggtgt',
-    'gtatc',
-    'gtatcc',
-    'gtatcccaggaatcg',
-    'gtatcccgagaatcg',
-    'gtb',
-    'gtb-bound',
-    'gtb7crg',
     'gtc',
-    'gtcs',
-    'gtd',
-    'gtdi',
-    'gtgc',
-    'gtgctgaatatgacgattca',
+)
+
+blocks_75 = (
+    '##ber$$vieh#$coat\'!s#\'derblom&$land$$hart$-of(phonogram)&!s%"rf$#rop$!s##een$!r$\'sthasis',
+    '$"da$&jkheid$"ms$"ng$"ot#%l-man(!n$&/crime$*er-tellers&$dale$$mann$"on#%metti#\'nhauser#$obet',
+    '$"us#%perin##sey#\'tzahler"4m&auml;ldesammlungen$&uuml;t*(lichkeit#&-class%%utter$(engraver$&mining$\'quality$$rock$\'serpent&%tters',
+    '#$acht$#lde\'\'galerie$$tria$$yels#%bloux#%eente$%inden&1schaftsf&auml;hig&%wesen$!r%"ek$!s#$iler$$nata',
+    '%"us$"to#\'matalis&#ion$!e%!d%-ll-hutchinson$*ill-o\'kane%,ngen-homberg$(ological)"st+!s$\'ulation$!y#"ot',
+    '#(sbounder$$mith$%oft36"Jn&egrave;ve-edinburgh-brugge-gen&egrave;ve$+rehy;tleman#\'\'rously#\'-locked$%u-ine#$.6:7##ady$!e#)bank/embl$"el$#oku##cer',
+    '#+darmenmarkt$4er&rehy;constructing&!-\'&\'time\'\'+appropriate\')conscious\'-dichotomising)%vided($rama\',expectations\')groupings\'+indifferent\'&marked\'(opposite\')sensitive',
+    '&%lects&%watch$"in$"je$#ron#$e(i)$"-1%\'bearers%\'centred&$lean\'%oning&(omplexes%&dosage%+environment%$line',
+    '%%pools%&screen&$eeds\'&lected&&pliced&(witching%#tox&)ransduced**plantation$!.%$left$+alogy-based%(ssembler$"en%&skunde',
+    '$%glish$!i%"na$!l%#abs%#eos&!x$\'markers$(ologists$!r%*&rehy;ated-$ions%!.%*a&ndash;on&+ci&oacute;n',
+    '("on&.l&rehy;purpose\'!\'\'!-(%added)%t-sea(&dealer)%uties(%elect(%human()including(#law(\'manager(%owned((practice',
+    '(-secretaryship(+to-specific\'#.43(#ext(\'purpose\'+/foundation((research(*scientific)%imple\'(direktor\'&humans\'$ibus(#dad(#se.)#tic',
+    '(#ter((zability*(tionship\'(klauseln\',landesarchiv(!i(,y-acceptable+%greed+&pplied+(vailable*$held*"in*(peaceful*&recent**understood',
+    '\'%s.see(,ekret&auml;r\'!y&$ted.\',ion&mdash;as+(rehy;gap*#(s)*)-defining+(oriented+(skipping*%/dumb+9transmission/distribution*$ally*"es*$s.in',
+    '\')or/driver%!e%-ic-specialist))trategies\'"al)(ly-named%#ose\'%ities)*y&mdash;it&*us-looking(\'ly-made%#tic%!y$%s.the%*/multigene',
+    '&!e&!s%"io&+s&mdash;the%#may%/tealer-infested$&tesque%.ic-manipulated)\'edicine(+sweepstakes\'+aetiologies()lly-based,\'defined-\'istinct,&linked',
+    '-\'odified,&shared-*usceptible\'(s-supply&"va$%va_in%!e%%ieves%$oise&"ra#-ias/soundware$#chi$!n$#ous$+tal-shaving',
+    '\',ia-flaunting(#bus\'"ly\'#men%$ives%(or-lover$+us&rehy;and&/-mathematicians$"za#"ji#"ki#%lisea##mic#"na%#dii',
+    '%$nica%&rgentu&!i$"er%&sseaux%\'villers$%leman$"oe$&ullmen##oan$%cided$\'ese-led$#me.$*ssenschaft.%sbank',
+    '%\'oxicity%%ropin%$yped$$vefa#$pack##rad%!l$\'e-based\'%ender&\'hopping&\'markers&(pictures($eces&(stomping%+/influences',
+    '$*cher-dumas)$like$"ho$#tat#&t-type$)/vodafone$"an%*r&oacute;0$-ech-sponsored%\'el-type\'$isms\'!y%!m%!r$"he',
+    '\'!a($ceae\'%oides%"cs%%lesse&#ini\'"um&%lesse\'!y&#man%!s$\'le&rehy&%-eyed\'%faced(#olk',
+    '(&ooking\'\'persons&,/obsolescent&,man-commoner+)ricketers**of-leisure*$poet+(ublisher*%usher)$like)!s\'+en-amateurs++ristocratic*\'friends*#ing',
+    '*&ushers)!.)(/animals%)y-curving\'(inclined\'\'lapping\'&moving\'#not\'&rising\'%toned&!.&#_on$!n%"er$!o',
+    '%"os$+rifications(#ers%,y-patricians&!.$"s.$%ulmun$!z#!u$+&rehy;inely$&flects\'!x($ions$%illey%+ne-colonial',
+    '%!s%!t$"ng$)s-species#$wise##zac$"en$!i$#ken"0o-archaeological$$demo$+engineering$\'related$\'science%&pheres',
+    '&\'rategic%\'yncline#&.i.c.7#)2:support#.archaeological##bel%!y$\'otanist#(centrism$&helone$*ybernetics#$data$-esic-designed($ally$!h',
+    '#(ffrey-of(!i&#ion%!y#"gg$!h%#iou$!o$"ra&$fico&*phical-and-(climatic,./environmental-*geological-(physical',
+    ',)ly-and/or/,concentrated/)disparate/)proximate/)scattered0*ignificant*"us("y\')%-both*\'student#$idal#-l&oacute;gica$4ogically-frustrating-)promising\'!e',
+    '\'+st-oriented)!/&"y.#*magnetists%"nt$!e%#tra\'#iae(\'c-types)*ally-based.&shaped)$ized(!d(#sed\'"y-',
+    '(!.$\'ilitech%&nerals(!o$$odel%-rphologically-!e#!n$!g$"ly#%petal$$hone%,ysical/shell+"ly-)-produced',
+    ')#ian$%oetry%)litically&$ymer%$nics%\'tential$$robe#\'quimica#+r&rehy;gian$,die-irishmen$$gala&#nne%"di%"e\'\'-s-in-the-east',
+    '&\'/author\'&domain\'%heart\')neighbour\')paramedic\'#the&5s-d\'esp&eacute;ranche(&pierre\'"cu\'"on)!s%"he%,ia&mdash;see\'&n-born)\'fronted',
+    '($ized&!c\'!a(!l&"ev("ka("na&#jev&%vhili&!y%"oi$#hge$#jan#3science/climatology$&eismic',
+    '%%eered%\'rategic$)ynthetics##tek%&xtiles$$herm$\'raverse""p2#&graphy##ids#%laces#!p$#ert"1r&rehy;manophobia#!\'',
+    '#(-mankind##ace$!d$+ghty/action$!l%$dene&#ton$#nia&"ol&*um-scented*%haped*(mothered("s.%"yl$#rde',
+    '&"ia&"us$%senes%$imos("v\'%"si##bas$$eaux%#rga&%muhle$%randy#6dauen-allenburg-wehlau$!e%$rest%!s',
+    '#&e-good$(formeerd,!e$#int$#mew%#gbo$$nuks$"on&%swall#\'gasites%"tz$%esene#$hart$"oh#"ia',
+    '%(tric-ing)0/psychogeriatric)!a*!s$"ch&\'tsstube%"ke$$ghty$!n#$juoy#$kang#!l$&andine%"ud$#ing',
+    '#\'m-cells%\'factory&\'ighting%%laden%%proof$3ain-des-pr&eacute;s\'\'e-marie\'"ie%"my%.n&oacute;filos&!\'&)-bohemian(#red\'*controlled($roat',
+    '(\'esigned)\'veloped($utch\'(educated\'$held((ungarian0(-italian\'\'induced(&talian\'(japanese\'\'looking\',manufactured\'$ness\'*registered(%oofed',
+    ')%ssian\'-specification)\'onsored(%train\'&teuton(&rained\'"uk(!s&(/belgian\'&jewish\'*luxembourg\'(students($wiss\'$west&!a',
+    '&"ez&&german&!i\'*c-speaking($ally($ised*"ms\'\'nspired\'$sing(!m(!t\'%tatis\',um-beryllium*\'gallium&)o-fascist',
+    '+"es&%scher&$town&+y&mdash;3.5.)democracy/%ouble.)including()rehy;west\'!\'(!s)&enigma\'!-(%aloof(\'centred(%first',
+    '()listeners(%party\'!.\'*/1989/cert$-ersheim/rhein$$idis%3gny-des-pr&egrave;s%"na\'&bility&!s&"vs%#yan(#ids($oglu$#nan',
+    '%"nt$!y#!n$#ert$"ie$"ot$$rode$\'sbacher(!k%$heim##oge$$lamo$"ng%%ticus&)ocracy-an',
+    ')$obia$#rge$"ta#$raff%"nd&!s%&rdavit\'!o&\'t-of-it%"tt$#ick%"es%!n&\'g/sixth\'!s',
+    '#)schenfeld($kron$#hom%$wins$$mehl$\'tenberg+"er\'$feld\'%haber%#ing%$mann)+-straussler%$ner.#"ta%!n',
+    '$"er$"on$,rudenstrasse(!s##uda$#lot$,nd/gerundive&!s$&saleme#&vasius%!t$"en%"ys$#ins$#old',
+    '#$wald$"in#$zina&$ters"(s&uacute%#uml##amt&\'ausgabe$/ngb&uuml;chlein\'#uch&"es&!k&%sweis#-chaeftsbriefe&(ftssache',
+    '%%winde\'+ster-scholl#%ellen&+schafsthaus+"t-$"ng$&tzbuch*!.#"he#%iegt.$"ng$"pa$"th&$cund#\'opholar',
+    '#%saman%#ria$"el&&schaft%$rent$%ilige%!n$"le&!r#&talten%.po&rehy;though\'&-style%#ted\'!s&$ions',
+    '%#ine%!l$(iculates%!n$$sson$"um%,ral/auditive&+e&rehy;then\'$d-to$"yl#%under",t&uacute;lio##\'em#+-acquainted%$head',
+    '%9way-from-only-a-bit-of-it$$even$(in-touch$$like$*on-with-it%"ur&\'t-of-me,Ay-way-i-haven\'t-a-moment-to-spare\'!s$$rich$,the-beers-in(8government-off-our-backs$*up-and-jig$2you-out-of-trouble#!.',
+    '#$/but$*get&dollar\'%s&num#$_fed$*in_contact$$near("er$"up#$alfe#$bulk#$char##ech&"ew$!s#%frame',
+    '##hal&!f$!e%!r$"in$\'semanes)!i#!i$"hu#$next#!o$"ut#$pack##rag$$eide',
+    '$!a#!t$$able$%er-up&!s$"he$(ier-type%3ng-away-with-murder(#off(%ready)&id-of.(2to-know-each-other0.the-neighbours0*you-period(\'up-time',
+    '$%leman$#nau$\'ogeddon\'$ther%\'utahere$#rup$"um$\'y-power%!s&Eburg&ndash;lancaster&ndash;washington#$ulio#&wpdata"#ula#"na#$vara',
+    '#$aert$"ld#"er%,kschaftsbund##rey&+-chambertin")w&uuml;rz#%-gaws##alt$,ndhaus/masur#$erbe%,kschaftsbund1*&mdash;sgb##gaw#%idmet',
+    '$"ss&$heit#%orden%\'fenheit##urz"#zda#!e#%houba!+f10,000,000""50"\'644,000"$91/2"!c#"16"!d',
+    '#!t""fs"!i"#lop")ormat.com"!s##100#!a#!c"#ten#!j!#g11"!4"0aagtcattctctgaga#+c(nnnn)gtcc',
+    '#!t$8caaggaaagctctggcagctg-3\'"\'ca/tgcc$3aaatgtttcctatattcat#!g$%/cgcc#&t/agcc"!e"&f-like#,bpp1&ndash;3&!2#%hbs14$+fb1-encoded"%g.aat#5ctgattgatttgcatgtccag',
+    '""hb"!l"!r"!s"&t/lddc#$gacc!+h&eacute;on"*-deficient#&ghosts"\'/garden#\'kitchen#\'natwest"!1#!6"%5-dna',
+    '"#657"(8-ribose"&aamprh#%bbash$&halach&!r#%daffi%$nfar$$dafi#$foor$\'urifard#%ghara#$irbh#"jn#\'l-maraz',
+    '$"eb#!n$\'ahallah%+ian-swedish&!n%!j$\'di-like%#our$#ian%$stan$"ja$%nejja#%oithe#"ri%#als',
+    '$#wal#(sihusrev$#ted%%liest&"y\'\'%-hued#)totkatcha%#war##uri##vri#%wshah&"eh##zal&!a\'!h',
+    '%"ui$%iabad$"na$#zah"%edina$#ras##est$$wala##lew$%linck$0uvelt-langemarck#%nghis$.t&ndash;bruges#(orghescu&"iu',
+    '$&mazien#$tto\'&,-blasterette\'*enterprise\'#yid&\'blaster&$izes&$logy")i/liberty$)panasonic##aia%!e$"si$$urov#$drah',
+    '#\'llebert$!o##nis#$olla$#tti#!r$&ardini$(inghelli$\'landina$"ri#%selin$#ing$$olfi#*yas-ud-din#!z',
+    '#&uasaid"!o#"bi##dse%$sieh#!e#$lkar#3rbanifar-engineered#%saini$"ht$$t-80&\'appears&(bottlers+#ing\'\'reakers',
+    '&%desks&%fleet+!s&(huntsmen&)inhabited&$life&(negative\'%ipple&\'reasons(#lic\'%idden)#ers&&shrimp\'$tory&%train',
+    '&%voice&%world\'&riters(#ote%!.%\'busting%-chainrattling%$hood&&unting%"ie%#ley&#ier\'"ly\'$ness&&y-like',
+    '%"s.&%capes&$hape%%voice%(watchers%!y##tbi$!i#+ul&rehy;ish%%-mask"%q7094""ra"!u#&burrun#&labzoi',
+    '#$naym$%groos#\'rburran$"ka#"ta"&vdhgkt"#yst"$z/km!(i&ograve"#-rl"$0pcu"!9""ac$%arini$&obazzi',
+    '#%gnoni##lli%!o#%milos$"pa%$etro#\'n-carlo%&franco$(debiaggi$\'giacomo$&luigis$%nadda%$elli%"ia&$colo',
+    '\'!o&!s$%piero$\'t-dwarf&%fiend&&killed&&leaved\'#ike&$nina&%riven&&scaled\'&tepped%#ish\'"ts%&killer',
+    '#&quinto#%rabub$%dello%#ina$$etto#!t#!u#%vanni"$baud#%b/ice$!e%\'rellins&%ingly)!s%!s',
+    '%$ting$"ie%,ngs/cotswold%#son$!o%$nian&)s/coroner%#sum$/s-faberg&eacute&)heaviside%&/owner%"es#&co/brl%#brl##eah',
+    '#&ichung)!s$"er$!n##ney#"or$*z/managing#$ralt\'-ar-registered$"is#%sails$+on-engraved\'\'feeling\'$girl\'&lovers',
+    '\'&toting\'$user&&/daily\'\'gretsch\',homoeopathic\'%royal\'%where&#ian#!t$#ner#"us""ca#$quel"!d#%acred',
+    '##die&!r$&yingly%"up##ing$"on##man#"om#"ri#!s#"uk""e\'#"be%!l#"ch',
+    '$#ion$&raitis#!l$"ty##nke##rre$(usalemme#\'seckite%"la$#kes$#ler$"on$&sen-de%#ler#\'terveen',
+    '$!q$"xq&#-10##fin$\'ord/rac)$oyal(\'winning\'!s#*t&mdash;no$%-back&%uying%$days%(exchange%&givers%&horses',
+    '%&ridden%#set%$type%%which$#.of$)/donation$!e%!s$$ians%!e%#ngs$;s/hospitality/entertainment$(wrapping#$ucho"\'g-going',
+    '$$mill$$type#,a-connection%-electron-volt%&gutted%\'tronics$\'credits$(dealions$,electronvolt$$flop$$herz$&joules$"lo$%n-tia%&telope',
+    '&!i\'$cism&!o\'%chloa\'&machia\'(pithecus$$pack$&skirts$$tons$%years#$bags##ero#"ge$$led.&#mas',
+    '$"s.%</rush/saunders/hughes/speed/#"ha#*ineishvili$!o#!o$!n$!u#"s.#"ue"!h##eno"$ichi#!i"$kaku',
+    '"\'l-estel$$lian#*an-e-gharb$#rdo#$back%!d%#rds$0ert-and-sullivan)%rthur(%smith\'*/buccaneer(%pupil(\'surgeon((villager\'#ese',
+    '-%libel\'!i%"y.$!o%!a%"dy$$reth$$urne#$cher%+rist-thomas)(/leyland$#ock##den%(r-dollar&%grids',
+    '$$ings$$oran$$smen#&eadite$!l$#ras$5s-without-cripplegate%*/anti-nazi&(landlady\'#one&%peter\'$ress&+step-father&$ward)$wick',
+    '$!t%!s#&fallan$#ore#&gallon$"it##ham##ies##jod#*kes/mother$%icker#(l-covers%$like%&maggot%\'netting',
+    '$!.$-/ingleborough%\'leyland$#air%"ma%*rd/monster$$born$"ed%"go%%nders&"er%%rcomb("om%)s-du-gard\'$like',
+    '+%ourse*)developer*$race)!s%$ttes$$head%$ouse$$iams&+tt-scripted%%emore&#ses%\'flowers%+land/breast%#ngs%!t',
+    '&"ur$#ott$$side(!s%"on$#uly$#yan#\'meister%!r$&iester$$oora%(re/pupil\'$hill%\'ur/paul\'!s',
+    '%\'y-sense#%stead%"on#"t-%/and-gingerbread)&velvet%&backed&&ronzes%\'covered%$edge(#ing%(finished%(japanned%%laden&%egged',
+    '&%idded\'"ke%%metal&&ounted%\'painted%\'trimmed$#aij%!r$%metal$$work##yak"%mbels$#le.##eno$!r',
+    '$&gnano.#(let-like#$mers%!z$(ick-free\'"ed$+s-generated##oti#"ps"*n-addicted%%holic%\'nd-lime$(drinking$&filled%%lames',
+    '$(inspired$&palace*!s$#rin$&soaked%\'willing$\'thirsty#&/tonic#%adian##chy##din#$epro$#ral$$stet&"ra',
+    '%$rden$(er-bread\'$clad\'\'frizzed\'*glistening\'*mutant-she\'#nob\'#pop($ubes\'#red(#oot\'&suited\')whiskered&#_of&)bread-men',
+    '&#ich&#nut&%y-red$+ham-coiffed$&ingara#"ir##jas#*kgo-biloba&%aceae#$less%!y#%neken%"ls$&indera##o-f',
+    '$"tt#0sberg&rehy;whose$$chel$"en&&g-like$#ter#%taras$$onic#,zburg-landau""oa$&cchino$!s#&bernay#&comini#!l',
+    '$"la#%nallo$!g$!s#"ra$#dan$%getto%"ia&"no&5one-titian-campagnola$$nata$\'usteggi##san$$eppo#%ttino',
+    '#"va%%ncili&%netti\'*i-battista)"it(#tti\'!o$%enale$"io##wed""p.#!e##per$#oes$%sland',
+    '$$ies.$"on%$teca$%yings%$wort")r&acirc;o#$adet$*ffe-headed($like(%nosed&#ish$"ld%)t-miracle$!n$$rdet',
+    '\'!t&"um%%rosto$$ssol$$ting&#ons$7ud-saunders/oxfordshire#%bauds#%dedst%&r-work$#ham$(le-cakes\'$line&!.&$ness',
+    '\'\'/garage&!y#$enko#!f#"ga%&shites#$idih$$kola#-l&mdash;quite$L-at-the-ball-coming-down-the-grand-staircase%\'centred&$razy&(um-panto%&friday%$love',
+    '%+on-the-wing%)producing%#spy&$tyle%%thing%1who-fell-to-earth&$idow&#ord$!.$*/boyfriend%(handsome%*thamesdown%%woman$!a$!e',
+    '$&firend%#rie(#nd/*"ly*"s/)"md$\'ie-girl\'(pictures$%power$\'s&mdash+$;her%5-are-better-than-boys&)next-door&0on-the&rehy;wing%!.',
+    '&$boys&%women%%:boys$!z#!n$"ed%!r$#in\'$#ock#"od%"et$$flee$%metti$*nde-landes&!o',
+    '$"si$"ud#"se#&th-shy%!.%"ed#)ukwigomba,(commerce#-ven/wiltshire$"in"\'s-based$\'derived$)generated$+independent$$like',
+    '#$anga$#rne#&bertus$%ourne$#urn\'!e#$chel%#ler#&ebelle$%lbert$#nye#"ha$"el#%laved$\'ebertus',
+    '&"us$!i#"mo%$ndis&"ti#%oreux#)selbrecht&$feld%!y$#i-1$#ssa#+t-listening#$udar##wil&"er',
+    '##ana%"ed%$illa$%swara#"ch#%elson$#rne#$hago$"ii#\'manlike#\'schiner$!g$"ie#!t$-el-plus-seven',
+    '%0ns/breastfeeding$%leman&!r$*us/british$!y")ubhsachan\'#ich#"da$!i%!a%&ziaria*!o\'!o#&ffrida#(lianotti',
+    '%#nii$%liano#$miot##nia$\'tallodi%!i##oco#%rgola#\'seppina$\'tiniane"+v&oacute;on#"\'n#-e-as-you-earn%,it-to-me-now%"up',
+    '(#our$#.in$$/for%#get$!d$#ing$/n&mdash;perhaps%+-before-new\'$irth&+large-scale&#new&#set&"up&&wilson%".i',
+    '%/s/neighbourhood$$r-in$!t#"in%*g/exchange&!s#$o/1n##son#"us"#zaw##ela#&mology#!z$"mo!!j',
+    '"&elsvik#%ssing"&inushi"#oka#"ni"!r#!e!$k1.5"\'s-based"!w!+l&aelig;dum$\'uml;ser#%egr;s#(ouml;bke(%chner',
+    '($wein""12""20"!3""50#!2#!6"!7"\'abellar$&riolix$!y#*c&eacute;e$#e/1%!e%!s',
+    '\')ly-dammed\'!s\'"us&"te%*er-derived)(ominated(#fed)%illed($like\'!.("it%)oisostasy&(tectonic$!k%"in',
+    '$&dening$%ewood$$hand(#ing$\'iat-ors\'#ori("ts%"is$$love$&nesses$!s#&e-eyed#$fkos#"ge$"ol',
+    '%%tones#!h$*olm/labour()wiltshire##iry$!s%#her$\'ve-like$"ze#&m-drag%&tastic&$rash$!e$#med\'#-up',
+    '%*rgan-gwent)#cia&\'ization&+ous-seeming%&ur-boy((oriented(&pusses(\'stuffed\'!.\'\'isation)"ed*!s(&zation\'$puss+"es',
+    '$!s#(n-y-pwll$%agans$&berrys$#cer$&d-cell%!.%$asse%#ore%\'ulifera$\'gothwyn$$mole$\'naventa$/ville-blackburn)!s',
+    '%"er%$mann#!p$)inskitown#(re-blind&#cry%&olidae%&shield$%nisch$&ryford$*us-klontal$!y#%s-put$\'carnoch%"ol',
+    '$!e%%rfeld$%gay!s%/ow&ndash;euston\'!*\'*-ayr/largs((carlisle(&euston($ites(/orkney-shetland(%style\'!/(2edinburgh-brighton2%poole\'#ing',
+    '%#tyn$#ier%"ng$#kin$)malereien&!n\'&/women$#ner&!y$\'ovskaya%!w$#per$+s&mdash;she&*rehy;boned+\'fronted',
+    '%)-and-gilt*%steel*$wood($imal&&bangle\'#ead*"ed\'&lowing&\'ceramic\'#lad(#ear($oths\'&overed\'\'racking(%ested',
+    '&$door*"ed\'#rop&)encircled)&rusted\'$poxy\'%tched&%faced\'/ibre-reinforced\'&loored\'$ront&%green(%inder&%happy&#jar',
+    '\'%idded(#ned($quid&$made(#ker&(painting("ne*!l(#ste\'\'etalled\'(olishing)*yalkenoate&(screened\'&hafted)#ped',
+    '\'&kinned\'&tacked)#nds(#ill($rewn(#yle&#tip\')riumphant\'%ubing&\'visored&\'washing($ving\'\'indowed\'&orking%#.in',
+    '&!a&.box//box/glass&*can/bottle&)polyester&#raf\'$esin\'#ock%&blower&$orow%\'ed-over&&s-take(\'wearers\'"/4(!7&!y',
+    '&#uls%+house-grown+$type%/ie-reconstructs\'!r\'"st&"ne\'!g&"te%$like%#man&#ill%$teel&#one%,ware/perfect',
+    '&%orker%)y-looking\'&smooth$\'tenbury%!o&.nbury/somerset,$take%&ullich$+wegian-born&$igan#$tter$!z#$uben\'&buelen$%cagon',
+    '&$dium%%oides&$nite&%phane&$usly%"um$!d%"ia$!t#$vany$$iano%"ca%"nd$#lit$$noye',
+    '##xie$\'o-style%$chem#!z$&ebrook&#ury%\'d-brick\'&cotton\'$eyed*!s\'\'looking&"ly%%guard$\'ing-bar%#oui',
+    '$#yev")c-related$%style$$type#!m##nac#!s"!d#&slvbze"!e#)am-surges%&/glory%*ing-booted$"ns$$sure',
+    '&!s#%bbeek$,ockinational#%choma#*dhill/news$%itsia$#son%$tane$!y#$eman$#per$+s/espionage%#ome#%ghorn#"hn',
+    '&)schattung$!k$$pnir$#ser#!k#"mm$%sford#\'n-arric%$gery%#man$)/prisoner$"ad%$lbyn%%maddy\'"ra',
+    '\'!e%\'rmanton&!n&$riff&$thur$)balleamon%$rien%#uck&#rgh&%terol$%carse&"se%$homa%#ogh&"rp',
+    '&"yn%&regagh$%dairy&#mbo&%rroch%#ell&$nen.&#von%$hill&!u%"on\'#ald&!r%&ronach%"un',
+    '%&gedale%"sk$&fillan%#ord%$rome$\'garnock\'#rys%#elt%%omley&$nnar&#rne&#wan&#yne%#yle$%holme',
+    '%#gan%#sle$(kaveckia$\'leisure%$icht%%ochar&$mond%#uce$#mac\'$hrie&#nor&#rie&#vis%\'ollison&\'rangies',
+    '\'$ison$#nan&\'sheevar%#ick$"oe%#ids%!o%$rchy$&pointe$%ravel%&iddell&!g%$obin&#ssi&*thes-based',
+    '%&uthven%#yck$#sax%\'hellach\'"sk%&taghey$%taise("ie&#nar%%ogher&!n%$rool%#urk%#ype$$uaig',
+    '$(varigill%$eagh%%inean%"on$(ys-style##sga$"ni#$tsch\'*erschlucht##wed""fs""hb"+i&egrave;re#-adin-antibody#)b-tongued',
+    '$%entin$#kum#$ddon$*e-approach&#out%&d.away%"r-\'%borne\'&flying\'&towing(&ugging&"en&"s.$$well#&enecke',
+    '#%goric#&kstein#\'mm\'ring%0ering/shimmering\'!y$#ore%$tsky$#pes%\'sing-it#!n$!g$"ns$!s#*oblastomas$\'cladium',
+    '$%virin#\'ricidia##ss.%#ant%&ements&!z$%tenin)!\')#gly*!s#(tch-free\'%proof$!e$-ter-and-glass(#bug',
+    '(&loving($rock(&silver)"ox\'&/black\'#ers\'%house\'+ing-tongued*"ly*!s$$zers%#ier\'!s%%krieg"!l',
+    '"#n44#"63#"73#"89"$oabl$$min\'$#nec$!r$$t&gt%$ings##bai%(l-system&&/local&$bank&%ement',
+    '\'#zed&(ly-aware)%based)&warmed&#pex&!x\'!c\'!g\'!p$/e&rehy;trotting%*-buttocked&(democrat&%maker&(scroller\'\'panning',
+    '*#ter-!s%#.it%$span%$trot$(icephala,!e%\'gerinid$%ocnik&"op%"sa$&ramine$,ular-cluster)$eyed\'#tor',
+    '\'%n=8.4(!s#+cestershire\'\'reshyre$!k%&enturm%!s$"on##dex#%field#"gg$#wyn#0meruloneophritis)%pathy$!o',
+    '##nek#\'o-oo-my$#gle$(m-pamper&$riff%#ies&$ness%&y-like$&p-fest&%gloop%#ing#!r$!a$$iaaa($aaaa',
+    '\'!x%#ole&*sissimorum&#us.%"um$)y-chasing&%holes&\'seekers*#ing%(.jobless%\'berries)!y%$hole##sha$\'s-cream',
+    '&(finished&\'printed&(throated%$able&%tella%\'ed-over&!r%%oides%#sed%\'y-black\'\'floored\'&haired\'&leaved(%ipped(&ooking',
+    '\'#new\'&roofed\'.surfaced.paper\'$text#)ttal-stop\'\'ization%&ogonic#-ucerstershire&/ster&rehy;shire*(-berkely+(holyhead+$ross+)sharpness*$.she+#the',
+    '*"18,#pts*%ahire*$hire+2sire/herofrodshire*3shire-herefordshire0.worcestershire/*/wiltshire/*photograph/!s((sershire%$ster$"gh$\'nthaune$$ston',
+    '&\'leather\'#imp\'%osers&%maker&&pocket\'%rints&*stretchers&&tanned\'#ype&\'wearing%$less%&prints%\'r-james&*/butterfly&#all',
+    '%&strips$$alla$)globe-lit$,ing-coloured$#orm$$paws$%strip#(xiniodes##yne""ro""sh#!i#!o#"si")t-thermal',
+    '""u-$#301%"74$+plasminogen#"27#"34#"88#!b$$bing$!u#(cagonoma%%nases$*k/sgambati%(el-sarah$&o-lyte',
+    '&0orticoid-induced,(steroids%)heptonate%(neogenic%*saminidase&-e-bicarbonate(+electrolyte(!h(*intolerant\',/electrolyte(&sodium)$ugar\'#and&&idases("es',
+    '#/e&rehy;sniffing$(-factory&#ree%$like\'#nes%%solid&&prayed%"to$$ball$&d-neck&"up$#man$$ware%$orks$%yness',
+    '$$gers%#ing$"ly#$lams#%mmest%!o%(uttering#(pczynski##r-2$)1&ndash;4#%sburn$#kin$#man$%tered#-tamate-evoked',
+    '*(receptor)%/gaba&$ines%$nime%0raldehyde-osmium\'"te%5taldehyde-3-phosphate&&hione-,\'agarose,-s-transferase-(epharose$!e%)n/gliadin%)raldehyde%!s',
+    '$(hathione$%toned\'%izes.#&xstein"(vacosmos"&wyndwr"#y15#"26#!4$!6#%cagon%!n$*eraldehyde&"ia\'+ne-enriched',
+    ')#hcl$$idyl%+ne/arginine&(oeclopin$(obiology%%choic&)onjugates%/protein-binding%*saminidase*\'oglycan1(-binding&!e&%ylase$&uronic$\'yrrhiza',
+    '*#ine#$fada#$kola%!s#"me#&n-owen$\'clydach$%dreth$%hafod%#ill$)n/patient&&thames%#eth%"is$$tawe',
+    '%$ogen$&xylate#&phsate$&ressin%!o$#tic&!s%$odon)"ts&)stoboides&#tek##rms##tex$#ona!"m%',
+    '"\'-hughes#%owned""/c$!2#\'leyland#$opel#!r"%03452#$6135"!1"!2"!3"#701""ac#!p',
+    '"&bh-kft#"tu""c."%elina#!x"!f"!m"!o"%p-140#!."(s/agecat"&t+0100#.v/20/10/93/cde&+7/10/93/cde$(25.10.93',
+    '#!t"!w#!u"#yge!(n&amp;ge$)uml;diges#-omacr;m&emacr",\'r/metallica"!-#!a"(adenfrei&\'kapelle$%igste#"ko#%ngara',
+    '#,rled-looking%\'y-faced#&shings%!y$%sinbe%&singbe#&t-bite%&crazed%#god%%psalm%&ridden%%whisp$\'catcher$\'hobases&+dynamometer',
+    '#$win\'$!n"#ctu"&eissic"!g#!h"#ish#$tteg""mp"$oble#&chetti#!f#+l&eacute;ba#"ma$(e-dotted',
+    '&#hat&)snaffling%$bats%!d%!n$$insh%"sh#$r\'nt#(ssiennes$(ticizing&#koi"*p-weighted#&7.57.8""rh"#udi',
+    '"#yss!"o%".&dstrok;3afoss*%afoss#%mdash#(ntilde;i#+rehy;around(\'between#)ucirc;ter"!\'#!n"#-a-$%broad$:nd-get-another-bit-of-moss%.ywhere-anytime',
+    '$!t#1between&mdash;cf.*$-god$!y#%carts$#ode#"ed$"rs#$fast$(or-broke\'&growth\'"it\'+the-jugular#\'get-\'em$&oretex',
+    '#$head#vinto-groups-discuss-an-important-issue-and-find-a-dramatic-statement-for-us-to-discuss#\'lightly$$ucky#&man-go$#ode%$tion#"od#&please#)sub-light#&to-bed#%video"!.#"iv#"od',
+    '"!/#"no%#.go"&125007"!2"":d"&_along$!s#"on$#ver"(ad-class$!.$!s#$jira#\'l&mdash',
+    '.#ing*(oriented*)searching$$-ace&&rousal&&verage%#den&,ifferentials&&rought%\'getters&#lut&&rabber\'$eedy%&hungry%$kick',
+    '%%laden&$ines%.of-the-century,$year%\'poacher%,satisfaction&#ide&\'napping&,pecification&$tate\'&opping%&tender%$ward$-/organization%$task',
+    '$"by$%conds$"ed%!r$&fields$&getter$&hanger%"er$.keeper-skipper&$peer$&minder$!o$-post-shifting&#wer$)s/assists',
+    '%$tart&%opper$$ward##nna&!s#-scor&aacute;n#(t\'s-milk$!-%(antelope%#boy(!.&\'reeding%$cart&"ow&\'reature',
+    '&#ung%\'fashion&#oot%&headed&&unting%#mad\'"sk&#eat&(olesting%%skins&&uckers&)wallowing%&tracks(#ils$!.',
+    '$!e%&e-herd\'&toting%!r$%herds%$ouse$#ley%#ike&"ng(!s%!y$#man%#eat$)s\'-cheese%#hed',
+    '")b-gimmick$$like$(smacking%&topper+!s#!a$%holic$#ith$!r%#gas#)bit-boxes&!t$\'le-eyed\'-gobble-gobble&\'degook.',
+    '$!o##daw#*edjichvili$&rnador$!y%*/guitarist&&stroud#$fuls#$inda%!s$"on%$soma##les%&t-like\'&shaped',
+    '#\'nascale#"ot#$rana$"ot#$seck$%hites$)mackingly$%ocket#$tron#&urdhun#&y-like""ce$!k#%hfeld$&oogiya',
+    '"\'d&mdash$,rehy;fearing)%given)\'imposed#&\'s-eye&%voice##(s)#(-a-mercy%\'lmighty%\'ncestor&%swers%(wfulness$%based%&lasted%\'otherer',
+    '%%urden$&carver%*hallenging&#ild%(ompelled&&ncepts%&reated$4dammit-i\'m-an-artist%\'esigned%\'ictator%(ominated$$fear%&ocused&\'rgotten$%giant',
+    '%#ead%%ungry\'!t$$idea&"ol%\'n-a-box\'&nature&)toxicated$%knows).-whatever-else$#led&"ss%\'ikeness$)motivated$%names',
+    '$+of-the-gaps$\'parents%>lease-be-kind-and-let-it-be-so%$ower%%rince$+realization%%otted%"un$&seeing\'$king&%rpent%$ized%$peak$$talk%\'empting',
+    '$\'with-us##.is$%jesus$!s#%/hero#":i#!a$"an$%lchan%&mighty$!n$#rds#$bert$$less$#urn',
+    '%!g%#mit&#med&#nit\'!s&!s%(rd/coach((villager\'!s&#ned&!t%$wful&&mighty$!b$!e',
+    '(&figure(%given(%idols)+mpersonator($like(&spirit(+worshipping&!t$#ier#&efroid$!l%$ieve$$tias$$wind$!y',
+    ')"ly$&earers$#ord$#ree&+y/meditator(&thames((villager\'!s#$hede##ier$$nton$!s##lee%!t&!s',
+    '$#ove#$mama%*n/abingdon&%stone$#und\'(dingaham##nat$#ess\'!e%!y#$olla$!n$$unov$#wns%#ski',
+    '#*parenthood##rej$"on%$tten#)s-and-men$%chall$%field$$hall$2on/gloucestershire#!t$$haab#$ward%&tching$)in-austen&%ssons',
+    '"$edel$$huis#!f#&hdeler$$lert$!r#!i#!l$#ets$!z#&neutte#\'ppingen#)r-between$"an$"es',
+    '#+s&mdash;but$"_a#&thalls$#ing$#tel$#zee#(vrnement"$ffer&#ing)%-iron$(man-like$%shock##ors##tar"*garth-like',
+    '$$tter##gin&!s$*le-glasses\'%visor&"s.#"h\'$\'-bonger$#ian%"sh##ner#"oi#%uadze$!e%!l',
+    '#(ynfeirdd"#hin##ner"+i&acirc;nia#"as#&cochea%%echea#%delic#!l#"ne%!s$\'g&ndash%\'-beyond&*on-holiday&&steady',
+    '\'%o-bed)&dublin\'$rain%#.it%#/to%#_as&#out%%s-on\'$!s$!t%"uh#%poria#$tres##ung#"ya',
+    '#&kovics#%obori"%kchai#$hale%!n#"ul"*l&aacute;n#$afre$!s$!t$!u$!y#$berg$&y/open#-d&rehy;leafed',
+    '*\'painted*&rimmed*&tapped$*-and-amber)$blue)%green)&silver%&backed&,lack-striped(#ded\'"ue&$ound&$rick(#ght\'-ocade-covered',
+    '&\'uttered)$oned%&capped&&entred&$hain&&rested\'%usted&(urtained%$dark&$omed\'$tted&)ust-sweet%)enamelled\'\'graving%%faced',
+    '\'$shed&$rame\'"ee\'%ogged&(urnished\'%tures%$glow%\'handled&%ilted%)inclusion%\'knobbed%%laced\'#den&)eaf-edged\'&ttered',
+    '&$oans&$urex%*medallists&&ounted%&nugget%*orientated%\'panning&\'illared\'#ped&&lated\'&$rice($nted\')ospecting%&relief%\'selling',
+    '($fted\'&eathed&%ilver&&kinned&\'peckled\'(lintered&\'tandard(!r\'#one\'%riped%&tipped&%ooled($thed\'"ps&$wist',
+    '&$hite&$ired%&yellow$#.47$&/brown%"or%%steel%%white$.:silver:copper$$acre%%nskii$1bach&ndash;rehage%&eating%&lender&(um/rowan',
+    '%!y$&castle$&digger$%ecker%#leh%%mburg%(n-banded(%eaked($lack)#ond,!e(#uff\'$clad($ream)%usted',
+    '(&ressed\'*egg-laying\'$grey\'\'hearted\'$mean\'&oldies\'%robed)!d)$ofed\',shoe-stepped(%toned)&reaked\'&tailed(%ipped(&ongued',
+    '&%/grey\'&orange&$burg&"ed\'!h&&weiser%"rn&!t%#son$$fine\'"ks%$lake\'"me%#oot$#gar',
+    '\'#mer&"nd%#ead%#ill$\'ie-scot&!.&%lands%(n-meadow&%g/the%*wilstrasse$&kowski$$lees$#mam&.n-hodgkin-katz&"rk',
+    '$"or$#pan\'#ner$$rein%#ick$"s.%#ack%$boro)$ughs%#eal%&mith\'s),-cum-writing))/engraver*(highways)#ery',
+    '%#oll&!n%#pur%$trom%$wain$&thread&$wait$#ust$$varb$\'working\'"th%)yn-united\'$isms#!e$"by',
+    '$$chha$"ma#"f\'$&-balls\'#sed%(clubbing&$razy\'\'icketer%\'driving%)equipment%%house%%links%$only%\'playing%\'writers',
+    '%&fixing$\'aholics$%balls$$club$!e$%hotel$,ing-designed(&themed$#net$$wise%$orks##gan$)i-stained$!o#&iadkin',
+    '$$gher$#kov$(n/harris$#pur$#sts$%tsyns#"ke#$land%#sch$&iwoggy$$ogly%"ps$"ut$(ywobbler#\'ogiques',
+    '$$shes$#wan#&pejera#&shmann##tho$"ix$.z-kinsk&yacute%"er##uan$$bkov#"va#!z$"en%"rn""m2',
+    '%!d##bar$+os&uuml;ren&#ren$&rowicz#!e$$l\'sk$(nkudasai$"ra%#sal&#how$-z-pe&ntilde;a#"ia$1na-pampaliforeign##ley',
+    '$&ecourt#,orro/mexican$!v#"pa%!s$$ertz$+hiocephalus%)ocerippus&&theres#\'ringers#%shall#%ulski""n\'#(-doh-lar#!a',
+    '-!s$$ives$"ve##bee#$calo$\'harenko$!z#!d$\'&oacute$"er$(ola-like&#in\'%#mar#&e-away%#out',
+    '$$_out(#_of%&so_far$$levu$$ness$"rs$#sse#)g-strokes%#yuh$(/chinese%&island$#ing$*s-and-pips$%uzmos##ial',
+    '$!g$!m$!o%&metric#"ja#"ky#!n$$a-be%!e$\'e-yeats%!s%!t$"os#$ophs%#lac',
+    '$%rrhea$#vii#&salves#*taut-biron$#ier#\'ystylus#5z&aacute;lez-palacios/\'defence$#ala\'!z&(es-falla\'&z-haba)&torres"$o-go$!l',
+    '#.ch&ndash;micky%(-stewart%!.%#ies#/d&rehy;contrast*(humoured*)womanhood$)\'n\'proper$$-and()-bad-debt&!t%#boy&!y%\'calibre\'#use',
+    '&(ondition\'!p%$digs%#egg%\'fitting&#orm%$girl&$lass&%round&"uy%,housekeeping&+umouredness%+intentioned%&living&&ookers',
+    '%&mother%%natur*&edness&(eighbour%#old\'%e-boy%2riddance-to-quebec%%sense&%ister\'"ze&"on\'&unding&\'tanding%$talk&)emperedly',
+    '\'&inking&%imers&-o-exceptional\'$rque%#uns%\'vs-evil$$.and%*cricketers$"/a&&verage%1bad/funny/serious&"ig%*convenient%&father%"it',
+    '%(resident%*transplant$#_at$#air%+ll/designer%"mn$!b%"an%&rother$#day$$earl%&bodies%!e%"id%"ly',
+    '+&victim%$rson%"st%"ve%\'xposure$%fella(#ows%#ood$%guise$$hall&*nd/british&*rt/liberal&$vens%*eartedness%#ill',
+    '\'&goodie&"r.%)ng-sanken\'%s/raf%#rly%!s$#kin$$land%#uck$+man/goodman/!s\'$dsen$$name&%tured%.eighbourliness',
+    '&!r&!s\',s-knows-what(!.%!i%"ow$/rich/gloucester3%shire%"um$\'s&mdash+$;and,#the,#was%+--whichever&%based',
+    '&&inward&)producing&\'related&%train&$yard%).sections%*/ownership&.sub-assemblies%+ell/patient%#haw%$peed$$time$"um$%will.&"n\'',
+    '($bath)&irdlip)&ristol*8ockworth/gloucestershire((chairman+%rlton)(ondicote(&durley((elmstone(&forest(/gloucestershire)&uiting()highgrove((kemerton)(ingswood',
+    ')%ydney($m-50)%ilton)\'onmouth(&newent+$nham/*-on-severn+$port(%prior()rendcombe))obinswood*)ss-on-wye(%south)\'taunton*#oke',
+    '()transport(*washbourne)*hitminster)(orcester&#ves%$oods$&y-good*#ies&(twoshoes%)/villager#*ey-centred##fer%!y$%iness%$shly',
+    '$\'y-faced%!s#$gies$#lie$"oo#!i$+est-looking$"ng#*k-speaking$"in$!s#!l$"ab%$gong$+e/doncaster',
+    '#!m#"na%&sekera%!y$"ed%&tileke%!y$#ish#\'ooaaaaa#!p#"re$\'ookelle#&sberry$\'e&mdash&,rehy;pimples',
+    '\'%umped&$down\'(roppings&"oh&#pie&%quill+"ed&$skin\'#tep*#ped%,berry-bushes+$like%\'fleshed&#oot%$girl',
+    '&$rass%$hill%#let%*neck-sunil%$tree$!t%#eli&%pping%"li&!y%#rey")pher-wood&"ed#!i$!k',
+    '##nik#&pingen#$sill\')/national"!q"%r\'all$"it#$-don$#may$#ray#$adze$"in$"ne&(-zaghawa%!i',
+    '#)bacharmed\'\'ev-kohl*\'maxwell+)itterrand*&reagan*%style)#.he)\'/reagan\'\'ov/bush%!l&#ite)!s%%nifar%$toff$-limey-by-nite',
+    '%%rdhun##des$%ienko%"ni\'!s$\'on-duff\'&morgan\'&walker&\'/dealer\')solicitor&!g&"ia("ns&%price&$vale',
+    '#"e-%&browne%(drenched%$lust%*splattered&&tarved%#xcr$"au$#cki$!e$$fest$#ham%%ounds$!l%(l-barnes',
+    '%$ykin$)n-gothelf$$side$%t-tex#%field#!g$"an$&e-like&#ous%%ouses(+ly-coloured++illustrated($ness%"ts$(ie/dalry',
+    '$-on-akroterion\'$face\'$like\'$mask+!s&!a&+ocephalidae&%zolas%!s$!u##ich$\'e/forum$2g&amacr;u&nacute;4$)lla-house$%nchem',
+    '&%/mill&!s%!i$"ot$&tskaia#!j$!a#"ka$!e$"ha&!m$"on%"va#!l$"ay',
+    '%+ston-on-sea$#ich$%lewin$$ovka#-man/assistant\'%coach$#ely$#ier$&lessby("ly&\'y/oxfam$#sen##ner$!i%!k',
+    '$!o%+-badakhshan#%obets$!d%&ishchi%#kin$$hova$\'khovaya$!n$&stiaga#!p$#in\'&!g##ran$#ell',
+    '%!r$%illas%*nge/wiggly%!s%#tia$!o%!d#)se-bushes&\'covered&&dotted&(prickled%"dd%!s$$hkov$"ki',
+    '$"se$$tart$$ucli#&tacare%&keegan$)ex-coated$)indarragh$(nagallon\'$lush$&ontoid$#ree$"ys$!z%%acoff#"up',
+    '##vie#\'yacheva$\'szewski#%zanis$!e%&-trier"+satomnadzor$!u#$beck%(e/cousin#/chen/employment$$ombe%"te#%ditch##ein',
+    '%#key$!a%!l$$darn$"en$!o$!t#"io$+p-compliant#\'komstat#$lett$+ing-whaddon\'(s/artist$"yn##man',
+    '$#ell#"pa%%trick$(el-based(#ook+!s\'%chant\'(hardened*$mony\')marriages($usic\'\'trained)#uth\'#way&!.',
+    '&$lers\'!y$)lan-types\'#ner$"od&\'arczych#+s/performer%%roger$$aert%(mer-fine)$like)%robed)$thin%#rds$"el',
+    '&+-columnists\'%point&%/info&"ee&$ping$"om%!p$$troy$&yplure&"ol#"ta$!e%&lradio&!y%%rmers',
+    '%#lna$(ling/dep))gallagher$%wicke##ubs$+darstvennoe$"te"#t-a$+there-first##_as$$ever$(together$"up##ama$"ri',
+    '#$chas%"er#!e$%borgs$!n$!r$#yen#\'h-laced&%oving%%style$$ards%!s$(erington%#tte$\'ic-arch',
+    '\'\'looking\'\'revival(%ococo\'&shaped(\'ounding\')victorian\'&whimsy&#ise)!d(!m\'"ze(#ing&#k-y\'!s&"ly',
+    '%#que$%orima$$punk$!y#"ic%"os##ley$#ieb#\'o/gosub$&h-like&$type$!s$"wn##sch&#alk',
+    '%!v$&iridze%!s#*ta-see-her$*edammerung%!m%%nborg$+hardstrasse%+elf-village$#leb&"ib%%ieben&\'f-stube$%sched(!e',
+    '"5uache-pastel-charcoal$"ra##dar$#eau%$bour%!n$"ys#\'ernment#+g&eacute;re$+e&rehy;like$\'h-yates%(/amateur$#ons%$usse#0lash/bourguignon',
+    '$\'d-davis%$/art%$isms%\'sbrough$"et$%imine$"my$$omet%%ngana$"ue#%marri$$iers#&ndrill&!y%!s',
+    '#!p#+raud-shared$)d-breasts&$like%"ie%"on$&gazaud%&onnier$\'mandise(!s%+et&mdash;as\'"s.$"na&!y%"es',
+    '$%teney##ted$,hi&egrave;re$$rage$#tes#$veia%%rment&\'nements(#urs#&zoules"%v\'ner#&anhill#!e$&nrment$)r/welfare',
+    '%%mment%+n&rehy;ance&%-ment&%ance\'*!s\'&torato*!e&!e\'$ment\'"rs\',ss-companion)#ing\'!y&(ing-body&$men\'',
+    '+-rehy;assisted0-to-government*"\'s*#(s)*!**--administered,$ided,)nd-church,!s,)uthorized+#big,\'usiness,3y-cabinet-committee.$fear.$veto',
+    ',(ollected-\'nnected+0depoliticisation-(signated,\'irected,&onated,%riven+)employers4&-trade,*stablished+$free-&iendly,&unding+)generated,*rant-aided',
+    '+&hacked+&issued+%level+*management,\'ilitary+*negotiated+*opposition,&rdered+#pac-\'trolled,(erceived+&reared-)commended-&leased,%igged',
+    '-%tting,(hrinking,&tamped,)upervised.%plied/&orting+#the,"nc,\'raining,"uc+%union*!.*!/+!2+#bsa',
+    '+%local+(movement+*opposition,(rganised+.union/employer*+al-cultural*%owned*)regulated*,s\'commitment+!-,4conservative/liberal,(in-exile*%wants\'$ment\'#net',
+    '&#or\'(*-designate)(generals1$hips)(in-chief(*/governess)(horfield)&oxford(;s&bull;shoreline&bull;storm\'"ur#$idge$\'er/alan\'&former\'\'maxwell\'\'retired',
+    '##ts."%w-mac#&anloch%$side$"rd&#han#"by#"da$"en$"ie#!e$"ns$\'r-style%%/gary&(national',
+    '%$lond%#sor%#ton#"in#&karran#$ling##man#&n-shop$)/bathrobe$$sman#$ries$!y#!t#!y"\'ya-like',
+    '##der#%emide##mer#%ogana$"ur#!s#&tisolo"$z-ok#!a#$ling#*zard/class!)p+envam12"#-16#!4#!8',
+    '#\'induced#\'patient")/grievous""12$*0-antibody"!7"#als#"ss"*c-decoding$*parliament%,ronunciation#!s"#fhs""ib$#/ix',
+    '"!n""rf"\'s&mdash#&-black$$were#0/pes&mdash;green"2t&gt;gpa&gt&gt;gpg"%u+atp"!v#/&mdash;reformed"!w"$z6oo#$900r!%q3500"!h',
+    ')%;fico*"we$\'circ;ce)!f$\'tilde;o$&uml;fe(%slund("tz#&eacute)$;ber*"cy*)goire-how*"il*%visse$\'grave;s',
+    '*&shnakh#/lsqb;ace\'s&rsqb#/oslash;nfjorden*"vu$)uml;nfors)$roos("ss*!e#3uuml;ndgens/karajan)&enthal*!r*!s)$feld("ss"$-100',
+    '#\'50/gk-2%!5#)700/g-707#\'induced"#.3s##eat"#100"!3"!5#!0#)5-00xla65"!7"(aafschap$!n$%skamp',
+    '$)-a-grammy%(it-quick$"au$"be%#in\'$!e%!d%&n-like%!r$%rails$#ski$#urn##cac%$nica%!s',
+    '$$chus$"e-&*and-favour&0elder/journalist&&filled\'#ull&%given%\'/wretch%.fully-designed%$hill%$well$\'hanitsa&!v%#eva%!t',
+    '&$rena%#eux%%llima%#osa\'!o(!s&\'us-lady(&speech$!o#%dated&%ional$$bach$#dol%!y$3e&rehy;distribution',
+    '&!4&!5&!b&(i-listed\'!v&%level&\'related%\'/spinal%(0-taking%!1&\'-unable%%2-can%%3-can%(4-unable%"ly',
+    '$&father$!h$$ians\'"ts%#dge%0ent/channel/rack(!e&%rwerk%$gnan%,ng/gradation%\'ometers)"ry&!r%$tude%"us',
+    '$+u&rehy;ally%.ally-operating)!.&)te/alumni)$post(#s.4\'"in(#on.*"s.$"ys#!e$$bner$#cae&#rum%!e',
+    '&"ae%+o-gandharan\'(illyrian\'&judaic\'%latin\'(scottish)&ythian\'\'turkish$!f%!f$#gos$%llsii$&me-rab$$sser$!t',
+    '##fen%#tti$&ficane&)ti-daubed)"ed)(inspired)%proof)(splashed+%rayed(#ing(!s)!t*!s%!t$"ia',
+    '$%onola$+t-rejection&&versus%%ed-on#&gonsly#!h$#am-\'%based\'%jones\'$moon\'1scott/northampton\'&watson\'%yooll&(/farrans(#ire',
+    '\'*meningitis\'&victim&\'e-smith&"ly&\'sbridge%!n$"nd##iae$(l-legend%&/grail%!y$)n-bearing("lt&(carrying\'&lipper',
+    '(%ficit\'$rier&(features\'#ree&&golden\'&rowers&\'harvest&)importing&\'milling&(oriented&\'storage\'(upported%\'/cement%#445%#fax',
+    '+!s%$geau\',r.attendance(!e%#ier&"ly%$less%1stones/packstones("re$"te#$khov$"le##lko$!l%#och',
+    '#*m-molecule$$acho%$phon)!e*!s%\'tically$"bo%!y$!i%%cidin%#gni%#nae&&earium)"um\'"us',
+    '\'&vorous$(malogues&#nan&"r\'\'&-based)#ook(+school.type)(ensitive(#the\'&/kevin(+linguistics()technical)*ranslation&"ta\',icalizations',
+    '(&zation\'\'ologist%$ercy%.ophon-polygram%)y-grabber\'&winner+#ing$!o%&philes\'"on)"ic%!s$"pa%$ound%#ton',
+    '$"s.%$/day&%litre%%cians%&hammer$)ulomatous#&n-gran%\'pickney%&tastic$.ada/visionhire%&getown%!l%$tina$#cey%\'hildren',
+    '+#son,$tand%,\'m&egrave;re%*-a-nighter&(costumed&$jury&$kids&#mal\'%other&&nephew&#old\'$pera&4parent/grandchildren,$hood\'$lace',
+    '%*ad-bashing\'$dies\'%ology&!l&$ther%#dam\'-ughter-in-law%(e-comore%!f&0ather&mdash;made+,/grandmother+)s/mothers&%ilial&#ord%$iere',
+    '*"um&$llon&!o%)ma-noreen\'\'/father\'(isonites\'!n\'$rina\'&ternal&)et/watney&!o\'"th),er&mdash;but+--footstepping,&in-law',
+    ',+who-was-not+,/grandfather+&liness&"um(!s%%niece%!o&!s%+p&egrave;re&&arent\'+)-friendly\'!s\'+terfamilias%%ridge%%selve',
+    '%/tully/strathtay%#ula(!r&"re%$wean)!s$#eus$%field$(ge-over-&-mouth-falkirk&(r-taylor\'*/wiltshire\'$ised(#zed&,town-lazenby',
+    '&$well\'#ood$#ick&"us%$fera%#lla\'!o%#te\'\'+-associated(&capped)\'oloured(%edged(,granodiorite(%harsh()ophiolite',
+    '(%still\'&/glass(&killas&!z%%vores(#ous%"zo$$noch%$usch%$y\'s.&%-flat\')murderers$%oogst%%phyre%&vskovo',
+    '$#sch&#ole%#ton$"t\'%!-&\'adamson\'*llocations&%based&\'funding&&givers&\'holders&+livingstone&(sterling\'(upported&#you',
+    '&)historian&&victim%&bridge%#cha%(ed/cross%+ham/gamston(#ite&%older%"ie&*ng/denying%0on&ndash;cramond\'(-on-spey%"s.&#/to$-ular-textured',
+    '($ions&"e.\'#/ml(*tablespoon\'!d\'!y&%iform\'#tic&&ocytic*$osis\'%matis($eter$.ville-grossman)!s#!p',
+    '&%green&$nuts&\'pickers\'%urple&%sized&(treading%&fruity%%juice%$nuts%(y-fruity$)h-plotter%".1&\'plotter%&/table&!x',
+    '%#eal&$tics%"ia&\'c-based\'-/photographic\'#aly\'"on\')s-capable))intensive((/drawing)%motif(%power\'!y&!o\'#nes',
+    ')!s&$soft&*te-bearing)$like))moderated)*reinforced(!.($/50%)#70%)*fibreglass(!s%&oderis&%logie*"st)+y/phonology',
+    '\'#per%"s.%$tech%!y$$ical%#nel\'"ss$$nels$+o&mdash;see$(pa-laced%(le-crazy(&hooked\'!r&(ing-iron.!s',
+    '\'#oid*"ea#,r-min-ay-oos($i-ya$"nd##sar$$brun$%croft$*eby-specac%!r$(hchenkov$$iers$$moor$"on$"p\'',
+    '\'#-at%*ing/raking$)s&rehy;or+#the%!-&(brushing\'&urning&\'cutters&&eaters&#fed&+germination\'*rain-grass&%heads\'&oppers&$kept',
+    '(!y\'$ight&$mesh&&packed\'%ollen&\'rooters(%sette&$seed*"ed\'&kirted\'&moking\'$nake\'&tudded&&topped\'$rack',
+    '&&verged&\'widowed,"rs\'#ren%&.roots%-/cross-leaved&$deer%%boxes&#run)!n&!y%%cocke%$elli&!r&"s.',
+    '%$hoff\'#lme\'&ppered%#ick&(e/mother\'!r\'"st&"ly%%land/*(moorland&!e&"ot%$mann&#ere%&rooted',
+    '*,/traditional%!s&%roots%(trackers%$wort%(y-staged$#tle#!t$%chova$*e-cleaning%$fied%$glow%*r/bicester\'&peeler$!i',
+    '%%cules%"en%*n&eacute;e.!s&#ate%\'oloides&!n&"sa%%toode&$ude.$!s$"te&!t%#ons$.u&rehy;itously',
+    '\'!s\'&uously%&titous$#zel&!r#(u-du-roi$$denz$!e$#man$!n%$ched\'#ing%"de$$pius%#ner',
+    '$\'samkeit#(v&eacute$#ado%#tom$.e&rehy;digging+\'statues%!-&(diggers.&$good&&marker,!s&&robber&%sites\'%tatue(#one',
+    '%&/acute%1l-bottom-dwelling\'(dredging\'%faced(&loored\'\'pattern("it*!s\'$rash\'(timbered+#red\'+under-waves&!d&"ey&%ights',
+    '\'(e/centre\'*y-textured)&voiced%$ment%#ner\'"ss&0horst-mittelland&%steen)"in%\'robbing\'"ot%\'s-goods&#ite%%tithe$$idas',
+    '%"na&"er%&portal%$scae%\'tatione+!s&$onos&"y-((operated*&posing(*percussion(%shift\'"=1\'$less$\'y-brown',
+    '&\'greased&&sodden%":i#+y-and-white%%black%\'flannel%$like%%white$)/magdalen$$burn(\'/farmer$#ful$!g$&hounds$"ly',
+    '$"on$&shotts%%tanes&#one$%thorp#&zalema$&ebrook$*ing-fields($land\'!."+b2-mediated%#sh3#%avica#$ovic#!s',
+    '#!s""dt"\'e-no-li#\'a-based$$ding$#lly$$msee$#ney$,se-absorbing\'$ball((lackened\'&coated\')encrusted\'(fingered\'\'infused',
+    '\'(painting,!s\'(removing\'\'shining(#pot(%tains)&reaked(&wabber\'%wagon&$band&$d-up&+proof-lined,%paper%#ier&!n',
+    '%&y-wool$+t&rehy;aunt+-granddaughter%#\'un%\'-beamed\'\'reasted&\'crested&%grand+)-daughter4!s,&father,#son+%child+%daddy-\'ughters',
+    '+"ma-!s+"pa-"pa-!s+$sons((eat-aunt0"ie,5etcetera-grandmothers,$gran0#dad1(daughter1\'parents.1eat-grandfather\'s7&mother',
+    '4#eat7,-grandfatherC"\'s2%niece2%uncle,%uncle+$gran/)ddaughter&(handling\'&earted&\'muscled&$name\'&ephews&(powerdom&%rakes',
+    '&\'serbian\'#ize\'4omething-grandfather&&tailed%&.track%\'britain%&coated%!e&(r-making(4than-market-clearing\'(.whether\'(efficacy\'!s&,st&rehy;ever(!.',
+    '&#tud%#ful%,grandmothers%%heart%+ly-improved()respected%\'nephews\'#ss.&$iece%!r&"ex&#igg\'!x%!t$)vesdeputy',
+    '\'\'housing%$sies$"zy##bby$&e-like#*co-iranian&&karian&*macedonian&\'turkish$$ques$!y#$dley##eat$2ce&mdash;something&!\'',
+    '&(-drachma\'+rome-judaea&#.if&&/crete\'%italy&#but&!s$(d-crazed%!.%%/envy%(iguzzler$%enest$"ff$#ham$*k-albanian',
+    '&)classical&\'derived&(inspired&#led\'&ooking&*macedonian&$nato&%owned&,philosophers&(sounding\'\'peakers&\'tragedy\'0urkish-bulgarian%$born%!e',
+    '$%ments$%n&amp&.rehy;and-white+$belt+&grocer+&topped+)uniformed%#\'un(!s%)-and-gold.(-painted*(magnolia*#red&&banked\'&ellied',
+    '\'%odied($oted\'%ronze&%check\'#lad(#ean&#eye&$felt\'&lagged(&owered\'&ringed&&glazed($oved\'%owned\'&rocers',
+    '\'#ued&1is-moreprofitable&\'keeping&)lacquered($wned\'%etter\'\'ichened(#ned(+zard-lidded\'$obed(#den&"of\'(il-based\'%range,&-white',
+    '(\'tterned\'%epper\'(igmented("nk\'$rice&*revolution\'$obed($ofed&\'scummed\'%hoots\'$lade(%eeves($imed\'&peared\'&temmed',
+    '(&reaked(#uff\'%uited\'&warded(&eepers&%tiled\'(rellised\'(urbanned\'$yped&&veined&&walled(%tered\'%ellie,!d*!y',
+    '\'$oods&\'yellows%*/amber/red&%black("ue\'&oatman&%darts&/gloucestershire&(landlord\'%ondon&*na&iuml;ve("vy\'#ear&+oxfordshire&)president',
+    '&*shropshire\'&ilvery&\'wantage\'(iltshire(%nning\'$omen%!a&%combe&$myer&%nmore&,way/employee%+belt-eaters)!.)"s.\'%rgian',
+    '&"ul(!s\'"rg)!h%$card&#oat%%dykes%%e-ish\'$land&%/bddp(%order\'\'museums&!n&(r-minded(*than-green',
+    '\'&/daily\'#eee&!s%$file\'(nch-like(#ger&)ly-eating&,ord-chiswick%$gold&$rass\',ocer/manager+#ies%$half\'$mism\'#ven',
+    '&#eys&)illstairs\'#the&$llls&"oe\'#lme\'"us)/e-forcing-alone+%grown+%humid+\'related*!.+&effect*%/cold*"es',
+    '&#urn\'!t%+idge-haynes&#ngs&\'sh-gold*$reen)$pink*%urple)#tan%#kat&$nowe%3land-iceland-united)"ic\'!w&"ee',
+    '&$ight\'"ne&"ys%#man%!o&"ch\'$kite&"re&,ugh/producer%\'painted\'!r&+eace-brazil+&funded+%style*!/',
+    '&$rint%"s*&(756.45.9&$cape\'$hist&%hirts&#itt&&lade\'s\'"ee&*man/caddie&$omes&$pace&&tained\'"ed)\'/author',
+    '%"up%#voe%$wash\'+y/warehouse&#old\'*od/swindon%-y-grey-leaved\'&orange$)r/phoades%!s$"sy$$ters%#in\'\'(gs-cards$"vy',
+    '##ffe%#ier%!s#$g-he$$anus%&rious.$%esche$&g/flat%!i&"sm$&oriana)!s\'"ev\'"us&&y-hood',
+    '((resident(&social\'!s$+son/british\'!s$$ucci##han#)ig-duncan%!y$!l$#ndl%#ton$"sa%&enised%%inger',
+    '%#est$$ving%#ous#%lette$%hadas$"ot#%micha%!o$+lin-plagued$"mo#-nade-launcher(&shaped(\'tossing%#ppe%"te',
+    '$&ehurst%$lefe%$rsen$)fell-like$$hill$$nock$!o%&bloise%$side$#son$/ville&ndash;fox$,zg&auml;nger#"po#!r#\'sham/cs',
+    '$%onnay$$shop%#ier&%ngham&!s%"ly%"us%+y-en-france$%wolde$!y#$then$!l$$schy%"ky$!t',
+    '#%ussen$,tzner-robins$\'ze-like#(v&eacute$$ilia%%ously%#sse$"os%"us#%w_out$!e%\'lthorpe%!r#!x#,y&rehy;black',
+    ')$gold)-white-striped&$shed%$back)"ed&%londe(%tched&%rowns%&cowled&&rusted%&dashed&(ecorated&"un%*flannelled&#orm',
+    '%&greens%"ie&(mporting%%lloyd&&ustred%&marble&)indedness((iskirted%&necked%(peppered&#ink&%urple+!s%&rimmed&%oofed',
+    '%$sand&%ilver&#uit%\'templed&$iled\'$nted&$oned\'$pped%)whiskered&%igged\'$nged$-/ash-laminate%+black/green\'(ue/brown&$rown',
+    '%%lilac%&thames$"be&"ck%$rook$%cloak$#ers%"st%!y$&friary$&haired%)ound-like*%style$"ie%+sh-coloured',
+    '($pink)%urple(&silver$%lands%$evel%#orn$%power$#s**%%cales%%hirts%$kull%$otne%$tock%%uited$\'transom',
+    '&#lls%$oode"&ffiths"+i&ntilde;an##ams$$nail#$bbon$&eauval$"in$&oyedov$#sby#+ce/customer$#ing$\'ultural#"d-',
+    '%)generated%\'locking%$plan%)reference.)-positive\'%moval%$size&%ystem+!s$$ding%#led&#ing$!e$#ful$#ing',
+    '%#ine(!s%$ocks$$mark$$plan$&s-type##ebe&)nschmaltz$%drich$*f-maddened&(obsessed&$work%).stricken%"en%$less',
+    '$#ger$!m$%rsons$!s%$baum&)eckerzell%%inger%!t$$uous%!x$!v%-ance-handling*/violence-remedy)-/disciplinary)"s.',
+    '&&s-cook%\'ousness##fel$$fens%!i&"er&&n-head\'//editor/malvern((planning&!s&(th-ee-ee(*s/designer+%river*&labour+*easeholder',
+    '*#nhs*&orient*)pensioner+%otato*%sales+\'quadron*#the%!o&)n-mounted(\'powered$$iths$#ter#!g$)gs/doctor\'(managing',
+    '$"io$#non%!y$&or\'yev&$escu\'#vna&"ii\'"os\'!s&#yan$!s#*inderjahre#%kelis#%lapad$(l&eacute',
+    '&#bar&#pan%!.%*/microwave%&apolis%#ers&!t%%mobil$"se#,m&rehy;faced$%-eyed%(featured%&lipped%#set%\'toothed',
+    '%#wah$&.there$$ace.%#ldo%"ni%"ux$$bles%#oid$)e-covered&$grey&\'sprayed\'\'treaked%!k%#ley%#sby',
+    '%%thorp&#ime$%faced$%grill$+ly-familiar$#mia&"sh%#ond$"od%$ldby$"pe&#rel$!s%(by-based(%louth',
+    '%%ditch&"on&#yke%#ell&$tter%%hader%#ley%&thorpe$"us$$wich$&y-arse#)n-cracked$"by$$ches%#ing',
+    '%$able&"ge%#cob%"ea&$land%&houses%)ing-mills)%stone)&wheels(!s%#lay&&ewoods&#ing%"on$%evsky',
+    '%\'o-hater&&landia$#ham$#ing$"jo$"ky$$nell&!r%#in\'\'#gly(!s$%spoon$!t%"er$#yer',
+    '#%p-end%-it-and-rip-it$"en%!y$)ings-like$$ness$%ping.$"s/%$holm#\'qualand&!s#(sanowsky$!e%%igena%$ldes',
+    '%(ogularis%$rson%#tte$&hankov%%inish%#kin$#iau$\'lewings$"on$&thorpe%$wood$$wald%%linia%#old#(t&eacute',
+    '%\'flecked%\'scoured&\'peckled$$ella$!o%!k$+stone-style)"rs$#ter%$iest$!z#"ve%%ously#\'zabella$+zle-bearded',
+    '\'!s&#ier("st"!k"(lisefski#!q"#mmm".o&oslash;nland$)rehy;cery$%szlig)&;stadt#$-act#%/mgsa#"am$*n-inducing',
+    '%%ingly$%thill%!y#$bags%"rt$%belar%%lebum$"er$%stein#!c$\'er-tory&*/newsagent&%y-bar(0cum-delicatessen$#han',
+    '$"yn##das$"in$!o#"el$\'nendijk&!r%#hof%#ing$!s$$tjes#%frame#)gan-esque$#gan$"na',
+    '\'!s$!s$&wynion#$hnde#+in-hauberks&%level&(poundin\'&\'vaulted&)wrenching%"al%"by#%kware##lle$$nick#&mmeted',
+    '%"en$!e%!s$#gar$+ingen/eelde)!s(!r%#voe$"ky$$land$$nies$$skin$$wall#!o$.m-cum-coachman',
+    '%*/wiltshire%/bridge/windmill%"es%$ings%\'sbridge$%scors$"te&%claes%\'fontein$&vature%(e-locked\'$only&)farm/yard&$less\'#ine',
+    '&!y\'#ard%#ies&$ness%)y-looking##pat$+e&rehy;suit%\'ability%"rs$%ingly$#pel%!i&!s#\'s-point$%beaks',
+    '$"ed%%illes$&graine$%holtz$%ovsky$(s-of-tax%\'bergers%"el&"ri&&testes\'!o\'"ti(\'o-pugna%$heim&(irnsalto',
+    '()polluting%$mith&+unsterplatz%$ular$!u$$veld&#ner\'#ors$"zy#%t-pop$!a$\'endorst&$huis%(squeness%$wohl',
+    '$#ing$"on%&phorst%$skew%$wski$!s$&taglie%"en\'$lava%!i%(o-garden&*/nymphaeum#!u$$cho-\'!s',
+    '$"ds$&illard\'\'ez-vous%!n$-nd&mdash;that\'-rehy;fielding&#(s)&&-angle($pple\'\'bearing($orne)#und(&reaker\'$care((ollected',
+    '+&rolled\'%doves(\'wellers\'\'feeders+#ing(%iring(&licker($rame\'%glass\'5hugging/semi-trailing\'$less(#ift)#nes(%ooped)$sing',
+    '($otif)$ving\'(oriented\'%plans+$ting\'\'related\'%seeds(%hared)$eets(#ite(#now($taff*%nding*$tion\'\'testing',
+    '*"me(\'o-flour(\'raining*\'velling\'\'walking)\'ndering)(tertable($ound&$.the&!/\'&oxford\'%rapid&&baited("se*!d',
+    '&!e\'%aters\'!r&%finch("sh&(handling&$lift&%plans&%roots&%s--it($that\'#.of(#the\'$cape($hool',
+    '\'%traps)#oke&$ward("sh(-ter-pollution\'&orkers*!s(#und$$p&gt&$lsqb&-rehy;building+\'captain+*orientated%!-&"19',
+    '&(activity\')s-context)*instrument&!b\'%uying\'%y-ear)&visual&+centredness\')omparison+%tible&(dwelling&)formation\'-ranche-manche&\'housing&(identity',
+    '\'!t&(jeopardy&\'leaders)%rning(!d\'#ife(\'stening\'(oyalties&(meetings\')indedness&$of-3)%seven\')ptimality\')rientated\'$wned',
+    '\')elievable&,selectionist\'\'tandard((ructured/!s&&takers\'\'eaching\'"he)&oretic&$wise\'&orkers\'&riting%&.being&+individuals%!/',
+    '&&centre&.franche-manche&&grande(#oup&#how&*individual&-lexicographer&\'members&8playgroup/nursery/school&$rest&&sector,\'/person,\'_rather\'%ocial\'$tand',
+    '&$unit%#age%!b%&ements&!s%$ing.&&shness\'!m%$lets%!o%1s&mdash;including-"on-#the&\'--exert\'\'firstly',
+    '(%tress&#_on&"of%$text%\'uscular*"es%&worker$)se-filled&&beater,!s&$moor&"rs%*svenegiger$(t-filled$"ws',
+    '$\'e-based&&palmer&*stephenson%*/guitarist%$land&#ing&#ler%)r/bentley&#ies%*s/families($lood\'&trader\'(villager&#nor#&w-bags',
+    '$#box$#den$!e$!h$*ing-points(%rules(&season((together\'*/producing\'"ly$\'l-snort%$edge%$iest&$ngly(!s',
+    '$$n-in&$over&/up&mdash;though($ness%!e$$pots$"s.$*th\'/\'share&)-arrested\'%based(\'oosting(-y-acquisition\'\'control.$ling\'*deficiency',
+    '\'%first($lake($orms\'&goaded\'&hungry\'(industry\'&layers(%eader(\'imiting\')motivated\'(obsessed()rientated-"ed\'&points(\'romoted',
+    '\'\'regions\'%share($teps)&unting\'"to(#ype&$.you&%/high\'&sexual#$zier$#nyy"#p-1##ups"%r-eat#$eaat',
+    '%"rr\'%rrrrr""sm""tc#!d"(u&zcaron#&agachs&#ich)#ean$"ud#\'b&mdash$\'-screws%"up$"ac$*b/european',
+    '%#ers%$iest&(ng-stick)"up%"le$(enhauser$\'hunting$!l$%screw#0chet-la-vallasse$!o#\'dgecore&"on&*r/friedman%Yingly-sometimes-fun&rehy;in-a-terribly-boyish-sort-of-way',
+    '%!n&#gly$+zi&aogon;dz#$eber$!d$$ling%%ling.)"ly("ng&!y$!n$,some-looking("st#)ff-voiced%"er',
+    '%!s%#udd%)y-looking$!t#$idae$!s%%hunya#!k##man$%bled\'\'!r&#in\'$$iaux$)mit-maker\'!t',
+    '$#ore%"us$#pas%\'y-boots##nay$$ched\'!s$%dberg%"le&#ich%$mann%"on%&rechte&#iss%\'vertrag',
+    '$%ebaum%$feld%!n&$berg$#ge-\')brechtian\'$fest(#unk\'#led(#ike\'&making\'$rock+#ers&!d\'$-out',
+    '&$play%#ier$%inger%$tzky$!k$#man$$sven$"t\'&\'n\'groan%*-and-grind&$like%\'enblick&!r%\'futtock%&lement',
+    '\'"ss%\'ometers#!p$"os$"pa%,enkommandant\'$stab%!i&&-which##sin$"sa$%zecki#!t#,y&egrave;res$#ter',
+    '\'!v"$vous"!y##der#\'ehounds#!f$!f$"in##gar$"or#"ke#+llotalpidae%"us#%phaea%#ons',
+    '$,tight-thynne#\'speerdt#&tviken"(zybowski!$s-15#!2##400#*ana/p-anca&!s#!d#%goose"!2#"/3"%3/ap2#"00',
+    '")5500fft92"!6"+chwandtkopf"#eee#"ll"!l""o1"#p-5"*t&mdash;10#%-atf1$%c-ab1%#reb$$gal4(0&lsqb;1-147&rsqb8%;-jun',
+    '("-1$"pa%7ou&lsqb;c&rsqb;-binding5#dna#%.gal4().jun1-193##alt##ric"&x-r750"!z!0t&gt;ga&gt&gt;gg"$-100#!8##iic#!r',
+    '"#/ac""11#!6"!2""3i"#40s"!6"4aggcxcacgtgaccgggtgt#"tc%!c&)caggaatcg\'(gagaatcg"!b#&-bound#$7crg',
+    '#!s"!d#!i""gc )hemp-seed',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_76 = (
+count_76 = 6695
+
+heads_76 = (
     'foncha',
-    'fonck',
-    'fonctionnaire',
-    'fonctionnement',
-    'fond&eacute;es',
-    'fondaci&oacute',
-    'fondant-about',
-    'fondas',
-    'fonde',
-    'fondkommission',
-    'fondly-cherished',
-    'fondnesses',
-    'fondo',
-    'fondriest',
-    'fonds-saint-denis',
-    'fondsfinans',
     'fonduta',
-    'fonenau',
-    'fonetic',
-    'fonfirmed',
-    'fongeru',
-    'fonhgtaew',
-    'fonic',
-    'fonmon',
-    'fonotipia',
-    'fonst&aring;r',
-    'fonsteins',
-    'font-covers',
-    'fontaines',
-    'fontainova',
-    'fontainroys',
-    'fontana/collins',
     'fontana/elvis',
-    'fontanay',
-    'fontanellatese',
-    'fontanelles',
-    'fontani',
-    'fontebuoni',
-    'fonteio',
-    'fonteius',
-    'fontelles',
-    'fontem',
-    'fontenallato',
-    'fontenays',
-    'fontette',
-    'fonteyraud',
-    'fontin',
-    'fontina',
     'fontitis',
-    'fontmeta',
-    'fonto-grapher',
-    'fontographer',
-    'fonts&mdash;but',
-    'fonts&mdash;they',
-    'fontstudio',
-    'fontvieille',
-    'fontvielle',
-    'fonu',
-    'fonvisin',
-    'fonzville',
-    'fooball',
-    'foocking',
-    'food&mdash;it',
-    'food&rehy;seeking',
     'food&rehy;supplying',
-    'food&rehy;tasters',
-    'food\'',
-    'food-',
-    'food-allergic',
-    'food-altering',
-    'food-and-agriculture',
-    'food-and-tobacco',
-    'food-and-wine',
-    'food-basket',
-    'food-baskets',
-    'food-body',
-    'food-carriers',
-    'food-conducting',
-    'food-consumption',
-    'food-crisis',
     'food-crop',
-    'food-crops',
-    'food-deficit',
-    'food-distributions',
-    'food-fetishism',
-    'food-filled',
-    'food-flecked',
-    'food-for-work',
-    'food-gatherers',
-    'food-giver',
-    'food-handlers.',
-    'food-herding',
-    'food-intake',
-    'food-laws',
-    'food-obsessed',
-    'food-packaging',
     'food-parcel',
-    'food-parcels',
-    'food-place',
-    'food-poor',
-    'food-price',
-    'food-processor',
-    'food-producers',
-    'food-production',
-    'food-rationing',
-    'food-relief',
-    'food-rents',
-    'food-retailing',
-    'food-safe',
-    'food-security',
-    'food-seeking',
-    'food-sellers',
     'food-selling',
-    'food-serving',
-    'food-sharing',
-    'food-song',
-    'food-spoiling',
-    'food-stall',
-    'food-stalls',
-    'food-stuff',
-    'food-subsidy',
-    'food-supplies',
-    'food-surpluses',
-    'food-taster',
-    'food-tasters',
-    'food-tasting',
-    'food-train',
-    'food-training',
     'food-vessel',
-    'food-vessels',
-    'food-warmer',
-    'food-writers',
-    'food/beverage',
-    'food/chocolate',
-    'food/drink/tobacco',
-    'food/emi',
-    'food/hygiene',
-    'food/pub',
-    'food/rent',
-    'food/tray',
-    'food_of',
-    'foodbotham',
-    'foodbowls',
-    'foodchain',
     'foodcrop',
-    'foodcrops',
-    'foodenthusiasts',
-    'foodery',
-    'foodfare',
-    'foodgrain',
-    'foodhalls',
-    'foodhandler',
-    'foodiest',
-    'foodists',
-    'foodlands',
-    'foodmakers',
-    'foodmaster',
-    'foodpipe',
-    'foods\'-',
-    'foodship',
     'foodstall',
-    'foodsticks',
-    'foody',
-    'foof',
-    'foofles',
-    'fooiver',
-    'fooker',
-    'fookin\'\'ell',
-    'fool\'',
-    'fool-gladly',
-    'fool-hardy',
-    'fool-in-christ',
-    'fool-proofed',
-    'foolhardily',
-    'foolishnesses',
-    'fools&mdash;she',
     'fools.',
-    'foom-hoom-zoom-boom',
-    'foonky',
-    'fooood',
-    'foop',
-    'foor',
-    'foord-kelcey',
-    'foord/teacher',
-    'foorler',
-    'foostier',
-    'foot&rehy;noted',
-    'foot&rehy;wall',
-    'foot\'',
-    'foot-bath',
-    'foot-baths',
-    'foot-binding',
     'foot-body',
-    'foot-changes',
-    'foot-controlled',
-    'foot-fetishist',
-    'foot-friendly',
-    'foot-holds',
-    'foot-in-mouth',
-    'foot-level',
-    'foot-line',
-    'foot-man',
-    'foot-marks',
-    'foot-notes',
-    'foot-numbing',
-    'foot-pace',
-    'foot-pedal',
-    'foot-plus',
     'foot-pounds',
-    'foot-powered',
-    'foot-racing',
-    'foot-shock',
-    'foot-shocks',
-    'foot-shuffling',
-    'foot-slog',
-    'foot-sloggers',
-    'foot-slogging',
-    'foot-smoothed',
-    'foot-steps',
-    'foot-stool',
-    'foot-stopper',
-    'foot-stretching',
-    'foot-strike',
-    'foot-surveillance',
     'foot-to-head-on',
-    'foot-touching-the-ground',
-    'foot-unit',
-    'foot-valve',
-    'foot.john',
-    'foot.taller',
-    'foot/former',
-    'foot/hand',
-    'foot/toes',
-    'foota',
-    'footall',
-    'footbal-pub:hoorible',
-    'football\'',
-    'football-fan-free',
-    'football-field-sized',
-    'football-following',
     'football-ground',
-    'football-loving',
-    'football-obsessive',
-    'football-only',
-    'football-pitch',
-    'football-playing',
-    'football-shaped',
-    'football-style',
-    'football-watching',
-    'football.he',
-    'football/',
-    'football/a',
-    'football/like',
-    'footballer-artists',
-    'footballer-designed',
-    'footballer.',
     'footballer/cricketer',
-    'footballers&mdash',
-    'footballings',
-    'footballsinto',
-    'footbaths',
-    'footbeats',
-    'footbell',
-    'footboar',
-    'footclouts',
-    'footcontroller.',
-    'footcups',
-    'footdragging',
-    'foote-wood',
-    'footee',
-    'footera',
-    'footerb',
     'footering',
-    'footfall-deadening',
-    'footguards',
-    'foothealth',
-    'footie-wise',
-    'footitt',
-    'footknives',
-    'footlamberts',
-    'footlets',
-    'footlight',
-    'footlighter',
-    'footlights-style',
-    'footlings',
-    'footlock',
-    'footmanly',
-    'footmats',
     'footnote-reference',
-    'footnoted',
-    'footnotes-either',
-    'footnoting',
-    'footpack',
-    'footpedals',
-    'footpegs',
-    'footpoints',
-    'footramp',
-    'footrim',
-    'footroom',
-    'footservants',
-    'footslide',
-    'footslopes',
-    'footsoldiering',
-    'footsoles',
     'footstalks',
-    'footstamping',
-    'footsteered',
-    'footsy',
-    'footvalve',
-    'footvalves',
-    'footwalk',
-    'footwalls',
-    'footwarmers',
-    'footwashing',
-    'footway/cycleway',
-    'footwear-as-fashion',
-    'footworks',
-    'footwright',
-    'footy-mad',
-    'foozle',
     'fopa',
-    'fopped',
-    'foppery',
-    'foppishly',
-    'foprty',
-    'foptur',
-    'for&amp;am',
-    'for&eacute;t',
-    'for&ndash;et',
-    'for&pound;190m',
-    'for&rehy;stuart',
-    'for\'ards',
-    'for\'t.',
-    'for\'tis',
-    'for-15',
-    'for-a',
     'for-ever',
-    'for-five',
-    'for-graham',
-    'for-heaven\'s-sake-get-enough',
-    'for-if',
-    'for-instance',
-    'for-loops',
-    'for-money',
-    'for-ness',
-    'for-non-care',
-    'for-not',
-    'for-oh',
-    'for-round',
-    'for-some',
-    'for-the',
-    'for-trouble',
     'for-wards',
-    'for-with',
-    'for.discussion',
-    'for.glyn',
-    'for.i',
-    'for.treatment',
-    'for/actively',
-    'for/dreading',
-    'for/meeting',
-    'for/sinn',
-    'for1992',
-    'for3ete',
-    'for_anything',
-    'for_apart',
-    'for_as',
-    'for_er_ever',
     'for_er_example',
-    'for_er_good',
-    'for_ever.',
-    'for_for_ever',
-    'for_less',
-    'for_the_,_for_the_most_part',
-    'forain',
-    'foraine',
-    'foramenifera',
-    'foraminifer',
-    'foraminifer-nannofossil',
-    'foraminiferal',
-    'forams',
-    'foratom',
-    'foraying',
-    'forbach',
     'forbearers',
-    'forber/association',
-    'forbert',
-    'forbes-adam',
-    'forbes-hamilton',
-    'forbes-robertson',
-    'forbesganj',
-    'forbesi',
-    'forbesii',
-    'forbidder',
-    'forbiddings',
-    'forbo-cp',
-    'forbo-kingfisher',
-    'forborn',
-    'forborne',
-    'forbra',
     'forbritish',
-    'forbs',
-    'forbundet',
-    'forbuoy',
-    'forbye',
-    'forc',
-    'forcalquier',
-    'forcasted',
-    'forcasts',
-    'force&rehy;based',
-    'force&rehy;feeding',
-    'force(s)',
-    'force-circulated',
-    'force-controlling',
-    'force-dry',
-    'force-fields',
     'force-membrane',
-    'force-of-mortality',
-    'force-push',
-    'force-skin',
-    'force-steve',
-    'force-taught',
-    'force-ten',
-    'force-throughout',
-    'force-trained',
-    'force-wall',
-    'force-wide',
-    'force-xxxx',
-    'force/area',
-    'force/retirement',
-    'force/viscous',
-    'force18',
     'forceable',
-    'forceball',
-    'forcecancelling',
-    'forced&rehy;labour',
-    'forced-draft',
-    'forced-labour',
-    'forced-open',
-    'forcefed',
-    'forcefields',
-    'forceful-looking',
-    'forcefully-worded',
-    'forcefulness.',
-    'forceps.',
-    'forcer',
-    'forces&mdash;his',
-    'forces-',
     'forces/relations',
-    'forces/territory',
-    'forces4990',
-    'forchaz',
-    'forcheim',
-    'forchhammer',
-    'forchondt',
-    'forcibly\'',
-    'forcillo-rose',
-    'forcin\'',
-    'forcing-ground',
-    'forcing-house',
-    'forcing-into-friction',
-    'forck',
-    'forcus',
-    'ford-approved',
     'ford-dominated',
-    'ford-end',
-    'ford-funded',
-    'ford-john',
-    'ford-owned',
-    'ford-powered',
-    'ford-speak',
-    'ford-style',
-    'ford-usa',
-    'ford-vv',
-    'ford-vv/iv',
-    'ford/berkshire',
-    'ford/chevrolet',
-    'ford/father',
-    'ford/playgroup',
-    'ford/weather-watcher',
     'forde-johnston',
-    'fordel',
-    'fordie',
-    'fordlea',
-    'fordlegal',
-    'fordneuk',
-    'fordney-mccumber',
-    'fordrive',
-    'fordstown',
-    'fordtran',
-    'fore&rehy;bears',
-    'fore&rehy;court',
-    'fore&rehy;runner',
-    'fore&rehy;seeability',
-    'fore&rehy;thought',
-    'fore\'ead',
     'fore-aft',
-    'fore-arc',
-    'fore-arms',
-    'fore-bear',
-    'fore-casting',
-    'fore-finger',
-    'fore-ground',
-    'fore-grounded',
-    'fore-hall',
-    'fore-heads',
-    'fore-hooves',
-    'fore-knowledge',
-    'fore-knuckle',
-    'fore-leg',
-    'fore-limb',
-    'fore-part',
     'fore-quarter',
-    'fore-reach',
-    'fore-shore',
-    'fore-shortened',
-    'fore-tex',
-    'fore-thought',
-    'fore-words',
-    'fore/',
-    'foreach',
-    'forearm-smashing',
-    'forebearance',
-    'forebearers',
-    'forebrains',
-    'forebulge',
-    'forecasters-about',
-    'foreced',
     'forecists',
-    'foredeep',
-    'foredune',
-    'forefated',
-    'forefaulted',
-    'forefend',
-    'forefist',
-    'forefoot.',
-    'foreforth',
-    'forefronting',
-    'foregated',
-    'foregger',
-    'foregoes',
-    'foregrip',
-    'foregrounded\'',
-    'foregroundings',
     'foregrounds.',
-    'forehalyard',
-    'foreham',
-    'forehatch',
-    'forehead-furrowingly',
-    'forehead-hair',
-    'foreheard',
-    'foreign-',
-    'foreign-accented',
-    'foreign-armed',
-    'foreign-backed',
-    'foreign-built',
-    'foreign-debt',
-    'foreign-desk-clerk',
-    'foreign-dominated',
-    'foreign-manufactured',
     'foreign-minister-level',
-    'foreign-money',
-    'foreign-operations',
-    'foreign-policy-making',
-    'foreign-produced',
-    'foreign-ruled',
-    'foreign-run',
-    'foreign-speaking',
-    'foreign-tourist',
-    'foreign-training',
-    'foreign/non-national',
-    'foreign74',
-    'foreigner-baiting',
-    'foreigner-hating',
-    'foreigners.i',
-    'foreignowned',
     'foreigns',
-    'forel',
-    'forelady',
-    'foreline',
-    'forelle',
-    'forelock-touching',
-    'forema',
-    'foremark',
-    'foremarks',
-    'foremasthand',
-    'foremr',
-    'forename(s)',
-    'forename.',
-    'forence',
-    'forens',
-    'forepaw',
     'foresails',
-    'foresake',
-    'foresaken',
-    'forescored',
-    'foresheet',
-    'foresightful',
-    'foresights',
-    'forest&mdash;a',
-    'forest&mdash;it',
-    'forest&mdash;to',
-    'forest\'',
-    'forest-',
-    'forest-area',
-    'forest-burning',
-    'forest-covered',
-    'forest-destroying',
     'forest-dweller',
-    'forest-edge',
-    'forest-fire',
-    'forest-free',
-    'forest-fringed',
-    'forest-harvesting',
-    'forest-land',
-    'forest-like',
-    'forest-liverpool',
-    'forest-loving',
-    'forest-ranger',
-    'forest-rich',
-    'forest-sized',
-    'forest-steppe',
-    'forest-trees',
-    'forest.enthusiasts',
     'forest/redbridge',
-    'forestage',
-    'forestal',
-    'forestarehege',
-    'forestarius',
-    'forestastes',
-    'forestation',
-    'foreste',
-    'forester/',
-    'forester/the',
-    'foresters.',
-    'forestership',
-    'foresti&egrave',
-    'forestiere',
-    'forestrial',
-    'forestry&mdash;they',
     'forestry/conservation',
-    'forests&mdash;five',
-    'forests--account',
-    'forests--including',
-    'foresty',
-    'foretellable',
-    'foretescues',
-    'forevahhh',
-    'forever-changing',
-    'forever-ish',
-    'forever-never',
-    'foreverness',
-    'foreville',
-    'forewarded',
-    'forewings',
-    'forewords',
     'foreworks',
-    'forf',
-    'forfait',
-    'forfar/actor',
-    'forfett',
-    'forficatus',
-    'forgac',
-    'forgandenny',
-    'forgat',
-    'forgavest',
-    'forgays',
-    'forge-fires',
-    'forgeeve',
-    'forgery-detection',
-    'forget&mdash',
-    'forget&rehy;me-nots',
     'forget-about',
-    'forget-me-knot',
-    'forget-me-knots',
-    'forget-what',
-    'forgetta',
-    'forgetten',
-    'forgetter',
-    'forgetting-place',
-    'forgie',
-    'forgit',
-    'forgivably',
-    'forgiveably',
-    'forgiven.',
-    'forgiveness/mercy',
-    'forgiveness/reconciliation',
-    'forgivenesses',
     'forgo&ndash;ten',
-    'forgott',
-    'forgotten-man',
-    'forgotten-that',
-    'forgotten.',
-    'forgottenness',
-    'forgotyn',
-    'forimprovements',
-    'forio',
-    'foris',
-    'forista',
-    'fork\'',
-    'fork-hand',
-    'fork-impaled',
-    'fork-shaped',
-    'fork.',
     'forked-tongue-speak',
-    'forkhurst',
-    'forking.',
-    'forkings',
-    'forklift-loader',
-    'forl&iacute',
-    'forl&igrave',
-    'forlag',
-    'forlosa',
-    'forloyn',
-    'form&gt',
-    'form&lsqb;ed&rsqb',
-    'form&mdash;if',
-    'form&rehy;up',
-    'form-building',
-    'form-content',
     'form-creating',
-    'form-critics',
-    'form-filler',
-    'form-fillers',
-    'form-fitting',
-    'form-focused',
-    'form-generating',
-    'form-giver',
-    'form-mistresses',
-    'form-plastic',
-    'form-plus-meaning',
-    'form-room',
-    'form-tables',
-    'form-teacher',
-    'form.l',
-    'form.with',
     'form/art',
-    'form/c.v.',
-    'form/content',
-    'form/injury',
-    'form/matter',
-    'form/style',
-    'formal-grammar',
-    'formal-informal',
-    'formal-ity',
-    'formal-legalistic',
-    'formal-stage',
-    'formal-summer-outfit-with-hat',
-    'formaldehyde-agarose',
-    'formaldehyde-based',
-    'formaldehyde-free',
-    'formaldehyde/agarose',
     'formaldehyde/mops',
-    'formaldhyde-acetic',
-    'formale',
-    'formalin-based',
-    'formalin-fixed',
-    'formalin/',
-    'formalist/structuralist',
-    'formalistically',
-    'formalities.',
-    'formalities/documentation',
-    'formality.',
-    'formality/informality',
-    'formality/politeness',
-    'formalizations',
-    'formally-biased',
-    'formally-forbidden',
     'formally-shaped',
-    'formamide-5',
-    'formamide/agarose',
-    'formanby',
-    'formastation',
-    'format-like',
-    'format-type',
-    'formateur',
-    'formation.the',
-    'formation/emploi',
-    'formation/ozone',
-    'formation/side',
-    'formations-in',
-    'formatwise',
-    'formazon',
-    'formboard',
     'formby-born',
-    'formeau',
-    'formed-up',
-    'formelles',
-    'formentation',
-    'former-communist',
-    'former-jugoslav',
-    'former-may',
-    'former/liberal',
-    'formerley',
-    'formerly-forested',
-    'formerly-gilded',
-    'formez',
-    'formica-faced',
-    'formica/b',
-    'formicariidae',
     'formicarium',
-    'formicarum',
-    'formicating',
-    'formication',
-    'formidable-as-ever',
-    'formidable-formidable',
-    'formiello',
-    'formigal',
-    'forminant',
-    'forming/storming',
-    'formings',
-    'formis',
-    'formlink',
-    'formore',
-    'formorians',
-    'formosanus',
     'formr',
-    'formrs',
-    'forms&mdash;most',
-    'forms-cheerful',
-    'forms-driver',
-    'forms.i',
-    'forms/',
-    'forms/black-stoled',
-    'forms/letters',
-    'forms/two',
-    'formstone',
-    'formula\'',
-    'formula-apportioned',
-    'formula-driven',
-    'formula-funded',
-    'formula-like',
     'formula-shy',
-    'formula-stories',
-    'formula-style',
-    'formula.',
-    'formularisation',
-    'formulatable',
-    'formulation.',
-    'formvar-coated',
-    'formwatch',
-    'formyl-leucyl-methionyl',
-    'formyl-methionyl-leucyl-phenyl-alanine',
-    'formyl-methionyl-leucyl-phenylalanine',
-    'formyl-methionyl-leucyl-proline',
-    'forn',
-    'fornacis',
-    'fornaia',
     'fornaire',
-    'fornazzo',
-    'forncast',
-    'fornebu',
-    'fornham',
-    'fornicated',
-    'fornications',
-    'fornicatory',
-    'fornix',
-    'foroed',
-    'forpost',
-    'forrader',
-    'forragne',
-    'forrai',
-    'forrell',
-    'forren',
     'forrest/accident',
-    'forrest/chief',
-    'forrestah',
-    'forresterhill',
-    'forrests',
-    'forrinter',
-    'forristal',
-    'forrrce',
-    'forrum',
-    'forryan',
-    'fors/repeats/gosubs',
-    'forsaketh',
-    'forsakyn',
-    'forsaw',
-    'forschungs',
-    'forschungs-gesellschaft',
     'forschungsamt',
-    'forschungsgemeinschaft',
-    'forschungszentrum',
-    'forseeing',
-    'forseth',
-    'forsham',
-    'forshamebalaamthoufoolishclown',
-    'forsightness',
-    'forslind',
-    'forsshey',
-    'forssman',
-    'forsstrom',
-    'forst',
-    'forster-like',
-    'forster-nietzsche',
-    'forster-nyham',
     'forster/race',
-    'forsteresheigh',
-    'forstereshey',
-    'forsteriana',
-    'forstershey',
-    'forsthaus',
-    'forstich',
-    'forswore',
-    'forsytes',
-    'forsythia.',
-    'fort&eacute',
-    'fort&iacute',
-    'fort&ndash;first',
-    'fort&uacute;n',
-    'fort-da',
-    'fort-lamy',
     'fort/da',
-    'fortana',
-    'fortar',
-    'forte(amersham)',
-    'forte-epice',
-    'forte-owned',
-    'forteans',
-    'fortended',
-    'fortepianos',
-    'forterishey',
-    'forterre',
-    'fortersley',
-    'fortesque',
-    'fortetsa',
-    'forth\'',
-    'forth-rightly',
     'forth/the',
-    'forthcome',
-    'forthcomimg',
-    'forthe',
-    'forthred',
-    'forthreve',
-    'forthrising',
-    'forths',
-    'forthw-ith',
-    'forti',
-    'forticrete',
-    'fortie',
-    'forties/fifties',
-    'fortifcation',
-    'fortificantes',
-    'fortifications.',
     'fortifier',
-    'fortifyin\'',
-    'fortini',
-    'fortino',
-    'fortissimos',
-    'fortissimus',
-    'fortition',
-    'fortitude-in-adversity',
-    'fortitudes',
-    'fortn',
-    'fortnight-off',
-    'fortnight-on',
-    'fortnightly/monthly',
-    'fortnightly/weekly',
-    'forto',
-    'fortran-90',
     'fortran-based',
-    'fortran90d',
-    'fortress&rehy;like',
-    'fortress-cities',
-    'fortress-den',
-    'fortress-farm',
-    'fortress-shrine',
-    'fortress-walling',
-    'fortress-windowed',
-    'fortressed',
-    'fortrey',
-    'fortria',
-    'fortryshey',
-    'fortschritte',
-    'fortu',
-    'fortuin',
     'fortuitousness',
-    'fortun&eacute',
-    'fortunado',
-    'fortunagasse',
-    'fortunam',
-    'fortunate.',
-    'fortunately.',
-    'fortunates',
-    'fortune-hunters',
-    'fortune-seekers',
-    'fortune-seeking',
-    'fortune-teller-once',
-    'fortunetellers',
-    'fortunetelling',
-    'fortuyn/o\'brien',
-    'forty&rehy;four-year-old',
     'forty&rehy;two',
-    'forty&rehy;two-year-old',
-    'forty-bed',
-    'forty-by',
-    'forty-eight-year-old',
-    'forty-fags-a-day',
-    'forty-five-gallon',
-    'forty-five-seater',
-    'forty-five-second',
-    'forty-fiveish',
-    'forty-fold',
-    'forty-foot-long',
-    'forty-for',
-    'forty-four-hour',
-    'forty-gallon',
-    'forty-member',
     'forty-mile',
-    'forty-mile-an-hour',
-    'forty-mile-long',
-    'forty-niners',
-    'forty-one-mile',
-    'forty-piece',
-    'forty-pillared',
-    'forty-plus',
-    'forty-rung',
-    'forty-seven-year-old',
-    'forty-seventh',
-    'forty-shilling',
-    'forty-six-inch',
-    'forty-six-mile',
-    'forty-storey',
-    'forty-thousand',
     'forty-thousand-noble',
-    'forty-ton',
-    'forty-year-olds',
-    'forty.',
-    'forty.four',
-    'forty/fifty',
-    'fortyeight',
-    'fortyfivish',
-    'fortyfooter',
-    'fortyone-fortyone',
-    'fortysomethings',
-    'forum&mdash;merged',
-    'forum-basilica',
-    'forum/alliance',
-    'forum/democracy',
-    'forum/dorset',
     'forums&mdash;they',
-    'forums.',
-    'forushagen',
-    'forw',
-    'forward&mdash;looking',
-    'forward&ndash',
-    'forward-backward',
-    'forward-currency',
-    'forward-curving',
-    'forward-defensive',
-    'forward-deployment',
-    'forward-drooping',
-    'forward-flying',
-    'forward-forward',
-    'forward-going',
-    'forward-heated',
     'forward-leaning',
-    'forward-line',
-    'forward-planned',
-    'forward-producing',
-    'forward-thrust',
-    'forward-voltage',
-    'forward.new',
-    'forward/futures',
-    'forward/m13',
-    'forward_at',
-    'forwarder-consolidator',
-    'forwards-and-backwards',
-    'forwards/back',
-    'forwardsing',
-    'foryewe',
-    'forz',
     'fos-core7',
-    'fos-related',
-    'fosbroke',
-    'fosdick',
-    'fose',
-    'fosforos',
-    'fosforus',
-    'fosgate',
-    'fosh',
-    'fosi',
-    'fosker',
-    'fosmire',
-    'foss&eacute;-aux-loups',
-    'foss/jane',
-    'fossano',
-    'fossany',
     'fossarius',
-    'fossed',
-    'fossett',
-    'fossey.',
-    'fossi',
-    'fossier',
-    'fossil-based',
-    'fossil-encrusted',
-    'fossil-fired',
-    'fossil-hunter',
-    'fossil-like',
-    'fossiled',
-    'fossiles',
-    'fossilis&eacute',
-    'fossilisable',
-    'fossilises',
     'fossilising',
-    'fossilist',
-    'fossilizes',
-    'fossiway',
-    'fosslands',
-    'fossom-brone',
-    'foster&rehy;ing',
-    'foster-care',
-    'foster-children',
-    'foster-rowe',
-    'foster-sons',
-    'foster/',
-    'foster/children',
-    'foster/executive',
-    'foster/frank',
-    'foster/secretary',
     'foster/wess',
-    'fosterage',
-    'fostercare',
-    'fosteriana',
-    'fostermother',
-    'fostermum',
-    'foston/raf',
-    'fotev',
-    'fother',
-    'fotherington-smythe',
-    'fotini',
-    'foto-tele',
-    'fotoarchiv',
-    'fotogallery',
-    'fotogra\'fi',
-    'fotolito',
     'fotomec',
-    'fototouch',
-    'fotting',
-    'fouard',
-    'foucar',
-    'foucauldians',
-    'foucaultian',
-    'fouchier',
-    'fouett&euml;s',
-    'fouga-flying',
-    'fougar',
-    'fougards',
-    'fought-off',
-    'fought-over',
-    'foughten',
-    'fougner',
     'foui',
-    'fouir',
-    'fouke',
-    'foukhar',
-    'foul&eacute',
-    'foul&rehy;mouthed',
-    'foul&rehy;weather',
-    'foul-faced',
-    'foul-free',
-    'foul-hooked',
-    'foul-minded',
-    'foul-smellimg',
-    'foul-weather',
-    'foul-worded',
-    'foul/sub-human',
-    'foul/subhuman',
     'fouladi',
-    'foulbridge',
-    'foulger',
-    'fouling\'',
-    'foulkes/brother',
-    'foulkes/mother',
-    'foulkes/stepfather',
-    'foulkes/wiltshire',
-    'foull',
-    'foulque',
-    'foulridge',
-    'foulsome',
-    'foumakoye',
-    'found\'',
-    'found-object',
-    'found/a',
     'found/thought',
-    'found_as',
-    'found_each',
-    'found_in',
-    'foundation&rehy;plus-option',
-    'foundation\'',
-    'foundation-and-powder',
-    'foundation-based',
-    'foundation-dates',
-    'foundation-laying/context-dependent',
-    'foundation-traces',
-    'foundation-wear',
-    'foundation.sir',
-    'foundation/modular',
-    'foundationer',
-    'foundationless',
     'foundations-crisis',
-    'founde',
-    'founded:1963',
-    'founded:1974',
-    'founded:1975',
-    'founder-architect',
-    'founder-chairman',
-    'founder-conductor',
-    'founder-councillor',
-    'founder-editor',
-    'founder-secretary',
-    'founder-sponsor',
-    'founder/',
-    'founder/charter',
-    'founder/foundress',
-    'founding-abbot',
     'founding-father',
-    'founding-place',
-    'foundrax',
-    'foundresses',
-    'foundry-women',
-    'foundryman',
-    'founf',
-    'founr',
-    'fountain\'',
-    'fountain-like',
-    'fountain-nymph',
-    'fountain-side',
-    'fountain/cotswold',
-    'fountain/glos',
-    'fountain/waterfall/venturi',
-    'fountaindale',
     'fountaine',
-    'fountaine/parent',
-    'fountainebleau',
-    'fountainhall',
-    'fountains-',
-    'fountains-abbot',
-    'fountains-abbotts',
-    'fountains.',
-    'fouorteen',
-    'fouqu&eacute',
-    'fouquier&rehy;tinville',
-    'four&eacute;e',
-    'four&mdash',
-    'four&mdash;generation',
-    'four&mdash;of',
-    'four&ndash;car',
     'four&rehy;digit',
-    'four&rehy;engined',
-    'four&rehy;goal',
-    'four&rehy;inch',
-    'four&rehy;minute',
-    'four&rehy;poster',
-    'four&rehy;seater',
-    'four&rehy;seaters',
-    'four&rehy;thirty',
-    'four&rehy;volume',
-    'four&rehy;year',
-    'four\'',
-    'four-0',
-    'four-10',
-    'four-album',
-    'four-ale',
     'four-all',
-    'four-alternative',
-    'four-and-a-half-minute',
-    'four-and-a-half-month',
-    'four-and-a-half-story',
-    'four-and-a-quarter-mile',
-    'four-angled',
-    'four-arm',
-    'four-armed',
-    'four-art',
-    'four-aspect',
-    'four-axle',
-    'four-badged',
-    'four-balls',
-    'four-band',
-    'four-barred',
     'four-bearing',
-    'four-beat',
-    'four-beat-line',
-    'four-birth',
-    'four-bit',
-    'four-boat',
-    'four-box',
-    'four-by-four',
-    'four-by-two-inch',
-    'four-byte',
-    'four-cam',
-    'four-can',
-    'four-carbon',
-    'four-carriage',
-    'four-celled',
-    'four-character',
     'four-choice',
-    'four-choir',
-    'four-chord',
-    'four-class',
-    'four-clause',
-    'four-coordinate',
-    'four-corner-towered',
-    'four-cornered',
-    'four-crewed',
-    'four-cutter',
-    'four-cycle',
-    'four-date',
-    'four-deck',
-    'four-disc',
-    'four-division',
-    'four-drawer',
     'four-egg',
-    'four-electron',
-    'four-eleven-forty-four',
-    'four-feeder',
-    'four-feet-seven-inches',
-    'four-fifty',
-    'four-fingered',
-    'four-fish',
-    'four-five-o',
-    'four-font',
-    'four-foot-deep',
-    'four-foot-high',
-    'four-foot-nine',
-    'four-foot-wide',
-    'four-foots',
-    'four-footwide',
     'four-for-five',
-    'four-force',
-    'four-forty-five',
-    'four-frame',
-    'four-girl',
-    'four-gore',
-    'four-gp',
-    'four-gun',
-    'four-helix',
-    'four-horn',
-    'four-house',
-    'four-hundred-foot',
-    'four-hundred-year',
-    'four-hundredths',
-    'four-idea',
-    'four-in-hands',
     'four-in-one',
-    'four-in-the-morning',
-    'four-inch-high',
-    'four-inch-wide',
-    'four-inchers',
-    'four-ish',
-    'four-jet',
-    'four-kilometre',
-    'four-lapper',
-    'four-leaved',
-    'four-legs',
-    'four-lettered',
-    'four-limbed',
-    'four-lobed',
-    'four-love',
-    'four-lp',
     'four-masted',
-    'four-master',
-    'four-metres',
-    'four-mile-long',
-    'four-miles',
-    'four-milk',
-    'four-model',
-    'four-module',
-    'four-monthly',
-    'four-museum',
-    'four-ninety',
-    'four-node',
-    'four-of-akind',
-    'four-oh-five',
-    'four-on-the-floor',
-    'four-one-four',
     'four-one-nine',
-    'four-ounce',
-    'four-over-par',
-    'four-packs',
-    'four-pager',
-    'four-panel',
-    'four-panelled',
-    'four-parter',
-    'four-passenger',
-    'four-peltae',
-    'four-pen',
-    'four-people-and-a-dog',
-    'four-plate',
-    'four-platform',
-    'four-plus-three',
-    'four-plus-zero',
     'four-ply.',
-    'four-pointed',
-    'four-portion',
-    'four-position',
-    'four-posta-jelly',
-    'four-postered',
-    'four-pot',
-    'four-probe',
-    'four-putted',
-    'four-rail',
-    'four-rayed',
-    'four-record',
-    'four-ribbon',
-    'four-roll',
-    'four-screen',
-    'four-season',
     'four-sensor',
-    'four-sentence',
-    'four-shaft',
-    'four-sheet',
-    'four-ship',
-    'four-six',
-    'four-slotted',
-    'four-spotted',
-    'four-squadron',
-    'four-square-to-the-wind',
-    'four-state',
-    'four-sting',
-    'four-storied',
-    'four-string',
-    'four-stringed',
-    'four-strokes',
     'four-test',
-    'four-there',
-    'four-thirty-five',
-    'four-three',
-    'four-tiered',
-    'four-times-two',
-    'four-times-wed',
-    'four-to-eleven',
-    'four-to-five-fold',
-    'four-to-five-on',
-    'four-to-three',
-    'four-to-two',
-    'four-toed',
-    'four-tonne',
-    'four-tonners',
-    'four-tracker',
     'four-train',
-    'four-two-four',
-    'four-under-',
-    'four-unit',
-    'four-up',
-    'four-us',
-    'four-velocity',
-    'four-vessel',
-    'four-walling',
-    'four-ways',
-    'four-week-old',
-    'four-weeks-plus',
-    'four-well',
-    'four-were',
-    'four-wheel-steer',
-    'four-wing',
     'four-wok',
-    'four-yard',
-    'four-year&rehy;old',
-    'four-year-',
-    'four-year-long',
-    'four-year-old-twins',
-    'four-years',
-    'four.but',
-    'four/four',
-    'fourblade',
-    'fourcade',
-    'fourcolour',
-    'fourdoor',
-    'fourdranier',
-    'foure-footed',
-    'foures',
     'foureyed',
-    'fourfold.',
-    'fourfoldness',
-    'fourfront',
-    'fourier-bessel',
-    'fourierist',
-    'fourletter',
-    'fourman',
-    'fourme',
-    'fourment',
-    'fourmillante',
-    'fourmost',
-    'fourna',
-    'fourneaux',
-    'fournel',
-    'fournierinterior',
     'fournil',
-    'fournit',
-    'fourpence-halfpenny',
-    'fourpence/by',
-    'fourposters',
-    'fourrier',
-    'fourstacker',
-    'fourstars',
-    'fourstorey',
-    'fourte',
-    'fourtee',
-    'fourteen&ndash;fifteenth',
-    'fourteen-',
-    'fourteen-and-a',
-    'fourteen-days',
-    'fourteen-fold',
     'fourteen-gallon',
-    'fourteen-ish',
-    'fourteen-item',
-    'fourteen-kilometre',
-    'fourteen-month-old',
-    'fourteen-piece',
-    'fourteen-sixteenths',
-    'fourteen-stone',
-    'fourteen-strong',
-    'fourteen/a',
-    'fourteen/eighteen',
-    'fourteenth&rehy;century',
-    'fourteenth-fifteenth',
-    'fourten',
-    'fourth&mdash;see',
-    'fourth-biggest',
     'fourth-century-bc',
-    'fourth-dimensional',
-    'fourth-fastest',
-    'fourth-innings',
-    'fourth-preference',
-    'fourth-rated',
-    'fourth-rounder',
-    'fourth-session',
-    'fourth-stage',
-    'fourth-third',
-    'fourth-to-fifth',
-    'fourthe',
-    'fourtie',
-    'fourtly',
-    'fourty-four',
-    'fourwagon',
     'fourway',
-    'fourwheel',
-    'fourwheelers',
-    'fourwinds',
-    'fous',
-    'fousands',
-    'foussas',
-    'fout',
-    'fouta',
-    'foutaine',
-    'foutch',
-    'foutez',
-    'foutou',
-    'foux',
-    'foveal-central',
-    'foveata',
     'foveaux',
-    'foward-moving',
-    'fowarded',
-    'fowel',
-    'fower',
-    'fowk',
-    'fowkes',
-    'fowl-flesh',
-    'fowl-pip',
-    'fowl-up',
-    'fowle/abingdon',
-    'fowle/banbury',
-    'fowle/broadway',
-    'fowle/bromyard',
-    'fowle/charlton',
-    'fowle/cheltenham',
     'fowle/didcot',
-    'fowle/gloucester',
-    'fowle/hereford',
-    'fowle/holt',
-    'fowle/kingsey',
-    'fowle/london',
-    'fowle/ludlow',
-    'fowle/milton',
-    'fowle/newport',
-    'fowle/northampton',
-    'fowle/shenington',
-    'fowle/stanton',
-    'fowle/stoke',
-    'fowle/warndon',
-    'fowler/imperial',
-    'fowler/mountaineer',
     'fowlhouse',
-    'fowlings',
-    'fowlsheugh',
-    'fownes',
-    'fownhope/herefordshire',
-    'fox&rehy;movietone',
-    'fox-bites',
-    'fox-brown',
-    'fox-clinch/woolsack',
-    'fox-core',
-    'fox-covers',
-    'fox-davies',
-    'fox-dumping',
-    'fox-haunted',
-    'fox-movietone',
-    'fox-reeking',
     'fox-terriers',
-    'fox-trot',
-    'fox-trots',
-    'fox-tv',
-    'fox-type',
-    'fox/author',
-    'fox/foxes',
-    'fox/hunt',
-    'fox/oxford',
-    'fox/scheme',
-    'fox/sheehy',
-    'foxall',
-    'foxam',
-    'foxanpelico',
-    'foxbase+',
-    'foxcombe',
     'foxdale',
-    'foxfire',
-    'foxglove-bells',
-    'foxglove-like',
-    'foxgloved',
-    'foxham',
-    'foxhead-and-riding-crop',
-    'foxhill/swindon/wiltshire',
-    'foxhills',
-    'foxhouse',
-    'foxite',
-    'foxline',
-    'foxpro-based',
-    'foxtail',
-    'foxtech',
-    'foxton-willoughby',
     'foxwarren',
-    'foxwoods',
-    'foxy-faced',
-    'foynes',
-    'foyson',
-    'foysters',
-    'fozard',
-    'fozziwig',
-    'fp&mdash;people',
-    'fp&mdash;progress',
-    'fp&ouml&mdash;liberal',
-    'fp-25',
-    'fp-777',
-    'fp-ph',
-    'fp1',
-    'fp10',
     'fp20',
-    'fp92',
-    'fp95',
-    'fp=pp',
-    'fpb',
-    'fpeak',
-    'fpj',
-    'fplc',
-    'fpmr-a',
-    'fpo',
-    'fpsas',
-    'fpu',
-    'fpv',
-    'fqlk',
-    'fqp',
-    'fr&auml;nkischer',
     'fr&auml;ulein\'',
-    'fr&eacute;maux',
-    'fr&eacute;missant',
-    'fr&eacute;quentations',
-    'fr&eacute;rot',
-    'fr&eacute;sages',
-    'fr&eacute;zier',
-    'fr&ecirc;le',
-    'fr&iacute;ge',
-    'fr&oacute;da/',
-    'fr&oacute;da/fr&oacute;thi',
-    'fr&oacute;dan',
-    'fr&oslash;ken',
-    'fr&ouml;liches',
-    'fr&uuml;chte',
-    'fr&uuml;h',
     'fr&uuml;hgeschichte',
-    'fr&uuml;hlingslied',
-    'fr&uuml;hlingslieder',
-    'fr&uuml;hlingssehnsucht',
-    'fr&uuml;hzeit',
-    'fr.19152',
-    'fr.4s',
-    'fr.5',
-    'fr.9',
-    'fr.is',
-    'fr.r',
-    'fr.xviii',
-    'fr10,000',
-    'fr100m',
-    'fr12.5',
-    'fr13.5',
     'fr25m',
-    'fr2m',
-    'fr3.6',
-    'fr3.6m',
-    'fr300,000,000',
-    'fr320/acre',
-    'fr350m',
-    'fr5',
-    'fr59.9',
-    'fr6.18bn',
-    'fr6.5bn',
-    'fr600',
-    'fr6182/921',
-    'fr650',
-    'fr70',
-    'fr800/ha',
     'fr95',
-    'fr=rf',
-    'fra&ncedil;ois',
-    'fra&uuml;lein',
-    'fra\'',
-    'fraacht',
-    'frabjous.',
-    'frac-ture',
-    'fracastorius',
-    'fracced',
-    'fracht',
-    'frackowiak',
-    'fracs',
-    'fractally',
-    'fractals&mdash;can',
-    'fraction-ridden',
     'fractionalized',
-    'fractionally_away',
-    'fractionate',
-    'fractionating',
-    'fractiousness',
-    'fractual',
-    'fracture-hosted',
-    'fracxillians',
-    'fraddam',
-    'fradley',
-    'fradu',
-    'fragance',
-    'fraganes',
-    'fragaria',
-    'frageria',
-    'fragging',
     'fragilaria',
-    'fragile-shelled',
-    'fragile-x-syndrome',
-    'fragilely',
-    'fragilities',
-    'fragment&mdash;the',
-    'fragment-bearing',
-    'fragment-length',
-    'fragment-like',
-    'fragmenta&rehy;tion',
-    'fragmentally',
-    'fragmentariness',
-    'fragmente',
-    'fragrance.',
-    'fragrancesshould',
-    'fragrang',
     'fragrnt',
-    'frahm',
-    'frail-hulled',
-    'frail-leaved',
-    'frail-spirited',
-    'frail-tubed',
-    'fraility',
-    'fraissinet',
-    'frak/defendant',
-    'frakes',
-    'fraktion',
-    'frall',
-    'fram-based',
-    'fram-compatible',
-    'frame(1984)',
-    'frame(s)',
     'frame-',
-    'frame-advance',
-    'frame-bags',
-    'frame-by',
-    'frame-cages',
-    'frame-hold',
-    'frame-leaned',
-    'frame-like',
-    'frame-rates',
-    'frame-ups',
-    'frame-winning',
-    'frame.as',
-    'frame/2',
-    'frame/the',
-    'framebus',
-    'framehold',
     'frameknitters',
-    'frameshift',
-    'framesmith',
-    'framework-knitters',
-    'framework-will',
-    'framework/direction',
-    'framings',
-    'framington',
-    'framp',
-    'frampton/wiltshire',
-    'framwork',
-    'fran&ccedil;aix',
-    'fran&ccedil;ise',
-    'fran&ccedil;isque',
-    'fran&ccedil;ois-thomas',
-    'fran&ccedil;oises',
     'fran&euml',
-    'franas',
-    'franc-german',
-    'franca.',
-    'france&mdash;the',
-    'france&mdash;upf',
-    'france\'',
-    'france-afrique',
-    'france-based',
-    'france-dawson/sickle',
-    'france-franc',
-    'france-in-algeria',
-    'france-in-europe',
-    'france-iraq',
-    'france-libertes',
-    'france-r&eacute;union-avenir',
     'france-scotland',
-    'france-t&eacute;l&eacute;com',
-    'france-unie',
-    'france-united',
-    'france.',
-    'france.13',
-    'france.15',
-    'france.clp',
-    'france.president',
-    'france.tolly',
-    'france.when',
-    'france/1987/cert',
-    'france/estate',
-    'france/meditator',
-    'france/piedmont',
-    'france/west',
     'france29',
-    'francesae',
-    'francesca.',
-    'francescatti',
-    'franceschild',
-    'francesco-maria',
-    'francescoli',
-    'francesi',
-    'francetti',
-    'franch',
-    'franch-lynch',
-    'franchement',
-    'franchesca',
-    'franchet',
-    'francheville',
-    'franchisal',
     'franchise\'-type',
-    'franchise-holder',
-    'franchise-holding',
-    'franchise-style',
-    'franchot',
-    'francia-based',
-    'franciae',
-    'francinstein',
-    'francione',
-    'franciose',
-    'francis-designed',
-    'francis-mullins',
-    'francis/provost',
-    'francis/taxi',
-    'francis/vale',
-    'franciscanas',
     'franciscanum',
-    'franciscas',
-    'francisci',
-    'francisco&ndash;monterey&ndash;santa',
-    'francises',
-    'franciskanerplatz',
-    'franck-condon',
-    'francke',
-    'franckian',
-    'francly',
-    'franco&mdash;italian',
-    'franco-',
-    'franco-agricultural',
-    'franco-australian',
-    'franco-austrian',
-    'franco-belge',
     'franco-belgian-swiss',
-    'franco-britannique',
-    'franco-bulgarian',
-    'franco-canadian',
-    'franco-espaffola',
-    'franco-european',
-    'franco-gabonese',
-    'franco-huron',
-    'franco-iranienne',
-    'franco-irish',
-    'franco-italianate',
-    'franco-libyan',
-    'franco-norman',
-    'franco-romanian',
-    'franco-russia',
-    'franco-swiss',
     'franco-turkish',
-    'franco-us',
-    'franco-vietminh',
-    'franco/sp',
-    'francofrench',
-    'francois-dufour',
-    'francois-poncet',
-    'francois-thomas',
-    'francois-xavier',
-    'francolini',
-    'francombe',
-    'francome/co-author',
-    'francon',
-    'franconians',
-    'francophobes',
-    'francophonie',
     'francoprussian',
-    'francos',
-    'francourt',
-    'francs-bateliers',
-    'francs.',
-    'francsisco',
-    'frandon',
-    'frandsen',
-    'franek',
-    'franey',
-    'franfurt',
-    'frangoulis',
-    'frangrance',
-    'franholz',
-    'franics',
-    'franiszek',
     'franits',
-    'franja',
-    'franjatransport',
-    'frank&euml/rollo',
-    'frank-read',
-    'frank-wolfe',
-    'frank/princess',
-    'frankau',
-    'frankel/consultant',
-    'frankena',
-    'frankenbury',
-    'frankenhausen',
-    'frankenstein-inspired',
-    'frankensteinian',
-    'frankes',
-    'frankfort',
     'frankfurt-an-der',
-    'frankfurt-an-der-oder',
-    'frankfurt-born',
-    'frankfurt-london-new',
-    'frankfurt-on-oder',
-    'frankfurt/main',
-    'frankfurter-coloured',
-    'frankies',
-    'franklains',
-    'franklands',
-    'frankley',
-    'frankli',
-    'franklim',
-    'franklin-engined',
-    'franklin/economist',
-    'franklin/farmer',
     'franklin/oxford',
-    'franklin/tv',
-    'frankling',
-    'franklinic',
-    'franklinlabour',
-    'frankly&mdash;no',
-    'frankly.',
-    'frankmobile',
-    'franko',
-    'frankofurtia',
-    'frankopani',
-    'frankovich',
-    'frankovits',
-    'frankovsk',
-    'frankprime',
-    'frankson.',
     'frankton',
-    'frankurt',
-    'franoise',
-    'franscico',
-    'franscisca',
-    'franscisco',
-    'franseria',
-    'fransham',
-    'fransman',
-    'franso&ecirc;ze',
-    'frant',
-    'frantic-mad',
-    'frantic.',
-    'frantsa-iosepha',
-    'frantz\'',
-    'frantzusov',
     'franz-anton',
-    'franz-ernst',
-    'franz-paul',
-    'franzblau',
-    'franzini',
-    'franziskanische',
-    'franzjosef',
-    'franzke',
-    'franzoni',
-    'franzy',
-    'frap',
-    'frapp',
-    'frapp&eacute',
-    'frappart',
-    'frasch',
-    'frascina',
     'frase',
-    'fraser\'',
-    'fraser-english',
-    'fraser-french-abrahams',
-    'fraser-williams',
-    'fraser.',
-    'fraser/aged',
-    'fraser/chairman/ardley',
-    'fraser/chief',
-    'fraser/exhibition',
-    'fraser/petites',
-    'fraser/shop',
-    'fraserbugh',
-    'fraserburgh-based',
-    'fraserburgh/new',
-    'frash',
     'frasheri',
-    'frassinelli',
-    'frassino',
-    'frasyniuk',
-    'fratch',
-    'fraternally-invaded',
-    'fraternised',
-    'fraternitate',
-    'fraternity.',
-    'frati-designed',
-    'fratini',
-    'fratmund',
-    'fratri',
-    'fratris',
-    'fraud\'',
-    'fraud-busters',
     'fraud-ravaged',
-    'fraud-resistant',
-    'fraud-tainted',
-    'fraud.the',
-    'fraude',
-    'fraudently',
-    'fraudu&rehy;lent',
-    'fraudulantly',
-    'fraudulend',
-    'fraudwatch',
-    'frauen',
-    'frauenbund',
-    'frauenfeid',
-    'frauenkulturhaus',
-    'frauenzimmer-gesprach-spiele',
-    'fraughage',
     'fraughan',
-    'frauline',
-    'fraumann',
-    'fraumanster',
-    'fravashis.',
-    'fraxi',
-    'fraxilly-style',
-    'fraxino',
-    'fray/ordinand',
-    'fray/thames',
-    'frayne',
-    'fraysses',
-    'frazczack',
-    'frazee',
-    'frazeer',
-    'frazenan',
     'frazer-nash',
-    'frazil',
-    'frazillian',
-    'frc1',
-    'frc2297',
-    'frckoski',
-    'frcog',
-    'frcquently',
-    'frcsed',
-    'freak-of-nature',
-    'freak/channel',
-    'freakazoid',
-    'freakiness',
-    'freakism',
-    'freakniks',
-    'freakout',
     'freakscene',
-    'freaky-looking',
-    'frealistic',
-    'freathby',
-    'frechen-bachem',
-    'frechette',
-    'freckle-destroying',
-    'freckle-dusted',
-    'freckle-nosed',
-    'freckleface',
-    'frecon',
-    'frecs',
-    'fred\'',
-    'freda-',
-    'freda/rebecca',
-    'fredbear',
     'fredda',
-    'freddiano',
-    'freddie.',
-    'freddieland',
-    'fredeman',
-    'fredensborg',
-    'frederheim',
-    'frederica.',
-    'frederickson',
-    'fredericktown',
-    'fredericton',
-    'frederike',
-    'frederiksen/nielsson',
-    'frederiksson',
-    'frederiksted',
-    'frederikstraat',
     'fredfellows',
-    'fredi',
-    'fredly',
-    'fredonna',
-    'fredor',
-    'fredrica',
-    'fredrici',
-    'fredricksson',
-    'fredriksen',
-    'fredson',
-    'free&gt;nine',
-    'free&lt;nine',
-    'free&mdash;your',
-    'free&rehy;flowing',
-    'free&rehy;running',
-    'free\'\'',
     'free\'old',
-    'free(0)',
-    'free(p)&formula',
-    'free(q)&formula;free(r)',
-    'free-arm',
-    'free-as-the-wind',
-    'free-asset',
-    'free-associate',
-    'free-base',
-    'free-based',
-    'free-basers',
-    'free-bass',
-    'free-blow',
-    'free-blown',
-    'free-borrowing',
-    'free-bound',
     'free-choice',
-    'free-climbing',
-    'free-convection',
-    'free-drained',
-    'free-drinks',
-    'free-energy',
-    'free-fatty',
-    'free-fights',
-    'free-float',
-    'free-floatingness',
-    'free-for-all-a',
-    'free-for-all/do-it-yourself',
-    'free-for-life',
-    'free-forming',
-    'free-french',
-    'free-from-rhetoric',
     'free-fruiting',
-    'free-grazing',
-    'free-grown',
-    'free-handed',
-    'free-holders',
-    'free-improvising',
-    'free-jazz',
-    'free-jazzer',
-    'free-lancers',
-    'free-lances',
-    'free-lovers',
-    'free-market-orientated',
-    'free-market-to-liberation',
-    'free-marketism',
-    'free-masonry',
-    'free-metre',
     'free-pass',
-    'free-place',
-    'free-radicals',
-    'free-ran',
-    'free-run',
-    'free-schoolers',
-    'free-scrolling',
-    'free-shaped',
-    'free-soloed',
-    'free-sparring',
-    'free-speech',
-    'free-spirit',
-    'free-stream',
-    'free-streaming',
-    'free-striding',
-    'free-stylers',
     'free-swinging',
-    'free-the-market',
-    'free-threshing',
-    'free-time',
-    'free-turning',
-    'free-verse',
-    'free-wheels',
-    'free-with-petrol',
-    'free.',
-    'free.floating',
-    'free.the',
-    'free/bad',
-    'free/national',
-    'free/private',
-    'freebasing',
-    'freebird',
     'freebodys',
-    'freecall',
-    'freece',
-    'freechurchman',
-    'freeclimbed',
-    'freeclimber',
-    'freed-up',
-    'freed.driver',
-    'freedmen-reliefs',
-    'freedom-',
-    'freedom-fighting',
-    'freedom-of-speech',
-    'freedom-the',
-    'freedom-to-roam',
-    'freedom:just',
-    'freedome',
     'freedomfighters',
-    'freedomseeker',
-    'freedrone',
-    'freedwomen',
-    'freedy',
-    'freeee',
-    'freefallers',
-    'freeholder&rehy;heritors',
-    'freeholdings',
-    'freeish',
-    'freejack',
-    'freek',
-    'freekicks',
-    'freel',
-    'freelance/contractual',
-    'freelance/self-employed',
     'freelandhealth',
-    'freelands',
-    'freeliving',
-    'freely-about',
-    'freely-adopted',
-    'freely-available',
-    'freely-convertible',
-    'freely-elected',
-    'freely-existing',
-    'freely-floating',
-    'freely-given',
-    'freely-worked',
-    'freema',
-    'freeman-encoded',
-    'freeman.',
-    'freeman/banbury',
     'freeman/director',
-    'freeman/ex-gloucestershire',
-    'freeman/first',
-    'freeman/historic',
-    'freeman/neighbour',
-    'freemantle/talbot',
-    'freemantles',
-    'freemasonary',
-    'freemasonries',
-    'freemed',
-    'freen',
-    'freend',
-    'freends',
-    'freeness',
-    'freeperson',
-    'freepersons',
     'freeplay',
-    'freer-handed',
-    'freer-standing',
-    'freeranging',
-    'freers',
-    'frees-up',
-    'freeschoolers',
-    'freesia-scented',
-    'freest-flowing',
-    'freestream',
-    'freethinker',
-    'freetrading',
-    'freewas',
-    'freewater',
-    'freewheelin\'',
-    'freewheelingly',
     'freeworld',
-    'freeworlds',
-    'freez',
-    'freezailah',
-    'freeze&rehy;frame',
-    'freeze-ahead',
-    'freeze-flame',
-    'freeze-fracture',
-    'freeze-framing',
-    'freeze-marked',
-    'freeze-marking',
-    'freeze-out.',
-    'freeze-to-sepia',
-    'freezebrand',
-    'freezemark',
-    'freezer-proof',
     'freezer/microwave',
-    'freezing-cold',
-    'freezing-in',
-    'freezing-plant',
-    'fregona',
-    'fregoso',
-    'frehold',
-    'freiburg-im-breisgau',
-    'freida',
-    'freidrich',
-    'freies',
-    'freifelder',
-    'freifrau',
-    'freight-carrying',
-    'freight-forwarders',
-    'freight-station',
     'freight-yard',
-    'freight/cargo',
-    'freight/mail',
-    'freight1,650',
-    'freightcars',
-    'freightcheck',
-    'freightliners',
-    'freightvehicle',
-    'freightways',
-    'freiheitsucher',
-    'freilach',
-    'freimacher',
-    'freimaurer-kantate',
-    'freimut/kurpiewski',
-    'freinkel',
-    'freirean',
     'freirian-inspired',
-    'freiser',
-    'freisian',
-    'freisinnig-demokratische',
-    'freisinnige',
-    'freistaaten',
-    'freitases',
-    'freitheitsucher',
-    'freixinet',
-    'freizes',
-    'freja',
-    'frejupo',
-    'freke/company',
-    'frely',
-    'fremdenpass',
-    'fremder',
     'fremin',
-    'fremington',
-    'fremlin',
-    'fremond',
-    'fremont-smith',
-    'fremskrittspartiet',
-    'fremund',
-    'fren\'',
-    'frena',
-    'frenatraca',
-    'frences',
-    'french&ndash;spanish',
-    'french&rehy;cultured',
-    'french\'',
-    'french-accented',
-    'french-affilated',
     'french-arab',
-    'french-australian',
-    'french-belgian',
-    'french-bred',
-    'french-brokered',
-    'french-ch&acirc;teau',
-    'french-chinese',
-    'french-cockney',
-    'french-created',
-    'french-egyptian',
-    'french-established',
-    'french-european',
-    'french-fashion',
-    'french-financed',
-    'french-flavoured',
-    'french-foreign',
     'french-fried',
-    'french-greek',
-    'french-indian',
-    'french-inhaled',
-    'french-irish',
-    'french-italian',
-    'french-italian-russian',
-    'french-letters',
-    'french-lexified',
-    'french-manufactured',
-    'french-occupied',
-    'french-only',
-    'french-provincial-style',
-    'french-published',
-    'french-romanian',
-    'french-soviet',
     'french-spanish',
-    'french-speaker',
-    'french-supported',
-    'french-swiss',
-    'french-tailored',
-    'french-us',
-    'french-window',
-    'french/allied',
-    'french/business',
-    'french/farmer',
-    'french/german/etc.',
-    'french/italian',
-    'french/letter',
-    'french/mp',
-    'french/spanish/german',
-    'french/speaking',
     'french/swiss',
-    'frenched',
-    'frencher',
-    'frenchifiers',
-    'frenching',
-    'frenchly',
-    'frenchsoc',
-    'frendes',
-    'frendly',
-    'frendo',
-    'frenesi',
-    'frenetic-indeed',
-    'frenetic-slack',
-    'frenk',
-    'frenloudji',
-    'frenni',
     'frentic',
-    'frentzen',
-    'frenzee',
-    'frenzy-wise',
-    'frenzying',
-    'frequ',
-    'frequecy',
-    'frequence',
-    'frequencies.',
-    'frequency&times;amplitude',
-    'frequency-adjusted',
-    'frequency-agile',
-    'frequency-counts',
-    'frequency-hopping',
-    'frequency-locking',
-    'frequency-multiplied',
     'frequency-order',
-    'frequency-shift-keying',
-    'frequency-specific',
-    'frequency-sweep',
-    'frequency-swept',
-    'frequency-temperature',
-    'frequency.the',
-    'frequency/duration',
-    'frequent&ndash;unctions',
-    'frequent-update',
-    'frequentation',
-    'frequentative',
-    'frequential',
-    'frequently&mdash;it',
-    'frequently-cited',
-    'frequently-expressed',
     'frequently-found',
-    'frequently-invoked',
-    'frequently-mentioned',
-    'frequently-neglected',
-    'frequently-reported',
-    'frequently-requested',
-    'frequently-several',
-    'fresco-like',
-    'fresco-painting',
-    'fresel',
-    'fresh&rehy;shaved',
-    'fresh-air-and-exercise',
-    'fresh-as-you-are',
-    'fresh-baked.',
-    'fresh-bathed',
-    'fresh-born',
     'fresh-caught',
-    'fresh-cheeked',
-    'fresh-coloured',
-    'fresh-complexioned',
-    'fresh-dug',
-    'fresh-dyed',
-    'fresh-fallen',
-    'fresh-food',
-    'fresh-green',
-    'fresh-green-shootiness',
-    'fresh-killed',
-    'fresh-landed',
-    'fresh-picked',
-    'fresh-roasted',
-    'fresh-turned',
-    'fresh-up',
     'fresh-washed',
-    'freshair',
-    'freshbrook',
-    'freshened.',
-    'freshens',
-    'freshest-tasting',
-    'freshly-brewed',
-    'freshly-broken',
-    'freshly-churned',
-    'freshly-coated',
-    'freshly-cooked',
-    'freshly-cropped',
-    'freshly-crushed',
-    'freshly-cut',
-    'freshly-delivered',
-    'freshly-dug',
     'freshly-erupted',
-    'freshly-fallen',
-    'freshly-fried',
-    'freshly-gathered',
-    'freshly-grated',
-    'freshly-hardened',
-    'freshly-harrowed',
-    'freshly-hit',
-    'freshly-ironed',
-    'freshly-laundered',
-    'freshly-leaved',
-    'freshly-lit',
-    'freshly-made',
-    'freshly-mown',
-    'freshly-oiled',
-    'freshly-painted',
     'freshly-purchased',
-    'freshly-restored',
-    'freshly-scrubbed',
-    'freshly-slaughtered',
-    'freshly-sliced',
-    'freshly-stamped',
-    'freshly-weeded',
-    'freshpack',
-    'freshwater-logged',
-    'freshwater/marine',
-    'fresian',
-    'freskin',
-    'fresko',
-    'fresne',
-    'fressgasse',
-    'fret&iacute;l&iacute;n',
     'fret-cutter',
-    'fret-dressed',
-    'fret-insertion',
-    'fret-slots',
-    'fret-wire',
-    'fret-work',
-    'fretboards',
-    'fretherne',
-    'fretilin\'',
-    'frettingly',
-    'fretworked',
-    'frety',
-    'freud-darwin',
-    'freud-like',
-    'freuden-aquarelle',
-    'freudenthal',
     'freudian/',
-    'freudien',
-    'freue',
-    'freuler',
-    'freundschaftsbild',
-    'frevel',
-    'frewen',
-    'frey/tring',
-    'freyberg',
-    'freybergi',
-    'freycinet',
-    'freycineti',
-    'freydis',
-    'freyers',
-    'freyja',
-    'freyle',
     'freymann',
-    'freyne',
-    'freyst&auml;dtler',
-    'freytag11,000',
-    'frezeli',
-    'frezzeria',
-    'frf',
-    'frfps',
-    'frg-led',
-    'frgs',
-    'fri&ndash;mon',
-    'fri&ndash;sun',
-    'fri-sat',
-    'fri:b1',
-    'frialator',
-    'friandise',
     'friandises',
-    'friar&rehy;duke',
-    'friar-bird',
-    'friar-tuck',
-    'friar.',
-    'friary-owned',
-    'friaunds',
-    'fribbins/assault',
-    'fribbling',
-    'fribbulus',
-    'fribourgo',
-    'fricase',
-    'frichot',
-    'frickin\'',
-    'friction-driven',
-    'friction-heated',
     'frictioned',
-    'fridas',
-    'friday-evening',
-    'friday-nighter',
-    'friday-nighters',
-    'friday.it',
-    'friday/kim',
-    'fridaymen',
-    'fridays.',
-    'fridean',
-    'fridee',
-    'frideh',
-    'fridge-',
-    'fridge-door',
-    'fridge-freezers',
-    'fridge-like',
     'fridged',
-    'fridgen',
-    'fridikrkas',
-    'fridtjof',
-    'fried-chicken',
-    'fried-fish',
-    'fried-up',
-    'friedel-crafts',
-    'friedemann',
-    'friedensallee',
-    'friedenstag',
-    'friedenthal',
-    'friedericke',
-    'friedes',
-    'friedewald',
-    'friedhelm',
     'friedl&auml;nder',
-    'friedman-phelps',
-    'friedman/peter',
-    'friedmanian',
-    'friedreich',
-    'friedrich-ebert',
-    'friedrich-ludwig-jahn',
-    'friedrichsdorf',
-    'friedrichsgracht',
-    'friedrichsplatz',
-    'friedrichstadt',
-    'friedrichsthalii',
-    'friedrichstrasse-leipziger',
-    'frieling',
-    'friem',
-    'frien\'',
     'friend\'',
-    'friend-cum-mentor',
-    'friend-engineered',
-    'friend-for-life',
-    'friend-of-a-friend',
-    'friend-or-foe',
-    'friend-smiths',
-    'friend-we',
-    'friend/coach',
-    'friend/enemy',
-    'friendlander',
-    'friendlessness',
-    'friendly-',
-    'friendly-disposed',
-    'friendly-going-on-gullible',
-    'friendly-ish',
     'friendly-society',
-    'friendlycare',
-    'friendman',
-    'friends&mdash',
-    'friends&mdash;we',
-    'friends&rehy;obvious',
-    'friends-',
-    'friends-at-court',
-    'friends-in-the-business',
-    'friends-sometimes',
-    'friends/competitors',
-    'friends/family/lovers',
-    'friends/partners',
-    'friends:antonia',
-    'friends:hugh',
-    'friendship-building',
     'friendship/',
-    'friendship/contact',
-    'friendship/merging',
-    'friendship/romantic',
-    'friendthe',
-    'friendwood',
-    'friere',
-    'frieries',
-    'friesch',
-    'friesenhahn',
-    'friesenplatz',
-    'friesenstrasse',
-    'friesian-holstein',
-    'frietas',
-    'frieze-level',
-    'frieze-like',
     'frig&eacute',
-    'frigard',
-    'frige',
-    'frigga',
-    'friggebo',
-    'frigged',
-    'friggers',
-    'frigh',
-    'fright-patterns',
-    'frightcore',
-    'frighted',
-    'frightened-fawn',
-    'frightened-my',
-    'frightened-of-being-soft',
-    'frightened/intimidated',
-    'frightfu',
     'frightning',
-    'frigic',
-    'frigidus',
-    'frigifaire',
-    'frigio',
-    'frigocut',
-    'frigogena',
-    'frigoverre',
-    'frik',
-    'frikadeller',
-    'frikarti',
-    'frikes',
-    'frilford/oxfordshire',
-    'frill.',
-    'frillier',
-    'frilling',
     'frilly-bloused',
-    'frilly-capped',
-    'frilly-gowned',
-    'frimaire',
-    'frimaldis',
-    'frimbal',
-    'frims',
-    'frindle',
-    'frinds',
-    'fring',
-    'fringe-flicking',
-    'fringe-groups',
-    'fringe-length',
-    'fringe-meeting',
-    'fringe-micelle',
-    'fringe/rump/boots',
     'fringford',
-    'fringilla',
-    'frinton-based',
-    'frinza',
-    'frioend',
-    'fripped',
-    'frippery.',
-    'fripps',
-    'frisbeeing',
-    'frisby/peers',
-    'frisch\'',
-    'frischenschl&auml;ger',
-    'frisches',
-    'frise-',
-    'frise-type',
-    'friskair',
     'friskers',
-    'friskfilm',
-    'friskie',
-    'friskier',
-    'friskily',
-    'frisoni',
-    'frisque',
-    'friss',
-    'frissen',
-    'fristoe',
-    'fritalux',
-    'fritchie/regional',
-    'frite-fly',
-    'fritend',
-    'frithe',
-    'frithuberht',
     'fritigern',
-    'fritole',
-    'frittenden',
-    'fritzell',
-    'fritzinger',
-    'fritzsch',
-    'fritzy',
-    'friuends',
-    'frivol',
-    'frivolous-looking',
-    'frivolous-menacing',
-    'frivolousness',
-    'frizant',
-    'frizbee',
-    'frizes',
-    'frizier',
     'frizington',
-    'frizz-beating',
-    'frizzel',
-    'frizzells',
-    'frizzing',
-    'frizzo',
-    'frizzoni',
-    'frizzy&rehy;haired',
-    'frizzy-head',
-    'frizzy-rugged',
-    'frj-2',
-    'frl',
-    'frlps',
-    'fro(5)',
-    'fro-up',
-    'fro/impotently/',
     'frobisher-zigtermans',
-    'frobisher.',
-    'frock.',
-    'frockcoat',
-    'frockcoats',
-    'frockdom',
-    'frode',
-    'frodebu',
-    'frodoor',
-    'froebelian',
-    'froech',
-    'froeschwiller',
-    'frog-7',
-    'frog-catching',
-    'frog-faced',
-    'frog-gapers',
     'frog-jumping',
-    'frog-kicks',
-    'frog-spawn',
-    'frog-tongue',
-    'frog.bottom',
-    'frogburgers',
-    'frogfish',
-    'frogfoots',
-    'froggart',
-    'froggat',
-    'froggatt/would-be',
-    'frogger',
-    'froggings',
-    'froggish',
-    'froggit',
-    'froggledown',
     'froggs',
-    'froghopper',
-    'froghoppers',
-    'frogland',
-    'froglet/toadlet',
-    'frogmarching',
-    'frogmouths',
-    'frogn',
-    'frogn-sellag',
-    'frognal',
-    'frognall',
-    'frognapark',
-    'frogsmore',
-    'frogspit',
-    'frogwell',
-    'frohlen',
     'frohlich',
-    'frohman',
-    'frohnweiler',
-    'frohsdorf',
-    'froide',
-    'froideterre',
-    'froinech',
-    'froings',
-    'frokost',
-    'frolich.',
-    'frolicks',
-    'frolicksome',
-    'frolov',
-    'frolovna',
-    'frolunda',
-    'from&ndash;the',
     'from-',
-    'from-ings',
-    'from-the',
-    'from-the-ground-up',
-    'from-the-heart',
-    'from-the-hip',
-    'from/english',
-    'from/go',
-    'from20',
-    'from:software',
-    'from:wordperfect',
-    'from_,_from_now_on',
-    'from_now_on.',
-    'from_one',
-    'froma',
-    'fromagiers',
     'frombats',
-    'fromcholangitis',
-    'frome&rehy;radstock',
-    'frome/herefordshire',
-    'fromjanuary',
-    'fromjean',
-    'fromk',
-    'fromm-reichmann',
-    'frommelt',
-    'fromondus',
-    'fromthe',
-    'fronsac',
-    'front&rehy;seat',
-    'front\'',
-    'front-back',
-    'front-brake',
     'front-central',
-    'front-designs',
-    'front-desk',
-    'front-doors',
-    'front-ender',
-    'front-ends.',
-    'front-engine',
-    'front-five',
-    'front-flap',
-    'front-frame',
-    'front-framing',
-    'front-heavy',
-    'front-jumping',
-    'front-leg',
-    'front-liners',
-    'front-lines',
     'front-lines-of-natural-history',
-    'front-loading',
-    'front-men',
-    'front-mounted',
-    'front-of-camera',
-    'front-of-shop',
-    'front-of-stage',
-    'front-of=house',
-    'front-pleated',
-    'front-pocket',
-    'front-projected',
-    'front-raise',
-    'front-rank',
-    'front-ranking',
-    'front-rear',
-    'front-revolutionary',
     'front-rower',
-    'front-rowers',
-    'front-shop',
-    'front-side',
-    'front-silvered',
-    'front-stage',
-    'front-type',
-    'front-unified',
-    'front.',
-    'front.do',
-    'front.were',
-    'front/make',
-    'front/movement',
-    'front/rear',
-    'front9',
-    'fronta',
     'frontel',
-    'frontem',
-    'frontenay',
-    'frontend',
-    'frontgirl',
-    'fronti&eacute;re',
-    'frontie',
-    'frontier&mdash;you',
-    'frontier-patrolling',
-    'frontier-post',
-    'frontierless',
-    'frontignan',
-    'frontispieces',
-    'frontist',
-    'frontless',
-    'frontlets',
     'frontliners',
-    'frontlist',
-    'frontman/rail',
-    'frontogenal',
-    'frontosas',
-    'frontotemporal',
-    'frontpage',
-    'frontperson',
-    'frontpersons',
-    'frontraising',
-    'frontstage',
-    'frontwards',
-    'frontwoman',
-    'frontwqindow',
-    'froomkin',
-    'frooms',
     'fros',
-    'frosine',
-    'frosinone',
-    'froskemansklub',
-    'frost&rehy;crisped',
-    'frost-bearded',
-    'frost-blue',
-    'frost-bound',
-    'frost-burn',
-    'frost-burned',
-    'frost-clawed',
-    'frost-compacted',
-    'frost-flecked',
-    'frost-gleamed',
-    'frost-gripped',
-    'frost-hit',
     'frost-laced',
-    'frost-nails',
-    'frost-protection',
-    'frost-ravaged',
-    'frost-sharp',
-    'frost-shattered',
-    'frost-shocked',
-    'frost-sorting',
-    'frost-spiked',
-    'frost-stats',
-    'frost-tender',
-    'frost-tipped',
-    'frost-tolerant',
-    'frost-webs',
-    'frost.but',
-    'frost/buckinghamshire',
     'frost/costume',
-    'frost/macintosh',
-    'frostbite.he',
-    'frostblades',
-    'frostbound',
-    'frostiest',
-    'frostproof',
-    'frosts.',
-    'frostwhite',
-    'frosty-eyed',
-    'frosty-face',
-    'frosty-faced',
-    'frosztega',
-    'frothier',
-    'frothiest',
-    'frottola-composers',
     'frou&rehy;frou',
-    'frou-frous',
-    'froud',
-    'frough',
-    'frowd',
-    'frowe',
-    'frown-prevention',
-    'frowned-upon',
-    'frownie',
-    'frownie-wearing',
-    'frowns/smiles',
-    'frowsiest',
-    'frowst',
-    'frowsting',
-    'frowzy',
-    'froy',
     'froyday',
-    'froyland',
-    'frozen\'',
-    'frozen-faced',
-    'frozen-foods',
-    'frozen-in-soul',
-    'frozen-out',
-    'frozen.and',
-    'frozzled',
-    'frp&mdash;progress',
-    'frr&prime;f&prime=i',
-    'frs.l',
-    'frs2',
-    'frsl',
-    'fruad',
-    'fruchtbaum',
     'fruchtman',
-    'fruck',
-    'fruck/us',
-    'fructifications',
-    'fructified',
-    'fructify',
-    'frued',
-    'frugging',
-    'frugivory',
-    'frugoni',
-    'fruhling',
-    'fruhschoppen',
-    'frui',
-    'fruidem',
-    'fruiffull',
-    'fruit&rehy;cake',
     'fruit-and-veg.',
-    'fruit-and-vegetable',
-    'fruit-barrow',
-    'fruit-baskets',
-    'fruit-bat',
-    'fruit-bats',
-    'fruit-crammed',
-    'fruit-crows',
-    'fruit-designed',
-    'fruit-display',
-    'fruit-eater',
-    'fruit-floras',
-    'fruit-grower',
-    'fruit-harvest',
-    'fruit-juices',
-    'fruit-laden',
     'fruit-machines',
-    'fruit-packaging',
-    'fruit-packed',
-    'fruit-pickers',
-    'fruit-pie',
-    'fruit-salad',
-    'fruit-shaped',
-    'fruit-stands',
-    'fruit-syrup',
-    'fruit-thrushes',
-    'fruit/fruit',
-    'fruitage',
-    'fruitbats',
-    'fruitbearer',
-    'fruitbowls',
-    'fruitdrops',
     'fruiter',
-    'fruiterer.',
-    'fruitfall',
-    'fruitflavoured',
-    'fruitflies',
-    'fruitgrowing',
-    'fruitgums',
-    'fruitiers',
-    'fruitious',
-    'fruitjuices',
-    'fruitlesse',
-    'fruitlets',
-    'fruitstall',
-    'fruitur',
-    'fruitwoods',
-    'fruity-tasting',
     'fruity.',
-    'frum',
-    'frumentarii',
-    'frumil',
-    'frumkin',
-    'frumy',
-    'frunkie',
-    'fruor',
-    'frupped',
-    'frush',
-    'frusrtrating',
-    'frustation',
-    'frustibus',
-    'frustrat',
-    'frustratedest',
-    'frustration-free',
     'frustration.',
-    'frustration/failure',
-    'frustrator',
-    'frute',
-    'frutella',
-    'fruticosum',
-    'frutin',
-    'frwdwyllt',
-    'fry-ness',
-    'fry-nets/traps',
-    'fry-proof',
-    'fry-saver',
-    'fry/cheltenham',
-    'fry/managing',
-    'fry/world',
-    'fryer/campaign',
     'fryes',
-    'fryett',
-    'frying-pans',
-    'fryingpan',
-    'frymoyer',
-    'frynych',
-    'fryston',
-    'fryxell',
-    'fs-3',
-    'fs-f',
-    'fs/2',
-    'fs16',
-    'fs29',
-    'fs35q',
-    'fsa-authorisation',
-    'fsa-exempted',
     'fsa-regulated',
-    'fsavc',
-    'fsbr',
-    'fsd50/91',
-    'fsf',
-    'fsite',
-    'fsl',
-    'fslc',
-    'fsmc',
-    'fsms',
-    'fsp100',
-    'fsr667',
-    'fstmb',
-    'fsyn',
-    'ft&ndash',
-    'ft&ndash;3ft',
     'ft-100',
-    'ft-2',
-    'ft-250',
-    'ft-350',
-    'ft-50',
-    'ft-ft',
-    'ft-high',
-    'ft-mast',
-    'ft-nmr',
-    'ft-plus',
-    'ft-raman',
-    'ft.sq.',
-    'ft/2,175',
-    'ft/min.',
-    'ft/rd',
-    'ft/se',
     'ft30',
-    'ft3c',
-    'ft4',
-    'ft4a-9',
-    'fta/cit',
-    'ftaf',
-    'ftaf.fdl',
-    'ftaf/failure',
-    'ftao',
-    'ftcl',
-    'ftcwatch',
-    'fte-led',
-    'fteah',
-    'fter',
-    'fthe',
-    'ftl',
     'ftm',
-    'ftn77',
-    'ftof',
-    'ftp.luth.se',
-    'ftrival',
-    'ftserver',
-    'ftsp.com',
-    'ftsp.exe',
-    'ftw31/8/85',
-    'ftx-based',
-    'fu&mdash',
-    'fu&nacute;railles',
-    'fu&zcaron;ina',
-    'fu\'',
-    'fu:d/',
-    'fuc',
     'fucares',
-    'fucawi',
-    'fuch',
-    'fuchsia-coloured',
-    'fuchsii',
-    'fuchsinophil',
-    'fucik',
-    'fucikova',
-    'fucine',
-    'fucini',
-    'fuck\'',
-    'fuck\'em',
-    'fuck-a-fresher',
-    'fuck-awful',
-    'fuck-for-real',
-    'fuck-free',
     'fuck-nothing',
-    'fuck-off',
-    'fucka',
-    'fuckall',
-    'fuckbrained',
-    'fuckee',
-    'fuckerson',
-    'fuckery',
-    'fuckface',
-    'fucki',
-    'fucking-posts',
-    'fucksake',
-    'fuckum',
-    'fuckwits',
-    'fucoid',
-    'fucoids',
     'fucopentaose',
-    'fud-u-u-',
-    'fud.',
-    'fudai',
-    'fudalewicz-niemczyk',
-    'fudan',
-    'fudauri',
-    'fuddi',
-    'fuddling',
-    'fuddy-',
-    'fuddy-duddies',
-    'fudge-coloured',
-    'fudge-like',
-    'fudge-packing',
-    'fudgeability',
-    'fudgetunnel',
     'fudginess',
-    'fue',
-    'fued',
-    'fueguino',
-    'fuehrerbegleit-kommando',
-    'fuel&rehy;storage',
-    'fuel-based',
-    'fuel-burn',
-    'fuel-carrier',
-    'fuel-consuming',
-    'fuel-contaminated',
-    'fuel-dump',
-    'fuel-efficiency',
-    'fuel-gathering',
-    'fuel-gauges',
-    'fuel-generated',
     'fuel-hungry',
-    'fuel-in',
-    'fuel-inefficient',
-    'fuel-inject',
-    'fuel-injection',
-    'fuel-load/',
-    'fuel-oxidant',
-    'fuel-powered',
-    'fuel-pricing',
-    'fuel-rationing',
-    'fuel-rich',
-    'fuel-rod',
-    'fuel-rods',
-    'fuel-system',
-    'fuel-wise',
-    'fuel-wood',
     'fuel/coleman',
-    'fueldumps',
-    'fuelish',
-    'fuelleborni',
-    'fueller',
-    'fuenllana',
-    'fuenmayor',
-    'fuent',
-    'fuenteeducation',
-    'fuenterrabia',
-    'fuer',
-    'fuerant',
-    'fuerst',
-    'fuerstenfeldbruck',
-    'fuerte',
-    'fuerteventura.',
     'fuerza',
-    'fuesday',
-    'fuezessy',
-    'fuff',
-    'fufill',
-    'fufilled',
-    'fuga',
-    'fugaces',
-    'fugacity',
-    'fugally',
-    'fugen',
-    'fuges',
-    'fugge',
-    'fugger',
-    'fuggier',
-    'fuggin\'',
     'fugginess',
-    'fughetta',
-    'fugiens',
-    'fugis',
-    'fugl',
-    'fugleman',
-    'fugler',
-    'fugo',
-    'fugro',
-    'fugue-subjects',
-    'fugue-wise',
-    'fugue-writing',
-    'fugure',
-    'fugures',
-    'fugweiss',
-    'fuh-q',
     'fuhrers',
-    'fuhrertum',
-    'fuhri',
-    'fuhring',
-    'fuiloro',
-    'fuimaono',
-    'fuiss&egrave',
-    'fuitgul',
-    'fuity',
-    'fuiza',
-    'fuji-gen',
-    'fuji-like',
-    'fuji-san',
-    'fujianese',
-    'fujihara',
-    'fujimae',
     'fujimi',
-    'fujimoro',
-    'fujinami',
-    'fujisawa',
-    'fujishima',
-    'fujitsu-fanuc',
-    'fujitsu-made',
-    'fujitsuist',
-    'fujix',
-    'fujiyama',
-    'fukadome',
-    'fukao',
-    'fukaya',
-    'fukida',
-    'fukien',
-    'fukkit',
     'fukofuka',
-    'fukue',
-    'fukugita',
-    'fukuoka-based',
-    'fukutake',
-    'fukuvi',
-    'fukuzawa',
-    'fukuzo',
-    'ful/text',
-    'fulani-speaking',
-    'fulber',
-    'fulbourne',
-    'fulbrook',
-    'fulchester',
-    'fulco',
-    'fulcra',
     'fuld',
-    'fules',
-    'fulfil.',
-    'fulfiling',
-    'fulfilled.',
-    'fulfilment-through-family',
-    'fulfilment-through-motherhood',
-    'fulfilment/absence',
-    'fulfilness',
-    'fulforn',
-    'fulfuld&eacute',
-    'fulfulde',
-    'fulg&ecirc;nico',
-    'fulgarated',
-    'fulgence',
-    'fulgens',
     'fulguration',
-    'fulgurations',
-    'fulham-based',
-    'fulicarius',
-    'fulimori',
-    'fulkeith',
-    'full&ndash;scale',
-    'full&rehy;pay',
-    'full&rehy;perception',
-    'full&rehy;size',
-    'full&rehy;year',
-    'full\'un',
-    'full-alert',
-    'full-and',
-    'full-automatic',
-    'full-beamed',
     'full-bearded',
-    'full-blast',
-    'full-blood',
-    'full-bloodedly',
-    'full-bloodied',
-    'full-blossomed',
-    'full-brother',
-    'full-cheeked',
-    'full-circled',
-    'full-class',
-    'full-control',
-    'full-coverage',
-    'full-cut',
-    'full-cut-off',
-    'full-data',
-    'full-depth',
     'full-dining',
-    'full-down',
-    'full-drainage',
-    'full-duplex',
-    'full-effect',
-    'full-faced',
-    'full-feature',
-    'full-fist',
-    'full-flavour',
-    'full-flowered',
-    'full-flush',
-    'full-flushed',
-    'full-focus',
-    'full-frame',
-    'full-fronted',
-    'full-girthed',
     'full-gloss',
-    'full-grain',
-    'full-grant',
-    'full-growed',
-    'full-necked',
-    'full-needle-rib',
-    'full-nose',
-    'full-nosed',
-    'full-o\'',
-    'full-of-flu',
-    'full-orchestra',
-    'full-paid',
-    'full-pay',
-    'full-pelt',
-    'full-plumaged',
-    'full-powered',
     'full-priced',
-    'full-profile',
-    'full-rime',
-    'full-sentients',
-    'full-sister',
-    'full-square',
-    'full-starred',
-    'full-steam',
-    'full-stop-sized',
-    'full-stretch',
-    'full-tabby',
-    'full-thighed',
-    'full-throatedly',
-    'full-time-equivalent',
-    'full-time/part-time',
-    'full-to',
     'full-tome',
-    'full-toned',
-    'full-tosses',
-    'full-travel',
-    'full-treble',
-    'full-value',
-    'full-voiced',
-    'full-wash',
-    'full-weight',
-    'full-well',
-    'full-words',
-    'full-year-round',
-    'full-zip',
-    'full/empty',
-    'full/half',
-    'full/part',
     'full=time',
-    'fullagar',
-    'fullager',
-    'fullalove',
-    'fullauthority',
-    'fullbodied',
-    'fullbrook',
-    'fullemploy',
-    'fuller\'s-earth-bearing',
-    'fuller-cut',
-    'fuller-figured',
-    'fuller-flavoured',
-    'fuller-sounding',
-    'fuller/bill',
-    'fuller/family',
-    'fuller/habitat',
     'fuller/keith',
-    'fuller/telethon',
-    'fullerene-based',
-    'fullerene-containing',
-    'fulletby',
-    'fullface',
-    'fullfilling',
-    'fullgrown',
-    'fullich',
-    'fulling-mill',
-    'fullish',
-    'fulllength',
-    'fullove',
-    'fullrecovery',
-    'fullsize',
-    'fullspan',
     'fullspate',
-    'fullsteam-ahead',
-    'fullup',
-    'fullwell',
-    'fullwood',
-    'fullwrite',
-    'fully&mdash;fledged',
-    'fully&rehy;clothed',
-    'fully&rehy;developed',
-    'fully&rehy;restored',
-    'fully-adjustable',
-    'fully-authenticated',
-    'fully-baptised',
-    'fully-battened',
-    'fully-blow',
-    'fully-briefed',
     'fully-charged',
-    'fully-compatible',
-    'fully-computerised',
-    'fully-considered',
-    'fully-converged',
-    'fully-costumed',
-    'fully-crewed',
-    'fully-depreciated',
-    'fully-digested',
-    'fully-diluted',
-    'fully-discounted',
-    'fully-documented',
-    'fully-double',
-    'fully-endowed',
-    'fully-equal',
-    'fully-escorted',
     'fully-fit',
-    'fully-framed',
-    'fully-furred',
-    'fully-glazed',
-    'fully-guaranteed',
-    'fully-halogenated',
-    'fully-hedged',
-    'fully-imagined',
-    'fully-independent',
-    'fully-lined',
-    'fully-married',
-    'fully-masculinized',
-    'fully-mature',
-    'fully-occupied',
-    'fully-opened',
-    'fully-operational',
     'fully-organised',
-    'fully-painted',
-    'fully-professional',
-    'fully-provisioned',
-    'fully-realised',
-    'fully-reasoned',
-    'fully-rounded',
-    'fully-sensitive',
-    'fully-shaped',
-    'fully-soundproofed',
-    'fully-stocked',
-    'fully-studied',
-    'fully-subscribed',
-    'fully-taped',
-    'fully-taxable',
-    'fully-tested',
     'fully-utilised',
-    'fully.',
-    'fully.a2',
-    'fully_in',
-    'fully_in_accord',
-    'fullyfitted',
-    'fulmaris',
-    'fulmarus',
-    'fulminatingly',
-    'fulnes',
-    'fulper',
-    'fulpmes',
-    'fuls',
-    'fulsarium',
-    'fulsom',
-    'fulsomeness',
     'fulter',
-    'fulva',
-    'fulvia',
-    'fulvic',
-    'fulvii',
-    'fulvum',
-    'fulvus',
-    'fum&eacute;e',
-    'fumaca',
-    'fumades',
-    'fumarate',
-    'fumaria',
-    'fumarole',
-    'fumble-fisted',
-    'fumble-free',
-    'fumbled-for',
     'fumd',
-    'fume-belching',
-    'fume-choked',
-    'fume-clouds',
-    'fume-cupboard',
-    'fume-laden',
-    'fume-ridden',
-    'fumeroles',
-    'fumerolic',
-    'fumes.',
-    'fumigants',
-    'fumigators',
-    'fumin\'',
-    'fuminal',
-    'fumings',
-    'fuminori',
     'fumish',
-    'fumoirs',
-    'fun&egrave;bres',
-    'fun(k)',
-    'fun-',
-    'fun-around-the-clock',
-    'fun-boards',
-    'fun-boat',
-    'fun-break',
-    'fun-buses',
-    'fun-fashion',
-    'fun-float',
-    'fun-fly',
-    'fun-flying',
-    'fun-for-all-the-family',
-    'fun-fur',
     'fun-gun',
-    'fun-making',
-    'fun-money',
-    'fun-palace',
-    'fun-park',
-    'fun-poking',
-    'fun-quake',
-    'fun-session',
-    'fun-sized',
-    'fun-thing',
-    'fun-to-wear',
-    'fun-wear',
-    'funabem',
-    'funaioli',
-    'funambulist',
-    'funboy',
     'func&rehy;tional',
-    'funck',
-    'funcks',
-    'funct',
-    'function-',
-    'function-associated',
-    'function-based',
-    'function-by-function',
-    'function-focused',
-    'function-independent',
-    'function-led',
-    'function-orientation',
-    'function-word',
-    'function-word-dependent',
-    'function.44',
-    'function/procedure',
     'function_because',
-    'functional-tonal',
-    'functional.',
-    'functional/specialist',
-    'functionalisation',
-    'functionalised',
-    'functionalism.',
-    'functionalist/-structuralist',
-    'functionally-defined',
-    'functions&mdash;to',
-    'functions-many',
-    'functions-pension',
-    'functions/exhibitions',
-    'functions2',
-    'functionsl',
-    'functors',
     'fund&atilde;o',
-    'fund&mdash',
-    'fund&mdash;by',
-    'fund-',
-    'fund-inspired',
-    'fund-matching',
-    'fund-raises',
-    'fund-worthy',
-    'fund/commander',
-    'fund/proprietary',
-    'fund/save',
-    'funda',
-    'funda&rehy;mental',
-    'fundacao',
-    'fundaccon',
-    'fundador',
     'fundamental-equilibrium',
-    'fundamental/tangential',
-    'fundaments',
-    'fundap',
-    'fundasti',
-    'fundation',
-    'fundays',
-    'funded-in-advance',
-    'funded-special',
-    'funded-tutor',
-    'fundemental',
-    'fundering',
-    'funderland',
-    'fundic-pyloric',
-    'fundic/junctional',
-    'funding-\'mezzanine',
     'funding/duration/principal',
-    'funding/staffing',
-    'fundmental',
-    'fundoscopy',
-    'fundraise',
-    'funds-starved',
-    'funds.95',
-    'funds.l',
-    'funds/expenses',
-    'funebria',
-    'funebrial',
-    'funera',
-    'funeral-arrangers',
-    'funeral-arranging',
-    'funeral-carriage',
-    'funeral-furnishing',
     'funeral-march',
-    'funeralese',
-    'funeralls',
-    'funerals.',
-    'funereal-sounding',
-    'funereally',
-    'funereus',
-    'funes',
-    'funf',
-    'funfight',
-    'fung-crawford',
-    'fungally',
-    'funge',
-    'fungi-beer',
-    'fungi.',
-    'fungistatic',
     'fungoidal',
-    'fungus&rehy;grower',
-    'fungus-based',
-    'fungus-breath',
-    'fungus-covered',
-    'fungus-growing',
-    'fungus-infected',
-    'fungus-like',
-    'fungus-resistant',
-    'fungus-toxic',
-    'fungusing',
-    'funia',
-    'funiak',
-    'funicello',
-    'funicles',
-    'funicul&agrave',
     'funicul&igrave',
-    'funis',
-    'funk-filled',
-    'funk-mc',
-    'funk-oriented',
-    'funk-punk-dirge',
-    'funk/metal',
-    'funk/rap',
-    'funk/rap/rawk',
-    'funk/soul',
-    'funkadelia',
-    'funke',
-    'funkee',
-    'funkel',
-    'funkenstein',
-    'funkers',
     'funkily',
-    'funkin\'',
-    'funkin-lesson',
-    'funkotron',
-    'funkrock',
-    'funky-chicken',
-    'funky/african',
-    'funline',
-    'funnel\'-shaped',
-    'funnel-hole',
-    'funnel-shape',
-    'funnel-web',
-    'funnil',
-    'funny-farm',
-    'funny-man',
-    'funny-money',
     'funny-sad',
-    'funny-smelling',
-    'funnybone',
-    'funnymoon',
-    'funpack',
-    'funpool',
-    'funseeker',
-    'funshine',
-    'funshineland',
-    'funsplash',
-    'funster',
-    'funt',
-    'funtley',
-    'funtop',
-    'funtumia',
-    'funwear',
     'funy',
-    'fuo',
-    'fupporting',
-    'fur&ndash;e',
-    'fur&rehy',
-    'fur&rehy;covered',
-    'fur&rehy;thermore',
-    'fur-backed',
-    'fur-bearer',
-    'fur-bearers',
-    'fur-coat',
-    'fur-hatted',
-    'fur-hooded',
-    'fur-less',
-    'fur-monopoly',
-    'fur-textiles',
     'fur-trading',
-    'fur-tribute',
-    'fur-wearing',
-    'fura-2/am',
-    'furan',
-    'furandi',
-    'furanosides',
-    'furayhat',
-    'furbelow',
-    'furbisher',
-    'furbishers',
-    'furbo-nairn',
-    'furby/abingdon/oxfordshire',
-    'furby/badbury',
-    'furby/banbury',
-    'furby/berkeley',
     'furby/blackbird',
-    'furby/cheltenham',
-    'furby/chieveley',
-    'furby/didcot',
-    'furby/harwell',
-    'furby/headington/oxford',
-    'furby/henley',
-    'furby/henley-on-thames',
-    'furby/high',
-    'furby/m4',
-    'furby/moreton-in-marsh',
-    'furby/northampton',
-    'furby/old',
-    'furby/raf',
-    'furby/reading',
-    'furby/severn',
     'furby/stansted',
-    'furby/stowe',
-    'furby/teddington',
-    'furby/thame',
-    'furby/upper',
-    'furby/worcester',
-    'furcal',
-    'furcating',
-    'fureenbond',
-    'furent',
-    'fureur',
-    'furgg',
-    'furguson',
-    'furguson-plympton',
-    'furhead',
-    'furhtermore',
     'furiani',
-    'furic',
-    'furihata',
-    'furing',
-    'furious.',
-    'furlanette',
-    'furlers',
-    'furlex',
-    'furlow',
-    'furls',
-    'furms',
-    'furnace-air',
-    'furnace-fashioned',
-    'furnace-heat',
-    'furnace-like',
-    'furnace-masters',
     'furnaceman',
-    'furnad',
-    'furnes',
-    'furni',
-    'furniglas',
-    'furnished-with',
-    'furnishing/decorating',
-    'furnishings0',
-    'furniture-cleaning',
-    'furniture-sculpture',
-    'furniture-vetting',
-    'furniture-window',
-    'furniture/cabinet-making',
-    'furniture/household',
-    'furnitureland',
-    'furnitures',
     'furnival-jones',
-    'furokowa',
-    'furons',
-    'furpuller',
-    'furred-edged',
-    'furricking',
-    'furry-coated',
-    'furry-headed',
-    'furry-looking',
-    'furs/pet',
-    'fursdon',
-    'furskin',
-    'fursland',
-    'furst-rate',
-    'furstenburg',
-    'furstenerius',
     'furtado/north',
-    'furtehr',
-    'further&rehy;again',
-    'further\'',
-    'further-more',
-    'further-out',
-    'further-than',
-    'further.it',
-    'further.mr',
-    'furtherer',
-    'furthermnore',
-    'furthermore-the',
-    'furthest-out',
-    'furtho',
-    'furtive-looking',
-    'furtok',
     'furtw&aacute;ngler',
-    'furtw&auml;ngler/emi',
-    'furu-fashion',
-    'furudism',
-    'furukawa',
-    'furunculosis',
-    'furze-clad',
-    'furze-covered',
-    'furze-cutter',
-    'furze-cutters',
-    'furze-faggot',
-    'furze-tangles',
-    'furzebrook',
-    'furzton',
-    'furzy',
-    'fusas',
     'fusata',
-    'fusato',
-    'fuscata',
-    'fuschlsee',
-    'fuscicollis',
-    'fusco-ferruginous',
-    'fuse-cupboard',
-    'fuse-wire',
-    'fuseable',
-    'fusebox/consumer',
-    'fused&mdash',
-    'fusel',
-    'fuselage-side',
-    'fuselage.',
-    'fuselian',
-    'fuselier',
     'fuselis',
-    'fuses/fitting',
-    'fusewires',
-    'fushe',
-    'fushikida',
-    'fusibility',
-    'fusible',
-    'fusicoccin',
-    'fusicollis',
-    'fusiform',
-    'fusillage',
-    'fusina',
-    'fusion-catalysed',
-    'fusion-generated',
-    'fusion-head',
-    'fusion-like',
     'fusion-safety',
-    'fusion.l',
-    'fusion/electrofusion',
-    'fusionpld',
-    'fusitronic',
-    'fusliza',
-    'fusobacterium',
-    'fusoris',
-    'fussey',
-    'fussiest',
-    'fussily-dressed',
-    'fussin',
-    'fussin\'',
-    'fussings',
-    'fusskn&ouml;chel',
-    'fusspots',
     'fussy\'',
-    'fustes',
-    'fustians',
-    'fustily',
-    'fusty-smelling',
-    'fusuline',
-    'fusulinids',
-    'fusuma',
-    'futaba',
-    'futabase',
-    'futas',
-    'futba-english',
-    'futball',
-    'futballing',
-    'futehr',
-    'futes',
     'futhermore',
-    'futile-seeming',
-    'futo',
-    'futrelle',
-    'futrex',
-    'futtaim-wimpey',
-    'futtermittel',
-    'futtock',
-    'futur',
-    'future&rehy;orientated',
-    'future-directed',
-    'future-oriented',
-    'future-proofed',
-    'future-proofing',
-    'future-sport',
-    'future-tense',
     'future-time',
-    'future-winning',
-    'future-wise',
-    'future.he',
-    'future.it',
-    'future.the',
-    'futurebus+-based',
-    'futurecomms',
-    'futureless',
-    'futures*',
-    'futures-related',
-    'futures.10',
-    'futureshock',
-    'futuresoft',
-    'futurevision',
-    'futurismus',
     'futuriste',
-    'futuristes',
-    'futuristic-looking',
-    'futuristically',
-    'futurities',
-    'futurize',
-    'futurized',
-    'futz',
-    'futzing',
-    'fux',
-    'fuxe',
-    'fuxin',
-    'fuy',
-    'fuyons',
-    'fuzak',
-    'fuzeau-braesch',
     'fuzhi.',
-    'fuzz-guitar',
-    'fuzzack',
-    'fuzzes',
-    'fuzzey',
-    'fuzzier',
-    'fuzzified',
-    'fuzzing',
-    'fuzzweed',
-    'fuzzy-edged',
-    'fuzzy-headed',
-    'fuzzy-matching',
-    'fuzzy-sounding',
-    'fuzzy-thinking',
-    'fuzzy-wuzzy',
-    'fv32l',
     'fvh',
-    'fvl',
-    'fw.kestel',
-    'fw15c',
-    'fw190',
-    'fw190s',
-    'fw200',
-    'fw200c',
-    'fwa',
-    'fwag-lothian',
-    'fwas',
-    'fwd&lsqb;n&rsqb',
-    'fwe',
-    'fweddie',
-    'fwes',
-    'fwiday/',
     'fwighted',
-    'fwk',
-    'fwo',
-    'fwoar',
-    'fwog',
-    'fworr',
-    'fws',
-    'fwuit',
-    'fx&bsol',
-    'fx-75383',
-    'fx-80',
-    'fx-mix',
-    'fx15',
-    'fx17ct',
-    'fx19ct',
-    'fx3720',
     'fx500',
-    'fx500b/fx500',
-    'fx850',
-    'fx85s',
-    'fxd5',
-    'fxe3',
-    'fxe5&verbar&verbar;bxe5&verbar&verbar&verbar&verbar&verbar&verbar',
-    'fxserver',
-    'fxvision',
-    'fy2',
-    'fy6',
-    'fy91',
-    'fyall',
-    'fyba',
-    'fyfe/solicitor',
-    'fyftie',
     'fylands',
-    'fyldes',
-    'fyleman',
-    'fyler',
-    'fylfots',
-    'fylgia',
-    'fyling',
-    'fylke',
-    'fyllo',
-    'fylthe',
-    'fynbos',
-    'fynde',
-    'fyndoune',
-    'fyner',
-    'fynest',
-    'fyneux',
     'fynings',
-    'fynney',
-    'fynnon',
-    'fynsshid',
-    'fyodorovna',
-    'fyourinitials15',
-    'fyrde',
-    'fyre',
-    'fyris',
-    'fyrst',
-    'fyscher',
-    'fyshwick',
-    'fyson',
-    'fyve',
-    'fz572',
-    'fzr4oorr',
     'fzr6oo',
-    'g&aacute;0mini',
-    'g&aacute;lvez',
-    'g&acirc;it&eacute',
-    'g&acirc;teaus',
-    'g&acirc;tinais',
-    'g&agrave;l',
-    'g&amacr;gro',
-    'g&amp',
-    'g&amp;a',
-    'g&amp;j',
-    'g&amp;ts',
-    'g&auml;ngigsten',
-    'g&auml;rtner',
-    'g&auml;starbetare',
-    'g&dollar;1,000',
     'g&dollar;10,000',
-    'g&dollar;101.75',
-    'g&dollar;165',
-    'g&dollar;17,600',
-    'g&dollar;45',
-    'g&dollar;48,000',
-    'g&eacute;ara',
-    'g&eacute;camines',
-    'g&eacute;labert',
-    'g&eacute;n&eacute;ralit&eacute',
-    'g&eacute;n&eacute;ralit&eacute;s',
-    'g&eacute;n&eacute;rique',
-    'g&eacute;n&eacute;tique',
-    'g&eacute;n&eacute;tiques',
-    'g&eacute;ne',
-    'g&eacute;neral',
     'g&eacute;om&eacute;trie',
-    'g&eacute;r&ocirc;me',
-    'g&eacute;rant',
-    'g&eacute;rouville',
-    'g&ecirc;nes',
-    'g&egrave;ant',
-    'g&lsqb;eorge&rsqb',
-    'g&lsqb;o&rsqb',
-    'g&mdash;2',
-    'g&ndash;21a',
-    'g&ndash;32a',
-    'g&ndash;58',
-    'g&ndash;aanm',
-    'g&ndash;aarp',
-    'g&ndash;aauc',
-    'g&ndash;abfa',
     'g&ndash;abuz',
-    'g&ndash;acdc',
-    'g&ndash;acss',
-    'g&ndash;aczp',
-    'g&ndash;aedt',
-    'g&ndash;aezj',
-    'g&ndash;afcz',
-    'g&ndash;affd',
-    'g&ndash;ahkx',
-    'g&ndash;aitb',
-    'g&ndash;aiyr',
-    'g&ndash;ajpl',
-    'g&ndash;akif',
-    'g&ndash;ampp',
-    'g&ndash;anxb',
-    'g&ndash;apwa',
     'g&ndash;are',
-    'g&ndash;ass',
-    'g&ndash;astl',
-    'g&ndash;avil',
-    'g&ndash;awau',
-    'g&ndash;awph',
-    'g&ndash;ayxt',
-    'g&ndash;bcow',
-    'g&ndash;bffs',
-    'g&ndash;bghb',
-    'g&ndash;bghf',
-    'g&ndash;bmkc',
-    'g&ndash;bplh',
-    'g&ndash;brlv',
-    'g&ndash;bsbg',
-    'g&ndash;btbj',
     'g&ndash;btov',
-    'g&ndash;ctlx',
-    'g&ndash;dhcb',
-    'g&ndash;dhzz',
-    'g&ndash;dpit',
-    'g&ndash;flak',
-    'g&ndash;fuga',
-    'g&ndash;hunn',
-    'g&ndash;jest',
-    'g&ndash;luft',
-    'g&ndash;mxiv',
-    'g&ndash;ustav',
-    'g&ndash;viii',
-    'g&oacute;d',
-    'g&oacute;ngora',
-    'g&ouml;ransson',
     'g&ouml;rel',
-    'g&ouml;rg',
-    'g&ouml;rlitz',
-    'g&ouml;rss',
-    'g&ouml;rtz',
-    'g&ouml;rz-gradisca',
-    'g&ouml;sta',
-    'g&ouml;tting',
-    'g&ouml;ttweig',
-    'g&rehy;aznf',
-    'g&rehy;btum',
-    'g&rehy;cramps',
-    'g&sharp;m7&flat;5',
-    'g&ucirc;nter',
-    'g&uuml;ell',
-    'g&uuml;her',
     'g&uuml;iraldes',
-    'g&uuml;ll&uuml;ck',
-    'g&uuml;lluk',
-    'g&uuml;mbet',
-    'g&uuml;ndem',
-    'g&uuml;ndogan',
-    'g&uuml;rses',
-    'g&uuml;rses-halilsoy',
-    'g&uuml;tersloh',
-    'g\'-g\'\'\'',
-    'g\'-i\'',
-    'g\'-related',
-    'g\'ag',
-    'g\'bye',
-    'g\'ford',
-    'g\'rahge',
     'g\'tag',
-    'g(0)',
-    'g(1989)',
-    'g(i)',
-    'g(n\')',
-    'g(p)',
-    'g(rf)',
-    'g(u)',
-    'g**d',
-    'g*e',
-    'g*natural*',
-    'g+',
-    'g-1(b)',
-    'g-160xl',
-    'g-17s',
-    'g-25',
     'g-2500',
-    'g-2t',
-    'g-46',
-    'g-50',
-    'g-6',
-    'g-60',
-    'g-6639',
-    'g-75',
-    'g-9',
-    'g-a-n-d-e-l-l',
-    'g-a-w-n',
-    'g-aazp',
-    'g-abox',
-    'g-acaa/d8084',
-    'g-acdp',
-    'g-acmn',
     'g-acus',
-    'g-adha',
-    'g-adpr',
-    'g-aduv',
-    'g-aebb',
-    'g-aedu',
-    'g-aeeh',
-    'g-aehm',
-    'g-aeim',
-    'g-aevs',
-    'g-affi',
-    'g-ahri',
-    'g-ajrs',
-    'g-ajxl',
-    'g-akby',
-    'g-akfc',
     'g-akir',
-    'g-akpf',
-    'g-akxs',
-    'g-alna',
-    'g-alsa',
-    'g-amgd',
-    'g-amhf',
-    'g-amino',
-    'g-amtd',
-    'g-anlk',
-    'g-apdb',
-    'g-apup',
-    'g-apwa',
-    'g-arfh',
-    'g-argg',
-    'g-arhf',
     'g-aryn',
-    'g-asay',
-    'g-askh',
-    'g-asop',
-    'g-assm',
-    'g-astg',
-    'g-avil',
-    'g-avod',
-    'g-avor',
-    'g-axop',
-    'g-axpg',
-    'g-ayec',
-    'g-aywt',
-    'g-ayxt',
-    'g-bact',
-    'g-band',
     'g-bbfpl',
-    'g-bdxy/xr269',
-    'g-bgau',
-    'g-bipo',
-    'g-bisu',
-    'g-bkdt',
-    'g-bkra',
-    'g-boyz',
-    'g-brbc',
-    'g-brlv',
-    'g-buch',
-    'g-bucj',
-    'g-bucm',
-    'g-budl',
-    'g-bues',
-    'g-buez',
     'g-bulo',
-    'g-bulu',
-    'g-bulv',
-    'g-bum',
-    'g-bumf',
-    'g-bump',
-    'g-buoi',
-    'g-burr',
-    'g-camm',
-    'g-cells',
-    'g-cjci',
-    'g-cramp',
-    'g-ebib.',
-    'g-efte',
-    'g-extr',
-    'g-farce',
     'g-file',
-    'g-g',
-    'g-g-g-g',
-    'g-g-g-g-got',
-    'g-g-going',
-    'g-g-goodness',
-    'g-gave',
-    'g-get',
-    'g-girl',
-    'g-girls',
-    'g-go',
-    'g-got',
-    'g-gwyn',
-    'g-hjss',
-    'g-ivar',
-    'g-ixcc',
     'g-jetn',
-    'g-jetp',
-    'g-jjsg',
-    'g-k',
-    'g-kyak',
-    'g-line.',
-    'g-lizy',
-    'g-loadings',
-    'g-lock',
-    'g-micro',
-    'g-modifications',
-    'g-moul',
-    'g-mydz',
-    'g-o-a-',
-    'g-o-a-a-',
-    'g-o-a-a-a-a-l',
     'g-o-o-o',
-    'g-ojvc',
-    'g-omig',
-    'g-orby',
-    'g-otsw',
-    'g-p',
-    'g-part',
-    'g-pawn',
-    'g-protein-regulated',
-    'g-pt-g',
-    'g-pyrimidine',
-    'g-r-r-r-l-l-l',
-    'g-r-r-r-r-owf',
-    'g-r-r-ruff',
-    'g-reaction',
-    'g-registration',
     'g-residues',
-    'g-rich',
-    'g-seai',
-    'g-seven',
-    'g-show',
-    'g-sized',
-    'g-speed',
-    'g-t-o',
-    'g-taff',
-    'g-thea',
-    'g-to-a',
-    'g-util',
-    'g-values',
-    'g-wako',
-    'g-yelt',
-    'g-z',
     'g.-u',
-    'g.118',
-    'g.20',
-    'g.46&ndash;iv',
-    'g.5',
-    'g.59b',
-    'g.6km/6mls',
-    'g.721',
-    'g.a.a.',
-    'g.a.r.y.',
-    'g.b./ireland',
-    'g.c.c.',
-    'g.c.c.palliser',
-    'g.c.d.',
-    'g.c.e.',
-    'g.c.g',
     'g.c.h',
-    'g.c.m.',
-    'g.c.m.g.',
-    'g.c.s.',
-    'g.c.s.e.s',
-    'g.c.v.o.',
-    'g.d.h.',
-    'g.d.o.',
-    'g.f.e.',
-    'g.f.h.',
-    'g.f.mccleary',
-    'g.g.f.',
-    'g.h.k.',
-    'g.h.o.',
-    'g.harvey',
-    'g.hulland',
     'g.i.e.',
-    'g.i.s.',
-    'g.j.v.',
-    'g.james',
-    'g.johnson',
-    'g.kozik',
-    'g.l',
-    'g.l.a.',
-    'g.l.gabriel',
-    'g.lichteim',
-    'g.ludbrook',
-    'g.m.t',
-    'g.may',
-    'g.moore',
-    'g.n.i.',
-    'g.o.c.',
     'g.old',
-    'g.p.d.',
-    'g.p.i.',
-    'g.pauli',
-    'g.paynes',
-    'g.piperno',
-    'g.prudhoe',
-    'g.q.',
-    'g.r.e.',
-    'g.r.loftus',
-    'g.r.w.',
-    'g.s.d.',
-    'g.s.p.',
-    'g.u.r.u.',
-    'g.u.s.',
-    'g.w.k.',
     'g.w.s.',
-    'g/00/22/2002',
-    'g/00/22/2005',
-    'g/00/22/2005-1',
-    'g/00/23/2117',
-    'g/00/23/2121',
-    'g/00/23/2122',
-    'g/00/23/2159',
-    'g/00/23/2163',
-    'g/00/23/2197',
-    'g/00/23/2211',
-    'g/00/23/2220',
-    'g/00/23/2229',
-    'g/00/23/2239',
-    'g/00/23/2247',
-    'g/00/23/2252',
     'g/00/23/2254',
-    'g/00/23/2259',
-    'g/00/23/2265',
-    'g/00/23/2267',
-    'g/00/23/2269',
-    'g/00/23/2270',
-    'g/00/23/2280',
-    'g/00/23/2290',
-    'g/00/23/2291',
-    'g/00/23/2296',
-    'g/00/23/2299',
-    'g/00/23/2300',
-    'g/00/23/2307',
-    'g/00/23/2309',
-    'g/00/23/2311',
-    'g/00/23/2323',
     'g/00/23/2328',
-    'g/00/23/2334',
-    'g/00/23/2343',
-    'g/00/23/2344',
-    'g/00/23/2345',
-    'g/00/23/2347',
-    'g/00/23/2350',
-    'g/00/23/2353',
-    'g/00/23/2354',
-    'g/00/23/2374',
-    'g/00/23/2393',
-    'g/00/23/2396',
-    'g/00/23/2442',
-    'g/00/23/2457',
-    'g/00/23/2458',
-    'g/00/24/2039',
     'g/00/28/0002',
-    'g/00/29/0003',
-    'g/01/25/0002',
-    'g/01/25/0010',
-    'g/02/28/0004',
-    'g/09/29/0001',
-    'g/1',
-    'g/10/28/0003',
-    'g/13/25/0003',
-    'g/13/25/0005',
-    'g/13/25/0007',
-    'g/13/25/0008',
-    'g/13/25/0009',
-    'g/13/25/0011',
-    'g/13/25/0014',
-    'g/13/25/0015',
     'g/13/25/0016',
-    'g/13/25/0017',
-    'g/13/25/0018',
-    'g/13/25/0020',
-    'g/13/25/0024',
-    'g/280/91/1.ns',
-    'g/70',
-    'g/8765',
-    'g/body',
-    'g/cm',
-    'g/day/kg',
-    'g/e',
-    'g/fab',
-    'g/h',
-    'g/kg/h',
-    'g/kw/hr',
     'g/litre',
-    'g/mg',
-    'g0-like',
-    'g0/g1',
-    'g00dbye',
-    'g01',
-    'g0125003',
-    'g06',
-    'g0sjw',
-    'g1+',
-    'g1/s',
-    'g10-site',
-    'g10-u25',
-    'g109',
-    'g11',
-    'g120',
     'g12t',
-    'g13',
-    'g14mfm',
-    'g160xl',
-    'g179',
-    'g18',
-    'g2.2',
-    'g2/m',
-    'g20',
-    'g21',
-    'g22',
-    'g24',
-    'g241',
-    'g25-sephadex',
-    'g26/m',
-    'g27',
     'g2h1',
-    'g2m',
-    'g2mmc.sys',
-    'g3&ndash;4d',
-    'g3-g2',
-    'g31',
-    'g32',
-    'g3b.',
-    'g3gsr',
-    'g3i',
-    'g3r',
-    'g3t',
-    'g4&verbar&verbar;h5&verbar&verbar;8',
-    'g4-g3',
-    'g4-g6',
-    'g4-g7',
     'g41',
-    'g418-resistance',
-    'g450sci',
-    'g49',
-    'g4m',
-    'g4pc5',
-    'g4r+v',
-    'g5-g4',
-    'g5.4&ndash;1.2',
-    'g500',
-    'g502',
-    'g505',
-    'g510',
-    'g5170',
-    'g520',
-    'g53',
     'g530',
-    'g542x',
-    'g545',
-    'g551s',
-    'g5955c',
-    'g5h8',
-    'g6+',
-    'g60\'s',
-    'g655',
-    'g7+',
-    'g702',
-    'g755',
-    'g76',
-    'g761',
-    'g77',
-    'g8&ndash;1ol',
     'g8-g10',
-    'g8.7&ndash;0.1',
-    'g85e',
-    'g8n1',
-    'g8n2',
-    'g8n3',
-    'g900',
-    'g902',
-    'g939',
-    'g=',
-    'g=0',
-    'g=28.9',
-    'g=foods',
-    'g_',
-    'ga\'g',
-    'ga-300',
     'ga-ee',
-    'ga-lata-saray',
-    'ga:d',
-    'gaaaaaargh',
-    'gaaaatcattctatgtta',
-    'gaaah',
-    'gaalen',
-    'gaan',
-    'gaanin',
-    'gaar',
-    'gaarden',
-    'gaarder',
-    'gaas-based',
-    'gaau',
-    'gab&ouml;r',
-    'gabaergic',
     'gabakt',
-    'gabardines',
-    'gabarek',
-    'gabarit',
-    'gabaston',
-    'gabbard',
-    'gabbi',
-    'gabbia',
-    'gabbiani',
-    'gabbichi',
-    'gabblings',
-    'gabbra',
-    'gabbro-type',
-    'gabcikovo-nagymar&oacute;s',
-    'gabelhorn-wellenkuppe',
-    'gabelhornr',
     'gabelle',
-    'gaberone',
-    'gabexate',
-    'gabion',
-    'gable-centre',
-    'gable-corner',
-    'gable-ended',
-    'gable-figures',
-    'gable-structure',
-    'gable/pillar',
-    'gablerbr&auml;u',
-    'gablestown',
-    'gablet',
-    'gabon*',
-    'gabon-based',
-    'gabonaise',
     'gaborne',
-    'gabr&aacute;n',
-    'gabre',
-    'gabriel-havez',
-    'gabriel-marie',
-    'gabriel-produced',
-    'gabrielis',
-    'gabrielle\'',
-    'gabriol',
-    'gabrlela',
-    'gabszewicz',
-    'gabulowka',
-    'gacatcgataatacgac',
-    'gaced',
-    'gacela',
-    'gache-patin',
     'gaches',
-    'gachui',
-    'gacia',
-    'gacic',
-    'gacy',
-    'gaczyna',
-    'gadabout',
-    'gadabouts',
-    'gadabursi',
-    'gadabursis',
-    'gadade',
-    'gadaffi.',
-    'gadali',
-    'gadalinium',
-    'gadamerian',
-    'gadara',
     'gadaref',
-    'gadd/father',
-    'gadd/music',
-    'gaddam',
-    'gadderin',
-    'gaddesden',
-    'gadelica',
-    'gadenne',
-    'gader',
-    'gades',
-    'gadfa',
-    'gadget&rehy;equipped',
-    'gadget-hungry',
-    'gadget-laden',
-    'gadget-lined',
-    'gadgetco',
     'gadgetwise',
-    'gadgi',
-    'gadhara',
-    'gadir',
-    'gadjiev',
-    'gadmen',
-    'gadney',
-    'gado-gado',
-    'gadocha',
-    'gadoids',
-    'gadong',
-    'gadred',
-    'gadroon',
-    'gadrooned',
-    'gadski',
-    'gadspy',
     'gadsten',
-    'gadus',
-    'gadya',
-    'gaecilius',
-    'gaede',
-    'gaeia',
-    'gaekwad',
-    'gaekwar',
-    'gael-labour',
-    'gael-linn',
-    'gaelectron-volts',
-    'gaelic-english',
-    'gaelic-medium',
-    'gaelic-speaker',
-    'gaelic-speakers',
-    'gaelic/english',
     'gaelicin',
-    'gaeumannomyces',
-    'gafer',
-    'gaff-rigged',
-    'gaffan',
-    'gaffelbitter',
-    'gaffer-to-man',
-    'gaffikin',
-    'gaffing',
-    'gaffon',
-    'gaffuri',
-    'gafsa',
-    'gafyn',
-    'gag-dependent',
-    'gag-heavy',
-    'gag-master',
     'gag-telling',
-    'gaganess',
-    'gagarino',
-    'gagas',
-    'gagatcgagctggaggatccgtacg',
-    'gageby',
-    'gageure',
-    'gagger',
-    'gaggingly',
-    'gaggles',
-    'gaglio',
-    'gagneraient',
-    'gago',
-    'gagol',
-    'gagosian-halley-sonnabend',
-    'gah-gah-gah',
     'gahagan.',
-    'gahr',
-    'gahrr',
-    'gahutu',
-    'gaianists',
-    'gaians',
-    'gaiar',
-    'gaibnazar',
-    'gaibounanou',
-    'gaibounanoutransport',
-    'gaida',
-    'gaidhlig',
-    'gaige',
-    'gailhard',
-    'gaillon',
-    'gailness',
     'gaily-decorated',
-    'gaily-dressed',
-    'gaily-striped',
-    'gain-and-loss',
-    'gain-line',
-    'gain-race',
-    'gain-seeking',
-    'gain-sharing',
-    'gain/a',
-    'gain/crunch',
-    'gainbsborough',
-    'gaineimh',
-    'gaines/flight',
-    'gainest',
-    'gainexposure',
-    'gainey-brown',
     'gainmh',
-    'gainmomentum',
-    'gainotti',
-    'gains/',
-    'gainsborough-ellesmere',
-    'gainsford',
-    'gainsford/speedway',
-    'gainsi',
-    'gainslaw',
-    'gainsthorpe',
-    'gainsville',
-    'gaint',
-    'gaintec',
-    'gaiole',
-    'gair-airt-dinner',
-    'gair-fair-n-indi',
     'gair-tair',
-    'gairbraid',
-    'gairing',
-    'gairland',
-    'gaisburg',
-    'gaiseric',
-    'gaisf',
-    'gaishi',
-    'gaiso',
-    'gaitan',
-    'gaith',
-    'gaithert',
-    'gaitskell-type',
-    'gaivoronsky',
-    'gajabuha',
-    'gajapathi',
     'gajduseking',
-    'gajendra',
-    'gajik',
-    'gajraula',
-    'gakky',
-    'gakonya',
-    'gakria',
-    'gakuin',
-    'gal&egrave;res',
-    'gal-related',
-    'gal.5:17',
-    'gal4-jun',
-    'gal4-max',
-    'gal4-myc',
-    'gal4/creb',
-    'gala-whatever-rice',
     'galabat',
-    'galabeeyah',
-    'galach',
-    'galact',
-    'galacte',
-    'galactica',
-    'galactically',
-    'galactigames',
-    'galactorrhoea',
-    'galactose-inducible',
-    'galactosylq',
-    'galadari',
-    'galadhremmin',
-    'galadine',
-    'galaga',
-    'galagoes',
     'galagorri',
-    'galagy',
-    'galahs',
-    'galai',
-    'galais',
-    'galais.',
-    'galangal',
-    'galani-maragkoudaki',
-    'galanta',
-    'galanterie',
-    'galantes',
-    'galantrie',
-    'galarrwuy',
-    'galat.',
-    'galatai',
-    'galatarasay',
     'galatos',
-    'galatsaray',
-    'galaunt',
-    'galavanting',
-    'galavima',
-    'galaway',
-    'galaxarian',
-    'galaxy-',
-    'galaxy-class',
-    'galaxy-galaxy',
-    'galaxy-swap',
-    'galaxy-wide',
-    'galaxy-with',
-    'galbraithian',
-    'galbstadt',
-    'galby',
     'galc/ba',
-    'galdakano',
-    'gale-',
-    'gale-damage',
-    'gale-force-winds',
-    'gale-jangled',
-    'gale-swept',
-    'gale-thrashed',
-    'gale-torn',
-    'gale-tossed',
-    'gale/protest',
-    'gale/smart',
-    'galeae',
-    'galeatus',
-    'galeb',
-    'galebs',
     'galeforce',
-    'galegate',
-    'galenical',
-    'galenists',
-    'galeobdolon',
-    'galeopsis',
-    'galeote',
-    'galer',
-    'galeras/colombia/south',
-    'galericulata',
-    'galerien',
-    'galeriestrasse',
-    'galerist',
-    'gales-tied',
-    'galesburg',
-    'galeses',
     'galesia',
-    'galeva',
-    'galfredus',
-    'galgudud',
-    'gali',
-    'galica',
-    'galicao',
-    'galiciani',
-    'galil&eacute;e',
-    'galileos',
-    'galinsoga',
-    'galiotti',
-    'galitza',
-    'galitzine',
-    'galivel',
-    'galizien',
     'gall&eacute;es',
-    'gall&eacute;stegui',
-    'gall-bearing',
-    'gall-causing',
-    'gall-curci',
-    'gall-drops',
-    'gall-formers',
-    'gall-hunting',
-    'gall-inducer',
-    'gall.',
-    'gallachio',
-    'gallacio',
-    'gallagherin',
-    'galland/chief',
-    'galland/county',
-    'galland/trading',
     'gallanders',
-    'gallano',
-    'gallansch',
-    'gallant-seeming',
-    'gallapagos',
-    'gallarati-scotti',
-    'gallart',
-    'gallarta',
-    'gallations',
-    'gallbadder',
-    'galleano',
-    'galleasses',
-    'gallegan',
-    'gallenkamp',
-    'galleon-hulled',
-    'galleon-like',
     'gallericcio',
-    'galleriers',
-    'gallert',
-    'gallery-controlled',
-    'gallery-duties',
-    'gallery-goers',
-    'gallery-holder',
-    'gallery-intense',
-    'gallery-owner',
-    'gallery-owners',
-    'gallery-style',
-    'gallery-targeted',
-    'gallery-wide',
-    'gallery.the',
-    'gallery/bookshop/restaurant/bar/cafe',
-    'gallery/dealers',
     'gallesio',
-    'galletas',
-    'galletti',
-    'galley\'',
-    'galley-like',
-    'galley-proof',
-    'galley-slaves',
-    'galley-type',
-    'galleyful',
-    'galleys.',
-    'galli&egrave;ni',
-    'gallian/universities',
-    'galliano-style',
-    'galliard',
-    'galliarden',
-    'gallically',
     'gallican',
-    'gallican-regalist',
-    'gallichan',
-    'gallici',
-    'gallicism',
-    'gallicization',
-    'gallicola',
-    'gallicum',
-    'gallicurn',
-    'gallienus.',
-    'gallimaufrians',
-    'gallimore/auctioneer',
-    'gallino',
-    'gallio-like',
-    'gallion',
-    'gallipagos',
     'gallirallus',
-    'gallivants',
-    'gallix',
-    'gallman',
-    'galloes',
-    'gallon-size',
-    'gallon:of',
-    'gallons/hour',
-    'galloon',
-    'gallopavo',
-    'galloper',
-    'gallopin',
-    'gallovadian',
-    'galloway-type',
-    'galloway.',
-    'gallowglasses',
     'gallows-like',
-    'galls/day',
-    'galluim',
-    'gallup-picked',
-    'gallup/bbc',
-    'gallura',
-    'galluspforte',
-    'gallustrum',
-    'gallway',
-    'gallybeggar',
-    'gallyer',
-    'gallygaskins',
-    'galma-tucker',
-    'galmers',
-    'galmington',
-    'galmoy',
     'galno',
-    'galois/cauchy',
-    'galon',
-    'galops',
-    'galosh-and-windchill',
-    'galowhill',
-    'galozzi',
-    'galq',
-    'galr',
-    'galro',
-    'galswinth',
-    'galtee',
-    'galteland',
-    'galtonia',
-    'galucci',
-    'galuchat',
     'galumphed',
-    'galuna',
-    'galusin',
-    'galusser',
-    'galva',
-    'galvanically',
-    'galvanisation',
-    'galvanised-steel',
-    'galvanizes',
-    'galvannealed',
-    'galvanometers',
-    'galvao',
-    'galwak',
-    'galway-athenry',
-    'galway-based',
-    'galways',
     'galweay',
-    'galwegian',
-    'galwex',
-    'gam-fitc',
-    'gamage/driver',
-    'gamakatsu',
-    'gamala',
-    'gamaletsos',
-    'gaman',
-    'gamar',
-    'gamba/two',
-    'gambaccini.',
-    'gambala',
-    'gamball',
-    'gambare',
-    'gambax',
     'gambella',
-    'gambia-senegal',
-    'gambiae',
-    'gambir',
-    'gambits/topics',
-    'gamble&ndash;de',
-    'gamble-thompson',
-    'gamble.',
-    'gambling-chamber',
-    'gambling-led',
-    'gambling-ring',
-    'gambling-tables',
-    'gamboge-painted',
-    'gambrel',
-    'gambrel-roofed',
-    'gambrell',
     'gambusio',
-    'gambuskenneth',
-    'gambuzzi',
-    'gambwll',
-    'game\'',
-    'game-board',
-    'game-books',
-    'game-boredom',
-    'game-breaking',
-    'game-by-game',
-    'game-by-rote',
-    'game-cock',
-    'game-cockiness',
-    'game-for-a-laugh',
-    'game-forms',
-    'game-hens',
     'game-hunting',
-    'game-keepers',
-    'game-keeping',
-    'game-like',
-    'game-matrix',
-    'game-play',
-    'game-players',
-    'game-preserving',
-    'game-rich',
-    'game-shooting',
-    'game-stealing',
-    'game-theory',
-    'game-tracks',
-    'game-types',
-    'game-wardens',
-    'game-winning',
     'game/',
-    'game:jobs',
-    'gameboards',
-    'gamebook',
-    'gamefish',
-    'gamefowl',
-    'gamegun',
-    'gamekeeping',
-    'gameless',
-    'gamemanship',
-    'gamen',
-    'gameplans',
-    'gamero',
-    'gamerra',
-    'games&ndash',
-    'games-board',
     'games-field',
-    'games-masters',
-    'games-oriented',
-    'games-players',
-    'games-system',
-    'games.in',
-    'games/exercises',
-    'games/quiz',
-    'games_such',
-    'gamesmaker',
-    'gamesplaying',
-    'gamete-intra-fallopian',
-    'gametic',
-    'gametocytes',
-    'gamey-flavoured',
-    'gamgees',
     'gamilla',
-    'gamily',
-    'gamina',
-    'gamines',
-    'gaming-boards',
-    'gaming-house',
-    'gaming-tables',
-    'gamla',
-    'gamlen',
-    'gamleys',
-    'gamlins',
-    'gamma&amp;sup1',
-    'gamma&amp;sup2',
-    'gamma&amp;sup3',
-    'gamma-amino-butyric',
-    'gamma-benzene',
     'gamma-emitting',
-    'gamma-globulin',
-    'gamma-lobe',
-    'gamma-sensitive',
-    'gammagard-treated',
-    'gammages',
-    'gammaglobulin',
-    'gammaglutamyl',
-    'gammaglutamyltransferase',
-    'gamman',
-    'gammascintillation',
-    'gammashire',
-    'gammed',
-    'gammel',
-    'gammelgaard',
-    'gammels',
     'gammer',
-    'gammies',
-    'gammill',
-    'gammimmune-n',
-    'gamming',
-    'gammo-amino',
-    'gammominister',
-    'gammons/mg',
-    'gammurus',
-    'gammy-legged',
-    'gamoche',
-    'gamos',
-    'gampa',
-    'gampaha',
-    'gamph',
-    'gampola',
     'gams',
-    'gamsabhava',
-    'gamson',
-    'gamza',
-    'gan&oacute',
-    'gan&rehy;gardia',
-    'gan**',
-    'gan-gan',
-    'ganadevta.',
-    'ganapathy',
-    'ganaveh',
-    'gance',
-    'ganchev',
-    'ganciclover',
-    'ganconer',
-    'gand&aacute;lfr',
     'gandais',
-    'gandar',
-    'gandells',
-    'gander/branch',
-    'ganderton',
-    'gandhi-diet',
-    'gandhiji',
-    'gandhy',
-    'gandipet',
-    'gandolf',
-    'gandolph',
-    'gandon',
-    'ganduras',
-    'ganeesh',
-    'ganefo',
-    'ganelin',
     'ganelon',
-    'ganesan',
-    'ganeshamoorthy',
-    'gang\'',
-    'gang-bang',
-    'gang-banged',
-    'gang-bangers',
-    'gang-bangs',
-    'gang-bosses',
-    'gang-buster',
-    'gang-chief',
-    'gang-culture',
-    'gang-fight',
-    'gang-girl',
-    'gang-girls',
-    'gang-leadership',
     'gang-like',
-    'gang-lion',
-    'gang-members',
-    'gang-of-lads-from-oldham',
-    'gang-related',
-    'gang-up',
-    'gang-versus-gang',
-    'gang-way',
-    'gang-work',
-    'gang/ion',
-    'gangadeen',
-    'gangadhar',
-    'gangbangers',
-    'gangboys',
-    'gangbuddies',
-    'gangell',
     'ganges-brahmaputra-meghna',
-    'gangin\'',
-    'gangla',
-    'gangland-style',
-    'gangle',
-    'gangli&mdash;msidos',
-    'ganglins',
-    'ganglion-blockers',
-    'ganglion-blocking',
-    'ganglionaris',
-    'ganglionectomy',
-    'ganglionitis',
-    'gangosa',
-    'gangotri',
-    'gangpaths',
-    'gangrels',
     'gangrened',
-    'gangrenosum',
-    'gangridge',
-    'gangry',
-    'gangscum',
-    'gangshow',
-    'gangster-like',
-    'gangster-movie',
-    'gangster-run',
-    'gangster/psycho',
-    'gangsterese',
-    'gangsters/self-made',
-    'gangtypes',
-    'ganguli',
-    'gangways.',
-    'ganhuyag',
     'ganiadau',
-    'ganister',
-    'ganj',
-    'ganji',
-    'ganjo-ji',
-    'ganneke',
-    'gannel',
-    'ganner',
-    'gannet-like',
-    'gannetries',
-    'gannex',
-    'gannexplains',
-    'gannin\'',
-    'gannoc',
-    'gannon/writer',
-    'gannow',
     'ganntakes',
-    'gannutz',
-    'ganny',
-    'ganoid',
-    'ganos',
-    'ganotantrik',
-    'ganouche',
-    'ganow',
-    'ganrantee',
-    'ganrif',
-    'gansch',
-    'ganseys',
-    'ganshof',
-    'gansser',
-    'ganstead',
-    'gant-aided',
     'ganta',
-    'gantenbrink',
-    'ganti&egrave;re',
-    'gantiadi',
-    'gantlet',
-    'gantry-lift',
-    'gantt-cpm',
-    'gantzer',
-    'ganu',
-    'ganzatti',
-    'ganze',
-    'ganzies',
-    'ganzon',
-    'gaobaeb',
-    'gaoithe',
-    'gaol-fees',
     'gaol-fever',
-    'gaol-keeper',
-    'gaoliang',
-    'gaon',
-    'gaou',
-    'gap-hunt',
-    'gap-length',
-    'gap-phase',
-    'gap-ridden',
-    'gap-spacer',
-    'gap-wearing',
-    'gap-weight',
-    'gapdh',
-    'gaperons',
-    'gapers',
-    'gapfillers',
     'gapl',
-    'gappa',
-    'gapper',
-    'gapr',
-    'gapway',
-    'gar&ccedil;ons.',
-    'gar&rehy;vey',
-    'gar.',
-    'garabaousse',
-    'garabedian',
-    'garabondal',
-    'garag&amacr;li',
-    'garage-breaking',
-    'garage-bunting',
-    'garage-cheese',
-    'garage-inclined',
     'garage-less',
-    'garage-owners',
-    'garage-type',
-    'garage.',
-    'garage/caf&eacute',
-    'garage/grunge',
-    'garage_at',
-    'garageland',
-    'garages/petrol',
-    'garajaus',
-    'garaleden',
-    'garallan',
-    'garaman',
-    'garamvolgyi',
-    'garang\'sdinka',
-    'garankuwa',
     'garantie',
-    'garara',
-    'garardo',
-    'garatt',
-    'garavini',
-    'garbacz',
-    'garbade',
-    'garbage-bins',
-    'garbage-collection',
-    'garbage-dispersed',
-    'garbage-disposal',
-    'garbage-dump',
-    'garbagey',
-    'garbaharrey',
-    'garbanzos',
-    'garbarino',
     'garberville',
-    'garbett-edwards',
-    'garbhanach',
-    'garbini',
-    'garbolino',
-    'garbutt/club',
-    'garbyang',
-    'garc&eacute;s',
-    'garc&iacute;adefence',
-    'garces-giraldo',
-    'garchey',
-    'garching-bei-m&uuml;nchen',
-    'garci',
-    'garcia-conway',
-    'garcia-lookalike',
-    'garcias',
     'garcilaso/mestizo',
-    'garcinia',
-    'garcke',
-    'garcons',
-    'gard&eacute',
-    'gardagolf',
-    'gardant',
-    'gardar',
-    'gardavsky',
-    'garde&eacute',
-    'garde-adh&eacute;mar',
-    'garde-manger',
-    'gardee',
-    'garden\'-style',
-    'garden-',
-    'garden-beds',
     'garden-boy',
-    'garden-centre',
-    'garden-conscious',
-    'garden-dried',
-    'garden-festival',
-    'garden-friendly',
-    'garden-gate',
-    'garden-gnome',
-    'garden-landscape',
-    'garden-lovers',
-    'garden-of-eden',
-    'garden-owners',
-    'garden-plot',
-    'garden-railway',
-    'garden-room',
-    'garden-shed',
     'garden-shed-type',
-    'garden-specific',
-    'garden-spray',
-    'garden-the',
-    'garden-tombs',
-    'garden-topped',
-    'garden-wall',
-    'garden.known',
-    'garden/marc',
-    'garden/piano',
-    'garden/sun',
-    'gardencourt',
-    'gardener-next-door',
-    'gardener-rule/british',
-    'gardener/snail',
-    'gardeners/grocers/greengrocers',
     'gardeners/maintenance',
-    'gardenesque',
-    'gardenfax',
-    'gardenhurst',
-    'gardening-basket',
-    'gardening-supply',
-    'gardens.their',
-    'gardens_so',
-    'gardeny',
-    'garderie',
-    'garderobes',
-    'gardiane',
-    'gardie',
-    'gardienne',
-    'gardin',
-    'gardiner/boatman',
     'gardiner/consultant',
-    'gardiner/family',
-    'gardiner/mother',
-    'gardiner/resident',
-    'gardiner/stepfather',
-    'gardiner/tenants',
-    'gardiner/wye',
-    'gardiners',
-    'gardiol',
-    'gardiole',
-    'gardner-medwin',
-    'gardner/nursery',
-    'gardnersville',
-    'gardoe',
-    'gardurey',
-    'gardy-good',
     'gardyloo',
-    'gardyne',
-    'gardyner',
-    'gardynik',
-    'garech',
-    'gared',
-    'gareden',
-    'garefowl',
-    'garel&rehy;jones',
-    'garelli',
-    'gareme',
-    'garent',
-    'garesse',
-    'garet',
-    'gareth/contestant',
-    'garfa',
     'garfield/national',
-    'garfield/reading',
-    'garfields',
-    'garfinkelian',
-    'garg',
-    'garganelli',
-    'gargantuanly',
-    'gargarin',
-    'gargarisms',
-    'gargellen',
-    'garges',
-    'gargetas',
-    'gargi',
-    'gargled-with',
-    'gargouille',
-    'gargoyle-like',
     'gargoyle-ventilated',
-    'gargoyled',
-    'gargunnock',
-    'gariannonum',
-    'garibay',
-    'garibi',
-    'garibondi',
-    'gariella',
-    'gariff',
-    'garigues',
-    'garilao',
-    'garimore',
-    'garimpeiro',
-    'garioch',
-    'garis',
-    'garisenda',
     'garish/colourful',
-    'garishly-lit',
-    'garith',
-    'garland-compton',
-    'garland.',
-    'garland/shop',
-    'garland/thames',
-    'garlande',
-    'garlato',
-    'garlic-and-beer',
-    'garlic-and-cross',
-    'garlic-and-onion',
-    'garlic-covered',
-    'garlic-eaters',
-    'garlic-flavoured',
-    'garlic-gnashing',
     'garlic-like',
-    'garlic-scented',
-    'garlickhithe',
-    'garlieston',
-    'garmain',
-    'garman-klass',
-    'garmanson',
-    'garmany',
-    'garmend&iacute;a',
-    'garment-hook',
-    'garment-sewing',
-    'garment.',
-    'garmentry',
-    'garments.',
-    'garmonchaty',
-    'garmondsway',
     'garmoyle',
-    'garn&rehy;illech',
-    'garn&rehy;wen',
-    'garnacha',
-    'garnade',
-    'garnar',
-    'garnasih',
-    'garnath',
-    'garnations',
-    'garndolbenmaen',
-    'garner/coach',
-    'garner/oxfordshire',
-    'garners',
-    'garnerville',
-    'garnet-bearing',
-    'garnet-edges',
     'garnet-hornblende',
-    'garnet-in',
-    'garnet-red',
-    'garnet-studded',
-    'garnet-tipped',
-    'garnet-work',
-    'garnett-botfield',
-    'garney',
-    'garnie',
-    'garnier-robson',
-    'garnierite',
-    'garnies',
-    'garnikov',
-    'garniture',
-    'garnkirk',
-    'garnock',
     'garoeb',
-    'garofani',
-    'garofolo',
-    'garoghan',
-    'garoteo',
-    'garotta',
-    'garotted',
-    'garoua',
-    'garoupa',
-    'garoupe',
-    'garr&oacute;n',
-    'garrads',
-    'garragan',
-    'garrani',
-    'garrats',
-    'garratt-glassman',
     'garravaghy',
-    'garraway/aylesbury',
-    'garraway/bernwood',
-    'garraway/bicester',
-    'garraway/cheltenham/gloucester',
-    'garraway/cinderford',
-    'garraway/clifton',
-    'garraway/deddington',
-    'garraway/didcot',
-    'garraway/malvern',
-    'garraway/princes',
-    'garraway/pusey',
-    'garraway/sevenhampton',
-    'garraway/swerford',
-    'garraway/tewkesbury',
-    'garreallabus',
     'garreg',
-    'garrels',
-    'garren',
-    'garret&oacute;n',
-    'garretson',
-    'garrett//newton',
-    'garrett/abingdon',
-    'garrett/arncott',
-    'garrett/aylesbury',
-    'garrett/aymestrey',
-    'garrett/belmont',
-    'garrett/birdwood',
-    'garrett/birmingham',
-    'garrett/burford',
-    'garrett/buscot',
-    'garrett/cinderford',
     'garrett/cirencester',
-    'garrett/claydon',
-    'garrett/cumnor',
-    'garrett/dorton',
-    'garrett/eastnor',
-    'garrett/fairford',
-    'garrett/faringdon',
-    'garrett/gloucester',
-    'garrett/guiting',
-    'garrett/hope-under-dinmore',
-    'garrett/horseferry',
-    'garrett/hullavington',
-    'garrett/kelmscott',
-    'garrett/kidlington',
-    'garrett/london',
-    'garrett/moreton',
     'garrett/north',
-    'garrett/nuffield',
-    'garrett/opera',
-    'garrett/silverstone',
-    'garrett/slimbridge',
-    'garrett/southam',
-    'garrett/stoke',
-    'garrett/stroud',
-    'garrett/the',
-    'garrett/uffington',
-    'garrett/watlington',
-    'garrett/wheatley',
-    'garrett/witney',
-    'garrett/woodchester',
-    'garrett/wootton',
-    'garrett/yarnton',
     'garrido',
-    'garrigan',
-    'garrigue-lagrange',
-    'garrincha',
-    'garriock',
-    'garriock/north',
-    'garrison-commander',
-    'garrison-commanders',
-    'garrison-point',
-    'garrle',
-    'garroch',
-    'garrone',
-    'garrould',
-    'garrowen',
-    'garrucha',
-    'garrulus',
     'garsden',
-    'garside-neville',
-    'garsin',
-    'garsington/oxfordshire',
-    'garstangs',
-    'garston-based',
-    'garstone',
-    'gart',
-    'gartain',
-    'gartbreck',
-    'gartell/royal',
-    'garterbelt',
-    'gartering',
-    'garterings',
-    'garth-bwlch',
-    'garthage',
     'garther',
-    'garthewin',
-    'garthmyl',
-    'garthwaite/united',
-    'gartland',
-    'gartmore-led',
-    'gartners',
-    'gartrell',
-    'garuet',
-    'garvald',
-    'garve',
-    'garve-achnasheen',
-    'garvel',
-    'garven',
-    'garver',
-    'garvey/jamaican',
     'garvilo',
-    'garvison',
-    'garways',
-    'gary-i',
-    'garza',
-    'garzetta',
-    'gas&rehy;chambers',
-    'gas&rehy;guzzling',
-    'gas-attack',
-    'gas-blast',
-    'gas-bubbles',
-    'gas-burners',
-    'gas-carrying',
-    'gas-charged',
-    'gas-chromatography/mass',
-    'gas-cloud',
     'gas-clouds',
-    'gas-detection',
-    'gas-engine-driven',
-    'gas-exchange',
-    'gas-f.e.t.s',
-    'gas-flame',
-    'gas-flares',
-    'gas-flaring',
-    'gas-flushed',
-    'gas-furnaces',
-    'gas-generated',
-    'gas-guns',
-    'gas-guzzlers.mike',
-    'gas-handling',
-    'gas-head',
-    'gas-holder',
     'gas-insulated',
-    'gas-jets',
-    'gas-laden',
-    'gas-leakage',
-    'gas-led',
-    'gas-lighting',
-    'gas-lights',
-    'gas-merchant',
-    'gas-monitoring',
-    'gas-output',
-    'gas-peril',
-    'gas-pipe',
-    'gas-pressure',
-    'gas-producing',
-    'gas-prone',
-    'gas-raising',
     'gas-reduction',
-    'gas-sensitive',
-    'gas-separation',
-    'gas-sponsored',
-    'gas-spray',
-    'gas-valve',
-    'gas-versus-coal',
-    'gas-wise',
-    'gas/',
-    'gas/bays',
-    'gas/biogas',
-    'gas/bobby',
-    'gas/diesel',
-    'gas/electric',
-    'gas/liquid',
-    'gas/liquids',
     'gas/oil',
-    'gas20,000',
-    'gasand',
-    'gasboard',
-    'gascape',
-    'gasch',
-    'gasch&eacute',
-    'gaschrom',
-    'gaschromatography',
-    'gaschuggers',
-    'gascoigne-inspired',
-    'gascoigne-style',
-    'gascoigne.',
-    'gascoigne/house',
-    'gascoigne/son',
-    'gascoignes',
     'gascoine.he',
-    'gasconha',
-    'gasdia',
-    'gasele',
-    'gaselees',
-    'gaseosa-selling',
-    'gaseosas',
-    'gaseousions',
-    'gases-and',
-    'gasevski',
-    'gasfired',
-    'gasfires',
-    'gasgcoigne',
-    'gasgoigne',
-    'gasgoine',
-    'gashings',
     'gashow',
-    'gashwiler',
-    'gasication',
-    'gasifier-powered',
-    'gasifier-produced',
-    'gasifying',
-    'gasing',
-    'gasiorowski',
-    'gasipaes',
-    'gasiyev',
-    'gask-pr',
-    'gaskarth',
-    'gaskell/royal',
-    'gasketed',
-    'gaskiya',
-    'gaslee-trained',
     'gasmark',
-    'gasmen',
-    'gasny',
-    'gasoil',
-    'gasoline-powered',
-    'gasoline-soaked',
-    'gasometers',
-    'gasp&eacute',
-    'gasp-inducing',
-    'gasp-provoking',
-    'gasped.',
-    'gasperoni',
-    'gaspin\'',
-    'gasping.',
-    'gass-coh-een',
-    'gass-kern',
     'gassed-out',
-    'gassees',
-    'gassem',
-    'gassen',
-    'gassendus',
-    'gassiem',
-    'gassies',
-    'gassin',
-    'gassin\'',
-    'gassino',
-    'gassiot',
-    'gassmasks',
-    'gassner',
-    'gassons',
-    'gast&oacute;n',
-    'gast-flabbering',
     'gastack',
-    'gastaldo',
-    'gastarbeiters',
-    'gasterophilus',
-    'gasteropod',
-    'gasteropods',
-    'gasterosteus',
-    'gasthauses',
-    'gasthofe',
-    'gastil',
-    'gastly',
-    'gasto-oesophageal',
-    'gastonia',
-    'gastoscophy',
-    'gastp',
-    'gastraophy',
     'gastrc',
-    'gastri',
-    'gastricsin',
-    'gastrinaemia',
-    'gastrinergic',
-    'gastritis/duodenitis',
-    'gastro-enteric',
-    'gastro-enteritic',
-    'gastro-enterologist',
-    'gastro-esophageal',
-    'gastro-nasal',
-    'gastrocholonic',
-    'gastrocnemius',
-    'gastrocolic',
-    'gastroconray',
-    'gastroduodenoscopy',
     'gastroendoscopic',
-    'gastroendoscopy',
-    'gastroenterological/',
-    'gastroferrin\'',
-    'gastrofibrescopic',
-    'gastrografin',
-    'gastroinintestinal',
-    'gastrointestinalmotility',
-    'gastrointestional',
-    'gastrointetinal',
-    'gastrojejunal',
-    'gastrojejunostomy',
-    'gastroliths',
-    'gastromancy',
-    'gastronemius',
-    'gastronom',
     'gastronomic-minded',
-    'gastronomus',
-    'gastronorm-sized',
-    'gastrontestinal',
-    'gastropodic',
-    'gastropods.',
-    'gastroporn',
-    'gastroscopes',
-    'gastroscopically',
-    'gastrostomies',
-    'gastrotechnology',
-    'gastrotrichs',
-    'gastrovascular',
-    'gastrscopic',
-    'gastst&auml;tte',
-    'gastulus',
     'gasunie',
-    'gasworthy',
-    'gat-jin',
-    'gataker',
-    'gataullin',
-    'gatc',
-    'gatc(nnnn)gatc',
-    'gate&ndash;fleetwood',
-    'gate-array-chip',
-    'gate-guard',
-    'gate-houses',
-    'gate-jerking',
-    'gate-legged',
-    'gate-type',
-    'gate-vaulter',
-    'gate-ways',
     'gate/ladder-stiles',
-    'gate/rails',
-    'gate/stile',
-    'gateacre-made',
-    'gateaus',
-    'gateholm',
-    'gatehouse-of-fleet',
-    'gatehouse-pend',
-    'gatehouse/lord',
-    'gatekeeper.dec.com',
-    'gateleg',
-    'gateley',
-    'gately',
-    'gatemoney',
-    'gatens',
-    'gatepiers',
     'gates.',
-    'gates/abt',
-    'gatescarth',
-    'gateshea',
-    'gateshead/',
-    'gateshill',
-    'gatesy',
-    'gatfield.',
-    'gatha',
-    'gather-good',
-    'gathercale',
-    'gathered\'',
-    'gathered-around',
-    'gatherer-hunter',
-    'gatherer/director',
-    'gatheri',
     'gatherin\'',
-    'gathering-a',
-    'gathering-place',
-    'gathering-places',
-    'gathering-point',
-    'gathering-together',
-    'gathering-up',
-    'gathering/reunion',
-    'gatheringsaleh',
-    'gatherley',
-    'gathorne',
-    'gathre',
-    'gati',
-    'gatinara',
-    'gatineau',
-    'gatlin',
     'gatlinburg',
-    'gatlings',
-    'gatorade',
-    'gatorland',
-    'gatot',
-    'gatrigg',
-    'gatsos',
-    'gatt-bashers',
-    'gatt-trade',
-    'gatt-uruguay',
-    'gatta',
-    'gattegno',
-    'gatter',
-    'gattias',
-    'gattina',
-    'gatting-like',
     'gatting/rana',
-    'gatting/shakoor',
-    'gattini',
-    'gattinoni',
-    'gattleton',
-    'gattletons',
-    'gattling',
-    'gattuso',
-    'gatwick&ndash;luxor',
-    'gatwick-athens',
-    'gatwick-lourdes',
-    'gaucci',
-    'gaucelin',
-    'gaucelme',
-    'gaucher',
-    'gauchier',
     'gauchiste',
-    'gauchly',
-    'gaud&iacute',
-    'gaudassinksy',
-    'gaude',
-    'gaudeamus',
-    'gaudeat',
-    'gaudebit',
-    'gaudenzio',
-    'gaudette',
-    'gaudia',
-    'gaudie',
-    'gaudierbrzeska',
-    'gaudieri',
-    'gaudiest',
-    'gaudino',
     'gaudio',
-    'gaudioso',
-    'gaudry',
-    'gauds',
-    'gaudy-covered',
-    'gauffres',
-    'gaugamela',
-    'gauge-line',
-    'gauge/understand',
-    'gaughain',
-    'gaughin',
-    'gaughran',
-    'gaugi',
-    'gauguelin',
-    'gauguin\'',
-    'gauguinesque',
     'gaujo',
-    'gauldie',
-    'gaulle&mdash;adenauer',
-    'gaulle-led',
-    'gaulli',
-    'gaullier',
-    'gaulstone/centre',
-    'gault-brick',
-    'gaulter',
-    'gaultier.',
-    'gaultiere',
-    'gaum',
-    'gauner',
-    'gaungit',
-    'gaunt-eyed',
-    'gaunt-featured',
     'gaunter',
-    'gauntlet-cuffed',
-    'gauntlet-hand',
-    'gauntletts',
-    'gauntly',
-    'gaurdian',
-    'gauri',
-    'gaus',
-    'gauss/weber',
-    'gaussmeter',
-    'gautam',
-    'gautel',
-    'gautier-hion',
-    'gautrait',
-    'gautrey/bursar',
-    'gauvin',
     'gauweiler',
-    'gauze-covered',
-    'gauze-veiled',
-    'gav\'st',
-    'gav-filled',
-    'gavagan',
-    'gavage',
-    'gavarni',
-    'gavazza',
-    'gavazzeni',
-    'gave-out',
-    'gavel-bashing',
-    'gavellers',
-    'gavelling',
-    'gavelocks',
-    'gaventa',
     'gavial',
-    'gavialidae',
-    'gaviao',
-    'gavigan',
-    'gavignano',
-    'gavin/gloucestershire',
-    'gavina',
-    'gavinies',
-    'gaviota',
-    'gavira',
-    'gaviscone',
-    'gaviteer',
-    'gavotta',
-    'gavr',
-    'gavrad',
-    'gavrel',
     'gavriel',
-    'gavrielides',
-    'gavrielle',
-    'gavriels',
-    'gavril',
-    'gavrilpopov',
-    'gavrinis',
-    'gavs',
-    'gavurin',
-    'gawdelpus',
-    'gawdsake',
-    'gawdy',
-    'gawford',
-    'gawkier',
-    'gawkish',
-    'gawkrodger',
     'gawky-limbed',
-    'gawps',
-    'gawron',
-    'gawronik',
-    'gawsworth',
-    'gay&rehy;rosse',
-    'gay\'',
-    'gay-and-happy-to-be-gay',
-    'gay-bashed',
-    'gay-bashers',
-    'gay-bashing',
-    'gay-coloured',
-    'gay-disco',
-    'gay-men',
-    'gay-related',
-    'gay-sex',
     'gay-sympathetic',
-    'gay/but',
-    'gay/capable',
-    'gay/lesbian',
-    'gaybour',
-    'gaybours',
-    'gayda',
-    'gaydom',
-    'gaye/journalist',
-    'gayhurst',
-    'gayi',
-    'gayla',
-    'gaylani',
-    'gaylegphug',
-    'gaylen',
-    'gayler/county',
     'gaylife',
-    'gaymer',
-    'gaynus',
-    'gays-only',
-    'gaythelus',
-    'gaythorpe',
-    'gaytimes',
-    'gayton/northamptonshire',
-    'gaytrick',
-    'gayvid',
-    'gayworld',
-    'gaza-based',
-    'gaza-first',
-    'gazania',
-    'gazdasag',
-    'gaze/glos',
     'gazebo.just',
-    'gazeboes',
-    'gazechim',
-    'gazelle-inhabited',
-    'gazelle-sized',
-    'gazeti',
-    'gazette.',
-    'gazetting',
-    'gazidis',
-    'gazil',
-    'gazing-stock',
-    'gazipur',
-    'gazmere',
-    'gazoro',
-    'gazso',
-    'gazump',
     'gazundering',
-    'gazunti',
-    'gazza-figure',
-    'gazza-grade',
-    'gazza-show',
-    'gazzas',
-    'gazzer.',
-    'gazzie',
-    'gazzo',
-    'gb&ndash;d',
-    'gb-manchester',
-    'gb-plated',
-    'gb20',
-    'gb21wm',
-    'gb2ply',
-    'gb2yia',
     'gb3rs',
-    'gb5owa',
-    'gb75',
-    'gbago',
-    'gbargna',
-    'gbassingbe',
-    'gbbd',
-    'gbbf',
-    'gbd',
-    'gbe-tv',
-    'gbejniet',
-    'gbezera-bria',
-    'gbgb',
-    'gbii',
-    'gbo',
-    'gbos',
     'gbowo',
-    'gbps',
-    'gbq',
-    'gburnage',
-    'gbw-sponsored',
-    'gc-2020',
-    'gc-binding',
-    'gc-ion',
-    'gc-reach',
-    'gc-series',
-    'gc-system',
-    'gc/lc-ms',
-    'gcatgatgaaactcatac',
-    'gcc/ggc',
-    'gcc50',
-    'gccataagtcagctctaattg',
     'gce/gcse',
-    'gces',
-    'gcggatcttgttgacgaccaggg',
-    'gcgtaggcgtcggtgacaaa',
-    'gcgtt',
-    'gcho',
-    'gcol',
-    'gcos6',
-    'gcos7',
-    'gcos8',
-    'gcrs',
-    'gcse&sup1',
-    'gcse-endangered',
-    'gctaccccctagtactgattttattgtcta',
-    'gctttacattccacaatatacatc',
-    'gcu',
     'gd195,000,000',
-    'gd3',
-    'gd552,200,000',
-    'gda&nacute;ska',
-    'gdansk-based',
-    'gdanski',
-    'gddm',
-    'gdi',
-    'gdn',
-    'gdnr',
-    'gdos',
-    'gdp-gtp',
-    'gdp-per-capita',
-    'gdreconint/doc',
-    'gdy',
-    'gdybh',
     'gdynia-ameryka',
-    'gdynia-based',
-    'ge&thorn;r&aelig;c',
-    'ge\'ez',
-    'ge\'neral',
-    'ge-10',
-    'ge-engined',
-    'ge-get',
-    'ge-x',
-    'ge02:huridocs',
-    'ge3t',
-    'ge5.1',
-    'ge58',
-    'ge=management',
-    'geagea-controlled',
-    'geala',
     'geale',
-    'geall',
-    'gealldruig',
-    'geally',
-    'geant',
-    'gear&rehy;stick',
-    'gear-case',
-    'gear-casing',
-    'gear-changes',
-    'gear-changing',
-    'gear-down/flaps-down',
-    'gear-knob',
-    'gear-ratios',
-    'gear-shift',
-    'gear-shifts',
-    'gear-test',
     'gear-trains',
-    'gear-wheels',
-    'gearach',
-    'gearbox-transmission',
-    'gearbox/passenger',
-    'geared-up',
-    'gearing-up',
-    'gears.',
-    'gearset',
-    'geartooth',
-    'gearwheels',
-    'geary/garage',
-    'geary/protestor',
-    'geas',
-    'geataway',
-    'geater',
     'geates',
-    'geaye',
-    'geba',
-    'gebe/',
-    'geben',
-    'geber',
-    'gebers',
-    'gebirge',
-    'gebracht',
-    'gebrecs',
-    'gebruder',
-    'geburs',
-    'geburt',
-    'gec\'s',
-    'gec-alshom',
-    'gec/marconi',
     'gec/plessey',
-    'gecevicius',
-    'gecophone',
-    'gedali',
-    'gedamu',
-    'gedde',
-    'geddle',
-    'gedelier',
-    'gedi',
-    'gediman',
-    'gedimino',
-    'gedir',
-    'gedle-ghiorgis',
-    'gee-gee',
-    'gee-h',
-    'gee-ing',
     'gee-node',
-    'gee-tars',
-    'gee-whizz',
-    'gee-wizz',
-    'gee/distribution',
-    'geebee',
-    'geega',
-    'geegaw',
-    'geehrter',
-    'geekie',
-    'geekish',
-    'geel',
-    'geelmuyden',
-    'geely',
-    'geendet',
-    'geens',
     'geerd',
-    'geerrrahtoffit',
-    'geertgen',
-    'geertruida',
-    'geertsma',
-    'geeses',
-    'geeter',
-    'geetha',
-    'geezer-good',
-    'gef&uuml;ge',
-    'gef&uuml;gekunde',
-    'gef&uuml;hl',
-    'gefangnistor',
-    'gefangnisturm',
-    'gefanil',
-    'gefechtskehrtwendung',
     'geffen/mca',
-    'geffery',
-    'geffner',
-    'geffrye',
-    'gefion',
-    'gegen',
-    'geggie',
-    'geggus',
-    'gegu',
-    'gehabt',
-    'geham-mantel',
-    'gehan-mantel',
-    'gehardt',
-    'gehd',
-    'geheime',
-    'geheimnis',
     'geheimschriifmachine',
-    'gehen',
-    'gehenna',
-    'gehlot',
-    'geho\'quein',
-    'gehring',
-    'gehrls',
-    'gehrman',
-    'geht',
-    'gehts',
-    'geier',
-    'geigenbuhel',
-    'geiger-counter',
-    'geiger-counters',
-    'geikien',
-    'geikies',
     'geilhausen',
-    'geils',
-    'geilsland',
-    'geinitzi',
-    'geisberg',
-    'geiselman',
-    'geissbehler',
-    'geissman',
-    'geiste',
-    'geister',
-    'geisteswissenschaften',
-    'geitel',
-    'gejvall',
-    'gekhakte',
-    'gekkos',
-    'gekommen',
     'gekoski',
-    'gel&eacute;e',
-    'gel-emulsion',
-    'gel-extraction',
-    'gel-filtered',
-    'gel-like',
-    'gel-mobility',
-    'gel-smeared',
-    'gel-sperse',
-    'gel-sprays',
-    'gelam',
-    'gelard',
-    'gelardi',
-    'gelasa',
-    'gelati',
-    'gelatines',
     'gelatinised',
-    'gelatinization',
-    'gelatinize',
-    'gelatinosa',
-    'gelatinous-looking',
-    'gelatinously',
+)
+
+blocks_76 = (
+    '$!k$)tionnaire)%ement#+d&eacute;es$*aci&oacute%(nt-about%!s$!e$*kommission$,ly-cherished$&nesses$!o$%riest$-s-saint-denis%&finans',
+    '#$enau$#tic#&firmed#$geru#&hgtaew#"ic##mon#&otipia#*st&aring;r%$eins#(t-covers$%aines\'#ova\'$roys%*na/collins',
+    '\'!y&(ellatese)"es&!i$&ebuoni%"io&"us%$lles%!m%\'nallato\'"ys%#tte%%yraud$"in&!a',
+    '$$meta$)o-grapher%\'grapher$+s&mdash;but,$they%%tudio$\'vieille\'#lle#!u#%visin#&zville"%oball#%cking#*d&mdash;it%,rehy;seeking',
+    '*\'tasters$!\'$!-%(allergic\'&tering&.nd-agriculture)\'tobacco)$wine%&basket+!s&#ody%(carriers&)onducting((sumption&%risis',
+    ')!s%\'deficit&,istributions%)fetishism&%illed&&lecked&\'or-work%)gatherers&$iver%)handlers.&&erding%&intake%$laws%(obsessed%)packaging',
+    '+!s&$lace&#oor&$rice\'\'ocessor(&ducers+$tion%)rationing&%elief\'#nts\'\'tailing%$safe&\'ecurity\'%eking\'%llers',
+    '\'%rving&&haring&#ong&\'poiling&$tall*!s\'#uff&&ubsidy\'&pplies\'\'rpluses%&taster+!s)#ing&$rain*#ing',
+    '+!s%&warmer&&riters$)/beverage%)chocolate%-drink/tobacco%#emi%\'hygiene%#pub%$rent%$tray$#_of$&botham&#wls$%chain',
+    '(!s$+enthusiasts%"ry$$fare$%grain$%halls&%ndler$$iest%#sts$%lands$&makers&$ster$$pipe$#s\'-%#hip',
+    '&$icks$!y#!f$#les#$iver##ker$\'in\'\'ell#"l\'$\'-gladly%%hardy%)in-christ%\'proofed$\'hardily$)ishnesses$+s&mdash;she',
+    '#0m-hoom-zoom-boom##nky##ood#!p#!r$(d-kelcey%(/teacher$#ler#%stier#,t&rehy;noted*$wall$!\'$%-bath)!s&&inding',
+    '%\'changes&)ontrolled%)fetishist&\'riendly%%holds%(in-mouth%%level&#ine%#man\'#rks%%notes&&umbing%$pace&$edal&#lus',
+    '\'%wered%&racing%%shock*!s\'\'uffling&#log)$gers*#ing&\'moothed&$teps\'#ool($pper\'(retching(#ike&+urveillance',
+    '\'1uching-the-ground%$unit%%valve$%.john%&taller$\'/former%$hand%$toes$!a%"ll$0bal-pub:hoorible\'"l\'()-fan-free**ield-sized*(ollowing',
+    ')&loving))obsessive*#nly)%pitch*&laying)&shaped*$tyle)(watching(#.he(!/)!a)$like(*er-artists+(designed*!.',
+    '*\'s&mdash($ings(%sinto&#ths%$eats&"ll%#oar$&clouts%*ontroller.%#ups$(dragging$&e-wood%!e%"ra&!b',
+    '$.fall-deadening$&guards$&health$\'ie-wise%"tt$&knives$(lamberts%#ets%$ight)"er)\'s-style&#ngs%#ock$%manly&"ts',
+    '(!d((s-either\'#ing$$pack%%edals&"gs%%oints$$ramp%"im%#oom$(servants%$lide&$opes%)oldiering\'"es',
+    '\'%mping&%eered%!y$%valve)!s$$walk\'"ls&%rmers&%shing&*y/cycleway%.ear-as-fashion%$orks%%right$%y-mad##zle',
+    '##ped%"ry$%ishly##rty##tur"(r&amp;am$(eacute;t$(ndash;et$*pound;190m$+rehy;stuart#%\'ards$"t.%"is##-15$!a',
+    '$$five$&graham$8heaven\'s-sake-get-enough$"if%\'nstance$%loops$%money$$ness%\'on-care&!t$"oh$%round$$some$#the%&rouble',
+    '%#ith#+.discussion$$glyn$!i$)treatment#)/actively$(dreading$\'meeting$$sinn#$1992#$3ete#)_anything%$part%!s$\'er_ever',
+    '\'$good%$ver.$(for_ever$$less$7the_,_for_the_most_part##ain&!e$(menifera%&inifer+,-nannofossil+"al%!s$#tom$$ying#$bach',
+    '%-r/association&!t%&s-adam\'(hamilton\')robertson&$ganj&!i\'!i$%idder\'$ings$$o-cp&*kingfisher%"rn\'!e$"ra',
+    '$!s$%undet%"oy$"ye#!c$\'alquier%$sted\'!s$,e&rehy;based+\'feeding%#(s)%+-circulated\'*ontrolling&#dry&&fields',
+    '&,of-mortality&$push&$skin\'$teve&&taught\'"en\')hroughout\'&rained&$wall\'#ide&$xxxx%%/area&*retirement&\'viscous%"18',
+    '%$ball%*cancelling%-d&rehy;labour&&-draft\'&labour\'$open%#fed&%ields&*ul-looking()ly-worded(%ness.%#ps.%!r%+s&mdash;his&!-',
+    '\')territory&$4990$#haz%#eim%&hammer%$ondt$%ibly\'%(llo-rose%"n\'&(g-ground(%house(-into-friction$!k$"us#*d-approved',
+    '%#end%&funded%$john%%owned%\'powered%%speak&$tyle%#usa%"vv\'#/iv$*/berkshire%)chevrolet%&father%)playgroup%/weather-watcher',
+    '%!l$"ie$#lea&#gal$$neuk&*y-mccumber$$rive$%stown$$tran#,e&rehy;bears*%court*&runner**seeability*\'thought$$\'ead',
+    '&"rc\'"ms%$bear%\'casting%&finger%&ground+"ed%$hall&$eads&%ooves%)knowledge\'%uckle%#leg&#imb%$part',
+    '%%reach%%shore)%tened%#tex&&hought%%words$!/$#ach%+rm-smashing$(bearance(#ers%%rains%$ulge$-casters-about%"ed',
+    '$$deep%#une$%fated&%ulted%#end%#ist%$oot.&#rth%\'ronting$%gated%#ger%#oes%#rip&\'ounded\'*$ings',
+    '$\'halyard&!m&#tch%/ead-furrowingly)$hair\'"rd$$ign-((accented)$rmed(&backed)$uilt($debt*(sk-clerk)(ominated(,manufactured',
+    ')$oney(*operations(-policy-making)\'roduced(%ruled*!n((speaking(\'tourist)\'raining\'-/non-national\'"74\'*er-baiting*&hating)#s.i\'%owned',
+    '$!l%#ady%#ine%"le%,ock-touching$"ma&"rk(!s&&sthand%!r$\'name(s)(!.%"ce%!s$#paw',
+    '&"ke(!n%%cored%$heet%\'ightful)!s%)t&mdash;a-"it-"to&!\'&!-\'$area\'\'burning\'\'covered\'*destroying',
+    '\'$edge\'$fire(#ree)%inged\'*harvesting\'$land(#ike)\'verpool(%oving\'&ranger(#ich\'%sized(%teppe\'%trees&,.enthusiasts',
+    '&#age\'!l\'&rehege(#ius\'$stes\'$tion&!e\'"r/)#the("s.)#hip&(i&egrave\'#ere&$rial\',y&mdash;they',
+    '&,s&mdash;five\')--account))including&!y$(tellable&%scues$%vahhh%+er-changing(#ish(%never\'$ness%$ille$&warded%$ings%$ords',
+    '#!f$#ait%\'r/actor$#ett$&icatus##gac%&ndenny%!t%$vest%"ys$\'e-fires%#eve%,ry-detection%\'t&mdash\',rehy;me-nots',
+    '\'\'me-knot.!s\'$what&"ta\'"en(!r\')ing-place$"ie%!t%%vably&%eably\'"n.()ess/mercy,.reconciliation+"es',
+    '%"tt\'&en-man*$that)!.)$ness&"yn#,improvements$!o$!s%"ta#"k\'$%-hand%\'impaled%&shaped$!.',
+    '$%hurst$$ing.\'!s$+lift-loader#(l&iacute&%grave$"ag$#osa%"yn#$m&gt%,lsqb;ed&rsqb%(mdash;if%\'rehy;up$)-building%\'content',
+    '\'%itics%&filler+!s\'%tting&&ocused%*generating&$iver%*mistresses%\'plastic\'*us-meaning%$room%&tables&&eacher$".l%$with',
+    '%$c.v.&&ontent%&injury%&matter%%style$*al-grammar\'(informal("ty\'*legalistic\'%stage(5ummer-outfit-with-hat&.dehyde-agarose-%based-$free,(/agarose',
+    '\'+hyde-acetic&!e&(in-based)%fixed(!/\'0st/structuralist)&ically\'%ties.+./documentation("y.),/informality**politeness\'\'zations&)ly-biased))forbidden',
+    '%&mide-5)(/agarose%#nby%\'station%&t-like\'$type&#eur&\'ion.the)\'/emploi*%ozone*$side)$s-in&$wise%#zon$%board',
+    '$#eau%$d-up%$lles%\'ntation%+r-communist\'(jugoslav\'#may&(/liberal&#ley\'*y-forested)&gilded%!z$)ica-faced\'"/b\'&riidae',
+    '("um\'$ting)"on%-dable-as-ever+*formidable%$ello%#gal%$nant&*g/storming\'!s%!s$$link$#ore&$ians%%sanus',
+    '%!s$,s&mdash;most%)-cheerful&&driver%".i%!/&,black-stoled&\'letters&#two%$tone$$ula\'\',-apportioned(&driven(&funded($like',
+    ')&tories*#yle\'!.\'(risation\'%table($ion.$*var-coated$%watch$3yl-leucyl-methionyl\'?methionyl-leucyl-phenyl-alanine>\'alanine9&roline#!n$$acis%"ia',
+    '%#zzo$$cast$#ebu$#ham$&icated($ions(#ory%!x##oed#$post#%rader%#gne%!i$#ell%!n',
+    '(%chief\'"ah\'&erhill\'!s$%inter%$stal$#rce$"um$#yan#0s/repeats/gosubs$%aketh&"yn%!w$&chungs*--gesellschaft',
+    '*,gemeinschaft*\'zentrum$%eeing%"th$#ham\'7ebalaamthoufoolishclown$(ightness$$lind$$shey%#man%$trom$!t%\'er-like()nietzsche)$yham',
+    '\'\'esheigh+!y\'$iana\'$shey%$haus%#ich$$wore$$ytes&$hia.#(t&eacute%&iacute%+ndash;first%(uacute;n$#-da%$lamy',
+    '$#ana%!r$+e(amersham)%&-epice&%owned%#ans%$nded%&pianos%&rishey&"re&$sley%$sque%#tsa$"h\'%(-rightly',
+    '%$come(#img%!e%#red\'"ve&%ising%!s%%w-ith$!i%%crete%!e&)s/fifties%\'fcation&\'icantes)&tions.',
+    '&$yin\'%"ni&!o%&ssimos)"us%$tion&0ude-in-adversity)!s$!n%(ight-off+!n)*ly/monthly,&weekly$!o$&ran-90',
+    '\'#90d%-ess&rehy;like(\'-cities)#den)$farm)&shrine)\'walling*\'indowed("ed&!y%"ia%%yshey$(schritte$!u%"in',
+    '%(n&eacute&#ado\'%gasse\'!m\'#te.)#ly.)!s&)e-hunters(\'seekers,#ing(+teller-once\'\'tellers+#ing%*yn/o\'brien$4y&rehy;four-year-old',
+    '.)-year-old%$-bed\'!y&.eight-year-old&*fags-a-day\'*ive-gallon+&seater-$cond*#ish\'#old(\'ot-long(!r(\'ur-hour&&gallon&&member',
+    '*(-an-hour+$long&&niners&(one-mile&%piece(&llared\'#lus&$rung&.seven-year-old+"th\'\'hilling\'\'ix-inch*$mile\'%torey&(thousand',
+    '\'"on&)year-olds%!.&$four%&/fifty%%eight%&fivish&%ooter%,one-fortyone%*somethings#/um&mdash;merged%)-basilica%)/alliance&)democracy\'%orset',
+    '&!.$&shagen#!w$1ard&mdash;looking(%ndash\')-backward((currency+$ving()defensive*(ployment)\'rooping(&flying)&orward(%going(&heated',
+    ')#ine(\'planned)(roducing(&thrust(\'voltage\'$.new\'(/futures(#m13\'#_at\'/er-consolidator\'/s-and-backwards(%/back(#ing#$yewe#!z',
+    '$\'related#%broke#$dick#!e#%foros&"us#$gate#!h#!i##ker#$mire#3s&eacute;-aux-loups$%/jane$#ano&!y',
+    '$"ed%"tt%"y.$!i%"er%\'l-based\')encrusted\'%fired\'&hunter\'$like&"ed\'!s&)is&eacute($able("es',
+    '(!t\'#zes%#way$%lands$(om-brone#,ter&rehy;ing&%-care(\'hildren\'$rowe\'$sons&!/\'(children\')executive\'%frank\')secretary',
+    '&#age&$care&$iana&&mother\'"um$&on/raf"#tev##her&-ington-smythe##ini#&o-tele$&archiv$\'gallery%%ra\'fi$$lito',
+    '$%touch#$ting"$uard##car%\'uldians\'$tian$$hier#*ett&euml;s#)ga-flying%!r&"ds$&ht-off(#ver&"en$#ner',
+    '$!r#"ke$#har#(l&eacute%,rehy;mouthed*\'weather$&-faced&#ree%&hooked%&minded%(smellimg%\'weather&%orded$*/sub-human(%human',
+    '$&bridge$#ger$$ing\'$+kes/brother(&mother(*stepfather()wiltshire$!l$#que$%ridge$$some#&makoye##nd\'%\'-object%"/a',
+    '%#_as&$each&"in%6ation&rehy;plus-option*!\'*+-and-powder+%based+%dates+8laying/context-dependent+&traces+$wear*$.sir*(/modular*"er*$less',
+    '%!e&&d:1963*"74+!5&+r-architect((chairman)(onductor*(uncillor(&editor()secretary)&ponsor\'!/(\'charter()foundress%)ing-abbot',
+    ')%place%#rax&%esses&\'y-women\'#man$!f$!r$%tain\'(%-like)%nymph)$side()/cotswold)$glos)1waterfall/venturi($dale',
+    ')\'/parent)%bleau($hall("s-*%abbot/"ts)!.#&orteen#)qu&eacute%1ier&rehy;tinville#*r&eacute;e%%mdash*+;generation+"of%)ndash;car',
+    '*\'engined*$goal*$inch*&minute*&poster*&seater0!s*&thirty*&volume*$year$!\'$"-0%"10%%album\'!e',
+    '\')ternative&0nd-a-half-minute1$onth0%story+,quarter-mile\'$gled&"rm("ed\'!t&%spect&#xle%&badged\'#lls\'"nd\'$rred',
+    '(!t)%-line&$irth\'!t&#oat\'!x&&y-four((two-inch\'"te%#cam\'!n\'$rbon(%riage&%elled&(haracter',
+    ')!r("rd&$lass(#use&)oordinate\',rner-towered+"ed&%rewed&%utter&$ycle%$date&#eck&#isc\'&vision&%rawer',
+    '&\'lectron(.ven-forty-four%&feeder(.t-seven-inches&$ifty\'&ngered\'"sh\'$ve-o&#ont\'\'ot-deep*$high*$nine*$wide)!s)$wide',
+    '("ce(\'ty-five&$rame%$girl&#ore&!p&"un%%helix&#orn\'#use&+undred-foot-$year,#ths%$idea&\'n-hands',
+    '(+the-morning\'\'ch-high*$wide)#ers&"sh%#jet%)kilometre%&lapper&%eaved\'"gs\'&ttered&%imbed&$obed\'"ve&!p',
+    '*!r&%etres&(ile-long)!s(!k&$odel(#ule\'%nthly&%useum%&ninety&#ode%(of-akind&&h-five&+n-the-floor\'&e-four',
+    '&$unce&\'ver-par%%packs\'#ger\'#nel*#led\'$rter\'\'ssenger&%eltae\'!n\'.ople-and-a-dog&$late)$form\'(us-three*$zero',
+    '&&ointed\'%rtion\'&sition((ta-jelly)$ered\'!t&$robe&%utted%$rail\'#yed&%ecord&%ibbon&#oll%&screen&%eason',
+    '(%tence&$haft\'#eet\'"ip&"ix&&lotted&&potted&\'quadron).re-to-the-wind&$tate\'#ing\'%oried\'$ring+"ed($okes',
+    '&$here\')irty-five\'#ree&%iered\'\'mes-two+#wed&(o-eleven()five-fold-"on(%three)"wo\'"ed\'#nne*"rs&&racker',
+    '&\'wo-four%&under-\'"it&!p&!s%(velocity\'$ssel%\'walling\'"ys&\'eek-old)&s-plus\'"ll\'"re&*heel-steer&#ing',
+    '%$yard&,ear&rehy;old)!-*$long*)old-twins)!s$$.but$%/four$%blade$$cade%%olour$$door%&ranier$(e-footed%!s',
+    '$%fold.($ness%$ront$*ier-bessel\'#ist$&letter$#man%!e&"nt%\'illante%#ost$"na%$eaux&!l%+ierinterior',
+    '&!t$/pence-halfpenny)#/by%&osters$$rier$\'stacker\'"rs&$orey$"te&!e\'1n&ndash;fifteenth(!-)%and-a)$days)$fold',
+    ')#ish*#tem))kilometre))month-old)%piece)*sixteenths*$tone+$rong("/a)(eighteen(/th&rehy;century**-fifteenth&!n%+h&mdash;see&(-biggest',
+    '\'+dimensional\'\'fastest\'\'innings\'*preference\'%rated(&ounder\'\'session($tage\'%third(\'o-fifth&!e%"ie%"ly%&y-four$%wagon',
+    '%$heel)#ers%$inds#!s$$ands$#sas#!t$!a%#ine$"ch$"ez$"ou#!x",veal-central%"ta',
+    '"+ward-moving&"ed#"el$!r#!k$"es#\'l-flesh%#pip%"up$*e/abingdon&\'banbury\'\'roadway)%myard&(charlton((eltenham',
+    '&*gloucester&(hereford\'#olt&\'kingsey&&london\'%udlow&&milton&\'newport\'*orthampton&*shenington\'&tanton(#oke&\'warndon%*r/imperial\'+mountaineer',
+    '$$ings$&sheugh##nes$2hope/herefordshire"0x&rehy;movietone#&-bites%$rown$/clinch/woolsack%#ore&$vers$&davies%&umping$\'haunted$)movietone$\'reeking',
+    '%#rot(!s%!v%#ype#\'/author$%foxes$$hunt$&oxford$&scheme%%heehy##all$!m$\'npelico#%base+#%combe',
+    '#$fire#+glove-bells)$like(!d##ham$3ead-and-riding-crop$5ill/swindon/wiltshire\'!s$$ouse##ite#$line#)pro-based#$tail$#ech$-on-willoughby',
+    '$$oods#\'y-faced"$ynes##son$$ters"$zard#%ziwig!.p&mdash;people*\'rogress#2ouml&mdash;liberal"#-25##777#"ph"!1#!0',
+    '""92#!5"#=pp"!b"#eak"!j""lc"$mr-a"!o"#sas"!u"!v!#qlk"!p!/r&auml;nkischer',
+    '#+eacute;maux+&issant*+quentations*#rot*%sages*$zier$\'circ;le#)iacute;ge#*oacute;da/--fr&oacute;thi,!n$)slash;ken$*uml;liches#)uuml;chte(!h',
+    '))lingslied2"er.)sehnsucht)$zeit"&.19152#"4s#!5#!9#"is#!r#%xviii"&10,000$"0m##2.5##3.5',
+    '#!m"#3.6%!m#*00,000,000#\'20/acre##50m"!5##9.9"&6.18bn$#5bn#"00#\'182/921#"50""70"&800/ha',
+    '"#=rf",a&ncedil;ois$)uuml;lein#!\'#$acht#&bjous.#&c-ture$(astorius$#ced$"ht$&kowiak$!s$%tally\'+s&mdash;can%*ion-ridden',
+    '*\'ly_away)"te*#ing\'&usness%#ual&)re-hosted$(xillians#$ddam$#ley$!u#%gance&"es%#ria$$eria$$ging',
+    '&)e-shelled(*x-syndrome\'"ly&%ities$.ment&mdash;the((-bearing)&length*#ike(+a&rehy;tion)#lly)&riness(!e$&rance.)\'sshould\'!g',
+    '#"hm#)il-hulled&&leaved&(spirited&%tubed%#ity$&ssinet#+k/defendant$"es$$tion#"ll#\'m-based%*compatible$\'e(1984)&"s)',
+    '&\'advance&$bags\'!y&%cages&$hold&&leaned\'#ike&%rates&#ups&\'winning%#.as%"/2&#the%#bus%$hold',
+    '%%shift&$mith%-work-knitters*$will)*/direction$$ings\'#ton$!p%-ton/wiltshire$$work#,n&ccedil;aix,#ise.#que,*ois-thomas/"es',
+    '$"as$(c-german%"a.%+e&mdash;the-#upf&!\'&(-afrique\'%based\'-dawson/sickle\'%franc\'*in-algeria*&europe(#raq\'(libertes\'5r&eacute;union-avenir',
+    '\'5t&eacute;l&eacute;com\'$unie*#ted&!.\'"13(!5\'#clp\')president\'%tolly\'$when&*/1987/cert\'&estate\')meditator\'(piedmont\'$west',
+    '&#sae\'#ca.)#tti($hild(\'o-maria)"li\'!i&#tti%!h&&-lynch&%ement\'#sca\'!t\'%ville&$isal',
+    ')\'-holder.#ing*%style&"ot%(ia-based\'!e&&nstein&#one\'"se&*s-designed(\'mullins\'(/provost($taxi($vale\'%canas',
+    ')!s(!i(<o&ndash;monterey&ndash;santa\'"es\'*kanerplatz%(k-condon&!e&#ian%"ly%/o&mdash;italian&!-\',agricultural()ustralian,#ian\'%belge',
+    '(*ritannique((ulgarian\'(canadian\')espaffola(\'uropean\'(gabonese\'%huron\')iranienne)#ish()talianate\'&libyan\'&norman\'(romanian(%ussia\'%swiss',
+    '\'"us\'(vietminh&#/sp&&french&)is-dufour)&poncet)&thomas)&xavier&$lini&#mbe\'+e/co-author&!n\'$ians&&phobes)#nie',
+    '&!s&#urt%+s-bateliers&!.&$isco$#don%#sen$"ek%!y$$furt$&goulis%%rance$$holz$#ics%$szek',
+    '$"ja&)transport$,k&euml/rollo%%-read&%wolfe%)/princess%"au%-el/consultant&"na\'$bury\'&hausen\'.stein-inspired,#ian&!s%$fort',
+    '0%-oder*$born**london-new*\'on-oder)%/main)+er-coloured%#ies%%lains\'#nds&"ey&!i\'!m\')n-engined(*/economist)&farmer',
+    ')"tv(!g("ic(&labour&*y&mdash;no\'!.%&mobile%!o&&furtia&$pani&$vich("ts\'"sk%%prime%$son.',
+    '%#urt$$oise$%scico\'#sca)!o%$eria%#ham%#man%*o&ecirc;ze$!t%&ic-mad\'!.%*sa-iosepha%"z\'&$usov',
+    '&%ernst&$paul%$blau%#ini&)skanische%%josef%"ke%#oni%!y#!p$!p%\'&eacute%#art##sch%#ina',
+    '%"r\'&(-english\'/french-abrahams\'(williams&!.&%/aged\'/chairman/ardley)#ief\'*exhibition\'\'petites\'$shop&$bugh()rgh-based+$/new$!h',
+    '$\'sinelli\'!o$%yniuk##tch$/ernally-invaded\'$ised($tate)"y.$*i-designed%"ni$$mund$"ri&!s##ud\'%(-busters',
+    '\'(esistant&\'tainted%$.the%!e&$ntly%+u&rehy;lent&&lantly\'#end%%watch$"en&$bund&$feid&*kulturhaus&6zimmer-gesprach-spiele$%ghage',
+    '$$line$$mann\'$ster#\'vashis.#"xi%)lly-style%"no#*y/ordinand%&thames$"ne$$sses#&zczack$"ee&!r%#nan',
+    '$"il&$lian""c1#$2297#%koski#"og#\'quently##sed"-eak-of-nature%(/channel%%azoid%%iness&"sm%$niks%#out',
+    '%)y-looking$&listic$$thby#+chen-bachem&#tte$.kle-destroying)%usted(%nosed\'$face$"on$!s#"d\'$"a-%(/rebecca$$bear',
+    '%$iano&"e.\'$land$$eman%&nsborg%%rheim&$ica.($kson)$town(#ton\'"ke(,sen/nielsson)#son)#ted*$raat',
+    '$!i$"ly$$onna%!r$$rica\'!i\'%ksson&$ksen$#son#)e&gt;nine%\'lt;nine%*mdash;your%,rehy;flowing*\'running$"\'\'',
+    '$#(0)%*p)&formula%2q)&formula;free(r)$$-arm&*s-the-wind\'#set(&ociate%$base)!d)"rs(!s&#low)!n&(orrowing\'#und',
+    '&\'limbing&)onvection%\'drained\'$inks%&energy%%fatty&%ights&$loat*\'ingness&(or-all-a,//do-it-yourself)$life($ming&%rench\'+om-rhetoric',
+    '%\'grazing\'#own%&handed&&olders%+improvising%$jazz)"er%\'lancers*!s&%overs%1market-orientated,-to-liberation+#ism\'%sonry&$etre',
+    '&$lace%(radicals\'!n&"un%)schoolers\'\'rolling&%haped&%oloed&\'parring\'$eech\'$irit&%tream+#ing(%iding\'%ylers',
+    '%*the-market\'\'reshing&#ime&&urning%%verse%&wheels&*ith-petrol$!.%(floating%#the$$/bad%(national%\'private$&basing%#ird',
+    '$$call%!e%(hurchman%&limbed*!r$$d-up%\'.driver%+men-reliefs%#om-((fighting()of-speech(#the)&o-roam\'%:just\'!e',
+    '\'&seeker%$rone%%women%!y$"ee$\'fallers$4holder&rehy;heritors($ings$#ish$$jack$!k%$icks$!l%0ance/contractual*-self-employed',
+    '(!s%%iving%\'y-about(&dopted((vailable\'+convertible\'\'elected(\'xisting\'(floating\'%given\'&worked$"ma&)n-encoded\'!.\'(/banbury',
+    '(2ex-gloucestershire(%first((historic()neighbour\'*tle/talbot*!s&&sonary)$ries%"ed$!n%!d&!s%#ess$&person*!s',
+    '$(r-handed&(standing%&anging%!s$$s-up%(choolers%*ia-scented%)t-flowing&$ream$\'thinker%&rading$#was&#ter%\'heelin\'+#gly',
+    ')!s$!z%%ailah%,e&rehy;frame&&-ahead\'%flame(\'racture*$ming\'&marked+#ing\'$out.\'(to-sepia&%brand&$mark&\'r-proof',
+    '%(ing-cold)"in)%plant#$gona%"so#$hold#1iburg-im-breisgau$"da%$rich$"es$&felder%#rau$,ght-carrying(*forwarders(\'station',
+    '\'&/cargo($mail\'%1,650\'$cars($heck\'&liners\'\'vehicle\'$ways$*heitsucher$$lach$&macher&,urer-kantate%-ut/kurpiewski$$nkel$$rean',
+    '$#ser%#ian&2nnig-demokratische*!e%&taaten$%tases%*heitsucher$%xinet$#zes#"ja$#upo#*ke/company#"ly#(mdenpass&!r',
+    '&$gton$#lin$#ond&\'t-smith$.skrittspartiet$#und#"n\'$!a%%traca$#ces%/h&ndash;spanish\'-rehy;cultured&!\'&)-accented((ffilated',
+    '()ustralian\'\'belgian(#red)&okered\'-ch&acirc;teau)%inese(&ockney(&reated\'(egyptian(*stablished(\'uropean\'\'fashion(\'inanced((lavoured(&oreign',
+    '\'%greek\'&indian)%haled($rish(&talian.(-russian\'\'letters)&xified\',manufactured\'(occupied(#nly\'0provincial-style((ublished\'(romanian\'&soviet',
+    ')%eaker((upported($wiss\'(tailored\'"us\'&window&\'/allied\'(business\'&farmer\'+german/etc.\'\'italian\'&letter\'"mp\'.spanish/german)&eaking',
+    '&"ed\'!r&&ifiers\'"ng&"ly&#soc$#des%"ly%!o$#esi%*tic-indeed)%slack$!k$&loudji$"ni',
+    '%#zen$#zee%&y-wise&#ing#"qu%#ecy&#nce($ies.(1y&times;amplitude))-adjusted+$gile*&counts*\'hopping*\'locking**multiplied',
+    '*,shift-keying+\'pecific+$weep-"pt*+temperature)$.the))/duration\'0t&ndash;unctions(\'-update(%ation+"ve(#ial(+ly&mdash;it*&-cited+)expressed',
+    '+\'invoked+)mentioned+)neglected+(reported-\'quested+\'several#(sco-like\'(painting$"el$-h&rehy;shaved%1-air-and-exercise\')s-you-are&&baked.($thed\'#orn',
+    '\'&heeked\'\'oloured(*mplexioned&#dug\'#yed&&fallen\'#ood&%green++-shootiness&&killed&&landed&&picked&\'roasted&&turned&"up',
+    '%#air%%brook%%ened.\'!s&*st-tasting%)ly-brewed*$oken(\'churned)%oated*$oked)&ropped*%ushed)"ut()delivered)"ug',
+    '(&fallen)$ried((gathered)%rated((hardened+%rowed)"it(&ironed()laundered)%eaved)"it($made)#own(%oiled(\'painted',
+    '((restored((scrubbed)*laughtered*$iced)&tamped(&weeded%$pack%,water-logged*\'/marine$#ian$#kin%!o$"ne$&sgasse#3t&iacute;l&iacute;n',
+    '%\'dressed%)insertion%%slots%$wire&#ork$&boards$%herne$%ilin\'$&tingly$&worked$!y#)ud-darwin&$like%,en-aquarelle\'$thal',
+    '&"en$!e$#ler$-ndschaftsbild##vel##wen#\'y/tring$$berg(!i$%cinet)!i$#dis$#ers$"ja$"le',
+    '$"ne$-st&auml;dtler$)tag11,000#$zeli$%zeria"!f#"ps"%g-led#!s"+i&ndash;mon*#sun#$-sat##:b1#&alator$%ndise',
+    '$+r&rehy;duke%%-bird&$tuck%!.%\'y-owned$$unds#-bbins/assault%$ling%$ulus$%ourgo#$case$#hot$$kin\'$+tion-driven)&heated',
+    '##das%)y-evening\'\'nighter.!s&#.it&$/kim&#men&"s.$#ean%!e%!h$#ge-\'$door\'(freezers\'$like',
+    '&!n$&ikrkas$$tjof#*ed-chicken&$fish&"up%)el-crafts&$mann&\'nsallee(#tag\'$thal&%ricke&!s&$wald%$helm',
+    '%*man-phelps(&/peter(#ian%%reich&)ich-ebert*+ludwig-jahn)%sdorf*&gracht*%platz*$tadt+%halii+/rasse-leipziger$$ling$!m$"n\'',
+    '&+-cum-mentor\'*engineered\'(for-life\'+of-a-friend(%r-foe\'&smiths\'"we&&/coach\'%enemy&&lander\'\'essness\'"y-)(disposed)1going-on-gullible)#ish',
+    '($care&#man&\'s&mdash-#;we(,rehy;obvious\'!-((at-court(/in-the-business()sometimes\',/competitors(-family/lovers((partners\'(:antonia($hugh\',hip-building',
+    '+\'contact+\'merging+(romantic&#the&$wood$"re%#ies$#sch%&enhahn\'%platz\'\'strasse%,ian-holstein$#tas$(ze-level(#ike',
+    '$#ard$!e$"ga%#ebo&!d&"rs$!h%*t-patterns&$core&"ed\'(ned-fawn+"my+-of-being-soft*,/intimidated&"fu',
+    '$"ic%#dus%%faire%!o$$ocut%$gena%%verre#!k$\'adeller%#rti$"es#1lford/oxfordshire$"l.%#ier&"ng',
+    '\'&capped\'&gowned#%maire%$ldis$#bal$!s#$ndle%!s$!g%*e-flicking\'&groups\'&length\'\'meeting(&icelle&+/rump/boots',
+    '%$illa$)ton-based$"za#$oend#$pped&#ry.%!s#\'sbeeing%\'y/peers$#ch\'&/enschl&auml;ger\'!s$"e-&$type$$kair',
+    '%$film%"ie\'!r&"ly$#oni$#que$!s%"en$#toe#%talux$-chie/regional$%e-fly%"nd$"he%&uberht',
+    '$#ole$&tenden$$zell%%inger%#sch%!y#%uends##vol&+ous-looking*(menacing)$ness#$zant$#bee$"es$#ier',
+    '$)z-beating%"el\'"ls%#ing%!o&"ni%-y&rehy;haired&%-head\'&rugged"#j-2"!l#"ps"$o(5)##-up#,/impotently/',
+    ')!.##ck.%$coat)!s%#dom#"de%"bu$#oor#\'ebelian$"ch$)schwiller##g-7%(catching%%faced%&gapers',
+    '%%kicks%%spawn%&tongue$\'.bottom$\'burgers$$fish%$oots$$gart&!t\'*t/would-be%"er%$ings&"sh&!t%&ledown',
+    '$&hopper*!s$$land%*et/toadlet$(marching%%ouths$!n%\'-sellag%"al\'!l&$park$%smore%#pit$$well#$hlen',
+    '$#man$\'nweiler$%sdorf##ide&%terre$$nech%"gs#$kost#%lich.&"ks(#ome$"ov&"na$$unda#+m&ndash;the',
+    '%$ings%#the(*-ground-up)%heart*"ip$(/english%"go$"20$):software%+wordperfect$._,_from_now_on%\'now_on.%#one$!a%%giers',
+    '$+cholangitis$/e&rehy;radstock%./herefordshire$\'january%#ean$!k$+m-reichmann%#elt$%ondus$#the#$nsac$+t&rehy;seat%!\'%%-back\'$rake',
+    '&\'designs)!k\'$oors&%ender)"s.($gine&$five\'#lap\'$rame*#ing&%heavy&\'jumping&#leg\'%iners*!s',
+    '\'&oading&#men\'&ounted&)of-camera)$shop*$tage(&=house&\'pleated\'%ocket\'(rojected&%raise("nk*#ing\'#ear(+volutionary',
+    '+!s&$shop\'#ide(&lvered\'$tage&$type&\'unified%!.&"do&$were%%/make\'\'ovement&$rear%!9%!a',
+    '&!m&#nay\'!d%$girl%+i&eacute;re&!e\'+r&mdash;you(+-patrolling*#ost($less&$gnan&\'spieces\'!t%$less\'"ts',
+    '\'"st%(man/rail%&ogenal&#sas&(temporal%$page&%erson+!s%\'raising%%stage%%wards&$oman&&qindow#%omkin%!s',
+    '$#ine&#one$*kemansklub$.t&rehy;crisped%(-bearded\'#lue\'$ound\'#urn*"ed&&clawed\'(ompacted&\'flecked&\'gleamed\'&ripped&#hit',
+    '&%nails&*protection&\'ravaged&%sharp)&ttered(%ocked\'&orting\'%piked\'$tats&&tender\'%ipped\'\'olerant&$webs%$.but%0/buckinghamshire',
+    '&)macintosh%\'bite.he&%lades&$ound%$iest%%proof%"s.%%white%&y-eyed\'$face+!d$%ztega#%thier\'"st$.tola-composers',
+    '$&-frous$!d$"gh#"wd$!e$,n-prevention%\'ed-upon%"ie\'(-wearing%(s/smiles$%siest%!t&#ing$"zy#!y',
+    '$$land#$zen\'&&-faced($oods\'\'in-soul\'#out&$.and$$zled"0p&mdash;progress"1r&prime;f&prime=i"#s.l#!2#!l"#uad#\'chtbaum',
+    '$!k%#/us$+tifications("ed\'!y#"ed#%gging$%ivory$#oni#%hling$(schoppen#!i$#dem$%ffull$+t&rehy;cake',
+    '-&etable&&barrow(%skets(!t)!s&\'crammed(#ows&(designed\'&isplay&%eater&&floras&&grower&\'harvest&&juices&%laden',
+    '&)packaging*"ed\'&ickers(!e&%salad\'%haped\'%tands\'$yrup&(thrushes%&/fruit%#age%$bats&%earer&$owls%%drops',
+    '\'#er.%$fall&(lavoured\'#ies%\'growing&#ums%$iers&#ous%&juices%%lesse\'"ts%%stall%"ur%%woods%)y-tasting',
+    '#!m$\'entarii$"il$#kin$!y#$nkie#"or#$pped#"sh$(rtrating$&tation%$ibus%#rat(%edest((ion-free',
+    '+(/failure("or#"te%#lla$&icosum%!n"\'wdwyllt"&y-ness&(ts/traps$%proof$%saver#+/cheltenham$(managing$%world#+er/campaign',
+    '$"tt#(ing-pans&#pan#%moyer#$nych#$ston#$xell!#s-3#!f""/2""16""29"#35q"/a-authorisation$(exempted',
+    '#"vc""br"&d50/91"!f"#ite"!l#!c""mc#!s"$p100"$r667"#tmb""yn!\'t&ndash($;3ft',
+    '#!2$"50##350#"50#"ft#$high#$mast##nmr#$plus#%raman"$.sq."&/2,175#$min.#"rd#"se',
+    '#!c"!4##a-9"%a/cit#!f$$.fdl$(/failure#!o""cl#%watch"%e-led#"ah#!r""he"!l',
+    '"#n77""of")p.luth.se"%rival"&server#%p.com%#exe"(w31/8/85"\'x-based!\'u&mdash#.nacute;railles#*zcaron;ina"!\'"#:d/"!c',
+    '$"wi#!h$,sia-coloured&!i&&nophil#"ik%#ova$"ne%!i#"k\'%"em$*-a-fresher&$wful%(for-real&#ree',
+    '%#off$!a%"ll$\'brained$"ee%$rson&!y$$face$!i%(ng-posts$$sake$"um$$wits##oid&!s',
+    '"&d-u-u-#!.#"ai$/lewicz-niemczyk$!n$#uri#"di$$ling$"y-&\'duddies#+ge-coloured&$like&\'packing%\'ability%&tunnel',
+    '"!e#!d#%guino#4hrerbegleit-kommando#.l&rehy;storage$&-based&#urn%\'carrier&(onsuming()taminated%$dump%*efficiency%)gathering\'$uges&(enerated',
+    '%"in\')efficient\'$ject+#ion%%load/%\'oxidant%\'powered&&ricing%)rationing&#ich&"od(!s%&system%$wise&#ood',
+    '$%dumps$#ish$\'leborni&!r#&nllana$%mayor$!t%*eeducation&&rrabia#!r$#ant$"st&+enfeldbruck$"te&(ventura.',
+    '#$sday#%zessy""ff##ill&"ed""ga$#ces%#ity$#lly#"en$!s#"ge%!r$#ier%"n\'',
+    '#%hetta#$iens$!s#!l$$eman%!r#!o#"ro#+ue-subjects&$wise\'&riting$"re&!s#%weiss"#h-q',
+    '&#tum$!i%"ng"%iloro#%maono#)ss&egrave#$tgul$!y#"za"&ji-gen%$like%#san$%anese$$hara$#mae',
+    '%#oro$$nami$$sawa%$hima$)tsu-fanuc($made\'#ist$!x$$yama"&kadome$!o$"ya##ida$"en##kit',
+    '#"ue$$gita$)oka-based$$take$"vi$$zawa%!o"&l/text#,ani-speaking##ber$%ourne$$rook#\'chester$!o$"ra',
+    '#"es#$fil.&#ing&$led.&3ment-through-family3*motherhood*(/absence&$ness$#orn$*uld&eacute\'!e#,g&ecirc;nico$&arated$$ence&!s',
+    '+!s#)ham-based#\'icarius$$mori#%keith#-l&ndash;scale%(rehy;pay+)erception*$size*$year$#\'un$&-alert&"nd&(utomatic%&beamed',
+    '&$last\'#ood*$edly*#ied(&ssomed&&rother%\'cheeked&&ircled&$lass&&ontrol\'&verage&"ut($-off%$data&$epth',
+    '&#own&\'rainage&%uplex%&effect%%faced&&eature&#ist&&lavour\'&owered\'#ush*"ed&$ocus&$rame\'%onted%\'girthed',
+    '&$rain("nt\'$owed%&necked\'(edle-rib&#ose)!d%"o\'&%f-flu&(rchestra%$paid\'!y&#elt&\'lumaged&&owered',
+    '\'%ofile%$rime%)sentients&%ister&%quare&&tarred\'#eam\'(op-sized\'%retch%%tabby&&highed\'(roatedly&.ime-equivalent)*/part-time&!o',
+    '\'#ned\'$sses&%ravel\'$eble%%value&%oiced%$wash&%eight\'"ll&$ords%*year-round%#zip$&/empty%$half%$part',
+    '$$agar&"er%$love%(uthority$&bodied%$rook$&employ%1r\'s-earth-bearing&$-cut\'\'figured((lavoured\'(sounding&%/bill\'&family\'\'habitat',
+    '\'(telethon&)ene-based**containing%#tby$$face%&illing$%grown$#ich%\'ng-mill%"sh$&length$#ove$(recovery$$size%#pan',
+    '%*team-ahead$"up$$well%#ood%$rite$/y&mdash;fledged&,rehy;clothed+)developed+(restored%+-adjustable\',uthenticated&(baptised(&ttened\'#low\'&riefed',
+    '\')ompatible*(uterised((nsidered)&verged(&stumed\'%rewed&+depreciated\'\'igested(%luted((scounted\')ocumented($uble&\'endowed\'$qual\'\'scorted',
+    '\'%ramed\'%urred&&glazed\')uaranteed&+halogenated\'%edged&(imagined\'*ndependent&%lined&\'married(*sculinized($ture&(occupied\'%pened)(rational',
+    '&\'painted\'+rofessional)(visioned&(realised)%soned\'&ounded&)sensitive\'%haped\'+oundproofed\'&tocked(%udied\')ubscribed&%taped(%xable\'%ested',
+    '%!.&"a2%#_in(\'_accord%&fitted#%maris&"us$)inatingly##nes##per$#mes#!s$%arium$"om&%eness',
+    '#"va$"ia%!c%!i$"um%!s"*m&eacute;e##aca$#des$$rate%"ia%#ole#*ble-fisted(#ree&%d-for',
+    '#*e-belching%&choked&%louds&\'upboard%%laden%&ridden$%roles\'"ic$"s.#&igants&$tors$"n\'%"al%"gs%#ori',
+    '#$oirs"-n&egrave;bres##(k)#!-$0around-the-clock$&boards\'!t%$reak%$uses$\'fashion%$loat&!y\'#ing%1or-all-the-family%"ur',
+    '$&making%$oney$&palace&"rk%%oking$%quake$\'session%$ized$%thing%&o-wear$$wear#$abem$$ioli$\'mbulist##boy',
+    '$!k%!s$!t%$ion-)*associated)%based**y-function)\'focused)+independent)#led)+orientation)$word-*-dependent(#.44(*/procedure',
+    '((al-tonal*!.*+/specialist*\'isation,"ed,"m.,0t/-structuralist**ly-defined(*s&mdash;to)%-many*\'pension),/exhibitions)!2)!l%#ors',
+    '%%mdash*#;by$!-%(inspired%(matching%&raises%&worthy$*/commander%+proprietary%$save$!a%,&rehy;mental%#cao&#con%#dor',
+    '++/tangential)!s%!p%#sti%$tion%"ys$-ed-in-advance\'\'special\'%tutor%&mental%$ring&$land$*ic-pyloric&+/junctional%-ng-\'mezzanine',
+    '((staffing$&mental$&oscopy$%raise$)s-starved%#.95&!l%)/expenses#%ebria(!l$"ra&+l-arrangers.#ing((carriage(*furnishing',
+    '\'#ese\'"ls\'"s.%,eal-sounding("ly&"us$!s#!f$$ight#*g-crawford$$ally$!e$&i-beer%!.%&static',
+    '$.us&rehy;grower&&-based(%reath\'\'covered\'\'growing\'(infected\'$like\')resistant\'%toxic&#ing#"ia%!k$%cello%#les%)ul&agrave',
+    '$!s#(k-filled%"mc%(oriented%*punk-dirge$&/metal%#rap(%/rawk%$soul$&adelia$!e%!e%!l%&nstein%"rs',
+    '%"n\'&\'-lesson$%otron$$rock$)y-chicken%(/african#$line#+nel\'-shaped&%-hole\'%shape\'#web$"il$&y-farm&#man\'$oney',
+    '\'\'melling%$bone%$moon#$pack$#ool#&seeker$$hine($land$%plash$#ter#!t$#ley$"op$$umia#$wear',
+    '"!o"(pporting")r&ndash;e$$rehy((;covered)(thermore#\'-backed%%earer*!s$$coat$&hatted%%ooded$$less$(monopoly$(textiles',
+    '&%ibute$\'wearing#&a-2/am$!n%"di%&osides$$yhat#%below$%isher)!s$\'o-nairn$6y/abingdon/oxfordshire&\'badbury(%nbury\'\'erkeley',
+    '&*cheltenham(\'ieveley&&didcot&\'harwell\'0eadington/oxford($nley,*-on-thames\'#igh&"m4\'/oreton-in-marsh&+northampton&#old&#raf\'&eading&&severn',
+    '(#owe&*teddington\'$hame&%upper&)worcester##cal%$ting#\'eenbond$"nt$"ur#"gg$$uson()-plympton#$head$\'termore',
+    '$!c$$hata$"ng$$ous.#\'lanette$#ers%!x$"ow$!s#"ms#(nace-air()fashioned($heat($like(\'masters',
+    '%!d$"es$!i%$glas%)shed-with\'.ing/decorating*"s0%-ture-cleaning*)sculpture*\'vetting*&window)//cabinet-making*)household)$land)!s',
+    '#%okowa$"ns#&puller#)red-edged$&icking$(y-coated&&headed&\'looking#%s/pet$#don$#kin$$land$&t-rate%&enburg\'%erius',
+    '$#ehr$.her&rehy;again\'!\'\'%-more(#out($than\'#.it("mr\'"er\'%mnore(\'ore-the&&st-out%!o$+ive-looking$"ok',
+    '\'-uml;ngler/emi#)u-fashion$$dism$$kawa$(nculosis#\'ze-clad\'&overed\'%utter,!s&&faggot&\'tangles%%brook$#ton$!y"#sas',
+    '%!o#$cata$%hlsee$\'icollis$-o-ferruginous#*e-cupboard%$wire$$able$,box/consumer$\'d&mdash$!l%(age-side(!.%#ian&"er',
+    '$)s/fitting$%wires#"he$%ikida#\'ibility%"le$&coccin&$llis$$form$%llage$"na$,on-catalysed\')generated\'$head\'$like',
+    '&".l&./electrofusion&#pld$&tronic#$liza#*obacterium$#ris##sey$$iest%*ly-dressed%!n&!\'&"gs$,kn&ouml;chel$$pots',
+    '##tes$$ians%"ly$*y-smelling#%uline\'#ids$"ma"$taba&"se$!s#*ba-english%"ll\'#ing##ehr$!s',
+    '#+ile-seeming#!o#%relle%!x#+taim-wimpey$(ermittel$#ock#"ur%1e&rehy;orientated&)-directed\'(oriented\'\'proofed,#ing\'%sport\'%tense',
+    '\'\'winning)"se&#.he\'"it\'#the&*bus+-based&%comms&$less&"s*\'(-related\'#.10\'$hock\'#oft&&vision%%ismus',
+    ')!s(*ic-looking*$ally&$ties&"ze(!d#!z$#ing"!x#!e#"in"!y##ons"#zak#+eau-braesch',
+    '#(z-guitar$#ack$"es%!y$#ier%$fied%"ng$$weed$\'y-edged&&headed&(matching&(sounding&(thinking&%wuzzy!$v32l',
+    '"!l!(w.kestel"#15c#"90%!s"#200%!c"!a#)g-lothian#!s"-d&lsqb;n&rsqb"!e#$ddie#!s"%iday/',
+    '"!k"!o#"ar#!g#"rr"!s"#uit!&x&bsol"&-75383#"80##mix""15##7ct##9ct"$3720',
+    '%\'b/fx500"#850$!s""d5""e3#^5&verbar&verbar;bxe5&verbar&verbar&verbar&verbar&verbar&verbar"&server"&vision!"y2"!6""91"#all""ba",fe/solicitor##tie',
+    '##des#$eman$!r#$fots##gia##ing#"ke#"lo##the"$nbos#"de$$oune#"er$"st$"ux',
+    '##ney$"on#%sshid"(odorovna#,urinitials15"#rde#!e#"is#"st"%scher#%hwick#"on""ve!$z572"&r4oorr',
+    ' .g&aacute;0mini)$lvez#.circ;it&eacute(%teaus)%inais#\'grave;l#(macr;gro$!p%";a&!j&"ts#,uml;ngigsten\'%rtner\'*starbetare",dollar;1,000',
+    '+$1.75*"65*%7,600)"45*%8,000"*eacute;ara)\'camines)&labert)5n&eacute;ralit&eacute>";s3$ique2%tique7!s*!e+#ral',
+    ')*r&ocirc;me*#ant*\'ouville#(circ;nes#)grave;ant"/lsqb;eorge&rsqb\'&o&rsqb"\'mdash;2")ndash;21a(#32a("58($aanm*"rp*"uc)#bfa',
+    ')#cdc*"ss*"zp)#edt*"zj)#fcz*"fd)#hkx)#itb*"yr)#jpl)#kif)#mpp)#nxb)#pwa',
+    ')"ss*"tl)#vil)#wau*"ph)#yxt($bcow)#ffs)#ghb+!f)#mkc)#plh)#rlv)#sbg)#tbj',
+    '($ctlx($dhcb*"zz)#pit($flak)#uga($hunn($jest($luft($mxiv(%ustav($viii"(oacute;d)%ngora#+uml;ransson',
+    '(!g($litz("ss("tz(*z-gradisca\'#sta\'%tting)$weig")rehy;aznf\'$btum\'&cramps"/sharp;m7&flat;5"*ucirc;nter#\'uml;ell\'#her',
+    '\'*ll&uuml;ck)"uk\'$mbet\'$ndem)$ogan\'$rses+)-halilsoy\'\'tersloh!&\'-g\'\'\'#"i\'#\'related""ag"#bye"$ford"%rahge',
+    '!#(0)"%1989)""i)"#n\')""p)"#rf)""u)!#**d"!e"(natural*!!+!%-1(b)#$60xl#"7s""25',
+    '#!t""46""50"!6#!0##639""75"!9"+a-n-d-e-l-l$#w-n##azp##box#)caa/d8084$"dp$"mn',
+    '##dha$"pr$"uv##ebb$"du$"eh$"hm$"im$"vs##ffi##hri##jrs$"xl##kby$"fc',
+    '$"pf$"xs##lna$"sa##mgd$"hf$#ino$"td##nlk##pdb$"up$"wa##rfh$"gg$"hf',
+    '##say$"kh$"op$"sm$"tg##vil$"od%!r##xop$"pg##yec$"wt$"xt"$bact$"nd',
+    '#)dxy/xr269##gau##ipo$"su##kdt$"ra##oyz##rbc$"lv##uch%!j%!m$"dl$"es%!z',
+    '%!u%!v$!m%!f%!p$"oi$"rr"$camm#$ells##jci#$ramp"%ebib.##fte##xtr"%farce',
+    '"!g#$-g-g\'$-got%$oing&&odness##ave#"et##irl&!s#!o$!t##wyn"$hjss"$ivar##xcc',
+    '%!p##jsg"!k##yak"%line.$"zy#\'oadings$"ck"%micro#,odifications$"ul##ydz"$o-a-&"a-(%a-a-l',
+    '##jvc##mig##rby##tsw"!p##art$"wn#0rotein-regulated##t-g#)yrimidine"+r-r-r-l-l-l(%r-owf\'#uff#\'eaction$*gistration',
+    '##ich"$seai$#ven##how#$ized#$peed"#t-o##aff##hea##o-a"$util"&values"$wako"$yelt"!z',
+    '"#118""20"+46&ndash;iv"!5#"9b"(6km/6mls"#721"$a.a.$$r.y."*b./ireland"$c.c.&(palliser$"d.$"e.$!g',
+    '$"m.&"g.$"s.&#e.s$$v.o."$d.h.$"o."$f.e.$"h.$(mccleary"$g.f."$h.k.$"o.#%arvey#&ulland',
+    '$"s."$j.v.#$ames#&ohnson"%kozik"!l##.a.$\'gabriel#\'ichteim#\'udbrook"#m.t#"ay#$oore"$n.i."$o.c.',
+    '"$p.d.$"i.#$auli$$ynes#&iperno#&rudhoe""q."$r.e.$&loftus$"w."$s.d.$"p."&u.r.u.$"s."$w.k.',
+    '!+/00/22/2002+!5,"-1&&3/2117*"21+!2*"59*"63*"97)#211*"20+!9*"39*"47*"52',
+    '+!9*"65+!7+!9*"70*"80*"90+!1+!6+!9)#300+!7+!9*"11*"23',
+    '*"34*"43+!4+!5+!7*"50+!3+!4*"74*"93+!6)#442*"57+!8&&4/2039',
+    '&&9/0003#)1/25/0002*"10#)2/28/0004#)9/29/0001"!1#)0/28/0003#)3/25/0003+!5+!7+!8+!9*"11+!4+!5',
+    '+!7+!8*"20+!4"+280/91/1.ns""70"$8765"$body""cm"&day/kg"!e"#fab"!h"$kg/h#$w/hr',
+    '""mg!&0-like"#/g1"%0dbye"!1#%25003"!6"#sjw!"1+""/s"&0-site$#u25#!9"!1""20',
+    '"!3"$4mfm"$60xl""79"!8!#2.2""/m"!0"!1"!2"!4#!1"*5-sephadex"#6/m"!7',
+    '"!m#&mc.sys!*3&ndash;4d"#-g2"!1"!2""b."#gsr"!i"!r"!t!B4&verbar&verbar;h5&verbar&verbar;8"#-g3$!6$!7',
+    '#,8-resistance"%50sci"!9"!m"#pc5"#r+v!$5-g4",.4&ndash;1.2""00#!2#!5""10#"70""20"!3',
+    '"#42x#!5"#51s"$955c""h8!"6+"#0\'s""55!"7+""02""55"!6#!1"!7!+8&ndash;1ol',
+    '",.7&ndash;0.1""5e""n1#!2#!3!#900#!2""39!!="!0"$28.9"%foods!!_!#a\'g"$-300',
+    '#*lata-saray"":d"(aaaaargh%-tcattctatgtta$!h##len#!n$"in#!r$#den&!r#\'s-based#!u"(b&ouml;r#&aergic',
+    '$&rdines%"ek%"it$$ston#$bard$!i%!a&"ni%#chi$%lings$"ra%&o-type#7cikovo-nagymar&oacute;s#2elhorn-wellenkuppe)!r',
+    '$$rone$$xate##ion#)le-centre\'%orner&%ended&\'figures&)structure%\'/pillar%*rbr&auml;u%%stown%!t##on*%&-based%$aise',
+    '#*r&aacute;n$!e$)iel-havez(%marie((produced\'"is\'#le\'%"ol$$lela#\'szewicz#&ulowka"/catcgataatacgac#"ed$"la#(he-patin',
+    '$"ui#"ia$!c#!y#$zyna"&dabout(!s%$ursi)!s$"de$$ffi.$"li&$nium$&merian$"ra',
+    '#(d/father%%music$"am$$erin%$sden#%elica$#nne$!r$!s#"fa#1get&rehy;equipped&\'-hungry\'%laden($ined&"co',
+    '$!i#$hara#"ir#$jiev##men##ney#&o-gado$#cha$#ids$"ng##red$#oon\'"ed##ski$"py',
+    '#"us#"ya"\'ecilius#"de#"ia#$kwad&!r#(l-labour&#inn$,ectron-volts$*ic-english\'&medium\'\'speaker.!s&(/english',
+    '#+umannomyces"#fer#(f-rigged$"an$(elbitter%(r-to-man$$ikin%"ng$"on$#uri#"sa#"yn"+g-dependent$%heavy$&master',
+    '#%aness$$rino$!s$5tcgagctggaggatccgtacg##eby$#ure##ger$%ingly$#les##lio#(neraient#!o$!l$5sian-halley-sonnabend")h-gah-gah',
+    '#!r$!r##utu"\'ianists%!s$!r#&bnazar$\'ounanou+)transport#"da$$hlig#"ge#%lhard$#lon$$ness',
+    '\'&ressed&\'striped#*n-and-loss%$line%$race%\'seeking&&haring$"/a%&crunch$)bsborough$$eimh%(s/flight&!t%\'xposure%\'y-brown',
+    '%\'omentum$$otti$"s/%1borough-ellesmere%$ford))/speedway%!i%#law%&thorpe%%ville$!t%"ec##ole#-r-airt-dinner%+fair-n-indi',
+    '$%braid$#ing$$land#%sburg$$eric$!f$"hi$!o##tan$!h%#ert$*skell-type#(voronsky"&jabuha$%pathi',
+    '#%endra#"ik#%raula"#kky#$onya##ria##uin",l&egrave;res#(-related#%.5:17#%4-jun%#max&"yc$%/creb#/a-whatever-rice',
+    '%%eeyah$"ch%!t&!e&#ica)#lly\'%games&\'orrhoea\',se-inducible(#ylq$$dari%\'hremmin%#ine$"ga%#oes',
+    '%!y$"hs$!i%!s&!.$$ngal%.i-maragkoudaki%"ta&$erie\'!s&#rie$%rrwuy$"t.%"ai&%rasay',
+    '%%saray$#unt$\'vanting%#ima$#way$&xarian%"y-\'%class\'&galaxy\'$swap\'$wide)"th#)braithian$%stadt$!y',
+    '#&dakano#"e-%&damage%+force-winds%\'jangled%%swept%(thrashed&#orn\'$ssed$(/protest%%smart$"ae%#tus$!b%!s',
+    '$$gate$%nical&#sts$\'obdolon%$psis%"te$!r%1as/colombia/south%\'iculata&"en\'\'strasse&"st$&s-tied%$burg%"es',
+    '$"va#&fredus#%gudud#!i$"ca&!o%$iani$*l&eacute;e%#eos$%nsoga$$otti$#tza&#ine$#vel$$zien',
+    ',&stegui$(-bearing%\'causing&$urci%%drops%\'formers%\'hunting%\'inducer$!.$%achio&"io%&gherin%(nd/chief)%ounty(\'trading',
+    '&!o&#sch&)t-seeming%%pagos%+rati-scotti&!t\'!a%%tions$&badder$$eano&$sses%#gan%%nkamp%)on-hulled($like',
+    '\'#ers&!t&,y-controlled(&duties(%goers(&holder(\'intense(%owner-!s(%style((targeted($wide\'$.the\'=/bookshop/restaurant/bar/cafe(\'dealers',
+    '%#tas&"ti%"y\'&%-like\'%proof\'&slaves\'$type&#ful&"s.$+i&egrave;ni%/an/universities\'\'o-style&"rd("en%%cally',
+    '()-regalist&#han&!i\'"sm\'&zation&#ola&"um\'"rn%%enus.%)maufrians&.ore/auctioneer%"no%&o-like&!n%%pagos',
+    '%%vants%!x$#man$#oes%&n-size&#:of&&s/hour%"on%$pavo&"er&"in%&vadian%(way-type(!.&\'glasses',
+    '$%s/day$#uim%(p-picked&$/bbc%"ra%\'spforte&$trum$#way$\'ybeggar%"er%\'gaskins#)ma-tucker$#ers$&ington$"oy',
+    '#*ois/cauchy$!n$"ps$0sh-and-windchill$%whill$#zzi#!q#!r$!o#&swinth##tee%$land$$onia#$ucci%#hat',
+    '$"na$#sin%#ser#"va%\'nically\'&sation((ed-steel\'#zes&&nealed&\'ometers%!o##wak%)y-athenry\'%based&!s',
+    '%$gian%!x"&m-fitc#*age/driver$%katsu$"la%%etsos$!n$!r#&ba/two%&ccini.%"la&!l%"re%!x',
+    '$*ia-senegal&!e%!r%)ts/topics$+le&ndash;de&)-thompson&!.%+ing-chamber)#led)$ring)&tables$+oge-painted$#rel\'\'-roofed\'!l',
+    '&\'kenneth%#zzi$#wll#"e\'$&-board\'#oks\'%redom&\'reaking&&y-game($rote%$cock)%iness%+for-a-laugh("ms%$hens',
+    '%\'keepers)#ing%$like%&matrix%$play)#ers&)reserving%$rich%(shooting&\'tealing%&theory&%racks&$ypes%\'wardens&&inning',
+    '$%:jobs$&boards&"ok$$fish%#owl$#gun$\'keeping$$less$\'manship$!n$%plans$"ro%"ra$\'s&ndash%&-board',
+    '&\'masters&(oriented&\'players&&system%#.in%*/exercises&$quiz%%_such%%maker%\'playing$2te-intra-fallopian%"ic%&ocytes$+y-flavoured#$gees',
+    '%!y$"na%"es%(g-boards\'%house\'&tables#"la$"en%"ys$#ins#+ma&amp;sup1-!2-!3%.-amino-butyric&\'benzene',
+    '&(globulin&$lobe&)sensitive%,gard-treated&"es&\'lobulin\'&utamyl-+transferase%!n%-scintillation&$hire$"ed%!l&%gaard&!s',
+    '$#ies%"ll%\'mmune-n%"ng$\'o-amino%(minister%%ns/mg$$urus$(y-legged#$oche$!s#"pa%"ha$!h$#ola',
+    '$&abhava$"on#"za"(n&oacute$+rehy;gardia#"**#$-gan#\'adevta.$%pathy$#veh#"ce$#hev$\'iclover$$oner#,d&aacute;lfr',
+    '%!r$$ells%(r/branch&#ton$\'hi-diet&"ji%!y$$ipet$#olf&"ph%!n$$uras#$eesh$"fo$#lin',
+    '$#san%)hamoorthy#"g\'$%-bang)"ed*"rs)!s&%osses&%uster%%chief&&ulture%%fight%$girl)!s%*leadership',
+    '\'"on%\'members%3of-lads-from-oldham%\'related%"up%+versus-gang%#way&#ork$$/ion$%adeen&#har$\'bangers%#oys%&uddies$#ell',
+    '$#in\'$"la&(nd-style%!e%.i&mdash;msidos&"ns&+on-blockers.#ing($aris(&ectomy($itis$#osa%#tri$%paths$$rels',
+    '\'$osum%$idge%!y$$scum%#how%(ter-like)%movie)#run(\'/psycho(#ese(+s/self-made$%types$#uli$%ways.#%huyag',
+    '$$ster#!j$!i$$o-ji#$neke%!l%!r%&t-like&$ries%!x&&plains$#in\'$"oc%(n/writer%!w',
+    '$#utz$!y##oid$!s$\'tantrik$$uche$!w#&rantee$"if##sch$#eys$#hof$#ser$$tead#\'t-aided',
+    '$\'enbrink$+i&egrave;re%#adi$#let$\'ry-lift$%t-cpm$#zer#!u#%zatti$!e$#ies$"on"%obaeb#$ithe#&l-fees',
+    '%&keeper$$iang#!n#!u"&p-hunt$&length$%phase$&ridden$&spacer$\'wearing&$ight#"dh#%erons%!s#\'fillers',
+    '#"pa$"er#!r##way"-r&ccedil;ons.$(rehy;vey#!.#(abaousse%%edian%%ondal$*g&amacr;li%*e-breaking(&unting\'&cheese\'(inclined',
+    '\'&owners\'$type&!.&+/caf&eacute\'&grunge&#_at&$land&(s/petrol$$jaus$%leden%#lan$#man%&volgyi$)ng\'sdinka%$kuwa',
+    '$"ra%"do$"tt$$vini#$bacz%"de%\'ge-bins(*collection()dispersed,$osal)#ump\'!y%&harrey%$nzos%$rino',
+    '%*tt-edwards$&hanach$#ini$%olino$(utt/club$$yang#*c&eacute;s%/iacute;adefence$*es-giraldo$#hey%4ing-bei-m&uuml;nchen$!i%(a-conway\')lookalike&!s',
+    '%#nia$"ke$#ons#(d&eacute$%agolf%"nt%!r%$vsky$(e&eacute%/-adh&eacute;mar&&manger%!e%(n\'-style&!-\'$beds',
+    '\'&centre((onscious\'%dried\'(festival(\'riendly\'$gate($nome\')landscape(%overs\'\'of-eden(%wners\'$plot\'\'railway(#oom\'$shed',
+    '(\'pecific)#ray\'#the($ombs)$pped\'$wall&&.known&%/marc\'%piano\'#sun&%court&,er-next-door),rule/british(&/snail(6s/grocers/greengrocers',
+    '\'$sque&#fax&%hurst&*ing-basket*&supply&\'s.their\'#_so&!y%#rie&$obes$$iane%!e&#nne%!n&*er/boatman',
+    ')&family)&mother)(resident)*stepfather)\'tenants)#wye(!s%"ol\'!e$*ner-medwin\'(/nursery\'&sville$"oe$$urey$&y-good',
+    '%"ne\'!r&"ik##ech$!d%"en$$fowl$,l&rehy;jones%"li$"me$"nt$#sse$!t%,h/contestant#"fa',
+    ')\'reading(!s%\'nkelian#!g$&anelli&&tuanly%#rin\'#sms$%ellen%!s%#tas$!i$(led-with$&ouille%(yle-like',
+    '(!d$&unnock#(iannonum$#bay%!i%$ondi$$ella$"ff$$gues$#lao$$more%%peiro$#och$!s%$enda',
+    '&&ly-lit$"th#,land-compton\'!.\'%/shop(&thames\'!e%"to$+ic-and-beer+%cross+%onion\'\'covered\'&eaters\')flavoured\'(gnashing',
+    '\'\'scented&&khithe%%eston#$main%\'n-klass&#son&!y$,end&iacute;a&&t-hook(&sewing\'!.\'"ry\'"s.$\'onchaty&%dsway',
+    '#-n&rehy;illech*#wen$$acha%"de%!r%#sih%"th&$ions$*dolbenmaen$(er/coach\'+oxfordshire&!s&%ville%)t-bearing\'%edges',
+    '\'"in\'#red\'\'studded\'&tipped\'$work&*t-botfield%!y$"ie&(r-robson\'#ite&!s%#kov%$ture$$kirk$#ock',
+    '$$fani%#olo$$ghan$#teo%"ta&"ed$"ua%"pa&!e#*r&oacute;n$#ads%#gan%"ni%"ts&*t-glassman',
+    '%-way/aylesbury)(bernwood*\'icester)5cheltenham/gloucester*)inderford*&lifton)*deddington*%idcot)\'malvern)\'princes*$usey),sevenhampton*\'werford)*tewkesbury$(eallabus',
+    '%"ls%!n%*t&oacute;n&#son&)t//newton((abingdon)&rncott)(ylesbury*\'mestrey(\'belmont)\'irdwood+\'mingham)&urford*$scot(*cinderford',
+    ')&laydon)%umnor(&dorton(\'eastnor((fairford*\'ringdon(*gloucester)&uiting(2hope-under-dinmore*(rseferry)+ullavington()kelmscott))idlington(&london(\'moreton',
+    ')\'uffield(%opera(+silverstone))limbridge)&outham)$toke*$roud(#the()uffington(*watlington)\'heatley)%itney)*oodchester+$tton(\'yarnton',
+    '%#gan&+ue-lagrange%$ncha%#ock(&/north%-son-commander2!s)%point$"le$#och%"ne%#uld%#wen$$ucha%#lus',
+    '$+ide-neville%!n&0gton/oxfordshire$%tangs%(on-based\'!e#!t$#ain$%breck$)ell/royal%%rbelt&#ing)!s$\'h-bwlch%#age',
+    '&#win%#myl%,waite/united$$land$(more-led$$ners$$rell##uet#$vald$!e%+-achnasheen%!l%!n%!r%*y/jamaican',
+    '%#son#$ways##y-i#"za$$etta"/s&rehy;chambers)(guzzling#\'-attack$%blast%&ubbles&%rners$(carrying%&harged&1romatography/mass%$loud',
+    '$)detection$-engine-driven%\'xchange$\'f.e.t.s%$lame\'#res(#ing&%ushed%\'urnaces$)generated%#uns&+zzlers.mike$(handling%#ead%%older',
+    '$$jets$%laden%&eakage&!d%\'ighting)!s$(merchant%)onitoring$&output$%peril%#ipe%\'ressure&\'oducing\'"ne$\'raising',
+    '$)sensitive&(paration%(ponsored&#ray$%valve%*ersus-coal$$wise#!/$$bays%%iogas%$obby$&diesel$(electric$&liquid*!s',
+    '#&20,000##and#%board#$cape$!h%\'&eacute%#rom()atography%&uggers$.oigne-inspired*%style)!.)&/house*#son)!s',
+    '%#nha##dia##ele&"es$+osa-selling\'!s%&usions$%s-and$$vski#%fired\'!s#\'gcoigne$%oigne&"ne#%hings',
+    '$%wiler#\'ication$,fier-powered*\'roduced%$ying$"ng$\'orowski$$paes$#yev#$k-pr$$arth$)ell/royal%#ted$#iya#+lee-trained',
+    '$"en#"ny##oil$,line-powered)&soaked$&meters#(p&eacute$)-inducing%)provoking$#ed.%$roni$#in\'&"g.#)s-coh-een%$kern',
+    '%"es%!m%!n&#dus$#iem&!s%!n&!\'&!o%"ot$%masks$#ner$#ons#*t&oacute;n$+-flabbering',
+    '%#ldo%(rbeiters$)erophilus("od*!s\'%steus$&hauses%#ofe$"il$"ly$-o-oesophageal%#nia%&scophy$!p$&raophy',
+    '%!i&$csin&&naemia\'%ergic&.tis/duodenitis%)o-enteric-#tic,\'ologist()sophageal\'%nasal&(cholonic\'&nemius\'$olic($nray&,duodenoscopy',
+    '.!y(,terological/&\'ferrin\'\'*ibrescopic&&grafin&,inintestinal(0testinalmotility-$onal*%tinal&\'jejunal+&ostomy&%liths&%mancy&&nemius\'"om',
+    ')"us((rm-sized\'(testinal&%podic)"s.("rn&&scopes*&ically\'&tomies&*technology\'%richs&(vascular%&scopic$+st&auml;tte$$ulus',
+    '#&worthy"%t-jin#$aker$%ullin#!c$*(nnnn)gatc#1e&ndash;fleetwood$+-array-chip%%guard%&houses%\'jerking%&legged%$type%\'vaulter%$ways',
+    '%%rails%%stile$)acre-made%"us$$holm&,use-of-fleet*$pend)%/lord$.keeper.dec.com$#leg&!y%!y$%money$"ns$%piers',
+    '%$/abt%%carth%#hea("d/&#ill%!y#&field.#"ha$\'er-good&$cale&#ed\'(\'-around\'(r-hunter()/director&!i',
+    '(#g-a*%place/!s+$oint*(together*"up)(/reunion)%saleh&#ley$$orne$"re#!i$$nara%#eau##lin',
+    '&"gs#%orade%$land$!t#$rigg##sos#)t-bashers%%trade%\'uruguay$!a$$egno%!r$#ias%"na&&g-like',
+    '(\'shakoor&!i&#oni$%leton)!s%#ing$#uso#0wick&ndash;luxor\'\'-athens(\'lourdes"$ucci$$elin&"me$#her%#ier',
+    '%"ly#(d&iacute$(assinksy$!e%$amus&!t%#bit%$nzio%#tte$"ia%!e&(rbrzeska\'!i&"st%"no',
+    '&"so$"ry$!s$)y-covered#%ffres#&gamela$&e-line%+/understand$$hain%"in%#ran$!i$%uelin%#in\'\'%esque',
+    '#$ldie$1le&mdash;adenauer&$-led%!i&"er$,stone/centre$\'t-brick%"er%$ier.(!e#!m##ner$#git$&t-eyed&(featured',
+    '%*let-cuffed)$hand("ts&!y#%rdian$!i#!s$\'s/weber%%meter##tam$"el$(ier-hion$$rait%)ey/bursar##vin',
+    '#*ze-covered&&veiled"$v\'st#\'-filled#$agan%!e$#rni$#zza&#eni#%e-out$)l-bashing%$lers&#ing%$ocks$#nta',
+    '&$idae%!o$#gan%$nano$1n/gloucestershire%!a%#ies$#ota$"ra$%scone$$teer#$otta#!r$"ad$"el',
+    '\'$ides\'"le\'!s%!l&%popov%#nis#!s#$urin"\'wdelpus$$sake$!y#$ford#$kier%"sh$&rodger',
+    '#"ps##ron&"ik#&sworth",y&rehy;rosse#!\'#4-and-happy-to-be-gay$&bashed)"rs(#ing$(coloured$%disco$#men$\'related$#sex',
+    '#$/but$\'capable$\'lesbian#$bour\'!s#"da$"om#,e/journalist#%hurst#!i#"la%"ni$&egphug%!n%(r/county',
+    '##mer##nus#&s-only#&thelus%$orpe$$imes$3on/northamptonshire$$rick##vid#%world"(za-based%%first$#nia#%dasag#&e/glos',
+    '&"es$$chim$-lle-inhabited(%sized$"ti%#te.&#ing#$idis$!l$(ng-stock$#pur#$mere##oro#"so##ump',
+    '%"ti#)za-figure&%grade&$show%!s$#er.$"ie$!o!)b&ndash;d"+-manchester#&plated""20##1wm##ply##yia',
+    '"$5owa""75"#ago#$rgna#\'ssingbe""bd#!f"!d"$e-tv#%jniet#)zera-bria""gb""ii"!o#!s',
+    '""ps"!q"&urnage"+w-sponsored!&c-2020#\'binding##ion#%reach#&series$%ystem"&/lc-ms"0atgatgaaactcatac"%c/ggc#"50#2ataagtcagctctaattg',
+    '#!s"5ggatcttgttgacgaccaggg#1taggcgtcggtgacaaa$!t""ho""ol#"s6$!7$!8""rs"\'se&sup1$+-endangered"<taccccctagtactgattttattgtcta#5ttacattccacaatatacatc"!u',
+    '"!3"+552,200,000",a&nacute;ska#)nsk-based&!i""dm"!i"!n#!r""os"%p-gtp$*per-capita",reconint/doc"!y#"bh',
+    '\'%based!1e&thorn;r&aelig;c"#\'ez#%neral"#-10#\'engined##get#!x"+02:huridocs""3t"#5.1#!8"+=management"/agea-controlled#"la',
+    '$!l%%druig%!y#"nt#,r&rehy;stick$%-case(#ing&&hanges*#ing%/down/flaps-down%$knob%&ratios%%shift*!s%$test',
+    '%&wheels$#ach$0box-transmission\'*/passenger$%ed-up$&ing-up$"s.%"et$%tooth$&wheels$(y/garage&)protestor#!s#%taway$"er',
+    '#"ye""ba#"e/$!n$!r%!s#$irge#%racht$#ecs$$uder##urs%!t"#c\'s#\'-alshom#(/marconi',
+    '#\'evicius#&ophone"$dali$"mu#"de$"le#%elier#!i$#man%#ino$!r#+le-ghiorgis"%e-gee$!h$#ing',
+    '$$tars$%whizz%#izz#-/distribution##bee#"ga%!w#%hrter##kie%"sh#!l$&muyden$!y#$ndet$!s',
+    '$*rrahtoffit$$tgen%%ruida%#sma##ses##ter$"ha#(zer-good")f&uuml;ge+%kunde)"hl#)angnistor*#urm%"il#1echtskehrtwendung',
+    '%"ry$#ner$#rye##ion"#gen##gie$"us#!u"$habt$(m-mantel$(n-mantel$#rdt#!d#$eime&#nis',
+    '$!n%"na##lot#\'o\'quein#$ring$"ls$#man#!t$!s"#ier#(genbuhel%)r-counter.!s#$kien&!s',
+    '$!s%$land#%nitzi#%sberg$%elman$\'sbehler%#man$"te&!r&/swissenschaften##tel"%jvall"&khakte##kos#%ommen',
+    '"*l&eacute;e#)-emulsion%)xtraction$(filtered$$like$(mobility$\'smeared%%perse&$rays#"am$"rd&!i$"sa$"ti&#nes',
+    '(&zation)!e\'#osa(*us-looking*"ly!3tgctgaatatgacgattca',
 )
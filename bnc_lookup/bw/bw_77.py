@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_77 = (
+count_77 = 6694
+
+heads_77 = (
     'fadumo',
-    'fadus',
-    'fadword',
-    'fadzil',
-    'fae&die;rie',
-    'faecal/oral',
-    'faecal/urine',
-    'faecally',
-    'faece',
-    'faeder',
-    'faegri',
-    'faentine',
-    'faer',
-    'faergeman',
-    'faeryland',
-    'faesch',
     'fag&uacute;rholsm&yacute;ri',
-    'fag-smoking',
-    'fag-strewn',
-    'fag.',
-    'fagan/oklahoma',
-    'fagel',
-    'fagella',
-    'fagen',
-    'faggi',
-    'faggiani',
-    'faggit',
-    'faggot-heated',
-    'faggot-stitched',
-    'faggotdom',
-    'faggoted',
-    'faggothood',
     'fagin-style',
-    'fagins',
-    'fagner',
-    'fagoth',
-    'fagotto',
-    'fags.',
-    'fagssaywhat',
-    'faguet',
-    'faguillon',
-    'faha',
-    'fahaleovantenan',
-    'fahed',
-    'faheem',
-    'faherty',
-    'fahnbulleh',
-    'fahrenden',
     'fahreneheit',
-    'fahrenheit-',
-    'fahrenheit/21',
-    'fahrner',
-    'fahrradstrasse',
-    'faiders',
-    'faidy',
-    'faiella',
-    'faietti',
-    'faifpens/',
-    'faigele',
-    'faijoada',
-    'fail-fall',
-    'failand',
-    'faile',
-    'failed&ndash',
     'failed-dieters',
-    'failingly',
-    'failkure',
-    'failla',
-    'faillant-dumas',
-    'failover',
-    'failure-driven',
-    'failure-in-england',
-    'failure.but',
-    'failure.the',
-    'failures.e',
-    'failures/faults',
-    'faiman',
-    'fain&eacute;ant',
-    'fain-es',
-    'fainaru',
     'faine',
-    'fained',
-    'fainfray',
-    'faini',
-    'faint-heartedness',
-    'faint-of-heart',
-    'faint-shriek',
-    'fainthearts',
-    'faintified',
-    'faintin\'',
-    'fainting-fit',
-    'faintly-flamed',
-    'faintly-jewelled',
-    'faintly-patterned',
-    'faipule',
-    'faipules',
     'fair&rehy;ground',
-    'fair&rehy;haired',
-    'fair\'92',
-    'fair-',
-    'fair-browed',
-    'fair-coloured',
-    'fair-complexioned',
-    'fair-copy',
-    'fair-copying',
-    'fair-deal',
-    'fair-dos',
-    'fair-goers',
-    'fair-is-fair',
-    'fair-isles',
-    'fair-maids',
-    'fair-market',
     'fair-plaited',
-    'fair-rather',
-    'fair-red',
-    'fair-rent',
-    'fair-scene',
-    'fair-share',
-    'fair-to-lousy',
-    'fair/silver',
-    'fairacre',
-    'fairacres',
-    'fairbanks&ndash;beaver',
-    'fairbanks-pickford-chaplin-griffith',
-    'fairbourn',
-    'fairbrassin\'',
-    'fairbunt',
-    'fairchilds',
     'faircliff',
-    'fairclough(1.8)',
-    'fairclough.',
-    'fairclough/o\'leary',
-    'faircoulgh',
-    'faircross',
-    'fairdell',
-    'faire-part',
-    'fairess',
-    'fairfax-blakeborough',
-    'fairford.protesters',
-    'fairford.we',
-    'fairgrade',
-    'fairgrowth',
-    'fairhaired',
-    'fairhanded',
     'fairholmes',
-    'fairie',
-    'fairlamb',
-    'fairlands',
-    'fairlawns',
-    'fairless',
-    'fairlights',
-    'fairly-balanced',
-    'fairly-long',
-    'fairmainer',
-    'fairminded',
-    'fairminer',
-    'fairmitre',
-    'fairness-minded',
-    'fairnilee',
-    'fairnington',
     'fairshare',
-    'fairstead',
-    'fairuza',
-    'fairweather-low',
-    'fairweigh',
-    'fairwood',
-    'fairy&rehy;tales',
-    'fairy-',
-    'fairy-beast',
-    'fairy-carriage',
-    'fairy-land',
-    'fairy-lit',
-    'fairy-palace',
-    'fairy-queen\'',
-    'fairy-shrimp',
-    'fairy/mortal',
     'fairydean',
-    'fairyflax',
-    'fairyfoot',
-    'fairylights',
-    'fairytale-like',
-    'faisait',
-    'faisans',
-    'faisans-renac',
-    'faisant',
-    'faisceau',
-    'faisley',
-    'faisons',
-    'faith\'',
-    'faith-assumptions',
-    'faith-building',
-    'faith-centred',
     'faith-do',
-    'faith-healer',
-    'faith-healers',
-    'faith-hungry',
-    'faith-in-grass',
-    'faith-non-faith',
-    'faither-in-law',
-    'faithful/faithful',
-    'faithfull-',
-    'faithfull-davies',
-    'faithfully-kept',
-    'faithing',
-    'faithorne',
-    'faivish',
-    'faizabad',
-    'faizieh',
     'fajko',
-    'fajnzylber',
-    'fakafanua',
-    'fakaofo',
-    'fakapapa',
-    'fake-auricula',
-    'fake-french',
-    'fake-fur-leopard-print-whatever',
-    'fake-half-timbered',
-    'fake-innocent',
-    'fake-log',
-    'fake-medieval',
-    'fake-sensitive',
-    'fake-snake',
-    'fake-stereo',
-    'fakeness',
     'fakeney',
-    'fakhani',
-    'fakhr-i-mudabbir',
-    'fakhru',
-    'fakies',
-    'fakings',
-    'fakt',
-    'fakty',
-    'fal-lal-lal',
-    'fal-lals',
-    'falabella',
-    'falacious',
-    'falaka',
-    'falakiko',
-    'falana',
-    'falange-dominated',
     'falangist-organized',
-    'falangists/anarch.',
-    'falaniko',
-    'falaschi',
-    'falasha',
-    'falbae',
-    'falcao',
-    'falcarragh',
-    'falcata',
-    'falcated',
-    'falcatones',
-    'falch',
-    'falchikov',
-    'falcon/royal',
-    'falconar',
-    'falconets',
     'falconing',
-    'falconite',
-    'falcs',
-    'falcula',
-    'falculatus',
-    'falderols',
-    'faldetta',
-    'faldingworth',
-    'faldo-type',
-    'faldos',
-    'fale',
-    'fales',
-    'fales&aacute',
-    'falette',
-    'faletto',
-    'falewesle',
     'faley',
-    'falf',
-    'falgui&egrave;re',
-    'faling',
-    'falis',
-    'falkenburg',
-    'falkener',
-    'falkenhausen',
-    'falkenhavn',
-    'falkenstein',
-    'falkirk-stirling',
-    'falkirk2',
-    'falkkirk',
-    'falklanders',
-    'falklands(malvinas)',
-    'falklands-bound',
     'falko',
-    'falkoff',
-    'falks',
-    'fall&rehy;out',
-    'fall\'n',
-    'fall-',
-    'fall-away',
-    'fall-derivatives',
-    'fall-down',
-    'fall-front',
-    'fall-guys',
-    'fall-outs',
-    'fall-pipes',
-    'fall-plus-rise',
-    'fall-year',
-    'fall/by',
     'fall/rise',
-    'fall/three',
-    'fallacci',
-    'fallaci',
-    'fallacious.',
-    'fallaciously',
-    'fallacy\'',
-    'fallan',
-    'fallas',
-    'fallbacks',
-    'fallen\'-type',
-    'fallen-tree',
-    'fallguys',
-    'fallibly',
-    'falling-in',
-    'falling-in-love',
     'falling-over',
-    'falling-rising',
-    'falling-short',
-    'falling-together',
-    'fallling',
-    'falloden',
-    'fallopians',
-    'falloposcopic',
-    'falloposcopy',
-    'fallor',
-    'fallover',
-    'fallow-deer',
-    'fallow-periods',
-    'fallowes',
-    'fallowiana',
-    'fallowing',
     'falls&ndash;toronto',
-    'falls/',
-    'falls/lower',
-    'falls_and_so',
-    'fallschirmjager',
-    'falluja',
-    'fallujah',
-    'fallujiah',
-    'faloona',
-    'falqui',
-    'falrinne',
-    'falsa',
-    'falsas',
-    'falsch',
-    'false-consciousness',
-    'false-dawn',
     'false-fossil',
-    'false-front',
-    'false-napoleonic',
-    'false-negative',
-    'false-negatives',
-    'false-starts',
-    'false-stone',
-    'false/rape',
-    'falsely-accused',
-    'falsely-beckoning',
-    'falsest',
-    'falsetter',
-    'falsettist',
-    'falsettists',
-    'falsework',
-    'falshood',
     'falsies.',
-    'falsirena',
-    'falstaff/verse',
-    'falstone',
-    'falta',
-    'faluns',
-    'falures',
-    'falush',
-    'falusi',
-    'falutin',
-    'falutin\'',
-    'falvai',
-    'falx',
-    'falzon',
-    'fama.',
-    'famagustans',
     'famale',
-    'famalicao',
-    'famau',
-    'fambare',
-    'fame-type',
-    'fame.mortimer',
-    'fame/it',
-    'fame_as',
-    'famel',
-    'famels',
-    'fami',
-    'famicom',
-    'familiale',
-    'familially',
-    'familiar-style',
-    'familiar/non-familiar',
     'familiari',
-    'familiaris',
-    'familiarit&eacute',
-    'familiarity/deference',
-    'familiarius',
-    'familiarizes',
-    'familiarly-shaped',
-    'familiars.',
-    'familien-partei',
-    'familier',
-    'familiere',
-    'families.in',
-    'families/',
-    'families/couples.',
-    'familihood',
-    'familists',
     'familiy',
-    'famille-rose',
-    'familo',
-    'familus',
-    'family&mdash',
-    'family-a',
-    'family-allowance',
-    'family-centredness',
-    'family-charles',
-    'family-circle',
-    'family-cum-laundry',
-    'family-dominated',
-    'family-ellwood',
-    'family-expenditure',
-    'family-farm',
-    'family-firm',
     'family-formation',
-    'family-friendly',
-    'family-group',
-    'family-head',
-    'family-held',
-    'family-holdings',
-    'family-incomes',
-    'family-is',
-    'family-life',
-    'family-magazine',
-    'family-man',
-    'family-members',
-    'family-only',
-    'family-plus-an-outsider',
-    'family-portraits',
-    'family-related',
     'family-room',
-    'family-situation',
-    'family-specialist',
-    'family-structure',
-    'family-tombs',
-    'family-type',
-    'family-way',
-    'family-willy',
-    'family-wise',
-    'family.',
-    'family/',
-    'family/beginner',
-    'family/couple',
-    'family/friends/neighbours',
-    'family/he',
-    'family/i',
     'family/interview',
-    'family/non',
-    'family/spouse/colleagues/',
-    'familyer',
-    'familys',
-    'familyso',
-    'famine-affected',
-    'famine-free',
-    'famine-level',
-    'famine-periods',
-    'famine-ravaged',
-    'famine-torn',
-    'famine.',
-    'famingdale',
-    'faminine',
-    'famlee',
     'famlingham',
-    'famlyn',
-    'fammau',
-    'famosus',
-    'famotidine',
-    'famroost',
-    'famulus',
-    'fan&rehy;shaped',
-    'fan&rehy;tasy',
-    'fan&rehy;window',
-    'fan&rehy;wise',
-    'fan\'-letters',
-    'fan\'s-eye',
-    'fan(atic)s',
-    'fan-',
-    'fan-bashing',
     'fan-belts',
-    'fan-blade',
-    'fan-cluib',
-    'fan-draught',
-    'fan-fare',
-    'fan-faulting',
-    'fan-feredin',
-    'fan-folded',
-    'fan-in-fin',
-    'fan-light',
-    'fan-lights',
-    'fan-maker',
-    'fan-tailed',
-    'fan-trained',
-    'fan-war',
-    'fanad',
     'fanatic/dolphin',
-    'fanatic/hummingbird',
-    'fanatick',
-    'fanayesh',
-    'fanbelt',
-    'fanbelts',
-    'fanboy',
-    'fanced',
-    'fancelli',
-    'fanchi',
-    'fanciability',
-    'fanciably',
-    'fanciest',
-    'fancily-disguised',
-    'fancily-named',
-    'fanciness',
     'fanclub.and',
-    'fanconi',
-    'fancy\'',
-    'fancy-dressed',
-    'fancy-goods',
-    'fancy-looking',
-    'fancy-schmancy',
-    'fancy-yourself',
-    'fancydress',
-    'fancye',
-    'fandangled',
-    'fandemonium',
-    'fanderl',
-    'fandian',
-    'fanek',
-    'fanelli',
     'faner',
-    'fanes',
-    'faneuil',
-    'fanfanis',
-    'fang-jawed',
-    'fang-toothed',
-    'fangablang',
-    'fangarisugan',
-    'fanged-friend',
-    'fangerprints',
-    'fangorak',
-    'fangugyab',
-    'fani',
-    'fania',
-    'fanidi',
-    'fanjakana',
     'fanjets',
-    'fanmily',
-    'fanmore',
-    'fanmos',
-    'fanned-out',
-    'fanner',
-    'fanners',
-    'fannet',
-    'fanney',
-    'fannia',
-    'fanning/thamesdown',
-    'fannish',
-    'fanny-annie',
-    'fanny-by-gaslight',
-    'fannying-about',
-    'fanony',
     'fans-pull-punkahs-hanging',
-    'fans-tastic',
-    'fans.nonetheless',
-    'fanshaws',
-    'fanshel',
-    'fanship',
-    'fansidar',
-    'fansungun',
-    'fant',
-    'fant&aacute;stico',
-    'fant&ocirc;mas',
-    'fant&ocirc;mes',
-    'fantabbidabbidosy',
-    'fantabulous',
-    'fantaisie-impromptu',
-    'fantan',
     'fantas&rehy;tic',
-    'fantascies',
-    'fantasiaargh',
-    'fantasic',
-    'fantasies.',
-    'fantasizer',
-    'fantasmatic',
-    'fantasms',
-    'fantastic-bathetic',
-    'fantastic-depressive',
-    'fantastically-named',
-    'fantastically-patterned',
-    'fantasticated',
-    'fantastication',
-    'fantastick',
-    'fantasticks',
     'fantastico',
-    'fantasticus',
-    'fantasy(long)',
-    'fantasy-adventure',
-    'fantasy-based',
-    'fantasy-comedy-drama',
-    'fantasy-forming',
-    'fantasy-heroic',
-    'fantasy-land',
-    'fantasy-life',
-    'fantasy-self',
-    'fantasy-sensation',
-    'fantasy-sonata',
-    'fantasy-style',
-    'fantasy-think',
-    'fantasy-time',
     'fantasy-type',
-    'fantasy-wise',
-    'fantasy-world',
-    'fantasy.',
-    'fantasy.but',
-    'fantayzee',
-    'fantham',
-    'fanthorpe',
-    'fantin',
-    'fantrained',
-    'fantuzzi',
-    'fanys',
-    'fao/basrah',
-    'fao/umm',
-    'fao/undp',
-    'fao/unesco',
     'faoil',
-    'fappani',
-    'faps/fam',
-    'faqir',
-    'far&ograve',
-    'far&rehy;sweeping',
-    'far\'',
-    'far-aimed',
-    'far-creeping',
-    'far-cry',
-    'far-distance',
-    'far-divided',
-    'far-enough',
-    'far-famed',
-    'far-fetched.',
-    'far-from',
     'far-from-affluent',
-    'far-from-convincing',
-    'far-from-easy',
-    'far-from-embarrassed',
-    'far-from-happy',
-    'far-from-healthy',
-    'far-from-ideal',
-    'far-from-impoverished',
-    'far-from-negligible',
-    'far-from-ordinary',
-    'far-from-perfect',
-    'far-from-quiet',
-    'far-from-reliable',
-    'far-from-serene',
-    'far-from-stable',
-    'far-from-universal',
     'far-from-victorian',
-    'far-gained',
-    'far-gone',
-    'far-i',
-    'far-looking',
-    'far-of',
-    'far-outstripped',
-    'far-post',
-    'far-reach-ing',
-    'far-reachingly',
-    'far-right-wingers',
-    'far-stretching',
-    'far-that',
-    'far-too-good-to-be-true',
-    'far-too-strong',
-    'far-too-sweeping',
     'far-travelled',
-    'far-up',
-    'far-uv',
-    'far-west',
-    'far.all',
-    'far.reaching',
-    'far/near',
-    'far/not',
-    'far_in',
-    'farabund',
-    'farabundi',
-    'farad',
-    'farafrans',
-    'faraglione',
-    'farago',
-    'faragon',
     'farahnaz',
-    'farai',
-    'farajplanning',
-    'farakat',
-    'faramus',
-    'faraneh',
-    'farat',
-    'farbauti',
-    'farbenindustrie',
-    'farbereshaye',
-    'farberg&eacute',
-    'farbmathematik',
-    'farbrother/landlady',
-    'farbrother/landlord',
-    'farce.',
-    'farcet',
     'farchog',
-    'farcies',
-    'farcy',
-    'fardel',
-    'fardells',
-    'farder',
-    'fardo',
-    'fardoe',
-    'fare-',
-    'fare-cutting',
-    'fare-dodgers',
-    'fare-fixing',
-    'fare-paid',
-    'fare-payer',
-    'fare-payers',
-    'fare-runner',
     'fare-slashing',
-    'fare-structures',
-    'fare-table',
-    'fare-wars',
-    'fare.',
-    'fareast',
-    'farel',
-    'farell',
-    'farendon',
-    'farense',
-    'farentino',
-    'farepack',
-    'fares-rather',
-    'farewell.the',
-    'farewell/relenting',
-    'farewelled',
     'farewelling',
-    'farey',
-    'fargesloides',
-    'fargion',
-    'farhan',
-    'farhana',
-    'farhang',
-    'farib',
-    'fariborz',
-    'farida',
-    'faridah',
-    'faries',
-    'farin',
-    'farine',
-    'faringdonense',
-    'faringdonians',
     'farini',
-    'fariq',
-    'farit',
-    'farizindustry',
-    'farjana',
-    'farjani',
-    'farkasa',
-    'farkers',
-    'farkunda',
-    'farla',
-    'farley/heller',
-    'farlington',
-    'farlo',
-    'farls',
-    'farm&mdash;and',
-    'farm-buildings',
     'farm-butter-yellow',
-    'farm-child',
-    'farm-ers',
-    'farm-estate',
-    'farm-estates',
-    'farm-girl',
-    'farm-hand',
-    'farm-holdings',
-    'farm-horse',
-    'farm-horses',
-    'farm-household',
-    'farm-houses',
-    'farm-in',
-    'farm-intensive',
-    'farm-labourers',
-    'farm-lad',
     'farm-owners',
-    'farm-reform',
-    'farm-safety',
-    'farm-school',
-    'farm-servant',
-    'farm-size',
-    'farm-smoked',
-    'farm-state',
-    'farm-strip',
-    'farm-support',
-    'farm-touns',
-    'farm-trade',
-    'farm-waste',
-    'farm-wives',
-    'farm-woodchester',
-    'farm-worker(s)',
     'farm.police',
-    'farm/business',
-    'farm/in',
-    'farm/miller',
-    'farmable',
-    'farmaceutico',
-    'farmar',
-    'farmary',
-    'farmbrough',
-    'farmcote',
-    'farmdown',
-    'farmer-conservationists',
-    'farmer-contractor',
-    'farmer-cooperative',
-    'farmer-craftsmen',
-    'farmer-employer',
     'farmer-labour',
-    'farmer-miner',
-    'farmer-owned',
-    'farmer-people',
-    'farmer-saved',
-    'farmer-settlers',
-    'farmer-substitute',
-    'farmer.she',
-    'farmer/cattle',
-    'farmer/coal',
-    'farmer/contractors',
-    'farmer/engineer',
-    'farmer/neighbour',
-    'farmer/pastoralist',
-    'farmer/pharmacy',
-    'farmer/pilot',
     'farmer/shepherds',
-    'farmers-general',
-    'farmers.',
-    'farmers.the',
-    'farmers/herdsmen',
-    'farmers/part-time',
-    'farmers_as',
-    'farmettes',
-    'farmfresh',
-    'farmful',
-    'farmholders',
-    'farmhorse',
-    'farmhorses',
-    'farmhouse-produced',
-    'farmhouse-restaurant',
-    'farmhouse-style',
     'farmhouse.',
-    'farmi',
-    'farmilon/fitter',
-    'farmimg',
-    'farmitalia',
-    'farmm',
-    'farmo&ucirc;tier-en-brie',
-    'farmoor/oxfordshire',
-    'farmout',
-    'farms.this',
-    'farmshop',
-    'farmstead/joint',
-    'farmtoy',
-    'farmyard-fresh',
-    'farn',
-    'farnascullogue',
     'farnbor',
-    'farnby',
-    'farndale-style',
-    'farnes-barnes',
-    'farnesene',
-    'farnesol',
-    'farnesyl',
-    'farnetani',
-    'farnfield',
-    'farnham-based',
-    'farnhams',
-    'farnhan',
-    'farnhorough',
-    'farnley',
-    'farnol',
-    'farnsagh',
     'farnsworth/antique',
-    'farnton',
-    'farokhzad',
-    'farook',
-    'farooqi',
-    'farouchely',
-    'faroudja',
-    'farouk-like',
-    'farouk-sluglett',
-    'farous',
-    'faroutski',
-    'farouz',
-    'farqirullah',
-    'farquarsons',
-    'farr/customer',
-    'farradane',
     'farradiddle',
-    'farragon',
-    'farragut',
-    'farrahs',
-    'farrakhanist',
-    'farrall',
-    'farran',
-    'farrand.',
-    'farrand/solar',
-    'farrar-hockley/former',
-    'farrar-hockley/korean',
-    'farrar.ardiles',
-    'farrar/former',
-    'farrara',
-    'farre',
-    'farreely',
     'farrell-donaldson',
-    'farrell/avon',
-    'farrell/friend',
-    'farrell/skin',
-    'farrenc',
-    'farrens',
-    'farril',
-    'farring',
-    'farrington/defence',
-    'farro',
-    'farrokhnia',
-    'farrol',
-    'farrucca',
-    'farrugia',
-    'farsan',
-    'farsetti',
     'farsham',
-    'farsley',
-    'fart-arsed',
-    'fart-arsing',
-    'fart-artist',
-    'fart-breaths',
-    'fart-catcher',
-    'fart-sucker',
-    'farter',
-    'fartface',
-    'fartfelt',
-    'farther-flung',
-    'farthingstone',
-    'fartlek',
-    'fartynge',
-    'farudin',
     'faruqi',
-    'farvefabrik',
-    'farvel',
-    'farver',
-    'farvings',
-    'farvver.',
-    'farwater',
-    'faryad',
-    'fas(t)n',
-    'fasanen',
-    'fasanenstrasse',
-    'fasb-sponsored',
-    'fasce',
-    'fasch',
-    'fasci',
-    'fascial',
     'fasciata',
-    'fascicularis',
-    'fascicule',
-    'fasciectomy',
-    'fasciitis',
-    'fascinans',
-    'fascinatin\'',
-    'fascination\'',
-    'fascinatrix',
-    'fascio-maxillary',
-    'fasciola',
-    'fascisms',
-    'fascist&rehy;brutalist',
-    'fascist-motivated',
-    'fascist-style',
-    'fascist-sympathiser',
     'fascist/nazi',
-    'fascists.',
-    'fashed',
-    'fasheh',
-    'fasher',
-    'fashio',
-    'fashion&rehy;conscious',
-    'fashion-',
-    'fashion-aware',
-    'fashion-clothing',
-    'fashion-design',
-    'fashion-features',
-    'fashion-houses',
-    'fashion-induced',
-    'fashion-led',
-    'fashion-like',
     'fashion-lovers',
-    'fashion-magazine',
-    'fashion-model',
-    'fashion-modelly',
-    'fashion-parade',
-    'fashion-ridden',
-    'fashion-seekers',
-    'fashion-shops',
-    'fashion-speak',
-    'fashion-victim',
-    'fashion-wearing',
-    'fashion/textile',
-    'fashion_in',
-    'fashionable/musical/',
-    'fashioneds',
-    'fashionites',
     'fashionline',
-    'fashionmodel',
-    'fashions-change',
-    'fashionwear',
-    'fashioon',
-    'fashport',
-    'fasing',
-    'fasisculus',
-    'fasman',
-    'fasolt',
-    'fasona',
-    'fasquel',
-    'fassam',
-    'fassano',
-    'fassi',
-    'fasso',
     'fast&rehy;changing',
-    'fast&rehy;disappearing',
-    'fast&rehy;drying',
-    'fast&rehy;written',
-    'fast\'ned',
-    'fast-appreciating',
-    'fast-becoming-barren',
-    'fast-blow',
-    'fast-bowlers',
-    'fast-buck',
-    'fast-charger',
-    'fast-day',
-    'fast-days',
-    'fast-dealing',
-    'fast-declining',
-    'fast-depleting',
     'fast-disbursing',
-    'fast-emerging',
-    'fast-encroaching',
-    'fast-fading',
-    'fast-falling',
-    'fast-fatteners',
-    'fast-firers',
-    'fast-fixing',
-    'fast-flagging',
-    'fast-flowering',
-    'fast-fooderies',
-    'fast-footed',
-    'fast-freeze',
-    'fast-held',
-    'fast-in/fast-out',
-    'fast-it',
     'fast-knotted',
-    'fast-link',
-    'fast-loading',
-    'fast-looking',
-    'fast-maturing',
-    'fast-multiplying',
-    'fast-paint',
-    'fast-pecking',
-    'fast-phase',
-    'fast-picked',
-    'fast-pressing',
-    'fast-raiding',
-    'fast-reacting',
-    'fast-reboot',
-    'fast-red',
-    'fast-reducing',
     'fast-reforming',
-    'fast-retrieve',
-    'fast-riding',
-    'fast-rope',
-    'fast-run',
-    'fast-scoring',
-    'fast-selling',
-    'fast-settling',
-    'fast-shrinking',
-    'fast-sounding',
-    'fast-spoken',
-    'fast-spreading',
-    'fast-starting',
-    'fast-thinking',
-    'fast-threat',
-    'fast-tracked',
     'fast-twirling',
-    'fast-twitch',
-    'fast-vanishing',
-    'fast-varying',
-    'fast-weaving',
-    'fast-wheeling',
-    'fast-working',
-    'fast-wrinkling',
-    'fast/quick',
-    'fast/reliable',
-    'fast=',
-    'fastball',
-    'fastballs',
-    'fastbuild',
-    'fastcomm',
-    'fastened-just',
     'faster&ndash',
-    'faster-drying',
-    'faster-fading',
-    'faster-innovating',
-    'faster-migrating',
-    'faster-pace',
-    'faster-paced',
-    'faster-spreading',
-    'faster-than',
-    'faster-than-average',
-    'faster-than-projected',
-    'faster-than-usual',
-    'faster-they',
-    'faster.',
-    'faster/slower',
-    'fastest-',
     'fastest-evolving',
-    'fastest-expanding',
-    'fastest-rising',
-    'fastest-rotating',
-    'fastest-spreading',
-    'fastestgrowing',
-    'fastfilter',
-    'fastfingers',
-    'fastflow',
-    'fastframe',
-    'fastfret',
-    'fastgrowth',
-    'fastidiously-dressed',
-    'fasties',
-    'fastish',
-    'fastload',
     'fastly',
-    'fastmath',
-    'fastmoving',
-    'fastopen',
-    'fastp',
-    'fastpaced',
-    'fastpacket',
-    'fastpath',
-    'fastrac',
-    'fastrada',
-    'fat&eacute',
-    'fat&mdash',
-    'fat&rehy;chett',
-    'fat-3',
-    'fat-a-lump',
-    'fat-arsed',
     'fat-awareness',
-    'fat-barrelled',
-    'fat-bastard-with-a-beard-dead-in-the-bath',
-    'fat-bottom',
-    'fat-brained',
-    'fat-burning',
-    'fat-cheeked',
-    'fat-coated',
-    'fat-dense',
-    'fat-gain',
-    'fat-hatred',
-    'fat-lipped',
-    'fat-loss',
-    'fat-melter',
-    'fat-packed',
-    'fat-producing',
     'fat-reduced',
-    'fat-soaked',
-    'fat-solvents',
-    'fat-specific',
-    'fat-stock',
-    'fat-storing',
-    'fat-thumbed',
-    'fat-walleted',
-    'fat-wrapped',
-    'fat/24',
-    'fat/alkali',
-    'fat/health',
-    'fatae',
-    'fatah-affiliated',
-    'fatah-inspired',
-    'fatah/islamic',
     'fatahland',
-    'fatal&mdash;thecourt',
-    'fatal.',
-    'fatalis',
-    'fatals',
-    'fatamid',
-    'fatar',
-    'fatbit',
-    'fatboys',
-    'fatcats',
-    'fate&mdash;i',
-    'fate.6',
-    'fate/god/luck',
-    'fatebenefratelli',
-    'fatefulness',
-    'fater',
     'fathe',
-    'father&mdash;something',
-    'father(s)',
-    'father-coach',
-    'father-complex',
-    'father-god',
-    'father-husband',
-    'father-husbands',
-    'father-i-want-to-kill-you',
-    'father-in-',
-    'father-in-law-to-be',
-    'father-in-science',
-    'father-just',
-    'father-king',
-    'father-love',
-    'father-more',
     'father-mother-children-aren\'t-we-normal',
-    'father-my',
-    'father-never',
-    'father-of',
-    'father-of&rehy;three',
-    'father-of-one',
-    'father-protest',
-    'father-religion',
-    'father-replacements',
-    'father-role',
-    'father-substitute',
-    'father-surrogates',
-    'father-to-son',
-    'father.',
-    'father/brother',
-    'father/daughter',
     'father/foetus',
-    'father/his',
-    'father/infant',
-    'father/mother/brother',
-    'father/mother/daughter/son',
-    'father/photographer/landowner',
-    'fatherfucker',
-    'fatherlands',
-    'fatherley',
-    'fatherliness',
-    'fatherly-looking',
-    'fatheya',
-    'fathhulla',
-    'fathima',
-    'fathman',
-    'fathomable',
     'fathomering',
-    'fathomes',
-    'fathomlessly',
-    'fathoms-deep',
-    'fathulla',
-    'fathy',
-    'fati',
-    'fatigue-resistant',
-    'fatigue/life',
-    'fatimeh',
-    'fatiou',
-    'fatipur',
-    'fatiya',
-    'fatlings',
-    'fatmawati',
-    'fatou',
     'fats.',
-    'fatschbach',
-    'fatseas',
-    'fatshan',
-    'fatshedera',
-    'fatsoes',
-    'fatt',
-    'fattal',
-    'fatteh',
-    'fatteners',
-    'fattenings',
-    'fatterson',
-    'fattest-ever',
-    'fattily',
-    'fatting',
-    'fatto',
     'fattori',
-    'fattoun',
-    'fatty-acid',
-    'fatty-phil',
-    'fattycakes',
-    'fatum',
-    'fatuma',
-    'fatuma-isaak',
-    'fatuousness',
-    'fatwahs',
-    'faubert',
-    'faubet',
-    'faubourg-saint-denis',
-    'faubourienne',
-    'faucets',
-    'fauchard',
     'fauchards',
-    'fauchons',
-    'fauchonville',
-    'faucon',
-    'fauconbergs',
-    'fauconnerie',
-    'fauder',
-    'faudi',
-    'faugh-a-ballagh',
-    'faughanvale',
-    'faughnan',
-    'faujas',
-    'faul-uhx',
-    'faulazo',
-    'faulchins',
-    'faulconbridge',
     'faulconer',
-    'fauld',
-    'faulding',
-    'faulenf&uuml;rst',
-    'faulkner/banbury',
-    'faulkner/coracle',
-    'faulkner/driver',
-    'faulkner/sdlp',
-    'faulkner/thames',
-    'faulkners',
-    'faull/gloucester',
-    'faullythe',
-    'faulston',
-    'fault\'',
-    'fault-block',
-    'fault-blocks',
     'fault-chasing',
-    'fault-diagnosis',
-    'fault-dissected',
-    'fault-free',
-    'fault-generated',
-    'fault-resilience',
-    'fault-tracing',
-    'fault-trees',
-    'fault/failure',
-    'fault/malfunction',
-    'fault/suggestion',
-    'faulter',
-    'faultered',
-    'faultfinding',
-    'faultily',
-    'faultline',
     'faults-notably',
-    'faults/defects',
-    'faults/reasons/remedies',
-    'faulx',
-    'faun-like',
-    'faunce',
-    'faunophiles',
-    'fauntleroys',
-    'fauntroy',
-    'fauquemont',
-    'faur&eacute;an',
-    'fausanias',
-    'faust/premier',
-    'faustine',
-    'faustische',
-    'faute-de-mieux',
     'fauteuil',
-    'fauteuils',
-    'fauve-inspired',
-    'fauve-ish',
-    'fauvet',
-    'faux-bois',
-    'faux-book',
-    'faux-bronze',
-    'faux-moralist',
-    'faux-na&iuml;f',
-    'faux-naif',
-    'faux_amis',
-    'fauxbourdon',
-    'fauxmonnayeurs',
-    'fav-oured',
-    'favager',
     'favaid-i-osmaniyeh',
-    'faverche',
-    'faveur',
-    'favites',
-    'favom',
-    'favonoid',
-    'favoritism',
-    'favory',
-    'favouarbly',
-    'favouilles',
-    'favour-as',
-    'favour-currying',
-    'favour-mongering',
-    'favourable&mdash;an',
-    'favourably.',
-    'favoured:relative',
     'favourers',
-    'favourite-last',
-    'favouriteflavoured',
-    'favouritisms',
-    'favours.',
-    'faw&rehy;cett',
-    'faw.53',
-    'fawcett-inne',
-    'fawddwy',
-    'fawdington',
-    'fawkener',
-    'fawkes/headmaster',
-    'fawlty-pounder',
-    'fawlty-style',
-    'fawn-and-white',
-    'fawn-froth',
     'fawn/tan',
-    'fawners',
-    'fawningly',
-    'fawnish',
-    'fawnless',
-    'fawny',
-    'fawsley.',
-    'fax-by-email',
-    'fax-in',
-    'fax-toting',
-    'fax-with-ocr',
-    'fax0716083283',
-    'faxbroadcast',
-    'faxe',
-    'faxes/cables',
-    'faxing/calling',
     'faxitis',
-    'faxmail',
-    'faxus',
-    'fay.',
-    'faya-largeau',
-    'fayance',
-    'fayawan',
-    'faye\'',
-    'faye.',
-    'fayery',
-    'fayez',
-    'fayid',
-    'fayiz',
-    'faylkner',
-    'fayllard',
-    'faylyng',
     'fayn',
-    'fayot',
-    'fayoumi',
-    'fayourn',
-    'fayre.',
-    'fays',
-    'fayyad',
-    'fayyum',
-    'fayzullin',
-    'fazel',
-    'fazenda',
-    'fazes',
-    'fazle',
-    'fazlic',
-    'fazloalah',
-    'fazzis',
     'fb-1',
-    'fb-24u',
-    'fb-25k',
-    'fb-40q',
-    'fb.9',
-    'fb01',
-    'fb2',
-    'fb23',
-    'fb31',
-    'fbf',
-    'fbgd/n',
-    'fbi-style',
-    'fbie',
-    'fbim',
-    'fbis',
-    'fbm',
     'fbms',
-    'fboa',
-    'fbp&mdash;progressive',
-    'fbpss',
-    'fbscale',
-    'fbsi',
-    'fbts',
-    'fbu23,000',
-    'fbu32,000',
-    'fc(m)&gt;fc(n)',
-    'fc(n1)',
-    'fc(n1)&gt;fc(n2)',
-    'fc(n2)',
-    'fc-100',
-    'fc-family',
-    'fc8',
     'fcca',
-    'fcdedm',
-    'fcdg',
-    'fcegce',
-    'fcf',
-    'fcibs',
-    'fcmo',
-    'fcn',
-    'fconsole',
-    'fcooled',
-    'fcup',
-    'fd-feather/down',
-    'fd2',
-    'fd4',
-    'fd906',
-    'fdalling',
     'fdb',
-    'fddi-v6s',
-    'fddi/utp',
-    'fde',
-    'fdf&mdash;democratic',
-    'fdight',
-    'fdldef.com',
-    'fdn',
-    'fdp&mdash;free',
-    'fdp*776.97.3',
-    'fdp-the',
-    'fdp/prd&mdash;radical',
-    'fdry',
-    'fds.',
-    'fdt',
-    'fdu',
     'fe&ccedil;or',
-    'fe&circ;te',
-    'fe&ndash',
-    'fe(cn)',
-    'fe(co)',
-    'fe(ii)-oxygen',
-    'fe(iii)-containing',
-    'fe-cu-ni',
-    'fe-dup',
-    'fe-far',
-    'fe-fi-fo-fum',
-    'fe-ti',
-    'fe/he',
-    'fe/mn',
-    'fe/university',
-    'fe2_',
     'fe85',
-    'fealar-glen',
-    'fear-a-choire',
-    'fear-arousal',
-    'fear-crazed',
-    'fear-inspiring',
-    'fear-levels',
-    'fear-mongering',
-    'fear-of&rehy;crime',
-    'fear-sharp',
-    'fear-silence',
-    'fear-stricken',
-    'fear/',
-    'fear/a',
-    'fear/things',
-    'fearbrache',
     'fearcrazed',
-    'fearedy-gowk',
-    'fearesome',
-    'fearfullest',
-    'fearless-looking',
-    'fearlessly-held',
-    'fearman',
-    'fearmonger',
-    'fearn/thames',
-    'fearnbeg',
-    'fearne',
-    'fearnought',
-    'fearns',
-    'fearnville',
-    'fearnyhough',
-    'fears&ndash;and',
     'fears/wishes',
-    'fearsome&rehy;looking',
-    'fearsomeness',
-    'fearson',
-    'feasable',
-    'feast-days',
-    'feast-time',
-    'feastdays',
-    'feasting-hall',
-    'feates',
-    'feather-brain',
-    'feather-brains',
-    'feather-cushioned',
-    'feather-filled',
-    'feather-fin',
-    'feather-footed',
     'feather-hatted',
-    'feather-insulated',
-    'feather-lightness',
-    'feather-lined',
-    'feather-plumed',
-    'feather-soft',
-    'feather-tailed',
-    'feather-weight',
-    'feather-wine',
-    'feather-work',
-    'featherbedded',
-    'featherbrain',
-    'featherbrained',
-    'feathered-footed',
-    'feathered-icing',
-    'featheredge',
     'featherheads',
-    'featherings',
-    'feathers/body',
-    'featherstars',
-    'featherstonhaugh',
-    'feathertonehaugh',
-    'featherweights',
-    'featherwheel',
-    'feathery-leafed',
-    'feathery-topped',
-    'featre',
-    'feature-a',
-    'feature-based',
-    'feature-detection',
-    'feature-detector',
-    'feature-detectors',
     'feature-i.e.',
-    'feature-in',
-    'feature-page',
-    'feature-positive',
-    'feature-rich',
-    'feature-values',
-    'feature-wise',
-    'feature-writer',
-    'feature.as',
-    'feature/letter',
-    'features****',
-    'features-perhaps',
-    'features.the',
-    'features.these',
-    'features/programmes',
-    'featurettes',
     'featuristic',
-    'featury',
-    'feau',
-    'feb&ndash;1',
-    'feb&ndash;19',
-    'feb&ndash;22',
-    'feb&ndash;30',
-    'feb&ndash;7',
-    'feb&ndash;april',
-    'feb&ndash;mar',
-    'feb-12',
-    'feb-15th',
-    'feb-march',
-    'feb.1',
-    'feb.1-2',
-    'feb.10',
     'feb.24',
-    'feb.8',
-    'feb/mar',
-    'feb20/mar20',
-    'febantel',
-    'febem',
-    'febendazole',
-    'febille',
-    'febor',
-    'febrary',
-    'febrifugal',
-    'febrilely',
-    'febrility',
-    'febris',
-    'febru',
-    'februaries',
     'february&mdash;march',
-    'february&ndash;10',
-    'february&ndash;24',
-    'february&ndash;9',
-    'february&ndash;december',
-    'february&ndash;sat',
-    'february&ndash;sun',
-    'february-1',
-    'february-26',
-    'february-9',
-    'february-december',
-    'february-early',
-    'february-may',
-    'february-november',
-    'february.',
-    'february/',
     'februry',
-    'febry',
-    'feburary',
-    'fecha',
-    'fechner-birkoff',
-    'fechter',
-    'fecit/',
-    'feck',
-    'fecl',
-    'feclt',
-    'feco',
-    'fecs',
-    'fect',
-    'fectionery',
-    'fecundable',
-    'fed&rehy;up',
     'fed/the',
-    'fed_even',
-    'fedco',
-    'fedcreds',
-    'feddan',
-    'feddon',
-    'fede',
-    'fedeco',
-    'fedel',
-    'fedeland',
-    'feder&rehy;ation',
-    'federa&ccedil&atilde;o',
-    'federal-government',
-    'federal-republican',
-    'federalize',
-    'federally-assisted',
     'federally-defined',
-    'federally-funded',
-    'federally-prescribed',
-    'federally-raised',
-    'federally-recognised',
-    'federally-sponsored',
-    'federalni',
-    'federals',
-    'federalstandards',
-    'federasts',
-    'federatie',
-    'federaton',
-    'federici',
-    'federique',
-    'federmediterraneo',
-    'federspiel',
     'fedi',
-    'fedics',
-    'fedio',
-    'fedorchak',
-    'fedorchuk',
-    'fedorowicz/director',
-    'fedoruk',
-    'fedotova',
-    'fedpols',
-    'fedrick',
-    'fedunix',
-    'fee&mdash&pound;25',
-    'fee&mdash;in',
-    'fee-basis',
-    'fee-fixing',
-    'fee-free',
     'fee-funded',
-    'fee-hiking',
-    'fee-sharing',
-    'fee-splitting',
-    'fee/client',
-    'feebate',
-    'feeble-looking',
-    'feeble-sounding',
-    'feebly-mindedly',
-    'feed&rehy;back',
-    'feed-',
-    'feed-back-loops',
-    'feed-bag',
-    'feed-conversion',
-    'feed-grains',
-    'feed-line',
     'feed-related',
-    'feed-store',
-    'feed-time',
-    'feed-troughs',
-    'feed-water',
-    'feed/tack',
-    'feedand-expansion',
-    'feedba',
-    'feedback-drenched',
-    'feedback/evaluation',
-    'feedback/information',
-    'feedbackers',
-    'feedbox',
-    'feede',
-    'feeder.',
-    'feeder/leger',
     'feeder_as',
-    'feedered',
-    'feederliner',
-    'feedeth',
-    'feedgrains',
-    'feedhouse',
-    'feeding-bottle',
-    'feeding-grounds',
-    'feeding-places',
-    'feeding-point',
-    'feeding-points',
-    'feeding/nutrition',
-    'feedlot',
-    'feedlots',
-    'feedpond',
-    'feedstuff',
     'feedthrough',
-    'feegletscher',
-    'feehan',
-    'feel\'',
-    'feel\'/',
-    'feel\'um',
-    'feel-goodism',
-    'feel-it-in-the-bone',
-    'feel-oriented',
-    'feel-the-response',
-    'feel/how',
-    'feel_a',
-    'feel_as',
-    'feel_no',
-    'feelability',
-    'feelable',
     'feelbad',
-    'feeler-like',
-    'feelered',
-    'feelest',
-    'feeley/mother',
-    'feeleys',
-    'feelin',
-    'feeling\'&mdash;but',
-    'feeling-',
-    'feeling-behind',
-    'feeling-expression',
-    'feeling-hate',
-    'feeling-tone',
-    'feeling/thought',
-    'feeling/tough',
-    'feeling:the',
     'feelingless',
-    'feelings-of-being-consulted',
-    'feelings-of-being-valuable',
-    'feelings/affective',
-    'feels.the',
-    'feels/the',
-    'feely-touchy',
-    'feenan',
-    'feepayer',
-    'feering',
-    'feery',
-    'fees.',
-    'fees/bills',
-    'fees/school',
-    'feesh',
-    'feet\'',
     'feet-',
-    'feet-\'i',
-    'feet-breaking',
-    'feet-five',
-    'feet-flat-on-the-floor',
-    'feet-high',
-    'feet-off',
-    'feet-on-the-ground',
-    'feet-per-minute',
-    'feet-planted',
-    'feet-plus',
-    'feet-rhyming',
-    'feet-ten',
-    'feet/2.1',
-    'feet/second',
-    'feetafeet',
     'feetafeetit',
-    'feetbones',
-    'feeted',
-    'feetham',
-    'feg',
-    'fegetting',
-    'feggans',
-    'fegina',
-    'fegman',
-    'feh',
-    'fehertys',
-    'fehl',
-    'fehling',
-    'fehlsdorf',
-    'fehn',
-    'fehrs',
     'feibusch',
-    'feid',
-    'feidhlim',
-    'feidr',
-    'feifdom',
-    'feige',
-    'feigele',
-    'feigenbaum.',
-    'feigin',
-    'feij&oacute;o',
-    'feilchenfeldt',
-    'feild',
-    'feiling',
-    'fein/ira',
-    'feinbiochemica',
-    'feinchemikalien',
     'feind',
-    'feiner',
-    'feingarten',
-    'feininga',
-    'feinne-bheinn',
-    'feinner',
-    'feinstein-iba&ntilde;ez',
-    'feira',
-    'feireiss',
-    'feiris',
-    'feirus',
-    'feisel',
-    'feistiest',
-    'feistily',
-    'feistiness',
-    'feistritz',
     'feit',
-    'feitas',
-    'feiteiras',
-    'feithean',
-    'feizor',
-    'fejn',
-    'fekadu',
-    'fekih',
-    'fekter',
-    'fel&amp;sup1,2,3',
-    'felafacs',
-    'felafel',
-    'felbiger',
-    'felbridge',
-    'felde',
-    'feldeggii',
     'feldgendarm',
-    'feldgrau',
-    'feldgrill-zankell',
-    'feldkamp',
-    'feldmarschallin',
-    'felds',
-    'feldwebelhaft',
-    'feldwebels',
-    'feleccia',
-    'feleke',
-    'felekeddin',
-    'felgate/tim',
-    'feli',
-    'felicetti',
-    'felicie',
-    'felicisimo',
     'felicit&aacute',
-    'felicite',
-    'felicite\'',
-    'feliciter',
-    'felicity\'',
-    'felin-y-gors',
-    'felinoids',
-    'felipismo',
-    'feliu',
-    'felix-hubert',
-    'felix-ited',
-    'felixes',
-    'felixstoe',
-    'felixstowe-based',
-    'felixstowe-bound',
-    'felixtowe',
     'fell-bordering',
-    'fell-length',
-    'fell-mongeries',
-    'fell-runner',
-    'fell-time',
-    'fella-me-lad',
-    'fellah-i-puts',
-    'fellate',
-    'fellating',
-    'fellators',
-    'fellbridge',
-    'fellbrook',
-    'felle',
-    'felled/nimbrethil',
-    'feller-me-lads',
-    'feller/butcher',
     'fellesdata',
-    'fellgate',
-    'fellick',
-    'fellin',
-    'felling-saw',
-    'fellingham',
-    'fellings',
-    'fellini-like',
-    'felliship',
-    'fellmonger',
-    'fellmongers',
-    'fellon',
-    'fellow&rehy;journalist',
-    'fellow&rehy;judges',
-    'fellow&rehy;savoyard',
-    'fellow&rehy;travellers',
     'fellow-academicians',
-    'fellow-actor',
-    'fellow-actors',
-    'fellow-americans',
-    'fellow-apprentice',
-    'fellow-arabs',
-    'fellow-archbishop',
-    'fellow-artist',
-    'fellow-asians',
-    'fellow-athenians',
-    'fellow-athletes',
-    'fellow-australian',
-    'fellow-barrister',
-    'fellow-batsmen',
-    'fellow-being',
-    'fellow-beings',
     'fellow-black',
-    'fellow-canon',
-    'fellow-captains',
-    'fellow-catholic',
-    'fellow-centre',
-    'fellow-christian',
-    'fellow-classicist',
-    'fellow-clergy',
-    'fellow-cockney',
-    'fellow-commanders',
-    'fellow-commoners',
-    'fellow-communists',
-    'fellow-composer',
-    'fellow-conservatives',
-    'fellow-countrywomen',
-    'fellow-creature',
     'fellow-critic',
-    'fellow-crusaders',
-    'fellow-curate',
-    'fellow-dancers',
-    'fellow-deaf',
-    'fellow-democrat',
-    'fellow-directors',
-    'fellow-earther',
-    'fellow-electors',
-    'fellow-employees',
-    'fellow-europeans',
-    'fellow-ex',
-    'fellow-exiles',
-    'fellow-feaster',
-    'fellow-fleming',
-    'fellow-generals',
     'fellow-governors',
-    'fellow-greeks',
-    'fellow-hfs',
-    'fellow-hildas',
-    'fellow-human',
-    'fellow-humans',
-    'fellow-inhabitants',
-    'fellow-inmates',
-    'fellow-invaders',
-    'fellow-irishmen',
-    'fellow-kabyes',
-    'fellow-king',
-    'fellow-labourers',
-    'fellow-lawyers',
-    'fellow-loner',
-    'fellow-magicians',
     'fellow-magnates',
-    'fellow-man',
-    'fellow-mancs',
-    'fellow-me-lad',
-    'fellow-me-lads',
-    'fellow-men.',
-    'fellow-minister',
-    'fellow-missionary',
-    'fellow-mp',
-    'fellow-muslims',
-    'fellow-northerner',
-    'fellow-officer',
-    'fellow-olympians',
-    'fellow-outsider',
-    'fellow-parishioners',
-    'fellow-participant',
     'fellow-patients',
-    'fellow-philosopher',
-    'fellow-picket',
-    'fellow-pilgrims',
-    'fellow-pilots',
-    'fellow-pioneer',
-    'fellow-poles',
-    'fellow-presbyter',
-    'fellow-prisoner',
-    'fellow-producers',
-    'fellow-protesters',
-    'fellow-provincial',
-    'fellow-psychologists',
-    'fellow-puritans',
-    'fellow-rat',
-    'fellow-rebel',
     'fellow-rebels',
-    'fellow-reporter',
-    'fellow-residents',
-    'fellow-rider',
-    'fellow-rulers',
-    'fellow-scots',
-    'fellow-scotsman',
-    'fellow-scribbler',
-    'fellow-servants',
-    'fellow-socialist',
-    'fellow-soldier',
-    'fellow-soldiers',
-    'fellow-spirit',
-    'fellow-sprinter',
-    'fellow-star',
-    'fellow-struggler',
     'fellow-strugglers',
-    'fellow-subaltern',
-    'fellow-suf&rehy;ferers',
-    'fellow-sufferers',
-    'fellow-supporters',
-    'fellow-thai',
-    'fellow-tipplers',
-    'fellow-toilers',
-    'fellow-tribesmen',
-    'fellow-ulsterman',
-    'fellow-undergraduates',
-    'fellow-victorian',
-    'fellow-voyagers',
-    'fellow-warriors',
-    'fellow-witness',
-    'fellow-woodsmen',
     'fellow-worker',
-    'fellow-workman',
-    'fellow-worshipper',
-    'fellow-writer',
-    'fellow/european',
-    'felloweses',
-    'fellowship.',
-    'fellowshipping',
-    'fellowshop',
-    'fellsides',
-    'fellstone',
-    'felltops',
-    'fellwalker',
-    'fellwort',
-    'felly',
-    'felmingham',
     'felony-murder',
-    'felperin',
-    'felpham',
-    'felsen',
-    'felsenegg',
-    'felsenfeld',
-    'felser',
-    'felsite',
-    'felson',
-    'felstein',
-    'felstone',
-    'felt&mdash;but',
-    'felt&mdash;that',
-    'felt-fair',
-    'felt-headed',
-    'felt-lined',
     'felt-makers',
-    'felt-pen',
-    'felt-textured',
-    'felt-the',
-    'felt_a',
-    'felten',
-    'feltham-based',
-    'feltham/villager',
-    'feltmakers',
-    'feltman',
-    'felton/estate',
-    'feltrinelli',
-    'felyng',
-    'felzmann',
-    'fem&atilde;o',
-    'fem-metallists',
     'fem-power',
-    'femaal',
-    'female&rehy;rich',
-    'female(s)',
-    'female-',
-    'female-appropriate',
-    'female-associated',
-    'female-based',
-    'female-biased',
-    'female-defined',
-    'female-father',
-    'female-flattering',
-    'female-kind',
-    'female-ness',
-    'female-reader',
-    'female-torso',
     'female/black',
-    'female/private',
-    'females.',
-    'femando',
-    'fembot',
-    'femenina',
-    'femgems',
-    'femgliah',
-    'femia',
-    'femicide',
-    'femin',
-    'feminae',
-    'feminead',
-    'feminella',
-    'feminemesis',
-    'feminin',
     'feminine-coded',
-    'feminine-identified',
-    'feminine-looking',
-    'feminine/feminist',
-    'feminine/masculine',
-    'femininely',
-    'feminines',
-    'femininist',
-    'femininity/masculinity',
-    'feminisations',
-    'feminisim',
-    'feminisism',
-    'feminism.and',
-    'feminist-influenced',
-    'feminist-puritanical',
-    'feminist-socialist',
     'feminist-sociologist',
-    'feminist/socialists',
-    'feministas',
-    'feminists/human',
-    'feminite',
-    'feminize',
-    'feminizes',
-    'feminizing',
-    'femme-type',
-    'femme-y',
-    'femmina',
-    'femodene',
-    'femoseconds',
-    'femtoskirt',
-    'femur-tibia',
-    'femy',
     'fen&euml;tre',
-    'fen-es-trar-lis',
-    'fen-sucked',
-    'fenari-is',
-    'fencamsamin',
-    'fence-builder',
-    'fence-building',
-    'fence-cutting',
-    'fence-fix',
-    'fence-hopping',
-    'fence-jumping',
-    'fence-lines',
-    'fence-panel',
-    'fence-sitter',
-    'fence-which',
-    'fence-wire',
     'fence/hole',
-    'fenced-i-meadow',
-    'fenceless',
-    'fencepost',
-    'fencot/oxfordshire',
-    'fencote',
-    'fencott/oxfordshire',
-    'fendent',
-    'fender-style',
-    'fender-type',
-    'fender/buddy',
-    'fenderbird',
-    'fenderesky',
-    'fenderi',
-    'fendick',
-    'fendis',
     'fendt',
-    'fenek',
-    'fenella.',
-    'fenestrates',
-    'fenestrations',
-    'fenestrations.',
-    'fenestre',
-    'fenestrellids',
-    'fenetre',
-    'feng-hsu',
-    'feng-shui',
-    'fengtai',
-    'fengu',
-    'fenhalls',
-    'fenham',
-    'feni',
     'fenianism',
-    'fenici',
-    'fenioux',
-    'fenjal',
-    'fenjal/gh',
-    'fenley',
-    'fenmd',
-    'fenn-tye',
-    'fenn/centre',
-    'fennec',
-    'fennel-stalk',
-    'fennellqc',
-    'fennema',
-    'fennessy',
-    'fennie',
-    'fennimore',
     'fenning',
-    'fenny-flat',
-    'fenodyree',
-    'fenoxaprop-ethyl',
-    'fenpropimorph',
-    'fenra',
-    'fensome',
-    'fenster',
-    'fensterwald',
-    'fensvig',
-    'fent',
-    'fenton/student',
-    'fents',
-    'fenvalerate',
-    'fenwich',
-    'fenwicke-clennell',
     'fenwoman',
-    'fenzi',
-    'feo(oh)',
-    'feo/mno',
-    'feock',
-    'feodorov',
-    'feodorovna',
-    'feodorum',
-    'fep',
-    'fepg',
-    'feraccas',
-    'feral-looking',
-    'ferales',
-    'ferally-bright',
-    'feramez',
-    'feran',
     'ferapontovyy',
-    'ferards',
-    'feray',
-    'ferber',
-    'ferchase',
-    'ferchrissake',
-    'ferchristssake',
-    'ferddig',
-    'ferde',
-    'ferderic',
-    'ferdful',
-    'ferdfull',
-    'ferdinandi-coburgii',
-    'ferdinandson',
-    'ferdowsian',
-    'ferds',
     'fere',
-    'ferengi',
-    'ferenzvaros',
-    'fereydun',
-    'fereys',
-    'ferforth',
-    'ferge',
-    'fergie-out',
-    'fergie-son',
-    'fergie-wergie',
-    'fergislie',
-    'fergs',
-    'fergursons',
-    'fergus/barclay',
-    'ferguson-developed',
-    'ferguson-funded',
     'ferguson-type',
-    'ferguson-v-mcgrandles',
-    'ferguson/atomic',
-    'ferguson/nationwide',
-    'ferguson/resident',
-    'ferguson/vet',
-    'ferhad',
-    'ferhad-pasha',
-    'ferhan',
-    'ferhat',
-    'ferie',
-    'ferier',
-    'feriha',
-    'ferik',
-    'feringhee',
-    'feringhi',
     'feringomalee',
-    'ferkauf',
-    'ferkin',
-    'ferlini',
-    'ferm',
-    'ferm&aacute;n',
-    'ferm&eacute;s',
-    'fermanagah',
-    'fermangh',
-    'fermariello',
-    'fermatas',
-    'fermee',
-    'fermenta',
-    'fermentative',
-    'fermer',
-    'fermet&eacute',
     'fermetoun',
-    'fermi-dirac',
-    'fermier',
-    'fermis',
-    'fern&aacute;ndez-galiano',
-    'fern&atilde;o',
-    'fern-book',
-    'fern-collection',
-    'fern-dominated',
-    'fern-fringed',
-    'fern-gatherer',
-    'fern-hung',
-    'fern-leaved',
-    'fern/british',
-    'fern/network',
-    'fern/patient',
     'fernandell',
-    'fernandeshealth',
-    'fernandesindustry',
-    'fernandez-britto',
-    'fernandez-llorente',
-    'fernandez-mir&oacute',
-    'fernandez-ochoa',
-    'fernandos',
-    'fernborough',
-    'fernbury',
-    'fernel',
-    'fernery',
-    'fernet',
-    'ferngully',
-    'fernilee',
-    'fernlands',
     'fernleaf',
-    'fernon',
-    'ferociousness',
-    'ferocities',
-    'ferocity.',
-    'feroda',
-    'feron',
-    'ferouk',
-    'feroxcube',
-    'feroz',
-    'ferozepur',
-    'ferr&egrave',
-    'ferr*',
-    'ferragosto',
-    'ferrailles',
-    'ferraiuoli',
     'ferrand/govenor',
-    'ferrandais',
-    'ferrangi',
-    'ferrano',
-    'ferrante/father',
-    'ferrantis',
-    'ferraresi',
-    'ferrari-driving',
-    'ferrari-iba&ntilde;ez-griffiths',
-    'ferrari-red',
-    'ferrari.',
-    'ferrari/mother',
-    'ferrarin',
-    'ferrarini',
-    'ferrarone',
-    'ferrazzini',
     'ferre.',
-    'ferrebe',
-    'ferredoxin',
-    'ferreirai',
-    'ferrell',
-    'ferreol',
-    'ferrera',
-    'ferreres',
-    'ferrers/home',
-    'ferret-box',
-    'ferret-cage',
-    'ferret-face',
-    'ferreting-out',
-    'ferretings',
-    'ferretlike',
-    'ferreyra',
     'ferri.runs',
-    'ferri/pietro',
-    'ferric-chloride',
-    'ferricrete',
-    'ferries-sponsored',
-    'ferries-to-orient',
-    'ferries-to-trailers',
-    'ferries/hoverspeed',
-    'ferrigno',
-    'ferrini',
-    'ferris-wheel',
-    'ferrishyn',
-    'ferrit',
-    'ferrite-rod',
-    'ferritic',
-    'ferrocarril',
     'ferrocarrilles',
-    'ferroconcrete',
-    'ferrocrete',
-    'ferrocyanide',
-    'ferrograph',
-    'ferromagnesian',
-    'ferromagnet',
-    'ferromagnets',
-    'ferromatik',
-    'ferromyn',
-    'ferron',
-    'ferroniere',
-    'ferrosan',
-    'ferroviaires',
-    'ferroviaria',
-    'ferroviario',
     'ferroviarios',
-    'ferrovitreous',
-    'ferroxcube',
-    'ferrozine',
-    'ferruch',
-    'ferrugineus',
-    'ferrule.',
-    'ferry-based',
-    'ferry-boat',
-    'ferry-bus',
-    'ferry-fume',
-    'ferry-inclusive',
-    'ferry/hovercraft/seacat',
-    'ferry/hydrofoil',
-    'ferryboats',
-    'ferryhill.name',
     'ferryill',
-    'ferryman/farm',
-    'ferrymasters',
-    'ferstl',
-    'ferteh',
-    'fertica',
-    'fertile-looking',
-    'fertilely',
-    'fertililty',
-    'fertiliser-the',
-    'fertiliser/grain',
-    'fertilisier',
-    'fertility&rehy;cult',
-    'fertility-breads',
-    'fertility-magic',
-    'fertilizations',
     'fertilizer100',
-    'fertilizers_on',
-    'fertilube',
-    'fertizol',
-    'fertlity',
-    'fertman',
-    'fertoniere',
-    'ferule',
-    'feruntur',
-    'ferus',
-    'feruzzi',
-    'fervently-held',
-    'fervidly',
-    'fervours',
-    'fes&rehy;tooned',
-    'fesh',
     'feshane',
-    'feshie',
-    'fesole',
-    'fessal',
-    'fesse',
-    'fessed',
-    'festegem',
-    'festehalle',
-    'festerey',
-    'festetics',
-    'festi&rehy;val',
-    'festinniog',
-    'festival-cum-carnival',
-    'festival.so',
-    'festivally',
-    'festive-day',
     'festivitates',
-    'festivums',
-    'festivus',
-    'festos',
-    'festuea',
-    'fesw',
-    'fetch-and-carry',
-    'fetchit',
-    'fete-style',
-    'fete-time',
-    'fethallah',
-    'fetherston-godley',
-    'fetherston_et',
-    'fethiye/turkey',
-    'fetilia',
-    'fetilisation',
     'feting',
-    'fetis',
-    'fetisch',
-    'fetish-chains',
-    'fetish-charms',
-    'fetishistically',
-    'fetishization',
-    'fetishwear',
-    'fetisov',
-    'fetisova',
-    'fetisso',
-    'fetke',
-    'fetoplacental',
-    'fetplaces',
-    'fett\'red',
-    'fettercairn',
     'fettucini',
-    'fetum',
-    'fetumi',
-    'fetus.',
-    'feud-ridden',
-    'feudal-aristocratic-agrarian',
-    'feudal-like',
-    'feudal-military',
-    'feudal-minded',
-    'feudal-patriarchal',
-    'feudal-system',
-    'feudal-type',
-    'feudalist\'',
-    'feudaliz&rehy;ation',
-    'feudalized',
-    'feudally',
     'feuduty',
-    'feuerback',
-    'feuferme',
-    'feugh',
-    'feuillard',
-    'feuille',
-    'feuillerat',
-    'feuillet',
-    'feuillet&eacute',
-    'feulgen-stained',
-    'feus',
-    'feustel',
-    'feuvre',
-    'feux',
-    'fever-bearing',
-    'fever-haunted',
     'fever-induced',
-    'fever-infested',
-    'fever-spot',
-    'fever-steppes',
-    'fever-stricken',
-    'fever-van',
-    'feverack',
-    'feverills',
-    'feverish-looking',
-    'feverously',
-    'feverstein',
-    'fevronia',
-    'fevum',
-    'fevver',
-    'few&mdash;perhaps',
-    'few\'',
     'few-brown',
-    'few-minutes',
-    'few.',
-    'few/',
-    'few/odyssey',
-    'fewcher',
-    'fewcott',
-    'fewcott/oxfordshire',
-    'fewe',
-    'fewell',
-    'fewins',
-    'fewins/gard',
-    'fewsdale',
-    'fewson',
-    'fewster',
-    'fewston',
     'fewtrell/former',
-    'fey-faced',
-    'feyer',
-    'feyerabendian',
-    'feyfar',
-    'feynmann',
-    'feynt',
-    'feystown',
-    'feyther',
-    'feyyaz',
-    'fez-topped',
-    'fezensac',
-    'fezes',
-    'ff1,400',
-    'ff1.2&ndash;1.8m',
-    'ff100.',
     'ff113m',
-    'ff125',
-    'ff13.9',
-    'ff140',
-    'ff1465',
-    'ff165',
-    'ff1800',
-    'ff188m',
-    'ff1m',
-    'ff20',
-    'ff21,658',
-    'ff210m',
-    'ff29.2',
-    'ff3,007',
-    'ff300,000&ndash;400,000',
-    'ff300m',
     'ff38',
-    'ff3m',
-    'ff4.70',
-    'ff4.93',
-    'ff40',
-    'ff400&ndash;600,000',
-    'ff5&frac12',
-    'ff500&ndash;700,000',
-    'ff5500rfbx9',
-    'ff600m',
-    'ff70',
-    'ff700m',
-    'ff823,180',
-    'ff8400',
-    'ff85',
-    'ff923,000',
     'ffabian',
-    'ffas',
-    'ffccccfcffffffffffcfccffffffffff',
-    'ffccfffffcffffffffccccccccfcffcc',
-    'ffck',
-    'ffeaver',
-    'ffees',
-    'ffells',
-    'ffenning',
-    'ffet',
-    'fffft',
-    'fffm',
-    'fffmv',
-    'fffwwaaw',
-    'ffiii',
-    'ffilmiau',
     'ffis/gh',
-    'ffishers',
-    'ffive',
-    'ffl/scan/re',
-    'fflanders',
-    'ffloute',
-    'ffolkes',
-    'fforde/national',
-    'fforest-fach',
-    'fforge',
-    'fforiwr',
-    'fforth',
-    'ffoss',
-    'ffount',
-    'ffour',
-    'ffourty',
     'ffp',
-    'ffr1&ndash;1.5',
-    'ffr1&ndash;1.5m',
-    'ffr1,000',
-    'ffr1,297,000',
-    'ffr1.16',
-    'ffr1.2-1.5m',
-    'ffr1.21',
-    'ffr1.34bn',
-    'ffr1.407',
-    'ffr1.5&ndash;1.8m',
-    'ffr1.54',
-    'ffr1.6',
-    'ffr1.7',
-    'ffr1.8&ndash;2.2m',
-    'ffr10,000&ndash;100,000',
     'ffr10,000&ndash;50,000',
-    'ffr10.7m',
-    'ffr100,000',
-    'ffr100m',
-    'ffr103',
-    'ffr10m',
-    'ffr11.76',
-    'ffr12,000',
-    'ffr12,000&ndash;80,000',
-    'ffr12.44',
-    'ffr120&ndash;150,000',
-    'ffr120m',
-    'ffr125,000',
-    'ffr13,888,000',
-    'ffr13.529',
-    'ffr130',
     'ffr14',
-    'ffr14,000',
-    'ffr146bn',
-    'ffr147m',
-    'ffr1490',
-    'ffr15,000',
-    'ffr155',
-    'ffr16',
-    'ffr16.5',
-    'ffr17',
-    'ffr175m',
-    'ffr18,000&ndash;25,000',
-    'ffr18.8',
-    'ffr180.5',
-    'ffr1850',
-    'ffr188m',
     'ffr2,380,000',
-    'ffr2.08',
-    'ffr2.2',
-    'ffr2.450',
-    'ffr2.5&ndash;3.5m',
-    'ffr2.5m',
-    'ffr2.8',
-    'ffr200&ndash;250,000',
-    'ffr200&ndash;300,000',
-    'ffr20bn',
-    'ffr21.22',
-    'ffr21.450',
-    'ffr211',
-    'ffr22.9',
-    'ffr225',
-    'ffr228,000',
     'ffr240,000',
-    'ffr240m',
-    'ffr25&ndash;50,000',
-    'ffr2500',
-    'ffr278',
-    'ffr289,000',
-    'ffr28m',
-    'ffr29.5m',
-    'ffr29.9bn',
-    'ffr3&ndash;5',
-    'ffr3,424,000',
-    'ffr3.2',
-    'ffr3.3',
-    'ffr3.6',
-    'ffr3.8',
-    'ffr30&ndash;35',
     'ffr30&ndash;40,000',
-    'ffr310&ndash;330',
-    'ffr314',
-    'ffr314.9',
-    'ffr319',
-    'ffr32',
-    'ffr320,000',
-    'ffr34.2',
-    'ffr35',
-    'ffr350m',
-    'ffr357m',
-    'ffr360',
-    'ffr363',
-    'ffr37',
-    'ffr383',
-    'ffr385',
     'ffr4&ndash;6',
-    'ffr4&ndash;6m',
-    'ffr4,000',
-    'ffr4,500',
-    'ffr4.5&ndash;5.9',
-    'ffr400,000',
-    'ffr400,000&ndash;500,000',
-    'ffr408m',
-    'ffr41',
-    'ffr410',
-    'ffr42',
-    'ffr420',
-    'ffr420,000',
-    'ffr43&ndash;65',
-    'ffr450,000',
-    'ffr46.77',
     'ffr480,000',
-    'ffr490',
-    'ffr5&ndash;50,000',
-    'ffr5&ndash;6',
-    'ffr5.7',
-    'ffr5.8',
-    'ffr500',
-    'ffr500&ndash;600,000',
-    'ffr500,000&ndash;1.4',
-    'ffr511,000',
-    'ffr53',
-    'ffr53bn',
-    'ffr550,000&ndash;650,000',
-    'ffr59.1m',
-    'ffr6&ndash;8',
-    'ffr6,681,000',
     'ffr6.3bn',
-    'ffr6.5',
-    'ffr6.76bn',
-    'ffr60,000&ndash;80,000',
-    'ffr600',
-    'ffr600,000',
-    'ffr600m',
-    'ffr62',
-    'ffr68.4bn',
-    'ffr680',
-    'ffr7',
-    'ffr7.8',
-    'ffr70',
-    'ffr70,000&ndash;150,000',
-    'ffr700&ndash;900,000',
-    'ffr700,000',
     'ffr700,000&ndash;1m',
-    'ffr72',
-    'ffr75.1m',
-    'ffr750',
-    'ffr750,000',
-    'ffr8&ndash;10',
-    'ffr8,880,000',
-    'ffr8.4',
-    'ffr8.9',
-    'ffr80&ndash;100',
-    'ffr800&ndash;1',
-    'ffr800,000&ndash;1',
-    'ffr800,000-ffr1',
-    'ffr83',
-    'ffr832,500',
-    'ffr850,000',
     'ffr850,000&ndash;1,200,000',
-    'ffr880,000',
-    'ffr880m',
-    'ffr887m',
-    'ffr9.29',
-    'ffr9.29m',
-    'ffr9.5',
-    'ffr9.68',
-    'ffr94.3bn',
-    'ffr950',
-    'ffr97',
-    'ffr995',
-    'ffrancon',
-    'ffrey',
-    'ffrom',
-    'ffss',
     'ffwddog',
-    'ffytche',
-    'fg&ndash;1d',
-    'fg-1d',
-    'fg.',
-    'fg12sa',
-    'fg260',
-    'fg51f',
-    'fg87u',
-    'fga',
-    'fga.9',
-    'fgc',
-    'fgd-fitted',
-    'fgd.',
-    'fgds',
-    'fgeet',
     'fghl',
-    'fgifteen',
-    'fglh',
-    'fgnm',
-    'fgr.2s',
-    'fgrk',
-    'fgt',
-    'fgtj',
-    'fha',
-    'fhb',
-    'fhima',
-    'fhir&rehy;bhallaich',
-    'fhir-bhallaich',
-    'fhl',
-    'fhm',
-    'fhs',
     'fhs-doors',
-    'fhs2a',
-    'fhuar-thuill',
-    'fhurain',
-    'fi&egrave;rement',
-    'fi&mdash',
-    'fi-fi',
-    'fi-xing',
-    'fiaciall',
-    'fiala',
-    'fialho',
-    'fialka',
-    'fiallos',
-    'fiam',
-    'fiametta',
-    'fiamma',
     'fian',
-    'fianaigheacht',
-    'fianc',
-    'fianc&egrave;e',
-    'fiance\'',
-    'fiancees',
-    'fiancially',
-    'fiant',
-    'fianuis',
-    'fias-200',
-    'fiascoes',
-    'fiasella',
-    'fiat-alfa',
-    'fiat-owned',
-    'fiat/lancia',
-    'fiaz',
     'fibak',
-    'fibatube',
-    'fibbed',
-    'fibbins',
-    'fibbs',
-    'fiber-optic',
-    'fiberail',
-    'fiberoptics',
-    'fibette',
-    'fibr&egrave',
-    'fibre***',
-    'fibre-board',
-    'fibre-bonded',
-    'fibre-bundle',
-    'fibre-composite',
-    'fibre-consumers',
     'fibre-fill',
-    'fibre-filled',
-    'fibre-forming',
-    'fibre-full',
-    'fibre-high',
-    'fibre-optical',
-    'fibre-pile',
-    'fibre-piles',
-    'fibre-purkinje',
-    'fibre-sinews',
-    'fibre-stripped',
-    'fibre-tract',
-    'fibre/100g',
-    'fibre/epoxy',
-    'fibre/resin',
-    'fibrebundles',
     'fibrecan',
-    'fibreglass/kevlar',
-    'fibreglassing',
-    'fibrenyl',
-    'fibrerich',
-    'fibres&mdash',
-    'fibrescopes',
-    'fibrillary',
-    'fibrillated',
-    'fibrin-affinity',
-    'fibrin-dissolving',
-    'fibrin-fibrinogen',
-    'fibrin-rich',
-    'fibrin-selective',
-    'fibrin-selectivity',
-    'fibrin-specificity',
     'fibrinoid',
-    'fibrinopeptide',
-    'fibro',
-    'fibro-adenoma',
-    'fibro-nectin',
-    'fibroadenomas',
-    'fibroblast-like',
-    'fibroblast-stimulating',
-    'fibrogen',
-    'fibroglast',
-    'fibromix',
-    'fibromyomata',
-    'fibronectin-type',
-    'fibrosed',
-    'fibrosis.',
-    'fibrosis/cirrhosis',
     'fibrositis',
-    'fibrosity',
-    'fibrous-looking',
-    'fibrous-to-spongy',
-    'fibrovascular',
-    'fibstory',
-    'fibulas',
-    'fibure',
-    'ficaria',
-    'ficciones',
-    'fich',
-    'fichi',
-    'fichio',
-    'fichon',
-    'fichtel',
-    'fichtesterben',
     'fichtler',
-    'fick',
-    'ficken',
-    'ficm',
-    'ficoides',
-    'ficp',
-    'fict.',
-    'fiction-facts',
-    'fiction-film',
-    'fiction-maker',
-    'fiction/',
-    'fiction/polydor',
-    'fiction/space',
-    'fictional-real',
-    'fictionaliser',
-    'fictionalization',
     'fictionless',
-    'fictious',
-    'fictonal',
-    'fictor',
-    'ficz',
-    'fid-elity',
-    'fidal',
-    'fidani',
-    'fidanzata',
-    'fidatov',
-    'fidc',
-    'fiddes/artist',
-    'fidditch',
-    'fiddle-and-flute',
-    'fiddle-de-dee',
-    'fiddler/princess',
     'fiddlestick',
-    'fiddlestone',
-    'fiddlestrings',
-    'fiddlier',
-    'fide/gma',
-    'fideicommiss',
-    'fideicommissa',
-    'fideicommissarii',
-    'fideicommissi',
-    'fideicommitto',
-    'fideism',
-    'fidelina',
-    'fidelista',
-    'fidelitatis',
-    'fideliter',
-    'fidelity&mdash;was',
     'fidelium',
-    'fidenza',
-    'fidersz',
-    'fidgetty',
-    'fidia',
-    'fido\'',
-    'fido-fibre',
-    'fidrer',
-    'fiduciare',
-    'fiduciary/agent',
-    'fiducie',
-    'fidus',
-    'fiebiger',
-    'fied',
-    'fieding',
-    'fief-rentes',
     'fiegehan',
-    'fiegel',
-    'field&rehy;research',
-    'field\'',
-    'field(s)',
-    'field-',
-    'field-aligned',
-    'field-army',
-    'field-atom',
-    'field-based',
-    'field-by-field',
-    'field-by-set',
-    'field-cannons',
-    'field-collecting',
-    'field-data',
-    'field-dressing',
     'field-equipped',
-    'field-fare',
-    'field-free',
-    'field-general',
-    'field-hands',
-    'field-independent',
-    'field-induced',
-    'field-ion',
-    'field-kitchen',
-    'field-marshall',
-    'field-marshals',
-    'field-modulated',
-    'field-nesting',
-    'field-of-view',
-    'field-operational',
-    'field-oriented',
     'field-path',
-    'field-programmable',
-    'field-promotion',
-    'field-reeves',
-    'field-sides',
-    'field-stripping',
-    'field-study',
-    'field-systems',
-    'field-tested',
-    'field-testing',
-    'field-tests',
-    'field-the',
-    'field-trip/holidays',
-    'field-vole',
-    'field-walking',
-    'field-walls',
     'field-wide',
-    'field-working',
-    'field.o',
-    'field/green',
-    'field/reverse-field',
-    'field13',
-    'field14',
-    'field15',
-    'fieldair',
-    'fieldborne',
-    'fieldcourse',
-    'fieldcourt',
-    'fieldday',
-    'fielde',
-    'fielder/ex-apprentice',
-    'fieldful',
     'fieldgate',
-    'fieldguns',
-    'fieldhands',
-    'fieldhouse/father',
-    'fieldhouse/guitarist',
-    'fieldhouse/maxillo',
-    'fieldhouse/pupil',
-    'fielding/son',
-    'fieldingesque',
-    'fieldings',
-    'fieldmarshal',
-    'fieldmaster',
-    'fieldname',
-    'fieldpieces',
-    'fieldscape',
-    'fieldsend',
     'fieldsportsmen',
-    'fieldupdateall()',
-    'fieldwork-based',
-    'fielke',
-    'fienal',
-    'fiendful',
-    'fiene',
-    'fieniet',
-    'fieno',
-    'fienta',
-    'fierce-sounding',
-    'fiercely-defined',
-    'fiercely-driven',
-    'fiercely-fought',
-    'fiercely-held',
-    'fierceness.',
     'fiercesome',
-    'fiere',
-    'fierre',
-    'fiertag',
-    'fiery-eyed',
-    'fiery-headed',
-    'fiery-headedness',
-    'fiery-red',
-    'fiery-tempered',
-    'fiesca',
-    'fiesolana',
-    'fiestiness',
-    'fiet',
-    'fietzav',
-    'fieve',
-    'fif-rox.',
     'fife-based',
-    'fife-born',
-    'fife-built',
-    'fifehead',
-    'fifeland',
-    'fifer',
-    'fifestone',
-    'fifferentiation',
-    'fifies',
-    'fiftee',
-    'fifteen%',
-    'fifteen\'',
-    'fifteen-a-sides',
-    'fifteen-and-a-half',
-    'fifteen-by-eight-inch',
-    'fifteen-by-ten',
     'fifteen-century',
-    'fifteen-dollar',
-    'fifteen-forty',
-    'fifteen-hundred-mile',
-    'fifteen-hundred-year',
-    'fifteen-incher',
-    'fifteen-litre',
-    'fifteen-love',
-    'fifteen-member',
-    'fifteen-page',
-    'fifteen-piastre',
-    'fifteen-something-or-other',
-    'fifteen-storey',
-    'fifteen-strong',
-    'fifteen-year-old-boy',
-    'fifteenfold',
     'fifteenth-and',
-    'fifteenth-largest',
-    'fifteenth/sixteenth-century',
-    'fiftene',
-    'fiftenth',
-    'fiftffn',
-    'fifth-biggest',
-    'fifth-column',
-    'fifth-degree',
-    'fifth-form',
-    'fifth-fourth',
-    'fifth-gear',
-    'fifth-hand',
-    'fifth-interval',
-    'fifth-lowest',
-    'fifth-magnitude',
     'fifth-monarchy',
-    'fifth-preference',
-    'fifth-ranking',
-    'fifth-to',
-    'fifth-to-fourth',
-    'fifth-years',
-    'fifth/sixth',
-    'fifther',
-    'fifthof',
-    'fifties.',
-    'fiftiesey',
-    'fiftieth-anniversary',
-    'fifty-acre',
-    'fifty-century',
-    'fifty-dollar',
-    'fifty-eighth',
     'fifty-feet',
-    'fifty-five-foot',
-    'fifty-foot-high',
-    'fifty-franc',
-    'fifty-guinea',
-    'fifty-hour',
-    'fifty-ish',
-    'fifty-metre',
-    'fifty-mile-an-hour',
-    'fifty-miles-an-hour',
-    'fifty-million',
-    'fifty-nation',
-    'fifty-oar',
-    'fifty-oared',
-    'fifty-one\'s',
-    'fifty-p',
     'fifty-page',
-    'fifty-piece',
-    'fifty-record',
-    'fifty-rouble',
-    'fifty-seat',
-    'fifty-second',
-    'fifty-seventh',
-    'fifty-signature',
-    'fifty-six&rehy;year-old',
-    'fifty-six-year-old',
-    'fifty-somethings',
-    'fifty-thousand',
-    'fifty-thousandth',
-    'fifty-three-',
-    'fifty-three-year',
-    'fifty-threes',
     'fifty-years-ago',
-    'fifty/two',
-    'fiftyfold',
-    'fiftyfour',
-    'fiftyknot',
-    'fiftyone',
-    'fiftysomething',
-    'fig&gt&lt;esc&gt',
-    'fig-branches',
-    'fig-eaters',
-    'fig-flavoured',
-    'fig-fruit',
-    'fig-jig',
-    'fig-shaped',
-    'fig.1.1',
-    'fig.1.3',
     'fig.1.3(a)',
-    'fig.1.8',
-    'fig.11.1',
-    'fig.12',
-    'fig.13',
-    'fig.14',
-    'fig.17',
-    'fig.18',
-    'fig.19',
-    'fig.19.1',
-    'fig.2.13',
-    'fig.2.14',
-    'fig.2.2',
-    'fig.2.4',
-    'fig.21',
-    'fig.22',
     'fig.3.11',
-    'fig.3.29',
-    'fig.3.3',
-    'fig.30',
-    'fig.36',
-    'fig.4.11',
-    'fig.4.3',
-    'fig.41',
-    'fig.48',
-    'fig.5.1-i',
-    'fig.5.2',
-    'fig.5.2(c)',
-    'fig.5.3',
-    'fig.5.5',
-    'fig.5.9',
-    'fig.5.l',
     'fig.50',
-    'fig.6.1',
-    'fig.6.2',
-    'fig.6.6',
-    'fig.6.8',
-    'fig.66',
-    'fig.7.1',
-    'fig.7.12(c)',
-    'fig.7.3',
-    'fig.7.4',
-    'fig.7.6',
-    'fig.8.33',
-    'fig.8.5',
-    'fig.8.7(a)',
-    'fig.8.8(a)',
-    'fig.9',
     'fig.9.1(d)',
-    'fig.9.1(e)',
-    'fig.9.3',
-    'fig.9.5',
-    'fig.9.7',
-    'fig.iii',
-    'fig.l.3(b)',
-    'fig.off',
-    'fig.s',
-    'fig1.2',
-    'fig1.3',
-    'fig11',
-    'fig12',
-    'fig13',
-    'fig14',
-    'fig15',
     'fig16',
-    'fig17',
-    'fig18',
-    'fig19',
-    'fig2',
-    'fig2.1',
-    'fig20',
-    'fig22',
-    'fig4.4',
-    'figan',
-    'figarella',
-    'figaro-mad',
-    'figata',
-    'fige',
-    'figel',
-    'figgins',
     'figgy',
-    'figgymisgrugifooniyn',
-    'fight-day',
-    'fight-fighters',
-    'fight-intros',
-    'fight-to-the-limit',
-    'fight/flight',
-    'fighter-aircraft',
-    'fighter-fiddler',
-    'fighter-like',
-    'fighter-planes',
-    'fighter-style',
-    'fighter/business',
-    'fighterland',
-    'fightfinisher',
-    'fighting&mdash',
     'fighting-dogs',
-    'fighting-fish',
-    'fighting-fit',
-    'fighting-leader',
-    'fighting-machine',
-    'fighting-off',
-    'fighting-platforms',
-    'fighting-power',
-    'fighting-resources',
-    'fighting-ship',
-    'fighting-ships',
-    'fightings',
-    'fightmarks',
-    'fights.',
-    'figi',
-    'figini',
     'figino',
-    'figleaves',
-    'figline',
-    'figr',
-    'figs.51',
-    'figs.53',
-    'figueroainterior',
-    'figuig',
-    'figur&eacute',
-    'figurate',
-    'figuratif',
-    'figurative-expressionist',
-    'figure&ndash;1',
-    'figure&ndash;3',
-    'figure&rehy;heads',
-    'figure(s)',
     'figure-',
-    'figure-carving',
-    'figure-decoration',
-    'figure-drawing',
-    'figure-eights',
-    'figure-forming',
-    'figure-frieze',
-    'figure-head',
-    'figure-heads',
-    'figure-length',
-    'figure-moulded',
-    'figure-of-8',
-    'figure-of-eight-female-body-screwing',
-    'figure-scene',
-    'figure-shuffling',
-    'figure-stained',
     'figure-style',
-    'figure-subjects',
-    'figure-typically',
-    'figure-zone',
-    'figure-zones',
-    'figure/diagram',
-    'figure_',
-    'figured-wood',
-    'figureheadand',
-    'figuremaking',
-    'figurers',
-    'figures&ndash',
-    'figures.j',
-    'figuresi.l',
-    'figuresiraqi',
-    'figurin\'',
     'fiished',
-    'fij',
-    'fijalkoski',
-    'fika',
-    'fike',
-    'fikret',
-    'fikri',
-    'fiktionen',
-    'fikus',
-    'fil&eacute',
-    'fil-filthy',
-    'fil-forn',
-    'fil-ox-er-oi-days',
-    'fil-thy',
-    'filabusi',
-    'filamenia',
     'filamentary',
-    'filane',
-    'filanovsky-zenkov',
-    'filariform',
-    'filberts',
-    'filboid',
-    'filbrosing',
-    'filches',
-    'file-',
-    'file-aid',
-    'file-card',
-    'file-filled',
-    'file-grinder',
-    'file-interrogating',
-    'file-keeping',
-    'file-layering',
     'file-locking',
-    'file-notes',
-    'file-o-fucks',
-    'file-structured',
-    'file.ba1',
-    'file.ba2',
-    'file1',
-    'file2',
-    'filecard',
-    'fileclose',
-    'filecube',
-    'filedrawn',
-    'filein',
-    'filemakers',
-    'filemerge',
-    'filene',
     'filenko',
-    'fileopen',
-    'fileplus',
-    'filepower',
-    'filepro',
-    'filers',
-    'files=20',
-    'fileserver',
-    'filesharing',
-    'filesystem',
-    'filet-',
-    'filet-abreu',
-    'filets.fil',
-    'fileuse',
-    'filey-based',
-    'filfy',
     'filgases',
-    'filhos',
-    'fili',
-    'filiae',
-    'filials',
-    'filiations',
-    'filiaton',
-    'filibeg',
-    'filicales',
-    'filiform',
-    'filigree-and-rivet',
-    'filigree-like',
-    'filiis',
-    'filikon',
-    'filiminov',
-    'filimon',
     'filimone',
-    'filinelle',
-    'filing-cabinet',
-    'filing-system',
-    'filiopietism',
-    'filios',
-    'filipa',
-    'filipenduline',
-    'filipepi',
-    'filipes',
-    'filipin',
-    'filipina',
-    'filipino-american',
-    'filipov',
-    'filipowski',
-    'filippini',
     'filium',
-    'filixfelnina',
-    'filiz',
-    'filkus',
-    'fill\'us',
-    'fill-horse',
-    'fill-in-the-',
-    'fill-in-the-blanks',
-    'fill-ins',
-    'fillability',
-    'fillaform',
-    'filld',
-    'filleca',
-    'filled-full',
-    'fillemal',
-    'filler-joist',
     'fillerval',
-    'filleter',
-    'filli',
-    'fillin',
-    'filling&mdash;station',
-    'filling-',
-    'filling.stations',
-    'filling/emptying',
-    'filling/insulation',
-    'fillingham',
-    'filliou',
-    'fillipo',
-    'filliter',
-    'filll',
-    'fillon-payoux/john',
-    'fillon-payoux/victim',
     'fillou',
-    'fillpina',
-    'filly-formis',
-    'film&mdash;usually',
-    'film-by-film',
-    'film-changing',
-    'film-clip',
-    'film-club',
-    'film-distribution',
-    'film-editing',
-    'film-footage',
-    'film-forming',
-    'film-funning',
-    'film-goer',
-    'film-holders',
-    'film-industry',
     'film-minded',
-    'film-noir',
-    'film-of-the-play',
-    'film-plots',
-    'film-preview',
-    'film-printing',
-    'film-producing',
-    'film-projector',
-    'film-related',
-    'film-school',
-    'film-script',
-    'film-sets',
-    'film-starry',
-    'film-still',
-    'film-studio-cum-information',
-    'film-there',
     'film-viewer',
-    'film-viewers',
-    'film-winding',
-    'film-work',
-    'film-world',
-    'film-wrapped',
-    'film-writer',
-    'film-writers',
-    'film.',
-    'film.intv',
-    'film/action',
-    'film/action-adventure',
-    'film/audio',
-    'film/simon',
-    'filmable',
-    'filmakers',
     'filmdom',
-    'filmed-entertainment',
-    'filmed-in-a-fortnight',
-    'filmer/young',
-    'filmerian',
-    'filmfest',
-    'filmgoing',
-    'filming/photography',
-    'filmlines',
-    'filmogenic',
-    'filmore',
-    'films-a',
-    'films.but',
-    'films/packages',
-    'films/videos',
-    'filmschool',
     'filmset',
-    'filmsetting',
-    'filmshow',
-    'filmshows',
-    'filmstar-style',
-    'filmstar-type',
-    'filmstock',
-    'filmy-fern',
-    'filnet',
-    'filo-faxes',
-    'filo-topped',
-    'filochowski',
-    'filofax/organiser',
-    'filomeni',
-    'filopod',
-    'filopodial',
     'filopods',
-    'filotas',
-    'filous',
-    'filreg',
-    'fils/fille',
-    'filsak',
-    'filshie',
-    'filsm',
-    'filteau',
-    'filter-cleaning',
-    'filter-feeder',
-    'filter-free',
-    'filter-gel',
-    'filter-ground',
-    'filter-out',
-    'filter-papers',
     'filter-passing',
-    'filter-plates',
-    'filter-tips',
-    'filter-wool',
-    'filter/filter',
-    'filter/integrators',
-    'filterable',
-    'filterers',
-    'filterpaper',
-    'filters.',
-    'filtertrons',
-    'filth-caked',
-    'filth-century',
-    'filth-dwellers',
-    'filth-mongers',
-    'filth-preference',
     'filth-talk',
-    'filthos',
-    'filths',
-    'filthy-earth',
-    'filthy-gleeful',
-    'filthy-looking',
-    'filthy-sounding',
-    'filthy-tasting',
-    'filtock',
-    'filtonbased',
-    'filtrations',
-    'filty',
-    'filzfabrik',
-    'fim7.07',
-    'fimag',
-    'fimagest',
     'fimbarrus',
-    'fimblett',
-    'fimbra-member',
-    'fimbra-registered',
-    'fimbriatus',
-    'fime',
-    'fimeche',
-    'fimgt',
-    'fiml',
-    'fims',
-    'fin-de-',
-    'fin-flaring',
-    'fin-gered',
-    'fin-ray',
-    'fin/legs',
-    'fin15',
     'fin_de_si&eacute;cle',
-    'finacial',
-    'finacially',
-    'finagle',
-    'finail',
-    'final&eacute',
-    'final-draft',
-    'final-match',
-    'final-quarter',
-    'final-race',
-    'final-salary',
-    'final-sounding',
-    'final-stage',
-    'final-task',
-    'final-winning',
-    'final.the',
     'final/2',
-    'final_coup',
-    'finalists/winners',
-    'finalities',
-    'finalizes',
-    'finall',
-    'finally\'',
-    'finally-burst',
-    'finally-won',
-    'finallyjanet',
-    'finalmente',
-    'finals.the',
-    'finalstrides',
-    'finan&rehy;cially',
-    'finanace',
-    'finanacial',
     'financ&eacute',
-    'finance-capitalist',
-    'finance-conscious',
-    'finance-directors',
-    'finance-driven',
-    'finance-linked',
-    'finance-plan',
-    'finance/european',
-    'finance/insurance',
-    'financer',
-    'financi',
-    'financial-',
-    'financial-asset-type',
-    'financial-bureaucratic',
-    'financial-cum-economic',
-    'financial-engineering',
     'financial-futures',
-    'financial-led',
-    'financial-loss',
-    'financial-material',
-    'financial-numerical',
-    'financial-reporting',
-    'financial-service',
-    'financial-transactions',
-    'financial-value',
-    'financial/numerical',
-    'financial/regulating',
-    'financial/speculative',
-    'financial/staff',
-    'financially&rehy;troubled',
-    'financially-accountable',
-    'financially-based',
     'financially-crippled',
-    'financially-driven',
-    'financially-embarrassed',
-    'financially-pressed',
-    'financially-shrewd',
-    'financially-sound',
-    'financially-stretched',
-    'financially-viable',
-    'financialplanning',
-    'financialsector',
-    'financieel',
-    'financieros',
-    'financing\'',
-    'financing-maintaining',
-    'finansa',
-    'finansises',
     'finanz',
-    'finanziaria',
-    'finasteride',
-    'finberg',
-    'finbogad&oacute;ttir',
-    'finborough',
-    'fincare',
-    'finch-hatton',
-    'finch-knightley',
-    'finch-lark',
-    'finch-royce',
-    'finch/patient',
-    'finchaa',
-    'fincher',
-    'finchera',
-    'finchfield',
     'find&formula;1',
-    'find-\'em-and-mash-\'em',
-    'find-raiser',
-    'find-spot',
-    'find-spots',
-    'find-the',
-    'finden',
-    'finder&mdash',
-    'findern',
-    'finders-keepers',
-    'findeth',
-    'findham',
-    'findi',
-    'finding-list',
-    'finding-out',
-    'finding_a',
     'findings--notably',
-    'findlaech',
-    'findlay/nurse',
-    'findongs',
-    'findum',
-    'fine&rehy;grained',
-    'fine&rehy;tuned',
-    'fine\'',
-    'fine-',
-    'fine-balanced',
-    'fine-bred',
-    'fine-bristled',
-    'fine-by-me',
-    'fine-chisel',
-    'fine-cotton',
-    'fine-denier',
     'fine-detail',
-    'fine-enough',
-    'fine-finishing',
-    'fine-fitting',
-    'fine-flavoured',
-    'fine-gems',
-    'fine-hewn',
-    'fine-honed',
-    'fine-limbed',
-    'fine-lined',
-    'fine-mix',
-    'fine-needle',
-    'fine-nosed',
-    'fine-particled',
-    'fine-print',
-    'fine-sand',
     'fine-sanding',
-    'fine-scale',
-    'fine-scored',
-    'fine-skinned',
-    'fine-slatted',
-    'fine-spinning',
-    'fine-structural',
-    'fine-tipped',
-    'fine-toned',
-    'fine-voiced',
-    'fine-weather',
-    'fine-woolled',
-    'fine.he',
-    'fine/flyaway',
-    'fined-down',
-    'fined.',
     'finefare',
-    'finegauge',
-    'finegold',
-    'finelight',
-    'finely-balanced',
-    'finely-chiselled',
-    'finely-coiffured',
-    'finely-controlled',
-    'finely-crushed',
-    'finely-detailed',
-    'finely-divided',
-    'finely-etched',
-    'finely-executed',
-    'finely-grated',
-    'finely-ground',
-    'finely-kept',
     'finely-knotted',
-    'finely-made',
-    'finely-patterned',
-    'finely-pointed',
-    'finely-sculptured',
-    'finely-sifted',
-    'finely-tailored',
-    'finely-wrought',
-    'finer-rooted',
-    'finer-than-fine',
-    'fines/costs',
-    'finesses',
-    'finest-ever',
-    'finest-grain',
-    'finestres',
-    'finesty',
     'finette',
-    'finewirers',
-    'finey',
-    'fing\'ring',
-    'fing.',
-    'fingarette',
-    'fingari',
-    'fingas',
-    'finger&rehy;bowl',
-    'finger&rehy;wagging',
-    'finger-',
-    'finger-and-thumb',
-    'finger-bone',
-    'finger-bones',
-    'finger-bowl',
-    'finger-bowls',
     'finger-clicking',
-    'finger-connection',
-    'finger-containing',
-    'finger-counting',
-    'finger-crack',
-    'finger-crossing',
-    'finger-curled',
-    'finger-dried',
-    'finger-dry',
-    'finger-end',
-    'finger-ended',
-    'finger-feeds',
-    'finger-flicked',
-    'finger-flicks',
-    'finger-flips',
-    'finger-fucking',
     'finger-gesture',
-    'finger-hold',
-    'finger-holes',
-    'finger-in-air',
-    'finger-jabbing',
-    'finger-lickin\'',
-    'finger-light',
-    'finger-load',
-    'finger-moving',
-    'finger-paintings',
-    'finger-pick',
-    'finger-picked',
-    'finger-pickin\'',
-    'finger-plug',
-    'finger-printers',
-    'finger-reading',
     'finger-rest',
-    'finger-rings',
-    'finger-rubbing',
-    'finger-searing',
-    'finger-sized',
-    'finger-snap',
-    'finger-speed',
-    'finger-spell',
-    'finger-stained',
-    'finger-strike',
-    'finger-sweep',
-    'finger-tapping',
-    'finger-tight',
-    'finger-tipped',
-    'finger-waved',
-    'finger-wiggle',
     'finger-work',
-    'finger-written',
-    'fingerboard/neck',
-    'fingerbob',
-    'fingerbobs',
-    'fingerbone',
-    'fingerbowls',
-    'fingered-friend',
-    'fingerends',
-    'fingerfertigkeit',
-    'fingerholds',
-    'fingerlicker',
-    'fingerlike',
-    'fingerlocks',
-    'fingermark',
-    'fingernail-sized',
     'fingernail-trimming',
-    'fingeronis',
-    'fingerpad',
-    'fingerpints',
-    'fingerposts',
-    'fingerprick',
-    'fingerpritns',
-    'fingers&rehy',
-    'fingersmear',
-    'fingerspell',
-    'fingerspeller',
-    'fingerspellng',
-    'fingerspitzen',
-    'fingersss',
-    'fingerstall',
-    'fingerstroke',
     'fingertip-end',
-    'fingertipped',
-    'finghall',
-    'finging',
-    'finglam',
-    'fingle',
-    'fingringhoe',
-    'fingure',
-    'fingy',
-    'finially',
-    'finibus',
-    'finic',
-    'finical',
-    'finicalness',
-    'finickety',
-    'finickity',
     'finicus',
-    'finish-\'im-off-rip-\'is-guts-out-fump-\'im-in-the-belly-ya-big-ugly-bag-of-chisels-yer-tattoo\'d-dick\'ead',
-    'finish-it-in-thirty-days-using-only-domestic-handtools',
-    'finish-line',
-    'finish-point',
-    'finish/-/0007',
-    'finisham',
-    'finishing-line',
-    'finishon',
-    'finist&egrave;re',
-    'finita',
-    'finite-dimensional',
-    'finite-element',
-    'finite-medium',
-    'finite-risk',
-    'finitribe',
     'finjan',
-    'finkelkraut',
-    'finkelman',
-    'finklehall',
-    'finkleman',
-    'finkles',
-    'finky',
-    'finland-see',
-    'finlandised',
-    'finler',
-    'finlon',
-    'finlough',
-    'finmarchicus',
-    'finmarks',
-    'finmere/oxfordshire',
-    'finn-kelcey',
     'finn-like',
-    'finna',
-    'finnacial',
-    'finnegan-butler',
-    'finnentrop',
-    'finnerty/designer',
-    'finnery',
-    'finnes',
-    'finney.it',
-    'finnies',
-    'finnimore',
-    'finnin',
-    'finning',
-    'finnish-based',
-    'finnish-bred',
-    'finnish-russian',
     'finnm&aring;rrks',
-    'finnmarks',
-    'finno-ugrian',
-    'finnoula',
-    'finnpipette',
-    'finnskogen',
-    'finntial',
-    'finnur',
-    'finnygook',
-    'finocchio',
-    'finol',
-    'finosh',
-    'finschia',
-    'finshing',
-    'finsider',
-    'finsihing',
     'finsinger-vogelsang',
-    'finson',
-    'finspang',
-    'finster',
-    'finsterwald',
-    'finstp',
-    'fintalich',
-    'fintech',
-    'finton',
-    'fintree',
-    'finty',
-    'finway',
-    'finzean',
-    'finztermunzter',
-    'finztermunzterschlucht',
-    'fiocco',
     'fiocre',
-    'fiom',
-    'fionas',
-    'fionavar',
-    'fionna',
-    'fionnbarra',
-    'fiopped',
-    'fiora',
-    'fiorano',
-    'fiorella',
-    'fiorentini',
-    'fioretti',
-    'fiorile',
-    'fiorillo',
-    'fiorita',
-    'fioriture',
     'fios',
-    'fiott',
-    'fiott-lee',
-    'fiow',
-    'fips151&ndash;2',
-    'fir-cone',
-    'fir-cun',
-    'fir-dying',
-    'fir-forests',
-    'firangi',
-    'firar',
-    'firatli',
-    'firbeck',
-    'firby',
-    'fircones',
-    'fircroft',
     'fire&ndash',
-    'fire&rehy;fighter',
-    'fire&rehy;like',
-    'fire&rehy;proof',
-    'fire&rehy;resisting',
-    'fire&rehy;walker',
-    'fire\'',
-    'fire-alarm',
-    'fire-alarms',
-    'fire-and-thunder',
-    'fire-ants',
-    'fire-appliances',
-    'fire-arrows',
-    'fire-assay',
-    'fire-ball',
-    'fire-balloons',
     'fire-beating',
-    'fire-bed',
-    'fire-bell',
-    'fire-birds',
-    'fire-boat',
-    'fire-bolts',
-    'fire-bomber',
-    'fire-bombers',
-    'fire-break',
-    'fire-bricks',
-    'fire-broken',
-    'fire-bucket',
-    'fire-carts',
-    'fire-comer',
-    'fire-crew',
-    'fire-crowned',
     'fire-damp',
-    'fire-dazzled',
-    'fire-detection',
-    'fire-direction',
-    'fire-draught',
-    'fire-em',
-    'fire-escapes',
-    'fire-exit',
-    'fire-extinguisher',
-    'fire-extinguishing',
-    'fire-falls',
-    'fire-fanged',
-    'fire-fights',
-    'fire-flies',
-    'fire-fountaining',
-    'fire-front',
     'fire-glow',
-    'fire-hazard',
-    'fire-hearth',
-    'fire-heat',
-    'fire-hole',
-    'fire-horse',
-    'fire-hoses',
-    'fire-hydrant',
-    'fire-insulating',
-    'fire-iron',
-    'fire-lighter',
-    'fire-load',
-    'fire-makers',
-    'fire-mounts',
-    'fire-mouths',
-    'fire-new',
     'fire-notice',
-    'fire-officer',
-    'fire-officers',
-    'fire-opal',
-    'fire-orange/red',
-    'fire-party',
-    'fire-pit',
-    'fire-plan',
-    'fire-polished',
-    'fire-prone',
-    'fire-protected',
-    'fire-raiser',
-    'fire-reddened',
-    'fire-risk',
-    'fire-salvaged',
-    'fire-scarred',
     'fire-shower',
-    'fire-sign',
-    'fire-signals',
-    'fire-siren',
-    'fire-snow',
-    'fire-soul',
-    'fire-spewing',
-    'fire-spread',
-    'fire-starter',
-    'fire-sticks',
-    'fire-storms',
-    'fire-streaked',
-    'fire-strung',
-    'fire-swim',
-    'fire-tail',
-    'fire-tailed',
     'fire-tanged',
-    'fire-tapestries',
-    'fire-temple',
-    'fire-tinge',
-    'fire-tinged',
-    'fire-tipped',
-    'fire-tolerant',
-    'fire-trail',
-    'fire-walkers',
-    'fire-watch',
-    'fire-watcher',
-    'fire-weed',
-    'fire-wheels',
-    'fire-woman',
-    'fire-worshippers',
-    'fire.',
     'fire.fighting',
-    'fire.n',
-    'fire/',
-    'fire/emergency',
-    'fire/jericho',
-    'fire/on',
-    'fire_over',
-    'firearm-explosive',
-    'firebalm',
-    'firebay',
-    'fireberg',
-    'firebird\'-style',
-    'firebird-style',
-    'fireblade',
-    'fireboat',
-    'firebowl',
     'firebowls',
-    'fireboy',
-    'firebrandish',
-    'firebreather',
-    'firebreathing',
-    'firebroom',
-    'firebug',
-    'firecast',
-    'fired.',
-    'firedance',
-    'firefights',
-    'firefish',
-    'firefly-sparks',
-    'firegas',
-    'firegod',
-    'firegods',
     'firegrate',
-    'fireheart',
-    'firehosing',
-    'firelady_instead',
-    'firelights',
-    'fireline',
-    'firelock',
-    'firemaking',
-    'fireman-turned-\'tec',
-    'fireman/security',
-    'firemans',
-    'firemanship',
-    'firemarks',
-    'firemen\'',
-    'firends',
-    'firenoise',
     'firepower.',
-    'fireprone',
-    'fireproofer',
-    'firequeen',
-    'fireraisers',
-    'fireraising',
-    'fires.',
-    'firescreens',
-    'firesetting',
-    'firesetting.',
-    'fireship',
-    'firesign',
-    'firesong',
-    'firestick',
-    'firesticks',
-    'firestorms',
     'firestreak',
-    'firetex',
-    'firethorns',
-    'firetraps',
-    'firewalking',
-    'firewatcher',
-    'firewatchers',
-    'firework-related',
-    'firgrove',
-    'firhouse',
-    'firing-line',
-    'firing-plate',
-    'firing-point',
-    'firing.',
-    'firkowska',
-    'firku&scaron;n&yacute',
     'firl',
-    'firm&mdash;see',
-    'firm-',
-    'firm--in',
-    'firm--pre-project',
-    'firm-buildings',
-    'firm-buttocked',
-    'firm-by-firm',
-    'firm-hold',
-    'firm-looking',
-    'firm-muscled',
-    'firm-one',
-    'firm-sounding',
-    'firm-the',
-    'firm-ware',
-    'firm/agency',
     'firma',
-    'firmamentum',
-    'firmer-based',
-    'firming-up',
-    'firmlet\'',
-    'firmly-bounded',
-    'firmly-moulded',
-    'firmly-stated',
-    'firmly.',
-    'firmont',
-    'firms&mdash;which',
-    'firms--will',
-    'firms.the',
-    'firmstone',
-    'firmyly',
-    'firouz',
     'firozshah',
-    'firpac',
-    'firsby',
-    'first&mdash;your',
-    'first&rehy;ball',
-    'first&rehy;day',
-    'first&rehy;division',
-    'first&rehy;footing',
-    'first&rehy;hand',
-    'first&rehy;name',
-    'first&rehy;time/small',
-    'first&rehy;to-third',
-    'first-aided',
-    'first-amendment',
-    'first-ballot',
-    'first-buyers',
     'first-calf',
-    'first-calver',
-    'first-category',
-    'first-comer',
-    'first-comers',
-    'first-contact',
-    'first-course',
-    'first-crossing',
-    'first-day-of-',
-    'first-day-of-issue',
-    'first-delivery',
-    'first-derivative',
-    'first-discovered',
-    'first-disk',
-    'first-do-it-yourself',
-    'first-edition',
     'first-episode',
-    'first-established',
-    'first-fence',
-    'first-fling',
-    'first-flowering',
-    'first-footed',
-    'first-footers',
-    'first-footing',
-    'first-formulated',
-    'first-glance',
-    'first-home',
-    'first-in-first-out',
-    'first-inning',
-    'first-is',
-    'first-lap',
-    'first-lass',
     'first-layer',
-    'first-mention',
-    'first-minute',
-    'first-movers',
-    'first-name-terms',
-    'first-names',
-    'first-nighter',
-    'first-nightish',
-    'first-nor',
-    'first-novel',
-    'first-of-',
-    'first-of-a&rehy;kind',
-    'first-out',
-    'first-paragraph',
-    'first-party',
-    'first-pass',
     'first-past.the-post',
-    'first-period',
-    'first-person-plural',
-    'first-personally',
-    'first-pick',
-    'first-preferences',
-    'first-preferred',
-    'first-prize',
-    'first-remembered',
-    'first-resolution',
-    'first-secured',
-    'first-set',
-    'first-shell',
-    'first-stop',
-    'first-teamer',
-    'first-term',
     'first-third',
-    'first-to-file',
-    'first-to-second',
-    'first-to-ten',
-    'first-up',
-    'first-vote',
-    'first-water',
-    'first-week',
-    'first-what',
-    'first-winter',
-    'first-with',
-    'first-world-war',
-    'first.preference',
-    'first.time',
-    'first.wife',
-    'first/fixed',
     'first/last',
-    'firstbrook',
-    'firstedge',
-    'firsters',
-    'firstgeneration',
-    'firstline',
-    'firstness',
-    'firstsave',
-    'firswood',
-    'firth&ndash;brearley',
-    'firth-butterfield',
-    'firth/severn',
-    'firth/student',
-    'firthlands',
-    'firthview',
-    'firty-five',
     'firty-nine',
-    'firzal',
-    'fis-controlled',
-    'fisc-lands',
-    'fiscal/regulatory',
-    'fiscardo',
-    'fischer-diskau',
-    'fischer-phelps-taylor',
-    'fischer-reinhardt',
-    'fischhoff',
-    'fischi-weiss',
-    'fischli-weiss',
-    'fischmann',
-    'fischoff',
-    'fiserve',
-    'fish&mdash',
     'fish&rehy;tank',
-    'fish\'',
-    'fish\'n\'chip',
-    'fish\'n\'chips',
-    'fish-',
-    'fish-and-chippery',
-    'fish-based',
-    'fish-bone',
-    'fish-breeding',
-    'fish-buying',
-    'fish-catchers',
-    'fish-dinner',
-    'fish-disease',
-    'fish-eye-lens',
-    'fish-eyes',
-    'fish-farm',
     'fish-farms',
-    'fish-feeding',
-    'fish-fin',
-    'fish-fingers',
-    'fish-freezer',
-    'fish-fry',
-    'fish-heads',
-    'fish-in-the-pond',
-    'fish-juice',
-    'fish-keeping',
-    'fish-kills',
-    'fish-laden',
-    'fish-lice',
-    'fish-liver',
-    'fish-louse',
-    'fish-market',
     'fish-meal',
-    'fish-meat',
-    'fish-nets',
-    'fish-netted',
-    'fish-nibbled',
-    'fish-per-pound',
-    'fish-pie',
-    'fish-point',
-    'fish-pool',
-    'fish-related',
-    'fish-scaled',
-    'fish-scattering',
-    'fish-scrap',
-    'fish-smelling',
-    'fish-sonars',
-    'fish-spear',
     'fish-spotting',
-    'fish-sting',
-    'fish-swallowing',
-    'fish-throwing',
-    'fish-trading',
-    'fish-traps',
-    'fish-tremulous',
-    'fish-vendors',
-    'fish-watcher',
-    'fish-weirs',
-    'fish.in',
-    'fish/dirty',
-    'fish/invert',
-    'fish/invertebrate',
-    'fish/invest',
-    'fish/mobile',
     'fish/vegetable',
-    'fishback',
-    'fishbait',
-    'fishball',
-    'fishbed-c',
-    'fishbeds',
-    'fishbein',
-    'fishbelly',
-    'fishbowls',
-    'fishbreeders',
-    'fishburne',
-    'fishcake',
-    'fishcare',
-    'fished-out',
-    'fisher-bird',
-    'fisher-clark',
     'fisher-karpark',
-    'fisher-price',
-    'fisher/bothy',
-    'fisher/chief',
-    'fisher/flying',
-    'fisher/gilder',
-    'fisher/hospital',
-    'fisher/student',
-    'fisher/thamesdown',
-    'fisher_et',
-    'fisherboat',
-    'fisheriers',
-    'fisheries-licence',
-    'fisheries.',
-    'fisherm',
-    'fisherman-knit',
     'fisherman/fishwife',
-    'fishermen-farmers',
-    'fisherrotha',
-    'fishertown',
-    'fisheyed',
-    'fishfarms',
-    'fishguard-based',
-    'fishie',
-    'fishier',
-    'fishily',
-    'fishing-chaps',
-    'fishing-grounds',
-    'fishing-knife',
-    'fishing-port',
-    'fishing-rods',
-    'fishing-skiff',
     'fishing-stakes',
-    'fishing-tackle',
-    'fishing-villages',
-    'fishing-weights',
-    'fishing.it',
-    'fishkeeping/tetra',
-    'fishki',
-    'fishknife',
-    'fishknife-in-your-face',
-    'fishlice',
-    'fishman-made',
-    'fishman/clay',
-    'fishman/pension',
-    'fishmeat',
-    'fishmen',
-    'fishmonkeyman',
     'fishnchips',
-    'fishness',
-    'fishometer',
-    'fishplate',
-    'fishplates',
-    'fishpools',
-    'fishquay',
-    'fishquays',
-    'fishroom',
-    'fishtailed',
-    'fishtailing',
-    'fishtank-lights',
-    'fishtour',
-    'fishtours',
-    'fishwaste',
-    'fishy-smelling',
     'fiskardo',
-    'fiskerton',
-    'fiskflug',
-    'fisler',
-    'fiss',
-    'fisse',
-    'fisseha',
-    'fissenden',
-    'fission-fusion-fission',
-    'fission-product',
-    'fissionable',
-    'fissiparist',
-    'fissiparously',
-    'fisson',
-    'fissues',
-    'fissure-vein',
     'fist-',
-    'fist-battle',
-    'fist-blow',
-    'fist-clenching',
-    'fist-faced',
-    'fist-fucking',
-    'fist-full',
-    'fist-like',
-    'fist-shaking',
-    'fist-size',
-    'fist-swinging',
-    'fist-thumbing',
-    'fist-width',
-    'fist/i',
-    'fisti-cuffs',
-    'fisticuff',
     'fisticuffing',
-    'fiston',
-    'fistral',
-    'fistrunk',
-    'fists-they',
-    'fistula-suffering',
-    'fistulation',
-    'fistulla',
-    'fistulotomy',
-    'fit-and-flare',
-    'fit-bits',
-    'fit-centre',
-    'fit-i',
-    'fit-inducing',
-    'fit-making',
-    'fit-ness',
     'fit-pro',
-    'fit-together',
-    'fit.the',
-    'fit/dance',
-    'fit/fresh/frisky',
-    'fita',
-    'fitba',
-    'fitc-(fab\')',
-    'fitc-goat',
-    'fitchburg',
-    'fitches',
-    'fitfulness',
-    'fith',
-    'fithers',
-    'fitkin-paul',
-    'fitling',
     'fitlock',
-    'fitness-fanatic',
-    'fitness-maximisation',
-    'fitness-rating',
-    'fitness.and',
-    'fitness/conditioning',
-    'fitness/parish',
-    'fitness/stamina',
-    'fitou',
-    'fitr',
-    'fitsgibbon',
-    'fitst',
-    'fittable',
-    'fitted-kitchens',
-    'fitted-tintawn',
-    'fitted-up',
     'fitted.',
-    'fitted.the',
-    'fittening',
-    'fittest&mdash;the',
-    'fittest\'',
-    'fittin\'',
-    'fittingness',
-    'fittipaldis',
-    'fittler',
-    'fittleworth',
-    'fitz-gibbon',
-    'fitz-gibbon/defend',
-    'fitz-ralph',
-    'fitzabraham',
-    'fitzalan.',
-    'fitzcarraldo',
     'fitzclarence',
-    'fitzclarences',
-    'fitzgerald/formation',
-    'fitzgiven',
-    'fitzgrip',
-    'fitzhammon',
-    'fitzhardinge',
-    'fitzharris',
-    'fitzharrys',
-    'fitzhenry',
-    'fitzinger',
-    'fitzosbern',
-    'fitzpatricks',
-    'fitzpayne',
-    'fitzpomeroy',
-    'fitzralph',
     'fitzrovia',
-    'fitzroya',
-    'fitzstephen',
-    'fitzwakelin',
-    'fitzwalters',
-    'fitzwarine',
-    'fitzwaryn',
-    'fitzwilliamiam',
-    'fiuids',
-    'fiumetto',
-    'fiumi',
-    'fiumicino',
-    'fiuve',
-    'fivbe',
-    'five&mdash;generation',
-    'five&mdash;year',
     'five&ndash;13',
-    'five&ndash;car',
-    'five&rehy;and',
-    'five&rehy;bedroomed',
-    'five&rehy;foot',
-    'five&rehy;pointed',
-    'five&rehy;speed',
-    'five&rehy;volume',
-    'five&rehy;year-old',
-    'five(h&ouml;yre)',
-    'five-a-',
-    'five-all',
-    'five-and',
-    'five-and-a-half-day',
-    'five-and-four',
-    'five-and-half',
     'five-and-thirty',
-    'five-arched',
-    'five-arm',
-    'five-asides',
-    'five-baller',
-    'five-barrelled',
-    'five-bathroomed',
-    'five-billion',
-    'five-bladed',
-    'five-block',
-    'five-book',
-    'five-button',
-    'five-by-eight',
-    'five-canvas',
-    'five-car',
-    'five-cd',
     'five-cent',
-    'five-centre',
-    'five-chamber',
-    'five-channel',
-    'five-church',
-    'five-clawed',
-    'five-coach',
-    'five-coloured',
-    'five-column',
-    'five-coordinated',
-    'five-copeck',
-    'five-count',
-    'five-customer',
-    'five-day-week',
-    'five-diamond',
-    'five-direction',
     'five-dog',
-    'five-domed',
-    'five-doored',
-    'five-doors',
-    'five-double-one',
-    'five-drawer',
-    'five-eights',
-    'five-electron',
-    'five-element',
-    'five-feet-seven',
-    'five-feet-three-inch',
-    'five-fifty',
-    'five-fingered',
-    'five-five',
-    'five-five-five',
-    'five-five-one',
     'five-floor',
-    'five-foot-five',
-    'five-foot-one',
-    'five-foot-ten',
-    'five-foot-three',
-    'five-for-16',
-    'five-franc',
-    'five-gatefold',
-    'five-headed',
-    'five-hole',
-    'five-horse',
-    'five-hundred',
-    'five-hundred-drachma',
-    'five-hundred-guinea',
-    'five-hundred-year',
-    'five-hundred-year-old',
     'five-items-only',
-    'five-jet',
-    'five-judge',
-    'five-knuckled',
-    'five-language',
-    'five-level',
-    'five-lorry',
-    'five-men',
-    'five-mile-an-hour',
-    'five-mile-long',
-    'five-million-peso',
-    'five-millionth',
-    'five-module',
-    'five-nations',
-    'five-note',
-    'five-o\'clock',
     'five-o\'clock-shadowed',
-    'five-octave',
-    'five-oh',
-    'five-on-three',
-    'five-one-five',
-    'five-one-one',
-    'five-or-ten',
-    'five-ounce',
-    'five-peg',
-    'five-phased',
-    'five-plus-one',
-    'five-plus-three',
-    'five-pounders',
-    'five-programme',
-    'five-putted',
-    'five-quarter',
     'five-ranked',
-    'five-red-star',
-    'five-rouble',
-    'five-round',
-    'five-rows',
-    'five-seaters',
-    'five-section',
-    'five-setter',
-    'five-seventieth',
-    'five-six',
-    'five-sixteenths',
-    'five-sou',
-    'five-speeder',
-    'five-speeds',
-    'five-star-standard',
-    'five-stop',
     'five-story',
-    'five-strand',
-    'five-stringed',
-    'five-surnamed',
-    'five-syllable',
-    'five-tape',
-    'five-thirteen',
-    'five-thousand-pound',
-    'five-thousand-ton',
-    'five-times-',
-    'five-times-a-day',
-    'five-times-wed',
-    'five-to-24-year-old',
-    'five-to-five',
-    'five-to-four',
-    'five-toed',
     'five-ton',
-    'five-tread',
-    'five-trophy',
-    'five-twenty',
-    'five-two-nine-seven',
-    'five-unit',
-    'five-valve',
-    'five-vehicle',
-    'five-watt',
-    'five-weekly',
-    'five-wents',
-    'five-wins',
-    'five-wood',
-    'five-year&rehy;old',
-    'five-year-plan',
-    'five-years',
     'five-years-olds',
-    'five.the',
-    'five.thirty',
-    'five/eighty',
-    'five_per',
-    'fivecar',
-    'fivefoot',
-    'fiveinch',
-    'fivemile',
-    'fivenine',
-    'fivepenny-piece',
-    'fivepoints',
-    'fiver-rah',
-    'fivestones',
-    'fivethousand',
-    'fivf',
     'fivish',
-    'fix&eacute',
-    'fix\'',
-    'fix-and-forget',
-    'fixation-on',
-    'fixator',
-    'fixcolour',
-    'fixe',
-    'fixed-asset',
-    'fixed-bridge',
-    'fixed-capital',
-    'fixed-cell',
-    'fixed-commission',
-    'fixed-configuration',
-    'fixed-contract',
-    'fixed-dividend',
     'fixed-fine',
-    'fixed-gear',
-    'fixed-heel',
-    'fixed-minded',
-    'fixed-neutrophil',
-    'fixed-odds',
-    'fixed-orbit',
-    'fixed-position',
-    'fixed-priced',
-    'fixed-r',
-    'fixed-route',
-    'fixed-sequence',
-    'fixed-site',
-    'fixed-stage',
-    'fixed-state',
-    'fixed-then-floating',
     'fixed-weight',
-    'fixed-width',
-    'fixed-yield',
-    'fixed.point',
-    'fixed/',
-    'fixed/part',
-    'fixedness',
-    'fixedpenalty',
-    'fixedwing',
-    'fixidity',
-    'fixin',
-    'fixing/cutting',
-    'fixits',
-    'fixlock',
-    'fixman',
-    'fixt&mdash',
     'fixture-clogging',
-    'fixture-lists',
-    'fixture-making',
-    'fixturecard',
-    'fixtureless',
-    'fixturing',
-    'fiynn',
-    'fizia',
-    'fizpatrick',
-    'fizzbangs',
-    'fizzier',
-    'fizzingly',
-    'fizzled-out',
-    'fizzy-drink',
-    'fizzy-drinks',
-    'fizzy-fuzzy',
     'fizzy-sists',
-    'fizzydrinks',
-    'fj&auml;llbrant',
-    'fjallfoss',
-    'fjc',
-    'fjc/amd',
-    'fjc/fsi',
-    'fjeldsatd',
-    'fjeldstad',
-    'fjmc',
-    'fjn',
-    'fjordable',
-    'fjorded',
-    'fjortoft/swindon',
-    'fk44a',
-    'fk506-fkbp',
     'fkame',
-    'fkbp',
-    'fkfl',
-    'fki-american-biased',
-    'fkw',
-    'fkws',
-    'fl&acirc;neur',
-    'fl&atilde',
-    'fl&egr;t',
-    'fl&mdash;free',
-    'fl&ocirc',
-    'fl&ucirc;te',
-    'fl&ucirc;tes',
-    'fl&uuml;gel',
-    'fl&uuml;geln',
-    'fl-flat',
     'fl-fleece',
-    'fl-fm',
-    'fl.1662',
-    'fl055',
-    'fl1,000',
-    'fl10',
-    'fl100',
-    'fl105.20',
-    'fl112.90',
-    'fl116.70',
-    'fl14',
-    'fl140',
-    'fl175,000',
-    'fl197,000',
-    'fl225',
-    'fl360',
     'fl40,000',
-    'fl400,000',
-    'fl615',
-    'fl650',
-    'fl8,300',
-    'fla&ccedil;on',
-    'fla&ndash;01',
-    'fla.',
-    'fla/skinny',
-    'flaachter',
-    'flab-faced',
-    'flab-fighting',
-    'flabbagasted',
-    'flabbed',
-    'flabbergast',
-    'flabbergastingly',
     'flabbies',
-    'flabbily',
-    'flabby-skinned',
-    'flabelliforme',
-    'flabellothyris',
-    'flacc.',
-    'flaccida',
-    'flaccus',
-    'flaches',
-    'flacida',
-    'flackair',
-    'flackett',
-    'flackwell',
-    'flacourtiaceae',
-    'fladdabister',
-    'fladdacaps',
     'fladen',
-    'flae',
-    'flaf',
-    'flag&rehy;bearers',
-    'flag\'',
-    'flag-bearers',
-    'flag-bedecked',
-    'flag-carrying',
-    'flag-dance',
-    'flag-erecting',
-    'flag-lowering',
-    'flag-nationalism',
-    'flag-officers',
-    'flag-oliver',
-    'flag-shaped',
-    'flag-slates',
     'flag-stick',
-    'flag-stones',
-    'flag-stop',
-    'flag-swept',
-    'flag-wavers',
-    'flag/current',
-    'flag/date',
-    'flag/level/chieftain',
-    'flag/lexo',
-    'flag/pace',
-    'flagellae/pili',
-    'flagellar',
-    'flagellated',
-    'flagg',
-    'flagg/neighbour',
-    'flagged&rehy;off',
     'flagged\'',
-    'flagger',
-    'flaggy',
-    'flagitious',
-    'flagitiousness',
-    'flaglets',
-    'flagmakers',
-    'flagmast',
-    'flagot',
-    'flagrancy',
-    'flagrante_delicto',
-    'flagsticks',
-    'flagstone-floored',
-    'flagwavers',
-    'flah',
-    'flahsh',
     'flailings',
-    'flairing',
-    'flairs',
-    'flak&rehy;jackets',
-    'flak-in\'',
-    'flak-jacket',
-    'flak-jacketed',
-    'flake-baited',
-    'flake-laden',
-    'flaked-off',
-    'flakiest',
-    'flakjak',
-    'flako',
-    'flakstadoya',
-    'flaky-pastry',
-    'flaling',
     'flam.',
-    'flama',
-    'flamanck',
-    'flamanville',
-    'flamb&eacute;s',
-    'flambards',
-    'flambeeing',
-    'flamboro\'',
-    'flamboyants',
-    'flamboyaunce',
-    'flambuoyant',
-    'flame-belching',
-    'flame-breasted',
-    'flame-burst',
-    'flame-eyed',
-    'flame-grilled',
     'flame-kindled',
-    'flame-pulling',
-    'flame-tipped',
-    'flame-topped',
-    'flame-tree',
-    'flame-tufts',
-    'flame-weeders',
-    'flame.',
-    'flame/a',
-    'flame/furnace',
-    'flamed-maple',
-    'flameflicker',
-    'flameless',
-    'flamenco-fuelled',
-    'flamencoing',
-    'flameout',
     'flames.firefighters',
-    'flamestorm',
-    'flamethrowers',
-    'flamewave',
-    'flamin',
-    'flamines',
-    'flamingo-edged',
-    'flamingo-type',
-    'flaminian',
-    'flammenwerfer',
-    'flammeus',
-    'flammifer',
-    'flamston',
-    'flamula',
-    'flamur',
-    'flanaghan',
     'flandern',
-    'flanders&mdash;among',
-    'flanderwell',
-    'flandre',
-    'flanellys',
-    'flaneur',
-    'flang',
-    'flanigan',
-    'flanigans',
-    'flank-forward',
-    'flank-guard',
-    'flank-man',
-    'flankmen',
-    'flannel-like',
-    'flannel-wearing',
-    'flannelled',
     'flannerys',
-    'flaouna',
-    'flap-valve',
-    'flap.',
-    'flapdoodle',
-    'flapping-open',
-    'flare-lit',
-    'flare-off',
-    'flare/patient',
-    'flarecopter',
-    'flarepaths',
-    'flares/torches',
-    'flarings',
-    'flasby',
-    'flaschenwein',
-    'flash&rehy;back',
     'flash&rehy;man',
-    'flash-cards',
-    'flash-flooded',
-    'flash-flooding',
-    'flash-forward',
-    'flash-frazzled',
-    'flash-generation/laser-detection',
-    'flash-glimpsed',
-    'flash-happy',
-    'flash-in',
-    'flash-in-the-pan',
-    'flash-ins',
-    'flash-lamp',
-    'flash-lights',
-    'flash-masks',
-    'flash-over',
     'flash-photolysis',
-    'flash-wallop',
-    'flash/tripod',
-    'flashcuts',
-    'flashdance',
-    'flashe',
-    'flashest',
-    'flashhead',
-    'flashiia',
-    'flashing-eyed',
-    'flashlamp',
-    'flashlamp-excited',
-    'flashlit',
-    'flashness',
-    'flashovers',
-    'flassik',
     'flat&mdash;if',
-    'flat(l)',
-    'flat-',
-    'flat-based',
-    'flat-batted',
-    'flat-bell',
-    'flat-boats',
-    'flat-bottoms',
-    'flat-broke',
-    'flat-buying',
-    'flat-c-b',
-    'flat-calm',
-    'flat-cap',
-    'flat-cars',
-    'flat-changing',
-    'flat-chased',
     'flat-coiled',
-    'flat-destructive',
-    'flat-dweller',
-    'flat-dwelling',
-    'flat-earth',
-    'flat-edged',
-    'flat-featured',
-    'flat-fee',
-    'flat-feet',
-    'flat-field',
-    'flat-first',
-    'flat-four',
-    'flat-irons',
-    'flat-land',
-    'flat-leaf',
-    'flat-lid',
     'flat-life.',
-    'flat-maximum',
-    'flat-mount',
-    'flat-nik',
-    'flat-nosed',
-    'flat-on',
-    'flat-ownership',
-    'flat-palm',
-    'flat-picking',
-    'flat-proud',
-    'flat-race',
-    'flat-racing',
-    'flat-radiused',
-    'flat-response',
-    'flat-rods',
-    'flat-roof',
     'flat-sawn',
-    'flat-shared',
-    'flat-sharing',
-    'flat-sided',
-    'flat-smouldering',
-    'flat-soled',
-    'flat-spot',
-    'flat-surfaced',
-    'flat-timber',
-    'flat-tongued',
-    'flat-toped',
-    'flat-warrens',
-    'flat-white',
-    'flat-wound',
-    'flat/a',
-    'flat/maisonette',
     'flat/tapewound',
-    'flat_rather',
-    'flatbush-based',
-    'flatcher',
-    'flatcherism',
-    'flatest',
-    'flateyri',
-    'flatfooting',
-    'flatholders',
-    'flatholm',
-    'flathouse',
-    'flatin',
-    'flating',
-    'flatkeeper',
-    'flatlamp',
-    'flatline',
     'flatman/church',
-    'flatman/cowley',
-    'flatman/vicar',
-    'flatmans',
-    'flatout',
-    'flatpacks',
-    'flatpick',
-    'flatpickers',
-    'flats-for',
-    'flatshanked',
-    'flatt',
-    'flattened-down',
-    'flattened-looking',
-    'flattened-off',
-    'flattenings',
-    'flatter-chested',
     'flattery_rather',
-    'flatting',
-    'flatville',
-    'flatweaving',
-    'flatwood',
-    'flatwoods',
-    'flatwounds',
-    'flatz',
-    'flaubert-sand',
-    'flaubertiana',
-    'flaubertistes',
-    'flaum',
-    'flaunchings',
-    'flaunt-it-and-fuck-you',
-    'flaunty',
-    'flaut',
     'flautilla',
-    'flauto',
-    'flava',
-    'flavanoids',
-    'flavia&mdash',
-    'flavia&mdash;andr&eacute;e',
-    'flavia&mdash;what',
-    'flaviae',
-    'flavian-trajanic',
-    'flavian/early',
-    'flavianus',
-    'flavien',
-    'flavines',
-    'flavinus',
-    'flaviramea',
-    'flavistic',
     'flavitaeniatus',
-    'flavo-protein',
-    'flavopes',
-    'flavoprotins',
-    'flavour-enhancing',
-    'flavour-tested',
-    'flavour.',
-    'flavour/sweetener',
-    'flavoured.',
-    'flavourists',
-    'flavours.',
-    'flavum',
-    'flavus',
-    'flavy',
-    'flaw-free',
-    'flawed.1',
     'flawedness',
-    'flaws.new',
-    'flax-retting',
-    'flax-spinner',
-    'flax-spinners',
-    'flaxby',
-    'flaxed',
-    'flaxes',
-    'flayaway',
-    'flaybrick',
-    'flayl',
-    'flea-bearing',
-    'flea-beetles',
-    'flea-bites',
-    'flea-biting',
-    'flea-flicker',
     'flea-free',
-    'flea-infested',
-    'flea-invested',
-    'flea-killing',
-    'flea-markets',
-    'flea-pits',
-    'flea-powder',
-    'flea-repellent',
-    'flea.',
-    'flea/pou',
-    'fleabites',
-    'fleabitten',
-    'fleace',
-    'fleaed',
-    'fleagle',
-    'fleahoppers',
     'fleaing',
-    'flear',
-    'fleas.',
-    'fleat',
-    'flebridge',
-    'flec-renewal',
-    'flechas',
-    'flechtheim',
-    'fleckalm',
-    'fleckiness',
-    'fledger',
-    'fledges',
-    'fleds',
-    'flee&rehy;ing',
-    'fleec',
-    'fleece-ing',
     'fleece/tactel',
-    'fleecer',
-    'fleecewear',
-    'fleein',
-    'fleeman',
-    'fleener',
-    'fleeng',
-    'fleet-prison',
-    'fleet-train',
-    'fleete',
-    'fleeted',
-    'fleeter',
-    'fleetest',
-    'fleetly',
-    'fleetwing',
-    'fleetwise',
     'fleetwith',
-    'flegel',
-    'flegere',
-    'flehner',
-    'fleicher',
-    'fleischer',
-    'fleischhauer',
-    'fleischman',
-    'fleischmanns',
-    'fleischner',
-    'fleischwurst',
-    'flelzonia',
-    'flem',
-    'fleming/wessex',
-    'flemish-language',
-    'flemish-school',
     'flemish-spe',
-    'flemish-style',
-    'flemishness',
-    'flense',
-    'flensing',
-    'flesaker',
-    'flesch-kincaid',
-    'fleschjes',
-    'flesh\'n\'blood',
-    'flesh-and-bone',
-    'flesh-burgers',
-    'flesh-contact',
-    'flesh-crawling',
-    'flesh-curdling',
-    'flesh-cutting',
-    'flesh-fed',
     'flesh-foods',
-    'flesh-forms',
-    'flesh-frenzy',
-    'flesh-mangling',
-    'flesh-out',
-    'flesh-padded',
-    'flesh-rending',
-    'flesh-seeking',
-    'flesh-skimped',
-    'flesh-sucking',
-    'flesh-tent',
-    'flesh-tinted',
-    'flesh-toned',
-    'flesh-tones',
-    'flesh/',
-    'flesh/tiny',
     'fleshammels',
-    'flesheaters',
-    'flesher',
-    'fleshies',
-    'fleshlike',
-    'fleshlumpeater',
-    'fleshpit',
-    'fleshpot',
-    'fleshrot',
-    'fleshwear',
-    'fleshwound',
-    'fleshy-hued',
-    'fleshy-leafed',
-    'fleshy-leaved',
-    'flessa',
-    'fletcher(40)',
     'fletcher-watson',
-    'fletcher/astronomer',
-    'fletcher/bus',
-    'fletcher/erwin',
-    'fletcher/king',
-    'fletcher/mother',
-    'fletcher/napo',
-    'fletcher/probation',
-    'fletcher/saleswoman',
-    'fletcher/solicitor',
-    'fletcher/stroud',
-    'fletchings',
-    'flettons',
-    'fleur-de',
-    'fleur-de-lille',
-    'fleuret',
     'fleuris',
-    'fleury-la-rivi&egrave;re',
-    'fleury-merogis',
-    'flew-wing',
-    'flewitt',
-    'flex-right-foot',
-    'flexaccount',
-    'flexarray',
-    'flexbility',
-    'flexer',
-    'flexi&ndash;time',
-    'flexi-age',
-    'flexi-corridors',
-    'flexi-furniture',
-    'flexi-hour',
-    'flexi-hours',
     'flexi-kite',
-    'flexi-mags',
-    'flexi-ownership',
-    'flexibacter',
-    'flexibility_on_the_part',
-    'flexibilty',
-    'flexiblade',
-    'flexiblc',
-    'flexible-hours',
-    'flexible-manufacturing',
-    'flexible/rigid',
-    'flexiblestrip',
-    'flexibly-interpreted',
-    'flexibly-trained',
-    'flexicartilage',
-    'flexicover',
     'flexiform',
-    'flexiglass',
-    'flexiheat',
-    'flexilis',
-    'flexiloan.',
-    'flexings',
-    'flexiplast',
-    'flexipop',
-    'flexitainers',
-    'flexitrot',
-    'flexneri',
-    'flexography',
-    'flexsql',
-    'flexton',
-    'flexures',
-    'flexute',
     'flexwing',
-    'flexy',
-    'fleygastong',
-    'flibbertigibbets',
-    'flibberty&rehy;gibbet',
-    'flic-en-flac',
-    'flick\'ring',
-    'flick-action',
-    'flick-back',
-    'flick-knives',
-    'flick-ons',
-    'flick-page',
-    'flick-up',
-    'flicka',
-    'flickan',
-    'flicke',
     'flickeed',
-    'flickereth',
-    'flickerin\'',
-    'flickies',
-    'flickings',
-    'fliedner',
-    'fliegel',
-    'fliegerbluse',
-    'fliegerhorst',
-    'fliess',
-    'fliessen',
-    'flig',
-    'flight&amp;bitter',
-    'flight-',
-    'flight-characteristics',
-    'flight-feathers',
     'flight-inclusive',
-    'flight-instructor',
-    'flight-level',
-    'flight-list',
-    'flight-mode',
-    'flight-noise',
-    'flight-planned',
-    'flight-planning',
-    'flight-recorder',
-    'flight-school',
-    'flight-testing',
-    'flight-to-the-moon',
-    'flight/active',
-    'flightcase-sized',
-    'flightcrew',
-    'flightcrews',
     'flighter',
-    'flightiness',
-    'flightlab',
-    'flightless-boyd',
-    'flightpack',
-    'flightsmaster',
-    'flightsystem',
-    'fligs',
-    'flim-flamming',
-    'flimby',
-    'flims-laax',
-    'flimsier',
-    'flimsily-based',
-    'flimsily-iced',
-    'flimsily-partitioned',
-    'flindburgh',
     'flinging-up',
-    'flint-built',
-    'flint-fronted',
-    'flint-laden',
-    'flint-like',
-    'flint-lock',
-    'flint-strewn',
-    'flint-studded',
-    'flint-towered',
-    'flintcomb',
-    'flinted',
-    'flintiness',
-    'flintlime',
-    'flintoff',
-    'flinton',
-    'flintsone-like',
     'flintstone-like',
-    'flinty-eyed',
-    'flionysiac',
-    'flip-charts',
-    'flip-down',
-    'flip-flopping',
-    'flip-lord',
-    'flip/flop',
-    'flipboards',
-    'flipo',
-    'flipper-clawed',
-    'flipper-hands',
-    'flippered',
-    'flippetti',
-    'flippity',
-    'flippy-floppy',
     'flir',
-    'flis',
-    'flisowski',
-    'flit/',
-    'flitelen',
-    'flites',
-    'flitin',
-    'flitt',
-    'flitterman',
-    'flittersnoop',
-    'flitton',
-    'flitvale',
-    'flitwick',
-    'flivver',
-    'flixe',
-    'flixonase',
     'flmech',
-    'fln-led',
-    'flnished',
-    'flnks-sponsored',
-    'flo-gas',
-    'flo-ral',
-    'float-chamber',
-    'float-fished',
-    'float-operated',
-    'float-plane',
-    'float-tackle',
-    'floatant',
-    'floatels',
-    'floatfished',
-    'floaties',
-    'floating-on-a-cloud',
     'floating-then-zero',
-    'floating.',
-    'floation',
-    'flob',
-    'flobamor',
-    'flobert',
-    'flobs',
-    'flocculant.',
-    'flocculate',
-    'floch-prigent',
-    'flocihilipilifaction',
-    'flock-owners',
-    'flock-piled',
-    'flock-walled',
-    'flockan',
-    'flockes',
     'flockett',
-    'flocking.',
-    'flocks.',
-    'flocon',
-    'flodday',
-    'flodensbog',
-    'floe-ice',
-    'flogger-h',
-    'flohic',
-    'flokatis',
-    'floline',
-    'flom',
-    'flomanesque',
-    'flomborn',
-    'flonking',
-    'floo\'er',
     'flooar',
-    'flood-affected',
-    'flood-devastated',
-    'flood-drains',
-    'flood-light',
-    'flood-like',
-    'flood-murmur',
-    'flood-plain',
-    'flood-prevention',
-    'flood-protection',
-    'flood-stories',
-    'flood-tides',
-    'flood-time',
-    'flood-wall',
-    'floode',
-    'flooded.the',
     'floodin\'',
-    'floodlands',
-    'floodwalls',
-    'flooer',
-    'flookburgh',
-    'floooded',
-    'floop',
-    'floor&rarr;wall&rarr;floor',
-    'floor&rehy;boards',
-    'floor&rehy;covering',
-    'floor\'&mdash',
-    'floor(s)',
-    'floor-board',
-    'floor-by-floor',
-    'floor-coverers',
-    'floor-cross',
     'floor-cushion',
-    'floor-fresco',
-    'floor-killing',
-    'floor-lights',
-    'floor-maintaining',
-    'floor-mat',
-    'floor-mop',
-    'floor-pan',
-    'floor-pans',
-    'floor-plan',
-    'floor-plans',
-    'floor-plates',
-    'floor-polish',
-    'floor-rumbling',
-    'floor-show',
-    'floor-strewn',
     'floor-sweeping',
-    'floor-walker',
-    'floor-wax',
-    'floor-what',
-    'floor.one',
-    'floor_as',
-    'floorboarding',
-    'floorbrush',
-    'floorcare',
-    'floore',
-    'floorfilling',
-    'floorlength',
-    'floorlights',
-    'floorman',
-    'floorpedal',
-    'floorplate',
     'floorpolish',
-    'floorpolishers',
-    'floors.',
-    'floorshows',
-    'floorstanding',
-    'floortiles',
-    'floorwalker',
-    'floorwards',
-    'flooted',
-    'flop-haired',
-    'flopear',
-    'flophouses',
-    'flopperoo',
-    'floppy-arsed',
-    'floppy-based',
-    'floppy-covered',
     'floppy-hatted',
-    'floppy-limbed',
-    'floppy-only',
-    'floppy/hard',
-    'flopsweat',
-    'florabunda',
-    'florade',
-    'floral-cushioned',
-    'floral-print',
-    'florangel',
-    'floraset',
-    'floraword',
-    'floreal',
-    'florek',
-    'florenc',
-    'florence-siena',
     'florence/festival',
-    'florence/rome',
-    'florencia',
-    'florency',
-    'florensa',
-    'florentes',
-    'florentine-mantuan',
-    'florentino',
-    'florentio',
-    'florenza',
-    'floresta',
-    'florestant',
-    'florez',
-    'floriale',
-    'florian&oacute;olis',
-    'floriana',
     'floriani',
-    'florianpolis',
-    'floribundus',
-    'floriculture',
-    'florid&rehy;faced',
-    'floridae',
-    'floridius',
-    'floridly-decorated',
-    'florilegium',
-    'florinda',
-    'florindo',
-    'florins/gulden',
-    'florints',
-    'florios',
-    'florissant',
-    'florissants',
     'floristically-rich',
-    'florivory',
-    'floroscopy',
-    'florry',
-    'florsheims',
-    'florum',
-    'flory-fox',
-    'flory-krigbaum',
-    'flos-cuculi',
-    'floscuculi',
-    'floss-threaders',
-    'floss.',
-    'flosse-vernaudon',
-    'flossenburg',
-    'flostrandli',
-    'flot-n-ad',
     'flote',
-    'flotels',
-    'floting',
-    'floto',
-    'flotsie',
-    'flottantes',
-    'flotte',
-    'flotter',
-    'flotterstone',
-    'flottweg',
-    'flotwell',
-    'flounderings',
-    'floundersi',
-    'flour\'',
-    'flour-based',
-    'flour-bomb',
     'flour-dusting',
-    'flour-manufacturing',
-    'flour-miller',
-    'flour-milling',
-    'flour-sacks',
-    'flour-thickened',
-    'flour-white',
-    'floure',
-    'flourens',
-    'floures',
-    'flouress',
-    'flouride',
-    'flourishinhg',
-    'floursacks',
-    'flourscopy',
-    'flow\'ring',
     'flow\'rs',
-    'flow\'ry',
-    'flow-chart-cum-module',
-    'flow-cost',
-    'flow-cytometry',
-    'flow-on',
-    'flow-rates',
-    'flow-sectioned',
-    'flow-tested',
-    'flow/funds',
-    'flow3d',
-    'flowcytometer',
-    'flower&rehy;pots',
-    'flower-and-citron',
-    'flower-bordered',
-    'flower-children',
     'flower-clasping',
-    'flower-covered',
-    'flower-curtained',
-    'flower-edged',
-    'flower-embroidered',
-    'flower-encompassed',
-    'flower-faced',
-    'flower-fair',
-    'flower-flanked',
-    'flower-flesh',
-    'flower-fresh',
-    'flower-fringed',
-    'flower-gardens',
-    'flower-garlanded',
-    'flower-growing',
-    'flower-head',
     'flower-in-the-hair',
-    'flower-infused',
-    'flower-laden',
-    'flower-lady',
-    'flower-market',
-    'flower-mix',
-    'flower-painted',
-    'flower-paintings',
-    'flower-pattern',
-    'flower-piece',
-    'flower-piercers',
-    'flower-planting',
-    'flower-powered',
-    'flower-presentation',
-    'flower-print',
-    'flower-selling',
     'flower-shapes',
-    'flower-shirted',
-    'flower-soft',
-    'flower-spattered',
-    'flower-spikes',
-    'flower-stands',
-    'flower-stems',
-    'flower-strewn',
-    'flower-throwing',
-    'flower-to-fruiting',
-    'flower-trimmed',
-    'flower-vases',
-    'flower-visiting',
-    'flower-walk',
-    'flower-water',
-    'flower/cake',
     'flowerbuds',
-    'flowercraft',
-    'flowerdew.',
-    'flowerer',
-    'flowerers',
-    'flowerets',
-    'flowergate',
-    'flowerhead',
-    'flowermaking',
-    'flowerpot&rehy;shaped',
-    'flowers&mdash;they',
-    'flowers-',
-    'flowers/wiltshire',
-    'flowers5',
-    'flowerseller',
-    'flowersellers',
     'flowery-papered',
-    'flowery/woody',
-    'floweth',
-    'flowin',
-    'flowingly',
-    'flowingness',
-    'flowings',
-    'flowline',
-    'flowlines',
-    'flown-in',
-    'flowry',
-    'flowsheet',
-    'flowstream',
-    'flowthrough',
-    'flowton',
-    'flowtonbrook',
     'floya',
-    'floyd-rose',
-    'floyd/team',
-    'floyer',
-    'flq',
-    'flt.l',
-    'flt.l.t',
-    'flt.lts',
-    'flu-ridden',
-    'flu/tet',
-    'fluanxol',
-    'flubalub',
-    'flubbadub',
-    'flubs',
-    'fluctating',
-    'fluctu-fucking-ation',
     'fluctuant',
-    'fluctuatingly',
-    'fluctuation-induced',
-    'fluctuations.',
-    'fludd',
-    'fluder',
-    'fludger',
-    'fludrocortisone',
-    'flue-hole',
-    'flue-tiles',
-    'flue/ducted',
-    'flued',
-    'flueless',
-    'fluents',
-    'fluey-like',
-    'fluff-free',
     'fluff-headed',
-    'fluff-spreading',
-    'fluffier',
-    'fluffies',
-    'fluffly',
-    'fluffy-looking',
-    'flug',
-    'flugalhorn',
-    'flugel',
-    'flugelhorns',
-    'flughafen',
-    'flugplatz',
-    'flugschneise',
-    'flugtermans',
-    'flugzeugbau',
-    'fluhli',
     'fluid-balance',
-    'fluid-bed',
-    'fluid-handling',
-    'fluid-mosaic',
-    'fluid-power',
-    'fluid-solid',
-    'fluid-test',
-    'fluid-type',
-    'fluid-volume',
-    'fluidal',
-    'fluidisation',
-    'fluidities',
-    'fluidium',
-    'fluidly-fluently',
-    'fluids/hydrocarbons',
-    'fluing',
     'fluit',
-    'flumazenil',
-    'flumina',
-    'flummox',
-    'flumpity',
-    'flumps',
-    'flung-down',
-    'flung-it',
-    'flung-together',
-    'flunitrazepam',
-    'flunkie',
-    'flunking',
-    'flunks',
-    'flunkyist',
-    'flunt',
-    'fluo',
     'fluorapatite',
-    'fluoresbrite',
-    'fluorescamine',
-    'fluorescein-latex-labelled',
-    'fluorescein-tagged',
-    'fluorescences',
-    'fluorescene',
-    'fluorescens',
-    'fluorescent-activated',
-    'fluorescent-indicator',
-    'fluorescent-lit',
-    'fluorescent/',
-    'fluorescents/spotlights',
-    'fluorescine',
-    'fluoric',
-    'fluoridate',
     'fluoridating',
-    'fluoride-containing',
-    'fluoride-releasing',
-    'fluorine-oriented',
-    'fluorite-barite',
-    'fluorite-baryte',
-    'fluorites',
-    'fluorocarbonate',
-    'fluorometer',
-    'fluorometry',
-    'fluoroorganics',
-    'fluorophores',
-    'fluoroscope',
-    'fluorospar',
-    'fluorosulphonic',
-    'fluorquinolones',
     'fluorscence',
-    'fluorscopic',
-    'fluoxetine',
-    'flupenthixol',
-    'flupper-type',
-    'flurglen',
-    'fluria',
-    'flurishing',
-    'flurrying',
-    'flury-roversi',
-    'flush-',
-    'flush-panelled',
-    'flush-pipe',
-    'flush-right',
-    'flush-toilets',
-    'flushable',
     'flushear',
-    'flushed-red',
-    'flushes.',
-    'flushings',
-    'flusse',
-    'flusser',
-    'flustering',
-    'flute-',
-    'flute-blower',
-    'flute-girl',
-    'flute-like',
-    'flute-maker',
-    'flute-notes',
-    'flute-playing',
-    'flute-type',
-    'flutherin',
     'flutte',
-    'flutter-jump',
-    'flutter-snake',
-    'flutter-tongue',
-    'flutterer',
-    'flutteringly',
-    'fluttes',
-    'fluvals',
-    'fluvial-dominated',
-    'fluviis',
-    'fluvio-glacial',
-    'flux-gate',
-    'flux-labyrinth',
-    'flux.',
-    'fluxed',
-    'fluxing',
     'fluxional',
-    'fluxions',
-    'flv',
-    'flxible',
-    'fly-be-night',
-    'fly-born',
-    'fly-boy',
-    'fly-boys',
-    'fly-by-nights',
-    'fly-bywire',
-    'fly-casting',
-    'fly-catcher',
-    'fly-catchers',
-    'fly-corpses',
-    'fly-covered',
-    'fly-drives',
     'fly-fisher',
-    'fly-fishermen',
-    'fly-fishers',
-    'fly-fornication',
-    'fly-front',
-    'fly-hit',
-    'fly-in-ists',
-    'fly-kicked',
-    'fly-leaves',
-    'fly-man',
-    'fly-men',
-    'fly-mo',
-    'fly-off',
-    'fly-on-the-wall-style',
-    'fly-only',
-    'fly-overs',
     'fly-posting',
-    'fly-speckled',
-    'fly-spotted',
-    'fly-spray',
-    'fly-stained',
-    'fly-strip',
-    'fly-swat',
-    'fly-swatter',
-    'fly-swatting',
-    'fly-the-flag',
-    'fly-tipped',
-    'fly-tipper',
-    'fly-tippers',
-    'fly-tipping',
-    'fly-tyer',
-    'fly-tyers',
     'fly-under',
-    'fly-wheels',
-    'fly-whisk',
-    'fly.now',
-    'fly/time',
-    'fly/tissues',
-    'fly/yellow',
-    'fly_by',
-    'fly_rather',
-    'flybar-equipped',
-    'flybarless',
-    'flyboard',
-    'flyboat',
-    'flyboys',
-    'flydacraft',
-    'flydaw',
     'flyde',
-    'flye',
-    'flye-flap',
-    'flyfish',
-    'flyharvard',
-    'flying-',
-    'flying-ace',
-    'flying-circus',
-    'flying-column',
-    'flying-glove',
-    'flying-jacket',
-    'flying-off',
-    'flying-saucer',
-    'flying-start',
-    'flyingboats',
-    'flyingdales',
     'flym',
-    'flymen',
-    'flyn',
-    'flynge',
-    'flynn-trained',
-    'flynne',
-    'flyoff',
-    'flyposter',
-    'flyposters',
-    'flyposting',
-    'flyridden',
-    'flyring',
-    'flysch-bearing',
-    'flysch-type',
-    'flyscreen',
-    'flysheet-pitch-first',
     'flyspray',
-    'flystjanst',
-    'flytings',
-    'flytipping',
-    'flytower',
-    'flytted',
-    'flyweights',
-    'flywhisk',
-    'fm-friendly',
-    'fm/glow',
-    'fm/kit',
-    'fm/mw/lw',
-    'fm/pr',
-    'fm/toys',
-    'fm10,000',
-    'fm2',
     'fm4,000',
-    'fm500,000,000',
-    'fm54,200',
-    'fm6,900',
-    'fm7',
-    'fm7,000',
-    'fma',
-    'fmcv',
-    'fmet',
-    'fmf',
-    'fmfln',
-    'fmk170,000',
-    'fmk18,000',
-    'fmk28,000',
-    'fmk7,000',
-    'fml',
     'fmln-controlled',
-    'fmln-farabundo',
-    'fmln-fdr',
-    'fmma',
-    'fmmental',
-    'fmnl',
-    'fmol/l',
-    'fmsm',
-    'fmttm',
-    'fmv',
-    'fmw1',
-    'fn&lowbar;discount',
-    'fn&lowbar;fred',
-    'fn&mdash;national',
-    'fn.9',
-    'fn/proc',
     'fn5',
-    'fname&dollar',
-    'fnarr',
-    'fnc',
-    'fnfc',
-    'fni',
-    'fnipp',
-    'fnk',
-    'fnl',
-    'fnlc',
-    'fnnnar',
-    'fnps',
-    'fnrm',
-    'fnsd',
-    'fnsea',
-    'fnuf',
     'fo\'',
-    'fo\'csle',
-    'fo\'st',
-    'fo+k/vd',
-    'fo=kvn',
-    'foad',
-    'foal-to-foal',
-    'foall',
-    'foam-',
-    'foam-backing',
-    'foam-based',
-    'foam-covered',
-    'foam-formings',
-    'foam-headed',
-    'foam-insulated',
-    'foam-lipped',
     'foam-padded',
-    'foam-punching',
-    'foam-streaked',
-    'foam-tasting',
-    'foam-wrapped',
-    'foam.shops',
-    'foam/fibreglass',
-    'foam/of',
-    'foam/wool',
-    'foamblowing',
-    'foamed-stone',
-    'foamhead',
-    'foamings',
-    'foamlike',
-    'foamous',
-    'foamy-flowered',
     'foamy-plumed',
-    'foan',
-    'foart',
-    'foawr',
-    'fobbing-off',
-    'fobney',
-    'fobwatch',
-    'focal-points',
-    'focal/general',
-    'focality',
-    'focalized',
-    'foccart',
-    'fochabers',
-    'foche',
-    'focii',
-    'focion',
     'focke-achgelis',
-    'focsani',
-    'focus-driven',
-    'focus/auto',
-    'focus:conservatives',
-    'focus:education',
-    'focusby',
-    'focussed.',
-    'fodder-dates',
-    'fodio',
-    'fodor-sperber-wilson',
-    'fodorian',
-    'fodrin',
-    'fodrum',
-    'foeken',
-    'foel-cwmcerwyn',
     'foeniculum',
-    'foermer',
-    'foerstel',
-    'foest',
-    'foetal-alcohol',
-    'foetalization',
-    'foetally',
-    'foetens',
-    'foetidly',
-    'foetidus',
-    'foever',
-    'fofanny',
-    'fofe',
-    'fog-bank',
-    'fog-free',
-    'fog-laden',
     'fog-like',
-    'fog-not',
-    'fog-prone',
-    'fog-related',
-    'fog-signal',
-    'fog-signals',
-    'fog-soaked',
-    'fog.',
-    'fogadab',
-    'fogels',
-    'fogelson',
-    'fogg-london',
-    'foggage',
-    'fogges',
-    'foggier',
-    'foggily',
     'foggy-brown',
-    'foggy/clear',
-    'foghorn-voiced',
-    'foglamps',
-    'foglia',
-    'foglight',
-    'fogwill',
-    'fohad',
-    'foice/mgr',
-    'foice/severn',
-    'foil-',
-    'foil-kite',
-    'foilers',
-    'foillan',
-    'foin-stone',
-    'foir',
     'foisonnement',
-    'foister',
-    'foit',
-    'foive',
-    'foix-bearn',
-    'fojtik',
-    'fok',
-    'fokin\'',
-    'fokine-stravinsky',
-    'fokus',
-    'fol-de-lols',
-    'fol-hardi',
-    'fol-hardili',
-    'fol-rol-rol',
-    'folard',
-    'folarpilo',
     'folastre',
-    'folb',
-    'folberth',
-    'folbots',
-    'folch',
-    'fold-belts',
-    'fold-overs',
-    'fold-town',
-    'fold-up-and-put-away',
-    'fold-yard',
-    'foldbacks',
-    'folded-back',
-    'folded-flat',
-    'folded-path',
-    'folded.',
-    'folden',
     'folder.up',
-    'folderol',
-    'foldes',
-    'foldet',
-    'folding\'',
-    'folding-leaf',
-    'folding-wing',
-    'foldings',
-    'foldline',
-    'foldout',
-    'foldyard',
-    'folea',
-    'foliaceus',
-    'foliage-only',
-    'foliages',
-    'foliations',
     'foliesbergeres',
-    'foliis',
-    'folin',
-    'foline',
-    'folinic',
-    'folio-sired',
-    'folio-sized',
-    'folivorous',
-    'foljambe',
-    'folk\'n\'ballads',
-    'folk-artists',
-    'folk-beliefs',
-    'folk-custom',
-    'folk-customs',
-    'folk-dancers',
-    'folk-group',
     'folk-heroes',
-    'folk-law',
-    'folk-legend',
-    'folk-loristic',
-    'folk-medicine',
-    'folk-moot',
-    'folk-myth',
-    'folk-psychological',
-    'folk-religion',
-    'folk-rock-country',
-    'folk-rockers',
-    'folk-roots',
-    'folk-saying',
-    'folk-stories',
-    'folk-themes',
-    'folk-tunes',
     'folk-weave',
-    'folk/blues',
-    'folk/pop',
-    'folke',
-    'folkedup',
-    'folkemuseum',
-    'folkeskoler',
-    'folkesson/skoldbek',
-    'folkett-browne',
-    'folklife',
-    'folklinguistically',
-    'folklore-ism',
-    'folklore/legend',
-    'folklorophobe',
-    'folknick',
-    'folksam',
     'folksey',
-    'folksier',
-    'folksily',
-    'folksworth',
-    'folkton',
-    'folktunes',
-    'folkwangmuseum',
-    'folkway',
-    'folkwin',
-    'folkwise',
-    'folkys',
-    'foll.',
-    'folla',
-    'folled',
-    'follesdal',
-    'follet',
     'follette',
-    'follicle-stimulating',
-    'follies.',
-    'folligon',
-    'folliguet',
-    'follo',
-    'follosco',
-    'follow&rehy;through',
-    'follow\'',
-    'follow-',
-    'follow-on-contract',
-    'follow-on-target',
-    'follow-the-fireworks-code',
-    'follow-then',
-    'follow-up.the',
-    'follow.through',
     'followed-him',
-    'followership',
-    'followeth',
-    'following-after-sales',
-    'following/',
-    'followingcoup',
-    'follows&mdash',
-    'follows*',
-    'follows-',
-    'follows-as',
-    'follows-up',
-    'follows-when',
-    'follows.',
-    'followthrough',
-    'followups',
-    'follwing',
     'folly-cum-',
-    'follyhouse',
-    'foloowing',
-    'folor',
-    'fols',
-    'fols.',
-    'folstad',
-    'folten',
-    'foltinowicz',
-    'folton',
-    'folye',
-    'fomaica-topped',
-    'fomalont',
-    'fomenko',
-    'fomentations',
-    'fomenter',
     'fomento',
-    'foments',
-    'fomer',
-    'fomily',
-    'fomite',
-    'fomukong',
-    'fomula',
+)
+
+blocks_77 = (
+    '$!s#$word##zil")e&die;rie#(cal/oral\'%urine&"ly$!e##der##gri#%ntine#!r$%geman$%yland##sch',
+    '#(-smoking%%trewn#!.#+an/oklahoma#"el%"la$!n#"gi%#ani%!t$)ot-heated\'(stitched&#dom&"ed&$hood',
+    '%!s##ner##oth%"to#"s.$\'saywhat##uet$%illon""ha$+leovantenan#"ed$"em$#rty#\'nbulleh#&renden',
+    '&%heit-*#/21$#ner$*radstrasse"%iders$!y#$ella$#tti#&fpens/#$gele#%joada#&l-fall$#and$!e%\'d&ndash',
+    '$%ingly$$kure$"la&(nt-dumas$$over$*ure-driven(*in-england\'$.but(#the\'#s.e(\'/faults##man#,n&eacute;ant$#-es$#aru',
+    '%!d$$fray$!i$-t-heartedness&(of-heart&&shriek%&hearts%%ified&"n\'\'%g-fit%)ly-flamed((jewelled()patterned#$pule\'!s',
+    '*&haired$#\'92$!-%&browed%(coloured\'*mplexioned\'"py)#ing%$deal&"os%%goers%\'is-fair\'#les%%maids\'$rket',
+    '%&rather&"ed\'"nt%%scene&$hare%(to-lousy$\'/silver$$acre(!s$2banks&ndash;beaver):-pickford-chaplin-griffith%$ourn%\'rassin\'%#unt$&childs',
+    '&)ough(1.8)*!.*(/o\'leary%%oulgh%$ross$$dell$&e-part%"ss$0fax-blakeborough%.ord.protesters)"we$%grade&$owth$&haired&$nded',
+    '$"ie$$lamb&#nds&#wns%#ess%%ights%*y-balanced\'$long$&mainer%%inded\'"er&#tre$+ness-minded%$ilee&%ngton',
+    '%$tead$#uza$+weather-low&#igh%#ood$,y&rehy;tales%!-&%beast&(carriage&$land\'"it&&palace&&queen\'&&shrimp%\'/mortal',
+    '%$flax&#oot%&lights%)tale-like#$sait%"ns\'&-renac&!t$$ceau$#ley$#ons##th\'%,-assumptions&(building&\'centred',
+    '&&healer,!s\'%ungry&(in-grass&)non-faith%)er-in-law%,ful/faithful("l-*&davies)&y-kept%#ing%$orne#$vish#%zabad$#ieh',
+    '#\'nzylber"\'kafanua$#ofo$$papa#*e-auricula%&french&9ur-leopard-print-whatever%-half-timbered%(innocent%#log%(medieval%)sensitive&$nake&%tereo$$ness',
+    '#$hani$,r-i-mudabbir%!u##ies$#ngs#!t$!y")l-lal-lal\'!s#&abella$%cious$"ka%#iko$"na%,ge-dominated',
+    '))s/anarch.%#iko$$schi%"ha##bae##cao%%rragh%"ta&"ed&$ones$!h%$ikov$(on/royal&"ar&#ets',
+    '\'"te$!s$#ula\'#tus#&derols%#tta$(ingworth$&o-type%!s#!e$!s%\'&aacute$#tte&!o$%wesle',
+    '#!f#-gui&egrave;re##ing$!s#\'kenburg&"er&&hausen("vn&%stein$,irk-stirling\'!2$$kirk$\'landers(+s(malvinas))&-bound',
+    '%"ff$!s#*l&rehy;out$"\'n$!-%$away%+derivatives&#own%%front%$guys%$outs%%pipes&(lus-rise%$year$#/by',
+    '%%three$$acci&!i\'$ous.*"ly&"y\'%!n%!s$%backs$(en\'-type&%-tree$$guys$$ibly%%ng-in*%-love',
+    '(&rising(%short((together$$ling$$oden%%pians&\'oscopic+!y%!r%#ver%&w-deer\'\'periods&"es&$iana\'"ng',
+    '%!/&%lower%\'_and_so%*chirmjager$#uja\'!h&#iah#$oona##qui#%rinne#"sa%!s$"ch$/e-consciousness&$dawn',
+    '\'$ront&*napoleonic\'\'egative.!s&&starts(#one%%/rape%*ly-accused()beckoning%"st%$tter\'#ist*!s%$work$$hood',
+    '%$rena$*taff/verse%#one#"ta##uns$#res$"sh%!i$#tin\'!\'##vai#!x##zon"#ma.$\'gustans',
+    '%$icao$!u#$bare#&e-type$).mortimer$#/it$#_as$!l%!s#!i$#com$%liale("ly\'\'r-style(-/non-familiar',
+    ')!s)(t&eacute*+y/deference)"us)#zes()ly-shaped("s.&)en-partei\'!r(!e\'$s.in(!/)(couples.&$hood&#sts',
+    '%\'le-rose%!o%"us%\'y&mdash&"-a((llowance\'+centredness(&harles(%ircle(*um-laundry\')dominated\'\'ellwood(*xpenditure\'$farm(#irm',
+    '(\'riendly\'%group\'$head)"ld(\'oldings\'\'incomes(!s\'$life\'(magazine)!n(&embers\'$only\'0plus-an-outsider((ortraits\'\'related',
+    '\')situation()pecialist((tructure\'%tombs(#ype\'#way($illy)"se&!.&!/\'(beginner\'&couple\'2friends/neighbours\'"he\'!i',
+    '\'#non\'2spouse/colleagues/&"er&!s\'!o$+ne-affected\'$free\'%level\'\'periods\'\'ravaged\'$torn&!.%%gdale%#ine##lee',
+    '$"yn##mau#$osus$&tidine#%roost#$ulus"-n&rehy;shaped)$tasy)&window+"se#)\'-letters$%s-eye#\'(atic)s#!-$\'bashing',
+    '%$lade$%cluib$\'draught$$fare&&ulting%&eredin%%olded$&in-fin$%light)!s$%maker$&tailed%&rained$#war#"ad',
+    '(+hummingbird\'!k$$yesh#$belt\'!s$"oy##ced%#lli$"hi$(iability\'"ly%#est%,ly-disguised(%named%$ness',
+    '$#oni$"y\'%(-dressed&%goods&\'looking&(schmancy&(yourself%%dress%!e#\'dangled$\'emonium%"rl$#ian#"ek$#lli',
+    '$!s$#uil#%fanis#\'g-jawed%\'toothed$&ablang%\'risugan$)ed-friend%\'rprints$$orak$%ugyab#!i$!a$"di#&jakana',
+    '#$mily$#ore%!s#\'ned-out%!r&!s%!t%!y$"ia%-ng/thamesdown%"sh$\'y-annie&+by-gaslight%)ing-about##ony',
+    '%&tastic$,.nonetheless$$haws%"el%"ip$$idar$%ungun#!t$-&aacute;stico%)ocirc;mas,"es$-abbidabbidosy&%ulous%.isie-impromptu%!n',
+    '&$cies&&iaargh\'!c\'#es.\'#zer&%matic\'!s&,tic-bathetic**depressive)*ally-named.)patterned*#ted+#ion)!k*!s',
+    ')"us&\'y(long)\'*-adventure(%based(,comedy-drama(\'forming(&heroic($land)#ife($self*\'nsation)%onata)$tyle(%think)#ime',
+    '($wise)$orld\'!.(#but%$yzee$#ham%$orpe$"in$&rained$$uzzi#"ys"(o/basrah$#umm%#ndp&$esco',
+    '"%ppani#%s/fam"#qir"(r&ograve$-rehy;sweeping#!\'#&-aimed$(creeping&!y$(distance&%vided$&enough$%famed%\'etched.%#rom',
+    ')*convincing)$easy**mbarrassed)%happy*&ealthy)%ideal*+mpoverished)*negligible)(ordinary)\'perfect)%quiet)(reliable)&serene*%table))universal',
+    '$&gained%#one$!i$\'looking$"of%*utstripped$$post$)reach-ing)%ingly%,ight-wingers$*stretching$$that%2oo-good-to-be-true(&strong)\'weeping',
+    '$"up%!v$$west#$.all$(reaching#%/near%"ot##_in#%abund(!i$!d$%frans$&glione%!o&!n',
+    '$!i$)jplanning$#kat$#mus$#neh$!t#%bauti$+enindustrie%\'reshaye&(g&eacute$*mathematik$/rother/landlady0#ord##ce.%!t',
+    '$#ies$!y##del&"ls%!r$!o%!e#"e-%\'cutting%\'dodgers%&fixing%$paid\'#yer*!s%&runner',
+    '&)tructures%%table%$wars$!.$#ast$!l%!l$$ndon%"se%$tino$$pack$(s-rather$(well.the(*/relenting("ed',
+    '$!y#)gesloides$#ion##han&!a&!g#"ib%#orz$"da&!h$"es$!n%!e%(gdonense)$ians',
+    '$!q$!t$)zindustry#$jana&!i#$kasa$#ers$$unda#"la$)ey/heller$&ington$!o$!s#+m&mdash;and$*-buildings',
+    '%%child%#ers&%state+!s%$girl%$hand&\'oldings\'#rse*!s\'\'usehold*!s%"in\'\'tensive%)labourers\'!d',
+    '%&reform%&safety&%chool&&ervant&#ize&%moked&$tate\'#rip&&upport%%touns&$rade%%waste&$ives&*oodchester\'\'rker(s)',
+    '$)/business%"in%&miller$$able%\'ceutico%!r&!y$&brough$$cote$$down$3er-conservationists*\'tractor))operative((raftsmen\'(employer',
+    '\'%miner\'%owned\'&people\'%saved(\'ettlers()ubstitute&$.she&\'/cattle(#oal))ntractors\'(engineer\')neighbour\'+pastoralist(\'harmacy($ilot',
+    '&)s-general\'!.(#the\')/herdsmen()part-time\'#_as%$ttes$%fresh%"ul$\'holders&#rse)!s&,use-produced**restaurant*%style',
+    '$!i%*lon/fitter%"mg%%talia$!m$4o&ucirc;tier-en-brie%.or/oxfordshire%"ut$&s.this%#hop%*tead/joint$#toy$*yard-fresh#!n$*ascullogue',
+    '%!y$*dale-style$)es-barnes&#ene&"ol&"yl%$tani$%field$)ham-based\'!s&!n%&orough$#ley$"ol$$sagh',
+    '$#ton#&okhzad$"ok%"qi$&uchely%#dja%&k-like\'(sluglett%!s%$tski%!z#(qirullah$\'uarsons#*r/customer$%adane',
+    '%#gon&"ut%"hs%\'khanist%"ll%!n&"d.\'&/solar%0r-hockley/former/&korean&(.ardiles&\'/former&!a$!e%#ely',
+    '\'%/avon(&friend($skin%"nc&!s$"il%"ng\'+ton/defence$!o%%khnia%!l$$ucca%#gia##san$$etti',
+    '$#ley#\'t-arsed(#ing\'$tist%\'breaths%\'catcher%&sucker$"er$$face%#elt$)her-flung%(ingstone$#lek$$ynge#$udin',
+    '#(vefabrik%!l%!r$$ings$$ver.#%water##yad"%s(t)n#$anen\'\'strasse#+b-sponsored#"ce$!h$!i%"al',
+    '%\'cularis(!e%&ectomy%$itis%$nans\'$tin\')#on\'(#rix%+o-maxillary&"la%#sms&0t&rehy;brutalist\'*-motivated(%style)*ympathiser',
+    '\'"s.##hed%!h%!r$"io&0n&rehy;conscious\'!-(%aware((clothing(&design((features(&houses(\'induced(#led)#ike',
+    '((magazine)$odel-"ly(&parade(&ridden(\'seekers)$hops)$peak(&victim(\'wearing\'(/textile\'#_in\'-able/musical/\'#eds\'$ites',
+    '\'%model\'(s-change\'$wear&"on$$port##ing$&sculus##man##olt$"na#$quel##sam%"no$!i$!o',
+    '*,disappearing+%rying*\'written$$\'ned$--appreciating%/becoming-barren&#low&&owlers&#uck%\'charger%#day(!s&&ealing\'\'clining\'\'pleting',
+    '%(emerging&*ncroaching%&fading\'%lling\'\'tteners&%irers\'$xing&\'lagging\'\'owering&(ooderies(#ted&%reeze%$held%+in/fast-out&!t',
+    '%$link&&oading\'%oking%(maturing&*ultiplying%%paint&&ecking&$hase&%icked&\'ressing%\'raiding&\'eacting\'$boot\'!d(%ucing',
+    '\'&trieve&%iding&#ope&"un%\'scoring&&elling\'&ttling&(hrinking&\'ounding&%poken\'\'reading&\'tarting%(thinking\'$reat&&racked',
+    '(#tch%)vanishing\'%rying%\'weaving&\'heeling&&orking&(rinkling$&/quick%(reliable$!=$$ball(!s%$uild$$comm$)ened-just',
+    '&\'-drying\'&fading\'*innovating\')migrating\'$pace+!d\')spreading\'$than+(-average,)projected,%usual)"ey&!.&\'/slower%#st-',
+    ')(xpanding(&rising)\'otating()spreading\'\'growing$&filter&%ngers%#low%$rame&"et$&growth$0idiously-dressed%"es%"sh$$load',
+    '$$math%%oving$$open$!p%$aced\'#ket&"th$#rac&"da"(t&eacute$%mdash$*rehy;chett#"-3$&a-lump%$rsed',
+    '$)barrelled&Cstard-with-a-beard-dead-in-the-bath%%ottom%&rained%&urning$\'cheeked%%oated$%dense$$gain$&hatred$&lipped%#oss$&melter$&packed%(roducing',
+    '$&soaked&&lvents%\'pecific%$tock\'$ring$\'thumbed$(walleted%&rapped##/24$&alkali$&health#"ae$,h-affiliated&(inspired%(/islamic',
+    '$0l&mdash;thecourt%!.%"is%!s$#mid$!r##bit$#oys#$cats#)e&mdash;i$".6$)/god/luck$,benefratelli$\'fulness$!r',
+    '%1r&mdash;something&#(s)&&-coach)%mplex\'#god\'\'husband.!s\'2i-want-to-kill-you("n-*)law-to-be*\'science\'$just\'$king\'$love\'$more',
+    '(!y\'%never\'"of)+&rehy;three)$-one\'\'protest\'(religion)*placements(#ole\'*substitute)(rrogates\'&to-son&!.&(/brother\'(daughter',
+    '\'#his\'&infant\'.mother/brother.,daughter/son\'6photographer/landowner&&fucker&%lands\'"ey\'%iness\')y-looking%"ya$%hulla$#ima$#man$&omable',
+    '\'!s&&lessly&&s-deep$$ulla$!y#!i$-gue-resistant\'%/life$#meh$"ou$#pur$"ya#%lings#&mawati#"ou',
+    '$&chbach$#eas$#han%%edera$#oes#!t$"al$"eh%$ners&$ings%$rson%\'st-ever$#ily%"ng$!o',
+    '%"un$&y-acid&$phil%%cakes#"um%!a&&-isaak$\'ousness#$wahs"%ubert%!t$0ourg-saint-denis\'%ienne#$cets$$hard',
+    '%#ons\'%ville$"on&%bergs&%nerie##der$!i#,gh-a-ballagh%&anvale%#nan##jas#%l-uhx$#azo$%chins%(onbridge',
+    '$!d%#ing$,enf&uuml;rst$,kner/banbury)\'coracle)&driver)$sdlp)&thames(!s$,l/gloucester%$ythe$$ston$"t\'%&-block+!s',
+    '&)diagnosis(\'ssected&$free&)generated&*resilience&\'tracing(#ees%(/failure&+malfunction&*suggestion%"er\'"ed%\'finding%#ily%$line',
+    '&(/defects\'0reasons/remedies$!x#&n-like$"ce$\'ophiles$\'tleroys%#roy#\'quemont#+r&eacute;an#&sanias$)t/premier%#ine&$sche#+te-de-mieux',
+    '(!s#+ve-inspired\'"sh%!t#&x-bois\'"ok&%ronze%(moralist%)na&iuml;f\'"if$%_amis$\'bourdon$*monnayeurs"\'v-oured#$ager',
+    '#%erche$"ur#$ites#"om$$noid$&ritism%!y$&uarbly%%illes%$r-as\'(currying\')mongering&-able&mdash;an)"y.&+ed:relative',
+    '&(ite-last))flavoured($isms&"s."+w&rehy;cett##.53#)cett-inne#$ddwy$&ington#%kener%,s/headmaster#+lty-pounder\'%style#+n-and-white%%froth',
+    '$#ers$%ingly%"sh$$less$!y#%sley."*x-by-email$"in$&toting$(with-ocr#*0716083283#)broadcast#!e$(s/cables#+ing/calling',
+    '#$mail#"us""y.#)a-largeau$#nce$#wan#"e\'$!.$"ry$!z#"id$!z#%lkner$$lard$#yng',
+    '#"ot$#umi%"rn##re.#!s##yad$"um#&zullin"#zel$#nda$!s#"le$"ic$%oalah##zis',
+    '##24u$"5k##40q"".9""01"!2#!3""31"!f"$gd/n"\'i-style#!e#!m#!s"!m',
+    '""oa"3p&mdash;progressive#"ss"%scale#!i""ts"\'u23,000#&32,000!-c(m)&gt;fc(n)##n1)&*&gt;fc(n2)$"2)"$-100#&family"!8',
+    '"$dedm#!g"$egce"!f"#ibs""mo"!n"&onsole#$oled""up!.d-feather/down"!2"!4"#906"&alling',
+    '"&di-v6s$$/utp"!e"2f&mdash;democratic"$ight"(ldef.com"!n",p&mdash;free#)*776.97.3#$-the#2/prd&mdash;radical""ry""s."!t"!u',
+    '$&irc;te#%ndash"$(cn)$"o)#*ii)-oxygen%-i)-containing"&-cu-ni##dup##far$(i-fo-fum#"ti"#/he#"mn#*university""2_',
+    '")alar-glen#*r-a-choire&&rousal%&crazed%)inspiring%&levels%)mongering%-of&rehy;crime%%sharp&&ilence&\'tricken$!/%!a%&things$&brache',
+    '$(edy-gowk%$some$\'fullest$,less-looking(\'ly-held$#man%%onger$(n/thames%#beg%!e%%ought%!s%%ville%&yhough$+s&ndash;and',
+    '%0ome&rehy;looking($ness&!n#%sable$&t-days&$time%$days%(ing-hall##tes$)her-brain-!s()cushioned(&filled*!n)%ooted',
+    '()insulated()lightness*#ned(&plumed($soft(&tailed(&weight)#ine)#ork\'&bedded($rain,"ed\')ed-footed*%icing)"ge',
+    '\'$ings\'&s/body($tars)\'onhaugh\')tonehaugh\'\'weights($heel\'(y-leafed)&topped$"re$%ure-a(%based()detection."or0!s',
+    ')!n($page)\'ositive($rich(&values($wise)%riter\'#.as\'\'/letter\'%s****((-perhaps($.the,"se(+/programmes\'$ttes',
+    '&!y#!u")b&ndash;1+!9*"22*"30*!7*%april*#mar##-12%#5th$%march#".1%"-2%!0',
+    '$!8#$/mar#(20/mar20#%antel#"em$\'ndazole#$ille#"or#$rary$&ifugal%$lely&#ity%!s$!u%%aries',
+    ')(ndash;10/"24/!9/(december/#sat0"un("-1)"26)!9)(december)%early)#may)(november(!.(!/',
+    '$!y#%urary"#cha$+ner-birkoff$#ter##it/#!k#!l$!t#!o#!s#!t$&ionery#\'undable")d&rehy;up',
+    '#%_even#"co$$reds##dan$"on#!e$"co$!l%#and$,r&rehy;ation%1a&ccedil&atilde;o&,l-government(*republican\'#ize\'+ly-assisted',
+    '*&funded**prescribed*&raised+)ecognised*)sponsored\'"ni\'!s((tandards&#sts&#tie\'"on%#ici&#que%,mediterraneo%%spiel',
+    '$"cs$!o#&orchak\'"uk%.owicz/director%"uk$$tova#$pols#$rick#$unix"0e&mdash&pound;25)#;in#&-basis$&fixing%#ree',
+    '$&hiking$\'sharing%(plitting#\'/client#$bate$*le-looking\'(sounding%*y-mindedly#+d&rehy;back$!-%*back-loops\'!g%*conversion%&grains%$line',
+    '%%store%$time&&roughs%%water$%/tack$-and-expansion$"ba&+ck-drenched(+/evaluation)+information(#ers%"ox$!e%"r.&&/leger',
+    '&"ed&%liner%"th$&grains$%house$*ing-bottle(\'grounds(&places)$oint-!s\'*/nutrition$#lot\'!s$$pond$%stuff',
+    '#)gletscher##han#"l\'%!/%"um$(-goodism%.it-in-the-bone%(oriented%,the-response$$/how$"_a&!s%"no$\'ability&"le',
+    '$\'er-like&"ed%"st%(y/mother&!s$"in&,g\'&mdash;but\'!-(&behind(*expression($hate($tone\'(/thought)$ough\'$:the',
+    '\'4s-of-being-consulted2(valuable(*/affective$%s.the%$/the$(y-touchy##nan#%payer#$ring$!y#"s.$&/bills%&school$!h#"t\'',
+    '%"\'i%(breaking%$five&0lat-on-the-floor%$high%#off&,n-the-ground%*per-minute&&lanted\'"us%\'rhyming%#ten$$/2.1%&second$%afeet',
+    '$%bones$"ed$#ham"!g#&etting#$gans##ina##man"!h#%ertys#!l$#ing$%sdorf#!n#"rs',
+    '#!d$$hlim$!r#$fdom#"ge%"le%&nbaum.$"in#*j&oacute;o#*lchenfeldt$!d$#ing#%n/ira$*biochemica$+chemikalien',
+    '$"er$&garten$$inga$)ne-bheinn&!r$3stein-iba&ntilde;ez#"ra$$eiss$"is$"us##sel$%tiest&"ly&$ness%$ritz',
+    '$"as$%eiras$$hean##zor""jn"$kadu#"ih##ter".l&amp;sup1,2,3#%afacs%"el#%biger$%ridge#"de%$ggii',
+    '%#rau&+ill-zankell$$kamp$+marschallin$!s$)webelhaft)!s#%eccia$"ke&$ddin#(gate/tim#!i$%cetti%"ie&$simo',
+    '\'!e(!\'(!r\'"y\'$(n-y-gors%$oids$%pismo$!u$(x-hubert&$ited%"es%$stoe((we-based,$ound%$towe',
+    '%&length%)mongeries%&runner%$time$(a-me-lad%(h-i-puts%"te&#ing&#ors$&bridge&#ook$!e%,d/nimbrethil%)r-me-lads&(/butcher',
+    '$$gate$#ick%!n&%g-saw\'#ham\'!s&&i-like%$ship$&monger*!s$"on%1w&rehy;journalist-%udges,(savoyard,*travellers',
+    ')#tor,!s((mericans()pprentice($rabs)(chbishop)$tist(%sians((thenians*%letes()ustralian\')barrister)%tsmen($eing,!s',
+    '\'%canon)&ptains)&tholic(%entre((hristian()lassicist)$ergy(&ockney)(mmanders+%oners+&unists*%poser)+nservatives)*untrywomen(\'reature',
+    ')\'usaders(%urate\'\'dancers(#eaf)&mocrat((irectors\'\'earther(\'lectors((mployees((uropeans(!x)$iles\'\'feaster(&leming\'(generals',
+    '(%reeks\'#hfs(%ildas($uman,!s\'+inhabitants)%mates)&vaders(\'rishmen\'&kabyes(#ing\')labourers)%wyers($oner\')magicians',
+    ')!n*"cs(%e-lad-!s)"n.(\'inister)(ssionary(!p(&uslims\'*northerner\'\'officer((lympians(\'utsider\',parishioners*(ticipant',
+    '(*hilosopher(%icket)&lgrims*#ots)%oneer($oles((resbyter)&isoner)\'oducers*\'testers*\'vincial(,sychologists(\'uritans\'#rat($ebel',
+    ')&porter)\'sidents($ider(%ulers\'%scots,#man)\'ribbler(\'ervants((ocialist)%ldier.!s(%pirit)&rinter(#tar)\'ruggler',
+    '((ubaltern)-f&rehy;ferers*&ferers)(pporters\'$thai(\'ipplers(&oilers((ribesmen\')ulsterman(-ndergraduates\')victorian(\'oyagers\'(warriors(&itness(\'oodsmen',
+    '+#man*\'shipper(%riter&)/european&$eses&%ship.*$ping("op$%sides%$tone$$tops$&walker%#ort$!y#\'mingham',
+    '#%perin$#ham##sen&#egg&$feld%!r$#ite$"on$$tein%#one#+t&mdash;but+$that$%-fair%&headed%%lined',
+    '%#pen%(textured&"he$"_a$"en$)ham-based\')/villager$&makers&!n$)on/estate$\'rinelli##yng#%zmann"*m&atilde;o#+-metallists',
+    '##aal$,le&rehy;rich&#(s)&!-\'+appropriate()ssociated\'%based(%iased\'\'defined\'&father()lattering\'$kind\'$ness\'&reader\'%torso',
+    '\'\'private&"s.$#ndo##bot#%enina#$gems$$liah#"ia$$cide$!n%"ae%#ead&#lla&%mesis%"in',
+    ')*identified)\'looking()/feminist))masculine("ly(!s\'#ist(.ty/masculinity&\'sations\'"im("sm\'%m.and\',t-influenced)+puritanical))socialist',
+    '(+/socialists("as(\'s/human&"te&"ze(!s\'#ing#\'me-type&!y$#ina#%odene$\'seconds#\'toskirt#(ur-tibia#!y',
+    '#,-es-trar-lis$&sucked#&ari-is#(camsamin$)e-builder+#ing&\'cutting&#fix&\'hopping&\'jumping&%lines&%panel&&sitter&%which\'#ire',
+    '%*d-i-meadow%$less%$post$.ot/oxfordshire&!e&-t/oxfordshire#$dent%\'r-style\'$type&&/buddy&$bird&$esky&!i$#ick%!s',
+    '#"ek$$lla.$\'strates)$ions-!.\'!e(%llids$#tre#%g-hsu%$shui$#tai$!u#%halls%!m#!i',
+    '$"ci$#oux##jal&#/gh##ley#"md#%n-tye$\'/centre$"ec%\'l-stalk&#lqc%"ma%#ssy$"ie%$more',
+    '$&y-flat#&odyree$,xaprop-ethyl#*propimorph#"ra#$some$#ter\'$wald$#vig#!t$*on/student$!s#(valerate#$wich&+ke-clennell',
+    '#"zi"%o(oh)#$/mno#"ck#%dorov("na&"um"!p#!g"&raccas$)l-looking%"es%)ly-bright$#mez$!n',
+    '$#rds$!y##ber#%chase%\'rissake(&tssake#$ddig$!e%#ric$#ful\'!l$/inandi-coburgii)#son$&owsian$!s',
+    '$#ngi%&zvaros$$ydun%!s#%forth#"ge$&ie-out\'#son\'&wergie%$slie$!s$&ursons%)s/barclay&,on-developed)&funded',
+    '),v-mcgrandles(\'/atomic)*nationwide)(resident)#vet##had&&-pasha%!n%!t#"ie%!r$"ha$!k$%nghee\'!i',
+    '#$kauf$"in#$lini#!m$)&aacute;n%(eacute;s$&anagah&"gh%&riello%#tas$"ee%#nta($tive%!r%(t&eacute',
+    '$\'i-dirac%"er%!s#5n&aacute;ndez-galiano&\'tilde;o$%-book%*collection%)dominated%\'fringed%(gatherer%$hung%&leaved$(/british%\'network%\'patient',
+    '(\'shealth)(industry((z-britto*(llorente**mir&oacute*%ochoa\'"os$\'borough%#ury$"el%"ry%!t$%gully$$ilee$%lands',
+    '$"on#*ociousness&$ties\'"y.$"da$!n$"uk$%xcube$!z%$epur#(r&egrave$!*$&agosto%%illes&$uoli',
+    '\'#ais&"gi&!o&)te/father\'"is%$resi&)i-driving(7iba&ntilde;ez-griffiths(#red\'!.\'\'/mother\'!n(!i&#one%%zzini',
+    '%"be%%doxin%$irai%"ll%"ol%"ra&"es&&s/home%%t-box\'$cage\'$face&\'ing-out)!s&$like%#yra',
+    '%\'/pietro%*c-chloride&$rete%,es-sponsored()to-orient+(trailers\'+/hoverspeed%#gno%"ni%\'s-wheel&#hyn%!t&%e-rod&"ic$\'ocarril',
+    '&\'oncrete&$rete&&yanide%%graph%)magnesian*!t+!s\'#tik&"yn%!n&$iere%#san%\'viaires(#ria*!o',
+    '\'&treous%%xcube%$zine$#uch%&gineus%#le.$\'y-based\'#oat\'"us&$fume&)inclusive%2/hovercraft/seacat\'(ydrofoil%%boats%)hill.name',
+    '%(man/farm\'%sters##stl##teh$#ica%*le-looking\'"ly&$ilty\'\'ser-the*&/grain(#ier\',ty&rehy;cult)\'-breads*%magic\'\'zations',
+    '*$s_on&#ube%#zol$$lity$#man$&oniere##ule$$ntur$!s$#zzi#+vently-held$$idly$$ours"-s&rehy;tooned#!h',
+    '$"ie##ole##sal$!e%!d#%tegem%%halle%#rey%$tics$*i&rehy;val%%nniog%0val-cum-carnival(#.so("ly&%e-day',
+    '&#ums\'!s$"os$#uea#!w"-tch-and-carry%"it#\'e-style%$time#&hallah$-erston-godley*#_et$*iye/turkey#$ilia&&sation',
+    '$!s%"ch%(h-chains*#rms&)istically\'&zation&$wear%"ov\'!a%"so#"ke#*oplacental#&places#%t\'red$\'ercairn',
+    '#"um%!i$"s.")ud-ridden$8al-aristocratic-agrarian\'$like\'(military)$nded\'+patriarchal\'&system\'$type&$ist\'\',z&rehy;ation("ed&"ly',
+    '#&erback#%ferme#"gh#&illard&!e\'#rat\'!t(\'&eacute#,lgen-stained#!s$#tel##vre#!x"+ver-bearing&\'haunted',
+    '(&fested&$spot\'&teppes(&ricken&#van%#ack%$ills&*sh-looking%%ously%%stein#%ronia#"um##ver"/w&mdash;perhaps#!\'',
+    '$\'minutes#!.#!/$\'odyssey#$cher$#ott\',/oxfordshire#!e$"ll##ins&%/gard#%sdale$"on$#ter%"on',
+    '"\'y-faced#"er%(abendian##far#%nmann$!t#%stown#$ther##yaz"(z-topped#%ensac$!s!&f1,400#-.2&ndash;1.8m##00.',
+    '#"25##3.9#"40$"65#"65##800$"8m#!m""20#%1,658$"0m##9.2"%3,007#400,000&ndash;400,000%!m',
+    '#!m"$4.70$"93#!0$/0&ndash;600,000"(5&frac12#000&ndash;700,000#(500rfbx9"$600m""70$"0m"\'823,180##400#!5"\'923,000',
+    '#!s">ccccfcffffffffffcfccffffffffff$<fffffcffffffffccccccccfcffcc#!k"%eaver#"es##lls#%nning#!t"#fft#!m$!v#%wwaaw"#iii#%lmiau',
+    '$$hers#"ve")l/scan/re#&anders#$oute"%olkes#,rde/national$(est-fach$"ge$#iwr$"th#"ss##unt$!r%"ty',
+    '",r1&ndash;1.5.!m$$,000%\'297,000$#.16%&2-1.5m&!1%$34bn%#407%,5&ndash;1.8m&!4%!6%!7%,8&ndash;2.2m$30,000&ndash;100,000',
+    '%#.7m%%0,000&!m%!3%!m$$1.76$%2,000)-&ndash;80,000%#.44%/0&ndash;150,000&!m%%5,000$)3,888,000%$.529%!0',
+    '%$,000%#6bn%"7m%"90$%5,000%!5$!6%".5$!7%"5m$28,000&ndash;25,000%".8%#0.5%"50%"8m',
+    '$#.08%!2%#450%,5&ndash;3.5m&!m%!8$000&ndash;250,000-\'300,000%"bn$$1.22&#450%!1$#2.9%!5%%8,000',
+    '&!m$.5&ndash;50,000%"00$"78$&89,000%!m$$9.5m&#9bn#)3&ndash;5$(,424,000$".2%!3%!6%!8$*0&ndash;35',
+    '$,10&ndash;330%!4&".9%!9$!2%%0,000$#4.2$!5%"0m%"7m$"60%!3$!7$"83%!5',
+    ',!m$$,000%#500$,.5&ndash;5.9$&00,000*.&ndash;500,000%"8m$!1%!0$!2%!0&$,000$*3&ndash;65$&50,000$$6.77',
+    '$"90#.5&ndash;50,000+!6$".7%!8$"00&.&ndash;600,000&.,000&ndash;1.4$&11,000$!3%"bn$450,000&ndash;650,000$$9.1m#)6&ndash;8$(,681,000',
+    '%!5%$76bn$20,000&ndash;80,000%!0&$,000&!m$!2$%8.4bn%!0#!7$".8$!0%2,000&ndash;150,000%/0&ndash;900,000&$,000',
+    '$!2$$5.1m%!0&$,000#*8&ndash;10$(,880,000$".4%!9$+0&ndash;100%)0&ndash;1&,,000&ndash;1*%-ffr1$!3%%2,500$&50,000',
+    '$&80,000&!m%"7m#$9.29\'!m%!5%"68$%4.3bn$"50$!7$"95#%ancon#"ey#"om""ss',
+    '"%ytche!*g&ndash;1d"#-1d"!."$12sa"#260"#51f"#87u"!a#".9"!c"(d-fitted#!.#!s"#eet',
+    '"&ifteen""lh""nm"$r.2s#!k"!t#!j!"ha"!b"#ima#0r&rehy;bhallaich$*-bhallaich"!l"!m"!s',
+    '#"2a"*uar-thuill#$rain!/i&egrave;rement#%mdash"#-fi#$xing"&aciall#"la$"ho$"ka$#los#!m$$etta$"ma',
+    '$)aigheacht$!c%)&egrave;e%"e\'&"es%%ially$!t$#uis#%s-200$$coes$$ella#&t-alfa%%owned$\'/lancia#!z',
+    '$$tube##bed$#ins$!s#(er-optic%#ail%&optics$#tte#(r&egrave$$e***%&-board($nded\'%undle&)composite(\'nsumers',
+    '*"ed\'&orming\'#ull&$high&\'optical&$pile*!s\'\'urkinje&&sinews\'\'tripped&%tract%%/100g&%epoxy&%resin%\'bundles',
+    '%,glass/kevlar*#ing%#nyl%$rich%\'s&mdash&%copes$&illary(#ted%*n-affinity\'*dissolving\'*fibrinogen\'$rich\')selective/#ity(*pecificity',
+    '\'\'peptide$!o%(-adenoma&&nectin%(adenomas%*blast-like++stimulating%#gen&$last%#mix&&yomata%+nectin-type%#sed&#is.(*/cirrhosis',
+    '(!y%*us-looking()to-spongy%(vascular#%story#$ulas$"re"%caria#&ciones#!h$!i%!o$"on$#tel&\'sterben',
+    '#!k$"en#!m#%oides#!p#"t.$)ion-facts)#ilm(%maker\'!/(\'polydor(%space\'\'al-real)$iser*&zation',
+    '&"us$$onal%!r#!z"\'d-elity#"al$"ni%$zata$#tov#!c#*des/artist$$itch$,le-and-flute\'&de-dee&*r/princess',
+    '(#one(%rings%#ier#%e/gma$(icommiss,!a-#rii,!i*#tto%"sm$$lina&#sta&%tatis\'"er\'+y&mdash;was',
+    '$#nza$#rsz#%getty#"ia#"o\'$&-fibre##rer#&uciare(\'y/agent&!e$!s"&ebiger#!d$#ing#(f-rentes',
+    '%!l#0ld&rehy;research%!\'%#(s)%!-&\'aligned\'#rmy\'#tom&%based\'\'y-field)#set&\'cannons\')ollecting&$data\'\'ressing',
+    '&$fare\'#ree&\'general&%hands&+independent)$uced\'"on&\'kitchen&(marshall-!s\'(odulated&\'nesting&\'of-view\'*perational\'\'riented',
+    '\'+rogrammable)&motion&&reeves&%sides\'(tripping(#udy\'&ystems&&tested*#ing*!s\'"he\',rip/holidays&$vole&\'walking)"ls',
+    '\'&orking%".o%&/green&-reverse-field%"13&!4&!5%#air%%borne%&course)!t%#day%!e&/r/ex-apprentice%#ful',
+    '&#uns%%hands&+ouse/father+)guitarist+\'maxillo+%pupil%\'ing/son(%esque(!s%\'marshal\'$ster%$name%&pieces%%scape&#end',
+    '%+updateall()%*work-based$"ke##nal$$dful$!e$#iet$!o$"ta#,rce-sounding&*ly-defined*%riven)&fought)$held&%ness.',
+    '$!e$"re$#tag$&y-eyed&&headed,$ness&#red&(tempered##sca$%olana$&tiness#!t$#zav#"ve"&f-rox.',
+    '&#orn&$uilt$$head$$land$!r$%stone#,ferentiation##ies##tee&"n%\'!\'\'(-a-sides))nd-a-half(-by-eight-inch+#ten',
+    '(&dollar(%forty(,hundred-mile0$year(&incher(%litre)#ove(&member($page)&iastre(2something-or-other)%torey*$rong(,year-old-boy\'$fold',
+    '*\'largest)2/sixteenth-century%"ne&"th$#ffn$)h-biggest&&column&&degree&$form($urth&$gear&$hand&(interval&&lowest&)magnitude',
+    '&*preference&\'ranking&"to(\'-fourth&%years%&/sixth%"er%"of$$ies.\'"ey&.th-anniversary$&y-acre&\'century&&dollar&&eighth',
+    '\'(ive-foot\'(oot-high\'$ranc&&guinea&$hour&#ish&%metre\'+ile-an-hour*)s-an-hour)$lion&&nation&#oar)"ed\'$ne\'s&!p',
+    '\'$iece&&record\'%ouble&$seat($cond(%venth\'(ignature(/x&rehy;year-old))-year-old\')omethings&(thousand."th($ree-,$year+!s',
+    '%$/two%$fold\'"ur%$knot%#one%)something".g&gt&lt;esc&gt#)-branches$&eaters$)flavoured%$ruit$#jig$&shaped#$.1.1&!3',
+    '&!8%#1.1%!2%!3%!4%!7%!8%!9&".1$$2.13\'!4&!2&!4%!1%!2',
+    '&"29&!3%!0%!6$$4.11&!3%!1%!8$%5.1-i&!2\'#(c)&!3&!5&!9&!l',
+    '$#6.1&!2&!6&!8%!6$#7.1\'$2(c)&!3&!4&!6$$8.33&!5&$7(a)&$8(a)$!9',
+    '("e)&!3&!5&!7$#iii$&l.3(b)$#off$!s##1.2%!3$!1$!2$!3$!4$!5',
+    '$!7$!8$!9#!2$".1$!0$!2##4.4#"an$%rella%%o-mad$"ta#!e$!l#$gins',
+    '%/misgrugifooniyn#&ht-day&(fighters&&intros&,to-the-limit%\'/flight%+er-aircraft(\'fiddler($like(&planes(%style\')/business\'$land%(finisher%)ing&mdash',
+    ')$fish+!t)&leader)\'machine)#off))platforms*$ower))resources)$ship-!s(!s%%marks%"s.#!i$"ni',
+    '#&leaves$#ine#!r#$s.51&!3#-ueroainterior$"ig$(r&eacute%#ate\'"if(0ve-expressionist%)e&ndash;1-!3\'*rehy;heads&#(s)',
+    '\'\'carving\'*decoration(&rawing\'&eights\'\'forming(%rieze\'$head+!s\'&length\'\'moulded\'$of-8*:eight-female-body-screwing\'%scene((huffling(&tained',
+    '(\'ubjects\')typically\'$zone+!s&(/diagram&!_&&d-wood&\'headand&&making&"rs&\'s&ndash\'".j\'#i.l($raqi%#in\'',
+    '"!j#\'alkoski""ka#!e##ret$!i#&tionen#"us"(l&eacute#\'-filthy%#orn$-ox-er-oi-days$#thy#%abusi$%menia',
+    '$"ne%,ovsky-zenkov$&riform#%berts$#oid$&rosing#$ches#"e-%#aid%$card%&filled%\'grinder%-interrogating%\'keeping%(layering',
+    '%%notes%\'o-fucks%*structured$$.ba1\'!2$!1$!2$$card%$lose%#ube$%drawn$"in$&makers%$erge$"ne',
+    '$$open$$plus%$ower%"ro$"rs$$s=20%%erver%&haring%%ystem$"t-&%abreu%%s.fil$#use$\'y-based#"fy',
+    '##hos#!i$"ae%"ls%%tions&"on$#beg$%cales$$form$.gree-and-rivet)$like$"is$#kon$%minov%"on',
+    '$%nelle%)g-cabinet\'&system$(opietism%!s$"pa%(enduline&"pi&!s%"in\'!a\'*o-american%"ov&$wski%$pini',
+    '$(xfelnina$!z##kus#$l\'us$&-horse%\'in-the-,&blanks\'!s$\'ability%$form$!d$#eca%&d-full%#mal%\'r-joist',
+    '%#ter$!i%!n&/g&mdash;station\'!-\').stations\')/emptying(*insulation\'#ham%"ou%"po%#ter$!l$.on-payoux/john.&victim',
+    '$$pina$(y-formis#/m&mdash;usually$(-by-film%(changing&#lip\'"ub%,distribution%\'editing%\'footage\'%rming&&unning%$goer%\'holders%(industry',
+    '%$noir%+of-the-play%%plots&&review\'&inting\'\'oducing(&jector%\'related%&school\'$ript&#ets&%tarry\'#ill\'4udio-cum-information%%there',
+    '+!s%\'winding&#ork("ld&&rapped\'$iter+!s$!.%$intv$\'/action+*-adventure&$udio%%simon$$able%$kers',
+    '$0ed-entertainment\'.in-a-fortnight%\'r/young&#ian$$fest$%going$/ing/photography$%lines$&ogenic%"re$#s-a%$.but%)/packages&&videos%%chool',
+    '\'$ting%#how(!s%)tar-style)$type&#ock$&y-fern##net#\'o-faxes%&topped$\'chowski$-fax/organiser$$meni$#pod\'#ial',
+    '$#tas$"us##reg#\'s/fille$"ak$#hie$!m#$teau%*r-cleaning\'&feeder(#ree\'#gel(%round\'#out\'&papers',
+    '(%lates\'$tips\'$wool&\'/filter\'+integrators&$able&#ers&%paper&"s.&%trons$\'h-caked\'&entury&(dwellers&\'mongers&*preference',
+    '%"os%!s%\'y-earth\'\'gleeful\'\'looking\'(sounding\'\'tasting$#ock%&nbased$\'rations$!y#\'zfabrik"%m7.07#"ag%#est',
+    '$$lett$)ra-member\'*registered%%iatus#!e$#che#"gt#!l#!s"%n-de-$\'flaring$%gered$#ray#%/legs#"15',
+    '#%acial("ly$#gle$"il$(l&eacute%&-draft&%match&\'quarter&$race&&salary\'\'ounding\'$tage&$task&\'winning%$.the',
+    '%%_coup%,ists/winners&$ties&#zes%!l&"y\'\'&-burst(#won\'%janet%%mente%%s.the&&trides$-n&rehy;cially%#ace\'#ial',
+    '&,e-capitalist)(onscious()directors)%riven(&linked($plan\')/european()insurance\'!r&!i\'#al-**asset-type*,bureaucratic*,cum-economic*+engineering',
+    '*#led+#oss*(material*)numerical*)reporting*\'service*,transactions*%value)*/numerical**regulating*+speculative+$taff)0ly&rehy;troubled+,-accountable,%based',
+    ',&driven,+embarrassed,\'pressed,&shrewd-$ound-(tretched,&viable)(planning)&sector\'#eel(#ros\'#ng\'),-maintaining%"sa&$ises',
+    '&%iaria$\'steride#$berg$0ogad&oacute;ttir%%rough#$care$(h-hatton&)knightley&$lark&%royce%(/patient%"aa%"er\'!a%%field',
+    '$1-\'em-and-mash-\'em%&raiser%$spot)!s%#the$"en%\'r&mdash&!n&)s-keepers%"th$#ham$!i%\'ng-list(#out\'"_a',
+    '$%laech&\'y/nurse$$ongs$"um#.e&rehy;grained*%tuned$!\'$!-%(balanced&#red\'&istled&$y-me%&chisel&%otton%&denier',
+    '%&enough%)finishing\'%tting&(lavoured%$gems%$hewn&$oned%&limbed\'#ned%#mix%&needle&$osed%)particled&$rint%$sand',
+    '&$cale\'$ored&&kinned&&latted&\'pinning&)tructural%&tipped&$oned%&voiced%\'weather&&oolled$#.he$(/flyaway$&d-down%!.',
+    '$%gauge%#old$%light%*y-balanced\')chiselled((oiffured)(ntrolled(&rushed\'(detailed(&ivided\'&etched(\'xecuted\'&grated)$ound\'$kept',
+    '\'$made\')patterned(&ointed\'*sculptured(%ifted\'(tailored\'\'wrought$(r-rooted&)than-fine$\'s/costs%#ses%&t-ever\'%grain&#res&!y',
+    '$&wirers$!y#&g\'ring$!.$&arette&!i%!s$,er&rehy;bowl,\'wagging&!-\')and-thumb\'$bone+!s)"wl+!s',
+    '()onnection*\'taining)&unting($rack)&ossing(%urled\'%dried)!y\'#end*"ed\'%feeds(&licked,!s*"ps(&ucking',
+    '\'$hold*"es\'&in-air\'\'jabbing\'\'lickin\')#ght(#oad\'&moving\')paintings(#ick+"ed+#in\'(#lug(\'rinters\'\'reading',
+    '($ings(&ubbing\'\'searing($ized(#nap($peed*"ll(&tained)$rike($weep\'\'tapping($ight)$pped\'%waved(%iggle',
+    '(&ritten&*board/neck(!b)!s("ne(#wls&)ed-friend\'#nds&*fertigkeit&%holds&&licker("ke\'$ocks&$mark&*nail-sized',
+    '&$onis&#pad\'$ints\'$osts\'$rick)#tns&&s&rehy\'$mear\'$pell+"er+"ng(%itzen\'"ss\'$tall($roke',
+    ')#ped$$hall$#ing$#lam%!e$\'ringhoe$#ure$!y#%ially$#bus$!c%"al\'$ness%$kety&#ity',
+    '$\x82sh-\'im-off-rip-\'is-guts-out-fump-\'im-in-the-belly-ya-big-ugly-bag-of-chisels-yer-tattoo\'d-dick\'ead\'Oit-in-thirty-days-using-only-domestic-handtools\'$line\'%point&\'/-/0007&"am&(ing-line&"on%+t&egrave;re$"ta%-e-dimensional\'\'element\'&medium\'$risk%$ribe',
+    '#(kelkraut&#man$&lehall&#man&!s$!y#(land-see\'$ised$"er$"on%#ugh#)marchicus&"ks$/ere/oxfordshire#(n-kelcey',
+    '$!a%$cial$+egan-butler%%ntrop%,rty/designer&!y%!s%$y.it$#ies%$more%!n&!g%(sh-based)#red(\'russian',
+    '%$arks$(o-ugrian%#ula$\'pipette$&skogen$$tial$"ur$%ygook#&occhio$!l$"sh#%schia$$hing$$ider%$hing',
+    '$"on$$pang$#ter\'$wald%!p#&talich$#ech$"on$#ree$!y##way#$zean$*termunzter.(schlucht"$occo',
+    '#!m##nas%#var$"na%%barra#$pped#"ra%"no$$ella%%ntini%#tti$#ile&"lo%"ta&#ure',
+    '#"tt%$-lee#!w"-ps151&ndash;2"&r-cone%"un$%dying$\'forests#$angi$!r$#tli#$beck$!y#%cones$$roft',
+    '%,rehy;fighter*$like*%proof*)resisting*&walker$!\'$&-alarm*!s&*nd-thunder\'"ts&)ppliances&%rrows&$ssay%$ball)$oons',
+    '\'!d\'"ll&$irds&#oat\'#lts\'$mber+!s&$reak\'$icks\'$oken&%ucket%%carts&$omer&#rew\'%owned',
+    '\'%zzled&(etection&(irection&&raught%"em&&scapes&#xit\'*tinguisher/#ing%%falls\'$nged&%ights&$lies&*ountaining&$ront',
+    '%&hazard&%earth(!t&#ole\'#rse\'#ses&&ydrant%*insulating&#ron%\'lighter&#oad%&makers&%ounts(#ths%#new',
+    '%\'officer,!s&#pal&)range/red%%party&"it&#lan&\'olished&$rone(&tected%&raiser&\'eddened&#isk%(salvaged&&carred',
+    '&#ign)#als\'#ren&#now&#oul&&pewing\'$read&&tarter\'$icks\'$orms\'&reaked(#ung&#wim%$tail)"ed',
+    '\'(pestries&%emple&$inge*!d\'$pped&\'olerant&$rail%\'walkers\'#tch*"er&#eed&%heels&$oman\')rshippers$!.',
+    '%!n$!/%)emergency%\'jericho%"on$%_over$-arm-explosive$$balm&!y%#erg%*ird\'-style(&-style%$lade%#oat&"wl',
+    '&!y%\'randish&&eather*#ing&#oom%"ug$$cast$"d.%$ance$&fights&"sh%)ly-sparks$#gas%"od\'!s',
+    '$%heart%%osing$,lady_instead%%ights&"ne%#ock$&making&-n-turned-\'tec\')/security\'!s(#hip&#rks%#en\'$#nds%$oise',
+    '%$rone\'$ofer$%queen$\'raisers(#ing$"s.%&creens%&etting+!.%#hip%#ign%#ong%$tick)!s&$orms',
+    '$#tex%%horns%$raps$\'walking&%tcher+!s%+ork-related#%grove#%house#(ing-line\'%plate($oint&!.#&kowska$1u&scaron;n&yacute',
+    '#+m&mdash;see$!-%#-in&+pre-project%)buildings\'\'ttocked&&y-firm%$hold%\'looking%\'muscled%#one%(sounding%#the%$ware$\'/agency',
+    '%&mentum$(er-based$&ing-up$$let\'%)y-bounded\'\'moulded\'&stated&!.$#ont$-s&mdash;which%&--will%$.the%$tone$#yly##ouz',
+    '##pac##sby$,t&mdash;your&)rehy;ball+#day,\'ivision+\'footing+$hand+$name+*time/small,\'o-third%&-aided\'(mendment&&ballot\'%uyers',
+    ')#ver(&tegory\'$omer+!s(%ntact($urse\'\'rossing&\'day-of--%issue\'\'elivery((rivative\')iscovered)!k\'-o-it-yourself&\'edition',
+    '\'*stablished&%fence\'$ling(\'owering\'%ooted+"rs*#ing((rmulated&&glance&$home&,in-first-out($ning\'!s&#lap("ss',
+    '&\'mention\'%inute\'%overs&*name-terms*!s\'&ighter+#ish\'"or(#vel&#of-)+a&rehy;kind\'"ut&)paragraph)"ty("ss',
+    '\'%eriod)*son-plural,$ally\'#ick\'*references,#red(#ize&*remembered((solution&\'secured(!t\'$hell\'#top&&teamer("rm',
+    '\'&o-file)&second)#ten&"up&$vote&%water\'#eek\'#hat\'%inter("th\'(orld-war%+.preference&$time&$wife%&/fixed',
+    '%%brook%$edge&"rs%*generation%$line%$ness%$save$$wood#1th&ndash;brearley%,-butterfield%\'/severn\'&tudent%%lands%$view$&y-five',
+    '##zal",s-controlled#\'c-lands$-al/regulatory%#rdo$*her-diskau(-phelps-taylor()reinhardt%$hoff%\'i-weiss%(li-weiss%$mann%#off#$erve#\'h&mdash',
+    '$!\'%&n\'chip+!s$!-%,and-chippery%%based&#one&\'reeding&%uying%(catchers%&dinner\'%sease%(eye-lens(!s%$farm',
+    '&&eeding&"in($gers&&reezer\'!y%%heads%+in-the-pond%%juice%\'keeping&$ills%%laden&#ice\'#ver&$ouse%&market',
+    '(!t%$nets(#ted&&ibbled%)per-pound&"ie&$oint\'"ol%\'related%&scaled(\'ttering\'#rap&\'melling&%onars&$pear',
+    '&$ting&)wallowing%(throwing&&rading("ps\'\'emulous%\'vendors%\'watcher&$eirs$#.in$&/dirty%&invert+&ebrate)"st%&mobile',
+    '$$back&"it&"ll%$ed-c\'!s&"in&#lly%$owls%\'reeders%$urne$$cake&"re$&ed-out%&r-bird\'%clark',
+    '\'%price&&/bothy\'%chief\'&flying\'&gilder\'(hospital\'\'student\'*thamesdown&#_et&$boat&$iers()s-licence)!.&!m\'\'an-knit',
+    '\'*en-farmers&%rotha&$town%#yed$%farms$+guard-based$"ie&!r%"ly%(ng-chaps(\'grounds(%knife($port($rods(%skiff',
+    '(&tackle((villages(\'weights\'#.it$-keeping/tetra%!i%$nife)--in-your-face$$lice$(man-made\'%/clay(\'pension%#eat&!n%(onkeyman',
+    '%#ess$&ometer$%plate)!s%$ools$$quay(!s$$room$&tailed(#ing&)nk-lights%#our(!s$%waste$*y-smelling',
+    '$%erton$$flug##ler#!s$!e%"ha%$nden$2ion-fusion-fission(\'product\'$able%&parist(%ously$"on$#ues%\'re-vein',
+    '%&battle&#low%)clenching%%faced&&ucking\'"ll%$like%\'shaking&#ize&\'winging%(thumbing%%width$"/i$\'i-cuffs%$cuff',
+    '$"on$#ral%#unk$&s-they$-ula-suffering\'$tion&"la&%otomy"+t-and-flare$$bits$&centre$!i%\'nducing$&making$$ness',
+    '$(together#$.the#&/dance$,fresh/frisky#!a#"ba#(c-(fab\')%$goat$%hburg%"es#\'fulness#!h$#ers#(kin-paul#$ling',
+    '#,ness-fanatic(,maximisation(&rating\'$.and\'-/conditioning(&parish(\'stamina#"ou#!r#\'sgibbon$!t#%table$+ed-kitchens\'\'tintawn\'"up',
+    '\'#the%$ning%,st&mdash;the\'!\'$#in\'&%gness%&paldis$#ler&%worth#(z-gibbon+\'/defend%%ralph$\'abraham%$lan.$(carraldo',
+    ',!s$0gerald/formation%$iven%#rip$&hammon&&rdinge\'#ris("ys%$enry$%inger$&osbern$(patricks&#yne%&omeroy$%ralph',
+    '&"ya$\'stephen$\'wakelin&%lters&$rine\'"yn%)illiamiam"$uids#%metto$!i%$cino#"ve"#vbe#2e&mdash;generation+$year',
+    '+#car%(rehy;and*)bedroomed*$foot*\'pointed*%speed*&volume*(year-old$,(h&ouml;yre)$#-a-&"ll&"nd(+-a-half-day)$four)$half',
+    '&%rched\'!m&%sides%&baller\'\'rrelled\'(throomed&&illion&%laded\'#ock&#ook&%utton&\'y-eight%&canvas\'!r&!d',
+    ')"re&&hamber($nnel\'$urch&%lawed&$oach\'&loured(#umn\')ordinated\'$peck\'#unt&\'ustomer%(day-week&&iamond\'\'rection',
+    '\'#med\'$ored)!s\'(uble-one&%rawer%&eights&\'lectron($ment%*feet-seven**three-inch&$ifty\'&ngered\'"ve)%-five*#one',
+    '&(oot-five*#one*#ten+$hree\'$r-16&$ranc%(gatefold%&headed&#ole\'#rse&&undred,(-drachma-&guinea-$year1$-old',
+    '%#jet&$udge%(knuckled%(language&$evel&$orry%#men&+ile-an-hour*$long()lion-peso,"th&%odule%\'nations&#ote%\'o\'clock',
+    '&%ctave&!h&\'n-three\'&e-five)#one&%r-ten&$unce%#peg&%hased&\'lus-one*%three&\'ounders&(rogramme&%utted%\'quarter',
+    '&\'ed-star&%ouble("nd\'"ws%\'seaters\'%ction\'$tter\'(ventieth&"ix(\'teenths&"ou&&peeder*!s&,tar-standard\'"op',
+    '\'$rand(%inged&\'urnamed&\'yllable%$tape&\'hirteen\',ousand-pound.#ton&%imes-+%a-day+#wed&-o-24-year-old($five)#our\'"ed',
+    '&$read\'$ophy&%wenty\',o-nine-seven%$unit%%valve&&ehicle%$watt&%eekly\'#nts&#ins&#ood%-year&rehy;old)%-plan)!s',
+    '$$.the\'$irty$\'/eighty$$_per$#car$$foot$$inch$$mile$$nine$+penny-piece%%oints$%r-rah$&stones$(thousand#!f',
+    '"(x&eacute#!\'#+-and-forget#(ation-on%"or#&colour#!e$\'d-asset&&bridge&\'capital\'#ell\')ommission(+nfiguration)%tract&(dividend',
+    '&$gear&$heel&&minded&*neutrophil&$odds\'$rbit&(position\'%riced&!r\'$oute&(sequence\'#ite\'$tage)"te&-then-floating',
+    '\'$idth&%yield%&.point%!/&$part%$ness%\'penalty%$wing#%idity$!n%)g/cutting$"ts#$lock##man#\'t&mdash',
+    '(%lists(&making\'$card\'$less&#ing"#ynn"#zia#\'patrick#&zbangs$#ier%$ngly$\'led-out$\'y-drink+!s&%fuzzy',
+    '%&drinks!.j&auml;llbrant"\'allfoss"!c#$/amd$#fsi"\'eldsatd&#tad""mc"!n"\'ordable%"ed$,toft/swindon!$k44a"(506-fkbp',
+    '""bp""fl"1i-american-biased"!w#!s!,l&acirc;neur$%tilde#%egr;t#*mdash;free#%ocirc#(ucirc;te+!s$\'uml;gel+!n"%-flat',
+    '$!m"%.1662"#055"%1,000#!0$!0$$5.20#%12.90$$6.70#!4$!0#&75,000#&97,000"#225"#360',
+    '$%0,000"#615#"50"%8,300"+a&ccedil;on$(ndash;01#!.#\'/skinny#&achter#\'b-faced&\'ighting$(bagasted%"ed&%rgast+%ingly',
+    '&"ly%)y-skinned$)elliforme\'\'othyris##cc.%#ida%"us$#hes$#ida$$kair%#ett%$well$*ourtiaceae#)ddabister&$caps',
+    '#!e#!f#.g&rehy;bearers$!\'$(-bearers\'&decked%(carrying%%dance%(erecting%(lowering%+nationalism%(officers&%liver%&shaped&%lates',
+    '\'$ones(!p&$wept%&wavers$(/current%$date%/level/chieftain\'"xo%$pace$*ellae/pili(!r(#ted$!g%*/neighbour%+ed&rehy;off',
+    '&!r%!y$&itious*$ness$$lets$&makers&"st$"ot$%rancy\'*te_delicto$&sticks&+one-floored$&wavers#!h$"sh',
+    '$$ring%!s#.k&rehy;jackets$$-in\'%&jacket+"ed$(e-baited&%laden%%d-off$$iest$#jak$!o$\'stadoya$(y-pastry#$ling',
+    '$!a%#nck&%ville$*b&eacute;s%$ards%%eeing%$oro\'&%yants($unce%&uoyant$*e-belching\'\'reasted\'$urst&$eyed&\'grilled',
+    '&\'pulling&&tipped\'%opped\'#ree\'$ufts&\'weeders%!.%"/a&\'furnace%\'d-maple%\'flicker%$less%+nco-fuelled(#ing%#out',
+    '&$torm%(throwers%$wave$"in&"es&(go-edged)$type&#ian$)menwerfer&"us%$ifer$$ston$#ula%!r#&naghan',
+    '\'-s&mdash;among\'$well%"re$%ellys%"ur$!g$$igan(!s$)k-forward&%guard&#man%#men$(nel-like(\'wearing\'#led',
+    '#$ouna#\'p-valve$!.$&doodle$)ping-open#&re-lit&#off%(/patient%&copter%%paths%)s/torches$$ings##sby$(chenwein$+h&rehy;back',
+    '%&-cards&\'flooded+#ing\'&orward\'\'razzled&:generation/laser-detection\'\'limpsed&%happy&"in((-the-pan(!s&$lamp\'%ights&%masks&$over',
+    '&&wallop%\'/tripod%$cuts%%dance%!e&"st%$head%#iia&\'ng-eyed%$lamp)(-excited&"it%$ness%%overs$#sik',
+    '$#(l)$!-%%based\'$tted&#ell&$oats\'%ttoms&$roke&%uying%#c-b&#alm\'!p\'"rs&\'hanging(#sed',
+    '%+destructive&&weller*#ing%%earth&$dged%(featured\'!e(!t&$ield\'#rst&#our%%irons%$land&#eaf&"id',
+    '%\'maximum&$ount%#nik&$osed%"on&(wnership%$palm&&icking&$roud%$race(#ing\'&diused&\'esponse&#ods\'"of',
+    '&%hared)#ing&$ided&*mouldering&$oled&#pot&\'urfaced%&timber&&ongued\'#ped%\'warrens&$hite&$ound$"/a%*maisonette',
+    '$\'_rather$*bush-based$$cher(#ism$#est%#yri$\'footing$\'holders\'!m&#use$"in&!g$&keeper$$lamp%#ine',
+    ')%owley(%vicar\'!s$#out$%packs%#ick(#ers$%s-for%&hanked$!t%)ened-down*\'looking*#off\'$ings&)r-chested',
+    '%#ing$%ville$\'weaving%#ood(!s&$unds$!z#*ubert-sand($iana)$stes$!m$\'nchings%1t-it-and-fuck-you&!y$!t',
+    '%!o#"va%%noids$(ia&mdash,.;andr&eacute;e-$what&!e&*n-trajanic\'&/early\'"us%"en%#nes&"us%%ramea%$stic',
+    '$)o-protein%#pes&&rotins%,ur-enhancing(&tested\'!.\'*/sweetener\'#ed.\'$ists\'"s.$"um%!s$!y#&w-free$$ed.1',
+    '$%s.new#)x-retting%\'spinner,!s$"by$"ed%!s#%yaway$%brick$!l"*ea-bearing\'%etles&$ites(#ing%\'flicker',
+    '%(infested\'&vested%\'killing%\'markets%$pits&%owder%)repellent$!.$$/pou$%bites\'#ten$"ce$"ed$#gle$\'hoppers',
+    '$!r$"s.$!t#&bridge#)c-renewal$#has%%theim$$kalm%%iness#$dger&!s$!s#*e&rehy;ing$!c%%e-ing',
+    '&!r&$wear$"in$#man$#ner%!g$(t-prison&%train%!e&!d&!r&"st%"ly%$wing\'"se',
+    '##gel%"re#$hner#%icher$%scher\'%hauer\'#man*"ns\'#ner\'%wurst#&lzonia#!m$*ing/wessex%+sh-language(&school',
+    ')$tyle\'$ness##nse%#ing#%saker$*ch-kincaid&#jes$)h\'n\'blood%)-and-bone&\'burgers&\'contact\'\'rawling\'\'urdling(%tting&#fed',
+    '(#rms\'%renzy&(mangling&#out&&padded&\'rending&\'seeking\'&kimped\'&ucking&$tent\'%inted\'$oned*!s%!/&$tiny',
+    '%&eaters&!r%#ies%$like&(umpeater%#pit&"ot%#rot%$wear&$ound%&y-hued\'&leafed*#ved$"sa#)tcher(40)',
+    '(+/astronomer)#bus)%erwin)$king)&mother)$napo))probation)*saleswoman*(olicitor*%troud&$ings$$tons#%ur-de(&-lille%"et',
+    '%3y-la-rivi&egrave;re\'\'merogis#&w-wing$#itt#,x-right-foot$\'account%$rray$&bility$"er$,i&ndash;time%$-age&)corridors&)furniture&$hour*!s',
+    '&$mags&)ownership%&bacter&1ility_on_the_part("ty&$lade\'!c\'\'e-hours)-manufacturing(&/rigid(%strip\'-y-interpreted)\'trained%)cartilage&$over',
+    '%%glass%$heat%#lis&$oan.%#ngs%%plast&"op%\'tainers&#rot$$neri$\'ography$#sql$#ton$$ures%"te',
+    '$!y#(ygastong".ibbertigibbets(-y&rehy;gibbet#)c-en-flac$&k\'ring%\'-action&$back&&knives&#ons&$page&"up%!a&!n%!e',
+    '&$reth\'#in\'%#ies&#ngs#%edner$#gel&&rbluse\'%horst$"ss&"en#!g$-ht&amp;bitter&!-\'/characteristics\'(feathers',
+    ')(structor\'%level(#ist\'$mode\'%noise\'\'planned,#ing\'(recorder\'&school\'\'testing(*o-the-moon&\'/active&*case-sized\'#rew*!s',
+    '&%iness&#lab\'(ess-boyd&$pack&\'smaster\'%ystem$!s#*m-flamming$"by$&s-laax%#ier&(ly-based)$iced)+partitioned#\'ndburgh',
+    '$\'t-built&\'fronted&%laden\'#ike\'#ock&&strewn(%udded&\'towered%$comb%"ed%%iness%$lime%#off&!n%)sone-like',
+    '%&y-eyed#\'onysiac#(p-charts%$down%(flopping%$lord$%/flop$&boards$!o$*per-clawed(%hands\'"ed&#tti%#ity%(y-floppy',
+    '#!s$%owski#"t/$$elen%!s$"in$!t%%erman\'%snoop%"on$$vale$$wick#$vver#"xe$%onase',
+    '"%n-led#%ished#,ks-sponsored"%o-gas$#ral#*at-chamber&&fished&(operated&%plane&&tackle%#ant%#els%&fished%#ies&-ng-on-a-cloud',
+    '(!.&"on#!b$$amor$#ert$!s#(cculant.("te$)h-prigent$0ihilipilifaction$(k-owners&%piled&&walled%"an%"es',
+    '%$ing.%"s.$"on#$dday$&ensbog#%e-ice#&gger-h##hic#%katis#$line#!m$\'anesque$$born#%nking#$o\'er',
+    '$*d-affected&*devastated\'%rains&%light("ke&&murmur&%plain\')revention((otection&\'stories&%tides("me&$wall%!e&%d.the',
+    '%%lands%%walls$"er$&kburgh$$oded$!p$6r&rarr;wall&rarr;floor\'*ehy;boards+(covering%\'\'&mdash%#(s)%&-board\'\'y-floor&(coverers\'$ross',
+    '&&fresco&\'killing&&lights&+maintaining(!t\'"op&#pan)!s\'#lan*!s)#tes\'%olish&(rumbling&$show\'%trewn',
+    '&&walker(!x\'#hat%$.one%#_as%(boarding&$rush%$care%!e%\'filling%&length&%ights%#man%%pedal&$late',
+    '+#ers%"s.&$hows&\'tanding%%tiles%&walker\'#rds$#ted#(p-haired$#ear$&houses$%peroo%\'y-arsed\'%based\'\'covered',
+    '\'&limbed\'$only&%/hard$%sweat#\'rabunda%"de%+l-cushioned\'%print%$ngel%#set%$word$#eal%!k%"nc\'\'e-siena',
+    ')$rome\'"ia\'!y&"sa&#tes\'+ine-mantuan)!o(!o&"za%#sta("nt%!z$$iale&-n&oacute;olis\'!a',
+    '\'%polis%&bundus%\'culture%,d&rehy;faced&"ae&#ius&,ly-decorated%&legium%#nda\'!o&(s/gulden&"ts%"os%%ssant*!s',
+    '%$vory$&oscopy$"ry$&sheims$"um$%y-fox&(krigbaum#(s-cuculi$&cuculi$+s-threaders%!.%+e-vernaudon&%nburg$\'trandli#&t-n-ad',
+    '%"ls$#ing$!o$#sie$&tantes%!e&!r\'%stone%#weg$$well#)underings("si$"r\'%&-based\'#omb',
+    '&-manufacturing\'%iller*#ing&%sacks&)thickened&%white%!e&"ns&!s\'!s%#ide&&shinhg%%sacks&$copy#&w\'ring',
+    '&!y$1-chart-cum-module&#ost&(ytometry%"on%%rates%)sectioned%&tested$&/funds$"3d$)cytometer$,er&rehy;pots&+-and-citron\'(bordered\'(children',
+    '(&overed((urtained\'%edged(*mbroidered(*ncompassed\'%faced)"ir(&lanked)#esh($resh)%inged\'\'gardens*&landed(&rowing\'$head',
+    ')%fused\'%laden*!y\'&market("ix\'\'painted,$ings)%ttern($iece*%rcers(\'lanting(&owered(+resentation)#int\'\'selling',
+    ')%irted(#oft((pattered)$ikes(%tands)#ems)$rewn\'(throwing(*o-fruiting(&rimmed\'%vases(\'isiting\'$walk)#ter&%/cake',
+    '&%craft&$dew.&"er(!s\'"ts&$gate&$head&&making&/pot&rehy;shaped&,s&mdash;they\'!-\'*/wiltshire\'!5\'%eller,!s',
+    '\'&/woody%"th$"in&#gly\'$ness\'!s$$line(!s$$n-in$"ry$%sheet%%tream$\'through%"on\'%brook',
+    '$&d-rose%%/team$"er"!q"#t.l%".t%"ts"(u-ridden#$/tet#%anxol#%balub$%badub$!s#\'ctating%/u-fucking-ation',
+    '\'&tingly)*on-induced+"s.#"dd$"er$#ger$+rocortisone#&e-hole%%tiles$\'/ducted$!d$$less$#nts$&y-like#\'ff-free',
+    '&)spreading%#ier\'!s%"ly%)y-looking#!g$&alhorn$"el&%horns$%hafen$%platz$(schneise$\'termans$\'zeugbau##hli',
+    '\'"ed&(handling&&mosaic&%power&%solid&$test\'#ype&&volume%"al%\'isation&$ties&"um%+ly-fluently%.s/hydrocarbons$"ng',
+    '#\'mazenil$#ina$#mox$$pity%!s#\'ng-down&"it&(together$)itrazepam$#kie&"ng%!s%$yist$!t#!o',
+    '%\'esbrite\'&camine(2ein-latex-labelled,&tagged)$nces*!e*!s*+t-activated,)indicator,#lit+!/+,s/spotlights(#ine%"ic&$date',
+    '\',e-containing))releasing&+ne-oriented&)te-barite,#yte(!s%*ocarbonate&%meter)"ry&(organics&&phores&%scope\'#par\'(ulphonic%*quinolones',
+    '\'$opic$&xetine#)penthixol$(per-type#%rglen$"ia%%shing$%rying$)y-roversi##sh-&(panelled\'#ipe&%right&\'toilets%$able',
+    '&%d-red&"s.%$ings$"se&!r$&tering##te-&&blower&$girl&$like&%maker&%notes&\'playing&$type$%herin',
+    '&&r-jump(%snake(&tongue\'"er\'%ingly&!s#$vals$-ial-dominated%"is%)o-glacial#&x-gate%)labyrinth$!.$"ed$#ing',
+    '\'!s"!v"%xible"*y-be-night%#orn&!y\'!s%(y-nights&$wire$\'casting&%tcher+!s%&orpses&%vered$&drives',
+    '*#men*!s%*ornication%$ront$#hit$\'in-ists$&kicked$&leaves$#man%"en%!o$#off%0n-the-wall-style&"ly%$vers',
+    '$(speckled&%otted&#ray%&tained&#rip%#wat(#ter)#ing$(the-flag%%ipped)!r*!s(#ing%#yer(!s',
+    '$&wheels&#isk#$.now#%/time&%ssues$&yellow##_by$&rather#,bar-equipped&$less$$oard&!t%"ys#\'dacraft%!w',
+    '#!e$%-flap#$fish#\'harvard#$ing-\'#ace\'&circus(%olumn\'%glove\'&jacket\'#off\'&saucer($tart&%boats&%dales',
+    '$"en#!n$"ge$)n-trained%!e##off#&poster)!s\'#ing#&ridden%"ng#+sch-bearing\'$type%$reen$0heet-pitch-first',
+    '$&tjanst#%tings%%pping$$ower$#ted#\'weights$$hisk!*m-friendly"%/glow##kit#%mw/lw#"pr#$toys"&10,000"!2',
+    '"+500,000,000#%4,200"%6,900"!7#$,000"!a""cv""et"!f#"ln"(k170,000$%8,000#&28,000#%7,000"!l',
+    '%)farabundo&"dr""ma#%ental""nl"$ol/l""sm"#ttm"!v""w1!1n&lowbar;discount*$fred#.mdash;national"".9"%/proc',
+    '"*ame&dollar#"rr"!c""fc"!i#"pp"!k"!l#!c"$nnar""ps""rm""sd#"ea""uf',
+    '#$csle#"st"%+k/vd"$=kvn""ad#)l-to-foal$!l#"m-%\'backing\'#sed%\'covered%(formings%&headed%)insulated%&lipped',
+    '&\'unching%(streaked%\'tasting%\'wrapped$&.shops$+/fibreglass%"of%$wool$\'blowing$(ed-stone$$head$$ings$$like$#ous$*y-flowered',
+    '#!n#"rt#"wr")bbing-off##ney#%watch"*cal-points%(/general%#ity&#zed#$cart#&habers$!e#"ii$"on',
+    '#$sani#)us-driven%%/auto%.:conservatives&)education%"by%$sed."*dder-dates#"io#1or-sperber-wilson%#ian##rin$"um"$eken#+l-cwmcerwyn',
+    '#$rmer$$stel#"st#+tal-alcohol&\'ization&"ly$#ens$$idly&"us##ver"%fanny#!e"&g-bank$$free$%laden',
+    '$#not$%prone$\'related$&signal*!s%%oaked#!.#$adab##els&"on#(g-london$#age$"es$#ier%"ly',
+    '%&/clear#+horn-voiced#%lamps$"ia%#ght#$will"#had"\'ice/mgr&&severn#"l-%$kite$#ers$#lan#\'n-stone#!r',
+    '$#ter#!t#"ve#\'x-bearn"$jtik"!k##in\'%,e-stravinsky#"us")l-de-lols$%hardi)"li$\'rol-rol##ard%$pilo',
+    '#!b$$erth$#ots#"ch#\'d-belts%%overs%$town%/up-and-put-away%$yard$%backs$\'ed-back\'$flat\'$path&!.%!n',
+    '&"ol%!s%!t$$ing\'\'%-leaf($wing\'!s$$line$#out$$yard#"ea#&iaceus%\'ge-only\'!s%%tions',
+    '$"is$!n%!e%"ic$\'o-sired(#zed$&vorous#%jambe#+k\'n\'ballads$(-artists%\'beliefs%&custom+!s%\'dancers%%group',
+    '%#law&%egend&\'oristic%(medicine&#oot&#yth%-psychological%(religion&+ock-country)#ers\'#ots%&saying&&tories%&themes&$unes',
+    '$&/blues%#pop$!e%#dup%&museum%&skoler&,son/skoldbek%)tt-browne$$life&,nguistically%\'ore-ism(\'/legend\'&ophobe$$nick$#sam',
+    '%#ier&"ly%%worth$#ton%$unes$*wangmuseum&!y%"in&"se$"ys#"l.$!a$"ed%$sdal%!t',
+    '$0icle-stimulating%#es.%#gon&#uet$!o%#sco%.w&rehy;through&!\'&!-\'+on-contract*&target\'2the-fireworks-code*!n\'&up.the&(.through',
+    '\'%rship\'"th&/ing-after-sales)!/)$coup&\'s&mdash\'!*\'!-("as("up($when\'!.&\'through&#ups$$wing',
+    '%%house#&oowing$!r#!s$!.$#tad##ten$\'inowicz$"on#"ye",maica-topped$$lont#$enko%\'tations&"er',
+    '&!s$!r##ily$"te#%ukong',
 )
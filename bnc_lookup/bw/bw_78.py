@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_78 = (
+count_78 = 6694
+
+heads_78 = (
     'enciklopedija',
-    'encina/cics',
-    'encinitas',
-    'enciphered',
-    'enciso',
-    'encl',
-    'enclave-protectors',
-    'enclave.',
-    'enclaved',
-    'enclitic',
-    'enclitics',
-    'enclosed/sent',
-    'enclosedness',
-    'enclosured',
-    'encoanal',
-    'encode(s)',
     'encoded/unencoded',
-    'encoder-decoders',
-    'encoding-decoding-encoding',
-    'encoigneurs',
-    'encombe',
-    'encombrous',
-    'encompassable',
-    'encon',
-    'enconomienda',
-    'encoppice',
-    'encoragement',
-    'encore-free',
-    'encore-opener',
-    'encorporate',
-    'encoscopic',
-    'encotel',
     'encou',
-    'encounter&ndash',
-    'encounter/time',
-    'encountered.',
-    'encourage-visitors',
-    'encourage/allow',
-    'encourage/reinforce',
-    'encourage_so_much',
-    'encouraged.',
-    'encourageing',
-    'encouragment',
-    'encoureage',
-    'encoutner',
-    'encratite',
-    'encreased',
-    'encrev&eacute',
     'encreve',
-    'encrimsoned',
-    'encrusters',
-    'encrypter',
-    'encryptions',
-    'enculturate',
-    'encumbers',
-    'encumbrancer',
-    'encyclo',
-    'encyclo-banks',
-    'encyclop&eacute;dico',
-    'encyclop&eacute;dique',
-    'encyclop&egrave;die',
-    'encyclopaedia-like',
-    'encyclopaedists',
-    'encyclopedia-aka',
     'encyclopedia-type',
-    'encyclopediast',
-    'encyclopedists',
-    'encylical',
-    'encylopaedia',
-    'encylopaedic',
-    'encyphering',
-    'end&gt',
-    'end&ndash;sanderstead',
-    'end&rehy;a',
-    'end&rehy;products',
-    'end-',
-    'end-1975',
-    'end-1984',
-    'end-1987',
-    'end-1988',
     'end-1999',
-    'end-april.inchcape',
-    'end-area',
-    'end-based',
-    'end-bay',
-    'end-boards',
-    'end-born',
-    'end-consumer',
-    'end-customer',
-    'end-effects',
-    'end-expiratory',
-    'end-filing',
-    'end-flap',
-    'end-gap',
-    'end-gaps',
-    'end-held',
     'end-in-itself',
-    'end-items',
-    'end-john',
-    'end-joining',
-    'end-knotted',
-    'end-labeled',
-    'end-loads',
-    'end-members',
-    'end-music',
-    'end-note',
-    'end-of-1989',
-    'end-of-agreement',
-    'end-of-camp',
-    'end-of-class',
-    'end-of-coding-details',
-    'end-of-conference',
     'end-of-contest',
-    'end-of-description-lines',
-    'end-of-errors',
-    'end-of-february',
-    'end-of-flight',
-    'end-of-foreign-set',
-    'end-of-ice-age',
-    'end-of-life',
-    'end-of-meeting',
-    'end-of-modification-records',
-    'end-of-module-relations',
-    'end-of-month',
-    'end-of-period',
-    'end-of-phase',
-    'end-of-pipe',
-    'end-of-race',
     'end-of-range',
-    'end-of-references',
-    'end-of-row',
-    'end-of-run',
-    'end-of-school',
-    'end-of-season-game',
-    'end-of-session',
-    'end-of-shift',
-    'end-of-show',
-    'end-of-stage',
-    'end-of-summer',
-    'end-of-teenage',
-    'end-of-test-status',
-    'end-of-tether',
-    'end-of-the&rehy;day',
-    'end-of-the-day',
     'end-of-the-night',
-    'end-of-the-road',
-    'end-of-the-trail',
-    'end-of-the-worldish',
-    'end-of-time',
-    'end-of-types-and-names',
-    'end-of-war',
-    'end-ofgame',
-    'end-ordovician',
-    'end-palaeozoic',
-    'end-paper',
-    'end-papers',
-    'end-pattern',
-    'end-piece',
-    'end-pieces',
-    'end-play',
     'end-post',
-    'end-probes',
-    'end-quarter',
-    'end-repaired',
-    'end-selling',
-    'end-station',
-    'end-struggle',
-    'end-systems',
-    'end-terrace',
-    'end-terraced',
-    'end-the',
-    'end-title',
-    'end-to-side',
-    'end-use-routine/non-routine',
-    'end-walls',
-    'end-window',
     'end-window-geiger-m&uuml;ller',
-    'end-wise',
-    'end.of',
-    'end/day',
-    'end/east',
-    'end/forest',
-    'end/isle',
-    'end/mayfair',
-    'end/prelude',
-    'end=',
-    'enda1',
-    'endaby',
-    'endacott/oxfordshire',
-    'endanges',
-    'endblock',
-    'endboard',
     'endboards',
-    'endcap',
-    'endearing-eccen&rehy;tricity',
-    'endebt',
-    'endecaine',
-    'ended-ness',
-    'ended-up',
-    'endeka',
-    'endelman',
-    'endenizened',
-    'endering',
-    'enderlein',
-    'endevco',
-    'endevorethe',
-    'endevour',
-    'endgame-inspired',
     'endhoven',
-    'endiekkickmekcs',
-    'endimanch&eacute',
-    'endin\'',
-    'ending-up',
-    'ending/scottish',
-    'endino',
-    'endl&ouml;sung',
-    'endlabelled',
-    'endland',
-    'endler',
-    'endless-but',
-    'endless-renewed',
-    'endless-seeming',
-    'endless.',
-    'endlessly-discussed',
     'endlessly/all',
-    'endlf',
-    'endlicher',
-    'endlink',
-    'endlow+i',
-    'endmoor',
-    'endo-',
-    'endo-metriosis',
-    'endo-peroxides',
-    'endoanally',
-    'endobronchial',
-    'endocanal',
-    'endocentric',
-    'endocope',
-    'endocranial',
-    'endocrinal',
     'endocsopic',
-    'endoctine',
-    'endocuticles',
-    'endocytic',
-    'endocytosed',
-    'endodermis',
-    'endof',
-    'endogeneity',
-    'endogeneous',
-    'endogenic',
-    'endogenising',
-    'endogneous',
-    'endoios',
-    'endolymphatic',
-    'endomorphic',
-    'endomorphines',
     'endomorphins',
-    'endomorphs',
-    'endomycetes.',
-    'endongo',
-    'endonuclease.',
-    'endonucleolytic',
-    'endophilia',
-    'endophilial',
-    'endophoric',
-    'endophthalmitis',
-    'endoproshesis',
-    'endopterygota',
-    'endopterygotes',
-    'endorectal',
-    'endorgenic',
-    'endorheic',
     'endoril',
-    'endorsable',
-    'endorsement-negotiation',
-    'endorser-shipper',
-    'endorser-transferor',
-    'endosconography',
-    'endoscop',
-    'endoscoping',
-    'endoscopy.',
-    'endospermum',
-    'endothelin-1-like',
-    'endothelin-1=endothelin&rehy;2&gt;endothelin-3',
-    'endothelin-2',
-    'endothelin-3',
-    'endothelin-immunoreactivity',
-    'endotheoium',
     'endotherm',
-    'endotixin',
-    'endotoxaemic',
-    'endotoxin-binding',
-    'endotracheally',
-    'endotrophic',
-    'endotropic',
-    'endowment.i',
-    'endpin-jack',
-    'endres',
-    'endress',
-    'endrin',
-    'endro-t',
-    'endrocrine',
-    'endrodenny',
-    'ends.technically',
     'ends.then',
-    'ends/desire',
-    'endscope',
-    'endsheets',
-    'endt',
-    'endtrimmed',
-    'endu',
-    'enduement',
-    'endure/',
-    'endurers',
-    'enduringness',
-    'enduros',
-    'endwell',
-    'endwise',
-    'endword',
-    'endyng',
     'ene&ndash;wnw',
-    'ene-wsw',
-    'eneados',
-    'enebish',
-    'ened',
-    'eneemys',
-    'enefer',
-    'enema/colonoscopy',
-    'enemas-in-a-hole',
-    'enemies-in-a-hole',
-    'enemis',
-    'enemy\'',
-    'enemyes',
-    'enenforceable',
-    'eneptometopus',
-    'ener',
     'ener&rehy;gies',
-    'enerdale',
-    'energetic&mdash;how',
-    'energetical',
-    'energically',
-    'energie',
-    'energie-sud',
-    'energique',
-    'energizers',
-    'energy&mdash',
-    'energy*',
-    'energy-absorber',
-    'energy-absorbing',
-    'energy-are',
-    'energy-budget',
-    'energy-centred',
     'energy-charged',
-    'energy-composition',
-    'energy-conservation',
-    'energy-consumption',
-    'energy-consumptive',
-    'energy-containing',
-    'energy-cost',
-    'energy-coupling',
-    'energy-demanding',
-    'energy-disadvantaged',
-    'energy-draining',
-    'energy-expensive',
-    'energy-exporting',
-    'energy-flows',
-    'energy-fossil',
-    'energy-from-waste',
     'energy-furnishing',
-    'energy-guzzler',
-    'energy-importing',
-    'energy-intensity',
-    'energy-labelling',
-    'energy-level',
-    'energy-liberating',
-    'energy-linked',
-    'energy-losses',
-    'energy-measuring',
-    'energy-often',
-    'energy-reduction',
-    'energy-restoring',
-    'energy-rich/right-to-work',
-    'energy-spacing',
-    'energy-storing',
     'energy-time',
-    'energy-transfer',
-    'energy-use',
-    'energy-well',
-    'energy.saving',
-    'energy/atmosphere',
-    'energycare',
-    'energyr',
-    'enerhodar',
-    'enertaining',
-    'enery',
-    'enessi',
-    'eneteropathy',
-    'enetertaining',
-    'enever',
-    'enever/bletchley',
     'enfacement',
-    'enfante',
-    'enfants&rehy;trouv&eacute;s',
-    'enfeebles',
-    'enfeoffment',
-    'enfermera',
-    'enfervoured',
-    'enffant',
-    'enfidaville',
-    'enfield.',
-    'enfield/the',
-    'enfields',
-    'enfluorane',
-    'enflurane',
-    'enfoldment',
-    'enfonc&eacute;e',
     'enfor',
-    'enforce/breach',
-    'enforceable&mdash;see',
-    'enforceable.',
-    'enforced&mdash;see',
-    'enforced.',
-    'enforcedly',
-    'enforcement.',
-    'enforcement.d',
-    'enforcing/applying',
-    'enford',
-    'enfranchisements',
-    'enfranchized',
-    'enfringe',
-    'enfringement',
-    'enfs',
     'enfs/cache',
-    'enfs/pfs',
-    'enfys',
-    'enga&rehy;ged',
-    'engadin',
-    'engag',
-    'engag&eacute;e',
-    'engag&eacute;s',
-    'engagement\'',
-    'engagement-rings',
-    'engai',
-    'engaliere',
-    'engalnd',
-    'engdahl',
-    'engeland',
-    'engelberg',
     'engelbreth',
-    'engelbreth-holm-swarm',
-    'engelhartszell',
-    'engelond',
-    'engels-like',
-    'engelsk',
-    'engelsman',
-    'engergy',
-    'engerixb',
-    'engge',
-    'engh',
-    'engham',
-    'enghin',
-    'engi',
-    'engilond',
-    'engimatic',
     'engimatically',
-    'engine-based',
-    'engine-bay',
-    'engine-boilers',
-    'engine-builder',
-    'engine-capacity',
-    'engine-chargers',
-    'engine-cover',
-    'engine-driving',
-    'engine-handling',
-    'engine-houses',
-    'engine-idling',
-    'engine-maker',
-    'engine-mount',
-    'engine-on',
-    'engine-shed',
     'engine-stoker',
-    'engine-stripping',
-    'engine-thunder',
-    'engine-weight',
-    'engine-wright',
-    'engine/britt',
-    'engine/driveline',
-    'engine/gearbox',
-    'engine/propeller',
-    'engine/timing/mixture',
-    'engineeering',
-    'engineer-already',
-    'engineer-friendly',
-    'engineer/borough',
-    'engineer/leading',
-    'engineer/national',
     'engineer/producer',
-    'engineering-based',
-    'engineering-cum-marketing',
-    'engineering-oriented',
-    'engineering/banking/tourism/etc',
-    'engineering/building',
-    'engineering/environmental',
-    'engineering/technology',
-    'engineerings',
-    'engineerng',
-    'engineers-on',
-    'engineers/technicians',
-    'engineers_by_the',
-    'engineerspeak',
-    'engineless',
-    'engint',
     'engirdling',
-    'engis',
-    'engishmen',
-    'engl.j.med.',
-    'engla',
-    'englacial',
-    'englacially',
-    'englad',
-    'england&ndash',
-    'england&ndash;quebec',
-    'england\'',
-    'england-',
-    'england-australia',
-    'england-experience',
-    'england-france',
-    'england-kamerun',
     'england-land',
-    'england-loyalty',
-    'england-norway',
-    'england-qualified',
-    'england-reject',
-    'england-scotland',
-    'england-south-east',
-    'england-the',
-    'england-us',
-    'england-usa',
-    'england-various',
-    'england-wales',
-    'england-west',
-    'england.fifty',
-    'england.in',
-    'england/bride',
     'england/lancashire',
-    'england/scotland',
-    'england/scotland/n.i.',
-    'england/student',
-    'england28pts',
-    'england3',
-    'englandat',
-    'englander\'',
-    'englanderism',
-    'englandhass',
-    'englarged',
-    'englebert',
-    'englebrecht',
-    'englebuch',
-    'englehard',
-    'engleheart',
     'englert',
-    'engley',
-    'engli',
-    'engliscan',
-    'englisch',
-    'englisch&ndash\'',
-    'englischer',
-    'englisches',
-    'english&amp;sup2',
-    'english&mdash;errors',
-    'english&ndash;speaking',
-    'english&rehy;and',
-    'english&rehy;born',
-    'english&rehy;man',
-    'english&rehy;speaker',
-    'english-as-second-language',
     'english-backed',
-    'english-born-and-raised',
-    'english-bred',
-    'english-built',
-    'english-burmese',
-    'english-canada',
-    'english-confluence',
-    'english-derived',
-    'english-dominated',
-    'english-fashion',
-    'english-fashioned',
-    'english-financed',
-    'english-french',
-    'english-german',
-    'english-german-italian',
-    'english-japanese',
     'english-japanese/japanese-english',
-    'english-learning',
-    'english-lexicon',
-    'english-lexified',
-    'english-made',
-    'english-medium',
-    'english-men',
-    'english-modo',
-    'english-packed',
-    'english-promoted',
-    'english-publishers',
-    'english-registered',
-    'english-run',
-    'english-seeming',
-    'english-spanish',
-    'english-subtitled',
     'english-teaching',
-    'english-warm',
-    'english-woman',
-    'english.303',
-    'english.36',
-    'english/arabic',
-    'english/continental',
-    'english/drama',
-    'english/french/german/japanese',
-    'english/german/french',
-    'english/german/japanese',
-    'english/italian',
-    'english/literate',
-    'english/low',
-    'english/metric',
-    'english/r.p.',
     'english/scottish/',
-    'english/target',
-    'englisher',
-    'englishings',
-    'englishman\'',
-    'englishman.i',
-    'englishry',
-    'englishspeaking',
-    'englnd',
-    'englobing',
-    'englond',
-    'englsih',
-    'englsihman',
-    'englynion',
-    'englyst',
-    'engo',
     'engogenous',
-    'engolismensem',
-    'engoran',
-    'engraftment',
-    'engrais',
-    'engramelle',
-    'engrelee',
-    'engrialls',
-    'engrimed',
-    'engrosses',
-    'engstr&ouml;m',
-    'engulfers',
-    'enh',
-    'enhanced.this',
-    'enhancee',
-    'enhancer-like',
     'enhancer-type',
-    'enhancer/early',
-    'enhancer/promoter',
-    'enheim',
-    'enif',
-    'enig',
-    'enig&rehy;matic',
-    'enironment',
-    'enisa',
-    'eniskellen',
-    'enitre',
-    'enja',
-    'enjambment',
-    'enjambments',
-    'enjo',
-    'enjoy/envy/suffer/ca',
     'enjoy/like/desire',
-    'enjoyability',
-    'enjoye',
-    'enjoyin\'',
-    'enjoyment&mdash;the',
-    'enke',
-    'enkephalin-endorphin',
-    'enki',
-    'enkindle',
-    'enkindled',
-    'enkyo',
-    'enl&egrave;vement',
-    'enlargening',
-    'enlayde',
-    'enlightener',
-    'enlighteners',
     'enlightenment\'',
-    'enlightenment.',
-    'enlightenments',
-    'enlisters',
-    'enlistments',
-    'enliteration',
-    'enliveners',
-    'enlli',
-    'enmag',
-    'enmeshes',
-    'ennahdha',
-    'ennascarthy',
-    'ennea',
-    'enneagram',
-    'ennemi',
-    'ennersaledale',
     'ennis/northamptonshire',
-    'enniskillen&ndash;belleek',
-    'enniskillen&ndash;swanlinbar',
-    'ennismore',
-    'enno',
-    'ennorath',
-    'ennos',
-    'enns',
-    'ennubelation',
-    'ennumerator',
-    'ennunciated',
-    'eno-daynes',
-    'eno-era',
-    'eno-esque',
-    'enobarbus',
-    'enoble',
     'enock',
-    'enola',
-    'enomous',
-    'enoough',
-    'enormi',
-    'enormo-bus',
-    'enormo-dome',
-    'enormoously',
-    'enormous-breasted',
-    'enormous-looking',
-    'enormous-seeming',
-    'enormously-solid',
-    'enormously.',
-    'enosi',
-    'enot',
-    'enott',
     'enough-but',
-    'enough-he',
-    'enough-of-this',
-    'enough-we',
-    'enough.',
-    'enough.s',
-    'enough_by',
-    'enounced',
-    'enow',
-    'enoxacin',
-    'enoying',
-    'enpa',
-    'enplane',
-    'enplaned',
-    'enployed',
-    'enprynted',
     'enq&dollar',
-    'enq.',
-    'enquieries',
-    'enquiries&mdash;a',
-    'enquiries.speedway',
-    'enquiries/appeals',
-    'enquirin\'',
-    'enquiry-answering',
-    'enquiry-discovery',
-    'enquiry/communication',
-    'enquiry_for',
-    'enr',
-    'enr&iacute;quez',
-    'enrapt',
-    'enrapture',
-    'enrapturement',
     'enrica',
-    'enricher',
-    'enrichingly',
-    'enrichissez-vous',
-    'enriques',
-    'enriquez',
-    'enrolements',
-    'enroling',
-    'enrollees',
-    'enrycephalus',
-    'enrys',
-    'ens&ndash;e',
-    'ensaimadas',
-    'ensalada',
-    'ensay',
-    'ensayhan',
     'ensconce',
-    'enscribed',
-    'enseamed',
-    'ensellure',
-    'ensemble/haas',
-    'ensemble/rattle',
-    'ensenada',
-    'enshroud',
-    'ensialic',
-    'ensiform',
-    'ensiled',
-    'ensiling',
-    'ensino',
-    'enslavery',
-    'ensnarement',
-    'ensolls',
     'ensom',
-    'enson',
-    'ensorcel',
-    'ensorcelled',
-    'ensphered',
-    'enstated',
-    'enstructured',
-    'ensu',
-    'ensue.',
-    'ensurance',
-    'enswathed',
-    'entactin',
-    'entada',
-    'entails.',
-    'entame',
-    'entdifferenzierung',
     'entebbe-style',
-    'entecsa',
-    'entellan',
-    'entellus',
-    'entelsur',
-    'entencoun',
-    'entendez',
-    'enter&rehy;tainer',
-    'enter&rehy;taining',
-    'enter.relationships',
-    'enter/exit',
-    'enterectomies',
-    'entered-into',
-    'enterer',
-    'enteridis',
-    'entering/leaving',
     'enteritidis',
-    'enterobacteria/g',
-    'enterobacteriacae',
-    'enterobacterial',
-    'enterochromaffin-like',
-    'enterococcal',
-    'enteroenteral',
-    'enteroglucagon/l',
-    'enteroglucoagon',
-    'enterolobium',
-    'enteromorpha',
-    'enteropathic',
-    'enteropathogens',
-    'enteropneust',
-    'enterotoxin-producing',
-    'enteroviruses',
     'enteroxytes',
-    'enterpise',
-    'enterpprise',
-    'enterpreneurs',
-    'enterprise-',
-    'enterprise-by&rehy;enterprise',
-    'enterprise-centred',
-    'enterprise-generating',
-    'enterprise-groups',
-    'enterprise-led',
-    'enterprise-related',
-    'enterprise-router-switch',
-    'enterprise-scale',
-    'enterprise-style',
-    'enterprise-with',
-    'enterprise/',
     'enterprise/scottish',
-    'enterprises-to',
-    'enterprises.',
-    'enterprisewide',
-    'enterprisin\'',
-    'enterstage',
-    'entertai',
-    'entertained&mdash;people',
-    'entertained/moved',
-    'entertainer\'',
-    'entertainer-lover',
-    'entertainin\'',
-    'entertaining-cum-educational',
-    'entertaining.',
-    'entertainment-led',
-    'entertainment-packed',
     'entertainment.',
-    'entertainment.and',
-    'entertainment/education',
-    'entertainment/tourism',
-    'entertainments.',
-    'entertainmentsws29',
-    'entestate',
-    'entfremdung',
-    'entfuhrung',
-    'enth',
-    'enthalpy.',
-    'entheticus',
-    'enthicketed',
-    'enthnography',
-    'enthoosiasm',
-    'enthousiasme',
     'enthrallingly',
-    'enthrallment',
-    'enthrones',
-    'enthroning',
-    'enthsiasm',
-    'enthusaist',
-    'enthusaists',
-    'enthusi',
-    'enthusiano',
-    'enthusiasm/motivation',
-    'enthusiast-driven',
-    'enthusiast-for-books-about',
-    'enthusiast-orientated',
-    'enthusiastically-friendly',
-    'enthusiasts/',
-    'enthusisastically',
     'enthustiastic',
-    'enthusuasm',
-    'enthwistle',
-    'enthymematic',
-    'enti',
-    'enti&egrave;re',
-    'enti&egrave;rement',
-    'enticer',
-    'enticers',
-    'enticingly-named',
-    'entier',
-    'entimus',
-    'entin',
-    'entireley',
-    'entirely.',
-    'entires',
     'entit&eacute',
-    'entity&mdash;not',
-    'entity&rehy;makes',
-    'entity-based',
-    'entity-concept',
-    'entity-identifier',
-    'entity-meanings',
-    'entity-oriented',
-    'entity-staging',
-    'entity-types',
-    'entity.',
-    'entlebucher',
-    'entlenmatt',
-    'entlo',
-    'ently',
-    'entmacher',
     'entognathous',
-    'entombing',
-    'entombs',
-    'entomo-urochrome',
-    'entomophily',
-    'entomophthora',
-    'enton',
-    'entoned',
-    'entonhurst',
-    'entorhinal',
-    'entos',
-    'entosis',
-    'entour&eacute;s',
-    'entr&acirc;in&eacute',
-    'entr\'aide',
-    'entr\'autres',
     'entract',
-    'entrada',
-    'entrail-gazing',
-    'entraile',
-    'entrailed',
-    'entrammel',
-    'entrammelled',
-    'entrance\'',
-    'entrance-buzzer',
-    'entrance-cum-exit',
-    'entrance-exhibition',
-    'entrance-fa&ccedil;ade',
-    'entrance-pipe',
-    'entrance-porch',
-    'entrance-way',
-    'entrance/staircase',
     'entranceways',
-    'entrants.',
-    'entrants/their',
-    'entrapments',
-    'entrappings',
-    'entraps',
-    'entre&eacute',
-    'entre&rehy;preneurs',
-    'entre-deux-sujets',
-    'entreatingly',
-    'entrechat',
-    'entrechats',
-    'entrecote',
-    'entrees',
-    'entremet',
-    'entrentically',
     'entrepeneur',
-    'entrepeneurs',
-    'entrepenur',
-    'entrepre&rehy;neur',
-    'entrepreneur-producer',
-    'entrepreneur-scientist',
-    'entrepreneur.',
-    'entrepreneuralism',
-    'entrepreneurial-competitive',
-    'entrepreneurism',
-    'entrepris',
-    'entresol',
-    'entretiens',
-    'entrical',
-    'entries.mark',
-    'entries_so',
     'entrikin',
-    'entrin',
-    'entritis',
-    'entrocite',
-    'entrocytes',
-    'entrombicula',
-    'entrophication',
-    'entropy-enthalpy',
-    'entropy-maximizing',
-    'entropy/enthalpy',
-    'entrotoxigenic',
-    'entrusted.',
-    'entry&mdash;and',
-    'entry-deterring',
-    'entry-fine',
-    'entry-heat',
     'entry-phone',
-    'entry-price',
-    'entry-words',
-    'entry.',
-    'entschuldigen',
-    'entusiasmo',
-    'entwinement',
-    'entwurf',
-    'entymologists',
-    'enucleation',
-    'enumberation',
-    'enumeratio',
-    'enunciated.',
-    'enuretics',
-    'enuring',
-    'envalira',
     'envarados',
-    'envelope&rehy;shaped',
-    'envelope-directed',
-    'envelope-handbags',
-    'envelope-lined',
-    'envelopments',
-    'enverist',
-    'envermeu',
-    'envers',
-    'envi',
-    'enviousness',
-    'enviro',
-    'enviro-art',
-    'enviro-coal',
-    'enviro-jargon',
-    'envirocor',
     'enviromnent',
-    'environed',
-    'environment&ndash',
-    'environment\'',
-    'environment-chamber',
-    'environment-compliance',
-    'environment-friendlier',
-    'environment-in',
-    'environment-liese',
-    'environment-minded',
-    'environment-related',
-    'environment-saving',
-    'environment-type',
-    'environment-xxxx',
-    'environment.66',
-    'environment.he',
     'environment/esa',
-    'environmental\'',
-    'environmental-protection',
-    'environmental-scanning',
-    'environmental-style',
-    'environmental/amenity',
-    'environmental/carbon',
-    'environmental/land',
-    'environmental/land-use',
-    'environmentalists-it',
-    'environmentally-',
-    'environmentally-appropriate',
-    'environmentally-attractive',
-    'environmentally-aware',
-    'environmentally-based',
-    'environmentally-compatible',
     'environmentally-dictated',
-    'environmentally-led',
-    'environmentally-linked',
-    'environmentally-minded',
-    'environmentally-progressive',
-    'environmentally-responsible',
-    'environmentally-safe',
-    'environmentaly',
-    'environmesntally',
-    'environmet',
-    'environpace',
-    'enviroquant',
-    'envisa',
-    'envisag',
-    'envisageable',
-    'envisaged.',
     'envisaged.it',
-    'envisagement',
-    'envizage',
-    'envoler',
-    'envoro',
-    'envy-driven',
-    'envy-management',
-    'envy-neutralising',
-    'enwind',
-    'enwombed',
-    'enwraps',
-    'enwreath',
-    'enymore',
-    'enyo',
-    'enzmann',
-    'enzymatically-driven',
     'enzyme-desizing',
-    'enzyme-storage',
-    'enzymopathy',
-    'eoan',
-    'eoard',
-    'eoc/ssrc',
-    'eocambrian',
-    'eocene-oligocene',
-    'eochaidh',
-    'eocrinoids',
-    'eodred',
-    'eogene',
-    'eogenetic',
-    'eoleslav',
-    'eolo-gayla',
-    'eom',
     'eomysmena',
-    'eonycteris',
-    'eople',
-    'eopolis',
-    'eops',
-    'eoq',
-    'eorforwic',
-    'eorl',
-    'eorlcund',
-    'eormenhild',
-    'eormenric',
-    'eorporation',
-    'eorrabus',
-    'eorum',
-    'eosat',
-    'eosg',
     'eosiniophils',
-    'eostre',
-    'eota',
-    'ep&amp;p',
-    'ep(f2)',
-    'ep-12',
-    'ep-odd',
-    'ep-odds',
-    'ep/ix',
-    'ep1',
-    'ep19',
-    'ep342',
-    'ep4',
-    'ep92',
-    'epa-approved',
-    'epaenetus',
     'epagathus',
-    'epala',
-    'epanalepsis',
-    'epano',
-    'epanoui',
-    'epaon',
-    'eparcheia',
-    'eparchy',
-    'epater',
-    'epaulet-laden',
-    'epc-7',
-    'epca',
-    'epckfor1',
-    'epcott',
-    'epe.',
-    'epeal',
     'epedemic',
-    'epeeist',
-    'epeeists',
-    'epehy',
-    'epeirogenesis',
-    'epelbaum',
-    'epeli',
-    'epelo',
-    'eperon',
-    'epervier',
-    'epethelioid',
-    'ephage',
-    'ephah',
-    'ephapses',
-    'ephebe',
-    'ephebes',
     'epheboi',
-    'ephedra',
-    'ephedrinium',
-    'ephel',
-    'ephemerals',
-    'ephestia',
-    'epheus',
-    'ephgrave/mother',
-    'ephgrave/stepfather',
-    'ephisians',
-    'ephor',
-    'ephors',
-    'ephractian',
-    'ephrath',
-    'ephraums',
-    'ephygenia',
     'ephyrean',
-    'epi&rehy;tonrized',
-    'epi-fluorescence',
-    'epi-illumination',
-    'epi-illuminator',
-    'epi-info',
-    'epibatai',
-    'epibenthic',
-    'epic-o-meter',
-    'epic-reading',
-    'epic/epc',
-    'epica',
-    'epically',
-    'epicenter',
-    'epicharis',
-    'epicharmos',
     'epick',
-    'epiclastic',
-    'epicondyle',
-    'epicraft',
-    'epicurius',
-    'epicuro-gassendo-charltonia',
-    'epicycloids',
-    'epidemic-like',
-    'epidemiol',
-    'epidemiourgoi',
-    'epidemologist',
-    'epidendrum',
-    'epididymal',
-    'epididymes',
-    'epididymo-orchitis',
-    'epidote',
     'epidura',
-    'epidurally',
-    'epieugeosynclines',
-    'epigastralgia',
-    'epigenetically',
-    'epiglottis',
-    'epiglottitis',
-    'epigramatically',
-    'epigrammata',
-    'epigrammaticism',
-    'epigrammatist',
-    'epigrammatists',
-    'epigraphes',
-    'epil',
-    'epilation',
-    'epilators',
     'epilepsy-related',
-    'epilepticus',
-    'epileptologists',
-    'epiletic',
-    'epiligrin',
-    'epimedium',
-    'epinal-76',
-    'epinards',
-    'epinician',
-    'epinotum',
-    'epipactis',
-    'epiphanizes',
-    'epiphany-oriented',
-    'epipharyngeal',
-    'epipharynx',
-    'epiphenomenalism',
     'epiphora',
-    'epiphyllae',
-    'epiphyllanthus',
-    'epipire',
-    'epiploic',
-    'epipodite',
-    'epipodophyllatoxin',
-    'epipogium',
-    'epipophyseal',
-    'epiproct',
-    'epis',
-    'episcopacies',
-    'episcopalianism/presbyterianism',
-    'episcopally',
-    'episcopari',
-    'episcopates',
     'episcopum',
-    'episcopus',
-    'episcopy',
-    'episode\'',
-    'episode-by-episode',
-    'episode-what',
-    'episode.while',
-    'episodicity',
-    'episodios',
-    'episomal',
-    'episome',
-    'episomes',
-    'episopi',
-    'epistandard',
-    'epistatic',
-    'epistemologist',
     'epistolae',
-    'epistolarum',
-    'epistomal',
-    'epistrophe',
-    'epistrophy',
-    'epistyle',
-    'epistylis',
-    'episyrphus',
-    'epitaphes',
-    'epitaxially-coated',
-    'epitek',
-    'epith',
-    'epithalamion',
-    'epithalamiums',
-    'epithalial',
-    'epithelial-cell-fibroblast',
     'epithelial-like',
-    'epithelial-mesenchymal',
-    'epithelial-specific',
-    'epithelial-specificity',
-    'epithelial/',
-    'epitheliam',
-    'epitheliod',
-    'epithelised',
-    'epithelium-like',
-    'epitheloid',
-    'epithemeus',
-    'epithetising',
-    'epithumia',
-    'epitomator',
-    'epitomizer',
-    'epizephyrian',
     'epizeuxis',
-    'epizone',
-    'epkialtes',
-    'eplayed',
-    'epm',
-    'epodes',
-    'epoisses',
-    'epomeo',
-    'eponym',
-    'eponymity',
-    'eponymy',
-    'epoprostenol',
-    'epops',
-    'eport',
-    'epotes',
-    'epoxides',
     'epoxids',
-    'epoxies',
-    'epoxy-based',
-    'epoxy-covered',
-    'eppendorfer-baum',
-    'eppenergy',
-    'epping-born',
-    'eppolito',
-    'epps/orchards',
-    'eprdf-dominated',
-    'eprevious',
-    'epriod',
-    'eprit',
-    'epron',
-    'epryn',
-    'eps-486',
     'epsilon&amp;sup1',
-    'epsilon&amp;sup2',
-    'epsilons',
-    'epsion',
-    'epson-compatible',
-    'epsons',
-    'eptatretus',
-    'eptesicus',
-    'epthelial',
-    'epting',
-    'eptu',
-    'epulis',
-    'epuration',
-    'epusios',
-    'epwin',
-    'eq.5.16',
     'eq/compression',
-    'eq/ep=&frac14',
-    'eq/volume',
-    'eq26',
-    'eqdvyahlvqqrlea',
-    'eqipment',
-    'eql',
-    'eqn(3.17)',
-    'eqn(8.1)',
-    'eqpt.',
-    'equa',
-    'equa&rehy;lity',
-    'equal-',
-    'equal-but-different',
-    'equal-footed',
-    'equal-impact',
     'equal-rights&rehy;and-opportunities',
-    'equal-sided',
-    'equal-span',
-    'equal-third',
-    'equal-time',
-    'equal-top',
-    'equal-value',
-    'equal.this',
-    'equal/greater',
-    'equalister',
-    'equalists',
-    'equalitarian',
-    'equalitarianism',
-    'equality-inequality',
-    'equality-maximizer',
-    'equality/equity',
     'equality/liberty',
-    'equall',
-    'equalledis',
-    'equally&mdash;high',
-    'equally-damaging',
-    'equally-highly-charged',
-    'equally-important',
-    'equally-loaded',
-    'equally-owned',
-    'equally-weighted',
-    'equally-well-attested',
-    'equanil',
-    'equanimous',
-    'equant',
-    'equation(10.3)',
-    'equation(4.14)',
     'equation(6.3)',
-    'equation-specific',
-    'equation-the',
-    'equation.pcx',
-    'equations.',
-    'equator-quiveringly',
-    'equator-to-pole',
-    'equatorially',
-    'equators',
-    'equatorwards',
-    'equest',
-    'equestrienne',
-    'equi&ndash;effective',
-    'equi-normal',
-    'equi-status',
-    'equiano',
     'equicaloric',
-    'equidimensional',
-    'equids',
-    'equifinally',
-    'equilia',
-    'equilibre',
-    'equilibria.',
-    'equilibriating',
-    'equilibriation',
-    'equilibrilium',
-    'equilibrium-amount',
-    'equilibrium-price',
-    'equilibrium.',
-    'equilibrium/diaphragm',
-    'equilibrla',
-    'equilibrum',
     'equiluz',
-    'equina',
-    'equinoxial',
-    'equiopment',
-    'equiparated',
-    'equipartition',
-    'equiped',
-    'equipes',
-    'equipmenjt',
-    'equipment&mdash;she',
-    'equipment-free',
-    'equipment-makers',
-    'equipment-manufacturing',
-    'equipment-rattling',
-    'equipment-there',
-    'equipment-vibration',
     'equipment.',
-    'equipment.l',
-    'equipment/building',
-    'equipment/chemical',
-    'equipment/control',
-    'equipment/furniture',
-    'equipment/projectors/screens/tvs/',
-    'equipment/switches',
-    'equipo',
-    'equipoment',
-    'equipp',
-    'equippped',
-    'equiprobability',
-    'equiproportionately',
-    'equiries',
-    'equisitales',
     'equite',
-    'equitone',
-    'equitor',
-    'equitrac',
-    'equity\'',
-    'equity-accounted',
-    'equity-financed',
-    'equity-financing',
-    'equity-linked',
-    'equity-only',
-    'equity-required',
-    'equity-sharing',
-    'equity-type',
-    'equityas',
-    'equivalence.',
-    'equivalenced_',
     'equivalency',
-    'equivalent-mass',
-    'equivalent-ranking',
-    'equivalent/g',
-    'equivalent/relevant',
-    'equivalised',
-    'equivelant',
-    'equivites',
-    'equivocality',
-    'equivocates',
-    'equs',
-    'er&dollar',
-    'er&rehy;have',
-    'er&rehy;run',
-    'er\'uoy',
-    'er(m)',
     'er-appendages',
-    'er-mr',
-    'er1',
-    'er15',
-    'er153',
-    'er350me',
-    'er489',
-    'er535me',
-    'er8870',
-    'er9610ew-1',
-    'er9630e',
-    'er_a',
-    'er_all_the',
-    'er_for',
-    'er_just_as_well',
-    'er_now',
     'er_of',
-    'er_rather',
-    'er_so_often',
-    'er_spot',
-    'er_such',
-    'er_to',
-    'era-provincial',
-    'era.but',
-    'erable',
-    'eraclea',
-    'eractically',
-    'eradiation',
-    'eradicationists',
-    'eradicators',
-    'eradification',
-    'eragaleit',
     'eraill',
-    'erakat',
-    'eraldo',
-    'eralp',
-    'erannis',
-    'erap',
-    'eraseability',
-    'erased.',
-    'erasma',
-    'erasmi',
-    'erasp',
-    'erasrg',
-    'erasrgc',
-    'erathiopica',
-    'eratication',
-    'eration',
     'erations',
-    'erato/steere',
-    'eravi',
-    'eravur',
-    'erawan',
-    'erb',
-    'erb-b',
-    'erba',
-    'erba-odescalchi',
-    'erbach',
-    'erbamont',
-    'erbb3',
-    'erbesfield',
-    'erbie',
-    'erbium-doped',
-    'ercall',
     'ercan',
-    'ercans',
-    'erchia',
-    'erchie',
-    'ercildoune',
-    'ercolani',
-    'ercon',
-    'ercoupe/aircoupe/fornaire/alon/cadet',
-    'ercoupes',
-    'ercoupes/aircoupes',
-    'ercument',
-    'erd',
-    'erd&ouml;l',
-    'erdelyi',
-    'erden',
-    'erdener',
     'erdenet',
-    'erdeswicke',
-    'erdich',
-    'erdm&ouml;bel',
-    'erdnow',
-    'erdodi/baranyai',
-    'erdos',
-    'erdsicht',
-    'erdsiek',
-    'erdstock',
-    'erdtman',
-    'erebor',
-    'erechtheum',
-    'erechtheus',
-    'erected.',
-    'erected.strands',
     'erecteth',
-    'erectheus',
-    'erede',
-    'eredine',
-    'ereg',
-    'ereht',
-    'erembald',
-    'eremita',
-    'eremitani',
-    'eremiti',
-    'eremitic',
-    'eremopterix',
-    'erence',
-    'ereng',
-    'erengrad',
-    'erenhot',
     'erentz',
-    'eres',
-    'eretage',
-    'eretmodus',
-    'erev',
-    'erfal',
-    'erforms',
-    'erfsu',
-    'erfurterstrasse',
-    'erg&auml;nzung',
-    'erg&auml;nzungsindex',
-    'erg-second',
-    'ergas',
-    'ergatikou',
-    'ergativity',
-    'ergazomenou',
     'ergcm',
-    'ergel',
-    'ergene',
-    'erges',
-    'ergife',
-    'ergo-sphere',
-    'ergodynamics.',
-    'ergomatic',
-    'ergometer',
-    'ergonomical',
-    'ergosterol',
-    'ergoteles',
-    'ergotherapy',
-    'erh-li-t\'ou',
-    'erhalte',
-    'erhardstrasse',
     'erhardt',
-    'erhebt',
-    'erhwald',
-    'eria',
-    'eribo',
-    'ericae',
-    'ericales',
-    'erican',
-    'erice',
-    'erichthonios',
-    'ericolin',
-    'ericsson-hewlett',
-    'eridania',
-    'eridu',
-    'erig',
-    'erigeron',
     'erika.',
-    'eriks',
-    'eriksen',
-    'eriksonian',
-    'eriksons',
-    'erim',
-    'erin\'',
-    'erinacea',
-    'eringa/telemonster',
-    'erington',
-    'erinoid',
-    'erinoids',
-    'erinosis',
-    'erinyes',
-    'erio',
-    'eriobotrya',
     'eriochrome',
-    'eriosoma',
-    'eriphorium',
-    'erique',
-    'erisort',
-    'eristic',
-    'eristics',
-    'erit',
-    'eritage',
-    'erithramita',
-    'eritrichium',
-    'erizzo',
-    'erkel',
-    'erkenntnisgewinnender',
-    'erkenwald',
-    'erkl&auml;ren',
     'erkl&auml;rende',
-    'erkl&auml;rendes',
-    'erkum',
-    'erl&eacute',
-    'erlabus',
-    'erlanbach',
-    'erlander',
-    'erlanger',
-    'erlangeri',
-    'erlebacher',
-    'erleia',
-    'erleigh',
-    'erlen',
-    'erlenmeyer-kimling',
-    'erlevestrop',
-    'erlewine',
     'erlier',
-    'erlingsflokkr',
-    'erlkonig',
-    'erly',
-    'erm-inspired',
-    'erm-sympathiser',
-    'erm-sympathisers',
-    'erm.',
-    'erm_as',
-    'erm_by',
-    'erm_in',
-    'erm_so_er',
-    'erm_that',
-    'ermacora',
-    'ermatingen',
-    'ermenonville',
     'ermera',
-    'ermerm',
-    'ermes',
-    'ermessen',
-    'ermine-edged',
-    'ermine-lined',
-    'ermine-trimmed',
-    'ermined',
-    'ermione',
-    'ermo',
-    'ermolinsky',
-    'ern&aacute;n',
-    'ernaga',
-    'ernani',
-    'erndhura',
-    'ernesiders',
     'ernesti',
-    'ernets',
-    'ernic',
-    'ernie.',
-    'ernie/ernette',
-    'ernmental',
-    'ernsberger',
-    'ernst-ludwig',
-    'ernsting',
-    'ernston',
-    'eroded\'',
-    'erodingly',
-    'erodium',
-    'erodiumpelagoniiflorum',
-    'erofeyev',
-    'erogation',
     'erogonimic',
-    'erolius',
-    'eroni',
-    'erooga',
-    'eror',
-    'eros-wise',
-    'erosca',
-    'erosion-susceptible',
-    'erosion.',
-    'erosionally',
-    'erotic-drawings',
-    'erotic-passionel',
-    'erotic-that',
-    'erotically-charged',
-    'eroticisation',
-    'eroticism\'',
     'erotique',
-    'erotomane',
-    'erotomania',
-    'erpounds',
-    'erpyngham',
-    'erpynghams',
-    'erquelines',
-    'erquiza',
-    'err&aacute;zuriz',
-    'err=17',
-    'errances',
-    'errand-boys',
-    'errand-girl',
-    'errantibus',
-    'errars',
-    'erratic/erotic',
     'erratically&mdash;a',
-    'errazuriz',
-    'errgh',
-    'erribol',
-    'erriboll',
-    'errichett',
-    'erridge',
-    'errie',
-    'errif',
-    'errill',
-    'errin',
-    'erringham',
-    'errm',
-    'errmm',
-    'erro',
-    'errols',
     'erromanga',
-    'erronius',
-    'error&mdash;log',
-    'error&mdash;number',
-    'error&mdash;text',
-    'error-bars',
-    'error-correcting',
-    'error-filled',
-    'error-looked',
-    'error-trap',
-    'error-trapped',
-    'error?',
-    'errors-in-variables',
-    'errrrmmmm',
-    'errrrr',
-    'errup',
     'errupted',
-    'ers.',
-    'ersanyre',
-    'ersatz-importance',
-    'ersatz-kaiser',
-    'erself',
-    'ershler',
-    'ersin',
-    'erskines',
-    'ersly',
-    'ersoz',
-    'erste',
-    'erster',
-    'erstfeld',
-    'erta',
-    'ertan',
     'erte',
-    'erteinbrod',
-    'erthematodes',
-    'ertola',
-    'ertr4',
-    'ertr7',
-    'eructation',
-    'eruditions',
-    'erum',
-    'eruptives',
-    'erve',
-    'erven',
-    'erves',
-    'ervey',
-    'erwarton',
-    'erwartung',
     'erwein-carl',
-    'erwinia',
-    'erwinus',
-    'erwood',
-    'erygium',
-    'eryi',
-    'eryilmaz',
-    'eryou',
-    'eryrys',
-    'erythemal',
-    'erythematosis',
-    'erythematous/haemorrhagic',
-    'erythraei',
-    'erythrean',
-    'erythrism',
-    'erythroaphin',
     'erythrodon',
-    'erythrogenic',
-    'erythroleukaemic',
-    'erythrophthalmus',
-    'erythrops',
-    'erythros',
-    'erythrosine',
-    'erz',
-    'erzahlte',
-    'erzan',
-    'erzen',
-    'erzieherisch',
-    'erziehung',
-    'erzs&eacute;bet',
-    'erzulie',
-    'erzurum',
     'es-1',
-    'es-175d',
-    'es-330',
-    'es-330s',
-    'es-335s',
-    'es-340',
-    'es-347',
-    'es-350',
-    'es-500',
-    'es-pormote2/w-diag',
-    'es-promote',
-    'es-said',
-    'es-salaam',
-    'es-smara',
-    'es-tu',
-    'es.',
     'es/kernel',
-    'es/pex',
-    'es175',
-    'es345/355',
-    'es350t',
-    'esa&iuml;e',
-    'esa-quest',
-    'esa/irs',
-    'esa/nasa',
-    'esaa',
-    'esacerbation',
-    'esafs',
-    'esalen',
-    'esally',
-    'esape',
-    'esari',
     'esatet',
-    'esbcd',
-    'esbo',
-    'esbrough',
-    'esc+x',
-    'esc/esc&lsqb',
-    'esc225,000',
-    'esc3,900,000',
-    'esc416,000',
-    'esc439,000',
-    'esc488,000',
-    'esc539,000',
-    'esc543,000',
-    'esc601,000',
-    'esca-organised',
-    'escalada',
     'escalade',
-    'escalatingly',
-    'escalier',
-    'escallops',
-    'escalonia',
-    'escapable',
-    'escape-committees',
-    'escape-kit',
-    'escape-route',
-    'escarboucle',
-    'escarole',
-    'escarpit',
-    'escaude',
-    'escc',
-    'eschalots',
-    'eschar',
     'escharoides',
-    'eschars',
-    'eschatologies',
-    'eschborn',
-    'escheators',
-    'escheats',
-    'eschenberg',
-    'eschenburg',
-    'eschericia',
-    'escholz',
-    'eschrichtius',
-    'eschscholzias',
-    'eschweiler',
-    'esco',
-    'escofferys',
-    'escohotado',
     'escoillee',
-    'escondo',
-    'escor',
-    'escort-size',
-    'escort.',
-    'escort/dash',
-    'escortin\'',
-    'escossoys',
-    'escott/resident',
-    'escoubes',
-    'escp',
-    'escravos',
-    'escrementizio',
-    'escribano',
-    'escribi&otilde',
-    'escritoires',
     'escriva',
-    'escs',
-    'escuadrilla',
-    'escuadrones',
-    'escude',
-    'escudo**',
-    'escuelas',
-    'escuintla',
-    'esculentia',
-    'esculturas',
-    'escumasiids',
-    'esdale',
-    'esdays',
-    'esdec',
-    'esdras',
-    'esdu',
     'esediye',
-    'esegetiche',
-    'esema',
-    'esement',
-    'esempio',
-    'esemplastic',
-    'esene',
-    'esenin',
-    'esential',
-    'eserine',
-    'eserve',
-    'eses',
-    'esetl',
-    'esf475',
-    'esfandiari',
-    'esgair',
     'esgardiatores',
-    'esha',
-    'esheleagh',
-    'eshembethel',
-    'eshkolot',
-    'eshman',
-    'esholt',
-    'eshton',
-    'eshugbayi',
-    'eshwood',
-    'esili',
-    'esj',
-    'esjberg',
-    'eskapa',
-    'eskbridge',
-    'eskdale-side',
     'eskimeaux',
-    'eskimoes',
-    'eskins/1944-47',
-    'esko-juhani',
-    'eskra',
-    'esks',
-    'eskuara',
-    'eskview',
-    'esla',
-    'eslamabad',
-    'eslami',
-    'eslava',
-    'eslewhere',
-    'esma',
-    'esmark',
-    'esmati',
     'esmee',
-    'esmeraldo',
-    'esmerelda-less',
-    'esmerlda',
-    'esn(mild)',
-    'esn(severe)',
-    'esn-m',
-    'esnal',
-    'esneh',
-    'esnol',
-    'esnouf',
-    'esnure',
-    'esocrt',
-    'esophagram',
-    'esoterica',
-    'esp&eacute;lugues',
     'esp&eacute;rance',
-    'esp&iacute;n',
-    'esp&iacute;rito',
-    'esp-disk',
-    'esp/acc',
-    'espa&ntilde;iola',
-    'espace/mbb',
-    'espadon',
-    'espadrille',
-    'espagnola',
-    'espagnols',
-    'espalier-trained',
-    'esparanza',
-    'esparto-grass',
-    'espat',
-    'espc',
     'espcially',
-    'espeariensed',
-    'espec',
-    'especializada',
-    'especiall',
-    'especiallie',
-    'especially&mdash;in',
-    'especialy',
-    'espedair',
-    'espeically',
-    'esperanto&mdash',
-    'esperanto-speaking',
-    'esperase',
-    'esperaza',
-    'espereme',
-    'espersen',
     'espetadas',
-    'espgan',
-    'esphyr',
-    'espies',
-    'espinettes',
-    'esping-anderson',
-    'espinozo',
-    'espirit',
-    'espirito-santo',
-    'espiscopacy',
-    'espitali&eacute',
-    'espite',
-    'espley',
-    'esplins',
-    'esplose',
-    'espoecially',
     'esporles',
-    'esporter',
-    'esposa',
-    'espousers',
-    'espressione',
-    'espressionist',
-    'espressivo',
-    'espresso-style',
-    'espresso/cappuccino',
-    'espresso/repubblica',
-    'espressos',
-    'esprit\'92',
-    'esprit-295',
-    'esprit-3',
-    'esprit-funded',
-    'espriu',
     'espry',
-    'esq1',
-    'esqe',
-    'esqr.',
-    'esquadra',
-    'esquadras',
-    'esquadrilha',
-    'esquilache',
-    'esquilina',
-    'esquiline',
-    'esquimau',
-    'esquipul&aacute;s',
-    'esquirla',
-    'esquisse',
-    'esr=51',
-    'esrange',
     'esras',
-    'esrc-funding',
-    'esrc/',
-    'esrc/afrc',
-    'esrc/cntls',
-    'esrc/department',
-    'esrc/esf',
-    'esrc/jaep',
-    'esrc/mrc/serc',
-    'esrc/nsf',
-    'esrc/oda',
-    'esrc/regional',
-    'esrf',
-    'ess-food',
-    'ess-pik',
-    'essaie',
     'essam',
-    'essanians',
-    'essaouira',
-    'essay-',
-    'essay-collections',
-    'essay-reviews',
-    'essay-worn',
-    'essay-writer',
-    'essay/class',
-    'essayes',
-    'essemple',
-    'essence(s)',
-    'essenhigh/teacher',
-    'essense',
-    'essential-',
-    'essential-at-the-time',
     'essential-books',
-    'essential-to',
-    'essential_in',
-    'essentialising',
-    'essentialist/constructionist',
-    'essentiality',
-    'essentialize',
-    'essentiall',
-    'essentiel',
-    'essentyale',
-    'essequibo',
-    'esset',
-    'essex-london',
-    'essex-man',
-    'essex-qualified',
-    'essex-suffolk',
     'essex-type',
-    'essex/suffolk',
-    'essi',
-    'essien-udom',
-    'essingone',
-    'essington',
-    'esslingen',
-    'essof',
-    'essoins',
-    'essonne',
-    'essonnes',
-    'essopadam',
-    'essorer',
-    'essoyes',
-    'essy',
-    'est&aacute',
     'est&eacute',
-    'est&egrave;ve',
-    'est-ce-que',
-    'est-elle',
-    'est-ites',
-    'est.ffr1&ndash;1.5',
-    'est.ffr1.5&ndash;2m',
-    'est/a',
-    'esta&ccedil&atilde;o',
-    'estab',
-    'estabilizaci&oacute;n',
-    'establised',
-    'establish/maintain',
-    'establishable',
-    'established\'',
-    'established-',
     'established-firm',
-    'establishement',
-    'establishesa',
-    'establishme',
-    'establishment-level',
-    'establishment-man',
-    'establishment-orientated',
-    'establishmentopen',
-    'establishments.',
-    'establishments/academia',
-    'establsihed',
-    'estadio',
-    'estagio',
-    'estahbanat',
-    'estain',
-    'estalagem',
     'estalished',
-    'estaminets',
-    'estamp',
-    'estancias',
-    'estancieros',
-    'estandarte',
-    'estanguet',
-    'estanquinhos',
-    'estant',
-    'estas',
-    'estat',
-    'estatal',
-    'estate-agent',
-    'estate-bottled',
-    'estate-boundaries',
-    'estate-centres',
     'estate-driver',
-    'estate-grown',
-    'estate-manager',
-    'estate-managers',
-    'estate-owners',
-    'estate-representative',
-    'estate-structure',
-    'estate-surveys',
-    'estate-village',
-    'estate-workers',
-    'estate.it',
-    'estates&rehy;general',
-    'estates-general',
-    'estates-tail',
-    'estates-their',
-    'estates.',
     'estatesmen',
-    'estaub&eacute',
-    'estavisham',
-    'estay',
-    'estbottom',
-    'estd.',
-    'estebaero',
-    'esteban-magdalena',
-    'ested',
-    'esteem.',
-    'esteem.joyce',
-    'esteeme',
-    'esteinou',
-    'estelar',
-    'estelit',
-    'estepona',
     'ester-induced',
-    'ester-poor',
-    'esterases',
-    'estergom',
-    'esterh&aacute;za',
-    'esterhaza',
-    'esterhazy',
-    'esteril',
-    'esterlin',
-    'estern',
-    'estero',
-    'estesties',
-    'esteve',
-    'estevez/marcheco',
-    'estfield',
-    'esth&eacute;tique',
     'esth&eacute;tiques',
-    'esthart',
-    'esthers',
-    'estheticians',
-    'esthonia',
-    'esti',
-    'estialcodine',
-    'estiamting',
-    'estiatoras',
-    'estier',
-    'estifanos',
-    'estil&iacute;stico',
-    'estimatable',
-    'estimate(s)',
-    'estimates/receipts',
-    'estimates/reserves',
     'estimnated',
-    'estira',
-    'estis',
-    'estivant',
-    'estives',
-    'estler',
-    'estling',
-    'estlins',
-    'estoban',
-    'estoi',
-    'estonian-latvian',
-    'estop',
-    'estopped.',
-    'estorbo',
-    'estorie',
-    'estouffade',
     'estoy',
-    'estrada-kalaw',
-    'estradiol',
-    'estrapade',
-    'estray',
-    'estreatment',
-    'estreats',
-    'estremaduran',
-    'estridge',
-    'estrithsson',
-    'estrogen',
-    'estrogens',
-    'estroil',
-    'estuary-type',
-    'estudded',
-    'estudiantes',
     'estufados',
-    'estufagem',
-    'esturial',
-    'esturmy',
-    'esty',
-    'estyn',
-    'esurient',
-    'esus4-e',
-    'esv',
-    'eswa',
-    'eswarakrishnan',
-    'eswi',
-    'eswl',
-    'et&agrave',
-    'et-1-induced',
-    'et-1-stained',
     'et-122&ndash;38',
-    'et-270',
-    'et-aia',
-    'et._al.',
-    'et4000ax',
-    'et500mc326',
-    'et5500fy338',
-    'et5500hx845',
-    'et5500kt716',
-    'et5500kt727',
-    'et5500kt730',
-    'et5500kt741',
-    'et5500kt866',
-    'et5500ln010',
-    'et5500mb926',
-    'et5500mb968',
     'et5500mc185',
-    'et5500mc207',
-    'et5500mc217',
-    'et5500mc224',
-    'et5500mc227',
-    'et5500mc248',
-    'et6',
-    'eta&mdash;basque',
-    'eta-linked',
-    'eta.',
-    'etablissement',
-    'etage',
-    'etages',
-    'etait',
-    'etajul',
-    'etal',
     'etamine',
-    'etancelin',
-    'etangs',
-    'etap',
-    'etarnity',
-    'etarras',
-    'etas',
-    'etaul',
-    'etbe',
-    'etc&mdash;can',
-    'etc-become',
-    'etc.ban',
-    'etc/',
-    'etc2',
-    'etce',
-    'etcet',
     'etch-proof',
-    'etch-resistant',
-    'etchasketches',
-    'etche',
-    'etcheberry',
-    'etched-mirror',
-    'etched-sandstone',
-    'etchegary',
-    'etchers',
-    'etchingham',
-    'etected',
-    'etem',
-    'etemadi',
-    'etemadi.',
-    'eten',
-    'etenalol',
     'eter',
-    'eternal-maternal',
-    'eternalize',
-    'eternall',
-    'eternally-caring-for-others',
-    'eternally-young',
-    'eternel',
-    'eternitie',
-    'eternity.i',
-    'eternum',
-    'eth-ical',
-    'etha',
-    'ethamsylate',
-    'ethanal',
-    'ethanesulphonic',
-    'ethanim',
     'ethanoate',
-    'ethanol-acetic',
-    'ethanol-fixed',
-    'ethanol-precipitated',
-    'ethanol-water',
-    'ethanol/0.5%',
-    'ethanol:ammonium',
-    'ethanol:water',
-    'ethanolamine-phosphoglycerol',
-    'ethanols',
-    'ethate',
-    'ethel-',
-    'ethelbergers',
-    'etheldreds',
-    'ethelhild',
-    'ethell',
     'ethelwyn',
-    'ethene.',
-    'ether-anaesthetized',
-    'ether-library',
-    'ether/ethanol',
-    'ethercoupler',
-    'etherealized',
-    'etherealizing',
-    'ethernet-based',
-    'ethernet-compatible',
-    'ethernet-serial-pcmcia',
-    'ethernet.',
-    'ethernet/ieee',
-    'ethernetted',
-    'etherswitch',
-    'etherteam',
     'etherx',
-    'etheyl',
-    'ethicacy',
-    'ethically-based',
-    'ethice',
-    'ethicise',
-    'ethicks',
-    'ethicolegal',
-    'ethidium-',
-    'ethidiumbromid',
-    'ethile',
-    'ethio',
-    'ethiopa',
-    'ethiope',
-    'ethiopean',
-    'ethiopes',
     'ethiopian-occupied',
-    'ethirajulu',
-    'ethische',
-    'ethlyn',
-    'ethmoid',
-    'ethnarch',
-    'ethnic&rehy;armenian',
-    'ethnic-/confessionally-based',
-    'ethnic-cleansers',
-    'ethnic-fijian',
-    'ethnic-german',
-    'ethnic-greek',
-    'ethnic-group',
-    'ethnic-meets-rustic',
-    'ethnic-moslem',
-    'ethnic-of-somewhere',
     'ethnic-polish',
-    'ethnic-religious',
-    'ethnic/folk',
-    'ethnic/nationalist',
-    'ethnic/regional',
-    'ethnically-defined',
-    'ethnically-mixed',
-    'ethnicists',
-    'ethnicz',
-    'ethno&rehy;linguistic',
-    'ethno&rehy;methodological',
-    'ethno&rehy;methodology',
-    'ethno&rehy;musicography',
-    'ethno-babble',
-    'ethno-biology',
-    'ethno-botanical',
     'ethno-botanist',
-    'ethno-centric',
-    'ethno-centricism',
-    'ethno-linguistic',
-    'ethno-musicologist',
-    'ethno-psychology',
-    'ethno-racism',
-    'ethno-sociology',
-    'ethno/religious/tribal',
-    'ethnobiology',
-    'ethnocentrically',
-    'ethnogenesis',
-    'ethnogeny',
-    'ethnogeographic',
-    'ethnographically-based',
-    'ethnograpic',
     'ethnohistory',
-    'ethnolect',
-    'ethnolinguists',
-    'ethnomusicological',
-    'ethnomusicologist',
-    'ethnomusicologists',
-    'ethnopharmacology',
-    'ethnoscience',
-    'ethod',
-    'ethogeny',
-    'ethologically',
-    'ethopia',
-    'ethos.',
-    'ethoxylates',
-    'ethoxyresorufin',
-    'ethy',
     'ethyl-cellulose',
-    'ethylamine',
-    'ethylation',
-    'ethylene-propylene',
-    'ethylene2.3',
-    'ethylenediaminetetra-acetate',
-    'ethylenediaminetetraacetate',
-    'ethylenediaminetetraacetic',
-    'ethylenedithiolo',
-    'ethylhexyl',
-    'ethylinediamine',
-    'ethyrra',
-    'etiang',
-    'etibar',
-    'etica',
-    'eticson',
     'etid',
-    'etien',
-    'etienne-emile',
-    'etim',
-    'etio',
-    'etiolate',
-    'etiological',
-    'etiologies',
-    'etiophia',
-    'etisalat',
-    'etkin',
-    'etna-watchers',
-    'etna/sicily',
-    'etnas',
-    'etnaward',
-    'etnean',
     'etnicko',
-    'etoecologista',
-    'etoh',
-    'eton-educated',
-    'etona',
-    'etonne-moi',
-    'etons',
-    'etook',
-    'etoughe',
-    'etr',
-    'etr&egrave;nes',
-    'etr-254',
-    'etrang&egrave;re',
-    'etrangeres',
-    'etrier',
-    'etrim',
     'etrs',
-    'etruscan-style',
-    'etruschi',
-    'etrusci',
-    'etrusco',
-    'etrusco-italian',
-    'etruscologist',
-    'etrusques',
-    'ets.',
-    'etsou-nzabi-bamungwabi',
-    'etsuro',
-    'ett',
-    'ette',
-    'ettela\'at',
-    'ettelaat',
-    'ettens',
     'etting',
-    'ettingers',
-    'ettinghausen',
-    'ettori',
-    'ettra',
-    'ettringite',
-    'etud',
-    'etudiants',
-    'etwas',
-    'etxabe',
-    'etymologic',
-    'etymologicum',
-    'etymologising',
-    'etzel',
-    'etzli',
-    'etzmuss',
     'eu-fuse-ia',
-    'eu-m3',
-    'eua',
-    'euander',
-    'euangelion',
-    'euba',
-    'eubacterium',
-    'eubank-ahrens',
-    'eubank-barkley',
-    'eubank-piper',
-    'eubank/world',
-    'eubulus',
-    'eucalyptus-scented',
-    'euchaeta',
-    'eucharist-church',
-    'eucharist/holy',
     'eucharisticon',
-    'eucharisto',
-    'euclase',
-    'euclidis',
-    'eucmos',
-    'eucnemus',
-    'euconodonts',
-    'eucrates',
-    'eucrite',
-    'eucs-supported',
-    'eucypris',
-    'eudaimon',
-    'eudamex',
-    'eudemis',
-    'eudoxie',
-    'eudoxius',
     'eudyptes',
-    'eueliner',
-    'euencristene',
-    'euentide',
-    'euere',
-    'euergos',
-    'eueri',
-    'euerlastynge',
-    'euermore',
-    'euesong',
-    'eufa',
-    'eug&egrave;ne-aim&eacute',
-    'eugametos',
-    'euge',
-    'eugeen',
-    'eugeissona',
     'eugena',
-    'eugenes',
-    'eugenically-based',
-    'eugenides',
-    'eugenios',
-    'eugeosynclinal',
-    'eugeosynclines',
-    'euglenoids/kinetoplasts',
-    'eugosynclinal',
-    'eugui',
-    'eukronia',
-    'eulalie',
-    'euler-beroulli',
-    'euler-lotka',
-    'euler-poisson',
-    'euler-poisson-darboux',
     'eulittoral',
-    'eulogio',
-    'eulogises',
-    'eulogium',
-    'eulx',
-    'eumares',
-    'eumaros',
-    'eumelanin',
-    'eumelio',
-    'eumelos',
-    'eumenea',
-    'eumetes',
-    'eums',
-    'eunet/relcom',
-    'eungellensis',
-    'eunjoo',
     'eunomius',
-    'eunuchry',
-    'eunuchs-in-the-harem',
-    'euo',
-    'euonymous',
-    'euopean',
-    'euoticus',
-    'eupator',
-    'eupator.',
-    'eupen',
-    'euphemised',
-    'euphemistically-minded',
-    'euphemsism',
-    'euphoberia',
-    'euphon',
-    'euphonia',
     'euphorbs',
-    'euphorion',
-    'euphorosinum',
-    'euphrasua',
-    'euphuism',
-    'euphuistic',
-    'euphylia',
-    'euplectes',
-    'eupsychic',
-    'euqity',
-    'eur&iuml;pos',
-    'euralair',
-    'eurasure',
-    'eurax',
-    'eurddrail',
-    'eure',
     'eures',
-    'eurgah',
-    'eurgh',
-    'eurhetemecs',
-    'eurhodip',
-    'eurhythmic',
-    'eurican',
-    'eurich',
-    'euricianus',
-    'eurikon',
-    'eurikoneuropa',
-    'eurip',
-    'euripedes',
-    'euro&rehy;debate',
-    'euro-&pound',
-    'euro-aid',
     'euro-aim',
-    'euro-allegiance',
-    'euro-ambush',
-    'euro-artscribble',
-    'euro-banana',
-    'euro-bank',
-    'euro-bash',
-    'euro-bid',
-    'euro-bishop',
-    'euro-blue',
-    'euro-brand',
-    'euro-buffers',
-    'euro-cash',
-    'euro-centred',
-    'euro-champion',
-    'euro-champs',
     'euro-children',
-    'euro-christians',
-    'euro-clash',
-    'euro-clubbing',
-    'euro-comics',
-    'euro-commissioner',
-    'euro-commuters',
-    'euro-competitors',
-    'euro-consortium',
-    'euro-constituencies',
-    'euro-convertible',
-    'euro-cracy',
-    'euro-culture',
-    'euro-cutie',
-    'euro-cynics',
-    'euro-debate',
     'euro-deeds',
-    'euro-defence',
-    'euro-directives',
-    'euro-dirigism',
-    'euro-disneyland',
-    'euro-dizzy',
-    'euro-eire',
-    'euro-enthusiasm',
-    'euro-event',
-    'euro-events',
-    'euro-executives',
-    'euro-eyes',
-    'euro-fair',
-    'euro-fanatic',
-    'euro-fanaticism',
-    'euro-federalist',
     'euro-fervour',
-    'euro-fis',
-    'euro-foreign-policy',
-    'euro-french',
-    'euro-fudge',
-    'euro-gabble',
-    'euro-glam',
-    'euro-gospel',
-    'euro-group',
-    'euro-hands',
-    'euro-haters',
-    'euro-hopefuls',
-    'euro-hypochondriacs',
-    'euro-index',
-    'euro-influence',
-    'euro-institution',
     'euro-institutions',
-    'euro-integration',
-    'euro-intentions',
-    'euro-investment',
-    'euro-italian',
-    'euro-jaunt',
-    'euro-judges',
-    'euro-junket',
-    'euro-language',
-    'euro-lavatory',
-    'euro-lawyer',
-    'euro-left',
-    'euro-legend',
-    'euro-loan',
-    'euro-loans',
-    'euro-man',
     'euro-markets',
-    'euro-mechanism',
-    'euro-medium-term',
-    'euro-millionaires',
-    'euro-minister',
-    'euro-ministers',
-    'euro-money',
-    'euro-moralising',
-    'euro-mountain',
-    'euro-moves',
-    'euro-myths',
-    'euro-nonsense',
-    'euro-notes',
-    'euro-notion',
-    'euro-operations',
-    'euro-organization',
     'euro-parliamentarians',
-    'euro-partners',
-    'euro-peace',
-    'euro-phoria',
-    'euro-pig',
-    'euro-plants',
-    'euro-platitudes',
-    'euro-plot',
-    'euro-plus',
-    'euro-politics',
-    'euro-pop',
-    'euro-pragmatist',
-    'euro-prefix',
-    'euro-presidency',
-    'euro-prize',
-    'euro-processed',
     'euro-protectionism',
-    'euro-puddings',
-    'euro-quest',
-    'euro-ready',
-    'euro-recovery',
-    'euro-reforms',
-    'euro-reggae',
-    'euro-regulation',
-    'euro-researchers',
-    'euro-rock',
-    'euro-sails',
-    'euro-scare',
-    'euro-slut',
-    'euro-soccer',
-    'euro-sport',
-    'euro-sterling',
     'euro-styling',
-    'euro-supercomputing',
-    'euro-synthesis',
-    'euro-thriller',
-    'euro-tour',
-    'euro-trading',
-    'euro-train',
-    'euro-trash',
-    'euro-tv',
-    'euro-uk',
-    'euro-vanette',
-    'euro-visionaries',
-    'euro-vote',
-    'euro-waffle',
-    'euro-week',
-    'euro-yen',
     'euro-zone',
-    'euro.credits',
-    'euro.currency',
-    'euro/dpc',
-    'euroactividade',
-    'euroagriculture',
-    'euroamerican',
-    'euroaton',
-    'euroband',
-    'eurobankers',
-    'eurobar',
-    'eurobills',
-    'eurobit',
-    'eurobland',
-    'euroboard',
-    'eurobrat',
     'eurobridge',
-    'eurocard-style',
-    'eurocard/mastercard/access',
-    'eurocards',
-    'eurocare',
-    'eurocargo',
-    'eurocats',
-    'eurochamps',
-    'eurochicken',
-    'euroclydon',
-    'eurocoinmunists',
-    'eurocomp',
-    'eurocover',
-    'eurocowl',
-    'eurocrat',
-    'eurocrypt',
     'eurocumber',
-    'eurodata',
-    'eurodisaster',
-    'eurodisc',
-    'eurodisneyland',
-    'eurodrivel',
-    'eurodynamics',
-    'euroelection',
-    'eurofanatic',
-    'eurofax',
-    'eurofloppy',
-    'eurofrancs',
-    'eurogas',
-    'eurogateway',
-    'eurogenic',
-    'eurogentleman',
     'eurogug',
-    'eurohack',
-    'eurohacks',
-    'eurohits',
-    'eurohopes',
-    'euroindex',
-    'euroinfocentre',
-    'eurojoke',
-    'eurolanguage',
-    'euroleisure',
-    'eurolex',
-    'euroline',
-    'euroloans',
-    'euroluce',
-    'eurolycee',
-    'eurom',
     'euromarks',
-    'euromask',
-    'euromerger',
-    'euromissiles',
-    'euromix',
-    'euromovies',
-    'euromyths',
-    'euronomia',
-    'euronorm',
-    'europ&auml;ischen',
-    'europ&eacute;ene',
-    'europ-assistance',
-    'europa-bund',
-    'europae',
-    'europaei',
-    'europajugendsieger',
     'europallet',
-    'europan',
-    'europanet',
-    'europaper',
-    'europarc',
-    'europcar',
-    'europe-',
-    'europe-1',
-    'europe-argentina',
-    'europe-as',
-    'europe-asia',
-    'europe-brazil',
-    'europe-centredness',
-    'europe-dataquest',
-    'europe-far',
-    'europe-japan',
     'europe-minded',
-    'europe-see',
-    'europe-us',
-    'europe.',
-    'europe.i',
-    'europe/mediterranean',
-    'europe/middle',
-    'europe_as',
-    'european&rehy;centred',
-    'european-atlantic',
-    'european-born',
-    'european-centred',
-    'european-consortium',
-    'european-free',
-    'european-level',
-    'european-ness',
     'european-north',
-    'european-owned',
-    'european-sized',
-    'european-standard',
-    'european-trained',
-    'european-type',
-    'european/american',
-    'european/asian',
-    'european/ec',
-    'european/rest',
-    'european/rhenania',
-    'europeaney',
-    'europeanizers',
-    'europeannesswhich',
-    'europeanut',
-    'europeene',
     'europejski',
-    'europhilia',
-    'europhobia',
-    'europhor',
-    'europia',
-    'europiskaya',
-    'europlant',
-    'europointer',
-    'europolitics',
-    'europoort',
-    'europort',
-    'europrats',
-    'europroblem',
-    'europsport',
-    'euroquest',
-    'euroradical',
     'euroradio',
-    'eurorailing',
-    'euroresearch',
-    'euroroute',
-    'eurosafe',
-    'eurosam',
-    'eurosatellite',
-    'eurosclerosis',
-    'eurosearch',
-    'euroserv',
-    'euroshank',
-    'euroski',
-    'eurosoft',
-    'eurosong',
-    'eurosport/eurogoals',
-    'eurostars',
     'eurostation',
-    'eurostatute',
-    'eurostem',
-    'eurostyle',
-    'eurosud',
-    'eurosud-calvisson',
-    'eurosurvey',
-    'euroswiss',
-    'eurotas',
-    'eurotax',
-    'eurotaxi',
-    'eurotec',
-    'eurotecnet',
-    'euroterminal',
-    'eurotrack-100',
-    'eurotrash',
     'eurotraveller',
-    'eurotreks',
-    'eurotrib',
-    'eurotrust',
-    'eurovat',
-    'eurowide',
-    'eurpean',
-    'eurway',
-    'euryalae',
-    'eurybathic',
-    'eurybiadas',
-    'eurydike',
-    'eurymedan',
-    'eurypterus',
-    'eurythion',
-    'eurythmists',
     'eurytopic',
-    'eus',
-    'eusapia',
-    'euseb',
-    'eusi',
-    'euskadiko',
-    'euskara',
-    'eusko',
-    'eusmilia',
-    'eusse',
-    'eusses',
-    'eustace/bonsai',
-    'eustachio',
-    'eustaquio',
-    'eustasio',
-    'eusterna',
     'euston&ndash;glasgow',
-    'euston&ndash;manchester',
-    'euston-king',
-    'euteleology',
-    'euteltracs',
-    'euth&eacute;rapie',
-    'euthanase',
-    'euthanasia/suicide',
-    'eutheria',
-    'euthunai',
-    'euthymenes',
-    'eutin',
-    'eutrop.',
-    'eutrophicationin',
-    'eutropius',
-    'eutyche',
     'eutyches',
-    'eutychius',
-    'euv',
-    'euxine',
-    'euxinos',
-    'euxitheos',
-    'euyll',
-    'euynsonge',
-    'ev&eacute;ry',
-    'ev&mdash',
-    'ev\'nings',
-    'ev\'one',
-    'ev\'ryone',
-    'ev-100',
-    'ev-12l',
-    'ev-45',
     'ev-4s',
-    'ev-6',
-    'ev-ev-ev-ever',
-    'ev10',
-    'eva.',
-    'evac',
-    'evacu',
-    'evacuated.',
-    'evacuated_along',
-    'evacuation-decree',
-    'evacuation-two',
-    'evacuted',
-    'evader',
-    'evae',
-    'evagination',
-    'evah',
     'evaire',
-    'evala07',
-    'evala11',
-    'evala16',
-    'evala2',
-    'evala7',
-    'evald',
-    'evald08',
-    'evalie',
-    'evallonians',
-    'evalu',
-    'evaluation/consultation',
-    'evaluation/modification',
-    'evaluative/emotive',
-    'evaluatory',
-    'evalution',
     'evan-cook',
-    'evance',
-    'evandro',
-    'evang&eacute;licas',
-    'evangeliar',
-    'evangelic',
-    'evangelical-baptist',
-    'evangelical/humanitarian',
-    'evangelical/secular',
-    'evangeliche',
-    'evangelicism',
-    'evangelien',
-    'evangeliery',
-    'evangelist-propagandist',
-    'evangelistas',
-    'evangelisti',
     'evangelistically',
-    'evangelou',
-    'evani',
-    'evans&rehy;pritchard',
-    'evans-clarke',
-    'evans-halshaw',
-    'evans-turner',
-    'evans/',
-    'evans/aaron',
-    'evans/aea',
-    'evans/clydeside',
-    'evans/cpre',
-    'evans/geriatric',
-    'evans/gypsy',
-    'evans/landlord',
-    'evans/patient',
     'evans/police',
-    'evans/presentation',
-    'evans/thames',
-    'evans/vicar',
-    'evans/west',
-    'evansdiscovered',
-    'evansiana',
-    'evante',
-    'evantes',
-    'evantius',
-    'evapor-8',
-    'evaporators',
-    'evaporitic',
-    'evaready',
-    'evaristi',
-    'evathane',
     'evauation',
-    'eve-of-budget',
-    'eve-of-conference',
-    'eve-of-play',
-    'eve-of-strike',
-    'eve-of-summit',
-    'eve-of-talks',
-    'eve-of-test',
-    'eve-of-wembley',
-    'eve-teasers',
-    'eve-teasing',
-    'eve.r',
-    'eve/sat',
-    'eveleen',
-    'eveling',
-    'eveling/inland',
     'even&mdash;perhaps',
-    'even&ndash',
-    'even-',
-    'even-better',
-    'even-bigger-than-expected',
-    'even-god',
-    'even-length',
-    'even-matched',
-    'even-more',
-    'even-par',
-    'even-stevens',
-    'even-temper',
-    'even-textured',
-    'even-topped',
-    'even.',
-    'even.swindon',
     'even_,_even_so',
-    'even_as',
-    'even_even_though',
-    'evened-off',
-    'evenereal',
-    'eveneutally',
-    'evenfall',
-    'evenhandedly',
-    'eveni',
-    'evenin',
-    'evening&mdash',
-    'evening&mdash;that',
-    'evening&ndash;only',
-    'evening-class',
-    'evening-coated',
-    'evening-gowns',
     'evening-long',
-    'evening-paper',
-    'evening-star',
-    'evening-time',
-    'evening/',
-    'evening/25/10/93/cde',
-    'evening/parents',
-    'evenings.',
-    'evenings/coffee',
-    'evenings/consultations',
-    'evenings/interviews',
-    'evenish',
-    'evenley',
-    'evenly-based',
-    'evenly-divided',
-    'evenly-shaped',
     'evenmtually',
-    'evenness_in_terms',
-    'evenson',
-    'evensongs',
-    'event&mdash;public',
-    'event(s)',
-    'event-drive',
-    'event-frequency',
-    'event-orders',
-    'event-oriented',
-    'event-patterns',
-    'event-tree',
-    'event-trees',
-    'event.joyce',
-    'event/idea/method',
-    'event/mini',
     'eventfulness',
-    'eventness',
-    'events-arranging',
-    'events-that',
-    'events.it',
-    'events/activities',
-    'events/crises',
-    'events/human',
-    'events/mosside',
-    'events/reports',
-    'events/states',
-    'events_sort',
-    'eventu',
-    'eventuations',
-    'evenweave',
-    'ever&mdash',
     'ever&ndash;thing',
-    'ever&rehy;expanding',
-    'ever&rehy;greater',
-    'ever&rehy;growing',
-    'ever&rehy;increasing',
-    'ever&rehy;lasting',
-    'ever&rehy;present',
-    'ever&rehy;rising',
-    'ever&rehy;weakening',
-    'ever&rehy;widening',
-    'ever\'',
-    'ever\'thing',
-    'ever-absorbing',
-    'ever-accommodating',
-    'ever-adaptable',
-    'ever-after',
     'ever-ambiguous',
-    'ever-anxious',
-    'ever-appeasing',
-    'ever-approachable',
-    'ever-beaming',
-    'ever-bearing',
-    'ever-beating',
-    'ever-beckoning',
-    'ever-benevolent',
-    'ever-bigger',
-    'ever-bored',
-    'ever-boyish',
-    'ever-branching',
-    'ever-brighter',
-    'ever-bulging',
-    'ever-buoyant',
     'ever-burgeoning',
-    'ever-caring',
-    'ever-circulating',
-    'ever-comforting',
-    'ever-consistent',
-    'ever-cordial',
-    'ever-crackling',
-    'ever-creative',
-    'ever-crowded',
-    'ever-cynical',
-    'ever-dangerous',
-    'ever-dapper',
-    'ever-decorative',
-    'ever-deeper',
-    'ever-desperate',
-    'ever-disappearing',
     'ever-divorcing',
-    'ever-drawing-near',
-    'ever-earlier',
-    'ever-earnest',
-    'ever-ebullient',
-    'ever-elusive',
-    'ever-enterprising',
-    'ever-escaping',
-    'ever-evolving',
-    'ever-exes',
-    'ever-facetious',
-    'ever-familiar',
-    'ever-fancier',
-    'ever-faster',
-    'ever-feckless',
-    'ever-fewer',
     'ever-flickering',
-    'ever-fluctuating',
-    'ever-formidable',
-    'ever-fresh',
-    'ever-greens',
-    'ever-hardening',
-    'ever-hidden',
-    'ever-historical',
-    'ever-hospitable',
-    'ever-humble',
-    'ever-hungry',
-    'ever-imminent',
-    'ever-important',
-    'ever-improved',
-    'ever-incisive',
-    'ever-increased',
     'ever-increasingly',
-    'ever-industrious',
-    'ever-inquisitive',
-    'ever-intensifying',
-    'ever-inventive',
-    'ever-labelled',
-    'ever-lasting',
-    'ever-later',
-    'ever-loosening',
-    'ever-loudening',
-    'ever-louder',
-    'ever-lurking',
-    'ever-married',
-    'ever-mated',
-    'ever-more-irrational',
-    'ever-more-populous',
     'ever-more-shadowy',
-    'ever-nervous',
-    'ever-observant',
-    'ever-persistent',
-    'ever-pleasant',
-    'ever-precarious',
-    'ever-presents',
-    'ever-protective',
-    'ever-prudent',
-    'ever-publicity-conscious',
-    'ever-puzzling',
-    'ever-rancorous',
-    'ever-relevant',
-    'ever-reluctant',
-    'ever-renewed',
-    'ever-renewing',
     'ever-repeated',
-    'ever-repeating',
-    'ever-resounding',
-    'ever-responsive',
-    'ever-restless',
-    'ever-returning',
-    'ever-righteous',
-    'ever-rolling',
-    'ever-rotting',
-    'ever-ruling',
-    'ever-rumbling',
-    'ever-scarcer',
-    'ever-scrolling',
-    'ever-shaded',
-    'ever-shaping',
-    'ever-sharp',
     'ever-shrinking',
-    'ever-shut',
-    'ever-silver',
-    'ever-so&rehy;slightly',
-    'ever-so-desperate',
-    'ever-so-diplomatic',
-    'ever-so-english',
-    'ever-so-ever-so',
-    'ever-so-hot',
-    'ever-so-proper',
-    'ever-so-respectable',
-    'ever-so-slowly',
-    'ever-so-sorry',
-    'ever-so-thin',
-    'ever-spellbinding',
-    'ever-steeper',
     'ever-stricter',
-    'ever-stronger',
-    'ever-sulky',
-    'ever-swifter',
-    'ever-thinning',
-    'ever-threatening',
-    'ever-tougher',
-    'ever-true',
-    'ever-unravelling',
-    'ever-unstable',
-    'ever-vengeful',
-    'ever-wagging',
-    'ever-waiting',
-    'ever-wasting',
-    'ever-weakening',
-    'ever-welcome',
     'ever-westward',
-    'ever-young',
-    'ever-younger',
-    'ever.',
-    'ever_since',
-    'everaert',
-    'everaet',
-    'everbaddy',
-    'everbest',
-    'everclene',
-    'evercourt',
-    'evercreech',
-    'everdenes',
-    'everdeveloping',
-    'everding',
-    'evered',
     'evererst',
-    'everestine',
-    'everett-green',
-    'everett/eyewitness',
-    'everette',
-    'everetts',
-    'everexes',
-    'evergates',
-    'everglade',
-    'everglum',
-    'evergold',
-    'evergood',
-    'evergreen&lsqb;heart-throb',
-    'evergreen-forest-dweller',
-    'evergrowing',
-    'everhart',
     'evering',
-    'everit/thames',
-    'everitt/milton',
-    'everland',
-    'everlast',
-    'everlastin',
-    'everlastings',
-    'everlasts',
-    'everlaure',
-    'everlook',
-    'everlord',
-    'evermair',
-    'evermare',
-    'evernia',
-    'everpopular',
-    'everqueens',
     'eversharp',
-    'eversheds',
-    'eversholt',
-    'eversible',
-    'everson/competitor',
-    'everson/neighbour',
-    'eversons',
-    'everthorpe/humberside',
-    'evertidy',
-    'everton-liverpool',
-    'evertrin',
-    'everwhere',
-    'every&rehy;day',
-    'every\'',
-    'every-',
-    'every-changing',
     'every-disappearing',
-    'every-night-something-awful',
-    'every-other-day',
-    'every-ready',
-    'every-second',
-    'every-so-often',
-    'every-this-and-thatspins',
-    'every-where',
-    'every.convent',
-    'everybod',
-    'everybodies',
-    'everybody.i',
-    'everybodys',
-    'everydamnwhere',
-    'everyday-the',
-    'everyday/ed',
     'everydayness',
-    'everyf***ing',
-    'everyf*ckinwhere',
-    'everyfink',
-    'everynerd',
-    'everyone&mdash;reformers',
-    'everyone-but',
-    'everyone-for-himself',
-    'everyone.even',
-    'everyth',
-    'everyth&mdash',
-    'everything\'-tried',
-    'everything-but',
-    'everything-mini-weapons',
-    'everything-not',
-    'everything-on-demand',
     'everything-proof',
-    'everything-under-the',
-    'everythings',
-    'everythink',
-    'everytown',
-    'everyw',
-    'everyway',
-    'everywh',
-    'everywhe',
-    'everywhere&mdash',
-    'everywhere-like',
-    'everywhere.rather',
-    'everywhereabouts',
-    'everywun',
-    'evesdon',
-    'evette',
     'evetually',
-    'evey',
-    'evf',
-    'evga',
-    'evgeniya',
-    'evgenny',
-    'evgraf',
-    'evh5150',
-    'evichstar',
-    'evid',
-    'evidence\'',
-    'evidence-conclusion',
-    'evidence-i',
-    'evidence-taking',
-    'evidence.a',
-    'evidence/rationale',
     'evidence/with',
-    'evidenced.',
-    'evidencve',
-    'evident_in',
-    'evidential/security',
-    'eview',
-    'evig',
-    'evil&rehy;looking',
-    'evil-a',
-    'evil-doer',
-    'evil-omened',
-    'evil-speaking',
-    'evil-tasting',
-    'evil-wagging',
-    'evil/sin',
-    'evil/suffering',
     'evil/tempteth',
-    'evildoer',
-    'evill',
-    'evilness',
-    'evily',
-    'evinos',
-    'evinson',
-    'evironmental',
-    'evis',
-    'eviscerating',
-    'evison/west',
-    'evizzo',
-    'evn',
-    'evns',
-    'evnvironment',
-    'evo-stick',
     'evoc-ative',
-    'evocateur',
-    'evocatively-monikered',
-    'evocator',
-    'evoct',
-    'evodence',
-    'evoe',
-    'evoker',
-    'evokes.7sup9',
-    'evol',
-    'evolu&rehy;tion',
-    'evolution\'',
-    'evolution-plus-natural-selection',
-    'evolution.',
-    'evolutionarily-induced',
-    'evolutions.',
     'evonana',
-    'evonne',
-    'evp/pev&mdash;evangelical',
-    'evpatoriia',
-    'evps',
-    'evr',
-    'evrard',
-    'evremonde',
-    'evron',
-    'evrugo',
-    'evryone',
-    'evteev',
-    'evvahh',
-    'evysdon',
-    'ew/c473',
-    'ewangai',
     'eward/girlfriend',
-    'ewardian',
-    'ewarti',
-    'ewaryst',
-    'ewcba',
-    'ewe\'s-milk',
-    'ewe-grief',
-    'ewe-mutton',
-    'ewe/ram',
-    'ewebank',
-    'eweleaze',
-    'ewenny',
-    'eweretta',
-    'ewes/man',
-    'ewesdale',
-    'eweweb',
     'ewige',
-    'ewigen',
-    'ewing/mccracken',
-    'ewingi',
-    'ewingswode',
-    'ewmergency',
-    'ewoks',
-    'ewoldt',
-    'eworp',
-    'ewottes',
-    'ewp',
-    'ews-4800',
-    'ews4800/380',
-    'ewsm',
-    'ex&eacute;cutants',
-    'ex&eacute;cuteur',
     'ex&ndash;directory',
-    'ex&ndash;lt',
-    'ex&rehy',
-    'ex&rehy;absolutists',
-    'ex&rehy;academic',
-    'ex&rehy;army',
-    'ex&rehy;cons',
-    'ex&rehy;cused',
-    'ex&rehy;display',
-    'ex&rehy;ecutioner',
-    'ex&rehy;employees',
-    'ex&rehy;fakintil',
-    'ex&rehy;general',
-    'ex&rehy;green',
-    'ex&rehy;hubby',
-    'ex&rehy;husbands',
     'ex&rehy;indie',
-    'ex&rehy;liverpool',
-    'ex&rehy;marine',
-    'ex&rehy;member',
-    'ex&rehy;millfield',
-    'ex&rehy;partners',
-    'ex&rehy;perimenter',
-    'ex&rehy;public',
-    'ex&rehy;services',
-    'ex&rehy;swiss',
-    'ex&rehy;television',
-    'ex&rehy;traneous',
-    'ex&rehy;tremely',
-    'ex-253',
-    'ex-41',
-    'ex-53',
     'ex-54',
-    'ex-60',
-    'ex-85',
-    'ex-abbe',
-    'ex-abbot',
-    'ex-abbots',
-    'ex-actor',
-    'ex-ad-man',
-    'ex-addicts',
-    'ex-adverts',
-    'ex-aerobicists',
-    'ex-aeroflot',
-    'ex-aerospace',
-    'ex-afrika',
-    'ex-agent',
-    'ex-agents',
     'ex-airline',
-    'ex-airman',
-    'ex-aldershot',
-    'ex-alignment',
-    'ex-alliance',
-    'ex-althorp',
-    'ex-amateur',
-    'ex-ambulance',
-    'ex-aminers',
-    'ex-angelic',
-    'ex-anthropologist',
-    'ex-appanage',
-    'ex-apprentices',
-    'ex-archbishop',
-    'ex-armed',
-    'ex-arse',
     'ex-arsenal',
-    'ex-artilleryman',
-    'ex-arts',
-    'ex-assistant',
-    'ex-austrian',
-    'ex-b.r',
-    'ex-b.r.',
-    'ex-ballerina',
-    'ex-ballet',
-    'ex-ballyclare',
-    'ex-band',
-    'ex-barclays',
-    'ex-barmaid',
-    'ex-barnardo',
-    'ex-barracuda',
-    'ex-barrister',
     'ex-barrow',
-    'ex-barry',
-    'ex-bbc',
-    'ex-beach',
-    'ex-beatnik',
-    'ex-between',
-    'ex-bevanite',
-    'ex-bexley',
-    'ex-bf',
-    'ex-biology',
-    'ex-bisu',
-    'ex-bkr',
-    'ex-black',
-    'ex-blues',
-    'ex-bna',
-    'ex-board',
     'ex-boarding',
-    'ex-bobby',
-    'ex-bodyguard',
-    'ex-bog-trotter',
-    'ex-bomber',
-    'ex-bond',
-    'ex-boomtown',
-    'ex-border',
-    'ex-borstal',
-    'ex-bosnian',
-    'ex-brake-end',
-    'ex-brats',
-    'ex-bread',
-    'ex-bricklayers',
-    'ex-brigadiers',
-    'ex-bristol',
     'ex-brm',
-    'ex-broadway',
-    'ex-brookside',
-    'ex-bros',
-    'ex-bt',
-    'ex-buf',
-    'ex-buick',
-    'ex-bunny',
-    'ex-bureaucrat',
-    'ex-bus',
-    'ex-business',
-    'ex-butcher',
-    'ex-california',
-    'ex-californian',
-    'ex-callie',
-    'ex-cambrian/great',
     'ex-captains',
-    'ex-carlos',
-    'ex-catholics',
-    'ex-cavalry',
-    'ex-cellent',
-    'ex-celt',
-    'ex-central',
-    'ex-cents',
-    'ex-ceo',
-    'ex-ch',
-    'ex-chair',
-    'ex-challenge',
-    'ex-chancellors',
-    'ex-changed',
-    'ex-channel',
-    'ex-charlton',
     'ex-chaser',
-    'ex-chasers',
-    'ex-chauvinist',
-    'ex-chiddingfold',
-    'ex-child',
-    'ex-chrome',
-    'ex-cid',
-    'ex-citadel',
-    'ex-clash',
-    'ex-class',
-    'ex-classicists',
-    'ex-clergyman',
-    'ex-clerks',
-    'ex-cliftonville',
-    'ex-club',
-    'ex-clubmate',
     'ex-coal-miner',
-    'ex-colchester',
-    'ex-college',
-    'ex-colonels',
-    'ex-colonists',
-    'ex-colorado',
-    'ex-colourfieldman',
-    'ex-commander',
-    'ex-commando',
-    'ex-commandos',
-    'ex-commodity',
-    'ex-commons',
-    'ex-commonwealth',
-    'ex-communicate',
-    'ex-communications',
-    'ex-commuter',
     'ex-comptroller',
-    'ex-conduits',
-    'ex-conscripts',
-    'ex-constable',
-    'ex-constables',
-    'ex-consul',
-    'ex-convener',
-    'ex-convent',
-    'ex-cooperative',
-    'ex-coopers',
-    'ex-cornard',
-    'ex-coronation',
-    'ex-correspondent',
-    'ex-cossack',
-    'ex-council',
-    'ex-councillors',
     'ex-country',
-    'ex-course',
-    'ex-coven',
-    'ex-cox\'n',
-    'ex-coxswain',
-    'ex-cpr',
-    'ex-cpsu',
-    'ex-crash',
-    'ex-crewmen',
-    'ex-croatian',
-    'ex-cska',
-    'ex-cumbrian',
-    'ex-curriculum',
-    'ex-customs',
-    'ex-daily',
-    'ex-dancers',
     'ex-darlington',
-    'ex-davis',
-    'ex-dealers',
-    'ex-dean',
-    'ex-decies',
-    'ex-decorator',
-    'ex-defence',
-    'ex-demagogue',
-    'ex-demo',
-    'ex-dentist',
-    'ex-derby',
-    'ex-detainee',
-    'ex-dictator',
-    'ex-dictators',
-    'ex-dinosaur',
-    'ex-docker',
     'ex-dominions',
-    'ex-dowty',
-    'ex-dr',
-    'ex-dragons',
-    'ex-drexel',
-    'ex-driver',
-    'ex-drummer',
-    'ex-duce',
-    'ex-duchesses',
-    'ex-dundee',
-    'ex-dungannon',
-    'ex-dustman',
-    'ex-eagle',
-    'ex-eastenders',
-    'ex-easterners',
-    'ex-ecml',
     'ex-educationists',
-    'ex-ellesmere',
-    'ex-employers',
-    'ex-engine-driver',
-    'ex-episcopal',
-    'ex-equitation',
-    'ex-erm',
-    'ex-eton',
-    'ex-european',
-    'ex-eurythmic',
-    'ex-eurythmics',
-    'ex-everything',
-    'ex-ex',
-    'ex-examiners',
-    'ex-exhibition',
-    'ex-face',
     'ex-fakoum',
-    'ex-fall',
-    'ex-farmer',
-    'ex-farmhand',
-    'ex-father-in-law',
-    'ex-fbi',
-    'ex-featherweight',
-    'ex-felon',
-    'ex-fibres',
-    'ex-fighters',
-    'ex-finance',
-    'ex-financial',
-    'ex-fini',
-    'ex-first',
-    'ex-fleadh',
-    'ex-fleet',
     'ex-fleetwood',
-    'ex-florence',
-    'ex-football',
-    'ex-foreign',
-    'ex-founder',
-    'ex-foundry',
-    'ex-fourth-division',
-    'ex-fractured',
-    'ex-freddie',
-    'ex-front',
-    'ex-full-time',
-    'ex-furniture',
-    'ex-fyt',
-    'ex-gang',
-    'ex-gardener',
-    'ex-gartner',
     'ex-gary',
-    'ex-gc',
-    'ex-gec',
-    'ex-geoffrey',
-    'ex-gestapo',
-    'ex-gi',
-    'ex-git',
-    'ex-glc',
-    'ex-gn',
-    'ex-gorbalite',
-    'ex-grand',
-    'ex-greece',
-    'ex-greek',
-    'ex-grocery',
-    'ex-guardsman',
-    'ex-guerrilla',
     'ex-guggenheim',
-    'ex-guides',
-    'ex-guitar',
-    'ex-gunman',
-    'ex-gunner',
-    'ex-guns',
-    'ex-gurkha',
-    'ex-gw',
-    'ex-hackers',
-    'ex-halifax',
-    'ex-hall',
-    'ex-hamble',
-    'ex-hammer',
-    'ex-hangman',
-    'ex-harlem-globetrotter',
-    'ex-hatred',
     'ex-haymarket',
-    'ex-headhunter',
-    'ex-headman',
-    'ex-heads',
-    'ex-health',
-    'ex-heathrow',
-    'ex-hell',
-    'ex-heritage',
-    'ex-herrmann',
-    'ex-hired',
-    'ex-hms',
-    'ex-hobo',
-    'ex-hockey',
-    'ex-hollywood',
-    'ex-horseman',
-    'ex-hospital',
     'ex-host',
-    'ex-hotfoot',
-    'ex-housekeeper',
-    'ex-housemartin',
-    'ex-hurler',
-    'ex-hustu',
-    'ex-ibf',
-    'ex-ici',
-    'ex-imperial',
-    'ex-in-laws',
-    'ex-industrial',
-    'ex-industry',
-    'ex-inmate',
-    'ex-insider',
-    'ex-inspector',
-    'ex-inter-city',
     'ex-internees',
-    'ex-invalid',
-    'ex-issue',
-    'ex-it',
-    'ex-italian',
-    'ex-james',
-    'ex-jehovah',
-    'ex-jesuit',
-    'ex-jimi',
-    'ex-jimmie',
-    'ex-job',
-    'ex-jock',
-    'ex-john',
-    'ex-journalist',
-    'ex-journo',
-    'ex-judo',
     'ex-junior',
-    'ex-junkie',
-    'ex-junkies',
-    'ex-kadi',
-    'ex-kalamazoo',
-    'ex-kennel',
-    'ex-kent',
-    'ex-kgb',
-    'ex-kings',
-    'ex-kinlochewe',
-    'ex-kitchen',
-    'ex-klansman',
-    'ex-knob',
-    'ex-l',
-    'ex-l.g.o.c',
-    'ex-l.n.w.r.',
     'ex-la',
-    'ex-lady',
-    'ex-lancashire',
-    'ex-land',
-    'ex-landlord',
-    'ex-law',
-    'ex-lead',
-    'ex-leadership',
-    'ex-leaguers',
-    'ex-legal',
-    'ex-legionnaire',
-    'ex-lemon',
-    'ex-light',
-    'ex-linfield',
-    'ex-lmr',
-    'ex-loan',
     'ex-local',
-    'ex-long',
-    'ex-loop-ers',
-    'ex-lorry',
-    'ex-lotus',
-    'ex-loves',
-    'ex-lyricist',
-    'ex-m',
-    'ex-m.n',
-    'ex-machinery',
-    'ex-machinists',
-    'ex-magazine',
-    'ex-maiden',
-    'ex-major',
-    'ex-makin\'',
-    'ex-man',
     'ex-management',
-    'ex-mandarin',
-    'ex-manorian',
-    'ex-maoist',
-    'ex-mariners',
-    'ex-marines',
-    'ex-marxian',
-    'ex-marxist',
-    'ex-mason',
-    'ex-master',
-    'ex-masters',
-    'ex-max',
-    'ex-mayoress',
-    'ex-mcc',
-    'ex-mccarthyite',
-    'ex-mental',
     'ex-mental-hospital',
-    'ex-mercenary',
-    'ex-mi5',
-    'ex-michael',
-    'ex-middlesex',
-    'ex-midfield',
-    'ex-milkshake',
-    'ex-mill',
-    'ex-million',
-    'ex-minicabs',
-    'ex-mining',
-    'ex-ministry',
-    'ex-mistresses',
-    'ex-models',
-    'ex-monarchists',
-    'ex-moreau',
     'ex-moroccan',
-    'ex-mossad',
-    'ex-mother',
-    'ex-motley',
-    'ex-motor',
-    'ex-motorcycle',
-    'ex-movie',
-    'ex-n.c.o.',
-    'ex-n.e.a.',
-    'ex-napalm',
-    'ex-ncb',
-    'ex-ncc',
-    'ex-ncos',
-    'ex-neighbours',
-    'ex-ner',
-    'ex-networking',
     'ex-new',
-    'ex-newmarket',
-    'ex-newport',
-    'ex-news',
-    'ex-next',
-    'ex-next-door-but-one',
-    'ex-niall',
-    'ex-nick',
-    'ex-nir',
-    'ex-nme',
-    'ex-nonconformists',
-    'ex-nottingham',
-    'ex-nuffield',
-    'ex-nurses',
-    'ex-nymph',
-    'ex-occupant',
     'ex-offender',
-    'ex-olympic',
-    'ex-op',
-    'ex-orient',
-    'ex-orrell',
-    'ex-ovalteenies',
-    'ex-oxbridge',
-    'ex-oxford',
-    'ex-p&amp;o',
-    'ex-paduan',
-    'ex-pakistani',
-    'ex-paramilitaries',
-    'ex-paras',
-    'ex-parents-in-law',
-    'ex-paris',
-    'ex-parte',
     'ex-partisan',
-    'ex-penpal',
-    'ex-permanent',
-    'ex-personal',
-    'ex-pest',
-    'ex-peterborough',
-    'ex-pharisee',
-    'ex-phd',
-    'ex-phil',
-    'ex-philosophy',
-    'ex-pil',
-    'ex-pilot',
-    'ex-pilot-boat',
-    'ex-pilots',
-    'ex-pistols',
-    'ex-playboy',
     'ex-plumbers',
-    'ex-pm',
-    'ex-poachers',
-    'ex-pogue',
-    'ex-political-prisoners',
-    'ex-politician',
-    'ex-politicians',
-    'ex-polys',
-    'ex-poms',
-    'ex-ponytail',
-    'ex-pool',
-    'ex-portadown',
-    'ex-portsmouth',
-    'ex-position',
-    'ex-postie',
-    'ex-pows',
     'ex-pram',
-    'ex-presenter',
-    'ex-presidential',
-    'ex-pressed',
-    'ex-preston',
-    'ex-prison',
-    'ex-private',
-    'ex-probationers',
-    'ex-professor',
-    'ex-prussian',
-    'ex-publisher',
-    'ex-punk',
-    'ex-puwp',
-    'ex-pw',
-    'ex-quality',
-    'ex-r.a.f',
     'ex-racehorse',
-    'ex-racehorses',
-    'ex-radio',
-    'ex-ranger',
-    'ex-ranker',
-    'ex-rated',
-    'ex-rcaf',
-    'ex-real',
-    'ex-rebels',
-    'ex-record',
-    'ex-reds',
-    'ex-redundant',
-    'ex-regimental',
-    'ex-registered',
-    'ex-renaissance',
-    'ex-reporter',
     'ex-revie',
-    'ex-revolutionaries',
-    'ex-revolutionary',
-    'ex-river',
-    'ex-roadsweepers',
-    'ex-rock-star',
-    'ex-rockers',
-    'ex-rover',
-    'ex-rpr',
-    'ex-rugger',
-    'ex-ruled',
-    'ex-rulers',
-    'ex-running',
-    'ex-russian',
-    'ex-sabbath',
-    'ex-sacw',
     'ex-safari',
-    'ex-sailor',
-    'ex-sailors',
-    'ex-sales',
-    'ex-salesman',
-    'ex-salesmen',
-    'ex-salt',
-    'ex-sand',
-    'ex-sandinistas',
-    'ex-sapper',
-    'ex-saru',
-    'ex-satanist',
-    'ex-satirist',
-    'ex-saxophone',
-    'ex-scanro',
-    'ex-schoolboy',
     'ex-schoolmate',
-    'ex-schoolmistress',
-    'ex-scientific',
-    'ex-sco',
-    'ex-scotland',
-    'ex-scots',
-    'ex-scribe',
-    'ex-sdp',
-    'ex-secretarial',
-    'ex-secretaries',
-    'ex-secretary-general',
-    'ex-secretary.',
-    'ex-sellsword',
-    'ex-seminarian',
-    'ex-separatist',
-    'ex-separatists',
     'ex-serf-owning',
-    'ex-serfs',
-    'ex-servant',
-    'ex-servicewomen',
-    'ex-servicvemen',
-    'ex-serving',
-    'ex-sex',
-    'ex-shadow',
-    'ex-sharedealer',
-    'ex-sheffield',
-    'ex-sheriff',
-    'ex-shipmates',
-    'ex-shipyard',
-    'ex-shooter',
-    'ex-shunter',
-    'ex-sidekick',
     'ex-sister-in-law',
-    'ex-skinhead',
-    'ex-sky',
-    'ex-smackheads',
-    'ex-snooker',
-    'ex-soccer',
-    'ex-socialists',
-    'ex-software',
-    'ex-solder',
-    'ex-solidarity',
-    'ex-somali',
-    'ex-somerset',
-    'ex-somocistas',
-    'ex-sons',
-    'ex-sony',
-    'ex-sounds',
     'ex-southampton',
-    'ex-southmet',
-    'ex-spanish',
-    'ex-spencer',
-    'ex-spies',
-    'ex-spoolers',
-    'ex-spouse.',
-    'ex-squeeze',
-    'ex-ss',
-    'ex-stalwart',
-    'ex-stalwarts',
-    'ex-stardent',
-    'ex-starz',
-    'ex-stasi',
-    'ex-state',
-    'ex-steelworker',
     'ex-steeplechase',
-    'ex-stockton',
-    'ex-strathallan',
-    'ex-submariners',
-    'ex-sugar',
-    'ex-suicide',
-    'ex-sun/ex-rational',
-    'ex-super',
-    'ex-sussex',
-    'ex-swansea',
-    'ex-swapo',
-    'ex-swindon',
-    'ex-switchboard',
-    'ex-t.a.',
-    'ex-talking',
-    'ex-taxi',
     'ex-team-mate',
-    'ex-technical',
-    'ex-teenage',
-    'ex-teenagers',
-    'ex-telescope',
-    'ex-templetonian',
-    'ex-tended',
-    'ex-tennis',
-    'ex-tesco',
-    'ex-theatre',
-    'ex-three',
-    'ex-thyssen',
-    'ex-tied-cottagers',
-    'ex-tommy',
-    'ex-trading',
-    'ex-trafalgar',
     'ex-train',
-    'ex-trainees',
-    'ex-transaction',
-    'ex-trigem',
-    'ex-trinity',
-    'ex-trotskyist',
-    'ex-trotskyists',
-    'ex-tsarist',
-    'ex-tunisian',
-    'ex-turtles',
-    'ex-tvh',
-    'ex-typist',
-    'ex-tyrrell',
-    'ex-u',
-    'ex-udc',
-    'ex-ulster',
     'ex-underground',
-    'ex-undertones',
-    'ex-united',
-    'ex-us',
-    'ex-usaf',
-    'ex-user',
-    'ex-valet',
-    'ex-veteran',
-    'ex-vicar',
-    'ex-vickers',
-    'ex-vietnam',
-    'ex-voto',
-    'ex-waaf',
-    'ex-waffen',
-    'ex-wage',
-    'ex-wailers',
     'ex-waitress',
-    'ex-walkers',
-    'ex-wall',
-    'ex-walthamstow',
-    'ex-warbler',
-    'ex-wardens',
-    'ex-warsaw',
-    'ex-wartime',
-    'ex-wbo',
-    'ex-wd',
-    'ex-west',
-    'ex-western',
-    'ex-what',
-    'ex-whip',
-    'ex-who',
-    'ex-witch',
     'ex-wivenhoe',
-    'ex-wives/lovers',
-    'ex-woodentop',
-    'ex-wor&rehy;kington',
-    'ex-workaholic',
-    'ex-workhouses',
-    'ex-workmate',
-    'ex-world-class',
-    'ex-worpswede',
-    'ex-wrestler',
-    'ex-wrexham',
-    'ex-xerox',
-    'ex-yugoslavs',
-    'ex.10',
-    'ex.12',
-    'ex.13',
     'ex.16',
-    'ex.1a',
-    'ex.2.1',
-    'ex.2b',
-    'ex.2c',
-    'ex.2d',
-    'ex.2e',
-    'ex.2f',
-    'ex.30',
-    'ex.3a',
-    'ex.3b',
-    'ex.3d',
-    'ex.3e',
-    'ex.4',
-    'ex.40',
-    'ex.4a',
     'ex.4b',
-    'ex.5a',
-    'ex.5b',
-    'ex.5c',
-    'ex.5d',
-    'ex.5e',
-    'ex.g',
-    'ex.p',
-    'ex.s',
-    'ex/100s',
-    'ex1',
-    'ex12',
-    'ex14',
-    'ex16',
-    'ex23',
-    'ex3',
     'ex370',
-    'ex370fmtr',
-    'ex38',
-    'ex39',
-    'ex5',
-    'ex=husband',
-    'ex_army',
-    'exa&rehy;mined',
-    'exacta',
-    'exactally',
-    'exactly-so',
-    'exactly_in_excess',
-    'exacty',
-    'exacyly',
-    'exaeretodon',
-    'exag&rehy;gerated',
     'exagamous',
-    'exagerrated',
-    'exaggera&rehy;tion',
-    'exaggerated.',
-    'exaggerates&mdash;and',
-    'exaggeratin\'',
-    'exaggeraton',
-    'exaggerator',
-    'exaggeratted',
-    'exahausted',
-    'exakly',
-    'exall',
-    'exalt&eacute',
-    'exaltations',
-    'exaltedness',
-    'exaltednesses',
     'exaltic',
-    'exam(s)',
-    'exam-aid',
-    'exam-bound',
-    'exam-entry',
-    'exam-orientated',
-    'exam-room',
-    'exam-taker',
-    'exame',
-    'examin&rehy;ing',
-    'examinability',
-    'examinant',
-    'examinatam',
-    'examinatio',
-    'examination&ndash',
-    'examination(s)',
     'examination-dominated',
-    'examination-oriented',
-    'examination-type',
-    'examination.in',
-    'examination/assessment',
-    'examination/test',
-    'examinations.at',
-    'examinations.e',
-    'examinations/',
-    'examinations/assessments',
-    'examinator',
-    'examine.',
-    'examine.request',
-    'examine/try',
-    'examined-in',
-    'examined.',
     'examing',
-    'examinied',
-    'examinin\'',
-    'examining-room',
-    'examins',
-    'example&mdash;all',
-    'example\'',
-    'example(s)',
-    'example-',
-    'example-always',
-    'example-is',
-    'example-than',
-    'example-where',
-    'example.',
-    'example.at',
-    'example.the',
     'example.to',
-    'example:understanding',
-    'examplified',
-    'examplify',
-    'exams/tests',
-    'exan',
-    'exander',
-    'exanples',
-    'exaplanations',
-    'exasasberate',
-    'exaskirts',
-    'exasparation',
-    'exasparatus',
-    'exatron',
-    'exaudi',
-    'exb-8500',
     'exboxer',
-    'exbury',
-    'exc-c-cuse',
-    'excaliber',
-    'excarnate',
-    'excavalryman',
-    'excavation-team',
-    'exce',
-    'exceat',
-    'excede',
-    'exceded',
-    'exceed2/h',
-    'exceed3',
-    'exceed3/h',
-    'exceed3/w-dai',
-    'exceed3/w-sim',
     'exceedence',
-    'exceedences',
-    'exceedes',
-    'excelcis',
-    'excelent',
-    'excelerator',
-    'excella',
-    'excellance',
-    'excellant',
-    'excellence\'',
-    'excellencie',
-    'excellent-four',
-    'excellent-maker-of-baskets',
-    'excells',
-    'excelsiors',
-    'excelso',
     'excentricity',
-    'excep\'',
-    'except-',
-    'except=only',
-    'excepte',
-    'exception-based',
-    'exceptional.',
-    'exceptional/extraordinary',
-    'exceptionally-strong',
-    'exceptyonall',
-    'excercises',
-    'excercising',
-    'excerpta',
-    'excerpting',
-    'excerption',
-    'excersise',
     'excess&times;time',
-    'excess(es)',
-    'excess/franchise',
-    'excessible',
-    'excessive\'',
-    'exchan',
-    'exchan&rehy;ges',
-    'exchang',
-    'exchange&mdash;see',
-    'exchange&rehy;control',
-    'exchange\'',
-    'exchange(s)',
-    'exchange-determined',
-    'exchange-free',
-    'exchange-listed',
-    'exchange-management',
     'exchange-rates',
-    'exchange-reverse',
-    'exchange-scheme',
-    'exchange-switches',
-    'exchange-traded',
-    'exchange-transfer',
-    'exchange.by',
-    'exchange/refund',
-    'exchanges.',
-    'exchangeways',
-    'exchequer-financed',
-    'exchequer-funded',
-    'exchequergate',
-    'excidia',
-    'excipients',
-    'excise&mdash;just',
     'excise-based',
-    'excisional',
-    'excit',
-    'excitants',
-    'excitation-emission',
-    'excitation/maintenance',
-    'exciteants',
-    'excited-looking',
-    'excited-nervous',
-    'excited-state',
-    'excitedly.',
-    'excitement-value',
-    'excitement.',
-    'excitement/deep',
-    'excitotoxic',
-    'exclaimed.',
     'exclaims.',
-    'exclamation-marked',
-    'exclamative',
-    'exclamatives',
-    'exclud&rehy;ing',
-    'excludability/non-excludability',
-    'excluded/rejected/',
-    'exclusion&mdash;if',
-    'exclusionism',
-    'exclusive\'',
-    'exclusive-',
-    'exclusive/shared',
-    'exclusivelyby',
-    'excluson',
-    'excommuni&rehy;cate',
-    'excommunication_as',
     'excoriations',
-    'excorporation',
-    'excperts',
-    'excrement-',
-    'excrement-ridden',
-    'excrementally',
-    'excrescent',
-    'excruciator',
-    'excruciators',
-    'excrusive',
-    'excrutiating',
-    'exculpates',
-    'excultavit',
-    'excurse',
-    'excurses',
-    'excursion-train',
     'excursions&mdash;things',
-    'excursions.',
-    'excusal',
-    'excusat',
-    'excusatory',
-    'excuse-a',
-    'excuse-me',
-    'excuse-seekers',
-    'excused/unavailable',
-    'excusez',
-    'excusingly',
-    'excusions',
-    'excution',
-    'excutive',
-    'excuuuuse',
-    'exdependants',
     'exea',
-    'exeat',
-    'exec/hotshot',
-    'execesses',
-    'exechotels',
-    'execllent',
-    'execpt',
-    'execra',
-    'execrabilis',
-    'execrating',
-    'execretary',
-    'exective',
-    'exectuive',
-    'execu',
-    'execucon',
-    'execuirire',
     'executante',
-    'executed.',
-    'executed_in',
-    'executi',
-    'executinor',
-    'execution-like',
-    'executioner-in-chief',
-    'executive\'',
-    'executive-dominated',
-    'executive-elect',
-    'executive-initiated',
-    'executive-led',
-    'executive-look',
-    'executive-manager',
-    'executive-produced',
-    'executive-producer',
     'executive-recruitment',
-    'executive-search',
-    'executive/client',
-    'executive/collector',
-    'executive/english',
-    'executive/legislative',
-    'executive/local',
-    'executive/malvern',
-    'executive/managing',
-    'executive/morland',
-    'executive/research',
-    'executives.',
-    'executiveships',
-    'executone',
-    'executorship.',
-    'exedrae',
     'exegete',
-    'exegetic',
-    'exegi',
-    'exel-edge',
-    'exemplarily',
-    'exemplificatory',
-    'exemplifiers',
-    'exemplory',
-    'exemplyfying',
-    'exempt\'',
-    'exemption.',
-    'exemptions_as',
-    'exemptionthis',
-    'exemynyde',
-    'exencephaly',
-    'exept',
     'exequatur',
-    'exer',
-    'exercise-bicycle',
-    'exercise-bike',
-    'exercise-books',
-    'exercise-doers',
-    'exercise-rings',
-    'exercise/activity',
-    'exercise/time',
-    'exercise/work',
-    'exerciser',
-    'exercisin\'',
-    'exercisng',
-    'exercycle',
-    'exerptum',
-    'exersept',
     'exersions',
-    'exersise',
-    'exertional',
-    'exertise',
-    'exessses',
-    'exf3',
-    'exfoliants',
-    'exford',
-    'exh',
-    'exhall',
-    'exhanged',
-    'exhausation',
-    'exhaust-belching',
-    'exhaust-heated',
-    'exhaust-mounted',
-    'exhaust-pipe',
     'exhaust-tainted',
-    'exhausted.',
-    'exhaustion.',
-    'exhaustions',
-    'exhaustively.',
-    'exhaustless',
-    'exhi',
-    'exhib',
-    'exhibitd',
-    'exhibition-going',
-    'exhibition-the',
-    'exhibition-train',
-    'exhibition.',
-    'exhibition/public',
-    'exhibition/sales',
-    'exhibitions.',
     'exhibitions/graphics',
-    'exhibtion',
-    'exhil&rehy;arated',
-    'exhilarates',
-    'exhileration',
-    'exhiliration',
-    'exhorbitant',
-    'exhortacion',
-    'exhortative',
-    'exhortion',
-    'exhuberance',
-    'exhurst',
-    'exi',
-    'exierunt',
-    'exigence',
-    'exigently',
     'exigez',
-    'exilius',
-    'exima',
-    'eximia',
-    'eximious',
-    'exis&rehy;tences',
-    'exised',
-    'exisited',
-    'exist(s)',
-    'existe',
-    'existence-',
-    'existence-for',
-    'existence-through',
-    'existence-to',
-    'existence/just',
-    'existences.',
     'existenceuntil',
-    'existenceworthiness',
-    'existin\'',
-    'existing\'',
-    'existing/proposed',
-    'exists_according',
-    'exists_at',
-    'exit&num',
-    'exit-consultancy',
-    'exit-entrance',
-    'exit-poll',
-    'exit-ramp',
-    'exitless',
-    'exivi',
-    'exj',
-    'exlog',
     'exmonsworthy',
-    'exmore',
-    'exo-narthex',
-    'exobiological',
-    'exocet-armed',
-    'exocet-like',
-    'exodus-deuteronomy',
-    'exoduses',
-    'exoenzyme',
-    'exon-specific',
-    'exoner',
-    'exoners',
-    'exonia',
-    'exonucleases',
-    'exonucleolytic',
-    'exophoric',
     'exophthalmos',
-    'exopterygota',
-    'exopterygote',
-    'exopthalmia',
-    'exorbitante',
-    'exorcises',
-    'exorcismorum',
-    'exorcistic',
-    'exorcizo',
-    'exors',
-    'exostoses',
-    'exostrakizo',
-    'exoteric',
-    'exotheca',
-    'exothyethane',
-    'exotic-eyed',
     'exotically-named',
-    'exoticizing',
-    'exotick',
-    'exotox',
-    'exotropic',
-    'exp&eacute;dito',
-    'exp&formula',
-    'exp&lsqb;erienced',
-    'exp-erlosion',
-    'expamet',
-    'expan',
-    'expan&rehy;sionism',
-    'expand/contract',
-    'expand/develop/change',
-    'expanded-mind',
-    'expanded.',
     'expands-if',
-    'expans&rehy;ions',
-    'expansa',
-    'expansing',
-    'expansion-minded',
-    'expansion/the',
-    'expansion/vent',
-    'expansionable',
-    'expansionist-sounding',
-    'expansive-toned',
-    'expansivities',
-    'expartner',
-    'expatiating',
-    'expatriated',
-    'expatriots',
-    'expawnbrokers',
     'expec',
-    'expecations',
-    'expecked',
-    'expect\'',
-    'expecta',
-    'expectance',
-    'expectancy/valence',
-    'expectancy:66',
-    'expectatins',
-    'expectation\'',
-    'expectation-as',
-    'expected&mdash;that',
-    'expectedness',
-    'expecting-as',
-    'expecting_an_awful',
-    'expections',
     'expectorant',
-    'expectred',
-    'expecxt',
-    'expedicio',
-    'expedicione',
-    'expedient.',
-    'expediential',
-    'expediters',
-    'expeditio',
-    'expedition.',
-    'expedition.in',
-    'expedition/fleeing',
-    'expedition/rescue',
-    'expedition30',
-    'expeditioning',
-    'expeditor',
     'expeditors',
-    'expeditously',
-    'expeds',
-    'expeeting',
-    'expel-air',
-    'expellations',
-    'expendable.',
-    'expenditre',
-    'expenditure-control',
-    'expenditure-cutting',
-    'expenditure-related',
-    'expenditure-restriction',
-    'expenditure-type',
-    'expenditure/gdp',
-    'expenditure/national',
-    'expenditure1,747',
     'expenim',
-    'expensa',
-    'expense&mdash;was',
-    'expense-account-friendly',
-    'expenses/excess',
-    'expensive-sounding',
-    'expensive-to-patrol',
-    'expensive-to-repair',
-    'expensive-to-supply',
-    'expensive-toy',
-    'expensive.incremental',
-    'expensive/cheapo',
-    'expensive:report',
-    'expensively-acquired',
-    'expensively-dressed',
-    'expensively-equipped',
     'expensively-priced',
-    'expensively-produced',
-    'expensiveness',
-    'experean',
-    'experi&rehy;mental',
-    'expericence',
-    'experiementation',
-    'experiements',
-    'experience\'',
-    'experience(s)',
-    'experience-',
-    'experience-centred',
-    'experience-exchange',
-    'experience-independent',
-    'experience-is',
-    'experience-rated',
     'experience-related',
-    'experience.',
-    'experience/administrative',
-    'experience/advice',
-    'experience/resources',
-    'experienced\'',
-    'experienced-based',
-    'experienced/inexperienced',
-    'experiences.but',
-    'experientation',
-    'experientia',
-    'experientially-based',
-    'experimen&rehy;tation',
-    'experiment&rehy;to',
-    'experiment\'',
-    'experiment-based',
     'experiment-the',
-    'experiment/try',
-    'experiment_in',
-    'experimentaci&oacute;n',
-    'experimental\'',
-    'experimental-control',
-    'experimentall',
-    'experimentally-derived',
-    'experimentally-minded',
-    'experimentally.',
-    'experimentation/disguise',
-    'experimentations',
-    'experimentellen',
-    'experimenter-behind',
-    'experimenter-in-front',
-    'experiments-the',
     'experiments.1',
-    'experiments1',
-    'expersoft',
-    'expert\'',
-    'expert/novice',
-    'experta',
-    'experting',
-    'expertise\'',
-    'expertise/ability',
-    'expertise_such',
-    'experts--have',
-    'experts-swapping',
-    'experts-training',
-    'experts/scientists',
-    'expession',
-    'expiating',
     'expir',
-    'expire&mdash;and',
-    'expired.',
-    'explain&mdash;i',
-    'explain-',
-    'explain-ail',
-    'explaination',
-    'explained\'',
-    'explainer',
-    'explainin\'',
-    'explaining-understanding',
-    'explains.',
-    'explanagion',
-    'explananda',
-    'explanandum',
-    'explanans',
     'explanary',
-    'explanation.',
-    'explanationfor',
-    'explanatoriness',
-    'explanatory-normative',
-    'explantation',
-    'explanting',
-    'expletively',
-    'explicability',
-    'explicandum',
-    'explicatory',
-    'explicit-far',
-    'explicit.4',
-    'explicitly-stated',
-    'explicitly.',
-    'explicitly/dismissively',
     'explicity',
-    'expliqu&eacute',
-    'expliquer',
-    'expliquez-vous',
-    'exploded.the',
-    'exploder',
-    'exploders',
-    'explodings',
-    'explods',
-    'exploer',
-    'exploit-ation',
-    'exploitativeness',
-    'explorable',
-    'exploration.',
-    'exploration/elevation',
-    'exploration/emotional',
     'exploration/exploitation',
-    'explorationist',
-    'explorationists',
-    'exploratively',
-    'exploratorily',
-    'explore_in',
-    'explored_in',
-    'explorer-naturalist',
-    'explorer.however',
-    'exploring/enquiring',
-    'explosion\'',
-    'explosion-clouds',
-    'explosion-the',
-    'explosions.',
-    'explosive-related',
-    'explosive-tipped',
     'exployees',
-    'explusion',
-    'expo-92',
-    'expocenter',
-    'expoconsul',
-    'expoconsult',
-    'expoitation',
-    'expolosion',
-    'exponants',
-    'exponence',
-    'exponent/transition',
-    'exponentiated',
-    'exponentiation',
-    'export\'',
-    'export-credit',
-    'export-dependent',
     'export-drive',
-    'export-driven',
-    'export-inclined',
-    'export-industry',
-    'export-only',
-    'export-stopped',
-    'export-trade',
-    'export/importation',
-    'exportability',
-    'exporter\'',
-    'exporter/importer',
-    'exporting-only',
-    'exports.',
-    'exports.30',
-    'exports_such',
-    'exposarium',
     'expose/their',
-    'exposed-aggregate',
-    'exposed-coast',
-    'exposed/that',
-    'exposee',
-    'exposer',
-    'exposiciones',
-    'expositio',
-    'expositional',
-    'expositionis',
-    'exposure-based',
-    'exposure-conditioning',
-    'exposure-test',
-    'expozoo',
-    'expreienced',
-    'expreiments',
     'expres',
-    'expres&rehy;sions',
-    'expresi&oacute;n',
-    'express-geared',
-    'express-train',
-    'express-way',
-    'express/',
-    'express/fears',
-    'expressd',
-    'expresse&lsqb;d&rsqb',
-    'expresser',
-    'expressesd',
-    'expressing.',
-    'expression-marks',
-    'expression.',
-    'expression/variable',
     'expressional',
-    'expressionist/surrealist',
-    'expressionof',
-    'expressivism',
-    'expressivist',
-    'expressivity',
-    'expressivo',
-    'expressline',
-    'expressors',
-    'expresssed',
-    'expresssion',
-    'exprix',
-    'expropriable',
-    'expropriator',
-    'exps.',
-    'expsore',
     'expsrh',
-    'expsrl',
-    'expulsionism',
-    'expulsions&mdash;the',
-    'exqueeze-me',
-    'exquence',
-    'exquisile',
-    'exquisite-looking',
-    'exquisitely-sculpted',
-    'exquisitely-stylised',
-    'exquisitely-tailored',
-    'exquisitus',
-    'exquota',
-    'exqusite',
-    'exrcretions',
-    'exresident',
     'exretion',
-    'exrn',
-    'exrnr',
-    'exs',
-    'exsaguination',
-    'exsanguinating',
-    'exsanguine',
-    'exsanguinised',
-    'exsculptus',
-    'exsected',
-    'exsheath',
-    'exsheathing',
-    'exsheaths',
-    'exsmoker',
-    'exsmokers',
-    'exspect',
     'exspectans',
-    'exspectavi',
-    'exst',
-    'exstatic',
-    'exstudents',
-    'exsultate',
-    'ext&eacute;rieure',
-    'ext.3826',
-    'ext2500',
-    'exta',
-    'extabe',
-    'extactly',
-    'extacy',
-    'extasy',
-    'exte',
-    'extech',
     'extel-ranked',
-    'exteme',
-    'extemely',
-    'extemporaneous',
-    'extemporaneously',
-    'extemporare',
-    'extemporising',
-    'extemporization',
-    'extemporizations',
-    'extemporize',
-    'extemporized',
-    'extemporizer',
-    'extemporizing',
-    'exten',
-    'exten&rehy;sively',
-    'exten-sive',
     'extenbhich',
-    'extend/retract',
-    'extendability',
-    'extended&ndash;range',
-    'extended-caption',
-    'extended-edge',
-    'extended-family',
-    'extended-range',
-    'extended/upgraded',
-    'extending.',
-    'extensa',
-    'extense',
-    'extensified',
-    'extensifying',
-    'extension-line',
-    'extension-of-sentiments',
     'extension.4',
-    'extensionally',
-    'extensive/limited',
-    'extensive:mdash',
-    'extensively-researched',
-    'extensively-travelled',
-    'extent\'',
-    'extent-by',
-    'extent-so',
-    'extenuated',
-    'extenuates',
-    'extenxded',
-    'extep',
-    'exterieure',
-    'exterior-grade',
-    'exteriorisation',
     'exteriorise',
-    'exteriorizing',
-    'exterminators',
-    'exterminatos.s',
-    'exterminatum',
-    'exterminism',
-    'external\'',
-    'external-wall',
-    'external/situational',
-    'externalists',
-    'externality/utility',
-    'externalizing',
-    'externally-based',
-    'externally-controlled',
-    'externally-funded',
-    'externally-provided',
     'externally-refereed',
-    'externally-sourced',
-    'externally.',
-    'externsteine',
-    'externum',
-    'extin&rehy;guished',
-    'extinct.now',
-    'extinction.',
-    'extinguished.',
-    'extirpating',
-    'extoll',
-    'exton/',
-    'exton/playwright',
-    'extortion\'',
-    'extortion.',
-    'extortioner',
     'extortionist',
-    'extpected',
-    'extr',
-    'extr&ecirc;me',
-    'extra&mdash;curricular',
-    'extra&rehy;ordinary',
-    'extra&rehy;social',
-    'extra&rehy;strong',
-    'extra-abdominal',
-    'extra-absorbent',
-    'extra-added-indie-generic-overlay',
-    'extra-alimentary',
-    'extra-alpine',
-    'extra-alveolar',
-    'extra-and',
-    'extra-axial',
     'extra-bureaucratic',
-    'extra-calorie',
-    'extra-careful',
-    'extra-classical',
-    'extra-contract',
-    'extra-contractually',
-    'extra-controversial',
-    'extra-cost',
-    'extra-curricula',
-    'extra-denominational',
-    'extra-difficult',
-    'extra-dimensional',
-    'extra-dramatic',
-    'extra-dry',
-    'extra-duty',
-    'extra-efficient',
     'extra-fast',
-    'extra-fine',
-    'extra-full',
-    'extra-group',
-    'extra-hazardous',
-    'extra-healthy',
-    'extra-height',
-    'extra-himalayan',
-    'extra-hot',
-    'extra-household',
-    'extra-illustrated',
-    'extra-institutional',
-    'extra-intensive',
-    'extra-judiciares',
-    'extra-life',
-    'extra-liturgical',
     'extra-long-range',
-    'extra-metrical',
-    'extra-metropolitan',
-    'extra-motivated',
-    'extra-murally',
-    'extra-musical',
-    'extra-nasal',
-    'extra-office',
-    'extra-oral',
-    'extra-organizational',
-    'extra-performance',
-    'extra-phenomenal',
-    'extra-philosophical',
-    'extra-physical',
-    'extra-pictorial',
-    'extra-point',
     'extra-political',
-    'extra-proud',
-    'extra-realistic',
-    'extra-ripe',
-    'extra-school',
-    'extra-sensitive',
-    'extra-sensorily',
-    'extra-shapeless',
-    'extra-sharp',
-    'extra-smoochy',
-    'extra-social',
-    'extra-somatic',
-    'extra-spacious',
-    'extra-spiritual',
-    'extra-strength',
-    'extra-strict',
     'extra-sturdy',
-    'extra-supermassive',
-    'extra-talented',
-    'extra-thin',
-    'extra-tight',
-    'extra-tragic',
-    'extra-union',
-    'extra-vehement',
-    'extra-vigilant',
-    'extra-wide',
-    'extra-wise',
-    'extra-work',
-    'extra4',
-    'extrabiblical',
-    'extracardiac',
-    'extracellulary',
     'extract&rehy;ing',
-    'extractant',
-    'extracters',
-    'extractionist',
-    'extradictable',
-    'extraditable',
-    'extrafamilial',
-    'extrafilm',
-    'extragavance',
-    'extrahemispheric',
-    'extraintstinal',
-    'extraits',
-    'extramaritally',
-    'extramedullary',
-    'extramurally',
-    'extraneously',
     'extranjeros',
-    'extraoesophageal',
-    'extraor',
-    'extraordinario',
-    'extraordinarly',
-    'extraordinary-deep',
-    'extrap',
-    'extrapancreatic',
-    'extraparliamentary',
-    'extrapericardial',
-    'extraplanetary',
-    'extrapolative',
-    'extras.',
-    'extrasensitive',
-    'extrasensitivity',
-    'extraterrestial',
     'extrathyroidal',
-    'extravagance.',
-    'extravagences',
-    'extravagent',
-    'extravangant',
-    'extravasate',
-    'extraveganza',
-    'extraversion-introversion',
-    'extrazonal',
-    'extrelut',
-    'extrema',
-    'extremable',
-    'extremado',
-    'extreme\'',
-    'extreme-case',
-    'extreme-centre',
     'extreme-left',
-    'extreme-use',
-    'extreme-value',
-    'extremelly',
-    'extremely-dirty-white-coloured',
-    'extremenly',
-    'extremism.',
-    'extremists.',
-    'extremity.what',
-    'extremly',
-    'extrete',
-    'extricable',
-    'extricably',
-    'extrinsick',
-    'extrordinary',
-    'extrospection',
     'extrotic',
-    'extrovertedness',
-    'extrovertly',
-    'extrudable',
-    'extrusives',
-    'extynct',
-    'exuberants',
-    'exudr',
-    'exulceratio',
-    'exultancy',
-    'exultingly',
-    'exup&egrave;re',
-    'exupery',
-    'exustus',
-    'exuviae',
-    'exwaste',
     'exwba',
-    'exx.1-3',
-    'exx.1b',
-    'exxcluding',
-    'exxon-owned',
-    'eya',
-    'eyal',
-    'eyars',
-    'eyases',
-    'eybe',
-    'eybler',
-    'eyc',
-    'eydelie',
-    'eydenburk',
-    'eye&ndash;bleak',
-    'eye&rehy;brows',
     'eye&rehy;lashes',
-    'eye&rehy;lite',
-    'eye-achingly',
-    'eye-baggage',
-    'eye-balling',
-    'eye-beam',
-    'eye-blinking',
-    'eye-blinks',
-    'eye-blurring',
-    'eye-bolt',
-    'eye-brain',
-    'eye-brows',
-    'eye-burning',
-    'eye-but',
-    'eye-care',
-    'eye-catchers',
     'eye-catchingly',
-    'eye-cave',
-    'eye-charts',
-    'eye-closing',
-    'eye-closure',
-    'eye-concealing',
-    'eye-contouring',
-    'eye-corners',
-    'eye-crossing',
-    'eye-definer',
-    'eye-demanding',
-    'eye-dropper-bottle',
-    'eye-dropper-type',
-    'eye-filling',
-    'eye-flame',
-    'eye-flattering',
     'eye-gesture',
-    'eye-glasses',
-    'eye-guarded',
-    'eye-hand',
-    'eye-heavy',
-    'eye-hole',
-    'eye-irritating',
-    'eye-lid',
-    'eye-like',
-    'eye-line',
-    'eye-lotions',
-    'eye-make-up',
-    'eye-makeup',
-    'eye-mounted',
-    'eye-mucus',
-    'eye-openers',
     'eye-pad',
-    'eye-paint',
-    'eye-phones',
-    'eye-pleasing',
-    'eye-point',
-    'eye-poking',
-    'eye-pupil',
-    'eye-readable',
-    'eye-rim',
-    'eye-rims',
-    'eye-rings',
-    'eye-scan',
-    'eye-scorching',
-    'eye-screens',
-    'eye-searing',
-    'eye-slit',
     'eye-slits',
-    'eye-smartingly',
-    'eye-sores',
-    'eye-spotted',
-    'eye-stopper',
-    'eye-surgeon',
-    'eye-taking',
-    'eye-tech',
-    'eye-their',
-    'eye-torturing',
-    'eye-twinkling',
-    'eye-twitch',
-    'eye-velocity',
-    'eye-wash',
-    'eye-wounds',
-    'eye/and',
     'eye/brain',
-    'eye/ear/',
-    'eye/gun',
-    'eye1992',
-    'eyebag',
-    'eyeball-photographed',
-    'eyeballer',
-    'eyebath',
-    'eyebaths',
-    'eyebe',
-    'eyebeams',
-    'eyebright-red',
-    'eyebright-red-fescue',
-    'eyebrights',
-    'eyebrow-pencil',
-    'eyebrow-raiser',
     'eyebrow-twitch',
-    'eyebrowish',
-    'eyebrowns',
-    'eyebu-bakand',
-    'eyecaps',
-    'eyeeee',
-    'eyehole',
-    'eyelash-fluttering',
-    'eyelet-holing',
-    'eyeleted',
-    'eyeletted',
-    'eyelid-rubbing',
-    'eyelid-shapes',
-    'eyepad',
-    'eyepaint',
-    'eyepits',
     'eyeryone',
-    'eyes&mdash;in',
-    'eyes-',
-    'eyes-and-ears',
-    'eyes-cast&rehy;down',
-    'eyes-of-blue',
-    'eyes-peeled',
-    'eyescreens',
-    'eyescrews',
-    'eyesfree',
-    'eyeshadow-liner',
-    'eyesight.',
-    'eyesilmar',
-    'eyesocket',
-    'eyesore\'cranes',
-    'eyestone',
     'eyetie',
-    'eygptian',
-    'eygpts',
-    'eyjolfur',
-    'eyken',
-    'eyler',
-    'eyles/race',
-    'eymard',
-    'eymeric',
-    'eymore',
-    'eyne',
-    'eynesford',
-    'eynhallow',
-    'eynham',
-    'eynsford',
-    'eyots',
     'eype',
-    'eyraud',
-    'eyri',
-    'eyroun',
-    'eyslate',
-    'eysmont',
-    'eysmontt',
-    'eysmonttminister-director',
-    'eyssen',
-    'eysymontt',
-    'eyton-on-severn',
-    'eyvkclenrvavlenqnktlieelkalkdlychksd',
-    'eywooddes',
-    'ez-zohr',
-    'ezanville',
-    'ezcema',
     'eze',
-    'ezee',
-    'ezeiza',
-    'ezek',
-    'ezeke',
-    'ezeke.',
-    'ezia',
-    'ezkerra-ee',
-    'ezoe',
-    'ezooli',
-    'ezra\'',
-    'ezrapour',
-    'eztetyke',
-    'ezzard',
-    'ezzedin',
-    'ezzi',
     'ezzouar',
-    'ezzumpo',
-    'f&aacute;il-progressive',
-    'f&aacute;il_in',
-    'f&acirc;l-n&acirc;me',
-    'f&aelig;st',
-    'f&amp;b',
-    'f&bsol;s',
-    'f&dollar%',
-    'f&dollar;122,600,000',
-    'f&dollar;183',
-    'f&dollar;248',
-    'f&dollar;3',
-    'f&dollar;330',
-    'f&dollar;340',
-    'f&dollar;476,700,000',
     'f&dollar;500,000',
-    'f&dollar;538,000,000',
-    'f&dollar;55,000,000',
-    'f&dollar;69,700,000',
-    'f&dollar;74,700,000',
-    'f&dollar;setprv',
-    'f&eacute;anor',
-    'f&eacute;bus',
-    'f&eacute;condes',
-    'f&eacute;d&eacute;ral',
-    'f&eacute;d&eacute;rale',
-    'f&eacute;d&eacute;rastes',
-    'f&eacute;es',
-    'f&eacute;ilim',
-    'f&eacute;licien',
-    'f&eacute;meline',
     'f&eacute;minin',
-    'f&eacute;nelon',
-    'f&eacute;odalit&eacute;s',
-    'f&eacute;odore',
-    'f&eacute;ri',
-    'f&eacute;s',
-    'f&egrave;re',
-    'f&euml;licit&euml',
-    'f&euml;tes',
-    'f&euml;tes-champ&euml;tres',
-    'f&flat',
-    'f&gt',
-    'f&hellip;ing',
-    'f&iacute;anna',
-    'f&lsqb&egr&rsqb;ctory',
-    'f&mdash;-up',
     'f&mdash;it',
-    'f&mdash;k',
-    'f&mdash;ng',
-    'f&mdash;rando',
-    'f&mdash;ups',
-    'f&mdash;wits',
-    'f&ndash',
-    'f&ndash&ndash&ndash;ing',
-    'f&ndash;101',
-    'f&ndash;104',
-    'f&ndash;104s',
-    'f&ndash;111',
-    'f&ndash;13402',
-    'f&ndash;15s',
-    'f&ndash;16s',
-    'f&ndash;g.',
     'f&ndash;lack',
-    'f&ndash;r',
-    'f&ocirc;lha',
-    'f&ouml',
-    'f&ouml;ellalt',
-    'f&ouml;rg',
-    'f&pound;53.2m',
-    'f&pound;bead',
-    'f&sharp;7&flat;9',
-    'f&sharp;m',
-    'f&sharp;m-e',
-    'f&sharp;sus4-f&sharp',
-    'f&uacute;tbol',
-    'f&ucirc;r',
-    'f&uuml;hls',
-    'f&uuml;hrerbunker',
     'f&uuml;hrerlose',
-    'f&uuml;hrers',
-    'f&uuml;hrerstaat',
-    'f&uuml;hrich',
-    'f&uuml;nff',
-    'f&uuml;nffzig',
-    'f&uuml;nfkirchen',
-    'f&uuml;rsorgeerziehung',
-    'f&uuml;rstenburgs',
-    'f&uuml;rstenzug',
-    'f&uuml;rth',
-    'f&uuml;rtwangler',
-    'f&uuml;ssen',
-    'f&uuml;ssli',
-    'f\'&gt;0',
-    'f\'&lt;0',
     'f\'-h\'',
-    'f\'-j\'',
-    'f\'=',
-    'f\'b',
-    'f\'r',
-    'f\'zam',
-    'f(-d)',
-    'f(1)',
-    'f(1,100)=3.62',
-    'f(1,100)=5.87',
-    'f(1,24)=27.27',
-    'f(1,34)=0.06',
-    'f(1,35)=5.22',
-    'f(1,42)=59.17',
-    'f(1,42)=70.92',
-    'f(1,50)=6.65',
     'f(1,64)=0.59',
-    'f(1,64)=7.88',
-    'f(1,9)=16.25',
-    'f(1,9)=195.21',
-    'f(1,9)=4.43',
-    'f(1,9)=43.01',
-    'f(1,9)=92.56',
-    'f(2)',
-    'f(2,18)=0.95',
-    'f(2,18)=16.66',
-    'f(2,18)=18.98',
-    'f(2,18)=2.05',
-    'f(2,18)=25.90',
-    'f(2,18)=3.04',
-    'f(2,18)=3.975',
-    'f(2,18)=5.16',
     'f(2,18)=7.80',
-    'f(2,33)=0.57',
-    'f(22,286)=1.92',
-    'f(23,437)=3.95',
-    'f(23,437)=4.02',
-    'f(23,437)=4.74',
-    'f(23,437)=5.67',
-    'f(23,966)=2.13',
-    'f(23,966)=2.35',
-    'f(24)',
-    'f(39,936)=13.12',
-    'f(39,936)=3.89',
-    'f(78,936)=1.42',
-    'f(9,100)=0.24',
-    'f(9,100)=1.28',
-    'f(9,315)=13.83',
     'f(9,315)=24.90',
-    'f(9,315)=4.362',
-    'f(9,315)=5.56',
-    'f(9,476)=21.61',
-    'f(9,50)=0.36',
-    'f(9,50)=0.48',
-    'f(9,50)=0.71',
-    'f(9,50)=0.77',
-    'f(9,50)=0.99',
-    'f(9,50)=1.01',
-    'f(9,50)=1.84',
-    'f(9,576)=1.14',
-    'f(9,576)=1.77',
-    'f(9,576)=28.35',
-    'f(c)&gt;f(n)',
-    'f(cn)',
     'f(co)',
-    'f(op)&gt;0',
-    'f(r)',
-    'f(s)=c',
-    'f(u)=a',
-    'f(u)=b',
-    'f(w)',
-    'f*****',
-    'f****d',
-    'f***er',
-    'f***in',
-    'f***is',
-    'f***k**g',
-    'f**i',
-    'f**king',
-    'f**ks',
     'f*cks',
-    'f*n*nc**l',
-    'f-&ndash',
-    'f------',
-    'f-0.25',
-    'f-1-11',
-    'f-10',
-    'f-100',
-    'f-101',
-    'f-106',
-    'f-14s',
-    'f-15b',
-    'f-15j',
-    'f-16c',
-    'f-16cs',
-    'f-18s',
     'f-210',
-    'f-25ce',
-    'f-30ce',
-    'f-36',
-    'f-404',
-    'f-4500',
-    'f-4b',
-    'f-4ce',
-    'f-4e',
-    'f-4j',
-    'f-4s',
-    'f-51',
-    'f-5es',
-    'f-6',
-    'f-6504',
-    'f-65ce',
     'f-7p',
-    'f-8',
-    'f-84g',
-    'f-89j',
-    'f-ace',
-    'f-air',
-    'f-ba-pb',
-    'f-beat',
-    'f-bgjm',
-    'f-block',
-    'f-bmsh',
-    'f-bmss',
-    'f-bnre',
-    'f-boed',
-    'f-boef',
-    'f-bolx',
     'f-booa',
-    'f-chord',
-    'f-ck',
-    'f-dash',
-    'f-er.',
-    'f-f-f-f-u-n',
-    'f-f-f-found',
-    'f-f-fantasy',
-    'f-f-favours',
-    'f-f-fourteen',
-    'f-family',
-    'f-feather',
-    'f-feels',
-    'f-fell',
-    'f-fishing',
-    'f-fishtail',
     'f-flaps',
-    'f-foolhardy',
-    'f-foolish',
-    'f-forced',
-    'f-fortunate',
-    'f-france',
-    'f-freddy',
-    'f-freud',
-    'f-fucking',
-    'f-fun',
-    'f-funny',
-    'f-grade',
-    'f-holed',
-    'f-horn',
-    'f-i4',
-    'f-l-u',
     'f-logo',
-    'f-macs',
-    'f-model',
-    'f-o-r-e-s-t-e-r',
-    'f-on-the-bottom',
-    'f-pan',
-    'f-plus',
-    'f-region',
-    'f-shed',
-    'f-stamped',
-    'f-star',
-    'f-stars',
-    'f-stop',
-    'f-things',
-    'f-variate',
-    'f-w',
     'f-wlkb',
-    'f-wmsh',
-    'f-zbac',
-    'f-zbad',
-    'f-zero',
-    'f.10',
-    'f.122',
-    'f.13',
-    'f.150f',
-    'f.1s',
-    'f.200',
-    'f.207',
-    'f.22',
-    'f.24',
-    'f.3s',
-    'f.7',
     'f.8',
-    'f.84',
-    'f.a.a',
-    'f.a.a.',
-    'f.a.s.',
-    'f.c.o.',
-    'f.c.s.',
-    'f.c.w.',
-    'f.charles',
-    'f.checklist',
-    'f.e./tertiary',
-    'f.e.t.s.',
-    'f.eng',
-    'f.f.b.',
-    'f.g.s.',
-    'f.h.b.',
     'f.i.ex',
-    'f.i.r.t.o.',
-    'f.i.s.a.',
-    'f.ia',
-    'f.j.e.',
-    'f.j.fisher',
-    'f.k.',
-    'f.l.s',
-    'f.l.s.',
-    'f.m.g.',
-    'f.m.h.',
-    'f.mudway',
-    'f.o.b',
-    'f.p.ramsey',
-    'f.r.c.p.',
-    'f.r.c.r.',
     'f.r.c.s.',
-    'f.r.h.',
-    'f.r.i.c.s.',
-    'f.r.leavis',
-    'f.r.m.s.5%',
-    'f.r.m.s.8%',
-    'f.r.o.7',
-    'f.r.s.e.',
-    'f.rubra',
-    'f.s.a.',
-    'f.s.s.',
-    'f.t.s.',
-    'f.u.c.k',
-    'f.understanding',
-    'f.v.',
-    'f.vii/3m',
     'f.w.de',
-    'f.w.j.',
-    'f.w.r.',
-    'f.w.w.',
-    'f.x.',
-    'f.xiia',
-    'f.xiims',
-    'f/',
-    'f/00/22/2002',
-    'f/00/23/2138',
-    'f/00/23/2149',
-    'f/00/23/2151',
-    'f/00/23/2152',
-    'f/00/23/2190',
-    'f/00/23/2201',
-    'f/00/23/2208',
     'f/00/23/2226',
-    'f/00/23/2237',
-    'f/00/23/2263',
-    'f/00/23/2266',
-    'f/00/23/2269',
-    'f/00/23/2278',
-    'f/00/23/2282',
-    'f/00/23/2294',
-    'f/00/23/2298',
-    'f/00/23/2305',
-    'f/00/23/2348',
-    'f/00/23/2350',
-    'f/00/23/2370',
-    'f/00/23/2374',
-    'f/00/23/2377',
-    'f/00/23/2382',
     'f/00/23/2387',
-    'f/00/23/2389',
-    'f/00/23/2398',
-    'f/00/23/2409',
-    'f/00/23/2412',
-    'f/00/23/2420',
-    'f/00/23/2424',
-    'f/00/23/2441',
-    'f/00/24/2015',
-    'f/00/26/0003-3',
-    'f/00/29/0001',
-    'f/00/29/0001-1',
-    'f/01/25/0000',
-    'f/04/25/0000',
-    'f/04/26/0007',
-    'f/05',
     'f/05/25/0016',
-    'f/05/25/0020',
-    'f/05/25/0025',
-    'f/09/25/0000',
-    'f/09/25/0095',
-    'f/09/25/0100',
-    'f/09/25/0106',
-    'f/09/25/0109',
-    'f/09/25/0111',
-    'f/09/25/0112',
-    'f/09/25/0114',
-    'f/09/25/0115',
-    'f/09/25/0116',
-    'f/09/25/0118',
-    'f/09/25/0119',
-    'f/09/25/0121',
     'f/09/25/0122',
-    'f/09/25/0125',
-    'f/09/25/0126',
-    'f/09/25/0127',
-    'f/09/25/0128',
-    'f/09/25/0129',
-    'f/09/25/0140',
-    'f/09/25/0141',
-    'f/09/25/0151',
-    'f/09/25/0154',
-    'f/09/25/0157',
-    'f/09/25/0160',
-    'f/09/25/0164',
-    'f/09/25/0168',
-    'f/09/25/0177',
-    'f/11',
     'f/13/06/1980',
-    'f/16/28/0001',
-    'f/18/25/0002',
-    'f/2.0',
-    'f/20/25/0003',
-    'f/20/25/0004',
-    'f/20/25/0005',
-    'f/20/25/0006',
-    'f/20/25/0007',
-    'f/20/25/0014',
-    'f/20/25/0015',
-    'f/20/25/0017',
-    'f/20/25/0018',
-    'f/20/25/0019',
-    'f/20/25/0020',
-    'f/20/25/0022',
     'f/20/25/0022-1',
-    'f/20/25/0023',
-    'f/20/25/0027',
-    'f/22',
-    'f/24/05/0006-2',
-    'f/24/25/0016',
-    'f/24/25/0020',
-    'f/24/25/0021',
-    'f/24/25/0023',
-    'f/24/25/0030',
-    'f/24/25/0032',
-    'f/26&deg;s',
-    'f/28/63/0001',
-    'f/3&middot;5',
-    'f/4',
-    'f/5.6',
     'f/8',
-    'f/gas',
-    'f/ls',
-    'f/n',
-    'f/weight',
-    'f0.2',
-    'f01',
-    'f02',
-    'f03',
-    'f08',
-    'f0lin',
-    'f1+',
-    'f1,217,700',
-    'f1,330',
-    'f1,330,360',
-    'f1,800',
     'f1,850',
-    'f1-111',
-    'f1-11e',
-    'f1-plus',
-    'f1.57bn',
-    'f103,000',
-    'f104',
-    'f107,000',
-    'f10i',
-    'f117s',
-    'f11s',
-    'f123car',
-    'f13',
-    'f1336',
-    'f1379',
-    'f140,000,000',
     'f15,000',
-    'f15s',
-    'f16,700',
-    'f160,000',
-    'f165,400',
-    'f180,000',
-    'f19,000,000',
-    'f19,600',
-    'f190,000',
-    'f1yer',
-    'f2&ndash;80',
-    'f2,400',
-    'f2,500',
-    'f2,500,000',
-    'f2,700',
-    'f2,800',
     'f2.40',
-    'f2/2.4997',
-    'f2/soveriegn',
-    'f20,000,000',
-    'f21,534,298',
-    'f210',
-    'f226',
-    'f228,000',
-    'f23,700',
-    'f231',
-    'f235',
-    'f240',
-    'f25',
-    'f25,000',
-    'f250',
-    'f28',
     'f29',
-    'f3&ndash;80',
-    'f3&verbar&verbar;b5&verbar&verbar',
-    'f3,000,000',
-    'f3,300',
-    'f3,820',
-    'f3.38',
-    'f3.43',
-    'f3.5&ndash;4.5',
-    'f30,000',
-    'f30,000,000',
-    'f31',
-    'f310,000,000',
-    'f33,400',
-    'f33.80',
-    'f35,000,000',
     'f350',
-    'f36',
-    'f367,000,000',
-    'f37,500',
-    'f39,000,000',
-    'f39a',
-    'f3ba',
-    'f3fs',
-    'f4&ndash;5.6',
-    'f4&verbar&verbar;rh8&verbar&verbar',
-    'f4,400',
-    'f4-f5',
-    'f4.5',
-    'f4/80',
-    'f40,000',
-    'f42,000',
     'f424',
-    'f437,800',
-    'f458,000,000',
-    'f470,000',
-    'f4f',
-    'f4f-3',
-    'f4f-4s',
-    'f4fs',
-    'f4u&ndash;4',
-    'f5,000,000',
-    'f5,470',
-    'f5,522',
-    'f5,600',
-    'f5-type',
-    'f50,000,000',
-    'f500,000',
     'f500,000,000',
-    'f5000',
-    'f508/&micro;w1282x',
-    'f508/f508',
-    'f514',
-    'f55',
-    'f6,000',
-    'f60',
-    'f62',
-    'f65,000',
-    'f650,000,000',
-    'f66.60',
-    'f670',
-    'f6b',
-    'f6f',
-    'f7.80',
     'f70',
-    'f72,000',
-    'f75.50',
-    'f770',
-    'f7a&plus',
-    'f7c&plus',
-    'f7f',
-    'f8,300',
-    'f8,500,000',
-    'f8,850',
-    'f80',
-    'f80,000,000',
-    'f80,700',
-    'f801',
-    'f89,500',
-    'f8a&plusmn',
     'f8a/8a+',
-    'f8c',
-    'f8c&plusmn',
-    'f8c+',
-    'f8fs',
-    'f9,000',
-    'f9,000/2',
-    'f9.65',
-    'f90',
-    'f90,000',
-    'f90,000,000',
-    'f900',
-    'f930',
-    'f95.30',
-    'f:penguin',
-    'f=28mm',
     'f=3.965',
-    'f=32+9/70c',
-    'f=35',
-    'f_',
-    'fa&ccedil;acde',
-    'fa&ccedil;ading',
-    'fa&ccedil;e',
-    'fa&iacute;te',
-    'fa&icirc;tes',
-    'fa\'',
-    'fa(-)te',
-    'fa(s)t-halvard',
-    'fa(v)t',
-    'fa-18s',
-    'fa-k\'uei',
-    'fa-kwei',
     'fa/16/25/0001',
-    'fa/16/25/0002',
-    'fa/fa',
-    'fa342',
-    'fa563',
-    'faa\'n',
-    'faak',
-    'faarevejle',
-    'faartoft',
-    'faas',
-    'faav',
-    'fab\'',
-    'fab-6',
-    'fab-antigen',
-    'fab-binding',
-    'fab-less',
     'fab.',
-    'fab/lysozyme',
-    'fab/protein',
-    'fab1',
-    'fabada',
-    'fabbricatori',
-    'fabeltiere',
-    'faber&rehy;castell',
-    'faber-kaiser',
-    'faberg&eacute;-style',
-    'fabian-style',
-    'fabiano',
-    'fabiato',
-    'fabl',
-    'fable-within-the-fable',
-    'fable-writers',
     'fableaus',
-    'fableland',
-    'fabliau(s)',
-    'fabliau-like',
-    'fabliau-type',
-    'fabling',
-    'fabnatch',
-    'fabr&eacute',
-    'fabr&eacute;ges',
-    'fabr&egrave;ges',
-    'fabr&ouml',
-    'fabra',
-    'fabrega',
-    'fabri',
-    'fabric-and-leather',
-    'fabric-backed',
     'fabric-covering',
-    'fabric-deep',
-    'fabric-destructive',
-    'fabric-like',
-    'fabric-retentive',
-    'fabric-softeners',
-    'fabric-weaving',
-    'fabric-winged',
-    'fabric/an',
-    'fabricae',
-    'fabrication.',
-    'fabricks',
-    'fabrics&mdash',
-    'fabrics/furnishings',
-    'fabrics/ravissant',
-    'fabricus',
     'fabrielis',
-    'fabrik',
-    'fabrikherr',
-    'fabritius',
-    'fabron',
-    'fabryka',
-    'fabu&rehy;lously',
-    'fabulists',
-    'fabyan',
-    'fac&rehy;tor',
-    'facadists',
-    'facae',
-    'faccetta',
-    'faccio',
-    'facciosos',
-    'face&mdash;she',
     'face&mdash;the',
-    'face&ndash;to&ndash;back',
-    'face-',
-    'face-bronzer',
-    'face-centre',
-    'face-centres',
-    'face-first',
-    'face-flattering',
-    'face-fungus-clad',
-    'face-furniture',
-    'face-gleamer',
-    'face-grinding',
-    'face-guards',
-    'face-high',
-    'face-hugger',
-    'face-level',
     'face-lifting',
-    'face-losing',
-    'face-loss',
-    'face-offs',
-    'face-only',
-    'face-paint',
-    'face-painted',
-    'face-painters',
-    'face-patch',
-    'face-powdery',
-    'face-protector',
-    'face-ripples',
-    'face-rubbings',
-    'face-savers',
-    'face-slap',
-    'face-slapping',
     'face-splitting',
-    'face-to-the-camera',
-    'face-to-wall',
-    'face-upwards',
-    'face-wrinkling',
-    'face.7sup5',
-    'face/lemon',
-    'face/north-west',
-    'face/resin',
-    'faceache-',
-    'facedown',
-    'facefulls',
-    'faceitious',
-    'facel',
-    'facelessly',
-    'facemasks',
     'facepacks',
-    'faces\'87\'\'',
-    'faces_in_front',
-    'faceshields',
-    'facetiae',
-    'facewise',
-    'faceworker',
-    'faceworkers',
-    'facey',
-    'fachen',
-    'fachin',
-    'fachini',
-    'fachochschulen',
-    'fachralo',
-    'fachtna',
-    'fachwerk',
     'faci',
-    'facia-lift',
-    'facial/vestibuloacoustic',
-    'facialis',
-    'facie',
-    'facies-controlled',
-    'facil',
-    'facilely',
-    'facili',
-    'facilities-',
-    'facilities-including',
-    'facilities.anyone',
-    'facilities/400',
-    'facility-2',
-    'facility/system-managed',
-    'facilius',
     'facill',
-    'facing-brick',
-    'facio',
-    'facisim',
-    'facism',
-    'facists',
-    'facit',
-    'faciundis',
-    'facivermis',
-    'fack',
-    'fackins',
-    'facknellmatey',
-    'facks',
-    'facktion',
-    'faclities',
-    'faconnier',
     'facourable',
-    'facoured',
-    'facsimile-transmission',
-    'facsimile.specifications',
-    'facsimilie',
-    'fact&mdash;there',
-    'fact\'',
-    'fact-',
-    'fact-causation',
-    'fact-establishing',
-    'fact-finder',
-    'fact-finders',
-    'fact-head',
-    'fact-imparters',
-    'fact-is-stranger-than-fiction',
-    'fact-lode',
     'fact-of-the-matter',
-    'fact-orientated',
-    'fact-packed',
-    'fact-seekers',
-    'fact_in',
-    'factbox',
-    'facted',
-    'factel',
-    'facters',
-    'factfinder',
-    'factfinds',
-    'facti',
-    'factio',
-    'faction-initiated',
-    'faction-politics',
-    'factionalise',
     'factionism',
-    'factions-in',
-    'factiousness',
-    'factness',
-    'factoires',
-    'factor&rehy;analytic',
-    'factor\'',
-    'factor(tf)',
-    'factor-',
-    'factor-&bgr',
-    'factor-4',
-    'factor-analytic',
-    'factor-augmenting',
-    'factor-inducible',
-    'factor-like',
-    'factor/aagpc',
     'factor/lyso',
-    'factories.bulmers',
-    'factories/offices',
-    'factorise',
-    'factors--both',
-    'factors-initial',
-    'factors.in',
-    'factors/characteristics',
-    'factors/mike',
-    'factors/responsibilities',
-    'factory&rehy;glazed',
-    'factory-built',
-    'factory-cleaning',
-    'factory-coated',
-    'factory-era',
-    'factory-finished',
     'factory-forced',
-    'factory-galvanised',
-    'factory-grimed',
-    'factory-labour',
-    'factory-owning',
-    'factory-raised',
-    'factory-recorded',
-    'factory-side',
-    'factory-style',
-    'factory-supplied',
-    'factory-supported',
-    'factory-the',
-    'factory-treated',
-    'factory-wise',
-    'factory.and',
-    'factory.but',
     'factory/handmade',
-    'factoryland',
-    'factorys',
-    'factorywise',
-    'factos',
-    'factote',
-    'factpacks',
-    'facts&mdash;assumptions&mdash;problems&mdash;alternatives&mdash;recommendations',
-    'facts-a',
-    'facts-ibn',
-    'facts-list',
-    'facts-these',
-    'facts/information',
-    'factsheet(s)',
-    'factual-thought-provoking',
-    'facture',
     'facturing',
-    'facult&eacute',
-    'facult&eacute;s',
-    'facultad',
-    'facultative',
-    'faculte',
-    'faculties-they',
-    'faculties/courses',
-    'faculties/departments',
-    'faculties/subjects',
-    'faculty-based',
-    'faculty-wide',
-    'faculty/department',
-    'faculty/school',
-    'facundo',
-    'fad-head',
     'fadchester',
-    'fadd',
-    'fadd&sharp;4-f',
-    'fadda',
-    'faddishness',
-    'faddism',
-    'fade-button',
-    'fade-free',
-    'fade-to-black',
-    'fade-up',
-    'fadel',
-    'fadellivestock',
-    'fadeout',
-    'faders',
-    'fadge.',
-    'fadhel',
     'fadhil',
-    'fadhils',
-    'fading.',
-    'fadl',
-    'fadog',
-    'fadoul',
+)
+
+blocks_78 = (
+    '$\'na/cics%$itas$&phered$"so#!l$.ave-protectors\'!.\'!d$$itic(!s$)osed/sent($ness&$ured#%oanal$%de(s)',
+    '&*r-decoders%5ing-decoding-encoding$\'igneurs$#mbe&$rous%(passable$!n%\'omienda$%ppice$(ragement%&e-free\'&opener%&porate$&scopic$#tel',
+    '%*nter&ndash)%/time)#ed.%-rage-visitors)&/allow*)reinforce)(_so_much)"d.)#ing($ment&$eage%$tner#&ratite$%eased%(v&eacute',
+    '$\'imsoned$&usters$%ypter\'$ions#(ulturate$%mbers&&rancer#$yclo\'&-banks\'-p&eacute;dico2#que*)grave;die(*aedia-like,#sts((edia-aka',
+    ',"st+#sts$%lical%\'opaedia+!c$\'phering"$d&gt$1ndash;sanderstead$&rehy;a)(products#!-$$1975&"84\'!7\'!8',
+    '$.april.inchcape%#rea$%based&!y%%oards&"rn$(consumer%\'ustomer$\'effects%)xpiratory$&filing%#lap$#gap\'!s$$held',
+    '%$tems$$john&%ining$\'knotted$\'labeled%$oads$\'members%$usic$$note$\'of-1989\')agreement\'$camp($lass(-oding-details)(nference',
+    '\'1description-lines\'&errors\'(february(%light(*oreign-set\'\'ice-age\'$life\'\'meeting(3odification-records*-ule-relations)#nth\'&period($hase(#ipe\'$race',
+    '()eferences("ow("un\'&school(*eason-game)%ssion($hift)"ow($tage(%ummer\'\'teenage))st-status)$ther(+he&rehy;day*$-day',
+    '+$road+%trail+(worldish(#ime(.ypes-and-names\'#war&$game%)rdovician$*palaeozoic&#per)!s&%ttern%$iece)!s%#lay',
+    '%%robes$\'quarter$(repaired$\'selling%&tation&&ruggle%&ystems$\'terrace+!d%"he%$itle%&o-side$7use-routine/non-routine$%walls%%indow',
+    '&"se##.of#$/day$$east$&forest$$isle$\'mayfair$\'prelude#!=#"a1$"by$0cott/oxfordshire$$nges#%block$$oard',
+    '##cap#9earing-eccen&rehy;tricity$"bt$%caine$&d-ness&"up$"ka$$lman$\'nizened$$ring%$lein$#vco%&orethe&"ur#-game-inspired',
+    '#,iekkickmekcs$,manch&eacute$"n\'%$g-up&)/scottish%!o#+l&ouml;sung$\'abelled%"nd$"er%&ss-but(\'renewed(\'seeming\'!.\',ly-discussed',
+    '$!f$%icher%"nk$$ow+i#$moor#"o-%)metriosis%)peroxides$&anally$)bronchial$%canal%&entric%#ope%&ranial&$inal',
+    '%$tine%\'uticles%$ytic\'$osed$&dermis$!f$\'geneity(#ous\'"ic($sing%%neous$#ios$)lymphatic$\'morphic*#nes',
+    ')!s%\'ycetes.$#ngo%(uclease.)&olytic$&philia*!l&$oric&)thalmitis%(roshesis%(terygota,"es$&rectal%%genic%$heic',
+    '%%sable&1ement-negotiation\')r-shipper)*transferor$+sconography\'!p(#ing("y.%&permum$-thelin-1-like,B=endothelin&rehy;2&gt;endothelin-3+!2+!3+0immunoreactivity\'$oium',
+    '%$ixin%\'oxaemic\'*in-binding%)racheally&%ophic("ic$\'wment.i#(pin-jack##res&!s$"in$#o-t%%crine%%denny#-s.technically',
+    '$\'/desire$$cope$%heets#!t$&rimmed#!u$%ement$#re/&"rs%\'ingness%"os#$well$#ise$#ord##yng',
+    '#$-wsw#$ados#$bish#!d#$emys##fer#.ma/colonoscopy%+s-in-a-hole$-ies-in-a-hole%!s$"y\'%"es#*nforceable#*ptometopus#!r',
+    '$$dale$/getic&mdash;how)"al%&ically&!e\'$-sud&#que&$zers%\'y&mdash&!*&)-absorber-#ing("re\'&budget\'\'centred',
+    '(*omposition)*nservation+\'umption0"ve*\'taining)"st)&upling\')demanding(,isadvantaged(\'raining\')expensive*&orting\'%flows(%ossil()rom-waste',
+    '\'\'guzzler\')importing((ntensity\')labelling($evel()iberating)$nked(%osses\')measuring\'%often\')reduction)\'storing(1ich/right-to-work\'\'spacing(&toring',
+    '(\'ransfer\'#use\'$well&\'.saving&+/atmosphere&$care&!r$%hodar$\'taining$!y##ssi#)teropathy&\'taining##ver&*/bletchley',
+    '$#nte&5s&rehy;trouv&eacute;s#&eebles$\'offment$%rmera%&voured#$fant#(idaville$$eld.\'$/the\'!s#\'luorane%$rane#\'oldment$+nc&eacute;e',
+    '%)ce/breach\'.able&mdash;see+!.\'+d&mdash;see(!.("ly\'%ment.,!d&,ing/applying%!d#-ranchisements)#zed$$inge($ment#!s',
+    '%#pfs#"ys"+ga&rehy;ged$#din$!g%)&eacute;e-!s%&ement\'*&-rings$!i$%liere%"nd#$dahl#%eland%$berg',
+    '*+-holm-swarm%)hartszell%#ond%&s-like&!k&#man$#rgy%#ixb#"ge#!h$"am$"in#!i$$lond$%matic',
+    '$(ne-based)!y(&oilers(&uilder\'(capacity(\'hargers($over\'\'driving\'(handling(%ouses\'&idling\'%maker($ount\'"on\'$shed',
+    ')\'ripping\'\'thunder\'&weight(%right&&/britt\')driveline\'\'gearbox\')propeller\'.timing/mixture&&eering\')r-already)(friendly((/borough)\'leading)(national',
+    '()ing-based,-cum-marketing,(oriented+4/banking/tourism/etc-\'uilding,-environmental,*technology+!s("ng($s-on),/technicians)\'_by_the)$peak&$less%!t',
+    '$!s%$hmen#(l.j.med.$!a%$cial)"ly%!d%(nd&ndash-\';quebec\'!\'\'!-()australia(*experience(&france(\'kamerun',
+    ')&oyalty(&norway()qualified(&reject((scotland))outh-east(#the("us*!a(\'various(%wales)#est\'&.fifty("in\'&/bride',
+    '((scotland0%/n.i.)&tudent\'%28pts\'!3\'"at\'#er\')#ism\'$hass%$rged$%ebert&%recht&#uch%$hard&$eart',
+    '%!y$!i%$scan\'!h(\'&ndash\'("er)!s&*h&amp;sup2(,mdash;errors(.ndash;speaking((rehy;and-$born-#man-\'speaker\'3-as-second-language',
+    ').orn-and-raised)#red)$uilt*%rmese(&canada))onfluence(\'derived)(ominated(\'fashion/"ed)\'inanced)%rench(&german.(-italian((japanese',
+    '((learning*%xicon,$fied($made)%edium*!n)#odo(&packed)\'romoted))ublishers(*registered)"un(\'seeming)&panish)(ubtitled',
+    '($warm)$oman\'$.303)!6\'\'/arabic(+continental(%drama(6french/german/japanese(-german/french/(japanese(\'italian((literate)"ow(&metric($r.p.',
+    '(&target\'"er\'$ings\'$man\'*".i\'"ry\'(speaking$"nd$%obing%"nd$#sih\'#man$%ynion%"st#!o',
+    '$)lismensem$#ran#(raftment%"is%%melle$$elee$%ialls%#med$%osses#*str&ouml;m#&ulfers"!h#*anced.this\'!e\'&r-like',
+    '(&/early)(promoter##eim""if#!g$+&rehy;matic#\'ronment#"sa$&kellen##tre""ja$&mbment*!s#!o$0y/envy/suffer/ca',
+    '%\'ability%!e%#in\'%.ment&mdash;the""ke$0phalin-endorphin#!i$$ndle(!d#"yo"/l&egrave;vement#(argening$#yde#(ightener+!s',
+    '-!.-!s$%sters&%ments$(teration$&veners#"li"#mag#%eshes"&nahdha$\'scarthy#"ea%$gram$"mi$)rsaledale',
+    '%4killen&ndash;belleek2*swanlinbar%$more#!o$$rath$!s#!s#)ubelation$\'merator$\'nciated"(o-daynes$#era%$sque#&barbus$"le',
+    '#"la#$mous#$ough##rmi%%o-bus\'$dome&%ously&+us-breasted)\'looking)\'seeming((ly-solid*!.#"si#!t$!t',
+    '\'"he\'\'of-this\'"we&!.\'!s&#_by$$nced#!w#%xacin#$ying""pa#$lane\'!d$$oyed#&rynted',
+    '#!.#\'uieries%,ries&mdash;a)).speedway)(/appeals\'"n\'&+y-answering()discovery\'./communication\'$_for"!r#,&iacute;quez##apt&#ure)$ment',
+    '%#her&%ingly\')ssez-vous$$ques\'!z#(olements%#ing%$lees#)ycephalus$!s")s&ndash;e#\'aimadas$$lada$!y%#han',
+    '$%ribed#%eamed$%llure$)mble/haas)&rattle$$nada#%hroud#%ialic$$form$#led%#ing$"no#&lavery#(narement#$olls',
+    '$!n$$rcel(#led#&phered#%tated$(ructured#!u$"e.$%rance#&wathed"&tactin$"da$$ils.$"me#/differenzierung',
+    '$#csa$$llan&"us%#sur$%ncoun%#dez$-r&rehy;tainer/#ing%..relationships%%/exit%(ectomies&&d-into&!r%$idis&*ng/leaving',
+    '%+obacteria/g.#cae.!l&/chromaffin-like\'%occal&\'enteral&*glucagon/l*%oagon&&lobium&&morpha&&pathic*%ogens\'%neust&/toxin-producing&\'viruses',
+    '%$pise&%prise&\'reneurs\'$ise-+2by&rehy;enterprise+\'centred+*generating,%roups+#led+\'related,,outer-switch+%scale,$tyle+$with*!/',
+    '*$s-to+!.*$wide)#in\'%%stage%#tai(0ned&mdash;people+&/moved*"r\'+&-lover)#in\'+1g-cum-educational,!.)(ment-led.&packed',
+    '.#and-*/education.\'tourism-"s..$ws29$%state#(fremdung$&uhrung#!h$%alpy.$&eticus$\'icketed$(nography$\'oosiasm%\'usiasme',
+    '($ment%$ones\'#ing$%siasm$&usaist*!s&!i\'#ano(-sm/motivation)(t-driven+/for-books-about+*orientated*/ically-friendly*"s/\'*sastically',
+    '&$uasm$&wistle$(ymematic#!i$*&egrave;re.$ment$#cer\'!s%+ingly-named$"er$#mus$!n$%reley\'"y.&!s',
+    '%+y&mdash;not\'*rehy;makes&&-based\'\'concept\'*identifier\'(meanings\'(oriented\'\'staging\'%types&!.#(lebucher%%nmatt$!o$!y#&macher',
+    '$%mbing&!s%+o-urochrome&%phily(%thora$!n%"ed%%hurst$&rhinal$!s%"is$+ur&eacute;s#1r&acirc;in&eacute$%\'aide&%utres',
+    '%"da%)il-gazing\'!e(!d%$mmel)#led%$nce\'(\'-buzzer)(cum-exit)*exhibition)-fa&ccedil;ade)$pipe*$orch)#way(*/staircase',
+    '&#ts.(&/their%&pments&%pings&!s$(e&eacute&-rehy;preneurs%,-deux-sujets%\'atingly%$chat)!s&#ote%"es%#met%(ntically',
+    '+!s("ur&,re&rehy;neur(-neur-producer-)scientist,!.,%alism,/ial-competitive-"sm\'"is%#sol%%tiens$$ical%\'es.mark\'#_so',
+    '%!n%#tis$%ocite&$ytes%\'mbicula%)phication&*y-enthalpy(*maximizing\')/enthalpy%)toxigenic$&usted.$+y&mdash;and%*-deterring&$fine&$heat',
+    '\'$rice&%words%!.#*schuldigen#\'usiasmo#(winement$#urf#*ymologists")ucleation#)mberation$&eratio#(nciated.#&retics$#ing"&valira',
+    '#1elope&rehy;shaped()-directed)(handbags)%lined\'%ments$$rist%#meu%!s#!i$\'ousness$"ro&$-art\'$coal\'&jargon&#cor',
+    '&#ned\'*ment&ndash+!\'+(-chamber-)ompliance,*friendlier,"in,%liese,&minded,\'related,&saving,$type,$xxxx+#.66,"he',
+    '+#al\'-+-protection.(scanning/$tyle-(/amenity.&carbon.$land2$-use-\'ists-it-#ly-0+appropriate1)ttractive1$ware0%based0*compatible',
+    '0#led1%inked0&minded0+progressive0+responsible0$safe-!y)\'sntally)!t\'$pace&%quant$"sa&!g\'%eable("d.',
+    '($ment$$zage#$oler$"ro#(y-driven%*management%,neutralising"$wind#%ombed#$raps$$eath"%ymore#!o"%zmann#1ymatically-driven',
+    '\'\'storage%&opathy!#oan#"rd"&c/ssrc#\'ambrian#-ene-oligocene#%haidh#\'rinoids"$dred"$gene&#tic"&leslav#\'o-gayla"!m',
+    '"(nycteris"#ple#$olis#!s"!q"\'rforwic#!l$$cund#\'menhild&#ric#(poration#%rabus#"um"#sat#!g',
+    '##tre""ta!\'p&amp;p"$(f2)"#-12##odd&!s"#/ix"!1#!9"#342"!4""92"*a-approved#&enetus',
+    '#"la#(nalepsis$!o%"ui#"on#&rcheia&!y##ter#*ulet-laden"#c-7#!a#%kfor1##ott""e.#"al',
+    '#$eist\'!s#"hy#*irogenesis#%lbaum$!i$!o##ron$$vier#(thelioid"$hage$!h$$pses##ebe&!s',
+    '$#dra&%inium$!l$&merals$$stia$"us#,grave/mother)*stepfather#&isians#"or%!s#\'ractian%"th%#ums#&ygenia',
+    '"/i&rehy;tonrized#--fluorescence$,illumination-"or%#nfo#%batai$&enthic#)c-o-meter%\'reading$$/epc$!a%#lly$%enter$%haris\'#mos',
+    '$&lastic$&ondyle$$raft$%urius&5o-gassendo-charltonia$\'ycloids#*demic-like\'"ol(%urgoi&\'ologist%%ndrum$&idymal("es(*o-orchitis$#ote',
+    '\'#lly#.eugeosynclines#*gastralgia$*enetically$&lottis)#tis$+ramatically\'$mata*%icism+"st-!s&$phes#!l$%ation&#ors',
+    '&%ticus\'(ologists%#tic$%igrin#&medium#&nal-76%#rds$%ician$$otum#&pactis$\'hanizes\'*y-oriented&\'ryngeal)!x%+enomenalism',
+    '%%yllae)%nthus$#ire$$loic$%odite&,ophyllatoxin%$gium%\'physeal$$roct#!s$(copacies(7lianism/presbyterianism)"ly("ri(#tes',
+    '(!s\'!y$$ode\'\'+-by-episode($what\'&.while&%icity\'"os%#mal&!e\'!s%"pi$\'tandard&#tic%)emologist',
+    '(#rum&#mal%%rophe)!y%#yle\'"is$&yrphus#&taphes%-xially-coated$"ek$!h%\'alamion*#ums\'#ial%5elial-cell-fibroblast',
+    '++mesenchymal+(specific3#ity*!/)!m("od(#sed(\'um-like\'#oid&$meus&&tising%$umia$&omator&$izer#)zephyrian',
+    '$#one"\'kialtes"%layed"!m"$odes#%isses##meo##nym&#ity&!y#)prostenol$!s#"rt##tes#%xides',
+    '%"es$\'y-based&\'covered".pendorfer-baum%$ergy#(ing-born#%olito#*s/orchards"-rdf-dominated#&evious##iod$!t#"on#"yn"%s-486',
+    '/!2\'!s$"on#-on-compatible%!s"(tatretus#&esicus#&helial##ing#!u"$ulis#&ration#$sios"#win!&q.5.16',
+    '#*ep=&frac14#&volume""26"-dvyahlvqqrlea"&ipment"!l"\'n(3.17)$$8.1)"#pt.""ua$*&rehy;lity$"l-&-but-different&&footed&&impact',
+    '&%sided\'#pan&%third\'#ime\'"op&%value%%.this%(/greater%%ister(!s&&tarian,#ism\',y-inequality))maximizer(\'/equity',
+    '%!l&$edis&,y&mdash;high\')-damaging(.highly-charged()important(&loaded(%owned((weighted*+ll-attested$#nil&$mous%!t$*tion(10.3))%4.14)',
+    '()-specific)#the($.pcx("s.%.or-quiveringly(\'to-pole\'%ially\'!s\'%wards##est&&rienne#1i&ndash;effective$\'-normal%&status$#ano',
+    '$+dimensional%!s$\'finally$#lia&#bre(#ia.*$ting,"on)$lium))um-amount,%price+!.+*/diaphragm("la("um',
+    '$"na%%oxial$&opment$\'parated\'&tition%"ed&!s%%menjt(+t&mdash;she)%-free*&makers,+nufacturing*(rattling*%there*)vibration',
+    '*!l))/building*(chemical+&ontrol*)furniture*7projectors/screens/tvs/*(switches%!o&$ment%!p&#ped%*robability\',portionately$$ries$\'sitales',
+    '%#one&!r%#rac%"y\'&*-accounted\'(financed-#ing\'&linked\'$only\'(required\'\'sharing\'$type&"as$(valence.+"d_',
+    ')&t-mass+\'ranking*"/g+(relevant\'$ised%%elant%$ites%\'ocality(#tes#!s!(r&dollar#)rehy;have(#run"$\'uoy"#(m)',
+    '#"mr"!1#!5$!3"%350me"#489"%535me"$8870"(9610ew-1$#30e""_a$&ll_the##for#,just_as_well##now',
+    '#&rather#(so_often$#pot$#uch#"to",a-provincial#$.but##ble#$clea$\'tically#\'diation%*cationists(#ors%(fication#&galeit',
+    '##kat##ldo$!p#$nnis#!p#)seability%"d.$"ma%!i$!p$"rg&!c#(thiopica$\'ication%"on',
+    '$(o/steere#"vi$"ur##wan"!b#"-b#!a$+-odescalchi$"ch$$mont#"b3#\'esfield#"ie$(um-doped"$call',
+    '%!s##hia%!e#\'ildoune#%olani$!n$@upe/aircoupe/fornaire/alon/cadet\'!s(*/aircoupes#%ument"!d#\'&ouml;l#$elyi$!n%"er',
+    '$&swicke##ich#*m&ouml;bel##now#,odi/baranyai$!s#%sicht%"ek$$tock#$tman"$ebor#\'chtheum)!s$$ted.(\'strands',
+    '%$heus#"de$#ine#!g#"ht#%mbald$#ita\'"ni&!i\'!c$\'opterix##nce$!g%#rad$#hot',
+    '#!s#$tage$%modus#!v"#fal#$orms#"su#,urterstrasse",g&auml;nzung.&sindex#\'-second#"as$%tikou&$vity$\'zomenou',
+    '#"el$"ne$!s##ife#(o-sphere$)dynamics.$%matic%$eter$\'nomical$&sterol$%teles%&herapy")h-li-t\'ou#$alte$)rdstrasse',
+    '##ebt#$wald""ia#"bo##cae%#les%!n$!e$(hthonios$$olin$,sson-hewlett#%dania$!u#!g$$eron',
+    '$!s%"en%%onian\'!s#!m#"n\'$$acea$.ga/telemonster%#ton$#oid\'!s%#sis$#yes#!o$&botrya',
+    '$$soma#\'phorium##que#$sort$#tic\'!s#!t$#age$\'hramita$\'richium##zzo"#kel$1nntnisgewinnender%$wald#*l&auml;ren',
+    '/!s#"um"(l&eacute#$abus$%nbach%#der%#ger(!i#\'ebacher$"ia%"gh$!n%-meyer-kimling$\'vestrop$$wine',
+    '$)ngsflokkr#%konig#!y"*m-inspired$+sympathiser/!s#!.##_as$"by$"in$%so_er$$that#%acora$&tingen#)enonville',
+    '%!m$!s%#sen#)ine-edged\'%lined\'\'trimmed&!d$#one#!o$&linsky"*n&aacute;n##aga$"ni#%dhura#\'esiders',
+    '$"ts#"ic$"e.%(/ernette#&mental#\'sberger$(t-ludwig%#ing%"on"%oded\'$%ingly%"um\'/pelagoniiflorum#%feyev#&gation',
+    '#$lius#"ni##oga#!r#&s-wise$"ca$/ion-susceptible\'!.\'$ally#,tic-drawings\')passionel\'$that&,ally-charged&\'isation("m\'',
+    '$%omane("ia"&pounds#&yngham)!s"(quelines$#iza".r&aacute;zuriz##=17#%ances%&d-boys\'$girl%%tibus$"rs$*tic/erotic',
+    '$%zuriz#"gh#$ibol\'!l$%chett$#dge$!e$!f$"ll$!n%$gham#!m$!m#!o$"ls',
+    '$$nius$+r&mdash;log,&number,$text%%-bars&*correcting&&filled&&looked&$trap*#ped%!?%.s-in-variables#&rrmmmm%!r#"up',
+    '""s.#%anyre$-tz-importance\'&kaiser##elf#$hler#"in#%kines#"ly#"oz#"te%!r$$feld""ta$!n',
+    '$&inbrod#)hematodes##ola#"r4$!7"(uctation#\'ditions#!m#&ptives""ve$!n$!s$!y"&warton&#ung',
+    '#$inia%"us##ood"%ygium#!i$$lmaz#"ou##rys#&themal(%tosis*/us/haemorrhagic%$raei&#ean&#ism&&oaphin',
+    '\'%genic\')leukaemic\')phthalmus(!s\'!s(#ine"!z#%ahlte$!n#"en#)ieherisch&#ung#,s&eacute;bet#$ulie$#rum',
+    '$#75d##330&!s%"5s$"40%!7$"50##500#/pormote2/w-diag$&romote#$said%$laam$$mara#"tu"!.',
+    '##pex"#175"\'345/355##50t"(a&iuml;e#&-quest#$/irs$$nasa#!a#)cerbation#"fs##len$"ly#"pe#"ri',
+    '"#bcd#!o#%rough"#c+x#)/esc&lsqb#\'225,000#)3,900,000#\'416,000$&39,000$&88,000#\'539,000$&43,000#\'601,000#+a-organised$$lada',
+    '&&tingly%#ier%$lops%$onia$%pable%,e-committees\'#kit\'%route$\'rboucle%#ole%#pit$#ude#!c#&halots%!r',
+    '&!s%(tologies$$born$&eators\'!s%%nberg\'#urg%%ricia$#olz$(richtius$)scholzias$&weiler#!o$&fferys$&hotado',
+    '$#ndo$!r%&t-size&!.&%/dash&#in\'$%ssoys$+tt/resident$$ubes#!p#%ravos$)ementizio$%ibano&(i&otilde%&toires',
+    '#!s#(uadrilla\'$ones$"de%#o**$$elas$%intla$&lentia%%turas$\'masiids"$dale$"ys#"ec##ras#!u',
+    '#\'getiche#"ma$#ent$#pio%&lastic#"ne$"in$$tial#$rine$"ve#!s#"tl"$f475#\'andiari"$gair',
+    '""ha#&eleagh$\'mbethel#%kolot##man##olt##ton#&ugbayi#$wood"#ili"!j#$berg"$kapa#&bridge#)dale-side',
+    '%#oes$*ns/1944-47#(o-juhani#"ra#!s#$uara#$view""la$%mabad%!i$"va#&ewhere""ma$"rk$"ti',
+    '$%raldo%)elda-less%#lda"\'n(mild)$\'severe)#"-m#"al#"eh#"ol$"uf##ure"$ocrt#\'phagram#&terica"/p&eacute;lugues',
+    '$(iacute;n+$rito#%-disk#$/acc#-a&ntilde;iola$&ce/mbb$#don%%rille$%gnola(!s$,lier-trained$%ranza%(to-grass$!t#!c',
+    '#)eariensed$!c%(ializada(!l)"ie)*y&mdash;in(!y$$dair$&ically$+ranto&mdash))-speaking&"se&"za%#eme%#sen',
+    '##gan##hyr##ies$&nettes%*g-anderson%#ozo$#rit\'\'o-santo$\'scopacy$+tali&eacute%!e##ley$#ins$#ose#(oecially',
+    '%#ter$"sa$%users#(ressione*#ist("vo\'\'o-style(+/cappuccino)*repubblica(!s$%it\'92&$-295\'!3\'&funded%!u',
+    '""q1#!e#"r.#%uadra(!s\'$ilha$&ilache&#ina(!e%#mau%,pul&aacute;s%#rla%#sse"$r=51#$ange',
+    '#)c-funding$!/%$afrc%%cntls%*department%#esf%$jaep%(mrc/serc%#nsf%#oda%(regional#!f"&s-food$#pik##aie',
+    '$%nians$%ouira$"y-&+collections&\'reviews&$worn\'%riter%&/class%"es#%emple$&nce(s)%,high/teacher%"se%%tial-*+at-the-time',
+    '*"to)#_in)%ising+1t/constructionist*"ty*"ze)!l\'"el&$yale$%quibo$!t$(x-london&#man&)qualified&\'suffolk',
+    '%(/suffolk#!i$\'en-udom$%ngone&#ton#&lingen#"of$#ins$#nne\'!s$%padam$#rer$#yes#!y"(t&aacute',
+    '%(grave;ve#\'-ce-que$$elle$$ites#/.ffr1&ndash;1.5(+.5&ndash;2m#"/a#1a&ccedil&atilde;o$!b%0ilizaci&oacute;n%%lised(*h/maintain)$able)#ed\'+!-',
+    '*$ment*"sa)"me+(nt-level.#man.*orientated-$open-"s..)/academia&%sihed$#dio$#gio$&hbanat$"in$%lagem',
+    '$&minets%!p$%ncias\'$eros%%darte%$guet%\'quinhos%!t$!s$!t%"al%\'e-agent\'\'bottled)(undaries\'\'centres',
+    '\'%grown\'\'manager.!s\'&owners\'.representative\')structure(&urveys\'\'village\'\'workers&#.it&.s&rehy;general\'(-general($tail)$heir\'!.',
+    '$)ub&eacute$&visham$!y#&bottom#"d.#&ebaero&+n-magdalena$!d$#em.\'%joyce&!e$$inou$#lar%"it$$pona',
+    '&$poor%$ases%#gom%+h&aacute;za&#aza(!y%"il%#lin%!n%!o$%sties$"ve&*z/marcheco#%field#.h&eacute;tique',
+    '$#art$#ers%\'ticians$$onia#!i$(alcodine%%mting%%toras$"er$%fanos$.l&iacute;stico$\'matable\'$e(s)(*s/receipts,&serves',
+    '$"ra$!s$$vant%"es##ler$#ing&!s#$oban$!i$,nian-latvian$!p%$ped.$#rbo%"ie$&uffade',
+    '#*rada-kalaw&#iol%$pade%!y$\'eatment\'!s%\'maduran$$idge%&thsson$$ogen(!s%"il#)uary-type$$dded%&iantes',
+    '&#gem$$rial%"my#!y$!n"&urient#$s4-e"!v""wa$*rakrishnan#!i#!l!(t&agrave"*-1-induced%\'stained',
+    '##270##aia"%._al."&4000ax"(500mc326#(500fy338&%hx845&%kt716)"27)"30)"41(#866&%ln010&%mb926)"68',
+    '(#207)"17)"24*!7)"48"!6".a&mdash;basque#\'-linked#!.#*blissement#"ge%!s#"it##jul#!l',
+    '#&ncelin$"gs#!p#%rnity$#ras#!s#"ul""be"+c&mdash;can#\'-become#$.ban#!/#!2#!e$!t',
+    '%)resistant$)asketches$!e%%berry%(d-mirror\')sandstone%$gary%"rs$&ingham"%ected#!m$#adi\'!.#!n$$alol',
+    '$,nal-maternal\'#ize\'!l(3y-caring-for-others*%young%"el%$itie\'#y.i%"um"&h-ical#!a$\'msylate$#nal%*esulphonic%"im',
+    '&(l-acetic(%fixed(,precipitated(%water\'%/0.5%\'):ammonium(%water\'5amine-phosphoglycerol\'!s$"te##el-%\'bergers%%dreds%$hild%!l',
+    '$#ne.$/r-anaesthetized&\'library%(/ethanol%\'coupler%\'ealized*#ing%)net-based)*compatible)-serial-pcmcia(!.(%/ieee(#ted%&switch%$team',
+    '$"yl#%icacy&)lly-based%!e%#ise%"ks%&olegal$%dium-(&bromid$"le$!o%"pa&!e\'"an\'!s',
+    '$&rajulu$$sche##lyn#$moid#%narch$0ic&rehy;armenian&6-/confessionally-based\')cleansers\'&fijian\'&german($reek)#oup\',meets-rustic(%oslem\',of-somewhere',
+    '\')religious&%/folk\'+nationalist\'(regional&,ally-defined+%mixed&$ists&!z$1o&rehy;linguistic+.methodological5!y,+usicography%\'-babble\'&iology\'(otanical',
+    '&\'centric-#ism&*linguistic&,musicologist&*psychology&&racism&)sociology%1/religious/tribal%\'biology%+centrically%\'genesis(!y\'(ographic&0raphically-based)"ic',
+    '%$lect&(inguists%-musicological/"st1!s%,pharmacology%\'science#"od$$geny$)logically$#pia$"s.$\'xylates&)resorufin#!y',
+    '%%amine&$tion%-ene-propylene(#2.3(4diaminetetra-acetate4\'acetate8"ic*&thiolo%%hexyl%*inediamine$#rra"$iang##bar#"ca$#son',
+    '#"en%(ne-emile#!m#!o$$late%&ogical("es$$phia#%salat"#kin"+na-watchers$\'/sicily$!s$$ward##ean',
+    '"+oecologista#!h#*n-educated$!a$&ne-moi$!s#"ok#$ughe"!r#+&egrave;nes#$-254#-ang&egrave;re&$eres##ier$!m',
+    '#+uscan-style&"hi&!i&!o\'(-italian\'&logist%$ques""s.#3ou-nzabi-bamungwabi##uro"!t#!e$%la\'at&"at$"ns',
+    '&#ers&&hausen##ori#"ra$&ingite""ud$%iants"#was"$xabe"(ymologic*"um)$sing"#zel#"li#$muss',
+    '#"m3"!a#$nder$&gelion""ba$\'cterium$)nk-ahrens\'\'barkley\'%piper&&/world#$ulus"0calyptus-scented#%haeta%+rist-church)%/holy',
+    ')!o#$lase$$idis##mos#%nemus#(onodonts#%rates$#ite#+s-supported#%ypris"&daimon$#mex#$emis#$oxie&"us',
+    '"&eliner#)ncristene$$tide#"re$#gos$!i$(lastynge$$more#$song""fa"6g&egrave;ne-aim&eacute#&ametos#!e$"en$&issona',
+    '%"es%,ically-based&#des&"os$*osynclinal,"es#4lenoids/kinetoplasts#*osynclinal#"ui"&kronia"%lalie#+er-beroulli&%lotka&\'poisson-(-darboux',
+    '#$ogio&#ses&"um#!x"%mares%"os#&elanin%"io%"os$#nea$#tes#!s"*net/relcom#)gellensis##joo',
+    '#%uchry&.s-in-the-harem"!o#&nymous#$pean#%ticus"%pator\'!.#"en#\'hemised(.tically-minded&$sism$&oberia%!n&"ia',
+    '&#ion&&osinum$%rasua$$uism\'#tic$$ylia#&lectes#&sychic"$qity"*r&iuml;pos#%alair$$sure$!x#&ddrail#!e',
+    '##gah$!h#(hetemecs$$odip$&ythmic#$ican%!h%%ianus$#kon\'&europa$!p%$edes#-o&rehy;debate$\'-&pound%#aid',
+    '&)llegiance&%mbush&*rtscribble%&banana(!k\'"sh&"id\'$shop&#lue&$rand&&uffers%$cash&&entred&\'hampion*!s',
+    '\'(ristians&$lash\'&ubbing&%omics()missioner)%uters((petitors\'(nsortium)*tituencies((vertible&$racy&&ulture\'#tie&%ynics%&debate',
+    '\'%fence&)irectives(%igism\'(sneyland\'#zzy%$eire&)nthusiasm&$vent*!s&)xecutives&#yes%$fair\'%natic,#ism&)ederalist',
+    '&"is&-oreign-policy&%rench&$udge%&gabble&#lam&%ospel&$roup%%hands\'$ters&\'opefuls&-ypochondriacs%%index\'\'fluence\')stitution',
+    '\')tegration)&ntions\'(vestment&&talian%%jaunt&%udges\'$nket%(language\'&vatory\'$wyer&#eft\'$gend&#oan)!s%#man',
+    '&(echanism\')dium-term&+illionaires\'&nister-!s&$oney\'(ralising\'&untain\'#ves&$yths%(nonsense\'#tes(#ion%*operations&+rganization',
+    '(%tners&$eace&%horia&"ig&%lants(\'titudes\'"ot\'"us&\'olitics\'!p&)ragmatist\'$efix(\'sidency\'#ize\'\'ocessed',
+    '&\'uddings%%quest%%ready\'&covery\'%forms\'$ggae(\'ulation\')searchers&#ock%%sails&$care&#lut&%occer&$port&\'terling',
+    '&-upercomputing&(ynthesis%(thriller&#our&&rading("in("sh&!v%"uk%\'vanette&*isionaries&#ote%&waffle&#eek%#yen',
+    '$(.credits&\'urrency$$/dpc$*actividade%*griculture%\'merican%#ton$$band\'$kers&!r%$ills&!t%$land%$oard%#rat',
+    '$*card-style(2/mastercard/access(!s\'!e\'"go&"ts%%hamps&%icken%%lydon%*oinmunists&"mp&#ver&"wl%#rat&#ypt',
+    '$$data%\'isaster\'!c\'\'neyland%%rivel%\'ynamics$(election$\'fanatic&!x%%loppy%%rancs$#gas&%teway%$enic\'&tleman',
+    '$$hack(!s%#its%$opes$%index&(focentre$$joke$(language%&eisure&!x%#ine%$oans%#uce%$ycee$!m',
+    '&"sk%%erger%\'issiles&!x%%ovies%$yths$%nomia&"rm$-p&auml;ischen&*eacute;ene%+-assistance%&a-bund&!e\'!i&,jugendsieger',
+    '&!n\'"et&#per&"rc%#car%"e-\'!1\')argentina(!s)"ia\'&brazil\'+centredness\')dataquest\'#far\'%japan',
+    '\'#see\'"us&!.\'!i&./mediterranean(%iddle&#_as&/an&rehy;centred()-atlantic)$born)\'centred*)onsortium)$free)%level)$ness',
+    ')%owned)%sized*\'tandard)\'trained*#ype()/american*$sian)"ec)$rest*\'henania("ey(%izers()nesswhich("ut&#ene',
+    '%%hilia&$obia\'!r%"ia&%skaya%$lant%&ointer&&litics&#ort&"rt%$rats&%oblem%%sport$%quest$\'radical',
+    '&%iling%\'esearch%$oute$$safe&!m&\'tellite%(clerosis%%earch&"rv%$hank%"ki%#oft&"ng%.port/eurogoals%$tars',
+    '(#ute&"em&#yle%"ud\'*-calvisson&$rvey%$wiss$#tas&!x\'!i%"ec\'#net&&rminal%(rack-100\'"sh',
+    '&#eks&"ib&#ust$#vat$$wide#$pean##way#%yalae$&bathic%%iadas$$dike$%medan$&pterus$%thion&%mists',
+    '"!s#$apia#"eb#!i#&kadiko%"ra$!o#%milia#"se%!s#+tace/bonsai&#hio%$quio%#sio$$erna',
+    '-*manchester&%-king")teleology%%tracs#.h&eacute;rapie$%anase(*ia/suicide$$eria$$unai$&ymenes#"in#$rop.&*hicationin&#ius#$yche',
+    '&#ius"!v"$xine%"os$%theos"#yll#&nsonge!+v&eacute;ry#%mdash"&\'nings##one#%ryone"$-100$"2l#"45',
+    '#!6#*ev-ev-ever""10""a.#!c$!u%%ated.)&_along\'*ion-decree+#two%#ted##der#!e#(gination#!h',
+    '#$la07%"11&!6%!2%!7$!d%"08$"ie$\'lonians$!u%2ation/consultation+,modification(*ve/emotive\'#ory%$tion',
+    '$"ce$#dro$.g&eacute;licas%%eliar(!c)*al-baptist+-/humanitarian,\'secular)"he)#ism("en)"ry(/st-propagandist*"as*!i',
+    '\'"ou$!i$0s&rehy;pritchard%\'-clarke&\'halshaw&&turner%!/&%aaron\'"ea&)clydeside\'#pre&)geriatric\'$ypsy&(landlord&\'patient',
+    '\'+resentation&&thames&%vicar&$west%*discovered%$iana$"te&!s%#ius#%por-8&%ators&$itic#%ready$$isti#%thane',
+    '"+e-of-budget\'*conference\'$play\'&strike(%ummit\'%talks(#est\'\'wembley$\'teasers(#ing#".r#$/sat#$leen$#ing\'\'/inland',
+    '%%ndash$!-%&better&3igger-than-expected%#god%&length%\'matched&#ore%#par%\'stevens%&temper\'&xtured&%opped$!.%\'swindon',
+    '%"as%+even_though$&ed-off%$real%&utally$$fall$(handedly$!i%!n&\'g&mdash-%;that(*ndash;only\'&-class)%oated(%gowns',
+    '(%paper($star($time\'!/(,25/10/93/cde(\'parents\'"s.(\'/coffee++nsultations)*interviews%"sh$#ley%\'y-based\'\'divided\'&shaped',
+    '$-ness_in_terms$#son\'"gs$.t&mdash;public%#(s)%&-drive&)frequency&&orders(&iented&(patterns&$tree*!s%&.joyce%,/idea/method&$mini',
+    '%$ness%+s-arranging\'$that&#.it&+/activities\'&crises\'%human\'\'mosside\'\'reports\'&states&%_sort%!u&&ations$%weave#\'r&mdash',
+    '%.rehy;expanding*\'greater,%owing**increasing*\'lasting*\'present*&rising*)weakening+\'idening$!\'%%thing$*-absorbing&,ccommodating&(daptable&$fter',
+    '&&nxious&(ppeasing()roachable%\'beaming($ring($ting\'\'ckoning\'(nevolent&%igger&$ored\'$yish&(ranching\'&ighter&&ulging\'%oyant',
+    '%&caring&*irculating&)omforting\'(nsistent\'%rdial&(rackling\'&eative\'%owded&&ynical%)dangerous\'$pper&)ecorative\'$eper\'\'sperate&+isappearing',
+    '&+rawing-near%\'earlier($nest&(bullient&&lusive&+nterprising&\'scaping&\'volving&#xes%)facetious\'&miliar\'%ncier\'$ster&\'eckless\'#wer',
+    '\')uctuating&)ormidable&$resh%&greens%)hardening&%idden\'(storical&)ospitable&%umble\'$ngry%(imminent\'\'portant(%roved&\'ncisive(&reased',
+    '\')dustrious\')quisitive\'*tensifying\'\'ventive%(labelled\'%sting\'#ter&(oosening\'\'udening*!r&&urking%\'married\'#ted&.ore-irrational*(populous',
+    '%\'nervous%)observant%*persistent&\'leasant&)recarious(%sents\'(otective\'%udent&2ublicity-conscious\'&zzling%)rancorous&\'elevant(&uctant\'%newed*#ing',
+    '+#ing\'(sounding(\'ponsive(%tless\'\'turning&(ighteous&&olling\'%tting&%uling\'&mbling%\'scarcer\'\'rolling&%haded($ping("rp',
+    '\'"ut&%ilver&/o&rehy;slightly\'*-desperate))iplomatic(\'english)&ver-so(#hot(&proper(+respectable(&slowly)$orry($thin&+pellbinding&&teeper',
+    '(%onger&$ulky&&wifter%(thinning\')reatening&&ougher&#rue%+unravelling\'&stable%(vengeful%\'wagging\'%iting\'%sting&(eakening\'%lcome',
+    '%%young*"er$!.$&_since$$aert&!t$%baddy%#est$%clene%$ourt%%reech$%denes&(veloping%#ing$"ed',
+    '%%stine%(tt-green\'+/eyewitness\'!e\'!s%#xes$%gates%$lade&"um%#old&"od%5reen&lsqb;heart-throb)/-forest-dweller&%owing$$hart',
+    '%(t/thames&(t/milton$$land&"st("in*"gs(!s&#ure%#ook&"rd$$mair&"re$#nia$\'popular$&queens',
+    '&#eds&#olt%$ible%-on/competitor()neighbour\'!s$1thorpe/humberside%#idy%,on-liverpool%#rin$%where$*y&rehy;day%!\'%!-&(changing',
+    '&5night-something-awful&)other-day&%ready&&second\'\'o-often&2this-and-thatspins&%where%(.convent%#bod(#ies(#y.i)!s%)damnwhere\'%y-the(#/ed',
+    '%\'f***ing\')ckinwhere&#ink%$nerd%3one&mdash;reformers($-but)+for-himself(%.even%"th\'&&mdash\'*ing\'-tried*$-but+,mini-weapons+#not+)on-demand',
+    '+)under-the*!s)!k&#own%!w&"ay&!h\'!e((re&mdash*%-like*\'.rather*&abouts&"un#$sdon##tte',
+    '#!y"!f""ga#%eniya%"ny##raf"%h5150"\'ichstar#!d$%ence\'(+-conclusion)!i)&taking(".a(*/rationale',
+    '("d.\'"ve&$t_in\',ial/security#"ew#!g#.l&rehy;looking$"-a%$doer%&omened%(speaking%\'tasting%\'wagging$$/sin&(uffering',
+    '$$doer$!l$$ness$!y##nos$#son#)ronmental#!s$(cerating$\'on/west##zzo"!n#!s#)vironment"\'o-stick',
+    '$%ateur&/ively-monikered&"or$!t#%dence#!e##ker%\'s.7sup9#!l$+u&rehy;tion%%tion\')7-plus-natural-selection)!.)-arily-induced)"s.',
+    '$"ne"7p/pev&mdash;evangelical#\'atoriia#!s"!r##ard#&emonde#"on##ugo#$yone"$teev"$vahh"%ysdon!&w/c473"%angai',
+    '%#ian$"ti$#yst"#cba"(e\'s-milk#&-grief$&mutton#$/ram#$bank#%leaze##nny#%retta#%s/man$$dale##web',
+    '%!n#,ng/mccracken%!i%%swode"(mergency"#oks##ldt#"rp#$ttes"!p"&s-4800#(4800/380#!m!0x&eacute;cutants-#eur',
+    ')"lt#$rehy\',;absolutists)\'cademic)#rmy($cons)$used(\'display()ecutioner)(mployees((fakintil(\'general)$reen(%hubby*&sbands',
+    '()liverpool(&marine)%ember)(illfield((partners))erimenter)%ublic((services)$wiss(*television)\'raneous*%emely"$-253#"41#"53',
+    '#"60#"85#$abbe&"ot(!s$$ctor$%d-man%%dicts%%verts$*erobicists\'$flot\'%space$%frika$$gent(!s',
+    '&#man$(ldershot%\'ignment%&liance%%thorp$&mateur%\'bulance%%iners$&ngelic%,thropologist$\'ppanage&(rentices$)rchbishop%#med%"se',
+    '%*tilleryman&!s$(ssistant$\'ustrian##b.r&!.$(allerina(!t\'&yclare%"nd%&rclays&$maid&%nardo&&racuda\'%ister',
+    '\'!y$"bc$$each&$tnik%%tween%&vanite%$xley$!f$&iology%"su$"kr$$lack%#ues$"na$$oard',
+    '%#bby%\'dyguard%)g-trotter%$mber%"nd%&omtown%$rder&$stal%%snian$(rake-end&"ts%#ead%)icklayers&\'gadiers&$stol',
+    '%&oadway&&okside&!s$!t$"uf%#ick%#nny%(reaucrat%!s&%iness%%tcher#*california-!n&#lie%,mbrian/great',
+    '%$rlos%\'tholics%%valry$&ellent&!t%%ntral\'!s%!o$!h%#air&&llenge&(ncellors\'#ged\'#nel&%rlton',
+    ')!s&\'uvinist%*iddingfold&"ld%$rome$"id%%tadel$$lash\'!s(&icists%\'ergyman\'"ks%*iftonville%"ub\'$mate',
+    '%(lchester&$lege&%onels($ists\'$rado\'*urfieldman%\'mmander*!o+!s\'%odity("ns)&wealth\'\'unicate-$ions(#ter',
+    '%&nduits&\'scripts\'%table,!s\'"ul&%vener)!t%)operative)!s%%rnard&\'onation&*respondent%%ssack%%uncil*$lors',
+    '&#rse%#ven%#x\'n&%swain$"pr%"su$$rash%%ewmen%&oatian$#ska$\'umbrian%(rriculum%%stoms#%daily%%ncers',
+    '%#vis$&ealers&!n%$cies&&orator%%fence%\'magogue&!o%%ntist%#rby%&tainee$\'ictator+!s%&nosaur$%ocker',
+    '%#wty$!r%%agons%$exel%$iver%%ummer$#uce&&hesses%$ndee&&gannon%%stman#%eagle%(stenders(%rners$#cml',
+    '$(llesmere$(mployers$,ngine-driver$(piscopal$)quitation$"rm$#ton$\'uropean&&ythmic,!s$)verything$!x%\'aminers%(hibition#$face',
+    '%"ll%$rmer\'$hand%+ther-in-law$"bi$,eatherweight%#lon$%ibres%&ghters%%nance)#ial&!i%#rst$%leadh&"et',
+    '%&orence$\'ootball%%reign%%under("ry&,rth-division$(ractured%%eddie%#ont$(ull-time%\'rniture$"yt#$gang%&rdener&$tner',
+    '$!c$"ec%&offrey%%stapo$!i%!t$"lc$!n$(orbalite$$rand%$eece\'!k%%ocery$(uardsman%\'errilla',
+    '%$ides&#tar%$nman&#ner&!s%$rkha$!w#\'hackers%%lifax&!l%$mble&#mer%%ngman%1rlem-globetrotter%$tred',
+    '$)eadhunter\'#man\'!s&#lth&%throw%"ll%&ritage&%rmann$$ired$"ms$#obo%$ckey%\'llywood%&rseman%&spital',
+    '%%tfoot%)usekeeper(&martin$%urler%#stu##ibf$"ci$\'mperial$&n-laws%(dustrial*!y%$mate%%sider&&pector%(ter-city',
+    '%%valid$$ssue$!t%%alian#%james$&ehovah%$suit$#imi&#mie$"ob%"ck%"hn%(urnalist(!o$#udo',
+    '&#kie)!s#$kadi%\'lamazoo$%ennel&!t$"gb$$ings&\'lochewe%%tchen$\'lansman$#nob#!l$&.g.o.c%&n.w.r.',
+    '%"dy%(ncashire&!d\'$lord%!w$#ead\'&ership&%guers%#gal&(ionnaire%#mon$$ight%&nfield$"mr$#oan',
+    '%"ng%&op-ers%#rry%#tus%#ves$\'yricist#!m$".n$(achinery)$ists%&gazine%$iden%#jor%$kin\'%!n',
+    '&%darin&%orian%$oist%&riners)!s&$xian("st%#son&#ter)!s%!x%&yoress$"cc&(arthyite$%ental',
+    '%\'rcenary$"i5%%chael%\'ddlesex&%field%\'lkshake&!l\'#ion%&nicabs\'"ng\'$stry%(stresses$%odels%)narchists%$reau',
+    '%$ssad%$ther&#ley&"or(%cycle%#vie#&n.c.o.%$e.a.$%apalm$"cb%!c%"os$)eighbours%!r%(tworking',
+    '&&market&$port&!s%"xt\'--door-but-one$$iall%"ck%!r$"me$-onconformists%(ttingham$\'uffield%$rses$$ymph#(occupant',
+    '$&lympic$!p$%rient%$rell$*valteenies$\'xbridge%$ford#\'p&amp;o$%aduan%\'kistani%,ramilitaries\'!s&+ents-in-law&"is&"te',
+    '$%enpal%\'rmanent&%sonal%"st%*terborough$\'harisee%!d%"il\'&osophy$"il&"ot(%-boat(!s%%stols$&layboy',
+    '$!m$\'oachers%#gue%1litical-prisoners*#ian-!s&"ys%"ms%&nytail%"ol%\'rtadown\'&smouth%&sition&#tie%"ws',
+    '%\'esenter\'(idential\'#sed\'#ton%$ison&$vate%*obationers&&fessor%&ussian$(ublisher%"nk%"wp$!w#\'quality#%r.a.f',
+    ',!s%#dio%$nger&#ker%#ted$#caf$#eal%$bels%$cord%"ds&&undant%(gimental\'&stered%)naissance%&porter',
+    '&,olutionaries/!y$$iver$+oadsweepers%\'ck-star\'#ers%#ver$"pr$%ugger%#led\'"rs%%nning%%ssian#\'sabbath%"cw',
+    '%$ilor)!s%#les(#man)"en&!t%"nd\'\'inistas%$pper%"ru%&tanist&%irist%\'xophone$%canro%\'hoolboy',
+    '*\'istress%(ientific%!o&%tland\'!s%$ribe$"dp$*ecretarial,"es+)y-general,!.%\'llsword%(minarian%(paratist-!s',
+    '\'!s&$vant\'(icewomen)%vemen("ng%!x$%hadow&(redealer%\'effield&$riff%\'ipmates\'$yard%%ooter%%unter$\'idekick',
+    '$\'kinhead%!y$)mackheads$&nooker$%occer&\'ialists%&ftware%$lder&\'idarity%$mali&%erset&\'ocistas%"ns&!y%$unds',
+    '(#met$&panish%%encer%#ies%&oolers&$use.$&queeze$!s$\'talwart+!s&%rdent\'!z&"si&"te%)eelworker',
+    '%&ockton%)rathallan$*ubmariners%#gar%%icide%-n/ex-rational%#per%$ssex$&wansea&"po%%indon&(tchboard#$t.a.$&alking%"xi',
+    '%\'chnical%%enage*"rs%\'lescope%*mpletonian%$nded&#nis%#sco$&heatre%#ree%%yssen$-ied-cottagers$$ommy$&rading&&falgar',
+    '(#ees&(nsaction%$igem&$nity%(otskyist-!s$&sarist$\'unisian%%rtles$"vh$%ypist%%rrell#!u$"dc$%lster',
+    '(%tones%$ited$!s%"af%"er#%valet$&eteran$$icar&$kers%%etnam$#oto#$waaf%$ffen%"ge%%ilers',
+    '%%lkers&!l&(thamstow%%rbler&$dens&#saw&$time$"bo$!d$#est\'#ern$#hat%"ip%!o$$itch',
+    '\'(s/lovers$(oodentop%.r&rehy;kington&\'kaholic\'&houses\'$mate&(ld-class&&pswede$\'restler&$xham#%xerox#)yugoslavs"#.10$!2$!3',
+    '$!a##2.1$!b$!c$!d$!e$!f#"30$!a$!b$!d$!e#!4$!0$!a',
+    '#"5a$!b$!c$!d$!e#!g#!p#!s"%/100s"!1#!2#!4#!6""23"!3',
+    '%$fmtr#!8#!9"!5"(=husband"%_army",a&rehy;mined##cta&#lly%%ly-so\'*_in_excess%!y$#yly#(eretodon#.g&rehy;gerated',
+    '$\'errated$.gera&rehy;tion($ted.*+s&mdash;and)#in\')"on*!r)#ted#\'hausted##kly#"ll$(t&eacute%&ations%&edness+"es',
+    '#$m(s)$$-aid%%bound%%entry%*orientated%$room%%taker$!e$+in&rehy;ing&\'ability\'"nt\'#tam("io*\'n&ndash+#(s)',
+    ',(oriented,$type+#.in++/assessment,$test+$s.at-!e,!/-+assessments("or&"e.(\'request\'$/try\'$d-in(!.',
+    '&#ied\'"n\'(&g-room&!s$-ple&mdash;all\'!\'\'#(s)\'!-(&always("is($than(%where\'!.("at(#the',
+    '\'.:understanding&%ified(!y$\'s/tests#!n$#der$$ples#*planations#)sasberate$%kirts$(paration)"us#$tron##udi"&b-8500',
+    '##ury"(c-c-cuse#&aliber$%rnate$(valryman&)tion-team#!e$"at$"de&!d$%ed2/h&!3\'"/h(%w-dai*#sim',
+    '*!s\'!s$$lcis%#ent&%rator%"la\'#nce(!t&%ence\')"ie(&t-four*0maker-of-baskets&!s%%siors&!o',
+    '$"p\'%"t-&%=only&!e&)ion-based)#al.+./extraordinary+)ly-strong&&yonall$&rcises(#ing%#pta\'#ing("on%$sise',
+    '&$(es)&*/franchise&$ible\'#ve\'##han&)&rehy;ges&!g\'+e&mdash;see),rehy;control(!\'(#(s)(+-determined)$free)&listed)*management',
+    '*&everse)&scheme*\'witches)&traded,%nsfer(#.by(\'/refund("s.($ways$.equer-financed+%unded)$gate#$idia$&pients$-se&mdash;just',
+    '%%ional$!t%$ants&-tion-emission*,/maintenance%%eants&)d-looking(\'nervous(%state\'#ly.&*ment-value*!.*%/deep%&otoxic#\'laimed.',
+    '%-mation-marked)"ve+!s$+ud&rehy;ing&9ability/non-excludability&,ed/rejected/%-sion&mdash;if)#ism\'#ve\')!-)\'/shared)$lyby&"on#0ommuni&rehy;cate))cation_as',
+    '%(poration#%perts#\'rement-*&ridden)$ally%%scent$\'uciator+!s%$sive%\'tiating#\'ulpates%%tavit$#rse\'!s&)ion-train',
+    '*!.$#sal&!t\'#ory%#e-a\'"me\'\'seekers&-d/unavailable&!z%%ingly&#ons$$tion&"ve$%uuuse"*dependants',
+    '$!t#)c/hotshot$%esses$&hotels$%llent$"pt$"ra&%bilis&$ting%%etary$$tive%$uive$!u%#con%%irire',
+    '&#ed.(#_in&!i\'#nor\'\'on-like)+er-in-chief\'#ve\')*-dominated*%elect*)initiated*#led+#ook*\'manager*(produced1!r',
+    '*&search)\'/client+(ollector*\'english*+legislative+$ocal*\'malvern,&naging+&orland*(research)"s.*$hips&#one\'&rship.#$drae',
+    '&"ic$!i#&l-edge#(mplarily&)ificatory)#ers&#ory&&yfying%"t\'&$ion.)$s_as)$this$%ynyde#(ncephaly#"pt',
+    '#!r$,cise-bicycle+"ke*$ooks)%doers)%rings()/activity)$time)$work(!r\'#in\'\'"ng%$ycle$$ptum$$sept',
+    '&"se$&tional&"se#%ssses""f3#\'oliants$"rd"!h##all$$nged$\'usation&*t-belching(&heated(\'mounted($pipe',
+    '\'#ed.\'$ion.*!s(%vely.\'$less#!i$!b%#itd\')ion-going+#the,$rain*!.*\'/public+%sales*"s.',
+    '%$tion$-l&rehy;arated%&arates%\'eration%\'iration#(orbitant%&tacion\'$tive&#ion#(uberance$#rst"!i#%erunt#%gence&#tly',
+    '#$lius#"ma$"ia%#ous#-s&rehy;tences$"ed$$ited$$t(s)%!e&$nce-*#for*\'through+!o)%/just)"s.',
+    ')*worthiness%#in\'\'"g\'()/proposed%+s_according(!t#%t&num$,-consultancy%(entrance%$poll%$ramp$$less#"vi"!j"#log',
+    '$"re")o-narthex#*biological#)cet-armed\'$like#/dus-deuteronomy&"es#&enzyme#*n-specific$"er&!s$"ia$(ucleases(&olytic#&phoric',
+    '$(terygota+!e%&halmia#(rbitante$%cises\'%morum\'#tic&"zo$!s#&stoses%&rakizo#%teric$$heca%\'yethane$\'ic-eyed',
+    '&%izing&!k$"ox$%ropic"-p&eacute;dito$\'formula$-lsqb;erienced#)-erlosion#$amet$!n%-&rehy;sionism%*d/contract\'.develop/change&\'ed-mind(!.',
+    '%+s&rehy;ions&!a&#ing\')on-minded)$/the*$vent)$able),ist-sounding\'(ve-toned(%ities$%rtner$\'tiating%&riated\'#ots$)wnbrokers',
+    '%&ations%#ked%"t\'&!a\'#nce))y/valence*#:66\'$tins)#on\'+#-as&-ed&mdash;that($ness&&ing-as))_an_awful\'#ons',
+    '&#red%"xt$%dicio)"ne&$ent.)#ial&$ters\'"io)"n.+"in*(/fleeing+&rescue*"30*#ing\'"or',
+    '($usly%!s$%eting$%l-air%\'lations$\'ndable.&$itre(+ure-control-&utting,\'related.)striction,$type+$/gdp,(national+%1,747',
+    '%"sa&+e&mdash;was\'1-account-friendly\'(s/excess&,ive-sounding*)to-patrol-&repair-&supply,!y),.incremental)\'/cheapo)\':report)+ly-acquired,\'dressed,(equipped',
+    '.&oduced)$ness$$rean%-i&rehy;mental&%cence&*ementation+!s\'$nce\'*#(s)*!-+\'centred+(exchange++independent,!s+%rated',
+    '*!.*//administrative-$vice+)resources*"d\'+&-based+./inexperienced*%s.but(&tation)"ia+)lly-based&/men&rehy;tation))t&rehy;to*!\'*&-based',
+    '*$/try*#_in*,aci&oacute;n+"l\',(-control,!l-)y-derived/&minded.!.+-tion/disguise/!s*%ellen+(r-behind-(in-front*%s-the',
+    '+!1%$soft%"t\'&\'/novice&!a&#ing\'#se\')(/ability)%_such&\'s--have((swapping((training\'+/scientists$%ssion#&iating',
+    '%+e&mdash;and&"d.#,lain&mdash;i\'!-(#ail\'%ation\'#ed\'(!r\'#in\')/g-understanding\'"s.%&nagion\'#nda)"um(!s',
+    '\'%tion.+#for(\'oriness*+y-normative&&tation\'#ing$\'etively$)icability\'$ndum\'$tory&&it-far(".4()ly-stated*!.*-/dismissively',
+    '%)qu&eacute\'"er(&z-vous$(oded.the\'!r(!s&$ings&!s%"er%(it-ation\')ativeness%%rable\'%tion.+*/elevation-(motional',
+    '+#ist.!s)$vely(%orily&$e_in\'$d_in\',r-naturalist((.however&-ing/enquiring%%sion\')\'-clouds*#the)"s.\'*ve-related*&tipped',
+    '$%usion#$o-92$&center%%onsul*!t$\'itation$&losion$%nants%$ence\',t/transition(%iated+#ion$#rt\'&\'-credit\')dependent',
+    ',!n\'(inclined)&dustry\'$only\'\'stopped\'%trade&,/importation&\'ability&#er\'()/importer&(ing-only&"s.("30\'%_such$&sarium',
+    '&+d-aggregate(%coast\'%/that&!e&!r%\'iciones&#tio)#nal*"is%)ure-based),conditioning)$test$#zoo#(reienced&%ments',
+    '&+&rehy;sions&*i&oacute;n&(s-geared(%train(#way\'!/(%fears\'!d\'-e&lsqb;d&rsqb(!r("sd\'$ing.((on-marks*!.*)/variable',
+    '*.ist/surrealist*"of($vism+!t*"ty)!o\'$line\'#ors\'#sed(#ion$"ix$(opriable)#tor#"s.$#ore',
+    '%!l#)ulsionism)+s&mdash;the")queeze-me%#nce$%isile\'*te-looking)+ly-sculpted-\'tylised,(tailored("us$#ota$$site")rcretions#\'esident',
+    '#!n$!r"!s#*aguination$*nguinating)!e)$ised#\'culptus#%ected#%heath(#ing(!s#%moker(!s#$pect',
+    '("vi#!t$$atic$&udents#&ultate"/t&eacute;rieure#%.3826#$2500#!a$"be$$ctly%!y$"sy#!e$"ch',
+    '$"me&"ly%)poraneous."ly)"re(%ising)&zation/!s*!e+!d+!r*#ing$!n%,&rehy;sively%%-sive',
+    '%)d/retract&\'ability&.ed&ndash;range((-caption)$edge)&family)%range()/upgraded&$ing.%"sa&!e&%ified($ying\'\'on-line*-of-sentiments',
+    ')$ally\'*ve/limited)&:mdash)-ly-researched,)travelled%"t\'&#-by\'"so%%uated)!s%$xded$!p$&rieure&(or-grade(\'isation',
+    ')$zing%(minators+#s.s*"um(#ism%$nal\'(%-wall(,/situational($ists)*ty/utility)$zing((ly-based+*controlled+&funded+(provided',
+    '+\'sourced*!.&&steine&"um#/in&rehy;guished%&ct.now\'$ion.%(guished.$\'rpating##oll$"n/&*playwright$&rtion\')!.)"er',
+    '#&pected#!r$)&ecirc;me$2a&mdash;curricular&-rehy;ordinary+&social,%trong%*-abdominal(\'sorbent\':dded-indie-generic-overlay\')limentary($pine(&veolar\'"nd\'$xial',
+    '&\'calorie(%reful\'(lassical\'\'ontract.%ually+(oversial("st\'(urricula&.denominational\'(ifficult()mensional\'\'ramatic(!y\'#uty&)efficient',
+    '\'#ine\'#ull&%group&)hazardous\'&ealthy($ight\'(imalayan\'"ot(\'usehold&+illustrated\',nstitutional(\'tensive&*judiciares&$life((turgical',
+    '&(metrical*(opolitan\'(otivated\'&urally(%sical&%nasal&&office\'#ral(,ganizational&+performance\')henomenal(+ilosophical(&ysical\'(ictorial\'$oint',
+    '\'$roud&)realistic\'#ipe&&school\'(ensitive*%orily\'(hapeless)"rp\'&moochy\'%ocial(%matic\'\'pacious(\'iritual\'\'trength)#ict',
+    '\'+upermassive&(talented\'#hin\'$ight\'%ragic&%union&(vehement\'\'igilant&$wide("se\'#ork%!4%(biblical%\'cardiac&(ellulary',
+    '\'#ant\'#ers\'&ionist%(dictable\'%table%(familial&#ilm%\'gavance%+hemispheric%)intstinal&"ts%)maritally&(edullary&&urally%\'neously',
+    '%+oesophageal&!r\'\'dinario,"ly,&y-deep%!p&)ancreatic\'+rliamentary&*ericardial&(lanetary&\'olative%"s.&(ensitive-#ity%*terrestial',
+    '%(vagance.(%ences*!t\'%ngant\'$sate&&eganza\'2rsion-introversion%%zonal$$elut%"ma\'#ble\'"do&"e\'\'%-case)%entre',
+    '(#use(%value\'#lly(6y-dirty-white-coloured\'#nly&$ism.(#ts.\'\'ty.what&"ly%"te$&icable)!y%%nsick$(ordinary%(spection',
+    '%*vertedness)"ly$&udable%%sives#$ynct"(uberants#"dr#(lceratio$%tancy%%ingly#+p&egrave;re$#ery#$stus#$viae"%waste',
+    '"%x.1-3%!b#\'cluding#(on-owned!"ya#!l#"rs##ses""be##ler"!c"%delie$%nburk"-e&ndash;bleak$*rehy;brows',
+    '*#ite#)-achingly$\'baggage&%lling%#eam%\'linking)!s&&urring%#olt%$rain&#ows%&urning&!t$$care&&tchers',
+    '&"ve%%harts%&losing(#ure%)oncealing\'\'touring&%rners%\'rossing$\'definer&\'manding%-ropper-bottle,$type$\'filling%$lame\'\'ttering',
+    '%&lasses%&uarded$$hand%$eavy%#ole$*irritating$#lid&"ke&"ne%&otions$\'make-up("up%&ounted%$ucus$\'openers',
+    '&#int%%hones%\'leasing%$oint&$king%$upil$(readable%"im\'!s&#ngs$$scan&\'orching&%reens%&earing%#lit',
+    '%)martingly%$ores%&potted%&topper%&urgeon$&taking%#ech%$heir%(orturing%(winkling\'#tch$(velocity$$wash%%ounds#$/and',
+    '$$ear/$#gun#$1992##bag%/ll-photographed\'"er%"th\'!s$!e%#ams$)right-red-\'-fescue)!s%)ow-pencil(&raiser',
+    '\'#ish\'"ns$(u-bakand#$caps##eee#$hole#/lash-fluttering$)et-holing&"ed&#ted$*id-rubbing\'&shapes##pad%#int$#its',
+    '#*s&mdash;in$!-%(and-ears%.cast&rehy;down%\'of-blue%&peeled$&creens\'"ws$$free$+hadow-liner$%ight.%$lmar$%ocket%)re\'cranes$$tone',
+    '"&gptian%!s"&jolfur"#ken"#ler$&s/race"$mard#$eric##ore""ne$%sford#&hallow%!m#%sford"#ots',
+    '"$raud#!i##oun"%slate#$mont\'!t(1minister-director##sen#&ymontt"-ton-on-severn"Bvkclenrvavlenqnktlieelkalkdlychksd"\'wooddes!&z-zohr"\'anville"$cema',
+    '#!e##iza#!k$!e%!.""ia"(kerra-ee""oe##oli"#ra\'$$pour"&tetyke"$zard#$edin#!i',
+    '#$umpo 7f&aacute;il-progressive+#_in#1circ;l-n&acirc;me#\'elig;st#$mp;b"&bsol;s"\'dollar%(,;122,600,000*"83)#248)!3*"30*"40)+476,700,000',
+    '**38,000,000*)5,000,000)*69,700,000)*74,700,000)&setprv"+eacute;anor)#bus)&condes),d&eacute;ral5!e4$stes)"es)$ilim)&licien)&meline',
+    ')%nelon)/odalit&eacute;s+#ore)"ri)!s#(grave;re#.uml;licit&euml\'#tes*0-champ&euml;tres"$flat""gt"*hellip;ing"+iacute;anna"3lsqb&egr&rsqb;ctory")mdash;-up',
+    '(!k("ng(%rando(#ups($wits"%ndash\'0&ndash&ndash;ing\'$;101*!4+!s)"11)$3402)"5s)"6s("g.',
+    '(!r")ocirc;lha##uml&\';ellalt\'"rg"+pound;53.2m($bead".sharp;7&flat;9(!m)"-e(,sus4-f&sharp"+uacute;tbol#&circ;r#\'uml;hls()rerbunker',
+    '+!s,$taat)#ich\'#nff*#zig)\'kirchen\'/rsorgeerziehung)(tenburgs,#zug("th)\'wangler\'$ssen)"li!&\'&gt;0#$lt;0',
+    '#"j\'"!="!b"!r"#zam!$(-d)""1)#*,100)=3.62)$5.87$)24)=27.27$(34)=0.06%\'5)=5.22$)42)=59.17(%70.92$(50)=6.65',
+    '($7.88$(9)=16.25(%95.21\'$4.43($3.01\'%92.56""2)#),18)=0.95(%16.66)$8.98($2.05)$5.90($3.04*#975($5.16',
+    '$(33)=0.57#+2,286)=1.92#+3,437)=3.95*$4.02,"74*$5.67%)966)=2.13,"35#"4)"-39,936)=13.12*$3.89",78,936)=1.42"+9,100)=0.24)$1.28$*315)=13.83',
+    ')%4.362)$5.56$*476)=21.61$(50)=0.36*"48*"71+!7*"99($1.01*"84%(76)=1.14+"77)%28.35"*c)&gt;f(n)#"n)',
+    '"(op)&gt;0""r)"$s)=c"$u)=a%!b""w)!%*****%!d$"er$"in%!s$$k**g#!i#$king$!s',
+    '"\'n*nc**l!\'-&ndash"%-----"$0.25"$1-11#!0$!0$!1$!6#"4s#"5b$!j#"6c%!s#"8s',
+    '##5ce"$30ce#!6"#404##500#!b#"ce#!e#!j#!s""51#"es"!6##504$"ce',
+    '"!8#"4g#"9j"#ace#"ir"%ba-pb##eat##gjm#$lock##msh%!s##nre##oed%!f$"lx',
+    '"%chord#!k"$dash"#er.")f-f-f-u-n\'$ound%&antasy&%vours%\'ourteen#%amily#&eather$#els$"ll#&ishing&$tail',
+    '#(oolhardy&#ish$$rced%&tunate#%rance$$eddy%"ud#&ucking$!n%"ny"%grade"%holed$"rn""i4"#l-u',
+    '"$macs#$odel"-o-r-e-s-t-e-r#,n-the-bottom"#pan##lus"&region"$shed#&tamped%!r&!s$"op"&things"\'variate"!w',
+    '##msh"$zbac%!d##ero!#.10#"22#!3##50f#!s"#200$!7#!2#!4""3s"!7',
+    '#!4"#a.a%!.$"s."$c.o.$"s.$"w.#&harles$\'ecklist"+e./tertiary$$t.s.#"ng"$f.b."$g.s."$h.b.',
+    '$&r.t.o.$$s.a.#!a"$j.e.$&fisher""k."#l.s%!."$m.g.$"h.#%udway"#o.b"(p.ramsey"&r.c.p.&"r.',
+    '$"h.$&i.c.s.$&leavis$&m.s.5%("8%$#o.7$$s.e.#$ubra"$s.a.$"s."$t.s."%u.c.k#,nderstanding""v.#%ii/3m',
+    '$"j.$"r.$"w.""x.##iia%"ms!!/"*00/22/2002&&3/2138*"49*"51+!2*"90)#201+!8',
+    '*"37*"63+!6+!9*"78*"82*"94+!8)#305*"48*"50*"70+!4+!7*"82',
+    '+!9*"98)#409*"12*"20+!4*"41&&4/2015&(6/0003-3&&9/0001,"-1#)1/25/0000#)4/25/0000&&6/0007#!5',
+    '*"20+!5#)9/25/0000*"95)#100+!6+!9*"11+!2+!4+!5+!6+!8+!9*"21',
+    '+!5+!6+!7+!8+!9*"40+!1*"51+!4+!7*"60+!4+!8*"77""11',
+    '#)6/28/0001#)8/25/0002"#2.0#)0/25/0003+!4+!5+!6+!7*"14+!5+!7+!8+!9*"20+!2',
+    '+!3+!7#!2#+4/05/0006-2%\'25/0016*"20+!1+!3*"30+!2#\'6&deg;s#)8/63/0001"*3&middot;5"!4"#5.6',
+    '"#gas""ls"!n"&weight!#0.2"!1"!2"!3"!8"#lin!"1+"(,217,700##330&$,360##800',
+    '"$-111%!e#$plus"%.57bn"&03,000#!4#%7,000#!i"#17s#!s"%23car"!3#"36#"79"*40,000,000',
+    '#!s"%6,700#%0,000#%5,400"&80,000")9,000,000$#600#%0,000"#yer!*2&ndash;80"$,400##500&$,000##700##800',
+    '"\'/2.4997#)soveriegn")0,000,000")1,534,298#!0""26#%8,000"%3,700#!1#!5""40"!5#$,000#!0"!8',
+    '!*3&ndash;80#>verbar&verbar;b5&verbar&verbar"(,000,000##300##820"#.38#"43#+5&ndash;4.5"%0,000\'$,000"!1#)0,000,000"%3,400##.80")5,000,000',
+    '"!6#)7,000,000"%7,500")9,000,000#!a""ba""fs!+4&ndash;5.6#?verbar&verbar;rh8&verbar&verbar"$,400"#-f5"".5"#/80"%0,000"%2,000',
+    '"&37,800"*58,000,000"&70,000"!f#"-3$"4s#!s")u&ndash;4!)5,000,000##470##522##600"%-type")0,000,000#%0,000',
+    '$!0#/8/&micro;w1282x%$f508""14"!5!%6,000"!0"!2"%5,000#)0,000,000"$6.60""70"!b"!f!$7.80',
+    '"%2,000"$5.50""70"&a&plus"&c&plus"!f!%8,300#\'500,000##850"!0#(,000,000$#700#!1"%9,500"(a&plusmn',
+    '"!c#\'&plusmn#!+""fs!%9,000&"/2"#.65"!0#$,000\'$,000#!0""30"$5.30!(:penguin!%=28mm',
+    '#\'2+9/70c#!5!!_!-a&ccedil;acde+$ding*!e#)iacute;te$(circ;tes"!\'"%(-)te#+s)t-halvard##v)t"$-18s#%k\'uei$#wei',
+    ',!2#"fa"#342"#563"#a\'n#!k#\'revejle$$toft#!s#!v""b\'#"-6$\'antigen$\'binding$$less',
+    '#)/lysozyme$\'protein#!1##ada#)bricatori#\'eltiere$.r&rehy;castell%\'-kaiser%/g&eacute;-style#)ian-style&!o%"to#!l$2e-within-the-fable\'&riters',
+    '%$land$&iau(s)\'%-like($type%"ng#%natch#(r&eacute+$;ges&)grave;ges%$ouml$!a$#ega$!i%-c-and-leather\'&backed',
+    '\'$deep))structive\'$like\')retentive\')softeners\'\'weaving(%inged&#/an&"ae\'%tion.&"ks&\'s&mdash\',/furnishings()ravissant&"us',
+    '%!k&$herr%$tius$"on$#yka#-u&rehy;lously$%lists##yan"*c&rehy;tor#&adists$!e#%cetta$"io&#sos#+e&mdash;she',
+    '%3ndash;to&ndash;back$!-%\'bronzer%&centre+!s%%first&)lattering&*ungus-clad\'\'rniture%\'gleamer&\'rinding&%uards%$high&%ugger%%level',
+    '&%osing(!s%$offs&#nly%%paint*"ed+"rs\'#tch&&owdery&(rotector%\'ripples&\'ubbings%&savers&#lap)$ping',
+    '%-to-the-camera($wall%\'upwards%)wrinkling$&.7sup5$&/lemon%*north-west%%resin$%ache-$$down$%fulls$&itious$!l%%essly$%masks',
+    '$&s\'87\'\'%)_in_front%&hields$$tiae$$wise%%orker*!s$!y##hen$"in&!i$*ochschulen$$ralo$#tna$$werk',
+    '$&a-lift%3l/vestibuloacoustic&"is$!e%,s-controlled$!l%#ely%!i&%ties-+)including*\'.anyone*$/400\'#y-2(//system-managed&"us',
+    '$(ng-brick$!o$#sim%!m%"ts$!t$%undis$&vermis#!k$#ins$)nellmatey$!s$$tion#&lities#&onnier',
+    '&"ed#3simile-transmission)/.specifications("ie#-t&mdash;there$!\'$!-%)causation%,establishing%&finder+!s%$head%)imparters&7s-stranger-than-fiction%$lode',
+    '&)rientated%&packed%\'seekers$#_in$#box$"ed%!l%"rs$&finder(!s$!i%!o&+n-initiated((politics\'%alise',
+    '\'$s-in&&usness$$ness$%oires%/r&rehy;analytic&!\'&$(tf)&!-\'$&bgr\'!4\'(analytic()ugmenting\')inducible\'$like&&/aagpc',
+    '&+ies.bulmers)(/offices\'"se&\'s--both(\'initial\'#.in\'0/characteristics($mike(0responsibilities&-y&rehy;glazed\'&-built((cleaning)%oated(#era((finished',
+    '(*galvanised)%rimed(&labour(&owning(&raised)\'ecorded($side)$tyle)\'upplied,%orted(#the)&reated($wise\'$.and(#but',
+    '\'$land\'!s\'$wise%!s%"te$%packs$ks&mdash;assumptions&mdash;problems&mdash;alternatives&mdash;recommendations%"-a&#ibn&$list&%these%,/information%\'heet(s)$5ual-thought-provoking%"re',
+    '#*ult&eacute-";s&"ad\'$tive&!e&(ies-they)(/courses*+departments*(subjects&\'y-based($wide\'+/department(&school$#ndo"&d-head',
+    '#!d$*&sharp;4-f$!a$\'ishness&!m#(e-button%$free%(to-black%"up$!l%)livestock$#out$"rs##ge.##hel',
+    '&!s#$ing.#!l#"og!%omula',
 )
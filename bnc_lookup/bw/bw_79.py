@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_79 = (
+count_79 = 6694
+
+heads_79 = (
     'dreadnoughtish',
-    'dreads\'n\'all',
-    'dreaful',
-    'dreakensburg',
-    'dream-activity',
-    'dream-bat',
-    'dream-blowing',
-    'dream-brain',
-    'dream-chamber',
-    'dream-coat',
-    'dream-come-true',
-    'dream-consciousness',
-    'dream-corner',
-    'dream-depths',
-    'dream-dream-dream',
-    'dream-dust',
     'dream-find',
-    'dream-fulfilling',
-    'dream-imagery',
-    'dream-interpretations',
-    'dream-kiss',
-    'dream-life',
-    'dream-logic',
-    'dream-lover',
-    'dream-machines',
-    'dream-manuals',
-    'dream-map',
-    'dream-metaphor',
-    'dream-packed',
-    'dream-past',
-    'dream-people',
-    'dream-picture',
     'dream-poem',
-    'dream-poems',
-    'dream-self',
-    'dream-swain',
-    'dream-tangled',
-    'dream-team',
-    'dream-telepathy',
-    'dream-topics',
-    'dream-touch',
-    'dream-town',
-    'dream-troubled',
-    'dream-vision',
-    'dream-walking',
-    'dream-way',
-    'dream-woman',
-    'dream-work',
     'dream-wracked',
-    'dream/you',
-    'dreamboy',
-    'dreamcrossed',
-    'dreamed-of',
-    'dreamed-up',
-    'dreamership',
-    'dreames',
-    'dreamflower',
-    'dreamier',
-    'dreamiest',
-    'dreamin\'',
-    'dreamography',
-    'dreampop',
-    'dreampoppers',
-    'dreams.',
     'dreams.19',
-    'dreams/a',
-    'dreamscapes',
-    'dreamseat',
-    'dreamself',
-    'dreamshadows',
-    'dreamspace',
-    'dreamstone',
-    'dreamsun',
-    'dreamt-of',
-    'dreamteam',
-    'dreamwalked',
-    'dreamwalkers',
-    'dreamwalking',
-    'dreamy-faced',
-    'dreamy-time',
     'drearier-than-thou',
-    'drearton',
-    'dreary-i',
-    'dreary-looking',
-    'dreath',
-    'drebbond',
-    'dreckspatz',
-    'drecky',
-    'dredge/pensioner',
-    'dredged-out',
-    'dreeb',
-    'dreeeeaaaam',
-    'dreeeeeaaaaammm',
-    'dreema',
-    'dreened',
-    'dreenk',
     'dreesman',
-    'drefaldwyn',
-    'dreff',
-    'dreflan',
-    'drefn',
-    'drefoldwyn',
-    'dregger',
-    'dreggiest',
-    'dregne',
-    'dreien',
-    'dreigiaw',
-    'dreigroschenmusik',
-    'dreigroschenoper',
-    'dreikanter',
-    'dreiklang',
-    'dreikonigstrasse',
     'dreilini',
-    'dreimne',
-    'dreitzel',
-    'drekar',
-    'dreksler',
-    'drekzone',
-    'drella',
-    'dremanis',
-    'dremel',
-    'dremes',
-    'dremyth',
-    'drenches',
-    'drenchev',
-    'drenchings',
-    'drennan/neighbour',
-    'drent',
     'drentish',
-    'dreptatea',
-    'drery',
-    'dresdeners',
-    'dreser',
-    'dresing',
-    'dress-basket',
-    'dress-coat',
-    'dress-conscious',
-    'dress-fastening',
-    'dress-fastenings',
-    'dress-lengths',
-    'dress-maker',
-    'dress-shop',
-    'dress-styles',
-    'dress-to-impress',
     'dress-wearing',
-    'dress/',
-    'dress/shoes/bridesmaids',
-    'dress/with',
-    'dress_up',
-    'dressable',
-    'dresscoat',
-    'dressed-down',
-    'dressed-nicely',
-    'dressed/',
-    'dressel',
-    'dresser/harris/kirk/saunt',
-    'dressful',
-    'dressidge',
-    'dressing-',
-    'dressing-by-numbers',
     'dressing-cases',
-    'dressing-chair',
-    'dressing-cum-locker',
-    'dressing-gown-clad',
-    'dressing-own',
-    'dressing-robot',
-    'dressing-shelf',
-    'dressing-stations',
-    'dressing-trolley',
-    'dressing/undressing',
-    'dressing=table',
-    'dressings&rehy;down',
-    'dressoir',
-    'dressor',
-    'dresternan',
-    'dreu',
     'dreugs',
-    'dreves',
-    'dreweatt',
-    'drewes',
-    'drewry/lothian',
-    'drey',
-    'dreye',
-    'dreyfuseur',
-    'dreyt',
-    'dreze',
-    'dreznik',
-    'drh',
-    'dri-block',
-    'dribbig',
-    'dribble-brain',
-    'dribble-stained',
     'dribble:a',
-    'dribbleware',
-    'driblet',
-    'drictum',
-    'dridekker',
-    'drie',
-    'dried-blood',
-    'dried-blood-red',
-    'dried-food',
-    'dried-up-looking',
-    'dried.',
-    'dried/tinned',
-    'driefontein',
-    'driessen',
-    'drietabbetje',
-    'drieu',
     'driffield&ndash;beverley',
-    'driffield-bridlington',
-    'driffield/gloucestershire',
-    'drift-beating',
-    'drift-fishing',
-    'drift-lines',
-    'drift-tube',
-    'driftbeater',
-    'drifte',
-    'driftin\'',
-    'driftline',
-    'driftways',
-    'drighlington',
-    'drigo',
-    'drii',
-    'drill-bit',
     'drill-furrow',
-    'drill-holes',
-    'drill-like',
-    'drill-makers',
-    'drill-master',
-    'drill-sarn',
-    'drill-sergeant',
-    'drill-string',
-    'drill/screwdrivers',
-    'drillability',
-    'drillcore',
-    'drillholes',
-    'drillin\'',
-    'drilling-rigs',
-    'drilling-service',
-    'drillos',
     'drillpipe',
-    'drillpress',
-    'drills/breakers',
-    'drills/screwdrivers',
-    'drimmer',
-    'drimmon',
-    'drimnagh',
-    'drimnin',
-    'drinched',
-    'drincourt',
-    'drini',
-    'drink&mdash;if',
-    'drink&rehy;fuddled',
-    'drink\'',
-    'drink\'st',
-    'drink-',
     'drink-and-a-rabbit',
-    'drink-and-drive',
-    'drink-associated',
-    'drink-based',
-    'drink-laden',
-    'drink-offering',
-    'drink-on-a-stick',
-    'drink-or',
-    'drink-pouring',
-    'drink-ravaged',
-    'drink-shop',
-    'drink-swilling',
-    'drink-then',
-    'drink-this-and-score',
-    'drink.although',
-    'drink.the',
     'drink/complaint',
-    'drink/drivers',
-    'drinkability',
-    'drinkables',
-    'drinkard',
-    'drinkeries',
-    'drinkfield',
-    'drinkin',
-    'drinking&rehy;party',
-    'drinking-',
-    'drinking-clubs',
-    'drinking-companion',
-    'drinking-cup',
-    'drinking-cups',
-    'drinking-feeder',
-    'drinking-glass',
     'drinking-horns',
-    'drinking-house',
-    'drinking-parties',
-    'drinking-place',
-    'drinking-songs',
-    'drinking-soundtrack',
-    'drinking-time',
-    'drinking-trough',
-    'drinking-vessel',
-    'drinking/cooking',
-    'drinkken',
-    'drinkless',
-    'drinks&mdash',
-    'drinks-carriers',
-    'drinks-machine',
-    'drinks-to-restaurants',
     'drinks/cocktail',
-    'drinks/sells/abhors/wastes',
-    'drinkstone',
-    'drinkwater/association',
-    'drinky-poos',
-    'drinkypoohs',
-    'drinsk',
-    'driom',
-    'drip&rehy;feed',
-    'drip&rehy;ping',
-    'drip-course',
-    'drip-dried',
-    'drip-drip',
-    'drip-drip-drip',
-    'drip-dripping',
-    'drip-drying',
     'drip-free',
-    'drip-pan',
-    'drip.',
-    'dripfeed',
-    'driphter',
-    'dripped-dried',
-    'drippie',
-    'drippiest',
-    'dripping-wet',
-    'dripple',
-    'drippng',
-    'dripps',
-    'dripster',
-    'dripstone',
-    'drirun',
-    'dris',
     'driscoll/estate',
-    'driscoll/uv',
-    'driskell',
-    'dritfed',
-    'dritte',
-    'driv\'n',
-    'drivability',
-    'drivage',
-    'drivative',
-    'drive&rehy;by',
-    'drive\'',
-    'drive(s)',
-    'drive-',
-    'drive-belt',
-    'drive-bys',
-    'drive-cum-cut',
     'drive-hole',
-    'drive-in-drive-out',
-    'drive-inhibiting',
-    'drive-line',
-    'drive-related',
-    'drive-stimulus',
-    'drive-up',
-    'drive-w900112/034',
-    'drive/accommodation',
-    'drive/alnwickhill',
-    'drive/master',
-    'drive/on',
-    'drive/ski/sail/swim/dance/surf/',
-    'drive/we',
-    'drive/were',
-    'driveable',
     'driveages',
-    'drivecharts',
-    'drived',
-    'drivemaster',
-    'drivename',
-    'drivenness',
-    'driver\'',
-    'driver(s)',
-    'driver-accompanied',
-    'driver-conductor',
-    'driver-fatigue',
-    'driver-no',
-    'driver-operated',
-    'driver-plus',
-    'driver/navigator',
-    'driver/nra',
     'driver/operator',
-    'driver/porter',
-    'driver/rider',
-    'driver/yardman',
-    'driver1',
-    'drivers.',
-    'drivers/bus',
-    'drivers/east',
-    'drivers/operators',
-    'drivers/riders',
-    'driversstopped',
-    'driveshafts',
-    'driveth',
-    'driveway.',
-    'drivewise',
-    'driving-board',
     'driving-cab',
-    'driving-gauntlets',
-    'driving-licence',
-    'driving-licences',
-    'driving-morenz',
-    'driving-ranges',
-    'driving-time',
-    'driving-unconsciously-while-proving-a-theorem',
-    'driving.approximately',
-    'driving/driving',
-    'driving_out',
-    'driza',
-    'drizhon',
-    'drizic',
-    'drizley',
-    'drizzle-veiled',
     'drizzles',
-    'drlica',
-    'drmatically',
-    'drnis',
-    'droaphernes',
-    'drobeta-turnu',
-    'drobner',
-    'drobnewski',
-    'droemer',
-    'droese',
-    'droi',
-    'droid-bunking',
-    'drolatiques',
-    'drolleries',
-    'drolling',
-    'drolls',
     'drolma',
-    'dromadidae',
-    'dromalane',
-    'dromas',
-    'drome1',
-    'dromena',
-    'dromenon-',
-    'dromin',
-    'dromina',
-    'dromineer',
-    'dromnasough',
-    'dromoland',
-    'dromora',
-    'dromornithidae',
-    'drone-chant',
-    'drone-figure',
     'drone-like',
-    'droney',
-    'drongo',
-    'drongo-rock',
-    'droningly',
-    'dronk',
-    'dronke',
-    'dronkers',
-    'dronnies',
-    'droo',
-    'drood.',
-    'drooklin',
-    'drooler',
-    'droolings',
-    'droop-stockinged',
-    'droopily',
     'droopiness',
-    'drooping-moustached',
-    'drooping.',
-    'droopy-jaws',
-    'drooth',
-    'drop\'t',
-    'drop-',
-    'drop-down-dead',
-    'drop-ended',
-    'drop-escape',
-    'drop-handled',
-    'drop-handles',
-    'drop-head',
-    'drop-jaw',
-    'drop-kicked',
-    'drop-kicks',
     'drop-leafed',
-    'drop-leafs',
-    'drop-leaved',
-    'drop-net',
-    'drop-of-a-hat',
-    'drop-of-water',
-    'drop-offs',
-    'drop-pearl',
-    'drop-pounce',
-    'drop-scene',
-    'drop-shaft',
-    'drop-side',
-    'drop-size',
-    'drop-stones',
-    'drop-style',
-    'drop-tank',
     'drop-top',
-    'drop-tune',
-    'drop-tuned',
-    'drop-zones',
-    'drop.sheila',
-    'dropball',
-    'dropcloth',
-    'droped',
-    'drophar',
-    'dropinstitches',
-    'dropkicking',
-    'dropleted',
-    'droplocks',
-    'dropnik',
-    'dropoffs',
-    'dropout/spiritualist',
     'dropp',
-    'droppa',
-    'dropped-head',
-    'dropped.well',
-    'droppers-out',
-    'droppin',
-    'dropping-free',
-    'dropping-out',
-    'drops.',
-    'dropsafoot',
-    'dropshafts',
-    'dropside',
-    'dropsies',
-    'dropstone',
-    'dropthrough',
-    'dropwort',
     'dros-bern',
-    'drosanthemum',
-    'drosdik',
-    'droseracea',
-    'droshkys',
-    'droskapovchy',
-    'drosopterins',
-    'drosselmeyer',
-    'droste',
-    'drot',
-    'drottingholm',
-    'drottkvaett',
-    'drouard',
-    'drought&rehy;resistant',
-    'drought-',
-    'drought-afflicted',
     'drought-defying',
-    'drought-hardened',
-    'drought-hit',
-    'drought-induced',
-    'drought-lovers',
-    'drought-loving',
-    'drought-proof',
-    'drought-striken',
-    'drought-threatened',
-    'droughtiest',
-    'drouin',
-    'drousie',
-    'drov',
-    'drove-way',
-    'drove/',
-    'drover-wood',
     'droves.',
-    'drow',
-    'drowin\'',
-    'drown/county',
-    'drowsier',
-    'droylesden',
-    'droylsdon',
-    'drozdov',
-    'drr',
-    'drs/6000',
-    'drs9000',
-    'drs9000s',
-    'drtf1-polypeptide-1',
-    'drtf1/e2f-rb',
-    'drtf1/e2f.',
-    'dru/petit',
     'drub',
-    'drub-drub-drub',
-    'drub-drub-drub-drub-drub',
-    'drubbel',
-    'drubs',
-    'drucke',
-    'drucker-brown',
-    'drud',
-    'drudgeries',
-    'drudgy',
-    'drue',
-    'drueke',
-    'druer',
-    'drug&rehy;sodden',
-    'drug&rehy;suppliers',
-    'drug-15',
     'drug-abuse',
-    'drug-abusers',
-    'drug-abusing',
-    'drug-addled',
-    'drug-administering',
-    'drug-and-drink-influenced',
-    'drug-approval',
-    'drug-baronish',
-    'drug-binding',
-    'drug-boosted',
-    'drug-chewing',
-    'drug-containing',
-    'drug-dependent',
-    'drug-deprived',
-    'drug-deranged',
-    'drug-design',
     'drug-du-jour',
-    'drug-enhanced',
-    'drug-enthralled',
-    'drug-fiend',
-    'drug-filled',
-    'drug-frenzied',
-    'drug-fuelled',
-    'drug-handlers',
-    'drug-happy',
-    'drug-hearing',
-    'drug-hungry',
-    'drug-imbibing',
-    'drug-immunophilin',
-    'drug-infested',
-    'drug-laden',
-    'drug-liability',
     'drug-making',
-    'drug-money',
-    'drug-obsessed',
-    'drug-oriented',
-    'drug-overdoses',
-    'drug-peddler',
-    'drug-policy',
-    'drug-pusher',
-    'drug-pushing',
-    'drug-raddled',
-    'drug-related.',
-    'drug-resistance',
-    'drug-rich',
-    'drug-ring',
-    'drug-scene',
-    'drug-screening',
     'drug-selling',
-    'drug-smugglers',
-    'drug-squad',
-    'drug-sting',
-    'drug-suspects',
-    'drug-taker',
-    'drug-taking\'/\'drug',
-    'drug-terrorist',
-    'drug-test',
-    'drug-testers',
-    'drug-therapy',
-    'drug-trafficker',
-    'drug-triggered',
-    'drug-troubled',
-    'drug-wise',
-    'drug.',
     'drug.s',
-    'drug/doping',
-    'drug/pesticide/herbicide',
-    'drug/phosphate',
-    'drugged-out',
-    'druggedly',
-    'drugger',
-    'druggeted',
-    'druggie',
-    'druggings',
-    'druglords',
-    'drugmasters',
-    'drugmusic',
-    'drugnet',
-    'drugnotes',
-    'drugs\'n\'rock\'n\'drugs',
     'drugs-bust',
-    'drugs-busting',
-    'drugs-crime',
-    'drugs-for-hostages',
-    'drugs-hunting',
-    'drugs-in-prison',
-    'drugs-ridden',
-    'drugs-squad',
-    'drugs-terrorist',
-    'drugs.tim',
-    'drugs/intoxicating',
-    'drugsters',
-    'drugtakers',
-    'drugules',
-    'drugvomit',
-    'druick',
     'druide',
-    'druidibeg',
-    'druidism',
-    'druiett',
-    'druiff',
-    'druitt',
-    'drukov',
-    'drum-a-thon',
-    'drum-and-rattle',
-    'drum-backing',
-    'drum-banging',
-    'drum-beats',
-    'drum-fed',
-    'drum-head',
-    'drum-major',
-    'drum-maniac',
     'drum-nest',
-    'drum-numbed',
-    'drum-range',
-    'drum-rattle',
-    'drum-revolve',
-    'drum-rolling',
-    'drum-sander',
-    'drum-sanding',
-    'drum-scanning',
-    'drum-song',
-    'drum-stick',
-    'drum-tight',
-    'drumadd',
-    'drumadoon',
-    'drumaroad',
-    'drumceat',
     'drumchaple',
-    'drumcrew',
-    'drumfire',
-    'drumglass',
-    'drumgooles',
-    'drumgor',
-    'drumgore',
-    'drumhallagh',
-    'drumhark',
-    'drumheller',
-    'druminally',
-    'drumlee',
-    'drumless',
-    'drumlone',
-    'drummahoe',
-    'drummamore',
     'drummer-boy',
-    'drummer-cum-guitarist',
-    'drummer-cum-taxidriver',
-    'drummer-girl',
-    'drummer/horn',
-    'drummie',
-    'drummie-bees',
-    'drummings',
-    'drummond/leaf',
-    'drummund',
-    'drumnasole',
-    'drumont',
-    'drumoyne',
-    'drumpellier',
-    'drumreagh',
-    'drumright',
     'drumrolls',
-    'drumsallan',
-    'drumskinney',
-    'drumskins',
-    'drumsmudden',
-    'drumsna',
-    'drumsteaks',
-    'drumstinchall',
-    'drumtara',
-    'drumtech',
-    'drumtower',
-    'drumulator',
-    'druncliffe',
-    'drunk-and-disorderly',
-    'drunk-driver',
-    'drunk-in-charge',
     'drunk-looking',
-    'drunk-person',
-    'drunk-proof',
-    'drunk/dance',
-    'drunke',
-    'drunkeen',
-    'drunken&rehy;ness',
-    'drunken-dog',
-    'drunken-driving',
-    'drunkening',
-    'drunkin',
-    'drunkin\'',
-    'drunkne',
-    'drunning',
-    'druscovich',
-    'druses',
     'drush',
-    'druss',
-    'drussilas',
-    'drustan',
-    'drustans',
-    'druten',
-    'druv',
-    'druzhba',
-    'druzhinii',
-    'druzhinin',
-    'druzina',
-    'drving',
-    'drvs',
-    'drw9',
-    'drws-y-coed',
-    'drx/&pound;1',
     'dry&rehy;cleaners',
-    'dry&rehy;eyed',
-    'dry\'',
-    'dry-bagged',
-    'dry-bark',
-    'dry-bony',
-    'dry-cell',
-    'dry-clean-only',
-    'dry-cleaned.',
-    'dry-coloured',
-    'dry-deposition',
-    'dry-drilling',
-    'dry-drunk',
-    'dry-farming',
-    'dry-fly',
-    'dry-fry',
     'dry-glistening',
-    'dry-heat',
-    'dry-hopped',
-    'dry-humoured',
-    'dry-into-wet',
-    'dry-land',
-    'dry-mix',
-    'dry-nosed',
-    'dry-play',
-    'dry-plucked',
-    'dry-road',
-    'dry-roast',
-    'dry-rotted',
-    'dry-run',
-    'dry-salter',
-    'dry-scraped',
     'dry-seasonal',
-    'dry-skinned',
-    'dry-smelling',
-    'dry-spun',
-    'dry-stone-wall',
-    'dry-storage',
-    'dry-store',
-    'dry-stored',
-    'dry-tanks',
-    'dry-type',
-    'dry-verge',
-    'dry-walling',
-    'dry-weight',
-    'dry-wipe',
-    'dry-witted',
-    'dry.',
     'dry/cough',
-    'dry/moist',
-    'dry/normal',
-    'dry/permed',
-    'dryades',
-    'dryantilla',
-    'dryboard',
-    'drybox',
-    'drycleaning',
-    'drydenesque',
-    'dryderdale',
-    'drydocked',
-    'drydon',
-    'dryed',
-    'dryen',
-    'dryer_so',
     'dryfield',
-    'dryham',
-    'dryhole',
-    'dryhurst',
-    'drying-allow',
-    'drying-field',
-    'drying-room',
-    'drying.',
-    'drylining',
-    'drymatic',
-    'drymix',
-    'drymonia',
-    'dryness.',
-    'drynie',
-    'drynke',
-    'dryocopus',
     'drypoints',
-    'drypool',
-    'drysalter',
-    'drysdale/gloucester',
-    'drysdale/markets',
-    'drysdate',
-    'drysgol',
-    'drysgolgoch',
-    'dryshod',
-    'dryson',
-    'drystone-dyked',
-    'dryvent',
-    'drywall',
-    'drzewiecka',
-    'drzycimski',
-    'drzyma&lstrok;a',
     'ds-40',
-    'ds-backup',
-    'ds-dna',
-    'ds.',
-    'ds/90-7000',
-    'ds/dt',
-    'ds10',
-    'ds15',
-    'ds4',
-    'ds5',
-    'ds6',
-    'ds7',
-    'ds700',
-    'ds8',
-    'ds:binary',
-    'dsb',
     'dsbr',
-    'dsc.',
-    'dschang',
-    'dsd3',
-    'dsdc.',
-    'dsdl',
-    'dsdsksm',
-    'dsecretion',
-    'dsepite',
-    'dsfc',
-    'dsg',
-    'dsh',
-    'dshcher',
-    'dsicvoeverd',
-    'dsincve',
-    'dsir',
     'dsk&mdash;democratic',
-    'dsm1616',
-    'dsms',
-    'dsn',
-    'dsp&mdash;democratic',
-    'dsp-128',
-    'dsp-a500',
-    'dsp-e200',
-    'dsp11',
-    'dsp16a',
-    'dsp56000',
-    'dsp56001',
-    'dspg',
-    'dsr6',
-    'dsrm',
-    'dss-gis',
     'dssc.qry',
-    'dssent',
-    'dssp',
-    'dssun',
-    'dsthhb',
-    'dstl',
-    'dsu***',
-    'dsubl',
-    'dsus4',
-    'dsus4-d',
-    'dsvf',
-    'dt-dacron',
-    'dt.',
-    'dt11',
-    'dt150',
-    'dt2600',
     'dt551514625',
-    'dt6',
-    'dtake',
-    'dtbgmbh',
-    'dtc-1000',
-    'dten',
-    'dtfs',
-    'dtg',
-    'dti-appointed',
-    'dti-link',
-    'dti-sponsored',
-    'dti/cbi',
-    'dti/government',
-    'dti/mti',
-    'dti/sep',
-    'dtjbswirzrezlmqco',
     'dtmf',
-    'dtmp',
-    'dtp-like',
-    'dtp-style',
-    'dtr-1',
-    'dtt.',
-    'du&rehy;bious',
-    'du&scaron;ek',
-    'du\'',
-    'du-50',
-    'du-gnorian',
-    'du.',
-    'du/chinese',
-    'du/dt',
-    'du/dz',
-    'dua2',
     'duabanga',
-    'duada&sacute;i',
-    'dual&rehy;edged',
-    'dual&rehy;purpose',
-    'dual-33mhz',
-    'dual-66.7mhz',
-    'dual-arc',
-    'dual-beam',
-    'dual-capable',
-    'dual-channel',
-    'dual-coding',
-    'dual-command',
-    'dual-cone',
-    'dual-containment',
-    'dual-cost',
-    'dual-detector',
     'dual-earner',
-    'dual-flush',
-    'dual-frequency',
-    'dual-gold',
-    'dual-income',
-    'dual-insurance',
-    'dual-key',
-    'dual-labour',
-    'dual-level',
-    'dual-note',
-    'dual-operating',
-    'dual-organism',
-    'dual-period',
-    'dual-pointer',
-    'dual-practitioners',
-    'dual-presenter',
     'dual-presidency',
-    'dual-price',
-    'dual-resident',
-    'dual-roled',
-    'dual-source',
-    'dual-standard',
-    'dual-surface',
-    'dual-system',
-    'dual-temperature',
-    'dual-tone',
-    'dual-use',
-    'dual-water-supply',
-    'dual-wired',
-    'dual-xxxx',
-    'dual/instruction',
-    'duala',
     'dualconcentric',
-    'dualgrph',
-    'dualthon',
-    'duannian',
-    'duaos',
-    'duathlons',
-    'dub&oacute;n',
-    'dub-disco',
-    'dub-funk',
-    'dub-house',
-    'dubagunta',
-    'dubayyah',
-    'dubb',
-    'dubbers',
-    'dubbier',
-    'dubbin-lickers',
     'dubbining',
-    'dubbins',
-    'dubbs',
-    'dubcekite',
-    'dubecco',
-    'duben',
-    'dubhacon',
-    'dubin',
-    'dubitability',
-    'dubitantium',
-    'dubitare',
-    'dubitation',
-    'dubium',
-    'dubler',
-    'dublin-bound',
-    'dublin-created',
     'dublin-derry',
-    'dublin-moscow',
-    'dubliniensis',
-    'dublinman',
-    'dubmaster',
-    'dubois-pillet',
-    'duboule',
-    'dubova/coach',
-    'dubovsky',
-    'dubowitz',
-    'dubplates',
-    'dubrac',
-    'dubrao',
-    'dubrav',
-    'dubrey',
-    'dubrov&ccaron;anin',
     'dubrovnick',
-    'dubrovnik.mike',
-    'dubtek',
-    'dubuc',
-    'dubuffets',
-    'dubuisson',
-    'dubunnic',
-    'dubut',
-    'dubversh',
-    'duby',
-    'dubynin',
-    'ducados',
-    'ducan',
-    'ducane',
-    'ducar',
-    'ducaufour',
     'duccios',
-    'duceppe',
-    'duch&ecirc;ne',
-    'duch-ess',
-    'duchampians',
-    'duchamps',
-    'duchane',
-    'ducharme',
-    'duchein',
-    'duchek',
-    'duches',
-    'duchess-countess',
-    'duchlage',
-    'duchossois',
-    'duchrae',
-    'duck\'s-head',
     'duck(1986)',
-    'duck-',
-    'duck-and-mushroom',
-    'duck-calls',
-    'duck-dives',
-    'duck-egg-blue',
-    'duck-guns',
-    'duck-hook',
-    'duck-jumping',
-    'duck-jumps',
-    'duck-pond',
-    'duck-ponds',
-    'duck-pooh',
-    'duck-quack',
-    'duck-shaped',
-    'duck-shooting',
     'duck-tail',
-    'duck-talk',
-    'duck-thronged',
-    'duck.too',
-    'duckarsed',
-    'duckboard',
-    'duckboarding',
-    'duckek',
-    'duckeries',
-    'duckering',
-    'duckery',
-    'duckets',
-    'duckettes',
-    'duckhaven',
-    'ducking-chair',
-    'ducking-stools',
     'duckings',
-    'duckist',
-    'ducklington/oxfordshire',
-    'duckman',
-    'duckumentaries',
-    'duckworth-chad',
-    'duckypet',
-    'duclaud-williams',
-    'duco',
-    'ducorroy',
-    'ducreux',
-    'ducreyi',
-    'ducrocq-lawford',
-    'ducrow',
-    'ducru-beaucaillour',
-    'ducs',
     'duct-blocking',
-    'duct-borne',
-    'duct-laying',
-    'ductilance',
-    'ductless',
-    'ductor',
-    'ducumentaries',
-    'duddies',
-    'duddily',
-    'duddington',
-    'duddle',
-    'duded',
-    'dudely',
-    'dudesville',
-    'dudettes',
-    'dudfield/farmer',
     'dudfiled',
-    'dudgeons',
-    'dudhia',
-    'dudie',
-    'dudik',
-    'dudinets',
-    'dudley-based',
-    'dudley-smith',
-    'dudley.r',
-    'dudleys',
-    'dudot',
-    'dudowski',
-    'dudududududududu',
-    'dudwick',
-    'dudyrev',
-    'due&ntilde;as',
     'due-process',
-    'due/dew',
-    'due_,_but_due_to',
-    'due_no',
-    'dueing',
-    'duel-scarred',
-    'duell',
-    'duell/royal',
-    'duelli-klein',
-    'duely',
-    'duemmler',
-    'dueodde',
-    'duerdoth',
-    'duergars',
-    'duero',
-    'dues&mdash;were',
     'duesbury',
-    'duesing',
-    'duessa',
-    'duet-tone',
-    'dueted',
-    'duetti',
-    'duetto',
-    'dufeck',
-    'duff-duff',
-    'duff-mucky',
-    'duff-sounding',
-    'duffel-coat',
-    'duffett',
-    'duffeyrn',
-    'duffhead',
-    'duffield-harding',
     'duffield/tenant',
-    'duffing',
-    'duffle-jacketed',
-    'dufflecoats',
-    'duffles',
-    'duffley',
-    'duffs',
-    'duffy-fallon',
-    'duffy/designer',
-    'dufkin',
-    'dufourstrasse',
-    'dufresnier',
-    'duft',
-    'dufy-print',
-    'dug-over',
-    'dugal',
     'dugard/oxford',
-    'dugganitch',
-    'duggesting',
-    'duggonitch',
-    'dugie',
-    'dugin',
-    'duglas',
-    'dugleddau',
-    'dugmore',
-    'dugonijic/evacuee',
-    'dugonijic/injured',
-    'dugue',
-    'duguet',
-    'duguid/mother',
-    'duh-d-duh-d-duh-d-duhduhduh',
-    'duh-duh',
     'duha',
-    'duhan',
-    'duhaney',
-    'duhayyat',
-    'duhesme',
-    'duhhh',
-    'duhm',
-    'duhne',
-    'duignans',
-    'duijn',
-    'duilisg',
-    'duino',
-    'duirnish',
-    'duisburg/',
-    'duiser',
-    'duisker',
     'duivendrecht',
-    'dujac',
-    'dujakovich',
-    'duk',
-    'duk1',
-    'duka',
-    'dukan',
-    'dukat',
-    'duke\'s',
-    'duke-designate',
-    'duke-edinburgh',
-    'duke-friar',
-    'duke-portland',
-    'dukeness',
-    'dukerdale',
-    'dukerich',
     'dukey',
-    'dukhha',
-    'dukkered',
-    'dukkerer',
-    'duklija',
-    'duku',
-    'dul',
-    'dulari',
-    'dulbecos',
-    'dulcamara',
-    'dulcedo',
-    'dulcephone',
-    'dulces',
-    'dulci',
-    'dulcimers.',
-    'dulcissime',
     'dulcit',
-    'dulciter',
-    'dulcitone',
-    'dulcy',
-    'duleek',
-    'dulep',
-    'dulhorn',
-    'dulia',
-    'dulks',
-    'dull-brained',
-    'dull-dark',
-    'dull-dust',
-    'dull-faced',
-    'dull-faceted',
-    'dull-green',
-    'dull-hued',
     'dull-plumaged',
-    'dull-pointed',
-    'dull-sounding',
-    'dull-straw',
-    'dull-toned',
-    'dull.',
-    'dullborough',
-    'dullea',
-    'duller/editor',
-    'duller/oxford',
-    'dullesian',
-    'dullpeldyr',
-    'dullsville',
-    'dully-written',
-    'dulon',
-    'dulphalac',
     'dulplicate',
-    'dulson',
-    'dulston',
-    'duly-authorised',
-    'dulyn',
-    'dum&eacute;nil-lebl&eacute',
-    'dum-day',
-    'dum-de-dum',
-    'dum-do-be-',
-    'dum-dum-dum',
-    'dum-dums',
-    'dum87q4',
-    'dumaine',
-    'dumais',
-    'dumalise',
-    'dumas-herm&egrave;s',
     'dumay',
-    'dumb-bell-shaped',
-    'dumb-brunette',
-    'dumb-fuck',
-    'dumb-mindedness',
-    'dumb-show',
-    'dumbarton-helensburgh',
-    'dumbaton',
-    'dumbbell-shape',
-    'dumbed',
-    'dumbell',
-    'dumber',
-    'dumbfoundedness',
-    'dumbiedykes',
-    'dumbledykes',
-    'dumbleton/gloucestershire',
     'dumbleton/grand-daughter',
-    'dumbleyoung',
-    'dumbly.',
-    'dumbnation',
-    'dumbounded',
-    'dumbwaiter',
-    'dumby',
-    'dumeisen',
-    'dumfermline',
-    'dumfrieshire',
-    'dumini',
-    'dumiso',
-    'dumkins',
-    'dummkopf',
-    'dummm',
-    'dummy-chewing',
     'dummy-proof',
-    'dummy-run',
-    'dummydummydummydummy',
-    'dummys',
-    'dumnor',
-    'dumnorix',
-    'dumont-nizan',
-    'dumosa',
-    'dump-bins',
-    'dump-clearing',
-    'dump-head',
-    'dump/load',
-    'dump/restore',
-    'dumped-off',
-    'dumperd',
-    'dumpford',
     'dumphey',
-    'dumpily',
-    'dumping-off',
-    'dumping/preparation',
-    'dumpled',
-    'dumpling-based',
-    'dumpson',
-    'dumpster',
-    'dumpware',
-    'dumpwatch',
-    'dumy',
-    'dumycz',
-    'dun&rehy;comb',
-    'dun-and-white',
-    'dun-and-whites',
-    'dun-cream',
     'dun-grey',
-    'dun-ping',
-    'dun-tinged',
-    'dun-walled',
-    'dun/',
-    'dunach',
-    'dunachie',
-    'dunacree',
-    'dunadry',
-    'dunaj',
-    'dunakeszi',
-    'dunalastair',
-    'dunams',
-    'dunand',
-    'dunara',
-    'dunarea',
     'dunav',
-    'dunavon',
-    'dunayev',
-    'dunayevskaya',
-    'dunbar-naysmith',
-    'dunbeg',
-    'dunblaine',
-    'duncalf',
-    'duncalfe',
-    'duncan\'s',
-    'duncan/charge',
-    'duncanskingle',
-    'duncanssons',
-    'duncanstown',
-    'duncel-backed',
-    'duncery',
     'duncical',
-    'duncombes',
-    'duncraig',
-    'dunction',
-    'dundaff',
-    'dundases',
-    'dundee0',
-    'dunder-headed',
-    'dunderdale',
-    'dunderl',
-    'dunderth',
-    'dundfermline',
-    'dundic',
-    'dundock',
-    'dundon',
-    'dundonians',
     'dundonnel',
-    'dundy',
-    'dundyvan',
-    'dune-bedded',
-    'dune-buggies',
-    'dune-grass',
-    'dune-land',
-    'dune-sand',
-    'dune-shaped',
-    'dunefield',
-    'duneight',
-    'dunelands',
-    'dunelmensis',
-    'dunelmi',
-    'dunelmians',
-    'duneva',
     'dunfa',
-    'dunfanaghy',
-    'dunfermline-based',
-    'dunfirmline',
-    'dunford-wood',
-    'dunford/parent',
-    'dunfords',
-    'dung-beetles',
-    'dung-caked',
-    'dung-coloured',
-    'dung-dwelling',
-    'dung-faced',
-    'dung-flies',
-    'dung-hai',
-    'dung-like',
-    'dung-mimicking',
     'dung-spattered',
-    'dungait',
-    'dungannon-based',
-    'dunganon',
-    'dungarthill',
-    'dungeon-vowelled',
-    'dungeys',
-    'dunglike',
-    'dungong',
-    'dungweed',
-    'dungworm',
-    'dunharrow',
-    'dunhenda',
-    'dunholm',
-    'dunhope',
-    'dunit',
     'dunkelweizen',
-    'dunkerly',
-    'dunkerton/driver',
-    'dunkertons',
-    'dunkhorst',
-    'dunkings',
-    'dunkirk-boulogne',
-    'dunkirk-style',
-    'dunkirk.',
-    'dunkleosteus',
-    'dunkler',
-    'dunkles',
-    'dunkley/balloon',
-    'dunkley/balloonist',
-    'dunkley/master',
-    'dunkley/pilot',
     'dunkling',
-    'dunky',
-    'dunlarg',
-    'dunlea',
-    'dunleary',
-    'dunleath',
-    'dunley',
-    'dunlop-humphrey/cross-channel',
-    'dunlop-trained',
-    'dunluskin',
-    'dunmacreena',
-    'dunmanifestin',
-    'dunn/award',
-    'dunn/cataract',
-    'dunn/countrywatch',
-    'dunn/fife',
     'dunn/garage',
-    'dunnaker',
-    'dunnart',
-    'dunnery',
-    'dunnetts',
-    'dunneven',
-    'dunnin',
-    'dunningite',
-    'dunningley',
-    'dunnon',
-    'dunnos',
-    'dunnose',
-    'dunny-in-the-wold',
-    'dunowen',
-    'dunque',
-    'dunroamin',
     'dunromin',
-    'dunrossil/conservative',
-    'dunscore',
-    'dunscri',
-    'dunselectin',
-    'dunsells',
-    'dunsely',
-    'dunshalt',
-    'dunsinea',
-    'dunslair',
-    'dunsland',
-    'dunsmore',
-    'dunsmore-hardy',
-    'dunsmure',
-    'dunsmuress',
-    'dunson',
     'dunst',
-    'dunstabians',
-    'dunstall',
-    'dunstan\'s-in-the-west',
-    'dunstan-in-the',
-    'dunstan-in-the-east',
-    'dunstanvill',
-    'dunsteld',
-    'dunston-based',
-    'dunstone/senior',
-    'dunstons',
-    'duntaylor',
-    'dunted.',
-    'dunter',
-    'dunthorne/oxford',
-    'duntinnie',
     'duntis',
-    'duntisbourne',
-    'duntreath',
-    'dunts',
-    'duntulm',
-    'dunvant6',
-    'dunville',
-    'dunvin-markievicz',
-    'dunwan',
-    'dunway',
-    'dunwick',
-    'dunworth',
-    'dunyask',
-    'duo-art',
-    'duo-bus',
-    'duo-pianist',
     'duo.',
-    'duodecies',
-    'duodecim',
-    'duodenal-gastric',
-    'duodenale',
-    'duodenocolic',
-    'duodenofibrescope',
-    'duodenogastro',
-    'duodenoscope',
-    'duodenoscopes',
-    'duodenoscopy',
-    'duodenotomy',
-    'duodentitis',
-    'duodenuma',
-    'duodo',
-    'duodu',
     'duogastrone',
-    'duoi',
-    'duolian',
-    'duolians',
-    'duolithic',
-    'duologues',
-    'duomatics',
-    'duon',
-    'duophone',
-    'duopolies',
-    'duopolists',
-    'duopoly.the',
-    'duorail',
-    'duotac',
-    'duovir',
-    'dup/vanguard',
     'dupage',
-    'duperoux',
-    'duperval',
-    'dupey',
-    'dupeyron',
-    'dupf',
-    'duphalac-duphar',
-    'dupicate',
-    'dupl',
-    'duplessis',
-    'duplexed',
-    'dupli-carvers',
-    'duplicated-resource',
-    'duplicities',
-    'duplicitously',
-    'dupm',
     'dupont/camex',
-    'duponti',
-    'dupontia',
-    'dupuy',
-    'duquenoy',
-    'durabilities',
-    'durables-infrequent',
-    'durabuild',
-    'duracells',
-    'durafelt',
-    'durafort',
-    'durafour-crematoire',
-    'duragel',
-    'duraj',
-    'duralinium-lined',
-    'durameau',
     'durance-jourdain',
-    'durand-deacon',
-    'durandal',
-    'durande',
-    'durandelle',
-    'durandii',
-    'durano',
-    'durans',
-    'durasteel',
-    'duration-related',
-    'duration.',
-    'duratiown',
-    'duratively',
-    'duratype',
-    'durbah',
-    'durbanville',
     'durber',
-    'durbervilles',
-    'durchaus',
-    'durden-smith',
-    'durdles',
-    'duree',
-    'durelle',
-    'durendal',
-    'duress&mdash;see',
-    'duresses',
-    'durey',
-    'durgapur',
-    'durgul',
-    'durham-based',
-    'durham-born',
-    'durham-mancelle',
     'durham-parkes',
-    'durham-somerset',
-    'durham/',
-    'durham/newcastle',
-    'durham/northumberland',
-    'durhambased',
-    'durhamers',
-    'durhanl',
-    'duri',
-    'duric/bosnian',
-    'during-puberty',
-    'durissima',
-    'durite',
-    'durleigh',
-    'durmala',
-    'durn',
     'durng',
-    'durnin/goal',
-    'durnin/oxford',
-    'durobrivis',
-    'durock',
-    'durocortorum',
-    'durosell',
-    'durotrigum',
-    'durox',
-    'durr/south',
-    'durrance',
-    'durrands',
-    'durranhill',
-    'durrans',
-    'durras',
-    'durrenroth',
     'durres/albania',
-    'durries',
-    'durrington',
-    'durrock',
-    'durrrrrrrrr',
-    'durruti',
-    'durrville',
-    'durs',
-    'dursch',
-    'durse',
-    'dursley&ndash;pedersen',
-    'durstine',
-    'durten',
-    'durtnell',
-    'durty',
-    'duru',
     'dury-esque',
-    'durzak',
-    'dusapin',
-    'dusary',
-    'duschdas',
-    'duse',
-    'dusen',
-    'dushchinta',
-    'dushenyka',
-    'dusi',
-    'dusillion',
-    'dusk-grey',
-    'dusk-laden',
-    'dusk-lit',
-    'dusk-white',
-    'duskier',
     'duskily',
-    'dusklight',
-    'dusky-black',
-    'dusky-pink',
-    'dusky-scarlet',
-    'dusky-skinned',
-    'duson',
-    'dussan',
-    'dusseldorf/munich',
-    'dussie',
-    'dust&rehy;men',
-    'dust&rehy;press',
-    'dust-air',
-    'dust-bag',
-    'dust-bins',
-    'dust-blown',
     'dust-blue',
-    'dust-caused',
-    'dust-cloud',
-    'dust-darkened',
-    'dust-explosion',
-    'dust-flecked',
-    'dust-gas',
-    'dust-grimy',
-    'dust-heat',
-    'dust-laying',
-    'dust-lifting',
-    'dust-man',
-    'dust-masks',
-    'dust-misted',
-    'dust-motes',
-    'dust-nebula',
     'dust-presses',
-    'dust-raising',
-    'dust-red',
-    'dust-rims',
-    'dust-sheeted',
-    'dust-shovelling',
-    'dust-size',
-    'dust-smelling',
-    'dust-stiffened',
-    'dust-storms',
-    'dust-trap',
-    'dust-wreathed',
-    'dust/epoxy',
-    'dustballs',
-    'dustbi',
-    'dustbin\'',
     'dustbin-crowded',
-    'dustbin-day',
-    'dustbin-fuls',
-    'dustbin-lined',
-    'dustbin-liner',
-    'dustbin-liners',
-    'dustbin-marauding',
-    'dustbin-sized',
-    'dustbin-type',
-    'dustbin.',
-    'dustcloud',
-    'dustcoats',
-    'dustdevil',
-    'dustdevils',
-    'dusted-down',
-    'dusted-over',
     'dustette',
-    'dustheap',
-    'dustheaps',
-    'dustin/sumner',
-    'dusting-down',
-    'dustings',
-    'dustlouse',
-    'dustmotes',
-    'dustov',
-    'dustproof',
-    'dustsheet',
-    'dustsheeted',
-    'dustwomen',
-    'dusty&rehy;pink',
-    'dusty-blank',
-    'dusty-faced',
     'dusty-green',
-    'dusty-robed',
-    'dusulphate',
-    'dut',
-    'dut&aacute;n',
-    'dutar',
-    'dutce',
-    'dutch-accent',
-    'dutch-backed',
-    'dutch-born',
-    'dutch-bred',
-    'dutch-built',
-    'dutch-commanded',
-    'dutch-doll',
-    'dutch-english',
-    'dutch-gabled',
     'dutch-german',
-    'dutch-indonesian',
-    'dutch-led',
-    'dutch-occupied',
-    'dutch-ruled',
-    'dutch-sponsored',
-    'dutch-style',
-    'dutch-tiled',
-    'dutch/american',
-    'dutch/belgian',
-    'dutch/flemish',
-    'dutch/portuguese',
-    'dutch/swiss',
-    'dutchman.',
-    'dutchman/senta',
-    'dutchshell',
     'duteously',
-    'duteplase',
-    'dutfield',
-    'dutfin',
-    'duthac',
-    'dutie',
-    'duties&ndash',
-    'dutilleul-masurel',
-    'dutka',
-    'dutko',
-    'dutoit/philadelphia',
-    'dutosky',
-    'dutp',
-    'dutra',
-    'dutsch',
-    'dutse',
     'dutter',
-    'dutton-forshaw',
-    'dutton/gloucestershire',
-    'dutton/nal',
-    'dutton/solicitor',
-    'dutty',
-    'duty\'',
-    'duty-beats',
-    'duty-boat',
-    'duty-conscious',
-    'duty-made',
-    'duty-neuron',
-    'duty-roster',
-    'duty-rotas',
-    'duty-sergeant',
-    'duty-suspended',
     'duty.soon',
-    'duty/taking',
-    'duty_on_the',
-    'dutyfrees',
-    'dutys',
-    'duumvirs',
-    'duuring',
-    'duurstede',
-    'duut/refugee',
-    'duvall-stood',
-    'duvaz',
-    'duveens',
-    'duverger',
-    'duvet-cover',
-    'duvet-like',
-    'duvillard',
     'duvoisin',
-    'duvy',
-    'duwaydar',
-    'duwynt',
-    'duxberry',
-    'duxworth',
-    'duyn',
-    'duyodenal',
-    'duyunolepis',
-    'dv/dt',
-    'dv/dv',
-    'dv841',
-    'dv=jdv',
-    'dvaita',
-    'dvc',
-    'dvi-related',
     'dvina',
-    'dvision',
-    'dvizhenie',
-    'dvo&rcaron&aacute;k-like',
-    'dvo&rcaron&agrave;k',
-    'dvoeverie',
-    'dvory',
-    'dvoryane',
-    'dvoryanstvo',
-    'dvp',
-    'dvsm',
-    'dvts',
-    'dvv',
-    'dvx',
-    'dw15',
-    'dw20',
     'dw4',
-    'dw400',
-    'dwangwa',
-    'dwarf-bean',
-    'dwarf-forged',
-    'dwarf-held',
-    'dwarf-hewn',
-    'dwarf-life',
-    'dwarf-like',
-    'dwarf-lily',
-    'dwarf-star',
-    'dwarfey',
-    'dwarkanath',
-    'dwarvishly',
-    'dweebettes',
-    'dweeje',
     'dwejra',
-    'dwelle',
-    'dwellers-around',
-    'dwelles',
-    'dwelli',
-    'dwellin\'',
-    'dwelling&rehy;house',
-    'dwelling-apartments',
-    'dwelling-colonial',
-    'dwelling-ground',
-    'dwelling-space',
-    'dwellings.',
-    'dwellt',
-    'dwellyng',
-    'dwelt-on',
-    'dwem',
     'dwems',
-    'dwergar',
-    'dwerryhouse',
-    'dwf',
-    'dwi-fungsi',
-    'dwibbly',
-    'dwile',
-    'dwind',
-    'dwing',
-    'dwipa',
-    'dwk',
-    'dwmail',
-    'dwon',
-    'dwor',
-    'dworkins',
-    'dws',
     'dwunk',
-    'dwurnik',
-    'dwy',
-    'dwyle',
-    'dwymyn',
-    'dx2&ndash;66',
-    'dxc2',
-    'dxcp',
-    'dxd5',
-    'dxe',
-    'dxe-based',
-    'dxe5&verbar&verbar;nxe5&verbar&verbar;23',
-    'dxe6',
-    'dxgiii',
-    'dxl',
-    'dxpedition',
     'dxpeditioners',
-    'dxpeditions',
-    'dxs',
-    'dxs17',
-    'dxs3',
-    'dxs370',
-    'dxs740',
-    'dxs94',
-    'dxtps',
-    'dxxg',
-    'dxycp',
-    'dyad-related',
-    'dyading',
-    'dyaki',
-    'dyakovo',
-    'dyan',
     'dyasi',
-    'dyball',
-    'dyban',
-    'dybkjaer',
-    'dybski',
-    'dycer',
-    'dyche',
-    'dyckhoff',
-    'dycp',
-    'dydime',
-    'dydon',
-    'dye-',
-    'dye-baths',
-    'dye-house',
-    'dye-in-liquid',
-    'dye-layer',
     'dye-making',
-    'dye-plant',
-    'dye-producing',
-    'dye-stuff',
-    'dye-terminator',
-    'dye:epoxy',
-    'dyed-blonde',
-    'dyehenko',
-    'dyeline',
-    'dyell',
-    'dyemaker',
-    'dyenasty',
-    'dyer\'s-bugloss',
-    'dyer\'s-greenweed',
-    'dyes-the',
-    'dyetary',
     'dyfeisio',
-    'dyffed',
-    'dyfnallt',
-    'dyg564b',
-    'dying&mdash;how',
-    'dying-down',
-    'dying-duck',
-    'dying-in',
-    'dying-out',
-    'dying/is',
-    'dyingness',
-    'dyir',
-    'dyk',
-    'dyka',
-    'dyke-acland',
-    'dyke-divide',
     'dyke-forming',
-    'dyke-hag',
-    'dyke-mobile',
-    'dyke-wellington',
-    'dykeheads',
-    'dykers',
-    'dykeside',
-    'dykhtau',
-    'dyl',
-    'dylan-biograph',
-    'dylan-type',
-    'dyland',
-    'dylanised',
-    'dylanologists',
-    'dylexia',
-    'dyli',
     'dylis',
-    'dyllansow',
-    'dylle',
-    'dylycate',
-    'dymakkya',
-    'dymally',
-    'dymaxion',
-    'dyme',
-    'dymetol',
-    'dymoed',
-    'dymoke',
-    'dymotape',
-    'dyn/',
-    'dyn/sec.cm',
-    'dyna-rod',
-    'dynabeads',
     'dynacomp',
-    'dynam',
-    'dynamic-programming-type',
-    'dynamicism',
-    'dynamicists',
-    'dynamikou',
-    'dynamise',
-    'dynamism.',
-    'dynamix',
-    'dynamo-operated',
-    'dynamoed',
-    'dynamoes',
-    'dynamotologist',
-    'dynan',
-    'dynascan',
-    'dynastar',
     'dynasteia',
-    'dynastic-minded',
-    'dynastical',
-    'dynastid',
-    'dynasty-style',
-    'dynatek',
-    'dyncorp',
-    'dyneley',
-    'dynema',
-    'dynewydd',
-    'dynix(r)',
-    'dynne',
-    'dynorphins',
-    'dyns',
-    'dyonas',
-    'dyoni',
     'dyosad',
-    'dyott',
-    'dyou',
-    'dyouthinkesesawrus',
-    'dyp&mdash;true',
-    'dyrchafiad',
-    'dyrh&oacute;l&aelig;y',
-    'dyrhaven',
-    'dyring',
-    'dyrlund',
-    'dyrrachium',
-    'dyrynk',
-    'dysart.',
-    'dysarthria',
-    'dysarts',
-    'dysentery-type',
     'dysentry',
-    'dysequilibrium',
-    'dysert',
-    'dysfluent',
-    'dysfunctionalism',
-    'dysfunctionality',
-    'dysfunctionally',
-    'dysgraphias',
-    'dysinger',
-    'dyskinesias',
-    'dyslipidaemic',
-    'dysmorphologies',
-    'dysnomia',
-    'dyson-hudson',
-    'dysp',
-    'dyspapsia',
     'dyspepsic',
-    'dysplacia',
-    'dysplasias',
-    'dysponea',
-    'dysprosium',
-    'dysreflexia',
-    'dysregulation',
-    'dysrhythmia',
-    'dysseasid',
-    'dyssynergic',
-    'dystocia',
-    'dystonia',
-    'dystopic',
-    'dystrophies',
-    'dystrophin-associated',
-    'dystrophins',
     'dyten',
-    'dytiscidae',
-    'dyttye',
-    'dyulgerov',
-    'dyve',
-    'dyvers',
-    'dyz',
-    'dyz-specific',
-    'dyz1-specific',
-    'dz.',
-    'dz/is',
-    'dzaba',
-    'dzanga-ndoki',
-    'dzanga-sangha',
-    'dzantav',
-    'dzaoudzi',
     'dzardin',
-    'dzat',
-    'dzenkle',
-    'dzerszhinsky',
-    'dzerzhihsky',
-    'dzerzinsky',
-    'dzevad',
-    'dzewu',
-    'dzhalil',
-    'dzhambul',
-    'dzhenchurayev',
-    'dzherzhinsky',
-    'dzi&eogon;kuje',
-    'dziak',
-    'dziendziel',
-    'dziewanowski',
     'dzikow',
-    'dzindzihashvili',
-    'dzodzi',
-    'dzongkhags',
-    'dzonkwa',
-    'dzubeck',
-    'dzumber',
-    'dzundza',
-    'dzvimbo',
-    'dzwig',
-    'dzyan',
-    'e&agr',
-    'e&agr;e&bgr',
-    'e&amp;b',
-    'e&amp;fn',
-    'e&amp;pd',
     'e&amp;ss',
-    'e&auml',
-    'e&ccedil;a',
-    'e&dgr;en',
-    'e&flat;9',
-    'e&infin',
-    'e&lt;d',
-    'e&mdash;3',
-    'e&mdash;h',
-    'e&mdash;the',
-    'e&natur',
-    'e&ndash;ample',
-    'e&ndash;plain',
-    'e&ouml;nw&euml',
-    'e&ouml;tr&ouml;s',
-    'e&pound;1,500',
     'e&pound;3,775',
-    'e&pound;37,473',
-    'e&pound;41,248',
-    'e&rarr;p',
-    'e&rehy;heads',
-    'e&rgr;a',
-    'e&ucirc;t',
-    'e\'asy',
-    'e\'l',
-    'e\'la',
-    'e\'ly',
-    'e(f)/121',
-    'e(p)',
-    'e(ri)',
-    'e(s)',
-    'e-113c',
     'e-15s',
-    'e-16s',
-    'e-220',
-    'e-2500',
-    'e-28',
-    'e-3',
-    'e-5',
-    'e-6',
-    'e-a',
-    'e-additives',
-    'e-boat',
-    'e-bow',
-    'e-boy',
-    'e-cadherin-dependent',
-    'e-cadherin-expressing',
-    'e-cadherin-independent',
     'e-cadherin-transfected',
-    'e-coes',
-    'e-coli',
-    'e-component',
-    'e-core',
-    'e-culture',
-    'e-days',
-    'e-detector',
-    'e-elephant',
-    'e-ellie',
-    'e-expedition',
-    'e-f',
-    'e-face',
-    'e-facing',
-    'e-factor',
-    'e-fit',
     'e-flats',
-    'e-folding',
-    'e-fu',
-    'e-g.',
-    'e-generation',
-    'e-grade',
-    'e-i',
-    'e-iii',
-    'e-impossible',
-    'e-jones',
-    'e-lo-de-ar',
-    'e-mail:geo2:aidoc',
-    'e-mailed',
-    'e-momin',
-    'e-night',
-    'e-number',
     'e-of',
-    'e-palaeographers',
-    'e-paleographers',
-    'e-reg',
-    'e-registered',
-    'e-registration',
-    'e-restricted',
-    'e-rich',
-    'e-right',
-    'e-s',
-    'e-sat',
-    'e-string',
-    'e-sytems',
-    'e-text',
-    'e-types',
-    'e-words',
     'e-x-p-l-o-i-t-e-d',
-    'e-yes',
-    'e.-l',
-    'e.-w.',
-    'e.1',
-    'e.14',
-    'e.351',
-    'e.42nd',
-    'e.a.o.',
-    'e.a.t',
-    'e.b.i.h.q.',
-    'e.c.c.',
-    'e.c.ferenie',
-    'e.c.s.',
-    'e.c.t.',
-    'e.c.u.',
     'e.coli.',
-    'e.ds',
-    'e.e.c',
-    'e.f.benson',
-    'e.f.e.s.',
-    'e.f.f.s.',
-    'e.f.j.',
-    'e.f.knipling',
-    'e.g.a',
-    'e.g.chestnut',
-    'e.g.clapping',
-    'e.g.fraud',
-    'e.g.jones',
-    'e.g.lard',
-    'e.g.m',
-    'e.g.m.',
     'e.g.points',
-    'e.garber',
-    'e.h.e',
-    'e.h.r.r',
-    'e.h.w.',
-    'e.ix',
-    'e.j.c.',
-    'e.j.w.',
-    'e.l.t.',
-    'e.l.v.',
-    'e.laue',
-    'e.lephant',
-    'e.m.b.',
-    'e.m.j.a.',
-    'e.m.s.',
-    'e.m.w.',
     'e.m.y.',
-    'e.murphy',
-    'e.n.',
-    'e.n.e.',
-    'e.n.e.-w.s.w.',
-    'e.n.e.l.',
-    'e.n.t.',
-    'e.o.s.',
-    'e.p.evans',
-    'e.p.i.',
-    'e.p.s.p.s',
-    'e.r.354',
-    'e.r.jessop',
-    'e.raven',
-    'e.s.p.',
-    'e.s.r.',
     'e.s.r.c',
-    'e.t',
-    'e.t.gifts',
-    'e.t.s.',
-    'e.v.phillips',
-    'e.v.young',
-    'e/00/22/0002',
-    'e/00/22/0009',
-    'e/00/22/2005',
-    'e/00/22/2011',
-    'e/00/23/0049',
-    'e/00/23/2054',
-    'e/00/23/2109',
-    'e/00/23/2125',
-    'e/00/23/2131',
-    'e/00/23/2153',
     'e/00/23/2159',
-    'e/00/23/2161',
-    'e/00/23/2162',
-    'e/00/23/2175',
-    'e/00/23/2183',
-    'e/00/23/2186',
-    'e/00/23/2187',
-    'e/00/23/2196',
-    'e/00/23/2197',
-    'e/00/23/2207',
-    'e/00/23/2210',
-    'e/00/23/2224',
-    'e/00/23/2227',
-    'e/00/23/2236',
-    'e/00/23/2238',
-    'e/00/23/2241',
     'e/00/23/2242',
-    'e/00/23/2245',
-    'e/00/23/2246',
-    'e/00/23/2251',
-    'e/00/23/2270',
-    'e/00/23/2277',
-    'e/00/23/2283',
-    'e/00/23/2287',
-    'e/00/23/2289',
-    'e/00/23/2292',
-    'e/00/23/2294',
-    'e/00/24/2038',
-    'e/00/24/2045',
-    'e/00/24/2050',
-    'e/00/24/2057',
-    'e/00/26/0018',
     'e/00/28/0001',
-    'e/01/26/0010-1',
-    'e/02/25/0000',
-    'e/03/25/0000',
-    'e/04/25/0000',
-    'e/04/25/0007',
-    'e/04/25/0008',
-    'e/04/25/0010',
-    'e/04/25/0012',
-    'e/05/25/0000',
-    'e/05/25/0006',
-    'e/05/25/0009',
-    'e/05/25/0010',
-    'e/05/25/0014',
-    'e/05/25/0018',
-    'e/06/25/0000',
     'e/06/25/0013',
-    'e/06/25/0019',
-    'e/06/25/0020',
-    'e/06/25/0023',
-    'e/06/25/0027',
-    'e/06/25/0029',
-    'e/06/25/0031',
-    'e/06/25/0035',
-    'e/06/25/0036',
-    'e/09/25/0000',
-    'e/09/25/0001',
-    'e/09/25/0002',
-    'e/09/25/0005',
-    'e/09/25/0006',
-    'e/09/25/0009',
-    'e/09/25/0011',
     'e/09/25/0013',
-    'e/11/25/0000',
-    'e/11/25/0001',
-    'e/11/25/0002',
-    'e/11/25/0003',
-    'e/11/25/0005',
-    'e/11/25/0006',
-    'e/11/25/0011',
-    'e/13/25/0005',
-    'e/1omund',
-    'e/1owyn',
-    'e/1pigraphs',
-    'e/b',
-    'e/f',
-    'e/p/r',
-    'e/tm3',
     'e/w',
-    'e000',
-    'e06',
-    'e1&gt;e0',
-    'e1&lt;e0',
-    'e1&sol;2',
-    'e1&sol;25c',
-    'e1-e0',
-    'e1-sh',
-    'e1.',
-    'e1/psti',
-    'e10.93',
-    'e101/676/51',
-    'e102',
-    'e11-e13',
-    'e11.93',
     'e111\'s',
-    'e12000',
-    'e123',
-    'e127',
-    'e13.93',
-    'e131',
-    'e132',
-    'e1385',
-    'e139',
-    'e14.93',
-    'e142',
-    'e15.93',
-    'e151',
-    'e153',
-    'e1536',
-    'e16.93',
     'e160g',
-    'e162',
-    'e179',
-    'e19',
-    'e1ectioneering',
-    'e200/scholar',
-    'e21',
-    'e220',
-    'e222',
-    'e233',
-    'e25c',
-    'e25c,5c',
-    'e26a',
-    'e28',
-    'e2e4',
-    'e3&mdash;012',
     'e3+',
-    'e3-b6',
-    'e3003',
-    'e301',
-    'e331',
-    'e351/306',
-    'e36a',
-    'e3s',
-    'e3x',
-    'e4&verbar&verbar;d6&verbar&verbar;2',
-    'e4.',
-    'e4.93a',
-    'e4.93b',
-    'e4.93d',
-    'e4.93e',
-    'e4.93f',
     'e4.93g',
-    'e4.93h',
-    'e4.93i',
-    'e41',
-    'e410',
-    'e414',
-    'e428.',
-    'e450',
-    'e460',
-    'e4a',
-    'e5&plus',
-    'e5&sol;6',
-    'e5&verbar&verbar;nfd7&verbar&verbar',
-    'e5\'s',
-    'e5/b',
-    'e5001',
     'e51',
-    'e5259',
-    'e5467',
-    'e55',
-    'e56',
-    'e566',
-    'e5x5r5btc-on',
-    'e6&bsol;7',
-    'e6&plusmn',
-    'e6&sol;7',
-    'e6.93',
-    'e6000\'s',
-    'e601',
-    'e621',
-    'e634',
-    'e66',
     'e7&ndash;e10',
-    'e7&pound;9',
-    'e7.93',
-    'e7/8',
-    'e72/25',
-    'e75',
-    'e76b',
-    'e7723',
-    'e7746',
-    'e791',
-    'e7after',
-    'e8-e11',
-    'e8.93',
-    'e8132',
-    'e817',
-    'e851/',
     'e9.93',
-    'e9000',
-    'e92+',
-    'e=mc2',
-    'ea-250',
-    'ea-400',
-    'ea.',
-    'ea/&bgr;-actin',
-    'ea/00/20/0001',
-    'ea/00/20/0002',
-    'ea/00/20/0003',
-    'ea/00/20/0004',
-    'ea/00/20/0005',
-    'ea/00/20/0007',
-    'ea/00/20/0008',
-    'ea/00/20/0010',
     'ea/00/20/0011',
-    'ea/00/20/0012',
-    'ea/00/20/0013',
-    'ea/00/20/0014',
-    'ea/00/20/0015',
-    'ea/00/20/0016',
-    'ea/00/20/0017',
-    'ea/00/20/0018',
-    'ea/00/20/0019',
-    'ea/00/20/0020',
-    'ea/00/20/0021',
-    'ea/00/20/0022',
-    'ea/00/20/0023',
-    'ea/00/20/0024',
-    'ea/00/20/0025',
-    'ea/00/20/0026',
     'ea/00/20/0028',
-    'ea/00/20/0103',
-    'ea/locus',
-    'ea260',
-    'ea30',
-    'ea40bi',
-    'eabani',
-    'each-company',
-    'eachan',
-    'eachcontext',
-    'eachothers',
-    'eadales',
-    'eadbangin',
-    'eadburg',
-    'eadburh',
-    'eaden',
     'eadership',
-    'eadon',
-    'eadstown',
-    'eadulf',
-    'eadwacer',
-    'eadward',
-    'eadwin',
-    'eadwold',
-    'eaeac&pound;e',
-    'eaei',
-    'eagelscliffe',
-    'eager-eyed',
-    'eager-faced',
-    'eager-looking',
-    'eager-to-help',
-    'eager-to-impress',
     'eagerest',
-    'eagerness.',
-    'eagil',
-    'eagle&rehy;messenger',
-    'eagle\'',
-    'eagle-3',
-    'eagle-and-swastika',
-    'eagle-atlas',
-    'eagle-clarke',
-    'eagle-creature',
-    'eagle-crowned',
-    'eagle-eye',
-    'eagle-feather',
-    'eagle-feathers',
-    'eagle-like',
-    'eagle-mounted',
     'eagle-phantom',
-    'eagle-plastrons',
-    'eagle-sized',
-    'eagle-spotting',
-    'eagle-two',
-    'eagle.',
-    'eagle/falcon',
-    'eaglehurst',
-    'eaglemann',
-    'eaglescliffe-based',
-    'eaglesclough',
-    'eagleson',
-    'eagleston',
-    'eaglestone',
-    'eagletrap',
-    'eagon',
     'eain',
-    'eakenhead',
-    'eaker',
-    'eaking',
-    'eala',
-    'ealand/driver',
-    'ealderman',
-    'ealdgyth',
-    'ealdormanry',
-    'eale',
-    'ealees',
-    'ealey/thames',
-    'ealing-born',
-    'ealingesque',
-    'ealmes',
-    'ealric',
     'eals',
-    'ealu',
-    'eanfled',
-    'eanfleda',
-    'eanna',
-    'eanred',
-    'eant',
-    'eapitalist',
-    'eappa',
-    'ear&mdash;greek',
-    'ear&rehy;holes',
-    'ear\'',
-    'ear\'oles',
-    'ear*',
-    'ear-\'oles',
-    'ear-aerials',
     'ear-bashers',
-    'ear-boxing',
-    'ear-by-stimulus',
-    'ear-canal',
-    'ear-cleaning',
-    'ear-crushing',
-    'ear-curdling',
-    'ear-damaging',
-    'ear-drops',
-    'ear-flattening',
-    'ear-fringe',
-    'ear-holes',
-    'ear-holing',
-    'ear-it',
-    'ear-lowering',
-    'ear-muffed',
     'ear-muffs',
-    'ear-opener',
-    'ear-opening',
-    'ear-patches',
-    'ear-pick',
-    'ear-pieces',
-    'ear-plug',
-    'ear-punishing',
-    'ear-rending',
-    'ear-shaped',
-    'ear-stones',
-    'ear-stud',
-    'ear-tagged',
-    'ear-tested',
-    'ear-thudding',
-    'ear-tickling',
     'ear-to-ear',
-    'ear-to-the',
-    'ear-tom',
-    'ear-training',
-    'ear-tugging',
-    'ear-witness',
-    'earaches',
-    'earbands',
-    'earbobs',
-    'earbone',
-    'earbones',
-    'earchip',
-    'eardrops',
-    'eardrum-battering',
-    'eardrum-piercing',
-    'eareckson',
     'earee',
-    'earen',
-    'earendel-references',
-    'eares',
-    'earflap',
-    'earflaps',
-    'earh',
-    'eariler',
-    'earing',
-    'eariy',
-    'earl/castlemorton',
-    'earle/beauty',
-    'earlem',
-    'earlier&mdash',
-    'earlier-',
-    'earlier-as',
     'earlier-occurring',
-    'earlier-vintage',
-    'earlier-you',
-    'earlier.',
-    'earlier_as',
-    'earliest-known',
-    'earliest-looking',
-    'earling',
-    'earllier',
-    'earlme',
-    'earlom',
-    'earlsbury',
-    'earlsdon',
-    'earlshall',
-    'earlsmere',
-    'earlsome',
     'earlstone',
-    'earlstown.',
-    'early&rehy;flowering',
-    'early-\'60s',
-    'early-\'80s',
-    'early-17th-century',
-    'early-18th-century',
-    'early-1991',
-    'early-80s',
-    'early-adopters',
-    'early-bather',
-    'early-break',
-    'early-century',
-    'early-comers',
-    'early-diagnosed',
-    'early-eleventh-century',
     'early-emphasized',
-    'early-fifth-century',
-    'early-flavian',
-    'early-forties',
-    'early-fourteenth',
-    'early-fourteenth&rehy;century',
-    'early-fourteenth-century',
-    'early-generated',
-    'early-ish',
-    'early-learned',
-    'early-mid-\'sixties',
-    'early-middle-aged',
-    'early-midsummer',
-    'early-nineteenth',
-    'early-open',
-    'early-renaissance',
     'early-rising',
-    'early-session',
-    'early-seventeenth-century',
-    'early-shift',
-    'early-stage',
-    'early-start',
-    'early-starting',
-    'early-stuart',
-    'early-to-mid-1990s',
-    'early-to-mid-fifties',
-    'early-twelfth-century',
-    'early-twentieth',
-    'early-winter',
-    'early.because',
-    'early/late',
-    'early/mid',
     'early/mid-fourth',
-    'early/middle/late',
-    'early1907',
-    'earlybirds',
-    'earlyh',
-    'earlyriser',
-    'earn/bitnet',
-    'earn_a',
-    'earnach',
-    'earnbank',
-    'earnest(1)',
-    'earnestly.',
-    'earnests',
-    'earnign',
-    'earnin\'',
-    'earnings&rehy;related',
     'earnings-enhancing',
-    'earnings-per-share',
-    'earnings.',
-    'earnings/employment',
-    'earpads',
-    'earpiercing',
-    'earpricking',
-    'earragh',
-    'earring-maker',
-    'ears-an',
-    'ears-of-corn',
-    'ears/were',
-    'earse',
-    'earsed',
-    'earsewig',
-    'earshot&mdash;and',
     'earspeakers',
-    'earsplittingly',
-    'eartag',
-    'earth&mdash;australasia',
-    'earth&ndash;moon&ndash;sun',
-    'earth&ndash;surface',
-    'earth-balancing-pyramid',
-    'earth-beaten',
-    'earth-borne',
-    'earth-bottomed',
-    'earth-bowel',
-    'earth-burial',
-    'earth-centre',
-    'earth-centred',
-    'earth-colours',
-    'earth-covered',
     'earth-diggers',
-    'earth-dwellers',
-    'earth-dwelling',
-    'earth-encrusted',
-    'earth-facing',
-    'earth-floored',
-    'earth-foetus',
-    'earth-forces',
-    'earth-fountains',
-    'earth-friendly',
-    'earth-glitter',
-    'earth-god',
-    'earth-green',
-    'earth-hued',
-    'earth-linkage',
-    'earth-mapping',
     'earth-mass',
-    'earth-melting',
-    'earth-motherhood',
-    'earth-movers',
-    'earth-netherlands',
-    'earth-notes',
-    'earth-orbit',
-    'earth-penetrator',
-    'earth-quake',
-    'earth-residence',
-    'earth-s',
-    'earth-sea',
-    'earth-shaker',
-    'earth-shrinking',
-    'earth-sized',
-    'earth-smoke',
     'earth-stoppingly',
-    'earth-suckled',
-    'earth-sun',
-    'earth-tangential',
-    'earth-terminal',
-    'earth-tired',
-    'earth-tremor',
-    'earth-wall',
-    'earth-worshipper',
-    'earth/',
-    'earth/ecology',
-    'earth/food',
-    'earth/mankind',
-    'earth/pathfinder',
-    'earth/terracotta/red',
-    'earth/the',
     'eartham',
-    'earthborn',
-    'earthcore',
-    'earthed-over',
-    'earthen-floor',
-    'earthenergy',
-    'earther',
-    'earthfirst',
-    'earthfurniture',
-    'earthily',
-    'earthquake-detecting',
-    'earthquake-hit',
-    'earthquake-prone',
-    'earthquake-related',
-    'earthquake-resistance',
-    'earthquake-resistant',
     'earthquake-shock',
-    'earthquake-stricken',
-    'earthquake.',
-    'earthquaked',
-    'earthscan.',
-    'earthscience',
-    'earthshaker',
-    'earthshrinker',
-    'earthstar',
-    'earthstation',
-    'earthstations',
-    'earthwheel',
-    'earthwoman',
-    'earthworks/',
-    'earthylooking',
-    'earvin',
     'earwaker',
-    'earwigged',
-    'earwiggin\'',
-    'earworm',
-    'eary',
-    'easain',
-    'easains',
-    'easams',
-    'easbourne',
-    'ease.',
-    'eased-up',
-    'easel-based',
-    'easel-pictures',
-    'easement.',
-    'easi-feeders',
-    'easi-gro',
     'easi-mesh',
-    'easier&rehy;it',
-    'easier-going',
-    'easier-running',
-    'easier-to-clean',
-    'easier-to-get',
-    'easier-to-manage',
-    'easies',
-    'easiest-ever',
-    'easiest-to-make',
-    'easily&rehy;readable',
-    'easily-',
-    'easily-accessible',
-    'easily-available',
-    'easily-bored',
-    'easily-bought',
     'easily-bred',
-    'easily-broken',
-    'easily-controlled',
-    'easily-deciphered',
-    'easily-delivered',
-    'easily-digestible',
-    'easily-discernible',
-    'easily-disguised',
-    'easily-drinkable',
-    'easily-earned',
-    'easily-found',
-    'easily-handled',
-    'easily-identifiable',
-    'easily-led',
-    'easily-maintained',
-    'easily-managed',
     'easily-measured',
-    'easily-penetrated',
-    'easily-reached',
-    'easily-read',
-    'easily-recognised',
-    'easily-recognizable',
-    'easily-remedied',
-    'easily-targeted',
-    'easily-understood',
-    'easing-off',
-    'easington-born',
-    'easishop',
-    'easiway',
-    'easley',
-    'easonsmith',
-    'east&ndash;west',
     'east&rehy;central',
-    'east-anglian',
-    'east-arab',
-    'east-based',
-    'east-block',
-    'east-coasters',
-    'east-european',
-    'east-gate',
-    'east-going',
-    'east-greek',
-    'east-indiaman',
-    'east-kilbride-based',
-    'east-london',
-    'east-setting',
-    'east-to-west',
-    'east-wood',
     'east/',
-    'east/africa',
-    'east/britain',
-    'east/chief',
-    'east/europe',
-    'east/north',
-    'east/portugese',
-    'east/south',
-    'eastabout',
-    'eastam',
-    'eastan',
-    'eastaugh',
-    'eastaways',
-    'eastbach',
-    'eastbourne.',
-    'eastburn',
     'eastcombe',
-    'eastden',
-    'easteal',
-    'eastell',
-    'eastem',
-    'eastend',
-    'easter/deputy',
-    'easterbridge',
-    'easterling',
-    'easterlings',
-    'easterman',
-    'eastern&rehy;inspired',
-    'eastern-bounding',
-    'eastern-european',
-    'eastern-most',
-    'easternly',
     'easternseaboard',
-    'eastfield&ndash;allocated',
-    'eastfields',
-    'eastham/development',
-    'eastham/wiltshire',
-    'easthorpe',
-    'easthwaite',
-    'eastick',
-    'eastie',
-    'easties',
-    'eastings',
-    'eastington/gloucestershire',
-    'eastland',
-    'eastlands',
-    'eastlea',
-    'eastleigh&ndash;refurbished',
     'eastman-kodak',
-    'eastman/kodak',
-    'eastment',
-    'eastmond',
-    'eastnor/herefordshire',
-    'eastoak',
-    'eastoes',
-    'easton/swindon',
-    'eastop',
-    'eastphalian',
-    'eastrop',
-    'eastshaw',
-    'eastward-dipping',
-    'eastward-looking',
-    'eastwest',
-    'eastwood-type',
     'eastwood.',
-    'eastwood/chairman',
-    'eastwood/gloucestershire\'s',
-    'eastwood/gypsy',
-    'eastwood/police',
-    'easy&rehy;access',
-    'easy-8',
-    'easy-angled',
-    'easy-availability',
-    'easy-call',
-    'easy-climb',
-    'easy-cook',
-    'easy-does-it',
-    'easy-e',
-    'easy-easy',
-    'easy-edit',
     'easy-feeling',
-    'easy-fitting',
-    'easy-fix',
-    'easy-fixing',
-    'easy-flow',
-    'easy-handling',
-    'easy-ish',
-    'easy-kerr',
-    'easy-learn',
-    'easy-living',
-    'easy-natured',
-    'easy-on-the-ear',
-    'easy-paced',
-    'easy-payment',
-    'easy-peasies',
-    'easy-reading',
     'easy-sounding',
-    'easy-tee',
-    'easy-term',
-    'easy-to-administer',
-    'easy-to-answer',
-    'easy-to-apply',
-    'easy-to-beat',
-    'easy-to-build',
-    'easy-to-cook',
-    'easy-to-digest',
-    'easy-to-draw',
-    'easy-to-drive',
-    'easy-to-eat',
-    'easy-to-find',
-    'easy-to-fit',
-    'easy-to-fix',
     'easy-to-grasp',
-    'easy-to-grip',
-    'easy-to-handle',
-    'easy-to-load',
-    'easy-to-manage',
-    'easy-to-open',
-    'easy-to-operate',
-    'easy-to-pass-tory-gcse',
-    'easy-to-peel',
-    'easy-to-run',
-    'easy-to-strip',
-    'easy-to-tear-off',
-    'easy-to-win',
-    'easy-virtue',
-    'easy/moderate',
-    'easy/th',
     'easyboot',
-    'easymoving',
-    'easyreach',
-    'easyreader',
-    'easytalk',
-    'easyways',
-    'easywin',
-    'eat-in',
-    'eat-shit-kill',
-    'eat-up',
-    'eat.n',
-    'eatcha',
-    'eaten-looking',
-    'eaten_a',
-    'eatenand',
-    'eater&mdash',
     'eatern',
-    'eateth',
-    'eathens',
-    'eating-behaviour',
-    'eating-books',
-    'eating-disorder',
-    'eating-disorders',
-    'eating-habits',
-    'eating-living',
-    'eating-nearly',
-    'eating-paper',
-    'eating-room',
-    'eating:quiet',
-    'eatings',
-    'eatitnatural',
-    'eatman',
     'eatock',
-    'eaton/oxfordshire',
-    'eatoni',
-    'eator',
-    'eatro',
-    'eatwot',
-    'eaukay',
-    'eautel',
-    'eaux-de-vie',
-    'eaval',
-    'eaved',
-    'eaven',
-    'eaves&rehy;droppers',
-    'eaves-',
-    'eavesham',
-    'eavestones',
     'eaxctly',
-    'eayrs',
-    'eazy',
-    'eb-1',
-    'eb-2',
-    'eb-2s',
-    'eb-650',
-    'eb-750',
-    'eb/&bgr;-actin',
-    'eb1',
-    'eb110',
-    'eb185(jc)',
-    'eb3-ish',
-    'eb6',
-    'eb8',
-    'ebac',
     'ebb-sleepers',
-    'ebbels',
-    'ebbelwei',
-    'ebbers',
-    'ebbes',
-    'ebbinghaus',
-    'ebbitt',
-    'ebbon',
-    'ebbor',
-    'ebbringham/christie',
-    'ebbrix',
-    'ebby',
-    'ebcc',
-    'ebco',
-    'ebdcs',
-    'ebden',
     'ebdg',
-    'ebeg&pound;be',
-    'ebel',
-    'ebenaceae',
-    'ebeneza',
-    'ebenficial',
-    'ebenistes',
-    'eber',
-    'ebermannstadt',
-    'eberneezer',
-    'ebertor',
-    'ebertplatz',
-    'eberts',
-    'ebertstiftung',
-    'eberz',
-    'ebi',
     'ebie',
-    'ebing',
-    'ebionim',
-    'ebiris',
-    'ebiscite',
-    'ebl',
-    'eblin',
-    'ebls',
-    'ebm',
-    'ebm11',
-    'ebmaj7&amp;sharp',
-    'ebmeier',
-    'ebnat-kappel',
-    'ebobo',
-    'eboe',
-    'ebonex',
     'ebonies',
-    'ebony&rehy;handled',
-    'ebony-buttoned',
-    'ebony-handled',
-    'ebony-shining',
-    'ebou&eacute',
-    'ebouka-babackas',
-    'ebps',
-    'ebrahimian',
-    'ebrey',
-    'ebudea',
-    'ebulfez',
-    'ebulliometry',
-    'ebullioscopy',
-    'ebullition',
-    'ebulo',
     'eburnated',
-    'eburnea',
-    'ebv-immortalized',
-    'ebyth',
-    'ebz',
-    'ebzw',
-    'ec&dollar;100,000,000',
-    'ec&dollar;103,00,000',
-    'ec&dollar;154,700,000',
-    'ec&dollar;158,100,000',
-    'ec&dollar;183,100,000',
-    'ec&dollar;184,000,000',
-    'ec&dollar;193,300,000',
-    'ec&dollar;20,000,000',
-    'ec&dollar;246,900,000',
-    'ec&dollar;25,000,000',
     'ec&dollar;30,000,000',
-    'ec&dollar;341,300,000',
-    'ec&dollar;348,100,000',
-    'ec&dollar;5,500,000',
-    'ec&dollar;58,900,000',
-    'ec&dollar;65,400,000',
-    'ec&dollar;7,000,000',
-    'ec&dollar;78,000,000',
-    'ec&dollar;81,196',
-    'ec&dollar;85,100,000',
-    'ec&dollar;93,200,000',
-    'ec&dollar;98,800,000',
-    'ec&mdash;see',
-    'ec&rehy;backed',
-    'ec-2400',
-    'ec-26',
     'ec-american',
-    'ec-arranged',
-    'ec-asean',
-    'ec-built',
-    'ec-canada',
-    'ec-central',
-    'ec-chinese',
-    'ec-financed',
-    'ec-fmc',
-    'ec-gulf',
-    'ec-hungary',
-    'ec-ibm',
-    'ec-identified',
-    'ec-iraq',
-    'ec-label',
-    'ec-national',
     'ec-nato',
-    'ec-organized',
-    'ec-regulation',
-    'ec-resident',
-    'ec-run',
-    'ec-soviet',
-    'ec-standard',
-    'ec-subsidised',
-    'ec/ce',
-    'ec/gatt',
-    'ec/hse',
-    'ec/japan',
-    'ec/nato',
-    'ec/weu',
-    'ec28c',
-    'ec2b',
     'ec2y',
-    'ec4p',
-    'ec50',
-    'ec83/12ax7',
-    'ec99',
-    'ecae',
-    'ecalles',
-    'ecalpon',
-    'ecart',
-    'ecas',
-    'ecc83s',
-    'eccard',
-    'eccc',
-    'eccellentissimi',
-    'eccen',
-    'eccen&rehy;tric',
     'eccentrically-placed',
-    'ecci',
-    'eccl',
-    'eccl&eacute;siastiques',
-    'eccle',
-    'eccles.',
-    'eccleshare/tewkesbury',
-    'eccleshill',
-    'ecclesi&aelig',
-    'ecclesiarchs',
-    'ecclesiarchy',
-    'ecclesias',
-    'ecclesiastical&rehy;political',
-    'ecclesiastical-political',
-    'ecclesiasticall',
-    'ecclesiasticism',
     'ecclesiatics',
-    'ecclesiis',
-    'ecclesiologically',
-    'eccleston/computer',
-    'ecclestonians',
-    'eccoti',
-    'eccovi',
-    'eccu',
-    'eccup',
-    'ecdysiast',
-    'ecerit',
-    'eceumenically',
-    'ecga',
-    'ecgbald',
-    'ecgburh',
-    'echandi',
     'echange',
-    'echavarri',
-    'echave',
-    'eche',
-    'echecs',
-    'echeidoros',
-    'echekrateia',
-    'echekratids',
-    'echelles',
-    'echeloned',
-    'echenard',
-    'echeverias',
-    'echeverr&iacute;a',
-    'echeverry',
-    'echezeaux',
-    'echibey',
     'echinades',
-    'echinochloa',
-    'echinochloa-',
-    'echinococcus',
-    'echinocorys',
-    'echinoderm-like',
-    'echinoderms.',
-    'echinoid',
-    'echinoid.bearing',
-    'echinoidea',
-    'echinos',
-    'echinospora',
-    'echinus',
-    'echlin',
-    'echmiadzin',
-    'echnical',
     'echnidna',
-    'echo-',
-    'echo-box',
-    'echo-cardiograph',
-    'echo-clicks',
-    'echo-distorted',
-    'echo-doppler',
-    'echo-effects',
-    'echo-filled',
-    'echo-machines',
-    'echo-planar',
-    'echo-producing',
-    'echo-sounders',
-    'echocardiograms',
-    'echoed-up',
-    'echoings',
     'echolalic',
-    'echoless',
-    'echolocation\'',
-    'echolocators',
-    'echopraxia',
-    'echorec',
-    'echosounder',
-    'echosounders',
-    'echothey',
-    'echoy',
-    'eciron',
-    'ecitb',
-    'eciton',
-    'ecitonis',
-    'eciv',
-    'eckardt',
     'eckart',
-    'eckdorf',
-    'eckels',
-    'eckenbrech',
-    'eckener',
-    'eckenstein',
-    'eckenstein&ndash;crowley',
-    'eckersall',
-    'eckershall',
-    'eckes',
-    'eckett',
-    'eckhardt-grammatt&eacute\'s',
-    'eckhardt-grammatte',
-    'ecklands',
-    'eckle',
-    'eckles',
     'eckleys',
-    'eckofisk',
-    'ecksteen',
-    'eckstock',
-    'ecky',
-    'ecl&eacute;e',
-    'eclaireur',
-    'eclampsia',
-    'eclanum',
-    'eclastic',
-    'eclat&mdash;i',
-    'eclats',
-    'ecld',
-    'eclectics',
-    'eclectro',
-    'eclip',
     'eclipse.',
-    'ecliptic-plane',
-    'eclogites',
-    'eclogitic',
-    'eclogues',
-    'eclosion',
-    'eclub',
-    'ecmra',
-    'ecnomic',
-    'eco-auditing',
-    'eco-aware',
-    'eco-bananas',
-    'eco-catastrophe',
-    'eco-citizen',
-    'eco-citizens',
-    'eco-class',
     'eco-collection',
-    'eco-concerns',
-    'eco-crisis',
-    'eco-discourse',
-    'eco-dork',
-    'eco-dosing',
-    'eco-echo',
-    'eco-energy',
-    'eco-fashionable',
-    'eco-huts',
-    'eco-logy',
-    'eco-management',
-    'eco-movie',
-    'eco-ok',
-    'eco-pac',
-    'eco-pilots',
     'eco-politics',
-    'eco-products',
-    'eco-sensitive',
-    'eco-smugness',
-    'eco-social',
-    'eco-sound',
-    'eco-sounders',
-    'eco-soundly',
-    'eco-taxes',
-    'eco-terrorism',
-    'eco-trendiness',
-    'eco-vandalism',
-    'eco1',
-    'ecob',
-    'ecobalances',
-    'ecoclimate',
     'ecocollection',
-    'ecodisc',
-    'ecoes',
-    'ecoforest',
-    'ecofuel',
-    'ecogenetic',
-    'ecol',
-    'ecolars',
-    'ecole(s)',
-    'ecoli',
-    'ecolirix',
-    'ecollection',
-    'ecolo&mdash;ecologist',
-    'ecolo-j',
-    'ecologically-dead',
-    'ecologically-fragile',
     'ecologically-managed',
-    'ecologically-minded',
-    'ecologically-ruinous',
-    'ecologically-unique',
-    'ecologiques',
-    'ecologiste',
-    'ecologists-greens-are',
-    'ecology-based',
-    'ecology-minded',
-    'ecology/environmental',
-    'ecolytes',
-    'ecom',
-    'ecometric',
-    'ecommendation',
-    'ecomomy',
-    'ecomonies',
     'econ&oacute;mica',
-    'econ&oacute;mico',
-    'econ/soc.',
-    'econ/social',
-    'econ/sociol',
-    'econe',
-    'econmomic',
-    'econo-matrixes',
-    'econoclimatic',
-    'economi',
-    'economic&mdash;financial',
-    'economic--',
-    'economic-activity',
-    'economic-assistance',
-    'economic-capital',
-    'economic-convergence',
     'economic-development',
-    'economic-growth-based',
-    'economic-orientated',
-    'economic-performance',
-    'economic-policy',
-    'economic-practicability',
-    'economic-technical',
-    'economic.',
-    'economic/',
-    'economic/econometric',
-    'economic/monetary',
-    'economic/productivity',
-    'economically-active',
-    'economically-damaging',
-    'economically-disadvantaged',
-    'economically-motivated',
     'economically-oriented',
-    'economically-rather',
-    'economically-rational',
-    'economically-reliant',
-    'economically-troubled',
-    'economically-viable',
-    'economicaly',
-    'economico-political',
-    'economics--together',
-    'economics-alan',
-    'economics-defying',
-    'economics-style',
-    'economics/technology',
-    'economicus',
-    'economides',
-    'economie',
     'economies.',
-    'economies/diseconomies',
-    'economiques',
-    'economisers',
-    'economist-driven',
-    'economist-researcher',
-    'economist-writer',
-    'economist.',
-    'economist/financial',
-    'economist/statisticians',
-    'economoic',
-    'economosis',
-    'economuy',
-    'economy&mdash;in',
-    'economy\'',
-    'economy-halting',
     'economy-in-exile',
-    'economy-oriented',
-    'economy-related',
-    'economy-subsistence',
-    'economy-watchers',
-    'economy-who',
-    'economy-wrecking',
-    'economy.i',
-    'economy/production',
-    'econonic',
-    'econor',
-    'ecoonmic',
-    'ecopolitical',
-    'ecoproduct',
-    'ecopschology',
-    'ecorcheurs',
     'ecori-hindiii',
-    'ecori-mspi',
-    'ecori-ncoi',
-    'ecori-psti',
-    'ecori-xmai',
-    'ecori/bamhi',
-    'ecos',
-    'ecospan',
-    'ecossais',
-    'ecossaise',
-    'ecostar',
-    'ecosystematic',
-    'ecotage',
-    'ecotax',
-    'ecotec-v6',
-    'ecotones',
     'ecotopians',
-    'ecotourists',
-    'ecotoxicological',
-    'ecotoxological',
-    'ecotrade',
-    'ecotrin',
-    'ecotypic',
-    'ecovalve',
-    'ecowas-installed',
-    'ecowas-sponsored',
-    'ecozoologists',
-    'ecr90',
-    'ecre-1',
-    'ecre-3',
-    'ecre-4',
-    'ecrivez',
     'ecrivisses',
-    'ecrm',
-    'ecro',
-    'ecro-gnothics',
-    'ecros',
-    'ecroyd',
-    'ecru-coloured',
-    'ecs-',
-    'ecsa',
-    'ecsc&mdash;established',
-    'ecsc-established',
-    'ecservices',
-    'ecstasis',
-    'ecstasy-induced',
-    'ecstasy-related',
-    'ecstatics',
     'ectasia',
-    'ectes',
-    'ecthpwethion',
-    'ecto-',
-    'ecto-parasites',
-    'ectoderm.',
-    'ectoenzyme',
-    'ectomycorrhizae',
-    'ectomycorrhizas',
-    'ectona',
-    'ectoparasitic',
-    'ectoplacental',
-    'ectopterygoid',
-    'ectropion',
-    'ects',
-    'ectual',
     'ecu*',
-    'ecu/dollar',
-    'ecu/lu',
-    'ecu/month',
-    'ecu1,150',
-    'ecu1,200',
-    'ecu1,580',
-    'ecu1.00=us&dollar;1.37255',
-    'ecu1.4',
-    'ecu1.5',
-    'ecu1.8',
-    'ecu100,000',
-    'ecu108',
-    'ecu108,600',
-    'ecu10m',
-    'ecu110',
     'ecu110,000,000',
-    'ecu111,370',
-    'ecu12,680',
-    'ecu12.3',
-    'ecu137,000,000',
-    'ecu14',
-    'ecu14.7',
-    'ecu146',
-    'ecu15',
-    'ecu15,300',
-    'ecu15.5',
-    'ecu150',
-    'ecu16,000',
-    'ecu166,000,000',
-    'ecu170,000,000',
-    'ecu175,000,000',
     'ecu17m',
-    'ecu1=30',
-    'ecu1=nkr7.9940',
-    'ecu1=us&dollar;1.13436',
-    'ecu1=us&dollar;1.17476',
-    'ecu1=us&dollar;1.19255',
-    'ecu1=us&dollar;1.20796',
-    'ecu1=us&dollar;1.24065',
-    'ecu1=us&dollar;1.26848',
-    'ecu1=us&dollar;1.35507',
-    'ecu1=us&dollar;1.39013',
-    'ecu1=us&dollar;1.41',
-    'ecu2,100',
-    'ecu2,750',
-    'ecu2,800',
-    'ecu2.4-billion',
     'ecu2.5m',
-    'ecu2.9',
-    'ecu20,600',
-    'ecu200',
-    'ecu200,000',
-    'ecu203,000,000',
-    'ecu21.7',
-    'ecu22,000',
-    'ecu220,000,000',
-    'ecu23,900',
-    'ecu25',
-    'ecu250',
-    'ecu250,000',
-    'ecu28.5',
-    'ecu282,000,000',
-    'ecu3.5',
     'ecu3.5m',
-    'ecu300,000',
-    'ecu32,150',
-    'ecu33.64',
-    'ecu34,000,000',
-    'ecu35,000',
-    'ecu35,000,000',
-    'ecu35,350',
-    'ecu355',
-    'ecu4,100',
-    'ecu4,405',
-    'ecu400,000,000',
-    'ecu425',
-    'ecu48,000,000',
-    'ecu5',
-    'ecu5,000',
     'ecu5,000,000',
-    'ecu5.3',
-    'ecu50,000',
-    'ecu52,000,000',
-    'ecu540',
-    'ecu57,600',
-    'ecu5m',
-    'ecu6',
-    'ecu6,000',
-    'ecu6.6',
-    'ecu600,000,000',
-    'ecu62',
-    'ecu621,000,000',
-    'ecu65,200',
-    'ecu66,000',
-    'ecu66,600',
     'ecu66.6',
-    'ecu67,300',
-    'ecu70,000,000',
-    'ecu70.5',
-    'ecu713',
-    'ecu785',
-    'ecu8,000',
-    'ecu8,200',
-    'ecu8.9',
-    'ecu80',
-    'ecu83,300',
-    'ecu87.5',
-    'ecu870,000,000',
-    'ecu88,000',
-    'ecu880',
-    'ecu8bn',
     'ecu90,000,000',
-    'ecu900',
-    'ecu900,000,000',
-    'ecu95',
-    'ecu9m',
-    'ecuadoreans',
-    'ecuatorial',
-    'ecudaorian',
-    'ecuelle',
-    'ecume',
-    'ecumenics',
-    'ecumenists',
-    'ecunemical',
-    'ecurious',
-    'ecuyer',
-    'ecv',
     'ecz',
-    'eczacibasi',
-    'eczema-related',
-    'ed(s)',
-    'ed+',
-    'ed-dahab',
-    'ed-filling',
-    'ed-monds',
-    'ed-xrf',
-    'ed.13',
-    'ed.2',
-    'ed.a',
-    'ed.renate',
-    'ed/d',
-    'ed/de',
-    'ed1/k2',
     'ed14',
-    'ed2/k31',
-    'ed3',
-    'ed3/k21',
-    'ed4/k2',
-    'ed40',
-    'ed5/k31',
-    'ed51',
-    'ed6/k21',
-    'ed64',
-    'ed68',
-    'ed7/k2',
-    'ed70',
-    'ed74',
-    'ed920',
-    'ed=oucsacknowledgement',
     'eda-oriented',
-    'eda-pierre',
-    'edaan',
-    'edacious',
-    'edain',
-    'edaphosaurus',
-    'edas',
-    'edata',
-    'edawick',
-    'edax',
-    'edbas',
-    'edberg-mcenroe',
-    'edbergs',
-    'edburton',
-    'edcaad',
-    'edcf',
     'edcs',
-    'edd&eacute',
-    'eddels',
-    'edden/family',
-    'eddication',
-    'eddie\'',
-    'eddie(6)',
-    'eddin',
-    'eddine',
-    'eddington-finkelstein',
-    'eddington-limited',
-    'eddisbury',
-    'eddisbury.',
-    'eddoll',
-    'eddolls',
-    'eddon',
     'eddowe',
-    'eddrizzi',
-    'eddy-current',
-    'eddy-like',
-    'eddy-shaped',
-    'eddyline',
-    'eded',
-    'edeiman',
-    'edela',
-    'edelberto',
-    'edelbrande',
-    'edelin',
-    'edelmans',
-    'edelmiro',
-    'edelnand',
-    'edelsborough/buckinghamshire',
     'edelstahlwerke',
-    'edelweisspiraten',
-    'edenborough',
-    'edenglass',
-    'edenidery',
-    'edennote',
-    'edentulous',
-    'eder-victoria',
-    'ederer',
-    'ederesi',
-    'ederney',
-    'edery',
-    'edf.',
-    'edfax-based',
-    'edfu&ndash;esna&ndash;luxor',
-    'edgar/protest',
     'edgbaston.',
-    'edgcombe',
-    'edgcumbe',
-    'edge-enhanced',
-    'edge-enhancement',
-    'edge-jointed',
-    'edge-of-the-envelope',
-    'edge-to-edge',
-    'edge-to-face',
-    'edge-tone',
-    'edge-track',
-    'edge-triggered',
-    'edge-working',
-    'edge.in',
-    'edge.tensioned',
-    'edge.when',
     'edge/',
-    'edge/economist',
-    'edgealt',
-    'edgebaston',
-    'edgeborough',
-    'edged-woodworking',
-    'edgewood',
-    'edgeworth-bowley',
-    'edgeworthstown',
-    'edgington/centre',
-    'edgiva',
-    'edgren',
-    'edgworth',
-    'ediacaran-type',
-    'edible-fruited',
-    'edible-leaved',
     'edicated',
-    'edicayshn',
-    'edici&oacute;n',
-    'edictum',
-    'edie-hullo',
-    'edifications',
-    'edifyingly',
-    'edilizie',
-    'edin-borow',
-    'edina/bosnian',
-    'edinboro',
-    'edinboro\'',
-    'edinbrugh',
-    'edinbugh',
-    'edinburg',
-    'edinburg-based',
     'edinburgh&mdash;but',
-    'edinburgh&mdash;was',
-    'edinburgh-aberdeen',
-    'edinburgh-dunbar',
-    'edinburgh-king',
-    'edinburgh-newcastle',
-    'edinburgh-paris',
-    'edinburgh-qualified',
-    'edinburgh-rome-london',
-    'edinburgh-wick-kirkwall',
-    'edinburgh.21',
-    'edinburgh/',
-    'edinburgh/aberdeen',
-    'edinburgh/heriot-watt',
-    'edinburgh/kilmarnock',
-    'edinburgh/local',
     'edinburgh/london',
-    'edinburgh/midlothian',
-    'edinburgh/north',
-    'edinburgh/scottish',
-    'edinburghians',
-    'edinburghs',
-    'edinfo',
-    'edingburgh',
-    'edinger',
-    'edippo',
-    'edison-swan',
-    'edison-type',
-    'ediswan',
-    'edit-in-camera',
-    'edit-out',
-    'edit/compile/debug',
     'editeur',
-    'edithatcher',
-    'edithmead',
-    'editing-down',
-    'editing-on-screen',
-    'editing-transfer',
-    'editings',
-    'edition(s)',
-    'edition-impression-issue',
-    'editioners',
-    'editioning',
-    'edito',
-    'editor(s)',
-    'editor-',
-    'editor-less',
-    'editor-reviser',
     'editor/news',
-    'editor/printer',
-    'editor:composers',
-    'editorialised',
-    'editorialists',
-    'editorialization',
-    'editorialized',
-    'editorincluding',
-    'editorship.',
-    'editr',
-    'edivio',
-    'ediworks',
-    'edizioni',
-    'edjupci',
-    'edl',
-    'edlan',
     'edle',
-    'edlehoff',
-    'edlesboro',
-    'edlestein',
-    'edlestone',
-    'edleweiss',
-    'edley/transport',
-    'edline',
-    'edlington/trading',
-    'edllb',
-    'edlm',
-    'edlow',
-    'edlund/eeg',
-    'edm&eacute;-pierre',
-    'edmarsh',
-    'edme',
     'edmeston',
-    'edminston',
-    'edmondsley',
-    'edmondstown',
-    'edmonion',
-    'edmonsley',
-    'edmonson',
-    'edmonston-zagreb',
-    'edmont',
-    'edmontosaurus',
-    'edms',
-    'edmundbyers',
-    'edmundi',
-    'edmunds-based',
-    'edmunds.',
-    'edmundsen',
     'edmunston',
-    'edmunt',
-    'edna-like',
-    'ednaisation',
-    'ednam',
-    'ednan',
-    'ednbro',
-    'edne',
-    'edney/transport',
-    'edoard',
-    'edoga',
-    'edoni',
-    'edora',
-    'edouard-i',
-    'edr',
-    'edric',
     'edrichs',
-    'edrophonium',
-    'edrych',
-    'eds-200',
-    'eds-bedaux',
-    'edsells',
-    'edsiv',
-    'edstone',
-    'edsul',
-    'edsvs',
-    'edta-1%',
-    'edta.4',
-    'edta/sds',
-    'edtn',
-    'edtra',
-    'eduadro',
     'eduardas',
-    'educa&rehy;tion',
-    'educacion',
-    'educadores',
-    'educated\'',
-    'educatees',
-    'educatic',
-    'education*',
-    'education-business',
-    'education-of-the-whole-man',
-    'education-orientated',
-    'education-thirsty',
-    'education-training-employment',
-    'education-wise',
-    'education.',
-    'education.1984&ndash;1986',
     'education.2',
-    'education/',
-    'education/basic',
-    'education/business',
-    'education/full-time',
-    'education/lessen',
-    'education/production',
-    'education/rites',
-    'education/social',
-    'education/understanding',
-    'education/vocatinoal',
-    'education/vocational',
-    'education/world',
-    'education/yet',
-    'education_with',
-    'educational-grant',
     'educational-or',
-    'educational/computer',
-    'educational/economic',
-    'educational/fun',
-    'educational/home',
-    'educational/social',
-    'educational/training/youth',
-    'educationalfunctions',
-    'educationally-damaging',
-    'educationally-subnormal',
-    'educationally-underprivileged',
-    'educationals',
-    'educativa',
-    'educatonal',
-    'educator-into-business',
-    'educators/promoters',
     'educommunication',
-    'edulie&ndash;juniperus',
-    'edumundo',
-    'edunet',
-    'edusei',
-    'edutainers',
-    'edv',
-    'edv-anwendungen',
-    'edv-systeme',
-    'edvac',
-    'edventure',
-    'edwa',
-    'edwalton',
-    'edward/johnny',
-    'edwardi',
-    'edwardian-ball',
     'edwardmgraham',
-    'edwardo',
-    'edwards-knighton',
-    'edwards/consultant',
-    'edwards/dubrovnik',
-    'edwards/kington',
-    'edwards/mother',
-    'edwards/parent',
-    'edwards/pitt-rivers',
-    'edwards/scotland',
-    'edwards/tenant',
-    'edwards/the',
-    'edwards/trainer',
-    'edwards/tuc',
-    'edwards/veteran',
-    'edwards/war',
     'edwards/widower',
-    'edwardus',
-    'edweard',
-    'edwell',
-    'edwick/children',
-    'edword',
-    'edwyna',
-    'edyone',
-    'edyth',
-    'edythe',
-    'edzell',
-    'edzoa',
-    'ee2',
-    'ee210',
-    'ee3',
-    'ee4',
     'ee791',
-    'ee792',
-    'ee798',
-    'ee799',
-    'ee_',
-    'eeaahoo',
-    'eeac',
-    'eeb-related',
-    'eec&mdash;established',
-    'eec-approved',
-    'eec-backed',
-    'eec-country',
-    'eec-derived',
-    'eec-established',
-    'eec-v',
-    'eeckhout',
     'eecmos',
-    'eectrostatic',
-    'eedjit',
-    'eedle',
-    'eeducation',
-    'eee-by-god-i\'ve-got-a-stomach-ache',
-    'eeeee',
-    'eeeeeeaaahh',
-    'eeeeeeaaarrh',
-    'eeeeeeaaarrrggghhh',
-    'eeeeeeeaaaaaaaw',
-    'eeeeeeeh',
-    'eeeeek',
-    'eeeeh',
-    'eeeerrrr',
-    'eeek',
     'eeelam',
-    'eeeling',
-    'eeeowww',
-    'eeer',
-    'eees',
-    'eeether',
-    'eeg/',
-    'eehh',
-    'eejut',
-    'eekoff',
-    'eeky',
-    'eel-and-pie',
-    'eel-backed',
-    'eel-fishing',
-    'eel-handler',
-    'eel-pout',
     'eel-pouts',
-    'eel-proof',
-    'eel-worms',
-    'eelco',
-    'eeldrop',
-    'eelectively',
-    'eeles',
-    'eell',
-    'eelstripe',
-    'eem',
-    'eemland',
-    'eency',
-    'eende',
-    'eenglish',
-    'eeo',
-    'eep',
     'eependent',
-    'eepromming',
-    'eeproms',
-    'eerieness',
-    'eeris',
-    'eerrmmm',
-    'eersel',
-    'eerst',
-    'eesh',
-    'eeshal',
-    'eetgerink',
-    'eether',
-    'eeting',
-    'eetooklook',
-    'eeurgh',
-    'eeurk',
     'eeuworts',
-    'eeyaahh',
-    'eezit',
-    'ef-1',
-    'ef-1&agr&middot;gdp',
-    'ef-1&bgr&bgr\'&ggr',
-    'ef-1&dgr',
-    'ef-111s',
-    'ef-400sc',
-    'ef-forts',
-    'ef-hand',
-    'ef-one-eleven',
-    'ef1&ggr',
-    'ef1-11a',
-    'ef111',
-    'ef2',
     'ef2(g).',
-    'efailwen',
-    'efamolia',
-    'efanol',
-    'efato',
-    'efb',
-    'efcharistoume',
-    'efdss',
-    'efect',
-    'efendy',
-    'efes',
-    'eff&ndash;ct',
-    'effable',
-    'effeciency',
-    'effecient',
-    'effect\'&rehy;locally',
     'effect-a',
-    'effect-and-cause',
-    'effect-but',
-    'effect-gave',
-    'effect-heavy',
-    'effect-now',
-    'effect-size',
-    'effect-they',
-    'effect.we',
-    'effected.',
-    'effecteg',
-    'effective\'',
-    'effective.the',
-    'effective/costly',
-    'effectively-controlled',
-    'effectiveness-centred',
     'effectiveness/improvement',
-    'effectivey',
-    'effectivness',
-    'effects-formed',
-    'effects-hidden',
-    'effects-hungry',
-    'effects-stunned',
-    'effects-the',
-    'effects-worthiness',
-    'effects/mixer',
-    'effects/music',
-    'effectuality',
-    'effectuall',
-    'effectuallie',
-    'effectuates',
-    'effectuating',
     'effectum',
-    'effectuve',
-    'effeminate-looking',
-    'effemininity',
-    'effeminized',
-    'effendowicz',
-    'efferick',
-    'effervescence\'',
-    'effetely',
-    'effeteness',
-    'efff',
-    'effi',
-    'efficacies',
-    'efficaciousness',
-    'efficacity',
-    'efficency',
     'efficent',
-    'efficicency',
-    'efficiency-',
-    'efficiency-boosting',
-    'efficiency-directed',
-    'efficiency-effectiveness',
-    'efficiency-inducing',
-    'efficiency-maximizer',
-    'efficiency-promoting',
-    'efficiency-reducing',
-    'efficiency-stimulating',
-    'efficiency/safety',
-    'efficient-sounding',
-    'efficiently-built',
-    'efficiently/i',
-    'effictio',
     'effiency',
-    'effin',
-    'effiong',
-    'efflorescent',
-    'efflu',
-    'effluenct',
-    'effluencts',
-    'effluent-treatment',
-    'efflusions',
-    'effluvial',
-    'effnick',
-    'effore',
-    'effort-',
-    'effort-driven',
-    'effort-either',
-    'effort-energy',
     'effort-free',
-    'effort-related',
-    'effort-reward',
-    'effort.5',
-    'effort.richard',
-    'effort/cost-benefit',
-    'effortism',
-    'effortitism',
-    'effortlessness',
-    'efforts&mdash;or',
-    'efforts/successes',
-    'effraction',
-    'effrayer',
-    'effrondrement',
-    'effuse',
-    'effusum',
     'efg',
-    'efgh',
-    'efh',
-    'efibanca',
-    'efim',
-    'efima',
-    'efimovich',
-    'efisio',
-    'efl-related',
-    'efme',
-    'efmtr',
-    'efna',
-    'efp',
-    'efpn',
-    'efps',
-    'efrain',
     'efren',
-    'efron',
-    'efsathiou',
-    'efss',
-    'eft',
-    'efta-czechoslovakia',
-    'efta-hungary',
-    'efta-israel',
-    'efta-turkey',
-    'efta-yugoslavia',
-    'eftect',
-    'efternoon',
-    'efts',
-    'eftss',
-    'efx',
-    'eg&iacute;dio',
     'eg/f/',
-    'eg/r/',
-    'eg/s/',
-    'ega-compatible',
-    'ega.sys',
-    'ega/vga',
-    'egalitaranism',
-    'egalitarian-feminist',
-    'egami',
-    'egans',
-    'egar',
-    'egarch',
-    'egas',
-    'egawa',
-    'egberink',
-    'egberth',
     'egberts',
-    'egbo-obong',
-    'egbulefu',
-    'egd',
-    'egdell',
-    'ege',
-    'egedee',
-    'egerman',
-    'egertoni',
-    'egertons',
-    'egertro',
-    'egertroic',
-    'egest',
-    'egeth',
-    'egf-antibody',
-    'egf-positively',
     'egfrid',
-    'egg&rehy;shell',
-    'egg\'n\'cress',
-    'egg-&amp;-spn',
-    'egg-and',
-    'egg-and&rehy;cress',
-    'egg-and-bacon',
-    'egg-and-breadcrumbed',
-    'egg-and-chick-minding',
-    'egg-and-cream',
-    'egg-and-cress',
-    'egg-based',
-    'egg-basket',
-    'egg-boxes',
-    'egg-building',
-    'egg-carrying',
     'egg-case',
-    'egg-cell',
-    'egg-cells',
-    'egg-centred',
-    'egg-collectors',
-    'egg-crate',
-    'egg-cum-helicopter',
-    'egg-cupful',
-    'egg-detection',
-    'egg-dish',
-    'egg-dumping',
-    'egg-eaters',
-    'egg-faced',
-    'egg-factory',
-    'egg-filled',
-    'egg-formation',
     'egg-head',
-    'egg-heads',
-    'egg-inviolate',
-    'egg-larva-pupa-adult',
-    'egg-layer',
-    'egg-layers',
-    'egg-less',
-    'egg-marketeers',
-    'egg-mimicry',
-    'egg-modeller',
-    'egg-opener',
-    'egg-opening',
-    'egg-packing',
-    'egg-pale',
-    'egg-producing',
-    'egg-rejection',
     'egg-seller',
-    'egg-shape',
-    'egg-shapes',
-    'egg-sitters',
-    'egg-size',
-    'egg-smeared',
-    'egg-spert',
-    'egg-splattered',
-    'egg-spoon',
-    'egg-stravaganza',
-    'egg-thickened',
-    'egg-throwers',
-    'egg-timer',
-    'egg-timers',
-    'egg-type',
-    'egg-ups',
     'egg-whisk',
-    'egg-yellow',
-    'egg-zero',
-    'egg/',
-    'egg/225g',
-    'egg/450g',
-    'egg/bacon',
-    'egg/cream',
-    'egg/fry',
-    'egg/water',
-    'eggagerate',
-    'eggan',
-    'eggbasket',
-    'eggburger',
-    'eggcases',
-    'eggcellent',
     'eggcept',
-    'eggceptable',
-    'eggception',
-    'eggcilerating',
-    'eggciting',
-    'eggcupful',
-    'eggcupfuls',
-    'eggers',
-    'eggihard',
-    'eggijir',
-    'eggily',
-    'eggings-on',
-    'eggingtons',
-    'eggish',
-    'eggler',
-    'egglessness',
     'eggleswyke',
-    'egglishaw',
-    'eggo',
-    'eggs-and-bacon',
-    'eggs-as-they-came',
-    'eggs-over-easy',
-    'eggs-traordinary',
-    'eggs/chicken/',
-    'eggs/hens',
-    'eggs/sperm',
-    'eggsact',
-    'eggshape',
-    'eggsplene',
-    'eggspoonful',
-    'eggspress',
-    'eggspressive',
     'eggstatic',
-    'eggstraordinarily',
-    'eggstraordinary',
-    'eggstremely',
-    'eggum',
-    'eggwhite-smooth',
-    'eggwina',
-    'egi',
-    'egic',
-    'egilo',
-    'egin',
-    'egit',
-    'egland',
-    'egler',
-    'egles',
-    'eglese',
     'egley',
-    'egli',
-    'eglintons',
-    'eglisay',
-    'eglizeaud',
-    'eglon',
-    'egloshayle',
-    'eglwys',
-    'eglwysbach',
-    'eglwysilian',
-    'eglwyswrw',
-    'egmore',
-    'egms',
-    'egner',
-    'ego-bass',
-    'ego-boost',
     'ego-boundaries',
-    'ego-building',
-    'ego-centrically',
-    'ego-competence',
-    'ego-defence',
-    'ego-defensive',
-    'ego-degradation',
-    'ego-diffusion',
-    'ego-driven',
-    'ego-enhancement',
-    'ego-free',
-    'ego-fulfilment',
-    'ego-function',
-    'ego-infested',
-    'ego-involvement',
-    'ego-less',
     'ego-life',
-    'ego-mancs',
-    'ego-pampering',
-    'ego-plated',
-    'ego-reward',
-    'ego-satisfaction',
-    'ego-supportive',
-    'ego-tossery',
-    'ego-tripping',
-    'ego/self',
-    'egocentric/ethnocentric',
-    'egocentrically',
-    'egocentricism',
-    'egoic',
-    'egoisms',
-    'egoistical',
     'egoistically',
-    'egology',
-    'egomaniacal',
-    'egomaniacs',
-    'egophony',
-    'egoresuscitation',
-    'egorov',
-    'egothon',
-    'egotism-&agrave;-deux',
-    'egotissimo',
-    'egotistical/individualistic',
-    'egoyan',
-    'egpc',
-    'egpgc&mdash;guerrilla',
-    'egr',
-    'egresses',
     'egretta',
-    'egshel',
-    'egton-cum-newland',
-    'egusa',
-    'egwuchukwu',
-    'egypt-based',
-    'egyptian&mdash;czech',
-    'egyptian-backed',
-    'egyptian-registered',
-    'egyptian-soviet',
-    'egyptian-speaking',
-    'egyptian-sudanese',
-    'egyptian-syrian',
-    'egyptian-trained',
-    'egypto-italian',
-    'egyspt',
     'egyutteles',
-    'egziabher',
-    'eh&ndash;101',
-    'eh-up',
-    'eh.101',
-    'eh101',
-    'eh19',
-    'eh26',
-    'eh28',
-    'eh4',
-    'eh48',
-    'eh907',
-    'ehaling',
-    'ehaviour',
-    'ehb',
-    'ehco-klm',
     'ehdc',
-    'ehem',
-    'eheu',
-    'ehfi-substrat',
-    'ehicon',
-    'ehie',
-    'ehilst',
-    'ehipa',
-    'ehl',
-    'ehler&rehy;mann',
-    'ehler-danlos',
-    'ehlers-danlos',
-    'ehlvest',
-    'ehmcke',
-    'ehnbohm',
-    'ehninger',
     'ehp',
-    'ehren',
-    'ehrenbreitstein',
-    'ehrenfeldg&uuml;rtel',
-    'ehrenfels',
-    'ehrenfest',
-    'ehrenzweig',
-    'ehrfurcht',
-    'ehrhardt',
-    'ehrhart',
-    'ehrlichia',
-    'ehrmann',
-    'ehrwald',
-    'ehryngum',
-    'eht',
-    'ei&mdash',
     'ei&ndash;abu',
-    'ei-',
-    'ei/r',
-    'ei5dj',
-    'eibar',
-    'eibeschutz',
-    'eibis',
-    'eibli',
-    'eibon',
-    'eicg',
-    'eichelbergher',
-    'eichenauer',
-    'eichhausen',
-    'eichhormia',
-    'eichner',
-    'eichstatt',
     'eichstedt',
-    'eickhoff',
-    'eiconsanoid',
-    'eicosapentaenoate',
-    'eicosapentanoic',
-    'eid-al-fitr',
-    'eid-e-milad-un-nabi',
-    'eid-eid',
-    'eiddwen',
-    'eider-like',
-    'eider.',
-    'eiderdowned',
-    'eiders.',
-    'eidetically-removed',
-    'eidetiked',
-    'eidolon',
     'eidur',
-    'eiduson',
-    'eieieio',
-    'eier',
-    'eies',
-    'eiff',
-    'eifionnydd',
-    'eigelstein',
-    'eigeman',
-    'eigen-values',
-    'eigenschaften',
-    'eigentlich',
-    'eigenvalues.',
-    'eigerman',
-    'eighl&iacute;n',
-    'eight&ndash;coach',
     'eight&rehy;and',
-    'eight&rehy;neuron',
-    'eight&rehy;piece',
-    'eight-and-a-half-months',
-    'eight-arm',
-    'eight-aside',
-    'eight-band',
-    'eight-barrel',
-    'eight-beat',
-    'eight-bedded',
-    'eight-bedroom',
-    'eight-bell',
-    'eight-burner',
-    'eight-by-five',
-    'eight-by-tens',
-    'eight-celled',
     'eight-channel',
-    'eight-coloured',
-    'eight-count',
-    'eight-county',
-    'eight-course',
-    'eight-cubic-foot',
-    'eight-cutting',
-    'eight-eight',
-    'eight-engined',
-    'eight-faceted',
-    'eight-feeder',
-    'eight-feet-deep',
-    'eight-fingered',
-    'eight-forty-five',
-    'eight-furrow',
-    'eight-generation',
     'eight-gigacube',
-    'eight-girl',
-    'eight-goal',
-    'eight-gun',
-    'eight-headed',
-    'eight-horse',
-    'eight-hundred-mile',
-    'eight-in-one-tool',
-    'eight-inch-diameter',
-    'eight-inch-long',
-    'eight-inches',
-    'eight-ish',
-    'eight-knot',
-    'eight-lap',
-    'eight-letter',
-    'eight-light',
     'eight-metre',
-    'eight-mile-long',
-    'eight-millimetre',
-    'eight-month-',
-    'eight-month-long',
-    'eight-month-olds',
-    'eight-months',
-    'eight-months-old',
-    'eight-nation',
-    'eight-night',
-    'eight-officer',
-    'eight-one',
-    'eight-order',
-    'eight-over-par',
-    'eight-pager',
-    'eight-pan',
     'eight-panel',
-    'eight-partner',
-    'eight-peaks',
-    'eight-people',
-    'eight-phase',
-    'eight-pint',
-    'eight-plane',
-    'eight-pointed-compass',
-    'eight-points',
-    'eight-pounders',
-    'eight-quid-a-bottle',
-    'eight-rider',
-    'eight-rink',
-    'eight-rounds',
-    'eight-row',
-    'eight-session',
     'eight-slot',
-    'eight-slotted',
-    'eight-span',
-    'eight-square-kilometre',
-    'eight-square-mile',
-    'eight-stone',
-    'eight-strand',
-    'eight-stroke',
-    'eight-ten',
-    'eight-tenths',
-    'eight-term',
-    'eight-test',
-    'eight-three',
-    'eight-time',
-    'eight-time-a-year',
-    'eight-times-married',
     'eight-to-eight',
-    'eight-to-four',
-    'eight-ton',
-    'eight-tonne',
-    'eight-under',
-    'eight-under-par',
-    'eight-vehicle',
-    'eight-way-scrolling',
-    'eight-week-long',
-    'eight-wheel',
-    'eight-wickets',
-    'eight-wing',
-    'eight-wire',
-    'eight-yard-high',
-    'eight-year&rehy;olds',
-    'eight-year-ban',
     'eight-year-campaign',
-    'eight-year-daughter',
-    'eight-years',
-    'eight-years&rehy;long',
-    'eight-years-old',
-    'eight.bit',
-    'eight.the',
-    'eight/three',
-    'eighte',
-    'eightee',
-    'eighteen-and-a-half-year-old',
-    'eighteen-century',
-    'eighteen-day',
-    'eighteen-forty',
-    'eighteen-inch-high',
-    'eighteen-lot',
     'eighteen-metre-high',
-    'eighteen-mile',
-    'eighteen-months',
-    'eighteen-ninety',
-    'eighteen-person',
-    'eighteen-plus',
-    'eighteen-round',
-    'eighteen-seventies',
-    'eighteen-thirties',
-    'eighteen-thirty',
-    'eighteen-thousand-foot',
-    'eighteen-to',
-    'eighteen-twenties',
-    'eighteen/nineteen',
-    'eighteenish',
-    'eighteens',
     'eighteenth-centuries',
-    'eighteenth-nineteenth',
-    'eighteenth-nineteenth-and',
-    'eighteenth-to',
-    'eighteenthcentury',
-    'eighteenyear-old',
-    'eighteerth',
-    'eighter',
-    'eighth-finals',
-    'eighth-magnitude',
-    'eighth-ninth',
-    'eighth-notes',
-    'eighth-of-a-page',
-    'eighth-of-an-inch',
-    'eighth-tone',
-    'eighthly',
     'eighties-bashing',
-    'eightmonth-old',
-    'eightpanther',
-    'eightsome-reeling',
-    'eightteen',
-    'eighty&rehy;two',
-    'eighty-acre',
-    'eighty-column',
-    'eighty-day',
-    'eighty-fifth',
-    'eighty-footer',
-    'eighty-four-year',
-    'eighty-four-year-old',
-    'eighty-line',
-    'eighty-mile',
-    'eighty-minute',
     'eighty-oddyear-old',
-    'eighty-pound',
-    'eighty-second',
-    'eighty-six&rehy;room',
-    'eighty-something',
-    'eighty-tonner',
-    'eighty-twenty',
-    'eighty-two-year-old',
-    'eighty-week',
-    'eighty_per',
-    'eigiau',
-    'eigits',
-    'eigler',
-    'eignnnngh',
-    'eigth',
-    'eigthies',
     'eiiot',
-    'eiir',
-    'eijken',
-    'eijsden',
-    'eika',
-    'eikichi',
-    'eikoh',
-    'eikonoklastes',
-    'eiland',
-    'eilberg',
-    'eild',
-    'eildons',
-    'eile',
-    'eileanach',
-    'eileen-atkins',
-    'eileen-rose',
     'eileithyia',
-    'eilenberg',
-    'eilenroc',
-    'eilers',
-    'eilert',
-    'eili&sacute',
-    'eillen',
-    'eillot',
-    'eimantas',
-    'eimas',
-    'eimi',
-    'eimontova',
-    'eimskip',
-    'ein&ocirc;llen',
-    'ein\'',
-    'einars',
     'einarsson',
-    'einaudi',
-    'eindhoven-based',
-    'eindhoven/rijswijk',
-    'einen',
-    'einerseits',
-    'einf&uuml;hrung',
-    'einfache',
-    'einfalt',
-    'einfluss',
-    'einfuhr',
-    'eingang',
-    'eingeborenen',
-    'einhorn',
-    'einon/tenancy',
-    'eins',
     'einsatz',
-    'einschlummer',
-    'einsiedel',
-    'einstein\'',
-    'einstein-maxwell',
-    'einsteins',
-    'einstellungen',
-    'einstuerzende',
-    'eionion',
-    'eirenic',
-    'eirenical',
-    'eirian',
-    'eirig',
-    'eirinn',
-    'eirlys',
-    'eis-ula',
     'eisa-bus',
-    'eisa-ethernet',
-    'eisa-like',
-    'eisai',
-    'eisdorfer',
-    'eiseman',
-    'eisen',
-    'eisenbad',
-    'eisenbahnstrasse',
-    'eisendrath',
-    'eisenger',
-    'eisenh&uuml;ttenstadt',
-    'eisenhower-dulles-strategic-bomber',
-    'eisenhowers',
-    'eisenloeffel',
-    'eisenmann',
     'eisensteins',
-    'eisher',
-    'eishes',
-    'eishort',
-    'eiskanal',
-    'eisma',
-    'eismarks',
-    'eisogesis',
-    'eisogetic',
-    'eisphora',
-    'eisteddfodic',
-    'eitelhans',
-    'either&mdash;a',
-    'either&ndash',
-    'either&ndash;or',
-    'either(i)solve',
     'either-',
-    'either.',
-    'either.telex',
-    'either.who',
-    'either/ors',
-    'either:payment',
-    'eitherspigotted',
-    'eithy',
-    'eitzen',
-    'eiulantum',
-    'eivind',
-    'eivor',
-    'eiwa',
-    'eiwse',
-    'eizaburo',
-    'eizan',
     'eizenstat',
-    'eizo',
-    'ejaculators',
-    'ejaz-ul',
-    'ejazul',
-    'ejectees',
-    'ejective',
-    'ejectments',
-    'ejectors',
-    'ejercito',
-    'ejidos',
-    'ejlersen',
-    'ejner',
-    'ejs',
-    'ek&amacr;da&sacute;i',
-    'eka',
     'ekani',
-    'ekectroloid',
-    'ekei',
-    'ekelund',
-    'ekenge',
-    'ekenosen',
-    'ekg',
-    'ekhof-buhner',
-    'ekibastuz',
-    'ekiden',
-    'ekimov',
-    'ekin-o-door-oos',
-    'ekino-sperma',
-    'ekins',
-    'ekiriyankumbra',
-    'ekkodal',
     'eklbb',
-    'eklo',
-    'ekmeleddin',
-    'eknomska',
-    'ekologesch',
-    'ekondo',
-    'ekor',
-    'ekos',
-    'ekrund',
-    'eksath',
-    'ekstrand',
-    'ekua',
-    'ekuku',
-    'ekwebelam',
-    'ekwensi',
-    'ekwona',
     'ekworth',
-    'el&eacute;ctrico',
-    'el&eacute;mentaire',
-    'el&lsqb;93&rsqb;51',
-    'el&oacute;segui',
-    'el\'konin',
-    'el(91)5',
-    'el-',
-    'el-aai&uacute;n',
-    'el-ajnaf',
-    'el-ajnaf/mother',
-    'el-alamein',
-    'el-amam',
-    'el-aqse',
-    'el-araba',
-    'el-as',
     'el-ashmunein',
-    'el-azhar',
-    'el-bahr',
-    'el-banna',
-    'el-basir',
-    'el-bazaz',
-    'el-beik',
-    'el-beji',
-    'el-chaab',
-    'el-daim',
-    'el-fenari',
-    'el-fitr',
-    'el-galala',
-    'el-gaz',
-    'el-girba',
-    'el-grecoed',
     'el-hadi',
-    'el-hawa',
-    'el-hi',
-    'el-hinnawi',
-    'el-hoss',
-    'el-hussaini',
-    'el-jerid',
-    'el-karouri',
-    'el-kharga',
-    'el-khatib',
-    'el-korhadris',
-    'el-maraghi',
-    'el-menshawy',
-    'el-meshad',
-    'el-mili',
-    'el-munim',
     'el-nil',
-    'el-qarni',
-    'el-sarrag',
-    'el-shemali',
-    'el-star',
-    'el-swaify',
-    'el-yassa',
-    'el-yazghi',
-    'el-yousifi',
-    'el-zaiyat',
-    'el100',
-    'el1055',
-    'el1055/105',
-    'el1055/128',
-    'el1055/129',
-    'el1055/iii',
     'el2',
-    'el34',
-    'el84',
-    'elabarate',
-    'elabor',
-    'elaborately-carved',
-    'elaborately-designed',
-    'elaborately-folded',
-    'elaborately-structured',
-    'elaborately-tooled',
-    'elaboratory',
-    'eladeldi.',
-    'elaegnus',
-    'elaeis',
-    'elafi',
-    'elah',
     'elaine/edinburgh',
-    'elaine/guy',
-    'elal',
-    'elam-1',
-    'elan-hero-turned-de',
-    'elan-like',
-    'elancyl/she',
-    'elander',
-    'elands',
-    'elans',
-    'elantosh',
-    'elanus',
-    'elaphostrongylus',
-    'elasica',
-    'elasmobranchiomorphi',
-    'elasmobranchs',
     'elastan',
-    'elastaplast',
-    'elastic-waisted',
-    'elasticising',
-    'elastokinematic',
-    'elastoplast-pink',
-    'elatedly',
-    'elateia',
-    'elatine',
-    'elations',
-    'elatior',
-    'elaura',
-    'elazar',
-    'elazig',
-    'elban',
-    'elbe.',
     'elbian',
-    'elbin',
-    'elbistan',
-    'elbit',
-    'elbius',
-    'elborne',
-    'elbourne',
-    'elbow-crutches',
-    'elbow-deep',
-    'elbow-dodging',
-    'elbow-grease',
-    'elbow-joint',
-    'elbow-patched',
-    'elbow-rado',
-    'elbow-shuddering',
-    'elbrus-3',
     'elby',
-    'elcar',
-    'elcctcd',
-    'elce',
-    'elche',
-    'elchin',
-    'elco',
-    'elcoat',
-    'elcomb/paul',
-    'elcome',
-    'elconn',
-    'elctions',
-    'eld-er',
-    'eld/morrell',
-    'eld/morrells',
-    'eldagsen',
     'eldalie',
-    'elddis',
-    'elder-brother',
-    'elder-dominated',
-    'elder-statesman',
-    'eldercare',
-    'elderkin',
-    'elderlies',
-    'elderly-authoritative',
-    'elderly-care',
-    'elderly.king',
-    'elderly.we',
-    'elderly/disabled',
-    'elderly/sick',
-    'eldermen',
-    'elderwood',
     'eldery',
-    'eldest-born',
-    'eldest-daughter',
-    'elding',
-    'eldip',
-    'eldisogi',
-    'eldo-europa',
-    'eldonia',
-    'eldonwall',
-    'eldor',
-    'eldor-sad-o',
-    'eldorado.',
-    'eldra',
-    'eldred-evans',
-    'eldric',
-    'eldridge/driver',
     'eldridges',
-    'eldrige',
-    'eldritch-bright',
-    'eldritchites',
-    'eldyandiekkickm',
-    'elea&rehy;nor',
-    'eleal',
-    'elean:it',
-    'elean:lauretta',
-    'elean:which',
-    'elean:would',
-    'elean:you',
-    'elean:your',
-    'eleanora',
-    'eleatic',
-    'elecktrick',
     'elecorate',
-    'elect-number',
-    'elect-year',
-    'electant',
-    'elected.',
-    'electet',
-    'election&mdash;due',
-    'election\'',
-    'election--see',
-    'election-although',
-    'election-eve',
-    'election-law',
-    'election-manifesto',
-    'election-oriented',
-    'election-referendum',
-    'election-rigging',
     'election-timing',
-    'electionaire',
-    'electional',
-    'electioneering\'-type',
-    'electioneers',
-    'elections--a',
-    'elections-that',
-    'elections.they',
-    'elections.twelve',
-    'elections/1',
-    'electionsin',
-    'electonic',
-    'elector&rehy;ally',
-    'electoral/community',
-    'electoralism',
-    'electorate&mdash;that',
     'electorial',
-    'electors/union',
-    'electory',
-    'electrcial',
-    'electribal',
-    'electric-acoustic',
-    'electric-arc',
-    'electric-block',
-    'electric-drill',
-    'electric-engined',
-    'electric-field',
-    'electric-hauled',
-    'electric-heat',
-    'electric-lighting',
-    'electric-pink',
-    'electric-piping',
     'electric-power',
-    'electric-ring',
-    'electric-telegraph',
-    'electric/hydraulically',
-    'electric/petrol',
-    'electrical-conduit',
-    'electrical-goods',
-    'electrical/gas',
-    'electrical/mechanical/hydraulic',
-    'electrical751',
-    'electrically-changed',
-    'electrically-controlled',
-    'electrically-heated',
-    'electrically-impulsed',
-    'electrically-operating',
-    'electrically-raised',
     'electrically-related',
-    'electrically-shielded',
-    'electrically-warmed',
-    'electricalmanufacturing',
-    'electrician/swan',
-    'electricidad',
-    'electricite/',
-    'electricities',
-    'electricity**',
-    'electricity-based',
-    'electricity-board',
-    'electricity-from-biomass',
-    'electricity-generation',
-    'electricity-guzzling',
-    'electricity-intensive',
-    'electricity-propelled',
     'electricity-saving',
-    'electricity-supply',
-    'electricity/water',
-    'electricity810,000',
-    'electricityless',
-    'electricked',
-    'electricorp',
-    'electrics-wise',
-    'electricus',
-    'electricy',
-    'electrifying/of',
-    'electrifyingly',
-    'electro&ndash;diesel',
-    'electro-acoustic/active',
-    'electro-band',
-    'electro-bars',
     'electro-bass',
-    'electro-bleach',
-    'electro-cardiograph',
-    'electro-cardiographs',
-    'electro-cautery',
-    'electro-chemistry',
-    'electro-convulsion',
-    'electro-dialysis',
-    'electro-diesels',
-    'electro-duo',
-    'electro-dynamic',
-    'electro-encephalograph',
-    'electro-encephalographic',
-    'electro-encephalography',
-    'electro-fished',
-    'electro-funk',
     'electro-galvanic',
-    'electro-harmonix',
-    'electro-hydraulically',
-    'electro-immobilisation',
-    'electro-iron',
-    'electro-jolted',
-    'electro-luminescent',
-    'electro-magnetic-like',
-    'electro-magnetics',
-    'electro-man',
-    'electro-mechanically',
-    'electro-motive',
-    'electro-myographic',
-    'electro-oculographic',
-    'electro-palatgraphy',
-    'electro-photographic',
     'electro-plating',
-    'electro-pneumatically',
-    'electro-rheological',
-    'electro-rotation',
-    'electro-shock',
-    'electro-slag',
-    'electro-sticks',
-    'electro-tattoo',
-    'electro-techinal',
-    'electro-technical',
-    'electro-technology',
-    'electro-voice',
-    'electro-zinc',
-    'electro/acid',
-    'electroacoustics',
-    'electroblot',
     'electroblotter',
-    'electroblotting',
-    'electrobuses',
-    'electrocardiographc',
-    'electrocephalography',
-    'electrocharge',
-    'electrochemical-enzymic',
-    'electrochemistry.',
-    'electrochemists',
-    'electrocoagulated',
-    'electrocoat',
-    'electrocoating',
-    'electrocompositor',
-    'electrocortical',
-    'electrocuffs',
-    'electrocuting',
     'electrocycling-eignetmer',
-    'electrode-bearing',
-    'electrode-coating',
-    'electrode.',
-    'electroencelograph',
-    'electrofence',
-    'electrofibres',
-    'electrofish',
-    'electroflambeau',
-    'electroflambeaux',
-    'electroflare',
-    'electrofluid',
-    'electrofoils',
-    'electrofouling',
-    'electrofunk',
-    'electrofusion',
     'electrogastrogram',
-    'electrogenerative',
-    'electrografted',
-    'electrograms',
-    'electrographic',
-    'electroid',
-    'electrolocation',
-    'electrolube',
-    'electrolumens',
-    'electrolyse',
-    'electrolyser',
-    'electrolysis.',
-    'electrolyte-filled',
-    'electrolytes&rehy;acids',
-    'electrolytically',
-    'electrolytics',
     'electrolyzing',
-    'electromagic',
-    'electromagnetics',
-    'electromedical',
-    'electromicroscopy',
-    'electromyograph',
-    'electron-antineutrino',
-    'electron-antineutrinos',
-    'electron-bombarded',
-    'electron-capture',
-    'electron-density',
-    'electron-energy',
-    'electron-grabbing',
-    'electron-like',
-    'electron-lucency',
-    'electron-microscopic',
     'electron-neutrino',
-    'electron-nucleus',
-    'electron-phonon',
-    'electron-position',
-    'electron-radiation',
-    'electron-rich',
-    'electron-richness',
-    'electron-shell',
-    'electron-shells',
-    'electron-sized',
-    'electron-stained',
-    'electron-to-photon',
-    'electron-transparent',
-    'electron-type',
-    'electron-velocity',
-    'electron-volt',
     'electron.',
-    'electron/antielectron',
-    'electron/proton',
-    'electrone',
-    'electronegativities',
-    'electroneutrality',
-    'electronially',
-    'electronic-based',
-    'electronic-information',
-    'electronic-only',
-    'electronic-pressure',
-    'electronic-publishing',
-    'electronic-sounding',
-    'electronic-type',
-    'electronica',
-    'electronically-heated',
     'electronically-stored',
-    'electronickery',
-    'electronics-related',
-    'electronics-to-fruit',
-    'electronics719',
-    'electronics721',
-    'electronics794',
-    'electronique',
-    'electronmicroscope',
-    'electronmicroscopy',
-    'electropad',
-    'electrophonic',
-    'electrophoresis/electrofocussing',
-    'electrophorezed',
-    'electrophysiologic',
-    'electrophysiologists',
     'electropneumatic',
-    'electropolished',
-    'electropop',
-    'electroporating',
-    'electroporesed',
-    'electroreceptor',
-    'electroreceptors',
-    'electroretinograms',
-    'electros',
-    'electrostress',
-    'electrotherapeutic',
-    'electrotherapy',
-    'electrotypes',
-    'electrotyping',
-    'electrovac',
-    'electrovalence',
     'electrovalue',
-    'electroway',
-    'electroyte',
-    'electrs',
-    'electtoral',
-    'eled',
-    'eledone',
-    'elee.',
-    'elegance.',
-    'elegances',
-    'elegancies',
-    'elegancy',
-    'elegant-ish',
-    'elegant-looking',
-    'elegant-sounding',
-    'elegant/contemporary',
     'elegante',
-    'elegantly-moulded',
-    'elegantly-shaped',
-    'elegantly-suited',
-    'elegantly-tailored',
-    'elegantulus',
-    'elegible',
-    'eleigh',
-    'eleko',
-    'elektrizit&auml;t',
-    'elektrizitatswerke',
-    'elektroaila',
-    'elektromashexport',
-    'elektronik',
-    'elektronisches',
-    'elelemental',
     'elem',
-    'elema',
-    'element&mdash;his',
-    'element&mdash;the',
-    'element-self-expression',
-    'elementalist',
-    'elementars',
-    'elementary-school',
-    'elements-c',
-    'elements-engineering',
-    'elements/i',
-    'elements/sublevels',
-    'elements/themes',
-    'elemeta',
-    'elemis',
-    'elen',
     'elenica',
-    'elenium',
-    'elenkh&oacute;0',
-    'eleod',
-    'eleonex',
-    'eleonor',
-    'eleonorae',
-    'eleonore',
-    'elephant-catching',
-    'elephant-cord',
-    'elephant-ear',
-    'elephant-grass',
-    'elephant-horse',
-    'elephant-leg',
-    'elephant-lorry',
-    'elephant-man',
     'elephant-noses',
-    'elephant-of-the-sky',
-    'elephant-patterned',
-    'elephant-tamer',
-    'elephant-tooth',
-    'elephantes',
-    'elephantidae',
-    'elephantoid',
-    'elephantopus',
-    'elephants.',
-    'elephantsized',
-    'elera',
-    'elert',
-    'elesborough',
-    'elesewhere',
-    'eletha',
     'elettaria',
-    'elettromeccanica',
-    'eleusinians',
-    'eleutheria',
-    'eleutherius',
-    'eleutherocoque',
-    'eleuthia',
-    'elevationally',
-    'elevationary',
-    'eleven&rehy;ish',
-    'eleven\'s',
-    'eleven-a-side',
-    'eleven-beat',
-    'eleven-bit',
-    'eleven-down',
-    'eleven-font',
     'eleven-foot-high',
-    'eleven-forty',
-    'eleven-man',
-    'eleven-month-old',
-    'eleven-o\'clock-on-a-fine-night-an',
-    'eleven-place',
-    'eleven-screw',
-    'eleven-sided',
-    'eleven-thousand-foot',
-    'eleven-to',
-    'eleven-to-thirteen-year-olds',
-    'eleven-up',
-    'eleven-volume',
-    'eleven-year-old-son',
-    'eleven-year-olds.',
-    'eleven/eleven-thirty',
     'eleven/twelve',
-    'elevenpence',
-    'elevenpence-halfpenny',
-    'elevenpoint',
-    'eleventh-biggest',
-    'elevons',
-    'eleys',
-    'elf-biter',
-    'elf-bow',
-    'elf-cc',
-    'elf-friend',
-    'elf-ghosts',
-    'elf-hero',
-    'elf-land',
-    'elf-maid',
-    'elf-maids',
     'elf-patterned',
-    'elf-queen',
-    'elf-rc',
-    'elf-realm',
-    'elf-uo',
-    'elf-woman',
-    'elfan',
-    'elfbane',
-    'elfe',
-    'elfel',
-    'elfennau',
-    'elfin-formed',
-    'elfins',
-    'elflocks',
-    'elgabrowny',
-    'elgaren',
     'elgie',
-    'elhanan',
-    'elhill',
-    'eli&scaron;ka',
-    'eli-lilly',
-    'eliabethanism',
-    'eliassi',
-    'eliat',
-    'eliator',
-    'elicidated',
-    'eliduc',
-    'elie-rudel',
-    'elieser',
-    'eliffit',
-    'eligibilities',
-    'eligio',
     'elijah-elisha',
-    'elijah-like',
-    'elika',
-    'eliki',
-    'elil-hrair-rah',
-    'elima',
-    'elimelechis',
-    'elimilech',
-    'eliminability',
-    'eliminate-',
-    'eliminate/render',
-    'elincs',
-    'elinor-',
-    'elinor-style',
-    'elio-car-is',
-    'eliot\'s',
     'eliot-etiquette',
-    'eliot-leavis',
-    'eliot-richards-leavis',
-    'eliot-style',
-    'eliotish',
-    'elipsis',
-    'elipsot',
-    'elis&eacute;e',
-    'elis-thomas',
-    'elisabet',
-    'elisah',
-    'elisas',
-    'elishas',
-    'eliska',
-    'elison',
-    'elissalde',
     'elissalde-olaizola',
-    'elista',
-    'elistererrarich',
-    'eliston',
-    'elitair',
-    'elite\'.',
-    'elite-educated',
-    'elite-v-mass',
-    'elite/eclat/esprit',
-    'eliteness',
-    'elites.',
-    'elithie',
-    'eliud',
-    'elival',
-    'elixon',
-    'eliz.1',
     'elizab',
-    'elizabe&rehy;than',
-    'elizabeta',
-    'elizabeth/glasgow',
-    'elizabeth/methil',
-    'elizabetha',
-    'elizabethe',
-    'elizabethian',
-    'elizas',
-    'elizer',
-    'elizondo',
-    'elk-hide',
-    'elkamel',
-    'elkasaite',
-    'elkenford',
-    'elkhound',
     'elkins-sinn',
-    'elkinton',
-    'elky',
-    'ellaby',
-    'ellados-exoteriko',
-    'ellagic',
-    'ellaline',
-    'ellamd',
-    'ellames',
-    'ellan',
-    'ellands',
-    'ellang',
-    'ellar',
-    'ellauria',
-    'ellaway/west',
-    'ellbee',
     'elle-m&ecirc;me',
-    'elle-men',
-    'elle-women',
-    'elleanor',
-    'elledge',
-    'ellefson',
-    'ellegy',
-    'elleke',
-    'ellel',
-    'elleman-jensen',
-    'ellenbank',
-    'ellenberg',
-    'ellenberger',
-    'ellenborgen',
-    'ellenbys',
-    'ellencourt',
     'ellend',
-    'elleniki',
-    'ellenmere',
-    'ellensohn',
-    'ellepo',
-    'eller',
-    'ellerbroek',
-    'elleridge',
-    'ellertsen',
-    'ellery/officer',
-    'ellerycorp',
-    'ellesemere',
-    'ellesfield',
-    'ellestadite',
-    'elli-markella',
-    'ellial',
     'ellic',
-    'ellie\'s',
-    'elliesmere',
-    'elliffee',
-    'ellingford',
-    'ellington/mills',
-    'ellington/strayhorn',
-    'ellingtonia',
-    'ellinor',
-    'elliot/chairman/carers',
-    'elliot/kidscape',
-    'elliott-harris',
-    'elliott-king',
-    'elliott/honda',
-    'elliott/museum',
-    'elliott/oxford',
     'elliott/race',
-    'ellipitcal',
-    'ellipse/de',
-    'elliptic-eccentric',
-    'elliptical-shaped',
-    'ellipticity',
-    'ellis-beto-estelle',
-    'ellis-jones',
-    'ellis.',
-    'ellis/conservative',
-    'ellis/crime',
-    'ellis/hoople',
-    'ellis/instrument',
-    'ellis/milkman',
-    'ellise',
-    'ellises',
     'ellisland',
-    'elliston/accident',
-    'elliston/aged',
-    'elliston/peter',
-    'ellistown',
-    'ellitt',
-    'ellix',
-    'ellmauer',
-    'ellold',
-    'ellora',
-    'ellory',
-    'ellouz',
-    'elloway',
-    'ellpots',
-    'ellridge',
-    'ellroyd',
     'ellsmore',
-    'ellum',
-    'ellwein',
-    'ellwells',
-    'ellworthy',
-    'ellyn',
-    'elm-carved',
-    'elm-chips',
-    'elm-shaded',
-    'elmali',
-    'elmas',
-    'elmensbury',
-    'elmenshawy',
-    'elment',
-    'elmes',
-    'elmesthorpe',
     'elmeston',
-    'elmina',
-    'elmir',
-    'elmly',
-    'elmos',
-    'elmsett',
-    'elmtree',
-    'elmyr',
-    'elocutionary',
-    'elocutionist',
-    'eloesser',
-    'elofanerror',
-    'elogar',
-    'elogia',
-    'elolhim',
-    'elolombe',
     'elombe',
-    'elomix',
-    'elon',
-    'elonex-ises',
-    'elongases',
-    'elongated-labial-sticker-on-guitar-strap',
-    'elongated.',
-    'elongatum',
-    'eloquently.',
-    'elosegui',
-    'elouise',
-    'elp-style',
-    'elped',
-    'elphgrave',
-    'elphgrave/stepfather',
-    'elphick/historian',
     'elphick/research',
-    'elphinston',
-    'elps',
-    'elr-coach',
-    'elrathia',
-    'elremco',
-    'elrick',
-    'elsaghier',
-    'elsasser',
-    'elsdale',
-    'elsdens',
-    'else&mdash;and',
-    'else&mdash;that',
-    'else-but',
-    'else-more',
-    'else-of',
     'else-where',
-    'else.',
-    'else_instead',
-    'else_on',
-    'elsebeth',
-    'elsenberg',
-    'elsenham',
-    'elsenstrasse',
-    'elseqhere',
-    'elsevier/pergamon',
-    'elsewhere-\'in',
-    'elsewhere-their',
-    'elsewheres',
-    'elshie',
-    'elsi',
-    'elsing',
     'elsing-spital',
-    'elsinge',
-    'elsnet',
-    'elso',
-    'elspa',
-    'elstar',
-    'elstobb',
-    'elston/daughter',
-    'elstronwick',
-    'elswehere',
-    'elswich',
-    'elsworthy',
-    'elsy',
-    'elsyng',
-    'elta',
-    'eltac',
     'eltex',
-    'elth&aacute;rin',
-    'elton-speak',
-    'elton/the',
-    'elts',
-    'elu96',
-    'eluants',
-    'elucidario',
-    'elucidationin',
-    'elucidations',
-    'elucidative',
-    'elutes',
-    'eluvial',
-    'elvaloy',
-    'elvas',
-    'elvedon',
     'elven-lord',
-    'elvenkind',
-    'elvey',
-    'elvi',
-    'elvidnir',
-    'elvis-as-hub-cap-thief',
-    'elvis-style',
-    'elvis-the-pelvis',
-    'elvish-marked',
-    'elvishness',
-    'elviss',
-    'elw&eacute',
-    'elwells',
-    'elwesii',
-    'elwing',
-    'elworthy',
     'elworty',
-    'elwyn-jones',
-    'elya',
-    'elymiots',
-    'elyna',
-    'elyon',
-    'elysass',
-    'elyse',
-    'elysemat',
-    'elysia',
-    'elysion',
-    'elzea',
-    'em&iacute;lio',
-    'em&rehy;bodied',
-    'em&rehy;braced',
-    'em-',
     'em-2mr',
-    'em-barrassment',
-    'em-er-sorry',
-    'em-power',
-    'em2',
-    'em2714br',
-    'em42',
-    'em7&flat;5',
-    'emable',
-    'emac',
-    'emaciate',
-    'emaciated-looking',
-    'emaciating',
-    'emaciation.',
-    'emailbag',
-    'emain',
     'emancipations',
-    'emanicipation',
-    'emanual',
-    'emanuel-style',
-    'emanuel/costume',
-    'emanuela',
-    'emanuella',
-    'emanuelle',
-    'emanuelli',
-    'emarginated',
-    'emasotsha',
-    'embaixador',
-    'embajadores',
-    'embakasi',
-    'emballage',
-    'embalm.',
     'embalmers.',
-    'embalming.',
-    'embalms',
-    'embank',
-    'embank&rehy;ment',
-    'embankmant',
-    'embarass',
-    'embarazada',
-    'embargo-breaking',
-    'embargo-busting',
-    'embargo.',
-    'embarkin\'',
-    'embarrased',
-    'embarrasment',
-    'embarrass&lsqb;es&rsqb',
-    'embarrassable',
     'embarrassed\'',
-    'embarrassedly.',
-    'embarrassin\'',
-    'embarrassing-if',
-    'embarrassing-sounding',
-    'embarrassing/boring/upsetting',
-    'embarresses',
-    'embase',
-    'embassador',
-    'embassy-level',
-    'embassyland',
-    'embattlement',
-    'embattles',
-    'embayed',
-    'embden',
-    'embden-meyerhof',
     'embedded/linked',
-    'embeddedment',
-    'embedding-like',
-    'embeded',
-    'embedgph',
-    'ember-eyed',
-    'ember-red',
-    'embera',
-    'embering',
-    'emberley',
-    'emberses',
-    'emberson',
-    'embeth',
-    'embez',
-    'embezzles',
-    'embitterment',
     'embitters',
-    'embl12',
-    'emblazed',
-    'emblazons',
-    'embledown',
-    'emblem-poem',
-    'emblema',
-    'emblematical',
-    'emblemed',
-    'emblemised',
-    'embodi&rehy;ment',
-    'embodied.',
-    'embold-clare',
-    'emboldening',
-    'embolisms',
-    'embosomed',
     'emboss',
-    'embotedo',
-    'embothrium',
-    'embouchures',
-    'embourg',
-    'embourgeoisee',
-    'embourgoisement',
-    'embowed',
-    'emboxment',
-    'embra',
-    'embracement',
-    'embracings',
-    'embranchments',
-    'embrasse-moi',
-    'embratel',
-    'embrey',
     'embrocatory',
-    'embroidered-yoke',
-    'embroideress',
-    'embroiderings',
-    'embroidery-edged',
-    'embroidery-frame',
-    'embroidery/stitch/textiles',
-    'embroiling',
-    'embrooks',
-    'embrowned',
-    'embry',
-    'embryo-government',
-    'embryo-logically',
-    'embryo.',
-    'embryogenesis.',
-    'embryologically',
     'embryologies',
-    'embryonically',
-    'embu',
-    'embuss',
-    'embyronic',
-    'emcom',
-    'emdad',
-    'emdale',
-    'eme',
-    'emek',
-    'emel\'ian',
-    'emelia',
-    'emelie',
-    'emena',
-    'emendatory',
-    'emending',
     'emerald-eyes',
-    'emeraudes',
-    'emerge/relevant',
-    'emergecy',
-    'emerged.',
-    'emerged.20',
-    'emerged_from_time_to',
-    'emergen',
-    'emergences',
-    'emergencies.',
-    'emergency&mdash;to',
-    'emergency-exit',
-    'emergency-feedwater',
-    'emergency-service',
-    'emergency-speak',
-    'emergency.',
     'emergency/hazard',
-    'emergency/panic',
-    'emergwncy',
-    'emeried',
-    'emersonian',
-    'emersonianism',
-    'emersons',
-    'emerville',
-    'emery-papering',
-    'emery/dinner',
-    'emes/thames',
-    'emesa',
-    'emese',
-    'emf-atic',
-    'emf/silverfish',
-    'emfadlek',
     'emhain',
-    'emi-tape',
-    'emi/us',
-    'emigrants\'society',
-    'emigratin\'',
-    'emigree',
-    'emilies',
-    'emilios',
-    'emilius',
-    'emille',
-    'emilly',
-    'emilyan',
-    'emin7',
-    'emina',
-    'eminase',
-    'eminency',
     'eminens',
-    'eminescu',
-    'emip',
-    'emira',
-    'emirates-though',
-    'emirates.',
-    'emiri',
-    'emiroglu',
-    'emisions',
-    'emison',
-    'emission-conscious',
-    'emission-controlled',
-    'emission-free',
-    'emission-inventory/meteorology',
-    'emission-monitoring',
-    'emission-reduction',
     'emission-releasing',
-    'emissions-trading',
-    'emissives',
-    'emissivities',
-    'emissons',
-    'emk',
-    'emk-1',
-    'emka',
-    'emkarate',
-    'emla',
-    'emlith',
-    'emloyees',
-    'emloyment',
-    'emlpoys',
-    'emm-o',
-    'emm.sys',
     'emma-louise',
-    'emma.',
-    'emmajane',
-    'emmaline',
-    'emmannuelle',
-    'emmanuel&mdash',
-    'emmanuella',
-    'emmanuilovich',
-    'emmanus',
-    'emmanyel',
-    'emmas',
-    'emmbrook',
-    'emmelle',
-    'emmen-7',
-    'emmen-9',
-    'emmen-nieuw',
     'emmence',
-    'emmendingen',
-    'emmenlauer',
-    'emmentaler',
-    'emmerland',
-    'emmesworth',
-    'emmetten',
-    'emmie-emmie',
-    'emmigrate',
-    'emminent',
-    'emminently',
-    'emmings/thames',
-    'emmisions',
-    'emmission',
-    'emmm',
-    'emmo',
     'emmonbee',
-    'emmonsailes',
-    'emmy-award-winning',
-    'emnet',
-    'emneth',
-    'emnities',
-    'emnity',
-    'emollience',
-    'emolliently',
-    'emollit',
-    'emon',
-    'emot1onal',
-    'emotape',
-    'emote',
-    'emotes',
-    'emotion-based',
     'emotion-free',
-    'emotion-junkie',
-    'emotion-packed',
-    'emotion-purged',
-    'emotion.',
-    'emotional\'',
-    'emotional/behavioural',
-    'emotional/mental/spiritual',
-    'emotional/rational',
-    'emotionalist',
-    'emotionally-balanced',
-    'emotionally-chaotic',
-    'emotionally-demanding',
-    'emotionally-driven',
-    'emotionally-packed',
-    'emotionally-related',
     'emotionally-triggered',
-    'emotionally.',
-    'emotionlessly',
-    'emotions.',
-    'emough',
-    'emp.no',
-    'emp.no(1)',
-    'emp700',
-    'empacho',
-    'empacombe',
-    'empalement',
-    'empanadas',
-    'empanelment',
-    'empat',
-    'empate',
-    'empathies',
     'empathizes',
-    'empaths',
-    'empecinado',
-    'empedocle',
-    'empeiria',
-    'empennages',
-    'emperor\'s',
-    'emperor-elect',
-    'emperor-in-exile',
-    'emperor-of-peace-and-nations-of-austria',
-    'emperor-sent',
-    'emperor-size',
-    'emperor-slayers',
-    'emperor-to-be',
-    'emperor/your',
-    'emperorism',
     'empery',
-    'empetraceae',
-    'emph',
-    'empha',
-    'empha&rehy;sise',
-    'emphaasise',
-    'emphacyte',
-    'emphas',
-    'emphases-provide',
-    'emphasi',
-    'emphasied',
-    'emphasis&mdash;perhaps',
-    'emphasis&rehy;ing',
-    'emphasises.',
-    'emphasising.',
-    'emphasisis',
     'emphasize-',
-    'emphasizing_rather',
-    'emphraim',
-    'emphysema-related',
-    'emphysemaand',
-    'empi-uchi',
-    'empictured',
-    'empire-line',
-    'empire-orientated',
-    'empire.building',
-    'empires.',
-    'empirical.',
-    'empirical/deductive',
-    'empirically-based',
-    'empiricistes',
-    'empirick',
     'empiricks',
-    'empirics',
-    'empisal',
-    'empl',
-    'empleadismo',
-    'empleo',
-    'empleomani/1a',
-    'empli',
-    'emplloyee',
-    'employ-ment',
-    'employa',
-    'employed-as-required',
-    'employed-husband',
-    'employed/were',
-    'employee&mdash;employer',
-    'employee(s)',
     'employee-based',
-    'employee-centered',
-    'employee-holder',
-    'employee-involvement',
-    'employee-orientation',
-    'employee-oriented',
-    'employee-share',
-    'employee-shareholders',
-    'employee/connection',
-    'employee/employer',
-    'employees&mdash;that',
-    'employees.it',
-    'employees/candidates',
-    'employees/employee',
-    'employees/pupils',
-    'employeesnew',
     'employer&mdash;has',
-    'employer\'s',
-    'employer-company',
-    'employer-directed',
-    'employer-education',
-    'employer-friends',
-    'employer-magistrates',
-    'employer-provided',
-    'employer-union',
-    'employer.based',
-    'employer/',
-    'employer/education',
-    'employer/fellow',
-    'employer/former',
-    'employer/magistrate',
-    'employer/s',
     'employers/appropriate',
-    'employers/employees',
-    'employers/establishments',
-    'employers/landlords',
-    'employers/local',
-    'employes',
-    'employess',
-    'employm',
-    'employmcnt',
-    'employmednt',
-    'employmee',
-    'employmemt',
-    'employment\'',
-    'employment-centred',
-    'employment-growth',
-    'employment-lead',
     'employment-of',
-    'employment-orientation',
-    'employment-oriented',
-    'employment-promotion',
-    'employment/acas',
-    'employment/directorships',
-    'employment/occupational',
-    'employment/register',
-    'employmenttechnology',
-    'employs.',
-    'empodium',
-    'empor',
-    'emporiae',
-    'emport&eacute',
-    'empoverished',
-    'empoy',
     'emprego',
-    'empress-regent',
-    'emprove',
-    'empsonian',
-    'emptae',
-    'empti',
-    'emptied-out',
-    'emptiness-that-was-not',
-    'emptiness.',
-    'empting',
-    'emptive',
-    'empty&rehy;handed',
-    'empty(a1)',
-    'empty(a2)',
-    'empty(a3)',
-    'empty(b3)',
     'empty(c1)',
-    'empty(c2)',
-    'empty(c3)',
-    'empty(z\')',
-    'empty-',
-    'empty-glanded',
-    'empty-hearted',
-    'empty-shell',
-    'empty-sounding',
-    'empty-suited',
-    'empty-ward',
-    'empty.she',
-    'empty/full',
-    'empty/nobody',
-    'emptyhanded',
-    'emptyheadedness',
     'emptyness',
-    'empurpling',
-    'empyrea',
-    'emrawde',
-    'emreb',
-    'emrged',
-    'emrging',
-    'emrh',
-    'emrick',
-    'ems/help',
-    'emsladn',
-    'emsland',
-    'emtns',
-    'emu-enthusiast',
-    'emulative',
-    'emulatory',
     'emulsification',
-    'emulsion-polymerized',
-    'emulsive',
-    'emunctory',
-    'emv-23',
-    'emyard',
-    'emyn',
-    'en&ndash;ugh',
-    'en&rehy;courages',
-    'en&rehy;joying',
-    'en&rehy;lightened',
-    'en&rehy;suite',
-    'en\'all',
-    'en-2',
-    'en-able',
-    'en-echelon',
     'en-gedi',
-    'en-mass',
-    'en-suite.',
-    'en-tact',
-    'en-tranced',
-    'en/em=&frac12',
-    'en1',
-    'en4',
-    'en71',
-    'enabl',
-    'enable/provoke',
-    'enabling/disabling',
-    'enachescu',
-    'enacted.',
-    'enactive',
-    'enactors',
     'enamel-base',
-    'enamel-based',
-    'enamel-coated',
-    'enamel-like',
-    'enameller',
-    'enamels.the',
-    'enamour',
-    'enantiomorph',
-    'enantiomorphic',
-    'enantiomorphs',
-    'enantioselective',
-    'enantiotropes-grey',
-    'enantiotropic',
-    'enardeces',
-    'enarque',
-    'enatal',
     'enatced',
-    'enayas',
-    'enayes',
-    'enbourne',
-    'enbus',
-    'encafe',
-    'encalada',
-    'encamping',
-    'encampment-',
-    'encantada',
-    'encap',
-    'encapsidated',
-    'encapsulation\'',
-    'encapsulations',
-    'encapsulators',
-    'encapsuled',
     'encapsulisation',
-    'encarnation',
-    'encasement',
-    'encephalins',
-    'encephalo',
-    'encephalogram',
-    'encephalographic',
-    'encephalography',
-    'encephalomyopathies',
-    'encephalpathy',
-    'ences',
-    'enchada',
-    'enchain&eacute',
-    'enchaine',
-    'enchainement',
-    'enchainements',
     'enchant&eacute;e',
-    'enchillada',
-    'enchmarch',
-    'enchoying',
-    'enchufe',
-    'enchytraeids',
+)
+
+blocks_79 = (
+    '%\'s\'n\'all$#ful$(kensburg$*m-activity&#bat\'&lowing\'$rain&\'chamber\'#oat(\'me-true(+nsciousness($rner&&depths\'*ream-dream\'#ust',
+    '\')ulfilling&\'imagery\'.nterpretations&$kiss&$life\'$ogic(#ver&(machines(%nuals(!p\'\'etaphor&&packed("st\'%eople\'&icture',
+    '*!s&$self\'$wain&\'tangled\'#eam(\'lepathy\'%opics(#uch("wn\'\'roubled&&vision&\'walking(!y\'$oman("rk',
+    '%$/you%#boy%\'crossed%%ed-of("up&%rship&!s%&flower%#ier\'"st&"n\'%\'ography%#pop($pers%"s.',
+    '&"/a&%capes&#eat\'"lf&&hadows&$pace&$tone&"un%$t-of&#eam%&walked*"rs)#ing%\'y-faced\'$time',
+    '%#ton%#y-i\'\'looking$"th#%bbond#\'ckspatz%!y#-dge/pensioner&%d-out#"eb$\'eeaaaam&)eaaaaammm$"ma$#ned%!k',
+    '#\'faldwyn$!f$#lan$!n$&oldwyn#$gger%$iest$"ne##ien$$giaw%,roschenmusik,$oper$&kanter%$lang%+onigstrasse',
+    '$#mne$$tzel##kar$$sler$$zone##lla#%manis$"el%!s$#yth#%nches\'!v&$ings$-nan/neighbour$!t',
+    '#&ptatea#"ry#\'sdeners$"er$#ing$(s-basket&$coat(\'nscious&)fastening/!s&\'lengths&%maker&$shop\'%tyles&*to-impress',
+    '%!/&1shoes/bridesmaids&$with%#_up%$able%$coat%\'ed-down(&nicely\'!/&!l&3r/harris/kirk/saunt%#ful%$idge&#ng-)*by-numbers',
+    '*$hair*)um-locker))gown-clad)#own)%robot)%shelf*\'tations)\'trolley(+/undressing(&=table(+s&rehy;down%#oir&!r$&ternan#!u',
+    '##ves#%weatt%!s$*ry/lothian#!y$!e$&fuseur$!t#"ze$#nik"!h"\'i-block#$bbig%(le-brain(\'stained',
+    '\'$ware$#let#$ctum#&dekker#!e$\'d-blood+$-red&$food&*up-looking%!.%\'/tinned$\'fontein$$ssen$(tabbetje$!u',
+    '),-bridlington)0/gloucestershire$)t-beating&\'fishing&%lines&$tube%&beater%!e%#in\'%$line%$ways#)ghlington$!o#!i#&ll-bit',
+    '&%holes&$like&&makers($ster&$sarn\'\'ergeant\'%tring%-/screwdrivers%\'ability%$core%%holes%#in\'\'&g-rigs)\'service%"os',
+    '&$ress%*s/breakers\',screwdrivers#$mmer%"on$$nagh%"in#%nched%$ourt$!i$*k&mdash;if&,rehy;fuddled%!\'&"st%!-',
+    '*%drive\')ssociated&%based&%laden&(offering\')n-a-stick\'!r&\'pouring&\'ravaged&$shop\'\'willing&$then(,is-and-score%).although&#the',
+    '&\'drivers%\'ability\'#les&"rd%%eries%%field%"in\',g&rehy;party(!-)%clubs*(ompanion*"up,!s)&feeder)%glass',
+    '+#use)\'parties*$lace)%songs+(undtrack)$time*%rough)&vessel((/cooking%#ken%$less%\'s&mdash&)-carriers\'\'machine\'.to-restaurants',
+    '\'3sells/abhors/wastes&$tone%1water/association%&y-poos&%poohs$"sk#"om#+p&rehy;feed*$ping$\'-course%%dried(!p)%-drip)$ping\'$ying',
+    '%#pan$!.$$feed$$hter$)ped-dried%"ie\'"st&&ng-wet%"le%"ng%!s$$ster&#one##run#!s',
+    ')"uv$$kell#$tfed$"te##v\'n$\'ability%"ge%$tive$)e&rehy;by%!\'%#(s)%!-&$belt\'"ys&\'cum-cut',
+    '&,in-drive-out((hibiting&$line&\'related&(stimulus&"up&+w900112/034%./accommodation\'*lnwickhill&&master&"on&9ski/sail/swim/dance/surf/&"we("re%$able',
+    '%&charts%!d%&master%$name&$ness%"r\'&#(s)&,-accompanied\')conductor\'\'fatigue\'"no\'(operated\'$plus&*/navigator("ra',
+    '\'&porter\'%rider\'\'yardman&!1&"s.\'$/bus($east()operators(&riders\'\'stopped%&shafts%"th%$way.&#ise$)ing-board',
+    '()gauntlets(\'licence/!s(&morenz(&ranges($time(Eunconsciously-while-proving-a-theorem\'..approximately\'(/driving\'$_out#"za$#hon$"ic$#ley$*zle-veiled',
+    '"$lica")matically"#nis")oaphernes#*beta-turnu$#ner&$wski#$emer$"se#!i$)d-bunking#(latiques$&leries%#ing%!s',
+    '#\'madidae%$lane%!s$"e1%"na&#on-$"in&!a&#eer$\'nasough$%oland%"ra&(nithidae#(ne-chant&&figure',
+    '%!y$"go&%-rock$%ingly$!k%!e&"rs$$nies#!o$"d.$$klin$#ler%$ings$,p-stockinged%#ily',
+    '\',g-moustached(!.%&y-jaws$"th##p\'t$!-%)down-dead%%ended&%scape%\'handled+!s&#ead%#jaw%&kicked)!s',
+    ')!s(#ved%#net%(of-a-hat(%water\'"fs%%pearl&%ounce%%scene&$haft&#ide\'"ze&%tones\'#yle%$tank',
+    '&#une)!d%%zones$\'.sheila$$ball$%cloth$"ed$#har$*institches$\'kicking$%leted%$ocks$#nik$$offs%/ut/spiritualist',
+    '%!a%\'ed-head\'%.well&&rs-out%"in\'&g-free)#out$"s.%%afoot%%hafts%#ide&"es%$tone$\'through$$wort',
+    '$(anthemum$#dik$&eracea$$hkys$(kapovchy$(opterins$(selmeyer$"te#!t$(tingholm%&kvaett#$uard$2ght&rehy;resistant\'!-()afflicted',
+    '((hardened)"it(\'induced(&lovers+#ing(%proof(\'striken(*threatened\'$iest$"in$#sie#!v$%e-way%!/%&r-wood',
+    '#!w$#in\'$(n/county$$sier#\'ylesden%$sdon#$zdov"!r"&s/6000#$9000\'!s"1tf1-polypeptide-1%\'/e2f-rb)!."\'u/petit',
+    '$*-drub-drub.*-drub-drub$#bel$!s##cke&\'r-brown#!d$&geries%!y#!e$"ke$!r#-g&rehy;sodden+(uppliers$#-15',
+    '*"rs)#ing&%ddled\'+ministering&3nd-drink-influenced&\'pproval%(baronish&&inding&&oosted%\'chewing&)ontaining%)dependent(%rived\'&ranged\'$sign',
+    '%(enhanced\'(thralled%%fiend\'$lled&\'renzied&&uelled%(handlers\'#ppy&&earing&%ungry%(imbibing\'*munophilin&\'nfested%%laden&(iability',
+    '&$oney%(obsessed&\'riented&(verdoses%\'peddler&%olicy&%usher)#ing%\'raddled&\'elated.\'(sistance&#ich\'"ng%%scene\'\'reening',
+    '&(mugglers&$quad&$ting&\'uspects%%taker(*ing\'/\'drug&(errorist\'"st)#ers&&herapy&)rafficker\'\'iggered\'&oubled%$wise$!.',
+    '$\'/doping%3pesticide/herbicide&(hosphate$\'ged-out\'"ly&!r&#ted%"ie&#ngs$%lords$\'masters%$usic$#net%$otes$0s\'n\'rock\'n\'drugs',
+    '*#ing&%crime&,for-hostages&\'hunting&)in-prison&&ridden&%squad&)terrorist%$.tim%-/intoxicating%$ters$&takers$$ules$%vomit##ick',
+    '%$ibeg&"sm$#ett$"ff$"tt##kov#(m-a-thon&)nd-rattle%\'backing\'%nging&$eats%#fed%$head%%major\'$niac',
+    '&%umbed%%range\'$ttle&&evolve&&olling%&sander)#ing&\'canning&#ong&$tick%%tight$#add&#oon%$road$$ceat',
+    '%#rew$$fire$%glass%%ooles&!r\'!e$\'hallagh&"rk%%eller$&inally$#lee&"ss%#one$%mahoe&$more',
+    '(-cum-guitarist,*taxidriver($girl\'%/horn%"ie\'%-bees&#ngs%(ond/leaf%#und$&nasole$#ont%#yne$\'pellier$%reagh%$ight',
+    '$&sallan%&kinney(!s%&mudden%"na%%teaks&\'inchall$$tara%#ech%$ower$&ulator#\'ncliffe$0k-and-disorderly&&driver&)in-charge',
+    '&&person\'$roof%&/dance%!e&"en&+n&rehy;ness\'$-dog)&riving\'#ing%"in\'!\'%"ne$$ning#\'scovich$"es',
+    '$!s%$ilas$#tan\'!s##ten#!v#$zhba%$inii(!n$#ina"$ving#!s""w9#(s-y-coed"*x/&pound;1',
+    ')$eyed#!\'#\'-bagged&"rk%#ony$$cell%)lean-only)#ed.%\'oloured$*deposition%\'rilling&#unk$\'farming%"ly%"ry',
+    '$$heat%%opped%\'umoured$(into-wet$$land$#mix$%nosed$$play&%ucked$$road\'"st&$tted%"un$&salter%&craped',
+    '%&kinned%\'melling%#pun%)tone-wall\'$rage(!e)!d$%tanks%#ype$%verge$\'walling%%eight%#ipe&$tted#!.',
+    '$%moist$&normal$&permed#$ades$&ntilla#%board%!x#(cleaning#(denesque%%rdale$%ocked%!n#"ed$!n$$r_so',
+    '##ham$#ole$$urst#)ing-allow\'%field\'$room&!.#&lining#%matic$"ix$$onia#%ness.$"ie$"ke#&ocopus',
+    '%"ol#&salter$/dale/gloucester)\'markets&"te$#gol\'$goch$#hod$"on$*tone-dyked#$vent#$wall"(zewiecka#\'ycimski$+ma&lstrok;a',
+    '#&backup##dna"!."(/90-7000#"dt""10#!5"!4"!5"!6"!7#"00"!8"\':binary"!b',
+    '""c.#$hang""d3#"c.#!l#$sksm"(ecretion#$pite""fc"!g"!h#$cher")icvoeverd#$ncve#!r',
+    '"%m1616#!s"!n"2p&mdash;democratic#$-128$$a500$$e200#"11$"6a#%56000\'!1#!g""r6#!m"%s-gis',
+    '##ent#!p#"un"$thhb#!l"$u***#"bl#"s4%"-d""vf!(t-dacron"!.""11#"50"$2600',
+    '"!6"#ake"%bgmbh"&c-1000""en""fs"!g"+i-appointed$$link$)sponsored#$/cbi$*government$#mti$#sep"/jbswirzrezlmqco',
+    '#!p"&p-like$%style"#r-1""t.!,u&rehy;bious#)scaron;ek"!\'"#-50#\'gnorian"!."(/chinese#"dt$!z""a2',
+    '#+da&sacute;i#,l&rehy;edged*\'purpose$&-33mhz%\'66.7mhz%#arc%$beam%\'capable&&hannel&%oding\'%mmand\'"ne((tainment\'"st%(detector',
+    '%%flush&(requency%$gold%&income\'\'surance%#key%&labour&$evel%$note%)operating&\'rganism%&period&&ointer&,ractitioners\'\'esenter',
+    '\'#ice%(resident&$oled%&source&\'tandard&&urface&%ystem%+temperature&#one%#use%,water-supply&$ired%$xxxx$,/instruction$!a',
+    '$$grph$$thon#%nnian#"os#&thlons"*b&oacute;n#&-disco$$funk$%house#&agunta$$yyah#!b$#ers$#ier%)n-lickers',
+    '&!s$!s#&cekite#$ecco$!n#%hacon#"in$(tability&%ntium&"re&$tion$"um##ler$(in-bound\'\'created',
+    '\'&moscow&&iensis&#man#&master#*ois-pillet$#ule$(va/coach%#sky$$witz#&plates##rac%!o%!v$"ey$.ov&ccaron;anin',
+    '(&k.mike##tek#"uc$%ffets$%isson$$nnic$!t#%versh#!y$#nin"%cados$!n%!e$!r$%ufour',
+    '#$eppe#*h&ecirc;ne$$-ess$\'ampians\'!s%"ne%#rme$#ein%!k%!s&*s-countess$$lage$&ossois$#rae#(k\'s-head',
+    '$!-%,and-mushroom%%calls%%dives%(egg-blue%$guns%$hook%\'jumping)!s%$pond)!s\'"oh%%quack%&shaped\'&ooting',
+    '\'"lk&\'hronged$$.too$%arsed$%board)#ing$"ek%$ries\'"ng&!y%"ts&#tes$%haven$)ing-chair(&stools',
+    '%"st$3lington/oxfordshire$#man$*umentaries$*worth-chad$$ypet#-laud-williams#!o$$rroy#$reux%"yi$+ocq-lawford%!w$.u-beaucaillour#!s',
+    '&$orne%&laying$&ilance$$less$"or#*umentaries"%ddies%"ly%%ngton$"le#"ed$"ly$&sville$$ttes#,field/farmer',
+    '#%geons##hia#"ie$!k$$nets#)ley-based\'%smith&".r&!s#"ot$$wski#-ududududududu#$wick#$yrev"+e&ntilde;as',
+    '#$/dew#-_,_but_due_to$"no##ing#)l-scarred$!l%&/royal%\'i-klein$!y#%mmler#$odde#%rdoth$$gars$!o#,s&mdash;were',
+    '$#ing$"sa#&t-tone$"ed$"ti%!o"$feck#&f-duff%%mucky%(sounding$\'el-coat%"tt%#yrn$$head$,ield-harding',
+    '%"ng$+le-jacketed&%coats&!s&!y$!s$(y-fallon%)/designer##kin#*ourstrasse#\'resnier#!t#\'y-print"&g-over#"al',
+    '#\'ganitch$&esting$&onitch#"ie$!n##las$%eddau#$more#.onijic/evacuee*\'injured#"ue%!t$)id/mother"9h-d-duh-d-duh-d-duhduhduh%"uh',
+    '$!n%"ey$$yyat#$esme#"hh#!m#"ne"&ignans#"jn#$lisg#"no#%rnish#&sburg/$"er$#ker',
+    '"#jac$&kovich"!k#!1#!a$!n$!t##e\'s$*-designate%)edinburgh%%friar%(portland$$ness$%rdale%#ich',
+    '##hha#%kered\'!r#$lija#!u"!l##ari#%becos#&camara$#edo%%phone%!s$!i%%mers.%%ssime',
+    '&"er&#one$!y##eek$!p#$horn#"ia#"ks#)l-brained%$dark&#ust%%faced)#ted%%green%$hued',
+    '&&ointed%(sounding&$traw%%toned$!.$\'borough$"ea%(r/editor\'&oxford%$sian$&peldyr$&sville$)y-written#"on#&phalac',
+    '##son$#ton#,y-authorised$!n"8m&eacute;nil-lebl&eacute#$-day%%e-dum%%o-be-%&um-dum\'!s#$87q4#$aine%!s$$lise$/s-herm&egrave;s',
+    '#-b-bell-shaped&\'runette%$fuck%*mindedness%$show$1arton-helensburgh%#ton$*bell-shape$"ed%"ll%!r$+foundedness$\'iedykes$\'ledykes&3ton/gloucestershire',
+    '&%young%"y.$&nation$&ounded$&waiter$!y#%eisen#(fermline$(rieshire##ini$"so#$kins#%mkopf$!m$)y-chewing',
+    '&#run%/dummydummydummy%!s##nor&"ix#)ont-nizan$"sa#&p-bins%(clearing%$head$%/load%\'restore$&ed-off%"rd$$ford',
+    '$#ily%&ng-off\',/preparation$#led%)ing-based$#son%#ter$$ware&#tch#!y$"cz"+n&rehy;comb#*-and-white-!s$%cream',
+    '$$ping$&tinged$&walled#!/##ach&"ie%#ree$#dry$!j$%keszi$\'lastair$"ms$"nd$"ra%"ea',
+    '%"on$#yev\'%skaya#,bar-naysmith$"eg$%laine#$calf\'!e%#n\'s&\'/charge&\'skingle\'$sons\'$town$)el-backed%"ry',
+    '$%ombes$$raig$$tion#$daff%#ses$#ee0%(r-headed&$dale&!l&"th$(fermline$"ic$#ock%!n&$ians',
+    '$!y%#van#(e-bedded&&uggies%%grass%$land%$sand&%haped$%field$$ight$%lands%&mensis&!i\'#ans$"va',
+    '%%naghy$-ermline-based$\'irmline$(ord-wood\'\'/parent\'!s#)g-beetles%%caked&\'oloured%(dwelling%%faced&$lies%#hai%$like%)mimicking',
+    '$#ait%*nnon-based&"on%&rthill$,eon-vowelled%"ys$$like$#ong$$weed%#orm#&harrow$$enda$#olm%"pe#"it',
+    '%#rly&*ton/driver)!s$%horst$$ings%+rk-boulogne(%style\'!.$(leosteus&!r&!s&)y/balloon/#ist(&master(%pilot',
+    '$!y#$larg$"ea&"ry&"th%!y$9op-humphrey/cross-channel\'\'trained$%uskin#(macreena%(nifestin#\'n/award%(cataract&+ountrywatch%$fife',
+    '$$aker%"rt$#ery%#tts%#ven$"in&$gite\'#ley$"on%!s&!e$-y-in-the-wold#$owen##que#&roamin',
+    '%1ssil/conservative#%score%"ri$\'electin&"ls&!y$$halt$$inea$$lair&"nd$$more(&-hardy%#ure("ss$"on',
+    '%&abians&"ll&/n\'s-in-the-west\'\'-in-the.%-east\'$vill%#eld%(on-based\'(e/senior\'!s#&taylor$#ed.%!r$,horne/oxford$%innie',
+    '&&bourne$%reath$!s$#ulm#%vant6$$ille%,n-markievicz##wan%!y$#ick$$orth#$yask"%o-art$#bus$\'pianist',
+    '#&decies\'!m%+nal-gastric(!e&&ocolic\'*fibrescope\'&gastro\'%scope,!s+!y\'$tomy&%titis&#uma$!o$!u',
+    '#!i#$lian\'!s%$thic$%ogues#&matics#!n#%phone$%olies\'#sts&%y.the#$rail##tac##vir"*p/vanguard',
+    '#%eroux%#val$!y%#ron#!f#,halac-duphar#%icate#!l$%essis%#xed$)i-carvers%.cated-resource&%ities(%ously#!m',
+    '&!i\'!a#"uy"&quenoy"*rabilities%.les-infrequent%$uild$%cells$$felt%#ort&-ur-crematoire$#gel$!j$,linium-lined$$meau',
+    '%(d-deacon&"al&!e\'#lle&"ii%!o%!s$%steel$,tion-related(!.\'"wn&$vely%#ype##bah%&nville',
+    '&&villes#%chaus#)den-smith$#les#"ee$#lle$$ndal$,ss&mdash;see&"es$!y#%gapur$"ul#)ham-based(#orn\'(mancelle',
+    '\'(somerset&!/\')newcastle(-orthumberland&%based&#ers%"nl#!i$)c/bosnian$*ng-puberty$%ssima$"te#%leigh#$mala#!n',
+    '$\'in/goal\'&oxford#\'obrivis$"ck%\'ortorum$$sell$&trigum$!x#\'r/south$$ance&"ds&$hill&!s%!s$&enroth',
+    '$#ies%%ngton$#ock$\'rrrrrrr$#uti$%ville#!s$"ch$!e$2ley&ndash;pedersen$$tine##ten$$nell$!y#!u',
+    '##zak"%sapin$"ry#%chdas#!e$!n#\'hchinta$%enyka#!i$%llion#&k-grey%%laden&"it%%white$#ier',
+    '$%light$\'y-black&$pink&\'scarlet\'&kinned#"on##san$-eldorf/munich$"ie#*t&rehy;men*%press$$-air%#bag&#ins&$lown',
+    '%&caused&$loud%(darkened%)explosion%\'flecked%#gas&$rimy%$heat%&laying&&ifting%#man\'#sks&%isted&$otes%&nebula',
+    '%\'raising&"ed&#ims%\'sheeted\'(ovelling&#ize&\'melling&(tiffened\'$orms%$trap%(wreathed$&/epoxy$%balls%!i&"n\'',
+    '(#day($fuls(%lined,!r-!s()marauding(%sized($type\'!.$%cloud%$oats$%devil)!s$\'ed-down\'$over',
+    '$$heap(!s$)in/sumner&&g-down\'!s$%louse$%motes$"ov$%proof$%sheet)"ed$%women$+y&rehy;pink%&-blank&%faced',
+    '&%robed#\'ulphate"!t#)&aacute;n#"ar#"ce$(h-accent&&backed\'#orn\'#red\'$uilt&)commanded&$doll&\'english&&gabled',
+    '&*indonesian&#led&(occupied&%ruled&)sponsored\'$tyle&%tiled%)/american&\'belgian&\'flemish&*portuguese&%swiss%$man.(&/senta%%shell',
+    '$%plase#%field%!n##hac#"ie%\'s&ndash$-lleul-masurel#"ka$!o#0oit/philadelphia$#sky#!p#"ra##sch$!e',
+    '$*on-forshaw&0/gloucestershire\'#nal\')solicitor$!y#"y\'$&-beats&#oat%)conscious%$made%&neuron%&roster\'#tas%(sergeant&(uspended',
+    '$\'/taking$\'_on_the$%frees$!s"&umvirs#$ring$%stede#)t/refugee"*vall-stood$!z#$eens$$rger$\'t-cover&$like#&illard',
+    '#!y"&waydar##ynt"&xberry#%worth""yn#&odenal#(unolepis!$v/dt$!v"#841"$=jdv"$aita"!c")i-related',
+    '#$sion#&zhenie"6o&rcaron&aacute;k-like,\'grave;k#&everie#"ry%#ane\'$stvo"!p""sm""ts"!v"!x!#w15""20',
+    '#"00"%angwa#\'rf-bean&&forged&$held("wn&$life("ke("ly&$star%"ey$&kanath$&vishly"(eebettes$"je',
+    '##lle&)rs-around&!s%!i&"n\'\',g&rehy;house(+-apartments)(colonial)&ground)%space("s.%!t%#yng$$t-on#!m',
+    '#$rgar$\'ryhouse"!f"(i-fungsi#$bbly#"le#"nd$!g#"pa"!k"$mail""on#!r$$kins"!s',
+    '#$rnik"!y#"le##myn!+x2&ndash;66""c2#!p""d5"!e#&-based#E5&verbar&verbar;nxe5&verbar&verbar;23#!6"$giii"!l"(pedition',
+    '*!s"!s#"17#!3$"70##740#"94"#tps""xg"#ycp!+yad-related$#ing#"ki$#ovo#!n',
+    '"$ball$!n#%kjaer##ski"#cer#"he#%khoff#!p"$dime#"on""e-$%baths$%house$)in-liquid$%layer',
+    '$%plant%(roducing$%stuff$*terminator#&:epoxy#(d-blonde#%henko#$line$!l#%maker#%nasty#+r\'s-bugloss\')greenweed#%s-the#$tary',
+    '##fed#%nallt"%g564b"-ing&mdash;how%%-down\'#uck&"in&#out%#/is%$ness#!r"!k#!a#(e-acland%&divide',
+    '%#hag%&mobile%*wellington$%heads$"rs$$side#$htau"!l#+an-biograph&$type%!d%$ised%(ologists#$exia#!i',
+    '#&lansow$!e#%ycate"&makkya$#lly$$xion#!e$#tol##oed$"ke$$tape""n/$&sec.cm#%a-rod$%beads',
+    '$!m%3ic-programming-type\'#ism)"ts&#kou&"se\'"m.&!x%*o-operated&"ed\'!s&(tologist$!n$$scan%#tar',
+    '&)ic-minded("al\'!d&\'y-style$#tek#$corp#$eley$"ma$$wydd#%ix(r)#"ne#\'orphins#!s"$onas$!i',
+    '#"tt#!u$.thinkesesawrus",p&mdash;true"(rchafiad#2h&oacute;l&aelig;y$$aven##ing#$lund#\'rachium##ynk"%sart.&$hria&!s#+entery-type',
+    '$*quilibrium$"rt#&fluent$,unctionalism."ty-"ly#(graphias#%inger#(kinesias#*lipidaemic#,morphologies#%nomia#)on-hudson#!p$%apsia',
+    '$%lacia&$sias$$onea$&rosium#(reflexia%(gulation$\'hythmia#&seasid$\'ynergic#%tocia%#nia%#pic$\'rophies),n-associated*!s',
+    '#\'iscidae##tye"\'ulgerov""ve$"rs"!z#)-specific#*1-specific!"z."#/is"#aba#)nga-ndoki\'&sangha$#tav#%oudzi',
+    '#!t"%enkle#)rszhinsky$\'zhihsky%%insky##vad#"wu"%halil$$mbul#*enchurayev$(rzhinsky",i&eogon;kuje#"ak#\'endziel$(wanowski',
+    '#,ndzihashvili"$odzi#\'ngkhags$#kwa"%ubeck#$mber#$ndza"%vimbo"#wig"#yan %e&agr%&;e&bgr#$mp;b&"fn&"pd',
+    '##uml"(ccedil;a"&dgr;en"&flat;9"%infin"$lt;d"\'mdash;3(!h(#the"%natur#*dash;ample(%plain",ouml;nw&euml\')tr&ouml;s"+pound;1,500',
+    ')%7,473(&41,248"&rarr;p#)ehy;heads#$gr;a"\'ucirc;t!$\'asy"!l#!a#!y!\'(f)/121""p)"#ri)""s)!%-113c',
+    '#"6s"#220##500#!8"!3"!5"!6"!a#(dditives"$boat$!w$!y"2cadherin-dependent+*expressing++independent',
+    '##oes$"li$\'mponent$"re#&ulture"$days#\'etector"(elephant$#lie#)xpedition"!f##ace%#ing%#tor#"it',
+    '#&olding#!u""g.#)eneration#$rade"!i#"ii#)mpossible"%jones"(lo-de-ar"/mail:geo2:aidoc&"ed#$omin"%night#%umber',
+    '".palaeographers%*eographers"#reg%\'istered(&ration$(stricted##ich$#ght"!s#"at#%tring#%ytems"$text#$ypes"%words',
+    '"#yes!#.-l#"w."!1#!4"#351"$42nd"$a.o.$!t"(b.i.h.q."$c.c.$\'ferenie$"s.$"t.$"u.',
+    '""ds"#e.c"(f.benson$$e.s.$$f.s.$"j.$(knipling"#g.a$(chestnut%\'lapping$%fraud$%jones$$lard$!m%!.',
+    '#%arber"#h.e$#r.r$"w.""ix"$j.c.$"w."$l.t.$"v.##aue#&ephant"$m.b.$$j.a.$"s.$"w.',
+    '#%urphy""n.$"e.&\'-w.s.w.&"l.$"t."$o.s."\'p.evans$"i.$%s.p.s"%r.354$&jessop#$aven"$s.p.$"r.',
+    '"!t#&.gifts$"s."*v.phillips$%young!+/00/22/0002+!9($2005*"11&&3/0049($2054)#109*"25*"31*"53',
+    '*"61+!2*"75*"83+!6+!7*"96+!7)#207*"10*"24+!7*"36+!8*"41',
+    '+!5+!6*"51*"70+!7*"83+!7+!9*"92+!4&&4/2038*"45*"50+!7&&6/0018',
+    '#+1/26/0010-1#)2/25/0000#)3/25/0000#)4/25/0000+!7+!8*"10+!2#)5/25/0000+!6+!9*"10+!4+!8#)6/25/0000',
+    '+!9*"20+!3+!7+!9*"31+!5+!6#)9/25/0000+!1+!2+!5+!6+!9*"11',
+    '"*11/25/0000+!1+!2+!3+!5+!6*"11#)3/25/0005#%omund$#wyn#(pigraphs"!b"!f"#p/r"#tm3',
+    '!#000"!6!\'1&gt;e0#%lt;e0#%sol;2("5c"#-e0#"sh"!."%/psti"$0.93#(1/676/51#!2"%1-e13##.93',
+    '"$2000#!3#!7"$3.93#!1#!2#"85#!9"$4.93#!2"$5.93#!1#!3$!6"$6.93',
+    '#!2""79"!9",ectioneering!+200/scholar"!1""20#!2""33""5c$#,5c""6a"!8""e4!+3&mdash;012',
+    '"#-b6"#003#!1""31"&51/306""6a"!s"!x!B4&verbar&verbar;d6&verbar&verbar;2"!.##93a%!b%!d%!e%!f',
+    '%!h%!i"!1#!0#!4"#28.""50""60"!a!&5&plus#%sol;6#@verbar&verbar;nfd7&verbar&verbar""\'s""/b"#001',
+    '"#259"#467"!5"!6#!6"*x5r5btc-on!(6&bsol;7#&plusmn#%sol;7"#.93"%000\'s#!1""21""34"!6',
+    '#\'pound;9"#.93""/8"$2/25"!5""6b"#723#"46""91"%after!%8-e11"#.93"#132#!7"#51/',
+    '"#000""2+!$=mc2!%a-250##400"!.",/&bgr;-actin#*00/20/0001,!2,!3,!4,!5,!7,!8+"10',
+    ',!2,!3,!4,!5,!6,!7,!8,!9+"20,!1,!2,!3,!4,!5,!6',
+    '*#103#%locus"#260""30"$40bi"$bani"*ch-company$"an$\'context$&others"%dales#&bangin$#urg&!h#"en',
+    '#"on#%stown##ulf#%wacer%"rd$"in$#old"+eac&pound;e#!i"*gelscliffe$&r-eyed&%faced&\'looking&\'to-help)\'impress',
+    '%%ness.#"il#1le&rehy;messenger%!\'%"-3&,and-swastika\'$tlas&&clarke\'\'reature(%owned&#eye&\'feather-!s&$like&\'mounted',
+    '\'(lastrons&%sized\'\'potting&#two%!.%\'/falcon%%hurst%$mann%-scliffe-based($ough&"on&#ton)!e%$trap#"on',
+    '"\'kenhead$!r##ing""la$)nd/driver#&derman$$gyth$\'ormanry#!e$"es$(y/thames#(ing-born&%esque##mes##ric',
+    '#!u"%nfled\'!a#"na##red#!t"(pitalist#"pa"-r&mdash;greek$*rehy;holes#!\'$$oles#!*#&-\'oles$\'aerials',
+    '%%oxing%*y-stimulus$%canal%\'leaning%\'rushing%\'urdling$(damaging%$rops$*flattening%%ringe$%holes\'#ing$"it$(lowering$&muffed',
+    '$&opener(#ing$\'patches%#ick&$eces%#lug%(unishing$\'rending$&shaped%%tones&"ud$&tagged%%ested%\'hudding%\'ickling',
+    '\'#the&!m%\'raining%&ugging$\'witness#%aches#%bands$#obs%"ne\'!s#$chip#%drops%,um-battering((piercing#&eckson',
+    '$!n%.del-references$!s#$flap\'!s#!h#$iler$"ng$!y#.l/castlemorton$(e/beauty%!m$)ier&mdash\'!-("as',
+    '(\'vintage(#you\'!.\'#_as&(st-known)\'looking%"ng$$lier$"me$"om$%sbury%#don%$hall%$mere%#ome',
+    '\'#wn.$0y&rehy;flowering%%-\'60s\'#80s&,17th-century\'+8th-century\'#991&#80s&(adopters&&bather\'$reak&\'century\'%omers&)diagnosed&0eleventh-century',
+    '&-fifth-century\'&lavian\'&orties((urteenth0-&rehy;century0(-century&)generated&#ish&\'learned&,mid-\'sixties)(dle-aged)&summer&*nineteenth&$open&+renaissance',
+    '&\'session(1venteenth-century\'$hift\'$tage)"rt+#ing($uart&,to-mid-1990s-\'fifties\'.welfth-century)&ntieth&&winter%(.because%%/late&#mid',
+    ')(dle/late%$1907%%birds%!h%%riser#(n/bitnet$"_a$#ach$$bank$&est(1)\'#ly.\'!s$#ign%"n\'&/gs&rehy;related',
+    '))per-share(!.(+/employment#$pads$\'iercing$\'ricking#$ragh$)ing-maker#$s-an%\'of-corn$%/were$!e%!d%#wig$-hot&mdash;and',
+    '%)littingly##tag$3h&mdash;australasia&4ndash;moon&ndash;sun,\'surface%2-balancing-pyramid\'%eaten\'$orne(&ttomed(#wel\'%urial&&centre,!d\'&olours(%vered',
+    '\'\'wellers+#ing&)encrusted&&facing\'&loored\'%oetus($rces(\'untains\'\'riendly&\'glitter\'"od\'$reen&$hued&\'linkage&\'mapping',
+    '\'&elting\')otherhood($vers&+netherlands\'$otes&%orbit&*penetrator&%quake&)residence&!s\'"ea\'%haker(\'rinking\'$ized\'$moke',
+    '\'&uckled(!n&*tangential\'\'erminal\'$ired\'%remor&$wall\')orshipper%!/&\'ecology&$food&\'mankind&*pathfinder&.terracotta/red\'"he',
+    '%$born%$core%\'ed-over&\'n-floor\'$ergy&!r%%first&(urniture%#ily%/quake-detecting+#hit+%prone+\'related-(sistance3!t',
+    ',\'tricken*!.*!d%%scan.\'%ience&%haker\'&rinker&#tar($tion,!s%%wheel&$oman\'$rks/%(ylooking##vin',
+    '$%igged\'#in\'$#orm#!y"$sain&!s$"ms#&bourne#"e.$$d-up$\'l-based&(pictures$%ment.#)i-feeders%#gro',
+    '$*er&rehy;it&&-going\'\'running\'(to-clean*#get*&manage%!s&&t-ever(\'to-make$0ly&rehy;readable&!-\'*accessible((vailable\'%bored)$ught',
+    ')$oken\'*controlled\'*deciphered)\'livered()igestible))scernible*&guised((rinkable\'&earned\'%found\'\'handled\',identifiable\'#led\'*maintained)%naged',
+    '\'*penetrated\'\'reached*!d)(cognised.%zable)&medied\'(targeted\'*understood$&ng-off&(ton-born$$shop$#way##ley#\'onsmith#,t&ndash;west',
+    '$(-anglian&#rab%%based&$lock%(coasters%(european%$gate&$oing&$reek%(indiaman%.kilbride-based%&london%\'setting%\'to-west%$wood',
+    '%&africa%\'britain%%chief%&europe%%north%)portugese%%south$%about%!m%!n%#ugh%$ways$$bach%&ourne.%#urn',
+    '$#den$#eal%"ll%!m%"nd%(r/deputy&&bridge&$ling*!s&#man&/n&rehy;inspired\')-bounding((european($most\'"ly',
+    '$5field&ndash;allocated)!s$/ham/development()wiltshire%$orpe%%waite$#ick%!e&!s%#ngs\'3ton/gloucestershire$$land(!s%"ea&5igh&ndash;refurbished',
+    '\'&/kodak%#ent%#ond$1nor/herefordshire$#oak%"es%)n/swindon%!p$\'phalian$#rop$$shaw$,ward-dipping)\'looking%#est%(ood-type',
+    '()/chairman)1gloucestershire\'s*$ypsy)&police#-y&rehy;access$"-8%&angled&+vailability%$call&$limb&#ook%\'does-it%!e&#asy&#dit',
+    '&&itting\'!x(#ing&#low%(handling%#ish%$kerr%%learn&%iving%\'natured%*on-the-ear%%paced\'%yment&&easies%\'reading',
+    '%#tee\'"rm&,o-administer)%nswer)$pply($beat)$uild($cook(&digest)#raw*#ive(#eat($find*!t*!x',
+    '*"ip(&handle($load(&manage($open+$rate(.pass-tory-gcse)#eel(#run(%strip((tear-off(#win%&virtue$)/moderate%"th',
+    '$&moving$%reach\'#der$$talk$$ways%"in"$t-in$)shit-kill$"up#".n##cha#*en-looking%"_a%#and$\'r&mdash',
+    '$"th#$hens#-ing-behaviour($ooks\'(disorder/!s\'&habits\'&living\'&nearly\'%paper\'$room&&:quiet&!s$(tnatural##man',
+    '$-n/oxfordshire%!i$!r#"ro##wot"$ukay##tel#(x-de-vie"#val#"ed$!n$/s&rehy;droppers%!-%#ham%%tones',
+    '"#yrs""zy!#b-1#!2$!s##650##750",/&bgr;-actin"!1#"10#&85(jc)"%3-ish"!6"!8""ac',
+    '##els%#wei$"rs$!s#\'inghaus$"tt#"on$!r#0ringham/christie%!x#!y""cc#!o"#dcs#"en',
+    '"+eg&pound;be#!l#&naceae$#eza$&ficial$%istes#!r$)mannstadt$&neezer$#tor%%platz%!s&\'tiftung$!z"!i',
+    '#"ng#$onim##ris#%scite"!l#"in#!s"!m#"11#-aj7&amp;sharp#$eier"*nat-kappel"#obo#!e##nex',
+    '$.y&rehy;handled%)-buttoned&\'handled&\'shining#(u&eacute$+ka-babackas""ps"(rahimian#"ey"$udea#$lfez$(liometry\'%scopy&$tion$!o',
+    '%"ea".v-immortalized"#yth"!z#!w!4c&dollar;100,000,000,(3,00,000+*54,700,000,)8,100,000+*83,100,000,)4,000,000+*93,300,000**20,000,000+*46,900,000+)5,000,000',
+    '+*41,300,000,)8,100,000*)5,500,000+)8,900,000**65,400,000*)7,000,000+)8,000,000*&81,196+)5,100,000**93,200,000+)8,800,000#)mdash;see#+rehy;backed"%-2400$!6',
+    '$\'rranged$$sean#%built#&canada$&entral$&hinese#(financed$"mc#$gulf#\'hungary##ibm$)dentified$#raq#%label#(national',
+    '#)organized#*regulation%&sident$"un#&soviet$\'tandard$)ubsidised"#/ce#$gatt##hse#%japan#$nato##weu"#28c#!b',
+    '""4p""50"(83/12ax7""99""ae#$lles$#pon#"rt#!s"$c83s##ard#!c#,ellentissimi$!n%*&rehy;tric',
+    '#!i#!l$2&eacute;siastiques$!e%"s.&/hare/tewkesbury\'#ill&\'i&aelig\'%archs+!y(!s)4tical&rehy;political.*-political.!l,#ism',
+    '\'"is\'*ologically&,ton/computer)$ians##oti$"vi#!u$!p"\'dysiast"$erit#*umenically""ga#$bald$#urh"%handi',
+    '$%varri%!e#!e$"cs$&idoros$\'krateia(#ids$$lles%$oned$$nard$&verias\'*r&iacute;a(!y$%zeaux#$ibey',
+    '%&ochloa+!-\'%occus(#rys&)derm-like*"s.&"id((.bearing("ea&!s\'$pora%"us##lin#\'miadzin#%nical',
+    '#"o-%#box%+cardiograph&%licks%)distorted&&oppler%\'effects%&filled%(machines%&planar&(roducing%(sounders$+cardiograms$%ed-up$$ings',
+    '%#ess%(ocation\')#ors$&praxia$#rec$\'sounder+!s$$they$!y"$iron#"tb$"on&"is#!v"%kardt',
+    '#$dorf##els$&nbrech%"er%%stein*.&ndash;crowley$%rsall&$hall$!s$"tt#7hardt-grammatt&eacute\'s1!e#%lands$!e%!s',
+    '#%ofisk#%steen%#ock#!y"*l&eacute;e#&aireur$%mpsia$#num$$stic$)t&mdash;i%!s#!d#&ectics&"ro#"ip',
+    '%)tic-plane#&ogites\'"ic%#ues$$sion#"ub"#mra"%nomic"*o-auditing%$ware$\'bananas$+catastrophe%&itizen+!s%$lass',
+    '&&ncerns%%risis$)discourse%#ork&$sing$$echo%%nergy$+fashionable$$huts$$logy$*management%$ovie$"ok$#pac%%ilots',
+    '%\'roducts$)sensitive%\'mugness%%ocial&#und)#ers)"ly$%taxes%(errorism%)rendiness$)vandalism#!1#!b$\'alances#\'climate',
+    '#$disc#"es#&forest$#uel#\'genetic#!l$#ars$$e(s)$!i%#rix$\'lection$1o&mdash;ecologist%"-j%,gically-dead-\'fragile',
+    '.%inded-\'ruinous-&unique\'$ques\'#ste),s-greens-are&\'y-based(&minded\'./environmental$$ytes#!m$%etric$)mendation$#omy%$nies',
+    '/!o$%/soc.(#ial)"ol$!e$%momic$*o-matrixes%(climatic%"mi\'1c&mdash;financial("--)(activity*)ssistance)\'capital**onvergence',
+    '),growth-based)*orientated)+performance*%olicy*-racticability))technical(!.(!/)+econometric)(monetary),productivity(+ally-active-(damaging.,isadvantaged-)motivated',
+    '-&rather0%ional.&eliant-(troubled-&viable*!y(+o-political(+s--together*$alan*\'defying*%style)+/technology("us\'#des\'!e',
+    ')-/diseconomies\'$ques\'$sers((t-driven**researcher*&writer)!.)*/financial*-statisticians&#oic\'#sis&"uy&*y&mdash;in\'!\'\'(-halting',
+    '((oriented(\'related(+subsistence((watchers)"ho)\'recking\'".i\'+/production%#nic%!r#%onmic#)political$&roduct$(schology#\'rcheurs',
+    '&$mspi&$ncoi&$psti&$xmai%&/bamhi#!s$#pan$$sais(!e$#tar$)ystematic#$tage%!x$%ec-v6$$ones',
+    '%&urists%+xicological&(ological$$rade%"in$$ypic#%valve#-was-installed\')sponsored#*zoologists"#r90##e-1%!3%!4#$ivez',
+    '#!m#!o$)-gnothics$!s$"yd#*u-coloured""s-#!a#3c&mdash;established$,-established#\'ervices#%tasis&)y-induced(\'related%$tics',
+    '#"es#)hpwethion#"o-%)parasites$%derm.$&enzyme$+mycorrhizae.!s$"na$)parasitic%(lacental%(terygoid#&ropion#!s##ual',
+    '#\'/dollar$"lu$%month#%1,150%#200%#580$5.00=us&dollar;1.37255%!4%!5%!8$&00,000%!8&$,600%!m$"10',
+    '%%1,370$%2,680%".3$*37,000,000$!4%".7%!6$!5%$,300%".5%!0$%6,000%)6,000,000$*70,000,000%)5,000,000',
+    '$#=30%)nkr7.9940%1us&dollar;1.134362$74762$92551%207962$40652$68481%355072$90131"41#%2,100%#750%#800$*.4-billion',
+    '%!9$%0,600%!0&$,000%)3,000,000$#1.7$%2,000%)0,000,000$%3,900$!5%!0&$,000$#8.5%)2,000,000##3.5',
+    '$&00,000$%2,150$$3.64$)4,000,000$%5,000)$,000&#350%!5#%4,100%#405$*00,000,000$"25$)8,000,000#!5$$,000',
+    '$".3$%0,000$)2,000,000$"40$%7,600$!m#!6$$,000$".6$*00,000,000$!2%)1,000,000$%5,200$%6,000&#600',
+    '$%7,300#*70,000,000%".5$"13$"85#%8,000%#200$".9$!0$%3,300$#7.5%)0,000,000$%8,000%!0$"bn',
+    '%!0&(,000,000$!5$!m#(adoreans$&torial#\'daorian#$elle#"me%$nics\'#sts#\'nemical#%rious##yer"!v',
+    '#\'acibasi#+ema-related!$d(s)"!+"&-dahab#\'filling#%monds##xrf"#.13#!2#!a#&renate""/d$!e"$1/k2',
+    '"%2/k31"!3#$/k21"$4/k2#!0"%5/k31#!1"%6/k21#!4#!8"$7/k2#!0#!4"#920"4=oucsacknowledgement',
+    '$&pierre#"an#%cious#"in#)phosaurus#!s#"ta#$wick#!x"#bas#+erg-mcenroe&!s#%urton"$caad#!f',
+    '"(d&eacute##els$(n/family#\'ication$"e\'%#(6)$!n%!e%0gton-finkelstein*\'limited$%sbury)!.##oll&!s$!n',
+    '#%rizzi#)y-current%$like%&shaped$$line""ed#$iman#"la$%berto%%rande$"in$$mans%#iro$$nand$8sborough/buckinghamshire',
+    '$,weisspiraten#(nborough$%glass$%idery$$note$&tulous#*r-victoria$"er%"si$#ney$!y""f.#(ax-based#8u&ndash;esna&ndash;luxor"+gar/protest',
+    '#%combe$$umbe#*e-enhanced,$ment%\'jointed%/of-the-envelope%\'to-edge($face\'"ne&$rack\'\'iggered%\'working$#.in%)tensioned%$when',
+    '%)economist$#alt$&baston%&orough$-d-woodworking$$wood&*rth-bowley)%stown#-ington/centre$"va##ren#%worth",iacaran-type#+ble-fruited\'&leaved',
+    '%$yshn$*i&oacute;n$#tum#\'e-hullo#)fications$&yingly#%lizie#\'n-borow$)a/bosnian$$boro(!\'%$rugh%#ugh&"rg(&-based',
+    '0#was))-aberdeen*&dunbar*$king*)newcastle*%paris*)qualified*+rome-london*-wick-kirkwall)#.21)!/*(aberdeen*+heriot-watt**kilmarnock*%local',
+    '**midlothian*%north*(scottish)$ians)!s$"fo$&gburgh%"er##ppo#(son-swan\'$type$#wan#+t-in-camera%#out$./compile/debug',
+    '$\'hatcher%$mead$(ing-down()on-screen((transfer\'!s%%on(s)\'1-impression-issue\'#ers\'#ing$!o%$r(s)&!-\'$less\'\'reviser',
+    '\'\'printer&*:composers&\'ialised+"ts*&zation+"ed\'(ncluding&%ship.$!r##vio#%works#%zioni"%jupci"!l#"an',
+    '$$hoff$%sboro%$tein&#one$%weiss$+y/transport##ine%,gton/trading#"lb#!m#"ow#\'und/eeg"0m&eacute;-pierre#$arsh#!e',
+    '#&inston#\'ondsley\'$town%#ion%$sley&"on&*ton-zagreb%!t&\'osaurus#!s#(undbyers&!i&\'s-based\'!.\'"en',
+    '%!t"\'na-like$\'isation$!m$!n##bro#!e$+y/transport"$oard#"ga#"ni#"ra#&uard-i"!r#"ic',
+    '#(ophonium##ych"%s-200$&bedaux#$ells#"iv#$tone#"ul#"vs"%ta-1%$".4$$/sds#!n#"ra"%uadro',
+    '#,ca&rehy;tion%$cion%%dores%$ted\'\'"es&"ic\'#on*))-business*0of-the-whole-man+)rientated*\'thirsty+2raining-employment*$wise)!.*/1984&ndash;1986',
+    ')!/*%basic+\'usiness*)full-time*&lessen**production*%rites*&social*-understanding**vocatinoal0$onal*%world*#yet)%_with)(al-grant',
+    '+)/computer,(economic,#fun,$home,&social,.training/youth+)functions++ly-damaging.)subnormal./underprivileged+!s\'"va&$onal\'/r-into-business(+s/promoters',
+    '#3lie&ndash;juniperus#%mundo##net##sei#\'tainers"!v#,-anwendungen$\'systeme#"ac#&enture""wa$$lton$)rd/johnny&!i\'\'an-ball',
+    '&!o&*s-knighton\'+/consultant()dubrovnik(\'kington(&mother(&parent)*itt-rivers((scotland(&tenant)"he)&rainer)"uc(\'veteran(#war',
+    '&"us#$eard$"ll#,ick/children##ord##yna"$yone#"th%!e"$zell#"oa!"e2#"10"!3"!4',
+    '$!2$!8$!9"!_"%aahoo#!c")b-related"3c&mdash;established#)-approved$&backed$\'country$\'derived$+established$!v#%khout',
+    '#)trostatic"$djit#"le#\'ucation"@e-by-god-i\'ve-got-a-stomach-ache#"ee%&eaaahh)#rrh+\'rggghhh&)eaaaaaaaw\'!h%!k$!h$$rrrr#!k',
+    '$#ing#$owww#!r#!s#$ther""g/""hh"#jut"$koff#!y")l-and-pie$&backed$\'fishing$\'handler$$pout',
+    '%$roof$%worms#"co#$drop#(ectively$!s#!l#&stripe"!m#$land"#ncy#"de#%glish"!o"!p',
+    '#\'romming&!s"\'rieness$!s#$rmmm##sel$!t""sh$"al"\'tgerink##her##ing#\'ooklook"$urgh$!k',
+    '"%yaahh"#zit!#f-1$/&agr&middot;gdp%,bgr&bgr\'&ggr%#dgr$#11s#%400sc#%forts#$hand#*one-eleven"%1&ggr#$-11a#"11"!2',
+    '"&ailwen#%molia##nol#"to"!b"+charistoume"#dss"#ect##ndy#!s"*f&ndash;ct#$able#\'eciency(!t%/t\'&rehy;locally',
+    '((nd-cause\'#but\'$gave\'%heavy\'#now\'$size\'$they&#.we&#ed.\'!g&$ive\')$.the)\'/costly)-ly-controlled),ness-centred',
+    ')!y($ness&(s-formed(&hidden)%ungry(\'stunned(#the(*worthiness\'&/mixer)$usic&&uality)!l*"ie(#tes)#ing',
+    '\'"ve$.minate-looking\'%inity(#zed$\'ndowicz$$rick%)vescence\'$$tely&$ness#!f#!i$&cacies(\'ousness("ty%$ency',
+    '%&icency&%ency-+(boosting+(directed+-effectiveness+(inducing+)maximizer+)promoting+(reducing++stimulating*\'/safety(*t-sounding)(ly-built+"/i%#tio',
+    '$!n$#ong#)lorescent$!u%$enct)!s\'+t-treatment%%sions%$vial#$nick##ore%"t-\'&driven\'&either(%nergy',
+    '\'\'related)$ward&".5\'\'richard&-/cost-benefit&#ism\'$tism&(lessness&*s&mdash;or\'*/successes#\'raction%#yer$)ondrement##use%"um',
+    '#!h"!h"&ibanca#!m$!a$%ovich##sio")l-related""me#"tr""na"!p#!n#!s"$rain',
+    '#"on"\'sathiou#!s"!t#0a-czechoslovakia%\'hungary%&israel%&turkey%*yugoslavia##ect$%rnoon#!s$!s"!x!,g&iacute;dio',
+    '#"r/#"s/",a-compatible#$.sys#$/vga#*litaranism(,ian-feminist#"mi#"ns#!r$"ch#!s#"wa"&berink%"th',
+    '#\'o-obong#%ulefu"!d##ell"!e##dee#$rman$$toni\'!s%"ro\'"ic#"st#"th"*f-antibody$*positively',
+    '",g&rehy;shell#(\'n\'cress#*-&amp;-spn$#and\'+&rehy;cress\'&-bacon)+readcrumbed(-chick-minding)$ream+"ss$%based\'#ket%$oxes%\'uilding$(carrying',
+    '%#ell(!s&%ntred%)ollectors%$rate%-um-helicopter&$pful$)detection%#ish%&umping$&eaters$%faced\'$tory%%illed%(ormation',
+    '(!s$)inviolate$0larva-pupa-adult&#yer)!s%#ess$*marketeers%&imicry%\'odeller$&opener(#ing$\'packing&"le%(roducing$)rejection',
+    '%$hape)!s%&itters&"ze%&meared%$pert&(lattered&#oon%*travaganza$)thickened&&rowers%$imer)!s%#ype$#ups',
+    '$&yellow$$zero#!/$$225g$$450g$%bacon$%cream$#fry$%water#\'agerate$!n#&basket$%urger#%cases$&ellent',
+    '\'$able\'#ion$)ilerating%$ting$%upful)!s##ers#%ihard$#jir$"ly$&ngs-on&$tons$"sh##ler%&ssness',
+    '$%ishaw#!o#+s-and-bacon&+s-they-came%)over-easy%+traordinary$)/chicken/%$hens%%sperm$#act$$hape$%plene%&oonful%$ress)#ive',
+    '%,raordinarily.!y&%emely#"um#,white-smooth$#ina"!i#!c#"lo#!n#!t"$land#"er$!s%!e',
+    '#!i$%ntons$#say$%zeaud#"on$&shayle##wys&$bach&%ilian&#wrw"$more#!s"#ner"&o-bass%$oost',
+    '%\'uilding$+centrically%)ompetence$\'defence)$sive&)gradation%(iffusion%%riven$+enhancement$$free%)ulfilment&&nction$(infested&)volvement$$less',
+    '$%mancs$)pampering%%lated$&reward$,satisfaction%)upportive$\'tossery%\'ripping#%/self#4centric/ethnocentric*$ally*#ism#"ic$#sms%%tical',
+    '#$logy#(maniacal)!s#%phony#-resuscitation$"ov#$thon$1ism-&agrave;-deux&$simo&5tical/individualistic##yan""pc#2gc&mdash;guerrilla"!r#%esses',
+    '"$shel"/ton-cum-newland"#usa"(wuchukwu")ypt-based%/ian&mdash;czech(\'-backed)*registered)&soviet*\'peaking*\'udanese*%yrian)\'trained%)o-italian##spt',
+    '"\'ziabher!+h&ndash;101"#-up"$.101"#101#!9""26#!8"!4#!8"#907"%aling#%viour"!b"&co-klm',
+    '""em#!u"+fi-substrat"$icon#!e##lst#"pa"!l#,er&rehy;mann%\'-danlos%(s-danlos#$vest"$mcke"%nbohm#%inger',
+    '"#ren%*breitstein%/feldg&uuml;rtel(!s\'"st%%zweig#&furcht#%hardt&!t#&lichia#$mann#$wald#%yngum"!t!\'i&mdash',
+    '"!-""/r"#5dj"#bar#\'eschutz#"is#"li#"on""cg#*helbergher%%nauer$&hausen%%ormia$#ner$%statt',
+    '#%khoff#(onsanoid$-sapentaenoate+$noic")d-al-fitr$/e-milad-un-nabi%"id#$dwen#\'er-like%!.%&downed%"s.$/tically-removed&#ked#$olon',
+    '$#son"%eieio#!r#!s""ff#\'ionnydd"(gelstein$#man$(n-values%(schaften%%tlich%\'values.$$rman#+hl&iacute;n$-t&ndash;coach',
+    '+&neuron+%piece%2-and-a-half-months\'"rm\'$side&$band($rrel\'#eat($dded)$room("ll\'%urner\'&y-five)$tens&&celled',
+    '\'\'oloured(#unt+!y)#rse\')ubic-foot(%tting&%eight\'&ngined&\'faceted\'%eeder)&t-deep\'\'ingered\')orty-five\'%urrow&*generation',
+    '("rl\'#oal\'"un&&headed\'$orse\'+undred-mile&+in-one-tool(+ch-diameter+$long*"es\'"sh&$knot&#lap\'%etter\'$ight',
+    '\'(ile-long)\'limetre\'%onth-,$long,$olds+!s,$-old&&nation\'$ight&\'officer\'"ne\'$rder\'\'ver-par&%pager(!n',
+    '(%rtner\'$eaks($ople\'$hase\'#int\'$lane\'.ointed-compass+!s(&unders&-quid-a-bottle&%rider("nk\'%ounds(!w&\'session',
+    '*#ted\'#pan\'/quare-kilometre-$mile\'$tone($rand)#oke&#ten)#ths("rm("st\'$hree\'#ime*\'-a-year*)s-married',
+    ')$four(!n)"ne&%under+$-par&\'vehicle&-way-scrolling\'(eek-long\'$heel\'&ickets("ng("re&)yard-high\'-ear&rehy;olds*$-ban',
+    '+(daughter*!s+*&rehy;long+$-old%$.bit&#the%&/three%!e&!e\'5n-and-a-half-year-old)\'century)#day)%forty))inch-high)#lot',
+    '*#ile*%onths)&ninety)&person*#lus)%round))seventies)(thirties.!y++ousand-foot*!o*\'wenties()/nineteen(#ish(!s',
+    '+*nineteenth5$-and+"to*\'century((year-old\'#rth&!r%(h-finals\')magnitude\'%ninth($otes\')of-a-page+&n-inch\'$tone&"ly',
+    '%)month-old%\'panther%,some-reeling%$teen%*y&rehy;two&%-acre\'&column\'#day\'%fifth(%ooter)\'ur-year0$-old\'$line\'$mile)$nute',
+    '\'%pound\'&second(,ix&rehy;room((omething\'&tonner(%wenty)*o-year-old\'$week&$_per##iau$"ts##ler#&nnnngh#"th%#ies',
+    '#!r"$jken#$sden""ka#$ichi#"oh$)noklastes"$land#$berg#!d$#ons#!e$%anach$)en-atkins\'$rose',
+    '$%nberg%#roc$"rs%!t#(i&sacute##len$"ot"&mantas$!s#!i#&ontova#$skip",n&ocirc;llen#!\'##ars',
+    '$#udi#,dhoven-based))/rijswijk#"en$&rseits#,f&uuml;hrung$$ache%"lt$$luss$#uhr#$gang$(eborenen#$horn#*on/tenancy#!s',
+    '$(chlummer$%iedel$%tein\'((-maxwell(!s&\'llungen%(uerzende"%onion"%renic\'"al##ian$!g$"nn##lys"%s-ula',
+    '%(ethernet%$like$!i#&dorfer#$eman$!n%#bad\')hnstrasse%%drath%#ger%0h&uuml;ttenstadt&<ower-dulles-strategic-bomber*!s%\'loeffel%$mann',
+    '##her%!s$#ort#%kanal#"ma%#rks#&ogesis&#tic#%phora#)teddfodic"\'telhans#+her&mdash;a\'%ndash,#;or&((i)solve',
+    '&!.\'%telex\'#who&$/ors&(:payment&)spigotted$!y##zen"\'ulantum"$vind#"or""wa#"se"&zaburo$!n',
+    '#!o!*jaculators#$z-ul$"ul"&ectees%#ive%%ments%#ors#%rcito"$idos"&lersen"#ner"!s!3k&amacr;da&sacute;i"!a',
+    '")ectroloid#!i#$lund##nge$$osen"!g"*hof-buhner"\'ibastuz##den##mov#,n-o-door-oos$(o-sperma$!s#+riyankumbra"%kodal',
+    '#!o"(meleddin"&nomska"(ologesch##ndo#!r#!s"$rund"$sath#%trand""ua#"ku"\'webelam$#nsi##ona',
+    '!/l&eacute;ctrico*(mentaire#/lsqb;93&rsqb;51#,oacute;segui"&\'konin"%(91)5"!-#,aai&uacute;n$$jnaf(\'/mother$&lamein$#mam$#qse$$raba$!s',
+    '$$zhar#$bahr%#nna%#sir%#zaz$#eik%"ji#%chaab#$daim#&fenari$#itr#&galala%!z$$irba$&recoed',
+    '%"wa$!i%%nnawi$#oss$\'ussaini#%jerid#\'karouri$%harga&#tib$(orhadris#\'maraghi$\'enshawy%$shad$#ili$$unim',
+    '#%qarni#&sarrag$&hemali$#tar$%waify#%yassa%$zghi$&ousifi#&zaiyat"#100$"55&$/105("28)!9\'#iii',
+    '""34""84"\'abarate$"or&,ately-carved,(designed,&folded,*structured,&tooled(#ory#&deldi.#%egnus$"is#"fi#!h',
+    '\'#guy#!l##m-1#0n-hero-turned-de%$like$\'cyl/she$#der%!s$!s$$tosh$"us#-phostrongylus#$sica$0mobranchiomorphi,!s',
+    '&%plast%*ic-waisted\'%ising%*okinematic&*plast-pink#%tedly%"ia$#ine%#ons&!r##ura##zar$"ig"#ban#"e.',
+    '$!n$$stan$!t$"us#$orne$$urne$*w-crutches&$deep\'&odging&&grease&%joint&\'patched&$rado&*shuddering#%rus-3',
+    '"#car#$ctcd#!e#"he$"in#!o$"at$\'mb/paul%!e$"nn#%tions"$d-er#(/morrell+!s#%agsen',
+    '##dis#*er-brother&)dominated&)statesman%$care%#kin%$lies&/y-authoritative($care\'%.king("we\')/disabled($sick%#men%$wood',
+    '$\'st-born\'(daughter##ing$!p$$sogi#(o-europa$#nia%$wall$!r%&-sad-o%$ado.#"ra$(ed-evans$"ic%*dge/driver',
+    '%"ge%*tch-bright($ites#,yandiekkickm"+ea&rehy;nor$!l$$n:it&(lauretta&%which\'$ould&#you)!r%#ora$#tic#\'cktrick',
+    '$(t-number&$year%#ant%#ed.&!t%-ion&mdash;due(!\'(%--see)(although)#eve)#law))manifesto)(oriented)*referendum*&igging',
+    '($aire)!l(,eering\'-type+!s($s--a*$that)%.they+%welve)"/1)"in%$onic&+r&rehy;ally\',al/community)#ism(-te&mdash;that',
+    '\'\'s/union\'!y%%rcial&$ibal\'*c-acoustic*"rc)%block)%drill)\'engined)%field)&hauled*#eat)(lighting)$pink+$ping',
+    ')$ring))telegraph(./hydraulically)&petrol(*al-conduit+%goods*$/gas+4mechanical/hydraulic*#751**ly-changed.)ontrolled-&heated-(impulsed-)operating-&raised',
+    '-(shielded-&warmed*-manufacturing((ian/swan)#dad)#te/*#ies*#y**+&-based-$oard,,from-biomass,*generation-\'uzzling,)intensive,)propelled',
+    '-%upply+&/water+\'810,000+$less(#ked(#orp(&s-wise("us(!y\'(fying/of,"ly&.o&ndash;diesel\'0-acoustic/active($band*"rs',
+    ')%leach(+cardiograph3!s*%utery)(hemistry))onvulsion((dialysis*%esels)"uo)&ynamic(.encephalograph6"ic6!y(&fished)#unk',
+    '((harmonix),ydraulically(.immobilisation)#ron(&jolted(+luminescent(-magnetic-like0!s*!n)+echanically)%otive))yographic(,oculographic(+palatgraphy)+hotographic',
+    '),neumatically(+rheological)\'otation(%shock)#lag)%ticks(&tattoo)\'echinal,%nical-%ology(%voice($zinc\'%/acid\')acoustics\'$blot',
+    ',#ing($uses\',cardiographc(,ephalography(%harge).emical-enzymic,%stry..!s()oagulated*!t+#ing)(mpositor)&rtical($uffs)$ting',
+    '\'*de-bearing*\'coating)!.\'+encelograph\'%fence(%ibres)"sh(\'lambeau/!x*"re)#uid($oils)%uling(#unk)$sion',
+    '()enerative(&rafted*"ms*$phic\'"id\'(location(#ube)$mens(#yse+!r*#is.))te-filled+,s&rehy;acids*&ically,!s',
+    '\'%magic*&netics(&edical()icroscopy(\'yograph\'.n-antineutrino5!s))bombarded)\'capture)\'density)&energy)(grabbing)$like*&ucency)+microscopic',
+    '*&ucleus)&phonon*\'osition))radiation*#ich-$ness)%shell.!s*$ized*&tained))to-photon**ransparent*#ype)(velocity*#olt',
+    '(-/antielectron)&proton(!e)*gativities)(utrality(%ially)\'c-based++information+$only+(pressure,)ublishing+(sounding+$type*!a+*lly-heated',
+    '*$kery*)s-related,(to-fruit+#719,"21,"94)#que(*microscope1!y\'#pad(%honic*6resis/electrofocussing,#zed))ysiologic1#sts',
+    '(\'olished)!p)&rating*$esed\'(receptor/!s))tinograms\'!s(%tress\'+therapeutic-!y($ypes*#ing\'#vac)%lence',
+    '\'#way\'#yte&!s%%toral#!d$#one#"e.#&gance.(!s\'#ies\'!y&%t-ish(\'looking((sounding\'-/contemporary',
+    '\'*ly-moulded*&shaped+%uited*(tailored\'$ulus$$ible##igh#"ko$-trizit&auml;t*(atswerke&%oaila\'*mashexport\'#nik)%sches#(lemental',
+    '$!a$-ent&mdash;his.#the\'0-self-expression\'%alist("rs)(y-school\'#s-c)+engineering("/i))sublevels)&themes%"ta$"is#!n',
+    '%"um$+kh&oacute;0#"od$#nex%"or\'"ae\'!e#.phant-catching*#ord)#ear)%grass)%horse)#leg*$orry)#man',
+    ')*of-the-sky))patterned)%tamer*$ooth("es($idae(#oid)#pus("s.)$ized#"ra$!t#(sborough$&ewhere##tha',
+    '%+romeccanica#(usinians$&theria)"us(&ocoque&"ia#*vationally*"ry$+en&rehy;ish&"\'s&\'-a-side\'$beat("it\'$down\'$font',
+    ')#rty\'#man((onth-old\':o\'clock-on-a-fine-night-an\'%place\'%screw($ided\'-thousand-foot(!o)3-thirteen-year-olds\'"up\'&volume\',year-old-son/"s.&./eleven-thirty',
+    '&%pence+*-halfpenny\'$oint&*th-biggest$#ons#"ys"\'f-biter%"ow$"cc$&friend$&ghosts$$hero$$land$$maid(!s',
+    '$%queen$"rc%$ealm$"uo$%woman#"an#$bane#!e$!l$$nnau#)in-formed%!s#%locks"(gabrowny$#ren',
+    '"%hanan##ill"+i&scaron;ka#&-lilly#*abethanism$#ssi$!t%"or#\'cidated##duc#\'e-rudel$#ser#$ffit#*gibilities%!o',
+    '\'$like#"ka$!i#+l-hrair-rah#"ma$\'elechis$%ilech%(nability\'#te-)\'/render##ncs$#or-\'%style#(o-car-is$#t\'s',
+    '&&leavis&/richards-leavis&%style%#ish#$psis%"ot#*s&eacute;e$\'-thomas$$abet%!h%!s$#has$"ka$"on$%salde',
+    '$"ta%*ererrarich%"on#$tair$#e\'.%)-educated&&v-mass%-/eclat/esprit%$ness%"s.$#hie#"ud##val##xon##z.1',
+    '&+e&rehy;than\'"ta()h/glasgow*&methil)!a)!e)#ian%!s$"er$$ondo"&k-hide#$amel$%saite#&enford#%hound',
+    '%#ton#!y"$laby$-dos-exoteriko$#gic$$line$"md%"es$!n%"ds%!g$!r$$uria$(way/west##bee',
+    '&"en%%women$$anor$#dge$$fson$"gy$"ke$!l$*man-jensen$%nbank&#erg)"er&%orgen&"ys%%court',
+    '%#iki%$mere%$sohn$"po$!r%%broek%$idge%$tsen%)y/officer&$corp$&semere%%field%&tadite#*i-markella$"al',
+    '$#e\'s%%smere$$ffee$&ngford&)ton/mills*)strayhorn)"ia%"or$2ot/chairman/carers\'(kidscape&(t-harris($king\'&/honda(&museum(&oxford',
+    '$&pitcal%%se/de%-tic-eccentric()al-shaped(#ity$.s-beto-estelle&%jones%!.%-/conservative\'$rime&&hoople&*instrument&\'milkman%!e&!s',
+    '%,ton/accident*#ged)%peter\'"wn$"tt$!x#%mauer##old$"ra%!y$"uz$#way#$pots#%ridge$#oyd',
+    '#"um#$wein%#lls$%orthy#"yn"(m-carved%$hips$&shaded##ali$!s#\'ensbury&$hawy%!t$!s%&thorpe',
+    '##ina$!r#"ly#"os#$sett#$tree#"yr"*ocutionary)#ist#%esser#(fanerror##gar$"ia#$lhim$$ombe',
+    '$"ix#!n$\'ex-ises$%gases&Bted-labial-sticker-on-guitar-strap)!.\'"um#(quently.#%segui#$uise"\'p-style#"ed#&hgrave)+/stepfather$-ick/historian',
+    '%%nston#!s"\'r-coach#%athia#$emco##ick"\'saghier$$sser#$dale$#ens#+e&mdash;and+$that$$-but%$more%"of',
+    '$!.$(_instead%"on$$beth$%nberg%#ham%\'strasse$%qhere$-vier/pergamon$)where-\'in*%their)!s##hie#!i$"ng',
+    '&!e##net#!o#"pa##tar$#obb%*n/daughter$\'ronwick#&wehere$#ich$%orthy#!y$"ng""ta$!c',
+    '#,h&aacute;rin#(on-speak%$/the#!s"#u96#$ants#\'cidario\'&tionin+!s)"ve##tes#$vial"%valoy$!s#$edon',
+    '%$kind$!y#!i$$dnir$2s-as-hub-cap-thief&%style&*the-pelvis%(h-marked&$ness%!s"(w&eacute#$ells$#sii##ing#%orthy',
+    '#(yn-jones""ya#%miots#"na#"on#$sass$!e%#mat$"ia%"on"#zea!,m&iacute;lio#+rehy;bodied)%raced"!-',
+    '#+barrassment#(er-sorry#%power"!2#%714br""42"(7&flat;5"$able#!c$$iate()d-looking\'#ing(#on.#%ilbag$!n',
+    '$)icipation$#ual%(el-style\'(/costume\'!a\'"la(!e(!i#(rginated#&sotsha"(baixador$\'jadores$$kasi$%llage%"m.',
+    '&$ing.&!s$"nk&*&rehy;ment&$mant$$rass&$zada%+go-breaking)&usting\'!.%$kin\'%%rased($ment(.s&lsqb;es&rsqb)$able',
+    '+#ly.)#in\'+$g-if-(sounding,1/boring/upsetting&%esses$"se%%sador&\'y-level\'$land$(ttlement(!s$#yed##den&)-meyerhof',
+    '($ment&(ing-like%"ed%#gph$&r-eyed&#red%!a%#ing%#ley%#ses&"on$"th$!z%$zles#)itterment',
+    '##l12$$azed&#ons$%edown%&m-poem&!a\'%tical&"ed&$ised#-odi&rehy;ment&#ed.$(ld-clare&%ening%$isms$%somed',
+    '$$tedo%%hrium$\'uchures%"rg\'&eoisee\'(oisement$#wed$%xment#"ra%&cement&$ings%(nchments%\'sse-moi%#tel$"ey',
+    '%+idered-yoke*"ss)$ings)\'y-edged+%frame*0/stitch/textiles&$ling%#oks%$wned$!y%,o-government\')logically&!.&(genesis.&)logically',
+    '&\'nically#!u$"ss#&yronic"#com"#dad$"le"!e#!k#%l\'ian$"ia%!e#"na$&datory%#ing',
+    '%$udes$+ge/relevant&"cy&"d.("20\'-_from_time_to&!n\'#ces($ies.(*y&mdash;to)%-exit*)feedwater*\'service+$peak)!.',
+    '*%panic%$wncy$#ied$&sonian*#ism\'!s$%ville$*y-papering%\'/dinner#(s/thames$!a$!e"&f-atic#+/silverfish#%adlek',
+    '"&i-tape##/us#.grants\'society&$tin\'%"ee#$lies%"os%"us$"le%!y$#yan#"n7$!a%"se$$ency',
+    '%#scu#!p#"ra%*tes-though(!.$!i$$oglu#%sions$"on$.sion-conscious,\'trolled)$free)5inventory/meteorology)*monitoring))reduction',
+    '()s-trading&#ves\'%ities%#ons"!k#"-1#!a$$rate""la##ith#%oyees%$ment#$poys"#m-o#$.sys',
+    '$!.$$jane$$line$\'nnuelle%)uel&mdash("la&\'ilovich&!s%#yel$!s#%brook#$elle$#n-7&!9&%nieuw',
+    '%&dingen%%lauer%%taler$%rland$&sworth$$tten#(ie-emmie$%grate$$nent("ly%)gs/thames$%sions%$sion#!m#!o',
+    '%&sailes#/y-award-winning"#net%!h#%ities%!y"(ollience(#tly&!t#!n#&t1onal$#ape$!e%!s$)ion-based',
+    '(&junkie(&packed)%urged\'!.\'#al\'),/behavioural*0mental/spiritual*(rational)#ist)+ly-balanced,\'chaotic,)demanding-%riven,&packed,\'related',
+    '+!.\'&lessly\'"s.##ugh"$p.no&#(1)##700#$acho%$ombe$&lement$%nadas%&elment$!t%!e%$hies',
+    '&!s#\'ecinado$%docle$$iria$&nnages$%ror\'s\'&-elect((in-exile(?of-peace-and-nations-of-austria($sent)#ize)&layers(%to-be\'%/your\'#ism',
+    '$\'traceae#!h$!a%*&rehy;sise%%asise%$cyte%!s&*es-provide&!i\'"ed\'/s&mdash;perhaps)(rehy;ing(#es.($ing.)!s',
+    '(*ing_rather$$raim$-ysema-related)#and#&i-uchi$&ctured$\'re-line\'*orientated&).building&"s.%%ical.)*/deductive)(ly-based\'%istes\'!k',
+    '\'!s$#sal#!l$\'eadismo%!o&\'mani/1a$!i$%loyee$\'oy-ment&!a&.ed-as-required)\'husband(%/were\'0e&mdash;employer(#(s)',
+    ')(centered)&holder)+involvement)+orientation/"ed)%share.\'holders(+/connection)(employer(,s&mdash;that)#.it)+/candidates*(employee*&pupils)#new',
+    '("\'s((-company)(directed))education)\'friends)+magistrates)(provided)%union(&.based(!/))education)&fellow*%ormer)*magistrate)!s',
+    '*)employees+-stablishments*)landlords+$ocal\'!s(!s&!m\'#cnt\'$ednt(!e("mt(#nt\'*(-centred+&growth+$lead',
+    ',*rientation1"ed+)promotion*%/acas+-directorships+,occupational+(register**technology&"s.#%odium$!r%#iae%(t&eacute$(verished$!y',
+    '%)ss-regent$#ove#&sonian##tae$!i%&ed-out%1ness-that-was-not)!.&!g%"ve$-y&rehy;handed%$(a1)\'"2)\'"3)&#b3)',
+    '\'"2)\'"3)&#z\')%!-&\'glanded&\'hearted&%shell\'\'ounding\'%uited&$ward%$.she%%/full&&nobody%&handed&)eadedness',
+    '#\'urpling#$yrea"%rawde#"eb##ged$#ing#!h##ick"&s/help#$ladn%"nd"#tns",u-enthusiast#&lative&#ory',
+    '&.on-polymerized&"ve#&nctory"$v-23"$yard#!n!+n&ndash;ugh#-rehy;courages(&joying()lightened(%suite"$\'all""-2#$able#\'echelon',
+    '#$mass#&suite.#$tact$&ranced"+/em=&frac12"!1"!4""71"#abl%)e/provoke%-ing/disabling#&chescu$$ted.%#ive%#ors',
+    '+!d\'&coated\'$like&#ler&%s.the$#our#)ntiomorph,"ic,!s\')selective\'+tropes-grey+"ic#&rdeces$#que##tal',
+    '##yas$"es"&bourne#"us"$cafe$$lada$%mping&%ment-$%ntada$!p%\'sidated&(ulation\'-!s*#ors("ed',
+    '$\'rnation$&sement#(ephalins(!o)$gram,$phic.!y)*myopathies(%pathy$!s#$hada%)in&eacute\'!e($ment,!s',
+    '$&illada$%march$%oying$#ufe &fadoul',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_80 = (
+count_80 = 6694
+
+heads_80 = (
     'density-size',
-    'density/multiplexity',
-    'density/unit',
-    'densu',
-    'densum',
-    'densworth',
-    'dent-de-rat',
-    'dent/hop',
-    'dent/mother',
-    'dent/national',
-    'dent/oxon',
-    'dent/stephen',
-    'dent/trading',
-    'dental-care',
-    'dentals',
-    'dentals/alveolars',
     'dentalwork',
-    'dentanurse',
-    'dentatus',
-    'dentelin',
-    'dentergens',
-    'dentex',
-    'dentfert-rochereau',
-    'denthead',
-    'denticles',
-    'dentiform',
-    'dentiger',
-    'dentin',
-    'dentist&mdash',
-    'dentist-type',
-    'dentist/optician',
-    'dentist/optician/chiropodist',
     'dentists.',
-    'dentists/dental',
-    'dentitions',
-    'denton-white',
-    'dentons',
-    'dentoplan',
-    'dentorn',
-    'dentory',
-    'dentrifice',
-    'dentune',
-    'dentureless',
-    'dentzel',
-    'denuclearizing',
-    'denudiation',
-    'denunciator',
-    'denville',
     'denyin',
-    'denys-drash',
-    'denziloe',
-    'deobandis',
-    'deocynojirimycin',
-    'deodato',
-    'deoderizing',
-    'deodorants/antiperspirants',
-    'deodoriser',
-    'deodorising',
-    'deodorize',
-    'deogar',
-    'deogratia',
-    'deok',
-    'deolali',
-    'deomcrat',
     'deomocrats',
-    'deonata',
-    'deontic',
-    'deontology',
-    'deorc',
-    'deorum',
-    'deosil',
-    'deossum',
-    'deoxyadenosine',
-    'deoxycholate.',
-    'deoxygenate',
-    'deoxygenating',
-    'deoxymannojirimycin',
-    'deoxynojirimycin',
-    'deoxynucleotides',
-    'deoxyribonucleotide',
     'deoxythymidine-5\'-monophosphate',
-    'dep5',
-    'depaganisation',
-    'depaganise',
-    'depanments',
-    'deparafinisation',
-    'deparl-mental',
-    'deparment',
-    'deparolles',
-    'depart&rehy;mental',
-    'depart&rehy;ments',
-    'departamentul',
-    'departed.',
-    'departementale',
-    'departization',
-    'departmens',
     'department&rehy;store',
-    'department-',
-    'department-commissioned',
-    'department-specific',
-    'department-style',
-    'department-wide',
-    'department.',
-    'department/activity',
-    'department/oxford',
-    'department/school/division',
-    'departmental/faculty',
-    'departmental/sectional',
-    'departmentalise',
-    'departmentalizing',
-    'departmentally-related',
-    'departmently',
     'departmento',
-    'departmentof',
-    'departments/',
-    'departments/activities',
-    'departments/area',
-    'departments/associations',
-    'departments/heads',
-    'departments/schools',
-    'departments/sections',
-    'departmnt',
-    'departure-time',
-    'departure/',
-    'departure/return',
-    'depaul',
-    'depaula',
-    'depauw',
     'depden',
-    'depeaux',
-    'depen&rehy;dency',
-    'dependancie',
-    'dependence-producing',
-    'dependence/',
-    'dependency\'',
-    'dependency-in',
-    'dependency-through-loss',
-    'dependency/op&rehy;pression',
-    'dependent-clause',
-    'dependent-relative',
-    'dependently-necessary',
-    'dependeth',
-    'dependi',
-    'dependistas',
     'depends-what-you-mean',
-    'depends/solely',
-    'depenedant',
-    'deperdussin',
-    'deperet',
-    'depertment',
-    'depeyrot',
-    'depezay',
-    'dephosphorizing',
-    'dephosphorylate',
-    'dephosphorylates',
-    'depia',
-    'depicted.',
-    'depied',
-    'depigged',
-    'depigmented',
     'depilated',
-    'depilex',
-    'depipped',
-    'depite',
-    'deplan',
-    'depledge',
-    'depletant',
-    'depleter',
-    'deployable',
-    'depoe/coach',
-    'depoisson',
-    'depolarises',
-    'depolarizers',
-    'depoliticise',
-    'depollute',
-    'depolymerizes',
     'depone',
-    'deponents',
-    'deponere',
-    'depopulator',
-    'deportationof',
-    'deportiva',
-    'depose.',
-    'deposit-',
-    'deposit-base',
-    'deposit-feeding',
-    'depositare',
-    'depositaries',
-    'depositary-custodian',
-    'deposited(2,3)',
-    'deposited(4)',
-    'deposited.',
     'depositus',
-    'depostes',
-    'deposuit',
-    'depot-workers',
-    'depotentiated',
-    'depowered',
-    'depowering',
-    'deppeana',
-    'deppei',
-    'depper',
-    'depradations',
-    'depratment',
-    'depre&rehy;dations',
-    'deprecantum',
-    'deprecationis',
-    'depreciation/wear',
     'depreciations',
-    'depreciators',
-    'depres',
-    'depressed&mdash;releasing',
-    'depressed-',
-    'depresser',
-    'depressing-looking',
-    'depressinglv',
-    'depression-hit',
-    'depression:3',
-    'depressurize',
-    'depriva&rehy;tion',
-    'deprivation&mdash;a',
-    'deprivation/cultural',
-    'deprivatory',
-    'deprivileged',
     'deprofessionalisation',
-    'deprofessionalising',
-    'deprofessionalization',
-    'deprogramme',
-    'deprogrammers',
-    'deproletarianisation',
-    'deproteinised',
-    'deproteinizing',
-    'deprotonated',
-    'deps',
-    'depse',
-    'depsipeptides',
-    'depsite',
-    'dept(a10)',
-    'dept-head',
-    'dept.m',
     'depth&mdash;breadth',
-    'depth-averaged',
-    'depth-charge',
-    'depth-charges',
-    'depth-contour',
-    'depth-converted',
-    'depth-defence',
-    'depth-diameter',
-    'depth-interview',
-    'depth-perception',
-    'depth.',
-    'depth.while',
-    'depth/temperature',
-    'depthlessness',
-    'depurinated',
-    'deputa&rehy;tions',
     'deputies&mdash;20',
-    'deputies-elect',
-    'deputizations',
-    'deputy-chairmanship',
-    'deputy-commissioner',
-    'deputy-governors',
-    'deputy-lieutenant',
-    'deputy-lieutenants',
-    'deputy-mayor',
-    'deputy-shepherd',
-    'deputy_in_charge',
-    'dequeen',
-    'dequi',
-    'der-chuen',
-    'der-de-der-de-der',
-    'der-to-shoulder',
     'deracialisation',
-    'deracinating',
-    'deradicalised',
-    'deradicalising',
-    'deradicalized',
-    'derailments',
-    'deran',
-    'derangedly',
-    'derasa',
-    'derasge',
-    'derated',
-    'deratinised',
-    'derb',
-    'derby-',
-    'derby-buxton-manchester',
-    'derby-winner',
     'derby/',
-    'derby/epsom',
-    'derby2',
-    'derbys.',
-    'derbyshire-warwickshire',
-    'derbyshire/',
-    'derbyshire/south',
-    'derealisation',
-    'dereck',
-    'derecognise',
-    'derecognised',
-    'derecognized',
-    'deregionalization',
-    'deregistrations',
-    'dereglation',
-    'deregularization',
     'deregulation/reregulation',
-    'deregulatory/reregulation',
-    'dereh',
-    'dereligionized',
-    'deren',
-    'deren&ccaron;in',
-    'derenne',
-    'dereso',
-    'derestricted',
-    'derevnia',
-    'derevnya',
-    'derfreisch&uuml;tz',
-    'derganagh',
-    'derham',
-    'derig',
-    'derijcke',
     'derilei',
-    'derilict',
-    'derious',
-    'derivati',
-    'derivation.',
-    'derivative(s)',
-    'derivatization',
-    'derivatized',
-    'derivera',
-    'derivitisation',
-    'derk',
-    'derknesse',
-    'derlin',
-    'derm',
-    'derma-optical',
-    'derma-surgery',
     'dermacentor',
-    'dermalogica',
-    'dermatitic',
-    'dermatitus',
-    'dermato',
-    'dermato-venereo-andrologist',
-    'dermato-venereological',
-    'dermatologically-tested',
-    'dermatomycoses',
-    'dermatophilosis',
-    'dermatoses',
-    'dermatosis',
-    'dermatron',
-    'dermer',
-    'dermitze',
-    'dermo-muscular',
     'dermody',
-    'dermogenys',
-    'dermoptera',
-    'dermorphin',
-    'dermothill',
-    'dermovate',
-    'derndan',
-    'derne',
-    'dernhelm',
-    'dernie/meb',
-    'dernie/midlands',
-    'dernieres',
-    'dernin',
-    'dernt',
-    'deroceras',
-    'derogatively',
     'deroling',
-    'derom',
-    'derompompompedom',
-    'derota',
-    'derotation',
-    'derouesne',
-    'derouet',
-    'derounian',
-    'deroute',
-    'derpive',
-    'derramore',
-    'derranville',
-    'derreck',
-    'derrett/cooper',
-    'derrick/ebco',
-    'derricott',
     'derrida-foucault',
-    'derridian',
-    'derrie&egrave;re',
-    'derrieres',
-    'derrik',
-    'derringer',
-    'derrings',
-    'derrington',
-    'derrinstown',
-    'derry-donegal',
-    'derry/londonderry',
-    'derryadd',
-    'derryboye',
-    'derrycarne',
-    'derrychrin',
-    'derrydown',
     'derrygimla',
-    'derryhale',
-    'derrylee',
-    'derrylin-ballinaleck',
-    'derrymore',
-    'derryswood',
-    'derryvale',
-    'ders',
-    'dersely',
-    'dersimonian-laird',
-    'dersley',
-    'derson',
-    'dersu',
-    'dertouzis',
-    'derugulation',
-    'deruta',
     'derv-burner',
-    'derv-sipping',
-    'derval',
-    'derville',
-    'dervish-like',
-    'dervy',
-    'derw',
-    'derwentcote',
-    'derwentwaters',
-    'derwin',
-    'derwinger',
-    'derwinsky',
-    'derx',
-    'deryn',
-    'derynck',
-    'derzhala',
     'derzis',
-    'des&eacute;tatisation',
-    'des-cribes',
-    'des-res',
-    'des-troy',
-    'des-troying',
-    'des/dhss',
-    'des/hmi',
-    'des/hmso',
-    'desa',
-    'desacralises',
-    'desacralization',
-    'desaguliers',
-    'desailly',
-    'desaix',
-    'desalinisation',
     'desalting',
-    'desanctified',
-    'desano',
-    'desanti',
-    'desaraed',
-    'desargue',
-    'desart',
-    'desat',
-    'desaturase',
-    'desaturated',
-    'desaturates',
-    'desaturations',
-    'desbruslais',
-    'desc',
-    'descalent',
-    'descalers',
     'descanted',
-    'descar',
-    'desce',
-    'descendeth',
-    'descendit',
-    'descenmascaremos',
-    'descent-group',
-    'descent-lines',
-    'descent-rate',
-    'deschamp/camp',
-    'deschanel',
-    'deschoolers',
-    'descibe',
-    'descibed',
-    'descibing',
-    'desciples',
     'desclaux',
-    'desclerotized',
-    'desco',
-    'descoping',
-    'descoteaux',
-    'descr',
-    'describedby',
-    'describes.',
-    'descries',
-    'descrip&rehy;tion',
-    'descrip.',
-    'descriptif',
-    'descriptio',
-    'description&mdash;in',
-    'description-prediction',
-    'description-types',
     'description/',
-    'description/specification',
-    'description/transfer',
-    'descriptions\'',
-    'descriptions.',
-    'descriptions/interpretations',
-    'descriptive-inductive',
-    'descriptivism',
-    'descriptivists',
-    'descruction',
-    'desctibed',
-    'desctruction',
-    'deseart',
-    'deseases',
-    'deselecting',
-    'deselects',
     'desenboluer',
-    'desenrasca',
-    'desensitise',
-    'desensitizing',
-    'desenvolvimento',
-    'desequilibre',
-    'deserere',
-    'desert-adapted',
-    'desert-camouflage',
-    'desert-covered',
-    'desert-flower',
-    'desert-hardened',
-    'desert-rat',
-    'desert-stained',
-    'desertland',
-    'deserv',
     'deserver',
-    'deservingly',
-    'desexed',
-    'desexualizes',
-    'desexualizing',
-    'desferroxamine',
-    'desfoutre',
-    'desgeorges',
-    'desgraupes',
-    'deshabill&eacute;e',
-    'deshabille-toi',
-    'deshapremi',
-    'deshelving',
-    'desherit&eacute;e',
-    'deshima',
-    'deshiscence',
     'deshnok',
-    'deshprabhu',
-    'desiatiny',
-    'desic',
-    'desider',
-    'desidera\'',
-    'desiderated',
-    'desiderates',
-    'desideratus',
-    'desidero',
-    'desiend',
-    'design&copy',
-    'design\'',
-    'design-',
-    'design-assistant',
-    'design-built-and-operate',
     'design-by-committee',
-    'design-centred',
-    'design-disc',
-    'design-generated',
-    'design-languages',
-    'design-office',
-    'design-professionals',
-    'design-speciality',
-    'design-to-manufacturing',
-    'design-type',
-    'design-your-own-holiday',
-    'design.and',
-    'design/cost',
-    'design/drafting',
-    'design/project',
-    'design/style',
     'design1790&ndash;1840',
-    'design_as',
-    'designatronics',
-    'designatum',
-    'designbase',
-    'designed&mdash;to',
-    'designed\'',
-    'designed-for-primo-carnera',
-    'designed-to-appeal',
-    'designedly',
-    'designees',
-    'designer-',
-    'designer-clothes',
-    'designer-conscious',
-    'designer-creased',
-    'designer-expensive',
     'designer-gardener',
-    'designer-green',
-    'designer-jacketed',
-    'designer-letterer',
-    'designer-makers',
-    'designer-manufacturer',
-    'designer-monogrammed',
-    'designer-plaster',
-    'designer-producers',
-    'designer-selected',
-    'designer-soul',
-    'designer-suited',
-    'designer-wear',
-    'designer.',
-    'designer/builder/decorator',
-    'designer/director',
     'designer/driver',
-    'designer/printer',
-    'designer/producer',
-    'designer/stylist',
-    'designer/user',
-    'designerisms',
-    'designerly',
-    'designershop',
-    'designerwear',
-    'designes',
-    'designfiles',
-    'designinformation',
-    'designing/prototyping',
-    'designw.pcx',
-    'designworkshop',
-    'desilla',
     'desilt',
-    'desinens',
-    'desio',
-    'desipere',
-    'desipience',
-    'desipte',
-    'desipur',
-    'desir&eacute',
-    'desirabilities',
-    'desirability&mdash;behind',
-    'desirableness',
-    'desirand',
-    'desire-breaching',
-    'desire-clouded',
-    'desire-darkened',
-    'desire-lines',
     'desire-motivated',
-    'desire/',
-    'desire/impossibility',
-    'desire/need',
-    'desire/people',
-    'desire/subjectivity',
-    'desireless',
-    'desireth',
-    'desiring-can',
-    'desirs',
-    'desista',
-    'desjenigen',
-    'desk&rehy;based',
-    'desk&rehy;clerk',
-    'desk\'',
-    'desk-attached',
     'desk-based',
-    'desk-computer',
-    'desk-console',
-    'desk-diary',
-    'desk-drawer',
-    'desk-high',
-    'desk-jockey',
-    'desk-jockeys',
-    'desk-pounding',
-    'desk-propping',
-    'desk-set',
-    'desk-side',
-    'desk-sitting',
-    'desk-sized',
-    'desk-study',
-    'desk-tank',
     'desk-to-desk',
-    'desk-tops',
-    'desk-toys',
-    'desk-work',
-    'desk.simon',
-    'desk/hot',
-    'deskill',
-    'deskilling/upskilling/economics',
-    'deskman',
-    'deskpros',
-    'desksides',
-    'desktalk',
-    'desktech',
-    'desktop-j',
-    'desktop-to-datacentre',
-    'desktop-to-mainframe',
     'desktop/deskside',
-    'desktop/workstation',
-    'deslon',
-    'desloughed',
-    'desludging',
-    'desmarere',
-    'desmarest',
-    'desmarets',
-    'desmet',
-    'desmiers',
-    'desmodus',
-    'desmoiselles',
-    'desmoisselles',
-    'desmondo',
-    'desmoplastic',
-    'desmoret',
     'desmosomal',
-    'desmotomy',
-    'desmoulia',
-    'desmoulins',
-    'desmovilizaci&oacute;n',
-    'desn',
-    'desolaci&oacute;n',
-    'desolate-andmisunderstood',
-    'desolating',
-    'desolations',
-    'desolato',
-    'desolaton',
-    'desolder',
-    'desorber',
-    'desorbs',
-    'desoto',
     'desoxynojirimycin',
-    'desoxyribosenucleic',
-    'desoys',
-    'despa',
-    'despair.the',
-    'despair/existentialism',
-    'despaired-of',
-    'desparetely',
-    'despartie',
-    'despatch-boat',
-    'despatch-box',
-    'despatch-riders',
-    'despatch-riding',
-    'despatched/',
-    'despatchers',
-    'despatches.',
     'despatchment',
-    'despax',
-    'despeignes',
-    'desper',
-    'desperantium',
-    'desperate-',
-    'desperate-for',
-    'desperate-seeming',
-    'desperate-to-sleep',
-    'desperately-ill',
-    'desperately-sought',
-    'desperately.',
-    'desperateness',
-    'desperations',
-    'desperatly',
-    'desperd',
     'despinis',
-    'despiritualizing',
-    'despis',
-    'despiser',
-    'despisers',
-    'despiseth',
-    'despite-everything',
-    'despitefully',
-    'despoilation',
-    'despoilment',
-    'despoliations',
-    'despondancy',
-    'despondent&ndash;y',
-    'desportes',
-    'desposited',
-    'despositions',
     'despressingly',
-    'desq',
-    'desquamative',
-    'desribed',
-    'desrosiers',
-    'desroyed',
-    'dess-beech',
-    'dessay',
-    'desse',
-    'dessease',
-    'dessein',
-    'desserbil',
-    'dessert-plates',
-    'dessert-spoonful',
-    'dessertfork',
-    'dessertknife',
     'dessi',
-    'dessikarb',
-    'dessler',
-    'dessoulavy',
-    'desta',
-    'destabalising',
-    'destalinise',
-    'destalked',
-    'destec',
-    'destep',
-    'destigmatise',
-    'destigmatizing',
-    'destina',
-    'destination&rehy;sanson',
-    'destination/waypoint',
-    'destiny&ndash',
     'destiny\'',
-    'destiny-on-sparc',
-    'destivelle/stefan',
-    'destock',
-    'destoolment',
-    'destop',
-    'destory',
-    'destorying',
-    'destra',
-    'destraction',
-    'destrained',
-    'destransformed',
-    'destressers',
-    'destroyd',
-    'destroyer-class',
-    'destroyer-escorted',
     'destroyer-in-chief',
-    'destroyin\'',
-    'destruc&rehy;tion',
-    'destruccioun',
-    'destructability',
-    'destructavision',
-    'destruction/creation',
-    'destructionn',
-    'destruxins',
-    'desublimated',
-    'desublimates',
-    'desublimation',
-    'desuggest',
-    'desulfomonas',
-    'desulfotomaculum',
-    'desulfovibrios',
     'desulphate',
-    'desulphating',
-    'desulphatng',
-    'desulphurise',
-    'desulphurised',
-    'desulphurize',
-    'desulphurizing',
-    'desuper',
-    'desvalli&egrave;res',
-    'desvallievres',
-    'desy&mdash;democratic',
-    'desynapsis',
-    'desynchronization',
-    'desyre',
-    'desyres',
-    'det&formula',
     'det-insp',
-    'detabla',
-    'detach&rehy;ment',
-    'detachable/adjustable',
-    'detacthed',
-    'detail&rehy;ing',
-    'detail\'',
-    'detail-minded',
-    'detailers',
-    'detailing.',
-    'details&mdash;confirmation',
-    'details&mdash;whether',
-    'details-whatever',
-    'details.pc.',
-    'details/brochure',
-    'details/demos',
     'details/error',
-    'details_such',
-    'detainable',
-    'detained.',
-    'detangles',
-    'detchon',
-    'detct',
-    'deteachment',
-    'deteced',
-    'detecta',
-    'detectible',
-    'detection.',
-    'detective&rehy;constable',
-    'detective&rehy;sergeant',
-    'detective\'',
-    'detective-chief',
     'detective-inspectors',
-    'detective-sergeants',
-    'detective-story',
-    'detective-story-like',
-    'detecton',
-    'detector\'',
-    'detector-found',
-    'detector.',
-    'deteioration',
-    'detek-1-hrp',
-    'detel',
-    'detencao',
-    'detented',
-    'detents',
-    'deter&rehy;ministic',
-    'deter-',
     'deter-mined',
-    'deterent',
-    'detergent-bottle',
-    'detergent-free',
-    'detergent-like',
-    'detergent-proof',
-    'detergent-released',
-    'detergent-stable',
-    'deteri-oration',
-    'deteriate',
-    'deterink',
-    'deterioated',
-    'deteriora',
-    'deteriora&rehy;tion',
-    'deteriorated\'',
-    'deterioration/illness',
     'deterioriate',
-    'determ&rehy;nined',
-    'determent',
-    'determin',
-    'determinals',
-    'determinant.',
-    'determinatio',
-    'determination/motivation',
-    'determinationes',
-    'determinationthree',
-    'determined-impossible',
-    'determineth',
-    'determinism.',
-    'determinisms',
-    'determinted',
-    'deternined',
     'deternmined',
-    'deteroriation',
-    'deterr',
-    'deterrence&rehy;through-symbolism',
-    'deterrence-by-threat-of-retaliation',
-    'deterrent-sized',
-    'deterrent/luxury',
-    'deterring-effect',
-    'detetives',
-    'deteyned',
-    'dethermaliser',
-    'dethick',
-    'dethis',
-    'dethlac',
-    'dethloff',
-    'detholiad',
     'detillin',
-    'detiorate',
-    'detling',
-    'detlof',
-    'detmar',
-    'detmers',
-    'detonation-resistant',
-    'detory',
-    'detotalisation',
-    'detotalization',
-    'detotalized',
-    'detotalizes',
-    'detours/variations',
-    'detoxes',
-    'detoxication',
-    'detoxifier',
     'detoxifiers',
-    'detoxifies',
-    'detoxing',
-    'detpradiyut',
-    'detractive',
-    'detransforming',
-    'detrended',
-    'detrending',
-    'detribalised',
-    'detribalized',
-    'detriment.',
-    'detritus-eating',
-    'detritus-feeding',
-    'detroit-',
-    'detroit-made',
-    'detroit/nyc',
     'detroiter',
-    'detroitmumble',
-    'detroitphile',
-    'detrovyllan',
-    'detskoye',
-    'detterman',
-    'dettifoss',
-    'detumesces',
-    'detumescing',
-    'detuner',
-    'detunes',
-    'deturpit',
-    'detweiler',
-    'detwiler',
-    'deu',
-    'deucalion',
     'deuchars',
-    'deuddwr',
-    'deuel',
-    'deuices',
-    'deums',
-    'deunionisation',
-    'deupan',
-    'deupanhome',
-    'deuqua',
-    'deurle',
-    'deurloo',
-    'deurzen-smith',
-    'deus-ex-machina',
-    'deusser',
-    'deusto',
-    'deutchmark',
     'deutchmarks',
-    'deuteragonist',
-    'deuterated',
-    'deuterium-substitution',
-    'deuterocanonical',
-    'deuterochloroform',
-    'deuteromelia',
-    'deuteronomic',
-    'deuteronomist',
-    'deuteros',
-    'deuteroxide',
-    'deutsch&rehy;marks',
-    'deutsch-ostafrikanische',
-    'deutschewerkbund',
-    'deutschlands.',
-    'deutschlandsender',
     'deutschmann',
-    'deutschmark&mdash;not',
-    'deutschmark-dollar',
-    'deutschmark-dominated',
-    'deutset-orient',
-    'deutsher',
-    'deutzia',
-    'deux-chevaux',
-    'deux-s&egrave;vres',
-    'dev&amacr;dhideva',
-    'dev&imacr',
-    'dev&scedil;irme\'',
-    'dev-',
-    'dev-eloped',
-    'dev-sol',
-    'dev.ed.',
     'dev.time',
-    'deva/one',
-    'devaas&uuml;ren',
-    'devalorisation',
-    'devalorized',
-    'devaluation-to-match',
-    'devalued.this',
-    'devaluings',
-    'devalution',
-    'devan',
-    'devanagari',
-    'devanahalli',
-    'devar',
-    'devas/former',
-    'devascularised',
-    'devaststaed',
     'devcom',
-    'devdisvatn',
-    'devegetated',
-    'deveined',
-    'devel&rehy;ops',
-    'develekanovo',
-    'develo',
-    'develop&lsqb;ed&rsqb',
-    'develop&lsqb;s&rsqb',
-    'develop-man',
-    'develop/keep',
-    'developability',
-    'developed-country',
-    'developed.two',
-    'developed_a',
-    'developer-come-oem',
     'developer/builder',
-    'developer/building',
-    'developer/integrator',
-    'developer/producers',
-    'developers-oriented',
-    'developers.',
-    'developing-see',
-    'developm',
-    'development&mdash;ibrd',
-    'development*',
-    'development--one',
-    'development-aid',
-    'development-mad',
-    'development-oriented',
-    'development-trans',
-    'development.',
     'development.e',
-    'development/consideration/review',
-    'development/fund-raising',
-    'development/integration',
-    'development/literacy',
-    'development/role',
-    'development/service',
-    'development/structure',
-    'development/transformation',
-    'developments-someone',
-    'developments.3',
-    'developpe',
-    'deven',
-    'devenant',
-    'devenay',
-    'devendra',
     'devenney/families',
-    'devenport',
-    'devensian',
-    'devenu',
-    'devenue',
-    'deveolution',
-    'deverbalized',
-    'devere',
-    'devereaux',
-    'deveria',
-    'deveriis',
-    'devestated',
-    'devestation',
-    'devetsil',
-    'devia',
-    'deviant\'',
     'deviation-theory',
-    'deviation.',
-    'deviation=',
-    'deviationism',
-    'deviators',
-    'device-and',
-    'device-definition',
-    'device-specific',
-    'device/path/file',
-    'device=display.sys',
-    'device=smartdrv.sys',
-    'devicenotselectedtimeout=15',
-    'devicto',
-    'devienne',
-    'devika',
-    'devil\'s-food-cakes',
     'devil-',
-    'devil-breath',
-    'devil-cat',
-    'devil-damned',
-    'devil-dance',
-    'devil-dark',
-    'devil-doll',
-    'devil-frenchman',
-    'devil-like',
-    'devil-loving',
-    'devil-made-flesh',
-    'devil-mask',
-    'devil-may-care-image',
-    'devil-sent',
-    'devil-take-the-hindmost',
-    'devil-woman',
     'devil-you-know',
-    'devilbiss',
-    'devilish-looking',
-    'devilish-sounding',
-    'devillar',
-    'devillife',
-    'devills',
-    'devils-bit',
-    'devinder',
-    'devine/rc',
-    'devine/wife',
-    'devineaux',
-    'devinka',
-    'devisal',
-    'devisings',
-    'devisive',
     'devisor',
-    'devita',
-    'devitalise',
-    'devizes-westminster',
-    'devlin-',
-    'devlop',
-    'devloping',
-    'devlopment',
-    'devlopments',
-    'devlops',
-    'devolopers',
-    'devolu&rehy;tion',
-    'devolu-tion',
-    'devolutionists',
-    'devon-based',
-    'devon-born',
     'devon.shire',
-    'devon/cornish',
-    'devondale',
-    'devonian-lower',
-    'devonian/carboniferous',
-    'devonport-based',
-    'devonsher',
-    'devonsis',
-    'devoravit',
-    'devorgilla',
-    'devot&eacute;e',
-    'devotees.',
-    'devotio',
-    'devourers',
-    'devouringly',
-    'devoyde',
     'devoyrah',
-    'devra',
-    'devries',
-    'devswap',
-    'devswap.com',
-    'devysed',
-    'dew\'',
-    'dew-and-moonbeam',
-    'dew-beaded',
-    'dew-covered',
-    'dew-drenched',
-    'dew-fall',
-    'dew-gemmed',
-    'dew-like',
-    'dew-picked',
-    'dew-point',
     'dew-pond',
-    'dew-raked',
-    'dew-washed',
-    'dew-wet',
-    'dew/due',
-    'dewani',
-    'dewanji',
-    'dewantoro',
-    'dewar/shadow',
-    'dewater',
-    'dewatered',
-    'dewaxing',
-    'dewball',
-    'dewberries',
-    'dewberry',
-    'dewdney',
     'dewdrop2',
-    'deweerdt',
-    'dewei',
-    'dewesbury',
-    'dewey-based',
-    'dewey/met',
-    'dewhurst/gloucestershire',
-    'dewhurst/vicar',
-    'dewired',
-    'dewirements',
-    'dewiring',
-    'dewjee',
-    'dewlaps',
-    'dewlike',
-    'dewlish',
-    'dewoitine',
     'deworm',
-    'dewponds',
-    'dex-o-tex',
-    'dexadrin',
-    'dexco',
-    'dexeter',
-    'dexi-',
-    'dexpo',
-    'dext',
-    'dextarosatory',
-    'dexter-kerry',
-    'dexter/finance',
-    'dexter/financial',
-    'dexter/grant',
-    'dexter/hospital',
-    'dexter/writer',
     'dexteram',
-    'dextrin',
-    'dextro',
-    'dextrocardia',
-    'dextromoramide',
-    'dextropropoxyphene',
-    'dextrose.',
-    'dexy\'s-clones',
-    'deydrogenase',
-    'deye',
-    'deyes',
-    'deyhrdation',
-    'deylaud',
-    'deyman',
-    'deyna',
-    'deyns',
     'deyrnged',
-    'deysbrook',
-    'deysel',
-    'dezalay',
-    'dezayi',
-    'dezhan',
-    'dezhurnaya',
-    'deziel',
-    'dezo',
-    'dezsoe',
-    'dezzman',
-    'df-down/feather',
-    'df.s',
-    'df1',
-    'df11',
-    'df11.8',
     'df110',
-    'df13.7',
-    'df17',
-    'df=1064',
-    'df=16',
-    'df=19',
-    'df=2305',
-    'df=35',
-    'df=39',
-    'df=57',
-    'df=6',
-    'df=9',
-    'dfd-derived',
-    'dfe',
-    'dfesire',
-    'dfetective',
     'dff',
-    'dfl.1',
-    'dfl.1&ndash;1.5',
-    'dfl.1,250',
-    'dfl.1.2',
-    'dfl.10',
-    'dfl.10,000',
-    'dfl.100',
-    'dfl.12,500',
-    'dfl.120,000',
-    'dfl.130,000',
-    'dfl.15,000',
-    'dfl.150,000',
-    'dfl.17',
-    'dfl.2',
-    'dfl.2.8',
     'dfl.200&ndash;300,000',
-    'dfl.215,000',
-    'dfl.270,000',
-    'dfl.36,000',
-    'dfl.4.2',
-    'dfl.40&ndash;60,000',
-    'dfl.414,000',
-    'dfl.45',
-    'dfl.50',
-    'dfl.50,000',
-    'dfl.65,641,000',
-    'dfl.7.5',
-    'dfl.80&ndash;120,000',
-    'dfl.l75',
-    'dfl126,500',
-    'dfl16,100',
     'dfl28,000',
-    'dfl50m',
-    'dfl8/dfl12,000',
-    'dfl80,000&ndash;120,000',
-    'dflb',
-    'dfms',
-    'dfp**',
-    'dfp-128',
-    'dfrk',
-    'dfskd',
-    'dfvlr',
-    'dfw',
-    'dg-11',
-    'dg-ship',
-    'dg-ux',
-    'dg/07/90',
     'dg/sa',
-    'dg13',
-    'dg427766-2',
-    'dg59,400,000',
-    'dgdf&amp;sharp',
-    'dge',
-    'dghajjes',
-    'dgi',
-    'dgiii',
-    'dh&amacr;ma',
-    'dh&eacute',
-    'dh-82as',
-    'dh-dacron',
-    'dh.1',
-    'dh.15',
-    'dh.60s',
     'dh.83',
-    'dh.86',
-    'dh.91',
-    'dh1,810',
-    'dh11,872',
-    'dh14,978',
-    'dh15,645',
-    'dh155,600,000',
-    'dh16,400',
-    'dh2',
-    'dh3',
-    'dh4',
-    'dh666,700,000',
-    'dh667,000,000',
-    'dha-run',
-    'dhabi-dubai',
     'dhabi/al',
-    'dhac&ndash;nicra',
-    'dhagamwar',
-    'dhah',
-    'dhahran1',
-    'dhahran3-21',
-    'dhahran4-4',
-    'dhai',
-    'dhal',
-    'dhalia',
-    'dhalit',
-    'dhallagiri',
-    'dhals',
-    'dhamal&agrave',
-    'dhamma-guard',
-    'dhamma-king',
     'dhamma-man',
-    'dhammapada',
-    'dhanesha',
-    'dhanna',
-    'dhansak',
-    'dhar',
-    'dharams&amacr;l&amacr',
-    'dharhan',
-    'dhari',
-    'dharker',
-    'dharmadasa',
-    'dharmala',
-    'dharmasakdi',
-    'dharmasena',
-    'dharmawardena',
-    'dharwar',
     'dharwars',
-    'dhater',
-    'dhawan',
-    'dhc&ndash;1',
-    'dhc&ndash;3',
-    'dhc&ndash;4t',
-    'dhc-2',
-    'dhc-5',
-    'dheen',
-    'dheli',
-    'dhenki',
-    'dhew',
-    'dhiban',
-    'dhifallah',
-    'dhimiter',
-    'dhingra',
     'dhirendra',
-    'dhiyab',
-    'dhj',
-    'dhjerzinsky',
-    'dhladhla',
-    'dhlamini',
-    'dhlomo',
-    'dho',
-    'dhobied',
-    'dhoble',
-    'dhofaris',
-    'dhoka',
-    'dhole',
-    'dhomhnuill',
-    'dhomnaill',
-    'dhondrub',
     'dhoondiah',
-    'dhorcha',
-    'dhot',
-    'dhr.210.10',
-    'dhronachalam',
-    'dhss-funded',
-    'dhss/doe',
-    'dhss/esrc',
-    'dhss/nhs',
-    'dhss/ssrc',
-    'dhu\'l-hijja',
-    'dhubh',
-    'dhubhghaill',
-    'dhuit',
-    'dhuramoolan',
-    'di&aacute;rio',
     'di&aacute;s',
-    'di&oacute;genes',
-    'di\'mond',
-    'di-2-xxxx',
-    'di-acid',
-    'di-amine',
-    'di-bromide',
-    'di-dc',
-    'di-iron',
-    'di-isocyanate',
-    'di-marzios',
-    'di-meo',
-    'di-methacrylate',
-    'di-nickel',
-    'di-wear',
-    'di-what',
     'di.l.it',
-    'di1',
-    'di50',
-    'di760ss',
-    'dia-',
-    'dia-issue',
-    'dia.',
-    'dia/lif',
-    'dia/narcog',
-    'diab',
-    'diabatic',
-    'diabellis',
-    'diabetes-related',
-    'diabetogenic',
-    'diabetologists',
-    'diabilities',
     'diabira',
-    'diablada',
-    'diables',
-    'diablo-enhanced',
-    'diabolical.',
-    'diabolists',
-    'diabolocentric',
-    'diabolos/apollyon',
-    'diabotic',
-    'diacetone',
-    'diacetyl-nivalenol',
-    'diachronique',
-    'diachronously',
-    'diachylon',
-    'diacolour',
-    'diaconal',
     'diacritic',
-    'diacritics',
-    'diadematus',
-    'diademed',
-    'diadie',
-    'diadochi',
-    'diadoumenos',
-    'diads',
-    'diadumenoi',
-    'diadumenos',
-    'diaeresis',
-    'diag(1,2,2,1)',
-    'diag(6,3,2,1,5,1,2,1)',
-    'diagen',
-    'diagne',
-    'diagnosably',
     'diagnosic',
-    'diagnosis.',
-    'diagnosis/detection',
-    'diagnosis/prediction',
-    'diagnosis/treatment/cure',
-    'diagonal.',
-    'diagonalise',
-    'diagonally-split',
-    'diagramatically',
-    'diagrammable',
-    'diahnne',
-    'diahorrhoea',
-    'diaion',
-    'diakka',
-    'diakonia',
-    'diakrino',
     'diakrisis',
-    'dial-a-bone',
-    'dial-a-brochure',
-    'dial-a-job',
-    'dial-a-quiz',
-    'dial-a-santa',
-    'dial-a-sex-kitten',
-    'dial-a-swelling',
-    'dial-a-video',
-    'dial-an-elephant',
-    'dial-back',
-    'dial-telephone',
-    'dial/comet',
-    'dialect(s)',
-    'dialect.',
-    'dialect/',
     'dialect/accent',
-    'dialectalism',
-    'dialectique',
-    'dialed',
-    'dialekt.',
-    'dialektos',
-    'dialing',
-    'dialling-in',
-    'dialling-tone',
-    'dialogical',
-    'dialogique',
-    'dialogization',
-    'dialogizomai',
-    'dialogue-form',
-    'dialogue-free',
-    'dialoguebox',
     'dialogus',
-    'dialux',
-    'dialyser',
-    'diamacoun',
-    'diamacoune',
-    'diamagnetism',
-    'diamagnets',
-    'diamandopoulos',
-    'diamantine',
-    'diamants',
-    'diameter(c1)',
-    'diameter(c2)',
-    'diameter-compared',
-    'diameter-depth',
-    'diameter/rim',
-    'diameter/thickness',
     'diameter=0.025',
-    'diameter=90',
-    'diametral',
-    'diamidines',
-    'diamino-benzidine',
-    'diamino-benzidine-hydrogen',
-    'diaminobencidine',
-    'diaminopurine',
-    'diaminotetracetic',
-    'diamir',
-    'diamminedichloroplatinum',
-    'diamond&rehy;shape',
-    'diamond-back',
-    'diamond-bearing',
-    'diamond-bright',
-    'diamond-bullet',
     'diamond-chips',
-    'diamond-clear',
-    'diamond-core',
-    'diamond-cutting',
-    'diamond-decked',
-    'diamond-encrusted',
-    'diamond-faced',
-    'diamond-growing',
-    'diamond-is-forever',
-    'diamond-lite',
-    'diamond-lonsdaleite',
-    'diamond-mesh',
-    'diamond-molybdenum',
-    'diamond-mottled',
-    'diamond-patterned',
-    'diamond-set',
     'diamond-sharp',
-    'diamond-white',
-    'diamond/site',
-    'diamondbacks',
-    'diamondes',
-    'diamondring',
-    'diamondy',
-    'diamono',
-    'diamorphic',
-    'diana&mdash;democratic',
-    'diana\'',
-    'dianalan',
-    'diancecht',
-    'diane/glasgow',
-    'dianesque',
-    'dianion',
     'diann',
-    'dianora',
-    'dianova',
-    'dianthus-covered',
-    'diaorrhea-related',
-    'diapedesis',
-    'diapered',
-    'diapering',
-    'diaperwork',
-    'diaphanopterida',
-    'diaphanously',
-    'diaphone',
-    'diaphonic',
-    'diaphoresis',
-    'diaphragm-breathers',
-    'diaphragm/lungs',
     'diaphragm/spermicide',
-    'diapiacer',
-    'diapir',
-    'diaplaced',
-    'diappointment',
-    'diapsids',
-    'diaptomus',
-    'diaquest',
-    'diar',
-    'diarchy',
-    'diarhoea',
-    'diarized',
-    'diarrhetic',
-    'diarrhoea-causing',
-    'diarrhoea-related',
-    'diarrhoea.',
     'diarrhoeas',
-    'diarrhoes',
-    'diarrhoetic',
-    'diarroea',
-    'diarrohea',
-    'diary\'',
-    'diary-cum-commonplace',
-    'diary-keeper',
-    'diary-like',
-    'diary-notebook',
-    'diary-type',
-    'diary/database',
-    'diary/notebook',
-    'dias.',
-    'dias/driver',
-    'dias/tardes/noches',
     'diasabled',
-    'diasaster',
-    'diaship',
-    'diasjustice',
-    'diasporas',
-    'diaspores',
-    'diaspri',
-    'diassala',
-    'diastereoisomer',
-    'diastereoisomers',
-    'diastole',
-    'diastral',
-    'diatary',
-    'diate',
-    'diatomaceous',
-    'diatoms.',
     'diatonic-scale',
-    'diatraea',
-    'diatriba',
-    'diatthoea',
-    'diavolezza',
-    'diawara',
-    'diazamuls',
-    'diazemuls',
-    'diazepan',
-    'diazirene',
-    'diazlabour',
-    'diazotisation',
-    'diazotized',
-    'dib-da-dib-da-dib-dib',
-    'dibacsa',
-    'dibala',
     'dibango',
-    'dibas',
-    'dibbers',
-    'dibbets',
-    'dibbie',
-    'dibbled',
-    'dibbley',
-    'dibbly',
-    'dibekulu',
-    'dibela',
-    'dibles',
-    'dibley/agema',
-    'diblo',
-    'diblos',
-    'dibo',
-    'diboma',
     'dibos',
-    'dibromide',
-    'dibromoalkanes',
-    'dibromochloropropane',
-    'dibutyryl-camp',
-    'diby',
-    'dicaeeidae',
-    'dicarboxethyl',
-    'dicarboxylate',
-    'dicarboxylic',
-    'dicasteries',
-    'dicastero',
-    'dicastiglione',
-    'dicat',
-    'dice-board',
-    'dice-box',
     'dice-coggers',
-    'dice-cup',
-    'dice-play',
-    'dice-playing',
-    'dice-throwing',
-    'dice/',
-    'diceman',
-    'dicendi',
-    'dicentras',
-    'dicerem',
-    'diceros',
-    'diceyan',
-    'diceyesque',
-    'dichalcogenides',
-    'dichaptic',
-    'diche',
     'dichlorisoprenaline',
-    'dichloro',
-    'dichloro-diphenyl',
-    'dichlorodimethylhydanation',
-    'dichloroethylene',
-    'dichloroisocyanuric',
-    'dichloromethane/methanol/',
-    'dichloronitrobenzene',
-    'dichlorprop',
-    'dichotomise',
-    'dichotonomy',
-    'dichroic',
-    'dichromate',
-    'dichromatism',
-    'dicht',
-    'dichte',
     'dichuchwa',
-    'dicier',
-    'diciest',
-    'diciplinary',
-    'dicit',
-    'dicite',
-    'dicitrato',
-    'dicitrato-bismuthate',
-    'dicitur',
-    'dick&rehy;tionaries',
-    'dick-doctor',
-    'dick-follower',
-    'dick-heads',
-    'dick-idolator',
-    'dick-led',
-    'dick-rattling',
     'dick-read',
-    'dick-shaped',
-    'dick-showing',
-    'dick-suck',
-    'dick-wipe',
-    'dick-work',
-    'dick/owner',
-    'dick/that',
-    'dickcheese-pilot',
-    'dickensen',
-    'dickensian-approved',
-    'dickensian-like',
-    'dickensianisms',
-    'dickensianly',
-    'dickered',
-    'dickerly',
     'dickerson-type',
-    'dickert',
-    'dickerty',
-    'dickery',
-    'dickety',
-    'dickeyi',
-    'dickeys',
-    'dickeyup',
-    'dickfield',
-    'dickhead-infested',
-    'dickie/council',
-    'dickinson/bellringer',
-    'dickinson/consumers',
-    'dickinson/parachute',
-    'dickinson/raf',
-    'dickinsonia',
     'dickinsonian',
-    'dickinsoniids',
-    'dickinsons',
-    'dickish',
-    'dickite',
-    'dickity',
-    'dickjoke',
-    'dickle',
-    'dickleburgh',
-    'dicks/brewery',
-    'dicks/brewhouse',
-    'dicksplash',
-    'dicksupply',
-    'dickweed',
-    'dickwit',
-    'dickwits',
     'dicky-bird',
-    'dicky-looking',
-    'dickybirds',
-    'dicle',
-    'dico',
-    'dicom-car',
-    'dicomcar',
-    'dicophane',
-    'dicotyledon',
-    'dicoveries',
-    'dicretionary',
-    'dics',
-    'dict',
-    'dictam',
-    'dictate-7-k',
-    'dictated.',
     'dictater',
-    'dictator-by-consent',
-    'dictatoriship',
-    'diction-finding',
-    'dictionarium',
-    'dictionarum',
-    'dictionary-based',
-    'dictionary-chasing',
-    'dictionary-definition',
-    'dictionary-making',
-    'dictionary-specific',
-    'dictionary/catalogue',
-    'dictionary/thesaurus',
-    'dictionry',
-    'dictionum',
-    'dictor',
     'dictory',
-    'dictotyledons',
-    'dictu',
-    'dictyate',
-    'dictynidae',
-    'dictyocauliasis',
-    'dictyocha',
-    'dictyoneurida',
-    'dictyostelium',
-    'dictyotene',
-    'dicu',
-    'dicul',
-    'dicurane',
-    'dicussions',
-    'dicyanin',
-    'dicyanobenzenes',
     'dicyanogen',
-    'dicynodontia',
-    'did&mdash',
-    'did&mdash;and',
-    'did\'n',
-    'did\'st',
-    'did-he',
-    'did-he-do-it',
-    'did.',
-    'did_at',
-    'did_kind',
-    'did_out',
-    'didace',
-    'didactism',
-    'didactyla',
-    'didb\'t',
     'didbrook',
-    'didcart',
-    'diddems',
-    'diddicois',
-    'diddicoy',
-    'diddiums.',
-    'diddle-daddle',
-    'diddleebob',
-    'diddlers',
-    'diddles',
-    'diddlethingy',
-    'diddleybuzz',
-    'diddleydo',
-    'diddleything',
-    'diddly-dums',
-    'diddly-shit',
     'diddly-squat',
-    'diddlysquat',
-    'diddums',
-    'diddy-jackets',
-    'dideoxycytidine',
-    'dideoxyinosine',
-    'dideoxynucleoside',
-    'diderot.',
-    'didicisse',
-    'didicoi',
-    'dididididi',
-    'didierea',
-    'didiers',
-    'didius',
-    'didja',
-    'didmarton',
     'didn\'t&mdash',
-    'didn\'t&rehy;with',
-    'didn\'t\'',
-    'didn\'t-get-through-my-qualifying-rounds-again',
-    'didn\'t-what',
-    'didn\'t.say',
-    'didn\'y',
-    'didonian',
-    'didonians',
-    'didot',
-    'didouche',
-    'didso',
-    'didycoys',
-    'didymocarpus',
-    'die&rehy;case',
-    'die&szlig;en',
     'die*',
-    'die-change',
-    'die-free',
-    'die-groups',
-    'die-hardism',
-    'die-in-the-wool',
-    'die-sets',
-    'die-sinking',
-    'die-stamping',
-    'die-studier',
-    'die-xxxx',
-    'die.',
-    'die.he',
-    'die/vomiting',
-    'die/your',
-    'die_rather',
     'diease',
-    'diecasting',
-    'died&mdash',
-    'died&mdash;fifteen',
-    'died-in-the-wool',
-    'died.ken',
-    'diederich',
-    'diedrich',
-    'diedrichs',
-    'diefenbachia',
-    'diegan',
-    'diegesis',
-    'diego&ndash;phoenix/scottsdale',
-    'diek',
-    'diekwisch',
-    'dielectric-loss',
     'dielheim',
-    'diella',
-    'dielli',
-    'dieme',
-    'dien-bien-phu',
-    'diendere',
-    'dienekes',
-    'dienel',
-    'diener',
-    'dieniolen',
-    'dienne',
-    'dienste',
-    'dienstherr',
-    'dienstreglement',
-    'diepenbeeck',
-    'dieppe-newhaven',
     'dier',
-    'dierach',
-    'dierdre',
-    'diereach',
-    'dieren',
-    'diergaardt',
-    'dieric',
-    'dierich',
-    'dierking',
-    'dieroff',
-    'dies-at',
-    'diesase',
-    'diesbach',
-    'diese',
-    'diesel&rehy;driven',
-    'diesel-and-hemp-smelling',
     'diesel-bi',
-    'diesel-engines',
-    'diesel-flavoured',
-    'diesel-hydraulic',
-    'diesel-hydraulics',
-    'diesel-only',
-    'diesel-type',
-    'diesel-wise',
-    'dieselhauled',
-    'dieselisation',
-    'dieselised',
-    'diesellocomotive-hauled',
-    'diesels.',
-    'diesem',
-    'dieses',
-    'diesiodinate',
     'diesis',
-    'diet-controlled',
-    'diet-drinks',
-    'diet-failed',
-    'diet-restricted',
-    'diet-shifts',
-    'diet/cholesterol',
-    'diet/weight',
-    'dietaries',
-    'dietger',
-    'diethanolamine',
-    'diethycarbamazine',
-    'diethyldithio-carbamate',
-    'diethylene',
-    'diethylenetriaminepentaacetic',
-    'diethylethanolamines',
     'diethylether',
-    'diethylphosphineplatinum',
-    'diethylstilboestrol',
-    'dietki',
-    'dietman',
-    'dietologist',
-    'dietrich-genscher',
-    'dietrich-style',
-    'dietrichsen',
-    'dietry',
-    'diets-',
-    'diets.',
-    'diettrichstein',
-    'diety',
-    'dietylaminohydroxypropyl',
-    'dietzius',
     'dieudonne/former',
-    'diezma-gradada',
-    'dif&eacute;rance',
-    'dif2',
-    'difa',
-    'difa-forum',
-    'difenditi',
-    'diferenciales',
-    'diff&eacute;rante',
-    'diff&eacute;rentes',
-    'diff&eacute;rents',
-    'diff&eacute;rer',
-    'diff&rehy;ferently',
-    'diff0',
-    'diff1',
-    'diffe',
     'diffeent',
-    'diffence',
-    'diffences',
-    'diffent',
-    'differ.',
-    'differen',
-    'difference\'',
-    'difference.it',
-    'difference/desire',
-    'difference=0.5',
-    'difference=1.1',
-    'difference=difference',
-    'differences.',
-    'different\'',
-    'different-different',
-    'different-language',
     'different-length',
-    'different-more',
-    'different-name',
-    'different-sexed',
-    'different-shaped',
-    'different-smelling',
-    'different/noncomparable',
-    'different/same',
-    'different/unrelated',
-    'differentiability',
-    'differentiae',
-    'differentiated.',
-    'differentiating.',
-    'differention',
-    'differently-priced',
-    'differently-shaped',
     'differet',
-    'differing/deferring',
-    'differs&pound',
-    'differunt',
-    'diffewent',
-    'diffiation',
-    'difficclt',
-    'difficiulties',
-    'difficul',
-    'difficulkt',
-    'difficult-looking',
-    'difficult-not',
-    'difficult-shaped',
-    'difficult-to-classify',
-    'difficult-to-define',
-    'difficult-to-digest',
     'difficult-to-exercise',
-    'difficult-to-hit',
-    'difficult-to-keep',
-    'difficult-to-manage',
-    'difficult-to-photograph',
-    'difficult-to-pronounce-sounds',
-    'difficult-to-reach',
-    'difficult-to-read',
-    'difficult-to-serve',
-    'difficult-to-style',
-    'difficult-to-test',
-    'difficult-to-type',
-    'difficult-to-value',
-    'difficult/easy',
-    'difficult_as',
-    'difficult_because',
     'difficulties\'.',
-    'difficulties--in',
-    'difficulties.the',
-    'difficulties/successes',
-    'difficulty\'',
-    'diffilcult',
-    'diffiulties',
-    'diffk',
-    'diffm',
-    'diffracting',
-    'diffractometers',
-    'diffractor',
-    'diffrent',
-    'diffrentiation',
-    'diffring',
-    'diffuclties',
     'diffugia',
-    'diffuntos',
-    'diffuser-type',
-    'diffuser/dryers',
-    'diffuseurs',
-    'diffusibility',
-    'diffusion-porous',
-    'diffusion/partitioning',
-    'diffusions',
-    'diffwent',
-    'diffwys',
-    'diffy',
-    'dificult',
-    'difiicult',
-    'diflubenzuron',
-    'dig.',
     'diga',
-    'digamma',
-    'digby-wyatt',
-    'digd',
-    'diged',
-    'digema',
-    'digenean',
-    'digenetic',
-    'digenova',
-    'digeridoo',
-    'diges',
-    'digestable',
-    'digestants',
-    'digestible/low',
-    'digeston',
-    'digests.',
     'diggen',
-    'digger-drivers',
-    'diggety',
-    'diggicult',
-    'digging-out',
-    'diggleswade',
-    'diggory/alex',
-    'dighinala',
-    'dighty',
-    'digi-pack',
-    'digi-terror',
-    'digicable',
-    'digicom',
-    'digifax',
-    'digiform',
-    'digilink',
     'digiovanni',
-    'digipak',
-    'digispeech',
-    'digit(s)',
-    'digit-by.digit',
-    'digit-like',
-    'digitabula',
-    'digital-based',
-    'digital-data',
-    'digital-kienzle',
-    'digital-mapping',
-    'digital-networks',
-    'digital/analogue',
-    'digitalker',
-    'digitally-minded',
-    'digitally-recorded',
     'digitallydriven',
-    'digitalness',
-    'digitask',
-    'digitatus',
-    'digitek',
-    'digiti',
-    'digitial',
-    'digitigrade',
-    'digitisation/integration',
-    'digitonin',
-    'digitorum',
-    'digitron',
-    'digits/two',
-    'digiusto',
-    'dignare',
-    'dignatory',
     'digne',
-    'digneley',
-    'dignification',
-    'dignified-looking',
-    'dignit',
-    'dignitas',
-    'dignitate',
-    'dignitatem',
-    'dignitatis',
-    'dignus',
-    'digo-',
-    'digon',
-    'digoxigenin',
-    'digoxsin',
-    'digraphic',
-    'digresses',
     'digris',
-    'digs.',
-    'digtech',
-    'digual',
-    'diguel-est',
-    'diguise',
-    'diguised',
-    'digul',
-    'digwood',
-    'dih',
-    'dihedralled',
-    'dihedrals',
-    'dihistan',
-    'dihli',
-    'dihybrid',
-    'dihydride',
     'dihydroergotamine',
-    'dihydropyradines',
-    'dihydropyrrolizidines',
-    'dihydroscyanthraquinone',
-    'dihydrotestosterone',
-    'diic',
-    'diictodon',
-    'diifficult',
-    'diificult',
-    'diii-',
-    'diiodine',
-    'diisopropylfluorophosphate',
-    'dijana',
-    'dijck',
-    'dijo',
-    'dijon-beaune',
     'dijon-paris',
-    'dijonval',
-    'dijver',
-    'dik&emacr',
-    'dikaiopolis',
-    'dike/waitress',
-    'dikeledi',
-    'diketene',
-    'dikker',
-    'dikoul',
-    'dikshitar',
-    'dikstein',
-    'diktaean',
-    'diktat\'',
-    'diktene',
-    'diktilian',
     'diktynna-worship',
-    'diktynnaion',
-    'dilap',
-    'dilapi&rehy;dated',
-    'dilata',
-    'dilataion',
-    'dilatating',
-    'dilated.',
-    'dilatometric',
-    'dilema',
-    'dilemma(s)',
-    'dilemma.',
-    'dilemmatic',
-    'dilemna',
-    'dileo',
-    'dilettantish',
     'diletto',
-    'dilettoso',
-    'dilgard',
-    'dilham',
-    'diligence.',
-    'diliman',
-    'dilithium',
-    'dilks',
-    'dill-water',
-    'dilla',
-    'dilled',
-    'dilley/third',
-    'dilligence',
-    'dilligent',
-    'dilling',
-    'dillingen',
     'dillingers',
-    'dillis',
-    'dillonising',
-    'dillons/hatchards',
-    'dillons/mowbray',
-    'dilly/hampshire',
-    'dillydallying',
-    'dillying',
-    'dillys',
-    'dilmen',
-    'dilnot/social',
-    'dilophosaurus',
-    'dilrafo',
-    'dils',
-    'dilsk',
-    'dilsworth',
     'dilum',
-    'dilute_now',
-    'dilutees',
-    'dilution.',
-    'dilutor',
-    'dilwara',
-    'dily',
-    'dim-blue',
-    'dim-dip',
-    'dim-discerned',
-    'dim-discovered',
-    'dim-looking',
-    'dim-seen',
-    'dim-shit',
-    'dim-tinted',
-    'dim-wittedness',
     'dim-yellow',
-    'dim.',
-    'dimaggio',
-    'dimanis',
-    'dimark',
-    'dimartini',
-    'dimatima',
-    'dimattia',
-    'dimblebyan',
-    'dimbo',
-    'dimbulb',
-    'dimdi',
-    'dime-store',
-    'dimech',
-    'dimeco',
-    'dimension-bending',
     'dimeola',
-    'dimercaptosuccinic',
-    'dimerised',
-    'dimerises',
-    'dimerizing',
-    'dimethacrylate',
-    'dimethoate',
-    'dimethyl-sulfate-piperidine',
-    'dimethylamine',
-    'dimethylamino',
-    'dimethylaminoacrylate',
-    'dimethylethanolamine',
-    'dimethylglycine',
-    'dimethylsulphoxide/tes',
-    'dimethylthreonine',
-    'dimethyltryptamine',
     'dimetric',
-    'dimetridazole',
-    'dimidiating',
-    'dimidiation',
-    'diminish&mdash;it',
-    'diminishable',
-    'diminished7',
-    'diminishingly',
-    'diminishment',
-    'diminshed',
-    'diminuendoed',
-    'diminuendos',
-    'diminuiti',
-    'diminute',
-    'dimiserit',
-    'dimissed',
     'dimiter',
-    'dimitr',
-    'dimitra',
-    'dimitriadis',
-    'dimitriargo',
-    'dimitriev',
-    'dimitrij',
-    'dimitrijevic',
-    'dimitrova',
-    'dimitto',
-    'dimlit',
-    'dimm',
-    'dimmed-out',
-    'dimmi',
-    'dimmlite',
-    'dimmockia',
     'dimmuborgir',
-    'dimnati',
-    'dimocarpus',
-    'dimokratia',
-    'dimomona',
-    'dimorphisms',
-    'dimorphotheca',
-    'dimou',
-    'dimpuna',
-    'dimskal',
-    'dimster',
-    'dimunition',
-    'dimx',
-    'din\'',
-    'din\'eeee',
-    'din-plug',
     'din-standard',
-    'dinahet',
-    'dinampa',
-    'dinapur',
-    'dinar/us',
-    'dinar=26',
-    'dinardois',
-    'dinaride',
-    'dinarides',
-    'dinary',
-    'dinarzade',
-    'dind',
-    'dinde',
-    'dindins',
-    'dindons',
-    'dineage/kray',
     'dinedor',
-    'dinenage',
-    'dinenis',
-    'diner-out',
-    'ding-a-de-ding-ding-a-de-ding',
-    'ding-bat',
-    'ding-dung',
-    'dingdong',
-    'dinge',
-    'dingell',
-    'dingen',
-    'dingepore',
-    'dingey',
-    'dinghies.',
-    'dinghlis',
-    'dinghy-like',
     'dinghy-sailor',
-    'dinghy-topped',
-    'dingier',
-    'dingies',
-    'dingiest',
-    'dingily',
-    'dingizwayo',
-    'dingman',
-    'dingomaniaque',
-    'dingos',
-    'dings',
-    'dington',
-    'dingwall/convener',
-    'dingxi',
-    'dingy-coloured',
-    'dingy-looking',
     'dinin\'',
-    'dining&rehy;table',
-    'dining-and-dance',
-    'dining-club',
-    'dining-in',
-    'dining-out',
-    'dining-parlour',
-    'dining/guest',
-    'dining/kitchens',
-    'dinistan',
-    'dinitrogen',
-    'dinitz',
-    'dinkan',
-    'dinkar',
-    'dinked',
-    'dinkelspiel',
     'dinkety-bonk',
-    'dinkey',
-    'dinkily',
-    'dinkin',
-    'dinkish',
-    'dinko',
-    'dinks',
-    'dinky-sized',
-    'dinlle',
-    'dinmukhamed',
-    'dinnasty',
-    'dinner\'',
-    'dinner\'sready',
-    'dinner-bell',
-    'dinner-cabaret',
-    'dinner-eaters',
     'dinner-guest',
-    'dinner-guests',
-    'dinner-hostess',
-    'dinner-jackets',
-    'dinner-size',
-    'dinner-tables',
-    'dinner-the',
-    'dinner-things',
-    'dinner-tray',
-    'dinner-waiting',
-    'dinner.he',
-    'dinner/boxing',
-    'dinner/dance.the',
-    'dinner/hm',
-    'dinner=time',
-    'dinnerjackets',
     'dinnerplate',
-    'dinnertimes',
-    'dinnet',
-    'dinney',
-    'dinnigan',
-    'dinning-hall',
-    'dinno',
-    'dino-facts',
-    'dinocap',
-    'dinoflagellate',
-    'dinofrio',
-    'dinohatten',
-    'dinophysis',
-    'dinophysistoxin-2',
-    'dinorben',
-    'dinosauric',
     'dinosaurish',
-    'dinosaurus',
-    'dinotopia',
-    'dinsmore',
-    'dinton',
-    'dinton/buckinghamdshire',
-    'dinton/buckinghamshire',
-    'dintorni',
-    'dinuclear',
-    'dinverter',
-    'dinxie',
-    'dinyar',
-    'dioactive',
-    'diobble',
-    'dioc',
-    'diocalm',
     'diocesano',
-    'dioceseabout',
-    'dioclea',
-    'diocles',
-    'dioctyl-medo',
-    'dioctylated',
-    'diode-pumped',
-    'diode.shaping',
-    'dioderus',
-    'diodide',
-    'diodides',
-    'diodor.',
-    'diodora',
-    'diodorvs',
-    'dioestrum',
-    'diol',
     'diol/33%',
-    'diolm',
-    'diology',
-    'dion&iacute;sio',
-    'dion-bouton',
-    'dioneda',
-    'dionisiy',
-    'dionisotti',
-    'dionovi&cacute',
-    'dionysische',
-    'dionysus-worship',
-    'dionysus-worshippers',
-    'diophantus',
-    'diopsides',
-    'diopter',
-    'dior-patented',
     'dior.',
-    'dioralyte',
-    'dioramas',
-    'dioressence',
-    'dioritic',
-    'dioscorea',
-    'dioscoreaceae',
-    'dioscoridis',
-    'diosesan',
-    'dioskilos',
-    'diosnel',
-    'diospyros',
-    'diotallevi',
-    'dioula',
-    'dioxan',
-    'dioxane:methanol:acetic',
     'dioxide.',
-    'dioxin-covered',
-    'dioxin-pollution',
-    'dioxine',
-    'diozesanmuseum',
-    'dip-backed',
-    'dip-closed',
-    'dip-moulded',
-    'dip-pipes',
-    'dip-slope',
-    'dip-the-finger-in-the-water-and-let\'s-talk-about-the-test-match',
-    'dip-through',
-    'dip-wet-dip-scrub',
-    'dip.',
-    'dip.h.e.s',
-    'dip.sw',
     'dipalmitoyl',
-    'dipankar',
-    'diparch',
-    'dipel',
-    'dipeptides',
-    'dipertuan',
-    'dipesh',
-    'dipfs',
-    'diphale',
-    'diphe/ba',
-    'diphe/bsc',
-    'diphenylcarbazide',
-    'diphenylcarbazone',
-    'diphosgene',
-    'diphosphonate',
-    'diphtheria.',
     'diphtheriaevar',
-    'diphtherinum',
-    'diphthongs/long',
-    'dipinti',
-    'dipipanone',
-    'dipl-ing',
-    'diplays',
-    'dipling',
-    'diploblast',
-    'diploblastic',
-    'diplodoselache',
-    'diplograptus',
-    'diplom&eacute;e',
-    'diploma/med',
-    'diploma/scotvec',
-    'diplomatic.',
     'diplomatico',
-    'diplomatics',
-    'diplomonads',
-    'dipmeter',
-    'dipn',
-    'dipnarine',
-    'dipnoans',
-    'dipole-induced',
-    'dipole-like',
-    'dipp',
-    'dippa',
-    'dipped-back',
-    'dipped-beam',
-    'dippel',
-    'dippermouth',
-    'dippersful',
     'dippety-doo-dah',
-    'dippie',
-    'dippily',
-    'dippin',
-    'dippin\'',
-    'dippy-backed',
-    'diproprionate',
-    'diprotodon',
-    'diprotodonta',
-    'dipsacos',
-    'dipslopes',
-    'dipsomania',
-    'dipsukos',
-    'dipteral',
-    'dipterex',
-    'dipterocarpus',
     'dipterus',
-    'diptford',
-    'dipthong',
-    'diptyque',
-    'diputacion',
-    'dipylidium',
-    'dipylium',
-    'dipylon',
-    'diquate',
-    'diquet',
-    'dir/full',
-    'dir/p',
-    'dir/w',
-    'dir/w/p',
-    'diracto',
-    'diradical',
     'diradicals',
-    'diralite',
-    'diram',
-    'dirams',
-    'dirdy',
-    'dire-warning',
-    'direc&ccedil&atilde;o',
-    'direc&rehy;tions',
-    'direcci&oacute;n',
-    'direccion',
-    'direcors',
-    'direct&rehy;ing',
-    'direct-application',
-    'direct-care',
-    'direct-cast',
-    'direct-connect',
     'direct-coupled',
-    'direct-current',
-    'direct-drive',
-    'direct-energy',
-    'direct-heat',
-    'direct-injected',
-    'direct-inversion',
-    'direct-linked',
-    'direct-manipulation',
-    'direct-marketing',
-    'direct-out',
-    'direct-pressure',
-    'direct-reduction',
-    'direct-sell',
-    'direct-sold',
-    'direct-sun',
     'direct-to-disc',
-    'direct-track',
-    'direct-voltage',
-    'directed&mdash;for',
-    'directed_on',
-    'directee',
-    'directeurs',
-    'directi',
-    'direction(s)',
-    'direction-sensitive',
-    'direction-shifts',
-    'direction-you',
-    'direction.6',
-    'direction/set',
-    'directions&mdash;exchange',
-    'directions/commands',
     'directionsl',
-    'directive\'',
-    'directive.33',
-    'directiveness',
-    'directives.extremely',
-    'directivities',
-    'directivity',
-    'directly&rehy;kno&rehy;wn',
-    'directly-',
-    'directly-coupled',
-    'directly-dissociated',
-    'directly-farmed',
-    'directly-provided',
-    'directly.',
-    'directon',
-    'director-controlled',
     'director-gen.',
-    'director-generals',
-    'director-level',
-    'director-of-operations',
-    'director-turned',
-    'director/assistant',
-    'director/canon',
-    'director/chairman',
-    'director/cmg',
-    'director/dean',
-    'director/director',
-    'director/dj',
-    'director/embalmer',
-    'director/feed',
-    'director/group',
-    'director/jewson',
     'director/johnson',
-    'director/macintyre',
-    'director/secretary',
-    'director/three',
-    'director/tutor',
-    'director:clare',
-    'director:mike',
-    'directoral',
-    'directorate/divisional',
-    'directories.',
-    'directors/committee',
-    'directorship-general',
-    'directory&bsol*.',
-    'directory&gt;error.log',
-    'directory\'',
-    'directory\'-type',
     'directory-type',
-    'directoryname',
-    'directress',
-    'directrix',
-    'directv',
-    'directvote',
-    'diregnosis',
-    'direness',
-    'direttore',
-    'dirge-like',
-    'dirige',
-    'dirigeants',
-    'dirigenten',
-    'dirigenti',
-    'dirigisism',
-    'dirigism',
     'dirigistes',
-    'diriham',
-    'dirir',
-    'dirkmann',
-    'dirksen',
-    'dirndl-clad',
-    'dirpack1',
-    'dirpack3',
-    'dirrerent',
-    'dirs3',
-    'dirt-beaten',
-    'dirt-coloured',
-    'dirt-darkened',
-    'dirt-digging',
-    'dirt-disposing',
-    'dirt-encrusted',
     'dirt-farmers',
-    'dirt-filled',
-    'dirt-free',
-    'dirt-path',
-    'dirt-proof',
-    'dirt-resistance',
-    'dirt-ridden',
-    'dirt-strewn',
-    'dirt-trackers',
-    'dirt-tracking',
-    'dirt/',
-    'dirt/and',
-    'dirt/glam',
-    'dirt_in',
-    'dirtdish',
-    'dirtdog',
     'dirth',
-    'dirtier.',
-    'dirtily',
-    'dirtisisism',
-    'dirtot',
-    'dirtside',
-    'dirty&rehy;looking',
-    'dirty-colourful',
-    'dirty-finger',
-    'dirty-grey',
-    'dirty-intentioned',
-    'dirty-laundry',
-    'dirty-linen',
-    'dirty-nailed',
-    'dirty-never',
-    'dirty-nosed',
     'dirty-phonecall',
-    'dirty-pink',
-    'dirty-sock-washing',
-    'dirty-weekend',
-    'dirty-yellow',
-    'dirtywork',
-    'dirvishes',
-    'dis&mdash',
-    'dis&rehy',
-    'dis&rehy;advantage',
-    'dis&rehy;associating',
-    'dis&rehy;contented',
-    'dis&rehy;covery',
-    'dis&rehy;crediting',
-    'dis&rehy;enfranchisement',
-    'dis&rehy;honest',
     'dis&rehy;illusionment',
-    'dis&rehy;incentives',
-    'dis&rehy;integrating',
-    'dis&rehy;obeyed',
-    'dis&rehy;pensed',
-    'dis&rehy;proof',
-    'dis&rehy;proportionate',
-    'dis&rehy;satisfaction',
-    'dis&rehy;tinctly',
-    'dis-ambiguation',
-    'dis-ap-point-ment',
-    'dis-applied',
-    'dis-assembled',
-    'dis-assembler',
-    'dis-assembly',
-    'dis-associate',
     'dis-autonomization',
-    'dis-believing',
-    'dis-continuing',
-    'dis-continuity',
-    'dis-corporation',
-    'dis-cover',
-    'dis-economy',
-    'dis-embarrass',
-    'dis-enfranchised',
-    'dis-enfranchisement',
-    'dis-equilibria',
-    'dis-honour',
-    'dis-honoured',
-    'dis-inhibitive',
-    'dis-investment',
-    'dis-passionate',
     'dis-represent',
-    'dis-satisfaction',
-    'dis-stress',
-    'dis-used',
-    'disabilites',
-    'disability-definition',
-    'disability-related',
-    'disability.these',
-    'disability/',
-    'disabitata',
-    'disabl',
-    'disabled.50',
-    'disabled.the',
-    'disabled/variety',
-    'disabledism',
-    'disablements',
     'disaccharidase',
-    'disaccumulation',
-    'disadva',
-    'disadvan',
-    'disadvantage-of',
-    'disadvantage.',
-    'disadvantaged.',
-    'disaese',
-    'disaffections',
-    'disaffiliating',
-    'disaffinities',
-    'disageement',
-    'disaggregates',
-    'disagr',
-    'disagreeableness',
-    'disait',
     'disait-il',
-    'disalienated',
-    'disallowable',
-    'disallowances',
-    'disalysis',
-    'disambiguates',
-    'disap&rehy;pointed',
-    'disap&rehy;pointing',
-    'disap&rehy;proves',
-    'disapase',
-    'disapearance',
-    'disappeared.but',
-    'disappeared_as',
-    'disappearence',
-    'disappearnce',
-    'disappers',
     'disappointed/',
-    'disappointment.l',
-    'disapproval.',
-    'disapproval.the',
-    'disapprove.',
-    'disapproved-of',
-    'disapprover',
-    'disapprovers',
-    'disarmer',
-    'disarmingly.',
-    'disarrange',
-    'disarray.27',
-    'disarraying',
-    'disarticulation',
-    'disassoc',
-    'disast',
     'disaster-affected',
-    'disaster-hit',
-    'disaster-laden',
-    'disaster-makers',
-    'disaster-obsessed',
-    'disaster-payouts',
-    'disaster-shutter',
-    'disaster-stricken',
-    'disaster-that',
-    'disasterously',
-    'disasters.',
-    'disater',
-    'disatisfaction',
-    'disavantages',
-    'disbanded.',
-    'disbandments',
     'disbarments',
-    'disbarring',
-    'disbeautifying',
-    'disbeliefs',
-    'disbud',
-    'disbudded',
-    'disburser',
-    'disc-a-gogo',
-    'disc-brake',
-    'disc-braked',
-    'disc-copying',
-    'disc-cutter',
-    'disc-drives',
-    'disc-junketing',
-    'disc-not',
-    'disc-only',
     'disc-shape',
-    'discal',
-    'discalced',
-    'discalimer',
-    'discard-tray',
-    'discarded.',
-    'discarvard',
-    'discern\'st',
-    'discerned-particularly',
-    'disch',
-    'dischage',
-    'discharg',
-    'discharge\'',
-    'discharge.',
-    'dischargeable',
-    'dischargees',
     'discher',
-    'dischnry',
-    'disci',
-    'discias',
-    'disciform',
-    'discip',
-    'discip.',
-    'discipled',
-    'disciplin',
-    'disciplinae',
-    'disciplinarianism',
-    'disciplinaries',
-    'discipline&rehy;orientated',
-    'discipline(s)',
-    'discipline-bound',
-    'discipline-hence',
     'discipline-independent',
-    'discipline.',
-    'disciplined.',
-    'discipular',
-    'discjunkie',
-    'disclaimants',
-    'disclean',
-    'disclined',
-    'disclocated',
-    'disclosee',
-    'discloser',
-    'disclude',
-    'disco&iuml;dales',
-    'disco\'',
-    'disco-based',
-    'disco-bleared',
     'disco-dance',
-    'disco-garage',
-    'disco-ing',
-    'disco-princess',
-    'disco-type',
-    'disco/royal',
-    'disco/wear',
-    'discogoers',
-    'discoing',
-    'discol&rehy;oured',
-    'discolor',
-    'discolourings',
-    'discombobulate',
-    'discomfits',
-    'discomfitted',
-    'discomfitures',
     'discomfort.',
-    'discomfortingly',
-    'discomitors',
-    'discomknockerated',
-    'discommode',
-    'discommodities',
-    'discommunicate',
-    'discommunication',
-    'discompose',
-    'discon',
-    'disconcertion',
-    'disconcertment',
-    'disconfirmation',
-    'disconfirms',
-    'disconitnued',
-    'disconnectedly',
     'disconnecting/reconnecting',
-    'disconnexion',
-    'disconsolate-looking',
-    'discontents.',
-    'discontiguous',
-    'discontinous',
-    'discontinued.',
-    'discontinuously',
-    'discoordinated',
-    'discophile',
-    'discopolice',
-    'discorde',
-    'discordiale',
-    'discorporate',
-    'discorporeal',
-    'discorsi',
     'discorso',
-    'discotech',
-    'discoteque',
-    'discount-retailing',
-    'discount-store',
-    'discount-trading',
-    'discount.',
-    'discount/discount',
-    'discountable',
-    'discountenances',
-    'discounts/exemptions/second',
-    'discour&rehy;aged',
-    'discourage&rehy;ment',
-    'discouragment',
-    'discourged',
-    'discourse&rehy;internal',
     'discourse-as-process',
-    'discourse-based',
-    'discourse-dependence',
-    'discourse-in',
-    'discourses.',
-    'discourses.i',
-    'discourtesies',
-    'discovating',
-    'discovd',
-    'discover&rehy;ing',
-    'discovered-',
-    'discoveries-',
-    'discoveries.',
-    'discovering\'',
-    'discre&rehy;pancies',
-    'discreditability',
     'discreditably',
-    'discreditation',
-    'discredited.',
-    'discreetly-concealed',
-    'discrepancies.',
-    'discreptione',
-    'discretefunc',
-    'discretion-deduction',
-    'discretion/estoppel',
-    'discretionally',
-    'discrezione',
-    'discri',
-    'discri&rehy;minated',
-    'discribed',
-    'discried',
-    'discrimate',
     'discriminat',
-    'discrimination-learning',
-    'discriminiation',
-    'discs.',
-    'discsaver',
-    'disctly',
-    'discua',
-    'discumknockerated',
-    'discus&rehy;sions',
-    'discus-carrier',
-    'discused',
-    'discuss/argue/disagree',
-    'discuss/implement',
-    'discussants',
-    'discussed/clarified',
-    'discussed/i',
     'discussed_in',
-    'discusser',
-    'discussin\'',
-    'discussion-led',
-    'discussion-point',
-    'discussion/topic',
-    'discussions.',
-    'discussions/interviews',
-    'discussions/refine',
-    'discusssed',
-    'discuter',
-    'disdain\'',
-    'dise',
-    'diseaes',
-    'disease&mdash',
-    'disease&rehy;causing',
     'disease*',
-    'disease**',
-    'disease-',
-    'disease-carriers',
-    'disease-causing',
-    'disease-forecasting',
-    'disease-incidence',
-    'disease-infected',
-    'disease-prone',
-    'disease-provoking',
-    'disease-trap',
-    'disease-vulnerable',
-    'disease.3',
-    'disease.according',
-    'disease.nick',
-    'disease/emphysema',
     'disease/energy',
-    'disease/genotype',
-    'diseased-looking',
-    'diseases&mdash;therefore',
-    'diseases&mdash;we',
-    'diseases/but',
-    'diseases/fertiliser',
-    'diseases5',
-    'diseconomics',
-    'diseconomy',
-    'disegni',
-    'diselenide',
-    'disem&rehy;powering',
-    'disembarks',
-    'disembarrassed',
-    'disembodiedness',
     'disembodies',
-    'disembodiment',
-    'disembody',
-    'disemboweller',
-    'disembowelment/birth',
-    'disenchant',
-    'disenchantement',
-    'disencrusted',
-    'disencumbered',
-    'disendowed',
-    'disenfranchized',
-    'disengenuous',
-    'disentailing',
-    'disentangleable',
-    'disentangles',
-    'disentegration',
     'disentwined',
-    'disequalizing',
-    'disert',
-    'disertissime',
-    'disestablish',
-    'disesteem',
-    'disez',
-    'disfamiliarization',
-    'disfavor',
-    'disfavours',
-    'disfigur-ing',
-    'disfigure&rehy;ment',
-    'disfigurement.',
-    'disfluencies',
-    'disforest',
-    'disfranchise',
     'disfunctional',
-    'disgeusting',
-    'disgised',
-    'disgorger',
-    'disgorgers',
-    'disgrace.',
-    'disgraceful-looking',
-    'disgraceful.',
-    'disgracefull',
-    'disgracelands',
-    'disgrazia',
-    'disgruntled-looking',
-    'disgsd',
-    'disgu',
-    'disguise-the',
-    'disguised/voice',
     'disgus',
-    'disgust&rehy;ingly',
-    'disgusteds',
-    'dish\'',
-    'dish-aster',
-    'dish-basin',
-    'dish-cloth',
-    'dish-covers',
-    'dish-kettle',
-    'dish-of-herbs',
-    'dish-rag',
-    'dish-reflector',
-    'dish-telescopes',
-    'dish-towel',
-    'dish-washing',
-    'dish-water',
     'disha',
-    'dishabille',
-    'dishabituator',
-    'dishafinance',
-    'dishearteningly',
-    'disherison',
-    'dishes-of-the-month',
-    'dishes.',
-    'dishevellved',
-    'dishforth-based',
-    'dishful',
-    'dishfuls',
-    'dishiest',
-    'dishin\'',
-    'dishington',
-    'dishmop',
     'dishonest&rehy;comparing',
-    'dishonest\'',
-    'dishonesties',
-    'dishonesty.',
-    'dishonorable',
-    'dishonorifics',
-    'dishpan',
-    'disht',
-    'dishtowels',
-    'dishwarmer',
-    'dishwash',
-    'dishwashelectric',
-    'dishwasher-proof',
-    'dishwasher/oven/',
-    'dishy-looking',
-    'disident',
     'disidentification',
-    'disilicate',
-    'disilientis',
-    'disillusion&rehy;ment',
-    'disimproved',
-    'disincarnate',
-    'disinclines',
-    'disincorporate',
-    'disincrustant',
-    'disinfectant.',
-    'disinfection-destruction',
-    'disinfects',
-    'disinfested',
-    'disingenuity',
-    'disinherioty',
-    'disinherits',
     'disinhibit',
-    'disinhibitory',
-    'disinquinamento',
-    'disinsection',
-    'disintegrationists',
-    'disintegrins',
-    'disinterment',
-    'disinvesting',
-    'disinvestors',
-    'disinvests',
-    'disio',
-    'disip',
-    'disipal',
-    'disipline',
-    'disjected',
-    'disjoin',
     'disjoins/remorse',
-    'disjointedly',
-    'disjoints',
-    'disjonction',
-    'disjonctive',
-    'disk(s)',
-    'disk-fiddling',
-    'disk-free',
-    'disk-head',
-    'disk-held',
-    'disk-intensive',
-    'disk-magazine',
-    'disk-on-a-card',
-    'disk-only',
-    'disk-quality',
-    'disk-read',
     'disk-shaped',
-    'disk.the',
-    'disk/trend',
-    'disk1',
-    'diskeeper',
-    'diskexpress',
-    'diskey',
-    'diskfax',
-    'diskful',
-    'diskgas',
-    'diskhalers',
-    'diskin',
-    'disklavier',
-    'disklike',
-    'diskophoros',
-    'disks_on_top',
     'diskspace',
-    'diskul',
-    'diskuscript',
-    'diskussion',
-    'dislik',
-    'dislike&lsqb;d&rsqb',
-    'dislike\'',
-    'disliked_each',
-    'dislimns',
-    'dislocates',
-    'disloyalists',
-    'dismantleable',
-    'dismantler',
-    'dismantlings',
-    'dismemberer',
-    'dismembrio',
     'dismiss/criticize',
-    'dismission',
-    'dismount-ed',
-    'dismuth',
-    'disna\'',
-    'disnature',
-    'disney-inspired',
-    'disney-mgm',
-    'disney-ravaged',
-    'disney-style',
-    'disneyfied',
-    'disneyfodder',
-    'disneyworlds',
-    'diso',
-    'disobligingly',
-    'disolv',
     'disomy',
-    'disophenol',
-    'disorderlies',
-    'disorganisers',
-    'disorganizing',
-    'disorien&rehy;tate',
-    'disorients',
-    'disoss',
-    'disovered',
-    'disown&rehy;able',
-    'disowne',
-    'disownment',
-    'disp.',
-    'dispagne',
-    'dispairs',
-    'disparagements',
     'disparaissait',
-    'disparition',
-    'disparked',
-    'disparus',
-    'dispase',
-    'dispatch-boat',
-    'dispatch-case',
-    'dispatch-riders',
-    'dispatch.',
-    'dispen&rehy;saries',
-    'dispence',
-    'dispendant',
-    'dispensability',
-    'dispensation\'',
-    'dispensers.the',
-    'dispensery',
     'dispension',
-    'dispers',
-    'dispersed-fuel',
-    'dispersed_by_the',
-    'dispersedly',
-    'dispersionless',
-    'dispersity',
-    'dispiace',
-    'dispiritingly',
-    'displ',
-    'displacement.',
-    'displacive',
-    'display-',
-    'display-(pad)',
-    'display-case',
-    'display-item',
     'display-related',
-    'display-xl',
-    'display.and',
-    'display/holding',
-    'displays.and',
-    'displeasures',
-    'dispoal',
-    'dispoile',
-    'disporportionate',
-    'disportings',
-    'disposability',
-    'disposablehave',
-    'disposal/sluice',
-    'disposer:directors',
-    'disposessed',
-    'disposiong',
     'dispositer',
-    'dispositionally',
-    'dispositionem',
-    'dispositioning',
-    'dispossesed',
-    'dispossessin\'',
-    'dispossessions',
-    'dispozal',
-    'dispray',
-    'disprized',
-    'disprol',
-    'disproofs',
-    'disproportion&rehy;ately',
-    'disproportionably',
-    'disproportionating',
-    'disputationum',
     'dispute-settlement',
-    'dispute-settling',
-    'dispute-solving',
-    'dispute.',
-    'disqualificatory',
-    'disqualifier',
-    'disques',
-    'disquietly',
-    'disquisitioner',
-    'disraeliana',
-    'disrated',
-    'disremember',
-    'disreputable-looking',
-    'disresonance',
-    'disribution',
-    'disrup&rehy;tion',
     'disrupti',
-    'disruption_and_er',
-    'disruptor',
-    'disruptors',
-    'disrupture',
-    'dissaffection',
-    'dissallowed',
-    'dissapeared',
-    'dissapearing',
-    'dissapointment',
-    'dissappeared',
-    'dissappears',
-    'dissappointting',
-    'dissatisfaction.',
-    'dissatisfied.',
-    'dissatisfier',
     'dissatisfies',
-    'dissaude',
-    'dissavers',
-    'dissaving',
-    'dissecting-room',
-    'dissector',
-    'dissectum',
-    'disseised',
-    'disseisin',
-    'dissembler',
-    'dissemblers',
-    'dissemination\'',
-    'disseminatus',
-    'dissen',
-    'dissent/unitarianism',
-    'dissentions',
     'disser',
-    'dissert',
-    'disservices',
-    'dissever',
-    'dissi&rehy;pate',
-    'dissidency',
-    'dissident-led',
-    'dissidents-but',
-    'dissimilar-looking',
-    'dissimilar-two',
-    'dissimilars',
-    'dissimilis',
-    'dissimulated',
-    'dissimulates',
-    'dissimulatioque',
-    'dissimulator',
     'dissipators',
-    'dissoblige',
-    'dissol.',
-    'dissolutely',
-    'dissolutes',
-    'dissolution.',
-    'dissolution/alteration',
-    'dissolution/replacement',
-    'dissolution/reprecipitation',
-    'dissolv',
-    'dissolvable',
-    'dissolved-\'quit',
-    'dissolver',
-    'dissonant-type',
-    'dissonantly',
-    'disssatisfied',
     'disssolved',
-    'disstressed',
-    'dissused',
-    'dissy',
-    'distachyus',
-    'distact',
-    'distal/proximal',
-    'distalgesics',
-    'distanc',
-    'distance\'-where',
-    'distance-consuming',
-    'distance-decay',
-    'distance-dependent',
-    'distance-eating',
-    'distance-judging',
-    'distance-lending',
     'distance-teaching',
-    'distance-variation',
-    'distance/bearing',
-    'distance/number',
-    'distance/open',
-    'distance/similarity',
-    'distance/speed',
-    'distanciations',
-    'distancs',
-    'distans',
-    'distant-but-polite',
-    'distant-cousin',
-    'distant-water',
-    'distantly-resident',
-    'distastes',
-    'distastrous',
     'distat',
-    'distate',
-    'distateful',
-    'distazo',
-    'distearoyl',
-    'distemperature',
-    'distempering',
-    'disterhoft',
-    'disterision',
-    'distillated',
-    'distillates',
-    'distillery-hopping',
-    'distillment',
-    'distin&rehy;guishing',
-    'distinc\'ly',
-    'distince',
     'distinctement',
-    'distinction.',
-    'distinctiones',
-    'distinctly-shaped',
-    'distinguised',
-    'distinti',
-    'dististipes.',
-    'disto',
-    'distonic',
-    'distoring',
-    'distorted.',
-    'distorted_papier',
-    'distortedly',
-    'distortion-free',
-    'distortion-plus-noise',
-    'distortion/eq/chorus/delay',
     'distortion/overdrive',
-    'distortional',
-    'distortomanaics',
-    'distos',
-    'distracted.',
-    'distractedness',
-    'distracter',
-    'distractio',
-    'distraction.',
-    'distractive',
-    'distrainer',
-    'distresse',
-    'distressed.',
-    'distressfully',
-    'distribu',
-    'distribu&rehy;tion',
     'distribute*',
-    'distributed-information-delivery',
-    'distributed-object-computing',
-    'distributers',
-    'distributes&gt',
-    'distribution-based',
-    'distribution/exhibition',
-    'distribution/reinvoicing',
-    'distributionally',
-    'distributionists',
-    'distributist',
-    'distributors.',
-    'distributte',
-    'distributuion',
-    'distric',
-    'districk',
     'district&mdash;which',
-    'district(s)',
-    'district-based',
-    'district-country',
-    'district-focused',
-    'district-level',
-    'district-nurse',
-    'district/central',
-    'district/municipal',
-    'district/output',
-    'district/provincial',
-    'district:traffic',
-    'districtphotograph',
-    'districts.',
-    'districtu',
-    'distridct',
     'distringency',
-    'distriparks',
-    'distrought',
-    'distrubiton',
-    'distrubute',
-    'distugil',
-    'disturb&rehy;ingly',
-    'disturbance-free',
-    'disturbance-producing',
-    'disturbance/',
-    'disturbance/difficulty',
-    'disturbances.liz',
-    'disturbed.',
-    'disturbin\'',
-    'disturbing.',
-    'disturbity\'',
     'distylous',
-    'disuade',
-    'disucss',
-    'disulfiram-ethanol',
-    'disulphide/water',
-    'disulphides',
-    'disulphonic',
-    'disulphur',
-    'disunifies',
-    'disunite',
-    'disunities',
-    'disupte',
-    'disuq-1',
-    'disused-looking',
-    'disusered',
-    'disush',
     'disussion',
-    'disvaluation',
-    'disvalue',
-    'disy',
-    'disyllable/polysyllables',
-    'disztl',
-    'dit-da',
-    'dit-da-dit',
-    'ditch&mdash;unto',
-    'ditch-and-bund',
-    'ditch-delivered',
-    'ditch-lip',
-    'ditchfern',
-    'ditchfield',
-    'ditchings',
-    'ditchingworth',
     'ditchwitch',
-    'dite',
-    'ditford',
-    'dithane',
-    'ditheist',
-    'ditherington',
-    'dithiadiazolium',
-    'dithiazole',
-    'dithiazolium',
-    'dithing',
-    'dithiotreitol',
-    'dithyrambos',
-    'ditinguished',
-    'ditions',
-    'ditliv-simonsen',
-    'ditransitive',
     'ditributed',
-    'dits',
-    'ditsum',
-    'ditsums',
-    'ditsy',
-    'dittenberger',
-    'dittisham',
-    'dittrich',
-    'dittus',
-    'diturrible',
-    'ditzy',
-    'diur',
-    'diurecti',
-    'diurnalis',
-    'diurnea',
-    'diurnus',
     'diused',
-    'div-derived',
-    'div.1',
-    'div3s',
-    'diva-like',
-    'divagated',
-    'divagation',
-    'divali',
-    'divan-cum-four-seater',
-    'divan-type',
-    'divaricata',
-    'divebomb',
-    'divebomber',
-    'divebombing',
-    'divell',
-    'divemaster',
     'divemasters',
-    'diver-',
-    'diver-geologists',
-    'diver-picture',
-    'diver.',
-    'diverged.',
-    'divergence-free',
-    'divergence/convergence',
-    'divergents',
-    'diverless',
-    'diverlike',
-    'diverness',
-    'divers/eyewitness',
-    'diversi-t',
-    'diversifed',
-    'diversifolius',
     'diversional',
-    'diversity-dependent',
-    'diversity/human',
-    'diverters',
-    'diverticula',
-    'diverticuli',
-    'diverticuloses',
-    'divertimento-style',
-    'divertissement-like',
-    'dives-lazarus',
-    'divesture',
-    'divets',
-    'diviacus',
-    'diviana',
-    'diviani',
-    'dividalen',
     'divide.',
-    'divide.by.m',
-    'divided-up',
-    'dividend-stripping',
-    'dividend.',
-    'dividend/tax',
-    'dividends&mdash;flat',
-    'dividends.',
-    'dividents',
-    'divider-out',
-    'divider/heading',
-    'dividing-lines',
-    'dividing-up',
-    'diviion',
-    'divila',
-    'divils',
     'divinae',
-    'divinatione',
-    'divinely-destined',
-    'divinely-dictated',
-    'divinely-fecund',
-    'divinely-intended',
-    'divinely-protected',
-    'divinest',
-    'diving-duck',
-    'divinity.',
-    'divinization',
-    'divintity',
-    'divis/twinbrook',
-    'divisa',
-    'divisim',
-    'divisiocn',
     'division\'',
-    'division-funk',
-    'division-plan.',
-    'division/cocteaus',
-    'division/multiplication',
-    'divisional-section',
-    'divisional/',
-    'divisional/product',
-    'divisionalisation',
-    'divisionally',
-    'divisioners',
-    'divisions&mdash;hiving',
-    'divisions.however',
-    'divisions/',
-    'divisively',
-    'divisory',
     'divisum',
-    'divlin',
-    'divo',
-    'divonne',
-    'divorc&eacute;es',
-    'divorce\'',
-    'divorce-courts',
-    'divorce-rates',
-    'divorce/',
-    'divorced/legally',
-    'divorced/widowed/separated',
-    'divorcer',
-    'divorthed',
-    'divorzio',
-    'divoto',
-    'divozione',
     'divulgation',
-    'divv',
-    'divvil',
-    'diwan-i-khas',
-    'diwaniya',
-    'diwwaniya',
-    'dix\'s',
-    'dix-sept',
-    'dix/marina',
-    'dix/rspca',
-    'dixarit',
-    'dixcart',
-    'dixco',
-    'dixen',
-    'dixi',
-    'dixiecrat',
     'dixit-stiglitz',
-    'dixneuf',
-    'dixodaros',
-    'dixode',
-    'dixon-parkers',
-    'dixon/campaign',
-    'dixon/daughter',
-    'dixon/landlord',
-    'dixon/peter',
-    'dixon/son',
-    'dixons/silo',
-    'dixville',
-    'diy-',
-    'diy-ers',
-    'diy-ing',
-    'diy-structured',
     'diyab',
-    'diyadama',
-    'diyer',
-    'diying',
-    'diza',
-    'dizah',
-    'dizapac',
-    'dizier',
-    'dizygocrinus',
-    'dizzard',
-    'dj-ed',
-    'dj-ing',
-    'dj/artist',
-    'djabi',
-    'djabord',
-    'djajusman',
     'djakarta.',
-    'djakovica',
-    'djallon',
-    'djalo',
-    'djamaloudine',
-    'djamaravli',
-    'djambokota',
-    'djamolodine',
-    'djamshed',
-    'djanet',
-    'django-type',
-    'djawa',
-    'djax-up',
-    'djebels',
-    'djedje',
-    'djedjemel',
     'djelalzade',
-    'djellaba',
-    'djellabah',
-    'djellebah',
-    'djelloul',
-    'djem',
-    'djemel',
-    'djenne',
-    'djer',
-    'djerdap',
-    'djeric',
-    'djian',
-    'djibouiti',
-    'djiboutians',
-    'djidi',
-    'djidingar',
     'djika',
-    'djilali',
-    'djimasta',
-    'djime',
-    'djin\'',
-    'djinn.',
-    'djinni',
-    'djinsky',
-    'djize',
-    'djodan',
-    'djoe',
-    'djondo',
-    'djonkouma',
-    'djordevic',
-    'djorgovski',
-    'djorjovski',
     'djoua',
-    'djoudi',
-    'djoulasso',
-    'djp.moreover',
-    'dju:l&ndash',
-    'djuanda',
-    'djugashvili',
-    'djugurba',
-    'djukanovic',
-    'djungel',
-    'djurayev',
-    'djurdjevic',
-    'dk&ndash;2300',
-    'dk-2600',
-    'dk-2830',
-    'dk.31h',
     'dk431',
-    'dkny',
-    'dkp***',
-    'dkr',
-    'dkr12,000',
-    'dkr16,100',
-    'dkr16.1',
-    'dkr2,800',
-    'dkr277,500',
-    'dkr280,300',
-    'dkr282,600',
-    'dkr29,500',
-    'dkr30,500',
-    'dkr312,100',
-    'dkr326,200',
-    'dkr35,800',
     'dkr5,100',
-    'dkr560,400',
-    'dkr57,900',
-    'dkr58,200',
-    'dkr6.3',
-    'dkr8,000',
-    'dkr90,000,000',
-    'dkw',
-    'dl&amp;j',
-    'dl-double',
-    'dl-glu',
-    'dl/c/367',
-    'dl/dt',
-    'dl123a',
-    'dl14',
-    'dl3',
     'dl3200/a',
-    'dla0',
-    'dla1',
-    'dladla',
-    'dlg',
-    'dlg-e',
-    'dlgs',
-    'dlimi',
-    'dlimy',
-    'dloe',
-    'dlp-led',
-    'dls',
-    'dlugach',
-    'dlugoraj',
-    'dlugosz',
-    'dm&amp;sup-3',
     'dm.1.57',
-    'dm.2',
-    'dm.3',
-    'dm/&pound',
-    'dm/2',
-    'dm/at',
-    'dm0.0',
-    'dm0.04',
-    'dm0.05&ndash;0.04',
-    'dm0.5m',
-    'dm000',
-    'dm000,000',
-    'dm1,000,000',
-    'dm1,200',
-    'dm1,500',
-    'dm1,650',
     'dm1,700,000',
-    'dm1,900',
-    'dm1.00=13',
-    'dm1.00=200',
-    'dm1.00=360',
-    'dm1.00=65',
-    'dm1.00=70,000',
-    'dm1.00=9',
-    'dm1.18',
-    'dm1.32',
-    'dm1.40',
-    'dm1.45',
-    'dm1.49',
-    'dm1.5',
-    'dm1.56',
-    'dm1.6',
     'dm1.62',
-    'dm1.6370',
-    'dm1.65m',
-    'dm1.74',
-    'dm1.75',
-    'dm1.8748',
-    'dm1.8845',
-    'dm1.8925',
-    'dm10,000,000',
-    'dm1000',
-    'dm100bn',
-    'dm100m-worth',
-    'dm104&ndash;135',
-    'dm108',
-    'dm109,000',
-    'dm10m',
     'dm10m-20m',
-    'dm11,400',
-    'dm11.70',
-    'dm110,000',
-    'dm12*55',
-    'dm12*57',
-    'dm12.3',
-    'dm125',
-    'dm125,000',
-    'dm126.1m',
-    'dm130',
-    'dm130,000',
-    'dm14',
-    'dm148',
-    'dm15.',
-    'dm155,000',
     'dm16,000,000',
-    'dm17,500,000',
-    'dm170',
-    'dm175,000',
-    'dm175m',
-    'dm18,000',
-    'dm18.1',
-    'dm180',
-    'dm180,000',
-    'dm19,000',
-    'dm19.80',
-    'dm1=8',
-    'dm2&ndash;5',
-    'dm2,120,000',
-    'dm2,400',
-    'dm2,500',
     'dm2,900',
-    'dm2.1',
-    'dm2.15',
-    'dm2.1bn',
-    'dm2.30',
-    'dm2.3157',
-    'dm2.32',
-    'dm2.3213',
-    'dm2.3235',
-    'dm2.33',
-    'dm2.3372',
-    'dm2.34',
-    'dm2.3486',
-    'dm2.3550',
-    'dm2.3562',
-    'dm2.3669',
     'dm2.3750',
-    'dm2.3779',
-    'dm2.3835',
-    'dm2.3887',
-    'dm2.4',
-    'dm2.4000',
-    'dm2.4050',
-    'dm2.4120',
-    'dm2.4138',
-    'dm2.4172',
-    'dm2.4229',
-    'dm2.4350',
-    'dm2.4365',
-    'dm2.61',
-    'dm2.63',
-    'dm2.7',
     'dm2.71',
-    'dm2.72',
-    'dm2.727',
-    'dm2.7336',
-    'dm2.75',
-    'dm2.7568',
-    'dm2.7760',
-    'dm2.7784',
-    'dm2.7bn',
-    'dm2.8',
-    'dm2.8426',
-    'dm2.8801',
-    'dm2.9450',
-    'dm2.97',
-    'dm20,000,000',
-    'dm20,100',
     'dm20/sin',
-    'dm200m',
-    'dm205m',
-    'dm215&ndash;295',
-    'dm22,000',
-    'dm220',
-    'dm220,000',
-    'dm230&ndash;280',
-    'dm24',
-    'dm24,000',
-    'dm24,700',
-    'dm24.80',
-    'dm240,000',
-    'dm248',
-    'dm25',
-    'dm25,000',
     'dm25,100',
-    'dm25.9',
-    'dm26,000,000',
-    'dm26,900',
-    'dm260,000',
-    'dm27.6m',
-    'dm28,000',
-    'dm280,000',
-    'dm28bn',
-    'dm29,400',
-    'dm29.80',
-    'dm290&ndash;420',
-    'dm296',
-    'dm3,200',
-    'dm3,400',
-    'dm3.00',
     'dm3.0081',
-    'dm3.009',
-    'dm3.0102',
-    'dm3.0283',
-    'dm3.03',
-    'dm3.0335',
-    'dm3.0342',
-    'dm3.0400',
-    'dm3.07',
-    'dm3.54',
-    'dm3.8',
-    'dm3.88&ndash;3.92',
-    'dm3.9',
-    'dm3.90',
-    'dm3.92',
-    'dm3.98&ndash;4.02',
     'dm30',
-    'dm30,000,000',
-    'dm30.',
-    'dm300,000,000',
-    'dm300m',
-    'dm306,900',
-    'dm320,000',
-    'dm324,000',
-    'dm34,700',
-    'dm350&ndash;400',
-    'dm350&ndash;450,000',
-    'dm350,000',
-    'dm35m',
-    'dm36,000',
-    'dm38.8m',
-    'dm380&ndash;430',
     'dm39,600',
-    'dm39.3m',
-    'dm390,000',
-    'dm395',
-    'dm395,000,000',
-    'dm398,000',
-    'dm4,000',
-    'dm4,500',
-    'dm4,682,000',
-    'dm4.12',
-    'dm4.1bn',
-    'dm4.4bn',
-    'dm4.5',
-    'dm40',
-    'dm40,000-50,000',
-    'dm40.1',
     'dm40.4m',
-    'dm400,000',
-    'dm400,000,000',
-    'dm412m',
-    'dm42,000&ndash;43,000',
-    'dm42,700',
-    'dm422,560',
-    'dm43,700',
-    'dm430,000',
-    'dm435,650',
-    'dm436m',
-    'dm440',
-    'dm440,000',
-    'dm440,000,000',
-    'dm45',
-    'dm450',
     'dm450,000',
-    'dm46.6',
-    'dm47,000,000',
-    'dm48,000',
-    'dm480,000',
-    'dm49',
-    'dm49,860',
-    'dm49,900',
-    'dm4bn',
-    'dm5,300',
-    'dm5,500',
-    'dm5,800',
-    'dm5,900',
-    'dm5.3',
-    'dm50&ndash;60,000',
-    'dm50,800',
     'dm5000m',
-    'dm500m',
-    'dm50m',
-    'dm52,500',
-    'dm53,000',
-    'dm545',
-    'dm55,000',
-    'dm550m',
-    'dm58,000',
-    'dm580',
-    'dm580,000',
-    'dm6,000,000',
-    'dm6,200',
-    'dm6,276,000',
-    'dm6.3',
-    'dm60&ndash;70,000',
     'dm60,000',
-    'dm600',
-    'dm600&ndash;3000',
-    'dm600,000,000-worth',
-    'dm60bn',
-    'dm62,000',
-    'dm620,000',
-    'dm64,150',
-    'dm650-900',
-    'dm66,400',
-    'dm66,800',
-    'dm675,000',
-    'dm692,000',
-    'dm7,800',
-    'dm7.5',
-    'dm70,000',
     'dm737,000',
-    'dm74.3',
-    'dm75,300,000',
-    'dm750',
-    'dm77,000',
-    'dm78,000',
-    'dm8,200',
-    'dm8,300',
-    'dm80,000',
-    'dm800,000',
-    'dm800,000,000',
-    'dm85',
-    'dm85,000',
-    'dm85.5',
-    'dm88',
-    'dm880,000,000',
     'dm8billion',
-    'dm9',
-    'dm9,100',
-    'dm9,600',
-    'dm900',
-    'dm900,000',
-    'dm91',
-    'dm91,900',
-    'dm93',
-    'dm93,000',
-    'dm95,000',
-    'dm95,847',
-    'dm96',
-    'dm985m',
-    'dm99,000',
-    'dm997,500',
     'dmac',
-    'dmark',
-    'dmd',
-    'dme-based',
-    'dme-compatible',
-    'dme-ready',
-    'dmem/10%fbs.',
-    'dmin',
-    'dminor',
-    'dmitrij',
-    'dmitriyev',
-    'dmitriyevich',
-    'dmk-led',
-    'dmls',
-    'dmmp',
-    'dmo',
     'dmp&mdash;democratic',
-    'dmp11',
-    'dmps',
-    'dms-100',
-    'dms-interference',
-    'dms-media',
-    'dms-methylation',
-    'dms-stop',
-    'dmsa',
-    'dmsu',
-    'dmts',
-    'dmytrik',
-    'dmytro',
-    'dn-dp',
-    'dn/',
-    'dn10-related',
     'dn14',
-    'dn2',
-    'dn3000',
-    'dn4',
-    'dn6-impregnated',
-    'dna&mdash;norwegian',
-    'dna-activated',
-    'dna-affinic',
-    'dna-binding-domain',
-    'dna-binding-site',
-    'dna-cleavage',
-    'dna-contacts',
-    'dna-cutting',
-    'dna-encoding',
-    'dna-fingerprint',
-    'dna-probe',
     'dna-region',
-    'dna-replication',
-    'dna-ribbon',
-    'dna-sequencing',
-    'dna-synthesis',
-    'dna-targeted',
-    'dna-targeting',
-    'dna-thymidine',
-    'dna-transmitted',
-    'dna.',
-    'dna/',
-    'dna/beads',
-    'dnae',
-    'dnasei-digested',
-    'dnastar',
-    'dnc/bergen',
     'dneister',
-    'dnes',
-    'dniepr',
-    'dniepr-bug',
-    'dniepr-niemen',
-    'dniestr',
-    'dnipro',
-    'dnis',
-    'dnm',
-    'dnpq',
-    'dnps-100',
-    'do&mdash;for',
-    'do&mdash;it',
-    'do&mdash;thinking',
-    'do&mdash;while',
-    'do&ndash;en',
     'do&rehy;it-all',
-    'do\'ed',
-    'do\'em',
-    'do-anything-if-the-cash-is-right',
-    'do-as-you-like',
-    'do-be-ra',
-    'do-better',
-    'do-day',
-    'do-days',
-    'do-dum-dum',
-    'do-dum-dum-waking-up-is-hard-to-do',
-    'do-ers',
-    'do-goodish',
-    'do-goodism',
-    'do-hickey',
-    'do-it-in-your-pants',
     'do-it-ourself',
-    'do-it-your-self',
-    'do-it-yourself&ndash',
-    'do-it-yourself-stores',
-    'do-it-yourselfer',
-    'do-it-yourselfers',
-    'do-it-yourselvers',
-    'do-jigger',
-    'do-lally',
-    'do-loop',
-    'do-na-no-bis-pa-cem',
-    'do-namely',
-    'do-not-disturb',
-    'do-not-touch-me',
-    'do-nothings',
-    'do-nut',
     'do-nuts',
-    'do-o-o',
-    'do-or-drown',
-    'do-piaza',
-    'do-probe-me',
-    'do-right',
-    'do-si-do',
-    'do-up',
-    'do-wah-diddy-diddy-dum-diddy-do',
-    'do-year-old',
-    'do.335',
-    'do.es',
-    'do.system',
-    'do/do',
-    'do/does/did',
-    'do/lead',
     'do/now',
-    'do/some',
-    'do1',
-    'do17s',
-    'do_a',
-    'do_as',
-    'do_in',
-    'doab',
-    'doabs',
-    'doacks',
-    'doake',
-    'doalbriforme',
-    'doanh',
-    'doanted',
-    'doares',
-    'doating',
     'dobbelaere',
-    'dobber',
-    'dobbertin',
-    'dobbin\'',
-    'dobbing',
-    'dobblers',
-    'dobbo',
-    'dobbs-style',
-    'dobbs/father',
-    'dobbyn',
-    'dobel/landlord',
-    'doben&iacute;n',
-    'dobereiner\'',
-    'doberiner',
-    'doberman-cross',
-    'doberman-pinscher',
     'dobeson',
-    'dobislav',
-    'dobkin',
-    'dobleing',
-    'dobles',
-    'dobney',
-    'dobody',
-    'doboj',
-    'dobr&eacute',
-    'dobrilla',
-    'dobrnja',
-    'dobrolyubov',
-    'dobronica',
-    'dobros',
-    'dobrynin',
-    'dobson/labour',
     'dobsonville',
-    'dobsworth',
-    'dobt',
-    'doby',
-    'dobyns',
-    'dobzhansky',
-    'doc-lap',
-    'doc-shoed',
-    'doc.',
-    'doc/0500',
-    'docapprover',
-    'docco',
-    'docendi',
-    'docens',
-    'dochart',
-    'dochartaigh',
     'dochay',
-    'docherty/former',
-    'docherty/gloucestershire',
-    'dochertys',
-    'dochfour',
-    'dochgarroch',
-    'dock-gate',
-    'dock-gates',
-    'dock-grubs',
-    'dock-leaf',
-    'dock-related',
-    'dock-road',
-    'dock-to-dock',
-    'dock-union',
-    'dock.',
-    'dock.we',
     'dock/bi',
-    'dock/gloucestershire',
-    'dockar',
-    'docken',
-    'dockenfield',
-    'docker-inspired',
-    'dockerill',
-    'dockertys',
-    'dockertz',
-    'dockett',
-    'dockford',
-    'dockham',
-    'dockies',
-    'dockings',
-    'docklands-style',
-    'docko',
     'dockree',
-    'dockrell',
-    'docks.',
-    'docks/gloucestershire',
-    'docksey',
-    'docksiders',
-    'docosahexoenic',
-    'docotrate',
-    'docshop',
-    'doct',
-    'docta',
-    'docted',
-    'doctering',
-    'doctissimorum',
-    'doctor\'',
-    'doctor-a',
     'doctor-and-copper',
-    'doctor-counsellor',
-    'doctor-doctor',
-    'doctor-father',
-    'doctor-flattering',
-    'doctor-induced',
-    'doctor-journalist',
-    'doctor-martined',
-    'doctor-nurse',
-    'doctor-prescribed',
-    'doctor-salesperson',
-    'doctor-shopping',
-    'doctor.',
-    'doctor/a',
-    'doctor/hospital/dentist',
-    'doctor/manager',
     'doctor/passed',
-    'doctor_by',
-    'doctorem',
-    'doctorial',
-    'doctorov',
-    'doctorow',
-    'doctors.',
-    'doctors/nurses/medical',
-    'doctos',
-    'doctrinaires',
-    'doctrinairism',
-    'doctrinale',
-    'docu-melodrama',
-    'docuit',
-    'documatic',
-    'documen',
     'document-faking',
-    'document-handling',
-    'document-holder',
-    'document-holders',
-    'document-led',
-    'document-nursery',
-    'document-ordering',
-    'document-oriented',
-    'document-passing',
-    'document-wallet',
-    'document/manual',
-    'document_in',
-    'documenta-halle',
-    'documental',
-    'documentary-like',
-    'documentary-maker',
     'documentary.',
-    'documentation_such',
-    'documentazione',
-    'documentedera',
-    'documentor',
-    'documentos',
-    'documents&mdash;it',
-    'documents&mdash;still',
-    'documents-for',
-    'documents/exhibitions',
-    'documents/information',
-    'documents/list',
-    'documents=',
-    'docutech',
-    'dod-1',
-    'dod/trantec',
     'dodanduwa',
-    'dodanim',
-    'dodd/milton',
-    'doddafydd',
-    'dodderidge',
-    'doddersell',
-    'doddies',
-    'doddiscombsleigh',
-    'doddridges',
-    'dodds-parker',
-    'dodds-smith',
-    'doddyda',
-    'dodecachordon',
-    'dodecacorde',
-    'dodecahedrane',
-    'dodecamers',
     'dodecapeptife',
-    'dodecaphony-on-stilts',
-    'dodewaard',
-    'dodford',
-    'dodgem-drivers',
-    'dodgen',
-    'dodgiest',
-    'dodgion',
-    'dodgy-looking',
-    'dodgy-style',
-    'dodgyness',
-    'dodik',
-    'dodington',
-    'dodmire',
-    'dodne',
-    'dododo',
     'dodson/hip',
-    'dodswells',
-    'dody',
-    'doe-funded',
-    'doe/forestry',
-    'doe/rescue',
-    'doe/stag',
-    'doebley',
-    'doebner',
-    'doederlein',
-    'doeings',
-    'doen',
-    'doena',
-    'doer&lsqb;s&rsqb',
-    'doer-of-good-works',
-    'doers.',
     'does&mdash;without',
-    'does\'na',
-    'does-not',
-    'does/he',
-    'does_a',
-    'doesn\'t&mdash;but',
-    'doesn\'t.',
-    'doesn.t',
-    'doesnt/didnt',
-    'doessing',
-    'doest',
-    'doeuff',
-    'doeverie',
-    'doffeinsoabbe',
-    'doffings',
-    'doffs',
     'doftana',
-    'dog&mdash;bull-dog',
-    'dog&rehy;crate',
-    'dog&rehy;tired',
-    'dog\'s-mercury',
-    'dog-',
-    'dog-adorned',
-    'dog-aids',
-    'dog-ape',
-    'dog-attached',
-    'dog-biscuit',
-    'dog-bone',
-    'dog-chain',
-    'dog-cock',
-    'dog-collars',
-    'dog-crawl',
     'dog-daisies',
-    'dog-day',
-    'dog-dirt',
-    'dog-earing',
-    'dog-eat&rehy;dog',
-    'dog-eatcat',
-    'dog-eaten',
-    'dog-fashion',
-    'dog-for',
-    'dog-free',
-    'dog-handling',
-    'dog-howl',
-    'dog-kennel',
-    'dog-kennels',
-    'dog-latin',
-    'dog-leads',
     'dog-lean',
-    'dog-less',
-    'dog-look',
-    'dog-muck',
-    'dog-murdering',
-    'dog-obedience',
-    'dog-orientated',
-    'dog-owners',
-    'dog-owning',
-    'dog-packs',
-    'dog-paddle',
-    'dog-paddled',
-    'dog-paddles',
-    'dog-proof',
-    'dog-racing',
-    'dog-registration',
     'dog-related',
-    'dog-roses',
-    'dog-rough',
-    'dog-rover-with',
-    'dog-sat',
-    'dog-shaped',
-    'dog-shoots-master',
-    'dog-skin',
-    'dog-sledging',
-    'dog-stealer',
-    'dog-stealing',
-    'dog-straying',
-    'dog-stroking',
-    'dog-tags',
-    'dog-teeth-mountable',
-    'dog-trainer',
     'dog-weary',
-    'dog-whistle',
-    'dog-wolf',
-    'dog/betrayed',
-    'dog/owner',
-    'dog/returning',
-    'dogam',
-    'dogbert',
-    'dogcart',
-    'dogcarts',
-    'dogcatcher',
-    'dogchoc',
-    'dogen',
-    'dogfighter',
-    'dogfish-sized',
-    'dogga',
     'dogges',
-    'doggets',
-    'doggie-fashion',
-    'dogginess',
-    'doggish',
-    'doggy-paddle',
-    'doggy-style',
-    'doggypaddle',
-    'doghandling',
-    'doghead',
-    'doghter',
-    'dogleap',
-    'dogleash',
-    'dogless',
-    'dogliani',
-    'dogma-driven',
     'dogmaels',
-    'dogmata',
-    'dogmaticism',
-    'dogmatist',
-    'dogmeat',
-    'dognapped',
-    'dogo',
-    'dogowners',
-    'dogoyn',
-    'dogpatch',
-    'dogrelated',
-    'dogs-are',
-    'dogs-meat',
-    'dogs/clogs',
-    'dogs/east',
-    'dogs_as',
     'dogsbodying',
-    'dogsfather',
-    'dogsick',
-    'dogsitter',
-    'dogsled',
-    'dogstoerd',
-    'dogstooth',
-    'dogtail',
-    'dogtooth',
-    'dogubeyazit',
-    'dogun',
-    'dogwalkers',
-    'dogwards',
-    'doh-backed',
-    'doh-funded',
-    'doheney',
     'doheny',
-    'dohn&aacute;yi',
-    'doid',
-    'doidledoidledaddy',
-    'doies',
-    'doigts',
-    'doileys',
-    'doillon',
-    'doin\'.',
-    'doing-accounts',
-    'doing-all-right',
-    'doing-as',
-    'doing-but',
-    'doing-by',
-    'doing-how',
-    'doing-over',
     'doing-tell',
-    'doing-the',
-    'doing-up',
-    'doing-well',
-    'doing/not',
-    'doing_all',
-    'doing_so',
-    'doinges',
-    'doings.',
-    'doire',
-    'doise',
-    'doisneau/photographer',
-    'dojos',
-    'dojran',
-    'dojums',
-    'dok',
     'dokhoda',
-    'dokhody',
-    'dokimasia',
-    'dokimeion-iasos',
-    'dokken',
-    'dokoupil',
-    'doku',
-    'dokuchaev',
-    'dokumentarischem',
-    'dol&rehy;lar',
-    'dolabella',
-    'dolanog',
-    'dolatalyas',
-    'dolbec',
-    'dolbyised',
-    'dolcezza',
     'dolcourt',
-    'dold&aacute;n',
-    'dolddafydd',
-    'dolddrums',
-    'doldrum-like',
-    'dole-light',
-    'dole-money',
-    'dole-scroungers',
-    'dolebury',
-    'doleful-looking',
-    'dolefulness',
-    'dolen',
-    'dolentium',
-    'dolerw',
-    'dolfuss',
-    'dolg',
     'dolge',
-    'dolgelly',
-    'dolgoborodov',
-    'dolgorsuren',
-    'dolgorukiis',
-    'dolgos',
-    'dolh',
-    'dolhagaray',
-    'dolianova',
-    'doliche',
-    'dolichenum',
-    'dolichurus',
-    'dolies',
-    'dolimitised',
-    'dolinchek',
-    'dolindo',
     'dolinger',
-    'dolinka',
-    'dolisie',
-    'dolivo',
-    'doll\'',
-    'doll-dress',
-    'doll-eyes',
-    'doll-faced',
-    'doll-size',
-    'doll-washing',
-    'doll/bradford-hill',
-    'doll/imperial',
-    'dolland',
-    'dollar-exchange',
-    'dollar-hoover',
-    'dollar-hungry',
     'dollar-mark',
-    'dollar-millionaires',
-    'dollar-orientated',
-    'dollar-priced',
-    'dollar-pulling',
-    'dollar-rouble',
-    'dollar-short',
-    'dollar-sign',
-    'dollar-sterling',
-    'dollar/&pound',
-    'dollar/abc/malcolm',
-    'dollar/gold',
-    'dollar/pound',
-    'dollar/pound-per-mips',
-    'dollar/sterling',
-    'dollar/swiss',
     'dollardom',
-    'dollaro',
-    'dollars15m',
-    'dollars_away',
-    'dollarsigns',
-    'dollei',
-    'dollenz',
-    'dollfus-mieg',
-    'dollier',
-    'dollingston',
-    'dollingstown',
-    'dollmakers',
-    'dolloped',
-    'dolloping',
-    'dollor',
-    'dolly-birds',
     'dolly-blued',
-    'dolly-chops',
-    'dolly-dye',
-    'dolly-mixture',
-    'dolly-mixtures',
-    'dolly-of',
-    'dolly-wheel',
-    'dollywagon',
-    'dolmades',
-    'dolman/housing',
-    'dolmans',
-    'dolmatov',
-    'dolohov',
-    'dolomicrites',
-    'dolomitan',
-    'dolomite/saab',
     'dolomiti',
-    'dolomitic',
-    'dolomitic/sideritic',
-    'dolomitized',
-    'doloranda',
-    'dolore',
-    'dolorimeter',
-    'doloris',
-    'dolorosas',
-    'dolorose/c\'hanno',
-    'doloroso',
-    'dolosa',
-    'dolosi',
-    'dolostones',
-    'dolphin\'',
-    'dolphin-',
     'dolphin-class',
-    'dolphin-kill',
-    'dolphin-lengths',
-    'dolphin-protection',
-    'dolphin-safe\'',
-    'dolphin-saving',
-    'dolphin-shaped',
-    'dolphin/womb',
-    'dolphinaria',
-    'dolphinariums',
-    'dolstar',
-    'dolstars',
-    'dolvy',
-    'dolydd',
-    'dom-peromp',
-    'dom-tom',
     'dom-tower',
-    'dom7',
-    'doma/pilot',
-    'domain-dictionary',
-    'domain-free',
-    'domain-general',
-    'domain/shareware',
-    'domainal',
-    'domains.',
-    'domant',
-    'domaru',
-    'domasi',
-    'dombai',
-    'dombello',
-    'dombeys',
-    'domby',
     'domcasual',
-    'dome-cars',
-    'dome-over-square',
-    'dome-topped',
-    'dome-watching',
-    'domed-shaped',
-    'domeheads',
-    'domela',
-    'domelawe',
-    'domelights',
-    'domelike',
-    'domenech',
-    'domestic\'-built',
-    'domestic-',
-    'domestic-airline',
-    'domestic-care',
     'domestic-policy',
-    'domestic/commercial/agricultural',
-    'domestic/general',
-    'domestic/moderate',
-    'domestically-based',
-    'domestically-consumed',
-    'domestically-controlled',
-    'domestically-generated',
-    'domestically-oriented',
-    'domestically-produced',
-    'domestically-scaled',
-    'domesticants',
-    'domesticated-wife',
-    'domesticates',
-    'domestications',
-    'domesticities',
     'domestick',
-    'domesticum',
-    'dometic',
-    'domett',
-    'domette',
-    'domgasse',
-    'domiciles',
-    'domiciliary/residential/day',
-    'domicilium',
-    'domina',
-    'dominance_with_regard',
-    'dominant\'',
-    'dominant-5',
-    'dominant-negative',
-    'dominant-party',
-    'dominant7',
     'dominate(d)',
-    'dominati',
-    'domination/',
-    'dominators',
-    'domineered',
-    'dominees',
-    'dominelli',
-    'dominicae',
-    'dominicaines',
-    'dominicalis',
-    'dominico',
-    'dominicoes',
-    'dominics',
-    'dominik',
-    'dominikanermuseum',
-    'dominikus',
     'dominio',
-    'dominion-hood',
-    'dominion_ahead',
-    'domino-effect',
-    'dominoing',
-    'dominos',
-    'dominque',
-    'dominy',
-    'domitilia',
-    'domitilla',
-    'domke',
-    'dommel',
-    'dommersen',
-    'domninique',
-    'domocracia',
-    'domoni',
     'domos',
-    'dompok',
-    'domsky',
-    'domville',
-    'domzalski',
-    'don\'t&rehy;another',
-    'don\'t-',
-    'don\'t-a',
-    'don\'t-all',
-    'don\'t-answer-back-i\'m-in-charge-here',
-    'don\'t-be-ridiculous',
-    'don\'t-be-silly',
-    'don\'t-bother-me',
-    'don\'t-care',
-    'don\'t-cares',
-    'don\'t-come-here',
     'don\'t-do',
-    'don\'t-f&mdash;with-me-heels',
-    'don\'t-give-a-fuck',
-    'don\'t-give-me-that',
-    'don\'t-know-who',
-    'don\'t-mind-us',
-    'don\'t-stand-in-my-way-or-else',
-    'don\'t-take-no-for-an-answer',
-    'don\'t-wake',
-    'don\'t-worry-you-won\'t-capsize',
-    'don\'tcha',
-    'don\'tee',
-    'don\'tski',
-    'don\'ty',
-    'don-eat',
-    'don-kosaken-chor',
     'don-t',
-    'dona-a-a-ation',
-    'donabedian',
-    'donabella',
-    'donadea',
-    'donagh',
-    'donaghamore',
-    'donaghcloney',
-    'donaghue/tenant',
-    'donahoe',
-    'donakey',
-    'donalbain',
-    'donalbane',
-    'donald/berinsfield',
-    'donald/brockweir',
-    'donald/broughton',
     'donald/cheddington',
-    'donald/cheltenham',
-    'donald/cirencester',
-    'donald/faringdon',
-    'donald/forest',
-    'donald/london',
-    'donald/milton',
-    'donald/ross-on-wye',
-    'donald/swindon',
-    'donald/wescote',
-    'donald/wescott',
-    'donald/westminster',
-    'donaldina',
-    'donaldo',
-    'donaldson\'s',
-    'donaldsonian',
     'donalis',
-    'donals',
-    'donarius',
-    'donatas',
-    'donate-and-buy',
-    'donatellos',
-    'donatien',
-    'donatilo',
-    'donatin\'',
-    'donation\'',
-    'donationes',
-    'donations/gifts',
-    'donatist',
-    'donative',
-    'donativum',
-    'donatory',
     'donats',
-    'donaul&auml;nder',
-    'donavan',
-    'donavint',
-    'doncaster-gainsborough',
-    'doncaster/retford/lincoln',
-    'doncaster/yorkshire',
-    'doncha',
-    'dondero',
-    'donders',
-    'dondeschiepolschuygen',
-    'dondois',
-    'done&rehy;over',
-    'done\'t',
-    'done/methods',
-    'done/then',
     'done_by',
-    'done_by_the_er',
-    'donee-based',
-    'donees',
-    'donegal\'s-most-famous-son',
-    'donegani',
-    'donegore',
-    'donehaving',
-    'donehower',
-    'doneyshiel',
-    'donfirm',
-    'donfloss',
-    'dong-minh',
-    'dong-son',
-    'donged',
-    'donger',
     'donges',
-    'dongfang',
-    'dongfeng',
-    'donggang',
-    'dongkhe',
-    'dongwan',
-    'doniambo',
-    'donichem',
-    'donike',
-    'doniol-volcroze',
-    'donis',
-    'donithorn',
-    'donizettian',
-    'donjela',
-    'donjons',
-    'donker',
     'donkey&rehy;jacket',
-    'donkey\'',
-    'donkey-beings',
-    'donkey-brown',
-    'donkey-dancing',
-    'donkey-driver',
-    'donkey-engines',
-    'donkey-fringe',
-    'donkey-head',
-    'donkey-loads',
-    'donkey-run',
-    'donkey-saddles',
-    'donkey-skin',
-    'donkey-stick',
-    'donkey-stoning',
-    'donkey-trappings',
     'donkey-work',
-    'donkey-y',
-    'donkey.',
-    'donkeymen',
-    'donkeyness',
-    'donkeys-and-backs',
-    'donkeywork',
-    'donkor',
-    'donkova',
-    'donlin',
-    'donm',
-    'donn&eacute',
-    'donn\'',
-    'donnachie',
-    'donnadieu',
-    'donnaj',
     'donnall',
-    'donnar',
-    'donnaz',
-    'donnees',
-    'donnelle',
-    'donnells',
-    'donnellsmithii',
-    'donnelly/jaguarsport',
-    'donnelly/promoter',
-    'donnely',
-    'donnenfeld',
-    'donnerwetter',
-    'donnery',
-    'donnini',
-    'donnino',
-    'donnis',
     'donnishly',
-    'donofrio',
-    'donogh',
-    'donohoe/dorset',
-    'donohue/captain',
-    'donohue/midsummer',
-    'donolo',
-    'donor(s)',
-    'donor-assisted',
-    'donor-card',
-    'donor-funded',
-    'donor/lender/vendor',
-    'donoring',
-    'donothingism',
-    'donou',
-    'donovan-you',
     'donovan/bank',
-    'donovan/gloucestershire',
-    'donovania',
-    'donovans',
-    'donsey',
-    'donside',
-    'dont\'',
-    'dont/cant',
-    'dontchathink',
-    'donts',
-    'dontun',
-    'donus',
-    'donusz/meszaros',
-    'donuzla',
-    'donwhill',
-    'donwpatrick',
     'donz&egrave;re',
-    'donzelot',
-    'donzels',
-    'doo-da',
-    'doo-dahed',
-    'doo-dahs',
-    'doo-doo-doodooo',
-    'doo-rag',
-    'dooars',
-    'doob-yar-na',
-    'doochary',
-    'doocots',
-    'dood',
-    'dooda',
-    'doodahs',
-    'doodler',
     'doodlewhang',
-    'doody/managing',
-    'dooey',
-    'doofer',
-    'doofers',
-    'doogfish',
-    'doohans',
-    'doohickeys',
-    'dooin\'',
-    'dookeepent-arch',
-    'dookeran',
-    'dool',
-    'dool&rehy;eys',
-    'doolally-land',
-    'doolay',
-    'doolb',
     'doom-and-gloomers',
-    'doom-dominated',
-    'doom-ikons',
-    'doom-loop',
-    'doom-merchant',
-    'doom-merchants',
-    'doom-monger',
-    'doom-rock',
-    'doom-shrouded',
-    'doom-tome',
-    'doom-watch',
-    'doom-watchers',
-    'doom-with-a-view',
-    'doom.',
-    'doom/christopher',
-    'doomsday-book',
     'doomsday-type',
-    'doomsdayers',
-    'doomster',
-    'doomwatching',
-    'doonans',
-    'doones',
-    'doonesbury',
-    'doonettes',
-    'doooom',
-    'dooooo',
-    'doopher',
-    'door&mdash',
-    'door&ndash',
-    'door&rehy;way',
-    'door\'',
-    'door(s)',
     'door(s)/door(s)',
-    'door(s)/final',
-    'door-arch',
-    'door-based',
-    'door-cases',
-    'door-chain',
-    'door-chime',
-    'door-curtain',
-    'door-flaps',
-    'door-frames',
-    'door-hanging',
-    'door-hangings',
-    'door-holt',
-    'door-key',
-    'door-knobbed',
-    'door-knobs',
     'door-knocking',
-    'door-locks',
-    'door-making',
-    'door-narb',
-    'door-open',
-    'door-opened',
-    'door-openers',
-    'door-opening',
-    'door-policy',
-    'door-prize',
-    'door-release',
-    'door-scraper',
-    'door-sculpture',
-    'door-seals',
-    'door-shutting',
-    'door-sill',
     'door-slamming',
-    'door-space',
-    'door-still',
-    'door-switch',
-    'door-viewer',
-    'door-way',
-    'door.part',
-    'door/',
-    'door/window',
-    'door_as',
-    'doorbelled',
-    'doorchain',
-    'doore',
-    'doored',
-    'doores',
-    'doorga',
     'doorhanger',
-    'doorjambs',
-    'doorlock',
-    'doorly',
-    'doormaker',
-    'doornails',
-    'doornfontein',
-    'doorperson',
-    'doorphone',
-    'doorplate',
-    'doors&mdash;i',
-    'doors-off',
-    'doors.',
-    'doors/stooges/mc5',
-    'doors/windows',
-    'doorseals',
     'doorstaff',
-    'doorstep-fresh',
-    'doorstep-of',
-    'doorstep.',
-    'doorsteppy',
-    'doorstone',
-    'doorstopper',
-    'doorstoppers',
-    'doorstopping',
-    'doorway.it',
-    'doorzetten',
-    'dooth',
-    'dooty',
-    'doover',
-    'doovers',
-    'dooving',
     'doowhat',
-    'dooyeweerd',
-    'doozy',
-    'dopac',
-    'dope-dealer',
-    'dope-fiend',
-    'dope-free',
-    'dope-heads',
-    'dope-painted',
-    'dope-peddling',
-    'dope-promoting',
-    'dope-sheet',
-    'dope-takers',
-    'dope-tested',
-    'dope-tribute',
-    'doped-out',
     'doped-up',
-    'dopehead',
-    'dopeman',
-    'doper',
-    'dopey-like',
-    'dopfner',
-    'dophiephin',
-    'dopiest',
-    'dopings',
-    'dopitova',
-    'dopler',
-    'dopolavoro',
-    'dopolavro',
-    'doppelg&auml;ngers',
-    'doppelgouache',
-    'dopple',
     'doppleganger',
-    'dopplemayr',
-    'dopramine',
-    'dopson',
-    'dopy',
-    'dopyera-designed',
-    'dor&aacute;ti',
-    'dor&zacute;ti',
-    'dora/national',
-    'doradan',
-    'dorank',
-    'doras',
-    'doratt',
-    'dorcas-like',
-    'dorcase',
-    'dorceus',
     'dorchester-on&rehy;thames',
-    'dordi',
-    'dorean',
-    'doree',
-    'dorego',
-    'doreian',
-    'dorell',
-    'dorendra',
-    'dorer',
-    'dores',
-    'dorey',
-    'dorf-just',
-    'dorfkrug',
-    'doria-pamphili',
-    'dorian&amp;sharp',
-    'doriano',
     'doric-speaking',
-    'doric-square',
-    'doric.',
-    'dorice',
-    'doriclea',
-    'dorie',
-    'dorigish',
-    'dorigo(1.9)',
-    'dorigo/speed',
-    'dorina',
-    'dorincourt',
-    'dorinskaya',
-    'doris-the-dinner-lady',
-    'dorival',
-    'dork2',
-    'dorken',
     'dorkins',
-    'dorks',
-    'dorksteiner',
-    'dorlhac',
-    'dorligjav',
-    'dorligshaw',
-    'dorm\'nt',
-    'dormagen',
-    'dormandy',
-    'dormansland',
-    'dormante',
-    'dormer-roofed',
-    'dormer-windowed',
-    'dormered',
-    'dormeuil',
-    'dormey',
     'dormez',
-    'dormi',
-    'dormia',
-    'dormington/herefordshire',
-    'dormit',
-    'dormite',
-    'dormitory-style',
-    'dormond',
-    'dormonside',
-    'dormouse&rehy;friendly',
-    'dorneywood',
-    'dornr&ouml;schen',
-    'dornseif',
-    'doroga',
-    'dorogobuzhskii',
-    'doronicum',
     'doroszczuk',
-    'dorota',
-    'doroth&eacute;e',
-    'dorothe',
-    'dorothie',
-    'dorothys',
-    'dorovernis',
-    'dorpped',
-    'dorps',
-    'dorpserven',
-    'dorra/national',
-    'dorrf',
-    'dorridge',
-    'dorrisons',
-    'dorro',
-    'dorronsoro',
     'dorsa',
-    'dorsal/lateral',
-    'dorsar',
-    'dorset-hampshire',
-    'dorset/hampshire',
-    'dorsett',
-    'dorsey/dustin',
-    'dorsiocellata',
-    'dorsman',
-    'dorso-medially',
-    'dorso-ventrally',
-    'dorsoduro',
-    'dorson',
-    'dorsoventrally',
-    'dorter',
-    'dortic&oacute;s',
     'dorum',
-    'dorusduain',
-    'dorville',
-    'dorward',
-    'dorward/lib',
-    'dorylus',
-    'dorz',
-    'dos-msnet',
-    'dos-only',
-    'dos/ibm',
-    'dos/vs',
-    'dos/vs(e)',
-    'dos/vse',
-    'dos=umb',
-    'dosaaf',
-    'dosapps.ini',
     'dose-boarded',
-    'dose-cropped',
-    'dose-dependently',
-    'dose-responses',
-    'dose.',
-    'dosell',
-    'dosemealti',
-    'dosen',
-    'doser',
-    'doshak',
-    'dosia',
-    'dosifey',
-    'dosimeter',
-    'dositejism',
-    'dositube',
-    'doskey',
     'doskey.com',
-    'dosmate',
-    'dosogne',
-    'dosposition',
-    'doss-houses',
-    'dosser.',
-    'dossetter',
-    'dosshell.ini',
-    'dosshouses',
-    'dossi',
-    'dossing-down',
-    'dossvidanya',
-    'dostioevsky',
-    'dostoeosky',
-    'dostoyevksy',
-    'doszkocs',
     'dot-dash',
-    'dot-dashed',
-    'dot-filled',
-    'dot-free',
-    'dot-fret',
-    'dot-markers',
-    'dot-to-dot',
-    'dot/full',
-    'dotards',
-    'dothegirls',
-    'dotherin\'',
-    'dothiepin',
-    'dothill',
-    'dotis',
-    'dotos',
-    'dotronix',
     'dots&mdash;a',
-    'dots-per-inch',
-    'dots/s',
-    'dots/subarea',
-    'dotsam',
-    'dotted-note',
-    'dotted-rhythms',
-    'dotter',
-    'dottier',
-    'dottily',
-    'dottin',
-    'dottingham',
-    'dottings',
-    'dottle',
-    'dotto',
-    'dotton',
     'dottora',
-    'dottrens',
-    'dottridges',
-    'douaihy',
-    'douanier-like',
-    'douay',
-    'doub',
-    'doubin',
-    'doublas',
-    'double&mdash;glazing',
-    'double&ndash;headed',
-    'double&rehy;cross',
-    'double&rehy;crossed',
-    'double&rehy;decker',
-    'double&rehy;glazing',
-    'double&rehy;jointedness',
     'double&rehy;locked',
-    'double&rehy;meaning',
-    'double&rehy;spaced',
-    'double&rehy;stitched',
-    'double-\'sticky\'',
-    'double-0-seven',
-    'double-a-1',
-    'double-a-3',
-    'double-adult',
-    'double-adzes',
-    'double-agent',
-    'double-aided',
-    'double-and',
-    'double-arcaded',
-    'double-arched',
-    'double-armed',
     'double-arrowed',
-    'double-asterisked',
-    'double-axe-hand',
-    'double-backed',
-    'double-backers',
-    'double-backing',
-    'double-bacon-andegg',
-    'double-bagged',
-    'double-bagging',
-    'double-balanced',
-    'double-bank',
-    'double-bar',
-    'double-barrel',
-    'double-basses',
-    'double-bedded',
-    'double-bedroom',
     'double-being',
-    'double-blend',
-    'double-bluffs',
-    'double-bogied',
-    'double-boilered',
-    'double-bolt',
-    'double-bomb',
-    'double-bonded',
-    'double-booking',
-    'double-bookings',
-    'double-books',
-    'double-bound',
-    'double-box-of-popcorn',
-    'double-breasting',
-    'double-byte',
-    'double-capsid',
     'double-case',
-    'double-checker',
-    'double-checks',
-    'double-chimneyed',
-    'double-chins',
-    'double-chock',
-    'double-choir',
-    'double-clasped',
-    'double-clicking',
-    'double-clipped',
-    'double-columned',
-    'double-count',
-    'double-credit',
-    'double-cropping',
-    'double-crossers',
-    'double-crown',
     'double-crusted',
-    'double-cube',
-    'double-cult',
-    'double-cupped',
-    'double-curved',
-    'double-cycle',
-    'double-date',
-    'double-dated',
-    'double-dates',
-    'double-defensible',
-    'double-delta',
-    'double-density',
-    'double-diffusive',
-    'double-digest',
-    'double-digested',
-    'double-ditched',
     'double-door',
-    'double-draught',
-    'double-drill',
-    'double-dutch',
-    'double-dyed',
-    'double-edge',
-    'double-engined',
-    'double-ethnography',
-    'double-exposure',
-    'double-faceted',
-    'double-faulted',
-    'double-feature',
-    'double-fisherman',
-    'double-fleeced',
-    'double-fold',
-    'double-furrow',
     'double-game',
-    'double-garaged',
-    'double-gate',
-    'double-gated',
-    'double-glass',
-    'double-green',
-    'double-handers',
-    'double-handle',
-    'double-harnessed',
-    'double-harp',
-    'double-headed-eagle',
-    'double-hernia',
-    'double-hinged',
-    'double-hundreds',
-    'double-hung',
-    'double-income',
     'double-kick',
-    'double-kiss',
-    'double-knits',
-    'double-knitted',
-    'double-knot',
-    'double-knotting',
-    'double-layer',
-    'double-leaf',
-    'double-leafed',
-    'double-leaved',
-    'double-lifing',
-    'double-listed',
-    'double-lock',
-    'double-looped',
-    'double-lungful',
-    'double-mambas',
     'double-marked',
-    'double-meanings',
-    'double-member',
-    'double-membraned',
-    'double-mindedness',
-    'double-molecule',
-    'double-mounted',
-    'double-mugging',
-    'double-muscle',
-    'double-narrative',
-    'double-necked',
-    'double-necks',
-    'double-negative',
-    'double-note',
-    'double-noted',
-    'double-occupancy',
     'double-opening',
-    'double-or-more',
-    'double-or-single-breasted',
-    'double-overtime',
-    'double-paddle',
-    'double-past',
-    'double-pit',
-    'double-platinum',
-    'double-play',
-    'double-pouched',
-    'double-precision',
-    'double-printing',
-    'double-pronged',
-    'double-prowed',
-    'double-pulse',
-    'double-quarter',
     'double-ratio',
-    'double-refined',
-    'double-resonance',
-    'double-rhyme',
-    'double-role',
-    'double-run',
-    'double-save',
-    'double-scan',
-    'double-scroll',
-    'double-sculling',
-    'double-sentence',
-    'double-session',
-    'double-sexed',
-    'double-shafted',
-    'double-sheet',
-    'double-shell',
     'double-six',
-    'double-size',
-    'double-skin',
-    'double-span',
-    'double-spout',
-    'double-spurred',
-    'double-spy',
-    'double-stage',
-    'double-staircase',
-    'double-standards',
-    'double-stemmed',
-    'double-step',
-    'double-stepping',
-    'double-storey',
-    'double-substitution',
-    'double-sure',
     'double-symphonic',
-    'double-talk',
-    'double-tapered',
-    'double-tax',
-    'double-thatched',
-    'double-the-number-you-first-thought-of',
-    'double-thinking',
-    'double-thump',
-    'double-tied',
-    'double-tier',
-    'double-tiered',
-    'double-timed',
-    'double-tit',
-    'double-took',
-    'double-toothed',
-    'double-top',
     'double-topped',
-    'double-tracking',
-    'double-transplant',
-    'double-trap',
-    'double-try',
-    'double-tyretrack',
-    'double-u',
-    'double-underlined',
-    'double-values',
-    'double-vault',
-    'double-vented',
-    'double-voiced',
-    'double-voicedness',
-    'double-wall',
-    'double-walled',
-    'double-whamming',
     'double-whetton',
-    'double-wind',
-    'double-winners',
-    'double-winning',
-    'double-work',
-    'double-world',
-    'double-wrapped',
-    'double-yolked',
-    'doublea-minus',
-    'doublebacked',
-    'doublebarrelled',
-    'doublebind',
-    'doublechecked',
-    'doubleclickspeed=452',
-    'doubled&rehy;over',
-    'doubled-co',
     'doubled-locked',
-    'doubled-sided',
-    'doubled.',
-    'doubled.the',
-    'doubleday/black',
-    'doubledoors',
-    'doubledutch',
-    'doubleglazed',
-    'doubleglazing',
-    'doubleheader',
-    'doublelash',
-    'doubleminded',
-    'doublemindedness',
-    'doubleneck',
-    'doublenesse',
-    'doublere',
     'doubleres',
-    'doublesign',
-    'doubletaking',
-    'doubleted',
-    'doubleyour-money',
-    'doublingof',
-    'doublle-digit',
-    'doubloon',
-    'doublures',
-    'doubly-bereaved',
-    'doubly-determined',
-    'doubly-deviant',
-    'doubly-good',
-    'doubly-inverted',
-    'doubly-sexist',
-    'doubt-ridden',
     'doubt-sowing',
-    'doubt/till',
-    'doubtfire',
-    'doubtful-looking',
-    'doubtfull',
-    'doubtfuls',
-    'douce-am&egrave;re',
-    'douch',
-    'douchmanov',
-    'doucments',
-    'douct',
-    'douds',
-    'doudy',
-    'dougallii',
-    'dougans',
-    'dougary',
     'dough-like',
-    'dough-nutting',
-    'dough-shaped',
-    'dough.',
-    'doughan',
-    'doughball',
-    'doughballs',
-    'doughlike',
-    'doughmen',
-    'doughnut-shape',
-    'doughnut/ask',
-    'doughnutting',
-    'doughtie',
-    'doughtily',
-    'doughty-featured',
-    'doughtys',
     'douglah',
-    'douglas&rehy;home',
-    'douglas-',
-    'douglas-based',
-    'douglas-homes',
-    'douglas-orientated',
-    'douglas/district',
-    'douglas/malvern',
-    'douglas/northrop',
-    'douglas/playgroup',
-    'douglasdale',
-    'douglasii',
-    'douglo',
-    'douhe',
-    'doukaga',
-    'doulab',
     'douleur',
-    'doulgas',
-    'doumas',
-    'doumen-trained',
-    'doumenc',
-    'doumer',
-    'doungous',
-    'dounray',
-    'doupamby',
-    'doupamby-matoka',
-    'dour-looking',
-    'dourdin',
-    'dourest',
-    'dourif',
-    'douris',
-    'doushantuo',
     'dousland',
-    'dout',
-    'doutfire',
-    'douthland',
-    'doutoum',
-    'doutoummines',
-    'douvan',
-    'douven',
-    'douwes',
-    'douyon',
-    'douz',
-    'douze/dieus',
-    'douzet',
-    'douzets',
-    'dov&rcaron&aacute;k',
-    'dovana',
     'dovber',
-    'dove-coloured',
-    'dove-tees',
-    'dove-topped',
-    'dove-tree',
-    'dove-white',
-    'dove-winged',
-    'dovecots',
-    'dovedaly',
-    'doveishly',
-    'dovekin',
-    'dovely',
-    'dover&mdash;calais',
-    'dover-dunkirk',
-    'dover-folkestone',
-    'dover/folkestone',
     'dovercourt.the',
-    'dovered',
-    'doverhay',
-    'doverow',
-    'doverstrand',
-    'dovesse',
-    'dovetailer',
-    'dovgan',
-    'dovil',
-    'doving',
-    'dovish',
-    'dovleti',
-    'dovr&ograve',
-    'dovre',
-    'dovvy',
-    'dow&ndash',
     'dowager-like',
-    'dowayoland',
-    'dowbiggen',
-    'dowcett',
-    'dowd/neighbour',
-    'dowdales',
-    'dowdeswell/rsc',
-    'dowdier',
-    'dowdiest',
-    'dowdily',
-    'dowdings',
-    'dowdney/kevin',
-    'dowdswell',
-    'doweling',
-    'dower-house',
-    'dower-lands',
     'dower/countryside',
-    'dowers',
-    'dowex',
-    'dowfield',
-    'dowgang',
-    'dowi',
-    'dowitcz',
-    'dowl',
-    'dowl.',
-    'dowlen',
-    'dowley',
-    'dowlie',
-    'down&gt',
-    'down&mdash',
-    'down&ndash;graded',
-    'down&rehy;graded',
     'down&rehy;hearted',
-    'down&rehy;loaded',
-    'down&rehy;longford',
-    'down&rehy;side',
-    'down&rehy;stream',
-    'down&rehy;to',
-    'down&rehy;valuing',
-    'down\'n',
-    'down-a-step',
-    'down-an\'-outs',
-    'down-and-out.',
-    'down-and-outer',
-    'down-at-the-heel',
-    'down-atheel',
-    'down-awn',
-    'down-blast',
     'down-branch',
-    'down-by',
-    'down-channel',
-    'down-climb',
-    'down-climbed',
-    'down-climbing',
-    'down-column',
-    'down-country',
-    'down-covered',
-    'down-curled',
-    'down-drawn',
-    'down-drift',
-    'down-fine',
-    'down-flexure',
-    'down-flow',
-    'down-force',
     'down-from-town',
-    'down-glacier',
-    'down-gradings',
-    'down-gyred',
-    'down-homey',
-    'down-in',
-    'down-in-the-mouth',
-    'down-jacket',
-    'down-lake',
-    'down-line',
-    'down-longford',
-    'down-memory-lane',
-    'down-modulate',
-    'down-nodes',
-    'down-on-his-luck-but-permanently',
-    'down-on-its-luck',
     'down-pillar',
-    'down-pipe',
-    'down-play',
-    'down-playing',
-    'down-plunging',
-    'down-pointing',
-    'down-pour',
-    'down-problems',
-    'down-pseudo-cost',
-    'down-putting',
-    'down-right',
-    'down-scale',
-    'down-scatter',
-    'down-seeds',
-    'down-setting',
-    'down-shaft',
     'down-shop',
-    'down-specific',
-    'down-spinning',
-    'down-spout',
-    'down-state',
-    'down-strokes',
-    'down-stuffed',
-    'down-sweep',
-    'down-swings',
-    'down-the-card',
-    'down-the-middle',
-    'down-the-place',
-    'down-thrown',
-    'down-thrusted',
-    'down-time',
-    'down-to',
     'down-tools',
-    'down-tow',
-    'down-trading',
-    'down-turns',
-    'down-wave',
-    'down-weather',
-    'down-well',
-    'down-whole',
-    'down.',
-    'down.charge',
-    'down.i',
-    'down.then',
-    'down/',
-    'down/but',
-    'down/ditched/jammed',
-    'down/gloucestershire',
     'down/left',
-    'down/rambo',
-    'down/swimmer',
-    'down/the',
-    'down_as',
-    'down_in_front',
-    'down_to',
-    'downay',
-    'downbent',
-    'downbird',
-    'downchanges',
-    'downdraughts',
-    'downdrift',
-    'downer/trialist',
-    'downes/show',
-    'downes/victim',
     'downfall.',
-    'downfilled',
-    'downflex',
-    'downfolds',
-    'downful',
-    'downheartening',
-    'downhiller',
-    'downhurling',
-    'downily',
-    'downin',
-    'downing-street',
-    'downlighting',
-    'downlinked',
-    'downloader',
-    'downlooking',
-    'downloops',
     'downm',
-    'downman',
-    'downmanning',
-    'downness',
-    'downpage',
-    'downpour.',
-    'downproof',
-    'downrated',
-    'downregulating',
-    'downs/peace',
-    'downs/player',
-    'downs/staffordshire',
-    'downscale',
-    'downshay',
-    'downshurst-bound',
-    'downsian',
     'downside-up',
-    'downsizing-bent',
-    'downsizing/rightsizing',
-    'downslide',
-    'downspout',
-    'downspouts',
-    'downsta',
-    'downstaging',
-    'downstair',
-    'downstairts',
-    'downstep',
-    'downswivel',
-    'downtempo',
-    'downthrow',
-    'downtide',
-    'downtons',
     'downtowner',
-    'downturning',
-    'downturns.questor',
-    'downview',
-    'downward&rehy;pointing',
-    'downward-angled',
-    'downward-compatible',
-    'downward-decreasing',
-    'downward-deflected',
-    'downward-shifted',
-    'downward-slammed',
-    'downward-swooping',
-    'downwearing',
-    'downweight',
-    'downwind-.',
-    'downy-cheeked',
     'downy-clad',
-    'dowrick',
-    'dowrog',
-    'dowrs',
-    'dowry.',
-    'dows',
-    'dowsland',
-    'dowth',
-    'dowties',
-    'doww',
-    'dowwnn',
-    'doxazocin',
-    'doxological',
-    'doxorubicin',
-    'doyle-davidson',
-    'doyle/dealer',
     'doylerush',
-    'doylish',
-    'dozen/ten',
-    'dozenth',
-    'doziest',
-    'doziness',
-    'dozing-off',
-    'dozzel',
-    'dp&mdash;proletarian',
-    'dp-1/e2f-1',
-    'dp-2',
-    'dp-210',
-    'dp-controlled',
-    'dp.sc.aeasoe',
-    'dp/sc/special',
-    'dp2',
     'dp2.5',
-    'dp651075',
-    'dph',
-    'dpl',
-    'dply',
-    'dpm/&micro;g',
-    'dpmi-based',
-    'dpn',
-    'dpn-100s',
-    'dpn8/90',
-    'dpns',
-    'dpnss',
-    'dposits',
-    'dpou-19',
-    'dpou-28',
-    'dpou28',
     'dprs',
-    'dps/7',
-    'dps600',
-    'dpss',
-    'dpx20',
-    'dq-timecoder',
-    'dqf-cosy',
-    'dql',
-    'dr&ocirc;lerie',
-    'dr&uacute;-',
-    'dr&uacute;adan',
-    'dr&uacute;edain',
-    'dr&uuml;ben',
-    'dr&yacute;-cr&aelig;ft',
-    'dr\'gasia',
-    'dr-110',
     'dr-550',
-    'dr-6000s',
-    'dr-i',
-    'dr-negative',
-    'dr.1051',
-    'dr.berry',
-    'dr.calamy',
-    'dr.cullen',
-    'dr.e.spanopoulou',
-    'dr.gauden',
-    'dr.lloyd-jones',
-    'dr.martyn',
-    'dr.patrick',
-    'dr.stephen',
-    'dr.thomas',
-    'dr.winston',
     'dr160,000',
-    'dr2',
-    'dr200',
-    'dr300/400',
-    'dr550',
-    'dr90',
-    'dra&zcaron;ice',
-    'drab-coloured',
-    'drab-looking',
-    'drab-trousered',
-    'drabble/author',
-    'drabbled',
-    'drably-coloured',
-    'draca',
-    'drachma**',
-    'drack',
     'dracmas',
-    'draconius',
-    'dracott',
-    'dracula-like',
-    'dracunculiasis',
-    'draeger',
-    'draft\'',
-    'draft-bill',
-    'draft-project',
-    'draft/constitution',
-    'drafted-in',
-    'drafted.',
-    'drafting.',
-    'draftlaw',
-    'draftman',
-    'draftsmancurrent',
     'drag\'n',
-    'drag-anchor',
-    'drag-arse',
-    'drag-artist',
-    'drag-back',
-    'drag-backs',
-    'drag-down',
-    'drag-free',
-    'drag-hag',
-    'drag-hunting',
-    'drag-lift',
-    'drag-like',
-    'drag-line',
-    'drag-lines',
-    'drag-net',
-    'drag-out',
     'drag-queen',
-    'drag-racers',
-    'drag-ropes',
-    'dragados',
-    'dragahn',
-    'draganescu',
-    'draganov/georgiev',
-    'dragasakis',
-    'dragbellies',
-    'drages',
-    'dragged-down',
-    'dragger',
-    'draggin\'',
-    'dragging-and-dropping',
-    'dragging-hopping',
-    'dragging.',
     'dragging.tell',
-    'draggle',
-    'draghici',
-    'draghounds',
-    'dragi&scaron;a',
-    'draglifts',
-    'draglines',
-    'draglink',
-    'dragnignazzo',
-    'drago/geminis',
-    'dragomen',
-    'dragon-clasp',
-    'dragon-decorated',
-    'dragon-dictate',
-    'dragon-fillers',
-    'dragon-god',
     'dragon-haunted',
-    'dragon-headed',
-    'dragon-heads',
-    'dragon-hide',
-    'dragon-in-charge',
-    'dragon-killing',
-    'dragon-master',
-    'dragon-mounted',
-    'dragon-ship',
-    'dragon-sized',
-    'dragon-stamp',
-    'dragon-stands',
-    'dragon-vanquishing',
-    'dragon-winged',
-    'dragon-wings',
-    'dragon-wort',
     'dragon.',
-    'dragonair',
-    'dragonback',
-    'dragonboat',
-    'dragondictate-7-k',
-    'dragone',
-    'dragonera',
-    'dragoneras',
-    'dragones',
-    'dragonets',
-    'dragonfire',
-    'dragonfish',
-    'dragonflair',
-    'dragonflair/european',
-    'dragonhead',
-    'dragonhide',
     'dragonhome',
-    'dragonlady',
-    'dragonlands',
-    'dragonlords',
-    'dragonrage',
-    'dragonwoman',
-    'dragos',
-    'dragoshi',
-    'dragoumis',
-    'dragovit',
-    'dragsholm',
-    'dragsmen',
-    'dragster',
-    'dragstrip',
-    'draguer',
-    'drain-age',
     'drain-all',
-    'drain-clogging',
-    'drain-edged',
-    'drain-hole',
-    'drain-like',
-    'drain-pipe',
-    'drain-runs',
-    'drain/source',
-    'drainable',
-    'drainage-minded',
-    'drainages',
-    'draine',
-    'drained-looking',
-    'drainhead',
-    'drainie',
-    'drainin\'',
     'draino',
-    'drainpiped',
-    'drainshoe',
-    'draka',
-    'drakakis-smith',
-    'drake-ish',
-    'drake.but',
-    'drake/smith',
-    'drake/sub-postmistress',
-    'draken',
-    'drakensburg',
-    'drakon',
-    'drakos',
-    'drakoulis',
-    'dram-divans',
-    'drama-documentaries',
     'drama-draining',
-    'drama-made-music',
-    'drama-maker',
-    'drama-through-movement',
-    'drama/',
-    'drama/documentary',
-    'drama/english',
-    'drama/music/essay-writing/cookery/coming',
-    'drama/percussionists',
-    'drama/theatre',
-    'dramane',
-    'dramarama',
-    'dramat',
-    'dramatherapist',
-    'dramatherapy',
-    'dramati&rehy;cally',
     'dramatic-coloured',
-    'dramatic-sounding',
-    'dramatic/change',
-    'dramatic/recitative',
-    'dramatically-bent',
-    'dramatick',
-    'dramatizations',
-    'dramaturgic',
-    'dramaturgically',
-    'dramm',
-    'dranich',
-    'dranked',
-    'drapa',
-    'drapability',
-    'drapable',
-    'draparnaudi',
     'drapchai',
-    'drape-over',
-    'drape-suits',
-    'drapeability',
-    'drapeau',
-    'draper/aston',
-    'draper/paul',
-    'drapersfield',
-    'draperstown&mdash;plumbridge',
-    'drapery-folds',
-    'drapier',
-    'drapings',
-    'drasdo',
-    'drastically-altered',
-    'drastically-increased',
-    'drastically-reduced',
     'draug',
-    'draught-and-meat',
-    'draught-board',
-    'draught-flow',
-    'draught-horse',
-    'draught-oxen',
-    'draught-play',
-    'draughtiest',
-    'draughtmanship',
-    'draughts.',
-    'draughtstrip',
-    'draughtworks',
-    'dravs',
-    'draw&rehy;back',
-    'draw\'',
-    'draw-a-man',
     'draw-back',
-    'draw-bridge',
-    'draw-leaf',
-    'draw-out',
-    'draw-stringing',
-    'draw-type',
-    'draw-well',
-    'draw-win-draw',
-    'drawcorded',
-    'drawd',
-    'drawe',
-    'drawee/acceptor',
-    'drawen',
-    'drawer-liners',
-    'drawer-unit',
-    'drawes',
     'drawice',
-    'drawing&rehy;pins',
-    'drawing-book',
-    'drawing-card',
-    'drawing-offices',
-    'drawing-pad',
-    'drawing-room\'',
-    'drawing-together',
-    'drawing.pcx',
-    'drawing.room',
-    'drawing/',
-    'drawing/design',
-    'drawing/discussing/other/as',
-    'drawing/negotiating/telephoning',
-    'drawings/presentations',
-    'drawn&mdash',
     'drawn&rehy;out',
-    'drawn\'\'',
-    'drawn-4.30',
-    'drawn-down',
-    'drawn-in',
-    'drawn-thread-work',
-    'drawn.',
-    'drawn.6',
-    'drawn.b',
-    'drawn_out',
-    'drawn_up',
-    'drawover',
-    'drawrin\'',
-    'draws_near',
-    'drawsheets',
-    'drawyn',
     'draxler',
-    'dray-pulling',
-    'draycart',
-    'draycott/shopowner',
-    'drayhorses',
-    'drayning',
-    'drayton/oxfordshire',
-    'draza',
-    'drazh',
-    'drbs',
-    'dread&rehy;nought',
-    'dread-ful',
-    'dread-making',
-    'dread-swinging',
-    'dread/the',
-    'dreaded-value-for-money',
     'dreadful-looking',
-    'dreadful.',
-    'dreadfull',
-    'dreadfuls',
-    'dreadheads',
-    'dreadnought-accustomed',
+)
+
+blocks_80 = (
+    '\'-/multiplexity($unit$!u%!m$%worth#(t-de-rat$$/hop%&mother%(national%$oxon%\'stephen%\'trading$\'al-care&!s\'*/alveolars',
+    '%%nurse%#tus$$elin%%rgens%!x$.fert-rochereau$$head$%icles%$form%#ger%!n%(st&mdash\'%-type\')/optician0,/chiropodist',
+    '(\'/dental%%tions$(on-white&!s%$plan%"rn&!y$&rifice$#une%&reless$#zel#+uclearizing$\'diation$\'nciator#%ville',
+    '$\'s-drash#%ziloe"\'obandis#-cynojirimycin#$dato$\'erizing$6orants/antiperspirants&$iser(#ing\'"ze##gar$%ratia#!k#$lali#%mcrat',
+    '#$nata$#tic%%ology#"rc$"um##sil$#sum#+xyadenosine%(cholate.%&genate*#ing%.mannojirimycin%+nojirimycin&*ucleotides%.ribonucleotide',
+    '""p5#+aganisation)!e$&nments$,rafinisation%(l-mental%$ment%%olles%-t&rehy;mental0!s&\'amentul&#ed.\'\'mentale&\'ization&$mens',
+    '*!-+,commissioned+(specific,$tyle+$wide*!.*)/activity+&oxford+/school/division**al/faculty-)sectional,#ise-$zing,*ly-related*"ly',
+    '+!f*"s/,*activities-#rea-+ssociations,%heads,\'schools-\'ections\'"nt&(ure-time)!/*&return$"ul&!a%!w',
+    '#$eaux$,n&rehy;dency%&dancie&.ence-producing*!/)"y\'*#-in+,through-loss*1/op&rehy;pression((t-clause*(relative),ly-necessary\'"th&!i\'$stas',
+    '\'\'/solely%%edant$\'rdussin%"et%%tment$$yrot$#zay#,hosphorizing*%ylate/!s#"ia$%cted.$"ed$$gged%&mented',
+    '%"ex$$pped$"te##lan$$edge%$tant&"er$&oyable#(oe/coach$%isson$\'larises($zers%\'iticise%$lute%(ymerizes',
+    '&#nts&"re$\'pulator$)rtationof&#iva$#se.%#it-($base(\'feeding\'#are)#ies)+y-custodian\'\'ed(2,3)*"4))!.',
+    '%#tes%#uit$)t-workers%(entiated$%wered\'#ing#%peana%!i%!r#)radations%%tment$.e&rehy;dations%&cantum\'&tionis&+iation/wear',
+    ')#ors%!s&3sed&mdash;releasing)!-(!r\'+ing-looking*"lv(&on-hit*":3\'%urize$-iva&rehy;tion\',tion&mdash;a+)/cultural(#ory&&ileged',
+    '0#ing/&zation%&gramme+"rs%/letarianisation%(teinised*$zing&&onated#!s$!e$)ipeptides%"te#&t(a10)$%-head$".m',
+    '%)-averaged&&charge,!s\'&ontour)&verted&\'defence\'\'iameter&)interview&*perception%!.&%while%,/temperature%(lessness#(urinated$-ta&rehy;tions',
+    '(&-elect&\'zations%.y-chairmanship(+ommissioner\')governors\'*lieutenant1!s\'%mayor\'(shepherd&*_in_charge"%queen$!i"\'r-chuen$-de-der-de-der$+to-shoulder',
+    '&&nating$)dicalised+#ing*#zed$\'ilments$!n%%gedly$"sa%"ge$#ted%&inised#!b$"y-&1buxton-manchester&&winner',
+    '&%epsom%!2%"s.&1hire-warwickshire*!/+%south#*ealisation$"ck%&ognise+!d)#zed$-gionalization&)strations%&lation%+ularization',
+    ')0ory/reregulation$!h$*ligionized$!n%*&ccaron;in%"ne$"so%\'tricted$$vnia&"ya#/freisch&uuml;tz#&ganagh##ham#"ig$$jcke',
+    '%#ict$#ous$$vati(#on.(%ve(s)(&zation)"ed%#era%)itisation#!k$%nesse##lin#!m$)a-optical&\'surgery',
+    '%&logica%%titic("us&!o\'4-venereo-andrologist/\'logical\'0logically-tested\'\'mycoses\'(philosis\'#ses("is&#ron$"er$$itze$*o-muscular',
+    '%%genys%%ptera%%rphin%%thill%$vate#$ndan$!e$$helm$&ie/meb(\'idlands&#res%!n$!t#&oceras$(gatively',
+    '$!m%+pompompedom$"ta&$tion$%uesne&!t%$nian%"te#$pive#&ramore%&nville$#eck%)tt/cooper$(ick/ebco&#ott',
+    '&#ian%+e&egrave;re&#res%!k%$nger\'!s\'#ton&%stown$)y-donegal%,/londonderry%#add%$boye%%carne&$hrin%$down',
+    '%$hale%#lee&.in-ballinaleck%$more%%swood%$vale#!s$#ely$-imonian-laird$#ley$"on$!u#&touzis#)ugulation$"ta',
+    '%\'sipping$"al$$ille%\'sh-like$!y#!w$\'entcote\'&waters$"in&#ger&#sky#!x#"yn%"ck#%zhala',
+    '"3s&eacute;tatisation#\'-cribes$#res$$troy(#ing#%/dhss$#hmi&"so#!a$(cralises)&zation$\'guliers$$illy%!x$*linisation',
+    '$(nctified%!o%"ti$$raed%#gue%!t$!t%%urase(#ted*!s)$ions#(bruslais#!c$%alent\'"rs',
+    '%!r$!e%%ndeth\'"it&*mascaremos&\'t-group(%lines($rate$)hamp/camp&#nel%&oolers$#ibe\'!d&#ing%$ples',
+    '%(erotized$!o%$ping%%teaux$!r%&ibedby("s.&"es&+p&rehy;tion\'!.\'#tif)!o**n&mdash;in++-prediction,%types',
+    ',-specification,(transfer+"s\',!.,0/interpretations),ve-inductive*#ism,"ts%&uction$%tibed%\'ruction#$eart%#ses$\'lecting(!s',
+    '%%rasca%&sitise)$zing%*volvimento$(quilibre$$rere%)t-adapted\'*camouflage(&overed\'&flower\'(hardened\'#rat\'\'stained&$land%!v',
+    '&%ingly$#xed%\'ualizes*#ing#+ferroxamine$%outre#\'georges$&raupes#/habill&eacute;e)%e-toi%%premi$&elving%,rit&eacute;e$#ima%&scence',
+    '$&prabhu#&iatiny$!c$#der\'"a\'(#ted*!s)"us\'!o$#end$\'gn&copy&!\'&!-\')assistant\'1built-and-operate',
+    '\'\'centred\'$disc\')generated\')languages\'&office\'-professionals\'*speciality\'0to-manufacturing(#ype\'0your-own-holiday&$.and&%/cost\'(drafting\'\'project\'%style',
+    '&#_as&(atronics("um&$base&+ed&mdash;to(!\'(2-for-primo-carnera))to-appeal("ly\'"es\'"r-)\'clothes*(onscious*&reased))expensive',
+    '*$reen)(jacketed)(letterer)&makers+*nufacturer**onogrammed)\'plaster*(roducers)(selected*#oul*%uited)$wear(!.(2/builder/decorator)(director',
+    ')\'printer+&oducer)\'stylist)$user($isms("ly($shop($wear\'!s&%files&+information(-g/prototyping&%w.pcx\'\'orkshop$#lla',
+    '$$nens$!o$$pere%%ience%"te%"ur$(r&eacute%)abilities+.y&mdash;behind\'&leness&"nd%+e-breaching\'\'clouded\'(darkened\'%lines',
+    '&!/\'-impossibility\'$need\'&people\',subjectivity&$less&"th%\'ing-can%!s$#sta#\'jenigen#,k&rehy;based*%clerk$!\'$)-attached',
+    '%(computer\'%nsole%%diary&%rawer%$high%&jockey+!s%(pounding&\'ropping%#set&#ide\'%tting\'#zed&$tudy%$tank',
+    '\'"ps\'"ys%$work$&.simon$$/hot$#ill\'8ing/upskilling/economics$#man$$pros$%sides$$talk%#ech%$op-j(-to-datacentre+)mainframe',
+    '(+workstation##lon%%ughed$&udging#&marere\'"st\'"ts$"et$$iers$$odus%\'iselles\'&selles%#ndo%\'plastic%#ret',
+    '%$tomy%$ulia("ns%1vilizaci&oacute;n#!n#.olaci&oacute;n&3te-andmisunderstood\'#ing(#ons\'!o(!n%#der$$rber&!s$"to',
+    '&-ribosenucleic$"ys#"pa%&ir.the\'//existentialism\'%ed-of%&retely&#tie%(tch-boat+!x)&riders,#ing(#ed/)"rs)"s.',
+    '%!x$&eignes%!r&&antium\'#te-*#for*\'seeming*(to-sleep)&ly-ill,&sought+!.)$ness($ions("ly&!d',
+    '%+ritualizing%!s&"er(!s\'"th%-te-everything\'%fully$(oilation\'$ment%(liations%&ndancy\'+ent&ndash;y%$rtes%%sited($ions',
+    '#!q$(uamative#%ribed$&osiers%#yed#\'s-beech$"ay$!e%#ase%"in%$rbil&(t-plates((spoonful\'$fork\'%knife',
+    '%$karb$#ler$&oulavy#"ta%(balising%&linise&#ked$"ec%!p$(igmatise*$zing%"na\'0tion&rehy;sanson+)/waypoint&\'y&ndash',
+    '\')-on-sparc%,velle/stefan$#ock%&olment%!p%"ry\'#ing$"ra&%ction&$ined&(nsformed%&essers%#oyd\'(er-class*(escorted',
+    '\'#in\'%,uc&rehy;tion\'%cioun\'(tability)&vision(,ion/creation+!n&$xins#)ublimated+!s*#ion$%ggest$(lfomonas\')tomaculum\'\'vibrios',
+    ')#ing)"ng\'%urise,!d*"ze+#ing$#per#0valli&egrave;res(%evres#2y&mdash;democratic$&napsis%,chronization$"re&!s")t&formula',
+    '#$abla$,ch&rehy;ment&/able/adjustable%$thed$+il&rehy;ing&!\'&\'-minded&#ers&$ing.&4s&mdash;confirmation.\'whether\')-whatever\'$.pc.\')/brochure(%demos',
+    '\'%_such%%nable&#ed.$%ngles#$chon$!t#(eachment$#ced%"ta&$ible\'#on.\'1ve&rehy;constable/(sergeant)!\')&-chief',
+    '*)sergeants+$tory/%-like&"on\'"r\'(&-found(!.$(ioration$\'k-1-hrp$!l$$ncao%#ted&!s$/r&rehy;ministic%!-',
+    '%#ent%+gent-bottle*$free*$like*%proof*(released*&stable%)i-oration&#ate&"nk&%oated\'"ra)*&rehy;tion)$ted\'*+ion/illness',
+    '%,m&rehy;nined&#ent&"in(#als)#nt.)#tio,,n/motivation-"es-%three(-ed-impossible)"th($ism.+!s(#ted%%nined',
+    '%(oriation%!r&;ence&rehy;through-symbolism*9-by-threat-of-retaliation(\'t-sized)\'/luxury&*ing-effect$%tives$$yned#*hermaliser$#ick%!s$#lac%#off$%oliad',
+    '$%orate#$ling$"of##mar$#ers#1onation-resistant$"ry$*talisation(&zation)"ed*!s$.urs/variations$#xes%\'ication&$fier',
+    ')!s&"ng#(pradiyut#\'ractive%)nsforming$%ended\'#ing$(ibalised)#zed%%ment.%*tus-eating)\'feeding$$oit-($made\'$/nyc',
+    '\'&mumble\'%phile%&vyllan#%skoye#&terman$%ifoss#\'umesces(#ing$#ner&!s$$rpit#&weiler$$iler"!u#&calion',
+    '#$ddwr#"el#$ices#"ms#+nionisation##pan&$home##qua##rle%"oo$)zen-smith#,s-ex-machina$#ser$"to#\'tchmark',
+    '$)eragonist\'#ted&0ium-substitution&*ocanonical()hloroform\'%melia\'%nomic+"st\'!s\'$xide$.sch&rehy;marks\'0-ostafrikanische\')ewerkbund\'&lands.,%ender',
+    '),rk&mdash;not+\'-dollar.\'minated%)et-orient%#her$#zia#)x-chevaux%-s&egrave;vres"/v&amacr;dhideva$%imacr$,scedil;irme\'#!-$&eloped$#sol#$.ed.',
+    '#%a/one$+as&uuml;ren$*lorisation(#zed%/uation-to-match&\'ed.this&$ings&$tion$!n%%agari&%halli$!r$(s/former%)cularised%&tstaed',
+    '#\'disvatn#(egetated$$ined$*l&rehy;ops%\'ekanovo%!o&.p&lsqb;ed&rsqb-&s&rsqb\'$-man\'%/keep\'\'ability\'*ed-country)$.two)"_a(*r-come-oem',
+    '/#ing**integrator*)producers)*s-oriented*!.\'\'ing-see\'!m(.ent&mdash;ibrd+!*+%--one,#aid,#mad,(oriented,%trans+!.',
+    '+5/consideration/review,,fund-raising,+integration,(literacy,$role,\'service-(tructure,.transformation+)s-someone,".3\'"pe$!n%#ant&!y%#dra',
+    '%$port%$sian%!u&!e$\'olution$(rbalized%!e&#aux%"ia&"is$&stated(#ion$$tsil#"ia%#nt\'',
+    ')!.)!=)#ism&#ors$&ce-and\'*definition\'(specific&*/path/file&,=display.sys\',smartdrv.sys&5notselectedtimeout=15%"to$$enne$"ka$.l\'s-food-cakes',
+    '&&breath&#cat&&damned(#nce("rk\'#oll&)frenchman&$like\'%oving&*made-flesh("sk(,y-care-image&$sent&1take-the-hindmost&%woman',
+    '%$biss%+ish-looking)(sounding%#lar&#ife&!s%%s-bit$$nder%$e/rc\'$wife&#aux%"ka$#sal%$ings&"ve',
+    '$"ta&$lise$/zes-westminster#$lin-$"op&#ing&$ment*!s&!s#\'olopers%+u&rehy;tion&%-tion&(tionists$\'n-based\'#orn',
+    '%(/cornish%$dale%)ian-lower(./carboniferous%*port-based%$sher&"is$%ravit%%gilla$*t&eacute;e%$ees.%"io$%urers&%ingly$#yde',
+    '#"ra$#ies#$swap\'$.com#$ysed""w\'#--and-moonbeam$&beaded$\'covered$(drenched$$fall$&gemmed$$like$&picked%$oint',
+    '$%raked$&washed%"et#$/due##ani%"ji%$toro$(r/shadow$#ter\'"ed$$xing#$ball$&erries\'!y#$dney',
+    '#%eerdt$!i$%sbury$\'y-based%$/met#5hurst/gloucestershire)%vicar#$ired&%ments%#ing##jee#$laps$#ike%"sh#&oitine',
+    '#%ponds"\'x-o-tex#%adrin#"co#$eter#"i-#"po#!t$)arosatory$(er-kerry&(/finance-#ial\'%grant\'(hospital\'&writer',
+    '$#rin%!o&&cardia&(moramide&,propoxyphene&#se.#*y\'s-clones"*ydrogenase#!e$!s#(hrdation#$laud##man#"na$!s',
+    '#&sbrook$"el"%zalay$"yi##han$&urnaya##iel#!o##soe#$zman!.f-down/feather"".s"!1#!1$".8',
+    '##3.7#!7"%=1064$!6$!9#$2305#"35$!9#"57#!6#!9")d-derived"!e#$sire#\'tective',
+    '"#l.1%*&ndash;1.5%$,250%".2%!0&$,000&!0%%2,500&%0,000%&30,000%%5,000&%0,000%!7$!2%".8',
+    '%&15,000%&70,000$&36,000$#4.2%.0&ndash;60,000%&14,000%!5$"50&$,000$*65,641,000$#7.5$080&ndash;120,000$#l75#\'126,500$%6,100',
+    '##50m#+8/dfl12,000$30,000&ndash;120,000#!b""ms"#p**#$-128""rk"#skd"#vlr"!w!$g-11#$ship#"ux"&/07/90',
+    '""13"(427766-2"*59,400,000",df&amp;sharp"!e"&hajjes"!i#"ii!*h&amacr;ma#&eacute"%-82as#&dacron"".1$!5##60s',
+    '$!6#"91"%1,810#%1,872#%4,978#%5,645$)5,600,000#%6,400"!2"!3"!4"+666,700,000$)7,000,000"%a-run#(bi-dubai',
+    '#-c&ndash;nicra#&gamwar#!h$$ran1\'$3-21\'#4-4#!i#!l$"ia%!t$&lagiri$!s#*mal&agrave$(ma-guard\'$king',
+    '&$pada#%nesha$"na$#sak#!r$1ams&amacr;l&amacr$#han$!i$#ker$&madasa&"la&%sakdi\'#ena&\'wardena$#war',
+    '##ter##wan")c&ndash;1*!3*"4t#"-2$!5"#een#"li##nki#!w"$iban#&fallah#%miter#$ngra',
+    '##yab"!j#(erzinsky"&ladhla$$mini##omo"!o#$bied$"le#%faris#"ka#"le#\'mhnuill$%naill#%ndrub',
+    '#$rcha#!t"(r.210.10#)onachalam")ss-funded$$/doe%$esrc%#nhs%$ssrc")u\'l-hijja#"bh%&ghaill#"it#(ramoolan!,i&aacute;rio',
+    '#,oacute;genes"%\'mond"\'-2-xxxx#$acid$$mine#\'bromide#"dc#$iron$)socyanate#\'marzios$"eo%*thacrylate#&nickel#$wear$#hat',
+    '"!1""50"%760ss""a-$%issue#!.#$/lif$&narcog#!b$$atic$%ellis%+tes-related&&ogenic\'\'logists$\'ilities',
+    '$$lada%"es%*o-enhanced$\'olical.\'#sts&(ocentric\'*s/apollyon%#tic#&cetone&,yl-nivalenol$(hronique(%ously%$ylon$%olour%#nal',
+    ')!s#\'dematus&"ed$"ie$$ochi%&umenos$!s$&umenoi)!s#&eresis#*g(1,2,2,1)%06,3,2,1,5,1,2,1)$"en$"ne%&osably',
+    '("s.)*/detection**prediction*.treatment/cure$%onal.(#ise((ly-split$+ramatically\'%mable#$hnne$\'orrhoea##ion##kka$$onia$$rino',
+    '#(l-a-bone(\'rochure\'#job\'$quiz\'%santa()ex-kitten(\'welling\'%video&*n-elephant%$back%)telephone$&/comet$&ect(s)\'!.\'!/',
+    '\'%alism\'$ique%!d%#kt.\'"os$#ing$\'ling-in)$tone$&ogical\'#que\'&zation($omai&\'ue-form*#ree(#box',
+    '$"ux$$yser#&macoun)!e%\'gnetism)!s%)ndopoulos&$tine\'!s$(eter(c1)*"2)()-compared)%depth($/rim))thickness',
+    ')"90&#ral$&idines%,no-benzidine1)-hydrogen\')bencidine\'&purine\'*tetracetic%!r$4minedichloroplatinum$.ond&rehy;shape\'%-back)&earing)%right)%ullet',
+    ')$lear)#ore)&utting(&decked()encrusted(%faced(\'growing(*is-forever($lite)*onsdaleite($mesh))olybdenum*%ttled()patterned(#set',
+    '(%white\'%/site\'%backs\'"es\'$ring\'!y&!o%%rphic#3na&mdash;democratic%!\'%#lan$%cecht$)e/glasgow%$sque$#ion',
+    '$#ora%"va$,thus-covered#.orrhea-related#\'pedesis%#red&#ing&$work$+hanopterida($usly%#one\'"ic&%resis%.ragm-breathers)&/lungs',
+    '$%iacer%!r$%laced$)pointment$$sids$%tomus#%quest#!r$#chy$$hoea$$ized$&rhetic&+oea-causing*\'related)!.',
+    '(!s(#tic%#oea&#hea$"y\'%0-cum-commonplace&&keeper&$like&(notebook&$type%)/database&(notebook#"s.$\'/driver%-tardes/noches',
+    '%$ster$#hip$\'justice$%poras\'"es%"ri$$sala$+tereoisomer/!s%#ole%#ral#$tary$!e$(omaceous&"s.',
+    '$$raea%#iba$%thoea#\'volezza#$wara#&zamuls$%emuls%#pan$%irene$&labour$)otisation\'#zed"3b-da-dib-da-dib-dib#$acsa$"la',
+    '$!s#$bers%"ts$"ie$#led&!y%!y#%ekulu$"la##les%\'y/agema$!o%!s#!o$"ma',
+    '#&romide&(oalkanes\'-chloropropane#+utyryl-camp#!y"(caeeidae$)rboxethyl(%ylate*"ic$\'steries(!o&\'iglione$!t#\'e-board\'!x',
+    '&"up%$play)#ing%(throwing$!/$#man$#ndi%$tras$#rem%"os$#yan%%esque#,halcogenides%$ptic$!e',
+    '\'!o()-diphenyl(2dimethylhydanation((ethylene(+isocyanuric(1methane/methanol/(,nitrobenzene\'$prop$\'otomise\'$nomy$$roic&$mate)#ism$!t%!e',
+    '##ier%"st$\'plinary$!t%!e%$rato)+-bismuthate%"ur#0k&rehy;tionaries$\'-doctor%(follower%%heads%(idolator%#led%(rattling',
+    '%&shaped\'%owing&#uck%$wipe&#ork$&/owner%$that$,cheese-pilot$%ensen\',ian-approved+$like*$isms*"ly%#red&"ly',
+    '&!t\'!y&!y%"ty%"yi&!s&"up$%field$-head-infested$*ie/council%/nson/bellringer*)consumers*)parachute*#raf)"ia',
+    '*#ids)!s%"sh%"te&!y$$joke$"le&%burgh$)s/brewery*%house%%plash%%upply$$weed%"it\'!s',
+    '&\'looking%%birds#"le#!o$%m-car%#car$%phane$\'tyledon$&veries#)retionary#!s#!t$"am%&te-7-k\'"d.',
+    '&-or-by-consent(%iship$+ion-finding\'%arium)"um)\'y-based+\'chasing+*definition+&making+(specific**/catalogue+)thesaurus\'"ry\'"um$"or',
+    '%(tyledons$!u$$yate%%nidae%*ocauliasis\'"ha&\'neurida&\'stelium&$tene#!u$!l$$rane$&ssions#%yanin&)obenzenes',
+    '$(nodontia"\'d&mdash)$;and#"\'n$"st##-he&&-do-it#!.##_at$$kind$#out##ace%$tism&#yla##b\'t',
+    '#$cart#$dems$%icois\'!y%$ums.$)le-daddle&$ebob&"rs&!s&&thingy&%ybuzz\'"do\'%thing%&y-dums\'$shit',
+    '&%squat$#ums$)y-jackets#,eoxycytidine\'\'inosine\'*nucleoside$$rot.#&icisse%"oi$&dididi$$erea&!s$"us#"ja#&marton',
+    '\')rehy;with&!\'&G-get-through-my-qualifying-rounds-again\'$what&$.say%!y#%onian(!s$!t$$uche#"so#%ycoys$(mocarpus"+e&rehy;case$(szlig;en',
+    '#\'-change$$free$&groups$\'hardism$+in-the-wool$$sets%&inking%\'tamping&%udier$$xxxx#!.$"he#)/vomiting$$your#\'_rather',
+    '#\'casting#\'d&mdash*(;fifteen$,-in-the-wool$$.ken$%erich$$rich(!s#)fenbachia##gan$$esis$:o&ndash;phoenix/scottsdale#!k$%wisch#,lectric-loss',
+    '$"la%!i#"me#*n-bien-phu$$dere$$ekes%!l%!r$%iolen$"ne$#ste&$herr&)reglement#(penbeeck$+pe-newhaven',
+    '$#ach$#dre$$each%!n$&gaardt$"ic&!h$$king$#off#$s-at$#ase$$bach$!e%-l&rehy;driven&2-and-hemp-smelling',
+    '\'\'engines\')flavoured\')hydraulic0!s\'$only\'$type\'$wise&&hauled&\'isation("ed&1locomotive-hauled&"s.%!m%!s$(iodinate',
+    '#,t-controlled%&drinks%&failed%*restricted%&shifts$,/cholesterol%&weight$%aries$#ger$*hanolamine%,ycarbamazine&1ldithio-carbamate\'#ene*3triaminepentaacetic(,thanolamines',
+    '\'1phosphineplatinum\',stilboestrol$"ki$#man$\'ologist$-rich-genscher)%style(#sen%!y$"s-%!.$*trichstein$!y%3laminohydroxypropyl$$zius',
+    '#+zma-gradada".f&eacute;rance#!2#!a$&-forum#&enditi$)renciales#.f&eacute;rante-%entes0!s.!r%-rehy;ferently$!0$!1$!e',
+    '%#nce(!s&!t%"r.&"en(#ce\'*#.it*\'/desire*$=0.5+#1.1+*difference*"s.("t\')*-different*(language',
+    '*$more*$name*%sexed+%haped+\'melling)./noncomparable*$same*)unrelated)(iability+!e+$ted.,$ing.*"on))ly-priced,&shaped',
+    '&-ing/deferring&\'s&pound&#unt%$went$&iation%$cclt&\'iulties&"ul("kt()t-looking*#not*&shaped*+to-classify-&define.%igest',
+    '-#hit-$keep-&manage-*photograph./ronounce-sounds-%reach0!d-%serve.$tyle-$test.#ype-%value)%/easy)#_as*\'because',
+    ',$--in,$.the,*/successes)"y\'%%lcult%&ulties$!k$!m$\'racting(\'ometers)!r%#ent(&iation%#ing$\'uclties',
+    '%$ntos%(ser-type(\'/dryers\'#urs&\'ibility\')on-porous)-/partitioning)!s$$went%"ys$!y#%icult$%icult#*lubenzuron""g.',
+    '$#mma#(by-wyatt#!d#"ed$"ma$$nean&#tic%#ova$%ridoo$!s%%table\'#nts&(ible/low&"on&"s.',
+    '%)r-drivers%"ty$%icult%&ng-out$\'leswade$(ory/alex#&hinala$"ty#&i-pack%&terror$%cable%"om$#fax%#orm$$link',
+    '$#pak$&speech$$t(s)%)-by.digit&$like%%abula&\'l-based($data(\'kienzle(\'mapping((networks\')/analogue\'#ker\')ly-minded*(recorded',
+    '\'$ness&"sk&#tus%"ek%!i&"al&%grade&2sation/integration%$onin&#rum%#ron%%s/two$$usto#$nare%$tory',
+    '%#ley$)ification\'*ed-looking%!t&"as\'"te)!m("is$"us#"o-$!n$\'xigenin%#sin#&raphic$%esses',
+    '#"s.#$tech##ual$&el-est$#ise\'!d$!l#$wood"!h#(edralled(!s#%istan#"li#%ybrid$%dride',
+    '\')pyradines*+rolizidines\'0scyanthraquinone\',testosterone""ic$%todon#\'fficult$%icult#"i-#%odine#7sopropylfluorophosphate"$jana#"ck#!o$(n-beaune',
+    '%#val##ver"\'k&emacr#(aiopolis#*e/waitress$$ledi$$tene##ker##oul#&shitar$$tein#%taean%"t\'$#ene$%ilian',
+    '(#ion"#lap%,i&rehy;dated$"ta&#ion&$ting%#ed.%\'ometric##ema%%ma(s)\'!.\'#tic%"na$!o$(ttantish',
+    '\'"so#$gard##ham#\'igence.$#man$%thium#"ks#\'l-water$!a$"ed%\'y/third$&igence(!t%"ng\'"en',
+    '%!s$\'onising&+s/hatchards(\'mowbray$+y/hampshire%(dallying%#ing%!s##men#*not/social#*ophosaurus#$rafo#!s$!k$%worth',
+    '$&te_now&"es%$ion.%"or#$wara#!y"&m-blue$#dip&\'scerned(&overed$\'looking$$seen%#hit$&tinted$*wittedness',
+    '#!.#%aggio$#nis$"rk%$tini$$tima%#tia#\'blebyan$!o$#ulb#"di#\'e-store$"ch%!o$-nsion-bending',
+    '$.rcaptosuccinic%$ised(!s&$zing$*thacrylate&$oate&5yl-sulfate-piperidine(%amine,!o-(acrylate(,ethanolamine(\'glycine(.sulphoxide/tes()threonine))ryptamine',
+    '\'&dazole#(idiating)"on$-nish&mdash;it($able(#ed7(%ingly($ment%$shed%\'uendoed*!s&#iti&"te$%serit%#sed',
+    '%!r&!a&%iadis(#rgo\'"ev\'!j($evic&#ova%"to##lit#!m$&ed-out$!i$$lite$%ockia',
+    '#$nati#\'ocarpus$&kratia$$mona$\'rphisms\'&otheca$!u#$puna#$skal$#ter#\'unition#!x""n\'$$eeee#%-plug',
+    '#$ahet$#mpa$#pur$$r/us%#=26%$dois%#ide(!s%!y%$zade#!d$!e$#ins$#ons#)eage/kray',
+    '$$nage%"is$%r-out#:g-a-de-ding-ding-a-de-ding%#bat%$dung$$dong$!e%"ll%!n%$pore%!y$%hies.%#lis%&y-like',
+    '\'&topped$#ier&!s\'!t%"ly%%zwayo$#man$)omaniaque%!s$!s$#ton$-wall/convener$"xi$*y-coloured&\'looking',
+    '%,g&rehy;table&*-and-dance\'$club\'"in\'#out\'\'parlour&&/guest\'(kitchens$$stan$&trogen%!z##kan%!r$"ed%&lspiel',
+    '%!y$#ily%!n%"sh$!o$!s$\'y-sized##lle#(mukhamed#%nasty$#er\'\'&sready&%-bell\'\'cabaret\'&eaters',
+    ',!s\'\'hostess\'\'jackets\'$size\'&tables("he)$ings(#ray\'\'waiting&#.he&\'/boxing\')dance.the\'"hm&%=time&\'jackets',
+    '&%times%!t%!y$$igan%\'ng-hall$!o#\'o-facts$#cap$*flagellate%#rio$&hatten$&physis*\'toxin-2$$rben$&sauric',
+    '("us$%topia#%smore##ton&1/buckinghamdshire1%shire%#rni#&uclear#&verter##xie##yar"\'oactive#$bble#!c$#alm',
+    '&&eabout$#lea&!s$(tyl-medo\'$ated#)de-pumped%(.shaping%#rus$#ide\'!s$#or.&!a&"vs#&estrum#!l',
+    '$!m$#ogy#,n&iacute;sio$\'-bouton$#eda$$isiy&$otti$*ovi&cacute$\'ysische&*us-worship0$pers#\'phantus$%sides$#ter#*r-patented',
+    '$%alyte%#mas$\'essence$$itic#&scorea)$ceae\'$idis$$esan$%kilos$#nel$%pyros#\'tallevi##ula##xan&1e:methanol:acetic',
+    '%)n-covered\')pollution&!e#+zesanmuseum"(p-backed$&closed$\'moulded$%pipes$%slope$[the-finger-in-the-water-and-let\'s-talk-about-the-test-match&%rough$-wet-dip-scrub#!.$%h.e.s$"sw',
+    '$$nkar$#rch#"el$&ptides$%rtuan$"sh#"fs#$hale$$e/ba\'"sc%,nylcarbazide.#one$&osgene&\'phonate$\'theria.',
+    ')#num&)ongs/long#$inti$&panone#%l-ing$#ays$#ing$&oblast*"ic%)doselache%\'graptus%*m&eacute;e&%a/med(\'scotvec\'$tic.',
+    '*!s&%onads#%meter#!n$%arine$$oans#+ole-induced\'$like#!p$!a$\'ed-back(#eam%!l%&rmouth&$sful',
+    '$"ie%"ly%!n&!\'$(y-backed#*roprionate%%todon*"ta#%sacos$%lopes$&omania$$ukos#%teral&"ex&\'ocarpus',
+    '$$ford$$hong$$yque#\'utacion#\'ylidium&"um%"on"%quate$"et"&r/full$!p$!w%"/p#$acto$%dical',
+    '$$lite$!m%!s#"dy#)e-warning$1c&ccedil&atilde;o&*rehy;tions%+ci&oacute;n\'"on%#ors%*t&rehy;ing&,-application\'$care)"st(&onnect',
+    '(&urrent\'%drive\'&energy\'$heat\'(injected)\'version\'&linked\',manipulation)\'rketing\'#out\'(pressure\')reduction\'$sell(#old("un',
+    '($rack\'\'voltage&,ed&mdash;for(#_on\'!e\'#urs&!i\'%on(s))*-sensitive+%hifts*#you)".6)$/set)0s&mdash;exchange*)/commands',
+    '\'#ve\')#.33)$ness)+s.extremely(%ities*!y&3ly&rehy;kno&rehy;wn(!-)\'coupled)+dissociated)&farmed)(provided(!.&"on\',r-controlled',
+    ',%erals)%level)-of-operations)&turned(*/assistant)%canon*\'hairman*"mg)$dean*\'irector*!j)(embalmer)$feed)%group)&jewson',
+    '))macintyre))secretary)%three*$utor(&:clare)$mike("al)-te/divisional($ies.(+s/committee)+hip-general((y&bsol*.*,gt;error.log)!\'*%-type',
+    ')$name&$ress\'"ix&!v\'#ote$&gnosis$$ness$%ttore#\'ge-like##ige&$ants&$nten(!i%%isism\'!m',
+    '$#ham$!r#%kmann$#sen#(ndl-clad#%pack1\'!3#&rerent#"s3#(t-beaten%(coloured%(darkened&&igging\'\'sposing%)encrusted',
+    '&%illed&#ree%$path&$roof%*resistance&%idden%&strewn%(trackers*#ing$!/%#and%$glam$#_in$$dish%"og',
+    '$$ier.%"ly%&sisism$"ot$$side$.y&rehy;looking%*-colourful&&finger&$grey&+intentioned&\'laundry\'$inen&&nailed\'$ever\'$osed',
+    '\'#ink&,sock-washing&\'weekend&&yellow%$work#&vishes"\'s&mdash$$rehy(*;advantage**ssociating))contented+$very*(rediting)/enfranchisement)&honest',
+    '*)ncentives+)tegrating)&obeyed)&pensed*$roof,*portionate),satisfaction)\'tinctly#,-ambiguation%,p-point-ment&%plied%(ssembled,!r+!y\'&ociate',
+    '$)believing$*continuing,"ty&)rporation&#ver$\'economy%(mbarrass%+nfranchised/$ment%)quilibria$&honour*"ed$*inhibitive&(vestment$*passionate',
+    '$,satisfaction%%tress$$used#(abilites),y-definition+\'related*&.these*!/&$tata%!l&%ed.50)#the((/variety(#ism\'%ments',
+    '&)umulation$#dva\'!n(\'tage-of,!.,"d.$#ese$)ffections&(iliating\'&nities$\'geement%(gregates%!r&*eeableness$"it',
+    '$(lienated%\'lowable)$nces%$ysis$)mbiguates$.p&rehy;pointed0#ing,%roves%#ase%\'earance%*peared.but+#_as*#nce)#nce\'"rs',
+    '*&ment.l&&roval.,#the)"e.*$d-of*!r+!s$$rmer&&ingly.%%range\'$y.27(#ing%*ticulation$$ssoc%!t',
+    ')#hit)%laden)&makers)(obsessed)\'payouts)\'shutter*\'tricken)$that(%ously("s.$#ter%)isfaction$(vantages#\'banded.\'%ments',
+    '&$ring$*eautifying%%liefs$"ud&#ded%$rser#(c-a-gogo%%brake*!d%\'copying&%utter%&drives%)junketing%#not%$only',
+    '$"al&#ced&$imer%\'rd-tray\'#ed.&$vard$&ern\'st\'/ed-particularly$!h%#age&"rg("e\')!.)$able)"es',
+    '%#nry$!i%"as%$form%!p&!.&#led\'"in)"ae*\'rianism,"es)1e&rehy;orientated*#(s)*&-bound+%hence',
+    '*!.*"d.&$ular$&junkie$(laimants%#ean%$ined%&ocated&#see(!r%#ude$,o&iuml;dales%!\'%&-based\'&leared',
+    '&&garage&#ing&(princess&$type%&/royal&$wear%%goers%#ing%,l&rehy;oured&"or\'&urings%)mbobulate&$fits)#ted)$ures',
+    '*%ingly&%itors&+knockerated&$mode)%ities\'\'unicate-#ion&$pose%!n&\'certion*$ment&)firmation*!s&&itnued&(nectedly',
+    '($xion&.solate-looking&&tents.\'&iguous($nous)$ued.*%ously%)ordinated%%phile&%olice%#rde\'$iale&&porate)#eal&"si',
+    '%$tech\'#que%-unt-retailing)%store)\'trading(!.()/discount($able(\'enances(3s/exemptions/second&+r&rehy;aged\'-age&rehy;ment)$ment\'#ged\'0se&rehy;internal',
+    '*%based**dependence*"in)"s.+!i\'&tesies%&vating&!d&+er&rehy;ing(#ed-($ies-+!.)#ng\'$/re&rehy;pancies&*ditability',
+    '*$tion)#ed.&.etly-concealed&(pancies.\'%tione&&tefunc\'-ion-deduction*)/estoppel*$ally&%zione%!i&-&rehy;minated&#bed&"ed&$mate',
+    '+,ion-learning)&iation$"s.%$aver$#tly$"ua%,mknockerated%,s&rehy;sions&(-carrier&"ed&0s/argue/disagree()implement\'$ants\',ed/clarified*!i',
+    '(!r\'#in\'(&on-led+%point*&/topic*"s.++/interviews,&refine\'#sed%#ter#%dain\'#!e$#aes%(se&mdash(,rehy;causing',
+    '(!*\'!-((carriers*%using(+forecasting()incidence*&fected(%prone+&voking($trap(*vulnerable\'".3()according($nick\'*/emphysema',
+    '((genotype\')d-looking\'1s&mdash;therefore/"we($/but)*fertiliser(!5$(conomics)!y$#gni$&lenide$/m&rehy;powering%%barks(&rassed&)odiedness',
+    ')$ment(!y\'&weller**ment/birth$&nchant*%ement&&rusted&\'umbered%%dowed%*franchized%\'genuous%\'tailing\'(ngleable+!s&(egration',
+    '$)qualizing$"rt&&issime$(stablish&#eem$!z#/familiarization%#vor\'#urs$(igur-ing(+e&rehy;ment)%ment.$(luencies$%orest$(ranchise',
+    '#(geusting$$ised$%orger)!s$%race.(+ful-looking+!.+!l(%lands&#zia%.untled-looking$"sd$!u%\'ise-the(\'d/voice',
+    '&,t&rehy;ingly\'#eds#"h\'$&-aster%%basin%%cloth&%overs%&kettle%(of-herbs%#rag&(eflector%*telescopes&$owel%\'washing\'#ter',
+    '%%bille\'&tuator%\'finance$+earteningly%%rison%.s-of-the-month&!.%\'vellved$+forth-based%"ul\'!s$$iest%"n\'&$gton$#mop',
+    ')!\')#ies)"y.&&orable(%ifics$#pan$!t%%owels$&warmer&"sh((electric)\'r-proof*&/oven/$)y-looking#%ident',
+    '$&licate&%entis%0lusion&rehy;ment$\'mproved$(ncarnate&%lines&(orporate&\'rustant%(fectant.)/ion-destruction)!s\'$sted%\'genuity%\'herioty)"ts',
+    '*#ory%*quinamento%\'section%-tegrationists)#ins\'%rment%\'vesting)#ors)!s$!o$!p%"al%$line#&jected$#oin',
+    '\'%tedly(!s%&nction)"ve#$k(s)$)-fiddling&#ree%$head\'"ld%)intensive%(magazine%)on-a-card\'"ly%\'quality%$read',
+    '$$.the$&/trend$!1$%eeper%&xpress%!y$#fax%"ul$#gas$&halers$"in$&lavier%#ike$\'ophoros$(s_on_top',
+    '$"ul%&script&$sion##lik&-e&lsqb;d&rsqb\'!\'\'&d_each%#mns$&ocates%\'yalists#*mantleable)!r($ings$\'emberer\'#rio',
+    '\'#ion$\'ount-ed$#uth##na\'%$ture$+ey-inspired\'#mgm\'\'ravaged\'%style&$fied\'%odder&&worlds#!o$)bligingly$"lv',
+    '$&phenol$(rderlies%(ganisers)$zing%-ien&rehy;tate("ts$"ss$%vered$,wn&rehy;able&!e&$ment#"p.$$agne%#irs%)ragements',
+    '&%ition&#ked&"us%"se%(tch-boat)$case)&riders(!.$.en&rehy;saries&"ce&$dant&(sability(%tion\'\'\'ers.the)!y',
+    '%"rs\'\'ed-fuel)\'_by_the)"ly\'\'ionless("ty$$iace%(ritingly$!l%(acement.\'#ive&"y-(%(pad)($case($item',
+    '("xl\'$.and\'(/holding\'%s.and%\'easures$#oal%#ile%+rportionate&%tings%(sability(&lehave\'(l/sluice&,er:directors\'$ssed&$iong',
+    '(\'ionally+"em+#ing&%sesed)$sin\'+#ons%#zal$#ray%$ized%"ol&#ofs&2portion&rehy;ately-$ably.$ting$)utationum',
+    '-#ing)&olving\'!.#-qualificatory*"er%"es%%ietly&(sitioner#(raeliana%#ted$\'emember%/putable-looking%\'sonance$\'ibution$,up&rehy;tion',
+    '()on_and_er\'"or)!s\'#ure#*saffection%&llowed%&peared)#ing&(ointment&&peared*!s\'(ointting%+tisfaction.)$ied.+!r',
+    '%#ude%$vers&#ing$+ecting-room\'"or\'"um%$ised\'"in%%mbler*!s&(ination\'*"us%!n&.t/unitarianism\'$ions',
+    '&!t&%vices%#ver$+i&rehy;pate%%dency(%t-led)%s-but%-milar-looking+#two*!s("is&&ulated+!s*%ioque*"or',
+    '$&oblige%"l.&%utely)!s($ion.++/alteration,+replacement/,recipitation&!v\'$able\'(ed-\'quit(!r%)nant-type)"ly$)satisfied',
+    '$\'tressed$$used$!y#\'tachyus&!t%*l/proximal&&gesics%"nc\'(e\'-where(*-consuming)%decay+\'pendent)&eating)\'judging)\'lending',
+    '))variation((/bearing)&number)$open)*similarity*$peed\'\'iations\'!s&!s&,t-but-polite(&cousin(%water\'+ly-resident%$stes\'$rous',
+    '&!e\'#ful%"zo$&earoyl%)mperature)#ing%%rhoft&%ision$\'illated*!s\'+ery-hopping\'$ment%/n&rehy;guishing&$c\'ly\'!e',
+    '($ion.+"es()ly-shaped&&guised&"ti%\'stipes.$!o%#nic%$ring&$ted.)\'_papier)"ly\'(ion-free+*plus-noise*0/eq/chorus/delay',
+    '*"al\'(omanaics%!s$\'racted.*$ness)!r("io*"n.)"ve&$iner%$esse)"d.(%fully%#ibu(*&rehy;tion',
+    '*6d-information-delivery,0object-computing*"rs*$s&gt))ion-based,+/exhibition-+reinvoicing,$ally,$ists*"st)$ors.)"te)$uion&!c\'!k',
+    '(#(s)(&-based)\'country)\'focused)%level)%nurse((/central))municipal)&output)*provincial((:traffic(*photograph("s.(!u&#dct',
+    '&%parks%%ought%&ubiton\'#ute$$ugil%-rb&rehy;ingly\')ance-free,)producing+!/,*difficulty+%s.liz\'#ed.\'#in\')"g.(#ty\'',
+    '#$uade$#css$.lfiram-ethanol%+phide/water*!s\'$onic\'"ur$&nifies&"te\'#ies$#pte$#q-1$+sed-looking&#red%!h',
+    '#)valuation\'!e#!y$4llable/polysyllables##ztl"$t-da&$-dit#-ch&mdash;unto%)-and-bund&)delivered&#lip%$fern&$ield%$ings(%worth',
+    '#!e#$ford#$hane$$eist%\'rington$+iadiazolium&$zole)#ium%"ng%(otreitol$\'yrambos#)inguished$#ons#,liv-simonsen#)ransitive',
+    '#!s$"um&!s$!y#)tenberger$%isham$$rich$"us#\'urrible#"zy""ur$$ecti$%nalis%"ea%"us',
+    '")v-derived#".1#"3s#&a-like$%gated\'#ion$"li$1n-cum-four-seater&$type$&ricata#%ebomb("er(#ing$"ll$&master',
+    '$"r-&*geologists&\'picture%!.%$ged.\'(nce-free*,/convergence("ts%$less&#ike%$ness%,s/eyewitness&#i-t\'#fed(%olius',
+    '\',ty-dependent)&/human%$ters&%icula*!i*$oses\'+mento-style\',ssement-like$)s-lazarus%$ture$"ts#%iacus%"na&!i$%dalen',
+    '\'$by.m&$d-up&,nd-stripping(!.($/tax(,s&mdash;flat)!.\'"ts&%r-out\'(/heading%)ing-lines)"up$#ion$"la%!s',
+    '&%tione%,ely-destined*\'ictated)&fecund)(intended))protected&"st%&g-duck%$ity.&&zation%$tity$+s/twinbrook%!a%"im&#ocn',
+    '(%-funk)%plan.()/cocteaus).multiplication(*al-section*!/+\'product*\'isation*"ly(#ers(.s&mdash;hiving)(.however)!/&$vely%#ory',
+    '##lin#!o$#nne$,rc&eacute;es&"e\'\'\'-courts(%rates\'!/\')d/legally)1widowed/separated\'!r%$thed%#zio$"to$%zione',
+    '#!v$"il"*wan-i-khas%#iya#&waniya"#x\'s#%-sept#\'/marina$%rspca#$arit#$cart$!o#"en#!i$%ecrat',
+    '#$neuf#&odaros%!e$)n-parkers%)/campaign&(daughter&(landlord&%peter&#son%&s/silo#%ville""y-$#ers$#ing$*structured',
+    '$$dama#"er##ing""za$!h$#pac##ier#)ygocrinus#$zard!$j-ed##ing"\'/artist"#abi$#ord#&jusman',
+    '$%ovica#$llon$!o#)maloudine%%ravli$&bokota$\'olodine$$shed##net$\'go-type#"wa#$x-up"%ebels##dje&#mel',
+    '$$laba(!h%$ebah%#oul#!m$"el##nne#!r$#dap$"ic"#ian#&bouiti&%tians#"di%$ngar',
+    '#$lali#%masta$!e#"n\'$"n.%!i$#sky#"ze"$odan#!e##ndo$%kouma#&rdevic$&govski$&jovski',
+    '$"di$%lasso"*p.moreover")u:l&ndash#$anda#(gashvili$$urba#\'kanovic#$ngel#%rayev$&djevic!,k&ndash;2300"%-2600$#830"$.31h',
+    '""ny"$p***"!r#&12,000$%6,100%".1#%2,800$&77,500$&80,300%%2,600$%9,500#&30,500$&12,100$&26,200$%5,800',
+    '$&60,400$%7,900$%8,200##6.3#%8,000#*90,000,000"!w!\'l&amp;j"\'-double##glu"&/c/367#"dt"$123a#!4"!3',
+    '""a0#!1##dla"!g#"-e#!s"#imi$!y""oe"%p-led"!s"%ugach$$oraj%"sz!+m&amp;sup-3',
+    '#!2#!3"\'/&pound#!2#"at"#0.0%!4%,5&ndash;0.04$"5m#"00%$,000")1,000,000$#200$#500$#650',
+    '$#900#&.00=13\'#200\'#360\'"65\'&70,000\'!9$"18$"32$"40%!5%!9$!5%!6$!6',
+    '%#370%"5m$"74%!5$$8748%#845%#925#)0,000,000$"00%"bn%\'m-worth$+4&ndash;135$!8$%9,000$!m',
+    '#%1,400$#.70$%0,000#$2*55&!7$".3$!5%$,000$$6.1m#"30%$,000#!4$!8#"5.$%5,000',
+    '#)7,500,000$!0$%5,000%!m#%8,000$".1$!0%$,000#%9,000$#.80#"=8")2&ndash;5#(,120,000$#400$#500',
+    '#".1%!5%"bn$"30%#157%!2&"13&"35%!3&"72%!4&"86%#550&"62%#669',
+    '&"79%#835&"87$!4%#000&"50%#120&"38&"72%#229%#350&"65$"61%!3$!7',
+    '%!2&!7%#336%!5&"68%#760&"84%"bn$!8%#426%#801$$9450%!7#)0,000,000%#100',
+    '$"0m$"5m#,15&ndash;295#%2,000$!0%$,000#,30&ndash;280#!4$$,000%#700$#.80$%0,000$!8#!5$$,000',
+    '$".9#)6,000,000%#900$%0,000#$7.6m#%8,000$%0,000$"bn#%9,400$#.80$+0&ndash;420$!6"%3,200$#400##.00',
+    '&!9%#102%#283%!3&"35&"42%#400%!7$"54$!8%,8&ndash;3.92$!9%!0%!2%,8&ndash;4.02',
+    '$(,000,000$!.$)0,000,000%!m$%6,900#&20,000$%4,000#%4,700#,50&ndash;400-&50,000%$,000$!m#%6,000#$8.8m$+0&ndash;430',
+    '$#.3m$%0,000$!5%(,000,000$%8,000"%4,000$#500$\'682,000##.12%"bn$#4bn$!5#!0$+,000-50,000$".1',
+    '$%0,000)$,000##12m#22,000&ndash;43,000%#700$%2,560#%3,700$%0,000$%5,650$"6m#"40%$,000)$,000#!5$!0',
+    '##6.6#)7,000,000#%8,000$%0,000#!9$$,860%#900#"bn"%5,300$#500$#800$#900#".3#.0&ndash;60,000$$,800',
+    '%!m$!m#%2,500#%3,000#"45#%5,000$"0m#%8,000$!0%$,000")6,000,000$#200%&76,000#".3#.0&ndash;70,000',
+    '$!0%+&ndash;3000%.,000,000-worth$"bn#%2,000$%0,000#%4,150#&50-900#%6,400%#800#&75,000#&92,000"%7,800#".5#%0,000',
+    '##4.3#)5,300,000$!0#%7,000#%8,000"%8,200$#300#%0,000$%0,000)$,000#!5$$,000$".5#!8$)0,000,000',
+    '"!9#$,100$#600#"00%$,000#!1$$,900#!3$$,000#%5,000%#847#!6##85m#%9,000$%7,500',
+    '#"rk"!d"\'e-based$*compatible$%ready#)m/10%fbs.""in$"or#$trij&#yev)#ich"%k-led""ls""mp"!o',
+    '#"11#!s"%s-100$,interference$%media&)thylation$$stop#!a#!u""ts"%ytrik%!o!$n-dp"!/"*10-related',
+    '"!2"$3000"!4"-6-impregnated"1a&mdash;norwegian#*-activated%&ffinic$.binding-domain,$site$(cleavage%\'ontacts%&utting$(encoding$+fingerprint$%probe',
+    '&)plication%%ibbon$*sequencing%(ynthesis$(targeted*#ing%(hymidine%*ransmitted#!.#!/$%beads#!e#,sei-digested$#tar"(c/bergen',
+    '#!s"$iepr&$-bug\'&niemen$#str##pro#!s"!m""pq#%s-100!+o&mdash;for)"it)(thinking)%while#(ndash;en',
+    '"#\'ed$!m">-anything-if-the-cash-is-right$*s-you-like#%be-ra%$tter##day&!s$&um-dum*8-waking-up-is-hard-to-do##ers#\'goodish)!m#&hickey#0it-in-your-pants',
+    '&)your-self**self&ndash.\'-stores."er0!s-$vers#&jigger#%lally$#oop#0na-no-bis-pa-cem%$mely$*ot-disturb\'(touch-me&%hings$"ut',
+    '##o-o$\'r-drown#%piaza$\'robe-me#%right#%si-do#"up#<wah-diddy-diddy-dum-diddy-do#(year-old"$.335#"es#&system"#/do%&es/did#$lead',
+    '#$some"!1#"7s""_a$!s#"in""ab$!s##cks#"ke#)lbriforme#"nh$#ted##res#$ting',
+    '%!r&#tin$#in\'&!g$$lers$!o$\'s-style%\'/father$"yn#+el/landlord$*n&iacute;n$\'reiner\'%$iner%)man-cross)(pinscher',
+    '#%islav##kin#%leing%!s##ney##ody$!j#(r&eacute$$illa$#nja$\'olyubov%$nica%!s$$ynin#*son/labour',
+    '$%worth#!t#!y$"ns#\'zhansky"%c-lap$%shoed#!.#%/0500#(approver#"co#$endi%!s#$hart\'$aigh',
+    '$+erty/former)/gloucestershire(!s$$four$\'garroch#&k-gate)!s&$rubs%$leaf%\'related&#oad%\'to-dock%%union$!.%"we',
+    '%/gloucestershire$"ar$"en&%field%*r-inspired&#ill&#tys\'!z%"tt$$ford$#ham$#ies%#ngs$+lands-style$!o',
+    '&"ll$"s.%0/gloucestershire%"ey%%iders#+osahexoenic$%trate#$shop#!t$!a$"ed%$ring$)issimorum$#or\'&"-a',
+    '\'*counsellor\'&doctor\'&father()lattering\'\'induced\'*journalist\'(martined\'%nurse\'*prescribed\'+salesperson(\'hopping&!.&"/a\'0hospital/dentist\'\'manager',
+    '&#_by&"em&#ial&"ov\'!w&"s.\'//nurses/medical%!s$(rinaires*#ism("le#+u-melodrama$"it$%matic%"en',
+    ')(handling*%older/!s)#led)\'nursery)(ordering+&iented)\'passing)&wallet(\'/manual(#_in(\'a-halle)!l)\'ry-like,%maker',
+    '))tion_such)%zione(%edera("or)!s(*s&mdash;it0%still)$-for),/exhibitions*+information*$list)!=$$tech"#d-1#(/trantec',
+    '%"im#(d/milton$%afydd$&eridge&$sell$#ies%+scombsleigh$&ridges$(s-parker&%smith$#yda#*ecachordon\'$orde&\'hedrane&$mers',
+    '\'.hony-on-stilts$%waard#$ford#+gem-drivers%!n$$iest%"on$)y-looking&%style%$ness#"ik$%ngton#$mire#"ne##odo',
+    '$%wells#!y"(e-funded#)/forestry$&rescue$$stag#$bley$#ner#\'derlein#$ings#!n$!a#-r&lsqb;s&rsqb$.-of-good-works$"s.',
+    '$#\'na$$-not$#/he$"_a$-n\'t&mdash;but\'!.%".t%\'t/didnt$$sing$!t##uff#%verie"+ffeinsoabbe$$ings$!s',
+    '"0g&mdash;bull-dog$*rehy;crate)%tired#*\'s-mercury#!-$\'adorned%#ids%"pe%\'ttached$\'biscuit%#one$%chain%#ock&%llars%$rawl',
+    '&!y%#irt$&earing&*t&rehy;dog\'#cat\'"en$\'fashion%"or%#ree$(handling%#owl$&kennel*!s$%latin%$eads',
+    '&"ss%#ook$$muck&\'rdering$)obedience%)rientated%%wners\'#ing$%packs&$ddle*!d*!s%$roof$&racing%+egistration',
+    '%$oses&#ugh&(ver-with$#sat%%haped&+oots-master%#kin%\'ledging%&tealer)#ing&&raying\'%oking$$tags%.eeth-mountable%&rainer',
+    '%&histle%#olf#)/betrayed$%owner$)returning#"am#$bert#$cart\'!s%%tcher$#hoc#"en#\'fighter%(sh-sized#"ga',
+    '%"ts$*ie-fashion%$ness%"sh$(y-paddle&%style%&paddle#(handling$#ead$#ter#$leap&"sh%"ss$$iani#)ma-driven',
+    '%"ta&%icism\'"st$#eat#&napped#!o$%wners$"yn#%patch#\'related#%s-are%$meat$&/clogs%$east$#_as',
+    '$&father$#ick%$tter$#led$%toerd&#oth#$tail$$ooth#(ubeyazit$!n#\'walkers%#rds"(h-backed$&funded#$eney',
+    '#+n&aacute;yi""id$-ledoidledaddy#"es##gts#$leys$#lon##n\'.$*g-accounts\'(ll-right\'!s&#but\'!y&#how&$over',
+    '\'"he&"up&$well%$/not%$_all&"so%"es%"s.#"re#"se$1neau/photographer"#jos##ran##ums"!k',
+    '&!y#&imasia%*eion-iasos##ken#%oupil#!u$%chaev$,mentarischem"*l&rehy;lar#&abella$#nog$&talyas##bec$%yised#%cezza',
+    '#*d&aacute;n$&dafydd%$rums$(rum-like#\'e-light%%money%*scroungers$$bury$+ful-looking\'$ness$!n%$tium$"rw#$fuss#!g',
+    '%#lly$(oborodov%&rsuren&%ukiis%!s#!h$&agaray#&ianova$#che\'#num&$urus$"es$\'mitised$%nchek%"do',
+    '%"ka$#sie$"vo#"l\'$&-dress%$eyes%%faced%$size%\'washing$./bradford-hill%(imperial$#and%*r-exchange\'&hoover(%ungry',
+    '(+illionaires\'*orientated\'&priced(&ulling\'&rouble\'%short(#ign(\'terling&\'/&pound\'+abc/malcolm\'$gold\'%pound,)-per-mips\'(sterling($wiss',
+    '&!o&$s15m\'%_away\'$igns$"ei%"nz$(fus-mieg$#ier%&ngston*"wn$&makers$$oped&#ing%!r$\'y-birds',
+    '&%chops&#dye&\'mixture-!s&"of&%wheel%%wagon#%mades%)n/housing&!s%#tov#$ohov$(micrites&#tan\'&e/saab',
+    '(!c)*/sideritic(#zed$%randa%!e%&imeter&!s%$osas\')e/c\'hanno\'!o$"sa%!i%%tones#%phin\'\'!-',
+    '($kill(\'lengths(*protection(%safe\'*$ving)%haped\'%/womb\'$aria*#ums#$star\'!s#"vy##ydd"(m-peromp$#tom',
+    '#!7#\'a/pilot$-in-dictionary\'$free\'\'general&*/shareware&"al&"s.$"nt$"ru$"si##bai$$ello%"ys$!y',
+    '#&e-cars%+over-square%&topped%(watching$(d-shaped$%heads$"la&"we%%ights&"ke$$nech$+stic\'-built(!-)\'airline)$care',
+    '(8/commercial/agricultural)\'general)(moderate(*ally-based-(consumed0\'trolled-)generated-(oriented-(produced-&scaled)#nts)(ted-wife+!s*$ions(%ities',
+    '("um$#tic%!t&!e#%gasse#&iciles\'4iary/residential/day("um$"na&/nce_with_regard\'"t\'("-5)(negative)%party(!7',
+    '\'!i(#on/\'#ors%%eered\'!s&#lli%$icae($ines(#lis\'!o("es\'!s&!k\'*anermuseum\'"us',
+    '\'&n-hood(&_ahead%(o-effect&#ing&!s%#que%!y$%tilia\'"la#"ke##mel%$rsen#\'ninique#\'ocracia$"ni',
+    '##pok##sky#%ville#&zalski"0n\'t&rehy;another%!-&!a\'"ll\'=nswer-back-i\'m-in-charge-here&-be-ridiculous)%silly\'(other-me&$care*!s\'(ome-here',
+    '&5f&mdash;with-me-heels&+give-a-fuck+\'me-that&(know-who&\'mind-us&7stand-in-my-way-or-else&5take-no-for-an-answer&$wake\'6orry-you-won\'t-capsize%#cha%"ee%#ski%!y#$-eat$,kosaken-chor',
+    '#+a-a-a-ation$&bedian&#lla$#dea$"gh&%amore&&cloney&)ue/tenant$#hoe$#key$%lbain\'"ne%-d/berinsfield((rockweir*&ughton',
+    '*\'ltenham(*irencester\')faringdon(%orest\'&london\'&milton\'+ross-on-wye\'\'swindon\'\'wescote-!t*(tminster&#ina&!o&%son\'s)#ian',
+    '%!s$$rius$#tas%)e-and-buy&$llos%#ien&"lo&"n\'&#on\'("es(\'s/gifts&"st&"ve\'"um%#ory',
+    '$,ul&auml;nder$#van%#int#3caster-gainsborough)0/retford/lincoln*)yorkshire$"ha#$dero&!s%0schiepolschuygen$#ois#+e&rehy;over$"\'t$(/methods%$then',
+    '\'\'_the_er$\'e-based%!s$5gal\'s-most-famous-son&"ni%#ore$&having%$ower$&yshiel#$firm$$loss#&g-minh%#son$"ed%!r',
+    '$$fang%#eng$$gang$#khe$#wan#%iambo$$chem$"ke$+ol-volcroze$!s$%thorn$\'zettian#$jela$#ons##ker',
+    '&!\'&\'-beings($rown\'\'dancing(%river\'\'engines\'&fringe\'$head\'%loads\'#run\'\'saddles(#kin($tick)%oning\')trappings',
+    '\'!y&!.&#men&$ness&+s-and-backs&$work$"or%"va##lin#!m#(n&eacute$!\'$%achie%$dieu%!j',
+    '%!r%!z$#ees%#lle\'!s(&mithii\'-y/jaguarsport)(promoter&!y%%nfeld%\'rwetter&!y$#ini&!o%!s',
+    '#%ofrio$"gh$*hoe/dorset%*ue/captain()midsummer$"lo$$r(s)%)-assisted&$card&&funded%./lender/vendor%#ing$(thingism$!u$\'van-you',
+    '(/gloucestershire\'"ia\'!s##sey$#ide#"t\'$%/cant$(chathink$!s$"un#"us%*z/meszaros$#zla#%whill$\'patrick',
+    '$$elot&!s"$o-da&#hed\'!s%*oo-doodooo$#rag##ars#(b-yar-na#%chary$#ots#!d$!a%"hs$#ler',
+    '$*y/managing#"ey##fer&!s#%gfish#$hans$&ickeys##in\'#,keepent-arch%#ran#!l$)&rehy;eys$)ally-land%!y$!b',
+    '%)dominated%%ikons%$loop%(merchant-!s&%onger%$rock%(shrouded%$tome%%watch*#ers&*ith-a-view$!.$,/christopher$)sday-book',
+    '(#ers%#ter$(watching#$nans$"es&$bury%$ttes##oom%!o#$pher#\'r&mdash%%ndash%(rehy;way$!\'$#(s)',
+    '(%final$%-arch%%based%%cases&$hain\'#ime&&urtain%%flaps&%rames%\'hanging,!s&#olt%#key&&nobbed)!s',
+    '%%locks%&making%$narb%$open)"ed*"rs)#ing%&policy&$rize%\'release%\'scraper\'\'ulpture&$eals&\'hutting&#ill',
+    '&$pace&$till&%witch%&viewer%#way$%.part$!/%&window$#_as$&belled$%chain$!e%!d%!s$"ga',
+    '$%jambs$$lock%!y$%maker$%nails%\'fontein$&person%$hone%$late$)s&mdash;i%$-off%!.%,/stooges/mc5&\'windows%$eals',
+    '&(ep-fresh)"of(!.("py&#one\'$pper+!s)#ing$&way.it$&zetten#"th$!y##ver&!s$#ing',
+    '#\'yeweerd#"zy"#pac#(e-dealer%%fiend&#ree%%heads%\'painted&\'eddling&(romoting%%sheet%&takers&%ested&&ribute$%d-out',
+    '$$head$#man$!r$&y-like#$fner#\'hiephin#$iest$#ngs$$tova##ler#\'olavoro\'"ro#/pelg&auml;ngers\'&ouache$"le',
+    '&$mayr#&ramine##son#!y$,era-designed"+r&aacute;ti$)zacute;ti#*a/national$#dan$"nk$!s$"tt#(cas-like&!e$#eus',
+    '#"di##ean$!e$"go$#ian$"ll$$ndra$!r$!s$!y#&f-just$$krug#+ia-pamphili%+n&amp;sharp&!o',
+    '\'%quare%!.%!e%#lea$!e$$gish%&o(1.9)&&/speed$"na%%court%%skaya$1s-the-dinner-lady$#val#"k2$"en',
+    '$!s%&teiner#$lhac$%igjav&$shaw#$m\'nt$$agen%#ndy&%sland&"te$)er-roofed\'(windowed&"ed%#uil%!y',
+    '$!i%!a%3ngton/herefordshire%!t&!e&)ory-style$#ond&$side%1use&rehy;friendly#\'neywood$,r&ouml;schen$$seif##oga%)obuzhskii$%nicum',
+    '$"ta%*h&eacute;e&!e&"ie&"ys$&vernis#$pped$!s%%erven#+ra/national$!f$$idge%$sons$!o%%nsoro',
+    '%)l/lateral%!r$,et-hampshire&*/hampshire&!t%(y/dustin$)iocellata$#man$*o-medially&)ventrally%$duro%!n%)ventrally##ter$+ic&oacute;s',
+    '$&sduain#%ville#$ward\'$/lib#$ylus#!z"\'s-msnet$$only#$/ibm$"vs&#(e)&!e#$=umb##aaf$\'pps.ini',
+    '%\'cropped%+dependently%)responses$!.$"ll$&mealti$!n$!r##hak#"ia$#fey$%meter$&tejism%#ube##key',
+    '#$mate#$ogne#(position#(s-houses$#er.%$tter$(hell.ini%%ouses$!i%\'ng-down$\'vidanya#(tioevsky$&oeosky%&yevksy#%zkocs',
+    '("ed$&filled%#ree\'!t$\'markers$&to-dot#%/full#$ards#\'hegirls%$rin\'$%iepin%"ll#"is#"os#%ronix',
+    '$)-per-inch$"/s&&ubarea$"am#(ted-note\'\'rhythms%!r$#ier%"ly%!n&$gham\'!s$"le$!o%!n',
+    '$$rens%%idges"%uaihy$)nier-like$!y#!b$"in$#las%/e&mdash;glazing\',ndash;headed\'*rehy;cross1"ed,&decker,\'glazing,+jointedness',
+    ',\'meaning,&spaced-\'titched&)-\'sticky\'\'\'0-seven\'#a-1)!3($dult)#zes($gent($ided("nd(&rcaded*#hed)#med',
+    '()sterisked(\'xe-hand\'&backed,"rs+#ing*)on-andegg)$gged+#ing)&lanced)"nk)!r*#rel)$sses(%edded*$room',
+    '($lend)$uffs(%ogied)&ilered)"lt)"mb)$nded)%oking.!s+!s)#und),x-of-popcorn((reasting(#yte\'&capsid',
+    '(&hecker,!s)\'imneyed*"ns)#ock*"ir(&lasped)&icking*$pped(\'olumned)#unt(%redit)&opping*%ssers*"wn',
+    '(#ube)"lt)$pped)$rved($ycle\'$date+!d+!s()efensible)#lta)%nsity((iffusive)$gest-"ed)%tched',
+    '(&raught)#ill($utch(#yed\'$edge(&ngined(*thnography(\'xposure\'\'faceted)%ulted(&eature((isherman(&leeced(#old(%urrow',
+    ')%raged)"te+!d($lass($reen\'\'handers+"le)\'rnessed*!p(+eaded-eagle)$rnia(%inged(\'undreds*!g\'&income',
+    ')"ss($nits+#ted)"ot+$ting\'%layer(#eaf+"ed*#ved(%ifing)$sted(#ock)$oped(&ungful\'&mambas',
+    '(\'eanings)$mber+%raned()indedness(\'olecule)%unted(&ugging)$scle\')narrative(%ecked+!s)&gative(#ote+!d\')occupancy',
+    '(&r-more*/single-breasted(\'vertime\'&paddle)"st("it(\'latinum*!y(&ouched((recision)&inting)%onged*#wed($ulse\'\'quarter',
+    '(&efined)\'sonance($hyme(#ole("un\'$save(#can)$roll)&ulling(\'entence)%ssion)#xed(&hafted)#eet*"ll',
+    ')"ze(#kin(#pan)#out)%urred)!y($tage*&ircase*&ndards)%emmed*!p+$ping)$orey(+ubstitution)"re',
+    '\'$talk)%pered)!x(\'hatched)=e-number-you-first-thought-of)&inking)#ump(#ied*!r+"ed)#med)!t(#ook*$thed)!p',
+    '(\'racking*\'nsplant*!p)!y((yretrack\'!u()nderlined\'&values)#ult(%ented(%oiced-$ness\'$wall+"ed(\'hamming',
+    '(#ind*$ners+#ing(#ork*"ld(&rapped\'&yolked&\'a-minus&&backed(\'rrelled\'#ind&\'checked\'-lickspeed=452&+d&rehy;over\'#-co',
+    '(%sided\'!.(#the\'(ay/black\'$oors\'$utch&&glazed*#ing&&header&$lash&&minded,$ness&$neck(#sse&"re',
+    '&$sign&&taking\'"ed&*your-money%%ingof%(le-digit%#oon%$ures%*y-bereaved\'*determined)%viant\'$good\'(inverted\'&sexist$(t-ridden',
+    '%%/till%$fire&*ul-looking(!l(!s#/ce-am&egrave;re$!h%%manov$%ments$!t#"ds$!y#&gallii%"ns%"ry',
+    '&\'nutting&&shaped%!.%"an%$ball)!s%$like%#men%)nut-shape($/ask($ting%#tie\'"ly&*y-featured\'!s',
+    '&+s&rehy;home\'!-(%based(%homes(*orientated\')/district(\'malvern((northrop()playgroup\'$dale\'"ii%!o#"he#$kaga##lab',
+    '$#gas##mas$*en-trained&!c%!r#%ngous$#ray#%pamby(\'-matoka#)r-looking$#din$#est$"if%!s#\'shantuo',
+    '#!t$$fire$%hland$#oum\'%mines##van$"en##wes##yon#!z$\'e/dieus%!t&!s"1v&rcaron&aacute;k##ana',
+    '#*e-coloured%$tees&%opped&#ree%%white&%inged$$cots$$daly$%ishly$#kin$"ly$.r&mdash;calais%(-dunkirk&*folkestone%+/folkestone',
+    '%"ed%#hay%"ow%&strand$#sse$&tailer##gan#"il$"ng$"sh#$leti#(r&ograve$!e#"vy"\'w&ndash',
+    '$&yoland#&biggen#$cett#+d/neighbour$$ales$*eswell/rsc$#ier&"st%"ly%#ngs$)ney/kevin$%swell#%eling$\'r-house&%lands',
+    '%!s$!x#%field#$gang#!i$#tcz#!l$!.$"en%!y$"ie#$n&gt%%mdash%,ndash;graded%+rehy;graded',
+    '*&loaded,&ngford*$side+%tream*"to*\'valuing$"\'n$\'-a-step&\'n\'-outs\'&d-out.,"er&*t-the-heel\'$heel&"wn%%blast',
+    '&!y%\'channel&$limb*"ed*#ing&%olumn\'%untry\'%vered&%urled%%drawn\'#ift%$fine&&lexure\'"ow&$orce',
+    '%\'glacier&\'radings&$yred%%homey%"in\'*-the-mouth%&jacket%$lake&#ine&\'ongford%+memory-lane&\'odulate%%nodes%;on-his-luck-but-permanently((its-luck',
+    '\'"pe&#lay)#ing\'&unging&\'ointing\'"ur&\'roblems&*seudo-cost&&utting%%right%%scale($tter&$eeds\'%tting&$haft',
+    '&\'pecific\'&inning\'#out&$tate\'%rokes\'%uffed&$weep\'$ings%(the-card)&middle)%place\'$rown(%usted&#ime&!o',
+    '\'!w&&rading&$urns%$wave&&eather\'"ll&$hole$!.%&charge%!i%$then$!/%#but%.ditched/jammed%/gloucestershire',
+    '%%rambo%\'swimmer%#the$#_as%(in_front%"to$"ay$$bent%#ird$\'changes$(draughts&#ift$+er/trialist%&s/show\'&victim',
+    '%%illed%#lex%$olds%"ul$*heartening%%iller%&urling$#ily%!n&(g-street$(lighting&$nked%%oader&%oking\'"ps',
+    '%"an\'$ning$$ness$$page%$our.%$roof$%rated%)egulating$\'s/peace\'%layer&-staffordshire%$cale%#hay&*urst-bound%#ian',
+    '&)zing-bent*,/rightsizing%$lide%$pout)!s%"ta\'$ging\'"ir)"ts&"ep%%wivel$%tempo%$hrow%#ide%#ons',
+    '%&urning()s.questor$$view$2ward&rehy;pointing(\'-angled)*compatible)*decreasing+\'flected)\'shifted*&lammed*\'wooping%&earing&$ight%%ind-.$)y-cheeked',
+    '#$rick$"og$!s$"y.#!s$$land#"th$#ies#!w$"nn"\'xazocin#(ological$\'rubicin",yle-davidson%\'/dealer',
+    '$#ish"\'zen/ten%"th#$iest$$ness%%g-off##zel!3p&mdash;proletarian"(-1/e2f-1#!2$"10#*controlled"*.sc.aeasoe"+/sc/special"!2',
+    '"&651075"!h"!l#!y"*m/&micro;g#\'i-based"!n#%-100s#$8/90#!s$!s"%osits#$u-19%"28$"28',
+    '"#s/7##600#!s"#x20!+q-timecoder"&f-cosy"!l!-r&ocirc;lerie#(uacute;-*$adan*%edain$\'uml;ben#3yacute;-cr&aelig;ft"&\'gasia"$-110',
+    '#%6000s#!i#(negative"%.1051#%berry#&calamy$%ullen#-e.spanopoulou#&gauden#+lloyd-jones#&martyn#\'patrick#\'stephen#&thomas#\'winston',
+    '"!2#"00"\'300/400"#550""90",a&zcaron;ice#*b-coloured%\'looking%)trousered$*ble/author\'!d$+ly-coloured#"ca$%hma**$!k',
+    '$%onius%"tt$(ula-like%)nculiasis#$eger##ft\'%%-bill&\'project%-/constitution%%ed-in\'!.%$ing.%#law%#man%+smancurrent',
+    '$\'-anchor&#rse\'$tist%$back)!s%$down%$free%#hag&&unting%$lift\'"ke\'"ne)!s%#net%#out',
+    '%&racers&$opes$$ados%"hn%%nescu&+ov/georgiev%%sakis$\'bellies$"es$(ged-down&!r%#in\'\'.g-and-dropping)\'hopping(!.',
+    '%"le$$hici%%ounds$*i&scaron;a$%lifts&#nes\'!k$(nignazzo$)o/geminis%#men%\'n-clasp\')decorated(&ictate\'\'fillers\'#god',
+    '(%eaded+!s(#ide\')in-charge\'\'killing\'&master(&ounted\'$ship($ized($tamp*#nds\'+vanquishing\'&winged+!s(#ort',
+    '&#air&$back\'#oat&+dictate-7-k&!e\'"ra)!s\'!s\'"ts&$fire("sh\'$lair+)/european&$head\'#ide',
+    '&$lady(#nds\'$ords&$rage&%woman%!s&"hi%$umis%#vit$%sholm%#men%#ter&#rip$#uer#&in-age',
+    '&(clogging&%edged&$hole&$like&$pipe&$runs%\'/source%$able&)ge-minded(!s%!e&)d-looking%$head%"ie&"n\'',
+    '%%piped%$shoe#"ka%)kis-smith$%e-ish%$.but%&/smith\'/ub-postmistress%!n&%sburg$"on%!s%$ulis#(m-divans$/a-documentaries',
+    '&*made-music(#ker&0through-movement%!/&+documentary&\'english&Bmusic/essay-writing/cookery/coming&.percussionists&\'theatre%"ne%$rama%!t&(herapist+!y&,i&rehy;cally',
+    ')(sounding(\'/change)*recitative()ally-bent(!k\'\'zations&%urgic+$ally$!m#$nich$#ked#"pa%&bility&"le%&rnaudi',
+    '$&e-over&%suits%\'ability&!u%\'r/aston\'$paul&&sfield\'5town&mdash;plumbridge&\'y-folds$#ier%#ngs##sdo$/tically-altered,)increased,\'reduced',
+    '%+ht-and-meat(%board($flow(%horse($oxen($play\'$iest\'\'manship\'"s.($trip\'%works#"vs#+w&rehy;back$!\'$&-a-man',
+    '&%ridge%$leaf%#out%)stringing%$type%$well&\'in-draw$&corded$!d$!e%*e/acceptor%!n%(r-liners\'$unit%!s',
+    '%,ng&rehy;pins\'%-book($card(\'offices(#pad(%room\'((together\'$.pcx($room\'!/(&design)2iscussing/other/as(7negotiating/telephoning\'/s/presentations$\'n&mdash',
+    '%"\'\'%%-4.30&$down&"in&+thread-work%!.&!6&!b%$_out&"up$$over$$rin\'$&s_near%%heets$"yn',
+    '#)y-pulling$$cart%-ott/shopowner$&horses$$ning$/ton/oxfordshire#"za$!h""bs"/ead&rehy;nought%$-ful&&making&(swinging%$/the%2ed-value-for-money',
+    '(!.(!l(!s%%heads ,enchytraeids',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_81 = (
+count_81 = 6694
+
+heads_81 = (
     'crucifix\'',
-    'crucifix-shape',
-    'crucifixions/',
-    'crucifixissent',
-    'crucifyingly',
-    'cruciger',
-    'cruckerne',
-    'crucks',
-    'crucorney',
-    'crud-like',
-    'crud-y-gwynt',
-    'cruddace',
-    'cruddace/chief',
-    'cruddled',
-    'crude\'',
-    'crudely-carved',
     'crudely-drawn',
-    'crudely-duplicated',
-    'crudely-executed',
-    'crudely-lettered',
-    'crudely-lit',
-    'crudely-penned',
-    'crudens',
-    'crudge',
-    'crudgington',
-    'crudia',
-    'crudiq',
-    'crudit&eacute',
-    'cruds',
-    'cruel-looking',
-    'cruell',
-    'cruelle',
     'cruelly-lit',
-    'cruelty-kindness',
-    'crueltyfree',
-    'cruet-set',
-    'cruff',
-    'cruftiest',
-    'cruggleton',
-    'cruibh',
-    'cruicial',
-    'cruidlin',
-    'cruiks',
-    'cruise-control',
-    'cruise-level',
-    'cruise-missiles',
-    'cruise-ship',
-    'cruise.the',
     'cruise/ss',
-    'cruise254+n/a',
-    'cruiseliner',
-    'cruiseliners',
-    'cruisephone',
-    'cruiser-racers',
-    'cruiser-shaped',
-    'cruiser/racing',
-    'cruisewatch',
-    'cruisewear',
-    'cruising-speed',
-    'cruite',
-    'crul',
-    'crumb-collection',
-    'crumb-patch',
-    'crumb-scattered',
     'crumb-spreading',
-    'crumb-structure',
-    'crumbing',
-    'crumbleholme',
-    'crumblies',
-    'crumbling-looking',
-    'crumeniferus',
-    'crumhorn',
-    'crumhorns',
-    'crumland',
-    'crumlin-trained',
-    'crummery',
-    'crummey',
-    'crumped',
-    'crumple-faced',
-    'crumple-free',
     'crumpler',
-    'crums',
-    'crumsters',
-    'crumwell',
-    'crunch-point',
-    'crunch-points',
-    'crunch-time',
-    'crunch-you-upper',
-    'crunch/lead',
-    'crunchier',
-    'crunchily',
-    'crunchiness',
-    'crunden',
-    'crunella',
-    'crunkleton',
-    'cruppers',
     'crus-galli',
-    'crusader-states',
-    'crusader.royal',
-    'crusaders-portadown',
-    'crusading-journalist',
-    'crusading-spirited',
-    'crush-barriered',
-    'crush-land',
-    'crush-load',
-    'crush-proof',
-    'crushbarriers',
-    'crushed-pumice',
-    'crushed.',
-    'crushings',
-    'crusoes',
-    'crust&mdash;a',
     'crustaceous',
-    'crustal-scale',
-    'crustiness',
-    'crustscrapers',
-    'crusty-free',
-    'crusty-grunger',
-    'crusty-type',
-    'crutch-stop',
-    'crutcher',
-    'crutchfield',
-    'crutchpiece',
-    'crute',
-    'cruthirds',
-    'crux-andrae',
-    'cruxton',
-    'cruyft',
     'cruzatt',
-    'cruze',
-    'cruzfisheries',
-    'cruzi',
-    'crw',
-    'crwee-crwee',
-    'crweetuu',
-    'crwother',
-    'crx-24',
-    'cry-babies',
-    'cry-off',
-    'cry-sis',
-    'cry-y',
-    'cry/invocation/cursing',
-    'cryans',
-    'crye',
     'cryes',
-    'cryfield',
-    'cryigg',
-    'cryiia',
-    'cryiib',
-    'cryiiia',
-    'crying.',
-    'crymbles',
-    'crymes',
-    'crymych',
-    'cryo',
-    'cryoconite',
-    'cryoglobulinaemia',
-    'cryoglobulins',
-    'cryohydrates',
-    'cryohydric',
     'cryonicists',
-    'cryonics',
-    'cryonival',
-    'cryoprecipitate',
-    'cryopreservation',
-    'cryoprotectants',
-    'cryoprotected',
-    'cryoservice',
-    'cryosophila',
-    'cryospec',
-    'cryospeed',
-    'cryosurgery',
-    'cryotech',
-    'cryotubes',
-    'crypsis',
-    'crypsls',
     'crypt+',
-    'crypt-room',
-    'crypt-rooms',
-    'crypt/',
-    'cryptal',
-    'cryptanalyst',
-    'cryptands',
-    'cryptanthus',
-    'crypticity',
-    'crypticole',
-    'crypto&rehy;sporidium',
-    'crypto-amnesiac',
-    'crypto-anarchist',
-    'crypto-cartesianism',
-    'crypto-catholics',
-    'crypto-chauvinist',
     'crypto-chauvinistic',
-    'crypto-communists',
-    'crypto-crystalline',
-    'crypto-industrial',
-    'crypto-jews',
-    'crypto-market',
-    'crypto-post-feminist',
-    'crypto-protestant',
-    'crypto-royalist',
-    'crypto-scientific',
-    'cryptococcosis',
-    'cryptococcus',
-    'cryptogam',
-    'cryptoglandular',
-    'cryptograhic',
-    'cryptograph',
     'cryptographs',
-    'cryptological',
-    'cryptomeria',
-    'cryptomonas',
-    'crypton',
-    'cryptonyms',
-    'cryptopygus',
-    'cryptoses',
-    'cryptospyridia',
-    'crys',
-    'crysanthemums',
-    'crysta',
-    'crystal&rehy;clear',
-    'crystal&rehy;lises',
-    'crystal(1980)',
-    'crystal-',
     'crystal-appointed',
-    'crystal-based',
-    'crystal-blue',
-    'crystal-coated',
-    'crystal-controlled',
-    'crystal-free',
-    'crystal-grower',
-    'crystal-like',
-    'crystal-melt',
-    'crystal-stemmed',
-    'crystal-studded',
-    'crystal-wielding',
-    'crystal-wireless',
-    'crystalate',
-    'crystaley',
-    'crystalisation',
     'crystalle',
-    'crystallinum',
-    'crystallisers',
-    'crystallizations',
-    'crystallizers',
-    'crystalloid',
-    'crystallorophias',
-    'crystally',
-    'crystals.',
-    'crystals/resonators',
-    'crystat',
-    'crytalised',
-    'crytic',
-    'cryuff',
-    'cs&rehy;2',
-    'cs-context',
     'cs-no',
-    'cs-shock',
-    'cs-tlc',
-    'cs-type',
-    'cs0',
-    'cs336630',
-    'cs40',
-    'cs4zx',
-    'cs9000',
-    'cs9001pc',
-    'csa-a',
-    'csa-a\'',
-    'csa-binding',
-    'csa/',
-    'csa/csa',
-    'csa1',
     'csabd',
-    'csad',
-    'csas',
-    'csc-free',
-    'cscc',
-    'csce-for',
-    'cscw',
-    'csdp',
-    'cse\'',
-    'cse/',
-    'cse/gce',
-    'csec',
-    'csecs',
-    'csenger',
-    'csengery',
-    'csepel',
     'cserge',
-    'cserka',
-    'csernai',
-    'csf-1',
-    'csfr',
-    'cshh',
-    'csicsery-r&oacute;nay',
-    'csie',
-    'csikszentmihalyi',
-    'csil',
-    'csillag',
-    'csillik',
-    'cskac',
-    'cslb',
-    'csma/cd',
-    'csms3',
     'csn',
-    'csn&amp;y',
-    'csnpd',
-    'cso/ng',
-    'csob',
-    'csondor',
-    'csorna',
-    'csra',
-    'csrg/bsdi',
-    'css-2',
-    'css-x-4',
-    'csso',
-    'csta',
-    'csteep',
-    'cstj',
-    'cstrs',
     'csu&mdash;christian',
-    'csu*',
-    'csu-ers',
-    'csus4-c',
-    'cswip',
-    'csx',
-    'cszaba',
-    'ct-2',
-    'ct-caratex',
-    'ct-directed',
-    'ct-gastrin',
-    'ct/ct',
-    'ct01',
-    'ct13',
-    'ct16',
-    'ct19',
     'ct2-standard',
-    'ct4',
-    'ct5',
-    'cta-2000',
-    'ctal',
-    'ctb36',
-    'ctcaagccactgctggag',
-    'ctcatga',
-    'ctccagttaaaccacctac',
-    'ctctgcatcatttagccacttctctaa',
-    'cte',
-    'ctenidia',
-    'ctenoid',
-    'ctenopharyngodon',
-    'ctenophora',
-    'ctenophore',
     'ctesibius',
-    'ctf',
-    'ctf/nf-1',
-    'ctg.gt',
-    'ctgaacat',
-    'ctgggatac',
-    'ctggggaggcgacccctccccccttgtcccgact',
-    'cthulhoid',
-    'cthulhu',
-    'cti/mvp',
-    'ctis',
-    'ctislav',
-    'ctiss',
-    'ctl-mediated',
-    'ctlr',
-    'ctn',
     'ctn-sou-of',
-    'ctp-synthase',
-    'ctrl+&larr',
-    'ctrl+&rarr',
-    'ctrl+alt+break',
-    'ctrl+alt+delete',
-    'ctrl+alt+insert',
-    'ctrl+click',
-    'ctrl+end',
-    'ctrl+enter',
-    'ctrl+f5',
-    'ctrl+pg',
-    'ctrl+x',
-    'ctrl-',
-    'ctrl-alt',
-    'ctrl-alt-del',
     'ctrl-esc',
-    'ctrl-k-k',
-    'ctrl-k-n',
-    'ctrl-kd',
-    'ctrl-r',
-    'ctrl-z',
-    'ctrl/alt/del',
-    'ctrl/c',
-    'ctrl/y',
-    'ctrl=break',
-    'ctrl=click',
-    'ctry',
-    'ctte',
-    'cttee',
-    'cu&lsqb;id',
-    'cu(i)',
     'cu(nh)',
-    'cu(oh)',
-    'cu+',
-    'cu-as-pyrite',
-    'cu-ic',
-    'cu-mo-au',
-    'cu-zn-au',
-    'cu-zn-pb',
-    'cu-zn-pb-ag',
-    'cu-zno',
-    'cu.cm',
-    'cu.ft.',
-    'cu.m/ha/year',
-    'cu.m/year',
-    'cu/kg',
-    'cu/mmole',
     'cu1a',
-    'cu2+',
-    'cua91',
-    'cuadernos',
-    'cuadros',
-    'cuailnge',
-    'cuaist',
-    'cualann',
-    'cuanavale',
-    'cuanza',
-    'cuanza-bengo',
-    'cuaranty',
-    'cuartas',
-    'cuarte',
-    'cuasee',
-    'cuationed',
     'cuatro',
-    'cuauhtemoc',
-    'cub-hunting',
-    'cub-reporter',
-    'cub-scouts',
-    'cuba-ctc',
-    'cubahiro',
-    'cuban-americans',
-    'cuban-based',
-    'cuban-caricom',
-    'cuban-chartered',
-    'cuban-spanish',
-    'cuban-us',
-    'cubana&mdash;cdc',
-    'cubane',
-    'cubano',
     'cubapetroleo',
-    'cubatur',
-    'cubberly',
-    'cubbies',
-    'cubbing',
-    'cubbitt',
-    'cube-like',
-    'cube-shards',
-    'cube-sleeves',
-    'cube-stock',
-    'cubemaster',
-    'cubensis',
-    'cubeo',
-    'cubeoctahedron',
-    'cubertin',
-    'cubic-foot',
     'cubicfoot',
-    'cubicle-cupboard',
-    'cubicle-sized',
-    'cubicstructures',
-    'cubicula',
-    'cubies',
-    'cubillo',
-    'cubist-futurist',
-    'cubiste',
-    'cubistic',
-    'cubital',
-    'cubmaster',
-    'cubmistress',
-    'cubozoan',
-    'cubuto',
-    'cucamonga',
     'cucaratxa',
-    'cuccini',
-    'cuchinan',
-    'cuchulainn',
-    'cuchullain',
-    'cucichair',
-    'cuck',
-    'cuckham',
-    'cuckoldry',
-    'cuckoo\'ed',
-    'cuckoo-bee',
-    'cuckoo-bees',
-    'cuckoo-bird',
-    'cuckoo-flowers',
-    'cuckooism',
-    'cuco',
     'cucuchuchu',
-    'cuculidae',
-    'cucullata',
-    'cucullia',
-    'cucumber-like',
-    'cucumis',
-    'cucuracha',
-    'cucurbitacins',
-    'cucurbitae',
-    'cudbear',
-    'cudd/stable',
-    'cuddesdon-like',
-    'cudding',
-    'cuddington',
-    'cuddleee',
-    'cuddlesome',
     'cuddliest',
-    'cuddly-duddly',
-    'cuddly-looking',
-    'cuder',
-    'cudham',
-    'cudjoe',
-    'cudnell',
-    'cudworth-flint',
-    'cue-bic',
-    'cue-cards',
-    'cue-in',
-    'cue-line',
-    'cue-sheets',
-    'cue/',
-    'cueboard',
-    'cuecard-readers',
     'cuelgamuros',
-    'cuello',
-    'cuemen',
-    'cuerdale',
-    'cuernavaca',
-    'cuero',
-    'cuerpos',
-    'cuervo-vinent',
-    'cuesmes',
-    'cuester',
-    'cueva',
-    'cufay',
-    'cuff-buttons',
-    'cuff-title',
-    'cuff-titles',
-    'cuffe',
     'cuffuffle',
-    'cuffy',
-    'cugat',
-    'cuggly',
-    'cugullere',
-    'cuh',
-    'cuh-cuh-clean',
-    'cuidad',
-    'cuidar',
-    'cuigear',
-    'cuilin',
-    'cuiline',
-    'cuir-bouilli',
-    'cuiraing',
-    'cuirasses',
-    'cuire',
     'cuisenier',
-    'cuishes',
-    'cuisick',
-    'cuisinary',
-    'cuisinier',
-    'cuisiniers',
-    'cuisses',
-    'cuistot',
-    'cuitt',
-    'cuitural',
-    'cuivr&eacute',
-    'cuj',
-    'cukor',
-    'cukura',
-    'cul&rehy;minating',
-    'cul-de-',
     'cula',
-    'culate',
-    'culatello',
-    'culbin',
-    'culblean',
-    'culboons',
-    'culcairn',
-    'culchie',
-    'culcreuch',
-    'culd',
-    'culdees',
-    'cule',
-    'culebra',
-    'culemborg',
-    'culham-based',
-    'culhwch',
     'culicidae',
-    'culicinomyces',
-    'culicivorax',
-    'culina',
-    'culinaires',
-    'culinarily',
-    'culinary-minded',
-    'cullams',
-    'cullen/defending',
-    'cullen/mother',
-    'cullen/unipart',
-    'cullenswood',
-    'culleonard',
-    'culleross',
-    'cullett',
-    'culley/animal',
     'culley/bucks',
-    'culleys',
-    'culliford/wife',
-    'culligan/air',
-    'cullimore/campaign',
-    'cullimore/farmer',
-    'culling.',
-    'cullings',
-    'cullion',
-    'cullip',
-    'cullmann',
-    'cullom',
-    'cullular',
-    'cullutherapie',
-    'cullwick',
-    'cullyhanna',
     'culmenated',
-    'culmer',
-    'culmin&rehy;ated',
-    'culmington',
-    'culmne-seymour',
-    'culnahna',
-    'culotte-skirt',
-    'culpepers',
-    'culpeppers',
-    'culpin',
-    'culprit.',
-    'culpryt',
-    'culquha',
-    'culs-de-four',
-    'culs-de-paris',
-    'culsh',
     'cult&rehy;figures',
-    'cult(s)',
-    'cult-associated',
-    'cult-centres',
-    'cult-communities',
-    'cult-figure',
-    'cult-jah',
-    'cult-littered',
-    'cult-poet',
-    'cult-sign',
-    'cult-song',
-    'cult-turned-flagship',
-    'cult-viewing',
-    'cult/d&amp;h',
-    'culte',
-    'cultelli',
     'cultellum',
-    'cultellus',
-    'culterty',
-    'culteys',
-    'culthord',
-    'cultigen',
-    'cultiral',
-    'cultivability',
-    'cultivated.',
-    'cultivi',
-    'cultiweeder',
-    'cultram',
-    'culturable',
-    'culturais',
-    'cultural&ndash;social',
-    'cultural-educational',
     'cultural-political',
-    'cultural-religious',
-    'cultural-southern-hip-hop-folk-ethnic-funk',
-    'cultural/arte',
-    'cultural/communication',
-    'cultural/ethnic',
-    'cultural/racial',
-    'culturalize\'',
-    'culturally&rehy;determined',
-    'culturally&rehy;mediated',
-    'culturally-defined',
-    'culturally-dependent',
-    'culturally-engrained',
-    'culturally-loaded',
-    'culturally-marked',
-    'culturally-specific',
     'culturally/spiritually',
-    'culturati',
-    'culture&lsqb;1&rsqb',
-    'culture&rehy;bound',
-    'culture*',
-    'culture**',
-    'culture-area',
-    'culture-as-an-aspect-of-nature/culture-as-an-aspect-of-mind',
-    'culture-boundedness',
-    'culture-building',
-    'culture-centric',
-    'culture-changing',
-    'culture-complex',
-    'culture-conditioning',
-    'culture-controlled',
-    'culture-creating',
     'culture-dependence.',
-    'culture-fair',
-    'culture-favoured',
-    'culture-gap',
-    'culture-krill-harvesting',
-    'culture-less',
-    'culture-nature',
-    'culture-proof',
-    'culture-related',
-    'culture-shaped',
-    'culture-shift',
-    'culture-specificness',
-    'culture-style',
-    'culture-transmitting',
-    'culture-vulture',
-    'culture-vultures',
     'culture-worker',
-    'culture.',
-    'culture.l',
-    'culture/pop',
-    'culture/society',
-    'culture/structures',
-    'culture_as',
-    'cultureideology',
-    'cultureless',
-    'cultures/groups',
-    'cultures/structures',
-    'culverhay',
-    'culverin',
-    'culverthorpe',
-    'culverting',
-    'culverwell',
     'culzean',
-    'cum-',
-    'cum-workshop',
-    'cum/cause',
-    'cumainn',
-    'cumans',
-    'cumarasamy',
-    'cumate',
-    'cumberbund-wearers',
-    'cumberminster',
-    'cumbermounds',
-    'cumbernauld-based',
-    'cumbersome-looking',
-    'cumbies',
-    'cumble',
-    'cumbra',
     'cumbraes',
-    'cumbria-based',
-    'cumbria-built',
-    'cumbria/lancashire',
-    'cumbrian-born',
-    'cumecs',
-    'cumella',
-    'cumene',
-    'cumers',
-    'cumfreis',
-    'cumi&egrave;re',
-    'cumidge',
-    'cumieres',
-    'cumin-scented',
-    'cumin-spiced',
-    'cuming/senior',
     'cumingi',
-    'cuminyn',
-    'cumm',
-    'cumma-cumma-cumma-dum-do-be-do-dum-dum-cumma-cumma-dum-do-be-',
-    'cumma-cumma-dum-do-be-do-dum',
-    'cummage',
-    'cumme',
-    'cummen',
-    'cummerbands',
-    'cummin-seed',
-    'cumminity',
-    'cummock',
-    'cummyn',
-    'cumnor/oxfordshire',
-    'cumonck',
-    'cumparsita',
     'cumpsty',
-    'cumshaw',
-    'cumuli',
-    'cumulo-domes',
-    'cumulus-covered',
-    'cumuppance',
-    'cun&rehy;ningham',
-    'cuna',
-    'cunan',
-    'cunarders',
-    'cuncliffe-owen',
-    'cunctator',
-    'cundarder',
-    'cundell',
-    'cunderdin',
-    'cunedda',
     'cuneen',
-    'cunegonde',
-    'cunegunda',
-    'cunene',
-    'cunes',
-    'cunescu',
-    'cung',
-    'cunhas',
-    'cuniberti',
-    'cunico',
-    'cuniculus',
-    'cuninghame',
-    'cuninghames',
-    'cunner',
-    'cunnes',
-    'cunnigar',
     'cunnignham',
-    'cunnin\'',
-    'cunningest',
-    'cunningham-craig',
-    'cunningham-jardine',
-    'cunningham/children',
-    'cunningham/general',
-    'cunningham/hospital',
-    'cunningham/mother',
-    'cunningham/trainer',
-    'cunninghamii',
-    'cunninghan',
-    'cunningly-written',
-    'cunningsworth',
-    'cunnon',
-    'cunnyngham',
     'cunoarus',
-    'cunobelin',
-    'cunomaglos',
-    'cunomorous',
-    'cunomorus',
-    'cunred',
-    'cuns',
-    'cunt(ona)',
-    'cunt-struck',
-    'cuntish',
-    'cuntmeat',
-    'cuntrair',
-    'cuntre\'',
-    'cuntrera',
-    'cuntries',
-    'cunty',
     'cunwald',
-    'cuny',
-    'cunynghame',
-    'cuomos',
-    'cuong',
-    'cup&amp;league',
-    'cup&mdash',
-    'cup\'',
-    'cup-and-league',
-    'cup-and-saucer',
-    'cup-clinching',
-    'cup-conscious',
-    'cup-european',
-    'cup-exterior',
-    'cup-fighters',
-    'cup-fighting',
     'cup-interior',
-    'cup-interiors',
-    'cup-marked',
-    'cup-nests',
-    'cup-painter',
-    'cup-style',
-    'cup-tondo',
-    'cup.how',
-    'cup/',
-    'cup/european',
-    'cup/flour',
-    'cup/league',
-    'cup/saucer',
-    'cupar-springfield',
-    'cupboard-full',
-    'cupboard-lined',
     'cupboard-love',
-    'cupboard-under-the-stairs',
-    'cupboard.',
-    'cupboard/prep',
-    'cupcakes',
-    'cupchik',
-    'cupel',
-    'cupertino-based',
-    'cuphea',
-    'cupholders',
-    'cuphook',
-    'cupiagua',
-    'cupiagua-2',
-    'cupiagua-3',
-    'cupid-bow',
-    'cupid-woven',
     'cupidon',
-    'cupio',
-    'cupless',
-    'cupo',
-    'cupp',
-    'cuppa.',
-    'cuppam',
-    'cuppery',
-    'cuppes',
-    'cuppin',
-    'cupple',
-    'cupples',
-    'cuppy',
-    'cuprate',
-    'cuprates',
-    'cupreous',
     'cupressoides',
-    'cuprethol',
-    'cupric',
-    'cuprija',
-    'cuprina',
-    'cuprite',
-    'cupro-nickel',
-    'cuproine',
-    'cups-of-tea',
-    'cups.',
-    'cuptondos',
-    'cupula',
-    'cupwinners',
-    'cupwinning',
-    'cur&eacute;s',
-    'cur&rehy;rent',
     'cur(se)',
-    'cur.',
-    'cura',
-    'curabell',
-    'curably',
-    'curagh',
-    'curam',
-    'curandera',
-    'curanderas',
-    'curantur',
-    'curaray',
-    'curare-based',
-    'curas',
-    'curassavica',
-    'curat',
-    'curate-assistant',
     'curatione',
-    'curative/treatment',
-    'curatively',
-    'curatores',
-    'curatorially',
-    'curatorships',
-    'curazin',
-    'curazzo',
-    'curb.',
-    'curbcrawler',
-    'curbcrawlers',
-    'curber',
-    'curches',
-    'curchill',
-    'curcinus',
-    'curculigo',
     'curculionidae',
-    'curd&rehy;white',
-    'curd-like',
-    'curd-white',
-    'curd-yellow',
-    'curdblooding',
-    'curded',
-    'curdie',
-    'curdiea',
-    'curdies',
-    'curdler',
-    'curdly',
-    'cure\'',
-    'cure-',
-    'cure-centred',
-    'cure-house',
     'cure-seekers',
-    'cure/alleviate/prevent',
-    'curelty',
-    'curers',
-    'curetes',
-    'curi&rehy;osity',
-    'curialists',
-    'curially',
-    'curiam.',
-    'curie-weiss',
-    'curieuse',
-    'curinan',
-    'curio-',
-    'curio-sellers',
-    'curiobiological',
-    'curiorisity',
     'curiosae',
-    'curiosity-oriented',
-    'curiositys',
-    'curious-making',
-    'curious-minded',
-    'curiousities',
-    'curiously-conceived',
-    'curit',
-    'curl-haired',
-    'curl-tip',
-    'curled-up-with-age',
-    'curlew-loud',
-    'curlew-sandpiper',
-    'curliest',
-    'curlin\'',
-    'curling-up',
     'curliques',
-    'curlm',
-    'curlpapers',
-    'curls.',
-    'curls/waves/body',
-    'curlsdon',
-    'curly-blonde',
-    'curly-brimmed',
-    'curly-coated',
-    'curly-permed',
-    'curly-tailed',
-    'curly-wurly',
-    'curly/frizzy',
-    'curlyheaded',
-    'curlyish',
-    'curlytops',
     'curman',
-    'curnock',
-    'curnock/access',
-    'curnonsky',
-    'curphey',
-    'curraghmore',
-    'curraghs',
-    'currah',
-    'currallone',
-    'curran-petris',
-    'curran/music',
-    'currant-free',
-    'currawong',
-    'curray',
-    'curre',
-    'currencies*',
     'currency&mdash;us&dollar;1.00=lf37.3374',
-    'currency-dealing',
-    'currency-denominated',
-    'currency-option',
-    'currency-paying',
-    'currency-support',
-    'currency-turmoil',
-    'currency:bahamian',
-    'currency:bermuda',
-    'currency:lebanese',
-    'currency:netherlands',
-    'currency:new',
-    'current(3).',
-    'current(c)',
-    'current-creating',
-    'current-generation',
     'current-output',
-    'current-period',
-    'current-using',
-    'current-weighted',
-    'current.account',
-    'current.limiting',
-    'current.record.position',
-    'current/capacitance',
-    'current/deposit',
-    'currently-available',
-    'currently-celebrated',
-    'currently-used',
-    'currents.',
-    'currents/capacitance',
-    'currenty',
-    'curri&egrave;res',
     'curric',
-    'curriculae',
-    'curriculum\'',
-    'curriculum-controlled',
-    'curriculum-deviance',
-    'curriculum-general',
-    'curriculum-in-action',
-    'curriculum-led',
-    'curriculum-on-offer',
-    'curriculum/library',
-    'curriculum/whole',
-    'curriculum/year-group',
-    'curridge',
-    'currie-like',
-    'currie-style',
-    'currie.',
     'currie/animal',
-    'curruc',
-    'curry-coloured',
-    'curry-combs',
-    'curry-eating',
-    'curry-face',
-    'curry-favouring',
-    'curry-house',
-    'curry-powder',
-    'curry-powders',
-    'curry-scented',
-    'curry/captain',
-    'currycomb',
-    'curryface',
-    'curse/d',
-    'curse/to',
     'curse/toothbrush',
-    'cursed.',
-    'cursin',
-    'cursiter',
-    'cursor-type',
-    'cursorblinkrate=530',
-    'cursorius',
-    'cursus-type',
-    'curtain-calls',
-    'curtain-darkened',
-    'curtain-holders',
-    'curtain-line',
-    'curtain-muffled',
-    'curtain-opener',
-    'curtain-pull',
-    'curtain-rails',
     'curtain-twitching',
-    'curtain-walling',
-    'curtain-wire',
-    'curtaincracks',
-    'curtainraiser',
-    'curtainraisers',
-    'curtains.',
-    'curtana',
-    'curtate',
-    'curteisi',
-    'curteisye',
-    'curter',
-    'curtesly',
-    'curtess',
-    'curtest',
-    'curthoys',
     'curticeanu',
-    'curtiei',
-    'curties',
-    'curtis-brown',
-    'curtis-s-s',
-    'curtis/cheltenham',
-    'curtis/home',
-    'curtis/marsh',
-    'curtis/resident',
-    'curtiss-electric',
-    'curtiz\'',
-    'curule',
-    'curundoloc',
-    'curvaceousness',
-    'curvata',
-    'curve-edged',
     'curve-fit',
-    'curve-shaped',
-    'curved-wave',
-    'curves-',
-    'curvet',
-    'curvetting',
-    'curvex',
-    'curyously',
-    'curzon-price',
-    'cusack/oxford',
-    'cusamano',
-    'cuscatl&aacute;n',
-    'cuscuses',
-    'cuscutaceae',
-    'cushendun',
-    'cushie',
     'cushiest',
-    'cushings',
-    'cushinstown',
-    'cushion-cover',
-    'cushion-like',
-    'cushionflor',
-    'cushioning/stability',
-    'cushionless',
-    'cushionlike',
-    'cushite',
-    'cushman',
-    'cushnie',
-    'cushway',
-    'cusiana-2a',
-    'cusine',
-    'cusions',
     'cusk',
-    'cusp-cleft',
-    'cusp-mantle',
-    'cusp/cleft',
-    'cuspidatus',
-    'cuspius',
-    'cusque&ntilde;o',
-    'cusque&ntilde;os',
-    'cussedly',
-    'cussell/game',
-    'cussen',
-    'cusses',
-    'cussings',
-    'cussins',
-    'cussler',
-    'custard-apple',
     'custard-covered',
-    'custard-free',
-    'custine',
-    'custnie',
-    'custo',
-    'custodes',
-    'custodially',
-    'custodianships',
-    'custodiat',
-    'custodies',
-    'custoditur',
-    'custom&rehy;built',
-    'custom-blend',
-    'custom-bound',
-    'custom-builds',
-    'custom-configuration',
     'custom-cut',
-    'custom-design',
-    'custom-fit',
-    'custom-fitted',
-    'custom-make',
-    'custom-order',
-    'custom-ordered',
-    'custom-painted',
-    'custom-tailored',
-    'custom-type',
-    'custom-written',
-    'custom/toll',
-    'customer&rehy;contractor',
-    'customer\'',
-    'customer-address',
-    'customer-buyer',
     'customer-care',
-    'customer-contract',
-    'customer-defined',
-    'customer-facing',
-    'customer-focus',
-    'customer-friendliness',
-    'customer-minded',
-    'customer-name',
-    'customer-nominated',
-    'customer-orientated',
-    'customer-ready',
-    'customer-related',
-    'customer-responsive',
-    'customer-service',
-    'customer-services',
-    'customer-specified',
     'customer-support',
-    'customer-tailorable',
-    'customer.claire',
-    'customer/',
-    'customer/actual',
-    'customer/bank',
-    'customer/broker',
-    'customer/client',
-    'customer/staff',
-    'customer/transaction',
-    'customer/user',
-    'customer_at',
-    'customers/',
-    'customers/clients/your',
-    'customers/patients/pupils/incidents',
-    'customhouse',
     'customiser',
-    'customises',
-    'customizing',
-    'customline',
-    'customm',
-    'customs-approved',
-    'customs-exempt',
-    'customs-free',
-    'customs-house',
-    'customs/immigration',
-    'customs/rituals',
-    'custon',
-    'custumal',
-    'custumary',
-    'custys',
-    'cut&rehy;away',
     'cut&rehy;out',
-    'cut&rehy;price',
-    'cut\'',
-    'cut-',
-    'cut-and-assemble',
-    'cut-and-pasted',
-    'cut-and-splice',
-    'cut-corned',
-    'cut-crystal',
-    'cut-flower',
-    'cut-glassware',
-    'cut-grass',
-    'cut-in',
-    'cut-mid',
-    'cut-off-his-nose-to-spite-his-face',
-    'cut-on',
     'cut-points',
-    'cut-purses',
-    'cut-string',
-    'cut-tile',
-    'cut-to-length',
-    'cut-to-shape',
-    'cut-water',
-    'cut-waters',
-    'cut/meon',
-    'cutaway-collar',
-    'cutbacks.',
-    'cutbacksa',
-    'cutblocks',
-    'cutbush',
-    'cutch',
-    'cutdowns',
     'cute-as-a-button',
-    'cute-looking',
-    'cutenesses',
-    'cutglass',
-    'cuth',
-    'cuthbert\'s',
-    'cuthertson',
-    'cuthill',
-    'cuthswith',
-    'cuthwine',
-    'cutical-chitin',
-    'cuticle-remover',
-    'cutirubrum',
-    'cutis',
-    'cutivate',
-    'cutlass-wielding',
     'cutler/manager',
-    'cutmaster',
-    'cutmore',
-    'cutmore-smith',
-    'cutody',
-    'cutomers',
-    'cutover',
-    'cutprice',
-    'cutpurses',
-    'cuts.tim',
-    'cuts/no',
-    'cuts:doctors',
-    'cutsem',
-    'cutside',
-    'cuttaree',
-    'cutter-bar',
     'cutter/draper/pattern',
-    'cutter/miles',
-    'cutterblock',
-    'cutterhead',
-    'cutteridge',
-    'cutters.',
-    'cutthroats',
-    'cuttin',
-    'cutting-board',
-    'cutting-off-head-strangers',
-    'cutting-short',
-    'cutting/collection',
-    'cutting/colouring',
-    'cutting/small',
-    'cutting/speaking',
-    'cutting/surgeon',
     'cuttings-book',
-    'cuttings/swindon',
-    'cuttle-fish',
-    'cuttle-shell',
-    'cuttler',
-    'cuttles',
-    'cutumnatis',
-    'cutworms',
-    'cuv',
-    'cuv&eacute',
-    'cuv2',
-    'cuverian',
-    'cuverville',
-    'cuvoald',
-    'cuxtone',
-    'cuyahoga',
     'cuyo',
-    'cuypers',
-    'cuzcos',
-    'cv\'s',
-    'cv-1',
-    'cv-2',
-    'cv-240',
-    'cv-dors',
-    'cv270',
-    'cv35',
-    'cv37',
-    'cv6',
-    'cv7',
-    'cva01',
-    'cviji&cacute',
-    'cvitan',
     'cvos',
-    'cvp&mdash;christian',
-    'cvp/pdc&mdash;christian',
-    'cvp/psc',
-    'cvpe',
-    'cvr(t)',
-    'cvrd',
-    'cvss',
-    'cvts',
-    'cvw',
-    'cw-2mark',
-    'cw/gl',
-    'cw11',
-    'cw12',
-    'cw3',
-    'cw4',
     'cw6',
-    'cw9',
-    'cwas',
-    'cwf',
-    'cwho',
-    'cwk',
-    'cwl',
-    'cwmfelinfach',
-    'cwmfellinfach',
-    'cwmhir',
-    'cwmllinfell',
-    'cwmparc',
-    'cwmsychpant',
-    'cwmtawe',
-    'cwmwd',
-    'cwmystwyth',
     'cwn',
-    'cwnin',
-    'cwntillery',
-    'cwo',
-    'cwp1',
-    'cwr',
-    'cwrt-mawr',
-    'cwsw/nccc',
-    'cx&formula',
-    'cx3',
-    'cx4',
-    'cx486s',
-    'cx486se',
-    'cx487s',
-    'cx878slc',
-    'cxb5',
     'cxb6',
-    'cxb7',
-    'cxcv',
-    'cxd-2562',
-    'cxd6',
-    'cxe',
-    'cxiii',
-    'cxiv',
-    'cxli.',
-    'cxliii',
-    'cxlix',
-    'cxlv',
-    'cxlvi',
-    'cxlvii',
-    'cxlviii',
-    'cxoroner',
     'cxr',
-    'cxvii',
-    'cxx',
-    'cxxi',
-    'cxxix',
-    'cxxv',
-    'cxxvi',
-    'cxxxv',
-    'cy-pres',
-    'cyaan',
-    'cyalume',
-    'cyamopsis',
-    'cyana',
-    'cyaneas',
-    'cyaneka',
-    'cyanide-',
     'cyanide-containing',
-    'cyanidin',
-    'cyaniding',
-    'cyanine',
-    'cyanocorax',
-    'cyanocrylate',
-    'cyanoethyl',
-    'cyanogen',
-    'cyanol-blue',
-    'cyanophytes',
-    'cyanopica',
-    'cyanostictus',
-    'cyanus',
-    'cyathophyllum',
-    'cyathostomum',
-    'cybemetics',
     'cyber-club',
-    'cyber-groove',
-    'cyber-punk',
-    'cyber-samples',
-    'cyber-strength',
-    'cyberfeed',
-    'cyberhippie',
-    'cybern&eacute;tique',
-    'cybernetic-based',
-    'cyberoptics',
-    'cyberquery',
-    'cybersurgeons',
-    'cybertippy',
-    'cybertron',
-    'cyborg.doc',
-    'cybortron',
     'cybriwsky',
-    'cycadales',
-    'cycadeiodes',
-    'cycadeoidea',
-    'cycas',
-    'cycl',
-    'cycladals',
-    'cycladic-inspired',
-    'cyclamates',
-    'cyclamen-pink',
-    'cyclase-guanosine',
-    'cyclases',
-    'cycle-',
-    'cycle-a',
-    'cycle-length-based',
-    'cycle-regulating',
     'cycle-run',
-    'cycle-sequencing',
-    'cycle-street',
-    'cycle-track',
-    'cycle-way',
-    'cycle/',
-    'cycle/min',
-    'cycle/walk',
-    'cyclepath',
-    'cyclepaths',
-    'cycleroute',
-    'cyclers',
-    'cycles/',
-    'cycles/second',
-    'cycleway/footpath',
-    'cycleway/footpaths',
     'cycleway/footway',
-    'cyclic-amp',
-    'cyclicality',
-    'cyclicals',
-    'cycliguanosine',
-    'cyclimorph',
-    'cyclin',
-    'cyclin-dependent',
-    'cyclinders',
-    'cycling-groups',
-    'cyclins',
-    'cyclisme',
-    'cyclist-only',
-    'cyclistes',
-    'cyclng',
-    'cyclo',
     'cyclo-girls',
-    'cyclo-hexane',
-    'cyclo-oxygenation',
-    'cycloacylating',
-    'cycloalkenes',
-    'cycloalkyl',
-    'cycloase',
-    'cyclobutane',
-    'cyclocarpum',
-    'cyclodextrin-based',
-    'cycloheat',
-    'cycloheximide-insensitive',
-    'cyclohexyl',
-    'cyclomania',
-    'cyclomorphosis',
-    'cyclone-affected',
     'cycloocygenase',
-    'cyclooyxgenase',
-    'cyclopaedias',
-    'cyclopaths',
-    'cyclopentadienyl',
-    'cyclopentane',
-    'cyclopropylaminoacrylate',
-    'cycloramic',
-    'cyclorana',
-    'cycloserine',
-    'cyclotella',
-    'cyclotis',
-    'cyclotomic',
-    'cyclysation',
-    'cycoming-simple',
-    'cyder-royal',
     'cydewain',
-    'cydia',
-    'cydonia',
-    'cyf',
-    'cyf.',
-    'cyfa',
-    'cyfartha',
-    'cyfodwyr',
-    'cyfrewas',
-    'cyfrol',
-    'cygne',
-    'cygnea',
-    'cygnes',
-    'cyhyraeth',
-    'cykeman',
-    'cykes',
     'cykesound',
-    'cyketank',
-    'cylchgrawn',
-    'cylicocyclus',
-    'cylicodontophorus',
-    'cylicostephanus',
-    'cylinder-head',
-    'cylinder-heads',
-    'cylinder-mower',
-    'cylinder-seal',
-    'cylinder-shaped',
-    'cylinder-to-cylinder',
-    'cylinder-type',
-    'cylinder.',
-    'cylindrical-shaped',
-    'cylindrical.',
     'cylindrically',
-    'cylindrically-shaped',
-    'cylindro-conicals',
-    'cylindrophyllum',
-    'cyling',
-    'cylisticus',
-    'cylists',
-    'cylopean',
-    'cylotoxic',
-    'cym.',
-    'cymadothea',
-    'cymaflowers',
-    'cymatics',
-    'cymatogenic',
-    'cymatophlebia',
-    'cymbal-and-drum',
     'cymbal-heavy',
-    'cymbarum',
-    'cymbra',
-    'cymbydoll',
-    'cymer',
-    'cymfforest',
-    'cymio',
-    'cymmrodor',
-    'cymmrodorian',
-    'cymo',
-    'cymon',
-    'cymor',
-    'cymptoms',
-    'cymraeg',
-    'cymru&mdash;see',
-    'cymru/green',
     'cymrus',
-    'cyna',
-    'cynamid',
-    'cyncoed',
-    'cyncrona',
-    'cyndrwyn',
-    'cyndrwynyn',
-    'cyndy',
-    'cyneberht',
-    'cyneheard',
-    'cynfedw',
-    'cynganeddwyr',
-    'cyngen',
-    'cynghordy',
-    'cynicus',
-    'cynipid',
     'cynique',
-    'cyniscus',
-    'cynllunio',
-    'cynnar',
-    'cynodont',
-    'cynodontia',
-    'cynogen',
-    'cynologique',
-    'cynonville',
-    'cynops',
-    'cynoque',
-    'cynric',
-    'cynthie',
-    'cynwyl',
-    'cyomologus',
-    'cyosine',
     'cyp/cyp',
-    'cyphered',
-    'cyphering',
-    'cyphert',
-    'cyphoma',
-    'cyphomandra',
-    'cyphus',
-    'cyprea',
-    'cypres/breeder',
-    'cypress-scented',
-    'cypress-studded',
-    'cypress-wood',
-    'cypri',
-    'cypriana',
-    'cypriano',
-    'cyprianus',
     'cypridina',
-    'cyprini',
-    'cypriot-greek',
-    'cypriote',
-    'cypripedium',
-    'cyprus-amax',
-    'cyprus-frankfurt',
-    'cypselid',
-    'cyr-l\'ecole',
-    'cyran',
-    'cyrenaican',
-    'cyrenes',
-    'cyrff',
-    'cyriacus',
-    'cyrilla',
-    'cyro',
     'cyrological',
-    'cyrtocara',
-    'cys117',
-    'cys157',
-    'cys248',
-    'cyst-jejunostomy',
-    'cyst-like',
-    'cystadenoma',
-    'cystal',
-    'cystectomies',
-    'cysteic',
-    'cysteine-hcl',
-    'cystica',
-    'cystiene',
-    'cystinuria',
-    'cystocaulus',
     'cystocele',
-    'cystoid',
-    'cystoidea',
-    'cystoides',
-    'cystoids',
-    'cystometogram',
-    'cystoscopied',
-    'cytherea',
-    'cythioate',
-    'cytn',
-    'cytoarabine',
-    'cytocell',
-    'cytochalasin',
-    'cytochemical',
-    'cytochemically',
-    'cytofluorimetrically',
     'cytofluorimetry',
-    'cytogeneticists',
-    'cytokeratins',
-    'cytokine-stimulation',
-    'cytokinetic',
-    'cytolysis',
-    'cytomeglaovirus',
-    'cytomehalovirus',
-    'cytometrically',
-    'cytometry.',
-    'cytopathic',
-    'cytopathologists',
-    'cytopenia',
-    'cytopenias',
-    'cytophagaceae',
-    'cytoplasm&lsqb;12&rsqb',
     'cytopsin',
-    'cytosine-5-fluoro',
-    'cytoskeletons',
-    'cytosplasmic',
-    'cytosteatonecrosis',
-    'cytostom',
-    'cytotoxicities',
-    'cytotoxin',
-    'cytotrophoblastic',
-    'cytotrophoblasts',
-    'cyubahiro',
-    'cyvar',
-    'cywinska',
-    'cywydd',
-    'czachowski',
-    'czaplinski',
     'czarnecki',
-    'cze300',
-    'czech\'kia',
-    'czech-austrian',
-    'czech-built',
-    'czech-latin',
-    'czech-o-slo-vak-i-a',
-    'czech/east',
-    'czechborn',
-    'czeched',
-    'czechlands',
-    'czechmate',
-    'czecho-mor',
-    'czecho-moravian',
-    'czecho-slovakia',
-    'czecholslovakia',
     'czechoslavakian',
-    'czechoslovak-based',
-    'czechoslovak-german',
-    'czechoslovak-usa',
-    'czechoslovakia&mdash;for',
-    'czechoslovakia-germany',
-    'czechoslovakia-hungary',
-    'czechoslovakia/hungary',
-    'czechoslovakian&rehy;built',
-    'czechoslovakian-english',
-    'czechoslovakians',
-    'czechoslovkia',
-    'czechowski',
-    'czechslovakia',
-    'czeckoslovakian',
-    'czerniatynski',
     'czerniawskyi',
-    'czersk',
-    'czeskawa',
-    'czestochowa',
-    'czg',
-    'czipra',
-    'czm',
-    'czudek',
-    'czurda',
-    'czwg',
-    'czytelnik',
-    'czyzewicz',
-    'czyzk',
-    'd&aacute;0mareta',
-    'd&aacute;in',
-    'd&aelig;nor',
     'd&agrave',
-    'd&amacr;mar&amacr;tos',
-    'd&amp;eg',
-    'd&amp;subt-1',
-    'd&auml;hn',
-    'd&auml;mmergung',
-    'd&auml;mpfung',
-    'd&bsol;c',
-    'd&dollar',
-    'd&eacute',
-    'd&eacute/d&eacute',
-    'd&eacute;0m&eacute;0trios',
-    'd&eacute;0mareteion',
-    'd&eacute;0mos',
-    'd&eacute;abes',
-    'd&eacute;acute',
     'd&eacute;artements',
-    'd&eacute;b&acirc;le',
-    'd&eacute;bats',
-    'd&eacute;bcle',
-    'd&eacute;bonaire',
-    'd&eacute;bonairement',
-    'd&eacute;bonairement\'',
-    'd&eacute;bonaires',
-    'd&eacute;bonairet&eacute',
-    'd&eacute;brouiller',
-    'd&eacute;butantes',
-    'd&eacute;buted',
-    'd&eacute;cadents',
-    'd&eacute;ch.',
-    'd&eacute;chelette',
-    'd&eacute;chets',
     'd&eacute;chiffrable',
-    'd&eacute;chu',
-    'd&eacute;cider',
-    'd&eacute;ciller',
-    'd&eacute;claration',
-    'd&eacute;class&eacute',
-    'd&eacute;class&egrave;s',
-    'd&eacute;co',
-    'd&eacute;collet&eacute;e',
-    'd&eacute;contract&eacute;e',
-    'd&eacute;cor&eacute',
-    'd&eacute;cora',
-    'd&eacute;coratif',
-    'd&eacute;cors',
-    'd&eacute;coup&eacute',
-    'd&eacute;coupage',
     'd&eacute;couvert',
-    'd&eacute;couvertes',
-    'd&eacute;f&eacute;ra',
-    'd&eacute;faillance',
-    'd&eacute;faite',
-    'd&eacute;faitisme',
-    'd&eacute;fendu',
-    'd&eacute;ficit',
-    'd&eacute;finition',
-    'd&eacute;gorgeur',
-    'd&eacute;i',
-    'd&eacute;j&aacute;-vu',
-    'd&eacute;j&aacute_vu',
-    'd&eacute;j&agrave;-vu',
-    'd&eacute;j&auml_vu',
-    'd&eacute;ja_vu',
     'd&eacute;licieuse',
-    'd&eacute;licieusement',
-    'd&eacute;limit&eacute;s',
-    'd&eacute;lire',
-    'd&eacute;los',
-    'd&eacute;luge',
-    'd&eacute;m&eacute;nag&eacute',
-    'd&eacute;marches',
-    'd&eacute;ment',
-    'd&eacute;mission',
-    'd&eacute;mocrate-chr&eacute;tien',
-    'd&eacute;molisseur',
-    'd&eacute;ni',
-    'd&eacute;nise',
-    'd&eacute;partementale',
-    'd&eacute;partmentale',
     'd&eacute;pass&eacute',
-    'd&eacute;peche',
-    'd&eacute;pot',
-    'd&eacute;put&eacute',
-    'd&eacute;put&eacute;s',
-    'd&eacute;raisonnable',
-    'd&eacute;rive',
-    'd&eacute;river',
-    'd&eacute;roul&egrave;de',
-    'd&eacute;roulement',
-    'd&eacute;sastre',
-    'd&eacute;senclavement',
-    'd&eacute;sert',
-    'd&eacute;sh&eacute;rit&eacute;e',
-    'd&eacute;siller',
-    'd&eacute;sir',
     'd&eacute;sir&eacute;e\'s',
-    'd&eacute;sirez',
-    'd&eacute;sormi&egrave;re',
-    'd&eacute;tergent',
-    'd&eacute;terminations',
-    'd&eacute;tourn&eacute',
-    'd&eacute;velopp&eacute',
-    'd&eacute;velopp&eacute;s',
-    'd&ecaron;tsk&yacute',
-    'd&ecirc',
-    'd&ecirc;mocratique',
-    'd&egrave;bes',
-    'd&egrave;crit',
-    'd&egrave;jeuner',
-    'd&egrave;luding',
-    'd&egrave;p&ecirc;chez',
     'd&eogon;bnica',
-    'd&euml;partement',
-    'd&formula',
-    'd&gt;a',
-    'd&icirc;ner',
-    'd&mdash;4',
-    'd&mdash;no.',
-    'd&ndash;1.23',
-    'd&ndash;1.3',
-    'd&ndash;2.2',
-    'd&ndash;2.55',
-    'd&ndash;2.9',
-    'd&ndash;3',
-    'd&ndash;a',
-    'd&ndash;aqui',
-    'd&ndash;cdlh',
     'd&ndash;edez/g&ndash;bopy',
-    'd&ndash;f',
-    'd&ndash;g',
-    'd&ndash;h',
-    'd&ndash;i',
-    'd&oacute;ttir',
-    'd&ouml;blin',
-    'd&ouml;bner',
-    'd&ouml;derleini',
-    'd&ouml;ppelg&auml;nger',
-    'd&rehy;shaped',
-    'd&sup2',
-    'd&uacute;ath',
-    'd&uacute;chas',
-    'd&uacute;n-harg',
-    'd&uuml;mmler',
     'd&uuml;rer-like',
-    'd&uuml;rers',
-    'd&uuml;rr',
-    'd&uuml;rst',
-    'd&uuml;sseldorfer',
-    'd&uuml;sseldorft',
-    'd&uuml;ssesldorfer',
-    'd&yacute;rafj&ouml&dstrok;3ur',
-    'd&yacute;rafj&ouml;dur',
-    'd\'&aacute;gua',
-    'd\'&eacute;at',
-    'd\'&eacute;couter',
-    'd\'&eacute;cueil',
-    'd\'&eacute;l&eacute;phant',
-    'd\'&eacute;laborer',
-    'd\'&eacute;loquence',
     'd\'&eacute;on',
-    'd\'&eacute;pernay',
-    'd\'&eacute;pinards',
-    'd\'&eacute;str&eacute;es',
-    'd\'&eacute;tage',
-    'd\'&eacute;tat\'',
-    'd\'&eacute;valuation',
-    'd\'&eacute;viter',
-    'd\'&ecirc;atre',
-    'd\'&ecirc;tre\'',
-    'd\'&oelig;uil',
-    'd\'\'',
-    'd\'-a-r-c-y',
-    'd\'-f\'',
-    'd\'/',
-    'd\'abbeville',
     'd\'abitot',
-    'd\'abo',
-    'd\'abondance',
-    'd\'abrizzio',
-    'd\'accident',
-    'd\'achard',
-    'd\'acier',
-    'd\'acquapendente',
-    'd\'actuaires',
-    'd\'actualiser',
-    'd\'acunha',
-    'd\'adda',
-    'd\'adone',
-    'd\'adresser',
-    'd\'affaire/albania',
-    'd\'affairs',
     'd\'afra',
-    'd\'agostini',
-    'd\'agoty',
-    'd\'agriculture',
-    'd\'aguia',
-    'd\'aguiar',
-    'd\'aguitaine',
-    'd\'aiguillon',
-    'd\'aiguisy',
-    'd\'ailleurs',
-    'd\'ailly',
-    'd\'aimer',
-    'd\'airain',
-    'd\'ajou',
-    'd\'al&ecirc;nes',
-    'd\'albe',
     'd\'alberi',
-    'd\'alberquerque',
-    'd\'alcamo',
-    'd\'alcool',
-    'd\'alembertian',
-    'd\'alfred',
-    'd\'alger',
-    'd\'allumettes',
-    'd\'almeida',
-    'd\'alvadorez',
-    'd\'amante',
-    'd\'ambassadeurs',
-    'd\'amelio',
-    'd\'ameublement',
-    'd\'amis',
-    'd\'amorefatta',
     'd\'ampezzo',
-    'd\'amusement',
-    'd\'analyse',
-    'd\'andalousie',
-    'd\'andlau-hombourg',
-    'd\'andrinople',
-    'd\'ang&eacute;ly',
-    'd\'angelo/co-director',
-    'd\'angers',
-    'd\'anghiera',
-    'd\'angiviller',
-    'd\'angkor',
-    'd\'anguille',
-    'd\'annecy',
-    'd\'ans',
-    'd\'ansembourg/aid',
     'd\'anthon',
-    'd\'antrevernes',
-    'd\'aphanize',
-    'd\'apicius',
-    'd\'apr&egrave;s',
-    'd\'apres',
-    'd\'aptitude/',
-    'd\'aquebus',
-    'd\'arby-neither',
-    'd\'arcachon',
-    'd\'arcadie',
-    'd\'arcangelo',
-    'd\'archaeologie',
-    'd\'archeologie',
-    'd\'archet',
-    'd\'architettura',
     'd\'ard&egrave;che',
-    'd\'arezzo',
-    'd\'arfet',
-    'd\'argenson',
-    'd\'arianna',
-    'd\'ariettes',
-    'd\'arlincourt',
-    'd\'arm&eacute;e',
-    'd\'arm&eacute;es',
-    'd\'armide',
-    'd\'armont',
-    'd\'arnouville',
-    'd\'aromatherapie',
-    'd\'arpino',
-    'd\'arquebus-like',
-    'd\'arsonval',
     'd\'artifice',
-    'd\'artistes',
-    'd\'artois',
-    'd\'artouste',
-    'd\'arts',
-    'd\'arzew',
-    'd\'ascq',
-    'd\'asino',
-    'd\'asperges',
-    'd\'aspremont',
-    'd\'asq',
-    'd\'assaut',
-    'd\'assi',
-    'd\'assurance',
-    'd\'attente',
-    'd\'aubigne',
     'd\'aumont',
-    'd\'aurevilles',
-    'd\'auria',
-    'd\'auteuil',
-    'd\'autre',
-    'd\'aval',
-    'd\'avalos',
-    'd\'avant',
-    'd\'avant-garde',
-    'd\'avaux',
-    'd\'avenir',
-    'd\'avenza',
-    'd\'avila/deputy',
-    'd\'avila/labour',
-    'd\'aviron',
-    'd\'avril',
     'd\'ayen',
-    'd\'ayous',
-    'd\'azeglio',
-    'd\'azione',
-    'd\'azure',
-    'd\'d\'',
-    'd\'e',
-    'd\'ecole',
-    'd\'ecologie',
-    'd\'ecosse',
-    'd\'ecran',
-    'd\'effet',
-    'd\'elboeuf',
-    'd\'election',
-    'd\'elide',
-    'd\'en',
     'd\'encouragement',
-    'd\'endurance',
-    'd\'enea',
-    'd\'enfants',
-    'd\'ennui',
-    'd\'enqu&ecirc;te',
-    'd\'enrayer',
-    'd\'ensemble',
-    'd\'ensingen',
-    'd\'entendre',
-    'd\'enterprises',
-    'd\'entrepise',
-    'd\'epaignes',
-    'd\'epargne',
-    'd\'epizooties',
-    'd\'equip',
     'd\'erik',
-    'd\'erlon',
-    'd\'errico/pilot',
-    'd\'erroymendi',
-    'd\'escargot',
-    'd\'esclavage',
-    'd\'escossan',
-    'd\'escoto',
-    'd\'escours',
-    'd\'escures',
-    'd\'eslon',
-    'd\'esmanault',
-    'd\'esp&egrave;rey',
-    'd\'espailly',
-    'd\'esposito',
-    'd\'ess&eacute',
     'd\'essai',
-    'd\'est',
-    'd\'esterre/head',
-    'd\'estourel',
-    'd\'estournel',
-    'd\'etate',
-    'd\'etats',
-    'd\'evrard',
-    'd\'execution',
-    'd\'exercer',
-    'd\'exister',
-    'd\'exp&eacute;dition',
-    'd\'expansion',
-    'd\'exploitants',
-    'd\'expositions',
-    'd\'extr&egrave;me',
     'd\'extr&euml;me',
-    'd\'fautralla/trainee',
-    'd\'ghies',
-    'd\'h&eacute;siode',
-    'd\'h&ocirc;t',
-    'd\'h&ocirc;tel',
-    'd\'hancarville',
-    'd\'harfleur',
-    'd\'haussonville',
-    'd\'havilland',
-    'd\'herbes',
-    'd\'hercule',
-    'd\'heritages',
-    'd\'hilliers',
-    'd\'hiv',
-    'd\'hiver',
     'd\'hocqueville',
-    'd\'hoffmann',
-    'd\'hoker',
-    'd\'hollande',
-    'd\'honeur',
-    'd\'horlogerie',
-    'd\'horreur',
-    'd\'huddersfield',
-    'd\'humanisme',
-    'd\'huysser',
-    'd\'hy&egrave;res',
-    'd\'hyber',
-    'd\'id&eacute;es',
-    'd\'identification',
-    'd\'imaginer',
-    'd\'imprimerie',
     'd\'incantation',
-    'd\'incarville',
-    'd\'independence',
-    'd\'indification',
-    'd\'industrie',
-    'd\'infanterie',
-    'd\'influence',
-    'd\'information',
-    'd\'ing&eacute;nieur',
-    'd\'inghilterra',
-    'd\'initiative',
-    'd\'inscriptions',
-    'd\'int&eacute;r&eacute;t',
-    'd\'intervention',
-    'd\'investissements',
-    'd\'isernia',
     'd\'islande',
-    'd\'issy',
-    'd\'ixelles',
-    'd\'ja',
-    'd\'jew',
-    'd\'l&eacute;na',
-    'd\'monte',
-    'd\'neistr',
-    'd\'observateurs',
-    'd\'observation',
-    'd\'oc-',
-    'd\'occident',
-    'd\'oenologie',
-    'd\'oex',
-    'd\'oger',
-    'd\'oignon',
     'd\'oignons',
-    'd\'oilly',
-    'd\'oise',
-    'd\'oisellemont',
-    'd\'olbreuse',
-    'd\'olive',
-    'd\'oliviera',
-    'd\'ombre',
-    'd\'onofrio',
-    'd\'onore',
-    'd\'onotrio',
-    'd\'optique',
-    'd\'or&eacute;don',
-    'd\'ora',
-    'd\'orbigny',
-    'd\'orcia',
     'd\'oredon',
-    'd\'oreilles',
-    'd\'orfeo',
-    'd\'orge',
-    'd\'orgue',
-    'd\'orgueil',
-    'd\'orient',
-    'd\'oriuoli',
-    'd\'ornelas',
-    'd\'orum',
-    'd\'orvilliers',
-    'd\'ossola',
-    'd\'oulx',
-    'd\'overbroeck',
-    'd\'oxford',
-    'd\'oyle',
     'd\'oyre',
-    'd\'rozario',
-    'd\'uccello',
-    'd\'udine',
-    'd\'ume',
-    'd\'ung',
-    'd\'union',
-    'd\'unite',
-    'd\'unix',
-    'd\'urfe',
-    'd\'urso',
-    'd\'utilit&eacute',
-    'd\'warden',
-    'd\'y\'know',
-    'd\'yeh',
-    'd\'york',
     'd\'your',
-    'd\'yquem',
-    'd\'yvette',
-    'd(&num;4)',
-    'd(a)',
-    'd(a)n',
-    'd(a-t)',
-    'd(catgacgtcatg)',
-    'd(cgattgcg)',
-    'd(cgcaatcg)',
-    'd(cgcxxtcg)',
-    'd(cgxttgcg)',
-    'd(gacgatatcgtc)',
-    'd(ii)',
-    'd(ij)&gt;0',
-    'd(ij)&lt;0',
     'd(obunnorum)',
-    'd*',
-    'd*zire',
-    'd-(5)f',
-    'd-110',
-    'd-14',
-    'd-15',
-    'd-1500',
-    'd-16h',
-    'd-2',
-    'd-2000',
-    'd-3',
-    'd-30sn',
-    'd-35',
-    'd-41',
-    'd-54',
     'd-7000',
-    'd-76',
-    'd-7800',
-    'd-8557',
-    'd-a',
-    'd-ajie',
-    'd-all\'s-well',
-    'd-aminobutyric',
-    'd-and-c',
-    'd-antigen',
-    'd-aspartate.',
-    'd-blinkers',
-    'd-code',
-    'd-cup',
-    'd-cups',
-    'd-cycloserine',
     'd-d-ddiet',
-    'd-d-did',
-    'd-d-do',
-    'd-day+33',
-    'd-deficient',
-    'd-designed',
-    'd-diaminobutyric',
-    'd-diamond',
-    'd-different',
-    'd-dinner',
-    'd-down',
-    'd-dudley',
-    'd-efte',
-    'd-eglu',
-    'd-ehen',
-    'd-ehuk',
     'd-exkl',
-    'd-fet',
-    'd-form',
-    'd-glucose',
-    'd-i-g',
-    'd-i-y-use',
-    'd-in-the-fourth-position',
-    'd-input',
-    'd-iyer',
-    'd-j',
-    'd-latches',
-    'd-loop',
-    'd-m',
-    'd-mac',
-    'd-mobs',
-    'd-notices',
     'd-o-n',
-    'd-orbitals',
-    'd-penicillamine',
-    'd-q',
-    'd-reg',
-    'd-registered',
-    'd-rust',
-    'd-s-ing',
-    'd-shape',
-    'd-stream',
-    'd-string',
-    'd-thiogalactoside',
-    'd-tuner',
-    'd-turbocurarine',
-    'd-word',
-    'd-zone',
     'd.1',
-    'd.1005',
-    'd.1033',
-    'd.1241',
-    'd.1446',
-    'd.1447',
-    'd.1474',
-    'd.1483',
-    'd.1503',
-    'd.1568',
-    'd.1608',
-    'd.1609',
-    'd.1616',
-    'd.1625',
-    'd.1628',
-    'd.1635',
     'd.1638',
-    'd.1640',
-    'd.1650',
-    'd.1770',
-    'd.1795',
-    'd.1805',
-    'd.1827',
-    'd.1882',
-    'd.19.1.11.5',
-    'd.1960',
-    'd.1966',
-    'd.28',
-    'd.40',
-    'd.5/180',
-    'd.725',
-    'd.735',
     'd.93cm',
-    'd.a.e.h.r.e.v.o.n.o.t.t.u.b.',
-    'd.a.j.',
-    'd.b.sweeney',
-    'd.b.w.',
-    'd.c.&ndash;new',
-    'd.c.-based',
-    'd.c./cleveland/saint',
-    'd.c.3',
-    'd.c.l.',
-    'd.c.t.',
-    'd.d\'a',
-    'd.d.t.',
-    'd.dave',
-    'd.e.a.',
-    'd.eng.',
     'd.g.ockleton',
-    'd.g.t.',
-    'd.h.5',
-    'd.h.b.',
-    'd.h.r.b.',
-    'd.h.s.',
-    'd.h.s.s',
-    'd.hardcastle',
-    'd.hughes',
-    'd.i.',
-    'd.i.1.',
-    'd.i.l.s',
-    'd.i.s.',
-    'd.i.s.c.o',
-    'd.i.v.o.r.c.e.',
-    'd.isa',
     'd.j.a.',
-    'd.j.s',
-    'd.klein',
-    'd.l.cockroft',
-    'd.l.f.',
-    'd.l.w.',
-    'd.latchman',
-    'd.lit.',
-    'd.m.u',
-    'd.meijer',
-    'd.mus',
-    'd.mus.',
-    'd.n.a.',
-    'd.n.f.',
-    'd.neill',
-    'd.o.',
     'd.o.a.',
-    'd.o.b.s',
-    'd.o.u',
-    'd.p.b.',
-    'd.p.r.',
-    'd.postgatei',
-    'd.q.',
-    'd.r.l.',
-    'd.s.c',
-    'd.s.c.',
-    'd.s.e.',
-    'd.s.m.',
-    'd.sinclair',
-    'd.t.p.',
-    'd.tech.hons',
-    'd.the',
     'd.univ.',
-    'd.v.r.',
-    'd.v.santi',
-    'd.va',
-    'd.vii',
-    'd.w.1',
-    'd.w.f.',
-    'd.w.simmonds',
-    'd.wood',
-    'd.y.',
-    'd.yakuba',
-    'd/00/22/0003',
-    'd/00/23/0044',
-    'd/00/23/2053',
-    'd/00/23/2152',
-    'd/00/23/2170',
     'd/00/23/2171',
-    'd/00/23/2178',
-    'd/00/23/2180',
-    'd/00/23/2181',
-    'd/00/23/2189',
-    'd/00/23/2194',
-    'd/00/23/2198',
-    'd/00/23/2211',
-    'd/00/23/2217',
-    'd/00/23/2222',
-    'd/00/23/2226',
-    'd/00/23/2233',
-    'd/00/23/2237',
-    'd/00/23/2240',
-    'd/00/23/2241',
-    'd/00/23/2252',
     'd/00/23/2254',
-    'd/00/23/2255',
-    'd/00/23/2257',
-    'd/00/23/2258',
-    'd/00/23/2275',
-    'd/00/23/2277',
-    'd/00/23/2279',
-    'd/00/23/2282',
-    'd/00/23/2289',
-    'd/00/23/2292',
-    'd/00/23/2301',
-    'd/00/23/2307',
-    'd/00/23/2312',
-    'd/00/23/2335',
-    'd/00/23/2338',
-    'd/00/23/2339',
     'd/00/23/2346',
-    'd/00/23/2348',
-    'd/00/24/2008',
-    'd/00/24/2009',
-    'd/00/24/2012',
-    'd/00/26/0003-4',
-    'd/00/26/0057',
-    'd/00/28/0004',
-    'd/01/23/0039',
-    'd/02/25/0000',
-    'd/04/25/0000',
-    'd/04/25/0006',
-    'd/04/25/0010',
-    'd/04/25/0011',
-    'd/04/25/0012',
-    'd/04/25/0013',
     'd/04/25/0015',
-    'd/04/25/0018',
-    'd/06/25/0001',
-    'd/06/25/0003',
-    'd/06/25/0004',
-    'd/06/25/0008',
-    'd/06/25/0009',
-    'd/06/25/0013',
-    'd/06/25/0016',
-    'd/08/25/0007',
-    'd/08/25/0008',
-    'd/08/25/0022',
-    'd/08/25/0024',
-    'd/bos',
-    'd/chief',
-    'd/d',
     'd/kfp',
-    'd/mx553308',
-    'd/p',
-    'd0280',
-    'd03',
-    'd0310',
-    'd04',
-    'd05',
-    'd06',
-    'd07',
-    'd1,477',
-    'd1,805',
-    'd1.12',
-    'd100',
-    'd1030',
-    'd11/1',
     'd11/2',
-    'd110',
-    'd112',
-    'd117',
-    'd120',
-    'd122',
-    'd124',
-    'd1254',
-    'd127',
-    'd12ms',
-    'd13',
-    'd14',
-    'd140',
-    'd16a',
-    'd1771',
-    'd1777',
     'd1784',
-    'd180,000,000',
-    'd1893',
-    'd1p2',
-    'd2&gt;d',
-    'd2&mdash;011',
-    'd2&mdash;100',
-    'd2*12',
-    'd2.',
-    'd2.1',
-    'd20',
-    'd201',
-    'd202',
-    'd206',
-    'd2112',
-    'd2119',
     'd212',
-    'd2138',
-    'd216',
-    'd21s55',
-    'd25s',
-    'd27',
-    'd273-10b',
-    'd2914',
-    'd2s',
-    'd3+',
-    'd3-f5',
-    'd300,000,000',
-    'd3000',
-    'd31',
-    'd33',
-    'd335',
     'd34',
-    'd3420',
-    'd3462',
-    'd3586',
-    'd367',
-    'd38',
-    'd386',
-    'd3a4',
-    'd4&verbar&verbar;g6&verbar&verbar',
-    'd4,080',
-    'd400',
-    'd4059',
-    'd413',
-    'd44',
-    'd49',
-    'd5\'gmp',
     'd5-c5',
-    'd50',
-    'd51',
-    'd519',
-    'd53',
-    'd546',
-    'd550',
-    'd5705',
-    'd6+',
-    'd6+2',
-    'd6+4',
-    'd6+6',
-    'd60',
-    'd66',
-    'd66&mdash;democrats',
-    'd6798',
     'd6807',
-    'd6810',
-    'd6812',
-    'd6898',
-    'd69',
-    'd6x10',
-    'd7523',
-    'd7560',
-    'd7671',
-    'd7672',
-    'd77',
-    'd781',
-    'd7nic1',
-    'd8+',
-    'd8/dt',
-    'd800',
     'd800-dfff',
-    'd810',
-    'd83',
-    'd84',
-    'd85',
-    'd86',
-    'd89',
-    'd899',
-    'd9&ndash;d10',
-    'd90',
-    'd9000',
-    'd9016',
-    'd91',
-    'd911',
-    'd92',
-    'd929',
     'd93',
-    'd930316',
-    'd94',
-    'd95',
-    'd950',
-    'd9531',
-    'd9553',
-    'd96',
-    'd960',
-    'd97',
-    'd978',
-    'd98',
-    'd981',
-    'd99',
-    'd990',
-    'd:context',
     'd:roman',
-    'd=&verbar;d&verbar',
-    'd=2',
-    'd=3',
-    'd=34',
-    'd=430mm',
-    'd=established',
-    'd=f/n',
-    'd=pawn',
-    'da-91',
-    'da-da-da',
-    'da-da-da-da-da-ra-da-dada-da-ra-da-ta-ta-ta',
-    'da-da-da-di-da-da',
-    'da-da-da-m',
-    'da-dat',
-    'da-dee-da',
     'da-dt',
-    'da-nang',
-    'da-pu-ri-to-jo',
-    'da1',
-    'da16v',
-    'da20',
-    'da7',
-    'da783',
-    'daaaaad',
-    'daaaaarling',
-    'daaad',
-    'daahling',
-    'daal',
-    'daandered',
-    'daarik',
-    'dab-dabbing',
     'dab-hand',
-    'dabangwa',
-    'dabar',
-    'dabate',
-    'dabbings',
-    'dabbott',
-    'dabbus',
-    'dabchick',
-    'dabchick-bill',
-    'dabchicks',
-    'dabco',
-    'dabdoub',
-    'dabeiba',
-    'dabit',
-    'dablen',
-    'dabler',
     'dables',
-    'dabney',
-    'dabo',
-    'dabrendorf',
-    'dabtiyah',
-    'dabub',
-    'dabydeen',
-    'dac2',
-    'dachilleae',
-    'dachsie',
-    'dachsies',
-    'dachstein',
-    'dacias',
-    'dacic',
-    'dacier',
-    'dacites',
     'dacmi',
-    'dacre-fox',
-    'dacrydium',
-    'dacrymyces',
-    'dactinomycin',
-    'dactu',
-    'dactyl',
-    'dactylifera',
-    'dactylogyridae',
-    'dactylopius',
-    'dactylorrhiza',
-    'dactyls',
-    'dad-dad',
-    'dad-figures',
-    'dad-of-three',
-    'dad-of-two',
     'dad-oh',
-    'dad.',
-    'dada-',
-    'dada-lettrist',
-    'dada/nihilismus',
-    'daddae',
-    'daddeee',
-    'daddi',
-    'daddie',
-    'daddin',
-    'daddington',
-    'daddio',
-    'daddry',
-    'daddryshield',
-    'dadds',
-    'daddy\'',
     'daddy-longlegs',
-    'daddy-substitutes',
-    'dadely',
-    'dadford',
-    'dadgad',
-    'dadi',
-    'dadley',
-    'dadoes',
-    'dadouche',
-    'dadtylis',
-    'dady',
-    'dae\'n\'',
-    'dae-sook',
-    'daearth',
-    'daedalus.',
-    'daemon-haunted',
     'daemon-head',
-    'daemon-hunter',
-    'daemon-masked',
-    'daemon-masks',
-    'daemon-possessed',
-    'daemon-slaying',
-    'daemonette-tongue',
-    'daemonhunter',
-    'daemonologie',
-    'daemonologist',
-    'daemonorops',
-    'daemonslayer',
-    'daeniker',
-    'daens',
-    'daes',
-    'daetwyler',
     'daeza',
-    'daf-leyland',
-    'daf.',
-    'dafang',
-    'daffarra',
-    'daffection',
-    'daffern',
-    'daffin',
-    'daffley',
-    'daffodil-yellow',
-    'daforno',
-    'dafriche',
-    'daftly',
-    'dafts',
-    'dafy',
-    'dag-hess-tan',
     'dag-pkc',
-    'dag/pkc',
-    'daga',
-    'dagaa',
-    'dagarti',
-    'dagbani',
-    'dagbladdet',
-    'dagblod',
-    'dagcentra',
-    'dage',
-    'dagenham-built',
-    'dager',
-    'daggenhurst',
-    'dagger&rehy;shaped',
-    'dagger-bill',
-    'dagger-billed',
     'dagger-bright',
-    'dagger-fangs',
-    'dagger-horned',
-    'dagger-shaped',
-    'dagger-sharp',
-    'dagger-toothed',
-    'daggermen',
-    'daggers-',
-    'daggers-drawn',
-    'daggled',
-    'daghestan-quality',
-    'daghestans',
-    'dagidder',
-    'daglas',
-    'daglesh',
-    'dagless',
     'daglo',
-    'dagnasty',
-    'dagnaw',
-    'dagnell',
-    'dagner',
-    'dagoe',
-    'dagori',
-    'dagos',
-    'dagri',
-    'dague',
-    'daguerrean',
-    'daguet',
-    'dagworthy',
-    'dah-dah-dah-dum',
-    'dah-dum',
-    'dahagram-angarpota',
     'dahai',
-    'dahayeeyah',
-    'dahg',
-    'dahistan',
-    'dahl-beck',
-    'dahlbeck',
-    'dahleeng',
-    'dahlerus.',
-    'dahlin',
-    'dahlings',
-    'dahlinks',
-    'dahlis',
-    'dahlman',
-    'dahlou',
-    'dahls',
-    'dahlstom',
     'dahmen',
-    'dahms',
-    'dahnendorf',
-    'daho',
-    'dahok',
-    'dahouk',
-    'dahs',
-    'daht',
-    'daid',
-    'daidalaion',
-    'daidley',
-    'daido',
-    'daiei',
-    'daigaku',
-    'daihan',
-    'daihatsu-powered',
     'daihatsus',
-    'daikichi',
-    'daikon',
-    'daikyo',
-    'daille',
-    'dailley',
-    'daily-different',
-    'daily-mirror',
-    'daily/every',
-    'daily/hourly',
-    'daily/weekly/monthly/archival',
-    'daimachos',
-    'daimen-icker',
-    'daimien',
-    'daimier',
-    'daimler-benz-group',
     'daimler-benz/mbb',
-    'daimonion',
-    'dain',
-    'daina',
-    'dainabot',
-    'dainfern',
-    'dainford',
-    'dainis',
-    'daintree',
-    'dainty-footed',
-    'dairena',
-    'dairn',
-    'dairo',
-    'dairy-based',
-    'dairy-class',
-    'dairy-cross',
     'dairy-farmers',
-    'dairy-goat',
-    'dairy-research',
-    'dairyhouse',
-    'dairyland',
-    'dairytime',
-    'dairywomen',
-    'dairywork',
-    'daisen',
-    'daishi',
-    'daissala',
-    'daisy-crowned',
-    'daisy-cutter',
-    'daisy-faced',
-    'daisy-shaped',
-    'daisy-spangled',
     'daisy-starred',
-    'daisy/thames',
-    'daisychaining',
-    'daitch',
-    'daitle',
-    'daitling',
-    'daitz',
-    'daix',
-    'dajan',
-    'dajani',
-    'dakanopolous',
-    'dakar-niger',
-    'daker',
-    'dakhar',
-    'dakhil',
-    'dakins',
     'dakno',
-    'dakoum',
-    'dakshina',
-    'dakt',
-    'daktarin',
-    'dal-dominated',
-    'dal25',
-    'dalada',
-    'daland',
-    'dalani',
-    'dalap-uliga-darrit',
-    'dalau',
-    'dalboni',
-    'dalden',
-    'daldens',
-    'daleky',
     'dalemain',
-    'daler&rehy;rowneys',
-    'dalers',
-    'dalesbus',
-    'dalescu',
-    'daleside',
-    'dalespeople',
-    'dalessandro',
-    'dalessio',
-    'dalestour',
-    'daleswomen',
-    'daley/55th',
-    'daley/pegasus',
-    'daleyesque',
-    'daleyite',
-    'daleymen',
     'dalf',
-    'dalgarno',
-    'dalgleish-like',
-    'dalglish/blackburn',
-    'dalglish/harold',
-    'dalglishfatigued',
-    'dalguise',
-    'dalheroia',
-    'dali-esque',
-    'daliborka',
-    'dalila',
-    'dalilandia',
-    'dalindyebo',
-    'dalinnoch',
-    'dalio',
-    'dalip',
     'dalk',
-    'dalkin',
-    'dallae',
-    'dallah-al-baraka',
-    'dallan',
-    'dallaras',
-    'dallari',
-    'dallas\'-type',
-    'dallas-oklahoma',
-    'dallas/constance',
-    'dallasburgh',
-    'dallasites',
-    'dallaturca',
-    'dallaway/davey/eastwood/thorogood',
-    'dallesandro',
-    'dallicus',
     'dallies',
-    'dallii',
-    'dallinghoo',
-    'dallmayr',
-    'dallmeier',
-    'dallos',
-    'dallow',
-    'dallwitz',
-    'dalmacija',
-    'dalmane',
-    'dalmatian-murdering',
-    'dalmatic',
-    'dalmatica',
-    'dalmaticus',
-    'dalmatius',
-    'dalmeny/sotheby',
     'dalmia',
-    'dalmon',
-    'dalmore',
-    'dalnacardoch',
-    'dalnair',
-    'dalon',
-    'dalrain',
-    'dalreoch',
-    'dalrymple/morland',
-    'dalrymples',
-    'dalshannon',
-    'dalsland',
-    'daltry',
-    'dalvand',
-    'daly-ferriera',
-    'dalyell-type',
     'dalymount',
-    'dalyngrydge',
-    'dalys',
-    'dam&rehy;nation',
-    'dam\'',
-    'dam-',
-    'dam-aging',
-    'dam-controlled',
-    'dama',
-    'damaclese',
-    'damad',
-    'damage\'',
-    'damage-',
-    'damage-awarding',
-    'damage-causing',
-    'damage-in-use',
     'damage-inflicting',
-    'damage-to-the',
-    'damage.9',
-    'damage/accidental',
-    'damageable',
-    'damaged.',
-    'damaged.but',
-    'damages(scotland)act',
-    'damages-was',
-    'damajan',
-    'damanded',
-    'damange',
-    'damanged',
-    'damanges',
-    'damareta',
-    'damari/weather',
     'damascening',
-    'damaschin',
-    'damask-caparisoned',
-    'damaska',
-    'damaso',
-    'damasta',
-    'damaturu',
-    'dambach',
-    'dambijn',
-    'dambiyn',
-    'dambor',
-    'damborenea',
-    'dambreuses',
-    'dambulla',
-    'damburst',
-    'dame-ellen',
     'dame-school',
-    'damed',
-    'damehoods',
-    'dameshek',
-    'damfool',
-    'damia',
-    'damiao',
-    'damietta',
-    'damige',
-    'daminozide',
-    'damir',
-    'damiri',
-    'damiro',
-    'damish',
-    'damishel',
-    'damjanovitch',
     'damley',
-    'dammage',
-    'dammam',
-    'damme-buster',
-    'dammes',
-    'damming/drying/erosion',
-    'dammit-get-out-of-my-way-variety',
-    'damn-the-consequences',
-    'damn-you',
-    'damn-your-eyes',
-    'damna',
-    'damnavit',
-    'damne',
-    'damned-all',
-    'damned-fool',
-    'damned-foolery',
     'damnedmascus',
-    'damnerncharnwanit',
-    'damnoen',
-    'damnosa',
-    'damo',
-    'damoclean',
-    'damodar',
-    'damoiseau',
-    'damoiselle',
-    'damoisselle',
-    'damole',
-    'damolly',
-    'damons',
-    'damonte',
-    'damosel',
-    'damp-down',
     'damp-eyed',
-    'damp-living',
-    'damp-proofers',
-    'damp-protecting',
-    'damp-squib',
-    'damp-trousered',
-    'damp/wood',
-    'dampcourse',
-    'dampcoursing',
-    'damped-out',
-    'dampierre-sur-boutonne',
-    'dampiet',
-    'damping.dependent',
-    'damplips',
-    'dampmartin',
-    'dampnacion',
     'dampned',
-    'dampners',
-    'damsel-fish',
-    'damselfly.',
-    'damson-charged',
-    'damson-coloured',
-    'damson-dripping',
-    'damson-hop',
-    'damson-hued',
-    'damur',
-    'dan&auml;e',
-    'dan\'l',
-    'dan-color',
-    'dan-yr',
-    'dana&iuml;de',
-    'dana-farber',
     'danaid',
-    'danaids',
-    'danair',
-    'danakils',
-    'danalia',
-    'danase',
-    'danask&oacute;gar',
-    'danatar',
-    'danazol',
-    'danby.',
-    'danby/community',
-    'dance&rehy;christopher',
-    'dance-and-forget',
-    'dance-card',
-    'dance-cards',
-    'dance-class',
     'dance-club',
-    'dance-composers',
-    'dance-crazed',
-    'dance-crazy',
-    'dance-cum-martial',
-    'dance-dominated',
-    'dance-down',
-    'dance-drama',
-    'dance-dramas',
-    'dance-enhanced',
-    'dance-friendly',
-    'dance-frock',
-    'dance-goers',
-    'dance-in-a-cold-climate',
-    'dance-inspired',
-    'dance-motion',
     'dance-numbers',
-    'dance-pair',
-    'dance-patterns',
-    'dance-pop',
-    'dance-rock',
-    'dance-style',
-    'dance-tunes',
-    'dance-type',
-    'dance/carer',
-    'dance/chic',
-    'dance/oddity',
-    'dance/theatre',
-    'dancehall-sized',
-    'dancehalls',
-    'danceing',
-    'dancelike',
     'danceline',
-    'dancenergy',
-    'dancer-acrobat',
-    'dancer-artist',
-    'dancer-mimes',
-    'danceries',
-    'dancerly',
-    'dancershave',
-    'dancey-dancey',
-    'danchenko',
-    'danchev',
-    'dancho',
-    'danci',
-    'dancienne',
-    'dancin',
-    'dancing-eyed',
     'dancing-floor',
-    'dancing-girl',
-    'dancing-in-the-aisles',
-    'dancing-partners',
-    'dancing-room',
-    'dancing-school',
-    'dancing-teacher',
-    'dancing-teachers',
-    'dancing-type',
-    'dancing/disco',
-    'dancingly',
-    'danckerts',
-    'dandelion-dotted',
-    'dandelioned',
-    'danders',
-    'dandi',
     'dandie',
-    'dandiest',
-    'dandin',
-    'dandit',
-    'dandles',
-    'dandong',
-    'dandruff-afflicted',
-    'dandruff-like',
-    'dandugama',
-    'dandy-looking',
-    'dandying',
-    'dane-gerous',
-    'dane-mastiff',
-    'daneel',
-    'danegelds',
-    'danehill',
     'danehy',
-    'danelectro-style',
-    'danelectros',
-    'danepack',
-    'danepak',
-    'danesbury',
-    'danescu',
-    'daneshill',
-    'danesway',
-    'danett',
-    'danewood',
-    'danforth-type',
-    'danforths',
-    'danfoss',
-    'dang&eacute;reuses',
-    'dang-shi',
     'danged',
-    'dangeous',
-    'danger-can',
-    'danger-filled',
-    'danger-fraught',
-    'danger-free',
-    'danger-made',
-    'danger-man',
-    'danger-money',
-    'danger-zone',
-    'danger/power',
-    'danger:anti',
-    'dangermouse',
-    'dangerous-sounding',
-    'dangerous.he',
-    'dangerous.man',
     'dangerous/risky',
-    'dangerously-high',
-    'dangerously-poisoned',
-    'dangerpoint',
-    'dangers.',
-    'dangers.ian',
-    'dangrus',
-    'dangu',
-    'dani&egrave;l',
-    'daniconius',
-    'daniel/vice',
-    'danielescu',
-    'daniell/derby',
-    'danielles',
-    'daniels/family',
-    'danielson',
     'danielsson',
-    'danielyan',
-    'daniil',
-    'danik',
-    'danikenesque',
-    'danilevich',
-    'danilevskii',
-    'danilevsky',
-    'danilian',
-    'danilov-danilyan',
-    'danilyan',
-    'danioko',
-    'danisco',
-    'danish-faced',
-    'danish-financed',
-    'danish-operated',
     'danish/swedish',
-    'danish/swedish/german/french',
-    'danislabour',
-    'danjal',
-    'danka',
-    'dankali',
-    'dankelly',
-    'danken',
-    'dankeshon',
-    'dankgesang',
-    'dankly',
-    'dankworths',
-    'danmare',
-    'danmark',
-    'dannan',
-    'dannell',
     'dannemeyer',
-    'dannett',
-    'dannewerk',
-    'dannezapfli',
-    'dannheisser',
-    'dannielle',
-    'dannii/woman',
-    'dannreuther',
-    'dannygal',
-    'danoli',
-    'danos',
-    'danouk',
-    'danra',
-    'dansalarural',
-    'danscribe',
-    'dansengiyn',
     'dansent',
-    'danser',
-    'dansereau',
-    'dansettes',
-    'dansez',
-    'dansken',
-    'danski',
-    'dansokho',
-    'dant',
-    'dante&eacute',
-    'dante-like',
-    'dantean',
-    'danter/angler',
-    'danth',
-    'danthorpe',
-    'dants',
     'dantz',
-    'danusia',
-    'danwear',
-    'danya',
-    'danyal',
-    'danyatai',
-    'danza',
-    'danzega',
-    'daobao',
-    'daobli',
-    'daoine',
-    'daoist',
-    'daoudi',
-    'daouel',
-    'daoukou',
-    'daoust',
     'daoyu',
-    'dap-t',
-    'dap/cp8',
-    'daper',
-    'daphnoides',
-    'daplen',
-    'daplyn',
-    'dapper-looking',
-    'dapper-suited',
-    'dappers',
-    'dappertutto',
-    'dapping',
-    'dapping-rod',
-    'dapple&rehy;grey',
-    'dapple-grey',
-    'dapplings',
     'daprou',
-    'daption',
-    'daputamodra',
-    'daqua',
-    'dar&rehy;381313',
-    'darabiner',
-    'daragh',
-    'darah',
-    'daraich',
-    'darakorum',
-    'daramalan',
-    'darawshah',
-    'darband-e-khan',
-    'darbandekhan',
-    'darbhanga',
-    'darbourne',
     'darboux',
-    'darby/chief',
-    'darby/eye',
-    'darby/flood',
-    'darby/oxfordshire',
-    'darco',
-    'dard&oacute;n',
-    'dardanians',
-    'dardanoni',
-    'dardistan',
-    'dardo',
-    'dare-not',
-    'darecliff',
-    'dareen',
-    'daregho-chvadhata',
-    'darem',
     'darez',
-    'darf',
-    'darfield',
-    'darfold',
-    'darfst',
-    'dargahs-such',
-    'dargonne',
-    'darie',
-    'daries',
-    'darina',
-    'darinda',
-    'dariole',
-    'daritis',
-    'dariuss',
-    'dariyoun',
-    'dark&rehy;brown',
     'dark&rehy;green',
-    'dark&rehy;silvered',
-    'dark\'-moon',
-    'dark-avised',
-    'dark-backed',
-    'dark-background',
-    'dark-beamed',
-    'dark-bearded',
-    'dark-blond',
-    'dark-blonde',
-    'dark-blues',
-    'dark-bottomed',
-    'dark-burnt',
-    'dark-capped',
-    'dark-cloaked',
-    'dark-clothed',
     'dark-coated',
-    'dark-complected',
-    'dark-corner',
-    'dark-current',
-    'dark-curtained',
-    'dark-dressed',
-    'dark-feathered',
-    'dark-featured',
-    'dark-flowing',
-    'dark-framed',
-    'dark-glass',
-    'dark-glassed',
-    'dark-gowned',
-    'dark-grey/',
-    'dark-hared',
-    'dark-hole-eyed',
     'dark-humoured',
-    'dark-i',
-    'dark-jacketed',
-    'dark-lashed',
-    'dark-leafed',
-    'dark-legged',
-    'dark-light',
-    'dark-lined',
-    'dark-natured',
-    'dark-nippled',
-    'dark-packed',
-    'dark-painted',
-    'dark-pastoral',
-    'dark-pillared',
-    'dark-purple',
-    'dark-ringleted',
     'dark-rose-and-amber',
-    'dark-scarlet',
-    'dark-ship',
-    'dark-stockinged',
-    'dark-stone',
-    'dark-stoned',
-    'dark-striped',
-    'dark-swollen',
-    'dark-tanned',
-    'dark-tasting',
-    'dark-thoughted',
-    'dark-timbre',
-    'dark-toned',
-    'dark-vowelled',
-    'dark-walled',
-    'dark-windowed',
     'dark-winged',
-    'dark-wood',
-    'dark-wooled',
-    'dark/12',
-    'darker-eyed',
-    'darker-skinned',
-    'darker-toned',
-    'darkes',
-    'darkey',
-    'darkgate',
-    'darkglass',
-    'darkground',
-    'darkhaired',
-    'darkhan',
-    'darkies',
-    'darkish-brown',
     'darklords',
-    'darkly-clothed',
-    'darkly-panelled',
-    'darkness.',
-    'darkness/day',
-    'darkpanelled',
-    'darkside/filipinos',
-    'darkstar',
-    'darktown',
-    'darku',
-    'darkwood',
-    'darl',
-    'darley-ridden',
-    'darling\'',
-    'darling-idea',
-    'darling-no',
     'darling/game',
-    'darling/parent',
-    'darlinged',
-    'darlinghurst',
-    'darlington&ndash;stockton',
-    'darlington-',
-    'darlington-bishop',
-    'darlington-built',
-    'darlington-crafted',
-    'darlington.name',
-    'darlingtonbased',
-    'darlingtonnewcastle',
-    'darlix',
-    'darlton',
-    'darmani',
-    'darmanovic',
     'darmilo',
-    'darmon',
-    'darmstadt-based',
-    'darn-tootin\'',
-    'darnbrough',
-    'darndale',
-    'darndest',
-    'darnell\'s.',
-    'darner',
-    'darners',
-    'darnin\'',
-    'darning-and-patching',
-    'darning-wool',
-    'daroca',
-    'darode',
-    'darpan',
     'darr&eacute',
-    'darrach',
-    'darracotta',
-    'darracq',
-    'darrall',
-    'darrick',
-    'darrig',
-    'darrington',
-    'darriulat',
-    'darrius',
-    'darsham',
-    'darsieres',
-    'dart-board',
-    'dart-heralds',
-    'dart-shaped',
-    'dartec',
     'darted.',
-    'dartfield',
-    'dartford&ndash;charing',
-    'dartfordians',
-    'darthaven',
-    'dartingly',
-    'dartle',
-    'dartmen',
-    'dartnell',
-    'dartoll',
-    'darton/operations',
-    'dartons',
-    'dartrey',
-    'dartry',
-    'darts.',
-    'dartsman',
     'dartsmen',
-    'darulhadis.',
-    'daruma',
-    'darville',
-    'darvish',
-    'darwen-bolton',
-    'darwin-mendel',
-    'darwinnia',
-    'daryanto',
-    'daryn',
-    'daryush',
-    'darzi',
-    'dasai',
-    'daschle',
-    'dascom',
-    'dascombe',
     'dascyllus',
-    'dase',
-    'dash-board',
-    'dashboard-mounted',
-    'dashbuttons',
-    'dashdabaa',
-    'dashdial',
-    'dashdovdon',
-    'dasheen',
-    'dashers',
-    'dashin\'',
-    'dashman',
-    'dashnaksutyun',
-    'dashnaktsutiun',
-    'dashnyam',
-    'dasho',
     'dashscreen',
-    'dashur',
-    'dashut',
-    'dasi',
-    'dassault-sud',
-    'dassault/fan-jet',
-    'dassault/sud',
-    'dassell',
-    'dassertdefence',
-    'dasseville',
-    'dassin',
-    'dasso',
-    'dassonville',
-    'dassu',
-    'dastards',
-    'dastle',
     'dastor',
-    'dastra',
-    'dasumius',
-    'dasvadanya',
-    'dasycladacean',
-    'dasypodius',
-    'dasyprocta',
-    'dasyuridae',
-    'dat\'s',
-    'data&rehy;sets',
-    'data\'',
-    'data-',
-    'data-acquisition',
-    'data-bass',
-    'data-call',
-    'data-coding',
     'data-collections',
-    'data-communication',
-    'data-compression',
-    'data-cube',
-    'data-design',
-    'data-desk',
-    'data-desks',
-    'data-destroying',
-    'data-filled',
-    'data-holding',
-    'data-infant',
-    'data-ink-ratio',
-    'data-input',
-    'data-intensive',
-    'data-logging',
-    'data-net',
     'data-networks',
-    'data-points',
-    'data-processing-and-moving',
-    'data-receiving',
-    'data-related',
-    'data-relay',
-    'data-rich',
-    'data-sheets',
-    'data-source',
-    'data-sponge',
-    'data-storage',
-    'data-stores',
-    'data-structure',
-    'data-swapping',
-    'data-tapes',
-    'data-threatening',
     'data-transmission',
-    'data-yielding',
-    'data.',
-    'data.manipulation',
-    'data.type',
-    'data.with',
-    'data/index',
-    'data/individual',
-    'data/knowledge',
-    'data_as',
-    'database(s)',
-    'database-management',
-    'database-word',
-    'database.dir',
-    'database.the',
-    'database/data',
     'database/system',
-    'database_by',
-    'databox',
-    'databus',
-    'datacell',
-    'datacenter',
-    'datacorders',
-    'datacraft',
-    'datacrime',
-    'datafiles.',
-    'dataguard',
-    'dataid',
-    'dataimage',
-    'datakit',
-    'datalogging',
-    'datamat',
     'datanet',
-    'datang',
-    'datapak',
-    'dataphones',
-    'dataproducts',
-    'datarec',
-    'datas',
-    'datascope',
-    'dataset/resource',
-    'datasets--in',
-    'datasheets',
-    'datasouth',
-    'datassette',
-    'datastream/robert',
-    'datastreams',
-    'datastructuring',
     'datasupport',
-    'datatrip',
-    'datatronic',
-    'datatype',
-    'dataviewer',
-    'dataware',
-    'dataworks',
-    'datblygiad',
-    'datd',
-    'date&mdash;new',
-    'date&mdash;synchronise',
-    'date-guessers',
-    'date-of',
-    'date-of-birth',
-    'date-pudding',
-    'date-stamps',
     'date-stones',
-    'date.the',
-    'date.throughout',
-    'date/',
-    'date/s',
-    'date/time/lexicographer/log',
-    'date:radio',
-    'datebook',
-    'datebooks',
-    'dated-looking',
-    'dated-product',
-    'datedness',
-    'datejust',
-    'datemark',
-    'datemarked',
-    'datemi',
     'dateq',
-    'dater',
-    'dates&mdash;view',
-    'dates/venues',
-    'datetargetfiredhitsmissesdownedkilledinjured',
-    'datewise',
-    'datex-m',
-    'datex-p',
-    'dathy',
-    'datin',
-    'datiscaceae',
-    'datner',
-    'datong',
-    'datronech',
-    'datsun-owners',
-    'datu',
     'datura-based',
-    'datura-related',
-    'datus',
-    'daub-',
-    'daubeney',
-    'daubeny',
-    'daubers',
-    'daubes',
-    'daubhill',
-    'daubuz',
-    'daudel',
-    'dauelsberg',
-    'dauer',
-    'dauers',
-    'daugava',
-    'dauger',
     'daughter&rehy;in-law',
-    'daughter\'s/son\'s/friend\'s',
-    'daughter-at-home',
-    'daughter-mother',
-    'daughter-what',
-    'daughter/father',
-    'daughtercards',
-    'daughters-at-home',
-    'daughters-in&rehy;law',
-    'daughtry',
-    'daugleddau',
-    'daugr.',
-    'daulaire',
-    'daumiers',
-    'daun',
-    'daunca',
     'daunce',
-    'dauncer',
-    'dauncey',
-    'dauncey/gloucestershire',
-    'daungers',
-    'dauntedly',
-    'daunting-looking',
-    'dauntingly-high',
-    'daunts',
-    'dauphines',
-    'daurade',
-    'dauson',
-    'dauster',
-    'dav&iacute',
-    'dav-eed',
-    'dava',
     'davaasambuu',
-    'davall',
-    'davao',
-    'davar',
-    'davda',
-    'davdison',
-    'davelaar',
-    'davenay',
-    'davendranath',
-    'davenport/head',
-    'davenport/prisoner',
-    'daverelle',
-    'davers:where',
-    'davex',
-    'davey/witness',
-    'davey_et',
     'daveyton',
-    'davico',
-    'david&lsqb',
-    'david-and-goliath',
-    'david-like',
-    'david-starke/eyewitness',
-    'david-weill',
-    'david-west',
-    'david/ayr',
-    'david/glasgow',
-    'davidb&uuml;ndlert&auml;nze',
-    'davidbattersby',
-    'davideis',
-    'davidhazi',
-    'davidi',
-    'davidis',
     'davidov',
-    'davidova',
-    'davidovich',
-    'davidovitch',
-    'davidow-ventures',
-    'davidsen-nielsen',
-    'davidson\'s',
-    'davidson/assistant',
-    'davidson/bishop',
-    'davidson/organiser',
-    'davidsson',
-    'davidsz.',
-    'davidtz',
-    'davies-colley',
-    'davies/associate',
-    'davies/asst',
     'davies/co-editor/supporters\'',
-    'davies/director',
-    'davies/estate',
-    'davies/farmer',
-    'davies/fruit',
-    'davies/garage',
-    'davies/hannah',
-    'davies/haulage',
-    'davies/haulier',
-    'davies/higher',
-    'davies/jockey',
-    'davies/land',
-    'davies/landowner',
-    'davies/malvern',
-    'davies/national',
-    'davies/neighbour',
     'davies/occupational',
-    'davies/oxfordshire',
-    'davies/psychology',
-    'davies/registered',
-    'davies/road',
-    'davies/senior',
-    'davies/spider',
-    'davies/station',
-    'davies/swindon',
-    'davies/trading',
-    'davies/villager',
-    'davies/volunteer',
-    'davies/weightlifter',
-    'davies/whitbreads',
-    'davill',
-    'davinci',
     'davis-monthan',
-    'davis/alan',
-    'davis/aviation',
-    'davis/avon',
-    'davis/baker/tear',
-    'davis/burglary',
-    'davis/chairman/british',
-    'davis/charlie',
-    'davis/consultant',
-    'davis/del',
-    'davis/developer',
-    'davis/director',
-    'davis/driver',
-    'davis/eye',
-    'davis/gloucester',
-    'davis/gloucestershire',
     'davis/horse',
-    'davis/landowner',
-    'davis/malvern',
-    'davis/managing',
-    'davis/owner',
-    'davis/oxfordshire',
-    'davis/trader',
-    'davis/usaf',
-    'davison/british',
-    'davison/photographer',
-    'davison/thames',
-    'davistow',
-    'davlar',
-    'davlatov',
-    'davlec',
-    'davlyn',
     'davoli',
-    'davoll',
-    'davor',
-    'davorin',
-    'davos-klosters',
-    'davos/klosters',
-    'davros',
-    'davset',
-    'davut',
-    'davy&ndash;faraday',
-    'davydov',
-    'dawbarn',
-    'dawdlers',
-    'dawdy',
-    'dawel',
-    'dawen',
     'dawes/appeal',
-    'dawes/coal',
-    'dawes/pershore',
-    'daweses',
-    'dawit',
-    'dawkin',
-    'dawkings',
-    'dawn-dirty',
-    'dawn-light',
-    'dawn-lipped',
-    'dawn-streaked',
-    'dawn-very',
-    'dawn/duskward',
-    'dawn/homeless',
-    'dawne',
-    'dawneth',
     'dawnlit',
-    'dawnpatrick',
-    'dawnrise',
-    'dawny',
-    'dawood',
-    'dawoud',
-    'daws/grandaughter',
-    'dawson(bradford)',
-    'dawson-porter',
-    'dawson-shephard',
-    'dawson-williams',
-    'dawson/',
-    'dawson/certificated',
-    'dawson/coney',
-    'dawson/enigma',
-    'dawson/santa',
     'dawsoni',
-    'dawston',
-    'dawstone',
-    'dawtry',
-    'dawuaciren',
-    'day&bsol;week&bsol;month',
-    'day&mdash;because',
-    'day&rehy;to-day',
-    'day&trade',
-    'day\'-bring',
-    'day*',
-    'day--which',
-    'day-12',
-    'day-14',
-    'day-21',
-    'day-a',
     'day-after',
-    'day-and-a-bit',
-    'day-at-a-time',
-    'day-before-payday',
-    'day-boarder',
-    'day-book',
-    'day-break',
-    'day-bug',
-    'day-bugs',
-    'day-bundles',
-    'day-cabin',
-    'day-cap',
-    'day-clients',
-    'day-colleges',
-    'day-conductress',
-    'day-conferences',
     'day-count',
-    'day-dreamers',
-    'day-dreamt',
-    'day-fearing',
-    'day-fighter&rehy;reconnaissance',
-    'day-frock',
-    'day-girls',
-    'day-glo&rehy;rucksacked',
-    'day-glow',
-    'day-gown',
-    'day-hockin',
-    'day-hospital',
-    'day-in-day-out',
-    'day-job',
-    'day-jobs',
-    'day-like',
     'day-lined',
-    'day-lodge',
-    'day-mare',
-    'day-names',
-    'day-o',
-    'day-of-the',
-    'day-of-the-week',
-    'day-off',
-    'day-on',
-    'day-pupil',
-    'day-pupils',
-    'day-return',
-    'day-set',
-    'day-sheet',
-    'day-spring',
-    'day-stage',
     'day-they',
-    'day-this',
-    'day-timer',
-    'day-times',
-    'day-to',
-    'day-to-evening&rehy;wear',
-    'day-to.day',
-    'day-today-',
-    'day-tripper',
-    'day-tripping',
-    'day-tutor',
-    'day-visas',
-    'day-visitor',
-    'day-were',
-    'day-worker',
-    'day.a',
     'day.just',
-    'day.meet',
-    'day.none',
-    'day.other',
-    'day.the',
-    'day.today',
-    'day/agricultural',
-    'day/all',
-    'day/away',
-    'day/co-ordinator',
-    'day/evening',
-    'day/lecturer',
-    'day/managing',
-    'day/out',
-    'day/sales',
-    'day/three',
     'day/trader',
-    'day/week',
-    'day=0',
-    'dayabeeyah',
-    'dayaks',
-    'dayanand',
-    'daycourse',
-    'daycourses',
-    'dayell',
-    'dayest',
-    'dayglo-colour',
-    'dayglo-coloured',
-    'dayglo-encrusted',
-    'daykin',
-    'daylay',
-    'daylengths',
     'daylight-active',
-    'daylight-saving',
-    'daylight-simulating',
-    'daylight-strange',
-    'daylighty',
-    'daymare',
-    'daymond',
-    'daypart',
-    'dayre',
-    'dayrie',
-    'dayrooms',
-    'days&mdash',
-    'days&mdash;she',
-    'days&ndash;93',
-    'days\'n\'nights',
-    'days\'supply',
     'days*',
-    'days-and',
-    'days-my',
-    'days-of',
-    'days-off',
-    'days-out',
-    'days.if',
-    'days.ken',
-    'days/4',
-    'days/6',
-    'days/7',
-    'days/hours',
-    'days/i',
-    'days/occasionally/',
-    'days/weeks',
-    'days/wk',
     'daysailing',
-    'dayshift',
-    'daysit',
-    'daysitting',
-    'daytimers',
-    'dayto-day',
-    'daytrip',
-    'daytrips',
-    'daywalking',
-    'dayworker',
-    'dayworkers',
-    'dayyy',
-    'dazed&mdash;he',
-    'dazeley',
-    'dazled',
-    'dazs',
     'dazu',
-    'dazzle-bright',
-    'dazzle-confusion',
-    'dazzle-painting',
-    'dazzlement',
-    'dazzlers',
-    'db&mdash;vista',
-    'db(uk)',
-    'db++',
-    'db+no',
-    'db-15',
-    'db-5ms',
-    'db-double',
-    'db.h++',
-    'db1',
-    'db2-based',
     'db2/nt',
-    'db36',
-    'db601n',
-    'dbase-compatible',
-    'dbaselv',
-    'dbauto',
-    'dbb',
-    'dbcm',
-    'dbes',
-    'dbmaj7',
-    'dbp-tag',
-    'dbsu',
-    'dbto',
-    'dbutil',
-    'dbviewer',
-    'dbw',
     'dc&amp',
-    'dc&mdash;ass&mdash;mods',
-    'dc&mdash;christian',
-    'dc&mdash;details',
-    'dc&mdash;history',
-    'dc&mdash;identifier',
-    'dc&mdash;info/',
-    'dc&ndash;3&ndash;201d',
-    'dc&ndash;3s',
-    'dc&ndash;4s',
-    'dc&ndash;6',
-    'dc&ndash;6a',
-    'dc&ndash;6b',
-    'dc&ndash;6s',
-    'dc&ndash;8',
-    'dc&rehy;3&ndash;209b',
     'dc&rehy;8s',
-    'dc-125',
-    'dc-135',
-    'dc-1o',
-    'dc-2',
-    'dc-200',
-    'dc-3/c-47',
-    'dc-3a',
-    'dc-3a-197b',
-    'dc-4s',
-    'dc-4s/-6s/-7s',
-    'dc-6bs',
-    'dc-7',
-    'dc-7cf',
-    'dc-7s',
-    'dc-9-15s',
     'dc-9s',
-    'dc-arc',
-    'dc-restoration',
-    'dc-rom',
-    'dc.',
-    'dc/osx',
-    'dc/user',
-    'dc18',
-    'dc2',
-    'dc20',
-    'dc5',
-    'dc6525',
-    'dc9015',
-    'dc9100',
-    'dca/rft',
-    'dcac-organised',
     'dcbasehead',
-    'dcca',
-    'dcd',
-    'dcd-6',
-    'dcds',
-    'dce-based',
-    'dce-competitive',
-    'dce-conformance',
-    'dce-interoperable',
-    'dce-lite',
-    'dce-type',
-    'dce/dme',
-    'dce/dme-based',
-    'dce/encina',
-    'dcf\'s',
-    'dcfs',
     'dci0s',
-    'dcis',
-    'dcm-catalysed',
-    'dcm.',
-    'dcme-a15',
-    'dcms',
-    'dcoes',
-    'dcpg',
-    'dcrb',
-    'dcs10637-hso510490',
-    'dcs10638',
-    'dcs20515',
-    'dcs20608',
-    'dcstat.fil',
-    'dctober',
-    'dcvd',
     'dcx',
-    'dd\'',
-    'dd-60',
-    'dd-62',
-    'dd-duck',
-    'dd.',
-    'dd/ah',
-    'dd1000',
-    'dd206',
-    'dd4',
-    'dd931',
-    'ddavid',
-    'ddawns',
-    'ddcr',
-    'ddcs/2',
-    'dddd:hh:mm:ss',
     'dde-',
-    'ddls',
-    'ddrb',
-    'ddress',
-    'ddrglkdxrrdo',
-    'dds',
-    'dds-dc',
-    'ddsi',
-    'ddt-resistant',
-    'dduallt',
-    'ddx/tf/715/1&ndash;12',
-    'ddx/tf/996/1',
-    'ddysgais',
-    'de&atilde;o',
-    'de&rehy;briefing',
-    'de&rehy;demarcated',
     'de&rehy;differentiation',
-    'de&rehy;educated',
-    'de&rehy;feated',
-    'de&rehy;fending',
-    'de&rehy;loittes',
-    'de&rehy;moralizing',
-    'de&rehy;motivating',
-    'de&rehy;mystified',
-    'de&rehy;mythologised',
-    'de&rehy;stabilize',
-    'de&thorn',
-    'de\'agneau',
-    'de\'benci',
-    'de\'grassi',
-    'de\'mocracy',
-    'de-acetylation',
     'de-acidify',
-    'de-affiliated',
-    'de-afforestation',
-    'de-alienate',
-    'de-allocations',
-    'de-anne',
-    'de-authorised',
-    'de-automatization',
-    'de-bag',
-    'de-beaked',
-    'de-bearded',
-    'de-biologising',
-    'de-bittered',
-    'de-bittering',
-    'de-bolting',
-    'de-bombing',
     'de-briefed',
-    'de-briefings',
-    'de-briefs',
-    'de-buggers',
-    'de-bugging',
-    'de-bureaucratisation',
-    'de-bureaucratize',
-    'de-burring',
-    'de-capped',
-    'de-categorising',
-    'de-center',
-    'de-centralise',
-    'de-centralization',
-    'de-centralized',
-    'de-centralizing',
-    'de-centre',
     'de-centred',
-    'de-centres',
-    'de-chernatony',
-    'de-childed',
-    'de-ciphered',
-    'de-classified',
-    'de-clutch',
-    'de-clutching',
-    'de-code',
-    'de-coded',
-    'de-collectivisation',
-    'de-collectivization',
-    'de-colonization',
-    'de-com-po-ses',
-    'de-composed',
-    'de-compounding',
     'de-compression',
-    'de-concretise',
-    'de-construction',
-    'de-contamination',
-    'de-contextualised',
-    'de-contextualized',
-    'de-convert',
-    'de-count',
-    'de-counting',
-    'de-coupled',
-    'de-criminalisation',
-    'de-criminalise',
-    'de-criminalising',
-    'de-criminalization',
-    'de-crofting',
-    'de-dedicated',
     'de-designated',
-    'de-development',
-    'de-dooh-de-doo',
-    'de-dramatized',
-    'de-ee-o',
-    'de-ee-ooo',
-    'de-energised',
-    'de-eroticize',
-    'de-escalate',
-    'de-escalation',
-    'de-essing',
-    'de-everythinged',
-    'de-feminised',
-    'de-foil',
-    'de-fragmenters',
-    'de-frocked',
     'de-frocking',
-    'de-fuelling',
-    'de-furbishment',
-    'de-fuzz',
-    'de-gas',
-    'de-gassers',
-    'de-gaussing',
-    'de-gazetted',
-    'de-gear',
-    'de-generated',
-    'de-glaciating',
-    'de-glamorization',
-    'de-glamourize',
-    'de-grandfathered',
-    'de-greaser',
-    'de-greasing',
     'de-gut',
-    'de-gutted',
-    'de-hardened',
-    'de-haut-en-bas',
-    'de-horns',
-    'de-hospitalising',
-    'de-hospitalizing',
-    'de-housed',
-    'de-hulling',
-    'de-humanise',
-    'de-humanized',
-    'de-hydration',
-    'de-icers',
-    'de-ideologized',
-    'de-incorporation',
-    'de-ink',
     'de-inking',
-    'de-ins',
-    'de-installed',
-    'de-installing',
-    'de-institutionalise',
-    'de-institutionalization',
-    'de-insurance',
-    'de-insured',
-    'de-insuring',
-    'de-integrating',
-    'de-internalization',
-    'de-interpret',
-    'de-investing',
-    'de-jected',
-    'de-judaise',
-    'de-la-pole',
     'de-legitimize',
-    'de-lethalisation',
-    'de-licensed',
-    'de-link',
-    'de-linkage',
-    'de-linking',
-    'de-listed',
-    'de-listing',
-    'de-louse',
-    'de-loused',
-    'de-manning',
-    'de-marxisation',
-    'de-medicalise',
-    'de-medicalization',
-    'de-miniaturise',
-    'de-mirv',
     'de-mob',
-    'de-mobbed',
-    'de-mobilised',
-    'de-monopolising',
-    'de-monopolization',
-    'de-motivating',
-    'de-motivation',
-    'de-motorised',
-    'de-mountable',
-    'de-mystified',
-    'de-nailing',
-    'de-nationalisation',
-    'de-nationalise',
-    'de-nationalization',
-    'de-nationalizing',
-    'de-naturalising',
     'de-nazify',
-    'de-newleyfy',
-    'de-nol',
-    'de-notified',
-    'de-novo',
-    'de-personalising',
-    'de-politicisation',
-    'de-politicise',
-    'de-politicized',
-    'de-politicizing',
-    'de-pollute',
-    'de-population',
-    'de-porn',
-    'de-portraitised',
-    'de-programmers',
-    'de-programming',
     'de-railed',
-    'de-railment',
-    'de-rated',
-    'de-rating',
-    'de-realization',
-    'de-registration',
-    'de-registrations',
-    'de-religionized',
-    'de-resourcing',
-    'de-restrict',
-    'de-restricted',
-    'de-rigeur',
-    'de-rigs',
-    'de-rigueurly',
-    'de-rind',
-    'de-sacramentalized',
     'de-sampled',
-    'de-scale',
-    'de-scaler',
-    'de-schoolers',
-    'de-seasonalization',
-    'de-seasonalize',
-    'de-segregated',
-    'de-segregation',
-    'de-sensationalized',
-    'de-sensitised',
-    'de-sensitising',
-    'de-sensitivized',
-    'de-sexed',
-    'de-sexualises',
-    'de-sexualization',
-    'de-sexualized',
     'de-shelled',
-    'de-signifiers',
-    'de-silting',
-    'de-skiing',
-    'de-skilling/re-skilling',
-    'de-sludging',
-    'de-socialised',
-    'de-soldered',
-    'de-sovietising',
-    'de-sovietization',
-    'de-spool',
-    'de-stabilisation',
-    'de-stabilisations',
-    'de-stabilised',
-    'de-stabilising',
-    'de-stabilization',
     'de-stabilizing',
-    'de-staffing',
-    'de-stalinized',
-    'de-stalked',
-    'de-stationization',
-    'de-stigmatise',
-    'de-stocked',
-    'de-stressing',
-    'de-suited',
-    'de-teddying',
-    'de-thorn',
-    'de-throning',
-    'de-tox',
-    'de-toxification',
-    'de-toxify',
-    'de-trend',
     'de-trunking',
-    'de-unionization',
-    'de-valued',
-    'de-veiling',
-    'de-what',
-    'de-whiffing',
-    'de-xgas',
-    'de-xxxx',
-    'de.g',
-    'de.g.j.',
-    'de/1coupage',
-    'de/ed',
-    'de/tente',
-    'de16mb.exe',
-    'de2000',
-    'de55',
     'de82',
-    'de_force',
-    'de_grace',
-    'de_resistance',
-    'dea*',
-    'dea-controlled',
-    'dea-financed',
-    'dea/jella',
-    'dea/narcog',
-    'deac',
-    'deacde',
-    'deacey',
-    'deacidification',
-    'deacon/club',
-    'deacon/gloucester',
-    'deacondale',
     'deactivating',
-    'deacylated',
-    'dead\'',
-    'dead(ening)',
-    'dead-ass',
-    'dead-at-birth',
-    'dead-baits',
-    'dead-beat',
-    'dead-cart',
-    'dead-centre',
-    'dead-drunk',
-    'dead-end\'',
-    'dead-even',
-    'dead-eye',
-    'dead-from-the-nerves-down',
-    'dead-heat',
     'dead-heaters',
-    'dead-important',
-    'dead-leg',
-    'dead-line',
-    'dead-lines',
-    'dead-lock',
-    'dead-locked',
-    'dead-locks',
-    'dead-metaphor',
-    'dead-my',
-    'dead-one',
-    'dead-panning',
-    'dead-player',
-    'dead-pull',
-    'dead-reckoning',
-    'dead-ringer',
     'dead-skinned',
-    'dead-walking',
-    'dead-weights',
-    'dead-wood',
-    'dead-work',
-    'dead.',
-    'dead.david',
-    'dead.dersingham',
-    'dead/unwell',
-    'dead_of',
-    'deadalus',
-    'deadband',
-    'deadend',
-    'deadfaced',
-    'deadground',
-    'deadhorse',
     'deadhouse',
-    'deadline-defying',
-    'deadline-packed',
-    'deadline/just',
-    'deadlined',
-    'deadlines.',
-    'deadlock-breaking',
-    'deadly-serious',
-    'deadmans',
-    'deadmen',
-    'deadpanning',
-    'deadringer',
-    'deadspace',
-    'deadspots',
-    'deadstick',
-    'deadweights',
     'deadwoods',
-    'deaf&rarr;not',
-    'deaf-',
-    'deaf-aids',
-    'deaf-and-stupid',
-    'deaf-hearing',
-    'deaf-loops',
-    'deaf-without-speech',
-    'deaf.his',
-    'deafeat',
-    'deaggregation',
-    'deaglan',
-    'deak',
-    'deaker/chris',
-    'deal&mdash;no',
-    'deal&mdash;she',
     'deal&rehy;to',
-    'deal\'',
-    'deal-',
-    'deal-framed',
-    'deal-less',
-    'deal-sized',
-    'dealable',
-    'dealbata',
-    'dealbreaker',
-    'dealed',
-    'dealer-artist',
-    'dealer-supplied',
-    'dealer-supreme',
-    'dealer.',
-    'dealer/customer',
-    'dealer/mechanic',
     'dealer/point-of-sale',
-    'dealer/promoter',
-    'dealer/retailer',
-    'dealerlinkplus',
-    'dealers/',
-    'dealers/big',
-    'dealigned',
-    'dealignment',
-    'dealin',
-    'dealine',
-    'dealing-buying',
-    'dealing-with-difficult-parents',
-    'dealkent',
-    'deall',
-    'dealmaking',
-    'deals-discretionary',
     'dealt&mdash;ie',
-    'dealuminated',
-    'dealy',
-    'dean-designate',
-    'dean-like',
-    'dean-possessed',
-    'dean.',
-    'dean/416th',
-    'dean/badger',
-    'dean/safety',
-    'dean/shop',
-    'dean/veteran',
-    'deance/wallace',
-    'deancross',
-    'deane(3.0)',
-    'deane-amite',
     'deane.',
-    'deane/wallace',
-    'deanein',
-    'deaner',
-    'deangate',
-    'deangelis',
-    'deanish',
-    'deano/whelan/wallace',
-    'deanos',
-    'deanpark',
-    'deans/provosts',
-    'deanscales',
-    'deansgate-piccadilly',
-    'deansloch',
-    'deanspark',
-    'deap',
     'deap-seated',
-    'deapsie',
-    'dear&mdash;has',
-    'dear\'',
-    'dear-jeannette-letter',
-    'dear-ludovico',
-    'dear-up',
-    'dear-was',
-    'dear_.&',
-    'dearbhla',
-    'dearborne',
-    'dearborni',
-    'dearden-scripted',
-    'deardorf',
-    'dearie-oh',
-    'dearing-style',
     'dearl',
-    'dearly-beloved',
-    'dearly-bought',
-    'dearly/as',
-    'dearman',
-    'dearmon',
-    'dearnesse',
-    'dears.',
-    'dearumque',
-    'deases',
-    'deasley',
-    'deason',
-    'death&gt',
-    'death&mdash;house',
-    'death&mdash;impermanence',
-    'death&rehy;adder',
     'death&rehy;strip',
-    'death(s)',
-    'death-and-rebirth',
-    'death-as-a-viable-alternative-to-life',
-    'death-bid',
-    'death-bringer',
-    'death-bus',
-    'death-causing',
-    'death-charge',
-    'death-columns',
-    'death-crash',
-    'death-cry',
-    'death-dance',
-    'death-days',
-    'death-dazzled',
-    'death-destruction-doom',
     'death-dive',
-    'death-dreading',
-    'death-dust',
-    'death-duties',
-    'death-exposure',
-    'death-faced',
-    'death-fall',
-    'death-feign',
-    'death-fleet',
-    'death-for-death',
-    'death-full',
-    'death-hold',
-    'death-hole',
-    'death-in-service',
-    'death-instinct',
-    'death-masks',
     'death-metal',
-    'death-of-the-author',
-    'death-oriented',
-    'death-pact',
-    'death-pale',
-    'death-pangs',
-    'death-patched',
-    'death-plot',
-    'death-pose',
-    'death-potential',
-    'death-ration',
-    'death-ray',
-    'death-registry',
-    'death-related',
-    'death-right',
-    'death-row',
     'death-scream',
-    'death-seeker',
-    'death-spells',
-    'death-stiffening',
-    'death-strewn',
-    'death-tech',
-    'death-tent',
-    'death-throe',
-    'death-village',
-    'death-wail',
-    'death-white',
-    'death-wishers',
-    'death-with',
-    'death-world',
-    'death.but',
-    'death.jack',
     'death/doom',
-    'death/for',
-    'death/knows',
-    'death/loss',
-    'deathbeat',
-    'deathblackgrindthrashmetalultrafastfrashyfrashydoomgloom',
-    'deathblow',
-    'deathblows',
-    'deathbucker',
-    'deathcharge',
-    'deathclaw',
-    'deathe',
-    'deathedness',
-    'deathfield',
-    'deathfulness',
-    'deathheads',
     'deathline',
-    'deathlock',
-    'deathly-tinted',
-    'deathmangle',
-    'deathmask',
-    'deathmasques',
-    'deathness',
-    'deathrider',
-    'deaths.richard',
-    'deaths/which',
-    'deaths:families',
-    'deaths_due',
-    'deathshead',
-    'deathward',
-    'deathwards',
-    'deathware',
     'deathyell',
-    'deattributed',
-    'deauratam',
-    'deautomatization',
-    'deaytons',
-    'deb&circ;acle',
-    'deb-like',
-    'deb-type',
-    'deb-types',
-    'deb.',
-    'debaar/farmer',
-    'debach',
-    'debaene',
-    'debag',
-    'debagged',
-    'debakle',
     'debarge',
-    'debark',
-    'debarked',
-    'debarrs',
-    'debart',
-    'debasements',
-    'debassie',
-    'debastarrechea',
-    'debate/future',
-    'debate_as',
-    'debated.',
-    'debates-half',
-    'debates-late',
-    'debati',
-    'debating-chamber',
-    'debating-table',
     'debating/arguing/nagging',
-    'debation',
-    'debaucher',
-    'debauchery\'',
-    'debb\'io',
-    'debbeh',
-    'debble',
-    'debe',
-    'debeaked',
-    'debeaking',
-    'debeat',
-    'debebat',
-    'debectib',
-    'debele',
-    'debelleyme',
-    'debendox-related',
     'debendranath',
-    'debenham/cellmark',
-    'debenhans',
-    'debent',
-    'debeo',
-    'debili',
-    'debilitating/chronic/better-do-something-quick',
-    'debit/credit',
-    'debitore',
-    'debitum',
-    'deblemishing',
-    'debler',
-    'deblicker',
-    'deblocking',
-    'deblurring',
-    'debole',
     'debonairly',
-    'debonding',
-    'debone',
-    'deborra-lee',
-    'debost',
-    'debottle-necked',
-    'debottlenecking',
-    'debouchment',
-    'debouchure',
-    'debrecan',
-    'debreu',
-    'debrezcin',
-    'debriefers',
-    'debriefing/evaluation',
-    'debris-flow',
-    'debrum',
     'debrutalizing',
-    'debsy',
-    'debt&mdash;or',
-    'debt&mdash;us&dollar;11,000',
-    'debt\'',
-    'debt-bearing',
-    'debt-collectors',
-    'debt-counselling',
-    'debt-death',
-    'debt-financed',
-    'debt-happy',
-    'debt-heavy',
-    'debt-holding',
-    'debt-issuer',
-    'debt-nature',
-    'debt-on-wind-up',
     'debt-plus-equity',
-    'debt-protection',
-    'debt-recovery',
-    'debt-repayment',
-    'debt-restructurings',
-    'debt-scourged',
-    'debt-settler',
-    'debt-strapped',
-    'debt-swap',
-    'debt.',
-    'debt/credit',
-    'debt/net',
-    'debt/poverty',
-    'debt/quick',
-    'debtor-contracts',
-    'debtor-country',
     'debtor-in-possession',
-    'debtors/creditors',
-    'debts/receivables',
-    'debulks',
-    'debunker',
-    'debunkery',
-    'debunne',
-    'deburr',
-    'deburred',
-    'debussyan',
-    'debussyans',
-    'debut-ing',
-    'debut-making',
-    'debye-h&uuml;ckel',
-    'dec&ndash;30',
-    'dec&ndash;5',
     'dec-10',
-    'dec-12',
-    'dec-4',
-    'dec-based',
-    'dec-designed',
-    'dec-developed',
-    'dec-feb',
-    'dec-hp-unisys-tandem',
-    'dec-march',
-    'dec-to-dec',
-    'dec-vax',
-    'dec.16',
-    'dec.31',
-    'dec/3000s',
-    'dec/alpha',
-    'dec/edi',
     'dec/europe',
-    'dec/fujitsu',
-    'dec/ultrix',
-    'dec/unix',
-    'dec10',
-    'dec21',
-    'dec22/jan20',
-    'deca-dance',
-    'decacred',
-    'decadal',
-    'decade&mdash;the',
-    'decade-and-a-half',
-    'decade-blocks',
-    'decade-bound',
-    'decade-conscious',
-    'decade-obsessed',
     'decade-to-decade',
-    'decade.the',
-    'decadently',
-    'decades.',
-    'decadic',
-    'decadrachm',
-    'decaffeinate',
-    'decaffeination',
-    'decaffinated',
-    'decagonal',
-    'decaisnea',
-    'decalcomanie',
-    'decalogues',
-    'decamers',
-    'decampment',
-    'decan',
     'decanning',
-    'decanonized',
-    'decantation',
-    'decantations',
-    'decantees',
-    'decants',
-    'decaocto',
-    'decapitalised',
-    'decapitates',
-    'decapitator',
-    'decapitators',
-    'decapolis',
-    'decarbonised',
-    'decarboniser',
-    'decarburisation',
-    'decarceration',
     'decarnation',
-    'decartelisation',
-    'decastyle',
-    'decasualisation',
-    'decasualized',
-    'decatex',
-    'decathletes',
-    'decay-accelerating',
-    'decay-blackened',
-    'decay-rate',
-    'decay-series',
-    'decay.',
-    'decayperiod',
-    'decca-ap4',
-    'decca-ap5',
-    'decca-polydor',
     'decca-receiving',
-    'decchip',
-    'decdesign',
-    'deceaseds',
-    'deceases',
-    'deceassed',
-    'dececco',
-    'deceided',
-    'deceiptful',
-    'deceiue',
-    'deceiv&eacute;d',
-    'deceive/',
-    'deceiver(s)',
-    'deceivest',
-    'deceivingly',
-    'decelean',
     'decelerator',
-    'decelle',
-    'december&ndash;1',
-    'december&ndash;january',
-    'december-13',
-    'december-16',
-    'december-19',
-    'december-21',
-    'december-30',
-    'december-4',
-    'december-6',
-    'december-april',
-    'december-picked',
-    'december/early',
-    'december1924',
-    'decembers',
     'decembre',
-    'decemvirate',
-    'decen',
-    'decency-rock',
-    'decend-count',
-    'decent&rehy;sized',
-    'decentish',
-    'decentraliser',
-    'decentralism',
-    'decentralization*',
-    'decentralization-process',
-    'decentralization/devolution',
-    'decentralize.',
-    'decentricity',
-    'decentrings',
-    'decentrists',
     'decepticon',
-    'deception&mdash;theft',
-    'deception.',
-    'deceptionist',
-    'decerebrate',
-    'decerebrated',
-    'dechavanne',
-    'dechhen',
-    'dechlorinating',
-    'dechlorination',
-    'dechnoleg',
-    'decianus',
-    'decibal',
-    'decibel-diplomacy',
-    'decibel-heavy',
-    'decibles',
     'decid',
-    'decided_whether_or',
-    'decidely',
-    'deciders',
-    'decides/tell',
-    'deciding-frame',
-    'decidion',
-    'decidua',
-    'deciduous.',
-    'decie',
-    'decies',
-    'decilitre',
-    'decilitres',
-    'decimalise',
-    'decimalization',
-    'decimatio',
     'decimations',
-    'decimetre-scale',
-    'decimetres',
-    'decimomannu',
-    'decination',
-    'decins',
-    'decipher-',
-    'decipherability',
-    'decipherer',
-    'decipiens',
-    'decipium',
-    'decipularis',
-    'decis&rehy;iveness',
-    'decisi',
-    'decision\'',
-    'decision(s)',
     'decision-by-default',
-    'decision-making.',
-    'decision-oriented',
-    'decision-rule',
-    'decision-taker.',
-    'decision-takin',
-    'decision.but',
-    'decision/solution',
-    'decisionpoint/relational',
-    'decisionpoint/rqs',
-    'decisions-',
-    'decisions-it',
-    'decisions.the',
-    'decisions/proposals',
-    'decisionwas',
-    'decisive&mdash;regard',
     'decisive.the',
-    'decisiveness.',
-    'decisve',
-    'decivilizing',
-    'deck-arrester',
-    'deck-cabin',
-    'deck-cargo',
-    'deck-covered',
-    'deck-hand',
-    'deck-hands',
-    'deck-house',
-    'deck-space',
-    'deck-stepped',
-    'deck-swabbers',
-    'deckbeds',
-    'decked-out',
     'deckelpokal',
-    'deckenson',
-    'deckered',
-    'deckloading',
-    'deckplates',
-    'decksalon',
-    'decksaloon',
-    'declaimers',
-    'declairs',
-    'declarative/interrogative/imperative',
-    'declarativeness',
-    'declarden',
-    'declassifed',
-    'declermont',
-    'declinature',
-    'decline&mdash;or',
     'decline-and-fall',
-    'decline/withdraw',
-    'declinedtocomment',
-    'decling',
-    'declining-cost',
-    'declining-in',
-    'declinists',
-    'decmpp',
-    'decnet/osi',
-    'deco-fronted',
-    'decoctions',
-    'decoits',
-    'decoke',
-    'decollation',
-    'decollet&eacute',
-    'decollet&eacute;e',
     'decolonialisation',
-    'decolonising',
-    'decolonize',
-    'decolonizing',
-    'decolorans',
-    'decolorized',
-    'decolourize',
-    'decomcracy',
-    'decommission-ing',
-    'decommitted',
-    'decommitting',
-    'decompaction',
-    'decompiled',
-    'decompiling',
-    'decomposability',
-    'decomposer',
     'decompossed',
-    'decompressional',
-    'decompressive',
-    'decompressors',
-    'deconcentrated',
-    'deconditioning',
-    'decongest',
-    'decongesting',
-    'deconjugating',
-    'deconstructable',
-    'deconstruction.',
-    'deconstructivism',
-    'decontam',
-    'decontaminants',
-    'decontaminates',
-    'decontextualise',
     'decontextualization',
-    'decontextualize',
-    'decontraction',
-    'decontrolling',
-    'deconverted',
-    'deconvolutional',
-    'decor&rehy;ations',
-    'decorated\'',
-    'decorated-utilitarian',
-    'decoration.',
-    'decorational',
-    'decorations.',
-    'decorative&mdash',
-    'decorative-then',
-    'decorative/educational/food',
-    'decorative/representational/ultilarian/ceremonial',
     'decorator-hosts',
-    'decorcast',
-    'decormier',
-    'decoro',
-    'decorousness',
-    'decorprint',
-    'decorums',
-    'decos',
-    'decosahexaenoic',
-    'decosphere',
-    'decot',
-    'decoturf',
-    'decourt',
-    'decoux',
-    'decoying',
-    'decpresents',
     'decratered',
-    'decreased.',
-    'decree\'',
-    'decree-law',
-    'decreeth',
-    'decremental',
-    'decrements.',
-    'decrescence',
-    'decrescendo',
-    'decrescendos',
-    'decreto',
-    'decretorum',
-    'decriminalise',
-    'decriminalizing',
-    'decrucqs',
-    'decrusted',
     'decryption',
-    'decrystallising',
-    'decservers',
-    'decss7',
-    'dect1800',
-    'dectalk',
-    'dectect',
-    'dectective',
-    'decticus',
-    'dectors',
-    'dectp',
-    'decultured',
-    'decumanus',
-    'decurion',
-    'decurions',
-    'decussata',
     'decussate',
-    'decvoice',
-    'decwatchers',
-    'decwindows-osf',
-    'decydes',
-    'decypher',
-    'dedari',
-    'dedective',
-    'dedere',
-    'dedes',
-    'dedgun',
-    'dedic',
-    'dedicatad',
-    'dedicated.',
-    'dedifferentiated',
-    'dedifferentiation',
     'dedimus',
-    'dedman',
-    'dedombar',
-    'dedousyg',
-    'dedreux-dorcy',
-    'dedridge',
-    'deds',
-    'deduc',
-    'deductable',
-    'deductionism',
-    'deductionj',
-    'deductions.',
-    'deductive/',
-    'deductivist',
-    'dee-',
-    'dee-dah-dah',
     'dee-dah-dee-dah-dum',
-    'dee-groovy',
-    'dee-hee',
-    'dee-liteful',
-    'dee/merseyside',
-    'deeah',
-    'deed/dead',
-    'deede',
-    'deedeelee',
-    'deedoadal',
-    'deeds&mdash;registered',
-    'deedsafe',
-    'deee-liteful',
-    'deee-magical',
-    'deeeeep',
-    'deeepest',
     'deeeply',
-    'deef',
-    'deeioo',
-    'deejayed',
-    'deekie',
-    'deeko',
-    'deeks',
-    'deeks/hospital',
-    'deeleebob',
-    'deeleebobber',
-    'deeley/injured',
-    'deelkraal',
-    'deely',
-    'deener',
-    'deenethorpe-based',
-    'deep-',
     'deep-banked',
-    'deep-bore',
-    'deep-brimmed',
-    'deep-bronzed',
-    'deep-brown',
-    'deep-buried',
-    'deep-buttoned',
-    'deep-carpeted',
-    'deep-cleanse',
-    'deep-cleansing',
-    'deep-crimson',
-    'deep-cuffed',
-    'deep-cushioned',
-    'deep-delved',
-    'deep-delving',
-    'deep-discounted',
     'deep-discounters',
-    'deep-draught',
-    'deep-drawn',
-    'deep-driving',
-    'deep-dug',
-    'deep-dyed',
-    'deep-enough',
-    'deep-etched',
-    'deep-faced',
-    'deep-fat-fried',
-    'deep-filled',
-    'deep-flavoured',
-    'deep-freezers',
-    'deep-freezes',
-    'deep-freezing',
-    'deep-fry',
     'deep-grained',
-    'deep-green',
-    'deep-grounded',
-    'deep-hollowed',
-    'deep-inside',
-    'deep-lead',
-    'deep-mantle',
-    'deep-mining',
-    'deep-money',
-    'deep-navelled',
-    'deep-navy',
-    'deep-ocean',
-    'deep-piled',
-    'deep-pink',
-    'deep-pitched',
-    'deep-plan',
     'deep-ploughed',
-    'deep-purple',
-    'deep-quarried',
-    'deep-rock',
-    'deep-root',
-    'deep-rootedly',
-    'deep-rootedness',
-    'deep-sand',
-    'deep-sided',
-    'deep-sky',
-    'deep-socketed',
-    'deep-straw-and-goggling-visitors',
-    'deep-structures',
-    'deep-sunk',
-    'deep-taped',
-    'deep-tendon',
     'deep-textured',
-    'deep-thinking',
-    'deep-throat',
-    'deep-tow',
-    'deep-trance',
-    'deep-treaded',
-    'deep-vaulted',
-    'deep-vein',
-    'deep-wrapped',
-    'deepdye',
-    'deepends',
-    'deeper-bodied',
-    'deeper-coloured',
-    'deeper-marine',
-    'deeper-water',
-    'deepflow',
     'deepfreeze',
-    'deepglow',
-    'deeplish',
-    'deeply&rehy;felt',
-    'deeply-cleft',
-    'deeply-dejected',
-    'deeply-exotic',
-    'deeply-furrowed',
-    'deeply-hidden',
-    'deeply-hit',
-    'deeply-ingrained',
-    'deeply-lined',
-    'deeply-lobed',
-    'deeply-moulded',
-    'deeply-needed',
-    'deeply-read',
     'deeply-recessed',
-    'deeply-set',
-    'deeply-tanned',
-    'deeply-troubled',
-    'deeply-voiced',
-    'deeply-wooded',
-    'deepness',
-    'deeprooted',
-    'deepsix',
-    'deer-',
-    'deer-caught-in-the-headlights',
-    'deer-hound',
-    'deer-hounds',
-    'deer-hunters',
-    'deer-killers',
-    'deer-like',
     'deer-parks',
-    'deer-raiders',
-    'deer-raiding',
-    'deer-shooting',
-    'deer-skin',
-    'deer-skins',
-    'deer-spotting',
-    'deer-stealing',
-    'deer-watchers',
-    'deer-watching',
-    'deeralok',
-    'deerbrook',
-    'deerfield',
-    'deerfin',
-    'deerhood',
-    'deerhunters',
     'deerner',
-    'deerpark',
-    'deershot',
-    'deerskin-covered',
-    'deerstalkered',
-    'deescalation',
-    'deescuss',
-    'deestriders',
-    'deeth',
-    'deever',
-    'deevy',
-    'deezes',
-    'def-stan',
-    'defaecated',
-    'defaite',
-    'defalcations',
     'defamation*',
-    'defamation.',
-    'defamers',
-    'defamiliarize',
-    'defamiliarizes',
-    'defanged',
-    'defatting',
-    'default-free',
-    'default/withdrawals',
-    'default14',
-    'defaute',
-    'defcli',
-    'defe',
-    'defea',
-    'defeasance',
-    'defeasibly',
     'defeat.',
-    'defeated&mdash;see',
-    'defeated-looking',
-    'defeated.',
-    'defeater',
-    'defeatingly',
-    'defeatism/triumphalism',
-    'defebrillation',
-    'defecatory',
-    'defecography',
-    'defectations',
-    'defects.',
-    'defects/symptoms',
-    'defectuum',
-    'defeminising',
-    'defen',
     'defence&mdash;it',
-    'defence&mdash;often',
-    'defence-dependent',
-    'defence-dominated',
-    'defence-electronics',
-    'defence-industry',
-    'defence-led',
-    'defence-less',
-    'defence-sector',
-    'defence-spending',
-    'defence-strategy-led',
-    'defence-talk',
-    'defence-work',
-    'defence/industrial',
-    'defence/keeper',
-    'defence_as',
     'defences&rehy;when',
-    'defencies',
-    'defencists',
-    'defend-against-labour',
-    'defendan',
-    'defendant&mdash;has',
-    'defendant\'',
-    'defendant-on',
-    'defended-against',
-    'defendentis',
-    'defender-turned-striker',
-    'defender/full',
-    'defender/midfielder',
-    'defender/sweeper',
-    'defendin\'',
-    'defending/',
     'defending/attacking',
-    'defendinge',
-    'defenestrated',
-    'defenitely',
-    'defensa',
-    'defenses',
-    'defension',
-    'defensive\'',
-    'defensively.',
-    'defensores',
-    'defeo',
-    'defer-ence',
-    'deference/patronage',
-    'deferences',
-    'deferments',
-    'deferred-payment',
     'deferreds',
-    'deffand',
-    'deffett',
-    'deffinately',
-    'defi&rehy;nitional',
-    'defiant-sounding',
-    'defibrillate',
-    'defibrillations',
-    'defibrination',
-    'deficiency-based',
-    'deficient\'',
-    'deficit-cutters',
-    'deficit-reducing',
-    'deficit-ridden',
-    'deficits.',
-    'defie',
     'defier',
-    'defilements',
-    'defileth',
-    'defilippo',
-    'defin',
-    'definatly',
-    'defined-benefit',
-    'defined-entry',
-    'defined-sequences',
-    'definetely',
-    'defini',
-    'defini&rehy;tively',
-    'definicil',
-    'defining/non-defining',
-    'definite-sounding',
-    'definitely.',
     'definition\'',
-    'definition-conformant',
-    'definition-tasks',
-    'definitionalism',
-    'definitions.',
-    'deflatingly',
-    'deflation-induced',
-    'deflection-displaying',
-    'defleshed',
-    'defleur',
-    'deflexa',
-    'deflexion',
-    'deflo',
-    'deflocculated',
-    'defloratum',
-    'defluffing',
     'defoe-like',
-    'defoes',
-    'defogging',
-    'defoliaria',
-    'defoliators',
-    'defore',
-    'deforest',
-    'deforestation.',
-    'deforges',
-    'deformans',
-    'deformational',
-    'deformd',
-    'deformed-looking',
-    'deformer',
-    'defosses',
-    'defoy',
     'defrag',
-    'defragging',
-    'defraoui',
-    'defrauder',
-    'defrayment',
-    'defrays',
-    'defreitas10',
-    'defreyn',
-    'defrock',
-    'defs',
-    'deftedar',
-    'deftly-sketched',
-    'deftly-timed',
-    'defton',
-    'defu',
-    'defuerunt',
     'defunction',
-    'defunctive',
-    'defunctorum',
-    'defuzzification',
-    'defuzzing',
-    'deg.',
-    'degage',
-    'degale',
-    'degame',
-    'degania',
-    'degannwy',
-    'degarmo',
-    'degaslish',
-    'degasn',
-    'degassed',
-    'degasser',
     'degen',
-    'degener',
-    'degenerescence',
-    'degenkolb',
-    'deger',
-    'degg',
-    'degged',
-    'deggendorf',
-    'degiorgio',
-    'deglacial',
-    'deglaciations',
-    'deglamorise',
-    'deglamorised',
-    'deglamorising',
-    'deglazing',
-    'degler',
     'deglon',
-    'degloving',
-    'deglupta',
-    'deglutitions',
-    'deglycyrrhizinised',
-    'degn&iacute',
-    'degna',
-    'degoricija',
-    'degosang',
-    'degoune',
-    'degr&eacute;s',
-    'degraded-core',
-    'degradingly',
-    'degranulate',
-    'degranulated',
-    'degranulating',
     'degreasant',
-    'degreasants',
-    'degredation',
-    'degree-ceremonies',
-    'degree-course',
-    'degree/that',
-    'degreee',
-    'degrees-of-freedom',
-    'degrees.the',
-    'degreesc',
-    'degreesf',
-    'degrenality',
-    'degrevaunt',
-    'degrey',
-    'degrugillier',
-    'degruy',
     'degryse',
-    'deguchi',
-    'degucht',
-    'degueldre',
-    'degun',
-    'degusted',
-    'dehaen',
-    'dehalogenating',
-    'dehalogenation',
-    'dehaut-enbas',
-    'dehaven',
-    'deheubarth',
-    'dehiscent',
-    'dehiscing',
-    'dehistorical',
-    'dehistoricization',
     'dehistoricize',
-    'dehiwala',
-    'dehmc',
-    'dehmel',
-    'dehner',
-    'dehomosexualised',
-    'dehorning',
-    'dehortatory',
-    'dehousse',
-    'dehradun',
-    'dehumanize',
-    'dehumidification',
-    'dehy',
-    'dehybridization',
-    'dehybridized',
-    'dehydrator',
     'dehydroascorbic',
-    'dehydrocholesterol',
-    'dehydrodoginase',
-    'dehydrogenases',
-    'dehydrogenations',
-    'dehydroxyacetone',
-    'dei&aacute',
-    'deianira',
-    'deiation',
-    'deichtire',
-    'deicide',
-    'deictic/non-deictic',
-    'deideologisation',
-    'deideologised',
-    'deiectos',
-    'deigo',
     'deil',
-    'deim',
-    'dein\'',
-    'deindustrializing',
-    'deine',
-    'deinonychus',
-    'deinos',
-    'deinotherium',
-    'deinstitutionalisation',
-    'deinstitutionalizing',
-    'deionisation',
-    'deionisers',
-    'deirdra',
-    'deirdrie',
-    'deiring',
-    'deisel',
     'deist',
-    'deitemeyer',
-    'deiters',
-    'deith',
-    'deities&mdash;and',
-    'deivio',
-    'deixes',
-    'deja',
-    'dejager',
-    'dejala',
-    'dejame',
-    'dejana',
-    'dejanikus',
-    'dejective',
-    'dejerine',
-    'dejin',
     'dejmal&lsqb;see',
-    'dejohnette',
-    'dejoria',
-    'dek',
-    'dekalia',
-    'dekametre',
-    'dekemhare',
-    'deken',
-    'dekink',
-    'dekmejian',
-    'deko&mdash;democratic',
-    'dekom',
-    'dekooning',
-    'dekorativnoye',
-    'dekretstil',
-    'dekstop',
     'dekuji',
-    'del&gt',
-    'del&iacute;rio',
-    'del\'abbate',
-    'del-boy',
-    'del-nevo/committee',
-    'del.',
-    'dela',
-    'delabel',
-    'delabelling',
-    'delacluse',
-    'delacorta',
-    'delacours',
-    'delacy',
-    'delaford',
-    'delafouge',
     'delagi',
-    'delahay',
-    'delahunt/scotland',
-    'delair',
-    'delamaide',
-    'delamain',
-    'delamare',
-    'delamarre',
-    'delambre',
-    'delaminated',
-    'delaminating',
-    'delaminations',
-    'delande/waiter',
-    'delaney/mother-to-be',
-    'delaney/pickle',
-    'delaney/wildfowl',
     'delaneys',
-    'delannoy',
-    'delanos',
-    'delanouei',
-    'delapidation',
-    'delapidations',
-    'delapon',
-    'delaport',
-    'delapraz',
-    'delaration',
-    'delarivi&mdash;re',
-    'delarivier',
-    'delaroche',
-    'delarue',
-    'delatores',
-    'delaubenque',
     'delaune',
-    'delaxica',
-    'delay-inducing',
-    'delay-start/pre-set/auto-start',
-    'delaye',
-    'delayed&rehy;action',
-    'delayed-telecast',
-    'delayed.',
-    'delayering',
-    'delbard',
-    'delbigot',
-    'delbridge',
-    'delcamp',
-    'delcev',
-    'delchev',
-    'delcl',
     'delcor',
-    'delecluse',
-    'delecour',
-    'delectable-looking',
-    'delegate-general',
-    'delegates/officials',
-    'delegation-general',
-    'delegation.',
-    'delegats',
-    'delegi&rehy;timize',
-    'delegitimate',
-    'delegitimating',
-    'delegitimation',
-    'delegitimisation',
-    'delegitimization',
-    'delegitimized',
     'delelopment',
-    'delemotte',
-    'delenda',
-    'delendick',
-    'deleon',
-    'delerious',
-    'delesman',
-    'delete/erase',
-    'deleted&mdash;see',
-    'deletion-clones',
-    'deletion-prone',
-    'deletion.there',
-    'deletrious',
-    'deletrix',
-    'deleuzian',
-    'delev',
     'delever',
-    'delevopment',
-    'delfeayo',
-    'delfen',
-    'delfield',
-    'delfino',
-    'delfland',
-    'delfonics',
-    'delfzjil',
-    'delgado-gal',
-    'delhi&ndash;srinagar',
-    'deli-cum-restaurant-cum',
-    'deli-restaurant',
-    'delibars',
-    'delibas',
-    'delibe',
     'delibera&rehy;tion',
-    'deliberacy',
-    'deliberat',
-    'deliberate-',
-    'deliberate/avoidable',
-    'deliberateley',
-    'deliberately-created',
-    'deliberately-for-dining',
-    'deliberately-invented',
-    'deliberately-sown',
-    'deliberatio',
-    'deliberations.',
-    'deliberations.5',
-    'deliberatle',
-    'deliberatly',
-    'deliberatory',
     'deliberte',
-    'delible',
-    'delibrately',
-    'delicare',
-    'delicari',
-    'delicate-filmed',
-    'delicate-fingered',
-    'delicate-leaved',
-    'delicate/diabetic',
-    'delicately-balanced',
-    'delicately-barbed',
-    'delicately-composed',
-    'delicately-painted',
-    'delicately-sprayed',
-    'delicately-worked',
-    'delicatessen-cum-drinking',
     'delicati',
-    'delich',
-    'delichon',
-    'delicia',
-    'delicious&mdash;are',
-    'delicious-sounding',
-    'delicious.',
-    'deliciousnesses',
-    'deliever',
-    'delighted.it',
-    'delightfl',
-    'delightfully-',
-    'delightfully-named',
-    'delikatess',
-    'delilah-complex',
-    'deliline',
     'delimara',
-    'delimitable',
-    'delin',
-    'delincourt',
-    'deline',
-    'delineato',
-    'delineator',
-    'delinguente',
-    'delinquency-is',
-    'delinquency/criminality',
-    'delinquente',
-    'delipidated',
-    'deliquency',
-    'deliquent',
-    'deliquescence',
-    'deliquescing',
     'delire',
-    'deliria',
-    'deliriums',
-    'delisle',
-    'delissa',
-    'delitiae',
-    'delitions',
-    'delitzsch',
-    'deliuer',
-    'deliuered',
-    'delivas',
-    'delivered&mdash;no',
-    'delivereth',
-    'deliveries.',
-    'deliveries/distributions',
-    'delivery-against-payment',
     'delivery-boy',
-    'delivery-boys',
-    'delivery-man',
-    'delivery-men',
-    'delivery-rooms',
-    'delivery-service',
-    'delivery-specification',
-    'delivery-to-promise',
-    'delivery-ward',
-    'delivery/collection',
-    'deliverying',
-    'deliveryman',
-    'deliving',
-    'delivrance',
-    'delizie',
-    'dell\'acqua',
     'dell\'acquese',
-    'dell\'agricoltura',
-    'dell\'amata',
-    'dell\'antico',
-    'dell\'antiquario',
-    'dell\'aqua',
-    'dell\'armata',
-    'dell\'et&agrave',
-    'dell\'europa',
-    'dell\'incoronata',
-    'dell\'intelletto',
-    'dell\'orio',
-    'dell\'orizzonte',
-    'dell\'orologio',
-    'dell\'orto',
-    'dell\'ospedale',
     'dell\'osservanza',
-    'dell\'osso',
-    'dell\'ottocento',
-    'dell\'ovo',
-    'dell\'universit&agrave',
-    'dell\'uva',
-    'dell-arte',
-    'dell/ultra',
-    'della-savina',
-    'dellach',
-    'dellanzo',
-    'dellas',
-    'dellasel',
-    'dellightful',
-    'dellin',
-    'delly',
     'delm&eacute',
-    'delmaney',
-    'delmark',
-    'delmazou',
-    'delme',
-    'delmo',
-    'delmont',
-    'delmore',
-    'delnashaugh',
-    'delni',
-    'delocalise',
-    'delocalized',
-    'delofting',
-    'deloite',
-    'deloitt',
-    'delonghi',
     'delor',
-    'delors-ii',
-    'delors-led',
-    'delorsism',
-    'delozier',
-    'delphi-story',
-    'delphinapterus',
-    'delphine/us',
-    'delphyne',
-    'delphys',
-    'delpiazzo',
-    'delpy',
-    'delrina.',
-    'delsoin',
-    'delsol',
-    'delta-400',
     'delta-6',
-    'delta-9-desaturase',
-    'delta-capacitor',
-    'delta-factor',
-    'delta-shaped',
-    'delta-west',
-    'delta-winged',
-    'delta/ad3.1',
-    'deltaclavus',
-    'deltanet',
-    'deltate',
-    'deltawave',
-    'deltec',
-    'delteil',
-    'deltoblastus',
-    'deltones',
     'deltopectoral',
-    'deluge-cursed',
-    'deluges',
-    'delunctious',
-    'delusion-formation',
-    'delusion-of-grandeur',
-    'delux',
-    'deluxes',
-    'deluze',
-    'delveloped',
-    'delver',
-    'delvi',
-    'delvine',
-    'delvoye',
-    'delyved',
-    'dem16',
     'dema',
-    'demacedo',
-    'demads',
-    'demage',
-    'demagnetise',
-    'demagnetising',
-    'demagogical',
-    'demand-based',
-    'demand-determined',
-    'demand-employment',
-    'demand-fed',
-    'demand-for-money',
-    'demand/aggregate',
-    'demand/guidance',
-    'demand/limitation',
-    'demand/monetary',
     'demand_along',
-    'demandez',
-    'demandin\'',
-    'demanet',
-    'demangler',
-    'demantis',
-    'demarateion',
-    'demaratos',
-    'demarcastel',
-    'demarcator',
-    'demarcators',
-    'demarchelier',
-    'demarchia',
-    'demarchs',
-    'demarest',
-    'demarned',
     'demasculation',
-    'demasculatory',
-    'demasted',
-    'dematerializes',
-    'dematurization',
-    'dembele',
-    'dember',
-    'dembi-dolo',
-    'dembicki',
-    'dembinska-kiec',
-    'dembo',
-    'demchigdorj',
-    'demchigjavyn',
-    'demcratic',
-    'demcrats',
-    'demeane',
     'demeaningly',
-    'demeanor',
-    'demeclocycline',
-    'demeclocycline+all',
-    'demed',
-    'demedicalising',
-    'demelo',
-    'demenour',
-    'demensne',
-    'dementiae',
-    'demential',
-    'dementias',
-    'dements',
-    'demeny',
-    'demeraby',
-    'demerarae',
     'demere',
-    'demersum',
-    'demeska',
-    'demeski',
-    'demesne-farms',
-    'demestica',
-    'demethylating',
-    'demetris',
-    'demetroulla',
-    'demeure',
-    'demi-',
-    'demi-authoritarian',
-    'demi-caract&euml;re',
-    'demi-chef',
-    'demi-continent',
-    'demi-devil/why',
     'demi-divine',
-    'demi-glace',
-    'demi-johns',
-    'demi-kilo',
-    'demi-lion',
-    'demi-machines',
-    'demi-mondaines',
-    'demi-mondes',
-    'demi-pete',
-    'demi-pli&eacute',
-    'demi-pointes',
-    'demi-regular',
-    'demi-semi-quaver',
-    'demi-semis',
-    'demi-vegetarians',
-    'demi-world',
     'demic',
-    'demidovs',
-    'demigod',
-    'demille',
-    'demille-like',
-    'demineralises',
-    'demineralized',
-    'deminimus',
-    'deminished.',
-    'deminutive',
-    'demipirouette',
-    'demiral',
-    'demirdji',
-    'demiser',
-    'demist',
-    'demisted',
     'demisting',
-    'demitasse',
-    'demits',
-    'demiurge',
-    'demling',
-    'demming',
-    'demmings',
-    'demmy',
-    'demnati',
-    'demner',
-    'demo\'cratic',
-    'demo-',
-    'demo-competition',
-    'demo-cracy',
-    'demo-dudes',
-    'demo-ing',
     'demo-making',
-    'demo-sized',
-    'demo-tape',
-    'demob-happy',
-    'demobs',
-    'democr&aacute;ca',
-    'democr&agrave;tico',
-    'democracy-haters',
-    'democracy-movement',
-    'democracy-would',
-    'democracy/workers',
-    'democracyand',
-    'democrappery',
-    'democrappiness',
-    'democrasserie',
-    'democrassness',
     'democrat-authoritarian',
-    'democrat-fdp',
-    'democrat-free',
-    'democrat-inspired',
-    'democrat-liberal',
-    'democrat-run',
-    'democrat-sponsored',
-    'democrat/liberal',
-    'democrate',
-    'democratic\'',
-    'democratic-centralist',
-    'democratic-dominated',
-    'democratic-manandhar',
-    'democratic-participant',
-    'democratic-social',
-    'democratic/labour',
     'democratic/liberal',
-    'democratically-accountable',
-    'democratically-chosen',
-    'democratically-constructed',
-    'democratically-determined',
-    'democratically-run',
-    'democratically-structured',
-    'democratick',
-    'democratics',
-    'democratique-(rcd)',
-    'democratiques',
-    'democratisch',
-    'democratische',
-    'democratizers',
-    'democratizes',
-    'democratrization',
     'democreats',
-    'democrisy',
-    'democritas',
-    'demodulated',
-    'demographyand',
-    'demokracja',
-    'demokrasi',
-    'demokraten',
-    'demokraten/d&eacute;mocrates',
-    'demokraterna',
-    'demokrati',
-    'demokratiei',
-    'demokratikon',
-    'demokratikos',
-    'demokratische-sozialen',
-    'demokratischen',
     'demokratischer',
-    'demokratsiya',
-    'demokratske',
-    'demokratskhi',
-    'demokratyczne',
-    'demokritos',
-    'demol',
-    'demolder',
-    'demolised',
-    'demolished/derelict',
-    'demolisher',
-    'demolisher/ex-jungle',
-    'demolishers',
-    'demolition-perspective',
-    'demolition-work',
-    'demolitions.',
     'demoliton',
-    'demollari',
-    'demomcrats',
-    'demon&rehy;strates',
-    'demon&rehy;strations',
-    'demon&rehy;strators',
-    'demon-creature',
-    'demon-enemy',
-    'demon-filled',
-    'demon-haunted',
-    'demon-possessed',
-    'demon-serpents',
-    'demon-servant',
-    'demon-star',
-    'demon-world',
-    'demoness',
     'demonetisation',
-    'demonetised',
-    'demonetization',
-    'demoniacally',
-    'demoniacs',
-    'demonic\'',
-    'demonics',
-    'demonise',
-    'demonism',
-    'demonize',
-    'demonography',
-    'demonological',
-    'demonologies',
-    'demonologist',
-    'demonstable',
-    'demonstators',
     'demonstrable-largen',
-    'demonstrate.',
-    'demonstrated.',
-    'demonstratio',
-    'demonstration-experiments',
-    'demonstration-lectures',
-    'demonstration-steamed',
-    'demonstration-type',
-    'demonstration/in',
-    'demonstrative\'',
-    'demonstratorship',
-    'demonstratorships',
-    'demonstratory',
-    'demontage',
-    'demontrond',
-    'demonz',
     'demopped',
-    'demoralised-sounding',
-    'demorgan',
-    'demornay',
-    'demos.',
-    'demosetic',
-    'demosponges',
-    'demostenes',
-    'demostrators',
-    'demotivates',
-    'demotivator',
-    'demourova',
-    'demours',
-    'demoze',
-    'demphu',
-    'dempseys',
     'demsar',
-    'demski',
-    'demulsifier',
-    'demulsifiers',
-    'demultiplexing',
-    'demureness',
-    'demurrence',
-    'demutualisations',
-    'demythologization',
-    'demythologized',
-    'demythology',
-    'den-sa',
-    'denali&ndash;fairbanks',
-    'denamrk',
-    'denar',
-    'denari',
     'denaris-style',
-    'denars',
-    'denate',
-    'denationalize',
-    'denationalizers',
-    'denationisation',
-    'denatired',
-    'denatonium',
-    'denaturalize',
-    'denaturant',
-    'denaturated',
-    'denaturating',
-    'denatures',
-    'denaturisation',
-    'denazifying',
-    'denbies',
     'denbigh/green',
-    'denbound',
-    'denbury',
-    'dence',
-    'denchworth/oxfordshire',
-    'denco',
-    'denda',
-    'denderah&ndash;abydos&ndash;sohag',
-    'denderah/quena',
-    'dendermonde',
-    'dendral',
-    'dendrochronotogy',
-    'dendrocopos.',
-    'dendrodorid',
-    'dendrodorids',
-    'dendrograms',
     'dendroicus',
-    'dendroidea-dendroid',
-    'dendroids',
-    'dendrologist',
-    'dendronephtya',
-    'dendrophthoe',
-    'dendropithecus',
-    'dendrov',
-    'dendur',
-    'denebola',
-    'deneficial',
-    'deneke',
-    'denerarios',
-    'denervated',
-    'denetted',
-    'denevan',
     'deneview',
-    'denfield',
-    'denfreude',
-    'deng-era',
-    'dengemarsh',
-    'denhall',
-    'denham/council',
-    'denholm-young',
-    'deniably',
-    'denial/aspirations',
-    'denial/withdrawal',
-    'denice-work-if-you-can-get-it',
-    'denidba/mba',
-    'denied-exchange',
-    'denied.',
-    'denied.a',
     'denier-woven',
-    'deniers',
-    'denig',
-    'denigrators',
-    'denigratory',
-    'deniken',
-    'denile',
-    'denim-blue',
-    'denim-cotton',
-    'denim-dark',
-    'denined',
-    'denington',
-    'deniol',
-    'deniros',
-    'denison-type',
-    'denisovich',
     'denita',
-    'denitrifying',
-    'denizer',
-    'denkaring',
-    'denkavit',
-    'denken',
-    'denker',
-    'denkies',
-    'denknetzeyans',
-    'denli',
-    'denlike',
-    'denly/neighbour',
-    'denmans',
-    'denmark-based',
-    'denmark-russia',
-    'denmarke',
     'denna',
-    'denne',
-    'dennehey',
-    'dennehy',
-    'dennell',
-    'dennerie',
-    'dennet',
-    'dennick',
-    'denning-type',
-    'dennings',
-    'dennis-going-to-the-toilet',
-    'dennis.',
-    'dennis/science',
-    'dennis/thames',
-    'dennison/oxford',
-    'denniss',
     'dennonvilliers',
-    'denny\'',
-    'denny-falkirk',
-    'denny/hollocks',
-    'denny/landlady',
-    'denny/publican',
-    'denoel-gonthier',
-    'denoltabs',
-    'denominating',
-    'denominationalisation',
-    'denominations.s',
-    'denominator-dominated',
-    'denoon',
-    'denora',
-    'denorionum',
-    'denotified',
     'denotra',
-    'denoument',
-    'denouncement.',
-    'denouncer',
-    'denouncers',
-    'denpasar',
-    'denrees',
-    'dens-canis',
-    'denscombe',
-    'densdark',
-    'dense-celled',
-    'dense-grained',
-    'dense-growing',
-    'dense-textured',
-    'densely-forested',
-    'densely-printed',
     'densely-stitched',
-    'densely-stocked',
-    'densely-textured',
-    'densely-wooded',
-    'densely-worked',
-    'densepack',
-    'denser-liar',
-    'denser.',
-    'denshering',
-    'densified',
-    'densiflora',
-    'densify',
-    'densipollenites',
-    'densis',
-    'densitometrically',
-    'densitron',
     'density-',
-    'density-averaged',
-    'density-averaging',
-    'density-dependence',
-    'density-driven',
-    'density-graded',
+)
+
+blocks_81 = (
+    '(&-shape(%ions/)%ssent&&yingly%#ger$%kerne%!s$%orney#&d-like%\'y-gwynt$$dace(&/chief%#led$"e\'%)ly-carved',
+    '))uplicated((executed((lettered)"it(&penned%"ns$"ge%&ington$"ia%!q%(t&eacute$!s#*el-looking%!l&!e',
+    '%+ty-kindness\'$free$%t-set#"ff$%tiest#\'ggleton##ibh$$cial$$dlin$"ks$*se-control\'%level\'(missiles\'$ship&$.the',
+    '&\'254+n/a&%liner+!s&%phone&(r-racers(&shaped\'\'/racing&%watch\'#ear%)ing-speed$"te#!l#-mb-collection&%patch&)scattered',
+    '\'(tructure%#ing%\'leholme&#ies\'*ng-looking$(eniferus$$horn(!s$$land%*in-trained$$mery&!y$#ped%(le-faced)#ree',
+    '$!s%$ters$$well#)nch-point,!s\'$time\')you-upper&%/lead&#ier\'"ly\'$ness$#den$$ella$&kleton#%ppers',
+    '$+ader-states(&.royal(+s-portadown&.ing-journalist*(spirited$+h-barriered&$land\'#oad&%proof%(barriers%)ed-pumice\'!.%$ings$#oes$)t&mdash;a',
+    '&\'l-scale%%iness%(scrapers%&y-free\'\'grunger\'$type#(tch-stop&"er&%field&%piece$!e$%hirds#(x-andrae$#ton##yft',
+    '$!e$)fisheries$!i"!w#(ee-crwee%#tuu#%other"$x-24"(y-babies$#off$#sis$!y#3/invocation/cursing##ans#!e',
+    '#%field##igg$"ia%!b%"ia$#ng.#%mbles$"es$#ych#!o$&conite$-globulinaemia,!s$(hydrates("ic',
+    '\'!s&#val$+precipitate\')servation&)otectants+"ed$\'service%&ophila%#pec\'"ed%&urgery$$tech%$ubes#$psis%"ls',
+    '%%-room*!s%!/%"al&&nalyst\'"ds\'$thus%%icity\'#ole%0o&rehy;sporidium&)-amnesiac((narchist\',cartesianism)\'tholics()hauvinist',
+    '()ommunists(*rystalline\'*industrial\'$jews\'&market\'-post-feminist()rotestant\'(royalist\'*scientific&(coccosis*"us&#gam\'(landular\'%rahic)"ph',
+    '&\'logical&%meria\'$onas&!n\'#yms&%pygus&#ses\'\'pyridia#!s$)anthemums$"ta&,l&rehy;clear-%lises\'&(1980)\'!-',
+    '(%based)#lue(&coated*(ntrolled($free(&grower($like($melt(\'stemmed*%udded((wielding*&reless\'#ate\'"ey\'\'isation',
+    '($inum)$sers)\'zations*#ers(#oid)\'rophias(!y\'"s.(+/resonators&!t#\'talised$"ic##uff!(s&rehy;2"(-context',
+    '#%shock##tlc$#ype"!0"&336630""40#"zx"$9000%#1pc"#a-a%!\'$\'binding#!/$#csa#!1',
+    '#!d#!s"&c-free#!c#%e-for#!w""dp""e\'#!/$#gce#!c$!s#$nger\'!y##pel',
+    '$"ka$#nai"#f-1#!r""hh"3icsery-r&oacute;nay#!e#-kszentmihalyi#!l$#lag%"ik"#kac""lb"%ma/cd#"s3',
+    '#&&amp;y#"pd"$o/ng#!b#$ndor##rna""ra#&g/bsdi"#s-2$#x-4#!o""ta##eep#!j#"rs',
+    '#!*#$-ers#$s4-c"#wip"!x"$zaba!#t-2#\'caratex#(directed#\'gastrin"#/ct""01""13#!6#!9',
+    '"!4"!5"&a-2000#!l"#b36"0caagccactgctggag$#tga#0cagttaaaccacctac#8tgcatcatttagccacttctctaa"!e#%nidia$#oid%+pharyngodon\'#ora)!e',
+    '"!f#%/nf-1"$g.gt#%aacat#&ggatac%=gaggcgacccctccccccttgtcccgact"\'hulhoid&!u"%i/mvp#!s$#lav$!s"*l-mediated#!r"!n',
+    '"*p-synthase"(rl+&larr&$rarr%)alt+break)&delete)&insert%%click%#end\'#ter%"f5%"pg%!x$!-%#alt($-del',
+    '%#k-k\'!n&!d%!r%!z$(/alt/del%!c%!y$&=break%%click#!y""te$!e!)u&lsqb;id"#(i)',
+    '##oh)"!+"*-as-pyrite#"ic#%mo-au#%zn-au&"pb(#-ag%!o"#.cm##ft.#)m/ha/year%$year"#/kg#%mmole',
+    '""2+"#a91#&dernos$#ros#%ilnge$"st#$lann#&navale$"za&&-bengo#%ranty$#tas%!e##see#&tioned',
+    '#\'uhtemoc")b-hunting$(reporter$&scouts#%a-ctc$$hiro$+n-americans&%based&\'caricom\'(hartered&\'spanish&"us%+a&mdash;cdc%!e%!o',
+    '$#tur#%berly$#ies%"ng%"tt#&e-like%&shards&&leeves&$tock$&master$$nsis$!o%)ctahedron$$rtin#\'ic-foot',
+    '%+le-cupboard(%sized%*structures%#ula$"es$#llo$+st-futurist&!e&"ic$#tal#&master$\'istress#%ozoan##uto"\'camonga',
+    '#$cini#%hinan$&ulainn&$lain#&ichair#!k$#ham$%oldry%$o\'ed&$-bee*!s(#ird\'\'flowers&#ism#!o',
+    '$%lidae%$lata&"ia$)mber-like%"is$%racha%(bitacins)!e"%dbear#(d/stable$*esdon-like$#ing\'#ton$$leee&$some',
+    '%(y-duddly\'\'looking#"er##ham##joe#$nell#+worth-flint"%e-bic$%cards$"in$$line$&sheets#!/#%board#,card-readers',
+    '$"lo##men#%rdale$&navaca$!o$#pos$)vo-vinent#$smes$#ter#"va"#fay#)f-buttons%%title*!s$!e',
+    '$!y"#gat##gly#&ullere"!h#*-cuh-clean"$idad%!r#$gear##lin&!e#)r-bouilli$$aing%$sses$!e',
+    '$#hes$#ick%$nary&#ier)!s$#ses$#tot#"tt$$ural#)vr&eacute"!j"#kor##ura"/l&rehy;minating#$-de-',
+    '$"te&#llo##bin$$lean$$oons#%cairn$#hie$%reuch#!d$#ees#!e$#bra$%mborg#)ham-based$#wch',
+    '&\'nomyces&%vorax$"na&$ires&$rily\'(y-minded#$lams$,en/defending\'&mother\'\'unipart&%swood%%onard%$ross%"tt%(y/animal',
+    '&!s$*iford/wife%\'gan/air%-more/campaign*&farmer%#ng.\'!s%"on%!p$$mann$"om$$ular%(therapie$$wick$&yhanna',
+    '%!r$,in&rehy;ated&$gton$*ne-seymour#%nahna#*otte-skirt#&pepers&$pers$"in$$rit.%"yt#$quha#)s-de-four(%paris$!h',
+    '$#(s)$+-associated%\'centres&*ommunities%&figure%#jah%(littered%$poet%$sign&#ong%/turned-flagship%\'viewing$(/d&amp;h$!e%#lli',
+    '(!s%#rty%"ys$$hord$$igen%#ral%(vability\'$ted.&!i%&weeder$#ram$&urable\'"is\'.l&ndash;social(,-educational',
+    '))religious)Asouthern-hip-hop-folk-ethnic-funk(%/arte)-communication)&ethnic)&racial($ize\'(2ly&rehy;determined0(mediated*(-defined-\'pendent+)engrained+&loaded+&marked+(specific',
+    '\'"ti&-e&lsqb;1&rsqb(*rehy;bound\'!*(!*\'%-area)Rs-an-aspect-of-nature/culture-as-an-aspect-of-mind(+boundedness)\'uilding(\'centric)\'hanging)&omplex**nditioning+\'trolled)\'reating',
+    '($fair*&voured(#gap(0krill-harvesting($less(&nature(%proof(\'related(&shaped*#ift)+pecificness)$tyle(,transmitting(\'vulture/!s',
+    '\'!.(!l\'$/pop(\'society))tructures\'#_as\'(ideology\'$less\'(s/groups)*structures#&verhay&"in&&thorpe\'#ing&$well',
+    '""m-$(workshop#&/cause#$ainn$"ns$&rasamy$"te#/berbund-wearers&\'minster\'%ounds&+nauld-based&,some-looking$#ies$"le$"ra',
+    '%(ia-based)$uilt\'+/lancashire\'&n-born##ecs$#lla$"ne$"rs#%freis#+i&egrave;re$#dge$$eres$)n-scented\'%piced%(g/senior',
+    '%"yn#!m$Ya-cumma-cumma-dum-do-be-do-dum-dum-cumma-cumma-dum-do-be-,0dum-do-be-do-dum%"ge$!e%!n%&rbands$\'in-seed&#ity$#ock$"yn#/nor/oxfordshire#$onck#\'parsita',
+    '#$shaw##uli%\'o-domes%*us-covered$&ppance".n&rehy;ningham#!a$!n$%rders#+cliffe-owen$%tator#&darder$#ell%$rdin#$edda',
+    '$%gonde%$unda$"ne$!s%"cu#!g##has#&iberti$"co%$ulus$&nghame*!s##ner%!s$$igar',
+    '%"n\'&$gest\')ham-craig+\'jardine*)/children+\'general+(hospital+&mother+\'trainer*"ii)!n\'*ly-written\'&sworth$"on$&yngham',
+    '$%belin$&maglos%%orous\'"us##red#!s#&t(ona)$\'-struck$#ish$$meat$$rair%"e\'&"ra%#ies$!y',
+    '#!y$&nghame"$omos#"ng",p&amp;league$%mdash#!\'#+-and-league(&saucer$)clinching%(onscious$(european%\'xterior$(fighters)#ing',
+    ',!s$&marked$%nests$\'painter$%style$%tondo#$.how#!/$(european$%flour$&league$&saucer#.ar-springfield#*board-full)%lined',
+    ')0under-the-stairs(!.(%/prep#%cakes$#hik#"el$+rtino-based##hea$&olders%"ok#%iagua("-2)!3$%d-bow&%woven',
+    '$!o#$less#!o#!p$"a.%!m$#ery%!s$"in$"le&!s$!y#$rate\'!s$$eous',
+    '%$thol$"ic%"ja%"na%"te$(o-nickel%#ine#(s-of-tea$!.#&tondos##ula#\'winners\'#ing"*r&eacute;s$)rehy;rent',
+    '#!.#!a$$bell%"ly$"gh$!m$%ndera)!s%#tur$#ray%\'e-based$!s%&savica$!t%+e-assistant',
+    '&,ve/treatment("ly%$ores\'%ially\'%ships$#zin%"zo#"b.$\'crawler+!s$"er#$ches%#ill$$inus$%uligo',
+    '#,d&rehy;white$%-like%%white%&yellow$(blooding$"ed$"ie&!a&!s$#ler%!y#"e\'$!-%\'centred%%house',
+    '$2/alleviate/prevent$#lty$"rs$#tes#,i&rehy;osity$&alists&"ly%"m.$\'e-weiss%#use$#nan$"o-&\'sellers%*biological%&risity',
+    '&,ity-oriented)!s%)us-making)%inded\'%ities\',ly-conceived$!t#(l-haired%#tip$.ed-up-with-age%&w-loud\')sandpiper$$iest%"n\'&$g-up',
+    '$!m$&papers$"s.%+/waves/body%#don$(y-blonde\'&rimmed&&coated&&permed&&tailed&%wurly%\'/frizzy%&headed%#ish%$tops',
+    '#$nock\'\'/access%$nsky#$phey#(raghmore\'!s%!h%%llone%(n-petris&&/music&&t-free%$wong%!y$!e%&ncies*',
+    '((-dealing+)nominated)&option)&paying)\'support)\'turmoil():bahamian*&ermuda)(lebanese)+netherlands+!w&%t(3).("c)\')-creating(*generation',
+    '(&period(%using((weighted\'(.account((limiting(/record.position\',/capacitance(\'deposit\',ly-available**celebrated*$used\'"s.(,/capacitance\'!y$,i&egrave;res',
+    '&$ulae(#um\'*+-controlled+(deviance+\'general+)in-action+#led+(on-offer*(/library+%whole+*year-group%#dge%&e-like\'%style&!.',
+    '$"uc$*y-coloured(#mbs&&eating&$face(\'vouring&%house&&powder,!s&\'scented%(/captain%$comb%$face#$se/d&"to',
+    '%"d.$"in%#ter$\'or-type&-blinkrate=530&#ius$\'us-type#*tain-calls((darkened(\'holders($line(\'muffled(&opener($pull(%rails',
+    '(\'walling)#ire\'&cracks\'&raiser-!s\'"s.%"na%"te$$eisi\'"ye%!r%#sly&!s&!t$$hoys',
+    '%"ei&!s%\'s-brown\'#s-s&+/cheltenham\'$home\'%marsh\'(resident&*s-electric%"z\'##ule$&ndoloc#+vaceousness%"ta$\'e-edged',
+    '&&shaped%&d-wave%"s-%!t&$ting%!x#&yously#)zon-price"+sack/oxford$$mano#-catl&aacute;n$$uses%&taceae#&hendun$"ie',
+    '%#ngs&%stown%(on-cover($like\'$flor\'-ing/stability\'$less(#ike%"te$#man$#nie$#way#\'iana-2a$"ne$#ons',
+    '#\'p-cleft%&mantle$&/cleft$&idatus%"us#,que&ntilde;o/!s#%sedly%\'ll/game%!n%!s$$ings&!s$#ler#*tard-apple',
+    '($free$#ine$#nie$!o%#des&%ially(&nships(!t\'"es\'#tur%,m&rehy;built&&-blend($ound(%uilds\'-configuration',
+    '\'&design\'#fit*#ted\'$make\'%order,"ed\'\'painted\'(tailored(#ype\'\'written&%/toll&2er&rehy;contractor(!\'((-address)%buyer',
+    '*\'ontract)\'defined)&facing*$ocus*+riendliness)&minded)$name*(ominated)*orientated)%ready+%lated+(sponsive)\'service0!s*(pecified',
+    ')*tailorable(\'.claire(!/)&actual)$bank*%roker)&client)%staff)+transaction)$user(#_at("s/*,clients/your*9patients/pupils/incidents&%house',
+    ')!s\'$zing&$line&!m&*s-approved(&exempt($free(%house\',/immigration(\'rituals%!n$$umal\'"ry$"ys"+t&rehy;away',
+    ')%price#!\'#!-$,and-assemble(&pasted(&splice$&corned%&rystal$&flower$)glassware%$rass$"in$#mid$>off-his-nose-to-spite-his-face%!n',
+    '%%urses$&string$$tile%(o-length\'%shape$%water)!s#%/meon#+away-collar#&backs.(!a$%locks$#ush#"ch#%downs',
+    '%\'looking$&nesses#%glass#!h$&bert\'s$&ertson$#ill$%swith$$wine#+ical-chitin%*le-remover$&rubrum$!s$$vate#-lass-wielding',
+    '#&master$#ore\'&-smith##ody$$mers$#ver#%price$%urses#%s.tim$#/no$(:doctors$"em$#ide#%taree$&er-bar',
+    '\'%miles&%block&$head&$idge&"s.$&hroats$"in&\'g-board(2off-head-strangers(%short\'+/collection+&ouring(%small)\'peaking)&urgeon',
+    '((/swindon$\'le-fish\'%shell&!r&!s#\'umnatis#%worms"!v#\'&eacute#!2#%erian%%ville#$oald"%xtone"&yahoga',
+    '#$pers"$zcos!#v\'s""-1#!2$"40#$dors"#270""35#!7"!6"!7"#a01"*iji&cacute##tan',
+    '"1p&mdash;christian#4/pdc&mdash;christian%"sc#!e"$r(t)#!d""ss""ts"!w!\'w-2mark"#/gl""11#!2"!3"!4',
+    '"!9""as"!f""ho"!k"!l"*mfelinfach&\'linfach##hir#(llinfell#$parc#(sychpant#$tawe#"wd#\'ystwyth',
+    '#"in#\'tillery"!o""p1"!r#&t-mawr"\'sw/nccc!)x&formula"!3"!4##86s&!e$"7s"&878slc""b5',
+    '#!7""cv"&d-2562#!6"!e"#iii#!v"#li.$"ii$!x#!v$!i%!i&!i"&oroner',
+    '"#vii"!x#!i$!x#!v$!i#"xv!&y-pres"#aan#$lume#&mopsis#"na$#eas%"ka$$ide-',
+    '&"in(!g%"ne$&ocorax&&rylate%%ethyl%#gen%&l-blue%&phytes&#ica%\'stictus$"us#*thophyllum&&stomum"(bemetics',
+    '&&groove&$punk&\'samples\'\'trength%$feed%&hippie%.n&eacute;tique&*etic-based%&optics%%query%(surgeons%%tippy&#ron#\'org.doc%$tron',
+    '"\'cadales%&eiodes&%oidea$!s#!l$%adals&+ic-inspired%%mates&\'en-pink%,se-guanosine\'!s$"e-&!a&,length-based&*regulating',
+    '&*sequencing\'%treet&%track&#way%!/&#min&$walk%$path)!s%%route&!s%"s/\'&second%,way/footpath1!s',
+    '$&ic-amp&%ality(!s%)guanosine%%morph%!n&*-dependent&$ders&(g-groups&!s%#sme&&t-only\'"es$"ng$!o',
+    '&&hexane&+oxygenation%)acylating&&lkenes("yl&"se%&butane%&carpum%-dextrin-based%$heat\'2ximide-insensitive("yl%%mania&(orphosis%+ne-affected',
+    '&(yxgenase%\'paedias\'#ths&*entadienyl*"ne&2ropylaminoacrylate%%ramic\'"na%&serine%%tella&"is&$omic$\'ysation#,oming-simple")der-royal',
+    '#"ia#$onia"!f#!.#!a$$rtha#%odwyr#%rewas$"ol"#gne%!a%!s"\'hyraeth"%keman$!s',
+    '$$tank"(lchgrawn#)icocyclus&+dontophorus&)stephanus$)nder-head-!s)%mower)$seal*%haped)+to-cylinder*#ype(!.&,rical-shaped+!.',
+    '-\'-shaped\'*o-conicals(\'phyllum%!g$&sticus&!s#%opean$%toxic""m.#\'adothea$\'flowers$$tics%&ogenic&\'phlebia#,bal-and-drum',
+    '%#rum$"ra$%ydoll#"er#\'fforest#"io#&mrodor)#ian#!o$!n$!r#%ptoms#$raeg$+u&mdash;see%&/green',
+    '""na$#mid#$coed$$rona#%drwyn("yn$!y#&eberht$%heard#$fedw#)ganeddwyr$"en$%hordy#$icus$#pid',
+    '$$scus#&llunio##nar#%odont("ia$#gen$\'logique$&nville$"ps$#que##ric#$thie##wyl"(omologus#$sine',
+    '#%hered&#ing&!t$#oma\'$ndra$"us##rea%)s/breeder&)s-scented)&tudded($wood$!i%#ana\'!o\'"us',
+    '%"ni%(ot-greek\'!e%&pedium$\'us-amax\')frankfurt#%selid")r-l\'ecole#"an#\'enaican%"es#"ff#%iacus$#lla#!o',
+    '#&tocara"$s117$"57##248#-t-jejunostomy%$like$\'adenoma%!l$(ectomies%"ic&&ne-hcl$#ica%#ene%%nuria$\'ocaulus',
+    '%"id\'"ea(!s\'!s%(metogram%\'scopied"&therea$%ioate#!n#(oarabine$$cell%\'halasin&&emical,"ly$0fluorimetrically',
+    '$+geneticists$(keratins%/ine-stimulation(#tic$%lysis$+meglaovirus&)halovirus&(trically("y.$&pathic((ologists%$enia)!s%(hagaceae%1lasm&lsqb;12&rsqb',
+    '$-sine-5-fluoro%(keletons%\'plasmic%-teatonecrosis&"om$*toxicities(!n%,rophoblastic/!s"\'ubahiro"#var"&winska##ydd!)zachowski#\'plinski',
+    '"$e300#&ch\'kia%)-austrian&%built&%latin&-o-slo-vak-i-a%%/east%$born%"ed%%lands%$mate%%o-mor*%avian\'(slovakia&)lslovakia',
+    '(*ovak-based-&german-#usa,,ia&mdash;for.(-germany/\'hungary.(/hungary.,n&rehy;built/(-english/!s*#kia&$wski%(slovakia$+koslovakian#*rniatynski',
+    '$"sk#%skawa$\'tochowa"!g"$ipra"!m"$udek##rda""wg"\'ytelnik#&zewicz$!k 0d&aacute;0mareta)"in#(elig;nor',
+    '#2macr;mar&amacr;tos$$p;eg&&subt-1#&uml;hn\'(mmergung(%pfung"&bsol;c"&dollar"&eacute()/d&eacute(1;0m&eacute;0trios+(areteion+"os)$abes*$cute',
+    ')*b&acirc;le*#ats*#cle*&onaire0$ment4!\'0!s0(t&eacute*(rouiller*\'utantes,"ed)\'cadents*"h.+&elette,"ts',
+    '+!u*$ider+$ller*(laration,)ss&eacute0\'grave;s*!o+-llet&eacute;e+/ntract&eacute;e+(r&eacute,!a-#tif,!s+)up&eacute-#age',
+    '0"es)+f&eacute;ra*(aillance,"te-$isme*$endu*$icit+&nition)\'gorgeur)!i),j&aacute;-vu1#_vu,)grave;-vu,&uml_vu*$a_vu',
+    '1$ment+,mit&eacute;s+"re*"os*#uge)3m&eacute;nag&eacute*&arches*#ent*&ission*6ocrate-chr&eacute;tien+\'lisseur)"ni+"se),partementale-\'mentale',
+    '*$eche*"ot*)ut&eacute3";s)+raisonnable*#ive-!r*-oul&egrave;de-%ement)&sastre*+enclavement+"rt*5h&eacute;rit&eacute;e*%iller+!r',
+    ',"ez*.ormi&egrave;re)\'tergent,)minations*+ourn&eacute)-velopp&eacute6";s#0caron;tsk&yacute$#irc\'+;mocratique#)grave;bes)$crit)&jeuner)&luding),p&ecirc;chez',
+    '#-uml;partement"\'formula"$gt;a")icirc;ner"\'mdash;4(#no."*ndash;1.23*!3(#2.2*"55*!9(!3(!a)#qui($cdlh',
+    '(!f(!g(!h(!i"+oacute;ttir#(uml;blin(#ner\'(derleini\'/ppelg&auml;nger"+rehy;shaped"$sup2"*uacute;ath)$chas)&n-harg#)uml;mmler',
+    '*!s(!r("st\'*sseldorfer/!t*(sldorfer";yacute;rafj&ouml&dstrok;3ur2$;dur!,\'&aacute;gua#)eacute;at*&couter+$ueil*.l&eacute;phant+&aborer+\'oquence',
+    '*&pernay+&inards*-str&eacute;es*$tage,"t\'*)valuation+$iter$)circ;atre)$tre\'#)oelig;uil"!\'"(-a-r-c-y#"f\'"!/")abbeville',
+    '$!o%&ndance$&rizzio#\'ccident$$hard$#ier$+quapendente$\'tuaires\'%liser$$unha##dda$#one$&resser#.ffaire/albania(!s',
+    '#\'gostini%"ty$)riculture$#uia\'!r&%taine#(iguillon\'"sy$&lleurs&!y$#mer$$rain##jou#+l&ecirc;nes$"be',
+    '\'\'querque$$camo%#ool$)embertian$$fred$#ger$(lumettes$%meida$\'vadorez#%mante$*bassadeurs$$elio%(ublement$"is$(orefatta',
+    '$\'usement#&nalyse$(dalousie%,lau-hombourg%\'rinople$+g&eacute;ly%/elo/co-director&"rs%%hiera%\'iviller%#kor%%uille$$necy$!s%+embourg/aid',
+    '%(revernes#\'phanize$%icius$*r&egrave;s%"es$\'titude/#&quebus#+rby-neither$&cachon&#die&%ngelo%)haeologie&\'eologie\'!t&(itettura',
+    '$$ezzo$#fet$&genson$%ianna%%ettes$(lincourt$*m&eacute;e.!s%#ide%#ont$(nouville$+omatherapie$$pino$+quebus-like$&sonval',
+    '&$stes%#ois&$uste%!s$#zew##scq$#ino$&perges%&remont$!q$$saut%!i%&urance#&ttente#&ubigne',
+    '$(revilles%"ia$%teuil%"re##val&"os%"nt\'&-garde%"ux$$enir&"za$*ila/deputy(&labour%#ron$#ril',
+    '$#ous#&zeglio$$ione$#ure""d\'"!e#$cole&$ogie%#sse$#ran#$ffet#&lboeuf$&ection$#ide#!n',
+    '$\'durance$"ea$%fants$#nui$+qu&ecirc;te$%rayer$&semble%%ingen$&tendre&\'rprises%&repise#\'paignes%$rgne$(izooties#$quip',
+    '$#lon$*rico/pilot%\'oymendi#\'scargot%&lavage%%ossan&"to&#urs%$ures$#lon$\'manault$,p&egrave;rey%%ailly%%osito$(s&eacute',
+    '$!t%)erre/head%%ourel(#nel#$tate&!s#%vrard#(xecution%$rcer$%ister$/p&eacute;dition%&ansion%(loitants%(ositions$,tr&egrave;me',
+    '"1fautralla/trainee"%ghies".h&eacute;siode$\'ocirc;t+"el#*ancarville$&rfleur$*ussonville$\'villand#%erbes%$cule%&itages#\'illiers$!v%"er',
+    '$&ffmann$#ker$&llande$$neur$(rlogerie%$reur#+uddersfield$\'manisme$%ysser#,y&egrave;res$#ber",id&eacute;es$,entification#\'maginer$(primerie',
+    '&&rville$*dependence%)ification%&ustrie$(fanterie%&luence%(ormation$.g&eacute;nieur%(hilterra$(itiative$*scriptions$3t&eacute;r&eacute;t%)ervention$-vestissements#&sernia',
+    '$"sy#&xelles""ja#"ew"+l&eacute;na"%monte"&neistr",observateurs*#ion#"c-$&cident#(enologie$!x##ger#%ignon',
+    '$#lly$"se&\'llemont#\'lbreuse$#ive&$iera#$mbre#&nofrio%"re%$trio#&ptique#,r&eacute;don$!a$%bigny$#cia',
+    '%%illes$#feo$"ge%"ue\'"il$$ient%$uoli$%nelas$"um$(villiers#%ssola##ulx#)verbroeck#%xford##yle',
+    '"\'rozario"\'uccello#$dine#"me#"ng$#ion%"te%!x##rfe$"so#,tilit&eacute"&warden"&y\'know#"eh##ork',
+    '#$quem#%vette!((&num;4)""a)$!n##-t)"-catgacgtcatg)#(gattgcg)$\'caatcg)%&xxtcg)$\'xttgcg)"-gacgatatcgtc)"#ii)#\'j)&gt;0&$lt;0',
+    '!!*"$zire!%-(5)f"#110#!4#!5$"00#"6h"!2##000"!3##0sn#!5""41""54',
+    '#!6##800"$8557"!a##jie#)ll\'s-well#+minobutyric#$nd-c$%tigen#)spartate."(blinkers"$code#"up%!s#*ycloserine',
+    '%"id%!o#%ay+33#(eficient$&signed#-iaminobutyric&#ond$\'fferent$$nner##own#%udley"$efte##glu##hen$"uk',
+    '"#fet##orm"\'glucose"#i-g$%y-use#5n-the-fourth-position$#put##yer"!j"\'latches##oop"!m#"ac##obs"\'notices',
+    '#\'rbitals"-penicillamine"!q"#reg%\'istered##ust"%s-ing#$hape#%tream%#ing"/thiogalactoside#$uner$+rbocurarine"$word"$zone',
+    '##005$"33##241##446%!7$"74$"83##503$"68##608%!9$"16$"25%!8$"35',
+    '$"40$"50##770$"95##805$"27$"82#(9.1.11.5$"60%!6""28""40"%5/180"#725#"35',
+    '":a.e.h.r.e.v.o.n.o.t.t.u.b.$"j.")b.sweeney$"w.",c.&ndash;new$&-based$0/cleveland/saint$!3$"l.$"t."#d\'a##.t.##ave"$e.a.##ng.',
+    '$"t."#h.5$"b.$$r.b.$"s.&!s#)ardcastle#%ughes""i.$"1.$#l.s$"s.&#c.o$*v.o.r.c.e.#"sa',
+    '$!s"%klein"*l.cockroft$"f.$"w.#\'atchman##it."#m.u#%eijer#"us%!."$n.a.$"f.#$eill""o.',
+    '$#b.s$!u"$p.b.$"r.#(ostgatei""q."$r.l."#s.c%!.$"e.$"m.#\'inclair"$t.p.#(ech.hons#"he',
+    '"$v.r.$%santi#!a#"ii"#w.1$"f.$(simmonds##ood""y.#%akuba!+/00/22/0003&&3/0044($2053)#152*"70',
+    '+!8*"80+!1+!9*"94+!8)#211+!7*"22+!6*"33+!7*"40+!1*"52',
+    '+!5+!7+!8*"75+!7+!9*"82+!9*"92)#301+!7*"12*"35+!8+!9',
+    '+!8&&4/2008+!9*"12&(6/0003-4*"57&&8/0004#)1/23/0039#)2/25/0000#)4/25/0000+!6*"10+!1+!2+!3',
+    '+!8#)6/25/0001+!3+!4+!8+!9*"13+!6#)8/25/0007+!8*"22+!4"#bos"%chief"!d',
+    '"(mx553308"!p!$0280"!3#"10"!4"!5"!6"!7!%1,477##805"#.12""00#"30"#1/1',
+    '#!0#!2#!7""20#!2#!4#"54#!7#"ms"!3"!4#!0""6a"#771$!7',
+    '"*80,000,000#"93""p2!&2&gt;d#)mdash;011)#100"#*12"!.#!1"!0#!1#!2#!6"#112$!9',
+    '#"38#!6##s55""5s"!7#%3-10b"#914"!s!"3+"#-f5"*00,000,000$!0"!1"!3#!5',
+    '#"20#"62"#586""67"!8#!6""a4!@4&verbar&verbar;g6&verbar&verbar"$,080""00#"59""13"!4"!9!%5\'gmp',
+    '"!0"!1#!9"!3""46""50"#705!"6+#!2#!4#!6"!0"!6#0&mdash;democrats"#798',
+    '#"10$!2#"98"!9"#x10!$7523#"60"#671$!2"!7""81"$nic1!"8+"#/dt""00',
+    '""10"!3"!4"!5"!6"!9#!9!+9&ndash;d10"!0#"00#"16"!1#!1"!2#!9',
+    '#$0316"!4"!5#!0#"31#"53"!6#!0"!7#!8"!8#!1"!9#!0!(:context',
+    '!1=&verbar;d&verbar"!2"!3#!4"%430mm"+established"#f/n"$pawn!$a-91#%da-da(C-da-da-ra-da-dada-da-ra-da-ta-ta-ta*\'i-da-da)!m%!t$%ee-da',
+    '#$nang#+pu-ri-to-jo"!1#"6v""20"!7#"83"%aaaad&%rling$!d#%hling#!l#&ndered##rik")b-dabbing',
+    '#%angwa$!r$"te#%bings$#ott$"us#%chick(%-bill(!s$!o#$doub#$eiba#"it##len%!r',
+    '##ney#!o#\'rendorf#%tiyah#"ub#%ydeen""c2#\'hilleae$#sie\'!s%$tein##ias$!c$"er$#tes',
+    '#&re-fox$%ydium%%myces#)tinomycin$!u$"yl&%ifera&(ogyridae\'$pius\'&rrhiza&!s"%d-dad$\'figures$(of-three("wo',
+    '#!.#"a-%(lettrist$+/nihilismus##dae$#eee$!i%!e%!n&$gton%!o$"ry&&shield$!s$"y\'',
+    '&+substitutes##ely#$ford##gad#!i##ley##oes$$uche#%tylis#!y"$e\'n\'#%-sook#$arth#&dalus.#+mon-haunted',
+    '(%unter\'&masked+!s\')possessed\'\'slaying&+ette-tongue&&hunter&&ologie+"st\'$rops&&slayer#%niker$!s#!s#&twyler',
+    '")f-leyland#!.##ang#%farra$&ection%"rn$"in$#ley$+odil-yellow#$orno#%riche##tly$!s#!y"*g-hess-tan',
+    '#$/pkc#!a$!a$#rti#$bani$&laddet%"od#&centra#!e$*nham-built$!r#(genhurst%-r&rehy;shaped&%-bill+"ed',
+    '\'%fangs\'&horned\'&shaped*"rp\'\'toothed&#men&"s-(%drawn$#led#.hestan-quality)!s#%idder##las$#esh&!s',
+    '#%nasty%!w$#ell%!r#"oe$"ri$!s#"ri#"ue%%rrean%!t#&worthy"-h-dah-dah-dum%"um#/agram-angarpota',
+    '$&yeeyah#!g#%istan#&l-beck$$beck$$eeng%$rus.$"in&"gs&"ks%!s$#man$"ou$!s%#tom',
+    '$!s#\'nendorf#!o$!k$"uk#!s#!t""id$&alaion$#ley$!o#"ei#$gaku##han%+tsu-powered',
+    '#%kichi$"on$"yo##lle&!y$+y-different&&mirror%&/every&&hourly&7weekly/monthly/archival#&machos$(en-icker$#ien&!r$.ler-benz-group',
+    '$%onion#!n$!a%#bot$$fern%#ord$"is$$tree%(y-footed#$rena$!n$!o$\'y-based&%class\'$ross',
+    '&$goat&(research%%house%$land%$time%%women\'"rk##sen$"hi$$sala$)y-crowned\'%utter&%faced&&shaped\'\'pangled',
+    '%\'/thames%(chaining##tch$"le%#ing$!z#!x"#jan%!i"*kanopolous$\'r-niger#"er##har$"il##ins',
+    '##oum#%shina#!t$$arin"+l-dominated#"25##ada$"nd%!i$.p-uliga-darrit$!u#$boni##den&!s##eky',
+    '$.r&rehy;rowneys%!s$$sbus%"cu%#ide%&people%&sandro&"io%$tour%%women$&y/55th&\'pegasus%%esque%#ite%#men',
+    '#%garno$*leish-like%-ish/blackburn)&harold((fatigued$$uise#&heroia#\'i-esque$%borka$"la&$ndia$&ndyebo%$noch$!o$!p',
+    '$"in##lae%+h-al-baraka%!n%#ras&!i%\'s\'-type&)-oklahoma&*/constance&%burgh&$ites%%turca%<way/davey/eastwood/thorogood$\'esandro$$icus',
+    '%!i%%nghoo$$mayr%$eier$"os%!w$$witz#&macija%"ne%.tian-murdering\'!c(!a("us\'"us$+eny/sotheby',
+    '$"on%"re#)nacardoch%"ir#"on#$rain$$eoch$-ymple/morland)!s#\'shannon$$land##try#$vand#*y-ferriera$(ell-type',
+    '$\'ngrydge$!s"-m&rehy;nation#!\'#!-$%aging$*controlled#!a$%clese$!d$#ge\'&!-\'(awarding\'\'causing\'&in-use',
+    '\'&to-the&".9&+/accidental&$able&"d.(#but&.s(scotland)act\'$-was$#jan$$nded%"ge\'!d\'!s$$reta%)i/weather',
+    '&#hin%-k-caparisoned&!a%!o%"ta$$turu#$bach$#ijn%"yn$"or&$enea$&reuses$$ulla%#rst#\'e-ellen',
+    '$!d$%hoods$$shek#$fool#"ia%!o$$etta$"ge$&nozide$!r%!i%!o$"sh&"el#)janovitch',
+    '#$mage%!m$(e-buster%!s$2ing/drying/erosion%;t-get-out-of-my-way-variety#2n-the-consequences%#you(&r-eyes$!a%#vit$!e%%d-all\'$fool+#ery',
+    '%,rncharnwanit$#oen%"sa#!o$%clean$#dar$%iseau\'#lle&%selle$"le%"ly$"ns%"te$#sel#&p-down',
+    '%&living%(proofers(\'tecting%%squib%)trousered$%/wood$&course)#ing$&ed-out$2ierre-sur-boutonne&!t%,ng.dependent$$lips$&martin$&nacion',
+    '&"rs#(sel-fish&$fly.$*on-charged(\'oloured\'(dripping\'#hop(#ued#"ur"(n&auml;e#"\'l#&-color$"yr#)a&iuml;de$\'-farber',
+    '&!s%!r$$kils$#lia$"se%,k&oacute;gar$#tar$#zol##by.%*/community#3ce&rehy;christopher%+-and-forget&$card*!s\'$lass',
+    '\'(omposers\'%razed*!y\'*um-martial&)dominated("wn\'$rama+!s&(enhanced&(friendly(#ock&%goers&1in-a-cold-climate(&spired&&motion',
+    '&$pair(&tterns\'"op&$rock&%style&%tunes\'#ype%&/carer\'#hic&&oddity&\'theatre%*hall-sized)!s%#ing%$like',
+    '%%nergy%)r-acrobat(%rtist\'%mimes&#ies&"ly&%shave%(y-dancey$%henko&!v%!o$!i%$enne%!n&&g-eyed',
+    '($girl(-in-the-aisles((partners($room(&school(\'teacher/!s)#ype\'&/disco\'"ly$%kerts#-delion-dotted)"ed%"rs$!i',
+    '&"st%!n%!t$#les$#ong$.ruff-afflicted)$like$%ugama$)y-looking%#ing#(e-gerous%\'mastiff$"el$%gelds$$hill',
+    '$,lectro-style*!s$$pack&!k$%sbury%"cu%$hill%#way$"tt$$wood#*forth-type(!s%"ss#/g&eacute;reuses$$-shi',
+    '%#ous%%r-can\'&filled(&raught)"ee\'$made)!n($oney\'$zone&&/power&%:anti&%mouse&,ous-sounding)#.he*#man',
+    ')\'ly-high,(poisoned&%point&"s.(#ian$#rus$!u#*i&egrave;l$&conius$\'el/vice&$escu&\'l/derby\'"es&(s/family\'"on',
+    '&#yan$"il$!k%\'enesque$&levich\'$skii)!y%#ian%+ov-danilyan%#yan$#oko$#sco%\'h-faced(\'inanced\'(operated',
+    '../german/french%&labour##jal#"ka%"li$$elly%!n%$shon$&gesang$"ly$&worths#$mare&!k##nan$#ell',
+    '%"tt%$werk%&zapfli$\'heisser$%ielle%\'i/woman$\'reuther$$ygal##oli$!s$"uk#"ra#)salarural$%cribe$&engiyn',
+    '%!r&#eau%$ttes%!z$#ken%!i$$okho#!t$(e&eacute%%-like%"an%(r/angler$!h%$orpe$!s',
+    '#$usia#$wear#"ya%!l%#tai#"za$#ega"$obao$"li##ine$"st##udi$"el$#kou$"st',
+    '"#p-t#$/cp8#"er#\'hnoides##len$"yn#+per-looking\'&suited&!s&%tutto$#ing\'$-rod$,le&rehy;grey&%-grey%$ings',
+    '#$tion#(utamodra"#qua"-r&rehy;381313#&abiner$"gh$!h$#ich$%korum$%malan$%wshah#+band-e-khan\'%ekhan$%hanga$%ourne',
+    '$\'y/chief&#eye&%flood&+oxfordshire#"co#*d&oacute;n$&anians&#oni$%istan$!o#%e-not$%cliff$"en$-gho-chvadhata$!m',
+    '#!f$$ield$#old$"st#)gahs-such$$onne#"ie%!s$"na%"da$#ole$#tis$#uss$$youn#,k&rehy;brown',
+    '*(silvered$&\'-moon$\'-avised%&backed)&ground&%eamed($rded&$lond*!e\'#ues&\'ottomed&$urnt%&capped&&loaked($thed',
+    '\'(mplected\'$rner&&urrent(&tained%\'dressed%)feathered)$ured&&lowing&%ramed%%glass*"ed&%owned&$rey/%%hared&(ole-eyed',
+    '%!i%(jacketed%&lashed&%eafed\'$gged&$ight\'#ned%\'natured&&ippled%&packed\'%inted\'&storal&\'illared&%urple%)ringleted',
+    '%\'scarlet&#hip&)tockinged("ne*!d\'%riped&&wollen%&tanned\'%sting&(houghted&%imbre&$oned%(vowelled%&walled&\'indowed',
+    '&#ood(#led$#/12$\'er-eyed\'\'skinned\'%toned%!s%!y$$gate%$lass%%round$&haired&!n$#ies%(sh-brown',
+    '%)y-clothed\'(panelled$%ness.($/day$(panelled$.side/filipinos%#tar$$town$!u$$wood#!l$)ey-ridden$$ing\'\'%-idea("no',
+    '(&parent\'"ed\'%hurst\'2ton&ndash;stockton*!-+&bishop,$uilt+\'crafted*%.name*%based*)newcastle%!x$#ton#$mani&$ovic',
+    '$"on$+stadt-based#)n-tootin\'$&brough$$dale%#est$&ell\'s.%!r&!s$#in\'&.g-and-patching($wool##oca$"de##pan',
+    '$#ach&$otta&!q%"ll$#ick%!g%%ngton%$ulat&!s#$sham$%ieres#\'t-board%\'heralds%&shaped$"ec',
+    '$%field%1ord&ndash;charing($ians$%haven$%ingly$"le$#men$$nell$#oll%,n/operations&!s$#rey%!y$"s.%#man',
+    '#(ulhadis.$"ma#%ville%"sh#*wen-bolton$)in-mendel&#nia#%yanto$!n$#ush#"zi"#sai#$chle$"om&"be',
+    '#!e#\'h-board$-board-mounted%&uttons$%dabaa%#ial%%ovdon$#een%"rs$#in\'$#man$)naksutyun\'\'tsutiun%#yam$!o',
+    '$"ur%!t#!i#)sault-sud((/fan-jet)#sud$#ell%)rtdefence%%ville$"in$!o%&nville$!u#%tards$"le',
+    '$"ra#%umius#\'vadanya#*ycladacean$&podius%%rocta$&uridae"#t\'s#+a&rehy;sets$!\'$!-%+acquisition%$bass%$call&%oding',
+    '\'+mmunication((pression&#ube%&design(!k)!s(\'troying%&filled%\'holding%&infant\'\'k-ratio\'#put\'\'tensive%\'logging%#net',
+    '%&points&4rocessing-and-moving%)receiving\'%lated)!y&#ich%&sheets&%ource&%ponge&&torage)"es\'\'ructure&\'wapping%%tapes&*hreatening',
+    '%(yielding$!.%,manipulation%$type%$with$&/index(\'ividual%)knowledge$#_as$\'base(s)(+-management)$word($.dir)#the(%/data',
+    '(#_by%"ox%"us$$cell&$nter%&orders%$raft&#ime$&files.$%guard$"id%$mage$#kit$\'logging$#mat',
+    '%!g$#pak%%hones%\'roducts$#rec$!s%$cope%+et/resource\'%s--in%%heets%$outh%%sette%,tream/robert*!s\'(ucturing',
+    '$$trip&$onic%#ype$&viewer$$ware%$orks#\'blygiad#!d#+e&mdash;new++synchronise$)-guessers%"of\'&-birth%\'pudding%&stamps',
+    '$$.the\'(roughout$!/%!s%6time/lexicographer/log$&:radio$$book(!s$)d-looking&\'product%$ness$$just$$mark("ed%!i',
+    '$!r$,s&mdash;view%\'/venues$Htargetfiredhitsmissesdownedkilledinjured$$wise$#x-m&!p#"hy#"in$\'scaceae##ner##ong#&ronech#*sun-owners#!u',
+    '\'\'related$!s"#ub-$$eney&!y%"rs%!s$$hill$"uz##del#\'elsberg$!r%!s#$gava$"er',
+    '(1\'s/son\'s/friend\'s((-at-home)&mother)$what(\'/father(%cards()s-at-home*+in&rehy;law&"ry$&leddau$"r.#%laire#%miers#!n$"ca',
+    '&!r&!y\'0/gloucestershire$$gers$%tedly%+ing-looking(\'ly-high%!s#&phines#$rade##son$#ter"(v&iacute#$-eed#!a',
+    '$"ll$!o$!r#"da$$ison#%elaar$#nay%\'dranath%)port/head*(prisoner$%relle%\'s:where$!x$)y/witness%#_et',
+    '##ico$&d&lsqb%,-and-goliath&$like&1starke/eyewitness&%weill("st%$/ayr&\'glasgow%6b&uuml;ndlert&auml;nze&(attersby%#eis%$hazi%!i&!s',
+    '\'!a\'#ich(#tch&*w-ventures%+sen-nielsen&$on\'s(*/assistant)&bishop))organiser&#son&"z.%"tz$)es-colley&*/associate*!t',
+    '\'(director\'&estate\'&farmer($ruit\'&garage\'&hannah)%ulage+#ier(%igher\'&jockey\'$land+%owner\'\'malvern\'(national((eighbour',
+    '(*xfordshire\'*psychology\'*registered(#oad\'&senior(%pider(&tation(&windon\'\'trading\'(villager((olunteer\',weightlifter()hitbreads$"ll$#nci',
+    '%%/alan\'\'viation("on&*baker/tear\'\'urglary&0chairman/british)$rlie\')onsultant&#del(\'veloper\'\'irector\'%river&#eye&*gloucester0%shire',
+    '&)landowner&\'malvern(&naging&%owner\'*xfordshire&&trader&$usaf%*on/british(,photographer(&thames%#tow##lar%#tov$"ec$"yn',
+    '%!l$!r%"in$*s-klosters%)/klosters##ros##set#"ut#/y&ndash;faraday$#dov"%wbarn#%dlers$!y#"el$!n',
+    '&$coal&(pershore%"es#"it##kin&"gs#\'n-dirty%%light\'$pped%(streaked%$very$)/duskward%(homeless$!e%"th',
+    '$\'patrick$$rise$!y##ood$"ud#.s/grandaughter$,on(bradford)&\'-porter\'(shephard\'(williams&!/\',certificated($oney\'&enigma\'%santa',
+    '$#ton\'!e##try#\'uaciren"6y&bsol;week&bsol;month$-mdash;because$+rehy;to-day$%trade#\'\'-bring#!*#\'--which$"12%!4$"21$!a',
+    '%(nd-a-bit%(t-a-time$-before-payday%&oarder&"ok%$reak%"ug\'!s&%ndles$%cabin&!p%&lients%\'olleges&)nductress\'(ferences',
+    '$(dreamers)!t$\'fearing%:ighter&rehy;reconnaissance%$rock$%girls%2lo&rehy;rucksacked\'!w%#own$&hockin&&spital$*in-day-out$#job\'!s$$like',
+    '%$odge$$mare$%names$!o%%f-the*%-week&!f%!n$%pupil)!s$&return$#set%$heet%%pring%$tage',
+    '&"is%$imer(!s%!o&2-evening&rehy;wear&$.day&$day-%&ripper)#ing%$utor$%visas\'$itor$$were%%orker#".a',
+    '$$meet$$none$%other$#the%$oday#-/agricultural%"ll%#way$,co-ordinator$\'evening$(lecturer$(managing$#out$%sales$%three',
+    '$$week#"=0#\'abeeyah$"ks$$nand#&course)!s##ell$"st#*glo-colour-"ed\')encrusted##kin##lay$&engths',
+    ')&saving*)imulating*&trange(!y#$mare$#ond#$part#"re$"ie$$ooms#\'s&mdash*$;she%(ndash;93$)\'n\'nights%&supply',
+    '$$-and%"my%"of\'!f&"ut$#.if%#ken$"/4%!6%!7%%hours%!i%-occasionally/%%weeks&!k',
+    '$$hift$"it&$ting#&timers$%o-day$#rip\'!s#\'walking$%orker)!s#"yy",zed&mdash;he$#ley##led#!s',
+    '#*zle-bright\')confusion\'(painting&$ment&"rs!-b&mdash;vista"$(uk)""++#"no"#-15##5ms#&double"$.h++"!1"\'2-based',
+    '""36"$601n".ase-compatible%"lv##uto"!b""cm""es"$maj7"%p-tag""su""to"$util"&viewer"!w',
+    '#4mdash;ass&mdash;mods))christian)\'details)\'history)*identifier*$nfo/#2ndash;3&ndash;201d*!s)"4s)!6*!a*!b*!s)!8#1rehy;3&ndash;209b',
+    '"$-125$"35$!o#!2$"00#&3/c-47$!a%%-197b#"4s%(/-6s/-7s##6bs#!7$"cf$!s#%9-15s',
+    '##arc#+restoration$"om"!."$/osx#$user""18"!2#!0"!5"$6525"$9015##100"%a/rft#+c-organised',
+    '""ca"!d#"-6#!s"\'e-based$+competitive&)nformance$-interoperable$$lite$$type#$/dme\'&-based$&encina"#f\'s#!s',
+    '#!s"+m-catalysed#!.#%e-a15#!s"#oes""pg""rb"0s10637-hso510490\'!8#%20515%#608#\'tat.fil"%tober""vd',
+    '!"d\'"#-60$!2#$duck"!."#/ah"$1000"#206"!4"#931"$avid##wns""cr##s/2"+dd:hh:mm:ss',
+    '""ls""rb##ess#)glkdxrrdo"!s##-dc#!i"+t-resistant"%uallt"3x/tf/715/1&ndash;12\'%996/1"&ysgais!*e&atilde;o#-rehy;briefing(*demarcated',
+    '((educated(&feated*%nding(\'loittes(*moralizing*(tivating)(ystified**thologised()stabilize#%thorn"\'\'agneau#%benci#&grassi#\'mocracy",-acetylation',
+    '$)ffiliated&*orestation$\'lienate%)locations$#nne$)uthorised&+omatization##bag$%eaked&$rded$*iologising%&ttered)#ing$&olting%%mbing',
+    '($ings(!s$&uggers\'#ing%/reaucratisation."ze&$ring#&capped%*tegorising$%enter\'&ralise+&zation,"ed,#ing(!e',
+    ')!s$)hernatony%%ilded$\'iphered$)lassified%$utch)#ing$#ode\'!d%.llectivisation-&zation&)onization%(m-po-ses&%posed(&unding',
+    '%(ncretise&)struction&*tamination\'*extualised.#zed&$vert%#unt(#ing&$pled$.riminalisation-!e-#ing,&zation%&ofting#)dedicated',
+    '%)velopment$*ooh-de-doo$)ramatized#$ee-o\'"oo$(nergised$(roticize$\'scalate*#ion%$sing$+verythinged#)feminised$#oil$*ragmenters%%ocked',
+    '$\'uelling%)rbishment%"zz##gas&$sers%&ussing%&zetted$#ear%\'nerated$)laciating&*morization(%urize$,randfathered%%easer(#ing',
+    '&#ted#(hardened%)ut-en-bas$$orns%+spitalising,$zing%$used$&ulling%&manise)#zed$(ydration#%icers$*deologized$,ncorporation%!k',
+    '%!s&&talled*#ing\',itutionalise1&zation&&urance("ed(#ing%)tegrating\'+rnalization($pret%\'vesting#&jected$&udaise#\'la-pole',
+    '%+thalisation$\'icensed%"nk\'#age\'#ing%$sted\'#ing$$ouse(!d#\'manning%)rxisation$)edicalise+&zation$*iniaturise%"rv',
+    '&#bed&&ilised%*nopolising+&zation%(tivating+"on&&orised%\'untable$(ystified#\'nailing%-tionalisation-!e,&zation-#ing&)uralising',
+    '$\'ewleyfy$"ol%&tified%"vo#-personalising$-oliticisation,!e+#zed,#ing&$lute%(pulation%"rn&)traitised$*rogrammers+#ing',
+    '\'$ment%#ted&#ing$*ealization%*gistration/!s%*ligionized%(sourcing&%trict+"ed$%igeur&!s&&ueurly%"nd#/sacramentalized',
+    '$$cale(!r%\'hoolers$.easonalization-!e%(gregated+#ion%-nsationalized\'&itised+#ing*%vized%#xed&\'ualises*&zation+"ed',
+    '$)ignifiers%%lting$%kiing&1lling/re-skilling$\'ludging$)ocialised%&ldered%)vietising*&zation$$pool$,tabilisation0!s+"ed+#ing*&zation',
+    '&%ffing&\'linized\'#ked&+tionization%(igmatise%%ocked%\'ressing$%uited#(teddying$$horn%&roning$"ox&)ification(!y$$rend',
+    '#,unionization#&valued$&eiling#$what%&iffing#$xgas$#xxx"".g$#.j.")/1coupage#"ed#%tente"(16mb.exe"$2000""55',
+    '"&_force#%grace#*resistance""a*#+-controlled$(financed#&/jella$&narcog#!c$"de$"ey$+idification$\'on/club\'*gloucester&$dale',
+    '$&ylated#"d\'$\'(ening)$$-ass&\'t-birth%%baits&#eat%$cart&%entre%%drunk%$end\'&#ven&"ye%4from-the-nerves-down%$heat',
+    '%)important%#leg&#ine)!s&#ock)"ed)!s%(metaphor&!y%#one%\'panning&%layer&#ull%)reckoning&%inger',
+    '%\'walking&&eights&#ood\'"rk$!.%%david&)ersingham$\'/unwell$#_of$$alus$$band$#end$%faced$&ground$%horse',
+    '$,line-defying)&packed(%/just(!d("s.%,ock-breaking%)y-serious$$mans%"en$\'panning$&ringer$%space&#ots%$tick$\'weights',
+    '#*f&rarr;not$!-%$aids&)nd-stupid%\'hearing%%loops%.without-speech$$.his$#eat#*ggregation$#lan#!k$(er/chris#*l&mdash;no+#she',
+    '$!\'$!-%&framed%$less%%sized$$able$$bata%&reaker$"ed%(r-artist\'(supplied*$reme&!.&)/customer\'(mechanic',
+    '(\'romoter\'(retailer&(linkplus&"s/(#big$%igned\'$ment%!n&!e&(g-buying(6with-difficult-parents$$kent$!l$&making$/s-discretionary',
+    '$(uminated$!y#+n-designate%$like%)possessed$!.$&/416th%&badger%&safety&#hop%\'veteran$*ce/wallace%$ross$&e(3.0)%&-amite',
+    '%(/wallace%"in%!r$$gate%$elis$#ish$0o/whelan/wallace%!s$$park$*s/provosts%%cales%/gate-piccadilly%$loch%$park#!p',
+    '$#sie#+r&mdash;has$!\'$1-jeannette-letter%(ludovico%"up%#was$#_.&$$bhla%$orne(!i$,den-scripted%#orf$%ie-oh%(ng-style',
+    '%)y-beloved(%ought&#/as$#man%"on$%nesse$"s.$%umque##ses$#ley$"on#%th&gt&+mdash;house,,impermanence&*rehy;adder',
+    '%#(s)%,-and-rebirth\'>s-a-viable-alternative-to-life&#bid\'&ringer\'"us&\'causing\'%harge\'&olumns\'$rash(!y&%dance("ys(%zzled\'/estruction-doom',
+    '\'\'reading\'#ust($ties&(exposure&%faced("ll\'$eign\'$leet\'(or-death\'#ull&$hold)!e&*in-service(&stinct&%masks',
+    '&-of-the-author\'\'riented&$pact("le(#ngs(%tched\'#lot\'#ose(\'tential&&ration(!y\'\'egistry(%lated\'$ight\'"ow',
+    '\'%eeker\'%pells\')tiffening($rewn&$tech("nt\'$hroe&\'village&$wail\'$hite\'&ishers("th\'$orld%$.but&$jack',
+    '&#for&%knows&$loss%$beat&Rlackgrindthrashmetalultrafastfrashyfrashydoomgloom\'"ow)!s&%ucker%&charge&#law%!e&%dness%%field&&ulness%%heads',
+    '&#ock&(y-tinted%&mangle\'"sk($ques%$ness%%rider%)s.richard&&/which&):families&$_due&$head%$ward)!s(!e',
+    '$(tributed#&uratam$,tomatization#%ytons"+b&circ;acle#%-like$$type(!s#!.#*aar/farmer$"ch$#ene$!g%#ged$#kle',
+    '%!k&"ed%"rs%!t$\'sements%#sie%)tarrechea$)te/future&#_as&"d.&&s-half($late%!i&*ng-chamber)%table',
+    '&"on$%ucher)"y\'#$b\'io$"eh$"le#!e$$aked&#ing%!t$#bat$$ctib$"le%%leyme$,ndox-related',
+    '%,ham/cellmark\'"ns%!t$!o##ili&Htating/chronic/better-do-something-quick$(t/credit%#ore%"um#)lemishing%!r$%icker$&ocking$&urring##ole',
+    '%$ding%!e$\'rra-lee$"st$+ttle-necked(\'necking$\'uchment\'#ure#%recan%!u%$zcin$&iefers\'.ing/evaluation%&s-flow$"um',
+    '#"sy#*t&mdash;or+0us&dollar;11,000$!\'$(-bearing%*collectors\')unselling%%death%(financed%%happy&$eavy&&olding%&issuer%&nature%*on-wind-up',
+    '&)rotection%(recovery\'\'payment\',structurings%(scourged&&ettler&\'trapped&#wap$!.$\'/credit%#net%\'poverty%%quick$,or-contracts)%untry',
+    '&+s/creditors$-s/receivables#$ulks$$nker(!y%"ne$"rr&"ed$%ssyan)!s$%t-ing&&making#.ye-h&uuml;ckel"*c&ndash;30*!5',
+    '%!2$!4$%based$(designed&\'veloped$#feb$0hp-unisys-tandem$%march$&to-dec$#vax##.16$"31#&/3000s$%alpha$#edi',
+    '$\'fujitsu$&ultrix%#nix#"10#"21$\'2/jan20#\'a-dance$$cred$#dal%+e&mdash;the&+-and-a-half\'&blocks($ound\')conscious\'(obsessed',
+    '&$.the&$ntly&"s.%"ic%%rachm$(ffeinate+#ion&&inated$%gonal$%isnea$(lcomanie%%ogues$$mers%%pment$!n',
+    '%&onized%&tation+!s&#ees&!s$$octo$)pitalised(#tes)"or+!s%$olis$(rbonised+!r&)urisation%(ceration',
+    '%*telisation$%style%*ualisation)#zed$#tex%&hletes$.y-accelerating&)blackened&$rate&&series%!.%&period#&ca-ap4(!5&\'polydor',
+    '$#hip#&design#&easeds\'!s&#sed$#cco$$ided%%ptful%"ue%*v&eacute;d&"e/\'$r(s)\'"st&%ingly$$lean',
+    '%"le$,mber&ndash;1/\'january(#-13*!6*!9)"21)"30)!4)!6)%april)&picked(&/early($1924(!s',
+    '%&virate$!n%\'cy-rock%\'d-count%,t&rehy;sized&#ish&\'raliser+!m*\'zation*0(-process0+/devolution+"e.\'%icity(#ngs(#sts',
+    '\'.on&mdash;theft)!.)#ist$\'rebrate+!d#\'havanne$#hen$*lorinating,"on$%noleg#%ianus$#bal%,el-diplomacy(%heavy%#les',
+    '%-ed_whether_or&"ly&"rs&&s/tell%)ing-frame&"on%"ua&$ous.$!e%!s$%litre)!s$&malise(&zation&#tio',
+    '%*etre-scale)!s%&omannu$&nation%!s$%pher-(\'ability("er%$iens&"um%&ularis$.s&rehy;iveness%!i&#on\'(#(s)',
+    ')\'making.)(oriented)$rule)&taker.,"in($.but()/solution(0point/relational/"qs("s-*"it)$.the)*/proposals(#was&/ve&mdash;regard',
+    '(%ness.%"ve$(vilizing#*k-arrester%%cabin\'#rgo&&overed%$hand)!s&$ouse%%space&&tepped&\'wabbers$$beds$&ed-out',
+    '%$nson%#red$\'loading$&plates$%salon("on#\'laimers&"rs%?rative/interrogative/imperative+$ness&#den%&ssifed$&ermont$\'inature&*e&mdash;or',
+    '\')/withdraw\'*dtocomment&!g&(ing-cost*"in\'#sts##mpp#\'net/osi#)o-fronted$&ctions$#its$"ke$\'llation&)et&eacute/";e',
+    '($sing("ze)#ing&$rans\'$ized&%urize$&mcracy%+mission-ing\'$tted)#ing%\'paction&$iled(#ing&)osability("er',
+    '&)ressional+"ve*#ors$*ncentrated%)ditioning%$gest)#ing%(jugating%*structable+$ion.,$vism%#tam(&inants+#tes&)extualise',
+    '.!e&\'raction\'&olling%&verted&)olutional$-r&rehy;ations%%ated\'),-utilitarian\'$ion.*"al*"s.((ve&mdash*%-then*1/educational/food+Frepresentational/ultilarian/ceremonial',
+    '%$cast%$mier%!o&&usness%%print%#ums$!s%*ahexaenoic%%phere$!t%#urf$#urt%!x$$ying#(presents',
+    '$&eased.%"e\'&$-law&"th%&mental)"s.%&scence)"do+!s%"to\'#rum$)iminalise+$zing$$ucqs%$sted',
+    '%*stallising#\'servers$"s7#%t1800$#alk$#ect\'#ive$$icus$#ors$!p#\'ultured$%manus$$rion(!s$%ssata',
+    '#%voice#(watchers$*indows-osf#$ydes$$pher"$dari#&ective$"re$!s##gun#"ic%$atad\'#ed.$,fferentiated.#ion',
+    '##man#%ombar$$usyg#*reux-dorcy$$idge#!s#"uc%%table&&ionism)!j)"s.\'#ve/(#ist""e-$\'dah-dah',
+    '$&groovy$#hee$\'liteful#+/merseyside#"ah#&d/dead$!e%$elee$%oadal$2s&mdash;registered%#afe#)e-liteful%\'magical$#eep$$pest',
+    '#!f##ioo#%jayed##kie$!o$!s%)/hospital#&leebob)#ber%)y/injured$%kraal$!y##ner%,thorpe-based#"p-',
+    '&#ore&&rimmed\'%onzed("wn&%uried\'&ttoned%(carpeted&&leanse+#ing&&rimson&%uffed\'\'shioned%&delved)#ing&)iscounted',
+    '&&raught("wn\'%iving&"ug&#yed%&enough&%tched%%faced\'\'t-fried&%illed&(lavoured&\'reezers+!s*#ing\'!y',
+    '\'#een\'&ounded%(hollowed%&inside%$lead%&mantle&%ining&$oney%(navelled(!y%%ocean%%piled\'"nk\'%tched&#lan',
+    '&%urple%(quarried%$rock\'"ot)$edly+$ness%$sand&$ided&"ky&\'ocketed&:traw-and-goggling-visitors(\'uctures&#unk%%taped&%endon',
+    '&\'hinking\'$roat&"ow&%rance\'%eaded%\'vaulted&#ein%\'wrapped$#dye$$ends%(r-bodied\'(coloured\'&marine\'%water$$flow',
+    '$$glow$$lish%+y&rehy;felt&&-cleft\'(dejected\'&exotic\'(furrowed\'&hidden)!t\')ingrained\'%lined($obed\'\'moulded\'&needed\'$read',
+    '\'#set\'&tanned(\'roubled\'&voiced\'&wooded$$ness$&rooted$#six#"r-%8caught-in-the-headlights%%hound*!s&&unters%\'killers%$like',
+    '%\'raiders)#ing%(shooting&#kin)!s&\'potting&\'tealing%(watchers*#ing$$alok$%brook$%field&!n$$hood%&unters',
+    '$$park$$shot%+kin-covered%(talkered#)scalation%#uss$\'triders#"th##ver$!y##zes"&f-stan#\'aecated$#ite$(lcations',
+    '*!.%#ers%(iliarize-!s$$nged$%tting$(ult-free\',/withdrawals\'"14%"te##cli#!e$!a%%sance&$ibly',
+    '&,ed&mdash;see((-looking(!.\'!r&%ingly\'/sm/triumphalism$*brillation$&catory%\'ography%\'tations&"s.\')/symptoms&#uum$(minising$!n',
+    '.%often\'*-dependent)(ominated(+electronics((industry(#led*"ss(&sector)\'pending)+trategy-led($talk($work\'+/industrial(&keeper\'#_as',
+    '&#ies\'#sts%0d-against-labour&"an(+t&mdash;has)!\')#-on&*ed-against\'$ntis\'0r-turned-striker(%/full)*midfielder)\'sweeper&#in\'("g/',
+    ')!e%(estrated%%itely%"sa&"es&#ion\'#ve\')#ly.&$ores$!o$&r-ence%.ence/patronage)!s%%ments%+red-payment',
+    '#$fand$#ett$\'inately#/i&rehy;nitional$,ant-sounding$(brillate+$ions\'&nation$,ciency-based("t\'&)t-cutters((reducing)%idden\'"s.$!e',
+    '$\'lements&"th%$ippo$!n%$atly%*ed-benefit(%entry()sequences&$tely%!i&,&rehy;tively&#cil&/ng/non-defining&+te-sounding(#ly.',
+    '*+-conformant+%tasks*%alism*"s.#(latingly\'*on-induced$1ection-displaying%$shed%"ur%"xa&#ion$!o%(cculated%%ratum$&uffing',
+    '%!s$%gging$&liaria\'$tors$"re&"st(&ation.%#ges%$mans\'&tional&!d&*ed-looking\'!r$$sses$!y',
+    '&$ging%#oui%$uder%%yment&!s$\'eitas10%"yn$#ock#!s#%tedar$+ly-sketched\'%timed$"on#!u$%erunt',
+    '("ve\'$orum$+zzification\'"ng""g.##age$"le$"me$#nia%#nwy$#rmo$%slish%!n%#sed\'!r',
+    '%"er\'\'escence%$kolb$!r#!g$"ed%%ndorf#&iorgio#&lacial(%tions%&morise+!d*#ing%$zing$"er',
+    '%$ving$$upta%\'titions$.ycyrrhizinised#(n&iacute$!a#\'oricija$$sang$#une#*r&eacute;s$)aded-core&%ingly%&nulate+!d*#ing',
+    '*!s%&dation%,e-ceremonies(%ourse&%/that&!e&,s-of-freedom\'$.the\'!c\'!f%&nality%%vaunt%!y$(ugillier%!y',
+    '#$uchi&!t$%eldre$!n$$sted"$haen$*logenating,"on$(ut-enbas$#ven#\'eubarth#&iscent&#ing%\'torical*\'ization',
+    '$$wala#"mc$"el##ner#-omosexualised$%rning%&tatory$$usse#%radun#\'umanize%+idification#!y$+bridization*"ed$&drator',
+    '\'+cholesterol\'(doginase\'\'genases+%tions\')xyacetone"(i&aacute#%anira$$tion#&chtire$#ide$/tic/non-deictic#-deologisation+"ed#%ectos#"go',
+    '#!m#"n\'$-dustrializing$!e$\'onychus%!s%\'therium$2stitutionalisation0$zing#)onisation\'#ers#$rdra&"ie$#ing##sel',
+    '#\'temeyer%"rs$!h$-ies&mdash;and##vio##xes""ja$#ger$"la$"me$"na%$ikus#&ective$$rine#"in',
+    '#\'ohnette$#ria"!k#$alia$%metre#&emhare$!n##ink#&mejian#2o&mdash;democratic$!m$%oning$)rativnoye#\'retstil#$stop',
+    '"$l&gt$*iacute;rio#\'\'abbate#$-boy$.nevo/committee#!.#!a$#bel\'$ling$%cluse%$orta&#urs%!y$$ford&#uge',
+    '$#hay%,unt/scotland$"ir$%maide\'!n&"re\'"re%#bre%&inated)#ing*#ons$*nde/waiter%/ey/mother-to-be(&pickle((wildfowl',
+    '%#noy%"os&#uei$(pidation,!s%"on&"rt%#raz$&ration%,ivi&mdash;re("er%$oche%"ue$%tores$\'ubenque',
+    '$$xica$*y-inducing&8start/pre-set/auto-start%!e&-d&rehy;action\')-telecast\'!.&$ring#$bard$$igot$%ridge#$camp$"ev$#hev$!l',
+    '#&ecluse%#our%-table-looking$,gate-general(+s/officials\'+ion-general*!.\'!s%-i&rehy;timize&&timate+#ing,"on)\'isation*&zation+"ed',
+    '$%motte$#nda&#ick$"on$%rious$$sman$(te/erase&+d&mdash;see%*ion-clones)%prone(&.there%%rious\'!x$%uzian$!v',
+    '%&opment#%feayo%!n$$ield%"no$$land$%onics$$zjil#(gado-gal#1hi&ndash;srinagar#4i-cum-restaurant-cum%*restaurant$$bars&!s%!e',
+    '("cy(!t)"e-**/avoidable*#ley+)y-created-*for-dining-(invented-$sown)"io+#ns..!5)"le*!y)#ory',
+    '%"le%&rately$$care\'!i&)te-filmed+&ngered)&leaved()/diabetic(+ly-balanced-$rbed+(composed+\'painted+\'sprayed+&worked(1ssen-cum-drinking',
+    '%!h&"on%"ia&-ous&mdash;are))-sounding)!.)&nesses$$ever$(ghted.it\'"fl(%ully--%named$&katess$+lah-complex%#ine',
+    '%&itable$!n%%court%!e&#ato)!r%&guente%)quency-is+,/criminality)"te$\'pidated$&quency(!t\'&scence)#ing',
+    '%"ia&#ums$#sle%"sa$$tiae&#ons%$zsch$#uer\'"ed$#vas%-ered&mdash;no("th\'$ies.*./distributions\'1y-against-payment',
+    ',!s)#man*"en)%rooms)\'service*,pecification)*to-promise)$ward(+/collection(#ing(#man%#ing%%rance$#zie#\'l\'acqua',
+    '&*gricoltura&$mata&%ntico)&quario&#qua&%rmata%)et&agrave&%uropa%*incoronata\'(telletto%$orio(&zzonte\'&ologio\'"to&\'spedale',
+    '(!o&(ttocento&"vo%0universit&agrave&"va$%-arte$&/ultra$(a-savina%"ch%#nzo%!s&"el$\'ightful%!n$!y',
+    '$$aney%"rk%#zou$!e$!o%"nt%"re#(nashaugh$!i#\'ocalise(#zed$%fting$#ite&!t$$nghi',
+    '%$s-ii\'#led&#ism$$zier#)phi-story&(napterus\'$e/us%#yne&!s$%iazzo$!y#%rina.#$soin%!l#&ta-400',
+    '&,9-desaturase&)capacitor&&factor&&shaped&$west\'%inged%&/ad3.1%&clavus%#net%"te%$wave$"ec%"il$(oblastus%#nes',
+    '#*uge-cursed&!s$\'nctious$.sion-formation)+of-grandeur$!x%"es$"ze#\'veloped%!r$!i%"ne$#oye#$yved"#m16',
+    '$$cedo$"ds$"ge%&netise*#ing%&ogical$(nd-based\'*determined\'*employment\'#fed((or-money&*/aggregate\'(guidance\'*limitation\'(monetary',
+    '&"ez&#in\'%"et%$gler%#tis$\'rateion\'"os%&castel\'#tor*!s&&helier\'"ia\'!s%#est%#ned',
+    '*#ory%#ted$*terializes%)urization#$bele%!r$&i-dolo%#cki%)nska-kiec$!o#(chigdorj\'%javyn$%ratic\'!s#$eane',
+    '&"or$*clocycline.$+all$!d%)icalising$"lo$$nour%#sne%$tiae(!l(!s&!s%!y$$raby&#rae',
+    '%#sum$#ska&!i%(ne-farms%$tica$)thylating%#ris&%oulla$#ure#"i-%-authoritarian%.caract&euml;re&#hef&(ontinent%)devil/why',
+    '%%glace%%johns%$kilo%$lion%(machines&(ondaines)"es%$pete&)li&eacute&&ointes%\'regular%+semi-quaver)!s%+vegetarians%%world',
+    '$$dovs$#god$#lle\'%-like$)neralises*#zed%$imus&%shed.%%utive$)pirouette$#ral%#dji$#ser%!t&"ed',
+    '$%tasse%!s$$urge#$ling#$ming\'!s$!y#$nati$"er#(o\'cratic$!-%+competition&$racy%%dudes%#ing',
+    '%%sized%$tape$\'b-happy%!s$,cr&aacute;ca(*grave;tico&*acy-haters*(movement*%would)(/workers)#and\'%ppery)%iness\'&sserie)$ness',
+    ')#fdp*#ree)(inspired)\'liberal)#run))sponsored((/liberal(!e(#ic\'*+-centralist+)dominated+)manandhar++participant+&social*\'/labour',
+    '*0ally-accountable/&chosen0*onstructed/*determined/#run/*structured*!k*!s))que-(rcd),!s)#sch,!e)$zers+!s((rization',
+    '&#isy\'#tas$\'dulated$)graphyand$&kracja\'"si\'#ten*2/d&eacute;mocrates)#rna(!i)"ei)#kon+!s)-sche-sozialen-!n',
+    '($siya)"ke*"hi(%yczne&$itos$!l%#der%$ised\',hed/derelict)!r**/ex-jungle*!s&0tion-perspective+$work*"s.',
+    '%$lari$&mcrats$.n&rehy;strates0$ions0#ors%)-creature&%enemy&&filled&\'haunted&)possessed&(serpents)$vant\'#tar&%world%#ess',
+    ')"ed(&zation%\'iacally(!s&"c\'\'!s&"se\'!m&"ze%\'ography&\'logical*"es*"st%&stable($tors',
+    ')#te.+"d.*"io,-n-experiments.(lectures.\'steamed.$type-#/in+#ve\'*&orship0!s,!y%$tage&$rond%!z',
+    '$0ralised-sounding%#gan%#nay$"s.%$etic%&ponges%%tenes&&rators$\'tivates)"or$%urova&!s$"ze##phu$$seys',
+    '$"ki#(ulsifier+!s%)tiplexing$&reness%%rence$,tualisations#.ythologization,"ed*!y"$n-sa#3ali&ndash;fairbanks$#mrk$!r%!i',
+    '%!s$"te%(ionalize-"rs(\'isation&#red%%onium%\'uralize("nt(#ted)#ing\'"es\'\'isation$\'zifying#$bies',
+    '$$ound$#ury#"ce$2hworth/oxfordshire$!o#"da$=erah&ndash;abydos&ndash;sohag(&/quena&%monde$#ral%+ochronotogy\'%opos.&%dorid+!s&%grams',
+    '\',dea-dendroid(!s&&logist&\'nephtya&&phthoe\'\'ithecus&!v$"ur#%ebola$&ficial$"ke$&rarios%%vated$$tted$#van',
+    '#%field$%reude#%g-era$&emarsh#$hall%)m/council$)olm-young#%iably%-l/aspirations\'*withdrawal$9ce-work-if-you-can-get-it$\'dba/mba$+ed-exchange&!.\'!a',
+    '&!s$!g%&rators*!y$#ken$"le$&m-blue&&cotton&$dark$#ned%$gton$"ol$#ros$(son-type&$vich',
+    '%\'rifying$#zer#&karing%#vit$"en%!r$#ies$)netzeyans#"li%"ke$+y/neighbour#$mans%(rk-based(&russia\'!e',
+    '$!e%#hey&!y%"ll%#rie%!t$#ick%\'ng-type\'!s%5s-going-to-the-toilet&!.&(/science\'&thames&)on/oxford&!s',
+    '$"y\'%(-falkirk%)/hollocks&(landlady&(publican#,oel-gonthier$%ltabs$(minating*+onalisation,#s.s),or-dominated$"on$"ra%%ionum$&tified',
+    '$%ument%(ncement.(!r)!s#%pasar#$rees#\'s-canis$%combe$$dark$(e-celled&\'grained(%owing&(textured%+ly-forested(\'printed',
+    '*%ocked((textured(&wooded*$rked%$pack%&r-liar&!.$&hering$%ified&$lora&!y%*pollenites%!s%,tometrically&#ron',
+    '((averaged.#ing(*dependence)%riven!5readnought-accustomed',
 )
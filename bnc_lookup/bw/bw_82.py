@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_82 = (
+count_82 = 6695
+
+heads_82 = (
     'cometson/team',
-    'comf\'table',
-    'comfily',
-    'comfirm',
-    'comfit',
-    'comfort-dream',
-    'comfort-house',
-    'comfort-keeper',
-    'comfort-orientated',
-    'comfort-sex',
-    'comfort-zone',
-    'comfort.',
-    'comfortable-sounding',
-    'comfortable_instead',
-    'comfortableness',
-    'comfortables',
     'comfortably-scuffed',
-    'comforth',
-    'comfortin\'',
-    'comfortlessly',
-    'comfrey-scented',
-    'comfreys',
-    'comhaolt&aacute;s',
-    'comic-cuts',
-    'comic-drama',
-    'comic-horror',
-    'comic-satiric',
-    'comic-surreal',
-    'comic-terrible',
-    'comic-turns',
-    'comic/book/t-shirt/toy',
-    'comic/tragic',
     'comiczine',
-    'comigrate',
-    'comilla',
-    'comillas',
-    'comin\'.',
-    'cominco',
-    'comincom',
-    'coming&mdash',
-    'coming-and-going',
-    'coming-down',
-    'coming-of',
-    'coming-out-ball',
-    'coming-round-the-mountain-in-a-12-ton-rig',
-    'coming-through',
-    'coming-to-be',
-    'coming-to-know',
     'coming-to-maturity',
-    'coming-to-terms',
-    'coming/',
-    'coming/dealing',
-    'coming_out',
-    'coming_up',
-    'coming_up_,',
-    'coming_up_to',
-    'comings-and-goings',
-    'comins',
-    'comintern-inspired',
-    'comintern-style',
-    'cominterns',
-    'comisetti',
-    'comish',
-    'comiskey',
     'comissao',
-    'comission',
-    'comitas',
-    'comitato',
-    'comitment',
-    'comitted',
-    'comittees',
-    'comix',
-    'comjunction',
-    'comley/thamesdown',
-    'comm-called',
-    'comm-lens',
-    'comm-link',
-    'comm-switch',
-    'comm-system',
-    'comm-unit',
     'comma-delimited',
-    'comma_next',
-    'commachio',
-    'commadagh',
-    'command(s)',
-    'command-backed-by-threats',
-    'command-driven',
-    'command.num',
-    'command.to',
-    'commandant-general',
-    'commandement',
-    'commander-elect',
-    'commander/gloucestershire',
-    'commander/raf',
-    'commanderie',
-    'commanders&mdash;riek',
     'commanders.',
-    'commandeur',
-    'commandit&eacute',
-    'commando-helicopter-carriers',
-    'commas.',
-    'commdesk',
-    'commdr',
-    'commedagh',
-    'commelinaceae',
-    'commeline',
-    'commemoratively',
-    'commemoratives',
-    'commenc&eacute',
-    'commencement.',
-    'commendam',
-    'commendatio',
     'commenlina',
-    'commensurability',
-    'comment&lsqb;modifications',
-    'comment&lsqb;this',
-    'commentaires',
-    'commentates',
-    'commentbecause',
-    'commented-on',
-    'commentry',
-    'commentry/report',
-    'comments.',
-    'comments/answers',
-    'comments/dependent',
-    'comments/further',
-    'commenus',
-    'commerate',
     'commercal',
-    'commerce&rehy;destroying',
-    'commerce-designate',
-    'commercial-electronics',
-    'commercial-law',
-    'commercial-making',
-    'commercial-scale',
-    'commercial-sized',
-    'commercial-type',
-    'commercial/',
-    'commercial/bmp',
-    'commercial/legal',
-    'commercial/technical',
-    'commercializing',
-    'commercially&rehy;applied',
-    'commercially-attractive',
     'commercially-based',
-    'commercially-important',
-    'commercially-led',
-    'commercially-oriented',
-    'commercially-owned',
-    'commercially-packaged',
-    'commercially-produced',
-    'commercially-relevant',
-    'commercially-sustainable',
-    'commercially-viability',
-    'commercially-viable',
-    'commercially-xxxx',
-    'commercianti',
-    'commericial',
-    'commerntary',
-    'commers',
     'commersant',
-    'commersonii',
-    'commes',
-    'commessi',
-    'commet',
-    'commetary',
-    'commg',
-    'commication',
-    'commidendrum',
-    'commie-hating',
-    'comminating',
-    'commination',
-    'comminuqu&eacute',
-    'comminuted',
-    'comminution',
-    'comminutors',
     'commiserative',
-    'commish',
-    'commisioned',
-    'commisioners',
-    'commisison',
-    'commisit',
-    'commiss&rehy;ioned',
-    'commissao',
-    'commissary-johnny',
-    'commission&rehy;free',
-    'commission-approved',
-    'commission-based',
-    'commission-inspired',
-    'commission-only',
-    'commission-paid',
-    'commission-xxxx',
     'commission/science',
-    'commission/training',
-    'commissionable',
-    'commissionaer',
-    'commissioner-in-waiting',
-    'commissioner-the',
-    'commissioners&mdash;whatever',
-    'commissioners.',
-    'commissiong',
-    'commissionings',
-    'commissn',
-    'commisson',
-    'commissons',
-    'commisssion',
-    'commit&rehy;tee',
-    'commit&rehy;tees',
     'commitment&mdash',
-    'commitment-makers',
-    'commitment/disengagement',
-    'commitments_in',
-    'committeds',
-    'committee&mdash;that',
-    'committee\'',
-    'committee(s)',
-    'committee-accredited',
-    'committee-forcing',
-    'committee-level',
-    'committee-like',
-    'committee-making',
-    'committee-managed',
-    'committee-meeting',
-    'committee-related',
     'committee-ridden',
-    'committee-roast',
-    'committee-run',
-    'committee-type',
-    'committee-work',
-    'committee/oxford',
-    'committee1',
-    'committees.',
-    'committees/office',
-    'committer',
-    'commlink',
-    'commmission',
-    'commmitment',
-    'commmons',
-    'commmunist',
-    'commmunists',
     'commmuters',
-    'commnications',
-    'commnity',
-    'commodify',
-    'commodis',
-    'commoditise',
-    'commodity-broking',
-    'commodity-capital',
-    'commodity-dependent',
-    'commodity-like',
-    'commodity-linked',
-    'commodity-price',
-    'commodity-product',
-    'commodity-socialist',
-    'commodity-status',
-    'commodity-type',
     'commodity-value-product',
-    'commodius',
-    'commodo',
-    'commodus&rehy;hercules',
-    'common&commat',
-    'common-',
-    'common-collector',
-    'common-core',
-    'common-crime',
-    'common-denominator',
-    'common-earth',
-    'common-envelope',
-    'common-format',
-    'common-grazing',
-    'common-ground',
-    'common-know',
     'common-land',
-    'common-man',
-    'common-prim',
-    'common-senseless',
-    'common-weale',
-    'common-wealth-men',
-    'common-yard',
-    'common/oxfordshire',
-    'commonage',
-    'commone',
-    'commoned',
-    'commoners.they',
-    'commonership',
-    'commong',
-    'commonhelp',
-    'commonish',
     'commonlie',
-    'commonly&rehy;owned',
-    'commonly-cited',
-    'commonly-experienced',
-    'commonly-kept',
-    'commonly-occurring',
-    'commonly-prescribed',
-    'commonman',
-    'commonplace\'',
-    'commonside',
-    'commonwave',
-    'commonwealth-centred',
-    'commonwealth-soviet',
-    'commonwealth-style',
-    'commonwealthism',
-    'commonwealths',
     'commonwealthsmen',
-    'commonweath',
-    'commorits',
-    'commowealth',
-    'commrs',
-    'commtments',
-    'commuity',
-    'commun.',
-    'communal-like',
-    'communal.',
-    'communales',
-    'communally-based',
-    'communally-owned',
-    'communaute',
-    'communcation',
-    'commune-brutally',
     'commune.',
-    'commune/warehouse/community',
-    'communeau',
-    'communi&oacute;n',
-    'communic8',
-    'communica&rehy;tions',
-    'communicate/signify/represent/constitute',
-    'communication(s)',
-    'communication-oriented',
-    'communication-training',
-    'communication-wise',
-    'communication.',
-    'communication/counselling',
-    'communication/culture',
-    'communication/presentation',
-    'communications***',
     'communications-based',
-    'communications-conscious',
-    'communications-network',
-    'communications-obsessed',
-    'communications.',
-    'communications/advisory',
-    'communications/transport',
-    'communicationsweek',
-    'communicative-representational',
-    'communicative-symbolic',
-    'communicatively-based',
-    'communicativeness',
-    'communidade',
-    'communikty',
-    'communion\'',
-    'communione',
     'communiqu&eacute\'',
-    'communisation',
-    'communisme',
-    'communist\'',
-    'communist-',
-    'communist-bloc',
-    'communist-homosexual',
-    'communist-hunter',
-    'communist-inclined',
-    'communist-influenced',
-    'communist-installed',
-    'communist-jewish',
-    'communist-labourites',
-    'communist-occupied',
-    'communist-orchestrated',
-    'communist-oriented',
     'communist-socialist',
-    'communist-starred',
-    'communist-supported',
-    'communist/',
-    'communistische',
-    'communists&mdash;gained',
-    'communitarians',
-    'communites',
-    'communities&mdash;ec',
-    'communities-european',
-    'communities-the',
-    'communities-we',
-    'communities/health',
-    'community&mdash;set',
-    'community&rehy;focused',
-    'community-',
     'community-backed',
-    'community-based-services',
-    'community-centre',
-    'community-controlled',
-    'community-decision-making',
-    'community-devised',
-    'community-directed',
-    'community-funded',
-    'community-health',
-    'community-in-education',
-    'community-member',
-    'community-mindedness',
-    'community-ministers',
-    'community-originated',
-    'community-run',
-    'community-scale',
     'community-sensitive',
-    'community-set',
-    'community-smack',
-    'community-us',
-    'community.j&ndash',
-    'community.we',
-    'community/adult',
-    'community/client',
-    'community/community',
-    'community/police',
-    'community/village',
-    'communityl',
-    'communityoriented',
-    'communitywide',
-    'communiucation',
-    'communiy',
     'communizing',
-    'communizm',
-    'communo-socialism',
-    'communs',
-    'communties',
-    'commutable',
-    'commuter-belt',
-    'commuter-hour',
-    'commuter-lines',
-    'commuter/runabout',
-    'commuterland',
-    'commuti',
-    'commy',
-    'comnes',
-    'comng',
-    'comnpany',
     'comodale',
-    'comonwealths',
-    'comorans',
-    'comorant',
-    'comoration',
-    'comoreans',
-    'comorin',
-    'comovement',
-    'comp&eacute;tente',
-    'comp&egrave;ring',
-    'comp&lsqb;any',
-    'comp&ocirc;te',
-    'comp/decomp',
-    'comp/tech',
-    'comp600',
-    'compac-branded',
     'compact\'',
-    'compact-initiated',
-    'compactaci&oacute;n',
-    'compactant',
-    'compactdisc',
-    'compactible',
-    'compactum',
-    'compadrinazgo',
-    'compagnia',
-    'compagnoni',
-    'compagnons',
-    'compair-holman',
-    'compajina',
-    'compalint',
-    'companeras',
-    'companeros',
     'compangnie',
-    'companhons',
-    'companie',
-    'companies&mdash;fell',
-    'companies&mdash;mainly',
-    'companies\'',
-    'companies-hitachi',
-    'companies/organizations/groups',
-    'companies/partnerships',
-    'companies_rather',
-    'companieshave',
-    'companieswith',
-    'companion-general',
-    'companion-housekeeper',
-    'companion-secretary',
-    'companion-way',
     'companion/assistant',
-    'companionability',
-    'companioning',
-    'companionless',
-    'companions-augustus',
-    'companions.',
-    'companionship-seeking',
-    'companionship.we',
-    'companionships',
-    'companionways',
-    'company&mdash;in',
-    'company&mdash;see',
-    'company\'s.',
-    'company*',
-    'company-approved',
-    'company-by-company',
     'company-clients',
-    'company-fascinated',
-    'company-funded',
-    'company-government',
-    'company-headed',
-    'company-law',
-    'company-oriented',
-    'company-patient',
-    'company-provided',
-    'company-reporting',
-    'company-subsidised',
-    'company-suggested',
-    'company.based',
-    'company/co-operative',
-    'company/companies',
-    'company/institution',
     'company/l',
-    'company/mgm',
-    'company/organisation',
-    'company/port',
-    'company/unit',
-    'company_except',
-    'companying',
-    'companyw',
-    'compar&eacute;e',
-    'compar&egrave;es',
-    'comparable-17.o',
-    'comparable.',
-    'comparably-priced',
-    'comparanda',
-    'comparatively-sized',
-    'comparatively-small',
     'comparativist',
-    'comparco',
-    'compard',
-    'compare/contrast',
-    'comparerite',
-    'comparin',
-    'comparison-and-contrast',
-    'comparison_with',
-    'comparisons--with',
-    'comparms',
-    'comparsion',
-    'compartment-the',
-    'compartmentalising',
-    'compartmentalizes',
-    'compartments.',
-    'compas',
     'compass-bearing',
-    'compass-points',
-    'compasse',
-    'compassion\'',
-    'compassion-filled',
-    'compassionate/',
-    'compatative',
-    'compatibiity',
-    'compatibilty',
-    'compay',
-    'compc',
-    'compcon',
-    'compeditors',
-    'compeigne',
-    'compen',
-    'compendiosa',
     'compensa',
-    'compensaion',
-    'compensaiton',
-    'compensates.',
-    'compensatingly',
-    'compensation-cheque',
-    'compensationary',
-    'compensationitis',
-    'compensator',
-    'compense',
-    'compers',
-    'compess',
-    'compesses',
-    'compesso',
-    'compete/',
-    'compete/canvass',
     'competence.',
-    'competence/outcomes',
-    'competence/performance',
-    'competency/threshold',
-    'competers',
-    'competi&rehy;tions',
-    'competing.in',
-    'competiors',
-    'competit',
-    'competiting',
-    'competition-',
-    'competition-inducing',
-    'competition-orientated',
-    'competition-promoting',
-    'competition-sized',
-    'competition.richard',
     'competition/',
-    'competition/canvassing',
-    'competition/market-driven/efficiency/quality/flexibility/nmanned&rehy;onment',
-    'competition/soliciting',
-    'competitions.',
-    'competitivc',
-    'competitive/partly',
-    'competitively-determined',
-    'competitively-set.',
-    'competitives',
-    'competive',
-    'competively',
-    'competiveness',
-    'compil',
-    'compilable',
-    'compilation&rehy;collaboration',
     'compilatorial',
-    'compilatory',
-    'compiler-independent',
-    'compiler-level',
-    'compilio',
-    'comping',
-    'compla',
-    'complain\'',
-    'complainingly',
-    'complaint-based',
-    'complaint.',
-    'complaint/urgent',
-    'complaints.',
-    'complaints/injuries',
-    'complaisantly',
-    'complaynt',
     'compleate',
-    'compleated',
-    'complement-inhibitory',
-    'complement_rather',
-    'complementarily',
-    'complementarity-determining',
-    'complementer',
-    'complementisers',
-    'complemento',
-    'complete.1',
-    'complete.fulfilled',
-    'complete.richard',
-    'complete3',
-    'completed/or',
-    'completed_at',
-    'completely-all',
     'completely-different',
-    'completely-occluded',
-    'completeness.',
-    'completer-finisher',
-    'completer.',
-    'completeunco/headlesschicken/lamehorse',
-    'completeyl',
-    'completing_in',
-    'completion&mdash;buyer',
-    'completion&mdash;eg',
-    'completion&mdash;no',
-    'completion&mdash;seller',
-    'completion&mdash;should',
-    'completion&mdash;whether',
-    'completion&mdash;you',
-    'completionil',
     'completus',
-    'complex-feature-based',
-    'complex-seeming',
-    'complex-shaped',
-    'complex-stabilization',
-    'complex/skilled',
-    'complexe',
-    'complexes.',
-    'complexion-conscious',
-    'complexion.',
-    'complexity.',
-    'complexs',
-    'compli&rehy;cated',
-    'compli&rehy;cation',
-    'compliance-were',
-    'compliated',
     'complica',
-    'complicat&lsqb;ing&rsqb',
-    'complicated&mdash;as',
-    'complicated&mdash;eg',
-    'complicated-sounding',
-    'complicatedly',
-    'complicational',
-    'complice',
-    'compliements',
-    'compliers',
-    'compliment-hunt',
-    'compliment/congratulate',
-    'complimentaries',
-    'complimente',
-    'compliments-to-the-chef',
-    'complin',
     'complins',
-    'complot',
-    'complt',
-    'complutense',
-    'complx',
-    'complyn',
-    'compny',
-    'componenets',
-    'component-based',
-    'component-buying',
-    'component-by-component',
-    'component-failure',
-    'component-making',
-    'component-to-component',
-    'component-to-external',
-    'component.',
     'componentin',
-    'components&mdash;pumps',
-    'components&mdash;the',
-    'componets',
-    'comportait',
-    'comporte&rehy;ment',
-    'comports',
-    'compos',
-    'compos&eacute',
-    'compos&eacute;s',
-    'compos_mentis.',
-    'composee',
-    'composer-conductors',
-    'composer-figure',
-    'composer-in-residence',
-    'composer-movie',
     'composer-musicians',
-    'composer-performer',
-    'composer-producer',
-    'composer/conductor',
-    'composer/performer',
-    'composer/pianist',
-    'composeress',
-    'composerpianists',
-    'composers-in-residence',
-    'composi-tions',
-    'composing-rooms',
-    'composing-stick',
-    'composite-bodied',
-    'composite-they',
-    'compositeur',
-    'composition--will',
     'composition-based',
-    'composition/mineral',
-    'compositional/redactional',
-    'compositive',
-    'compositoresses',
-    'compositors.',
-    'composits',
-    'composium',
-    'composizione',
-    'composnents',
-    'compost-filled',
-    'compost-heap',
-    'compost-maker',
-    'compost-makers',
-    'compost/soil',
-    'composto',
     'compouding',
-    'compound(s)',
-    'compound-interest',
-    'compound-noun',
-    'compound/adhesive',
-    'compradore',
-    'compradores',
-    'comprehender',
-    'comprehendible',
-    'comprehendo',
-    'comprehensive&mdash',
-    'comprehensive-turned-direct',
-    'comprehensive-type',
-    'comprehensive/secondary',
-    'comprehensivize',
-    'comprendo',
     'comprendre',
-    'comprenez',
-    'compreshensive',
-    'compressa',
-    'compressed-snow',
-    'compressibilities',
-    'compression-ignited',
-    'compression-moulding',
-    'compression.',
-    'compression/doubling',
-    'compression/expansion',
-    'compression/limiting',
-    'compression/support',
-    'compressor-blade',
-    'compressor-sustainer',
-    'compressor/noise',
     'comprimat',
-    'comprime',
-    'comprise(d)',
-    'comprisers',
-    'comprisong',
-    'compro&rehy;miser',
-    'compromisability',
-    'compromise-creating',
-    'compromise-which',
-    'compromise.for',
-    'compromise:each',
-    'compromise:in',
-    'compromise:the',
-    'compromise:vendor',
-    'compromises-are',
-    'compromises:the',
     'compserve',
-    'compson',
-    'compsure',
-    'comptable',
-    'compterised',
-    'compton&rehy;burnett',
-    'compton-smith',
-    'compton/berkshire',
-    'comptonesque',
-    'compucount',
-    'compucraft',
-    'compudata',
-    'compulink',
-    'compulsitor',
-    'compulsiveness',
-    'compulsives',
     'compulsories',
-    'compulsory-purchase',
-    'compulsory.',
-    'compunction&rehy',
-    'compund',
-    'compurgators',
-    'compuserve.',
-    'compuserve.com',
-    'compusys',
-    'computa',
-    'computacenter',
-    'computadate',
-    'computakits',
-    'computati',
-    'computation.',
-    'computationally-influenced',
     'computationally-informed',
-    'compute-bound',
-    'computer&mdash;plus',
-    'computer&ndash',
-    'computer&rehy;company',
-    'computer&rehy;room',
-    'computer&rehy;sensitive',
-    'computer&rehy;superliterate',
-    'computer--based',
-    'computer-across-the-curriculum',
-    'computer-activated',
-    'computer-adept',
-    'computer-administered',
-    'computer-age',
-    'computer-analysis',
-    'computer-banks',
     'computer-base',
-    'computer-boosting',
-    'computer-brained',
-    'computer-builders',
-    'computer-calculated',
-    'computer-centre',
-    'computer-clustering',
-    'computer-collected',
-    'computer-cum-word',
-    'computer-data',
-    'computer-dating',
-    'computer-derived',
-    'computer-designing',
-    'computer-developed',
-    'computer-directed',
-    'computer-ed',
     'computer-fashion',
-    'computer-fax',
-    'computer-friendly',
-    'computer-goalie',
-    'computer-illiterate',
-    'computer-indexing',
-    'computer-industry',
-    'computer-information',
-    'computer-initiated',
-    'computer-instrument',
-    'computer-learned',
-    'computer-literates',
-    'computer-lock',
-    'computer-made',
-    'computer-makers',
-    'computer-making',
     'computer-managed',
-    'computer-manufacturing',
-    'computer-minded',
-    'computer-monitored',
-    'computer-monitors',
-    'computer-music',
-    'computer-networks',
-    'computer-numerically-controlled',
-    'computer-obsessed',
-    'computer-orientated',
-    'computer-output',
-    'computer-owning',
-    'computer-peripheral',
-    'computer-person',
-    'computer-plan',
-    'computer-processed',
     'computer-processing',
-    'computer-programming',
-    'computer-recognisable',
-    'computer-reservations',
-    'computer-resident',
-    'computer-room',
-    'computer-routed',
-    'computer-screens',
-    'computer-shy',
-    'computer-simulation',
-    'computer-storage',
-    'computer-stored',
-    'computer-systems',
-    'computer-telephone',
-    'computer-telephony',
-    'computer-tested',
     'computer-to-mass',
-    'computer-to-outside',
-    'computer-to-peripheral',
-    'computer-training',
-    'computer-type',
-    'computer-usage',
-    'computer-visualisation',
-    'computer-wise',
-    'computer-zombie',
-    'computer.total',
-    'computer/information',
-    'computer/manual',
-    'computer/node/telecommunication',
-    'computer/processor',
-    'computer/slip',
-    'computeranwendungs-beratungs',
     'computerbased',
-    'computercard',
-    'computercontrolled',
-    'computerdom',
-    'computered',
-    'computeredge',
-    'computergenerated',
-    'computering',
-    'computerised-map',
-    'computerises',
-    'computerless',
-    'computermail',
-    'computerniks',
-    'computerphobes',
-    'computers-in-the-cab',
-    'computers.',
     'computerspeak',
-    'computersysteme',
-    'computersystemvertriebs',
-    'computetor',
-    'computilliterates',
-    'computing-network',
-    'computing-services',
-    'computing/control',
-    'computing/i.t.',
-    'computing/it',
-    'computing/other',
-    'computing/pc',
-    'computing/study',
-    'computor-assisted',
-    'computrac',
-    'computum',
     'compy',
-    'comr.',
-    'comrade-colonel',
-    'comrade-in&rehy;arms',
-    'comrade-inarms',
-    'comradeliness',
-    'comrades.',
-    'comraind',
-    'comrs',
-    'coms',
-    'comsec',
-    'comsit',
-    'comstat',
-    'comstock-smith',
-    'comte.l',
-    'comte/defence',
     'comtec',
-    'comtechsa',
-    'comtemplated',
-    'comtemplative',
-    'comtemptuous',
-    'comtes',
-    'comtian',
-    'comtinued',
-    'comtist',
-    'comtois',
-    'comtoise',
-    'comtrol',
-    'comturist',
-    'comunero',
-    'comunic',
-    'comunica&ccedil;ao',
     'comunica&ccedil;es',
-    'comunicacoes',
-    'comunione',
-    'comunitarias',
-    'comunitario',
-    'comverse',
-    'con&rehy;ceived',
-    'con&rehy;centrating',
-    'con&rehy;cern',
-    'con&rehy;cessional',
-    'con&rehy;fidences',
-    'con&rehy;firming',
-    'con&rehy;front',
-    'con&rehy;fused',
-    'con&rehy;nors',
-    'con&rehy;quer',
     'con&rehy;servatory',
-    'con&rehy;sonance',
-    'con&rehy;strained',
-    'con&rehy;straining',
-    'con&rehy;taining',
-    'con&rehy;templated',
-    'con&rehy;testants',
-    'con&rehy;tested',
-    'con&rehy;tingents',
-    'con&rehy;tracted',
-    'con&rehy;triving',
-    'con&rehy;versational',
-    'con&rehy;versations',
-    'con&rehy;version',
-    'con&rehy;vincing',
-    'con\'s.',
     'con-artist',
-    'con-artists',
-    'con-ceded',
-    'con-dis-corde',
-    'con-ducting',
-    'con-flict',
-    'con-founders',
-    'con-fronted',
-    'con-fusing',
-    'con-lib',
-    'con-on-the-run',
-    'con-ordinates',
-    'con-sent',
-    'con-sequences',
-    'con-stant',
-    'con-strict',
     'con-tact',
-    'con-tent',
-    'con.e',
-    'con29',
-    'con=',
-    'conachair',
-    'conacre',
-    'conacuid',
-    'conae',
-    'conaf',
-    'conaghty',
-    'conain',
-    'conaing',
-    'conair',
-    'conant',
-    'conary',
     'conatively',
-    'conbac',
-    'conbined',
-    'conbloc',
-    'conbrough',
-    'conbservators',
-    'concairned',
-    'concanon',
-    'concass&eacute;es',
-    'concasse',
-    'concatamers',
-    'concauous',
-    'concavities',
-    'concealing-sheet',
-    'concecutive',
-    'concedique',
     'conceed',
-    'conceedes',
-    'conceeding',
-    'concelebrant',
-    'concentr',
-    'concentr&eacute;s',
-    'concentra-ting',
-    'concentraci&oacute;n',
-    'concentrat',
-    'concentratd',
-    'concentrated-beam',
-    'concentratin\'',
-    'concentrating-so-hard',
-    'concentrating_on_the',
-    'concentration&mdash&mdash',
-    'concentration\'',
     'concentration-1time-1',
-    'concentration-dependence',
-    'concentration-driven',
-    'concentration/new',
-    'concentration=0.4',
-    'concentrational',
-    'concentrationmay',
-    'concentrations.',
-    'concentratiown',
-    'concentred',
-    'concentres',
-    'concentric-layer',
-    'concentric.',
-    'concentrtion',
-    'concentyraqted',
-    'concep&rehy;tion',
     'concep&rehy;tualization',
-    'concept(s)',
-    'concept-abstraction',
-    'concept-bound',
-    'concept-equivalence',
-    'concept-forming',
-    'concept-image',
-    'concept-laden',
-    'concept-learning',
-    'concept-words',
-    'concept/keywords',
-    'concept/you',
-    'conceptpresumably',
-    'concepts/keyword',
-    'conceptu',
-    'conceptua',
     'conceptualises',
-    'conceptualists',
-    'conceptuality',
-    'conceptualizable',
-    'concer&rehy;tos',
-    'concerences',
-    'concern/eoc',
-    'concernant',
-    'concerned\'',
-    'concerned-but',
-    'concerned-for',
-    'concerned-looking',
-    'concerns&mdash;a',
-    'concert-',
-    'concert-drama',
-    'concert-managers',
     'concert-masters',
-    'concert-party',
-    'concert-platform',
-    'concertare',
-    'concertata',
-    'concertate',
-    'concertato',
-    'concertgebouw/decca',
-    'concertgebouw/flor',
-    'concertgebouw/harnoncourt',
-    'concertgebouw/jarvi',
-    'concerthall',
-    'concertina-folded',
-    'concertina-style',
-    'concertinered',
-    'concerto-king/mackintosh/',
     'concerto-style',
-    'concerto.robin',
-    'concertos.',
-    'concession-holders',
-    'concession-making',
-    'concession.',
-    'concession/contract',
-    'concessions.',
-    'concessions_in_respect',
-    'concessively',
-    'concevons',
-    'conch-shells',
-    'conches',
-    'conchie',
-    'conchiolin',
-    'concho-spirals',
     'conchobar',
-    'conchoidal',
-    'conchoids',
-    'conchubar',
-    'conchy',
-    'conci&egrave;rge',
-    'concidered',
-    'conciding',
-    'concience',
-    'concierge-type',
-    'concierto',
-    'concieve',
-    'concieving',
-    'conciliaci&oacute;n',
-    'conciliarism',
-    'conciliarists',
     'conciliation-if',
-    'conciliations',
-    'conciola',
-    'concipio',
-    'conclu&rehy;sions',
-    'concludion',
-    'conclusion-on',
-    'conclusion/evaluation',
-    'conclusions&mdash',
-    'conclusions/recommendations',
-    'conclusiouns/',
-    'conclusus',
-    'concocter',
-    'concoined',
-    'concolors',
-    'concombre',
     'concominants',
-    'concomittant',
-    'concomittantly',
-    'concommitant',
-    'concommitants',
-    'concordancer',
-    'concordancers',
-    'concordancing',
-    'concorde\'',
-    'concorde-like',
-    'concorde-replacement',
-    'concordski',
-    'concorede',
-    'concorno',
-    'concrete&rehy;embedded',
-    'concrete-and-steel',
     'concrete-balconied',
-    'concrete-based',
-    'concrete-coloured',
-    'concrete-encased',
-    'concrete-faced',
-    'concrete-grey',
-    'concrete-like.',
-    'concrete-mixer',
-    'concrete-operational',
-    'concrete-panelled',
-    'concrete-poetry',
-    'concrete-reinforcement',
-    'concrete-sided',
-    'concrete-walled',
-    'concrete/asphalt',
-    'concrete/glass',
     'concrete/scientific',
-    'concretes',
-    'concretescape',
-    'concretisation',
-    'concretise',
-    'concretised',
-    'concretize',
-    'concretizing',
-    'concubinist',
-    'concubitus',
-    'conculcavit',
-    'concupiscendo',
-    'concupiscit',
-    'concurrent\'',
-    'concurrent/terminal',
-    'concurrently.',
     'concurve',
-    'concuss',
-    'concussing',
-    'concussions',
-    'concussively',
-    'cond',
-    'condado',
-    'condamine',
-    'condemna',
-    'condemnatio',
-    'condemnation.',
-    'condemned&rehy;to-death',
-    'condemneth',
-    'condens',
-    'condensa',
-    'condensation-covered',
     'condensation.',
-    'condensation/displacement',
-    'condensations',
-    'condenser-type',
-    'condensers.',
-    'condensible',
-    'condensite',
-    'conderation',
-    'condescendence',
-    'condi',
-    'condicio',
-    'condicionem',
-    'condicionis',
-    'condidate',
-    'condidered',
-    'condintions',
     'condition&mdash',
-    'condition&mdash;consequence',
-    'condition(s)',
-    'condition-cc',
-    'condition-effect',
-    'condition.they',
-    'condition/consequence',
-    'condition/player',
-    'condition_rather',
-    'conditional-roughly',
-    'conditional/',
-    'conditionalibus',
-    'conditionalising',
-    'conditioned-unconditioned',
-    'conditioned/heat',
-    'conditionis',
     'conditions&mdash;an',
-    'conditions&mdash;and',
-    'conditions-of',
-    'conditions-say',
-    'conditions-unemployment',
-    'conditions/loads',
-    'conditorio',
-    'condits.',
-    'condolence-letter',
-    'condoling',
-    'condom-dispensing',
-    'condom-like',
-    'condom-thin',
-    'condom-use',
-    'condomeria',
-    'condominium\'',
     'condomme',
-    'condoratt',
-    'condore',
-    'condotti',
-    'condottiero',
-    'condra',
-    'condrieu',
-    'condron',
-    'condu',
-    'conduc&rehy;ted',
-    'conduct&mdash;for',
-    'conduct-based',
-    'conducter',
-    'conducteur&bsol;conductor',
-    'conductivity-temperature-depth',
-    'conductor\'s-eye',
     'conductor-ceo',
-    'conductor-in-chief',
-    'conductor-led',
-    'conductor-posts',
-    'conductor-trainees',
-    'conductor.',
-    'conductor/composer',
-    'conductor/orchestra',
-    'conductorship',
-    'conduire/conducteur',
-    'conduisait',
-    'conduit-point',
-    'conduit/overhead',
-    'condylactis',
-    'condylar',
-    'condylomatous',
     'cone&mdash',
-    'cone&rehy;beakers',
-    'cone-bearing',
-    'cone-pointed',
-    'cone.',
-    'conectigon',
-    'coned-shape',
-    'coneflower',
-    'conefo',
-    'conegarry',
-    'conegliano',
-    'conelly/gym',
-    'conerney',
-    'conerning',
-    'conero',
-    'conert',
     'coneygate',
-    'conf&eacute;r&eacute;e',
-    'conf&eacute;rence',
-    'confa',
-    'confabs',
-    'confabulate',
-    'confabulators',
-    'confacs',
-    'confalonieri',
-    'confect',
-    'confected',
-    'confectioner/newsagent/tobacconist',
-    'confectioneri',
-    'confectioneries',
-    'confectionery-loving',
-    'confectionery.',
     'confects',
-    'confedera&ccedil;ao',
-    'confederacion',
-    'confederating',
-    'confederations.9',
-    'confederative',
-    'confen',
-    'confeniae',
-    'confer&ecirc;nce',
-    'conferation',
-    'conferderation',
-    'confere',
-    'conferee',
-    'confereence',
-    'conference-attending',
-    'conference-based',
     'conference-calling',
-    'conference-going',
-    'conference-holding',
-    'conference-led',
-    'conference-papers',
-    'conference-reconciled',
-    'conference-related',
-    'conference-rooms',
-    'conference-style',
-    'conference/courses',
-    'conference/exhibition',
-    'conferencees',
-    'conferencemanship',
-    'conferences/courses',
-    'conferences/exhibitions',
-    'conferencia',
     'conferes',
-    'confering',
-    'confertech',
-    'confesercenti',
-    'confess\'t',
-    'confess-only',
-    'confesse&lsqb;d&rsqb',
-    'confessionale',
-    'confessione',
-    'confessore',
-    'confest',
-    'confeteor',
-    'confetti-gunge',
-    'confetti-like',
-    'confetty',
-    'confex',
     'confi',
-    'confianza',
-    'confided-to',
-    'confidence-boost',
-    'confidence-builder',
-    'confidence-creating',
-    'confidence-promoting',
-    'confidence-rebuilding',
-    'confidence-undermining',
-    'confident-looking',
-    'confident/tentative',
-    'confidental',
-    'confidentally',
-    'confidentia',
-    'confidential.and',
-    'confidentiality-based',
     'confidentiality/fraud',
-    'config&mdash;man',
-    'config&mdash;man.lifespan.lslive.s1234',
-    'configuration(s)',
-    'configurations.',
-    'configure-to-order',
-    'configurement',
-    'confim',
-    'confimation',
-    'confimed',
-    'confin',
-    'confin\'d/my',
-    'confinemnent',
-    'confineth',
-    'confir',
-    'confirmands',
     'confirmation\'',
-    'confirmers',
-    'confirmthat',
-    'confiscated.',
-    'confiscates',
-    'confiscatted',
-    'conflabs',
-    'conflations',
-    'confli',
-    'conflict\'',
-    'conflict-adjustment',
-    'conflict-of-interest',
-    'conflict-prevention',
-    'conflict-producing',
-    'conflict-prone',
-    'conflict-related',
     'conflict-riven',
-    'conflict-torn',
-    'conflict/cooperation',
-    'confliction',
-    'conflictive',
-    'conflicts-of-interest',
-    'confluence-english',
-    'confluently',
-    'confluents',
-    'conford',
-    'conformalities',
-    'conformation.',
-    'conformationally',
-    'conformity-base',
-    'conformo',
-    'confortans',
     'confortis',
-    'confrere',
-    'confreres',
-    'confron',
-    'confront&rehy;ing',
-    'confronta&rehy;tion',
-    'confrontaciones',
-    'confrontation-point',
-    'confrontationalism',
-    'confrontationist',
-    'confrontations.',
-    'confronter',
-    'confronti',
-    'confucian-style',
-    'confucionism',
-    'confucious',
     'confued',
-    'confusa',
-    'confusables',
-    'confused-elderly',
-    'confuseurs',
-    'confusion-that',
-    'confusion.the',
-    'confusionism',
-    'confusioun',
-    'confussed',
-    'confutable',
-    'cong-held',
-    'cong-san',
-    'conga-line',
-    'congatulating',
-    'congdell',
     'congee',
-    'congeith',
-    'congelation',
-    'congemiscens',
-    'congener',
-    'congenic',
-    'congerie',
-    'congerton',
-    'congesting',
-    'congestion-busting',
-    'congests',
-    'congle',
-    'congles',
-    'conglobata',
-    'conglomerata',
-    'conglomerateers',
     'conglomerateur',
-    'conglomeratic',
-    'conglomerating',
-    'conglomeratisation',
-    'congolensis',
-    'congr',
-    'congrat-ulate',
-    'congrations',
-    'congratters',
-    'congratu&rehy;lated',
-    'congratulatingly',
-    'congratulations/commiserations',
-    'congratulators',
-    'congrega-tions',
-    'congregatio',
-    'congregationals',
     'congresbury',
-    'congress-led',
-    'congress-ruled',
-    'congress-run',
-    'congress-the',
-    'congress110',
-    'congressed',
-    'congressphotograph',
-    'congretation',
-    'congrieve',
-    'congruentia',
-    'congruently',
-    'congruously',
-    'congsoc',
-    'conguered',
-    'conholt',
     'coni/regatta',
-    'conibear',
-    'conibear/education',
-    'conical-roofed',
-    'conically-roofed',
-    'conican',
-    'conicide',
-    'conics',
-    'conifer-covered',
-    'conifer-forested',
-    'conifer-shaped',
-    'conifera',
-    'coniferae',
-    'coniferophyta',
-    'coniger',
-    'conigli',
     'coniophora',
-    'conisation',
-    'conisholme',
-    'coniston-ulverston',
-    'coniunction',
-    'conival',
-    'conizaoides',
-    'conj.',
-    'conjectandi',
-    'conjestion',
-    'conjoncture',
-    'conjours',
-    'conjuctiv',
-    'conjuctivitus',
-    'conjugal/maternal',
-    'conjugale',
     'conjugally',
-    'conjugation-causing',
-    'conjugators',
-    'conjugo',
-    'conjunc&rehy;ture',
-    'conjuncte',
-    'conjunctive-type',
-    'conjunctively',
-    'conjunctly',
-    'conjuncts.',
-    'conjuncturally',
-    'conjungated',
-    'conjur',
-    'conjurers',
-    'conjuring-trick',
-    'conjux',
     'conker-age',
-    'conker-caskets',
-    'conker-red',
-    'conkering',
-    'conks',
-    'conlay',
-    'conlisk',
-    'conlon/churchill',
-    'conlon/john',
-    'conlons',
-    'conludes',
-    'conmfortably',
-    'conmmunications',
-    'conmservative',
-    'conmunity',
-    'conmy',
     'conn&acirc;itre',
-    'conna&icirc;t',
-    'connagh',
-    'connais-tu',
-    'connaisseur',
-    'connait',
-    'connaitre',
-    'connallys',
-    'connant',
-    'connard',
-    'connarty',
-    'connatural',
-    'connaught-trained',
-    'conne',
-    'connect-time',
-    'connect400',
     'connecta',
-    'connectable',
-    'connected.',
-    'connectedly',
-    'connectigons',
-    'connecting/secondary',
-    'connection-activation',
-    'connection-must',
-    'connection-oriented',
-    'connections-is',
-    'connectivity-compliant',
-    'connectivity.',
-    'connectivus',
-    'connectology',
-    'connector.',
-    'connector/support',
     'connectors.',
-    'conneely',
-    'connell.the',
-    'connellies',
-    'connelly/base',
-    'connelly/hereford',
-    'connelpark',
-    'connerton',
-    'connex',
-    'connexion.',
-    'connexions.',
-    'connexiunei',
-    'connifer',
-    'connin',
-    'connivin\'',
-    'connnected',
     'connnecticut-based',
-    'connnections',
-    'connock',
-    'connoiseur',
-    'connoisseurial',
-    'connoissuers',
-    'connolley',
-    'connolly/comedian',
-    'connoly',
-    'connon/relief',
-    'connop',
-    'connor-c&oacute;mez',
-    'connor-trained',
-    'connor/head',
-    'connor/pearson',
-    'connors/former',
     'connorton',
-    'connorton/thames',
-    'connotate',
-    'connotated',
-    'connotational',
-    'connswater',
-    'connubium',
-    'connurbations',
-    'conoca',
-    'conodont-bearing',
-    'conodonta',
-    'conoisseur',
-    'conoley',
-    'conolophus',
-    'conoly',
-    'conomedusites',
     'conomics',
-    'conopoderas',
-    'conort',
-    'conortoxin',
-    'conose',
-    'conoway',
-    'conpanies',
-    'conpiracy',
-    'conqu&eacute;rant',
-    'conqu&ecirc;te',
-    'conque',
-    'conquer\'',
-    'conquerour',
-    'conquests.',
-    'conquist',
-    'conquistadorial',
     'conquy',
-    'conrad&num',
-    'conradh',
-    'conradinum',
-    'conrado',
-    'conrads',
-    'conran-designed',
-    'conray',
-    'conribution',
-    'conrie',
-    'conrig',
-    'conrodd',
-    'conrol',
-    'cons&rehy;traint',
-    'consa',
-    'consagra',
     'consallen',
-    'consanguineus',
-    'consanguinitatis',
-    'consarn',
-    'consatble',
-    'consc',
-    'conscience-mad',
-    'conscience-prodding',
-    'conscience-seeking',
-    'conscienscious',
-    'conscientious-objector',
-    'conscientiously-held',
-    'conscientise',
-    'conscientised',
-    'conscientize',
-    'conscientous',
     'conscio',
-    'consciopus',
-    'conscious.of',
-    'consciousl1ess',
-    'consciouslessly',
-    'consciously-realized',
-    'consciousness-altering',
-    'consciousness-creating',
-    'consciousness-expanding',
-    'consciousness-generator',
-    'consciousness-of',
-    'consciousness-say',
-    'consciousness-the',
-    'consciousness.these',
-    'consciousness/irrational',
-    'consciousness/relaxation',
     'consclence',
-    'conscrip',
-    'conscription.',
-    'conse',
-    'consecrat',
-    'consecrated.',
-    'consecrates',
-    'consecurive',
-    'consecutions',
-    'consecutive-spill',
-    'conseiller',
-    'conseillers',
-    'conseils-sondages-analyses',
-    'consejos',
-    'conselheiro',
-    'consensous',
     'consensuality',
-    'consensus&rehy;seeking',
-    'consensus-backed',
-    'consensus-run',
-    'consentants',
-    'consentement',
-    'consentimiento',
-    'consentingly',
-    'consentrated',
-    'consents.',
-    'consenus',
-    'consenvoye',
-    'consequences-seeking',
-    'consequencies',
-    'consequentiall',
-    'consequentials',
     'consequentlie',
-    'conser',
-    'conserable',
-    'conserservative',
-    'conserted',
-    'conserto',
-    'conserv',
-    'conserv&eacute;e',
-    'conserv.',
-    'conserv.ism/reaction',
-    'conservacion',
-    'conservando',
-    'conservatation',
-    'conservating',
-    'conservation-friendly',
-    'conservation-related',
     'conservation-the',
-    'conservation/',
-    'conservation/efficiency',
-    'conservation/environmental',
-    'conservation/management',
-    'conservationally',
-    'conservatising',
-    'conservatism\'',
-    'conservative&mdash;transformist',
-    'conservative-backed',
-    'conservative-clerical',
-    'conservative-communist',
-    'conservative-created',
-    'conservative-inclined',
-    'conservative-mod',
-    'conservative-radical',
     'conservative-right',
-    'conservative-suit-mod',
-    'conservative-supported',
-    'conservative-tinged',
-    'conservative-waged',
-    'conservative-won',
-    'conservative/democratic',
-    'conservative3589',
-    'conservatively-minded',
-    'conservatively-striped',
-    'conservativeness',
-    'conservatives&mdash;to',
-    'conservatives/hardliners',
-    'conservator.but',
-    'conservatori',
-    'conservatorie',
     'conservatorship',
-    'conservatory-like',
-    'conservatory-style',
-    'conservatory-type',
-    'conserveatory',
-    'conserved.',
-    'conservenfabriek',
-    'conserver',
-    'consessions',
-    'conshi',
-    'conshohocken',
-    'consi',
-    'consid&eacute;r&eacute;e',
-    'consid&eacute;rablement',
-    'consid&eacute;rant',
-    'consid\'ring',
     'consider&mdash;that',
-    'consider-',
-    'consider-these',
-    'consider/',
-    'consider5able',
-    'consider_in',
-    'considera',
-    'considerably-from',
-    'considerably.',
-    'considerably_more',
-    'consideration&mdash;cash',
-    'consideration\'',
-    'consideration.what',
-    'considerations&ndash',
-    'considered.in',
-    'considerin\'',
     'considering&mdash;goods',
-    'consier',
-    'consign&rehy;ments',
-    'consignatie',
-    'consignations',
-    'consignee-bank',
-    'consignee-creditor',
-    'consigner',
-    'consignor-beneficiary',
-    'consilia',
-    'consiros',
-    'consis',
-    'consisstincy',
-    'consistance',
-    'consistancy',
-    'consistantly',
     'consisted.',
-    'consistency\'',
-    'consistency/organizational',
-    'consistentalignment',
-    'consistentia',
-    'consisteth',
-    'consited',
-    'consitituency',
-    'consituency',
-    'consituents',
-    'consitute',
-    'conslequence',
-    'conslusion',
-    'consociates',
-    'consol',
-    'consol&rehy;ing',
     'consolably',
-    'consolamentum',
-    'consolationf',
-    'consolatoria',
-    'consolatrice',
-    'console-table',
-    'consolers',
-    'consoles-dessertes',
-    'consolid',
-    'consommateur',
-    'consonant-cracking',
-    'consonant-group',
-    'consonant-vowel-constant',
-    'consonant/',
-    'consonant/vowel',
-    'consonante',
     'consonants-groups',
-    'consorcio',
-    'consortia-devised',
-    'consortia-organized',
-    'consortium-developed',
-    'conspicuousness_per',
-    'conspiraccy',
-    'conspiracy-minded',
-    'conspiracy.',
-    'conspiracy/sabotage',
-    'conspiracytheory',
-    'conspiratual',
-    'conspiritors',
-    'consrtuction',
-    'conssidered',
-    'const.',
     'constable&mdash',
-    'constable-',
-    'constable/gloucestershire',
-    'constable/warden',
-    'constable/warwickshire',
-    'constableship',
-    'constaine',
-    'constan&tcedil;a',
-    'constandse',
-    'constaninina',
-    'constant-frequency',
-    'constant-level',
-    'constant-speed',
-    'constant-until',
-    'constant-velocity',
-    'constantijn',
     'constantines',
-    'constantinope',
-    'constantinopolitan',
-    'constantinus',
-    'constantly-changing',
-    'constantly-dripping',
-    'constantly-grinning',
-    'constantly-replaced',
-    'constantly.',
-    'constantly.but',
-    'constanza&mdash;oh',
-    'constanza&mdash;she',
-    'constative',
-    'constella',
-    'constellated',
-    'constellation.',
     'constent',
-    'consti&rehy;tuting',
-    'constipation-pain-retention',
-    'constipation/soiling',
-    'constipations',
-    'constipatiown',
-    'constit',
-    'constitently',
-    'constituant',
-    'constitucional',
-    'constituencies.',
-    'constituency-by-constituency',
-    'constituency-level',
-    'constituent-member',
-    'constituent/consumer',
-    'constituent/phrase-structure',
     'constituional',
-    'constitutary',
-    'constitutency',
-    'constitution-building',
-    'constitutional/legal',
-    'constitutionalization',
-    'constitutionalize',
-    'constitutionalized',
-    'constitutionally-elected',
-    'constitutionally-entrenched',
-    'constitutionally-sanctioned',
-    'constitutionals',
-    'constitutionnel',
-    'constitututed',
-    'constrainedly',
-    'constraint-',
     'constraints/rewards',
-    'constrair',
-    'constrast',
-    'constri',
-    'constrictively',
-    'construc&rehy;tional',
-    'construct.',
-    'constructed-data',
-    'constructed-sentence',
-    'constructedness',
-    'constructhor',
-    'construction-industry',
-    'construction-projects',
-    'construction-worker',
-    'constructional/linguistic',
-    'constructionn',
     'constructionplas',
-    'constructively.',
-    'constructokit',
-    'constructs.',
-    'constructs/explains',
-    'constructural',
-    'construed.',
-    'construendum',
-    'construx',
-    'construzioni',
-    'consts',
-    'constsnt',
-    'constucted',
-    'constucting',
-    'consuetudinibus',
-    'consul-',
     'consulage\'',
-    'consularibus',
-    'consulats',
-    'consules',
-    'consuli',
-    'consulktants',
-    'consult&rehy;ation',
-    'consultancy-oriented',
-    'consultant-free',
-    'consultant-promoter',
-    'consultant-type',
-    'consultant.foxpro',
-    'consultat',
-    'consultate',
-    'consultation/collaboration',
-    'consultation/exercises/exhibitions',
     'consultation/new',
-    'consultation/team',
-    'consultation_with',
-    'consultations.',
-    'consultative/participative',
-    'consultative/support',
-    'consultattion',
-    'consulted.',
-    'consultive',
-    'consultum',
-    'consum\'st',
-    'consumables&mdash;such',
-    'consumated',
-    'consumed-productivity',
-    'consumer\'s-eye',
-    'consumer-',
     'consumer-advice',
-    'consumer-based',
-    'consumer-citizens',
-    'consumer-conscious',
-    'consumer-driven',
-    'consumer-durables',
-    'consumer-guides',
-    'consumer-industry',
-    'consumer-level',
-    'consumer-loan',
-    'consumer-product',
-    'consumer-related',
-    'consumer-responsive',
-    'consumer-responsiveness',
-    'consumer-side',
-    'consumer-style',
     'consumer-voters',
-    'consumer/borrower',
-    'consumer/patient',
-    'consumerised',
-    'consumerisrn',
-    'consumeristic',
-    'consumers\'association',
-    'consumers-aid',
-    'consumers-in-the-making',
-    'consumers/users',
-    'consumers/voters',
-    'consumism',
-    'consummately-executed',
-    'consummates',
-    'consummatum',
-    'consumos',
     'consumpcon',
-    'consumption&mdash;production',
-    'consumption-',
-    'consumption--has',
-    'consumption-generating',
-    'consumption-reproduction',
-    'consumption-sector',
-    'consumption-sharing',
-    'consumption.',
-    'consumption/low',
-    'consumptionist',
-    'consv',
-    'consyderations',
-    'cont&ndash;in',
-    'cont=',
-    'contact&rehy;sign',
     'contact\'',
-    'contact(s)',
-    'contact-a-family',
-    'contact-breaker',
-    'contact-called',
-    'contact-lenses',
-    'contact-mediated',
-    'contact-poison',
-    'contact-rate',
-    'contact-rates',
-    'contact-scanning',
-    'contact-tracer',
-    'contact-welder',
-    'contact/gesticulation',
-    'contact/initials',
-    'contact/the',
     'contact:0434',
-    'contactee',
-    'contactees',
-    'contactless',
-    'contacts.',
-    'contacts:news',
-    'contactual',
-    'contadino',
-    'contaiminated',
-    'containammunition',
-    'container(s)',
-    'container-raised',
-    'container-truck',
-    'containerisation',
-    'containers\'',
-    'containers.',
     'containerships',
-    'containing10%',
-    'contains-file',
-    'contains-file&lsqb;file',
-    'contains-file&lsqb;nam.typ&rsqb',
-    'contains-file&lsqb;nam2.typ&rsqb',
-    'contaloc',
-    'contam&rehy;ination',
-    'contamina-xxxx',
-    'contamination-free',
-    'contamination-prone',
-    'contaminations',
-    'contan',
-    'contangos',
-    'contant',
-    'contants',
     'contary',
-    'contat',
-    'contati',
-    'contd.',
-    'contel',
-    'contem&rehy;poraneous',
-    'contem-',
-    'contemner',
-    'contemnor.',
-    'contemplacionis',
-    'contemplacioun',
-    'contemplacyon',
-    'contemplated.',
-    'contemplativa',
-    'contemplatyf',
-    'contempor&aacute;neo',
     'contempor&agrave;neo',
-    'contemporary-style',
-    'contempories',
-    'contemporizes',
-    'contemptibility',
-    'contemptibleness',
-    'contemptibly',
-    'contemptuated',
-    'contemptuousness',
-    'contemptus',
-    'conten&rehy;tious',
-    'contenant',
-    'contenderbookmakers',
-    'content-addressable',
-    'content-addressing',
-    'content-analysis',
     'content-coverage',
-    'content-dominated',
-    'content-driven',
-    'content-length',
-    'content-orientated',
-    'content-say',
-    'content-searching',
-    'content-sequence',
-    'content-versus-form',
-    'content-wise',
-    'content-word',
-    'content/form',
-    'content/numbers',
-    'content/outcomes',
-    'contente',
-    'contente-toi',
     'contenter',
-    'contentieuses',
-    'contentieux',
-    'contentin',
-    'contention.',
-    'contentions.',
-    'contentious-administrative',
-    'contentless',
-    'contently',
-    'contentus',
-    'contentz',
-    'contenu',
-    'contenzioso',
-    'conterfete',
-    'contervailing',
-    'contessas',
     'contessina',
-    'contest-type',
-    'contest.anglia',
-    'contest.the',
-    'contest/mainstream',
-    'contest/ramp',
-    'contestative',
-    'context(s)',
-    'context*',
-    'context-',
-    'context--notably',
-    'context-complementary',
-    'context-concept',
-    'context-conditional',
-    'context-derived',
-    'context-description',
     'context-driven',
-    'context-establishing',
-    'context-identifying',
-    'context-invariant',
-    'context-laden',
-    'context-less',
-    'context-name',
-    'context-produced',
-    'context-relativity',
-    'context-table(s)',
-    'context-target',
-    'context.5',
-    'context_even',
-    'contexts-compare',
-    'contexts.',
-    'contextual/thematic',
     'contextualism',
-    'contextualist',
-    'contextualist/historical',
-    'contextualists',
-    'contextuality',
-    'conteyne',
-    'conteyning',
-    'conthe',
-    'conti.',
-    'conticello',
-    'contig-building',
-    'contigorder',
-    'contiguous.',
-    'contiguousness',
-    'continebar',
-    'continent-by-continent',
     'continent-carrying',
-    'continent-derived',
-    'continent-sized',
-    'continent-spanning',
-    'continent-wandering',
-    'continent/ocean',
-    'continental-crust',
-    'continental-scale',
-    'continental-seven',
-    'continental-simple',
-    'continentale',
-    'continentals-despising',
-    'conting',
-    'contingence',
-    'contingency/emergency',
-    'contingent-claims',
     'contingent-commanders',
-    'continu',
-    'continuallye',
-    'continuants',
-    'continuatio',
-    'continuatives',
-    'continue\'is',
-    'continue-play',
-    'continueing',
-    'continuen',
-    'continuing.',
-    'continuing.s',
-    'continuing.sgs-thomson',
-    'continuingly',
-    'continuingviolence',
-    'continuities/discontinuities',
     'continuous&mdash;i',
-    'continuous&ndash;from',
-    'continuous-composite',
-    'continuous-extraction',
-    'continuous-movement',
-    'continuous-operations',
-    'continuous-sprung',
-    'continuous-wave',
-    'continuous-welding',
-    'continuously-published',
-    'continuously-variable',
-    'continuously.',
-    'continuously.variable',
-    'continuously/fighting',
-    'continuting',
-    'continuum.',
     'continuus',
-    'continuwing',
-    'contio',
-    'contis',
-    'contitrade',
-    'contnts',
-    'contnuing',
-    'contol',
-    'contolled',
-    'contometer',
-    'conton',
-    'contone',
-    'contorionist',
-    'contortionism',
-    'contortionists',
-    'contour-band',
     'contour-couch',
-    'contour-designed',
-    'contour-girdle',
-    'contour-line',
-    'contoured-glass',
-    'contoux',
-    'contr&ocirc;leurs',
-    'contra-account',
-    'contra-cases',
-    'contra-ceptives',
-    'contra-cyclical',
-    'contra-discourse',
-    'contra-flows',
-    'contra-intuitive',
-    'contra-laid',
-    'contra-supporting',
     'contraalmirante',
-    'contraceptions',
-    'contract&mdash;alive',
-    'contract&mdash;and',
-    'contract&mdash;are',
-    'contract&mdash;between',
-    'contract&mdash;eg',
-    'contract&mdash;he',
-    'contract&mdash;in',
-    'contract&mdash;leaving',
-    'contract&mdash;seller',
-    'contract\'',
-    'contract-awarding',
-    'contract-breaker',
-    'contract-fixing',
-    'contract-funded',
     'contract-hired',
-    'contract-including',
-    'contract-law',
-    'contract.exclusion',
-    'contract.section',
-    'contract/corporate',
-    'contract/wages',
-    'contract_at',
-    'contract_in',
-    'contracting-in',
-    'contracting/franchising',
-    'contraction&times;mean',
-    'contractions/minute&times',
-    'contractive',
-    'contractor\'',
-    'contractor-built',
     'contractor/',
-    'contractor/repairer',
-    'contractor/retailer',
-    'contractorising',
-    'contractorization',
-    'contractors_in',
-    'contractorship',
-    'contractraven',
-    'contracts&mdash;exclusions',
-    'contracts&mdash;for',
-    'contracts&mdash;see',
-    'contracts*',
-    'contracts/family',
-    'contractso',
-    'contractthe',
-    'contractualising',
     'contractualists',
-    'contractually-incorporated',
-    'contractural',
-    'contracture',
-    'contracyclical',
-    'contrada',
-    'contradicente',
-    'contradict\'ry',
-    'contradicter',
-    'contradictions.',
-    'contradictious',
-    'contradictor',
-    'contradictories',
-    'contraflexion',
-    'contraflows',
-    'contrain',
     'contraindicate',
-    'contraints',
-    'contraire',
-    'contralateral+aer',
-    'contralateral-directed',
-    'contraprojection',
-    'contrapuntalism',
-    'contrapuntally',
-    'contrari&eacute',
-    'contrarians',
-    'contrarieties',
-    'contrary-insinuations',
-    'contrast-exalting',
-    'contrast-reversing',
-    'contrast-stretched',
-    'contrast-trimmed',
     'contrast/hatching',
-    'contrastable',
-    'contrasted.',
-    'contrasting/complementary',
-    'contrasts.',
-    'contrasuggestible',
-    'contratenor',
-    'contration',
-    'contrats',
-    'contrattazione',
-    'contraversial',
-    'contraversions',
-    'contre-danse',
-    'contre-filet',
-    'contre-jour',
-    'contrebandiers',
     'contredanse',
-    'contrepoinct',
-    'contreras/hotel',
-    'contreversial',
-    'contri',
-    'contrib',
-    'contrib.',
-    'contribition',
-    'contribitions',
-    'contribu&rehy;tory',
-    'contribut',
-    'contributaries',
-    'contributary',
-    'contributes_a',
-    'contributi',
-    'contributin',
     'contribution-free',
-    'contribution-related',
-    'contributional',
-    'contributors/demonstrators',
-    'contrinuously',
-    'contriteness',
-    'contritional',
-    'contrivd',
-    'contrivedly',
-    'contriver',
-    'contrivers',
-    'control&eacute;e',
-    'control&mdash',
-    'control&mdash;little',
-    'control&rehy;autonomy',
-    'control+kqx',
     'control+shift+q',
-    'control-and-pass',
-    'control-demographic',
-    'control-gear',
-    'control-head',
-    'control-panel',
-    'control-posts',
-    'control-pulses',
-    'control-showing',
-    'control-system',
-    'control-turn-shot',
-    'control-voltage',
-    'control.001',
-    'control.ini',
-    'control/budget',
-    'control/commercial',
     'control/constraint',
-    'control/cultural',
-    'control/data',
-    'control/display',
-    'control/influence',
-    'control/patronage',
-    'control/pull',
-    'control/regulation',
-    'control/taste',
-    'control/transmitter',
-    'control:rats',
-    'controlability',
-    'controle',
-    'controllables',
-    'controlled&mdash;he',
-    'controlled-release',
     'controlled/',
-    'controller-based',
-    'controller/memory',
-    'controller/superdrug',
-    'controls/feedback',
-    'controlwise',
-    'contronics',
-    'controul',
-    'controv',
-    'controversa',
-    'controversally',
-    'controversery',
-    'controversiality',
-    'controversially-received',
-    'controversy.2',
-    'controversy.pat',
     'controversy/debate',
-    'controvertible',
-    'controverting',
-    'controverts',
-    'controvery',
-    'controvesy',
-    'contrry',
-    'contrubute',
-    'contruct',
-    'contructed',
-    'contrued',
-    'contry',
-    'contucci',
-    'contumaciously',
-    'contumelious',
-    'contused',
     'contynuly',
-    'conuersion',
-    'conulariid',
-    'conur&rehy;bation',
-    'conures',
-    'convaincus',
-    'conval',
-    'convallaria',
-    'conve&rehy;niently',
-    'convection-chamber',
-    'convection/microwave',
-    'convector-cum-night',
-    'convectoradd',
-    'convects',
-    'conveived',
-    'convena',
     'convenae',
-    'convenarum',
-    'convenc&iacute;on',
-    'convenership',
-    'convenience\'',
-    'convenient-instead',
-    'convenient-sized',
-    'conveniently-shaped',
-    'conveniently-sited',
-    'convenio',
-    'convenit',
-    'convent\'-ional',
-    'convent.',
-    'convent/retreat',
-    'conventa',
-    'convented',
     'convential',
-    'conventially',
-    'convention&mdash;as',
-    'convention-',
-    'convention-based',
-    'convention-breaking',
-    'convention-counting',
-    'convention-mocking',
-    'convention-rooted',
-    'convention.',
-    'convention/and',
-    'conventional+upper',
-    'conventional-looking',
-    'conventional-weapon',
-    'conventional/nuclear',
-    'conventional/street',
     'conventionalisms',
-    'conventionally-defined',
-    'conventionally-desirable',
-    'conventionally-ornamented',
-    'conventionally-woven',
-    'conventionary',
-    'conventioneer',
-    'conventum',
-    'convenz',
-    'convergencies',
-    'convergency',
-    'conversance',
-    'conversation&rehy;stopper',
-    'conversation-based',
-    'conversation-initial',
-    'conversation-like',
     'conversation-wise',
-    'conversation/interview',
-    'conversationd',
-    'conversationist',
-    'conversationists',
-    'conversative',
-    'conversatives',
-    'conversazzione',
-    'converse/with',
-    'conversion-kits',
-    'conversion/call',
-    'conversion/entry',
-    'conversionbut',
-    'conversions.',
-    'converso',
-    'converstion',
     'convertase',
-    'convex-downward',
-    'convexus',
-    'convey&rehy;ing',
-    'convey/thames',
-    'convey/transfer',
-    'conveyable',
-    'conveyance/',
-    'conveyance/transfers',
-    'conveyancing&mdash;a',
-    'conveyancing-based',
-    'conveyed/transferred',
-    'conveyor-belts',
-    'conveythe',
-    'convic',
-    'convicned',
     'convict.ed',
-    'conviction&ndash;government',
-    'conviction-inspired',
-    'conviction.',
-    'conviction/sentence/conviction',
-    'convictphotograph',
-    'convieniently',
-    'convinc',
-    'convinced/',
-    'convincedly',
-    'convincement',
-    'convincing-looking',
-    'convival',
-    'convivi&rehy;ality',
-    'conviviales',
-    'convivialit&eacute',
     'convocations/graduate',
-    'convokes',
-    'convoking',
-    'convolute',
-    'convolutus',
-    'convolvulaceae',
-    'convolvulus&rehy;shaped',
-    'convorted',
-    'convoyaid',
-    'convoys.',
-    'convuclsions',
-    'convulses',
-    'convulvulus',
-    'conway-jones/historian',
-    'conway/garcia',
-    'conwere',
     'conyer',
-    'conyerd',
-    'conygree',
-    'conyngham',
-    'conynghan',
-    'conyza',
-    'conz&aacute;lez',
-    'conza',
-    'conze',
-    'conzen',
-    'coo\'',
-    'coo-ca-choo',
-    'coo-ca-choo\'',
-    'coo-coo',
-    'coo-coo-coo',
-    'coo-cooed',
     'coo-cooo',
-    'coo-cooo-cuh',
-    'coo-ee',
-    'coo-ing',
-    'coo-leee',
-    'coo-roo-coo',
-    'coo-roo-uh',
-    'coobie',
-    'cooc-cooc-ooo',
-    'coodale',
-    'coode-adams',
-    'coody',
-    'coogee',
-    'cook\'n\'clean',
-    'cook(e)',
-    'cook-',
     'cook-book',
-    'cook-books',
-    'cook-boy',
-    'cook-general',
-    'cook-gumperz',
-    'cook-house',
-    'cook-housekeeper',
-    'cook-housekeeper-secretary',
-    'cook-in-sauce',
-    'cook-maid',
-    'cook-maids',
-    'cook-offs',
-    'cook-proprietress',
-    'cook-shop',
-    'cook-supervisor',
-    'cook-up',
     'cook/buav',
-    'cook/commander',
-    'cook/community',
-    'cook/deputy',
-    'cook/esquire',
-    'cook/father',
-    'cook/gloucestershire',
-    'cook/jehovah',
-    'cook/labour',
-    'cook/mother',
-    'cook/reformed',
-    'cook/shadow',
-    'cook/thames',
-    'cook/tourism',
-    'cookbook-come-autobiography',
-    'cookboy',
     'cooke/tourist',
-    'cooked-meat',
-    'cooked-off',
-    'cooked-to-order',
-    'cooked-up',
-    'cooked/heated',
-    'cooker/',
-    'cookery-book',
-    'cookery-lore',
-    'cookery-student',
-    'cookery/chemistry',
-    'cookestone',
-    'cookhorn',
-    'cookie-cutter',
-    'cookie-making',
-    'cookiemix',
     'cooking-corner',
-    'cooking-day',
-    'cooking-energy',
-    'cooking-fire',
-    'cooking-fires',
-    'cooking-hearths',
-    'cooking-oil',
-    'cooking-range',
-    'cooking-stores',
-    'cooking-stove',
-    'cooking-stoves',
-    'cooking-the-books',
-    'cooking-timer',
-    'cooking-world',
-    'cooking/baby',
-    'cooking/eating',
     'cooking_for',
-    'cookism',
-    'cookout',
-    'cookpot',
-    'cookpots',
-    'cooksdown',
-    'cooksley/artist',
-    'cooksons',
-    'cooktail',
-    'cool-as-ice',
-    'cool-coloured',
-    'cool-eyed',
-    'cool-funk',
-    'cool-kitsch',
-    'cool-man',
-    'cool-mannered',
     'cool-thinking',
-    'cool/carrott',
-    'cool:model',
-    'coolability',
-    'coolaney',
-    'coole',
-    'coolelectric',
-    'cooler-than-thou',
-    'cooles',
-    'coolfont',
-    'coolheadedness',
-    'cooling-earth',
-    'cooling-flow',
-    'cooling-water',
-    'coolingtowers',
-    'coolish',
     'coolkeeragh',
-    'coollest',
-    'coolmax/15%',
-    'coolmine',
-    'coolnafrankey',
-    'coolock',
-    'coolroe',
-    'coolth',
-    'coolum',
-    'cooly',
-    'coombi',
-    'coombs/conservative',
-    'coombs/geoffrey',
-    'coombs/pupil',
-    'coombs/victim',
-    'coomes/diocesan',
     'coomlees',
-    'coonan',
-    'coonawarra',
-    'coong',
-    'coonley',
-    'coonly',
-    'coonoor',
-    'coonter',
-    'cooo',
-    'cooo-cooo-kakoor',
-    'coooo',
-    'coooper',
-    'coop&eacute;rative',
-    'cooped-up',
-    'cooper-climax',
-    'cooper-driver',
     'cooper-styled',
-    'cooper/acting',
-    'cooper/author',
-    'cooper/biochemist',
-    'cooper/car',
-    'cooper/friend',
-    'cooper/hunt',
-    'cooper/labour',
-    'cooper/neighbour',
-    'cooper/novelist',
-    'cooper/racial',
-    'cooper/university',
-    'cooper/vet',
-    'cooper/victim',
-    'cooper/writer',
-    'cooperages',
     'cooperatively-developed',
-    'cooperatively.',
-    'coopered',
-    'cooperheat',
-    'cooperite',
-    'coopers&amp;lybrand',
-    'coopers-deloitte-touche-spicers',
-    'coopers.',
-    'cooperville',
-    'coopervision',
-    'coopland',
-    'cooporate',
-    'cooption',
-    'cooptive',
-    'coopts',
-    'coordin',
     'coordinates.',
-    'coordinatised',
-    'coordinator/',
-    'coordinator/national',
-    'coort',
-    'coosje',
-    'coot-haunted',
-    'coot-like',
-    'coot/and',
-    'cootchy-coo',
-    'cootchy-wootchy-coo',
-    'cootlike',
-    'coover',
-    'coover.',
-    'cooxon',
-    'cop&aacute;n',
     'cop-a-gram',
-    'cop-car',
-    'cop-cum',
-    'cop-hating',
-    'cop-outs',
-    'cop-ple',
-    'cop-show',
-    'cop-sided',
-    'cop-speak',
-    'cop/policeman',
-    'cop/young',
-    'copable',
-    'copack',
-    'copacobana',
-    'copain',
-    'copains',
     'copans',
-    'coparcener',
-    'copartnership',
-    'copas/riverside',
-    'copayment',
-    'cope.',
-    'cope/teardrops',
-    'copeing',
-    'copeley/cherwell',
-    'copella',
-    'copellotti',
-    'copely',
-    'copemaman',
-    'copenhagen-based',
-    'copenhague',
-    'coperative',
     'copernica',
-    'copernican\'',
-    'coperstraten',
-    'copex',
-    'copford',
-    'copgrove',
-    'cophenotrope',
-    'cophill',
-    'copi',
-    'copiable',
-    'copicats',
-    'copie',
-    'copies&mdash;but',
-    'copies.',
-    'copies/originals',
-    'copiholdes',
     'copilot',
-    'coping/life/social/home',
-    'copinsay',
-    'coplon',
-    'copmmon',
-    'copmpleting',
-    'copnor',
-    'copnservative',
-    'copolla',
-    'copolymerisation',
-    'copolymerising',
-    'copolymerization',
-    'coporatism',
-    'coporatist',
-    'coposa',
-    'copp&eacute;iia',
     'coppay',
-    'coppenamensis',
-    'coppens',
-    'copper&mdash',
-    'copper(ti)',
-    'copper-arsenic',
-    'copper-associated',
-    'copper-bearing',
-    'copper-beech',
-    'copper-belt',
-    'copper-cabled',
-    'copper-capped',
-    'copper-containing',
-    'copper-copper',
-    'copper-dark',
-    'copper-ended',
     'copper-fastened',
-    'copper-gilt',
-    'copper-gold',
-    'copper-impregnated',
-    'copper-mauve',
-    'copper-mines',
-    'copper-on-zinc',
-    'copper-plated',
-    'copper-polyimide',
-    'copper-polymide',
-    'copper-potassium',
-    'copper-producing',
-    'copper-rich',
-    'copper-silver',
-    'copper-smiths',
-    'copper-stick',
     'copper-t',
-    'copper-tin',
-    'copper-tinted',
-    'copper-toned',
-    'copper-top',
-    'copper-wire',
-    'copper-work',
-    'copper-wound',
-    'copperfasten',
-    'copperhead',
-    'coppermines',
-    'copperplate-inscribed',
-    'copperplates',
-    'coppersmiths',
-    'coppery-grey',
-    'coppery-purple',
     'coppetts',
-    'coppice-as-fuel',
-    'coppice-workers',
-    'coppicing-with-standards',
-    'coppick',
-    'coppin\'',
-    'copping/raf',
-    'coppist',
-    'coppists',
-    'copplehouse',
-    'coppuck',
-    'coppy',
-    'coppyes',
-    'coppys',
-    'copraphagia',
-    'coprecipitation',
     'copreipitated',
-    'coprepared',
-    'copres',
-    'copright',
-    'coprime',
-    'coprocentric',
-    'coprock',
-    'coproducer',
-    'coproducing',
-    'copromote',
-    'copronymus',
-    'coprophile',
-    'coprophilic',
-    'coprosma',
-    'coproxamols',
-    'coproximol',
     'coprus',
-    'copse-bank',
-    'copshop',
-    'copsi',
-    'copsley',
-    'copsu',
-    'copthill',
-    'coptos',
-    'copublish',
-    'copublished',
-    'copulsky',
-    'copurified',
-    'copurifying',
-    'copus',
-    'copus/swindon',
-    'copus/wiltshire',
     'copy&mdash;a',
-    'copy-and-paste',
-    'copy-and-verify',
-    'copy-back',
-    'copy-books',
-    'copy-cat-raid',
-    'copy-catting',
-    'copy-editing',
-    'copy-editor',
-    'copy-editors',
-    'copy-ink',
-    'copy-numbers',
-    'copy-of-a-copy',
-    'copy-preparation',
-    'copy-protect',
-    'copy-reading',
     'copy-takers',
-    'copy-tape',
-    'copy-types',
-    'copy-typist',
-    'copy/module',
-    'copyboy',
-    'copycatting',
-    'copydesk',
-    'copye',
-    'copyflow',
-    'copyguard',
-    'copyiipc',
-    'copying/imaging/printing/faxing',
-    'copyism',
-    'copyit',
-    'copylines',
     'copymaster',
-    'copyright-related',
-    'copyright.',
-    'copyrightable',
-    'copyrighted&mdash;or',
-    'copyrite',
-    'copyslay',
-    'copytakers',
-    'copywriter-art',
-    'coquart',
-    'coque',
-    'coquelin',
-    'coquempot',
-    'coquet',
-    'coquetdale',
-    'coquetel',
     'coquettishness',
-    'coqui',
-    'coquillage',
-    'coquin',
-    'cor-anglais',
-    'cor-blimey',
-    'cor-data',
-    'cor.v.',
-    'coraciidae',
-    'coracle-builder',
-    'coraggio',
-    'corah',
-    'coral-coloured',
-    'coral-fretted',
-    'coral-fringed',
-    'coral-ladbrokes',
     'coralfish',
-    'coralie',
-    'coralita',
-    'coralled',
-    'corallimorpharia',
-    'corallimorphia',
-    'corallite',
-    'coranguinum',
-    'corary',
-    'coras',
-    'corax',
-    'coraxi',
-    'coraz&oacute;n',
-    'corbala',
-    'corbar',
-    'corbara',
     'corbeil-essonnes',
-    'corbeiller',
-    'corbeiltransport',
-    'corbella',
-    'corbenic',
-    'corbeny-sur-aisne',
-    'corber',
-    'corbett/prisoner',
-    'corbey',
-    'corbi&egrave;res',
-    'corbieres',
-    'corbijn',
-    'corbina',
-    'corbon',
-    'corbrige',
-    'corbriggs',
     'corcesque',
-    'corchester',
-    'corcia',
-    'corcuero(interior)',
-    'corcyreans',
-    'corcyrensis',
-    'cord&oacute;vez',
-    'cord&rehy;pull',
-    'cord-breeches',
-    'cord-made',
-    'cord/string',
-    'cordaites',
-    'cordal',
-    'cordale',
-    'cordateria',
-    'cordee',
     'cordeeroy',
-    'cordeiro',
-    'cordelias',
-    'cordemais',
-    'corder-birch',
-    'cordet',
-    'cordevants',
-    'cordialls',
-    'cordifolius',
-    'cordin\'',
-    'cordiner',
-    'cordings',
-    'cordis',
-    'cordite-reeking',
-    'cordium',
-    'cordius',
     'cordner/groom',
-    'cordocentesis',
-    'cordon-barrier',
-    'cordon-duty',
-    'cordon/liberal',
-    'cordonazos',
-    'cordoned-off',
-    'cordoning-off',
-    'cordorniu',
-    'cordorys',
-    'cords-plc',
-    'corduroy-clad',
-    'corduroy-jacket-wearing',
-    'corduroyed',
-    'cordwaggle',
-    'cordwan',
     'cordwina',
-    'cordyceps',
-    'cordylinefruticosa',
-    'cordylines',
-    'core&mdash',
-    'core&rehy;periphery',
-    'core\'',
-    'core-areas',
-    'core-based',
-    'core-bell',
-    'core-byte',
-    'core-constituting/context-independent',
-    'core-element',
-    'core-field',
-    'core-formed',
-    'core-plus-extension',
     'core-to-wrap',
-    'core-type',
-    'core-vessel',
-    'core/kevlar/carbon',
-    'corean',
-    'coreceptors',
-    'coregency',
-    'coreldraw.exe',
-    'coreldraws',
-    'corell',
-    'corelle',
-    'corelli.',
-    'corelli/tartini/kreisler',
-    'coreof',
-    'coreper',
-    'cores.first',
     'corescrapers',
-    'corespondent',
-    'coresponsibility',
-    'corestones',
-    'corethron',
-    'coretta',
-    'coreware',
-    'corey-crump',
-    'corfe-studland',
-    'corff',
-    'corfo',
-    'corfton',
-    'corgi-owner',
-    'corgie',
-    'coriaceous',
-    'coriander-flavoured',
     'corianders',
-    'coriarick',
-    'coricidin',
-    'corie',
-    'corielopocarium',
-    'corieltauvi',
-    'corillo',
-    'corimo',
-    'corinia',
-    'corinii',
-    'corinithian',
-    'corinthi',
-    'corinthian-athenian',
-    'corinthias',
-    'corio',
-    'coriolanian',
     'coriosopitum',
-    'coris',
-    'coritani',
-    'coritanian',
-    'corixidae',
-    'corizo.',
-    'corizon',
-    'corizos',
-    'cork-blackened',
-    'cork-born',
-    'cork-bundles',
-    'cork-effect',
-    'cork-faced',
-    'cork-lined',
-    'cork-screwing',
-    'cork-soled',
     'cork-strewn',
-    'cork-tiled',
-    'cork-twist',
-    'cork/eire',
-    'cork75',
-    'corkin\'',
-    'corkindale',
-    'corks-around-hats',
-    'corkscrew/knife',
-    'corkster',
-    'corkwing',
-    'corky-style',
-    'corl',
-    'corlass',
-    'corlay',
-    'corle',
     'corlea',
-    'corlears',
-    'corled',
-    'corleonese',
-    'corleonesi',
-    'corless/',
-    'corless/coaching',
-    'corless/director',
-    'corless/nic',
-    'cormacan',
-    'cormack/carer',
-    'cormack/daughter',
-    'cormacks',
-    'cormainville',
-    'cormani',
-    'cormdale',
     'cormers',
-    'cormet',
-    'cormie',
-    'cormist',
-    'cormlets',
-    'cormode',
-    'cormon',
-    'cormont',
-    'cormoran',
-    'corn-bound',
-    'corn-bunting-like',
-    'corn-chandler',
-    'corn-circles',
-    'corn-cob',
-    'corn-cobs',
-    'corn-dryer',
     'corn-exchange',
-    'corn-fields',
-    'corn-gold',
-    'corn-husk',
-    'corn-law-loving',
-    'corn-market',
-    'corn-markets',
-    'corn-mission',
-    'corn-samples',
-    'corn-sellers',
-    'corn-sheaves',
-    'corn-sheep',
-    'corn-shortage',
-    'corn-stack',
-    'corn-stacks',
-    'corn-stalks',
     'corn-white',
-    'corn/maize',
-    'cornabus',
-    'cornaert',
-    'cornbin',
-    'cornbleth',
-    'cornbrash',
-    'cornbride',
-    'corncockles',
-    'corncrake-friendly',
-    'corndell',
-    'corneanu',
-    'corneau',
-    'corneill',
-    'cornelian-red',
-    'cornelisssen',
     'cornelisz',
-    'corneliszoon',
-    'corneliussen',
-    'cornell/pensioner',
-    'cornelle',
-    'corneloup',
-    'cornelsen',
-    'cornely',
-    'cornelys',
-    'corneoscleral',
-    'corner-based',
-    'corner-cube',
-    'corner-cutting',
-    'corner-markings',
-    'corner-post',
-    'corner-segments',
     'corner-seldom',
-    'corner-to-corner',
-    'corner-wise',
-    'corner/chimney',
-    'corner/north',
-    'cornerboys',
-    'cornerer',
-    'cornerl',
-    'cornermen',
-    'cornerpiece',
-    'cornerpost',
-    'cornerseat',
-    'cornertowre',
-    'cornerwise',
-    'cornetcy',
-    'corneth',
     'corneto',
-    'cornette',
-    'cornettist',
-    'cornettists',
-    'cornetto-type',
-    'cornettos',
-    'cornetts',
-    'corneum',
-    'cornflake-mass',
-    'cornflakes-ad',
-    'cornflakes.',
-    'cornford/oxfam',
-    'cornhill\'',
-    'cornhill-on-tweed',
-    'corni',
-    'cornia',
     'corniculum',
-    'corniea',
-    'cornies',
-    'cornified',
-    'corniger',
-    'cornigera',
-    'corning\'',
-    'cornish-born',
-    'cornishness',
-    'cornmarket=',
-    'cornmentarii',
-    'cornmilling',
-    'cornner',
-    'cornopolis',
-    'cornorered',
-    'cornors',
     'cornovian',
-    'cornparative',
-    'cornsilk',
-    'cornstalk',
-    'cornstarch',
-    'cornstock',
-    'cornua',
-    'cornubia',
-    'cornubiense',
-    'cornucopia-like',
-    'cornucopianism',
-    'cornucopious',
-    'cornulier',
-    'cornusmas',
-    'cornuta',
-    'cornwa',
     'cornwall-based',
-    'cornwall-born',
-    'cornwall-rhenish',
-    'cornwall/rspca',
-    'cornwellian',
-    'cornyshe',
-    'coro',
-    'corob',
-    'corocraft',
-    'corofin',
-    'coromba',
-    'corona.',
-    'coronabit',
-    'coronach',
-    'coronarium',
-    'coronarius',
     'coronary-prone',
-    'coronati',
-    'coronavirus',
-    'coronea',
-    'coronership',
-    'coroneted',
-    'coronory',
-    'corosinis',
-    'corovoda',
-    'corozal',
-    'corp\'',
-    'corp*',
-    'corp-hewlett-packard',
-    'corp-insignia',
-    'corp-intel',
-    'corp-meiko',
     'corp-related',
-    'corp-ross',
-    'corp-specific',
-    'corp.the',
-    'corp/motorola',
-    'corp/motorola-developed',
-    'corp/ms-dos',
-    'corpak',
-    'corpn.',
-    'corpo-',
-    'corpoal',
-    'corpor&rehy;ation',
-    'corpora&rehy;tion',
-    'corporal-armourer',
-    'corporally',
-    'corporate&rehy;wide',
     'corporate-based',
-    'corporate-borrowing',
-    'corporate-centred',
-    'corporate-disguised-as-consumer',
-    'corporate-induced',
-    'corporate-owned',
-    'corporate-planning',
-    'corporate-sector',
-    'corporate-trousered',
-    'corporate/',
-    'corporate/consultative',
-    'corporated',
-    'corporation-caused',
-    'corporation-speak',
-    'corporation-tax',
-    'corporation/b.e.t',
     'corporation/royal',
-    'corporational',
-    'corporations.in',
-    'corporatise',
-    'corporatist/pluralist',
-    'corporativist',
-    'corporatized',
-    'corporic',
-    'corporist',
-    'corpos',
-    'corpoturismo',
-    'corpozulia',
-    'corpral',
-    'corps-de-ballet',
-    'corps-sized',
-    'corpse-baggers',
     'corpse-dressers',
-    'corpse-flies',
-    'corpse-holding',
-    'corpse-reeking',
-    'corpse-strewn',
-    'corpse-veil',
-    'corpse/cadaver',
-    'corpsebumlickery',
-    'corpselike',
-    'corpsman',
-    'corpulency',
-    'corpus&rehy;based',
-    'corpus.',
-    'corpus/antrum',
-    'corpus_delicti',
-    'corpus_juris',
     'corpuscularians',
-    'corpuscules',
-    'corpusculor',
-    'corpusty',
-    'corr&ecirc;a',
-    'corra',
-    'corradillar',
-    'corradino',
-    'corrales',
-    'corratts',
-    'corre&rehy;spondence',
-    'correan',
-    'correc',
-    'correct\'',
-    'correct-and',
-    'correct-score:other-score',
     'correct-speak',
-    'correct.',
-    'correct/incorrect',
-    'correct/tied/incorrect',
-    'correct:incorrect',
-    'correct_with',
-    'correctaircraft',
-    'corrected.',
-    'correcteur',
-    'correction-praise\'',
-    'correction=13.65',
-    'correctionel',
-    'correctively',
-    'correctly&mdash;this',
-    'correctly&rehy;saw',
-    'correctly-completed',
     'correctly-maintained',
-    'correctly-meeting',
-    'correctly-positioned',
-    'correcton',
-    'correctwas',
-    'corregated',
-    'corregedor',
-    'correlatable',
-    'correlatedwith',
-    'correlates.',
-    'correlative\'',
-    'correlatory',
-    'correns',
-    'correspdonent',
-    'correspon-dent',
-    'correspondence&rehy;computations',
     'correspondence-computation',
-    'correspondence-course',
-    'correspondence-school',
-    'correspondencia',
-    'correspondencies',
-    'correspondent/live',
-    'correspondent/newsroom',
-    'correspondentloaded',
-    'corresponder',
-    'correspondes',
-    'corret',
-    'corrette',
-    'correxit',
-    'corri',
-    'corriad',
-    'corrichatachin\'',
     'corridon',
-    'corridor.',
-    'corridor/coffee',
-    'corridors-a',
-    'corrie/wembley',
-    'corriearrack',
-    'corriechoille',
-    'corriehallie',
-    'corrielo',
-    'corrientes',
-    'corrievrikin',
-    'corrigal',
-    'corrigan-maguire',
-    'corrigan/strathclyde',
-    'corrigans',
-    'corrigible',
     'corrigon',
-    'corrihons',
-    'corro',
-    'corrobery',
-    'corroborations',
-    'corroborees',
-    'corrodable',
-    'corrodian',
-    'corrodians',
-    'corroie',
-    'corrosion-control',
-    'corrosion-inhibitor',
-    'corrosion-resistance',
-    'corrosively',
-    'corrosivity',
-    'corrosivus',
     'corrouge',
-    'corrs',
-    'corrugated-iron-roofed',
-    'corrugating',
-    'corrupt-smelling',
-    'corrupter',
-    'corrupters',
-    'corruptio',
-    'corruption-tainted',
-    'corruption-wielding',
-    'corruptive',
-    'corruptly-led',
-    'corruscating',
-    'corruscation',
-    'corry/gloucestershire',
-    'corrycharmaig',
     'corrymeela',
-    'cors',
-    'corsalius',
-    'corsation',
-    'corsbie',
-    'corsed',
-    'corselette',
-    'corsellis',
-    'corser',
-    'corset.',
-    'corsham/wiltshire',
-    'corslet',
-    'corsock',
-    'corss-examining',
-    'corstrophine',
-    'cort&eacute;ge',
     'cort&egrave;z',
-    'corta',
-    'cortado',
-    'cortaillod',
-    'cortal',
-    'cortazar',
-    'corte-real',
-    'cortel',
-    'cortesi',
-    'cortex\'',
-    'cortexes',
-    'cortezone',
-    'corthorn',
-    'cortical-evoked',
-    'corticoadrenal',
-    'corticosteriods',
     'corticosterioid',
-    'corticosteroids/antibiotics',
-    'corticostroids',
-    'corticotropin',
-    'cortille',
-    'cortilles',
-    'cortin',
-    'cortisocsteroids',
-    'cortisone-lipped',
-    'cortisones',
-    'cortivo',
-    'cortleferry',
-    'corton-charlemagne',
-    'corton-charlemagne&mdash;chambolle-musigny',
-    'corty',
-    'cortzee',
     'coruler',
-    'coruscated',
-    'coruscatingly',
-    'coruscations',
-    'corv&eacute;es',
-    'corval&aacute;n',
-    'corvatsch',
-    'corve',
-    'corvee',
-    'corven',
-    'corvey',
-    'corvid-the',
-    'corvidae',
-    'corwen-denbigh-rhyl',
-    'corydons',
-    'corylifolia',
     'corymbosa',
-    'coryn',
-    'coryndon',
-    'corynocarpaceae',
-    'corynocarpus',
-    'corypha',
-    'corystospermales',
-    'coryzal',
-    'cos&iacute',
-    'cos\'&egrave',
-    'cos_as_soon_as',
-    'cosas',
-    'cosatto',
-    'cosby-admiring',
-    'coscom',
-    'cosculluela',
     'cosd',
-    'cosegregated',
-    'cosegregation',
-    'coseley',
-    'cosener',
-    'cosequently',
-    'coset',
-    'cosh-boys',
-    'cosh-carrying',
-    'cosh-style',
-    'cosh-tailed',
-    'cosh/milton',
-    'coshing',
-    'coshquin',
-    'cosignatories',
-    'cosimini',
     'cosinewaves',
-    'cosinusoidally',
-    'cosipa',
-    'coskunsu',
-    'cosl',
-    'cosla/scottish',
-    'coslany',
-    'cosma',
-    'cosmati',
-    'cosmatos',
-    'cosme',
-    'cosmelli',
-    'cosmetic-bag',
-    'cosmetic-reasons-only',
-    'cosmetic-testing',
-    'cosmetically-engineered',
     'cosmeticize',
-    'cosmetologist',
-    'cosmetologists',
-    'cosmic-ice',
-    'cosmically\'',
-    'cosmically-inclined',
-    'cosmics',
-    'cosmig',
-    'cosmo-cocktail',
-    'cosmochelonian',
-    'cosmochemistry',
-    'cosmogenic',
-    'cosmogirl',
-    'cosmogonical',
-    'cosmographe',
-    'cosmol',
     'cosmonautilor',
-    'cosmoplitan',
-    'cosmopolis',
-    'cosmopolitan-mgm',
-    'cosmopolites',
-    'cosmorama',
-    'cosmos-spanning',
-    'cosmosair',
-    'cosmus',
-    'cosne',
-    'cosolvent',
-    'cosourcing',
-    'cospecificity',
-    'cospoir',
-    'cossachok',
-    'cossack-flavoured',
     'cossack-horseman',
-    'cossack-infested',
-    'cossack-style',
-    'cossaks',
-    'cossans',
-    'cossart-miles',
-    'cossarts',
-    'cosse',
-    'cossens',
-    'cossetedly',
-    'cossie',
-    'cossin',
-    'cosstick',
-    'cosstick/robbery',
-    'cost&mdash;benefit',
-    'cost&mdash;effectively',
     'cost&ndash;effective',
-    'cost&ndash;effectiveness',
-    'cost&rehy;accounting',
-    'cost&rehy;adjustor',
-    'cost&rehy;covering',
-    'cost&rehy;efficiency',
-    'cost-a',
-    'cost-base',
-    'cost-behaviour',
-    'cost-beneficial',
-    'cost-benefit-calculating',
-    'cost-book',
-    'cost-caps',
-    'cost-centred',
-    'cost-competitiveness',
-    'cost-containing',
     'cost-containment',
-    'cost-controlling',
-    'cost-curbing',
-    'cost-cut',
-    'cost-cuting',
-    'cost-cutters',
-    'cost-depreciated',
-    'cost-differentiation',
-    'cost-driven',
-    'cost-effective.',
-    'cost-escalation',
-    'cost-focus',
-    'cost-impractical',
-    'cost-in-use',
-    'cost-income',
-    'cost-inflation',
     'cost-inflationary',
-    'cost-influencing',
-    'cost-justify',
-    'cost-obsessed',
-    'cost-of-capital',
-    'cost-of-funds',
-    'cost-optimises',
-    'cost-oriented',
-    'cost-per-inhabitant',
-    'cost-per-megabyte',
-    'cost-per-mile',
-    'cost-per-response',
-    'cost-quality',
-    'cost-rational',
-    'cost-reductions',
-    'cost-schedule',
     'cost-shared',
-    'cost-system',
-    'cost-to-income',
-    'cost-trimming',
-    'cost-uneffective',
-    'cost-utility',
-    'cost/estimating',
-    'cost/full',
-    'cost/income',
-    'cost/marginal',
-    'cost/responsibility',
-    'cost/standard',
-    'cost:benefit',
-    'costa-bound',
-    'costa-gavras',
-    'costa-glitzy',
     'costa1',
-    'costabadic',
-    'costadas',
-    'costage',
-    'costaguana',
-    'costaki',
-    'costallisation',
-    'costanera',
-    'costantini',
-    'costantino',
-    'costanza',
-    'costata',
-    'costb1',
-    'costcode',
-    'costcutters',
-    'costel',
     'costella',
-    'costello-king',
-    'costentins',
-    'costentinstune',
-    'costertium',
-    'costes',
-    'costessey',
-    'costessy',
-    'costi&egrave;res',
-    'costing-calculating',
-    'costis',
-    'costley',
-    'costnerwood',
-    'costo-radial',
-    'costochondritis',
-    'costof',
     'costorphine',
-    'costow',
-    'costrecovery',
-    'costruzioni',
-    'costs.',
-    'costs.i',
-    'costs/expenditure',
-    'costs/margins',
-    'costs/objectives/achievements',
-    'costs/prices',
-    'costsprovides',
-    'costumbrism',
-    'costume-but',
-    'costume-wise',
-    'costure',
-    'cosultant',
     'cosurfactant',
-    'coswarth',
-    'cosworth&rehy;powered',
-    'cosworth-developed',
-    'cosworth-powered',
-    'cosy-comfortable',
-    'cosy-looking',
-    'cosycot',
-    'cosyn',
-    'cosynage',
-    'cot&aacute;n',
-    'cot&eacute',
-    'cot-1',
-    'cot-sided',
-    'cot-size',
-    'cot-type',
     'cot/buggy',
-    'cota',
-    'cotabato',
-    'cotact',
-    'cotari',
-    'cotcher',
-    'cotdeath',
-    'cote-hardie',
-    'cote-rotie',
-    'cotehele',
-    'cotemporary',
-    'cotenine',
-    'cotenville',
-    'coterminus',
-    'cotesworth',
-    'cotham',
     'cothereau',
-    'cothurnocystis',
-    'cothwas',
-    'cotingidae',
-    'cotmanhay',
-    'cotner',
-    'cotoneasters',
-    'cotranfection',
-    'cotransfections',
-    'cotransmitted',
-    'cotretsecretary',
-    'cots-cum-playpens',
-    'cotsfield',
-    'cotside',
-    'cotswall',
-    'cotswold-type',
     'cotswolds-based',
-    'cotswolds.',
-    'cotswolds.it',
-    'cotsworth',
-    'cottage-born',
-    'cottage-cruising',
-    'cottage-dweller',
-    'cottage-industrial',
-    'cottage-proportions',
-    'cottage-residence',
-    'cottage-size',
-    'cottage/dyehouses',
-    'cottage/willow',
-    'cottbus-based',
-    'cottee-inspired',
-    'cottee/harry',
     'cottell/conference',
-    'cotterall',
-    'cotterel',
-    'cotterell/country',
-    'cotterell/former',
-    'cotterell/show',
-    'cotteril',
-    'cotters',
-    'cottes',
-    'cottesbrook',
-    'cotteslow',
-    'cotteswoldiae',
-    'cottex',
-    'cotthard',
-    'cottidae',
-    'cottingwith',
     'cottisford',
-    'cotton-and-polyester',
-    'cotton-broker',
-    'cotton-bud',
-    'cotton-clad',
-    'cotton-covered',
-    'cotton-crop',
-    'cotton-growers',
-    'cotton-jersey',
-    'cotton-lace',
-    'cotton-lined',
-    'cotton-mill-owner',
-    'cotton-mills',
-    'cotton-pickin\'',
-    'cotton-polyester',
-    'cotton-processing',
     'cotton-producing',
-    'cotton-shift',
-    'cotton-spinners',
-    'cotton-thin',
-    'cotton-twill',
-    'cotton-waste',
-    'cotton-weaving',
-    'cotton-wool-tipped',
-    'cotton-woolled',
-    'cotton-wound',
-    'cotton/25%',
-    'cotton/43%',
-    'cotton/elastane',
-    'cotton/linen',
-    'cotton/nylon',
-    'cotton/poly',
     'cottonian',
-    'cottonopolis',
-    'cottonpickin\'',
-    'cottonreels',
-    'cottonseed',
-    'cottonwoods',
-    'cottrell/swindon',
-    'cottringer',
-    'cotts',
-    'cottus',
-    'cotw',
-    'cotwold',
-    'cotwolds',
-    'cotwsold',
-    'cotyloid',
-    'cotylosaurs',
     'cotz',
-    'cou&bsol;nty',
-    'cou&eacute',
-    'couble-figure',
-    'coubre',
-    'couch&eacute;e',
-    'couch-based',
-    'couchage',
-    'couchette-style',
-    'couchianus',
-    'couchman/waiter',
-    'couchot',
-    'coudenhove-kalergi',
-    'coudes',
-    'coueite',
-    'couepia',
     'couffin',
-    'cougers',
-    'cough-splintered',
-    'cough-sweet',
-    'cough-up',
-    'coughcrackle',
-    'coughed.',
-    'coughers',
-    'coughin\'',
-    'coughings',
-    'coughtrecy',
-    'couhe',
-    'couid',
-    'couiza',
-    'couiza-montazels',
-    'coula-nut-cracking',
     'coulavie',
-    'could\'',
-    'could\'st',
-    'could-er',
-    'could-have-beens',
-    'could-if',
-    'could-perhaps',
-    'could-ridden',
-    'could-sell',
-    'could.be',
-    'coulde',
-    'couldent',
-    'couldery',
-    'couldfollow',
-    'couldn\'t-give-a-stuff',
-    'couldn\'t-have-beens',
     'couldn\'t.',
-    'couldn\'t/did',
-    'couldni',
-    'couldrey/the',
-    'coulds\'t',
-    'coule',
-    'coulee',
-    'coulinats',
-    'couling',
-    'coulins',
-    'coulisses',
-    'coulman',
-    'coulombe-saint',
-    'coulometric',
-    'coulommier',
-    'coulpe',
     'coulsden',
-    'coulstock',
-    'coulteri',
-    'coulthard/father',
-    'coulthard/jaguar',
-    'coulthard/mother',
-    'coulthwaite',
-    'coultrop',
-    'coum&eacute;ly',
-    'coumforte',
-    'coun&rehy;tries',
-    'counce',
-    'councelled',
-    'counci',
-    'council&mdash;auksiausiogi',
-    'council&rehy;house',
     'council-appointed',
-    'council-backed',
-    'council-bashing',
-    'council-congress',
-    'council-donated',
-    'council-entry',
-    'council-home',
-    'council-housing',
-    'council-land',
-    'council-managed',
-    'council-npkc',
-    'council-ordered',
-    'council-property',
-    'council-scene',
-    'council-speak',
-    'council-that',
     'council-type',
-    'council.no',
-    'council.once',
-    'council.project',
-    'council.this',
-    'council.tlr',
-    'council.until',
-    'council/',
-    'council/boards',
-    'council/channel',
-    'council/ed',
-    'council/essex',
-    'council/faces',
-    'council/for',
-    'council/fulbright',
-    'council/inns',
     'council/minerva',
-    'council/private',
-    'council/publishers',
-    'council/university',
-    'councillor/to',
-    'councillorsfore',
-    'councilmen',
-    'councilnorthern',
-    'councilnot',
-    'councilors',
-    'councilpersons',
-    'councils-the',
-    'councils.',
-    'councilspeak',
-    'councilsupported',
-    'councilwoman',
     'counillor',
-    'counntry',
-    'counor',
-    'counry',
-    'counryside',
-    'counseiller',
-    'counseillers',
-    'counseling',
-    'counsell/friends',
-    'counseller',
-    'counselleth',
-    'counselling-room',
-    'counselling/',
-    'counselling/rehabilitation',
-    'counsellor/mk',
-    'counsellor/patient',
     'counsellors.',
-    'counsellors/social',
-    'counselor',
-    'count&mdash;back',
-    'count-duke',
-    'count-off',
-    'count-rate',
-    'count-your-blessings',
-    'count.doc',
-    'count=23',
-    'count_up',
-    'countax',
-    'counted.',
-    'counter&rehy;accusations',
-    'counter&rehy;assertion',
-    'counter&rehy;balance',
     'counter&rehy;balanced',
-    'counter&rehy;demonstrations',
-    'counter&rehy;espionage',
-    'counter&rehy;example',
-    'counter&rehy;examples',
-    'counter&rehy;natural',
-    'counter&rehy;opinion',
-    'counter&rehy;part',
-    'counter&rehy;spies',
-    'counter-account',
-    'counter-accusation',
-    'counter-acted',
-    'counter-adaptation',
-    'counter-addresses',
-    'counter-advance',
-    'counter-agents',
     'counter-alleged',
-    'counter-ambush',
-    'counter-assassination',
-    'counter-assert',
-    'counter-assertion',
-    'counter-assumptions',
-    'counter-attempt',
-    'counter-attitudinal',
-    'counter-attributes',
-    'counter-balances',
-    'counter-balancing',
-    'counter-bargaining',
-    'counter-battery',
-    'counter-blast',
-    'counter-blows',
-    'counter-bored',
     'counter-caster',
-    'counter-changes',
-    'counter-check',
-    'counter-cheers',
-    'counter-colonialist',
-    'counter-colonisation',
-    'counter-communism',
-    'counter-consideration',
-    'counter-constructive',
-    'counter-counter-establishment',
-    'counter-criticisms',
-    'counter-culturalists',
-    'counter-cyclically',
-    'counter-deals',
-    'counter-decisions',
-    'counter-declaration',
     'counter-deformation',
-    'counter-democratic',
-    'counter-demonstrate',
-    'counter-devices',
-    'counter-directed',
-    'counter-directions',
-    'counter-draft',
-    'counter-economy',
-    'counter-education',
-    'counter-effective',
-    'counter-embassy',
-    'counter-equatorial',
-    'counter-establishment',
-    'counter-expertise',
-    'counter-gift',
-    'counter-gifts',
     'counter-grandadology',
-    'counter-guarantees',
-    'counter-hand',
-    'counter-hegemonical',
-    'counter-hegemony',
-    'counter-historical',
-    'counter-history',
-    'counter-ideologies',
-    'counter-insistence',
-    'counter-instance',
-    'counter-insurgents',
-    'counter-intellectual',
-    'counter-invention',
-    'counter-ions',
-    'counter-irritant',
-    'counter-irritating',
     'counter-irritation',
-    'counter-jumper',
-    'counter-like',
-    'counter-magic',
-    'counter-magnet',
-    'counter-marking',
-    'counter-mines',
-    'counter-mining',
-    'counter-mobilisation',
-    'counter-mockery',
-    'counter-modernism',
-    'counter-objection',
-    'counter-offensives',
-    'counter-opposing',
-    'counter-orders',
-    'counter-organisations',
     'counter-pane',
-    'counter-parallel',
-    'counter-part',
-    'counter-parties',
-    'counter-plans',
-    'counter-plotting',
-    'counter-polemic',
-    'counter-positions',
-    'counter-power',
-    'counter-preparations',
-    'counter-pressures',
-    'counter-productively',
-    'counter-programme',
-    'counter-proposition',
-    'counter-protection',
-    'counter-protectionism',
     'counter-purchase',
-    'counter-purchased',
-    'counter-queue',
-    'counter-raid',
-    'counter-raids',
-    'counter-reasons',
-    'counter-rebellion',
-    'counter-reconnaissance',
-    'counter-reformers',
-    'counter-remark',
-    'counter-reply',
-    'counter-restitution',
-    'counter-reversible',
-    'counter-revolutionhad',
-    'counter-rioters',
-    'counter-security',
     'counter-shots',
-    'counter-sign',
-    'counter-signing',
-    'counter-signs',
-    'counter-smear',
-    'counter-smears',
-    'counter-sniper',
-    'counter-sounds',
-    'counter-sources',
-    'counter-sphere',
-    'counter-stain',
-    'counter-stances',
-    'counter-staring',
-    'counter-stereotypes',
-    'counter-stratagem',
-    'counter-stream',
     'counter-strength',
-    'counter-striking',
-    'counter-style',
-    'counter-subject',
-    'counter-submission',
-    'counter-sued',
-    'counter-sues',
-    'counter-suggestibility',
-    'counter-suggestion',
-    'counter-suing',
-    'counter-sunk',
-    'counter-systems',
-    'counter-tactics',
-    'counter-taunts',
-    'counter-tendencies',
-    'counter-theme',
     'counter-thesis',
-    'counter-tops',
-    'counter-tradition',
-    'counter-vision',
-    'counter-warning',
-    'counter-warnings',
-    'counter-weighted',
-    'counter-weighting',
-    'counter-wide',
-    'counter/decoder',
-    'counteractants',
-    'counteractions',
-    'counteractive',
-    'counteraffirmations',
-    'counterargument',
-    'counterarguments',
     'counterbattened',
-    'counterblasting',
-    'counterbore',
-    'counterbored',
-    'countercanon',
-    'countercase',
-    'counterchanged',
-    'countercharged',
-    'counterchecks',
-    'countercoup',
-    'countercoups',
-    'countercyclically',
-    'counterdemonstration',
-    'counterdemonstrations',
-    'counterfactives',
-    'counterfactuality',
     'counterfiet',
-    'counterflow',
-    'counterinductivism',
-    'counterinvestment',
-    'counterion',
-    'counterions',
-    'counterlaste',
-    'countermagic',
-    'counterman',
-    'countermands',
-    'countermanoeuvre',
-    'countermarch',
-    'countermelodies',
-    'countermine',
-    'countermotion',
-    'countermoves',
     'counternotices',
-    'counterpar',
-    'counterpart&mdash;see',
-    'counterparts.3',
-    'counterproof',
-    'counterpropagating',
-    'counterproposals',
-    'counterpunch',
-    'counterreligion',
-    'counterscarp',
-    'countersense',
-    'counterset',
-    'countershock',
-    'countersigning',
-    'countersinking',
-    'counterstaining',
     'countersteer',
-    'countersteering',
-    'counterstrike',
-    'counterstrokes',
-    'counterstructure',
-    'countertenor-timothy',
-    'counterterrorism',
-    'countertops',
-    'countertransport',
-    'countertransports',
-    'counterurban',
-    'countervale',
-    'counterview',
-    'countery',
-    'counterzest',
-    'countesswells',
     'countie',
-    'counties-based',
-    'counties.',
-    'counties/',
-    'countin\'',
-    'counting-down',
-    'counting-games',
-    'counting-houses',
-    'counting-room',
-    'counting/computing',
-    'counting2',
-    'countires',
-    'countlessly',
-    'countray-men',
-    'countrey-painter',
-    'countreys',
     'countries&mdash;also',
-    'countries&mdash;in',
-    'countries&mdash;iraq',
-    'countries&mdash;was',
-    'countries&rehy;at',
-    'countries--a',
-    'countries--have',
-    'countries-brazil',
-    'countries-during',
-    'countries-have',
-    'countries-nepal',
-    'countries.brian',
-    'countries.in',
-    'countriessent',
-    'country&mdash',
-    'country&rehy;gentleman',
     'country&rehy;ruining',
-    'country\'n\'western',
-    'country(ies)',
-    'country-blues',
-    'country-churchyard',
-    'country-cottage',
-    'country-crossover',
-    'country-cut',
-    'country-faced',
-    'country-flavoured',
-    'country-fresh',
-    'country-girl',
-    'country-hauled',
-    'country-in',
-    'country-like',
-    'country-offensive',
     'country-parson',
-    'country-people',
-    'country-pleasures',
-    'country-side',
-    'country-singing',
-    'country-sized',
-    'country-sport',
-    'country-squiredom',
-    'country-sweetened',
-    'country-tory',
-    'country-tunisia-which',
-    'country-voiced',
-    'country-walking',
-    'country-wear',
-    'country-wise',
-    'country.',
     'country.a',
-    'country.today',
-    'country.v',
-    'country/',
-    'country/neighbourhood',
-    'country/repeat',
-    'country/rock',
-    'country/rock/blues',
-    'country/sovereign',
-    'country/territory',
-    'countrybar',
-    'countryd',
-    'countrye',
-    'countryfying',
-    'countrygoer',
-    'countryhouse',
     'countrylover',
-    'countryment',
-    'countryscape',
-    'countryside-often',
-    'countryside.60',
-    'countryside.llewela',
-    'countrysiders',
-    'countrywheat',
-    'counts.relax',
-    'counts/10',
-    'countty',
-    'county-',
-    'county-border',
-    'county-endorsed',
-    'county-house',
-    'county-model',
     'county-school',
-    'county-size',
-    'countybus',
-    'countyside',
-    'coup&mdash;see',
-    'coup-de-gr&acirc;ce',
-    'coup-mongers',
-    'coup-ridden',
-    'coup_d\'etat.',
-    'coup_de_main',
-    'coupar',
-    'coupar&ndash;angus',
-    'coupe-code',
-    'couping',
-    'coupl\'a',
-    'couple-headed',
     'couple-loneliness',
-    'coupledcavity',
-    'couples-land',
-    'couples/families',
-    'couplet.',
-    'coupon-rate',
-    'coupon.',
-    'couponed',
-    'courage-he',
-    'courage.',
-    'courage.a',
-    'courageous.today',
-    'courageouslycaught',
-    'courageousness',
-    'courages',
-    'couragingly',
     'couragious',
-    'courakis',
-    'courances',
-    'courantes',
-    'courbe',
-    'courbiss',
-    'courbon',
-    'courbusier',
-    'courcey',
-    'courcey-meade',
-    'courcheval/meribel/val',
-    'courcon',
-    'courdouan',
-    'coure',
-    'couret',
-    'courier-service',
     'courier-woman',
-    'courier/express',
-    'courlach',
-    'courloisie',
-    'courmayeur-bound',
-    'courmi',
-    'courn',
-    'cournot-equivalent',
-    'couroupita',
-    'courre',
-    'course&mdash;she',
-    'course\'',
-    'course-book',
-    'course-by-course',
-    'course-costing',
-    'course-fishing',
     'course-grained',
-    'course-growing',
-    'course-knit',
-    'course-led',
-    'course-linked',
-    'course-organiser',
-    'course-owning',
-    'course-record',
-    'course-record-equalling',
-    'course-setting',
-    'course-to-population',
-    'course-units',
-    'course.constable',
-    'course/accreditations',
-    'course/class',
-    'course/examination',
     'course/explodes',
-    'course/sailor',
-    'course/unit',
-    'coursees',
-    'coursefinder',
-    'courses/external',
-    'courses/projects',
-    'courses/seminars/workshops',
-    'courses/training',
-    'court&mdash;country\'',
-    'court&mdash;separate',
-    'court&mdash;which',
-    'court&rehy;martial',
-    'court-31c',
-    'court-action',
-    'court-aires',
     'court-and',
-    'court-approved',
-    'court-authorised',
-    'court-battles',
-    'court-building',
-    'court-cases',
-    'court-centred',
-    'court-circle',
-    'court-connected',
-    'court-convened',
-    'court-going',
-    'court-hampton',
-    'court-imposed',
-    'court-jester',
-    'court-life',
-    'court-made',
     'court-mandated',
-    'court-marshall',
-    'court-martialling',
-    'court-martials',
-    'court-messengers',
-    'court-of-arms',
-    'court-packing',
-    'court-related',
-    'court-roll',
-    'court-scholars',
-    'court-side',
-    'court-substitute',
-    'court-work',
-    'court-yard',
-    'court-you',
-    'court/buckinghamshire',
     'court/mother',
-    'courtade',
-    'courtald',
-    'courtalds',
-    'courtanay',
-    'courtaulds-made',
-    'courtaulds-owned',
-    'courtaulds-sponsored',
-    'courtdecision',
-    'courtelle/10%',
-    'courtenay-biggins',
-    'courtenay-latimer',
-    'courteny',
-    'courteron',
-    'courtesy/',
-    'courth',
     'courtheard',
-    'courthhouse',
-    'courtier-backed',
-    'courtier-like',
-    'courtillot',
-    'courtin',
-    'courting-free',
-    'courtiols',
-    'courtivron',
-    'courtmartialled',
-    'courtmen',
-    'courtnay',
-    'courtney/aston',
-    'courtney/oxfordshire',
-    'courtof',
-    'courtoisie',
     'courtroom-style',
-    'courts&mdash',
-    'courts&mdash;all',
-    'courts-general',
-    'courts-sustained',
-    'courts.l',
-    'courts.the',
-    'courtsey',
-    'courttown',
-    'courtyarded',
-    'courtyards-',
-    'cous-cous',
-    'cousfield',
-    'cousin-german',
-    'cousin-marriage',
-    'cousin-once-removed',
     'cousin/goddaughter',
-    'cousine',
-    'cousinhood',
-    'cousins-germain\'',
-    'cousins.',
-    'cousins/oxfordshire',
-    'cousinship',
-    'cousmacv',
-    'cousteau-style',
-    'cousteaus',
-    'coustillier',
-    'cout',
-    'coutant',
-    'coutelan',
-    'couterparts',
-    'couteuses',
     'coutinho',
-    'coutries',
-    'coutsoudis',
-    'coutt',
-    'coutts-smith',
-    'coutumier',
-    'couvercle',
-    'couvert',
-    'couverture',
-    'couvrat-desvergnes',
-    'couvrir-d&eacute;couvrir-travaux',
-    'couyld',
-    'couzins',
-    'cov&lsqb',
-    'cov&lsqb;b',
-    'cov/leeds',
     'covalently-bonded',
-    'covall',
-    'covariability',
-    'covariations',
-    'covary',
-    'cove&ntilde;as',
-    'cove-water',
-    'cove/mother',
-    'covehill',
-    'covehithe',
-    'covenant&mdash;length',
-    'covenant&mdash;usually',
-    'covenant-pledge',
-    'covenantees',
-    'covenants.',
-    'covenents',
     'covenham',
-    'covent-garden',
-    'coventionalised',
-    'coventionality',
-    'coventr',
-    'coventree',
-    'coventry-born',
-    'coventry-bound',
-    'coventry-built',
-    'coventry-climax',
-    'coventry/warwick',
-    'coventry0',
-    'cover-charge',
-    'cover-cropping',
-    'cover-design',
-    'cover-girls',
     'cover-loading',
-    'cover-mounted',
-    'cover-names',
-    'cover-papers',
-    'cover-photo',
-    'cover-price',
-    'cover-set',
-    'cover-slips',
-    'cover-stick',
-    'cover-story',
-    'cover-tackling',
-    'cover-title',
-    'cover-up\'',
-    'cover-version',
-    'cover-we',
-    'cover/logo',
     'cover/midwicket',
-    'coverage.the',
-    'coverclash',
-    'covered&rehy;up',
-    'covered-in',
-    'covergence',
-    'coverglass',
-    'coverham',
-    'covering/the',
-    'coverless',
-    'coverlets',
-    'coverlid',
-    'covermounted',
-    'coverplate',
-    'coverpoint',
-    'covers.',
     'covers/original',
-    'covers/originals',
-    'coversation',
-    'coversationally',
-    'coversations',
-    'coverseck',
-    'coversville',
-    'covertape',
-    'covertapes',
-    'coverup',
-    'coverversion',
-    'covetables',
-    'covey-crump',
-    'coveyancing',
-    'coveys',
-    'covin',
     'covington',
-    'covnoys',
-    'covox',
-    'covoy',
-    'covring',
-    'cow&rehy;ley',
-    'cow\'rin',
-    'cow-bells',
-    'cow-boys',
-    'cow-breath',
-    'cow-brown',
-    'cow-catchers',
-    'cow-country',
-    'cow-crossed',
-    'cow-flop',
-    'cow-free',
     'cow-herding',
-    'cow-hide',
-    'cow-hocked',
-    'cow-kick',
-    'cow-lick',
-    'cow-man',
-    'cow-muck',
-    'cow-noises',
-    'cow-pastures',
-    'cow-shit',
-    'cow-trodden',
-    'cow-truck',
-    'cow-worship',
-    'cow.',
-    'cow/bull',
-    'cow/heifers',
     'cowan/cherwell',
-    'cowan/london',
-    'cowap',
-    'coward-style',
-    'coward/lean',
-    'cowardian',
-    'cowardly-looking',
-    'cowark',
-    'cowbar',
-    'cowberry',
-    'cowbird',
-    'cowboi',
-    'cowboy-booted',
-    'cowboy-boots',
-    'cowboy-type',
-    'cowbyre',
     'cowcross',
-    'cowden/director',
-    'cowdin',
-    'cowdreys',
-    'cowdria',
-    'cowe11',
-    'cowells',
-    'cowerdly',
-    'cowerings',
-    'cowfish',
-    'cowford',
-    'cowgill/author',
-    'cowhands',
-    'cowherding',
-    'cowhides',
-    'cowhouse',
     'cowichan',
-    'cowin',
-    'cowirkers',
-    'cowl-necked',
-    'cowl-shaped',
-    'cowland',
-    'cowler',
-    'cowlers',
-    'cowley-designed',
-    'cowley-made',
-    'cowley/fraud',
-    'cowley/oxfordshire',
-    'cowley/warwickshire',
-    'cowliffe',
-    'cowling/propeller/spinner',
-    'cownie',
     'cownt',
-    'cowocracy',
-    'cowp',
-    'cowpeace',
-    'cowper-temple',
-    'cowpers',
-    'cowpits',
-    'cowpokes',
-    'cowps',
-    'cowrielike',
-    'cows/hectare',
-    'cowsfield',
-    'cowshill',
-    'cowshit',
-    'cowsill',
-    'cowson',
     'cowte',
-    'cox\'n/mechanic',
-    'cox/biomass',
-    'cox/farmer',
-    'cox/gloucestershire',
-    'cox/ldr',
-    'cox/pupil',
-    'cox/ross',
-    'cox/sports',
-    'cox/the',
-    'cox/victim',
-    'cox/white',
-    'cox/zoo',
-    'coxae',
-    'coxage',
-    'coxcombed',
     'coxeter',
-    'coxhall',
-    'coxii',
-    'coxosternum',
-    'coxsachie',
-    'coy-virgin',
-    'coygen',
-    'coyhaique',
-    'coyle/',
-    'coyle/banbury',
-    'coyle/bicester',
-    'coyle/bix',
-    'coyle/cirencester',
-    'coyle/english',
-    'coyle/huntingdon',
-    'coyle/latton',
     'coyle/london',
-    'coyle/swindon',
-    'coyle/witney',
-    'coyle/wotton',
-    'coylumbridge',
-    'coyme',
-    'coyney',
-    'coypu-control',
-    'coys',
-    'coytes',
-    'cozart',
-    'coze',
-    'cozened',
-    'cozening',
-    'cozens-walker',
-    'cozens.',
     'cozia',
-    'cozying',
-    'cozza',
-    'cozzens',
-    'cp&ndash;1961',
-    'cp&ndash;620',
-    'cp&ndash;621',
-    'cp-1655',
-    'cp-cotton',
-    'cp-env',
-    'cp.301a',
-    'cp/mas',
-    'cp071.210.91,927',
-    'cp10',
-    'cp16&ndash;18',
-    'cp2',
     'cp22',
-    'cp24',
-    'cp24-cp31',
-    'cp25',
-    'cp26-cp29',
-    'cp3',
-    'cp30',
-    'cp31',
-    'cp4',
-    'cp402.201.1',
-    'cp7',
-    'cpb-controlled',
-    'cpc-6128',
-    'cpc-sponsored',
-    'cpcr',
-    'cpcs',
     'cpders',
-    'cpdh',
-    'cpdn',
-    'cphl',
-    'cpi(m)-led',
-    'cpi-m-led',
-    'cpi-marxist',
-    'cpio',
-    'cpl/irs',
-    'cpm-mean',
-    'cpm/&micro;p',
-    'cpm/93',
-    'cpm/ng',
-    'cpm/tube',
-    'cpms',
-    'cpones',
     'cpos',
-    'cppd',
-    'cpq',
-    'cprw/scw',
-    'cps/service',
-    'cpsg',
-    'cpsl',
-    'cpsu\'',
-    'cpti',
-    'cpu-independent',
-    'cqa',
-    'cqc103',
-    'cqd',
-    'cr&acirc;ne',
-    'cr&eacute',
-    'cr&eacute;che',
     'cr&eacute;cy-calaig',
-    'cr&eacute;cy-en-ponthieu',
-    'cr&eacute;pe',
-    'cr&eacute;pinettes',
-    'cr&eacute;py',
-    'cr&eacute;tin',
-    'cr&ecirc;cy-calais',
-    'cr&ecirc;piness',
-    'cr&ecirc;ping',
-    'cr&ecirc;tes',
-    'cr&ecirc;ts',
-    'cr&egrave;hes',
-    'cr&egrave;me-de-menthe',
-    'cr&egrave;merie',
-    'cr&egrave;mes',
-    'cr&egrave;pe',
     'cr&euml;che',
-    'cr&iacute;tico',
-    'cr&oacute;nica',
-    'cr&uuml;e',
-    'cr-3',
-    'cr-39',
-    'cr.',
-    'cr.app.r.149',
-    'cr.app.r.59',
-    'cr/3491/g1',
-    'cr/c',
-    'cr2',
-    'cr21',
-    'cr3',
-    'cr393',
-    'cr4&ndash;45nm',
     'cr5',
-    'cr:licaf',
-    'cr:lisaf',
-    'cra\'ster',
-    'craaaark',
-    'craaark',
-    'crab-apples',
-    'crab-cake',
-    'crab-crawled',
-    'crab-eater',
-    'crab-faced',
-    'crab-hunting',
-    'crab-infested',
-    'crab-lice',
-    'crab-louse',
-    'crab-men',
     'crab-walked',
-    'crab-wise',
-    'crab-yaw',
-    'crabbes',
-    'crabbies',
-    'crabbily',
-    'crabbiness',
-    'crabe',
-    'crabeater',
-    'crablets',
-    'crabocide',
-    'crabstones',
-    'crabtree/worcester',
-    'crac/hobsons',
-    'cracherode',
-    'cracies',
     'crack&mdash;is',
-    'crack&rehy;addicted',
-    'crack\'d\'',
-    'crack-at',
-    'crack-boom',
-    'crack-cocaine',
-    'crack-free',
-    'crack-fzzz-tchktchk',
-    'crack-fzzzz',
-    'crack-head',
-    'crack-heads',
-    'crack-of-dawn',
-    'crack-peddling',
-    'crack-resistant',
-    'crack-selling',
-    'crack-stopper',
     'crack-stoppers',
-    'crack-thud',
-    'crack-war',
-    'crackable',
-    'crackamondo',
-    'crackbrain',
-    'crackbrained',
-    'cracked&rehy;leather',
-    'cracked-asunder',
-    'cracked-brain',
-    'crackenthorpe',
-    'crackenthwaite',
-    'cracker-ass',
-    'cracker-wise',
-    'crackhead',
-    'crackin',
     'cracking-apart',
-    'crackingly',
-    'crackle-glaze',
-    'crackle-glazing',
-    'crackle-prone',
-    'cracklets',
-    'cracklier',
-    'cracklingly',
-    'cracklure',
-    'cracknels',
-    'crackow',
-    'cracksmen',
-    'cracoe',
-    'cracoviensis',
-    'cracticus',
-    'craddock/protestor',
     'cradit',
-    'cradle-clothes',
-    'cradle-grave',
-    'cradle-snatcher',
-    'cradle-song',
-    'cradle-switch',
-    'craft-affiliation',
-    'craft-kind',
-    'craft-level',
-    'craft-maintenance',
-    'craft-masters',
-    'craft-related',
-    'craft-technician',
-    'craft-trading',
-    'craft-worker',
-    'craft.',
     'craft/design',
-    'craft/railway',
-    'craft/supervisory',
-    'crafters',
-    'craftily-titled',
-    'craftmen',
-    'craftroom',
-    'crafts&rehy;men',
-    'crafts*',
-    'crafts-and',
-    'crafts-exters',
-    'crafts-men',
-    'crafts-people',
-    'craftshops',
-    'craftsman-composer',
-    'craftsman-farmer',
     'craftsman-made',
-    'craftsmanship.dieter',
-    'craftsmen-entrepreneurs',
-    'craftsmen-level',
-    'craftsmen.',
-    'craftsmenship',
-    'craftspace',
-    'craftspersonship',
-    'craftsworker',
-    'craftwise',
-    'craftworker',
-    'craftworld',
-    'crag-fast',
-    'crag-like',
-    'crag-u-likes',
-    'cragdale',
     'craggenemars',
-    'cragger',
-    'craggily',
-    'cragging',
-    'craggit',
-    'craggsy',
-    'craggy-faced',
-    'craghead',
-    'craghill',
-    'cragnotti',
-    'crags/of',
-    'cragson',
-    'crahn',
-    'craib',
-    'craic',
-    'craies',
     'craig-y-biceps',
-    'craig-y-forwyn',
-    'craig-y-nos',
-    'craig-ydon',
-    'craig/contestant',
-    'craigan',
-    'craiganee',
-    'craigbarnett',
-    'craigeam',
-    'craigearm',
-    'craigendarrock',
-    'craigens',
-    'craigentinny',
-    'craiggowrie',
-    'craighton',
-    'craiglea',
     'craigline',
-    'craignethan',
-    'craigroyston',
-    'craigy\'s.',
-    'craik/frilford',
-    'craiks',
-    'crailing',
-    'crait',
-    'crakapax',
-    'crakow',
-    'crall',
-    'cram-full',
-    'cramar',
-    'crambeck',
-    'crambo',
-    'crambook',
     'crame',
-    'cramley',
-    'cramm',
-    'crammed-in',
-    'cramoisy',
-    'cramp-holes',
-    'cramp-tight',
-    'cramp_rather',
-    'crampa',
-    'crampe',
-    'cramped-looked',
-    'crampions',
-    'cramponed',
-    'crampsie',
-    'crampsy',
-    'crampy',
     'cranachs',
-    'cranbeads',
-    'cranborne/mother',
-    'crancour',
-    'crane-boulders',
-    'crane-hire',
-    'crane-like',
-    'crane-load',
-    'crane-neck',
-    'crane-necked',
-    'crane-tracks',
-    'crane/contractors',
-    'crane/west',
-    'cranefly',
-    'cranes.queen',
-    'cranfields',
     'cranially',
-    'cranidge',
-    'cranio-facial',
-    'craniocaudal',
-    'craniometric',
-    'craniometry',
-    'craniorachisisis',
-    'crank-handle',
-    'crank-starting',
-    'cranker',
-    'crankier',
-    'crankily',
-    'crankley',
-    'crankpins',
-    'crannagh',
-    'crannaig',
     'crans-montana',
-    'cranstackie',
-    'cranstouns',
-    'craon.',
-    'crap-heap',
-    'crap.',
-    'crapaud',
-    'craphead',
-    'crapo',
-    'crapoids',
-    'crapola',
-    'craposki',
-    'crappant',
-    'crapped-in-pants',
-    'crappees',
-    'crappen',
     'crapper/oxford',
-    'crapshooting',
-    'crapula',
-    'crapulousness',
-    'craquelure',
-    'crarae',
-    'crash-bang',
-    'crash-bang-wallop-bang-crash',
-    'crash-bash',
-    'crash-cutting',
-    'crash-diving',
-    'crash-in',
-    'crash-lands',
-    'crash-pad',
-    'crash-programme',
-    'crash-sites',
     'crash-testing',
-    'crash-worthiness',
-    'crash.the',
-    'crash/stole',
-    'crashability',
-    'crashaw',
-    'crashbarrier',
-    'crashdown',
-    'crasher',
-    'crasherama',
-    'crashingiy',
-    'crashland',
-    'crashlanded',
-    'crasie',
-    'crassigyrinus',
-    'crassioes',
     'crassulaceae',
-    'crassulacean',
-    'crassus',
-    'craster',
-    'craswall',
-    'cratchit.',
-    'cratchits',
-    'cratchley/holidaymaker',
-    'crate-people',
-    'crateagus',
-    'crateful',
-    'crater-free',
-    'crater-strewn',
-    'crateral',
-    'crateraster',
-    'crates-the',
     'crathienaird',
-    'cratloe',
-    'crauford',
-    'craufurd',
-    'crauste',
-    'cravan',
-    'cravat-looseners',
-    'crave.but',
-    'craven-hearted',
-    'cravenova',
-    'cravers',
-    'cravin\'',
-    'cravings.',
-    'cravioto',
-    'cravitz',
-    'crawcrook',
     'craweley',
-    'crawford/advertising',
-    'crawford/ingram',
-    'crawford/oxford',
-    'crawford/strathclyde',
-    'crawfordfsburn',
-    'crawhall',
-    'crawhill',
-    'crawl-spaces',
-    'crawlaway',
-    'crawle',
-    'crawler-crane',
-    'crawler-cranes',
-    'crawleys',
-    'craws',
-    'crawshafts',
     'crawyetts',
-    'cray-1',
-    'cray-2s',
-    'cray-equivalent',
-    'cray-l',
-    'cray-ymp',
-    'cray-zee',
-    'crayencour',
-    'crayeres',
-    'crayfishes',
-    'craylands',
-    'craymer',
-    'crayons/charcoal',
-    'craypas',
-    'crays',
-    'craza',
     'crazannes',
-    'crazily-built',
-    'crazinesses',
-    'crazy&mdash',
-    'crazy\'',
-    'crazy-angled',
-    'crazy-ass',
-    'crazy-golf',
-    'crazy-pavement',
-    'crazyman',
-    'crc-5',
-    'crch',
-    'crches',
-    'crda',
-    'crdp',
-    'crds',
     'cre-ange',
-    'cre-binding',
-    'creag-et',
-    'creagach',
-    'creakiness',
-    'creakingly',
-    'creakle',
-    'creaks&mdash;it',
-    'cream-and-white',
-    'cream-bag',
-    'cream-buff',
-    'cream-cake',
-    'cream-crackered',
-    'cream-curdling',
-    'cream-enriched',
-    'cream-gel',
     'cream-like',
-    'cream-pink',
-    'cream-puff',
-    'cream-reduction',
-    'cream-spotted',
-    'cream-stoned',
-    'cream-stuccoed',
-    'cream-tea-on-the-patio',
-    'cream-walled',
-    'cream-white',
-    'creamless',
-    'creampuff',
-    'creamy-bronze',
-    'creamy-brown',
-    'creamy-browny',
-    'creamy-buff',
     'creamy-gold',
-    'creamy-grey',
-    'creamy-pink',
-    'creamy-purple',
-    'creamy-red',
-    'creamy-textured',
-    'creamy/mealy',
-    'crear',
-    'crearie',
-    'crease-proof',
-    'crease-torn',
-    'creasebound',
-    'creaseline',
-    'creasemark',
-    'create&lsqb;d&rsqb',
-    'create-a-wood',
     'create/',
-    'create/directory',
-    'create/edit',
-    'created\'',
-    'created/safeguarded',
-    'creater',
-    'creates.',
-    'createst',
-    'creatifs',
-    'creatingl',
-    'creation-as-destruction',
-    'creation/',
-    'creationof',
-    'creative-affirmative',
-    'creative-destructive',
-    'creative/fantasy',
     'creative/innovative',
-    'creative/re-creative',
-    'creativists',
-    'creativity\'',
-    'creativity-oriented',
-    'creativity-stimulating',
-    'creativity/madness',
-    'creativity/psychosis',
-    'creativity/spirituality',
-    'creator/creation',
-    'creator/producer',
-    'creator/receiver',
-    'creature-comfortable',
-    'creature-flesh',
-    'creature-from-another-planet',
-    'creature-killer',
     'creature-world',
-    'creature.',
-    'creatures.it',
-    'creatures.they',
-    'creb-binding-protein',
-    'creb-binding-proteins',
-    'creb/creb',
-    'creber',
-    'crecerelle',
-    'creche-landing',
-    'creche/meeting',
-    'crecher',
-    'creching',
-    'creci',
-    'creci-trained',
-    'crecon.aa',
     'crecon.ab',
-    'crecon.pre',
-    'crecon.s01',
-    'crecon.s02',
-    'crecon.s03',
-    'crecon.s04',
-    'crecon.s05',
-    'crecon.s06',
-    'crecon.s07',
-    'crede',
-    'credem',
-    'credenhill/hereford',
-    'credenhill/herefordshire',
-    'credentialed',
-    'credentialization',
-    'credere',
     'crederis',
-    'credfl',
-    'credibility-boosting',
-    'credibilty',
-    'credibitity',
-    'credible/authoritative',
-    'credideritis',
-    'credidit',
-    'credietverzekering',
-    'credinta',
-    'credit&mdash;but',
-    'credit&rehy;worthiness',
-    'credit-',
-    'credit-activeness',
-    'credit-approved',
-    'credit-broking',
     'credit-by-',
-    'credit-card-style',
-    'credit-cards',
-    'credit-cost',
-    'credit-creating',
-    'credit-debit',
-    'credit-financing',
-    'credit-led',
-    'credit-limit',
-    'credit-powered',
-    'credit-rated',
-    'credit-rationing',
-    'credit-scheme',
-    'credit-scoring',
-    'credit-squeeze',
-    'credit-standing',
     'credit-starved',
-    'credit-wary',
-    'credit/documentary',
-    'credit/entry',
-    'credit/hire',
-    'credit:gpt',
-    'credit=total',
-    'credita',
-    'creditanstalt',
-    'creditanstalt-bankverein',
-    'creditbank',
-    'creditcall',
-    'creditible',
-    'creditist',
-    'creditor-supplier',
-    'creditor/plaintiffs',
     'creditors(s)',
-    'creditphone',
-    'creditplan',
-    'creditscoring',
-    'creditthis',
-    'creditview',
-    'creditwatch',
-    'credo-planning',
-    'credulity-straining',
-    'credulity.',
-    'credulously',
-    'creeager',
-    'creed.christ',
-    'creednz',
-    'creeeh',
-    'creeft',
     'creek&ndash;whitehouse',
-    'creek-warner',
-    'creeksville-in-the-boondocks',
-    'creelie',
-    'creely',
-    'creem',
-    'creen',
-    'creenagh',
-    'creep-haunts',
-    'creep-show',
-    'creep/i',
-    'creepe',
-    'creepea',
-    'creepercovered',
-    'creepered',
-    'creepeth',
     'creepier',
-    'creeping-jesus',
-    'creepit',
-    'creepy-crawliness',
-    'creese-parsons',
-    'creese-smith',
-    'creeveys',
-    'cregneish',
-    'creh',
-    'crehan/restaurateur',
-    'creider',
-    'creige',
-    'creigh',
-    'creith',
-    'crem.',
-    'cremaster',
     'cremated.',
-    'crematoire',
-    'crematorium-like',
-    'crematory',
-    'cremdean',
-    'creme-de-la-creme',
-    'cremello',
-    'cremers',
-    'cremmins',
-    'crems',
-    'crenallated',
-    'crendal',
-    'crendle',
-    'crendon/buckinghamshire',
-    'crenistria',
-    'crenmer',
     'crenosomiasis',
-    'crenson',
-    'creole-based',
-    'creole-language',
-    'creole-speakers',
-    'creole/english',
-    'creosote-based',
-    'crep',
-    'crepe-de-walthamstow',
-    'crepe-like',
-    'crepe-marocain',
-    'crepe-paper',
-    'crepe-sole',
-    'crepescule',
-    'crepet',
-    'crepidam',
     'crepitant',
-    'crepitating',
-    'crepitation',
-    'creppiny',
-    'crepsi',
-    'crepuscularity',
-    'crepy',
-    'crepy-en-valois',
-    'crer',
-    'crerard',
-    'cres',
-    'crescencio',
-    'crescendoes',
-    'crescent&ndash;silverknowes',
-    'crescent/hammond',
-    'crescenta',
     'crescentmead',
-    'cresley',
-    'cressa',
-    'cressall',
-    'cressbrook',
-    'cresse',
-    'cresses',
-    'cresset-torch',
-    'cresslough',
-    'cressly',
-    'cresswell/mariners',
-    'crest-derived',
-    'crest-fallen',
-    'crest-to-crest',
-    'crestfall',
-    'crestian',
     'crestona',
-    'cresttor',
-    'crestworth',
-    'cresyl-fast',
-    'cretae',
-    'cretagenes',
-    'cretan-born',
-    'crete-controlled',
-    'creten',
-    'creter',
-    'creti',
-    'cretingham',
-    'cretinisation',
-    'cretinizingly',
-    'cretonnes',
-    'cretton',
     'cretzschmar',
-    'creuau',
-    'creuset/',
-    'creutzfeld-jakob',
-    'creutzfeldt',
-    'creux',
-    'crev&eacute;e',
-    'creva',
-    'crevalcore',
-    'crevased',
-    'crevelle',
-    'crevettes',
-    'crevicing',
-    'crevy',
-    'crew&rehy;necked',
-    'crew-clipped',
     'crew-cutted',
-    'crew-mate',
-    'crew-member',
-    'crew-necked',
-    'crew-talk',
-    'crew-to-budget',
-    'crew-training',
-    'crew.ed',
-    'crew.there',
-    'crewdsons',
-    'crewe-cardiff',
-    'crewe/stoke-on-trent',
-    'crewed&rehy;up',
-    'crewes',
-    'crewgirl',
-    'crewi',
     'crews.',
-    'crews_as',
-    'creykes',
-    'crf.',
-    'cri-de-coeur',
-    'criacao',
-    'criado',
-    'criaerd',
-    'criagavon',
-    'criana',
-    'crib-bite',
-    'cribbens',
-    'cribber',
-    'cribbers',
-    'cribricyathids',
-    'cribsheet',
     'crich/midland',
-    'crichton-maitland/timber',
-    'crichton-miller',
-    'cricitize',
-    'crick-crick',
-    'crick-harper-raper',
-    'cricket&mdash;he',
-    'cricket-based',
-    'cricket-bat',
-    'cricket-bats',
-    'cricket-care',
-    'cricket-clubs',
-    'cricket-crazy',
-    'cricket-ground',
-    'cricket-like',
-    'cricket-loud',
     'cricket-mad',
-    'cricket-related',
-    'cricket-watchers',
-    'cricket-writing',
-    'cricket.',
-    'cricketer\'',
-    'cricketer-commentator',
-    'cricketers.',
-    'cricketfield',
-    'cricketless',
-    'crickey',
-    'crickl',
-    'cricklegate',
-    'cricklewoods',
-    'cricocosmia',
-    'cricoid',
     'criddle',
-    'cridland',
-    'cridmore',
-    'cried.',
-    'crieing',
-    'criena',
-    'crier.',
-    'crieria',
-    'cries/as',
-    'criffel',
-    'crightons',
-    'crii',
-    'crijevi&cacute',
-    'crike',
-    'crile',
-    'crill',
     'crim&mdash',
-    'crim.lr.',
-    'crimaldi',
-    'crimbo',
-    'crime\'\'',
-    'crime-books',
-    'crime-busters',
-    'crime-coercive',
-    'crime-controlling',
-    'crime-cutting',
-    'crime-fatigue',
-    'crime-fixing',
-    'crime-hit',
-    'crime-inducing',
-    'crime-infested',
-    'crime-plus',
     'crime-producing',
-    'crime-proof',
-    'crime-rates',
-    'crime-recording',
-    'crime-scares',
-    'crime-scene',
-    'crime-solving',
-    'crime-stories',
-    'crime-weary',
-    'crime-writing',
-    'crime2',
-    'crimea-based',
-    'crimebuster',
-    'crimed',
-    'crimefighter',
-    'crimefighting',
     'crimes/lwt',
-    'crimestalker',
-    'crimewatcher',
-    'crimewriters',
-    'crimewriting',
-    'criminal\'',
-    'criminal-court',
-    'criminal-enforcement',
-    'criminal-minded',
-    'criminal-participation',
-    'criminal-pollution',
-    'criminal.',
-    'criminalisa',
-    'criminalistics',
-    'criminally-enforceable',
-    'criminaloids',
     'criminals.',
-    'crimine',
-    'criminel',
-    'criminels',
-    'criming',
-    'criminla',
-    'criminol',
-    'criminology.',
-    'criminy',
-    'crimmitschau',
-    'crimonology',
-    'crimpage',
-    'crimped-edged',
-    'crimperology',
-    'crimple',
-    'crimpling',
     'crimson-bellied',
-    'crimson-black',
-    'crimson-carpeted',
-    'crimson-clouded',
-    'crimson-coated',
-    'crimson-coloured',
-    'crimson-curtained',
-    'crimson-dyed',
-    'crimson-eared',
-    'crimson-enamelled',
-    'crimson-lipped',
-    'crimson-nailed',
-    'crimson-painted',
-    'crimson-purple',
-    'crimson/wine',
-    'cringe&rehy;making',
     'cringe-worthy',
-    'cringeing',
-    'cringeth',
-    'cringeworthy',
-    'cringingly',
-    'crinita',
-    'crinitus',
-    'crink',
-    'crinkle-cut',
-    'crinkle-faced',
-    'crinkliness',
-    'crinnis',
-    'crinolene',
-    'crinolines.',
-    'crinow',
-    'crinum',
     'crinyion',
-    'criollos',
-    'criomes',
-    'cripp',
-    'crippens',
-    'cripple-ware',
-    'cripplecock',
-    'cripplin\'',
-    'cripps-day',
-    'cripps.lansbury',
-    'cripps/gloucestershire',
-    'cripps/swindon',
-    'crippsian',
-    'cripwise',
-    'cris-cross',
-    'crisantemi',
     'crisell',
-    'crises_because',
-    'crisham',
-    'crishill',
-    'crisis&mdash;particularly',
-    'crisis&rehy;ridden',
-    'crisis-and-clarity',
-    'crisis-based',
-    'crisis-by-crisis',
-    'crisis-callaghan',
-    'crisis-discussions',
-    'crisis-driven',
-    'crisis-fancying',
-    'crisis-manager',
-    'crisis-of-britain',
-    'crisis-point',
     'crisis-prone',
-    'crisis-provoking',
-    'crisis-revolution',
-    'crisis-sharing',
-    'crisis-solving',
-    'crisis-strewn',
-    'crisis-weary',
-    'crisis/emergency',
-    'crisises',
-    'crisman',
-    'crismas',
-    'crisp&rehy;cutting',
-    'crisp-bags',
-    'crisp-cooked',
-    'crisp-cuffed',
-    'crisp-edged',
     'crisp-looking',
-    'crispe',
-    'crispers',
-    'crisphead',
-    'crispiest',
-    'crispin.',
-    'crispings',
-    'crispins',
-    'crispinus',
-    'crisply-dressed',
-    'crisply-mixed',
-    'crisply-pressed',
-    'crisply-produced',
-    'criss&rehy;cross',
-    'criss&rehy;crossing',
-    'crissakes',
     'crisswell',
-    'cristaes',
-    'cristalized',
-    'cristalle',
-    'cristalline',
-    'cristao',
-    'cristatella',
-    'cristea',
-    'cristen',
-    'cristes',
-    'cristescues',
-    'cristi',
-    'cristi&aacute;n',
-    'cristian',
-    'cristianas',
-    'cristianos',
     'cristin',
-    'cristini',
-    'cristo-1',
-    'cristo-2',
-    'cristofano',
-    'cristofori-style',
-    'cristofori-type',
-    'cristoforo',
-    'cristy',
-    'critcal',
-    'critchell',
-    'critcis',
-    'critcized',
-    'crite',
-    'criter',
-    'criter-',
     'criterea',
-    'criterial\'/\'less',
-    'criterion&rehy;referenced',
-    'criterion-basis',
-    'criterions',
-    'criti',
-    'criti&rehy;cisms',
-    'critic-as-reader',
-    'critic-in-chief',
-    'critic-learning',
-    'critic-novelist',
-    'critic/reader',
-    'critical-dissuasive',
-    'critical-mass',
-    'critical-success',
-    'critical-success-factor',
     'critical-theoretical',
-    'criticalities',
-    'critically-acclaimed',
-    'critically-defied',
-    'critically-lauded',
-    'critically-minded',
-    'critically-mocked',
-    'critically-supported',
-    'critically-thinking',
-    'criticalness/acquiescence',
-    'criticaly',
-    'criticcal',
-    'critici',
-    'criticise/i',
-    'criticism-wise',
-    'criticisms.i',
     'criticisms/disavowals',
-    'criticizing/shouting',
-    'critico-storici',
-    'critics-made',
-    'criticsim',
-    'criticus',
-    'critieize',
-    'critiism',
-    'critiqued',
-    'critiscise',
-    'critisicms',
-    'critising',
-    'critisized',
-    'critism',
-    'critize/praise',
-    'critque',
     'critria',
-    'crits',
-    'crittal',
-    'crittall',
-    'crittalls',
-    'crittenden',
-    'crittle',
-    'critz',
-    'criville',
-    'crizzled',
-    'crk',
-    'crm',
-    'crmx',
-    'crn-ccaod',
-    'crna',
-    'crnic',
     'crnojevi&cacute;i',
-    'crnota',
-    'cro&euml;s',
-    'cro&ucirc',
-    'cro&ucirc;tes',
-    'cro&ucirc;ton',
-    'cro-operator',
-    'croa',
-    'croag',
-    'croaghleighan',
-    'croak-a-cola',
-    'croak-a-roach',
-    'croaka-cola',
-    'croaky-faced',
-    'croasdaile',
-    'croat-governed',
     'croat-inhabited',
-    'croat-manned',
-    'croat-slovene',
-    'croatia&mdash;after',
-    'croatia-bosnia',
-    'croatia-slovenia',
-    'croatian-controlled',
-    'croatian-held',
-    'croatian-manned',
-    'croatian-slovene',
-    'croats.',
-    'croats1',
-    'crocea',
-    'croceanism',
-    'crocelle',
-    'crochet-bordered',
     'crochet-hook',
-    'crochet-like',
-    'crochets',
-    'crock-filled',
-    'crockatt',
-    'crockenhill',
-    'crockers',
-    'crockery-ware',
-    'crocket',
-    'crockett-style',
-    'crockhamhill',
-    'crocknafeola',
-    'crocky',
-    'crocodile-headed',
-    'crocodile-infested',
-    'crocodile-inhabited',
     'crocodile-magill',
-    'crocodile-toothed',
-    'crocodile-wise',
-    'crocodylidae',
-    'crocoldee',
-    'crocosmiiflora',
-    'crocoytus',
-    'croda-funded',
-    'croesi',
-    'croesian',
-    'croesnewydd',
-    'croeso',
-    'croesuses',
-    'croesusian',
-    'croetzer',
-    'croft/district',
     'croftamie',
-    'crofted',
-    'crofter-managed',
-    'croftfoot',
-    'crofthead',
-    'crofts/car',
-    'croftsman',
-    'croftway',
-    'croftweave',
-    'crogary',
-    'croggan',
-    'croggon/award',
-    'croggon/research',
-    'croggy',
-    'croglin',
-    'croham',
     'croi',
-    'croispol',
-    'croissier',
-    'croixde-guerres',
-    'croizat',
-    'croker/organiser',
-    'crole',
-    'cromagnon',
-    'cromak',
-    'cromakalim',
-    'cromalins',
-    'cromar',
-    'crombleholme',
-    'cromed',
-    'cromek',
-    'cromlechs',
     'cromley',
-    'cromlix',
-    'crommock',
-    'cromornes',
-    'crompton-batt',
-    'cromsley',
-    'cromwell/cattle',
-    'cromwellians',
-    'cron',
-    'cronberry',
-    'cronenbergian',
-    'cronex-4',
-    'croneyism',
-    'cronicles',
-    'cronista',
-    'cronj&eacute',
     'cronjie/elizabeth',
-    'cronkhill',
-    'cronmore',
-    'cronquist',
-    'cronshaw/college',
-    'cronton',
-    'croob',
-    'crook-back',
-    'crook-backed',
-    'crook-shouldered',
-    'crook/driver',
-    'crooke/neighbour',
-    'crookeder',
-    'crookedness',
-    'crookeing',
-    'crookhall',
     'crookrise',
-    'crooks/mother',
-    'crooks/ralph',
-    'crooksbarn',
-    'crooksbury',
-    'croompet',
-    'crooned.',
-    'croonies',
-    'crop-blonde',
-    'crop-chemical',
-    'crop-climate',
-    'crop-destroying',
-    'crop-dusting',
-    'crop-failures',
-    'crop-farming',
-    'crop-full',
     'crop-picker',
-    'crop-planting',
-    'crop-raiding',
-    'crop-residues',
-    'crop-sick',
-    'crop-sprayer',
-    'crop-storage',
-    'crop-top',
-    'crop-yield',
-    'crop-yields',
-    'crop.',
-    'crop/stock',
-    'cropful',
-    'crophail',
-    'cropping-rate',
-    'croppings',
     'croppy',
-    'cropredy/oxfordshire',
-    'crops.',
-    'cropsey',
-    'cropstar',
-    'cropt',
-    'cropuching',
-    'cropwood',
-    'croquant',
-    'croque-madame',
-    'croque-monsieur',
-    'croque-monsieurs',
-    'croquemonsieur',
-    'croques',
-    'croqueting',
-    'crores',
     'crorie',
-    'crosbiefisheries',
-    'crosbrig',
-    'crosby-born',
-    'crosby-on-eden',
-    'crosby/panelbeater',
-    'crosby/united',
-    'croscill',
-    'crosen',
-    'crosgrave',
-    'croshaw',
-    'crosland-symms',
-    'crosland/fabian/',
-    'croslandite',
-    'crosley',
-    'crosman',
     'crosotel',
-    'cross&mdash;country',
-    'cross&ndash;boundary',
-    'cross&ndash;leeds',
-    'cross&ndash;london',
-    'cross&ndash;york',
-    'cross&rehy;courses',
-    'cross&rehy;culturally',
-    'cross&rehy;currents',
-    'cross&rehy;cutting',
-    'cross&rehy;eyed',
-    'cross&rehy;fertilization',
-    'cross&rehy;gartered',
-    'cross&rehy;head',
-    'cross&rehy;indexed',
-    'cross&rehy;ings',
     'cross&rehy;modal',
-    'cross&rehy;purposes',
-    'cross&rehy;unit',
-    'cross-advising',
-    'cross-agency',
-    'cross-analysing',
-    'cross-analysis',
-    'cross-angled',
-    'cross-areal',
-    'cross-art',
-    'cross-assembler',
-    'cross-authority',
-    'cross-band',
-    'cross-banded',
-    'cross-barred',
-    'cross-bars',
     'cross-bearing',
-    'cross-bedding',
-    'cross-belts',
-    'cross-billing',
-    'cross-body',
-    'cross-boring',
-    'cross-bows',
-    'cross-breds',
-    'cross-breeds',
-    'cross-breeze',
-    'cross-bridges',
-    'cross-burning',
-    'cross-but-trying-to-be-helpful',
-    'cross-calculation',
-    'cross-cambridge/',
-    'cross-cambridge/peterborough',
     'cross-campus',
-    'cross-capital',
-    'cross-charging',
-    'cross-city',
-    'cross-combination',
-    'cross-come-shot',
-    'cross-company',
-    'cross-compatibility',
-    'cross-compilers',
-    'cross-complications',
-    'cross-compound',
-    'cross-connexion',
-    'cross-connotation',
-    'cross-continental',
-    'cross-contribution',
-    'cross-core',
     'cross-correlating',
-    'cross-corridors',
-    'cross-courses',
-    'cross-cows',
-    'cross-crediting',
-    'cross-cum-shot',
-    'cross-curricularity',
-    'cross-dating',
-    'cross-default',
-    'cross-diagram',
-    'cross-dialectal',
-    'cross-ditch',
-    'cross-divisional',
-    'cross-draughts',
-    'cross-dressed',
-    'cross-dresses',
     'cross-drill',
-    'cross-editing',
-    'cross-elasticity',
-    'cross-ethnic',
-    'cross-examiner',
-    'cross-experience',
-    'cross-experiment',
-    'cross-feed',
-    'cross-fertilise',
-    'cross-fertilised',
-    'cross-fertilises',
-    'cross-fertilising',
-    'cross-fertilizing',
-    'cross-financed',
-    'cross-fitting',
-    'cross-frame',
     'cross-frequencies',
-    'cross-function',
-    'cross-gartering',
-    'cross-generic',
-    'cross-hatchings',
-    'cross-hauling',
-    'cross-heads',
-    'cross-holding',
-    'cross-hybridize',
-    'cross-immunity',
-    'cross-in-hand',
-    'cross-indexing',
-    'cross-influence',
-    'cross-influences',
-    'cross-institutional',
-    'cross-insurance',
     'cross-interrogation',
-    'cross-island',
-    'cross-labels',
-    'cross-lacing',
-    'cross-lamination',
-    'cross-laying',
-    'cross-leading',
-    'cross-leaved',
-    'cross-leeds/',
-    'cross-linkage',
-    'cross-listing',
-    'cross-lit',
-    'cross-load',
-    'cross-looking',
-    'cross-market',
-    'cross-marketing',
     'cross-members',
-    'cross-membership',
-    'cross-mersey',
-    'cross-migration',
-    'cross-model',
-    'cross-motion',
-    'cross-motions',
-    'cross-multiplying',
-    'cross-my-heart-and-hope-to-die',
-    'cross-nation',
-    'cross-oriented',
-    'cross-pacific',
-    'cross-peaks',
-    'cross-pegs',
-    'cross-pennine',
-    'cross-peterborough',
     'cross-plan',
-    'cross-platforms',
-    'cross-play',
-    'cross-plots',
-    'cross-polar',
-    'cross-polarisation/magic',
-    'cross-polarization',
-    'cross-pressures',
-    'cross-proceedings',
-    'cross-productisation',
-    'cross-purpose',
-    'cross-purposed',
-    'cross-pyrenean',
-    'cross-range',
-    'cross-rate',
-    'cross-reaction',
     'cross-reactivity',
-    'cross-reacts',
-    'cross-referential',
-    'cross-referral',
-    'cross-relate',
-    'cross-relating',
-    'cross-relations',
-    'cross-relationship',
-    'cross-representation',
-    'cross-resistance',
-    'cross-rhymed',
-    'cross-ridges',
-    'cross-rods',
-    'cross-route',
-    'cross-routes',
-    'cross-sbu',
     'cross-screen',
-    'cross-seasonal',
-    'cross-seat',
-    'cross-sectarian',
-    'cross-sectioned',
-    'cross-sectioning',
-    'cross-sectorial',
-    'cross-sell',
-    'cross-selling&mdash;it',
-    'cross-selling.',
-    'cross-sensitivity',
-    'cross-sexual',
-    'cross-shaft',
-    'cross-situational',
-    'cross-skill',
-    'cross-skilling',
     'cross-slices',
-    'cross-span',
-    'cross-spar3',
-    'cross-spoke',
-    'cross-spur',
-    'cross-staff',
-    'cross-staffing',
-    'cross-sterile',
-    'cross-stitching',
-    'cross-straits',
-    'cross-strand',
-    'cross-strap',
-    'cross-subsidies',
-    'cross-subsidised',
-    'cross-subsidization',
-    'cross-task',
     'cross-temporal',
-    'cross-terms',
-    'cross-terrier',
-    'cross-threaded',
-    'cross-tics',
-    'cross-trade',
-    'cross-trainer',
-    'cross-tremor',
-    'cross-validity',
-    'cross-vaulted',
-    'cross-vendor',
-    'cross-walks',
-    'cross-wall',
-    'cross-weave',
-    'cross-winged',
-    'cross-wired',
     'cross-xxxx',
-    'cross-your-legs-and-cringe',
-    'cross.addictions',
-    'cross.addictive',
-    'cross.bedding',
-    'cross.examine',
-    'cross/corner/throw',
-    'cross/daily',
-    'cross/egged',
-    'cross/euston',
-    'cross/northamptonshire',
-    'cross/patient',
-    'cross/station',
-    'cross/underground',
-    'crossable',
-    'crossaig',
     'crossapol',
-    'crossarms',
-    'crossball',
-    'crossbelt',
-    'crossbencher',
-    'crossbenches',
-    'crossbone',
-    'crossbow*',
-    'crossbridge',
-    'crosscauseway',
-    'crosscollyer',
-    'crosscourt',
-    'crosscurrent',
-    'crosscutting',
-    'crossdraught',
-    'crossed-aphasia',
     'crossed-controls',
-    'crossed-in-love',
-    'crossed-swords',
-    'crossed-up',
-    'crossed-wires',
-    'crossed.',
-    'crossen',
-    'crosses.',
-    'crosses/corners/free',
-    'crossett',
-    'crossfell',
-    'crossfield/refuse',
-    'crossfire.they',
-    'crossfires',
-    'crossgatehall',
-    'crossharbour',
     'crosshatching',
-    'crosshill',
-    'crosshills',
-    'crossier',
-    'crossing\'',
-    'crossing-over',
-    'crossing-patrol',
-    'crossing-place',
-    'crossing-places',
-    'crossing.',
-    'crosskill',
-    'crosslands',
-    'crossleys',
-    'crossline',
-    'crosslingual',
-    'crossman/managing',
     'crossman/south',
-    'crossmans',
-    'crossmix',
-    'crosson',
-    'crossplies',
-    'crossplys',
-    'crosspunch',
-    'crosspurpose',
-    'crossreaction',
-    'crossreactivity',
-    'crossroad-built',
-    'crosssection',
-    'crosstab',
-    'crosstabulation',
-    'crosstides',
-    'crosstree',
     'crosswalks',
-    'crosswalls',
-    'crosswell',
-    'crosswires',
-    'crossword-puzzle',
-    'crost',
-    'crostade',
-    'crostain',
-    'crosthwaite-eyres',
-    'crostinos',
-    'crotalidae',
-    'crotamiton',
-    'crotch-obsessed',
-    'crotch-related',
-    'crotch-sweating',
-    'crotch-thrusting',
     'crotche',
-    'crotchet=76',
-    'crotia',
-    'crotonifolia',
-    'crotonville',
-    'crotti',
-    'crouch-backed',
-    'crouch-touch',
-    'croucheston',
-    'crouchings',
-    'croucier',
-    'crouds',
-    'croun',
-    'crouner',
-    'croupe',
-    'crousse',
     'croustades',
-    'crout',
-    'crouzet',
-    'crow\'s-nest',
-    'crow-bar',
-    'crow-black',
-    'crow-flying',
-    'crow-harry',
-    'crow-headed',
-    'crow-shrikes',
-    'crow-sized',
-    'crow-style',
-    'crow-toe',
-    'crow-women',
-    'crow/ravens',
-    'crowd&rehy;side',
     'crowd\'',
-    'crowd-avoiding',
-    'crowd-baiting',
-    'crowd-drawer',
-    'crowd-lined',
-    'crowd-management',
-    'crowd-out',
-    'crowd-quelling',
-    'crowd-raiser',
-    'crowd-scene',
-    'crowdale',
-    'crowded.',
-    'crowden/pest',
-    'crowdie',
-    'crowdin\'',
-    'crowe/bucks',
     'crowford',
-    'crowingly',
-    'crowings',
-    'crowish',
-    'crowley/thamesdown',
-    'crowleyite',
-    'crowleys',
-    'crowlin',
-    'crowlink',
-    'crown-capped',
-    'crown-debtors',
-    'crown-feathers',
-    'crown-heel',
-    'crown-of-thorns',
-    'crown-piping',
-    'crown-roast',
     'crown-rump',
-    'crown-shaped',
-    'crown-subject',
-    'crown-weave',
-    'crown-zellerbach',
-    'crown/rac',
-    'crowned.',
-    'crownes',
-    'crownholds',
-    'crownings',
-    'crownless',
-    'crowscombe',
-    'crowshaw',
-    'crowskin',
-    'crowth',
-    'crowther-like',
     'crowther/protestor',
-    'crowthers',
-    'crowthorne/berkshire',
-    'crowying',
-    'croyance',
-    'croydon-based',
-    'croydon-born',
-    'croydon/surrey',
-    'crozat',
-    'croze',
-    'crozes-hermitage',
-    'crp-3',
-    'crp-wild-type',
-    'crp.',
-    'crp1',
-    'crpf',
     'crpt',
-    'crre',
-    'crrkkkk',
-    'crrreak',
-    'crrrk',
-    'crrrkkkkkk',
-    'crsd',
-    'crshd',
-    'crshing',
-    'crt.',
-    'crua',
-    'crubeens',
-    'crucc-crucc',
-    'crucem',
-    'cruche',
-    'cruci',
     'crucial_in',
-    'cruciani',
-    'cruciferous',
-    'crucifi',
-    'crucifiction',
-    'crucified.',
+)
+
+blocks_82 = (
+    '#\'f\'table$#ily%"rm%!t$)ort-dream(%house(&keeper(*orientated(#sex($zone\'!.\'-able-sounding+(_instead+$ness+!s',
+    '\'!h\'#in\'\'&lessly$+rey-scented\'!s#.haolt&aacute;s#\'ic-cuts&%drama&&horror&\'satiric\'&urreal&(terrible\'$urns%1/book/t-shirt/toy&&tragic',
+    '$%grate$#lla\'!s$#n\'.%"co\'!m%\'g&mdash&*-and-going\'$down\'"of(\'ut-ball\'Bround-the-mountain-in-a-12-ton-rig\'\'through($o-be*$know',
+    '*%terms&!/\'\'dealing&$_out\'"up)"_,*"to&,s-and-goings%!s%-tern-inspired*%style)!s$%setti%!h%#key',
+    '&#ion$#tas&"to%$ment%#ted\'"es$!x#(junction#.ley/thamesdown#(m-called%$lens&#ink%&switch&%ystem%$unit',
+    '%%_next%$chio%$dagh%%nd(s)\'2-backed-by-threats(&driven\'$.num("to\'+ant-general\'%ement(\'r-elect)0/gloucestershire*#raf)"ie),s&mdash;riek',
+    '("ur\')it&eacute\'5o-helicopter-carriers%"s.$$desk%!r$%edagh%(linaceae(!e%*moratively-!s%)nc&eacute\'&ement.&#dam(#tio',
+    '&*surability&4t&lsqb;modifications-$this\'%aires(#tes\'\'because\'%ed-on\'"ry)\'/report\'"s.((/answers))dependent)\'further&"us%$rate',
+    '\'1e&rehy;destroying(*-designate\'/ial-electronics+#law+&making+%scale,$ized+$type*!/+#bmp+%legal+)technical*%izing*/ly&rehy;applied,+-attractive',
+    '-)important-#led-(oriented.$wned-(packaged.\'roduced-(relevant-+sustainable-)viability1"le-$xxxx)#nti&%icial&%ntary&!s',
+    '\'$onii%!s&"si%!t&#ary$!g$\'ication%\'dendrum%(e-hating%&nating)"on&*uqu&eacute\'#ted(#ion(#ors',
+    '&!h&%ioned*"rs\'#son\'!t&,s&rehy;ioned\'"ao()ry-johnny\'-ion&rehy;free*)-approved+%based+(inspired+$only+$paid+$xxxx',
+    '+(training*$able+"er*-er-in-waiting-#the,0s&mdash;whatever-!.*!g*$ings\'!n\'"on)!s\'$sion%*t&rehy;tee/!s',
+    '*\'-makers*./disengagement*$s_in&$teds(,e&mdash;that)!\')#(s))+-accredited*\'forcing*%level+#ike*&making,%naged+&eeting*\'related',
+    '+$oast+"un*$type*$work)\'/oxford)!1)"s.*\'/office(!r$$link$\'mission&%tment%#ons%%unist*!s',
+    '$)nications&"ty$%odify\'!s\'$tise()y-broking*\'capital*)dependent*$like,$nked*%price,%oduct*)socialist+%tatus*$type',
+    '\'"us&!o&0us&rehy;hercules%(n&commat&!-\')collector)"re($rime\'+denominator\'%earth(\'nvelope\'&format\'\'grazing)$ound\'$know',
+    '\'#man\'$prim\')senseless\'%weale+&th-men\'$yard&,/oxfordshire&#age&!e\'!d\'\'rs.they)#hip&!g&$help&#ish',
+    '\',y&rehy;owned(&-cited)+experienced)$kept))occurring)*prescribed&#man&&place\'&$side&$wave\'-ealth-centred-&soviet.$tyle,#ism,!s',
+    ')"th%$rits%&wealth$"rs$&tments$$uity%"n.&\'al-like(!.("es((ly-based+%owned\'#ute&&cation&*e-brutally',
+    '\'4/warehouse/community\'"au&*i&oacute;n\'"c8(,a&rehy;tions)?te/signify/represent/constitute*&ion(s)-)-oriented.(training.$wise-!.-,/counselling/&ulture.,presentation-$s***',
+    '/)conscious/\'network/(obsessed.!..)/advisory/)transport.$week+3ve-representational.(symbolic-(ly-based-$ness\'$dade\'#kty\'#on\')!e',
+    '\'&sation("me("t\')!-*$bloc**homosexual+%unter*(inclined,(fluenced,\'stalled*&jewish**labourites*(occupied++rchestrated,&iented',
+    '+&tarred+(upported)!/)%ische).s&mdash;gained\'\'tarians("es(,ies&mdash;ec+)-european,#the,"we+\'/health(+y&mdash;set*,rehy;focused)!-',
+    ',,sed-services*&centre+)ontrolled*/decision-making,%vised+\'irected*&funded*&health*,in-education*&member+)indedness-&isters**originated*#run*%scale',
+    ',!t+$mack*"us)(.j&ndash*"we)&/adult*&client+(ommunity*&police*\'village)!l)(oriented)$wide\'\'ucation\'!y',
+    '(!m&+o-socialism&!s&$ties%%table&\'er-belt)$hour)%lines()/runabout($land&!i$!y##nes$!g$$pany',
+    '$(nwealths$$rans\'!t&$tion%$eans%"in$&vement#.p&eacute;tente&*grave;ring%(lsqb;any%(ocirc;te$\'/decomp%$tech$#600$*ac-branded',
+    '\'*-initiated\',aci&oacute;n("nt\'$disc\'$ible\'"um%(drinazgo%$gnia\'#oni)!s%)ir-holman%$jina%$lint%%neras("os',
+    '&$hons&"ie(,s&mdash;fell0&mainly)!\')(-hitachi)5/organizations/groups*,partnerships)\'_rather)$have)$with\'*on-general*+housekeeper*)secretary*#way',
+    ')\'ability)#ing)$less)*s-augustus*!.*+hip-seeking-#.we-!s)$ways&*y&mdash;in.#see\'#\'s.\'!*\')-approved(*by-company',
+    '(*fascinated)%unded(*government(&headed(#law((oriented(\'patient)\'rovided()reporting(*subsidised*\'ggested\'&.based\'-/co-operative*\'mpanies(+institution',
+    '(#mgm(,organisation($port($unit\'\'_except\'#ing\'!w%*r&eacute;e((grave;es&)able-17.o*!.)(y-priced\'#nda\',tively-sized/$mall',
+    '&"co&!d&*e/contrast\'$rite&"in\'0son-and-contrast*%_with*\'s--with&"ms&$sion&)tment-the+\'alising.#zes+"s.%!s',
+    '(&points\'!e\'$ion\'*\'-filled*$ate/%&tative&&ibiity)#lty%!y$!c%"on$\'editors%$igne%!n&%diosa',
+    '(#ion)#ton($tes.)%ingly*)on-cheque,#ary,$itis)"or\'!e%"rs%"ss\'"es\'!o%#te/(\'canvass',
+    '*)/outcomes++performance)+y/threshold\'"rs&,i&rehy;tions\'%ng.in\'#ors\'!t(#ing)#on-,(inducing,*orientated,)promoting,%sized+(.richard',
+    ',*canvassing,`market-driven/efficiency/quality/flexibility/nmanned&rehy;onment,*soliciting+"s.)"vc*(e/partly+-ly-determined.$set.+!s\'"ve)"ly)$ness$"il&$able\'7tion&rehy;collaboration',
+    '*!y&.er-independent)%level&"io%"ng$"la&#in\'(%ingly(\'t-based)!.)\'/urgent)"s.*)/injuries\'&santly&#ynt',
+    ')!d&/ment-inhibitory*\'_rather*%arily-.ty-determining*"er*%isers*!o&$te.1))fulfilled)\'richard(!3($d/or)#_at(&ly-all',
+    '+(occluded(%ness.(*r-finisher)!.(>unco/headlesschicken/lamehorse("yl\'&ing_in(.on&mdash;buyer1"eg1"no1&seller2%hould1\'whether1#you*"il',
+    '&/x-feature-based(\'seeming)%haped),tabilization\'(/skilled\'!e("s.\'-ion-conscious*!.(#ty.\'!s%,i&rehy;cated/#ion&)ance-were\'#ted',
+    '(/t&lsqb;ing&rsqb)+ed&mdash;as2"eg+)-sounding+"ly)%ional\'!e&&ements\'"rs&)ment-hunt*-/congratulate*%aries*!e*-s-to-the-chef&!n',
+    '%"ot%!t%&utense%!x%"yn$"ny$\'onenets(\'t-based+%uying++y-component*\'failure*&making*,to-component-(external)!.',
+    ')-s&mdash;pumps1#the\'"ts%%rtait\'+e&rehy;ment\'!s%!s&\'&eacute-";s&(_mentis.&"ee\',r-conductors)&figure),in-residence)%movie',
+    '))performer*\'roducer(*/conductor))performer*&ianist(#ess((pianists(.s-in-residence&\'i-tions\'(ng-rooms*%stick\')te-bodied*$they)"ur()ion--will',
+    '+(/mineral+.al/redactional)"ve(\'oresses*"s.(!s\'"um\'%zione&%nents&(t-filled($heap(%maker-!s\'%/soil\'!o',
+    '&%nd(s)()-interest)$noun()/adhesive$&radore*!s%\'ehender*$ible*!o)*sive&mdash-.-turned-direct/#ype-*/secondary,#ize&#ndo',
+    '\'"ez&(shensive\'"sa(\'ed-snow()ibilities)*on-ignited,(moulding+!.+)/doubling,)expansion,(limiting,\'support((or-blade+)sustainer*&/noise',
+    '\'!e&%se(d)("rs\'#ong%,o&rehy;miser&*misability)*e-creating+%which*$.for*%:each+"in+#the+&vendor*%s-are+$:the',
+    '%"on%#ure$%table%&erised%/on&rehy;burnett\'&-smith\'*/berkshire\'%esque$&ucount&$raft%$data%$link&%sitor(&veness*!s',
+    ')*y-purchase*!.%+nction&rehy&!d%\'rgators%&serve.+#com&"ys%"ta\'&center\'$date\'$kits\'"ti)#on.+/ally-influenced',
+    '&\'e-bound\',r&mdash;plus)%ndash),rehy;company.$room.)sensitive/,uperliterate(\'--based)5across-the-curriculum+\'tivated*$dept+*ministered*"ge*\'nalysis)%banks',
+    '*\'oosting*&rained*\'uilders)*calculated*%entre*)lustering*(ollected*\'um-word)$data,#ing*&erived+\'signing+\'veloped*\'irected)"ed',
+    '+!x*\'riendly)&goalie)*illiterate*\'ndexing,%ustry+)formation+\'itiated+(strument)\'learned*(iterates*#ock)$made+$kers,#ing',
+    ',*ufacturing*%inded*(onitored0!s*$usic)(networks*5umerically-controlled)(obsessed*)rientated*%utput*%wning)*peripheral,#son*#lan*(rocessed',
+    ',(gramming),recognisable+*servations,%ident*#oom+$uted)\'screens*"hy*)imulation*&torage-"ed*&ystems))telephone1!y+$sted',
+    ',\'outside,*peripheral*\'raining*#ype)%usage)-visualisation)$wise)&zombie(&.total(,/information)&manual)6node/telecommunication))processor)$slip(4anwendungs-beratungs',
+    '($card))ontrolled(#dom("ed*"ge()generated(#ing)\'sed-map+!s($less($mail($niks(&phobes(,s-in-the-cab)!.',
+    ')&ysteme.)vertriebs\'#tor&+illiterates\'*ng-network*(services)(/control*$i.t.+!t*%other*"pc*%study&+or-assisted&#rac&"um',
+    '#"r.$+ade-colonel(,in&rehy;arms*$arms\'&liness\'"s.%#ind$!s#!s$"ec$"it$#tat%)ock-smith#$te.l%(/defence',
+    '&#hsa%\'mplated*#ive\'%tuous%!s$#ian%$nued%"st$#ois\'!e$#rol$%urist#%unero%"ic\'+a&ccedil;ao',
+    '($coes&#one&&tarias*!o#%verse"-n&rehy;ceived+(ntrating+"rn+\'ssional)(fidences+%rming*$ront*$used)$nors)$quer',
+    '*&onance*\'trained/#ing)\'taining*(emplated+&stants-"ed*\'ingents*&racted+%iving)+versational2!s-#ion*&incing##\'s.',
+    '*!s$%ceded$)dis-corde%&ucting$%flict%\'ounders%&ronted%%using$#lib$*on-the-run%(rdinates$$sent&\'quences%$tant&$rict',
+    '%#ent#".e#"29#!=#&achair%"re%#uid$!e$!f$$ghty$"in&!g%!r$"nt$"ry',
+    '##bac$$ined$#loc$%rough$)servators#\'cairned%#non%,ss&eacute;es\'!e%&tamers%$uous%&vities$,ealing-sheet%&cutive%%dique',
+    '\'"es\'#ing%\'lebrant%#ntr()&eacute;s(&a-ting)+ci&oacute;n)!t*!d*\'ed-beam*#in\',)g-so-hard-\'_on_the+.on&mdash&mdash-!\'',
+    '.*dependence/%riven-$/new-$=0.4-"al-#may-"s.,"wn("ed)!s((ic-layer*!.($tion\'\'yraqted%+p&rehy;tion',
+    '&$t(s)\',-abstraction(%bound(+equivalence(\'forming(%image(%laden)\'earning(%words\')/keywords(#you\'*presumably\')s/keyword\'!u(!a',
+    ',"ts+"ty+%zable%*r&rehy;tos&%ences&%n/eoc\'#ant\'#ed\')$-but*#for*\'looking\')s&mdash;a&"t-(%drama((managers',
+    '(%party)\'latform\'#are("ta)!e)!o\',gebouw/decca.$flor.+harnoncourt.%jarvi\'$hall\'*ina-folded+%style)$ered\'2o-king/mackintosh/',
+    '(&.robin("s.%-ssion-holders+&making*!.*)/contract*"s.++_in_respect($vely%$vons$(h-shells%"es%"ie&$olin%)o-spirals',
+    '&$idal(!s%$ubar%!y$,i&egrave;rge%%dered&#ing%$ence&(rge-type\'"to&"ve\'#ing%.liaci&oacute;n($rism+"ts',
+    ',!s%#ola%#pio$-lu&rehy;sions&$dion&\'sion-on*+/evaluation*\'s&mdash+0/recommendations)$uns/\'"us$%octer%$ined%$lors%$mbre',
+    '\'%ttant,"ly&&mitant,!s%\'rdancer,!s*#ing\'"e\'(%-like)+replacement\'#ski&#ede&"no$2rete&rehy;embedded(*-and-steel',
+    '+#sed)(coloured)\'encased)%faced)$grey)%like.)%mixer)+operational)(panelled*%oetry)-reinforcement)%sided)&walled((/asphalt)%glass',
+    '(!s)$cape\'\'isation)!e*!d("ze)#ing$\'ubinist\'#tus%&lcavit%(piscendo)"it%&rrent\'*)/terminal*#ly.',
+    '%"ss\'#ing(#ons($vely#!d$#ado%$mine$$emna(#tio+"n.\'0ed&rehy;to-death("th%"ns\'!a(,tion-covered',
+    ',-/displacement,!s\'\'er-type)"s.\'$ible("te%&ration%)scendence$!i%#cio(#nem)"is%$date&$ered%&ntions',
+    '/,;consequence)#(s))#-cc*&effect)%.they),/consequence*&player)\'_rather)*al-roughly+!/+$ibus,$sing)0ed-unconditioned+%/heat)"is',
+    '3!d*#-of+#say+,unemployment*&/loads&$orio&"s.$-olence-letter&#ing%,m-dispensing\'$like\'$thin\'#use&$eria&&inium\'',
+    '%$ratt&!e%#tti(#ero$"ra%#ieu%"on$!u%*c&rehy;ted&+t&mdash;for\'&-based\'"er(1ur&bsol;conductor\'7ivity-temperature-depth\'(or\'s-eye',
+    '*(in-chief*#led*%posts*(trainees)!.))/composer*)orchestra)$ship%.ire/conducteur&$sait&\'t-point\')/overhead$\'ylactis\'!r&\'omatous',
+    '%,rehy;beakers$(-bearing%\'pointed$!.$&ctigon$\'d-shape$&flower%!o$%garry%%liano$\'lly/gym$$rney&#ing%!o%!t',
+    '#3f&eacute;r&eacute;e-$ence$!a%"bs&%ulate*#ors%"cs%\'lonieri$#ect\'"ed\';ioner/newsagent/tobacconist,!i-"es,(y-loving-!.',
+    '%.dera&ccedil;ao)$cion)$ting+%ons.9+"ve%!n&#iae%+r&ecirc;nce&%ation&(deration&!e\'!e(#nce\'-nce-attending+%based',
+    '+%going+\'holding+#led+&papers+*reconciled-%lated,$ooms+%style*(/courses+*exhibition*"es*\'manship*)s/courses,+exhibitions)"ia',
+    '&#ing&$tech%(sercenti&#s\'t\'%-only\'-e&lsqb;d&rsqb\'&ionale*!e\'#ore&!t%$teor&(ti-gunge)$like\'!y%!x',
+    '%$anza%&ded-to\')nce-boost,&uilder+(creating+)promoting+*rebuilding++undermining()t-looking)*/tentative)"al+"ly)"ia+%l.and,)ity-based',
+    '%+g&mdash;man06.lifespan.lslive.s1234&*uration(s)-"s.(*e-to-order)$ment%!m&%ation&"ed%!n&%\'d/my&&emnent\'"th%!r&%mands',
+    '\'#ers\'$that%\'scated.*!s)#ted$$labs&%tions%!i&#ct\'(+-adjustment)+of-interest)*prevention+\'oducing,"ne)\'related',
+    ')$torn(,/cooperation(#ion)"ve(-s-of-interest%-uence-english(#tly)!s$#ord&(malities(%tion.,$ally\'(ity-base\'!o&$tans',
+    '$$rere(!s%"on\'*t&rehy;ing(+a&rehy;tion)&ciones)*tion-point-%alism-#ist-"s.("er(!i$+ucian-style\'%onism("us',
+    '%"sa\'$bles&*ed-elderly\'#urs&(ion-that)$.the)#ism("un&#sed%%table#&g-held%#san$&a-line%(tulating$$dell',
+    '%#ith%&lation%\'miscens%#ner&"ic%#rie&#ton%%sting(*on-busting\'!s$"le&!s%%obata&&merata+$eers',
+    '+"ic,"ng,&sation$\'olensis$!r%(at-ulate\'$ions\'$ters\',u&rehy;lated((latingly,2ons/commiserations+#ors%)ega-tions(#tio+$nals',
+    '\'%s-led)%ruled+!n)#the(#110("ed(*photograph&&tation%$ieve%&uentia)"ly&%ously$#soc$%uered#$holt',
+    '$$bear(*/education$*cal-roofed\')ly-roofed&!n%#ide%!s$+fer-covered((forested(&shaped\'!a(!e\'&ophyta$#ger%"li',
+    '$&sation%%holme%-ton-ulverston$\'unction$#val$\'zaoides#"j.$\'ectandi%%stion$\'oncture%#urs$%uctiv)$itus%,gal/maternal(!e',
+    '\',tion-causing(#ors&!o%,nc&rehy;ture\'"te((ive-type+"ly("ly("s.(&urally&%gated%!r&#ers&)ing-trick%!x',
+    '\'\'caskets\'#red&#ing$!s##lay$#isk$,on/churchill\'$john&!s$$udes#)mfortably$+munications$)servative$%unity$!y',
+    '$)a&icirc;t%"gh%%is-tu\'$seur&!t\'"re%$llys%"nt%"rd&"ty%%tural%,ught-trained$!e%\'ct-time\'#400',
+    '(#ble\'#ed.)"ly\'%igons(,ng/secondary(-on-activation+$must+(oriented*$s-is(.vity-compliant,!.)"us\'%ology("r.)(/support',
+    '%#ely%&ll.the\'#ies\'&y/base)(hereford&$park%$rton%!x&$ion.)"s.\'$unei$$ifer%!n%$vin\'$&nected',
+    ')#ons$#ock%%iseur\'\'seurial($uers%$lley\'*y/comedian&!y%(n/relief%!p%.r-c&oacute;mez\'\'trained&%/head\'\'pearson&(s/former',
+    ')\'/thames%$tate)!d(%ional$&swater$%ubium%(rbations##oca$,dont-bearing(!a$&isseur$#ley%%ophus%!y$)medusites',
+    '$\'poderas$"rt&$oxin$"se$#way#&panies$%iracy#.qu&eacute;rant\'\'circ;te%!e&"r\'\'#our&$sts.%#ist(\'adorial',
+    '#\'rad&num&!h&$inum&!o&!s%*n-designed%!y$\'ibution%!e%!g$#odd%!l#-s&rehy;traint$!a%#gra',
+    '%(nguineus*&itatis%"rn%$tble$!c%)ience-mad+(prodding+\'seeking(&scious(.tious-objector-\'ly-held*"se,!d*"ze)#ous',
+    '\'#pus\'%us.of)%l1ess*%essly**y-realized)-ness-altering.(creating.)expanding.)generator."of.#say.#the-&.these-+/irrational.*relaxation',
+    '%#rip(%tion.$!e%$crat)#ed.*!s&%urive\'%tions)(ve-spill%%iller*!s\'3s-sondages-analyses%#jos%&lheiro%%nsous',
+    '(.s&rehy;seeking)\'-backed*#run&%tants\'%ement\'\'imiento($ngly\'%rated\'"s.&"us&$voye%/quences-seeking*#ies)%tiall-!s',
+    '%!r&$able&)servative&#ted\'!o&!v\')&eacute;e\'!.(,ism/reaction\'%acion(#ndo(&tation)#ing*+on-friendly-\'related',
+    ',!/-*efficiency.,nvironmental-*management,$ally*$sing+"m\'*5ve&mdash;transformist,\'-backed-(clerical.(ommunist.&reated-(inclined-#mod-\'radical',
+    '-(suit-mod/\'pported-&tinged-%waged."on,+/democratic,$3589,)ly-minded/\'striped,$ness,*s&mdash;to-+/hardliners)&or.but+!i,!e',
+    '+&y-like-%style-$type\'&eatory("d.((nfabriek(!r%&ssions$"hi%\'ohocken$!i%3d&eacute;r&eacute;e/(ablement0"nt&%\'ring',
+    '(!-)%these(!/(%5able(#_in(!a)(bly-from,!.,%_more)/tion&mdash;cash-!\'-%.what-\'s&ndash(%ed.in(#in\'',
+    '%"er%-gn&rehy;ments\'$atie*#ons\'\'ee-bank*(creditor(!r\'.or-beneficiary%#lia%#ros%!s&&stincy&%tance*!y)#tly',
+    '($ncy\'+//organizational)*talignment*"ia("th%#ted&\'ituency&%uency)"ts\'"te$(lequence%%usion$\'ociates%!l&)&rehy;ing',
+    '\'&mentum\'%tionf($oria($rice&\'e-table\'"rs\'+s-dessertes&"id%\'mmateur%-nant-cracking*%group*.vowel-constant)!/*%vowel)!e',
+    '%$rcio&+tia-devised*)organized(,um-developed$/picuousness_per&%raccy)(y-minded*!.*)/sabotage*&theory($tual\'%itors$(rtuction$\'sidered$"t.',
+    ')!-)0/gloucestershire*&warden-)wickshire)$ship&#ine&*n&tcedil;a\'#dse\'%inina\'+t-frequency)%level)%speed)%until)(velocity(#ijn',
+    '*#ope,&olitan*"us(+ly-changing+(dripping+(grinning+(replaced*!.+#but\'+za&mdash;oh0#she&$tive%$ella)#ted*$ion.',
+    '%-i&rehy;tuting&5pation-pain-retention,(/soiling,!s+"wn&!t\'%ently\'$uant(&cional(\'encies.+1y-by-constituency-%level*(t-member+)/consumer,0phrase-structure',
+    '($tary)$ency),ion-building,(al/legal.\'ization0!e1!d.*ly-elected2)ntrenched1*sanctioned.!s,#nel)$uted%(rainedly)"t-',
+    '(!r\'"st&!i\'\'ctively&.uc&rehy;tional("t.)\'ed-data,(sentence+$ness)#hor),ion-industry-(projects-&worker,-al/linguistic,!n',
+    '*%vely.)$okit)"s.*)/explains)$ural\'#ed.($ndum\'!x\'%zioni%!s&"nt%%ucted(#ing$+uetudinibus%"l-',
+    '\'%ribus\'"ts&"es&!i&&ktants&,t&rehy;ation\'-ancy-oriented)&t-free+(promoter+$type*\'.foxpro(!t)!e)1ion/collaboration-5exercises/exhibitions',
+    '-$team,%_with,"s.*0ve/participative-\'support)$tion\'#ed.\'#ive\'"um%$m\'st&0ables&mdash;such\'#ted&/ed-productivity\'\'r\'s-eye(!-',
+    ')%based)(citizens*(onscious)&driven*\'urables)&guides)(industry)%level*#oan)\'product)\'related+(sponsive3$ness)$side*$tyle',
+    '()/borrower)\'patient($ised*"rn*#tic(-s\'association)$-aid*-in-the-making)&/users*&voters&#ism&/mately-executed*!s)"um&"os',
+    '\'5tion&mdash;production+!-,$-has,*generating,,reproduction,&sector-&haring+!.+$/low+#ist$!v$*yderations#*t&ndash;in$!=$-act&rehy;sign',
+    '\'#(s)\')-a-family(\'breaker(&called(&lenses((mediated(&poison($rate,!s((scanning(&tracer(&welder\'./gesticulation((initials(#the',
+    '\'"ee)!s\'$less\'"s.(%:news\'#ual%$dino%(iminated&+nammunition\'%er(s))\'-raised*%truck)\'isation)"s\'*!.',
+    '\'&ing10%\'&s-file-*&lsqb;file3,nam.typ&rsqb6*2.typ&rsqb%#loc%.m&rehy;ination&(ina-xxxx))tion-free.%prone-!s%!n&#gos&!t\'!s',
+    '%!t&!i$"d.$"el%0m&rehy;poraneous&!-&#ner\'#or.&)placionis,"un*#yon)$ted.*#iva*"yf\'-or&aacute;neo',
+    '))ary-style)#ies*#zes\'(tibility*&leness+!y(%uated)\'ousness)!s%,n&rehy;tious&#ant&-derbookmakers&-t-addressable/#ing)\'nalysis',
+    '()dominated)%riven(&length(*orientated(#say)(earching*&quence(+versus-form($wise)#ord\'%/form(\'numbers((outcomes\'!e($-toi',
+    '\'&ieuses*!x(!n(#on.*"s.)1us-administrative\'$less(!y\'"us\'!z&!u&%zioso%%rfete&\'vailing%$ssas',
+    '&&t-type\'\'.anglia(#the\'+/mainstream($ramp\'%ative%%xt(s)\'!*\'!-((-notably(-complementary*%ncept+(ditional(\'derived*)scription',
+    '(,establishing(+identifying)(nvariant(%laden)#ess($name((produced(*relativity((table(s)*$rget\'".5\'%_even\')s-compare(!.\',ual/thematic',
+    ',!t-+/historical-!s+"ty%#yne\'#ing$"he$"i.%%cello%*g-building&%order&%uous.*$ness%%nebar\'/nt-by-continent',
+    '*\'derived*%sized+\'panning*)wandering)&/ocean)(al-crust,%scale-$even-%imple+!e++s-despising&!g\'$ence*+y/emergency)(t-claims',
+    '&!u\'%allye(#nts(#tio*#ves\'$e\'is(%-play(#ing(!n\'$ing.+!s,*gs-thomson*"ly*(violence(4ties/discontinuities',
+    '+*ndash;from**-composite+*extraction+(movement+*operations+&sprung+$wave,&elding*,ly-published-(variable,!.-(variable,)/fighting\'$ting\'#um.',
+    '\'$wing%!o%!s%%trade$#nts%$uing$"ol&#led%%meter%!n&!e%\'rionist&\'tionism,"ts%\'ur-band',
+    '((designed(&girdle($line\'(ed-glass&!x$-r&ocirc;leurs%)a-account\'%cases(\'eptives(\'yclical\')discourse\'%flows\')intuitive\'$laid\'*supporting',
+    '&(ceptions\'-t&mdash;alive0"nd0"re/\'between/"eg/"he/"in/\'leaving/&seller(!\'()-awarding)\'breaker)&fixing*%unded',
+    '))including)#law(*.exclusion)\'section(*/corporate)%wages(#_at)"in(&ing-in+,/franchising)-on&times;mean+.s/minute&times)"ve(#or\'*&-built',
+    '+(repairer-&tailer*%ising+&zation*$s_in+#hip(%raven(2s&mdash;exclusions0#for0#see)!*)\'/family)!o(#the((ualising',
+    '+/ly-incorporated)#ral*!e\'\'yclical&"da\'&icente)$t\'ry*"er*%ions.,"us*"or,#ies&\'flexion(#ows&"in',
+    '("ts\'"re&+lateral+aer-)-directed&*projection\'(untalism,"ly&)ri&eacute(#ans(%eties\'.y-insinuations&+st-exalting))reversing))stretched)\'trimmed',
+    '($able(#ed.(1ing/complementary("s.\'*uggestible&%tenor\'#ion\'!s\'\'tazione&\'versial+#ons%\'e-danse\'%filet\'$jour&(bandiers',
+    '&&poinct&)ras/hotel&\'versial%!i&!b\'!.\'%ition,!s\'+u&rehy;tory(!t)%aries+!y)$es_a)!i*!n',
+    '-\'related,"al)1ors/demonstrators&\'nuously&&teness\'%ional&"vd\'$edly(!r)!s%+ol&eacute;e(%mdash-\';little(-rehy;autonomy\'$+kqx',
+    '\')-and-pass(+demographic($gear($head(%panel)$osts)%ulses(\'showing)%ystem()turn-shot(\'voltage\'$.001(#ini\'\'/budget(*commercial',
+    ')\'ultural($data)&isplay()influence()patronage)#ull(*regulation(%taste)*ransmitter\'%:rats\'\'ability\'!e\'&lables(+ed&mdash;he*(-release',
+    ')\'r-based*\'/memory+)superdrug\'*s/feedback\'$wise&$nics&"ul&!v\'$ersa+#lly*#ery*&iality-+ly-received*#y.2,#pat',
+    ')%tible+"ng*!s)!y("sy%"ry%%ubute&"ct("ed&"ed%!y$$ucci%)maciously&&elious%#sed',
+    '#\'uersion$&lariid$-r&rehy;bation%"es#\'vaincus%!l&%laria$.e&rehy;niently%-ction-chamber**/microwave\',or-cum-night)#add\'!s%$ived%"na',
+    '\'#rum&+c&iacute;on&&ership&&ience\'))t-instead+%sized*)ly-shaped.$ited\'!o\'!t&(t\'-ional\'!.\'(/retreat\'!a\'"ed',
+    '*"ly(+on&mdash;as*!-+%based,\'reaking+(counting+\'mocking+&rooted*!.*$/and*(al+upper,(-looking-&weapon,(/nuclear-&street',
+    ',*ly-defined1\'sirable/*ornamented/%woven+"ry*#eer\'"um&!z%(rgencies*!y&%sance(1tion&rehy;stopper,&-based-\'initial-$like',
+    ',*/interview,!d,#ist/!s*"ve,!s(&zzione\'&e/with\'(ion-kits*%/call+%entry*#but*"s.\'!o\'$tion',
+    '%*x-downward&"us%*y&rehy;ing&\'/thames(\'ransfer&$able\'$nce/+)transfers)+ing&mdash;a,&-based&.ed/transferred&(or-belts&#the$"ic&#ned',
+    '\'4ion&ndash;government*)-inspired*!.*4/sentence/conviction\'*photograph%(eniently%"nc\'#ed/)"ly($ment\'+ing-looking%#val&,i&rehy;ality\'$ales))it&eacute',
+    '%#kes&#ing%$lute("us&(vulaceae).us&rehy;shaped%$rted%$yaid&"s.$(uclsions%$lses&%vulus#3way-jones/historian&\'/garcia$#ere',
+    '&!d$$gree$%ngham(!n$"za#,z&aacute;lez$!a$!e%!n""o\'#(-ca-choo+!\'%"oo\'$-coo\'"ed',
+    '($-cuh$"ee$#ing$$leee$\'roo-coo("uh##bie#*c-cooc-ooo#$dale$\'e-adams$!y##gee#)k\'n\'clean$#(e)$!-',
+    ')!s\'!y%\'general&&umperz%%house*&keeper0*-secretary%(in-sauce%$maid)!s%$offs%,proprietress%$shop&)upervisor%"up',
+    '%)commander)%unity%&deputy%\'esquire%&father%/gloucestershire%\'jehovah%&labour%&mother%(reformed%&shadow%&thames&&ourism$7book-come-autobiography&!y',
+    '%&d-meat\'#off\'(to-order\'"up&\'/heated%"r/&&y-book($lore(\'student\'*/chemistry%%stone$$horn$)ie-cutter\'&making&#mix',
+    '(#day(&energy($fire,!s(\'hearths(#oil(%range(&stores+"ve-!s()the-books)$imer(%world\'%/baby(&eating',
+    '%"sm$#out$#pot\'!s$%sdown%*ley/artist%#ons$$tail#(l-as-ice%(coloured%$eyed%$funk%&kitsch%#man(%nered',
+    '$(/carrott$&:model$\'ability%#ney$!e%\'lectric%+r-than-thou%!s$$font$*headedness$)ing-earth($flow(%water\'&towers%"sh',
+    '$$lest$\'max/15%%#ine$)nafrankey$#ock$#roe$"th$"um$!y##mbi%.s/conservative\'(geoffrey\'%pupil\'&victim$+es/diocesan',
+    '##nan%%warra$!g$#ley%!y$#oor$#ter#!o$,-cooo-kakoor$!o$#per#/p&eacute;rative$%ed-up%(r-climax\'&driver',
+    '&\'/acting(%uthor\'*biochemist\'#car\'&friend\'$hunt\'&labour\')neighbour(\'ovelist\'&racial\'*university\'#vet(%ictim\'&writer&$ages',
+    '-!.&"ed&$heat&#ite&-s&amp;lybrand\'8-deloitte-touche-spicers\'!.&%ville($sion$$land$%orate$$tion&"ve%!s#$rdin',
+    ')$ised)#or/,(national$!t##sje#)t-haunted%$like$$/and$\'chy-coo(+wootchy-coo$$like##ver&!.##xon"*p&aacute;n',
+    '$#car%"um$&hating$$outs$#ple$$show%$ided%$peak#*/policeman$%young#$able$"ck%%obana$"in&!s',
+    '$&rcener%(tnership$+s/riverside$%yment#"e.$*/teardrops$#ing$,ley/cherwell%"la&$otti%!y$%maman$,nhagen-based("ue$&rative',
+    ')"n\'%\'straten$!x#$ford#%grove#)henotrope$#ill#!i$$able$$cats$!e%+s&mdash;but&!.&*/originals$&holdes',
+    '$3ng/life/social/home%#say##lon#$mmon$\'pleting##nor$)servative#$olla%+ymerisation+#ing*&zation$&ratism)!t$"sa#,p&eacute;iia',
+    '$)enamensis&!s%\'r&mdash&$(ti)&(-arsenic()ssociated\'\'bearing)#ech)"lt\'&cabled)$pped()ontaining)$pper\'$dark\'%ended',
+    '\'$gilt(#old\'+impregnated\'%mauve($ines\'\'on-zinc\'&plated((olyimide+$mide)\'tassium((roducing\'$rich\'&silver(%miths($tick',
+    '("in*#ted($oned)!p\'$wire(#ork)#und&&fasten&$head&%mines&/plate-inscribed+!s&&smiths&&y-grey(&purple',
+    '$+ice-as-fuel(\'workers&2ing-with-standards&!k%"n\'&%g/raf%"st\'!s$\'lehouse$#uck$!y%"es%!s#(raphagia$+ecipitation',
+    '%%pared%!s$$ight%"me$(ocentric&!k%%ducer(#ing%$mote%%nymus%%phile)"ic%#sma%&xamols&$imol',
+    '#\'se-bank$#hop$!i$#ley$!u#%thill$"os#&ublish)"ed$$lsky$&rified\'$ying$!s%(/swindon&)wiltshire',
+    '$*-and-paste)&verify%$back&$ooks%(cat-raid($ting%\'editing)"or+!s%#ink%\'numbers%)of-a-copy%+preparation\'%otect%\'reading',
+    '\'"pe&$ypes(#ist$\'/module$#boy$\'catting$$desk$!e$$flow$%guard$$iipc%:ng/imaging/printing/faxing%"sm%!t$%lines',
+    '$-right-related)!.)$able)+ed&mdash;or&"te$$slay$&takers$*writer-art"%quart$!e%#lin%$mpot%!t&$dale&"el',
+    '$!i%%llage%!n")r-anglais$&blimey$$data##.v.#\'aciidae%*le-builder$$ggio$!h$*l-coloured&\'fretted(%inged&)ladbrokes',
+    '%"ie&"ta%#led&*imorpharia,"ia\'"te$\'nguinum$"ry$!s$!x%!i$*z&oacute;n#$bala%!r&!a',
+    '\'#ler\')transport%#lla%#nic&+y-sur-aisne%!r%+tt/prisoner%!y$,i&egrave;res%$eres%"jn%"na$"on$$rige\'"gs',
+    '$&hester$"ia$.uero(interior)$&yreans\'$nsis#,d&oacute;vez%)rehy;pull$)-breeches%$made$\'/string$%aites%!l&!e%%teria$"ee',
+    '%#iro%$lias%$mais%\'r-birch%!t%%vants$%ialls%&folius%"n\'&"er&"gs%!s%*te-reeking%"um&!s',
+    '$)ocentesis%)n-barrier\'$duty&(/liberal&$azos&&ed-off&\'ing-off%$rniu&"ys$%s-plc$)uroy-clad).jacket-wearing("ed$&waggle&!n',
+    '$%yceps%-linefruticosa)!s#\'e&mdash%.rehy;periphery$!\'$&-areas%%based&#ell&#yte%@constituting/context-independent%\'element%%field&%ormed%.plus-extension',
+    '&#ype%&vessel$./kevlar/carbon$"an$\'ceptors$%gency$)ldraw.exe)!s%!l&!e&"i.\'1/tartini/kreisler$"of$#per$\'s.first',
+    '%\'pondent((sibility%%tones$%thron%"ta$$ware$\'y-crump#+fe-studland$!f$!o$#ton#(gi-owner%!e#\'iaceous%.nder-flavoured',
+    '%$rick$%cidin$!e%*lopocarium&%tauvi$#llo$"mo$#nia&!i&%thian%#thi(+an-athenian)!s$!o%&lanian',
+    '$!s$$tani("an$%xidae$#zo.&!n&!s#+k-blackened&#orn&&undles%&effect%%faced%%lined%(screwing&$oled',
+    '%%tiled&$wist$%/eire$"75$#in\'&$dale$-s-around-hats%*crew/knife%#ter$$wing$\'y-style#!l$#ass%!y$!e',
+    '&"rs%!d%%onese)!i%#ss/((coaching((director(#nic#%macan&\'k/carer((daughter\'!s%\'inville%"ni$$dale',
+    '%!t$"ie%"st$$lets$#ode%!n&!t%#ran#\'n-bound&+unting-like%(chandler&&ircles&"ob(!s%%dryer',
+    '%&fields%$gold%$husk%*law-loving%&market+!s&&ission%\'samples&&ellers&&heaves("ep\'&ortage&$tack*!s(#lks',
+    '$&/maize$$abus%#ert$#bin%$leth%$rash&#ide$\'cockles%-rake-friendly$$dell$$eanu&!u%#ill%(lian-red\'%sssen',
+    ')#oon\'%ussen&+l/pensioner\'!e&#oup&#sen&!y\'!s%(oscleral%\'r-based\'$cube)%tting\'(markings\'$post\'(segments',
+    '\')to-corner\'$wise&(/chimney\'%north&$boys&"er&!l&#men&%piece\'#ost&$seat&%towre&$wise%#tcy&!h',
+    '&"te\'#ist*!s\'&o-type(!s\'!s%"um$*flake-mass)$s-ad*!.%)ord/oxfam$%hill\'()-on-tweed$!i%!a',
+    '%"ea&!s%$fied%#ger(!a%#ng\'%\'sh-born\'$ness$\'market=%\'entarii%&illing$#ner$&opolis%%rered&!s',
+    '$(parative$$silk%$talk\'#rch&#ock$"ua%#bia\'$ense%*copia-like*$nism)#ous%$lier%$smas%"ta$"wa',
+    '*#orn)\'rhenish(&/rspca%&ellian$$yshe#!o$!b$%craft$#fin$#mba$#na.&#bit&"ch&$rium)!s',
+    '&"ti&%virus%"ea&%rship&#ted%#ory$%sinis$$voda$#zal#"p\'$!*$0-hewlett-packard%(insignia\'#tel%%meiko',
+    '&#oss%(specific$$.the$)/motorola-*-developed&%s-dos$"ak$"n.$"o-%"al%,r&rehy;ation&+a&rehy;tion\'*l-armourer("ly\',te&rehy;wide',
+    '+(orrowing*\'centred*5disguised-as-consumer*\'induced*%owned*(planning*&sector*)trousered)!/*,consultative)!d(*ion-caused,%speak,#tax+&/b.e.t',
+    '+"al+$s.in)"se*+t/pluralist)$vist)#zed&"ic\'"st%!s%\'turismo%%zulia$#ral$+s-de-ballet&%sized%)e-baggers',
+    '\'%flies\'\'holding\'\'reeking\'&strewn\'$veil&(/cadaver&*bumlickery&$like%#man$&ulency%,s&rehy;based&!.&\'/antrum&(_delicti\'%juris',
+    ')"es)"or&"ty#)r&ecirc;a$!a%&dillar\'"no%#les%#tts$0e&rehy;spondence%"an%!c&"t\'\'$-and(1score:other-score',
+    '\'!.\'*/incorrect(.tied/incorrect\'*:incorrect\'%_with\'(aircraft\'#ed.("ur\'+ion-praise\'*&=13.65*"el($vely\'-ly&mdash;this*(rehy;saw)*-completed',
+    '+&eeting**positioned\'"on\'#was%%gated&$edor%\'latable(&edwith)"s.($ive\'(#ory%"ns%(spdonent\'\'on-dent)7dence&rehy;computations',
+    '1$urse/&school-"ia."es,&t/live.(newsroom-&loaded+!r+!s%!t&"te%#xit$!i%"ad%*chatachin\'',
+    '\'"r.(\'/coffee(#s-a%)e/wembley&&arrack&\'choille&&hallie&"lo&$ntes&&vrikin%#gal\')n-maguire(,/strathclyde(!s&$ible',
+    '%$hons$!o%$bery&(orations(#ees%%dable&#ian)!s%"ie%,sion-control*)inhibitor**resistance\'$vely(#ity("us',
+    '$!s$2ugated-iron-roofed(#ing%+pt-smelling\'"er)!s\'"io))n-tainted+(wielding("ve\'&ly-led%\'scating*"on$1y/gloucestershire%(charmaig',
+    '#!s$%alius%$tion$#bie$"ed%%lette&#lis%!r%"t.$-ham/wiltshire$#let$#ock$+s-examining$(trophine#+t&eacute;ge',
+    '$!a%"do%%illod%!l%#zar$&e-real%!l%"si%"x\'&"es%$zone$$horn$+ical-evoked&(oadrenal\'(steriods',
+    '+0oids/antibiotics)%roids\'&tropin%#lle(!s%!n%+socsteroids\')ne-lipped)!s%"vo$\'leferry$.on-charlemagne28&mdash;chambolle-musigny$!y$#zee',
+    '$&scated(%ingly)#ons#+v&eacute;es$+al&aacute;n%$tsch$!e%!e%!n%!y$&id-the&"ae#0wen-denbigh-rhyl#%ydons$\'lifolia',
+    '$!n%#don%*ocarpaceae*"us$#pha$,stospermales$#zal"(s&iacute#(\'&egrave#+_as_soon_as#"as$#tto#+by-admiring##com$\'ulluela',
+    '#)egregated*#ion$#ley$#ner$\'quently$!t#&h-boys%(carrying%%style%&tailed$\'/milton$#ing$$quin#*ignatories$$mini',
+    '%)usoidally$"pa#%kunsu#!l$*a/scottish%"ny#"ma%"ti&"os$!e%#lli%\'tic-bag),reasons-only)\'testing(/ally-engineered',
+    '&\'ologist-!s$&ic-ice&%ally\'*)-inclined&!s%!g$*o-cocktail%)chelonian(&mistry%%genic&#irl&&onical&%raphe%!l',
+    '%&plitan&$olis)\'tan-mgm*"es%$rama%*s-spanning&#air$"us#"ne#&olvent$&urcing#*pecificity$#oir#&sachok&+k-flavoured',
+    '((infested(%style%"ks%"ns%(rt-miles\'!s$!e%"ns%%tedly$"ie%!n$$tick((/robbery#/t&mdash;benefit++effectively',
+    '4$ness%/rehy;accounting+\'djustor*(covering**efficiency$"-a%$base&(ehaviour\'(neficial+-t-calculating&#ook%$caps&&entred&.ompetitiveness\'(ntaining',
+    ')\'rolling&&urbing\'!t(#ing($ters%+depreciated&.ifferentiation&%riven%*effective.&)scalation%%focus%+impractical&%n-use\'$come\'\'flation',
+    ')\'uencing%\'justify%(obsessed&)f-capital(%funds&(ptimises&\'riented%.per-inhabitant)(megabyte*#ile)(response%\'quality%(rational&)eductions%(schedule',
+    '&%ystem%)to-income&\'rimming%+uneffective&&tility$+/estimating%$full%&income%(marginal%.responsibility%(standard$(:benefit$\'a-bound&&gavras\'%litzy',
+    '%%badic%#das%"ge&$uana%"ki%)llisation%$nera&$tini)!o&"za%"ta$"b1$$code%&utters$"el',
+    '\'&o-king%%ntins*$tune%%rtium%!s&#sey\'!y$,i&egrave;res%.ng-calculating%!s$#ley$\'nerwood$(o-radial%*chondritis%!f',
+    '%!w$(recovery%&uzioni$"s.&!i%,/expenditure&\'margins&7objectives/achievements&&prices%(provides$\'umbrism&%e-but($wise%"re#&ultant',
+    '#%warth$1orth&rehy;powered(*-developed)\'powered#-y-comfortable%\'looking$#cot$!n%#age"*t&aacute;n$&eacute#"-1$%sided&"ze$$type',
+    '#!a$$bato$"ct$"ri#$cher#%death#(e-hardie%%rotie$$hele$\'mporary$$nine%%ville$&rminus$&sworth##ham',
+    '$*urnocystis$#was#\'ingidae#&manhay##ner#)oneasters#*ranfection&)sfections\'&mitted$+etsecretary#.s-cum-playpens$%field$#ide$$wall%(old-type',
+    ')!.*"it&#rth#)tage-born((cruising(\'dweller(*industrial(+proportions()residence($size\'*/dyehouses(&willow$)bus-based$+ee-inspired&&/harry',
+    '%$rall&"el()l/country*&former*$show&"il&!s%!s&%brook&#low&\'woldiae%!x$$hard$$idae%&ngwith',
+    '$0on-and-polyester\'&broker("ud\'$clad(&overed(#rop\'\'growers\'&jersey\'$lace($ined\'*mill-owner+!s\'\'pickin\'((olyester()rocessing',
+    '\'%shift(\'pinners\'$thin($will\'%waste(&eaving(*ool-tipped+#led)#und&$/25%\'#43%\'(elastane\'%linen\'%nylon\'$poly',
+    '&&opolis&\'pickin\'&%reels&$seed&%woods$,rell/swindon%%inger$!s$"us#!w$#old\'!s$$sold#%yloid&%saurs',
+    '"*u&bsol;nty$&eacute#*ble-figure$"re#+ch&eacute;e%&-based%#age%*ette-style%%ianus%*man/waiter%"ot#/denhove-kalergi%!s#$eite$#pia',
+    '#$gers$,h-splintered\'$weet&"up%\'crackle%#ed.&"rs%#in\'\'"gs%%trecy#"he#"id$"za&*-montazels#/la-nut-cracking',
+    '$"d\'&"st%#-er&*have-beens&"if&\'perhaps&&ridden&$sell%#.be%!e&"nt&"ry%&follow%0n\'t-give-a-stuff)*have-beens',
+    '($/did&!i%\'rey/the%#s\'t$!e%!e$%inats&!g&!s%$sses$#man$*ombe-saint&%etric&$mier$"pe',
+    '%$tock$$teri%+hard/father*&jaguar*&mother&%waite%#rop#+m&eacute;ly$%forte#,n&rehy;tries$"ce&$lled%!i&4l&mdash;auksiausiogi(*rehy;house',
+    '(&backed*%shing((congress(\'donated(%entry($home*%using($land(\'managed($npkc(\'ordered((property(%scene)$peak($that',
+    '\'#.no($once(\'project($this)"lr(%until\'!/(&boards(\'channel("ed)$ssex(%faces)"or)(ulbright($inns',
+    '(\'private))ublishers(*university\'&lor/to*%sfore\'#men\'(northern)!t\'#ors\'\'persons\'%s-the(!.($peak((upported\'%woman',
+    '$$ntry$"or$"ry&$side$\'seiller+!s&$ling\')l/friends("er)"th((ing-room+!/,.rehabilitation(%or/mk+\'patient',
+    '+\'/social\'"or$,t&mdash;back%%-duke&#off&$rate&.your-blessings%$.doc%#=23%#_up%"ax%#ed.&2r&rehy;accusations.(ssertion-\'balance',
+    '-.demonstrations-)espionage.&xample4!s-\'natural-\'opinion-$part-%spies\'(-account+\'usation*#ted))daptation*\'dresses*%vance)%gents',
+    ')%mbush),ssassination+#ert.#ion+(umptions)&ttempt+(itudinal+\'ributes((balances.#ing*(rgaining*%ttery)$last*#ows)$ored',
+    ')&hanges*#eck+#ers)*olonialist.&sation*\'mmunism*+nsideration,(tructive*3unter-establishment))riticisms)+ulturalists))yclically(%deals*\'cisions+(laration',
+    '*(mocratic,\'nstrate*%vices)\'irected.$ions)$raft(\'economy)(ducation)(ffective)&mbassy))quatorial),stablishment)(xpertise($gift,!s',
+    '))uarantees($hand)*egemonical/!y))istorical.!y(*ideologies))nsistence+%tance+\'urgents**tellectual*\'vention)#ons)\'rritant.$ting',
+    '(&jumper($like(%magic+#net*%rking)$ines+#ing)+obilisation*%ckery*\'dernism()objection))ffensives)\'pposing)%rders*+ganisations',
+    '*&rallel+!t,#ies)$lans*&otting)&olemic*\'sitions*#wer)+reparations+&ssures**oductively+&gramme+(position+\'tection2#ism',
+    '0!d(%queue($raid,!s)&easons*\'bellion*,connaissance*\'formers*$mark*#ply*)stitution*(versible+*olutionhad)&ioters((security',
+    ')#ign,#ing,!s)$mear-!s)%niper)%ounds+$rces)%phere)$tain+$nces+$ring*)ereotypes*\'ratagem+#eam',
+    '+%iking*#yle)&ubject+\'mission*"ed+!s*,ggestibility0"on*#ing*"nk)&ystems(\'tactics*$unts))endencies)$heme',
+    ')#ops)(radition(&vision(\'warning/!s)\'eighted.#ing)#ide\'(/decoder\'\'actants*$ions+"ve(+ffirmations(\'rgument/!s',
+    '(\'lasting(#ore+!d\'%canon)"se(&hanged*$rged)$ecks(#oup+!s()yclically\'-demonstration4!s\'(factives+&uality',
+    '(#low\'+inductivism)(vestment("on*!s\'%laste\'%magic)!n*"ds*&oeuvre)#rch(\'elodies(#ine(%otion)#ves',
+    '\'#par*+t&mdash;see+#s.3($roof*(pagating+%osals($unch\'(religion\'%scarp($ense)!t($hock(&igning)%nking(\'taining',
+    ',#ing)$rike*$okes*&ucture\'-tenor-timothy)\'rrorism(#ops((ransport0!s\'%urban\'$vale(#iew\'!y\'$zest&\'sswells',
+    '\'\'s-based(!.(!/&"n\'\'&g-down)%games)&houses)$room(*/computing(!2&#res%&lessly%\'ray-men&*ey-painter(!s',
+    '0"in1#raq0#was*\'rehy;at)#--a+$have*&brazil*&during*$have*%nepal)&.brian*"in)$sent&\'y&mdash(.rehy;gentleman',
+    '\'*\'n\'western\'%(ies)\'&-blues(*churchyard)&ottage)(rossover)"ut(%faced)(lavoured)$resh($girl(&hauled("in($like()offensive',
+    ')%eople)(leasures($side*%nging*#zed)$port)(quiredom)(weetened($tory),unisia-which(&voiced(\'walking)#ear)#ise\'!.',
+    '(%today(!v\'!/(-neighbourhood(&repeat)#ock,&/blues()sovereign()territory\'#bar\'!d\'!e\'%fying\'$goer\'%house',
+    '\'$ment\'%scape()ide-often+#.60,\'llewela+"rs\'%wheat%\'s.relax&#/10%"ty%"y-\'&border\'(endorsed\'%house\'%model',
+    '(#ize&#bus&$side#+p&mdash;see$/-de-gr&acirc;ce%\'mongers%&ridden$(_d\'etat.&&e_main$"ar&,&ndash;angus$&e-code$#ing$#l\'a%(e-headed',
+    '&\'dcavity&&s-land\')/families&"t.$\'on-rate&!.&"ed#\'rage-he\'!.(!a\')ous.today*(lycaught*$ness\'!s&%ingly',
+    '%#kis%$nces&#tes$"be%#iss%"on%%usier$#cey\'&-meade%1heval/meribel/val%"on$%douan$!e%!t$+ier-service',
+    '\'(/express$$lach%%oisie$,mayeur-bound%!i$!n%-ot-equivalent$&oupita$"re$,se&mdash;she&!\'&%-book((y-course\'\'costing\'\'fishing',
+    ')%owing\'$knit\'#led(%inked\')organiser(%wning\'&record-*-equalling\'\'setting\'-to-population\'%units&*.constable&//accreditations\'%class\'+examination',
+    '\'&sailor\'$unit&"es&&finder&*s/external((projects(2seminars/workshops((training$0t&mdash;country\',(separate,%which&,rehy;martial%$-31c&&action\'$ires',
+    '\'\'pproved\')uthorised&\'battles\'\'uilding&%cases\'&entred\'%ircle\'(onnected)%vened&%going&\'hampton&\'imposed&&jester&$life&$made',
+    '(&rshall)(tialling-!s\')essengers&\'of-arms&\'packing&\'related\'#oll&(scholars\'#ide\')ubstitute&$work&$yard\'"ou%0/buckinghamshire',
+    '%#ade&"ld(!s&#nay&)ulds-made+%owned+)sponsored%(decision%(elle/10%&+nay-biggins*\'latimer\'!y&#ron&#sy/%!h',
+    '&%house%*ier-backed)$like&$llot&!n\'&g-free&#ols&$vron%*martialled&"en%#nay&(ey/aston)+oxfordshire%"of&$isie',
+    '%\'s&mdash,$;all&(-general\')sustained&".l\'#the&"ey%$town%&yarded)"s-#&s-cous$%field$)in-german\'(marriage\',once-removed',
+    '&!e&$hood&*s-germain\'\'!.\',/oxfordshire\'#hip$$macv$*teau-style(!s%&illier#!t$#ant$$elan%&rparts%$uses',
+    '$$ries$&soudis$!t%\'s-smith$%umier#&vercle&!t\'#ure$.rat-desvergnes%;ir-d&eacute;couvrir-travaux##yld#$zins"&v&lsqb(";b#&/leeds',
+    '%!l$)riability\'%tions%!y#+e&ntilde;as$&-water$\'/mother$$hill&#the$1nant&mdash;length/\'usually(\'-pledge(#ees("s.%$ents',
+    '%(t-garden&)ionalised,"ty&!r\'"ee\'&y-born+#und*$uilt)&climax((/warwick(!0$(r-charge\'\'ropping&&design&%girls',
+    '&\'mounted&%names&&papers\'$hoto\'$rice&#set\'$lips\'$tick(#ory&(tackling\'$itle&#up\'&\'version&"we%%/logo',
+    '%\'age.the%%clash%*ed&rehy;up\'#-in%%gence&$lass%#ham%\'ing/the%$less\'"ts&"id%\'mounted%%plate&$oint%"s.',
+    '/!s&%ation+$ally+!s&#eck&%ville%$tape)!s%"up%\'version$&tables$\'y-crump%&ancing%!s#"in',
+    '#$noys#"ox$!y#$ring"*w&rehy;ley#$\'rin#&-bells%#oys%%reath&#own$(catchers%&ountry%&rossed$$flop%#ree',
+    '%#ide%%ocked$$kick$$lick$#man%#uck$&noises$(pastures$$shit$\'trodden&#uck$\'worship#!.#%/bull$\'heifers',
+    '&&london$!p$(rd-style&%/lean&#ian&*ly-looking%!k##bar$$erry$#ird$"oi%(y-booted+!s\'$type$#yre',
+    '#,den/director$"in$$reys%"ia##e11$#lls$$rdly%$ings#$fish$#ord#+gill/author#%hands$&erding$$ides$$ouse',
+    '$!n$%rkers#(l-necked%&shaped$#and$"er&!s%*y-designed\'$made&&/fraud\'+oxfordshire\',warwickshire$$iffe%4ng/propeller/spinner##nie',
+    '#&ocracy#!p$$eace%(r-temple&!s$#its$$okes$!s#\'rielike#)s/hectare$%field$$hill&!t$#ill$"on',
+    '",x\'n/mechanic#(/biomass$&farmer$/gloucestershire$#ldr$%pupil$$ross$&sports$#the$&victim$%white$#zoo#"ae$"ge#&combed',
+    '#$hall#"ii#(osternum#&sachie"(y-virgin##gen#&haique##le/&\'banbury\'\'icester(!x&+cirencester&\'english&*huntingdon&&latton',
+    '&\'swindon&&witney\'%otton$(umbridge#"me##ney#*pu-control#!s##tes"$zart#!e$#ned%#ing%(s-walker&!.',
+    '#$ying#"za$#ens!,p&ndash;1961)#620+!1"%-1655#&cotton##env"%.301a"$/mas".071.210.91,927""10#*6&ndash;18"!2',
+    '#!4$%-cp31#!5#&6-cp29"!3#!0#!1"!4#(02.201.1"!7",b-controlled"&c-6128$)sponsored#!r#!s',
+    '#!h#!n""hl"(i(m)-led#&-m-led%&arxist#!o"%l/irs"&m-mean#)/&micro;p$"93$"ng$$tube#!s"$ones',
+    '""pd"!q"&rw/scw")s/service#!g#!l#"u\'""ti"-u-independent!"qa"$c103"!d!*r&acirc;ne#&eacute)$;che',
+    '-+en-ponthieu*"pe+\'inettes+!y*#tin$.circ;cy-calais)&piness,!g)#tes*!s$)grave;hes*,me-de-menthe,#rie,!s*"pe',
+    '#+iacute;tico#+oacute;nica#&uuml;e""-3$!9"!.#)app.r.149)"59"(/3491/g1#!c"!2#!1"!3#"93",4&ndash;45nm',
+    '"&:licaf%#saf"&a\'ster#%aaark%"rk#(b-apples%$cake&&rawled%%eater%%faced%\'hunting%(infested%$lice&$ouse%#men',
+    '&#ise%#yaw$#bes%#ies&"ly&$ness$!e%$ater$$lets$%ocide$&stones$.tree/worcester#)c/hobsons$&herode$#ies',
+    '&-rehy;addicted%#\'d\'%#-at&$boom&\'cocaine&$free\',zzz-tchktchk*!z&$head*!s&\'of-dawn&(peddling&)resistant&\'selling\'&topper',
+    '&$thud&#war%$able&%mondo%%brain*"ed%/ed&rehy;leather\'(-asunder(%brain&\'nthorpe)%waite&%r-ass($wise%$head%"in',
+    '("ly%(le-glaze,#ing(%prone\'"ts&#ier\'$ngly&#ure%$nels%"ow%$smen$"oe%\'viensis$%ticus#/ddock/protestor',
+    '$*le-clothes\'%grave\'(snatcher(#ong(%witch#.ft-affiliation&$kind&%level&+maintenance(%sters&\'related&*technician\'&rading&&worker%!.',
+    '&\'railway&+supervisory%#ers%*ily-titled%#men%$room%*s&rehy;men&!*&$-and\'&exters\'#men\'&people&$hops&,man-composer*&farmer',
+    ')+ship.dieter\'0en-entrepreneurs*%level)!.)$ship&$pace\')ersonship&&worker%$wise&%orker("ld#&g-fast%$like%\'u-likes$$dale',
+    '&!r%#ily&"ng&!t%"sy%\'y-faced$$head%#ill$%notti$$s/of%"on#"hn#"ib$!c$"es',
+    '(&forwyn(#nos\'#don%+/contestant%"an\'"ee%\'barnett%#eam\'"rm&(ndarrock\'!s\'%tinny%&gowrie%$hton%#lea',
+    '%&nethan%\'royston%$y\'s.$*k/frilford%!s$$ling$!t#%kapax$"ow#"ll#&m-full$"ar$$beck%!o&"ok',
+    '$#ley$!m%%ed-in$$oisy$\'p-holes&%tight%\'_rather%!a%!e&(d-looked%$ions%$oned%#sie&!y%!y',
+    '$%beads%+orne/mother$$cour$*e-boulders&$hire&$like\'#oad&$neck*"ed&&tracks%,/contractors&$west%#fly%\'s.queen$&fields',
+    '%#dge%(o-facial&&caudal&&metric*!y&*rachisisis$(k-handle&(starting%"er%#ier&"ly%#ley%$pins$$nagh&"ig',
+    '%&tackie&$ouns##on.#&p-heap$!.$#aud$$head$!o%#ids%"la%#ski$$pant%+ed-in-pants&"es&!n',
+    '$(shooting$#ula&\'ousness#\'quelure##rae#\'sh-bang*2-wallop-bang-crash("sh&\'cutting&&diving&"in&%lands&#pad\'(rogramme&%sites',
+    '&*worthiness%$.the%&/stole%\'ability&!w%\'barrier%$down%"er\'#ama%%ingiy%$land)"ed$"ie$)sigyrinus&#oes',
+    '+!n&!s$#ter$$wall#&tchit.(!s&0ley/holidaymaker$(e-people%$agus%#ful%&r-free\'&strewn&"al\'$ster%%s-the',
+    '$#loe#%uford%#urd$#ste##van%+t-looseners$%e.but%)n-hearted&#ova%"rs$#in\'&#gs.%#oto%"tz#&wcrook',
+    '$0ford/advertising)&ingram)&oxford)+strathclyde(&fsburn$$hall%#ill$(l-spaces%$away%!e&\'r-crane-!s&"ys$!s%%hafts',
+    '##y-1%"2s%*equivalent%!l%#ymp%#zee$&encour%#res$&fishes$%lands$#mer$,ons/charcoal$#pas$!s#"za',
+    '$)ily-built%&nesses$\'y&mdash%!\'%\'-angled\'"ss&$golf&(pavement%#man"#c-5#!h$"es""da#!p#!s',
+    '$\'binding#%ag-et%#ach$&kiness\'#gly%"le%*s&mdash;it$+m-and-white&#bag\'#uff&$cake\'(rackered\'\'urdling&(enriched&#gel',
+    '&$pink\'#uff&)reduction&\'spotted\'%toned(&uccoed&0tea-on-the-patio&&walled\'$hite%$less%$puff%(y-bronze*"wn,!y(#uff',
+    '(#rey\'$pink(%urple\'#red\'(textured&&/mealy$!r%"ie$(se-proof\'$torn&%bound&$line&$mark$.te&lsqb;d&rsqb&\'-a-wood',
+    '\')directory\'$edit&"d\'\',/safeguarded&!r&"s.\'!t%#ifs&#ngl&1on-as-destruction(!/("of&.ve-affirmative)+destructive((/fantasy',
+    ')+re-creative\'$ists(#ty\'*)-oriented++stimulating*(/madness+)psychosis+,spirituality%+or/creation((producer((receiver%/ure-comfortable)%flesh*2rom-another-planet)&killer',
+    '(!.($s.it*$they#1b-binding-protein4!s$%/creb$"er#\'cerelle$*he-landing&(/meeting&!r%#ing$!i%(-trained$%on.aa',
+    '\'#pre\'#s01)!2)!3)!4)!5)!6)!7#"de%!m%.nhill/hereford3%shire&&tialed*\'ization%"re',
+    '$"fl$0ibility-boosting("ty\'$tity&0le/authoritative%\'deritis&"it%-etverzekering%#nta%+t&mdash;but\'/rehy;worthiness&!-\'*activeness(\'pproved\'\'broking',
+    '\'*card-style+!s(#ost(\'reating\'%debit\')financing\'#led($imit\'\'powered\'%rated*&ioning\'&scheme)%oring(&queeze(\'tanding',
+    '\'$wary&,/documentary\'%entry\'$hire&$:gpt&&=total&!a\'&nstalt-+-bankverein&$bank&$call&$ible\'"st&+or-supplier(+/plaintiffs',
+    '&%phone\'#lan&\'scoring&$this&$view&%watch$*o-planning$/ulity-straining)!.&%ously#%eager$(d.christ%"nz$"eh$"ft',
+    '%\'-warner%7sville-in-the-boondocks$#lie%!y$!m$!n%#agh$(p-haunts&$show%"/i%!e&!a&(rcovered\'"ed&"th',
+    '&(ng-jesus&!t%,y-crawliness$*se-parsons\'%smith$$veys#&gneish#!h$/an/restaurateur#$ider$"ge%!h$"th#"m.$%aster',
+    '&$oire\')rium-like(!y$$dean$-e-de-la-creme%#llo%"rs$$mins$!s#(nallated$#dal%"le%2on/buckinghamshire$&istria$#mer',
+    '$#son#)ole-based\'(language\'(speakers&(/english$*sote-based#!p$0e-de-walthamstow&$like&(marocain&%paper&$sole%%scule%!t$$idam',
+    '\'$ting)"on$$piny$"si$*uscularity$!y%*-en-valois#!r$#ard#!s$&cencio\'$does\'4t&ndash;silverknowes((/hammond(!a',
+    '$#ley$"sa&"ll%%brook%!e&!s&\'t-torch%%lough&!y%-well/mariners$)t-derived&&fallen&(to-crest%$fall%#ian',
+    '%#tor%%worth$\'yl-fast##tae%%genes%&n-born$,e-controlled%!n%!r$!i%%ngham&\'isation\'&zingly$%onnes$#ton',
+    '##uau$$set/$,tzfeld-jakob*!t$!x#*v&eacute;e$!a%%lcore%#sed$$elle%$ttes$%icing$!y#-w&rehy;necked$(-clipped',
+    '%$mate&%ember%&necked%$talk&(o-budget&\'raining$#.ed%%there$%dsons$)e-cardiff%//stoke-on-trent%)d&rehy;up%!s$$girl$!i',
+    '%#_as#$ykes""f."*i-de-coeur#$acao$"do$#erd$%gavon$"na#&b-bite$$bens&!r\'!s$*ricyathids$%sheet',
+    '%3ton-maitland/timber*%iller$%itize$\'k-crick&,harper-raper%+et&mdash;he\'&-based*!t+!s($care)$lubs)$razy(&ground($like)#oud',
+    '(\'related((watchers)&riting\'!.\'#er\'),-commentator)"s.\'%field\'$less&!y%!l&%egate\'%woods$\'ocosmia%"id',
+    '$$land$$more##ed.$#ing$"na$"r.%"ia$$s/as#$ffel#&ghtons#!i#+jevi&cacute#"ke#"le$!l',
+    '$$.lr.$$aldi$"bo$#e\'\'%&-books\'&usters&(coercive()ntrolling\'&utting&\'fatigue\'%ixing&#hit&(inducing(&fested&$plus',
+    ')"of&%rates\'(ecording&&scares(#ene\'&olving\'&tories&%weary\'&riting%!2%\'a-based%&buster%!d%\'fighter*#ing',
+    '&&talker%\'watcher&&riters)#ing$%inal\'(&-court)+enforcement)&minded)-participation*(ollution(!.(#isa*$tics(.ly-enforceable($oids',
+    '&!e\'!l(!s&!g&"la&"ol($ogy.&!y$(mitschau$\'onology$$page%(ed-edged&&rology%"le&#ing',
+    ')$lack((carpeted)&louded)%oated*&loured)(urtained($dyed(%eared)(namelled(&lipped(&nailed(\'painted)%urple\'%/wine#/nge&rehy;making',
+    '&#ing&"th&&worthy%%ingly$#ita&"us$!k%&le-cut(%faced&%iness$#nis$%olene&%ines.%!w$"um',
+    '#%ollos$#mes#"pp%#ens%\'le-ware\'$cock&#in\'%%s-day&).lansbury&0/gloucestershire\'\'swindon&#ian$$wise#\'s-cross$&antemi',
+    '%)s_because$#ham%#ill$5is&mdash;particularly\'+rehy;ridden&,-and-clarity\'%based((y-crisis\')callaghan\'+discussions(%riven\'(fancying\'\'manager\'*of-britain\'%point',
+    '*&voking\'*revolution\'\'sharing(&olving(%trewn\'%weary&*/emergency&"es$#man&!s$.p&rehy;cutting%%-bags&&cooked\'%uffed&%edged',
+    '%!e&"rs%$head%$iest&"n.\'"gs\'!s\'"us%*ly-dressed(%mixed(\'pressed*&oduced$,s&rehy;cross0#ing%$akes',
+    '$$taes&%lized\'"le(#ine&!o&%tella%"ea&!n&!s\'$cues%!i&)&aacute;n&"an("as("os',
+    '\'!i%#o-1\'!2&$fano\')ori-style+$type)!o%!y#$tcal%$hell%"is&#zed$!e%!r&!-',
+    '&*ial\'/\'less\'2on&rehy;referenced)&-basis)!s$!i%+&rehy;cisms%+c-as-reader\'(in-chief\'(learning\'(novelist&\'/reader&-al-dissuasive)$mass)\'success0\'-factor',
+    '(%ities(,ly-acclaimed+&defied+&lauded+&minded,%ocked+)supported+(thinking(1ness/acquiescence(!y&#cal&!i\'$se/i(&m-wise)#s.i',
+    '\'-zing/shouting&)o-storici&&s-made\'"im&"us%$eize%#ism%$qued%%scise&$icms\'"ng\'#zed&!m%)ze/praise$#que',
+    '$!s$#tal\'!l(!s%%enden%"le$!z#%ville#%zzled"!k"!m#!x"\'n-ccaod#!a#"ic',
+    '$"ta"(o&euml;s$%ucirc)$;tes+"on#)-operator#!a$!g%(hleighan$(k-a-cola(%roach%&a-cola%\'y-faced$&sdaile$*t-governed',
+    '&&manned&\'slovene%.ia&mdash;after\'\'-bosnia((slovenia\',n-controlled)$held)&manned)\'slovene%"s.&!1##cea&$nism%#lle$,het-bordered',
+    '($like\'!s$(k-filled%#att%&enhill&"rs\'&y-ware&!t\'\'t-style%\'hamhill%\'nafeola%!y$,odile-headed*(infested,\'habited',
+    '*\'toothed*$wise&&ylidae%$ldee%)smiiflora%$ytus#)da-funded##esi&"an%&newydd%!o%$uses\'#ian$$tzer#+ft/district',
+    '%"ed&)r-managed%$foot%$head%%s/car&#man%#way&$eave#$gary$#gan%(on/award((research%!y$#lin##ham',
+    '$$spol%$sier$+xde-guerres$#zat#-ker/organiser#"le#&magnon%!k&$alim%$lins%!r$(bleholme$"ed%!k$%lechs',
+    '%"ix$$mock$%ornes$)pton-batt$$sley$+well/cattle($ians#!n$%berry$)enbergian%#x-4%$yism$%icles%#sta$(j&eacute',
+    '$%khill$$more$%quist$,shaw/college$#ton#"ob$&k-back*"ed&*shouldered%\'/driver%+e/neighbour&#der\'$ness&#ing%$hall',
+    '%(s/mother\'%ralph&$barn\'#ury$$mpet$$ned.%#ies#(p-blonde%(chemical&&limate%*destroying&&usting%(failures\'%rming&#ull',
+    '&\'lanting%\'raiding&\'esidues%$sick&&prayer&&torage%#top%%yield*!s$!.$&/stock$#ful$$hail$)ping-rate(!s',
+    '$0redy/oxfordshire$"s.%"ey%#tar$!t$&uching$$wood#%quant%(e-madame(\'onsieur/!s&(monsieur&!s&$ting##res',
+    '#-sbiefisheries%#rig%&y-born\'\'on-eden&,/panelbeater\'&united$$cill$"en$%grave$#haw$*land-symms((/fabian/(#ite%"ey$#man',
+    '$/s&mdash;country&.ndash;boundary,%leeds-%ondon,$york&,rehy;courses,)ulturally-&rrents-%tting+$eyed+-fertilization+(gartered+$head+\'indexed-"gs',
+    '+(purposes+$unit%)-advising\'%gency\'(nalysing-!s($gled\'$real(!t\'(ssembler\'(uthority&$band*"ed($rred)!s',
+    '(%dding(#lts\'&illing\'#ody($ring("ws\'$reds)#eds*"ze(%idges\'&urning(6t-trying-to-be-helpful&+calculation((mbridge/0,peterborough',
+    '(%pital\'\'harging\'#ity\'*ombination)&e-shot)$pany+(tibility*%ilers*)lications*$ound(\'nnexion*\'otation)(tinental*(ribution("re',
+    '*%idors(%urses("ws\'(rediting\'\'um-shot(+rricularity&&dating\'&efault\'&iagram)&lectal(#tch((visional\'\'raughts(%essed,!s',
+    '&\'editing\')lasticity\'%thnic\'\'xaminer((perience,$ment&$feed(\'rtilise/!d/!s.#ing-$zing\'\'inanced(%tting\'$rame',
+    '\'\'unction&)gartering\'&eneric&)hatchings(%uling\'$eads\'&olding\'(ybridize&(immunity\'&n-hand(&dexing(\'fluence/!s(+stitutional)&urance',
+    '\'%sland&&labels($cing((mination($ying\'&eading)#ved($eds/\'&inkage(%sting(!t\'#oad(%oking&&market,#ing',
+    '-#hip($rsey\'(igration\'$odel($tion,!s\'*ultiplying\'7y-heart-and-hope-to-die&&nation&(oriented&\'pacific\'$eaks("gs(%nnine(*terborough',
+    ')&tforms)!y(#ots\'$olar+-isation/magic,&zation\'(ressures()oceedings)+ductisation\'&urpose-!d\'\'yrenean&%range("te\'\'eaction',
+    '+!s()ferential+#ral($late+#ing,#ons/#hip(,presentation((sistance\'%hymed\'%idges\'#ods(#ute+!s&#sbu',
+    '\'\'easonal)!t(\'ctarian*%ioned-#ing*%orial("ll*,ing&mdash;it-!.()nsitivity($xual\'$haft\'*ituational\'$kill+#ing',
+    '\'#pan)"r3(#oke("ur\'$taff+#ing(%erile(\'itching(%raits*"nd*!p\'(ubsidies-#sed-&zation&$task',
+    '(#rms)$rier\'\'hreaded\'#ics\'$rade)$iner($emor&(validity(%ulted\'%endor&%walks)!l\'$eave\'%inged(#red',
+    '&4your-legs-and-cringe%+.addictions-"ve&\'bedding&\'examine%-/corner/throw&%daily&%egged\'%uston&0northamptonshire&\'patient&\'station&+underground%$able&"ig',
+    '&#rms%$ball&#elt\'%ncher+!s&#one\'"w*&%ridge%(causeway&&ollyer\'#urt&&urrent\'%tting%\'draught%*ed-aphasia',
+    '(\'in-love(&swords("up(%wires\'!.&!n&"s.\'-/corners/free&"tt%$fell&+ield/refuse\'\'re.they)!s%(gatehall%\'harbour',
+    '&#ill)!s%#ier&#ng\'(%-over)&patrol*$lace.!s(!.%$kill%%lands&#eys&#ine($gual%,man/managing',
+    '(!s&"ix%"on%%plies\'"ys&$unch\'%rpose%(reaction+$vity&)oad-built%\'section%#tab(\'ulation&$ides&#ree',
+    '("ls&#ell&$ires&*ord-puzzle$!t%#ade&"in%,hwaite-eyres%$inos#\'talidae%%miton$+ch-obsessed\'\'related\'(sweating\')thrusting',
+    '\'$t=76$"ia$(onifolia&%ville$"ti#*uch-backed\'%touch&%eston&$ings%#ier$"ds$!n%"er$"pe$#sse',
+    '$!t$#zet#(w\'s-nest$$-bar&$lack%&flying%%harry&%eaded%\'shrikes&$ized&$tyle%#toe%%women$\'/ravens$+d&rehy;side',
+    '%)-avoiding&\'baiting&&drawer&%lined&*management&#out&(quelling&&raiser&%scene%#ale%#ed.&&n/pest%"ie&"n\'$\'e/bucks',
+    '$%ingly\'!s%"sh$.ley/thamesdown\'#ite\'!s%"in\'!k$(n-capped&\'debtors&(feathers&$heel&)of-thorns&&piping&%roast',
+    '&&shaped\'&ubject&%weave&*zellerbach%$/rac%#ed.&!s%%holds%$ings%$less$&scombe%#haw%#kin$"th&\'er-like',
+    '(!s&.orne/berkshire$$ying#%yance$)don-based)#orn\'\'/surrey##zat$!e%+s-hermitage"#p-3$)wild-type#!.#!1#!f',
+    '""re#$kkkk#$reak$!k%%kkkkk""sd#"hd$#ing""t.""ua#%beens#(cc-crucc$"em$"he$!i',
+    '&"ni%&ferous&!i\'%ction\'#ed. .density-graded',
 )
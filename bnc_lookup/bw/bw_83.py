@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_83 = (
+count_83 = 6694
+
+heads_83 = (
     'charrolais',
-    'charsh',
-    'charskys',
-    'chart-and-',
-    'chart-busting',
-    'chart-friendly',
-    'chart-makers',
-    'chart-orientated',
-    'chart-reading',
-    'chart-return',
-    'chartable',
-    'chartbeat',
-    'chartbound',
-    'chartbury',
-    'chartbustin\'',
-    'charted-out',
     'charter&mdash;for',
-    'charter&mdash;the',
-    'charter-analyses',
-    'charter-material',
-    'charter-party',
-    'chartered-in',
-    'chartered-out',
-    'chartered/qualified',
-    'charterhall',
-    'chartering-in',
-    'charterparties',
-    'charters/jr',
-    'charth',
-    'chartier-kastier',
-    'chartlets',
-    'charton',
     'chartpak',
-    'chartplot',
-    'chartrand',
-    'chartreuse-coloured',
-    'chartreux',
-    'charts-a',
-    'charts-land',
-    'charts/wall',
-    'chartsey',
-    'chartson',
-    'charturn',
-    'chartwizard',
-    'charve',
-    'charvel-style',
-    'charvel/jackson',
-    'charwallas',
     'charwoods',
-    'charz',
-    'chas\'n',
-    'chas\'n\'dave-style',
-    'chasa',
-    'chase-and-catch',
-    'chase-dunn',
-    'chase-like',
-    'chase-ups',
-    'chase/gloucestershire',
-    'chaseable',
-    'chasen',
-    'chaseplane',
-    'chasepool',
-    'chasethe',
-    'chasey',
     'chasgaig',
-    'chashma',
-    'chashni',
-    'chashnik',
-    'chasifness',
-    'chasllenged',
-    'chasma',
-    'chasmochord',
-    'chass&eacute;s',
-    'chassagne',
-    'chasse-map&eacute;es',
-    'chassemar&eacute;e',
-    'chasseours',
-    'chasserieau',
-    'chassidic',
-    'chassigny',
     'chassis-based',
-    'chassis.',
-    'chassis/frame',
-    'chaste/unchaste',
-    'chasted',
-    'chastelain',
-    'chasten',
-    'chasteness',
-    'chasteningly',
-    'chastest',
-    'chastiser',
-    'chastizement',
-    'chastizes',
-    'chasty',
-    'chastysing',
-    'chasyrion',
     'chat&acirc;igniers',
-    'chat&rehy;ting',
-    'chat-and-pat',
-    'chat-lines',
-    'chat-pieces',
-    'chat-to-stars',
-    'chat/chatte',
-    'chat/introduction',
-    'chatachuk',
-    'chataibh',
-    'chatani',
-    'chatanooga',
-    'chatearu',
-    'chateau-bottled',
-    'chateau-cambr&eacute;sis',
-    'chateau-cambr&egrave;sis',
     'chateau-grillet',
-    'chateaugay',
-    'chateauguay',
-    'chateauvallon',
-    'chatelain',
-    'chatelet',
-    'chatelherault',
-    'chatenay-malabry',
-    'chater\'s',
-    'chates',
-    'chatfest',
-    'chatford',
-    'chatha',
-    'chathrailriabhaigh',
-    'chatilier',
-    'chatillon-en-diois',
     'chating',
-    'chation',
-    'chatlereau',
-    'chatles',
-    'chatley',
-    'chatmeister',
-    'chato',
-    'chatou',
-    'chatoyant',
-    'chatri',
-    'chatricide',
-    'chatswold',
-    'chatswood',
-    'chatsworths',
-    'chattancourt',
-    'chatted-up',
     'chattel-slavery',
-    'chattells',
-    'chattels.5',
-    'chatter-box',
-    'chatter-head',
-    'chatter-up',
-    'chatterjis',
-    'chatterley-itis',
-    'chatterley-whitfield',
-    'chatterly',
-    'chatteron',
-    'chatterscreen&lsqb;s&rsqb',
-    'chatterton-newman',
-    'chattery',
-    'chattha',
-    'chatting-up',
     'chatting.',
-    'chattings',
-    'chattington',
-    'chattra',
-    'chattray',
-    'chattris',
-    'chattuarii',
-    'chaturda&sacute;i',
-    'chatwins',
-    'chatzigakis',
-    'chauce',
-    'chaucer/',
-    'chaucerians',
-    'chaude',
-    'chaudepisse',
-    'chaudhry/mother',
     'chaudhury',
-    'chaudonneret',
-    'chaudrey',
-    'chauds',
-    'chauffage',
-    'chauffer',
-    'chauffered',
-    'chaufferettes',
-    'chauffeur&rehy;driven',
-    'chauffeur-gardener',
-    'chauffeur-handyman',
-    'chauffeur-maintained',
-    'chauffeur-valet',
-    'chauffeurs/israeli',
-    'chauffuer',
-    'chauldron',
     'chauldrons',
-    'chaulmes',
-    'chaume',
-    'chaumontell',
-    'chauncel',
-    'chauncey',
-    'chaundy',
-    'chaung',
-    'chaunging',
-    'chaus&eacute;es',
-    'chausebickli',
-    'chaussees',
-    'chausskaya',
-    'chautier',
-    'chauvelin',
-    'chauvir&eacute',
     'chauvire',
-    'chavagnon',
-    'chaverim',
-    'chavigny-style',
-    'chavin',
-    'chavinism',
-    'chaviva',
-    'chavot',
-    'chaw',
-    'chawarta',
-    'chaweng',
-    'chawin',
-    'chawing',
-    'chawla',
-    'chawleigh',
-    'chawls',
     'chawnges',
-    'chaxhill',
-    'chayes',
-    'chayevsky',
-    'chayil',
-    'chaynay',
-    'chayter',
-    'chayzuz',
-    'chazel',
-    'chazov',
-    'chci3',
-    'chck',
-    'chcl',
-    'chct',
-    'chdn',
-    'che&lstrok;mno',
     'che-chirree',
-    'che-vee',
-    'cheak',
-    'cheale',
-    'chean-derag',
-    'cheana',
-    'cheap(er)',
-    'cheap-and-cheerful',
-    'cheap-and-cheerfulness',
-    'cheap-bistro',
-    'cheap-feeling',
-    'cheap-haul',
-    'cheap-jade',
-    'cheap-skate',
-    'cheap-thrill',
-    'cheap-thrills',
     'cheap-to-build',
-    'cheap-to-make',
-    'cheapernet',
-    'cheaperto-operate',
-    'cheapest-to-deliver',
-    'cheapish',
-    'cheaply-framed',
-    'cheaply-made',
-    'cheapo-hong',
-    'cheapos',
-    'cheapskating',
-    'chearavanont',
-    'chearell',
-    'chearfullie',
-    'chearing',
-    'cheat\'',
     'cheated_out',
-    'cheatering',
-    'cheating-ways',
-    'cheatingly',
-    'cheavely',
-    'cheboksary',
-    'chebut',
-    'checagou',
-    'chechen-ingushia',
-    'chechen-populated',
-    'chechenia',
-    'cheches',
-    'check&rehy;out',
-    'check-about',
-    'check-and-balance',
-    'check-bloomered',
     'check-it-out',
-    'check-mark',
-    'check-mate',
-    'check-over',
-    'check-playing',
-    'check-rail',
-    'check-replay',
-    'check-stay',
-    'check-summer',
-    'check-test',
-    'check-weigh',
-    'check:a',
-    'checkbook',
-    'checkcite',
-    'checked-in-luggage',
-    'checked-out',
     'checked.',
-    'checkedfisher',
-    'checkenden',
-    'checkenden/oxfordshire',
-    'checkendon',
-    'checker.',
-    'checketts/parish',
-    'checkhovian',
-    'checkings',
-    'checkit',
-    'checkland/harry',
-    'checkley/work',
-    'checkmark',
-    'checkmarks',
-    'checkmates',
-    'checknr',
     'checkpointed',
-    'checkposts',
-    'checks-ins',
-    'checksumming',
-    'checrouit',
-    'chedanne',
-    'cheddar-types',
-    'chedder',
-    'chedderton',
-    'cheddington/buckinghamshire',
-    'cheddleton-based',
-    'chedglow',
-    'chedi',
-    'chedlow',
-    'chedorlaomer',
-    'chedzoy',
     'chee-chee-chee-cheeeeee',
-    'chee-e-eat',
-    'chee-seong',
-    'cheech',
-    'cheeee',
-    'cheeeeeee',
-    'cheeeeeeee',
-    'cheek&rehy;bones',
-    'cheek-boned',
-    'cheek-busting',
-    'cheek-by',
-    'cheek-by-jowl-with-industry',
-    'cheek-hairs',
-    'cheek-length',
-    'cheek-roses',
-    'cheek-to-cheek',
     'cheek-to-jowl',
-    'cheek-touch',
-    'cheek/head',
-    'cheekboned',
-    'cheekbones.',
-    'cheeken',
-    'cheekie',
-    'cheekies',
-    'cheekless',
-    'cheeky-chappy',
-    'cheeky-chopped',
-    'cheeky-looking',
-    'cheeldrin',
-    'cheen',
-    'cheeow',
-    'cheer-lead',
     'cheer-oh',
-    'cheered_once',
-    'cheerfuly',
-    'cheerie-bye',
-    'cheering/in',
-    'cheerleader-slaying',
-    'cheerlessness',
-    'cheers-style',
-    'cheersome',
-    'cheery-bung',
-    'cheery-hearted',
-    'cheery-little-girl',
-    'cheery-looking',
-    'cheery-pip',
-    'cheeryble',
-    'cheesaholic',
     'cheesbrough',
-    'cheescake',
-    'cheese-and-tomato',
-    'cheese-and-wines',
-    'cheese-cake',
-    'cheese-cakes',
-    'cheese-cloth',
-    'cheese-containing',
-    'cheese-counter',
-    'cheese-cutter',
-    'cheese-filled',
-    'cheese-flavoured',
-    'cheese-grease',
-    'cheese-knife',
-    'cheese-knives',
-    'cheese-parer',
     'cheese-parings',
-    'cheese-plant',
-    'cheese-room',
-    'cheese.bank',
-    'cheese/',
-    'cheese/egg',
-    'cheeseblock',
-    'cheesegrater',
-    'cheeses.',
-    'cheesey',
-    'cheesies',
-    'cheesily',
-    'cheesman',
-    'cheeswring',
-    'cheet',
-    'cheeta',
     'cheetas',
-    'cheevers',
-    'cheez',
-    'cheezus',
-    'chef-d\'oeuvre',
-    'chef-d\'oeuvres',
-    'chef/hostess',
-    'chef/manager',
-    'chef/owner',
-    'chef/owners',
-    'chefas',
-    'chefesses',
-    'chefet',
-    'chefette',
-    'cheffie',
-    'cheffou',
     'cheget',
-    'chegutu',
-    'chegwidden',
-    'chegwins',
-    'chegwyn',
-    'chehab',
-    'chehem',
-    'cheicko',
-    'cheif',
-    'cheifest',
-    'cheik',
-    'cheilosia',
-    'cheine',
-    'cheiracanthus',
-    'cheirisophos',
-    'cheiron',
     'cheka.',
-    'chekwate',
-    'chel&aelig',
-    'chel-sea',
-    'chelae',
-    'chelators',
-    'chelenham',
-    'chelful',
-    'chelgate',
-    'chelgraph',
-    'cheliabinsk',
-    'chelicerae',
-    'chelicerata',
-    'chelidon',
-    'chelkan',
-    'chellew',
     'chelly',
-    'chelmarsh',
-    'chelms',
-    'chelms-ford',
-    'chelmsford-born',
-    'chelmsfordians',
-    'chelmsley',
-    'chelnock',
-    'chelom',
-    'chelomei',
-    'cheloviek',
-    'chelsea-bloomsbury',
-    'chelsea-bound',
-    'chelsea-like',
-    'chelsea-supporting',
-    'chelsea/west',
     'chelsea2',
-    'chelseafication',
-    'chelseano',
-    'chelseiano',
-    'chelsford',
-    'chelsmford',
-    'cheltam',
-    'cheltehnam',
-    'cheltenaham',
-    'cheltenh',
-    'cheltenham-based',
-    'cheltenham-gloucester',
-    'cheltenham-liverpool',
-    'cheltenhamphotograph',
-    'cheltenhams',
-    'cheltenmham',
     'cheltonian',
-    'chelune',
-    'chelworth',
-    'chelyabinsk-70',
-    'chelyuskin',
-    'chem-facts',
-    'chem-flex',
-    'chem-vite',
-    'chem-x',
-    'chem3d/plus',
-    'chemabs',
-    'chemcial',
-    'chemdraw',
-    'chemdraw/plus',
-    'chemetics',
-    'chemi-',
     'chemi-pure',
-    'chemiakin',
-    'chemical-based',
-    'chemical-biological',
-    'chemical-by-chemical',
-    'chemical-carriers',
-    'chemical-green',
-    'chemical-physical',
-    'chemical-radiative-dynamical',
-    'chemical-scented',
-    'chemical-splitting',
-    'chemical-taking',
-    'chemical-warfare',
-    'chemical-weapon',
-    'chemical/physical',
-    'chemicalisation',
     'chemicalized',
-    'chemically-aided',
-    'chemically-coloured',
-    'chemically-defined',
-    'chemically-enhanced',
-    'chemically-fertilised',
-    'chemically-milled',
-    'chemically-modified',
-    'chemically-produced',
-    'chemically-speaking',
-    'chemically-treated',
-    'chemically-unreactive',
-    'chemically/physically',
-    'chemicals-industry',
-    'chemicals.',
-    'chemicals/ucb',
     'chemicke',
-    'chemiclas',
-    'chemico-mineral',
-    'chemico-physical',
-    'chemilumine',
-    'chemintosh',
-    'chemiques',
-    'chemische',
-    'chemischehe',
-    'chemischen',
-    'chemisches',
-    'chemistry-industry',
-    'chemistry-s',
-    'chemistry.',
-    'chemistry/mathematics',
-    'chemistry/physics',
     'chemistry/quality',
-    'chemisty',
-    'chemmy',
-    'chemname',
-    'chemnitz-based',
-    'chemo-receptors',
-    'chemoattractand',
-    'chemoattraction',
-    'chemoautotrophic',
-    'chemodynamical',
-    'chemokine\'',
-    'chemokines',
-    'chemolimpex',
-    'chemolithotrophs',
-    'chemolytic',
-    'chemomorphological',
     'chemophobia',
-    'chemopreventative',
-    'chemoprevention',
-    'chemoreception',
-    'chemoreceptor',
-    'chemoreceptors',
-    'chemosensitive',
-    'chemosensory',
-    'chemosh',
-    'chemostat',
-    'chemotaxonomic',
-    'chemotherapeutics',
-    'chemotherapist',
-    'chempak',
-    'chemprint&trade',
-    'chempro',
     'chemring',
-    'chemsafe',
-    'chemsford',
-    'chemspec',
-    'chemstation',
-    'chemsystem',
-    'chen-foo',
-    'chen-tai',
-    'chenal',
-    'chenca',
-    'chencellor',
-    'chendo',
-    'chenets',
-    'chenevix-trench',
-    'cheney.',
-    'cheng-chieh',
     'cheng-jan',
-    'cheng-kuang',
-    'cheng-sarah',
-    'cheng/burglary',
-    'chengbin',
-    'chengchi',
-    'chengchow',
-    'chengenter',
-    'chenglai',
-    'chenhalls',
-    'chenieres',
-    'chenna',
-    'chenonceaux',
-    'chenoua',
-    'chenshed',
-    'cheopsis',
     'chepauk',
-    'chepe',
-    'chephren',
-    'chepo',
-    'chepping',
-    'chepstow/south',
-    'cheque&rehy;clearing',
-    'cheque-clearing',
-    'cheque-printing',
-    'cheque-signer',
-    'cheque/slip',
-    'chequebook-brandishing',
-    'chequebooking',
-    'chequecards',
-    'chequed',
-    'chequerboard-patterned',
     'chequerboards',
-    'chequered-tile',
-    'chequers-board',
-    'chequerwork',
-    'cheques/money',
-    'cheques/po',
-    'cheques/postal',
-    'cher-wuc',
-    'cherborne',
-    'cherbourne',
-    'cherche',
-    'cherddi',
-    'chere',
-    'cheree',
-    'cheremushki',
-    'cherenvisinov',
     'cherepanov',
-    'cherepi',
-    'cherepki',
-    'cherepnin',
-    'cherepovets',
-    'cherhill',
-    'cherigal',
-    'cherington',
-    'cherised',
-    'cherished-possession-to-be',
-    'cherk',
-    'cherkasskiy',
-    'cherkassky',
-    'cherkasskys',
-    'cherleroi',
-    'cherleton',
     'cherlow',
-    'chermes',
-    'cherne',
-    'chernechersky',
-    'chernihiv',
-    'chernikeef',
-    'chernikeeff',
-    'cherno',
-    'chernobyl\'',
-    'chernobyl-linked',
-    'chernobyled',
-    'chernoivanov',
-    'chernozem',
-    'chernyak',
-    'chernyshev',
-    'chernyshov',
     'chero',
-    'cherow-o\'leary',
-    'cherpinski',
-    'cherrug',
-    'cherry-',
-    'cherry-and-green',
-    'cherry-blossom-draped',
-    'cherry-boughs',
-    'cherry-brown',
-    'cherry-flavoured',
-    'cherry-like',
-    'cherry-pick',
-    'cherry-pickers',
-    'cherry-pink',
-    'cherry-plum',
-    'cherry-raw',
     'cherry-ripe',
-    'cherry-sized',
-    'cherry-trees',
-    'cherry-type',
-    'cherry-wood',
-    'cherrybank',
-    'cherryes',
-    'cherryman',
-    'cherrytree',
-    'chers',
-    'chersby',
-    'chersophilus',
-    'chertkow',
-    'cherty',
-    'cherub-faced',
-    'cherub-like',
     'cherubin',
-    'cherubins',
-    'cheruiyot',
-    'chervonenko',
-    'chervonets',
-    'cheryden',
-    'cherylynne',
-    'chesebrough-pond',
-    'chesemore',
-    'chesese.',
-    'cheshers',
-    'cheshire-lancashire',
-    'cheshirer',
-    'cheshum',
-    'cheshure',
-    'cheska',
     'cheslea',
-    'chesnau',
-    'chesnimnus',
-    'chesoni',
-    'chess-boards',
-    'chess-intelligent',
-    'chess-players',
-    'chess.',
-    'chess_on',
-    'chessels',
-    'chessmaster',
-    'chessplayer',
-    'chest-\'in',
-    'chest-bone',
-    'chest-brace',
-    'chest-contouring',
     'chest-disease',
-    'chest-flexing',
-    'chest-hair',
-    'chest-level',
-    'chest-mike',
-    'chest-on-chest',
-    'chest-ornaments',
-    'chest-pod',
-    'chest-prodding',
-    'chest-register',
-    'chest-tearing',
-    'chest-top',
-    'chest-veins',
-    'chest/back',
-    'chest/broom',
-    'chest/sternum',
     'chest_as',
-    'chestables',
-    'chestband',
-    'chesteny',
-    'chester&ndash;rhyl',
-    'chester-le',
-    'chester-le-',
-    'chester-shrewsbury',
-    'chester/shrewsbury',
-    'chester/thumper',
-    'chester/wigan',
-    'chesterare',
-    'chesterf\'ld',
-    'chesterfield-based',
-    'chesterfield-sheffield',
-    'chesterfield-style',
     'chesterly',
-    'chesters/hm',
-    'chesterton-on-fosse',
-    'chesterton/oxfordshire',
-    'chestertons',
-    'chestflex',
-    'chestful',
-    'chestid',
-    'chestnut-backed',
-    'chestnut-cheeked',
-    'chestnut-mandibled',
-    'chestnut-red',
-    'chestnut-roasters',
-    'chestnut-sellers',
-    'chestnut-shaped',
-    'chestnut-tree',
     'chestnutery',
-    'chestok',
-    'cheston',
-    'chests-of-drawers',
-    'chestwigs',
-    'cheta-',
-    'chetali',
-    'chetan',
-    'chetek',
-    'chethams',
-    'chetnole',
-    'chetta',
-    'chettle.',
-    'chettri',
-    'cheuchter',
-    'cheuco',
     'chevaleret',
-    'chevalerie',
-    'chevalier-skolnikoff',
-    'chevara',
-    'chevauch&egrave;es',
-    'chevenoz',
-    'cheverell',
-    'cheverly',
-    'cheverolets',
-    'chevillon',
-    'chevre',
-    'chevrier',
-    'chevrillon',
-    'chevrolet-powered',
-    'chevron-like',
-    'chevvies',
     'chevvys',
-    'chevys',
-    'chew-de-chew-chew-chewdy-chew-de-chew-chew',
-    'chew-ew',
-    'chewed-off',
-    'chewer',
-    'chewier',
-    'chewiest',
-    'chewily',
-    'chewiness',
-    'chewing&rehy;gum',
-    'chewits',
-    'chewitts',
-    'chewong-like',
-    'chey',
-    'cheyassin',
     'cheyennes',
-    'cheyne-stokes',
-    'cheynell',
-    'chez-williams',
-    'chez_moi',
-    'chezeris',
-    'chh',
-    'chhagan',
-    'chhakuri',
-    'chhang',
-    'chhatarpur',
-    'chhen',
-    'chho',
-    'chhoden',
-    'chhoeun',
-    'chhrabra',
     'chhy',
-    'chi\'',
-    'chi-chi',
-    'chi-chi-chitty',
-    'chi-h',
-    'chi-kung',
-    'chi-ree',
-    'chi-ro',
-    'chi-test',
-    'chi-uh',
-    'chi=standards',
-    'chia-yi',
-    'chiah',
-    'chiam',
-    'chiamata',
-    'chiamate',
     'chiang-kai-shek',
-    'chiangmai',
-    'chianina',
-    'chianti-bottle',
-    'chiantigiana',
-    'chiantis',
-    'chiantishire\'',
-    'chiappa',
-    'chiarini',
-    'chiaros&rehy;curo',
-    'chiasmata',
-    'chiasmatic',
-    'chiasmus.',
-    'chiasognathus',
-    'chiasso',
-    'chiat',
     'chiate',
-    'chiave',
-    'chiberta',
-    'chibis',
-    'chibnalls',
-    'chibol',
-    'chibols',
-    'chic-but-not-denim',
-    'chic-est',
-    'chic-scratch',
-    'chic-style',
-    'chicage',
-    'chicago-inspired',
-    'chicago-made',
-    'chicago-raised',
-    'chicana',
     'chiccioli',
-    'chicest',
-    'chich&eacute;n',
-    'chicharro',
-    'chiche',
-    'chicheley',
-    'chicheley-smythes',
-    'chichell',
-    'chichen',
-    'chiches',
-    'chichester-clarke',
-    'chichester/langstone',
-    'chichi-vache',
-    'chichido',
-    'chichilnisky',
-    'chichirrrrp',
     'chichis',
-    'chick-and-egg',
-    'chick-chick-chick',
-    'chick-oh-ny',
-    'chick-rearing',
-    'chick.',
-    'chick/oxford',
-    'chickabiddy',
-    'chickadonz',
-    'chickamaw',
-    'chicken&rehy;boned',
-    'chicken&rehy;pox',
-    'chicken-and&rehy;egg',
-    'chicken-bone',
-    'chicken-burger',
-    'chicken-dropping',
     'chicken-ducks',
-    'chicken-farming',
-    'chicken-feed.',
-    'chicken-flicker',
-    'chicken-free',
-    'chicken-houses',
-    'chicken-incubating',
-    'chicken-killers',
-    'chicken-killing',
-    'chicken-leg',
-    'chicken-licken',
-    'chicken-livered',
-    'chicken-neck',
-    'chicken-pens',
-    'chicken-processing',
-    'chicken-producing',
     'chicken-rearing',
-    'chicken-ribs',
-    'chicken-wire',
-    'chickenburger',
-    'chickencoop',
-    'chickenfarmer',
-    'chickengate',
-    'chickenheads',
-    'chickenhearted',
-    'chickenhouse',
-    'chickenman',
-    'chickenshit',
-    'chickita',
-    'chicklade',
-    'chicks-day',
-    'chickweeds',
     'chiclets',
-    'chicness',
-    'chicno',
-    'chicons',
-    'chicories',
-    'chicory-and-orange',
-    'chicoye',
-    'chidananda',
-    'chidcare',
-    'chiddyfort',
-    'chidekel',
-    'chidings',
-    'chidlow',
-    'chidlows',
-    'chiduo',
-    'chieda',
     'chief-doms',
-    'chief-executives',
-    'chief/proprietor',
-    'chiefe',
-    'chiefs-of-air-staff',
-    'chieftainates',
-    'chieftaincies',
-    'chieftan',
-    'chiel',
-    'chiels',
-    'chiem',
-    'chien-han',
-    'chien-shiung',
-    'chiene',
-    'chieng',
-    'chier',
     'chifa',
-    'chiff-chaff-chiff-chaff-chiff-',
-    'chiffon-clad',
-    'chiffon-covered',
-    'chiffonnier',
-    'chiffonniers',
-    'chigger',
-    'chigley',
-    'chignard',
-    'chigney-les-roses',
-    'chigny',
-    'chigorin',
-    'chigworth',
-    'chih',
-    'chihli',
-    'chihuaha',
     'chihuahua.',
-    'chihuio',
-    'chijiiwa',
-    'chijikwa',
-    'chik-cheek-cheek-keraykek',
-    'chikan',
-    'chikar',
-    'chikeee',
-    'chikitsa',
-    'chikoworeconstruction',
-    'chikreng',
-    'chikulu',
-    'chilambe',
-    'chilblain',
-    'chilcahuaycco',
-    'chilcompton',
     'chilcroft',
-    'child&mdash',
-    'child&pound;s',
-    'child&rehy;centred',
-    'child&rehy;environment',
-    'child&rehy;interracial',
-    'child&rehy;management',
-    'child&rehy;producing',
-    'child&rehy;snatcher',
-    'child&rehy;worship',
-    'child\'',
-    'child\'s-eye',
-    'child\'s-head-sized',
-    'child\'s-play',
-    'child\'s-pugh',
-    'child-actor',
     'child-actors',
-    'child-aware',
-    'child-battering',
-    'child-bearer',
-    'child-bearers',
-    'child-beating',
-    'child-bed',
-    'child-beggars',
-    'child-boarder',
-    'child-brother',
-    'child-burdened',
-    'child-caring',
-    'child-centered',
-    'child-centredness',
-    'child-characters',
-    'child-child',
     'child-custody',
-    'child-dancing',
-    'child-developmental',
-    'child-directed',
-    'child-dominated',
-    'child-drawn',
-    'child-eater',
-    'child-faced',
-    'child-foal',
-    'child-friendliness',
-    'child-friendly\'',
-    'child-genius',
-    'child-guidance',
-    'child-heart',
-    'child-in-peril',
-    'child-in-the-adult',
     'child-initiated',
-    'child-kidnapper',
-    'child-labour',
-    'child-molester',
-    'child-molesters',
-    'child-molesting',
-    'child-mortality',
-    'child-murder',
-    'child-obsessed',
-    'child-orientated',
-    'child-oriented',
-    'child-pedestrian',
-    'child-phobia',
-    'child-proofed',
-    'child-protection',
-    'child-psychologists',
     'child-quelling',
-    'child-raising',
-    'child-reading',
-    'child-self',
-    'child-sex',
-    'child-soiled',
-    'child-star',
-    'child-survival',
-    'child-victim',
-    'child-violation',
-    'child-watcher',
-    'child-welfare',
-    'child-whorish',
-    'child-women',
-    'child-world',
-    'child.twenty',
     'child/adolescent',
-    'child/all',
-    'child/godchild',
-    'child/infants',
-    'child/oap',
-    'child/parent',
-    'child/reader',
-    'child/savage',
-    'child/senior',
-    'child/woman',
-    'childas',
-    'childbearers',
-    'childcentred',
-    'childerly',
-    'childfree',
-    'childgrief',
     'childhall',
-    'childhole',
-    'childhood&mdash;arthur',
-    'childhood-makes-man',
-    'childhood-smelling',
-    'childine',
-    'childish=',
-    'childishnesses',
-    'childlikeness',
-    'childminder-users',
-    'childminders/nannies',
-    'childraising',
-    'childre',
-    'childrearer',
-    'children&mdash',
-    'children&rehy;especially',
     'children\'s',
-    'children-battering',
-    'children-in&rehy;law',
-    'children-in-law',
-    'children-in-peril',
-    'children-only',
-    'children-rearing',
-    'children.',
-    'children.he',
-    'children/attend',
-    'children/beelzebub',
-    'children/cat/dog',
-    'children/children',
-    'children/red',
-    'children/ub40s',
-    'children_in_relation',
     'childrenonceptual',
-    'childrey',
-    'childrten',
-    'childseat',
-    'childsized',
-    'childury',
-    'childwatch',
-    'chile-mexico',
-    'chile/peru',
-    'chile_con_carne',
-    'chilean-peruvian',
-    'chilhac',
-    'chiliarch',
-    'chiliarchus',
-    'chiliasm',
-    'chilied',
     'chilindrina',
-    'chilingirian',
-    'chilingutila',
-    'chilion',
-    'chiliprufe',
-    'chilkd',
-    'chill-filtering',
-    'chilla',
-    'chillbox',
-    'chilldren',
-    'chilled-food',
-    'chilled.',
-    'chillen',
-    'chiller/killer',
-    'chillesford',
-    'chilli-bean',
     'chilli-con-barmy',
-    'chilli-con-carne',
-    'chilli-flavoured',
-    'chilli/cayenne',
-    'chilliest',
-    'chillinga',
-    'chillness',
-    'chillon',
-    'chillul',
-    'chillums',
-    'chilmark',
-    'chilodus',
-    'chiloe',
-    'chilotilapia',
-    'chilperici',
-    'chiltington',
     'chilton/managing',
-    'chilton/pensioner',
-    'chilufya',
-    'chilveston',
-    'chim&rehy;panzee',
-    'chima',
-    'chimanimani',
-    'chimbalile',
-    'chimbima',
-    'chimen',
-    'chimene',
-    'chimenti',
-    'chimeran',
-    'chimeres',
-    'chimichangas',
-    'chimid',
     'chimkent',
-    'chimney-boys',
-    'chimney-breasts',
-    'chimney-cradles',
-    'chimney-flue',
-    'chimney-groove',
-    'chimney-jambs',
-    'chimney-lamp',
-    'chimney-like',
-    'chimney-mouth',
-    'chimney-place',
-    'chimney-shelf',
-    'chimney-sized',
-    'chimney-sweepers',
-    'chimney-sweeping',
-    'chimney-top',
     'chimney.',
-    'chimneybreasts',
-    'chimneyheads',
-    'chimneyplace',
-    'chimneypot',
-    'chimneypots',
-    'chimneys.',
-    'chimneystack',
-    'chimneystacks',
-    'chimneytops',
-    'chimny',
-    'chimp-watching',
-    'chimpanzee-human',
-    'chimpanzee-like',
-    'chimplike',
-    'chimpy',
     'chimu',
-    'chimwemwe',
-    'chin&rehy;length',
-    'chin-',
-    'chin-borne',
-    'chin-chain',
-    'chin-cloths',
-    'chin-controlled',
-    'chin-high',
-    'chin-length',
-    'chin-out',
-    'chin-sheng',
-    'chin-stubble',
-    'chin-supporting',
-    'chin-up',
-    'chin-ups',
     'chin.',
-    'china-based',
-    'china-beijing',
-    'china-cabinet',
-    'china-ceramics',
-    'china-doll',
-    'china-faced',
-    'china-india',
-    'china-mania',
-    'china-myanma',
-    'china-ware',
-    'china-watchers',
-    'china-white',
-    'china.there',
-    'china/france',
-    'chinah',
     'chinama',
-    'chinamiotle',
-    'chinandega',
-    'chinati',
-    'chinauley',
-    'chinchon',
-    'chinchontepec',
-    'chindits',
-    'chindustrials',
-    'chined',
-    'chinela',
-    'chinese-based',
-    'chinese-box',
-    'chinese-british',
-    'chinese-built',
-    'chinese-canadian',
     'chinese-designed',
-    'chinese-dominated',
-    'chinese-drafted',
-    'chinese-gauge',
-    'chinese-indonesian',
-    'chinese-influenced',
-    'chinese-leaf',
-    'chinese-occupied',
-    'chinese-run',
-    'chinese-sponsored',
-    'chinese/eating',
-    'chinesey',
-    'ching\'oli',
-    'ching-ing',
-    'ching-te-chin',
-    'chingachook',
     'chingay',
-    'chingford-line',
-    'chinghis-khan',
-    'chinguard',
-    'chinguetta',
-    'chingunji',
-    'chinian',
-    'chinioserie',
-    'chinisia',
-    'chinjikikilu',
-    'chinke',
-    'chinkers',
-    'chinket',
-    'chinkum',
-    'chinman',
-    'chinmeys',
     'chinnery-haldane',
-    'chinnocks',
-    'chinny',
-    'chinny-chin-chin',
-    'chinodoxas',
-    'chinois',
-    'chinoiserie-decorated',
-    'chinona',
-    'chinoy',
-    'chins-up',
-    'chinstrapped',
-    'chinta',
-    'chinthurst',
-    'chintpurni',
-    'chintz-curtained',
-    'chintzed-up',
     'chinyanja',
-    'chionis',
-    'chionodoxas',
-    'chiot',
-    'chip\'',
-    'chip-board',
-    'chip-bound',
-    'chip-cashing',
-    'chip-fryer',
-    'chip-independent',
-    'chip-ins',
-    'chip-kick',
-    'chip-level',
-    'chip-making',
-    'chip-orientated',
-    'chip-pie',
     'chip-powered',
-    'chip-proof',
-    'chip-resistant',
-    'chip-shaped',
-    'chip-sucker',
-    'chip-toothed',
-    'chip-up',
-    'chip.just',
-    'chip_in_conjunction',
-    'chipapa',
-    'chipathi',
-    'chipboa',
-    'chipeta',
-    'chipeto',
-    'chipewyan',
-    'chiplin',
     'chipling',
-    'chipmunk-equipped',
-    'chipmunk-like',
-    'chipmunks/oxfords/tigers',
-    'chipped-in',
-    'chipped-up',
-    'chipperfields',
-    'chippersmart\'s',
-    'chippindale',
-    'chippindales',
-    'chippingdale',
-    'chipre',
-    'chips-with-everything',
-    'chips.million',
-    'chipshops/',
-    'chipster',
     'chipwood',
-    'chirag',
-    'chirche',
-    'chiree',
-    'chirho',
-    'chirino',
-    'chirinos',
-    'chiriqu&iacute',
-    'chiriqui',
-    'chirkin',
-    'chirkland',
-    'chirkpar',
-    'chirognomy',
-    'chirograph',
-    'chirographer',
-    'chiromancy',
     'chirone',
-    'chironomidae',
-    'chironomyces',
-    'chiropaedic',
-    'chiropracters',
-    'chiropractice',
-    'chiropratic',
-    'chiroptera',
-    'chiropterophily',
-    'chiroubles',
-    'chiroulet',
-    'chirozos',
-    'chirrie',
-    'chirring',
-    'chirrp',
-    'chirrupped',
     'chirugical',
-    'chirurgery',
-    'chirurgians',
-    'chirurgions',
-    'chirwa&gt',
-    'chis',
-    'chis-wick',
-    'chisamba',
-    'chisan',
-    'chisango',
-    'chisel-beak',
-    'chisel-blade',
-    'chisel-chinned',
-    'chisel-edged',
-    'chisel-end',
-    'chisel-faced',
     'chisel-sharp',
-    'chisenbury',
-    'chisenhale-marsh',
-    'chish',
-    'chishti',
-    'chisledon',
-    'chislehampton',
-    'chisler',
-    'chisman',
-    'chismas',
-    'chisnell',
-    'chisom',
-    'chissell',
-    'chistian',
-    'chistophe',
-    'chistoprudney',
     'chiswick-based',
-    'chiszar',
-    'chit-chattered',
-    'chit-chatting',
-    'chit-ridden',
-    'chitac',
-    'chitalada',
-    'chitalishte',
-    'chitambala',
-    'chitarone',
-    'chitarra',
-    'chitarrone-player',
-    'chitarroni',
-    'chitin-protein',
-    'chitin-rich',
-    'chitinase',
     'chitinases.',
-    'chitonomyces',
-    'chitosan',
-    'chitou',
-    'chitra',
-    'chitrali',
-    'chittajallu',
-    'chittavira',
-    'chittel',
-    'chitter',
-    'chitter-chattering',
-    'chitterne',
-    'chitterwood',
-    'chittes',
-    'chitties',
-    'chitts',
     'chitumukulu',
-    'chitwa',
-    'chitwan&ndash;kathmandu',
-    'chiumento',
-    'chiusa',
-    'chival',
-    'chivalerie',
-    'chive-vache',
-    'chivee-chivee-chivee',
-    'chiverton',
-    'chivvies',
-    'chivy',
-    'chivying',
-    'chix',
-    'chiyah',
-    'chiyoda-ku',
     'chiyodaku',
-    'chiz',
-    'chize',
-    'chizimulu',
-    'chk',
-    'chkdsk/f',
-    'chkeidze',
-    'chklist.cps',
-    'chlamydotis',
-    'chlangitis',
-    'chldren',
-    'chlef',
-    'chleirich',
-    'chlodovald',
-    'chloralkali',
-    'chloramine-t',
     'chlorantha',
-    'chlorapropane',
-    'chloraseptic',
-    'chlorate(vii)',
-    'chlordiazepoxide',
-    'chlordimeform',
-    'chlori',
-    'chloric(vii)',
-    'chloride/bicarbonate',
-    'chloridel',
-    'chloridorrhoea',
-    'chlorification',
-    'chlorinating',
-    'chlorinator',
-    'chlorinators',
-    'chlorine-',
     'chlorine-bleaching',
-    'chlorine-catalysed',
-    'chlorine-dioxide',
-    'chlorine-green',
-    'chlorine-like',
-    'chlorine/chloramine',
-    'chlorine/chloramine/and',
-    'chlorite-dominated',
-    'chlorite-illite',
-    'chloro-',
-    'chloro-benzene',
-    'chloro-fluoro-carbons',
-    'chloro-fluorocarbons',
-    'chloroactate',
-    'chlorobenzene/',
-    'chlorobenzoate',
     'chlorobenzoates',
-    'chlorocephala',
-    'chlorodifluoromethane',
-    'chlorodioxin',
-    'chloroethane',
-    'chloroflourocarbons',
-    'chlorofluococarbons',
-    'chlorofluoromethanes',
-    'chloroform-induced',
-    'chloroform-methanol',
-    'chloroform-solution',
-    'chloroform/methanol/ammonium',
-    'chloroformates',
-    'chloroisocyanuric',
-    'chloromethane',
-    'chlorophyl',
     'chlorophyll-specific',
-    'chlorophylls',
-    'chlorophytum',
-    'chloroplastic',
-    'chloroplatinic',
-    'chloropolymer',
-    'chloroprene',
-    'chloropropamide',
-    'chloroquin',
-    'chloros',
-    'chlorosulfonation',
-    'chlorosulphonic',
-    'chlorotic',
-    'chlorotriazine',
-    'chlorotuluron',
-    'chlorox',
     'chloroxantha',
-    'chloroxylon',
-    'chlorpropamide',
-    'chlorpropramide',
-    'chlorthalidone',
-    'chlortoluron',
-    'chlostridium',
-    'chm',
-    'chmns',
-    'chmp',
-    'chnace',
-    'chnang',
-    'chng',
-    'chnge',
-    'cho-chak',
-    'cho-hsien',
     'cho-sen',
-    'choanoflagellates',
-    'chobanian',
-    'chobbing',
-    'chobhair',
-    'choc-',
-    'choc-binge',
-    'choc-ices',
-    'choc-on-top',
-    'choc.',
-    'chocaholic',
-    'chocaholics',
-    'chochas',
-    'chochol',
-    'chochola',
-    'chocies',
     'chock-a-bloc',
-    'chock-winner',
-    'chockabloc-jampacked',
-    'chocked-up',
-    'chockered',
-    'choclates',
-    'chocolate-addicted',
-    'chocolate-bar',
-    'chocolate-boxes',
-    'chocolate-boxy',
-    'chocolate-chip',
-    'chocolate-dipped',
-    'chocolate-finding',
-    'chocolate-grinder',
-    'chocolate-haired',
-    'chocolate-hause',
     'chocolate-making',
-    'chocolate-malt',
-    'chocolate-mousse',
-    'chocolate-painted',
-    'chocolate-purple',
-    'chocolate-scented',
-    'chocolate-smeared',
-    'chocolati&egrave;re',
-    'chocolaty',
-    'chocophiles',
-    'chocques',
-    'chocroach',
-    'choctaw',
-    'chodor',
-    'chodowiecki',
-    'chodzko',
     'choesterol',
-    'choeun',
-    'choeurs',
-    'chogolisa',
-    'choice\'',
-    'choice*',
-    'choice-limiting',
-    'choice-of-cake-to-follow',
-    'choice-to-tell',
-    'choice/no',
-    'choice/risk',
-    'choice/you',
-    'choiceness',
-    'choidoryn',
-    'choinich',
-    'choinneachain',
     'choinnichs',
-    'choir-book',
-    'choir-mistress',
-    'choir-screen',
-    'choir-stalls',
-    'choir.6',
-    'choir/',
-    'choir/darlington',
-    'choir/english',
-    'choir/king',
-    'choir/pinnock',
-    'choiral',
-    'choirboy-doll',
-    'choirboy.',
-    'choired',
-    'choiristers',
     'choirmen',
-    'choirscreen',
-    'choise',
-    'choiseul-amboise',
-    'choisies',
-    'choisis',
-    'chojiro',
-    'chojnice',
-    'chojun',
-    'choke-chain',
-    'choke/no',
-    'chokeapple',
-    'chokeapples',
-    'chokecherry',
-    'choked-off',
-    'choked-up',
     'choken',
-    'chokepoints',
-    'chokin\'',
-    'choking-point',
-    'chokings',
-    'chokka',
-    'chokwatana',
-    'chokwatanas',
-    'chol-su',
-    'cholangio',
-    'cholangiocarcinoma.2',
-    'cholangiograms',
-    'cholangiographies',
-    'cholangiopancreaticography',
-    'cholangiopancreatorgaphy',
-    'cholangiopgraphy',
     'cholbon',
-    'cholderton',
-    'chole-hepatic',
-    'cholecystectography/',
-    'cholecystectomies',
-    'cholecystokinetic',
-    'cholecystokinine',
-    'cholecystokinn',
-    'cholecystolithotomies',
-    'cholecystolithotripsy',
-    'cholecystoscopes',
-    'cholecystrokinin',
-    'choledochoduodenostomy',
-    'choledocoduodenostomy',
-    'choledocolithiasis',
-    'choledocus',
     'cholegraphic',
-    'choleitis',
-    'cholera-causing',
-    'cholera-infested',
-    'cholera-related',
-    'choleric-looking',
-    'cholerics',
-    'cholescintigraphy',
-    'cholesintigraphy',
-    'cholestaris',
-    'cholesterl',
-    'cholesterol-carrying',
-    'cholesterol-poor',
-    'cholesterolic',
-    'cholesterolosis',
-    'cholexystectomy',
     'choli',
-    'chollagen',
-    'chollie',
-    'cholmondleys',
-    'cholmondoley-warner',
-    'choloepi',
-    'choloepus',
-    'cholonic',
-    'choluteca',
-    'chombo',
-    'chomczynski',
-    'chomezynski',
-    'chomondeley',
-    'chompedy',
-    'chomper',
-    'chompingly',
     'chomsky\'s',
-    'chomskyism',
-    'chomutove',
-    'chomzcynski',
-    'chondral',
-    'chondria',
-    'chondritescontain',
-    'chong-sun',
-    'chongil',
-    'chongjin',
-    'chongkumdan',
-    'chongup',
-    'chongwe',
-    'chonminnyon',
-    'chonnam',
-    'chonnohyop',
     'chonoghlais',
-    'chontala',
-    'chontales',
-    'chontamenti',
-    'chonwe',
-    'choochie',
-    'choochy',
-    'chooked',
-    'chooky-chooky',
-    'choom',
-    'chooph-ch',
-    'choorta',
-    'choos',
-    'choose&lsqb;s&rsqb',
-    'choose\'',
-    'choose-and-follow',
     'choosed',
-    'chooseexpsr',
-    'chooses.',
-    'choosiness',
-    'choosing.',
-    'chop-chop',
-    'chop-houses',
-    'chop-job',
-    'chop-off-their-willies',
-    'chop-orientated',
-    'chop-sticks',
-    'chop-sueys',
-    'chop-variants',
-    'chopanyan',
-    'chopinesque',
-    'choppe-lautier',
     'chopped-chicken-liver-on-rye',
-    'chopped-down',
-    'chopped-off',
-    'chopper-knife',
-    'chopper.',
-    'chopper/distribution',
-    'choppering',
-    'choppery',
-    'choppily',
-    'chopping-up',
-    'choppings-off',
-    'choppinnng',
-    'chopstick-holders',
-    'chopunnish',
-    'choquel',
-    'chor-',
     'chora',
-    'choral-orchestral',
-    'chorale-like',
-    'choralists',
-    'chord-challenged',
-    'chord-colour',
-    'chord-like',
-    'chord-passage',
-    'chord-patterns',
-    'chord-shape',
-    'chord-spiralling',
-    'chord-successions',
-    'chord-type',
-    'chordae',
-    'chordal/arpeggio',
-    'chordate-like',
     'chordeiles',
-    'chordita',
-    'chordotonal',
-    'choregrapher',
-    'choreoghraphy',
-    'choreographed\'',
-    'choreographies',
-    'choreopoem',
-    'chores.',
-    'chori',
-    'choria',
-    'chorianopoulos',
-    'choric',
-    'chorihippus',
-    'chorionoc',
-    'chorioretinal',
     'chorioretinitis',
-    'choristership',
-    'choriwad',
-    'chorlape',
-    'chorlis',
-    'chorlton-on-medlock',
-    'chorlton-upon-medlock',
-    'chorny',
-    'chorophyll',
-    'chororists',
-    'chorrie',
-    'chortex',
-    'chorthippus',
-    'chortle-merchant',
-    'chortler',
-    'chorus-based',
     'chorus-boy',
-    'chorus-interruptus',
-    'chorus-leader',
-    'chorus-line',
-    'chorus/delay',
-    'chorus/echo/reverb/sound',
-    'chorus/flanger',
-    'chorus/rattle',
-    'chorusing',
-    'chorussing',
-    'choruswards',
-    'choses-in-action',
-    'chossy',
-    'chosun',
-    'chosun-ilbo',
-    'chotain',
     'chotanagpur',
-    'chotard',
-    'chotesov',
-    'choti',
-    'chotiyothin',
-    'choto',
-    'chou-fasman',
-    'choua',
-    'choudbhury',
-    'choudhary/thames',
-    'choudhouri',
-    'choudury',
-    'choueka',
-    'choughing',
-    'chouilly*',
-    'chouinard',
     'choukier',
-    'chould',
-    'choupana',
-    'chourou',
-    'chovet',
-    'chovy',
-    'chow-chow',
-    'chow-michiel',
-    'chow.',
-    'chowdhuryeducation',
-    'chowgule',
-    'chowkidars',
-    'choybalsan',
-    'choyjiljavyn',
-    'choyjilsurengiyin',
-    'choynese',
     'choynoryn',
-    'choynowski',
-    'chpman',
-    'chr&emacr;smologists',
-    'chr-r-eek',
-    'chreschtlech-sozial',
-    'chrestomathia',
-    'chricton',
-    'chrimble',
-    'chriostat',
-    'chriostats',
-    'chris&rehy;tiansen',
-    'chris\'sakes',
-    'chris-style',
-    'chris/airdrie',
-    'chris/helper',
     'chriselton',
-    'chrisitan',
-    'chrismatos',
-    'chrismuzak',
-    'chrisopher',
-    'chrisostomos',
-    'chrisp',
-    'chrisse',
-    'chrissmas',
-    'chrissst',
-    'christ-baby',
-    'christ-corpse',
-    'christ-likeness',
-    'christ-lived',
-    'christ-shaped',
-    'christ-this-is-so-delicious-it-seems-a-shame-to-go-on-about-it-but-i-feel-it-is-my-duty',
     'christ.john',
-    'christaforou',
-    'christain',
-    'christal',
-    'christalbloodymighty',
-    'christaller',
-    'christamas',
-    'christatus',
-    'christboy',
-    'christchurch/dorset',
-    'christel',
-    'christelton',
-    'christen-democratisch',
-    'christendome',
-    'christendon',
-    'christenin',
     'christensen/farmer',
-    'christenson',
-    'christentums',
-    'christenyng',
-    'christenyngs',
-    'christey',
-    'christian-allegorical',
-    'christian-based',
-    'christian-bernard',
-    'christian-controlled',
-    'christian-cum-romantic',
-    'christian-influenced',
-    'christian-minority',
-    'christian-moslem',
-    'christian-national',
-    'christian-truths.',
     'christianism',
-    'christianitee',
-    'christianity&mdash;around',
-    'christianity-and-water',
-    'christianne',
-    'christiano',
-    'christianos',
-    'christians-in-the-making',
-    'christians/syrians',
-    'christianso',
-    'christiansted',
-    'christic',
-    'christie\'',
-    'christie-lewis',
-    'christie-like',
-    'christie/husband',
     'christie/patient',
-    'christies/london',
-    'christifideles',
-    'christinae',
-    'christine&mdash',
-    'christine/edinburgh',
-    'christkind',
-    'christl',
-    'christleib',
-    'christless',
-    'christlichdemokratische',
-    'christly',
-    'christm',
-    'christma',
-    'christmas-day',
-    'christmas-flowering',
     'christmas-gift',
-    'christmas-lit',
-    'christmas-morning',
-    'christmas-present',
-    'christmas-pudding',
-    'christmas-shopping',
-    'christmas-tree-like',
-    'christmas.it',
-    'christmas/january',
-    'christmas/new',
-    'christmasy',
-    'christmoz',
-    'christobal',
-    'christodoulous',
-    'christof',
-    'christofe',
     'christoffersen',
-    'christofias',
-    'christofides',
-    'christofidhis',
-    'christofix',
-    'christofle',
-    'christophenes',
-    'christopher\'',
-    'christopher-rabin',
-    'christopher-stefan',
-    'christopherian',
-    'christophine',
-    'christorfe',
-    'christov',
-    'chritopher',
-    'chro',
     'chro&iacute',
-    'chro-',
-    'chrohn',
-    'chroisprig',
-    'chrom',
-    'chroma',
-    'chromacol',
-    'chroman',
-    'chromascan',
-    'chromatin-like',
-    'chromatofocusing',
-    'chromatograph/mass',
-    'chromatographers',
-    'chromatology',
-    'chromatophore',
-    'chrome-dome',
     'chrome-domed',
-    'chrome-finished',
-    'chrome-iron',
-    'chrome-vanadium-molybdenum',
-    'chromea',
-    'chromeless',
-    'chromes',
-    'chromex',
-    'chromidotilapia',
-    'chromium-',
-    'chromium-51-ethylene-diaminetetra-acetate',
-    'chromium-ethylenediaminetetraacetic',
-    'chromium-labelled',
-    'chromium-polluted',
-    'chromocentre',
-    'chromolox',
     'chromomere',
-    'chromoproteins',
-    'chromoscan',
-    'chromosomatic',
-    'chromosome/contig',
-    'chromotographic',
-    'chromotrope',
-    'chrompac',
-    'chrompack',
-    'chronatography',
-    'chronically-tired',
-    'chronicis',
-    'chronicle-history',
-    'chronicled.2',
-    'chronics',
-    'chronicus',
     'chronobiol.',
-    'chronobiologist',
-    'chronocyclograph',
-    'chronofunction',
-    'chronografia',
-    'chronographia',
-    'chronographic',
-    'chronographs',
-    'chronologer',
-    'chronologically-based',
-    'chronologists',
-    'chronometres',
-    'chronosociology',
-    'chronospheres',
-    'chronostatigraphic',
-    'chronostratigraphy',
     'chronotography',
-    'chronotopal',
-    'chronozone',
-    'chronozones',
-    'chroococcum',
-    'chrst',
-    'chrst-lk',
-    'chrulew',
-    'chryptosporidia',
-    'chrysaetos',
-    'chrysalid',
-    'chrysanthemum-pattern',
-    'chrysaor',
-    'chrysazine',
-    'chryseum',
-    'chrysichthys',
     'chrysididae.',
-    'chrysippus',
-    'chrysithics',
-    'chryslers',
-    'chrysm',
-    'chrysobalanaceae',
-    'chrysoberyls',
-    'chrysogon',
-    'chrysoidine',
-    'chrysokamino',
-    'chrysolina',
-    'chrysolite',
-    'chrysomelid',
-    'chrysoms',
-    'chrysopa',
-    'chrysophlax',
     'chrysoprase',
-    'chrysoprases',
-    'chrysostomus',
-    'chrysotile',
-    'chryssy',
-    'chrystean',
-    'chrzanow',
-    'chrzanowskijustice',
-    'chrzescijansko-narodowe',
-    'chs.202/88',
-    'chteau',
-    'chthonian',
-    'chu&mdash&mdash&mdash',
-    'chu-chu-chu',
-    'chu-ming',
-    'chualar',
     'chuan-shan',
-    'chub.',
-    'chuba',
-    'chubas',
-    'chubbier',
-    'chubbing',
-    'chubbly',
-    'chubbs',
-    'chubby-chaser',
-    'chubby-faced',
-    'chubbycheeks',
-    'chubbyish',
-    'chubut',
-    'chuca',
-    'chucanaque',
-    'chuches',
     'chuchu',
-    'chuck\'em',
-    'chuck-ball',
-    'chuck-chuck',
-    'chuck-chuck-chuck',
-    'chuck-up',
-    'chucka',
-    'chuckies',
-    'chuckle-chuckle',
-    'chuckle-gobble',
-    'chucklebuds',
-    'chuckled-gently',
-    'chucklevision',
-    'chucklings',
-    'chucko',
-    'chucuito',
     'chue',
-    'chuechlihaus',
-    'chuenjai',
-    'chuff-bag',
-    'chuff-chuff',
-    'chuffa',
-    'chuffa-chuffa-clang-clang',
-    'chuffinelles',
-    'chug-chug&rehy;chug',
-    'chuganov',
-    'chugg',
-    'chuichi',
-    'chuilon',
-    'chuinneag',
-    'chukara',
-    'chukha',
     'chukhurova',
-    'chukkers',
-    'chukwuma',
-    'chulam',
-    'chuldren',
-    'chulkaturin',
-    'chulmleigh',
-    'chummage',
-    'chummlees',
-    'chumphon',
-    'chun-hung',
-    'chun-yu',
-    'chundar',
-    'chundered',
-    'chunders',
-    'chundo',
     'chundra',
-    'chungang',
-    'chungdan',
-    'chungju',
-    'chunichi',
-    'chunker',
-    'chunkily',
-    'chunky-ish',
-    'chunky-looking',
-    'chunkydogmeat',
-    'chunnels',
-    'chunnering',
-    'chunter',
-    'chuntered',
-    'chunters',
-    'chuo',
     'chup-a-chups',
-    'chupa',
-    'chupcuaro',
-    'chuppah',
-    'chuquiwillca',
-    'chur-cock',
-    'chur-zurich',
-    'churbanov',
-    'church&lsqb;es&rsqb',
-    'church&mdash',
-    'church&ndash',
-    'church&rehy;affiliated',
-    'church&rehy;manship',
-    'church\'',
-    'church-andstate',
-    'church-attendance',
     'church-banner',
-    'church-bishop',
-    'church-builder',
-    'church-burning',
-    'church-by-church',
-    'church-comer',
-    'church-fellowship',
-    'church-fortresses',
-    'church-free',
-    'church-goer.',
-    'church-inspired',
-    'church-keys',
-    'church-led',
-    'church-loaded',
-    'church-loan',
-    'church-man',
     'church-membership',
-    'church-men',
-    'church-music',
-    'church-nominated',
-    'church-of-englandism',
-    'church-planting',
-    'church-roof',
-    'church-run',
-    'church-towers',
-    'church-town',
-    'church-type',
-    'church-warden',
-    'church-y',
-    'church/bride',
-    'church/cattle',
-    'church/chapel',
     'church/community',
-    'church/legal',
-    'church/newtown',
-    'church/northants',
-    'church/synagogue/register',
-    'churcham',
-    'churchcrown',
-    'churches_as',
-    'churchey',
-    'churchglade',
-    'churchgoer-which',
-    'churchgrim',
-    'churchi',
-    'churchill-led',
-    'churchill/eden/macmillan/home',
-    'churchill/leading',
     'churchless',
-    'churchley',
-    'churchly',
-    'churchmans',
-    'churchmanships',
-    'churchward/nra',
-    'churchworkers',
-    'churchy-type',
-    'churchyard-based',
-    'churdjin',
-    'churfirsten',
-    'churi',
-    'churilov',
-    'churinga',
-    'churk',
-    'churm',
     'churney',
-    'churnful',
-    'churning&mdash;but',
-    'churny',
-    'churr-rur-rur',
-    'churrascaria',
-    'churrigueresque',
-    'churrings',
-    'churros',
-    'chusan',
-    'chuseing',
-    'chuses',
-    'chuted',
-    'chuter-ede',
-    'chutney-filled',
-    'chuulu',
     'chuvaandorjiyn',
-    'chuval',
-    'chuvash',
-    'chuzlev',
-    'chvy',
-    'chwang',
-    'chwarae\'r',
-    'chware',
-    'chwasky',
-    'chwedl',
-    'chwilog',
-    'chyan',
-    'chyi-ming',
-    'chyldern',
-    'chylothorax',
-    'chylous',
     'chymicall',
-    'chymie',
-    'chymosin',
-    'chymotrypsinogen',
-    'chyna',
-    'chynoweth/father',
-    'chynoweth/mother',
-    'chyslaire',
-    'chysoidine',
-    'chytilova',
-    'chytrids',
-    'chytroeisphaeridia',
-    'chzs',
-    'ci&ecirc;ncia',
-    'ci\'niib',
-    'ci-apr&egrave;s',
     'ci-devant',
-    'ci/mmole',
-    'ci/mol',
-    'ci2c=cci2',
-    'ci=-16.2',
-    'ci=-18.1',
-    'ci=-2.6',
-    'ci=-22.4',
-    'ci=-3.8',
-    'ci=0.02',
-    'ci=0.02&ndash;0.95',
-    'ci=0.06',
-    'ci=0.10',
-    'ci=0.10&ndash;1.11',
-    'ci=0.19',
-    'ci=0.21',
     'ci=0.45',
-    'ci=0.95',
-    'ci=2',
-    'cia&ndash;kgb',
-    'cia&rehy;bcci',
-    'cia-based',
-    'cia-contract',
-    'cia-organised',
-    'cia-sponsored',
-    'cia-types',
-    'cia.',
-    'cia/',
-    'cia/billett',
-    'cia/fbi',
-    'ciabatta-bread',
-    'cially',
     'ciam',
-    'ciambella',
-    'ciammarughi',
-    'ciampoli',
-    'ciancimino',
-    'ciapino',
-    'ciapp',
-    'ciass',
-    'cibachromes',
-    'cibarial',
-    'ciblings.',
-    'cibola',
-    'cibucu',
-    'cic.',
-    'cicados',
-    'cicalamento',
     'cicatrice',
-    'cicatricial',
-    'cicatrised',
-    'cicatrizes',
-    'cicciolina-inspired',
-    'cicciolina/harry',
-    'ciccone',
-    'cicconer',
-    'cicek',
-    'cicero.',
-    'cicerone-babble',
-    'cicerones',
-    'ciceronis',
-    'cichell',
-    'cichilidae',
-    'cichlasomaniacs',
     'cichlasomas',
-    'cichlid-keeper',
-    'cichlid-like',
-    'cichlidophiles',
-    'cichon',
-    'cichorius',
-    'cicil',
-    'cicli',
-    'ciclitira',
-    'cico',
-    'ciconiidae',
-    'cics-based',
-    'cics-compatible',
-    'cics-for-unix',
-    'cics-on-unix',
-    'cics/600-based',
     'cics/6000-based',
-    'cics/6000-effectively',
-    'cics/6000-to-encina',
-    'cics/aix',
-    'cics/cobol/vsam',
-    'cics/vs',
-    'cicutarium',
-    'cid.',
-    'cidaroids',
-    'cider-fuelled',
-    'cider-heads',
-    'cider-makers',
-    'cider-swilling',
-    'cider.',
-    'ciderhouse',
-    'cidermaking',
     'cidermill',
-    'cidery',
-    'cidi',
-    'cidium',
-    'cidrax',
-    'cidrolin',
-    'cidse',
-    'ciec',
-    'ciechanowski',
-    'ciechi',
-    'ciecierski',
-    'ciegos',
-    'cielab',
-    'cielcovich',
-    'ciemniewski',
-    'cieplak',
     'ciespl',
-    'ciete',
-    'cieza',
-    'cifel',
-    'cifmd',
-    'cigalle',
-    'cigani',
-    'cigar-',
-    'cigar-box',
-    'cigar-boxes',
-    'cigar-brown',
-    'cigar-cutter',
-    'cigar-end',
-    'cigar-ends',
-    'cigar-galls',
-    'cigar-gnawing',
     'cigar-scented',
-    'cigar-shape',
-    'cigar-smoker',
-    'cigar-store',
-    'cigareets',
-    'cigares',
-    'cigarette&rehy;smoking',
-    'cigarette\'',
-    'cigarette-',
-    'cigarette-ash',
-    'cigarette-box',
-    'cigarette-burned',
-    'cigarette-butt',
-    'cigarette-ends',
-    'cigarette-filled',
-    'cigarette-filters',
     'cigarette-holders',
-    'cigarette-packet',
-    'cigarette-sized',
-    'cigarette-stinking',
-    'cigarette-tapping',
-    'cigarette-tip',
-    'cigarette-voiced',
-    'cigaretteholder',
-    'cigarettes&rehy;which',
-    'cigarettes.',
-    'cigarettes.mike',
-    'cigarettes/day',
-    'cigarettes/tobacco',
-    'cigaretteswere',
-    'cigarillo',
-    'cigarrillos',
     'cigarros',
-    'cigary',
-    'cigatettes',
-    'ciggie-sized',
-    'cigno',
-    'cigognani',
-    'cigogne',
-    'cigourel',
-    'cigs.',
-    'cigua',
-    'ciguenza',
-    'cihe',
-    'cihlar',
-    'ciii&ndash;cvi',
-    'ciip',
-    'ciir',
     'cikarette',
-    'ciklamini',
-    'cila',
-    'cilacap',
-    'cilantro',
-    'cilby',
-    'cilea',
-    'cilfit',
-    'cilgwyn',
-    'ciliaris',
-    'ciliate',
-    'ciliau',
-    'ciliberto',
-    'cilicap',
-    'cilician',
-    'cilicians',
     'ciliwung',
-    'cillaris',
-    'cillia',
-    'cillis',
-    'cillus',
-    'cilmore',
-    'cilt-provided',
-    'cimapps',
-    'cimarosa',
-    'cimbernauld',
-    'cimbrone',
-    'cimco',
-    'cimcon',
-    'ciment',
-    'cimento',
-    'cimes',
     'cimetidines',
-    'cimetine',
-    'cimicifuga',
-    'cimitero',
-    'cimitidine',
-    'cimliss',
-    'cimonian',
-    'cimper',
-    'cimtidine',
-    'cin',
-    'cin&eacute',
-    'cin&eacute;-variety',
-    'cin&eacute;aste',
-    'cin&eacute;ma-v&eacute;rit&eacute',
-    'cinamon',
-    'cincinnati-based',
     'cincinnatian',
-    'cincinnatti',
-    'cinclosomas',
-    'cincpac',
-    'cincta',
-    'cincturus',
-    'cinda',
-    'cinder-coloured',
-    'cinder-head',
-    'cinder-paths',
-    'cinder-raking',
-    'cinder-strewn',
-    'cinderalla',
-    'cinderbed',
-    'cinderblock',
-    'cinderblocks',
     'cindered',
-    'cinderella-like',
-    'cinderfella',
-    'cinderfield',
-    'cindi',
-    'cindoruk',
-    'cindra',
-    'cine-cameras',
-    'cine-cardiography',
-    'cine-films',
-    'cine-literate',
-    'cineas',
-    'cineaste',
-    'cineastes',
-    'cinecasino',
-    'cineemaaa',
     'cinegelet',
-    'cineguild',
-    'cineloop',
-    'cineloops',
-    'cinema-',
-    'cinema-as-drug',
-    'cinema-city',
-    'cinema-hall',
-    'cinema-like',
-    'cinema-scope',
-    'cinema-test',
-    'cinema-type',
-    'cinema-verit&eacute',
-    'cinema/bookshop',
-    'cinema/theatre/wedding',
-    'cinemagique',
     'cinemagoer',
-    'cinematically-sensational',
-    'cinematog-raphers',
-    'cinemattractions',
-    'cinemax',
-    'cinephotography',
-    'cineplex',
-    'cinepoem',
-    'cinepop',
-    'cineprojector',
-    'cinera',
-    'cinerea/tetralix',
-    'cinereous',
-    'cinetel',
-    'cinetropolises',
-    'cinewomen',
     'cinglais',
-    'cingoz',
-    'cingria',
-    'cingula',
-    'cingulum',
-    'cinical',
-    'ciniewicz',
-    'cinna',
-    'cinnabar-covered',
-    'cinnabars',
-    'cinnamin',
-    'cinnamon-spiced',
-    'cinnamus',
-    'cinncinatti',
-    'cinni',
-    'cinoptilolite',
     'cinos',
-    'cinoxacin',
-    'cinqe',
-    'cinquantenaire',
-    'cinqui&egrave;me',
-    'cinto',
-    'cintura',
-    'cinva',
-    'cioaba',
-    'ciob/cibse',
-    'ciobanu',
-    'ciobotea',
-    'cioccolato',
-    'cioffe',
-    'cione',
-    'ciorog&icirc;la',
     'cipa',
-    'cipcs',
-    'cipfa/adss',
-    'cipher-breaker',
-    'cipher-breaking',
-    'ciphered',
-    'cipherist',
-    'cipian',
-    'cipinang',
-    'cipivari',
-    'cippenham',
-    'cipperfields',
-    'ciprepediums',
-    'cipro',
-    'ciprobay',
-    'ciproxan',
     'ciproxin',
-    'cir&eacute',
-    'cir&rehy;culation',
-    'cir/home',
-    'ciragettes',
-    'ciral',
-    'circ.',
-    'circaea',
-    'circaetus',
-    'circinn',
-    'circinus',
-    'circinzade',
-    'circiumar',
-    'circle-related',
-    'circle-sized',
-    'circle-stitched',
     'circle-that',
-    'circles.i',
-    'circles/moths',
-    'circlesquare',
-    'circling\'',
-    'circling-around',
-    'circlips',
-    'circly',
-    'circotherm/microwave',
-    'circs.',
-    'circu',
-    'circuit(s)',
-    'circuit-bashing',
-    'circuit-boards',
-    'circuit-breaker',
-    'circuit-parts',
     'circuit-switching',
-    'circuit/county-court',
-    'circuitbreaker',
-    'circuitries',
-    'circuitry.',
-    'circuity',
-    'circula&rehy;tion',
-    'circulaci&oacute;n',
-    'circular-based',
-    'circular-bound',
-    'circular-concentric',
-    'circular-ended',
-    'circular-plan',
-    'circularities',
-    'circularization',
-    'circulated.a',
     'circulatesmostly',
-    'circulation&mdash;this',
-    'circulation-grabbing',
-    'circulation-oriented',
-    'circulation.',
-    'circulation/emergency',
-    'circulized',
-    'circulum',
-    'circum-earth',
-    'circum-polar',
-    'circum-stances',
-    'circumambulated',
-    'circumambulating',
-    'circumambulator',
-    'circumambulatory',
-    'circumbaikal',
     'circumcisees',
-    'circumcision-ceremony',
-    'circumcision.',
-    'circumdati',
-    'circumfe',
-    'circumflexes',
-    'circumfrential',
-    'circumgranular',
-    'circumgrids',
-    'circumnavigable',
-    'circumnavigates',
-    'circumpolar&rehy;that',
-    'circumpolarly',
-    'circumscissile',
-    'circumscriptions',
-    'circumspective',
     'circumstance-the',
-    'circumstance-type',
-    'circumstance.',
-    'circumstances&mdash',
-    'circumstances&rehy;and',
-    'circumstances-causal',
-    'circumstances-none',
-    'circumstances.m',
-    'circumstances.so',
-    'circumvallate',
-    'circus-artist',
-    'circus-like',
-    'circus-sounding',
-    'circus-style',
-    'circus-type',
-    'circus.',
     'circushead',
-    'circussy',
-    'cird',
-    'cire-perdue',
-    'cirefca',
-    'cirencester/gloucestershire0',
-    'ciri',
-    'ciriato',
-    'ciric',
-    'ciril',
-    'cirillo',
-    'cirio',
-    'cirith',
-    'cirkewwa',
-    'cirkovic',
-    'cirmen',
     'cirrhose',
-    'cirrus-mottled',
-    'cirrus-strewn',
-    'cirscale',
-    'cirsiums',
-    'cirsoid',
-    'ciruelo',
-    'cirumstances',
-    'cirvice',
-    'cirvs',
-    'cis-&lsqb;pt',
-    'cis-diamminedichloroplatinum',
-    'cis-double',
-    'cis-lunar',
-    'cis-octahedral',
-    'cis-oriented',
     'cis-poly(1,3-butadiene)',
-    'cis-polyisoprene',
-    'cis-uralian',
-    'cisalpinism',
-    'cisapride=37%',
-    'cisarovsky',
-    'cisbee',
-    'ciscenje',
-    'ciscoworks',
-    'cisel&eacute;e',
-    'cisiley',
-    'cising',
-    'cisister',
-    'cisitalia',
-    'cisk',
-    'cisparide',
     'cisplatin-modified',
-    'cisret',
-    'cissa',
-    'cissbury',
-    'cissi',
-    'cissies',
-    'cissiness',
-    'cisssie',
-    'cisteachan',
-    'cistern-drenched',
-    'cistern-flush',
-    'cisterna',
-    'cisternal',
-    'cisterns.',
-    'cisto',
-    'cisudror',
     'cit&eacute;s-cin&eacute;s',
-    'cit-alcatel',
-    'cit-xe',
-    'cit-xe+',
-    'cit.es',
-    'citabria',
-    'citadel-town',
-    'citadella',
-    'citadelles',
-    'citaristi',
-    'citational',
-    'citators',
-    'citeaux',
-    'cited-integrity',
-    'cited-primary',
-    'cited_in',
     'citello',
-    'citerite',
-    'cites-monitored',
-    'cither',
-    'citibanks',
-    'citicorp-scrimgeour',
-    'citicorps',
-    'citied',
-    'cities.there',
-    'cities/abc',
-    'cities/countries',
-    'citigate/price',
-    'citigen',
-    'citing-for-violations',
-    'citiservice',
-    'citiwatch',
     'citizen\'',
-    'citizen-advocacy',
-    'citizen-authority',
-    'citizen-centred',
-    'citizen-intellectual',
-    'citizen-reader',
-    'citizen-slob',
-    'citizen-soldier',
-    'citizen-state',
-    'citizen-suit',
-    'citizen/viewer/elector',
-    'citizens&mdash;see',
-    'citizens/groups',
-    'citizenship*douglas',
-    'citizenship-law',
-    'citochrome',
     'citosan',
-    'citoyenne',
-    'citoyent&eacute',
-    'citr&ouml;en',
-    'citrange',
-    'citrata',
-    'citrate-phosphate',
-    'citrate-phosphate-dextrose',
-    'citrate/phosphate/dextrose',
-    'citrate/sodium',
-    'citridorus',
-    'citro&euml;ns',
-    'citroe&die;n',
-    'citrohan',
-    'citrone',
-    'citronnade',
     'citrons',
-    'citrus-based',
-    'citrus-enhanced',
-    'citrus-planting',
-    'citrus-producing',
-    'citrus-scented',
-    'citrusy',
-    'citterne',
-    'city&ndash;ottawa',
-    'city&rehy;born',
-    'city-birmingham',
-    'city-bound',
-    'city-boy',
-    'city-but',
-    'city-chicago',
-    'city-child',
     'city-enclosure',
-    'city-folk',
-    'city-gates',
-    'city-goddess',
-    'city-grimed',
-    'city-imposed',
-    'city-kid',
-    'city-machine',
-    'city-middlesbrough',
-    'city-organised',
-    'city-plundering',
-    'city-provided',
-    'city-scale',
-    'city-scape',
-    'city-sights',
-    'city-sophisticated',
     'city-sponsored',
-    'city-striped',
-    'city-style',
-    'city-suburban',
-    'city-suited',
-    'city-to-city',
-    'city-users',
-    'city-wise',
-    'city-workers',
-    'city.',
-    'city.milton',
-    'city/boyz',
-    'city/interceptor',
-    'city/nec',
-    'city/urban',
-    'cityguy',
     'cityhopper',
-    'citylight',
-    'cityline',
-    'cityman',
-    'citymusic',
-    'citymystic',
-    'cityplans',
-    'citys',
-    'cityslickers',
-    'citywards',
-    'ciu.',
-    'ciubotaru',
-    'ciucci',
-    'civardi',
-    'civi',
-    'civic-amenity',
     'civic-led',
-    'civic-political',
-    'civil&mdash;an',
-    'civil&mdash;military',
-    'civil-aircraft',
-    'civil-list',
-    'civil-produced',
-    'civil-servant-type',
-    'civil/military',
-    'civil/political',
-    'civili',
-    'civiliam',
-    'civilian-clad',
-    'civilian-controlled',
-    'civilian-led',
-    'civilian-looking',
     'civilian-operated',
-    'civilian-populated',
-    'civilian/military',
-    'civilianize',
-    'civilis.',
-    'civilisation\'',
-    'civilisation.sir',
-    'civiliser',
-    'civilisers',
-    'civilises',
-    'civilista',
-    'civiliz',
-    'civilization\'',
-    'civilized\'',
-    'civilizer',
-    'civill',
     'civill\'st',
-    'civily',
-    'civis',
-    'civisme',
-    'civit',
-    'civitas&mdash;centres',
-    'civs',
-    'civy',
-    'ciwi-zade',
-    'cixi',
-    'ciyms&mdash',
-    'cizetas',
-    'cj&ndash;6',
-    'cj&ndash;6a',
-    'cj-6a',
-    'cj610',
     'cjb',
-    'cjf',
-    'cjh',
-    'cjk',
-    'cjrm',
-    'ck-ii',
-    'ck141433778',
-    'ck5',
-    'ckamp',
-    'ckck',
-    'ckk-8',
-    'ckkk',
-    'ckl',
-    'ckng',
-    'cl&agrave;rsaich',
-    'cl&eacute;mence',
     'cl&eacute;on',
-    'cl&eacute;rambault',
-    'cl&egrave;ves',
-    'cl&mdash;mode',
-    'cl+',
-    'cl-215',
-    'cl-215t',
-    'cl-4b',
-    'cl-activating',
-    'cl-alexanders',
-    'cl-caralight',
-    'cl-gd5424',
-    'cl-gd5426',
-    'cl100/3ch134',
-    'cl44',
-    'cl4b',
     'cla-cla-cla',
-    'cla30',
-    'claaaarse',
-    'claar',
-    'claasen',
-    'claassen',
-    'clabburn/boat',
-    'clabby',
-    'clabecq',
-    'clabidacia',
-    'clac',
-    'clacach',
-    'clachlet',
-    'clack-spring',
-    'clackering',
-    'clackin\'',
     'clackmanshire',
-    'clacky',
-    'clacton.',
-    'claddach',
-    'clader',
-    'cladinam',
-    'cladist',
-    'clads',
-    'claehan',
-    'claerwen',
-    'claesz',
-    'claesz.',
-    'claeus',
-    'claffam',
-    'claffey',
-    'claffin',
     'clafoutis',
-    'claibourne',
-    'claim-free',
-    'claim-game',
-    'claim-jumping',
-    'claim.2',
-    'claimant-based',
-    'claime',
-    'claimed&mdash;an',
-    'claimed-that',
-    'claimed.the',
-    'claims-made',
-    'claims-paying',
-    'claims-raising',
-    'claims/benefits',
-    'claims/of',
     'claioming',
-    'clair-obscur',
-    'clairaudience',
-    'clairaudients',
-    'claire-th&eacute;r&egrave;se',
-    'clairemont',
-    'clairify',
-    'clairrnonte',
-    'clairsentients',
-    'clairson',
-    'clairty',
-    'clairvaux\'',
-    'clairvoy',
-    'clairvoyancy',
-    'clairvoyantes',
-    'clairvoyantly',
     'clais',
-    'claiville',
-    'clake',
-    'clam-digger',
-    'clam-like',
-    'clam-martinic',
-    'clam-shell',
-    'clam2',
-    'clambake',
-    'clambring',
-    'clamerkin',
-    'clamey',
-    'clamitat',
-    'clammying',
-    'clamorously',
-    'clamourings',
     'clamourous',
-    'clamp-fired',
-    'clamp-on',
-    'clampdowns',
-    'clampe',
-    'clamped&rehy;down',
-    'clamper',
-    'clampett',
-    'clamping-down',
-    'clampt',
-    'clamworm',
-    'clan-based',
-    'clan-dominated',
-    'clan-type',
-    'clanabogan',
-    'clancarty',
     'clancy/techno-thriller',
-    'clandestin',
-    'clandestins',
-    'clandonensis',
-    'clanfield/oxfordshire',
-    'clanfield/peers',
-    'clanga',
-    'clangy',
-    'clankish',
-    'clanne',
-    'clannel',
-    'clanrickard',
-    'clansfolk',
-    'clanship',
-    'clant/neighbour',
-    'clanton',
     'clap-boarded',
-    'clap-happiness',
-    'clapalong',
-    'clapci',
-    'clapcott',
-    'clapgut',
-    'clapham-style',
-    'clapham-type',
-    'clapham/battersea',
-    'claphow',
-    'clapman',
-    'clappedout',
-    'clapper-boards',
-    'clapperbridge',
-    'clappison',
-    'clapt',
     'clapton-style',
-    'claptonesque',
-    'clar&iacute;n',
-    'clara.',
-    'claras',
-    'clarawood',
-    'claray',
-    'clarborough',
-    'claredon',
-    'claremorris',
-    'clarence-smith',
-    'clarencieux',
-    'clarendon:1961',
-    'clarendonian',
-    'claret-flavor',
-    'claret-loving',
     'claret-style',
-    'claridad',
-    'clariden',
-    'claridge/psycholgist',
-    'clarif',
-    'clarifi&rehy;cation',
-    'clarificatory',
-    'clarifiers',
-    'clarifying/explaining/informing',
-    'clarinet-like',
-    'clarinet.',
-    'clarino',
-    'clarion-call',
-    'clarionets',
-    'clarisan',
-    'clarissimae',
     'clarissimo',
-    'clarity.',
-    'clark(1984)',
-    'clark-kennedy',
-    'clark-mcneish',
-    'clark.',
-    'clark/chairman',
-    'clark/chairman/sunday',
-    'clark/gloucestershire',
-    'clark/hereford',
-    'clark/inventor',
-    'clark/pick-your-own',
-    'clark/wet',
-    'clarke-ish',
-    'clarke-jones',
-    'clarke-stewart',
     'clarke/altitude',
-    'clarke/anthony',
-    'clarke/army',
-    'clarke/arnhem',
-    'clarke/banbury',
-    'clarke/community',
-    'clarke/education',
-    'clarke/former',
-    'clarke/gloucestershire',
-    'clarke/gray/bremner',
-    'clarke/historian',
-    'clarke/hook',
-    'clarke/master',
-    'clarke/milton',
-    'clarke/nrpb',
-    'clarke/parent',
     'clarke/prison',
-    'clarke/retired',
-    'clarke/schools',
-    'clarke/sun',
-    'clarke/teacher',
-    'clarke/tenant',
-    'clarke/trustees',
-    'clarke/west',
-    'clarke/winner',
-    'clarkesburg',
-    'clarkess',
-    'clarketrade',
-    'clarkite',
-    'clarkminister',
-    'clarksburg',
-    'clarkson/crossroads',
     'clarkstown',
-    'clarksville',
-    'claros',
-    'clarosan',
-    'clarri',
-    'clarriher',
-    'clarriker',
-    'clars',
-    'clarte',
-    'clarvis',
-    'clarysly',
-    'clas',
-    'clasby',
-    'clasdir',
-    'clasen',
-    'clasen/parent',
     'clases',
-    'clash-version',
-    'clashbea',
-    'clashganiff',
-    'clashing/like',
-    'clasical',
-    'clasics',
-    'clasina',
-    'clasp-knife',
-    'claspable',
-    'class&mdash;in',
-    'class&rehy;conscious',
-    'class&rehy;consciousness',
-    'class&rehy;ridden',
-    'class&rehy;specific',
-    'class\'/labour',
     'class\'/party',
-    'class\'/politics',
-    'class\'/tory',
-    'class-100',
-    'class-ab',
-    'class-accents',
-    'class-against-class',
-    'class-and',
-    'class-b',
-    'class-blind',
-    'class-busting',
-    'class-categorization',
-    'class-centric',
-    'class-centrism',
-    'class-composition',
-    'class-conflict',
     'class-conscience',
-    'class-contact',
-    'class-d',
-    'class-dependent',
-    'class-determined',
-    'class-distinct',
-    'class-distinctive',
-    'class-division',
-    'class-divisions',
-    'class-dominated',
-    'class-enquiry',
-    'class-firster',
-    'class-free',
-    'class-hatred',
-    'class-historical',
-    'class-hopping',
     'class-labels',
-    'class-like',
-    'class-linked',
-    'class-manager',
-    'class-marks',
-    'class-parable',
-    'class-rational',
-    'class-ruled',
-    'class-run',
-    'class-society',
-    'class-structure',
-    'class-structured',
-    'class-teaching',
-    'class-time',
-    'class-use',
-    'class.consciousness',
     'class/background',
-    'class/collectivity/political',
-    'class/dominated',
-    'class/es/',
-    'class/flair',
-    'class/party',
-    'class/political',
-    'class/race',
-    'class/respond',
-    'class/skill',
-    'class/specialised',
-    'class/style',
-    'class/tory',
-    'class/type/subtype/name',
-    'class:car',
-    'classbooks',
     'classen',
-    'classes-in',
-    'classful',
-    'classfuls',
-    'classic\'',
-    'classic-winning',
-    'classic/early',
-    'classic/open',
-    'classica/linguistica',
-    'classicacl',
-    'classical-cum-shakespearian',
-    'classical-looking',
-    'classical-music',
-    'classical-renaissance',
-    'classical-renaissance-enlightenment',
-    'classical-rock',
     'classical-scholarly',
-    'classical-sounding',
-    'classical-statue',
-    'classical.',
-    'classical/gothic',
-    'classical/romantic',
-    'classicallly',
-    'classically-trained',
-    'classici',
-    'classicianus',
-    'classicistic',
-    'classicized',
-    'classico-romantic',
-    'classics-based',
-    'classics/de',
-    'classifactory',
     'classifcations',
-    'classifed',
-    'classifi',
-    'classific',
-    'classification124',
-    'classificator',
-    'classist',
-    'classix',
-    'classlessly',
-    'classness',
-    'classold',
-    'classroom&mdash',
-    'classroom-centred',
-    'classroom-orientated',
-    'classroom-oriented',
-    'classroom-rebel',
     'classroom-style',
-    'classroom-type',
-    'classroom.police',
-    'classroom/hall',
-    'classroom/issue',
-    'classrooms.',
-    'classwizard',
-    'classy-looking',
-    'clatch',
-    'clathrin',
-    'clatt',
-    'clatter-clatter-clatter',
-    'clatter-pop',
-    'clatterbrick',
-    'clauberg',
-    'clauda',
     'claudal',
-    'claude-adrien',
-    'claude-glass',
-    'claude-henri',
-    'claude-joseph',
-    'claude-monet',
-    'claude-nicolas',
-    'claudeian',
-    'claudet',
-    'claudien',
-    'claudii',
-    'claus-dieter',
-    'clause&mdash;if',
-    'clause&mdash;specific',
-    'clause&mdash;which',
-    'clause\'',
     'clause-by-clause',
-    'clause-initial',
-    'clause-to-clause',
-    'claused',
-    'clausentum',
-    'clauses.',
-    'clausesses',
-    'clausewitzian',
-    'clausit',
-    'clausius',
-    'clausius-clapeyron',
-    'clauss',
-    'claustralium',
-    'claustraphobic',
-    'claustrophilic',
-    'claustrophoberised',
     'claustrophobics',
-    'clausula',
-    'clausura',
-    'clavatum',
-    'clavatus',
-    'clavecins',
-    'claver',
-    'claverie',
-    'claverley',
-    'clavers.',
-    'claverse',
-    'clavet',
-    'clavicembalisticum',
-    'clavichordist',
-    'clavichords',
-    'clavicula',
     'clavie',
-    'clavier-&uuml;bung',
-    'clavijo',
-    'claviorganum',
-    'clavosporus',
-    'clavpes',
-    'clavulinopsis',
-    'claw-and-grip-tipped',
-    'claw-back',
-    'claw-backs',
-    'claw-bent',
-    'claw-clicking',
-    'claw-hammer',
-    'claw-legged',
-    'claw-prints',
-    'claw-proof',
     'claw-removal',
-    'claw-shaped',
-    'claw-sharpening',
-    'claw-that',
-    'claw-toed',
-    'clawfoot',
-    'clawhands',
-    'clawings',
-    'clawmarks',
-    'clawtrack',
-    'clawy',
-    'clay&rehy;wise',
-    'clay-',
-    'clay-cored',
-    'clay-court',
-    'clay-courter',
     'clay-crystal',
-    'clay-eating',
-    'clay-filled',
-    'clay-floored',
-    'clay-haired',
-    'clay-hardened',
-    'clay-lined',
-    'clay-lizard',
-    'clay-loving',
-    'clay-making',
-    'clay-mineral',
-    'clay-mining',
-    'clay-modelling',
-    'clay-pigeons',
-    'clay-pipe',
-    'clay-pipes',
     'clay-pit',
-    'clay-pot',
-    'clay-reddened',
-    'clay-sized',
-    'clay-sodden',
-    'clay-stiffened',
-    'clay-to-day',
-    'clay-type',
-    'clay-with-flints',
-    'clay-y',
-    'clay/calcite/silt',
-    'clay/loam',
-    'clay/organic',
-    'clay/silt',
-    'clay:rich',
-    'clayallee',
     'claybank',
-    'claybanker',
-    'claybourn',
-    'claycart',
-    'claycourter',
-    'clayderbuck',
-    'clayderman',
-    'clayed',
-    'clayey-lignite',
-    'clayey-sandstones',
-    'clayey-silts',
-    'clayhall',
-    'clayhill',
-    'claykickers',
-    'claypit',
-    'claypits',
     'claypots',
-    'claypotts',
-    'clays-sous-bois',
-    'clayton\'s',
-    'clayton-land',
-    'clayton-le-moors',
-    'clayton-stripe',
-    'claytonia',
-    'claytons',
-    'claywork',
-    'clayworkers',
-    'clazie',
-    'clazomenae',
-    'clcoholic',
-    'cle-',
-    'cleaage',
     'cleady',
-    'cleak',
-    'clean\'',
-    'clean-again',
-    'clean-boned',
-    'clean-break',
-    'clean-catch',
-    'clean-consciousness',
-    'clean-down',
-    'clean-edged',
-    'clean-fuel',
-    'clean-gas',
-    'clean-gleaming',
-    'clean-government',
-    'clean-healing',
-    'clean-it',
     'clean-mouthed',
-    'clean-nailed',
-    'clean-picked',
-    'clean-room',
-    'clean-sheeted',
-    'clean-sheets',
-    'clean-surface',
-    'clean-swept',
-    'clean-tasting',
-    'clean-up-the-mess',
-    'clean-water',
-    'clean-xxxx',
-    'clean/filthy',
-    'clean2.com',
-    'clean97',
-    'cleanable',
     'cleanacres',
-    'cleanazoom',
-    'cleaneasy',
-    'cleaned.',
-    'cleaner-breathing',
-    'cleaner-cut',
-    'cleaner-out',
-    'cleaner-up',
-    'cleaner/caretaker',
-    'cleaner/home',
-    'cleaner/polisher',
-    'cleanest-running',
-    'cleani',
-    'cleaniless',
-    'cleaning&rehy;rota',
-    'cleaning-aids',
     'cleaning-fluid',
-    'cleaning/catering',
-    'cleaning/disinfection',
-    'cleaning/replacement',
-    'cleanliness/hygiene',
-    'cleanly-painted',
-    'cleanly-structured',
-    'cleanorama',
-    'cleanroom',
-    'cleanse-tone-protect',
-    'cleanseal',
-    'cleanseth',
-    'cleansin\'',
-    'cleansiness',
-    'cleansing\'-strictly',
-    'cleansing-cream',
     'cleantex',
-    'cleanups',
-    'cleanzone',
-    'clear&gt',
-    'clear&mdash;and',
-    'clear&mdash;if',
-    'clear&rehy;ing',
-    'clear(c)',
-    'clear-\'k&auml;rtnerstrasse',
-    'clear-cutting',
-    'clear-definition',
-    'clear-eye',
-    'clear-finished',
-    'clear-fronted',
-    'clear-handled',
-    'clear-head',
     'clear-mindedly',
-    'clear-piped',
-    'clear-sightedly',
-    'clear-sky',
-    'clear-sufficient',
-    'clear-textured',
-    'clear-thinker',
-    'clear-tlot-tlot',
-    'clear-to-send',
-    'clear-vision',
-    'clear-washed',
-    'clear-water',
-    'clear-wing',
-    'clear-with',
-    'clear-you',
-    'clear.jesus',
     'clear/translucent',
-    'clear_a',
-    'clear_a_little',
-    'clearage',
-    'clearaid.exe',
-    'clearances.',
-    'clearcutting',
-    'cleard',
-    'clearences',
-    'clearer-case',
-    'clearest-cut',
-    'clearest-skinned',
-    'clearheadedness',
-    'cleari',
-    'clearie',
-    'clearin\'',
     'clearing&rehy;house',
-    'clearing-compounds',
-    'clearing-houses',
-    'clearing-system',
-    'clearings.',
-    'clearish',
-    'clearlink',
-    'clearly\'',
-    'clearly-focused',
-    'clearly-identified',
-    'clearly-marked',
-    'clearly-modifies',
-    'clearly-prescribed',
-    'clearly-presented',
-    'clearly-specified',
-    'clearly-understood',
     'clearly-written',
-    'clearly_no',
-    'clearmaster',
-    'clearmountain',
-    'clearpond',
-    'clearsighted',
-    'clearsightedness',
-    'clearup',
-    'clearvision',
-    'clearvoyance',
-    'clearwing',
-    'cleary/mounted',
-    'cleary/thames',
-    'cleavable',
-    'cleavage-revealing',
-    'cleavage-stage',
     'cleavage-transection',
-    'cleave/henry',
-    'cleave/owner',
-    'cleaver/ap',
-    'cled',
-    'cledford',
-    'cleep',
-    'clees',
-    'cleese-type',
-    'cleethorpe',
-    'cleeton',
-    'cleetraval',
-    'cleft-tailed',
-    'clefted',
-    'clegg/bonsai',
-    'clegg/dorothy',
     'clegg/exhibition',
-    'clegg/exhibitor',
-    'cleithan',
-    'clelands',
-    'clellan',
-    'clellands',
-    'clematis-bower',
-    'clematis-clad',
-    'clembuterol',
-    'clemen&ccedil;eau',
-    'clemendy',
-    'clement-evans',
-    'clementhorpe',
-    'clementina.',
-    'clements/buyers',
-    'clements/patient',
     'clements/protestor',
-    'clements/tm',
-    'clementson',
-    'clemet',
-    'clemetis',
-    'clemitson',
-    'clemmensen',
-    'clemment',
-    'clemmet',
-    'clemmie',
-    'clemmons',
-    'clemmow',
-    'clemmy',
-    'clemow',
-    'clenaghan',
-    'clenched-teeth',
     'clenched-to-cracking',
-    'clenched_together',
-    'clencher',
-    'clenching.',
-    'clencing',
-    'clene',
-    'cleneth',
-    'clennett',
-    'clentibret',
-    'cleobaea',
-    'cleodemus',
-    'cleomedes',
-    'cleophas',
-    'clephan',
-    'clepht',
-    'cler&rehy;kenwell',
     'clerc/clers',
-    'clerestoried',
-    'clerestories',
-    'clerfayt',
-    'clergerie',
-    'clergue',
-    'clergyman-poet',
-    'cleric-civil',
-    'clerical-dominated',
-    'clerical-looking',
-    'clerical-religious',
-    'clerical/',
-    'clerical/admin',
-    'clerical/sales/i.t',
-    'clericalized',
-    'clericus',
     'clerisseau',
-    'clerk-assistant',
-    'clerk-cum-clerk',
-    'clerk-cum-what-have-you',
-    'clerk-douglas',
-    'clerk-in-charge',
-    'clerk-level',
-    'clerk-receptionist',
-    'clerkenwall',
-    'clerkesses',
-    'clerkin\'',
-    'clerkington',
-    'clerodendrum',
-    'clers',
-    'cleruchiea',
-    'cleruchs',
     'clerum',
-    'clervals',
-    'cles',
-    'cless',
-    'clett',
-    'clettering',
-    'clettraval',
-    'clev',
-    'clevegate',
-    'cleveland-durham',
-    'cleveland/middlesbrough',
-    'clevelandbased',
-    'clevelend',
-    'cleveleys&ndash;clifton',
-    'clevelys',
-    'clever-dick',
     'clever-dick-nick',
-    'clever-gits',
-    'clever-looking',
-    'clever-quick',
-    'cleverist',
-    'cleverly-devised',
-    'cleverly-disguised',
-    'cleverly-titled',
-    'cleverly-worded',
-    'clevernesses',
-    'cleveurr',
-    'clewiston',
-    'cleworth',
-    'cleyburg',
-    'cleyhemsugworth',
-    'cleyndert',
     'cliamh',
-    'cliath',
-    'clibbig',
-    'clic-sponsored',
-    'clich&eacute\'',
-    'clich&eacute;-ing',
-    'clich&eacute;-style',
-    'clich&eacute;ed',
-    'cliche\'',
-    'cliche-lancing',
-    'cliche-riddled',
-    'cliche/1',
-    'clichs',
-    'click-and-point',
-    'click-click-clack',
-    'click-click-click',
     'click-clicked',
-    'click-like',
-    'click-lock',
-    'click-touch',
-    'click-whirr',
-    'click.6',
-    'clickamin',
-    'clickers',
-    'clicket',
-    'clicketty-click',
-    'clickety',
-    'clickhimin',
-    'clickimin',
-    'clickimmin',
-    'clicking.but',
-    'clico',
     'clicottee',
-    'clicquot-ponsardin',
-    'clicquot-ponsardine',
-    'clie',
-    'clien',
-    'client&lowbar;conveyancer',
-    'client&mdash;head',
-    'client\'',
-    'client-',
-    'client-attorney',
-    'client-body',
-    'client-borrower',
-    'client-bureaucracy',
-    'client-buyer.',
-    'client-confidentiality',
-    'client-country',
     'client-dependent',
-    'client-design',
-    'client-families',
-    'client-friendly',
-    'client-group',
-    'client-led',
-    'client-level',
-    'client-need',
-    'client-only',
-    'client-prince',
-    'client-seller',
-    'client-servers',
-    'client-situation',
-    'client-subjects',
-    'client-to-host',
-    'client-turned-practitioner',
     'client-user',
-    'client/agency',
-    'client/and',
-    'client/contractor',
-    'client/helper',
-    'client/open',
-    'client/server-based',
-    'client/sever',
-    'client/subject',
-    'client/unix',
-    'clientages',
-    'clientcentred',
-    'clientel',
-    'clientelist-based',
-    'clientfilebuild',
-    'clienthood',
     'clienthowever',
-    'clientilist',
-    'clientist',
-    'clients&mdash;as',
-    'clients-france',
-    'clients-to-be',
-    'clients-turned-volunteers',
-    'clients/customers',
-    'clients/policyholders',
-    'clientships',
-    'clientspeak',
-    'cliff&rehy;top',
-    'cliff-',
-    'cliff-arch',
-    'cliff-breeders',
-    'cliff-dwelling',
     'cliff-edged',
-    'cliff-fall',
-    'cliff-jumping',
-    'cliff-slopes',
-    'cliff-top.',
-    'cliff-wall',
-    'cliff-walls',
-    'cliffcaves',
-    'cliffden',
-    'cliffhangers',
-    'clifford-like',
-    'clifford/alison',
-    'clifford/gloucestershire',
-    'clifford/horse',
-    'clifford/pilot',
-    'cliffortanianus',
     'cliffortianus',
-    'cliffscapes',
-    'clifton-mogg',
-    'clifton/organiser',
-    'cliftonettes',
-    'cliftonhall',
-    'clifts',
-    'clignet',
-    'clii',
-    'cliical',
-    'cliii',
-    'clilff',
-    'clim',
-    'clim-bed',
-    'clima',
-    'climacteris',
     'climactichnites',
-    'climat',
-    'climate-control',
-    'climate-driven',
-    'climate-modeller',
-    'climate-related',
-    'climate-relevant',
-    'climate-responsive',
-    'climate.when',
-    'climatephotographs',
-    'climatic-inspired',
-    'climatically-favoured',
-    'climatized',
-    'climato-genetic',
-    'climato-morphogenetic',
-    'climatogenetic',
     'climatologically',
-    'climatotherapy',
-    'climb-downs',
-    'climb-possibly',
-    'climb.',
-    'climbe',
-    'climbed_out',
-    'climber-covered',
-    'climber-pruning',
-    'climber-turned-platform-builder',
-    'climber/dangler',
-    'climbers.',
-    'climbing-boy',
-    'climbing-down',
-    'climbing-frame',
-    'climbing-frames',
     'climbing-rose',
-    'climbing-village',
-    'climbing/swimming',
-    'climbing_in_connection',
-    'climbout',
-    'climbs.',
-    'climie',
-    'climsy',
-    'clinch-perfect',
-    'clinch/motorcycle',
-    'cling-filmed',
-    'cling-ons',
-    'cling-silk',
-    'clingeth',
-    'clingfilms',
-    'clingfire',
     'clingier',
-    'clinging-on-to-the',
-    'clinging-onto',
-    'clinging-to-the-van-sides',
-    'clingingly',
-    'clingingness',
-    'clingsuits',
-    'clingwrap',
-    'clinhed',
-    'clinial',
-    'clinic\'',
-    'clinic-based',
-    'clinic-operating',
-    'clinic-referred',
-    'clinic/colonoscopy',
-    'clinic/toddler',
     'clinica',
-    'clinical\'',
-    'clinical-looking',
-    'clinical-pathological',
-    'clinical/holistic',
-    'clinical/medical-type',
-    'clinically-based',
-    'clinically-executed',
-    'clinically-minded',
-    'clinician-management',
-    'clinician/management',
-    'clinico-pathological',
-    'clinics.',
-    'clink\'-ed',
-    'clink-clanking',
-    'clink-clink-clink',
     'clink-clink-clinking',
-    'clink-clonk',
-    'clink.',
-    'clinker-built',
-    'clinker-hulled',
-    'clinkering',
-    'clinks',
-    'clinkscale',
-    'clino-',
-    'clinoptilolites',
-    'clinopyroxenes',
-    'clinord',
-    'clint-and-gryke',
-    'clint-like',
-    'clintlike',
-    'clinto',
     'clintoch',
-    'clintom',
-    'clinton&rehy;like',
-    'clinton-al',
-    'clinton-brown',
-    'clinton-christopher',
-    'clinton-davis',
-    'clinton-land',
-    'clinton-yeltsin',
-    'clinton/gore',
-    'clintonisation',
-    'clintonless',
-    'clintonomics',
-    'clio.',
-    'cliocquot-ponsardin\'',
-    'clione',
     'clioquinol',
-    'clip-7',
-    'clip-around-the-nose',
-    'clip-arsed',
-    'clip-clipping',
-    'clip-clopped',
-    'clip-clopping',
-    'clip-in',
-    'clip-ons',
-    'clip-out',
-    'clip-thunk',
-    'clip-together',
-    'clip.4',
-    'clipe',
-    'clipjoint',
-    'clippard',
     'clipped-haired',
-    'clipped-off',
-    'clipped-on',
-    'clipped-toned',
-    'clipped-voiced',
-    'clippens',
-    'clipper-based',
-    'clipper-equipped',
-    'clippy',
-    'clipstore',
-    'cliquish',
-    'cliquy',
-    'clish',
-    'clisham',
-    'clispa',
-    'clissett',
     'clitherow',
-    'clitoridectomies',
-    'clitorises',
-    'clittisford',
-    'cliv',
-    'clives',
-    'clk',
-    'clmspols',
-    'clo.',
-    'cloacas',
-    'cload',
-    'cloak-',
-    'cloak-like',
-    'cloak-shrouded',
-    'cloak-twitchers',
-    'cloakroom/',
     'cloaths',
-    'cloave',
-    'clocca',
-    'cloch',
-    'clochard',
-    'clochemerle',
-    'clocher-calvaire',
-    'clocher-porche',
-    'clochered',
-    'clock\'',
-    'clock-a-block',
-    'clock-beating',
-    'clock-crowned',
-    'clock-it',
-    'clock-makers',
-    'clock-operated',
     'clock-shaped',
-    'clock-speed',
-    'clock-thieves',
-    'clock-to-output',
-    'clock-towered',
-    'clock-tripled',
-    'clock-tripler',
-    'clock-tripling',
-    'clock-type',
-    'clock-watcher',
-    'clock.',
-    'clock.exe',
-    'clock/alarm',
-    'clock/radio',
-    'clock/radio/alarm',
-    'clock/radios',
     'clock/stopwatch',
-    'clocker',
-    'clockhands',
-    'clocking-on',
-    'clockings',
-    'clockish',
-    'clockmaster',
-    'clocks.',
-    'clocksin-moore',
-    'clocksmiths',
-    'clockwatching',
-    'clockwise-rotating',
-    'clockwork-like',
-    'clockworklike',
-    'cloclough',
-    'clod-footed',
     'clod-hoppers',
-    'clod/',
-    'clodgy',
-    'clodhopped',
-    'clodhoppingly',
-    'clodoaldo',
-    'cloete',
-    'clofazamine',
-    'clofibrate',
-    'clog-maker',
-    'clog-repair',
-    'cloggable',
-    'cloggers',
-    'cloggies',
-    'cloggs',
-    'cloghesy',
     'cloghie',
-    'cloghmills',
-    'clogmaker',
-    'clogthorpe',
-    'clogtown',
-    'cloiche-muilinn',
-    'cloisonnist',
-    'cloister-like',
-    'cloister-pump',
-    'clombe',
-    'clomid',
-    'clompingly',
-    'clonagh',
-    'clonahoe',
-    'clonakilty',
-    'clonalities',
     'clonatec',
-    'clonazepam',
-    'clondalkin',
-    'clone&mdash;so',
-    'clone-clone',
-    'clone-forming',
-    'clone-length',
-    'clone-makers',
-    'clone-mates',
-    'clone-probe',
-    'cloned.',
-    'cloneen',
-    'clonemaker',
-    'clonetics',
-    'clonfert',
-    'clong',
     'clongeel',
-    'clongoes',
-    'clonin',
-    'cloninger',
-    'clonked',
-    'clonky',
-    'clonmain',
-    'clont',
-    'clontibret',
-    'cloob',
-    'cloonacool',
-    'cloothes',
-    'clooties',
-    'clop-clopping',
-    'clops',
-    'clopton',
     'clopyralid',
-    'cloran',
-    'cloret',
-    'clorets',
-    'cloroform',
-    'closbetason',
-    'close&rehy;fitting',
-    'close&rehy;grained',
-    'close\'',
-    'close-',
-    'close-at-hand',
-    'close-attack',
-    'close-branched',
-    'close-built',
-    'close-caged',
-    'close-clipped',
     'close-combat',
-    'close-cropping',
-    'close-dated',
-    'close-drawn',
-    'close-fastened',
-    'close-fit',
-    'close-furled',
-    'close-growing',
-    'close-kept',
-    'close-link',
-    'close-meshed',
-    'close-migrating',
-    'close-miking',
-    'close-mown',
-    'close-of-poll',
-    'close-on',
     'close-passing',
-    'close-pearled',
-    'close-planted',
-    'close-position',
-    'close-pressed',
-    'close-rings',
-    'close-shaves',
-    'close-shots',
-    'close-shutting',
-    'close-studded',
-    'close-studding',
-    'close-support',
-    'close-to-market',
-    'close-to-the-line',
-    'close-to-the-vest',
-    'close-tolerance',
     'close-upfalling',
-    'close-valued',
-    'close-wound',
-    'close-woven',
-    'close.by',
-    'close.run',
-    'close/charmat',
-    'close/thames',
-    'closed-',
-    'closed-access',
-    'closed-boundary',
-    'closed-centre',
-    'closed-chest',
-    'closed-circuit-tv-monitored',
-    'closed-circular',
-    'closed-cycle',
     'closed-eyed',
-    'closed-group',
-    'closed-string',
-    'closed-system',
-    'closed-world',
-    'closed-worlder',
-    'closed-worlders',
-    'closed-xxxx',
-    'closefitting',
-    'closehauled',
-    'closein',
-    'closely&mdash;do',
-    'closely-aligned',
-    'closely-allied',
-    'closely-analyzed',
-    'closely-carpeted',
     'closely-defined',
-    'closely-felted',
-    'closely-interwoven',
-    'closely-planted',
-    'closely-prescribed',
-    'closely-reasoned',
-    'closely-set',
-    'closely-similar',
-    'closely-spaces',
-    'closely-typed',
-    'closely-worked',
-    'closely_into_line',
-    'closemouth',
-    'closenesses',
-    'closening',
-    'closepacked',
     'closer-grained',
-    'closer-than-expected',
-    'closest-fought',
-    'closestudded',
-    'closet-free',
-    'closet-reformists',
-    'closeting',
-    'closetload',
-    'closetting',
-    'closeure',
-    'closey',
-    'closin',
-    'closing-time.',
-    'closkelt',
-    'closky',
-    'closley',
     'closness',
-    'closs',
-    'clossies',
-    'clostridia',
-    'closures.',
-    'clot-associated',
-    'clot-bey',
-    'clot-busting',
-    'clot.',
-    'cloten',
-    'clotes',
-    'clotfelter',
-    'cloth-cutter',
-    'cloth-draped',
-    'cloth-dressers',
-    'cloth-finisher',
     'cloth-finishing',
-    'cloth-lined',
-    'cloth-of-gold',
-    'cloth-of-silver',
-    'cloth-padded',
-    'cloth-producing',
-    'cloth-shop',
-    'cloth-stall',
-    'cloth-tearing',
-    'cloth-weaving',
-    'cloth-working',
-    'cloth-yard',
-    'cloth/mop',
-    'clothbound',
-    'clothcapped',
-    'clotherholme',
     'clothes&rehy;line',
-    'clothes\'-prop',
-    'clothes-',
-    'clothes-buying',
-    'clothes-chests',
-    'clothes-hooks',
-    'clothes-lining',
-    'clothes-making',
-    'clothes-manufacturing',
-    'clothes-pins',
-    'clothes-prop',
-    'clothes-sense',
-    'clothes-shops',
-    'clothes-speak',
-    'clothes-styles',
-    'clothes-switch',
     'clothes-talk',
-    'clothes-thick',
-    'clothes/paint/draw',
-    'clothes_and_so',
-    'clothes_as',
-    'clothesaholic',
-    'clothesbrush',
-    'clotheshorse',
-    'clotheslines',
-    'clothesrail',
-    'clothesshop',
-    'clotheswise',
-    'clothfolding',
-    'clothier/abingdon',
-    'clothies',
-    'clothin\'',
     'clothing-hire',
-    'clothing-manufacturer',
-    'clothing-manufacturers',
-    'clothing.she',
-    'clothing/decent',
-    'clothings',
-    'clothmakers',
-    'clothsful',
-    'clothyard',
-    'clotpoll',
-    'clotrimazole',
-    'clottery',
-    'cloucestershire',
-    'cloud&rehy;capped',
-    'cloud-bank',
-    'cloud-buffering',
     'cloud-canals',
-    'cloud-dappled',
-    'cloud-flecked',
-    'cloud-forest',
-    'cloud-forms',
-    'cloud-front',
-    'cloud-futures',
-    'cloud-hidden',
-    'cloud-making',
-    'cloud-mountain',
-    'cloud-of&rehy;dust',
-    'cloud-pale',
-    'cloud-piercer',
-    'cloud-piercing',
-    'cloud-punctuated',
-    'cloud-rack',
     'cloud-reflecting',
-    'cloud-resting',
-    'cloud-shape',
-    'cloud-shrouded',
-    'cloud-soft',
-    'cloud-spattered',
-    'cloud-stained',
-    'cloud-streaked',
-    'cloud-tops',
-    'cloud-torn',
-    'cloud-walkers',
-    'cloud-wreaths',
-    'cloud.of',
-    'cloud/that',
-    'cloudbelt',
-    'cloudboy',
     'cloudesley',
-    'cloudfall',
-    'cloudflakes',
-    'cloudinids',
-    'cloudland',
-    'cloudlet',
-    'cloudscapes',
-    'cloudship',
-    'clough-leeds',
-    'clough-like',
-    'clough-parker',
-    'clough-style',
-    'clough/armfield/stein/adamson',
-    'clough/taylor',
-    'clough/transport',
-    'cloughfield',
     'cloughies',
-    'cloughmills-coleraine-kilrea',
-    'cloughtaney',
-    'cloured',
-    'clouse',
-    'clouseau-class',
-    'clout.',
-    'clouth',
-    'clove-pink',
-    'clove-scented',
-    'clovellyan',
-    'cloven-hooved',
-    'clover-hay',
-    'cloverleaves',
-    'clowdisley',
-    'clowdy',
     'clown-chasing',
-    'clown-scenes',
-    'clown-size',
-    'clown-white',
-    'clown.',
-    'clownabout',
-    'clowne',
-    'clownesque',
-    'clowney',
-    'clownfishes',
-    'clownlike',
-    'cloxam',
-    'cloyce',
-    'cloyness',
-    'cloys',
-    'cloyster',
     'cloysters',
-    'clrtap',
-    'clsa',
-    'clsuters',
-    'club&rehy;except',
-    'club\'',
-    'club\'s/ground',
-    'club\'sfall',
-    'club(s)',
-    'club-bearers',
-    'club-call',
-    'club-carrier',
-    'club-centred',
-    'club-class',
-    'club-clutching',
-    'club-crossover',
     'club-cum-business',
-    'club-cum-recording',
-    'club-face',
-    'club-footed',
-    'club-friendly',
-    'club-goers',
-    'club-goings',
-    'club-handlers',
-    'club-ing',
-    'club-land',
-    'club-mascot',
-    'club-night',
-    'club-organised',
-    'club-orientated',
-    'club-oriented',
-    'club-owner/mafia',
     'club-owners',
-    'club-pop',
-    'club-runners',
-    'club-stick',
-    'club-swinging',
-    'club-tail',
-    'club-testing',
-    'club-they',
-    'club-turns',
-    'club-v-country',
-    'club-viable',
-    'club-wielders',
-    'club-wielding',
-    'club.perfect',
-    'club/american',
-    'club/association',
     'club/dance',
-    'club/disco',
-    'club/dub',
-    'club/my',
-    'club/restaurant',
-    'club/workshop',
-    'clubb',
-    'clubber/good',
-    'clubbiness',
-    'clubby/tribey',
-    'clubdom',
-    'clubfaces',
-    'clubfooted',
-    'clubgoer',
-    'clubhead-feel',
-    'clubhouses',
     'clubionidae',
-    'clublengths',
-    'clubless',
-    'clubley',
-    'clubline',
-    'clubmakers',
-    'clubmaking',
-    'clubroot-infected',
-    'clubs.',
-    'clubs/4',
-    'clubs/players',
-    'clubs/societies',
-    'clubs/unions',
-    'clubscene',
-    'clubsters',
-    'clubwise',
     'clubzine',
-    'cluckheaded',
-    'clucky',
-    'clude',
-    'cludge',
-    'clue-hunting',
-    'clue.',
-    'cluedopolybats',
-    'clues-citations',
-    'clues.',
-    'clug',
-    'clugson',
-    'clugston',
-    'clujnapoca',
-    'clukas',
-    'cluley',
     'clum',
-    'clumbs',
-    'clumpering',
-    'clumpier',
-    'clumsy-looking',
-    'clumsy-sounding',
-    'clunie',
-    'cluniemore',
-    'clunk-click',
-    'clunk-click-mumble',
-    'clunk-clicking',
-    'clunk-thunk',
-    'clunt',
-    'cluppins',
-    'clurican',
-    'cluricaun',
     'cluricauns',
-    'clurman',
-    'clusaz',
-    'clustal',
-    'clustalv',
-    'cluster-bomb',
-    'cluster-flowering',
-    'cluster-sized',
-    'cluster-to-cluster',
-    'clustered.',
-    'clustring',
-    'clut-napoca',
-    'clutch-bag',
-    'clutch/pressure',
-    'clutchbag',
-    'clutchwork',
     'clutha',
-    'cluthas',
-    'cluther',
-    'cluthing',
-    'clutter-clutter',
-    'clutter-free',
-    'clutterbrook',
-    'clutterbuck/chief',
-    'cluttery',
-    'cluysenaar',
-    'cluytia',
-    'clviii',
-    'clwyd-based',
-    'clwyd-powys',
-    'clwyd/shropshire',
-    'clwyedog',
     'clwyn',
-    'clxiii',
-    'clxxix',
-    'clxxx',
-    'clxxxix',
-    'clxxxv',
-    'clybourn',
-    'clydbeank',
-    'clyde-based',
-    'clyde-forth',
-    'clyde.',
-    'clyde/mossend',
-    'clydebank-based',
-    'clydebank.',
-    'clydebridge',
-    'clydesale',
     'clydesdale-type',
-    'clydeshore',
-    'clydesider',
-    'clydeview',
-    'clydewell',
-    'clydogan',
-    'clydogau',
-    'clymbande',
-    'clymen',
-    'clymeniid',
-    'clymenshore',
-    'clymer',
-    'clynched',
-    'clynderwen',
-    'clyndwr',
-    'clype',
     'clypeogenal',
-    'clypeolabral',
-    'clyppan',
-    'clyster-pipe',
-    'clyth',
-    'clytha',
-    'clyve',
-    'clywyd',
-    'cm&amp;sup2',
-    'cm&times;1.3',
-    'cm&times;10',
-    'cm&times;20cm',
-    'cm-1',
-    'cm-1.5',
-    'cm-1.80',
-    'cm-10',
     'cm-120',
-    'cm-240',
-    'cm-3',
-    'cm-335',
-    'cm-5s',
-    'cm-high',
-    'cm-long',
-    'cm-scale',
-    'cm.91',
-    'cm/',
-    'cm/&frac12',
-    'cm/1',
-    'cm/13',
-    'cm/30',
-    'cm/8',
-    'cm/aw',
     'cm15',
-    'cm23',
-    'cm500',
-    'cm7',
-    'cma/20',
-    'cma/micro',
-    'cmaj',
-    'cmbor',
-    'cmbr-activated',
-    'cmd.1',
-    'cmd.9889',
-    'cmdr.',
-    'cmdre',
-    'cmdt',
-    'cme-linked',
-    'cmg.',
     'cmhera',
-    'cmip/cmis',
-    'cmip/x.700',
-    'cmis',
-    'cmkyr',
-    'cml\'s',
-    'cmmd',
-    'cmmdr',
-    'cmmunication',
-    'cmn7',
-    'cmnd.1',
-    'cmnd.1432',
-    'cmnd.8273',
-    'cmnd.8494',
-    'cmome',
-    'cmos-backing',
     'cmos-erasable',
-    'cmost',
-    'cmot',
-    'cmp',
-    'cms/data',
-    'cmt10',
-    'cmte',
-    'cmtte',
-    'cmv-&bgr;-gal',
-    'cmwater',
-    'cmwbran',
-    'cmws',
-    'cmyb',
-    'cmz',
-    'cn-1000',
-    'cn-235',
     'cna\'t',
-    'cnaa-directed',
-    'cnaa-funded',
-    'cnaa-institution',
-    'cnaa-institutions',
-    'cnaa-ncdad',
-    'cnaa-university',
-    'cnaa/scotvec',
-    'cnaa/tec',
-    'cnac',
-    'cnae',
-    'cnaeus',
-    'cnas',
-    'cnbc-tv',
-    'cnca',
-    'cnd&rehy;supporting',
     'cnd-leaning',
-    'cnd.',
-    'cnen',
-    'cnf',
-    'cnit',
-    'cnn/',
-    'cnn/usa',
-    'cnodhonna',
-    'cnoke',
-    'cnooc',
-    'cnpp',
-    'cnpq',
-    'cnpz',
-    'cnqx',
-    'cnrg',
-    'cnsnc',
     'cnsnet',
-    'cnstant',
-    'cnt-dominated',
-    'cnt-inspired',
-    'cntg',
-    'cnvt',
-    'co&mdash;decision',
-    'co&mdash;operating',
-    'co&ndash;co',
-    'co&ndash;lld',
-    'co&ndash;opted',
-    'co&rehy;consultant',
-    'co&rehy;consultants',
-    'co&rehy;crystallize',
-    'co&rehy;interpret',
-    'co&rehy;operative',
     'co&rehy;parcenor',
-    'co&rehy;present',
-    'co&rehy;produced',
-    'co&rehy;rich',
-    'co&rehy;terminosity',
-    'co&rehy;villagers',
-    'co&rehy;worker',
-    'co&sacute',
-    'co&ucirc;ts',
-    'co\'s.',
-    'co\'way',
-    'co(g)',
-    'co+2h',
-    'co-acting',
-    'co-activators',
-    'co-active',
     'co-actors',
-    'co-adaption',
-    'co-adaptors',
-    'co-agent',
-    'co-amplification',
-    'co-an',
-    'co-anchors',
-    'co-architects',
-    'co-articulation',
-    'co-articulatory',
-    'co-artists',
-    'co-backed',
-    'co-boss',
-    'co-branded',
-    'co-brokers',
-    'co-caine',
     'co-called',
-    'co-captain',
-    'co-centre',
-    'co-ch',
-    'co-ch.',
-    'co-chairmanship',
-    'co-chairperson',
-    'co-channel',
-    'co-chromatographed',
-    'co-citations',
-    'co-climber',
-    'co-coach',
-    'co-cola',
-    'co-commentator',
-    'co-composed',
-    'co-conspirators',
     'co-constituent',
-    'co-constituents',
-    'co-counsellors',
-    'co-created',
-    'co-creator',
-    'co-creators',
-    'co-crystal',
-    'co-crystallization',
-    'co-curricular',
-    'co-debtors',
-    'co-defendent',
-    'co-dependents',
-    'co-derived',
-    'co-development/co-marketing',
-    'co-direction',
-    'co-directorship',
     'co-discoverers',
-    'co-disposal',
-    'co-dominance',
-    'co-drivers',
-    'co-driving',
-    'co-editors',
-    'co-eds',
-    'co-elutes',
-    'co-emperor',
-    'co-employees',
-    'co-ential',
-    'co-enzyne',
-    'co-eo',
-    'co-ep',
-    'co-erced',
-    'co-established',
     'co-evolutionary',
-    'co-executor',
-    'co-facilitating',
-    'co-facilitator',
-    'co-farmer',
-    'co-favourite',
-    'co-favourites',
-    'co-finance',
-    'co-fired',
-    'co-foundations',
-    'co-fraternal',
-    'co-function',
-    'co-funds',
-    'co-generation',
-    'co-grantee',
-    'co-guardian',
     'co-h',
-    'co-habitate',
-    'co-habitees',
-    'co-habits',
-    'co-headed',
-    'co-hearse',
-    'co-hewlett-packard',
-    'co-hosting',
-    'co-identified',
-    'co-immunoprecipitated',
-    'co-immunoprecipitation',
-    'co-imperial',
-    'co-incident',
-    'co-incides',
-    'co-inciding',
-    'co-inheritance',
     'co-injection',
-    'co-inside',
-    'co-instructor',
-    'co-itinerant',
-    'co-joined',
-    'co-labourer',
-    'co-lateral',
-    'co-leads',
-    'co-learners',
-    'co-legislates',
-    'co-legislating',
-    'co-librettist',
-    'co-ligation',
-    'co-linearity',
-    'co-localization',
-    'co-localizes',
     'co-made',
-    'co-man',
-    'co-managed',
-    'co-management',
-    'co-mc',
-    'co-members',
-    'co-migrated',
-    'co-migrates',
-    'co-migrating',
-    'co-mingle',
-    'co-mingling',
-    'co-morbidity',
-    'co-morons',
-    'co-motion',
-    'co-ni-as',
-    'co-o-o-ld',
     'co-observation',
-    'co-observers',
-    'co-occurred',
-    'co-occurs',
-    'co-odinator',
-    'co-op&eacute;ratives',
-    'co-operation\'',
-    'co-operation.gone',
-    'co-operation/and',
-    'co-opetition',
-    'co-optee',
-    'co-optition',
-    'co-ord.',
-    'co-ordinator/economic',
-    'co-ordinator/national',
-    'co-ordinator/yvonne',
     'co-organizer',
-    'co-oximeter',
-    'co-parent',
-    'co-parental',
-    'co-parented',
-    'co-participants',
-    'co-partnership',
-    'co-pastor',
-    'co-payments',
-    'co-pilot-was',
-    'co-pilot/instructor',
-    'co-pioneer',
-    'co-plaintiffs',
-    'co-playwright',
-    'co-ploughing',
-    'co-poisoning',
     'co-politicians',
-    'co-possession',
-    'co-postmaster-general',
-    'co-precipitate',
-    'co-presence',
-    'co-presentation',
-    'co-presenting',
-    'co-presents',
-    'co-presidency',
-    'co-processing',
-    'co-processor.the',
-    'co-producers',
-    'co-professor',
-    'co-programmed',
-    'co-proxamol',
-    'co-publishing',
     'co-purification',
-    'co-purified',
-    'co-ran',
-    'co-rappers',
-    'co-receiver-general',
-    'co-receptor',
-    'co-referentiality',
-    'co-refers',
-    'co-regencies',
-    'co-regent',
-    'co-relate',
-    'co-relation',
-    'co-relationship',
-    'co-representative',
-    'co-represented',
-    'co-researcher',
     'co-researchers',
-    'co-researching',
-    'co-resided',
-    'co-residency',
-    'co-residential',
-    'co-resister',
-    'co-respondent&mdash;bogus',
-    'co-respondent&mdash;when',
-    'co-rider',
-    'co-rotate',
-    'co-running',
-    'co-scripted',
-    'co-scriptwriter',
-    'co-scriptwriting',
-    'co-segregate',
-    'co-seigneurie',
     'co-sign',
-    'co-signee',
-    'co-singer',
-    'co-skippered',
-    'co-skippers',
-    'co-sourcing',
-    'co-sovereignty',
-    'co-sponsorship',
-    'co-starts',
-    'co-striker',
-    'co-substrate',
-    'co-sun',
-    'co-surety',
-    'co-surfactant',
-    'co-teaching',
-    'co-terminous.',
     'co-terrestrials',
-    'co-therapists',
-    'co-thinker',
-    'co-trainer',
-    'co-traitors',
-    'co-transfecting',
-    'co-transfections',
-    'co-transformation',
-    'co-translators',
-    'co-transporter',
-    'co-transporter.',
-    'co-treasurer-at-wars',
-    'co-twins',
-    'co-variant',
-    'co-venture',
-    'co-ventures',
     'co-villager',
-    'co-villagers',
-    'co-vocalist',
-    'co-work',
-    'co-worshippers',
-    'co-writer/arranger',
-    'co-xxxx',
-    'co.al',
-    'co.antrim',
-    'co.litt.',
-    'co/',
-    'co10',
-    'co16',
-    'co2,10%',
-    'co2-buffered',
-    'co2/energy',
     'co=op',
-    'coaccused',
-    'coach&rehy;style',
-    'coach-',
-    'coach-bodies',
-    'coach-builder',
-    'coach-cum-manager-cum-union',
-    'coach-in',
-    'coach-lamps',
-    'coach-lantern',
-    'coach-lengths',
-    'coach-loads',
-    'coach-maker',
-    'coach-mang',
-    'coach-painter',
-    'coach-parties',
     'coach-self',
-    'coach-shed',
-    'coach-tour',
-    'coach-traffic',
-    'coach-trippers',
-    'coach/boyfriend',
-    'coach/camping',
-    'coach/hoverspeed/coach',
-    'coach/manager/guru',
-    'coach/martial',
-    'coach/player',
-    'coach/school',
-    'coachcraft',
-    'coaches-come-locomotives',
-    'coachford',
-    'coaching-aid',
     'coaching-inn',
-    'coaching-inns',
-    'coaching/development',
-    'coachlamps',
-    'coachliners',
-    'coachmaker',
-    'coachride',
-    'coachwarming',
-    'coachwhip',
-    'coactive',
-    'coad/yourdon',
-    'coadjutors',
-    'coadministered',
-    'coads',
-    'coaffee',
-    'coaggregation',
     'coagonist',
-    'coagulase',
-    'coagulation/flocculation',
-    'coagulations',
-    'coagulum',
-    'coahoma',
-    'coak-a-leekie',
-    'coaker',
-    'coal&rehy;barges',
-    'coal&rehy;cost',
-    'coal&rehy;generated',
-    'coal&rehy;producing',
-    'coal-',
-    'coal-and',
-    'coal-bag',
-    'coal-biters',
     'coal-bunkers',
-    'coal-burner',
-    'coal-carrier',
-    'coal-carts',
-    'coal-cutters',
-    'coal-dark',
-    'coal-efficient',
-    'coal-export',
-    'coal-eyed',
-    'coal-faces',
-    'coal-gasification',
-    'coal-hard',
-    'coal-hauling',
-    'coal-hewing',
-    'coal-hunk-peter',
-    'coal-man',
     'coal-merchant',
-    'coal-meter',
-    'coal-oil',
-    'coal-opolis',
-    'coal-pitted',
-    'coal-price',
-    'coal-red',
-    'coal-scar',
-    'coal-seam',
-    'coal-searcher',
-    'coal-selling',
-    'coal-shafts',
-    'coal-shales.',
-    'coal-sheds',
-    'coal-sidings',
-    'coal-smoke',
     'coal-smuts',
-    'coal-store',
-    'coal-tip',
-    'coal-town',
-    'coal-wharf',
-    'coal-whippers',
-    'coal-winning',
-    'coal-workers',
-    'coal/gas',
-    'coal1,230',
-    'coal_out',
-    'coalbin',
-    'coalchief',
-    'coalcorp',
-    'coaler',
-    'coalesce.',
     'coaley/gloucestershire',
-    'coalforth',
-    'coalhall',
-    'coalhill',
-    'coalici&oacute;n',
-    'coaliion',
-    'coaling&rehy;stage',
-    'coaling-station',
-    'coalisland-dungannon',
-    'coalition&mdash;see',
-    'coalition-a',
-    'coalition-based',
-    'coalition-for-clampdown',
-    'coalition-for-democracy',
-    'coalizao',
-    'coalmasters',
     'coalness',
-    'coals/logs',
-    'coalsack',
-    'coalshed',
-    'coalship',
-    'coalter',
-    'coaltown',
-    'coaltrucks',
-    'coaly-skinned',
-    'coanalgesics',
-    'coarctation',
-    'coardinated',
-    'coardinating',
-    'coarns',
-    'coarse&rehy;fibred',
-    'coarse-bladed',
     'coarse-boned',
-    'coarse-cut',
-    'coarse-fishing',
-    'coarse-graining',
-    'coarse-looking',
-    'coarse-minded',
-    'coarse-pelted',
-    'coarse-spun',
-    'coarse-stranded',
-    'coarse-tongued',
-    'coarse-winded',
-    'coarse-woven',
-    'coarsen',
-    'coarsing',
-    'coarticulatory',
-    'coase-williamson',
     'coast&rehy;line',
-    'coast-bound',
-    'coast-defence',
-    'coast-hugging',
-    'coast-lines.',
-    'coast-poverty',
-    'coast-to-',
-    'coast-to-interior',
-    'coastal/marine',
-    'coasteering',
-    'coaster/table',
-    'coastguard.priam',
-    'coastline.',
-    'coastroad',
-    'coastward',
-    'coat&mdash;stand',
     'coat&rehy;dress',
-    'coat-and-hat',
-    'coat-but',
-    'coat-hooks',
-    'coat-of-joseph',
-    'coat-on',
-    'coat-owner',
-    'coat-pockets',
-    'coat-thread',
-    'coat.',
-    'coat/dress',
-    'coatdyke',
-    'coatee',
-    'coates/chief',
-    'coates/dancer',
-    'coates/springhill',
     'coatest',
-    'coatex',
-    'coathook',
-    'coatian',
-    'coaties',
-    'coating/laminating',
-    'coatings.',
-    'coatless',
-    'coatmakers',
-    'coatman/pool',
-    'coatney',
-    'coats-on-the-seat',
-    'coats-viyella',
-    'coatup',
-    'coauthored',
-    'coaxial.',
     'coaxing.',
-    'cob-bers',
-    'cob-called',
-    'cob-shaped',
-    'cob-webs',
-    'cobaea',
-    'cobalamin',
-    'cobalt-58',
-    'cobalt-free',
-    'cobalt.',
-    'cobaltinitrate',
-    'cobam',
-    'cobanglu',
-    'cobb/rnib',
-    'cobbers',
-    'cobble-strewn',
     'cobbledicks',
-    'cobbler-up',
-    'cobbler.',
-    'cobblstone',
-    'cobbly',
-    'cobdenites',
-    'coberg',
-    'coberger',
-    'coberine',
-    'coberly',
-    'cobian',
-    'cobiere',
-    'cobija',
-    'coblemen',
-    'coblentz',
-    'cobner',
     'cobol++',
-    'cobol/vsam',
-    'cobol77',
-    'coborn',
-    'cobra-goddess',
-    'cobra-like',
-    'cobre',
-    'cobretti',
-    'cobseo',
-    'coburg&ndash;portuguese',
-    'cobweb-pattern',
-    'cobwebs.',
-    'cobwebs/tatters',
-    'coca-barons',
-    'coca-coal',
-    'coca-cola.',
     'coca-cola/kaiser',
-    'coca-colonial',
-    'cocaine-addicted',
-    'cocaine-addiction',
-    'cocaine-induced',
-    'cocaine-manufacturing',
-    'cocaine-taking',
-    'cocaine-using',
-    'cocaleros',
-    'cocan',
-    'cocarel',
-    'cocceral',
-    'cocciante',
-    'coccidian',
-    'coccidioidomycosis',
-    'coccidiosis',
     'coccinella',
-    'coccinellid',
-    'coceral',
-    'cochabamba.',
-    'cochairman',
-    'cochambamba',
-    'cochenilles',
-    'coches',
-    'cochilicus',
-    'cochito',
-    'cochleas',
-    'cochleata',
-    'cochliomyasis',
-    'cochrane/oxfordshire',
-    'cochranepublic',
-    'cochranes',
     'cochromatographs',
-    'cochylis',
-    'cocine',
-    'cocis',
-    'cock&rehy;shy',
-    'cock\'s-foot',
-    'cock-a-doodle-doo',
-    'cock-a-doodle-doos',
-    'cock-cock-cock',
-    'cock-feather',
-    'cock-for-the-night',
-    'cock-masters',
-    'cock-of&rehy;the-roost',
-    'cock-prod',
-    'cock-rings',
-    'cock-rock',
     'cock-scailing',
-    'cock-sparrow',
-    'cock-stand',
-    'cock-sucking',
-    'cock-sure',
-    'cock-tease',
-    'cock-teasing',
-    'cock-throwing',
-    'cockainge',
-    'cockamamy',
-    'cockateels',
-    'cockatoo-plumed',
-    'cockborn',
-    'cockburnianus',
-    'cockbury',
-    'cocked-hat',
     'cockel-shell',
-    'cocken-ey',
-    'cockerham',
-    'cockerham-based',
-    'cockernee-yorkshire',
-    'cockernees',
-    'cockersands',
-    'cockingford',
-    'cockings',
-    'cockle-doodle-doo',
-    'cockle-gatherers',
-    'cockle-shaped',
-    'cocklecarrot',
-    'cocklemoor',
-    'cockler',
-    'cockleshell',
     'cockleshells',
-    'cocklicrane',
-    'cocklin',
-    'cockmarsh',
-    'cockmasters',
-    'cockneyism',
-    'cockneyisms',
-    'cockpen',
-    'cockpit-adjustable',
-    'cockpit-straps',
-    'cockpit-style',
-    'cockpit-wide',
-    'cockpit.',
-    'cockrams',
-    'cockrels',
-    'cockroach-like',
     'cockroach-studded',
-    'cockroft/gloucestershire',
-    'cocks-of-the-rock',
-    'cocks/against',
-    'cockshall',
-    'cockshaw-prompted',
-    'cockshoot',
-    'cockshutt',
-    'cocksparrer',
-    'cocksparrow',
-    'cocktail-flavoured',
-    'cocktail-glass',
-    'cocktail-hour',
-    'cocktail-length',
-    'cocktail-lounge',
-    'cocktailing',
     'cockteasing',
-    'cockwood',
-    'cocky-looking',
-    'coclusions.lusions',
-    'coco-cola',
-    'coco/jeanette',
-    'cocoa-adviser',
-    'cocoa-beans',
-    'cocoa-breeding',
-    'cocoa-brown',
-    'cocoa-coloured',
-    'cocoa-flavoured',
-    'cocoa-leaf',
-    'cocoa-magnates',
-    'cocoa-tin',
-    'cocoanut',
     'cocobolo',
-    'cocod',
-    'cocoi',
-    'cocoluche',
-    'coconut&rehy;growing',
-    'coconut-cream',
-    'coconut-style',
-    'coconut-wood',
-    'cocoon&rehy;like',
-    'cocorp',
-    'cocottes',
-    'cocove',
-    'cocoyo',
-    'cocozza',
-    'cocq',
-    'cocr',
     'cocteau-calm',
-    'coculture',
-    'cocultured',
-    'cocultures',
-    'cocxa',
-    'cod\'n',
-    'cod-2',
-    'cod-acting',
-    'cod-almighty',
-    'cod-broadway',
-    'cod-erudite',
-    'cod-flamenco',
-    'cod-japanese',
-    'cod-like',
-    'cod-meal',
-    'cod-military',
     'cod-operatic',
-    'coda-ias',
-    'codafiene',
-    'codar',
-    'codasyl-oriented',
-    'codazzi',
-    'codbeck',
-    'codded\'',
-    'codder',
-    'coddin\'',
-    'code&rehy;name',
-    'code&rehy;named',
-    'code-',
-    'code-block',
-    'code-books',
-    'code-break',
     'code-breaker',
-    'code-check',
-    'code-cracking',
-    'code-cum-driving',
-    'code-driven',
-    'code-making',
-    'code-mixing',
-    'code-of-conduct',
-    'code-path',
-    'code-phrase',
-    'code-room',
-    'code-sheet',
-    'code-sheets',
-    'code-switch',
-    'code-switched',
-    'code/message',
     'code/request',
-    'code/value',
-    'codeable',
-    'codebook',
-    'codebooks',
-    'codecenter/objectcentre',
-    'codefendant',
-    'codefendent',
-    'codeines',
-    'codemanager',
-    'codemen',
-    'codenoll',
-    'codependents',
-    'codes&mdash;each',
-    'codes.',
-    'codetermine',
     'codevision',
-    'codeworded',
-    'codey',
-    'codge',
-    'codham',
-    'codiaeum',
-    'codicillary',
-    'codicillis',
-    'codificacao',
-    'codifiers',
-    'codigoro',
-    'codina',
-    'coding-office',
-    'coding/classification',
-    'codisa',
-    'codktails',
     'codle',
-    'codlea',
-    'codling-tree',
-    'codmans',
-    'codnover',
-    'codorn&iacute;u',
-    'codpiece-daughter',
-    'cods-up',
-    'codtabulous',
-    'codthorpe',
-    'codul',
-    'codzienny',
-    'coe-kell',
-    'coeck',
-    'coedited',
-    'coeditor',
     'coedpoeth',
-    'coeffic',
-    'coefficiency',
-    'coefficient=0.8',
-    'coelenterata',
-    'coelenterate',
-    'coelestium',
-    'coelian',
-    'coelis',
-    'coelius',
-    'coelobs',
-    'coeloria',
-    'coelorum',
-    'coeloscleritophora',
-    'coelosphaeridium',
-    'coelurosaur',
     'coelute',
-    'coelutes',
-    'coen-hickman',
-    'coenraad',
-    'coenvvlf',
-    'coenzymes',
-    'coeperstraten',
-    'coequality',
-    'coer',
-    'coercions',
-    'coercivities',
-    'coerulea',
-    'coeruleoalta',
-    'coerulescens',
-    'coeruleus',
-    'coerulum',
     'coetan',
-    'coeternal',
-    'coetraks',
-    'coeurville',
-    'coevals',
-    'coevolutions',
-    'coexpress',
-    'coexpressed',
-    'coextruded',
-    'coextrusion',
-    'coface',
-    'cofamilial',
-    'cofer',
-    'coff-choc',
-    'coffee&rehy;cups',
-    'coffee-',
     'coffee-and-cream',
-    'coffee-blender',
-    'coffee-brown',
-    'coffee-chat',
-    'coffee-filled',
-    'coffee-filter',
-    'coffee-filters',
-    'coffee-flavoured',
-    'coffee-futures',
-    'coffee-harvesters',
-    'coffee-harvesting',
-    'coffee-machines',
-    'coffee-man',
-    'coffee-market',
-    'coffee-mill',
-    'coffee-pouring',
     'coffee-salting',
-    'coffee-sellers',
-    'coffee-service',
-    'coffee-shade',
-    'coffee-stained',
-    'coffee-the',
-    'coffee-tray',
-    'coffee-trolley',
-    'coffee-warming',
-    'coffee.',
-    'coffee/lunch',
-    'coffee/pepper',
-    'coffeemate',
-    'coffen/ploughman',
-    'coffer-box',
-    'coffer.',
     'cofferdam',
-    'cofferers',
-    'coffering',
-    'coffi',
-    'coffin&rehy;plates',
-    'coffin-',
-    'coffin-bearers',
-    'coffin-bodied',
-    'coffin-cover',
-    'coffin-lid',
-    'coffin-nail',
-    'coffin-shape',
-    'coffin-style',
-    'coffinish',
-    'coffinlid',
-    'coffinlike',
     'coffre',
-    'coffy',
-    'cofield',
-    'cofinanced',
-    'cofino',
-    'cofiroute',
-    'cofluampicil',
-    'cofractionates',
-    'cofton',
-    'cog&ndash;in',
-    'cog-sure',
-    'cog-wheels',
-    'cogea',
-    'cogedipresse',
-    'cogenerating',
-    'cogeners',
     'cogenhoe',
-    'cogently-argued',
-    'cogged',
-    'cogger',
-    'coggie',
-    'coggs',
-    'cogit',
-    'cogn&eacute;e',
-    'cognatic',
-    'cognicioun',
-    'cognised',
-    'cognitariat',
-    'cognitive-academic',
-    'cognitive-affective',
-    'cognitive-based',
-    'cognitive-epistemic',
     'cognitive-modeling',
-    'cognitive-practical',
-    'cognitive-practice',
-    'cognitively-held',
-    'cognomina',
-    'cognoscente',
-    'cogo-fawcett',
-    'cogrino',
-    'cogshall',
-    'coguate',
-    'coguilles',
-    'coh&eacute;rent',
-    'cohab',
-    'cohabitant',
-    'cohabiting.',
-    'cohabitor',
     'cohabitors',
-    'cohabits',
-    'cohanim',
-    'cohasset/panuke',
-    'cohave',
-    'cohe',
-    'cohe&rehy;sive',
-    'cohen-solal',
-    'cohen/children',
-    'cohen/vicar',
-    'coherences',
-    'cohesions',
-    'cohla',
-    'cohorn',
-    'cohort\'s-',
-    'cohorts.',
     'cohse-backed',
-    'cohu',
-    'cohune',
-    'coi/mod',
-    'coias',
-    'coicidence',
-    'coid',
-    'coiffeur',
-    'coiffeurs',
-    'coiffeuses',
-    'coign',
-    'coignac',
-    'coil\'',
-    'coil-core',
-    'coil-springs',
-    'coil-tappable',
     'coil-type',
-    'coil/left',
-    'coila',
-    'coiled-round',
-    'coiled-spring',
-    'coillabus',
-    'coillach',
-    'coillege',
-    'coilsholm',
-    'coimhleun',
-    'coin-',
-    'coin-collecting',
-    'coin-flip',
-    'coin-image',
-    'coin-in-the-slot',
-    'coin-moulds',
     'coin-shoving',
-    'coin-sized',
-    'coin-tossing',
-    'coin-weight',
-    'coin/object',
-    'coincedentally',
-    'coinci-dents',
-    'coincide.',
-    'coincidence-detection',
-    'coincidence-gravity',
-    'coincidencia',
-    'coincidental-but',
-    'coincidentia',
-    'coincidential',
-    'coincubation',
-    'coining-irons',
     'coinneach',
-    'coins.if',
-    'coins/tokens',
-    'coinshoot',
-    'cointegration',
-    'cointerfeiters',
-    'cointise',
-    'cointreu',
-    'cointrin',
-    'coir-grown',
-    'coirechat-achan',
-    'coires',
-    'coirt',
-    'coiruisg',
-    'coiruisk',
-    'coisir',
     'coist',
-    'coitis',
-    'coitu',
-    'cojacaru',
-    'cojuangcos',
-    'cok',
-    'coke-aholic',
-    'coke-cellar',
-    'coke-dry',
-    'coke-fired',
-    'coke-like',
-    'coke-smelting',
-    'coke-snortin\'',
-    'cokefreak',
-    'cokemen',
-    'cokertme',
     'cokethorpe',
-    'coketowners',
-    'cokie',
-    'col&egrave;re',
-    'col&rehy;lision',
-    'col-leagues',
-    'col-oh-nell',
-    'col-ours',
-    'col-umns',
-    'col.-gen.',
-    'col.12',
-    'col.j',
-    'col.pl.',
-    'col/jog',
-    'col1a1',
-    'cola*',
     'cola-free',
-    'colaba-side',
-    'colada',
-    'colaford',
-    'colaiuta',
-    'colamartino',
-    'colander-type',
-    'colandered',
-    'colap',
-    'colarres',
-    'colaton',
-    'colawrean',
-    'colbalt',
-    'colbart',
-    'colbea',
-    'colbeck.monday',
     'colbertian',
-    'colbertism',
-    'colbiensus',
-    'colbourne-browne',
-    'colbround',
-    'colcannon',
-    'colchester-',
-    'colchesterjust',
-    'colchia',
-    'colchian',
-    'colchica',
-    'colchicumns',
-    'colchis',
-    'colcombe',
-    'colcy',
-    'cold&rehy',
     'cold\'',
-    'cold(s)',
-    'cold-air',
-    'cold-applied',
-    'cold-bathing',
-    'cold-beaded',
-    'cold-blown',
-    'cold-box',
-    'cold-call',
-    'cold-called',
-    'cold-chain',
-    'cold-comfort',
-    'cold-country',
-    'cold-drawn',
-    'cold-drink',
-    'cold-frame',
     'cold-frames',
-    'cold-fusion',
-    'cold-hall',
-    'cold-heartedly',
-    'cold-i',
-    'cold-like',
-    'cold-looking',
-    'cold-moulded',
-    'cold-mutton',
-    'cold-pressing',
-    'cold-resistant',
-    'cold-roll',
-    'cold-rolled',
-    'cold-rooms',
-    'cold-setting',
-    'cold-smelling',
     'cold-sore',
-    'cold-spots',
-    'cold-storage',
-    'cold-store',
-    'cold-stores',
-    'cold-test',
-    'cold-tolerant',
-    'cold-weld',
-    'cold-worked',
-    'cold.he',
-    'cold/hot',
-    'coldale',
-    'coldeel',
-    'coldershaw',
-    'coldfaced',
-    'coldham',
     'coldhearted',
-    'coldinghame',
-    'coldingley',
-    'coldly.',
-    'coldman',
-    'coldness-yet',
-    'coldrick/residents',
-    'coldrooms',
-    'coldsores',
-    'coldstar',
-    'coldstores',
-    'coldstreams',
-    'coldwater/tropical',
-    'coldwell-turner',
-    'coldy',
-    'cole-king/drayton',
     'cole-trained',
-    'cole/arthur',
-    'cole/house',
-    'colebourne',
-    'coleccion',
-    'colecterol',
-    'coledale',
-    'coleford/forest',
-    'coleharbour',
-    'colehill',
-    'coleman&mdash;that',
-    'coleman&mdash;were',
-    'coleman-noll',
-    'coleman/countryside',
-    'coleman/library',
-    'colemand',
     'colenso/lacrosse',
-    'coleoliids',
-    'colepeper',
-    'coleport',
-    'coleractal',
-    'colerectal',
-    'coleridge\'',
-    'coleridge-like',
-    'coleridge-taylor',
-    'coleridge/middle',
-    'coles/building',
-    'coles/former',
-    'coles/wife',
-    'coles/yachtsman',
-    'colest',
-    'colestipol',
     'coleta',
-    'colewood',
-    'coleworthys',
-    'coleworts',
-    'coley/business',
-    'coleys',
-    'colfeians',
-    'colfins',
-    'colgrove',
-    'colherne',
-    'colhoun',
-    'colias',
-    'colic-type',
-    'coliditz',
-    'coliepes',
-    'coligation',
     'colijn',
-    'colima',
-    'colin-thome',
-    'colindres',
-    'colinearity',
-    'colinical',
-    'colinmoynihan',
-    'colinton/animal',
-    'colinus',
-    'colinwood',
-    'colique',
-    'colisa',
-    'colisseum',
-    'colitis.',
-    'coliupe',
-    'colkirk',
     'coll&eacute',
-    'coll&eacute;aux',
-    'coll&eacute;s',
-    'coll&egrave;gues',
-    'coll-oh-nell',
-    'collab&rehy;oration',
-    'collaborated-and',
-    'collaboration.',
-    'collaborationism',
-    'collabortive',
-    'collachs',
-    'collaer',
-    'collage-maker',
-    'collage.',
-    'collage/drawings',
-    'collagen-based',
     'collagenous',
-    'collagens.',
-    'collam',
-    'collams',
-    'collan',
-    'collapse\'',
-    'collapse.',
-    'collapse/consolidation',
-    'collapse/in',
-    'collapsed.tonight',
-    'collapser',
-    'collapsibles',
-    'collar-bones',
-    'collar-decorations',
-    'collar-makers',
-    'collar-points',
     'collar-shirted',
-    'collar-size',
-    'collar-transmitter',
-    'collar/white',
-    'collarbone-breaking',
-    'collare',
-    'collarets',
-    'collars-up',
-    'collased',
-    'collateral-commissural',
-    'collateralised',
-    'collateralization',
-    'collateralized',
-    'collavoce',
-    'collco',
-    'collcutt',
     'colleagenase',
-    'colleague&lsqb',
-    'colleagues-in-crime',
-    'colleagues.',
-    'colleagues/stress',
-    'colleaque',
-    'collect-call',
-    'collect/deliver',
-    'collect/obtain',
-    'collectania',
-    'collecting-box',
-    'collecting.',
-    'collecting/delivering',
-    'collection&lsqb;s&rsqb',
-    'collection-based',
-    'collection-box',
     'collection-management',
-    'collection-point',
-    'collection-time',
-    'collection.',
-    'collection/delivery',
-    'collection/enquiry',
-    'collection/library',
-    'collectionand',
-    'collectionneurs',
-    'collections.',
-    'collections/plant',
-    'collections/recovery',
-    'collective-bargaining',
-    'collective-decision',
-    'collective-farm',
-    'collective/tail',
     'collective17.6',
-    'collectively-controlled',
-    'collectively-managed',
-    'collectively-owned',
-    'collectively.',
-    'collectiveness',
-    'collectivise',
-    'collectivisim',
-    'collectivisms',
-    'collectivit&eacute',
-    'collectivizations',
-    'collector-wallah',
-    'collector/christmas',
-    'collector/dealer',
-    'collector/donor',
-    'collector/restorer',
     'collectorem',
-    'collectors.',
-    'colleeg',
-    'colleenette',
-    'colleer',
-    'collegaue',
-    'college&mdash',
-    'college&mdash;a',
-    'college&mdash;because',
-    'college-aged',
-    'college-bound',
-    'college-developed',
-    'college-entrance',
-    'college-initiated',
-    'college-leavers',
-    'college-project',
     'college-trained',
-    'college-wide',
-    'college.',
-    'college/alternative',
-    'college/you',
-    'college18',
-    'colleges.under',
-    'colleges/polytechnics/universities',
-    'colleges/teachers',
-    'collegiate-type',
-    'collegue',
-    'collegues',
-    'collema',
-    'collembolae',
-    'collenage',
-    'collender',
     'collenette',
-    'collenn',
-    'colleran',
-    'colleries',
-    'collesden',
-    'colletias',
-    'collettes',
-    'colletts',
-    'colleville-sur-mer',
-    'colleymore',
-    'colleys',
-    'collezione',
-    'collick',
-    'colliding-beam',
-    'collie-cross',
-    'collie-labrador',
     'collier-farmers',
-    'collier-jackson',
-    'collieries.',
-    'collieryman',
-    'collieshaw',
-    'colliflowers',
-    'colligan',
-    'collignon',
-    'collimate',
-    'collimation',
-    'collinf',
-    'colling&rehy;ridge',
-    'colling-bred',
-    'collingbourne',
-    'collingdale',
-    'collinge/goat',
     'collingnon',
-    'collino',
-    'collins&rehy;featuring',
-    'collins-designed',
-    'collins-howgill/medical',
-    'collins-willow',
-    'collins/andrew',
-    'collins/fontana',
-    'collins/resident',
-    'collinsassociate',
-    'collinson/housing',
-    'collinsons',
-    'collis-smith',
-    'collis-squires',
-    'collis/thames',
-    'collishaw',
     'collision\'',
-    'collision-free',
-    'colliton',
-    'colllgatlve',
-    'collobm',
-    'collocamenta',
-    'collocated',
-    'collocation-building',
-    'collocatlons',
-    'collograph',
-    'collographs',
-    'collographs.',
-    'collomorphic',
-    'collomosse',
-    'collon',
-    'collonges',
     'collonic',
-    'collooney',
-    'colloques',
-    'colloquially-speaking',
-    'colloredo-mansfeld',
-    'colloring',
-    'collossally',
-    'collotype',
-    'colloveti',
-    'colluders',
-    'collwn',
-    'colly-wobbles',
-    'collyear',
-    'collyer-bristow',
-    'collyn',
-    'collyrium',
     'colma&nacute',
-    'colman/farmer',
-    'colmap',
-    'colmenares',
-    'colmris',
-    'colnbridge',
-    'colneis',
-    'colobinae',
-    'coloboma',
-    'colocalise',
-    'colocalization',
-    'colocasia',
-    'colocated',
-    'colocotronises',
-    'cologastric',
-    'cologna',
     'cologne-london',
-    'colognole',
-    'colohus',
-    'cololur',
-    'cololurs',
-    'colomb&eacute;-le-fosse',
-    'colombey-les-deux-eglises',
-    'colombi&egrave;re',
-    'colombia-style',
-    'colombian-born',
-    'colombian-venezuelan',
-    'colombianas',
-    'colombo-bound',
-    'colombo-to-kandy',
-    'colomendy',
-    'colomer',
     'colon-cancer',
-    'colon-ialism',
-    'colon-ripping',
-    'colon/rectum',
-    'colonc',
-    'colone',
-    'colonel&rehy;general',
-    'colonel-husband',
-    'colonel-in',
-    'colonial-based',
-    'colonial-boy',
-    'colonial-educated',
-    'colonial-interloping',
-    'colonialisation',
-    'colonialisms',
-    'colonialization',
     'colonics',
-    'colonies.',
-    'coloniser',
-    'colonizes',
-    'colonnus',
-    'colono',
-    'colonocyte',
-    'colonoscopically',
-    'colonoscopy/patient',
-    'colons.',
-    'colonscopic',
-    'colonscopies',
-    'colonum',
-    'colony\'',
-    'colony-sticks',
-    'colony/plaque',
     'coloproctological',
-    'color&eacute;s',
-    'colora',
-    'colorado/san',
-    'colorama',
-    'colorance',
-    'colorap',
-    'colorations',
-    'coloratus',
-    'colorcoat',
-    'colores',
-    'colorid',
-    'colorific',
-    'colorimeter',
-    'colorimeters',
-    'colorissimo',
     'colorist',
-    'colorno',
-    'colorplush',
-    'colorpro',
-    'colorscan',
-    'colorsense',
-    'colorspin',
-    'colorvision',
-    'colosally',
-    'coloss',
-    'colosseo/pineta',
-    'colosseums',
-    'colossio',
-    'colosso',
-    'colossuses',
-    'colotis',
     'colotti',
-    'colou',
-    'colour&mdash;no',
-    'colour&rehy;coded',
-    'colour(s)',
-    'colour-balance',
-    'colour-balanced',
-    'colour-balancing',
-    'colour-bar',
-    'colour-based',
-    'colour-blending',
-    'colour-change',
-    'colour-changing',
-    'colour-choice',
-    'colour-clashes',
-    'colour-co-ordinated',
     'colour-codes',
-    'colour-conscious',
-    'colour-contrasts',
-    'colour-crazed',
-    'colour-display',
-    'colour-effects',
-    'colour-encrusted',
-    'colour-enhancer',
-    'colour-enhancing',
-    'colour-feeding',
-    'colour-filled',
-    'colour-films',
-    'colour-filter',
-    'colour-fixed',
-    'colour-form',
-    'colour-forms',
     'colour-illustrated',
-    'colour-insensitive',
-    'colour-intensity',
-    'colour-interactive',
-    'colour-keyed',
-    'colour-killing',
-    'colour-mapping',
-    'colour-mark',
-    'colour-marked',
-    'colour-marker',
-    'colour-markers',
-    'colour-marks',
-    'colour-mass',
-    'colour-mixing',
-    'colour-photographed',
-    'colour-plate',
     'colour-point',
-    'colour-print',
-    'colour-ramped',
-    'colour-ringed',
-    'colour-rinsed',
-    'colour-rubbed',
-    'colour-sensitive',
-    'colour-shy',
-    'colour-soaked',
-    'colour-spectrum',
-    'colour-steel',
-    'colour-supplement-magnetic',
-    'colour-talk',
-    'colour-themed',
-    'colour-tint',
-    'colour-up',
     'colour-video',
-    'colour-wash',
-    'colour-washes',
-    'colour-washing',
-    'colour-waves',
-    'colour-word-users',
-    'colour.here',
-    'colour/intensity',
-    'colour/pattern',
-    'colour/performance',
-    'colour/perm/highlights',
-    'colour/shell',
-    'colour_as',
-    'colourations',
-    'colourbox',
-    'colourcare',
     'colourcoat',
-    'colourcoded',
-    'coloured-glass',
-    'coloured-immigrant',
-    'coloured-sprite',
-    'coloured-tile',
-    'coloured/banded',
-    'coloured/permed',
-    'colourfastness',
-    'colourfully-attired',
-    'colourfully-dressed',
-    'colourfully-lit',
-    'colourfun',
-    'colourific',
-    'colouring-free',
-    'colouring-in',
     'colouring_rather',
-    'colourise',
-    'colourless.',
-    'colourlessness',
-    'colourman',
-    'colourmania',
-    'colourmatch',
-    'colourprinted',
-    'colourprinting',
-    'colourquest',
-    'colours-the',
-    'colours/finishes',
-    'colours:brown',
-    'colourstudio',
-    'colourwash',
-    'colourwashed',
     'colourwashing',
-    'colourway.',
-    'colpan',
-    'colpepper',
-    'colperras',
-    'colpitt',
-    'colporteur',
-    'colporteurs',
-    'colposcopic',
-    'colposcopically',
-    'colpoy',
-    'colprensa',
-    'colpus',
-    'colquiri',
-    'colron',
-    'colsons',
     'colston/farmer',
-    'colt-like',
-    'colt.38',
-    'colta',
-    'coltham',
-    'coltham&mdash;fines',
-    'colthorp',
-    'colthouse',
-    'coltishly',
-    'colubriformis',
-    'coludi',
-    'columb&aelig',
-    'columba.',
-    'columbae',
-    'columbani',
-    'columbaria',
     'columbia/tri-star',
-    'columbians',
-    'columbidae.',
-    'columbids',
-    'columbina',
-    'columbite',
-    'columbus-bashing',
-    'columbus.',
-    'columcille-columba',
-    'columes',
-    'columkille',
-    'colummbus',
-    'column-arcade-supported',
-    'column-breaker',
-    'column-drum',
-    'column-like',
     'column-lines',
-    'column-row',
-    'columna',
-    'columnar-squamous',
-    'columnarised',
-    'columnist-and',
-    'columnist-with-attitude',
-    'columns-compact',
-    'colunteers',
-    'colussus',
-    'colutea',
-    'colvend',
-    'colvern',
-    'colvile',
-    'colvilei',
-    'colvills',
     'colvins',
-    'colwall/worcestershire',
-    'colwich',
-    'colwin',
-    'colyear',
-    'colyer-fergusson',
-    'colyn',
-    'colyte',
-    'colza',
-    'colzium',
-    'com&eacute;die-fran&ccedil;aise',
-    'com&eacute;dies-ballets',
-    'com&mdash',
-    'com&rehy;missions',
-    'com&rehy;munal',
-    'com&rehy;municator',
     'com&rehy;panionable',
-    'com&rehy;pany',
-    'com&rehy;plaint-led',
-    'com&rehy;plaints',
-    'com&rehy;posure',
-    'com&rehy;prehended',
-    'com&rehy;prehensively',
-    'com&rehy;puter-typesetting',
-    'com\'&eacute;grande',
-    'com\'st',
-    'com(89)',
-    'com-/con-',
-    'com-goddess',
-    'com-muni-ca-tions',
-    'com-pete',
-    'com-sheep',
     'com/nav',
-    'com2',
-    'coma-like',
-    'coma-type',
-    'comac',
-    'comacchio',
-    'comadre',
-    'comae',
-    'comag',
-    'comand',
-    'comani',
-    'comapanies',
-    'comapnies',
-    'comaprative',
-    'comar',
-    'comatosed',
     'comayagua',
-    'comb-back',
-    'comb-on',
-    'comb-rows',
-    'comb-sack',
-    'comb-sacks',
-    'comb-scalpel',
-    'comb-spinelets',
-    'combalou',
-    'comband',
-    'combat-cannibalism',
-    'combat-casual',
-    'combat-chaplain',
-    'combat-jacket',
-    'combat-master',
-    'combat-ready',
     'combat-trained',
-    'combat.',
-    'combatively',
-    'combativit&eacute',
-    'combattere',
-    'combed-out',
-    'comberbach',
-    'combered',
-    'comberg',
-    'combes/group',
-    'combeses',
-    'combi-baking',
-    'combi-roasting',
-    'combi-steamers',
-    'combi-steaner',
-    'combi-wardrobe',
     'combiboard',
-    'combidoc',
-    'combina',
-    'combinado',
-    'combinaison',
-    'combination-coded',
-    'combination-room&mdash',
-    'combinational',
-    'combinatoire',
-    'combinatorially.',
-    'combinazione',
-    'combinazioni',
-    'combine&lsqb;s&rsqb',
-    'combine-harvesting',
-    'combine-mounted',
-    'combined-bomber',
     'combined.',
-    'combined/joint',
-    'combinitis',
-    'combione',
-    'combipen',
-    'combipens',
-    'combles',
-    'combo\'',
-    'combort',
-    'combray',
-    'combretum',
-    'combs-and-paper',
-    'combustibility',
-    'combusting',
-    'combustion-metamorphosed',
-    'combustion-zone',
     'combustions',
-    'combustive',
-    'combustor',
-    'comc',
-    'comcare',
-    'comcraft',
-    'comdap',
-    'comdata',
-    'comdef',
-    'comdemned',
-    'comden',
-    'comdex\'',
-    'comdex-attached',
-    'comdex/sucesu',
-    'come&mdash;she',
-    'come-and-try',
     'come-backs',
-    'come-capital',
-    'come-downance',
-    'come-downs',
-    'come-every-week',
-    'come-first',
-    'come-for',
-    'come-from-behind',
-    'come-hithers',
-    'come-home-and-all-will-be-forgiven',
-    'come-on-fred-we-give-you-all-this-advertising-how-about-an-in-depth-profile',
-    'come-out',
-    'come-to',
-    'come-to-skegness',
-    'come-to-the-doctor',
-    'come-uppances',
     'come-what-may',
-    'come.2',
-    'come/from',
-    'come_over',
-    'comeback-making',
-    'comeblack',
-    'comedienne-turned-crusader',
-    'comedietta',
-    'comedy&ndash',
-    'comedy\'',
-    'comedy-even',
-    'comedy-lovers',
-    'comedy-music',
-    'comedy-pop-and-hobbies',
-    'comedy-writer',
-    'comedy/music',
     'comedy/pauly',
-    'comega',
-    'comelier',
-    'comelin/igor',
-    'comely-looking',
-    'comence',
-    'comendable',
-    'comenen',
-    'comensour',
-    'comentarios',
-    'comeonyouwhads',
-    'comer-shaving',
-    'comerica',
-    'comers.',
-    'comerton',
-    'comes.',
     'comest',
-    'comestible',
-    'comestor',
-    'comet\'s-tail',
-    'comet-blaze',
-    'comet-hunter',
-    'cometabolism',
+)
+
+blocks_83 = (
+    '$"sh%#kys$&t-and-&\'busting&(friendly&&makers&*orientated&\'reading($turn%$able%$beat&$ound&#ury\'%stin\'%&ed-out',
+    '.#the\')-analyses((material(%party\'%ed-in*#out)*/qualified\'$hall\'&ing-in\'\'parties\'$s/jr%!h%+ier-kastier%$lets%"on',
+    '&#lot%$rand&-euse-coloured(!x%#s-a\'$land&%/wall&"ey&"on%#urn%&wizard$"ve&\'l-style\'(/jackson$&wallas',
+    '$!z##s\'n&+\'dave-style$!a$+e-and-catch&$dunn&$like&#ups%0/gloucestershire%$able%!n%%plane&#ool%#the%!y',
+    '$#hma%"ni\'!k$&ifness$\'llenged$"ma%&ochord$*s&eacute;s%$agne%/e-map&eacute;es&,mar&eacute;e&$ours&%rieau%$idic&#gny',
+    '\'!.\'&/frame$+te/unchaste&!d&$lain&!n\'#ess\'%ingly&"st%$iser&&zement(!s%!y&$sing$%yrion',
+    '%)rehy;ting$(-and-pat%%lines%&pieces%(to-stars$\'/chatte%,introduction$%achuk%#ibh%"ni&$ooga$$earu&)u-bottled(0cambr&eacute;sis/)grave;sis',
+    '\'#gay(#uay\'&vallon%$lain&"et&\'herault%+nay-malabry%#r\'s%!s$$fest%#ord$"ha%-railriabhaigh$%ilier&,lon-en-diois',
+    '%"on$&lereau&!s&!y$\'meister$!o%!u%$yant$"ri&$cide$%swold\'"od\'$rths$(tancourt%%ed-up',
+    '\'"ls\'#s.5&%r-box($head("up\'#jis\'(ley-itis+)whitfield(!y\'"on\'2screen&lsqb;s&rsqb\'*ton-newman\'!y%"ha%&ing-up',
+    '(!s(#ton%"ra\'!y&"is%%uarii$-urda&sacute;i$$wins$\'zigakis##uce&"r/\'$ians$"de&%pisse%*hry/mother',
+    '%\'onneret%#rey%!s$%ffage&"er("ed)$ttes\'.ur&rehy;driven))-gardener*(handyman**maintained*%valet))s/israeli&#uer$%ldron',
+    '%#mes$"me%&ontell$$ncel\'!y%"dy%!g&#ing$+s&eacute;es%\'ebickli%$sees&$kaya$$tier$%velin%)ir&eacute',
+    '#&vagnon$$erim$*igny-style%!n&#ism%"va$"ot#!w$$arta$#eng$"in&!g$"la%$eigh%!s',
+    '#%xhill##yes%$vsky$"il$#nay$#ter$#zuz##zel$"ov"#ci3#!k#!l#!t""dn",e&lstrok;mno',
+    '$#vee#"ak$"le$\'n-derag%!a$%p(er)%--and-cheerful2$ness&&bistro&\'feeling&$haul&$jade&%skate&&thrill,!s',
+    ')$make%%ernet\'*to-operate&-st-to-deliver%#ish%)ly-framed($made%&o-hong&!s%\'skating$(ravanont%#ell%&fullie%#ing$"t\'',
+    '&$ring%(ing-ways("ly$$vely#\'boksary$"ut#%cagou$,hen-ingushia()populated\'"ia&!s$*k&rehy;out%&-about\'*nd-balance&)bloomered',
+    '&$mark("te&$over&\'playing&$rail\'%eplay&$stay\'%ummer&$test&%weigh%":a%$book%$cite%-ed-in-luggage(#out',
+    '\'&fisher&$nden*,/oxfordshire("on&"r.&*tts/parish%&hovian%$ings&!t%*land/harry&\'ey/work%$mark)!s\'#tes%"nr',
+    '\'#sts%%s-ins&&umming$%rouit#%danne$)dar-types%"er\'#ton%6ington/buckinghamshire%+leton-based$$glow$!i$#low$(orlaomer$#zoy',
+    '%%e-eat%%seong$"ch$"ee&#eee)!e$,k&rehy;bones%&-boned\'&usting\'!y(3-jowl-with-industry&%hairs&&length&%roses&(to-cheek',
+    '(#uch%%/head%%boned)"s.%"en%"ie\'!s%$less%(y-chappy)%opped\'\'looking$%ldrin$!n$"ow$&r-lead',
+    '%\'ed_once%$fuly%&ie-bye&%ng/in%.leader-slaying\'&ssness%\'s-style&#ome%&y-bung\'\'hearted\'+little-girl(&ooking\'#pip&#ble$\'saholic',
+    '%$cake%,e-and-tomato+%wines\'$cake+!s($loth()ontaining)%unter(%utter\'&filled((lavoured\'&grease\'%knife*#ves\'%parer',
+    '($lant\'$room&%.bank&!/\'#egg&%block&&grater&"s.&!y%#ies&"ly%#man%%wring$!t%!a',
+    '$$vers$!z%"us#*f-d\'oeuvre-!s$(/hostess%\'manager%%owner*!s$"as$%esses%!t&"te$#fie%"ou',
+    '$#utu$&widden&"ns%"yn##hab$"em#$icko$!f%#est$!k$%losia$"ne$)racanthus%\'isophos%"on',
+    '$$wate#\'l&aelig$$-sea$"ae%$tors$%enham$#ful$$gate%$raph$\'iabinsk%%cerae)"ta%#don$#kan$#lew',
+    '$%marsh%!s&%-ford&)ford-born*$ians&#ley$$nock$"om&"ei%$viek$.sea-bloomsbury)$ound($like(*supporting\'%/west',
+    '\'(fication\'"no&$iano%$ford%%mford$#tam%%ehnam&%naham\'!h((am-based+*gloucester+)liverpool**photograph*!s\'$mham',
+    '$#une$%worth$*yabinsk-70%%uskin#\'m-facts&#lex%$vite%!x$\'3d/plus$#abs$$cial$$draw(%/plus$%etics$"i-',
+    '%$akin%)cal-based*)iological**y-chemical)(carriers)%green)(physical)3radiative-dynamical)\'scented*(plitting)&taking)\'warfare*%eapon()/physical(\'isation',
+    '((ly-aided+(coloured+\'defined+(enhanced+*fertilised+&milled,\'odified+(produced+(speaking+\'treated+*unreactive*+/physically(*s-industry)!.)$/ucb',
+    '&#las&)o-mineral((physical%&lumine%%ntosh%$ques%$sche)"he)!n)!s&,try-industry*!s)!.),/mathematics*\'physics',
+    '\'!y$"my$$name%)itz-based$+o-receptors%*attractand,#ion&*utotrophic%)dynamical%%kine\')!s%&limpex\')thotrophs&$ytic%-morphological',
+    '&+reventative,#ion%)reception+"or-!s%)sensitive)#ory&!h&#tat%)taxonomic&+herapeutics+#ist$#pak%*rint&trade&!o',
+    '$$safe%$ford%#pec%&tation%%ystem#%n-foo%#tai$"al$"ca%%ellor$"do$#ets%*vix-trench%"y.$\'g-chieh',
+    '&%kuang&%sarah%)/burglary%#bin%#chi\'"ow%%enter%#lai$%halls$%ieres$"na$\'onceaux%"ua$$shed#%opsis',
+    '$!e$$hren$!o$$ping$*stow/south#1que&rehy;clearing&)-clearing\'(printing\'&signer&%/slip&0book-brandishing*#ing&%cards&!d&0rboard-patterned',
+    '\'\'ed-tile\'\'s-board\'$work&\'s/money("po*$stal#%r-wuc$%borne&$urne$#che$#ddi$!e%!e%&mushki%(nvisinov',
+    '&!i&"ki&#nin&%ovets$$hill$$igal%%ngton%#sed&4hed-possession-to-be$!k%&asskiy)!y*!s$%leroi&#ton',
+    '$#mes$"ne&\'chersky%$ihiv&$keef*!f%!o&$byl\')\'-linked)"ed&&ivanov&#zem%#yak&$shev("ov',
+    '%)w-o\'leary$&pinski$#rug%"y-\')and-green\'.blossom-draped(%oughs($rown\')flavoured\'$like\'$pick+#ers)"nk(#lum\'#raw',
+    '\'%sized\'%trees(#ype\'$wood&$bank&"es&#man&$tree$!s%"by%\'ophilus$$tkow%!y$(ub-faced\'$like',
+    '(!s%$iyot$\'vonenko("ts$$yden%%lynne#-sebrough-pond%$more%#se.$$hers%.ire-lancashire(!r%"um&"re$"ka',
+    '$#nau%%imnus$#oni$(s-boards&+intelligent&\'players%!.%#_on%#els%&master%&player$%t-\'in&$bone\'$race&*contouring',
+    '&\'flexing&$hair&%level&$mike&(on-chest\'(rnaments&#pod\'\'rodding&(register&\'tearing\'"op&%veins%%/back\'$room&\'sternum',
+    '%%ables%$band%#eny&,r&ndash;rhyl\'#-le*!-(*shrewsbury\'+/shrewsbury(\'thumper(%wigan\'#are\'$f\'ld(*ield-based-)sheffield.$tyle',
+    '\'$s/hm\',ton-on-fosse*,/oxfordshire*!s%$flex&"ul%"id%*nut-backed)\'cheeked))mandibled)#red*\'oasters)\'sellers*%haped)$tree',
+    '%"ok&!n%,s-of-drawers%$wigs##ta-%"li%!n$"ek$$hams$$nole$"ta%#le.%"ri#&uchter%!o',
+    '("ie&.ier-skolnikoff%"ra%-uch&egrave;es$$enoz%$rell&"ly&%olets$%illon$"re%#ier&$llon%,olet-powered&&n-like$$vies',
+    '$"ys#Gw-de-chew-chew-chewdy-chew-de-chew-chew%"ew$&ed-off%!r$#ier&"st%"ly%$ness&*g&rehy;gum%"ts&"ts$(ong-like#!y$%assin',
+    '$)ne-stokes&"ll#*z-williams$$_moi$$eris"!h#$agan$$kuri$"ng$&tarpur#"en#!o$#den$#eun#%rabra',
+    '""i\'#$-chi\'\'-chitty$!h$$kung$#ree%!o$$test$"uh#*=standards#$a-yi$!h$!m%#ata\'!e',
+    '&#mai%#ina%)ti-bottle\'%giana\'!s(%hire\'$#ppa$$rini%,os&rehy;curo$%smata("ic&#us.%(ognathus%"so$!t',
+    '$"ve#%berta$"is$%nalls$"ol&!s#/c-but-not-denim%#est%\'scratch&$tyle$#age&*o-inspired($made(&raised%"na',
+    '$#est$*h&eacute;n%$arro%!e&#ley)(-smythes\'!l&!n&!s\'*ter-clarke**/langstone%\'i-vache&"do&&lnisky&%rrrrp',
+    '$)k-and-egg&+chick-chick&%oh-ny&\'rearing%!.%\'/oxford%&abiddy&$donz&#maw%-en&rehy;boned-#pox\'--and&rehy;egg($bone)%urger((dropping',
+    '(\'farming)$eed.)&licker)#ree(&houses(*incubating(\'killers,#ing(#leg)%icken*%vered($neck($pens))rocessing+&ducing',
+    ')#ibs($wire\'&burger\'$coop\'&farmer\'$gate\'%heads*$rted($ouse\'#man\'$shit%#ita%$lade%%s-day%%weeds',
+    '$$ness%!o$#ons%$ries&,y-and-orange%"ye#\'dananda$$care$&dyfort$$ekel$$ings$#low\'!s$"uo##eda',
+    '&*executives%+/proprietor%!e%.s-of-air-staff%(tainates)$cies\'!n$!l%!s$!m$%n-han&&shiung%!e%!g$!r',
+    '$:f-chaff-chiff-chaff-chiff-%\'on-clad)&overed\'$nier+!s#$gger$#ley$$nard%,ey-les-roses%!y$$orin$%worth#!h$"li$$uaha',
+    '%"io#%jiiwa%#kwa#6k-cheek-cheek-keraykek$"an%!r$#eee$$itsa$1oworeconstruction$$reng$#ulu#%lambe$%blain$)cahuaycco%&ompton',
+    '$\'d&mdash&\'pound;s&,rehy;centred++environment++interracial+*management+)producing+(snatcher+\'worship%!\'&%s-eye(*head-sized($play)#ugh%&-actor',
+    '\'$ware&)battering\'%earer,!s)$ting(!d(%ggars\'&oarder\'&rother\'\'urdened&&caring\'\'entered*\'redness\')haracters(#ild',
+    '&\'dancing\',evelopmental\'\'irected\'(ominated\'$rawn&%eater&%faced\'#oal\'+riendliness-"y\'&&genius\'\'uidance&%heart&(in-peril))the-adult',
+    '&)kidnapper&&labour&(molester.!s,#ing(\'rtality\'%urder&(obsessed\')rientated,"ed&*pedestrian\'%hobia\'&roofed)\'tection\',sychologists',
+    '&\'raising\'&eading&$self(!x\'%oiled\'#tar\'\'urvival&&victim(\'olation&\'watcher\'&elfare\'&horish\'$omen(#rld%\'.twenty',
+    '\'"ll&(godchild&\'infants&#oap&&parent&&reader&&savage\'%enior&%woman%"as%\'bearers%\'centred%$erly%$free%%grief',
+    '&#ole\'/od&mdash;arthur)*-makes-man*(smelling%#ine&#sh=(&nesses%(likeness%,minder-users+)s/nannies%\'raising&!e\'$arer\'\'n&mdash)/rehy;especially',
+    '(*-battering)+in&rehy;law+$-law,%peril)$only)\'rearing(!.)"he(\'/attend))beelzebub)\'cat/dog*\'hildren)#red)%ub40s(,_in_relation',
+    '\'!y&#ten%$seat&$ized%#ury%%watch$(e-mexico%%/peru%*_con_carne%+an-peruvian$#hac$%iarch)"us&"sm%"ed',
+    '&&girian\'%utila%"on%%prufe$"kd$+l-filtering%!a%#box%$dren%\'ed-food\'!.&!n&(r/killer&%sford%&i-bean',
+    '+%carne\')flavoured&(/cayenne&#est&#nga%$ness%"on%"ul&"ms$$mark$$odus%!e%\'tilapia$&perici$\'tington',
+    '()pensioner$$ufya$&veston#-m&rehy;panzee$!a%&nimani$&balile%#ima$"en&!e&"ti%#ran&"es$(ichangas%!d',
+    '$(ney-boys)&reasts(\'cradles($flue(&groove(%jambs($lamp)#ike(%mouth(%place(%shelf)$ized)\'weepers-#ing(#top',
+    '\'\'breasts\'%heads\'%place("ot*!s\'"s.($tack,!s\'$tops%!y$*p-watching%+anzee-human+$like%$like%!y',
+    '$%wemwe#-n&rehy;length$!-%%borne%%chain&%loths&)ontrolled%$high%&length%#out%%sheng&&tubble&)upporting%"up\'!s',
+    '$\'a-based\'&eijing&\'cabinet\'\'eramics&$doll&%faced&%india&%mania\'%yanma&$ware(&tchers\'$hite%&.there%\'/france%!h',
+    '&%iotle%%ndega%"ti%$uley$$chon(%tepec$$dits%(ustrials$"ed%"la%(se-based)"ox)&ritish)$uilt((canadian',
+    ')(ominated)&rafted(%gauge(*indonesian*(fluenced($leaf((occupied(#run()sponsored\'\'/eating\'!y$%g\'oli%$-ing&\'te-chin%&achook',
+    '%)ford-line%(his-khan%$uard&$etta&#nji$#ian%&oserie%#sia$(jikikilu$"ke&"rs&!t%"um$#man%#eys',
+    '%$ocks%!y&*-chin-chin$&odoxas%"is\'.erie-decorated%"na%!y$$s-up%\'trapped$"ta%%hurst%%purni%+z-curtained&%ed-up',
+    '#$onis%&odoxas$!t#"p\'$&-board\'#und%\'cashing%%fryer%+independent\'!s%$kick%%level%&making%*orientated%#pie',
+    '&$roof%)resistant%&shaped&%ucker%\'toothed%"up$%.just$/_in_conjunction$#apa%#thi$#boa$#eta&!o%$wyan$#lin',
+    '$-munk-equipped)$like(0s/oxfords/tigers$&ped-in("up&\'rfields\'\'smart\'s%&indale+!s\'%gdale$"re$1s-with-everything%(.million%%hops/%#ter',
+    '##rag$#che$"ee$"ho$#ino\'!s%)qu&iacute\'!i$#kin%$land%#par$&ognomy&$raph*"er%%mancy',
+    '&&omidae($yces%&paedic&\'racters*#ice(#tic&$tera)&ophily%%ubles&#let%#zos$#rie&"ng%!p%%upped',
+    '%%rgery\'$ians(#ons$%wa&gt#!s$%-wick$$amba%!n&"go$\'el-beak($lade\'\'chinned\'%edged("nd\'%faced',
+    '%%nbury&*hale-marsh$!h%"ti$%ledon&\'hampton&!r$#man&!s$$nell$"om$$sell$$tian%$ophe\'&rudney',
+    '$#zar#+t-chattered*#ing%&ridden$"ac%$lada&%ishte%%mbala%$rone&"ra\'*one-player)!i$*in-protein\'$rich&#ase',
+    '$(onomyces%#san%!u$"ra&"li$\'tajallu&$vira%"el&!r\'+-chattering\'"ne\'$wood&!s%#ies%!s',
+    '$"wa&1n&ndash;kathmandu#&umento$"sa##val&$erie$\'e-vache%/e-chivee-chivee%$rton$$vies$!y%#ing#!x##yah$&oda-ku',
+    '#!z$!e$%imulu"!k#%dsk/f#%eidze#(list.cps")lamydotis$&ngitis#$dren#"ef$%irich#\'odovald$\'ralkali&&mine-t',
+    '&\'propane&&septic&\'te(vii)%+diazepoxide\'&meform%!i&&c(vii)&.de/bicarbonate(!l\'\'orrhoea&(fication&&nating)"or+!s\'"e-',
+    '))catalysed)\'dioxide)%green)$like(+/chloramine3$/and&,te-dominated)&illite%"o-\'\'benzene\'.fluoro-carbons-\'carbons&&actate&(benzene/*$oate',
+    '&\'cephala&/difluoromethane($oxin&&ethane&-flourocarbons(+uococarbons**romethanes\'+orm-induced+(methanol+(solution*2/methanol/ammonium*$ates&+isocyanuric&\'methane&$phyl',
+    '+!s)#tum\'&lastic)%tinic\'&olymer\'$rene(\'opamide&$quin&!s\'*ulfonation)&phonic&#tic\'\'riazine\'&uluron&!x',
+    '\'$ylon%)propamide)&ramide%)thalidone&&oluron$(stridium"!m#"ns#!p"$nace$"ng#!g$!e"&o-chak$%hsien',
+    '#.anoflagellates#&banian$$bing$$hair#"c-%%binge%$ices%&on-top$!.$&aholic*!s$#has%"ol\'!a$#ies',
+    '&&winner%/abloc-jampacked%%ed-up&#red$%lates$.olate-addicted*#bar+$oxes-!y*$chip*&dipped*\'finding*\'grinder*&haired,#use',
+    ',"lt+%ousse*\'painted+%urple*\'scented+&meared(+i&egrave;re(!y%&philes$$ques$%roach$#taw##dor%&wiecki$#zko',
+    '$"un%"rs#&golisa#$ice\'&!*&)-limiting\'1of-cake-to-follow\'\'to-tell&#/no\'$risk\'#you&$ness$%doryn$$nich%(neachain',
+    '$&r-book&(mistress&&screen\'%talls%".6%!/&*darlington&\'english&$king&\'pinnock%"al%(boy-doll(!.%"ed%&isters',
+    '%&screen$"se&*ul-amboise%#ies&!s#$jiro$$nice$"un#(ke-chain%#/no%%apple*!s%&cherry%%d-off\'"up',
+    '%&points$#in\'&\'g-point\'!s$"ka$&watana*!s#$l-su$%angio)+carcinoma.2)%grams,%phies)1pancreaticography1\'orgaphy*&graphy',
+    '$&derton$)e-hepatic%/cystectography/-$mies)(okinetic-#ine-!n*+lithotomies0%ripsy*&scopes)\'rokinin%1dochoduodenostomy(-oduodenostomy))lithiasis("us',
+    '%$itis%*ra-causing((infested(\'related&*ic-looking(!s%,scintigraphy&*intigraphy&%taris\'#erl)+ol-carrying,$poor+"ic+$osis%*xystectomy',
+    '$%lagen%"ie$(mondleys(+oley-warner$$oepi\'"us%#nic$%uteca##mbo$\'czynski$\'ezynski$\'ondeley$$pedy&!r%%ingly',
+    '\'#ism$%utove$\'zcynski#%ndral&"ia\'*tescontain$%g-sun%"il%#jin%&kumdan%"up%"we$\'minnyon$#nam%%ohyop',
+    '$$tala\'"es&%menti$"we#%ochie&!y$#ked%(y-chooky$!m$%ph-ch$#rta$!s%-e&lsqb;s&rsqb&!\'&+-and-follow',
+    '&%expsr&"s.%%iness\'"g.#&p-chop%&houses%#job%1off-their-willies&)rientated%&sticks&$ueys%(variants$%anyan$\'inesque$*pe-lautier',
+    '($down(#off&\'r-knife\'!.\'-/distribution\'#ing\'!y%#ily&%ng-up(%s-off\'#nng$-stick-holders$&unnish#$quel#"r-',
+    '%,l-orchestral&&e-like&$ists$,d-challenged\'%olour&$like&\'passage(&tterns&%shape\')piralling\'*uccessions&$type%"ae&*l/arpeggio&\'te-like',
+    '%#ita%&otonal$(egrapher%(oghraphy\'\'raphed\'+#ies&$poem%"s.$!i%!a&(nopoulos%!c%&hippus%$onoc&\'retinal',
+    '%(stership%#wad$$lape%"is%.ton-on-medlock),upon-medlock$"ny$&ophyll%%rists$#rie$#tex%&hippus%+le-merchant\'!r$(us-based',
+    '\'+interruptus\'&leader(#ine&&/delay\'1echo/reverb/sound\'\'flanger\'&rattle&#ing&$sing&%wards#-ses-in-action$"sy$"un&%-ilbo#$tain',
+    '%"rd$$esov$!i%&yothin$!o#(u-fasman$!a$&dbhury%+hary/thames&$ouri%#ury$#eka$%ghing$%illy*%$nard',
+    '$"ld$$pana$#rou##vet$!y#&w-chow%\'michiel$!.$.dhuryeducation$$gule$&kidars#\'ybalsan$(jiljavyn\'*surengiyin$$nese',
+    '&$wski"$pman"2r&emacr;smologists#&-r-eek#0eschtlech-sozial%(tomathia#%icton$$mble$%ostat)!s$.s&rehy;tiansen%&\'sakes%&-style%(/airdrie&&helper',
+    '%$itan%%matos&$uzak%%opher&&stomos%!p%"se&#mas&"st%&t-baby\'&corpse\'(likeness)#ved\'&shaped\'pthis-is-so-delicious-it-seems-a-shame-to-go-on-about-it-but-i-feel-it-is-my-duty',
+    '&&aforou\'"in\'!l(,bloodymighty(#ler\'#mas\'#tus&#boy&-church/dorset&"el(#ton\'.n-democratisch($dome*!n("in',
+    ')"on($tums(#yng+!s\'!y&/ian-allegorical*%based+&ernard**controlled++um-romantic**influenced*(minority+%oslem*(national*\'truths.',
+    '*#tee+.y&mdash;around,*-and-water)"ne)!o*!s)/s-in-the-making*(/syrians*!o*#ted\'!c\'"e\'(&-lewis*#ike((/husband',
+    '((s/london\'\'fideles\'#nae(\'e&mdash)*/edinburgh&$kind&!l\'#eib("ss\'0ichdemokratische\'!y&!m\'!a(%s-day*)flowering',
+    '*#lit*\'morning*\'present+&udding*(shopping*)tree-like)#.it)(/january*#new)!y\'"oz&$obal\'\'doulous\'!f(!e',
+    '(#ias)#des*#his)!x("le\'&phenes*"r\'+&-rabin,&stefan+#ian)#ine\'#rfe\'!v$&topher#!o',
+    '$!-$"hn$&isprig$!m%!a&#col&!n&$scan&(tin-like\')ofocusing(*graph/mass-#ers($logy(%phore%&e-dome',
+    '\'(finished\'$iron\'3vanadium-molybdenum&!a&$less&!s&!x%*idotilapia&#um-)@51-ethylene-diaminetetra-acetate):ethylenediaminetetraacetic)(labelled)(polluted%\'ocentre&#lox',
+    '&(proteins&$scan\'&omatic)(e/contig&)tographic\'$rope%#pac(!k$*natography%,ically-tired\'"is\'*le-history)#d.2\'!s\'"us',
+    '*%ogist&*cyclograph&(function&&grafia)$phia,!c+!s&%loger),ically-based*#sts&&metres&)sociology\'&pheres\'+tatigraphic(*ratigraphy',
+    '(#pal&$zone*!s$\'ococcum#"st%#-lk#$ulew#,yptosporidia$&saetos&#lid&/nthemum-pattern&"or&$zine%#eum%\'ichthys',
+    '&$ppus&%thics%$lers%!m%+obalanaceae\'%eryls&#gon&%idine&&kamino&$lina("te&%melid\'!s&"pa\'$hlax',
+    '+!s&&stomus&$tile%"sy%$tean#%zanow(*skijustice$3escijansko-narodowe"(s.202/88"$teau#&honian"3u&mdash&mdash&mdash#(-chu-chu$$ming#$alar',
+    '#"b.$!a%!s$$bier&"ng%"ly%!s%(y-chaser\'%faced&&cheeks&#ish$"ut#"ca%%naque$#hes',
+    '$$k\'em%%-ball&%chuck+&-chuck&"up%!a%#ies%*le-chuckle(&gobble\'$buds\'(d-gently\'&vision&$ings%!o$$uito',
+    '$(chlihaus$$njai#&ff-bag&%chuff%!a&3-chuffa-clang-clang%\'inelles#0g-chug&rehy;chug$$anov$!g#$ichi$#lon$%nneag#$kara$"ha',
+    '$$kers$$wuma##lam$$dren$\'katurin$&mleigh#%mmage%$lees$$phon#&n-hung%"yu$#dar%$ered\'!s%!o',
+    '$$gang%#dan%"ju$$ichi$#ker%#ily%%y-ish\'\'looking&\'dogmeat$$nels&$ring$#ter\'"ed\'!s#!o',
+    '$!a$%cuaro$#pah#)quiwillca#&r-cock%&zurich$%banov$/ch&lsqb;es&rsqb\'%mdash\'%ndash\'/rehy;affiliated,\'manship&!\'&)-andstate()ttendance',
+    '(%ishop(&uilder)%rning((y-church\'%comer\'*fellowship()ortresses(#ree\'%goer.\'(inspired\'$keys\'#led(%oaded*!n\'#man',
+    ')!n($usic\')nominated\'-of-englandism\'(planting\'$roof("un\'&towers*!n(#ype\'&warden\'!y&&/bride\'&cattle(%hapel',
+    '\'%legal\'\'newtown((orthants\'2synagogue/register&"am&%crown&%es_as\'!y&%glade\')oer-which\'#rim&!i\'&ll-led)4/eden/macmillan/home*\'leading',
+    '(!y\'!y&$mans*$hips&(ward/nra\'&orkers&&y-type\')ard-based$$djin$\'firsten$!i%#lov%#nga$!k$!m',
+    '%#ful%-ing&mdash;but%!y$)r-rur-rur%\'ascaria%*igueresque&#ngs%"os##san$$eing%!s##ted%%r-ede$*ney-filled##ulu',
+    '%!l%"sh#$zlev""vy"$wang$%rae\'r%!e$#sky##edl#$ilog"#yan#&i-ming#%ldern$\'othorax%"us',
+    '%!e$$osin%+trypsinogen#"na$,oweth/father*&mother#&slaire$&oidine#&tilova$$rids%-oeisphaeridia""zs!,i&ecirc;ncia"%\'niib"--apr&egrave;s',
+    '"&/mmole$"ol"\'2c=cci2"&=-16.2%#8.1$#2.6%#2.4$#3.8#$0.02\'+&ndash;0.95&!6%"10\'+&ndash;1.11&!9%"21',
+    '%"95#!2"+a&ndash;kgb$)rehy;bcci#&-based$(contract$)organised$)sponsored$%types#!.#!/$\'billett$#fbi#+batta-bread##lly',
+    '$%bella$\'marughi$$poli#\'ncimino#$pino$!p#"ss")bachromes$$rial#&lings.##ola##ucu""c.#$ados$\'lamento',
+    '(#ial\'#sed\'#zes#0ciolina-inspired*&/harry$#one\'!r#"ek$#ro.&)ne-babble(!s\'"is#$hell$&ilidae$+lasomaniacs',
+    '%)id-keeper($like\'\'ophiles$"on%$rius#"il#"li%$tira#!o$&niidae#\'s-based%*compatible%(for-unix%\'on-unix$*/600-based',
+    '*+effectively*)to-encina%#aix%*cobol/vsam%"vs#\'utarium""d.#&aroids#*er-fuelled&%heads&&makers&(swilling%!.%%house%&making',
+    '%!y#!i$"um##rax$$olin#"se""ec$(hanowski%!i$&ierski##gos##lab$&covich#(mniewski#$plak',
+    '#"te#"za"#fel#"md"%galle$"ni$"r-&#box)"es\'$rown&&cutter&#end)!s&%galls\'&nawing',
+    '\'$hape\'%moker\'$tore%$eets&!s&0tte&rehy;smoking)!\')!-*#ash*#box+%urned,"tt*$ends*&filled-$ters',
+    '*&packet*%sized+\'tinking*\'tapping+"ip*&voiced)&holder),s&rehy;which*!.+$mike*$/day+\'tobacco*$were%$illo%&rillos',
+    '%!y$&tettes#)gie-sized#"no#&ognani&!e$$urel#"s.#"ua$$enza""he##lar",ii&ndash;cvi#!p#!r',
+    '#&lamini""la$#cap$$ntro#"by#"ea##fit#$gwyn#%iaris%"te%!u$%berto$#cap%#ian(!s',
+    '#%laris$"ia%!s$"us#$more#*t-provided"%mapps$$rosa#(bernauld$$rone#"co%!n##ent&!o$!s',
+    '&"ne#\'icifuga$$tero%%idine#$liss#%onian##per#&tidine"!n#\'&eacute*);-variety+$aste+6ma-v&eacute;rit&eacute#$amon#-cinnati-based',
+    ')"ti$\'losomas$#pac$"ta%$urus#"da$+er-coloured\'$head\'%paths\'&raking\'&strewn&$alla&#bed\'$lock+!s',
+    '\'(lla-like&%fella\'$ield$!i$$oruk$"ra#)e-cameras\'*rdiography%%films%(literate$"as&"te(!s$&casino$%emaaa',
+    '%$uild$$loop(!s$#ma-\'\'as-drug\'$city\'$hall\'$like\'%scope\'$test(#ype\',verit&eacute&)/bookshop\'/theatre/wedding&%gique',
+    '&3tically-sensational\'*og-raphers\')tractions&!x$+photography%#lex%#oem&!p%(rojector$"ra%+ea/tetralix&#ous$#tel%)ropolises$%women',
+    '$"oz$#ria$#ula&"um#$ical$%ewicz#"na%+bar-covered(!s%#min&)on-spiced&"us$\'cinatti$!i#*optilolite',
+    '$%xacin#"qe$*uantenaire%+i&egrave;me#"to$#ura#"va"$oaba#\'b/cibse$#anu$$otea#\'ccolato##ffe#"ne#,rog&icirc;la',
+    '#"cs#\'fa/adss#+her-breaker,#ing&"ed&#ist##ian$$nang$$vari#&penham%\'rfields#)repediums$!o%#bay%#xan',
+    '"(r&eacute$-rehy;culation#%/home#\'agettes$!l#"c.$#aea&#tus$#inn&"us&$zade%$umar$*le-related\'%sized(\'titched',
+    '&#s.i\'&/moths\'%quare%$ing\'(\'-around&"ps%!y$0otherm/microwave$"s.$!u%%it(s)\'(-bashing)%oards)&reaker(%parts',
+    '\'-/county-court\'\'breaker\'$ries("y.\'!y%,la&rehy;tion\'+ci&oacute;n\'\'r-based*$ound)*concentric)%ended)$plan(%ities)&zation\'%ted.a',
+    '(.ion&mdash;this+)-grabbing,(oriented+!.+*/emergency&$ized&"um%\'m-earth\'%polar\'\'stances&)ambulated-#ing-"or/!y&&baikal',
+    '),ion-ceremony,!.&$dati&"fe\'%lexes\'\'rential&(granular(#ids&)navigable,#tes&/polar&rehy;that+"ly&(scissile((riptions\'\'pective',
+    '.#ype,!.,\'s&mdash.(rehy;and-\'-causal.$none-".m."so&\'vallate%(s-artist\'$like\'(sounding($tyle\'$type&!.',
+    '&"sy#!d#(e-perdue$#fca$8ncester/gloucestershire0#!i$#ato$!c$!l%"lo$!o$"th#%kewwa$$ovic##men',
+    '$*us-mottled\'&strewn#%scale$$iums$#oid#$uelo$(mstances#$vice$!s"*s-&lsqb;pt$8diamminedichloroplatinum%%ouble$%lunar$*octahedral%\'riented',
+    '((isoprene$\'uralian#(alpinism$)pride=37%$&rovsky##bee#%cenje$&oworks#+el&eacute;e#$iley$"ng$$ster$%talia#!k#&paride',
+    '##ret#"sa$$bury$!i%"es%$ness$#sie#\'teachan%+rn-drenched(%flush\'!a(!l\'"s.$!o#%udror',
+    '#(-alcatel$"xe&!+##.es#%abria$(del-town\'"la("es$%risti$&tional%#ors#$eaux$+d-integrity&\'primary%#_in',
+    '$$rite$+s-monitored##her#&ibanks$/corp-scrimgeour(!s$"ed%\'s.there&$/abc\')countries$*gate/price%"en$1ng-for-violations$\'service$%watch',
+    '\')-advocacy)(uthority(\'centred(,intellectual(&reader($slob)&oldier)$tate)#uit\'//viewer/elector\'+s&mdash;see(\'/groups(+hip*douglas+$-law#\'ochrome',
+    '$%yenne\'(t&eacute#)r&ouml;en$$ange%"ta&+e-phosphate1)-dextrose\'3/phosphate/dextrose(&sodium$&idorus$)o&euml;ns%\'e&die;n%#han%"ne&$nade',
+    '$(us-based\'(enhanced\'(planting((roducing\'\'scented&!y#%terne#.y&ndash;ottawa%)rehy;born$+-birmingham&$ound\'!y&"ut%\'chicago("ld',
+    '%$folk%%gates&&oddess&%rimed%\'imposed%#kid%\'machine&,iddlesbrough%)organised%*plundering&\'rovided%%scale("pe&%ights&,ophisticated',
+    '&&triped\'#yle&\'uburban\'$ited%\'to-city%%users%$wise&&orkers$!.%&milton$%/boyz%+interceptor%#nec%%urban$#guy',
+    '$%light&"ne$#man%$usic%%ystic$%plans$!s%\'lickers$%wards""u.#&botaru##cci"%vardi#!i$)c-amenity',
+    '&)political$*l&mdash;an,(military%)-aircraft&$list&(produced&,servant-type%)/military&)political%!i&"am\'&n-clad*)ontrolled)#led*&ooking',
+    '))populated()/military(#ize&"s.\'&ation\',$.sir\'"er)!s(!s\'"ta&!z\'&ation\'\'#ed\'(!r%!l',
+    '%!y$!s%"me$!t%0as&mdash;centres#!s#!y"\'wi-zade""xi")yms&mdash"%zetas!)j&ndash;6*!a"#-6a"#610',
+    '"!f"!h"!k""rm!$k-ii")141433778"!5"#amp""ck"#k-8#!k"!l""ng!/l&agrave;rsaich#,eacute;mence',
+    '*(rambault$)grave;ves#*mdash;mode"!+"$-215&!t#"4b#*activating$)lexanders#)caralight#&gd5424(!6"*100/3ch134""44#!b',
+    '#"30#&aaarse$!r$#sen%#sen#*bburn/boat%!y$#ecq$&idacia#!c$#ach$$hlet$(k-spring%%ering%#in\'',
+    '%!y$$ton.#%ddach$"er$$inam%"st$!s#$ehan$$rwen$"sz&!.$"us#$ffam%"ey%"in',
+    '#\'ibourne$&m-free&$game&\'jumping%".2%)ant-based%!e&*d&mdash;an\'%-that\'$.the%&s-made\'&paying\'\'raising&)/benefits\'"of',
+    '$(r-obscur%(audience+"ts%7e-th&eacute;r&egrave;se&$mont%#ify%&rnonte%)sentients&"on%"ty%%vaux\'&"oy($ancy*#tes+"ly',
+    '$%ville#"ke#(m-digger%$like%(martinic%%shell$!2$$bake%$ring$%erkin%!y$$itat$%mying$\'orously%&urings',
+    '$\'p-fired&"on%%downs%!e&+d&rehy;down&!r&"tt%(ing-down%!t$$worm#\'n-based%)dominated%$type$&abogan$%carty',
+    '$&destin*!s%\'onensis$1field/oxfordshire*%peers$"ga%!y$$kish$"ne&!l$\'rickard$%sfolk%#hip$+t/neighbour%"on',
+    '%)happiness$%along$"ci%#ott$#gut$)ham-style($type\'*/battersea%"ow$#man$&pedout&(r-boards\'&bridge%$ison$!t',
+    '\'%esque#*r&iacute;n$"a.%!s%$wood%!y$\'borough$$edon%&morris%)nce-smith\'$ieux&(don:1961)#ian%(t-flavor\'&loving',
+    '$$idad&"en&.ge/psycholgist%!f&-i&rehy;cation\'&catory\'#ers&9ying/explaining/informing%(net-like(!.&!o%\'on-call\'#ets%#san&%simae',
+    '%#ty.$\'k(1984)%(-kennedy&\'mcneish%!.%)/chairman.\'/sunday&/gloucestershire&(hereford&(inventor&-pick-your-own&#wet%%e-ish\'%jones\'\'stewart',
+    '(&nthony(#rmy)$nhem\'\'banbury\')community\')education\'&former\'/gloucestershire(+ray/bremner\')historian(#ook\'&master(%ilton\'$nrpb\'&parent',
+    '\'\'retired\'\'schools("un\'\'teacher)$nant(\'rustees\'$west(%inner&%sburg\'!s&%trade%#ite%(minister%%sburg&-on/crossroads',
+    '&%ville$"os&"an$"ri&#her&#ker$!s$"te$#vis$$ysly#!s$"by$#dir$"en&\'/parent',
+    '$)h-version%#bea%&ganiff%(ing/like$$ical&!s%"na$\'p-knife%$able$*s&mdash;in&.rehy;conscious4$ness+&ridden+(specific%(\'/labour',
+    '(\'olitics\'$tory%$-100&"ab\'&ccents\',gainst-class\'"nd&!b\'$lind\'&usting&.categorization\'&entric,"sm\'*omposition(&nflict',
+    ')$tact&!d\'(ependent((termined\'\'istinct.#ive(&vision.!s\'(ominated&\'enquiry&\'firster\'#ree&&hatred\')istorical\'&opping',
+    '\'#ike($nked&\'manager(#rks&\'parable&(rational\'$uled(!n&\'society\'(tructure/!d&(teaching\'#ime&#use%..consciousness',
+    '&6collectivity/political&)dominated&#es/&%flair&%party\'(olitical&$race\'&espond&%skill\'*pecialised\'$tyle&$tory\'0ype/subtype/name%$:car%%books',
+    '&$s-in%#ful(!s%#ic\'\'(-winning\'&/early($open\'-a/linguistica("cl(3l-cum-shakespearian*\'looking*%music*+renaissance5.-enlightenment+#ock',
+    '+\'ounding+%tatue)!.)\'/gothic*(romantic)#lly*)y-trained\'!i($anus($stic(#zed\'*o-romantic\'\'s-based(#/de&\'factory',
+    '\'"ed\'!i(!c)(ation124+"or&"st&!x%&lessly%$ness%#old%*room&mdash)(-centred**orientated0"ed*%rebel',
+    '*$type)\'.police)%/hall*%issue)"s.%&wizard%)y-looking##tch$$hrin$!t%2er-clatter-clatter(#pop\'%brick#%uberg$"da',
+    '%(e-adrien\'%glass\'%henri\'&joseph\'%monet\'\'nicolas&#ian&!t%#ien&!i$(s-dieter%*e&mdash;if-(specific-%which&!\'',
+    '\'\'initial\')to-clause&!d&$ntum&"s.\'#ses&\'witzian%"it&"us(*-clapeyron%!s%\'tralium(&phobic\'\'ophilic*(oberised',
+    '%#ula&"ra#%vatum\'!s$%ecins%!r&"ie&#ley&"s.\'!e%!t$.icembalisticum&\'hordist*!s&#ula',
+    '&,r-&uuml;bung%"jo%\'organum$\'osporus$#pes$)ulinopsis#1w-and-grip-tipped%$back)!s&#ent%(clicking%&hammer%&legged%&prints\'#oof',
+    '%&shaped(\'rpening%$that&#oed$$foot$%hands$$ings$%marks$%track$!y#+y&rehy;wise$!-%%cored\'#urt*"er',
+    '%&eating%&filled&&loored%&haired\'&rdened%%lined\'$zard&%oving%&making&&ineral(#ing&(odelling%\'pigeons\'"pe)!s',
+    '&"ot%(reddened%%sized&%odden&(tiffened%&to-day&#ype%+with-flints%!y$-/calcite/silt%$loam%\'organic%$silt$%:rich$%allee',
+    '("er%$ourn$$cart%&ourter$\'derbuck\'#man$"ed%)y-lignite\'*sandstones($ilts$$hall%#ill$\'kickers$#pit\'!s',
+    '\'"ts$+s-sous-bois$%ton\'s\'%-land)\'e-moors(&stripe\'"ia\'!s$$work(#ers##zie$&omenae"\'coholic""e-#$aage',
+    '$!k$"n\'%&-again&%boned\'$reak&%catch\',onsciousness&$down&%edged&$fuel&#gas\'\'leaming\')overnment&\'healing&"it',
+    '&&nailed&&picked&$room&\'sheeted+!s\'&urface\'$wept&\'tasting&+up-the-mess&%water&$xxxx%\'/filthy%%2.com%"97%$able',
+    '&$zoom%$easy&"d.&+r-breathing(#cut(#out("up\'*/caretaker($home((polisher&*st-running%!i&$less&,ng&rehy;rota(%-aids',
+    '()/catering),disinfection)+replacement%.liness/hygiene&)y-painted(*structured%%orama%$room%/se-tone-protect\'"al\'"th&#in\'(#ess(+g\'-strictly)&-cream',
+    '%#ups%$zone$$r&gt&)mdash;and,"if&(rehy;ing%#(c)%5-\'k&auml;rtnerstrasse&\'cutting&*definition&#eye&(finished\'&ronted&\'handled\'#ead',
+    '&%piped&)sightedly\'"ky\')ufficient&(textured\'&hinker\'(lot-tlot\'&o-send&&vision&&washed(#ter\'#ing("th&#you%&.jesus',
+    '%"_a\'\'_little%#age&&id.exe&%nces.%\'cutting%!d%%ences&&r-case&&st-cut)\'skinned%*headedness%!i&!e&"n\'',
+    '(*-compounds)&houses)&system("s.&"sh%$link&"y\'\'(-focused(*identified(&marked)\'odifies(*prescribed,%ented()specified(*understood',
+    '\'#_no%&master&\'ountain%$pond%\'sighted,$ness%"up%&vision&&oyance%$wing%)y/mounted\'&thames$%vable&,ge-revealing)%stage',
+    '%\'e/henry\'%owner&$r/ap#!d$$ford#"ep$!s%&e-type$&thorpe%"on%%raval#)ft-tailed%"ed#)gg/bonsai&\'dorothy',
+    '-"or#%ithan#%lands$#lan\'"ds#+matis-bower)$clad$\'buterol$-en&ccedil;eau&"dy&\'t-evans\'%horpe\'$ina.\'(s/buyers)\'patient',
+    ')"tm("on%!t&"is$%itson$&mensen\'!t&!t%"ie%#ons&!w%!y$"ow#&naghan$*ched-teeth',
+    '()_together\'!r&$ing.%#ing$!e%"th$$nett$&tibret#%obaea$%demus$%medes$$phas#$phan%!t#.r&rehy;kenwell',
+    '$(estoried+!s$$fayt$%gerie%"ue%)yman-poet$(ic-civil&,al-dominated)\'looking))religious(!/)%admin))sales/i.t($ized&"us',
+    '$+k-assistant&)cum-clerk*-what-have-you&\'douglas&)in-charge&%level&,receptionist%&enwall&$sses%#in\'\'$gton$(odendrum$!s$&uchiea\'!s',
+    '$$vals#!s$!s#"tt%%ering%%raval#!v$%egate%+land-durham)./middlesbrough)%based&#end\'0ys&ndash;clifton&"ys%&r-dick',
+    '\'$gits\'\'looking\'%quick&#ist&*ly-devised*(isguised)&titled)&worded&&nesses%#urr#&wiston$$orth#%yburg$+hemsugworth$%ndert',
+    '$"th#$bbig#+c-sponsored$)h&eacute\',%;-ing.%style-"ed%"e\'&(-lancing\'\'riddled&"/1%!s$+k-and-point&+click-clack.#ick',
+    '&$like\'#ock&%touch&%whirr%".6%$amin%#ers&!t\'(ty-click\'!y%%himin%$imin\'#min&&ng.but$!o',
+    '$.quot-ponsardin2!e#!e$!n%4t&lowbar;conveyancer\'*mdash;head&!\'&!-\'(attorney\'$body)&rrower(*ureaucracy)$yer.\'/confidentiality)%untry',
+    ')$sign\'(families(\'riendly\'%group\'#led)#vel\'$need\'$only\'&prince\'&seller)%rvers((ituation(\'ubjects\'\'to-host(2urned-practitioner',
+    '&\'/agency("nd\'*contractor\'&helper\'$open\',server-based)#ver(&ubject\'$unix&$ages&\'centred&"el()ist-based&)filebuild&$hood',
+    '&%ilist\'"st&*s&mdash;as\'\'-france(%to-be)0urned-volunteers\'*/customers(-policyholders\'$hips\'$peak#+ff&rehy;top%!-&$arch&(breeders&(dwelling',
+    '&$fall&\'jumping&&slopes&$top.&$wall*!s%%caves%#den%\'hangers%(ord-like(\'/alison)/gloucestershire)%horse)%pilot\'(tanianus',
+    '%&scapes$(ton-mogg\'*/organiser\'%ettes\'$hall%!s#$gnet#!i$#cal$!i##lff#!m$$-bed$!a%&cteris',
+    '%!t&)e-control(&driven((modeller(\'related+%evant*(sponsive\'%.when\'+photographs&+ic-inspired(-ally-favoured\'#zed&)o-genetic(-morphogenetic\'\'genetic',
+    '\'\'therapy$\'b-downs&(possibly%!.%!e&%d_out&)r-covered(\'pruning(7turned-platform-builder\'(/dangler\'"s.%\'ing-boy)$down)%frame.!s',
+    ')\'village()/swimming(._in_connection%#out%"s.$"ie$"sy#+nch-perfect&+/motorcycle$(g-filmed&#ons&$silk%#eth%%films\'"re',
+    '&,ng-on-to-the+"to)0to-the-van-sides("ly($ness%%suits%$wrap$#hed$#ial%"c\'&&-based\')operating\'(referred&,/colonoscopy\'\'toddler',
+    '\'"l\'((-looking),pathological()/holistic),medical-type((ly-based+(executed+&minded&.ian-management)+/management&.o-pathological&"s.$%k\'-ed%)-clanking()ink-clink',
+    '(#onk%!.%(er-built(&hulled\'#ing%!s&$cale$"o-%*ptilolites&(yroxenes%"rd$+t-and-gryke&$like%$like%!o',
+    '&!m&+n&rehy;like\'#-al(%brown(+christopher(%davis($land(\'yeltsin\'%/gore\'\'isation\'$less\'%omics#"o.$0cquot-ponsardin\'$"ne',
+    '##p-7%/around-the-nose\'#sed%(clipping\'%opped*#ing%"in%#ons&"ut%%thunk&\'ogether$".4$!e$%joint$$pard',
+    '(#off)!n(%toned(&voiced&"ns&\'r-based((equipped%!y$%store#%quish%!y#"sh%"am$"pa$$sett',
+    '$,oridectomies\'#ses$\'tisford#!v$"es"!k"&mspols""o.#$acas$!d$"k-&$like&(shrouded&)twitchers%%room/',
+    '$"ve##cca$!h%#ard%&emerle&*r-calvaire(&porche\'"ed$"k\'%(-a-block&\'beating&\'crowned&"it&&makers&(operated',
+    '\'$peed&\'thieves\'(o-output(%wered\'&ripled,!r+#ing\'#ype&\'watcher%!.&#exe%&/alarm&%radio+&/alarm+!s',
+    '%"er%%hands%&ing-on(!s&"sh%&master%"s.&(in-moore&%miths%(watching&,ise-rotating&(ork-like)$like$%lough#(d-footed',
+    '$!/$"gy$&hopped(%ingly$%oaldo##ete#(fazamine$&ibrate#\'g-maker%&repair$%gable%#ers%#ies%!s$$hesy',
+    '%%mills$%maker$&thorpe%#own#,iche-muilinn$\'sonnist%(ter-like)$pump##mbe$"id$&pingly#$nagh%#hoe%%kilty%&lities',
+    '%%zepam$&dalkin$*e&mdash;so%&-clone&\'forming&&length&&makers(#tes&%probe%"d.%"en%%maker%$tics$$fert$!g',
+    '%#oes$"in&#ger$#ked%!y$$main$!t%%ibret#"ob$&nacool$$thes%#ies#*p-clopping$!s$#ton',
+    '##ran$"et&!s$%oform#(sbetason$.e&rehy;fitting+\'grained%!\'%!-&\'at-hand($tack&(branched\'$uilt&%caged\'&lipped',
+    '\'\'ropping&%dated\'$rawn&(fastened\'"it\'%urled&\'growing&$kept&$link&&meshed\'(igrating($king\'#own&\'of-poll\'!n',
+    '\'&earled\'&lanted\'\'osition\'&ressed&%rings&&shaves(#ots(&utting\'&tudded+#ing\'&upport&)to-market)(the-line-$vest(\'lerance',
+    '&&valued&%wound(#ven%#.by&#run%(/charmat&&thames%"d-\'&access\'(boundary\'&centre($hest(3ircuit-tv-monitored,#lar($ycle',
+    '\'%group\'&string(%ystem\'%world,"er.!s\'$xxxx%\'fitting%&hauled%"in%+ly&mdash;do\'(-aligned*$lied)\'nalyzed((carpeted',
+    '(&felted(*interwoven(\'planted))rescribed((reasoned(#set)&imilar)%paces(%typed(&worked\'*_into_line%%mouth%&nesses&#ing%&packed',
+    '\'-than-expected%)st-fought\'%udded%&t-free\'*reformists&#ing&$load&$ting%#ure%!y$"in&\'g-time.$$kelt%!y$#ley',
+    '$!s%#ies$&tridia$%ures.#,t-associated%#bey&&usting$!.$"en%!s$&felter$(h-cutter&&draped(&essers&(finisher',
+    '&%lined&\'of-gold)&silver&&padded\'(roducing&$shop\'$tall&\'tearing&\'weaving\'&orking&$yard%$/mop%%bound%&capped%\'erholme',
+    '\'&\'-prop\'!-(&buying(&chests(%hooks(&lining(&making*+nufacturing($pins)#rop(%sense)$hops)$peak)%tyles)%witch',
+    ')$hick\'+/paint/draw\'\'_and_so)!s\'&aholic\'%brush\'%horse\'%lines\'$rail\'$shop\'$wise%\'folding%,ier/abingdon\'!s&"n\'',
+    '),manufacturer5!s($.she(\'/decent(!s%&makers%$sful%$yard$$poll$(rimazole$$tery#,ucestershire$-d&rehy;capped%%-bank\'(uffering',
+    '&\'dappled&\'flecked\'%orest)"ms\'$ront\'&utures&&hidden&&making\'\'ountain&,of&rehy;dust&$pale\'&iercer+#ing\')unctuated&$rack',
+    '(%sting&%shape(&rouded\'#oft\'(pattered\'&tained(&reaked&$tops("rn&\'walkers\'&reaths%#.of%%/that%$belt&"oy',
+    '%$fall&%lakes%%inids%$land&"et%&scapes&#hip$(gh-leeds(#ike\'&parker\'%style&7/armfield/stein/adamson\'&taylor((ransport&%field',
+    '&6mills-coleraine-kilrea&%taney$#red$"se&(au-class$"t.%!h#\'ve-pink&\'scented%%llyan%(n-hooved%%r-hay&&leaves#\'wdisley%!y',
+    '&&scenes\'#ize&%white%!.%%about%!e&$sque&!y%&fishes%$like##xam##yce$$ness$!s%#ter',
+    '"$rtap""sa#%uters".ub&rehy;except$!\'%(s/ground&$fall$#(s)$(-bearers%$call\'%rrier&&entred&$lass\'\'utching&(rossover',
+    '))recording%$face&%ooted&\'riendly%%goers\'$ings%(handlers%#ing%$land%&mascot%%night%)organised\'(ientated+"ed&*wner/mafia',
+    '%#pop%\'runners%%stick&\'winging%$tail&&esting&#hey&$urns%)v-country&%iable%(wielders*#ing$(.perfect$)/american&*ssociation',
+    '&$isco&"ub%"my%*restaurant%(workshop$!b%\'er/good%%iness%(y/tribey$#dom$%faces%%ooted$$goer$)head-feel%%ouses',
+    '$\'lengths&"ss&!y%#ine$&makers\'#ing$-root-infected$"s.%"/4&\'players&)societies&&unions%$cene%$ters$$wise',
+    '#(ckheaded%!y#"de$"ge#)e-hunting$!.$*dopolybats$+s-citations%!.#!g$#son%#ton#\'jnapoca##kas##ley',
+    '$"bs$&pering%#ier$*sy-looking\'(sounding##nie&$more$\'k-click+\'-mumble+#ing&%thunk$!t#%ppins#%rican\'"un',
+    '$#man##saz$#tal\'!v%\'er-bomb()flowering(%sized(*to-cluster\'#ed.%$ring#(t-napoca$&ch-bag&)/pressure&#bag&$work',
+    '&!s%"er%#ing$+ter-clutter($free\'%brook()uck/chief\'!y#\'ysenaar$#tia"$viii")wyd-based&%powys%+/shropshire$$edog',
+    '"$xiii##xix$!x%"ix%!v"&ybourn#&dbeank$\'e-based&%forth%!.%(/mossend%*bank-based)!.&%ridge%$sale',
+    '&$hore&$ider%$view%$well$$ogan\'!u#&mbande$"en&#iid&%shore%!r#%nched$&derwen%"wr#"pe',
+    '&&labral$#pan#)ster-pipe#"th%!a#"ve##wyd!*m&amp;sup2#)times;1.3*!0)$20cm""-1$".5%"80$!0',
+    '##240#!3$"35#"5s#$high#$long#%scale"#.91"!/#\'&frac12#!1$!3#"30#!8#"aw',
+    '""23"#500"!7"$a/20$%micro#!j"#bor#+r-activated"#d.1$$9889#"r.$!e#!t"(e-linked""g.',
+    '"\'ip/cmis%%x.700#!s"#kyr"#l\'s""md$!r#)unication""n7##d.1&#432%$8273&#494"#ome#)s-backing',
+    '$!t#!t"!p"&s/data"#t10#!e#"te"+v-&bgr;-gal"%water#$bran#!s""yb"!z!&n-1000##235',
+    '#*a-directed%&funded%+institution0!s%%ncdad%*university$(/scotvec%#tec#!c#!e$"us#!s"%bc-tv""ca"1d&rehy;supporting',
+    '#!.""en"!f""it""n/$#usa"\'odhonna#"ke#"oc""pp#!q#!z""qx""rg"#snc',
+    '#$tant"+t-dominated$(inspired#!g""vt!0o&mdash;decision))operating#(ndash;co)#lld)%opted#/rehy;consultant2!s)*rystallize()interpret()operative',
+    ')&resent*&oduced($rich(+terminosity()villagers(&worker#&sacute#(ucirc;ts"#\'s.##way"#(g)"#+2h"\'-acting\'&vators(!e',
+    '$\'daption(#ors$$gent$,mplification$!n%%chors$)rchitects%*ticulation,#ory\'#sts#&backed$#oss$&randed%%okers#%caine',
+    '%%ptain$%entre$!h%!.%*airmanship(&person&$nnel%-romatographed$(itations$&limber$$oach%"la%)mmentator&%posed%*nspirators',
+    '.!s%)unsellors$&reated("or*!s%%ystal*(lization$)urricular#\'debtors%\'fendent%(pendents%%rived%6velopment/co-marketing$(irection)&orship',
+    '&%posal$(ominance$&rivers\'#ing#\'editors%!s$%lutes$&mperor&&loyees$%ntial%$zyne$!o$!p$$rced$*stablished',
+    '$\'xecutor#,facilitating,"or%$rmer%\'vourite,!s$&inance%#red$*oundations$(raternal$\'unction&"ds#*generation$&rantee$\'uardian',
+    '$\'abitate(#ees(!s$%eaded&#rse%-wlett-packard$&osting#*identified$1mmunoprecipitated3#ion%&perial$\'ncident)!s(#ing%)heritance',
+    '%$side&\'tructor$(tinerant#&joined#(labourer%%teral$$eads&%rners%(gislates+#ing$)ibrettist%&gation%\'nearity$+ocalization*"es',
+    '%!n&$aged)$ment$!c$&embers$\'igrated*!s)#ing%$ngle(#ing$(orbidity&#ons%$tion#%ni-as#&o-o-ld',
+    ')#ers$\'ccurred(!s$\'dinator$0p&eacute;ratives%(eration\',%.gone,$/and&&tition%#tee&%ition$#rd.&/inator/economic-(national-&yvonne',
+    '$\'ximeter#&parent)"al)"ed&)ticipants\'\'nership%$stor%&yments$(ilot-was(+/instructor%%oneer$)laintiffs&\'ywright%\'oughing$(oisoning',
+    '%(ssession&/tmaster-general$*recipitate&%sence)&tation*#ing*!s\'&idency%(ocessing*&or.the&&ducers&&fessor&\'grammed&%xamol$)ublishing',
+    ')"ed##ran%%ppers$/eceiver-general\'$ptor%,ferentiality(!s%\'gencies(!t%$late(#ion+$ship%,presentative,"ed%(searcher',
+    '+#ing&$ided)#ncy*$tial\'$ster&3pondent&mdash;bogus4$when$$ider$%otate$&unning#(scripted)&writer-#ing$(egregate%(igneurie',
+    '\'"ee%$nger$(kippered*!s$\'ourcing%)vereignty$*ponsorship$%tarts%%riker$(ubstrate%!n%$rety&\'factant#(teaching%(rminous.',
+    '$)herapists%%inker$&rainer\'$tors&)nsfecting-#ons)(ormation(&lators(&porter.!.%/easurer-at-wars$$wins#\'variant$&enture*!s',
+    '+!s$\'ocalist#$work&(shippers$.riter/arranger#$xxxx"#.al$%ntrim#%litt."!/""10#!6"%2,10%#)-buffered#\'/energy',
+    '"\'accused$,h&rehy;style%!-&&bodies\'&uilder&5cum-manager-cum-union&"in&%lamps(%ntern\'&engths\'$oads&%maker("ng&\'painter(%rties',
+    '\'#hed&$tour\'&raffic(&ippers%*/boyfriend&\'camping&0hoverspeed/coach&,manager/guru(%rtial&&player&&school%%craft%3es-come-locomotives%$ford%\'ing-aid',
+    ',!s(,/development%%lamps&%iners%%maker%$ride%\'warming&#hip$$tive#)d/yourdon$&jutors$*ministered$!s#$ffee#*ggregation',
+    '$%ulase\'1tion/flocculation+!s&"um#$homa#*k-a-leekie$"er#-l&rehy;barges*$cost*)generated*)producing$!-%#and%#bag&%iters',
+    '\'$rner%\'carrier("ts&&utters%$dark%)efficient&%xport&#yed%%faces%,gasification%$hard\'%uling&%ewing&)unk-peter%#man',
+    '\'#ter%#oil&%polis%&pitted&$rice%#red%$scar&#eam(%rcher\'%lling&%hafts($les.\'#eds&&idings&$moke',
+    '&$tore%#tip&#own%%wharf\'&ippers&&inning&&orkers$$/gas$%1,230$$_out$#bin$%chief%#orp$"er%$sce.',
+    '$%forth$$hall%#ill$,ici&oacute;n%#ion%-ng&rehy;stage\'(-station%/sland-dungannon%.tion&mdash;see)"-a*%based*-for-clampdown.)democracy%#zao$\'masters',
+    '$&s/logs%#ack%#hed&"ip$#ter%#own%%rucks$)y-skinned#)nalgesics#(rctation$\'dinated)#ing$"ns$.se&rehy;fibred&\'-bladed',
+    '\'#cut\'\'fishing\'(graining\'\'looking\'&minded\'&pelted\'$spun(\'tranded\'\'tongued\'&winded($oven&!n%#ing$*ticulatory#-se-williamson',
+    '%&-bound&\'defence&\'hugging&&lines.&\'poverty&#to-)(interior%)al/marine%&eering&\'r/table%+guard.priam%%line.%$road%$ward#-t&mdash;stand',
+    '$(-and-hat%#but%%hooks%)of-joseph&!n&$wner%\'pockets%&thread$!.$&/dress$$dyke$"ee%\'s/chief\'&dancer\'*springhill',
+    '%!x$$hook$#ian%"es%-ng/laminating\'"s.$$less$&makers&&n/pool$#ney$-s-on-the-seat&\'viyella$"up#\'uthored#%xial.',
+    '"&b-bers$&called$&shaped$$webs##aea$%lamin%$t-58\'$free&!.&(initrate$!m$$nglu#&b/rnib$#ers$)le-strewn',
+    '&$r-up\'!.%%stone%!y#\'denites##erg&"er%#ine%"ly##ian$#ere$"ja#%lemen%#ntz##ner',
+    '%%/vsam%"77$"rn#*ra-goddess&$like$!e%#tti##seo#4urg&ndash;portuguese#+web-pattern&"s.\'(/tatters")ca-barons%$coal\'#la.',
+    '(%onial$,ine-addicted.#ion(\'induced(-manufacturing(&taking(%using$%leros$!n$#rel#%ceral$%iante%$dian\'+oidomycosis(#sis',
+    ')"id#$eral#(habamba.%%irman%&mbamba$\'enilles%!s$&ilicus%"to$$leas\'"ta%(iomyasis$0rane/oxfordshire(&public(!s',
+    '$$ylis##ine$!s#*k&rehy;shy$\'\'s-foot$--a-doodle-doo1!s%)cock-cock%\'feather&,or-the-night%\'masters%1of&rehy;the-roost%$prod%%rings&#ock',
+    '&&parrow&$tand&&ucking\'"re%%tease)#ing&\'hrowing$%ainge%$mamy%%teels&)oo-plumed$$born%(urnianus\'!y$&ed-hat',
+    '%$n-ey%$rham)&-based&-nee-yorkshire)!s&%sands$\'ingford\'!s$-le-doodle-doo\')gatherers\'&shaped&&carrot&$moor&!r&%shell',
+    '%&icrane&!n$%marsh&%sters$&neyism*!s$#pen%-it-adjustable(&straps*#yle($wide\'!.$$rams%#els%)oach-like',
+    '&2ft/gloucestershire$-s-of-the-rock%(/against%$hall\'*w-prompted&#oot&#utt%&parrer)"ow$.tail-flavoured)%glass)$hour)&length*%ounge(#ing',
+    '$$wood$)y-looking#/lusions.lusions#&o-cola$)/jeanette$)a-adviser&%beans\'\'reeding(#own&(coloured&)flavoured&$leaf&(magnates&#tin%#nut',
+    '$!d$!i$%luche$0nut&rehy;growing\'&-cream(%style($wood$,on&rehy;like$"rp$$ttes$"ve$"yo$#zza#!q#!r',
+    '#&ulture)!d)!s#"xa"#d\'n#"-2$&acting%\'lmighty$(broadway$\'erudite$(flamenco$(japanese$$like$$meal%\'ilitary',
+    '#%a-ias$%fiene$!r$,syl-oriented$#zzi#$beck#$ded\'%!r$#in\'#+e&rehy;name.!d$!-%%block&$ooks&$reak',
+    '%%check&\'racking&*um-driving%&driven%&making&%ixing%*of-conduct%$path&%hrase%$room%%sheet*!s&%witch+"ed$(/message',
+    '%%value$$able$$book(!s$3center/objectcentre$\'fendant(#ent$$ines$\'manager%"en$$noll$(pendents$,s&mdash;each%!.$\'termine',
+    '$&worded$!y#"ge##ham#%iaeum$\'cillary("is$\'ficacao&#ers$$goro$"na%(g-office&//classification$"sa#&ktails',
+    '%!a$(ing-tree#$mans#%nover#,orn&iacute;u#.piece-daughter#$s-up#(tabulous$%horpe#"ul#&zienny"&e-kell#"ck#%dited&"or',
+    '#$ffic\'%iency*%t=0.8#)lenterata+!e%%stium$#ian%!s%"us$#obs%#ria&"um%-scleritophora&*phaeridium$\'urosaur',
+    '\'!s#)n-hickman$$raad$$vvlf$%zymes#*perstraten#\'quality#!r$%cions&&vities$$ulea\'%oalta\'%scens\'"us&"um',
+    '$%ernal$$raks#\'urville#$vals$(olutions#&xpress)"ed$&truded\'$sion"$face$&milial#"er#&f-choc$,ee&rehy;cups&!-',
+    '\'\'blender($rown\'$chat\'&filled*#ter-!s((lavoured(&utures\'*harvesters.#ing\'(machines)!n)$rket(#ill\'\'pouring',
+    '(&ellers)%rvice($hade(&tained\'#the(#ray)%olley\'\'warming&!.&&/lunch\'&pepper&$mate%+n/ploughman%%r-box&!.',
+    '&#ers&#ing$!i%-n&rehy;plates&!-\'\'bearers(%odied\'%cover\'#lid\'$nail\'%shape($tyle&#ish&#lid("ke',
+    '$!y#$ield$&nanced%!o$%route#)luampicil#+ractionates##ton"*g&ndash;in#%-sure$&wheels#"ea$(dipresse$(nerating\'!s',
+    '%*tly-argued##ged%!r$"ie$!s#"it#*n&eacute;e$$atic$&icioun%#sed%&tariat&,ive-academic+(ffective*%based*)epistemic',
+    '*)practical1!e)\'ly-held$%omina%&scente#)o-fawcett#$rino#%shall#$uate$%illes"-h&eacute;rent#"ab%%itant\'$ing.\'"or',
+    '\'!s$#nim$+sset/panuke$"ve#!e$*&rehy;sive$\'n-solal%)/children&%vicar$&rences$%sions#"la##orn%$t\'s-&"s.',
+    '#!u$"ne"%i/mod#"as#\'cidence#!d#%ffeur(!s\'#ses#"gn%"ac#"l\'$%-core%\'springs%(tappable',
+    '$%/left$!a$(ed-round\'&spring$%labus&"ch%#ege$%sholm#&mhleun#"n-%*collecting%$flip%%image&*n-the-slot%&moulds',
+    '&$ized%\'tossing%&weight$\'/object$*cedentally%\'i-dents&#de.(-nce-detection,\'gravity*"ia)\'tal-but*"ia,!l%\'ubation$)ing-irons',
+    '$$s.if%\'/tokens%$hoot$)tegration&(rfeiters%#ise%#reu&"in#\'r-grown$+echat-achan%!s$!t$$uisg\'!k##sir',
+    '##tis$!u"&jacaru#\'uangcos"!k#(e-aholic%&cellar%#dry%%fired%$like%(smelting&\'nortin\'$%freak$#men$$rtme',
+    '%&owners#"ie"+l&egrave;re$+rehy;lision#(-leagues$\'oh-nell%#urs$$umns#&.-gen.$"12$!j$#pl.#$/jog##1a1#"a*',
+    '$\'ba-side$"da$$ford$$iuta$\'martino$)nder-type("ed$!p$$rres$#ton$%wrean#$balt%"rt$"ea%)ck.monday',
+    '("sm$&iensus$,ourne-browne$%round#&cannon$\'hester-*$just%"ia\'!n&"ca\'$umns&!s$$ombe$!y#&d&rehy',
+    '$#(s)$$-air&&pplied%\'bathing&%eaded&$lown&"ox%$call)"ed&$hain&&omfort\'%untry%%drawn\'#ink%%frame',
+    '&%usion%$hall&(eartedly%!i%$like&&ooking%\'moulded&%utton%(pressing%)resistant&#oll)"ed\'#oms%\'setting&\'melling',
+    '&$pots&&torage)!e*!s%$test&\'olerant%$weld&%orked$#.he$$/hot$#ale$#eel%%rshaw$%faced$#ham',
+    '$\'inghame\'#ley$#ly.$#man$(ness-yet$.rick/residents%$ooms$%sores%#tar&$ores&%reams$.water/tropical%*ell-turner$!y#.e-king/drayton',
+    '$\'/arthur%%house$&bourne$%ccion%%terol$$dale$+ford/forest$\'harbour%#ill$.man&mdash;that.$were\'%-noll\',/countryside(\'library\'!d',
+    '$&oliids$%peper%#ort$&ractal%%ectal%%idge\')%-like*&taylor)\'/middle$*s/building&&former&$wife&)yachtsman%!t&$ipol',
+    '$$wood&%rthys(!s$*y/business%!s#&feians$#ins#%grove#%herne$#oun##ias$&c-type$$ditz$$epes$&gation',
+    '$"ma$\'n-thome%$dres%&earity%$ical%(moynihan%*ton/animal%"us%$wood$#que$"sa%$seum$$tis.$#upe#$kirk',
+    '+$;aux,!s&*grave;gues$(-oh-nell$/ab&rehy;oration&*orated-and*$ion.-#ism($tive%#chs%"er%(ge-maker\'!.\')/drawings\'\'n-based',
+    '("s.%!m&!s%!n%$pse\'(!.(./consolidation)"in()d.tonight(!r\'%ibles%\'r-bones\'+decorations\'&makers\'&points',
+    '(#ize\'+transmitter&&/white&-bone-breaking&!e\'"ts&$s-up%#sed%1teral-commissural*$ised+&zation,"ed%$voce$"co%#utt',
+    '\'\'ue&lsqb)*s-in-crime*!.*\'/stress&#que%\'ct-call\'(/deliver(&obtain\'$ania\'\'ing-box*!.*+/delivering(.on&lsqb;s&rsqb*&-based,"ox',
+    '+%point+$time*!.*)/delivery+\'enquiry+\'library*#and*%neurs*"s.+&/plant,(recovery(-ve-bargaining+(decision+$farm*%/tail',
+    '*-ly-controlled-\'managed-%owned,!.*$ness)#ise+"im+"ms*(t&eacute*\'zations\')or-wallah)*/christmas*&dealer+$onor*(restorer',
+    ')"s.%"eg&%nette&!r%$gaue&\'e&mdash-";a.\'because\'%-aged(%bound()developed((entrance()initiated(\'leavers(\'project',
+    '($wide\'!.\',/alternative(#you\'"18\'\'s.under(:/polytechnics/universities)(teachers&)iate-type&"ue(!s%"ma&%bolae%$nage&#der',
+    '&!n%#ran&#ies%$sden%$tias&#tes\'!s%-ville-sur-mer%%ymore&!s%%zione$#ick%)ding-beam%\'e-cross\'(labrador',
+    '(\'jackson\'$ies.\'$yman&$shaw%\'flowers%#gan&#non%$mate(#ion%"nf&,g&rehy;ridge\'%-bred\'&bourne\'$dale\'&e/goat',
+    '&!o&0s&rehy;featuring\')-designed(/howgill/medical(&willow\'\'/andrew(\'fontana((resident\')associate\'*on/housing)!s%\'s-smith(&quires&\'/thames&#haw',
+    ')%-free%#ton$\'lgatlve$#obm%\'camenta\'#ted(,ion-building($lons%%graph*!s+!.%\'morphic\'#sse%!n&#ges',
+    '%$oney%$ques\'.ially-speaking%-redo-mansfeld&#ing%&ssally%$type%$veti$%uders$"wn$)y-wobbles%#ear&)r-bristow%!n%$rium',
+    '%(n/farmer%!p$&enares$#ris#\'nbridge$#eis#&obinae%#oma$&calise(&zation&#sia&#ted%)otronises$\'gastric%"na',
+    '&#ole$#hus$#lur\'!s$3mb&eacute;-le-fosse&3ey-les-deux-eglises&+i&egrave;re\'\'a-style(&n-born**venezuelan)"as&\'o-bound((to-kandy%$endy&!r',
+    '&&ialism&\'ripping%\'/rectum%!c%!e&.l&rehy;general\'(-husband("in%)ial-based*"oy)(educated)+interloping(\'isation*"ms)&zation',
+    '&#es.&#ser&#zes%#nus%!o&$cyte&*scopically*)y/patient%"s.&%copic*"es%"um%"y\'&\'-sticks&\'/plaque',
+    '$*r&eacute;s%!a&&do/san&"ma&#nce&!p&%tions\'"us%$coat%"es%"id&#fic&%meter+!s&%ssimo',
+    '%"no%%plush&"ro%$scan&$ense&#pin%&vision$%sally%!s&)eo/pineta\'#ums&"io&!o&$uses$#tis',
+    '$!u%*r&mdash;no\'*rehy;coded&#(s)&(-balance.!d-#ing)!r)#sed(\'lending\'&change,#ing)$oice(&lashes(+o-ordinated',
+    ')\'nscious*&trasts(%razed\'\'display\'\'effects((ncrusted)&hancer-#ing\'\'feeding(%illed*"ms*#ter)#xed(#orm+!s',
+    '(*nsensitive)\'tensity+\'ractive\'%keyed(&illing\'\'mapping)"rk+"ed,!r-!s+!s)"ss(%ixing\',photographed($late',
+    '($rint\'&ramped(%inged*#sed(%ubbed\')sensitive("hy(%oaked(\'pectrum($teel(2upplement-magnetic\'$talk(%hemed(#int\'"up',
+    '\'$wash+"es+#ing)#ves()ord-users&%.here&*/intensity\'\'pattern(*erformance*,m/highlights\'%shell&#_as&&ations&#box&$care',
+    '(#ded&(ed-glass))immigrant)&sprite)$tile(\'/banded)&permed&(fastness\',ully-attired,\'dressed,#lit(!n&$ific\'\'ng-free*"in',
+    '\'"se&%less.*$ness&#man)"ia(#tch&\'printed+#ing&%quest&%s-the\')/finishes\'&:brown\'%tudio&$wash*"ed',
+    '("y.##pan$%epper%$rras$#itt$&orteur*!s%&scopic+$ally%!y$%rensa$"us#%quiri##ron#$sons',
+    '#&t-like$#.38$!a$#ham\',&mdash;fines%#orp&#use$%ishly#*ubriformis$"di$(mb&aelig&"a.\'!e\'"ni\'#ria',
+    '("ns\'$dae.(!s\'"na\'"te&*us-bashing(!.%-cille-columba%"es%%kille%$mbus%2n-arcade-supported\'\'breaker\'$drum\'$like',
+    '\'#row&!a\'*r-squamous($ised&\'ist-and*-with-attitude&)s-compact$&nteers$$ssus$#tea#$vend%"rn$#ile\'!i&"ls',
+    '#3wall/worcestershire$#ich%!n#$year%+r-fergusson$!n$"te#"za$#ium"=m&eacute;die-fran&ccedil;aise.)s-ballets$%mdash$-rehy;missions*$unal,&icator',
+    ',!y*)laint-led/!s*%osure*(rehended/&sively*0uter-typesetting#/\'&eacute;grande$"st#$(89)#&-/con-$\'goddess$-muni-ca-tions$$pete$%sheep',
+    '#!2#&a-like%$type$!c%$chio$#dre$!e$!g$"nd%!i$&panies%$nies%&rative$!r$%tosed',
+    '#&b-back%"on%$rows%$sack)!s&&calpel&(pinelets$$alou%"nd%-t-cannibalism)$sual(\'haplain\'&jacket\'&master\'%ready',
+    '&!.&%ively()it&eacute&$tere$&ed-out%%rbach&"ed&!g%\'s/group&"es$(i-baking&(roasting&(steamers*#ner&(wardrobe',
+    '%#doc%"na\'"do\'$ison\'*tion-coded,*room&mdash+"al($oire)\'rially.\'%zione+!i&-e&lsqb;s&rsqb\'+-harvesting(\'mounted\'(d-bomber',
+    '(&/joint&$itis%#one%#pen(!s$#les$"o\'%"rt$#ray%$etum$+s-and-paper$*ustibility("ng(0on-metamorphosed+$zone',
+    '("ve\'"or#!c$#are$$raft##dap%"ta$"ef%$mned%!n%"x\'&)-attached&\'/sucesu#+e&mdash;she$(-and-try',
+    '%\'capital%(downance)!s%*every-week%%first&"or&*rom-behind%\'hithers&<ome-and-all-will-be-forgiven%fon-fred-we-give-you-all-this-advertising-how-about-an-in-depth-profile&"ut%"to\')-skegness(*the-doctor%(uppances',
+    '$".2$%/from$%_over$+back-making%$lack$6dienne-turned-crusader\'#tta%\'y&ndash&!\'&%-even\'&lovers\'%music\'/pop-and-hobbies\'&writer&&/music',
+    '$"ga$$lier&&n/igor%)y-looking$#nce%%dable%"en%$sour%&tarios$*onyouwhads$)r-shaving%#ica%"s.%#ton$"s.',
+    '&$ible&"or$(t\'s-tail%&-blaze&&hunter',
 )
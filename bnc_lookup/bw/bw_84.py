@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_84 = (
+count_84 = 6694
+
+heads_84 = (
     'c.1947&ndash;87',
-    'c.1950',
-    'c.1960&ndash;89',
-    'c.1966',
-    'c.1971',
-    'c.1973',
-    'c.1980',
-    'c.1980&ndash;90',
-    'c.2.5',
-    'c.2000',
-    'c.2000bc',
-    'c.205&ndash;70',
-    'c.21',
-    'c.2150',
-    'c.23',
-    'c.24',
     'c.25',
-    'c.25.',
-    'c.260&ndash;340',
-    'c.2600&ndash;2500',
-    'c.270',
-    'c.28',
-    'c.28&ft',
-    'c.288&ndash;335',
-    'c.293',
-    'c.3,500',
-    'c.3000',
-    'c.30a',
-    'c.32k',
-    'c.33',
-    'c.330-360',
-    'c.350',
     'c.372&ndash;287bc',
-    'c.40',
-    'c.420',
-    'c.425',
-    'c.438',
-    'c.439',
-    'c.440',
-    'c.452&ndash;413',
-    'c.46',
-    'c.460&ndash;390',
-    'c.47,000',
-    'c.475',
-    'c.480&ndash;411',
-    'c.480&ndash;425bc',
-    'c.480&ndash;c.425bc',
-    'c.49',
     'c.5&mdash;7',
-    'c.500',
-    'c.52',
-    'c.54',
-    'c.55',
-    'c.577&ndash;655',
-    'c.59',
-    'c.6.1',
-    'c.6.2',
-    'c.63',
-    'c.630',
-    'c.650',
-    'c.66',
-    'c.7',
-    'c.7,000',
-    'c.70',
     'c.700',
-    'c.72',
-    'c.737',
-    'c.750',
-    'c.800',
-    'c.800&ndash;400',
-    'c.830',
-    'c.840',
-    'c.8kg',
-    'c.9&ft',
-    'c.94&ndash;55',
-    'c.950',
-    'c.951&mdash;61',
-    'c.9550',
-    'c.960',
-    'c.970',
     'c.970&ndash;930',
-    'c.973',
-    'c.979',
-    'c.980',
-    'c.980&mdash;1016',
-    'c.985',
-    'c.985&mdash;c.991',
-    'c.987',
-    'c.990',
-    'c.991',
-    'c.a.a./national',
-    'c.a.d.m.r.s.',
-    'c.a.f.o.d.',
-    'c.a.i.',
-    'c.a.m',
-    'c.a.s.',
     'c.a.t.s',
-    'c.a.v.',
-    'c.ad300',
-    'c.ad905',
-    'c.analytical',
-    'c.anderson',
-    'c.b.k.',
-    'c.b.s',
-    'c.berardenga',
-    'c.biol',
-    'c.c',
-    'c.c.-m',
-    'c.c./foe',
-    'c.c.d.s',
-    'c.c.h.',
-    'c.c.p.',
     'c.citrinellum',
-    'c.claus',
-    'c.d.e.',
-    'c.d.garrad',
-    'c.d.r.',
-    'c.d.t.',
-    'c.dennet',
-    'c.dent',
-    'c.dvorak',
-    'c.e.c.',
-    'c.e.e.',
-    'c.e.f.',
-    'c.e.m.',
-    'c.e.s.g.',
-    'c.e.t.',
-    'c.eng',
     'c.f.c.',
-    'c.f.martin',
-    'c.f.s.',
-    'c.g.c.',
-    'c.greesley',
-    'c.group',
-    'c.h.a.s.',
-    'c.i.\'s',
-    'c.i.c.',
-    'c.i.e.',
-    'c.i.f',
-    'c.i.m.a.',
-    'c.i.p.c.',
-    'c.in-c.',
-    'c.isa',
-    'c.iv',
     'c.iwahashi',
-    'c.j.c.',
-    'c.j.e.',
-    'c.j.h.',
-    'c.j.mcd',
-    'c.l',
-    'c.l.cardon',
-    'c.l.k.c.',
-    'c.l.r',
-    'c.lose-ups',
-    'c.m.s.',
-    'c.morgan',
-    'c.n.s.',
-    'c.n.t',
-    'c.n.t.-f.a.i',
-    'c.nicaraguense',
     'c.o.b',
-    'c.o.d',
-    'c.o.l.l',
-    'c.o.p.',
-    'c.o.s',
-    'c.o.s.',
-    'c.o.w.b.o.y.',
-    'c.p.2330',
-    'c.p.m',
-    'c.p.r.e',
-    'c.q.m.s.',
-    'c.r.a.',
-    'c.r.b.c.',
-    'c.r.c.',
-    'c.r.i.c.t.',
-    'c.r.o.',
     'c.rada',
-    'c.rubriventralis',
-    'c.s.a.',
-    'c.s.h.',
-    'c.s.i.c.',
-    'c.s.lewis',
-    'c.s.orwin',
-    'c.s2',
-    'c.sparrow',
-    'c.t.a.',
-    'c.t.b.',
-    'c.t.r.',
-    'c.u.c.b.',
-    'c.v.o.',
-    'c.v.r.',
-    'c.w.c.',
     'c.w.l.',
-    'c.what',
-    'c.y',
-    'c/00/22/2005',
-    'c/00/23/0075',
-    'c/00/23/2053',
-    'c/00/23/2136',
-    'c/00/23/2174',
-    'c/00/23/2177',
-    'c/00/23/2178',
-    'c/00/23/2179',
-    'c/00/23/2181',
-    'c/00/23/2200',
-    'c/00/23/2201',
-    'c/00/23/2213',
-    'c/00/23/2217',
     'c/00/23/2227',
-    'c/00/23/2229',
-    'c/00/23/2235',
-    'c/00/23/2243',
-    'c/00/23/2260',
-    'c/00/23/2264',
-    'c/00/23/2275',
-    'c/00/23/2284',
-    'c/00/23/2289',
-    'c/00/23/2296',
-    'c/00/23/2311',
-    'c/00/23/2321',
-    'c/00/23/2323',
-    'c/00/23/2324',
-    'c/00/23/2325',
-    'c/00/23/2326',
     'c/00/23/2327',
-    'c/00/23/2328',
-    'c/00/23/2331',
-    'c/00/23/2339',
-    'c/00/23/2340',
-    'c/00/23/2341',
-    'c/00/23/2342',
-    'c/00/23/2359',
-    'c/00/23/2364',
-    'c/00/23/2367',
-    'c/00/23/2368',
-    'c/00/23/2389',
-    'c/00/23/2392',
-    'c/00/23/2393',
-    'c/00/23/2398',
-    'c/00/23/2399',
     'c/00/23/2400',
-    'c/00/23/2403',
-    'c/00/23/2426',
-    'c/00/23/2432',
-    'c/00/23/2439',
-    'c/00/23/2441',
-    'c/00/23/2452',
-    'c/00/23/2458',
-    'c/00/23/2470',
-    'c/00/23/2476',
-    'c/00/24/2003',
-    'c/00/24/2016',
-    'c/00/26/2058',
-    'c/00/28/0001',
-    'c/00/28/0004',
-    'c/00/28/0006',
     'c/01/25/0000',
-    'c/01/25/2025',
-    'c/01/25/2032',
-    'c/01/25/2033',
-    'c/04',
-    'c/04/25/0003',
-    'c/04/26/0003',
-    'c/05',
-    'c/05/21/0000',
-    'c/05/25/0007-1',
-    'c/05/25/0008',
-    'c/05/25/0009',
-    'c/05/25/0011',
-    'c/05/25/0012',
-    'c/05/25/0014',
-    'c/05/25/0019',
     'c/08/25/0005',
-    'c/08/25/0006',
-    'c/08/25/0011',
-    'c/08/25/0014',
-    'c/08/25/0015',
-    'c/08/25/0016',
-    'c/08/25/0017',
-    'c/08/25/0019',
-    'c/08/26/0004',
-    'c/09/25/0002',
-    'c/09/25/0004',
-    'c/09/25/0005',
-    'c/09/25/0006',
-    'c/1',
-    'c/11',
-    'c/11/25/0001',
     'c/11/26/0002',
-    'c/11/26/0003',
-    'c/11/26/0004',
-    'c/14/25/0024',
-    'c/14/25/0027',
-    'c/14/26/0003',
-    'c/350',
-    'c/400',
-    'c/b',
-    'c/cheese',
-    'c/e',
-    'c/ebp&dgr/nf-il6b',
-    'c/ebp&ggr',
-    'c/ebp-family',
-    'c/f',
-    'c/flakes',
     'c/l',
-    'c/manager',
-    'c/min',
-    'c/ps',
-    'c/ps/e',
-    'c/spot/run',
-    'c/tv',
-    'c/y',
-    'c01',
-    'c0130b',
-    'c1,387',
-    'c1-c3',
-    'c1/88',
-    'c100&ndash;3',
-    'c1000',
-    'c102g0256',
     'c11',
-    'c11h17no3',
-    'c12.',
-    'c130\'s',
-    'c13000',
-    'c141',
-    'c1450',
-    'c1450&ndash;1550',
-    'c14:0',
-    'c150s',
-    'c1514',
-    'c1525/1526',
-    'c152s',
-    'c1590',
-    'c16+4',
-    'c16.5',
     'c1600&mdash;1789',
-    'c1600&ndash;1661',
-    'c1660-1870',
-    'c1675&ndash;1749',
-    'c1700',
-    'c1705',
-    'c1754',
-    'c1760',
-    'c1765',
-    'c1771&ndash;2',
-    'c1772',
-    'c1779',
-    'c1798',
-    'c1800',
-    'c1810',
-    'c1830',
     'c1841',
-    'c1850',
-    'c1855',
-    'c1859',
-    'c1860&ndash;c1945',
-    'c1870',
-    'c18755',
-    'c1880&ndash;1918',
-    'c1887',
-    'c1888',
-    'c18:1',
-    'c1900&ndash;1958',
-    'c1902&ndash;1959',
-    'c1910',
-    'c1925',
-    'c1955',
     'c1964',
-    'c1985',
-    'c1990',
-    'c1c2',
-    'c1c2(d)',
-    'c1lhl7no3',
-    'c1n10',
-    'c1pa2',
-    'c2\'-',
-    'c2+',
-    'c2-compounds',
-    'c2-level',
-    'c2-n',
-    'c2.',
-    'c2/c3',
-    'c2/cp3',
     'c200,000',
-    'c2000',
-    'c206',
-    'c20:5n3',
-    'c20th',
-    'c212,400',
-    'c219',
-    'c22',
-    'c224',
-    'c22j',
-    'c23',
-    'c250pp',
-    'c2613&ndash;2494bc',
-    'c262',
-    'c2640',
-    'c266',
     'c272,500',
-    'c2a',
-    'c2b',
-    'c2c',
-    'c2d',
-    'c2de',
-    'c2g',
-    'c2n',
-    'c3\'-endo',
-    'c3\'-o3\'-p-o5\'',
-    'c3\'s',
-    'c3-10',
-    'c3-6&lsqb;pvmc3&rsqb',
-    'c3-p0',
-    'c3.93a',
-    'c3.93b',
     'c3.93c',
-    'c3.93d',
-    'c3.93e',
-    'c3/r2',
-    'c3/telos',
-    'c30',
-    'c3000',
-    'c312',
-    'c330&ndash;379',
-    'c3400',
-    'c341,000',
-    'c3410/es',
-    'c3440',
-    'c35',
-    'c363.29b',
-    'c385,000',
     'c386sx-lt',
-    'c386sxlt',
-    'c4\'',
-    'c4+',
-    'c4.93',
-    'c4/img',
-    'c40',
-    'c4129',
-    'c434',
-    'c4468',
-    'c49-formation',
-    'c4e-88',
-    'c5+',
-    'c5-sized',
-    'c5.93',
-    'c5065',
     'c50s',
-    'c56',
-    'c57b1/6xbalb/c',
-    'c57bl',
-    'c57bl/10',
-    'c57bl/6&mdash;sjl',
-    'c6,000',
-    'c60\'s',
-    'c62',
-    'c625af',
-    'c64\'s',
-    'c64.',
-    'c64/128',
-    'c67',
-    'c68',
-    'c6h5br',
     'c6h5nh',
-    'c6h5nh2',
-    'c7-d8-e7',
-    'c7.5p',
-    'c7.93',
-    'c7.g10\'',
-    'c730l',
-    'c735',
-    'c75',
-    'c7637&ndash;380',
-    'c782',
-    'c8.93',
-    'c800',
-    'c83',
-    'c86-type',
-    'c8ash',
     'c9.93',
-    'c90&ndash;16f',
-    'c91',
-    'c98s',
-    'c:1',
-    'c=',
-    'c=0.025cm',
-    'c=29.88',
-    'c=84.81',
-    'c=86.9',
-    'c==c',
-    'c=a+b',
-    'c=c',
-    'c=ch',
-    'c=conference',
-    'c=control',
     'c=q/v',
-    'c=s',
-    'ca&amp;g',
-    'ca&mdash',
-    'ca&ntilde;o',
-    'ca&ntilde;o-lim&oacute;n',
-    'ca&rehy;pacities',
-    'ca&sup2',
-    'ca\'ed',
-    'ca\'granda',
-    'ca\'in\'',
-    'ca*e',
-    'ca-20/20',
-    'ca-ca-ca-ca',
-    'ca-caracas',
-    'ca-co-2',
     'ca-compete',
-    'ca-datacom',
-    'ca-db:generator',
-    'ca-idms',
-    'ca-o',
-    'ca-paint',
-    'ca-ra-van',
-    'ca-raly',
-    'ca-scheduler',
-    'ca.1850',
-    'ca.66',
-    'ca.s7',
-    'ca/ciir',
-    'ca/p2',
-    'ca130bqq%m0101g/a',
-    'ca14',
     'ca2+-',
-    'ca2+-depleted',
-    'ca2+-free',
-    'ca20',
-    'ca310',
-    'ca4',
-    'ca85',
-    'ca=182',
-    'ca=1868',
-    'caa\'ing',
-    'caa-approved',
-    'caac',
-    'caade',
-    'caagacggtcaagaatgac',
-    'caaggtaatgtaataggaata',
-    'caals',
     'caam',
-    'caatinga',
-    'caatingas',
-    'cab&aacute;lleros',
-    'cab&rehy;legged',
-    'cab-door',
-    'cab-drive',
-    'cab-firm',
-    'cab-journey',
-    'cab-legged',
-    'cab-ride',
-    'cab/powell',
-    'cabable',
-    'cabalism',
-    'cabalisms',
-    'caballerial',
     'caballing',
-    'cabane',
-    'cabanillas',
-    'cabaret-goers',
-    'cabaret-set',
-    'cabaret-style',
-    'cabaret/theatre',
-    'cabarett',
-    'cabbage-field',
-    'cabbage-leaves',
-    'cabbage-like',
-    'cabbage-looking',
-    'cabbage-patch',
-    'cabbagy',
-    'cabbalas',
-    'cabbie\'',
     'cabbin',
-    'cabble',
-    'cabbot',
-    'cabdrivers',
-    'cabeldu',
-    'cabell',
-    'cabellero',
-    'cabelo',
-    'cabeo',
-    'caber-tossing',
-    'caberera',
-    'caberfeidh',
-    'cabernet-sauvignon',
-    'cabernets',
-    'cabers',
-    'cabessal',
     'cabestaing',
-    'cabestanh',
-    'cabezo',
-    'cabieses',
-    'cabiin',
-    'cabin-fever',
-    'cabin-house',
-    'cabin-lights',
-    'cabin-like',
-    'cabin-style',
-    'cabin-trunk',
-    'cabin-trunks',
-    'cabinboy',
-    'cabindan',
-    'cabined',
-    'cabines',
     'cabinet-based',
-    'cabinet-government',
-    'cabinet-style',
-    'cabinet-wide',
-    'cabinet/worktop',
-    'cabinetmakers',
-    'cabinless',
-    'cabinmate',
-    'cabinside',
-    'cabint',
-    'cabinteely',
-    'cable&rehy;knit',
-    'cable(s)',
-    'cable-carrying',
-    'cable-cord',
-    'cable-drum',
     'cable-franchise',
-    'cable-hauled',
-    'cable-hung',
-    'cable-layer',
-    'cable-makers',
-    'cable-route',
-    'cable-station',
-    'cable-way',
-    'cable.',
-    'cablecoil',
-    'cablecom',
-    'cablephone',
-    'cables-part',
-    'cableways',
-    'caboc',
-    'caboolture',
     'caborange',
-    'cabots',
-    'cabours',
-    'cabowin',
-    'cabr&oacute;n',
-    'cabrach-morvern',
-    'cabrales',
-    'cabras',
-    'cabrinety',
-    'cabrioie',
-    'cabrioles',
-    'cabriolets',
-    'cabside',
-    'cabtell',
-    'cabul',
-    'cac&eacute;m',
     'cac03',
-    'cac1',
-    'cac12',
-    'cac40',
-    'cacaphonous',
-    'cacarels',
-    'cacares',
-    'cacaxtia',
-    'caccamise',
-    'cacciatore',
-    'cacciatori',
-    'cacciucco',
-    'cacdp',
-    'cacerolazo',
-    'cacetes',
-    'cachalot\'',
     'cachan',
-    'cache-coherency',
-    'cache-injected',
-    'cache-pot',
-    'cache-sexe',
-    'cachectic',
-    'cacher',
-    'cacherel',
-    'cachette',
-    'cachinnation',
-    'cachinnations',
-    'cachit',
-    'cacho',
-    'cachots',
-    'cachuma',
-    'cacioppo',
     'cacium',
-    'cack-handedly',
-    'cackest',
-    'cackfunk',
-    'cackhanded',
-    'cackulations',
-    'cacky',
-    'cacl1',
-    'cacl2',
-    'caco-fonix',
-    'caco3',
-    'cacodylate-buffered',
-    'cacophany',
-    'cacophonic',
-    'cacophonously',
-    'cacotuodes',
     'cacp',
-    'cactaceae',
-    'cactaeae',
-    'cactophile',
-    'cactus-like',
-    'cactus-riddled',
-    'cactusflesh',
-    'caculuma',
-    'cad-2',
-    'cad-cam',
-    'cad-generated',
-    'cad-vile',
-    'cad.',
-    'cad/',
-    'cad/cadd',
-    'cad/cam/cae',
     'cad/cam/cim',
-    'cad/desk',
-    'cad401',
-    'cada',
-    'cadabra',
-    'cadagon',
-    'cadalmosto',
-    'cadam-compatible',
-    'cadam-emulation',
-    'cadamosto',
-    'cadaqu&eacute;s',
-    'cadaverine',
-    'cadaverously-thin',
-    'cadbury-branded',
-    'cadd-1',
-    'caddell',
     'caddelton',
-    'cadden',
-    'cadder/psychiatric',
-    'cadders',
-    'caddie/player',
-    'caddis-flies',
-    'caddles',
-    'caddo',
-    'caddonlea',
-    'caddysure',
-    'cadeac',
-    'cadeaux',
-    'cadena',
-    'cadenced',
-    'cadenettes',
-    'cadens',
     'cadentially',
-    'caderack',
-    'cades',
-    'cadette/falkirk',
-    'cadex',
-    'cadexomer',
-    'cadger',
-    'cadgers.',
-    'cadherin-like',
-    'cadherin-specific',
-    'cadialac',
-    'cadians',
-    'cadiar',
-    'cadieuxminister',
-    'cadillac-powered',
-    'cadinsky',
     'cadioli',
-    'cadkey',
-    'cadkey/datacad',
-    'cadmium-cell',
-    'cadmium-containing',
-    'cadmium-sulphide',
-    'cadnam',
-    'cadno',
-    'cado',
-    'cadoc',
-    'cadoxton',
-    'cadualadr',
-    'caduc',
-    'caduceatrix',
-    'caducity',
-    'caduto',
     'cadvat',
-    'cadwaller',
-    'cae-negative',
-    'caecilian',
-    'caecostomy',
-    'caedewen',
-    'caega',
-    'caehrun',
-    'caelaverock',
-    'caelerphenyn',
-    'caeli',
-    'caelis',
-    'caelum',
-    'caementarius',
-    'caenby',
-    'caepio',
     'caer-howel',
-    'caerau',
-    'caerberllan',
-    'caereiniou',
-    'caerfanell',
-    'caerflos',
-    'caerfyrddin',
-    'caergoorle',
-    'caerhalmi',
-    'caermarthen',
-    'caernach',
-    'caernarfon-dinas',
-    'caernarfonshire:david',
-    'caerulean',
-    'caerulein-induced',
-    'caeruleum',
     'caeruloplasmins',
-    'caerwent.alternatively',
-    'caesalpinioideae',
-    'caesar-',
-    'caesar-sized',
-    'caesar/i',
-    'caesarem',
-    'caesarinus',
-    'caesario',
-    'caesaro-papist',
-    'caesarstudien',
-    'caesium-induced',
-    'caesius',
-    'caesurae',
-    'caetani',
-    'caex',
     'caeyers',
-    'caf&eacute/bar',
-    'caf&eacute;-and-restaurant',
-    'caf&eacute;-cum-shop',
-    'caf&eacute;-filled',
-    'caf&eacute;-haunting',
-    'caf&eacute;-owners',
-    'caf&eacute;-style',
-    'caf&eacute;d',
-    'caf&eacute;terias',
-    'caf&egrave',
-    'caf&egrave;-brasserie',
-    'caf&egrave;s',
-    'caf&euml;s',
-    'caf2',
-    'cafaggiolo',
     'cafe&sacute',
-    'cafe-bar',
-    'cafe-bars',
-    'cafe-culture',
-    'cafe-shabby',
-    'cafe/1s',
-    'cafe/take',
-    'cafe/terrace',
-    'cafe_au_lait',
-    'cafeteria-style',
-    'caff&egrave;s',
-    'caffa',
-    'caffe-bar',
-    'caffeinated',
-    'caffelatte',
-    'caffitino',
     'caffon',
-    'caffres',
-    'caffyns',
-    'cafs-isp',
-    'cafuffle',
-    'cagan',
-    'cagccat',
-    'cagd',
-    'cage-birds',
-    'cage-haters',
-    'cage-style',
-    'cagebred',
-    'cagelike',
-    'cageots',
-    'cager',
-    'cageyness',
     'caggaatcg',
-    'caginess',
-    'cagion',
-    'cagiva',
-    'caglianelli',
-    'cagliarian',
-    'cagliaritano',
-    'cagliostro',
-    'cagnola',
-    'cagnoni',
-    'cagoule-style',
-    'cagree',
-    'cags',
-    'cagus',
-    'cahamarca',
-    'cahdor',
     'cahen',
-    'caherciveen',
-    'cahexia',
-    'cahier',
-    'cahill/strathclyde',
-    'cahir',
-    'cahm',
-    'cahnce',
-    'cahoolin',
-    'cahorsins',
-    'cahpo',
-    'cahrc',
-    'cahun',
-    'cahuna',
-    'caian',
-    'caid',
     'caies',
-    'caiger',
-    'cailean',
-    'cailean-a',
-    'cailes',
-    'cailich',
-    'caillaux',
-    'caillebotte',
-    'caillettes',
-    'cailloux',
-    'caimgorms',
-    'cain-brands',
-    'cain/chubaty',
-    'cainar',
-    'caine/ludlow/shropshire',
-    'caingeham',
     'cainite',
-    'caique/island',
-    'cair&eacute;enne',
-    'cairn-like',
-    'cairn-marked',
-    'cairn-smith',
-    'cairn/shelter',
-    'cairnbank',
-    'cairnbuilding',
-    'cairnburgh',
-    'cairncaslte',
-    'cairncastle',
-    'cairncross_et',
-    'cairndhu',
-    'cairndow',
-    'cairnduff',
     'cairnes',
-    'cairngill',
-    'cairngorms-led',
-    'cairngryffe',
-    'cairnlodge',
-    'cairnplace',
-    'cairns/one',
-    'cairns/raf',
-    'cairnshield',
-    'cairnshill',
-    'cairnsmore',
-    'cairo&ndash;aswan',
-    'cairo&ndash;london',
-    'cairo-amman',
-    'cairo-suez-khartoum',
-    'cairolle',
     'cairry',
-    'cairs',
-    'caise',
-    'caish',
-    'caister-murdoch',
-    'caister-on-sea',
-    'caister/murdoch',
-    'caistor-by',
-    'cait',
-    'caithes',
-    'caithness-based',
-    'caithness-south',
-    'caithness_such',
-    'caitif',
-    'caitiff',
-    'caitrin',
     'caits',
-    'caiuby',
-    'caixabank',
-    'cajetan',
-    'cajoler',
-    'cajolings',
-    'cajra',
-    'caju',
-    'cake&rehy;hole',
-    'cake(s)',
-    'cake-and-eat-it',
-    'cake-burning',
-    'cake-candles',
-    'cake-eaters',
-    'cake-holes',
-    'cake-knife',
     'cake-like',
-    'cake-lovers',
-    'cake-mixes',
-    'cake-sellers',
-    'cake-shovelling',
-    'cake-stall',
-    'cake-tasting',
-    'cake-tin',
-    'cake-tray',
-    'cake-walk',
-    'cake.',
-    'cake.swindon',
-    'cake/rower',
-    'cake/run',
-    'cake/s',
-    'cakeboards',
     'caked-on',
-    'cakehan',
-    'cakelike',
-    'caker',
-    'cakes/pancakes',
-    'cakeshop',
-    'cakewalked',
-    'cakeware',
-    'cakle',
-    'cakmak',
-    'cal&ccedil;adas',
-    'cal&ndash;n',
-    'cal&rehy;derwood',
-    'cal-calloo',
-    'cal33',
-    'cal64',
     'calacatta',
-    'caladium',
-    'calafate',
-    'calafornia',
-    'calafornie',
-    'calais-feldkirch',
-    'calais-hazebrouck',
-    'calais.6',
-    'calais/france',
-    'calaloo',
-    'calamai',
-    'calaman',
-    'calamarca',
-    'calamayor',
-    'calambokidis',
-    'calamian',
     'calamiforme',
-    'calamintous',
-    'calamita',
-    'calander',
-    'calandre',
-    'calangis',
-    'calanna',
-    'calanoides',
-    'calaresu',
-    'calasso',
-    'calaste',
-    'calatheas',
-    'calavecchia',
-    'calavessi',
-    'calavr&iacute;a',
-    'calayoglu',
     'calays',
-    'calbraith',
-    'calc-silicates',
-    'calcalkali',
-    'calcalkaline',
-    'calcaneus',
-    'calcar',
-    'calcarii',
-    'calcarius',
-    'calcedonio',
-    'calceoaria',
-    'calceolarias',
-    'calcero',
-    'calces',
-    'calchalk',
-    'calchas',
     'calcichordates',
-    'calcicolous',
-    'calcific',
-    'calcinai',
-    'calcinated',
-    'calcinating',
-    'calcinatio',
-    'calcinema',
-    'calcining',
-    'calciosome',
-    'calcite-cemented',
-    'calcite-marcasite-sphalerite',
-    'calcite/diatomite/organic',
-    'calcitic',
-    'calcitonin/cgrp',
-    'calciuim',
     'calcium+',
-    'calcium-calmodulin',
-    'calcium-containing',
-    'calcium-enriched',
-    'calcium-ion',
-    'calcium-phosphate-bile',
-    'calcium-sensing',
-    'calcium-stimulated',
-    'calcium.',
-    'calcium/magnesium',
-    'calcium/phosphorous',
-    'calciuric',
-    'calcomp/telecommunications',
-    'calcrete',
-    'calcretized',
-    'calcsilicates',
     'calcu&rehy;lated',
-    'calcualted',
-    'calculat',
-    'calculated\'',
-    'calculatedness',
-    'calculation.',
-    'calculation/analysis',
-    'calculator-like',
-    'calculus-based',
-    'calculus.',
-    'calcut',
-    'calcutt/wiltshire',
-    'calcutta&ndash;delhi',
-    'calcutta-based',
-    'calcutta-born',
-    'calcutta-on-hudson',
     'calcuttan',
-    'cald',
-    'caldair',
-    'caldara',
-    'caldbec',
-    'caldbeck/playgroup',
-    'caldecot',
-    'caldecott-cum-chelveston',
-    'calder-manse',
-    'calder/retired',
-    'caldera-forming',
-    'caldera-graben',
-    'caldera-hosted',
-    'calderberry',
-    'caldercruix',
-    'calderhead',
     'calderoni',
-    'caldervale',
-    'calderwood/club',
-    'calderwood/hockey',
-    'calderwood/town',
-    'caldez',
-    'caldicotes',
-    'caldicotte',
-    'caldo',
-    'caldow',
-    'caldron',
-    'caldway',
-    'caldwell-reckless',
-    'caldwell/horse',
-    'caldwell/lawrence',
-    'cale&ccedil;on',
     'cale&ccedil;ons',
-    'cale-esque',
-    'cale-music',
-    'cale/former',
-    'caleacte',
-    'calearo',
-    'caled',
-    'caledon-newman',
-    'caledonia.',
-    'caledonie',
-    'caleman',
-    'calenberg',
-    'calendar-making',
-    'calendar-type',
-    'calendar/scheduler',
-    'calendarium',
     'calende',
-    'calendrically',
-    'calenzana',
-    'cales',
-    'caleta',
-    'caleycourt',
-    'calf-bearing',
-    'calf-boots',
-    'calf-hide',
-    'calf-high',
-    'calf-like',
-    'calf-muscle',
-    'calf-note',
-    'calf-rearing',
-    'calfbound',
-    'calfhill',
     'calfinaidd',
-    'calfire',
-    'calfornian',
-    'calfornicum',
-    'calfs',
-    'calgarian',
-    'calgary&ndash;banff',
-    'calgary-based',
-    'calgate',
-    'calgranulin',
-    'calha',
-    'calham',
-    'caliari',
-    'calib',
-    'calibanese',
-    'calibmeas',
     'calibogue',
-    'calibos',
-    'calibr',
-    'calibra-vs-vw',
-    'calibrant',
-    'calibrates',
-    'calibration/reference',
-    'calices',
-    'calicivirus',
-    'calico-printers',
-    'calida',
-    'calidore',
-    'califia',
-    'california-davis',
-    'california-invented',
-    'california-light',
     'california-san',
-    'california-style',
-    'california/hawaii',
-    'californian-based',
-    'californian-born',
-    'californian-italian',
-    'californian-style',
-    'californicum',
-    'californicus',
-    'californium',
-    'californucation',
-    'caligraphy',
-    'caligulan',
-    'calil',
-    'calina',
-    'calinese',
     'calipette',
-    'caliphe',
-    'caliphers',
-    'calippo',
-    'calisma',
-    'caliterra',
-    'calkewood',
-    'call&egrave;d',
-    'call\'st',
-    'call(s)',
-    'call-',
-    'call-backs',
-    'call-bar',
-    'call-blocking',
-    'call-boy',
-    'call-by-call',
     'call-card',
-    'call-centre',
-    'call-finder',
-    'call-girl/pimp',
-    'call-handling',
-    'call-letters',
-    'call-light',
-    'call-line',
-    'call-logger',
-    'call-only',
-    'call-order',
-    'call-over',
-    'call-rate',
-    'call-signal',
-    'call-signals',
-    'call-stud',
     'call-them',
-    'call-to-arms',
-    'call/',
-    'call_apart',
-    'callability',
-    'callaccess',
-    'callad',
-    'callaloo',
-    'callaly',
-    'callampas',
-    'calland',
-    'callandine',
-    'callands',
-    'callanetic-type',
-    'callanish/outer',
-    'callar',
     'callard/weightlifter',
-    'callart',
-    'callata',
-    'callaveros',
-    'callaway/motor',
-    'callback',
-    'callboy/assistant',
-    'callcenter',
-    'callcott',
-    'callcutt/crest',
-    'called&mdash;will',
-    'called&rehy;up',
-    'called-off',
-    'called-stations',
-    'calledmick',
-    'callee',
     'callendars',
-    'calles',
-    'calleva',
-    'calleywood',
-    'callfornianus',
-    'calli',
-    'calliactis',
-    'callichthidae',
-    'callick',
-    'callicots',
-    'calliergon',
-    'calligrammes',
-    'calligrapher.',
-    'calligraphical',
-    'calligraphics',
-    'calligraphies',
     'calligraphy/jane',
-    'callimba',
-    'callimorpha',
-    'callin\'-all',
-    'calling-back',
-    'calling-cards',
-    'calling-off',
-    'calling/scottish',
-    'callionymidae',
-    'calliopes',
-    'callip&aelig;dia',
-    'calliphorid',
-    'callisher',
-    'callistephus',
-    'callisth',
-    'callisthenes',
     'callit',
-    'callitee',
-    'callith',
-    'callixte',
-    'callls',
-    'callman',
-    'callmis',
-    'callooh',
-    'callosal',
-    'callots',
-    'callow/herefordshire',
-    'callowly',
-    'callowness',
-    'callows',
-    'calls.',
-    'calls/actions',
     'calls/man',
-    'callsall',
-    'callsat',
-    'callsigns',
-    'callsthe',
-    'calltuccio',
-    'callusing',
-    'callwood/butcher',
-    'callychthids',
-    'callynder',
-    'callynge',
-    'callyr',
-    'calm-faced',
-    'calm-sounding',
-    'calm/angry',
-    'calmann',
     'calmers',
-    'calmess',
-    'calmly-slashed',
-    'calmly.',
-    'calmodulin-sepharose',
-    'calmol-1',
-    'calmon',
-    'calmucks',
-    'calocephalus',
-    'calogen',
-    'calogeracos',
-    'calonectris',
-    'caloo',
-    'caloplaca',
-    'calorie&ndash',
-    'calorie-',
     'calorie-awareness',
-    'calorie-burning',
-    'calorie-costly',
-    'calorie-counter',
-    'calorie-fibre',
-    'calorie-killers',
-    'calorie-packed',
-    'calorie-reducing',
-    'calorie-restricted',
-    'calorie-rich',
-    'calorie/protein',
-    'calories-in',
-    'calories-out',
-    'calories-worth',
-    'calorifier',
-    'calorigenic',
     'calorimeters',
-    'calory',
-    'calotier',
-    'calpain',
-    'calper',
-    'calpionella',
-    'calques',
-    'calsin',
-    'caltec',
-    'calthrops',
-    'caltraps',
-    'caltrops',
-    'caluclation',
-    'calum-beag',
-    'calumniated',
-    'calumniator',
     'calumnious',
-    'calunnia',
-    'calutron',
-    'calv&eacute',
-    'calva',
-    'calvacante',
-    'calvaria',
-    'calvely',
-    'calveras',
-    'calvers',
-    'calvert-toulmin',
-    'calvert/buckinghamshire',
-    'calves-arched',
-    'calvia',
-    'calville',
-    'calvinian',
     'calvinistic-copernican',
-    'calvitti',
-    'calvopina',
-    'calvos',
-    'calway',
-    'caly',
-    'calymene',
-    'calypogeia',
-    'calypsoed',
-    'calystegia',
-    'calyton',
-    'calzado',
-    'calzone',
-    'cam&eacute;lias',
-    'cam\'',
-    'cam-action',
     'cam-corder',
-    'cam-cutting',
-    'cam-i',
-    'cama&ntilde;o',
-    'camachos',
-    'camada',
-    'camag',
-    'camaieux',
-    'camalata',
-    'camapigners',
-    'camarades',
-    'camarda',
-    'camarena-salazar',
-    'camarguaise',
-    'camarilla',
-    'camaroon',
     'camaros',
-    'camartelo',
-    'camarvon',
-    'camataru',
-    'camaxys',
-    'cambara',
-    'camber-induced',
-    'camber-well',
-    'camberaberaux',
-    'camberra',
-    'cambes',
-    'cambia',
-    'cambial',
-    'cambiaso',
-    'cambios',
-    'cambir',
     'cambist',
-    'cambletown',
-    'cambodian-style',
-    'cambodian-vietnamese',
-    'cambodunum',
-    'cambois',
-    'camborne-hayle',
-    'cambot',
-    'cambou',
-    'cambourne',
-    'cambray',
-    'cambrdidgeshire',
-    'cambrelle/leather',
-    'cambri',
-    'cambria',
-    'cambridge-educated',
     'cambridge-ely',
-    'cambridge-line',
-    'cambridge-style',
-    'cambridge/british',
-    'cambridge/dti',
-    'cambridged',
-    'cambridgeport',
-    'cambriense',
-    'cambrium',
-    'cambrizzia',
-    'cambroclaves',
-    'cambrorhytium',
-    'cambtidge',
-    'cambusbarns',
-    'camby',
-    'camcorder-only',
     'camdem',
-    'camden-lock-shirted',
-    'came.from',
-    'came.to',
-    'came_out',
-    'camel-artillery',
-    'camel-bells',
-    'camel-cart',
-    'camel-coloured',
-    'camel-dung',
-    'camel-owning',
-    'camel-thorn',
-    'camel-train',
-    'camel-trains',
-    'camel-trappings',
-    'camel-wool-acrylic',
     'cameleer',
-    'cameleers',
-    'cameleon',
-    'cameleons',
-    'camelgrass',
-    'camelias',
-    'cameling',
-    'camell',
-    'camelliifolia',
-    'camelmen',
-    'camelon',
-    'camelopardus',
-    'camelthorn',
-    'camensac',
-    'camenzind',
-    'cameo-cutting',
     'cameo-like',
-    'camera-back',
-    'camera-bag',
-    'camera-bereft',
-    'camera-bulb',
-    'camera-control',
-    'camera-fetching',
-    'camera-holding',
-    'camera-kite',
-    'camera-laden',
-    'camera-like',
-    'camera-man',
-    'camera-mounted',
-    'camera-obsessed',
-    'camera-on-a-chip',
-    'camera-ready-copy',
     'camera-reconnaissance',
-    'camera-screen',
-    'camera-ship',
-    'camera-shot',
-    'camera-shy',
-    'camera-sized',
-    'camera-stalking',
-    'camera-strapped',
-    'camera-to-tape',
-    'camera-toting',
-    'camera-tripod',
-    'camera-wise',
-    'camera-work',
-    'camera.',
-    'camera/vtr',
-    'cameraderic',
     'cameradie',
-    'camerae',
-    'cameraman.',
-    'cameramans',
-    'camerano',
-    'cameras-and',
-    'cameras.',
-    'cameras.the',
-    'camerawoman',
-    'cameria',
-    'cameriere',
-    'camerlinckx',
-    'camerman',
-    'camero',
-    'cameron-',
-    'cameron.',
     'cameron/drug',
-    'cameron/houston',
-    'cameron/local',
-    'cameron/ruchill',
-    'cameron/video',
-    'cameronbridge',
-    'cameroun-eec',
-    'camerounaise',
-    'camerounaises',
-    'camesi',
-    'camhealth',
-    'cami-top',
-    'camicia',
-    'camidge',
-    'camie',
-    'camijn',
     'camiknicks',
-    'camiletti',
-    'camilio',
-    'camilla-gate',
-    'camilleri',
-    'camilleti',
-    'camillus',
-    'camions',
-    'camisea',
-    'camisi',
-    'camlets',
-    'camlin',
-    'camlinton',
-    'cammander',
-    'cammdwr',
-    'cammed',
     'cammells',
-    'cammerino',
-    'cammidge',
-    'cammie',
-    'cammo/river',
-    'cammock',
-    'cammomile',
-    'camnant',
-    'camoes',
-    'camoglia',
-    'camomella',
-    'camondo',
-    'camos',
-    'camouflag',
-    'camouflaged.',
-    'camouflagers',
     'camouflet',
-    'camourflage',
-    'camovia',
-    'camp-',
-    'camp-activated',
-    'camp-agonists',
-    'camp-beds',
-    'camp-built',
-    'camp-crp-dna',
-    'camp-crp/dna',
-    'camp-dependent-protein-kinase',
-    'camp-guard',
-    'camp-inducibility',
-    'camp-life',
-    'camp-receptor',
-    'camp-response',
     'camp-response-element-binding-protein',
-    'camp-response-element-modulator',
-    'camp-signal',
-    'camp-survivor',
-    'campagnac',
-    'campagnie',
-    'campagnoni',
-    'campaign-finance',
-    'campaign-i',
-    'campaign-law',
-    'campaign-related',
-    'campaign-weary',
-    'campaigners.',
-    'campaigning/training',
-    'campaigniung',
-    'campaigns.',
     'campain',
-    'campalani',
-    'campan&aacute;rio',
-    'campanas',
-    'campanello',
-    'campanie',
-    'campaniform',
-    'campanili',
-    'campaniole',
-    'campano',
-    'campanotto',
-    'campaogn',
-    'camparis',
-    'campas',
-    'campbel',
-    'campbell-',
     'campbell-brown',
-    'campbell-ferguson',
-    'campbell-harding',
-    'campbell-in-jail',
-    'campbell-moore',
-    'campbell-savers',
-    'campbell-smith',
-    'campbell/british',
-    'campbell/captain',
-    'campbell/edinburgh',
-    'campbell/intelligence',
-    'campbell/swimmer',
-    'campbell/women-only',
-    'campbellfield',
-    'campbelljustice',
-    'campbellmania',
     'campden/gloucestershire',
-    'campeggio',
-    'camper-caravan',
-    'campero',
-    'campers/diners',
-    'campervanners',
-    'campery',
-    'campestricola',
-    'campfield',
-    'campfollower',
-    'camphora',
-    'camphorated',
-    'camphoroquinone-tertiary',
-    'camphre',
-    'campiagn',
-    'campin\'',
     'campina',
-    'camping-gas',
-    'camping-shop',
-    'camping-stoves',
-    'camping/cycling',
-    'camping/outdoor',
-    'campinos-dubernet',
-    'campione',
-    'campionesi',
-    'campioni',
-    'campkin',
-    'campleshon',
-    'camplissan',
-    'camplisson',
-    'campness',
-    'campnosperma',
     'campo-formio',
-    'camponotus',
-    'campoolie',
-    'camporeggiano',
-    'campos-ortega',
-    'camposanto',
-    'campoverde',
-    'campri',
-    'camprobin',
-    'camprubi',
-    'camps-to',
-    'camps.whether',
-    'campsa',
-    'campsea-ash',
-    'campsies',
-    'campsis',
     'campstool',
-    'camptosaurus',
-    'campucheans',
-    'campus-like',
-    'campus-style',
-    'camputers',
-    'campuzano',
-    'campy',
-    'campylium',
-    'camr',
-    'camra-gales',
-    'camraman',
-    'camranh',
-    'camray',
-    'camrex',
-    'camrys',
     'cams.',
-    'camsiscan',
-    'camster',
-    'camstro',
-    'camtab',
-    'camulodonum',
-    'camus&rehy;esque',
-    'camusunary',
-    'camusvachan',
-    'can&dollar;11,600',
-    'can&dollar;15,000',
-    'can&dollar;20,400',
-    'can&dollar;50,000,000',
-    'can&dollar;8,600',
-    'can&dollar;88',
-    'can&ndash;t',
     'can&rehy;celled',
-    'can&rehy;nabis',
-    'can\'&pound;t',
-    'can\'t&mdash',
-    'can\'t-',
-    'can\'t-believe-a-word-he-says',
-    'can\'t-do-a-thing-about-it',
-    'can\'t-for',
-    'can\'t-get-away-with-anything',
-    'can\'t-stand-still-ski',
-    'can\'t/kent',
-    'can-base',
-    'can-be',
-    'can-chanh',
-    'can-get-away-with-murder',
-    'can-maker',
     'can-making',
-    'can-not',
-    'can-openers',
-    'can-toad',
-    'can-track',
-    'can-tracks',
-    'can.',
-    'can.be',
-    'can/will',
-    'can1&ndash;100',
-    'can_just',
-    'canabrava',
-    'canada&rehy;produced',
-    'canada*',
-    'canada-mexico-usa',
-    'canada-united',
     'canada/us',
-    'canadaria',
-    'canadia',
-    'canadian-american',
-    'canadian-backed',
-    'canadian-built',
-    'canadian-nisi',
-    'canadian-owned',
-    'canadian-raised',
-    'canadian-reared',
-    'canadian-soviet',
-    'canadian-us',
-    'canadian/french',
-    'canadian/u.s.a.',
-    'canadianised',
-    'canadians.',
     'canadienne',
-    'canadium',
-    'canair',
-    'canal-bank',
-    'canal-boat',
-    'canal-builder',
-    'canal-digging',
-    'canal-heads',
-    'canalejo',
-    'canales',
-    'canaliculatus',
-    'canalise',
-    'canalising',
-    'canals.',
-    'canaltwoath',
-    'canamega',
     'canard-duchene',
-    'canari',
-    'canarias',
-    'canarina',
-    'canario',
-    'canarozzi',
-    'canarvons',
-    'canary-hopping',
-    'canary-yellow-and-indigo',
-    'canas-jerez',
-    'canaska',
-    'canastrelli',
-    'canata',
-    'canatifera',
-    'canaul',
-    'canaverals',
     'canavese',
-    'canberra--and',
-    'canbjwin.zip',
-    'canbon',
-    'canbord',
-    'canbury',
-    'canc&uacute;n',
-    'canca',
-    'cancanagh',
-    'cancel/amend',
-    'canceled',
-    'cancelleria',
-    'cancelliere',
-    'cancelor',
-    'cancer\'',
-    'cancer-conscious',
     'cancer-forming',
-    'cancer-free',
-    'cancer-giving',
-    'cancer-growth',
-    'cancer-killing',
-    'cancer-pained',
-    'cancer-prevention',
-    'cancer-ridden',
-    'cancer-victim',
-    'cancer.gareth',
-    'cancer/heart',
-    'cancericidal',
-    'cancerisation',
-    'cancernet',
-    'cancerously',
-    'cancerphobia',
     'cancers.',
-    'canche',
-    'canciones',
-    'cancr',
-    'cancri',
-    'cancy',
-    'candau',
-    'candaules',
-    'candeille',
-    'candelabri',
-    'candelaria',
-    'candeleda',
-    'candidat',
-    'candidate&mdash;both',
-    'candidatem',
-    'candidates.',
     'candidating',
-    'candido',
-    'candids',
-    'candidum',
-    'candiloro',
-    'candindates',
-    'candir',
-    'candis',
-    'candle-bowl',
-    'candle-drips',
-    'candle-end',
-    'candle-flowers',
-    'candle-holders',
-    'candle-lighting',
-    'candle-like',
-    'candle-shelf',
     'candle-smoke',
-    'candle-snuffers',
-    'candle-stick-maker',
-    'candle-stub',
-    'candle-stubs',
-    'candle-wax',
-    'candleberry',
-    'candlegate',
-    'candlegrease',
-    'candlelights',
-    'candlemaker',
-    'candlemakers',
-    'candlepower',
-    'candlerack',
-    'candleriggs',
-    'candles.',
     'candleshine',
-    'candlesmoke',
-    'candlestick-holders',
-    'candlewheel',
-    'candlewood',
-    'candling',
-    'candoco',
-    'candonga',
-    'candor',
-    'candus',
-    'candy-assed',
-    'candy-pink',
-    'candy-sponsored',
-    'candy-stripe',
-    'candy-wrappers',
-    'candyfloss-maker',
     'candyheart',
-    'candying',
-    'candyish',
-    'candykisses',
-    'candymen',
-    'candyskin',
-    'candyskins',
-    'candysmeared',
-    'candystriped',
-    'cane&rehy;chair',
-    'cane-backed',
-    'cane-framed',
-    'cane-handled',
-    'cane-shredder',
-    'cane-spliced',
-    'cane-sugar',
     'cane-supports',
-    'canebi&egrave;re',
-    'canedy',
-    'canefields',
-    'canek',
-    'canellini',
-    'canes.',
-    'canescent',
-    'canete',
-    'canette',
-    'caneuon',
-    'caneva',
-    'canevalle',
-    'canewdon',
-    'canews',
-    'canfora',
     'canfranc',
-    'canful',
-    'cangas',
-    'cange',
-    'canged',
-    'canh',
-    'canham',
-    'caniadau',
-    'canicularis',
-    'canicule',
-    'canideputy',
-    'canidi',
-    'canine-life',
-    'canines.',
-    'caninity',
-    'canio',
     'canip',
-    'canisius',
-    'canisters-old',
-    'canizaris',
-    'canker-bit',
-    'canker-blooms',
-    'canker-resistant',
-    'cankerous',
-    'cankerously',
-    'cankerworm',
-    'canley',
-    'canmotors',
-    'cann-',
-    'cann/shop',
-    'cannabalistic',
-    'cannabichs',
     'cannabis-related',
-    'cannabis/hallucinogenic',
-    'cannack',
-    'cannadine',
-    'cannalised',
-    'cannards',
-    'cannareggio',
-    'cannaregio',
-    'canne-linguini',
-    'cannella',
-    'cannelle',
-    'cannelli',
-    'canneloni',
-    'cannetti',
-    'cannever',
-    'cannibale',
     'cannibalic',
-    'cannibalisation',
-    'cannibalisme',
-    'canniest',
-    'cannily-timed',
-    'canning/alison',
-    'canning/former',
-    'canningite',
-    'cannington-wardour-portsdown',
-    'canno',
-    'cannobiro',
-    'cannodale',
-    'cannon-ball-like',
-    'cannon-barrel',
-    'cannon-founding',
-    'cannon-shot',
     'cannon-wielding',
-    'cannonball-you',
-    'cannondale',
-    'cannoneer',
-    'cannoneers',
-    'cannonoutside',
-    'cannonshot',
-    'cannot.',
-    'cannot/do',
-    'cannstadt',
-    'cannulate',
-    'cano&euml',
-    'cano&ntilde;o',
-    'canoe-camper',
-    'canoe-like',
-    'canoe-loads',
     'canoe-orientated',
-    'canoe-position',
-    'canoe-shaped',
-    'canoe-surfing',
-    'canoe-trip',
-    'canoe/cycle/run',
-    'canoenergy',
-    'canoes-wood',
-    'canoes.',
-    'canoist',
-    'canon-derived',
-    'canon-formation',
-    'canon-williams',
-    'canon.',
-    'canone',
-    'canonero',
     'canonesses',
-    'canonicha',
-    'canonicity',
-    'canonicorum',
-    'canonicorvm',
-    'canonmills/warriston',
-    'canonteign',
-    'canonum',
-    'canoodled',
-    'canooed',
-    'canopy-smashing',
-    'canopy-trees',
-    'canor',
-    'canossiane',
-    'canoville',
-    'cansada',
     'cansap',
-    'cansfield',
-    'cansimili',
-    'cant\'t',
-    'cant/dont',
-    'cantabit',
-    'cantabrica',
-    'cantabrigienses',
-    'cantaluppi',
-    'cantana',
-    'cantando',
-    'cantankerously',
-    'cantankerousness',
-    'cantankersome',
-    'cantarist',
-    'cantasi',
     'cantat',
-    'cantates',
-    'canteens-general',
-    'canteleu',
-    'canterbury-nd',
-    'canters',
-    'cantes',
-    'cantharis',
-    'cantiaci',
-    'cantianum',
-    'cantico',
-    'cantii',
-    'cantil',
-    'cantilena/shephard',
-    'cantilenas',
-    'cantilene',
     'cantilever-domed',
-    'cantione',
-    'cantiques',
-    'cantiunculae',
-    'cantock',
-    'canton-wood',
-    'canton.22',
-    'cantona-like',
-    'cantonas',
-    'cantonensis',
-    'cantonese-speaking',
-    'cantonists',
-    'cantonite',
-    'cantonment-dwellers',
-    'cantoon',
-    'cantoor',
     'cantor*',
-    'cantore',
-    'cantores',
-    'cantrap',
-    'cantred',
-    'cantribb',
-    'cantrill/president/gloucs',
-    'cantuarienses',
-    'cantuccio',
-    'cantv',
-    'cantwell.',
-    'cantwell/attack',
-    'cantwell/derek',
-    'canulae',
-    'canullation',
-    'canutus',
     'canvan',
-    'canvas-backed',
-    'canvas-beauty',
-    'canvas-bottomed',
-    'canvas-shod',
-    'canvas-sided',
-    'canvas/nylon',
-    'canvased',
-    'canvass.',
-    'canvassed-everybody',
-    'canvasstructured',
-    'canworth',
-    'cany',
-    'canynge',
-    'canyon&ndash;monument',
-    'canyon&ndash;ruby',
     'canyon&ndash;zion',
-    'canyonlands',
-    'canzonen',
-    'canzonette\'',
-    'canzonetti',
-    'canzoniero',
-    'cao(sio2)s',
-    'caobang',
-    'caodaism',
-    'caodaist',
-    'caonis',
-    'caost',
-    'caotic',
-    'caoutchouc',
-    'cap&rehy;tain',
-    'cap-a-pie',
     'cap-badge',
-    'cap-de-long',
-    'cap-ferrat',
-    'cap-firing',
-    'cap-gun',
-    'cap-haitien',
-    'cap-peak',
-    'cap-pins',
-    'cap-pistol',
-    'cap-rouge',
-    'cap-shaped',
-    'cap-sleeve',
-    'cap-sleeved',
-    'cap-sleeves',
-    'cap-snatching',
-    'cap-throwing',
     'cap-twisting',
-    'cap-wearing',
-    'cap.in-hand',
-    'cap/breather',
-    'cap/name',
-    'capabilities.vying',
-    'capability\'',
-    'capabilty',
-    'capable-as',
-    'capaccio',
-    'capachica',
-    'capaciously',
-    'capacitance/voltage',
-    'capacitation',
-    'capacities-though',
-    'capacity-pale',
     'capacity-sharing',
-    'capacity/layout',
-    'capacity_as',
-    'capades',
-    'capadocea',
-    'capanna',
-    'capanne',
-    'caparison',
-    'caparisons',
-    'caparn',
-    'capbreton',
-    'capcha',
-    'capdeuil',
-    'cape-backed',
-    'cape-like',
-    'capel-y-ffyn',
     'capel/caretaker',
-    'capela',
-    'capelat',
-    'capeling',
-    'capellae',
-    'capellanus',
-    'capelletti',
-    'capellini',
-    'capener',
-    'capense',
-    'capercaillie-friendly',
-    'capercaillie.',
-    'capesante',
-    'capesthorpe',
-    'capetanakis',
-    'capetian-plantagenet',
     'capetown-born',
-    'capeverdian',
-    'capework',
-    'capheaton',
-    'capi&rehy;talise',
-    'capi&rehy;talism',
-    'capilano',
-    'capili',
-    'capillarization',
-    'capilleries',
-    'capilliary',
-    'capintech',
-    'capirola',
-    'capiscums',
-    'capishe',
-    'capisto',
     'capit',
-    'capit&aacute;n',
-    'capital\'',
-    'capital-account',
-    'capital-accumulating',
-    'capital-adequecy',
-    'capital-augmenting',
-    'capital-based',
-    'capital-beneficiaries',
-    'capital-deepening',
-    'capital-expenditure',
-    'capital-financed',
-    'capital-growth',
-    'capital-importer',
-    'capital-infrastructure',
-    'capital-intensity',
     'capital-invested-in-agriculture',
-    'capital-l',
-    'capital-market-based',
-    'capital-markets',
-    'capital-o',
-    'capital-providers',
-    'capital-punishment',
-    'capital-to-asset',
-    'capital-to-assets',
-    'capital-travail',
-    'capital-widening',
-    'capital-works',
-    'capital.2',
-    'capital.lead',
-    'capital.z',
-    'capital/asset',
     'capital/finance',
-    'capital/function',
-    'capital/income',
-    'capital/labour',
-    'capital/loans',
-    'capital/resource/labour-intensive',
-    'capital/revenue',
-    'capital:hyderabad',
-    'capital:port',
-    'capital:san',
-    'capital:shillong',
-    'capitales',
-    'capitali',
-    'capitalis',
-    'capitalisations',
-    'capitaliser',
     'capitalism\'',
-    'capitalism.',
-    'capitalist&rehy;proletarian',
-    'capitalist-democratic',
-    'capitalist-imperialist-industrial',
-    'capitalist-socialist',
-    'capitalist-type',
-    'capitalist.',
-    'capitalistic-style',
-    'capitalization-day',
-    'capitalizations',
-    'capitalized\'',
-    'capitalled',
-    'capitally',
-    'capitals.',
-    'capitanes',
     'capitani',
-    'capitatlon',
-    'capiti',
-    'capitialism',
-    'capitole',
-    'capitolina',
-    'capitulaire',
-    'capivari',
-    'capland',
-    'caple',
-    'capler',
-    'caples',
-    'capless',
-    'capline',
-    'capm-based',
-    'capmakers',
     'capn',
-    'capo-up',
-    'capodistria',
-    'capodistrias',
-    'capodoceans',
-    'capoeira',
-    'capomaestro',
-    'capon-fed',
-    'capon/husband',
-    'capon/son',
-    'capon/wife',
-    'caponago',
-    'caponish',
-    'caporaso',
-    'caporetto',
-    'caporoso',
     'cappadocian',
-    'capped-off',
-    'capped-on',
-    'cappell',
-    'cappellae',
-    'cappelletto',
-    'cappellin',
-    'cappellitti',
-    'capper/\'femme',
-    'cappiello',
-    'capplebank',
-    'cappocchiano',
-    'cappuccilli',
-    'capranica',
-    'capree',
-    'capreee',
     'capreolo',
-    'capretto',
-    'capri-driver',
-    'capria',
-    'caprian',
-    'capricci',
-    'capricio',
-    'capricode',
-    'capricola',
-    'capricorn-rising',
-    'capricorne',
-    'capricornian',
-    'capricorno',
-    'caprido',
-    'caprifoliaceae',
-    'caprile',
     'caprimo',
-    'caprinae',
-    'capriol',
-    'caprivians',
-    'caproate',
-    'caprock',
-    'caprolactam',
-    'caproli',
-    'caps.',
-    'capsella',
-    'capsian',
-    'capsid-targeted',
-    'capsl',
-    'capstones',
-    'capsules.',
-    'capt&lsqb;ai-n&rsqb',
     'captain&mdash',
-    'captain\'s',
-    'captain-elect',
-    'captain-superintendent',
-    'captain-to-be',
-    'captain/wicketkeeper',
-    'captaincy.',
-    'captains-general',
-    'captaux',
-    'captiousness',
-    'captiva',
-    'captivation',
-    'captive-born',
-    'captivi',
-    'captivities',
-    'captivus',
     'captn.',
-    'capton',
-    'capture.',
-    'capture/export',
-    'capture/input',
-    'capture/mark/release',
-    'capturers',
-    'capuana',
-    'capucho',
-    'capucian',
-    'capucines',
-    'capucinus',
-    'capuleti',
-    'capuletti',
-    'caputh',
-    'capuzzo',
     'capybaras',
-    'caqueta',
-    'caquezo',
-    'caquita',
-    'car&amp',
-    'car&ndash',
-    'car-a',
-    'car-accessory',
-    'car-beating',
-    'car-bombed',
-    'car-boot-sale',
-    'car-bound',
-    'car-building',
-    'car-bumper',
-    'car-but',
-    'car-buyers',
     'car-buying',
-    'car-care',
-    'car-chase',
-    'car-chases',
-    'car-child',
-    'car-cleaners',
-    'car-cleaning',
-    'car-congested',
-    'car-crushing',
-    'car-dealing',
-    'car-death',
-    'car-decks',
-    'car-dependence',
-    'car-din-ar-lis',
-    'car-door',
-    'car-driver',
     'car-drivers',
-    'car-engine',
-    'car-familiar',
-    'car-fart',
-    'car-friendly',
-    'car-horn',
-    'car-industry',
-    'car-infested',
-    'car-installed',
-    'car-jacking',
-    'car-kicking',
-    'car-manufacturer',
-    'car-manufacturing',
-    'car-marker',
-    'car-mine',
-    'car-mirror',
     'car-orientated',
-    'car-owing',
-    'car-owner',
-    'car-painting',
-    'car-paraphernalia',
-    'car-park-like',
-    'car-park-training',
-    'car-part',
-    'car-passenger',
-    'car-pla2',
-    'car-plant',
-    'car-polishing',
-    'car-port',
-    'car-ports',
-    'car-producer',
-    'car-proud',
     'car-purchasing',
-    'car-rallying',
-    'car-ringers',
-    'car-roofs',
-    'car-sales',
-    'car-salesmen',
-    'car-spray',
-    'car-starved',
-    'car-tec',
-    'car-telephone',
-    'car-transporter',
-    'car-truck',
-    'car-tyre',
-    'car-tyres',
-    'car-users',
-    'car-washer',
     'car-washing',
-    'car-worker',
-    'car-workers',
-    'car.gonna',
-    'car/bicycle',
-    'car/boat',
-    'car/cars',
-    'car/coach',
-    'car/coach/taxi',
-    'car/taxi/bus',
-    'car_out',
-    'cara-van',
-    'carabastos',
-    'carabids',
-    'carabin-somethings',
-    'carabineer',
     'carabineers',
-    'carabiner',
-    'carabineri',
-    'carabinero',
-    'carabiniers',
-    'caracas-based',
-    'caracasses',
-    'caracci',
-    'caracciola',
-    'caracias',
-    'caracole',
-    'caracoled',
-    'caracolling',
-    'caracteris&eacute',
-    'caradamons',
-    'caradocian',
     'caradonna',
-    'carafa',
-    'carafino',
-    'caragium',
-    'carague',
-    'caraid',
-    'caramanlis',
-    'caramba',
-    'carambolim',
-    'caramel-coated',
-    'caramelises',
-    'caramelly',
-    'caramoja',
-    'carancho',
-    'carandiru',
-    'caranfil',
     'carangidae',
-    'caranvaserais',
-    'carapelli',
-    'carapintada',
-    'carapu&ccedil;a',
-    'carataxis',
-    'carate',
-    'carats-worth',
-    'caravaggesque',
-    'caravaggios',
-    'caravan-club',
-    'caravan-dragging',
-    'caravan-site',
-    'caravanettes',
-    'caravaning',
-    'caravans/chalets/',
     'caravans/mobile',
-    'caravela',
-    'caraveli',
-    'caravell',
-    'caravogue',
-    'caraways',
-    'carayon',
-    'carb-othello',
-    'carbaby',
-    'carbamates',
-    'carbamazepin',
-    'carbamoyl',
-    'carbamyl',
-    'carbanions',
-    'carbatec',
-    'carbemazapine',
     'carbene',
-    'carbenes',
-    'carberryi',
-    'carbetamide',
-    'carbeth-s',
-    'carbh',
-    'carbi',
-    'carbi&egrave;re',
-    'carbides',
-    'carbinate',
-    'carbisdale',
-    'carbo-union',
-    'carbocation',
-    'carbody',
-    'carbohydrate-binding',
-    'carbohydrate-containing',
     'carbohydrate-fat',
-    'carbohydrates.',
-    'carbomedicinalis',
-    'carbon-',
-    'carbon-16',
-    'carbon-atomed',
-    'carbon-backed',
-    'carbon-cluster',
-    'carbon-crusted',
-    'carbon-date',
-    'carbon-dating',
-    'carbon-dioxide-bearing',
-    'carbon-dioxide-induced',
-    'carbon-electrolyte',
-    'carbon-fibre-bladed',
-    'carbon-fixation',
     'carbon-nitrogen',
-    'carbon-producing',
-    'carbon-reinforced',
-    'carbon-sodium',
-    'carbon-sulphur-carbon',
-    'carbon-water',
-    'carbon-water-oxygen',
-    'carbon/',
-    'carbon/aluminium',
-    'carbon/aramid',
-    'carbon/indian',
-    'carbon/oxygen',
-    'carbonate-',
-    'carbonate-based',
-    'carbonate-cemented',
-    'carbonate-depositing',
     'carbonate-opal',
-    'carbonate-silica',
-    'carbonate-siliciclastic',
-    'carbonate/bicarbonate/co',
-    'carbonate/l',
-    'carbonatian',
-    'carbonatites',
-    'carbonator',
-    'carbonel',
-    'carboneras',
-    'carbonfibre',
-    'carboni',
-    'carbonications',
-    'carboniferous&mdash;jurassic',
-    'carboniferous-early',
-    'carboniferous-pennsylvanian',
     'carboniferous-permian',
-    'carbonified',
-    'carbonis',
-    'carbonization',
-    'carbonize',
-    'carbonne',
-    'carbonoapatite',
-    'carboot',
-    'carbopol',
-    'carborundum-impregnated',
-    'carbosin',
-    'carboxyl-terminal',
-    'carboxylase',
-    'carboxylase-oxygenase',
-    'carboxylated',
-    'carboxylates',
     'carboxyls',
-    'carboxypeptidase',
-    'carboxypeptidases',
-    'carboy',
-    'carbrooke',
-    'carbuncled',
-    'carburated',
-    'carburation',
-    'carburettor-type',
-    'carburettored',
-    'carburised',
-    'carburration',
-    'carby/british',
-    'carc',
-    'carcasci',
-    'carcasing',
     'carcassed',
-    'carceller',
-    'carcelvos',
-    'carcere',
-    'carcereri',
-    'carcharodon',
-    'carchayra',
-    'carcimona',
-    'carcinima',
-    'carcinogencity',
-    'carcinogenes',
-    'carcinogenetic',
-    'carcinogenically',
-    'carcinogenics',
-    'carciofo',
-    'carcrash',
     'card(s)',
-    'card-bearing',
-    'card-board',
-    'card-buying',
-    'card-dropping',
-    'card-file',
-    'card-games',
-    'card-holder',
-    'card-indexed',
-    'card-indexes',
-    'card-indexing',
-    'card-issuers',
-    'card-like',
-    'card-load',
-    'card-maker',
-    'card-player',
     'card-reader',
-    'card-readers',
-    'card-saving',
-    'card-sharps',
-    'card-shops',
-    'card-size',
-    'card-style',
-    'card-wired',
-    'card/monitor',
-    'card/writing',
-    'cardamom-flavoured',
-    'cardamomum',
-    'cardamon',
-    'cardamone',
-    'cardan',
-    'cardano',
     'carday',
-    'cardayvay',
-    'cardboard-bodied',
-    'cardboard-box-making',
-    'cardboard-cutout',
-    'cardboard-mounted',
-    'cardboard-pipped',
-    'cardboardy',
-    'cardbox',
-    'cardbox-plus',
-    'cardbox-type',
-    'cardena',
-    'cardenist',
-    'carder.',
-    'cardhouses',
-    'cardiac-support',
     'cardial',
-    'cardiff&ndash;based',
-    'cardiff-aberdare',
-    'cardiff-barry',
-    'cardiff-paddington',
-    'cardiff-swansea',
-    'cardiff/south',
-    'cardiffffff',
-    'cardigan-fitzbaddely',
-    'cardille',
-    'cardin\'',
-    'cardinal-bishop',
-    'cardinal-prince',
-    'cardinal-red',
-    'cardinaled',
-    'cardinally',
     'cardinalsto',
-    'cardinan',
-    'cardines',
-    'cardington-born',
-    'cardio',
-    'cardio&rehy',
-    'cardio&rehy;vascular',
-    'cardio-funk',
-    'cardio-respiratory',
-    'cardio-sculpting',
-    'cardiodata',
-    'cardiographed',
-    'cardiographic',
-    'cardion',
-    'cardiopathy',
-    'cardiotonic',
     'cardiotoxic',
-    'cardiovascular-pulmonary',
-    'cardioversion',
-    'cardioverter-defibrillator',
-    'cardisoma',
-    'cardkeyholes',
-    'cardmaker\'',
-    'cardmakers',
-    'cardmaking',
-    'cardohydrate',
-    'cardoma',
-    'cardon',
-    'cardoni',
-    'cardonma',
-    'cardoor',
-    'cardos',
     'cardosoinformation',
-    'cardoza',
-    'cardplayers',
-    'cardri',
-    'cards.',
-    'cards/away',
-    'cards/posters',
-    'carduelis',
-    'cardunculus',
-    'cardweil',
-    'care\'',
-    'care-alan',
-    'care-and-maintenance',
-    'care-control',
-    'care-eliciting',
-    'care-ful',
     'care-ful-ly',
-    'care-giving-related',
-    'care-he',
-    'care-laden',
-    'care-leaver',
-    'care-leavers',
-    'care-lessly',
-    'care-line',
-    'care-of-cook',
-    'care-oriented',
-    'care-plans',
-    'care-seeking',
-    'care-staff',
-    'care-taking',
-    'care-type',
-    'care.',
     'care.a',
-    'care/',
-    'care/education',
-    'care/family',
-    'care/other',
-    'care/richard',
-    'care/social',
-    'care/treatment',
-    'care_as',
-    'careassist',
-    'careatum',
-    'carebridge',
-    'cared.',
-    'caredocs',
-    'careds',
-    'caree',
     'career&rehy;threatening',
-    'career-assessment',
-    'career-based',
-    'career-bests',
-    'career-centred',
-    'career-changing',
-    'career-conscious',
-    'career-defining',
-    'career-enhancing',
-    'career-girl',
-    'career-highest',
-    'career-hungry',
-    'career-indeed',
-    'career-long',
-    'career-motivation',
-    'career-move',
     'career-problematic',
-    'career-related',
-    'career-route',
-    'career-saving',
-    'career-search',
-    'career-structure',
-    'career-suicidal',
-    'career-swaps',
-    'career-type',
-    'career-woman-housewife-mother',
-    'career/job',
-    'career/job/home',
-    'career/life',
-    'careerist-turned-nationalist',
-    'careerless',
-    'careers.five',
     'careers/education/training',
-    'careerwoman',
-    'carees',
-    'carefillly',
-    'careforce',
-    'carefullest',
-    'carefully-broken',
-    'carefully-carved',
-    'carefully-composed',
-    'carefully-cut',
-    'carefully-designed',
-    'carefully-even',
-    'carefully-honed',
-    'carefully-kept',
-    'carefully-looped',
-    'carefully-nurtured',
     'carefully-ordered',
-    'carefully-positioned',
-    'carefully-ranked',
-    'carefully-recalled',
-    'carefully-rehearsed',
-    'carefully-staged',
-    'carefully-structured',
-    'carefully-studied',
-    'carefully-studied-careless-informality',
-    'carefully-tended',
-    'carefully-wrought',
-    'careg',
-    'caregiving',
-    'careless.',
-    'carelessless',
-    'caremongering',
     'caremore',
-    'carenarfon',
-    'careness',
-    'carentanians',
-    'carer(s)',
-    'carer-counsellor',
-    'carer-dependant',
-    'carer-infant',
-    'carerra',
-    'carers/adopters',
-    'caressable',
-    'caressant',
-    'caressive',
-    'carestaff',
-    'careta',
-    'caretaker-boss',
     'caretaker-coach',
-    'caretaker-handyperson',
-    'caretaker-manger',
-    'caretakes',
-    'caretas',
-    'caretena',
-    'careth',
-    'careto',
-    'caretto',
-    'carew-jones',
-    'careworkers',
-    'carey/hazelbaker',
-    'carey/resident',
-    'carfeul',
-    'carfist',
-    'carfour',
     'carfours',
-    'carfree',
-    'cargate',
-    'cargilfield',
-    'cargin',
-    'cargo-boat',
-    'cargo-cruising',
-    'cargo-importing',
-    'cargo-ship',
-    'cargo-shipping',
-    'cargo-ships',
-    'cargoed',
-    'cargolink',
-    'carha',
-    'carharrack',
-    'cari&ntilde;o',
     'caria',
-    'carians',
-    'cariatores',
-    'carib&rehy;speaking',
-    'carib-enayas',
-    'caribaea',
-    'caribbean-accented',
-    'caribbean-based',
-    'caribbean-dominated',
-    'caribbean.',
-    'caribbean/latin',
-    'caribbean/mediterranean',
-    'caribbeanness',
-    'caribe&ntilde;a',
-    'caribees',
-    'caribonum',
     'caribou.',
-    'caricaceae',
-    'caricuao',
-    'carida',
-    'caried',
-    'carieton',
-    'cariff',
-    'carige',
-    'cariglia',
-    'carignou',
-    'carileff',
-    'carin',
-    'carin\'',
-    'carinachites',
-    'carinachitiids',
-    'carinate',
     'carinate.',
-    'carinatus',
-    'caring-nineties',
-    'caring-sounding',
-    'caring-will',
-    'caring.',
-    'caring/sharing/',
-    'caringlessness',
-    'cariniana',
-    'carinis',
-    'carinthia&mdash;see',
-    'carinthia/eastern',
-    'carinthian',
-    'cario',
-    'carisamol',
-    'carisio',
     'carissa',
-    'carissimus',
-    'cariston',
-    'caritatas',
-    'caritatem',
-    'caritatis',
-    'carj',
-    'carjackings',
-    'carjon',
-    'carker',
-    'carkeys',
-    'carkhuff',
-    'carl-august',
-    'carl-dieter',
-    'carl-zeiss',
-    'carla-whatever-her-name-is',
     'carland',
-    'carlas',
-    'carlat',
-    'carlaw',
-    'carlaway',
-    'carleill',
-    'carlenses',
-    'carletonville',
-    'carletto',
-    'carlfa',
-    'carliari',
-    'carlil',
-    'carline',
-    'carling-guscott',
-    'carlingwark',
-    'carlini',
     'carlinor',
-    'carlioz',
-    'carlisle-edinburgh',
-    'carlisle-glasgow',
-    'carlisle-gretna',
-    'carlisle-hellifield',
-    'carlisle.',
-    'carlisle/farmer',
-    'carlisles',
-    'carlita',
-    'carlomagno',
-    'carlone',
-    'carlopolis',
-    'carlops',
-    'carlos-about',
-    'carlosa',
     'carlotto',
-    'carlow-based',
-    'carlow-kilkenny',
-    'carlquist',
-    'carlsb',
-    'carlsberg-tetley',
-    'carlsberg/elephant',
-    'carlscroon',
-    'carlsons',
-    'carlssoni',
-    'carlssons',
-    'carlstein',
-    'carlstrom',
-    'carlswood',
-    'carlton-browne',
-    'carlton-dewhirst',
     'carlton-led',
-    'carlton-powered',
-    'carlton/back',
-    'carltonware',
-    'carluke-born',
-    'carlunie',
-    'carlye',
-    'carlyles',
-    'carlyon',
-    'carlyon-britton',
-    'carlyon/witchcraft',
-    'carmagnoli',
-    'carmal',
-    'carmalite',
-    'carmarthen-west',
-    'carme',
     'carmela',
-    'carmelita',
-    'carmengloria',
-    'carmens',
-    'carmes',
-    'carmichaels',
-    'carmicheal',
-    'carmine-painted',
-    'carmine-winged',
-    'carminic',
-    'carmolito',
-    'carmontelles',
-    'carmunion',
-    'carnaby/union',
-    'carnall',
-    'carnallite',
     'carnan/gloucester',
-    'carnapping',
-    'carnarvan',
-    'carnarvons',
-    'carnation/',
-    'carnavalet',
-    'carnavel',
-    'carncastle',
-    'carneades',
-    'carneddeu',
-    'carnedds',
-    'carnedoe',
-    'carnegie-esque',
-    'carnegie/greenaway',
-    'carnegies',
-    'carneil',
     'carnelians',
-    'carnero',
-    'carnets',
-    'carnglaze',
-    'carnic',
-    'carnick',
-    'carnifex',
-    'carniolanus',
-    'carnival-like',
-    'carnival-style',
-    'carnival-type',
-    'carnivale',
-    'carnivalised',
-    'carnivora',
-    'carnivore/omnivores',
-    'carnivory',
     'carnkie',
-    'carnlea',
-    'carnmoni',
-    'carnochan',
-    'carnogurksy',
-    'carnoma',
-    'carnosauria',
-    'carnreagh',
-    'carns',
-    'carnson',
-    'carnt',
-    'carnteel',
-    'carnthruft',
-    'carntine',
-    'carnuculata',
-    'carnugorsky',
     'carnuntum',
-    'carnutes',
-    'carnwarth',
-    'carnwood',
-    'carnyces',
-    'caro-kann',
-    'caro-kanns',
-    'carob-coloured',
-    'carobs',
-    'caroggio',
-    'carol-lyn',
-    'carol-singers',
-    'carolann',
-    'carolau',
-    'carole-ann',
-    'caroles',
     'carolians',
-    'carolingan',
-    'carolivia',
-    'carolla',
-    'carolling-a-long',
-    'carolls',
-    'carolynn',
-    'carolynne',
-    'carome',
-    'caroni',
-    'caronia',
-    'carosel',
-    'carotenemia',
-    'carotids',
-    'caroto',
-    'carousal',
     'carousals',
-    'carousers',
-    'carouses',
-    'carozzelle',
-    'carp-feeding',
-    'carp-fisher',
-    'carp-helm',
-    'carp-scaring',
-    'carpaneto',
-    'carparking',
-    'carpatho-ukraine',
-    'carpatho-ukranians',
-    'carpave',
-    'carped',
-    'carpelary',
-    'carpels',
     'carpene',
-    'carpenter/cycle',
-    'carpenter/dietician',
-    'carpenter/mortician',
-    'carpentered',
-    'carpenters.',
-    'carpentring',
-    'carper',
-    'carpertright',
-    'carpes',
-    'carpet&mdash;figuratively&mdash;we',
-    'carpet-and-slippers',
-    'carpet-bagger',
-    'carpet-bagging',
-    'carpet-beating',
-    'carpet-biter',
     'carpet-bombed',
-    'carpet-bombing',
-    'carpet-cushions',
-    'carpet-fitter',
-    'carpet-layers',
-    'carpet-laying',
-    'carpet-like',
-    'carpet-obsessed',
-    'carpet-rod',
-    'carpet-seller',
-    'carpet-size',
-    'carpet-slippered',
-    'carpet-weave',
-    'carpet-weaving',
-    'carpet-widdling',
-    'carpet.',
     'carpet/floor',
-    'carpetbag',
-    'carpetbagging',
-    'carpetlayers',
-    'carpetwise',
-    'carphalute',
-    'carpingly',
-    'carpinus',
-    'carpio.',
-    'carplant',
-    'carpoid',
-    'carpools',
-    'carpus',
-    'carr-elison',
-    'carr-ellison',
-    'carr/unemployed',
     'carra',
-    'carradine-haye',
-    'carradock',
-    'carrageenan',
-    'carraigh',
-    'carrans',
-    'carranza',
-    'carrascalao',
-    'carravaggio',
-    'carraz',
-    'carrbridge&ndash;balnaan',
-    'carreau',
-    'carrefours',
-    'carreg-y-bucci',
-    'carrega',
-    'carreiras',
     'carrenage',
-    'carreno',
-    'carrer',
-    'carrere',
-    'carresses',
-    'carrett',
-    'carretta',
-    'carrette',
-    'carretti',
-    'carrhouse',
-    'carri&egrave;re',
-    'carri&egrave;res',
-    'carri&oacute;n',
-    'carriage-cleaning',
-    'carriage-exercise',
-    'carriage-full',
     'carriage-lamps',
-    'carriage-launch',
-    'carriage-travellers',
-    'carriage-way',
-    'carriage-works',
-    'carriageblock',
-    'carriagefolk',
-    'carriages.',
-    'carriageworks',
-    'carribales',
-    'carribe',
-    'carribers',
-    'carrick-a-rede',
-    'carrick-bred',
-    'carrickcruppin',
-    'carricke',
     'carrickknowe',
-    'carrickmore',
-    'carricot',
-    'carriden',
-    'carridon',
-    'carrieage',
-    'carriearrack',
-    'carrier-by-carrier',
-    'carrier-copter',
-    'carrier-current',
-    'carrier-eagle',
-    'carrier-fluid',
-    'carrier-gas',
-    'carrier-operated',
-    'carrier-pigeon',
-    'carrier-receiving',
     'carrier-sense',
-    'carrier.',
-    'carriers/aircraft',
-    'carriers/slings',
-    'carriest',
-    'carrieta',
-    'carrieth',
-    'carrige',
-    'carrigrohane',
-    'carril',
-    'carringden',
-    'carrington-cummings',
-    'carrion-and',
-    'carrion-eater',
-    'carrion-eaters',
-    'carrion-scented',
     'carritt/county',
-    'carroll-that-was',
-    'carron/simon',
-    'carrot-cum-stick',
-    'carrot-ground',
-    'carrot-red',
-    'carrot-shaped',
-    'carrotty-headed',
-    'carrouge',
-    'carroun',
-    'carrousels',
-    'carrow-woodfolk',
-    'carroz',
-    'carrozza',
-    'carrrier',
-    'carruthers/branch',
     'carrwood',
-    'carry-across',
-    'carry-coal-bag',
-    'carry-in',
-    'carry-le-rouet',
-    'carry-lookahead',
-    'carry-net',
-    'carry-sac',
-    'carry.the',
-    'carryall',
-    'carrybabe',
-    'carrybag',
-    'carryduff-based',
-    'carryed',
-    'carrying-boxes',
-    'carrying-in',
     'carrying-on',
-    'carrying-ons',
-    'carrying-parties',
-    'carrying-strap',
-    'carrying-thong',
-    'carryout',
-    'carryover',
-    'carryseat',
-    'carryying',
-    'cars-on',
-    'cars-to-defence',
-    'cars.richard',
-    'cars:aston',
-    'cars:jaguar',
-    'carsch',
-    'carseat',
     'carseckies',
-    'carsely',
-    'carser',
-    'carshalton-humphreys',
-    'carshalton/sutton',
-    'carshes',
-    'carsick',
-    'carsington',
-    'carslogie',
-    'carsolio',
-    'carson-moved',
-    'carsphairn',
-    'carstairs&ndash;edinburgh',
-    'carsten-peter',
-    'carstian',
-    'carstone',
     'carswells',
-    'cart&rehy;horses',
-    'cart&rehy;wheeling',
-    'cart-end',
-    'cart-freshly',
-    'cart-harness',
-    'cart-house',
-    'cart-pulling',
-    'cart-roads',
-    'cart-ruts',
-    'cart-shod',
-    'cart-way',
-    'cart-wheeled',
-    'cart-wheeling',
-    'cart-wheels',
-    'cart-wide',
     'cartaceum',
-    'cartae',
-    'cartagana',
-    'cartan',
-    'cartaret',
-    'cartas',
-    'carte-blanche',
-    'carte-de-visites',
-    'cartel-determined',
-    'cartelization',
-    'cartelize',
-    'cartelized',
-    'cartells',
-    'carter\'',
-    'carter-',
-    'carter-manning',
     'carter-you',
-    'carter/former',
-    'carter/meadsman',
-    'carter/usm',
-    'cartera',
-    'carterons',
-    'carterville/montreal',
-    'cartes-de-visite',
-    'cartesian-kantian',
-    'cartfuls',
-    'carthegians',
-    'carthys',
-    'cartiere',
-    'cartieri',
-    'cartiglio',
-    'cartilagenous',
     'cartiledge',
-    'cartilige',
-    'cartin\'',
-    'cartledge',
-    'cartless',
-    'carto-net',
-    'cartogram',
-    'cartologists',
-    'cartomancy',
-    'cartoon\'n\'chewing',
-    'cartoon-film',
-    'cartoon-strip',
-    'cartoon-strip-like',
-    'cartoon/comics',
-    'cartoon/pictorial',
-    'cartoonia',
     'cartoonist/illustrator',
-    'cartoons/illustrations',
-    'cartoonsws29',
-    'cartoonsws33',
-    'cartooonists',
-    'cartop',
-    'cartossable',
-    'cartridge-based',
-    'cartridge-belt',
-    'cartridge-cases',
-    'cartridge-fed',
-    'cartridge-filled',
-    'cartridge-making',
-    'cartridge-only',
-    'cartridge/cassette',
-    'cartright/public',
     'cartright/villager',
-    'cartrio',
-    'cartroads',
-    'cartron',
-    'cartulary',
-    'cartway',
-    'cartways',
-    'cartwright/faringdon',
-    'cartwright/meningitis',
-    'caruanae',
-    'caruba',
-    'carucae',
-    'carucate',
-    'carucci',
-    'carumba',
-    'caruncles',
     'carunculate',
-    'caruth',
-    'carvaers',
-    'carvaho',
-    'carved-and-painted',
-    'carved-ivory',
-    'carved-out',
-    'carved-sandstone',
-    'carved-stone',
-    'carvel-built',
-    'carven',
-    'carver-style',
-    'carver/enterprise',
-    'carver/works',
-    'carveries',
-    'carvery-style',
     'carvetii',
-    'carving-knives',
-    'carvoeira',
-    'carw',
-    'carwardine',
-    'carwelti',
-    'carwen',
-    'carworkers',
-    'caryatide',
-    'caryer',
-    'caryn',
-    'caryocaraceae',
-    'caryophyllia',
-    'carzo',
-    'carzolus',
-    'carzy',
     'cas&rehy;bar',
-    'cas-t&eacute;moin',
-    'casa-bona',
-    'casa-something-or-other',
-    'casablanca/',
-    'casadei',
-    'casadiego',
-    'casalarreina',
-    'casaldaliga',
-    'casale',
-    'casamanche',
-    'casamari',
-    'casamayor',
-    'casanovas',
-    'casaras',
-    'casas/villager',
     'casaulaties',
-    'casazza',
-    'cascadable',
-    'cascadia',
-    'cascamite',
-    'casciano',
-    'cascieri',
-    'cascierolo',
-    'casco',
-    'cascob',
-    'cascomelt',
-    'casdec',
-    'casderigg',
-    'casderiggs',
-    'casdn',
-    'case&mdash;in',
     'case&mdash;is',
-    'case&mdash;no',
-    'case&mdash;we',
-    'case\'',
-    'case-accurate',
-    'case-clock',
-    'case-conference',
-    'case-conferences',
-    'case-controlled',
-    'case-definitions',
-    'case-example',
-    'case-files',
-    'case-flow',
-    'case-forms',
-    'case-frame',
-    'case-handling',
     'case-hardening',
-    'case-in-point',
-    'case-inflexions',
-    'case-labelled',
-    'case-laws',
-    'case-lid',
-    'case-loads',
-    'case-managed',
-    'case-management',
-    'case-rooms',
-    'case-specific',
-    'case-to-case',
-    'case-winning',
-    'case.13',
-    'case/4gl',
-    'case/against',
     'case/client',
-    'case/one',
-    'case/toolbus',
-    'case1',
-    'casea',
-    'casearia',
-    'caseball',
-    'casebooks',
-    'casefinding',
-    'caseful',
-    'casegemas',
-    'caseificio',
-    'casein-glued',
-    'caseinates',
-    'caseiro',
-    'casel/lou',
     'caselaw',
-    'caseless',
-    'casell',
-    'casely',
-    'casenave',
-    'casenote',
-    'caserma',
-    'caserna',
-    'caseroom',
-    'cases&mdash;both',
-    'cases&mdash;except',
-    'cases/',
-    'cases/100,000',
-    'cases/letters',
-    'cases/persons',
-    'cases_less',
     'cases_such',
-    'caset',
-    'casevision',
-    'casevision/workshop',
-    'caseware',
-    'caseware/pt',
-    'casford',
-    'cash&rehy;flows',
-    'cash\'n\'carry',
-    'cash-absorptive',
-    'cash-balancing',
-    'cash-before-care',
-    'cash-bloated',
-    'cash-conscious',
-    'cash-constrained',
-    'cash-consuming',
     'cash-cow',
-    'cash-cows',
-    'cash-crops',
-    'cash-cutter',
-    'cash-demands',
-    'cash-desk',
-    'cash-dispenser',
-    'cash-dispensing',
-    'cash-down',
-    'cash-facility',
-    'cash-finding',
-    'cash-flows',
-    'cash-for-hostages',
-    'cash-for-places',
-    'cash-generative',
-    'cash-happy',
     'cash-holding',
-    'cash-hungry',
-    'cash-in-advance',
-    'cash-in-books',
-    'cash-in/cash-out',
-    'cash-income',
-    'cash-killing',
-    'cash-laden',
-    'cash-management',
-    'cash-n\'-carry',
-    'cash-needs',
-    'cash-negative',
-    'cash-on-deposit',
-    'cash-only',
-    'cash-orientated',
-    'cash-paying',
     'cash-payment',
-    'cash-pressed',
-    'cash-quiz',
-    'cash-raisers',
-    'cash-registers',
-    'cash-relations',
-    'cash-releasing',
-    'cash-rents',
-    'cash-rhythm',
-    'cash.prudently',
-    'cash/by',
-    'cash/cheque',
-    'cash/that',
-    'cashbook',
-    'cashboxes',
-    'cashcall',
     'cashdesk',
-    'cashed-in',
-    'cashed-up',
-    'cashfund',
-    'cashin',
-    'cashing-up',
-    'cashless/paperless',
-    'cashmere-clad',
-    'cashmere-like',
-    'cashmore/physicist/oxford',
-    'cashosis',
-    'cashpoints',
-    'cashy',
-    'casida',
-    'casillas',
-    'casimance',
     'casingham',
-    'casino-type',
-    'casiovision',
-    'casis',
-    'casisteal',
-    'cask-conditions',
-    'cask-strength',
-    'caski',
-    'caskies',
-    'casl',
-    'casle',
-    'caslick',
-    'casma',
-    'casmance',
-    'casolo',
-    'casp',
     'caspers',
-    'caspius',
-    'casquet',
-    'casquette',
-    'casre',
-    'cass-andra',
-    'cass-doff',
-    'cassa-le-caillou',
-    'cassady',
-    'cassagnes',
-    'cassagnes/malinski',
-    'cassandra-like',
-    'cassandre',
-    'cassany',
-    'cassations',
-    'cassavetes',
     'casscarino',
-    'casserly',
-    'cassero',
-    'casserole-based',
-    'cassette-filled',
-    'cassette-only',
-    'cassette-radio',
-    'cassette-recording',
-    'cassette-sized',
-    'cassette-tapes',
-    'cassette-type',
-    'cassette.',
-    'cassette/cd',
-    'cassette/disk',
-    'cassettedecks',
-    'cassettes/7-lp',
     'casseus',
-    'cassevetes',
-    'cassi',
-    'cassida',
-    'cassiduloid',
-    'cassie.',
-    'cassil',
-    'cassim',
-    'cassin/cheltenham',
-    'cassinari',
-    'cassinelli',
-    'cassinello',
-    'cassington/yarnton',
-    'cassion',
-    'cassiopaeia',
-    'cassirers',
     'cassiterides',
-    'cassl',
-    'casslen',
-    'cassolette',
-    'cassou',
-    'cassoulet-type',
-    'cassoulets',
-    'cassowarys',
-    'casspirs',
-    'cast&rehy;off',
-    'cast-aluminium',
-    'cast-litter',
-    'cast-maker',
-    'cast-metal',
-    'cast/crew',
-    'cast/trist',
     'casta&ntilde;os',
-    'castabala',
-    'castagnoli',
-    'castaing',
-    'castaings',
-    'castalia',
-    'castalus',
-    'castanar',
-    'castanettes',
-    'castanetting',
-    'castaneum',
-    'castang',
-    'castanheiros',
-    'castano',
-    'castati',
-    'castaway/united',
     'caste&rehy;conscious',
-    'caste-',
-    'caste-bound',
-    'caste-conscious',
-    'caste-mark',
-    'casted',
-    'castelcapuano',
-    'casteldario',
-    'casteley/prisoner',
-    'casteli',
-    'castell&oacute',
-    'castell&ograve;n',
-    'castella-ruins',
-    'castellamare',
-    'castellammare',
-    'castellana',
     'castellane',
-    'castellaneta',
-    'castellanries',
-    'castellarium',
-    'castellas',
-    'castellation',
-    'castelle',
-    'castellet',
-    'castellum',
-    'castelmola',
-    'castelnau-breonoux',
-    'castelnau-de-rivi&egrave;re',
-    'castelnuovo-tedesco',
-    'castenadas',
-    'casteneda',
-    'castens',
     'casteras',
-    'casteret',
-    'castern',
-    'casteth',
-    'castigations',
-    'castilians',
-    'castilla',
-    'castillan',
-    'castille-la',
-    'castillero',
-    'castilli',
-    'castillian',
-    'castilloeconomy',
-    'castillon&egrave;s',
-    'castillon-sur-agen',
-    'casting-away',
     'casting-call',
-    'casting-master',
-    'casting-mould',
-    'casting-off',
-    'casting-out',
-    'castings-on',
-    'castings.',
-    'castitatis',
-    'castle-adorned',
-    'castle-based',
-    'castle-bridge',
-    'castle-digging',
-    'castle-ditch',
-    'castle-in-the-air',
-    'castle-kanerova',
-    'castle-keepership',
     'castle-owner',
-    'castle-shaped',
-    'castle-stacks',
-    'castle-station',
-    'castle-style',
-    'castle-walls',
-    'castle.william',
-    'castle/farmer',
-    'castle/geologist',
-    'castle/winchcombe',
-    'castlebellingham',
-    'castlebray',
-    'castlebridge',
-    'castlecaldwell',
-    'castledawson',
-    'castledery',
     'castledon',
-    'castledyke',
-    'castleford-born',
-    'castlefuls',
-    'castlegreve',
-    'castlelaw',
-    'castlemartins',
-    'castlemore',
-    'castlemorton.tickets',
-    'castlepollard',
-    'castlereaghs',
-    'castleton-esk',
-    'castlett',
-    'castlina',
-    'castorama',
-    'castoreum',
     'castoro',
-    'castors.',
-    'castraitor',
-    'castrametation',
-    'castrations',
-    'castratus',
-    'castrey/legal',
-    'castries.',
-    'castro-caldas',
-    'castro-communist',
-    'castroist',
-    'castroites',
-    'castrol-lotus-ford',
-    'castropampa',
-    'casual-looking',
-    'casual/occasional',
     'casualest',
-    'casuality',
-    'casualization',
-    'casually&mdash;almost',
-    'casually-clad',
-    'casually-dressed',
-    'casualty-figure',
-    'casualty-room',
-    'casualty-strewn',
-    'casualty.',
-    'casued',
-    'casuelles',
-    'casuist',
-    'casuistical',
-    'casuistically',
-    'casuists',
     'casulaties',
-    'casulties',
-    'cat&aacute;lan',
-    'cat\'s-cradling',
-    'cat\'s-eyes',
-    'cat\'s-meat',
-    'cat\'s-paw',
-    'cat-among-the',
-    'cat-and-dog',
-    'cat-and-mouse-whipped',
-    'cat-animal',
-    'cat-assays',
-    'cat-astrophe',
-    'cat-at-the-cream',
-    'cat-breeding',
-    'cat-built',
     'cat-call',
-    'cat-caught',
-    'cat-cautious',
-    'cat-chat',
-    'cat-cream',
-    'cat-cry',
-    'cat-dust',
-    'cat-ese',
-    'cat-eyed',
-    'cat-fighting',
-    'cat-footed',
-    'cat-fouled',
-    'cat-herd',
-    'cat-ice',
-    'cat-jar',
-    'cat-licking-the-cream',
     'cat-litter',
-    'cat-lover',
-    'cat-loving',
-    'cat-man',
-    'cat-meal',
-    'cat-napped',
-    'cat-napping',
-    'cat-naps',
-    'cat-o-nine-tails',
-    'cat-people',
-    'cat-person',
-    'cat-phobic',
-    'cat-pissed',
-    'cat-purr',
-    'cat-rapers',
-    'cat-repellent',
     'cat-reporter',
-    'cat-sand',
-    'cat-shape',
-    'cat-shaped',
-    'cat-showing',
-    'cat-sick',
-    'cat-sitting',
-    'cat-slide',
-    'cat-suit',
-    'cat-swinging',
-    'cat-to-cat',
-    'cat-training',
-    'cat-watcher',
-    'cat/',
-    'cat/human',
-    'cat/sgt',
     'cata-',
-    'catabolised',
-    'cataclasite',
-    'cataclysm.',
-    'cataclysmal',
-    'cataclysmax',
-    'cataclysmically',
-    'catagenesis',
-    'catagenic',
-    'catagorisation',
-    'catagorization',
-    'catagory',
-    'catal&aacute;n',
-    'catalan(north-east)',
-    'catalana',
-    'catalanised',
     'catalectic',
-    'cataleimmoida',
-    'cataleptically',
-    'cataleptognic',
-    'catalin',
-    'catallaucus',
-    'catallaxics',
-    'catalles',
-    'catalloy',
-    'catalog.',
-    'catalogaholic',
-    'cataloguable',
-    'catalogue(s)',
-    'catalogue-aria',
-    'catalogue-retailing',
-    'catalogue.56',
     'catalogues/price',
-    'catalonia-based',
-    'catalouge',
-    'catalpas',
-    'catalunia',
-    'catalysable',
-    'catalyst/manager',
-    'catalysted',
-    'catalystic',
-    'catalysts-is',
-    'catalyze',
-    'catalyzing',
-    'catan',
-    'catana',
-    'catananche',
-    'cataora',
     'cataphorically',
-    'cataphractes',
-    'cataract-eyes',
-    'catarain',
-    'cataratie',
-    'catarax',
-    'catari',
-    'catarrh-coloured',
-    'catasetinae',
-    'catasta',
-    'catastophe',
-    'catastrophe\'',
-    'catastrophicus',
-    'catastrophise',
-    'catatonics',
-    'catayltic',
     'catbird',
-    'catbox',
-    'catcalling',
-    'catch-as-catch',
-    'catch-cropping',
-    'catch-crops',
-    'catch-dyke',
-    'catch-hand',
-    'catch-me-if-you-can',
-    'catch-monitoring',
-    'catch-penny',
-    'catch-plate',
-    'catch-twenty-two',
-    'catch/ketch',
-    'catchably',
-    'catchee',
     'catchen',
-    'catcheside',
-    'catcheth',
-    'catchfire',
-    'catchier',
-    'catchiest',
-    'catching-game',
-    'catchingly',
-    'catchlines',
-    'catchweight',
-    'catclaw',
-    'cateau-cambr&eacute;sis',
-    'catechetists',
-    'catechises',
-    'catechistic',
-    'catechizandis',
     'catechized',
-    'catechizers',
-    'catechol-o-methyltransferase',
-    'catecholaminergic',
-    'catechu',
-    'catechumen',
-    'catechumenate',
-    'categ',
-    'catego',
-    'categoricaliy',
-    'categoried',
-    'categories0',
-    'categorisable',
-    'categorizable',
-    'category-b',
-    'category-based',
     'category-confusing',
-    'category_no',
-    'catel',
-    'catella',
-    'catelonian',
-    'catenaries',
-    'catenatives',
-    'catenins',
-    'catephores',
-    'cateract',
-    'caterers/band/disco',
-    'caterhams',
-    'catering-geared',
-    'catering/',
-    'caterino',
-    'catermaster',
     'caterpillar-hunting',
-    'caterpillar:plump',
-    'caterpillars-you',
-    'caterwauler',
-    'caterwauls',
-    'caterwise',
-    'catesbaea',
-    'catex',
-    'catey',
-    'catfishes',
-    'catfoss',
-    'catggccatg',
-    'cath\'lics',
-    'cath\'rine',
-    'cathab',
-    'catharacta',
     'catharanthus',
-    'catharism',
-    'catharists',
-    'catharsis.',
-    'cathart',
-    'cathartically',
-    'cathayan',
-    'cathcom',
-    'cathechism',
-    'cathecting',
-    'cathederal',
-    'cathedra',
-    'cathedral-',
-    'cathedral-aisle',
-    'cathedral-building',
-    'cathedral-size',
     'cathedral-style',
-    'cathedral.the',
-    'cathenne',
-    'catherall',
-    'catherer',
-    'catherine-wheels',
-    'catherine/aged',
-    'cathering',
-    'catherington',
-    'catherter',
-    'catherterisation',
-    'catheter-tube',
-    'catheterise',
-    'catheterize',
-    'cathinians',
-    'cathlick',
     'cathlicks',
-    'cathlon',
-    'cathole',
-    'catholic&mdash;but',
-    'catholic-agrarian',
-    'catholic-approved',
-    'catholic-aristocratic',
-    'catholic-conservative',
-    'catholic-educated',
-    'catholic-led',
-    'catholic-protestant',
-    'catholic-puritan',
-    'catholic/a',
-    'catholica',
-    'catholicised',
-    'catholicism-nation',
     'catholicisme',
-    'catholics.',
-    'catholism',
-    'cathro',
-    'caths',
-    'catie',
-    'catina',
-    'cation-active',
-    'cation-bearing',
-    'catlick',
-    'catlimore',
-    'catlin/peter',
-    'catline',
-    'catlins',
-    'catmose',
-    'catnapping',
     'catnip-soaked',
-    'catodon',
-    'catolicas',
-    'caton-thompson',
-    'catonbased',
-    'catone',
-    'catonsville',
-    'catori',
-    'catpaw',
-    'catraeth',
-    'catreeona',
-    'catrigg',
-    'catriona/glasgow',
-    'catroimani',
-    'cats\'-meat',
-    'cats-cradle',
     'cats-meat',
-    'cats.',
-    'cats/herons',
-    'catsash',
-    'catseye',
-    'catsgore',
-    'catskills',
-    'catsuited',
-    'catsup',
-    'catta',
-    'cattahianchi',
-    'cattails',
-    'cattaro',
-    'cattel',
-    'cattenom',
-    'catter',
     'catteral',
-    'catterline',
-    'cattersty',
-    'cattesty',
-    'catti',
-    'cattily',
-    'catting',
-    'cattini/tornado',
-    'cattinni',
-    'cattish',
-    'cattistock',
-    'cattivo',
-    'cattle&mdash;he',
-    'cattle&rehy;rustling',
-    'cattle-ambush',
-    'cattle-dealers',
     'cattle-drive',
-    'cattle-drives',
-    'cattle-fodder',
-    'cattle-food',
-    'cattle-grazing',
-    'cattle-herding',
-    'cattle-holdings',
-    'cattle-less',
-    'cattle-like',
-    'cattle-lorry',
-    'cattle-lovers',
-    'cattle-man',
-    'cattle-pastures',
-    'cattle-pen',
-    'cattle-pens',
-    'cattle-pounds',
     'cattle-prod',
-    'cattle-rancher',
-    'cattle-ranchers',
-    'cattle-ranching',
-    'cattle-road',
-    'cattle-rustler',
-    'cattle-rustlers',
-    'cattle-shed',
-    'cattle-sheds',
-    'cattle-stealers',
-    'cattle-steamers',
-    'cattle-thief',
-    'cattle-thieves',
-    'cattle-thieving',
-    'cattle-trucks',
-    'cattle-yard',
     'cattle-yards',
-    'cattle.but',
-    'cattle.in',
-    'cattlegrid',
-    'cattleshed',
-    'cattleways',
-    'cattlin',
-    'catunarich',
-    'catunda',
-    'catuvellaunian',
-    'catwalker',
-    'catway',
-    'catweasle',
-    'catwomen',
-    'catworth',
-    'caubeen',
     'caubet',
-    'caucasian-style',
-    'caucasicus',
-    'cauchon',
-    'cauchy-riemann',
-    'caudacutus',
-    'caudill',
-    'caudillos',
-    'caudimaculata',
-    'caudimaculatus',
-    'caudrey',
-    'caudron',
-    'caudwell/landowner',
-    'caued',
-    'caugh',
-    'caughedy',
     'caughie',
-    'caughley',
-    'caughoo',
-    'caught-and-bowleds',
-    'caught-but',
-    'caught-out',
-    'caught.the',
-    'caught_in',
-    'caughton',
-    'caul/public',
-    'caularthron',
-    'cauldewood',
-    'cauldren',
-    'cauldron-heads',
-    'cauldstane',
-    'cauldwell/herefordshire',
     'cauldwell/pre-school',
-    'cauli-head',
-    'cauli-wobbles',
-    'caulibus',
-    'caulies',
-    'cauliflow',
-    'cauliflower-like',
-    'caulis',
-    'caulkers',
-    'caulkett',
-    'caullery',
-    'caulton',
-    'caumartin',
-    'caumont',
-    'caunt',
-    'caunterbury',
     'caupenne',
-    'caurs',
-    'causa-r',
-    'causal-sounding',
-    'causalities',
-    'causality\'',
-    'causally-related',
-    'causans',
-    'causations',
-    'cause&mdash;to',
-    'cause-specific',
-    'cause-way',
-    'cause/cafod',
-    'cause_cel&egrave;bre',
-    'caused\'',
-    'causennis',
     'causeof',
-    'causeries',
-    'causes-hyperactivity',
-    'causes-more',
-    'causevic/injured',
-    'causevic/wife',
-    'causeway.',
-    'causewayhead',
-    'causewsay',
-    'causin',
-    'causin\'',
-    'causovic',
-    'caussade',
-    'caussed',
-    'caustic-soda',
-    'caustic-tongued',
     'caustic/chlorine',
-    'causticiser',
-    'causway',
-    'cautares',
-    'cautela',
-    'cautela.',
-    'cautella',
-    'cauterisation',
-    'cauterizing',
-    'cautes',
-    'cauther',
-    'cauthorne',
-    'cauti',
-    'caution(s)',
-    'cautions.',
-    'cautious-minded',
     'cautious/play',
-    'cautiously-worded',
-    'cautley',
-    'cav100',
-    'cava/right',
-    'cavacuiti',
-    'cavada',
-    'cavadino',
-    'cavae',
-    'cavaggioni',
-    'cavagnaro',
-    'cavaignac',
-    'cavalaire',
-    'cavalcante',
-    'cavalcare',
-    'cavalcaselle',
     'cavalek',
-    'cavaleri',
-    'cavali',
-    'cavalier/opel',
-    'cavaliero',
-    'cavallaro',
-    'cavalli-bjorkman',
-    'cavallini',
-    'cavalloeconomy',
-    'cavallos',
-    'cavallotti',
-    'cavally',
-    'cavalotti',
-    'cavalries',
-    'cavalry-owning',
-    'cavalry-twill',
     'cavalry-twilled',
-    'cavan-monaghan',
-    'cavanilles',
-    'cavanna',
-    'cavatina',
-    'cavator',
-    'cavatorta',
-    'cavazzuti',
-    'cave&rehy;man',
-    'cave\'',
-    'cave-bound',
-    'cave-brasil',
-    'cave-cities',
-    'cave-divers',
-    'cave-diving',
-    'cave-dwelling',
     'cave-floor',
-    'cave-ins',
-    'cave-mouths',
-    'cave-wife',
-    'cave-woman',
-    'cave.',
-    'cave/cpre',
-    'caveated',
-    'caveds',
-    'cavedwellers',
-    'caveful',
-    'cavelight',
-    'cavellini',
-    'cavemouth',
-    'caven-atack',
-    'cavenagh',
     'cavender',
-    'cavendish-woodhouse',
-    'cavenham',
-    'cavern-church',
-    'cavern-desk',
-    'cavern-like',
-    'cavern-roof',
-    'cavern-temple',
-    'caverne-phoenix',
-    'cavernoma',
-    'cavernously',
-    'cavero',
-    'caverswall',
-    'cavery',
-    'caves.',
-    'cavessons',
     'cavestany',
-    'caveston',
-    'cavewoman',
-    'cavex',
-    'caviare-eyed',
-    'cavies',
-    'caviety',
-    'cavillaciones',
-    'cavilled',
-    'cavillers',
-    'cavilling/marra',
-    'caviste',
-    'cavitate',
-    'cavitated',
-    'cavitous',
-    'cavity-despite',
     'cavity-filled',
-    'cavity-foam',
-    'cavity-mode',
-    'cavity-nesting',
-    'cavity-resonant',
-    'cavlin',
-    'cavmont',
-    'cavorite',
-    'cavvy',
-    'cavy',
-    'cawardine',
-    'cawes',
-    'cawforth',
-    'cawings',
-    'cawington',
-    'cawkwell/college',
     'cawle',
-    'cawledge',
-    'cawood',
-    'cawr',
-    'cawsey',
-    'cawsts',
-    'caxais',
-    'caxlodge',
-    'caxton\'',
-    'cayasso',
-    'caycedo',
-    'cayent',
-    'cayerfully',
-    'cayes',
-    'cayla',
-    'caylers',
     'cayley-torrington',
-    'caynazzo',
-    'cayoma',
-    'cayron',
-    'caytiue',
-    'caytoniales',
-    'cayuni',
-    'cayzer',
-    'cazabon',
-    'cazale',
-    'cazaly',
-    'cazanove',
-    'cazelet',
-    'cazin',
-    'cazire',
-    'cazmatann',
     'cazorla',
-    'cazort',
-    'cazrti',
-    'cazyer',
-    'cb-1',
-    'cb-radio',
-    'cb0006',
-    'cb1-ah7',
-    'cb1250rm',
-    'cb25',
-    'cba/cact',
-    'cba/nederland',
-    'cbaxc57',
-    'cbde',
-    'cbe/inspector',
-    'cbema',
     'cbfs',
-    'cbi/bs',
-    'cbi/cia',
-    'cbi/coopers',
-    'cbi/dti/bim',
-    'cbi/natwest',
-    'cbiol',
-    'cbis',
-    'cbl',
-    'cbns',
-    'cbs%uk.ac.uknet-relay',
-    'cbs-chongjin',
-    'cbs-tv',
-    'cbs/epic',
-    'cbsiftcb',
-    'cbz-arg-arg-&bgr;-naphthylamide',
     'cbz-arg-arge-&bgr;-naphthylamide',
-    'cc-3\'',
-    'cc-cotton',
-    'cc-cup',
-    'cc-e',
-    'cc-g-c',
-    'cc-m3t',
-    'cc-m4t',
-    'cc-operating',
-    'cc-ordinated',
-    'cc.',
-    'cc.operation',
-    'cc.ordinating',
-    'cc.qry',
-    'cc117',
-    'cc4',
     'cca=serum',
-    'ccacc',
-    'ccaccat',
-    'ccaccatg',
-    'ccagctgagcagcccag',
-    'ccagg',
-    'ccall',
-    'ccaod',
-    'ccbi',
-    'ccbn',
-    'ccc+',
-    'ccc/manager',
-    'ccccccfffccfcfffffffffcccfffccff',
-    'cccckkk',
-    'cccdna',
-    'ccchhhrrr',
     'cccp&ndash;81434',
-    'cccp&ndash;l5275',
-    'ccctgtgtgtgttctctgatg',
-    'cccvcc',
-    'ccdc',
-    'ccdh',
-    'ccdhrn',
-    'ccdp',
-    'cce',
-    'cce500',
-    'ccem',
-    'ccessdon\'tw',
-    'ccffcfccccccccccccfffffcfcfcffff',
-    'cch',
-    'cchhr',
-    'cci\'s',
     'cci4',
-    'ccir',
-    'ccix',
-    'ccl\'s',
-    'ccl4.',
-    'ccm1',
-    'ccmail',
-    'ccmi',
-    'ccngg',
-    'ccny',
-    'ccoach',
-    'ccoeliac',
-    'ccojb',
-    'cconcentrated',
-    'ccostly',
-    'ccould',
     'ccp-led',
-    'ccpa',
-    'ccpit',
-    'ccprs',
-    'ccrai-nccj',
-    'ccrorder',
-    'ccsu',
-    'cctgg',
-    'ccts',
-    'ccttttccttattaacctgc',
-    'cctvs',
-    'ccu-clc',
-    'ccup/cflo',
-    'ccup/fclo',
-    'ccus',
-    'ccv',
     'ccvc',
-    'ccvcc',
-    'ccvt',
-    'ccw/cprw',
-    'ccxlviii',
-    'ccxxi',
-    'ccxxv',
-    'ccxxxi',
-    'cd&bsol',
-    'cd&bsol;dustbin',
-    'cd&bsol;kermit',
-    'cd-603',
-    'cd-7000',
-    'cd-buying',
-    'cd-canterbury',
-    'cd-cfp4481',
     'cd-plus-eight-',
-    'cd-r',
-    'cd-radio-cassette',
-    'cd-rom&rehy;based',
-    'cd-rom-delivered',
-    'cd-rom-xa',
-    'cd-single',
-    'cd-v',
-    'cd.',
-    'cd.1',
-    'cd.1200',
-    'cd.9239',
-    'cd/rom',
-    'cd11a',
-    'cd11a/cd18',
-    'cd11b',
     'cd11b/cd18',
-    'cd16',
-    'cd2/cd4',
-    'cd2/cd59',
-    'cd29',
-    'cd3/19',
-    'cd3/4',
-    'cd3/8',
-    'cd32',
-    'cd36',
-    'cd4&lt;300/l',
-    'cd4-biotin-pe',
-    'cd4-cd8',
-    'cd4-envelope',
-    'cd4-pe',
-    'cd44/vcam-1',
     'cd44548',
-    'cd45-depleted',
-    'cd45/14',
-    'cd45rb',
-    'cd45rc+',
-    'cd45rc-',
-    'cd45ro',
-    'cd48',
-    'cd4lymphocytopenia',
-    'cd58',
-    'cd62',
-    'cd7',
-    'cd8-earlstown',
-    'cda&mdash;christian',
-    'cda-vvd',
-    'cda9',
     'cdbg',
-    'cdc-625',
-    'cdc25',
-    'cdc7',
-    'cdca/day',
-    'cdcd',
-    'cdcl',
-    'cdcw/cprw',
-    'cdd/plus',
-    'cdd/repository',
-    'cdes',
-    'cdev',
-    'cdex/tdex',
-    'cdgae',
-    'cdh',
-    'cdif',
     'cdjr',
-    'cdm4',
-    'cdma/analogue',
-    'cdms',
-    'cdna-deduced',
-    'cdo',
-    'cdp-397',
-    'cdp-497',
-    'cdp-c325m',
-    'cdp-c425',
-    'cdp-m44',
-    'cdp-m54',
-    'cdp-x339',
-    'cdp-x339es',
-    'cdp-x559',
-    'cdpf',
     'cdps',
-    'cdrjc',
-    'cds&mdash;centre',
-    'cds.',
-    'cds/isis',
-    'cdtce',
-    'cdu&mdash;christian',
-    'cdu-christian',
-    'cdu-csu',
-    'cdu-csu-fdp',
-    'cdu-pav',
-    'cdu/',
-    'cdu/csu-fdp',
-    'cdu/csu/spd',
-    'cdu/fdp',
-    'cdu404838.745.1',
     'cdw27',
-    'cdx-460',
-    'cdx-560',
-    'cdx-660',
-    'cdx-860',
-    'cdxl',
-    'cdzz',
-    'ce-1',
-    'ce-150',
-    'ce-200',
-    'ce/1leste',
-    'ce/e',
-    'ce/yb',
-    'ce1112',
-    'ce2b',
-    'ce2l',
     'ce601',
-    'cea-industrie',
-    'cea-paz',
-    'ceacescu',
-    'ceann',
-    'ceannlleach',
-    'ceara',
-    'cearid',
-    'cearl',
-    'cearls',
-    'cease-fire.s',
-    'ceasefirewas',
-    'ceasessee',
-    'ceasfires',
-    'ceasire',
-    'ceation',
     'ceau&scedil;cscu',
-    'ceaux',
-    'ceawlin',
-    'cebaco',
-    'cebado',
-    'cebus',
-    'cec/soed',
-    'cecal',
-    'ceccano',
-    'ceccato',
-    'cecchinato',
-    'cecco',
-    'cecconi',
-    'cece',
-    'cechmaine',
-    'cecidomyidae',
     'cecil-keays',
-    'cecilio',
-    'cecilius',
-    'cecill',
-    'cecropiaceae',
-    'ceda-manipulated',
-    'ceda-radical',
-    'cedano',
-    'cedar-barque',
-    'cedar-sinai',
-    'cedar-topped',
-    'cedar-tree',
-    'cedarlea',
-    'ceddesfield',
-    'cedens',
-    'cedere',
     'cederhielm',
-    'cedes',
-    'cedewain',
-    'cedf',
-    'cedgs',
-    'cedile',
-    'cedilla',
-    'cedis',
-    'cedists',
-    'cedit',
-    'cedmas',
-    'cedoin',
-    'cedomir',
-    'cedona',
-    'cedre',
-    'cedrela',
     'cedric-lucy',
-    'cedrics',
-    'cedrus',
-    'cee-ed',
-    'ceea',
-    'ceecom',
-    'ceefax-style',
-    'ceegar',
-    'ceel',
-    'ceep',
-    'cef',
-    'cefai',
-    'cefamandole',
-    'cefin',
-    'cefixime',
-    'cefnddwysarn',
     'cefotetan',
-    'cefotiame',
-    'cefrino',
-    'cefta',
-    'ceftazidime',
-    'cefuroxim',
-    'cefuroxime',
-    'cefyn',
-    'ceg',
-    'cegb/sseb',
-    'cegs',
-    'cehe',
-    'cehill',
-    'cehovin',
-    'ceibe',
-    'ceil',
     'ceila',
-    'ceilidh.',
-    'ceilidhing',
-    'ceilin',
-    'ceilin\'',
-    'ceiling-busting',
-    'ceiling-full',
-    'ceiling-hung',
-    'ceiling-lights',
-    'ceiling/with',
-    'ceilingward',
-    'ceiliuradh',
-    'ceinwen',
-    'ceirog',
-    'ceitlin',
-    'cekuolis',
     'cel&aelig;no',
-    'celadons',
-    'celam',
-    'celan',
-    'celastic',
-    'celauro',
-    'celbes',
-    'celbrating',
-    'celbridge',
-    'celco',
-    'celcon',
-    'celcured',
-    'cele-brated',
-    'celeb\'s-eye',
-    'celeb-filled',
-    'celeb-snapper',
     'celebesian',
-    'celebrantur',
-    'celebrat',
-    'celebratary',
-    'celebrate.2',
-    'celebrate/major',
-    'celebrated\'',
-    'celebration-of-democracy',
-    'celebrational',
-    'celebratons',
-    'celebrator',
-    'celebratorily',
-    'celebrators',
-    'celebrimbor',
-    'celebrity-filled',
-    'celebrity-packed',
     'celebrity-seeking',
-    'celebrity-strewn',
-    'celebrity.he',
-    'celebritydom',
-    'celebrologist',
-    'celena',
-    'celene',
-    'celeno',
-    'celep',
-    'celere',
-    'celerina',
-    'celeritate',
-    'celery-flavoured',
-    'celery-like',
-    'celery.',
-    'celescu',
     'celesia',
-    'celeste-ville',
-    'celesteville',
-    'celestially',
-    'celestian',
-    'celestina',
-    'celestion-loaded',
-    'celfyn',
-    'celibacy-conscious',
-    'celibacy/marriage',
-    'celinda',
-    'celines',
-    'celinet',
-    'celino',
-    'celio',
-    'celiomonte',
     'cell\'s&ndash;chromosomes',
-    'cell-',
-    'cell-adhesion',
-    'cell-binding',
-    'cell-block',
-    'cell-blocks',
-    'cell-bodies',
-    'cell-by-cell',
-    'cell-casting',
-    'cell-culture',
-    'cell-cycle',
-    'cell-death',
-    'cell-division',
-    'cell-formation',
-    'cell-link',
-    'cell-phone',
     'cell-sorted',
-    'cell-specific',
-    'cell-structure',
-    'cell-switch',
-    'cell-washing',
-    'cell/cell',
-    'cellamare',
-    'cellan',
-    'cellar-bar',
-    'cellar-dwellers',
-    'cellar-dwellings',
-    'cellar-level',
-    'cellar/on',
-    'cellarage',
-    'cellardwellers',
-    'cellaret',
     'cellarful',
-    'cellarless',
-    'cellarmasters',
-    'cellata',
-    'celler',
-    'cellifier',
-    'cellnotr',
-    'cello-brate',
-    'cello-oboe',
-    'cellobiose/',
-    'cellofilm',
-    'celloobiose/mannitol',
-    'cellophaned',
-    'cellotex-and-formica',
-    'cells-unit',
-    'cells/barracks',
     'cells/crypt/',
-    'cells/ml.',
-    'cells/pan-t',
-    'cells/specimen',
-    'cells/spleen',
-    'cells/unit',
-    'cellu',
-    'celluar',
-    'cellucon',
-    'celluheavy',
-    'cellular-telephone',
-    'cellularly',
-    'cellulase',
-    'cellulite-laden',
-    'cellulitic',
-    'cellulizer',
     'cellulolytic',
-    'cellulum',
-    'celluplex',
-    'celmisia',
-    'celos',
-    'celotti',
-    'celsian',
-    'celsteel',
-    'celta',
-    'celtae',
-    'celtiberic',
-    'celtic-mad',
-    'celtic-roman',
-    'celtic-scottish',
-    'celtic-speaking',
-    'celtic-type',
     'celtic/isora',
-    'celtic1',
-    'celtic2',
-    'celtic3',
-    'celtick',
-    'celutel',
-    'celyn',
-    'cem&acirc;l&icirc',
-    'cemat',
-    'cembali',
-    'cemc',
-    'cement-asbestos',
-    'cement-back-filled',
-    'cement-based',
-    'cement-coloured',
-    'cement-filled',
     'cement-fixation',
-    'cement-lined',
-    'cement-rendered',
-    'cement/ballast',
-    'cement230',
-    'cement:sand',
-    'cementite',
-    'cementless',
-    'cementwork',
-    'cemetaries',
-    'cemetary',
-    'cemetery\'s-on-sea',
-    'cemetries',
-    'cemil',
-    'cemit&eacute;rio',
-    'cemp',
     'cen-ars',
-    'cen-dxs3-',
-    'cena',
-    'cenap',
-    'cenargo',
-    'cenberht',
-    'cenbiot',
-    'cenbose',
-    'cenchrus',
-    'cencio',
-    'cencius',
-    'cenderawasih',
-    'cendre',
-    'cener',
-    'cenfrith',
-    'cenfus',
     'cennydd',
-    'cenobite',
-    'cenobitic',
-    'cenoceras',
-    'cenocladum',
-    'cenomani',
-    'cenomarv',
-    'cenotaph\'-the',
-    'censere',
-    'censerie',
-    'censor-operated',
-    'censor-taunting',
-    'censored/moderated',
-    'censorinus',
-    'censorship.',
-    'censu',
     'censurer',
-    'census-awareness',
-    'census-defined',
-    'census-ratings',
-    'census-taking',
-    'census-to-census',
-    'cent&mdash;had',
-    'cent&mdash;it',
-    'cent(p&lt;0.05)',
-    'cent-wise-dollar-foolish',
-    'cent.profit',
-    'cent.the',
-    'cent/month',
-    'cent1',
-    'cent3',
-    'cent7',
     'centaploy',
-    'centaur-like',
-    'centaura',
-    'centauran',
-    'centaures',
-    'centaurus-powered',
-    'centauruses',
-    'centavo',
-    'centawer',
-    'centella',
-    'centenaria',
-    'centenario',
-    'centenarius',
-    'centenary-class',
-    'centennial-season',
-    'center-half',
     'center-of-mass',
-    'center-stage',
-    'centerpartiet',
-    'centersshowed',
-    'centesimus',
-    'centex',
-    'centilly',
-    'centime',
-    'centime-counting',
-    'centimeters',
-    'centimetre-scale',
-    'centimetre-to-metre-scale',
-    'centimetre-wide',
-    'centimetres/inches',
-    'centimorgan',
-    'centincome',
     'centium',
-    'centocelle',
-    'centolla',
-    'centore',
-    'centoxin',
-    'centraal',
-    'centrafricain-rdc',
-    'centrafricaine',
-    'centrafrique',
-    'centrais',
-    'central&rehy;heating',
-    'central-american',
-    'central-city',
-    'central-control',
-    'central-defensive',
-    'central-ise',
     'central-planning',
-    'central-western',
-    'central-wrawby',
-    'central/',
-    'central/peripheral',
-    'centralia',
-    'centraliens',
-    'centralisa&rehy;tion',
-    'centralisation/',
-    'centralised-bargaining',
-    'centraliser&mdash;de-centraliser',
-    'centralistic',
-    'centralists',
-    'centralized-state',
-    'centralizes',
-    'centrally-based',
     'centrally-defined',
-    'centrally-developed',
-    'centrally-held',
-    'centrally-prepared',
-    'centrally-set',
-    'centrally-situated',
-    'centrally.',
-    'centrallyplanned',
-    'centralness',
-    'centralsystem',
-    'centrarchidae',
-    'centrarchids',
-    'centrated',
-    'centre&mdash;the',
-    'centre\'',
-    'centre-back/centre-front',
     'centre-boarder',
-    'centre-by-centre',
-    'centre-centre',
-    'centre-chest',
-    'centre-class',
-    'centre-conservative',
-    'centre-controlled',
-    'centre-cum-fly-half',
-    'centre-cum-sports',
-    'centre-detente',
-    'centre-east',
-    'centre-entrance',
-    'centre-field',
-    'centre-focused',
-    'centre-folds',
-    'centre-frame',
     'centre-front',
-    'centre-furrows',
-    'centre-hole',
-    'centre-less',
-    'centre-libera',
-    'centre-liberal',
-    'centre-loaded',
-    'centre-locality',
-    'centre-off',
-    'centre-partners',
-    'centre-pin',
-    'centre-pivoting',
-    'centre-screen',
-    'centre-sewn',
-    'centre-shafted',
-    'centre-sponsored',
     'centre-spreads',
-    'centre-stapled',
-    'centre-strip',
-    'centre-table',
-    'centre-threequarter',
-    'centre-to-centre',
-    'centre-weighted',
-    'centre-west',
-    'centre-wheel',
-    'centre.',
-    'centre.ps',
-    'centre.the',
-    'centre/civic',
-    'centre/hotel',
-    'centre/library',
-    'centre/margin',
     'centre/periphery',
-    'centre/region',
-    'centre/road/railway',
-    'centre/sports',
-    'centre/west',
-    'centred-account',
-    'centred.',
-    'centreism',
-    'centreless',
-    'centrepages',
-    'centreparcs',
-    'centrepetal',
-    'centrepin',
-    'centreprise',
-    'centres/subjects',
-    'centresand',
     'centresport',
-    'centrestand',
-    'centrewhich',
-    'centricon-10',
-    'centrifiguration',
-    'centrifugated',
-    'centrigade',
-    'centrigudes',
-    'centrigued',
-    'centrilobular',
-    'centriprep',
-    'centriprep-10',
-    'centrista',
-    'centroam&eacute;rica',
-    'centroamericano',
-    'centroamericanos',
     'centroblastic',
-    'centroblastic/centrocytic',
-    'centrocytic',
-    'centromere-associated',
-    'centromin',
-    'centropus',
-    'centros',
-    'centrosome',
-    'centrosomes',
-    'centrum-democraten',
-    'centrumdemocraten',
-    'centruroides',
-    'centry',
-    'cents.',
-    'cents/bbl',
-    'centu',
     'centuary',
-    'centurial',
-    'centuriate',
-    'centuries&rehy;gone',
-    'centuries-gone',
-    'centuries-worth',
-    'centuries.',
-    'centurio',
-    'centurion-like',
-    'centuriones',
-    'century&mdash;simonds',
-    'century-but',
-    'century-ecclesiastical',
-    'century-hutchinson',
-    'century-perhaps',
-    'century-that',
     'century-when',
-    'century-wide',
-    'century.4',
-    'century.more',
-    'century.they',
-    'century/arrow',
-    'century/early',
-    'century/english',
-    'century/hutchinson/arrow/legend',
-    'centurymakers',
-    'centurythey',
-    'cenwald',
-    'ceoe',
-    'ceolbeg',
-    'ceolicolor',
-    'ceolin',
     'ceolwald',
-    'ceonocc',
-    'ceonothus',
-    'ceontea',
-    'cepacia-positive',
-    'cepacia-specific',
-    'cepacia.',
-    'cepad',
-    'cepe',
-    'cepg',
-    'cephalanthus',
-    'cephalaspis',
-    'cephale',
-    'cephalization',
-    'cephalo-caudal',
-    'cephalochordate',
     'cephalodiscus',
-    'cephalon',
-    'cephalopoda',
-    'cephalopoid',
-    'cephalopolydactyly',
-    'cephalosporium',
-    'cephalotes',
-    'cephisodotus',
-    'cepilux',
-    'ceplac',
-    'cepn',
-    'cepo',
-    'cepr-nber',
-    'cer-tain',
-    'ceraceous',
-    'cerafotherium',
     'cerain',
-    'cerainly',
-    'ceralene',
-    'ceralo',
-    'cerambycidae',
-    'ceramesh',
-    'ceramic-and-leather',
-    'ceramic-hob',
-    'ceramic-like',
-    'ceramic-mounted',
-    'ceramic-reinforced',
-    'ceramics/paintings',
-    'ceramide/gh',
-    'ceramik',
-    'ceramista',
-    'ceramists',
     'cerana',
-    'cerasi',
-    'cerasifera',
-    'cerasifolia',
-    'cerate',
-    'ceratec',
-    'cerates',
-    'ceratias',
-    'ceratiidae',
-    'ceratite',
-    'ceratodon',
-    'ceratophyllum',
-    'ceratostigma',
-    'ceravolo',
-    'cerc',
-    'cercal',
     'cercamon',
-    'cercando',
-    'cercariae',
-    'cercato',
-    'cerchi',
-    'cercis',
-    'cercla',
-    'cercone',
-    'cercopithecoidea',
-    'cercopithecus',
-    'cerdagne',
-    'cerdana',
-    'cerdanya',
-    'cerddi',
-    'cerddoriaeth',
-    'cerdo',
     'cere-cloth',
-    'cereal-',
-    'cereal-based',
-    'cereal-importing',
-    'cereal-offering',
-    'cereale',
-    'cerealicoltura',
-    'cerealogists',
-    'cerebal',
-    'cerebellums',
-    'cereblis',
-    'cerebralism',
-    'cerebrally',
-    'cerebrations',
-    'cerebrism',
-    'cerebrist',
     'cereclothed',
-    'ceredase',
-    'ceredigion\'',
-    'cerely',
-    'cerement',
-    'ceremoney',
-    'ceremoniall',
-    'cereologist',
-    'cereq',
-    'cerestar',
-    'ceretainly',
-    'cerfs',
-    'cerialised',
-    'cerian',
-    'cerillo',
-    'cerillos',
     'cerinthus',
-    'ceriph',
-    'cerise-and-navy',
-    'cerise-magenta',
-    'cerise-pink',
-    'cerises',
-    'cerisettes',
-    'cerish',
-    'cerium-based',
-    'cerknica',
-    'cernac',
-    'cernavoda',
-    'cerniog',
-    'cernobbio',
-    'cernohlavek',
-    'ceropithecus',
     'cerrados',
-    'cerrava',
-    'cerrej',
-    'cerrlabobuv',
-    'cerrone',
-    'cerrutty',
-    'cert15',
-    'cert:pg',
-    'certa',
-    'certain-death',
-    'certain-line',
-    'certain-the',
-    'certain.facts',
-    'certainement',
-    'certainlt',
-    'certainly-they',
     'certainly.they',
-    'certainy',
-    'certally',
-    'certayne',
-    'certeine',
-    'certentye',
-    'certifcate',
-    'certificand',
-    'certificate-holding',
-    'certificate-related',
-    'certificate/doctors',
-    'certificate/portfolio/',
-    'certificatesseparate',
-    'certifications/doctors',
-    'certificats',
-    'certificuts',
     'certifire',
-    'certinly',
-    'certiorati',
-    'certis',
-    'certology',
-    'certorari',
-    'cerulli',
-    'ceruna',
-    'cervantic',
-    'cervelas',
-    'cervera',
-    'cervetti',
-    'cerveza',
-    'cervezas',
-    'cervia',
-    'cervic',
     'cervical-cancer',
-    'cervical-octamer',
-    'cervical-specific',
-    'cerviciae',
-    'cervicothoracic',
-    'cervidius',
-    'cervilla',
-    'cervis',
-    'ceryth',
-    'ces&aacute;r',
-    'cesario',
-    'cesarovitch',
-    'cesay',
-    'ceside',
-    'cesio',
-    'ceske',
     'cesky',
-    'cesne',
-    'cesnoh',
-    'cesopot',
-    'cess-pits',
-    'cessda',
-    'cesse',
-    'cessio',
-    'cessna-310',
-    'cessna-equipped',
-    'cessolis',
-    'cestine',
-    'cestius',
-    'cesto',
-    'cestode',
-    'cestodes',
     'cestrum',
-    'cestuis',
-    'cetacean-sized',
-    'cetaceans.',
-    'cetain',
-    'cetaweyo',
-    'cetekovac',
-    'cetelem',
-    'ceteris',
-    'cetes',
-    'cetinkaya',
-    'cetoniid',
-    'cetra',
-    'cetrek',
-    'cetyl',
-    'cetyltrimethyl',
     'ceud',
-    'ceufad',
-    'ceulan',
-    'ceulemans',
-    'ceva',
-    'cevallo',
-    'ceveland',
-    'cevers',
-    'cevin',
-    'cevizdali',
-    'cexecutive',
-    'ceyrargues',
-    'ceyrek',
-    'cezar',
-    'ceze',
-    'cezeri',
     'cf&lsqb;5&rsqb',
-    'cf&ndash;104',
-    'cf&ndash;dtl',
-    'cf&ndash;gbi',
-    'cf&ndash;gli',
-    'cf&ndash;igx',
-    'cf(5.3)',
-    'cf-1000',
-    'cf-18',
-    'cf-480',
-    'cf-480c',
-    'cf-700',
-    'cf-700s',
-    'cf-fly',
-    'cf-modified',
-    'cf-psg',
     'cf-tdo',
-    'cf-type',
-    'cf-wis',
-    'cf.101',
-    'cf.102',
-    'cf.7.2',
-    'cf.honderich',
-    'cf.sections',
-    'cf/+',
-    'cf/c',
-    'cf/d',
-    'cf31',
-    'cf4',
-    'cf48',
-    'cf5',
-    'cf5610',
     'cf56a',
-    'cf56b',
-    'cf6/76',
-    'cf700-2c',
-    'cf800',
-    'cfa-franc',
-    'cfa1,000,000',
-    'cfa200',
-    'cfa30,000,000',
-    'cfag',
-    'cfast',
-    'cfb',
-    'cfc-113',
-    'cfc-13',
-    'cfc-blown',
-    'cfc11',
     'cfc12',
-    'cfc502',
-    'cfcl',
-    'cfdss',
-    'cfe-first',
-    'cfe1a',
-    'cfels',
-    'cfer',
-    'cfgs',
-    'cfla',
-    'cflp',
-    'cfm-metalfax',
-    'cfpo',
-    'cfqc',
-    'cfrb',
-    'cfrs',
     'cfsma',
-    'cfsr',
-    'cftr-expressing',
-    'cfu',
-    'cfup/cflo',
-    'cg-selective',
-    'cg3/svga',
-    'cgacattaaacacactggaac',
-    'cgatt',
-    'cgattaatcg',
-    'cgattc',
-    'cgattcctgggatac',
-    'cgattctcgggatac',
-    'cgbr',
-    'cgca',
-    'cgca/tgca',
     'cgcatatatgcg',
-    'cgcc',
-    'cgcggatccccggatgttcttctggtc',
-    'cgcggatccgttctggcactcctgagc',
-    'cgct',
-    'cgct/agcg',
-    'cgdgbd',
-    'cgdgbe',
-    'cgdh',
-    'cge-controlled',
-    'cge-itt',
-    'cgegae',
-    'cgegbe',
-    'cgegce',
-    'cgip',
-    'cgp-115',
     'cgsd',
-    'cgt-3\'',
-    'cgt-fo',
-    'cgtc',
-    'cgtgagggcatcgaggtggc',
-    'ch&acirc;let',
-    'ch&acirc;lon-sur-sa&ocirc;ne',
-    'ch&acirc;lons-sur-ch&acirc;lons-sur-marne',
-    'ch&acirc;teau-bottled',
-    'ch&acirc;teau-chinon',
-    'ch&acirc;teau-larcher',
-    'ch&acirc;teau-proprietors',
-    'ch&acirc;teau/baronial',
-    'ch&acirc;teaudun',
-    'ch&acirc;teaued',
-    'ch&acirc;teauneuf-du-pape',
     'ch&acirc;teaurenard',
-    'ch&acirc;teaurenault',
-    'ch&acirc;teauvillain',
-    'ch&acirc;telet-lomont',
-    'ch&acirc;tillon-sur-indre',
-    'ch&acirc;tillon-sur-marne',
-    'ch&acirc;timent',
-    'ch&acirc;tres',
-    'ch&agrave;tillon',
-    'ch&eacute',
-    'ch&eacute;crout',
-    'ch&eacute;i',
-    'ch&eacute;nier',
-    'ch&eacute;reau',
-    'ch&eacute;ri-bibi',
-    'ch&eacute;rif',
     'ch&eacute;valier',
-    'ch&eacute;ze',
-    'ch&egrave;vre',
-    'ch&ggr;1',
-    'ch&lsqb;a&rsqb;que',
-    'ch&mdash&mdash&mdash&mdash',
-    'ch&oacute;0',
-    'ch&oacute;0nin',
-    'ch&oacute;0sh&oacute;0',
-    'ch&oacute;0sh&uacute',
-    'ch&oacute;sh&uacute',
-    'ch&uuml;n',
-    'ch\'',
-    'ch\'ang',
-    'ch\'el',
-    'ch\'ella',
     'ch\'in-sei',
-    'ch\'know',
-    'ch\'min',
-    'ch\'ships',
-    'ch\'ung',
-    'ch\'uscite',
-    'ch-1',
-    'ch-4007',
-    'ch-47',
-    'ch-7',
-    'ch-7500',
-    'ch-8902',
-    'ch-ch-ch',
-    'ch-ch-chaps',
-    'ch-china',
-    'ch.12',
     'ch.16',
-    'ch.18',
-    'ch.22',
-    'ch.6',
-    'ch.7&ndash;9',
-    'ch.8',
-    'ch.iii',
-    'ch.v',
-    'ch/new',
-    'ch/state',
-    'ch1/ch2',
-    'ch16',
-    'ch2-',
-    'ch3.',
-    'ch3oh',
-    'ch5',
     'ch6-v-hiv/aids',
-    'ch8',
-    'cha&bsol;t4eau',
-    'cha\'n',
-    'cha-cha-chaaing',
-    'cha-chagarra',
-    'chaa',
-    'chaat',
-    'chaban&rehy;delmas',
-    'chabary',
-    'chabas',
-    'chabbering',
-    'chabbert',
-    'chabert',
-    'chabertiasis',
-    'chabi',
     'chablis-style',
-    'chabonchard',
-    'chabran',
-    'chabrot',
-    'chac',
-    'chac&oacute;n',
-    'chaceporc',
-    'chacewater',
-    'chachapoyas',
-    'chachoengsao',
-    'chack-chack',
-    'chack-chacking',
-    'chacksfield',
-    'chacmool',
-    'chacok',
-    'chacon',
     'chacony',
-    'chacra',
-    'chad-libyan',
-    'chadam',
-    'chaddha',
-    'chaddian',
-    'chaddians',
-    'chaddlewood',
-    'chadha',
-    'chadkirk',
-    'chads',
-    'chadswith',
-    'chadwick-jones',
-    'chadwick_et',
-    'chadwickian',
-    'chadwicks',
     'chadworth',
-    'chady',
-    'chadyr',
-    'chaebols',
-    'chaemerops',
-    'chaerophon',
-    'chaetae',
-    'chaetoceros',
-    'chaetodons',
-    'chaetognath',
-    'chaetotaxy',
-    'chafe-wax',
-    'chafee',
-    'chaff-chutter',
-    'chaff-tempering',
-    'chaffani',
     'chaffering',
-    'chaffin',
-    'chaffris',
-    'chaffs',
-    'chafing-dish',
-    'chafyn',
-    'chagall.',
-    'chagallian',
-    'chagans',
-    'chaggar',
-    'chagla',
-    'chagoi',
-    'chagool',
-    'chagos',
-    'chagres',
-    'chague',
     'chah',
-    'chahab',
-    'chahine',
-    'chaianan',
-    'chaif',
-    'chaili',
-    'chain&rehy;festooned',
-    'chain&rehy;smoker',
-    'chain&rehy;smoking',
-    'chain-breaking',
-    'chain-dotted',
-    'chain-drank',
-    'chain-drinking',
-    'chain-drive',
-    'chain-ferry',
-    'chain-guard',
     'chain-linked',
-    'chain-pulling',
-    'chain-rattling',
-    'chain-read',
-    'chain-saws',
-    'chain-shot',
-    'chain-smokers',
-    'chain-specific',
-    'chain-whipped',
-    'chain-wire',
-    'chain/bypass',
-    'chain/side',
-    'chainbreaking',
-    'chainbridge',
-    'chaine',
-    'chainey/judge',
     'chainguns',
-    'chainline',
-    'chainmailed',
-    'chainmaking',
-    'chainplate',
-    'chainplates',
-    'chains_such',
-    'chainsaw-handed',
-    'chainsaw-happy',
-    'chainsaw-wielding',
-    'chainsawed',
-    'chainsmoke',
-    'chainsmoking',
-    'chainstitch',
-    'chainstore-owner',
-    'chainsword-fist',
     'chainworker',
-    'chaipaval',
-    'chair&rehy;manship',
-    'chair-and-desk',
-    'chair-backs',
-    'chair-based',
-    'chair-bodgers',
-    'chair-chair',
-    'chair-covers',
-    'chair-cum-bed',
-    'chair-designate',
-    'chair-frames',
-    'chair-is',
-    'chair-legs',
-    'chair-men',
-    'chair-o-plane',
     'chair-o-planes',
-    'chair-person',
-    'chair-rail',
-    'chair-ridden',
-    'chair-shape',
-    'chair-shuffling',
-    'chair-straddling',
-    'chair-then',
-    'chair/bench/stool/seat',
-    'chair/harness',
-    'chair/rucksack',
-    'chairamn',
-    'chairbear',
-    'chairbears',
-    'chaircovering',
-    'chaire',
     'chairfast',
-    'chairfman',
-    'chairladder',
-    'chairlady',
-    'chairleather',
-    'chairline',
-    'chairm',
-    'chairmaker',
-    'chairman&rehy;ship',
-    'chairman-of-the-board',
-    'chairman-president',
-    'chairman-to-be',
-    'chairman.but',
-    'chairman/',
-    'chairman/bucks',
-    'chairman/coordinator',
     'chairman/courage',
-    'chairman/directors',
-    'chairman/home',
-    'chairmen/spokesmen',
-    'chairmen/women',
-    'chaironea',
-    'chairoplanes',
-    'chairpersonship',
-    'chairpersonships',
-    'chairs-',
-    'chairs.',
-    'chairseat',
-    'chairstools',
-    'chaise&rehy;dieu',
-    'chaise-dieu',
-    'chaisehouse',
     'chaises-longues',
-    'chaisgein',
-    'chaissac',
-    'chaitow',
-    'chaiyasarn',
-    'chaka-chaka-chaka-chaka-chaka',
-    'chakari',
-    'chakdara',
-    'chakiris',
-    'chakka',
-    'chakkrapong',
-    'chakoladnovy',
-    'chakori',
-    'chakoti',
-    'chakra-nadi',
-    'chakraverty/ship',
     'chakri',
-    'chakvad',
-    'chala',
-    'chalak',
-    'chalamain',
-    'chalamont',
-    'chalamp&eacute',
-    'chalan',
-    'chalcedonic',
-    'chalcedonica',
-    'chalchihuitl',
-    'chalcidian',
-    'chalcidians',
-    'chalcidic',
-    'chalcidius',
-    'chalcidoid',
     'chalcidoidea',
-    'chalcone',
-    'chaldaea',
-    'chaldaei',
-    'chaldea',
-    'chaldee',
-    'chaldeworth',
-    'chaleff',
-    'chalet-bungalow',
-    'chalet-restaurant',
-    'chaleur',
-    'chalfield',
-    'chalgrove/oxfordshire',
-    'chalice-shaped',
-    'chalicodoma',
-    'chalk-and-cheese',
     'chalk-and-talk',
-    'chalk-based',
-    'chalk-boards',
-    'chalk-caves',
-    'chalk-drawn',
-    'chalk-dusted',
-    'chalk-figured',
-    'chalk-haired',
-    'chalk-like',
-    'chalk-line',
-    'chalk-marked',
-    'chalk-or-cheese',
-    'chalk-smeared',
-    'chalk-stripe',
-    'chalk-striped',
-    'chalk-waggons',
     'chalkboard/whiteboard',
-    'chalkboards',
-    'chalke/tory',
-    'chalkedon',
-    'chalker-pearson',
-    'chalker/overseas',
-    'chalkers',
-    'chalkey',
-    'chalkhouse',
-    'chalkias',
-    'chalkidian',
-    'chalkidians.',
-    'chalkier',
-    'chalkin',
-    'chalkiness',
-    'chalkings',
     'chalkpits',
-    'chalksman',
-    'chalkstripe',
-    'chalky-marl',
-    'challand',
-    'challange',
-    'challenbrooke',
-    'challeneger',
-    'challenge\'93',
-    'challenge-acceptance',
-    'challenge-driven',
-    'challenge-the',
-    'challenge-the-pro',
-    'challenge/response',
-    'challengeability',
-    'challenger/space',
     'challengers-in-waiting',
-    'challenges&mdash;not',
-    'challi-bar',
-    'challow/oxfordshire',
-    'chalmers/aid',
-    'chalmers/scout',
-    'chalo',
-    'chalon-sur-',
-    'chalone',
-    'chalongphob',
-    'chalonnaise',
-    'chaloup&eacute;s',
-    'chalst',
-    'chalstrey',
-    'chaltenham',
-    'chalvey',
     'chalwyn',
-    'cham-pionships',
-    'chamaco',
-    'chamaecyparis',
-    'chamaecyparissus',
-    'chamaedrys',
-    'chamaemorus',
-    'chamaerhododendron',
-    'chamali&egrave;res',
-    'chamartin',
-    'chamber-dimension',
-    'chamber-music',
-    'chamber-scale',
-    'chamberlain-birkenhead',
-    'chamberlain-in',
-    'chamberlain-mussolini',
     'chamberlain/drag',
-    'chamberlain/neighbour',
-    'chamberlain/royal',
-    'chamberlainesque',
-    'chamberlainship',
-    'chamberlayne/farmer',
-    'chamberlens',
-    'chambermaiding',
-    'chambermen',
-    'chambers/estate',
-    'chambers/iveco',
-    'chamblain',
-    'chambler',
-    'chambletting',
-    'chambons',
-    'chambrer',
     'chambrin',
-    'chamcha',
-    'chamden-london',
-    'chameleonic',
-    'chameleonism',
-    'chameleonlike',
-    'chameleons/rem',
-    'chamically',
-    'chamintong',
-    'chamions',
-    'chamionship',
-    'chamlay',
-    'chamlet',
-    'chamoix',
-    'chamoli',
-    'chamomiles',
     'chamond',
-    'chamorin',
-    'chamouns',
-    'champ&eacute;tre',
-    'champ-ian',
-    'champ.ship',
-    'champaben',
-    'champagnac',
-    'champagnat',
-    'champagne*',
-    'champagne-ardenne',
-    'champagne-colour',
-    'champagne-cooled',
-    'champagne-filled',
-    'champagne-hued',
-    'champagne-lorraine',
     'champagne-pyramid',
-    'champagne-showers',
-    'champagne-swilling',
-    'champagne-tasting',
-    'champagne.',
-    'champaine',
-    'champaka',
-    'champerelle',
-    'champfleuri',
-    'champflower',
-    'champignonni&egrave;res',
-    'champigny',
-    'champion-elect',
-    'champion-ship',
-    'champion/auctioneer',
-    'champion/boss',
     'champion/former',
-    'championship-best',
-    'championship-chasing',
-    'championship-decider',
-    'championship-fa',
-    'championship-league',
-    'championships.',
-    'champit',
-    'champkin',
-    'champkins',
-    'champleve',
-    'champlieu',
-    'champman',
-    'champneuville',
-    'champoluc',
-    'champs-elys&eacute;e',
     'champs-elyse&eacute;s',
-    'champs-sur-marne',
-    'champsocephalus',
-    'champtercier',
-    'chanakyapuri',
-    'chanamine',
-    'chanc',
-    'chanc&egrave;d',
-    'chance\'',
-    'chance\'-that',
-    'chance-in-a-million',
-    'chance-induced',
-    'chance-meeting',
-    'chance-selected',
-    'chance-started',
-    'chance-the',
     'chance-throw',
-    'chance-vought',
-    'chancel&rehy;lor',
-    'chanceller',
-    'chancellerie',
-    'chancellor-candidacy',
-    'chancellor-candidates',
-    'chancellor-election',
-    'chancellorial',
-    'chancellories',
-    'chancelloritus',
-    'chancelot',
-    'chancels',
-    'chancers',
-    'chances.',
-    'chancey',
     'chancily',
-    'chancourtois',
-    'chancres',
-    'chandana',
-    'chandappa',
-    'chandeliers-and-roller-skates',
-    'chandelle',
-    'chander',
-    'chanderel',
-    'chandernagore',
-    'chandio',
-    'chandisingh',
-    'chandler-scripted',
-    'chandler/ibanez',
-    'chandler/instructor',
-    'chandler/ruby',
     'chandler/solicitor',
-    'chandleresque',
-    'chandos/curzon',
-    'chandris',
-    'chandu',
-    'chane',
-    'chanel-covered',
-    'chanel-smelling',
-    'chanelled',
-    'chanes',
-    'chanet',
-    'chaneuon',
-    'chang\'an',
-    'changabang',
-    'change&mdash;over',
-    'change&mdash;see',
     'change&mdash;the',
-    'change--looking',
-    'change-agents',
-    'change-around',
-    'change-because',
-    'change-colonists',
-    'change-facilitating',
-    'change-nightly',
-    'change-of-heart',
-    'change-of-subject',
-    'change-opportunity',
-    'change-out',
-    'change-points',
-    'change-ringers',
-    'change-shock',
-    'change-up',
     'change.a',
-    'change.the',
-    'change/',
-    'change/distortion',
-    'change/expansion',
-    'change/school',
-    'change/shift',
-    'changeably',
-    'changeand',
-    'changebar',
-    'changed_a',
-    'changed_at',
-    'changemakers',
-    'changenot',
-    'changeovers',
-    'changes(dcs)',
     'changes-melting',
-    'changes/feelings',
-    'changes/priorities',
-    'changes/problems',
-    'changey',
-    'changin',
-    'changing-mats',
-    'changing-me',
-    'changing-of-the-guard',
-    'changing.to',
-    'changing/improving',
-    'changings',
-    'changjiang',
-    'changling',
-    'changshun',
-    'changtse',
     'changve',
-    'chani',
-    'chanine',
-    'chanka',
-    'channals',
-    'channel-4',
-    'channel-based',
-    'channel-by-channel',
-    'channel-forming',
-    'channel-hoppers',
-    'channel-ready',
-    'channel-receiver',
-    'channel-switch',
-    'channel-to-channel',
-    'channel.our',
-    'channel/esp',
     'channel/getting',
-    'channel4',
-    'channelfills',
-    'channeling',
-    'channellers',
-    'channellings',
-    'channelplate',
-    'channels-were',
-    'channels/mass',
-    'channelways',
-    'channichthyid',
-    'channingswood',
-    'chano',
-    'chanoine',
-    'chanoines',
-    'chanoun',
     'chanoyu',
-    'chanrango',
-    'chans',
-    'chanson-masses',
-    'chansonettes',
-    'chantant',
-    'chanterlands',
-    'chanters',
-    'chanteurs',
-    'chanthamat',
-    'chanthamat*',
-    'chantin\'',
-    'chanto',
-    'chantoisel',
-    'chanukah',
-    'chanzoni',
     'chanzy',
-    'chao-ju-kua',
-    'chaologists',
-    'chaology',
-    'chaorach',
-    'chaorainn',
-    'chaos-oozing',
-    'chaos-stuff',
-    'chaos-worshipping',
-    'chaos/heresy',
-    'chaostikahn',
-    'chaotic-looking',
-    'chaotic/stable',
-    'chaoticum',
-    'chaouat',
-    'chaouen',
     'chaozhu',
-    'chap,',
-    'chap-books',
-    'chap-home',
-    'chap-lain',
-    'chap.2',
-    'chap.4',
-    'chapals',
-    'chaparral',
-    'chapautier',
-    'chapeaubras',
-    'chapei',
-    'chapel-goer',
-    'chapel-like',
-    'chapel-meeting',
-    'chapel-of-ease',
     'chapel-reared',
-    'chapel-rooted',
-    'chapelain-midy',
-    'chapelcorse',
-    'chapelet',
-    'chapelgarth',
-    'chapeliers',
-    'chapell',
-    'chapelle-saint',
-    'chapelon',
-    'chapels-of-ease',
-    'chapelstile',
-    'chapelthorpe',
-    'chapeltoun',
-    'chaper',
-    'chaperon.',
     'chaperonins',
-    'chapess',
-    'chapesses',
-    'chapham',
-    'chaphood',
-    'chapinera',
-    'chapius',
-    'chapka',
-    'chaplain\'',
-    'chaplain-in-chief',
-    'chaplain-in-ordinary',
-    'chaplain-secretary',
-    'chaplais',
-    'chaplayne',
-    'chaplin-',
-    'chapman.',
     'chapman/5',
-    'chapman/brakspears',
-    'chapman/curry',
-    'chapman/custodian',
-    'chapman/dairy',
-    'chapman/event',
-    'chapman/prison',
-    'chapman/production',
-    'chapman/teacher',
-    'chapman/town',
-    'chapmanesque',
-    'chappacqua',
-    'chappals',
-    'chappell.',
-    'chappell/decoy',
-    'chappell/imp',
     'chappell/society',
-    'chappell/volunteer',
-    'chappells',
-    'chappen',
-    'chappers',
-    'chapperson',
-    'chappill',
-    'chapple-hyam-trained',
-    'chapple/base',
-    'chapple/bucks',
-    'chappo',
-    'chappy.',
-    'chappy/wallace',
-    'chappys',
-    'chaprassis',
-    'chapska',
     'chapson',
-    'chaptalisation',
-    'chapter&mdash;that',
-    'chapter-breaks',
-    'chapter-divisions',
-    'chapter-end',
-    'chapter-headings',
-    'chapter-house',
-    'chapter-social',
-    'chapter-title',
-    'chapter.',
-    'chapter.this',
-    'chapter/',
-    'chapter/book',
-    'chapter/section',
-    'chapter4',
     'chapter7',
-    'chapters.good',
-    'chapters/days',
-    'chapters1&ndash;3',
-    'chaquichocha',
-    'char&dollar',
-    'char&lowbar;code',
-    'char&rehy;terer',
-    'char-bagh',
-    'char-volant',
-    'chara-assassin',
-    'charac',
-    'charac&rehy;terize',
-    'characid',
-    'characinid',
-    'character&mdash;and',
     'character&mdash;it',
-    'character&rehy;assassinations',
-    'character&rehy;istically',
-    'character-at-a-time',
-    'character-by-character',
-    'character-centred',
-    'character-comedy',
-    'character-enigma',
-    'character-generation',
-    'character-generators',
-    'character-inspired',
-    'character-is',
-    'character-istics',
-    'character-level',
-    'character-pieces',
-    'character-portrayal',
     'character-printing',
-    'character-reader',
-    'character-reading',
-    'character-sized',
-    'character-tested',
-    'character-training',
-    'character-turns',
-    'character-wheel',
-    'character.',
-    'character.handling',
-    'character.oriented',
-    'character/',
-    'character/image',
-    'character/national',
-    'charactered',
-    'characterist',
     'characteristic-',
-    'characteristically-he',
-    'characteristics/',
-    'characteristics/ideas',
-    'characterizable',
-    'characterizati',
-    'characterological',
-    'characterology',
-    'characterware',
-    'charadnus',
-    'charadriidae.',
-    'charalambedes',
-    'charalambides/junior',
-    'charalambous',
-    'charalambrous',
-    'charando',
     'charanga',
-    'charangos',
-    'charas',
-    'charasvilli',
-    'charater',
-    'charbonneau',
-    'charbonneaux',
-    'charbonnier',
-    'charbury',
-    'charcoal-effect',
-    'charcoal-impregnated',
-    'charcoal-like',
-    'charcoal-rich',
-    'charcoal-suited',
-    'charcoal.',
-    'charcoal/adsorptive',
     'charcoal/carbon',
-    'charcoal/red/black',
-    'charcoal:dextran:fat',
-    'charcuterie-&eacute;picerie',
-    'charcuterie/',
-    'charcuti&egrave;re',
-    'charcutieres',
-    'chard/rhubarb',
-    'chardaidh',
-    'charde',
-    'chardell',
-    'chardonnay-growing',
-    'chardonne',
-    'charecter',
-    'charecterful',
-    'charef',
     'chareges',
-    'charemza',
-    'charentaise',
-    'charente-maritime',
-    'charenton',
-    'charents',
-    'charestenvironment',
-    'chareyon',
-    'charg',
-    'charg&eacute;s',
-    'chargaff',
-    'chargakov',
-    'chargate',
-    'charge&mdash',
-    'charge-',
-    'charge-based',
     'charge-cap',
-    'charge-convertor',
-    'charge-cooled',
-    'charge-dealing',
-    'charge-gun',
-    'charge-holding',
-    'charge-out',
-    'charge-payer',
-    'charge-pump',
-    'charge-rents',
-    'charge-separation',
-    'charge-to-mass',
-    'charge-up',
-    'charge/credit',
-    'chargeable-time',
-    'chargeant',
     'chargecap',
-    'chargecapped',
-    'chargecaps',
-    'charged-capped',
-    'charged-particle',
-    'charged/credited',
-    'chargeout',
-    'chargepay',
-    'charger/power',
-    'charges.',
-    'charges/stamp',
-    'charges_as',
-    'chargings',
-    'chargor',
-    'chargrill',
-    'charibdis',
     'charibean',
-    'charidees',
-    'charily',
-    'chariman',
-    'charimer',
-    'charin\'',
-    'charingworth',
-    'chariot(s)',
-    'chariot-horse',
-    'chariot-horses',
-    'chariot-victories',
-    'chariot-victory',
-    'chariot-wheel',
-    'chariot-wheels',
-    'charis',
-    'charisma-',
     'charismaniacs',
-    'charismata',
-    'charismatic-looking',
-    'charit&egrave;s',
-    'charitable-status',
-    'charitable/educational',
-    'charitableness',
-    'charitably-minded',
-    'charitabulous',
-    'charities.',
-    'charity-backed',
-    'charity-box',
-    'charity-funded',
-    'charity-registered',
-    'charity-related',
-    'charity-school',
     'charity-schools',
-    'charity.',
-    'charity.richard',
-    'charity/do',
-    'charityware',
-    'chariulf',
-    'charivaris',
-    'charl',
-    'charla',
-    'charlannes',
-    'charlatan-type',
-    'charlcombe',
-    'charlcote',
-    'charlee',
-    'charleen',
-    'charlefontaine',
     'charlen',
-    'charles-adolphe',
-    'charles-albert',
-    'charles-dominique',
-    'charles-emmanuel',
-    'charles-fran&ccedil;ois',
-    'charles-jones',
-    'charles-le-chauve',
-    'charles-roux',
-    'charles-victor',
-    'charles/solicitor',
-    'charleses-and-dianas',
-    'charlestoned',
-    'charlesville',
-    'charlesworth/chairman/fencot',
-    'charlesworth/m40',
     'charlet',
-    'charlet-stratton',
-    'charlett',
-    'charleville-m&eacute;zi&egrave;res',
-    'charleville-mezieres',
-    'charlevoix',
-    'charlewood',
-    'charley/planning',
-    'charlick',
-    'charlie-bloody-hatton',
-    'charlinch',
-    'charline',
-    'charlotte-elizabeth',
-    'charlotte-emilie',
-    'charlottenstrasse',
-    'charlottville',
     'charlt\'n',
-    'charltin',
-    'charlton&mdash;asked',
-    'charlton-',
-    'charlton/boots',
-    'charlton/manager',
-    'charlwood.',
-    'charm&eacute',
-    'charm-seller',
-    'charm.',
-    'charmel',
-    'charmet/science',
-    'charmilles',
-    'charming.',
-    'charmion',
-    'charmond',
     'charmos',
-    'charmpits',
-    'charmworth',
-    'charnac&eacute',
-    'charnay',
-    'charnd',
-    'charndon',
-    'charnel&rehy;house',
-    'charnel-houses',
-    'charnel-pit',
-    'charnell',
-    'charnett',
-    'charnford',
-    'charnham',
-    'charniak',
-    'charniodiscus',
     'charnock/raf',
-    'charnois',
-    'charnok',
-    'charoalis',
-    'charolais.there',
-    'charolette',
-    'charollaisa',
-    'charolle',
-    'charolles',
-    'charonia',
-    'charophytes',
-    'charost',
-    'charotar',
-    'charpak',
-    'charpantier',
-    'charpoy',
     'charr',
-    'charred-edged',
-    'charred-looking',
-    'charri&egrave;ere',
-    'charri&grave;ere',
-    'charrismo',
+)
+
+blocks_84 = (
+    '$"50$+60&ndash;89%!6$"71%!3$"80&)&ndash;90"#2.5##000&"bc$*5&ndash;70#!1$"50#!3#!4',
+    '$!.#,60&ndash;340%,0&ndash;2500#"70#!8$#&ft$+8&ndash;335#"93"%3,500##000$!a#"2k#!3$%0-360#"50',
+    '""40#"20$!5#"38$!9#"40#,52&ndash;413#!6$+0&ndash;390#%7,000$!5#,80&ndash;411-$25bc,\'c.425bc#!9',
+    '#"00#!2#!4#!5#,77&ndash;655#!9"#6.1$!2#!3$!0#"50#!6"!7#$,000#!0',
+    '#!2#"37#"50"#800%*&ndash;400#"30#"40#"kg"$9&ft#*4&ndash;55#"50$*1&mdash;61$"50#"60#"70',
+    '$!3$!9#"80%+&mdash;1016$!5%,&mdash;c.991$!7#"90$!1"-a.a./national$(d.m.r.s.$&f.o.d.$"i.$!m$"s.',
+    '$"v.#$d300$#905#)nalytical$&derson"$b.k.$!s#)erardenga##iol"!c##.-m$$/foe$#d.s$"h.$"p.',
+    '#$laus"$d.e.$&garrad$"r.$"t.#%ennet%!t#%vorak"$e.c.$"e.$"f.$"m.$$s.g.$"t.#"ng',
+    '$&martin$"s."$g.c.#\'reesley$#oup"&h.a.s."$i.\'s$"c.$"e.$!f$$m.a.$$p.c.#$n-c.#"sa#!v',
+    '"$j.c.$"e.$"h.$#mcd"!l#\'.cardon$$k.c.$!r#\'ose-ups"$m.s.#%organ"$n.s.$!t%\'.-f.a.i#+icaraguense',
+    '$!d$#l.l$"p.$!s%!.$(w.b.o.y."&p.2330$!m$#r.e"&q.m.s."$r.a.$$b.c.$"c.$&i.c.t.$"o.',
+    '#-ubriventralis"$s.a.$"h.$$i.c.$%lewis$%orwin#!2#&parrow"$t.a.$"b.$"r."&u.c.b."$v.o.$"r."$w.c.',
+    '##hat"!y!+/00/22/2005&&3/0075($2053)#136*"74+!7+!8+!9*"81)#200+!1*"13+!7',
+    '+!9*"35*"43*"60+!4*"75*"84+!9*"96)#311*"21+!3+!4+!5+!6',
+    '+!8*"31+!9*"40+!1+!2*"59*"64+!7+!8*"89*"92+!3+!8+!9',
+    '+!3*"26*"32+!9*"41*"52+!8*"70+!6&&4/2003*"16&&6/2058&&8/0001+!4+!6',
+    '($2025*"32+!3#!4$(/25/0003&&6/0003#!5$(/21/0000&(5/0007-1+!8+!9*"11+!2+!4+!9',
+    '+!6*"11+!4+!5+!6+!7+!9&&6/0004#)9/25/0002+!4+!5+!6"!1#!1$(/25/0001',
+    '+!3+!4#)4/25/0024+!7&&6/0003"#350"#400"!b"&cheese"!e#.bp&dgr/nf-il6b&#ggr%\'-family"!f#%lakes',
+    '"\'manager#"in""ps$"/e"(spot/run""tv"!y!"01##30b!%1,387"#-c3"#/88"*00&ndash;3$!0#&2g0256',
+    '#&h17no3""2."$30\'s$"00""41#"50%+&ndash;1550#":0"#50s#"14#\'25/1526$!s#"90"#6+4#".5',
+    '&*ndash;1661#\'60-1870#-75&ndash;1749"#700$!5#"54#"60$!5#*71&ndash;2$!2$!9#"98"#800#"10#"30',
+    '#"50$!5$!9#.60&ndash;c1945#"70$"55#-80&ndash;1918$!7$!8#":1".900&ndash;1958$,2&ndash;1959#"10#"25#"55',
+    '#"85#"90""c2$#(d)"\'lhl7no3"#n10"#pa2!#2\'-"!+"*-compounds#%level#!n"!."#/c3$"p3',
+    '$!0#!6#$:5n3#"th"&12,400#!9"!2#!4#!j"!3"$50pp"0613&ndash;2494bc#!2#"40#!6',
+    '"!a"!b"!c"!d#!e"!g"!n!\'3\'-endo$)o3\'-p-o5\'#!s"#-10#16&lsqb;pvmc3&rsqb#"p0"$.93a%!b',
+    '%!d%!e"#/r2#%telos"!0#"00""12",30&ndash;379"#400#%1,000$$0/es#"40"!5"&63.29b"&85,000',
+    '&"lt!"4\'"!+"#.93"$/img"!0"#129""34"#468"+9-formation"$e-88!"5+"&-sized"#.93"#065',
+    '"!6",7b1/6xbalb/c$!l%#/10&+6&mdash;sjl!%6,000"#0\'s"!2##5af"#4\'s#!.#$/128"!7"!8"$h5br',
+    '&!2!\'7-d8-e7"#.5p#"93#$g10\'"#30l#!5"!5"-637&ndash;380""82!$8.93""00"!3"&6-type"#ash',
+    '"+0&ndash;16f"!1""8s!":1!!="\'0.025cm"%29.88"%84.81##6.9""=c"#a+b"!c#!h#)onference%$trol',
+    '"!s!\'a&amp;g#%mdash#(ntilde;o+--lim&oacute;n#-rehy;pacities#$sup2"#\'ed#&granda##in\'""*e"&-20/20#(ca-ca-ca%%racas$#o-2',
+    '#\'datacom$+b:generator#$idms#!o#%paint#&ra-van%"ly#)scheduler"%.1850#"66#"s7"%/ciir#"p2"/130bqq%m0101g/a#!4',
+    '%(depleted%$free#!0"#310"!4""85"$=182%"68"%a\'ing#)-approved#!c#"de#0gacggtcaagaatgac$1gtaatgtaataggaata#"ls',
+    '#%tinga(!s"/b&aacute;lleros$+rehy;legged#%-door%$rive$$firm$\'journey$&legged$$ride#\'/powell#$able$$lism(!s%&lerial',
+    '$"ne%%illas$)ret-goers(#set)$tyle\'(/theatre\'!t#*bage-field(&leaves)#ike)&ooking(%patch&!y%#las$#ie\'',
+    '$"le$"ot#\'drivers#$eldu%!l&#ero%!o$!o$)r-tossing%#era%%feidh%-net-sauvignon(!s%!s$$ssal',
+    '\'"nh$"zo#%ieses$"in$\'n-fever&%house&&lights("ke&%style&%trunk+!s%#boy%#dan%"ed&!s',
+    '(*government(%style($wide\'(/worktop\'&makers%$less%$mate%$side%!t&$eely#,le&rehy;knit%#(s)%)-carrying\'#ord&$drum',
+    '&&hauled\'#ung&%layer&&makers&%route&\'station&#way%!.%$coil\'!m%%phone%&s-part%$ways#"oc$&olture',
+    '$"ts$#urs$#win#*r&oacute;n$+ach-morvern%#les%!s$%inety%#oie&#les("ts#$side#$tell#"ul"*c&eacute;m',
+    '#!1$!2#"40#(aphonous$$rels&!s$$xtia#&camise$&iatore)!i%$ucco#"dp#\'erolazo$#tes#&halot\'',
+    '$+e-coherency&(injected&#pot&$sexe%$ctic%!r&"el%#tte$(innation,!s%!t$!o%"ts$#uma#%ioppo',
+    '#*k-handedly$#est$$funk$&handed$(ulations$!y#"l1$!2#\'o-fonix$!3$/dylate-buffered$%phany&$onic(%ously$&tuodes',
+    '#&taceae%#eae$&ophile$\'us-like\'\'riddled&%flesh#%uluma"#d-2$#cam$)generated$$vile#!.#!/$$cadd&%m/cae',
+    '$$desk##401#!a$#bra$#gon$&lmosto$,m-compatible&)emulation%$osto$+qu&eacute;s$&verine\'*ously-thin#,bury-branded##d-1$#ell',
+    '%!n%-r/psychiatric&!s$)ie/player%\'s-flies$#les$!o%$nlea$%ysure##eac%"ux$"na%#ced%%ettes%!s',
+    '$$rack$!s$+tte/falkirk$!x%$omer##ger&"s.#*herin-like)(specific#%ialac%"ns%!r$+euxminister$,llac-powered$$nsky',
+    '##key&(/datacad#)mium-cell))ontaining((sulphide##nam$!o#!o$!c$$xton#&ualadr$!c%&eatrix%#ity$"to',
+    '#&waller"*e-negative#&cilian$&ostomy#%dewen#"ga#$hrun#(laverock$(erphenyn$!i%!s$"um#)mentarius##nby##pio',
+    '$"au$\'berllan$&einiou$&fanell%#los%&yrddin$&goorle$%halmi$\'marthen$$nach&*rfon-dinas*+shire:david$%ulean\'*in-induced\'"um',
+    '$2went.alternatively#-salpinioideae%"r-\'%sized&"/i&"em&$inus\'!o&(o-papist&\'studien$+ium-induced&!s$$urae#$tani#!x',
+    '",f&eacute/bar*0;-and-restaurant,(cum-shop,&filled,(haunting,&owners,%style+!d+&terias%%grave*+;-brasserie+!s%%uml;s#!2#\'aggiolo',
+    '$$-bar(!s%\'culture%&shabby$#/1s%$take&&errace$(_au_lait$+teria-style#*f&egrave;s$!a$%e-bar%&inated%%latte$%itino',
+    '$#res$#yns#%s-isp#%uffle"#gan#$ccat#!d#\'e-birds%&haters%%style$$bred$$like$#ots$!r$%yness',
+    '#%iness$"on$"va#(lianelli&$rian($tano%%ostro#$nola%"ni#*oule-style##ree#!s#"us"\'hamarca##dor',
+    '$\'rciveen$#xia##ier$.ll/strathclyde$!r#!m##nce#%oolin$%rsins#"po#"rc#"un%!a"#ian#!d',
+    '##ger#$lean\'"-a%!s$#ich$$laux%&ebotte&$ttes%#oux#&mgorms#(n-brands$(/chubaty$"ar$3e/ludlow/shropshire$%geham',
+    '#*que/island#-r&eacute;enne$&n-like&&marked&%smith%(/shelter%$bank&\'uilding\'#rgh%&caslte(#tle&\'ross_et%#dhu&"ow&#uff',
+    '%$gill&(orms-led&%ryffe%%lodge%%place%%s/one\'#raf&%hield("ll&$more$-o&ndash;aswan,&london%&-amman&-suez-khartoum%#lle',
+    '$!s#"se$!h$+ter-murdoch(&on-sea\'(/murdoch%%or-by#!t$#hes%*ness-based*%south)%_such$"if&!f$#rin',
+    '##uby#&xabank"%jetan#$oler%$ings#"ra#!u",ke&rehy;hole$#(s)$+-and-eat-it%\'burning%\'candles%&eaters%%holes%%knife',
+    '&%overs%%mixes%\'sellers&)hovelling&$tall%\'tasting&"in&#ray%$walk$!.%\'swindon$&/rower&"un%!s$&boards',
+    '$#han$$like$!r$*s/pancakes%#hop$&walked&"re#"le##mak"-l&ccedil;adas$\'ndash;n$,rehy;derwood#\'-calloo#"33#"64',
+    '$$dium$$fate%%ornia)!e$,is-feldkirch\'*hazebrouck&".6&\'/france$#loo$#mai&!n&#rca&#yor%\'bokidis%#ian',
+    '&%ntous&"ta$$nder&"re%#gis%"na%%oides$$resu$#sso%"te$%theas$\'vecchia&#ssi%*r&iacute;a$%yoglu',
+    '#&braith#+c-silicates$&alkali*"ne%$neus%!r&"ii\'"us$&edonio%%oaria&&larias%"ro%!s$$halk&!s',
+    '&%olous%#fic%#nai\'#ted(#ing)!o&#ema&#ing%%osome%+te-cemented(4marcasite-sphalerite\'2/diatomite/organic&"ic&)onin/cgrp%#uim',
+    '\'+-calmodulin))ontaining((enriched(#ion(.phosphate-bile(\'sensing))timulated\'!.\'*/magnesium(+phosphorous&#ric$6omp/telecommunications$$rete\'$ized$)silicates',
+    '%%alted%#lat(#ed\'*$ness($ion.+)/analysis(\'or-like&(us-based(!.%!t&+t/wiltshire\'-a&ndash;delhi(&-based*#orn))on-hudson',
+    '#!d$#air%"ra$#bec\'+k/playgroup$$ecot(0t-cum-chelveston%\'r-manse&(/retired&)a-forming(&graben(&hosted&%berry&%cruix&$head',
+    '&$vale&)wood/club+&hockey+$town%!z$&icotes("te$!o%!w$#ron$#way%,ell-reckless(&/horse)(lawrence#+e&ccedil;on',
+    '$&-esque%%music$\'/former$$acte%"ro$!d%)on-newman\'#ia.(!e$#man$%nberg%*dar-making)$type(*/scheduler(#ium',
+    '&\'rically%$zana$!s$"ta$&ycourt#)f-bearing&$oots%$hide\'"gh%$like%&muscle%$note%\'rearing$%bound$$hill',
+    '%"re$&ornian(#cum$!s#&garian&-y&ndash;banff\'&-based%"te$\'ranulin#"ha%!m#$iari$!b%%anese%$meas',
+    '&!s%!r&\'a-vs-vw\'"nt\'#tes(-ion/reference$#ces%&ivirus%*o-printers$"da%#ore$#fia%+ornia-davis+(invented+%light',
+    ',$tyle*\'/hawaii*\'n-based-#orn,\'italian,%style)#cum+!s)"um(\'ucation$&graphy%$ulan$!l$"na%#ese',
+    '%"he\'"rs%"po$#sma$%terra#&kewood#*l&egrave;d$#\'st$#(s)$!-%%backs\'!r&\'locking&"oy&&y-call',
+    '&%entre%&finder%)girl/pimp%(handling%\'letters&$ight\'"ne&%ogger%$only&$rder&#ver%$rate%&signal+!s&#tud',
+    '&&o-arms$!/$&_apart$\'ability%%ccess%!d%#loo&!y%$mpas%"nd\'#ine\'!s&)etic-type&)ish/outer%!r',
+    '&!t%"ta%%veros%)way/motor$$back%,oy/assistant$&center%#ott%)utt/crest$-ed&mdash;will\'\'rehy;up&$-off\'(stations&$mick%!e',
+    '%!s%"va%%ywood$)fornianus$!i%%actis%(chthidae&!k&#ots%%ergon%\'grammes(%pher.*$ical,!s+"es',
+    '%#mba&%orpha%&n\'-all&&g-back(%cards(#off\')/scottish%(onymidae&#pes%+p&aelig;dia&%horid%$sher&&tephus\'!h($enes',
+    '&"ee&!h%#xte$"ls$#man%"is$#ooh%#sal%"ts%/w/herefordshire&"ly&$ness&!s$"s.%(/actions',
+    '%#all&!t%$igns%#the$&tuccio$%using$,wood/butcher$(ychthids%$nder&"ge%!r#\'m-faced%(sounding$&/angry$#ann',
+    '%"ss$*ly-slashed&!.$0odulin-sepharose%#l-1%!n$$ucks#)ocephalus$#gen&%racos$\'nectris$!o$%placa$)rie&ndash\'!-',
+    '(\'burning(&costly*%unter(%fibre(\'killers(&packed((reducing*(stricted)#ich\'(/protein\'$s-in)#out)%worth&$fier&%genic',
+    '%!y$$tier#$pain$"er$\'ionella#$ques##sin##tec$%hrops$$raps%#ops#(uclation$&m-beag%&niated)"or',
+    '$$nnia$$tron#(v&eacute$!a%%cante%#ria$#ely%#ras&!s&)t-toulmin\'0/buckinghamshire%(s-arched$"ia%#lle%$nian',
+    '%#tti$%opina%!s##way#!y$$mene$&pogeia%$soed$&stegia$#ton#$zado$#one"-m&eacute;lias#!\'#\'-action',
+    '%&utting$!i#*a&ntilde;o$$chos$"da$!g$$ieux$$lata$\'pigners$%rades%"da%+ena-salazar%&guaise%$illa%#oon',
+    '%$telo%#von$$taru$#xys#$bara$*er-induced\'$well&\'aberaux&"ra%!s$"ia&!l&"so%"os%!r',
+    '$&letown$+odian-style**vietnamese&$unum%"is%)rne-hayle%!t%!u&#rne$#ray%*didgeshire%,elle/leather%!i&!a&,dge-educated',
+    '*$line*%style)(/british*#dti)!d)$port&$ense&"um&$zzia%\'oclaves&\'rhytium$%tidge$\'usbarns$!y#+corder-only',
+    '%.n-lock-shirted#&e.from%"to$$_out$+l-artillery&%bells&$cart\'\'oloured&$dung&&owning&%thorn\'$rain+!s)&ppings&,wool-acrylic',
+    '(!s&"on(!s%%grass%#ias&"ng%!l&\'iifolia%#men%"on&&pardus%%thorn$$nsac%$zind$)o-cutting',
+    '$\'ra-back)!g(%ereft(#ulb\'\'control\'(fetching\'\'holding\'$kite\'%laden(#ike\'#man(&ounted\'(obsessed((n-a-chip\'*ready-copy',
+    '\'&screen(#hip)"ot)!y($ized(\'talking)&rapped\'\'to-tape)$ting(%ripod\'$wise(#ork&!.&$/vtr&%deric',
+    '&!e&$man.)!s&"no&%s-and\'!.(#the&%woman%"ia&#ere%&linckx%#man%!o&"n-\'!.',
+    '(\'houston(%local(\'ruchill(%video\'&bridge&&un-eec($aise,!s$"si#&health#%i-top$#cia$#dge$!e$"jn',
+    '$%letti%"io%\'la-gate&#eri\'"ti&"us$#ons$#sea%!i#$lets$"in&#ton#&mander$#dwr$"ed',
+    '%$rino$$idge%!e$\'o/river%"ck%$mile#$nant##oes$$glia$%mella$#ndo$!s$%uflag)#ed.*"rs',
+    '%&rflage$#via#"p-%)activated&\'gonists%$beds&$uilt%\'crp-dna($/dna%8dependent-protein-kinase%%guard%,inducibility%$life%(receptor\'&sponse',
+    '6)modulator%&signal&\'urvivor$%agnac\'"ie\'#oni%+ign-finance)!i)#law)\'related)%weary($ers.(,ing/training)#ung("s.',
+    '%$lani%,n&aacute;rio&"as&$ello&"ie\'$form\'"li\'#ole&!o\'#tto%#ogn%#ris%!s$#bel\'"l-',
+    ')(ferguson)\'harding)\'in-jail)%moore)&savers*$mith((/british)\'captain))edinburgh),intelligence)\'swimmer)*women-only(%field(\'justice(%mania',
+    '$%eggio%)r-caravan&!o&(s/diners&\'vanners&!y%(stricola$%field%\'ollower$$hora(#ted\'1oquinone-tertiary%"re$$iagn%"n\'',
+    '&%g-gas($shop)%toves\'(/cycling(\'outdoor&+os-dubernet%#one("si\'!i$#kin$&leshon%%issan("on$$ness%\'osperma',
+    '%%notus%$olie%(reggiano%(s-ortega&$anto%%verde$"ri%$obin%#ubi$$s-to%(.whether%!a%&ea-ash%#ies&!s',
+    '$(tosaurus$\'ucheans%&s-like\'%style%$ters%$zano$!y%$lium#!r$\'a-gales%#man%"nh%!y$"ex$"ys',
+    '$%iscan$#ter%"ro##tab#(ulodonum$,s&rehy;esque%%unary%&vachan"/n&dollar;11,600,%5,000+&20,400+*50,000,000+%8,600,!8$\'ndash;t',
+    ')%nabis#)\'&pound;t$\'t&mdash%!-&6believe-a-word-he-says&3do-a-thing-about-it&#for&6get-away-with-anything&/stand-still-ski%%/kent#%-base%!e$%chanh$4get-away-with-murder$%maker',
+    '$#not$\'openers$$toad%$rack)!s#!.$"be#%/will#+1&ndash;100#%_just#&abrava$0da&rehy;produced&!*&+-mexico-usa\'&united',
+    '&#ria%"ia\'*n-american)&backed*$uilt)$nisi)%owned)&raised*%eared)&soviet)"us(\'/french)&u.s.a.($ised("s.',
+    '&"um$"ir$&l-bank\'#oat\'&uilder&\'digging&%heads%#ejo&!s%(iculatus&"se\'#ing%"s.%&twoath$$mega',
+    '%!i&"as&"na&!o%$ozzi%$vons%)y-hopping\'1yellow-and-indigo$\'s-jerez%"ka%&trelli$"ta%%ifera$"ul$&verals',
+    '#*berra--and$(jwin.zip$"on%"rd$#ury#*c&uacute;n$!a%$nagh$(el/amend&"ed&%leria\'$iere&"or%"r\'&*-conscious',
+    '(#ree\'&giving(%rowth\'\'killing\'&pained()revention\'&ridden\'&victim&\'.gareth&&/heart&&icidal\'&sation&#net&%ously&&phobia',
+    '$"he$%iones$!r%!i$!y##dau&#les$%eille%%labri\'#ria&#eda$$idat(,e&mdash;both)!m)"s.',
+    '&!o&!s&"um%$loro%&ndates%!r%!s$\'le-bowl\'%drips\'#end\'\'flowers\'\'holders\'(lighting)"ke\'%shelf',
+    '(\'nuffers(*tick-maker)"ub+!s\'#wax&%berry&$gate\'%rease&&lights&%maker+!s&%power&$rack\'$iggs&"s.',
+    '\'$moke\',tick-holders&%wheel\'#ood%#ing$#oco%#nga%!r$"us$\'y-assed&$pink&)sponsored\'%tripe&(wrappers%+floss-maker',
+    '%#ing&"sh%&kisses%#men%$skin)!s&&meared&&triped#,e&rehy;chair$\'-backed%&framed%\'handled%(shredder&&pliced&$ugar',
+    '$,bi&egrave;re$"dy$&fields$!k$%llini$"s.%$cent$"te%"te$#uon$"va&#lle$$wdon%!s#$fora',
+    '$"ul##gas$!e%!d#!h$"am#%iadau$\'cularis\'!e$&deputy%!i$\'ne-life&"s.%#ity$!o',
+    '$$sius%(ters-old$%zaris#\'ker-bit(%looms\')resistant&#ous)"ly&$worm##ley#&motors#"n-$%/shop$)abalistic&$ichs',
+    '(//hallucinogenic%"ck%$dine%%lised%#rds&%eggio("io$*e-linguini%#lla\'!e\'!i&#oni%#tti%#ver$%ibale',
+    ')&sation*"me%#est%(ly-timed%)ng/alison(&former\'#ite\'5ton-wardour-portsdown$!o%$biro%$dale%+n-ball-like)$rrel\'(founding\'$shot',
+    '&(ball-you&$dale&#eer)!s&\'outside&$shot%"t.&#/do$%stadt$%ulate#&o&euml%(ntilde;o$(e-camper&$like\'$oads',
+    '&(position&&shaped\'&urfing&$trip%*/cycle/run%%nergy%&s-wood&!.$#ist$)n-derived&)formation&(williams%!.%!e&"ro',
+    '%$icha\'#ity\'$orum)"vm%/mills/warriston%%teign%"um$%odled%"ed$+py-smashing\'%trees$!r$&ssiane$%ville#$sada',
+    '$%field$%imili##t\'t$%/dont$$abit&$rica(\'gienses%%luppi%"na&"do&(kerously,$ness)$some%$rist%"si',
+    '&"es$,eens-general%#leu%(rbury-nd&!s%!s$%haris$$iaci&#num%"co%!i%!l&,ena/shephard)!s(!e',
+    '%#one%$ques%\'unculae$#ock%&n-wood&#.22&&a-like\'!s&%ensis\'+se-speaking&$ists\'"te&-ment-dwellers%"on&!r',
+    '&!e\'!s$#rap%"ed%#ibb&3ll/president/gloucs$)uarienses%$ccio$!v$%well.(\'/attack)%derek#$ulae%&lation$#tus',
+    '%(s-backed(%eauty(\'ottomed\'$shod($ided&&/nylon&"ed&"s.\',ed-everybody\')tructured#%worth#!y$#nge$1on&ndash;monument-$ruby',
+    '&%lands#%zonen\'$tte\')!i&$iero"(o(sio2)s#$bang#%daism\'!t##nis#"st##tic#\'utchouc"+p&rehy;tain#&-a-pie',
+    '$\'de-long$&ferrat%%iring$#gun$\'haitien$$peak%#ins&$stol$%rouge$&shaped%%leeve*!d*!s%(natching$(throwing',
+    '$\'wearing#(.in-hand#)/breather$$name#/abilities.vying)"y\'\'"ty%%le-as$$ccio%$hica%&iously&-tance/voltage($tion\'*ies-though\'&y-pale',
+    '(\'/layout(#_as$#des%$ocea$#nna&!e$%rison)!s%!n#&breton##cha#%deuil#(e-backed%$like$(l-y-ffyn',
+    '%!a&!t%#ing%#lae\'#nus&$etti&#ini$#ner%"se$1rcaillie-friendly,!.$%sante%&thorpe$\'tanakis%/ian-plantagenet',
+    '$\'verdian$$work#&heaton#-i&rehy;talise/!m$$lano%!i%*larization&%eries&$iary$%ntech$$rola$%scums%"he%"to',
+    '%)&aacute;n%#al\'\'(-account+)umulating)\'dequecy))ugmenting(%based),eneficiaries()deepening(+expenditure((financed(&growth((importer)-nfrastructure*\'tensity',
+    '(!l(,market-based.!s(!o()providers))unishment((to-asset0!s)&ravail((widening)$orks\'".2($lead(!z\'&/asset',
+    ')\'unction(&income(&labour)$oans(9resource/labour-intensive*%venue\'*:hyderabad($port(#san)\'hillong\'"es\'!i(!s)&ations)"er',
+    '*!.)2t&rehy;proletarian*+-democratic+6imperialist-industrial+)socialist+$type*!.*(ic-style(*zation-day.!s)#ed\'\'#led(!y\'"s.&#nes',
+    '&$tlon%!i&%alism%#ole\'#ina%&ulaire$$vari#$land$!e%!r%!s&!s$#ine#\'m-based$%akers',
+    '#$o-up$\'distria+!s%&oceans$$eira$\'maestro$%n-fed%(/husband&#son&$wife%#ago%#ish$$raso%$etto%#oso',
+    '$&ed-off(!n%"ll\'"ae\'$etto\'"in(#tti%(r/\'femme$%iello$&lebank$(occhiano$\'uccilli#&ranica$"ee&!e',
+    '%#tto$(i-driver%!a&!n%#cci&"io&#ode\'"la\')rn-rising)!e)#ian)!o%"do%)foliaceae%"le',
+    '%#nae%"ol%%vians$$oate%"ck%&lactam&!i#"s.$$ella$#ian%*d-targeted$!l$%tones$%ules.#0t&lsqb;ai-n&rsqb',
+    '\'"\'s\'&-elect(.superintendent(%to-be\'-/wicketkeeper\'#cy.\')s-general%"ux$(iousness%"va\'$tion&&e-born&!i\'$ties&"us',
+    '$"on$$ure.\'\'/export(%input(,mark/release\'"rs#$uana$#cho%#ian&#nes\'"us$$leti\'"ti$"th$#zzo',
+    '"%queta%"zo$#ita"%r&amp$%ndash#"-a%(ccessory$\'beating%%ombed&\'ot-sale&#und%\'uilding&$mper&!t&$yers',
+    '$$care%$hase)!s&#ild%\'leaners)#ing%(ongested%\'rushing$\'dealing\'"th&#cks&(pendence%)in-ar-lis%#oor%%river',
+    '$&engine$(familiar&"rt%\'riendly$$horn$(industry&&fested&\'stalled$\'jacking$\'kicking$,manufacturer.#ing&$rker%#ine&$rror',
+    '%$wing&#ner$(painting&+raphernalia\'&k-like)(training\'!t&\'ssenger%#la2\'"nt%(olishing&"rt(!s%\'roducer\'"ud',
+    '$(rallying%&ingers%$oofs$%sales)#men%$pray%&tarved$#tec&\'lephone%*ransporter&#uck%#yre(!s$%users$&washer',
+    '%%orker*!s#&.gonna#(/bicycle%#oat$$cars%$oach)%/taxi$(taxi/bus#$_out#%a-van$&bastos%#ids&,n-somethings\'#eer',
+    '(!r)!i)!o\'$iers$)cas-based\'#ses%"ci\'#ola%#ias%#ole(!d\'$ling%,teris&eacute$&damons%%ocian',
+    '$"fa%#ino$$gium%"ue$"id$&manlis%"ba&$olim%)el-coated\'$ises\'"ly%#oja$$ncho%$diru%#fil',
+    '%(vaserais$%pelli%&intada%*u&ccedil;a$%taxis%!e%\'s-worth$)vaggesque(#ios&&n-club((dragging($site\'%ettes\'#ing\'*s/chalets/',
+    '%#ela\'!i\'!l%$ogue$$ways$#yon#)b-othello$#aby%%mates\'%zepin&#oyl&"yl%%nions%#tec$)emazapine',
+    '\'!s%$rryi%&tamide&#h-s$!h$!i%*&egrave;re%#des%$nate%%sdale$\'o-union%&cation%"dy%/hydrate-binding-*containing',
+    ',"s.%+medicinalis%"n-\'"16\'&atomed\'&backed\'\'cluster(&rusted\'$date*#ing(.ioxide-bearing/\'induced\'+electrolyte\',fibre-bladed)&xation',
+    '\')producing\'*reinforced\'&sodium(-ulphur-carbon\'%water,\'-oxygen&!/\')aluminium(%ramid\'&indian\'&oxygen&$ate-*%based*(cemented**depositing',
+    '*&silica/(iclastic)//bicarbonate/co*!l(#ian)#tes("or&"el\'#ras&%fibre&!i\'\'cations\'5ferous&mdash;jurassic-&-early.-pennsylvanian',
+    '(#ied\'!s\'&zation(!e&"ne&(oapatite%"ot%#pol%2rundum-impregnated%#sin%,xyl-terminal(#ase+*-oxygenase)#ted+!s',
+    '\')peptidase0!s%!y$%rooke$&uncled%%rated(#ion&*ettor-type+"ed&$ised&&ration$)y/british#!c$$asci&#ing',
+    '$%eller&#vos%"re\'"ri$\'harodon&#yra$%imona%$nima&(ogencity*"es+#tic*&ically,!s%#ofo$$rash',
+    '$(-bearing&$oard&%uying%(dropping%$file%%games%&holder%\'indexed+!s*#ing&&ssuers%$like&#oad%%maker%&player',
+    '+!s%&saving&%harps\'#ops&#ize&$tyle%%wired$(/monitor%\'writing$.amom-flavoured("um\'!n(!e%!n&!o',
+    '&#vay$,board-bodied,(x-making*&cutout*\'mounted*&pipped)!y&!x\'%-plus($type$#ena&#ist%"r.$&houses$+iac-support',
+    '%.ff&ndash;based\')-aberdare(%barry(*paddington(\'swansea\'&/south\'$ffff%/gan-fitzbaddely%#lle%"n\'&)al-bishop)&prince)#red("ed("ly',
+    '\'!n&"es&)gton-born%!o&%&rehy+);vascular&%-funk\'+respiratory\')sculpting&$data&\'graphed+"ic&!n&%pathy&%tonic',
+    '&2vascular-pulmonary\'&ersion)1ter-defibrillator%$soma$(keyholes$&maker\')!s\'#ing$(ohydrate%"ma%!n&!i&"ma%"or%!s',
+    '%"za$\'players$"ri$"s.%%/away&\'posters$%uelis%&nculus$$weil#"e\'$%-alan&.nd-maintenance%\'control%)eliciting%#ful',
+    '%.giving-related%"he%%laden&%eaver+!s\'$ssly&#ine%\'of-cook&\'riented%%plans%\'seeking&$taff%&taking&#ype$!.',
+    '$!/%)education%&family%%other%\'richard%&social%)treatment$#_as$&assist%#tum$&bridge$"d.%#ocs%!s$!e',
+    '&+-assessment\'%based($ests\'\'centred(\'hanging((onscious\'(defining\')enhancing\'$girl\'\'highest(%ungry\'&indeed\'$long\'*motivation)"ve',
+    '\'\'related($oute\'&saving(%earch((tructure(\'uicidal($waps\'$type\'6woman-housewife-mother&$/job*%/home\'$life&6ist-turned-nationalist&$less&&s.five',
+    '&%woman%!s$&fillly%$orce%&ullest((y-broken*&carved+\'omposed+"ut*(designed*$even*%honed*$kept*&looped*(nurtured',
+    '**positioned*&ranked+\'ecalled,\'hearsed*&staged,(ructured,%udied15-careless-informality*&tended*\'wrought$!g%%iving$%less.($less$)mongering',
+    '$&narfon%#ess%\'tanians$$r(s)%+-counsellor&)dependant&&infant%"ra%*s/adopters$&ssable\'"nt&#ive%$taff$"ta&(ker-boss',
+    '*+handyperson*&manger(!s&!s%#ena%!h%!o%"to$\'w-jones%&orkers$,y/hazelbaker&(resident#$feul$#ist$#our',
+    '$#ree#$gate$\'ilfield%!n$&o-boat&(cruising&)importing&$ship*$ping*!s%"ed%$link#"ha%%rrack#*i&ntilde;o',
+    '%"ns%%tores$/b&rehy;speaking%\'-enayas%#aea%-bean-accented*%based*)dominated)!.)&/latin*-mediterranean)$ness%*e&ntilde;a&"es%$onum',
+    '$&caceae%#uao$"da$"ed%#ton$"ff$"ge%#lia%#nou$$leff$!n%!\'%\'achites*$iids&"te',
+    '\'"us%*g-nineties\'(sounding\'$will&!.&)/sharing/&(lessness%$iana&!s%.thia&mdash;see)(/eastern)!n$!o$%samol%"io',
+    '&$imus%#ton$%tatas\'"em\'"is#!j$\'ackings$"on##ker%"ys$$huff#(l-august%&dieter%%zeiss$6a-whatever-her-name-is',
+    '%!s%!t%!w&"ay$$eill%$nses%(tonville&"to$"fa$$iari%!l%"ne&)g-guscott\'$wark&!i',
+    '%"oz%-sle-edinburgh)\'glasgow*%retna)*hellifield(!.(\'/farmer(!s%"ta$&omagno%"ne%%polis&!s%\'s-about&!a',
+    '%\'w-based\'(kilkenny$%quist$"sb&*erg-tetley))/elephant%%croon%#ons%$soni(!s%$tein&#rom%$wood$*ton-browne((dewhirst',
+    '(\'powered\'%/back\'$ware$(uke-born%#nie$"ye%#les%"on\'(-britton\'+/witchcraft#\'magnoli%!l&#ite%*rthen-west$!e',
+    '&#ita%\'ngloria&!s%!s$\'ichaels\'#eal%*ne-painted(&winged&"ic$%olito%\'ntelles$%union#*naby/union%"ll\'#ite',
+    '%%pping%$rvan\'#ons%%tion/%%valet&"el$&castle$%eades%$ddeu\'!s&"oe%)gie-esque(*/greenaway(!s%"il',
+    '%"ro%"ts$%glaze$"ic&!k%#fex%&olanus%(val-like)%style)$type(!e($ised&#ora(+e/omnivores(!y',
+    '$#lea$$moni$%ochan%&gurksy%"ma%&sauria$%reagh$!s%"on$!t%#eel%%hruft%#ine$\'uculata%&gorsky',
+    '%#tes$%warth%#ood$$yces#&o-kann)!s$*b-coloured%!s$$ggio$%l-lyn&\'singers%#ann&!u%%e-ann&!s',
+    '&$ngan&#via%"la&*ing-a-long&!s%#ynn(!e$"me$"ni&!a$#sel$\'tenemia%#ids%!o$$usal',
+    '&#ers\'!s$&zzelle#)p-feeding&%isher%$helm%\'scaring$%aneto%%rking%+tho-ukraine-%nians%"ve$"ed%$lary&!s',
+    '&)ter/cycle*)dietician*)mortician)"ed)"s.\'$ring%!r&&tright%!s%=t&mdash;figuratively&mdash;we&--and-slippers\'&bagger+#ing(&eating($iter',
+    '+#ing\'(cushions\'&fitter\'&layers*#ing(#ike\'(obsessed\'#rod\'&seller(#ize((lippered\'%weave+#ing(\'iddling&!.',
+    '&#bag)$ging&&layers&$wise$&halute$%ingly&"us%"o.$$lant$#oid%#ols$"us#(r-elison\'%lison$+/unemployed',
+    '%)dine-haye&#ock%&geenan%#igh%"ns&"za%&scalao%&vaggio%!z$4bridge&ndash;balnaan$#eau%%fours%)g-y-bucci&!a%$iras',
+    '&!o%!r&!e%$sses%"tt\'!a\'!e\'!i$%house$+i&egrave;re/!s&(oacute;n%,age-cleaning)(exercise)$full',
+    '+$unch)*travellers)#way*$orks(%block($folk("s.(%works%%bales&!e\'"rs%)ck-a-rede($bred\'\'cruppin\'!e',
+    '\'$more&"ot%#den&"on%$eage\'%rrack&,r-by-carrier(&copter)&urrent(%eagle(%fluid(#gas((operated(&pigeon()receiving',
+    '\'!.\'*s/aircraft)&slings&"st&"ta\'!h%"ge&&rohane%!l%%ngden\',ton-cummings%&on-and(%eater-!s(\'scented',
+    '$,oll-that-was%\'n/simon%+t-cum-stick\'&ground\'#red\'&shaped&)ty-headed%#uge&!n&$sels%*w-woodfolk%!z&"za$$rier$-uthers/branch',
+    '$(y-across&(coal-bag&"in&(le-rouet\'(ookahead&#net&#sac%$.the%#all%$babe\'!g%*duff-based%"ed%)ing-boxes)"in',
+    '+!s)\'parties)%strap)%thong%#out&#ver%$seat%$ying#$s-on%*to-defence$(.richard$&:aston%&jaguar$"ch$#eat',
+    '%"ly%!r$0halton-humphreys*\'/sutton%"es$#ick%%ngton$%logie$$olio%\'n-moved$&phairn$5tairs&ndash;edinburgh%(en-peter%#ian%#one',
+    '#-t&rehy;horses*(wheeling$$-end%\'freshly%\'harness&$ouse%\'pulling%%roads&#uts%$shod%#way&&heeled*#ing*!s&#ide',
+    '%!e%$gana%!n%#ret%!s$)e-blanche&*de-visites%,l-determined&\'ization(!e)!d&"ls%"r\'&!-\'\'manning',
+    '&\'/former\'(meadsman\'#usm&!a&#ons&.ville/montreal%+s-de-visite&+ian-kantian$$fuls$\'hegians%"ys$$iere\'!i%$glio%(lagenous',
+    '&#ige%"n\'$%ledge&"ss$%o-net%$gram%\'logists%%mancy%,on\'n\'chewing\'%-film(%strip-%-like\'\'/comics()pictorial\'"ia',
+    '\'/s/illustrations($ws29*"33&&onists%!p%&ssable$+ridge-based+#elt*%cases*#fed+%illed*&making*$only))/cassette&*ght/public',
+    '&!o%$oads&!n$%ulary$#way\'!s%/right/faringdon+*meningitis#%uanae$"ba$#cae&"te%"ci$#mba$%ncles',
+    '$"th#%vaers%"ho$.ed-and-painted\'%ivory\'#out\')sandstone($tone%\'l-built%!n%\'r-style&+/enterprise\'%works&#ies&\'y-style',
+    '$*ing-knives$%oeira#!w$&ardine$$elti%!n$&orkers#&yatide$"er$!n$)ocaraceae%\'phyllia#"zo%#lus$!y',
+    '#.-t&eacute;moin#&a-bona%2something-or-other$\'blanca/$#dei%$iego$(larreina%&daliga%!e$&manche&"ri&#yor$%novas$#ras$*s/villager',
+    '$#zza#\'cadable&"ia%$mite$$iano%#eri\'#olo$!o%!b%$melt##dec%$rigg)!s$!n#*e&mdash;in',
+    '+"no+"we$!\'$)-accurate%%clock&)onference/!s(\'trolled%+definitions%\'example%%files&#low&$orms&$rame%(handling',
+    '%(in-point\'(flexions%(labelled\'"ws&"id&$oads%\'managed+$ment%%rooms%(specific%\'to-case%\'winning$#.13$$/4gl%\'against',
+    '%#one%\'toolbus$!1$!a%#ria$$ball%$ooks$\'finding%"ul$%gemas$&ificio%\'n-glued&$ates%"ro$%l/lou',
+    '%#ess%!l%!y$$nave%#ote$#rma%"na%#oom$,s&mdash;both,&except%!/&\'100,000&\'letters&\'persons%%_less',
+    '$!t$&vision*)/workshop$$ware(#/pt#$ford#,h&rehy;flows$(\'n\'carry$+-absorptive%)balancing&*efore-care&&loated%)conscious)\'trained)%uming',
+    '(!s&$rops&%utter%\'demands\'"sk&(ispenser,#ing&#own%(facility&&inding&$lows&+or-hostages)&places%*generative%%happy',
+    '&%ungry%*in-advance(%books\')/cash-out\'$come%\'killing%%laden%*management%(n\'-carry&$eeds\'&gative%*on-deposit\'"ly&)rientated%&paying',
+    '&&ressed%$quiz%\'raisers&(egisters\'\'lations(&easing\'#nts&%hythm$*.prudently$#/by%&cheque%$that$$book&#xes$$call',
+    '$%ed-in\'"up$$fund$"in&$g-up$.less/paperless$)mere-clad)$like%4ore/physicist/oxford$$osis$&points$!y##ida$$llas$%mance',
+    '%&o-type$\'ovision$!s%$teal#,k-conditions%(strength$!i%"es#!l$!e$#ick#"ma%#nce##olo#!p',
+    '$#ius#$quet\'"te#"re#\'s-andra%$doff$,a-le-caillou%"dy%$gnes))/malinski%)ndra-like(!e&!y%%tions%%vetes',
+    '$$erly&!o\'(le-based%*tte-filled)$only)%radio*(ecording)%sized)%tapes*#ype(!.(#/cd)$disk(%decks(&s/7-lp',
+    '%%vetes$!i%"da&%uloid%"e.%!l%!m%,n/cheltenham&#ari&$elli)!o&,gton/yarnton%"on&%paeia%$rers',
+    '$!l%"en$&olette%!u&(let-type)!s%%warys$$pirs#*t&rehy;off$*-aluminium%&litter%%maker&$etal$%/crew%%trist',
+    '%$bala%%gnoli%#ing(!s%#lia&"us%#nar&%ettes)#ing\'"um&!g&&heiros&!o%"ti%*way/united',
+    '%!-&%bound&)conscious&$mark%!d%(lcapuano&%dario&+ey/prisoner&!i&(l&oacute)\'grave;n\'\'a-ruins($mare)$mare("na',
+    '*"ta)$ries($rium(!s($tion\'!e(!t\'"um&$mola&,nau-breonoux*1de-rivi&egrave;re\',uovo-tedesco%%nadas&#eda&!s',
+    '&"et&!n%"th$(igations%%lians&"la(!n\'$e-la("ro\'!i("an\'(oeconomy(*n&egrave;s))-sur-agen%\'ng-away',
+    '(&master)$ould(#off)"ut\'$s-on(!.%%tatis$*le-adorned\'%based(%ridge\'\'digging)#tch\'*in-the-air\'(kanerova()eepership',
+    '\'&shaped(%tacks*$tion)#yle\'%walls&(.william&\'/farmer\')geologist\'*winchcombe&*bellingham\'#ray($idge&(caldwell&&dawson\'#ery',
+    '\'#yke&)ford-born\'#uls&%greve&#law&\'martins\'#ore)+ton.tickets&\'pollard&&reaghs&\'ton-esk\'!t%#ina$%orama&#eum',
+    '&"s.$&raitor&(metation&%tions\'"us%(ey/legal%$ies.%(o-caldas((ommunist&#ist\'#tes&,l-lotus-ford&%pampa#+ual-looking&+/occasional',
+    '&#ity\'&zation&/ly&mdash;almost(%-clad)\'dressed&)ty-figure)$room)&strewn(!.$"ed%$lles$#ist\'$ical+"ly\'!s',
+    '%$ties",t&aacute;lan#+\'s-cradling&$eyes&$meat&#paw#*-among-the%&nd-dog(-mouse-whipped&$imal%%ssays&&trophe%+t-the-cream$(breeding%$uilt',
+    '&$ught\'%tious%#hat%$ream&!y$$dust$#ese%#yed$(fighting%%ooted&$uled$$herd$#ice$#jar$1licking-the-cream',
+    '%$over\'#ing$#man%#eal$&napped(#ing\'!s$,o-nine-tails$&people&$rson%%hobic%%issed%#urr$&rapers%(epellent',
+    '$$sand%$hape)!d&%owing%#ick&%tting%$lide%#uit%\'winging$&to-cat%\'raining$\'watcher#!/$%human$#sgt',
+    '$\'bolised$\'clasite&$ysm.)"al*!x)&ically$\'genesis\'"ic%)orisation(&zation\'!y$*l&aacute;n%.an(north-east)\'!a\'$ised',
+    '&\'immoida&(ptically(%ognic%"in%&laucus\'$xics&"es&"oy%#og.\'&aholic\'%uable($e(s))%-aria*)retailing)#.56',
+    '&)nia-based&#uge%#pas%$unia%&ysable\')t/manager("ed("ic($s-is&"ze\'#ing$!n%!a&$nche$#ora',
+    '&&ractes$)ract-eyes&"in&#tie&!x%!i%+rh-coloured$\'setinae%"ta&$ophe&&rophe\'*$icus+"se$&tonics$%yltic',
+    '$"ox#\'calling$*h-as-catch&(cropping*!s&$dyke&$hand&-me-if-you-can\')onitoring&%penny\'$late&*twenty-two%&/ketch%$ably%"ee',
+    '&$side&"th%$fire%#ier\'"st&\'ng-game("ly%%lines%&weight$#law#4eau-cambr&eacute;sis$(chetists&$ises(#tic\'&zandis',
+    ')"rs&6ol-o-methyltransferase()aminergic&!u\'#men*#ate$!g%!o&\'ricaliy("ed)"s0(%sable(%zable\'#y-b*$ased',
+    '(#_no$!l%"la%%onian$&naries&%tives%#ins$&phores$$ract%.ers/band/disco%$hams%*ing-geared(!/\'!o%&master',
+    '+&:plump+%s-you%&wauler)!s&#ise$%sbaea$!x$!y#&fishes$#oss#\'ggccatg#&h\'lics%$rine$"ab%%racta',
+    '&#ism("ts&$sis.&!t\'&ically%#yan$#com$&echism&$ting%%deral&"ra("l-*%aisle*(building*$size',
+    ')$.the%#nne%$rall&"er&*ine-wheels)%/aged(!g)#ton&#ter)\'isation%(ter-tube(#ise)"ze$&inians$$lick',
+    '%"on$#ole&,ic&mdash;but()-agrarian*\'pproved*+ristocratic),conservative)(educated)#led)*protestant*&uritan("/a(!a($ised*(m-nation',
+    '("s.\'"sm$"ro$!s#"ie$"na$)on-active\'\'bearing#$lick%$more%\'n/peter&!e&!s#$mose#\'napping',
+    '#$odon$%licas$*n-thompson%%based%!e%&sville$"ri##paw#%raeth$%eeona$#igg%+ona/glasgow$&oimani#\'s\'-meat$\'-cradle',
+    '$!.$\'/herons$#ash$#eye$$gore$%kills$%uited%!p#"ta%\'hianchi%#ils%"ro$"el%#nom%!r',
+    '&$line&#sty%#sty$!i%"ly%"ng&)i/tornado&"ni%"sh&$tock%"vo$+le&mdash;he\'-rehy;rustling&\'-ambush\'\'dealers',
+    ',!s\'&fodder)"od\'\'grazing\'\'herding(\'oldings\'$less(#ike($orry)$vers\'#man\'(pastures("en*!s(%ounds',
+    '\'\'rancher.!s,#ing(#oad(&ustler.!s\'$shed+!s(\'tealers+$mers\'%thief+#ves,#ing(%rucks\'$yard',
+    '&$.but\'"in&$grid&$shed&$ways%"in#\'unarich%"da$*vellaunian#&walker%!y$%easle$$omen%#rth"%ubeen',
+    '#,casian-style\'#cus$#hon%)y-riemann#\'dacutus$#ill\'"os%(maculata,"us$#rey%"on$.well/landowner#"ed#"gh%#edy',
+    '%#ley%"oo%-t-and-bowleds\'#but\'#out&$.the&#_in&"on#(l/public$\'arthron$&dewood%#ren&(on-heads%%stane%2well/herefordshire',
+    '$&i-head&\'wobbles%#bus%"es%$flow)\'er-like%!s$$kers&"tt$$lery$#ton#&martin$#ont#"nt%&erbury',
+    '#"rs#$sa-r%*l-sounding&%ities("y\'&*ly-related%"ns%%tions$*e&mdash;to%)-specific&#way%&/cafod%/_cel&egrave;bre%"d\'%$nnis',
+    '%$ries%/s-hyperactivity\'$more%+vic/injured)$wife%$way.($head&#say$"in&!\'$$ovic$$sade%"ed$(tic-soda(\'tongued',
+    '\'$iser$#way#%tares$#ela\'!.&"la%(risation\'$zing%!s$#her%$orne$!i%%on(s)\'"s.&)us-minded',
+    '()ly-worded$#ley"$v100#\'a/right$%cuiti$"da%#ino$!e$&ggioni%$naro$%ignac$%laire%%cante\'"re\'%selle',
+    '&"ri%!i&\'er/opel(!o%$laro&*i-bjorkman\'"ni&(oeconomy\'!s\'#tti&!y%$otti%$ries&(y-owning(%twill',
+    '$*n-monaghan%%illes%"na$$tina%"or\'"ta$%zzuti#*e&rehy;man$!\'$&-bound&%rasil%&cities%&divers(#ing&\'welling',
+    '%#ins%&mouths%$wife&$oman$!.$%/cpre$$ated$"ds%\'wellers$#ful$%light%$lini$%mouth$\'n-atack%#agh',
+    '&-ish-woodhouse%#ham$)rn-church\'$desk\'$like\'$roof\'&temple&)e-phoenix&#oma\'$usly%!o%%swall%!y$"s.%$sons',
+    '&"on$%woman$!x#)iare-eyed$"es%"ty$)llaciones&"ed\'"rs&)ing/marra$#ste$$tate(!d%#ous%)y-despite',
+    '(#oam\'$mode\'\'nesting\'(resonant##lin#$mont#%orite#"vy#!y"\'wardine#"es#%forth#$ings&#ton#-kwell/college',
+    '%#dge##ood#!r##sey$"ts"$xais#%lodge#$ton\'"%yasso#$cedo##ent$&rfully$!s#"la$#ers',
+    '#%nazzo##oma##ron#$tiue$\'oniales##uni##zer"%zabon$"le%!y$$nove#$elet#"in$"re#&matann',
+    '%!t##rti##yer!#b-1#%radio"$0006"%1-ah7#%250rm""25"&a/cact$)nederland#$xc57""de"+e/inspector#"ma',
+    '"$i/bs$#cia%&oopers$\'dti/bim$\'natwest#"ol#!s"!l""ns"3s%uk.ac.uknet-relay#)-chongjin$"tv#%/epic#%iftcb"=z-arg-arg-&bgr;-naphthylamide',
+    '!$c-3\'#&cotton$"up#!e##g-c##m3t$"4t#)operating$(rdinated"!.#)operation$)rdinating##qry"#117"!4',
+    '#"cc%"at\'!g#.gctgagcagcccag$!g#"ll#"od""bi#!n""c+#(/manager#=cccfffccfcfffffffffcccfffccff$#kkk##dna#&hhhrrr',
+    '+%l5275#2tgtgtgtgttctctgatg##vcc""dc#!h$"rn#!p"!e##500#!m#(ssdon\'tw">ffcfccccccccccccfffffcfcfcffff"!h#"hr"#i\'s',
+    '#!r#!x"#l\'s#"4.""m1##ail#!i"#ngg#!y"$oach#%eliac#"jb#*ncentrated#$stly##uld',
+    '#!a#"it#"rs"(rai-nccj#%order""su"#tgg#!s#1tttccttattaacctgc#"vs"%u-clc#&p/cflo%$fclo#!s"!v',
+    '$!c#!t"&w/cprw"&xlviii#"xi$!v$"xi!&d&bsol\'(;dustbin(&kermit"$-603#$7000#&buying#*canterbury$&fp4481',
+    '#!r$-adio-cassette$-om&rehy;based&*-delivered\'"xa#&single#!v"!.#!1$#200#$9239"$/rom"#11a%%/cd18$!b',
+    '#!6"%2/cd4&"59#!9"$3/19$!4$!8#!2#!6"*4&lt;300/l#*-biotin-pe$#cd8$(envelope$"pe#(4/vcam-1',
+    '#*5-depleted$#/14$"rb%"c+&!-%!o#!8#/lymphocytopenia""58""62"!7"+8-earlstown"1a&mdash;christian#$-vvd#!9',
+    '"%c-625#"25#!7#%a/day#!d#!l#&w/cprw"&d/plus$*repository""es#!v#&x/tdex"#gae"!h""if',
+    '""m4#*a/analogue#!s"*na-deduced"!o"%p-397$#497$%c325m%#425$#m44%"54$$x339("es%#559#!f',
+    '"#rjc".s&mdash;centre#!.#%/isis"#tce"1u&mdash;christian#*-christian%"su\'$-fdp$#pav#!/$\'csu-fdp\'$/spd$#fdp#,404838.745.1',
+    '"%x-460$#560$#660$#860#!l""zz!#e-1$"50##200"\'/1leste#!e#"yb"$1112""2b#!l',
+    '"+a-industrie$#paz#%cescu#"nn%&lleach#"ra$"id$!l%!s#)se-fire.s%\'firewas%$ssee$%fires$#ire#$tion',
+    '$!x#$wlin"$baco$"do#"us"&c/soed#"al#$cano%"to$&hinato$!o%"ni#!e#&hmaine#)idomyidae',
+    '%"io&"us%!l#)ropiaceae".da-manipulated%\'radical$"no$(r-barque&%sinai&&topped\'#ree%#lea#(desfield##ens$"re',
+    '$!s$$wain#!f#"gs##ile%"la$!s%"ts$!t##mas##oin$#mir$"na#"re%"la',
+    '&!s$"us"$e-ed#!a##com#)fax-style##gar#!l#!p"!f#"ai$\'mandole#"in$$xime#)nddwysarn',
+    '%$iame#$rino#"ta%&zidime#&uroxim)!e#"yn"!g#&b/sseb#!s""he##ill#$ovin"#ibe#!l',
+    '$$idh.\'#ing%!n&!\'&)g-busting($full($hung(&lights\'%/with\'$ward%%uradh#$nwen##rog#$tlin"&kuolis',
+    '#%adons$!m$!n$$stic$#uro##bes$&rating%$idge#"co%!n$$ured#(e-brated$\'b\'s-eye%\'-filled&\'snapper',
+    '%&rantur\'!t(#ary(#e.2)&/major)"d\'(0ion-of-democracy+"al(#ons)!r*#ily*!s&%imbor\')ty-filled*&packed',
+    '+%trewn)#.he)#dom&\'ologist$"na%!e%!o$!p$"re%#ina&$tate%+y-flavoured\'$like&!.$#scu',
+    '%(te-ville\'%ville&%ially(!n\'"na\')on-loaded##fyn#/ibacy-conscious()/marriage$#nda%"es&!t%!o$!o%%monte',
+    '$!-%(adhesion%\'binding&$lock*!s&%odies&&y-cell%\'casting&&ulture&$ycle%%death&\'ivision%)formation%$link%%phone',
+    '&\'pecific&(tructure&%witch%\'washing$%/cell$%amare%!n%%r-bar\'(dwellers,$ings\'%level&#/on&#age&(dwellers&"et',
+    '&$less&\'masters%"ta$"er$%ifier$$notr$\'o-brate&$oboe%&biose/%$film%/obiose/mannitol%&phaned%/tex-and-formica$&s-unit%)/barracks',
+    '&#ml.&%pan-t&(specimen($leen&$unit$!u%"ar%#con%%heavy%-lar-telephone("ly\'"se&)ite-laden("ic\'#zer',
+    '&"um%$plex#%misia#"os$#tti#$sian$$teel#"ta%!e$&iberic%%c-mad\'%roman\'(scottish(\'peaking\'$type',
+    '&!1&!2&!3&!k#$utel#"yn"/m&acirc;l&icirc#"at#$bali#!c#,ent-asbestos\'+back-filled)#sed\'(coloured\'&filled',
+    '\'%lined\'(rendered&(/ballast&#230&%:sand&#ite&$less&$work$&taries\'!y%,ery\'s-on-sea%$ries#"il$,t&eacute;rio#!p',
+    '$%dxs3-#!a$!p$#rgo#%berht$#iot$#ose#%chrus$"io%"us#)derawasih$"re#"er#%frith$"us',
+    '#%obite\'"ic$%ceras%%ladum$$mani&"rv$)taph\'-the#$sere&"ie$+or-operated\'(taunting&,ed/moderated&$inus&%ship.$!u',
+    '%+s-awareness\'\'defined\'\'ratings\'&taking((o-census#+t&mdash;had+"it$+(p&lt;0.05)$4-wise-dollar-foolish$\'.profit%#the$&/month$!1$!3$!7',
+    '%\'ur-like\'!a(!n\'"es\'*us-powered)"es%"vo%#wer$$ella%%naria)!o)"us(\'y-class&+nial-season%&r-half',
+    '\'%stage&\'partiet&\'sshowed%%simus%!x$$illy%"me\')-counting\'$ters((re-scale+.to-metre-scale+$wide*(s/inches&%organ%%ncome',
+    '$&ocelle%#lla%"re%#xin$$raal&+fricain-rdc-!e)#que&"is&.l&rehy;heating\')-american($city)&ontrol()defensive(#ise',
+    '(\'western)%rawby\'!/(*peripheral\'"ia(#ens(,sa&rehy;tion*%tion/)-ed-bargaining*6r&mdash;de-centraliser)#tic*!s()zed-state*!s\'(ly-based',
+    ',\'veloped*$held*(prepared*#set+\'ituated)!.)\'planned\'$ness\'&system&\'rchidae+!s&#ted%+e&mdash;the&!\'&2-back/centre-front',
+    '((y-centre\'&centre($hest($lass(+onservative*\'trolled(+um-fly-half+&sports\'\'detente\'$east(\'ntrance\'%field(&ocused)#lds($rame',
+    '(&urrows\'$hole\'$less(%ibera-!l(%oaded)&cality\'#off\'(partners("in)&voting\'&screen(#ewn(&hafted((ponsored',
+    '(&tapled)#rip\'%table(+hreequarter((o-centre\'(weighted)"st($heel&!.\'"ps\'#the&&/civic\'%hotel\'\'library\'&margin',
+    '\'&region(+oad/railway\'&sports\'$west&)d-account\'!.&#ism&$less&%pages(#rcs\'$etal\'"in\'$rise&*s/subjects\'#and',
+    '\'$tand&%which%\'icon-10&*figuration\'&ugated&$gade\'$udes("ed&\'lobular&$prep*#-10&#sta%/oam&eacute;rica(\'ericano/!s',
+    '-,/centrocytic&%cytic&/mere-associated\'"in&#pus&!s\'#ome*!s%-um-democraten\'*democraten&&roides%!y$"s.%$/bbl$!u',
+    '%$rial("te\',es&rehy;gone)%-gone*%worth)!.\'!o(&n-like)"es&/y&mdash;simonds\'$-but(.ecclesiastical(*hutchinson(\'perhaps($that',
+    ')#ide\'".4($more($they\'&/arrow(%early)&nglish(7hutchinson/arrow/legend\'&makers\'$they#$wald""oe#$lbeg$&icolor%!n',
+    '#$nocc%$thus$#tea".pacia-positive((specific\'!.$!d#!e#!g#)halanthus\'$spis&!e&\'ization&(o-caudal\'(chordate',
+    '\'!n\'$poda)"id))lydactyly\'\'sporium\'#tes$(isodotus#$ilux##lac#!n#!o#&r-nber"&r-tain#&aceous$)fotherium',
+    '&"ly$$lene%!o$(mbycidae%#esh%.ic-and-leather(#hob($like(\'mounted(*reinforced\'+s/paintings&%de/gh&!k&#sta(!s',
+    '$"si&$fera\'$olia$"te&!c&!s%#ias&$idae&"te%$odon&\'phyllum&&stigma$$volo#!c$"al',
+    '%#ndo%$riae%"to$"hi$"is$"la$#one%+pithecoidea+"us#%dagne%"na&"ya$"di%\'oriaeth$!o',
+    '$#al-\'%based\')importing\'(offering&!e&(icoltura&&ogists$#bal%&ellums%#lis%&ralism("ly\'%tions&#ism(!t',
+    '$$dase%&igion\'$"ly$$ment%$oney\'$iall$\'ologist$!q$$star$&tainly#"fs#\'ialised%!n$#llo\'!s',
+    '$"ph$+se-and-navy\'\'magenta\'$pink&!s&$ttes%!h$(um-based#%knica##nac%$voda$#iog$%obbio%&hlavek#)opithecus',
+    '%"va$"ej$\'labobuv$#one$$utty##t15$#:pg$!a%(in-death($line(#the\'&.facts\'%ement\'"lt(&y-they',
+    '\'!y%#lly%#yne$$eine%$ntye$&ifcate&%icand)*te-holding,\'related+(/doctors,*portfolio/+)sseparate*,ions/doctors*!s(#uts',
+    '%#nly%%orati%!s$%ology%$rari#$ulli$"na#&vantic$$elas%"ra%#tti%"za\'!s$"ia%!c',
+    ')\'octamer)(specific&#iae&)othoracic%$dius%#lla%!s##yth"*s&aacute;r#$ario%&ovitch$!y##ide$!o#"ke',
+    '#"ne$"oh#$opot#&s-pits$"da$!e$"io$&na-310\'(equipped$$olis#$tine%"us$!o%"de\'!s',
+    '$#uis",tacean-sized("s.$"in$$weyo#&ekovac$#lem$#ris$!s#&inkaya#%oniid#"ra$"ek#"yl%)trimethyl',
+    '##fad##lan$%emans""va$#llo#%eland$"rs#"in$%zdali"(xecutive"(yrargues$"ek"#zar#!e$"ri',
+    '#)ndash;104)#dtl)#gbi*"li)#igx"%(5.3)"%-1000$!8##480&!c##700&!s##fly#(modified##psg',
+    '$#ype##wis"$.101%!2##7.2#)honderich#(sections""/+#!c#!d""31"!4#!8"!5##610',
+    '$!b"$6/76"&700-2c"#800"\'a-franc#)1,000,000##200#*30,000,000#!g#"st"!b"%c-113%!3$%blown#"11',
+    '##502#!l"#dss"\'e-first#"1a#"ls#!r""gs""la#!p"*m-metalfax""po""qc""rb#!s',
+    '#!r"-tr-expressing"!u#&p/cflo!+g-selective"&3/svga"3acattaaacacactggaac#"tt%%aatcg%!c&)ctgggatac&)tcgggatac""br""ca$%/tgca',
+    '#!c#8ggatccccggatgttcttctggtc)2gttctggcactcctgagc#!t$%/agcg"$dgbd%!e#!h",e-controlled$#itt##gae$"be$"ce""ip"%p-115',
+    '"$t-3\'$"fo#!c#1gagggcatcgaggtggc!+h&acirc;let*2on-sur-sa&ocirc;ne,=s-sur-ch&acirc;lons-sur-marne),teau-bottled.&chinon.\'larcher.+proprietors-)/baronial-#dun-"ed-,neuf-du-pape',
+    '1#ult-\'villain+*let-lomont*/illon-sur-indre4%marne+$ment*#res$,grave;tillon#&eacute)&;crout*!i*$nier*$reau+&i-bibi,!f',
+    '*"ze$)grave;vre#%ggr;1#/lsqb;a&rsqb;que#7mdash&mdash&mdash&mdash#(oacute;0+#nin++sh&oacute;0.&uacute*)sh&uacute#&uuml;n"!\'##ang#"el%"la',
+    '#$know##min#%ships##ung$%scite""-1#$4007$!7#!7$#500#$8902#%ch-ch(#aps%#ina"#.12',
+    '$!8#"22#!6#)7&ndash;9#!8##iii#!v"$/new#%state"%1/ch2#!6""2-""3.#"oh"!5',
+    '"!8",a&bsol;t4eau#"\'n#,-cha-chaaing\'%garra#!a$!t#/ban&rehy;delmas%"ry%!s$&bering\'!t$#ert\'%iasis$!i',
+    '$\'onchard$#ran%"ot#!c$)&oacute;n$%eporc%%water$\'hapoyas%\'oengsao$\'k-chack+#ing%&sfield$$mool$"ok%!n',
+    '$"ra#(d-libyan$"am$#dha%#ian(!s%&lewood$"ha$$kirk$!s%$with$*wick-jones(#_et(#ian(!s',
+    '$!y%!r#%ebols$&merops$&rophon$#tae%&oceros&$dons&%gnath&$taxy#&fe-wax%!e$)f-chutter&)tempering%#ani',
+    '%"in%#ris%!s$(ing-dish$"yn#%gall.\'#ian%"ns$#gar$"la$"oi%"ol%!s$#res$"ue',
+    '$"ab$#ine#%ianan$!f$"li$0n&rehy;festooned+&smoker/#ing%)-breaking&&dotted\'$rank(&inking)"ve&%ferry&%guard',
+    '&\'pulling&(rattling\'#ead&$saws\'#hot\'&mokers\'\'pecific&\'whipped\'#ire%\'/bypass&$side%(breaking\'$idge%!e&\'y/judge',
+    '%$line%&mailed\'$king%%plate*!s%&s_such&)aw-handed+#ppy)(wielding("ed&$moke)#ing&%titch\')ore-owner&)word-fist',
+    '$%paval$.r&rehy;manship%)-and-desk&%backs(#sed\'&odgers&%chair\'%overs\'&um-bed&)designate&&frames&"is&$legs&#men&\'o-plane',
+    '&&person&$rail\'%idden&%shape(\'uffling\')traddling&$then%1/bench/stool/seat&\'harness&(rucksack%#amn%$bear)!s%(covering%!e',
+    '&#man%&ladder(!y&&eather&#ine%!m&$aker\'+n&rehy;ship(--of-the-board))president)%to-be($.but(!/)%bucks)+coordinator',
+    '))directors)$home&,en/spokesmen)%women%$onea&&planes%*personship/!s%"s-&!.&#eat&%tools$,se&rehy;dieu&%-dieu&%house',
+    '%$gein%#sac$#tow$&yasarn#:ka-chaka-chaka-chaka-chaka%"ri$$dara$$iris$"ka%&rapong$(oladnovy%"ri%"ti$\'ra-nadi&*verty/ship',
+    '$#vad#"la%!k%$main&#ont&(p&eacute%!n$\'cedonic+!a%\'hihuitl%%idian*!s(!c("us\'#oid',
+    '%#one$$daea\'!i%"ea&!e&%worth$#eff%*t-bungalow\'*restaurant%"ur$%field$1grove/oxfordshire$*ice-shaped&%odoma$,k-and-cheese',
+    '&%based\'%oards&%caves&%drawn\'%usted&\'figured&&haired&$like("ne&&marked&)or-cheese&\'smeared\'%tripe,!d&\'waggons',
+    '*!s%&e/tory&#don&)r-pearson\')/overseas\'!s&!y%%house%#ias&$dian*"s.&"er&!n\'#ess\'"gs',
+    '%$sman&%tripe%&y-marl$$land\'"ge%(enbrooke\'$eger\'%ge\'93)+-acceptance*&driven*#the-$-pro))/response)\'ability)\'r/space',
+    ')+s&mdash;not%%i-bar%.ow/oxfordshire$(mers/aid)%scout$!o%&n-sur-&!e&%gphob&%naise%+up&eacute;s$"st&#rey$&tenham$#vey',
+    '#+m-pionships$#aco%(ecyparis-#sus&$drys&%morus&,rhododendron%-li&egrave;res%$rtin$-ber-dimension(%music(%scale\'/lain-birkenhead,"in,)mussolini',
+    ',)neighbour,%royal+%esque+$ship)*yne/farmer(#ens\'\'maiding("en\'(s/estate)%iveco%$lain&"er\'%tting%#ons%#rer',
+    '$#cha$*den-london$\'eleonic*"sm)$like)%s/rem$&ically%%ntong%#ons(#hip$#lay%"et$#oix%"li%%miles',
+    '%#rin%#uns$,p&eacute;tre%$-ian%%.ship%$aben&$gnac)!t("e*)(-ardenne*&colour,$oled*&filled*$hued*(lorraine',
+    '*\'showers+\'willing*\'tasting)!.&#ine&"ka%&erelle%&fleuri\'$ower%2ignonni&egrave;res(!y&(on-elect)$ship(+/auctioneer)$boss',
+    '()ship-best-\'chasing-\'decider-"fa-&league,"s.&!t%#kin(!s%$leve&#ieu%#man%(neuville%$oluc%/s-elys&eacute;e',
+    '\')sur-marne&)ocephalus%\'tercier#)nakyapuri%$mine$!c%)&egrave;d%"e\'\'%-that&--in-a-million)%duced\'\'meeting\'(selected(&tarted\'#the',
+    '\'&vought&*l&rehy;lor\'#ler*"ie(,or-candidacy2#tes+(election*#ial+"es+#tus\'"ot\'!s&"rs&"s.&!y',
+    '%\'ourtois%#res$$dana&#ppa%8eliers-and-roller-skates\'"le&!r\'"el\'&nagore%"io&%singh%,ler-scripted(\'/ibanez*)nstructor)$ruby',
+    '(%esque%)os/curzon%#ris%!u$!e%)l-covered\'(smelling&#led%!s%!t%#uon$$g\'an%%abang%,e&mdash;over-#see',
+    '&)--looking\'&agents(%round\'\'because\')colonists\',facilitating\'\'nightly\'(of-heart*\'subject(*pportunity("ut\'&points\'\'ringers\'%shock\'"up',
+    '\'#the&!/\'*distortion\')expansion\'&school($hift&$ably\'"nd&#bar&#d_a)!t&&makers&#not&%overs&&s(dcs)',
+    '\')/feelings(*priorities*&oblems&!y%"in\'&g-mats*!e),of-the-guard(#.to(*/improving(!s%%jiang%$ling%$shun%#tse',
+    '$!i%"ne$"ka$$nals%$el-4(%based))y-channel(\'forming(\'hoppers(%ready*&ceiver(&switch(*to-channel\'$.our\'$/esp',
+    '\'!4\'%fills\'#ing\'$lers($ings\'%plate\'&s-were(%/mass\'$ways%(ichthyid&\'ngswood$!o%#ine(!s%"un',
+    '$%rango$!s%)on-masses\'%ettes$$tant%\'erlands\'!s&#urs%%hamat*!*%#in\'%!o&$isel$$ukah$$zoni',
+    '#(o-ju-kua$\'logists\'!y$$rach&#inn$(s-oozing&%stuff&+worshipping%\'/heresy%&tikahn$+tic-looking\'\'/stable\'"um$#uat%"en',
+    '#"p,$&-books%$home%$lain$".2%!4$#als%$rral%%utier$\'eaubras%!i%&l-goer\'$like\'\'meeting\'\'of-ease',
+    '(%ooted&(ain-midy&%corse&"et&%garth&$iers&!l\'\'e-saint&"on&)s-of-ease\'$tile&&thorpe\'#oun%!r&#on.',
+    '%"ss\'"es$#ham%#ood$%inera%"us$"ka$%lain\'()-in-chief,(ordinary))secretary\'!s&#yne%#in-$$man.',
+    '(*brakspears(%curry*\'stodian(%dairy(%event(&prison*(oduction(\'teacher)#own\'%esque$&pacqua&"ls%$ell.(&/decoy)#imp',
+    '))volunteer(!s&!n&"rs("on%#ill%/le-hyam-trained\'%/base)$ucks%!o%"y.&(/wallace&!s$&rassis$#ska',
+    '$*talisation%-er&mdash;that\'\'-breaks()divisions(#end((headings)$ouse(&social(%title\'!.($this\'!/($book(\'section\'!4',
+    '\'&s.good(%/days()1&ndash;3#)quichocha#(r&dollar%+lowbar;code%*rehy;terer$%-bagh%&volant$*a-assassin%!c&,&rehy;terize&"id\'#nid&-ter&mdash;and',
+    '*3rehy;assassinations/)istically)*-at-a-time*,by-character*\'centred+%omedy*&enigma**generation1#ors*(inspired+!s,$tics*%level*&pieces+(ortrayal',
+    '*&reader.#ing*%sized*&tested+\'raining+$urns*%wheel)!.*(handling*(oriented)!/*%image*(national)"ed)#ist',
+    '.\'ally-he."s/0%ideas*%zable,"ti)(ological-!y)$ware%$dnus&\'riidae.%(lambedes)+ides/junior)#ous)$rous%#ndo',
+    '\'"os%!s&%villi%#ter$\'bonneau+!x(#ier%#ury$+coal-effect)+impregnated)$like)$rich)&suited(!.(+/adsorptive',
+    '))red/black(,:dextran:fat%6uterie-&eacute;picerie+!/\'+i&egrave;re($eres$)d/rhubarb%$aidh%!e&"ll%-onnay-growing(!e$%ecter)#ful%!f',
+    '%#mza%&ntaise\'*e-maritime\'"on\'!s%-stenvironment%#yon$!g%)&eacute;s%#aff&#kov&"te%\'e&mdash&!-\'%based',
+    '((onvertor)$oled\'\'dealing\'#gun\'\'holding\'#out\'%payer(#ump\'%rents\'*separation\'\'to-mass\'"up&\'/credit&)able-time\'"nt',
+    ')#ped)!s&(d-capped((particle\')/credited&#out&#pay&\'r/power&"s.\'&/stamp\'#_as%$ings%"or%$rill$%ibdis',
+    '%$dees%"ly%#man&"er%"n\'&&gworth%%ot(s)\'&-horse-!s()victories.!y(%wheel-!s%!s&#ma-',
+    '("ta)*ic-looking%*t&egrave;s&+able-status*,/educational*$ness)(y-minded(%ulous&$ies.&(y-backed)"ox(&funded(*registered*%lated(&school',
+    '\'!.(\'richard\'#/do\'$ware%#ulf%%varis$!l%!a&$nnes&(tan-type%%combe\'"te%"ee\'!n&(fontaine',
+    '&)s-adolphe)%lbert()dominique((emmanuel(/fran&ccedil;ois(%jones()le-chauve($roux(&victor\'*/solicitor\'-es-and-dianas\'%toned\'%ville\'5worth/chairman/fencot-#m40',
+    '\')-stratton\'!t&<ville-m&eacute;zi&egrave;res-\'ezieres\'#oix&$wood&*y/planning%#ick&/e-bloody-hatton&#nch\'!e%.otte-elizabeth+%milie)(nstrasse(%ville',
+    '&"in&.on&mdash;asked(!-(&/boots)\'manager%%wood.$(m&eacute%\'-seller%!.%"el&)t/science%%illes&#ng.&"on%#ond',
+    '%$pits%%worth$*nac&eacute&!y%!d&"on%-el&rehy;house\'\'-houses(#pit\'!l&"tt%$ford%#ham%#iak&\'odiscus',
+    '&"is&!k$%oalis%*lais.there&$ette&%laisa\'!e(!s%#nia%&phytes%"st%#tar$#pak&%ntier%"oy',
+    '%(ed-edged(\'looking%,i&egrave;ere\')grave;ere!+ometabolism',
 )
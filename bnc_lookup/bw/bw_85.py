@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_85 = (
+count_85 = 6694
+
+heads_85 = (
     'bolt-through',
-    'bolt-upright',
-    'bolt.',
-    'bolted-up',
-    'bolten',
-    'bolthead',
-    'boltholes',
-    'bolting.',
-    'bolton-bury',
-    'bolton-le-sands',
-    'bolton/chilean',
-    'boltonian',
-    'boltonians',
-    'boltons',
-    'bolts.',
-    'boltz',
     'boltzman',
-    'boltzmann-gibbs',
-    'bolukbasi',
-    'bolume',
-    'bolumising',
-    'bolungarvik',
-    'bolx',
-    'bomarzo',
-    'bomb\'s-',
-    'bomb\'s-worth',
-    'bomb-aimers',
-    'bomb-aiming',
-    'bomb-attack',
-    'bomb-bay',
-    'bomb-blitzed',
-    'bomb-building',
     'bomb-burst',
-    'bomb-bursts',
-    'bomb-carriers',
-    'bomb-carrying',
-    'bomb-chuckers',
-    'bomb-collectors',
-    'bomb-crater',
-    'bomb-craters',
-    'bomb-destroyed',
-    'bomb-detecting',
-    'bomb-display',
-    'bomb-fragments',
-    'bomb-hoax',
-    'bomb-laden',
-    'bomb-less',
-    'bomb-maker',
     'bomb-proofed',
-    'bomb-proofing',
-    'bomb-scare',
-    'bomb-shattered',
-    'bomb-skip',
-    'bomb-store',
-    'bomb-strike',
-    'bomb-threat',
-    'bomb-torn',
-    'bomb-victim',
-    'bomb.',
-    'bomb/small',
-    'bombardable',
-    'bombarde',
-    'bombardier/navigator',
-    'bombayite',
     'bombazine-covered',
-    'bombe-shaped',
-    'bombed-outs',
-    'bombelles',
-    'bombelli',
-    'bomber-launched',
-    'bomber-style',
-    'bomber-type',
-    'bombers.',
-    'bombert',
-    'bombet',
-    'bombifrons',
-    'bombin\'',
-    'bombing-range',
-    'bombing.mike',
-    'bombix',
     'bomblet',
-    'bomblets',
-    'bombmaker',
-    'bombo',
-    'bombois',
-    'bomboklaat',
-    'bombola',
-    'bomboniera',
-    'bombrum',
-    'bombscape',
-    'bombyciferum',
-    'bombycoidea',
-    'bombyliidae',
-    'bomer',
-    'bomers',
-    'bomfords',
     'bomm',
-    'bomowski',
-    'bomped',
-    'boms',
-    'bomsztyk',
-    'bomza',
-    'bon-bon',
-    'bon-lecours',
-    'bon-mots',
-    'bon.',
-    'bonacure',
-    'bonafacio',
-    'bonafide',
-    'bonafoux',
-    'bonald',
-    'bonam',
     'bonamargy',
-    'bonamia',
-    'bonane',
-    'bonanza-pace',
-    'bonapartistes',
-    'bonapartists',
-    'bonar-law',
-    'bonas',
-    'bonasia',
-    'bonasse',
-    'bonaventur',
-    'bonavia-',
-    'bonazza',
-    'bonbon',
-    'bonbonniere',
-    'bonbrest',
     'bonces',
-    'bonchester',
-    'bond\'',
-    'bond-',
-    'bond-buyers',
-    'bond-dealing',
-    'bond-elute',
-    'bond-like',
-    'bond-market',
-    'bond-mobile',
-    'bond-raiders',
-    'bond-rating',
-    'bond-street',
-    'bond-style',
-    'bond-theme-that-never-was',
-    'bond-trading',
     'bond-underwriting',
-    'bond/finalist',
-    'bond/gilt',
-    'bond/obstetrician',
-    'bond/resident',
-    'bond/skylon',
-    'bondarev',
-    'bondartchuk',
-    'bondedness',
-    'bonder',
-    'bondieuserie',
-    'bonding/non-bonding/anti-bonding',
-    'bondington',
-    'bondjale',
-    'bondmaid',
-    'bondman',
     'bondone',
-    'bondor',
-    'bonds.',
-    'bondsters',
-    'bondt',
-    'bondware',
-    'bondway',
-    'bondwoman',
-    'bone&rehy;snafflingly',
-    'bone-',
-    'bone-a-fide',
-    'bone-ache',
-    'bone-achingly',
-    'bone-against-bone',
-    'bone-against-muscle',
-    'bone-based',
     'bone-box',
-    'bone-bruising',
-    'bone-cage',
-    'bone-carvings',
-    'bone-chaste',
-    'bone-clear',
-    'bone-coloured',
-    'bone-comb',
-    'bone-crackingly',
-    'bone-damp',
-    'bone-face',
-    'bone-fingers',
-    'bone-framed',
-    'bone-grinding',
-    'bone-healer',
-    'bone-hole',
     'bone-jarring',
-    'bone-juddering',
-    'bone-like',
-    'bone-loading',
-    'bone-melting',
-    'bone-mill',
-    'bone-poor',
-    'bone-rated',
-    'bone-ridged',
-    'bone-selfish',
-    'bone-setting',
-    'bone-shadow',
-    'bone-splintering',
-    'bone-strengthening',
-    'bone-structures',
-    'bone-substitute',
     'bone-thin',
-    'bone-thinning',
-    'bone-tired',
-    'bone-twisting',
-    'bone-whiteness',
-    'bone-workers',
-    'bone-wrenching',
-    'bone-yard',
-    'bone.the',
-    'bone/chilled',
-    'boneen',
-    'bonefiers',
-    'bonefire',
-    'bonefires',
-    'boneheur',
-    'boneji',
     'boneless.',
-    'bonerfydies',
-    'bones&mdash',
-    'bonesheaths',
-    'bonewhite',
-    'bonfire(s)',
-    'bonfire.',
-    'bonfires.',
-    'bong-jun',
-    'bongarde',
-    'bongbong',
-    'bongchundong',
-    'bonghi',
-    'bongi',
-    'bongo-bongo',
-    'bongo-bongoland',
     'bongoes',
-    'bongrace',
-    'bongton',
-    'bonham-carters',
-    'bonham-christie',
-    'bonham-type',
-    'bonheure',
-    'bonhomous',
-    'boniarense',
-    'bonica',
-    'bonicco',
-    'bonifacio-lugiato',
-    'bonifatii',
-    'bonifazio',
-    'bonification',
-    'bonilabour',
     'bonington\'s',
-    'boninsegna',
-    'bonior-hoyer',
-    'bonios',
-    'bonitas',
-    'bonitate',
-    'bonitatis',
-    'boniti',
-    'bonitta',
-    'bonitz',
-    'bonjela',
-    'bonjourdino',
-    'bonk-famine',
-    'bonkbusters',
-    'bonkersville',
-    'bonkidorm',
     'bonkrupt',
-    'bonlieu',
-    'bonmahrat',
-    'bonn-based',
-    'bonn-cologne',
-    'bonn.the',
-    'bonn/berlin',
-    'bonn/frankfurt',
-    'bonna-fide',
-    'bonnafous',
-    'bonnaire',
-    'bonnar',
-    'bonne-bouche',
-    'bonne/wiltshire',
-    'bonnefons',
-    'bonnelame',
     'bonnellia',
-    'bonnemaison',
-    'bonnensia',
-    'bonner&lsqb;1970&rsqb',
-    'bonner-walter',
-    'bonner/celtic',
-    'bonner/farmer',
-    'bonner/owner',
-    'bonners',
-    'bonnerstrasse',
-    'bonnesoeur',
-    'bonnet-lid',
-    'bonnet-like',
-    'bonnet.',
-    'bonneti&egrave;re',
-    'bonnett',
     'bonneuil',
-    'bonneuil/marne',
-    'bonnevie',
-    'bonnheure',
-    'bonni',
-    'bonnichsen',
-    'bonniere',
-    'bonniers',
-    'bonnieux',
-    'bonnke',
-    'bonnymuir',
-    'bonnyrigg/newtongrange',
-    'bonnyton',
-    'bononian',
-    'bonosa',
-    'bonrepaux',
     'bonsais',
-    'bonser-philhower',
-    'bonsford',
-    'bonsor/committee',
-    'bonstelle',
-    'bonsu',
-    'bontages',
-    'bontddu',
-    'bontje',
-    'bontnewydd',
-    'bontron',
-    'bonus-earnings',
-    'bonus-wise',
-    'bonus/commission',
-    'bonus/prizes',
-    'bonuses.already',
     'bonusing',
-    'bonussed',
-    'bonvillian',
-    'bonxie',
-    'bony-jawed',
-    'bony-plated',
-    'bony-skinned',
-    'bonytt',
-    'bonz',
-    'bonzai',
-    'bonzanna',
-    'bonzer',
-    'bonzes',
-    'bonzieeed',
-    'boo&ndash',
-    'boo-boo-boo-boom',
     'boo-hooing',
-    'boo-word',
-    'boobok',
-    'booboo',
-    'boobs/knockers/charlies/tits',
-    'booby-trapping',
-    'boobycharges',
-    'boobytrap',
-    'boobytrapgreeting',
-    'boobytrapped',
-    'booch',
-    'boode',
-    'boodles',
-    'boodlesniff',
-    'booga-booga',
-    'boogaloo',
     'booger',
-    'boogie-',
-    'boogie-meal',
-    'boogie-musicians',
-    'boogieman',
-    'boogying',
-    'booh',
-    'booi',
-    'boojum',
-    'book&rehy;distributive',
-    'book&rehy;keeper',
-    'book&rehy;stores',
-    'book\'',
-    'book-a-year',
-    'book-albeit',
-    'book-bank',
     'book-barrows',
-    'book-bills',
-    'book-bindings',
-    'book-breakers',
-    'book-clubs',
-    'book-copying',
-    'book-cube',
-    'book-cum-record',
-    'book-dealers',
-    'book-despoiler',
-    'book-destroyers',
-    'book-ending',
-    'book-ends',
-    'book-entries',
-    'book-entry',
-    'book-established',
     'book-fetchers',
-    'book-fetching',
-    'book-finding',
-    'book-focused',
-    'book-holding',
-    'book-hungry',
-    'book-illustrating',
-    'book-illustration',
-    'book-in-advance',
-    'book-in-hand',
-    'book-jackets',
-    'book-judges',
-    'book-keeper/administrator',
-    'book-knowledge',
-    'book-label',
-    'book-laden',
     'book-lover',
-    'book-lovers',
-    'book-loving',
-    'book-maker',
-    'book-makers',
-    'book-making',
-    'book-market',
-    'book-matches',
-    'book-nourished',
-    'book-of-hours',
-    'book-on',
-    'book-productive',
-    'book-provision',
-    'book-rack',
-    'book-review',
-    'book-reviewers',
     'book-reviewing',
-    'book-reviews',
-    'book-sales',
-    'book-satchel',
-    'book-sellers',
-    'book-selling',
-    'book-shelf',
-    'book-shelves',
-    'book-shrines',
-    'book-sorter',
-    'book-stacks',
-    'book-stall',
-    'book-stalls',
-    'book-stamps',
-    'book-stand',
-    'book-stores',
     'book-strewn',
-    'book-the',
-    'book-ticket',
-    'book-topic',
-    'book-type',
-    'book-value',
-    'book-writing',
-    'book.',
-    'book.you',
-    'book/bedtime',
-    'book/cassette',
-    'book/chapter/pamphlet/',
-    'book/library',
-    'book/newspaper',
-    'book/show/film/affair',
-    'bookbindery',
     'bookbuyers',
-    'bookcentre',
-    'bookcovers',
-    'bookdealer',
-    'booked-out',
-    'booked/sent',
-    'bookend',
-    'bookending',
-    'booker-millburn',
-    'booker-nominated',
-    'bookering',
-    'bookie/snake-oil',
-    'bookin',
-    'booking-clerk',
-    'booking-halls',
-    'booking-offices',
     'booking-out',
-    'bookish-looking',
-    'bookishness',
-    'bookk',
-    'bookking',
-    'bookless',
-    'booklet-notes',
-    'bookline',
-    'bookmakers-sponsored',
-    'bookman\'',
-    'bookmarts',
-    'bookmobiles',
-    'bookpublication',
-    'bookrest',
-    'books&mdash',
-    'books&mdash;there',
     'books&ndash',
-    'books*',
-    'books-',
-    'books-on-a-disk',
-    'books/journals',
-    'books/manuals',
-    'books/newspapers',
-    'booksafe',
-    'booksales',
-    'bookscan',
-    'booksellers.',
-    'booksellers.the',
-    'bookshoe',
-    'bookshops.',
-    'bookspeed',
-    'bookstands',
     'bookstore/poster',
-    'booksy',
-    'booktree',
-    'booktrust',
-    'boolean.',
-    'booler',
-    'booligal',
-    'bools',
-    'boom-',
-    'boom-and-slump',
-    'boom-ba-di-boom',
-    'boom-bang-a-bang-booooooom',
-    'boom-chi',
-    'boom-chi-boom',
-    'boom-chi-boom-chi-boom-chi-boom-chi',
-    'boom-hoom-hoom',
     'boom-induced',
-    'boom-led',
-    'boom-to-bust',
-    'boom-type',
-    'boom.',
-    'boomer/incident',
-    'boomerang-like',
-    'boomfood',
-    'boomiest',
-    'boominess',
-    'boomph',
-    'boomshanka',
-    'boomz',
-    'boon-doggle',
-    'boon-ish',
-    'boon-style',
     'boon/harlequin',
-    'boon/managing',
-    'boond',
-    'boondatoon',
-    'boondocks',
-    'boonies',
-    'boonoonoonoos',
-    'boonpanya',
-    'boonpong',
-    'boonsithi',
-    'boonsri',
-    'boonwork',
-    'boooo',
-    'boooo-ring',
-    'booooooom',
-    'booooooommmwomp',
     'booooooooooo',
-    'boop-boop-boop',
-    'boop.',
-    'boops',
-    'boord',
-    'boorde',
-    'boorer',
-    'booring',
-    'boorman/dietician',
-    'boosback',
-    'booseys',
-    'boost-regulated',
-    'booster/turbo',
-    'boosting/cutting',
-    'boot&rehy;strapping',
-    'boot-bindings',
     'boot-blacks',
-    'boot-boys',
-    'boot-clad',
-    'boot-cleaning',
-    'boot-closer',
-    'boot-crusher',
-    'boot-deep',
-    'boot-faced',
-    'boot-full',
-    'boot-heel',
-    'boot-iful',
-    'boot-in',
-    'boot-lace',
-    'boot-leather',
-    'boot-legs',
-    'boot-maker',
     'boot-makers',
-    'boot-marks',
-    'boot-polished',
-    'boot-prints',
-    'boot-repairers',
-    'boot-sales',
-    'boot-shaped',
-    'boot-sprigs',
-    'boot-studs',
-    'boot-tapping',
-    'boot-time',
-    'boot-toe',
-    'boot-top',
-    'boot-worn',
-    'bootbrush',
-    'boote',
     'bootee-style',
-    'bootface',
-    'bootful',
-    'booth-fighting',
-    'booth/bookseller',
-    'booth/director/oxford',
-    'booth/john',
-    'booth/vice-chanchellor',
-    'boothbay',
-    'boothim',
-    'boothroyd/speaker',
-    'boothroydists',
-    'boothville',
-    'bootle-wilbraham',
-    'bootlegging/piracy/counterfeiting',
-    'bootless',
     'bootlicking',
-    'bootlid',
-    'bootling',
-    'bootload',
-    'bootmaking',
-    'booton',
-    'bootpacking',
-    'boots/and',
-    'boots/socks',
-    'bootscraper',
-    'bootscrapers',
-    'bootsen',
-    'bootsoles',
-    'bootson',
-    'bootsteps',
-    'bootstrapped',
     'bootstrappers',
-    'bootstring',
-    'booty-type',
-    'booz-allan',
-    'booze\'n\'barbiturates',
-    'booze-driven',
-    'booze-induced',
-    'booze.',
-    'boozery',
-    'boozes',
-    'boozey',
-    'boozier',
-    'boozily',
-    'booziness',
-    'boozing-shops',
-    'boozler',
     'boozums',
-    'bop-derived',
-    'bopeep',
-    'bophutatswna',
-    'boppelagriculture',
-    'bopromoxol',
-    'bopsy',
-    'bopurgois',
-    'boputhatswana',
-    'bopx',
-    'boquer&oacute;nes',
-    'bor-ring',
-    'bor/consultant',
-    'borac',
-    'boraceva',
-    'borachio',
     'borak',
-    'boram',
-    'boras',
-    'borassus',
-    'boratto',
-    'borbe',
-    'borbely',
-    'borbone',
-    'borborygmus',
-    'borcham',
-    'borchgrevinki',
-    'borck',
-    'borcke',
-    'bordado',
-    'bordados',
-    'bordan',
     'bordas',
-    'bordeaux-la',
-    'bordeaux-merignac',
-    'bordeaux-paris',
-    'bordeaux/plum',
-    'bordel',
-    'bordelaises',
-    'bordellos',
-    'border&rehy;formalities',
-    'border\'',
-    'border-border',
-    'border-controls',
-    'border-crosser',
-    'border-crossers',
-    'border-crossings',
-    'border-dwellers',
     'border-folk',
-    'border-goer',
-    'border-guards',
-    'border-line',
-    'border-lines',
-    'border-officials',
-    'border-wars',
-    'border-work',
-    'border-zone',
-    'bordereaux',
-    'borderin\'',
-    'borderline-case',
-    'borders.for',
-    'borderwidth=3',
-    'bordes-type',
-    'bordesly',
     'bordetella',
-    'bordez',
-    'bordier',
-    'bordieu',
-    'bordin',
-    'bordj',
-    'bordl',
-    'bordland',
-    'bordley',
-    'bordolo',
-    'bords',
-    'borduas',
-    'bordwell',
-    'bore&mdash;that',
-    'bore&rehy;dom',
-    'bore\'',
     'bore-',
-    'bore-ins',
-    'bore-minded',
-    'bored-looking',
-    'bored-o-meter',
-    'boredly',
-    'boredom-relieving',
-    'boreens',
-    'borehold',
-    'borehole-flow',
-    'boreholing',
-    'borellii',
-    'boreogadus',
-    'boreonymphon',
-    'boresford',
-    'boresome',
     'boretius',
-    'borey',
-    'borford',
-    'borg/imperial',
-    'borgas',
-    'borgerhoff-mulder',
-    'borghi',
-    'borghs',
-    'borgi',
-    'borgioli',
-    'borgis',
-    'borgnine',
-    'borgogna',
-    'borgonovo',
-    'borgue',
-    'borgus',
     'borham',
-    'borhanoddin',
-    'borhanuddin',
-    'borhausen',
-    'bori',
-    'borichill',
-    'bories',
-    'boring&rehy;bit',
-    'boring-but-sometimes-funny',
-    'boring-my',
-    'boring-set',
-    'boring-sounding',
-    'boring/unhumourous',
-    'boringest',
-    'borisov',
-    'boristan',
     'borja-villel',
-    'borkel-en-schaft',
-    'borken',
-    'borkenau',
-    'borkh',
-    'borland/martin',
-    'borle',
-    'borlick',
-    'borm-reid',
-    'bormanis',
-    'bormuth',
-    'born&rehy;again',
-    'born-',
-    'born-again\'',
-    'born-agains',
-    'born-oppenheimer',
     'born-or-bred',
-    'born-rich',
-    'born-squalid',
-    'born.joshua',
-    'born/hatched',
-    'born:otley',
-    'bornat',
-    'borneo-based',
-    'borner',
-    'borners',
-    'borness',
-    'bornet',
-    'bornfreund',
-    'bornier',
-    'borning',
-    'borns',
     'bornschier',
-    'bornu',
-    'boro\'',
-    'borobudhur',
-    'boroevi&cacute',
-    'borogon',
-    'borogravian',
-    'boroko',
-    'boroma',
-    'boron-graphite',
-    'borondy',
-    'borooah',
-    'bororos',
-    'boroscopes',
-    'borosilicate',
-    'borouch',
     'borough-reve',
-    'borough-specific',
-    'borough/district',
-    'boroughmuir.',
-    'boroughs.',
-    'borova',
-    'borovac',
-    'borovets',
-    'borovicka',
-    'borovik',
-    'borovits',
-    'borow',
-    'borr',
-    'borrachos',
-    'borradaile',
-    'borrani',
     'borrego',
-    'borrel',
-    'borrell',
-    'borrelli',
-    'borrered',
-    'borringdon',
-    'borrman',
-    'borrobol',
-    'borromeus',
-    'borroughs',
-    'borrow.',
-    'borrow/beg/steal',
-    'borrowed/lexicographer/current',
-    'borrower\'',
-    'borrower-governments',
-    'borrowing-requirement',
     'borrowing/lending',
-    'borrowings.',
-    'borruso',
-    'borry',
-    'bors',
-    'borsay',
-    'borscht-belt',
-    'borseholders',
-    'borsello',
-    'borsholders',
-    'borsman',
-    'borso',
-    'borst-smith',
-    'borstorffer',
-    'bort',
-    'bortaceva',
     'borthalogically',
-    'borthers',
-    'borthwicks',
-    'bortier',
-    'bortnyansky',
-    'bortnyik',
-    'bortolazzi',
-    'bortolotti',
-    'borujerdi',
-    'borusewicz',
-    'borussian',
-    'borut',
-    'borve',
-    'borwitzky',
-    'borz',
-    'borzacchini',
     'bos-combe',
-    'bosan&ccaron;ica',
-    'bosanka',
-    'bosanka-krupa',
-    'bosanki-petrovac&mdash;in',
-    'bosanquets',
-    'bosavern',
-    'bosberry',
-    'bosbury',
-    'bosc',
-    'boscaglia',
-    'boscarhyn',
-    'boscarne',
-    'bosch-like',
-    'bosch-made',
-    'bosch/blaupunkt',
     'bosch/northern',
-    'bosche',
-    'boschek',
-    'boschervilles',
-    'boschian',
-    'boscoe',
-    'boscoli',
-    'boscom',
-    'boscoreale',
-    'boscotrecase',
-    'boscovich',
-    'boscq',
-    'boscubban',
-    'boscuen',
-    'bosevski',
-    'bosha',
     'boshall',
-    'boshed',
-    'bosher',
-    'bosher/gamekeeper',
-    'bosher/stolen',
-    'boshintang',
-    'boshoff',
-    'bosian',
-    'bosians',
-    'bosigran/sennen',
-    'bosiljevac',
-    'bosinney',
-    'bosinoski',
-    'bosk',
-    'bosket',
-    'boskop',
     'boskovich',
-    'bosnawi',
-    'bosnia-hercevgovina',
-    'bosnia-hercogovina',
-    'bosnia-herzegovinia',
-    'bosnia-hzercegovina',
-    'bosnian-born',
-    'bosnian-croatian',
-    'bosnian-muslim',
-    'bosnian-serbs',
-    'bosnias',
-    'bosola',
-    'bosom-buddies',
-    'bosom-friend',
-    'bosom-heaving',
-    'bosom-thrusting',
     'bosom.',
-    'bosomes',
-    'bosominess',
-    'bosongo',
-    'boss-',
-    'boss-boy',
-    'boss-eye',
-    'boss-follower',
-    'boss-i',
-    'boss-subordinate',
-    'boss-wren',
-    'boss/boxing',
-    'boss/have',
-    'boss/pa',
-    'boss/subordinate',
-    'bossage',
     'bossau',
-    'bosschen',
-    'bossen',
-    'bosses&mdash;call',
-    'bosses-but',
-    'bosses:the',
-    'bosseworth',
-    'bossington',
-    'bosslet',
-    'bossom',
-    'bossuet',
-    'bossunga',
-    'bostall',
-    'bostan-al-amarah',
-    'bostan/susangerd',
-    'bostanzade',
     'bostg',
-    'bostik-',
-    'bostin\'',
-    'bostock-smith',
-    'boston&ndash;new',
-    'boston-born',
-    'boston-irish',
-    'boston-quay',
-    'boston/',
-    'bostoniensis',
-    'bosullow',
-    'bosvigo',
-    'bosvil',
-    'bosville',
-    'bosvilles',
-    'boswednack',
     'boswel',
-    'boswell/union',
-    'boswells-kelso-tweedmouth',
-    'boswelly',
-    'boswith',
-    'boswood',
-    'bosworth-toller',
-    'bosworth.',
-    'bosworth/physiotherapist',
-    'bosworths',
-    'bot&rehy;tome',
-    'bot\'er',
-    'bot-bot',
-    'bot-fly',
-    'bot.',
-    'botanica',
     'botanical-style',
-    'botanicas',
-    'botanicks',
-    'botanico',
-    'botanicum',
-    'botanise',
-    'botanised',
-    'botanist-companion',
-    'botanist.',
-    'botanizing',
-    'botanomancy',
-    'botantic',
-    'botargo',
-    'botas',
-    'botbs',
-    'botch-job',
     'botcha',
-    'botched-job',
-    'botched-up',
-    'botchway',
-    'botchwork',
-    'bote',
-    'botehs',
-    'botek',
-    'boteleur',
-    'botelho',
-    'botende',
-    'boter',
-    'boterel',
-    'botering',
-    'boteti',
-    'botetourt',
     'botez',
-    'botfield',
-    'both&mdash',
-    'both&mdash;yet',
-    'both-and',
-    'both.l',
-    'both/and',
-    'bothem',
-    'bother-headed\'',
-    'bothered_so_long',
-    'botherim',
-    'bothers.',
-    'botherway',
-    'bothrio',
-    'bothriocephalus',
-    'bothriolepis',
     'bothriomyrmex',
-    'bothun',
-    'bothwellbank',
-    'bothwellbridge',
-    'bothy-dwellers',
-    'bothy/',
-    'boticelli',
-    'botiller',
-    'botin',
-    'botna',
-    'botolph-without-aldersgate',
-    'botom',
-    'botomian',
-    'botoms',
-    'botony',
-    'botorok',
     'botryoides',
-    'botrytis-affected',
-    'botrytised',
-    'botshabelo',
-    'botsy',
-    'bott&eacute',
-    'bottae',
-    'bottem',
-    'botter',
-    'botterill/allsport',
-    'botterills',
-    'botters',
-    'bottes',
-    'bottesford',
-    'bottesford-newark',
-    'bottesini',
     'botties',
-    'bottiger',
-    'bottighofen',
-    'bottineau',
-    'bottl',
-    'bottla',
-    'bottle&rehy;nose',
-    'bottle-bashers',
-    'bottle-basket',
-    'bottle-battles',
-    'bottle-blonde',
-    'bottle-buyer',
-    'bottle-covers',
-    'bottle-dungeon',
-    'bottle-end',
-    'bottle-ette',
     'bottle-feeds',
-    'bottle-fight',
-    'bottle-fights',
-    'bottle-garden',
-    'bottle-loaded',
-    'bottle-nose',
-    'bottle-palms',
-    'bottle-rather',
-    'bottle-recycling',
-    'bottle-scarred',
-    'bottle-stores',
-    'bottle-throwing',
-    'bottle-type',
-    'bottle-up',
-    'bottle-walled',
-    'bottlebank',
     'bottlebuyer',
-    'bottled-conditioned',
-    'bottled-in',
-    'bottled-in-scotland',
-    'bottlefield',
-    'bottleful',
-    'bottleneck/growth-cycle',
-    'bottles-',
-    'bottles-of-piss',
-    'bottlesham',
-    'bottley',
-    'bottom-crawlers',
-    'bottom-fermented',
-    'bottom-fishing',
-    'bottom-growing',
-    'bottom-lurking',
     'bottom-most',
-    'bottom-of-the-pile',
-    'bottom-of-the-range',
-    'bottom-pinching',
-    'bottom-rate',
-    'bottom-right',
-    'bottom-slippering',
-    'bottom-spanking',
-    'bottom-swimming',
-    'bottom-to-top',
-    'bottom-up.',
-    'bottom-upwards',
-    'bottom-use',
-    'bottom-water',
-    'bottom-wrappers',
-    'bottom.',
     'bottom_in',
-    'bottomley/head',
-    'bottomley/health',
-    'bottomley/trainer',
-    'bottomline',
-    'bottomly',
-    'bottommost',
-    'bottoms-up',
-    'bottomset',
-    'bottomspins',
-    'bottomsup',
-    'bottomup\'',
-    'bottrall',
-    'bottrell',
-    'bottrill',
-    'botts',
     'bottura',
-    'bottura/dexter',
-    'botulf',
-    'botulism.experts',
-    'botur',
-    'botvay',
-    'botwright',
-    'bou-arreridj',
-    'bou-bou',
-    'boualapha',
-    'boualem',
-    'bouamoud',
-    'bouaziz',
-    'boube',
-    'bouberc',
-    'boublik',
     'bouc',
-    'bouchalov',
-    'bouchant',
-    'bouchardhealth',
-    'bouchardon',
-    'boucher/british',
-    'boucher/hereford',
-    'bouchereau',
-    'boucheresque',
-    'bouches',
-    'bouches-du-rh&circ;one',
-    'bouches-du-rh&ocirc;ne',
-    'bouches-du-rhone',
-    'boucho',
-    'bouchoucha',
-    'boucicaut',
     'boucing',
-    'bouckaert',
-    'boucl&eacute;s',
-    'boucot',
-    'bouda',
-    'boudec',
-    'boudiccan',
-    'boudicea',
-    'boudins',
-    'boudjelal',
-    'boudoir-church',
-    'boudon',
-    'boudouresque',
-    'bouer',
-    'boufarik',
-    'bouffan',
     'bouffantish',
-    'bouffe',
-    'bouftas',
-    'bougainvillaea-covered',
-    'bougainvillaea-fringed',
-    'bougard',
-    'bougatsa',
-    'bougeoisie',
-    'bougets',
-    'bougette',
-    'bougherton/sunday',
-    'boughing',
-    'bought-and-paid-for',
-    'bought-back',
-    'bought-deal',
-    'bought/rented',
     'bought/sold',
-    'boughta',
-    'bougie',
-    'bougienage',
-    'bouguereaus',
-    'bouiali-see',
-    'bouille',
-    'boujdour',
-    'boukheir',
-    'boukhima',
-    'boukhreiss',
-    'boulac',
-    'boulang&egrave;re',
-    'boulangere',
-    'boulangeries',
-    'boulangist',
     'boulangists',
-    'boulay',
-    'boulbine',
-    'boulden',
-    'boulder-based',
-    'boulder-filled',
-    'boulder-hopped',
-    'boulder-lumped',
-    'boulderchoked',
-    'boulderers',
-    'boulderous',
-    'boulengerochromis',
-    'boules-eye',
-    'boulestln',
-    'boulevardier',
-    'boulevers&eacute',
     'bouleversed',
-    'boulia',
-    'boulingrin',
-    'boulis',
-    'boulkheir',
-    'boull&egrave;e',
-    'boullin',
-    'bouloir',
-    'bouloulou',
-    'boult-like',
-    'boultham',
-    'boulting/film',
-    'boulton/coach',
-    'boulton/k',
-    'bouma',
-    'boumer',
     'boumerda',
-    'bounce-free',
-    'bounce-it-off-the',
-    'bounce-lighting',
-    'bouncer&rehy;restriction',
-    'bouncer-happy',
-    'bouncin\'',
-    'bouncing/stretching',
-    'bouncingly',
-    'bouncings',
-    'bound-dna',
-    'bound-for-glory',
-    'bound-in',
-    'bound-mg',
-    'bound-up',
-    'bound/border',
     'bound/milton',
-    'boundar',
-    'boundaries.in',
-    'boundaries/room',
-    'boundary&rehy;stone',
-    'boundary\'',
-    'boundary-blurring',
-    'boundary-fixing',
-    'boundary-recognizing',
-    'boundary-stones',
-    'boundary-transgressing',
-    'boundes',
-    'boundis',
-    'boundries',
-    'boundstone',
-    'bouneau',
     'bounkoulou',
-    'bounnaphon',
-    'bounty-hunting',
-    'bountys',
-    'bouquet-making',
-    'bouqueted',
-    'bouquinistes',
-    'bourajnee',
-    'bourbaki',
-    'bourbon-habsburg',
-    'bourbon-type',
-    'bourboulenc',
-    'bourdeaux',
-    'bourdeilles',
-    'bourdes-ogouliguende',
-    'bourdeux',
     'bourdillo',
-    'bourdj',
-    'bourdons',
-    'boure',
-    'boureima',
-    'bourg-de-four',
-    'bourgas',
-    'bourgd\'oisans',
-    'bourgeau',
-    'bourgeaud',
-    'bourgeois-led',
-    'bourgeoised',
-    'bourgeoisie\'',
-    'bourgeoisie-relied',
-    'bourgeoisie.14',
-    'bourgeot',
     'bourgeouisie',
-    'bourgeousie',
-    'bourget-drancy',
-    'bourginion',
-    'bourgneuf',
-    'bourgoing',
-    'bourguina',
-    'bourhis',
-    'bourje',
-    'bourjolly',
-    'bourman',
-    'bourmont',
-    'bourne&rehy;mouth',
-    'bourne-mouth',
-    'bourne-wilkinson',
-    'bourne/headmaster',
     'bourne/lawler',
-    'bournemouth-based',
-    'bournemouth-hurn',
-    'bournesports',
-    'bournmouth',
-    'bournous',
-    'bourns',
-    'bournton',
-    'bourouba',
-    'bourough',
-    'bourr&eacute;es',
-    'bourreurs',
-    'bourri',
-    'bourry',
-    'bours',
-    'boursidi&egrave;re',
     'bourson',
-    'boursoufler',
-    'bourton&rehy;on-the-water',
-    'bourton-on-the-water/gloucestershire',
-    'bourton/oxfordshire',
-    'bouscade',
-    'bouse',
-    'bousiris',
-    'bousnina',
-    'bousquel',
-    'boussa',
-    'bousset',
-    'boussey',
-    'boussod-valadon',
-    'boustany',
-    'bousted',
     'bouston',
-    'bouston/farmer',
-    'boutades',
-    'boutboul',
-    'bouteflika',
-    'bouteilles',
-    'bouteillier',
-    'bouteloua',
-    'boutique/souvenir',
-    'boutiques.',
-    'boutoir',
-    'boutonn&eacute',
-    'boutonne',
-    'boutons',
-    'boutos',
-    'boutron-charland',
     'boutros-',
-    'boutros-boutros',
-    'boutros-gahli',
-    'boutruche',
-    'boutu',
-    'bouvet-ladubay',
-    'bouvia',
-    'bouvy',
-    'bouw',
-    'bouwes',
-    'bouyiki',
-    'bouzah',
-    'bouzi',
-    'bouziane',
-    'bouzid',
-    'bouzigues',
     'bovair',
-    'bovaird',
-    'bovarian',
-    'bovell/coach',
-    'boven',
-    'bovill',
-    'bovine-eyed',
-    'bovinely',
-    'bovingford',
-    'bovrils',
-    'bovumin',
-    'bovver-',
-    'bovverin\'',
-    'bovy',
-    'bow&lsqb;ed&rsqb',
-    'bow&rehy;tie',
     'bow*',
-    'bow-backed',
-    'bow-case',
-    'bow-down',
-    'bow-drills',
-    'bow-end',
-    'bow-first',
-    'bow-grip',
-    'bow-like',
-    'bow-maker',
-    'bow-ride',
-    'bow-shock',
-    'bow-shot',
-    'bow-tie-',
-    'bow-tiful',
-    'bow-tip',
     'bow-to',
-    'bow-up',
-    'bow-waves',
-    'bow-window',
-    'bowan',
-    'bowart&rehy;using',
-    'bowbridge',
-    'bowcliffe',
-    'bowcock',
-    'bowd/amersham',
-    'bowd/aylesbury',
-    'bowd/bicester',
-    'bowd/bletchley',
-    'bowd/bloxham',
-    'bowd/bodenham',
-    'bowd/brize',
     'bowd/cote',
-    'bowd/crowmarsh',
-    'bowd/didcot',
-    'bowd/hampton',
-    'bowd/heathrow',
-    'bowd/isleworth',
-    'bowd/kidlington',
-    'bowd/leeds',
-    'bowd/raf',
-    'bowd/sandford',
-    'bowd/sandford-on-thames',
-    'bowd/shrivenham',
-    'bowd/southmoor',
-    'bowd/stanford',
-    'bowd/upper',
-    'bowd/upton',
     'bowd/wallingford',
-    'bowd/wargrave',
-    'bowd/watchfield',
-    'bowd/westonbirt',
-    'bowd/widford',
-    'bowd/woodford',
-    'bowdendale',
-    'bowdentii',
-    'bowdlerising',
-    'bowdlerize',
-    'bowdy',
-    'bowe-baiting',
-    'bowe-holyfield',
-    'bowe-lewis',
-    'bowed-and-upright',
-    'bowel-emptying',
     'bowel-loosening',
-    'bowel-looseningly',
-    'bowel-opening',
-    'bowel-quaking',
-    'bowel-regulating',
-    'bowel-related',
-    'bowel-wall',
-    'bowell',
-    'bowen-pope',
-    'bowen-webb',
-    'bowen/carer',
-    'bowen/presenter',
-    'bowenhill',
-    'bowenoid',
-    'bowens',
-    'bowens-sung',
     'bowenscourt',
-    'bower\'',
-    'bower\'\'',
-    'bower-bird.',
-    'bower-boiling',
-    'bower-building',
-    'bowerchalk',
-    'bowerdean',
-    'bowerham',
-    'boweri',
-    'bowers/deaton/turk',
-    'bowesy-bente',
-    'bowey/eye',
-    'bowfins',
-    'bowgie',
-    'bowgreen',
     'bowhaple',
-    'bowheads',
-    'bowhill/managing',
-    'bowie\'',
-    'bowie-fandom',
-    'bowie-like',
-    'bowier',
-    'bowiesque',
-    'bowings',
-    'bowl\'',
-    'bowl-head',
-    'bowl-headed',
-    'bowl-heads',
-    'bowl-room',
-    'bowl-sterilizer',
-    'bowl-type',
     'bowl-winning',
-    'bowl/servers',
-    'bowla/floor',
-    'bowlarama',
-    'bowleaze',
-    'bowler\'',
-    'bowler-style',
-    'bowler/mother',
-    'bowler/swan',
-    'bowler/thames',
-    'bowlerhatted',
-    'bowlers.',
-    'bowles.',
-    'bowles/kit',
-    'bowlesland',
-    'bowley/oxfordshire',
     'bowleymead',
-    'bowlfish',
-    'bowlhead',
-    'bowline',
-    'bowlines',
-    'bowling-alley',
-    'bowling-green',
-    'bowly',
-    'bowman/reporting',
-    'bowmans',
-    'bowmer',
-    'bowmonde',
-    'bown/chairman',
-    'bownde',
-    'bowsaw',
-    'bowsers',
     'bowshell',
-    'bowshots',
-    'bowsprit-fashion',
-    'bowsprits',
-    'bowstave',
-    'bowstem',
-    'bowtell/torpy',
-    'bowthruster',
-    'bowtie',
-    'bowvale',
-    'bowys',
-    'bowzer',
-    'box&mdash;in',
-    'box-',
-    'box-ad',
-    'box-arrow',
     'box-barrage',
-    'box-beds',
-    'box-carrying',
-    'box-cars',
-    'box-chairs',
-    'box-compass',
-    'box-edged',
-    'box-flues',
-    'box-folds',
-    'box-full',
-    'box-girder',
-    'box-hedge',
-    'box-ing',
-    'box-jellies',
-    'box-just',
-    'box-leafed',
     'box-load',
-    'box-maker',
-    'box-message',
-    'box-off',
-    'box-offices',
-    'box-out',
-    'box-pleated',
-    'box-rooms',
-    'box-shape',
-    'box-shifter',
-    'box-spanner',
-    'box-sprung',
-    'box-stalls',
-    'box-stick-and-banana',
-    'box-swap',
-    'box-tickers',
     'box-ticking',
-    'box-tomb',
-    'box-type',
-    'box-walking',
-    'box-within-a-box',
-    'box-wood',
-    'box.one',
-    'box/block',
-    'box/english',
-    'box/hype',
-    'box/lozenge',
-    'box/vase',
-    'box3',
-    'boxall/brenda',
-    'boxboard',
-    'boxborough',
     'boxell',
-    'boxer-puncher',
-    'boxer-shorts',
-    'boxer-versus-puncher',
-    'boxfile',
-    'boxfront',
-    'boxfuls',
-    'boxgrove',
-    'boxhall/road',
-    'boxhill',
-    'boxiana',
-    'boxier',
-    'boxin',
-    'boxin\'.',
-    'boxiness',
-    'boxing-booth',
     'boxing-champion',
-    'boxing-glove',
-    'boxing-gloves',
-    'boxing-lesson',
-    'boxing-matches',
-    'boxing-programmes',
-    'boxing-ring',
-    'boxing-type',
-    'boxkites',
-    'boxload',
-    'boxmen',
-    'boxrooms',
-    'boxshifters',
-    'boxwell',
-    'boxwoods',
-    'boy&eacute',
     'boy&rehy;land',
-    'boy\'\'',
-    'boy\'z',
-    'boy-',
-    'boy-and-his-dog',
-    'boy-babies',
-    'boy-ban',
-    'boy-genius',
-    'boy-girl&rehy;siren',
-    'boy-god',
-    'boy-gunner',
-    'boy-hero',
-    'boy-his',
-    'boy-lance-corporal',
-    'boy-like',
-    'boy-outfitted',
     'boy-outsider',
-    'boy-preacher',
-    'boy-producing',
-    'boy-proof',
-    'boy-racer',
-    'boy-rescue',
-    'boy-scoutish',
-    'boy-servant',
-    'boy-soldier',
-    'boy-soldiers',
-    'boy-something',
-    'boy-to-alien',
-    'boy-who-was-shaman',
-    'boy-word',
-    'boy/',
-    'boy/girl-friend',
     'boy/girlfriends',
-    'boy_as',
-    'boyac',
-    'boyac&aacute',
-    'boyack',
-    'boyan',
-    'boyant',
-    'boyarskaya',
-    'boyau',
-    'boyce-codd',
-    'boyce/reuter',
-    'boyces',
-    'boychik',
-    'boychuk',
-    'boycott.',
-    'boycott/b.l',
     'boycott/b.w',
-    'boycott/free-produce',
-    'boycs',
-    'boyd-rochfort',
-    'boyd/airman',
-    'boyd/presenter',
-    'boyd/technical',
-    'boyda',
-    'boyde',
-    'boydfield',
-    'boyest',
-    'boyett',
-    'boyez',
-    'boyf',
-    'boyfriend-wise',
-    'boyfriend.',
     'boyfriend/boss',
-    'boyhill',
-    'boyish-looking',
-    'boyits',
-    'boyland/lollipop',
-    'boyle.',
-    'boyle/banbury',
-    'boyle/doctors',
-    'boyle/family',
-    'boylesk',
-    'boylil',
-    'boyns',
-    'boyo\'',
-    'boyo-larrikin-rugby-skiving',
-    'boyoing',
-    'boypower',
     'boys\'-own',
-    'boys\'n\'toys',
-    'boys-',
-    'boys-only',
-    'boys-own',
-    'boys-produced',
-    'boys-stones',
-    'boys-together',
-    'boys.remittance',
-    'boys/',
-    'boys/guys/mates',
-    'boys/men',
-    'boys/neil',
-    'boys:four',
-    'boys_for',
-    'boysenberries',
     'boyston/customer',
-    'boystones',
-    'boystown',
-    'boyt',
-    'boythorn',
-    'boyu',
-    'boza-edwards',
-    'bozberg',
-    'bozeat',
-    'bozetti',
-    'bozionek',
-    'bozkurt',
-    'bozon',
-    'bozouki',
-    'bozson',
-    'bozza',
     'bozzi',
-    'bp*',
-    'bp-alaska',
-    'bp-alliance',
-    'bp-bonded',
-    'bp-donated',
-    'bp-shell',
-    'bp-sponsored',
-    'bp-statoil',
-    'bp/br',
-    'bp/number',
-    'bp/sohio',
-    'bp/turn',
-    'bp10',
-    'bp552346526',
-    'bp552346550',
     'bp552346563',
-    'bp552346581',
-    'bp552346587',
-    'bp552346595',
-    'bp552346599',
-    'bp552346601',
-    'bp552346605',
-    'bp552346607',
-    'bp552346636',
-    'bp552346639',
-    'bp552346642',
-    'bp552346655',
-    'bp552346657',
-    'bp552346669',
-    'bp552346677',
-    'bp552346686',
     'bp552346691',
-    'bp552346712',
-    'bp552346713',
-    'bp552346736',
-    'bp552346761',
-    'bp552346775',
-    'bp552361497',
-    'bp552361620',
-    'bpamerica',
-    'bpas',
-    'bpca',
-    'bpcc-sponsored',
-    'bpdal',
-    'bpgroup',
-    'bph',
-    'bphils',
     'bpic',
-    'bpl',
-    'bpo/furtwangler',
-    'bpo/giulini',
-    'bpo/haitink',
-    'bpo/maazel',
-    'bppppprrrrrr',
-    'bppt',
-    'bpq',
-    'bprs',
-    'bps/macmillan',
-    'bpught',
-    'bput',
-    'bpvenezuela',
-    'bpx-gom',
-    'bpxcolombia',
     'bpxm-pemex',
-    'bq-123',
-    'bq/l',
-    'bqm',
-    'br&agrave',
-    'br&auml;ndi',
-    'br&eacute;laz',
-    'br&eacute;mond',
-    'br&ecirc;che',
-    'br&egrave;ves',
-    'br&iacute;zola',
-    'br&ouml;nte',
-    'br&uacute',
-    'br&uuml;cke-museum',
-    'br&uuml;cker',
-    'br&uuml;ckners',
     'br&uuml;hl',
-    'br&uuml;innich',
-    'br&uuml;nnichs',
-    'br&uuml;sselerplatz',
-    'br\'er',
-    'br(lmr)',
-    'br(s)',
-    'br(w)',
-    'br-116',
-    'br-built',
-    'br-design',
-    'br-owned',
-    'br-promoted',
-    'br-speak',
-    'br-sponsored',
-    'br/leeds',
     'br/lrt',
-    'br20ms',
-    'br226',
-    'br3',
-    'br364',
-    'br6',
-    'br700',
-    'bra&ndash;ket',
-    'bra-',
-    'bra-burners',
-    'bra-burning',
-    'bra-size',
-    'bra-style',
-    'braaang',
-    'braachit',
-    'braai',
     'braaivleis',
-    'braakin',
-    'braashee',
-    'brabagon',
-    'brabantbark',
-    'brabanters',
-    'brabanterstrasse',
-    'brabantia',
-    'brabants',
-    'brabantsia',
-    'brabanzonen',
-    'brabazon/transport',
-    'brabbin',
-    'brabbs',
-    'braben',
-    'brabham-bmw',
     'brabham-taming',
-    'brabham-yamaha',
-    'brabham/jaguar',
-    'brabhams',
-    'brabournes',
-    'brabrooke',
-    'bracamonte',
-    'bracati',
-    'bracbiopods',
-    'braccia',
-    'brace-and-a-half',
-    'brace.',
-    'bracefield',
-    'bracelets/necklaces',
-    'bracer',
-    'bracewell-milnes',
     'bracewell-style',
-    'brach',
-    'brachard',
-    'bracher',
-    'bracher/head',
-    'brachers',
-    'brachiales',
-    'brachiaria',
-    'brachiated',
-    'brachioles',
-    'brachiopod-like',
-    'brachsycome',
-    'brachty',
-    'brachury',
-    'brachycephaly',
-    'brachydanio',
     'brachyglottis',
-    'brachygobius',
-    'brachyodanio',
-    'brachyodont',
-    'brachypodium',
-    'brachypomum',
-    'brachyrhnchus',
-    'brachyrhynchus',
-    'brackbill',
-    'bracke',
-    'bracked',
-    'bracken-and-tree',
-    'bracken-battling',
-    'bracken-clothed',
-    'brackened',
-    'brackenfell',
     'brackenshaw',
-    'brackenstown',
-    'bracker',
-    'bracket-five-',
-    'bracket-to',
-    'bracket-to-instrument',
-    'bracket-torches',
-    'brackets.',
-    'bracketted',
-    'bracketville',
-    'brackishly',
-    'brackley/northamptonshire',
-    'brackley/sweetpea',
-    'bracknell-based',
-    'bracknells',
-    'brackness',
     'brackwell',
-    'bracon',
-    'braconid',
-    'brad-stone',
-    'bradano',
-    'bradawn',
-    'bradbeer',
-    'bradbery',
-    'bradburne',
-    'bradbury/solar',
-    'bradcroft',
-    'bradda',
-    'braddan',
-    'braddell',
-    'brade',
-    'braden-harder',
     'braden-kelly',
-    'bradens',
-    'bradewas',
-    'bradford-born',
-    'bradford-liverpool',
-    'bradford/manchester',
-    'bradfordians',
-    'bradfordon-avon',
-    'bradhope',
-    'bradish-ellames',
-    'bradlaugh/besant',
-    'bradlee',
-    'bradleigh',
-    'bradley/firearms',
-    'bradley/merchant',
-    'bradley/p',
     'bradley/scrapyard',
-    'bradley/sharp',
-    'bradocke',
-    'bradon',
-    'bradridge',
-    'bradridge/england',
-    'bradshaigh',
-    'bradshaw/former',
-    'bradshaw/sunday',
-    'bradshawgate',
-    'bradsport',
-    'bradsteet',
-    'bradstow',
-    'bradtec',
-    'brady/forest',
-    'brady/shooting',
     'bradyarrhythmia',
-    'bradyarrhythmias',
-    'bradycardias',
-    'bradymetabolism',
-    'bradyodont',
-    'bradypus',
-    'bradyseism',
-    'brae-head',
-    'braeburn',
-    'braec',
-    'braendlin',
-    'braepark',
-    'braf',
-    'braff',
-    'braffords',
-    'brafield/northamptonshire',
     'brafl.',
-    'bragadocio',
-    'braganca',
-    'bragar',
-    'bragelonne',
-    'braggard',
-    'braggart-blodge',
-    'braggartism',
-    'braggins',
-    'braginsky',
-    'bragman',
-    'bragoli',
-    'brags',
-    'braguinha',
-    'brahams',
-    'brahims',
     'brahmach&amacr;rya',
-    'brahman-&amacr;tman',
-    'brahmanadu',
-    'brahmanas',
-    'brahminic',
-    'brahmis',
-    'braich',
-    'braid-decorated',
-    'braid-reinforced',
-    'braid-trimmed',
-    'braidburn',
-    'braiden',
-    'braider',
-    'braidholm',
-    'braidotti',
-    'braids.',
     'braigh',
-    'braiis',
-    'brailles',
-    'braillon',
-    'brailovsky',
-    'brailu',
-    'braimah',
-    'braimoh',
-    'brain&rehy;crunching',
-    'brain\'s-eye',
-    'brain-4',
-    'brain-acting',
-    'brain-air',
-    'brain-based',
-    'brain-boggler',
-    'brain-bones',
     'brain-box',
-    'brain-boxes',
-    'brain-bruisingly',
-    'brain-cell',
-    'brain-covers',
-    'brain-crushing',
-    'brain-damaging',
-    'brain-drain\'',
-    'brain-ectomy',
-    'brain-fatigue',
-    'brain-fever',
-    'brain-food',
-    'brain-frying',
-    'brain-injury',
-    'brain-just',
-    'brain-matter',
     'brain-mind',
-    'brain-numbers',
-    'brain-pans',
-    'brain-processes',
-    'brain-related',
-    'brain-resonance',
-    'brain-scanner',
-    'brain-shrinker',
-    'brain-sick',
-    'brain-snuff',
-    'brain-strain',
-    'brain-stretching',
-    'brain-surgery',
-    'brain-teasing',
-    'brain-tumour',
-    'brain-wash',
     'brain-waves',
-    'brain-weak',
-    'brain-work',
-    'brain.',
-    'brain/',
-    'brain/principal',
-    'brain/principal/swindon',
-    'brain/right',
-    'brainboxbatterer',
-    'braincases',
-    'braincheese',
-    'brainchildren',
-    'brainchilds',
-    'braindamaged',
-    'braindead',
-    'braindeadchester',
     'brainfuddler',
-    'braingrowth',
-    'brainkiller',
-    'brainless-seconds',
-    'brainlessly',
-    'brains-trust',
-    'brains-with-burnt-butter-salad',
-    'brainstawm',
-    'brainticket',
-    'brainwashes',
-    'brais&eacute',
-    'braise',
-    'braithwell',
-    'brake(s)',
-    'brake-',
-    'brake-disc',
     'brake-drum',
-    'brake-force',
-    'brake-gear',
-    'brake-job',
-    'brake-light',
-    'brake-lining',
-    'brake-pad',
-    'brake-pedal-down',
-    'brake-squealing',
-    'brake-vans',
-    'brake-work',
-    'brake/guard',
-    'brakeless',
-    'brakelights',
-    'brakeloads',
-    'brakemen',
     'brakenbury',
-    'brakhage',
-    'braking-jets',
-    'brakislava',
-    'bralin',
-    'brama',
-    'bramahs',
-    'bramble-filled',
-    'bramble-lined',
-    'brambles.',
-    'bramfitt',
-    'bramha',
-    'bramhald',
-    'bramhanda',
-    'bramimunde',
-    'bramische',
     'bramlett',
-    'brammeier',
-    'brampt',
-    'brams',
-    'bramsford',
-    'bramshott&ndash;liphook&ndash;bordon&ndash;alton',
-    'bramswood',
-    'bramwell\'s.',
-    'bran\'-new',
-    'bran-bin',
-    'bran-like',
-    'branacci',
-    'branaghed',
-    'branaghs',
-    'branbury',
-    'brancaleone',
     'brancaster',
-    'brancatelli',
-    'brancati',
-    'brancepath',
-    'brances',
-    'branch&mdash',
-    'branch-adorned',
-    'branch-by-branch',
-    'branch-derived',
-    'branch-even',
-    'branch-less',
-    'branch-like',
-    'branch-office',
-    'branch-plant',
-    'branch-produced',
-    'branch-shaped',
     'branch-sponsored',
-    'branch-tusked',
-    'branch/department',
-    'branch/division',
-    'branchenfernsprechb&uuml;cher',
-    'branches&mdash;similar',
-    'branchiae',
-    'branchidai',
-    'branchiostoma',
-    'branchlets',
-    'branchlike',
-    'branchship',
-    'branchwood',
-    'branchyomyces',
-    'brand-conscious',
-    'brand-driven',
     'brand-image',
-    'brand-level',
-    'brand-loyalty',
-    'brand-mark',
-    'brand-new(ish)',
-    'brand-related',
-    'brand-spanking-new',
-    'brand.',
-    'branda',
-    'brandable',
-    'brandao',
-    'brandaris',
-    'brande',
-    'branded-goods',
-    'brandeis-bardin',
-    'brandenberger',
     'brandenburg-berlin',
-    'brandenburger',
-    'brandenburgers',
-    'brandenburgicum',
-    'brandenburgs',
-    'brandenstein',
-    'branders',
-    'brandewijn',
-    'branding-iron',
-    'brandini',
-    'brandir',
-    'brandlerites',
-    'brandless',
-    'brandmeier',
-    'brandname',
-    'brando-clift',
     'brandon-jones',
-    'brandos',
-    'brandrood',
-    'brands.',
-    'brands/',
-    'brands/retail',
-    'brandsburton',
-    'brandstrup',
-    'brandtzaeg',
-    'brandwagon',
-    'brandy-and-soda',
-    'brandy-bottle',
-    'brandy-drenched',
-    'brandy-drinking',
-    'brandysnaps',
-    'branfoots',
     'brang',
-    'brang&auml;ne',
-    'brangus',
-    'brangwen',
-    'branham',
-    'braniak',
-    'branicki',
-    'branig',
-    'branjo',
-    'brank',
-    'branlant',
-    'brann.',
-    'brannam',
-    'branner',
-    'brannis',
-    'brano',
     'brans',
-    'branscombe/south',
-    'bransdale',
-    'bransden',
-    'bransgore',
-    'branski',
-    'bransons',
-    'branstad',
-    'branstead',
-    'branstone',
-    'brant&ocirc;me',
-    'brantes-pearson',
-    'branthwaite',
-    'brantley',
-    'brants',
-    'branwhite',
     'branwhites',
-    'branwoods',
-    'brapho',
-    'brare',
-    'bras&iacute;l',
-    'brasai&egrave;re',
-    'brasato',
-    'brasee-li-en-say',
-    'braselton',
-    'brasen-faced',
-    'brashed',
-    'brasheet',
-    'brasilian',
-    'brasmill',
-    'brasmus',
-    'brasov-based',
     'brass-buttoned',
-    'brass-cased',
-    'brass-dialled',
-    'brass-domed',
-    'brass-dresser',
-    'brass-ended',
-    'brass-finished',
-    'brass-finisher',
-    'brass-finishing',
-    'brass-founder',
-    'brass-framed',
-    'brass-gonged',
-    'brass-hat',
-    'brass-hats',
-    'brass-hilted',
-    'brass-hooped',
     'brass-inlaid',
-    'brass-lacquered',
-    'brass-necked',
-    'brass-plated',
-    'brass-polishing',
-    'brass-reel',
-    'brass-rubbing',
-    'brass-studded',
-    'brass-tipped',
-    'brass-wire',
-    'brass-works',
-    'brass.',
-    'brassac-le-grand',
-    'brassbound',
-    'brasscastle',
-    'brassett',
     'brassfounders',
-    'brasshats',
-    'brassi&egrave',
-    'brassia',
-    'brassic',
-    'brassington/swimmer',
-    'brassman',
-    'brassmill',
-    'brassnecked',
-    'brassworker',
-    'brassworks',
-    'brasted',
-    'brasway',
-    'braswell',
-    'brat&rcaron;i',
-    'bratan',
     'brathseth',
-    'bratin',
-    'bratinka',
-    'bratis&rehy;lava',
-    'bratkowski',
-    'bratnford',
-    'bratpacker',
-    'bratt/potato',
-    'brattenham',
-    'brattices',
-    'brattily',
-    'brattishings',
-    'brattleboro',
-    'bratty',
-    'bratukhin',
-    'bratwursts',
     'braty',
-    'brauchen',
-    'braud',
-    'braughingbaron',
-    'braunherz',
-    'braunholtz/gloucestershire',
-    'braunschweigers',
-    'braunsteiner',
-    'braunstonbury',
-    'braunthal',
-    'braunwald',
-    'brausebad',
-    'brauston',
-    'brav',
-    'bravance',
-    'bravante',
     'brave-faced',
-    'brave-lookin\'',
-    'braveboy',
-    'braveheart',
-    'braveness',
-    'bravery.this',
-    'braving-the-beach',
-    'bravington',
-    'bravissimi',
-    'bravitt',
-    'bravo-2-0',
-    'bravon',
-    'bravos',
-    'bravos/wrens',
-    'bravoure',
-    'bravura/programmatic',
     'brawer',
-    'brawest',
-    'brawith',
-    'brawly',
-    'brawn/student',
-    'brawniest',
-    'brawny-armed',
-    'braxton-hicks',
-    'bray/west',
-    'braya',
-    'brayer',
-    'brayes',
-    'brayfield',
-    'brayings',
-    'brayn',
-    'braynard',
     'braynes',
-    'braysgrove',
-    'brayshaw',
-    'brayshow',
-    'brayson',
-    'braytons',
-    'brazelle',
-    'brazen-hussy-like',
-    'brazenall',
-    'brazendale',
-    'brazening',
-    'brazens',
-    'brazier/fitter',
-    'brazil*',
-    'brazil-west',
-    'brazil/singapore',
     'brazilain',
-    'brazileno',
-    'brazilian-administrated',
-    'brazilian-born',
-    'brazilian-made',
-    'brazilienis',
-    'braziller',
-    'brazillia',
-    'brazillian',
-    'brazlandia',
-    'brazos',
-    'brazzi',
-    'brazzo',
-    'brcw',
-    'brdubudubum',
-    'brdurd-incorporating',
     'breacan-feiles',
-    'breach-of-contract',
-    'breach-of-promise',
-    'breach.as',
-    'breachwood',
-    'bread-and-cheese',
-    'bread-and-circuses',
-    'bread-and-no-chees-ily',
-    'bread-baskets',
-    'bread-crumb',
-    'bread-crumbs',
-    'bread-cutting',
-    'bread-dough',
-    'bread-eaters',
-    'bread-like',
-    'bread-lined',
     'bread-nibbler',
-    'bread-oven',
-    'bread-ovens',
-    'bread-pudding',
-    'bread-roll',
-    'bread-room',
-    'bread-sauce',
-    'bread-throwers',
-    'bread-winners',
-    'bread/cakes',
-    'breadboarding',
-    'breadbox',
-    'breadcakes',
-    'breadfield',
-    'breadfruit.they',
-    'breadle',
     'breadon',
-    'breadpaste',
-    'breadroll-throwing',
-    'breadth-',
-    'breadth-depth',
-    'breadthwise',
-    'breadun',
-    'breadwin',
-    'breadwinning',
-    'breaf',
-    'breagh',
-    'breagwell',
-    'break&amp;st',
-    'break&mdash;down',
-    'break&rehy;in',
-    'break&rehy;neck',
     'break&rehy;through',
-    'break&rehy;time',
-    'break-and-enter',
-    'break-angle',
-    'break-back',
-    'break-clause.',
-    'break-free',
-    'break-ing',
-    'break-surfaces',
-    'break-times',
-    'break-water',
-    'break/investment',
-    'break=on',
-    'breakaway-type',
-    'breakbeat-based',
-    'breakdown-john',
     'breakers.',
-    'breaketh',
-    'breakfast-burst',
-    'breakfast-set',
-    'breakfast-television',
-    'breakfast/dining-room',
-    'breakfast/english',
-    'breakfast/lunch',
-    'breakfast/lunch/tea/dinner/supper',
-    'breakfastless',
-    'breakheart',
-    'breaking-even',
-    'breaking-out',
-    'breaking/winning',
-    'breakingly',
-    'breakingpoint',
     'breaknecking',
-    'breaks.',
-    'breaksdown',
-    'breakspearean.',
-    'breakspeareans',
-    'breakthrough\'',
-    'breakthrough-assimilation-breakthrough-assimilation',
-    'bream.',
-    'bream/gloucestershire',
-    'breanski',
-    'brear',
-    'brear/lorry',
-    'breasal',
-    'breasclete',
-    'breashears',
-    'breast&rehy;plates',
     'breast-bones',
-    'breast-deprivation',
-    'breast-feeds',
-    'breast-pumps',
-    'breast-stroked',
-    'breast-stroking',
-    'breast.',
-    'breast/ovarian',
-    'breasterdays',
-    'breastfeeder',
-    'breastie',
-    'breasts-in-question',
-    'breastsummers',
-    'breastworks',
-    'breasty',
-    'breath-',
     'breath-alcohol',
-    'breath-groups',
-    'breath-lili',
-    'breath-snatching',
-    'breath-space',
-    'breath-takingly',
-    'breath-wind-spirit',
-    'breath.the',
-    'breathalyser\'',
-    'breathalysing',
-    'breathalyze',
-    'breathalyzer',
-    'breathe.',
-    'breathed-upon',
-    'breathholding',
-    'breathing&rehy',
     'breathing-spaces',
-    'breathing.test',
-    'breathing/coughing/sneezing/',
-    'breathnach',
-    'breaths/minute',
-    'breathtakes',
-    'breathtaking.as',
-    'breaut&eacute',
-    'brebes',
-    'brebi&egrave;res',
-    'brebis',
-    'breccio-conglomerates',
-    'brecciole',
-    'brech',
-    'brechot',
-    'brecht/weill',
     'brechtlien',
-    'breckenbridge',
-    'breckenbrough',
-    'brecklands',
-    'breckman',
-    'brecknell-munro',
-    'bredan',
-    'breddin',
-    'brede/',
-    'bredenhof',
-    'bredevej',
-    'bredgar',
-    'bredicote',
-    'bredun',
-    'breech-clad',
-    'breech-cloth',
     'breech-cloths',
-    'breech-clout',
-    'breeches-pockets',
-    'breechesmaker',
-    'breed/mongrel',
-    'breed/mongrels',
-    'breedehame',
-    'breedeth',
-    'breeding-',
-    'breeding-place',
-    'breeding-station',
-    'breeding/bluebells',
-    'breedlings',
-    'breeds.and',
-    'breedwise',
-    'breeeath',
     'breefe',
-    'breekouw',
-    'breeley',
-    'breenbergh',
-    'breetish',
-    'breeuwer',
-    'breever',
-    'breeze\'',
-    'breeze-filled',
-    'breeze-from-the-freeze',
-    'breeze.the',
-    'breezeless',
-    'breezie',
-    'breeziest',
-    'breezzy',
-    'breffni',
     'breffny',
-    'breffort',
-    'brefi',
-    'breganzona',
-    'bregdan',
-    'bregeon',
-    'bregeon/goetschy',
-    'breguet',
-    'breguet-dassault',
-    'breguet-made',
-    'brehaut',
-    'brehm',
-    'brehony',
-    'brehouse',
-    'brei&dstrok;3amerkurj&ouml;kull',
-    'breibergstr.',
     'breich',
-    'breidden',
-    'breidenstein',
-    'breig',
-    'breitenstein',
-    'breitling',
-    'breitmeyer',
-    'brekand',
-    'breker',
-    'brekken',
-    'brekker',
-    'brekkypoos',
-    'brekynge',
-    'brel/gec',
-    'brelade',
-    'breland',
     'brem',
-    'bremag',
-    'bremer-david',
-    'bremer/catcher',
-    'bremer/driver',
-    'bremetennaci',
-    'bremex',
-    'bremhill',
-    'bremnar',
-    'bremness',
-    'bremworth',
-    'bren&rehy;ner',
-    'brenbachhof',
-    'brenberg',
-    'brencethin',
-    'brenchelee',
     'brendas',
-    'brendekilde',
-    'brendell',
-    'brendoncare',
-    'brenidjet',
-    'brenidjetprimary',
-    'brennan/cleaner',
-    'brennan/environmental',
-    'brennan/talent',
-    'brennands',
-    'brennard',
-    'brenne',
-    'brennender',
-    'brennerstrasse',
-    'brenninkmeyer',
-    'brennyng',
     'brenon',
-    'brent-williamson',
-    'brentford-',
-    'brentham',
-    'brentonian',
-    'brentwood-based',
-    'brenva',
-    'breretons',
-    'brescello',
-    'bresch',
-    'brescia-cremona-brescia',
-    'brescia-rome-brescia',
-    'brescian',
-    'brescot',
-    'bresis',
-    'breslich',
     'bresnen',
-    'bressan',
-    'bressane',
-    'bresslaws',
-    'brest&ndash;litovsk',
-    'brestimont',
-    'bretagna',
-    'bretch',
-    'bretchi-ars',
-    'bretchill',
-    'breteche',
-    'bretfeld',
-    'bretford',
-    'bretherhed',
-    'bretherhede',
-    'bretherick',
     'brethern',
-    'brethyn',
-    'bretia',
-    'bretigny-sur-orge',
-    'bretland',
-    'breton-smocked',
-    'brett-haynes',
-    'brett/dealer',
-    'brett/head',
-    'brett/volunteer',
-    'brettenham',
-    'brettesnes',
-    'brettle',
-    'brettsy',
-    'bretyard',
-    'breue',
     'breuel',
-    'breughel-like',
-    'breughels',
-    'breuilly',
-    'breukink',
-    'breun',
-    'breur',
-    'breurd',
-    'breurne',
-    'breusch',
-    'breutheur',
-    'breval',
-    'brevant',
-    'breve',
-    'brevent',
-    'brevi-pedi-kel-artoos',
     'breviarium',
-    'breviat',
-    'breviate',
-    'brevicauda',
-    'brevicaudum',
-    'brevicoryne',
-    'brevicuspe',
-    'brevidentatus',
-    'brevifolia',
-    'brevipes',
-    'brevitate',
-    'brevity.',
-    'brevium',
-    'brew-it-yourself',
-    'brew-pub',
-    'brew-pubs',
     'breward',
-    'brewby',
-    'brewell',
-    'brewer/clerk',
-    'brewer/dental',
-    'brewery-sponsored',
-    'brewery-tie',
-    'brewin\'',
-    'brewitt',
-    'brewse',
-    'brewsville',
-    'brewsy',
-    'brewyn',
-    'brey',
-    'breyer',
-    'brezeanu',
     'brezezinski',
-    'brezhnev-gromyko',
-    'brezhnev-s',
-    'brezhnevian',
-    'brezi',
-    'brezkr',
-    'brezkum',
-    'brezner',
-    'brf',
-    'bri&egrave;re',
-    'bri1',
-    'brian-child',
-    'brian/victim',
-    'brianchon',
-    'briancon',
-    'brianne.',
     'briansk',
-    'brianza',
-    'briararch',
-    'briard',
-    'briared',
-    'briatore',
-    'briaunzon',
-    'bribdale',
-    'bribe-assisted',
-    'bribe-riddled',
-    'bribe-takers',
-    'bribery/dodgy',
-    'bric-&agrave;-bracery',
-    'bric-bracs',
-    'brica-brac',
-    'bricabrac',
     'brice&ntilde;o',
-    'brice-parain',
-    'bricgstow',
-    'brichard',
-    'bricher',
-    'bricht',
-    'brici',
-    'brick-a-brac',
-    'brick-b',
-    'brick-bint',
-    'brick-breaking',
-    'brick-broken',
-    'brick-building',
-    'brick-by-brick',
-    'brick-coloured',
-    'brick-eating',
     'brick-edged',
-    'brick-effect',
-    'brick-faced',
-    'brick-hard',
-    'brick-kiln',
-    'brick-laid',
-    'brick-laying',
-    'brick-like',
-    'brick-maker',
-    'brick-on-edge',
-    'brick-orange',
-    'brick-oven',
-    'brick-pathed',
-    'brick-paved',
-    'brick-red-and-white',
-    'brick-shaped',
     'brick-tiled',
-    'brick-tower',
-    'brick-truck',
-    'brick-wall',
-    'brick-wide',
-    'brick/air',
-    'brick/block',
-    'brickdust',
-    'brickearth',
-    'bricked-in',
-    'brickenden',
-    'brickendon',
-    'brickettes',
-    'brickfronted',
-    'brickhouse',
-    'bricklayeer',
     'bricklets',
-    'bricklike',
-    'brickmans',
-    'bricknell-type',
-    'bricknells',
-    'bricks.',
-    'brickwood/dodo',
-    'brickwork-like',
-    'brickworks-',
-    'brickying',
-    'bricogne',
-    'bricole',
-    'bricoler',
-    'bricoles',
-    'briconil',
-    'bricourt',
     'bricout',
-    'bricquebec',
-    'bridal-chambers',
-    'bridalled',
-    'bridals',
-    'bridders',
-    'briddge',
-    'bride&rehy;to-be',
-    'bride&rehy;wealth',
-    'bride\'s-dinner-party',
-    'bride\'s/',
-    'bride(pg)',
-    'bride-bed',
-    'bride-chamber',
-    'bride-groom',
-    'bride-prices',
     'bride/groom',
-    'bridego',
-    'bridegroo',
-    'bridegroom/bride',
-    'bridehouse',
-    'bridell',
-    'brides-in-the-bath',
-    'brideshead-style',
-    'bridestones',
-    'bridestowe',
-    'bridewel',
-    'bridford',
-    'bridge&ndash;a9',
-    'bridge&ndash;carbridge',
-    'bridge&ndash;dulnain',
-    'bridge&ndash;river',
     'bridge&ndash;sluggan',
-    'bridge\'',
-    'bridge-and-golf',
-    'bridge-corridor',
-    'bridge-corridors',
-    'bridge-fort',
-    'bridge-master',
-    'bridge-pin',
-    'bridge-pins',
-    'bridge-players',
-    'bridge-playing',
-    'bridge-posts',
-    'bridge-router-based',
-    'bridge-routing',
-    'bridge-rubber',
-    'bridge-saddle',
     'bridge-shaped',
-    'bridge-spouted',
-    'bridge-work',
-    'bridge/city',
-    'bridge/falls',
-    'bridge/tremolo',
-    'bridge/usaf',
-    'bridge/village/road',
-    'bridgecastle',
-    'bridgecourt',
-    'bridgeen',
-    'bridgegate',
-    'bridgehampton',
-    'bridgehead.',
-    'bridgehouses',
-    'bridgekeeper',
     'bridgend-built',
-    'bridgendl6',
-    'bridgenorse',
-    'bridgenorth.w',
-    'bridgepieces',
-    'bridgepin',
-    'bridgepins',
-    'bridges-brook',
-    'bridgetina',
-    'bridgette',
-    'bridgewater/jockey',
-    'bridgewood',
-    'bridging-loans',
-    'bridglington',
-    'bridisco',
-    'bridity',
     'bridle-bit',
-    'bridle-rein',
-    'bridle-riders',
-    'bridle-riding',
-    'bridlesmith',
-    'bridlesuite',
-    'bridlewalk',
-    'bridley',
-    'bridson',
-    'bridwell',
-    'brief-',
-    'brief-lived',
-    'brief-record',
-    'brief/specification',
-    'briefcase-bearing',
-    'briefcase-size',
     'briefcase-sized',
-    'briefe',
-    'briefers',
-    'briefg',
-    'briefing-paper',
-    'briefing/counselling',
-    'brieflies',
-    'briefly-married',
-    'briefly-stated',
-    'briefwechsel',
-    'briefy',
-    'brieger',
-    'brieish',
-    'brieland',
-    'brielly',
-    'brienzer',
     'brier-rose',
-    'brierfield',
-    'briesan',
-    'briest',
-    'briffitt/rover',
-    'brig-of-war',
-    'brigade&mdash;over',
-    'brigaded',
-    'brigaders',
-    'brigadier-generals',
-    'brigalow',
-    'brigama',
-    'brigand-infested',
-    'brigantines',
-    'brigcasterton',
-    'briggs/',
     'briggs/anthony',
-    'briggsmaid',
-    'brigh',
-    'brighde',
-    'brighest',
-    'brighouse/birmingham',
-    'brighouse/wife',
-    'bright&rehy;bladed',
-    'bright\'-faced',
-    'bright\'n\'breezy',
-    'bright-bay',
-    'bright-beaked',
-    'bright-cheeked',
-    'bright-dull',
-    'bright-faced',
-    'bright-feathered',
     'bright-haired',
-    'bright-lavender',
-    'bright-line',
-    'bright-lit',
-    'bright-looking',
-    'bright-painted',
-    'bright-peach',
-    'bright-point',
-    'bright-witted',
-    'bright-work',
-    'bright/fluorescent',
-    'bright/keep',
-    'brighte',
-    'brightened.',
-    'brighteners',
-    'brightening-up',
     'brighter\'n',
-    'brighter-green',
-    'brighter/duller',
-    'brightgreen',
-    'brightlife',
-    'brightly&rehy;coloured',
-    'brightly&rehy;lit',
-    'brightly-anoraked',
-    'brightly-dressed',
-    'brightly-marked',
-    'brightly-polished',
-    'brightly-shining',
-    'brightly.',
-    'brighton-hove',
-    'brighton/dieppe',
-    'brighton/rottingdean',
     'brighton/sussex',
-    'brighton1',
-    'brightonian',
-    'brightwalton',
-    'brightwell/thames',
-    'brigitta',
-    'brignell',
-    'brignorth',
-    'brignull',
-    'brigo',
-    'brigston',
-    'briguglio',
-    'brigus',
-    'brihtferth',
-    'brihtm&aelig;r',
-    'brihtwig',
     'brij',
-    'brijendra',
-    'brijinder',
-    'brijmokun',
-    'brijuni',
-    'brikom',
-    'briksdal',
-    'briliant',
-    'brillance',
-    'brillantissimo',
-    'brillian',
-    'brilliance.',
-    'brilliances',
-    'brilliant&rehy;green',
-    'brilliant&rehy;so',
-    'brilliant-white',
     'brilliant/shit',
-    'brilliant/successful/',
-    'brilliantly-executed',
-    'brilliantly-taken',
-    'brilliantly-varnished',
-    'brilliantly-worked',
-    'brillo-pad',
-    'brillouin',
-    'brilsin',
-    'brim-shadowed',
-    'brim.',
-    'brimacombe',
-    'brimah',
-    'brimarc',
-    'brimax',
-    'brimble',
     'brimglade',
-    'brimmond',
-    'brimpton',
-    'brimscombe/gloucestershire',
-    'brimsea',
-    'brin\'',
-    'brind/florist',
-    'brindabellaspis',
-    'brinded',
-    'brindisis',
-    'brindleford',
-    'brindling',
-    'brindy',
-    'brinefield',
-    'bring&ndash;benefit',
-    'bring-back',
     'bring-could',
-    'bring-them-down',
-    'bringer-in',
-    'bringest',
-    'bringhurst',
-    'bringing-into-being',
-    'bringing-together',
-    'bringraj',
-    'brington/northamptonshire',
-    'bringtons',
-    'brinhaus',
-    'brini',
-    'brinkengasse',
-    'brinkhaus',
-    'brinkhorst',
-    'brinkhurst',
     'brinkley/first-time',
-    'brinklow',
-    'brinkmen',
-    'brinkworth/former',
-    'brinn/gloucester',
-    'brinnin',
-    'brinol',
-    'brinquinho',
-    'brinsbury',
-    'brinsden',
-    'brintec',
-    'briny-dry',
-    'brione',
-    'briones',
-    'brionne',
-    'brionvega',
     'briot',
-    'brioverian',
-    'briquetters',
-    'brire',
-    'bris',
-    'bris&eacute',
-    'bris&eacute;e',
-    'bris&eacute;s',
-    'brisbin',
-    'brisby',
-    'brisca',
-    'brisco',
-    'briscola',
-    'briscow',
-    'brise',
-    'brise-soleil',
     'brisebois',
-    'brisees',
-    'briseis',
-    'brisfit',
-    'brisigotti',
-    'brisk-looking',
-    'brisk/relaxation',
-    'briskest',
-    'briskey',
-    'brisking',
-    'briskish',
-    'brisse',
-    'brissetts',
-    'brister',
-    'bristle-backed',
-    'bristle-bearded',
     'bristle-brushed',
-    'bristle-headed',
-    'bristle-moustached',
-    'bristle-stippled',
-    'bristle-tempered',
-    'bristle-tufted',
-    'bristle-workers',
-    'bristlebrow',
-    'bristol-bath',
-    'bristol-built',
-    'bristol-kempinski',
-    'bristol-made',
-    'bristol/coventry',
-    'bristol:friday',
-    'bristow/bletchley',
-    'bristowe',
     'brit&aacute;nica',
-    'brit-based',
-    'brit-for-champ',
-    'brit-hater',
-    'brit-huns',
-    'brit-ragga',
-    'brit-rock',
-    'brit-ton-gant',
-    'britag/hs',
-    'britain&mdash',
-    'britain\'s.',
-    'britain--a',
-    'britain-australia-new',
-    'britain-based',
-    'britain-china',
-    'britain.10',
     'britain.7',
-    'britain.but',
-    'britaincan',
-    'britaini',
-    'britamatic',
-    'britan',
-    'britania',
-    'britanici',
-    'britannia-bodied',
-    'britannians',
-    'britannicas',
-    'britannico',
-    'britannicum',
-    'britanniques',
-    'britannnica',
-    'britanno-americanus',
     'britanny',
-    'britax-excelsior',
-    'britchart',
-    'brite-lite',
-    'britel',
-    'britflick',
-    'britfunk',
-    'brither-in-law',
-    'britholdings',
-    'briti',
-    'britis',
-    'britischer',
-    'britisches',
-    'british&amp;commonwealthstill',
-    'british\'',
-    'british-',
     'british-aided',
-    'british-appointed',
-    'british-brazilian',
-    'british-bred',
-    'british-canadian',
-    'british-centered',
-    'british-chinese',
-    'british-crewed',
-    'british-derived',
-    'british-developed',
-    'british-drafted',
-    'british-established',
-    'british-french',
-    'british-invented',
-    'british-japanese',
-    'british-kuwaiti',
     'british-kuwaiti-german',
-    'british-naturalized',
-    'british-prepared',
-    'british-produced',
-    'british-racing-green',
-    'british-raised',
-    'british-record',
-    'british-russian',
-    'british-sounding',
-    'british-south',
-    'british-type',
-    'british-unit',
-    'british.imperial',
-    'british.made',
-    'british/',
-    'british/american',
     'british/ec',
-    'british/eec',
-    'british/french',
-    'british/indian',
-    'british/north',
-    'british/western',
-    'britiskis',
-    'britjobs',
-    'britknit',
-    'brito/dog',
-    'brito/mark',
-    'britonski',
-    'britonum',
-    'britpol',
-    'britpunk',
-    'britrail',
     'britrock',
-    'brittain-michael',
-    'brittain-trained',
-    'brittan/rally',
-    'brittanias',
-    'brittannia',
-    'britten-s',
-    'brittenden',
-    'brittenham',
-    'brittic',
-    'brittle-looking',
-    'brittleback',
-    'brittlebrain',
-    'brittlefish',
-    'brittlely',
-    'brittling',
     'britton-gant',
-    'britton/reporting',
-    'brittons',
-    'britvic',
-    'britz',
-    'briuhovec',
-    'brives',
-    'briwax',
-    'brixia',
-    'brixton-&gt;leeds',
-    'brixton-based',
-    'brixton-set',
-    'briza',
-    'brizio',
-    'brizzell',
-    'brkne',
     'brl-gibco',
-    'brlog',
-    'brmb',
-    'brms',
-    'brn',
-    'brnrd',
-    'bro&euml',
-    'bro&lsqb;the&rsqb;r',
-    'bro\'',
-    'bro.',
-    'broa',
-    'broached-to',
-    'broad&rehy;band',
-    'broad&rehy;based',
-    'broad&rehy;brimmed',
-    'broad&rehy;casting',
     'broad&rehy;minded',
-    'broad\'',
-    'broad-and-loose',
-    'broad-appeal',
-    'broad-basing',
-    'broad-bean',
-    'broad-beans',
-    'broad-bordered',
-    'broad-browed',
-    'broad-cast',
-    'broad-casting',
-    'broad-chested',
-    'broad-church',
-    'broad-crowned',
-    'broad-cut',
-    'broad-fold',
     'broad-front',
-    'broad-gauged',
-    'broad-headed',
-    'broad-hipped',
-    'broad-jawed',
-    'broad-jowled',
-    'broad-knitted',
-    'broad-lapelled',
-    'broad-leaved.',
-    'broad-lobed',
-    'broad-meshed',
-    'broad-seated',
-    'broad-sheets',
-    'broad-sleeved',
-    'broad-sweep',
-    'broad-swords',
     'broad-their',
-    'broad-tip',
-    'broad-wheeled',
-    'broad/rector',
-    'broadacre',
-    'broadbank',
-    'broadbent/brass',
-    'broadcast-quality',
-    'broadcast.the',
-    'broadcaster-type',
-    'broadcasting\'',
-    'broadcasting-appeared',
-    'broadcastle',
-    'broadcating',
-    'broadclothed',
-    'broadegg',
     'broadened.',
-    'broader&rehy;minded',
-    'broader-than-standard',
-    'broadfall',
-    'broadfold',
-    'broadham',
-    'broadholm',
-    'broadhurst-that-was',
-    'broadhurst/customer',
-    'broadie',
-    'broadisland',
-    'broadline',
-    'broadlooms',
-    'broadly-brushed',
-    'broadly-defined',
-    'broadmead/bristol',
     'broadoak',
-    'broadreach',
-    'broadribb',
-    'broads.',
-    'broadside-on',
-    'broadslides',
-    'broadtoothed',
-    'broadtown',
-    'broadwalk',
-    'broadwalks',
-    'broadway-bound',
-    'broadway/island',
-    'broadways-on',
-    'broadwinter',
-    'broadwith',
-    'broakes',
     'broatch',
-    'broath',
-    'brobdingnagarians',
-    'brobinski',
-    'brobity',
-    'broburn',
-    'broc',
-    'brocante',
-    'brocato',
-    'brocca',
-    'broccardo',
-    'broccoli-',
-    'broccoli-eating',
-    'brochier',
-    'brochis',
-    'brock-munchies',
     'brockdish',
-    'brocked',
-    'brockelsby',
-    'brockelschiefer',
-    'brocker',
-    'brocket-faces',
-    'brockewell',
-    'brockfield',
-    'brockhaus',
-    'brockhole',
-    'brockhoult',
-    'brockle',
-    'brockle-faced',
-    'brocklebank/reporting',
-    'brocklebeck',
-    'brocklebury',
     'brockleby',
-    'brockly',
-    'brockstedt',
-    'brockthorpe',
-    'brockthorpe/gloucestershire',
-    'brockweir/gloucestershire',
-    'brockwells',
-    'brodanski',
-    'broderbunds',
-    'broderers',
-    'broderies',
-    'broderip',
-    'broderipi',
-    'brodetto',
-    'brodies',
-    'brodkorb',
     'brodman',
-    'brodowicz',
-    'brodrick/angler',
-    'brodseam',
-    'brodwin',
-    'brodwof',
-    'brodwolf',
-    'broeder',
-    'broger',
-    'brogne',
-    'broguey',
-    'brogught',
-    'broguh',
-    'broidered',
-    'broile',
-    'broin',
     'broisset',
-    'brokage',
-    'brokahealth',
-    'brokain-hearted',
-    'brokaj',
-    'brokdorf',
-    'broke-i',
-    'broke-smith',
-    'broken-back',
-    'broken-chord',
-    'broken-glass-topped',
-    'broken-heart',
-    'broken-in',
-    'broken-kneed',
-    'broken-leg',
-    'broken-masted',
     'broken-mirror',
-    'broken-nailed',
-    'broken-nose',
-    'broken-spoked',
-    'broken-stemmed',
-    'broken-toothed',
-    'broken-winded',
-    'broken-windowed',
-    'brokenborough',
-    'brokenhearts',
-    'brokenhurst',
-    'brokensha',
-    'broker-dealers',
-    'broker/dealers',
-    'broker/dealing',
-    'brokers-dealers',
     'brokes',
-    'brokkoli',
-    'brolin',
-    'brolio',
-    'brollachan',
-    'brollie',
-    'brolly-less',
-    'bromatificus',
-    'bromb-orough',
-    'bromelin',
-    'bromell/auctioneer',
-    'bromide-cscl',
-    'bromide.',
-    'bromination',
-    'bromine-free',
-    'bromius',
     'bromley-davenport',
-    'bromley/friend',
-    'bromley/friends',
-    'bromley/save',
-    'bromly',
-    'bromma',
-    'bromo',
-    'bromo-',
-    'bromo-chloro-indolyl',
-    'bromocriptine',
-    'bromodeoxyridine',
-    'bromodeoxyuridine(brdu)-labelled',
-    'bromodeoxyuridine-positive',
-    'bromooctane',
-    'bromoxynil',
-    'brompren',
     'brompton-pac',
-    'brompton/chelsea',
-    'broms',
-    'bromsberrow',
-    'bromsground',
-    'bromswold',
-    'bromus',
-    'bromwich/west',
-    'bron-yr-eglwys',
-    'bronchiectasis',
-    'bronchioalveolar',
-    'broncho-obstructive',
-    'broncho-pneumonia',
-    'broncho-pulmonary',
-    'bronchoconstrictive',
-    'bronchoes',
     'bronchomotor',
-    'bronchoprovocation',
-    'bronchoscopes',
-    'bronco-buster',
-    'bronco-hand',
-    'broncobuster',
-    'broncom',
-    'broneirion',
-    'bronescombe',
-    'broneslaw',
-    'brongest',
-    'brongniart',
-    'bronham',
-    'bronhill',
-    'bronington',
-    'bronllys',
     'bronmiod',
-    'bronnaya',
-    'bronnley',
-    'bronoslaw',
-    'bronowski-like',
-    'bronshten',
-    'bronston',
-    'bront&euml;-rail',
-    'bront&euml;an',
-    'bronteuml',
-    'brontoburgers',
-    'bronton',
-    'brontophobia',
-    'brontosaurus-sized',
-    'brontosauruses',
-    'bronwin',
     'bronxville',
-    'bronydd',
-    'bronyddmawr',
-    'bronze-bladed',
-    'bronze-bound',
-    'bronze-covered',
-    'bronze-founder',
-    'bronze-gold',
-    'bronze-leafed',
-    'bronze-lit',
-    'bronze-medallists',
-    'bronze-red',
-    'bronze-smiths',
-    'bronze-streaked',
-    'bronze-tinged',
-    'bronze-tinted',
     'bronze-using',
-    'bronze-winged',
-    'bronze-working',
-    'bronze/dark',
-    'bronzeness',
-    'bronzie',
-    'bronzier',
-    'bronzy-green',
-    'brood-bond',
-    'brood-care',
-    'brood-mare',
-    'brood-parasites',
-    'brood-raising',
-    'brood-rearing',
-    'brood-ridden',
-    'broodbank',
     'broodhaers',
-    'broodily',
-    'broodings',
-    'broodmares',
-    'brook-lime',
-    'brook-little',
-    'brook-rose',
-    'brook-taylor',
-    'brook/gloucestershire',
-    'brook/the',
-    'brookborough',
-    'brooke-baker',
-    'brooke-haughey',
-    'brooke-little',
-    'brooke/',
-    'brookei',
     'brookend',
-    'brooker/west',
-    'brookes/rspca',
-    'brookey',
-    'brookhead',
-    'brooklands-type',
-    'brooklawn',
-    'brooklet',
-    'brooklyn-based',
-    'brooklyn-made',
-    'brooklyners',
-    'brookmeyer',
-    'brooks-any',
-    'brooks-ward',
-    'brooks/grandson',
-    'brooks/headmaster',
     'brooks/project',
-    'brookshaw',
-    'brookshill',
-    'brookshire',
-    'brooksites',
-    'brookstick',
-    'brookstone',
-    'brookthorpe',
-    'brooktrout',
-    'brookville',
-    'brookweald',
-    'broom-covered',
-    'broom-handle',
-    'broom-like',
-    'broom-making',
-    'broom-wielding',
     'broom.',
-    'broom/gloucestershire',
-    'broom/judge',
-    'broomball',
-    'broomfleet',
-    'broomhaugh',
-    'broomhouses',
-    'broomlee',
-    'broomsedge',
-    'broomwade',
-    'broon',
-    'broons',
-    'broooklyn',
-    'bror',
-    'brorda',
-    'brortigan',
     'bros&eacute;li&agrave;wnd',
-    'bros-like',
-    'brosha',
-    'brosman',
-    'brosna',
-    'broso',
-    'brossard',
-    'brosset',
-    'brossette',
-    'broters',
-    'broth-of-a-boyhood',
-    'brothel-going',
-    'brothel-like',
-    'brothel-owners',
-    'brothel-style',
-    'brothel.',
     'brother&mdash;or',
-    'brother(s)',
-    'brother-and-sister',
-    'brother-band',
-    'brother-clan',
-    'brother-general',
-    'brother-house',
-    'brother-in',
-    'brother-lover',
-    'brother-masons',
-    'brother-officers',
-    'brother-usurper',
-    'brother-workers',
-    'brother-you',
-    'brother/are',
-    'brother/sister/parent/child',
     'brother/son',
-    'brotherish',
-    'brotherless',
-    'brotherly-sisterly',
-    'brothers&rehy;unlike',
-    'brothers-in-arms',
-    'brothers-style',
-    'brothers.',
-    'brothger',
-    'broto',
-    'brotzu',
-    'brou',
-    'brouck&egrave;re',
-    'brough-based',
-    'broughs',
-    'brought\'',
     'brought_up',
-    'broughton/canonmills',
-    'broughton/edinburgh',
-    'broughtons',
-    'brouht',
-    'brouilles',
-    'brouillet',
-    'broulands',
-    'broumand',
-    'brounker',
-    'broussais',
-    'brousseau',
-    'brouster',
-    'broutman',
-    'brouwer',
-    'brouwers',
     'brouwershaven',
-    'brouzed',
-    'brovikov',
-    'broviscan',
-    'brow-beat',
-    'brow-knotting',
-    'brow-mopping',
-    'brow-ridges',
-    'brow-rubbing',
-    'brow-touching',
-    'broward',
-    'browers',
-    'browesminister',
-    'browing',
-    'browitt',
-    'browless',
     'brown&ndash;gibson',
-    'brown&rehy;bag',
-    'brown&rehy;knitting',
-    'brown\'s(1986)',
-    'brown-',
-    'brown-and-cream-liveried',
-    'brown-and-lilac',
-    'brown-bellied',
-    'brown-belly-buttoned.',
-    'brown-blotched',
-    'brown-bread',
-    'brown-clad',
-    'brown-covered',
-    'brown-cow',
-    'brown-earths',
-    'brown-encrusted',
     'brown-glass',
-    'brown-glazed',
-    'brown-green',
-    'brown-jerkinned',
-    'brown-maroon',
-    'brown-mouse',
-    'brown-panelled',
-    'brown-polished',
-    'brown-rimmed',
-    'brown-robed',
-    'brown-shaded',
-    'brown-shirt',
-    'brown-shirted',
-    'brown-spotted',
-    'brown-streaked',
-    'brown-style',
     'brown-tinted',
-    'brown-top',
-    'brown-violet',
-    'brown-walled',
-    'brown-winged',
-    'brown/adas',
-    'brown/animal',
-    'brown/beautician',
-    'brown/best',
-    'brown/captain',
-    'brown/careers',
-    'brown/cirencester',
-    'brown/cotswold',
-    'brown/dark',
-    'brown/editor',
-    'brown/green/black',
     'brown/grey',
-    'brown/head',
-    'brown/industry',
-    'brown/jackson/thorogood/williams',
-    'brown/james',
-    'brown/jockey',
-    'brown/kidnap',
-    'brown/managing',
-    'brown/nalgo',
-    'brown/oxford',
-    'brown/oxfordshire',
-    'brown/parliamentary',
-    'brown/party',
-    'brown/party-goer',
-    'brown/play',
-    'brown/princess',
     'brown/red',
-    'brown/retail',
-    'brown/scottish',
-    'brown/secretary/oxford',
-    'brown/senior',
-    'brown/tan',
-    'brown/thames',
-    'brown/the',
-    'brown/vice-chancellor',
-    'brown/warner',
-    'brown/yellow',
-    'brown/young',
-    'brownber',
-    'brownberry',
-    'browndens',
-    'browne-lecky',
     'browne/montague',
-    'brownea',
-    'browned.',
-    'brownells',
-    'brownfield',
-    'brownheaded',
-    'browniana',
-    'brownie-like',
-    'brownie/tizer',
-    'brownies&mdash;little',
-    'brownills',
-    'browning/british',
-    'browning/wife',
-    'brownish-orange',
-    'brownists',
-    'brownjohn',
     'brownlees',
-    'brownley',
-    'brownlows',
-    'brownmillerite',
-    'brownout',
-    'brownridge',
-    'browns.',
-    'brownsbank',
-    'brownsey',
-    'brownside',
-    'brownsnouts',
-    'brownson',
-    'brownsover',
-    'brownswood',
-    'brownton',
-    'browny-black',
     'browny-blue',
-    'browny-orange',
-    'browny-pink',
-    'browny-yellow',
-    'brows&rehy;ing',
-    'browse-and-edit',
-    'browse-and-leave-it',
-    'browse/malvern',
-    'browsed-through',
-    'browsewood',
-    'browsley',
-    'browtin',
-    'broxap',
-    'broxburn-based',
-    'broxhi',
-    'broxstowe',
     'broxup',
-    'broyd',
-    'brozie',
-    'brozies',
-    'brozman',
-    'brpo',
-    'brrap',
-    'brritish',
-    'brrm-brrm',
-    'brrp',
-    'brrring',
-    'brrrm-brrrm',
-    'brrrrm',
-    'brrrrr',
-    'brrrrrr',
-    'brrrrrrr',
     'brrrrrrrrrr',
-    'brrubububub',
-    'brso',
-    'brua',
-    'bruach',
-    'bruar',
-    'bruback',
-    'bruce&rehy;want',
-    'bruce\'s',
-    'bruce-dick',
-    'bruce-glazier',
-    'bruce-y',
-    'bruce/addiction',
-    'bruce/beeson',
-    'bruce/debate',
-    'brucefield',
     'brucey',
-    'bruch-a-claddy',
-    'bruchids',
-    'bruchsal',
-    'bruckit',
-    'bruckmoser',
-    'brucknerians',
-    'bruckshaw',
-    'bruder',
-    'bruderhaus',
-    'brudieu',
-    'brudney',
-    'brueghel-fat',
-    'brueghelesque',
-    'bruger',
-    'brugger',
     'brugglemith',
-    'brugh',
-    'brughe',
-    'brughs',
-    'brugman',
-    'brugmanasia',
-    'brugnoli',
-    'brugus',
-    'bruhn',
-    'bruichlady',
-    'bruidge',
-    'bruijn',
-    'bruijne',
-    'bruin-ridges',
-    'bruintjes',
-    'bruis',
     'bruise-coloured',
-    'bruise-faced',
-    'bruisewort',
-    'bruising-looking',
-    'bruit',
-    'bruitage',
-    'brujas',
-    'brukhart',
-    'brul',
-    'brulart',
-    'brulhois',
-    'brulisau',
-    'brulle',
-    'brumante',
-    'brumas',
-    'brumble',
     'brummagen',
-    'brumme',
-    'brummijam',
-    'brumrose',
-    'brunain',
-    'brunanburg',
-    'bruncv&iacute;k',
-    'brundall',
-    'brundenius',
-    'brundin',
-    'brundland',
-    'brundred',
-    'brundstone',
-    'brunehaut',
-    'brunel-cohen',
-    'brunel/',
     'brunell',
-    'brunetti',
-    'brunfaut',
-    'brunhes',
-    'brunhoffs',
-    'bruning',
-    'brunings',
-    'brunini',
-    'bruniquel',
-    'brunker',
-    'brunlees',
-    'brunless',
-    'brunnatwatt',
-    'brunnels',
-    'brunner-mond',
-    'brunnera',
     'brunni',
-    'brunnich',
-    'bruno\'',
-    'bruno-style',
-    'bruno/minstrel',
-    'brunos',
-    'brunot',
-    'brunschvicg',
-    'brunssons',
-    'brunssum',
-    'brunston',
-    'brunt/laser',
-    'bruntland',
-    'bruntons',
-    'brunwich',
-    'brunwick',
     'bruofen',
-    'brurghhh',
-    'brus&rehy;sels',
-    'brusa',
-    'brusc',
-    'brusca',
-    'bruschini',
-    'brusdeximit',
-    'brush-applied',
-    'brush-bristle',
-    'brush-brush',
-    'brush-built',
-    'brush-cleaned',
-    'brush-end',
-    'brush-filled',
-    'brush-fires',
     'brush-mark',
-    'brush-rail',
-    'brush-through',
-    'brush-tipped',
-    'brush-tong',
-    'brush-wood',
-    'brush-working',
-    'brush/carpet',
-    'brush/head',
-    'brushand-comb',
-    'brushcutting',
-    'brushe',
-    'brushed-aside',
-    'brushed-back',
-    'brushfield',
-    'brushfire',
     'brushing.',
-    'brushmakers',
-    'brushoff',
-    'brushpot',
-    'brushscript',
-    'brushstyles',
-    'brushtype',
-    'brushwood/badger',
-    'brushworks',
-    'brusnice',
-    'bruss-jo\'burg',
-    'brussells',
-    'brussels-dominated',
-    'brussels-like',
-    'brussels-watcher',
-    'brussels-waterloo',
     'brussie',
-    'brussles',
-    'brust',
-    'brustein',
-    'brustwarze',
-    'bruswick',
-    'bruszewski',
-    'brut&eacute',
-    'bruta',
-    'bruta-lised',
-    'brutails',
-    'brutal-game',
-    'brutal-looking',
-    'brutal-sounding',
-    'brutal-voiced',
-    'brutalattack',
     'brutalizes',
-    'brutals',
-    'brutents',
-    'bruthur',
-    'brutish-looking',
-    'brutscher',
-    'brutta',
-    'brutton',
-    'brutus/as',
-    'bruvva',
-    'bruwer',
-    'brux',
-    'bruxelle',
-    'bruxellois',
-    'bruyn',
-    'bruynooghe',
     'bruzzano',
-    'brx3270',
-    'brxsna/ip',
-    'bryan/antonia',
-    'bryan/curator',
-    'bryan/railway',
-    'bryandale',
-    'bryanite',
-    'bryansford',
-    'bryanstone',
-    'bryanstown',
-    'bryant/fiance',
-    'bryar-bound',
-    'brybrie.',
-    'brycheiniog',
-    'brychta',
     'brychtov&aacute',
-    'bryddie',
-    'brydekirk',
-    'brydens',
-    'brydensholt',
-    'brydone',
-    'brydson',
-    'bryer/director',
-    'bryers',
-    'brygidy',
-    'brymon',
-    'bryn-y-bont',
-    'bryna',
-    'bryncliffe',
-    'bryncunallt',
-    'bryncysegrfan',
     'brynduraz',
-    'bryng',
-    'brynge',
-    'bryngwyn',
-    'brynhedydd',
-    'brynhenllys',
-    'brynhyfryd',
-    'brynllyys',
-    'brynrefail',
-    'brynrefoil',
-    'bryny-baal',
-    'bryophyllum',
-    'bryozoanalgal',
-    'bryta',
-    'brytt',
-    'brzeska',
     'bs-100',
-    'bs-balloon',
-    'bs.476',
-    'bs/ral',
-    'bs1187',
-    'bs1361',
-    'bs2000/osd1',
-    'bs2724',
-    'bs3',
-    'bs3879',
-    'bs415',
-    'bs4637',
-    'bs4737',
-    'bs476',
-    'bs4863',
-    'bs528/81',
     'bs5306',
-    'bs5325',
-    'bs5386',
-    'bs5445',
-    'bs5572',
-    'bs5615:1985',
-    'bs5665',
-    'bs5750:part',
-    'bs5852',
-    'bs5950',
-    'bs6',
-    'bs6102',
-    'bs6206',
-    'bs6262',
-    'bs6575',
-    'bs7131',
     'bs8201',
-    'bsa-heparin',
-    'bsaa',
-    'bsad/kfa',
-    'bsb&mdash;launched',
-    'bsbi',
-    'bsc.econ.',
-    'bscc',
-    'bsd/1992/5',
-    'bsd/at&amp;t',
-    'bsd/unix',
-    'bsdp&mdash;ivan',
-    'bsent',
-    'bses',
-    'bsh',
-    'bsharri',
     'bside',
-    'bsis',
-    'bskyb-style',
-    'bsl/',
-    'bsl566',
-    'bsos',
-    'bsp&mdash;defence',
-    'bsp&mdash;deputy',
-    'bsp&mdash;the',
-    'bsp-inspired',
-    'bspa',
-    'bspos',
-    'bsrl',
-    'bss750',
-    'bsshii',
-    'bsteii-apai',
     'bsu36',
-    'bt&ndash;13s',
-    'bt-2',
-    'bt-du',
-    'bt-specific',
-    'bt-written',
-    'bt12',
-    'bt14',
-    'bt200',
-    'bt32',
-    'bt35',
-    'bt36',
-    'bt38',
-    'bt4',
-    'bt42',
-    'bt45s',
     'bt48',
-    'bt4l',
-    'bt51',
-    'bt70',
-    'bt98/376',
-    'btat',
-    'btca',
-    'btdc',
-    'btec\'',
-    'btec/higher',
-    'btech',
-    'btk',
-    'btl',
-    'btlr',
-    'btm',
-    'bto/basf',
     'btog',
-    'btr-brushed',
-    'btr/pilkington',
-    'bttrly',
-    'btts/prestel',
-    'btu/h',
-    'bu%',
-    'bu&ndash;o',
-    'bu:t',
-    'bua',
-    'buabse',
-    'buaiad',
-    'bual',
-    'buanarotti',
-    'buang',
-    'buato',
     'bubalis',
-    'bubaneshwar',
-    'bubanova',
-    'bubas',
-    'bubbl',
-    'bubble\'',
-    'bubble-and-squeak',
-    'bubble-bathed',
-    'bubble-bathing',
-    'bubble-baths',
-    'bubble-brains',
-    'bubble-canopied',
-    'bubble-canopy',
-    'bubble-car',
-    'bubble-curled',
-    'bubble-era',
     'bubble-fluid',
-    'bubble-forms',
-    'bubble-free',
-    'bubble-garden',
-    'bubble-glass',
-    'bubble-gleams',
-    'bubble-gum.',
-    'bubble-heads',
-    'bubble-like',
-    'bubble-making',
-    'bubble-nesters',
-    'bubble-pack',
-    'bubble-permed',
-    'bubble-ride',
-    'bubble-shaped',
-    'bubble-syringe',
     'bubble-wrap',
-    'bubblebath',
-    'bubblegum-pink',
-    'bubblegum.a',
-    'bubblehead',
-    'bubblejets',
-    'bubblenest',
-    'bubbler',
-    'bubbliest',
-    'bubblin\'',
-    'bubbling-in',
-    'bubblings',
-    'bubbly-water',
-    'bubbly-waterfall',
-    'bubbs',
-    'bubendorf',
     'bubenreuth',
-    'bubis',
-    'buble',
-    'bublimiting',
-    'bubo-like',
-    'bubongoronga',
-    'bubu',
-    'bububububub',
-    'bubucled',
-    'bubulcus',
-    'bubulu',
-    'buca',
-    'bucaille',
-    'bucar&aacute;m',
-    'bucaramanga',
-    'bucarest',
     'bucato',
-    'bucca-bos',
-    'buccanero',
-    'buccelin',
-    'buccinu',
-    'buccinunl',
-    'buccleugh',
-    'bucelli',
-    'bucephalia',
-    'bucetta',
-    'buchaille',
-    'buchanan/bar',
-    'buchanan/hereford',
-    'buchanani',
-    'bucharest-ettrick',
-    'bucharest1',
     'bucharesti',
-    'buchbinder',
-    'buchez',
-    'buchheim',
-    'buchicchio',
-    'buchie',
-    'buchinger',
-    'buchl',
-    'buchleyn',
-    'buchloh',
-    'bucho',
-    'buchons',
-    'buchsbaurn',
-    'buchzentrum',
-    'buck-a-day',
-    'buck-eye',
     'buck-morss',
-    'buck-stopping',
-    'buck-teeth',
-    'buck/complainant',
-    'buckaroo',
-    'buckaroos',
-    'bucke',
-    'bucker',
-    'buckesses',
-    'bucket-base',
-    'bucket-brigade',
-    'bucket-full',
-    'bucket-reared',
-    'bucket-smooth',
-    'bucket-stepped',
-    'bucket-type',
     'buckethead',
-    'bucketless',
-    'bucketload',
-    'buckets-full',
-    'buckeyes',
-    'buckfast-totnes',
-    'buckfastely',
-    'buckfastleigh-based',
-    'buckham',
-    'buckinary',
-    'buckingham/city',
-    'buckingham/home',
-    'buckinghams',
-    'buckinghamsahire',
-    'buckinghamshire/oxfordshire',
-    'buckinhamshire',
     'buckland/cheltenham',
-    'buckland/conservative',
-    'buckland/oxfordshire',
-    'buckle-and-strap',
-    'buckle-end',
-    'buckle-ends',
-    'buckle-plate',
-    'buckle-scratching',
-    'buckleberry/berkshire',
-    'bucklebury/berkshire',
-    'bucklegrove',
-    'bucklemaker',
-    'buckler-leaved',
-    'bucklered',
-    'bucklersbury',
-    'buckleyjones',
     'buckman',
-    'buckmaster/chairman',
-    'buckminsterfullerenes',
-    'buckmore',
-    'buckner/animal',
-    'buckner/protester',
-    'buckos',
-    'buckow',
-    'buckpool',
-    'buckra',
-    'buckrake',
-    'bucksbaum',
-    'buckshole',
-    'buckskin-clad',
-    'buckskin-fringed',
-    'buckstepe',
     'buckston',
-    'buckstone',
-    'buckthorpe',
-    'bucktown',
-    'buckwald',
-    'buckwheats',
-    'buco',
-    'bucolics',
-    'bucovina',
-    'bucquoy',
-    'bucrylate',
-    'buczacky',
-    'bud-chugging',
-    'bud-eli-fritz',
-    'bud-frierman',
-    'bud-sheaths',
     'bud-swilling',
-    'bud.a',
-    'budaj',
-    'budamir',
-    'budapestensis',
-    'budapester',
-    'budapestians',
-    'budathoki',
-    'budby',
-    'buddah',
-    'buddekes',
-    'buddenbrock',
-    'buddh',
-    'buddhist-based',
-    'buddhist-managed',
-    'buddine',
     'buddingh',
-    'buddist',
-    'buddists.',
-    'buddleja',
-    'buddwing',
-    'buddy-boy',
-    'buddy-buddy.',
-    'buddy-movie',
-    'buddymania',
-    'budel',
-    'budeler',
-    'budelli',
-    'budepest',
-    'buder',
-    'budgeon',
-    'budget-balancing',
     'budget-bin',
-    'budget-boosting',
-    'budget-busting',
-    'budget-chopping',
-    'budget-connected',
-    'budget-cutters',
-    'budget-day',
-    'budget-fixing',
-    'budget-funded',
-    'budget-keeping',
-    'budget-led',
-    'budget-management',
-    'budget-maximization',
-    'budget-price',
-    'budget-reducing',
-    'budget-rescue',
     'budget-restricted',
-    'budget-style',
-    'budget-time',
-    'budget-tourist',
-    'budget.this',
-    'budget/',
-    'budget/2*/3*',
-    'budgeteer',
-    'budgeteer/economic',
-    'budgetholder',
-    'budgetholders',
-    'budgeting/bargaining',
-    'budgets.',
-    'budgie-fancier',
-    'budgy',
-    'budhas',
     'budhill',
-    'budi',
-    'budilding',
-    'budino',
-    'budley',
-    'budoch',
-    'budokan',
-    'budongo',
-    'budr-induced',
-    'buds.',
-    'buds/',
-    'budsman',
-    'budstick',
-    'budsuren',
-    'budsurengiyn',
-    'budths',
     'budumir',
-    'budvar',
-    'budwig',
-    'budyonny\'',
-    'bueb',
-    'buechner',
-    'buellia',
-    'buenavista',
-    'buend&iacute;as',
-    'buendia',
-    'buenhope',
-    'bueno.',
-    'buerdsell',
-    'buerger',
-    'buergersinn',
-    'buescheri',
     'buess',
-    'buesst',
-    'buet',
-    'buff-backed',
-    'buff-breasted',
-    'buff-clad',
-    'buff-et',
-    'buffalo&ndash;gettysburg',
-    'buffalo-bundle',
-    'buffalo-dung',
-    'buffalo-horn',
-    'buffalo-hunters',
-    'buffalo-like',
-    'buffalo-robe',
-    'buffard',
-    'buffarot',
     'buffavento',
-    'buffbeards',
-    'buffer-based',
-    'buffer-containing',
-    'buffer-like',
-    'buffer-stock',
-    'buffer-zone',
-    'buffer_',
-    'buffers=',
-    'buffers=20',
-    'buffers=30,8',
-    'buffers=xx',
-    'buffet-bits',
-    'buffet-trolley',
-    'buffetingly',
-    'buffetmen',
     'buffetted',
-    'buffham',
-    'buffheads',
-    'buffie',
-    'buffler',
-    'buffr',
-    'buffs-up',
-    'buffteak',
-    'buffum',
-    'buffware',
-    'bufifood',
-    'bufo&rehy;frogs',
-    'bufonius',
-    'bufotalin',
-    'bufotenine',
-    'bufton/tenant',
     'bug-bear',
-    'bug-detectors',
-    'bug-eyes',
-    'bug-fighting',
-    'bug-fixes',
-    'bug-fixing',
-    'bug-hunting',
-    'bug-infested',
-    'bug-like',
-    'bug-out',
-    'bug-run',
-    'bug/patch',
-    'bugaboos',
-    'bugako',
-    'bugar',
-    'bugenhagen',
     'bugesera',
-    'bugey-3',
-    'buggen',
-    'bugger&rehy;all',
-    'bugger-off',
-    'bugger_all',
-    'buggered-to-bejaizus',
-    'buggered-up',
-    'buggerlugs',
-    'buggers.',
-    'bugges',
-    'buggeys',
-    'bugginses',
-    'buggles',
-    'buggleskelly',
-    'buggs',
     'buggy-designs',
-    'buggy.pictures',
-    'buggy/pram',
-    'bugisville',
-    'buglawton',
-    'bugle-call',
-    'bugle-horns',
-    'bugle-note',
-    'bugleblowing',
-    'buglehorn',
-    'bugles-and-banners',
-    'buglioni',
-    'bugloss',
-    'bugnariu',
-    'bugproof',
-    'bugs-to-source',
     'bugsby',
-    'bugsy/columbia',
-    'bugue',
-    'bugunda',
-    'buhari',
-    'buharizade',
-    'bui1t',
-    'buibuis',
-    'buick-derived',
-    'buick-powered',
-    'buicks',
-    'buidh',
-    'buidhie',
-    'buidings',
-    'buie',
-    'build-about',
     'build-and-repair',
-    'build-ing',
-    'build-it-yourself',
-    'build-operate-transfer',
-    'build-or-buy',
-    'build-quality',
-    'build.severn',
-    'buildable',
-    'builder\'s/lessor',
-    'builder-architect',
-    'builder-restored',
-    'builder-seller',
-    'builder.',
-    'builder/master',
-    'builders/decorators',
-    'buildi',
     'building&mdash',
-    'building-based',
-    'building-boom',
-    'building-clubs',
-    'building-complex',
-    'building-for-building',
-    'building-land',
-    'building-machine',
-    'building-mates',
-    'building-mounted',
-    'building-over',
-    'building-preservation',
-    'building-programme',
-    'building-sculptures',
-    'building-stones',
-    'building-style',
     'building-tools',
-    'building-trade',
-    'building.l',
-    'building/decorating',
-    'building_a',
-    'buildings.here',
-    'buildings/equipment/furniture',
-    'builds&rehy;up',
-    'built&mdash;in',
-    'built&ndash;dmus',
-    'built-homes',
-    'built-in-obsolescence',
-    'built-ins',
-    'built-it',
-    'built-under',
-    'built/unbuilt',
     'built_next',
-    'buir',
-    'buiseness',
-    'buisiness',
-    'buisness',
-    'buitendag',
-    'buitone',
-    'buiys',
-    'buize',
-    'bujold',
-    'bujosa',
-    'bujra',
-    'bukalo',
-    'bukan',
-    'bukas',
-    'bukavu',
     'bukayi',
-    'buketi',
-    'bukha',
-    'bukhari-zade',
-    'bukharin-piatakov',
-    'bukharin-stalin',
-    'bukharinites',
-    'bukhoosh',
-    'bukht',
-    'bukidnon',
-    'bukler',
-    'bukman',
-    'buknell',
-    'bukoba',
-    'bukovsky',
-    'bulabula',
     'bulagat',
-    'bulaki',
-    'bulaleh',
-    'buland',
-    'bulatovi&cacute',
-    'bulava',
-    'bulavin',
-    'bulb-growing',
-    'bulb-importing',
-    'bulb-life',
-    'bulb-light',
-    'bulb-traders',
-    'bulbacodium',
-    'bulbar',
-    'bulbeck',
-    'bulben',
     'bulbfield',
-    'bulbils',
-    'bulbir',
-    'bulbocodium',
-    'bulborne',
-    'bulbous-shaped',
-    'bulbously',
-    'bulbs.',
-    'bulbul',
-    'bulbus',
-    'bulbus/duodenum',
-    'bulcan',
-    'bulderin',
-    'bulding',
-    'buleita',
-    'bulevard',
     'bulevardul',
-    'buley',
-    'bulganin-khruschev',
-    'bulgaria*',
-    'bulgaria-turkey',
-    'bulgaria-yugoslavia',
-    'bulgarian-ec',
-    'bulgarian-french',
-    'bulgarian-turkish',
-    'bulgarian-united',
-    'bulgarin',
-    'bulgarka',
-    'bulgaroctonos',
-    'bulgarsko',
-    'bulge-tall',
-    'bulge/bulb',
     'bulging-bellied',
-    'bulging-full',
-    'bulging-ripe',
-    'bulglet',
-    'bulgur',
-    'bulhoes',
-    'bulidings',
-    'bulith',
-    'buliver',
-    'bulk-boosting',
-    'bulk-buys',
-    'bulk-carriers',
-    'bulk-chemicals',
-    'bulk-destined',
-    'bulk-discount',
-    'bulk-gas',
     'bulk-heads',
-    'bulk-loaded',
-    'bulk-shop',
-    'bulk-washing',
-    'bulkanov',
-    'bulkcarriers',
-    'bulkiest',
-    'bulkily-furred',
-    'bulkington',
-    'bulkly',
-    'bulky-files',
-    'bulky-looking',
-    'bull****',
-    'bull-beef',
-    'bull-cape',
-    'bull-court',
     'bull-dancing',
-    'bull-derived',
-    'bull-down',
-    'bull-dozed',
-    'bull-dozing',
-    'bull-faced',
-    'bull-fight',
-    'bull-fighter',
-    'bull-fighters',
-    'bull-for-evers',
-    'bull-free',
-    'bull-frog',
-    'bull-god',
-    'bull-grappler',
-    'bull-grapplers',
-    'bull-grappling',
     'bull-headedness',
-    'bull-hide',
-    'bull-huss',
-    'bull-licensing',
-    'bull-man',
-    'bull-neck',
-    'bull-owned',
-    'bull-related',
-    'bull-ritual',
-    'bull-shitted',
-    'bull-shitter',
-    'bull-shitting',
-    'bull-son',
-    'bull-subscriptions',
-    'bull-tritons',
-    'bull-voiced',
     'bull-woman',
-    'bull/25/10/93/cde',
-    'bull/26/10/93/cde',
-    'bull/27/10/93/cde',
-    'bull/sach',
-    'bullaasi',
-    'bullace',
-    'bullaces',
-    'bullae',
-    'bullar',
-    'bullard/cpre',
-    'bullard/forensic',
-    'bullard/local',
-    'bullata',
-    'bullator',
-    'bullboy',
     'bulldock',
-    'bulldog-calf',
-    'bulldog-clip-round-the-nose',
-    'bulldozered',
-    'bulldozers.',
-    'bulldykes',
-    'bulleid-influenced',
-    'bullemer',
-    'bullen-evans',
-    'bullen/divisional',
-    'bullet&rehy;free',
-    'bullet&rehy;proof',
-    'bullet-brow',
-    'bullet-catcher',
-    'bullet-catchers',
-    'bullet-hole',
     'bullet-holed',
-    'bullet-in',
-    'bullet-like',
-    'bullet-pocked',
-    'bullet-slashed',
-    'bullet-stream',
-    'bullet-streams',
-    'bulletin-board',
-    'bulletin-bullet-bull-pull-football-foot',
-    'bulletin/notice',
-    'bulletmaking',
-    'bullets-solid',
-    'bullety',
-    'bulley/carterton',
-    'bulley/town',
-    'bullfinch-like',
     'bullfrog/electronic',
-    'bullhampton',
-    'bullingham',
-    'bullis',
-    'bullmore',
-    'bullnecks',
-    'bullnosing',
-    'bullo',
-    'bullock\'',
-    'bullock-carts',
-    'bullock-power',
-    'bullocked',
-    'bulloughs',
-    'bullous',
-    'bullow',
-    'bullrings',
     'bullroar',
-    'bullseye/a',
-    'bulltes',
-    'bullus',
-    'bullvalene',
-    'bully-and-biscuit',
-    'bullyboy',
-    'bullyboys',
-    'bullyingly',
-    'bulnes',
-    'bulohawo',
-    'bulonda',
-    'bulova',
-    'bulrushers',
-    'bulsar',
-    'bulstrode/surgeon',
     'bultman',
-    'bulture',
-    'bulukumba',
-    'bulweria',
-    'bulwerii',
-    'bulyanda',
-    'bulygin',
-    'bum&rehy;length',
-    'bum-fluffed',
-    'bum-freezers',
-    'bum-of-the-month',
-    'bum-splintering',
-    'bum-wiggling',
-    'bumah',
-    'bumbach',
-    'bumbee',
     'bumberry',
-    'bumble-face',
-    'bumble-puppy',
-    'bumbledom',
-    'bumblers',
-    'bumblies',
-    'bumbly',
-    'bumboys',
-    'bumer',
-    'bumf-crammed',
-    'bumf-heaped',
-    'bumford/farmer',
-    'bumfreezer',
-    'bumfucker',
-    'bumhead',
-    'bummed-out',
     'bummel',
-    'bummers',
-    'bump\'n\'grind-your-bones-to-make-my-bread',
-    'bump-and-grind',
-    'bump-free',
-    'bump-up',
-    'bumpalong',
-    'bumped-up',
-    'bumped/tug',
-    'bumper-sized',
-    'bumper-sticker',
-    'bumper-to&rehy',
-    'bumpf',
-    'bumpham',
-    'bumpiest',
-    'bumpin\'',
     'bumpings',
-    'bumpkin\'',
-    'bumpo',
-    'bumppo',
-    'bumpv',
-    'bunac',
-    'bunbury/mother',
-    'bunburying',
-    'bunce/motor',
-    'bunch.',
-    'bunche',
-    'bunched-together',
-    'bunchrew',
-    'bunchs',
-    'bunchu',
-    'bund-l&auml;nder',
     'bundala',
-    'bundasleague',
-    'bunday',
-    'bundee',
-    'bunder',
-    'bundersrat',
-    'bundes',
-    'bundesarchiv',
-    'bundesbank-fixed',
-    'bundesbeamtengesetz',
-    'bundesdenkmalamt',
-    'bundeskanzlei',
-    'bundeskanzler&mdash;elected',
-    'bundeskanzler&mdash;head',
-    'bundeskanzleramt',
-    'bundeskartellamt',
     'bundeskunsthalle',
-    'bundeslaufbahnverordnung',
-    'bundesliga.',
-    'bundesnachrichtendienst',
-    'bundesoberbehorden',
-    'bundespr&auml;sident&mdash;head',
-    'bundespr&uuml;stelle',
-    'bundesrat&mdash;upper',
-    'bundesstaat',
-    'bundesstrafgericht',
-    'bundestages',
-    'bundestags-drucksache',
-    'bundestagsfraktion',
-    'bundestrasse',
-    'bundestreue',
-    'bundesverfassungsgerichtsgesetz=bverfgg',
     'bundeswehrkommando',
-    'bundi',
-    'bundle.',
-    'bundled-up',
-    'bundm&auml;dchen',
-    'bundnis',
-    'bundon',
-    'bundsandstein',
-    'bundt',
-    'buner',
-    'bung-hole',
-    'bunga',
-    'bungall',
-    'bungalow-land',
-    'bungalow-styled',
-    'bungee-jumped',
     'bungei',
-    'bunges',
-    'bunghole',
-    'bungle.',
-    'buniacenko',
-    'bunic',
-    'bunich',
-    'bunion',
-    'bunjee',
-    'bunjie-jumping',
-    'bunk-bed',
-    'bunk-hole',
-    'bunk-wives',
-    'bunker-pocked',
-    'bunker-shot',
-    'bunkerers',
     'bunkershot',
-    'bunkhead',
-    'bunkroom',
-    'bunnahabhain',
-    'bunned',
-    'bunnetless',
-    'bunnett',
-    'bunnied',
-    'bunnikin',
-    'bunnin',
-    'bunns',
-    'bunny-hopped',
-    'bunny-hops',
-    'bunny-love',
-    'bunnyhops',
-    'bunnyman',
     'bunnymen-heaven',
-    'bunnymen/joy',
-    'bunostomiasis',
-    'bunrannoch',
-    'bunscoil',
-    'bunsen-burners',
-    'bunslinger',
-    'bunson',
-    'bunter\'',
-    'bunter-like',
-    'bunter-style',
-    'bunterish',
-    'buntine',
-    'bunting-and-bubbly',
-    'buntingsdale',
-    'buntins',
     'buntline',
-    'buntom',
-    'bunton',
-    'buntustan',
-    'bunuk',
-    'bunwaree',
-    'bunyala',
-    'bunyanesque',
-    'bunyips',
-    'bunyon',
-    'bunyoro',
-    'buochs',
-    'buochserhorn',
-    'buoerta',
-    'buonaccorsa',
-    'buonadonna',
     'buonamici',
-    'buonarruoti',
-    'buonassisi',
-    'buonfiglia',
-    'buongiorno',
-    'buontalenti',
-    'buoy-ed',
-    'buoy.',
-    'buoyed-up',
-    'bupesh',
-    'buphthalmos',
-    'buppies',
-    'buracchia',
-    'burachati',
-    'burad',
-    'burada',
     'burak',
-    'burall',
-    'burannpour',
-    'burasian',
-    'buratai',
-    'burattoni',
-    'burbank-volupine',
-    'burbanking',
-    'burberried',
-    'burberries',
-    'burblings',
-    'burbose',
-    'burbs',
-    'burchelli',
-    'burchett',
-    'burchfiel',
     'burchi',
-    'burchuladze',
-    'burcombe',
-    'burcombe/gloucestershire',
-    'burcote',
-    'burdale',
-    'burdcrop',
-    'burden/west',
-    'burden_on',
-    'burdens.portico',
-    'burdens86',
-    'burdensomely',
-    'burdess',
-    'burdet',
-    'burdette',
-    'burdigalian',
     'burdis',
-    'burdon-sanderson',
-    'burdoned',
-    'burdwan',
-    'bureacracies',
-    'bureacratic',
-    'bureacuracy',
-    'bureau&mdash;bearing',
-    'bureau&rehy;crat',
-    'bureau-based',
-    'bureau-bookcase',
-    'bureau-cabinet',
-    'bureau-shaping',
-    'bureaucracy\'s',
-    'bureaucracy-cum-factory',
-    'bureaucracy-free',
     'bureaucracy-led',
-    'bureaucracy.',
-    'bureaucracy/hierarchy',
-    'bureaucrat-fisherman',
-    'bureaucratic&rehy;authoritarianism',
-    'bureaucratic-collegial',
-    'bureaucratic-exclusionary',
-    'bureaucratic-inclusionary',
-    'bureaucratic-legislative',
-    'bureaucratic-professional',
-    'bureaucratizing',
-    'bureaufax',
-    'bureaumetrics',
-    'bureaux&mdash;and',
-    'burek',
-    'buresch',
     'burewala',
-    'burford/gloucestershire',
-    'burfort',
-    'burgages',
-    'burgan',
-    'burgandy',
-    'burgdy',
-    'burgener',
-    'burgenstock',
-    'burgenthal',
-    'burger-box',
-    'burger-eating',
-    'burger-i',
-    'burger-type',
-    'burger-weeshuis',
-    'burgermasters',
     'burgerspark',
-    'burgess-dunne',
-    'burgess-like',
-    'burgess-ticket',
-    'burgess/70',
-    'burgess/asst',
-    'burgess/gloucestershire',
-    'burgess/herefordshire',
-    'burgess/neighbour',
-    'burgess/production',
-    'burgessian',
-    'burgessish',
-    'burgfrieden',
-    'burghal',
-    'burghelm',
-    'burghgeshes',
     'burgla',
-    'burglar-proofing',
-    'burglar-trap',
-    'burglaria',
-    'burglarise',
-    'burgler',
-    'burglers',
-    'burgles',
-    'burglin\'',
-    'burgomeister',
-    'burgondes',
-    'burgoyne/garage',
-    'burgoynes',
-    'burgred',
-    'burgues',
-    'burgular',
     'burgund.',
-    'burgundionum',
-    'burgundy&rehy;toned',
-    'burgundy-flavor',
-    'burgundy-vino',
-    'burgundy/saffron/green',
-    'burgwin',
-    'burh',
-    'burhou',
-    'burial-at-sea',
-    'burial-cave',
-    'burial-chamber',
-    'burial-chambers',
-    'burial-dump',
-    'burial-ground',
-    'burial-grounds',
     'burial-mounds',
-    'burial-places',
-    'burial-service',
-    'burian',
-    'burians',
-    'buric',
-    'buridan',
-    'buridda',
-    'buried.',
-    'buringh',
-    'burion',
-    'buriram',
-    'burit',
-    'burity',
-    'burj',
-    'burjan',
     'burkas',
-    'burke/cherwell',
-    'burkeite',
-    'burkel',
-    'burkemo',
-    'burkert/instructor',
-    'burkhard',
-    'burkhart',
-    'burkhauser',
-    'burkhill',
-    'burkian',
-    'burkin',
-    'burkinabes',
-    'burkitt-like',
-    'burlam',
-    'burlaps',
     'burlend',
-    'burler',
-    'burles',
-    'burlesca',
-    'burlesco',
-    'burlesk',
-    'burlettas',
-    'burley/economic',
-    'burley/planning',
-    'burli',
-    'burlies',
-    'burlin',
-    'burliness',
-    'burlingham',
-    'burlton',
-    'burlton/oxford',
     'burlwood',
-    'burly-looking',
-    'burma-siam',
-    'burmanising',
-    'burmilla',
-    'burmingford',
-    'burmola',
-    'burn&rehy;in',
-    'burn-',
-    'burn-bags',
-    'burn-blisters',
-    'burn-ear-rar-noos',
-    'burn-in-the-gut',
-    'burn-like',
-    'burn-tested',
-    'burn/gloucestershire',
     'burnable',
-    'burnages',
-    'burnard/mad',
-    'burnby',
-    'burncoose',
-    'burndige',
-    'burne-jones-face',
-    'burne-jones.',
-    'burned-black',
-    'burned-but-browned',
-    'burned-over',
-    'burned-through',
-    'burnell/olympic',
-    'burnells',
-    'burner-you',
-    'burner/vaporiser',
     'burneside',
-    'burnet-leaved',
-    'burnetii',
-    'burnettodesmondism',
-    'burnetts',
-    'burnfield',
-    'burnham-on-bloody-crouch',
-    'burnhams',
-    'burnhouse',
-    'burnier',
-    'burning-at-the-stake',
-    'burning-cats-alive',
-    'burning-eyed',
-    'burning-glass',
-    'burning-ground',
-    'burning-in',
     'burning-pains',
-    'burning.maastricht',
-    'burning/and',
-    'burning/the',
-    'burningly-cold',
-    'burnished-steel',
-    'burnisher',
-    'burnley-born',
-    'burnoist',
-    'burnous',
-    'burnouse',
-    'burnout.',
-    'burns-and-you-know-what',
-    'burns-anderson',
-    'burns-crosson',
-    'burns/aea',
     'burns/security',
-    'burnses',
-    'burnstall',
-    'burnstein',
-    'burnt-',
-    'burnt-arse',
-    'burnt-bones',
-    'burnt-orange',
-    'burnt-over',
-    'burnt-palace',
-    'burnt-phosphorous',
-    'burnt-sienna',
-    'burnt-umber',
-    'burnt_in',
-    'burntisland-granton',
-    'burnton',
     'burnup',
-    'burnwood',
-    'buroa',
-    'buroe',
-    'burokevicius',
-    'burokhof',
-    'buron',
-    'burovoi',
-    'burpee',
-    'burpman',
-    'burpy',
-    'burr&eacute;e',
-    'burr-brown',
-    'burr-granite',
-    'burr/rupert',
-    'burraburiash',
     'burrastow',
-    'burratos',
-    'burrells',
-    'burrender',
-    'burretti',
-    'burridges',
-    'burris',
-    'burritoville',
-    'burro-bushes',
-    'burroo',
-    'burroughes',
-    'burroughs&rehy;cult',
-    'burrow-livers',
-    'burrow.',
-    'burrower',
-    'burrowing-junction',
     'burrows-smith',
-    'burrows/carer',
-    'burrows/hunter',
-    'burrows/potato',
-    'burruss',
-    'bursa-except',
-    'bursapastoris',
-    'bursary-strings',
-    'burscough-based',
-    'burse',
-    'bursell',
-    'burst-mode',
-    'burst-pipe',
-    'burst-proof',
-    'burst-the-barricades',
-    'burster',
     'burstill',
-    'burstingly',
-    'bursts.',
-    'burswood',
-    'burtersett',
-    'burtini',
-    'burtless',
-    'burton&ndash;leicester',
-    'burton\'s',
-    'burton-brewed',
-    'burton-in-lonsdale',
-    'burton-is-an-expletive-deleted',
-    'burton-ness',
-    'burton-produced',
-    'burton-race',
-    'burton-taylor',
     'burton/former',
-    'burton/hercules',
-    'burton/taylor',
-    'burtoni',
-    'burtonians',
-    'burtonise',
-    'burtonon-trent',
-    'burtonshaw',
-    'burts',
-    'burtt-smith',
-    'burundi*',
-    'burundian',
-    'burundians',
-    'burunlar',
-    'burutu',
-    'burvill',
     'burwarton',
-    'burway',
-    'burwood',
-    'bury-manchester',
-    'buryan',
-    'buryded',
-    'buryenges',
-    'burying-ground',
-    'burza',
-    'bus&rehy;driver',
-    'bus&rehy;mastering',
-    'bus&rehy;route',
-    'bus\'ness',
-    'bus-bar',
-    'bus-bench',
-    'bus-boat',
     'bus-bodied',
-    'bus-compatible',
-    'bus-drivers',
-    'bus-fare',
-    'bus-fares',
-    'bus-miles',
-    'bus-only',
-    'bus-priority',
-    'bus-queue',
-    'bus-rail',
-    'bus-ready',
-    'bus-routes',
-    'bus-services',
-    'bus-steps',
-    'bus-strike',
-    'bus-ticket',
     'bus-tickets',
-    'bus-to-bus',
-    'bus-type',
-    'bus-width',
-    'bus/',
-    'bus/in',
-    'bus/laird',
-    'bus/train',
-    'bus_as',
-    'busa\'idi',
-    'busaco',
-    'busbar',
-    'busbars',
-    'busbies',
-    'busbridge',
-    'busby/thames',
     'busbys',
-    'buscando',
-    'buscel',
-    'busche',
-    'buscher',
-    'buschetta',
-    'buschmann',
-    'buscombe',
-    'busefi',
-    'busers',
-    'buses/in',
-    'buset',
-    'busfare',
-    'busful',
-    'bush-bucks',
-    'bush-clinton',
     'bush-delors',
-    'bush-drains',
-    'bush-dukakis',
-    'bush-hats',
-    'bush-inspired',
-    'bush-kaifu',
-    'bush-lined',
-    'bush-meets-gorbachev',
-    'bush-quayle',
-    'bush-ranger',
-    'bush-reagan',
-    'bush-telegraph',
-    'bush-walking',
-    'bush-whacked',
-    'bush-whacking',
-    'bush-work',
     'bush-yeltsin',
-    'bush.',
-    'bush/shearer',
-    'bush/team',
-    'bushbabies',
-    'bushel/hectolitre',
-    'bushenyi',
-    'bushfallow',
-    'bushfield',
-    'bushido',
-    'bushies',
-    'bushites',
-    'bushman-hottentot',
-    'bushmaster',
-    'bushmoor',
-    'bushra',
     'bushy-bearded',
-    'bushy-browed',
-    'bushy-haired',
-    'bushy.',
-    'busie',
-    'busienss',
-    'busiest/noisiest',
-    'busiger',
-    'busine',
-    'busineess',
-    'businesh',
-    'businesmen',
-    'business&mdash',
-    'business&mdash;as',
-    'business&mdash;or',
-    'business&rehy;government',
     'business&rehy;woman',
-    'business-as-usual',
-    'business-associates',
-    'business-base',
-    'business-building',
-    'business-community',
-    'business-cycles',
-    'business-education',
-    'business-end',
-    'business-ethics',
-    'business-europe',
-    'business-financed',
-    'business-focused',
-    'business-funded',
-    'business-government',
-    'business-head',
     'business-higher',
-    'business-hours',
-    'business-inclined',
-    'business-information',
-    'business-interest',
-    'business-journal',
-    'business-machine',
-    'business-management',
-    'business-mover',
-    'business-one',
-    'business-park',
-    'business-people',
-    'business-person',
-    'business-portfolio',
-    'business-priests',
-    'business-process',
     'business-profits',
-    'business-risk',
-    'business-start',
-    'business-study',
-    'business-suits',
-    'business-type',
-    'business.he',
-    'business.johnnie',
-    'business.market',
-    'business/commercial',
-    'business/design',
-    'business/division',
-    'business/economics',
-    'business/education',
-    'business/personal',
-    'business/professional',
     'business/professional/resident',
-    'business/project',
-    'business/residential',
-    'business/school',
-    'business/social',
-    'business/strategic',
-    'business/work/',
-    'businesses&mdash;the',
-    'businesses.they',
-    'businessgram&mdash',
-    'businessland',
-    'businesslike.',
-    'businessline',
-    'businessman-fraudster',
-    'businessman.',
-    'businessman/touring',
     'businessmen-',
-    'businessmen-buyers',
-    'businessmen-politicians',
-    'businessmen.',
-    'businesswear',
-    'businness',
-    'businsessmen',
-    'busiri',
-    'buskaid',
-    'buskaround',
-    'buskers.a',
-    'buskerud',
-    'busket',
-    'buskined',
-    'buslogic',
-    'busmaker',
     'busman\'s/policeman',
-    'busmanov',
-    'busness',
-    'busonians',
-    'bussaco',
-    'bussan',
-    'busschers',
-    'bussi',
-    'bussi&egrave;res',
-    'bussiness',
-    'bussitil',
-    'busson',
-    'busst',
-    'bussum',
-    'bust&mdash;up',
-    'bust-bodice',
     'bust-boom-bust',
-    'bust-booster',
-    'bust-enhanced',
-    'bust-out',
-    'bust/chest',
-    'bustanil',
-    'bustard-like',
-    'bustek',
-    'bustier-style',
-    'bustier-topped',
-    'busting_out',
-    'bustino',
-    'bustion',
-    'bustle-backed',
-    'bustler',
-    'bustlers',
     'bustless',
-    'bustlines',
-    'bustmdash',
-    'busto',
-    'bustyhill',
-    'busuness',
-    'buswatchers',
-    'buswell/heart',
-    'buswell/manager',
-    'busy-armed',
-    'busy-body',
-    'busy-ish',
-    'busy-lizzies',
-    'busy-seeming',
-    'busy-work',
-    'busycon',
     'but&rehy;toned',
-    'but\'n',
-    'but-benjamin',
-    'but-for',
-    'but-for-the-grace-of-bevan-there-go-i',
-    'but-it',
-    'but-the',
-    'but-when',
-    'but_as',
-    'but_because',
-    'but_by',
-    'but_er_that',
-    'but_erm_for',
-    'but_erm_that',
-    'but_every_so',
-    'but_grown',
     'but_no',
-    'but_now',
-    'buta',
-    'butachlor',
-    'butadroka',
-    'butale',
-    'butan-1-ol',
-    'butanes',
-    'butanoic',
-    'butanole',
-    'butanone',
-    'butaye',
-    'butazolidine',
-    'butch-femme',
-    'butcher-in',
-    'butcher-like',
     'butcher-shop',
-    'butcher/gloucestershire',
-    'butcher/houses',
-    'butcheries',
-    'butchermeat',
-    'butchersick',
-    'butches',
-    'butching',
-    'bute-based',
-    'butele',
-    'butenandt',
-    'butes',
-    'buteshire',
-    'buteven',
-    'butfour',
-    'buthal',
     'butharlyp',
-    'buthe',
-    'buthelelzi',
-    'buthus',
-    'butier',
-    'butinone',
-    'bution',
-    'butism',
-    'butjeman',
-    'butko',
-    'butler-style',
-    'butler/chartered',
-    'butler/home',
-    'butler/marco',
-    'butler/mayor',
-    'butler/national',
     'butler/pa',
-    'butler/scottish',
-    'butler/stable',
-    'butleri',
-    'butlerian',
-    'butlery',
-    'butley',
-    'butnothing',
-    'butobarbitone',
-    'butomus',
-    'butoxi-ethanol',
-    'butr',
-    'butros',
-    'butrus',
-    'butsfield',
-    'butt-crammed',
     'butt-end',
-    'butt-indicators',
-    'butt-joined',
-    'butt-jointed',
-    'butt-joints',
-    'butt-kickin\'',
-    'butt-naked',
-    'butt-traps',
-    'buttee',
-    'buttel',
-    'butter-and-honey-coloured',
-    'butter-based',
-    'butter-basted',
-    'butter-blob',
-    'butter-blobs',
-    'butter-cakes',
     'butter-churn',
-    'butter-churns',
-    'butter-coolers',
-    'butter-cream',
-    'butter-enriched',
-    'butter-fingered',
-    'butter-fingers',
-    'butter-fly',
-    'butter-flying',
-    'butter-hands',
-    'butter-in',
-    'butter-maker',
-    'butter-melting',
-    'butter-muslin',
-    'butter-rich',
-    'butter-slicing',
     'butter-slippery',
-    'butter-soft',
-    'butter-wine',
-    'butter-won\'t-melt-in-your-mouth',
-    'butter-wouldn\'t-melt-in-her-mouth',
-    'butter-wouldn\'t-melt-in-mouth',
-    'butterballs',
-    'butterbeans',
-    'buttercookies',
-    'buttercrambe',
-    'buttercrane',
-    'buttercrunch',
-    'butterell',
-    'butterfat-adjusted',
-    'butterfat-rich',
-    'butterfats',
     'butterfill/consultant',
-    'butterflied',
-    'butterflies/garden',
-    'butterfly-',
-    'butterfly-blue',
-    'butterfly-bowed',
-    'butterfly-catching',
-    'butterfly-collecting',
-    'butterfly-lovers',
-    'butterfly-taps',
-    'butterfly-type',
-    'butterflyfilled',
-    'butterflying',
-    'butterflyman',
-    'butterhead',
-    'butterheads',
     'butteriness',
-    'butteriss',
-    'buttermaker',
-    'butterman',
-    'butternut',
-    'butterpat',
-    'buttersmooth',
-    'buttersoft',
-    'butterston',
-    'butterstone',
-    'buttersworth',
-    'butterworth-hayes/interavia',
-    'butterworth/employee',
-    'butterworths:1988',
-    'butterworts',
-    'buttery-rich',
     'buttery-sweet',
-    'buttery/crime',
-    'buttery/meningitis',
-    'buttery/national',
-    'butthey',
-    'buttie',
-    'buttigeig',
-    'buttigieg-scicluna',
-    'buttle/physiotherapist',
-    'buttleberry',
-    'buttler',
-    'buttlerley',
-    'buttock-bones',
-    'buttock-groper',
-    'buttock-licker',
-    'buttock-skimming',
     'buttocked',
-    'buttocking',
-    'button-all',
-    'button-bashers',
-    'button-carding',
-    'button-centre',
-    'button-down-collared',
-    'button-eyed',
-    'button-faced',
-    'button-flowers',
-    'button-holing',
-    'button-necked',
-    'button-opening',
-    'button-push',
-    'button-shaped',
-    'button-to-neck',
     'buttonback',
-    'buttonbacked',
-    'buttonbrown',
-    'buttondown',
-    'buttoned&rehy;up',
-    'buttoned-leather',
-    'buttonhole&mdash;but',
-    'buttoning-up',
-    'buttonings',
-    'buttons.',
-    'buttony',
-    'buttrace',
-    'buttress/rake',
-    'butts-out',
-    'buttsfield',
-    'buttyism',
     'buttymen',
-    'butu',
-    'butyl-based',
-    'butyldimethylsilyl',
-    'butylhydroquinone',
-    'butylhydroxy-toluene',
-    'butyrate:glutamine',
-    'buultjens',
-    'buunderkamp',
-    'buur',
-    'buxbaum',
-    'buxi&egrave;res-sur-arce',
-    'buxley',
-    'buxom-looking',
-    'buxomness',
-    'buxton/coombs',
     'buxtorf',
-    'buxworth',
-    'buy&lsqb',
-    'buy\'em',
-    'buy-',
-    'buy-direct',
-    'buy-in-bulk',
-    'buy-of-the-season',
-    'buy-out&mdash;assets',
-    'buy-out/buy-ins',
-    'buy-outs&mdash;vendors',
-    'buy-outs.',
-    'buy-outs/buy-ins',
-    'buy-price',
-    'buy-ups',
-    'buyability',
     'buyable',
-    'buyer-endorsee',
-    'buyer-groups',
-    'buyer-importer',
-    'buyer-notify',
-    'buyer-supplier',
-    'buyer-up',
-    'buyer/',
-    'buyer/drawee',
-    'buyer/drawee/acceptor',
-    'buyers.',
-    'buying-off',
-    'buying.',
-    'buying/',
-    'buying/marketing/selling',
-    'buyldyd',
     'buyline',
-    'buyo',
-    'buyreg',
-    'buys-in',
-    'buyt',
-    'buyuk',
-    'buyukmihci',
-    'buyurulda',
-    'buzfuz',
-    'buzgalin',
-    'buzu',
-    'buzuluk',
-    'buzz-checked',
-    'buzz-giving',
-    'buzz-inducing',
-    'buzz-terms',
     'buzz.',
-    'buzzanca',
-    'buzzanga',
-    'buzzard-based',
-    'buzzard.',
-    'buzzard/bedfordshire',
-    'buzzboard',
-    'buzzboards',
-    'buzzbomb',
-    'buzzer-call',
-    'buzzgiving',
-    'buzzi',
-    'buzzily',
-    'buzzings',
-    'buzzzz',
-    'bv130',
     'bva&mdash;paris',
-    'bvaf',
-    'bvd',
-    'bvdc',
-    'bverfgg',
-    'bvetmed',
-    'bvi',
-    'bvi-incorporated',
-    'bvm&amp',
-    'bvms',
-    'bvrb',
-    'bvs',
-    'bvv552',
-    'bw-box',
-    'bw-nfs',
-    'bw-services',
     'bw-tcp',
-    'bw.',
-    'bw/colour',
-    'bw35',
-    'bw5',
-    'bw6',
-    'bwa',
-    'bwaa',
-    'bwaaaaaaaaaaah',
-    'bwacelet',
-    'bwain',
-    'bwayla',
-    'bwbachod',
-    'bwc',
-    'bwch',
-    'bwciod',
     'bwd&frac12',
-    'bwd&lsqb;n&rsqb',
-    'bwea',
-    'bwebwenibure',
-    'bwimstone',
-    'bwindi',
-    'bwint',
-    'bwl',
-    'bwlch-y&rehy;ddwy-elor',
-    'bwlch-y-saethau',
-    'bwlch-y-waun',
-    'bwllfa',
-    'bwmb',
-    'bwp',
-    'bwrs',
-    'bwv',
     'bwv1027/1039',
-    'bwv232',
-    'bwv529',
-    'bwv534',
-    'bwv548',
-    'bwv564',
-    'bwv565',
-    'bwv572',
-    'bwv577',
-    'bwv645',
-    'bwv769',
-    'bww',
-    'bx-10',
-    'bx.the',
-    'bxb4',
-    'bxc3',
     'bxc4',
-    'bxc6',
-    'bxd2',
-    'bxe4',
-    'bxe6+',
-    'bxe7',
-    'bxf5',
-    'bxf7+',
-    'bxg6+&verbar&verbar;kd8&verbar&verbar',
-    'bxr-300c',
-    'by&mdash',
-    'by&mdash;1',
-    'by&ndash;pass',
-    'by&rehy;employment',
-    'by&rehy;laws',
-    'by&thorn',
     'by\'',
-    'by\'71',
-    'by-a',
-    'by-and-bye',
-    'by-class',
-    'by-elected',
-    'by-elections.',
-    'by-environmental',
-    'by-gesture',
-    'by-hand-of-bearer',
-    'by-himself',
-    'by-large',
-    'by-life',
-    'by-name',
-    'by-out',
-    'by-pass-a',
     'by-rules',
-    'by-streets',
-    'by-the-way',
-    'by-way',
-    'by-words',
-    'by.another',
-    'by.product',
-    'by.small',
-    'by/distribution',
-    'by1',
-    'by25%',
-    'by31',
-    'by_,_by_far',
-    'by_all_means',
-    'by_just',
-    'by_the_er_by',
     'by_the_er_by_the_er_by',
-    'bya',
-    'byains',
-    'byambyn',
-    'byamee',
-    'byaraagiyn',
-    'byards',
-    'bybee',
-    'bybrook',
-    'byculla',
-    'byd',
-    'byd&oslash;y',
-    'bydawell/leominster',
-    'byde',
-    'bye&ndash+laws',
-    'bye&ndash;law',
     'bye-bye.',
-    'bye-ee',
-    'bye-eee',
-    'bye-elections',
-    'bye-laws.',
-    'bye-names',
-    'bye-ways',
-    'bye.ep',
-    'byedale',
-    'byeee',
-    'byegones',
-    'byelarussians',
-    'byelection-winning',
-    'byelections',
-    'byelorussia-lithuania',
-    'byelorussia/byelarus',
     'byers.',
-    'byers/sculptor',
-    'byett',
-    'byeways',
-    'byfleet-based',
-    'byfore',
-    'byggdok',
-    'bygraves/kim',
-    'byj',
-    'byjenny',
-    'byk',
-    'bykhov',
-    'bykova-egorova',
-    'bylandt-rheidtovsky',
-    'byles/play',
-    'byline:blackburn',
     'byllynge',
-    'bymail',
-    'bymark',
-    'byme',
-    'bymoore',
-    'byn',
-    'byng-hall',
-    'byng-stamper',
-    'byngs',
-    'byong',
-    'bypass-lopper',
-    'bypass/railway',
-    'bypaths',
-    'byphenyls',
-    'byphonic',
-    'byram-wigfield',
     'byran-cum-sutton',
-    'byrch',
-    'byrdcliffe',
-    'byrds-obsessed',
-    'byrdsian',
-    'byrdsong',
-    'byrely',
-    'byrepresentatives',
-    'byrge',
-    'byrhtwold',
-    'byrnand',
-    'byrne/archaeologist',
-    'byrne/gloucestershire',
-    'byrne/hospital',
-    'byrney',
-    'byron.',
     'byroniids',
-    'byrozoan',
-    'byrte',
-    'byrth',
-    'bysacodyl',
-    'byshot',
-    'bysitter',
-    'bysshop',
-    'byssus',
-    'bystanding',
-    'byt&oacute;w',
-    'byte-ordering',
-    'byte-orientated',
-    'byte-put',
-    'byte-size',
-    'byte-string',
     'byte-to-byte',
-    'bytery',
-    'bytestream',
-    'byteweek',
-    'byth',
-    'bythe-book',
-    'bythorpe',
-    'bythotrephes',
-    'bytlm',
-    'bytom',
-    'bytwo',
-    'byung-ju',
-    'byw',
-    'byw29/100',
-    'byw80/150',
-    'bywaters/axiom',
     'byxfield',
-    'byzance',
-    'byzantian',
-    'byzantina',
-    'byzantine-romanesque',
-    'byzantine/moorish',
-    'byzantinische',
-    'byzantium.',
-    'bz658',
-    'bzlf1',
-    'bzns&mdash;deputy',
-    'bzns&mdash;viktor',
-    'bzzz',
-    'bzzzz',
-    'bzzzzzz',
-    'bzzzzzzzzzzz',
     'c&abreve;f',
-    'c&aelig;dwalla',
-    'c&agrave;hors',
-    'c&agrave;ndid',
-    'c&amp',
-    'c&amp;p.',
-    'c&amp;s/sovran',
-    'c&amp;sub4+',
-    'c&amp;w-flavoured',
-    'c&atilde;o',
-    'c&bsol',
-    'c&deg',
-    'c&dollar;1.4m',
-    'c&dollar;1.8',
-    'c&dollar;10,000',
-    'c&dollar;100,000',
     'c&dollar;100m',
-    'c&dollar;11.5',
-    'c&dollar;118m',
-    'c&dollar;125,000',
-    'c&dollar;14.3',
-    'c&dollar;142m',
-    'c&dollar;19',
-    'c&dollar;19.6m.',
-    'c&dollar;2.5',
-    'c&dollar;2.65',
-    'c&dollar;20m',
-    'c&dollar;250',
-    'c&dollar;29m',
-    'c&dollar;3',
-    'c&dollar;3.50',
-    'c&dollar;3.8',
     'c&dollar;30',
-    'c&dollar;300m',
-    'c&dollar;33',
-    'c&dollar;38',
-    'c&dollar;42',
-    'c&dollar;425',
-    'c&dollar;5.4',
-    'c&dollar;50',
-    'c&dollar;6',
-    'c&dollar;6.3',
-    'c&dollar;6.5m',
-    'c&dollar;660m',
-    'c&dollar;7',
-    'c&dollar;7.125',
-    'c&dollar;7.50',
-    'c&dollar;750',
     'c&dollar;8',
-    'c&dollar;8.25',
-    'c&dollar;8.75',
-    'c&dollar;83.2',
-    'c&dollar;9',
-    'c&dollar;9.2',
-    'c&dollar;9.5',
-    'c&dollar;993,000',
-    'c&eacute;ad',
-    'c&eacute;anne',
-    'c&eacute;ar',
-    'c&eacute;cillon',
-    'c&eacute;dile',
-    'c&eacute;ee',
-    'c&eacute;il&iacute',
-    'c&eacute;l&eacute;bres',
     'c&eacute;l&eacute;stin',
-    'c&eacute;lebrit&eacute;s',
-    'c&eacute;lestin',
-    'c&eacute;lestine',
-    'c&eacute;leston',
-    'c&eacute;page',
-    'c&eacute;phale',
-    'c&eacute;r&eacute;brisme',
-    'c&eacute;r&eacute;monies',
-    'c&eacute;rise',
-    'c&egrave;pes',
-    'c&formula;c',
-    'c&formula;n',
-    'c&gt&formula',
-    'c&igrave',
-    'c&lcub',
     'c&lsqb;5-fc&rsqb;tgg',
-    'c&lsqb;atholic&rsqb',
-    'c&lsqb;ommission&rsqb',
-    'c&lsqb;urate&rsqb',
-    'c&mdash&mdash&mdash&mdash&mdash',
-    'c&mdash;3',
-    'c&mdash;centre',
-    'c&mdash;no.',
-    'c&mdash;trustees',
-    'c&ndash;118',
-    'c&ndash;11s',
-    'c&ndash;125',
-    'c&ndash;130',
-    'c&ndash;45',
-    'c&ndash;46d',
-    'c&ndash;46s',
     'c&ndash;47',
-    'c&ndash;47a',
-    'c&ndash;47b',
-    'c&ndash;90',
-    'c&ndash;d',
-    'c&ndash;f',
-    'c&ndash;fbhz',
-    'c&ndash;fhav',
-    'c&ndash;fjec',
-    'c&ndash;flzo',
-    'c&ndash;fudd',
-    'c&ndash;gehx',
-    'c&ndash;ghav',
-    'c&ndash;ghlk',
-    'c&ndash;gibf',
-    'c&oacute;rdovez',
     'c&ocirc',
-    'c&ocirc;teau',
-    'c&ocirc;teaux',
-    'c&ocirc;telettes',
-    'c&ocirc;tes-&agrave;-bras',
-    'c&ocirc;tes-du-nord',
-    'c&ocirc;tes-du-rh&ocirc;ne',
-    'c&ocirc;tes-du-rhone',
-    'c&oelig;ur',
-    'c&ouml;lin',
-    'c&pound;normally',
-    'c&pound;s',
-    'c&racute;ecy',
-    'c&rehy;13',
-    'c&rehy;47a-90-dl',
-    'c&sharp;min',
     'c\'&eacute;tait',
-    'c\'-e',
-    'c\'an',
-    'c\'bridge',
-    'c\'est-&agrave;-dire',
-    'c\'m\'dore',
-    'c(&formula)',
-    'c(1s)',
-    'c(28)',
-    'c(3)',
-    'c(i)',
-    'c(ivitatis)',
-    'c(u)',
-    'c*****',
-    'c*******',
-    'c**p',
     'c*n',
-    'c*ne*',
-    'c++/views',
-    'c+0.c',
-    'c+c',
-    'c+p',
-    'c--c',
-    'c-.',
-    'c-09',
-    'c-100',
-    'c-100&ndash;3',
-    'c-112',
-    'c-119',
-    'c-11s',
-    'c-121',
-    'c-121c',
     'c-130b',
-    'c-130s',
-    'c-14',
-    'c-141s',
-    'c-145',
-    'c-1g',
-    'c-208/90',
-    'c-209/91',
-    'c-20h',
-    'c-29/91',
-    'c-3\'',
-    'c-334/90',
-    'c-358/90',
-    'c-3840',
-    'c-46d',
-    'c-47a-1',
     'c-47a-25dk',
-    'c-47b-1-dk',
-    'c-47b-35dk',
-    'c-47s',
-    'c-54d',
-    'c-54s',
-    'c-5a',
-    'c-6',
-    'c-6/90',
-    'c-6190',
-    'c-6841',
-    'c-75',
-    'c-85',
-    'c-9/90',
-    'c-90',
-    'c-9190',
     'c-9235',
-    'c-an',
-    'c-apolipoproteins',
-    'c-apoprotein',
-    'c-apoproteins',
-    'c-c-c',
-    'c-c-c-ares',
-    'c-c-c-corrupts',
-    'c-c-cambridge',
-    'c-c-car',
-    'c-c-common',
-    'c-came',
-    'c-canopy',
-    'c-car',
-    'c-casting',
-    'c-certainly',
     'c-cl',
-    'c-co',
-    'c-controls',
-    'c-cor',
-    'c-cotton',
-    'c-couple',
-    'c-d-xylose',
-    'c-dash',
-    'c-deck',
-    'c-ds',
-    'c-enrichment',
-    'c-erb',
-    'c-erbb-2',
-    'c-erbb2',
-    'c-erminal',
-    'c-fica',
     'c-film',
-    'c-fizz',
-    'c-fnqb',
-    'c-four',
-    'c-ftba',
-    'c-fyqs',
-    'c-gfpl',
-    'c-grsd',
-    'c-grsd-x',
-    'c-h-i-l-d',
-    'c-helices',
-    'c-helix',
-    'c-i-s',
-    'c-i=l',
-    'c-in-c.',
-    'c-in.',
     'c-isotope',
-    'c-jam',
-    'c-lab',
-    'c-labelling',
-    'c-language',
-    'c-machines',
-    'c-majorish',
-    'c-mos',
-    'c-movies',
-    'c-myb',
-    'c-myc/bcl-2',
-    'c-mye',
-    'c-n',
-    'c-oct-11',
-    'c-operation',
-    'c-oriented',
     'c-p',
-    'c-p-c',
-    'c-plus',
-    'c-polysaccharide',
-    'c-r-a-p',
-    'c-r-e-a-m-s',
-    'c-registration',
-    'c-rich',
-    'c-routines',
-    'c-shaped',
-    'c-shell',
-    'c-shield',
-    'c-site',
-    'c-span',
-    'c-spanners',
-    'c-src',
     'c-super',
-    'c-t',
-    'c-termini',
-    'c-u-r',
-    'c-ura',
-    'c-word',
-    'c-x',
-    'c.&amp;a',
-    'c.-a',
-    'c.-in.c.',
-    'c.-j',
-    'c.10',
-    'c.100&ndash;50',
-    'c.1013',
-    'c.1014&mdash;19',
-    'c.1015',
     'c.1016&mdash;18',
-    'c.1017',
-    'c.1022',
-    'c.1025&mdash;8',
-    'c.1031',
-    'c.1034',
-    'c.1085',
-    'c.1137',
-    'c.1150',
-    'c.1170',
-    'c.1170&ndash;1240',
-    'c.11s',
-    'c.1200&ndash;30',
-    'c.1226&ndash;1314',
-    'c.1245',
-    'c.1250&ndash;c.1500',
     'c.1270',
-    'c.1270&ndash;1324',
-    'c.1284&ndash;1300',
-    'c.1290&ndash;1320',
-    'c.1292&ndash;1336',
-    'c.1299&ndash;1356',
-    'c.1308',
-    'c.1318',
-    'c.1366&ndash;7',
-    'c.1370',
-    'c.1372',
-    'c.1380',
-    'c.1385',
-    'c.1396',
-    'c.141',
-    'c.1418&ndash;25',
     'c.1435',
-    'c.1456',
-    'c.1470',
-    'c.1471',
-    'c.1475&ndash;79',
-    'c.1478&ndash;1555',
-    'c.1490&ndash;1525',
-    'c.15',
-    'c.15&ft',
-    'c.1504&ndash;after',
-    'c.1516&ndash;47',
-    'c.1530',
-    'c.1540&ndash;1850',
-    'c.1540&ndash;50',
-    'c.1550&ndash;1640',
-    'c.1550&ndash;81',
     'c.1555',
-    'c.1558',
-    'c.1560',
-    'c.1560-1630',
-    'c.1575',
-    'c.1580',
-    'c.1580&ndash;90',
-    'c.160z',
-    'c.1610&ndash;60',
-    'c.1625',
-    'c.1631',
-    'c.1635',
-    'c.1645',
-    'c.1660',
-    'c.1660&ndash;1715',
-    'c.1660&ndash;1832',
     'c.1660&ndash;75',
-    'c.1660-1770',
-    'c.1675',
-    'c.1678',
-    'c.1682&ndash;c.1712',
-    'c.1687&ndash;1740',
-    'c.1693',
-    'c.1693&ndash;1762',
-    'c.170,000',
-    'c.1709',
-    'c.1710',
-    'c.1713&ndash;1775',
-    'c.1715&ndash;88',
-    'c.1716&ndash;27',
-    'c.1720&ndash;30',
-    'c.1732',
     'c.1735',
-    'c.1740',
-    'c.1740&ndash;1803',
-    'c.1749&ndash;1802',
-    'c.1750&ndash;1828',
-    'c.1750&ndash;1880',
-    'c.1750&ndash;1900',
-    'c.1750&ndash;90',
-    'c.1755',
-    'c.1755&ndash;1813',
-    'c.1755&ndash;58',
-    'c.1756',
-    'c.1770-1820',
-    'c.1775',
-    'c.1790',
-    'c.1796&ndash;1906',
     'c.18',
-    'c.1800',
-    'c.1814',
-    'c.1820',
-    'c.1821&ndash;4',
-    'c.1822',
-    'c.1826&ndash;1959',
-    'c.1848',
-    'c.1869&ndash;70',
-    'c.1870',
-    'c.1880',
-    'c.1891',
-    'c.1895',
-    'c.18th',
-    'c.1900',
-    'c.1914',
     'c.1915',
-    'c.1923',
-    'c.1937',
-    'c.1945',
-    'c.1945&ndash;64',
-    'c.1945&ndash;c.1962',
+)
+
+blocks_85 = (
+    '%\'upright$!.$%ed-up%!n$$head%$oles$$ing.$\'on-bury\'(le-sands&(/chilean&#ian)!s&!s$"s.$!z',
+    '(\'n-gibbs#&ukbasi$"me%%ising$\'ngarvik#!x"%marzo#$b\'s-\'%worth$\'-aimers(#ing&%ttack%#bay&&litzed&\'uilding',
+    '*!s%(carriers)$ying&\'huckers&)ollectors&%rater+!s%)destroyed\'\'tecting&&isplay%)fragments%$hoax%%laden&#ess%%maker',
+    '*#ing%%scare&(hattered&#kip&$tore\'$rike%&threat&#orn%&victim$!.$&/small$\'ardable\'!e\'-ier/navigator%$yite',
+    '$(e-shaped%&d-outs%$lles\'!i%*r-launched\'%style\'$type&"s.&!t%!t$&ifrons%"n\'&\'g-range\'%.mike%!x',
+    '\'!s$%maker$!o%"is%%klaat%"la%%niera$#rum$%scape$(yciferum&%oidea%&liidae#"er%!s#%fords',
+    '#%owski##ped#!s$$ztyk#"za"%n-bon$\'lecours$$mots#!.#%acure$%facio%#ide%#oux$"ld$!m',
+    '%"ia$"ne%\'za-pace$)partistes+!s$%r-law$!s%"ia%"se$&ventur%#ia-$#zza##bon&%niere$$rest',
+    '$&hester#"d\'$!-%&buyers%\'dealing%%elute%$like%&market&%obile%\'raiders\'$ting%&street\'#yle%4theme-that-never-was&&rading',
+    '$)/finalist%$gilt%,obstetrician%(resident%&skylon$$arev&%tchuk$&edness%!r$(ieuserie%;ng/non-bonding/anti-bonding\'#ton$$jale$$maid&!n',
+    '%!r$"s.%$ters$!t$$ware&!y%$oman#2e&rehy;snafflingly$!-%&a-fide&#che(%ingly&+gainst-bone-&muscle%%based',
+    '&\'ruising%$cage\'&rvings&%haste&$lear&\'oloured\'"mb&)rackingly%$damp%$face&&ingers&%ramed%(grinding%&healer&#ole',
+    '&(uddering%$like&&oading%\'melting&#ill%$poor%%rated&%idged%\'selfish\'%tting&%hadow&*plintering&,trengthening(\'uctures&)ubstitute',
+    ')$ning&$ired&\'wisting%)whiteness&&orkers&(renching%$yard$$.the$(/chilled$"en$%fiers&"re(!s$$heur$"ji',
+    '$\'rfydies$\'s&mdash%&heaths$%white#\'fire(s)\'!.\'"s.#%g-jun$$arde$$bong$(chundong$"hi$!i$\'o-bongo+$land',
+    '$$race$#ton#+ham-carters(\'hristie\'$type$$eure$%omous#\'iarense$"ca%"co$-facio-lugiato&#tii&#zio%\'ication$&labour',
+    '%%segna$(or-hoyer%!s$#tas&"te\'"is%!i%"ta%!z#$jela$\'ourdino#(k-famine$\'busters$(ersville$%idorm',
+    '#$lieu#&mahrat#\'n-based%\'cologne$$.the$\'/berlin%)frankfurt$&a-fide%$fous%#ire%!r$(e-bouche%*/wiltshire%$fons%$lame',
+    '%&maison%$nsia%0r&lsqb;1970&rsqb&\'-walter&\'/celtic\'&farmer\'%owner&!s\'&trasse%%soeur%%t-lid)"ke&!.&+i&egrave;re&!t',
+    '(&/marne%#vie$%heure$!i%%chsen%#ere\'!s&"ux$"ke$%ymuir%1rigg/newtongrange%#ton#%onian$"sa#&repaux',
+    '$,er-philhower$$ford$,or/committee$%telle$!u#%tages$#ddu$"je$&newydd$#ron#+us-earnings&$wise%+/commission&&prizes%*es.already',
+    '%#sed#\'villian##xie#\'y-jawed%&plated%\'skinned$"tt#!z$"ai%#nna$"er%!s$%ieeed"\'o&ndash#--boo-boo-boom',
+    '$$word##bok%!o$8s/knockers/charlies/tits$*y-trapping%\'charges%$trap)(greeting)#ped#"ch#"de$#les\'$niff#(ga-booga%#loo',
+    '$#ie-\'$meal((usicians&#man$$ying#!h#!i##jum#3k&rehy;distributive*&keeper*&stores$!\'$\'-a-year&%lbeit%$bank',
+    '&$ills\'&ndings&\'reakers%%clubs&&opying&#ube\'(m-record%\'dealers\'\'spoiler(\'troyers%&ending(!s\'%tries)!y&*stablished',
+    '*#ing&&inding&&ocused%\'holding&%ungry%,illustrating/"on&)n-advance($hand%\'jackets&%udges%4keeper/administrator&(nowledge%%label\'#den',
+    '*!s(#ing%%maker*!s(#ing\'$rket\'%tches%)nourished%(of-hours&!n%*productive(&vision%$rack&%eview+#ers',
+    '+!s%%sales\'%tchel&&ellers)#ing&$helf)#ves\'%rines&%orter&%tacks("ll*!s(#mps("nd\'$ores',
+    '%#the&%icket&$opic&#ype%%value%\'writing$!.%#you$(/bedtime%(cassette&0hapter/pamphlet/%\'library%)newspaper%0show/film/affair$\'bindery',
+    '$&centre%%overs$&dealer$&ed-out&%/sent%"nd\'#ing%*r-millburn\')nominated&#ing$,ie/snake-oil%!n&\'g-clerk(%halls(\'offices',
+    '%*sh-looking\'$ness$!k%#ing$$less&\'t-notes%#ine$0makers-sponsored&"n\'&#rts%&obiles$+publication$$rest$\'s&mdash+&;there',
+    '%!*%!-&)on-a-disk%)/journals&\'manuals&*newspapers%#afe&#les%#can%\'ellers.,#the%#hoe\'#ps.%$peed%%tands',
+    '%!y$$tree&#ust#%lean.%!r$$igal$!s#"m-%)and-slump%*ba-di-boom\'3ng-a-bang-booooooom%#chi(%-boom-6-chi-boom-chi-boom-chi%)hoom-hoom',
+    '%#led%\'to-bust&#ype$!.$+er/incident&(ang-like$$food$$iest%$ness$"ph$&shanka$!z#(n-doggle%#ish%%style',
+    '%(managing$!d%%atoon%$ocks$#ies$)oonoonoos$%panya%#ong$%sithi%"ri$$work#"oo%%-ring%$ooom)&mmwomp',
+    '#+p-boop-boop$!.$!s#"rd%!e$"er$#ing$-man/dietician#%sback$#eys$+t-regulated%(er/turbo%+ing/cutting#0t&rehy;strapping$)-bindings',
+    '&#oys%$clad\'&eaning\'$oser&&rusher%$deep%%faced&#ull%$heel%$iful&!n%$lace&&eather\'"gs%%maker',
+    '\'#rks%(polished&%rints%)repairers%%sales&%haped&%prigs&$tuds%\'tapping&#ime&"oe\'!p%$worn$%brush$!e',
+    '$$face%"ul$*h-fighting%+/bookseller&/director/oxford&$john&0vice-chanchellor%#bay%"im%,royd/speaker)$ists%%ville$,le-wilbraham&;gging/piracy/counterfeiting&"ss',
+    '&!d&"ng%#oad$&making$"on$\'packing$%s/and&%socks%&craper+!s%"en%$oles&!n%$teps&&rapped',
+    '\'#ing$&y-type#\'z-allan$0e\'n\'barbiturates%\'-driven&\'induced%!.%"ry%!s%!y$#ier%"ly%$ness&\'g-shops$#ler',
+    '")p-derived##eep#)hutatswna#.pelagriculture#\'romoxol#"sy#&urgois$)thatswana#!x"/quer&oacute;nes"&r-ring#+/consultant#"ac%#eva%#hio',
+    '$!m$!s%#sus$#tto#"be%"ly$#one%&rygmus#$cham%(grevinki$!k%!e#$dado\'!s%!n',
+    '$\'eaux-la)(merignac)%paris(%/plum%!l&%aises&#los%2r&rehy;formalities&!\'&\'-border\'(controls(&rosser.!s,$ings\'(dwellers',
+    '\'$goer(%uards\'$line+!s\')officials\'$wars(#ork\'$zone&$eaux&#in\'&)line-case&%s.for&\'width=3%&s-type&"ly',
+    '%!z$#ier&!u%!n$!j$!l%#and%"ey$#olo$!s$#uas$$well#,e&mdash;that%(rehy;dom$!\'',
+    '%#ins%&minded$)d-looking&\'o-meter%"ly%,om-relieving$#ens$$hold\'&e-flow\'#ing$$llii$&ogadus%\'nymphon$%sford%#ome',
+    '$!y#$ford#*g/imperial$"as$-erhoff-mulder$"hi%!s$!i%#oli%!s$$nine$$ogna%$novo$"ue%!s',
+    '%&noddin&%uddin%$usen#!i$%chill$"es$+ng&rehy;bit&4-but-sometimes-funny\'"my\'#set(\'ounding&,/unhumourous&#est$#sov%#tan',
+    '#-kel-en-schaft%!n&"au$!h#+land/martin$!e$#ick#&m-reid$$anis$#uth#,n&rehy;again$!-%&again\'*!s%+oppenheimer',
+    '%$rich%\'squalid$\'.joshua$(/hatched$&:otley$"at$(eo-based%!r&!s%"ss%!t$&freund$#ier%"ng$!s',
+    '$!u#"o\'$&budhur$*evi&cacute$#gon%&ravian$"ko$"ma$*n-graphite%"dy$#oah$#ros$&scopes%\'ilicate$#uch',
+    '((specific\')/district\'%muir.\'"s.$"va&!c%#ets%$icka&!k&"ts$!w#!r$%achos%%daile%"ni',
+    '%!l&!l\'!i%#red$&ingdon$#man$$obol%$meus%$ughs%"w.&*/beg/steal&8ed/lexicographer/current\'"r\'(,-governments&/ing-requirement',
+    ')"s.$#uso$!y#!s$"ay$(cht-belt$(eholders%#llo$\'holders$#man$!o$\'t-smith%&orffer#!t$%aceva',
+    '%#ers%%wicks$#ier$\'nyansky&"ik$&olazzi&$otti#&ujerdi$&sewicz%$sian$!t#"ve#&witzky#!z$\'acchini',
+    '#-an&ccaron;ica%"ka\'&-krupa&3i-petrovac&mdash;in%%quets$$vern#%berry$#ury#!c$%aglia%$rhyn&"ne$&h-like&$made%*/blaupunkt',
+    '%!e&!k&\'rvilles%#ian$"oe%"li%!m%%reale%\'trecase%$vich$!q$%ubban%"en#%evski#"ha',
+    '$"ed%!r&+/gamekeeper\'&stolen$&intang$#off##ian&!s$+gran/sennen$&ljevac$$nney%$oski#!k$"et$"op',
+    '#$nawi$/ia-hercevgovina+\'ogovina*)zegovinia(+zercegovina&&n-born((croatian(&muslim(%serbs&!s##ola$)m-buddies&&friend&\'heaving&)thrusting',
+    '%"es%%iness$#ngo#"s-%#boy%#eye%(follower%!i%+subordinate%$wren$\'/boxing%$have%"pa%+subordinate$#age',
+    '$$chen$"en%,s&mdash;call&$-but&$:the%%worth$&ington$#let$"om$#uet%#nga#$tall%+n-al-amarah&*/susangerd&$zade',
+    '$#ik-%"n\'$)ock-smith%+n&ndash;new&%-born\'%irish\'$quay&!/&&iensis#%ullow#$vigo%!l&"le(!s#\'wednack',
+    '&\'l/union\'2s-kelso-tweedmouth\'!y$#ith$#ood%*rth-toller(!.(0/physiotherapist(!s"+t&rehy;tome##\'er#$-bot$#fly#!.#%anica',
+    '(!s\'"ks\'!o\'"um&"se(!d\'+t-companion(!.&$zing%&omancy%#tic$#rgo$!s#"bs#&ch-job',
+    '%&ed-job("up%#way&#ork#!e$"hs$!k$$leur%"ho$#nde$!r%"el%#ing$"ti%$ourt',
+    '#%field#\'h&mdash*$;yet$$-and$".l$$/and$"em%)r-headed\'&*ed_so_long&"im&"s.&#way$#rio\'(cephalus\'%lepis',
+    '$"un$(wellbank)%ridge$*y-dwellers%!/#&icelli$$ller$!n#"na#7olph-without-aldersgate$!m%#ian%!s$"ny$#rok',
+    '%,tis-affected("ed#\'shabelo$!y#(t&eacute$"ae$"em%!r&,ill/allsport)!s&!s%!s&$ford*\'-newark&#ini',
+    '%#ger&%hofen%$neau$!l%!a%+e&rehy;nose&(-bashers*#ket)%ttles(%londe($uyer\'&covers\'\'dungeon\'#end(#tte',
+    '($ight,!s\'&garden\'&loaded\'$nose\'%palms\'&rather((ecycling\'\'scarred(%tores\'(throwing(#ype\'"up\'&walled&$bank',
+    '&-d-conditioned("in*)-scotland&%field\'"ul&1neck/growth-cycle&"s-(\'of-piss\'#ham&!y$+om-crawlers\')fermented(&ishing\'\'growing\'\'lurking',
+    '\'+of-the-pile.%range\'(pinching\'$rate($ight\'*slippering(\'panking(\'wimming\'&to-top\'#up.)%wards("se\'%water(\'rappers&!.',
+    '&(ley/head-#lth*\'trainer\'#ine\'!y&$most&$s-up\'"et\'$pins\'"up&#up\'$$rall%#ell%#ill$!s',
+    '\'\'/dexter##ulf%+ism.experts$!r##vay#&wright"*u-arreridj$#bou#&alapha%"em$$moud$#ziz#"be%"rc$#lik',
+    '$%halov&"nt&(rdhealth("on%*er/british((hereford\'#eau($sque&!s\'/-du-rh&circ;one.(ocirc;ne-#one%!o&$ucha$%icaut',
+    '$%kaert$*l&eacute;s$"ot#"da$"ec$%iccan&"ea%"ns$%jelal$*oir-church%!n%\'uresque#"er#%farik$#fan',
+    '%!e$#tas#3gainvillaea-covered/\'fringed%"rd%#tsa$&eoisie%"ts&"te$-herton/sunday%#ing%.t-and-paid-for\'$back\'$deal&\'/rented',
+    '&!a$"ie&$nage$\'uereaus#(iali-see$#lle#%jdour#%kheir%#ima%%reiss##lac%,ng&egrave;re\'#ere)#ies\'#ist',
+    '%!y$$bine$#den&\'r-based(&filled(&hopped(&lumped\'&choked\'#ers\'#ous$-engerochromis%%s-eye&#tln%\'vardier&*ers&eacute',
+    '$"ia%%ngrin%!s$%kheir$*l&egrave;e%"in$#oir%$ulou$&t-like%#ham%(ing/film%(on/coach(!k#"ma$"er',
+    '#(nce-free\'*it-off-the\'(lighting&2r&rehy;restriction\'&-happy%#in\'\',g/stretching("ly(!s$%d-dna&)for-glory&"in&"mg&"up%\'/border',
+    '%"ar\'&ies.in*%/room\',y&rehy;stone(!\'()-blurring)&fixing)+recognizing)&stones)-transgressing%"es%"is%$ries%%stone$#eau',
+    '$&naphon$*ty-hunting&!s#+quet-making\'"ed%\'inistes#&rajnee$$baki%+on-habsburg($type&%ulenc$%deaux&%illes&.s-ogouliguende&"ux',
+    '%!j%#ons$!e%#ima$)g-de-four%"as%(d\'oisans%#eau(!d&\'ois-led)"ed)#ie\'+\'-relied+#.14\'!t',
+    '(#sie&(t-drancy%%inion%$neuf%$oing%$uina$#his$"je%$olly$#man%#ont$-ne&rehy;mouth&&-mouth\')wilkinson&+/headmaster',
+    '&+mouth-based,$hurn&&sports%%mouth%#ous%!s%#ton$$ouba&"gh$+r&eacute;es%$eurs%!i%!y$!s%-idi&egrave;re',
+    '&%ufler$5ton&rehy;on-the-water\'=-on-the-water/gloucestershire\',/oxfordshire#%scade$!e$$iris$$nina$$quel$"sa%"et&!y%*od-valadon$$tany%"ed',
+    '\'\'/farmer#%tades$$boul$&eflika%%illes(#ier%$loua$-ique/souvenir("s.$#oir%)nn&eacute\'!e&!s%!s$,ron-charland',
+    '(\'boutros(%gahli%$uche$!u#+vet-ladubay$"ia$!y#!w$"es#$yiki##zah$!i%#ane%!d%$gues',
+    '&!d$$rian#)ell/coach$!n##ill$\'ne-eyed&"ly%%gford#$rils#$umin#$ver-&#in\'#!y".w&lsqb;ed&rsqb$(rehy;tie',
+    '#\'-backed$$case$$down%%rills$#end$%first$$grip$$like$%maker$$ride$%shock\'!t$$tie-&#ful&!p',
+    '$"up$%waves%%indow#"an$-rt&rehy;using#&bridge#&cliffe$#ock#*d/amersham&(ylesbury%(bicester&(letchley\'%oxham&\'odenham&$rize',
+    '&(rowmarsh%&didcot%\'hampton&\'eathrow%)isleworth%*kidlington%%leeds%#raf%(sandford-*-on-thames&)hrivenham&(outhmoor&\'tanford%%upper\'#ton',
+    '\'&rgrave\'(tchfield&)estonbirt&&idford&\'oodford$&endale&#tii$(lerising("ze$!y#)e-baiting%)holyfield%%lewis$-d-and-upright$*l-emptying',
+    '/"ly&\'opening&\'quaking&*regulating(%lated&$wall%!l$&n-pope&$webb%&/carer&)presenter%$hill%#oid%!s&%-sung',
+    '$"r\'&!\'%&-bird.\'&oiling\'\'uilding%%chalk%$dean%#ham%!i%-s/deaton/turk$(sy-bente$%y/eye#$fins##gie$$reen',
+    '$$eads$,ill/managing##ie\'%\'-fandom&$like%!r%$sque$#ngs#"l\'$%-head)"ed)!s%$room%*sterilizer%$type',
+    '$(/servers$\'a/floor%$rama$$eaze%"r\'&&-style&\'/mother\'$swan\'&thames&&hatted&"s.%"s.&$/kit&$land%-y/oxfordshire',
+    '$$fish$$head$#ine\'!s&\'g-alley(%green$!y#-man/reporting&!s$"er$$onde#*n/chairman$"de##saw$#ers',
+    '%#ots$,prit-fashion(!s$$tave%"em#*tell/torpy$\'hruster$"ie#$vale#"ys##zer"*x&mdash;in#!-$"ad%$rrow',
+    '%#eds$(carrying\'!s%%hairs%&ompass$%edged$%flues%$olds%#ull$&girder$%hedge$#ing$\'jellies%#ust$&leafed',
+    '$%maker%&essage$#off\'$ices%"ut$\'pleated$%rooms$%shape&%ifter%&panner&$rung%%talls&.ick-and-banana%#wap$\'tickers',
+    '%#omb%#ype$\'walking%+ithin-a-box%#ood#$.one#&/block$\'english$$hype$\'lozenge$$vase#!3#*all/brenda#%board%%rough',
+    '$)r-puncher&&shorts&.versus-puncher#$file$$ront$#uls#%grove#)hall/road$#ill#$iana$"er$!n%"\'.%#ess%\'g-booth',
+    '\'%glove,!s\'&lesson\'\'matches\'*programmes\'$ring\'$type#%kites#$load##men#%rooms#(shifters#$well$$oods"(y&eacute',
+    '#"\'\'$!z#!-$+and-his-dog$&babies&!n$&genius%.irl&rehy;siren%"od%%unner$$hero%"is$.lance-corporal%#ike$)outfitted',
+    '$(preacher&\'oducing\'"of$%racer%%escue$(scoutish%&ervant%&oldier+!s&\'mething$(to-alien$.who-was-shaman%#ord#!/$+girl-friend',
+    '##_as#"ac%\'&aacute%!k$!n%!t$&rskaya$!u#\'ce-codd%\'/reuter%!s$#hik%"uk$$ott.\'$/b.l',
+    '(,free-produce$!s#*d-rochfort$\'/airman%)presenter%)technical$!a$!e$%field##est$"tt$!z#!f$*riend-wise)!.',
+    '#$hill#+ish-looking$"ts#-land/lollipop$"e.%(/banbury&\'doctors&&family%"sk$"il#"ns#"o\'$7-larrikin-rugby-skiving$#ing#%power',
+    '%&n\'toys$!-%$only&"wn%(produced%&stones%(together$+.remittance$!/%*guys/mates%#men%$neil$%:four$$_for$)enberries',
+    '\'"es&"wn#!t$$horn#!u"*za-edwards#$berg##eat$#tti#%ionek#$kurt#"on$#uki##son#"za',
+    '!"p*"\'-alaska%&liance#&bonded#\'donated#%shell$(ponsored$&tatoil"#/br#&number#%sohio#$turn""10")552346526)"50',
+    ')"81*!7)"95*!9(#601*!5*!7)"36*!9)"42)"55*!7)"69)"77)"86',
+    '(#712*!3)"36)"61)"75&%61497(#620"\'america#!s""ca#+c-sponsored"#dal"%group"!h##ils',
+    '"!l"-o/furtwangler$\'giulini$\'haitink$&maazel"*pppprrrrrr#!t"!q""rs"+s/macmillan"$ught#!t")venezuela"%x-gom#(colombia',
+    '!%q-123""/l"!m!(r&agrave$\'uml;ndi#*eacute;laz*$mond$(circ;che$)grave;ves#+iacute;zola#(ouml;nte#&uacute$.uml;cke-museum+!r*$ners',
+    '(&innich(&nnichs(+sselerplatz"#\'er"%(lmr)#"s)#"w)"$-116#%built#&design#%owned#(promoted#%speak%\'onsored"&/leeds',
+    '"$20ms#"26"!3#"64"!6"#700"+a&ndash;ket#!-$\'burners(#ing$$size%$tyle#$aang$$chit$!i',
+    '$#kin$$shee#%bagon%&ntbark\'#ers*&trasse\'"ia\'!s("ia&%zonen%-zon/transport$#bin%!s$"en$\'ham-bmw',
+    '(&yamaha\'\'/jaguar\'!s$&ournes$%rooke#\'camonte%"ti$\'biopods$#cia$,e-and-a-half%!.%%field%.lets/necklaces%!r%+well-milnes',
+    '$!h%#ard%"er\'%/head\'!s%%iales\'#ria\'#ted&$oles\'(pod-like%&sycome%"ty%#ury%(ycephaly&%danio',
+    '\'%obius&&odanio(#ont&&podium(#mum&\'rhnchus(&ynchus$%kbill%!e&!d&*n-and-tree((battling(\'clothed\'"ed\'$fell',
+    '($town&!r&\'t-five-("to*+-instrument*%rches\'"s.\'#ted\'%ville%%ishly%4ley/northamptonshire)(sweetpea%*nell-based)!s\'"ss',
+    '$"on&"id#\'d-stone$#ano%"wn$$beer&"ry%$urne\'\'y/solar$%croft$"da&!n%#ell$!e%(n-harder',
+    '&!s%#was$)ford-born))liverpool(+/manchester($ians(\'on-avon$$hope$+ish-ellames$,laugh/besant%"ee&#igh&*y/firearms((merchant(!p',
+    ')$harp$$ocke%!n$%ridge)(/england$&shaigh\'(w/former)&sunday($gate%$port%$teet&"ow$#tec$(y/forest&(shooting',
+    '/!s%\'cardias%*metabolism%%odont%#pus%%seism#&e-head$$burn$!c$%ndlin$$park#!f$!f%$ords$5ield/northamptonshire',
+    '#\'gadocio%#nca%!r$&elonne$$gard\'(t-blodge(#ism%#ins$%insky$#man$#oli$!s$%uinha#$hams$#ims',
+    '&-n-&amacr;tman\'#adu(!s%$inic&!s##ich$+d-decorated&*reinforced&\'trimmed%$burn%"en&!r%$holm%$otti%"s.',
+    '$"is$$lles&"on%%ovsky%!u$#mah%"oh$0n&rehy;crunching%&\'s-eye%"-4&&acting\'"ir&%based\'&oggler(#nes',
+    ')"es\')ruisingly&$cell\'%overs\'\'rushing&(damaging\'%rain\'&&ectomy&\'fatigue\'$ever\'#ood\'%rying&&injury&$just&&matter',
+    '&\'numbers&$pans\'(rocesses&\'related(\'sonance&\'scanner\'\'hrinker\'#ick\'$nuff\'%train)\'etching\'&urgery&\'teasing\'%umour&$wash',
+    '\'#eak\'#ork%!.%!/&)principal/(/swindon&%right%+boxbatterer%%cases&%heese\'&ildren*!s%\'damaged&#ead)\'chester',
+    '%&growth%&killer%,less-seconds)"ly%\'s-trust\'7with-burnt-butter-salad&$tawm%&ticket%&washes$(s&eacute%!e$&thwell#%ke(s)%!-&$disc',
+    '&%force&$gear&#job&%light($ning&#pad\')edal-down&)squealing&$vans&$work%&/guard%$less&%ights&$oads%#men',
+    '$$hage$(ing-jets%%slava##lin#"ma%"hs$*ble-filled(%lined\'"s.$$fitt$"ha&"ld&#nda$&imunde%$sche',
+    '$%meier$"pt$!s%$ford%Khott&ndash;liphook&ndash;bordon&ndash;alton%$wood$\'well\'s.#&n\'-new$$-bin%$like$$acci%$ghed\'!s$$bury$\'caleone',
+    '&%telli\'!i%%epath&!s%\'h&mdash&(-adorned\')by-branch\'\'derived\'$even\'$less(#ike\'&office\'%plant(\'roduced\'&shaped',
+    '\'&tusked&+/department(\'ivision&7enfernsprechb&uuml;cher\'/s&mdash;similar&#iae\'#dai\'&ostoma&$lets\'#ike&$ship&$wood&\'yomyces$+d-conscious&&driven',
+    '&%level\'&oyalty&$mark&(new(ish)&\'related&,spanking-new%!.%!a&#ble&!o&#ris%!e&\'d-goods&)is-bardin&\'nberger',
+    '+"er-!s+$icum+!s\'%stein&"rs&$wijn%(ing-iron\'!i&!r%\'lerites\'"ss%%meier%$name%\'o-clift',
+    '&!s%$rood%"s.&!/\'&retail&&burton&$trup%%tzaeg%%wagon%*y-and-soda\'&bottle\'(drenched)&inking&%snaps$%foots',
+    '%(&auml;ne%"us%#wen$#ham$#iak%#cki%!g$"jo$!k$$lant$"n.%"am%"er%"is$!o',
+    '%+combe/south%$dale&"en%$gore%"ki%#ons%#tad&#ead&#one$*t&ocirc;me%*es-pearson%&hwaite%#ley%!s$%white',
+    '%$oods##pho#"re#*s&iacute;l$,ai&egrave;re%"to$,ee-li-en-say%$lton%\'n-faced$#hed&"et$%ilian$$mill%"us$(ov-based',
+    '&%cased&\'dialled\'$omed\'&resser&%ended&(finished-!r,#ing\'&ounder\'%ramed&&gonged&#hat)!s\'%ilted\'%ooped',
+    '&)lacquered&&necked&&plated\'(olishing&$reel\'&ubbing&\'studded&&tipped&$wire\'$orks%!.%+ac-le-grand%%bound%&castle%#ett',
+    '%$hats%(i&egrave&!a&!c&-ngton/swimmer%#man&#ill%&necked%&worker)!s$#ted$#way%#ell#*t&rcaron;i$"an',
+    '$"in&"ka%+s&rehy;lava$&kowski$%nford$&packer$(t/potato%%enham%$ices&"ly&&shings%&leboro%!y$%ukhin$&wursts',
+    '#%uchen$!d$*ghingbaron$%nherz&4oltz/gloucestershire%*schweigers&&teiner\'&onbury%$thal%$wald$%sebad%#ton#!v$$ance&"te',
+    '&\'lookin\'%#boy%%heart%$ness%\'ry.this$-ing-the-beach\'#ton%%ssimi%"tt$%o-2-0%!n%!s&&/wrens%#ure$0ura/programmatic',
+    '%"st$#ith$"ly$)n/student%$iest%\'y-armed#*xton-hicks#&y/west$!a$"er%!s$%field$$ings$!n%#ard',
+    '$&sgrove%#haw&"ow%"on$$tons#%zelle%,n-hussy-like&#all&$dale&#ing&!s$*ier/fitter%"l*&%-west&*/singapore',
+    '&#eno&1ian-administrated*$born*$made\'$enis&#ler\'"ia)!n$&landia$"os$"zi%!o""cw")dubudubum$0rd-incorporating',
+    '%-h-of-contract*\'promise&#.as&$wood$,d-and-cheese+\'ircuses*,no-chees-ily&\'baskets&%crumb+!s\'&utting&%dough&&eaters&$like(#ned',
+    '&$oven*!s&\'pudding&$roll("om&%sauce&(throwers&\'winners%&/cakes%(boarding\'!x%%cakes%%field&)ruit.they%"le',
+    '%%paste%-roll-throwing%#th-(%depth\'$wise%"un%#win($ning$!f$"gh%$well$(k&amp;st&*mdash;down&\'rehy;in+$neck',
+    ',#ime%*-and-enter(#gle&$back&\'clause.&$free&#ing&(surfaces&%times&%water%+/investment%#=on%)away-type%*beat-based%)down-john',
+    '&"th%*fast-burst*#set**television),/dining-room*\'english*%lunch/2/tea/dinner/supper)$less%%heart%(ing-even)#out((/winning("ly(%point',
+    '%"s.&$down&(pearean.-!s%(through\',G-assimilation-breakthrough-assimilation$"m.%0/gloucestershire$$nski$!r%&/lorry$#sal%%clete%%hears%-t&rehy;plates',
+    '\'+deprivation\'%feeds\'%pumps\'\'stroked,#ing&!.&(/ovarian&&erdays&&feeder&"ie&-s-in-question\'&ummers&%works&!y$#th-',
+    '\'&groups\'$lili\')snatching($pace\'(takingly\'+wind-spirit&$.the&\'alyser\'*#ing)"ze+!r&"e.\'&d-upon&\'holding&(ing&rehy',
+    ')%.test)3/coughing/sneezing/&$nach&(s/minute&%takes)&ing.as$)ut&eacute##bes$,i&egrave;res%!s#2ccio-conglomerates\'"le$!h%"ot%\'t/weill',
+    '$)kenbridge)$ough%%lands%#man%*nell-munro##dan$#din$"e/%$nhof%#vej$#gar$%icote$"un#(ech-clad)#oth',
+    '*"ut&*es-pockets(%maker$)d/mongrel-!s%%ehame&"th%$ing-)%place)\'station(*/bluebells%%lings%%s.and%$wise$$eath',
+    '$$kouw$#ley$&nbergh$$tish$$uwer$#ver$#ze\'&\'-filled(.rom-the-freeze&$.the&$less%"ie\'"st%"zy#$ffni',
+    '%#ort$!i#\'ganzona$#dan$#eon\')/goetschy$#uet\')-dassault($made#$haut$!m$#ony%#use#<i&dstrok;3amerkurj&ouml;kull$(bergstr.',
+    '$$dden%\'enstein$!g$(tenstein%$ling%%meyer#$kand$"er$#ken&!r%%ypoos$$ynge#%l/gec$#ade%"nd',
+    '$"ag$(er-david&(/catcher\'&driver%\'tennaci%!x$$hill$#nar%#ess$%worth#*n&rehy;ner$\'bachhof%#erg$&cethin%%helee',
+    '%&ekilde&"ll%&oncare$%idjet)\'primary$+nan/cleaner(-environmental(&talent\'"ds&"rd%!e&$nder&(rstrasse%(inkmeyer%#yng',
+    '$,t-williamson%%ford-%#ham%%onian%*wood-based$"va#&retons#&scello%!h%2ia-cremona-brescia(,rome-brescia\'!n%"ot$"is$$lich',
+    '$#san\'!e%$laws$/t&ndash;litovsk%%imont#%tagna$"ch&%i-ars\'"ll$$eche$$feld%#ord$&herhed*!e\'#ick',
+    '%"yn$"ia%,gny-sur-orge$$land$*on-smocked$(t-haynes%\'/dealer&$head&)volunteer%%enham&$snes%"le%"sy$$yard#"ue',
+    '$)ghel-like(!s$$illy$$kink$!n$!r%!d%"ne$#sch$%theur##val%"nt$!e%"nt$1i-pedi-kel-artoos',
+    '&!t\'!e%%cauda)"um&%oryne&$uspe%(dentatus%%folia%#pes%$tate&"y.%"um#-w-it-yourself%#pub(!s',
+    '$"by$#ell%\'r/clerk\'&dental&+y-sponsored(#tie$#in\'%"tt$"se%%ville%!y$"yn#!y$"er#%zeanu',
+    '$,hnev-gromyko)!s(#ian$!i$"kr%"um$#ner"!f"+i&egrave;re#!1#(an-child%\'/victim%$chon&"on%#ne.',
+    '%"za$%rarch%!d%"ed$$tore$%unzon#%bdale$*e-assisted&\'riddled&&takers%(ry/dodgy#2c-&agrave;-bracery%%bracs$&a-brac%$brac',
+    '%\'-parain$%gstow$$hard%"er%!t$!i$(k-a-brac&!b\'#int\'\'reaking($oken\'\'uilding\'\'y-brick&(coloured&&eating',
+    '\'%ffect&%faced&$hard&$kiln&$laid($ying\'#ike&%maker&\'on-edge\'%range\'#ven&&pathed(#ved&-red-and-white&&shaped',
+    '\'$ower\'$ruck&$wall\'#ide%$/air&%block%$dust%%earth&$d-in&$nden("on&$ttes%\'fronted%%house%&layeer',
+    '&#ike%$mans%)nell-type)!s%"s.%)wood/dodo\'\'rk-like)"s-%$ying$$ogne%"le\'!r\'!s%#nil%#urt',
+    '$&quebec#,dal-chambers&#led&!s$$ders%"ge$,e&rehy;to-be+&wealth%/\'s-dinner-party\'!/%$(pg)%$-bed&\'chamber&%groom&&prices',
+    '%"go&#roo)\'m/bride%%house%"ll%-s-in-the-bath&*head-style&%tones("we%#wel$$ford$+ge&ndash;a9-)carbridge-\'dulnain-%river',
+    '&!\'&)-and-golf\'(corridor/!s\'$fort\'&master\'#pin*!s(&layers+#ing($osts\',router-based+#ing(%ubber\'&saddle',
+    '(&pouted\'$work&%/city\'%falls\'\'tremolo\'$usaf\',village/road&&castle\'$ourt&"en&$gate&\'hampton\'$ead.\'%ouses&&keeper',
+    '("l6\'$orse)$th.w&&pieces(!n)!s&\'s-brook&$tina\'"te&,water/jockey\'#ood%)ing-loans%\'lington$$isco%"ty',
+    '\'$rein(%iders*#ing&%smith\'$uite&$walk&!y$#son$$well##ef-&%lived&&record%./specification%,case-bearing*$size',
+    '%!e&"rs%!g%)ing-paper(,/counselling%$lies&)y-married(&stated%\'wechsel%!y$#ger$#ish$$land%"ly$$nzer',
+    '%%field$#san%!t#+ffitt/rover#(g-of-war$.ade&mdash;over\'!d\'"rs&,ier-generals%#low%"ma%+nd-infested&%tines$)casterton$#gs/',
+    '&$maid$!h%"de%#est%/ouse/birmingham*$wife%-t&rehy;bladed&\'\'-faced\'(n\'breezy&$-bay(%eaked\'\'cheeked\'$dull\'%faced((eathered',
+    '\'(lavender(#ine)!t(&ooking\'\'painted($each($oint\'&witted(#ork&,/fluorescent\'$keep&!e\'$ned.)"rs(&ing-up',
+    '(&-green(\'/duller&%green&$life\'/y&rehy;coloured.#lit()-anoraked)\'dressed)&marked)(polished)\'shining(!.&\'on-hove(\'/dieppe)+rottingdean',
+    '(!1(#ian&&walton\'*ell/thames$$itta$$nell%$orth%#ull$!o$$ston$%uglio%!s#\'htferth%)m&aelig;r%#wig',
+    '$%endra$%inder$%mokun$#uni##kom$$sdal#%liant$%lance\'\'tissimo%#ian(#ce.*!s(,t&rehy;green/"so)&-white',
+    '+*uccessful/)+ly-executed,%taken,)varnished,&worked%%o-pad&#uin$#sin#*m-shadowed$!.$&acombe%!h%"rc%!x$#ble',
+    '$$mond$$pton$6scombe/gloucestershire%"ea#"n\'$)d/florist%*abellaspis%"ed%$isis%&leford&#ing%!y$&efield$/g&ndash;benefit%%-back',
+    '&)them-down%%er-in&"st%%hurst%.ing-into-being)(together%#raj%4ton/northamptonshire(!s$$haus$!i$(kengasse%$haus&$orst&$urst',
+    '&"ow%#men%,worth/former$,n/gloucester%"in$"ol$&quinho$%sbury%#den$#tec$%y-dry##one&!s%"ne%$vega',
+    '$&verian#(quetters#"re#!s$\'&eacute+";e,!s$#bin%!y$"ca%!o&"la&!w$!e%\'-soleil',
+    '%"es%"is$#fit$&igotti$)k-looking%+/relaxation%#est&!y%#ing&"sh$"se&#tts$#ter%)le-backed)&earded',
+    '(&headed(*moustached((stippled((tempered)%ufted(\'workers\'$brow%\'ol-bath)$uilt()kempinski($made\')/coventry\'\':friday&+w/bletchley\'!e',
+    '$&-based%)for-champ%%hater&#uns%%ragga&#ock%(ton-gant$%ag/hs%(in&mdash\'#\'s.\'#--a(-australia-new(%based(%china\'#.10',
+    '(#but\'#can\'!i%%matic%!n&"ia\'"ci&*nia-bodied)"ns(#cas)!o)"um($ques\'$nica\',o-americanus',
+    '%+x-excelsior$%chart$&e-lite%!l$%flick%#unk$*her-in-law%\'oldings$!i%!s&$cher)!s&7h&amp;commonwealthstill\'!\'\'!-',
+    ')(ppointed()brazilian*"ed((canadian)\'entered)&hinese)%rewed(\'derived*\'veloped)&rafted(+established(&french((invented((japanese(\'kuwaiti',
+    '(+naturalized((prepared*&oduced(,racing-green*$ised)%ecord)&ussian((sounding+"th($type($unit\').imperial($made\'!/((american',
+    ')"ec(&french(&indian(%north(\'western&#kis$$jobs$$knit$%o/dog&$mark%$nski&"um$#pol%#unk$$rail',
+    '$,tain-michael)\'trained&\'n/rally\'#ias\'#nia%$en-s\'#den\'#ham%"ic%*le-looking\'$back($rain\'$fish\'"ly&#ing',
+    '\'*/reporting\'!s$#vic$!z#&uhovec##ves##wax##xia$-ton-&gt;leeds(%based(#set#"za$"io$$zell"#kne',
+    '#"og""mb#!s"!n#"rd"&o&euml$/lsqb;the&rsqb;r#!\'#!.#!a$\'ched-to$+d&rehy;band-#sed,&rimmed+\'casting',
+    '%!\'%*-and-loose\'%ppeal&&basing\'#ean*!s\'\'ordered\'%rowed&$cast*#ing\'&hested($urch\'&rowned\'"ut&$fold',
+    '&&gauged&&headed\'%ipped&%jawed\'%owled&\'knitted&(lapelled\'&eaved.\'$obed&&meshed&&seated\'%heets\'&leeved\'$weep($ords',
+    '\'"ip&\'wheeled%\'/rector%$acre%$bank&)ent/brass%,cast-quality)$.the)\'er-type)$ing\',)-appeared)"le\'$ting&&lothed%#egg',
+    '&-r&rehy;minded\'.-than-standard%$fall&#old%#ham&#olm&-urst-that-was*)/customer%"ie&%sland%$line&$ooms&)y-brushed(\'defined%,mead/bristol',
+    '%%reach&#ibb%"s.&&ide-on&%lides%\'toothed\'"wn%$walk)!s\'\'y-bound(\'/island($s-on&%inter\'"th$#kes',
+    '%!h#.bdingnagarians$%inski%"ty$#urn#!c$$ante%"to$"ca&#rdo%$oli-)&eating$$hier&!s$*k-munchies',
+    '%"ed&$lsby(\'chiefer&!r&\'t-faces&$well%%field%$haus&#ole\'#ult%"le\'&-faced\'.bank/reporting(#eck(#ury',
+    '&!y%%stedt%&thorpe+0/gloucestershire%4weir/gloucestershire\'#lls#&danski$\'erbunds&#ers&#ies\'!p(!i%#tto$#ies$$korb',
+    '$%owicz$+rick/angler$$seam$#win%"of&"lf#$eder##ger$"ne$#uey%#ght%!h#&idered$"le$!n',
+    '#$kage%&health%*in-hearted%!j$$dorf$#e-i&%smith%&n-back\'%chord\',glass-topped\'%heart\'"in\'%kneed\'#leg\'&masted',
+    '\'&nailed(#ose\'&spoked(&temmed\'\'toothed\'&winded+$owed&\'borough&&hearts\'$urst&#sha%)r-dealers&(/dealers+#ing&)s-dealers',
+    '$$koli##lin%!o$&lachan%"ie%&y-less#)matificus$(b-orough$$elin&,l/auctioneer$(ide-cscl\'!.%&nation&&e-free%"us',
+    '\'\'/friend.!s($save%!y$"ma$!o%!-&.chloro-indolyl%(criptine%+deoxyridine*6uridine(brdu)-labelled1)-positive%&octane%%xynil$$pren',
+    '((/chelsea$!s%&berrow%&ground%$wold$"us$)wich/west#+n-yr-eglwys$*chiectasis\')oalveolar&-o-obstructive()pneumonia)(ulmonary\',constrictive\'"es',
+    '\'+provocation\'&scopes%(o-buster\'$hand&&buster&!m$&eirion%&scombe&#law$$gest%%niart$#ham%#ill$&ington$$llys',
+    '$$naya%#ley$%oslaw%)wski-like$%shten%#ton$,t&euml;-rail+"an%$euml%(oburgers&!n&&phobia&,saurus-sized,"es$#win',
+    '$#ydd\'$mawr$)ze-bladed($ound\'\'covered\'\'founder\'$gold\'&leafed("it\'*medallists\'#red\'&smiths(\'treaked\'&tinged*#ted',
+    '\'&winged(&orking&%/dark&$ness%"ie\'!r%\'y-green#\'od-bond&$care&$mare&)parasites&\'raising\'&earing\'%idden%$bank',
+    '%#ily&#ngs%%mares$&k-lime($ttle&$rose&&taylor%0/gloucestershire&#the%\'borough%\'e-baker\'\'haughey\'&little&!/&!i',
+    '&&r/west&\'s/rspca&!y%$head%*lands-type\'"wn&"et&(yn-based)$made(#ers%%meyer%%s-any\'$ward&)/grandson\'*headmaster',
+    '&#haw\'#ill("re&$ites&$tick\'#one%&thorpe&$rout%%ville%%weald$)m-covered&&handle&$like&&making&(wielding',
+    '%0/gloucestershire&%judge%$ball%%fleet%%haugh&%ouses%#lee%%sedge%$wade$!n%!s$%oklyn#!r$"da$%tigan',
+    '$%-like$"ha$#man$"na$!o$$sard%"et\'"te#$ters$.h-of-a-boyhood%(el-going($like(&owners(%style\'!.',
+    '\'#(s)\'+-and-sister($band($clan(\'general(%house("in(%lover(&masons((officers(\'usurper(\'workers(#you\'$/are(3sister/parent/child',
+    '\'#ish\'$less(*y-sisterly\'-s&rehy;unlike((-in-arms)%style(!.%#ger$!o$"zu#!u$,ck&egrave;re$(gh-based&!s&"t\'',
+    '\'-on/canonmills*)edinburgh)!s$"ht$%illes(!t$%lands$$mand$$nker$%ssais&#eau%#ter$$tman$#wer\'!s',
+    '$#zed#%vikov%$scan#&w-beat%(knotting%\'mopping%&ridges&&ubbing%(touching$#ard$#ers%)sminister$#ing%"tt$$less',
+    '&(rehy;bag+(knitting%(\'s(1986)%!-&2and-cream-liveried*%lilac&\'bellied*+y-buttoned.\'\'lotched\'$read&$clad\'&overed(!w&&earths\'(ncrusted',
+    ')#zed\'$reen&)jerkinned&&maroon\'$ouse&(panelled\'\'olished&&rimmed\'$obed&&shaded(#irt+"ed\'&potted\'\'treaked(#yle',
+    '\'"op&&violet&&walled\'%inged%%/adas\'%nimal&*beautician("st&\'captain(%reers\'*irencester\'\'otswold&$dark&&editor&+green/black',
+    '&$head&(industry&:jackson/thorogood/williams(#mes\'%ockey&&kidnap&(managing&%nalgo&&oxford,%shire&-parliamentary)"ty+%-goer\'#lay\'\'rincess',
+    '($tail&(scottish\'/ecretary/oxford($nior&#tan\'%hames(!e&/vice-chancellor&&warner&&yellow\'$oung%#ber("ry%$dens%\'e-lecky',
+    '&!a&"d.&#lls%%field%&headed%$iana&&e-like\'&/tizer\'.s&mdash;little&#lls&*ng/british)$wife&)sh-orange\'"ts%$john',
+    '\'!y&#ows%)millerite%#out%%ridge%"s.&$bank&"ey&#ide&%nouts&"on\'#ver&$wood%#ton%\'y-black',
+    '\'&orange\'$pink\'&yellow$*s&rehy;ing%*e-and-edit+(leave-it&(/malvern&)d-through&$wood%#ley$#tin##xap$*burn-based$"hi$%stowe',
+    '#"yd##zie&!s$#man""po"#rap#%itish#&m-brrm#!p#$ring$\'m-brrrm$"rm%!r&!r\'!r',
+    '#(ubububub""so""ua$"ch$!r#$back#,ce&rehy;want%"\'s%%-dick&\'glazier&!y%*/addiction&&beeson&&debate%%field',
+    '$*h-a-claddy%#ids%#sal$#kit%%moser%\'nerians%$shaw##der&$haus$#ieu$#ney#)eghel-fat(%esque##ger$#ger',
+    '$!h%!e%!s$#man\'$asia$$noli$"us#"hn#\'ichlady$#dge$"jn&!e$(n-ridges%$tjes$!s',
+    '\'%faced&$wort%+ing-looking$!t%#age##jas#%khart#!l$#art$$hois$$isau$"le#%mante%!s$#ble',
+    '%!e%$ijam$$rose#$nain%%nburg$+cv&iacute;k$$dall%%enius%"in%$land%#red%%stone$%ehaut%\'l-cohen&!/',
+    '%#tti$$faut$#hes%$offs$#ing\'!s&!i%$quel$#ker$$lees&"ss$\'natwatt%#els&&r-mond\'!a',
+    '&"ch$"o\'%&-style%)/minstrel%!s%!t$\'schvicg%$sons&"um%#ton$\'t/laser%$land%#ons$$wich\'!k',
+    '#%rghhh#+s&rehy;sels$!a$!c%!a%$hini$\'deximit$)h-applied&\'bristle(#ush\'$uilt&\'cleaned&#end&&filled(#res',
+    '&$rail&\'through\'%ipped\'#ong&$wood(%rking%\'/carpet&$head%(and-comb%\'cutting%!e&\'d-aside($back%%field\'"re',
+    '%&makers%#off%#pot%&script&%tyles%$type%+wood/badger\'#rks$$nice$)s-jo\'burg%$ells\'+s-dominated)$like)\'watcher,%erloo',
+    '%#les$!t%#ein%%warze$$wick$&zewski#(t&eacute$!a%&-lised%#ils%&l-game\'\'looking\'(sounding\'&voiced&&attack',
+    '&!s$$ents$#hur$+ish-looking$%scher$"ta%"on$%us/as##vva##wer#!x$$elle\'#ois#"yn%%ooghe',
+    '"%x3270#&sna/ip"+yan/antonia&\'curator&\'railway%$dale%#ite%%sford&$tone("wn%(t/fiance$\'r-bound#%brie.#(cheiniog%"ta',
+    '#$ddie$%ekirk%"ns\'$holt$#one$#son#+er/director%!s#$gidy##mon#(n-y-bont$!a$&cliffe%&unallt%(ysegrfan',
+    '$!g%!e%#wyn$&hedydd&%nllys%%yfryd$%llyys$&refail\'#oil$&y-baal#(ophyllum$)zoanalgal#"ta$!t"%zeska',
+    '#\'balloon"$.476"$/ral"$1187##361")2000/osd1##724"!3##879"#415##637##737$!6##863"&528/81',
+    '$"25$"86##445##572#(615:1985$"65#(750:part##852##950"!6##102##206$"62##575"$7131',
+    '")a-heparin#!a#%d/kfa"0b&mdash;launched#!i"\'c.econ.#!c"(d/1992/5$(at&amp;t$$unix#,p&mdash;ivan"#ent#!s"!h#$arri',
+    '#!s")kyb-style""l/##566""os"/p&mdash;defence,$puty*#the#)-inspired#!a#"os""rl"$s750##hii")teii-apai',
+    '!+t&ndash;13s""-2#"du#(specific#\'written""12#!4"#200""32#!5#!6#!8"!4#!2#"5s',
+    '#!l""51""70"&98/376""at""ca""dc"#ec\'$\'/higher$!h"!k"!l#!r"!m"&o/basf',
+    '")r-brushed#+/pilkington"$trly#)s/prestel"#u/h!"u%"(&ndash;o"":t"!a##bse##iad#!l#\'narotti$!g#"to',
+    '$\'neshwar%#ova$!s#"bl%"e\'&+-and-squeak\'&bathed+#ing+!s(%rains\'(canopied,!y)!r(%urled\'#era',
+    '($orms(#ree\'&garden($lass)$eams(#um.\'%heads\'$like\'&making\'\'nesters\'$pack(%ermed\'$ride\'&shaped(&yringe',
+    '&$bath&(gum-pink)".a&$head&$jets&$nest&!r%$iest&"n\'\'$g-in(!s%\'y-water,$fall$!s#&endorf',
+    '#"is#"le$\'imiting#&o-like$(ngoronga#!u$\'bububub$$cled$$lcus%!u""ca$$ille$*r&aacute;m%&amanga%#est',
+    '#&ca-bos%$nero$$elin$#inu\'"nl$%leugh#$elli$&phalia$#tta#&haille%\'nan/bar)(hereford(!i%,rest-ettrick)!1',
+    '$&binder$"ez$$heim$&icchio%!e%$nger$!l%#eyn%"oh$!o%"ns$&sbaurn$\'zentrum#\'k-a-day%#eye',
+    '%(stopping%%teeth$,/complainant$$aroo(!s$!e%!r%$sses%&t-base(&rigade\'$full\'&reared\'&smooth(&tepped\'$type',
+    '&$less\'#oad&&s-full%#yes$+fast-totnes(#ely(+leigh-based$#ham$%inary&)gham/city+$home*!s+%ahire+0hire/oxfordshire&(hamshire',
+    '*+onservative)+oxfordshire%+e-and-strap\'#end*!s\'%plate\'*scratching&/berry/berkshire\'-ury/berkshire&%grove&%maker&(r-leaved\'"ed\'%sbury&&yjones',
+    '&-ster/chairman%0insterfullerenes%#ore$*ner/animal()protester$"os%!w$$pool$"ra&"ke$%sbaum%$hole%(kin-clad)\'fringed%$tepe',
+    '(!e$&thorpe%#own$$wald%%heats#!o$$lics$$vina#$quoy#&rylate#%zacky"*d-chugging$)eli-fritz$(frierman$\'sheaths',
+    '#".a#"aj$#mir$)pestensis)!r($ians$%thoki#"by##dah$$ekes%&nbrock$!h%)ist-based)\'managed$#ine',
+    '%"st\'"s.$$leja$$wing$%y-boy\'%uddy.&%movie%%mania#"el%"er%"li$$pest$!r#$geon%+t-balancing',
+    '(\'oosting(&usting\'(chopping((onnected(&utters\'#day\'&fixing(%unded\'\'keeping\'#led\'*management)*ximization\'%price\'(reducing)$scue',
+    '\'%style\'$time(&ourist&%.this&!/\'%2*/3*&#eer))/economic&&holder,!s&.ing/bargaining&"s.$*ie-fancier$!y##has',
+    '#!i$%lding$"no##ley##och$#kan$#ngo#)r-induced#"s.$!/$#man$$tick$$uren($giyn##ths',
+    '##var##wig#&yonny\'""eb#%chner#$llia#\'navista$+d&iacute;as%"ia$$hope$"o.#&rdsell$#ger\'$sinn#&scheri',
+    '%!t#!t")ff-backed&\'reasted%$clad%"et$4alo&ndash;gettysburg\'\'-bundle($dung($horn)&unters($like($robe%"rd&"ot',
+    '$&beards$(er-based\'*containing\'$like\'%stock\'$zone&!_&"s=("20($30,8("xx%&t-bits\'\'trolley&%ingly&#men',
+    '$#ham%$eads$"ie$#ler$!r$$s-up$$teak$"um$$ware#%ifood#,o&rehy;frogs$$nius$%talin%%enine#*ton/tenant',
+    '$)detectors$$eyes$(fighting&#xes\'#ing$\'hunting$(infested$$like$#out$#run#&/patch#%aboos$"ko$!r#\'enhagen',
+    '$#y-3##gen%*r&rehy;all&$-off&$_all&.ed-to-bejaizus)"up&$lugs&"s.%!s%"ys$%inses$#les\'%kelly$!s',
+    '%).pictures%%/pram#\'isville#&lawton$&e-call&%horns&$note%\'blowing%$horn%-s-and-banners$$ioni$#oss#%nariu#%proof#+s-to-source',
+    '$*y/columbia#"ue$#nda"$hari&$zade"#i1t#$buis#*ck-derived&\'powered%!s#"dh%"ie$$ings#!e#(ld-about',
+    '&#ing\'*t-yourself&0operate-transfer\'%r-buy&\'quality%\'.severn%$able%+er\'s/lessor\'*-architect((restored(&seller\'!.\'\'/master\',s/decorators%!i',
+    '(&-based*#oom)%clubs*&omplex),for-building)$land)\'machine+#tes*&ounted)$over),preservation+\'ogramme)*sculptures*%tones+#yle',
+    '*$rade(".l(+/decorating("_a(&s.here)4/equipment/furniture%)s&rehy;up$*t&mdash;in&*ndash;dmus%&-homes&/in-obsolescence(!s\'!t&%under%(/unbuilt',
+    '#!r#&seness$%iness$$ness#&tendag$#one#"ys#"ze"$jold$"sa#"ra"$kalo$!n$!s$"vu',
+    '##eti#"ha%\'ri-zade\'*n-piatakov)&stalin($ites$$oosh$!t#%idnon##ler##man#$nell##oba$$vsky"&labula',
+    '$"ki$#leh$"nd$+tovi&cacute$"va%"in#)b-growing%)importing%$life\'#ght%\'traders$\'acodium%!r$#eck%!n',
+    '$#ils%!r$\'ocodium%#rne%)us-shaped\'"ly$"s.$"ul%!s&)/duodenum##can#%derin$#ing#$eita$$vard',
+    '$!y#/ganin-khruschev%$ria*(\'-turkey)*yugoslavia($n-ec*&french*\'turkish*&united\'!n&"ka&\'octonos&#sko$&e-tall%%/bulb',
+    '($full($ripe$#let$"ur#$hoes#&idings$"th$#ver#*k-boosting&#uys%(carriers&(hemicals%(destined&\'iscount%#gas',
+    '%&loaded%$shop%\'washing$$anov$(carriers$$iest%)ly-furred%%ngton$"ly$\'y-files&\'looking#%l****$%-beef%$cape&$ourt',
+    '&&erived&#own\'#zed(#ing%%faced&$ight*"er,!s&(or-evers&#ree\'"og%#god&\'rappler-!s+#ing',
+    '&#ide&#uss%)licensing%#man%$neck%%owned%\'related&%itual%\'shitted+!r*#ing&"on&,ubscriptions%\'tritons%&voiced',
+    '$-/25/10/93/cde&+6/10/93/cde&+7/10/93/cde%$sach$$aasi%"ce\'!s%!e%!r&&d/cpre((forensic(%local%"ta&"or$#boy',
+    '&&g-calf)2lip-round-the-nose&%zered)"s.%$ykes$.eid-influenced%#mer%\'n-evans&+/divisional%+t&rehy;free,%proof&%-brow\'\'catcher.!s\'$hole',
+    '\'"in\'$like\'&pocked\'\'slashed(%tream-!s&(in-board*=ullet-bull-pull-football-foot(\'/notice&&making&\'s-solid&!y%+y/carterton\'$town$*finch-like',
+    '$\'hampton$&ingham%!s$$more$%necks%%osing$!o%#ck\'\'&-carts(%power\'"ed%$ughs&!s%!w$%rings',
+    '$&seye/a$#tes$"us$&valene$-y-and-biscuit%#boy(!s%%ingly##nes#%ohawo$#nda$"va#\'rushers##sar$-trode/surgeon',
+    '$#ure#&ukumba#%weria\'!i#%yanda$#gin"-m&rehy;length#(-fluffed%\'reezers$,of-the-month$+splintering$(wiggling#"ah#$bach$"ee',
+    '$\'le-face\'%puppy&#dom&"rs%#ies%!y$#oys#"er#)f-crammed%&heaped$*ord/farmer$&reezer$%ucker#$head#\'med-out',
+    '%"rs#Ep\'n\'grind-your-bones-to-make-my-bread$*-and-grind%$free%"up$%along$%ed-up&$/tug%\'r-sized(&ticker\'\'to&rehy$!f$#ham$$iest%"n\'',
+    '$$kin\'$!o$"po$!v"#nac#+bury/mother\'#ing#(ce/motor$"h.%!e&*d-together%#rew%!s%!u#-d-l&auml;nder',
+    '%\'sleague%!y$"ee%!r&$srat%!s&&archiv&*bank-fixed\',eamtengesetz&*denkmalamt&\'kanzlei,/r&mdash;elected4$head-#amt((rtellamt',
+    '&2laufbahnverordnung\'$iga.&1nachrichtendienst&,oberbehorden&9pr&auml;sident&mdash;head)+uuml;stelle&/rat&mdash;upper&%staat(*rafgericht&%tages),s-drucksache*(fraktion\'%rasse(#eue&Averfassungsgerichtsgesetz=bverfgg',
+    '$!i$#le.&$d-up$,m&auml;dchen$#nis$"on$)sandstein$!t#"er#&g-hole$!a%"ll&\'ow-land)&styled$)ee-jumped',
+    '%!s$$hole$#le.#\'iacenko$!c%!h$"on##jee$*ie-jumping#%k-bed%$hole%%wives$)er-pocked\'$shot&#ers',
+    '$$head$$room#)nahabhain$"ed%%tless&!t$#ied%#kin%!n$!s$(y-hopped)!s&$love%$hops%#man',
+    '($/joy#*ostomiasis#\'rannoch#%scoil$*en-burners$&linger$"on#$ter\'&%-like\'%style&#ish$#ine&,g-and-bubbly\'%sdale&!s',
+    '$"om%!n$%ustan#"uk#%waree#$yala%&nesque$#ips$"on%"ro"$ochs&&erhorn#$erta#(naccorsa%%donna',
+    '%&rruoti%%ssisi$&figlia$&giorno$\'talenti#$y-ed$!.$%ed-up"$pesh#(hthalmos#$pies"\'racchia%$hati$!d%!a',
+    '$"ll$&nnpour$$sian$#tai%$toni#-bank-volupine\'#ing$&erried)!s$%lings$#ose$!s#&chelli&"tt%$fiel',
+    '%&uladze$$ombe(0/gloucestershire%"te#$dale$$crop$\'en/west&#_on&)s.portico\'"86\'%omely%"ss%!t&"te$\'igalian',
+    '$,on-sanderson&"ed$#wan#)eacracies(#tic&%uracy%/u&mdash;bearing\')rehy;crat&&-based(\'ookcase\'\'cabinet\'\'shaping&\'cracy\'s+,-cum-factory,$free',
+    '+!.+*/hierarchy)+t-fisherman*8ic&rehy;authoritarianism,*-collegial-,exclusionary-,inclusionary-+legislative-,professional+$zing&#fax&\'metrics&+x&mdash;and$!k$#sch',
+    '#4ford/gloucestershire&!t#%gages%!n&"dy$"dy$$ener&%stock&$thal%%r-box\'&eating\'!i\'$type\'(weeshuis&\'masters',
+    '%(ss-dunne($like(&ticket\'#/70($asst(/gloucestershire(-herefordshire()neighbour(*production\'#ian("sh$\'frieden$#hal%#elm%&geshes',
+    '&*r-proofing($trap\'"ia("se%"er\'!s&!s%#in\'$(omeister%$ndes%*yne/garage(!s$#red$#ues%#lar',
+    '\'%ionum\',y&rehy;toned(\'-flavor)$vino(./saffron/green$#win#!h$"ou#*ial-at-sea\'$cave(&hamber.!s\'$dump\'&ground-!s',
+    '\'&places\'\'service%!n&!s$!c$#dan%"da$#ed.$#ngh$"on$#ram$!t%!y#!j$"an',
+    '$*e/cherwell%#ite%!l%"mo%-rt/instructor$$hard\'!t&$user%#ill$#ian%!n&$abes%\'tt-like##lam%"ps',
+    '%!r%!s&"ca\'!o&!k%$ttas%*y/economic\'(planning$!i%"es%!n&#ess&$gham$#ton\'\'/oxford',
+    '$)y-looking#\'ma-siam%&nising$$illa%&ngford$#ola#)n&rehy;in$!-%$bags&\'listers%,ear-rar-noos%*in-the-gut%$like%&tested$0/gloucestershire',
+    '%#ges%&rd/mad$"by$%coose$$dige$,e-jones-face+!.%\'d-black(*ut-browned\'$over\'\'through%*ll/olympic\'!s%%r-you&*/vaporiser',
+    '%(t-leaved&"ii&,todesmondism\'!s$%field$4ham-on-bloody-crouch\'!s%$ouse$#ier%/ng-at-the-stake(*cats-alive($eyed(%glass)%round("in',
+    '\'+.maastricht\'$/and(#the\'\'ly-cold%*shed-steel(!r$(ley-born$$oist%"us\'!e&"t.$3s-and-you-know-what)%erson&\'crosson%$/aea',
+    '%"es%$tall&#ein$"t-&$arse&%bones&&orange\'#ver&&palace\'*hosphorous&&sienna&%umber%#_in%.island-granton%"on',
+    '$$wood#"oa$!e$(kevicius%#hof$!n$#voi##pee$#man$!y#*r&eacute;e$&-brown%\'granite$\'/rupert$(aburiash',
+    '%#tos$$ells%$nder%#tti$%idges%!s%\'toville$(o-bushes%!o%%ughes(+s&rehy;cult%(w-livers&!.&"er&,ing-junction',
+    '\'&/carer(&hunter(&potato$#uss#)sa-except%(pastoris%*ry-strings$+cough-based$!e%"ll$&t-mode&$pipe\'$roof&.the-barricades%"er',
+    '&$ngly%"s.$$wood#\'tersett$#ini$$less$2on&ndash;leicester&"\'s&\'-brewed\'+in-lonsdale(6s-an-expletive-deleted\'$ness\'(produced\'$race\'&taylor',
+    '\'(hercules\'&taylor&!i\'#ans\'"se&(on-trent&$shaw$!s$\'t-smith#%undi*\'"an)!s%#lar$"tu#$vill',
+    '%!y$#ood#,y-manchester$"an$#ded$%enges$*ing-ground#"za"-s&rehy;driver))mastering)%route#%\'ness#$-bar%$ench%#oat',
+    '$*compatible$\'drivers$$fare(!s$%miles$$only$(priority$%queue$$rail%$eady%%outes$(services%$teps&$rike$&ticket',
+    '%%o-bus%#ype$%width#!/$"in$%laird$%train##_as#%a\'idi$"co##bar&!s$#ies$%ridge$(y/thames',
+    '#%cando$"el$"he&!r&#tta%$mann$$ombe##efi$"rs$$s/in$!t#$fare$"ul#\'h-bucks%\'clinton',
+    '&%rains&&ukakis%$hats%(inspired%%kaifu%%lined%/meets-gorbachev%&quayle%&ranger&%eagan%)telegraph%\'walking&&hacked*#ing&#ork',
+    '$!.$(/shearer%$team$&babies$-el/hectolitre%#nyi$&fallow%$ield$#ido%"es%#tes$-man-hottentot&$ster%#oor$"ra',
+    '\'%rowed&&haired%!.#"ie%#nss%+st/noisiest$#ger$"ne&#ess&"sh\'#men\'\'s&mdash.#;as/"or)/rehy;government',
+    '()-as-usual+(sociates)$base*\'uilding))community*%ycles))education*"nd*%thics*%urope)(financed*&ocused*%unded)*government)$head',
+    '*$ours)(inclined+)formation+&terest)\'journal)\'machine+(nagement*$over)#one)$park*%eople+$rson*(ortfolio*&riests+%ocess',
+    ')$risk)%start+#udy*$uits)$type(#.he)\'johnnie)&market(+/commercial)&design*\'ivision))economics*(ducation)(personal*+rofessional',
+    ',$ject)+residential)&school*%ocial*(trategic)%work/(,es&mdash;the*%.they(*gram&mdash($land)$ike.*"ne(-man-fraudster+!.+(/touring',
+    ',&buyers,+politicians+!.($wear%$ness%\'sessmen$"ri#$kaid%%round$%ers.a&"ud%!t$$ined#%logic#%maker',
+    '&"ov#$ness#&onians#$saco%!n$%chers$!i%+&egrave;res%$ness%#til$"on$!t$"um#*t&mdash;up$\'-bodice',
+    '($ster%(enhanced%#out$&/chest$$anil%\'rd-like$"ek$)ier-style(&topped%&ng_out&!o%"on$)le-backed&!r\'!s',
+    '%$ines$%mdash$!o$%yhill#%uness#(watchers$)ell/heart(\'manager#\'y-armed%$body%#ish%\'lizzies%\'seeming%$work$#con',
+    '#"\'n#)-benjamin$#for\'>-the-grace-of-bevan-there-go-i$"it$#the$$when##_as$\'because%!y$\'er_that&%m_for($that%\'very_so$%grown',
+    '&!w#!a$%chlor$%droka$"le$&n-1-ol%"es%#oic&"le&"ne$"ye$(zolidine#(ch-femme%%er-in($like',
+    '\'0/gloucestershire(&houses\'#ies\'$meat\'$sick&!s%#ing#\'e-based$"le$%nandt$!s%$hire$#ven#$four##hal',
+    '$!e%%lelzi$"us##ier$$none$"on$"sm#%jeman#"ko#)ler-style&*/chartered\'$home\'%marco)#yor\'(national',
+    '\'(scottish(%table&!i\'"an&!y%!y#\'nothing#*obarbitone$#mus$*xi-ethanol#!r$"os$"us#&sfield#)t-crammed',
+    '%*indicators%&joined)#ted*!s%\'kickin\'%%naked%%traps$"ee%!l%4r-and-honey-coloured\'%based*#ted(#lob+!s\'%cakes',
+    ',!s(&oolers($ream\'(enriched\'(fingered-!s("ly*#ing\'%hands\'"in\'%maker(&elting(%uslin\'$rich\'\'slicing',
+    '(#oft\'$wine(7on\'t-melt-in-your-mouth)8uldn\'t-melt-in-her-mouth8%mouth&%balls\'$eans&\'cookies\'%rambe)"ne($unch&#ell&,fat-adjusted*$rich)!s',
+    '\'$lied*(s/garden("y-*$blue+$owed*(catching+)ollecting*&lovers*$taps+#ype)&filled)#ing)#man&$head*!s',
+    '\'"ss&%maker(!n&#nut&#pat&&smooth\'#oft\'#ton*!e\'%worth&5worth-hayes/interavia+)/employee+&s:1988*!s&&y-rich',
+    '\'&/crime(*meningitis((national$#hey$"ie%$geig&,ieg-scicluna$2le/physiotherapist&%berry&!r\'#ley$)ock-bones(&groper(&licker((skimming',
+    '\'#ing%%n-all\'\'bashers\'\'carding(%entre\'-down-collared\'$eyed\'%faced(&lowers\'&holing\'&necked\'\'opening\'$push\'&shaped\'\'to-neck',
+    '*"ed\'$rown&$down&*ed&rehy;up((-leather&.hole&mdash;but&&ing-up)!s&"s.&!y$$race%(ess/rake$%s-out%%field$$yism',
+    '#!u#(yl-based%-dimethylsilyl%,hydroquinone**xy-toluene$.rate:glutamine"\'ultjens#(nderkamp#!r"%xbaum#5i&egrave;res-sur-arce##ley#*om-looking%$ness#*ton/coombs',
+    '#%worth"&y&lsqb##\'em#!-$&direct$\'in-bulk$-of-the-season%/ut&mdash;assets\'(/buy-ins\'/s&mdash;vendors(!.((/buy-ins$%price$#ups#\'ability',
+    '#+er-endorsee&&groups&(importer&&notify&(supplier&"up%!/&&drawee,)/acceptor%"s.#\'ing-off&!.&!/\'1marketing/selling#$ldyd',
+    '#!o##reg#$s-in#!t#"uk%%mihci$%rulda"$zfuz#%galin#!u$#luk#)z-checked%&giving%(inducing%%terms',
+    '$$anca&"ga%(rd-based\'!.\'-/bedfordshire$%board)!s&"mb$\'er-call$&giving$!i%"ly%#ngs$"zz!$v130',
+    '#!f"!d#!c"%erfgg#$tmed"!i#--incorporated"%m&amp#!s""rb"!s"$v552!%w-box##nfs#(services',
+    '"!."\'/colour""35"!5"!6"!a#!a$*aaaaaaaaah#%celet#"in##yla"&bachod"!c#!h##iod',
+    '$+lsqb;n&rsqb""ea#)bwenibure"\'imstone##ndi$!t"!l#3ch-y&rehy;ddwy-elor\'(-saethau($waun##lfa""mb"!p""rs"!v',
+    '##232##529$"34$"48$"64%!5$"72%!7##645##769"!w!$x-10"$.the""b4""c3',
+    '#!6""d2""e4#"6+#!7""f5#"7+"Cg6+&verbar&verbar;kd8&verbar&verbar"&r-300c!\'y&mdash(";1#*ndash;pass#/rehy;employment($laws#%thorn',
+    '#"71""-a$&nd-bye#%class#\'elected(%ions.$,nvironmental#\'gesture#.hand-of-bearer$&imself#%large$#ife#$name##out#&pass-a',
+    '#\'streets#\'the-way##way$$ords"(.another#\'product#%small"-/distribution"!1"#25%""31")_,_by_far#)all_means#$just#)the_er_by',
+    '"!a##ins#$mbyn$"ee#\'raagiyn$"ds"#bee#$rook"%culla"!d#)&oslash;y#0awell/leominster#!e",e&ndash+laws)$;law',
+    '$"ee&!e%(lections$%laws.$%names$$ways##.ep#$dale#"ee#%gones#*larussians$.ection-winning*!s$1orussia-lithuania+)/byelarus',
+    '%)/sculptor#"tt#$ways"+fleet-based##ore"%ggdok#)raves/kim"!j#$enny"!k##hov#+ova-egorova"1landt-rheidtovsky#\'es/play#-ine:blackburn',
+    '"$mail$"rk#!e#$oore"!n#&g-hall%\'stamper$!s"#ong"+pass-lopper&(/railway$#ths#&henyls$$onic",ram-wigfield',
+    '#"ch#\'dcliffe$*s-obsessed%#ian%#ong##ely$-presentatives#"ge#&htwold#$nand$/e/archaeologist&/gloucestershire&(hospital%!y##on.',
+    '$$zoan#"te$!h"\'sacodyl##hot#%itter#$shop$"us#\'tanding"*t&oacute;w#*e-ordering\'(ientated%#put%$size&%tring',
+    '$"ry$&stream$$week#!h$&e-book$$orpe%\'trephes#"lm#"om#"wo"&ung-ju"!w#&29/100#&80/150#+aters/axiom',
+    '"%zance%$tian\'"na(,e-romanesque)(/moorish(%ische\'#um.!$z658"#lf1"/ns&mdash;deputy+&viktor""zz$!z%"zz\'%zzzzz',
+    '#+elig;dwalla#*grave;hors)$ndid#"mp%#;p.&(s/sovran\'$ub4+&+w-flavoured#\'tilde;o"$bsol"#deg#*ollar;1.4m+!8*%0,000+%0,000',
+    '*#1.5+"8m*&25,000*#4.3+"2m*!9+$.6m.)#2.5+"65*"0m*"50*"9m)!3*#.50+!8',
+    '+"0m*!3*!8)"42+!5)#5.4*!0)!6*".3+"5m*#60m)!7*$.125+"50*"50',
+    '*#.25+"75*#3.2)!9*".2+!5*&93,000")eacute;ad*#nne*!r)&cillon)$dile)"ee))il&iacute)-l&eacute;bres',
+    '*.ebrit&eacute;s+$stin/!e-"on)$page*$hale)/r&eacute;brisme2&monies*#ise#)grave;pes")formula;c*!n"*gt&formula"&igrave"$lcub',
+    '\',atholic&rsqb\'.ommission&rsqb\'*urate&rsqb"=mdash&mdash&mdash&mdash&mdash\'";3(&centre(#no.((trustees")ndash;118*!s)"25)"30("45)"6d*!s',
+    '*!a*!b("90(!d(!f)#bhz)#hav)#jec)#lzo)#udd($gehx)#hav*"lk)#ibf"-oacute;rdovez',
+    '\'%;teau,!x*&lettes*/s-&agrave;-bras,\'du-nord/+rh&ocirc;ne1#one#\'elig;ur#\'uml;lin".pound;normally(!s"*racute;ecy#&ehy;13\')47a-90-dl")sharp;min',
+    '""-e""an"&bridge"1est-&agrave;-dire"&m\'dore!*(&formula)"#1s)"#28)""3)""i)#(vitatis)""u)!%*****&"**#!p',
+    '#"e*!(++/views"#0.c"!c"!p!#--c"!.""09"#100%(&ndash;3#"12$!9$!s#"21%!c',
+    '%!s#!4$"1s$!5#!g"&208/90$$9/91$!h#$9/91""3\'#%34/90#%58/90##840"#46d#$7a-1',
+    '$&b-1-dk&$35dk$!s"#54d$!s#!a"!6##/90##190##841""75""85"$9/90#!0##190',
+    '""an#.polipoproteins%\'protein,!s"#c-c%%-ares&(corrupts%(ambridge&!r%%ommon##ame$$nopy$!r$%sting#(ertainly',
+    '#!o$&ntrols$!r$$tton$$uple"(d-xylose##ash##eck#!s"*enrichment#"rb%#b-2&!2$%minal"$fica',
+    '$"zz##nqb##our##tba##yqs"$gfpl##rsd&"-x"\'h-i-l-d#&elices&!x"#i-s#"=l#$n-c.$!.',
+    '"#jam"#lab%&elling$&nguage"(machines$&jorish#"os$$vies#"yb$\'c/bcl-2$!e"!n"&oct-11#(peration#\'riented',
+    '#"-c##lus#-olysaccharide"%r-a-p$\'e-a-m-s#+egistration##ich#\'outines"&shaped$#ell$$ield##ite##pan&$ners#"rc',
+    '"!t#&ermini"#u-r#"ra"$word"!x!\'.&amp;a""-a#%in.c.#!j""10$*0&ndash;50$"13%*4&mdash;19%!5',
+    '%!7$"22%)5&mdash;8$"31%!4$"85##137$"50$"70&+&ndash;1240$!s#,200&ndash;30$-26&ndash;1314$"45$/50&ndash;c.1500',
+    '&+&ndash;1324$-84&ndash;1300$-90&ndash;1320%,2&ndash;1336%,9&ndash;1356##308$"18$*66&ndash;7$"70%!2$"80%!5$"96#"41%*8&ndash;25',
+    '$"56$"70%!1%*5&ndash;79%,8&ndash;1555$-90&ndash;1525#!5$#&ft$.04&ndash;after$+16&ndash;47$"30$-40&ndash;1850-"50$-50&ndash;1640-"81',
+    '%!8$"60&%-1630$"75$"80&)&ndash;90##60z$+10&ndash;60$"25$"31%!5$"45$"60&+&ndash;1715.#832',
+    '&%-1770$"75%!8$/82&ndash;c.1712%,7&ndash;1740$"93&+&ndash;1762#&70,000%!9$"10%,3&ndash;1775%*5&ndash;88%*6&ndash;27$+20&ndash;30$"32',
+    '$"40&+&ndash;1803%,9&ndash;1802$-50&ndash;1828/"80.#900-"90%!5&+&ndash;1813-"58%!6$\'70-1820%!5$"90%,6&ndash;1906',
+    '$"00$"14$"20%)1&ndash;4%!2%,6&ndash;1959$"48$+69&ndash;70$"70$"80$"91%!5$"th##900$"14',
+    '$"23$"37$"45&)&ndash;64!(harrismo',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_86 = (
+count_86 = 6694
+
+heads_86 = (
     'baz-who',
-    'bazaar-i',
-    'bazaar.',
-    'bazadi',
-    'bazalgee',
-    'bazarhuu',
-    'bazartete',
-    'bazaruto',
-    'bazell',
-    'bazen',
-    'bazett',
-    'bazeu',
-    'bazevichus',
-    'bazilio',
-    'bazooki',
-    'bazooms',
     'bazouki',
-    'bazoukis',
-    'bazzaro',
-    'bb-1100f',
-    'bb-1100s',
-    'bb-3000',
-    'bb-style',
-    'bb-wistar',
-    'bb1',
-    'bb1100s',
-    'bb12',
-    'bb2',
-    'bb200',
-    'bb3',
-    'bb3000',
-    'bb5',
     'bb9',
-    'bbbb',
-    'bbbllllooooooooddddyyyee',
-    'bbc-approved',
-    'bbc-bashing',
-    'bbc-commissioned',
-    'bbc-designed',
-    'bbc-funded',
-    'bbc-rte',
-    'bbc-thames',
-    'bbc-trained',
-    'bbc-type',
-    'bbc-wildlife',
-    'bbc.b',
-    'bbc/m68000',
-    'bbc/nop',
     'bbc3',
-    'bbci',
-    'bbcish',
-    'bbcprogs',
-    'bbcso',
-    'bbcsso',
-    'bbem',
-    'bbf918',
-    'bbn/cornerstone',
-    'bbnfl',
-    'bbsrc',
-    'bby',
-    'bc-ad',
-    'bc.solon',
-    'bc109',
-    'bc212l',
     'bc3',
-    'bc5',
-    'bc546',
-    'bc8',
-    'bcars',
-    'bcas',
-    'bcatp',
-    'bcause',
-    'bcb3',
-    'bcda',
-    'bcde',
-    'bce90/10/4(ns)',
-    'bcefaddb',
-    'bcfe',
-    'bcg-matrix',
-    'bcginning',
     'bchc',
-    'bche',
-    'bcie',
-    'bck',
-    'bcl-2-expressing',
-    'bcl-2-overexpressing',
-    'bcn',
-    'bcnn',
-    'bcp-affiliated',
-    'bcp-dominated',
-    'bcpd',
-    'bcpl',
-    'bcs/ocs',
-    'bcy',
-    'bd118,000,000',
-    'bd17',
     'bd2',
-    'bd3&verbar&verbar;nf8&verbar&verbar;12',
-    'bd575e',
-    'bd68,400,000',
-    'bd75',
-    'bd97,200,000',
-    'bdam',
-    'bdg',
-    'bdi',
-    'bdna',
-    'bdrb',
-    'bdrlund',
-    'bdtcs',
-    'bdx/4',
-    'bdx/4l',
-    'be&amp;n',
     'be&mdash',
-    'be&mdash;neither',
-    'be&mdash;the',
-    'be&ndash;an',
-    'be&rehy;sides',
-    'be\'alf',
-    'be\'ere',
-    'be-1',
-    'be-able',
-    'be-back',
-    'be-blazered',
-    'be-bop-a-lula',
-    'be-called',
-    'be-cause',
-    'be-costumed',
-    'be-dam',
     'be-decked',
-    'be-deleterious',
-    'be-ee-ee-ee',
-    'be-fore',
-    'be-frilled',
-    'be-gained',
-    'be-hind',
-    'be-hymened',
-    'be-ing',
-    'be-integration',
-    'be-jacket',
-    'be-kilted',
-    'be-kind-to-shelley',
-    'be-little',
-    'be-mirrored',
-    'be-moaning',
     'be-navelled',
-    'be-ni',
-    'be-ro',
-    'be-seen',
-    'be-sticked',
-    'be-thankful',
-    'be-there',
-    'be-trainered',
-    'be-wigged',
-    'be-yond',
-    'be.2b',
-    'be.2s',
-    'be.arguing',
-    'be.at',
-    'be.en',
-    'be.supposed',
     'be.the',
-    'be.this',
-    'be/displace',
-    'be/keep',
-    'be2s',
-    'be3',
-    'be3&verbar&verbar;bg7&verbar&verbar;4',
-    'be7',
-    'be=read',
-    'be_a_little',
-    'be_grown',
-    'be_in',
-    'beac',
-    'beacause',
-    'beach-bags',
-    'beach-based',
     'beach-boys',
-    'beach-clad',
-    'beach-comber',
-    'beach-combers',
-    'beach-fringed',
-    'beach-garbage',
-    'beach-gear',
-    'beach-house',
-    'beach-hut',
-    'beach-huts',
-    'beach-look',
-    'beach-robe',
-    'beach/rocks',
-    'beachbar',
-    'beachboy',
-    'beachcomb',
     'beachdale',
-    'beache',
-    'beacher',
-    'beaches/',
-    'beachfield',
-    'beachings',
-    'beachlovers',
-    'beachmont',
-    'beachrock',
-    'beachware',
-    'beachwise',
-    'beacock/campaign',
-    'beacon-fires',
-    'beaconfield',
-    'beaconville',
-    'beacuse',
     'bead-decorated',
-    'bead-eating',
-    'bead-ed',
-    'bead-ing',
-    'bead:cell',
-    'beadbonny',
-    'beade',
-    'beader',
-    'beadlike',
-    'beadling',
-    'beadlow',
-    'beadnells',
-    'beads.',
-    'beads/dna',
-    'beads/dna/bound',
-    'beafort',
     'beaglehole',
-    'beahan',
-    'beaini',
-    'beaird',
-    'beak-blow',
-    'beak-cleaning',
-    'beak-first',
-    'beak-marks',
-    'beak-prodding',
-    'beak.',
-    'beak/daughter',
-    'beaker-folk',
-    'beaker-vase',
-    'beaker.',
-    'beakerful',
-    'beakful',
     'beakfulls',
-    'beakfuls',
-    'beaks.',
-    'beaksful',
-    'beal/sotherby',
-    'bealby',
-    'bealdred',
-    'beale/cupid',
-    'beale/mother',
-    'bealey',
-    'bealin',
-    'bealing',
-    'bealings',
-    'beam(s)',
-    'beam-\'em-ups',
-    'beam-current',
     'beam-end',
-    'beam-engine',
-    'beam-lines',
-    'beam-slots',
-    'beam-width',
-    'beam.',
-    'beamaris',
-    'beamers',
-    'beamingly',
-    'beamish-based',
-    'beamishes',
-    'beamishest',
-    'beamlines',
-    'beamond',
-    'beamont',
-    'beamsley',
     'beamtenbewusstsein',
-    'beamtenbund',
-    'beamter',
-    'bean-counter',
-    'bean-counters',
-    'bean-field',
-    'bean-like',
-    'bean-row',
-    'bean-rows',
-    'bean-shaped',
-    'bean-sprout',
-    'bean-tin',
-    'beancounting',
-    'beaner',
-    'beanery',
-    'beaneth',
     'beaney.',
-    'beanfeast',
-    'beanhill',
-    'beani',
-    'beanland',
-    'beanley',
-    'beannacharain',
-    'beanpoles',
-    'beans-and-bullets',
-    'beans-in-a-tin',
-    'beansetting',
-    'beanshoot',
-    'beanstalks',
-    'beansticks',
-    'bear&rehy;spirit',
-    'bear\'',
     'bear\'s-grease',
-    'bear-cheek',
-    'bear-claws',
-    'bear-cub',
-    'bear-feast',
-    'bear-footed',
-    'bear-garden',
-    'bear-headed',
-    'bear-raiding',
-    'bear-shaped',
-    'bear-sized',
-    'bear-skinned',
-    'bear-survival',
-    'bear.',
-    'bearaphanalia',
-    'bearaviators',
     'bearberries',
-    'bearcats',
-    'beard-growth',
-    'beard-scratching',
-    'beard-shaving',
-    'beard-shavings',
-    'beard-stubble',
-    'beard/christmas',
-    'beard/jim',
-    'beardclippers',
-    'bearder',
-    'beardmore-built',
-    'beardo-weirdo',
-    'beardon',
-    'beardsall',
-    'beardsely',
     'beardsley/cole/',
-    'beardsmoor',
-    'beared',
-    'bearends',
-    'bearest',
-    'beargarden',
-    'beargardens',
-    'bearin\'',
-    'bearing-plinths',
-    'bearing-up',
-    'bearland',
-    'bearly',
-    'bearly-made-it',
-    'bearmail',
-    'bearman',
-    'bearnagh',
     'bearnais',
-    'bearnley',
-    'bearpit',
-    'bears/min',
-    'bearstead',
-    'beartrix',
-    'beasain',
-    'beaser',
-    'beasley/former',
-    'beasleys',
-    'beassoumal',
-    'beassoumalminister',
-    'beassst',
-    'beast-brain',
-    'beast-feeding',
-    'beast-footed',
     'beast-like',
-    'beast-sounds',
-    'beast-things',
-    'beast-trap',
-    'beastley',
-    'beastlily',
-    'beastling',
-    'beastmarket',
-    'beastmaster',
-    'beastmasters',
-    'beaston',
-    'beasts.',
-    'beat(en)',
-    'beat-\'em-up-cum-shoot-\'em-up',
-    'beat-boho-jazz-punk',
-    'beat-frequency',
     'beat-grandfather',
-    'beat-grinding',
-    'beat-poetry',
-    'beat-pop',
-    'beat-the-deadline',
-    'beat/migraine',
-    'beatae',
-    'beatam',
-    'beatbox-plus-guitar',
-    'beatdowns',
-    'beaten-earth',
-    'beaten.',
-    'beatham',
-    'beathing',
-    'beatiful',
-    'beatify',
     'beating-up',
-    'beatitudinous',
-    'beatle-cropped',
-    'beatle-era',
-    'beatle-oriented',
-    'beatles-style',
-    'beatles/stones/kinks/peters',
-    'beatless',
-    'beatley',
-    'beatmaster',
-    'beatmore',
-    'beatnik.',
-    'beatons',
-    'beatpop',
-    'beatrice/modi',
-    'beattie-tudes',
     'beattie/oxfam',
-    'beattie/show',
-    'beattification',
-    'beattycommunications',
-    'beaubien',
-    'beaubrun',
-    'beauc',
-    'beaucaire',
-    'beaucastel',
-    'beaucens',
-    'beauchamp/goal',
-    'beauchemin',
-    'beauchesne',
-    'beauchmap',
-    'beaucourt',
-    'beaucourt-hamel',
     'beaud',
-    'beaudidlez',
-    'beaufighter-equipped',
-    'beauford',
-    'beaufre',
-    'beaufront',
-    'beaugie',
-    'beaujo',
-    'beaumains',
-    'beaumanor',
-    'beaumarais',
-    'beaumarchais/livings',
-    'beaumel',
-    'beaumes-de-venise',
-    'beaumond',
-    'beaumont-les-valence',
     'beaumont-maille',
-    'beaumount',
-    'beauracrats',
-    'beaurepaire',
-    'beaurocracy',
-    'beaus&eacute;jour',
-    'beausang',
-    'beaut.',
-    'beautif',
-    'beautifiers',
-    'beautifillly',
-    'beautiful&mdash;crying',
-    'beautiful&rehy;voiced',
-    'beautiful-eyed',
-    'beautiful-looking',
-    'beautifulest',
     'beautifully-appointed',
-    'beautifully-crafted',
-    'beautifully-edited',
-    'beautifully-filmed',
-    'beautifully-kept',
-    'beautifully-knitted',
-    'beautifully-marked',
-    'beautifully-placed',
-    'beautifully-played',
-    'beautifully-produced',
-    'beautifully-sustained',
-    'beautifully-sutured',
-    'beautifully.',
-    'beautility',
-    'beautings',
-    'beautique',
     'beautiul',
-    'beauty&mdash;there',
-    'beauty\'',
-    'beauty-before-bread',
-    'beauty-contests',
-    'beauty-counter',
-    'beauty-dress',
-    'beauty-related',
-    'beauty-spot',
-    'beauty/best',
-    'beautyful',
-    'beauvai&rehy;sis',
-    'beauvallon',
-    'beauveria',
-    'beauvericin',
-    'beauverilides',
     'beauvoir/sartre',
-    'beauvois',
-    'beaux\'',
-    'beaux-livres',
-    'beauy',
-    'beavan/landlord',
-    'beaver-trapper',
-    'beaver-trapping',
-    'beaverbrook/',
-    'beaverish',
-    'beaverskin',
-    'beavon',
-    'beavor',
-    'beazleblor',
-    'beb',
-    'bebattled',
     'bebauungsplan',
-    'bebburn',
-    'bebel-platz',
-    'beboppin\'',
-    'bebory',
-    'bebout',
-    'bebow-tied',
-    'bebs',
-    'becalms',
-    'became/ai',
-    'becamest',
-    'becasuse',
-    'becatti',
-    'becauase',
-    'becaue',
-    'because&mdash;ca',
     'because/so',
-    'because_,_because_of',
-    'because_a',
-    'because_as',
-    'because_not_because_of',
-    'becausebecausebecause',
-    'becausec',
-    'becausehe',
-    'becauses',
-    'becayse',
-    'beccabunga',
-    'beccafumi',
-    'beccellati',
-    'beccera',
-    'becej',
-    'becel',
     'beceuse',
-    'bech',
-    'bechari',
-    'bechely-crundall',
-    'bechgaard',
-    'bechio',
-    'bechler',
-    'bechman',
-    'bechner',
-    'bechor',
-    'bechtel-france',
-    'bechtel-westinghouse',
-    'bechtler',
-    'bechtoldt',
-    'becir',
-    'beck&ndash;barnard',
     'beck-traversing',
-    'beck/owner',
-    'becka',
-    'beckanbauer',
-    'becket-tee-ee',
-    'beckett-hester/midwife',
-    'beckett/drug',
-    'becketti',
-    'beckettii',
-    'beckfield',
-    'beckfields',
-    'beckford/worcestershire',
-    'beckhampton',
-    'beckhard',
-    'beckingsale',
-    'beckington',
     'beckjay',
-    'beckler',
-    'beckley/whitchurch',
-    'beckly',
-    'beckmesser',
-    'beckmill',
-    'beckoner',
-    'beckowing',
-    'becksley',
-    'becksmann',
-    'beckworth-smith',
-    'becky-boops',
-    'becky/traveller',
-    'beclamethasone',
-    'beclothed',
-    'becloud',
     'beclouds',
-    'becolded',
-    'become&mdash;friends',
-    'become&ndash;the',
-    'become-i',
-    'become.more',
-    'become_out',
-    'becomeing',
-    'becomest',
-    'becoming-one',
-    'becontrolled',
-    'becotite',
-    'becow',
-    'becton-dickenson',
-    'becuse',
-    'bed(s)',
     'bed-and-breakfasted',
-    'bed-bag',
-    'bed-bathing',
-    'bed-blocker',
-    'bed-blockers',
-    'bed-blocking',
-    'bed-booking',
-    'bed-bound',
-    'bed-box',
-    'bed-chair',
-    'bed-coverings',
-    'bed-cradle',
-    'bed-cred',
-    'bed-curtain',
-    'bed-d-ed.',
-    'bed-d-ing',
     'bed-days',
-    'bed-edge',
-    'bed-fast',
-    'bed-fellow',
-    'bed-fellows',
-    'bed-heads',
-    'bed-hoists',
-    'bed-in',
-    'bed-jumping',
-    'bed-lamp',
-    'bed-leg',
-    'bed-makers',
-    'bed-nights',
-    'bed-only',
-    'bed-pans',
-    'bed-partners',
     'bed-push',
-    'bed-sacks',
-    'bed-set',
-    'bed-sharing',
-    'bed-sheet',
-    'bed-sheets',
-    'bed-sitting-room-study',
-    'bed-sitting-rooms',
-    'bed-size',
-    'bed-sized',
-    'bed-spaces',
-    'bed-spring',
-    'bed-tables',
-    'bed-ticking',
-    'bed-warmer',
-    'bed-wettin\'',
     'bed-willing',
-    'bed.',
-    'bed/breakfast',
-    'bed/days',
-    'bed/dealing',
-    'bed/storage',
-    'bed/washing',
-    'bedad',
-    'bedaholic',
-    'bedale/northallerton',
-    'bedan',
-    'bedarfsgerechter',
-    'bedaubed',
-    'bedazzle',
-    'bedbath',
-    'bedborough',
     'bedburn',
-    'bedcurtains',
-    'beddall',
-    'beddall/all',
-    'beddard',
-    'beddau',
-    'beddau\'r',
-    'bedded-down',
-    'bedders',
-    'bedding-down',
-    'bedding-mortar',
-    'bedding-out',
-    'bedding-plane',
-    'beddingham',
-    'beddington-brown',
-    'beddis',
     'beddis/forest',
-    'beddy-beddy-byes',
-    'bedeck',
-    'bedecking',
-    'bedeford',
-    'bedern',
-    'bedeuten',
-    'bedeux',
-    'bedevere',
-    'bedewed',
-    'bedford-based',
-    'bedford25pts',
-    'bedfordshire&ndash;buckinghamshire',
-    'bedgeberry',
-    'bedgey',
-    'bedgeys',
     'bedgrove',
-    'bedhead/dado',
-    'bediako',
-    'bedians',
-    'bedingfields',
-    'bedingham',
-    'bedini',
-    'bedinini',
-    'bedknob',
-    'bedknobs',
-    'bedlamp',
-    'bedless',
-    'bedlinens',
-    'bedload',
-    'bedlowe',
-    'bedmakers',
     'bedmoshin',
-    'bednall',
-    'bednarz',
-    'bednorg',
-    'bedo',
-    'bedoli',
-    'bedou',
-    'bedovers',
-    'bedpile',
-    'bedr',
-    'bedragoned',
-    'bedrocked',
-    'bedrocks',
-    'bedroom-band',
-    'bedroom-slippered',
-    'bedroom/',
     'bedroom/bath',
-    'bedroom/sitting',
-    'bedroom/study/broom',
-    'bedroomn',
-    'bedrooom',
-    'beds.even',
-    'beds.they',
-    'beds/1000',
-    'beds/thames',
-    'bedsers',
-    'bedsheets-and-bailing',
-    'bedside-',
-    'bedside-manner',
-    'bedsit-land',
-    'bedsit-type',
-    'bedsitland',
     'bedslave',
-    'bedsoiler',
-    'bedson',
-    'bedtable',
-    'bedward',
-    'bedwardine',
-    'bedwards',
-    'bedwet',
-    'bedwetters',
-    'bedworks',
-    'bedybuys',
-    'bee-',
-    'bee-bee-bee-bee-beep',
-    'bee-encrusted',
-    'bee-field',
-    'bee-gees',
     'bee-hived',
-    'bee-humming',
-    'bee-hunting',
-    'bee-in-his',
-    'bee-lass',
-    'bee-ootiful',
-    'bee-orientated',
-    'bee-skeps',
-    'beeause',
-    'beeban',
-    'beeblebrox',
-    'beech-buds',
-    'beech-effect',
-    'beech-forest',
-    'beech-fringed',
-    'beech-husks',
     'beech-laminated',
-    'beech-like',
-    'beech-mast',
-    'beech-rimmed',
-    'beech/oak',
-    'beecham/reiner/emi',
-    'beechcroft',
-    'beechen',
-    'beecheno',
-    'beecher-stowe',
-    'beechey/neighbour',
-    'beeching/thames',
-    'beechingesque',
-    'beechlawn',
-    'beechtree',
-    'beechtrees',
     'beechvale',
-    'beecke',
-    'beedham',
-    'beedings',
-    'beedini',
-    'beeeee',
-    'beeeep',
-    'beeem',
-    'beef-and-kidney',
-    'beef-booze-no',
-    'beef-cake',
-    'beef-dairy',
-    'beef-dumping',
-    'beef-exporting',
-    'beef-faced',
-    'beef-fattening',
     'beef-filled',
-    'beef-flavoured',
-    'beef-free',
-    'beef-heart',
-    'beef-hearted',
-    'beef-producing',
-    'beef-steak',
-    'beef-up',
-    'beef/draught',
-    'beef/work',
-    'beefbreeders',
-    'beefcattle',
-    'beefe',
-    'beefoes',
-    'beeford',
-    'beefroll',
     'beefstake',
-    'beefsteaks',
-    'beefy-feeling',
-    'beefy-jerky',
-    'beehive\'',
-    'beehive-pop',
-    'beehived',
-    'beeing',
-    'beeious',
-    'beekay',
-    'beekepers',
-    'beelderstorm',
-    'beels',
-    'beelsby',
-    'beelzebubs',
-    'been&rehy;is',
     'been-',
-    'been-amold',
-    'been-an',
-    'been-asked',
-    'been-kind',
-    'been-the',
-    'been-there-before',
-    'been/scarred',
-    'been_a',
-    'been_all',
-    'been_on',
-    'beeneys',
-    'beenhopping',
-    'beep-beep-beep-beep-beep',
-    'beep-voiced',
-    'beer-and-skittles',
     'beer-barrel',
-    'beer-befuddled',
-    'beer-belly',
-    'beer-bottles',
-    'beer-bottling',
-    'beer-bulged',
-    'beer-cellar',
-    'beer-coloured',
-    'beer-crate',
-    'beer-drinker',
-    'beer-fuming',
-    'beer-garden',
-    'beer-gardens',
-    'beer-house',
-    'beer-houses',
-    'beer-induced',
     'beer-lambert',
-    'beer-lovers',
-    'beer-maker',
-    'beer-money',
-    'beer-of-the-year',
-    'beer-pot',
-    'beer-pull',
-    'beer-pumps',
-    'beer-reeking',
-    'beer-shop',
-    'beer-shops',
-    'beer-snore',
-    'beer-soaked',
-    'beer-swiggers',
-    'beer-swigging',
-    'beer-tent',
     'beer-tin',
-    'beer-truck',
-    'beer-wet',
-    'beer/',
-    'beer/or',
-    'beerage',
-    'beercans',
-    'beercrocombe',
-    'beere',
-    'beerenauslese',
-    'beerenberg',
-    'beergut',
-    'beerguts',
-    'beerier',
-    'beerkeller',
-    'beermug',
     'beers.',
-    'beersele',
-    'beerstands',
-    'beertube',
-    'beery-voiced',
-    'bees&ndash;whitehaven',
-    'bees\'&rehy;waxed',
-    'beese',
-    'beesiana',
-    'beeside',
-    'beesley/former',
-    'beesly',
-    'beest',
-    'beestis',
-    'beestons',
-    'beestung',
     'beeswax-scented',
-    'beeswaxed',
-    'beeswing',
-    'beet-crop',
-    'beet-cutter',
-    'beet-sugar',
-    'beet.',
-    'beeta',
-    'beethov',
-    'beethoven-',
-    'beethovenize',
-    'beethovens',
-    'beethovensaal',
-    'beeting',
-    'beetle-brain',
-    'beetle-bright',
     'beetle-collector',
-    'beetle-driving',
-    'beetle-pollinated',
-    'beetle-riddled',
-    'beetle-spirited',
-    'beetle-style',
-    'beetle-wings',
-    'beetlecrusher',
-    'beetlejuicee',
-    'beetlestone',
-    'beetlestone/assistant',
-    'beetons',
-    'beetroots',
-    'beetson/esp',
-    'beety',
-    'beeves',
     'beevi',
-    'beeyou',
-    'beezy',
-    'befec-mulquin',
-    'befehl',
-    'befice',
-    'befind',
-    'befittin\'',
-    'beflared',
-    'beflowered',
-    'befoer',
-    'befoire',
-    'befooling',
-    'befor&eacute',
-    'befordshire',
-    'before&mdash',
     'before&mdash;if',
-    'before&mdash;now',
-    'before&ndash;relaxing',
-    'before&rehy;hand',
-    'before-',
-    'before-bed',
-    'before-dawn-returning',
-    'before-dinner',
-    'before-for',
-    'before-lunch',
-    'before-paying-tax',
-    'before.',
-    'before.its',
-    'before/after/during',
-    'before/during',
-    'before/if',
     'before/the',
-    'before_but',
-    'beforeand',
-    'beforehand.',
-    'beforei',
-    'beforeness',
-    'beforetimes',
-    'befouled',
-    'befrocked',
-    'befu',
-    'befuddle-headed',
-    'befurred',
-    'begans',
-    'begara',
-    'begarelli',
-    'begbie/daughter',
     'begetables',
-    'beggar-king',
-    'beggar-maid',
-    'beggar-women',
-    'beggardly',
-    'beggen',
-    'beggers',
-    'beggeth',
-    'begginback',
-    'begging-bowls',
-    'beggingbowl',
-    'beggy',
-    'begi',
-    'begijnhof',
-    'begin-with',
-    'beginings',
     'beginned',
-    'beginnen',
-    'beginner-intermediate',
-    'beginner/intermediate',
-    'beginner/rock',
-    'beginners\'-instruction',
-    'beginni',
-    'beginnig',
-    'beginnin&ndash',
-    'beginning-to',
-    'beginningless',
-    'beginnings_at',
-    'begins-with',
-    'begins.it',
-    'begins:will',
-    'begio',
     'begl&egrave;s-bordeaux',
-    'beglamoured',
-    'begles',
-    'begliocchi',
-    'begludship',
-    'begn',
-    'bego',
-    'begob',
-    'begod',
-    'begonne',
-    'begor',
-    'begorrahs',
-    'begouen',
-    'begowned',
-    'begozi',
-    'begr&uuml;ndung',
     'begradged',
-    'begram',
-    'begriff',
-    'begrudgers',
-    'begrudgery',
-    'begrutch',
-    'beguilements',
-    'beguiler',
-    'beguiling-looking',
-    'beguin',
-    'beguinages',
-    'beguinot',
-    'beguiristain',
-    'begum/aged',
-    'begwith',
-    'begziyn',
     'beh-aviour',
-    'behalf-could',
-    'behalfe',
-    'behav',
-    'behave.',
-    'behaved.the',
-    'behaver',
-    'behaving.',
-    'behavio',
-    'behaviorism',
-    'behaviorist',
-    'behaviour(s)',
-    'behaviour-based',
-    'behaviour-but',
-    'behaviour-controlling',
-    'behaviour-guidance',
     'behaviour-not',
-    'behaviour-pattern',
-    'behaviour-patterns',
-    'behaviour-sometimes',
-    'behaviour-that',
-    'behaviour-wise',
-    'behaviour/actions',
-    'behaviour/tasks',
-    'behavioural-dispositional',
-    'behavioural/physical',
-    'behavioural/social',
-    'behaviourist-type',
-    'behaviouristically',
-    'behaviourography',
-    'behaviuor',
-    'behaviur',
     'behavour',
-    'behavourism',
-    'behbehanian.',
-    'behdet',
-    'beheermaatschappij',
-    'behelf',
-    'beheshte-zahra',
-    'beheshti',
-    'behests',
-    'behidi',
-    'behilosophy',
-    'behind\'/',
-    'behind-before',
-    'behind-locked-doors',
-    'behind-nut',
-    'behind-scenes',
     'behind-the-arras',
-    'behind-the-back',
-    'behind-the-bars',
-    'behind-the-desk',
-    'behind-the-ear',
-    'behind-the-scene',
-    'behind-the-sheds',
-    'behind.picture',
-    'behing',
-    'behistun',
-    'behiund',
-    'behnisch',
-    'behold\'st',
-    'beholdingness',
-    'beholdynge',
-    'behoof',
     'behoven',
-    'behrends',
-    'behrens/cambridge',
-    'behroze',
-    'behviour',
-    'behzad',
-    'beide',
-    'beiden',
-    'beidermier',
-    'beige-and-dark-brown',
-    'beige-carpeted',
-    'beige-gold',
-    'beige-toned',
-    'beige/brown',
-    'beige/green',
-    'beihon',
     'beije',
-    'beijer',
-    'beijing&mdash;see',
-    'beijing-controlled',
-    'beil',
-    'beile',
-    'beilken',
-    'beilschmiedia',
-    'beim',
-    'bein\'-tactful-to-old-people',
-    'beincluded',
-    'beind',
-    'beinee',
-    'beineix',
-    'beines',
-    'being&mdash',
     'being\'',
-    'being-a-rock-star',
-    'being-breathed-in-to',
-    'being-for-the-other',
-    'being-in-a-box',
-    'being-on-drugs',
-    'being-related-to-x',
-    'being-the',
-    'being/there',
-    'beingcharacterised',
-    'beingthe',
-    'beinng',
-    'beinst',
-    'beira-mar',
-    'beirdd',
-    'beirniadaeth',
     'beirniadol',
-    'beirnstut',
-    'beiro',
-    'beirut&ndash',
-    'beirut-on-hudson',
-    'beirut-sharjah',
-    'beishon/consumers',
-    'beisly',
-    'beistis',
-    'beitel',
-    'beith/federation',
-    'beithe',
-    'beitr&auml;ge',
-    'beitrag',
-    'beitzel',
-    'bej',
     'bejabbers',
-    'bejabers',
-    'bejaisus',
-    'bejam',
-    'bejants',
-    'bejar',
-    'bejasis',
-    'bejasus',
-    'bejaze',
-    'bejewel',
-    'bekasi',
-    'bekele',
-    'bekenn',
-    'bekescsaba',
-    'bekhor',
-    'bekittenings',
     'bekke',
-    'bekker',
-    'bekkos',
-    'beknickered',
-    'bekteshi',
-    'bekulo',
-    'bekwaamheidsdiploma',
-    'bel&dollar;22,700,000',
-    'bel&eacute;m-brasilia',
-    'bel&ndash;eve',
-    'bel-him',
-    'bel-marduk',
-    'bel-samen',
-    'belaggered',
-    'belair',
-    'belaisa',
     'belalla',
-    'belamonte',
-    'belamy',
-    'belanda',
-    'belanov',
-    'belardo',
-    'belasco',
-    'belatucadrus',
-    'belay/abseil',
-    'belben',
-    'belbroughton',
-    'belchen',
-    'belcher/fraser',
-    'belcher/royal',
-    'belchertown',
-    'belchin',
     'belchite',
-    'belcho',
-    'beldham',
-    'beldon',
-    'beldray',
-    'beleagued',
-    'beleaguer',
-    'beleagurered',
-    'beleathered',
-    'belebey',
-    'beleeeeeeeeeeeeeeeeeeeeeeeeeeve',
-    'beleeeeeeeeeeeeeeeeeeeve',
-    'beleeeeeeeeeve',
-    'beleeeeeeeve',
-    'beleeeeeeve',
-    'beleeeeve',
     'beleek',
-    'beleevers',
-    'beleeving',
-    'beleiev',
-    'beleifs',
-    'belem',
-    'belemnite-rich',
-    'belemnoid',
-    'belen',
-    'belen\'kii',
-    'beleriand',
-    'belet',
-    'beleue',
-    'belew',
-    'belfast-blackpool',
-    'belfast-bred',
     'belfast-built',
-    'belfast-gatwick',
-    'belfast-heathrow',
-    'belfast-liverpool',
-    'belfast-london',
-    'belfast-manchester',
-    'belfast/liverpool',
-    'belfield-smith',
-    'belford-cellini',
-    'belfry-based',
-    'belfy',
-    'belga',
-    'belgard',
-    'belgian-bred',
-    'belgian-built',
-    'belgian-luxembourg',
     'belgian/luxembou&rehy;rg',
-    'belgium-and',
-    'belgium-trained',
-    'belgium-with',
-    'belgo-luxembourg',
-    'belgrade-zagreb',
-    'belgrand',
-    'belgraves',
-    'belha',
-    'belhaj',
-    'belhassine',
-    'belhouchet',
-    'belhus',
-    'beliairs',
-    'belice',
-    'belida',
     'belie-ed',
-    'belief&rehy;expression',
-    'belief&rehy;systems.the',
-    'belief-centred',
-    'belief-expressive',
-    'belief-far',
-    'belief-structure',
-    'belief-worlds',
-    'belief/assertion',
-    'belief/intention',
-    'belief/unbelief',
-    'beliefs-',
-    'beliefs.',
-    'belieft',
-    'believe-',
-    'believe-it-or-not',
     'believe-yet-doubt',
-    'believe/anxious',
-    'believe/feel',
-    'believe:the',
-    'believed-',
-    'believedly',
-    'believers-and',
-    'believin\'',
-    'belighted',
-    'belike',
-    'belinda-ish',
-    'belinform',
-    'beling',
-    'belinskii-zakharov',
-    'belinus',
-    'belipped',
     'belisario',
-    'belittlement',
-    'belittlingly',
-    'belizanus',
-    'belk',
-    'belkevitz/father',
-    'belkhadem',
-    'belkhuban',
-    'belkif',
-    'bell&ndash;coleman',
-    'bell&rehy;push',
-    'bell-and-weathercock',
-    'bell-belgacom',
-    'bell-birds',
-    'bell-board',
-    'bell-bow',
     'bell-box',
-    'bell-brass',
-    'bell-bright',
-    'bell-chain',
-    'bell-code',
-    'bell-flower',
-    'bell-hanging',
-    'bell-haunted',
-    'bell-jar',
-    'bell-jars',
-    'bell-laden',
-    'bell-lamp',
-    'bell-lyre',
-    'bell-man',
-    'bell-meaning',
-    'bell-metal',
     'bell-mouthed',
-    'bell-northern',
-    'bell-note',
-    'bell-notes',
-    'bell-panel',
-    'bell-scotch',
-    'bell-sleeved',
-    'bell-sound',
-    'bell-sounds',
-    'bell-turret',
-    'bell-wall',
-    'bell-walls',
-    'bell.gild.',
-    'bell/barbell',
-    'bell/brother-in-law',
-    'bell/convenor',
     'bell/farmer',
-    'bell/genesis',
-    'bell/john',
-    'bell/oxford',
-    'bell/student',
-    'bell/students',
-    'bell/university',
-    'bell/vet',
-    'belladonnae',
-    'bellador',
-    'bellafax',
-    'bellaire',
-    'bellanca',
-    'bellancas',
-    'bellani',
-    'bellapa&iuml;s',
     'bellard-thomson',
-    'bellarmin',
-    'bellarrnine',
-    'bellars',
-    'bellas',
-    'bellasis',
-    'bellatini',
-    'bellatrix',
-    'bellbird',
-    'bellbirds',
-    'bellborough',
-    'bellbottom',
-    'bellbottoms',
-    'bellboy/hollywood',
-    'bellcote',
-    'belle-epoque',
     'belle-etoile',
-    'belle-laide',
-    'belle-lettrist',
-    'belleair',
-    'bellecanna',
-    'bellechasse',
-    'bellecour',
-    'belleek&ndash;kesh',
-    'bellefon',
-    'bellefonds',
-    'bellefontaine',
-    'bellefroid',
-    'bellegarde',
-    'bellehatch',
-    'bellem',
-    'bellen',
     'bellena',
-    'bellenger',
-    'bellenie',
-    'belleperche',
-    'bellepheron',
-    'beller&eacute;e',
-    'beller-hann',
-    'bellerby/abbey',
-    'bellerbys',
-    'belleric',
-    'bellerophens',
-    'belles-lettrist',
-    'belles_lettres',
-    'bellette',
-    'bellettee',
-    'bellever',
     'belleview',
-    'bellevista',
-    'bellevue-rheinhotel',
-    'bellew',
-    'bellewarde',
-    'bellezze',
-    'bellflowers',
-    'bellfounder',
-    'bellhaven',
-    'bellic',
-    'bellicoes',
-    'bellido',
-    'belligerent&ndash;neutral',
-    'belligerently.',
-    'bellinas',
-    'bellinesque',
     'bellingdon',
-    'bellingers',
-    'bellini.',
-    'bellinian',
-    'bellinzona',
-    'bellissimo',
-    'bellmer',
-    'bellmon',
-    'bellmore',
-    'belloch',
-    'bellocq',
-    'bellomo',
-    'bellomy',
-    'bellon',
-    'belloni',
-    'bellord',
     'bellosguardo',
-    'bellotte',
-    'bellows-like',
-    'bellows-mender',
-    'bellpulls',
-    'bellpushes',
-    'bellringle',
-    'bellroom',
-    'bellrope',
-    'bellropes',
-    'bells-and-whistles',
-    'bellscat',
-    'bellshaped',
-    'bellto',
-    'bellurn',
-    'bellvale',
     'bellvue',
-    'bellwire',
-    'belly&rehy;landed',
-    'belly&rehy;landing',
-    'belly\'',
-    'belly-achings',
-    'belly-bumping',
-    'belly-cheer',
-    'belly-crawling',
-    'belly-dancer',
-    'belly-dancers',
-    'belly-dancing',
-    'belly-deep',
-    'belly-flopping',
-    'belly-flops',
-    'belly-full',
     'belly-high',
-    'belly-holds',
-    'belly-land',
-    'belly-like',
-    'belly-numbing',
-    'belly-piece',
-    'belly-roar',
-    'belly-rumble',
-    'belly-sliders',
-    'belly-slit',
-    'belly-turning',
-    'bellyboard',
-    'bellyfuls',
-    'bellylaugh',
-    'bellys',
-    'bellzouki',
     'belmaduthy',
-    'belmeis',
-    'belmore',
-    'belnap',
-    'beloch',
-    'belograd-chik',
-    'beloki',
-    'belon',
-    'belonesox',
-    'belong&rehy;here',
-    'belonged-the',
-    'belonged.',
-    'belongers',
-    'belongeth',
-    'belonging\'',
-    'belonging.',
     'belonging.n',
-    'belopole',
-    'beloros',
-    'belost',
-    'belostok',
-    'belouis',
-    'belouizdad',
-    'beloush',
-    'belousov-zhabotinsky',
-    'belov&egrave;d',
-    'beloved-style',
-    'belovodie',
-    'below&mdash',
-    'below&mdash;for',
-    'below-',
-    'below-branch',
     'below-conscious',
-    'below-decks',
-    'below-investment-grade',
-    'below-line',
-    'below-optimum',
-    'below-shoulder',
-    'below-shoulder-length',
-    'below-specification',
-    'below-the-bonnet',
-    'below-the-collarbone',
-    'below-the-market',
-    'below-the-poverty-line',
-    'below-zero',
-    'below.',
-    'below.as',
-    'belows',
     'belpanese',
-    'belsay',
-    'belsen-thin',
-    'belser',
-    'belser-verlag',
-    'belsher',
-    'belsteel',
-    'belstone',
-    'belt\'',
-    'belt-across-the-chops',
-    'belt-busting',
-    'belt-cum-tape',
-    'belt-joining',
-    'belt-loop',
-    'belt-plates',
-    'belt-stud',
     'belt-vibrators',
-    'belt-zone',
-    'belt.',
-    'belt/pulley',
-    'beltagne',
-    'beltanelliformis',
-    'beltanes',
-    'beltbuckle',
-    'belties',
-    'belting-up',
-    'beltingly',
-    'beltings',
-    'beltir',
-    'beltona',
-    'beltravers',
-    'beltsy',
     'beltz',
-    'belu-simion',
-    'belushi/aykroyd/murray',
-    'belval',
-    'belver',
-    'belvidere',
-    'belvier',
-    'belville:i',
-    'belvior',
-    'bely',
-    'belyaev',
-    'belyayev',
-    'belzec',
-    'bemal',
-    'bemard',
-    'bemas',
     'bemasked',
-    'bemax',
-    'bembe',
-    'bembeneck',
-    'bemberg',
-    'bemei',
-    'bemelmans',
-    'bemis',
-    'bemnor',
-    'bemowski',
-    'bemporad',
-    'bempstone',
-    'bemused-looking',
-    'bemy',
-    'ben&iacute;tez',
-    'ben&ocirc;it',
     'ben&ocirc;it-sur-loire',
-    'ben\'',
-    'ben-',
-    'ben-avraham',
-    'ben-gurion',
-    'ben-menashe',
-    'ben-ner',
-    'ben/rush',
-    'benachenhou-lafha',
-    'benadryl',
-    'benani',
-    'benasser',
-    'benat',
-    'benati',
-    'benatsky',
-    'benatura',
     'benauges',
-    'benazet',
-    'benazhir',
-    'benba',
-    'benbane',
-    'benbasat',
-    'benbow/bosnia',
-    'benbowe',
-    'benbulbous',
-    'bench&rehy;mark',
-    'bench&rehy;marking',
-    'bench&rehy;marks',
-    'bench(1861)',
-    'bench-altar',
-    'bench-altars',
-    'bench-back',
     'bench-boards',
-    'bench-seating',
-    'bench-top',
-    'bench.',
-    'bench/playing',
-    'benchchair',
-    'bencheik',
-    'benchers:james',
-    'benchlane',
-    'benchleys',
-    'benchpress',
-    'benchtest',
-    'benchurch',
-    'benchwork',
-    'benci',
-    'bencie',
     'benckendorff',
-    'bend-i-bus',
-    'bend.around',
-    'bend.sweepers',
-    'bendale',
-    'bendana',
-    'bendetti',
-    'bendfeldt',
-    'bendfeldturban',
-    'bendiest',
-    'bending-behind-the-nut',
-    'bendix/king',
-    'bendle',
-    'bendless',
-    'bendon',
-    'bendor',
     'bendouga',
-    'bendourou',
-    'bendra',
-    'bendrey',
-    'bendrofluazude',
-    'bends.',
-    'bendumb',
-    'bendusi',
-    'bendy-sole',
-    'bendyk',
-    'bendysh',
-    'bendz',
-    'bene\'t',
-    'beneah',
-    'benecke',
-    'benedens',
     'benedia',
-    'benedic',
-    'benedicam',
-    'benedicendum',
-    'benedicte',
-    'benedicts',
-    'benedik',
-    'benef',
-    'benefica',
-    'beneficaries',
-    'benefice-holder',
-    'benefice-holders',
-    'beneficiality',
-    'beneficiary&mdash;the',
-    'beneficiary.',
-    'beneficiating',
     'beneficiis',
-    'benefit\'',
-    'benefit-level',
-    'benefit.early',
-    'benefit/community',
-    'benefit/council',
-    'benefit:risk',
-    'benefitial',
-    'benefits/bad',
-    'benefitsca',
-    'benefitsvictor',
-    'benefo',
-    'beneforti',
-    'benegal',
-    'benegoechea',
-    'beneharnum',
     'beneift',
-    'beneix',
-    'benelips',
-    'benelli',
-    'benelong',
-    'benemann',
-    'benemerito',
-    'benes',
-    'beneson',
-    'benethe',
-    'benetos',
-    'benets',
-    'benettino',
-    'benetton-type',
-    'benetton.',
-    'benettons',
     'beneventanus',
-    'benevolent-beat-bohemian',
-    'benezet',
-    'benezit',
-    'benfey',
-    'benfica0',
-    'benfield/slalom',
-    'benfit',
-    'bengalese',
-    'bengali-speaking',
-    'bengate',
-    'bengeworth',
-    'bengi',
-    'bengie',
-    'benglis',
-    'benglog',
     'bengono',
-    'bengs',
-    'bengston',
-    'bengue',
-    'bengzon',
-    'benhaim',
-    'benhall',
-    'benham/oxford',
-    'benhams',
-    'benhilton',
-    'beni-soueif',
-    'beniamin',
-    'beniaminio',
-    'beniamino',
-    'benian',
-    'benians',
     'benicor',
-    'benightedness',
-    'benightment',
-    'benigna',
-    'benignum',
-    'benillion',
-    'benincasa',
-    'beningfield',
-    'beningfield/gamekeeper',
-    'benington',
-    'beninois',
-    'beninta',
-    'benisons',
-    'benisou&euml;f',
-    'benissa',
-    'benitier',
     'benizi',
-    'benja',
-    'benjamin\'',
-    'benjamin/cummings',
-    'benjaminson',
-    'benjie',
-    'benjiman',
-    'benk',
-    'benkei',
-    'benkert',
-    'benkhill',
-    'benkovac',
-    'benkulen',
-    'benlay',
-    'benlich',
-    'benllen',
     'benlowes',
-    'benmnett',
-    'benn-anza',
-    'benn-eubank',
-    'benn-healey',
-    'benn-recruited',
-    'benn-watcher',
-    'benn-watson',
-    'benn/festival',
-    'bennals',
-    'benndorf',
-    'bennery',
-    'bennet-clark',
-    'bennett/architect',
-    'bennett/cancer',
-    'bennett/glider',
     'bennett/head',
-    'bennett/neighbour',
-    'bennett/prefab',
-    'bennett/worker',
-    'bennettitales',
-    'bennettons',
-    'bennettsbridge',
-    'benninck',
-    'benninghome',
-    'benningtons',
-    'bennites',
-    'bennllech',
-    'benomylin',
-    'benoni',
-    'benotti',
-    'benouda',
     'benowitz',
-    'benowitz\'',
-    'benoxoprofen',
-    'benradoune',
-    'benredouane',
-    'benrig',
-    'benrkik',
-    'bensel',
-    'benseraside',
-    'benshie',
-    'benshoof',
-    'bensing',
-    'bensinger',
-    'benslow',
-    'benson/daily',
-    'benson/dowty',
     'benson/landowner',
-    'bensonian',
-    'bensonians',
-    'bensoussan',
-    'bent-backed',
-    'bent-handled',
-    'bent-wing',
-    'bent-wire-and-float',
-    'bent.the',
-    'bental',
-    'benteen',
-    'benteng',
-    'bentford',
-    'benthalls',
-    'benthamesque',
-    'benthamism',
     'benthem',
-    'benthically',
-    'bentii',
-    'bentil',
-    'bentle',
-    'bentleigh',
-    'bentley/bishop',
-    'bentota',
-    'bentov',
-    'bentti',
-    'bentum',
-    'benty',
-    'benu',
-    'benumbs',
-    'benummed',
-    'benutzerfreundlich',
     'benvenuta',
-    'benveridle',
-    'benway',
-    'benyellary',
-    'benyon/society',
-    'benzadine',
-    'benzadine-hydrogen',
-    'benzakin',
-    'benzamido',
-    'benzaminia',
-    'benzel',
-    'benzene-azo-benzene',
-    'benzene-diazo-chloride',
-    'benzene-like',
-    'benzene/ethanol',
-    'benzenic',
     'benzenoid',
-    'benzequinone-amine',
-    'benzer',
-    'benzidine',
-    'benzies',
-    'benzikie',
-    'benzil',
-    'benzin',
-    'benzo',
-    'benzo-14-thiacrown-4',
-    'benzodiazapines',
-    'benzodioazepine',
-    'benzofurane',
-    'benzotriazole',
-    'benzoylperoxide',
-    'benzylacohol',
     'benzyladenine',
-    'benzylammonium',
-    'benzyne',
-    'beomuy',
-    'beona',
-    'beor',
-    'beorhford',
-    'beorhthelm',
-    'beornred',
-    'beplushed',
-    'bepop',
-    'bepton',
-    'bequeather',
-    'bequeathers',
-    'bequeathes',
-    'bequerel',
     'bequested',
-    'bequia',
-    'ber&egrave;s',
-    'bera',
-    'berade',
-    'beragh',
-    'berain-inspired',
-    'beraja',
-    'berakhoth',
-    'beral/imperial',
-    'beral/project',
-    'beraldi',
-    'beram',
-    'berang',
-    'beranger',
-    'berardi',
     'berbak',
-    'berberana',
-    'berce',
-    'berceanu',
-    'bercelet',
-    'berche',
-    'berchem',
-    'berchthold',
-    'bercuit',
-    'bercuvitz',
-    'berdan',
-    'berdennikov',
-    'berea',
-    'bereans',
-    'bereave',
-    'bereavement-coping',
     'bereavement-counselling',
-    'bereaves',
-    'berec',
-    'bereczky',
-    'bereford',
-    'bereft/and',
-    'beregevoy',
-    'beregond',
-    'bereitschaftspolizei',
-    'berek',
-    'berenado',
-    'berendsen',
-    'berengo',
-    'berenices',
-    'berer',
-    'beresford/curator/regimental',
     'bereshith',
-    'beresina',
-    'beret-clad',
-    'beret.',
-    'bereted',
-    'berewick',
-    'berezovsky',
-    'berg&eacute;re',
-    'berg&egrave;res',
-    'bergagnone',
-    'bergahoff',
-    'bergakademie',
-    'bergamasque',
-    'bergamasques',
-    'bergamia',
-    'bergamo-brescia',
     'bergan',
-    'berganza',
-    'bergaptens',
-    'bergaretxe',
-    'bergeist',
-    'bergelin',
-    'bergen-belsen',
-    'bergen-mccarthy',
-    'bergen-op-zoom',
-    'bergendahl',
-    'bergenhus',
-    'bergenstammi',
-    'berger-gestapo',
-    'bergeres',
-    'bergeret',
-    'bergers',
     'bergeson',
-    'berget',
-    'bergfleth',
-    'bergfrieden',
-    'berggasse',
-    'bergheim',
-    'bergholt-based',
-    'bergian',
-    'bergii',
-    'bergische',
-    'bergisel',
-    'bergkaman',
-    'bergkelder',
-    'bergkranz',
-    'bergmanlein',
-    'bergnes',
     'bergodi',
-    'bergoonath',
-    'bergos',
-    'bergsagel',
-    'bergshrund',
-    'bergsjo',
-    'bergsma',
-    'bergsonian',
-    'bergstroms',
-    'berguaria',
-    'bergue',
-    'bergues',
-    'bergvist',
-    'bergwege',
-    'bergzaberner',
-    'berh2',
     'berhan',
-    'berhanu',
-    'berhtast',
-    'berhtgils',
-    'berhtwald',
-    'berichte',
-    'berick',
-    'berieved',
-    'berilia',
-    'berin',
-    'berindei',
-    'beringer',
-    'beringia',
-    'berinthia',
-    'berist&agrave;in',
-    'berits',
     'berk\'amstead',
-    'berkamp',
-    'berkeleian',
-    'berkeley-based',
-    'berkeley-derived',
-    'berkeley-trained',
-    'berkeley-walbrook',
-    'berkeley/conservator',
-    'berkeleyan',
-    'berkely',
-    'berkentex',
-    'berker',
-    'berketex',
-    'berkev',
-    'berkfell',
-    'berkhampstead-based',
     'berkhampsted',
-    'berkhamsted-based',
-    'berkhout',
-    'berklee',
-    'berkleyanism',
-    'berkner',
-    'berks.',
-    'berks/bucks',
-    'berkshire-oxfordshire',
-    'berkshire/buckinghamshire',
-    'berkshire/hampshire',
-    'berkshireman',
-    'berkshires',
-    'berkton',
-    'berkun',
-    'berlandieri',
     'berlanga',
-    'berleeeeeeeeeeeeeeve',
-    'berlev&aring;g',
-    'berlichingen',
-    'berlie',
-    'berlin(west)',
-    'berlin-based',
-    'berlin-born',
-    'berlin-budapest',
-    'berlin-charlottenburg',
-    'berlin-hohenschonhausen',
-    'berlin-moabit',
-    'berlin-rome',
-    'berlin-to-leipzig',
-    'berlin-watchers',
-    'berlin-wedding',
     'berlinerinnen',
-    'berlinische',
-    'berliozian',
-    'berliozz',
-    'berlkeley',
-    'berluddy',
-    'berly',
-    'berlyne',
-    'berman/perry',
-    'bermantofts',
-    'bermejo',
-    'bermingham-mcdonogh',
-    'bermondsey-based',
-    'bermondsey-born',
-    'bermud&eacute;z',
-    'bermuda-shorted',
     'bermudian',
-    'bermudo',
-    'bern-murten',
-    'bern-neuchatel',
-    'bern/f&uuml;ri',
-    'berna',
-    'bernabe',
-    'bernadac',
-    'bernadettes',
-    'bernado',
-    'bernaert',
-    'bernaise',
-    'bernanos',
-    'bernard-levy',
-    'bernard-shaw',
-    'bernard-soulier',
     'bernardes',
-    'bernardinplanning',
-    'bernardus',
-    'bernarr',
-    'bernauer',
-    'bernbach',
-    'bernbaum',
-    'bernberg',
-    'bernburg',
-    'berncastle',
-    'berncia',
-    'bernei',
-    'bernenstein',
-    'bernest',
-    'bernet',
-    'berney',
     'bernfield',
-    'berngate',
-    'bernhardfonds',
-    'bernhards',
-    'bernhardur',
-    'bernhardus',
-    'bernhart',
-    'bernhaum',
-    'bernhope',
-    'bernician-dalriadic',
-    'bernis',
-    'bernkasteler',
-    'bernod',
-    'bernouilli',
-    'bernoulli-euler',
-    'bernshaw',
     'bernstam',
-    'bernstead',
-    'bernstein-kearsley-zapas',
-    'bernstein/comden/green',
-    'bernstein/ormandy',
-    'bernstein/rave',
-    'berntsen',
-    'beroflex',
-    'berol/osmiroid',
-    'beromunster',
-    'berore',
-    'beroul',
-    'berquist',
-    'berr',
-    'berr&iacute;os',
-    'berra',
     'berreman',
-    'berrera',
-    'berrick',
-    'berriedale-johnson',
-    'berrini',
-    'berrios',
-    'berrisford/olympic',
-    'berrison',
-    'berrr-zerrr-ker',
-    'berrueta-clement',
-    'berry-',
-    'berry-coloured',
-    'berry-dee',
-    'berry-flavoured',
-    'berry-gatherers',
-    'berry-like',
     'berry-lined',
-    'berry-red',
-    'berry-trained',
-    'berry/forensic',
-    'berry/group',
-    'berry/i',
-    'berry/industry',
-    'berry/investment',
-    'berryappearing',
-    'berryboy',
-    'berrydale',
-    'berrydales',
-    'berryer',
-    'berryfields',
-    'berrylands',
-    'berrynarbor',
     'berrynarbour',
-    'bersa',
-    'berseem',
-    'bersenev',
-    'bersgardens',
-    'bershad',
-    'berson',
-    'bert-smiths',
-    'bertagni',
-    'bertarelli',
-    'bertaux-wiame',
-    'bertel&agrave',
-    'bertenshaw',
-    'bertera',
-    'berteroi',
-    'berth-holders',
     'berth/bedded',
-    'berthelotii',
-    'berthengam',
-    'berther',
-    'berthiers',
-    'berthois',
-    'bertholleria',
-    'berthollet',
-    'bertholletia',
-    'bertholt',
-    'berthrong',
-    'bertice',
-    'bertillon',
-    'bertinoro',
-    'bertioga',
-    'bertiscus',
     'bertlesmann',
-    'bertodano',
-    'bertoia',
-    'bertol',
-    'bertolan',
-    'bertold',
-    'bertoldo',
-    'bertolio',
-    'bertone-bodied',
-    'bertone-like',
-    'bertonor',
-    'bertop',
-    'bertorelli',
-    'bertotti',
-    'bertra',
-    'bertram/ostrich',
     'bertramka',
-    'bertran',
-    'bertrand-de-comminges',
-    'bertrand-type',
-    'bertrandon',
-    'bertrandus',
-    'bertrmm',
-    'bertsch',
-    'bertschi',
-    'bertschinger',
-    'bertus',
-    'bertz',
-    'beruhrt',
-    'berulf',
-    'beruncial',
-    'berutti',
     'berve',
-    'berverlin',
-    'berwell',
-    'berwickshire-based',
-    'berwyk',
-    'bery/house',
-    'beryll',
-    'beryllium-10',
-    'beryx',
-    'berzei',
-    'berzonsky',
-    'bes-assured',
-    'besagic',
-    'besakih',
-    'besamin',
-    'besanceney',
     'besanko',
-    'besaque',
-    'besashed',
-    'besceade&eth',
-    'beschaftigungsforderungsgesetz',
-    'beschantnikh',
-    'beschatnikh',
-    'beschi',
-    'bescoby',
-    'beseeming',
-    'beseieged',
-    'beseigning',
-    'besgrove',
-    'beshari',
-    'beshirs',
-    'besides&ndash',
     'besides-',
-    'besides.',
-    'besids',
-    'besiegement',
-    'besieges',
-    'besiegings',
-    'besikci',
-    'beskitas',
-    'besley',
-    'besloten',
-    'besm6',
-    'besmear',
-    'besmer',
-    'besmocked',
-    'besnier',
-    'besnik',
     'besnovatimi',
-    'besoin',
-    'besor',
-    'besozzled',
-    'bespake',
-    'bespatter',
-    'bespattering',
-    'bespeaking',
-    'bespittled',
-    'besport',
-    'besported',
-    'bespread',
-    'besprinkled',
-    'bessarbia',
-    'bessarion',
-    'bessay',
     'besselsen',
-    'bessera',
-    'besserat',
-    'besset',
-    'besshi-type',
-    'bessi&egrave;res',
-    'bessie-brains',
-    'bessin',
-    'bessinger',
-    'bessle',
-    'bessler',
-    'bessmertnyi',
-    'bessner',
-    'besso',
-    'bessons',
-    'bessoumal',
     'best&gt;150=active',
-    'best&mdash;at',
-    'best&rehy;selling',
-    'best\'',
-    'best-adapted',
-    'best-adjusted',
-    'best-attested',
-    'best-available',
-    'best-beloved',
-    'best-buy',
-    'best-class',
-    'best-composed',
-    'best-decorated',
-    'best-demonstrated',
-    'best-disciplined',
-    'best-dress',
     'best-educated',
-    'best-en',
-    'best-execution',
-    'best-execution\'',
-    'best-fed',
-    'best-few',
-    'best-first',
-    'best-flavoured',
-    'best-forgotten',
-    'best-formed',
-    'best-founded',
-    'best-governed',
-    'best-handling',
-    'best-hated',
-    'best-hearted',
-    'best-in-britain',
     'best-in-class',
-    'best-ironed',
-    'best-known-song',
-    'best-lighted',
-    'best-liked',
-    'best-lit',
-    'best-maintained',
-    'best-man',
-    'best-managed',
-    'best-manning',
-    'best-match',
-    'best-matches',
-    'best-matching',
-    'best-meaning',
-    'best-motivated',
-    'best-named',
     'best-of',
-    'best-of-11',
-    'best-of-17',
-    'best-of-17-frame',
-    'best-of-17-frames',
-    'best-of-19-frames',
-    'best-of-both-worlds',
-    'best-oiled',
-    'best-organized',
-    'best-out-of-three',
-    'best-overall',
-    'best-paying',
-    'best-platoon',
-    'best-playing',
-    'best-proportioned',
-    'best-protected',
     'best-provided',
-    'best-read',
-    'best-recorded',
-    'best-regulated',
-    'best-researched',
-    'best-rounded',
-    'best-scoring',
-    'best-she',
-    'best-situated',
-    'best-sized',
-    'best-sounding',
-    'best-specified',
-    'best-spirited',
-    'best-stocked',
-    'best-test',
-    'best-turned',
     'best-turned-out',
-    'best-understood',
-    'best-used',
-    'best-watched',
-    'best-written',
-    'best.known',
-    'best.possible',
-    'best/prisoners',
-    'bestegui',
-    'besteht',
-    'bestes',
-    'bestest-ever',
-    'bestfit',
-    'besthoff',
-    'bestiaire',
-    'bestially',
     'besting',
-    'bestley',
-    'bestlite',
-    'bestman',
-    'beston',
-    'bestowers',
-    'bestridden',
-    'bestride',
-    'bestseller-writing',
-    'bestubbled',
-    'bestv',
-    'besweatered',
-    'beswick/goat',
-    'besy',
-    'besydes',
-    'bet&mdash',
     'bet&mdash;with',
-    'bet-shean',
-    'bet-the-',
-    'bet-ween',
-    'bet-zur',
-    'bet.',
-    'beta&rehy;blockers',
-    'beta-',
-    'beta-2-microglobulin',
-    'beta-adrenoceptor',
-    'beta-amyloid',
-    'beta-cells',
-    'beta-chloro-beta-ethyl',
-    'beta-count',
-    'beta-emitter',
-    'beta-gamma',
     'beta-human',
-    'beta-lactam',
-    'beta-lactoglobulin',
-    'beta-lobe',
-    'beta-male',
-    'beta-minus',
-    'beta-particles',
-    'beta-radiation',
-    'beta-radiography',
-    'beta-ram',
-    'beta-ray',
-    'beta-sensitive',
-    'beta-tested',
-    'beta-thalassemia',
-    'beta-toxin',
-    'beta-toxin-producing',
     'beta-zeta',
-    'beta/gamma',
-    'betaadrenergic',
-    'betablocker',
-    'betablocking',
-    'betabuys',
-    'betacam',
-    'betacarotene',
-    'betacea',
-    'betacells',
-    'betacolor',
-    'betadine',
-    'betak',
-    'betaken',
-    'betalight',
-    'betalites',
     'betancur',
-    'betancuria',
-    'betano',
-    'betasselled',
-    'betchell',
-    'betcher',
-    'betcherrygahs',
-    'betel-leaf',
-    'betel-nut-rouged',
-    'betel-ravaged',
-    'betel-stained',
-    'beteljuice',
-    'betelnut',
-    'betels',
-    'beth-el',
-    'beth-horon',
     'beth.',
-    'bethanecol',
-    'bethell/department',
-    'bether',
-    'bethesa',
-    'bethge',
-    'bethink',
-    'bethke',
-    'bethleham',
-    'bethnel',
-    'bethshemesh',
-    'beti',
-    'betic',
-    'betides',
-    'betitou',
-    'betjamin',
     'betjeman-on-slough',
-    'betjemania',
-    'betjemann',
-    'betjemans',
-    'betle',
-    'betley',
-    'betokeneth',
-    'betolaza',
-    'betons',
-    'betrasey',
-    'betrayal\'',
-    'betrayal.venezuelans',
-    'betrayingly',
-    'betreated',
-    'betrvg',
-    'betselem',
     'betsiboka',
-    'betsy-coed',
-    'bettagno',
-    'bettah',
-    'bettarini',
-    'bettauer',
-    'betted',
-    'bettendorf',
-    'betteney',
-    'better&mdash;it',
-    'better&rehy;positioned',
-    'better&rehy;preserved',
-    'better\'ole',
-    'better(&gt)',
-    'better-',
-    'better-behaved',
     'better-bring',
-    'better-built',
-    'better-connected',
-    'better-defended',
-    'better-defined',
-    'better-developed',
-    'better-directed',
-    'better-disposed',
-    'better-drawn',
-    'better-dressed',
-    'better-engineered',
-    'better-fancied',
-    'better-fed',
-    'better-fitting',
-    'better-groomed',
-    'better-housed',
     'better-information',
-    'better-managed',
-    'better-mannered',
-    'better-ordered',
-    'better-paying',
-    'better-prepared',
-    'better-read',
-    'better-resourced',
-    'better-served',
-    'better-sized',
-    'better-sounding',
-    'better-spoken',
-    'better-stocked',
-    'better-suited',
-    'better-supported',
-    'better-tasting',
     'better-than-equal',
-    'better-than-nodding',
-    'better-than-normal',
-    'better-than-ordinary',
-    'better-than-usual',
-    'better-the',
-    'better-to-do',
-    'better-to-eat-you-with',
-    'better-told',
-    'better-used',
-    'better-waged',
-    'better.',
-    'better/worse-dressed',
-    'betterave',
-    'betteraves',
-    'betterin\'',
     'betterthe',
-    'betterways',
-    'betteshanger',
-    'bettesworth',
-    'bettey',
-    'bettiah',
-    'betties',
-    'bettin\'',
-    'betting-mad',
-    'betting-shops',
-    'bettinghaus',
-    'bettings',
-    'bettinson/father',
-    'bettis',
-    'bettison',
-    'bettle',
     'bettleheim',
-    'betton-ford',
-    'betton/abta',
-    'betton/assoc',
-    'betton/association',
-    'bettsworth',
-    'bettws-y-coed',
-    'betty-jean',
-    'bettyjones',
-    'betuix',
-    'betulia',
-    'betulin',
-    'betw',
-    'betwee',
-    'betweeded',
-    'betweeh',
     'between-airports-taxes-tips-and-porters-included-plan-a',
-    'between-area',
-    'between-chain',
-    'between-country',
-    'between-deck',
-    'between-generations',
-    'between-individual',
-    'between-kin',
-    'between-level',
-    'between-match',
-    'between-meals',
-    'between-points',
-    'between-programme',
-    'between-school',
-    'between-song',
-    'between-species',
     'between-taxon',
-    'between-the&rehy;wars',
-    'between-the-sheets',
-    'between-the-wars',
-    'between-track',
-    'between-two',
-    'between-venues',
-    'between-wars',
-    'between/in',
-    'between/p/',
-    'betweenm',
-    'betweenthe',
-    'betweentimes',
-    'betweenwhiles',
-    'betweenwroughton',
-    'betwqeen',
     'betws-yn-rhos',
-    'betzig',
-    'beufort',
-    'beugmot',
-    'beulah',
-    'beult',
-    'beumont',
-    'beurer',
-    'beurling',
-    'beurs',
-    'beurze',
-    'beuth',
-    'beuve-mery',
-    'beuy',
-    'bevan-style',
-    'bevan/parish',
     'bevanism',
-    'bevanlee',
-    'bevedere',
-    'bevel-edged',
-    'bevenden',
-    'beverely',
-    'bevergern',
-    'beveridge-style',
-    'beveridgian',
-    'beveridgites',
-    'beverlies',
-    'beverungen',
-    'bevies',
-    'bevin-citrine',
-    'bevna',
-    'bevrydingsbeweging',
     'bevs',
-    'bevven',
-    'bewails',
-    'bewcastledale',
-    'bewein',
-    'bewerley',
-    'bewes',
-    'bewick/joan',
-    'bewildered-puppy',
-    'bewilderedly.',
-    'bewinged',
-    'bewitcher',
-    'bewley/nfu',
-    'beworking',
-    'bewray',
-    'bewsher',
     'bexbuild',
-    'bexford',
-    'bexhill/',
-    'bexington',
-    'bexley-',
-    'beychevelle',
-    'beydun',
-    'beyind',
-    'beylerbeyi',
-    'beynam',
-    'beyoglu',
-    'beyond\'',
-    'beyond-the-physical',
-    'beyond/behind',
-    'beyondness',
-    'beyong',
     'beyrutus',
-    'beys',
-    'beyton',
-    'beyyene',
-    'bez-dance',
-    'bezannes',
-    'bezbozhnik',
-    'bezburzhuaznost\'',
-    'bezelle',
-    'bezelled',
-    'bezet',
-    'beziehung',
-    'bezirke',
-    'bezley',
-    'bezonasnosti',
-    'bezopasnosti',
     'bezopasnosti--kgb',
-    'bezopastnosti',
-    'bezruchka',
-    'bezrukovo',
-    'bezuidenhout',
-    'bezymianni',
-    'bezzi-scali',
-    'bf1,279,000',
-    'bf1,634,000',
-    'bf109g&ndash;2',
-    'bf110d',
-    'bf110e',
-    'bf110es',
-    'bf11o',
-    'bf2,000',
-    'bf21,800',
     'bf218',
-    'bf219',
-    'bf220',
-    'bf2b',
-    'bf30,000',
-    'bf34.0077',
-    'bf346,000',
-    'bf5',
-    'bf5&verbar&verbar;nf8&verbar&verbar;27',
-    'bf5,200',
-    'bf50,000',
-    'bf99,000',
-    'bfgoodrich',
-    'bfore',
-    'bfr1950',
-    'bfr3800/dfl.200',
     'bfr600m',
-    'bfr900',
-    'bfts',
-    'bg&mdash;base',
-    'bg38',
-    'bg4',
-    'bg4543/2221',
-    'bg5&verbar&verbar;c6&verbar&verbar',
-    'bg6',
-    'bga.',
-    'bgas',
-    'bget&num;n',
-    'bgj',
-    'bgk',
-    'bglenvrev',
-    'bgm',
     'bgp',
-    'bgt',
-    'bgw',
-    'bh12',
-    'bh14',
-    'bh2-mjlt',
-    'bh2-ncf',
-    'bh2-rfc',
-    'bh6',
-    'bh6+',
-    'bh8',
-    'bhabi',
-    'bhadase',
-    'bhadohi',
-    'bhadra',
-    'bhadur',
     'bhagalpur',
-    'bhagavad-g&imacr;t&amacr',
-    'bhagavad-gita',
-    'bhagey',
-    'bhagirathi.',
-    'bhagvad-gita',
-    'bhagya',
-    'bhai',
-    'bhaid',
-    'bhain',
-    'bhajee',
-    'bhajman',
-    'bhakthan',
-    'bhalendra',
-    'bhancair',
-    'bhanji',
     'bharadwaj',
-    'bharatanatyam',
-    'bhardwaj',
-    'bharita',
-    'bhartia',
-    'bhatacharya',
-    'bhatain',
-    'bhatia',
-    'bhatiasevi',
-    'bhatlekar',
-    'bhatta-mimamsaka',
-    'bhattacharyya',
-    'bhattlaw',
-    'bhavan',
-    'bhavnani',
-    'bhawoodien',
     'bhb',
-    'bheim',
-    'bheoil',
-    'bhera',
-    'bhf-bank',
-    'bhh',
-    'bhi',
-    'bhi-ri',
-    'bhibhutishan',
-    'bhiff',
-    'bhikhu',
-    'bhikkhu',
-    'bhiku',
-    'bhilwara',
-    'bhindranwale',
-    'bhingi',
     'bhiwani',
-    'bhkc',
-    'bhm',
-    'bhoma',
-    'bhoodan',
-    'bhootas',
-    'bhopal:victims',
-    'bhoreraig',
-    'bhowani',
-    'bhoy',
-    'bhreac',
-    'bhrogan',
-    'bhrolcain',
-    'bhrolch&aacute;in',
-    'bhsi',
-    'bhsii',
     'bhuban',
-    'bhuchaille',
-    'bhuchar',
-    'bhuchar/kiran',
-    'bhuddism',
-    'bhuddist',
-    'bhuide',
-    'bhuird',
-    'bhuiyan',
-    'bhumiadhat',
-    'bhupen',
-    'bhusan',
-    'bhutanis',
-    'bhuvan',
-    'bi&cacute;ani&cacute',
-    'bi&ecirc;n',
     'bi&rehy;directional',
-    'bi\'me',
-    'bi-amplification',
-    'bi-bii',
-    'bi-biralahi',
-    'bi-carbonate',
-    'bi-cmos',
-    'bi-communal',
-    'bi-cultural',
-    'bi-daily',
-    'bi-dialectalism',
-    'bi-federation',
-    'bi-fuel',
-    'bi-intercalation',
-    'bi-laterally',
-    'bi-level',
     'bi-media',
-    'bi-medical',
-    'bi-metal',
-    'bi-o-bin',
-    'bi-orthogonal',
-    'bi-orthogonality',
-    'bi-ped',
-    'bi-petals',
-    'bi-pod',
-    'bi-polarity',
-    'bi-products',
-    'bi-racial',
-    'bi-section',
-    'bi-sexy',
-    'bi-temporal',
-    'bi-tonality',
     'bi-valves',
-    'bi-word',
-    'bi-zonal',
-    'bi/multi',
-    'bi/triaxial',
-    'biac',
-    'biachu',
-    'biado',
-    'biagiotti',
-    'biagis',
-    'biakh',
-    'bial/brasilian',
-    'biala',
-    'biamba',
-    'biamby',
-    'biame',
     'biancardi',
-    'biancas',
-    'biancheri',
-    'bianchhi',
-    'bianchi/film',
-    'bianchi/stunt',
-    'bianchini',
-    'bianconese',
-    'biancos',
-    'biangular',
-    'biarmicus',
-    'biart',
-    'bias-cut',
-    'biasco',
-    'biasi',
-    'biasses',
     'biassono',
-    'biathlons',
-    'biatorella',
-    'bib-alls',
-    'bibata',
-    'bibbed',
-    'bibbing',
-    'bibbings/abingdon',
-    'bibbs',
-    'bibby/father',
-    'bibby/mother',
-    'bibdish',
-    'bibel',
-    'bibelot',
-    'biberach',
-    'biberegg',
     'bibiena',
-    'bible\'',
-    'bible-',
-    'bible-bashing',
-    'bible-believers',
-    'bible-belt',
-    'bible-bolstering',
-    'bible-bunk',
-    'bible-nest',
-    'bible-quoting',
-    'bible-reader',
-    'bible-reading',
-    'bible-spouting',
-    'bible-thumping',
-    'biblepuncher',
-    'biblethumper',
     'biblical&ndash;liturgical',
-    'biblical&rehy;babylonian',
-    'biblio.',
-    'biblioclast',
-    'bibliografico',
-    'bibliographic/reference',
-    'bibliographie',
-    'bibliographische',
-    'bibliolatry',
-    'biblion',
-    'bibliopegically',
-    'bibliopegy',
-    'bibliophily',
-    'bibliosophia',
-    'biblioth&eacute;caire',
-    'biblioth.',
     'bibliothecae',
-    'bibliothecal',
-    'bibliotherapy',
-    'biblique',
-    'biblische',
-    'bibulously',
-    'bibus',
-    'bic-sponsored',
-    'bic/titman',
-    'bica',
-    'bicalcaratus',
-    'bicameralism',
-    'bicarbonate-buffered',
-    'bicci',
-    'biccie',
-    'biccy',
     'bicec',
-    'bicentenaries',
-    'bicep-breast',
-    'bicep-bulging',
-    'bicephalous',
-    'bicester-based',
-    'bicestesr',
-    'bichai',
-    'bicharapost',
-    'biche',
-    'biches',
-    'bichitr',
-    'bichromicum',
-    'biciac',
-    'bicinia',
-    'bickell',
     'bickers-produced',
-    'bickerstaff/nupe',
-    'bickerstaff/tuc',
-    'bickerton-',
-    'bickerton/manager',
-    'bickleywood',
-    'bickmore',
-    'bicknall',
-    'bicknell/dire',
-    'bicks',
-    'bicksons',
-    'bico',
-    'bicoastal',
-    'biconcave',
-    'biconditional',
-    'bicondylar',
     'bicorne',
-    'bicuspid',
-    'bicycle-chain-type',
-    'bicycle-chains',
-    'bicycle-like',
-    'bicycle-mounted',
-    'bicycle-powered',
-    'bicycle-pump',
-    'bicycle-racers',
-    'bicycle-rickshaw',
-    'bicycle-riding',
-    'bicycle-seat',
-    'bicycle-shed',
-    'bicycle-type',
-    'bicycle-wheels',
-    'bicycles.',
     'bicycleship',
-    'bicyclette',
-    'bicyclistratum',
-    'bicycloids',
-    'bid-defeating',
-    'bid-list',
-    'bid-lists',
-    'bid-only',
-    'bid-rent',
-    'bid-rigging',
-    'bid.',
-    'bid/offer',
-    'bida',
-    'bidandi',
-    'bidarray',
-    'bidayuh',
     'biddability',
-    'biddenden',
-    'biddestone',
-    'biddics',
-    'biddies/dolls',
-    'biddiss',
-    'biddistone',
-    'biddlecomb',
-    'biddolph',
-    'biddulph/oxfordshire',
-    'bidein',
-    'bidens',
-    'bidentate',
-    'bideyat',
-    'bidford-on-avon',
-    'bidge',
     'bidi',
-    'bidialectalism',
-    'bidimensional',
-    'bidis',
-    'bidjar',
-    'bidjars',
-    'bidlake',
-    'bidlakes',
-    'bidle',
-    'bidlea',
-    'bidon',
-    'bidonville',
-    'bidri',
-    'bidst',
-    'bie.',
-    'bie/nafd/cfsma/bifd/liaison',
     'biebrza',
-    'biedanheafde',
-    'biederbecke',
-    'biedermayer',
-    'biegler',
-    'biel',
-    'biela',
-    'bielanski',
-    'bielawski',
-    'bieleckichairman',
-    'bieleman',
-    'bieleu',
-    'bielicki',
-    'bielorussia',
-    'bielorussians',
-    'bielsko-biala',
     'bien-pensant',
-    'bienal',
-    'bienek',
-    'bienes',
-    'bienfaisant',
-    'bieng',
-    'bienio',
-    'biennales',
-    'bienne',
-    'biennial-alumnus',
-    'bientz',
-    'bienvenidos',
-    'bierbaum',
-    'bierd',
-    'biergarten',
-    'bierges',
     'bieringa',
-    'bierodrome',
-    'bierschinkenwurst',
-    'bierstadt',
-    'bierton/aylesbury/buckinghamshire',
-    'bierut',
-    'bierwag',
-    'biesbosch',
-    'biest',
-    'bieuleu',
-    'bievre',
-    'bif',
-    'bifar',
-    'bifasciated',
-    'bife',
-    'biferno/campomarino',
     'bifertenstock',
-    'bifes',
-    'biff-wham-pow',
-    'biffed',
-    'biffin',
-    'biffy',
-    'bifidobacterium',
-    'bifidus',
-    'biflora',
-    'bifoore/and',
-    'bifore',
-    'biframe',
-    'bifrenatus',
-    'bifstek',
-    'biftek',
-    'bifulco',
     'bifunctional',
-    'bifurcate',
-    'bifurcating',
-    'big&rehy;mouthed',
-    'big&rehy;spending',
-    'big\'',
-    'big-alphabet',
-    'big-baby',
-    'big-balled',
-    'big-beaked',
-    'big-billed',
-    'big-block',
-    'big-bloody-hearted',
-    'big-boobed',
-    'big-boot',
-    'big-brand',
     'big-buck',
-    'big-bucks',
-    'big-bud',
-    'big-budge',
-    'big-built',
-    'big-buttoned',
-    'big-cheese',
-    'big-chested',
-    'big-cliffs',
-    'big-deal',
-    'big-dealer',
-    'big-displacement',
-    'big-dog',
-    'big-drum',
-    'big-eared',
-    'big-eaters',
     'big-end',
-    'big-eyes',
-    'big-fin-reef-squid',
-    'big-foot',
-    'big-footed',
-    'big-four',
-    'big-framed',
-    'big-gastrin',
-    'big-gig',
-    'big-gutted',
-    'big-haired',
-    'big-hall',
-    'big-headedness',
-    'big-heads',
-    'big-hitters',
-    'big-hoofed',
     'big-horsepower',
-    'big-league',
-    'big-manufacturer',
-    'big-muscled',
-    'big-navy',
-    'big-o',
-    'big-production',
-    'big-pupilled',
-    'big-ribbed',
-    'big-root',
-    'big-screened',
-    'big-shit',
-    'big-shots',
-    'big-shouldered',
-    'big-sisterly',
-    'big-snouted',
     'big-stage',
-    'big-step',
-    'big-studio',
-    'big-suited',
-    'big-tailed',
-    'big-thighed',
-    'big-titted',
-    'big-toe',
-    'big-top',
-    'big-town',
-    'big-two',
-    'big-uns',
-    'big-wheeled',
-    'big.john',
-    'biga',
-    'bigah',
     'bigamously',
-    'bigard',
-    'bigcheese',
-    'bigearian',
-    'bigerry',
-    'bigest',
-    'biggate',
-    'biggelaar',
-    'bigger-bore',
-    'bigger-breasted',
-    'bigger-dog',
-    'bigger-engined',
-    'bigger-is-better',
-    'bigger-mcdonald',
-    'bigger-spending',
-    'bigger-than-ever',
     'bigger-than-you',
-    'bigger-ticket',
-    'bigger-wig',
-    'bigger/sculptor',
-    'biggers',
-    'biggest-budget',
-    'biggest-earning',
-    'biggin-based',
-    'biggish-budget',
-    'biggles-type',
-    'biggs/shopkeeper',
-    'biggs/united',
-    'bigjob',
-    'biglan',
-    'biglen',
-    'biglifs',
     'bigman',
-    'bigmuff',
-    'bignardi',
-    'bigning',
-    'bignold',
-    'bignone',
-    'bignoniaceous',
-    'bignonioides',
-    'bigo',
-    'bigonioides',
-    'bigos',
-    'bigotted',
-    'bigrigg',
-    'bigsby-like',
-    'bigstrupp',
-    'bigyle',
     'bigynneth',
-    'bigynnynge',
-    'bih',
-    'bihand',
-    'biholdyng',
-    'bihynde',
-    'bii',
-    'biiab',
-    'biiba-fimbra',
-    'bijedic',
-    'bijenkor',
-    'biji',
-    'bijnor',
-    'bijouterie',
-    'bijser',
-    'bijul&imacr',
     'bijur',
-    'bijutsu',
-    'bika',
-    'bike-less',
-    'bike-park',
-    'bike-racing',
-    'bike-y',
-    'bikenibou',
-    'biker-drug-sex',
-    'biker-looking',
-    'bikernieki',
-    'bikini-like',
-    'bikini-pants',
-    'bikini-tops',
-    'bikkie',
-    'bikky',
     'biky',
-    'bil&rehy;dungsroman',
-    'bil-patata',
-    'bila',
-    'bilagare',
-    'bilalian',
-    'bilamellatum',
-    'bilancetta',
-    'bilary',
-    'bilaterally-negotiated',
-    'bilaterial',
-    'bilauri',
-    'bilba',
-    'bilbalaash',
-    'bilbany',
-    'bilbeads',
     'bilberry-picker',
-    'bilbo-type',
-    'bilboes',
-    'bilbohall',
-    'bilbrook',
-    'bilbrough',
-    'bilcliffe',
-    'bild-kunst',
-    'bildad',
-    'bilder',
-    'bildermann',
-    'bildes',
-    'bildhauer',
-    'bildungsb&uuml;rge1tum',
-    'bildungsromane',
-    'bildungsromans',
     'bildungsvereine',
-    'bildzeitung',
-    'bile-snorting',
-    'bileducts',
-    'bilek',
-    'bilet',
-    'bilfinger',
-    'bilge-induced',
-    'bilge-water',
-    'bilgewater',
-    'bilgrav-nielsen',
-    'bilh&egrave;res',
-    'biliary/',
-    'biliary/hepatic',
-    'bilic',
-    'bilichild',
     'bilici',
-    'biligraphy',
-    'bilin-binding',
-    'bilina',
-    'bilinelli',
-    'bilingham',
-    'bilington',
-    'bilingually',
-    'bilinguist',
-    'bilioenteric',
-    'biliruben',
-    'bilirubinate',
-    'biliti',
-    'bilities',
-    'bility',
-    'bilius',
     'bilivert',
-    'bilke',
-    'bilked',
-    'bilker',
-    'bilkey',
-    'bilko\'',
-    'bill&eacute',
-    'bill\'',
-    'bill-allowing',
-    'bill-boarded',
-    'bill-book',
-    'bill-cum-claim',
-    'bill-dipping',
-    'bill-of-material',
-    'bill-of-materials',
-    'bill-poster',
     'bill-posting',
-    'bill-related',
-    'bill-signing',
-    'bill-size',
-    'bill-stickers',
-    'bill-sticking',
-    'bill-thrust',
-    'bill-topping',
-    'bill-waterman',
-    'bill/billie',
-    'bill/resident',
-    'bill/save',
-    'bill/thames',
-    'bill732',
-    'billah',
-    'billard',
     'billarderie',
-    'billardon',
-    'billarum',
-    'billbacks',
-    'billcheck',
-    'bille',
-    'billecart',
-    'billennia-old',
-    'billennium',
-    'billers',
-    'billet-doux-ing',
-    'billet_doux',
-    'billetee',
-    'billetees',
-    'billett',
-    'billett/resident',
     'billhook-swinging',
-    'billi',
-    'billians',
-    'billiard-cue',
-    'billiard-tables',
-    'billing/northamptonshire',
-    'billingbear',
-    'billinger',
-    'billingsgate-based',
-    'billington-grieg',
-    'billington/tim',
-    'billingtons',
-    'billion+',
-    'billion-&dollar;19.9',
-    'billion-&dollar;5',
-    'billion-13',
     'billion-130',
-    'billion-15',
-    'billion-150',
-    'billion-20',
-    'billion-200',
-    'billion-25',
-    'billion-3',
-    'billion-30',
-    'billion-40',
-    'billion-45',
-    'billion-7',
-    'billion-95',
-    'billion-a-month',
-    'billion-ampere',
-    'billion-another',
-    'billion-beating',
     'billion-credit',
-    'billion-dollar-club',
-    'billion-letter',
-    'billion-lira',
-    'billion-lire',
-    'billion-pocket',
-    'billion-pound',
-    'billion-pound-a-year',
-    'billion-shilling',
-    'billion-strong',
-    'billion-year',
-    'billion.the',
-    'billionaire-populist',
-    'billionfold',
-    'billions\'-worth',
-    'billiter',
     'billiton-enthoven',
-    'billlimit',
-    'billour',
-    'billow.',
-    'billowings',
-    'billoydandrewalterysimoneil',
-    'bills-and-office-lunch',
-    'bills/monopoly',
-    'billsthorpe',
-    'billund',
-    'billwas',
-    'billy-button',
-    'billy-buttons',
-    'billy-cock',
-    'billy-giraffe',
-    'billy-goat',
     'billy-ho',
-    'billy-oh',
-    'billygoat',
-    'billyo',
-    'bilmermeer',
-    'bilney/theft',
-    'bilodeau',
-    'bilofix',
-    'bilogora',
-    'bilomas',
-    'bilong',
-    'bilonick',
-    'bilopha',
-    'bilou',
-    'biloxi',
-    'bilqis',
     'bilroth',
-    'bilsborough',
-    'bilsdean',
-    'bilsmoor',
-    'bilspedition',
-    'bilt',
-    'bilthoven',
-    'biltons',
-    'bily',
-    'bilzingsleben',
-    'bimaculata',
-    'bimaculatus',
-    'bimah',
-    'biman',
-    'bimbette',
-    'bimbettes',
     'bimbling',
-    'bimbo-next-door',
-    'bimbo-time',
-    'bimboesq',
-    'bimbometer',
-    'bimedia',
-    'bimetallism',
-    'bimie',
-    'biminerallic',
-    'bimm',
-    'bimodality',
-    'bin-card',
-    'bin-ends',
-    'bin-lids',
-    'bin-shaking',
-    'bin-skips',
     'binab',
-    'binaghi',
-    'binarism',
-    'binary-coded',
-    'binary-compatibility',
-    'binary-level',
-    'binaurally',
-    'binbags',
-    'binbay',
-    'binbin',
-    'binch/coroner',
-    'binchley',
-    'binchois',
-    'bind&rehy;ing',
-    'bind.',
-    'binded',
     'binder-twine',
-    'binding-cases',
-    'binding-related',
-    'binding-wise',
-    'binding/uptake',
-    'bindingly',
-    'bindown',
-    'bindra',
-    'bindu',
-    'bindweed.',
-    'bindweeds',
-    'bine-stems',
-    'binervis',
-    'binetheton',
-    'binfull',
-    'bing-bong-a',
     'bing.',
-    'bing/descendant/earl',
-    'bingabaeconomy',
-    'bingaman',
-    'bingchen',
-    'binge-and-fast',
-    'binge-and-vomit',
-    'binge-purge',
-    'binge-vomit',
-    'bingeing/starving/vomiting',
-    'bingeing/vomiting',
-    'bingemer',
-    'bingen-am-rhein',
-    'binger',
-    'bingey',
-    'bingham/investment',
     'bingham/photographer',
-    'binghams',
-    'binghamton',
-    'binghui',
-    'bingie',
-    'bingsteads',
-    'bingu',
-    'bingushions',
-    'bini',
-    'binic',
-    'binka',
-    'binliner',
-    'binliners',
-    'binna',
-    'binnema',
-    'binnenhoff',
     'binnenweg',
-    'binocular-aided',
-    'binocular-and-bobble-hats',
-    'binocular-owner',
-    'binocularly',
-    'binoculars-camera_out',
-    'binomially',
-    'binomials',
-    'binominals',
-    'binomination',
-    'binova',
-    'binproc',
-    'binproc.u',
-    'binscombe',
-    'binski',
-    'binstock',
     'binsturzende',
-    'binswood',
-    'binsztok',
-    'bintje',
-    'bintou',
-    'bintrey',
-    'bints',
-    'bintulu',
-    'bintworth',
-    'binuclearia',
-    'binul',
-    'binulu',
-    'binyang',
-    'bio-acoustic',
-    'bio-amendments',
-    'bio-analytical',
     'bio-brushes',
-    'bio-chemists',
-    'bio-collagen',
-    'bio-computing',
-    'bio-degradability',
-    'bio-ecological',
-    'bio-electro',
-    'bio-electronic',
-    'bio-electronics',
-    'bio-energetics',
-    'bio-engineer',
-    'bio-ethanol',
-    'bio-evolutionary',
-    'bio-feedback',
-    'bio-filters',
-    'bio-fuel',
     'bio-grammar',
-    'bio-harmony',
-    'bio-hazard',
-    'bio-hazards',
-    'bio-image',
-    'bio-implant',
-    'bio-implanted',
-    'bio-isolates',
-    'bio-location',
-    'bio-mass',
-    'bio-minutes',
-    'bio-nourishing',
-    'bio-physicist',
-    'bio-physics',
-    'bio-pic',
-    'bio-pics',
     'bio-proteinic',
-    'bio-psychological',
-    'bio-q',
-    'bio-reactor',
-    'bio-research',
-    'bio-resources',
-    'bio-rhythmic',
-    'bio-safety',
-    'bio-scanner',
-    'bio-science',
-    'bio-sea',
-    'bio-second',
-    'bio-suit',
-    'bio-systems',
-    'bio-technological',
-    'bio-technologies',
     'bio-tex',
-    'bio-unlimited',
-    'bio-vegetal',
-    'bio-week',
-    'bio-years',
-    'bio101',
-    'bioalarm',
-    'bioalert',
-    'bioanalyser',
-    'bioanalyst',
-    'bioassays',
-    'biobax',
-    'biobibliographical',
-    'biobibliography',
-    'biocarbonate',
-    'biocartridges',
     'biocatalysts',
-    'biocellatum',
-    'biochemic',
-    'biochemical-molecular',
-    'biochemistry/genetics',
-    'biocide',
-    'biocidic',
-    'biocombustion',
-    'biocompatibility.',
-    'biocomputing',
-    'biocular',
-    'bioculatus',
-    'biodegradability',
-    'biodegradeable',
-    'biodegrading',
-    'biodesign',
     'biodeterioration',
-    'biodisciplines',
-    'biodiversidad',
-    'biodrama',
-    'bioehringer',
-    'bioelement',
-    'bioenergetic',
-    'bioenergetical',
-    'bioengine',
-    'bioengineered',
-    'biofilta',
-    'biofiltering',
-    'biofiltration',
-    'biofixation',
-    'bioflavonoids',
-    'biofluorescent',
     'biofluorescents',
-    'biofoams',
-    'biofouling',
-    'biofuelled',
-    'biofunction',
-    'biog.',
-    'biogastrone',
-    'biogenesis',
-    'biogenetic',
-    'biogenetically',
-    'biogenical',
-    'biogentoypet',
-    'biogeochemistry',
-    'biogeographically',
-    'biogeologist',
-    'biograd-na-moru',
     'biograd.',
-    'biograf',
-    'biogrammar',
-    'biograms',
-    'biogranules',
-    'biographee',
-    'biographees',
-    'biographica',
-    'biographically-minded',
-    'biographies.',
-    'biography.',
-    'biography.34',
-    'biohazard',
-    'bioherm',
-    'biohermal',
-    'bioherms',
     'bioindustry',
-    'bioinformatics',
-    'bioinorganic',
-    'biokarst',
-    'biolayer/transducer',
-    'biolink',
-    'biolistic',
-    'biolistics',
-    'biolm',
-    'biolo',
-    'biolocation',
-    'biologi',
-    'biological/medical',
-    'biological/physical',
-    'biological/third',
-    'biologically-determined',
     'biologically-oriented',
-    'biologics',
-    'biologie',
-    'biologies',
-    'biologiques',
-    'biologist-naturalists',
-    'biologist/mathematician',
-    'biologistic',
-    'biologize',
-    'biologized',
-    'biologizing',
-    'biology.',
-    'biology/soil',
-    'biolyon',
-    'biomarkers',
-    'biomas',
     'biomatter',
-    'biome\'',
-    'biomedia',
-    'biomedica',
-    'biomedically',
-    'biomedicals',
-    'biomedics',
-    'biomek',
-    'biometrically',
-    'biometrika',
-    'biometry',
-    'biomining',
-    'biomolecular',
-    'biomorphisms',
-    'biomuse',
-    'biomusical',
     'biondello',
-    'biondolillo',
-    'bionetics',
-    'bionomic',
-    'bions',
-    'bionuclear',
-    'bioorganic',
-    'biop',
-    'biopesticide',
-    'biophasic',
-    'biophotolysis',
-    'bioplex',
-    'biopolar',
-    'bioprinting',
-    'bioprocess',
-    'biopses',
     'biopsy/',
-    'biopsychological',
-    'biopsying',
-    'biopty',
-    'biopy',
-    'bioral',
-    'bioreagent',
-    'biorecognition',
-    'bioredox',
-    'bioregionalism',
-    'bioremediation/bioreclamation',
-    'bioresmethrin',
-    'biorhythmic',
-    'biorklund',
-    'biorontes',
-    'biorrhiza',
     'biosafety',
-    'bioscientists',
-    'bioservos',
-    'biosignals-to-music',
-    'biosiliceous',
-    'bioskop',
-    'biosociety/ecotopia',
-    'biosoft',
-    'biospec',
-    'biospeleologists',
-    'biospheres',
-    'biospunge',
-    'biostatistics',
-    'biostrath',
-    'biosurface',
-    'biosyn',
     'biosynthesized',
-    'biosynthetically',
-    'biosystem',
-    'biotab',
-    'biotal',
-    'biotechnologicalise',
-    'biotecx',
-    'biotex',
-    'biotherapeutics',
-    'biotin-16-dupt',
-    'biotin-conjugated',
-    'biotin-coupled',
-    'biotin-labelled',
-    'biotin/anti-human-igg',
-    'biotinolyated',
-    'biotinylatd',
     'biotinylated-16-dutp',
-    'biotinylation',
-    'biotodoma',
-    'biotolerance',
-    'biotransduction',
-    'biotronics',
-    'biott',
-    'biotyping',
-    'bioules',
-    'biowar',
-    'biowizard',
-    'biox',
-    'biozentrum',
-    'biozonation',
-    'biozorb',
-    'biparietal',
     'bipectinate',
-    'bipedals',
-    'bipendicular',
-    'biphase',
-    'biphenals',
-    'biphonic',
-    'bipm',
-    'bipo',
-    'bipolarism',
-    'bipolars',
-    'bipp',
-    'bipped',
-    'bipunctata',
-    'bir-hakeim',
-    'bira-ramallah',
-    'biradari',
     'biramous',
-    'birch-branch',
-    'birch-hazel',
-    'birch-hazel-oak-alder',
-    'birch-lined',
-    'birch-studded',
-    'birch-wood',
-    'birch/buckingham',
-    'birch/greenpeace',
-    'birch/hiv',
-    'birch/stroud',
-    'birch/t',
-    'birchall(1989)',
-    'birchen',
-    'birchenhall',
-    'bircher',
     'birchers',
-    'birchir',
-    'birchley',
-    'birchmore',
-    'birchnell',
-    'birchy',
-    'bird&mdash;catch',
-    'bird\'s-foot',
-    'bird-box',
-    'bird-brightness',
-    'bird-call',
-    'bird-catcher',
-    'bird-catchers',
-    'bird-cherry',
-    'bird-claw',
-    'bird-drive',
     'bird-enticing',
-    'bird-eyes',
-    'bird-faced',
-    'bird-fancying',
-    'bird-fart',
-    'bird-feeder',
-    'bird-food',
-    'bird-house',
-    'bird-inflight',
-    'bird-killing',
-    'bird-language',
-    'bird-ledges',
-    'bird-lime',
-    'bird-lime-encrusted',
-    'bird-man',
-    'bird-of',
     'bird-of-prey',
-    'bird-prints',
-    'bird-proof',
-    'bird-pulling',
-    'bird-rich',
-    'bird-scaring',
-    'bird-screech',
-    'bird-shit',
-    'bird-shooting',
-    'bird-spotters',
-    'bird-spotting',
-    'bird-strike',
-    'bird-tending',
-    'bird-twitter',
-    'bird-walks',
-    'bird-whistle',
     'bird-winged',
-    'bird.richard',
-    'bird/aid',
-    'bird/charity',
-    'bird/importer',
-    'bird/rescue',
-    'bird/that',
-    'bird_as',
-    'birdbrain',
-    'birdcall',
-    'birdcombe',
-    'birded',
-    'birders',
-    'birdfeeder',
-    'birdfoods',
-    'birdge',
     'birdhides',
-    'birdhouses',
-    'birdhurst',
-    'birdie-birdie',
-    'birdie-eagle',
-    'birdie-ing',
-    'birdline',
-    'birdlip/gloucestershire',
-    'birds\'-nest-soup',
-    'birds-',
-    'birds-earth-brim',
-    'birds-parrots',
-    'birds-wiv-their-jugs-aht',
-    'birdsburg',
-    'birdscape',
-    'birdscarers',
     'birdselves',
-    'birdsong-studded',
-    'birdsongs',
-    'birdspotting',
-    'birdstrike',
-    'birdstrikes',
-    'birdtrap',
-    'birdville',
-    'birdwatching/nature',
-    'birefringence.',
-    'birgham',
-    'birgidale',
-    'birgir',
-    'birhan',
-    'birhindwa',
-    'birik',
     'birinius',
-    'birir',
-    'birjand',
-    'birjinni',
-    'birkby',
-    'birken',
-    'birkenead',
-    'birkenhead-born',
-    'birkenhead-had',
-    'birkenheads',
-    'birker',
-    'birket-smith',
-    'birketts',
-    'birkhauser.',
-    'birkhouse',
-    'birkinhead',
     'birkinshaw',
-    'birklands',
-    'birkley',
-    'birkmyre',
-    'birl',
-    'birlas',
-    'birleson',
-    'birm',
-    'birman',
-    'birmbaum',
-    'birmday',
-    'birmi',
-    'birmid',
-    'birmigham',
-    'birmin',
-    'birmingham&ndash;warrington',
     'birmingham-',
-    'birmingham-bred',
-    'birmingham-built',
-    'birmingham-coventry',
-    'birmingham-glasgow',
-    'birmingham-kidderminster',
-    'birmingham-london',
-    'birmingham-lyon',
-    'birmingham-manchester',
-    'birmingham-pwllheli',
-    'birmingham-rug',
-    'birmingham-rugby-northampton',
-    'birmingham-scotland',
-    'birmingham-stourbridge-kidderminster-worcester',
-    'birnbeck',
-    'birnbrauer',
     'birnin',
-    'birnin-kebbi',
-    'birnstiel',
-    'biro-smeared',
-    'birodom',
-    'birrell-produced',
-    'birren',
-    'birrova',
-    'birs',
-    'birsch',
-    'birsel',
-    'birt-smith/landlady',
-    'birt/ottaker',
-    'birtchnell',
-    'birte',
-    'birth&rehy;strangled',
     'birth&rehy;weights',
-    'birth\'',
-    'birth\'-rate',
-    'birth-canal',
-    'birth-cave',
-    'birth-certificate',
-    'birth-cord',
-    'birth-dead',
-    'birth-marks',
-    'birth-month',
-    'birth-mother',
-    'birth-mucus',
-    'birth-pain',
-    'birth-places',
-    'birth-right',
-    'birth-sin',
     'birth-soils',
-    'birth-yolk',
-    'birth/sex',
-    'birthcharts',
-    'birthcord',
-    'birthday-gift',
-    'birthday-suit',
-    'birthday-to',
-    'birthday-type',
-    'birthday:an',
-    'birthdays:the',
-    'birthf',
-    'birthpangs',
-    'birthquake',
-    'birthright.',
-    'birthrooms',
     'births.4',
-    'birthstones',
-    'birtian',
-    'birtists',
-    'birtles/gloucester',
-    'birtwhistles',
-    'birut&eacute',
-    'birute',
-    'biryukov.in',
-    'birzebbugia',
-    'bis&rehy;choffin',
-    'bis(2-aminoethyl)ether',
-    'bis(dithiadiazole)',
-    'bis(macrocycles)',
-    'bisaccates',
-    'bisacodyl',
     'bisacuta',
-    'bisagno',
-    'bisakha',
-    'bisaltai',
-    'bisazir',
-    'bisbo',
-    'bisceral',
-    'bisch',
-    'bischoffsheim',
-    'bischofswiesen',
-    'biscocodyl',
-    'biscottes',
-    'biscuit&rehy;coloured',
-    'biscuit-',
-    'biscuit-bowl',
-    'biscuit-brown',
     'biscuit-fired',
-    'biscuit-makers',
-    'biscuit-making',
-    'biscuit-rich',
-    'biscuit-tins',
-    'biscutella',
-    'biscyclohexanoneoxalyl-dihydrazone',
-    'bisectors',
-    'biseness',
-    'bisgrove',
-    'bisguanide',
-    'bishampton',
-    'bishari',
-    'bishma',
-    'bishnu',
-    'bishop&rehy;that',
     'bishop-monks',
-    'bishop-patriarch',
-    'bishop-rics',
-    'bishop-stone',
-    'bishop/bus',
-    'bishop/caver',
-    'bishop/insurers',
-    'bishop/neighbour',
-    'bishop/stroud',
-    'bishop/worker',
-    'bishoping',
-    'bishopp',
-    'bishops\'intrusion',
-    'bishops-elect',
-    'bishops-lydeard',
-    'bishopsbourne',
     'bishopsfield',
-    'bishopshalt',
-    'bishopsteignton',
-    'bishopstoke',
-    'bishopswearmouth',
-    'bishp',
-    'bishwanath',
-    'bisi-pedro',
-    'bisiacchi',
-    'bisignani',
-    'bisily',
-    'bisinus',
-    'bisis',
-    'bisit',
-    'bisket',
-    'bismarckalle',
     'bismil',
-    'bismol',
-    'bismuth-citrate-carbomer',
-    'bismuthate',
-    'bisney',
-    'bisone',
-    'bisonte',
-    'bispangle',
-    'bisphenol',
-    'bisphosphonates',
-    'bisquit',
-    'biss',
-    'biss-nics',
-    'biss-slip',
-    'bissainthe',
-    'bissets',
     'bissinger',
-    'bissle',
-    'bisso',
-    'bissonette',
-    'bistable-based',
-    'bister',
-    'bisto-to-mr-kipling-cakes',
-    'bistol',
-    'bistolfi',
-    'bistra',
-    'bistrita',
-    'bisulphite',
-    'bisum',
-    'biswaf',
-    'bisyllabic',
-    'bisync',
     'bisynesse',
-    'bit&mdash',
-    'bit-blitter',
-    'bit-colour',
-    'bit-critical',
-    'bit-graphics',
-    'bit-images',
-    'bit-maps',
-    'bit-now',
-    'bit-of-a-poll-tax',
-    'bit-packing',
-    'bit-playerish',
-    'bit-slices',
-    'bit-width',
-    'bit.if',
-    'bitamin',
     'bitas',
-    'bitch\'',
-    'bitch-boy',
-    'bitch-faced',
-    'bitch-goddesses',
-    'bitchdog',
-    'bitchiest',
-    'bitchily',
-    'bitching.',
-    'bitchings',
-    'bitchkill',
-    'bitchu',
-    'bitcom',
-    'bite-back',
-    'bite-detector',
-    'bite-shaped',
     'biteable',
-    'biteback',
-    'bitel',
-    'biter-bit',
-    'bites/toilet',
-    'bitewell',
-    'bitey-bluesy',
-    'bith-eolas',
-    'bithell',
-    'bithesis',
-    'bitholders',
-    'bithynia',
-    'bitlisi',
-    'bitmapped\'',
-    'bitmore',
-    'bitner',
     'bitok',
-    'bitokene',
-    'bitolia',
-    'bitomark',
-    'biton',
-    'bitot',
-    'bitows',
-    'bitpad',
-    'bitran',
-    'bits-and-bobs',
-    'bits-of-old-inner-tube',
-    'bits-versus-chunks',
-    'bits/pixel',
-    'bits/sec',
-    'bitsa',
-    'bitsteam',
     'bitta',
-    'bittaleni',
-    'bitter-eyed',
-    'bitter-flavoured',
-    'bitter-lemon',
-    'bitter-looking',
-    'bitter-orange',
-    'bitter-slurping',
-    'bitter-sweetly',
-    'bitter-sweetness',
-    'bitter-swilling',
-    'bitter-vetch',
-    'bitter-white',
-    'bitter.it',
-    'bittered',
-    'bitterer',
     'bittering',
-    'bitterley',
-    'bitterly-disputed',
-    'bitterly-fought',
-    'bitterly-upset',
-    'bitterman',
-    'bittern-bird',
-    'bittern-stance',
-    'bitternesses',
-    'bitterworld',
-    'bitti',
-    'bittie',
-    'bittier',
-    'bitties',
-    'bittily',
-    'bitting',
     'bittman',
-    'bittre',
-    'bitts',
-    'bituis',
-    'bituleanu/toma',
-    'bitumen-backed',
-    'bitumen-coated',
-    'bitumen-water',
-    'bitumenised',
-    'bitumens',
-    'bity',
-    'bitz',
-    'bitzer',
-    'biud',
-    'biui',
-    'biut',
     'biventricular',
-    'bivi',
-    'bivvi',
-    'bivvy-bags',
-    'bixle',
-    'bixler',
-    'bixschoote',
-    'biz\'ness\'-minded',
-    'biz-speak',
-    'biz-zalza',
-    'bizantina',
-    'bizantino',
-    'bizarre-looking',
-    'bizarre-rather',
-    'bizarrities',
-    'bizen',
     'bizjak',
-    'bizjet',
-    'bizniss',
-    'biznizz',
-    'bizonia',
-    'bizouard',
-    'bizquick',
-    'bizzarres',
-    'bizzarri',
-    'bizzi',
-    'bizzie',
-    'bizzin\'',
-    'bizzo',
-    'bizzy',
-    'bizzy-type',
-    'bj&oslash;rlykke',
     'bj&oslash;rn',
-    'bj&ouml;rck',
-    'bj&ouml;rgvinsson',
-    'bj&ouml;rnsson',
-    'bj-130e',
-    'bj10e',
-    'bj330',
-    'bja',
-    'bjallas',
-    'bjarne',
-    'bjartveit',
-    'bjc',
-    'bjelica',
-    'bjelke',
-    'bjelovar',
-    'bjerke',
     'bjerkness',
-    'bjernede',
-    'bjoerling',
-    'bjoern',
-    'bjontegard',
-    'bjor',
-    'bjorbye',
-    'bjorck',
-    'bjorling',
-    'bjornebye-halle',
-    'bjorneveien',
-    'bjornstrand',
-    'bjorntorp',
-    'bjp-led',
-    'bjp-national',
-    'bjsw',
     'bk.',
-    'bk33',
-    'bk387',
-    'bkb',
-    'bkc',
-    'bkerke',
-    'bkgoodrich',
-    'bkm',
-    'bkpm',
-    'bksts',
-    'bkv',
-    'bl&aring;b&aelig;rsuppe',
-    'bl&aring;hvidt',
-    'bl&aring;mannen',
-    'bl&aring;mannsisen',
-    'bl&eacute;mont',
     'bl&eacute;mont-la-fontaine',
-    'bl&eacute;riots',
-    'bl&ouml;ndal',
-    'bl&uuml;te',
-    'bl&uuml;thner',
-    'bl-lac',
-    'bl.',
-    'bl/pso/3504/92',
-    'bl1',
-    'bl21(de3)',
-    'bl21/de3(plyss)',
-    'bla&zcaron;e',
-    'blaaa',
-    'blaand',
-    'blaat',
-    'blabbenoids',
     'blabbering',
-    'blabberings',
-    'blabbermouth',
-    'blabbermouths',
-    'blachrie',
-    'black&amp',
-    'black&amp;white',
-    'black&ndash;out',
-    'black&rehy;coated',
-    'black&rehy;letter',
-    'black&rehy;painted',
-    'black&rehy;shirts',
-    'black\'n\'blue',
-    'black\'ning',
-    'black(bird)board',
-    'black-african',
     'black-and-brown',
-    'black-and-gold',
-    'black-and-red',
-    'black-and-silver',
-    'black-and-whiteness',
-    'black-art',
-    'black-back.',
-    'black-ball',
-    'black-balled',
-    'black-based',
-    'black-bashing',
-    'black-beetles',
-    'black-bereted',
-    'black-bibbed',
-    'black-bible',
-    'black-billed',
     'black-bird',
-    'black-birder',
-    'black-biro',
-    'black-blood',
-    'black-blooded',
-    'black-blotched',
-    'black-blue',
-    'black-booted',
-    'black-bound',
-    'black-branched',
-    'black-breasted',
-    'black-bullet',
-    'black-burn',
-    'black-buttock',
-    'black-button',
-    'black-can',
     'black-carapaced',
-    'black-chadored',
-    'black-chested',
-    'black-chromed',
-    'black-clawed',
-    'black-coffee-and-orange-juice',
-    'black-coloured',
-    'black-comic',
-    'black-currant',
-    'black-dark',
-    'black-directed',
-    'black-dominated',
-    'black-doored',
-    'black-draped',
-    'black-dressed',
-    'black-dyed',
     'black-economy',
-    'black-eyebrowed',
-    'black-face',
-    'black-fanged',
-    'black-feminist',
-    'black-figured',
-    'black-filled',
-    'black-finished',
-    'black-fletched',
-    'black-flies',
-    'black-friar-wynd',
-    'black-friars',
-    'black-frilled',
-    'black-fronted',
-    'black-fungus',
-    'black-glassed',
     'black-glistening',
-    'black-grey',
-    'black-grey-white',
-    'black-hat',
-    'black-hatted',
-    'black-head',
-    'black-heads',
-    'black-hilted',
-    'black-humour',
-    'black-influenced',
-    'black-jack',
-    'black-lace-becapped',
-    'black-land',
-    'black-lashed',
-    'black-leaved',
-    'black-lensed',
     'black-light',
-    'black-lined',
-    'black-listed',
-    'black-lists',
-    'black-mail\'',
-    'black-mailing',
-    'black-mantillaed',
-    'black-mascara-daubed',
-    'black-misted',
-    'black-moth',
-    'black-mouthed',
-    'black-mucosae',
-    'black-muzzled',
-    'black-naped',
-    'black-nyloned',
-    'black-on-green',
     'black-on-red',
-    'black-or-white',
-    'black-outs',
-    'black-peppered',
-    'black-pigmented',
-    'black-plumed',
-    'black-powder',
-    'black-printed',
-    'black-quiffed',
-    'black-rights',
-    'black-rim',
-    'black-sailed',
-    'black-satin',
-    'black-sea',
-    'black-sheep',
-    'black-sheet',
     'black-shelled',
-    'black-shouldered',
-    'black-shrouded',
-    'black-skirted',
-    'black-slash',
-    'black-souled',
-    'black-sounding',
-    'black-spired',
-    'black-stoled',
-    'black-stormy',
-    'black-straw',
-    'black-striped',
-    'black-studies',
-    'black-suede',
-    'black-tarred',
-    'black-tie-dressed',
     'black-tied',
-    'black-toothed',
-    'black-top',
-    'black-topped',
-    'black-un',
-    'black-varnished',
-    'black-vested',
-    'black-water',
-    'black-women-artists',
-    'black-yellow',
-    'black/blue',
-    'black/bottle',
-    'black/british',
-    'black/brown',
-    'black/egged',
-    'black/ethnic',
     'black/gay',
-    'black/gold',
-    'black/grey',
-    'black/jetstream',
-    'black/lazer',
-    'black/nalgo',
-    'black/navy',
-    'black/norton',
-    'black/poor',
-    'black/rapeman',
-    'black/red/blue/green',
-    'black/tan',
-    'black/wiltshire',
-    'black/yellow',
-    'blacka',
-    'blackaddie',
     'blackamoors',
-    'blackawton',
-    'blackback',
-    'blackbacked',
-    'blackballing',
-    'blackband',
-    'blackbeaded',
-    'blackbeetle',
-    'blackbelly',
-    'blackberry-coloured',
-    'blackberry-picking',
-    'blackberry-wild',
-    'blackbird-blue',
-    'blackboard-jungle',
-    'blackboard-like',
-    'blackboard/chalkboard',
     'blackboard/whiteboard',
-    'blackboardand',
-    'blackborough',
-    'blackburn-built',
-    'blackburn1',
-    'blackburnian',
-    'blackbury-based',
-    'blackclad',
-    'blackcoated',
-    'blackcocks',
-    'blackcomb',
-    'blackcraig',
-    'blackcurrant-red',
-    'blacke-smith',
-    'blacked&rehy;out',
-    'blackedge',
     'blackenstein',
-    'blacker-haired',
-    'blackers',
-    'blackett-ord',
-    'blacketts',
-    'blackeye',
-    'blackface-\'n-white-gloved',
-    'blackfeet',
-    'blackfelter',
-    'blackfish',
-    'blackfishing',
-    'blackford/hospital',
-    'blackforest',
-    'blackfoss',
-    'blackgame',
-    'blackgang',
     'blackgauntlet',
-    'blackguarding',
-    'blackguardly',
-    'blackhands',
-    'blackhatches',
-    'blackheart',
-    'blackhill',
-    'blackholes',
-    'blackhouse',
-    'blackhowe',
-    'blackith',
-    'blackjack-cards',
-    'blacklake',
-    'blacklegging',
-    'blacklers',
-    'blackletter',
     'blackleys',
-    'blackliners',
-    'blackmail.',
-    'blackmail/puts',
-    'blackmailable',
-    'blackmailer-in-chief',
-    'blackmailing/gay',
-    'blackmanminister',
-    'blackmar',
-    'blackmark',
-    'blackmarked',
-    'blackmore/horse',
-    'blackneed',
-    'blackout.',
-    'blackpitts',
-    'blackpoint',
     'blackpol',
-    'blackpole',
-    'blackpool-belfast',
-    'blackpool/bury',
-    'blackpudding',
-    'blacks/jews/irish',
-    'blackshawled',
-    'blackshirted',
-    'blackshots',
-    'blacksploitation',
-    'blackspot-infected',
-    'blackstar',
-    'blackstoun',
-    'blacksyde',
-    'blackthorn/bicester/oxfordshire',
-    'blacktoft',
     'blackula',
-    'blackwail',
-    'blackwand',
-    'blackwardine',
-    'blackwards',
-    'blackwatertown',
-    'blackwell/blackwell',
-    'blackwelliarum',
-    'blackwoodian',
-    'blackymor',
-    'blaconsthorpe',
-    'bladder-bursting',
-    'bladder-emptying',
-    'bladdery',
-    'blade-broad',
-    'blade-changing',
     'blade-guard',
-    'blade-interchange',
-    'blade-length',
-    'blade-locking',
-    'bladerunners',
-    'blades/climbing',
-    'bladet',
-    'bladud.',
-    'blaeberry',
-    'blaen',
-    'blaen-cwmiar',
-    'blaencwm',
-    'blaenllyfni',
-    'blaenymaes',
-    'blaeu',
-    'blaffer',
     'blaga',
-    'blagajek',
-    'blagbrough',
-    'blager',
-    'blaggard',
-    'blaggdon',
-    'blagger',
-    'blagget',
-    'blaggets',
-    'blagiyach',
-    'blagoev',
-    'blagov',
-    'blagroves',
-    'blague',
-    'blaguet',
-    'blah-blah-blah',
     'blah-de-blah-de-blah',
-    'blaha',
-    'blaich',
-    'blaim',
-    'blainead',
-    'blair.',
-    'blair/northampton',
-    'blair/shadow',
-    'blair/transvaal',
-    'blairdardie',
-    'blairdennan',
-    'blairgowie',
-    'blairhill-dundyvan',
-    'blairlodge',
-    'blairmore',
-    'blairshill',
     'blaisconsumer',
-    'blaisdon/gloucestershire',
-    'blaisers',
-    'blaisois',
-    'blake&lsqb;1900&rsqb;lq.b.426',
-    'blake\'s-arrest',
-    'blake-dax',
-    'blake-knox',
-    'blake/cheltenham',
-    'blake/garden',
-    'blake/stadium',
-    'blakea',
-    'blakeian',
-    'blakelock.',
-    'blakelocks',
-    'blakely/chief',
     'blaker-heseltine',
-    'blakerigg',
-    'blakesewn',
-    'blaketon',
-    'blakewell',
-    'blakey/chief',
-    'blakley',
-    'blame-shedding',
-    'blame-shifting',
-    'blame-they',
-    'blame-worthiness',
-    'blame.',
-    'blameable',
-    'blamed.',
-    'blameful',
-    'blamer',
     'blameth',
-    'blamin\'',
-    'blammer',
-    'blamming',
-    'blan',
-    'blan&iacute;k',
-    'blanc-maudit-tacul',
-    'blanc-rouge',
-    'blanc.',
-    'blanc/chef',
-    'blanc/restaurateur',
-    'blance',
-    'blanch-making',
-    'blanch-white',
-    'blanchard/estate',
-    'blanchard/fuel',
     'blanchard/pensioner',
-    'blanchdown',
-    'blanche-neige',
-    'blanche-taque',
-    'blanchefort',
-    'blanchis&rehy;serie',
-    'blanchot/factory',
-    'blancks',
-    'blancpain',
-    'blanden/shearing',
-    'blandfordia',
-    'blandfords',
-    'blandina',
-    'blandine',
-    'blanding',
-    'blandish',
     'blandishment',
-    'blandman',
-    'blando',
-    'blandois',
-    'blandon',
-    'blanesburgh',
-    'blanford',
-    'blaniflower',
-    'blank-cheque',
-    'blank-looking',
-    'blank-panelled',
-    'blank-walled',
-    'blanka',
-    'blanket&rehy;there',
-    'blanket-bog',
-    'blanket-brewing',
     'blanket-coat',
-    'blanket-covered',
-    'blanket-edge',
-    'blanket-forger',
-    'blanket-holder',
-    'blanket-protest',
-    'blanket-roll',
-    'blanketbog',
-    'blankety-blank',
-    'blankies',
-    'blanking-off',
-    'blanking-portion',
-    'blankouts',
-    'blanshard/accident',
-    'blanton',
-    'blantyre-based',
     'blanzy-les-',
-    'blar',
-    'blarey',
-    'blaricum',
-    'blaringly',
-    'blarings',
-    'blarmhor',
-    'blarneywood',
-    'blasdale',
-    'blase+',
-    'blasket',
-    'blason',
-    'blasphemin\'',
-    'blass-ee',
-    'blass.',
-    'blassii',
     'blast\'-em-up',
-    'blast-\'em-to-bits',
-    'blast-bays',
-    'blast-dried',
-    'blast-em-up',
-    'blast-in',
-    'blast-retaining',
-    'blast-wall',
-    'blast-wind',
-    'blast.',
-    'blastbuster',
-    'blasted-out',
-    'blaster-compatible',
-    'blastfurnaces',
-    'blastic',
-    'blastic-augmented',
     'blastic-laced',
-    'blastign',
-    'blastin',
-    'blastin\'',
-    'blastingly',
-    'blastings',
-    'blastmaster',
-    'blastocephalon',
-    'blastoderm',
-    'blastoidea',
-    'blastophaga',
-    'blastpipe',
-    'blatchley',
-    'blatherer',
-    'blatherings',
-    'blatherwicke',
     'blaton',
-    'blatta',
-    'blattel',
-    'blattering',
-    'blattidae',
-    'blattids',
-    'blausten',
-    'blavet',
-    'blavey',
-    'blawith',
-    'blax-ploitation',
-    'blaxpoitation',
-    'blayais',
-    'blaydon-on-tyne',
-    'blaylock',
-    'blaze-faced',
     'blazer-thing',
-    'blazheni',
-    'blazing-hot',
-    'blazo',
-    'blazonry',
-    'blazwick',
-    'blazy',
-    'blcc',
-    'bldg',
-    'bleabeck',
-    'bleach-blonde',
-    'bleach-damaged',
-    'bleache',
-    'bleached-blonde',
-    'bleached-blue',
-    'bleached-bone',
     'bleached-haired',
-    'bleached-khaki',
-    'bleached-looking',
-    'bleaching-powder',
-    'bleadoption',
-    'bleagh',
-    'bleahu',
-    'bleak-looking',
-    'bleakely',
-    'bleaney',
-    'blear-eied',
-    'bleasby',
-    'bleasdale/scotrail',
-    'bleasham',
-    'bleaval',
-    'bleaves.sty',
     'bleazley',
-    'blebs',
-    'bleby',
-    'blecher',
-    'bleddick',
-    'bleding',
-    'bledington',
-    'bledrws',
-    'bledyyn',
-    'bleeaggh',
-    'bleech',
-    'bleecker',
-    'bleed\'n',
-    'bleed\'n\'',
-    'bleed-air',
-    'bleeding-away',
     'bleeding-heart',
-    'bleeding-hearts',
-    'bleeding-stump',
-    'bleeding_in',
-    'bleep-alert',
-    'bleep-in',
-    'bleerk',
-    'bleet',
-    'bleeuch',
-    'blegvad',
-    'bleiben',
-    'bleiberg',
-    'bleibet',
-    'bleibt',
-    'bleichr&ouml;der',
-    'bleichroeders',
     'bleicker',
-    'bleistiftgebiet',
-    'blem',
-    'blemish-prone',
-    'blencowes',
-    'blende/calamine',
-    'blendedwith',
-    'blenderman',
-    'blending-in',
-    'blendinger',
-    'blendis',
-    'blends/bl/',
-    'blenkharn',
-    'blenkinsop/director',
-    'blenkinsopp',
-    'blenkner',
     'blenning',
-    'blenyth',
-    'bleriot-type',
-    'bleriots',
-    'blerte',
-    'bles',
-    'bless-her',
-    'bless-oo',
-    'blessing.',
-    'bletchedon',
-    'bletcher',
-    'bletchingdon/oxfordshire',
-    'bletchley-built',
-    'blethed',
-    'bletherin\'',
-    'blethyn',
     'blets',
-    'bletted',
-    'bleuel',
-    'bleuette',
-    'bleut&eacute;e',
-    'blew-up',
-    'blewbery',
-    'blewbury/oxfordshire',
-    'blewell',
-    'blewish',
-    'blewits',
-    'blf',
-    'blgc',
-    'bliaut',
-    'blick/course',
-    'blicken',
     'blicking',
-    'blidn',
-    'bliecq',
-    'blier',
-    'bliersbach',
-    'bligh-',
-    'bligh/swindon',
-    'blight/chief',
-    'blimp\'',
-    'blimp-style',
-    'blimpishly',
-    'blimpo',
-    'blin-stoyle',
-    'blinch',
-    'blincow',
-    'blind-bake',
     'blind-booked',
-    'blind-cord',
-    'blind-filmed',
-    'blind-flying',
-    'blind-lipped',
-    'blind-review',
-    'blind-sided',
-    'blind-spot',
-    'blind-spots',
-    'blind-stamped',
-    'blind-worm',
-    'blind/see',
-    'blindburn',
-    'blinde',
-    'blindfish',
-    'blindings',
     'blindish',
-    'blindnes',
-    'blindspots',
-    'blindworm',
-    'blink-and-you\'ll-miss-him',
-    'blink-and-you\'ll-miss-it',
-    'blink-of-the-eye',
-    'blinkenberg',
-    'blinkered\'',
-    'blinkering',
-    'blinkhorn',
-    'blinkmanship',
-    'blipper',
-    'blippy',
-    'blipverts',
-    'blisful',
     'blisham',
-    'bliss-guest',
-    'bliss-noise',
-    'bliss.',
-    'blisse',
-    'blisses',
-    'blissid',
-    'blissless',
-    'blistene',
-    'blister-like',
-    'blisteringly-fast',
-    'blisthorpe',
-    'blisting',
-    'blists',
-    'blith',
-    'blithe-heart',
     'blithedale',
-    'blitheman&ndash',
-    'blitheness',
-    'blitheringly',
-    'blitherings',
-    'blithesome',
-    'blithfield',
-    'blitt',
-    'blitz\'',
-    'blitz-torn',
-    'blitzed.',
-    'blitzkrieg-bop-pop',
-    'bliz',
-    'blizhee',
-    'blizzard.the',
-    'blizzarded',
     'blk',
-    'bllandudno',
-    'blld',
-    'bllleeeaarrrgggrrllleeeooouurrgghh',
-    'bloatedly',
-    'bloatedness',
-    'blob-and-trickle',
-    'blob-like',
-    'blob-shaped',
-    'blob-spotting',
-    'blobbing',
-    'blobettes',
-    'blobigurina',
-    'blobules',
-    'bloc-building',
-    'bloc-free',
     'bloc-like',
-    'blocage',
-    'bloccato',
-    'block&rehy;buster',
-    'block-bookings',
-    'block-busters',
-    'block-buying',
-    'block-chords',
-    'block-cut',
-    'block-end',
-    'block-faulted',
-    'block-houses',
-    'block-line',
-    'block-maker',
-    'block-making',
-    'block-mounted',
     'block-off',
-    'block-out',
-    'block-shifting',
-    'block-size',
-    'block-sorting',
-    'block-structured',
-    'block-the',
-    'block-these',
-    'block-to-block',
-    'block-vote',
-    'block-voter',
-    'block-wide',
-    'block/armagh',
-    'block/bouldering',
-    'block/burgess',
-    'block/burgess/burns/parsons',
     'block/chief',
-    'blockbusters/a',
-    'blockbustersand',
-    'blockcnt1()',
-    'blocked-off',
-    'blocker-out',
-    'blockfields',
-    'blockheadedly',
-    'blockier',
-    'blockin\'',
-    'blocking\'',
-    'blocking-up',
-    'blocking.',
-    'blocking/difficulty',
-    'blocklike',
-    'blockmakers',
     'blockmaking',
-    'blockmarker',
-    'blockmen',
-    'blockneck',
-    'blockprinted',
-    'blocks-southeast',
-    'blocks/copes',
-    'blocks/heads',
-    'blockship',
-    'blockwell',
-    'blocul',
-    'bloddy',
-    'blode',
-    'blodeuglwm',
-    'blodged',
-    'blodges',
     'blodgett',
-    'blodwell',
-    'blody',
-    'bloedite',
-    'bloemendal',
-    'bloemfontain',
-    'bloet',
-    'bloggert',
-    'bloggins',
-    'bloggsville',
-    'bloke-in-the-pub',
-    'bloke-ishness',
-    'bloke-ism',
-    'bloke.',
-    'blokey',
-    'blokhin',
     'blokzijl',
-    'blomet',
-    'blomfeld',
-    'blomfield/properties',
-    'blon',
-    'blond&rehy;haired',
-    'blond-headed',
-    'blond-mopped',
-    'blond-tinselled',
-    'blond.',
-    'blond/rolls',
-    'blondchen',
-    'blonde-framed',
-    'blonde-rinsed',
-    'blondeau',
-    'blondeel',
     'blondeell',
-    'blondell',
-    'blondies',
-    'blondin\'',
-    'blondwood',
-    'blonsky',
-    'blood&mdash;containing',
-    'blood&rehy;curdling',
-    'blood&rehy;streaked',
-    'blood&rehy;sucking',
-    'blood-and-buggery',
-    'blood-and-guts',
-    'blood-ball',
-    'blood-based',
-    'blood-bead',
-    'blood-beads',
     'blood-bespattered',
-    'blood-brotherhood',
-    'blood-cell',
-    'blood-cells',
-    'blood-cholesterol',
-    'blood-contacting',
-    'blood-dangle',
-    'blood-death',
-    'blood-debt',
-    'blood-derived',
-    'blood-drained',
-    'blood-drops',
-    'blood-factor',
-    'blood-fat',
-    'blood-feeders',
-    'blood-flecked',
     'blood-flicker',
-    'blood-flower',
-    'blood-food',
-    'blood-frenzied',
-    'blood-gas',
-    'blood-gorged',
-    'blood-greased',
-    'blood-guiltiness',
-    'blood-gushing',
-    'blood-heat',
-    'blood-house',
-    'blood-hued',
-    'blood-is-thicker-than-water',
-    'blood-kin',
-    'blood-lead',
-    'blood-lettings',
     'blood-mad',
-    'blood-maddened',
-    'blood-mystical',
-    'blood-product',
-    'blood-products',
-    'blood-protein',
-    'blood-pump',
-    'blood-purifier',
-    'blood-raw',
-    'blood-reddened',
-    'blood-relation',
-    'blood-relationship',
-    'blood-relationships',
-    'blood-revenge',
-    'blood-rich',
-    'blood-right',
     'blood-sachets',
-    'blood-sacrifices',
-    'blood-sample',
-    'blood-serum',
-    'blood-shapes',
-    'blood-shed',
-    'blood-slicked',
-    'blood-slippery',
-    'blood-smell',
-    'blood-snow',
-    'blood-sodden',
-    'blood-sopped',
-    'blood-sparing',
-    'blood-spiced',
-    'blood-splatter',
-    'blood-spongy',
     'blood-stain',
-    'blood-staunching',
-    'blood-stiffened',
-    'blood-stirring',
-    'blood-suckling',
-    'blood-tatters',
-    'blood-testing',
-    'blood-thinning',
-    'blood-ties',
-    'blood-tinged',
-    'blood-to-blood',
-    'blood-tub',
-    'blood-twig',
-    'blood-type',
-    'blood-wallow',
-    'blood-warm',
     'blood-wedding',
-    'blood-weight',
-    'blood.it',
-    'blood/',
-    'blood/is',
-    'blood/medium',
-    'blood/mosquito',
-    'blood/nutrient/waste-disposal',
-    'bloodbank',
-    'bloodbeads',
-    'bloodbottler',
-    'bloodcurdlingly',
-    'bloode',
-    'bloodedly',
-    'bloodee',
-    'bloodfang',
     'bloodfeast',
-    'bloodfin',
-    'bloodfins',
-    'bloodgood',
-    'bloodie',
-    'bloodlet',
-    'bloodlines.it',
-    'bloodling',
-    'bloodlusting',
-    'bloodnok',
-    'bloodpoisoning',
-    'bloodrush',
-    'bloodspattered',
-    'bloodsportswoman',
-    'bloodstage',
-    'bloodstones',
     'bloodstunning',
-    'bloodsucker',
-    'bloodsuckled',
-    'bloodthirstily',
-    'bloodtide',
-    'bloodworth',
-    'bloodworth-thomason',
-    'bloody-gether',
-    'bloody-icing',
-    'bloody-looking',
-    'bloody-mindedly',
-    'bloody-well',
-    'bloodyhell',
-    'bloodys',
-    'bloomaires',
-    'bloomer-curtained',
     'bloomer/burglary',
-    'bloomeries',
-    'bloomfield/headteacher',
-    'bloomin',
-    'bloomingdale-spending',
-    'bloomkolk',
-    'bloomm',
-    'blooms.',
-    'bloomsburgians',
-    'bloomsburial',
-    'bloomsbury-style',
-    'bloomsday',
-    'bloomy',
-    'blooomsbury',
-    'bloooop',
-    'bloop',
     'bloopers',
-    'bloops',
-    'bloopy',
-    'blootered',
-    'bloow',
-    'blops',
-    'bloque',
-    'bloquista',
-    'blorenge',
-    'bloring',
-    'blork',
-    'bloss',
-    'blosser',
-    'blossevilla',
-    'blossius',
-    'blossom\'',
     'blossom-burdened',
-    'blossom-end-rot',
-    'blossom-fall',
-    'blossom-scented',
-    'blossom-tree',
-    'blossom.',
-    'blossomtime',
-    'blostein',
-    'blotchiness',
-    'blotchy-faced',
-    'blotering',
-    'blotter-owning',
-    'blotting-out',
-    'blotting-pad',
-    'bloud',
-    'blouin',
     'blouse-cloth',
-    'blouse-ripping',
-    'blouse-tunic',
-    'blouse-type',
-    'blouseless',
-    'blousey',
-    'blousing',
-    'blousons',
-    'blousy',
-    'bloverks',
-    'blow-bladder',
-    'blow-dries',
-    'blow-drying/',
-    'blow-heater',
-    'blow-holes',
-    'blow-jobs',
     'blow-lamp',
-    'blow-lamps',
-    'blow-off',
-    'blow-pipe',
-    'blow-pipes',
-    'blow-stone',
-    'blow-torched',
-    'blow-torches',
-    'blow-torching',
-    'blow-wave',
-    'blow-waved',
-    'blow-waves',
-    'blow.',
-    'blow.she',
-    'blowdart',
-    'blowdries',
     'blowdry',
-    'blowen',
-    'blower-',
-    'blower-cooled',
-    'blower-no',
-    'blower-vacs',
-    'blower.',
-    'blowervac',
-    'blowfeather',
-    'blowhards',
-    'blowholes',
-    'blowhorn',
-    'blowhouses',
-    'blown-air',
-    'blown-rose',
-    'blowouts',
     'bloxen',
-    'bloxworth',
-    'bloyd',
-    'blpes',
-    'blr&amp;d',
-    'blts',
-    'blu&rehy;tack',
-    'blu&uuml;cher',
-    'blu-',
-    'blubing',
-    'blucher',
-    'bluchner',
-    'blucose',
-    'bluddeh',
-    'bludden',
-    'bluddy',
     'bludman',
-    'bludsheadinge',
-    'bludy',
-    'blue&rehy;black',
-    'blue&rehy;collar',
-    'blue&rehy;prints',
-    'blue\'n\'yellow',
-    'blue-and-brown',
-    'blue-and-cream',
-    'blue-and-gold',
-    'blue-and-green',
-    'blue-and-grey',
-    'blue-and-red',
-    'blue-aproned',
-    'blue-asbestos',
-    'blue-back',
     'blue-bag',
-    'blue-barred',
-    'blue-bellied',
-    'blue-beret',
-    'blue-black-green',
-    'blue-blacks',
-    'blue-bloodedness',
-    'blue-bloods',
-    'blue-blushed',
-    'blue-bottle',
-    'blue-bottles',
-    'blue-bound',
-    'blue-brown',
-    'blue-bruised',
-    'blue-capped',
-    'blue-carpeted',
     'blue-check',
-    'blue-chequer',
-    'blue-china',
-    'blue-chips',
-    'blue-clawed',
-    'blue-concreted',
-    'blue-covered',
-    'blue-dark',
-    'blue-dashed',
-    'blue-distanced',
-    'blue-ey',
-    'blue-face',
-    'blue-film',
-    'blue-filtered',
-    'blue-fin',
-    'blue-fingered',
     'blue-flecked',
-    'blue-footed',
-    'blue-framed',
-    'blue-fronted',
-    'blue-glazed',
-    'blue-gold',
-    'blue-grass',
-    'blue-greys',
-    'blue-haired',
-    'blue-headed',
-    'blue-helmet',
-    'blue-horizon',
-    'blue-iced',
-    'blue-ing',
-    'blue-jack',
-    'blue-jacketed',
     'blue-jean',
-    'blue-jeans',
-    'blue-knit',
-    'blue-lensed',
-    'blue-lit',
-    'blue-mascara',
-    'blue-massing',
-    'blue-mauve',
-    'blue-mottled',
-    'blue-movie',
-    'blue-ness',
-    'blue-nose',
-    'blue-nosed',
-    'blue-on-white',
-    'blue-only',
-    'blue-pencilled',
     'blue-period',
-    'blue-periodic',
-    'blue-pigeon',
-    'blue-pink',
-    'blue-prints',
-    'blue-purple',
-    'blue-red-chrome',
-    'blue-reddish',
-    'blue-resin-impregnated',
-    'blue-ribbed',
-    'blue-ribboned',
-    'blue-ribboners',
-    'blue-rim',
-    'blue-rimmed',
-    'blue-ring',
-    'blue-rinse',
     'blue-roan-and-white',
-    'blue-rock',
-    'blue-rumped',
-    'blue-satin-coated',
-    'blue-shadowed',
-    'blue-shuttered',
-    'blue-skirted',
-    'blue-smocked',
-    'blue-socked',
-    'blue-soda',
-    'blue-sparked',
-    'blue-stockings',
-    'blue-stone',
-    'blue-streaked',
-    'blue-sweet',
-    'blue-tack',
     'blue-tak',
-    'blue-tattooed',
-    'blue-throated',
-    'blue-tits',
-    'blue-to',
-    'blue-toned',
-    'blue-tongued',
-    'blue-velvet',
-    'blue-walled',
-    'blue-washed',
-    'blue-white-yellow',
-    'blue-wing',
-    'blue-worm',
-    'blue-wrapped',
-    'blue/black/',
-    'blue/blue',
     'blue/distance',
-    'blue/ecru',
-    'blue/everybody',
-    'blue/gold',
-    'blue/orange',
-    'blue/red',
-    'blue/tan',
-    'blue/turquoise/yellow',
-    'blue/violet',
-    'blue/white/',
-    'blue/white/red/grey',
-    'blueand-grey',
-    'bluebags',
-    'bluebeard.',
-    'bluebellies',
-    'blueberry-grey',
     'blueblooded',
-    'bluebonnets',
-    'bluecaps',
-    'bluechip',
-    'bluechipenterprise',
-    'bluecollar',
-    'bluefields',
-    'bluefish',
-    'blueflies',
-    'bluefly',
-    'bluegill',
-    'bluegrass/rock',
-    'blueish-grey',
-    'blueish-white',
-    'bluejean',
-    'bluejeans',
     'bluelane',
-    'bluemaq',
-    'blueprint-drawing',
-    'blueprinted',
-    'bluerings',
-    'bluery',
-    'blues-band-gone-wrong',
-    'blues-biased',
-    'blues-clash-u2-alternative',
-    'blues-core',
-    'blues-lovers',
-    'blues-orientated',
-    'blues-player',
-    'blues-rock',
-    'blues-spooked',
-    'blues-style',
     'blues-tinged',
-    'blues/come',
-    'blues/country/tin',
-    'blues/eddie',
-    'blues/soul',
-    'bluesberry',
-    'blueschists',
-    'bluescribe',
-    'bluescript.',
-    'blueser',
-    'blueshift',
-    'blueshirts',
-    'bluesmeisters',
-    'bluesology',
-    'bluespower',
-    'bluesy-crunch',
     'bluesywoozy',
-    'bluetack',
-    'bluethroat',
-    'bluey-black',
-    'bluey-greens',
-    'bluey-grey',
-    'blueyer',
-    'bluffin\'',
-    'bluffly',
-    'blugga',
-    'bluggy',
-    'bluhm',
-    'bluhm/gutsche',
-    'bluidy',
-    'bluing',
-    'bluish-black',
     'bluish-brown',
-    'bluish-misty',
-    'bluish-purple',
-    'bluish-yellow',
-    'blukold',
-    'blumenbach',
-    'blumenbachii',
-    'blumenthal/troop',
-    'blumenthals',
-    'blumier',
-    'blumine',
-    'blumka',
-    'blumleins',
-    'blumlisalp',
-    'blumson',
-    'blundellian',
     'blundells',
-    'blunden/teenage',
-    'blunder-buss',
-    'blunder.the',
-    'blunderbusses',
-    'blundering.down',
-    'blunderstone',
-    'blunderum',
-    'blundevilles',
-    'blundles',
-    'blundred/managing',
-    'blundun',
-    'blunged',
-    'blunger',
-    'blunham',
-    'blunkett/lab',
     'blunt-cornered',
-    'blunt-cutting',
-    'blunt-faced',
-    'blunt-featured',
-    'blunt-fingered',
-    'blunt-looking',
-    'blunt-speaking',
-    'blunt-tipped',
-    'bluntisham',
-    'blup',
-    'blur.',
-    'blurb.',
-    'blurbed',
-    'blurbing',
-    'blurps',
-    'blurr',
     'blurred-vision',
-    'blurredly',
-    'blurriest',
-    'blurton-jones',
-    'blush-brink',
-    'blush-making',
-    'blush-pink',
-    'blush-pinkened',
-    'blush-veined',
-    'blush-white',
-    'blushi',
-    'blushin\'',
-    'blushlessly',
-    'blushy',
-    'blusterings',
-    'bluston',
     'blutchochzeit',
-    'bluteau',
-    'bluth',
-    'blutsrecht',
-    'bluured',
-    'blw',
-    'blwch',
-    'blx',
-    'blx-80',
-    'blyddyn',
-    'blyde',
-    'blyed',
-    'blyford',
-    'blynde',
-    'blyne',
-    'blyth/challenge',
     'blyth/ocean',
-    'blythe-huntingdon',
-    'blythe/aeu',
-    'blythe/fry',
-    'blythin',
-    'blythman',
-    'blyton-style',
-    'blytonisms',
-    'bm-600',
-    'bm-tests',
-    'bm.4',
-    'bm/2.3.89',
-    'bm8',
-    'bma-bupa',
-    'bma/air',
-    'bmac',
     'bmbh',
-    'bmc-4',
-    'bmc-british',
-    'bmcc',
-    'bmcnp',
-    'bmd',
-    'bmdp3v',
-    'bmg/eurodisc',
-    'bmg/rac',
-    'bmi/thriller',
-    'bmi:wt/h',
-    'bmn',
-    'bmnfrsmxzwy',
-    'bmnlf',
-    'bmp-2-treated',
-    'bmp-2.',
     'bmrs',
-    'bms/mothercare',
-    'bms2',
-    'bmw-3-series',
-    'bmw-like',
-    'bmw-mclaren',
-    'bmw/jaguar/lexus',
-    'bmw/r-r',
-    'bn&rehy;2a',
-    'bn-affiliated',
-    'bn/sncf',
-    'bn15',
-    'bn16',
-    'bn17',
-    'bn2',
-    'bn21',
     'bn230',
-    'bn27',
-    'bn9',
-    'bna/pbf',
-    'bnaf',
-    'bnaid',
-    'bnc/10base-t',
-    'bncs',
-    'bneen',
-    'bnfl-backed',
-    'bnfl.',
-    'bnits',
-    'bnj',
-    'bnklfmnsgbeopagvsbhkfmnxbvsjh',
-    'bnl-rafidain',
-    'bnp-style',
     'bnp140',
-    'bnsa',
-    'bo&egrave;ce',
-    'bo&gt;singapore',
-    'bo&ouml;tes',
-    'bo&rcaron;ivoj',
-    'bo&scaron;kovi&cacute',
-    'bo&zcaron;o',
-    'bo&zdot;e',
-    'bo\'suns',
-    'bo*****ing',
-    'bo-',
-    'bo-lei',
-    'bo-linn',
-    'bo-o-o-oo-oo-oring',
-    'bo.',
     'bo.214',
-    'bo/covenant',
-    'boa(1)',
-    'boa-constrictor',
-    'boab',
-    'boaco',
-    'boading',
-    'boadu',
-    'boady',
-    'boag-thomson',
-    'boait/county',
-    'boait/gloucestershire',
-    'boaks',
-    'boaler',
-    'boam',
-    'boam-stewart/commission',
     'boanas',
-    'boanerges',
-    'boar\'s-tooth',
-    'boar-driven',
-    'boar-mate',
-    'board&mdash;looking',
-    'board&ndash;mounted',
-    'board\'',
-    'board(s)',
-    'board-and-label',
-    'board-and-lodging',
-    'board-changing',
-    'board-dominated',
-    'board-general',
-    'board-like',
-    'board-list',
     'board-makers',
-    'board-meeting',
-    'board-mounted',
-    'board-school',
-    'board-set',
-    'board-stiff',
-    'board-swap',
-    'board-swapout',
-    'board-walk',
-    'board-with',
-    'board.e',
-    'board/',
-    'board/chalk',
-    'board/eastern',
-    'board/f&amp;s',
-    'board/for',
     'board/home',
-    'board/magnet',
-    'board/panel',
-    'board/partners',
-    'boarded-off',
-    'boarded-over',
-    'boarden',
-    'boarder-collie',
-    'boarding&rehy;house',
-    'boarding-card',
-    'boarding-school&mdash;only',
-    'boardinghouse',
-    'boardings',
-    'boardlike',
-    'boardmaker',
-    'boardman/oxford',
     'boardman/witness',
-    'boardmill',
-    'boards/list',
-    'boards/listservers',
-    'boardsailors',
-    'boardshorts',
-    'boardslides',
-    'boardwalk_away',
-    'boardwalkers',
-    'boardwork',
-    'boardy',
-    'boarhound',
-    'boarhunt',
-    'boarman',
-    'boars/even',
-    'boasson',
     'boast.',
-    'boasters',
-    'boastin\'',
-    'boat-',
-    'boat-car',
-    'boat-cars',
-    'boat-cleat',
-    'boat-companion',
-    'boat-cutting-out',
-    'boat-deck',
-    'boat-handling',
-    'boat-hooks',
-    'boat-houses',
-    'boat-necked',
-    'boat-races',
-    'boat-related',
     'boat-shacks',
-    'boat-trip',
-    'boat-trips',
-    'boat.as',
-    'boat.he',
-    'boat/coach',
-    'boat/in',
-    'boatcrews',
-    'boatdeck',
-    'boatered',
-    'boates',
-    'boathandling',
-    'boatin\'',
-    'boating-lake',
-    'boatless',
-    'boatlift',
     'boatmaking',
-    'boatowner',
-    'boatowners',
-    'boatshaped',
-    'boatshows',
-    'boatswain-second',
-    'boattie',
-    'boatwoman',
-    'boatworthy',
-    'boatyear',
-    'bob&rehy;sleighs',
-    'bob\'s-worth',
-    'bob-a-job',
-    'bob-length',
-    'bob-ness',
-    'bob-tail',
     'bob-white',
-    'bob-wig',
-    'bob-wigs',
-    'bob/bobbie',
-    'bobadilla',
-    'bobadillo',
-    'bobak',
-    'bobath',
-    'bobbies:wirral',
-    'bobbin-maker',
-    'bobbingly',
-    'bobbings',
-    'bobble-hat',
-    'bobblehat',
-    'bobblesbon-bon',
-    'bobbliness',
     'bobbs',
-    'bobby-beaters',
-    'bobby-beating',
-    'bobby-soxers',
-    'bobbysoxer',
-    'bobcats',
-    'bobekreo',
-    'bobert',
-    'bobgans',
-    'bobi',
-    'bobling',
-    'boblingen',
-    'bobness',
-    'bobo-diolassu',
-    'bobol\'or',
-    'bobolink',
     'bobonaro',
-    'boboni',
-    'bobreshov/kalesnik',
-    'bobrinskoy',
-    'bobsledders',
-    'bobsleighing',
-    'bobsmill',
-    'bobsy',
-    'bobtail.',
-    'bobtails',
-    'bobzao',
-    'bobzien',
-    'boc-special',
-    'bocals',
-    'bocardo',
-    'bocart',
     'bocas',
-    'bocay',
-    'bocay&aacute',
-    'bocba',
-    'boccaccvo',
-    'boccacio',
-    'boccadifalco',
-    'boccalon',
-    'boccalone',
-    'boccalons',
-    'bocce',
-    'boccerini',
-    'bocconia',
-    'bochanski',
-    'bochco',
-    'bochur',
     'bocian',
-    'bocillus',
-    'bockelie',
-    'bockman/adelaide',
-    'bocknang',
-    'bockos',
-    'bockris',
-    'bockside',
-    'bockstrasse',
-    'bockwurst',
-    'bocm-silcock',
-    'bocodon',
-    'bocodonism',
-    'boconnoc',
-    'bocoum',
-    'bocton',
     'bocuse',
-    'bod&eacute;n',
-    'bodachs',
-    'bodanis',
-    'bodart',
-    'bodatii',
-    'boday',
-    'boddaertcentres',
-    'boddenwelsh',
-    'boddien',
-    'boddington/poa',
-    'bode-medau',
-    'bodek',
-    'bodel',
-    'bodele',
-    'boden/cystic',
     'boden/gloucestershire',
-    'boden/head',
-    'boden/nursing',
-    'bodenrecht',
-    'bodewig',
-    'bodffordd',
-    'bodge-up',
-    'bodged-up',
-    'bodgery',
-    'bodgy',
-    'bodh-gaya',
-    'bodham',
-    'bodhgaya',
-    'bodhi',
-    'bodhisattvas',
-    'bodhr&aacute;n',
     'bodhr&aacute;ns',
-    'bodhrans',
-    'bodhvriksha',
-    'bodianskii',
-    'bodiced',
-    'bodicote/oxfordshire',
-    'bodies&mdash;a',
-    'bodies&mdash;congress',
-    'bodies/',
-    'bodies/parents',
-    'bodilessness',
-    'bodimeade',
-    'bodin/swindon',
-    'boding',
-    'bodini',
-    'bodinick',
     'bodinnick',
-    'bodins',
-    'bodipala',
-    'bodle',
-    'bodlean',
-    'bodlondeb',
-    'bodlovic',
-    'bodnar',
-    'bodnath',
-    'bodoland',
-    'bodpod',
-    'bodrato',
-    'bodrhyddan',
-    'bodrum*',
-    'bodrum/bitez',
-    'bodry',
     'bodum',
-    'bodville',
-    'body&rehy;snatchers',
-    'body\'s.',
-    'body-and-head',
-    'body-and-mind-sets',
-    'body-and-psyche',
-    'body-art',
-    'body-as-it-is-for-me',
-    'body-awareness',
-    'body-bank',
-    'body-bargaining',
-    'body-beings',
-    'body-blows',
-    'body-braces',
-    'body-buddies',
     'body-build',
-    'body-centre',
-    'body-check',
-    'body-chemical',
-    'body-clock',
-    'body-concealing',
-    'body-confidence',
-    'body-conscious',
-    'body-contours',
-    'body-counts',
-    'body-crushed',
-    'body-eating',
-    'body-flattering',
-    'body-fluid',
-    'body-form',
-    'body-glove',
     'body-guard',
-    'body-guards',
-    'body-hair',
-    'body-harness',
-    'body-in-lake',
-    'body-in-the-jag',
-    'body-in-the-midst-of-the-world',
-    'body-juices',
-    'body-kit',
-    'body-lead',
-    'body-levels',
-    'body-lotion',
-    'body-mark',
-    'body-mind',
-    'body-movement',
-    'body-packing',
     'body-plan',
-    'body-pleasure',
-    'body-politic',
-    'body-pop',
-    'body-rebelling',
-    'body-relaxing',
-    'body-rub',
-    'body-scanners',
-    'body-scent',
-    'body-sculpture',
-    'body-search',
-    'body-searched',
-    'body-searches',
-    'body-shopping',
-    'body-smashing',
-    'body-smell',
     'body-space',
-    'body-spirit',
-    'body-starved',
-    'body-stretching',
-    'body-structure',
-    'body-surf',
-    'body-surfed',
-    'body-swaps',
-    'body-swing',
-    'body-the',
-    'body-thrust',
-    'body-thrusts',
-    'body-was',
-    'body-washing',
-    'body/arms',
-    'body/encoded',
     'body/headstock',
-    'body/hurts',
-    'body/legs',
-    'bodyboarder',
-    'bodycentreline',
-    'bodycheck',
-    'bodycolour',
-    'bodycount',
-    'bodygruve',
-    'bodyguarding',
-    'bodyhair',
-    'bodyhammer',
-    'bodying',
-    'bodying-forth',
-    'bodymaker',
-    'bodymakers',
     'bodypck',
-    'bodyplans',
-    'bodypopping',
-    'bodyrelated',
-    'bodyrites',
-    'bodyscanner',
-    'bodyservant',
-    'bodyshapers',
-    'bodyshops',
-    'bodyskin',
-    'bodystyles',
-    'bodysuits',
-    'bodysurfing',
-    'bodytone',
-    'bodywarmers',
-    'bodywarming',
     'boeckhorst',
-    'boedecker',
-    'boehmer',
-    'boehmer-christiansen',
-    'boehmischbroda',
-    'boekhandels',
-    'boelcsfoeldy',
-    'boemia',
-    'boemmelburg',
-    'boemond',
-    'boeno',
-    'boepple',
-    'boer-estaat',
-    'boer-ing',
-    'boere',
-    'boeren',
     'boerevolk',
-    'boericke',
-    'boeringer',
-    'boerner',
-    'boes',
-    'boeschen',
-    'boesman',
-    'boeti',
-    'boetie',
-    'boeton',
-    'boettger',
-    'boetto',
-    'boetzel',
-    'boewl',
-    'boezing',
-    'bof',
     'bofers',
-    'boff',
-    'boffa',
-    'boffed',
-    'boffes',
-    'boffin\'',
-    'boffin-house',
-    'boffing',
-    'bofors-related',
-    'bofors.',
-    'bofty',
-    'bog-cotton',
-    'bog-down',
-    'bog-garden',
-    'bog-holes',
-    'bog-land',
     'bog-like',
-    'bog-mouse',
-    'bog-myrtle',
-    'bog-off',
-    'bog-ridden',
-    'bog-rush',
-    'bog-snorkelling',
-    'bog-trotters',
-    'bog-wood',
-    'bog/ruffian',
-    'bogacki',
-    'bogaerde',
-    'bogakovsky',
-    'bogaloosa',
-    'boganclogh',
-    'boganclough',
     'boganni',
-    'bogard',
-    'bogartishly',
-    'bogarts',
-    'bogaski',
-    'bogazi',
-    'bogbean',
-    'bogbrush',
-    'bogdal',
-    'bogdaner',
-    'bogdankevich',
-    'bogdanovites',
-    'bogdanovka',
-    'bogdanovskaya-gienef',
-    'bogden',
-    'bogeared',
     'bogense',
-    'boges',
-    'bogey-free',
-    'bogey-horse',
-    'bogey-men',
-    'bogeywoman',
-    'bogg/ex-apprentice',
-    'boggas',
-    'bogged-down',
-    'bogger-flinging',
-    'boggeragh',
-    'boggerburger',
-    'boggerthwaite',
-    'boggiano',
-    'boggie',
-    'boggins',
     'boggiora',
-    'boggis',
-    'boggle-bos',
-    'boggly',
-    'boggo',
-    'boghazk&ouml;y',
-    'boghead',
-    'bogheap',
-    'boghill',
-    'boghole',
-    'boghte',
-    'boghten',
-    'bogic',
-    'bogicevic',
-    'bogie-man',
-    'bogie-mounted',
     'bogisic',
-    'bogler',
-    'bogliasco',
-    'boglins',
-    'bogmen',
-    'bogner',
-    'bognoriensis',
-    'bogod',
-    'bogomila',
-    'bogong',
-    'bogorodsk',
-    'boguinard',
-    'bogus-italian',
-    'boguslav',
-    'boguslawski',
-    'bogusly',
     'bogwarts',
-    'bogwatching',
-    'bogwhistle',
-    'bogye',
-    'bogyman',
-    'bogymen',
-    'boh&eacute;mienne',
-    'bohaine',
-    'bohana',
-    'bohannen',
-    'bohemer',
-    'bohemian-flavoured',
-    'bohemienne',
-    'bohemond',
-    'bohemus',
-    'bohergloss',
     'bohi',
-    'bohinens',
-    'bohinjka',
-    'bohlin',
-    'bohling',
-    'bohm-duchen',
-    'bohm-ermolli',
-    'bohme',
-    'bohnen',
-    'bohor',
-    'bohos',
-    'bohras',
-    'boias-fr&iacute;as',
-    'boidin',
-    'boids',
-    'boieldieu',
     'boii',
-    'boiing',
-    'boiko',
-    'boil-covered',
-    'boil-in-the',
-    'boil-infested',
-    'boil-necked',
-    'boil-pitted',
-    'boil-washed',
-    'boil.',
-    'boild',
-    'boiled-eye',
-    'boiled-up',
-    'boileds',
-    'boiler-check',
-    'boiler-house',
     'boiler-maker',
-    'boiler-making',
-    'boiler-rooms',
-    'boiler-stoker',
-    'boilerplating',
-    'boilersuit',
-    'boilie-belly',
-    'boilie-type',
-    'boiling-hot',
-    'boima',
-    'bointia',
-    'boinville',
-    'boiota',
-    'boiotarch',
-    'boiotian-type',
-    'boire',
     'bois&eacute;e',
-    'bois-les-pargny',
-    'boisdale',
-    'boisdeffre',
-    'boiselle',
-    'boish&eacute;visme',
-    'boisjoly',
-    'boismassif',
-    'boismond',
-    'boisot',
-    'boisseson',
-    'boissonade',
-    'boissons',
-    'boissy',
-    'boistel',
-    'boistrous',
     'boites',
-    'boito',
-    'boitumelo',
-    'bojan',
-    'bojas',
-    'bojemoi',
-    'bojnice',
-    'bojolly',
-    'bojtar',
-    'bojutsu',
-    'bok-bok',
-    'boka',
-    'bokam',
-    'bokara',
-    'bokaro',
-    'bokelers',
     'bokert',
-    'bokhariots',
-    'bokhary',
-    'bokinfold',
-    'bokini',
-    'bokm&ouml;l',
-    'bokor',
-    'bokov',
-    'bokpyin',
-    'bokreta',
-    'bokskogens',
-    'bokulo',
-    'bokum',
-    'bokun',
-    'bokwete',
-    'bokyngham',
     'bol&iacute;var--cgsb',
-    'bol&iacute;vares',
-    'bolab',
-    'bolaji',
-    'bolang',
-    'bolbeck',
-    'bolbitiaceae',
-    'bolca',
-    'bolchevisme',
-    'bolchini',
-    'bold-face',
-    'bold-faced',
-    'bold-type',
-    'boldboy',
-    'bolded',
-    'boldere',
     'bolderson/phoenix',
-    'bolderwood',
-    'boldfaced',
-    'boldfacing',
-    'boldheart',
-    'bolding',
-    'boldly-brushed',
-    'boldly-conceived',
-    'boldly-marked',
-    'boldly-patterned',
-    'boldmere',
-    'boldrini',
-    'boldron',
-    'bolemia',
-    'boleros',
-    'boleskine',
     'boleslavs',
-    'bolet&iacute;n',
-    'boletaceae',
-    'bolete',
-    'bolevill',
-    'bolex',
-    'bolham',
-    'bolian',
-    'bolic',
-    'bolier',
-    'bolikhamsai',
-    'bolinder',
-    'bolinders',
-    'bolinus',
-    'bolivari&aacute;n',
-    'bolivarist',
     'bolivia.when',
-    'bolivogui',
-    'bolkonsky',
-    'boll&egrave;ne',
-    'bolla',
-    'bollan',
-    'bollard-making',
-    'bollard-type',
-    'bollarded',
-    'bollers',
-    'bollettino',
-    'bollex',
-    'bolli',
-    'bollier',
-    'bollihope',
-    'bollingbroke',
     'bollingen',
-    'bollings',
-    'bollini',
-    'bollit',
-    'bollito',
-    'bollix',
-    'bollobas',
-    'bollock\'',
-    'bollock-less',
-    'bollock-tingling',
-    'bollockings',
-    'bollockless',
-    'bollocks.',
-    'bollocks_at',
-    'bollworms',
-    'bollyeld',
     'bolobacensis',
-    'bologna.',
-    'bolognas',
-    'bologne',
-    'bolognini',
-    'boloisms',
-    'bolonian',
-    'boloria',
-    'bolotnikov',
-    'bolotowsky',
-    'bolous',
-    'bols',
-    'bolsen',
-    'bolsena',
-    'bolshevik-style',
-    'bolshevisation',
     'bolshevising',
-    'bolshevistic',
-    'bolshevists',
-    'bolshevization',
-    'bolshevized',
-    'bolshevizers',
-    'bolshi',
-    'bolshieness',
-    'bolsho-bonapartism',
-    'bolshoy',
-    'bolsius',
-    'bolso',
-    'bolso.',
-    'bolsover/buccaneer',
-    'bolstadr',
-    'bolster-shaped',
     'bolt-action',
-    'bolt-cutters',
-    'bolt-guns',
-    'bolt-like',
-    'bolt-on-on',
-    'bolt-rigs',
+)
+
+blocks_86 = (
+    '#%aar-i&!.$"di$$lgee$$rhuu%$tete%#uto##ell$!n$"tt$!u$&vichus#$ilio#$ooki%"ms',
+    '\'!s#$zaro!\'b-1100f\'!s#$3000#%style#&wistar"!1#$100s#!2"!2#"00"!3##000"!5',
+    '""bb#5llllooooooooddddyyyee"*c-approved$\'bashing$,commissioned$(designed$&funded$#rte$&thames%&rained%#ype$(wildlife#".b#\'/m68000$#nop',
+    '#!i$"sh#%progs#"so$"so""em"$f918"-n/cornerstone#"fl"#src"!y!$c-ad"&.solon"#109"$212l',
+    '"!5#"46"!8"#ars#!s#"tp##use""b3""da#!e",e90/10/4(ns)#%faddb""fe"(g-matrix#&inning',
+    '#!e""ie"!k".l-2-expressing&.overexpressing"!n#!n",p-affiliated$)dominated#!d#!l"%s/ocs"!y!,d118,000,000#!7',
+    '"D3&verbar&verbar;nf8&verbar&verbar;12"$575e"*68,400,000""75"*97,200,000""am"!g"!i""na""rb#$lund"#tcs"#x/4%!l!\'e&amp;n',
+    '((;neither)#the#(ndash;an#*rehy;sides"$\'alf##ere""-1#$able#$back$\'lazered$)op-a-lula#&called%#use$\'ostumed##dam',
+    '%)leterious#(ee-ee-ee#$fore$&rilled#&gained#$hind$&ymened##ing%)tegration#&jacket#&kilted%-nd-to-shelley#&little#(mirrored$&oaning',
+    '$!i#"ro#$seen$&ticked#(thankful%#ere$(rainered#&wigged#$yond"#.2b$!s#\'arguing$!t#"en#(supposed',
+    '%"is")/displace#$keep""2s"!3#B&verbar&verbar;bg7&verbar&verbar;4"!7"%=read")_a_little#%grown#"in""ac$$ause$&h-bags(#sed',
+    '&$clad\'%omber,!s&\'fringed&\'garbage\'#ear&%house\'"ut)!s&$look&$robe%&/rocks%#bar&"oy%$comb',
+    '%!e&!r&"s/%%field%$ings%&lovers%$mont%$rock%$ware&#ise$,ock/campaign%\'n-fires&%field&%ville$#use',
+    '%&eating&!d%#ing$%:cell$%bonny$!e%!r$$like&"ng%"ow$%nells$"s.%$/dna)&/bound#$fort',
+    '##han##ini$"rd#&k-blow%(cleaning%%first%%marks%(prodding$!.$)/daughter$\'er-folk\'$vase&!.&#ful$#ful',
+    '\'!s$"s.%#ful#*l/sotherby$"by$$dred$\'e/cupid&&mother%!y$"in&!g\'!s#$m(s)$(-\'em-ups%\'current',
+    '\'$gine%%lines%%slots%%width$!.$$aris$#ers$%ingly%(sh-based\'"es)!t$%lines$#ond&!t$$sley',
+    '(#und&!r#)n-counter,!s%%field%$like%#row(!s%&shaped&%prout%#tin$(counting$"er&!y%"th',
+    '$%feast$$hill$!i$$land%"ey$)nacharain$%poles$-s-and-bullets&(in-a-tin%&etting%$hoot%%talks&$icks#-r&rehy;spirit$!\'',
+    '$&-cheek&$laws&"ub%%feast&%ooted%&garden%&headed%\'raiding%&shaped&$ized&&kinned&\'urvival$!.$)aphanalia%\'viators',
+    '$$cats$(d-growth&*scratching\'&having-!s\'&tubble%*/christmas&#jim%(clippers%"er%*more-built%(o-weirdo&!n%$sall&#ely',
+    '&$moor$"ed%#nds%"st$&garden*!s$#in\'&)g-plinths("up$$land%!y&(-made-it$$mail&!n$$nagh',
+    '%#ley$#pit$%s/min%$tead$$trix#$sain$"er$*ley/former\'!s$&soumal*(minister%"st$\'t-brain&\'feeding\'%ooted',
+    '&&sounds&&things\'#rap%#ley&#ily\'"ng%&market\'$ster+!s%"on%"s.#%t(en)$8-\'em-up-cum-shoot-\'em-up%.boho-jazz-punk%)frequency',
+    '\'&inding%&poetry\'!p%,the-deadline$)/migraine$"ae%!m$/box-plus-guitar$%downs$(en-earth&!.$#ham%#ing$$iful&!y',
+    '%(tudinous$*le-cropped\'#era\'(oriented&\'s-style\'4/stones/kinks/peters\'!s&!y$&master%#ore$$nik.$#ons$#pop$)rice/modi$)tie-tudes',
+    '($show&(fication%/ycommunications#%ubien%#run$!c%$aire&$stel%#ens%)hamp/goal&$emin\'#sne&#map%$ourt)&-hamel',
+    '%%idlez$0fighter-equipped%#ord%"re&#ont$#gie$"jo$%mains&#nor&$rais\'-chais/livings%"el&+s-de-venise%#ond\'-t-les-valence',
+    '&#unt$\'racrats%&epaire%&ocracy$-s&eacute;jour%#ang$"t.%"if\'$iers($llly\'/ul&mdash;crying*+rehy;voiced)%-eyed*\'looking)#est',
+    ',\'crafted,&edited,&filmed,$kept-&nitted,&marked,&placed/#yed-\'roduced,)sustained.%tured+!.&$lity&#ngs&#que',
+    '%-y&mdash;there&!\'&--before-bread\'(contests)%unter\'%dress\'\'related\'$spot&%/best&#ful$,vai&rehy;sis&$llon%$eria(#cin(%lides',
+    '\'!s$"x\'%\'-livres$!y#,van/landlord$*er-trapper,#ing&&brook/&#ish&$skin$"on%!r#\'zleblor"!b#&attled',
+    '#$burn#(el-platz#&oppin\'$"ry$"ut$&w-tied#!s"%calms$%me/ai&"st$$suse$#tti$$uase%!e%+se&mdash;ca',
+    '\'-_,_because_of(!a)!s(.not_because_of\'.becausebecause\'!c\'"he\'!s$#yse#\'cabunga%$fumi$&ellati%"ra#"ej$!l',
+    '#!h$#ari$,ely-crundall$%gaard$"io$#ler$#man$#ner$"or$*tel-france(,westinghouse%#ler%$oldt#"ir#/k&ndash;barnard',
+    '$&/owner$!a%&nbauer$)et-tee-ee&0t-hester/midwife\'%/drug\'!i(!i$%field)!s%2ord/worcestershire$\'hampton&"rd$\'ingsale\'#ton',
+    '$#ler&,y/whitchurch%!y$&messer%#ill$$oner%$wing$$sley%$mann$+worth-smith$\'y-boops%*/traveller#+lamethasone$%othed%"ud',
+    '#%olded$0me&mdash;friends\')ndash;the&"-i&%.more&$_out&#ing&"st%\'ing-one$(ntrolled$$tite$!w#-ton-dickenson##use"$d(s)',
+    '$#bag&%thing%&locker+!s)#ing%&ooking&#und&!x$%chair%(overings%%radle&"ed%&urtain$%d-ed.&#ing',
+    '$$edge$$fast%%ellow*!s$%heads%%oists$"in$\'jumping$$lamp%"eg$&makers$&nights$$only$$pans&&rtners',
+    '$%sacks%"et%&haring&#eet)!s%1itting-room-study0!s&"ze(!d%%paces&$ring$&tables%&icking$&warmer%&ettin\'',
+    '#!.#*/breakfast$$days%&ealing$\'storage$\'washing#"ad$%holic$0le/northallerton$!n$,rfsgerechter$$ubed$$zzle#$bath$&orough',
+    '#(curtains#$dall\'$/all%"rd%!u&"\'r$\'ed-down%"rs$(ing-down(&mortar(#out(%plane\'#ham\')ton-brown%!s',
+    '$,y-beddy-byes##eck&#ing$$ford$"rn$$uten%!x$$vere$#wed#*ford-based\'%25pts\';shire&ndash;buckinghamshire#\'geberry%!y&!s',
+    '#)head/dado#$iako%"ns$(ngfields&#ham%!i&"ni#$knob\'!s#$lamp$#ess$%inens$#oad%"we#&makers',
+    '#$nall%"rz$#org#!o$"li$!u$$vers#$pile#!r$&agoned$%ocked\'!s%\'om-band()slippered\'!/',
+    '(\'sitting)*tudy/broom\'!n&"om#&s.even%$they$%/1000%&thames$#ers$1heets-and-bailing$$ide-(&manner%&t-land\'$type&$land',
+    '$%oiler%!n#%table#$ward\'#ine\'!s$"et&$ters$$orks#%ybuys""e-$0bee-bee-bee-beep$)encrusted$%field$$gees',
+    '%&umming&%nting$&in-his$$lass$\'ootiful%)rientated$%skeps#$ause##ban$&lebrox#\'ch-buds&&effect&&forest\'&ringed&%husks',
+    '\'#ike&$mast&&rimmed%$/oak%-am/reiner/emi%%croft%"en\'!o&\'r-stowe&+y/neighbour%*ing/thames(%esque%$lawn%$tree)!s',
+    '$"ke#$dham$$ings&!i##eee%!p$!m#,f-and-kidney%(booze-no%$cake%%dairy&&umping%)exporting%%faced\'\'ttening',
+    '&(lavoured&#ree%%heart*"ed%)producing%%steak%"up$(/draught%$work$(breeders$&cattle$!e$#oes%"rd$$roll',
+    '&$eaks$)y-feeling&%jerky#%hive\'\'$-pop\'!d##ing$#ous##kay$%epers#)lderstorm$!s%"by$&zebubs#)n&rehy;is',
+    '%%amold&!n&$sked%$kind%#the()re-before$(/scarred$"_a&"ll%"on$#eys$\'hopping#5p-beep-beep-beep-beep%&voiced#.r-and-skittles',
+    '&(efuddled\'#lly&&ottles*#ing&%ulged%&cellar&\'oloured&$rate%\'drinker%&fuming%&garden+!s%%house*!s%\'induced',
+    '&%overs%%maker&$oney%+of-the-year%#pot&#ull\'#mps%\'reeking%$shop)!s&$nore&%oaked&\'wiggers*#ing%$tent',
+    '&$ruck%#wet$!/%"or$#age$$cans%\'rocombe$!e%(nauslese&$berg$#gut\'!s$#ier$&keller$#mug',
+    '%#ele%%tands$$tube$(y-voiced#2s&ndash;whitehaven$,\'&rehy;waxed$!e$$iana%"de$*ley/former%!y$!t%"is%#ons%#ung',
+    '\'"ed%#ing#&t-crop&%utter%%sugar$!.$!a$#hov\'#en-)#ize)!s*#aal$#ing$(le-brain)$ight',
+    '\'\'driving\'*pollinated\'\'riddled\'(spirited($tyle\'%wings&\'crusher&&juicee&%stone+*/assistant$#ons$%roots$\'son/esp$!y##ves',
+    '##you#"zy"+fec-mulquin$"hl##ice$"nd$%ttin\'#%lared$&owered##oer$#ire$%oling$(r&eacute%&dshire%\'e&mdash',
+    '-#now\'.ndash;relaxing\')rehy;hand&!-\'#bed\'.dawn-returning(%inner\'#for\'%lunch\'*paying-tax&!.\'#its&-/after/during\'&during\'"if',
+    '&$_but&#and&%hand.&!i&$ness&%times$$uled#&rocked#!u$+ddle-headed$$rred"$gans$"ra%$elli#,bie/daughter',
+    '#(gar-king\'$maid\'%women&#dly$"en%"rs%"th$&inback&\'g-bowls\'$bowl$!y#!i$%jnhof$&n-with%$ings',
+    '\'!n\'.r-intermediate(-/intermediate)$rock(.s\'-instruction&!i\'!g\'\'n&ndash($g-to)$less)$s_at%&s-with&#.it&%:will$!o',
+    '$\'amoured$"es$&iocchi$&udship#!n#!o$!b$!d$#nne$!r%$rahs$#uen$$wned$"zi#,r&uuml;ndung',
+    '%!m$#iff$&udgers)!y%#tch#)uilements\'!r&+ing-looking%!n&$ages&"ot%\'ristain$&m/aged#$with#$ziyn',
+    '#)alf-could&!e$!v%"e.&%d.the&!r%$ing.&!o\'$rism*!t\'%ur(s))&-based+"ut*+controlling*(guidance',
+    '*\'pattern1!s*)sometimes*$that*$wise)(/actions*%tasks)0al-dispositional+)/physical,&social)(ist-type,&ically)\'ography&#uor\'!r',
+    '(#ism#)behanian.##det#/eermaatschappij$"lf$*shte-zahra\'!i%"ts##idi$\'losophy$$nd\'/&\'-before\',locked-doors\'#nut\'&scenes',
+    '+$back-"rs+$desk+#ear+%scene,$heds&(.picture%!g$$stun$#und#%nisch#&old\'st&\'ingness&$ynge$"of',
+    '#%rends&+s/cambridge$#oze#%viour##zad"#ide%!n%%rmier#1ge-and-dark-brown&(carpeted&$gold&%toned%&/brown&%green##hon',
+    '%!r$-ing&mdash;see\'+-controlled#!l$!e$#ken$)schmiedia#!m#8n\'-tactful-to-old-people$&cluded$!d$"ee%"ix%!s$\'g&mdash',
+    '%,-a-rock-star&.breathed-in-to&-for-the-other&(in-a-box&(on-drugs&,related-to-x&#the%&/there%-characterised%#the$"ng$"st#&ra-mar$"dd$(niadaeth',
+    '%$stut$!o$(ut&ndash&*-on-hudson\'\'sharjah#.shon/consumers$"ly$#tis##tel$,h/federation%!e$)r&auml;ge%"ag$#zel"!j',
+    '%#ers$$isus$!m$#nts$!r$#sis%"us$"ze#$ewel"$kasi##ele$"nn$&scsaba##hor#)ittenings',
+    '%!r$"os#(nickered#%teshi##ulo#0waamheidsdiploma"3l&dollar;22,700,000$1eacute;m-brasilia$)ndash;eve#$-him$&marduk$%samen#\'aggered$"ir%"sa',
+    '$%monte%!y$#nda%"ov$#rdo$#sco$(tucadrus$(y/abseil##ben$(roughton#$chen&(r/fraser(%royal\'$town%"in',
+    '%!o#$dham$"on$#ray#&eagued(!r\'%rered%&thered$#bey$;eeeeeeeeeeeeeeeeeeeeeeeeeve6"ve,"ve*"ve)"ve\'"ve',
+    '%$vers&#ing$#iev%"fs$!m%)nite-rich&#oid$!n%$\'kii$%riand$!t$"ue$!w#.fast-blackpool)#red',
+    '(\'gatwick((heathrow()liverpool)%ondon(*manchester\'*/liverpool$*ield-smith$+ord-cellini$(ry-based$!y#"ga%"rd$(ian-bred)$uilt(*luxembourg',
+    '%&um-and(\'trained($with$,o-luxembourg$+rade-zagreb&"nd&#ves#"ha%!j%%ssine$&ouchet$"us#%iairs$"ce$"da',
+    '%1f&rehy;expression,+systems.the&(-centred\'*expressive\'#far\')structure\'&worlds&*/assertion\')intention\'(unbelief&"s-\'!.&!t%#ve-()it-or-not',
+    '\'(/anxious($feel\'$:the\'"d-("ly\'&rs-and&#in\'$%ghted$"ke$\'nda-ish%$form%!g%-skii-zakharov%"us$$pped',
+    '$(ttlement\'%ingly$%zanus#!k$,evitz/father$%hadem%$uban$"if#/l&ndash;coleman%)rehy;push$0-and-weathercock%(belgacom&$irds&$oard\'!w',
+    '&$rass\'$ight%%chain&#ode%&flower%\'hanging\'%unted%#jar(!s%%laden\'"mp&#yre%#man&&eaning\'#tal',
+    '%(northern\'"te)!s%%panel%&scotch&&leeved&$ound*!s%&turret%$wall)!s$&.gild.$(/barbell&-rother-in-law%(convenor',
+    '%\'genesis%$john%&oxford%\'student,!s%*university%#vet$\'adonnae\'!r%#fax%#ire%#nca(!s&!i%)pa&iuml;s',
+    '&#min&%rnine&!s%!s&"is%$tini&#rix$$bird(!s%&orough&$ttom*!s&+y/hollywood$$cote$(e-epoque',
+    '&%laide\'\'ettrist%#air%%canna&%hasse&#our%-ek&ndash;kesh%#fon("ds(%taine&$roid%%garde%%hatch%!m%!n',
+    '&#ger&"ie%&perche&%heron%*r&eacute;e&%-hann&(by/abbey(!s&"ic&&ophens%*s-lettrist&(_lettres%#tte(!e%#ver',
+    '\'#sta&-ue-rheinhotel%!w&$arde%#zze$\'flowers%&ounder$%haven$"ic&#oes%"do%4gerent&ndash;neutral+#ly.%#nas&%esque',
+    '\'#ers&"i.\'"an&$zona%%ssimo$#mer%"on&"re$#och&!q%"mo&!y%!n&!i%"rd',
+    '%#tte%\'ws-like(&mender$%pulls&$shes$&ringle%#oom&"pe(!s$.s-and-whistles%#cat%%haped$"to$#urn$$vale',
+    '$$wire$-y&rehy;landed/#ing%!\'%(-achings&\'bumping&%cheer\'\'rawling&&dancer,!s*#ing\'#eep&(flopping*!s\'#ull',
+    '\'$olds&$land\'#ike&\'numbing&%piece&$roar\'%umble&\'sliders)!t&\'turning%%board%$fuls%%laugh%!s$%zouki',
+    '$#eis$#ore##nap##och$)grad-chik$"ki$!n%$esox%+g&rehy;here&&ed-the(!.\'"rs\'"th&$ing\')!.',
+    '$$pole$#ros$"st&"ok$#uis&$zdad%"sh&.ov-zhabotinsky$*v&egrave;d%(ed-style%$odie$\'w&mdash+$;for%!-&&branch',
+    '&%decks&0investment-grade&$line&\'optimum&(shoulder.\'-length\',pecification&*the-bonnet**collarbone*&market*,poverty-line&$zero%!.&"as%!s',
+    '##say$\'en-thin%!r&\'-verlag$#her$$teel%#one#"t\'$1-across-the-chops%\'busting%(cum-tape%\'joining%$loop%&plates%$stud',
+    '%$zone$!.$\'/pulley$$agne%+nelliformis\'!s$&buckle$#ies%%ng-up\'"ly\'!s%!r$#ona$&ravers$"sy',
+    '#(u-simion$2shi/aykroyd/murray##val$"er$%idere%"er%%lle:i%"or#!y$#aev%#yev##zec"#mal$"rd$!s',
+    '$!x#"be%$neck%"rg#"ei$%lmans#"is##nor#%owski#%porad$%stone#,used-looking#!y",n&iacute;tez$(ocirc;it',
+    '#!\'#!-$\'avraham$&gurion$\'menashe$#ner#%/rush#.achenhou-lafha$$dryl$"ni$$sser$!t%!i%#sky%#ura',
+    '$#zet%#hir#"ba%"ne%#sat$)ow/bosnia&!e$&ulbous#,ch&rehy;mark/#ing/!s%&(1861)%&-altar+!s&$back',
+    '&\'seating&#top%!.%(/playing%%chair%#eik&(rs:james%$lane&#eys%%press%$test%$urch%$work$!i%!e',
+    '#\'d-i-bus$\'.around%(sweepers$#ale%"na$$etti$%feldt)%urban$$iest%1ng-behind-the-nut%&x/king$"le&"ss$"on%!r',
+    '&#rou$"ra%"ey%)ofluazude$"s.$#umb%"si$&y-sole%!k%"sh$!z##e\'t$"ah$#cke$$dens',
+    '&!c\'"am\'%endum\'"te(!s&!k$!f%#ica($ries\'(e-holder/!s\'&iality),ry&mdash;the+!.)$ting',
+    '&"t\'\'&-level\'&.early\'*/community*%uncil\'%:risk\'#ial\'%s/bad("ca(&victor%!o&#rti$#gal%&oechea$&harnum',
+    '%!x$$lips%"li%#ong$$mann%%erito$!s%"on$#the%"os%!s%$tino&\'on-type(!.(!s',
+    '%3olent-beat-bohemian$#zet%"it##fey$$ica0%*eld/slalom%!t#&galese&*i-speaking%"te$&eworth$!i%!e$#lis%"og',
+    '$!s%#ton$"ue$#zon#$haim%"ll%(m/oxford&!s$%ilton#(i-soueif$$amin("io(!o%!n&!s',
+    '$)ghtedness\'$ment%"na&"um$%llion$%ncasa%&gfield++/gamekeeper&#ton%#ois%"ta$$sons&(u&euml;f%"sa$$tier',
+    '#"ja%$min\'()/cummings(#son$"ie%#man#!k$"ei%"rt$$hill$$ovac$$ulen##lay$#ich$#len',
+    '#%mnett#&n-anza%&eubank%&healey%)recruited%\'watcher(#son$)/festival$#als$$dorf$#ery%\'t-clark&+t/architect(&cancer(&glider',
+    '()neighbour(&prefab(&worker\'&itales\'#ons\'\'sbridge$$inck&%ghome\'$tons%#tes$%llech#&omylin$"ni$#tti$#uda',
+    '(!\'$(xoprofen#\'radoune$\'edouane$"ig$#kik##sel%&raside$#hie%#oof$#ing\'"er$#low$(on/daily($owty',
+    '&#ian)!s%%ussan#(t-backed%\'handled%$wing\',re-and-float$$.the$"al$#een%"ng$$ford$%halls&&mesque\'#ism',
+    '%&ically$"ii%!l$"le&#igh&(y/bishop$#ota%!v$"ti$"um$!y#!u$#mbs%#med$.tzerfreundlich',
+    '%%ridle##way#\'yellary$*on/society#&zadine))-hydrogen%#kin%$mido\'#nia$"el%.ne-azo-benzene(.diazo-chloride($like\'(/ethanol&"ic',
+    '%-quinone-amine%!r$%idine%"es%#kie%!l%!n$!o%/-14-thiacrown-4%*diazapines\'(oazepine%&furane%(triazole%*ylperoxide$(ylacohol',
+    '\'\'mmonium%"ne"$omuy#"na#!r$%hford%%thelm$$nred"\'plushed#"op##ton"(queather*!s)!s%#rel',
+    '$"ia"*r&egrave;s#!a$"de$"gh$+in-inspired$"ja$%khoth$*l/imperial&\'project%"di$!m$"ng&"er$#rdi',
+    '$%erana#"ce%#anu%#let$"he&!m%%thold$#uit%$vitz##dan$\'ennikov#"ea%"ns%"ve\'+ment-coping',
+    '\'!s$!c%#zky$$ford%%t/and$%gevoy%#ond$0itschaftspolizei$!k$$nado%$dsen%"go%$ices$!r$8sford/curator/regimental',
+    '%#ina$&t-clad%!.%"ed$$wick$&zovsky#+g&eacute;re&)grave;res$&agnone%$hoff%\'kademie%&masque+!s&"ia&)o-brescia',
+    '&"za%%ptens%%retxe$$eist%#lin%(n-belsen\'(mccarthy\'\'op-zoom&$dahl&#hus&&stammi%)r-gestapo&"es\'!t&!s',
+    '%!t$%fleth%&rieden$%gasse$$heim%)olt-based$#ian%!i%$sche&"el$%kaman%%elder%$ranz$\'manlein$#nes',
+    '%%onath%!s$%sagel%%hrund%"jo%"ma%%onian%%troms$%uaria%!e&!s$$vist$$wege$(zaberner#"h2',
+    '&!u$$tast%$gils%$wald#%ichte%!k$$eved$#lia$!n%#dei%#ger&"ia%$thia$,st&agrave;in$"ts',
+    '$#amp$&eleian\'\'y-based)\'derived)\'trained)(walbrook(,/conservator("an&!y%$ntex%!r%#tex%!v$$fell$/hampstead-based',
+    '\'*sted-based%#out$#lee&&yanism$#ner$"s.%&/bucks%0hire-oxfordshire)0/buckinghamshire*)hampshire)#man)!s$#ton$"un#(landieri',
+    '$0eeeeeeeeeeeeeeve%)v&aring;g$(ichingen%!e%\'n(west)&&-based(#orn(\'udapest\'.charlottenburg\'0hohenschonhausen\'&moabit\'$rome\'*to-leipzig\'(watchers(&edding',
+    '&%ische%%ozian\'!z$%keley$$uddy$!y%"ne#)man/perry&%tofts$#ejo$/ingham-mcdonogh$,ondsey-based,#orn$+ud&eacute;z&)a-shorted',
+    '&!o#(n-murten%)neuchatel$*/f&uuml;ri$!a%"be%#dac&%ettes&!o%#ert%#ise%#nos%\'rd-levy($shaw)&oulier',
+    '\'*inplanning\'"us&!r%#uer$$bach&"um%#erg%#urg$&castle%"ia$"ei%&nstein%"st%!t%!y',
+    '$$gate$)hardfonds(!s("ur)!s\'!t&"um%#ope$/ician-dalriadic%!s$(kasteler$"od%%uilli&)lli-euler$$shaw',
+    '&#ead\'1in-kearsley-zapas)-/comden/green*\'ormandy*$rave$$tsen#%oflex$*l/osmiroid$\'munster$"re$"ul#%quist#!r$*&iacute;os$!a',
+    '%"ra$#ick%-edale-johnson%"ni%"os%-sford/olympic&"on$+r-zerrr-ker$,ueta-clement$"y-&(coloured&#dee&)flavoured&)gatherers&$like',
+    '&#red&\'trained%)/forensic&%group&!i\'\'ndustry((vestment%)appearing%#boy%$dale)!s%"er%&fields%%lands%&narbor',
+    '#"sa$#eem%#nev$\'gardens$#had$"on#(t-smiths$$agni%%relli%(ux-wiame$)el&agrave%%nshaw%"ra&"oi$)h-holders',
+    '%&elotii&$ngam&!r%$iers%#ois&&lleria)!t*"ia\'!t%$rong$#ice%$llon%$noro%#oga%$scus',
+    '$%odano%"ia%!l&"an&!d\'!o&"io%)ne-bodied($like&"or%!p%%relli%#tti$"ra&)m/ostrich',
+    '&!n\'.d-de-comminges)$type("on("us%"mm$#sch\'!i($nger$"us$!z#$uhrt$"lf$%ncial$#tti',
+    '%$rlin#$well$.ickshire-based$"yk#\'y/house$"ll&&ium-10$!x##zei$%onsky")s-assured#$agic$#kih$#min$&nceney',
+    '$#que$$shed#)ceade&eth$:haftigungsforderungsgesetz&&ntnikh&%tnikh%!i$#oby#&eeming$%ieged%%gning#%grove#$hari$#irs#*ides&ndash',
+    '\'!.%!s$\'egement\'!s&$ings$#kci#%kitas##ley$$oten#"m6$#ear%!r$%ocked#$nier%!k',
+    '##oin$!r$%zzled#$pake%$tter)#ing$&eaking$&ittled$#ort\'"ed$$read%&inkled#&sarbia&#ion%!y',
+    '%"ra\'!t%!t$\'hi-type$,i&egrave;res%(e-brains%!n&#ger$"le&!r$\'mertnyi$#ner$!o%"ns%$umal',
+    '%(mdash;at%,rehy;selling$!\'$(-adapted\'&justed&\'ttested&(vailable%\'beloved&"uy%%class&\'omposed%)decorated\'*monstrated&*isciplined&$ress',
+    '&!n&(xecution.!\'%#fed\'!w&$irst&(lavoured&(orgotten(#med\'%unded%(governed%(handling\'#ted&&earted%*in-britain',
+    '&%roned%*known-song%\'lighted\'#ked\'!t%*maintained\'!n($aged($ning\'#tch*"es*#ing&&eaning&(otivated%%named',
+    '\'#-11)!7*&-frame0!s)(9-frames(+both-worlds&$iled&(rganized&+ut-of-three&&verall%&paying&&latoon($ying&+roportioned(&tected',
+    '%$read\'&corded\'\'gulated\'(searched&&ounded%\'scoring&"he&\'ituated\'#zed&\'ounding&(pecified\'&irited&&tocked%$test&%urned',
+    '%*understood&#sed%\'watched&&ritten$&.known%(possible$*/prisoners$$egui%"ht%!s&&t-ever$#fit$$hoff$%iaire&#lly',
+    '$#ley%#ite$#man$"on%$wers$&ridden\'!e$.seller-writing$&ubbled$!v#(weatered$(ick/goat#!y$#des"\'t&mdash',
+    '#&-shean$$the-$$ween$#zur#!.#/a&rehy;blockers$!-%/2-microglobulin%,adrenoceptor&&myloid%%cells&0hloro-beta-ethyl&$ount%\'emitter%%gamma',
+    '%&lactam))oglobulin&#obe%$male&$inus%)particles%)radiation)\'ography\'!m\'!y%)sensitive%&tested&*halassemia&$oxin**-producing',
+    '$&/gamma$*adrenergic$\'blocker)#ing%#uys$#cam&&rotene%"ea&#lls%$olor$$dine$!k%"en$%light&#tes',
+    '("ia%!o$\'sselled#%chell&!r\'&rygahs#\'el-leaf&*nut-rouged&\'ravaged&\'stained%%juice%#nut%!s#$h-el%%horon',
+    '$&anecol$.ell/department%!r%"sa$"ge$#ink$"ke$%leham$#nel$\'shemesh#!i$!c$#des$#tou#%jamin',
+    '("ia(!n(!s#"le%!y#\'okeneth$$laza$"ns#%rasey%$yal\'(,.venezuelans&%ingly$%eated$"vg#%selem',
+    '$&y-coed#%tagno%!h%$rini%#uer$"ed%%ndorf&"ey%*r&mdash;it\'/rehy;positioned-(reserved&$\'ole&%(&gt)&!-\'\'behaved',
+    '($uilt\')connected\'(defended*$ined)\'veloped(\'irected)&sposed($rawn)%essed\'*engineered\'\'fancied("ed(&itting\'\'groomed\'&housed',
+    '\'\'managed*%nered\'\'ordered\'&paying(\'repared\'$read)\'sourced\'&served($ized(\'ounding(%poken(&tocked(%uited)\'pported\'\'tasting',
+    ',\'nodding.$rmal,(ordinary,%usual)!e($o-do*,eat-you-with)"ld\'$used\'%waged&!.&./worse-dressed&#ave)!s&#in\'',
+    '&$ways%\'shanger&%worth%!y$#iah%"es%"n\'&%g-mad(%shops\'$haus\'!s&*son/father%!s&"on$"le',
+    '$\'on-ford&%/abta($ssoc,&iation$&sworth$)ws-y-coed$&y-jean%%jones##uix$#lia&!n#!w$"ee&#ded&!h',
+    ')#rea(%chain)&ountry($deck(+generations(*individual(#kin(%level(%match)$eals(&points)(rogramme(&school)#ong)&pecies',
+    '),he&rehy;wars+\'-sheets,$wars)$rack)"wo(&venues($wars\'#/in("p/\'!m\'#the($imes\'&whiles((roughton$$qeen',
+    '##zig"%ufort#$gmot##lah$!t#$mont##rer$$ling$!s$"ze#"th#\'ve-mery#!y")van-style%\'/parish',
+    '%#lee#%edere$\'l-edged$$nden$$rely%$gern%*idge-style(#ian)#tes%$lies%%ungen##ies$)n-citrine#"na#/rydingsbeweging',
+    '##ven"%wails#*castledale##ein$$rley$!s#(ick/joan$,ldered-puppy*#ly.$$nged$%tcher#\'ley/nfu#&orking##ray#$sher',
+    '#$ford#%hill/#&ington#$ley-")ychevelle##dun##ind#\'lerbeyi##nam#$oglu$#nd\'&--the-physical&\'/behind&$ness%!g',
+    '#!s##ton#$yene"\'z-dance#%annes#\'bozhnik$,urzhuaznost\'#$elle\'!d$!t#&iehung$#rke##ley#)onasnosti$(pasnosti',
+    '\'&tnosti#&ruchka%$kovo#)uidenhout#\'ymianni#(zi-scali!*f1,279,000$\'634,000#+09g&ndash;2##10d%!e&!s$!o"%2,000#%1,800',
+    '$!9#"20#!b"&30,000#&4.0077$%6,000"!5#C&verbar&verbar;nf8&verbar&verbar;27#$,200#%0,000"&99,000"(goodrich"#ore"%r1950#,3800/dfl.200',
+    '##900""ts!,g&mdash;base""38"!4#(543/2221"@5&verbar&verbar;c6&verbar&verbar"!6""a.#!s"(et&num;n"!j"!k"\'lenvrev"!m',
+    '"!t"!w!#h12#!4"&2-mjlt$#ncf$#rfc"!6#!+"!8"#abi#$dase$#ohi$"ra$"ur',
+    '%3vad-g&imacr;t&amacr*#ita$"ey$\'irathi.$(vad-gita$"ya#!i$!d$!n##jee$#man#%kthan#&lendra#%ncair$"ji',
+    '%(tanatyam$$dwaj$#ita$#tia#(tacharya%"in$"ia&$sevi$%lekar$,ta-mimamsaka&\'charyya%#law##van$$nani#\'woodien',
+    '"#eim##oil#"ra"&f-bank"!h"!i##-ri#)bhutishan#"ff##khu$#khu$!u#%lwara#)ndranwale$"gi',
+    '""kc"!m"#oma#$odan$#tas#+pal:victims#&reraig#$wani#!y"$reac#$ogan$%lcain&+h&aacute;in""si$!i',
+    '#\'chaille&!r\'&/kiran#%ddism\'!t##ide$"rd$#yan#\'miadhat##pen##san#%tanis##van!3i&cacute;ani&cacute#\'ecirc;n',
+    '"#\'me".-amplification##bii%&ralahi#)carbonate$#mos$\'ommunal$\'ultural#%daily$+ialectalism#*federation$#uel#-intercalation#)laterally$$evel',
+    '\'#cal%#tal#%o-bin$)rthogonal-#ity##ped%$tals$"od%&larity$\'roducts#&racial#\'section%"xy#(temporal$\'onality',
+    '#$word#%zonal"&/multi#(triaxial""ac$"hu#"do#&giotti%!s#"kh#+l/brasilian$!a##mba%!y$!e',
+    '&!s%$heri&"hi&&i/film(%stunt\'"ni%%onese&!s$%gular#&rmicus$!t#%s-cut$"co$!i$#ses',
+    '#&thlons$&orella"&b-alls##ata##bed$#ing\'*s/abingdon$!s$(y/father&&mother#$dish#"el%"ot$$rach%#egg',
+    '##le\'%!-&\'bashing\'(elievers)!t\')olstering\'#unk&$nest&\'quoting&&reader*#ing&(spouting&(thumping%\'puncher%\'thumper',
+    ')/rehy;babylonian%"o.&%clast&\'grafico).phic/reference,!e,$sche&%latry&!n&)pegically)!y\'$hily&&sophia&/th&eacute;caire(!.',
+    '+!l)$rapy%#que%$sche#\'ulously$!s"+c-sponsored#\'/titman#!a$(lcaratus$(meralism$0rbonate-buffered#"ci%!e$!y',
+    '$)ntenaries$(p-breast\'&ulging%&halous$*ster-based\'"sr##hai%&rapost$!e%!s$#itr$\'romicum##iac$#nia#$kell',
+    '\')taff/nupe,#tuc&$ton-)(/manager$\'leywood$$more$$nall%(ell/dire$!s%#ons#!o$%astal$%ncave%(ditional&$ylar',
+    '#%uspid#/ycle-chain-type-!s($like(\'mounted(\'powered)#ump(&racers)\'ickshaw*$ding($seat)#hed($type(&wheels\'"s.',
+    '\'#tte&(istratum&$oids"+d-defeating$$list(!s$$only$$rent%&igging#!.#&/offer#!a$#ndi$$rray$#yuh',
+    '$%enden%%stone$#ics%(es/dolls%"ss&$tone$&lecomb$$olph$0ulph/oxfordshire##ein$"ns%$tate$#yat#,ford-on-avon#"ge',
+    '$*alectalism$)mensional$!s##jar&!s#$lake\'!s$!e%!a#"on%%ville#"ri#"st""e.#8/nafd/cfsma/bifd/liaison',
+    '#)danheafde$\'erbecke&%mayer#$gler#!l$!a%$nski%$wski$,eckichairman%#man%!u$$icki$\'orussia+"ns$)sko-biala',
+    '$"al$"ek%!s$\'faisant$!g$"io$%nales%!e%+ial-alumnus$"tz$\'venidos#%rbaum$!d$&garten%"es',
+    '$&odrome$-schinkenwurst%$tadt$=ton/aylesbury/buckinghamshire$"ut$#wag#&sbosch$!t#$uleu##vre"!f#"ar$\'sciated#!e$/rno/campomarino',
+    '$!s#*f-wham-pow$"ed$"in$!y#,idobacterium%"us#$lora#(oore/and$"re#$rame$&enatus#$stek##tek#$ulco',
+    '$%rcate(#ing".g&rehy;mouthed)(spending#!\'#)-alphabet$$baby&$lled%%eaked%%illed%$lock\'+ody-hearted%%oobed\'!t%$rand',
+    '(!s&!d\'"ge&#ilt&&ttoned$&cheese\'$sted%%liffs$$deal("er%+isplacement%"og%#rum$%eared&$ters',
+    '%#yes$.fin-reef-squid%#oot("ed&"ur%%ramed$\'gastrin%"ig%%utted$&haired&"ll%)eadedness(!s%&itters%%oofed',
+    '$&league$,manufacturer%&uscled$$navy$!o$*production%\'upilled$&ribbed%#oot$(screened%#hit&#ots\'\'uldered%\'isterly%&nouted',
+    '&"ep&$udio%%uited$&tailed%&highed%%itted%"oe&!p&"wn%"wo$#uns$\'wheeled#%.john#!a$!h',
+    '$"rd#&cheese#&earian$#rry$"st#$gate$%elaar%&r-bore(\'reasted\'#dog\'\'engined\')is-better\'(mcdonald\'(spending\')than-ever',
+    '(%icket\'#wig&)/sculptor&!s%)st-budget(\'earning$(in-based%)sh-budget$(les-type$,s/shopkeeper&&united##job##lan$"en$#ifs',
+    '$#uff#%nardi$#ing$#old%"ne&\'iaceous\'%oides#!o$\'nioides$!s$$tted#$rigg#(sby-like$%trupp##yle',
+    '&$ynge"!h##and#&oldyng#$ynde"!i#"ab#)ba-fimbra"%jedic$$nkor#!i##nor#\'outerie##ser#(ul&imacr',
+    '$#tsu""ka#&e-less%$park%&racing%!y$%nibou$*r-drug-sex&\'looking%%nieki#(ini-like\'%pants\'$tops##kie$!y',
+    '"1l&rehy;dungsroman#\'-patata#!a$$gare$$lian$(mellatum$&ncetta$"ry$2terally-negotiated\'#ial$#uri#"ba%%laash%"ny$$eads',
+    '$&o-type%"es%$hall$$rook&#ugh#&cliffe#\'d-kunst$"ad$"er&$mann%!s$%hauer$2ungsb&uuml;rge1tum(&romane-!s',
+    '$\'zeitung#*e-snorting$%ducts$!k$!t#&finger#*ge-induced&%water%%water$+rav-nielsen#,h&egrave;res#%iary/(\'hepatic$!c%$hild',
+    '$&graphy$)n-binding%!a%$elli%$gham&#ton&%ually\'#ist$(oenteric$%ruben\'%inate$"ti&"es%!y$"us',
+    '#"ke%!d%!r%!y$"o\'#(l&eacute$!\'$)-allowing%\'boarded\'"ok%)cum-claim%\'dipping%+of-material0!s%&poster',
+    '%\'related%\'signing\'"ze&\'tickers*#ing%&thrust&&opping%(waterman$\'/billie%(resident%$save%&thames$#732$"ah%"rd',
+    '\'"on&"um$%backs$%check$!e%$cart%(nnia-old("um%"rs%*t-doux-ing&%_doux&"ee(!s&!t\')/resident',
+    '$!i%#ans&&rd-cue)&tables%3ng/northamptonshire\'$bear\'"er\'+sgate-based\')ton-grieg*$/tim*!s%#on+\'--&dollar;19.90!5("13',
+    ')!5*!0("20*!0)!5(!3)!0("40)!5(!7("95(\'a-month)%mpere)&nother(\'beating',
+    '(+dollar-club(&letter)#ira+!e(&pocket*#und-\'-a-year((shilling)%trong($year\'$.the\'-aire-populist\'$fold\'(s\'-worth%#ter',
+    '$%limit$#our%"w.&$ings%6ydandrewalterysimoneil$2s-and-office-lunch%)/monopoly%&thorpe$#und$#was$(y-button,!s&$cock&\'giraffe\'#oat',
+    '&"oh%$goat%!o#\'mermeer#)ney/theft#%odeau$#fix$$gora$#mas$"ng%#ick$#pha$!u$"xi##qis',
+    '#(sborough$$dean$$moor$(pedition#!t$%hoven$#ons#!y#*zingsleben"(maculata)"us$!h$!n#%bette(!s',
+    '$+o-next-door&$time%#esq%%meter#$edia$\'tallism#"ie$(nerallic#!m#\'odality"&n-card$$ends$$lids$\'shaking%$kips',
+    '$#ghi$$rism%\'y-coded)+mpatibility\'%level$&urally#$bags%!y$"in#*ch/coroner%#ley%#ois#*d&rehy;ing$!.$"ed',
+    '$)ing-cases(\'related($wise\'\'/uptake\'"ly$#own$"ra$!u$%weed.(!s#\'e-stems$$rvis$&theton#$full#(g-bong-a',
+    '$0/descendant/earl$*abaeconomy%#man$$chen$*e-and-fast*%vomit&%purge&%vomit%5ing/starving/vomiting)(vomiting%#mer%*n-am-rhein%!r%!y$.ham/investment',
+    '\'!s\'#ton%"ui$"ie$&steads$!u%&shions#!i$!c#"ka#%liner(!s#"na$#ema%%nhoff',
+    '#,ocular-aided+.nd-bobble-hats*%owner)"ly),s-camera_out$&mially(!s&$nals($tion$"va#$proc\'".u#&scombe$"ki$$tock',
+    '$$wood$$ztok##tje$"ou$#rey$!s$#ulu$%worth#(uclearia$!l%!u#$yang"*o-acoustic%)mendments%)nalytical',
+    '$(chemists%\'ollagen&\'mputing$-degradability$*ecological%&lectro+#nic.!s%)nergetics&&gineer%&thanol%+volutionary$(feedback%&ilters%#uel',
+    '$\'harmony&$zard*!s$%image&%plant+"ed%\'solates$(location$$mass%&inutes$*nourishing$)physicist*!s%"ic\'!s',
+    '%,sychological$!q$\'reactor&&search\'&ources%\'hythmic$&safety%&canner&%ience%"ea&$cond%#uit%&ystems$-technological."es',
+    '$)unlimited$\'vegetal$$week$%years##101#%alarm%#ert$\'nalyser)!t$%ssays##bax$.ibliographical.!y#)carbonate&\'tridges',
+    '$\'ellatum$%hemic),al-molecular(-stry/genetics$#ide&"ic$)ombustion&+patibility.\'%uting$$ular\'#tus#-degradability)%eable)#ing%$sign',
+    '$*isciplines%(versidad$$rama#(ehringer$&lement$(nergetic,"al%$gine)$ered#%filta\'%ering\'&ration%&xation$)lavonoids%)uorescent',
+    '$$oams%%uling$&uelled%&nction#"g.$\'astrone$&enesis\'#tic*$ally&$ical&&toypet%*ochemistry&+graphically&&logist$+rad-na-moru',
+    '&!f&$mmar\'!s&%nules&$phee*!s(#ica+*lly-minded)#es.("y.*"34#&hazard$#erm\'"al\'!s',
+    '%)formatics%\'organic#%karst#0layer/transducer$#ink%$stic)!s$!m$!o%&cation%"gi\'+cal/medical+(physical+%third*-ly-determined',
+    '(!s\'!e(!s\'$ques\'.st-naturalists)./mathematician)"ic\'"ze)!d(#ing&"y.\'%/soil$#yon#\'markers%!s',
+    '$"e\'%#dia\'"ca)#lly*!s(!s%!k%(trically("ka\'!y$%ining$(olecular%\'rphisms$#use&$ical',
+    '%&olillo$%etics$$omic$!s$&uclear#\'organic#!p$(esticide$%hasic%(otolysis$#lex$$olar$\'rinting%%ocess$#ses',
+    '&*chological&#ing$"ty$!y##ral$&eagent%)cognition%#dox%)gionalism%8mediation/bioreclamation%(smethrin$\'hythmic$%klund$%ontes$%rhiza',
+    '$)cientists$%ervos$/ignals-to-music%\'liceous$#kop$/ociety/ecotopia%"ft$#pec&*leologists%%heres%$unge$)tatistics%$rath$&urface$"yn',
+    ')\'tically%$stem##tab%!l$/echnologicalise&!x%!x$+herapeutics$*in-16-dupt\'*conjugated)%upled\'(labelled&//anti-human-igg&\'olyated&%ylatd',
+    '*#ion$%odoma%\'lerance$+ransduction%%onics$!t$%yping#$ules##war$%izard#!x#\'zentrum$\'onation%"rb"(parietal',
+    '$$dals$(ndicular#$hase$%enals$$onic#!m#!o$&larism\'!s#!p$"ed#\'unctata"(r-hakeim#*a-ramallah$$dari',
+    '#)ch-branch&%hazel+*-oak-alder&%lined&\'studded&$wood%+/buckingham&*greenpeace&#hiv&&stroud&!t%)all(1989)%"en\'$hall&!r',
+    '%"ir%#ley%$more%$nell%!y#-d&mdash;catch$\'\'s-foot$$-box&)rightness%$call\'%tcher,!s&%herry&#law%%drive',
+    '&#yes%%faced\'&ncying\'"rt&%eeder&#ood%%house%(inflight%\'killing%(language&%edges&#ime)*-encrusted%#man%"of',
+    '%&prints\'#oof&&ulling%$rich%\'scaring\'%reech&#hit\'&ooting&\'potters*#ing&%trike%\'tending&&witter%%walks&&histle',
+    '$(.richard$$/aid%\'charity%(importer%&rescue%$that$#_as$%brain$$call%$ombe$"ed%"rs$&feeder%$oods$"ge',
+    '%%ouses%$urst$)ie-birdie\'%eagle\'#ing$$line&1p/gloucestershire$,s\'-nest-soup%!-&*earth-brim&\'parrots&2wiv-their-jugs-aht%$burg%$cape\'$rers',
+    '%+ong-studded(!s%\'potting%%trike*!s$$trap$%ville$/watching/nature#+efringence.#$gham$%idale%!r##han$%indwa#"ik',
+    '$!r#$jand$$inni##kby$"en&#ead&)head-born+#had*!s%!r%\'t-smith&"ts$\'hauser.%$ouse$&inhead',
+    '$%lands%"ey$$myre#!l$"as$$eson#!m$"an$$baum$#day$!i%!d%$gham%!n&5gham&ndash;warrington',
+    '+$bred,$uilt+(coventry+\'glasgow+-kidderminster+&london,#yon+*manchester+(pwllheli+#rug..by-northampton+(scotland,Btourbridge-kidderminster-worcester#%nbeck%%rauer',
+    '&&-kebbi$%stiel#)o-smeared$#dom#-rell-produced%!n$#ova#!s$"ch$"el#0t-smith/landlady$(/ottaker$&chnell$!e$0h&rehy;strangled',
+    '%!\'&%-rate%&-canal("ve\'*ertificate\'#ord&$dead&%marks\'$onth($ther\'$ucus&$pain\'%laces&%right&#sin',
+    '&$yolk%$/sex%&charts&#ord%(day-gift)$suit)"to*#ype(#:an(%s:the%!f%%pangs%%quake%&right.&$ooms',
+    '&%tones$#ian%#sts$.les/gloucester$(whistles#)ut&eacute%!e#(yukov.in#(zebbugia".s&rehy;choffin#3(2-aminoethyl)ether$.dithiadiazole)$,macrocycles)#\'accates%$odyl',
+    '$#gno$#kha$$ltai$#zir#"bo#%ceral$!h%(offsheim\'\'swiesen$&ocodyl%$ttes$1uit&rehy;coloured\'!-($bowl)$rown',
+    '(&makers+#ing($rich($tins%%tella$>yclohexanoneoxalyl-dihydrazone#&ectors$$ness#%grove$&uanide#\'hampton%"ri$"ma$"nu$,op&rehy;that',
+    '\')patriarch\'$rics\'%stone&$/bus\'%caver\'(insurers\')neighbour\'&stroud\'&worker&#ing&!p&+s\'intrusion\'&-elect(\'lydeard\'&bourne',
+    '\'$halt\'(teignton(#oke\')wearmouth$!p$&wanath#\'i-pedro$%acchi$%gnani$"ly$#nus$!s$!t##ket#)marckalle',
+    '$"ol$4uth-citrate-carbomer\'#ate##ney##one%"te#&pangle$%henol%*osphonates#$quit#!s$%-nics%$slip$&ainthe$#ets',
+    '$"le$!o%%nette#+table-based$"er$5o-to-mr-kipling-cakes%!l&"fi$"ra%#ita#\'ulphite$!m##waf#\'yllabic$"nc',
+    '"\'t&mdash#(-blitter$&colour%\'ritical$(graphics$&images$$maps$#now$-of-a-poll-tax$\'packing%(layerish$&slices$%width##.if#$amin',
+    '##ch\'%$-boy&%faced&)goddesses%#dog%$iest&"ly&#ng.(!s%$kill%!u$"om#&e-back%(detector%&shaped',
+    '$$back$!l$%r-bit$(s/toilet$$well$(y-bluesy#\'h-eolas$#ell%#sis$&olders$$ynia#$lisi#\'mapped\'$#ore##ner',
+    '%#ene$#lia$$mark$!n$!t$"ws##pad##ran#*s-and-bobs%1of-old-inner-tube%-versus-chunks$&/pixel%#sec$!a$$team',
+    '%$leni$\'er-eyed\')flavoured\'%lemon(&ooking\'&orange\'(slurping(&weetly,$ness)&illing\'%vetch\'%white&#.it&"ed\'!r',
+    '&#ley\'*y-disputed)&fought)%upset&#man&&n-bird(&stance\'%esses&%world$!i%!e&!r&!s%"ly%"ng',
+    '$"re$!s##uis$*leanu/toma$*men-backed(&coated(%water\'$ised\'!s#!y#!z$"er""ud#!i#!t',
+    '#!i#"vi$&y-bags"#xle%!r#\'schoote".z\'ness\'-minded#&-speak$%zalza#&antina(!o$+rre-looking(&rather&%ities#"en',
+    '$"et#$niss%"zz#$onia$$uard#%quick#&zarres\'!i$!i%!e%"n\'$!o$!y%%-type!/j&oslash;rlykke',
+    '$\'uml;rck)(gvinsson)%nsson"%-130e"#10e"#330"!a#$llas##rne$%tveit"!c"%elica$"ke$$ovar##rke',
+    '$$nede"\'oerling%!n#\'ntegard#!r$#bye$"ck$$ling$+nebye-halle&%veien%&strand%$torp"%p-led$(national""sw',
+    '""33#"87"!b"!c"$erke"(goodrich"!m""pm"#sts"!v!6l&aring;b&aelig;rsuppe)%hvidt)&mannen-%sisen#+eacute;mont',
+    '*%riots#)ouml;ndal#\'uuml;te)$hner"$-lac"!.",/pso/3504/92"!1"\'21(de3)$+/de3(plyss)"*a&zcaron;e#"aa$"nd$!t#(bbenoids',
+    '*!s\'%mouth,!s#%chrie$%k&amp)&;white&)ndash;out&+rehy;coated+&letter+\'painted+&shirts%\'\'n\'blue\'#ing%+(bird)board%(-african',
+    '*$gold*#red*&silver*)whiteness\'"rt&%back.("ll*"ed(#sed)$hing\'&eetles(%reted\'%ibbed)"le($lled',
+    '*"er)!o\'$lood+"ed)%tched("ue\'%ooted(#und\'\'ranched(&easted\'%ullet("rn(%ttock+!n&#can',
+    '\'\'hadored(%ested(%romed\'%lawed\'6offee-and-orange-juice(&loured(#mic\'&urrant&$dark\'\'irected\'(ominated($ored\'%raped(%essed\'#yed',
+    '\'(yebrowed&$face($nged\'\'eminist\'&igured($lled(&nished\'\'letched(#ies\')riar-wynd+!s)$lled(%onted\'%ungus&\'glassed',
+    '\'#rey*&-white&#hat)#ted\'#ead*!s\'%ilted\'%umour&*influenced&$jack&-lace-becapped("nd($shed\'%eaved($nsed',
+    '(#ned($sted*!s&%mail\'*#ing((ntillaed(,scara-daubed\'%isted\'#oth(%uthed\'&ucosae(%zzled&%naped\'&yloned&(on-green',
+    '\'\'r-white\'#uts&(peppered\'(igmented\'%lumed\'%owder\'&rinted&\'quiffed&&rights(!m&&sailed(#tin\'"ea\'$heep*!t',
+    '((ouldered(&rouded\'&kirted\'$lash\'%ouled)%nding\'%pired\'%toled)#rmy(#raw)$iped(%udies\'$uede&&tarred\'*ie-dressed',
+    '\'&oothed(!p)#ped&"un&)varnished\'%ested&%water\',omen-artists&&yellow%%/blue\'%ottle\'&ritish(#own&%egged\'%thnic',
+    '\'#old\'#rey&)jetstream&%lazer&%nalgo("vy\'%orton&$poor&\'rapeman\'-ed/blue/green&#tan&)wiltshire&&yellow%!a&$ddie',
+    '&$wton%$back)"ed\'%lling\'"nd&%eaded\'$etle\'#lly\',rry-coloured+\'picking+$wild&(ird-blue&+oard-jungle+$like*+/chalkboard',
+    '*#and\'%rough&)urn-built)!1)#ian(\'y-based%$clad&%oated\'#cks\'"mb&$raig&*urrant-red%\'e-smith&*d&rehy;out\'"ge',
+    '&(r-haired\'!s&&tt-ord(!s&"ye%4face-\'n-white-gloved&#eet\'$lter&#ish)#ing&,ord/hospital(#est\'"ss%$game\'"ng',
+    '&\'uarding*"ly%%hands\'%tches&$eart&#ill&$oles\'#use\'"we%#ith%*jack-cards%$lake&&egging\'"rs\'$tter',
+    '&%iners%%mail.)%/puts)$able)+er-in-chief)\'ing/gay\')nminister\'!r(!k)"ed&)ore/horse%$need%$out.%%pitts&$oint',
+    '(!e\'*ol-belfast)%/bury&&udding%,s/jews/irish&&hawled\'%irted\'#ots&*ploitation\'+ot-infected&#tar\'#oun&#yde%:thorn/bicester/oxfordshire&#oft',
+    '%$wail\'"nd\'%rdine)!s\'\'tertown&-ell/blackwell)%iarum&&oodian%$ymor$)onsthorpe#-dder-bursting((emptying\'!y$\'e-broad&(changing',
+    '&+interchange&&length\'&ocking%\'runners%*s/climbing%!t$#ud.#&eberry$!n%\'-cwmiar%#cwm%&llyfni%%ymaes$!u#$ffer',
+    '%#jek$&brough$"er$$gard%#don%"er&!t\'!s$%iyach$#oev%!v$%roves$"ue&!t#+h-blah-blah',
+    '$!a##ich$!m$$nead$"r.%,/northampton&&shadow&)transvaal%&dardie&%ennan%%gowie%-hill-dundyvan%%lodge%$more%%shill',
+    '%3don/gloucestershire%#ers%#ois#:ke&lsqb;1900&rsqb;lq.b.426%)\'s-arrest%$-dax&$knox%+/cheltenham&&garden&\'stadium%!a%#ian%%lock.)!s&\'y/chief',
+    '&#igg%$sewn%#ton%$well%\'y/chief$#ley#+me-shedding(&ifting&$they&*worthiness%!.%$able%"d.%#ful%!r',
+    '$#in\'$#mer%#ing#!n$)&iacute;k$.c-maudit-tacul&%rouge%!.%%/chef&,restaurateur%!e%(h-making\'%white&*ard/estate*$fuel',
+    '&$down&\'e-neige(%taque\'$fort&-is&rehy;serie&*ot/factory%"ks%$pain$,den/shearing%&fordia)!s%#ina\'!e\'!g&"sh',
+    '%#man%!o&"is&!n$\'esburgh$$ford$\'iflower$(k-cheque&\'looking&(panelled&&walled%!a%-et&rehy;there\'$-bog)&rewing',
+    '*%vered($edge(&forger(&holder(\'protest($roll\'#bog\'\'y-blank%#ies&&ng-off)\'portion%$outs$.shard/accident$#ton%)yre-based',
+    '#!r$"ey$$icum%$ngly\'!s$$mhor$\'neywood#%sdale$"e+$#ket$"on$\'phemin\'$$s-ee%!.%"ii',
+    '%,-\'em-to-bits&$bays&%dried&%em-up&"in&)retaining&$wall\'#ind%!.%&buster%&ed-out&,r-compatible%(furnaces%"ic\'*-augmented',
+    '&"gn&!n\'!\'\'#gly(!s%&master%)ocephalon&$derm&$idea&%phaga%$pipe#&tchley$%herer\'$ings\'%wicke',
+    '$"ta%"el&$ring%$idae\'!s#%usten##vet%!y#$with#,x-ploitation$)poitation#$yais$+don-on-tyne$$lock#(ze-faced',
+    '$$heni$\'ing-hot$!o%#nry$$wick$!y""cc""dg"&eabeck$)ch-blonde\'\'damaged&!e\'(d-blonde+"ue*#one',
+    ')%khaki)\'looking&*ing-powder$\'doption$"gh$"hu$)k-looking%#ely$#ney$&r-eied$#sby%-dale/scotrail%#ham$#val%&es.sty',
+    '#"bs$!y#$cher#%ddick$#ing\'#ton$#rws$#yyn#%eaggh$"ch%#ker$#d\'n\'!\'%$-air%(ing-away',
+    '.!s)%stump(#_in$\'p-alert&"in$"rk$!t$#uch#$gvad#$iben&"rg&!t%!t$,chr&ouml;der\'&oeders',
+    '$+stiftgebiet#!m$)ish-prone#&ncowes$+de/calamine&%dwith&$rman%&ing-in("er&!s%%s/bl/$%kharn%.insop/director*!p%#ner',
+    '$#yth#)riot-type\'!s$"te#!s$%s-her&"oo%$ing.#\'tchedon\'!r&2ingdon/oxfordshire&)ley-built$#hed&$rin\'%"yn',
+    '$#ted##uel%#tte$*t&eacute;e#$w-up$$bery%/ury/oxfordshire$#ell$#ish%"ts"!f""gc"$iaut#)ck/course%"en',
+    '#"dn##ecq$!r%%sbach##gh-%(/swindon%\'t/chief##mp\'%&-style%%ishly%!o#(n-stoyle$"ch%"ow$&d-bake',
+    '&$cord&&filmed\'%lying&&lipped&&review&%sided\'#pot*!s\'&tamped&$worm%$/see%$burn%!e%$fish%$ings',
+    '%#nes%%spots%$worm$5k-and-you\'ll-miss-him6"it&*of-the-eye%&enberg&$red\'\'#ing%$horn%\'manship#$pper%!y$%verts#$sful',
+    '$\'s-guest&%noise%!.%!e&!s%"id%$less$$tene&&r-like\'*ingly-fast%%horpe%#ing%!s#"th%\'e-heart',
+    '&)man&ndash&$ness&&ringly*!s&$some%%field$!t$"z\'%%-torn%#ed.%-krieg-bop-pop#!z$#hee$(zard.the("ed',
+    '"(landudno#!d#?leeeaarrrgggrrllleeeooouurrgghh"\'oatedly\'$ness#-b-and-trickle%$like%&shaped&\'potting$$bing$%ettes$\'igurina$$ules#*c-building%$free',
+    '$#age$$cato$-k&rehy;buster%)-bookings\'&usters($ying&&chords\'"ut&#end&\'faulted&&houses&$line&%maker)#ing\'&ounted',
+    '\'"ut&(shifting\'#ize\'&orting\')tructured&#the)"se\'\'o-block&$vote*!r&$wide%\'/armagh&*bouldering\'&urgess-./burns/parsons',
+    '%)busters/a,#and%&cnt1()%&ed-off&%r-out%&fields%(headedly%#ier&"n\'\'"g\'(#-up(!.(+/difficulty%$like%&makers',
+    '\'$rker&"en%$neck%\'printed%+s-southeast&&/copes\'%heads&#hip%$well$"ul##ddy$!e%%uglwm$#ged&!s',
+    '$$well$!y#%edite$&mendal%\'fontain$!t#%ggert%#ins%&sville#-ke-in-the-pub\'&shness(!m%!.%!y$#hin',
+    '##met$$feld%/ield/properties#!n$-d&rehy;haired%\'-headed&&mopped&)tinselled%!.%&/rolls%$chen%(e-framed\'&rinsed&"au&"el',
+    '&"ll%#ies&"n\'%$wood$#sky#3od&mdash;containing&-rehy;curdling+(streaked,&ucking%,-and-buggery*$guts&$ball(#sed\'#ead*!s',
+    '\'*rotherhood&$cell*!s\'*holesterol\')ontacting&&dangle\'$eath("bt(%rived\'&rained(#ops&&factor(!t\'&eeders\'&lecked',
+    '($ower\'#ood\'\'renzied&#gas\'%orged\'&reased\')uiltiness(%shing&$heat\'$ouse\'#ued&5is-thicker-than-water&#kin&$lead(&ttings',
+    ')%dened\'\'ystical&\'product-!s)$tein\'#ump(&rifier&#raw\'\'eddened(&lation.$ship2!s(%venge\'#ich(#ght',
+    ')\'rifices($mple\'$erum\'%hapes("ed\'&licked)%ppery\'$mell\'#now\'%odden($pped\'&paring($iced(&latter($ongy',
+    ')\'unching(\'iffened)%rring\'\'uckling&\'tatters\'&esting\'\'hinning\'#ies($nged\'\'o-blood\'"ub\'#wig\'#ype&&wallow("rm',
+    '($ight%#.it%!/&"is&&medium\'\'osquito&7nutrient/waste-disposal%$bank&$eads&&ottler%*curdlingly%!e&#dly&!e%$fang',
+    '&"in(!s%$good%"ie%#let&\'ines.it(!g&&usting%#nok%)poisoning%$rush%)spattered\')ortswoman&$tage\'$ones',
+    '&%ucker)#led%)thirstily&#ide%%worth*)-thomason%(y-gether\'%icing\'\'looking\'(mindedly\'$well&$hell&!s$&maires%,er-curtained',
+    '\'#ies%1field/headteacher%"in\'.gdale-spending%$kolk%!m%"s.&(burgians)#ial)\'y-style&#day%!y$\'omsbury%"op$!p',
+    '%!s%!y$%tered$!w#"ps##que%$ista#%renge$#ing$!k#"ss%"er&%villa%#ius%#om\'',
+    '(\'end-rot($fall(\'scented($tree\'!.\'$time$$tein#(tchiness&\'y-faced$%ering$*ter-owning%\'ing-out)#pad#"ud$"in',
+    '\'\'ripping\'%tunic(#ype&$less&!y%#ing%#ons%!y#%verks#)w-bladder%%dries\'%ying/%&heater&$oles%$jobs',
+    ')!s%#off%$pipe)!s%%stone%\'torched+!s*#ing%$wave)!d)!s$!.%#she$$dart%$ries',
+    '$"en%"r-\'&cooled\'"no\'$vacs&!.&#vac$\'feather$%hards%$oles&"rn&$uses$%n-air&$rose$$outs',
+    '$%worth#"yd"#pes"\'r&amp;d""ts"+u&rehy;tack$)uuml;cher#!-#$bing#$cher%#ner$#ose#$ddeh&!n%!y',
+    '$)sheadinge$!y#,e&rehy;black*&collar*&prints$)\'n\'yellow$*-and-brown)%cream)$gold*$reen,!y)#red&&proned&\'sbestos%$back',
+    '\'$rred&&ellied\'#ret&*lack-green*!s\')oodedness*!s\'%ushed&%ottle+!s\'#und&$rown\'%uised%&capped\'&rpeted',
+    '($quer\'#ina("ps&%lawed&(oncreted\'%vered%$dark\'$shed&(istanced%"ey%$face&#ilm(%tered\'!n(%gered',
+    '&%ooted&%ramed\'%onted%&glazed&#old&$rass\'#eys%&haired&%eaded\'$lmet&&orizon%$iced&"ng%$jack)$eted',
+    ')!s%$knit%&lensed&"it%\'mascara($sing\'#uve&&ottled\'#vie%$ness&#ose)!d%(on-white\'"ly%)pencilled',
+    '+"ic&%igeon\'"nk&%rints&%urple%*red-chrome($dish\'/sin-impregnated&%ibbed)$oned,"rs\'!m(#med\'"ng("se',
+    '\'"ck&%umped%,satin-coated&\'hadowed\'\'uttered&&kirted&&mocked&%ocked\'"da&&parked&(tockings("ne\'&reaked&$weet%$tack',
+    '\'&ttooed&\'hroated&#its&!o\'#ned($gued%&velvet%&walled\'$shed&+hite-yellow&#ing&#orm&&rapped$\'/black/\'"ue',
+    '%$ecru&(verybody%$gold%&orange%#red%#tan&/urquoise/yellow%&violet%&white/+(red/grey$(and-grey$$bags%%eard.&%llies&(rry-grey',
+    '%&onnets$$caps%#hip(*enterprise%%ollar$&fields&"sh%$lies&!y$$gill%)rass/rock$(ish-grey(%white$$jean(!s',
+    '$#maq$-print-drawing)"ed$%rings%!y$1s-band-gone-wrong\'%iased&4clash-u2-alternative\'#ore&&lovers&*orientated&&player&$rock&\'spooked\'$tyle',
+    '%%/come()untry/tin&%eddie&$soul%%berry%&chists&$ribe(#pt.%"er%$hift\'#rts%(meisters%%ology%%power%(y-crunch',
+    '$$tack%%hroat$\'y-black&&greens)!y%"er#%ffin\'%"ly##gga%!y#"hm%(/gutsche##idy$"ng$(sh-black',
+    '\'%misty\'&purple\'&yellow#$kold#\'menbach*"ii&*thal/troop*!s$#ier%"ne$"ka$%leins%%isalp$#son#(ndellian',
+    '&)n/teenage&&r-buss\'$.the\'&busses\'(ing.down\'%stone\'"um&&villes%#les%,red/managing%"un$#ged&!r$#ham$(kett/lab',
+    '\'&utting&%faced\'\'eatured\'\'ingered&\'looking&(speaking&&tipped%%isham#!p#"r.$"b.%"ed%#ing$"ps$!r',
+    '\'"ly%$iest$)ton-jones#(sh-brink&&making&$pink*$ened&&veined&%white%!i&"n\'%&lessly%!y$\'terings%"on',
+    '$#eau$!h$&srecht#$ured"!w#"ch"!x##-80"%yddyn$!e#"ed#$ford##nde$!e#,th/challenge',
+    '%,e-huntingdon&$/aeu\'#fry%"in%#man$(on-style&$isms!%m-600#%tests"".4"\'/2.3.89"!8"&a-bupa#$/air#!c',
+    '"#c-4$\'british#!c#"np"!d##p3v"*g/eurodisc$#rac"*i/thriller#%:wt/h"!n#(frsmxzwy#"lf"+p-2-treated%!.',
+    '",s/mothercare#!2"*w-3-series$$like$\'mclaren#-/jaguar/lexus$#r-r!)n&rehy;2a"+-affiliated"%/sncf""15#!6#!7"!2#!1',
+    '#!7"!9"%a/pbf#!f#"id"*c/10base-t#!s"#een")fl-backed$!."#its"!j";klfmnsgbeopagvsbhkfmnxbvsjh"*l-rafidain"\'p-style',
+    '""sa!+o&egrave;ce#,gt;singapore#(ouml;tes#+rcaron;ivoj#2scaron;kovi&cacute#(zcaron;o$%dot;e"%\'suns"(*****ing"!-##lei$#inn#/o-o-oo-oo-oring"!.',
+    '")/covenant"$a(1)#,-constrictor#!b#"co#$ding$!u$!y#)g-thomson#)it/county&/gloucestershire#"ks##ler#!m$3-stewart/commission',
+    '$%erges#)r\'s-tooth$\'-driven%$mate$/d&mdash;looking&-ndash;mounted%!\'%#(s)%*-and-label+&odging&(changing&)dominated&\'general&$like("st',
+    '\'&eeting\'&ounted&&school\'"et\'$tiff\'#wap*#out&$walk\'#ith%".e%!/&%chalk&\'eastern&\'f&amp;s\'"or',
+    '&&magnet&%panel(&rtners%&ed-off)#ver&!n&(r-collie%.ing&rehy;house(%-card)1school&mdash;only(%house(!s%$like%%maker\'(n/oxford',
+    '&#ill%&s/list+\'servers&&ailors&%horts&%lides%)walk_away)#ers&#ork%!y$%hound%#unt$#man$&s/even#$sson',
+    '%#ers%#in\'#"t-%#car(!s&$leat&(ompanion&*utting-out%$deck%(handling&$ooks\'$uses%&necked%%races&&elated',
+    '%$trip)!s$#.as%"he$&/coach%"in$%crews$$deck$$ered%!s$(handling$#in\'&&g-lake$$less%#ift',
+    '$%owner)!s$&shaped&#ows%+wain-second$#tie$%woman&$rthy$$year".b&rehy;sleighs#(\'s-worth#&-a-job$&length$$ness$$tail',
+    '%"ig\'!s#\'/bobbie#&adilla(!o$!k$"th#+bies:wirral%\'n-maker&#gly\'!s$&le-hat&#hat&(sbon-bon%%iness',
+    '$)y-beaters*#ing&&soxers%%soxer#$cats#%ekreo$"rt#$gans#!i#$ling\'"en#$ness#*o-diolassu$$l\'or%#ink',
+    '%!i#/reshov/kalesnik$&inskoy#(sledders&&ighing$$mill$!y#%tail.\'!s##zao$#ien")c-special##als$#rdo%!t',
+    '$!y%\'&aacute#"ba#&caccvo&"io%\'difalco%#lon(!e(!s$!e%$rini$$onia#&hanski$"co$"ur',
+    '$$llus#%kelie$,man/adelaide$$nang$"os$#ris$$side%&trasse$%wurst#)m-silcock#$odon\'#ism$$nnoc$"um##ton',
+    '"*d&eacute;n#$achs$#nis$"rt$#tii$!y#,daertcentres$\'enwelsh$#ien%)ngton/poa#\'e-medau$!k$!l%!e$(n/cystic',
+    '&$head&\'nursing%%recht$#wig#&ffordd#%ge-up%$d-up%"ry$!y#&h-gaya$"am$$gaya$!i%\'sattvas$*r&aacute;n',
+    '%#ans$\'vriksha#\'ianskii$#ced%/ote/oxfordshire$*es&mdash;a-(congress&!/\'\'parents$(lessness$%meade$)n/swindon%!g%!i&"ck',
+    '%!s$$pala#"le%"an$%ondeb%#vic##nar%"th#%oland##pod#$rato$&hyddan$#um*&&/bitez$!y',
+    '#%ville#0y&rehy;snatchers$#\'s.$)-and-head))mind-sets)&psyche&"rt&.s-it-is-for-me&(wareness%$bank\'(rgaining&%eings&$lows&%races&&uddies',
+    '%&centre&$heck(%mical&$lock&)oncealing(\'fidence(&scious(%tours\'$unts&&rushed%&eating%*flattering\'#uid&#orm%%glove',
+    '*!s%$hair\'%rness%\'in-lake(\'the-jag,2midst-of-the-world%&juices%#kit%$lead\'$vels&%otion%$mark&#ind&\'ovement%\'packing',
+    '\'&easure&&olitic\'!p%)rebelling\'&laxing&"ub%(scanners\'#ent\'\'ulpture&%earch+"ed,!s&\'hopping&\'mashing\'#ell',
+    '\'$irit&&tarved\'(retching(&ucture&#urf)"ed&$waps\'#ing%#the\'$rust+!s%#was($hing$%/arms%\'encoded',
+    '&$urts%$legs$\'boarder$*centreline%$heck%%olour&#unt$%gruve%\'uarding$$hair&$mmer$#ing\'&-forth$%maker)!s',
+    '%$lans%&opping$\'related%$ites$\'scanner%&ervant%&hapers&#ops%#kin%%tyles%$uits&%rfing$$tone$\'warmers(#ing',
+    '#&decker#$hmer\'--christiansen%)ischbroda#(khandels#)lcsfoeldy##mia$\'melburg$#ond#"no#$pple#(r-estaat%#ing$!e%!n',
+    '$$icke%$nger$#ner#!s$$chen$#man#"ti%!e$"on$$tger%!o$#zel#"wl#$zing"!f',
+    '#!f$!a$"ed%!s$#in\'&&-house&!g#+ors-related&!.#"ty"(g-cotton$$down$&garden$%holes$$land',
+    '$%mouse%%yrtle$#off$&ridden%#ush$+snorkelling$(trotters$$wood#(/ruffian#$acki$$erde$&kovsky$%loosa$&nclogh(#ugh',
+    '$"rd%&tishly&!s$#ski$"zi#$bean$$rush##dal%#ner&&kevich&&ovites("ka(,skaya-gienef$"en#%eared',
+    '$!s$&y-free&%horse&#men%%woman#/g/ex-apprentice$"as$\'ed-down%*r-flinging&#agh&&burger&\'thwaite$$iano%!e%"ns',
+    '%!s$&le-bos%!y$!o#+hazk&ouml;y$#ead&!p$#ill$#ole$"te&!n#"ic%$evic$%e-man\'&ounted',
+    '##ler$%iasco%"ns##men##ner$(oriensis#"od$$mila$"ng$%rodsk#&uinard$)s-italian%#lav\'$wski&!y',
+    '%&tching$&histle#"ye$#man%"en"/h&eacute;mienne#$aine$"na%#nen#$emer%-ian-flavoured&$enne%#ond%"us$&rgloss',
+    '$$nens%#jka##lin&!g#(m-duchen%\'ermolli$!e##nen#"or$!s##ras"0ias-fr&iacute;as##din$!s#&eldieu',
+    '$"ng#"ko#)l-covered%&in-the\'&fested%&necked%&pitted%&washed$!.$!d$&ed-eye\'"up&!s%\'r-check\'%house',
+    '*#ing\'%rooms\'&stoker&\'plating&$suit$(ie-belly\'$type%&ng-hot#"ma#$ntia$%ville##ota&#rch%(ian-type#"re',
+    '$+-les-pargny$$dale%%effre$$elle$.h&eacute;visme$$joly$&massif%#ond$"ot$%seson%%onade\'!s%!y$#tel%$rous',
+    '$!o$%umelo"#jan$!s#$emoi#$nice#$olly##tar#$utsu"%k-bok#!a$!m$"ra%!o#%elers',
+    '#\'hariots&!y#&infold%!i#(m&ouml;l#"or$!v#$pyin#$reta#\'skogens##ulo$!m$!n#$wete#&yngham',
+    '."es#"ab$"ji$"ng#$beck$(itiaceae#"ca$\'hevisme%#ini#&d-face)!d%$type$#boy$"ed%"re',
+    '&$wood$%faced\'#ing$%heart$#ing$*ly-brushed\')conceived\'&marked\')patterned$$mere$$rini%"on#$emia$#ros$%skine',
+    '$*t&iacute;n%%aceae%!e$$vill$!x##ham##ian$!c$"er$\'khamsai$$nder(!s%"us$-vari&aacute;n("st',
+    '%$ogui#&konsky#+l&egrave;ne$!a%!n%)rd-making($type\'"ed$#ers%%ttino%!x$!i%"er%$hope%\'ngbroke',
+    '\'!s&!i%!t&!o%!x$$obas%#ck\'\'%-less((tingling\'$ings\'$less\'"s.(#_at$%worms$$yeld',
+    '$$gna.\'!s&!e&#ini$$isms$$nian$#ria$&tnikov%%owsky$"us#!s$"en&!a$+hevik-style(&sation',
+    ')#tic*!s(&zation)"ed*"rs%!i&%eness%-o-bonapartism&!y$#ius$!o%!.%-ver/buccaneer$$tadr%)er-shaped',
+    '%\'cutters%$guns%$like%%on-on 3c.1945&ndash;c.1962',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_87 = (
+count_87 = 6694
+
+heads_87 = (
     'assab-addis',
-    'assad-hussein',
-    'assadabad',
-    'assadi',
-    'assadullah',
-    'assaf',
-    'assafaniya',
-    'assaglawi',
-    'assailant(s)',
-    'assailer',
-    'assal',
-    'assamblee',
-    'assap',
-    'assaroe',
-    'assasination',
-    'assass.',
     'assassin.',
-    'assassin/thriller',
-    'assassinates',
-    'assassination/could',
-    'assassinizing',
-    'assault&pound;290',
-    'assaulters',
-    'assaye',
-    'assayed.',
-    'assc',
-    'asscarts',
-    'asscher',
-    'asscn',
-    'assed',
-    'assegai&rehy;wielding',
-    'asseman',
     'assemb',
-    'assembl&eacute',
-    'assemblagist',
-    'assemble-time',
-    'assembled\'',
-    'assembled.',
-    'assembler/disassembler',
-    'assembly*',
-    'assembly-decisions',
-    'assembly-hall',
-    'assembly-language',
-    'assembly-only',
-    'assembly-robots',
-    'assembly-see',
-    'assembly-to-assembly',
-    'assembly.',
     'assembly/s',
-    'assemblylign',
-    'assemblywoman',
-    'assemby',
-    'assenovgrad',
-    'assente',
-    'assertibility',
-    'assertion-training',
-    'assertive-in-spite-of-herself',
-    'assertive.',
-    'assesing',
-    'assesment',
-    'assess&mdash;info/',
-    'assess.further',
-    'assessability',
-    'assessed.',
     'assessedor',
-    'assessionable',
-    'assessme',
-    'assessment-based',
-    'assessment-led',
-    'assessment/administrative',
-    'assessment/assistance/care',
-    'assessmented',
-    'assessor.',
-    'assessorato',
-    'assessore',
-    'asset-backing',
-    'asset-manipulation',
-    'asset-seller',
-    'asset-specific',
-    'asset-turnover',
     'asset-values',
-    'asset-wise',
-    'asset.',
-    'asset/liabilities',
-    'assets&mdash;though',
-    'assetto',
-    'assetts',
-    'asseverated',
-    'asseverations',
-    'asseyake',
-    'assface',
-    'assiatnt',
-    'assicurazioni',
-    'assid',
-    'assign-data-file(pmmlib.gimmspoly1',
-    'assign-data-file(pmmlib.gimmspolydat',
     'assign-output-file(pmmlib.gimmspoly',
-    'assign-output-file(pmmlib.gimmspolydat',
-    'assign-output-file(pmmlib.gimmspolyl',
-    'assigned-term',
-    'assignee-endorsee',
-    'assigner',
-    'assignment(s)',
-    'assignments.',
-    'assignments_as',
-    'assignors',
-    'assilek',
-    'assimilation-adaptation',
-    'assimilationists',
-    'assir',
-    'assirati',
-    'assiros',
     'assise',
-    'assises',
-    'assisi.',
-    'assisstance',
-    'assist-control',
-    'assistance\'',
-    'assistance-',
-    'assistance-even',
-    'assistance-for',
-    'assistances',
-    'assistant(s)',
-    'assistant-coach',
-    'assistant-secretary',
-    'assistant-secretary-general',
-    'assistant-ship',
-    'assistant/bank',
     'assistant/checkout',
-    'assistant/mistress',
-    'assistants.',
-    'assistants/non-teaching',
-    'assistants/trainee',
-    'assistantships',
-    'assisted.by',
-    'assistencia',
-    'assister',
-    'assistive',
-    'assitalia',
-    'assition',
-    'assman',
-    'assmann',
-    'assn.',
-    'assoc&gt',
     'assoc\'n',
-    'assoc(6.1)',
-    'assoc.',
-    'assocacion',
-    'assocaited',
-    'associ&eacute;s',
-    'associa',
-    'associa&ccedil&atilde;oes',
-    'associa&rehy;tions',
-    'associaci&oacute;n',
-    'associacion',
-    'associated&rehy;rediffusion',
-    'associatedly',
-    'associatesappear',
-    'association-approved',
-    'association-centres',
     'association-colorado',
-    'association.25',
-    'association.a',
-    'association.tony',
-    'association/a',
-    'association/football',
-    'association/hodder',
-    'association/staff',
-    'association/t',
-    'association/trade',
-    'associationalist',
-    'associationhas',
-    'associationhave',
-    'associationist-representational',
-    'associations.7',
-    'associations.ps',
     'associations/councils',
-    'assocs.',
-    'assoiated',
-    'assoli',
-    'assolutas',
-    'assolve',
-    'assonantic',
-    'assort',
-    'assosciation',
-    'assouad',
-    'assoumani',
-    'assoyled',
-    'assp',
-    'asssembly',
-    'asssessed',
-    'asssessment',
     'asssitant',
-    'asssociated',
-    'asssociation',
-    'asssured',
-    'asst.sec.',
-    'asston-underlyne',
-    'asstones',
-    'assualt',
-    'assualting',
-    'assualts',
-    'assuied',
-    'assults',
-    'assum',
-    'assume-surely',
-    'assumedly',
-    'assumer',
     'assumes.',
-    'assump',
-    'assumption.',
-    'assumptions.',
-    'assumptions/aspirations',
-    'assumptions/expectations',
-    'assuntos',
-    'assur&eacute;e',
-    'assur&rehy;ance',
-    'assurance-owned',
-    'assurance/insurance',
-    'assurancethe',
-    'assurantie',
-    'assurbanipal',
-    'assured-of',
-    'assuringly',
     'assurnasirpal',
-    'assurors',
-    'asswiper',
-    'assyntian',
-    'assyut',
-    'astafieva',
-    'astaire-ing',
-    'astaire-like',
-    'astaire/rogers',
-    'astakakalij',
-    'astano',
-    'astapovo',
-    'astar',
-    'astarac',
-    'astareus',
-    'astberg',
     'astedt',
-    'astelen',
-    'astemizole',
-    'astengo',
-    'astere',
-    'asteri',
-    'asterion',
-    'asterisk*',
-    'asterium',
-    'asterley',
-    'asteroid-belt',
-    'asteroidal',
-    'asteroidal-sized',
-    'asteronychidae',
-    'asterope',
-    'asteroschematidae',
     'asterousi',
-    'asth',
-    'asthenia',
-    'asthma-like',
-    'asthma-related',
-    'asthmat',
-    'asthmatic-like',
-    'astills',
-    'astler-coller',
-    'astley-jones',
-    'astley/ram',
-    'astmoor',
-    'astn',
-    'astogeny',
-    'astohall',
-    'astolphe',
     'aston&rehy;ishment',
-    'aston-le-wall',
-    'aston-on-ribble',
-    'aston-under-lyme',
-    'aston/health',
-    'aston/trader',
-    'astonian',
-    'astonished-looking',
-    'astonished.',
-    'astonishments',
-    'astophus',
-    'astorga',
-    'astoria.',
-    'astorias',
-    'astoundedly',
-    'astra/opel',
     'astrac',
-    'astrachan',
-    'astraddle',
-    'astrahan',
-    'astrain',
-    'astrakan',
-    'astral-travelling',
-    'astralasia',
-    'astrarium',
-    'astrasoi',
-    'astrategy',
-    'astrauskas',
-    'astray.',
-    'astre',
-    'astrel',
-    'astribut',
     'astrid/simon/anyone',
-    'astrin',
-    'astringent-soaked',
-    'astrite',
-    'astro\'s',
-    'astro-1',
-    'astro-navigational',
-    'astro-physicists',
-    'astro-tarot',
-    'astroarena',
-    'astrobelt',
-    'astrochemist',
-    'astrochimp',
-    'astrocytosis',
-    'astroglial',
-    'astrol&rehy;ogy',
     'astrolabes',
-    'astrologie',
-    'astrologies',
-    'astrologis',
-    'astrologists',
-    'astrology-prone',
-    'astromancy',
-    'astromantic',
-    'astrometric',
-    'astrometry',
-    'astronaut-speak',
-    'astronautical',
-    'astronesthes',
-    'astronomer-priest',
-    'astronomical-meteorological',
-    'astronomican',
     'astronomique',
-    'astronomiques',
-    'astronomy.',
-    'astronose',
-    'astropalace',
-    'astropecten',
-    'astrophys',
-    'astrophysically',
-    'astropsychology',
-    'astros',
-    'astrov',
-    'astrovirus',
-    'astucci',
-    'astudent',
-    'asturci',
-    'asturia',
     'asturica',
-    'asturiensis',
-    'astutely-applied',
-    'astutes',
-    'astwick',
-    'astylar',
-    'astyranax',
-    'asue',
-    'asukari',
-    'asulam',
-    'asuras',
-    'asus4-am',
-    'asvall',
-    'asw&acirc;n',
-    'asw17',
-    'aswa-medha',
     'aswan&ndash;cairo',
-    'aswan-',
-    'aswan-just',
-    'aswaying',
-    'aswim',
-    'aswiss',
-    'asworth',
-    'asylumapplication',
-    'asymetrically',
-    'asymetrix',
-    'asymetry',
-    'asymptomatically',
-    'asymptotically\'',
-    'asynch',
-    'asyndeton',
-    'asyntactic',
     'asyrian',
-    'at&acirc',
-    'at&amp;t-brand',
-    'at&amp;t-funded',
-    'at&amp;t-hewlett',
-    'at&amp;t-inherited',
-    'at&amp;t-owned',
-    'at&amp;t/usl',
-    'at&dollar;t',
-    'at&imacr;moi',
-    'at&ndash;16',
-    'at&ndash;6/bt&ndash;13',
-    'at&ndash;6s',
-    'at&ocirc;mes',
-    'at&pound;175',
-    'at&rehy;this',
     'at\'',
-    'at-\'im',
-    'at-404',
-    'at-a',
-    'at-alike',
-    'at-all-times',
-    'at-at',
-    'at-bats',
-    'at-bus',
-    'at-class',
-    'at-dealing',
-    'at-eileen',
-    'at-first-glance',
-    'at-grade',
-    'at-homeness',
-    'at-khalil',
     'at-odds',
-    'at-one',
-    'at-ouja',
-    'at-rest',
-    'at-seat',
-    'at-series',
-    'at-seven',
-    'at-shara',
-    'at-that',
-    'at-the-double',
-    'at-uni-',
-    'at-university',
-    'at.a',
-    'at.her',
-    'at/eisa',
-    'at/glasgow',
     'at/inverclyde',
-    'at/trial',
-    'at10',
-    'at13',
-    'at27/129',
-    'at3/1',
-    'at_,_at_er_best',
-    'at_at_all',
-    'at_at_first',
-    'at_er_er_first',
-    'at_er_erm_all',
-    'at_erm_er_most',
-    'at_long_length',
-    'at_more',
-    'at_of_at_least',
-    'at_random.',
     'ata-ur-rehman',
-    'ataatga',
-    'ataawhai',
-    'ataba',
-    'ataban',
-    'atabrin',
-    'atacey',
-    'ataensic',
-    'atafu',
-    'atagia',
-    'atagonists',
-    'ataia',
-    'atalan',
-    'atalantic',
-    'atalantis',
-    'atalaya',
     'atalayas',
-    'ataleh',
-    'atalia',
-    'atamans',
-    'atame',
-    'atamnarkovic',
-    'atamont',
-    'atanasovski',
-    'atapattu',
-    'atar',
-    'ataraoti',
-    'ataraxy',
-    'ataret',
-    'ataris',
-    'atatched',
-    'atatgcatat',
     'ataud',
-    'ataul',
-    'ataullah',
-    'atavan',
-    'atavistically',
-    'ataxgcyata',
-    'ataxgcytat',
-    'atb-60',
-    'atc&rehy;659',
-    'atc-3\'',
-    'atc.398',
-    'atc.404',
-    'atcde',
-    'atcgatggagaaggaggt',
-    'atchalov',
-    'atchee',
     'atcherleys',
-    'atd',
-    'atdabanian',
-    'ate/attacked',
-    'atebrin',
-    'atel',
-    'atem',
-    'atemberaubend',
-    'atemporality',
-    'atempts',
-    'atending',
-    'atengdem',
-    'atenism',
-    'atensin',
-    'atepo',
-    'ater',
     'ateriography',
-    'aternoon',
-    'atest',
-    'atf3-6-2c',
-    'atfi',
-    'atfield',
-    'atgofion',
-    'atgor',
-    'ath&eacute;n&eacute;e',
-    'ath.pol.',
-    'athanasia',
-    'athanasios',
-    'athanatos',
-    'athe',
-    'atheama',
-    'atheist/',
     'athel-loren',
-    'athelas',
-    'atheldene',
-    'athelings',
-    'athelred',
-    'athelwald',
-    'athelwold',
-    'athema',
-    'athemsocial',
-    'athen.',
-    'athena-plaque',
-    'athena/claude',
-    'athenagoras',
-    'athenamuse',
-    'athene/open',
-    'athenes',
     'atheni',
-    'athenia.',
-    'athenian(s)',
-    'athenian-led',
-    'athenian-style',
-    'athenian-supported',
-    'athenian-type',
-    'athenor',
-    'athenry-tuam',
-    'athenry-tuam-claremorris',
-    'athens-centred',
-    'atherectomy',
-    'atherlay',
-    'atherley',
-    'atheroesclerosis',
-    'athersmith',
     'atherton/england',
-    'atherton/lancashire',
-    'athesians',
-    'athesists',
-    'athinio',
-    'athis-mons',
-    'athlan',
-    'athlete-like',
-    'athlete-statue',
-    'athlete.',
-    'athletic-o',
-    'athletic.but',
-    'athletically-built',
-    'athleticism--disseminated',
-    'athletics-cross',
-    'athletics-oriented',
     'athlyne',
-    'atholle',
-    'athony',
-    'athorpe',
-    'athough',
-    'athoyd',
-    'athritis',
-    'athritus',
-    'athro',
-    'athro-gryposis',
-    'athukorale',
-    'athwal',
-    'athyrium',
-    'athyrus',
-    'atians',
-    'atibu',
     'atients',
-    'atik',
-    'atikpo',
-    'atim',
-    'atinder',
-    'atingle',
-    'ations',
-    'atip',
-    'atiqur',
-    'atishoo',
-    'atitlan',
-    'atker',
-    'atkins-style',
-    'atkins/british',
-    'atkins/elgar',
-    'atkinson-willes',
     'atkinson/american',
-    'atkinson/bereaved',
-    'atkinson/british',
-    'atkinson/diocesan',
-    'atkinson/neighbour',
-    'atkinson/patient',
-    'atkinson/science',
-    'atkinson/villa',
-    'atko',
-    'atkynson',
-    'atl&aacute;ntico',
-    'atl&aacute;ntida',
-    'atl&acirc;ntico',
-    'atla',
-    'atlacail',
-    'atlam',
     'atlan&rehy;tic',
-    'atland',
-    'atlanta-',
-    'atlantes',
-    'atlantic-and',
-    'atlantic-coloured',
-    'atlantic=bred',
-    'atlantici',
-    'atlantico',
-    'atlanticus',
-    'atlantik-br&uuml;cke',
-    'atlas/encyclopedia',
-    'atlascraft',
-    'atlases.',
-    'atlaspheres',
-    'atleast',
     'atli',
-    'atlin',
-    'atman',
-    'atmel',
-    'atmoda-atpute',
-    'atmopheric',
-    'atmordarminto',
-    'atmosfear',
-    'atmospgere',
-    'atmosphere&mdash;at',
-    'atmosphere-burn',
-    'atmosphere-hydrosphere',
-    'atmosphere-ocean',
-    'atmosphere/decor',
-    'atmosphere/ocean',
-    'atmosphere/surface',
     'atmosphere_as',
-    'atmosphere_rather',
-    'atmospheric-electric',
-    'atmostphere',
-    'atn-based',
-    'atnacealgach',
-    'atoes',
-    'atoguin',
-    'atom-age',
-    'atom-bombardment',
-    'atom-bomber',
-    'atom-clouds',
-    'atom-fired',
-    'atom-powered',
-    'atom-radical',
-    'atom-smashing',
     'atom.',
-    'atoma',
-    'atomi',
-    'atomic-bombed',
-    'atomic-charges',
-    'atomic-force',
-    'atomic-scale',
-    'atomic-sized',
-    'atomic/molecular',
-    'atomistical',
-    'atomium',
-    'atomize',
-    'atomizes',
-    'atomizing',
-    'atoms-to-ecologies',
-    'atoms-to-planet',
     'atoms-to-societies',
-    'aton-in-pickering',
-    'atonement/ransom',
-    'atones',
-    'atonia',
-    'atora',
-    'atouma',
-    'atouts',
-    'atp&ndash;p',
-    'atp-ase',
-    'atp/ibm',
-    'atpl',
-    'atplas',
-    'atq',
-    'atr&aacute;s',
-    'atrabilious',
     'atractocerus',
-    'atrapaldo.',
-    'atraumatic',
-    'atre',
-    'atremble',
-    'atresias',
-    'atribute',
-    'atricapillus',
-    'atriceps',
-    'atrickle',
-    'atridae',
-    'atriumed',
-    'atrix',
-    'atro&rehy;cious',
-    'atrociously-rhymed',
-    'atrocity-producing',
     'atropa',
-    'atrophying',
-    'atropia',
-    'atrosanguineum',
-    'atrotskyist',
-    'atrox',
-    'atrs',
-    'atrtack',
-    'atrypa',
-    'atrypid',
-    'atsabe',
-    'atsaoir',
-    'atsic',
-    'atsina',
-    'atsipeeten',
-    'atss',
     'atstrangeways',
-    'atsumi',
-    'atsuo',
-    'atsushi',
-    'atsuta',
-    'att.gen.',
-    'atta-vadins',
-    'attaboy.',
-    'attache&eacute',
-    'attached.',
-    'attachee',
-    'attachment&mdash',
-    'attachment\'',
-    'attack\'',
-    'attack-and-run',
-    'attack-oriented',
     'attack/dive',
-    'attack/reconnaissance',
-    'attacking.',
-    'attacts',
-    'attainability',
-    'attainance',
-    'attained-by-whatever-means',
-    'attained.',
-    'attainment-',
-    'attaint',
-    'attal',
-    'attala',
-    'attalids',
-    'attallah',
-    'attalos',
-    'attamyces',
     'attanasio',
-    'attanayake',
-    'attap',
-    'attard',
-    'attars',
-    'attaturk',
-    'attax\'',
-    'attax/cf-200',
-    'attcker',
-    'attearne',
-    'attempt-see',
-    'attempt/try',
-    'attempteth',
-    'attempts.',
-    'attemting',
-    'atten-',
     'attenborough/naturalist',
-    'attenborough/president',
-    'attenboroughs',
-    'attenburg',
-    'attenburrow',
-    'attendad',
-    'attendance-lists',
-    'attendance-pattern',
-    'attendance-student-name',
-    'attendance/viewing',
-    'attended/would',
-    'attendee',
-    'attendimes',
-    'attendin\'',
-    'attenshun',
-    'attent',
     'attente',
-    'attentioin',
-    'attention&rehy;getting',
-    'attention&rehy;seeking',
-    'attention-attracting',
-    'attention-diverting',
-    'attention-drawing',
-    'attention-fixer',
-    'attention-focusing',
-    'attention-getters',
-    'attention-grabbers',
-    'attention-held',
-    'attention-like',
-    'attention-seekers',
-    'attention.2',
-    'attention_in',
     'attentionall',
-    'attentione',
-    'attentiste',
-    'attenuata',
-    'attenzione',
-    'attepting',
-    'atterwards',
-    'attest/fiscal',
-    'attestations',
-    'attestato',
-    'attewell',
-    'atteyneing',
-    'attf',
-    'attgtacatcagagaaccc',
-    'attia',
-    'attibuting',
     'attic\'-style',
-    'attic-full',
-    'attic-room',
-    'attica-wide',
-    'atticum',
-    'attiero',
-    'attikismos',
-    'attile',
-    'attilia',
-    'attitb',
-    'attitide',
-    'attitiude',
-    'attitude&rehy;formation',
-    'attitude(s)',
-    'attitude-holders',
-    'attitude-scaling',
     'attitude-training',
-    'attitude/belief',
-    'attitude/tiredness/attitude',
-    'attitudemay',
-    'attitudes-deeply',
-    'attitudes.24',
-    'attitudes/policies',
-    'attitudessupported',
-    'attitudinising',
-    'attitudinous',
-    'attitudual',
-    'attitued',
-    'attitute',
-    'attiude',
-    'attivs',
-    'attiyah',
     'attlee-brook',
-    'attlee/',
-    'attlington',
-    'attneave',
-    'attone',
-    'attorney&rehy;general',
-    'attorney(s)',
-    'attorney-client',
-    'attorney-general.',
-    'attorney-generally',
-    'attorneygeneral',
-    'attorneyship',
-    'attornment',
-    'attoskirt',
-    'attoskirts',
-    'attrac',
     'attract/repel',
-    'attraction-merchants',
-    'attraction-repulsion',
-    'attraction-style',
-    'attraction.',
-    'attractions.',
-    'attractions.and',
-    'attractive&rehy;ness',
-    'attractive-to',
-    'attractive/',
-    'attractive/better',
-    'attractive_inasmuch',
-    'attractively-grained',
-    'attractively-shaped',
-    'attraits',
-    'attranto',
     'attrapez',
-    'attreed',
-    'attribtable',
-    'attribu&eacute',
-    'attributability',
-    'attributes.',
-    'attributively',
-    'attrill',
-    'attrited',
-    'attrocities',
-    'attrot',
-    'attta',
-    'atttacker',
-    'atttgcgcgggaat',
-    'attu',
-    'attunements',
     'attunes',
-    'attuning',
-    'atty',
-    'atucehene',
-    'atucha',
-    'atumba',
-    'atuned',
-    'atuz',
-    'atwest',
-    'atwick',
-    'atwill',
-    'atwo-hour',
-    'aty',
-    'atyiah',
-    'atykinson',
-    'atyp',
     'atypic',
-    'atypicality',
-    'atypidae',
-    'atyrausk',
-    'atys',
-    'atytended',
-    'atzinger',
-    'au&ndash;den',
-    'au-ag&rehy;te',
-    'au-as-sb',
-    'au-austria',
-    'au-vents',
-    'aua',
-    'aually',
-    'auao=',
-    'auaralion',
     'aubakirov',
-    'aubaro',
-    'aubdubon',
-    'aubenas',
-    'auberee',
-    'aubergines.',
-    'auberoche',
-    'auberrow',
-    'aubertin',
-    'aubeterre-sur-dronne',
-    'aubeterre.',
-    'aubevoye',
-    'aubignan',
-    'aubjects',
-    'aubois',
-    'aubonne',
     'aubreys',
-    'aubrietia',
-    'aubron',
-    'aubuisi&egrave;res',
-    'auburn-tinted',
-    'aubussons',
-    'auca',
-    'aucayacu',
-    'aucbe',
-    'auchacharlich',
-    'auchan',
-    'aucharn',
-    'auchenbegg',
-    'auchencairn',
-    'auchendarroch',
-    'auchendinny',
     'auchenipterichthys',
-    'auchenorrhynchan',
-    'auchentipple',
-    'aucher',
-    'auchin',
-    'auchinbrecke',
-    'auchincloich',
-    'auchincruive',
-    'auchingramont',
-    'auchintoul',
-    'auchinweet',
-    'auchlee',
-    'auchlochan',
-    'auchnasheen',
-    'auchterlonie',
-    'auchterlonies',
     'auchtertyre',
-    'auckland-bound',
-    'auckland-bred',
-    'auckward',
-    'auclair',
-    'auction\'',
-    'auction-block',
-    'auction-goer',
-    'auctionable',
-    'auctioned-off',
-    'auctioneer/sotheby',
-    'auctor',
-    'auctoritees',
-    'auctorytye',
-    'aucubas',
-    'aucune',
     'aud-ience',
-    'audaces',
-    'audaciousness',
-    'audane',
-    'audap',
-    'audas',
-    'audbury',
-    'auden-spender-isherwood',
-    'audencia',
-    'audenesque',
-    'audessus',
-    'audi-volkswagen',
-    'audi/',
-    'audi/vw',
-    'audial',
-    'audias',
     'audienca',
-    'audience(s)',
-    'audience-conscious',
-    'audience-friendly',
-    'audience-love',
-    'audience-orientated',
-    'audience-participation',
-    'audience-researched',
-    'audience/band',
-    'audience/church',
-    'audience/performer',
-    'audience/readership',
-    'audiences/voters',
-    'audienceship',
-    'audin',
-    'audio-',
     'audio-aids',
-    'audio-animatronic',
-    'audio-based',
-    'audio-cassettes',
-    'audio-cued',
-    'audio-discs',
-    'audio-generator',
-    'audio-nightmares',
-    'audio-programmes',
-    'audio-signals',
-    'audio-taped',
-    'audio-technica',
-    'audio-technology',
-    'audio-typewriting',
-    'audio-typist',
-    'audio-visual-aids',
     'audio-visual-tactile',
-    'audio-visualists',
-    'audio/joystick',
-    'audio/oral',
-    'audio/video',
-    'audiologists',
-    'audiometrically',
-    'audion',
-    'audioning',
-    'audiophile',
-    'audiophiles',
-    'audiotaping',
-    'audiotext',
-    'audiovision',
-    'audiovisuelle',
-    'audiponde',
     'audit&mdash;perhaps',
-    'audit-committee',
-    'audit.',
-    'auditaire',
-    'audite',
-    'auditee',
-    'auditing/reporting',
-    'auditionee',
-    'auditively.',
-    'auditor.',
-    'auditor/',
-    'auditor/shareholders',
-    'auditorial',
-    'auditors.',
-    'auditory-recognition',
-    'auditory-vocal',
     'audix',
-    'audley/oxfordshire',
-    'audo',
-    'audoen',
-    'audoin',
-    'audoins',
-    'audouin',
-    'audouinii',
-    'audovera',
-    'audrain',
-    'audran',
-    'audrey-ann',
-    'audrian',
-    'audris',
-    'audrius',
-    'audrjus',
     'audyponch',
-    'aued',
-    'auede',
-    'auen',
-    'auerback',
-    'auernhammer',
-    'auersperg',
-    'auerstadt',
-    'auf-wie-der-sein',
-    'aufarbeitung',
-    'aufbruch',
-    'aufenthalt',
-    'auferstehung',
-    'auffheben',
-    'aufforderung',
-    'aufgelistet',
     'aufgezeiget',
-    'aufidius',
-    'aufiria',
-    'aufklarung',
-    'aufstrich',
-    'aufvald',
-    'aufwuchs',
-    'aug&ndash;13',
-    'aug&ndash;18',
-    'aug&ndash;26',
-    'aug&ndash;30',
-    'aug&ndash;31',
-    'aug-sept',
-    'aug.22',
-    'aug.24',
-    'aug24/sept23',
     'augar',
-    'augea',
-    'augee',
-    'augen',
-    'auger&ndash;omagh',
-    'augering',
-    'augerunt',
-    'augh',
-    'aughafatten',
-    'augher',
-    'aughey',
-    'aughisky',
-    'aughlish',
-    'aughnacloy&ndash;augher',
-    'aughrim',
-    'aughton/mother',
     'augitic',
-    'augmentacion',
-    'augmentary',
-    'augmentin',
-    'augsburg-stadt',
-    'augsburger',
-    'augst',
-    'augstaka',
-    'augt',
-    'auguas',
-    'augue',
-    'auguitse',
-    'augumentin',
-    'auguri',
-    'auguring',
-    'august&ndash;3rd',
     'august&ndash;march',
-    'august&ndash;september',
-    'august&oacute;w-grodno',
-    'august*',
-    'august-',
-    'august-21',
-    'august-24',
-    'august-31',
-    'august-4',
-    'august-5',
-    'august-9th',
-    'august-bebel-platz',
-    'august-november',
-    'august/1',
-    'august/weightlifter',
-    'august_even',
     'augustas',
-    'auguste-ren&eacute',
-    'augustina',
-    'augustine-the-less',
-    'augustinergasse',
-    'augustinis',
-    'augustinus',
-    'augustly',
-    'augustusstr.',
-    'auhtorities',
-    'auidience',
-    'auitzotl',
-    'aujeszky',
-    'auknasheals',
-    'auks.',
-    'auksiausiogi',
     'aukusopost',
-    'aul\'',
-    'aulacaspis',
-    'aulacogen',
-    'aulacogens',
-    'aulagnier',
-    'aulaye',
-    'aulberry',
-    'aulentissima',
-    'auletes',
-    'aulide',
-    'aulis',
-    'aull',
-    'aulnage',
-    'aulnay',
-    'aulonacaras',
     'aulonocaras',
-    'aultroy',
-    'aum-gmbh',
-    'auncyent',
-    'aundray',
-    'aunes',
-    'aung*',
-    'aunis',
-    'aunjetitz',
-    'aunshuman',
-    'aunswere',
-    'aunt-mother',
-    'auntie-kate-directed',
-    'auntie-kate-liking',
-    'aunties_over',
-    'auntre',
     'auntres',
-    'aup',
-    'auping',
-    'aurab',
-    'aurait',
-    'aural-oral',
-    'aural-receptors',
-    'aural/oral',
-    'aurals/orals',
-    'aurangabad',
-    'aurassi',
-    'auraticised',
-    'auratone',
-    'aureate',
-    'aureate-',
-    'aurei',
     'aurelianstrasse',
-    'aurelius-',
-    'aurenche',
-    'aureng-zebe',
-    'aureo-variegata',
-    'aureola',
-    'aureolin',
-    'aureoreticulata',
-    'auribat',
-    'auricholatum',
-    'auricles',
-    'auricomus',
-    'aurigema',
-    'aurii',
-    'aurine',
-    'auritalcinerea',
     'auritus',
-    'aurlism',
-    'auroch',
-    'auroise',
-    'auronzo',
-    'aurum-like',
-    'aurvandill',
-    'aus&dollar;10',
-    'aus&dollar;13.2',
-    'aus&dollar;15,000',
-    'aus&dollar;170&ndash;200,000',
-    'aus&dollar;250,000',
-    'aus&dollar;30&ndash;40,000',
-    'aus&dollar;350&ndash;450,000',
-    'aus&dollar;400&ndash;600,000',
-    'aus&dollar;450&ndash;550,000',
     'aus&dollar;60&ndash;80,000',
-    'aus&dollar;90,000',
-    'ausbau',
-    'ausbruch',
-    'auscultated',
-    'auscultatory',
-    'ausdruck',
-    'auseinandergeschriehen',
-    'ausencio',
-    'ausgangpunkt',
-    'ausgebauten',
-    'ausgestellten',
-    'aushev',
-    'ausi',
-    'ausino',
-    'ausl&auml;ndergesetz',
     'ausl&auml;ndischen',
-    'auslandsdienst',
-    'ausona',
-    'ausone',
-    'ausonia',
-    'ausonio',
-    'ausperg',
-    'auspice',
-    'auspiciousness',
-    'ausria',
-    'ausria-ii',
-    'ausrian',
-    'aussenhandelstelle',
-    'aussenseiter',
-    'ausserlesene',
-    'ausserparlamentarische',
     'ausserwinkler',
-    'aussichten',
-    'aussie-designated',
-    'aussie-land',
-    'aussie-style',
-    'aussig',
-    'aussteigen',
-    'ausstellunghalle',
-    'ausstrahlung',
-    'austauschdienst',
-    'austells',
-    'austens',
-    'auster/headmaster',
-    'austere-faced',
-    'austereness',
-    'austerity-rationed',
     'austerlitz\'',
-    'austin\'',
-    'austin-based',
-    'austin-healeys',
-    'austin-morris',
-    'austin-rover',
-    'austin-smith',
-    'austin/car',
-    'austin/mg',
-    'austin/prisoner',
-    'austin/sainsburys',
-    'austin/west',
-    'austinianism',
-    'austmin',
-    'austoft',
-    'austra',
     'australia\'a',
-    'australia-singapore-thailand',
-    'australia-us',
-    'australian&rehy;american',
-    'australian-based',
-    'australian-designed',
-    'australian-funded',
-    'australian-japanese',
-    'australian-led',
-    'australian-made',
-    'australian-quoted',
-    'australian/new',
-    'australias',
-    'australiasia',
-    'australo-',
-    'australoid',
     'australopithese',
-    'austrapius',
-    'austrasians',
-    'austremoine',
-    'austria&mdash;hungary',
-    'austria--which',
-    'austria-bohemia',
-    'austriaca',
-    'austrialia',
-    'austrian-',
-    'austrian-american',
-    'austrian-based',
-    'austrian-held',
-    'austrian-hungarian',
-    'austrian-hungary',
-    'austrian-jewish',
     'austrian-manned',
-    'austrian-occupied',
-    'austrian-soviet',
-    'austrian/german',
-    'austrian/slovenian',
-    'austrian/swiss',
-    'austrianised',
-    'austritt',
-    'austrlia',
-    'austro-italian',
-    'austro-serbian',
-    'austro-spanish',
-    'austro-tours',
-    'ausverkauf',
-    'ausw&auml;rtiges',
-    'ausweis',
     'aut&oacute;noma',
-    'aut&oacute;nomo',
-    'aut\'ority',
-    'auteldac',
-    'auten',
-    'autenfesu',
-    'autentike',
-    'authentic-seeming',
-    'authentic-sounding',
-    'authentic-style',
-    'authenticators',
-    'authenticist',
-    'authenticity-to',
-    'authenticity-wilde',
-    'authentikos',
-    'authentique',
     'autheurs',
-    'authier',
-    'author-autocrat',
-    'author-centred',
-    'author-date',
-    'author-fiction',
-    'author-function',
-    'author-narrator',
-    'author-oriented',
-    'author-reader',
-    'author-subscriber',
-    'author-surrogates',
-    'author-text-reader',
-    'author-to-reader',
-    'author-transfers',
-    'author-vet',
     'author/illustrator',
-    'author/illustrators',
-    'author/translator',
-    'authorative',
-    'authoratively',
-    'authoresses',
-    'authori',
-    'authori&rehy;tarian',
-    'authori-ties',
-    'authorial-judgement',
-    'authoris',
-    'authoritarian-democratic',
-    'authoritarian-patriarchal',
-    'authoritarian-plebiscitary',
-    'authoritarian/democratic',
-    'authoritative-looking',
     'authoritie',
-    'authorities-',
-    'authorities-i',
-    'authorities-nursery',
-    'authorities-those',
-    'authorities.2',
-    'authorities/',
-    'authorities/doctors',
-    'authorities/hospitals',
-    'authorities/persons',
-    'authorititative',
-    'authority&mdash;a',
-    'authority&ndash;s',
-    'authority&rehy;wide',
-    'authority-(dla)',
-    'authority-bashing',
     'authority-bating',
-    'authority-controlled',
-    'authority-figures',
-    'authority-financed',
-    'authority-funded',
-    'authority-imposed',
-    'authority-sponsored',
-    'authority-systems',
-    'authority-the',
-    'authority-thinking',
-    'authority/board',
-    'authority/hospital',
-    'authority/it',
-    'authority/private',
-    'authority/religious',
-    'authority/school',
     'authorizingborrowing',
-    'authorlessness',
-    'authors/agents',
-    'authors/contributors',
-    'authors/journalists',
-    'authors/the',
-    'authorware',
-    'authurs',
-    'authurs/fund',
-    'auti',
-    'autioneering',
-    'autistically',
-    'autistics',
-    'autmn',
-    'autnomic',
-    'auto&rehy;matically',
     'auto-analyser',
-    'auto-answer',
-    'auto-answers',
-    'auto-antibody',
-    'auto-aphrodisiac',
-    'auto-assisted',
-    'auto-b&auml;cklund',
-    'auto-bahn',
-    'auto-biographical',
-    'auto-build',
-    'auto-canon',
-    'auto-catalytic',
-    'auto-coach',
-    'auto-company',
-    'auto-configuration',
-    'auto-cook/heat',
     'auto-cover',
-    'auto-credit',
-    'auto-crimes',
-    'auto-culture',
-    'auto-decrement',
-    'auto-decrementing',
-    'auto-destructing',
-    'auto-dialling',
-    'auto-didact',
-    'auto-differentiation',
-    'auto-digestion',
-    'auto-enhance',
-    'auto-exposure/auto',
-    'auto-faders',
-    'auto-feeder',
-    'auto-fellate',
     'auto-firing',
-    'auto-generated',
-    'auto-greaser',
-    'auto-gyration',
-    'auto-haemorrhage',
-    'auto-hypnosis',
-    'auto-iconism',
-    'auto-ignition',
-    'auto-incrementing',
-    'auto-indexing',
-    'auto-inoculation',
-    'auto-land',
-    'auto-landing',
-    'auto-lean',
-    'auto-makers',
-    'auto-marine',
     'auto-marine-because',
-    'auto-mechatons',
-    'auto-minute',
-    'auto-mobiles',
-    'auto-mutilation',
-    'auto-nomous',
-    'auto-numbering',
-    'auto-off',
-    'auto-promotion',
-    'auto-receive',
-    'auto-regulating',
-    'auto-reselect',
-    'auto-restart',
-    'auto-return',
-    'auto-rotating',
-    'auto-rough',
     'auto-sadistic',
-    'auto-samplers',
-    'auto-save',
-    'auto-select',
-    'auto-sense',
-    'auto-senses',
-    'auto-sensing',
-    'auto-set',
-    'auto-sketch',
-    'auto-suggestions',
-    'auto-suspension',
-    'auto-theft',
-    'auto-throttle',
-    'auto-timer',
-    'auto-trace',
-    'auto-transmission',
     'auto-waterer',
-    'auto-weight',
-    'auto-winders',
-    'auto-zoom',
-    'auto.',
-    'auto.bat',
-    'autoactivation',
-    'autoagglutinated',
-    'autoanalysers',
-    'autoanalysis',
-    'autoanalyzer',
-    'autoantigen',
-    'autobank/autocheque',
-    'autobanks',
-    'autobar',
-    'autobed',
     'autobiog',
-    'autobiogaphy',
-    'autobiographical/biographical',
-    'autobiographically',
-    'autobiographizing',
-    'autoblock',
-    'autobox',
-    'autocall',
-    'autocannon',
-    'autocap',
-    'autocapital',
-    'autocarrier',
-    'autocentres',
-    'autocentric',
-    'autocephalic',
-    'autochange',
     'autochenilles',
-    'autochoke',
-    'autochthonists',
-    'autocloning',
-    'autoclub',
-    'autoclubs',
-    'autoconcern',
-    'autoconfig',
-    'autoconfiguration',
-    'autocook',
-    'autocorrelator',
-    'autocraft',
-    'autocuring',
-    'autodale',
-    'autodeal',
-    'autodefrost',
     'autodeposit',
-    'autodeterminaci&oacute;n',
-    'autodidactic',
-    'autodidacts',
-    'autodromo',
-    'autoeroticism',
-    'autoexec.bats',
-    'autofact',
-    'autofacts',
-    'autofill',
-    'autofinancing',
-    'autofire',
-    'autoflash',
-    'autoflight',
-    'autofluorescent',
-    'autofocusing',
     'autofractions',
-    'autogavaeia',
-    'autogavea',
-    'autogeddon',
-    'autogenics',
-    'autogerechte',
-    'autogestionnaire',
-    'autografts',
-    'autograph-hunting',
-    'autohagiography',
-    'autohypnosis',
-    'autokat',
-    'autoland',
-    'autolite',
-    'autologon',
-    'automacity',
     'automated/computer',
-    'automati&rehy;cally',
-    'automatiaclly',
-    'automatic-only',
-    'automatic-pilot',
-    'automatically--have',
-    'automatically-increasing',
-    'automation\'',
-    'automation-oriented',
-    'automations',
-    'automatique',
-    'automatising',
-    'automatizing',
-    'automats',
-    'automec',
-    'automen',
     'automethylation',
-    'automex',
-    'automic',
-    'automization',
-    'automne',
-    'automobile-free',
-    'automobili',
-    'automobiliste',
-    'automobility',
-    'automorphism',
-    'automotive.',
-    'automoto',
-    'autona',
-    'autonets',
-    'autonic',
-    'autonom&iacute;as',
     'autonomen',
-    'autonomized',
-    'autonomo',
-    'autonomous-minded',
-    'autonomy-seeking',
-    'autonomy/creativity/growth',
-    'autonomy/dependence',
-    'autonomy/restriction',
-    'autonudge',
-    'autonyms',
-    'autopartei',
-    'autopartei/parti',
-    'autophilia',
-    'autophosphorylated',
-    'autopipe',
-    'autopista',
     'autoplex',
-    'autopoint',
-    'autoport',
-    'autoportrait',
-    'autopsychological',
-    'autoquip',
-    'autoquote',
-    'autoracing',
-    'autoradiographer',
-    'autoradiographical',
-    'autoradiography.',
-    'autoradiography/fluorography',
-    'autoranging',
-    'autoreactivity',
-    'autorecycling',
-    'autoregression',
     'autoregressions',
-    'autoregulate',
-    'autoregulates',
-    'autorepresentation',
-    'autorepression',
-    'autores',
-    'autoreturn',
-    'autoreverse',
-    'autorities',
-    'autorkay',
-    'autorotating',
-    'autorotation-throttle',
-    'autosales',
-    'autosamplers',
-    'autosaving',
-    'autoscope',
     'autoscript',
-    'autoscythe',
-    'autoserve',
-    'autosizer',
-    'autosoft',
-    'autosol',
-    'autosome',
-    'autosomic',
-    'autospec',
-    'autosplenectomy',
-    'autostat',
-    'autostimulation',
-    'autosuppression',
-    'autosuture',
-    'autoswitch',
-    'autotech',
     'autotelism',
-    'autotherapy',
-    'autotimer',
-    'autotritrator',
-    'autotronic',
-    'autotrophs',
-    'autovalet',
-    'autovent',
-    'autovents',
-    'autoview',
-    'autoworks',
-    'autozero',
-    'autpertus',
-    'autronica',
-    'auttori',
-    'autumn-blazing',
     'autumn-born',
-    'autumn-coloured',
-    'autumn-drilled',
-    'autumn-if',
-    'autumn-planted',
-    'autumn-putting-to-bed',
-    'autumn-spring',
-    'autumn-tinged',
-    'autumn.',
-    'autumn/',
-    'autumn/early',
-    'autumn/spring',
-    'autumnale',
-    'autumnm',
-    'autumnus',
-    'autunite',
     'auug\'92',
-    'auurgh',
-    'auuua',
-    'auva',
-    'auvergnats',
-    'auvers-sur-l\'oise',
-    'aux(iliary)',
-    'aux-morts',
-    'auxendunum',
-    'auxerrois',
-    'auxias',
-    'auxilia',
-    'auxilians',
-    'auxilio',
-    'auzac',
-    'auzias',
     'auzies',
-    'av-8b',
-    'av-av-avail-av-is',
-    'av/film/vtr',
-    'av142',
-    'av4600',
-    'av4625',
-    'av8000&ndash;8',
-    'avaangsbetyg',
-    'avadex',
-    'avadi',
-    'avaerage',
-    'avagnina',
-    'avai',
-    'avaible',
-    'avail&rehy;ability',
     'avail.',
-    'avail.the',
-    'availabil',
-    'availabilitiy',
-    'availability/co-operation',
-    'availabiltiy',
-    'available.by',
-    'available/produced',
-    'availble',
-    'availeth',
-    'availiable',
-    'aval',
-    'avala',
-    'avalan',
-    'avalanche\'',
-    'avalanche-breakdown',
     'avalanche-prone',
-    'avaliable',
-    'avaline',
-    'avall',
-    'avallen',
-    'avalonian',
-    'avance',
-    'avanda',
-    'avangard',
-    'avanguardia-transavanguardia',
-    'avant-gardism.',
-    'avant-gardisme',
-    'avant-grade',
-    'avant-guardian',
-    'avant-guardism',
-    'avant-metal',
     'avant.',
-    'avant.gardes',
-    'avant=',
-    'avanzo',
-    'avaon',
-    'avar-slav',
-    'avarina',
-    'avaris',
-    'avarua',
-    'avaunced',
-    'avbersek',
-    'avcom',
-    'avdell',
-    'avdic/',
-    'avdvarld',
-    'avedis',
     'aveen',
-    'avele',
-    'avella',
-    'avelli',
-    'avem',
-    'avenas',
-    'avenda&ntilde;o',
-    'avenel',
-    'avenidad',
-    'avenidas',
-    'avenson',
-    'aventicum',
-    'aventura',
-    'aventure',
-    'aventures',
-    'aventuri&egrave;re',
     'avenue-shaped',
-    'average&rehy;sized',
-    'average-cost',
-    'averaged.',
-    'averager',
-    'averages.',
-    'averages/norm',
-    'averaging.',
-    'averch',
-    'averch&ndash;johnson',
-    'averge',
-    'averie',
-    'averis',
-    'avermectin',
-    'averoff-tossizza',
-    'averre',
     'aversely',
-    'aversion-therapy',
-    'aversion.',
-    'aversive-to-appetitive',
-    'averton',
-    'averulino',
-    'averys',
-    'avesnes',
-    'avesta',
-    'aveyron-loz&egrave;re',
-    'avgareameasure',
-    'avge.29.01',
-    'avgolemono',
-    'avhieved',
-    'avhrr',
-    'aviaco',
     'aviate',
-    'aviated',
-    'aviatiks',
-    'aviation&rehy;oriented',
-    'aviation-',
-    'aviation-based',
-    'aviation-minded',
-    'aviation-oriented',
-    'aviation/ami',
-    'aviation/space',
-    'aviatrix',
-    'aviazione',
-    'avibras',
-    'avibus',
-    'avicennes',
-    'aviculopecten',
     'aviculture',
-    'avid-approved',
-    'avidano',
-    'avidin',
-    'avidin-peroxidase',
-    'avidly-read',
-    'avidness',
-    'aviemores',
-    'avienus',
-    'avier',
-    'avifaunas',
-    'avig&rehy;non',
-    'avigdor',
-    'aviion-based',
-    'avil&eacute;s',
-    'avila*',
     'avilable',
-    'avilez',
-    'avility',
-    'avin',
-    'avin\'',
-    'avinash',
-    'avington',
-    'avioc',
-    'avionetta',
-    'avionica',
-    'aviram',
-    'avirex',
-    'avisford',
-    'avishai',
-    'avisiting',
-    'aviso',
     'avitaminosis',
-    'aviti',
-    'avito',
-    'avium-intracellulare',
-    'aviv1',
-    'aviv11',
-    'aviv3',
-    'aviv431',
-    'avk',
-    'avm602',
-    'avm625',
-    'avm734',
-    'avneh',
-    'avneue',
-    'avni',
-    'avocado-coloured',
     'avocado-green',
-    'avocat',
-    'avogradro',
-    'avoi',
-    'avoid-like-the-plague',
-    'avoid_all',
-    'avoid_each',
-    'avoidability',
-    'avoidances',
-    'avoidant',
-    'avoider',
-    'avoidingthe',
-    'avoidnik',
-    'avoing',
-    'avoir/&ecirc;tre',
-    'avon&rehy;gloucestershire',
     'avona',
-    'avonbank',
-    'avoncliffe',
-    'avonholm',
-    'avonholme',
-    'avonmead',
-    'avonside',
-    'avonwick',
-    'avouch',
-    'avouched',
-    'avovi',
-    'avowals',
-    'avoyde',
-    'avraam',
-    'avraamov',
-    'avramescu',
     'avrankou',
-    'avrasya',
-    'avray',
-    'avrili',
-    'avrion',
-    'avro-730',
-    'avrora',
-    'avros',
-    'avs&trade',
-    'avsim321',
-    'avtarjeet',
-    'avtorkhanov',
-    'avunduk',
-    'avvago',
-    'avvocato',
-    'aw\'thin\'',
     'aw\'thing',
-    'aw-caw',
-    'aw-fly',
-    'aw-gosh',
-    'aw-right',
-    'aw-shucks',
-    'aw-shucks-gee-look-what-happened-to-me-when-i-wasn\'t-trying',
-    'aw1',
-    'awa-a-a-y',
-    'awa-guaja',
-    'awada',
-    'awaidah',
-    'awaits/',
-    'awakener',
-    'awakening-of-lesbian-desires',
-    'awale',
     'awaleh',
-    'awali',
-    'awamir',
-    'awangga',
-    'awapuhi',
-    'awar',
-    'award&rehy;bearing',
-    'award&rehy;winning',
-    'award-holders',
-    'award-making',
-    'awardance',
-    'awarded.',
-    'awardees',
-    'awards-ceremony',
-    'awards.tony',
-    'awards/',
     'awards/prizes',
-    'awardwinning',
-    'aware-holland',
-    'aware.',
-    'awareh',
-    'awareness-building',
-    'awareness-promoting',
-    'awareness-training',
-    'awareness.',
-    'awareness/',
-    'awareness/involvement',
-    'awareness/updating',
-    'awarere',
-    'awares',
-    'awarethat',
-    'awarness',
     'awarrant',
-    'awat',
-    'awaut',
-    'away&mdash;after',
-    'away&mdash;i',
-    'away&ndash;nth',
-    'away\'n',
-    'away-',
-    'away-from-it',
-    'away-from-it-all',
-    'away-goals',
-    'away-leg',
-    'away-signal',
-    'away-swing',
-    'away-win',
-    'away.',
     'away.yet',
-    'away/from',
-    'away/morrissey',
-    'away/there',
-    'away_from_each',
-    'away_of',
-    'awayawa',
-    'awaydays',
-    'awaydaze',
-    'awaying',
-    'aways&rehy;giving',
-    'awayyyyyyyy',
-    'awazadeh',
-    'awb672',
-    'awb949',
-    'awdah',
     'awdf',
-    'awdl',
-    'awdry/author',
-    'awe&rehy;inspiring',
-    'awe-',
-    'awe-filled',
-    'awe-full',
-    'awefully',
-    'aweless',
-    'awenydd',
-    'awesomeness',
-    'awesomly',
-    'awey',
-    'awford/fever',
-    'awfu',
-    'awfulizing',
     'awfull',
-    'awg997',
-    'awhiles',
-    'awhitehall',
-    'awi1.tif',
-    'awi10.tif',
-    'awi11.tif',
-    'awi12.tif',
-    'awi13.tif',
-    'awi14.tif',
-    'awi2.tif',
-    'awi3.tif',
-    'awi4.tif',
-    'awi5.tif',
-    'awi6.tif',
-    'awi7.tif',
     'awi8.tif',
-    'awi9.tif',
-    'awife',
-    'awka',
-    'awkard',
-    'awkward&ndash;and',
-    'awkward-shaped',
-    'awkward-sized',
-    'awkwardly-named',
-    'awld',
-    'awlgrip-coated',
-    'awlgripped',
-    'awliya',
-    'awlright',
-    'awlwort',
-    'awms',
     'awoling',
-    'awoman',
-    'awon',
-    'awoonor-renner',
-    'awopbopaloobopawombamboom',
-    'aworking',
-    'aworldwide',
-    'awotunsin',
-    'awrajas',
-    'awraka',
-    'awre/gloucestershire',
-    'awre/mmb',
-    'awristocrat',
-    'awsome',
-    'awthing',
-    'awwrr',
     'awza\'i',
-    'ax&bsol',
-    'ax-300',
-    'ax-44c',
-    'ax-ing',
-    'ax-les-thermes',
-    'ax-v401',
-    'ax2',
-    'ax20',
-    'axa-midi',
-    'axb+c',
-    'axb6',
-    'axe-adzes',
-    'axe-blade',
-    'axe-god',
-    'axe-hammers',
     'axe-handle',
-    'axe-handles',
-    'axe-hero',
-    'axe-like',
-    'axe-man',
-    'axe-murderer',
-    'axe-shaped',
-    'axe-sling',
-    'axe-swinging',
-    'axe-trashing',
-    'axe-wielder',
-    'axe/johnson',
-    'axegrinder',
-    'axelrodian',
-    'axels',
-    'axelsson',
     'axemyne',
-    'axen',
-    'axenic',
-    'axenically',
-    'axi',
-    'axilenvoy',
-    'axillae',
-    'axillaris',
-    'axilstation-230',
-    'axings',
-    'axiom.',
-    'axioma',
-    'axiomatising',
-    'axions',
-    'axios',
-    'axioskop',
     'axis&mdash',
-    'axis-allied',
-    'axkxt',
-    'axle-box',
-    'axle-making',
-    'axle-producing',
-    'axle-tree',
-    'axle.',
-    'axled',
-    'axleguards',
-    'axles.',
-    'axletree',
-    'axminton',
-    'axo-axonic',
-    'axolemmal',
-    'axolotls',
     'axos',
-    'axp-osf/1',
-    'axpcluster',
-    'axssault',
-    'axtell/driver',
-    'axxeman',
-    'axy',
-    'axys',
-    'ay-a-tain',
-    'ay-ay-ay',
-    'ay-ee',
-    'ay-eee',
-    'ay1',
-    'ayamara',
-    'ayant',
-    'ayat',
     'ayathis',
-    'ayatholugh',
-    'ayayem',
-    'ayce',
-    'ayckbourns',
-    'ayclife',
-    'aye-eye',
-    'aye.',
-    'ayear',
-    'ayeaye',
-    'ayele',
-    'ayelu',
-    'ayem',
-    'ayemwenre',
-    'ayen',
-    'ayer-hare',
     'ayerst',
-    'ayery',
-    'ayeshea',
-    'ayet',
-    'ayeva',
-    'aygell',
-    'ayglara',
-    'aygula',
-    'aygwmdfg',
-    'ayidan',
-    'ayih',
-    'ayissi',
-    'ayivor',
-    'aykbourn',
-    'aykut',
-    'aykut(f)',
     'ayland',
-    'ayle',
-    'ayleford',
-    'aylen',
-    'aylesbeare',
-    'aylesbury-bound',
-    'ayliffes',
-    'aylings',
-    'ayllus',
-    'aylmesthorpe',
-    'aylot',
-    'aylum',
-    'aymante',
-    'aymaraians',
-    'aymaran',
-    'aymaras',
     'aymarians',
-    'aymestry',
-    'aymon',
-    'aymonieri',
-    'ayn-al-hulwah',
-    'aynburg',
-    'aynhoreh',
-    'aynsleys',
-    'ayodyha',
-    'ayone',
-    'ayont',
-    'ayonua',
-    'ayoul',
-    'ayouth',
-    'ayr-based',
-    'ayr/mauchline',
     'ayra',
-    'ayreminne',
-    'ayres/attack',
-    'ayres/carer',
-    'ayrhoh',
-    'ayril',
-    'ayris',
-    'ayris/lightning',
-    'ayrshirekarja',
-    'ayrshiremen',
-    'ayrykyan',
-    'ays',
-    'aysbury',
-    'ayscoghe',
-    'ayse',
-    'aysen',
     'aysh',
-    'aysheaia',
-    'ayslebury',
-    'aytoun',
-    'ayubi',
-    'ayubu',
-    'ayudantes',
-    'ayue',
-    'ayup',
-    'ayursaniyn',
-    'ayuru',
-    'ayut',
-    'ayuverdic',
-    'ayvazovskiy',
-    'aywick',
-    'ayyeh',
     'ayyubids',
-    'ayyubsupply',
-    'ayyyyyyyyyyyyyyyyyyyyyyyyyyyyyyyywyyyyyyy',
-    'ayz',
-    'az&uacute;car',
-    'az-rotation',
-    'az-zibariminister',
-    'aza',
-    'azab',
-    'azabu',
-    'azadeh',
-    'azadehdel',
-    'azadirachtin',
-    'azagury',
-    'azahari',
-    'azaiba',
     'azaiez',
-    'azain',
-    'azains',
-    'azaires',
-    'azalea-blossomed',
-    'azali',
-    'azan',
-    'azangaro',
-    'azanla',
-    'azanza',
-    'azaouad',
-    'azap',
-    'azapo-linked',
-    'azaquinolone',
-    'azaquinolonecarboxylates',
-    'azara',
     'azaria',
-    'azaserine',
-    'azato',
-    'azay-le-rideout',
-    'azcoit&iacute;a',
-    'azef',
-    'azeito',
-    'azekrbayzhan',
-    'azema',
-    'azeotrope',
-    'azerado',
-    'azeredo',
-    'azeri-armenian',
-    'azeri-held',
-    'azeza',
-    'azfar',
     'azgal',
-    'azghadi',
-    'azgul',
-    'azha',
-    'azharrudin',
-    'azhuruddin',
-    'azide-based',
-    'azides',
-    'azienda',
-    'aziendale',
-    'azilian',
-    'azin',
-    'azinphos',
-    'azione',
-    'aziridine',
-    'aziru',
     'aziza',
-    'azizdeputy',
-    'azize',
-    'azizur',
-    'azmaiparashvili',
-    'azmat',
-    'azmitia',
-    'azmoddin',
-    'aznewts',
-    'azo-dye',
-    'azodye',
-    'azofeifa',
-    'azonal',
-    'azoospermic',
-    'azoreductases',
-    'azorius',
     'azp&uacute;rua',
-    'azparrent',
-    'azpitarte',
-    'azrad',
-    'azrael',
-    'azraq',
-    'aztreonam',
-    'azucena',
-    'azules',
-    'azura',
-    'azure-and-green',
-    'azure-eyed',
-    'azvedo',
-    'azwar',
-    'azygos',
-    'azzano',
     'azzaro',
-    'azziziya',
-    'azzola',
-    'azzulo',
-    'azzura',
-    'azzuro',
-    'b&aacute;n',
-    'b&aacute;nzer',
-    'b&aacute;r&eth;ardalur',
-    'b&abreve;th',
-    'b&acirc;timent',
-    'b&agrave;gneres',
-    'b&agrave;thory',
-    'b&amacr;rakot',
-    'b&amacr;rakote',
-    'b&amp;a',
     'b&amp;hs',
-    'b&amp;j',
-    'b&amp;m',
-    'b&amp;p',
-    'b&amp;sub12',
-    'b&amp;sup2',
-    'b&atilde;nos',
-    'b&auml;hr',
-    'b&auml;lf',
-    'b&auml;r',
-    'b&auml;rbel',
-    'b&auml;rlund',
-    'b&auml;sler',
-    'b&auml;umen',
-    'b&bsol;a',
-    'b&dollar;170',
     'b&dollar;63.4',
-    'b&eacute;arnaise',
-    'b&eacute;atois',
-    'b&eacute;atrix',
-    'b&eacute;chamel',
-    'b&eacute;ghin-say',
-    'b&eacute;hal',
-    'b&eacute;la',
-    'b&eacute;liz',
-    'b&eacute;n&eacute;dictins',
-    'b&eacute;n&eacute;ficiaire',
-    'b&eacute;n&eacute;zet',
-    'b&eacute;nais',
-    'b&eacute;nauges',
-    'b&eacute;nedict',
-    'b&eacute;ranger',
     'b&eacute;rot',
-    'b&eacute;tharram',
-    'b&ecirc;cherel',
-    'b&ecirc;te-',
-    'b&ecirc;te-noir',
-    'b&egr',
-    'b&egrave;glois',
-    'b&flat&sharp',
-    'b&flat;7',
-    'b&flat;s',
-    'b&iacute;blicos',
-    'b&iacute;l&aacute',
-    'b&lsqb&egr&rsqb;ck',
-    'b&lsqb;alfour&rsqb',
-    'b&lsqb;i&rsqb',
-    'b&lt&gt;3',
     'b&mdash;1',
-    'b&mdash;2',
-    'b&mdash;5',
-    'b&mdash;llocks',
-    'b&mdash;ng',
-    'b&mdash;no.',
-    'b&ndash',
-    'b&ndash;17cs',
-    'b&ndash;17f',
-    'b&ndash;23',
-    'b&ndash;25c',
-    'b&ndash;25j',
-    'b&ndash;25s',
-    'b&ndash;36',
-    'b&ndash;52',
-    'b&ndash;52s',
     'b&ndash;d',
-    'b&ndash;st',
-    'b&oacute',
-    'b&oacute;inne',
-    'b&ocirc;cskei',
-    'b&ograve',
-    'b&ouml;-ermolli',
-    'b&ouml;cklin',
-    'b&ouml;hl',
-    'b&ouml;hm/philips',
-    'b&ouml;hner',
-    'b&ouml;kow',
-    'b&ouml;lckow',
-    'b&ouml;ll',
-    'b&ouml;mmels',
-    'b&ouml;rje',
     'b&ouml;se',
-    'b&ouml;sen',
-    'b&ouml;ttger',
-    'b&rehy;218',
-    'b&rgr;a',
-    'b&rgr;c',
-    'b&ucirc;che',
-    'b&uuml;cherons',
-    'b&uuml;chi',
-    'b&uuml;chler',
-    'b&uuml;cken',
-    'b&uuml;der',
-    'b&uuml;hnenapparates',
-    'b&uuml;hrle',
-    'b&uuml;k&uuml',
-    'b&uuml;lbring',
     'b&uuml;ndnis/alliance',
-    'b&uuml;rge',
-    'b&uuml;rgerschreck',
-    'b\'aeronautics',
-    'b\'bbitt',
-    'b\'c\'',
-    'b\'gosh',
-    'b\'hahn',
-    'b\'head',
-    'b\'hinch',
-    'b\'jesus',
-    'b\'long',
-    'b\'mena',
-    'b\'now',
-    'b\'yerushulayim',
-    'b(0)',
     'b(2)',
-    'b(h)u',
-    'b(h1)',
-    'b(t)',
-    'b(t)r',
-    'b(urt)',
-    'b*&amp;tard',
-    'b*&dollar&pound',
-    'b****',
-    'b******',
-    'b*******',
-    'b******s',
-    'b*****ds',
-    'b***ocks',
-    'b***s',
-    'b*stard',
     'b+g',
-    'b-----ks',
-    'b-1\'s',
-    'b-1/b-1r',
-    'b-10',
-    'b-1040',
-    'b-1050',
-    'b-1160',
-    'b-17f-30-ve',
-    'b-1s',
-    'b-200s',
-    'b-211',
-    'b-24j',
-    'b-24s',
-    'b-25j',
-    'b-2s',
     'b-3',
-    'b-4',
-    'b-4211',
-    'b-46',
-    'b-5',
-    'b-51',
-    'b-52\'s',
-    'b-7',
-    'b-70s',
-    'b-90',
-    'b-a',
-    'b-a-b-y',
-    'b-a-n-g',
-    'b-allele',
-    'b-allotrope',
-    'b-axis',
     'b-b-b-b-bugger',
-    'b-b-b-be',
-    'b-b-b-being',
-    'b-b-b-brains',
-    'b-b-b-buff',
-    'b-b-bed',
-    'b-b-bitch',
-    'b-b-but',
-    'b-baby',
-    'b-baldwin',
-    'b-ballast',
-    'b-be',
-    'b-beastly',
-    'b-been',
-    'b-benedict',
-    'b-bit',
     'b-blackmail',
-    'b-blocking',
-    'b-bogged',
-    'b-bother',
-    'b-box',
-    'b-brakes',
-    'b-brzs',
-    'b-bump',
-    'b-c-d-e',
-    'b-cat',
-    'b-channel',
-    'b-class',
-    'b-club',
-    'b-day',
-    'b-deck',
-    'b-detector',
     'b-division',
-    'b-drive',
-    'b-e-d',
-    'b-effect',
-    'b-event',
-    'b-feature',
-    'b-fifty-two',
-    'b-films',
-    'b-flat',
-    'b-four-six-three-two',
-    'b-four-two-one-five',
-    'b-girls',
-    'b-glucosidase',
-    'b-group',
-    'b-gul',
-    'b-h-s',
     'b-i',
-    'b-i-g',
-    'b-i-l',
-    'b-international',
-    'b-joints',
-    'b-law',
-    'b-lymphocytic',
-    'b-lymphoid',
-    'b-men',
-    'b-mercaptoethanol',
-    'b-mode',
-    'b-o',
-    'b-pawn',
-    'b-pawns',
-    'b-picture',
-    'b-pillar',
     'b-plate',
-    'b-r',
-    'b-real',
-    'b-roosed',
-    'b-run',
-    'b-s-e',
-    'b-share',
-    'b-shell',
-    'b-shit',
-    'b-side.',
-    'b-splines',
-    'b-sulphur',
-    'b-tec',
-    'b-testing',
-    'b-u-t',
-    'b-vitamins',
     'b-wing',
-    'b-word',
-    'b-z',
-    'b.&amp;s.',
-    'b.&amp;w.',
-    'b.&num',
-    'b.0.a.c',
-    'b.1.',
-    'b.1.1',
-    'b.1.2',
-    'b.10.',
-    'b.1104',
-    'b.12',
-    'b.1391',
-    'b.14',
-    'b.1879',
     'b.1891',
-    'b.1894',
-    'b.1899',
-    'b.1906',
-    'b.1912',
-    'b.1913',
-    'b.1915',
-    'b.1918',
-    'b.1920',
-    'b.1924',
-    'b.1961',
-    'b.2.1',
-    'b.207',
-    'b.27',
-    'b.2t',
-    'b.5',
     'b.6',
-    'b.a\'t',
-    'b.a.a.b.',
-    'b.a.b.',
-    'b.a.e.c',
-    'b.a.g.a.',
-    'b.a.o.r.',
-    'b.a.t.o.d.',
-    'b.b.king',
-    'b.b.n',
-    'b.b.o.n.t.',
-    'b.butcher',
-    'b.c',
-    'b.c.&ndash;a.d.',
-    'b.c.d.a.',
-    'b.c.e.s.o.',
     'b.c.l.',
-    'b.c.rly',
-    'b.carotene',
-    'b.comm',
-    'b.d.=',
-    'b.d.a.',
-    'b.d.b.',
-    'b.d.d.a',
-    'b.d.p.ltd.',
-    'b.d.s.',
-    'b.e.ward',
-    'b.educational',
-    'b.eng.',
-    'b.evans',
-    'b.f.110',
-    'b.f.i.',
     'b.g.1692',
-    'b.g.s.',
-    'b.h.',
-    'b.h.p',
-    'b.i',
-    'b.iii',
-    'b.lapillus',
-    'b.m.a.',
-    'b.m.k.',
-    'b.m.s.',
-    'b.m/n.f',
-    'b.number',
-    'b.o.a.t.',
-    'b.o.b',
-    'b.o.e.',
-    'b.o.s.',
     'b.p',
-    'b.p.c.m.',
-    'b.p.cooper',
-    'b.prey',
-    'b.r./l.m.s',
-    'b.r.m.',
-    'b.r.m.l.',
-    'b.rufus',
-    'b.s',
-    'b.s.2690',
-    'b.s.476',
-    'b.s.a.',
-    'b.s.p.',
-    'b.s.t.',
-    'b.sc(eng)',
-    'b.t.c.',
     'b.t.i.',
-    'b.t.m.',
-    'b.t.p.',
-    'b.tech',
-    'b.thurigiensis',
-    'b.w.p.a.',
-    'b.what',
-    'b.x',
-    'b.xiii',
-    'b.z.w.',
-    'b/0.5m',
-    'b/00/22/0012',
-    'b/00/22/2003',
-    'b/00/22/2005',
-    'b/00/22/2006',
-    'b/00/22/2008',
     'b/00/23/0061',
-    'b/00/23/0067',
-    'b/00/23/2013',
-    'b/00/23/2068',
-    'b/00/23/2069',
-    'b/00/23/2081',
-    'b/00/23/2107',
-    'b/00/23/2108',
-    'b/00/23/2124',
-    'b/00/23/2131',
-    'b/00/23/2132',
-    'b/00/23/2137',
-    'b/00/23/2148',
-    'b/00/23/2149',
-    'b/00/23/2150',
-    'b/00/23/2151',
     'b/00/23/2152',
-    'b/00/23/2155',
-    'b/00/23/2156',
-    'b/00/23/2157',
-    'b/00/23/2159',
-    'b/00/23/2163',
-    'b/00/23/2164',
-    'b/00/23/2166',
-    'b/00/23/2168',
-    'b/00/23/2171',
-    'b/00/23/2174',
-    'b/00/23/2178',
-    'b/00/23/2179',
-    'b/00/23/2181',
-    'b/00/23/2184',
-    'b/00/23/2185',
     'b/00/23/2189',
-    'b/00/23/2194',
-    'b/00/23/2197',
-    'b/00/23/2200',
-    'b/00/23/2202',
-    'b/00/23/2211',
-    'b/00/23/2218',
-    'b/00/23/2221',
-    'b/00/23/2227',
-    'b/00/23/2231',
-    'b/00/23/2234',
-    'b/00/23/2236',
-    'b/00/24/2015',
-    'b/00/24/2020',
-    'b/00/24/2022',
-    'b/00/24/2023',
     'b/00/25/0009',
-    'b/00/26/0009-2',
-    'b/00/28/0001',
-    'b/01/25/0006',
-    'b/01/25/0011',
-    'b/01/25/0012',
-    'b/01/25/0013',
-    'b/01/25/0014',
-    'b/01/25/0015',
-    'b/01/25/0016',
-    'b/01/25/0019',
-    'b/01/25/0025',
-    'b/01/25/0026',
-    'b/01/25/0032',
-    'b/01/25/0034',
-    'b/01/25/0036',
     'b/02/25/0000',
-    'b/02/25/0005',
-    'b/02/25/0006',
-    'b/02/25/0007',
-    'b/02/25/0008',
-    'b/04/25/0012',
-    'b/05/25/0001',
-    'b/05/25/0002',
-    'b/05/25/0003',
-    'b/05/25/0004',
-    'b/05/25/0010',
-    'b/07/25/0001',
-    'b/1.0m',
-    'b/11',
-    'b/56/1',
-    'b/a',
     'b/a=1.1',
-    'b/b002',
-    'b/bo',
-    'b/bread',
-    'b/c1',
-    'b/day',
-    'b/f',
-    'b/h',
-    'b/l',
-    'b/ne',
-    'b/progenitor',
-    'b/s',
-    'b/t',
-    'b/type',
-    'b/w.',
-    'b/yamagata',
     'b0iy',
-    'b1-h7',
-    'b1.',
-    'b1.8-env',
-    'b1.8scfv-env',
-    'b1.8scfv-momlvenv',
-    'b10&ndash;14',
-    'b100',
-    'b104',
-    'b1040',
-    'b1046',
-    'b1052',
-    'b1077',
-    'b1084',
-    'b1085',
-    'b1116',
     'b1122',
-    'b115',
-    'b1152',
-    'b12-musicology',
-    'b122',
-    'b1224',
-    'b1229',
-    'b1242',
-    'b1267',
-    'b1277',
-    'b132',
-    'b134',
-    'b1365',
-    'b1366',
-    'b137',
-    'b1383',
     'b13th',
-    'b147',
-    'b151',
-    'b15n',
-    'b166',
-    'b1706&ndash;44',
-    'b178a',
-    'b17g',
-    'b193',
-    'b1957+20',
-    'b1iss',
-    'b2/12',
-    'b2/a',
-    'b200',
-    'b2026',
-    'b2036',
     'b204',
-    'b252',
-    'b29',
-    'b295',
-    'b2o3',
-    'b3*12',
-    'b3002',
-    'b3004',
-    'b3006',
-    'b3046',
-    'b319',
-    'b3227',
-    'b3269',
-    'b327',
-    'b3311',
-    'b332',
     'b35',
-    'b3501',
-    'b3502',
-    'b3503',
-    'b35467',
-    'b382',
-    'b3:5\'-attggcgagctcaggattcttc-3\'',
-    'b3b',
-    'b3j',
-    'b3rd',
-    'b3s',
-    'b404',
-    'b4055',
-    'b4064',
-    'b4103',
-    'b4124',
     'b42',
-    'b4215',
-    'b4234',
-    'b4235',
-    'b4246',
-    'b4267',
-    'b4287',
-    'b4293',
-    'b43',
-    'b4329',
-    'b4368',
-    'b4418',
-    'b4434',
-    'b4494',
-    'b4547',
-    'b4558',
     'b4579',
-    'b47',
-    'b48',
-    'b49',
-    'b4bs07',
-    'b5&ndash;5',
-    'b5000',
-    'b501',
-    'b5106',
-    'b5111',
-    'b526',
-    'b5292',
-    'b53-positive',
-    'b5343',
-    'b5500',
-    'b5700',
     'b58s',
-    'b590',
-    'b5900',
-    'b5:5\'-cctgagggagatgcgccac-3\'',
-    'b5th',
-    'b6*12',
-    'b6+',
-    'b60',
-    'b6105',
-    'b6165',
-    'b6265',
-    'b6277',
-    'b6278',
-    'b6318',
-    'b6355',
-    'b6359',
     'b6371',
-    'b6399',
-    'b65',
-    'b6500',
-    'b663',
-    'b6800',
-    'b692',
-    'b7-root',
-    'b7009',
-    'b7030',
-    'b7031',
-    'b706',
-    'b70g',
-    'b72',
-    'b736',
-    'b737s',
     'b743',
-    'b747s',
-    'b75',
-    'b7500',
-    'b7700',
-    'b7b9',
-    'b8-type',
-    'b80',
-    'b800',
-    'b8046',
-    'b80xl',
-    'b820170',
-    'b834(de3)',
-    'b886',
-    'b891',
-    'b9.12.1',
     'b9019',
-    'b9057',
-    'b9080',
-    'b9090',
-    'b9097',
-    'b9134',
-    'b9191',
-    'b92',
-    'b924',
-    'b954',
-    'b96',
-    'b98',
-    'b985',
-    'b:0,5',
-    'b:the',
-    'b=',
     'b=+9.7&deg',
-    'b=0',
-    'b=0.42',
-    'b=3.21',
-    'b=3.49',
-    'b=45.46',
-    'b=5',
-    'b=d',
-    'b=o',
-    'b=the',
-    'ba&iuml;f',
-    'ba&mdash;1',
-    'ba&scaron;iknez',
-    'ba&scaron;iknezovi',
-    'ba&tcaron;a',
-    'ba\'',
     'ba\'abda',
-    'ba\'ath-dominated',
-    'ba\'athists',
-    'ba\'athistssalah',
-    'ba\'th',
-    'ba(hons)',
-    'ba****ds',
-    'ba-aby',
-    'ba-ath',
-    'ba-ba',
-    'ba-ding-a-dang-ding',
-    'ba-ding-a-dong-ding',
-    'ba-hrun',
-    'ba-na-na',
-    'ba-sponsored',
-    'ba/bcal',
     'ba/ce',
-    'ba/ma',
-    'ba/u.s',
-    'ba11',
-    'ba11bx',
-    'ba12',
-    'ba13',
-    'ba14',
-    'ba20',
-    'ba255',
-    'ba34xd',
-    'ba40',
-    'ba4733',
-    'ba553',
-    'ba558',
-    'baa-3',
     'baa-baa',
-    'baa-lambs',
-    'baa-naa-naa',
-    'baaa-aad',
-    'baaaaaa',
-    'baaaarbaaraaa',
-    'baaad',
-    'baaader',
-    'baaargain',
-    'baaba',
-    'baabaas',
-    'baac',
-    'baadasses',
-    'baaden',
-    'baadjies',
-    'baah',
     'baai',
-    'baal-melqart',
-    'baalen',
-    'baan-shell',
-    'baaquba',
-    'baar',
-    'baard',
-    'baargan',
-    'baarh',
-    'baarrrp',
-    'baasam',
-    'baasanjav',
-    'baass',
-    'baastii',
-    'baath-nationalist',
-    'baathist-zionist',
     'bab-bab',
-    'baba-ba',
-    'babaco',
-    'babala',
-    'babale',
-    'babalu',
-    'babaly',
-    'babamine',
-    'babana',
-    'babani/ap',
-    'babaoshan',
-    'babara-anne',
-    'babassu',
-    'babatunde',
-    'babatundi',
-    'babauta',
     'babayan',
-    'babb-sprague',
-    'babbas',
-    'babbitts',
-    'babbler',
-    'babblers',
-    'babbtized',
-    'babchuk',
-    'babcia',
-    'babe-obsessed',
-    'babees',
-    'babel-based',
-    'babelicious',
-    'babelon',
-    'babels',
-    'babelsburg',
     'babenberg',
-    'babenburg',
-    'babenburgs',
-    'babeny',
-    'baber/fruit',
-    'baber/gipsies',
-    'babera',
-    'baberaham',
-    'baberahm',
-    'baberton/foulis',
-    'babes-and-boys',
-    'babes-bolyai',
-    'babeuf',
-    'babic/inventor',
-    'babie',
-    'babies/',
     'babij',
-    'babiker',
-    'babikian',
-    'babikins',
-    'babilonese',
-    'babinski',
-    'babirusas',
-    'babiwanjit',
-    'babkov',
-    'bablake',
-    'bablock',
-    'bablu',
-    'baboon-like',
-    'baboon-sized',
-    'baboon-to-human',
-    'babooshka',
     'babr',
-    'babsfield',
-    'babst',
-    'babsy',
-    'babu-sahib',
-    'babubhai',
-    'babulal',
-    'babuna',
-    'baburen',
-    'babuska',
-    'babuskas',
-    'babuta',
-    'babuu',
-    'babuy',
-    'baby&rehy;faced',
-    'baby&rehy;talk',
     'baby-baby',
-    'baby-basket',
-    'baby-bath',
-    'baby-batterers',
-    'baby-battering',
-    'baby-besotted',
-    'baby-boomerang',
-    'baby-bottom',
-    'baby-care',
-    'baby-carrying',
-    'baby-day',
-    'baby-dyke',
-    'baby-elephant',
-    'baby-fat',
-    'baby-feeder',
-    'baby-feeding',
     'baby-food',
-    'baby-friendly',
-    'baby-frilled',
-    'baby-furnace',
-    'baby-gates',
-    'baby-gown',
-    'baby-grows',
-    'baby-kissers',
-    'baby-like',
-    'baby-linked',
-    'baby-listening',
-    'baby-mad',
-    'baby-maker',
-    'baby-naming',
-    'baby-operated',
-    'baby-out-with-the-bathwater',
     'baby-plump',
-    'baby-sat',
-    'baby-seal',
-    'baby-seat',
-    'baby-signals',
-    'baby-slopes',
-    'baby-snatch',
-    'baby-soap',
-    'baby-soft',
-    'baby-talking',
-    'baby-trumpet',
-    'baby-watching',
-    'baby-wipes',
-    'baby/a',
-    'baby/invalid',
-    'babybels',
     'babychams',
-    'babycover',
-    'babycrafts',
-    'babyfish',
-    'babygrow',
-    'babygrows',
-    'babyhoods',
-    'babyishness',
-    'babyjelly',
-    'babykiller',
-    'babyland',
-    'babylon/',
-    'babylonic',
-    'babyloniensis',
-    'babylonis',
-    'babyminder',
     'babyribena',
-    'babyshh',
-    'babysits',
-    'babysittin\'',
-    'babyswap',
-    'babytalk',
-    'babywalker',
-    'babywipe',
-    'babyworld',
-    'bacai',
-    'bacalar',
-    'bacale',
-    'bacalhau',
-    'bacani',
-    'bacar',
-    'bacardis',
     'baccalaur&eacute;ats',
-    'baccalaureate-style',
-    'baccalaureates',
-    'baccaurea',
-    'bacchae',
-    'bacchanals',
-    'bacchi',
-    'bacchiad',
-    'bacciata',
-    'bacciflava',
-    'baccio',
-    'bacciochi',
-    'bacciochis',
-    'baccioli',
-    'bach&ndash;abel',
-    'bach-again',
     'bach-like',
-    'bach/petri',
-    'bacha-i',
-    'bachelier-cardonsky',
-    'bachelor-wimp',
-    'bachelor/spinster',
-    'bachelors.',
-    'bachev',
-    'bachgesellschaft',
-    'bachir',
-    'bachkovo',
-    'bachman-turner',
-    'bachowski',
-    'bachstein',
-    'bachtiar',
-    'bacifhe',
     'bacille',
-    'bacillin',
-    'bacillunum',
-    'bacillus-carrying',
-    'bacino',
-    'bacio',
-    'baciocchi',
-    'back&mdash;one',
-    'back&ndash',
-    'back&rehy;drop',
-    'back&rehy;drops',
-    'back&rehy;firing',
-    'back&rehy;handed',
-    'back&rehy;plates',
-    'back&rehy;pressure',
-    'back&rehy;streets',
     'back&rehy;ups',
-    'back\'',
-    'back\'ards',
-    'back(strach\'s)',
-    'back*',
-    'back-17',
-    'back-a',
-    'back-ache',
-    'back-against-the-wall',
-    'back-and-sides',
-    'back-answer',
-    'back-answered',
-    'back-bar',
-    'back-beat',
-    'back-bite',
-    'back-biters',
     'back-blocks',
-    'back-brush',
-    'back-busting',
-    'back-calculate',
-    'back-cast',
-    'back-chains',
-    'back-channelling',
-    'back-chatted',
-    'back-circulation',
-    'back-collar',
-    'back-comby',
-    'back-confirm',
-    'back-crossed',
-    'back-crossing',
-    'back-cut',
-    'back-date',
     'back-dive',
-    'back-donation',
-    'back-doorstep',
-    'back-doubles',
-    'back-draped',
-    'back-draughts',
-    'back-duty',
-    'back-elasticated',
-    'back-end-of-a-bus',
-    'back-entry',
-    'back-field',
-    'back-fire',
-    'back-fist',
-    'back-fists',
-    'back-five',
-    'back-flick',
     'back-flipping',
-    'back-flips',
-    'back-gammon',
-    'back-glens',
-    'back-hander',
-    'back-header',
-    'back-heel',
-    'back-i',
-    'back-if',
-    'back-illumination',
-    'back-in-form',
-    'back-interest',
-    'back-kick',
-    'back-leg',
-    'back-lift',
-    'back-light',
     'back-lists',
-    'back-lots',
-    'back-marker',
-    'back-mutations',
-    'back-netting',
-    'back-nuts',
-    'back-of-envelope',
-    'back-of-the-bus',
-    'back-of-the-envelope',
-    'back-of-the-head',
-    'back-of-the-neck',
-    'back-off',
-    'back-offices',
-    'back-ordered',
-    'back-packed',
-    'back-packer',
     'back-palms',
-    'back-parlour',
-    'back-part',
-    'back-pedals',
-    'back-plaiting',
-    'back-plane',
-    'back-plate',
-    'back-post',
-    'back-projection',
-    'back-protection',
-    'back-pumping',
-    'back-raised',
-    'back-raising',
-    'back-reef',
-    'back-reference',
-    'back-references',
     'back-rests',
-    'back-ring',
-    'back-road',
-    'back-roads',
-    'back-room-in-a-pub',
-    'back-rooms',
-    'back-rounding',
-    'back-routed',
-    'back-row.',
-    'back-rower',
-    'back-scattered',
-    'back-scrubber',
-    'back-selling',
-    'back-slappy',
-    'back-slider',
-    'back-sloping',
     'back-spin',
-    'back-stab',
-    'back-stabbers',
-    'back-stall',
-    'back-stop',
-    'back-stowing',
-    'back-straps',
-    'back-stretched',
-    'back-suction',
-    'back-sufferers',
-    'back-talk',
-    'back-tie',
-    'back-titrating',
-    'back-to&rehy;electronics',
-    'back-to-',
-    'back-to-a',
     'back-to-backers',
-    'back-to-business',
-    'back-to-form',
-    'back-to-nursing',
-    'back-to-the-earth',
-    'back-to-the-future',
-    'back-to-the-kitchen-sink',
-    'back-tracks',
-    'back-translations',
-    'back-up-service',
-    'back-up.',
-    'back-veld',
-    'back-vowel',
-    'back-wall',
-    'back-washing',
-    'back-way',
     'back-ways',
-    'back-winding',
-    'back-woods',
-    'back-yards',
-    'back-year',
-    'back-zipped',
-    'back.',
-    'back.a',
-    'back.doctors',
-    'back.gate',
-    'back.in',
-    'back.it',
-    'back.nick',
-    'back.the',
-    'back.up',
-    'back/cover',
     'back/do',
-    'back/forward',
-    'back/let',
-    'back/midfielder/striker',
-    'back/will',
-    'back/with',
-    'back2',
-    'back5',
-    'back:calls',
-    'back:in',
-    'back:nominations',
-    'back:now',
-    'back:speedway',
-    'back:this',
-    'back:thousands',
-    'back:three',
     'back:work',
-    'back=',
-    'back_for',
-    'backbars',
-    'backbencher-of-the-year',
-    'backbite',
-    'backbiters',
-    'backblast',
-    'backblocks',
-    'backbreakingly',
-    'backburnered',
-    'backchannel',
-    'backclothed',
-    'backcountry',
-    'backcrossed',
-    'backcrossing',
     'backdrop-like',
-    'backdrop/',
-    'backdropped',
-    'backdrops.',
-    'backdunes',
-    'backed-dated',
-    'backed-off',
-    'backed_in',
-    'backet',
-    'backfat',
-    'backfill/drainage',
-    'backflip',
-    'backflipped',
-    'backflipping',
-    'backflips',
-    'backfoot',
     'backfriend',
-    'backgarden',
-    'backglass',
-    'backgroun',
-    'background-',
-    'background-foreground',
-    'background-pattern-pattern-background',
-    'background/education/experience',
-    'background_in',
-    'backhand/forehand',
-    'backhands',
-    'backhaul',
-    'backhaus',
-    'backhaus/clemens',
-    'backhead',
-    'backheeled',
     'backhoe',
-    'backhouse/rescuer',
-    'backin\'',
-    'backing-away',
-    'backing-the',
-    'backlashers',
-    'backleys',
-    'backlid',
-    'backlift',
-    'backlighted',
-    'backliner',
-    'backlogged',
-    'backman',
-    'backmarker',
-    'backnuts',
-    'backorders',
     'backpieces',
-    'backplay',
-    'backporch',
-    'backpressure',
-    'backround',
-    'backrounds',
-    'backrower',
-    'backruns',
-    'backs&ndash;on',
-    'backscatter',
-    'backscattered-electron',
-    'backscattering',
-    'backsettown',
-    'backsheesh',
-    'backshield',
-    'backshift',
     'backsi',
-    'backside-numbing',
-    'backside.',
-    'backslant',
-    'backslap',
-    'backslaps',
-    'backsliden',
-    'backspacing',
-    'backstabbers',
-    'backstamper',
-    'backstitched',
-    'backstory',
-    'backstrap',
-    'backstripe',
-    'backstroke.',
-    'backstrokers',
     'backswamps',
-    'backsweep',
-    'backswimmer',
-    'backswung',
-    'backsystem',
-    'backteeth',
-    'backtrackies',
-    'backup.001',
-    'backup.unet',
-    'backup/restore',
-    'backus-naur',
-    'backveld',
-    'backviews',
-    'backward&rehy;ness',
-    'backward\'',
-    'backward-bending',
     'backward-compatible',
-    'backward-curving',
-    'backward-directed',
-    'backward-masking',
-    'backward-sloping',
-    'backward-type',
-    'backwardly-directed',
-    'backwards&mdash',
-    'backwards-looking',
-    'backwards-slanting',
-    'backwards/forwards',
-    'backwards_in',
-    'backwashed',
-    'backway',
-    'backwell',
-    'backwind',
     'backwoodsman',
-    'backwoodsmanship',
-    'backworth',
-    'backx',
-    'backyard.',
-    'bacly',
-    'bacolod',
-    'bacon-and-cheddar',
-    'bacon-burgers',
-    'bacon-cum-ham',
-    'bacon-happy',
-    'bacon-sizzling',
-    'bacon.',
-    'bacon/ham',
-    'baconeggs',
-    'baconin',
     'bacou',
-    'bact',
-    'bactec',
-    'bacteraemic',
-    'bacteria-fighting',
-    'bacteria-killers',
-    'bacteria-laden',
-    'bacteria-negative',
-    'bacteria.0',
-    'bacteria/enzymes',
-    'bacterial/anti-parasite',
-    'bacteriocidal',
-    'bacteriocide',
-    'bacteriostatically',
-    'bacteroids',
-    'bactigras',
     'bactocide',
-    'bacton/herefordshire',
-    'bactrial',
-    'bactrian',
-    'bactriana',
-    'bactris',
-    'bacuase',
-    'baculites',
-    'baculoviridae',
-    'baculovirus-expressed',
-    'bacum',
-    'bacus',
-    'bacuzzi',
-    'baczkowske',
-    'bad&mdash',
-    'bad\'',
     'bad-bastard',
-    'bad-boys',
-    'bad-breathed',
-    'bad-cop',
-    'bad-debts',
-    'bad-e-das',
-    'bad-for-you',
-    'bad-good',
-    'bad-hats',
-    'bad-human',
-    'bad-loan',
-    'bad-mouthed',
-    'bad-smelling',
-    'bad-style',
-    'bad/bed',
-    'badajar',
     'badamassi',
-    'badamhand',
-    'badami',
-    'badance',
-    'badaoui',
-    'badarchiyn',
-    'badarou',
-    'badass',
-    'badastan',
-    'badawai',
-    'badawy',
-    'badby/fawsley',
-    'badcall',
-    'badda',
-    'baddeil',
-    'baddel',
     'baddely',
-    'badden',
-    'baddening',
-    'baddens',
-    'baddingham',
-    'baddinsgill',
-    'baddridine',
-    'badds',
-    'badeev/pupil',
-    'badel',
-    'badelsburg',
-    'bademus',
-    'baden-',
-    'baden-fuller',
-    'baden-wurtemburg',
-    'badenhorst',
     'badens',
-    'bader-meinhof',
-    'bader-meinhoff',
-    'badereddine',
-    'badescu',
-    'badeslade',
-    'badewitz-dodd',
-    'badgaduish',
-    'badgan',
-    'badgastein',
-    'badge-covered',
-    'badgeless',
-    'badgemore',
-    'badger-baiters',
-    'badger-copse',
-    'badger-grey',
     'badger-lore',
-    'badger-related',
-    'badger-saving',
-    'badger-style',
-    'badger-watch',
-    'badgerish',
-    'badgerline',
-    'badges/or',
-    'badgett',
-    'badgoys',
-    'badh',
-    'badharoudine',
-    'badi',
-    'badia-batalla',
-    'badiks',
-    'badile',
     'badilla',
-    'badin',
-    'badiola',
-    'badius',
-    'badl',
-    'badlanders',
-    'badlooking',
-    'badluarach',
-    'badly&rehy;printed',
-    'badly&rehy;written',
-    'badly-acted',
-    'badly-aimed',
-    'badly-baked',
-    'badly-balanced',
-    'badly-beaten',
-    'badly-bruised',
     'badly-canned',
-    'badly-constructed',
-    'badly-cooked',
-    'badly-done-by',
-    'badly-dressed',
-    'badly-faded',
-    'badly-fitted',
-    'badly-handled',
-    'badly-hit',
-    'badly-hung',
-    'badly-indebted',
-    'badly-informed',
-    'badly-judged',
-    'badly-led',
-    'badly-maintained',
-    'badly-mixed',
     'badly-off',
-    'badly-organized',
-    'badly-phrased',
-    'badly-planned',
-    'badly-presented',
-    'badly-recorded',
-    'badly-remembered',
-    'badly-set',
-    'badly-signed',
-    'badly-sited',
-    'badly-slashed',
-    'badly-smelling',
-    'badly-sorted',
-    'badly-stapled',
-    'badly-stripped',
-    'badly-timed',
     'badly-trained',
-    'badly-worked',
-    'badly-worn',
-    'badly-written',
-    'badly.',
-    'badly.the',
-    'badly/deceptively',
-    'badmash',
-    'badminded',
-    'badmouthed',
-    'badoer',
-    'badoit',
-    'badranprime',
-    'badri',
-    'badrutt',
-    'badstube',
     'badu',
-    'baduan',
-    'badwell',
-    'badwill',
-    'bady',
-    'badyear',
-    'bae/rover',
-    'bae146',
-    'baea',
-    'baechler',
-    'baeej',
-    'baeg',
-    'baekland',
-    'bael-poor',
-    'baere',
-    'baeren',
     'baerenreiter',
-    'baerlund',
-    'baermann/wagner',
-    'baff',
-    'baffins',
-    'baffle-wall',
-    'baffled-looking',
-    'baffled/by',
-    'baffler',
-    'bafs',
-    'bafta-endorsed',
-    'bafta-hoover',
-    'bafta-winning',
-    'bafta/shell',
-    'bafuor',
-    'bag&rehy;snatchers',
     'bag&uacute',
-    'bag\'ums',
-    'bag(s)',
-    'bag-and-baggage',
-    'bag-barrow',
-    'bag-carrying',
-    'bag-dragging',
-    'bag-face',
-    'bag-filler',
-    'bag-full',
-    'bag-hosiers',
-    'bag-laden',
-    'bag-ladies',
-    'bag-like',
-    'bag-shaped',
-    'bag-switch',
     'bag-throwing',
-    'bag-wall',
-    'bag.',
-    'bagadates',
-    'bagamoyo',
-    'baganda',
-    'bagasse-based',
-    'bagasses',
-    'bagatti-valsecchi',
-    'bagbo',
-    'bagby',
-    'bagdogra',
-    'bage/head',
-    'bageho',
-    'bagelle',
-    'bagelow',
     'bagenal',
-    'bagetti',
-    'baggage-animals',
-    'baggage-carrying',
-    'baggage-list',
-    'baggage-servant',
-    'baggage-train',
-    'baggage-wagons',
-    'baggage/goods',
-    'baggage/money',
-    'bagged-out',
-    'baggeridge',
-    'baggeson',
-    'baggesons',
-    'baggier',
-    'baggily',
     'baggin',
-    'baggings',
-    'baggios',
-    'baggis',
-    'baggle',
-    'baggli',
-    'baggotrath',
-    'baggy-bodied',
-    'baggy-suited',
-    'baggy-trousered',
-    'baggy-type',
-    'baggyish',
-    'baghdad-ruweishid',
-    'baghdad-tehran',
-    'baghdadis',
-    'baghlani',
     'baghosiers',
-    'baghouse',
-    'baginal',
-    'baginsky',
-    'bagirov',
-    'baglar',
-    'bagman-fox',
-    'bagmati',
-    'bagn&eacute;res-de-bigorre',
-    'bagna',
-    'bagnaia',
-    'bagnalls',
-    'bagnalstown',
-    'bagnar',
-    'bagnara',
-    'bagnell/charcoal',
     'bagnerello',
-    'bagnet',
-    'bagnificent',
-    'bagnini',
-    'bagno-stat',
-    'bagnol',
-    'bagnols',
-    'bagoe',
-    'bagong',
-    'bagotomy',
-    'bagouet',
-    'bagpipe&amp;rehy',
-    'bagpipe-playing',
-    'bagpiper',
-    'bagpuize/oxfordshire',
-    'bagrid',
     'bagrids',
-    'bagrut',
-    'bags-under-eyes',
-    'bagshall',
-    'bagshawed',
-    'bagsnatcher',
-    'bagsnatchers',
-    'bagsv&aelig;rd',
-    'baguin',
-    'baguios',
-    'baguley&ndash;tim',
-    'baguryan',
-    'bagush',
-    'bagust',
-    'bagwara',
-    'bagwashes',
     'bagworth',
-    'bagworthy',
-    'bah&aacute\'&iacute',
-    'bah\'t',
-    'baha\'u\'llah',
-    'bahadhur',
-    'bahagi',
-    'bahal',
-    'bahamasair',
-    'bahamian-registered',
-    'bahamonde',
-    'bahang',
-    'bahari/figure',
-    'bahathri',
-    'bahcall',
-    'baher',
     'bahian',
-    'bahide',
-    'bahind',
-    'bahjee',
-    'bahktin',
-    'bahlsen',
-    'bahnd',
-    'bahnemann',
-    'bahnhofpassage',
-    'bahnini',
-    'baho',
-    'bahoolas',
-    'bahot',
-    'bahr-mildenburg',
-    'bahrain-based',
-    'bahrain-qatar',
     'bahram',
-    'bahranani',
-    'bahreah',
-    'bahrenborstel',
-    'bahrfrheum',
-    'bahri',
-    'bahriye',
-    'baht-billionaire',
-    'bahu',
-    'baibakov',
-    'baibars',
-    'baicoi',
-    'baidera',
-    'baif',
-    'baigent',
-    'baigneurs',
     'baignoire',
-    'baigue',
-    'baikal-amur',
-    'baikonn',
-    'baiks/',
-    'bail-high',
-    'bail.andrew',
-    'bail.mark',
-    'bail.richard',
-    'bail.the',
-    'bailed.a',
-    'bailemos',
-    'bailen',
-    'bailey-lichfield',
-    'bailey/bailey',
-    'bailey/chief',
     'bailey/gloucester',
-    'bailey/hercules',
-    'bailey/nra',
-    'bailey/stroudwater',
-    'bailey/vice-commander',
-    'baileyan',
-    'bailieboro',
-    'bailieston',
-    'bailing-wire',
-    'baill',
-    'baillages',
-    'baillamont',
-    'baillary',
-    'baille',
-    'baillet',
-    'bailli&egrave;re.',
     'bailliage',
-    'baillies',
-    'baillio',
-    'bailliwick',
-    'bailly-pommery',
-    'bailments',
-    'bailor/hirer',
-    'bailyn',
-    'baimbridge',
-    'bain&rehy;de-terre',
-    'bain-elsheikh',
-    'bain-maries',
-    'bain/agricultural',
-    'bainbridge/england',
-    'bainbridge/hereford',
-    'bainbridge/reuter',
     'bainham',
-    'bains-marie',
-    'bains-type',
-    'bains/resident',
-    'bains/west',
-    'bainter',
-    'bainton',
-    'baintree',
-    'baiocchis',
-    'bairab',
-    'bairam',
-    'baird-led',
-    'bairdboard',
-    'baire',
-    'bairrada',
-    'bairros',
     'bais',
-    'baissez',
-    'bait-and-switch',
-    'bait-box',
-    'bait-boxes',
-    'bait-making',
-    'bait-runner',
-    'bait-sized',
-    'bait/lure',
-    'baitbox',
-    'baitboxes',
-    'baitha',
-    'baiting-and-switching',
-    'baixa',
-    'baize-topped',
-    'baizecraft',
     'bajan-speak',
-    'baje',
-    'bajee',
-    'bajeux',
-    'bajja',
-    'bajracharya',
-    'bajram',
-    'bajramovic',
-    'bajt',
-    'bajuli',
-    'bakaar',
-    'bakalite',
-    'bakalof',
-    'bakamo-galaxen',
-    'bakas',
-    'bakatin&mdash;kgb',
     'bakayev',
-    'bakayoko',
-    'bakchylides',
-    'bake-house',
-    'bake-line',
-    'baked-bean',
-    'baked.',
-    'bakeland',
-    'baken',
-    'baken.',
-    'baker-hill',
-    'baker-holroyd',
-    'baker-kozyrev',
-    'baker-lutyens',
-    'baker-mubarak',
-    'baker-shevardnazde',
     'baker-style',
-    'baker-woman',
-    'baker/broadcaster',
-    'baker/burkes',
-    'baker/guest',
-    'baker/home',
-    'baker/nasuwt',
-    'baker/serck',
-    'baker/tenant',
-    'baker/town',
-    'bakerites',
-    'bakersfield',
-    'bakerthink',
-    'bakestone',
-    'bakewells',
-    'bakgatia',
     'bakhchisarai',
-    'bakhim',
-    'bakhlanov',
-    'bakhmin',
-    'bakhrushin',
-    'bakhrushin\'',
-    'bakhshaish',
-    'bakhshish',
-    'bakht',
-    'bakhtchi-serai',
-    'bakili',
-    'baking-sheet',
-    'bakings',
-    'bakiradze',
-    'bakke',
-    'bakkon',
     'bakkra',
-    'bakok',
-    'bakokele',
-    'bakokele-lokonga',
-    'bakool',
-    'bakorstranas',
-    'bakovka',
-    'bakoyanni',
-    'bakri',
-    'baksay',
-    'bakshaish',
-    'baksteen',
-    'bakthiar',
-    'baktiari',
-    'baktria',
-    'baktrian',
     'bakufu-han',
-    'bakula',
-    'bakuninite',
-    'bakuradze',
-    'bal&rehy;conies',
-    'bal-an-sai',
-    'bal1-stu1',
-    'bal31digestion',
-    'balabacensis',
-    'balabanov/dobrotvorski',
-    'balabosteh',
-    'balacalava',
-    'balace',
-    'balaclava-masked',
-    'balaclava-type',
-    'balacomment',
     'balade',
-    'balado',
-    'balaena',
-    'balafas',
-    'balafon',
-    'balafre',
-    'balagan',
-    'balah',
-    'balai',
-    'balakhnichov',
-    'balaki',
-    'balakjian',
-    'balaklava',
-    'balakov',
-    'balakumar',
-    'balal',
     'balalaika-type',
-    'balan',
-    'balanc',
-    'balance&mdash;this',
-    'balance&rehy;sheet',
-    'balance\'',
-    'balance-bob',
-    'balance-lug',
-    'balance-of-trade',
-    'balance-pan',
-    'balance-sheets',
-    'balance-wheel',
-    'balance/extension',
-    'balance_in',
-    'balanced-budget',
-    'balanced-flue',
     'balanced-line',
-    'balanced.crime',
-    'balanced/controlled',
-    'balances-',
-    'balances-the',
-    'balances/',
-    'balances/borrowing',
-    'balancestatement',
-    'balancetool',
-    'balande',
-    'balandier',
-    'balanoglossus',
-    'balanos',
-    'balanpur',
-    'balans',
-    'balantyre',
     'balao',
-    'balarabe',
-    'balaram',
-    'balart',
-    'balarus',
-    'balashov',
-    'balasinya',
-    'balasoiu',
-    'balasz',
-    'balawat',
-    'balb',
-    'balbastre',
-    'balbec',
-    'balbiani',
-    'balbina',
-    'balbuena',
     'balcarce',
-    'balcarre',
-    'balcerowiczdeputy',
-    'balch',
-    'balcnh',
-    'balconi',
-    'balcony&mdash;much',
-    'balcony-caf&eacute',
-    'balcony.',
-    'balcony/terrace',
-    'bald&eacute',
-    'bald-arsed',
-    'bald-domed',
-    'bald-gummed',
-    'bald-pated',
-    'bald-top',
     'baldacci',
-    'baldacci-daverio',
-    'baldaccio-daverio',
-    'baldanders',
-    'baldaro',
-    'baldauf',
-    'balded',
-    'balden',
-    'balderhead',
-    'baldernock',
-    'baldersby',
-    'baldersdale-bred',
-    'balderson',
-    'baldet',
-    'baldheaded',
-    'baldicote',
     'balding-trained',
-    'balding/hunt',
-    'baldino',
-    'baldion',
-    'baldisis',
-    'baldissera',
-    'baldly-going',
-    'baldness.',
-    'baldock/paramedic',
-    'baldomero',
-    'baldon/oxfordshire',
-    'baldonnel',
-    'baldoon',
-    'baldornock',
-    'baldr',
-    'baldricked',
     'baldrige',
-    'baldrik',
-    'balducci',
-    'balduin',
-    'baldvulture',
-    'baldwick',
-    'baldwin\'',
-    'baldwin-chamberlain',
-    'baldwin.',
-    'baldwin/city',
-    'baldwin/competition',
-    'baldwin/first-time',
-    'baldwin/meat',
-    'baldwin/victim',
-    'baldwinite',
-    'baldwyn',
     'bale-stacks',
-    'bale-weighing',
-    'baleanu',
-    'baleboste',
-    'balech',
-    'baled-out',
-    'balefires',
-    'baleno',
-    'balenscu',
-    'balentine',
-    'balerit',
-    'balero',
-    'baleshare/kirkibost',
-    'balestard',
-    'balesteros',
-    'balet',
     'balevullin',
-    'balewa',
-    'balf',
-    'balfa',
-    'balfour-all',
-    'balfourites',
-    'balfours',
-    'balfreish',
-    'balgair',
-    'balgie',
-    'balglass',
-    'balgonie',
-    'balgowan',
-    'balgownie',
-    'balgray',
-    'balgy',
     'balham-born',
-    'balhamilish',
-    'balhousie',
-    'bali-stui',
-    'balic',
-    'balick',
-    'baliff',
-    'balig',
-    'balija',
-    'balijinnyam',
-    'balil',
-    'balinda',
-    'balinese-style',
-    'balinoe',
-    'balis',
-    'baljaffray',
     'baljit',
-    'balkanesque',
-    'balkanise',
-    'balkanised',
-    'balkanization',
-    'balkerne',
-    'balkh',
-    'balkhi',
-    'balky',
-    'ball&rehy;scuffing',
-    'ball&rehy;shining',
-    'ball-aching',
-    'ball-act',
-    'ball-band',
-    'ball-boys',
-    'ball-breaking',
     'ball-burnisher',
-    'ball-buying',
-    'ball-by-ball-by-ball',
-    'ball-chain',
-    'ball-chained',
-    'ball-clipped',
-    'ball-clubs',
-    'ball-control',
-    'ball-crushing',
-    'ball-cum-transmitter',
-    'ball-dress',
-    'ball-dresses',
-    'ball-end',
-    'ball-ended',
-    'ball-fiddle',
-    'ball-firing',
     'ball-games',
-    'ball-head',
-    'ball-hunting',
-    'ball-item',
-    'ball-pen',
-    'ball-player',
-    'ball-retention',
-    'ball-scryer',
-    'ball-scuffing',
-    'ball-sense',
-    'ball-throwing',
-    'ball-tipped',
-    'ball-up',
-    'ball-valves',
-    'ball-vroom',
-    'ball-watched',
     'ball-watching',
-    'ball-winners',
-    'ball.bearings',
-    'ball/best',
-    'ball/bishop',
-    'ball/gloucester',
-    'ball/islander',
-    'ball/pass',
-    'ball/teacher',
-    'ballabosty',
-    'ballachallan',
-    'ballachullish',
-    'ballaclava',
-    'ballad-opera',
-    'ballad-operas',
-    'ballad-singer.i',
     'ballad-singing',
-    'ballad-style',
-    'ballad-type',
-    'ballad-writer',
-    'ballad-writers',
-    'balladic',
-    'ballady',
-    'ballaman',
-    'ballance/bossom',
-    'ballance/bossoms',
-    'balland',
-    'ballandras',
-    'ballantynes',
-    'ballantyre',
-    'ballard/boar',
-    'ballard/friends',
     'ballarue',
-    'ballast-dumping',
-    'ballasts',
-    'ballata',
-    'ballater-deliberately',
-    'ballavanich',
-    'ballbag',
-    'ballbarrow',
-    'ballbarrows',
-    'ballbearing',
-    'ballblazer',
-    'ballchild',
-    'ballcocks',
-    'balldress',
-    'balle',
-    'ballechin\'',
     'ballena',
-    'ballence',
-    'ballerina-style',
-    'ballerini',
-    'ballerino',
-    'ballerup',
-    'ballesteros-type',
-    'ballesteroses',
-    'ballestre',
-    'ballet-dancers',
-    'ballet-dancing',
-    'ballet-drama',
-    'ballet-goers',
-    'ballet-making',
-    'ballet-pantomime',
-    'ballet-pantomimes',
     'ballet-perrot',
-    'ballet-skiing',
-    'ballet/classic',
-    'balletgoers',
-    'balletists',
-    'balletmaster',
-    'balletomane',
-    'balletomania',
-    'ballgomartin',
-    'ballicastell',
-    'balligari',
-    'ballinacross',
-    'ballinamore',
-    'ballinamuck',
-    'ballinastow',
-    'ballincollig/ovens',
     'ballingdon',
-    'ballinger/centre',
-    'ballintine',
-    'ballintoy',
-    'balliol-trinity',
-    'ballisodare',
-    'ballista',
-    'ballistas',
-    'ballistic-missile',
-    'ballitor',
-    'ballitore',
-    'ballivicar',
-    'ballivio',
-    'balljoint',
-    'ballmoor',
-    'ballnahinch',
     'balloan',
-    'ballochbuie',
-    'ballocks',
-    'ballocky',
-    'ballonacy',
-    'balloneware',
-    'balloon-back',
-    'balloon-bedecked',
-    'balloon-blowing',
-    'balloon-catheter',
-    'balloon-dancing',
-    'balloon-filled',
-    'balloon-or',
-    'balloon-tyred',
-    'balloon-valve',
-    'balloonatics',
     'balloons.',
-    'balloonsonde',
-    'ballooon',
-    'ballot-a',
-    'ballot-box',
-    'ballot-counting',
-    'ballottini',
-    'ballou',
-    'ballpens',
-    'ballroom-dancing',
-    'ballroom.',
-    'balls.the',
-    'balls/bollocks/knackers/goolies',
-    'balls/sugar',
-    'ballsed-up',
-    'ballslaneyside',
     'ballstar',
-    'ballstones',
-    'balltype',
-    'ballum',
-    'ballwood',
-    'bally-bonkers',
-    'bally-hoo',
-    'bally.',
-    'ballyarnett',
-    'ballybogey',
-    'ballybunion',
-    'ballycastle&mdash;cushendun',
-    'ballychratigan',
-    'ballycollton',
-    'ballycolman',
-    'ballyconneely',
     'ballyconnell',
-    'ballycorr',
-    'ballycran',
-    'ballydougan',
-    'ballydown',
-    'ballydoyle',
-    'ballyduff',
-    'ballyeen',
-    'ballyfounder',
-    'ballygally',
-    'ballygaragan',
-    'ballygroman',
-    'ballygrooby',
-    'ballyhagan',
-    'ballyhannon',
-    'ballyholland',
     'ballyhooley',
-    'ballyhoura',
-    'ballykilbeg',
-    'ballykilbegs',
-    'ballykilcavan',
-    'ballykinler',
-    'ballylesson',
-    'ballylongford',
-    'ballylough',
-    'ballyloughan',
-    'ballymacarry',
-    'ballymacelligott',
-    'ballymacoll',
-    'ballymaconaghy',
-    'ballymaginty',
-    'ballymahon',
     'ballymeanoch',
-    'ballymonie',
-    'ballymote',
-    'ballymullan',
-    'ballynevoran',
-    'ballynonaghie',
-    'ballyogan',
-    'ballyoonan',
-    'ballyquinton',
-    'ballyranter',
-    'ballyregan',
-    'ballyroe',
-    'ballyrogan',
-    'ballysitteragh',
-    'ballytrustan',
-    'ballyuan',
     'ballyvicar',
-    'ballyvickranell',
-    'ballywarren',
-    'ballywilliam',
-    'ballywillwil',
-    'ballyworkan',
-    'balma',
-    'balmacara',
-    'balmacneil',
-    'balmaghie',
-    'balmaha',
-    'balmalcolm',
-    'balmano',
-    'balmavicar',
-    'balmbra',
-    'balme',
     'balmed',
-    'balmenhorn',
-    'balmerls',
-    'balmes',
-    'balmford',
-    'balmier',
-    'balmiest',
-    'balmin',
-    'balminess',
-    'balmont',
-    'balnab',
-    'balnacoil',
-    'balnaguard',
-    'balnain',
-    'balnamenoch',
-    'balnastraid',
     'balne',
-    'balneavis',
-    'balneology',
-    'balniel',
-    'balnuaren',
-    'balogun',
-    'balornock',
-    'balou',
-    'balouchi',
-    'balouchs',
-    'balquhandie',
-    'balraj',
-    'balri',
-    'balrog',
-    'bals',
-    'balsa-bomb',
     'balsam-like',
-    'balsamaria',
-    'balsamation',
-    'balsamea',
-    'balsaminaceae',
-    'balsan',
-    'balsawar',
-    'balsdean',
-    'balsemao',
-    'balser',
-    'balsfjorden',
-    'balslev',
-    'balson',
-    'balt',
-    'balta',
-    'baltamerica',
     'baltaretsu-gadea',
-    'baltay',
-    'baltcaribbean',
-    'balteatus',
-    'baltek',
-    'balterley',
-    'baltgulf',
-    'balthaz\'ar',
-    'balthis',
-    'baltic-coast',
-    'baltica',
-    'balticus',
-    'baltimore-based',
-    'baltimore-washington',
-    'baltimore/washington',
-    'baltisford',
     'balto-scandia',
-    'baltpacific',
-    'baltray',
-    'baltrunas',
-    'baltus',
-    'baltzer/company',
-    'baluchi',
-    'balun',
-    'balus-trade',
-    'baluster-style',
-    'balusters.',
-    'balwant',
-    'balybunion',
-    'balz',
-    'balzamo',
-    'balzarini',
     'balzer',
-    'bamahriz',
-    'baman',
-    'bambach',
-    'bambaclaht',
-    'bambatta',
-    'bambe',
-    'bamber/chamber',
-    'bamber/general',
-    'bamber/research',
-    'bambera',
-    'bambers',
-    'bambinos',
-    'bamboccianti',
-    'bambol&eacute;o',
-    'bamboo-cane',
     'bamboo-festooned',
-    'bamboo-like',
-    'bamboo-reed',
-    'bamboo-roofed',
-    'bamboo-strip',
-    'bamboo-wallah',
-    'bambou',
-    'bambrick',
-    'bambur',
-    'bamburi',
-    'bamerindus',
-    'bamhi+ecori+ncoi',
-    'bamhi-ecori',
-    'bamhi-ncoi',
-    'bamhl',
-    'bamhl-rsal',
     'bamileke',
-    'bamissi',
-    'bamm',
-    'bammer',
-    'bamnboozled',
-    'bamonte',
-    'bampot',
-    'bamrung',
-    'bamtik',
-    'ban&amp',
-    'ban\'',
-    'ban-the-bezier',
-    'ban-the-bomb',
-    'banabas',
-    'banacek',
-    'banakoye',
     'banakshol',
-    'banalisation',
-    'banalize',
-    'banalized',
-    'banaman',
-    'banan',
-    'banana-boat',
-    'banana-box',
-    'banana-coloured',
-    'banana-curved',
-    'banana-diet',
-    'banana-eaters',
-    'banana-fingered',
-    'banana-growing',
-    'banana-packing',
-    'banana-producing',
     'banana-split',
-    'bananaballs',
-    'bananaballs-style',
-    'bananaramas',
-    'bananaz',
-    'banane',
-    'banaster',
-    'banbury-daventry',
-    'banbury.with',
-    'bancada',
-    'bancaires',
-    'bancanus',
-    'bancario',
-    'bancas',
-    'bancasi',
-    'bancassurance',
     'bancau',
-    'bancomat',
-    'bancone',
-    'bancontact/mister',
-    'bancrofts',
-    'bancshares',
-    'band-box',
-    'band-cup',
-    'band-led',
-    'band-like',
-    'band-mates',
-    'band-members',
-    'band-numbers',
-    'band-of&rehy;brother-soldiers',
-    'band-parts',
-    'band-room',
     'band-saw',
-    'band-sawn',
-    'band-shapes',
-    'band-they',
-    'band-type',
-    'band-wide',
-    'band-wise',
-    'band/agent',
-    'band/label',
-    'band/live/ferry',
-    'band/pub/club',
-    'band:letters',
-    'bandaid',
-    'bandaratilleke',
-    'bandarban',
-    'bandas',
     'bandeath',
-    'bandeirantes',
-    'bander',
-    'bander\'',
-    'banderole',
-    'banders',
-    'banderway',
-    'bandgap',
-    'bandh',
-    'bandhavgargh',
-    'bandi',
-    'bandicoots',
-    'bandido',
-    'bandiged',
-    'bandiness',
-    'bandit-like',
     'bandit-style',
-    'banditi',
-    'banditman',
-    'bandkeramik',
-    'bandle',
-    'bandley',
-    'bandoeng',
-    'bandolieroed',
-    'bandoline',
-    'bandolo',
-    'bandon',
-    'bandoola',
-    'bandor',
-    'bandos',
-    'bandpass',
-    'bandras',
     'bands_on',
-    'bandsmaster',
-    'bandstring',
-    'bandula',
-    'bandwagon-jumping',
-    'bandwagonners',
-    'bandwagonning',
-    'bandwidth-on-demand',
-    'bandyopadhyay',
-    'banedryll',
-    'banefeld',
-    'baneh',
-    'baner',
-    'banergee',
-    'banerji',
-    'banff&ndash;jasper',
     'banffshire-born',
-    'bang\'',
-    'bang-a-bang',
-    'bang-box',
-    'bang-ins',
-    'bang-on',
-    'bang-the-big-bass-drum',
-    'bang-up',
-    'bang-up-to-date',
-    'bang-up-to-the-minute',
-    'bang-your-head-circles',
-    'bang.',
-    'bangalore-based',
-    'bangalore-madras-hong',
-    'bangalore/mysore',
-    'banger\'',
     'banger-racing',
-    'banghi',
-    'bangholm',
-    'bangila',
-    'banging\'',
-    'bangingly',
-    'bangkok&ndash;pitsanuloke',
-    'bangkok-ivoire',
-    'bangkok/pattaya',
-    'bangkok/phuket',
-    'bangkok/rangoon',
-    'bangkok/thai',
-    'bangla&rehy;deshi',
-    'bangladesh-born',
-    'bangladesh-myanma',
-    'bangor&ndash;newcastle',
     'bangor-born',
-    'bangor-bound',
-    'bangor-linfield',
-    'bangorian',
-    'bangorianism',
-    'bangorism',
-    'bangrak',
-    'bangroo',
-    'bangsa',
-    'bangshoot',
-    'bangtails',
-    'bangum',
-    'bangurambonaenergy',
-    'bangy',
-    'banham/commission',
-    'banhofs',
     'banim',
-    'banin',
-    'banis&rehy;ters',
-    'banishment-speech',
-    'banister-rail',
-    'baniyas',
-    'banjarmasin',
-    'banjaxed',
-    'banjoist',
-    'bank&rehy;notes',
-    'bank\'',
-    'bank-affiliated',
-    'bank-approved',
-    'bank-balances',
-    'bank-breakingly',
-    'bank-but',
     'bank-california',
-    'bank-chequer',
-    'bank-clerkcum-greek-galley-slave',
-    'bank-clerks',
-    'bank-controlled',
-    'bank-credit',
-    'bank-customer',
-    'bank-financed',
-    'bank-fraud',
-    'bank-gaza',
-    'bank-head',
-    'bank-induced',
-    'bank-led',
-    'bank-loan',
-    'bank-monitored',
-    'bank-of-england',
     'bank-reserve',
-    'bank-search',
-    'bank-share',
-    'bank-stick',
-    'bank-strewn',
-    'bank-watchers',
-    'bank.the',
-    'bank/building',
-    'bank/business',
-    'bank/fin',
-    'bank/folder',
-    'bank/lta',
-    'bank/national',
-    'bank/united',
-    'bank/univ',
-    'bank/young',
     'bank2',
-    'bank_so',
-    'bankamerica*',
-    'bankcard',
-    'bankchek',
-    'banker\'',
-    'banker-accountants',
-    'banker-v-the',
-    'banker/customer',
-    'bankers.',
-    'banketje',
-    'bankfull',
-    'bankhill',
-    'bankies',
-    'bankim',
-    'banking-bill',
     'banking-for',
-    'banking-reform',
-    'banking/financial',
-    'banklands',
-    'banklin',
-    'bankloan',
-    'bankmore',
-    'banknote-issue',
-    'bankole-noir',
-    'bankova',
-    'bankrobber',
-    'bankrolls',
-    'bankruptcy-reform',
-    'bankruptcyanother',
-    'bankrupts.',
-    'bankrupty',
     'banks-an',
-    'banks-have',
-    'banks-of',
-    'banks-which',
-    'banks.',
-    'banks/consultant',
-    'banks/discount',
-    'banks/post',
-    'bankseats',
-    'bankses',
-    'banksia',
-    'banksia-blossom',
-    'banksiae',
-    'banksian',
-    'banktop',
-    'bankwang',
     'banlga',
-    'banlieues',
-    'bann/festival',
-    'bannantyne',
-    'bannau',
-    'banned.',
-    'bannenberg',
-    'banner-bearer',
-    'banner-carrying',
-    'banner-decked',
-    'banner-holding',
-    'banner-towing',
-    'bannerama',
-    'bannerific',
-    'bannerware',
-    'bannerworks',
     'banning-notices',
-    'bannings',
-    'bannisetr',
-    'bannister-rail',
-    'bannister/meterologist',
-    'bannister/owner',
-    'bannister/weather',
-    'bannisterless',
-    'bannog',
-    'bannons',
-    'bannsiders',
-    'bannwalder',
-    'banny',
-    'banotti',
-    'banour',
-    'banovallum',
     'banqueroute',
-    'banquet-goers',
-    'banquet-hall',
-    'banqueteers',
-    'banquette-style',
-    'banquetting',
-    'bansal',
-    'bansbury',
-    'banshee-wail',
-    'banstead&rehy;horton',
-    'banston',
-    'banstustan',
-    'banta',
-    'bantam\'s-egg-sized',
-    'banted',
-    'bantem',
     'banterings',
-    'banterweight',
-    'banties',
-    'bantling',
-    'banton/taylors',
-    'bantu-speaking',
-    'bantustans/homelands',
-    'bantva',
-    'bantwick',
-    'banty',
-    'banu',
-    'banubian',
-    'banuta',
-    'banvie',
-    'banvilles',
-    'banyankole',
     'banyans',
-    'banyas',
-    'banyu',
-    'banyuls',
-    'banyuls-sur-mer',
-    'banza',
-    'banzato',
-    'banzhuren',
-    'banzie',
-    'baoding',
-    'baosheng',
-    'baotou',
-    'baow',
-    'bapc.10',
-    'bapc.114',
-    'bapc.177',
     'bapc.20',
-    'bapc.207',
-    'bapc.211',
-    'bapc.87',
-    'bapji',
-    'bappenas',
-    'bappoo',
-    'bapputchin',
-    'bapst',
-    'bapti',
-    'baptis&eacute;e',
-    'baptiser',
-    'baptises',
-    'baptist-based',
-    'baptist/unitarian',
-    'baptizers',
     'baqjaji',
-    'baquoy',
-    'bar&aacute&ccaron;nick&aacute',
-    'bar&egrave;ge',
-    'bar&oacute;n',
-    'bar&rehy;belle',
-    'bar&rehy;low',
-    'bar&rehy;stool',
-    'bar-',
-    'bar-bands',
-    'bar-bar-bar',
-    'bar-bar-ians',
-    'bar-be-quick',
-    'bar-bells',
-    'bar-billiards',
-    'bar-blues',
     'bar-brasserie',
-    'bar-chairman',
-    'bar-clay-a',
-    'bar-code-reading',
-    'bar-corner',
-    'bar-crawl',
-    'bar-crawling',
-    'bar-cum-club',
-    'bar-fly',
-    'bar-food',
-    'bar-girl',
-    'bar-girls',
-    'bar-heads',
-    'bar-hopping',
-    'bar-jonah',
-    'bar-lifts',
     'bar-line',
-    'bar-maid',
-    'bar-meal',
-    'bar-mitzvah',
-    'bar-nun',
-    'bar-orientation',
-    'bar-parlour',
-    'bar-partitions',
-    'bar-propped',
-    'bar-propping',
-    'bar-rail',
-    'bar-restaurants',
-    'bar-stube',
-    'bar-sur-loup',
-    'bar-taut',
-    'bar-tender',
     'bar-tenders',
-    'bar-winged',
-    'bar-wires',
-    'bar-yosef',
-    'bar.code',
-    'bar/cafe',
-    'bar/residents',
-    'bar/snack',
-    'bar/snacks',
-    'bar/television',
-    'bar/vending',
-    'baraba',
-    'barabanka',
-    'barabra',
-    'barac',
-    'baracade',
     'baracaldo',
-    'barachiopod',
-    'baracs',
-    'barada',
-    'baragouin',
-    'baragueys',
-    'barahma',
-    'barai',
-    'barajasspecific',
-    'baraje',
-    'barajna',
-    'barajneh',
-    'barakah',
-    'barakhda',
-    'barakzai',
-    'baraldini',
     'baranauskas',
-    'baranavskas',
-    'barangay',
-    'baranov',
-    'baranova',
-    'barantes',
-    'barantyne',
-    'baraou',
-    'barapukuria',
-    'bararunyeretseinterior',
-    'barass',
-    'barassa',
-    'barates',
-    'baratheas',
-    'baratieri',
-    'barattero',
     'baraul',
-    'barazan',
-    'barb\'rous',
-    'barb-wire',
-    'barbadian-born',
-    'barbados*',
-    'barbados-guatemala',
-    'barbagia',
-    'barbak',
-    'barbalho',
-    'barbar',
-    'barbara&ndash;los',
-    'barbarella-style',
-    'barbaresque',
-    'barbari',
-    'barbarian&mdash',
     'barbarian-hunting',
-    'barbarianism',
-    'barbarization',
-    'barbarize',
-    'barbaros',
-    'barbaross',
-    'barbarousness',
-    'barbarton',
-    'barbato',
-    'barbatum',
-    'barbaulds',
-    'barbazanges',
-    'barbazza',
-    'barbe-bleue',
-    'barbe-celor',
-    'barbe-en-auge',
     'barbecoup',
-    'barbecueing',
-    'barbecues.',
-    'barbed-wire-ringed',
-    'barbed.',
-    'barbedienne',
-    'barbedly',
-    'barbella',
-    'barbelling',
-    'barbeques',
-    'barber-lomax',
-    'barber-style',
-    'barber-surgeons',
-    'barber/car',
-    'barber/darren',
-    'barberoni',
     'barberously',
-    'barbershop-style',
-    'barbezieux',
-    'barbi',
-    'barbiaux',
-    'barbicans',
-    'barbie-style',
-    'barbie.',
-    'barbier-baltz',
-    'barbigerous',
-    'barbino',
-    'barbira-scazzocchio',
-    'barbitone',
-    'barbizet',
-    'barbizon-plaza',
-    'barboards',
     'barborum',
-    'barbour-outfitted',
-    'barbour-ripping',
-    'barbour/co-ordinator',
-    'barbour/commercial',
-    'barbour/farmer',
-    'barbourfields',
-    'barbours',
-    'barboys',
-    'barboza',
-    'barbrak',
-    'barbro',
-    'barbrooke',
-    'barbuscia',
-    'barc',
-    'barcaldine',
     'barcarolles',
-    'barcella',
-    'barcellos',
-    'barcelon',
-    'barcelona&rehy;based',
-    'barcelona-born',
-    'barcelona-bound',
-    'barcelona-on-aire',
-    'barcelone',
-    'barcelonian',
-    'barcham',
-    'barchard',
-    'barchuk',
-    'barclay/resident',
-    'barclaycards',
-    'barclayloan',
     'barclays-sponsored',
-    'barcle',
-    'barcos',
-    'barcroft',
-    'barcud',
-    'barcus',
-    'barcza',
-    'bardacke',
-    'bardai',
-    'barddoniaeth',
-    'barde',
-    'bardelys',
-    'bardens',
-    'bardere',
-    'bardez',
-    'bardful',
     'bardgett',
-    'bardhi',
-    'bardili',
-    'bardney-lincoln',
-    'bardolf-vaux',
-    'bardolotry',
-    'bardolphian',
-    'bardsea',
-    'bardwick',
-    'bardy',
-    'bare&rehy;headed',
-    'bare-as-you-dare',
-    'bare-back',
-    'bare-banked',
-    'bare-bone',
-    'bare-boned',
     'bare-bottomed',
-    'bare-earth',
-    'bare-face',
-    'bare-fisted',
-    'bare-gnawn',
-    'bare-handed',
-    'bare-knuckles',
-    'bare-looking',
-    'bare-shelves',
-    'bare-shouldered',
-    'bare/grey/door/morrowless//lay/more/away/sorrow&rehy;less',
-    'bare/skippered',
-    'bareala',
-    'bareboating',
-    'bareboim',
-    'barebones',
     'bareev',
-    'barefield/thames',
-    'bareges',
-    'bareham-stanley/sculptor',
-    'barel',
-    'barella',
-    'barelvis',
-    'barely-alive',
-    'barely-changed',
-    'barely-checked',
-    'barely-controlled',
-    'barely-explored',
-    'barely-hidden',
-    'barely-lit',
-    'barely-precedented',
-    'barely-seared',
     'barely-supressed',
-    'barely-to-bed',
-    'barely-veiled',
-    'barely-worn',
-    'barenbadkogl',
-    'barene',
-    'barenholz',
-    'barent',
-    'barentin',
-    'barents&oslash;vya',
-    'barents&oslash;ya',
-    'barere',
-    'barerooted',
-    'barets',
-    'barf-o-rama',
-    'barf-worthy',
     'barflies',
-    'barflying',
-    'barfreston',
-    'bargain-hunted',
-    'bargain-level',
-    'bargain.now',
-    'bargaine',
-    'bargainings',
-    'bargany',
-    'barge-',
-    'barge-builder',
-    'barge-dwellers',
-    'barge-in',
-    'barge-scene',
-    'barge-type',
-    'bargeboarded',
     'bargeddy',
-    'bargeload',
-    'bargemon',
-    'bargger',
-    'bargining',
-    'bargraph',
-    'bargue',
-    'bargues',
-    'barguest',
-    'barharn',
-    'barian',
-    'barient',
-    'barillas',
-    'bariloche',
-    'baring-sponsored',
-    'baringo&ndash;maasai',
     'barinsfather',
-    'barisano',
-    'barisna',
-    'barite',
-    'barito',
-    'baritonally',
-    'barium-enriched',
-    'barium-rich',
-    'barjarg',
-    'barjees',
-    'barjonna',
-    'bark-based',
-    'bark-green',
-    'bark-investigators',
-    'bark-like',
-    'bark-rough',
     'barkan',
-    'barkausen-kurz',
-    'barkeep',
-    'barkeeper',
-    'barkening',
-    'barker-green',
-    'barker/actor',
-    'barker/designer',
-    'barker/economist',
-    'barker/grower',
-    'barker/henry',
-    'barker/new',
-    'barker/nuffield',
-    'barkess',
-    'barkett',
-    'barkev',
     'barkhar',
-    'barkings',
-    'barklem',
-    'barkless',
-    'barkly',
-    'barko',
-    'barkton',
-    'barkus',
-    'barla',
-    'barlaam',
-    'barle-due',
-    'barle-due/verdun',
-    'barley-fair',
-    'barley-grower',
-    'barley-meal',
-    'barley-mill',
     'barley-sugar-stick',
-    'barley-threshing',
-    'barley-twist',
-    'barley/conservator',
-    'barley/stained',
-    'barleywhite',
-    'barleywine',
-    'barlie',
-    'barlines',
-    'barling.',
-    'barlop',
-    'barlord',
-    'barlow/hancock',
-    'barlow/worcester',
-    'barlowe',
-    'barlton',
     'barltrop',
-    'barly',
-    'barmaster',
-    'barmcakes',
-    'barmill',
-    'barmily',
-    'barminess',
-    'barmitzvahs',
-    'barmkin',
-    'barmkins',
-    'barmoot',
-    'barmough',
-    'barmow',
-    'barms',
-    'barmy\'',
-    'barmy-king',
     'barn-door-sized',
-    'barn-doors',
-    'barn-raising',
-    'barn-storming',
-    'barnabases',
-    'barnabe',
-    'barnacle-like',
-    'barnadi',
-    'barnaline',
-    'barnard/operations',
-    'barnard/owner',
-    'barnarde',
-    'barnault',
-    'barnborough',
-    'barnbrack',
-    'barnchase',
     'barncluith',
-    'barncroft',
-    'barndale',
-    'barnden',
-    'barndorff-',
-    'barndorff-nielsen',
-    'barndt',
-    'barneboim',
-    'barnehurst',
-    'barner',
-    'barnes-storm',
-    'barnes.chris',
-    'barnes/',
-    'barnes/andrew',
-    'barnes/bicester',
-    'barnes/birkenhead',
     'barnes/brill',
-    'barnes/bucknell',
-    'barnes/cactophile',
-    'barnes/cherington',
-    'barnes/chipping',
-    'barnes/didcot',
-    'barnes/eynsham',
-    'barnes/fenny',
-    'barnes/gloucestershire',
-    'barnes/gloucestershire-avon',
-    'barnes/headteacher',
-    'barnes/kingham',
-    'barnes/lilley/berkshire',
-    'barnes/little',
-    'barnes/lydbrook',
-    'barnes/mk',
     'barnes/north',
-    'barnes/northampton',
-    'barnes/organiser',
-    'barnes/piddington',
-    'barnes/princes',
-    'barnes/radcot',
-    'barnes/sandford',
-    'barnes/shifford',
-    'barnes/shillingford',
-    'barnes/society',
-    'barnes/southmoor',
-    'barnes/st',
-    'barnes/stoke',
-    'barnes/stony',
-    'barnes/wendlebury',
-    'barnes/wiltshire',
     'barnes/winslow',
-    'barnes/witney',
-    'barnes/yarnton',
-    'barnesfield',
-    'barnesley',
-    'barnesmore',
-    'barnet/community',
-    'barnett/auxerre',
-    'barnett/beckford',
-    'barnett/bicester',
-    'barnett/bishops',
-    'barnett/bisley',
-    'barnett/brean',
-    'barnett/brize',
-    'barnett/burford',
-    'barnett/cambridge',
     'barnett/cheltenham/gloucestershire',
-    'barnett/cherwell',
-    'barnett/cirencester',
-    'barnett/cleeve',
-    'barnett/coleford',
-    'barnett/community',
-    'barnett/craswall',
-    'barnett/defford',
-    'barnett/eardisley',
-    'barnett/evesham',
-    'barnett/garnons',
-    'barnett/glewstone',
-    'barnett/gloucestershire',
-    'barnett/hampton',
-    'barnett/hay',
-    'barnett/hollow',
     'barnett/kington',
-    'barnett/little',
-    'barnett/live',
-    'barnett/longdon',
-    'barnett/m50',
-    'barnett/madley',
-    'barnett/maismore',
-    'barnett/minsterworth',
-    'barnett/misarden',
-    'barnett/neighbour',
-    'barnett/northampton',
-    'barnett/ocle',
-    'barnett/parkend',
-    'barnett/pershore',
-    'barnett/ross',
-    'barnett/sandford',
     'barnett/sedbury',
-    'barnett/shrivenham',
-    'barnett/slimbridge',
-    'barnett/stonehouse',
-    'barnett/stroud',
-    'barnett/symonds',
-    'barnett/tenbury',
-    'barnett/tetbury',
-    'barnett/upper',
-    'barnett/wintours',
-    'barnett/woodchester',
-    'barnett/woolhope',
-    'barnett/wormelow',
-    'barnett/wyre',
-    'barnetta',
-    'barnette',
     'barnewall',
-    'barnful',
-    'barnham/energy',
-    'barnhart',
-    'barnhill',
-    'barni',
-    'barnies',
-    'barnimir',
-    'barningham',
-    'barnitts',
-    'barniville',
-    'barnola',
-    'barnside',
-    'barnsley-by-the-seine',
-    'barnsley.rosemary',
-    'barnsley/gloucestershire',
     'barnsleys',
-    'barnslow',
-    'barnsmoor',
-    'barnstaple-torrington/meeth',
-    'barnstorm',
-    'barnstormer',
-    'barnt',
-    'baro',
-    'barocchi',
-    'barocci',
-    'barocco',
-    'barock',
-    'barog',
-    'barogi',
-    'barographs',
-    'baroin',
     'barois',
-    'barometer-thermometer',
-    'barometric-pressure',
-    'barometrically',
-    'baron\'s',
-    'baron/parent',
-    'barones',
-    'baronesses',
-    'baronial-barbaric',
-    'baronial-type',
-    'baronian',
-    'baronie',
-    'baronness',
-    'baronta',
-    'barontus',
-    'baroque\'n\'roll',
     'baroquerie',
-    'barotse',
-    'barouilles',
-    'barpeta',
-    'barpress',
-    'barquera',
-    'barquettes',
-    'barquins',
-    'barquisimeto',
-    'barquq',
-    'barr-hall',
-    'barr/115',
-    'barr/coach',
-    'barr/fitness',
-    'barr/scotland',
-    'barrac&otilde;es',
     'barrachan',
-    'barrackings',
-    'barracklike',
-    'barrackroom',
-    'barracks-metropolis',
-    'barracks-quarters',
-    'barracks-town',
-    'barrada',
-    'barradale',
-    'barradell',
-    'barrae',
-    'barrag&aacute;n',
-    'barrage-balloon',
-    'barrage-balloons',
-    'barragh',
-    'barragons',
     'barrameda',
-    'barran',
-    'barrancos',
-    'barranger',
-    'barraqu&eacute',
-    'barraquilla',
-    'barrard',
-    'barrassing',
-    'barratt/gloucestershire',
-    'barraty',
-    'barraud',
-    'barrawclough',
-    'barrcks',
-    'barre-chords',
-    'barredo',
-    'barrei-rinhas',
     'barrel-ageing',
-    'barrel-bottom',
-    'barrel-built',
-    'barrel-chest',
-    'barrel-curled',
-    'barrel-drums',
-    'barrel-ends',
-    'barrel-laden',
-    'barrel-like',
-    'barrel-on-wheels',
-    'barrel-rolled',
-    'barrel-top',
-    'barrel-vault',
-    'barrelene',
-    'barrelful',
-    'barrelfuls',
     'barrelhouse',
-    'barrellers',
-    'barrelly',
-    'barrels-a-day',
-    'barrelsful',
-    'barremian/aptian',
-    'barrena',
-    'barreness',
-    'barrenjoey',
-    'barrenpointed',
-    'barrero',
-    'barrete',
-    'barrett-boyce',
-    'barrett-connor',
-    'barrett-era',
-    'barrett-fixated',
     'barrett-vintage',
-    'barrett/heart',
-    'barrett/owner',
-    'barretti',
-    'barrex',
-    'barreyres',
-    'barrhill',
-    'barrhouse',
-    'barrica',
-    'barricada',
-    'barrichello/jordan',
-    'barricune',
-    'barrie-jon',
-    'barrie/cheltenham',
-    'barriejon',
-    'barrientos',
     'barrier-breaker',
-    'barrier-breaking',
-    'barrier-field',
-    'barrier-pole',
-    'barrier-ridden',
-    'barrier/lagoon',
-    'barriered',
-    'barriers/the',
-    'barrimore',
-    'barringas',
-    'barrington/league',
-    'barringtonia',
-    'barrique',
-    'barrique-aged',
-    'barrir',
-    'barris',
     'barrisdale',
-    'barrister-politicians',
-    'barristers-at-law',
-    'barristers.ps',
-    'barristerstuemselves',
-    'barrit',
-    'barritone',
-    'barrlett',
-    'barroas',
-    'barrochen',
-    'barron-fox',
-    'barron/master/st',
-    'barrounes',
-    'barroux',
-    'barrow&rehy;boy',
-    'barrow-carlisle',
     'barrow-diggers',
-    'barrow-in-',
-    'barrow-like',
-    'barrow-on-furness',
-    'barrow-wight',
-    'barrow-wights',
-    'barrow/coniston',
-    'barrow/former',
-    'barrow/scottish',
-    'barrowboys',
-    'barrowby',
-    'barrowcliffe',
-    'barrowfield',
-    'barrowfields',
-    'barrows/mother',
-    'barrrie-brown',
     'barry-battesti',
-    'barry-jon',
-    'barry-walsh',
-    'barry/james',
-    'barry/south',
-    'barryman',
-    'bars/lounges',
-    'barsad',
-    'barsanuphius',
-    'barse',
-    'barshchina',
-    'barshelf',
-    'barsi',
-    'barslow',
-    'barsortiment',
-    'barsoum',
     'barsoumian',
-    'barsteward',
-    'barston',
-    'barstools',
-    'bartal',
-    'bartali',
-    'bartasiena',
-    'barteling',
-    'bartelsen',
-    'bartender.',
-    'bartensham',
-    'barteria',
-    'barthe-de-neste',
-    'barthelemy',
-    'barthelett',
-    'barthet',
     'barthlemess',
-    'bartholinitis',
-    'bartholom&auml',
-    'bartholomaei',
-    'bartholomaus',
-    'bartholomew.',
-    'barthou',
-    'bartic',
-    'bartlemy',
-    'bartles',
-    'bartlet',
-    'bartlett/warwickshire',
-    'bartletti',
-    'bartlettminerals',
-    'bartliff',
-    'bartling',
     'barto',
-    'barto&ncaron;s',
-    'bartocci.while',
-    'bartok-and-brittenish',
-    'bartokian',
-    'bartoletti',
-    'bartolme',
-    'bartolom&eacute',
-    'bartolomej',
-    'bartolomeu',
-    'bartolomeus',
-    'bartolucci',
-    'barton-card',
-    'barton-hawkins',
-    'barton-on-seaborn',
-    'barton-stonesfield-',
     'barton/aa',
-    'barton/gloucestershire',
-    'barton/oxfordshire',
-    'barton/worcester',
-    'bartoni',
-    'bartonia',
-    'bartonon-humber',
-    'bartoszewski',
-    'bartra',
-    'bartram-hynde',
-    'bartram/tewkesbury',
-    'bartrum',
-    'bartsia',
-    'bartter',
-    'bartumeu',
-    'barulawski',
     'barum',
-    'baruma',
-    'barvellous',
-    'barver',
-    'barw',
-    'barwah',
-    'barway',
-    'barwickers',
-    'baryshnikovs',
-    'baryte-base',
-    'baryte-cemented',
-    'baryton',
-    'barzaghi',
-    'barzan',
-    'barzanl',
-    'barzdo',
     'barzini',
-    'barzona',
-    'bas-clerg&eacute',
-    'bas-rhone',
-    'bas/hercules',
-    'basa',
-    'basal-substracted',
-    'basalare',
-    'basalt-andesite-dacite-rhyolite',
-    'basalt-covered',
-    'basanites',
-    'basaula',
-    'basavapunnaiah',
-    'basavaraj',
-    'basaza',
-    'basca',
     'bascelt',
-    'basche',
-    'baschebi',
-    'bascilica',
-    'bascinets',
-    'basden',
-    'base&rehy;superstructure',
-    'base(s)',
-    'base-',
-    'base-10',
-    'base-boards',
-    'base-calling',
-    'base-commodity',
-    'base-deficient',
-    'base-emitter',
-    'base-form',
     'base-of-overburden',
-    'base-only',
-    'base-over-apex',
-    'base-period',
-    'base-plate',
-    'base-rate',
-    'base-stacking',
-    'base-superstructure',
-    'base-viol',
-    'base-words',
-    'base-zero',
-    'base/',
-    'base2',
-    'baseball-glove',
-    'baseball-hit',
-    'baseballer',
     'basebell',
-    'basecamps',
-    'basecoat',
-    'based-brewery',
-    'based.ll',
-    'basedin',
-    'basedow',
-    'baseful',
-    'basehart',
-    'baseheads',
-    'basel&mdash',
-    'baselayer',
-    'baselchiasso',
-    'baselessness',
-    'baseley',
-    'baseline\'',
     'basement-room',
-    'basement-type',
-    'basement.',
-    'basementmembrane',
-    'basena',
-    'basepair',
-    'basepairing',
-    'basepaths',
-    'basepoint',
-    'bases-per',
-    'bases.',
-    'bases/cubicles',
-    'baseworx',
-    'basgarat',
-    'bash&omacr',
-    'bash-up',
     'bashala',
-    'basharmal',
-    'bashayer',
-    'bashed-in',
-    'bashed-up',
-    'basheer',
-    'bashelaya',
-    'bashford',
-    'bashford/inmate',
-    'bashforth',
-    'bashikarov',
-    'bashings',
-    'bashinkel',
-    'bashkirian',
-    'bashkirov',
-    'bashkirova',
     'bashkirria',
-    'bashkirsky',
-    'bashkirtostan',
-    'bashmachnikov',
-    'bashore',
-    'bashorun',
-    'bashourun',
-    'bashow',
-    'bashy',
-    'bashyam',
-    'basi-occipital',
-    'basic(z80)',
-    'basic-activity',
-    'basic-facilities',
-    'basic-guitar',
-    'basic-model',
     'basic-needs',
-    'basic-research',
-    'basic-sounding',
-    'basic/helix-loop-helix/leucine',
-    'basic/ultrabasic',
-    'basical',
-    'basicity',
-    'basicline',
-    'basicprotein',
-    'basidiomycete',
-    'basil&iacute;o',
-    'basil-sprigs',
-    'basil/cherry',
-    'basila',
-    'basilan',
-    'basileos',
     'basilic',
-    'basilichetta',
-    'basilio-he',
-    'basils',
-    'basin\'',
-    'basin-and-rise',
-    'basin-floors',
-    'basin-nut',
-    'basin-shaped',
-    'basin-wide',
-    'basin.',
-    'basin/bidet',
-    'basin/catchment',
-    'basina',
-    'basinful',
-    'basinghall',
     'basingstoke/leeds/glasgow',
-    'basinio',
-    'basinward',
-    'basiphilous',
-    'basis&mdash;in',
-    'basis-for',
-    'basis.for',
-    'basis.he',
-    'basis.uttlesford',
-    'basisphenoid',
-    'basistipes',
-    'basiti',
-    'basket-backed',
-    'basket-cars',
-    'basket-edge',
-    'basket-full',
     'basket-hilted',
-    'basket-like',
-    'basket-man',
-    'basket-ware',
-    'basket-weavers',
-    'basket-worker',
-    'basket/rack',
-    'basketball-playing',
-    'basketballers',
-    'basketeer',
-    'baskett-ful',
-    'basketter',
-    'basketware',
-    'baskhkortostan',
-    'baskine',
-    'basle.the',
     'basllycoan',
-    'basm',
-    'basmadjian',
-    'basnyat',
-    'basophil',
-    'baspograss',
-    'basprog',
-    'basq',
-    'basque-language',
-    'basque-oriented',
-    'basque-speaking',
-    'basque-style',
-    'basquiat-inspired',
-    'basquiats',
-    'basqyuet',
-    'bass&eacute;e',
     'bass-and-treble-no-mid',
-    'bass-as-lead',
-    'bass-baritones',
-    'bass-bassoon',
-    'bass-biased',
-    'bass-driven',
-    'bass-drum',
-    'bass-grappling',
-    'bass-ish',
-    'bass-led',
-    'bass-o-',
-    'bass-parts',
-    'bass-spectrum',
-    'bass-sponsored',
-    'bass-strengthener',
-    'bass-viol',
     'bass-voiced',
-    'bass-wise',
-    'bass/baritone',
-    'bass/drums/guitar',
-    'bass/guitar',
-    'bass/guitar/drum',
-    'bass/mid/treble',
-    'bassackward',
-    'bassai.',
-    'bassaleg',
-    'bassana',
-    'bassanio.',
-    'bassard',
-    'bassary',
-    'bassas',
-    'bassat',
     'bassatine',
-    'bassbase',
-    'bassdrum',
-    'basse-normandie',
-    'basse-terre',
-    'basse-vilaine',
-    'bassellin',
-    'bassem',
-    'bassenden',
-    'bassene',
-    'basser-bye',
-    'basserama',
-    'basses-pyr&eacute;n&eacute;es',
-    'basset-horns',
-    'basset-hound',
-    'bassett&amp;co',
     'bassett/oxfordshire',
-    'basseys',
-    'bassford',
-    'bassi',
-    'bassia',
-    'bassiahigher',
-    'bassiana',
-    'bassianalide',
-    'bassie',
-    'bassier',
-    'bassij',
-    'bassinets',
-    'bassinette',
-    'bassingbourne',
-    'bassingham',
-    'bassingthwaighte',
     'bassington',
-    'bassiouni',
-    'bassirou',
-    'bassiry',
-    'bassishaw',
-    'bassix',
-    'bassmaker',
-    'bassnet',
-    'bassoff',
-    'bassone',
-    'bassoons.',
-    'bassplayer',
-    'basstech',
-    'bastafield',
-    'bastaisk',
-    'bastard-metal',
     'bastardballs',
-    'bastardella',
-    'bastarding',
-    'bastardise',
-    'bastardization',
-    'bastardize',
-    'bastardizing',
-    'basterfield',
-    'basters',
-    'bastert',
-    'bastes',
-    'bastiaansen',
-    'bastianelli',
-    'bastiano',
-    'bastica',
-    'bastien-thiry',
     'bastille-written',
-    'bastilles',
-    'bastin\'',
-    'bastinadoed',
-    'bastinal',
-    'bastione',
-    'bastioni',
-    'bastola',
-    'baston/witney',
-    'bastric',
-    'bastrop',
-    'basturt',
-    'basualdo',
-    'basutu',
-    'bat&aacute;n',
-    'bat&rehy;face',
     'bat&rehy;wielding',
-    'bat\'',
-    'bat-and-pad',
-    'bat-confusion',
-    'bat-crawled',
-    'bat-droppings',
-    'bat-dung',
-    'bat-faced',
-    'bat-leather',
-    'bat-sonar',
-    'bat-squeak',
-    'bat-wings',
-    'bat.',
-    'bat/bet',
-    'bataclan',
-    'batahola',
     'batailler',
-    'batailles',
-    'bataillon',
-    'bataire',
-    'batal',
-    'batala',
-    'batalla',
-    'batallions',
-    'batam.',
-    'batan',
-    'batang',
-    'batarde',
-    'batardes',
-    'bataroma',
-    'batastini',
-    'batatas',
     'batavian',
-    'batayle',
-    'batbandsmen',
-    'batburger',
-    'batcape',
-    'batcave',
-    'batch-loads',
-    'batch-oriented',
-    'batch-processing',
-    'batch-related',
-    'batch-to-batch',
-    'batch/run',
-    'batcha',
-    'batchelor_et',
-    'batco',
-    'batcombe',
     'batcopter',
-    'batde',
-    'bateau-mouche',
-    'batell',
-    'batellis',
-    'bateman/chairman/commoners\'',
-    'batement',
-    'baten',
-    'baten\'kov',
-    'batenkov',
-    'bater',
-    'bates&ndash;neil',
-    'bates/andrew',
-    'bates/chelsea',
-    'bates/colling',
-    'batesons',
     'batesville',
-    'bateyapplies',
-    'bateyfinds',
-    'bateysifts',
-    'bateytries',
-    'bateytwiddles',
-    'bath&rehy;wing',
-    'bath-brick',
-    'bath-bricked',
-    'bath-bristol',
-    'bath-bristol-gloucester',
-    'bath-chairs',
-    'bath-easton',
-    'bath-foam',
-    'bath-heat',
-    'bath-nights',
     'bath-robe',
-    'bath-room',
-    'bath-sized',
-    'bath-sponge',
-    'bath-suites',
-    'bath-tin',
-    'bath-treatment',
-    'bath/showers',
-    'bathall',
-    'batham',
-    'batham/west',
-    'bathams',
-    'bathans',
-    'bathcaps',
-    'bathchair',
-    'bathcube',
     'batherne',
-    'bathetically',
-    'bathhurst',
-    'bathing-area',
-    'bathing-costume',
-    'bathing-dress',
-    'bathing-machine',
-    'bathing-place',
-    'bathing-suits',
-    'bathing-water',
-    'bathing.',
-    'bathing/washing',
-    'bathocuprione',
-    'bathocuproine',
-    'bathonian',
-    'bathory',
     'bathos&mdash;giorgio',
-    'bathous',
-    'bathoven',
-    'bathr',
-    'bathrik',
-    'bathroom/toilet',
-    'bathroomed',
-    'bathrooms.',
-    'bathrooms.porcelain',
-    'bathrooms/',
-    'bathrooms/kitchens',
-    'bathrooom',
-    'baths.',
-    'baths/showers',
-    'bathsheet',
-    'bathtard',
     'bathtob',
-    'bathtoys',
-    'bathursts',
-    'bathyclyn',
-    'bathygobius',
-    'bathymetry',
-    'bathysphere',
-    'bati',
-    'batiashvili',
-    'batignolles',
-    'batik&rehy;printed',
-    'batiment',
-    'batin',
-    'batinah',
-    'bation\'',
-    'batistelli',
     'batiti',
-    'batjargal',
-    'batkin',
-    'batllismo',
-    'batman-based',
-    'batmania',
-    'batmans',
-    'batmobile',
-    'batmonh',
-    'baton-charged',
-    'baton-charges',
-    'baton-end',
-    'baton-less',
-    'baton-passing',
-    'baton-twirlers',
-    'baton-wielder',
     'batoncharged',
-    'batonist',
-    'batowski',
-    'batpad',
-    'batperson',
-    'batpist',
-    'batra',
-    'batrachian',
-    'batricar',
-    'batrope',
-    'batrun',
-    'batsby',
-    'batschinski',
-    'batse',
-    'batshaw',
-    'batsheva',
     'batsi',
-    'batsman-captain',
-    'batsman/keeper',
-    'batsman/off-spinner',
-    'batson/aylesbury',
-    'batsqueak',
-    'batsuuri',
-    'batswana',
-    'batta',
-    'battalio',
-    'battalion&mdash;would',
-    'battalion-sized',
-    'battayle',
-    'batte',
-    'battek',
-    'battel',
     'battement',
-    'battements',
-    'battenberkaburg',
-    'battenbo',
-    'battenburg',
-    'battenburged',
-    'batteries-not-included',
-    'battersea-fields',
-    'battersea-living',
-    'battery-charger',
-    'battery-electric',
-    'battery-farmed',
-    'battery-fed',
-    'battery-free',
-    'battery-generated',
-    'battery-hen',
     'battery-house',
-    'battery-only',
-    'battery-pack',
-    'battery-run',
-    'battery.the',
-    'battestin',
-    'batteux',
-    'battey',
-    'batthyany',
-    'battiads',
-    'battig',
-    'battisborough',
-    'battishill',
-    'battistella',
-    'battistero',
-    'battisti',
     'battiwala',
-    'battlbattle-winningormance',
-    'battle&rehy;ground',
-    'battle\'',
-    'battle-barge',
-    'battle-car',
-    'battle-charred',
-    'battle-colours',
-    'battle-damage',
-    'battle-excitement',
-    'battle-fatigue',
-    'battle-fervour',
-    'battle-field',
-    'battle-frenzied',
-    'battle-front',
-    'battle-gleam',
     'battle-groups',
-    'battle-hosted',
-    'battle-lust',
-    'battle-management',
-    'battle-monastery',
-    'battle-of-the-maps',
-    'battle-plan',
-    'battle-poem',
-    'battle-practice',
-    'battle-prayers',
-    'battle-prowess',
-    'battle-robots',
-    'battle-scared',
-    'battle-ship',
-    'battle-shy',
-    'battle-spells',
     'battle-squadrons',
-    'battle-standards',
-    'battle-stations',
-    'battle-tactics',
-    'battle-tank',
-    'battle-towers',
-    'battle-wagons',
-    'battle-worthiness',
-    'battlebridge',
-    'battlebury',
-    'battled_in',
-    'battlefield-type',
-    'battleflats',
-    'battlefleet',
-    'battleford',
-    'battlegroups',
     'battlehill',
-    'battlelake',
-    'battlescape',
-    'battleship-building',
-    'battleshocked',
-    'battlesmoke',
-    'battlestations',
-    'battletank',
-    'battletoads',
-    'battlewagons',
-    'battleweary',
-    'battleworthy',
-    'battman',
-    'batton',
-    'battram',
-    'battramsley',
     'battting',
-    'batty/director',
-    'batty/fairclough',
-    'batty/pauline',
-    'battyburns',
-    'battyed',
-    'battyman',
-    'batubara',
-    'batumi',
-    'baturus',
-    'batut',
-    'batuta',
-    'batvala',
-    'batwoman',
-    'batzio',
-    'bauakademie',
     'bauart',
-    'baubled',
-    'baublocke',
-    'baucis',
-    'bauddhaloka',
-    'baude',
-    'bauden',
-    'baudinus',
-    'baudis.',
-    'baudonivia',
-    'baudrier',
-    'baudrillard-influenced',
-    'baudrillardian',
-    'baudroie',
-    'baudry',
-    'baudson',
     'baudy',
-    'bauer/microsoft',
-    'bauer/southern',
-    'bauerism',
-    'bauermeister',
-    'baug&eacute',
-    'baughan/robbery',
-    'baughans',
-    'baughit',
-    'baughs',
-    'baughton',
-    'baugniet',
-    'bauhaus-archivmuseum',
-    'bauhinia',
-    'bauldewyn',
-    'bauldie',
     'baules',
-    'baulieu',
-    'baulker',
-    'baulkism',
-    'baumbach',
-    'baumber',
-    'baumfield',
-    'baumgard',
-    'baumgartel',
-    'baumhauer',
-    'baumiere',
-    'baumler',
-    'baumstark',
-    'baumwol',
-    'baunbury',
-    'baunhauer',
     'baunton/gloucestershire',
-    'baurat',
-    'baurs',
-    'bauru',
-    'baussy',
-    'bauthumleys',
-    'bauv',
-    'bauxitic',
-    'bauz&aacute;secretary-general',
-    'bava',
-    'bavai',
-    'bavandra',
-    'bavard',
-    'bavard/keep',
-    'bavarde',
-    'bavarias',
     'bavay',
-    'bavens',
-    'bavester',
-    'bavidge',
-    'bavin/gloucestershire',
-    'bavisan',
-    'bavol-mengro',
-    'bavouzet',
-    'bavoyeu',
-    'bawa',
-    'bawaeth',
-    'bawb',
-    'bawburgh',
-    'bawdier',
-    'bawdiest',
-    'bawdily',
     'bawdley',
-    'bawean',
-    'bawling-out',
-    'bawoyeuprime',
-    'bawu',
-    'baxby',
-    'baxendale/somerville',
-    'baxendell',
-    'baxengill',
-    'baxley',
-    'baxter-jones',
-    'baxter/hyland',
-    'baxtergate',
-    'bay&rehy;hopping',
-    'bay-bay',
-    'bay-bee',
     'bay-coloured',
-    'bay-trees',
-    'bay-windowed',
-    'bay/and',
-    'bay/rhos-on-sea',
-    'bayamon',
-    'bayan-&ouml;lgiy',
-    'bayano',
-    'bayar',
-    'bayarbaatar',
-    'bayard-white',
-    'bayatti',
-    'bayberry',
-    'baydhaba',
-    'bayditch',
-    'bayeaux',
     'bayeh',
-    'bayekenov',
-    'bayerd&ouml;rffer',
-    'bayernpartei',
-    'bayford/somerset',
-    'bayh',
-    'bayim-adomako',
-    'bayings',
-    'bayisa',
-    'bayker',
-    'baykonur',
-    'baykov',
-    'baylaucq',
-    'bayleaves',
-    'bayley-jones',
-    'baylie',
     'bayliffe',
-    'bayliss/neighbour',
-    'bayliss/smiths',
-    'bayliss/victim',
-    'baynham/chairman',
-    'baynham/principal',
-    'bayonet-drill',
-    'bayonet-like',
-    'bayonet-point',
-    'bayonet-revolvers',
-    'bayonet-sharp',
-    'bayonne-anglet-biarritz',
-    'bayport',
-    'bayram',
-    'bayrami',
-    'bayrum',
     'baysbrown',
-    'bayston',
-    'bayswaters',
-    'bayti',
-    'bayturson',
-    'bayyud',
+)
+
+blocks_87 = (
+    '$)d-hussein%$abad%!i%%ullah$!f%%aniya$%glawi$(ilant(s)&"er$!l$%mblee$!p$#roe$(sination%"s.',
+    '()/thriller($ates*)ion/could(%izing$-ult&pound;290\'#ers$"ye&"d.#!c$$arts$#her$!n#"ed$1gai&rehy;wielding$#man',
+    '&(l&eacute\'%agist\'&e-time("d\')!.(.r/disassembler\'"y*(*-decisions)$hall)(language)$only)&robots)#see)+to-assembly(!.',
+    '($lign(%woman&!y$\'novgrad%"te$)rtibility\'+on-training\'6ve-in-spite-of-herself)!.$$sing%$ment%-s&mdash;info/&(.further&\'ability&#ed.',
+    '&\'ionable&"me((nt-based+#led*//administrative,.ssistance/care*"ed&#or.(#ato(!e$)t-backing&,manipulation&&seller\'\'pecific&(turnover',
+    '&$wise%!.%,/liabilities%.s&mdash;though%"to&!s$\'verated)$ions$$yake#$face#%iatnt$)curazioni$!d$>gn-data-file(pmmlib.gimmspoly1A#dat',
+    'C#datC!l&\'ed-term\'*e-endorsee\'!r&\'ment(s)*"s.+#_as&#ors$#lek$3milation-adaptation,$ists$!r%#ati%"os',
+    '&!s%"i.%&stance%)t-control&%ance\'*!-+$even+#for*!s($t(s))&-coach*)secretary3(-general+#hip)%/bank',
+    '*(mistress)"s.*-/non-teaching+\'trainee*$hips&%ed.by\'$ncia\'!r&#ive$%talia%#ion##man&!n#"n.#%oc&gt',
+    '%%(6.1)%!.%%acion&$ited%*i&eacute;s&!a\'2&ccedil&atilde;oes(*rehy;tions\'+ci&oacute;n)"on\'4ted&rehy;rediffusion*"ly)\'sappear(,ion-approved,\'centres',
+    '+#.25,!a,$tony+"/a,(football,&hodder,%staff,!t-$rade+%alist+#has-"ve+4ist-representational+#s.7-"ps',
+    '%"s.$%iated$"li%$utas%"ve$&nantic$"rt$(sciation$#uad%$mani$$yled#!p#&sembly%$ssed\'$ment',
+    '$\'ociated)#ion$$ured#&t.sec.$,on-underlyne&"es#$ualt\'#ing\'!s$#ied$#lts$!m%(e-surely&#dly&!r',
+    '%!p&%tion.*"s.+,/aspirations,,expectations$$ntos$*r&eacute;e&)rehy;ance%*ance-owned)*/insurance)#the\'#tie%\'banipal%%ed-of%%ingly',
+    '%#ors#%wiper#&yntian$"ut"\'tafieva$\'ire-ing($like\'\'/rogers$\'kakalij$"no$$povo$!r%"ac%#eus#$berg',
+    '$#len$&mizole$#ngo$"re%!i&"on&#sk*&"um%#ley%(oid-belt("al*&-sized&(nychidae&"pe&+schematidae',
+    '#!h$$enia$\'ma-like\'\'related&!t\'\'ic-like#$ills#*ler-coller%\'y-jones&$/ram#$moor#!n#%ogeny$$hall$$lphe',
+    '%(-le-wall&)on-ribble&*under-lyme%\'/health&&trader%#ian&,shed-looking*!.(%ments$$phus$#rga%#ia.\'!s$\'undedly#\'ra/opel',
+    '&#han%$ddle%#han%"in%#kan%,l-travelling&$asia%$rium%#soi%$tegy%%uskas%"y.$!e%!l$$ibut',
+    '%!n&+gent-soaked%"te$#o\'s%"-1&,navigational&*physicists&%tarot%%arena%$belt%\'chemist\'#imp&&ytosis%%glial%*l&rehy;ogy',
+    '&$ogie*!s)!s*"ts(\'y-prone%%mancy(#tic&%etric)!y%*naut-speak)$ical&&esthes&+omer-priest(3ical-meteorological+!n',
+    ',!s("y.\'"se%&palace&%ecten&#hys)&ically&)sychology%!s%!v&$irus#$ucci$$dent$#rci%"ia',
+    '&%ensis$,tely-applied&!s#$wick#$ylar$%ranax""ue#$kari##lam##ras#%s4-am"$vall")w&acirc;n#"17#\'a-medha',
+    '%!-&$just$$ying#"im$"ss#$orth"/ylumapplication#*metrically(!x\'!y$,ptomatically\'(tically\'##nch$%deton$&tactic',
+    '!\'t&acirc$*mp;t-brand)&funded)\'hewlett))inherited)%owned($/usl#(dollar;t#)imacr;moi#(ndash;16)-6/bt&ndash;13*!s#)ocirc;mes#)pound;175#)rehy;this',
+    '"$-\'im##404#!a$$like%\'l-times$!t#$bats$"us#%class#\'dealing#&eileen#,first-glance#%grade#(homeness#&khalil',
+    '$"ne$#uja#$rest#$seat%$ries%#ven$$hara#$that%(e-double#$uni-&\'versity"".a##her"%/eisa#\'glasgow',
+    '#%trial""10#!3"&27/129"#3/1"-_,_at_er_best#&at_all&%first#+er_er_first(%m_all%)m_er_most#+long_length#$more#+of_at_least#\'random.',
+    '#$atga$$whai#"ba%!n$#rin##cey#%ensic#"fu##gia$&onists#"ia##lan&#tic(!s%"ya',
+    '$"eh$"ia#$mans$!e$(narkovic$#ont#(nasovski#%pattu#!r$$aoti%"xy$"et$"is#%tched$&gcatat',
+    '$!l%#lah##van$)istically#\'xgcyata\'#tat"$b-60"*c&rehy;659##-3\'#$.398$#404#"de#/gatggagaaggaggt#%halov$"ee',
+    '"!d#\'abanian"*e/attacked#$brin#!l#!m$)beraubend$(porality%"ts#%nding$$gdem$#ism$#sin#"po#!r',
+    '$$noon#"st"\'f3-6-2c#!i$#eld"&gofion$!r"3h&eacute;n&eacute;e#%.pol.#&anasia("os&#tos#!e$#ama$$ist/',
+    '%"as%$dene%$ings%#red%$wald&#old$"ma%&social$"n.%(a-plaque&\'/claude&%goras&$muse%&e/open&!s',
+    '&"a.\'$n(s)($-led)%style*(upported)$type%"or%\'ry-tuam,,-claremorris%)s-centred$\'rectomy%#lay&"ey%+oesclerosis%%smith',
+    ')*lancashire$%sians&#sts#$inio$&s-mons##lan$(ete-like(&statue\'!.&$ic-o($.but(*ally-built(1ism--disseminated(\'s-cross*(oriented',
+    '#$olle$"ny$#rpe$#ugh$"yd#%ritis&"us$!o%)-gryposis#\'ukorale##wal#%yrium%"us"$ians#"bu',
+    '#!k$"po#!m#$nder$#gle##ons#!p##qur#$shoo#$tlan"#ker#)ins-style&(/british\'%elgar&)on-willes',
+    ')(bereaved*&ritish)(diocesan))neighbour)\'patient)\'science)%villa#!o#%ynson".l&aacute;ntico."da%*circ;ntico#!a$$cail$!m',
+    '%!d%#ta-&"es&&ic-and)(coloured(%=bred(!i(!o("us\'-k-br&uuml;cke$.s/encyclopedia%%craft%#es.%&pheres#$east',
+    '$!n"#man#"el#*oda-atpute$&pheric$)rdarminto$%sfear%%pgere&-here&mdash;at*%-burn++hydrosphere+%ocean*&/decor+%ocean+\'surface',
+    '+&rather)+ic-electric%&tphere"\'n-based#)acealgach"#oes#$guin#%m-age%+bombardment)"er%&clouds%%fired%\'powered%\'radical%(smashing',
+    '$!a$!i%(c-bombed\'\'charges\'%force\'%scale($ized&*/molecular%&stical%"um%"ze\'!s&#ing$.s-to-ecologies)&planet',
+    '#.n-in-pickering$,ement/ransom%!s$"ia#"ra##uma$"ts")p&ndash;p#$-ase#$/ibm#!l$"as"!q"*r&aacute;s#(abilious',
+    '$&paldo.$&umatic#!e$$mble$$sias#%ibute$(capillus%#eps%#kle$#dae$$umed$!x#,o&rehy;cious$.ciously-rhymed&,ty-producing',
+    '%%hying%"ia$*sanguineum$\'tskyist$!x#!s#$tack##ypa%"id"$sabe$#oir#"ic$"na$&peeten#!s',
+    '##umi$!o$#shi$"ta"&t.gen.#(a-vadins$$boy.$*che&eacute\'"d.\'!e&*ment&mdash*!\'%"k\'&(-and-run\'(oriented',
+    '\'.reconnaissance&$ing.%"ts$)inability\'#nce&4ed-by-whatever-means(!.&%ment-&!t$!l%!a%#ids%#lah%"os$%myces',
+    '&$yake$!p$"rd%!s$$turk$"x\'%\'/cf-200#$cker#%earne$\'mpt-see\'$/try\'#eth\'"s.%$ting$"n-',
+    '-)president,!s&#urg(#row%#dad\')nce-lists+\'pattern+,student-name*(/viewing&(ed/would\'!e&$imes\'"n\'%$shun%!t',
+    '&$ioin(.n&rehy;getting/\'seeking)+-attracting*)diverting+&rawing*%fixer+\'ocusing*\'getters+\'rabbers*$held*$like*\'seekers)".2)#_in',
+    ')!e\'#ste%$uata%%zione$%pting$&rwards$)st/fiscal&&ations(!o$$well$&yneing#!f#0gtacatcagagaaccc#"ia$&buting',
+    '%%-full&$room%&a-wide%"um$#ero$&kismos$"le%"ia$"tb%#ide&#ude%2ude&rehy;formation(#(s)((-holders)\'scaling',
+    '(\'/belief)2tiredness/attitude(#may((s-deeply)#.24))/policies))supported\'\'inising)#ous\'#ual&"ed&"te$#ude$"vs$#yah',
+    '&!/$&ington#%neave##one$1rney&rehy;general(#(s)(\'-client)(general.0"ly(\'general($ship&$ment$%skirt)!s##rac',
+    '\'-ion-merchants+)repulsion+%style*!.*"s.,#and(,ve&rehy;ness*#-to*!/+&better*)_inasmuch**ly-grained-&shaped%#its%#nto',
+    '$#eed$\'ibtable&(u&eacute\'(tability(#es.(%ively%"ll%#ted$\'ocities%!t#"ta%$cker$*gcgcgggaat#!u$\'nements',
+    '%#ing#!y"\'ucehene$"ha##mba##ned#!z"$west##ick$"ll#&o-hour"!y##iah#&kinson#!p',
+    '&%ality%#dae#%rausk#!s#&tended"&zinger!+u&ndash;den"+-ag&rehy;te$$s-sb$&ustria#%vents"!a##lly#"o=#&ralion',
+    '$"ro#%dubon#$enas$#ree%&gines.%$oche%#row%#tin$0terre-sur-dronne)!.$$voye#%ignan#%jects##ois$#nne',
+    '$%ietia$"on#/uisi&egrave;res$)rn-tinted$%ssons""ca$$yacu#"be#*hacharlich%!n%"rn$&enbegg&%cairn&\'darroch\'$inny',
+    '&*orrhynchan&&tipple%!r$"in&&brecke&&cloich\'%ruive&\'gramont&$toul&$weet$#lee%%ochan$\'nasheen$(terlonie,!s',
+    '#+kland-bound*#red$$ward#$lair#%tion\'\'&-block($goer\'$able\'&ed-off(*er/sotheby$"or&%itees&$ytye#$ubas$"ne',
+    '#$aces%(iousness$"ne$!p$!s#$bury#4en-spender-isherwood%#cia%%esque$$ssus#,i-volkswagen$!/%"vw$"al%!s',
+    '\'$e(s)(*-conscious)(friendly)$love)*orientated)-participation)*researched(%/band)&church))performer)*readership((s/voters)#hip$!n$"o-',
+    '\'*nimatronic&%based&)cassettes\'#ued&%discs&)generator&*nightmares&*programmes&\'signals&%taped\'\'echnica+%ology\'*ypewriting)#ist&+visual-aids',
+    ',$ists%)/joystick&$oral&%video%\'logists%*metrically%!n&#ing%%phile*!s%&taping&#ext%&vision(%uelle$%ponde',
+    '%*-committee%!.%$aire%!e&!e%-ing/reporting&$onee&%vely.%#or.\'!/(,shareholders\'#ial\'"s.\'-y-recognition)%vocal',
+    '#/ley/oxfordshire#!o$"en$"in&!s$#uin\'"ii$$vera#$rain%!n$&ey-ann$#ian%!s%"us$#jus',
+    '""ed$!e#!n#%rback$\'nhammer$%sperg%$tadt".f-wie-der-sein#)arbeitung#%bruch#\'enthalt$(rstehung#&fheben$(orderung#(gelistet',
+    '#%idius$#ria#\'klarung#&strich#$vald#%wuchs"*g&ndash;13+!8*"26*"30+!1#%-sept##.22%!4#)24/sept23',
+    '#"ea$!e$!n$-r&ndash;omagh%#ing%#unt#!h$\'afatten$"er%!y$$isky$$lish$3nacloy&ndash;augher$#rim$*ton/mother',
+    '#)mentacion("ry\'"in#+sburg-stadt("er$!t%#aka#!t##uas$!e$$itse$&mentin$"ri&"ng$,st&ndash;3rd',
+    '-)september\'/oacute;w-grodno&!*&!-\'"21(!4\'"31\'!4\'!5\'#9th\'+bebel-platz\'(november&"/1\',weightlifter&%_even',
+    '&,e-ren&eacute&#ina(*e-the-less)&rgasse("is("us&"ly&&usstr.")htorities"\'idience#%tzotl"&jeszky")knasheals#"s.$(iausiogi',
+    '""l\'#\'acaspis%$ogen)!s$%gnier$"ye#%berry#)entissima$#tes##ide$!s#!l#$nage%!y#(onacaras',
+    '#$troy"&m-gmbh"&ncyent#$dray#"es#"g*#"is#&jetitz#&shuman$$were#(t-mother$0ie-kate-directed,&liking&&s_over$"re',
+    '"!p##ing"#rab$"it$&l-oral&)receptors%%/oral%\'s/orals$&ngabad$#ssi$\'ticised%#one#$eate\'!-$!i',
+    '&#us-$$nche%&g-zebe$+o-variegata%"la&"in%*reticulata#$ibat$(cholatum%#les%$omus$$gema$!i$"ne$*talcinerea',
+    '#$lism##och$#ise$#nzo#\'um-like#\'vandill"+s&dollar;10,#3.2,%5,000,070&ndash;200,000+\'250,000+/30&ndash;40,000,050&ndash;450,000+1400&ndash;600,000,050&ndash;550,000',
+    '+&90,000##bau$$ruch#(cultated)#ory#%druck#3einandergeschriehen$$ncio#)gangpunkt$\'ebauten%(stellten##hev#!i$"no#1l&auml;ndergesetz',
+    '$*andsdienst##ona%!e%"ia&!o#$perg$#ice&(iousness##ria&#-ii&!n#/senhandelstelle&&seiter%\'rlesene&0parlamentarische',
+    '$&ichten%,e-designated\'$land\'%style%!g$&teigen&*llunghalle%\'rahlung#,tauschdienst$$ells%"ns%,r/headmaster&\'e-faced\'$ness&,ity-rationed',
+    '$#in\'&&-based\'\'healeys\'&morris\'%rover\'%smith&$/car\'"mg\'(prisoner\'*sainsburys\'$west&&ianism$#min$#oft$"ra',
+    ')3-singapore-thailand*"us)/n&rehy;american*&-based+(designed+&funded+(japanese+#led+$made+&quoted*$/new)!s*"ia\'"o-("id',
+    '&$pius&%sians%&emoine%0ia&mdash;hungary\'\'--which(\'bohemia\'"ca\'#lia\'"n-)(american)%based)$held*(ungarian/!y)&jewish',
+    ')(occupied)&soviet(\'/german))slovenian*$wiss($ised&"tt%#lia%)o-italian\'\'serbian(&panish\'%tours#\'verkauf#-w&auml;rtiges$#eis',
+    '.!o#&\'ority#%eldac$!n%$fesu%$tike#.hentic-seeming+\'ounding+$tyle)%ators)#ist*%ty-to-%wilde(#kos(#que',
+    '$#ier$+or-autocrat\'\'centred\'$date\'\'fiction(\'unction\'(narrator\'(oriented\'&reader\'*subscriber)(rrogates\'+text-reader((o-reader((ransfers\'#vet',
+    '2!s\'*translator&%ative+"ly&%esses&!i\',&rehy;tarian\'%-ties\',al-judgement\'!s\'1tarian-democratic.+patriarchal/+lebiscitary-+/democratic),tive-looking',
+    '*"s-,!i,\'nursery,%those+".2+!/,\'doctors,)hospitals,\'persons)&tative()y&mdash;a*\'ndash;s*)rehy;wide)&-(dla)*\'bashing',
+    '**controlled*\'figures,&nanced+%unded*\'imposed*)sponsored+&ystems*#the,&inking)&/board*(hospital*"it*\'private*)religious*&school',
+    '&(lessness&(s/agents(,contributors(+journalists(#the&$ware$#urs\'%/fund#!i$(oneering$(stically(!s#"mn#%nomic#0o&rehy;matically',
+    '\'$swer+!s\'&tibody&*phrodisiac&\'ssisted%-b&auml;cklund&#ahn&+iographical&$uild%%canon\'\'talytic&$oach\'%mpany\'+nfiguration\'\'ok/heat',
+    '&%redit\'$imes&&ulture%)decrement.#ing\')structing&\'ialling\'$dact\'-fferentiation\'\'gestion%\'enhance&,xposure/auto%&faders&%eeder\'%llate',
+    '%)generated&&reaser&\'yration%+haemorrhage&\'ypnosis%\'iconism&\'gnition&+ncrementing\'&dexing\')oculation%$land)#ing&#ean%&makers\'$rine',
+    '&(echatons&%inute&&obiles&)utilation%&nomous&(umbering%#off%)promotion%\'receive\'(gulating\'&select($tart\'$turn&\'otating\'#ugh',
+    '\'&mplers\'"ve&%elect\'#nse*!s)#ing\'!t&%ketch&*uggestions\'(spension%%theft\'&rottle&$imer&$race()nsmission',
+    '&%eight&&inders%$zoom$!.%#bat$*activation%+gglutinated%(nalysers*"is)#zer&%tigen$/bank/autocheque(!s&!r%"ed',
+    '($aphy(5raphical/biographical0"ly-$zing%$lock%"ox$$call&$nnon&!p\'$ital&%rrier%&entres)"ic&&phalic%%hange',
+    '&#oke&(thonists%&loning&"ub(!s%&oncern\'#fig*\'uration&"ok&(rrelator%$raft%%uring$$dale%#eal&%frost',
+    '&2terminaci&oacute;n%\'idactic*!s%$romo$)eroticism%(xec.bats$$fact(!s%#ill&\'nancing&"re%$lash&$ight&)uorescent%\'ocusing',
+    '$\'gavaeia\'"ea%%eddon&$nics&&rechte&*stionnaire%%rafts\'*ph-hunting$+hagiography%\'ypnosis$#kat$$land%#ite%$ogon$&macity',
+    '\',i&rehy;cally(%aclly(&c-only*%pilot)*ally--have.*increasing(#on\'*)-oriented*!s(#que($sing($zing\'!s%"ec&!n',
+    '&!x%"ic&&zation%"ne%*obile-free)!i*#ste*"ty&&rphism&%tive.\'!o$"na%#ets%"ic%,om&iacute;as',
+    '\'$ized\'!o()us-minded\')y-seeking(2/creativity/growth)*dependence)+restriction%$udge%#yms$&partei*&/parti%%hilia&,osphorylated%#ipe&#sta',
+    '%$oint&"rt($rait%,sychological$$quip&#ote$&racing&*diographer.$ical."y./-/fluorography&%nging%)eactivity&\'cycling&(gression',
+    '\'%ulate,!s&,presentation*$sion&!s&$turn&%verse%%ities%#kay%\'otating*+on-throttle$%sales&&mplers&$ving%$cope',
+    '&$ythe%$erve%$izer%#oft&!l&"me\'"ic%#pec&)lenectomy%#tat&)imulation%*uppression&$ture%%witch$$tech',
+    '%&herapy%$imer%(ritrator&$onic\'#phs$%valet%#ent(!s%#iew$%works$$zero#&pertus#&ronica#$tori#+umn-blazing',
+    '\'(coloured\'\'drilled\'"if\'\'planted(-utting-to-bed\'&spring\'&tinged&!.&!/\'%early\'&spring&#ale&!m&"us$$nite',
+    '##rgh#"ua""va#\'ergnats%,s-sur-l\'oise")x(iliary)#&-morts#\'endunum$%rrois##ias$#lia\'"ns&!o"#zac##ias',
+    '!$v-8b#.av-avail-av-is")/film/vtr"#142"$4600$"25",8000&ndash;8"*aangsbetyg##dex$!i#%erage#%gnina#!i$#ble$.l&rehy;ability',
+    '&#the%$abil)$itiy+.y/co-operation)#tiy\'%le.by))/produced%#ble%#eth%%iable#!l$!a%!n&$che\')*-breakdown',
+    '$%iable%"ne$!l%"en$%onian##nce$"da$$gard%7uardia-transavanguardia$*t-gardism.-!e\'$rade\'\'uardian,"sm&%metal',
+    '&&gardes%!=$"zo#"on#&r-slav$#ina%!s$"ua#%unced"&bersek"#com"$dell##ic/#%varld"$edis',
+    '#"le$"la%!i#!m##nas$+da&ntilde;o$"el$$idad\'!s$#son$%ticum%#ura\'!e(!s\'+i&egrave;re',
+    '#/rage&rehy;sized\'%-cost\'"d.\'!r\'"s.(%/norm&$ing.$"ch&.&ndash;johnson$"ge$"ie%!s$&mectin$,off-tossizza$"re',
+    '%+ion-therapy(!.&0ve-to-appetitive$#ton$%ulino$"ys#$snes$"ta#2yron-loz&egrave;re",gareameasure#\'e.29.01#\'olemono"&hieved#"rr"$iaco',
+    '&!d%#iks&0on&rehy;oriented(!-)%based)&minded)(oriented($/ami)%space%#rix$%zione#$bras$"us#&cennes$)ulopecten',
+    '#*d-approved$#ano$"in&+-peroxidase$\'ly-read$$ness#&emores$#nus$!r#&faunas#*g&rehy;non$#dor#)ion-based#*l&eacute;s$"a*',
+    '$"ez$#ity#!n$!\'$#ash$$gton#"oc$%netta%#ica##ram$"ex#%sford$#hai$%iting$!o',
+    '$!i$!o#1um-intracellulare#"v1%!1$!3$#431"!k"$m602$"25##734"#neh$"ue#!i".ocado-coloured',
+    '%!t#&gradro#!i$1d-like-the-plague%$_all&$each%\'ability&$nces\'!t%"er%&ingthe%#nik$"ng$,r/&ecirc;tre#6n&rehy;gloucestershire',
+    '$$bank$&cliffe$$holm(!e$$mead$$side$$wick##uch&"ed#"vi#$wals##yde"$raam&"ov$%mescu',
+    '$#sya$!y##ili$"on#%o-730$"ra$!s"\'s&trade#%im321"\'tarjeet#(orkhanov"%unduk"$vago#%ocato!\'w\'thin\'',
+    '"$-caw##fly#$gosh#%right#&shucks)R-gee-look-what-happened-to-me-when-i-wasn\'t-trying"!1"\'a-a-a-y$%guaja#"da#$idah$#ts/#%kener&6ing-of-lesbian-desires#"le',
+    '$!i##mir#$ngga#$puhi#!r$.d&rehy;bearing+\'winning%(-holders&&making%$ance%#ed.&"es%*s-ceremony&%.tony&!/',
+    '%\'winning$)e-holland%!.%!h%-ness-building*)promoting*(training)!.)!/*+involvement*(updating%"re%!s%$that$$ness',
+    '#!t#"ut#-y&mdash;after+!i%)ndash;nth$"\'n$!-%\'from-it,$-all%%goals%#leg%&signal&$wing%#win$!.',
+    '$%/from%)morrissey%%there$*_from_each%"of$#awa$$days&"ze$#ing$-s&rehy;giving$\'yyyyyyy#%zadeh"$b672##949"#dah',
+    '#!l#)ry/author"0e&rehy;inspiring#!-$&filled%#ull#%fully#$less#$nydd#(someness&"ly#!y"*ford/fever#!u$&lizing',
+    '"$g997"%hiles$&tehall"&i1.tif$%0.tif$%1.tif$%2.tif$%3.tif$%4.tif#%2.tif#%3.tif#%4.tif#%5.tif#%6.tif#%7.tif',
+    '#%9.tif#"fe""ka$"rd#.ward&ndash;and\'\'-shaped)$ized\'(ly-named""ld#+grip-coated\'#ped##iya#%right#$wort""ms',
+    '##man#!n#+onor-renner#6pbopaloobopawombamboom#%rking$&ldwide#&tunsin"%rajas$"ka#1e/gloucestershire%#mmb#(istocrat"$some"%thing"#wrr',
+    '!&x&bsol"$-300##44c##ing#+les-thermes#$v401"!2#!0"&a-midi"#b+c#!6"\'e-adzes$%blade$#god$\'hammers',
+    '*!s%#ero$$like$#man%\'urderer$&shaped%$ling%\'winging$(trashing$\'wielder#(/johnson#\'grinder#\'lrodian$!s%#son',
+    '#!n$"ic&$ally"!i#&lenvoy$#lae&#ris$+station-230##ngs##om.%!a&&tising$"ns$!s%#kop',
+    '$\'-allied"#kxt"&le-box%&making%)producing%$tree$!.$!d$&guards$"s.$$tree"&minton"(o-axonic#&lemmal$$otls',
+    '"\'p-osf/1#\'cluster"&ssault"+tell/driver"%xeman"!y#!s!(y-a-tain$$y-ay#"ee%!e"!1"%amara#"nt#!t',
+    '%%olugh##yem""ce#\'kbourns#$life"%e-eye#!.#"ar$"ye#"le$!u#!m$%wenre#!n#&r-hare',
+    '$!y#$shea#!t#"va"$gell#$lara##ula#%wmdfg"$idan#!h##ssi##vor"&kbourn#"ut%#(f)',
+    '#!e$$ford$!n$&sbeare&)ury-bound#%iffes$#ngs##lus#)mesthorpe#"ot#"um"%mante$&raians&!n&!s',
+    '#%estry#"on%$ieri"+n-al-hulwah#$burg#%horeh#%sleys"%odyha#"ne$!t$"ua#"ul$"th"\'r-based#*/mauchline',
+    '#&eminne$(s/attack&%carer##hoh#"il$!s%*/lightning#*shirekarja(#men#%ykyan"!s#$bury#%coghe#!e$!n',
+    '$$eaia#&lebury"$toun"#ubi$!u#&dantes#!e#!p#\'rsaniyn$!u#!t#&verdic")vazovskiy"$wick"#yeh',
+    '%&supply#Fyyyyyyyyyyyyyyyyyyyyyyyyyyyyyywyyyyyyy"!z!,z&uacute;car")-rotation#.zibariminister"!a#!b$!u##deh&#del$(irachtin#$gury#$hari##iba',
+    '$!n%!s$#res#-lea-blossomed$!i#!n$$garo$"la$"za#$ouad#!p$(o-linked#)quinolone,,carboxylates#"ra',
+    '#&serine#"to#,y-le-rideout"-coit&iacute;a""ef##ito#)krbayzhan#"ma#&otrope#$rado$#edo$*i-armenian&$held#"za"#far',
+    '#$hadi#"ul""ha$&rrudin#\'uruddin")ide-based%!s#$enda\'"le#$lian#!n$$phos##one#&ridine$!u',
+    '$&deputy$!e$"ur"-maiparashvili$!t#$itia#%oddin"%newts"%o-dye##dye#%feifa##nal#(ospermic#*reductases$#ius',
+    '#&arrent#&itarte"#rad$"el$!q"\'treonam"%ucena##les#"ra$+e-and-green&$eyed"$vedo"#war"$ygos"$zano',
+    '#%iziya##ola##ulo$"ra%!o *b&aacute;n*#zer)-r&eth;ardalur#(breve;th#+circ;timent#,grave;gneres)%thory#*macr;rakot-!e$#p;a',
+    '&!j&!m&!p&%sub12("p2#)tilde;nos#&uml;hr\'"lf\'!r(#bel($lund\'$sler\'$umen"&bsol;a"*dollar;170',
+    '".eacute;arnaise*$tois+#rix)&chamel)(ghin-say)#hal)"la*"iz)0n&eacute;dictins2(ficiaire2#zet*#ais+$uges*%edict)&ranger',
+    ')\'tharram#+circ;cherel(#te-+$noir#"gr%)ave;glois"*flat&sharp&";7\'!s"-iacute;blicos)(l&aacute"0lsqb&egr&rsqb;ck&,;alfour&rsqb\'&i&rsqb#&t&gt;3',
+    '(!2(!5(&llocks("ng)"o."%ndash\'%;17cs*!f("23)"5c*!j*!s("36("52*!s',
+    '("st"&oacute(%;inne#*circ;cskei#%grave#,uml;-ermolli\'%cklin\'"hl()m/philips(#ner\'#kow\'%lckow(!l\'%mmels\'#rje',
+    ')!n\'%ttger"(rehy;218#$gr;a&!c")ucirc;che#+uml;cherons)!i)#ler(#ken\'#der\'-hnenapparates(#rle\'&k&uuml\'&lbring',
+    '\'#rge*(rschreck!,\'aeronautics"%bbitt""c\'"$gosh"$hahn##ead#$inch"%jesus"$long"$mena"#now",yerushulayim!#(0)',
+    '"#h)u#"1)""t)$!r"$urt)!**&amp;tard#,dollar&pound"#***%"**\'!*\'!s&"ds$$ocks$!s"%stard',
+    '!\'-----ks"#1\'s#%/b-1r#!0$"40$"50##160#(7f-30-ve#!s"$200s#"11#"4j$!s#"5j#!s',
+    '"!4##211#!6"!5#!1##2\'s"!7#"0s""90"!a#$-b-y$#n-g#%llele%&otrope##xis',
+    '\'!e(#ing\'%rains\'#uff%"ed%$itch%"ut##aby$%ldwin%$last#!e$%astly$"en$&nedict#"it',
+    '$&ocking#%ogged$$ther$!x#%rakes$"zs##ump"%c-d-e#"at#&hannel#$lass$"ub"#day##eck$&tector',
+    '#$rive"#e-d#%ffect#$vent"\'feature#(ifty-two$#lms##lat#1our-six-three-two\',two-one-five"%girls#*lucosidase#$roup#"ul"#h-s',
+    '#"-g$!l#,nternational"&joints"#law#*ymphocytic("id"#men$-rcaptoethanol##ode"!o"$pawn&!s#&icture$$llar',
+    '"!r##eal#%oosed#"un"#s-e#$hare$#ell$"it#$ide.#&plines#&ulphur"#tec$%sting"#u-t"(vitamins',
+    '##ord"!z!(.&amp;s.\'"w.##num"%0.a.c""1.$!1$!2#"0.##104#!2##391#!4##879',
+    '%!4%!9##906$"12%!3%!5%!8$"20%!4$"61"#2.1#"07#!7#!t"!5',
+    '"#a\'t#%.a.b.$"b.$#e.c$$g.a.$$o.r.$&t.o.d."&b.king$!n$&o.n.t.#&utcher"!c#,.&ndash;a.d.$$d.a.$&e.s.o.',
+    '$#rly#\'arotene##omm"#d.=$"a.$"b.$#d.a$&p.ltd.$"s."&e.ward#*ducational##ng.#$vans"%f.110$"i.',
+    '$"s.""h.$!p"!i#"ii"(lapillus"$m.a.$"k.$"s.#$/n.f"&number"&o.a.t.$!b$"e.$"s.',
+    '#%.c.m.%%ooper##rey"(r./l.m.s$"m.&"l.#$ufus"!s#%.2690$#476$"a.$"p.$"t.#&c(eng)"$t.c.',
+    '$"m.$"p.##ech#+hurigiensis"&w.p.a.##hat"!x##iii"$z.w.!%/0.5m#)0/22/0012($2003+!5+!6+!8',
+    '+!7($2013*"68+!9*"81)#107+!8*"24*"31+!2+!7*"48+!9*"50+!1',
+    '+!5+!6+!7+!9*"63+!4+!6+!8*"71+!4+!8+!9*"81+!4+!5',
+    '*"94+!7)#200+!2*"11+!8*"21+!7*"31+!4+!6&&4/2015*"20+!2+!3',
+    '&(6/0009-2&&8/0001#)1/25/0006*"11+!2+!3+!4+!5+!6+!9*"25+!6*"32+!4+!6',
+    '+!5+!6+!7+!8#)4/25/0012#)5/25/0001+!2+!3+!4*"10#)7/25/0001"$1.0m#!1"$56/1"!a',
+    '"$b002#!o#$read""c1"#day"!f"!h"!l""ne"*progenitor"!s"!t##ype""w."(yamagata',
+    '!$1-h7"!.#%8-env$(scfv-env)(momlvenv"*0&ndash;14#!0#!4$!0$!6#"52#"77#"84$!5"#116',
+    '#!5$!2",2-musicology#!2$!4$!9#"42#"67#"77""32#!4#"65$!6#!7#"83',
+    '""47""51#!n""66",706&ndash;44#"8a#!g""93#%57+20"#iss!$2/12#!a""00#"26#"36',
+    '""52"!9#!5""o3!$3*12"#002$!4$!6#"46""19"#227#"69#!7"#311#!2',
+    '#"01$!2$!3##467""82"=:5\'-attggcgagctcaggattcttc-3\'"!b"!j""rd"!s!#404#"55#"64"#103#"24',
+    '#"15#"34$!5#"46#"67#"87#"93"!3#"29#"68"#418#"34#"94"#547#"58',
+    '"!7"!8"!9"$bs07!)5&ndash;5"#000#!1"#106#"11""26#"92"*3-positive#"43"#500"#700',
+    '""90$!0"::5\'-cctgagggagatgcgccac-3\'""th!$6*12"!+"!0"#105#"65"#265#"77$!8"#318#"55$!9',
+    '#"99"!5#"00""63"#800""92!&7-root"#009#"30$!1#!6#!g"!2""36#"7s',
+    '#"7s"!5#"00"#700""b9!&8-type"!0#!0#"46#"xl"%20170"\'34(de3)""86""91!&9.12.1',
+    '#"57#"80#"90$!7"#134#"91"!2#!4""54"!6"!8#!5!$:0,5"#the!!=',
+    '"!0##.42"$3.21$"49"%45.46"!5"!d"!o"#the!(a&iuml;f#\'mdash;1#,scaron;iknez/#ovi#(tcaron;a"!\'',
+    '$,th-dominated&$ists*%salah#"th"&(hons)"&****ds"$-aby$"th#"ba#0ding-a-dang-ding+(ong-ding#$hrun#%na-na#)sponsored"%/bcal',
+    '#"ma##u.s""11$"bx#!2#!3#!4""20#"55"$34xd""40##733"#553$!8"#a-3',
+    '$%lambs$\'naa-naa#%a-aad$#aaa%(rbaaraaa$!d%"er$%rgain#"ba%"as#!c#&dasses$"en$$jies#!h',
+    '#)l-melqart$"en#\'n-shell#$quba#!r$!d$#gan$!h$#rrp##sam%$njav$!s$#tii#.th-nationalist%+ist-zionist',
+    '#$a-ba$"co$"la%!e%!u%!y$$mine$"na%$i/ap$%oshan$\'ra-anne$#ssu$%tunde(!i$#uta',
+    '#)b-sprague$"as$$itts$#ler\'!s$%tized#$chuk$"ia#*e-obsessed$"es$\'l-based%&icious%"on%!s&$burg',
+    '&#urg)!s%!y$\'r/fruit&\'gipsies%!a&#ham\'!m%*ton/foulis$*s-and-boys&&bolyai$"uf#+ic/inventor$!e%"s/',
+    '$#ker%#ian&"ns$&lonese$$nski$%rusas$&wanjit##kov#$lake$#ock$!u#(oon-like\'%sized\'(to-human%$shka',
+    '#&sfield$!t$!y#\'u-sahib$$bhai$#lal$"na$#ren$#ska\'!s$"ta$!u$!y#,y&rehy;faced*$talk',
+    '\'$sket\'"th(&terers+#ing&\'esotted&(oomerang\'$ttom%$care(%rying%#day&#yke%(elephant%#fat&%eeder)#ing',
+    '&\'riendly($lled&&urnace%%gates&#own&$rows%\'kissers%$like\'$nked\'\'stening%#mad\'#ker%&naming%(operated&5ut-with-the-bathwater',
+    '%#sat&#eal(!t&&ignals&%lopes&%natch&#oap\'"ft%\'talking&&rumpet%(watching&$ipes$"/a%\'invalid$$bels',
+    '%$over%%rafts$$fish$$grow(!s$%hoods$\'ishness$%jelly$&killer$$land%#on/\'"ic(%ensis(!s$&minder',
+    '$#shh%#its\'$tin\'%#wap$$talk$&walker%#ipe%$orld"#cai$#lar%!e%#hau$"ni$!r%#dis',
+    ')*eate-style-!s%$urea$#hae&$nals%!i&"ad$$iata%%flava%!o&#chi)!s&"li#,h&ndash;abel$&-again',
+    '$&/petri$#a-i$/elier-cardonsky&\'or-wimp()/spinster("s.%!v$,gesellschaft$"ir$$kovo$*man-turner$%owski$%stein$$tiar#$ifhe',
+    '&"in&$unum\'*s-carrying$"no$!o%$cchi#+k&mdash;one%%ndash%)rehy;drop.!s*&firing*&handed*&plates+\'ressure*\'streets',
+    '$!\'%$ards$*(strach\'s)$!*$#-17%!a&#che&/gainst-the-wall&(nd-sides\'$swer+"ed%#bar&#eat&#ite)"rs',
+    '&$rush&&usting%)calculate\'"st&%hains((nnelling($tted&*irculation&%ollar\'#mby\'%nfirm&&rossed*#ing&"ut%$date',
+    '&\'onation\'&orstep\'%ubles&%raped(%ughts&#uty%+elasticated&+nd-of-a-bus\'#try%%field\'"re\'"st)!s\'"ve&$lick',
+    ')!s%&gammon&$lens%&hander&%eader\'"el%!i&!f&+llumination&&n-form\'&terest%$kick%#leg&#ift\'#ght',
+    '&#ots%&marker&(utations%\'netting&#uts%+of-envelope(\'the-bus,(envelope,$head,$neck\'!f($ices&&rdered%&packed*!r',
+    '\'%rlour(!t&%edals&\'laiting("ne("te&#ost&)rojection(\'tection&&umping%&raised)#ing&#eef\'\'ference.!s',
+    '&#ing&#oad)!s\'+om-in-a-pub)!s\'&unding(#ted\'"w.("er%)scattered\'&rubber&&elling&%lappy\'$ider\'%oping',
+    '&#tab)$bers("ll\'"op($wing\'$raps(&etched&&uction\'\'fferers%$talk&"ie\'\'trating&2o&rehy;electronics\'!-(!a',
+    ')\'usiness($form(\'nursing()the-earth,&future,,kitchen-sink&%racks()nslations%*up-service\'!.%$veld&$owel%$wall\'%shing\'!y',
+    '&&inding&$oods%%yards&#ear%&zipped$!.%!a%\'doctors%$gate%"in&!t%$nick%#the%"up$&/cover',
+    '%\'forward%#let%2midfielder/striker%$will\'"th$!2$!5$&:calls%"in%+nominations\'!w%(speedway%$this\'\'ousands\'#ree',
+    '$!=$$_for$$bars%2encher-of-the-year%#ite("rs%$last&$ocks%)reakingly%\'urnered$\'channel%&lothed%&ountry%&rossed)#ing',
+    '(!/(#ped("s.%$unes$(ed-dated\'#off&#_in%!t$#fat%,ill/drainage%#lip(#ped)#ing(!s%#oot',
+    '$&garden%$lass%$roun)"d-+*foreground+:pattern-pattern-background*5/education/experience*#_in$-hand/forehand(!s&"ul\'!s((/clemens%#ead&$eled',
+    '&+use/rescuer$#in\'&&g-away(#the$\'lashers%#eys%"id&"ft&%ghted&#ner%%ogged$#man&$rker$$nuts$&orders',
+    '%#lay%$orch%\'ressure$%round)!s&#wer%#uns$*s&ndash;on%&catter++ed-electron+#ing%&ettown%%heesh&$ield\'"ft',
+    '&*de-numbing(!.%$lant\'!p(!s&$iden%&pacing%\'tabbers\'$mper&&itched&#ory&#rap\'#ipe\'$oke.*"rs',
+    '&#eep&%immer&#ung%%ystem$%teeth%\'rackies$&up.001\'$unet&(/restore%&s-naur$$veld%$iews$.ward&rehy;ness(!\'((-bending',
+    '*&urving)(directed)\'masking)\'sloping)$type(+ly-directed(\'s&mdash)(-looking*(slanting))/forwards)#_in&$shed&!y%#ell%#ind',
+    ',$ship&#rth$!x$%yard.#"ly#$olod$-n-and-cheddar&\'burgers&\'cum-ham&%happy&(sizzling%!.%$/ham%$eggs%"in',
+    '#!t$"ec%&raemic&+ia-fighting)\'killers)%laden)(negative(".0((/enzymes(/l/anti-parasite\'&ocidal+!e(*statically&$oids$%igras',
+    '%/n/herefordshire$$rial\'!n(!a&!s#$uase$%lites%(oviridae),us-expressed$!m$!s$#zzi#\'zkowske"\'d&mdash#!\'',
+    '%#oys%\'reathed$#cop$%debts$%e-das$\'for-you$$good$$hats%$uman$$loan$\'mouthed$(smelling%$tyle#$/bed#$ajar',
+    '%$hand%!i$#nce$#oui$&rchiyn%"ou$"ss%#tan$#wai%!y#*by/fawsley#$call#"da$#eil%!l',
+    '%!n&#ing&!s$&ingham&%sgill$&ridine$!s#)eev/pupil$!l%%sburg$#mus$"n-&&fuller&*wurtemburg%%horst',
+    '$)r-meinhof-!f%&eddine$#scu%$lade$)witz-dodd#\'gaduish%!n%%stein$)e-covered%$less%$more%)r-baiters\'%copse\'$grey',
+    '\'\'related\'&saving($tyle\'%watch&#ish&$line%$s/or%"tt$#oys#!h$(aroudine#!i$)a-batalla$"ks$"le',
+    '$!n$#ola$"us#!l$&anders$&ooking$&uarach$.y&rehy;printed+\'written%&-acted\'$imed&%baked(&lanced\'%eaten\'&ruised',
+    '\'*onstructed($oked&\'done-by\'&ressed&%faded\'%itted&\'handled\'"it\'#ung&(indebted(&formed&&judged&#led&*maintained\'$ixed',
+    '\'(rganized&\'phrased\'&lanned\'(resented&(recorded((membered&#set\'%igned(#ted\'&lashed\'\'melling\'%orted\'&tapled(&ripped&%timed',
+    '&&worked)!n\'&ritten%!.&#the%,/deceptively#$mash$%inded$&outhed##oer$"it#(ranprime$!i$#utt#%stube',
+    '$"an#$well$#ill#!y$#ear"\'e/rover##146#!a#%chler#"ej#!g#%kland#&l-poor#"re%!n',
+    '$$lund$+mann/wagner""ff$#ins$\'le-wall&)d-looking\'#/by&!r#!s#+ta-endorsed&&hoover&\'winning%&/shell##uor"0g&rehy;snatchers',
+    '#$\'ums##(s)#,-and-baggage$&barrow$(carrying$(dragging$$face%%iller%#ull$\'hosiers$%laden\'#ies%#ike$&shaped%%witch',
+    '$$wall#!.#&adates$$moyo$#nda$)sse-based\'!s$-tti-valsecchi#"bo$!y#%dogra#&e/head$"ho$#lle%"ow',
+    '$#tti#,gage-animals((carrying($list(\'servant(%train(&wagons\'&/goods(%money$&ed-out%%ridge%#son(!s$#ier%"ly',
+    '&"gs%"os%!s$"le%!i$&otrath$(y-bodied&&suited&)trousered\'#ype%#ish#.hdad-ruweishid(&tehran\'"is$$lani',
+    '%#use#$inal%#sky$#rov##lar#\'man-fox%"ti#7n&eacute;res-de-bigorre$!a%"ia%#lls&%stown%!r&!a$,ell/charcoal',
+    '%!t$\'ificent%"ni$&o-stat%!l&!s#"oe$"ng$$tomy$#uet#-pipe&amp;rehy\'(-playing\'!r$0uize/oxfordshire##rid',
+    '$"ut#,s-under-eyes$$hall&#wed$\'natcher+!s$*v&aelig;rd##uin%"os$-ley&ndash;tim$$ryan$"sh%!t#$wara%$shes',
+    '(!y"0h&aacute\'&iacute#"\'t#(a\'u\'llah$$dhur$"gi$!l$&masair%.ian-registered%$onde$"ng$)ri/figure$$thri#$call#"er',
+    '$"de$"nd##jee#$ktin#$lsen#"nd$%emann$*hofpassage$#ini#!o$$olas$!t#,r-mildenburg$)ain-based(%qatar',
+    '%$nani$#eah%(nborstel$&frheum$!i%"ye#-t-billionaire#!u"&ibakov%"rs##coi#$dera#!f#$gent$%neurs',
+    '$"ue#(kal-amur$#onn$"s/#&l-high$\'.andrew%$mark%\'richard%#the$$ed.a%#mos%!n%+y-lichfield&\'/bailey\'%chief',
+    '\'(hercules\'#nra\'+stroudwater\'.vice-commander&"an$&ieboro&$ston%\'ng-wire$!l%$ages&$mont&"ry%!e&!t%,i&egrave;re.',
+    '&"es&!o&$wick%)y-pommery$%ments$(or/hirer$"yn#\'mbridge#/n&rehy;de-terre$)-elsheikh%&maries$-/agricultural$.bridge/england+(hereford+&reuter',
+    '$\'s-marie&$type%)/resident&$west$#ter%"on%#ree#&occhis##rab%!m$%d-led%%board$!e$$rada%"os',
+    '$#sez#,t-and-switch%#box("es%&making%&runner%%sized$%/lure$#box\'"es$"ha$1ing-and-switching#"xa#)ze-topped%%craft',
+    '#!e$!e$"ux#"ja#(racharya%!m&$ovic#!t##uli"$kaar$$lite%"of$*mo-galaxen$!s$-tin&mdash;kgb',
+    '%#oko#(chylides#\'e-house%$line$&d-bean%!.$$land$!n%!.$&r-hill\'&olroyd&\'kozyrev&\'lutyens&\'mubarak&,shevardnazde',
+    '&%woman%,/broadcaster\'%urkes&%guest&$home&&nasuwt&%serck&&tenant\'#own%$ites%&sfield%%think$%stone$%wells#%gatia',
+    '$"im$%lanov$#min$&rushin*!\'$&shaish&#ish$!t%)chi-serai##ili$(ng-sheet&!s$%radze#"ke$"on',
+    '#"ok%#ele((-lokonga$"ol$(rstranas$#vka$%yanni#"ri##say$%haish$$teen#%thiar$$iari$#ria\'!n',
+    '$"la$&ninite$%radze"-l&rehy;conies#\'-an-sai#&1-stu1#+31digestion#)abacensis&0nov/dobrotvorski%%osteh$&calava%!e%+lava-masked*$type%&omment',
+    '%!o$#ena$#fas%"on%"re$#gan$!h$!i$(khnichov%!i%$jian%$lava%"ov%$umar$!l',
+    '$!n%!c&,e&mdash;this(*rehy;sheet\'!\'\'$-bob(#lug((of-trade(#pan(&sheets(%wheel\'*/extension\'#_in\'(d-budget)$flue',
+    '(&.crime(+/controlled\'"s-)#the(!/))borrowing((tatement\'$tool%"de&#ier%(oglossus&!s%#pur%!s%$tyre',
+    '$$rabe&!m%!t%"us$$shov%$inya%#oiu%!z$#wat#!b$%astre$"ec$$iani%"na$$uena',
+    '&"re$-erowiczdeputy$!h$"nh$#oni&,y&mdash;much\'+-caf&eacute\'!.\'(/terrace#(d&eacute$&-arsed%%domed%&gummed%%pated%#top',
+    '((-daverio()o-daverio%%nders%"ro%"uf$"ed%!n%%rhead&$nock&#sby\')dale-bred\'"on%!t$&headed$%icote',
+    '\'%/hunt&!o%"on%#sis&$sera$(ly-going$%ness.$-ock/paramedic%$mero%-n/oxfordshire&#nel%"on%%rnock$!r%%icked',
+    '&!k$$ucci%"in$\'vulture$$wick&"n\'\',-chamberlain\'!.\'%/city)*ompetition(*first-time($meat(&victim\'#ite%"yn',
+    '%(weighing$#anu$%boste$"ch$%d-out$%fires$"no%#scu%$tine$#rit%!o$/share/kirkibost%$tard&$eros$!t',
+    '$"wa#!f$!a$\'our-all\'$ites\'!s$%reish#$gair$"ie$$lass$$onie%#wan&#nie$#ray$!y',
+    '&%ilish$%ousie#&i-stui$!c%!k$"ff$!g$"ja%&innyam$!l$#nda%)ese-style%"oe$!s#\'jaffray',
+    '#(kanesque&#ise)!d\'&zation$$erne$!h%!i$!y#/l&rehy;scuffing+&hining$\'-aching\'!t%$band&#oys&\'reaking',
+    '\'$ying&.y-ball-by-ball%%chain*"ed&&lipped\'#ubs&&ontrol&\'rushing&.um-transmitter%%dress*"es%#end("ed%&fiddle\'$ring',
+    '%$head&&unting%$item%#pen&%layer%)retention%&scryer\'&uffing&$ense%(throwing&%ipped%"up%&valves&$room%\'watched',
+    '&&inners$).bearings$%/best&%ishop%*gloucester%(islander%$pass%\'teacher$&abosty%\'challan\'&ullish&$lava%\'d-opera,!s\'(singer.i',
+    '($tyle\'$type\'&writer-!s&"ic&!y%#man%*nce/bossom/!s&!d\'#ras&%tynes("re%\'rd/boar(\'friends',
+    '%*st-dumping\'!s%"ta&/er-deliberately%&vanich$#bag&$rrow*!s%&earing%%lazer$%child%$ocks$%dress$!e%%chin\'',
+    '&"ce%*rina-style(!i(!o&"up%+steros-type+"es\'"re%)t-dancers+#ing($rama\'%goers\'&making\')pantomime0!s',
+    '\'&skiing&(/classic&%goers&$ists&&master&%omane*"ia$(gomartin$(icastell%$gari%\'nacross\'$more(#uck\'$stow&,collig/ovens',
+    '\')er/centre&$tine\'"oy%*ol-trinity%&sodare&"ta(!s\'*ic-missile%#tor(!e%%vicar\'!o$%joint$$moor$\'nahinch',
+    '%&chbuie&"ks\'!y%$nacy&%eware%\'on-back)\'edecked)&lowing((catheter(\'dancing(&filled("or(%tyred(%valve\'%atics',
+    '($onde&"on%#t-a\'#box\'(counting&$tini%!u$$pens$,room-dancing(!.$%s.the%:/bollocks/knackers/goolies&%sugar%%ed-up%)laneyside',
+    '&$ones$$type$"um$$wood$)y-bonkers&#hoo%!.%&arnett%%bogey&%union%6castle&mdash;cushendun&(hratigan&&ollton(#man\'&nneely',
+    '\'"rr&#ran%&dougan\'"wn\'#yle&#uff%#een%\'founder%%gally\'%ragan&%roman(#oby%%hagan\'$nnon&&olland',
+    '\'#ura%&kilbeg+!s(%cavan\'$nler%&lesson&\'ongford\'#ugh*"an%\'macarry((elligott(#oll)%naghy\'%ginty\'#hon',
+    '&$onie\'"te&%ullan%\'nevoran&\'onaghie%$ogan&$onan%\'quinton%&ranter&$egan&"oe\'#gan%)sitteragh%\'trustan%#uan',
+    '(\'kranell%&warren&&illiam)#wil&%orkan#"ma%$cara&$neil%$ghie%"ha%%lcolm%"no%%vicar$#bra$!e',
+    '%%nhorn%#rls%!s$$ford$#ier&"st%!n&#ess$#ont##nab%$coil%%guard%"in%&menoch%&straid',
+    '%$avis%%ology$#iel$%uaren#$ogun$%rnock$!u%#chi\'!s#(quhandie##raj$!i$"og#!s$&a-bomb',
+    '&$aria\'$tion&"ea&\'inaceae%!n%#war$$dean$$emao%!r$\'fjorden$#lev$"on#!t$!a%&merica',
+    '%!y$)caribbean$%eatus%!k%$rley$$gulf$&haz\'ar%"is$(ic-coast&!a&"us%*more-based**washington)+/washington%%sford',
+    '$\'pacific$#ray%$unas$"us$+zer/company#$uchi$!n$\'s-trade%)ter-style("s.#$want#\'ybunion#!z$#amo%$rini',
+    '"&mahriz$!n#$bach&$laht%#tta$!e%)r/chamber\'\'general\'(research&!a&!s$$inos$(occianti%*l&eacute;o%&o-cane',
+    '\'$like\'$reed(%oofed\'%strip\'&wallah%!u$$rick$"ur&!i#\'erindus#-hi+ecori+ncoi%&-ecori&$ncoi$!l%%-rsal',
+    '$#ssi#!m$"er#(nboozled#$onte##pot#$rung##tik"%n&amp#!\'#+-the-bezier)#omb#$abas$#cek$$koye',
+    '$(lisation&"ze(!d$#man$!n%&a-boat)!x\'(coloured(%urved\'$diet\'&eaters\'(fingered\'\'growing\'\'packing((roducing',
+    '&%balls+&-style&%ramas&!z%!e$$ster#-bury-daventry\'%.with#$cada%$ires%#nus%#rio%!s&!i&\'surance',
+    '$$omat%"ne&+tact/mister$%rofts$&shares#%d-box%#cup%#led&#ike%%mates&&embers%\'numbers%8of&rehy;brother-soldiers%%parts%$room',
+    '(!n&%hapes%$they&#ype%$wide\'"se$&/agent%%label&)ive/ferry%(pub/club$(:letters$#aid%)ratilleke&#ban%!s',
+    '%\'irantes%!r&!\'&#ole&!s&#way$#gap$!h%\'avgargh$!i%%coots%"do%#ged%$ness%&t-like',
+    '&!i&#man$\'keramik$"le&!y$$oeng%\'lieroed\'"ne&!o%!n%#ola%!r%!s$$pass$#ras',
+    '%&master%%tring$#ula$-wagon-jumping)$ners*#ing%.idth-on-demand$)yopadhyay#&edryll$$feld$!h$!r%#gee%"ji#/ff&ndash;jasper',
+    '#"g\'$\'-a-bang%#box%#ins%"on%1the-big-bass-drum%"up\'(-to-date+*the-minute%1your-head-circles$!.$+alore-based*+madras-hong)\'/mysore$#er\'',
+    '$"hi%#olm$#ila%#ng\'\'"ly$5kok&ndash;pitsanuloke\'\'-ivoire\'(/pattaya)%huket(\'rangoon($thai$-la&rehy;deshi&)desh-born+&myanma$2or&ndash;newcastle',
+    ')#und\'(linfield&#ian)#ism\'"sm$#rak%"oo$"sa%$hoot$%tails$"um%-rambonaenergy$!y#.ham/commission$#ofs',
+    '$!n$+s&rehy;ters%,hment-speech%(ter-rail$#yas#(jarmasin%#xed$$oist#,k&rehy;notes$!\'$+-affiliated&\'pproved%(balances&)reakingly&"ut',
+    '&&hequer&:lerkcum-greek-galley-slave*!s&)ontrolled&%redit&\'ustomer%(financed&$raud%$gaza%$head%\'induced%#led&#oan%)monitored%*of-england',
+    '%&search&$hare&$tick\'$rewn%(watchers$$.the$)/building\'&siness%#fin&%older%#lta%(national%&united(!v%%young',
+    '$#_so$(america*$$card%#hek$#er\'&,-accountants\'%v-the&)/customer&"s.%#tje$$full$$hill$#ies%!m%\'ng-bill',
+    '(&reform\'*/financial$%lands%"in%#oan$$more$*note-issue$(ole-noir%"va$&robber&#lls%,uptcy-reform*\'another("s.(!y',
+    '&$have&"of&%which%!.%+/consultant&(discount&$post%$eats&!s%"ia\'(-blossom\'!e\'!n$#top$$wang',
+    '$%ieues#*n/festival$&antyne%!u$#ed.%%nberg%(r-bearer\'(carrying\'&decked\'\'holding\'&towing&#ama&$ific&$ware\'$orks',
+    '\'!s%$setr&(ter-rail)-/meterologist*%owner*\'weather)$less$"og%"ns$&siders$&walder$!y#$otti$"ur$&vallum',
+    '&\'t-goers($hall\'$eers\'(te-style(#ing##sal$$bury$(hee-wail$0tead&rehy;horton%"on%%ustan#"ta%-m\'s-egg-sized$"ed%!m',
+    '&&weight$#ies$$ling$*on/taylors$*u-speaking%/stans/homelands$"va$$wick$!y#!u$$bian$"ta##vie%$lles#\'yankole',
+    '%!s$!u%"ls\'(-sur-mer#"za%"to$%huren$"ie"%oding#%sheng##tou#!w"%pc.10&"14&"77',
+    '\'!7&"11%"87#"ji#%penas$"oo$&utchin#"st#"ti%*s&eacute;e&"er\'!s&\'t-based\'*/unitarian%$zers',
+    '##uoy";r&aacute&ccaron;nick&aacute$)egrave;ge$(oacute;n$*rehy;belle)#low)%stool#!-$%bands&%r-bar($ians%\'e-quick&#lls%(illiards%$lues',
+    '$(chairman%%lay-a%+ode-reading&$rner%$rawl)#ing%\'um-club$#fly%#ood$$girl(!s$%heads%&opping$%jonah$%lifts',
+    '$$maid%#eal%&itzvah$#nun$+orientation$\'parlour\'\'titions%&ropped)#ing$$rail%*estaurants$%stube%\'ur-loup$$taut%%ender',
+    '$&winged&#res$%yosef#%.code#%/cafe$)residents$%snack)!s$*television$\'vending##aba&#nka%"ra$!c%#ade',
+    '%&hiopod%!s$"da$%gouin%$ueys$#hma$!i$+jasspecific%!e%"na&"eh$#kah%#hda%#zai$%ldini',
+    '&%vskas%#gay%"ov\'!a%#tes&#yne$"ou$\'pukuria$2runyeretseinterior$"ss&!a$#tes%$heas%$ieri%$tero',
+    '$#zan#&b\'rous$%-wire$*adian-born&#os*(*-guatemala%#gia%!k%#lho%!r&+a&ndash;los&*ella-style\'$sque&!i\'(an&mdash',
+    ')#ism\'&zation(!e&"os(!s\'&usness&#ton%"to&"um%$ulds%&zanges&"za$\'e-bleue&%celor&\'en-auge',
+    '&%ueing("s.%-d-wire-ringed&!.&%ienne&"ly%#lla\'#ing%$ques%\'r-lomax\'%style(\'urgeons&$/car\'&darren&#oni',
+    '&*shop-style%%zieux$!i%#aux%$cans%\'e-style&!.&\'r-baltz%&gerous%"no%.ra-scazzocchio%$tone%#zet&(on-plaza$%oards',
+    '%,ur-outfitted(\'ripping\'-/co-ordinator*(mmercial(&farmer\'&fields\'!s%"ys%"za$#rak%!o&#oke$%uscia#!c$&aldine',
+    '$$ella\'"os&"on(,a&rehy;based)%-born,#und*\'on-aire(!e(#ian$#ham&"rd%"uk$,lay/resident\'%cards\'$loan',
+    '%!e$"os$$roft$"ud%!s$"za#%dacke%!i$(doniaeth$!e%#lys%"ns%"re%!z$#ful',
+    '$"hi$#ili$+ney-lincoln$(olf-vaux&$otry&%phian$#sea$$wick$!y#-e&rehy;headed$,-as-you-dare%$back\'$nked&#one)!d',
+    '%%earth%$face&%isted%%gnawn%&handed%(knuckles%\'looking%\'shelves\'(ouldered$U/grey/door/morrowless//lay/more/away/sorrow&rehy;less%)skippered$#ala$\'boating&"im&#nes',
+    '$,field/thames$#ges$4ham-stanley/sculptor$!l%"la%#vis%\'y-alive\'\'changed)%ecked()ontrolled\'(explored\'&hidden\'#lit\'+precedented\'&seared',
+    '\'&to-bed\'&veiled\'$worn$(nbadkogl%!e%$holz%!t&"in&,s&oslash;vya/"ya$"re%%ooted$"ts#(f-o-rama%&worthy',
+    '%$ying$&reston#+gain-hunted(%level\'$.now\'!e\'$ings%"ny$"e-&\'builder&(dwellers&"in&%scene&$type%\'boarded',
+    '%$load%#mon$#ger$%ining$$raph$"ue&!s\'!t#$harn##ian$#ent$$llas%$oche$,ng-sponsored&.o&ndash;maasai',
+    '$$sano%"na$"te%!o&%nally$+um-enriched\'$rich#$jarg$#ees$$onna#\'k-based%%green%-investigators%$like%%rough',
+    '%)usen-kurz$#eep\'"er%$ning%\'r-green&&/actor\'(designer\')economist\'&grower\'%henry\'#new(\'uffield%"ss%"tt%!v',
+    '$$ings$#lem&"ss%!y$!o$#ton$"us#"la%"am$%e-due)\'/verdun%&y-fair\'&grower\'$meal(#ill',
+    '\')threshing($wist&,/conservator\'\'stained&%white\'#ine$"ie%#nes&"g.$"op%"rd%)w/hancock\')worcester&!e$#ton',
+    '$!y#&master$%cakes$#ill&!y%$ness%&tzvahs$#kin\'!s$#oot%#ugh%!w$!s$"y\'%%-king',
+    ')!s%\'raising%(storming$&abases&!e%(cle-like%"di%$line%-rd/operations)$wner\'!e%#ult$\'borough%$rack$%chase',
+    '%$roft$$dale%"en%%orff-*\'nielsen%!t$%eboim%%hurst%!r%\'s-storm&&.chris&!/\'&andrew\'(bicester)(rkenhead',
+    '(\'ucknell\'*cactophile()herington)&ipping\'&didcot\'\'eynsham\'%fenny\'/gloucestershire6%-avon\'+headteacher\'\'kingham\'0lilley/berkshire)$ttle(\'ydbrook\'"mk',
+    ',&ampton\')organiser\'*piddington(&rinces\'&radcot\'(sandford(\'hifford*)llingford(&ociety)\'uthmoor(!t)#oke*"ny\'*wendlebury((iltshire',
+    ')$tney\'\'yarnton&%field&#ley&$more%+t/community&)t/auxerre((beckford)\'icester*%shops+#ley)$rean*#ize)&urford()cambridge',
+    '+%rwell)*irencester)%leeve)\'oleford*\'mmunity)\'raswall(\'defford()eardisley)&vesham(\'garnons)(lewstone*-oucestershire(\'hampton*!y)%ollow',
+    '(&little*"ve)&ongdon(#m50)%adley*&ismore)+insterworth*&sarden()neighbour)*orthampton($ocle(\'parkend)\'ershore($ross((sandford',
+    '))hrivenham))limbridge))tonehouse*$roud)&ymonds(\'tenbury*%tbury(%upper((wintours)*oodchester+%lhope*&rmelow)#yre\'!a\'!e',
+    '$#ful$*ham/energy&"rt%#ill$!i%"es%#mir%%ngham%#tts%%ville$#ola$$side%0ley-by-the-seine().rosemary(0/gloucestershire',
+    '&"ow%$moor%6taple-torrington/meeth&#orm)"er$!t#!o$$cchi&!i&!o%!k$!g%!i%%raphs$"in',
+    '$1meter-thermometer\',ric-pressure*$ally$#n\'s%\'/parent%"es\'#ses%,ial-barbaric)$type\'!n&!e%$ness%"ta&"us$*que\'n\'roll',
+    '$#tse$&uilles#$peta$$ress#%quera&$ttes%#ins&&simeto%!q#&r-hall$$/115%%coach%\'fitness%(scotland$,ac&otilde;es',
+    '&%kings\'$like\'$room\',s-metropolis)(quarters)$town%"da\'"le&#ell%!e%*g&aacute;n&)e-balloon/!s&!h&#ons',
+    '%!n&#cos&#ger%)qu&eacute\'$illa%"rd%%ssing%2tt/gloucestershire&!y%"ud%\'wclough$#cks$(e-chords%"do%(i-rinhas',
+    '\'&bottom($uilt\'%chest(%urled\'%drums\'$ends\'%laden(#ike\')on-wheels\'&rolled\'#top\'%vault&#ene&#ful)!s',
+    '&$lers\'!y&\'s-a-day\'#ful%+mian/aptian%"na&#ess&$joey&\'pointed%"ro%"te&\'t-boyce(&connor(#era(\'fixated',
+    '\'&/heart(%owner\'!i%!x%$yres$$hill%$ouse$#ica\'"da&,hello/jordan&#une%%e-jon&+/cheltenham&#jon&$ntos',
+    '-#ing(%field($pole(&ridden\'\'/lagoon\'"ed\'%s/the%$more%$ngas\'*ton/league*"ia%#que(%-aged%!r%!s',
+    '&/ter-politicians)(s-at-law*#.ps**tuemselves%!t&#one$$lett$#oas%$chen%%n-fox&*/master/st%$unes&!x%*w&rehy;boy&)-carlisle',
+    '\'#in-\'$like\'*on-furness\'%wight,!s&)/coniston\'&former\'(scottish&$boys\'!y&&cliffe&%field+!s&(s/mother$)rie-brown',
+    '&#jon&%walsh%&/james&%south%#man#)s/lounges$"ad%\'nuphius$!e$&hchina%#elf$!i$#low$(ortiment%"um',
+    '$&teward%"on&#ols##tal&!i%%siena$%eling&#sen%%nder.&$sham%#ria$+he-de-neste&$lemy("tt&!t',
+    '%(olinitis\'\'om&auml)#aei*"us)#ew.&!u$"ic$$lemy&!s&!t\'.t/warwickshire(!i((minerals%#iff&"ng',
+    '%)&ncaron;s%)cci.while%0k-and-brittenish&#ian%%letti&"me&)om&eacute("ej)!u*!s&$ucci%&n-card\'\'hawkins\'*on-seaborn\',stonesfield-',
+    '\'/gloucestershire\'+oxfordshire\')worcester&!i\'!a&)on-humber%\'szewski$"ra&\'m-hynde\'+/tewkesbury%"um$#sia$#ter$$umeu#\'ulawski',
+    '%!a#\'vellous%!r#!w$"ah%!y$&ickers#)yshnikovs$\'te-base\'(cemented%"on#%zaghi%!n&!l$"do',
+    '$#ona".s-clerg&eacute$%rhone#)/hercules#!a$-l-substracted%#are%:t-andesite-dacite-rhyolite\'\'covered$%nites$#ula$*vapunnaiah&#raj$"za#"ca',
+    '$"he&"bi$%ilica%$nets##den#5e&rehy;superstructure$#(s)$!-%"10%&boards%\'calling&(ommodity%)deficient%\'emitter%$form',
+    '&#nly&(ver-apex%&period&$late%$rate%(stacking&-uperstructure%$viol%%words%$zero$!/$!2$*ball-glove)#hit("er',
+    '$%camps%#oat$)d-brewery%#.ll%"in%"ow$#ful$$hart%$eads$\'l&mdash%$ayer%\'chiasso%\'essness&!y%$ine\'',
+    ')$type(!.((membrane$"na$$pair(#ing&#ths%$oint$%s-per%!.%)/cubicles$$worx#%garat#\'h&omacr$#-up',
+    '%$rmal%#yer$%ed-in\'"up%"er%$laya$$ford(\'/inmate\'"th$&ikarov%#ngs&#kel$&kirian\'"ov)!a',
+    '\'#sky\'&tostan$)machnikov$#ore&"un%$urun%!w$!y%"am#+i-occipital$&c(z80)%)-activity&*facilities&&guitar&%model',
+    '&(research&(sounding%9/helix-loop-helix/leucine&*ultrabasic%"al%#ity%$line%\'protein$)diomycete$*l&iacute;o%\'-sprigs%\'/cherry%!a&!n%#eos',
+    '\'%hetta&$o-he%!s$"n\'%)-and-rise&&floors&#nut&&shaped&$wide%!.%&/bidet&)catchment%!a%#ful%%ghall',
+    '%"io%$ward$\'philous$*s&mdash;in%$-for%$.for&"he&*uttlesford%\'phenoid%%tipes$"ti#*ket-backed\'$cars\'$edge\'$full',
+    '\'$like\'#man\'$ware(&eavers(%orker&%/rack&,ball-playing*#ers&#eer&%t-ful\'"er&$ware$*hkortostan$#ine#&le.the',
+    '#!m$&adjian#$nyat#%ophil#\'pograss$#rog#!q$+ue-language\'(oriented\'(speaking($tyle%,iat-inspired(!s$$yuet#*s&eacute;e',
+    '&&s-lead%)baritones\'%ssoon&%iased%&driven\'"um%)grappling%#ish%#led%"o-%%parts%(spectrum\'\'onsored&+trengthener%$viol',
+    '%$wise$)/baritone%,drums/guitar%&guitar+%/drum%*mid/treble$\'ackward%"i.%#leg%"na&#io.%"rd&!y%!s%!t',
+    '$$base$$drum$+e-normandie&%terre&\'vilaine%$llin%!m%$nden&!e%%r-bye&#ama%8s-pyr&eacute;n&eacute;es%\'t-horns)#und&(t&amp;co',
+    '%"ys$$ford$!i%!a&&higher&"na($lide%!e&!r%!j%$nets("te&\'gbourne\'#ham\')thwaighte',
+    '%$ouni%#rou&!y%$shaw%!x$%maker$#net$#off%"ne%$ons.$&player$$tech#\'tafield%#isk%(rd-metal',
+    '\'$ella\'#ing("se(&zation)!e)#ing$\'erfield&!s&!t%!s$\'iaansen&%nelli\'!o%"ca%(en-thiry',
+    '(!s%"n\'&%adoed\'!l%#one\'!i$#ola%(n/witney$#ric%"op$#urt#%ualdo$"tu"*t&aacute;n$)rehy;face',
+    '#!\'#(-and-pad$)confusion%&rawled$)droppings%#ung$%faced$\'leather$%sonar%%queak$%wings#!.#$/bet#%aclan$$hola',
+    '(!s\'"on%"re$!l%!a%"la&$ions$"m.$!n%!g$#rde\'!s%#oma$%stini$#tas',
+    '$#yle#(bandsmen$%urger#$cape%"ve$\'h-loads&(oriented&*processing&\'related&(to-batch%$/run%!a%\'elor_et$!o%#mbe',
+    '#"de#*eau-mouche$"ll&"is$7man/chairman/commoners\'%#ent$!n%$\'kov%#kov$!r$,s&ndash;neil%\'/andrew&\'chelsea\'&olling%#ons',
+    '$(yapplies%%finds%%sifts%%tries&\'widdles#+h&rehy;wing$&-brick*"ed($stol,+-gloucester%&chairs%&easton%$foam%$heat%&nights',
+    '\'"om%%sized&%ponge&%uites%#tin&(reatment$(/showers$#all%!m&%/west&!s%"ns$$caps%$hair%#ube',
+    '%\'tically$%hurst$(ing-area(\'costume(%dress(\'machine(%place(%suits(%water\'!.\'(/washing$)ocuprione)$oine%$nian%"ry',
+    '%"us%#ven$!r%"ik%*oom/toilet("ed("s.*)porcelain)!/*(kitchens\'"om$"s.%(/showers%$heet$$tard',
+    '&"ys$%ursts$%yclyn%&gobius%%metry%&sphere#!i$\'ashvili$\'gnolles$.k&rehy;printed$$ment$!n%"ah$#on\'$&stelli',
+    '#&jargal##kin#&llismo#)man-based&"ia&!s$%obile%"nh#*on-charged,!s&#end&$less&\'passing&(twirlers&\'wielder',
+    '%#ist$$wski##pad$%erson$#ist#"ra%%chian$$icar$#ope$"un##sby$\'chinski$!e$#haw%#eva',
+    '$+man-captain\'\'/keeper(+off-spinner$,on/aylesbury$%queak$$uuri$$wana#"ta%#lio(-n&mdash;would)&-sized%#yle$!e%!k%!l',
+    ')!s%*nberkaburg\'!o\'#urg*"ed%1ries-not-included&*sea-fields*&living&)y-charger((electric(&farmed)"ed)#ree()generated(#hen',
+    '($only($pack(#run\'$.the%$stin%"ux%!y$%hyany$$iads%!g%(sborough&$hill&%tella("ro\'!i',
+    '$6lbattle-winningormance%-e&rehy;ground&!\'&&-barge\'#car(&harred(&olours\'&damage\'*excitement\'\'fatigue(&ervour($ield(\'renzied)#ont\'%gleam',
+    '\'&hosted\'$lust\'*management((onastery\'+of-the-maps\'$plan(#oem(\'ractice*$yers)%owess\'&robots\'&scared(#hip)!y(%pells',
+    '((tandards*%tions\'\'tactics)"nk(%owers\'&wagons()orthiness&&bridge\'#ury&$d_in&*field-type\'$lats(#eet\'#ord&&groups',
+    '&$lake&%scape\',hip-building(%ocked\'$moke\'\'tations&$tank\'$oads&&wagons\'$eary\'%orthy$#man$"on$#ram\'$sley',
+    '$*y/director&*fairclough&\'pauline%%burns%"ed%#man#%ubara$"mi$#rus$!t%!a#$vala#%woman##zio")uakademie',
+    '#$bled%$ocke##cis#(ddhaloka$!e%!n$$inus%"s.$&onivia$$rier&0llard-influenced+#ian%#oie%!y$#son',
+    '#,er/microsoft&(southern%#ism%\'meister#(g&eacute$+han/robbery\'!s%"it%!s%#ton$$niet#1haus-archivmuseum$$inia#&ldewyn%"ie',
+    '$#ieu$#ker%#ism#%mbach%"er$%field$$gard\'#tel$%hauer$$iere$#ler$%stark$#wol#%nbury$%hauer',
+    '##rat$!s$!u##ssy#(thumleys#!v#%xitic#:z&aacute;secretary-general""va$!i$$ndra$"rd&%/keep&!e%#ias',
+    '##ens$$ster#$idge$1n/gloucestershire$#san#)ol-mengro$$uzet$#yeu""wa$#eth#!b$$urgh#$dier&"st%"ly',
+    '##ean#(ling-out#)oyeuprime#!u"#xby#1endale/somerville&#ell%$gill##ley#)ter-jones&\'/hyland&$gate".y&rehy;hopping#$-bay%"ee',
+    '$%trees$(windowed#$/and$+rhos-on-sea#$amon$,n-&ouml;lgiy%!o$!r%&baatar%\'d-white$#tti#%berry#%dhaba$$itch#$eaux',
+    '$%kenov$-rd&ouml;rffer%\'npartei#-ford/somerset#!h#*im-adomako$#ngs$"sa##ker$$onur%!v#%laucq$%eaves%\'y-jones$"ie',
+    '%,ss/neighbour(&smiths(&victim#-nham/chairman()principal#*onet-drill($like(%point()revolvers(%sharp%2ne-anglet-biarritz#$port##ram&!i$"um',
+    '$#ton$&waters#"ti$%urson!(olt-rigs',
 )
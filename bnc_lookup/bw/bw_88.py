@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_88 = (
+count_88 = 6695
+
+heads_88 = (
     'altar-gether',
-    'altar-ist',
-    'altar-like',
-    'altar-servers',
-    'altar-slab',
-    'altar-stone',
-    'altar.',
-    'altaration',
-    'altare',
-    'altarf',
-    'altarnum',
-    'altarwise',
-    'altbea',
-    'altcar',
-    'altdeutsche',
-    'altecea',
     'altenhaus',
-    'altenmarkt/zauchensee',
-    'altentann',
-    'alter/new',
-    'alteranthera',
-    'alterating',
-    'alteratively',
-    'altered\'',
-    'altered.',
-    'alterial',
-    'altermediate',
-    'altermnatives',
-    'alternaive',
-    'alternative&mdash;characters',
-    'alternative-development',
-    'alternative-fuel',
     'alternative-politics',
-    'alternative.even',
-    'alternative/college',
-    'alternatively&ndash',
-    'alternatively.',
-    'alternatively/additionally',
-    'alternativen',
-    'alternatives-a',
-    'alternatives-fat',
-    'alternatives.',
-    'alternativists',
-    'alternativley',
-    'alterniflorum',
-    'alternizza',
-    'altertums',
-    'altesses',
     'altgermanische',
-    'althaea',
-    'althaus',
-    'alther',
-    'althernate',
-    'altheus',
-    'althoff',
-    'althogether',
-    'althorne',
-    'althoug',
-    'although/because',
-    'although_a',
-    'althought',
-    'althouigh',
-    'althouth',
-    'althrup',
     'alti',
-    'alti-librium',
-    'altick',
-    'altiero',
-    'altifrons',
-    'altimari',
-    'altimetric',
-    'altinkaya',
-    'altiport',
-    'altise',
-    'altitude/flight',
-    'altitudinally',
-    'altitute',
-    'altmisli',
-    'altmore',
-    'altmsli',
     'altnabreac',
-    'altneuland',
-    'alto&rehy;gether',
-    'alto-adige',
-    'alto-clef',
-    'alto-sax',
-    'alto-saxophone',
-    'alto-saxophonist',
-    'altogther',
-    'altolamprologus',
-    'altomonto',
-    'alton&ndash;whitehill&ndash;liphook&ndash;haslemere',
-    'altonian',
-    'altough',
-    'altp/cl',
-    'altre',
     'altredian',
-    'altrenative',
-    'altrieve',
-    'altrnate',
-    'altromin',
-    'altruim',
-    'altruism.',
-    'altruism/commitment',
-    'altrup',
-    'altsech',
-    'altsys',
-    'altuglas',
-    'altum',
-    'altunsu',
-    'altyre',
-    'alu-family',
     'alu-like',
-    'aluaudi.',
-    'aluberht',
-    'alucard',
-    'aludel',
-    'alum-bath',
-    'alum-sodium',
-    'aluma',
-    'alumettes',
-    'alumex',
-    'alumina-alumina',
-    'alumina-producing',
-    'aluminas',
-    'aluminide',
-    'aluminium&rehy;framed',
-    'aluminium&rehy;smelting',
     'aluminium-26',
-    'aluminium-alloy',
-    'aluminium-based',
-    'aluminium-bodied',
-    'aluminium-bronze',
-    'aluminium-clad',
-    'aluminium-copper',
-    'aluminium-dome',
-    'aluminium-foil',
-    'aluminium-skinned',
-    'aluminium.',
-    'aluminium/copper',
-    'aluminium/fabric',
-    'aluminium/perpex',
-    'alumino',
-    'alumino-',
     'alumino-silicate',
-    'aluminoids',
-    'aluminon',
-    'aluminosilicates',
-    'aluminuim',
-    'alumnae',
-    'alums',
-    'alun-alu',
-    'aluntur',
-    'alupres',
-    'aluredus',
-    'alush',
-    'alushta',
-    'alvah',
-    'alvanez',
-    'alvarez-designed',
     'alvarez-marchain',
-    'alvario',
-    'alvary',
-    'alvastra',
-    'alve',
-    'alvechurch',
-    'alveolars',
-    'alveolata',
-    'alver',
-    'alverguez',
-    'alverley',
-    'alverna',
-    'alvesda',
-    'alveva',
-    'alvez',
-    'alvia',
     'alvierbach',
-    'alvise',
-    'alwatar',
-    'always&rehy;open',
-    'always-',
-    'always-denied',
-    'always-female',
-    'always-male',
-    'always-on-the-move',
-    'always-renewed',
-    'always-there',
-    'always-turbulent',
-    'alwaysd',
-    'alwaysrated',
-    'alwih',
-    'alwington',
     'alwinton',
-    'alwiz',
-    'alwoodley',
-    'alwrld',
-    'alwyin',
-    'alwyne',
-    'alxenor',
-    'alxi',
-    'alyansang',
-    'alycidon',
-    'alyesbury',
-    'alyeska',
-    'alyl-acyl-glycerophosphocholine',
-    'alynne',
-    'alyosha',
-    'alyscamps',
     'alyse',
-    'alysis',
-    'alysun',
-    'alytes',
-    'alyve',
-    'alywin',
-    'alza',
-    'alzamiento',
-    'alzate',
-    'alzeimer',
-    'alzet',
-    'alzheimer\'s',
-    'am&amp;s',
-    'am&eacute',
-    'am&eacute;nagement',
-    'am&eacute;ricaine',
     'am&eacute;rican',
-    'am&egrave;riquains',
-    'am&gt',
-    'am&ndash;1',
-    'am&ndash;11',
-    'am&ndash;12',
-    'am&ndash;12.00',
-    'am&ndash;12.30',
-    'am&ndash;2.00',
-    'am&ndash;2.30',
-    'am&ndash;4',
-    'am&ndash;5',
-    'am&ndash;parnaso',
-    'am\'',
-    'am-1',
-    'am-2',
     'am-4',
-    'am-a',
-    'am-c',
-    'am-ish',
-    'am-style',
-    'am.16&ndash;7',
-    'am/aw',
-    'am/pro',
-    'am205',
-    'am29000',
-    'am386s',
-    'am386sxlv',
-    'am486dx2-50',
-    'am486dxlv',
-    'am486s',
-    'am7&pound;5',
     'am79c410',
-    'am9',
-    'am9116',
-    'ama&ndash;ed',
-    'amabile',
-    'amacis',
-    'amad&oacute',
-    'amadans',
-    'amade\'',
-    'amadeus/curzon/brain',
-    'amadigi',
-    'amadu',
-    'amadyah',
-    'amaemia',
-    'amaethwyr',
-    'amagai',
     'amager',
-    'amagnification',
-    'amahuacan',
-    'amaid',
-    'amain',
-    'amaizing',
-    'amaj',
-    'amajor',
-    'amakal',
-    'amakpiorural',
-    'amal-controlled',
-    'amal-held',
-    'amala',
-    'amalek',
-    'amalekites',
-    'amalepsis',
     'amalga-mate',
-    'amalgafix',
-    'amalgama',
-    'amalgamated.',
-    'amalgamation-friendly',
-    'amalienborg',
-    'amalienbourg',
-    'amals',
-    'amalvy/afp',
-    'amamiya',
-    'amamou',
-    'aman-geldy',
-    'amanada',
-    'amancio',
-    'amanda.',
-    'amandla',
     'amando',
-    'amandor',
-    'amandouera',
-    'amani',
-    'amanitin',
-    'amanoddin',
-    'amanoebang',
-    'amanogawa',
-    'amantes',
-    'amanti',
-    'amantus',
-    'amanuenses',
-    'amanuensists',
-    'amanya',
-    'amarabout',
-    'amarah',
     'amaraich',
-    'amaranath',
-    'amarani',
-    'amaranian',
-    'amaranthaceae',
-    'amaranthines',
-    'amaranths',
-    'amaranthus',
-    'amarelas',
-    'amarella',
-    'amarige',
-    'amarintha',
-    'amarit',
-    'amaritudine',
-    'amarna&ndash;beni',
-    'amaro',
     'amaroo',
-    'amarouch',
-    'amarsanaa',
-    'amarus',
-    'amasser',
-    'amassment',
-    'amate',
-    'amaterasu',
-    'amateur&rehy;built',
-    'amateur\'',
-    'amateur-champion',
-    'amateur-cum-renaissance',
-    'amateur-pickpocket-sort-of-manner',
-    'amateur-professional',
-    'amateur/professional',
-    'amateurish-looking',
     'amatil',
-    'amative',
-    'amatori',
-    'amatschon',
-    'amaturen',
-    'amaury-duval',
-    'amazements',
-    'amazer',
-    'amazing-looking',
-    'amazing.',
-    'amazingly.',
-    'amazone',
-    'amazonian-orinoco-guayanan',
-    'amazonicas',
-    'ambagibus',
-    'ambagious',
     'ambala',
-    'ambarro',
-    'ambassadeur',
-    'ambassador-at-large',
-    'ambassador-cum-political-adviser',
-    'ambassador-designate',
-    'ambassador-escort',
-    'ambassadorial-level',
-    'ambassadors/high',
-    'ambassadorship',
-    'ambassadress',
-    'ambasz',
-    'ambato',
-    'ambawela',
-    'ambegate',
-    'ambelaki',
     'ambelpoulia',
-    'amber-dropping',
-    'amber-glass',
-    'amber-red',
-    'amber-rich',
-    'amber-rose',
-    'amber-skinned',
-    'amber-sugar',
-    'amberin',
-    'amberley/',
-    'amberley/gloucestershire',
-    'amberloup',
-    'amberols',
-    'amberry',
-    'ambersham',
-    'amberston',
     'amberwood',
-    'ambesi',
-    'ambesol',
-    'ambeyseius',
-    'ambi-sexual',
-    'ambiances',
-    'ambiani',
-    'ambidexterity',
-    'ambient-dance',
-    'ambient-style',
-    'ambientali',
-    'ambiguous.',
-    'ambiguously-drawn',
-    'ambiguously.',
-    'ambilineal',
-    'ambionensis',
     'ambipolar',
-    'ambisexual',
-    'ambisonic',
-    'ambisonics',
-    'ambition/self-presentation/self-nurture',
-    'ambitious-enterprising',
-    'ambititious',
-    'ambix',
-    'amblecliff',
-    'amblecote',
-    'ambleside-coniston',
-    'ambleside/',
-    'amblestone',
-    'amblet',
-    'ambleton',
-    'amblewick',
     'amblings',
-    'amblyopic',
-    'amblyteles',
-    'amboina',
-    'ambonese',
-    'amboni',
-    'amboniacus',
-    'ambra/sage',
-    'ambraciots',
-    'ambrae',
-    'ambramovitz',
-    'ambras',
-    'ambrey',
-    'ambriz',
-    'ambrolauri',
-    'ambroziak',
     'ambrozzi',
-    'ambucetti/ap',
-    'ambulacral',
-    'ambulan',
-    'ambulance-chasing',
-    'ambulance-men',
-    'ambulante',
-    'ambulantes',
-    'ambulantly',
-    'ambulatories',
-    'ambulift',
-    'amburg',
-    'amburgh',
-    'ambuscados',
-    'ambushers.',
-    'ambystoma',
     'amca-conjugated',
-    'amcaf&eacute',
-    'amclub',
-    'amcoach',
-    'amdec',
-    'amderna',
-    'amdh',
-    'ame-1',
-    'ameasure',
-    'amecea',
-    'amed&eacute;e',
-    'amede',
-    'amedroz',
-    'amee',
-    'ameeeeeeeego',
-    'ameen',
     'ameeri',
-    'amegee',
-    'ameinias',
-    'amel',
-    'amelancher',
-    'ameland',
-    'amelavi',
-    'amelda',
-    'ameliaranne',
-    'ameliorations',
-    'amelioratrion',
-    'ameliorist',
-    'amelita',
-    'amelko',
-    'amels',
-    'amels/diana',
     'amen\'',
-    'amen.',
-    'amended&mdash;at',
-    'amended/without',
-    'amended_on',
-    'amendmen',
-    'amendments/additions/',
-    'amenemheb',
-    'ameneties',
-    'amenhope',
-    'amenianarxia',
-    'amenities.',
-    'amenity-injury',
-    'ament',
-    'amento',
-    'amenuvegbe',
     'ameoba',
-    'amer&ndash;can',
-    'amer&rehy;ica',
-    'amer-ican',
-    'amera',
-    'amerasian',
-    'amerbach',
-    'amercian',
-    'amerda',
-    'americ&acirc;no',
-    'americ-ans',
-    'america&mdash;travel&mdash;had',
-    'america-distancing',
-    'america-english',
-    'america-first',
-    'america-minded',
     'america-on-thames',
-    'america/australia',
-    'america3',
-    'america_as_a',
-    'american&mdash;soviet',
-    'american&ndash;based',
-    'american&ndash;canadian',
-    'american&rehy;controlled',
-    'american-accented',
-    'american-atlantic',
-    'american-brazilian',
-    'american-british',
-    'american-british-dominions',
-    'american-checked',
-    'american-chinese',
-    'american-cloth',
     'american-controlled',
-    'american-de',
-    'american-designed',
-    'american-devised',
-    'american-dominated',
-    'american-dutch-british',
-    'american-equity',
-    'american-european-british',
-    'american-football',
-    'american-funded',
-    'american-grown',
-    'american-imported',
-    'american-irish',
-    'american-israeli',
-    'american-manufactured',
-    'american-naturalized',
     'american-palestinian',
-    'american-registered',
-    'american-run',
-    'american-selected',
-    'american-sounding',
-    'american-south',
-    'american-zionist-atlantic',
-    'american/de',
-    'american/european',
-    'american/mexican',
-    'american/non-american',
-    'americana/us',
-    'americanified',
-    'americanisations',
-    'americanising',
-    'americanism\'',
     'americanly',
-    'americanowned',
-    'americanplatform',
-    'americans.',
-    'americansandwich',
-    'americare',
-    'americas-wide',
-    'americium-241',
-    'americo-liberian',
-    'amerifax',
-    'amerikkka',
-    'amerind',
-    'amerindia',
-    'amerindo',
-    'amero-west',
-    'amerous',
     'amersham-born',
-    'amersham-buchler',
-    'amery-warmly',
-    'amessy',
-    'amestrey',
-    'amethopterin',
-    'amethyst-coloured',
-    'amethyst-decked',
-    'amethyst/violet',
-    'ametistov',
-    'amf(a)',
-    'amf7',
-    'amgala',
-    'amgoed',
-    'amhadu',
-    'amharic-speaking',
     'amherstiae',
-    'ami9',
-    'amia',
-    'amiably.',
-    'amices',
-    'amiche',
-    'amicis-buonsollazzi',
-    'amicissumus',
-    'amicitiae',
-    'amico',
-    'amicos',
-    'amida-buddhist',
-    'amide-exchange',
-    'amidini',
-    'amidinium',
-    'amidomethylcoumarin',
     'amien',
-    'amiennois',
-    'amienois',
-    'amiens&ndash;boulogne',
-    'amies/designer',
-    'amiga500',
-    'amiganamore',
-    'amigismo',
-    'amikacin',
-    'amil',
-    'amilcare',
-    'amild',
-    'amilitary',
-    'amilius',
-    'amilly',
-    'amiloride.',
     'amimeche',
-    'amin\'ny',
-    'amin7',
-    'aminatat',
-    'aminis',
-    'amino-3-hydroxy-5-methyl-4-isoxazolepropionate',
-    'amino-ethylcarbazole',
-    'aminoacyl-trna-synthetases',
-    'aminoacyl-trnas',
-    'aminoacylation',
-    'aminobenzoic',
-    'aminocyclopentane-1s,3r-dicarboxylate',
-    'aminocylopentane',
-    'aminodinitrophenol',
-    'aminoethylether',
-    'aminoff',
     'aminoglutethimide',
-    'aminoglyco-side',
-    'aminohistochemical',
-    'aminolsalicylates',
-    'aminonitro-',
-    'aminophosphorylcholine',
-    'aminor',
-    'aminosalicylate',
-    'aminosalicylic',
-    'aminotransferase:alamine',
-    'aminotransferases',
-    'aminotrazole',
-    'aminov',
-    'amipro&bsol;macros',
-    'amiracle',
-    'amiral',
     'amirali',
-    'amirate',
-    'amis-like',
-    'amis-sounding',
-    'amises',
-    'amisfield',
-    'amisian',
-    'amiskwia',
-    'amiskwiids',
-    'amison',
-    'amisses',
-    'amissing',
-    'amistad',
-    'amitai',
-    'amitermitinae',
-    'amities.',
     'amitochondriate',
-    'amitotic',
-    'amitrypline',
-    'amity/the',
-    'amjab',
-    'amjawr',
-    'amlak',
-    'amlcd',
-    'amlot',
-    'amlow',
-    'ammallos',
-    'amman-based',
-    'amman-riyadh-dahran',
-    'ammanites',
-    'ammed',
-    'ammend',
     'ammers',
-    'ammerschwihr',
-    'ammir',
-    'ammock',
-    'ammocoete',
-    'ammonal',
-    'ammond',
-    'ammoni',
-    'ammonia-nitrite-nitrate',
-    'ammoniates',
-    'ammonite-like',
-    'ammotransferase',
-    'ammu',
-    'ammuffita',
-    'amner',
-    'amnesia-suffering',
     'amnesias',
-    'amnest',
-    'amnesty.',
-    'amneus',
-    'amney',
-    'amni',
-    'amnio-whatever',
-    'amniocentic',
-    'amnioeze',
-    'amnioinfusion',
-    'amnosics',
-    'amnount',
-    'amnuai',
-    'amoco-conoco',
-    'amoco-led',
-    'amodification',
     'amoeba.',
-    'amoebic-shaped',
-    'amoeboflagellates',
-    'amogordo',
-    'amold',
-    'amon-ra',
-    'amon.',
-    'amonet',
-    'amonge',
-    'amonges',
-    'amongest',
-    'amongthe',
-    'amonia',
-    'amonoantibiotic',
-    'amonsgt',
-    'amoo',
     'amoore',
-    'amor-odium',
-    'amorance',
-    'amorant',
-    'amorbach',
-    'amore\'',
-    'amores',
-    'amorg&oacute;s',
-    'amori',
-    'amorite',
-    'amornvivat',
-    'amorocho',
-    'amorosa',
-    'amorousness',
-    'amorphophallus',
-    'amorphously',
     'amorphousness',
-    'amortize',
-    'amortizing',
-    'amosis',
-    'amosquito',
-    'amotivational',
-    'amotor',
-    'amotz',
-    'amouage',
-    'amougies',
-    'amount-of-substance',
-    'amounts&mdash;50',
-    'amounts.',
-    'amoureaux',
-    'amoureuse',
-    'amoureux',
     'amourous',
-    'amouyel',
-    'amoxicillin/omperazole',
-    'amoxil',
-    'amoxypen',
-    'amp-in-case',
-    'amp-lexi-kow-lis',
-    'amp-type',
-    'amp/speaker',
-    'ampage',
-    'ampara',
-    'ampato',
-    'ampelcoalition',
-    'ampenan',
-    'amper',
-    'ampersands',
     'ampey',
-    'amph',
-    'amphana',
-    'amphenol',
-    'amphetamine-free',
-    'amphetamine-like',
-    'amphetamine-type',
-    'amphi-theatres',
-    'amphiacanthoides',
-    'amphiaraon',
-    'amphiaraos',
-    'amphib',
-    'amphibalus',
-    'amphibianism',
-    'amphibiologists',
-    'amphibiology',
     'amphibius',
-    'amphicar',
-    'amphictionic',
-    'amphictions',
-    'amphigory',
-    'amphiktiony',
-    'amphiktyonic',
-    'amphiktyons',
-    'amphiktyony',
-    'amphilepidinae',
-    'amphilimna',
-    'amphilipidinae',
-    'amphimaid',
-    'amphion',
-    'amphiopholis',
-    'amphipholis',
     'amphiprion',
-    'amphisbaenid',
-    'amphissa',
-    'amphitheaters',
-    'amphitheatre-like',
-    'amphitheatric',
-    'amphitheatrum',
-    'amphitryon',
-    'amphiuma',
-    'amphiuridae',
-    'amphong',
-    'amphthous',
-    'amphu',
-    'ampiaraus',
-    'amping',
-    'ampishness',
     'ampitude',
-    'ample-backed',
-    'ample-bellied',
-    'ample-busted',
-    'amplesso',
-    'amplexicaule',
-    'amplexicaulis',
-    'amplexiform',
-    'amplicillin',
-    'amplidues',
-    'amplificatory',
-    'amplimer',
-    'amplion',
-    'amplissimus',
-    'amplitude-modulated',
-    'amplitude-modulating',
     'amplitude-squared',
-    'amplitude=46',
-    'amplitude=52',
-    'amplitudeof',
-    'amplotude',
-    'amply-filled',
-    'amply-soled',
-    'amply-toned',
-    'amponsah',
-    'amport',
-    'amps&ins',
-    'ampstead',
-    'ampsys',
-    'ampulaceous',
-    'ampullatus',
-    'ampurias',
     'ampurias/costa',
-    'amputations.',
-    'ampwise',
-    'amqua',
-    'amraam',
-    'amraams',
-    'amram',
-    'amran',
-    'amrani',
-    'amresco',
-    'amrinder',
-    'amriyah',
-    'amrollahi',
-    'ams1s',
-    'amsandwiches',
-    'amsberg',
     'amsbury',
-    'amsel',
-    'amserau',
-    'amsiwi',
-    'amsk',
-    'amslmr',
-    'amsoft',
-    'amson',
-    'amstell',
-    'amstelveen',
-    'amsterdam&mdash;the',
-    'amsterdam-1',
-    'amsterdam-born',
-    'amsterdammers',
-    'amsterdamsche',
-    'amsterpark',
     'amstrad-made',
-    'amtes',
-    'amtree',
-    'amu-see',
-    'amulet/medallion',
-    'amuletic',
-    'amulva',
-    'amund',
-    'amunet',
-    'amurensis',
-    'amus',
-    'amusable',
-    'amuse&rehy;ment',
-    'amuse-gueules',
-    'amused/at',
-    'amusement.',
     'amusez-vous',
-    'amuzegar',
-    'amv-reverse',
-    'amwerica',
-    'amx-10',
-    'amy/rosabella',
-    'amygdalo-persica',
-    'amygists',
-    'amylacea',
-    'amylas',
-    'amylasaemia',
-    'amylasuria',
-    'amyloglucosidase',
-    'amyotrophic',
-    'amyrgian',
-    'amyses',
     'amyway',
-    'an&ccaron;erl',
-    'an&eacute;cdotique',
-    'an&eacute;es',
-    'an&ndash',
-    'an&ndash;el',
-    'an&ndash;l',
-    'an\'and',
-    'an\'ol\'perrishikk',
-    'an\'ry',
-    'an\'wee',
-    'an-',
-    'an-12',
-    'an-225',
-    'an-8',
-    'an-969m',
     'an-all',
-    'an-arche',
-    'an-atom-ical',
-    'an-atta',
-    'an-essential',
-    'an-gwil-a',
-    'an-ice',
-    'an-l',
-    'an-najah',
-    'an-nu\'aymi',
-    'an-or',
-    'an-other',
-    'an-overall',
-    'an.anachronism',
-    'an.l',
-    'an=and',
     'an_',
-    'an_as',
-    'ana\'',
-    'ana-',
-    'anabantidae',
-    'anabantids',
-    'anabaritid',
-    'anabaritids',
-    'anabase',
-    'anaca',
-    'anacharis',
-    'anachronic',
-    'anachrorlisms',
-    'anacletan',
-    'anacletus',
-    'anacomp',
     'anacostia',
-    'anad',
-    'anada',
-    'anadac',
-    'anadamide',
-    'anadarko/lasmo/maersk',
-    'anadia',
-    'anadromous',
-    'anae',
-    'anaemia\'',
-    'anaemic-looking',
-    'anaemics',
-    'anaero',
-    'anaesth',
-    'anaesthaeia',
-    'anaesthaeisia',
     'anaesthatist',
-    'anaesthesis',
-    'anaesthesised',
-    'anaesthetisation',
-    'anaethetus',
-    'anafa',
-    'anagallis',
-    'anagh',
-    'anaglogs',
-    'anagly',
-    'anagnorisis',
-    'anagnosti',
-    'anagogically',
-    'anagramming',
-    'anagyroides',
-    'anagyruus',
     'anaheim&ndash;tiajuana&ndash;san',
-    'anaik',
-    'anakena',
-    'anakepbalaiosis',
-    'anakupalo',
-    'anal-fixation',
-    'anal-genital',
-    'anal-retentives',
-    'analagus',
-    'analatresia',
-    'analaysis',
-    'analect',
-    'analecta',
-    'analeptics',
-    'analeti',
-    'analienburg',
     'analipsis',
-    'analised',
-    'anally-retentive',
-    'analog/digital',
-    'analogically',
-    'analogie',
-    'analogizations',
-    'analogon',
-    'analogue-minded',
-    'analogue-models',
-    'analogy\'',
-    'analogy.',
-    'analox',
-    'anals',
-    'analtis',
-    'analy',
     'analyist',
-    'analyists',
-    'analysands',
-    'analyse&ndash',
-    'analyse_on_account',
-    'analysers.',
-    'analysesusing',
-    'analysis-and-synthesis',
-    'analysis-based',
-    'analysis-by-feature',
-    'analysis-by-synthesis',
-    'analysis-cum-psychotherapy',
-    'analysis.candidates',
-    'analysis.the',
-    'analysis/assessment',
-    'analysis/needs',
     'analysist',
-    'analyst-advisers',
-    'analyst.',
-    'analyst/acupuncturist/homeopath/hypnotist',
-    'analyst/designer',
-    'analyst/hairdresser',
-    'analyst/programmers',
-    'analytic/synthetic',
-    'analyticae',
-    'analyticals',
-    'analyticity',
-    'analyze/rms',
-    'analyzed/evaluated',
-    'analyzers',
-    'aname',
-    'anamnesses',
     'anamnestic',
-    'anamorphotic',
-    'anandaban',
-    'anandan',
-    'anandi',
-    'anandians',
-    'anandji',
-    'anands',
-    'ananeotiko',
-    'ananev',
-    'anania',
-    'ananiashvili',
-    'anant',
-    'anap&mdash;motherland',
-    'anapaestic',
-    'anapaests',
     'anapest',
-    'anaphalis',
-    'anaphrodisiac',
-    'anaplastic',
-    'anapsids',
-    'anapurna',
-    'anarcestes',
-    'anarch/social',
-    'anarchically',
-    'anarchies',
-    'anarchique',
-    'anarchist-communist',
-    'anarchiste',
-    'anarchisten',
-    'anarchistically',
-    'anarcho-hippie',
     'anarcho-punk',
-    'anarcho-punks',
-    'anarchronistic',
-    'anarchy\'',
-    'anarene',
-    'anarjokka',
-    'anarthric',
-    'anas.',
-    'anasagasti',
-    'anasazi',
-    'anaspastoi',
-    'anastasie',
-    'anastasis',
-    'anastassios',
-    'anastassopoulos',
-    'anasteen',
     'anastigmatic',
-    'anastomomosed',
-    'anastomosing',
-    'anastylosis',
-    'anatagonist',
-    'anatalia',
-    'anatamo-physiological',
-    'anatevka',
-    'anathbethel',
-    'anathemata',
-    'anathematising',
-    'anathematize',
-    'anathemised',
-    'anathoth',
-    'anatidae.',
-    'anatinae',
     'anatinae.',
-    'anatiomaros',
-    'anatolepis',
-    'anatolian-inspired',
-    'anatolians',
-    'anatolio',
-    'anatomia',
-    'anatomico',
-    'anatomique',
-    'anatomises',
-    'anatomising',
-    'anatomization',
-    'anatomize',
-    'anatomo-clinical',
-    'anatoni',
-    'anatronic',
     'anatta',
-    'anaud',
-    'anaus',
-    'anavysos',
-    'anawim',
-    'anawratha',
-    'anaxagorean',
-    'anaxandros',
-    'anaximandrean',
-    'anaxis',
-    'anaylsts',
-    'anazarbus',
-    'anb',
-    'anbacher',
-    'anbd',
-    'anby',
     'anc-affiliated',
-    'anc-nosc',
-    'anc-supporting',
-    'anc/government',
-    'ance',
-    'ances&rehy;tral',
-    'ancester',
-    'ancesters',
-    'ancestor-descendent',
-    'ancestor-tracing',
-    'ancestor/did',
-    'ancestrous',
-    'anchimolios',
-    'anchisaur',
-    'anchizonal',
-    'anchois',
     'anchor-chains',
-    'anchor-handling',
-    'anchor-like',
-    'anchor-men',
-    'anchor-point',
-    'anchor-stone',
-    'anchor-worm',
-    'anchorage&ndash;denali',
-    'anchorage&ndash;portage',
-    'anchorage-dependant',
-    'anchorless',
-    'anchormen',
-    'anchorsholme',
-    'anchorthies',
-    'anchovy-',
-    'anchovy-paste',
     'anchusa',
-    'ancidetemi',
-    'ancient-looking',
-    'ancient-mariner',
-    'anciente',
-    'anciently-established',
-    'anciently-rooted',
-    'ancientry',
-    'ancients-see',
-    'ancientski',
-    'anciliaries',
-    'ancilla',
-    'ancillary-staff',
-    'ancit',
-    'ancliffe',
-    'anco',
     'ancon',
-    'ancylostomidae',
-    'and&amp',
-    'and&formula',
-    'and&gt',
-    'and&gt=10.57',
-    'and&lsqb;name',
-    'and&ndash',
-    'and&ndash;professional',
-    'and&rehy;great',
-    'and\'ava',
-    'and(3)',
-    'and(4)',
-    'and(ba)',
-    'and-240',
-    'and-98',
     'and-allingham',
-    'and-allow',
-    'and-as',
-    'and-based',
-    'and-blue',
-    'and-burn',
-    'and-by-way-of-hieronymus',
-    'and-carry',
-    'and-completely',
-    'and-death',
-    'and-development',
-    'and-does',
-    'and-enforcement',
-    'and-exposed',
-    'and-factory',
-    'and-felt',
     'and-ferns',
-    'and-fumbled',
-    'and-gate',
-    'and-hatred',
-    'and-i',
-    'and-iron.',
-    'and-loveable',
-    'and-mining',
-    'and-most',
-    'and-mother',
-    'and-now',
-    'and-off',
-    'and-ordered',
-    'and-pinion',
-    'and-polish',
-    'and-product',
     'and-provides',
-    'and-social',
-    'and-strikes',
-    'and-swann-meets-joyce-grenfell-old-fashioned',
-    'and-tax',
-    'and-then',
-    'and-to',
-    'and-took',
-    'and-tree',
-    'and-twisting',
-    'and-uranium',
-    'and-wet',
-    'and-with',
-    'and-you',
-    'and.daughter',
-    'and.find',
     'and.mclaren',
-    'and.of',
-    'and.opened',
-    'and.shifting',
-    'and.simply',
-    'and.their',
-    'and/and',
-    'and/but',
-    'and/but/because',
-    'and/courts',
-    'and/d/',
-    'and/ns/',
-    'and/o-r',
-    'and/skw/',
-    'and/with',
-    'and/y/',
     'and0',
-    'and10',
-    'and14',
-    'and1883',
-    'and1992',
-    'and2',
-    'and:allocation',
-    'and_,_and_er_so_on',
-    'and_again',
-    'and_away',
-    'and_er_,_and_so_on',
-    'and_for',
-    'and_hors',
-    'and_instead',
-    'and_instead_,',
-    'and_large',
     'and_more',
-    'and_now',
-    'and_out',
-    'and_outside',
-    'and_papier',
-    'and_so_on_and_so',
-    'and_so_on_and_so_on',
-    'and_vice',
-    'and_w',
-    'andahaylas',
-    'andale',
-    'andalie',
-    'andalusians',
-    'andam',
-    'andamans',
-    'andana',
     'andantes',
-    'andarte',
-    'andboth',
-    'andbreast',
-    'andcommunity',
-    'andconstruction',
-    'andd',
-    'anddelight',
-    'ande',
-    'andean-rockies',
-    'anded',
-    'andeli',
-    'andeljkova',
-    'andelle',
-    'andemson',
-    'ander',
     'anderby',
-    'anderegg',
-    'andererseits',
-    'anderida',
-    'anderjays',
-    'anderlect',
-    'andersag',
-    'andersens',
-    'anderson-alinari',
-    'anderson-style',
-    'anderson/cummins',
-    'anderson/forest',
-    'anderson/gallery',
-    'anderson/lumberjill',
-    'anderson/technical',
-    'anderson/tenant',
     'anderson/thunderbirds',
-    'anderssen',
-    'anderstorp',
-    'anderstown',
-    'andersz',
-    'anderszewski',
-    'anderton-like',
-    'andertons',
-    'andesine',
-    'andetrium',
-    'andhelicobacter',
-    'andia',
-    'andihysterbine',
-    'andikithera',
-    'andiol',
-    'andiron',
     'andirons',
-    'andit',
-    'andizhan',
-    'andjanet',
-    'andjel',
-    'andjelkovi&cacute',
-    'andjelkovic',
-    'andmalignant',
-    'andmeet',
-    'andmoreover',
-    'andmotor',
-    'andmutters',
-    'andn',
-    'andoe',
-    'andon',
-    'andonie',
     'andorfer',
-    'andothers',
-    'andov',
-    'andover-eastleigh',
-    'andoversford',
-    'andr',
-    'andr&eacute;-georges',
-    'andr&eacute;ew',
-    'andr&eacute;minister',
-    'andr&ograve',
-    'andrachne',
-    'andrachnoides',
-    'andrae',
-    'andragogical',
-    'andragogy',
-    'andraitx',
     'andrasfalvy',
-    'andre/1e',
-    'andreaea',
-    'andreani',
-    'andreas-salom&eacute',
-    'andreassi',
-    'andreatta',
-    'andreceived',
-    'andredsweald',
-    'andreescu',
-    'andrejs',
-    'andrena',
-    'andreoli',
-    'andreous',
-    'andreovich',
-    'andresen',
     'andreski',
-    'andreu',
-    'andreuzza',
-    'andrew.cmu.edu',
-    'andrew.i',
-    'andrews/prosthetist',
-    'andrews/racing',
-    'andrews/stone',
-    'andrex-coloured',
-    'andrezej',
-    'andriamanampy',
-    'andriamanmapy',
-    'andrian',
-    'andrianalijaona',
-    'andrianalijoana',
-    'andriantiana',
     'andricus',
-    'andriesson',
-    'andrieux',
-    'andriyadi',
-    'andrle',
-    'androboulos',
-    'androecium',
-    'androgyne',
-    'andromonetius',
-    'andronaci',
-    'andronaki',
-    'andronican',
-    'andronicusby',
-    'andronikhov',
-    'androniscius',
-    'andronov',
     'androsia',
-    'androtion',
-    'androuet',
-    'andruta',
-    'andrzeja',
-    'andrzejewski',
-    'andstudent',
-    'andthe',
-    'anduff',
-    'andulo',
-    'anduro',
-    'andwhere',
-    'andy\'s',
-    'andy-fergie',
-    'andys',
-    'andz&eacute',
     'andze-tsoungui',
-    'ane&zcaron;ka',
-    'aneasthetic',
-    'anec',
-    'anecdotalist',
-    'anecdotery',
-    'anecdotic',
-    'anecdotique',
-    'anechoically',
-    'anedande',
-    'anedjety',
-    'anees',
-    'anefis',
-    'aneis',
-    'anek',
-    'anek&amacr;ntav&amacr;din',
     'anelay',
-    'anely',
-    'anememas',
-    'anemic',
-    'anemograph',
-    'anemone-like',
-    'anemospilia',
-    'anencephaly',
-    'anend',
-    'anensk&aacute',
-    'anensk&eacute',
-    'anent',
-    'anepimeron',
-    'anepisternum',
-    'anergia',
-    'anericas',
     'anerobic',
-    'anes',
-    'anesthaesia',
-    'anesthesiologist',
-    'anesthetized',
-    'anet',
-    'anethoides',
-    'anette',
-    'anetz',
-    'aneurism',
-    'aneurysma',
-    'aneurysmas',
-    'aneus',
-    'aneuyrism',
-    'aney',
-    'anf&auml;ngen',
     'anfantais',
-    'anfieldborn',
-    'anfielders',
-    'anfora',
-    'anfractuous',
-    'ang&eacute;lica',
-    'ang&egrave;le',
-    'anga',
-    'angadriama',
-    'angaine',
-    'angal',
-    'angarita',
-    'angars',
-    'angba',
-    'anged',
-    'angehrn',
     'angel-dancer',
-    'angel-enabler',
-    'angel-fish',
-    'angel-on-the-shoulder',
-    'angel-snout',
-    'angel-tonsilled',
-    'angel-top',
-    'angel-wing',
-    'angel/your',
-    'angela-when',
-    'angela/georgia',
-    'angela/tracy',
-    'angelbert',
-    'angeldust',
-    'angele',
-    'angeleans',
     'angelelli',
-    'angeleno',
-    'angeles&ndash;london',
-    'angeles-born',
-    'angeles-san',
-    'angeles/',
-    'angeles/new',
-    'angelescu',
-    'angelfood',
-    'angelicals',
-    'angelicas',
-    'angeliki',
-    'angelism',
-    'angelitos',
-    'angellism',
-    'angellite',
     'angelman',
-    'angeln-type',
-    'angelolatory',
-    'angels&mdash;that',
-    'angels.',
-    'angels/stolen',
-    'angelteich',
-    'angelucci',
-    'angelwing',
-    'angenehmer',
-    'angenhenio',
-    'angepena',
-    'anger-provoking',
-    'anger.friendly',
-    'angerer',
-    'angeres',
     'angerless',
-    'angestellte',
-    'angestellten',
-    'angestellten-gewerkschaft',
-    'angevine',
-    'angevines',
-    'anghared',
-    'anghone',
-    'angilbert',
-    'angin\'',
-    'anging',
-    'angiogenesis-inhibitors',
-    'angiografine',
-    'angiographies',
-    'angioimmunoblastic',
-    'angiolo',
     'angiomas',
-    'angiomatous',
-    'angioscopy',
-    'angiospers',
-    'angiostrongylosis',
-    'angiotensinogen',
-    'angiotension',
-    'angithis',
-    'angkor-period',
-    'angl',
-    'anglade',
-    'anglais&ndash\'',
-    'angle-beams',
-    'angle-figures',
-    'angle-german-dutch',
-    'angle-grinders',
     'angle-just',
-    'angle-of-approach',
-    'angle-of-dive',
-    'angle-of-view',
-    'angle-parked',
-    'angle-poise',
-    'angle-shaped',
-    'angle-tables',
-    'angle-to',
-    'angleby-birmingham',
-    'angleguide',
-    'angleman',
-    'anglesea',
-    'anglesmiths',
-    'anglezarke',
-    'anglia-an',
     'anglia-biotec',
-    'anglia-north',
-    'anglia/itv',
-    'anglia124-1298.515.8',
-    'anglias',
-    'anglican&ndash;dissenter',
-    'anglican-catholic',
-    'anglican-roman',
-    'anglican-royalist',
-    'anglican-run',
-    'anglicism',
-    'anglicists',
-    'anglicum',
-    'anglie',
-    'angligena',
-    'anglo&mdash;saxon',
     'anglo&rehy;japanese',
-    'anglo&rehy;protestant',
-    'anglo-albanian',
-    'anglo-arab',
-    'anglo-arabian',
-    'anglo-argentines',
-    'anglo-armenian',
-    'anglo-austrian',
-    'anglo-bengali',
-    'anglo-british',
-    'anglo-burgundian',
-    'anglo-burmese',
-    'anglo-caribbean',
-    'anglo-celtic',
-    'anglo-channel',
-    'anglo-danish',
     'anglo-dominated',
-    'anglo-free',
-    'anglo-gallic',
-    'anglo-gaullist',
-    'anglo-greek',
-    'anglo-greeks',
-    'anglo-iraqi',
-    'anglo-ireland',
-    'anglo-irish.',
-    'anglo-israel',
-    'anglo-israeli',
-    'anglo-kuwaiti',
-    'anglo-latin',
-    'anglo-lrish',
-    'anglo-mexican',
-    'anglo-mongolian',
     'anglo-navarrese',
-    'anglo-newfoundland',
-    'anglo-nigerian',
-    'anglo-normans',
-    'anglo-nubian',
-    'anglo-oriental',
-    'anglo-ottoman',
-    'anglo-pakistani',
-    'anglo-portuguese',
-    'anglo-romanian',
-    'anglo-rushdie',
-    'anglo-saxon-celtic-norse-norman',
-    'anglo-saxon-german',
-    'anglo-saxon/middle',
-    'anglo-saxondom',
-    'anglo-saxonism',
     'anglo-saxophone.',
-    'anglo-torontonians',
-    'anglo-u',
-    'anglo-ukrainian',
-    'anglo-uruguay',
-    'anglo-welf',
-    'anglo.american',
-    'anglo/australian',
-    'anglocentrism',
-    'anglois',
-    'anglomania',
-    'anglophiled',
-    'anglophilic',
-    'anglophonic',
-    'anglosaxon',
-    'anglostrongylus',
     'anglovaal',
-    'angoche',
-    'angoff(1971)1-',
-    'angoisseux',
-    'angola&mdash;workers',
-    'angola-partido',
-    'angola.',
-    'angolan-born',
-    'angold',
-    'angoll',
-    'angot',
-    'angouleme',
-    'angove',
-    'angra-2',
-    'angraecoid',
-    'angraecum',
     'angries',
-    'angry-and-otherwise',
-    'angry-looking',
-    'angry-of-west-midlands',
-    'angry/polite',
-    'angry/polite/upset',
-    'angry/taken',
-    'angry/unhappy/sad/upset',
-    'angs',
-    'angst-fest',
-    'angst-free',
-    'angst-racked',
-    'angst-riddled',
-    'angst-struck',
-    'angst/celebration',
-    'angster',
     'angstrem',
-    'angue',
-    'anguillans',
-    'anguillidae',
-    'anguiped',
-    'anguisshe',
-    'anguka',
-    'angul',
-    'angular-looking',
-    'angular-shaped',
-    'angularly',
-    'angulations',
-    'angus&ndash',
-    'angus/agnes',
-    'angusson',
-    'angusta',
     'angustia',
-    'angustias',
-    'angustirostris',
-    'angustus',
-    'angwysche',
-    'angyal/petrovics',
-    'anharmonicities',
-    'anhedral',
-    'anhedralled',
-    'anhembi',
-    'anheuser',
-    'anhimsa',
-    'anhydrites',
-    'anhydro-n-acetylglucosamine',
-    'anicca',
-    'aniceto',
     'anicius',
-    'aniconic',
-    'anicteric',
-    'anidder',
-    'aniela',
-    'anieuse',
-    'anigree',
-    'anik',
-    'aniketos',
-    'anilene',
-    'anilide',
-    'anilingus',
-    'anilino',
-    'anim.',
-    'anima&atilde;o',
-    'animabus',
     'animac&iacute;on',
-    'animacion',
-    'animadverting',
-    'animal&mdash',
-    'animal&ndash;that',
-    'animal(s)',
-    'animal-baiting',
-    'animal-breeders',
-    'animal-care',
-    'animal-drawn',
-    'animal-enhanced',
-    'animal-eyed',
-    'animal-feeding',
-    'animal-friendly',
-    'animal-groups',
-    'animal-house',
     'animal-human',
-    'animal-husbandry',
-    'animal-issue',
-    'animal-land',
-    'animal-lovers',
-    'animal-man',
-    'animal-metabolism',
-    'animal-powered',
-    'animal-rescue',
-    'animal-righter',
-    'animal-scented',
-    'animal-soothing',
-    'animal-waste-rendering',
-    'animal-watched',
-    'animal.2',
-    'animal.bites',
     'animal/being',
-    'animal/environment',
-    'animal/human',
-    'animal/pedestrian',
-    'animal/people',
-    'animal/plant',
-    'animalcules',
-    'animaline',
-    'animalkind',
-    'animals.played',
-    'animals/insects',
-    'animals/species',
-    'animateness',
-    'animatic',
-    'animatics',
-    'animation/recherche/confrontation',
     'animatistic',
-    'animato',
-    'animaxx',
-    'animaze',
-    'animazl',
-    'animikie',
-    'animizing',
-    'animo',
-    'animorum',
-    'animosamente',
-    'animosity-suffering',
-    'animsl',
-    'animula',
-    'anina',
-    'aninal',
-    'anindita',
     'anion-binding',
-    'anion-cation',
-    'anionic-non-ionic',
-    'anirudh',
-    'anisakidae',
-    'anise-flavoured',
-    'aniseed-smelling',
-    'anisfeld',
-    'anishnabai',
-    'anishnabe',
-    'anisioylated',
-    'anisitsi',
-    'aniskin',
-    'anismus',
-    'anisole',
-    'anisomycin-sensitive',
     'anison',
-    'anisopteran',
-    'anisotonic',
-    'anisotropic-layered',
-    'anisotropies',
-    'aniss',
-    'anitra',
-    'aniushka',
-    'aniversario',
-    'aniversary',
-    'anjad',
-    'anjana',
-    'anjosagriculture',
-    'ank',
-    'ankaratrite',
-    'ankarcrona',
     'ankelbone',
-    'ankerdine',
-    'ankers',
-    'anketil',
-    'ankhian',
-    'ankhsenpaaten',
-    'ankle&rehy;length',
-    'ankle-biters',
-    'ankle-bones',
-    'ankle-boot',
-    'ankle-breaking',
-    'ankle-catching',
-    'ankle-holsters',
-    'ankle-injury',
-    'ankle-ligament',
-    'ankle-risking',
     'ankle-snap',
-    'ankle-socks',
-    'ankle-straining',
-    'ankle-strap',
-    'ankle-strapped',
-    'ankle-straps',
-    'ankle-supports',
-    'ankle-tight',
-    'ankle-twisting',
-    'ankle-wrenching',
-    'anklebiter',
-    'anklebone',
-    'ankledeep',
-    'ankles.',
-    'anklewarmers',
-    'ankling',
     'ankov',
-    'ankus',
-    'ankvaba',
-    'anky',
-    'anky-panky',
-    'ankylosaur',
-    'ankylosis',
-    'anlaby',
-    'anlage',
-    'anle',
-    'anleitung',
-    'anley/mounted',
-    'anlong',
-    'anmd',
-    'anmyon',
-    'ann&auml;herung',
     'ann\'d',
-    'ann-pascale',
-    'ann-sargent',
-    'anna&mdash;all',
-    'anna&mdash;of',
-    'anna-',
-    'anna-camilla',
-    'anna-eyes',
-    'anna-francis',
-    'anna-lee',
-    'annabelle/annabelle',
-    'annachamy',
-    'annad',
-    'annadale/queens',
-    'annaghmore',
-    'annahilt',
     'annait',
-    'annakin',
-    'annaleigh',
-    'annali',
-    'annaline',
-    'annamese.camp',
-    'annappes',
-    'annbank',
-    'annchen',
-    'anne\'s',
-    'anne\'s-on-sea',
-    'anne-line',
-    'anne-lucie',
-    'anneals',
-    'anneau',
-    'annectens',
     'annecy-le-vieux',
-    'annee',
-    'annefield',
-    'annejuleen',
-    'annelise',
-    'annelli',
-    'annells',
-    'annelo',
-    'annelsey',
-    'annersley',
-    'annes/blackpool',
-    'annesely',
-    'annesleys',
-    'annet',
-    'annetts',
-    'annexo',
     'annibal',
-    'annicombe',
-    'annie-the-silent',
-    'annies',
-    'annigonis',
-    'annihilatingly',
-    'annihilation.',
-    'annihilations',
-    'annihilator',
-    'annina',
-    'anninversary',
-    'annio',
-    'annita',
-    'annium',
-    'anniversaire',
-    'anniversario',
     'anniversary.',
-    'anniversay',
-    'annlies',
-    'annmarie',
-    'annnual',
-    'annointed',
-    'annointeth',
-    'annon',
-    'annonimous',
-    'annonymous',
-    'annotatable',
-    'annotto',
-    'annou',
-    'annoucement',
-    'announ',
-    'announced-but-not-available',
     'announced-for',
-    'announced.',
-    'announcemt',
-    'annoya',
-    'annoyed.',
-    'annoyin\'',
-    'annoying/',
-    'annsboro',
-    'annsborough',
-    'annual-calendar',
-    'annual-change',
-    'annual/oh',
-    'annual/sick',
-    'annualising',
-    'annuality',
-    'annuall',
     'annually&mdash&pound;3,750',
-    'annually-elected',
-    'annually-negotiated',
-    'annually-published',
-    'annually-renewable',
-    'annually.now',
-    'annually.the',
-    'annualt',
-    'annuario',
-    'annuation',
-    'annuitant',
-    'annuitized',
-    'annuity-depreciation',
-    'annular-type',
-    'annularia',
-    'annulata',
     'annuli',
-    'annullment',
-    'annuls',
-    'annum&mdash;the',
-    'annunciate',
-    'annunciator',
-    'annuver',
-    'annuvin',
-    'annwfn',
-    'annwood',
-    'ano-hon-wa',
-    'ano0ther',
-    'anobium',
-    'anode-bend',
-    'anodine',
-    'anogenital',
     'anointest',
-    'anoles',
-    'anolis',
-    'anols',
-    'anolsq',
-    'anom',
-    'anomal',
-    'anomalistic',
-    'anomals',
-    'anomie-based',
-    'anomie-type',
-    'anon-co-operating',
-    'anon-farm',
-    'anone',
-    'anonimous',
-    'anonio',
     'anonis',
-    'anonuevo',
-    'anony&rehy;mous',
-    'anonymity-r-us',
-    'anonymized',
-    'anonymous-impossible',
-    'anonymously-published',
-    'anoon',
-    'anoplura',
-    'anorak-type',
-    'anorak-wearing',
-    'anoraknophobia',
-    'anoraksia',
-    'anorakster',
-    'anorexic/bulimic/compulsive',
-    'anormal',
     'anormativity',
-    'anorthositic',
-    'anorthotiko',
-    'anosmic',
-    'anosov',
-    'anostinho',
-    'anostracan',
-    'anothair',
-    'another&mdash;what',
-    'another(s)',
-    'another-i',
-    'another-middle',
-    'another-no',
-    'another-with',
-    'another.4',
-    'another20%',
     'another_one_er',
-    'anotherr',
-    'anothr',
-    'anothy',
-    'anotte',
-    'anouncement',
-    'anouschka',
-    'anoushka',
-    'anouta',
-    'anovna',
-    'anovulation',
-    'anoxbridge',
-    'anoxygenic',
-    'anpp',
-    'anpulla',
-    'anr&aelig;dum',
     'anrhefn',
-    'ans&oacute;s',
-    'ans*',
-    'ansae',
-    'ansanta',
-    'ansaphones',
-    'ansaruddin',
-    'ansavery',
-    'ansbro',
-    'anscomb/st',
-    'ansd',
-    'ansdale',
-    'ansell-pearson',
-    'ansell/thames',
-    'anselme',
-    'anselmus',
     'anser.',
-    'anserina.',
-    'anserinae',
-    'anserinae.',
-    'anserinatelomeric',
-    'anserine',
-    'anseris',
-    'anses',
-    'ansfred',
-    'ansi-approved',
-    'ansi-compliant',
-    'ansi-type',
-    'ansi/ccitt',
-    'ansiedlungskomission',
-    'ansiminic',
-    'ansley',
     'anslinger',
-    'anslysed',
-    'ansokia',
-    'ansperto',
-    'anstee-algar/peace',
-    'anstess',
-    'anstey/mind',
-    'ansteys',
-    'ansties',
-    'anstix',
-    'anstotelian',
-    'anstry',
-    'ansumana',
-    'ansumane',
-    'answell',
-    'answer-back',
     'answer-orientated',
-    'answer-phone',
-    'answer.',
-    'answer.the',
-    'answer/argument',
-    'answer/input',
-    'answerback',
-    'answerbacks',
-    'answerers',
-    'answering-back',
-    'answermsgbox(no)\'answer',
-    'answers.',
-    'ansys',
-    'ant&eacute;rieur',
-    'ant&eacute;rieures',
-    'ant&oacute;ni',
     'ant&rehy;bear',
-    'ant\'',
-    'ant-',
-    'ant-association',
-    'ant-bear',
-    'ant-dispersed',
-    'ant-drug',
-    'ant-drugs',
-    'ant-eaters',
-    'ant-fed',
-    'ant-files',
-    'ant-inhabited',
-    'ant-interrogation',
-    'ant-l\'ouverture',
-    'ant-plant',
-    'ant-proof',
     'ant-searching',
-    'ant-size',
-    'ant-static',
-    'ant-trail',
-    'ant-transported',
-    'antabi',
-    'antagon&rehy;isms',
-    'antagonisers',
-    'antagonisms.',
-    'antagonistically-expressioned',
-    'antagonst',
-    'antaibao',
-    'antalgesics',
-    'antanaclasis',
-    'antananirivo',
-    'antanas',
     'antanov',
-    'antante',
-    'antapologia',
-    'antara',
-    'antarcticum',
-    'antas',
-    'antat1.3a',
-    'antbird',
-    'ante-chambers',
-    'ante-date',
-    'ante-dating',
-    'ante-preparatory',
-    'ante-room/office',
-    'ante_meridiem',
-    'antecede',
-    'antecedence',
     'antecedent-containing',
-    'antech',
-    'antechinus',
-    'anteclypeus',
-    'antecostae',
-    'antecoxal',
-    'antelias',
-    'antellectuel',
-    'antelope-horn',
-    'antemurale',
-    'antena',
-    'antenna-modem',
-    'antenna.the',
-    'antenna/nerves',
-    'antennae-like',
-    'antennae-trap',
     'antennaria',
-    'antenne-2',
-    'antennophorus',
-    'antependia',
-    'antepenultimate',
-    'antequera',
-    'antera',
-    'anterior/posterior',
-    'anteriorization',
-    'anteriorly-placed',
-    'anteriorly/posteriorly',
-    'anteriormost',
-    'antero',
-    'antero-superiorly',
-    'anteroapical',
-    'anterolateral',
     'anteroseptal',
-    'anteroventral',
-    'anteserum',
-    'antfo',
-    'antgardens',
-    'anthem-like',
-    'anthems-my',
-    'anthems-preston/christ',
-    'anthills.',
-    'anthocyanins',
-    'anthocyanosides',
-    'anthologie',
-    'anthologise',
-    'anthologize',
-    'anthologized',
-    'antholyza',
     'anthon',
-    'anthon&iacute;n',
-    'anthonie',
-    'anthonisz',
-    'anthony\'',
-    'anthony/athlete',
-    'anthonychallenged',
-    'anthophyta',
-    'anthopological',
-    'anthoxanthins',
-    'anthozoa',
-    'anthozoans',
-    'anthracene',
-    'anthracin-containing',
-    'anthracites',
-    'anthracitisation',
     'anthracyt',
-    'anthranoid-containing',
-    'anthro-pology',
-    'anthropism',
-    'anthropists',
-    'anthropogenically',
-    'anthropogeomorphology',
-    'anthropoidai',
-    'anthropoides',
-    'anthropoids',
-    'anthropol',
-    'anthropologia',
-    'anthropologise',
-    'anthropologizing',
-    'anthropology-as-art',
-    'anthropology-as-science',
     'anthropology/western',
-    'anthropology:02',
-    'anthropometrics',
-    'anthropomor&rehy;phized',
-    'anthropomorphically-minded',
-    'anthropomorphising',
-    'anthropomorphisms',
-    'anthropomorphize',
-    'anthropomorphizing',
-    'anthropophagi',
-    'anthropophagous',
-    'anthticus',
-    'anti&mdash;emancipation',
-    'anti&mdash;soviet',
-    'anti&rehy;aircraft',
-    'anti&rehy;american',
     'anti&rehy;avoidance',
-    'anti&rehy;columbus',
-    'anti&rehy;competitive',
-    'anti&rehy;compulsory',
-    'anti&rehy;correctionalism',
-    'anti&rehy;corrosive',
-    'anti&rehy;cosmopolitan',
-    'anti&rehy;determinism',
-    'anti&rehy;entrepreneurial',
-    'anti&rehy;guerrilla',
-    'anti&rehy;imperialist',
-    'anti&rehy;inflationary',
-    'anti&rehy;intellectual',
-    'anti&rehy;jacobite',
-    'anti&rehy;learning',
-    'anti&rehy;militant',
     'anti&rehy;monopoly',
-    'anti&rehy;nazi',
-    'anti&rehy;obsolescence',
-    'anti&rehy;plantagenet',
-    'anti&rehy;positivism',
-    'anti&rehy;racist',
-    'anti&rehy;racketeering',
-    'anti&rehy;romantic',
-    'anti&rehy;scald',
-    'anti&rehy;shipping',
-    'anti&rehy;socialist',
-    'anti&rehy;stalinist',
-    'anti&rehy;structuralist',
-    'anti&rehy;superstitious',
-    'anti&rehy;surrey',
-    'anti&rehy;tank',
     'anti&rehy;theoretical',
-    'anti&rehy;union',
-    'anti&rehy;urbanism',
-    'anti-&agr/',
-    'anti-&agr/anti-myeloperoxidase',
-    'anti-&eacute;tatisme',
-    'anti-\'creeping',
-    'anti-240k',
-    'anti-63k',
-    'anti-abh',
-    'anti-abortionism',
-    'anti-absolutist',
-    'anti-abuse',
-    'anti-academic',
-    'anti-academicism',
-    'anti-accommodationist',
     'anti-accord',
-    'anti-adaptationist',
-    'anti-affirmative-action',
-    'anti-aggregatory',
-    'anti-agricultural',
-    'anti-ai',
-    'anti-airfield',
-    'anti-algerian',
-    'anti-aliased',
-    'anti-allergic',
-    'anti-allergy',
-    'anti-ambush',
-    'anti-amendment',
-    'anti-americans',
-    'anti-anaemia',
-    'anti-analytical',
     'anti-anglican',
-    'anti-anti-pop',
-    'anti-antimissile',
-    'anti-antiracist',
-    'anti-anxiety',
-    'anti-anything',
-    'anti-apache',
-    'anti-aphrodisiac',
-    'anti-aphrodisiacs',
-    'anti-apostatic',
-    'anti-appeasers',
-    'anti-aquarius',
-    'anti-arabism',
-    'anti-arian',
-    'anti-aristide',
-    'anti-aristo',
     'anti-aristotle',
-    'anti-armour',
-    'anti-army',
-    'anti-arrhythmics',
-    'anti-arthritic',
-    'anti-arthritis',
-    'anti-artistic',
-    'anti-asialo',
-    'anti-asthmatic',
-    'anti-athenians',
-    'anti-atlas',
-    'anti-australian',
-    'anti-back-draught',
-    'anti-balance',
-    'anti-ballistic-missile',
-    'anti-ballot',
     'anti-bandwaggoners',
-    'anti-bank',
-    'anti-bazooka',
-    'anti-beatles',
-    'anti-beer',
-    'anti-belfry',
-    'anti-bennett',
-    'anti-bhutan',
-    'anti-bhutto',
-    'anti-bias',
-    'anti-big',
-    'anti-big-business',
-    'anti-bike',
-    'anti-bilingual',
-    'anti-bilious',
-    'anti-bill',
     'anti-biotic',
-    'anti-black/anti-immigrant',
-    'anti-blackgrass',
-    'anti-blemish',
-    'anti-blockade',
-    'anti-blood',
-    'anti-blood-sports',
-    'anti-bnfl',
-    'anti-bodies',
-    'anti-body',
-    'anti-boers',
-    'anti-bolshevist',
-    'anti-bond',
-    'anti-bonk',
-    'anti-booze',
-    'anti-boredom',
     'anti-boss',
-    'anti-bounce',
-    'anti-brdurd',
-    'anti-brit',
-    'anti-britishness',
-    'anti-browsing',
-    'anti-bsp',
-    'anti-btv-10',
-    'anti-build-up',
-    'anti-bureaucracy',
-    'anti-bureaucratism',
-    'anti-burger',
-    'anti-burner',
-    'anti-busing',
-    'anti-c',
-    'anti-c/ebp&dgr',
     'anti-cadherin',
-    'anti-camouflage',
-    'anti-campaigners',
-    'anti-candida',
-    'anti-caning',
-    'anti-capital',
-    'anti-car-theft',
-    'anti-cars',
-    'anti-catchphrase',
-    'anti-cathedral',
-    'anti-cd3',
-    'anti-cd36',
-    'anti-cd68',
-    'anti-cd71',
-    'anti-celebrity',
-    'anti-centralizers',
     'anti-cftr',
-    'anti-characters',
-    'anti-chemical',
-    'anti-chic',
-    'anti-chicken',
-    'anti-chlorine',
-    'anti-chocolate',
-    'anti-choice',
-    'anti-cholera',
-    'anti-cholinergics',
-    'anti-christianity',
-    'anti-church',
-    'anti-churchillian',
-    'anti-clark',
-    'anti-clash',
-    'anti-clerical.',
     'anti-climatically',
-    'anti-clinkering',
-    'anti-clinton',
-    'anti-closure',
-    'anti-cnd',
-    'anti-cnd-all',
-    'anti-coagulated',
-    'anti-coagulation',
-    'anti-coca',
-    'anti-cocaine',
-    'anti-collective',
-    'anti-collectivists',
-    'anti-collision',
-    'anti-colon',
-    'anti-commerciality',
-    'anti-commie',
     'anti-committee',
-    'anti-communautaire',
-    'anti-community',
-    'anti-comprehensive',
-    'anti-computer',
-    'anti-conceptionnel',
-    'anti-confessional',
-    'anti-conscription',
-    'anti-conservation',
-    'anti-conservatism',
-    'anti-conservatives',
-    'anti-conspiracy',
-    'anti-constipation',
-    'anti-contagious',
-    'anti-contemporary',
-    'anti-contraception',
     'anti-contraceptive',
-    'anti-convulsants',
-    'anti-convulsive',
-    'anti-copernicans',
-    'anti-copy',
-    'anti-copyright',
-    'anti-corn-law',
-    'anti-corporate',
-    'anti-corporatist',
-    'anti-corrosive',
-    'anti-corset',
-    'anti-cosy',
-    'anti-coup',
-    'anti-crack',
-    'anti-create',
-    'anti-credo',
     'anti-cricket',
-    'anti-critique',
-    'anti-crowd',
-    'anti-cultists',
-    'anti-culturalism',
-    'anti-cultures',
-    'anti-cuts',
-    'anti-cycling',
-    'anti-cyst',
-    'anti-d',
-    'anti-d&uuml;hring',
-    'anti-dada',
-    'anti-damian',
-    'anti-dampness',
-    'anti-dance',
-    'anti-danish',
     'anti-darwinism',
-    'anti-darwinists',
-    'anti-dazzle',
-    'anti-defamation',
-    'anti-deist',
-    'anti-democrat',
-    'anti-design',
-    'anti-detection',
-    'anti-detectorist',
-    'anti-detectorists',
-    'anti-deterrent',
-    'anti-detonation',
-    'anti-devaluation',
-    'anti-di',
-    'anti-diabetic',
-    'anti-dialectic',
     'anti-diarrhoea',
-    'anti-dickson',
-    'anti-dictatorship',
-    'anti-diet',
-    'anti-dieting',
-    'anti-difference',
-    'anti-dilutive',
-    'anti-diluvian',
-    'anti-disco',
-    'anti-dispersal',
-    'anti-dlp',
-    'anti-document',
-    'anti-dorian',
-    'anti-dostoievsky',
-    'anti-downsizing',
-    'anti-dp-1',
     'anti-dreyfusard',
-    'anti-driftnet',
-    'anti-drink-drive',
-    'anti-drink-driving',
-    'anti-drinking',
-    'anti-driver',
-    'anti-drugs/sports',
-    'anti-duke',
-    'anti-dump',
-    'anti-durfey',
-    'anti-duvalierists',
-    'anti-dynastic',
-    'anti-e-',
-    'anti-echekratid',
-    'anti-ecological',
-    'anti-egalitarianism',
     'anti-egg',
-    'anti-egyptian',
-    'anti-einstein',
-    'anti-elastase',
-    'anti-election',
-    'anti-embargo',
-    'anti-embolic',
-    'anti-enclosure',
-    'anti-enemy',
-    'anti-englishness',
-    'anti-entrepreneurial',
-    'anti-env',
-    'anti-environment',
-    'anti-environmentalism',
-    'anti-environmentalist',
-    'anti-epileptic',
     'anti-episcopalian',
-    'anti-epithelial/anti-brush',
-    'anti-epoxide',
-    'anti-eprdf',
-    'anti-er',
-    'anti-erosion',
-    'anti-erotic',
-    'anti-escape',
-    'anti-escort',
-    'anti-essentialism',
-    'anti-essentializing',
-    'anti-essex',
-    'anti-estab',
-    'anti-eta',
-    'anti-ethical',
-    'anti-euro',
     'anti-euro-federalists',
-    'anti-everybody',
-    'anti-eviction',
-    'anti-evolution',
-    'anti-experimental',
-    'anti-exploitation',
-    'anti-fa-18',
-    'anti-familial',
-    'anti-family',
-    'anti-famine',
-    'anti-fans',
-    'anti-fascista',
-    'anti-fat',
-    'anti-fecundity',
-    'anti-federal',
-    'anti-fee',
     'anti-feedant',
-    'anti-feeling',
-    'anti-feudalist',
-    'anti-fire',
-    'anti-flag',
-    'anti-flame',
-    'anti-flash',
-    'anti-flatulence',
-    'anti-flatulent',
-    'anti-floggers',
-    'anti-florio',
-    'anti-fluke',
-    'anti-fly',
-    'anti-foot',
-    'anti-ford',
-    'anti-foreign-worker',
     'anti-foreignism',
-    'anti-formal',
-    'anti-formalism',
-    'anti-foul',
-    'anti-fouled',
-    'anti-foundational',
-    'anti-fox',
-    'anti-franco',
-    'anti-francoism',
-    'anti-front',
-    'anti-fungals',
-    'anti-fungicide',
-    'anti-fungus',
-    'anti-gag',
-    'anti-galileo',
-    'anti-gamblers',
     'anti-game',
-    'anti-gamsakhurdia',
-    'anti-garlic',
-    'anti-garotter',
-    'anti-garotters',
-    'anti-garrisonian',
-    'anti-gas',
-    'anti-gaullists',
-    'anti-gct',
-    'anti-genetic',
-    'anti-georgian',
-    'anti-germanic',
-    'anti-germanism',
-    'anti-germans',
-    'anti-ghetto',
-    'anti-glamour',
     'anti-global',
-    'anti-glycophorin',
-    'anti-gmp',
-    'anti-gods',
-    'anti-gold',
-    'anti-golf',
-    'anti-gothic',
-    'anti-gp',
-    'anti-graft',
-    'anti-gravel',
-    'anti-gravitational',
-    'anti-gravitics',
-    'anti-greek',
-    'anti-gulf',
-    'anti-gulf-war',
-    'anti-gun',
     'anti-hair',
-    'anti-hamster',
-    'anti-hardline',
-    'anti-harry',
-    'anti-hate',
-    'anti-hbc',
-    'anti-hbe',
-    'anti-hdv',
-    'anti-heath',
-    'anti-hegde',
-    'anti-hegemonism',
-    'anti-hellenistic',
-    'anti-helmet',
-    'anti-herbivore',
-    'anti-hereditarians',
-    'anti-hero/ine',
     'anti-heroine',
-    'anti-heron',
-    'anti-heros',
-    'anti-heuristic',
-    'anti-his-own-class',
-    'anti-historicist',
-    'anti-hitlerism',
-    'anti-hiv-1.',
-    'anti-hla-a',
-    'anti-hla-a2.1',
-    'anti-hla-dr',
-    'anti-homophobic',
-    'anti-homosexuals',
-    'anti-hooligan',
-    'anti-hormones',
-    'anti-hospital',
     'anti-hostile',
-    'anti-housework',
-    'anti-housing',
-    'anti-hsp-65',
-    'anti-humen',
-    'anti-hun',
-    'anti-hus',
-    'anti-hydro',
-    'anti-i-a',
-    'anti-i-e',
-    'anti-iad',
-    'anti-iad-coated',
-    'anti-ibm',
-    'anti-ice',
-    'anti-idolatory',
-    'anti-il-6dbp',
     'anti-il2r',
-    'anti-il6dbp',
-    'anti-illusionism',
-    'anti-image',
-    'anti-immigrant/anti-foreign',
-    'anti-immunologlobulin',
-    'anti-individualism',
-    'anti-indonesian',
-    'anti-informer',
-    'anti-insect',
-    'anti-institution',
-    'anti-institutional',
-    'anti-insular',
-    'anti-intelligent',
-    'anti-interventionist',
-    'anti-intimidation',
     'anti-investiture',
-    'anti-involvement',
-    'anti-iran',
-    'anti-iranian',
-    'anti-irony',
-    'anti-isms',
-    'anti-israel',
-    'anti-jacobin',
-    'anti-jacobite',
-    'anti-jakarta',
-    'anti-jamming',
-    'anti-jap',
-    'anti-japan/britain',
-    'anti-jet',
-    'anti-jna',
-    'anti-joyrider',
     'anti-jubilee',
-    'anti-judaism',
-    'anti-jump',
-    'anti-karajan',
-    'anti-kennedy',
-    'anti-keratin',
-    'anti-keynesian',
-    'anti-kgb',
-    'anti-khomeni',
-    'anti-kim',
-    'anti-kims',
-    'anti-kink',
-    'anti-kitsch',
-    'anti-kmt',
-    'anti-label',
-    'anti-law',
     'anti-law-and-order',
-    'anti-laws',
-    'anti-ldp',
-    'anti-le',
-    'anti-leadership',
-    'anti-league',
-    'anti-leak',
-    'anti-leftist',
-    'anti-leftists',
-    'anti-lichen',
-    'anti-lighthouse',
-    'anti-literary',
-    'anti-litter',
-    'anti-lloyd',
-    'anti-lobby',
-    'anti-local',
     'anti-logocentric',
-    'anti-logs',
-    'anti-love',
-    'anti-lush',
-    'anti-maastrichters',
-    'anti-machiavel',
-    'anti-macho',
-    'anti-macmillan',
-    'anti-madonna',
-    'anti-madrid',
-    'anti-makassar',
-    'anti-malthusian',
-    'anti-manchu',
-    'anti-manufacturing',
-    'anti-maoist',
-    'anti-marcos',
     'anti-marxist/\'60s/experimental',
-    'anti-marxists',
-    'anti-mask',
-    'anti-masonic',
-    'anti-mass',
-    'anti-maxwell',
-    'anti-me',
-    'anti-meat',
-    'anti-mechanical',
-    'anti-medical',
-    'anti-membership',
-    'anti-men',
-    'anti-menem',
-    'anti-mengistu',
-    'anti-mentalistic',
-    'anti-mercantilist',
     'anti-mercian',
-    'anti-meritocratic',
-    'anti-mesometrial',
-    'anti-metabolites',
-    'anti-metropolis',
-    'anti-microsomal',
-    'anti-mig-fl',
-    'anti-militaristic',
-    'anti-milosevic',
-    'anti-minority',
-    'anti-minuteman',
-    'anti-mip-1',
-    'anti-mitotic',
-    'anti-mogul/president/swell',
-    'anti-monarchism',
-    'anti-monopolism',
     'anti-monotony',
-    'anti-monster',
-    'anti-montanist',
-    'anti-montazeri',
-    'anti-montenegrin',
-    'anti-morality',
-    'anti-moroccan',
-    'anti-mosley',
-    'anti-motorway',
-    'anti-movement',
-    'anti-mpla-pt',
-    'anti-mubarak',
-    'anti-mugging',
-    'anti-multiple-sclerosis',
-    'anti-murdoch',
-    'anti-musician',
     'anti-muslim',
-    'anti-mythological',
-    'anti-n&eacute;ocolonialiste',
-    'anti-nabiyev',
-    'anti-narcotic',
-    'anti-nasser',
-    'anti-natal',
-    'anti-natalist',
-    'anti-nationaliser',
-    'anti-nationalism',
-    'anti-nationalistic',
-    'anti-nato',
-    'anti-natural',
-    'anti-naturalism',
-    'anti-naturalist',
-    'anti-negotiation',
     'anti-neutrophile',
-    'anti-newtonian',
-    'anti-nicotine',
-    'anti-nip',
-    'anti-noras',
-    'anti-nowhere',
-    'anti-nuke',
-    'anti-o\'neill',
-    'anti-object',
-    'anti-objectivist',
-    'anti-oestrogen',
-    'anti-oncogenes',
-    'anti-opinion',
-    'anti-oppenheimer',
-    'anti-opt-out',
-    'anti-orestes',
     'anti-organizers',
-    'anti-os/2',
-    'anti-osmosis',
-    'anti-overload',
-    'anti-oxfam',
-    'anti-p24',
-    'anti-page',
-    'anti-paisley',
-    'anti-palestinian',
-    'anti-pankhurst',
-    'anti-parachute',
-    'anti-parallel',
-    'anti-parasite',
-    'anti-parasitic/antibacterial',
-    'anti-parking',
-    'anti-parliamentarian',
     'anti-parliamentarians',
-    'anti-partisans',
-    'anti-partitionism',
-    'anti-pass',
-    'anti-pasti',
-    'anti-pathology',
-    'anti-patriarchal',
-    'anti-pcp',
-    'anti-peace',
-    'anti-peasant',
-    'anti-peat',
-    'anti-peelite',
-    'anti-penal',
-    'anti-peroxidase',
-    'anti-perspective',
-    'anti-peruvian',
     'anti-petrarchan',
-    'anti-pharisaism',
-    'anti-philistinism',
-    'anti-philosopher',
-    'anti-photography',
-    'anti-pigeon-holing',
-    'anti-planners',
-    'anti-plastic',
-    'anti-plebiscitarian',
-    'anti-pluralism',
-    'anti-pneumococcal',
-    'anti-poacher',
-    'anti-poetic',
-    'anti-politicians',
-    'anti-pollutant',
-    'anti-polonism',
     'anti-pommie',
-    'anti-popish',
-    'anti-poppy',
-    'anti-population',
-    'anti-populist',
-    'anti-positivism',
-    'anti-pre-s1',
-    'anti-pre-s2',
-    'anti-predestinarian',
-    'anti-presidential',
-    'anti-prison',
-    'anti-professional',
-    'anti-profits',
-    'anti-prohibition',
-    'anti-projector',
-    'anti-proportional',
     'anti-prostitution',
-    'anti-protectionist',
-    'anti-pruritic',
-    'anti-prussian',
-    'anti-psychiatry',
-    'anti-psychological',
-    'anti-psychotic',
-    'anti-puritanism',
-    'anti-putschist',
-    'anti-quantitative',
-    'anti-quark',
-    'anti-quarks',
-    'anti-quayle',
-    'anti-quota',
-    'anti-race',
-    'anti-racist-action',
     'anti-rackets',
-    'anti-railway',
-    'anti-rap',
-    'anti-rape',
-    'anti-rather',
-    'anti-rationalism',
-    'anti-rauscher',
-    'anti-reactive',
-    'anti-recording',
-    'anti-recruitment',
-    'anti-red',
-    'anti-reductive',
-    'anti-referees',
-    'anti-reflective',
-    'anti-refugee',
-    'anti-regionalists',
     'anti-regulators',
-    'anti-rejection',
-    'anti-relativism',
-    'anti-relativist',
-    'anti-religion',
-    'anti-relocation',
-    'anti-renaissance',
-    'anti-representational',
-    'anti-republic',
-    'anti-republicans',
-    'anti-rescuing',
-    'anti-resonance',
-    'anti-resonant',
-    'anti-revolution',
-    'anti-rheumatick',
-    'anti-rhodesian',
     'anti-ribophorin',
-    'anti-richard',
-    'anti-rifat',
-    'anti-robbery',
-    'anti-rockism',
-    'anti-romanist',
-    'anti-romantic',
-    'anti-romanticism',
-    'anti-romanzo',
-    'anti-rome',
-    'anti-room',
-    'anti-rottie',
-    'anti-rumour',
-    'anti-run-back',
-    'anti-s-100',
-    'anti-sa',
     'anti-saloon',
-    'anti-sanctions',
-    'anti-sandys',
-    'anti-sardinian',
-    'anti-saving',
-    'anti-scald',
-    'anti-scholastics',
-    'anti-scientists',
-    'anti-scorbutic',
-    'anti-scowl',
-    'anti-screening',
-    'anti-scriptural',
-    'anti-scum',
-    'anti-sdp/liberal',
-    'anti-sectarian',
-    'anti-sed',
     'anti-sedition',
-    'anti-seize',
-    'anti-semantic',
-    'anti-semetic',
-    'anti-semitic&mdash;a',
-    'anti-semitics',
-    'anti-sense',
-    'anti-sensual',
-    'anti-sensuality',
-    'anti-septic',
-    'anti-sera',
-    'anti-serb',
-    'anti-sermons',
-    'anti-settler',
-    'anti-sex-symbol',
-    'anti-sexual',
     'anti-shia',
-    'anti-ship/submarine',
-    'anti-shoplifting',
-    'anti-show',
-    'anti-sikh',
-    'anti-sindhi',
-    'anti-slumming',
-    'anti-smear',
-    'anti-smiths',
-    'anti-smoker',
-    'anti-snail',
-    'anti-snake',
-    'anti-snakebite',
-    'anti-socially',
-    'anti-society',
-    'anti-software',
     'anti-something-',
-    'anti-speeding',
-    'anti-spiritual',
-    'anti-splinter',
-    'anti-spray',
-    'anti-stalinism/anti-communism',
-    'anti-star',
-    'anti-stare',
-    'anti-stars',
-    'anti-statesmen',
-    'anti-statusquo',
-    'anti-stranger',
-    'anti-streptokinase',
-    'anti-stress-related',
-    'anti-structuralism',
-    'anti-stussy',
     'anti-stuttgart',
-    'anti-suburban',
-    'anti-suburbanism',
-    'anti-subversive',
-    'anti-suffrage',
-    'anti-suffragette',
-    'anti-sunglasses',
-    'anti-surge',
-    'anti-sweat',
-    'anti-syn',
-    'anti-syndicalist',
-    'anti-systematizing',
-    'anti-systems',
-    'anti-t',
-    'anti-tabloid',
-    'anti-taig',
     'anti-talks',
-    'anti-taxi',
-    'anti-tb',
-    'anti-tcr',
-    'anti-technologists',
-    'anti-tembo',
-    'anti-terrorismo',
-    'anti-terroriste',
-    'anti-testimony',
-    'anti-thatcherism',
-    'anti-theatricalists',
-    'anti-themistocles',
-    'anti-theologian',
-    'anti-therapeutic',
-    'anti-though',
-    'anti-thyroglobulin',
     'anti-tibbu',
-    'anti-tickle',
-    'anti-time',
-    'anti-tithe',
-    'anti-titoist',
-    'anti-tnc',
-    'anti-tnf',
-    'anti-torpedo',
-    'anti-torque',
-    'anti-tourism',
-    'anti-town',
-    'anti-traditionalism',
-    'anti-traditionalists',
-    'anti-trainer',
-    'anti-traitor',
-    'anti-transferrin',
     'anti-travail',
-    'anti-traveller',
-    'anti-treatant',
-    'anti-triad',
-    'anti-tribal',
-    'anti-trinitarian',
-    'anti-tropical',
-    'anti-truancy',
-    'anti-tsarist',
-    'anti-tubercular',
-    'anti-tuberculosis',
-    'anti-tv',
-    'anti-twitch',
-    'anti-tycoon',
-    'anti-u',
-    'anti-u-boat',
     'anti-un',
-    'anti-universe',
-    'anti-uranium',
-    'anti-urbanism',
-    'anti-ussr',
-    'anti-utility',
-    'anti-utopia',
-    'anti-uuuc',
-    'anti-vaccination',
-    'anti-vampire',
-    'anti-vcam-1',
-    'anti-venins',
-    'anti-verruca',
-    'anti-vichy',
-    'anti-vietnamese',
-    'anti-virals',
     'anti-virgilian',
-    'anti-virgin',
-    'anti-vivisectionist',
-    'anti-vocal',
-    'anti-vocational',
-    'anti-vocationalism',
-    'anti-volk',
-    'anti-vp2',
-    'anti-vulgarians',
-    'anti-wagnerian',
-    'anti-washington',
-    'anti-waste-dumping',
-    'anti-welensky',
-    'anti-west',
-    'anti-whacking',
-    'anti-whig',
     'anti-william',
-    'anti-witchcraft',
-    'anti-wolf',
-    'anti-working',
-    'anti-yankee',
-    'anti-yugoslav',
-    'anti-zia',
-    'anti.sexist',
-    'antiacne',
-    'antianginal',
-    'antiapartheid',
-    'antiaris',
-    'antiaristocratic',
-    'antiarrhythmic/',
-    'antiarthritic',
-    'antiastunomologists',
     'antibac',
-    'antibacterials',
-    'antibaryons',
-    'antiben',
-    'antibiose',
-    'antibiotic-resistant',
-    'antibiotics/cortisones',
-    'antibiotics/steroids',
-    'antiblast',
-    'antibo',
-    'antibodies.',
-    'antibody-coated',
-    'antibody-enzyme',
-    'antibody-secreting',
-    'antibody-triggered',
-    'antibody.',
     'antiboyotics',
-    'anticapella',
-    'anticapitalist',
-    'anticarcinogens',
-    'anticarsia',
-    'anticatholicism',
-    'anticentromere',
-    'antiche',
-    'anticholecystokinin',
-    'anticholinergics',
-    'antichriste',
-    'antichristian',
-    'antici&rehy;pating',
-    'antici&rehy;pation',
-    'anticip&eacute;e',
-    'anticipat',
     'anticipate/prevent',
-    'anticipatingly',
-    'anticipational',
-    'anticipative',
-    'anticipator',
-    'antick',
-    'anticlassicism',
-    'anticlimactic.',
-    'anticlimatic',
-    'anticlises',
-    'antico\'',
-    'anticodons',
-    'anticoincidence',
-    'anticolonial',
-    'anticommunism',
-    'anticompetitively',
     'anticonvulsive',
-    'anticooperative',
-    'anticorrelation',
-    'anticpated',
-    'anticuario',
-    'anticubital',
-    'anticytokeratin',
-    'antideluvian',
-    'antidemocratic',
-    'antidiscipline',
-    'antidiscriminatory',
-    'antidisenstablishmentarialism',
-    'antidiuretic',
-    'antidoros',
-    'antidrug',
-    'antidrugs',
     'antidust',
-    'antidynastic',
-    'antiemetics',
-    'antiepithelial',
-    'antierosion',
-    'antievolution',
-    'antifashion',
-    'antifibrillatory',
-    'antifibrinolytics',
-    'antiflood',
-    'antifoaming',
-    'antifungals',
-    'antigen-binding',
-    'antigen-directed',
-    'antigen-positive',
-    'antigen-rich',
     'antigen/ml',
-    'antigenaemia',
-    'antigens/hsp-65',
-    'antiglare',
-    'antigones',
-    'antigonish',
-    'antiguans',
-    'antiguo',
-    'antihelmintics',
-    'antiherpes',
-    'antihistaminic',
-    'antihomosexual',
-    'antihumanist',
-    'antihumanitarian',
-    'antihypertensives',
-    'antii',
     'antiimperialist',
-    'antiinternment',
-    'antikenmuseum',
-    'antikensammlung',
-    'antikes',
-    'antiks',
-    'antileucocyte',
-    'antilogs',
-    'antilooting',
-    'antilymphoblast',
-    'antilysozyme',
-    'antimacassar',
-    'antimalaria',
-    'antimalarial\'',
-    'antimarket',
-    'antimatter&mdash',
     'antimenes',
-    'antimercantile',
-    'antimeridian',
-    'antimesenteric',
-    'antimetabole',
-    'antimetastasis',
-    'antimiocrobial',
-    'antimonarchical',
-    'antimonide',
-    'antimonies',
-    'antimonous',
-    'antimortem',
-    'antimouse-lgg',
-    'antimuscarinic',
-    'antimutagens',
-    'antimyeloperoxidase',
     'antin',
-    'antinaktes',
-    'antinational',
-    'antinausea',
-    'antineurofilament',
-    'antinomians',
-    'antiobiotic',
-    'antioch-on-the-orontes',
-    'antiochene',
-    'antione',
-    'antionette',
-    'antioqu&iacute;a',
-    'antioquian',
-    'antiorganic',
-    'antioxidative',
-    'antipalon',
     'antipancreatic',
-    'antiparallel-stranded',
-    'antipathic',
-    'antipeople',
-    'antiperoxydase',
-    'antiperspirant',
-    'antiperspirants',
-    'antiphanes',
-    'antiphlogistic',
-    'antiphlogistine',
-    'antiphonary',
-    'antiphoner',
-    'antiplasmin',
-    'antipodean-style',
-    'antipodian',
-    'antipology',
     'antipope',
-    'antiporcine',
-    'antiport',
-    'antiproteases',
-    'antipsychiatry',
-    'antipsychotic',
-    'antiputrescent',
-    'antipyrgos',
-    'antiq',
-    'antiq.',
-    'antiqua/bruno',
-    'antiquack',
-    'antiquari',
-    'antiquatedly-armoured',
-    'antique-dealers',
-    'antique-dealing',
     'antique-finish',
-    'antique-look',
-    'antique-looking',
-    'antique-model',
-    'antique-spotting',
-    'antique/collectors',
-    'antiques&mdash;i',
-    'antiques-hunting',
-    'antiques-packed',
-    'antiques.i',
-    'antiquissimum',
-    'antiquit&auml;ten',
-    'antiquitates',
-    'antiquitus',
-    'antiquityes',
-    'antiquorum',
     'antiquus',
-    'antiradar',
-    'antirational',
-    'antiresonant',
-    'antirrhinum-like',
-    'antiscientific',
-    'antise',
-    'antisegregation',
-    'antiself',
-    'antiseptic-looking',
-    'antiseptic/antibiotic',
-    'antiseptically',
-    'antiseptics/antibiotics',
-    'antiseptics/bacterials',
-    'antisera.',
-    'antiserums',
     'antisexual',
-    'antisheep',
-    'antisiphon',
-    'antislave',
-    'antisocialism',
-    'antisocially',
-    'antispasmodic',
-    'antispasmodics',
-    'antispirochetal',
-    'antistall',
-    'antistate',
-    'antistreplase',
-    'antistreptococcal',
-    'antistrophe',
-    'antisyphoning',
-    'antiterorrista',
     'antiterrorista',
-    'antiterroristas',
-    'antitesting',
-    'antitheft',
-    'antithetically',
-    'antithrombin',
-    'antithymocyte',
-    'antitotalitarian',
-    'antitoxoplasma',
-    'antituberculosis',
-    'antitypes',
-    'antiulcerogenic',
-    'antium',
-    'antivirals',
-    'antiwork',
-    'antix',
     'antixoidants',
-    'antizion',
-    'antkiv/musical',
-    'antler-axe',
-    'antler-picks',
-    'antless',
-    'antlia',
-    'antliff',
-    'antliss',
-    'anto',
-    'antobody',
-    'antoci',
-    'antoher',
-    'antoine-augustin',
-    'antoine/escape',
-    'antoines',
     'antoko\'ny',
-    'antommarchi',
-    'antonacci',
-    'antone',
-    'antonellos',
-    'antonetti',
-    'antonev',
-    'antoniazzeschi',
-    'antoniazzo',
-    'antonides',
-    'antonieta',
-    'antoniewicz',
-    'antonii',
-    'antonimity',
-    'antonina',
-    'antonino',
     'antonio-based',
-    'antonov-26',
-    'antonovsky',
-    'antonymic',
-    'antoxidants',
-    'antr&aacute;s',
-    'antral-duodenal',
-    'antrieflux',
-    'antrim-based',
-    'antrim/downpatrick',
-    'antro',
-    'ants-the',
-    'ants/year',
-    'antscherl',
-    'antseranana',
-    'antsiranana',
     'antulay',
-    'antur',
-    'anture',
-    'antwerp1',
-    'antwerpen',
-    'antwerpenstrasse',
-    'antwi',
-    'anty',
-    'anty-oxy',
-    'anuak',
-    'anually',
-    'anuarbek',
-    'anuga',
-    'anui',
-    'anukan',
-    'anulingus',
     'anum',
-    'anunciation',
-    'anunziata',
-    'anupam',
-    'anuria',
-    'anuric',
-    'anurion',
-    'anushka',
-    'anutrients',
-    'anuwat',
-    'anva',
-    'anvar',
-    'anvar-i',
-    'anverdons',
-    'anvers',
-    'anvers-sur-oise',
     'anvil-like',
-    'anville',
-    'anwa',
-    'anwar-saab',
-    'anwarpe',
-    'anwars',
-    'anwarshipping',
-    'anwaruddin',
-    'anwati',
-    'anwatr',
-    'anway',
-    'anwoth',
-    'anxietas',
-    'anxiety-',
-    'anxiety-dream',
-    'anxiety-induced',
     'anxiety-management',
-    'anxiety-reduction',
-    'anxiety-related',
-    'anxiety.',
-    'anxiolytics',
-    'anxious-cautious',
-    'anxious-to-integrate',
-    'anxious-to-please',
-    'anxious.',
-    'anxious/ambitious',
-    'any&rehy;more',
-    'any\'',
-    'any-',
-    'any-more',
-    'any-old-how',
-    'any-thing',
     'any-we',
-    'any/every',
-    'any8',
-    'any_more',
-    'anyanya',
-    'anyboday',
-    'anybody&mdash;would',
-    'anybody\'s',
-    'anybodys',
-    'anybus',
-    'anycase',
-    'anye',
-    'anyes',
-    'anyfamily',
-    'anyfunk',
-    'anyho',
     'anyhow&mdash',
-    'anylsts',
-    'anymole-else',
-    'anymore.this',
-    'anyon',
-    'anyone&mdash;i',
-    'anyone&mdash;including',
-    'anyone&mdash;the',
-    'anyone\'',
-    'anyone-for-tennis',
-    'anyone.',
-    'anyone/everyone',
-    'anyone/someone',
-    'anyother',
-    'anythin',
-    'anything&mdash',
     'anything&mdash;and',
-    'anything\'',
-    'anything-a',
-    'anything-but-carefree',
-    'anything-but-free',
-    'anything-but-lovable',
-    'anything-but-ragged',
-    'anything-core',
-    'anything-though',
-    'anything/working',
-    'anything_at',
-    'anything_except',
-    'anything_other',
-    'anything_with',
-    'anythingto',
-    'anythinke',
     'anytown',
-    'anyushkeleh',
-    'anyvay',
-    'anywany',
-    'anyway&ndash',
-    'anyway&rehy;without',
-    'anyway_because',
-    'anyway_so',
-    'anywayz',
-    'anywey',
-    'anzaas',
-    'anzakias',
-    'anzald&uacute;a',
-    'anzere',
-    'anziger',
-    'anzilotti',
     'anzorregu&iacute',
-    'anzusehen',
-    'aoe',
-    'aoew',
-    'aoibhe',
-    'aoifes',
-    'aoin',
-    'aolaia',
-    'aonack',
-    'aonalaschkae',
-    'aonghas',
-    'aonghusa',
-    'aooxford',
-    'aop.12',
-    'aopec',
-    'aor/mor',
     'aor1',
-    'aor2',
-    'aor3',
-    'aoraki',
-    'aornos',
-    'aorta-contracting',
-    'aortas',
-    'aortic-valve',
-    'aortoportography',
-    'aoss',
-    'aotearoa-new',
-    'aotrou',
-    'aouncontrols',
-    'aoussou',
-    'aout',
-    'aoyagi',
     'aoyama',
-    'ap&rehy;plauding',
-    'ap-analytical',
-    'ap-art-ment',
-    'ap-chagi',
-    'ap.',
-    'ap/6000',
-    'ap110',
-    'ap2',
-    'ap2/3',
-    'ap210',
-    'ap310',
-    'ap4',
-    'ap5-resistant',
-    'ap5/psd',
-    'ap60',
     'ap9',
-    'ap:elite',
-    'apac',
-    'apache-style',
-    'apachi',
-    'apacs',
-    'apagb',
-    'apai',
-    'apal',
-    'apalachicola',
-    'apanages',
-    'apanteles',
-    'aparatchiks',
-    'aparche',
-    'aparecido',
-    'aparigraha',
     'aparine',
-    'apart\'',
-    'apart-a',
-    'apart-hate',
-    'apart-soldiered',
-    'apart-time',
-    'apart.',
-    'apartamentos',
-    'apartheid-capitalism',
-    'apartheid-free',
-    'apartheid-ridden',
-    'apartheid-rooted',
-    'apartheids',
-    'aparthied',
-    'apartment-blocks',
-    'apartment-dwelling',
     'apartment-sized',
-    'apartment/sales',
-    'apasha',
-    'apasholisis',
-    'apasholisseos',
-    'apassionata',
-    'apastapeque',
-    'apath',
-    'apathe',
-    'apathy.',
-    'apatite-rich',
-    'apatosaurus',
-    'apatrides',
-    'apatura',
-    'apax',
-    'apbus',
     'apc-approved',
-    'apck2',
-    'apcs',
-    'apd/',
-    'apd/3700925/wp',
-    'apd1700',
-    'apdo',
-    'ape-devil',
-    'ape-dropping',
-    'ape-eyes',
-    'ape-hanger',
-    'ape-hominoids',
-    'ape-people',
-    'apedale',
-    'apehood',
-    'apeing',
     'apelaciones',
-    'apeldorn',
-    'apellation',
-    'apeman',
-    'apenalty',
-    'apenera',
-    'apenisa',
-    'apep',
-    'apepeople',
-    'apercu',
-    'aperforation',
-    'apersonal',
-    'apertate',
-    'aperte',
-    'apertif',
-    'aperture-less',
     'aperture-priority',
-    'apertured',
-    'apes&mdash;is',
-    'apesokari',
-    'apeth',
-    'apexco',
-    'apfelkrem',
-    'apfelstrudel',
-    'apg',
-    'apgrp',
-    'aphaca',
-    'aphaenogaster',
-    'aphaeresis',
-    'aphanamixis',
-    'aphareus',
-    'aphasia-producing',
     'aphek',
-    'aphelandra',
-    'aphelocoma',
-    'aphicides',
-    'aphid-ridden',
-    'aphid-tending',
-    'aphidoidea',
-    'aphins',
-    'aphorismic',
-    'aphorist',
-    'aphrodite-like',
-    'aphrodite-spes',
-    'aphtha',
-    'aphthae',
-    'aphthoid',
-    'aphyllum',
     'aphyocharax',
-    'aphytis',
-    'api-88',
-    'apiae',
-    'apiamin',
-    'apianus',
-    'apiary-keepers',
-    'apiaster',
-    'apic',
-    'apicello',
-    'apichari',
-    'apichella/anti',
-    'apician',
-    'apicolateral',
-    'apicorp',
-    'apidae',
     'apinion',
-    'apioline',
-    'apish',
-    'apistle',
-    'apisto',
-    'apithy',
-    'apiti',
-    'apiu',
-    'apivotal',
-    'aples',
-    'apliavit',
-    'aplicaciones',
-    'aplicants',
-    'aplix',
-    'aplocheilus',
-    'apls',
     'aplysian',
-    'apms',
-    'apna',
-    'apnea',
-    'apneoa',
-    'apo&rehy;logists',
-    'apo-',
-    'apo-a',
-    'apo-b',
-    'apo-protein',
-    'apoa',
-    'apoai',
-    'apoal',
-    'apocalpyse',
-    'apocalypticnatural',
-    'apocolocyntosis',
     'apocrisiar',
-    'apocrita',
-    'apocryphally',
-    'apocynum',
-    'apodeictic',
-    'apodidae',
-    'apodous',
-    'apoidea',
-    'apol',
-    'apol.',
-    'apolda-jena-weimar',
-    'apoligise',
-    'apoligised',
-    'apoliticism',
-    'apollinax',
-    'apolline-dionysiac',
     'apollinian',
-    'apollinis',
-    'apollinische',
-    'apollo-derived',
-    'apollo-in-the-glens',
-    'apollo-like',
-    'apollo/domain',
-    'apollo/soyuz',
-    'apollod&oacute;0ros',
-    'apollodoros',
-    'apologetic.',
-    'apologi',
-    'apology/excuse',
-    'apomictic',
-    'apomicts',
-    'apomorphine',
     'aponogetonaceae',
-    'apophthegms',
-    'apophyllite',
-    'apoplectically',
-    'apoptosis-associated',
-    'apoptosis-inducing',
-    'aporepressor',
-    'aporetic',
-    'aporthetos',
-    'aportion',
-    'apos',
-    'aposematically',
-    'aposiopetic',
-    'apossible',
-    'apostasie',
-    'apostatize',
     'apostatized',
-    'aposteln',
-    'apostelnstrasse',
-    'apostille',
-    'apostle-mentors',
-    'apostleship',
-    'apostol',
-    'apostolates',
-    'apostopoulos',
-    'apostrophed',
-    'apostrophise',
-    'apostrophised',
-    'apostrophising',
-    'apostrophize',
-    'apostrophizing',
-    'apoteksbolaget',
     'apoth&eacute;ose',
-    'apothecaria',
-    'apothegm',
-    'apothegmata',
-    'apothegmatic',
-    'apotheosised',
-    'apotheosising',
-    'apothesis',
-    'apottery',
-    'apout',
-    'app&eacute;tit',
-    'app-type',
-    'app/c/92/m1710/616168',
-    'app/m1710/a/92/203052',
-    'app/u2370/a/88/103680',
-    'app/u2370/a/91/192067',
     'appa-ratus',
-    'appalachian-variscan',
-    'appaled',
-    'appall',
-    'appallingly-titled',
-    'appanage',
-    'apparail',
-    'apparant',
-    'apparatchiki',
-    'apparati',
-    'apparc',
-    'apparel-manufacturing',
-    'apparen',
-    'apparently-green',
-    'apparently-inexorable',
-    'apparently.',
     'apparentrise',
-    'apparition&mdash;who',
-    'apparition-watchers',
-    'apparitions-and',
-    'apparitors',
-    'apparrent',
-    'appassany',
-    'appassionato',
-    'appauled',
-    'appauling',
-    'appblk',
-    'appc-based',
-    'appealed.',
-    'appeals.',
-    'appear&lsqb;ed&rsqb',
-    'appear&rehy;ances',
     'appear-statements',
-    'appeara',
-    'appearance-',
-    'appearance-based',
-    'appearance-conscious',
-    'appearance-the',
-    'appearance-versus-reality',
-    'appearance-wise',
-    'appearance.with',
-    'appearance/accomplishments',
-    'appearance/dress',
-    'appearance/reality',
-    'appearance/tidiness',
-    'appearance_on',
-    'appearancereality',
-    'appearances.',
     'appeare',
-    'appeared/',
-    'appearent',
-    'appearently',
-    'appeares',
-    'appearing_on',
-    'appears*',
-    'appears-has',
-    'appeart',
-    'appel\'sin',
-    'appelaing',
-    'appelboom',
-    'appeler',
-    'appell',
-    'appellacionum',
-    'appelle',
     'appello',
-    'appels',
-    'appendicectomies',
-    'appendicetomy',
-    'appendicitis.',
-    'appendicularians',
-    'appennines',
-    'appenzell-ausserrhoden',
-    'appenzellerei',
-    'apperception',
-    'apperknowle',
-    'apperley/gloucestershire',
-    'apperley/sun',
-    'apperly',
-    'appertaininge',
-    'appertenant',
     'appestat',
-    'appetencies',
-    'appetency',
-    'appetite\'',
-    'appetite-killer',
-    'appetite-satisfying',
-    'appetite-suppressant',
-    'appetite-wise',
-    'appication',
-    'appichella',
-    'appignanesi',
-    'apping',
-    'appiol',
-    'applaing',
-    'applaudable',
-    'applauder',
     'applaudin\'',
-    'applause.',
-    'apple-',
-    'apple-and-blackcurrant',
-    'apple-and-quince',
-    'apple-bearing',
-    'apple-blossom-time',
-    'apple-boughs',
-    'apple-corers',
-    'apple-growers',
-    'apple-halves',
-    'apple-juice',
-    'apple-logoed',
-    'apple-motorola',
-    'apple-mouth',
-    'apple-paring',
     'apple-pies',
-    'apple-pip',
-    'apple-pips',
-    'apple-planter',
-    'apple-producing',
-    'apple-round',
-    'apple-shaped',
-    'apple-skins',
-    'apple-thief',
-    'apple.',
-    'apple/ibm/novell',
-    'apple/macintosh',
-    'apple/taligent',
-    'applebee',
-    'applebey',
-    'appleby-warcop',
     'applecote',
-    'appledesign',
-    'appledore',
-    'appledorn',
-    'appledouble',
-    'appledurcombe',
-    'applegate/instructor',
-    'applegirth',
-    'applegreen',
-    'applenotch',
-    'applepicks',
-    'appleplex',
-    'apples.and',
-    'apples/apple',
-    'apples/pears',
-    'applesauce',
     'appleseed',
-    'appleshore',
-    'applesingle',
-    'applesque',
-    'applethwaite',
-    'appleton-le-street',
-    'appletree',
-    'appleworld',
-    'applewriter',
-    'appleyards',
-    'appliance-based',
-    'appliances.',
-    'applic',
-    'applic&rehy;ability',
-    'applicabilities',
-    'applican',
     'applicat',
-    'applicatino',
-    'application&mdash',
-    'application&mdash;see',
-    'application&mdash;that',
-    'application&rehy;specific',
-    'application(s)',
-    'application-',
-    'application-dependent',
-    'application-enabling',
-    'application-independent',
-    'application-linked',
-    'application-oriented',
-    'application-to-application',
-    'application-visible',
-    'application.i',
     'application/renewal',
-    'applicational',
-    'applications&mdash;filing',
-    'applications-oriented',
-    'applications-relevance',
-    'applications-software',
-    'applications/policies',
-    'applicaton',
-    'applicon',
-    'applier',
-    'appliers',
-    'applies&mdash;see',
-    'appliq&uacute;ed',
-    'appliqu&eacute;-work',
-    'appliqu&eacute;s',
-    'appliquee',
     'appliquer',
-    'appliques',
-    'applobish',
-    'apply\'',
-    'apply(3)',
-    'apply.not',
-    'apply/do',
-    'apply_in_relation',
-    'applyfees',
-    'appn/nn',
-    'appoggiatura',
-    'appoi',
-    'appointed&mdash;and',
-    'appointed-dual',
-    'appointed.',
-    'appointee.',
     'appointged',
-    'appointive',
-    'appointme',
-    'appointment\'',
-    'appointments.',
-    'appold',
-    'appolinaire',
-    'appolodorus',
-    'appologise',
-    'appomattox',
-    'apponale',
-    'apppearance',
-    'appraisal-linked',
-    'appraisal/project',
-    'appraisees',
-    'appraiser/appraisee',
     'appraoching',
-    'appre',
-    'appre&rehy;hended',
-    'appreached',
-    'appreaciate',
-    'appreaciated',
-    'apprecia&rehy;tive',
-    'appreciability',
-    'appreciably&mdash;all',
-    'appreciated-',
-    'appreciately',
-    'appreciation-\'what',
-    'appreciation.c.c',
-    'apprehendo',
-    'apprehensive-looking',
-    'appreiciate',
     'apprendre',
-    'apprent',
-    'apprentice-bond',
-    'apprentice-entered',
-    'apprentice-historian',
-    'apprentice-taxmen',
-    'apprentice-trained',
-    'apprentice/raf',
-    'apprenticeship.',
-    'apprentishipp',
-    'apprize',
-    'apprnce',
-    'appro.',
-    'approach\'',
-    'approach-',
-    'approach-optical',
     'approach/tower',
-    'approach1',
-    'approbations',
-    'approche',
-    'approoaches',
-    'approof',
-    'approp',
-    'appropinquante',
-    'appropinquata',
-    'approporiate',
-    'appropot',
-    'appropri',
-    'appropri&eacute;e',
-    'appropri-',
-    'appropria',
-    'appropriat&rehy;ing',
     'appropriate&mdash;that',
-    'appropriate\'',
-    'appropriate-',
-    'appropriately-named',
-    'appropriateness-conditions',
-    'appropriateness_in',
-    'approprite',
-    'approriate',
-    'approv',
-    'approvable',
-    'approval-procedures',
-    'approval-rating',
-    'approval/',
-    'approval/denial',
-    'approval/has',
-    'approval/support/reassurance',
     'approve&mdash;she',
-    'approve-if',
-    'approved-\'what',
-    'approved-body',
-    'approved-of',
-    'approved/desired',
-    'approved/non-approved',
-    'approx.2',
-    'approx.8ml',
-    'approxi&rehy;mate',
-    'approximatley',
-    'appserver',
-    'appstudio',
-    'appt.',
-    'appts',
-    'appuldurcome',
     'appwizard',
-    'appying',
-    'apq&ndash;13',
-    'apr&eacute;s',
-    'apr&eacute;s-sail',
-    'apr&egrave;s-din&eacute;e',
-    'apr&egrave;s-diners',
-    'apr&egrave;s-guerre',
-    'apr&egrave;s-midis',
-    'apr&egrave;s-premier',
-    'apr&egrave;s-school',
-    'apr&ndash;1',
-    'apr&ndash;23',
-    'apr&ndash;30',
-    'apr&ndash;sept',
-    'apr-1-neo',
     'apr/credit',
-    'apr21/may21',
-    'apraxic',
-    'aprel',
-    'aprell',
-    'apremont',
-    'apres-apres-ski',
-    'apres-riding',
-    'apres-season',
-    'apress',
-    'apri',
-    'apri1',
-    'apricot-pink',
-    'apricot-salmon',
-    'apricot-white',
-    'apries',
     'aprika',
-    'april&ndash;13',
-    'april&ndash;24',
-    'april&ndash;29',
-    'april&ndash;3',
-    'april&ndash;9',
-    'april&ndash;early',
-    'april&ndash;july',
-    'april&ndash;june',
-    'april&ndash;oct',
-    'april&ndash;october',
-    'april\'92',
-    'april-14',
-    'april-2',
-    'april-29',
-    'april-31',
     'april-4',
-    'april-7',
-    'april-8',
-    'april-august',
-    'april-born',
-    'april-december',
-    'april-england',
-    'april-i',
-    'april-july',
-    'april-march',
-    'april/francis',
-    'april/july',
-    'april/witney/oxfordshire',
-    'april1993',
-    'april1996',
-    'aprilhe',
     'aprilis',
-    'aprils',
-    'aprismo',
-    'aprista',
-    'apristas',
-    'aprivate',
-    'aprkham',
-    'aprlow',
-    'aproach',
-    'aproaches',
-    'aprojected',
-    'apron-like',
-    'apron-pouches',
-    'apron-stage',
-    'aproposed',
-    'aprotinin/l',
     'aprotinin/ml',
-    'aprotinine',
-    'aprotonin',
-    'aproximately',
-    'aprroached',
-    'aps/psa&mdash;automobile',
-    'apse-end',
-    'apsewac',
-    'apsey',
-    'apsidal-ended',
-    'apsion',
-    'apsley/cirencester',
-    'apsly',
-    'apsotles',
-    'apss',
-    'apsychologist',
     'apt.',
-    'aptc',
-    'aptdo',
-    'aptech',
-    'apteros',
-    'aptest',
-    'apthous',
-    'aptients',
-    'aptitud',
-    'aptly-titled',
-    'aptt',
-    'aptychi',
-    'apure',
-    'apurimac',
-    'apx-6',
-    'apx-86',
     'apx-based',
-    'apx12',
-    'apxs',
-    'apyrase',
-    'aq1073',
-    'aqa',
-    'aqbout',
-    'aqesqn',
-    'aqms',
-    'aqrawi',
-    'aqro1',
-    'aqsa',
-    'aqua-',
-    'aqua-coloured',
-    'aqua-decor',
-    'aqua-green',
     'aqua-jets',
-    'aqua-link',
-    'aqua-mammal',
-    'aqua-marine',
-    'aqua-planing',
-    'aqua-planning',
-    'aqua-soil',
-    'aqua-velvet',
-    'aquabatic',
-    'aquablast',
-    'aquacade',
-    'aquacontact',
-    'aquacool',
-    'aquad',
-    'aquaeous',
-    'aquafin',
     'aquafit',
-    'aquaflyte',
-    'aquafun',
-    'aquaglo',
-    'aquaguard',
-    'aquaintances',
-    'aqualash',
-    'aqualog',
-    'aqualunged',
-    'aqualunging',
-    'aqualungs',
-    'aquamixa',
-    'aquanaut',
-    'aquanauts',
-    'aquaphobes',
-    'aquaplaned',
     'aquaplanes',
-    'aquaplany',
-    'aquaprivy',
-    'aquaresistant',
-    'aquari',
-    'aquaria/siporax',
-    'aquarian/new',
-    'aquarium-',
-    'aquarium-kept',
-    'aquarium-sized',
-    'aquasafe',
-    'aquasave',
-    'aquascaped',
-    'aquascaper/vibrascaper',
-    'aquaseal',
-    'aquasoil',
     'aquasolve',
-    'aquasplash',
-    'aquasports',
-    'aquastats',
-    'aquatade',
-    'aquatechnics',
-    'aquatically',
-    'aquatinta',
-    'aquatinted',
-    'aquatone',
-    'aquavac',
-    'aquiar',
-    'aquiescence',
-    'aquil',
-    'aquila.',
-    'aquilaea',
     'aquilids',
-    'aquilifer',
-    'aquilina-ross',
-    'aquilinus',
-    'aquilus',
-    'aquin',
-    'aquinatis',
-    'aquiring',
-    'aquirre',
-    'aquisitions',
-    'aquiver',
-    'ar&aacute;khova',
-    'ar&eacute',
-    'ar&plus',
-    'ar\'',
-    'ar\'nt',
     'ar(2)',
-    'ar(n)',
-    'ar(o)',
-    'ar+',
-    'ar-15',
-    'ar-ch-er',
-    'ar-lott',
-    'ar-ran-ge-ment',
-    'ar-razzaq',
-    'ar-rifai',
-    'ar.d',
-    'ar.ii',
-    'ar/ar',
-    'ar/home',
-    'ar/home/travel',
-    'ar10',
     'ar2',
-    'ar705',
-    'ar706',
-    'ar727',
-    'ar735',
-    'ar739',
-    'ara&rehy;approved',
-    'araan',
-    'arab-african',
-    'arab-backed',
-    'arab-designated',
-    'arab-held',
-    'arab-inhabited',
-    'arab-jewish',
-    'arab-killer',
-    'arab-led',
     'arab-occupied',
-    'arab-sponsored',
-    'arab-style',
-    'arabah',
-    'arabank',
-    'arabesque-style',
-    'arabesquing',
-    'arabia.he',
-    'arabia/',
-    'arabian-financed',
-    'arabian1',
-    'arabian1n/a',
-    'arabic-african',
-    'arabic-english-arabic',
-    'arabic-speaker',
-    'arabic-speakers',
     'arabic-style',
-    'arabicum',
-    'arabin',
-    'arabinose',
-    'arabis',
-    'arabisation',
-    'arabise',
-    'arabistan',
-    'arabition',
-    'arabization',
-    'arabized',
-    'arable-farming',
-    'arable/grass',
-    'arable/pastoral',
-    'arabo-islamism',
-    'arac',
     'arachic',
-    'arachidonoyl',
-    'arachidonyl',
-    'arachiodonic',
-    'arachnoidea',
-    'arachnoides',
-    'arachnoiditus',
-    'arachnologist',
-    'arachnologists',
-    'arachnomaniac',
-    'arachnophobe',
-    'arachova',
-    'aracknophobia',
-    'aracoeli',
-    'aracy',
-    'aracylation',
     'arada',
-    'aradanza',
-    'arade',
-    'arado',
-    'arae',
-    'arafat-husayn',
-    'arafat.',
-    'aragnouet',
-    'aragon.',
-    'aragona',
-    'araja',
-    'araji',
-    'arakanese',
-    'arakcheev',
-    'araliaceae',
-    'araliaceous',
     'arall',
-    'araly',
-    'aram-naharaim',
-    'aramaeans',
-    'aramah',
-    'aramaic-speaking',
-    'aramaick',
-    'aramar',
-    'arambol',
-    'arame',
-    'arameans',
-    'aramians',
-    'aramintas',
-    'aramites',
-    'aran-knit',
-    'aran-type',
     'arancia',
-    'arancibia',
-    'arandar',
-    'arandaspida',
-    'arangil',
-    'arangio-ruiz',
-    'aranmore',
-    'aranyaprathet',
-    'arapahoe',
-    'arapaima',
-    'ararats',
-    'arasluokuoktastugorna',
-    'arason',
-    'arasse',
-    'arate',
-    'arathion',
     'arathra',
-    'arator',
-    'arattlin\'',
-    'aratus',
-    'araucana',
-    'arauna',
-    'arava',
-    'aravalli',
-    'aravena',
-    'arawaks',
-    'arawet&eacute',
-    'arays',
-    'arb&eacute;ost',
-    'arbailles',
-    'arbalastier',
-    'arbatov',
     'arbeidsbureau',
-    'arbeiten',
-    'arbeiterpartei',
-    'arbeiterwohlfahrt',
-    'arbeitgeber',
-    'arbeitsamt',
-    'arbeitsgemeinschaft',
-    'arbeitskreis',
-    'arbejdsformidling',
-    'arbel',
-    'arbel&aacute;ez',
-    'arben',
-    'arbetareparti',
-    'arbetarepartiet',
-    'arbhabhiramaagriculture',
-    'arbi',
     'arbia',
-    'arbikfini',
-    'arbin',
-    'arbinas',
-    'arbitary',
-    'arbiter-president',
-    'arbitr',
-    'arbitrage-free',
-    'arbitragers',
-    'arbitrages',
-    'arbitraria',
-    'arbitrarian',
-    'arbitratione',
-    'arbitrationthe',
-    'arbitrator.',
-    'arbitrators-dual',
     'arbitratus',
-    'arblaster',
-    'arblasts',
-    'arbnori',
-    'arbonne',
-    'arboretums',
-    'arboreus',
-    'arborfield',
-    'arboriculture',
-    'arboriform',
-    'arborite',
-    'arborization',
-    'arborophile',
-    'arbreu',
-    'arbur&uacute;a',
-    'arbustum',
     'arbuzov',
-    'arc&eacute',
-    'arc-en-ciel',
-    'arc-light',
-    'arc-shaped',
-    'arc-trench',
-    'arc-welder',
-    'arc.',
-    'arc/foreland-basin',
-    'arc/node',
-    'arcachidonic',
-    'arcachon',
-    'arcade-action',
-    'arcadeowner',
-    'arcadiae',
-    'arcadiana',
     'arcadias',
-    'arcal',
-    'arcalis',
-    'arcanely',
-    'arcanely&rehy;enunciated',
-    'arcangues',
-    'arcari',
-    'arcati',
-    'arcc',
-    'arcelona',
-    'arceri',
-    'arch&aacute;eologiques',
-    'arch&auml;ologische',
-    'arch&eacute;ologues',
-    'arch&rehy;conservative',
-    'arch&yuml;tas',
     'arch-agent',
-    'arch-appeaser',
-    'arch-backed',
-    'arch-bamboozler',
-    'arch-baseliner',
-    'arch-bebop',
-    'arch-bishop',
-    'arch-boss',
-    'arch-capitalists',
-    'arch-chaplain',
-    'arch-competitor',
-    'arch-conspirator',
-    'arch-critic',
-    'arch-cynic',
-    'arch-deacons',
-    'arch-demagogue',
     'arch-ditherer',
-    'arch-exponent',
-    'arch-favourite',
-    'arch-gallic',
-    'arch-guru',
-    'arch-heretics',
-    'arch-humiliators',
-    'arch-ideologue',
-    'arch-illusion',
-    'arch-introspective',
-    'arch-kinnockites',
-    'arch-lector',
-    'arch-like',
-    'arch-minimalist',
-    'arch-opponent',
-    'arch-opponents',
     'arch-political',
-    'arch-practitioner',
-    'arch-priestess',
-    'arch-priests',
-    'arch-proponent',
-    'arch-publicist',
-    'arch-rebel',
-    'arch-smuggler',
-    'arch-socialist',
-    'arch-squanderer',
-    'arch-support',
-    'arch-supports',
-    'arch-thatcherite',
-    'arch-tory',
-    'arch-weirdos',
-    'arch-wet',
     'archadian',
-    'archadians',
-    'archaemenid',
-    'archaeo-astronomy',
-    'archaeo-geographic',
-    'archaeocetes',
-    'archaeocyathids',
-    'archaeoentomology',
-    'archaeolgists',
-    'archaeologically-homogenous',
-    'archaeologising',
-    'archaeology.just',
-    'archaeometry',
-    'archaeopteris',
-    'archaeopterix',
-    'archaeozoic',
     'archaeozoic/cambrian',
-    'archaic-sounding',
-    'archaicism',
-    'archaionomia',
-    'archaizing',
-    'archambaud',
-    'archambault',
-    'archangelica',
-    'archangelo',
-    'archangelsk-based',
-    'archangetica',
-    'archastropecten',
-    'archbishopric-',
-    'archconservative',
-    'archdeadon',
-    'archdioceses',
     'archducal',
-    'archeaological',
-    'archeaologists',
-    'archemoros',
-    'archenemy',
-    'archenfield',
-    'archeology',
-    'archer/cpag',
-    'archer/paediatrician',
-    'archer/swindon',
-    'archer/thamesdown',
-    'archerio',
-    'archest',
-    'archetypically',
-    'archetypology',
-    'archexponent',
     'archi',
-    'archi-humble',
-    'archia',
-    'archiannelid',
-    'archias',
-    'archibad',
-    'archibenthic',
-    'archicad',
-    'archichauliodes',
-    'archid&aacute;0mos',
-    'archidamos',
-    'archidamus',
-    'archidonate',
-    'archie.',
-    'archief',
-    'archiepiscopacy',
     'archiepiscopates',
-    'archiepiscopi',
-    'archiepiscopus',
-    'archiepiscopus.',
-    'archil',
-    'archimandrites',
-    'archimboldo',
-    'archimede',
-    'archimedia',
-    'archipelagic',
-    'archipi&eacute;lago',
-    'archital',
-    'architect-author',
-    'architect-client',
-    'architect-in-chief',
-    'architect-owner',
     'architect.who',
-    'architect/designer',
-    'architect/designers',
-    'architectonica',
-    'architectonically',
-    'architectonics',
-    'architectooralooral',
-    'architector',
-    'architects/engineers',
-    'architects/who',
-    'architectual',
-    'architectually',
-    'architectural/buildings/record',
-    'architecturally-unique',
-    'architecture-',
-    'architecture-independence',
     'architecture-independent',
-    'architecture-risc',
-    'architecture/buildings/record',
-    'architecture/home',
-    'architecture/network',
-    'architecture/planning',
-    'architecturescribble',
-    'architectus',
-    'architype',
-    'archiv+light+',
-    'archivaria',
-    'archive-type',
-    'archiving.',
-    'archiving/destruction',
-    'archivisation',
-    'archivist.',
     'archiviste',
-    'archivists/records',
-    'archivolt',
-    'archlin',
-    'archlute',
-    'archlutes',
-    'archly-conservative',
-    'archmandrite',
-    'archmaster',
-    'archol',
-    'archon-list',
-    'archon-year',
-    'archontes',
-    'archpoet',
-    'archpriests',
-    'archrival',
     'archterrorist',
-    'archtops',
-    'archuar',
-    'archyield',
-    'arciduca',
-    'arcigram',
-    'arcimbolde',
-    'arcimboldi',
-    'arcinoma',
-    'arcircius',
-    'arclid',
-    'arclight',
-    'arcm',
-    'arcminute',
-    'arcolectric',
-    'arcopata',
     'arcott',
-    'arcs-bios',
-    'arcsecond',
-    'arcserver',
-    'arcstation',
-    'arcstation-1',
-    'arctic-cold',
-    'arctic-like',
-    'arctic-weather',
-    'arctogadus',
-    'arctons',
-    'arctophila',
-    'arcturans',
-    'arcturean',
-    'arcuata',
-    'arculation',
     'arcutt',
-    'arcwelder',
-    'ard&egrave',
-    'ard\'ed',
-    'ard-type',
-    'ard-up',
-    'ardant',
-    'ardawi',
-    'ardbo',
-    'ardboe/moortown',
-    'ardclach',
-    'ardeatine',
-    'ardebili',
-    'ardell',
-    'ardelow-ar-ardelow',
-    'ardelve',
     'ardencraig',
-    'ardency',
-    'ardenistle',
-    'ardenlea',
-    'ardennais',
-    'ardennaise',
-    'ardennes-rhineland',
-    'ardente-like',
-    'ardentia',
-    'ardentissimo',
-    'ardeotis',
-    'arder',
-    'arderseir',
-    'ardeseir',
-    'ardfern',
-    'ardfert',
     'ardi',
-    'ardiff',
-    'ardilaun',
-    'ardiles/speaking',
-    'ardinghi',
-    'ardington',
-    'ardington/oxfordshire',
-    'ardinisle',
-    'arditi',
-    'ardj/sbr/lif/scot.100/250',
-    'ardkeen',
-    'ardle',
-    'ardley/oxfordshire',
-    'ardloch-assynt',
-    'ardmaleish',
-    'ardminish',
     'ardnacross',
-    'ardnamoyle',
-    'ardnave-sanaig',
-    'ardnave.',
-    'ardnish',
-    'ardorous',
-    'ardossan',
-    'ardouin',
-    'ardous',
-    'ardownie',
-    'ardoz',
-    'ardres',
-    'ardroe',
-    'ards-cliftonville',
-    'ards-glentoran',
-    'ardsike',
     'ardsley-on-hudson',
-    'ardtalnaig',
-    'ardteisimeireacht',
-    'ardtornish',
-    'ardtullagh',
-    'ardu',
-    'ardudwy',
-    'arduennae',
-    'arduil',
-    'arduini',
-    'arduousness',
-    'ardview',
-    'ardzinaba',
-    'are&mdash;always',
-    'are&mdash;their',
-    'are\'',
     'are\'t',
-    'are(i',
-    'are-beginning',
-    'are-building',
-    'are-in',
-    'are-insensitive',
-    'are-we-going-to-have-a-season-or-aren\'t-we',
-    'are.8',
-    'are.compelled',
-    'are.to',
-    'are/f',
-    'are/mean',
-    'are/would',
-    'are3',
-    'are_',
-    'are_all',
     'are_in',
-    'are_no',
-    'are_on',
-    'are_up',
-    'area&mdash;.',
-    'area\'',
-    'area*',
-    'area-a',
-    'area-as',
-    'area-oriented',
-    'area-promoting',
-    'area-restricted',
-    'area-ruling',
-    'area-shaded',
-    'area-specific',
-    'area-table',
     'area-the',
-    'area-weighted',
-    'area.the',
-    'area/',
-    'area/county',
-    'area/equipment',
-    'area/lounge',
-    'area/old',
-    'area/region',
-    'area/s',
-    'area/shape',
-    'area/weight',
-    'area:2,381,741',
-    'area:259',
-    'area:volume',
-    'aready',
     'areaimol',
-    'areall',
-    'areas&mdash;strategic',
-    'areas--400,000',
-    'areas-leafield',
-    'areas.',
-    'areas.in',
-    'areas.ps/c',
-    'areas/more',
-    'areas/nations',
-    'areas/waiting',
-    'areby',
-    'arec',
-    'areca-box',
-    'arecanuts',
-    'arecent',
     'areciba',
-    'areean',
-    'areeda',
-    'areety',
-    'aref:a/439/09/0492',
-    'aregba',
-    'areilza',
-    'areley',
-    'areligious',
-    'arellano-guillemo',
-    'arem',
-    'aren\'t',
-    'aren\'t-over-protective-mothers-a-complete-pain-in-the-arse',
-    'aren\'t-you-sick-of-him',
-    'aren\'t.',
-    'arena&rehy;rockers',
     'arena\'',
-    'arena-compatible',
-    'arena-spaces',
-    'arenaceous',
-    'arenaria.',
-    'arencon',
-    'arendarski',
-    'arene',
-    'arenes',
-    'arenhoevel',
-    'arenigian',
-    'arenigs',
-    'arenites',
-    'arens-baker',
-    'arents',
-    'areoi',
     'areola',
-    'areopolis',
-    'areospace',
-    'areplain',
-    'areprepared',
-    'arequipe&ntilde;a',
-    'arescue',
-    'aresenal',
-    'aresnio',
-    'arested',
-    'aresti',
-    'arestis',
-    'aret&ecirc;s',
-    'aretes',
-    'arethousa',
-    'aretine',
     'aretinus',
-    'aretrue',
-    'areus',
-    'arev-3',
-    'arey',
-    'arffin',
-    'arfon/dwyfor',
-    'arfons',
-    'arfos',
-    'arfs',
-    'arfur-itic',
-    'arg&oacute;n',
-    'arg&ucirc;s',
-    'arg185',
-    'arg525',
-    'arg55',
     'arg94',
-    'argali',
-    'argando&ntilde;a',
-    'argant',
-    'arganthonius',
-    'argar',
-    'argasid',
-    'argaw',
-    'arge&lacute;es',
-    'argel&eacute;s-gazost',
-    'argel&egrave;s-gazost',
-    'argelino',
-    'argemi',
-    'argemone',
-    'argen',
-    'argenis',
     'argentaffin',
-    'argenteomarginata',
-    'argenterie.',
-    'argenteuil-born',
-    'argenteuile',
-    'argenteum',
-    'argenticum',
-    'argentieri',
-    'argentina\'',
-    'argentina*',
-    'argentina-belize',
-    'argentina-brazil',
-    'argentina-uk',
-    'argentine-based',
-    'argentine-born',
-    'argentine-brazilian',
     'argentine-french',
-    'argentine-owned',
-    'argentine-uruguayan',
-    'argentineans',
-    'argentinian-',
-    'argentinian-born',
-    'argentiventer',
-    'argerich/rabinovitch',
-    'arghan',
-    'argia',
-    'argicultural',
-    'argilos',
-    'arginine-glycine',
-    'arginine-glycine-aspartic',
-    'arginine-nitric',
-    'arginines',
     'arginusai',
-    'argives',
-    'argleses',
-    'argolic',
-    'argon-40/argon-39',
-    'argon-filled',
-    'argon-ion-laser',
-    'argon-xenon',
-    'argonath',
-    'argons',
-    'argory',
-    'argosies',
-    'argostoli',
-    'argosys',
-    'argryris',
-    'arguament',
     'argudo',
-    'argue-particularly',
-    'argued-that',
-    'argued.',
-    'argueing',
-    'arguements',
-    'argues*',
-    'argues.',
-    'argufment',
-    'argufy',
-    'argufying',
-    'arguineguin',
-    'arguingthat',
-    'arguit',
-    'argule',
-    'argument-free',
     'argument-siebert',
-    'argument-stopper',
-    'argumentall',
-    'argumentativeness',
-    'arguments/',
-    'arguments/ludicrous',
-    'argumenty',
-    'argun',
-    'argussoft',
-    'argy-bargies',
-    'argyll.',
-    'argyranthemum',
-    'argyranthemums',
-    'argyre',
-    'argyrol',
-    'argyrus',
     'arh',
-    'arhalien',
-    'arhiba',
-    'arhold',
-    'arhythmia',
-    'arhythmic',
-    'arhythmical',
-    'arhythmically',
-    'ari&egrave;ge',
-    'ari\'',
-    'aria-like',
-    'aria-recitative-aria',
-    'ariabignes',
-    'ariak',
-    'ariake',
-    'ariand',
     'ariane-3',
-    'ariano',
-    'ariarames',
-    'ariaramnes',
-    'ariazos',
-    'aribert',
-    'aric',
-    'arican',
-    'ariccia',
-    'arich',
-    'arici',
-    'aricia',
-    'arid-loving',
-    'aridisation',
-    'aridities',
-    'aridjis',
     'aridolis',
-    'arieans',
-    'arieh',
-    'arielle',
-    'ariens',
-    'arienti',
-    'ariettes',
-    'arietty',
-    'arifa/mother',
-    'ariff',
-    'ariffin',
-    'arighi',
-    'arigho',
-    'arigoni',
-    'arik',
-    'arikha',
     'aril-less',
-    'arild',
-    'arima',
-    'arimaddeyya',
-    'arimaspian',
-    'arimaspians',
-    'arimathaea',
-    'arin',
-    'arinagour',
-    'arinbjorn',
-    'arinori',
-    'ariodante',
-    'ariomardos',
-    'arious',
-    'ariovistus',
-    'aripand',
     'aris/husband',
-    'arisarum',
-    'arised',
-    'arises_out',
-    'ariseth',
-    'arising&mdash',
-    'arising.',
-    'arisitide',
-    'arisleus',
-    'arisotelis',
-    'ariss',
-    'arist',
-    'arist&oacute;bulo',
-    'arist.',
-    'aristagoras',
-    'aristech',
     'aristeo',
-    'aristera',
-    'aristidhou',
-    'aristidis',
-    'aristion',
-    'aristo-plutocracy',
-    'aristocacy',
-    'aristocop',
-    'aristocracy.',
-    'aristocracy/bourgeoisie',
-    'aristocrat-hero',
-    'aristocratic/military',
-    'aristocritters',
-    'aristolochia',
-    'aristolochiaceae',
-    'aristonike',
     'aristophane',
-    'aristotele',
-    'aristoteleian',
-    'aristotelian-scholastic',
-    'aristotelian-type',
-    'arita',
-    'arites',
-    'arith',
-    'arithm',
-    'arithmatic',
-    'arithmetic-bird',
-    'arithmetic-logical',
-    'arithmetic.',
-    'arithmeticall',
-    'arithmetically-able',
-    'arithmeticians',
     'arithmetics',
-    'arithmetique',
-    'arithmetisation',
-    'arithmological',
-    'arithmologists',
-    'aritst',
-    'arity',
-    'arives',
-    'arix',
-    'ariyoshi',
-    'arizmendi',
-    'arizona-mexico',
-    'arjomari',
-    'arjumand',
-    'arjuzah',
-    'ark-like',
     'arkadia',
-    'arkadii',
-    'arkadion',
-    'arkalochori',
-    'arkansas-based',
-    'arkautz',
-    'arkell/chairman',
-    'arkell/planner',
-    'arken',
-    'arkestra',
-    'arket',
-    'arkhi',
-    'arkhitektura',
-    'arkhund',
-    'arklay',
-    'arkle.',
     'arkosic',
-    'arksey',
-    'arktel',
-    'arkudi',
-    'arkworth',
-    'arl',
-    'arl&eacute;sienne',
-    'arlanda',
-    'arlathorp',
-    'arlecchinos',
-    'arledge',
-    'arlee-',
-    'arles-period',
-    'arlesians',
-    'arlett',
-    'arlettaz',
     'arletty',
-    'arli',
-    'arlick',
-    'arlingham',
-    'arlingtoll',
-    'arlino',
-    'arlon',
-    'arlston',
-    'arly',
-    'arm&eacute',
-    'arm&rehy;lock',
-    'arm&rehy;rest',
-    'arm-aches',
-    'arm-aching',
-    'arm-badge',
-    'arm-based',
     'arm-covered',
-    'arm-flapping',
-    'arm-holes',
-    'arm-in-arming',
-    'arm-less',
-    'arm-linked',
-    'arm-over-leg',
-    'arm-patches',
-    'arm-pit',
-    'arm-setter',
-    'arm-shells',
-    'arm-span',
-    'arm-spans',
-    'arm-stretching',
-    'arm-strong',
-    'arm-waver',
     'arm-wrestles',
-    'arm6l',
-    'arm_so',
-    'armadail',
-    'armadilloes',
-    'armadio',
-    'armageddon-inspired',
-    'armagh-richhill',
-    'armagh/',
-    'armala',
-    'armaline',
-    'armaly',
-    'armandur',
-    'armangual',
-    'armanishly',
-    'armata',
     'armatage',
-    'armateur',
-    'armathwaite',
-    'armato',
-    'armatorius',
-    'armattoe',
-    'armaturas',
-    'armbarring',
-    'armblaster',
-    'armblasters',
-    'armchair-sized',
-    'armchair.',
-    'arme-leute',
-    'armed-resistance',
-    'armed-response',
-    'armede',
     'armement',
-    'armenf&uuml;rsorge',
-    'armengol',
-    'armeniacum',
-    'armenian-controlled',
-    'armenie',
-    'armeno-turkish',
-    'armerer',
-    'armerian',
-    'armguard',
-    'armi',
-    'armidel',
-    'armieder',
-    'armies.',
-    'armiger/headmaster/crypt',
-    'armigers',
     'armignaz',
-    'armiia',
-    'armijah',
-    'arminas',
-    'armindo',
-    'armings',
-    'arminium',
-    'armis',
-    'armisted',
-    'armistizio',
-    'armitage/daughter',
-    'armitage/dealer',
-    'armitage/mrs',
-    'armitage/oxford',
-    'armitraj',
-    'armitstead',
     'armleder',
-    'armloads',
-    'armoir',
-    'armoires',
-    'armonatherapy',
-    'armonico',
-    'armoniosa',
-    'armonkeys',
-    'armoorgum',
-    'armorel',
-    'armoring',
-    'armorog',
-    'armour&rehy;plated',
-    'armour-chelu',
-    'armour-laden',
-    'armour-plate',
     'armour-plates',
-    'armour.these',
-    'armourcabbies',
-    'armourflex',
-    'armourless',
-    'armourplate',
-    'armourplating',
-    'armours',
-    'armpc',
-    'armpit-length',
-    'arms\'-length',
-    'arms-',
-    'arms-akimbo',
-    'arms-building',
-    'arms-controller',
-    'arms-export',
     'arms-exporting',
-    'arms-folded',
-    'arms-for-drugs',
-    'arms-lovers',
-    'arms-makers',
-    'arms-procurement',
-    'arms-runners',
-    'arms-stretched',
-    'arms-supply',
-    'arms-to-saddam',
-    'arms-trading',
-    'arms-wellington',
-    'arms/drugs-dealing',
-    'arms/waist',
-    'armstead',
-    'armstong',
     'armstrong&rehy;whitworth',
-    'armstrong-whitworth',
-    'armstrong/inmate',
-    'armstrong/trader',
-    'armstrongii',
-    'armthorpe',
-    'armtwisting',
-    'army&mdash;jna',
-    'army&mdash;provide',
-    'army&mdash;the',
-    'army&mdash;to',
-    'army-',
-    'army-appointed',
-    'army-blanket',
-    'army-dominated',
-    'army-escorted',
     'army-held',
-    'army-inspired',
-    'army-like',
-    'army-owned',
-    'army-party',
-    'army-payment',
-    'army-police',
-    'army-short',
-    'army-sized',
-    'army-tax',
-    'army-the',
-    'army.3',
-    'army.and',
-    'army.you',
-    'army/afhq',
-    'army/navy/',
     'army/police',
-    'army/propagate',
-    'army1539',
-    'army6pts',
-    'armye',
-    'armygdaloides',
-    'arnage',
-    'arnand',
-    'arnander',
-    'arnaoutis',
-    'arnar',
-    'arnarfj&ouml;r&dstrok;3ur',
-    'arnarson',
-    'arnat',
-    'arnaud-garcie',
-    'arnaud-guillaume',
     'arnaudov',
-    'arnauts',
-    'arnaz',
-    'arndstein',
-    'arndt-wonacott',
-    'arne\'t',
-    'arnebia',
-    'arnemetia',
-    'arnett/general',
-    'arnez',
-    'arnham',
-    'arnhara',
-    'arnhart',
-    'arnhem-elst-nijmegen',
-    'arnildo',
-    'arnison',
     'arnistons',
-    'arnki',
-    'arno&scaron;ts',
-    'arnold-baker',
-    'arnold/arthritis',
-    'arnold/city',
-    'arnold/crash',
-    'arnold/oxford',
-    'arnold/treaty',
-    'arnold_in',
-    'arnoldi',
-    'arnoldia',
-    'arnolds',
-    'arnoldstein',
-    'arnolf',
-    'arnolfo',
     'arnolt',
-    'arnost',
-    'arnott-job/licensing',
-    'arnotts',
-    'arnould',
-    'arnowsky',
-    'arnsat-1',
-    'arnside-silverdale',
-    'arnstadt',
-    'arntzenius',
-    'arnulfings',
-    'arnulfista',
-    'arnulfistas',
-    'arnull',
-    'arnulph',
-    'arnum-1',
     'arnuxii',
-    'arobieke',
-    'aroeira',
-    'aroff',
-    'arogast',
-    'aroid',
-    'aroint',
-    'aroll',
-    'arom-essence',
-    'aroma-filled',
-    'aroman',
-    'aromat.',
-    'aromatherapeutic',
-    'aromatic-aromatic',
-    'aromaticity',
-    'aromaticum',
     'aromaticus',
-    'aromatize',
-    'aromavision',
-    'aromel',
-    'arondissement',
-    'aronfreed',
-    'aronite',
-    'aronsists',
-    'aronson/clinical',
-    'aronsonists',
-    'aroond',
-    'arop',
-    'arosward',
-    'arotmatic',
-    'arou.d',
-    'aroua',
     'arougeaye',
-    'aroun\'',
-    'arouna',
-    'around&pound;3',
-    'around-arran',
-    'around-kevin',
-    'around.the',
-    'around.there',
-    'arous',
-    'arousal.',
-    'arouse\'',
-    'aroused&mdash;and',
-    'arouser',
-    'arousers',
-    'arova',
-    'arow',
     'arp&egrave;ges',
-    'arp-rar-ping',
-    'arpa-berkeley',
-    'arpal',
-    'arpege',
-    'arpeggiate',
-    'arpeggiates',
-    'arpeggio-based',
-    'arpeggio-figure',
-    'arpeggio-figures',
-    'arpeggione',
-    'arpeggioni',
-    'arpel',
-    'arpent',
-    'arpents',
-    'arpi',
     'arpil',
-    'arpm',
-    'arpus',
-    'arquala',
-    'arqueros',
-    'arques',
-    'arquesbusade',
-    'arr&ecirc;te',
-    'arr\'',
-    'arr-ange-ments',
-    'arr-tistic',
-    'arr.',
-    'arrabiatta',
-    'arrable',
-    'arractions',
-    'arrag&atilde;o',
     'arragon',
-    'arraign&eacute;e',
-    'arraigning',
-    'arrale',
-    'arrampicatopitheque',
-    'arran-beaton',
-    'arran-knit',
-    'arrange&rehy;ment',
-    'arrangeable',
-    'arrangement-wise',
-    'arrangement.',
-    'arrangements-that',
-    'arranger/composer',
-    'arranging/extending',
-    'arrans',
-    'arrasses',
     'arrau-massiveness',
-    'arrawdatayn',
-    'array-like',
-    'arraying',
-    'arrears.',
-    'arrendamento',
-    'arrent',
-    'arrented',
-    'arrest&mdash;a',
-    'arrest/in',
-    'arrest/prosecution',
-    'arrestants',
-    'arrestation',
-    'arrested.',
-    'arrestees',
-    'arrestin\'',
     'arresting-looking',
-    'arrestingly',
-    'arret',
-    'arrewes',
-    'arrey',
-    'arrez',
-    'arrgghh',
-    'arrhephoroi',
-    'arri&egrave;ge',
-    'arri&egrave;re',
-    'arri&egrave;re-vassaux',
-    'arria',
-    'arriagada',
-    'arrid',
-    'arriel',
-    'arriens',
     'arrieta',
-    'arrietty',
-    'arrigoni',
-    'arrikala',
-    'arrington',
-    'arrinson',
-    'arriortua',
-    'arris-totle',
-    'arrise',
-    'arriv&eacute',
-    'arrival.35',
-    'arrival/departure',
-    'arrivals&mdash;veterans',
-    'arrivals/departures',
-    'arrivano',
-    'arrive.',
     'arrived/',
-    'arrivederla-cherie',
-    'arriver',
-    'arrives/delivered',
-    'arrivetz',
-    'arro',
-    'arrojo',
-    'arromanches',
-    'arronale',
-    'arrorat',
-    'arroser',
-    'arrospide',
-    'arrospide&mdash;see',
-    'arrow-',
-    'arrow-debreu',
-    'arrow-fast',
     'arrow-fire',
-    'arrow-heads',
-    'arrow-marked',
-    'arrow-sharp',
-    'arrow-shower',
-    'arrow-straight',
-    'arrow-thwack',
-    'arrow-tip',
-    'arrow-tips',
-    'arrow/vintage/rowan',
-    'arrowcrab',
-    'arrowcroft',
-    'arrowgraphs',
-    'arrowhead-shaped',
-    'arrowhead.',
-    'arrowsmith/organiser',
     'arrowsmiths',
-    'arrowy',
-    'arroyabe',
-    'arrr',
-    'arrrgh',
-    'arruda',
-    'arrupe',
-    'arruti',
-    'arrythmia',
-    'ars&egrave;ne',
-    'arsacid',
-    'arsakov',
-    'arsala',
-    'arsch',
-    'arscot',
-    'arsdalen',
     'arse&rehy;over-tit',
-    'arse\'',
-    'arse-about-face',
-    'arse-end',
-    'arse-holes',
-    'arse-kick',
-    'arse-kickers',
-    'arse-kicking',
-    'arse-lick',
-    'arse-lickin\'',
-    'arse-nil',
-    'arse-quaking',
-    'arse/scouse/canaries',
-    'arseflap',
-    'arsegripper',
-    'arsehole-stopper',
     'arsel',
-    'arselick',
-    'arselicking',
-    'arsenal(*2)',
-    'arsenal-liverpool',
-    'arsenal-sponsored',
-    'arsenal/norwich',
-    'arsenal/qpr',
-    'arsenal1',
-    'arsenal4',
-    'arsenals_so',
-    'arsenic&lowbar',
-    'arsenic-rich',
-    'arsenides',
-    'arsenije',
-    'arsenis',
     'arsenurretted',
-    'arseole',
-    'arseway',
-    'arseways',
-    'arsewipe',
-    'arsey',
-    'arshat',
-    'arsia-tika',
-    'arsier',
-    'arsinal',
-    'arsing',
-    'arsizio',
-    'arsk',
-    'arsmtrong',
-    'arsnell',
-    'arson-related',
     'arsphenamine',
-    'arsten',
-    'art&iacute;stica',
-    'art&mdash;for',
-    'art&ocirc;t',
-    'art*enterprise',
-    'art-',
-    'art-2000',
-    'art-appreciation',
-    'art-because',
-    'art-business',
-    'art-centre',
-    'art-cities',
-    'art-collections',
-    'art-college',
-    'art-conscious',
     'art-dealers',
-    'art-deco-type',
-    'art-decorate',
-    'art-directed',
-    'art-expert',
-    'art-experts',
-    'art-fart',
-    'art-for-art',
-    'art-forms',
-    'art-france',
-    'art-gallery',
-    'art-im',
-    'art-is',
-    'art-jewellery',
-    'art-less',
-    'art-lover',
     'art-making',
-    'art-marketing',
-    'art-noise',
-    'art-nonsense',
-    'art-object',
-    'art-on-the-walls',
-    'art-oriented',
-    'art-philanthropy',
-    'art-punk',
-    'art-related',
-    'art-student',
-    'art-teacher',
-    'art-teaching',
-    'art-theft',
-    'art-to-wear',
-    'art-workers',
     'art-y',
-    'art.1',
-    'art.14',
-    'art.24',
-    'art.25',
-    'art.26',
-    'art.28',
-    'art.3',
-    'art.31',
-    'art.48',
-    'art.5',
-    'art.7',
-    'art.iii',
-    'art/design',
-    'art/entertainment',
-    'art/glasgow',
     'art/heriot',
-    'art/heriot-watt',
-    'art/no',
-    'art/oxford',
-    'art/photography',
-    'art/science',
-    'art/the',
-    'art93',
-    'arta',
-    'artabazos',
-    'artal',
-    'artaldus',
-    'artamonov',
-    'artan',
-    'artangel',
-    'artapalo',
     'artapanus',
-    'artaserse',
-    'artbooks',
-    'artcan',
-    'artchil',
-    'artech',
-    'artee',
-    'artefact-orientated',
-    'artelier',
-    'artem',
-    'artemesai',
-    'artemide',
-    'artemideros',
-    'arten',
-    'artention',
-    'arteria',
     'arterialised',
-    'arteriographic',
-    'arteriosus',
-    'arteritis',
-    'artery-clogging',
-    'artesania',
-    'artficial',
-    'artfully-poled',
-    'artfully-smudged',
-    'artfully-worded',
-    'artha',
-    'arthard',
-    'arthashastra',
-    'arthaud',
-    'artheritus',
-    'arthie',
     'arthmios',
-    'arthopod',
-    'arthrath',
-    'arthrath-dudwick',
-    'arthri',
-    'arthritically',
-    'arthritides',
-    'arthritidis',
-    'arthritis-like',
-    'arthritis.',
-    'arthropathy',
-    'arthrophyta',
-    'arthroplasty',
-    'arthropod-like',
-    'arthropod-linked',
-    'arthropoda',
     'arthropodin',
-    'arthropodized',
-    'arthur/thames',
-    'arthuriad',
-    'arthy',
-    'arti-lamp',
-    'articair',
-    'articboreal',
-    'articifial',
-    'article-by-article',
-    'articles/letters',
-    'articles/series',
-    'articles/threads',
-    'articolata',
-    'artics',
-    'articu&rehy;late',
     'articualted',
-    'articulat&rehy;ing',
-    'articulata',
-    'articulatecy',
-    'articulated\'',
-    'articulationists',
-    'articulatory-level',
-    'articulatus',
-    'artiest',
-    'artifactsin',
-    'artifactual',
-    'artificial-flower',
-    'artificial-heart',
-    'artificial-sounding',
-    'artificialia',
-    'artificially-inseminated',
     'artificially-lengthened',
-    'artificially-lit',
-    'artificially-produced',
-    'artificialsounding',
-    'artificiels',
-    'artificum',
-    'artigas',
-    'artillary',
-    'artillery-making',
-    'artillery-man',
-    'artillery-piece',
-    'artillery-shells',
-    'artiness',
-    'artioli',
-    'artios',
-    'artisan\'-producer',
     'artisan-class',
-    'artisan-craft',
-    'artisan-dominated',
-    'artisan-like',
-    'artisanale',
-    'artisanry',
-    'artist-approved',
-    'artist-craftsman',
-    'artist-cum-poet',
-    'artist-curators',
-    'artist-dancer',
-    'artist-designed',
-    'artist-doctor',
-    'artist-engraver',
-    'artist-hero',
-    'artist-in-school',
     'artist-initiated',
-    'artist-jeweller',
-    'artist-legislator',
-    'artist-manqu&eacute',
-    'artist-musician',
-    'artist-philosophers',
-    'artist-run',
-    'artist-wallah',
-    'artist-writer',
-    'artist-writers',
-    'artist.38',
-    'artist/band',
-    'artist/booking',
-    'artist/designer',
-    'artist/muse/feminist',
-    'artist/poet',
     'artist/teacher',
-    'artist/teachers',
-    'artist/writer',
-    'artistcolour',
-    'artistic-cinematic',
-    'artistic.',
-    'artistically\'-designed',
-    'artistically-conceived',
-    'artistically.',
-    'artistries',
-    'artists/craftswomen',
-    'artists/dealers/auctions',
-    'artists_as',
-    'artix',
-    'artmann',
-    'artound',
     'artpens',
-    'artpunk',
-    'artrage',
-    'artro',
-    'arts&rehy;and',
-    'arts-a',
-    'arts-and-crafts',
-    'arts-budget',
-    'arts-for-scientists',
-    'arts-funded',
-    'arts-funding',
-    'arts-orientated',
-    'arts-oriented',
-    'arts-related',
-    'arts-science',
-    'arts-spectacles',
     'arts.32',
-    'arts/aesthetic',
-    'arts/charles',
-    'arts/cultural',
-    'arts/documentary',
-    'arts/humanities',
-    'artscape',
-    'artscribe',
-    'artsimovich',
-    'artsman',
-    'artspace',
-    'artsvashen',
-    'arturas',
-    'artushof',
-    'artusi',
-    'artvin',
     'artwork-quality',
-    'artyst&omacr;ne',
-    'artzvashen',
-    'aruanus',
-    'aruba&mdash;see',
-    'arubanaase',
-    'aruca',
-    'arucaria',
-    'aruged',
-    'arulius',
-    'arum-like',
-    'arumainayagam',
-    'aruna',
-    'arunachalam',
-    'arunco',
-    'arundel-trained',
     'arundels',
-    'arundhati',
-    'arundinaceum',
-    'aruns',
-    'arur',
-    'aruru',
-    'arusha-moshi',
-    'aruz',
-    'arv',
-    'arvanitis',
-    'arvedladze',
-    'arveiler',
-    'arvellous',
-    'arvernien/journey',
-    'arveyda',
-    'arvi',
     'arvids',
-    'arvidson',
-    'arvind',
-    'arvins',
-    'arviragus',
-    'arvire',
-    'arvon/observer',
-    'arvs',
-    'arvydas',
-    'arwen-37',
-    'arwennack',
-    'aryanism',
-    'aryeetey',
-    'aryl',
-    'arylammonium',
-    'arylation',
     'aryle',
-    'aryton',
-    'arzberg',
-    'arzobispo',
-    'arzoumanian',
-    'arzt',
-    'arzu',
-    'as&rehy;sociations',
-    'as\'ad',
-    'as\'as',
-    'as-100',
-    'as-4',
-    'as-6',
-    'as-and-when',
-    'as-any',
-    'as-din',
     'as-i-see-it',
-    'as-it-is',
-    'as-it-used-to-be-played',
-    'as-mx',
-    'as-of-right',
-    'as-rich',
-    'as-salih',
-    'as-samarra\'i',
-    'as-sattar',
-    'as-size',
-    'as-suddenly',
-    'as-surani',
-    'as-they',
-    'as-tr',
-    'as-yet-unannounced',
-    'as-yet-unborn',
     'as-yet-undecided',
-    'as-yet-undetermined',
-    'as-yet-unexplained',
-    'as-yet-unhardened',
-    'as-yet-unidentified',
-    'as-yet-unnamed',
-    'as-yet-unproven',
-    'as-yet-unpublished',
-    'as-yet-untitled',
-    'as-you-please',
-    'as.350d',
-    'as.5s',
-    'as.7s',
-    'as/90',
-    'as/bs',
-    'as/in',
     'as/set-developed',
-    'as/tmj',
-    'as/to',
-    'as100',
-    'as110',
-    'as140',
-    'as20',
-    'as275',
-    'as3000',
-    'as400',
-    'as41',
-    'as68',
-    'as_,_as_if',
-    'as_,_as_it_were',
-    'as_,_as_of',
-    'as_,_as_to',
     'as_,_as_usual',
-    'as_,_as_well_as',
-    'as_,_you_as_well',
-    'as_as_far_as_as_far_as',
-    'as_as_if',
-    'as_as_of',
-    'as_as_opposed_to',
-    'as_as_though',
-    'as_as_to',
-    'as_as_well_as',
-    'as_er_,_as_to',
-    'as_er_er_as_though',
-    'as_er_of',
-    'as_er_to',
-    'as_er_well',
-    'as_erm_for',
     'as_far_as_far_as',
-    'as_good',
-    'as_it_,_as_it_were',
-    'as_it_were_so',
-    'as_long_as_,_as_long_as',
-    'as_soon_as_soon_as',
-    'as_up',
-    'as_well_as_er_,_as_well_as',
-    'as_well_as_well_as',
-    'as_well_er_as',
-    'as_well_in',
-    'asaba',
-    'asabere',
-    'asadas',
-    'asado',
-    'asakku',
     'asako',
-    'asakra',
-    'asakusa',
-    'asalam',
-    'asaluyeh',
-    'asama',
-    'asamoah',
-    'asanas',
-    'asang',
-    'asanka',
-    'asano',
-    'asansiki',
-    'asantehene',
-    'asanuma',
-    'asapah',
-    'asaphids',
     'asaridia',
-    'asaro',
-    'asataryan',
-    'asatiani',
-    'asats',
-    'asavahame',
-    'asazuma',
-    'asball',
-    'asbell',
-    'asbestos-cement',
-    'asbestos-infected',
-    'asbestos-like',
-    'asbestos-lined',
-    'asbestos-removal',
-    'asbs',
-    'asbury',
     'asbury-oliver',
-    'asbury/toxoplasmosis',
-    'asby',
-    'ascain',
-    'ascaridoidea',
-    'ascat',
-    'ascencion',
-    'ascend-21',
-    'ascendance-y',
-    'ascendancy-class',
-    'ascended.',
-    'ascendence',
-    'ascending-node',
-    'ascenscioun',
-    'ascensione',
-    'ascensions',
     'ascensive',
-    'ascent-descent',
-    'ascent.we',
-    'ascentionist',
-    'ascentionists',
-    'asceptic',
-    'ascer',
-    'ascetic-esoteric',
-    'ascetically',
-    'ascetism',
-    'asch',
-    'aschas',
-    'aschelminthes',
-    'asci/ansi',
-    'ascidians',
-    'ascii-ansi',
     'ascii-based',
-    'asciis',
-    'ascil',
-    'asciline',
-    'ascj',
-    'asclepeion',
-    'asclepiad',
-    'asclepiadean',
-    'asclepian',
-    'asclepias',
-    'asclepieia',
-    'asclepios',
-    'asclipius',
-    'asco',
-    'ascochyta',
-    'ascom/timeplex',
     'ascom/ultrafax',
-    'ascon',
-    'ascorbic-acid',
-    'ascot-bound',
-    'ascough',
-    'ascriptives',
-    'ascryum',
-    'ascyrum',
-    'asdc',
-    'asdics',
-    'asean-european',
-    'asean-indonesia',
-    'asean-sponsored',
-    'asean-united',
-    'asec',
-    'asecond',
     'asegid',
-    'aseismically',
-    'asellio',
-    'asellus',
-    'asema',
-    'asemia',
-    'asempa',
-    'asenal.',
-    'asenby',
-    'asencio',
-    'asendemic',
-    'asenior',
-    'asenoth',
-    'asepsis',
-    'aser',
-    'aseries',
     'asesinados',
-    'asessing',
-    'asets',
-    'asev',
-    'asfar',
-    'asforby',
-    'asford',
-    'asfour',
-    'asfv-infected',
-    'asg',
-    'asgarby',
-    'asgardweiler',
-    'asgerjorn',
-    'ash\'arites',
-    'ash-blond',
-    'ash-can',
     'ash-cold',
-    'ash-coloured',
-    'ash-covered',
-    'ash-dull',
-    'ash-filled',
-    'ash-grained',
-    'ash-handled',
-    'ash-like',
-    'ash-lilac',
-    'ash-pile',
-    'ash-pits',
-    'ash-sharqat',
-    'ash-shirawi',
-    'ash-shura',
-    'ash-strapped',
-    'ash-white',
     'ash/buckinghamshire',
-    'asha\'a',
-    'ashaf',
-    'ashai',
-    'ashake-up',
-    'asham',
-    'ashamd',
-    'ashanadan',
-    'ashangi',
-    'ashariyah',
-    'ashaway',
-    'ashbank',
-    'ashbaugh',
-    'ashbory',
-    'ashbowl',
-    'ashbrook/open',
     'ashbrooke',
-    'ashburndale',
-    'ashcan',
-    'ashcans',
-    'ashcher',
-    'ashchuch',
-    'ashcombe/owner',
-    'ashden',
-    'ashdown/leader/liberal',
-    'ashe/king',
-    'ashed',
-    'ashely',
-    'ashen-blue',
-    'ashend',
-    'ashenhill',
-    'asherman',
     'ashets',
-    'asheya',
-    'ashford-based',
-    'ashford/father',
-    'ashford/kidney',
-    'ashford/rebekah',
-    'ashford/reporting',
-    'ashfordby',
-    'ashforth',
-    'ashgari',
-    'ashgate',
-    'ashgrove.',
-    'ashibi',
-    'ashine',
-    'ashiness',
-    'ashingdon',
     'ashinwari',
-    'ashit',
-    'ashkenasi',
-    'ashkenazia',
-    'ashkenazic',
-    'ashkenazy/perlman/harrell',
-    'ashkhabad',
-    'ashkurak',
-    'ashlands',
-    'ashlars',
-    'ashle',
-    'ashley-coopers',
-    'ashley/driver',
-    'ashley/grandmother',
-    'ashling',
-    'ashlyn',
     'ashmall/unemployed',
-    'ashmodai',
-    'ashmolean/taylorian',
-    'ashmoleum',
-    'ashmore/heart',
-    'ashmore/media',
-    'asho',
-    'ashoka',
-    'ashonai',
-    'ashorne',
-    'ashou',
-    'ashover',
-    'ashpan',
-    'ashpitel',
-    'ashplant/former',
-    'ashpole/bungee',
     'ashpole/skydiver',
-    'ashpole/tightrope',
-    'ashpool',
-    'ashrafiyeh',
-    'ashrafs',
-    'ashrams',
-    'ashref/owner',
-    'ashtal',
-    'ashtaroth',
-    'ashteroth',
-    'ashtiany',
-    'ashtip',
-    'ashton-in-makerfield',
-    'ashton-under&rehy;hill',
-    'ashton/event',
-    'ashton/west',
     'ashtotosi',
-    'ashtrays-had',
-    'ashtree',
-    'ashurbanipal',
-    'ashurov',
-    'ashvale',
-    'ashwick',
-    'ashyadhyayi',
-    'asi-tere',
-    'asia&iacute;n',
-    'asia-america',
-    'asia-first',
-    'asia-north',
-    'asia/australia',
-    'asia_as',
-    'asiago',
     'asian&rehy;ness',
-    'asian-ancestry',
-    'asian-mauritian',
-    'asian-oriented',
-    'asian-origin',
-    'asian/oriental',
-    'asian/western',
-    'asianbooks',
-    'asiatskhikh',
-    'asic/pal',
-    'asicom',
-    'asid',
-    'asidates',
-    'asiding',
-    'asids',
-    'asie',
     'asiema',
-    'asile',
-    'asim',
-    'asimovian',
-    'asinelli',
-    'asingle',
-    'asinius',
-    'asiodu',
-    'asir',
-    'asisakid',
-    'asjes',
-    'ask-closer',
-    'ask-price',
-    'ask21',
-    'ask_a',
-    'ask_on_behalf',
     'askabad',
-    'askam-in-furness',
-    'askarov',
-    'askeaton',
-    'asked-about',
-    'asked-her',
-    'asked/spoke',
-    'askender',
-    'askeo',
-    'asker',
-    'askernish',
-    'asketh',
-    'askew/tears',
-    'askhenazi',
-    'askians',
-    'askiba',
     'asking-after-your-health-position',
-    'asking-price',
-    'asking_a_good',
-    'askings',
-    'askival',
-    'askja',
-    'asklepios',
-    'asklund',
-    'askole',
-    'askos',
-    'aslaby',
-    'aslamazov',
-    'aslaug',
-    'asleep.3,4',
-    'asley',
-    'aslimmer',
     'aslin',
-    'asline',
-    'aslocillin',
-    'aslockton',
-    'aslso',
-    'aslsq',
-    'aslumber',
-    'asmah',
-    'asmal',
-    'asmalyk',
-    'asmara-massawa',
-    'asmath',
-    'asmf',
-    'asmf/marriner',
-    'asmore',
-    'asms',
     'asn-x-ser/thr',
-    'asn175',
-    'asnah',
-    'asnele',
-    'asni',
-    'asni&egrave;res',
-    'asnooze',
-    'asnt',
-    'aso-so',
-    'asociacon',
-    'asociality',
-    'asociations',
-    'asoftly-softly',
-    'asogwa',
-    'asoke',
-    'asola',
     'asolo',
-    'asonides',
-    'asoniti',
-    'asop&oacute;s',
-    'asophus',
-    'asosa',
-    'asoya',
-    'asp-306',
-    'asp237',
-    'asp26',
-    'asp38',
-    'asp5033',
-    'asparagines',
-    'asparagus-seller',
-    'asparagusoides',
-    'asparetic',
     'aspartic',
-    'asparturian',
-    'aspartyl',
-    'asparukhova',
-    'aspatia',
-    'aspecific',
-    'aspect-ratio',
-    'aspecto',
-    'aspects&ndash;before',
-    'aspegic',
-    'aspel-laden',
-    'aspel.',
-    'aspell',
-    'aspendale',
-    'asper',
-    'asperen',
     'aspergers',
-    'aspergil',
-    'aspergillosis',
-    'asperne',
-    'aspersa',
-    'aspertini',
-    'aspettare',
-    'aspey',
-    'asphalt-surfaced',
-    'asphalterer-over',
-    'asphalting',
-    'asphalts',
-    'aspheric',
-    'asphixiation',
-    'asphodeline',
-    'asphodels',
     'asphyxiant',
-    'aspide',
-    'aspir&rehy;ing',
-    'aspira&rehy;tions',
-    'aspiras',
-    'aspirating',
-    'aspirations.',
-    'aspirators',
-    'aspiriations',
-    'aspirin\'',
-    'asplan',
-    'aspland',
-    'asplenii',
-    'asplenii-folio',
-    'asplenium',
-    'asplund',
     'aspnas',
-    'asporgenic',
-    'asportatis',
-    'asprawl',
-    'asprilio',
-    'aspring',
-    'asquarius',
-    'asqueroso',
-    'asquithian-liberal',
-    'asr.3',
-    'asraam',
-    'asri',
-    'asroc',
-    'asrs',
-    'ass-bones',
-    'ass-driver',
     'ass-freezing',
-    'ass-hole',
-    'ass-mar',
-    'ass-meat',
-    'ass.co',
-    'assaad',
+)
+
+blocks_88 = (
+    '&#ist&$like&\'servers\'#lab\'$tone%!.%%ation%!e%!f%#num%$wise##bea##car#(deutsche#$ecea',
+    '%0markt/zauchensee%$tann$%r/new%\'anthera&$ting($vely%#ed\'\'!.%#ial%\'mediate&\'natives%%naive\'5tive&mdash;characters+,-development,$fuel',
+    '+%.even+(/college+(ly&ndash-!.--/additionally+!n+#s-a-#fat,!.*$ists*#ley&\'iflorum\'#zza%$tums$$sses',
+    '#$haea%"us$"er&$nate%"us$#off%&gether%#rne%"ug\')h/because("_a(!t&#igh&"th$#rup',
+    '$(-librium$"ck$#ero$%frons$$mari%%etric$%nkaya$$port$"se$+tude/flight\'&inally&"te#%misli$#ore$#sli',
+    '$&euland#-o&rehy;gether$&-adige%$clef%#sax(&ophone-#ist$%gther$+lamprologus$%monto$On&ndash;whitehill&ndash;liphook&ndash;haslemere%#ian$#ugh#$p/cl#"re',
+    '%&native$$ieve$$nate$$omin$#uim&#sm.(+/commitment%!p#$sech$"ys#%uglas$!m$#nsu##yre"(u-family',
+    '#%audi.#%berht#$card##del#&m-bath%&sodium$!a$%ettes%!x$+ina-alumina()producing\'!s&#ide\'.um&rehy;framed/(smelting',
+    '*%alloy*%based+%odied+%ronze*$clad+%opper*$dome*$foil*\'skinned)!.)\'/copper*&fabric*&perpex&!o\'!-',
+    '\'#ids\'!n\')silicates&#uim$#nae$!s#%n-alu$#tur#$pres#%redus#"sh%"ta"#vah$#nez$,rez-designed',
+    '%"io%!y$$stra#!e$&church$%olars\'"ta$!r%$guez%#ley%"na$#sda$"va$!z#"ia',
+    '$"se"%watar$,ys&rehy;open&!-\'&denied\'&female\'$male\'+on-the-move\'\'renewed\'%there((urbulent&!d&%rated#"ih$%ngton',
+    '$!z#&oodley##rld##yin$"ne"%xenor#!i"\'yansang#%cidon#&esbury%"ka#<l-acyl-glycerophosphocholine##nne#$osha#&scamps',
+    '$"is$"un##tes#"ve##win""za$&miento$"te#%eimer$!t#(heimer\'s!\'m&amp;s#&eacute));nagement*\'ricaine',
+    '$.grave;riquains#"gt#\'ndash;1*!1*!2+#.00,"30)$2.00+"30)!4)!5)\'parnaso"!\'""-1#!2',
+    '#!a#!c##ish#%style"+.16&ndash;7"#/aw##pro"#205#$9000"$386s&#xlv")486dx2-50\'"lv%!s")7&pound;5',
+    '"!9##116"*a&ndash;ed#$bile##cis#(d&oacute$#ans$"e\'%/us/curzon/brain$#igi$!u$#yah#$emia$%thwyr##gai',
+    '$*nification#&huacan#"id$!n$$zing#!j$"or##kal$(piorural#,l-controlled%$held$!a$"ek&$ites%$psis',
+    '&#fix&"ma($ted.),ion-friendly$\'ienborg)#urg$!s$&vy/afp#$miya$"ou#\'n-geldy$#ada$#cio$#da.%"la',
+    '&!r&$uera$!i%#tin$%oddin%%ebang%$gawa$#tes%!i%"us$&uenses($ists$"ya#&rabout%!h',
+    '%$nath&!i\'"an&\'thaceae($ines(!s("us$$elas&"la$#ige%$ntha%!t&%udine$-na&ndash;beni$!o',
+    '%#uch$%sanaa$"us#$sser%$ment#"te%$rasu%-ur&rehy;built\'!\'\')-champion).um-renaissance(9pickpocket-sort-of-manner)+rofessional\'-/professional\'+ish-looking',
+    '%"ve$#ori$%schon$$uren#)ury-duval#\'zements%!r$+ing-looking\'!.\'#ly.$#one&4ian-orinoco-guayanan\'#cas"\'bagibus&#ous',
+    '$#rro$\'ssadeur(+or-at-large+5cum-political-adviser+)designate+&escort*)ial-level*&s/high+#hip($ress%!z$"to$$wela#%egate$$laki',
+    '$*r-dropping&%glass&#red\'#ich\'#ose&\'skinned\'$ugar%"in%$ley/)/gloucestershire&#oup%#ols%"ry%$sham&#ton',
+    '$"si%"ol$&yseius#(i-sexual$%ances&!i$)dexterity$)ent-dance(%style\'#ali$&guous.)(ly-drawn+!.$&lineal$\'onensis',
+    '$&sexual%$onic)!s$Ction/self-presentation/self-nurture\'/us-enterprising&%tious$!x#\'lecliff&#ote%-side-coniston)!/&$tone%!t&"on%$wick',
+    '$%yopic%%teles#$oina$$nese%!i&$acus#\'ra/sage%%ciots%!e%&movitz%!s$"ey$"iz$&olauri%$ziak',
+    '#)ucetti/ap$&lacral&!n\'*ce-chasing*#men\'"te)!s("ly&&tories%#ift$"rg&!h$&scados%%hers.#&ystoma',
+    '$(f&eacute##lub#$oach"#dec$#rna#!h"#e-1#%asure##cea#*d&eacute;e$!e$#roz#!e$(eeeeeego$!n',
+    '##gee#%inias#!l$&ancher&!d%"vi$"da$\'iaranne%(orations)$rion\'#ist%"ta$"ko$!s%&/diana',
+    '$!.$,ded&mdash;at\'(/without\'#_on%#men(-ts/additions/$%emheb%$ties$$hope$(ianarxia%%ties.&(y-injury$!t%!o$&uvegbe',
+    '#+r&ndash;can%(rehy;ica$%-ican$!a%$sian$$bach$$cian$"da$+ic&acirc;no&$-ans&8a&mdash;travel&mdash;had\'+-distancing(\'english(%first(&minded',
+    '\'*/australia\'!3\'%_as_a\'.n&mdash;soviet)+ndash;based/(canadian)/rehy;controlled()-accented*\'tlantic))brazilian+%itish0*-dominions)\'checked+%inese*$loth',
+    ')"de+&signed+%vised*(ominated*,utch-british)&equity*/uropean-british)(football*%unded)%grown)(imported*$rish*&sraeli),manufactured)+naturalized',
+    ')*registered*"un)(selected*\'ounding,"th)0zionist-atlantic(#/de)(european)\'mexican),non-american($a/us(%ified)\'sations*#ing*"m\'',
+    '(%owned((platform("s.)\'andwich\'"re\'&s-wide&\'ium-241&*o-liberian%#fax%$kkka%"nd\'"ia\'!o$&o-west%"us',
+    '*&uchler$(y-warmly##ssy$$trey#)thopterin%,yst-coloured)&decked(\'/violet$%istov"$f(a)#!7"$gala##oed"$hadu$,ric-speaking',
+    '""i9#!a$$bly.##ces$"he$/is-buonsollazzi&%sumus%$tiae$!o%!s#+da-buddhist$*e-exchange$#ini\'"um$/omethylcoumarin',
+    '%$nois%#ois%0s&ndash;boulogne$*s/designer#%ga500%&namore$$ismo#%kacin#!l$$care$!d$%itary%"us$"ly$&oride.',
+    '#$n\'ny$!7$$atat$"is$Jo-3-hydroxy-5-methyl-4-isoxazolepropionate&.ethylcarbazole%5acyl-trna-synthetases.!s)%ation%\'benzoic%@cyclopentane-1s,3r-dicarboxylate\')lopentane%-dinitrophenol%*ethylether%"ff',
+    '\'(yco-side%-histochemical%,lsalicylates%&nitro-%1phosphorylcholine%!r%*salicylate,"ic%3transferase:alamine0!s($zole%!v#/pro&bsol;macros#%racle%!l',
+    '%"te#&s-like%(sounding$"es$%field$#ian$$kwia\'#ids$"on$#ses%#ing$#tad##tai$)ermitinae$$ies.',
+    '%#tic$\'rypline$%y/the"#jab$"wr"#lak#"cd#"ot$!w"&mallos$\'n-based&-riyadh-dahran%$ites#"ed$"nd',
+    '&&chwihr#"ir##ock%$oete$#nal%!d%!i&1a-nitrite-nitrate\'#tes&\'te-like$+transferase#!u$%ffita"#ner$-sia-suffering',
+    '%!t&"y.$"us$!y#!i$*o-whatever%&centic%#eze%(infusion#%osics$#unt##uai"*oco-conoco&#led#*dification',
+    '%)ic-shaped%,oflagellates#%gordo#"ld#$n-ra$!.$"et$"ge&!s\'!t%#the$"ia$+oantibiotic$#sgt#!o',
+    '#\'r-odium$$ance&!t$$bach$"e\'%!s$*g&oacute;s$!i%"te$&nvivat$$ocho%"sa%&usness$*phophallus\'$usly',
+    '$$tize\'#ing##sis$%quito#*tivational$"or$!z#$uage$$gies$/nt-of-substance&*s&mdash;50\'!.$%reaux&#use\'!x',
+    '$#yel#3xicillin/omperazole%!l$$ypen")p-in-case$,lexi-kow-lis$$type#(/speaker##age$"ra$"to#+elcoalition$#nan$!r%%sands',
+    '#!h$#ana$$enol%+tamine-free,$like,$type$*i-theatres%+acanthoides&$raon)!s%!b&$alus&&ianism\'(ologists+!y',
+    '%#car&&tionic*!s%$gory%&ktiony\'%yonic*!s*!y%)lepidinae&$imna\'\'pidinae%$maid%"on&&pholis%&pholis',
+    '%\'sbaenid&"sa%(theaters*\'re-like+"ic+"um&$ryon%#uma&%ridae$#ong$%thous$!u#&iaraus$"ng$&shness',
+    '#)le-backed\'&ellied\'%usted%#sso%\'xicaule+"is\'$form$\'icillin%$dues%(ficatory%#mer%"on%&ssimus%.tude-modulated1#ing',
+    ')#=46*"52)"of$%otude$(y-filled&%soled&%toned#%onsah$"rt#%s&ins$$tead$"ys#(ulaceous%%latus$$rias',
+    '$(tations.#$wise"#qua"$raam&!s$!m$!n%!i#$esco#%inder$#yah#&ollahi"#s1s#)andwiches#$berg',
+    '#"el$#rau##iwi#!k##lmr##oft$!n#$tell&$veen%.rdam&mdash;the)"-1*$born)$mers)$sche&$park',
+    '"#tes##ree"%u-see#-let/medallion&"ic$"va#"nd$"et#&rensis#!s$$able$+e&rehy;ment%(-gueules%$d/at%%ment.',
+    '#%zegar")v-reverse"&werica"$x-10"+y/rosabella#-gdalo-persica$$ists#%lacea%!s&%aemia&$uria$,oglucosidase#(otrophic#%rgian##ses',
+    '!,n&ccaron;erl#/eacute;cdotique*"es#%ndash(#;el)!l"$\'and#-ol\'perrishikk#"ry##wee"!-#"12##225#!8#$969m',
+    '$$rche$(tom-ical%"ta#)essential#&gwil-a##ice#!l#%najah$&u\'aymi#"or$$ther$&verall",.anachronism#!l"$=and',
+    '#"as""a\'#!-#(bantidae)!s%%ritid*!s%"se#"ca$%haris%%ronic\'&rlisms$%letan\'"us$#omp',
+    '#!d$!a%!c%$mide%0rko/lasmo/maersk$"ia$&romous#!e$$mia\'&)c-looking\'!s$"ro$#sth\'$aeia*#sia',
+    '\'$esis+"ed((tisation$&thetus#"fa#&gallis$!h$$logs%!y$\'norisis&#sti$(ogically$\'ramming$\'yroides&#uus',
+    '#"ik#$kena%*pbalaiosis$%upalo#*l-fixation%\'genital%*retentives$$agus%&tresia%$ysis$#ect\'!a%%ptics%"ti$\'ienburg',
+    '%#sed$,ly-retentive$*og/digital&&ically\'!e\'\'zations&"on&)ue-minded*%odels&"y\'\'!.%!x$!s$#tis$!y',
+    '(!s%%sands&\'e&ndash\'+_on_account\'#rs.\'&susing&0is-and-synthesis)%based*)y-feature,)synthesis)1cum-psychotherapy(+.candidates)#the(+/assessment)%needs',
+    '&*t-advisers\'!.\'B/acupuncturist/homeopath/hypnotist((designer(+hairdresser(+programmers%-tic/synthetic("ae)"ls(#ity%&ze/rms\'+d/evaluated\'"rs#"me$&nesses',
+    '$(orphotic#&ndaban&!n%!i&#ans%"ji%!s$&eotiko%!v$"ia&&shvili$!t#2p&mdash;motherland$&aestic(!s',
+    '$%halis%(rodisiac$&lastic$$sids$$urna#\'rcestes%(h/social&&ically\'"es\'#que\',st-communist)!e*!n)&ically&(o-hippie',
+    ',!s&(ronistic&"y\'$#ene$%jokka$%thric#"s.$&agasti%"zi$&pastoi$%tasie(!s\'$sios(\'opoulos%#een',
+    '%(omomosed($sing%&ylosis#(tagonist%#lia%0mo-physiological$$evka$\'hbethel%%emata)%ising*"ze\'$ised%#oth$%idae.%#nae',
+    '%&omaros$&olepis&,ian-inspired)!s\'!o%#mia\'"co\'#que\'#ses(#ing\'&zation(!e&*o-clinical%"ni$%ronic',
+    '#"ud$!s#%vysos##wim$%ratha#(xagorean%%ndros$)imandrean%!s#%ylsts#&zarbus"!b#%acher#!d#!y',
+    '$$nosc$*supporting#+/government#!e$+s&rehy;tral%#ter(!s&-or-descendent)\'tracing($/did&$rous#(himolios%$saur%%zonal$#ois',
+    '\'(handling\'$like\'#men\'%point\'%stone\'$worm&0age&ndash;denali0\'portage)*-dependant&$less&#men&&sholme&%thies%#vy-(%paste',
+    '#\'idetemi$+ent-looking(\'mariner\'!e\'.ly-established*&rooted\'"ry\'%s-see("ki$\'liaries%"la\'(ry-staff$!t#%liffe#!o',
+    '#+ylostomidae"%d&amp$\'formula$"gt&&=10.57$)lsqb;name$%ndash)-;professional$*rehy;great#$\'ava##(3)$"4)$#ba)#$-240$"98',
+    '\'"ow%!s$%based%#lue%#urn%3y-way-of-hieronymus$%carry%)ompletely$%death&)velopment%#oes$+enforcement%&xposed$\'factory%#elt',
+    '%&umbled$$gate$&hatred$!i%$ron.$(loveable$&mining%#ost&$ther$#now$#off%&rdered$&pinion%%olish%&roduct',
+    '$&social%&trikes%Gwann-meets-joyce-grenfell-old-fashioned$#tax%#hen%!o&"ok%#ree%\'wisting$\'uranium$#wet%#ith$#you#).daughter$$find',
+    '$"of%%pened$(shifting%%imply$%their#$/and$#but\'(/because$&courts$"d/$#ns/$#o-r$$skw/$$with$"y/',
+    '#"10$!4$#883$#992#!2#+:allocation#/_,_and_er_so_on$%again%#way$.er_,_and_so_on$#for$$hors$\'instead+"_,$%large',
+    '$#now$#out\'$side$&papier$,so_on_and_so0#_on$$vice$!w#\'ahaylas$"le%"ie%&usians$!m%#ans$"na',
+    '$#rte#$both$%reast#)community%*nstruction#!d$&elight#!e$*an-rockies$!d$"li%%jkova%"le$$mson$!r',
+    '%#egg&&rseits%#ida%$jays%$lect%#sag&#ens&*on-alinari)%style((/cummins)&forest)\'gallery)*lumberjill))technical+$nant',
+    '&#sen&$torp("wn&!z\'%ewski%(ton-like(!s$$sine$%trium#,helicobacter#"ia$*hysterbine$\'kithera$"ol$#ron',
+    '$!t$$zhan#%janet$"el&+kovi&cacute*!c#)malignant$#eet$\'oreover%#tor$&utters#!n#"oe$!n%"ie',
+    '$%thers$!v%,er-eastleigh\'%sford#!r$0&eacute;-georges,"ew,(minister%&ograve$%achne(%oides%!e%\'gogical(!y%#itx',
+    '$$e/1e%#aea&"ni&.s-salom&eacute\'"si&#tta%&ceived%\'dsweald%$escu%"js%"na%#oli&"us&$vich%#sen',
+    '%!u&#zza%)w.cmu.edu\'!i&-s/prosthetist(&racing(%stone%*x-coloured%#zej$)iamanampy)$mapy&!n\'(alijaona+$oana\'%tiana',
+    '%%esson&"ux%$yadi$"le$\'oboulos%%ecium%$gyne%(monetius%$naci\'"ki&$ican($usby\'$khov\'%scius&"ov',
+    '%$tion%#uet$#uta$$zeja\'%ewski#\'student##the##uff$"lo$"ro#%where##y\'s$\'-fergie$!s#(z&eacute',
+    '"+e&zcaron;ka#(asthetic#!c$(dotalist\'#ery\'"ic(#que$(hoically#%dande$$jety#"es##fis#"is#!k$5&amacr;ntav&amacr;din',
+    '$!y#%memas$"ic$&ograph%\'ne-like%&spilia#(ncephaly$!d$)sk&aacute\'&eacute$!t#\'pimeron%\'sternum#$rgia$$icas',
+    '#!s$\'thaesia&*esiologist\'%tized#!t$&hoides$"te$!z#%urism%$ysma)!s$!s$%yrism#!y"+f&auml;ngen',
+    '#(ieldborn\'#ers##ora#(ractuous"-g&eacute;lica%(grave;le#!a$&driama$#ine$!l$$rita%!s#"ba#"ed$#hrn',
+    '&\'enabler&$fish&/on-the-shoulder&%snout&)tonsilled(!p&$wing%%/your%&a-when&(/georgia\'%tracy%$bert%$dust%!e&#ans',
+    '&"no&.s&ndash;london\'%-born(#san\'!/(#new\'"cu%$food%%icals(!s&"ki&"sm&#tos%$lism\'"te',
+    '%&n-type%\'olatory%,s&mdash;that&!.&\'/stolen%%teich%$ucci%$wing$&nehmer%%henio$$pena$+r-provoking%).friendly%"er&!s',
+    '$\'stellte+!n,--gewerkschaft$$vine(!s#%hared$#one#&ilbert$"n\'%!g$3ogenesis-inhibitors&&rafine(%phies%-immunoblastic%"lo',
+    '\'$tous%%scopy&$pers&+trongylosis%*tensinogen*"on$$this#*kor-period#!l$#ade%)is&ndash\'$\'e-beams&\'figures&,german-dutch\'\'rinders',
+    '&+of-approach)$dive)$view&&parked\'$oise&&shaped&&tables\'!o%-by-birmingham%%guide%#man%#sea&%miths%%zarke$%ia-an',
+    '\'%north&$/itv&.124-1298.515.8&!s%3can&ndash;dissenter()-catholic)%roman+&yalist*"un&#ism("ts&"um%!e%$gena$-o&mdash;saxon',
+    '+*protestant%)-albanian\'#rab*#ian((gentines(&menian\'\'ustrian&\'bengali\'&ritish\')urgundian)$mese&)caribbean\'%eltic\'&hannel&&danish',
+    '&$free&&gallic(&ullist\'$reek+!s&%iraqi(%eland($ish.\'%srael,!i&\'kuwaiti&%latin\'$rish&\'mexican\'(ongolian',
+    '\'+ewfoundland\'\'igerian\'&ormans\'%ubian&(oriental\'&ttoman&)pakistani\')ortuguese&(romanian\'&ushdie&9saxon-celtic-norse-norman,&german+\'/middle+#dom+#ism',
+    '&,torontonians&!u\'(krainian\'&ruguay&$welf%).american%+/australian%(centrism%"is%%mania%&philed)"ic\'$onic%%saxon&)trongylus',
+    '#$oche$*ff(1971)1-$&isseux$0la&mdash;workers&(-partido&!.&&n-born%!d%!l$!t$%uleme$"ve#$ra-2%%ecoid\'"um',
+    '$/y-and-otherwise&\'looking&0of-west-midlands%\'/polite,&/upset&%taken&1unhappy/sad/upset#!s$&t-fest\'#ree&&racked\'&iddled&&struck%,/celebration%"er',
+    '#"ue$&illans\'$idae%#ped%$sshe$"ka$!l%*ar-looking(&shaped\'"ly&%tions$\'s&ndash%&/agnes%#son%"ta',
+    '(!s\'\'rostris&"us#&wysche#-yal/petrovics"-harmonicities#%edral(#led$#mbi$$user#$imsa#\'ydrites&5o-n-acetylglucosamine"$icca$#eto',
+    '$$onic$%teric#$dder##ela$#use#$gree#!k$$etos#$lene$#ide%$ngus&!o#"m.$*a&atilde;o%#bus',
+    '&#ion%(dverting%\'l&mdash\'*ndash;that&#(s)&(-baiting(\'reeders\'$care\'%drawn\'(enhanced(#yed\'\'feeding(\'riendly\'&groups\'%house',
+    ')\'sbandry\'%issue\'$land(%overs\'#man()etabolism\'\'powered\'&rescue(&ighter\'\'scented(\'oothing\'/waste-rendering)%tched&".2\'%bites',
+    '\'+environment\'%human\'*pedestrian)$ople($lant&%cules&#ine&$kind&(s.played\'(/insects(\'species%&teness&"ic(!s\':on/recherche/confrontation',
+    '&!o%"xx%"ze&!l$$ikie%$zing$!o%#rum%\'samente&-ity-suffering$"sl$#ula#"na%!l$$dita',
+    '&&cation%,ic-non-ionic#$rudh#\'sakidae$+e-flavoured%+ed-smelling$$feld$&hnabai(!e$(ioylated%#tsi$#kin$#mus$#ole%/mycin-sensitive',
+    '%&pteran%%tonic&-ropic-layered*"es$!s##tra#%ushka#(versario)!y"#jad$"na#-osagriculture"!k#(aratrite%%crona',
+    '$%rdine%!s$#til#$hian$)senpaaten#.le&rehy;length%\'-biters\'$ones("ot\'\'reaking&(catching&(holsters&&injury&(ligament&\'risking',
+    '\'$ocks\'(training*!p+#ped+!s\'\'upports&%tight\'\'wisting&)wrenching%%biter&#one%$deep%"s.%\'warmers$#ing',
+    '#"us#$vaba#!y$&-panky$&losaur\'"is"$laby$"ge#!e$%itung$)y/mounted##ong""md##yon"-n&auml;herung',
+    '#(-pascale$\'sargent#+a&mdash;all+"of$!-%\'camilla%$eyes%\'francis%#lee$/belle/annabelle$%chamy$!d%*ale/queens$&ghmore$$hilt',
+    '$#kin$%leigh%!i&"ne$)mese.camp$$ppes#$bank#$chen##e\'s&\'-on-sea$%-line&$ucie$#als%!u$%ctens',
+    '$!e$%field$&juleen$$lise%"li&!s%!o%#sey$%rsley$+s/blackpool%#ely%$leys$!t%"ts$"xo',
+    '$%combe$,e-the-silent%!s$%gonis$*hilatingly*#on.,!s)"or$"na%\'versary$!o$"ta$"um$(versaire)#rio',
+    ')!y#$lies#%marie#$nual#&ointed("th$!n%%imous%%ymous$\'tatable%"to$!u%&cement%!n&5ced-but-not-available',
+    ')!.("mt$"ya%#ed.%#in\'\'"g/#%sboro(#ugh#,ual-calendar(%hange&#/oh\'$sick&%ising\'"ty&!l',
+    '((-elected)*negotiated))published))renewable($.now)#the&!t%#rio%$tion$%itant&$ized&.y-depreciation$(lar-type\'"ia&"ta',
+    '%%lment%!s$+m&mdash;the$&nciate)"or$#ver%"in##wfn$#ood"(o-hon-wa#%0ther#$bium#\'de-bend$#ine#\'genital',
+    '##les$"is$!s%!q#!m$"al&%istic&!s$(ie-based\'$type#.n-co-operating%$farm$!e$%imous%!o',
+    '$$uevo$+y&rehy;mous%)mity-r-us\'#zed&.ous-impossible),ly-published#"on#%plura#(rak-type\'\'wearing&(nophobia&#sia\'#ter$7exic/bulimic/compulsive$#mal',
+    '$(thositic\'$tiko#$smic$"ov$%tinho%%racan#%thair%-er&mdash;what\'#(s)\'"-i(&middle("no($with\'".4\'#20%',
+    '\'!r%!r%!y$"te#(uncement$%schka%#hka$"ta##vna$\'ulation#\'xbridge$&ygenic""pp#$ulla"+r&aelig;dum',
+    '"*s&oacute;s#!*#"ae$#nta$&phones$&ruddin$$very##bro#\'comb/st#!d$#ale#+ell-pearson&\'/thames%"me&"us',
+    '%$ina.(!e)!.()telomeric\'!e&!s$!s#$fred#*i-approved%)compliant%$type$&/ccitt$0edlungskomission$%minic##ley',
+    '$$ysed#$okia#%perto#/tee-algar/peace%"ss%&y/mind&!s$#ies%!x$\'otelian$"ry#%umana\'!e#$well%&r-back',
+    '\'%phone&!.\'#the&)/argument\'%input&$back*!s&#ers&(ing-back&1msgbox(no)\'answer&"s.#"ys".t&eacute;rieur0"es$)oacute;ni',
+    '#!\'#!-$+association$$bear$)dispersed%#rug(!s$&eaters$#fed%$iles$)inhabited&+terrogation$+l\'ouverture$%plant%$roof',
+    '%#ize%%tatic$%trail\'(nsported##abi$-gon&rehy;isms\'%isers)#ms.)4tically-expressioned\'"st$$ibao$\'lgesics$(naclasis&&nirivo&!s',
+    '%"te$\'pologia$"ra%&cticum$!s$%t1.3a#$bird#*e-chambers%$date(#ing%+preparatory%+room/office$)_meridiem$$cede(#nce',
+    '%!h&$inus%&lypeus%%ostae&#xal$$lias%\'lectuel%(ope-horn$&murale$"na%(na-modem\'$.the\'\'/nerves\'&e-like)$trap',
+    '&#e-2&\'ophorus$&pendia\'(ultimate$%quera$"ra%-ior/posterior(\'ization()ly-placed*,/posteriorly($most%!o&+-superiorly&&apical&\'lateral',
+    '&\'ventral$%serum#"fo#\'gardens#(hem-like&$s-my(.preston/christ$%ills.$(ocyanins)&osides%%logie)"se)"ze+!d&#yza',
+    '&)&iacute;n&"ie\'"sz&"y\'\'(/athlete\'*challenged%%phyta&(ological%(xanthins%#zoa("ns$&racene\'-in-containing(#tes)\'isation',
+    '&/noid-containing%(o-pology&$pism)"ts\'*ogenically*+omorphology($idai*"es*!s(!l)$ogia,"se,$zing+(y-as-art0\'science',
+    ',#:02(\'metrics).or&rehy;phized+/phically-minded.$sing/"ms."ze/#ing(%phagi,#ous$%ticus#4i&mdash;emancipation+&soviet%-rehy;aircraft+\'merican',
+    '*(columbus,)mpetitive.&ulsory,-rrectionalism.%osive,*smopolitan*+determinism*/entrepreneurial*)guerrilla*+imperialist++nflationary,*tellectual*(jacobite*(learning*(militant',
+    '*$nazi*,obsolescence*+plantagenet+)ositivism*&racist-)keteering+\'omantic*%scald+\'hipping+(ocialist+(talinist,+ructuralist+,uperstitious,$rrey*$tank',
+    '*%union+\'rbanism$&-&agr/*4anti-myeloperoxidase&.eacute;tatisme%)\'creeping%$240k%#63k%#abh\')ortionism\'(solutist\'#use&\'cademic-#ism\'.commodationist',
+    '&,daptationist&1ffirmative-action&*ggregatory\'*ricultural&!i\'&rfield&\'lgerian\'%iased\'&lergic+!y&%mbush\'\'endment(&ricans&&naemia(\'lytical',
+    '\'&ti-pop)\'missile)&racist\'%xiety\'&ything&%pache\')hrodisiac0!s\'\'ostatic\'\'peasers&\'quarius&&rabism\'#ian(%stide*!o',
+    '\'$mour(!y\')rhythmics\'\'thritic-!s(%istic&%sialo\'\'thmatic&(thenians\'#las&)ustralian%,back-draught\'%lance(.listic-missile)"ot',
+    '(!k\'%zooka&&eatles\'"er\'$lfry\'%nnett&%hutan)"to&#ias\'!g()-business\'"ke\'\'lingual)#ous(!l',
+    '&3lack/anti-immigrant*%grass\'%emish\'&ockade("od*\'-sports&#nfl&%odies(!y\'#ers\'(lshevist\'"nd(!k\'#oze\'%redom',
+    '\'$unce&%rdurd\'"it)\'ishness\'&owsing&"sp&%tv-10&\'uild-up\')reaucracy.$tism(#ger(#ner\'$sing%!c&(/ebp&dgr',
+    '\'(mouflage((paigners\'%ndida(#ing\'%pital\'\'r-theft(!s\')tchphrase(&hedral&"d3(!6\'"68\'"71&(elebrity\'*ntralizers',
+    '&)haracters\'&emical\'"ic)#ken\'&lorine\'\'ocolate(#ice($lera)(inergics\'*ristianity\'$urch+&illian&$lark("sh\'\'erical.',
+    '(\'nkering)#ton\'%osure&"nd($-all&)oagulated-#ion\'"ca)#ine\'(llective.$ists)%ision("on\'+mmerciality)"ie',
+    '))unautaire+#ity(*prehensive)$uter\'+nceptionnel()fessional()scription)(ervation/"sm/#ves)&piracy)(tipation(\'tagious)(emporary))raception',
+    '((vulsants,#ive\')pernicans(!y)%right\'&rn-law(&porate-#ist(&rosive(#set\'"sy\'"up&$rack\'$eate("do',
+    '(%tique\'#owd&\'ultists)\'uralism+"es\'"ts&&ycling\'"st%!d&+&uuml;hring&#ada\'$mian(%pness\'#nce(#ish',
+    '-"ts\'$zzle&)efamation\'#ist\'&mocrat\'$sign\'\'tection+%orist0!s)%rrent(\'onation\')valuation&!i\'&abetic(&lectic',
+    '\'%ckson()tatorship\'"et)#ing\'(fference\'&lutive)$vian\'#sco(&persal&"lp&\'ocument\'$rian\')stoievsky\'(wnsizing&#p-1',
+    '\'&iftnet((nk-drive/#ing*#ing(#ver\'*ugs/sports&#uke\'"mp\'$rfey\'*valierists&\'ynastic%"e-&)chekratid\'(ological&-galitarianism',
+    '\'&yptian&\'instein&\'lastase\'&ection&&mbargo($olic&(nclosure\'#emy\')glishness\'-trepreneurial\'!v((ironment0%alism4!t&(pileptic',
+    '(2thelial/anti-brush\'%oxide\'#rdf&!r\'%osion(#tic&%scape(#ort\'*sentialism/$zing)!x\'#tab&"ta\'%hical&#uro',
+    '&(verybody\'&iction\'\'olution&+xperimental()loitation%%fa-18\'&milial*!y)"ne\'"ns\'&scista\'!t&(ecundity\'%deral\'!e',
+    '($ling\'\'udalist&#ire&#lag("me("sh(\'tulence-!t\'&oggers(#rio\'#uke\'!y&#oot\'"rd(+eign-worker',
+    '(#mal+#ism\'"ul)"ed()ndational\'!x&%ranco+#ism\'#ont&&ungals)%icide)"us%#gag\'%lileo\'&mblers',
+    '()sakhurdia\'$rlic(%otter-!s((risonian\'!s\'\'ullists&"ct&&enetic\'&orgian\'&rmanic,"sm+!s&%hetto&&lamour',
+    '\')ycophorin&"mp&#ods\'"ld(!f\'$thic&!p&$raft(#vel))itational+#ics\'#eek&#ulf)$-war\'!n',
+    '\'%mster\'&rdline("ry\'"te&"bc\'!e&"dv&$eath\'#gde(\'emonism\')llenistic(#met\'\'rbivore(*editarians(%o/ine',
+    ')!n)!s\'\'uristic&,is-own-class((toricist\'\'tlerism\'$v-1.&$la-a*#2.1)"dr&)omophobic)\'sexuals\'&oligan\'&rmones\'&spital',
+    '\'\'usework)#ing&%sp-65&$umen\'!n\'!s&$ydro%#i-a\'!e&"ad(\'-coated&"bm&"ce&(dolatory&&l-6dbp',
+    '\'$6dbp\')lusionism&$mage\'4migrant/anti-foreign(-unologlobulin&,ndividualism(\'onesian\'&former\'$sect((titution0"al($ular\')telligent)+rventionist()imidation',
+    '((olvement&#ran)#ian\'#ony&#sms\'$rael%\'jacobin+"te\'%karta\'%mming\'!p(*an/britain&"et&"na&\'oyrider',
+    '\'%daism\'"mp%\'karajan&&ennedy\'%ratin\'\'ynesian&"gb&&homeni&"im(!s\'"nk\'$tsch&"mt%%label\'!w',
+    '(!s&"dp&!e\'(adership(#gue(!k\'%ftist,!s&%ichen\'(ghthouse\'&terary(#ter&$loyd&$obby\'#cal',
+    '(!s\'"ve&#ush%-maastrichters\'\'chiavel)!o(&millan\'%donna(#rid\'&kassar\'(lthusian\'$nchu(*ufacturing\'$oist\'$rcos',
+    ',!s\'"sk($onic(!s\'%xwell&!e\'"at\'(chanical\'%dical\'(mbership\'!n("em(%gistu((talistic\'*rcantilist',
+    '()itocratic\')sometrial\')tabolites(\'ropolis&)icrosomal\'$g-fl\'*litaristic(&osevic\'&nority(&uteman\'#p-1\'%totic&4ogul/president/swell\'(narchism(\'opolism',
+    '($ster(&tanist*$zeri)\'enegrin\'&rality(%occan\'$sley\'&torway\'&vement&&pla-pt&&ubarak\'%gging\'0ltiple-sclerosis\'%rdoch\'&sician',
+    '&+ythological%6n&eacute;ocolonialiste&&abiyev\'&rcotic\'$sser\'#tal*#ist()ionaliser/!m/#tic(!o($ural,#ism.!t&*egotiation',
+    '\'\'wtonian&\'icotine\'!p&$oras\'%where&#uke%\'o\'neill&%bject+%ivist&(estrogen&(ncogenes&&pinion\')penheimer\'%t-out&&restes',
+    '&#s/2\'%mosis&\'verload&$xfam%#p24&#age\'%isley\')lestinian\'\'nkhurst\'\'rachute)$llel)$site,0ic/antibacterial($king(,liamentarian',
+    '(&tisans*\'tionism\'"ss("ti\'\'thology((riarchal&"cp&$eace($sant(!t\'%elite\'#nal\'(roxidase((spective(%uvian',
+    '&)harisaism\'*ilistinism)\'osopher\')otography&,igeon-holing&\'lanners($stic\',ebiscitarian\'\'uralism&+neumococcal&&oacher\'$etic\')liticians(&lutant(%onism',
+    '\'$pish("py(\'ulation*#ist\'(sitivism&%re-s1*!2(+destinarian()sidential\'$ison\'*ofessional)#its((hibition(&jector()portional',
+    '(*tectionist\'&uritic(%ssian&)sychiatry*(ological+#tic&)uritanism\'\'tschist%,quantitative("rk*!s(#yle\'#ota%$race(*ist-action',
+    '\'%ilway\'!p(!e\'$ther((ionalism\'&uscher&\'eactive\'\'cording((ruitment\'!d(&uctive\'&ferees(\'lective($ugee\'*gionalists',
+    '\'\'jection\'(lativism.!t(%igion(\'ocation\')naissance\'.presentational(%ublic-#ans\'&scuing(&onance,!t\'(volution&)heumatick\'\'odesian',
+    '\'%chard\'#fat&&obbery\'%ckism\'&manist*#tic-#ism*"zo(!e\'"om\'$ttie&%umour\'&n-back%%s-100&!a',
+    '\'\'nctions(#dys\'\'rdinian\'$ving&$cald\')holastics\'(ientists\'\'orbutic("wl\'\'reening(\'iptural\'"um&*dp/liberal&(ectarian\'!d',
+    '\'#ize\'&mantic($etic(,itic&mdash;a,!s\'#nse)#ual,#ity\'$ptic\'"ra(!b($mons\'%ttler\'(x-symbol(#ual',
+    '(+p/submarine\')oplifting(!w&#ikh\'$ndhi&\'lumming&$mear\'$iths\'$oker&$nail("ke*$bite&\'ocially)#ety\'&ftware',
+    '&\'peeding\'\'iritual\'&linter\'#ray&7talinism/anti-communism(!r)!e)!s(&tesmen)%usquo\'&ranger(*eptokinase)*ss-related(*ucturalism\'$ussy',
+    '&\'uburban-#ism(\'versive\'&ffrage-#tte\'(nglasses\'#rge&$weat&"yn((dicalist\'+stematizing+!s%!t&&abloid\'"ig',
+    '\'"xi&!b&"cr&,echnologists\'#mbo\'(rrorismo-"te\'\'stimony&*hatcherism\',eatricalists()mistocles(\'ologian((rapeutic\'$ough\'+yroglobulin',
+    '\'$ckle\'"me\'#the($oist&"nc\'!f&&orpedo(#que\'%urism\'"wn&-raditionalism2"ts($iner)#tor((nsferrin',
+    ')%eller\'&eatant\'#iad(#bal((nitarian\'&opical\'%uancy&&sarist&)ubercular-$osis&!v&%witch&%ycoon%!u&%-boat',
+    '\'&iverse&&ranium\'&banism&#ssr&&tility\'$opia&#uuc%+vaccination\'%mpire&%cam-1&%enins\'%rruca&$ichy\'(etnamese\'$rals',
+    '*!n\',visectionist&$ocal)&tional/#ism\'"lk&"p2&)ulgarians%)wagnerian\'(shington(*te-dumping&\'elensky\'"st&\'hacking\'"ig',
+    '\'(tchcraft&#olf\'%rking%&yankee&\'ugoslav%#zia$\'.sexist$$acne%&nginal%(partheid%#ris((tocratic&)rhythmic/&\'thritic%.stunomologists',
+    '\'\'terials&%ryons%"en%$iose\'-tic-resistant*,s/cortisones,(steroids%$last%!o&%dies.\'(y-coated)&enzyme))secreting))triggered(!.',
+    '$\'capella\'\'italist&)rcinogens\'#sia&)tholicism%)entromere%"he&-olecystokinin((inergics&%riste*#ian%-i&rehy;pating0"on&*p&eacute;e\'"at',
+    ')%ingly*$onal*"ve)"or%!k%)lassicism&(imactic.)#tic\'#ses%"o\'&$dons&)incidence&&lonial&\'mmunism\'*petitively',
+    '&)operative&)rrelation%%pated%%uario&%bital%*ytokeratin$(deluvian&(mocratic%)iscipline(*riminatory\'6enstablishmentarialism&&uretic%$oros%#rug(!s',
+    '%\'ynastic$\'emetics%)pithelial%&rosion%(volution$\'fashion%+ibrillatory)(nolytics%$lood%&oaming%&ungals$+gen-binding((directed((positive($rich',
+    '\'%aemia\'(s/hsp-65%$lare%$ones\'#ish%$uans&!o$*helmintics&$rpes%)istaminic%)omosexual%\'umanist*&tarian%,ypertensives$!i',
+    '%)nternment$)kenmuseum\'(sammlung&!s%!s$)leucocyte%#ogs&%oting%*ymphoblast&&sozyme$(macassar&%laria+"l\'&$rket&*tter&mdash',
+    '&(rcantile\'%idian&(senteric&&tabole(&stasis%)iocrobial%*onarchical\'#ide("es\'#ous&$rtem&\'use-lgg%)uscarinic&&tagens%.yeloperoxidase',
+    '%%aktes&&tional&$usea%,eurofilament%&omians$\'obiotic%1ch-on-the-orontes\'#ene%"ne\'#tte%+qu&iacute;a\'#ian%&rganic%(xidative$%palon',
+    '&/rallel-stranded&$thic%%eople&(roxydase\'\'spirant.!s%%hanes&(logistic-"ne&%onary("er%&lasmin%+odean-style\'#ian&$logy',
+    '&%rcine\'!t%(roteases%)sychiatry)$otic%)utrescent%%yrgos$!q%!.%(ua/bruno\'"ck\'"ri\'.tedly-armoured&)e-dealers,#ing',
+    '($look,#ing(%model((spotting\'+/collectors\')s&mdash;i((-hunting)&packed(".i&\'issimum\'*t&auml;ten($ates("us(#yes&$orum',
+    '$%radar&&tional%\'esonant%+rhinum-like$*scientific%!e&)gregation&"lf&,ptic-looking*+/antibiotic*$ally*-s/antibiotics,*bacterials&#ra.\'#ums',
+    '%$heep%%iphon%$lave%(ocialism*"ly%(pasmodic-!s&)irochetal%$tall\'"te&\'replase)(tococcal\'$ophe%(yphoning$*terorrista',
+    '.!s&%sting%$heft\'\'tically&&rombin&\'ymocyte%+otalitarian&(xoplasma%+uberculosis%$ypes$+ulcerogenic%!m$&virals$$work$!x',
+    '$$zion#+kiv/musical#\'ler-axe\'%picks%"ss$"ia%"ff%"ss#!o$$body$"ci$#her$,ine-augustin\'\'/escape\'!s',
+    '$\'mmarchi$%nacci%!e&$llos&#tti&!v%)iazzeschi)!o&#des&#eta\'$wicz&!i&$mity&"na\'!o',
+    '%%ov-26\'#sky%$ymic$\'xidants#*r&aacute;s$+al-duodenal$&ieflux%\'m-based&,/downpatrick$!o#%s-the$%/year$%cherl$\'eranana$\'iranana',
+    '$!r%!e#%werp1\'"en)\'strasse$!i#!y$$-oxy"#uak$#lly$$rbek#"ga#!i##kan#&lingus',
+    '#(nciation$%ziata##pam##ria%!c%"on#$shka#\'trients##wat""va$!r%"-i#&erdons%!s&)-sur-oise',
+    '%"le""wa$&r-saab%"pe%!s&\'hipping%%uddin$"ti%!r$!y##oth"&xietas&"y-(%dream(\'induced',
+    '()reduction*%lated\'!.$\'olytics%+us-cautious(,to-integrate+&please\'!.\'*/ambitious"+y&rehy;more#!\'#!-$$more$\'old-how$%thing',
+    '#&/every#!8#%_more#$anya#%boday&-y&mdash;would\'"\'s\'!s$"us#$case#!e$!s#&family$#unk#"ho',
+    '#$lsts#)mole-else%\'re.this#"on%)e&mdash;i.(ncluding-#the&!\'&+-for-tennis&!.&)/everyone\'\'someone$$ther#$thin\'\'g&mdash',
+    '(!\'("-a),but-carefree-$free-\'lovable-&ragged)$core)&though((/working(#_at)&except)%other)$with("to\'"ke',
+    '#(ushkeleh##vay#$wany%\'y&ndash\',rehy;without&(_because\'"so&!z$"ey"$zaas$$kias$+ld&uacute;a##ere#$iger$%lotti',
+    '#&usehen!"oe#!w"$ibhe##fes#!n"$laia"$nack$(laschkae#$ghas%#usa"&oxford"$p.12#"ec"%r/mor',
+    '#!2#!3##aki##nos#.ta-contracting%!s$(ic-valve$,oportography""ss"*tearoa-new##rou"*uncontrols#$ssou#!t"$yagi',
+    '!/p&rehy;plauding"+-analytical$\'rt-ment#%chagi"!."%/6000"#110"!2#"/3#"10"#310"!4"+5-resistant#$/psd""60',
+    '"&:elite""ac$(he-style%!i$!s#"gb#!i#!l$(achicola#%nages$%teles#(ratchiks$#che$%ecido$&igraha',
+    '$"t\'%"-a&$hate&)soldiered&$time%!.%\'amentos%/heid-capitalism*$free*&ridden+%ooted)!s&#ied%+ment-blocks*(dwelling',
+    ')&/sales##sha%&olisis)$seos$\'sionata$\'tapeque#"th%!e%"y.$(ite-rich$\'osaurus$%rides$#ura#!x"#bus',
+    '#"k2#!s""d/$*3700925/wp#$1700#!o"\'e-devil%\'ropping$$eyes$&hanger%(ominoids$&people#$dale#$hood##ing',
+    '$$dorn$&lation##man#%nalty$#era$#isa#!p$%eople##rcu$(foration$%sonal$$tate%!e%"if%(ure-less',
+    '(!d#*s&mdash;is$%okari#"th##xco"\'felkrem%\'strudel"!g#"rp"$haca$)enogaster%%resis$\'namixis$$reus$-sia-producing',
+    '$&landra%%ocoma#&icides$(d-ridden&\'tending%%oidea$"ns#\'orismic\'!t#+rodite-like*$spes##tha&!e%#oid#%yllum',
+    '$#tis"$i-88#"ae$#min$#nus$*ry-keepers$$ster#!c$$ello$$hari%)ella/anti$#ian$(olateral%"rp##dae',
+    '#%oline#"sh$#tle%!o##thy$!i#!u#%votal"#les#%iavit$(caciones&#nts$!x#(ocheilus#!s',
+    '""ms""na#"ea$"oa".o&rehy;logists#!-$!a$!b$\'protein#!a$!i$!l#\'calpyse&,ypticnatural$+olocyntosis',
+    '&"ta%\'yphally$$ynum#\'deictic$$idae$#ous#$idea#!l$!.$.da-jena-weimar$%igise)!d%&ticism$%linax\'+e-dionysiac',
+    '(!s)#che%)o-derived\',in-the-glens\'$like&\'/domain\'%soyuz&-d&oacute;0ros\'$oros$\'ogetic.&!i&(y/excuse#&mictic\'!s$\'orphine',
+    '#(phthegms%&yllite$*lectically$0tosis-associated*(inducing#)repressor%#tic$&thetos%#ion#!s$*ematically$\'iopetic$%sible$%tasie&$tize',
+    '%#eln(\'strasse%$ille%*le-mentors\'$ship%"ol\'$ates&&poulos%&rophed)#ise,!d+#ing*"ze+#ing#+teksbolaget',
+    '%&ecaria&"gm(#ata*"ic&&osised*#ing&#sis$$tery#"ut",p&eacute;tit#%-type#2/c/92/m1710/616168$1m1710/a/92/203052$1u2370/a/88/103680,)91/192067',
+    '$0lachian-variscan%"ed%!l&,ingly-titled$$nage$$rail&"nt&&tchiki\'!i%!c%0el-manufacturing&!n\')tly-green+*inexorable*!.',
+    '%/ition&mdash;who*)-watchers*%s-and\'#ors%$rent$%ssany&&ionato$$uled&#ing##blk#\'c-based#&ealed.&"s.%.r&lsqb;ed&rsqb\'*rehy;ances',
+    '&!a\'$nce-+%based+)conscious+#the+.versus-reality+$wise*%.with*0/accomplishments+%dress+\'reality+(tidiness*#_on*\'reality*"s.',
+    '\'"d/\'"nt)"ly\'!s&&ing_on&"s*\'$-has&!t$%l\'sin%$aing%$boom%"er%!l&\'acionum&!e',
+    '%!s$,ndicectomies)$tomy(%itis.((ularians%%nines%1zell-ausserrhoden)$erei$(rception%&knowle%3ley/gloucestershire)#sun&!y%(taininge&%enant',
+    '$\'tencies(!y%$ite\'(\'-killer)*satisfying**uppressant)$wise#\'ication%%hella$\'gnanesi$"ng$"ol#%laing%&udable\'"er',
+    '&#se.$"e-&0and-blackcurrant*&quince&\'bearing\'+lossom-time\'%oughs&&corers&\'growers&&halves&%juice&&logoed&(motorola(#uth&&paring',
+    '(!p)!s\'&lanter\'(roducing&%round&&shaped\'$kins&%thief%!.%+/ibm/novell&)macintosh&(taligent%#bee\'!y&(y-warcop',
+    '%&design&#ore(!n\'$uble&\'urcombe%/gate/instructor&$irth&$reen%%notch%%picks&#lex%%s.and&&/apple\'%pears&$auce',
+    '&$hore&%ingle&#que%\'thwaite&,on-le-street&#ree%%world&%riter%%yards$+iance-based)"s.%!c&-&rehy;ability&)abilities\'!n',
+    '(#ino)(on&mdash1$;see2$that,-rehy;specific+#(s)+!-,)dependent,(enabling,+independent,&linked,(oriented,.to-application,\'visible+".i',
+    '+"al+.s&mdash;filing,)-oriented-)relevance-(software,)/policies("on&"on%"er\'!s&+s&mdash;see%+q&uacute;ed&.u&eacute;-work/!s\'"ee',
+    '(!s$%obish$"y\'%#(3)%$.not%#/do%,_in_relation%$fees#$n/nn#)oggiatura$!i%.nted&mdash;and)%-dual)!.("e.',
+    '\'#ive\'"me)#nt\'+"s.$"ld%&inaire%&odorus&$gise$&mattox$$nale#(pearance#-raisal-linked)(/project\'#ees(+r/appraisee',
+    '$!e%,&rehy;hended%%ached\'$iate+!d%-cia&rehy;tive(&bility),ly&mdash;all($ted-*"ly))ion-\'what,$.c.c%%hendo(,sive-looking%&iciate',
+    '&!t\'(ice-bond+\'entered+)historian+&taxmen,&rained*$/raf*%ship.(%shipp$#ize$#nce$"o.%$ach\'(!-)\'optical',
+    '(!1%\'bations%#che%&oaches&!f%!p&(inquante+"ta&&oriate\'!t&"ri()&eacute;e(!-(!a)*t&rehy;ing',
+    '+!\'+!-+(ly-named+/ness-conditions/#_in("te%%riate%!v&$able\',l-procedures)&rating(!/)&denial)#has)3support/reassurance',
+    '\'#-if\'\'d-\'what)$body)"of((/desired),non-approved%#x.2\'#8ml&+i&rehy;mate\'&matley#&server$%tudio#"t.$!s#)uldurcome',
+    '#$ying"*q&ndash;13"*r&eacute;s,%-sail%4grave;s-din&eacute;e0#ers-&guerre-%midis-\'premier-&school$\'ndash;1*"23*"30*$sept#&-1-neo',
+    '#(21/may21#$axic#"el%!l$$mont$+s-apres-ski&&riding&&season%!s#!i$!1$(cot-pink(&salmon(%white$"es',
+    '$*l&ndash;13,"24-!9,!3,!9,%early,$july."ne,#oct/$ober%#\'92%#-14&!2\'!9&"31',
+    '&!7&!8&&august&$born&(december&\'england&!i&$july&%march%(/francis&$july&2witney/oxfordshire%$1993(!6%"he',
+    '%!s$#smo%"ta\'!s$$vate#$kham##low#$oach\'"es$&jected$&n-like&\'pouches&%stage$%posed$\'tinin/l',
+    ')!e%$onin$(ximately#\'roached"6s/psa&mdash;automobile#%e-end$#wac$!y#*idal-ended$"on#/ley/cirencester$!y#%otles#!s#*ychologist',
+    '#!c#"do##ech$#ros$"st#$hous#%ients$#tud#)ly-titled#!t#$ychi"#ure$$imac"#x-6$"86',
+    '#"12#!s"%yrase!%q1073"!a"$bout"$esqn""ms"$rawi#"o1""sa"#ua-%(coloured%%decor%%green',
+    '%$link%&mammal\'$rine%\'planing)$ning%$soil%&velvet$%batic%$last$$cade%&ontact&"ol$!d$$eous$#fin',
+    '%$lyte%"un$#glo%$uard$(intances$$lash%"og%%unged(#ing(!s$$mixa$$naut(!s$&phobes%%laned',
+    '(!y%$rivy$)resistant%!i&)a/siporax\'%n/new&#um-)$kept)%sized$$safe&"ve%%caped)-r/vibrascaper%#eal%#oil',
+    '%%plash&$orts%$tats$$tade%\'echnics%&ically&#nta("ed%#one$#vac##iar$\'escence$!l%"a.&"ea',
+    '&#fer&\'na-ross\'"us%"us$!n%$atis$$ring%"re$\'sitions$#ver!.r&aacute;khova#&eacute#$plus"!\'#"nt',
+    '#"n)#"o)"!+"#-15#%ch-er#$lott#+ran-ge-ment%$zzaq$$ifai"".d#"ii"#/ar#$home\'\'/travel""10',
+    '"#705$!6#"27#"35$!9"/a&rehy;approved#"an#)b-african%&backed%*designated%$held%)inhabited%&jewish%&killer%#led',
+    '%)sponsored&$tyle$"ah%"nk$+esque-style(#ing$%ia.he&!/&*n-financed\'!1(#n/a%)c-african\'.english-arabic\'\'speaker.!s',
+    '&"um%!n&#ose%!s&%ation&!e&#tan%$tion%&zation&"ed$*le-farming&&/grass\'(pastoral$*o-islamism#!c',
+    '&&donoyl)"yl&&odonic%&noidea*!s)$itus\'&logist-!s\'&maniac\'%phobe%#ova$)knophobia$$oeli$!y%&lation',
+    '%#nza$!e$!o#!e#*fat-husayn&!.#&gnouet$#on.&!a#"ja$!i#&kanese$%cheev#\'liaceae(#ous',
+    '$!y#*m-naharaim$%aeans%!h%+ic-speaking\'!k%!r$#bol$!e%#ans$$ians%$ntas%#tes#&n-knit%$type',
+    '&#bia$#dar&%spida$#gil&&o-ruiz$$more$)yaprathet#%pahoe%#ima#$rats#2sluokuoktastugorna$"on$"se#"te$$hion',
+    '$"or$%tlin\'$"us#%ucana$"na#"va%#lli$#ena#$waks$)et&eacute#"ys",b&eacute;ost#&ailles$\'lastier$#tov',
+    '%#ten\'\'rpartei()wohlfahrt&%geber&$samt\',gemeinschaft\'%kreis$-jdsformidling$!l%*&aacute;ez$!n$)tareparti-"et#4habhiramaagriculture#!i',
+    '$%kfini$!n%"as$$tary%,er-president%!r&(age-free)"rs)!s\'#ria*!n\'%tione+#the(#or.*&s-dual',
+    '#&laster\'!s#$nori#$onne$&retums&"us%%field%(iculture&$form&"te&&zation%&ophile##reu#+ur&uacute;a$$stum',
+    '"(c&eacute#(-en-ciel$%light$&shaped$&trench$&welder#!.#//foreland-basin$$node#)achidonic&"on$)de-action&%owner%#iae\'"na',
+    '$!l%"is$$nely(0&rehy;enunciated%$gues$"ri$"ti#!c#%elona$"ri#3h&aacute;eologiques&-uml;ologische%.eacute;ologues%1rehy;conservative%(yuml;tas',
+    '&\'ppeaser%&backed\'(mboozler\'\'seliner&$ebop&%ishop&#oss%+capitalists&\'haplain&)ompetitor\')nspirator&%ritic&$ynic%\'deacons\'\'magogue',
+    '%(exponent%)favourite%&gallic&#uru%(heretics&*umiliators%)ideologue&\'llusion&,ntrospective%+kinnockites%&lector&#ike%*minimalist%(opponent-!s',
+    '&+ractitioner\'\'iestess+!s\'\'oponent&(ublicist%%rebel%(smuggler&(ocialist&)quanderer&&upport,!s%+thatcherite&#ory%\'weirdos\'!t',
+    ')!s%&emenid&+o-astronomy(*geographic\'%cetes(\'yathids\'*entomology\'&lgists(3ogically-homogenous+$sing*&y.just\'%metry\'&pteris,!x\'$zoic',
+    '%+ic-sounding\'#ism&&onomia&$zing%%mbaud)"lt%\'ngelica)!o)(sk-based($tica%*stropecten$*bishopric-$,conservative$&deadon%\'ioceses',
+    '$*eaological+#sts%%moros%$nemy&%field%%ology%&r/cpag\'-paediatrician\'\'swindon\'*thamesdown&"io%"st%)typically(%ology%\'xponent',
+    '%\'-humble%!a&&nnelid&!s%#bad&&enthic%#cad&)hauliodes%-d&aacute;0mos&$amos("us&%onate%"e.&!f&)piscopacy',
+    ',!i,"us.!.%!l%)mandrites&%boldo&#ede("ia%\'pelagic&-i&eacute;lago%#tal&*ect-author*&client*(in-chief*%owner',
+    '))/designer2!s)%onica.#lly-!s*)oralooral*!r)+s/engineers+#who)#ual,"ly*4ral/buildings/record-)ly-unique+"e--,independence',
+    '-$risc,1/buildings/record-$home-\'network-(planning,(scribble*!s&#ype%(v+light+&$aria&&e-type&$ing.),/destruction\'&sation("t.',
+    '))s/records&#olt$#lin%#ute(!s%.y-conservative$(mandrite&$ster$"ol%&n-list\'$year&#tes$$poet%&riests$%rival',
+    '%#ops$#uar$%yield#%iduca$$gram$&mbolde)!i$$noma$%rcius##lid%#ght#!m$%inute#(olectric$$pata',
+    '#&s-bios$%econd%$rver$&tation*"-1#(tic-cold\'$like\'\'weather$&ogadus%"ns%%phila$%urans&#ean#$uata$&lation',
+    '#&welder"(d&egrave##\'ed#%-type$"up##ant$"wi#"bo%*e/moortown#%clach#&eatine$$bili$"ll%-ow-ar-ardelow%"ve',
+    '&!y%%istle%#lea%$nais)!e&,es-rhineland%\'te-like&"ia\'%ssimo$$otis$!r%$seir$$seir#$fern&!t',
+    '$"ff$$laun%+es/speaking$$nghi&#ton),/oxfordshire%$isle$"ti#6j/sbr/lif/scot.100/250#$keen#"le%-y/oxfordshire$*och-assynt#\'maleish$%inish',
+    '%%moyle%)ve-sanaig\'!.$#ish#%orous$$ssan$#uin%!s$$wnie$!z##res$"oe#.s-cliftonville%)glentoran$#ike',
+    '#\'talnaig$-eisimeireacht$&ornish$&ullagh#!u$#dwy$%ennae$"il%"ni$\'ousness#$view#&zinaba".e&mdash;always*%their#!\'',
+    '#"(i#*-beginning%\'uilding$"in&)sensitive$Fwe-going-to-have-a-season-or-aren\'t-we#".8$)compelled$"to#"/f$$mean$%would#!3#!_$#all',
+    '$"no$"on$"up#)a&mdash;.$!\'$!*$"-a&!s%(oriented%)promoting%*restricted&%uling%&shaded&\'pecific%%table',
+    '%(weighted$$.the$!/%&county%)equipment%&lounge%#old%&region%!s&$hape%&weight$*:2,381,741&"59%&volume$"dy',
+    '$"ll$1s&mdash;strategic%)--400,000&(leafield%!.&"in&$ps/c%%/more&\'nations&\'waiting#"by#!c$%a-box%$nuts$#ent',
+    '##ean$"da$"ty#/f:a/439/09/0492##gba#$ilza##ley$&igious$-lano-guillemo#!m##n\'t&T-over-protective-mothers-a-complete-pain-in-the-arse\'/you-sick-of-him&!.$.a&rehy;rockers',
+    '%+-compatible&&spaces%%ceous%$ria.$#con$&darski$!e%!s$&hoevel$%igian&!s%#tes$\'s-baker$"ts#"oi',
+    '$%polis$%space#%plain$\'repared#.quipe&ntilde;a#$scue$$enal$#nio$#ted%!i&!s#)t&ecirc;s$"es$%housa$#ine',
+    '$#rue#"us##v-3#!y"$ffin#)on/dwyfor%!s$!s#!s#\'ur-itic"*g&oacute;n$\'ucirc;s##185##525$!5',
+    '##ali$,ndo&ntilde;a%!t&&honius$!r$#sid$!w#+e&lacute;es$1l&eacute;s-gazost\'.grave;s-gazost%#ino$"mi%#one$!n%"is',
+    '&+eomarginata\'$rie.\'(uil-born*!e(!m&$icum\'#eri\'#na\')!*)\'-belize+%razil*"uk(\'e-based+#orn+(razilian',
+    '*%owned*)uruguayan)#ans($ian-,$born\'&venter$0rich/rabinovitch##han#"ia$(cultural$#los$,nine-glycine0)-aspartic)&nitric(!s',
+    '$#ves#%leses#$olic$-n-40/argon-39&&filled&)ion-laser&%xenon%#ath%!s$"ry$$sies%$toli%"ys#%ryris#&uament',
+    '$.e-particularly%&d-that&!.%#ing%%ments%"s*&!.$%fment%!y&#ing$\'ineguin&%gthat%!t$"le$)ment-free',
+    '*&topper(#all)(tiveness("s/*)ludicrous(!y$!n$%ssoft#)y-bargies$#ll.$)ranthemum-!s%!e%"ol%"us',
+    '#%alien##iba##old#&ythmia(!c)"al+"ly"+i&egrave;ge#!\'#&a-like%/recitative-aria$&bignes$!k%!e$"nd',
+    '%!o$%rames\'#nes$#zos#$bert#!c$"an$#cia$!h$!i%!a#(d-loving$\'isation%$ties$#jis',
+    '#$eans$!h$#lle$"ns%"ti$$ttes&!y#)fa/mother$!f%"in##ghi%!o$#oni#!k$"ha',
+    '$!d#"ma%&ddeyya%%spian*!s%%thaea#!n$%agour$%bjorn$#ori#&odante$&mardos$"us$&vistus#$pand',
+    '$$arum$"ed%%s_out%"th$)ing&mdash\'!.%$tide$$leus$&otelis$!s$!t%,&oacute;bulo%!.%&agoras%#ech',
+    '&"ra%%idhou\'"is&"on%,o-plutocracy&$cacy\'"op\'%racy.+,/bourgeoisie)&t-hero*+ic/military(&itters&&lochia,$ceae&$nike',
+    '&$tele*#ian).ian-scholastic-$type#"ta$"es$!h%!m&$atic&)etic-bird+\'logical*!.*#all-&y-able*$ians',
+    ')#que)&sation&(ological+#sts$"st$!y##ves#!x#%yoshi#&zmendi$*ona-mexico"&jomari#%umand$#zah"&k-like',
+    '&!i&"on$\'lochori$*nsas-based$#utz#,ell/chairman\'\'planner$!n$$stra$!t#"hi%\'tektura$#und##lay$"e.',
+    '##sey##tel##udi#%worth"!l#.&eacute;sienne#$anda$%thorp#(ecchinos$#dge$"e-$(s-period%$ians$"tt&"az',
+    '#!i$"ck$%ngham&$toll%!o#"on#$ston#!y"(m&eacute$)rehy;lock)$rest#&-aches\'#ing$%badge&#sed',
+    '$(flapping$%holes$)in-arming$$less%%inked$(over-leg$\'patches%"it$&setter%%hells%#pan(!s%)tretching\'#ong$%waver',
+    '#"6l##_so#%adail%&illoes&!o$/geddon-inspired%*h-richhill&!/$"la%#ine%!y$$ndur%$gual%%ishly$"ta',
+    '%#eur%&hwaite%!o&$rius%#toe%$uras#\'barring$&laster*!s#+chair-sized(!.#\'e-leute$,d-resistance)%ponse%!e',
+    '$.nf&uuml;rsorge%#gol%%iacum\',n-controlled&!e%)o-turkish$#rer%#ian#%guard#!i$#del$$eder%"s.$4ger/headmaster/crypt\'!s',
+    '$"ia$#jah$#nas%"do%"gs%#ium$!s%#ted&$izio$-tage/daughter*%ealer)#mrs)&oxford%#raj%%stead',
+    '$$oads##oir&"es$)natherapy%#ico&#osa%$keys$%orgum$#rel%#ing%"og$.ur&rehy;plated&&-chelu\'%laden\'%plate',
+    '&&.these&\'cabbies&$flex&$less&%plate*#ing&!s#"pc$)it-length#)s\'-length$!-%&akimbo%(building%*controller%&export',
+    '%&folded\'\'r-drugs%&lovers%&makers%+procurement%\'runners%)stretched&%upply%)to-saddam&&rading%*wellington$./drugs-dealing%%waist$$tead%#ong',
+    ')*-whitworth)\'/inmate*&trader)"ii#&thorpe$\'wisting#+y&mdash;jna+\'provide+#the,!o$!-%)appointed%\'blanket%)dominated%(escorted',
+    '%(inspired%$like%%owned%%party\'%yment&%olice%%short&$ized%#tax&"he$".3%#and%#you$%/afhq%%navy/',
+    '&(ropagate$$1539$$6pts$!e$)gdaloides"$nage$"nd&"er$%outis$!r%4fj&ouml;r&dstrok;3ur%#son$!t$)ud-garcie((uillaume',
+    '%"ts$!z#&dstein$*t-wonacott##e\'t$#bia$%metia$*tt/general$!z##ham%"ra&!t$0em-elst-nijmegen#$ildo$#son',
+    '#"ki#+o&scaron;ts$(ld-baker&*/arthritis\'$city($rash\'&oxford\'&treaty&#_in&!i\'!a&!s\'$tein%!f&!o',
+    '$"st$0tt-job/licensing&!s$#uld$$wsky#%sat-1$.ide-silverdale$$tadt#\'tzenius#\'ulfings\'#sta*!s%!l%"ph$#m-1',
+    '"&obieke#$eira#"ff#$gast#"id$"nt#"ll#)m-essence$(a-filled%!n%"t.&*herapeutic&+ic-aromatic(#ity("um',
+    '\'"ze%&vision$"el#*ndissement$%freed$#ite$%sists%+on/clinical\'$ists##ond#!p#%sward#&tmatic##u.d$!a',
+    '$"n\'%!a%)d&pound;3&&-arran\'%kevin&$.the*"re$!s%#al.%"e\'&+d&mdash;and&!r\'!s#"va#!w',
+    '#)-rar-ping#*a-berkeley$!l##ege%%giate*!s\'\'o-based)&figure/!s("ne)!i$!l$"nt&!s#!i',
+    '#!m#"us"%quala$$eros%!s&&busade"*r&ecirc;te#!\'#+-ange-ments$&tistic#!.#\'abiatta%"le$&ctions$*g&atilde;o',
+    '$,ign&eacute;e\'#ing$"le$/mpicatopitheque$(n-beaton&$knit%,ge&rehy;ment\'$able\')ment-wise+!.+&s-that\'*r/composer&-ing/extending%!s$$sses',
+    '$\'wdatayn$&y-like%#ing#%ears.$(ndamento%!t&"ed$*st&mdash;a&#/in\'+prosecution&$ants\'$tion&#ed.\'"es&#in\'',
+    ')"ly$!t$#wes$!y$!z#$gghh#(hephoroi#+i&egrave;ge,"re.(-vassaux$!a%$gada$!d$"el%"ns',
+    '&"ty$$goni$$kala$%ngton%#son$%ortua$\'s-totle%!e$(v&eacute%%al.35\'*/departure\'0s&mdash;veterans(+/departures&"no%"e.',
+    '\'+erla-cherie&!r&+s/delivered&"tz#!o$"jo$\'manches$$nale$#rat$#ser%$pide)*&mdash;see$"w-&&debreu&$fast',
+    '&%heads&&marked&%sharp($ower\'\'traight&&thwack\'"ip)!s%./vintage/rowan%$crab\'#oft%&graphs%+head-shaped)!.%/smith/organiser',
+    '%!y$$yabe#!r$"gh##uda$"pe$"ti#&ythmia"+s&egrave;ne#$acid$#kov$"la#"ch$"ot#%dalen',
+    '$!\'$+-about-face%#end%%holes%$kick)#ers)#ing%$lick)#in\'%#nil%\'quaking$0/scouse/canaries$$flap$\'gripper$,hole-stopper',
+    '%#ick(#ing$\'nal(*2)\'*-liverpool()sponsored\'(/norwich(#qpr\'!1\'!4\'$s_so%)ic&lowbar\'%-rich&#des&"je&!s',
+    '$#ole$#way\'!s%#ipe$!y##hat#\'ia-tika$"er$#nal%!g$#zio#!k#&mtrong#$nell#*on-related',
+    '##ten".t&iacute;stica$)mdash;for$\'ocirc;t#+*enterprise#!-$$2000$,appreciation$\'because%\'usiness$&centre%%ities%*ollections)"ge&\'nscious',
+    '&\'co-type($rate%\'irected$&expert*!s$$fart%&or-art\'"ms%%rance$\'gallery$"im%!s$)jewellery$$less%$over',
+    '&\'rketing$%noise&&nsense$&object%+n-the-walls%\'riented$,philanthropy%#unk$\'related$\'student$\'teacher)#ing%$heft%&o-wear$\'workers',
+    '#".1%!4$"24%!5%!6%!8$!3%!1$"48$!5$!7$#iii#\'/design$-entertainment$\'glasgow',
+    '*%-watt$"no$&oxford$+photography$\'science$#the#"93#!a$%bazos$!l%#dus$%monov$!n%#gel$$palo',
+    '$%serse#%books##can$#hil##ech$!e$/fact-orientated$$lier$!m%$esai%#ide(#ros$!n%$tion$#ria',
+    '&(ographic\'#sus&#tis%*y-clogging$%sania#&ficial$*ully-poled)\'smudged)&worded#"ha%"rd%\'shastra%"ud$&eritus$"ie',
+    '$$opod$$rath((-dudwick%!i&\'tically(#des)"is(&s-like)!.%&opathy\'$hyta\'%lasty\'\'od-like,$nked)!a',
+    '*#zed$)ur/thames&#iad$!y#&i-lamp$$cair%&boreal%%ifial%-le-by-article\')s/letters)&series)\'threads%%olata%!s%+u&rehy;late',
+    '&,lat&rehy;ing)!a)#ecy*"d\')\'ionists))ory-level)"us$#est$\'factsin(#ual%,icial-flower+%heart+(sounding*"ia*.ly-inseminated',
+    '."it-(produced*(sounding(#els\'"um$#gas$%llary&*ery-making,!n*%piece*&shells$$ness$#oli%!s$-san\'-producer',
+    ')$raft()dominated($like\'#ale\'"ry%*t-approved\')craftsman(\'um-poet)&rators\'&dancer(\'esigned(%octor\'(engraver\'$hero\')in-school',
+    '\'(jeweller\'*legislator\',manqu&eacute(\'usician\',philosophers\'#run\'&wallah(%riter-!s&#.38&%/band(&ooking\'(designer\'-muse/feminist\'$poet',
+    '.!s\'&writer&&colour&,ic-cinematic(!.(.ally\'-designed,*-conceived,!.&$ries&-s/craftswomen(0dealers/auctions\'#_as$!x#$mann#$ound',
+    '$#unk#$rage$!o#*s&rehy;and$"-a&)nd-crafts%&budget%.for-scientists&%unded)#ing%*orientated+"ed%\'related%\'science&)pectacles',
+    '$*/aesthetic%\'charles&\'ultural%+documentary%*humanities$$cape%$ribe$\'imovich$#man$$pace$&vashen#$uras$$shof%!i##vin',
+    '#,yst&omacr;ne#\'zvashen"%uanus#,ba&mdash;see%%naase#"ca%#ria##ged#$lius#&m-like$)ainayagam#"na%&chalam$"co$+del-trained',
+    '%$hati%\'inaceum$!s#!r$!u#)sha-moshi#!z"!v#&anitis#\'edladze$$iler$%llous$-rnien/journey$#yda#!i',
+    '&"on$"nd%!s$%ragus%!e#+on/observer#!s#$ydas"&wen-37%$nack"&yanism#%eetey#!l$(ammonium%$tion',
+    '##ton"%zberg#&obispo$\'umanian#!t#!u!1s&rehy;sociations"#\'ad$!s"$-100#!4#!6#(and-when%!y##din',
+    '$$t-is&1used-to-be-played#"mx#(of-right#$rich#%salih%\'marra\'i%$ttar$#ize$\'uddenly%$rani#$they$!r#/yet-unannounced)$born',
+    '+(termined))explained)(hardened)*identified)%named)&proven*(ublished)&titled$)ou-please"%.350d#"5s#"7s"#/90#"bs#"in',
+    '##tmj$!o"#100#"10#"40""20#"75"$3000"#400#!1""68"(_,_as_if)&t_were("of("to',
+    '(\'well_as%+you_as_well#3as_far_as_as_far_as&"if&"of\')pposed_to&&though\'!o&\'well_as#*er_,_as_to&,er_as_though&"of&"to&$well%%m_for',
+    '#$good#/it_,_as_it_were&\'were_so#4long_as_,_as_long_as#/soon_as_soon_as#"up#7well_as_er_,_as_well_as+\'well_as(%er_as("in"#aba$#ere##das$!o##kku',
+    '$"ra$#usa##lam$$uyeh#"ma$#oah##nas$!g$"ka$!o$$siki$&tehene$#uma##pah$$hids',
+    '$!o#&taryan$$iani$!s#&vahame#$zuma"$ball##ell$+stos-cement)(infected)$like+#ned)\'removal#!s##ury',
+    '&./toxoplasmosis#!y"$cain$(ridoidea$!t#&encion%$d-21&&ance-y)\'y-class&#ed.\'#nce&(ing-node%&scioun&$ione)!s',
+    '%)t-descent&#.we&&ionist,!s$$ptic$!r$,tic-esoteric\'$ally&"sm#!h$"as$)elminthes#&i/ansi$%dians$&i-ansi',
+    '%!s$!l%#ine#!j#\'lepeion&#iad)#ean(!n(!s\'#eia\'"os$%ipius#!o$%chyta$*m/timeplex',
+    '$!n$)rbic-acid$\'t-bound$#ugh#(riptives$#yum#$yrum""dc##ics",ean-european&)indonesia&)sponsored&&united#!c$#ond',
+    '#)ismically#$llio%"us#"ma$"ia$"pa#$nal.$"by$#cio$%demic$#ior$#oth#$psis#!r$#ies',
+    '$$sing#"ts#!v"#far#$orby%!d$"ur#*v-infected"!g#$arby%\'dweiler#&erjorn"(h\'arites#&-blond$#can',
+    '\'%oured&%vered$$dull$&filled$\'grained$\'handled$$like&#lac$$pile&"ts$\'sharqat&%irawi&#ura%\'trapped$%white',
+    '##a\'a$!f$!i$%ke-up$!m%!d$%nadan%"gi$%riyah$#way#$bank%#ugh$#ory%"wl$)rook/open',
+    '$\'urndale##can&!s$#her%#uch$*ombe/owner##den$2own/leader/liberal#&e/king$!d$"ly$&n-blue%!d%$hill$$rman',
+    '$"ya#*ford-based\'\'/father(&kidney(\'rebekah*\'porting\'"by&"th#$gari%"te$%rove.##ibi$"ne&"ss%$gdon',
+    '$!t#&kenasi\'#zia)!c(1y/perlman/harrell$%habad$$urak#%lands%"rs$!e%)y-coopers&\'/driver\'+grandmother$#ing$"yn',
+    '$$odai%.lean/taylorian\'"um%(re/heart(%media#!o$"ka$#nai$#rne$!u$#ver##pan$$itel$+lant/former$*ole/bungee',
+    '()tightrope%"ol#\'rafiyeh&!s%"ms$(ef/owner##tal%$roth$%eroth$$iany%!p$0on-in-makerfield\'/under&rehy;hill&&/event\'$west',
+    '$(rays-had%"ee#)urbanipal%"ov#$vale#$wick#(yadhyayi"&i-tere#*a&iacute;n$(-america%%first%%north$*/australia$#_as$"go',
+    '%)-ancestry&)mauritian&(oriented)#gin%)/oriental&\'western%%books$\'tskhikh#%c/pal$"om#!d$$ates$#ing$!s#!e',
+    '#"le#!m$%ovian#%nelli$#gle$#ius##odu#!r#%sakid"#jes"(k-closer$%price#"21#"_a$)on_behalf',
+    '$,m-in-furness$#rov#%eaton$\'d-about&#her%&/spoke$$nder$!o$!r%$nish$"th$\'w/tears#&henazi#$ians$"ba',
+    '\'%price&\'_a_good&!s$#val#"ja#&lepios$#und##ole$!s"$laby$%mazov$"ug#\'eep.3,4$!y#%immer',
+    '%!e#\'ocillin%$kton#"so$!q#%umber"#mah$!l%"yk$*ra-massawa$"th#!f$)/marriner##ore#!s',
+    '##175#"ah##ele#!i$+&egrave;res#$ooze#!t"$o-so#&ciacon&$lity&%tions#+ftly-softly##gwa#"ke#"la',
+    '#%nides%"ti#*p&oacute;s$#hus#"sa#"ya"%p-306##237$!6#"38#$5033#(aragines\')us-seller)%oides%$etic',
+    '&%urian&"yl%&ukhova$#tia#&ecific%\'t-ratio&!o&.s&ndash;before$#gic$\'l-laden%!.%!l$%ndale$!r%"en',
+    '&"il(%losis%"ne%"sa%$tini$%ttare$!y#-halt-surfaced\')erer-over\'#ing\'!s$$eric$(ixiation$\'odeline(!s',
+    '##ide$*r&rehy;ing%,a&rehy;tions&!s&$ting($ons.\'#ors%\'iations&"n\'##lan&!d$$enii(&-folio\'"um$#und',
+    '#\'orgenic%%tatis#$rawl$$ilio%"ng"\'quarius$%eroso$.ithian-liberal"#r.3##aam#!i#"oc#!s"\'s-bones$&driver',
+    '$$hole$#mar%#eat##.co##aad &bayyud',
 )
@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_89 = (
+count_89 = 6694
+
+heads_89 = (
     'a.m.s.',
-    'a.m.u.',
-    'a.macmasteri',
-    'a.maritima',
-    'a.n.c.',
-    'a.n.f.',
-    'a.n.l.',
-    'a.n.other',
-    'a.n.r.',
-    'a.nicosia',
-    'a.nijsseni',
-    'a.o.',
-    'a.o.a.',
-    'a.o.r.',
-    'a.p.f./mill',
-    'a.p.j.',
     'a.p.t.',
-    'a.p.t.james',
-    'a.p.u.',
-    'a.person',
-    'a.piece',
-    'a.r.b.',
-    'a.r.c.',
-    'a.r.g.',
-    'a.r.p.s.',
-    'a.r.penck',
-    'a.r.wallace',
-    'a.s.a',
-    'a.s.b.',
-    'a.s.l',
-    'a.s.m.e.',
-    'a.s.o.',
     'a.s.y.1.u.m',
-    'a.sessilis',
-    'a.shell',
-    'a.some',
-    'a.staircase',
-    'a.streetwalker',
-    'a.t.j.',
-    'a.t.v.',
-    'a.understanding',
-    'a.v.r.',
-    'a.villa',
-    'a.volz',
-    'a.w.a.c.s.',
-    'a.w.o.l.',
-    'a.why',
-    'a.wilson',
     'a/00/20/0001',
-    'a/00/20/0002',
-    'a/00/20/0003',
-    'a/00/20/0004',
-    'a/00/20/0005',
-    'a/00/20/0007',
-    'a/00/20/0008',
-    'a/00/20/0010',
-    'a/00/20/0011',
-    'a/00/20/0012',
-    'a/00/20/0013',
-    'a/00/20/0014',
-    'a/00/20/0015',
-    'a/00/20/0016',
-    'a/00/20/0017',
-    'a/00/20/0018',
     'a/00/20/0019',
-    'a/00/20/0020',
-    'a/00/20/0021',
-    'a/00/20/0022',
-    'a/00/20/0023',
-    'a/00/20/0024',
-    'a/00/20/0025',
-    'a/00/20/0026',
-    'a/00/20/0028',
-    'a/00/20/0103',
-    'a/00/25/0003',
-    'a/00/25/0005',
-    'a/02/28/0001-1',
-    'a/08/25/0001',
-    'a/09',
-    'a/09/25/0006',
     'a/09/25/0008',
-    'a/09/25/0012',
-    'a/09/25/0013',
-    'a/09/25/0016',
-    'a/1',
-    'a/16/25/0001',
-    'a/16/25/0002',
-    'a/23/32/0004',
-    'a/23/32/0016',
-    'a/23/32/0017',
-    'a/23/32/0021',
-    'a/23/32/0022',
-    'a/23/32/0024',
-    'a/23/32/0025',
-    'a/23/32/0028',
-    'a/23/32/0029',
     'a/23/32/0032',
-    'a/23/32/0033',
-    'a/23/32/0034',
-    'a/23/32/0035',
-    'a/23/32/0036',
-    'a/27/63/0001',
-    'a/33/2',
-    'a/33/25/0004',
-    'a/33/25/0011',
-    'a/33/25/0026',
-    'a/33/25/0032',
-    'a/33/25/0035',
-    'a/33/25/0036',
-    'a/33/25/0039',
-    'a/33/25/0042',
-    'a/33/25/0046',
     'a/33/25/0047',
-    'a/33/25/0048',
-    'a/35/25/0002',
-    'a/35/25/0007-1',
-    'a/38/26/0011',
-    'a/4',
-    'a/44/25/0013',
-    'a/44/25/0018',
-    'a/44/26/0005',
-    'a/8',
-    'a/al',
-    'a/az',
-    'a/b-hybrid',
-    'a/cn.9/265',
-    'a/d',
-    'a/g=c',
     'a/her',
-    'a/me',
-    'a/o',
-    'a/o/r/c',
-    'a/party',
-    'a/sew',
-    'a/shanghai',
-    'a/singapore',
-    'a/the',
-    'a/though',
-    'a/type',
-    'a0-a7',
-    'a01',
-    'a02',
-    'a0620&ndash;00',
-    'a0620-00',
     'a09',
-    'a1&ndash;a3',
-    'a1&ndash;a8',
-    'a1-bloody-mighty',
-    'a1-plus',
-    'a1.5',
-    'a1/',
-    'a1/a2',
-    'a1/m62/m1',
-    'a1/y1',
-    'a10-u25',
-    'a100m',
-    'a1033',
-    'a1044',
-    'a1049',
-    'a1058',
     'a1066',
-    'a1120',
-    'a1127',
-    'a113',
-    'a1192&ndash;01',
-    'a1214',
-    'a1253',
-    'a131',
-    'a13123',
-    'a133',
-    'a134',
-    'a139',
-    'a148',
-    'a149',
-    'a1501/89(t1093)',
-    'a1528/89(t1102)',
     'a153',
-    'a154',
-    'a16-199',
-    'a16-year-old',
-    'a16.50',
-    'a166',
-    'a169/a170',
-    'a177',
-    'a178',
-    'a179',
-    'a181',
-    'a185',
-    'a198',
-    'a1m',
-    'a1s',
-    'a2&mdash;001',
     'a2&mdash;100',
-    'a2-a4',
-    'a2-a6',
-    'a2.1',
-    'a2.4',
-    'a2037',
-    'a21/a2100',
-    'a2100',
-    'a23/m23',
-    'a2317',
-    'a23187-stimulated',
-    'a24',
-    'a2431',
-    'a2482/89(t1102)',
-    'a249',
-    'a250',
     'a2507/89(t1097)',
-    'a258blv-5085n',
-    'a26(france)',
-    'a260/280',
-    'a264',
-    'a267',
-    'a271',
-    'a272',
-    'a273',
-    'a275',
-    'a275.',
-    'a29',
-    'a299',
-    'a2:a53',
-    'a2b5-coated',
-    'a2c4e2',
     'a2pl',
-    'a3\'s',
-    'a3(2)',
-    'a3-a4',
-    'a3-c2-b4-a6',
-    'a3.t14\'',
-    'a3/m25',
-    'a3/y3',
-    'a3000',
-    'a302',
-    'a3066',
-    'a310',
-    'a310-300',
-    'a310s',
-    'a316',
-    'a321s',
     'a33',
-    'a338',
-    'a34/m4',
-    'a34/oxfordshire',
-    'a344/a360',
-    'a345',
-    'a346',
-    'a3531/89(t1104)',
-    'a3532/89(t1101)',
-    'a36',
-    'a360p',
-    'a37',
-    'a386',
-    'a399',
-    'a39ac',
-    'a3:5\'-ggaaatttggagcctactgag-3\'',
     'a3i:5\'-cagacgccatacaactgcac-3\'',
-    'a3m',
-    'a3x/ah4',
-    'a4+',
-    'a4-a5-a6',
-    'a4-and-a-bit-on-the-side',
-    'a4.00',
-    'a4/y4',
-    'a40/oxfordshire',
-    'a401',
-    'a4031',
-    'a404',
-    'a4041',
-    'a4042',
-    'a4043',
-    'a4059',
     'a4067',
-    'a40s',
-    'a410',
-    'a4107',
-    'a413',
-    'a4130',
-    'a4136',
-    'a419',
-    'a424',
-    'a432',
-    'a433',
-    'a449',
-    'a451',
-    'a453',
-    'a466',
-    'a47409',
     'a483',
-    'a493',
-    'a5-a49',
-    'a5-size',
-    'a5.38m',
-    'a5.5',
-    'a5/a55',
-    'a5/m42',
-    'a5025',
-    'a505',
-    'a5096',
-    'a5105',
-    'a513',
-    'a515',
-    'a5152',
-    'a517',
     'a52-35',
-    'a5223',
-    'a523',
-    'a53',
-    'a534',
-    'a542',
-    'a564',
-    'a570',
-    'a590',
-    'a592',
-    'a593',
-    'a5i:5\'-gcaggcctgggatacggatc-3\'',
-    'a6(m)',
-    'a6-2',
-    'a6007',
-    'a6089',
     'a6091',
-    'a60s',
-    'a6106',
-    'a6116',
-    'a623',
-    'a625',
-    'a63',
-    'a635',
-    'a636',
-    'a637',
-    'a639',
-    'a643',
-    'a646',
-    'a656',
-    'a664',
-    'a692',
     'a697',
-    'a698',
-    'a6a',
-    'a6m5',
-    'a6m8',
-    'a7+',
-    'a7/a8',
-    'a7/y7',
-    'a700',
-    'a702',
-    'a706',
-    'a707',
-    'a708',
-    'a71/b7031',
-    'a73&ndash;39',
-    'a73&ndash;40',
     'a73&ndash;57',
-    'a755',
-    'a758',
-    'a76',
-    'a77003',
-    'a7e7',
-    'a8&ndash;a10',
-    'a8+',
-    'a8/y8',
-    'a814',
-    'a83',
-    'a836',
-    'a84',
-    'a856',
-    'a86/d86',
-    'a867',
     'a872',
-    'a883',
-    'a887',
-    'a89',
-    'a890',
-    'a894',
-    'a896',
-    'a9\'',
-    'a9/24',
-    'a937',
-    'a941',
-    'a950',
-    'a96',
-    'a981',
-    'a985',
-    'a:0,25',
     'a:expand.exe',
-    'a:not-a',
-    'a:qbasic.ex&mdash',
-    'a:qbasic.hl&mdash;c',
-    'a:qbasic.in&mdash',
-    'a:share',
-    'a:x',
-    'a=0.505',
-    'a=0.999',
-    'a=421',
-    'a=53.56',
-    'a=average',
-    'a=b=',
-    'a=b=111.4',
-    'a=b=121.35',
-    'a=c',
     'a=d',
-    'a=less',
-    'a=openout',
-    'a_',
-    'a_,_been_a_bit',
-    'a_,_do_a_little',
-    'a_,_for_a_,_for_a_,_a_few',
-    'a_,_for_a_few',
-    'a_,_he\'s_a_bit',
-    'a_,_he_had_a_,_he_had_a_,_a_lot',
-    'a_,_i\'m_a_bit',
-    'a_,_is_a_,_a_lot',
-    'a_,_with_a_little',
-    'a_a_,_a_few',
-    'a_a_a_few',
-    'a_a_great_deal',
     'a_bit_sort',
-    'a_brand',
-    'a_coup',
-    'a_er_a_little_bit',
-    'a_great_to_do_a_great_deal',
-    'a_i_can_think_of_a_few',
-    'a_it\'s_a_bit',
-    'a_just_a_few',
-    'a_l&agrave',
-    'a_little_',
-    'a_little_at',
-    'a_matter_of',
-    'a_matter_of_fact',
-    'a_on_a_bit',
-    'a_quite_a_few',
-    'a_rock',
     'a_there\'s_a_lot',
-    'a_treat',
-    'a_you_get_a_little',
-    'aa&ndash;8',
-    'aa+ba',
-    'aa-9',
-    'aa/23/32/0004',
-    'aa/23/32/0016',
-    'aa/23/32/0017',
-    'aa/23/32/0021',
-    'aa/23/32/0022',
-    'aa/23/32/0024',
-    'aa/23/32/0025',
-    'aa/23/32/0028',
-    'aa/23/32/0029',
-    'aa/23/32/0032',
     'aa/23/32/0033',
-    'aa/23/32/0034',
-    'aa/23/32/0035',
-    'aa/23/32/0036',
-    'aa/33/25/0042',
-    'aa/avis',
-    'aa2',
-    'aa4',
-    'aaa-rated',
-    'aaa.gct.tcc.att.tta.ggt.tgt',
-    'aaa/aaa',
-    'aaa2',
-    'aaa3',
-    'aaaaa-rated',
-    'aaaaaaaaaaaaaaahhhhhhhhhhhhhhhhhhh',
-    'aaaaaaaaaagh',
     'aaaaaaaaoooooooooow',
-    'aaaaaaah',
-    'aaaaaaarrrrgh',
-    'aaaaaagh',
-    'aaaaaah',
-    'aaaaaggghhh',
-    'aaaaagh',
-    'aaaaargh',
-    'aaaaarrrggghhh',
-    'aaaack',
-    'aaaages',
-    'aaaaoooo',
-    'aaaarg',
-    'aaaarghh',
-    'aaaarghhh',
-    'aaaarrggghhh',
     'aaaaw',
-    'aaab',
-    'aaaeeeyaaa',
-    'aaaghhh',
-    'aaaghrrr',
-    'aaah&mdash',
-    'aaahs',
-    'aaal',
-    'aaarrgghhh',
-    'aaarrghhhh',
-    'aaarrree',
-    'aaarrrrhhhhhh',
-    'aaarrrrrrrrggggggghhhhhhh',
-    'aaatgctgactaaggaacaaggt',
-    'aaawww',
-    'aaba',
     'aabb',
-    'aabba',
-    'aabbcc',
-    'aabbccdd',
-    'aabcc',
-    'aaby',
-    'aac(n)',
-    'aacr2-compatible',
-    'aacr2-conformant',
-    'aacr2r',
-    'aacs',
-    'aadd',
-    'aademodontoidea',
-    'aaeeeyurrgghaaaaaaaaaaaahhhhhhh',
-    'aagaard',
-    'aagagag',
     'aaggatccgtcgacatc',
-    'aaggatccgtcgacatcgataatacgactcactataagggattttttttttttttttt',
-    'aagghh',
-    'aagghhh',
-    'aagttcttatgtgtgaag',
-    'aah-tishoo',
-    'aahhhh',
-    'aahhhhhhhhh',
-    'aahhing',
-    'aahng-ung-ung',
-    'aai&uacute;n',
-    'aaie',
-    'aake',
-    'aalenian',
-    'aalsmeer',
-    'aalstreep',
     'aalto',
-    'aan',
-    'aandoo',
-    'aann',
-    'aanonsen',
-    'aaorrgh',
-    'aaow',
-    'aapam',
-    'aapo',
-    'aapso',
-    'aarango',
-    'aardman',
-    'aards',
-    'aarg',
-    'aarghh',
-    'aaronis',
     'aaronovitch',
-    'aaronvitch',
-    'aarp',
-    'aarrow',
-    'aarvold',
-    'aasfjord',
-    'aasociation',
-    'aass',
-    'aaswdu',
-    'aat.cca.ccc.at',
-    'aata',
-    'aatgctaatgccaacaatgctg',
-    'aathin',
-    'aats',
-    'aaughh',
-    'aayamuguchi',
     'aaz',
-    'aazella',
-    'ab&icirc;me',
-    'ab-bracket',
-    'ab-sent',
-    'ab.',
-    'ab/alleghany',
-    'ab11',
-    'ab2-type',
-    'ab313',
-    'ab41',
-    'ab419',
-    'ab43',
-    'ab57',
-    'ab910',
-    'ab:cb',
     'aba\'a',
-    'ababababa',
-    'ababababcccdcd',
-    'ababba',
-    'ababcdc',
-    'abac/babc',
-    'abaca',
-    'abacaba',
-    'abacada',
-    'abaci',
-    'abaconian',
-    'abacus-for-brains',
-    'abad-tempered',
-    'abadeh',
-    'abadi',
-    'abado',
     'abak',
-    'abakanowicz',
-    'abakhumov',
-    'abakonowicz',
-    'abal',
-    'aballi/zamora',
-    'abalone/pearl',
-    'aban',
-    'abana',
-    'abanazer',
-    'abancay',
-    'abanda',
-    'abandoned-in-transit',
-    'abandoned.l',
-    'abandoned/ignored',
-    'abandonemtn',
     'abanindranath',
-    'abanji',
-    'abano',
-    'abanu',
-    'abanumaque',
-    'abara',
-    'abarim',
-    'abarrister',
-    'abart',
-    'abases',
-    'abasha',
-    'abashum',
-    'abasic',
-    'abasin',
-    'abasto',
-    'abat-jour',
     'abat-jours',
-    'abatahun',
-    'abatellis',
-    'abatted',
-    'abaxial',
-    'abayas',
-    'abaza',
-    'abazah',
-    'abb&eacute;ville',
-    'abba-dagnaw',
-    'abbabashti',
-    'abbacadabra',
-    'abbacourt',
-    'abbaesque',
-    'abbagnales',
-    'abbaside',
     'abbasids',
-    'abbasminister',
-    'abbass',
-    'abbassids',
-    'abbassy',
-    'abbassyia',
-    'abbaswaqfs',
-    'abbatangelo',
-    'abbatial',
-    'abbatibus',
-    'abbatini',
-    'abbatoirs',
-    'abbattoir',
-    'abbazia',
-    'abbeduto',
-    'abbemuseum',
     'abberations',
-    'abberley/worcestershire',
-    'abberleys',
-    'abberrant',
-    'abbey-church',
-    'abbey-gates',
-    'abbey/cavendish',
-    'abbeylands',
-    'abbeyleix',
-    'abbeymore',
-    'abbeyshrule',
-    'abbies',
-    'abbitt',
-    'abblitt',
-    'abbot/devon',
-    'abbot/headteacher/pittville',
     'abbot/protest',
-    'abbot:2.20',
-    'abbotabad',
-    'abbotrule',
-    'abbots/gloucestershire',
-    'abbotsey',
-    'abbotsholme',
-    'abbotside',
-    'abbotsonians',
-    'abbott-compton',
-    'abbott-inspired',
-    'abbott/association',
-    'abbott/pre-admissions',
-    'abbotts/gloucestershire',
-    'abboud',
-    'abboxry',
     'abbregement',
-    'abbreviata',
-    'abbreviatedly',
-    'abbreviation.',
-    'abbreviatory',
-    'abbreviatum',
-    'abbs/roller',
-    'abc-harris',
-    'abc-style',
-    'abc-the',
-    'abcabcabc',
-    'abcda',
-    'abcde',
-    'abcess',
-    'abchasicus',
-    'abchurch',
     'abcott',
-    'abczynski',
-    'abd&uuml;laziz',
-    'abd\'el',
-    'abd\'ul-kerim',
-    'abd-ar-rahman',
-    'abda',
-    'abdali',
-    'abdalla',
-    'abdallah&gt',
-    'abdallahi',
-    'abdaly',
-    'abdehamid',
-    'abdel-baqi',
-    'abdel-fattah',
-    'abdel-ghani',
     'abdel-hadi',
-    'abdel-hamid',
-    'abdel-jabber',
-    'abdel-maguid',
-    'abdel-majid',
-    'abdel-mohsin',
-    'abdel-qader',
-    'abdel-rahim',
-    'abdel-razzaq',
-    'abdel-wahab',
-    'abdelfattah',
-    'abdelhadi',
-    'abdelhak',
-    'abdelkarim',
-    'abdelmajid',
-    'abdelmoumem',
     'abdelrahim',
-    'abdelrahman',
-    'abdelrasik',
-    'abdelwahab',
-    'abdelzar',
-    'abdenour',
-    'abderahim',
-    'abderezzak',
-    'abdes',
-    'abdeslam',
-    'abdessalam',
-    'abdessalem',
-    'abdick',
-    'abdiel',
-    'abdildin',
-    'abdirrahim',
     'abdisalam',
-    'abdnouri',
-    'abdolhassan',
-    'abdomen-straining',
-    'abdominoprineal',
-    'abdoulay',
-    'abdoulgassin',
-    'abdoulkerim',
-    'abdrahmane',
-    'abdrupt',
-    'abducted-by-aliens',
-    'abductee',
-    'abduction/of',
-    'abducts',
-    'abdul-\'aziz',
-    'abdul-dahab',
     'abdul-hamid',
-    'abdul-haq',
-    'abdul-hosn',
-    'abdul-wahhab',
-    'abdulah',
-    'abdulhamid',
-    'abdulhashim',
-    'abduljabbar',
-    'abdulkhashim',
-    'abdullah-owned',
-    'abdullahplanning',
-    'abdullashim',
-    'abdullodzhanov',
-    'abdullojanov',
-    'abdullrahim',
-    'abdulmalik',
     'abdulojonov',
-    'abdulraham',
-    'abdulrakhim',
-    'abdurachman',
-    'abdurahim',
-    'abdurraham',
-    'abdyl',
-    'abecor',
-    'abed-nego',
-    'abede',
-    'abednego',
-    'abeet',
-    'abef',
-    'abeid',
-    'abeilles',
-    'abekas',
     'abeking',
-    'abel&eacute',
-    'abele',
-    'abeles',
-    'abelesz',
-    'abelian',
-    'abeline',
-    'abeliuk',
-    'abella',
-    'abella*',
-    'abelsoftware',
-    'aben',
-    'abenalfarax',
-    'abendberg',
-    'abendblatt',
-    'abenddammerung',
     'abendruh',
-    'abendstern',
-    'abenefited',
-    'abenomatous',
-    'abensour',
-    'aber.',
-    'aberaman',
-    'aberarth',
-    'aberbrothick',
-    'abercanny',
-    'abercarne',
-    'aberceiro',
-    'aberchirder',
-    'abercombie',
-    'abercrave',
-    'abercrombie-like',
     'abercwmboi',
-    'abercywyn',
-    'aberdares',
-    'aberdeen+',
-    'aberdeen-inverness',
-    'aberdeen/glasgow-plymouth',
-    'aberdeen/lerwick',
-    'aberdeens',
-    'aberdeenshire-based',
-    'aberdenn',
-    'aberdonense',
-    'aberech',
-    'aberedeen',
-    'aberedw',
-    'aberfedly',
-    'aberffrau',
     'abergeirw',
-    'abergele-based',
-    'abergwili',
-    'abergwyngregyn',
-    'aberhosan',
-    'aberle',
-    'aberlessie',
-    'aberllong',
-    'abermort',
-    'abernithy',
-    'aberrance',
-    'aberrances',
-    'aberrant\'',
-    'aberrational',
-    'aberrhigian',
-    'aberthow',
     'abertridwr',
-    'aberuthven',
-    'aberystwyth-chester-birmingham',
-    'aberystwyth-manchester',
-    'aberystyth',
-    'aberyswyth',
-    'abesamis',
-    'abesement',
-    'abessole',
-    'abetalipoproteinaernia',
-    'abete',
-    'abeted',
-    'abetter',
-    'abetting-',
-    'abettor',
-    'abetts',
     'abeyance.',
-    'abeyewickreme',
-    'abeygoonasekara',
-    'abeysekera',
-    'abf',
-    'abf&auml;lle',
-    'abg',
-    'abgar',
-    'abhal',
-    'abhall',
-    'abhandlungen',
-    'abhay',
-    'abhidhamma',
-    'abhomynaciouns',
-    'abhorr&egrave;d',
-    'abhorrences',
     'abhuman',
-    'abhumans',
-    'abhy&amacr;sa',
-    'abi-compatible',
-    'abi-compliant',
-    'abi/bsa',
-    'abiang',
-    'abiar',
-    'abiathar',
-    'abiaw',
-    'abidine',
-    'abidingly',
-    'abidjan-matin',
-    'abidjan.',
-    'abietis',
-    'abiezer',
     'abigdor',
-    'abigne',
-    'abihu',
-    'abiko',
-    'abil',
-    'abilio',
-    'abilitating',
-    'abilites',
-    'abilities.',
-    'abilities.7',
-    'ability-grouping',
-    'ability-orientated',
-    'ability-range',
-    'ability-wise',
-    'ability/disability',
-    'ability/impairment',
     'ability/willingness',
-    'abill',
-    'abilty',
-    'abilugan',
-    'abimaq',
-    'abimbola',
-    'abinee',
-    'abing',
-    'abinghall',
-    'abio-energetic',
-    'abiog',
-    'abiogenesis',
-    'abiotically',
-    'abiru',
-    'abishai',
-    'abitante',
     'abitibi',
-    'abito',
-    'abitovabore',
-    'abitunentenzeugnis',
-    'abiy',
-    'abk',
-    'abl-brp',
-    'abla',
-    'ablark',
-    'ablates',
-    'ablating',
-    'ablations',
-    'able&mdash',
-    'able-',
-    'able-bodied/disabled',
-    'able-labels',
     'able.aa',
-    'able.ab',
-    'able.ac',
-    'able.s01',
-    'able.s02',
-    'able/unable',
-    'ablegatus',
-    'ableism',
-    'ablemarle',
-    'ableson',
-    'abliguritor',
-    'ablington',
-    'abljs',
-    'ablondi',
-    'abloom',
-    'ablur',
     'ablute',
-    'ablythe',
-    'abmaj7',
-    'abmaphd',
-    'abms',
-    'abnd',
-    'abnegated',
-    'abneget',
-    'abnorm',
-    'abnormal-normal',
-    'abnormalis',
-    'abnormalities.',
-    'abnormals',
-    'abnout',
-    'abodala',
-    'abodrites',
     'aboe',
-    'abolarin',
-    'abolendam',
-    'abolfazi',
-    'abolie',
-    'abolish&rehy;ing',
-    'abolished&mdash;the',
-    'abolished.it',
-    'abolishment',
-    'abolition/emancipation',
-    'abolition_of',
-    'abolqassem',
-    'aboltins',
-    'abominable-entered',
-    'abominates',
-    'abonae',
     'abond',
-    'abondano',
-    'abondio',
-    'aboo',
-    'aboon',
-    'abor&rehy;tion',
-    'aboratory',
-    'aborbing',
-    'aboriginese',
-    'aborning',
-    'aborted-by',
-    'aborted.',
-    'abortion-causing',
-    'abortion-decision',
-    'abortion-on-demand',
-    'abortion.',
     'abortioned',
-    'abortionism',
-    'abos',
-    'abotrite',
-    'abotsbery',
-    'abotsi',
-    'abotu',
-    'abouchdid',
-    'aboue',
-    'aboul-ela',
-    'aboundeth',
-    'about&mdash;that',
-    'about-',
-    'about-my',
-    'about-so',
-    'about-them',
     'about-to',
-    'about-to-be',
-    'about-to-be-ex-lit-ed',
-    'about-to-be-ex-wife',
-    'about-to-be-murdered',
-    'about-to-burst',
-    'about-to-go-on-holiday',
-    'about-to-open',
-    'about-to-retire',
-    'about.is',
-    'about.the',
-    'about/this',
-    'about0.5',
-    'about4',
-    'about_rather',
-    'aboute',
     'abouturn',
-    'aboutwhy',
-    'abouty',
-    'above&mdash',
-    'above&rehy;mentioned',
-    'above\'/',
-    'above-',
-    'above-all',
-    'above-and-beyond',
-    'above-averagely',
-    'above-board-well',
-    'above-boot',
-    'above-discussed',
-    'above-equilibrium',
-    'above-indicated',
-    'above-it-all',
     'above-listed',
-    'above-normal',
-    'above-noted',
-    'above-party',
-    'above-quoted',
-    'above-stated',
-    'above-the&rehy;average',
-    'above-the-ruck',
-    'above-the-water',
-    'above-window',
-    'above.d',
-    'above.discussion',
-    'above.they',
-    'above/',
-    'above/below',
-    'above/would',
     'above/yet',
-    'above14,550',
-    'above:paul',
-    'aboveboard',
-    'abowte',
-    'aboxcd1',
-    'aboyne-based',
-    'abp',
-    'abpi',
-    'abqar',
-    'abquaiq',
-    'abra(ha)m',
-    'abrabam',
-    'abracadata',
-    'abrachmanova',
-    'abracos',
     'abraha',
-    'abrahamian',
-    'abrahamic',
-    'abrahamsson',
-    'abrahmsohn',
-    'abraira',
-    'abramovich',
-    'abramsky',
-    'abramsohn',
-    'abramtsevo',
-    'abrash',
-    'abrawang',
-    'abraxas',
-    'abrdn',
-    'abreact',
-    'abreskov',
     'abrey',
-    'abridgments',
-    'abriefhistoryoftime',
-    'abrines',
-    'abrinia',
-    'abroad-in',
-    'abroad-notably',
-    'abroad-on',
-    'abrogado',
-    'abrokomes',
-    'abrooks',
-    'abrose',
-    'abrotanifolium',
-    'abroziak',
-    'abrs',
-    'abruption',
     'abrutal',
-    'abruzzesi',
-    'abs-modulated',
-    'abs:in',
-    'absa\'tze',
-    'absalon',
-    'absaroke',
-    'abscence',
-    'abscent',
-    'abscessing',
-    'abschied',
-    'abschirmdienst',
-    'abscissic',
-    'abscission',
-    'abscondings',
-    'abseil.',
     'abseilling',
-    'absen',
-    'absence(s)',
-    'absence/presence',
-    'absense',
-    'absent\'',
-    'absent-for',
-    'absent-without-leave',
-    'absenteeism.',
-    'absentia',
-    'absently.',
-    'absentmindedness',
-    'absestos',
-    'absey',
-    'abshir',
-    'absidal',
     'absinity',
-    'absinthum',
-    'absluley',
-    'absolue',
-    'absolutamente',
-    'absolute\'',
-    'absolute-zero',
-    'absolute/relative',
-    'absolutely-other',
-    'absoluteno',
-    'absolutest',
-    'absolutisms',
-    'absolutist\'',
-    'absolutive',
-    'absolutized',
-    'absolutizes',
     'absolvo',
-    'absorb.',
-    'absorbable',
-    'absorbances',
-    'absorbant',
-    'absorbedand',
-    'absorbent.',
-    'absorbents',
-    'absorbers/regenerators',
-    'absorbin\'',
-    'absorbption',
-    'absorptio-metrically',
-    'absorptiometric',
-    'absorption-stripping',
-    'absorption/24',
-    'absorption/emission',
     'absorptionof',
-    'absotption',
-    'abstentionism',
-    'abstentionists',
-    'abstract-figurative',
-    'abstract-sounding',
-    'abstract/concrete',
-    'abstract/realist',
-    'abstractedness',
-    'abstractible',
-    'abstraction-',
-    'abstractionists',
-    'abstractual',
-    'abstraktes',
-    'abstrusely',
-    'absue',
     'absurd-cum-behaviourist',
-    'absurd-looking',
-    'absurda',
-    'absurde',
-    'absurder',
-    'absurdo',
-    'absurds',
-    'absus',
-    'absw/glaxo',
-    'abswap',
-    'absymal',
-    'absynthii',
-    'abta-bonded',
-    'abta/atol',
-    'abtalion',
-    'abteiberg',
     'abteilungen',
-    'abteilungsrechner',
-    'abtion',
-    'abts',
-    'abu\'l',
-    'abu-2',
-    'abu-ghazala',
-    'abu-salih',
-    'abu-suer',
-    'abu2(nh)',
-    'abu2nh',
-    'abubacar',
-    'abubaker',
-    'abubakkar',
-    'abudefduf',
-    'abudget',
     'abuelita',
-    'abuif',
-    'abul-abbas',
-    'abuladze',
-    'abuleia',
-    'abulla',
-    'abun',
-    'abunch',
-    'abundance-bringers',
-    'abundance.',
-    'abunded',
-    'abundence',
-    'aburahamon',
-    'abus',
-    'abusable',
-    'abuse\'',
     'abuse-related',
-    'abuse.1',
-    'abuse_in',
-    'abused.',
-    'abusivis',
-    'abutement',
-    'abutendi',
-    'abutt',
-    'abuzayyad',
-    'abvailable',
-    'abverb',
-    'abverb\'',
-    'abysinian',
-    'abyss-like',
-    'abyssinia.',
-    'abyssinica',
     'abysssinia',
-    'abz',
-    'ac&amp;sharp',
-    'ac&rehy;quire',
-    'ac-',
-    'ac-10',
-    'ac-30',
-    'ac-47',
-    'ac-dc',
-    'ac-in',
-    'ac-pc',
-    'ac/173',
-    'ac/188',
-    'ac/750v',
-    'ac/acg',
-    'ac/dc-like',
     'ac1',
-    'ac10',
-    'aca-english',
-    'acab',
-    'acabus',
-    'acace',
-    'acacia-',
-    'acad&eacute;me',
-    'acad&eacute;micien',
-    'acad&egrave;mie',
-    'acadamy',
-    'academes',
-    'academi',
-    'academic&rehy;style',
-    'academic-centredness',
-    'academic-looking',
     'academic-only',
-    'academic-parliamentary',
-    'academic-philosophical',
-    'academic-territorial',
-    'academic-theoretical',
-    'academic-vocational',
-    'academic-year',
-    'academic/criminologist',
-    'academic/industrial',
-    'academic/research',
-    'academic/sociological',
-    'academic/specialised',
-    'academic/vocational',
-    'academically-gifted',
-    'academically-minded',
-    'academically-orientated',
     'academicking',
-    'academism',
-    'academjic',
-    'academy/dumfries',
-    'academy/leverhulme',
-    'academy/wolfson',
-    'academy12',
-    'academyish',
-    'acadia',
-    'acads10',
-    'acak',
-    'acalypha',
-    'acampora',
-    'acanthina',
-    'acanthocephalan',
-    'acanthocephalans',
     'acanthocytes',
-    'acanthodian',
-    'acantholysis',
-    'acanthomis',
-    'acanthus-leaf',
-    'acanthus-like',
-    'acapella',
-    'acarigua',
-    'acarnania',
-    'acarodomatia',
-    'acars',
-    'acarte',
-    'acaw',
-    'acbt-2/3/7/5',
-    'acbt-2/5',
-    'acbt-3/7',
     'acc-',
-    'accaattaaattatgaaa',
-    'accaattagattatgcaa',
-    'accaron',
-    'accastillage',
-    'acccident',
-    'acccommodate',
-    'accdient',
-    'accel-123',
-    'accelarazione',
-    'acceleration-60',
-    'acceleration/',
-    'accelerative',
-    'accelerometer',
-    'accellerating',
-    'accelr8',
     'accen',
-    'accent-perfect',
-    'accentuated-crested',
-    'accep-',
-    'accept&rehy;ance',
-    'acceptab',
-    'acceptable/full',
-    'acceptance(s)',
-    'acceptance-note',
-    'acceptance.',
-    'acceptance/usage',
-    'acceptances.',
-    'acceptant',
-    'accepted\'',
-    'accepters',
-    'acceptive',
     'accertamento',
-    'access&lsqb',
-    'access-',
-    'access-deficit',
-    'access-level',
-    'access-to-cash',
-    'access/mastercard/eurocard',
-    'access/use',
-    'access/visa/diners',
-    'accessary',
-    'accessble',
-    'accessed.',
-    'accessi&rehy;bility',
-    'accessibilities',
-    'accessibility/mobility',
-    'accession&gt',
     'accessit',
-    'accessor',
-    'accessories-tea',
-    'accessories.',
-    'accessoriser',
-    'accessorisers',
-    'accessorized',
-    'accessory&mdash;with',
-    'accessory-cooling',
-    'acci-hindiii',
-    'acciaccaturas',
-    'acciaiuoli',
-    'accid',
-    'accident&eacute',
-    'accident-',
-    'accident.both',
     'accident.confusion',
-    'accident.the',
-    'accident.they',
-    'accident/sickness',
-    'accident/system',
-    'accidentalists',
-    'accidents.',
-    'accidia',
-    'accidient',
-    'accidnet',
-    'accijnzen',
-    'accion',
-    'accipitres',
-    'accipitridae.',
-    'accis',
-    'accius',
     'acclaim/rover',
-    'acclerator',
-    'acclimations',
-    'acclivities',
-    'acclom',
-    'accodata',
-    'accoding',
-    'accolis',
-    'accolta',
-    'accom&rehy;plish',
-    'accom&rehy;plished',
-    'accomadation',
-    'accommodation&mdash;assistance',
-    'accommodation.the',
-    'accommodation/toilets',
-    'accommodationism',
     'accommol',
-    'accomo',
-    'accomodata',
-    'accomodations',
-    'accomp',
-    'accompa&rehy;nies',
-    'accompagny',
-    'accompaniment.',
-    'accompaniment/stage',
-    'accompanist-wife',
-    'accompanued',
-    'accompli',
-    'accompli\'',
-    'accomplish-measuring',
-    'accomplished&mdash;the',
-    'accompte',
     'accomulation',
-    'accord&mdash;which',
-    'accorded.',
-    'accorden',
-    'accorder',
-    'accordian',
-    'accordians',
-    'according\'',
-    'according_er_to',
-    'accordinge',
-    'accordinglie',
-    'accordinly',
-    'accordion-bashing',
-    'accordion-folded',
-    'accordion-player',
-    'accordionists',
     'accosta',
-    'accostic',
-    'accot.',
-    'accou',
-    'accoucheur',
-    'accoun&rehy;temps',
-    'account&rehy;ants',
-    'account-by-account',
-    'account-has',
-    'account-holder(s)',
-    'account.if',
-    'account/password',
-    'account6',
-    'account_of',
-    'account_on',
-    'accountability/',
     'accountable.',
-    'accountacy',
-    'accountanc\'sy',
-    'accountancy/customer',
-    'accountancyis',
-    'accountant\'s-eye',
-    'accountant-led',
-    'accountant/',
-    'accountant/md',
-    'accountants/banks',
-    'accountants/systems',
-    'accountholders',
-    'accounting\'',
-    'accounting-dictionaries',
-    'accounting-oriented',
-    'accounting-wise',
     'accounting/book-keeping',
-    'accounting/commercial',
-    'accounting/financial',
-    'accountingfor',
-    'accounts\'',
-    'accounts-related',
-    'accounts-system',
-    'accounts.macari',
-    'accounts/administration',
-    'accounts/forecasts',
-    'accounts/statutory',
-    'accounts/stockbroker',
-    'accountswhere',
-    'accous',
-    'accout\'red',
-    'accoutants',
     'accouterments',
-    'accra-north',
-    'accrediaton',
-    'accreditation/recognition',
-    'accreditisation',
-    'accretative',
-    'accretional',
-    'accretive',
-    'accroachment',
-    'accrochage',
-    'accrochages',
-    'accruable',
-    'accrual-type',
-    'accruals-based',
-    'accruals-type',
-    'acct.',
     'acctcom',
-    'accu-clear',
-    'acculturative',
-    'accummulated',
-    'accumula',
-    'accumulate.',
-    'accumulated.',
-    'accumulation/activity',
-    'accumulator-and-store',
-    'accumulator-to-accumulator',
-    'accumulator.',
-    'accumulattion',
-    'accunet',
-    'accupuncturist',
-    'accurate/up-to-date',
-    'accurately&rehy;mounted',
     'accurately-bored',
-    'accurately-measurable',
-    'accurately-timed',
-    'accurately.',
-    'accuratge',
-    'accurist',
-    'accurred',
-    'accurs',
-    'accursius',
-    'accusal',
-    'accusation.',
-    'accuscan',
-    'accused\'',
-    'accused.',
-    'accusin\'',
-    'accustions',
     'accustomably',
-    'acd',
-    'acde',
-    'ace-compatible',
-    'ace-compliant',
-    'ace-funded',
-    'ace-high',
-    'ace-inhibitors',
-    'ace-king',
-    'ace.',
-    'ace/agit',
-    'ace/arc',
-    'ace/arc-compliant',
-    'ace/chemical-resist',
-    'aceite',
-    'aceldama',
     'acellularity',
-    'acentral',
-    'acentric',
-    'acentury-old',
-    'acephale',
-    'acephalous',
-    'acepromazine',
-    'acept',
-    'acer/altos',
-    'aceramic',
-    'acerarc1',
-    'aceratus',
-    'acerbic-looking',
-    'acerbities',
-    'acerenza',
-    'acerero',
     'aceriales',
-    'acerpower',
-    'acerra',
-    'acertained',
-    'acertcm',
-    'acetabula',
-    'acetal/styrene/ester',
-    'acetaldehye',
-    'acetamide',
-    'acetaria',
-    'acetate-koh',
-    'acetate/pyridine/',
-    'acether',
-    'aceticism',
-    'acetification',
-    'acetoacetylation',
     'acetoarsenite',
-    'aceton',
-    'aceton-precipitated',
-    'acetone-cleaned',
-    'acetum',
-    'acetyl-ala-ala-pro-ala-amc',
-    'acetyl-ala-ala-pro-ala-amidomethylcoumarin',
-    'acetylaminosalicylic',
-    'acetylase',
-    'acetylate',
-    'acetylating',
-    'acetylcholin',
-    'acetylcholine-receptor-inducing',
-    'acetylenic',
-    'acetylhydolase',
-    'acetylides',
     'acetyls',
-    'acetyls/solvents',
-    'acfion',
-    'acfis',
-    'acgaattagattatgaaa',
-    'acgaattagattatgcaa',
-    'acgca/tgcg',
-    'acgs',
-    'acgt',
-    'achaanak',
-    'achaboun',
-    'achacachi',
-    'achada',
-    'achaeans',
-    'achaemeniann',
-    'achaeus',
     'achaians',
-    'achaimenes',
-    'achaius',
-    'achallader',
-    'achamore',
-    'achamou',
-    'achanarras',
-    'achar',
-    'achare',
-    'acharyaforests',
-    'acharyaland',
-    'achashverosh',
-    'achatine',
-    'acheilles',
-    'acheilognathi',
-    'acheived',
     'acheivement',
-    'achellies',
-    'achenbaum',
-    'aches.',
-    'acheter',
-    'achh',
-    'achi',
-    'achiba',
-    'achiee',
-    'achieng',
-    'achiev',
-    'achievability',
-    'achieved&mdash;see',
-    'achieved_by',
-    'achieveing',
-    'achievement&rehy;oriented',
     'achievement-full',
-    'achievement-orientated',
-    'achievement.',
-    'achievemnt',
-    'achievieng',
-    'achievments',
-    'achil',
-    'achili',
-    'achillean',
-    'achinbowie',
-    'achived',
-    'achmedijn',
-    'achmet',
-    'achnaba',
-    'achnaclaiche',
-    'achnahaird',
     'achnanthes',
-    'achnasheen-achanalt',
-    'achnelith',
-    'achonachie',
-    'achondraplasia',
-    'achondritic',
-    'achondroplasia',
-    'achong',
-    'achord',
-    'achortle',
-    'achr-like',
-    'achray',
-    'achrome',
-    'achromes',
-    'achromobacter',
-    'achselschwang',
     'achterland',
-    'achterman',
-    'achurch',
-    'acicularis',
-    'acid&mdash',
-    'acid\'n\'art',
-    'acid-alcohol',
-    'acid-citrate-dextrose',
-    'acid-cleaned',
-    'acid-dropping',
-    'acid-edta',
-    'acid-eluted',
-    'acid-extractable',
-    'acid-extracted',
-    'acid-forming',
-    'acid-gas',
     'acid-gobbling',
-    'acid-green',
-    'acid-green-yellow',
-    'acid-head',
-    'acid-igneous',
-    'acid-levels',
-    'acid-lovers',
-    'acid-mediated',
-    'acid-na2hpo4',
-    'acid-neutral',
-    'acid-phenol',
-    'acid-rain-causing',
-    'acid-reacting',
-    'acid-seared',
-    'acid-sensitive',
-    'acid-sprayed',
     'acid-stimulated',
-    'acid-sweet',
-    'acid-trip',
-    'acid-water',
-    'acid-weirdness',
-    'acid/alcohol',
-    'acid/alkali',
-    'acid/mercury',
-    'acid/ml',
-    'acid/phospholipid',
-    'acid:distilled',
-    'acid:formaldehyde',
-    'acid=6:3:1',
-    'acidication',
-    'acidification.',
-    'acidifiedwith',
     'acidifier',
-    'acidifiers',
-    'acidifies',
-    'acidising',
-    'acidities.ever',
-    'acidity-alkalinity',
-    'acidity/alkalinity',
-    'acidproof',
-    'acidul&eacute;es',
-    'aciegodefence',
-    'acieved',
-    'acii',
-    'aciieed',
-    'acilius',
-    'acing',
-    'acinonyx',
     'aciodophilus',
-    'acireale',
-    'acisclo',
-    'acistrate',
-    'acitity',
-    'acitivities',
-    'acivity',
-    'ack&rehy;nowledging',
-    'ack-acking',
-    'ack-tor',
-    'ackapella',
-    'ackcherly',
-    'ackehurst',
-    'ackemman',
-    'ackerit',
-    'ackerleys',
     'ackermonious',
-    'ackers/regional',
-    'ackert',
-    'ackham',
-    'ackling',
-    'acklington',
-    'acklom',
-    'acknell',
-    'ackney',
-    'acknoweldge',
-    'acknowledg',
-    'acknowledge.',
-    'acknowledged-in',
-    'acknowledges.',
-    'acknowledgment.',
-    'acknowlegment',
     'ackowledge',
-    'ackowledgement',
-    'ackroydiana',
-    'ackte',
-    'acktewrally.',
-    'aclet',
-    'aclm',
-    'aclr',
-    'acm-129',
-    'acme24',
-    'acmes',
-    'acmh',
-    'acmin',
-    'acml',
-    'acne-free',
-    'acne-necked',
     'acne-protection',
-    'acne-type',
-    'acnpv-infected',
-    'acocks',
-    'acoherent',
-    'acoirn',
-    'acomadation',
-    'acommadation',
-    'acompanied',
-    'acompline',
-    'aconacagua',
-    'aconitum',
-    'aconservation',
-    'aconsumer',
-    'acontract',
-    'acontroversial',
     'acop.',
-    'acord',
-    'acording',
-    'acording_to',
-    'acorn-fed',
-    'acorn-full',
-    'acorn-headed',
-    'acorn-worm',
-    'acorn.',
-    'acorss',
-    'acorte',
-    'acot',
-    'acott',
-    'acount',
-    'acounted',
-    'acounting',
     'acourt',
-    'acousmatique',
-    'acoustic-equivalence',
-    'acoustic-phonetics',
-    'acoustic.',
-    'acoustic/electric',
-    'acoustically-driven',
-    'acousticaster',
-    'acousticubes',
-    'acoustiguide',
-    'acoustique/musique',
-    'acousto-optical',
-    'acousto-optics',
-    'acoustoicube',
-    'acp/ih',
-    'acqquisition',
     'acquaintance\'',
-    'acquaintence',
-    'acquantance',
-    'acquaqueta',
-    'acquarelle',
-    'acquasac',
-    'acquaynt',
-    'acqueous',
-    'acquiantances',
-    'acquiesed',
-    'acquire/purchase',
-    'acquired.',
-    'acquired/improved',
-    'acquiree',
-    'acquisition-proof',
-    'acquisition-rich',
     'acquisition/procurement',
-    'acquisitioning',
-    'acquisitons',
-    'acquistion',
-    'acquistions',
-    'acquittances',
-    'acqusition',
-    'acr-mcr',
-    'acrawl',
-    'acre-feet',
-    'acre-foot',
-    'acre/',
-    'acres.',
-    'acres/180&ndash;200',
-    'acrid-tasting',
-    'acrida',
     'acridinium',
-    'acridly',
-    'acritarch',
-    'acroceolites',
-    'acrocephalus',
-    'acrocyanosis',
-    'acrodelphidae',
-    'acrodelphids',
-    'acrolectal',
-    'acroloxus',
-    'acromegalic',
-    'acromegalics',
-    'acromion',
-    'acronym-slinging',
-    'acronym-speak',
-    'acronym-to-acronym',
     'acronymed',
-    'acronymically',
-    'acronymics',
-    'acronymously',
-    'acrophobia',
-    'acrophobic',
-    'across&rehy;country',
-    'across-class',
-    'across-country',
-    'across-section',
-    'across-the-atlantic',
-    'across-the-bored',
-    'across-the-fence',
-    'across-the-range',
-    'acrowhatsits',
-    'acrss',
     'acru',
-    'acru/guy',
-    'acrucial',
-    'acrylamide/bisacrylamide',
-    'acrylamide:bisacrylamide',
-    'acrylamide:n',
-    'acrylan',
-    'acrylate-',
-    'acrylates',
-    'acrylic-10%',
-    'acrylic-dentine',
-    'acrylic-fibres',
-    'acrylic/glass',
-    'acrylo',
-    'acs.',
-    'acsc',
     'acsigning',
-    'acsin',
-    'acsni',
-    'acssi',
-    'act&mdash;finance',
-    'act(1986)-date',
-    'act(s)',
-    'act-alike',
-    'act-finale',
-    'act-of-creation',
-    'act-style',
-    'act.4',
-    'act.gareth',
-    'act/distribution',
-    'act_in',
-    'actable',
     'actally',
-    'actaully',
-    'actd',
-    'actea',
-    'actellic',
-    'acteur',
-    'acti-vities',
-    'actilyse',
-    'acting-back',
-    'acting-director',
-    'acting-knowing',
-    'acting-space',
-    'acting/taking',
-    'acting_as',
-    'actinian',
-    'actinin-type',
     'actinium',
-    'actinodoscus',
-    'actinolite',
-    'actinomycete',
-    'actinomycetin',
-    'actinomycin-',
-    'action*',
-    'action-',
-    'action-after-the-event',
-    'action-cube',
-    'action-descriptions',
-    'action-development',
-    'action-facilitating',
-    'action-figure',
-    'action-filled',
-    'action-leeds',
     'action-like/state-like',
-    'action-modelled',
-    'action-plan',
-    'action-rationality',
-    'action-replay',
-    'action-rose',
-    'action-scenes',
-    'action-seeking',
-    'action-show',
-    'action-statues',
-    'action-structure',
-    'action-taking',
-    'action.if',
-    'action.ps',
-    'action.tonight',
-    'action.yetdoctors',
     'action/',
-    'action/adventure',
-    'action/after',
-    'action/control',
-    'action/equal',
-    'action/granada',
-    'action/over',
-    'action/reflection',
-    'action/support',
-    'actionbook',
-    'actione',
-    'actionist',
-    'actions&mdash;defences',
-    'actions&mdash;that',
-    'actions(c)',
-    'actions/measures',
     'actions/words',
-    'actionwise',
-    'actis',
-    'activatd',
-    'activatedness',
-    'activation-inhibition',
-    'activation-synthesis',
-    'activation.',
-    'activation/',
-    'activator/',
-    'active-duty',
-    'active-elderly',
-    'active-issues',
-    'active-looking',
-    'active-low',
-    'active-minded',
     'active-region',
-    'active-ride',
-    'active-still',
-    'active/causal',
-    'active/contemplative',
-    'active/male',
-    'active/reflective',
-    'actively\'',
-    'actively-focused',
-    'actively-seeking-work',
-    'activenitrogen',
-    'activepage',
-    'activex',
-    'activi',
-    'activi&rehy;ty',
-    'activies',
     'activin',
-    'activist&rehy;or',
-    'activists-turned-officers',
-    'activists.',
-    'activit&eacute',
-    'activit&eacute;s',
-    'activities.',
-    'activities/description',
-    'activities/jobs',
-    'activities/products',
-    'activities_once',
-    'activition',
-    'activitis',
-    'activitites',
-    'activity&rehy;based',
-    'activity-',
     'activity-dependence',
-    'activity-in',
-    'activity-induced',
-    'activity-no',
-    'activity-rates',
-    'activity-supporting',
-    'activity.the',
-    'activity/angle-strain',
-    'activity/coach',
-    'activity/involvement',
-    'activity/purity',
-    'activity/reduction',
-    'activity/relaxation',
-    'activity_in',
-    'acto',
-    'actor-dancer',
     'actor-demosthenes',
-    'actor-husband',
-    'actor-murderer',
-    'actor-neighbour',
-    'actor-participants',
-    'actor-president',
-    'actor-speak',
-    'actor-turned-producer',
-    'actor-turned-writer',
-    'actor-wankers',
-    'actor/fine',
-    'actor/manager',
-    'actor/president',
-    'actor/singer',
-    'actor/soundtrack',
-    'actors.',
     'actors/events',
-    'actraphane',
-    'actress-dancer',
-    'actress-mother',
-    'actress-singer',
-    'acts/bills',
-    'acts_in',
-    'acttm',
-    'actu\'lly',
-    'actua',
-    'actualar',
-    'actualising',
-    'actualist',
-    'actualizable',
-    'actually-',
-    'actually.it',
     'actually_rather',
-    'actuance',
-    'actuaral',
-    'actuarially-determined',
-    'actuarily',
-    'actuary-dominated',
-    'actuels',
-    'actully',
-    'acturial',
-    'actwould',
-    'acu-dunlop',
-    'acubol',
-    'acuerdos',
-    'acuff',
-    'acugen',
-    'acuired',
     'acuities',
-    'acuity/es',
-    'aculei',
-    'acuma',
-    'acumos',
-    'acuphobia',
-    'acupuncturist\'swith',
-    'acupunture',
-    'acus',
-    'acused',
-    'acussed',
-    'acustical',
-    'acute-on-chronic',
-    'acute-service',
-    'acuteand',
-    'acutegraft-versus-host',
     'acutes.',
-    'acutistriatum',
-    'acutorostrata',
-    'acwo',
-    'acwos',
-    'acxcumulation',
-    'acylcoa',
-    'acyually',
-    'aczel-pozsgay',
-    'ad&atilde;o',
-    'ad&eacute;lies',
-    'ad&eacute;mar',
-    'ad&egrave;s',
-    'ad&mdash;democratic',
-    'ad&rehy;minister',
-    'ad&rehy;ministered',
     'ad&rehy;mitted',
-    'ad+',
-    'ad-',
-    'ad-get',
-    'ad-hod',
-    'ad-land',
-    'ad-libber',
-    'ad-man',
-    'ad-men',
-    'ad-space',
-    'ad-spending',
-    'ad-team',
-    'ad-tech',
-    'ad-vich',
-    'ad-visor-y',
-    'ad.ed/borough',
     'ad/93/105',
-    'ad08',
-    'ad1100-1300',
-    'ad121',
-    'ad13,500',
-    'ad144,400',
-    'ad149,000',
-    'ad15',
-    'ad15/3200',
-    'ad158-9',
-    'ad16v',
-    'ad1752',
-    'ad176,000',
-    'ad189,500',
-    'ad1974',
-    'ad200',
     'ad249',
-    'ad253',
-    'ad253-60',
-    'ad270',
-    'ad286',
-    'ad300',
-    'ad312',
-    'ad350.',
-    'ad381',
-    'ad45',
-    'ad500',
-    'ad500-2000',
-    'ad525',
-    'ad537',
-    'ad54-68',
-    'ad570',
     'ad585',
-    'ad61',
-    'ad664',
-    'ad68-9',
-    'ad70',
-    'ad731',
-    'ad7528',
-    'ad77',
-    'ad8-style',
-    'ad800',
-    'ad82',
-    'ad857',
-    'ad900',
-    'ad960',
-    'ad965',
-    'ad_lib.',
     'ada-oriented',
-    'ada-related',
-    'ada/softbench',
-    'adabase',
-    'adabo',
-    'adado',
-    'adagia',
-    'adagio-like',
-    'adagios',
-    'adagp',
-    'adair/historian',
-    'adakites',
-    'adalberti',
-    'adalberto',
-    'adalia',
-    'adam\'sa',
     'adam-designed',
-    'adam-schw&auml;tzer',
-    'adam-schwaetzer',
-    'adam-style',
-    'adama',
-    'adamanat',
-    'adamastor',
-    'adamek',
-    'adament',
-    'adamic',
-    'adamiya',
-    'adamkus',
-    'adamon',
-    'adamovich',
-    'adamowicz',
-    'adams(1981)',
     'adams-bould',
-    'adams-morgan',
-    'adams-type',
-    'adams-webber',
-    'adams/award',
-    'adams/brewer',
-    'adams/chief',
-    'adams/david',
-    'adams/farmer',
-    'adams/hitchikers',
-    'adams/mother',
-    'adams/multiple',
-    'adams/raf',
-    'adams/scotland',
-    'adams/spider',
-    'adamsdown',
     'adamses',
-    'adamu',
-    'adan',
-    'adanas',
-    'adande',
-    'adangling',
-    'adante',
-    'adao',
-    'adapation',
-    'adapidae',
-    'adapso',
-    'adapt&eacute;s',
-    'adaptationist',
-    'adapted&mdash',
-    'adapted-to',
-    'adapter-director',
     'adapter-lens',
-    'adapter/a',
-    'adaptivity',
-    'adaptor-independent',
-    'adaptor/charger',
-    'adaquan',
-    'adarga',
-    'adaro',
-    'adasani',
-    'adastral',
-    'adauctus',
-    'adaventures',
-    'adaws',
-    'adaxial',
-    'adayoma',
-    'adaytum',
     'adaza',
-    'adbomen',
-    'adbominal',
-    'adbonimal',
-    'adbonnyshig',
-    'adbul',
-    'adcocks',
-    'adcs',
-    'add&rehy;on',
-    'add-a-plane',
-    'add-ed',
-    'add-list',
-    'add-to',
-    'add-up',
-    'add-ups',
-    'add-value',
     'addacs',
-    'addaie',
-    'addams-like',
-    'addawo',
-    'addax',
-    'addb',
-    'adddresses',
-    'added-on',
-    'added.although',
-    'adden',
-    'addenbrooks',
-    'adder\'s-tongue',
-    'adder-land',
-    'adder/and',
-    'adderley\'',
-    'addernoydle',
     'adderston',
-    'addheader.com',
-    'addi',
-    'addicoat',
-    'addicting',
-    'addiction.',
-    'addiction/inner',
-    'addictive.',
-    'addiewell',
-    'adding/deleting',
-    'addio',
-    'addios',
-    'addison-ross',
-    'addison.',
-    'addison/churchill',
-    'addit',
     'additio',
-    'addition-cured',
-    'additionals',
-    'additions.',
-    'additiorial',
-    'additive-based',
-    'additive/subtractive',
-    'additivity',
-    'additon',
-    'addle-brained',
-    'addles',
-    'addlesfield',
-    'addonix',
-    'addorsed',
-    'addp',
-    'addresed',
     'addreses',
-    'addresing',
-    'address&mdash;capt.j.c',
-    'address&mdash;rev.j.mcfadyen',
-    'address-holders',
-    'address/key',
-    'address/phone',
-    'address/postal',
-    'address/status/text',
-    'address:7',
-    'addressed.',
-    'addressed/resolved',
-    'addressee/participant',
-    'addresser-addressee',
-    'addresser-message-addressee',
-    'addressing.',
     'addressings',
-    'addressograph',
-    'addrest',
-    'adds-and-ends',
-    'adds.so',
-    'addu',
-    'adduce.',
-    'adduced.',
-    'adduct/10',
-    'adducts/',
-    'ade2',
-    'ade6',
-    'adebicarcinoma',
-    'adecrease',
-    'adedeji',
-    'adeem',
     'adeemed',
-    'adees',
-    'adegasn',
-    'adegunle',
-    'adekounti',
-    'adelaide\'',
-    'adelantados',
-    'adelantamiento',
-    'adelard',
-    'adelbrau',
-    'adeleine',
-    'adelekan',
-    'adelhard',
-    'adeli',
-    'adelie',
-    'adeliza',
     'adelphoe',
-    'adelwold',
-    'ademi',
-    'ademoa',
-    'ademonas',
-    'aden-based',
-    'adenanthera',
-    'adenau',
-    'adenet',
-    'adenfield',
-    'adenines',
-    'adeninide',
-    'adeno',
-    'adenocarcinomatous',
-    'adenocellular',
-    'adenomas.',
     'adenomcarinomas',
-    'adenosine-mediated',
-    'adenoviruses',
-    'adenyl',
-    'adepo',
-    'adeptio',
-    'adequal',
-    'adequaly',
-    'adequan',
-    'adequately-acted',
-    'aderdice',
-    'aderley',
-    'aderly',
-    'aders',
-    'adertising',
-    'ades',
     'adesok&mdash;democratic',
-    'adesso',
-    'adeste',
-    'adeus',
-    'adevarul',
-    'adewumi',
-    'adeyfield',
-    'adf&amp;g',
-    'adf/vor/vdf',
-    'adforton',
-    'adgestone',
-    'adh2*2',
-    'adh5',
-    'adhear',
-    'adherants',
-    'adhereing',
     'adherentes',
-    'adhesimole',
-    'adhesin',
-    'adhesion-inducing',
-    'adhesion-induction',
-    'adhesive-bonded',
-    'adhesive/sealant',
-    'adhesive/sealer',
-    'adhibit',
-    'adhikary',
-    'adhmaid',
-    'adhocracies',
-    'adhortatio',
-    'adhyatma',
-    'adiantums',
-    'adibo',
     'adick',
-    'adidas.',
-    'adide',
-    'adient',
-    'adigun',
-    'adikari',
-    'adikibi',
-    'adina',
-    'adine',
-    'adinia',
-    'adioynder',
-    'adioyning',
-    'adipadi',
-    'adipadigyi',
-    'adiposally-challenged',
-    'adiposity',
     'adipsin',
-    'adire',
-    'adis\'mother',
-    'adisok',
-    'adispute',
-    'aditex',
-    'aditional',
-    'adiunaku',
-    'adiuva',
-    'adiwa',
-    'adjacent-note',
-    'adjacent_er_to',
-    'adjaho',
-    'adjan',
-    'adjectives.',
-    'adjigon',
     'adjodhia',
-    'adjoint',
-    'adjou',
-    'adjoudi',
-    'adjoudji',
-    'adjount.',
-    'adjournal',
-    'adjourned-12.',
-    'adjudges',
-    'adjudication-take',
-    'adjudication.',
-    'adjuik',
-    'adjunction',
-    'adjunctively',
-    'adjure',
-    'adjust&rehy;ments',
     'adjusta',
-    'adjusted.',
-    'adjuster/stabiliser',
-    'adjustible',
-    'adjustices',
-    'adjusting.',
-    'adjustment&mdash',
-    'adjustment.18',
-    'adjustment/',
-    'adjustments.',
-    'adjuvandum',
-    'adkisson',
-    'adlercreutz',
-    'adlh2*2',
-    'admags',
-    'admap',
     'admical',
-    'admin\'',
-    'adminis',
-    'adminis&rehy;tered',
-    'administator',
-    'administraci&oacute;n',
-    'administraive',
-    'administrando',
-    'administraors',
-    'administrat-xxxx',
-    'administrate',
-    'administrati',
-    'administration&mdash;see',
-    'administration-backed',
-    'administration-based',
-    'administration-i',
     'administration-particularly',
-    'administration-sponsored',
-    'administration/distribution',
-    'administration/records',
-    'administrationem',
-    'administrationof',
-    'administrative-bureaucratic',
-    'administrative-class',
-    'administrative-law',
-    'administrative/business/clerical',
-    'administrative/clerical',
-    'administrative/service',
-    'administrative/student',
-    'administratively-convenient',
-    'administratively-oriented',
-    'administratives',
     'administrator-cum-personal',
-    'administrator-dominated',
-    'administrator/head',
-    'administrator/programmer',
-    'administrator/secretary',
-    'administrators-of',
-    'administratum',
-    'administred',
-    'administrix',
-    'admins',
-    'adminstered',
-    'admira',
-    'admiraal',
-    'admiral\'',
-    'admiral-general',
-    'admiralties',
     'admiralty-issue',
-    'admire.',
-    'admired&mdash;the',
-    'admirin\'',
-    'admisit',
-    'admissibility&lsqb;3&rsqb',
-    'admission(s)',
-    'admission.',
-    'admission/discharge',
-    'admission/review',
-    'admissions.this',
-    'admissus',
-    'admit\'',
-    'admit.',
-    'admited',
-    'admitred',
     'admits.',
-    'admittances',
-    'admittatis',
-    'admittedly-dwindling',
-    'admittedly.',
-    'admixed',
-    'admixes',
-    'admt',
-    'adnam',
-    'adnew',
-    'adnisus',
-    'adnormality',
-    'adobe-less',
-    'adobe-style',
-    'adobe/linotype',
-    'adobes',
     'adobi',
-    'adochi',
-    'adolescence-as-career-move',
-    'adolescences',
-    'adolescent\'',
-    'adolescent-grown-up',
-    'adolescentis',
-    'adolfoi',
-    'adollars',
-    'adolmiro',
-    'adolpho',
-    'adomi',
-    'adomnan',
-    'adomnan\'&sacute',
-    'adonais',
-    'adone',
     'adonis-type',
-    'adonises',
-    'adopshn',
-    'adopt-a-player',
-    'adopt-a-roll',
-    'adopt-a-vine',
-    'adopt-an-orphan',
-    'adopt/proposals',
-    'adoptant',
-    'adopte',
-    'adoption/purchase',
-    'adorably',
-    'adorals',
-    'adoramus',
-    'adorata',
-    'adorations',
     'adoret',
-    'adorna',
-    'adorne',
-    'adorno\'',
-    'adosrbents',
-    'adourned',
-    'adourning',
-    'adowa',
-    'adp-stimulated',
-    'adpase',
-    'adpressed',
-    'adprt',
-    'adpted',
-    'adradzhenne',
-    'adrea',
-    'adreeja',
     'adrelion',
-    'adrenalin-boosting',
-    'adrenalin-charged',
-    'adrenalin-fuelled',
-    'adrenalin-rush',
-    'adrenalin-sapping',
-    'adrenalin-soaked',
-    'adrenaline-fuelled',
-    'adrenaline-inducing',
-    'adrenalines',
-    'adrenalize',
-    'adrenergic-dependent',
-    'adrenocorticotropin',
-    'adrenoleukodystrophy',
-    'adrep',
-    'adresses',
     'adriaane',
-    'adriactic',
-    'adriaene',
-    'adrian\'s',
-    'adrian-types',
-    'adrianna',
-    'adrianne',
-    'adrianopolis',
-    'adrians',
-    'adrianus',
-    'adrianza',
-    'adriko',
-    'adriles',
-    'adron',
-    'adrspatch',
-    'adrug',
     'ads-',
-    'ads56289',
-    'adscene',
-    'adsersen',
-    'adsetts',
-    'adsgey',
-    'adshed',
-    'adsit',
-    'adso',
-    'adson',
-    'adsorbability',
-    'adsorbates',
-    'adsorbers',
-    'adsorbing',
-    'adsorptivity',
-    'adsp-210x',
     'adsp2105',
-    'adspend',
-    'adsteam',
-    'adstitit',
-    'adstock/buckinghamshire',
-    'adsurdum',
-    'adugna',
-    'aduku',
-    'adulators',
-    'aduls',
-    'adult&egrave;re',
-    'adult\'',
-    'adult-ape',
-    'adult-education',
-    'adult-intelligent',
-    'adult-looking',
     'adult-only',
-    'adult-proof',
-    'adult-pupil',
-    'adult-size',
-    'adult-to-adult',
-    'adult-type',
-    'adult/business',
-    'adult/student',
-    'adulter',
-    'adulterates',
-    'adulterating',
-    'adulteresses',
-    'adulterine',
-    'adulterously',
-    'adultes',
-    'adulthood.',
     'adumbrated.ll',
-    'aduncum',
-    'adusta',
-    'adval',
-    'advan&rehy;tages',
-    'advan-tage',
-    'advance&mdash;mortgagee\'s',
-    'advance-parties',
-    'advance-planning',
-    'advance-warning',
-    'advance.in',
-    'advance/retard',
-    'advanced-',
-    'advanced-area',
-    'advanced-cooled',
-    'advanced-economy',
     'advanced/underdeveloped',
-    'advances.',
-    'advantage+11',
-    'advantage+11+11+26',
-    'advantage+1111',
-    'advantages.',
-    'advantageth',
-    'advatech',
-    'adven&rehy;turer',
-    'adveniens',
-    'adventageous',
-    'adventerous',
-    'adventide',
-    'adventitial',
-    'adventitiously',
-    'adventure(s)',
     'adventure-plots',
-    'adventure-romance',
-    'adventure-scotland',
-    'adventure-seekers',
-    'adventure/activity',
-    'adventure/rpg',
-    'adventureously',
-    'adventuresses',
-    'adventurline',
-    'adventurous-picaresque',
-    'adver',
-    'adverb\'',
-    'adverising',
-    'advers',
-    'adversane',
-    'adversarial-adjudicative',
     'adversarially',
-    'adversiding',
-    'adversity-unemployment',
-    'advertiing',
-    'adverting',
-    'advertis',
-    'advertised/selection-based',
-    'advertisement-inspired',
-    'advertisement-ridden',
-    'advertisement/job',
-    'advertisements-points',
-    'advertisements/posters',
-    'advertiser-dependent',
-    'advertising-management',
-    'advertising/promotion',
-    'advertising/promotional',
     'advertising/promotions',
-    'advertisingws22-25',
-    'advertisingws22-29',
-    'adverts/notices',
-    'advervisement',
-    'advest',
-    'advice&ndash',
-    'advice-seeking',
-    'advice-spewing',
-    'advice/delivery',
-    'advice/home',
-    'advice31',
-    'adviceas',
-    'advin',
-    'advis',
-    'advisari',
     'advise/assist',
-    'advised.',
-    'advised/warned',
-    'advisees',
-    'advisement',
-    'adviser-led',
-    'adviser/supervisor',
-    'advisers&mdash;are',
-    'advisers--on',
-    'advisers/inspectors',
-    'adviseth',
-    'advision',
-    'advisor/consultant',
-    'advisorate',
-    'advisors.',
-    'advisory-staff',
     'advo',
-    'advocados',
-    'advocate(s)',
-    'advocate.',
-    'advocatus',
-    'advogadro',
-    'adyar',
-    'adyasuren',
-    'adyl',
-    'adyr',
-    'adyta',
-    'adyton',
-    'adza',
-    'adze-blade',
-    'adzed',
-    'adzhar',
     'adzhubei',
-    'adzoic',
-    'adzope',
-    'ae-2/windows',
-    'ae-3',
-    'ae-ea/rt',
-    'ae1',
-    'ae1/ae3',
-    'ae10-',
-    'ae3s',
-    'ae4052v',
-    'ae450',
-    'ae6',
-    'ae700',
-    'ae800',
-    'ae900',
     'aea-beven',
-    'aea-funded',
-    'aeac',
-    'aebischer',
-    'aecom',
-    'aecs',
-    'aed',
-    'aed200',
-    'aeddi',
-    'aedicule',
-    'aedificamus',
-    'aedificare',
-    'aedificavit',
-    'aef-1&bgr',
-    'aef-2',
-    'aef.',
     'aefg',
-    'aegae',
-    'aeged',
-    'aegeria',
-    'aegolius',
-    'aegon-type',
-    'aegosthena',
-    'aeguidens',
-    'aegypt',
-    'aegyptica',
-    'aehrenthal',
-    'aeid',
-    'aej',
-    'aekyung',
-    'aekyung-pq',
-    'aelbert',
     'aelbianische',
-    'aelfred',
-    'aelfstan',
-    'aelfthryth',
-    'aelfvin',
-    'aelfwin',
-    'aelia',
-    'aeliana',
-    'aello',
-    'aelst',
-    'aeltc',
-    'aelwyn',
-    'aemilian',
-    'aena',
-    'aend',
-    'aenea',
     'aeneidos',
-    'aeolians',
-    'aeolid',
-    'aeonius',
-    'aeons-old-coin-op',
-    'aeorol&iacute;neas',
-    'aequa',
-    'aequinoctalis',
-    'aequo',
-    'aequorin',
-    'aer24l',
-    'aeradio',
-    'aerator.',
-    'aerdenhout',
-    'aereobatica',
-    'aeres',
     'aerflot',
-    'aerial-reconnaissance',
-    'aerially',
-    'aeriated',
-    'aeriel',
-    'aerien',
-    'aeriological',
-    'aermac',
-    'aermacchi',
-    'aermacchis',
-    'aermacclu-339as',
-    'aero-delights',
-    'aero-dynamic',
-    'aero-dynamics',
-    'aero-engineer',
-    'aero-engineering',
     'aero-foil',
-    'aero-futures',
-    'aero-intensive',
-    'aero-technology',
-    'aero/industrial',
-    'aero3gen',
-    'aeroback',
-    'aerobasic',
-    'aerobatically',
-    'aerobating',
-    'aerobatting',
-    'aerobics-class',
-    'aerobicycle',
-    'aerobrain',
-    'aerobraked',
-    'aerobraking',
     'aerocar',
-    'aerochago',
-    'aerocraft',
-    'aerodeck',
-    'aerodromes.',
-    'aeroduets',
-    'aerodustry',
-    'aerodynamically-sound',
-    'aerodynamically-styled',
-    'aerodynamische',
-    'aerodynamism',
-    'aeroelastic',
-    'aerofaciens',
-    'aerofilms',
-    'aerofoil-shaped',
-    'aerofoil-type',
     'aerofoils',
-    'aeroginosa',
-    'aerogramme',
-    'aerograms',
-    'aerogulf',
-    'aerojet',
-    'aerojumble',
-    'aerol',
-    'aeroleneas',
-    'aerolite',
-    'aerometric',
-    'aeronautical/marine',
-    'aeronautically',
-    'aeronavali',
-    'aeronomy',
-    'aeroperu',
     'aeroplane-like',
-    'aeroplane-makers',
-    'aeroplane-related',
-    'aeroplane-shaped',
-    'aeroplanesque',
-    'aeropract',
-    'aeropuerto',
-    'aeroquatic',
-    'aerosmith-permanent',
-    'aerosol-induced',
-    'aerosoled',
-    'aerosolled',
-    'aerospace-defence',
-    'aerospace-owned',
-    'aerospace-to-medical',
-    'aerospace/car',
     'aerospace/cheltenham',
-    'aerospace/thomson-csf',
-    'aerospatiale/alcatel',
-    'aerostatic',
-    'aerostructures',
-    'aerosucre',
-    'aerosystems',
-    'aerotech',
-    'aerotows',
-    'aerotrap',
-    'aersol',
-    'aertiological',
-    'aertsen',
-    'aes-type',
-    'aesch',
-    'aeschines',
     'aesculapian',
-    'aescwine',
-    'aest',
-    'aesthenospheric',
-    'aesthete-recluse',
-    'aesthetic\'',
-    'aesthetic-cultural',
-    'aesthetic-looking',
-    'aesthetical',
-    'aesthetically-numb',
-    'aesthetically-sterile',
-    'aestheticises',
-    'aestheticization',
-    'aestimatio',
-    'aestival',
-    'aestivating',
     'aestuans',
-    'aet.',
-    'aetatibus',
-    'aetdqledeksalqteianllkekekle',
-    'aeternae',
-    'aetes',
-    'aetheistic',
-    'aethestically',
-    'aethilwalh',
-    'aethiopians',
-    'aethiopicum',
-    'aethoxysclerol',
-    'aetia',
-    'aetimology',
-    'aetiologic',
-    'aetiologically',
     'aetiology.',
-    'aetiopathogenetic',
-    'aetolians',
-    'aetosauroides',
-    'aeuc',
-    'aeuw',
-    'aev1043',
-    'aevs',
-    'aew.2s',
-    'aew.3',
-    'af&eacute',
-    'af-finis',
-    'af-i',
-    'af10',
-    'af6',
-    'afaep',
     'afaese',
-    'afailure',
-    'afair',
-    'afal',
-    'afan&aacute;siev',
-    'afandy',
-    'afantchao',
-    'afaq',
-    'afar-inhabited',
-    'afaria',
-    'afaristoun',
-    'afc124',
-    'afcf',
-    'afcs',
-    'afdal',
-    'afds',
     'afdub',
-    'afecs',
-    'afected',
-    'afee',
-    'afewerk',
-    'affa',
-    'affadavit',
-    'affair&mdash;the',
-    'affair-as',
-    'affair/acne/a',
-    'affair/caused',
-    'affairist',
-    'affairistes',
-    'affairs**',
-    'affairs.',
-    'affairs.ps',
     'affairs/magazine',
-    'affan',
-    'affane',
-    'affar',
-    'affare',
-    'affari',
-    'affaries',
-    'affe',
-    'affear',
-    'affec',
-    'affec&rehy;tionate',
-    'affeccioun',
-    'affecioun/ymaginacioun',
-    'affectd',
-    'affected.a',
-    'affected.moody',
     'affecting.',
-    'affection-love',
-    'affection-starved',
-    'affection.',
-    'affectionally',
-    'affectual',
-    'affectus',
-    'affenpinschers',
-    'afference',
-    'afferty',
-    'afffair',
-    'affiants',
-    'afficionadoes',
-    'afficionados',
-    'affidavits-of',
-    'affiliational',
     'affiliations:council',
-    'affiliative/dependent',
-    'affiliaton',
-    'affin&eacute',
-    'affina',
-    'affinally',
-    'affinitas',
-    'affinitatis',
-    'affinity-chromatography',
-    'affinopurified',
-    'affins',
-    'affirmable',
-    'affirmation.',
-    'affirmative-to-the-max',
-    'affixes.',
-    'afflates',
     'afflitto',
-    'affluent-but-screwed-up',
-    'affluent-looking',
-    'affluent-worker',
-    'affluently',
-    'afflux',
-    'affordable&mdash;and',
-    'afforesayd',
-    'afforesayde',
-    'afforesting',
-    'afforsaid',
-    'affort',
-    'affraid',
-    'affright',
-    'affrine',
-    'affrits',
     'affronty',
-    'affs',
-    'afftc',
-    'affter',
-    'afg',
-    'afg-sponsored',
-    'afganistan',
-    'afghanaid',
-    'afghanistan-pakistan',
-    'afghanistan.the',
-    'afgie',
-    'afgoi',
-    'afgoye',
-    'afgshar',
-    'afhq/eighth',
-    'aficianado',
     'afif',
-    'afilaka',
-    'afilas',
-    'afin',
-    'afina',
-    'afinal',
-    'afirm',
-    'afis',
-    'afiso',
-    'afive-year-old',
-    'aflaq',
-    'aflaqi',
-    'aflatunense',
-    'afli',
-    'aflotoxin',
-    'aflotoxins',
     'aflow',
-    'aflower',
-    'aflush',
-    'afma-ata',
-    'afn',
-    'afne',
-    'afolbi',
-    'afonzo',
-    'afora',
-    'aforetime',
-    'aforetyme',
-    'afori',
-    'afpfls',
-    'afps',
-    'afr',
-    'afra',
     'afrah',
-    'afraid&ndash',
-    'afraid-to-rock',
-    'afranil',
-    'afrayd',
-    'afreen',
-    'afrem',
-    'afrench',
-    'afri',
-    'afriad',
-    'afric',
-    'africa&mdash;called',
-    'africa*',
-    'africa-american',
-    'africa-based',
-    'africa-cairo',
     'africa-educated',
-    'africa-get',
-    'africa.worcestershire',
-    'africa/ghana',
-    'africa_',
-    'africaan',
-    'africain',
-    'african-back',
-    'african-held',
-    'african-influenced',
-    'african-inspired',
-    'african-ish',
-    'african-led',
-    'african-linked',
-    'african-music',
-    'african-owned',
     'african-produced',
-    'african-registered',
-    'african-run',
-    'african-supported',
-    'african-traditions',
-    'african-trained',
-    'african/caribbean',
-    'african/english',
-    'africanders',
-    'africangus',
-    'africanise',
-    'africanism',
-    'africanists',
-    'africanization',
-    'africas',
-    'afridi',
     'afrighted',
-    'afrikaanerdom',
-    'afrikakorps',
-    'afrikaner-volksunie',
-    'afrlca',
-    'afro-america',
-    'afro-asians',
-    'afro-carribbean',
-    'afro-carribean',
-    'afro-charlie',
-    'afro-d',
-    'afro-eurasia',
-    'afro-funk',
-    'afro-guyanese',
-    'afro-house',
-    'afro-mauritanian',
     'afro-mauritanians',
-    'afro-saxons',
-    'afro-styled',
-    'afro-trinidadians',
-    'afro-west',
-    'afroasian',
-    'afrocaribbeans',
-    'afronauts',
-    'afronted',
-    'afrum',
-    'afsharm',
-    'afsprengi',
-    'aft\'',
-    'aft-hinged',
-    'aftc',
-    'afte',
     'aftemoon',
-    'aften',
-    'aftenposten',
-    'after&rehy;care',
-    'after&rehy;noon',
-    'after\'',
-    'after-acquired',
-    'after-action',
-    'after-affects',
-    'after-auction',
-    'after-benefits',
-    'after-birth',
-    'after-burners',
-    'after-christmas',
-    'after-employment',
-    'after-events',
     'after-harvest',
-    'after-himself',
-    'after-load',
-    'after-meal',
-    'after-medication',
-    'after-midnight',
-    'after-ops',
-    'after-product',
-    'after-puberty',
-    'after-pulse',
-    'after-r&acirc;le',
-    'after-reaction',
-    'after-smell',
-    'after-tastes',
-    'after-the-fact',
-    'after-the-sale',
     'after-trace',
-    'after-use',
-    'after-wall',
-    'after-wards',
-    'after-world',
-    'after.',
-    'after/',
-    'after/until',
-    'after1800',
-    'after=',
-    'after_a',
-    'aftera',
-    'afterbattle',
-    'afterbeing',
-    'afterburner-style',
-    'afterburning',
     'aftercast',
-    'aftercastle',
-    'aftercasts',
-    'afterdinner',
-    'aftereffect',
-    'afterf',
-    'afterfires',
-    'afterflow',
-    'afterglows',
-    'afterhatch',
-    'afterhaving',
-    'afterimage',
-    'afterlives',
-    'aftermatch',
-    'aftermeeting',
-    'aftermoments',
     'afterness',
-    'afternnon',
-    'afternoon.',
-    'afternoon.if',
-    'afternoon/',
-    'afternoonish',
-    'afteroon',
-    'afterpannage',
-    'afterseeing',
-    'aftershafts',
-    'aftershave-commercial',
-    'aftershaved',
-    'aftertang',
-    'afterward.',
-    'afterwards.',
-    'afterwards.if',
     'afterwards.joan',
-    'afterwork',
-    'aftewards',
-    'aftm',
-    'afv',
-    'afwillite',
-    'afzal/vg',
-    'afzeliana',
-    'ag&aacute;des',
-    'ag&lsqb;ains&rsqb;t',
-    'ag&uuml;ica',
-    'ag+',
-    'ag-125',
-    'ag-6200',
-    'ag-cat',
-    'ag-derived',
     'ag-ee-ma',
-    'ag-pilots',
-    'ag.gurney',
-    'ag20',
-    'ag350',
-    'aga-type',
-    'agaagagaatcaactgcc',
-    'agaainst',
-    'agace',
-    'agaces',
-    'agacgtct',
-    'agadez',
-    'agagttacatggtgtctgcc',
-    'agah',
-    'agaid',
-    'again&mdash',
     'again&mdash;a',
-    'again&mdash;surely',
-    'again&rehy;they',
-    'again-fashionable',
-    'again-same',
-    'again-that',
-    'again-with',
-    'again.her',
-    'again.more',
-    'again.richard',
-    'again.the',
-    'again.this',
-    'again.we',
-    'again/curves',
-    'again/i',
-    'again/just',
     'again/to',
-    'again_in',
-    'against&mdash',
-    'against&mdash;perhaps',
-    'against-note',
-    'against-the-grain',
-    'against-the-odds',
-    'against/rail',
-    'against/tobacco',
-    'againsy',
-    'againt',
-    'againts',
-    'againy',
-    'agalactia',
-    'agalev&mdash;live',
-    'agalevn',
     'agama',
-    'agan',
-    'agancy',
-    'agao',
-    'agaonidae',
-    'agaonids',
-    'agap&eacute',
-    'agape/1',
-    'agapemonism',
-    'agapito',
-    'agapitos',
-    'agar-agar',
-    'agar-coated',
-    'agar-like',
-    'agarbatti',
-    'agarbi',
     'agaricoides',
-    'agarose-coupled',
-    'agarose/0.22m',
-    'agarose/0.92m',
-    'agars',
-    'agasse',
-    'agassiz\'',
-    'agastya',
-    'agat',
-    'agate-coloured',
-    'agate-veined',
-    'agathistic',
-    'agatho',
-    'agathokles',
-    'agathonos',
-    'agawa',
     'agawk',
-    'agayn',
-    'agayne',
-    'agaynst',
-    'agaza',
-    'agazan',
-    'agbabi',
-    'agbhjtyowlnmpasddqgtuitlmdjex',
-    'agbiamo',
-    'agbrigg',
-    'agca/tgct',
-    'agcaoli',
-    'agcas/law',
-    'agcg',
-    'agcg/cgct',
-    'agcggcgcgt',
     'agcl',
-    'agcus',
-    'agdistis',
-    'agdor',
-    'age&mdash',
-    'age&rehy;distribution',
-    'age&rehy;group',
-    'age-195',
-    'age-band',
-    'age-barred',
-    'age-barrier',
-    'age-blackened',
-    'age-bound',
-    'age-bump',
-    'age-by-sex',
-    'age-changes',
     'age-class',
-    'age-corrected',
-    'age-diameter',
-    'age-discrimination',
-    'age-free',
-    'age-graded',
-    'age-grades',
-    'age-grading',
-    'age-groupings',
-    'age-hardened',
-    'age-heaping',
-    'age-hold',
-    'age-inappropriate',
-    'age-life',
-    'age-linked',
-    'age-match',
     'age-mate',
-    'age-mates',
-    'age-mixed',
-    'age-mottled',
-    'age-of-acquisition',
-    'age-or',
-    'age-phase',
-    'age-relations',
-    'age-restrictive',
-    'age-roles',
-    'age-scale',
-    'age-shifting',
-    'age-span',
-    'age-specification',
-    'age-spots',
-    'age-standardised',
     'age-structured',
-    'age-swap',
-    'age-type',
-    'age-types',
-    'age.new',
-    'age/experience',
-    'age/pregnancy',
-    'age/service',
-    'age/sex/marital',
-    'age/sex/type',
-    'age/size',
-    'age:mining',
-    'age_in',
-    'agebe',
-    'aged-matched',
-    'aged19&ndash;65',
     'aged29',
-    'agee',
-    'ageement',
-    'agehave',
-    'agehot',
-    'ageing.',
-    'ageism-awareness',
-    'agelaius',
-    'agelenidae',
-    'agema',
-    'agemund',
-    'agencies-',
-    'agencies-the',
-    'agencies.2',
-    'agencies/business',
-    'agencies/groups',
     'agency-centered',
-    'agency-provided',
-    'agency-sponsored',
-    'agency-structure',
-    'agency/client',
-    'agencyhas',
-    'agend',
-    'agenda&pound',
-    'agendaless',
-    'agendas&ndash',
-    'agendas.',
-    'agendasetting',
-    'agendle',
-    'agent&mdash;not',
-    'agent(s)',
-    'agent-in-place',
     'agent-less',
-    'agent-object',
-    'agent-provocateur',
-    'agent/employer',
-    'agent/patient',
-    'agente',
-    'agented',
-    'agenting',
-    'agents-',
-    'agents-in-place',
-    'agents-provocateurs',
-    'agents/3rd',
-    'agents/estate',
-    'agents:b',
-    'agentur',
-    'ageold',
     'ageorge',
-    'ageratums',
-    'agere',
-    'agerpres',
-    'agerpublicus',
-    'agersborg',
-    'ages-long',
-    'ages-old',
-    'agesidamos',
-    'agfa-gevaert',
-    'agfas',
-    'agfcc\'c',
-    'agg.',
-    'agg/ljh',
-    'aggaatcg',
-    'aggacctggttgcaaggaac',
     'aggeson',
-    'aggett',
-    'aggggggggggghhhhhhhhhhhhhhhhhhhhh',
-    'aggghh',
-    'agghhhh',
-    'aggie.',
-    'aggis',
-    'agglom-',
-    'agglomerates',
-    'agglutinate',
-    'agglutinatives',
-    'agglutinin-horseradish',
-    'aggr&eacute;gation',
-    'aggradations',
-    'aggrandir',
-    'aggrandise',
     'aggrandising',
-    'aggrandize',
-    'aggrandized',
-    'aggrandizements',
-    'aggrandizing',
-    'aggravation.',
-    'aggravator',
-    'aggregometry',
-    'aggreko',
-    'aggresion',
-    'aggression-arousing',
-    'aggressionist',
-    'aggressive\'&ndash',
-    'aggressive-looking',
-    'aggressive.',
-    'aggressive/anti-social',
     'aggressive/intellectual/pragmatic',
-    'aggressively-priced',
-    'aggressor5',
-    'aggro.',
-    'aggros',
-    'aghalee',
-    'aghanistan',
-    'aghastly',
-    'aghhhhh',
-    'aghia',
-    'aghion',
-    'aghrus',
-    'agianst',
-    'agias',
-    'agidihof',
-    'agilanico',
     'agile-thinking',
-    'agility.and',
-    'aginast',
-    'agip-operated',
-    'agis',
-    'agit-',
-    'agit-popping',
-    'agitator-pads',
-    'agitpop',
-    'agkagat',
-    'aglandular',
-    'aglantha',
-    'aglaonema',
-    'aglimmer',
-    'aglin-jarrett',
-    'aglipay',
     'aglobal',
-    'aglophone',
-    'agmatans',
-    'agmondesham',
-    'agmx1',
-    'agnaou',
-    'agnel',
-    'agneskirche',
-    'agness',
-    'agnete',
-    'agnificent',
-    'agnolini',
-    'agnon',
-    'agnosias',
-    'agnostic/atheist',
-    'agnostic/sceptic',
     'agnostications',
-    'agnst',
-    'ago&mdash;and',
-    'ago&rehy;in',
-    'ago-\'ave',
-    'ago-and',
-    'ago-industries',
-    'ago.and',
-    'ago.but',
-    'ago.forensic',
-    'ago.it',
-    'ago.now',
-    'ago.the',
-    'ago141213',
-    'ago788173',
-    'agoal',
     'agobard',
-    'agodo',
-    'agoe',
-    'agogic',
-    'agogo',
-    'agombar',
-    'agone',
-    'agonist-induced',
-    'agonist/antagonist',
-    'agoniz',
-    'agonizedly',
-    'agonizers',
-    'agonizes.',
-    'agony-aunt',
-    'agony-inducing',
-    'agop',
     'agoraphobics',
-    'agorazein',
-    'agordat',
-    'agorius',
-    'agosta-90',
-    'agostinho',
-    'agostoli',
-    'agoura',
-    'agouti-dispersed',
-    'agouti-pink-eyed',
-    'agovernment',
-    'agpc',
-    'agplanes',
-    'agr&eacute;gation',
-    'agr-',
-    'agra&ndash;delhi',
     'agra&ndash;khajuraho',
-    'agraha',
-    'agranu',
-    'agrarian-nationalism',
-    'agrarian-reform',
-    'agrarianists',
-    'agrario',
-    'agrarius',
-    'agrate',
-    'agrciutlural',
-    'agreables',
-    'agreda',
-    'agree&lsqb;d&rsqb',
-    'agreeably-warm',
-    'agreed&mdash;as',
-    'agreed-on',
     'agreed-upon',
-    'agreed.',
-    'agreedwhich',
-    'agreeed',
-    'agreemen',
-    'agreement&mdash;b',
-    'agreement&mdash;popularly',
-    'agreement&mdash;see',
-    'agreement&mdash;wife',
-    'agreement\'',
-    'agreement-consensus-on',
-    'agreement-in-principle',
-    'agreement.3',
-    'agreement/',
-    'agreement/compromise',
-    'agreement/signature',
     'agreements300',
-    'agreementsall',
-    'agreementsee',
-    'agreementsthis',
-    'agreemnent',
-    'agregado',
-    'agremeent',
-    'agren',
-    'agression',
-    'agressively',
-    'agreste',
-    'agri-',
-    'agri-chemical',
-    'agri-chemicals',
-    'agri-econ',
-    'agri-export',
     'agri-factories',
-    'agriada',
-    'agribuggies',
-    'agric',
-    'agric.',
-    'agrichemicals',
-    'agricoles',
-    'agricu',
-    'agricul-tural',
-    'agricultores',
-    'agricultural-based',
-    'agricultural-development',
-    'agricultural-implement',
-    'agricultural-rural',
-    'agricultural-style',
-    'agricultural/',
     'agricultural/agroforestry',
-    'agricultural/military',
-    'agriculturalism',
-    'agriculturally-based',
-    'agriculturam',
-    'agriculture4-64.6',
-    'agriframes',
-    'agrin',
-    'agripino',
-    'agrisilvicultural',
-    'agrisilviculture',
-    'agro-',
-    'agro-chemcials',
-    'agro-division',
-    'agro-export',
-    'agro-exports',
     'agro-industry',
-    'agro-monetary',
-    'agro-processing',
-    'agro-service',
-    'agro-xxxx',
-    'agrobiological',
-    'agrocultural',
-    'agroecosystem',
-    'agrokipia',
-    'agromineral',
-    'agronomical',
-    'agronomics',
-    'agropastoral',
-    'agropinopines',
-    'agropolis',
-    'agrose',
     'agrostemma',
-    'agrostis-festuca',
-    'agrostis/',
-    'agrostis/festuca',
-    'agroup',
-    'agrovata',
-    'agrowing',
-    'agscene',
-    'agsostart',
-    'agt-3\'',
-    'agtcctccccgtcagacc',
-    'aguacate',
-    'aguada',
-    'aguado',
-    'aguaruna',
-    'aguascalientes',
     'ague-altered',
-    'agued',
-    'agueda',
-    'aguenit',
-    'aguero',
-    'aguiari',
-    'aguided',
-    'aguinaco',
-    'aguish',
-    'agus',
-    'agusta',
-    'agut',
-    'aguwa',
-    'agv',
-    'agvaanjantsangiyn',
-    'agw',
     'agwantibo',
-    'agwi',
-    'agydeus',
-    'ah-200',
-    'ah-ah-ah',
-    'ah-ah-ah-ah',
-    'ah-ah-are',
-    'ah-er-',
-    'ah-huh',
-    'ah-lah',
-    'ah-lah-deen',
-    'ah-men',
-    'ah-oo:or',
-    'ah/00/22/0003',
-    'ah/00/23/0006',
-    'ah/00/23/0012',
     'ah/00/23/0015',
-    'ah/00/23/0018',
-    'ah/00/23/0047',
-    'ah/00/23/2002',
-    'ah/00/23/2010',
-    'ah/00/23/2024',
-    'ah/00/23/2035',
-    'ah/00/23/2037',
-    'ah/00/23/2038',
-    'ah/00/23/2039',
-    'ah/00/23/2044',
-    'ah/00/23/2048',
-    'ah/00/23/2050',
-    'ah/00/23/2055',
-    'ah/00/23/2059',
-    'ah/00/24/2002',
     'ah/00/25/0005',
-    'ah/00/25/0008',
-    'ah/00/26/0038',
-    'ah/00/28/0062',
-    'ah/01/05/0001-3',
-    'ah/11/25/0002',
-    'ah/11/25/0005-1',
-    'ah/11/25/0006',
-    'ah/1ah2',
-    'ah001',
-    'ah250',
-    'ah300',
-    'ah350',
-    'ah3x',
-    'ah500x',
-    'ah8189/20',
     'ah_of',
-    'ahad',
-    'ahad/jaipur',
-    'ahagger',
-    'ahalf',
-    'ahaloth',
-    'ahamad',
-    'ahamed',
-    'ahan',
-    'ahar',
-    'aharon',
-    'ahat',
-    'ahava',
-    'ahcima',
-    'ahclorhydric',
-    'ahdaf',
     'ahead-of-its-time',
-    'ahead-of-the-game',
-    'aheadsums',
-    'ahed',
-    'aherdane',
-    'aherloe',
-    'ahf',
-    'ahg',
-    'ahhaa',
-    'ahhhcapella',
-    'ahhhherrr',
-    'ahhhhgnhhh',
-    'ahhhhhhh',
-    'ahhhhhhhhh',
-    'ahhhhhm',
-    'ahhhooo',
     'ahhhooooeeeeaye',
-    'ahi-tere',
-    'ahiauzu',
-    'ahii',
-    'ahilo',
-    'ahimataotao',
-    'ahime',
-    'ahing',
-    'ahinici',
-    'ahiqar',
-    'ahis',
-    'ahl-e',
-    'ahlahdeen',
-    'ahlbrand',
-    'ahlen',
-    'ahmadabad',
     'ahmado',
-    'ahmatinformation',
-    'ahmed/asian',
-    'ahmedabad-380',
-    'ahmedcommunications',
-    'ahmednagar',
-    'ahmedzai',
-    'ahmend',
-    'ahmes',
-    'ahmose-nefertari',
-    'ahmoundou',
-    'ahmovic',
-    'ahnd',
-    'ahng-ha',
-    'ahnung',
-    'ahoi',
     'ahoj',
-    'ahomely',
-    'ahooi',
-    'ahora',
-    'ahorey',
-    'ahortly',
-    'ahout',
-    'ahoyo',
-    'ahr',
-    'ahr-eh',
-    'ahrar',
-    'ahrends',
-    'ahrenses',
-    'ahrjinder',
-    'ahronot',
-    'ahteha',
     'ahti',
-    'ahu',
-    'ahue',
-    'ahum',
-    'ahw',
-    'ahzelgrove',
-    'ai(kij)',
-    'ai-anon',
-    'ai-based',
-    'ai-skilled',
-    'ai/00/25/0001',
-    'ai/00/26/0037',
-    'ai/00/26/0052',
-    'ai/01/23/0008',
-    'ai/01/23/0010',
-    'ai/01/23/0011',
     'ai/01/23/0012',
-    'ai/01/23/0014',
-    'ai/01/23/0015',
-    'ai/01/23/0020',
-    'ai/01/23/0021',
-    'ai/01/23/0026',
-    'aiakos',
-    'aib/first',
-    'aibbf',
-    'aibd',
-    'aibert',
-    'aibling',
-    'aic-71lv80',
-    'aic-7770',
-    'aicc-7',
-    'aichatou',
     'aico',
-    'aid-agency',
-    'aid-donor',
-    'aid-donors',
-    'aid-financed',
-    'aid-funded',
-    'aid-giver',
-    'aid-givers',
-    'aid-spain',
-    'aid-tied',
-    'aid-to-gnp',
-    'aid-to-recruitment',
-    'aid-user',
-    'aid.',
-    'aid/c.e.e.c.',
-    'aid/ceec',
     'aid/prevention',
-    'aid/scotland',
-    'aid/trade',
-    'aid_of',
-    'aidab',
-    'aidable',
-    'aidam',
-    'aidcroft',
-    'aide&rehy;m&eacute;moire',
-    'aide-',
-    'aide-m&eacute;emoire',
-    'aide-m&eacute;moireto',
-    'aide_de_camp',
-    'aideburgh',
-    'aidee',
-    'aidergrove',
     'aides-memoire',
-    'aides-memoires',
-    'aidez',
-    'aidgap',
-    'aidin',
-    'aidit',
-    'aidley',
-    'aidrie',
-    'aids-acclimatised',
-    'aids-associated',
-    'aids-awareness',
-    'aids-concerned',
-    'aids-contaminated',
-    'aids-epidemic',
-    'aids-era',
-    'aids-free',
     'aids-h',
-    'aids-induced',
-    'aids-prevention',
-    'aids-sufferer',
-    'aids-tested',
-    'aids-testing',
-    'aids.',
-    'aids/malaria',
-    'aids/safer',
-    'aidsout.com',
-    'aidy',
-    'aiee',
-    'aieee',
-    'aieeee',
-    'aieng91',
-    'aife',
     'aifld',
-    'aigai',
-    'aigaleos-parnes',
-    'aigburththieves',
-    'aigialos',
-    'aigina.',
-    'aiginetan',
-    'aigle',
-    'aigles',
-    'aigner',
-    'aigrette',
-    'aigu',
-    'aigueblanche',
-    'aiguer',
-    'aigues-mortes',
-    'aiguillette',
     'aiguillettes',
-    'aigulettes',
-    'aigun',
-    'aihits',
-    'aii',
-    'aiii',
-    'aijv',
-    'aike',
-    'aiki-jitsu',
-    'aikidoist',
-    'aila',
-    'ailanthus',
-    'ailefroide',
-    'aileron-spoiler',
-    'aileron/rudder',
-    'ailias',
     'ailie',
-    'ailill',
-    'ailin\'',
-    'ailiss',
-    'aille',
-    'ailleurs',
-    'ailort',
-    'ailsi',
-    'aily',
-    'aim-',
-    'aim-directed',
-    'aim/aug',
-    'aim/july',
-    'aim4',
-    'aiman',
-    'aimant',
     'aimberworth',
-    'aimed-at',
-    'aimeluk',
-    'aimers',
-    'aimes',
-    'aimiable',
-    'aimin',
-    'aiming-point',
-    'aimo',
-    'aims.',
-    'aims/goals',
-    'aims/goals/priorities/intentions',
-    'aimsleys',
-    'ain\'t\'',
-    'ain-el-hilweh',
-    'aincent',
     'ainchant',
-    'aincher',
-    'aingeala',
-    'aingle',
-    'ainiktozoonids',
-    'ainis',
-    'ainna',
-    'ainnit',
-    'ainort',
-    'ainslie/fish',
-    'ainst0:keele',
-    'ainstey',
-    'aintura',
-    'ainulindal&eacute',
-    'ainwick',
-    'aiolis',
     'aiolupo',
-    'aion-supported',
-    'aipac',
-    'aipedaile',
-    'aipim',
-    'aiport',
-    'aiptasia',
-    'air&lsqb',
-    'air&mdash;hostesses',
-    'air&ndash',
-    'air&rehy;mail-paper',
-    'air-bag',
-    'air-bags',
-    'air-based',
-    'air-battle',
-    'air-bed',
     'air-beds',
-    'air-bladders',
-    'air-blast',
-    'air-blown',
-    'air-bottle',
-    'air-bottles',
-    'air-brained',
-    'air-brakes',
-    'air-braking',
-    'air-bricks',
-    'air-brushed',
-    'air-brushing',
-    'air-bubbles',
-    'air-can',
-    'air-car',
-    'air-carrying',
     'air-catching',
-    'air-cells',
-    'air-chills',
-    'air-combat',
-    'air-conditiioning',
-    'air-conditining',
-    'air-conditioning/',
-    'air-crews',
-    'air-current',
-    'air-currents',
-    'air-cushion',
-    'air-cushioned',
-    'air-date',
-    'air-directed',
-    'air-dispersal',
-    'air-displacing',
     'air-drawn',
-    'air-driven',
-    'air-droppable',
-    'air-empire',
-    'air-ferry',
-    'air-fields',
-    'air-filters',
-    'air-fluid',
-    'air-forces',
-    'air-frames',
-    'air-france',
-    'air-free',
-    'air-fuel',
-    'air-ground',
-    'air-gun',
-    'air-gusts',
     'air-head',
-    'air-headed',
-    'air-hell-lair',
-    'air-hellair',
-    'air-horns',
-    'air-hunger',
-    'air-inflated',
-    'air-ing',
-    'air-intercept',
-    'air-ioniser',
-    'air-jets',
-    'air-kiss',
-    'air-law',
-    'air-lighting',
-    'air-line',
-    'air-links',
     'air-locked',
-    'air-locking',
-    'air-mail',
-    'air-marshals',
-    'air-mattress',
-    'air-movements',
-    'air-naval',
-    'air-obics',
-    'air-only',
-    'air-operated',
-    'air-our',
-    'air-package',
-    'air-packed',
-    'air-phone',
-    'air-photographs',
-    'air-plants',
     'air-pockets',
-    'air-pollutant',
-    'air-pollution',
-    'air-power',
-    'air-puff',
-    'air-punching',
-    'air-raid.when',
-    'air-resistance',
-    'air-rink',
-    'air-sac',
-    'air-sacs',
-    'air-safety',
-    'air-sampling',
-    'air-scream',
-    'air-sensitive',
-    'air-shaft',
     'air-smoothed',
-    'air-sniffers',
-    'air-spaces',
-    'air-speed',
-    'air-splitting',
-    'air-sprung',
-    'air-station',
-    'air-steam',
-    'air-step',
-    'air-stewardess',
-    'air-stream',
-    'air-strip',
-    'air-sucking',
-    'air-suction',
-    'air-supremacy',
-    'air-surveillance',
     'air-tear',
-    'air-tested',
-    'air-thermals',
-    'air-ticket',
-    'air-to-sea',
-    'air-transport',
-    'air-vice',
-    'air-war',
-    'air-warden',
-    'air-water',
-    'air-worthy',
-    'air.',
-    'air.it',
-    'air/cabin',
-    'air/diet/underclothes',
-    'air/dust',
     'air/fuel',
-    'air/rail',
-    'air/sea/rescue',
-    'air/skrowaczewski/wallenstein',
-    'air/surface',
-    'aira',
-    'airacobra',
-    'airbag-equipped',
-    'airballoon',
-    'airborn',
-    'airborne&mdash',
-    'airbox',
-    'airbraked',
-    'airbreathers',
-    'airbreathing',
-    'airbridges',
     'airbrushing',
-    'airbus-slaying',
-    'aircall',
-    'aircam',
-    'airchair',
-    'aircoupes',
-    'aircover',
-    'aircr',
-    'aircract',
-    'aircraft-',
-    'aircraft-based',
-    'aircraft-builders',
-    'aircraft-engineering',
-    'aircraft-fuelling',
-    'aircraft-kits',
-    'aircraft-making',
     'aircraft-stands',
-    'aircraft-style',
-    'aircraft-type',
-    'aircraft/avionics',
-    'aircraft/because',
-    'aircraft/systems',
-    'aircrafters',
-    'aircraftmen',
-    'aircraftswoman',
-    'aircrete',
-    'aircrewmen',
-    'aird/crime',
-    'airdam',
-    'airdisplay',
-    'airdrie-bathgate',
-    'airdries',
     'aire&rehy;sur-lys',
-    'aire-calder',
-    'aire-sur-la',
-    'aires.',
-    'airfair',
-    'airfield(s)',
-    'airfield/oxfordshire',
-    'airfighter',
-    'airfilter',
-    'airflor',
-    'airflows',
-    'airfood',
-    'airforcemen',
-    'airfreighted',
-    'airfresheners',
-    'airgraph',
     'airhelds',
-    'airicide',
-    'airjet',
-    'airknockers',
-    'airleys',
-    'airlfted',
-    'airlies',
-    'airlift\'',
-    'airline(s)',
-    'airline-it',
-    'airline-safety',
-    'airline-standard',
-    'airline-type',
-    'airliner-style',
-    'airliner-type',
-    'airloads',
     'airlocked',
-    'airmails',
-    'airmaster',
-    'airmiles',
-    'airmin',
-    'airmisses',
-    'airmix',
-    'airmount',
-    'airo',
-    'airodrome',
-    'airpath',
-    'airpistols',
-    'airplane-like',
-    'airpockets',
-    'airport(s)',
-    'airport-\'which',
     'airport/london',
-    'airport/nec',
-    'airport/seaport',
-    'airport/today',
-    'airports-authority',
-    'airports-peals',
-    'airports.',
-    'airports/ports',
-    'airpowered',
-    'airrifle',
-    'airscoop',
-    'airshafts',
-    'airshed',
-    'airship-related',
-    'airshot',
-    'airskate',
     'airspeeds',
-    'airsports',
-    'airstair',
-    'airstart',
-    'airstrip/farm',
-    'airsupply',
-    'airtest',
-    'airtexed',
-    'airtour',
-    'airtours-owners',
-    'airtoys',
-    'airtrak',
-    'airtravel',
-    'airts',
-    'airuk',
-    'airvents',
     'airventure',
-    'airwair',
-    'airways.',
-    'airways/british',
-    'airwells',
-    'airwheels',
-    'airwick',
-    'airwickers',
-    'airwomen',
-    'airwork',
-    'airworld',
-    'airwrecked',
-    'airy&rehy;fairy',
-    'airy-',
-    'airy-faerie',
-    'airyholme',
     'aisalby',
-    'aisch.',
-    'aisholt',
-    'aisian',
-    'aisie',
-    'aisne-marne',
-    'aisons',
-    'aiston',
-    'ait-laoussine',
-    'aitched',
-    'aitchison/chairman',
-    'aiter',
-    'aiternative',
-    'aiters',
-    'aitislie',
-    'aitken/business',
     'aitken/community',
-    'aitken/former',
-    'aitken/glasgow',
-    'aitken/singer',
-    'aitolia',
-    'aitolian',
-    'aitolians',
-    'aitor',
-    'aits-n',
-    'aiu',
-    'aiuk',
-    'aivanzian',
-    'aiverlaur',
-    'aix-marseille',
-    'aix-marseilles',
-    'aix-os/2',
     'aix-run',
-    'aix-supported',
-    'aix/',
-    'aix/6000/3.2',
-    'aix/dce',
-    'aix/es',
-    'aix/unix',
-    'aix3.2',
-    'aixoneis',
-    'aixwindows',
-    'aiya',
-    'aiyer',
-    'aizawa',
-    'aizelwood',
-    'aizpuru',
-    'aizu',
     'aizu-wakamatsu',
-    'aj26',
-    'aj469',
-    'ajai',
-    'ajaiki',
-    'ajaj',
-    'ajalan',
-    'ajangle',
-    'ajax\'',
-    'ajdayt',
-    'ajdp',
-    'ajdukiewicz',
-    'ajeen',
-    'ajegunle',
-    'ajely',
-    'ajenda',
     'aji',
-    'ajina',
-    'ajingle',
-    'ajm',
-    'ajmal',
-    'ajmeri',
-    'ajmone',
-    'ajo',
-    'ajob',
-    'ajoe',
-    'ajohida',
-    'ajongpong',
-    'ajour&eacute',
-    'ajournalist',
-    'ajp',
-    'ajp8',
     'aju',
-    'ajuria',
-    'ajustable',
-    'ajw',
-    'ak&rehy;47s',
-    'ak-ak-ak',
-    'ak-wa-ti-ka',
-    'ak-wat-ica',
-    'ak2a',
-    'ak899',
-    'aka-boy',
-    'akaash',
-    'akabar',
-    'akad',
-    'akad.',
-    'akadake',
     'akademi',
-    'akademischer',
-    'akadimpex',
-    'akafia',
-    'akaileheducation',
-    'akakievich',
-    'akakpo',
-    'akamas',
-    'akanegakubo',
-    'akao',
-    'akapekabou',
-    'akarcali',
-    'akaroa',
-    'akaruru',
-    'akary',
-    'akasaka',
     'akashambacwa',
-    'akashambatwa',
-    'akast',
-    'akathisia',
-    'akaufaka',
-    'akbari',
-    'akbars',
-    'akbay',
-    'akbel',
-    'akber',
-    'akbuk',
-    'akcay',
-    'akcije',
-    'akdes',
-    'akebar',
-    'akel&mdash;progressive',
     'akele',
-    'akeler',
-    'akeley',
-    'akena',
-    'akendengue',
-    'akenside',
-    'akenson',
-    'akers-douglas',
-    'akfed',
-    'akfm-fanavoazana',
-    'akfm-kdrsm',
-    'akfm-kongresi',
-    'akg',
-    'akhaimenid',
-    'akhboob',
-    'akhelia',
     'akhet',
-    'akhetaten',
-    'akhissar',
-    'akhlaq',
-    'akhmim',
-    'akhsarbak',
-    'akhsarbek',
-    'akhtarini',
-    'akhter',
-    'akhter/shop',
-    'akhtra',
-    'akhu',
-    'akhund',
-    'akhundzadeh',
-    'aki-ku-lar-is',
-    'akihabara',
     'akihiro',
-    'akikiwe',
-    'akil.',
-    'akinand',
-    'akinci',
-    'akinesia',
-    'akinetic',
-    'akinfii',
-    'akino',
-    'akirebi',
-    'akirebimines',
-    'akirkeby',
-    'akis',
-    'akiva',
-    'akka',
-    'akkadians',
     'akkastugorna',
-    'akkaya',
-    'akkid',
-    'akli',
-    'aklonis',
-    'akmadzic',
-    'akmene',
-    'akohito',
-    'akol/world',
-    'akoli',
-    'akomfrah',
-    'akon',
-    'akosombo',
-    'akoto',
-    'akpamgbo',
-    'akqi',
     'akr/j',
-    'akraman',
-    'akrasi-sarpong',
-    'akros',
-    'akroydon',
-    'akroyds',
-    'aks',
-    'aksai-chin',
-    'aksakovo',
-    'akselrod',
-    'aksentijevic',
-    'akses',
-    'aksionairnoye',
-    'aksu-caykoy',
-    'aksunite',
-    'aktinson',
     'aktok/central',
-    'aktubinsk',
-    'aktyubinsk',
-    'akubussi',
-    'akue',
-    'akulov',
-    'akumu',
-    'akun',
-    'akurana',
-    'akutagawa',
-    'akward',
-    'akwesasne',
-    'akyarlar',
-    'akyma',
-    'al&egrave;gre',
-    'al&rehy;karim',
     'al&rehy;muraba',
-    'al&rehy;watani',
-    'al&sup3+',
-    'al\'',
-    'al\'askalani',
-    'al(1992)',
-    'al-\'am',
-    'al-\'amara',
-    'al-\'azzaz',
-    'al-88',
-    'al-abdullah',
-    'al-abid',
-    'al-adha',
-    'al-adwan',
-    'al-aemmah',
-    'al-agha',
     'al-ahad',
-    'al-ahali',
-    'al-ahd',
-    'al-ahly',
-    'al-ahmedhousing',
-    'al-ajili',
-    'al-akbar',
-    'al-akra',
-    'al-akrami',
-    'al-alam',
-    'al-alawi',
-    'al-ali',
-    'al-alousi',
-    'al-amaoui',
-    'al-amariyah',
-    'al-amayyah',
     'al-amiri',
-    'al-amn',
-    'al-anba',
-    'al-andalus',
-    'al-ani',
-    'al-anon',
-    'al-anqari',
-    'al-anwar',
-    'al-aqqad',
-    'al-araba',
-    'al-arashicabinet',
-    'al-arqam',
-    'al-arrayed',
-    'al-asad',
-    'al-ashari',
-    'al-assad&gt',
     'al-assefie',
-    'al-aswad',
-    'al-atassi',
-    'al-athar',
-    'al-atrushi',
-    'al-atti',
-    'al-awsat',
-    'al-awwal',
-    'al-ayyubi',
-    'al-azem',
-    'al-azmani',
-    'al-azzaz',
-    'al-ba',
-    'al-baba',
-    'al-badi',
-    'al-baida',
     'al-bakry',
-    'al-bamerni',
-    'al-banbi',
-    'al-baqi',
-    'al-barajneh',
-    'al-barghuti',
-    'al-bashiri',
-    'al-batawi',
-    'al-batayinah',
-    'al-baten',
-    'al-batin',
-    'al-bayan',
-    'al-bazzazeducation',
-    'al-beidah',
-    'al-beshari',
-    'al-bireh',
     'al-bitawi',
-    'al-bizri',
-    'al-busa\'idi',
-    'al-busaidi',
-    'al-butush',
-    'al-dali',
-    'al-dawa',
-    'al-dawla',
-    'al-dayri',
-    'al-dhairi',
-    'al-dhuhiri',
-    'al-dibal',
-    'al-dimoqrati',
-    'al-dinawi',
-    'al-dughmilabour',
-    'al-durar',
     'al-fadl',
-    'al-fahahil',
-    'al-fahum',
-    'al-faiz',
-    'al-falasifa',
-    'al-falastini',
-    'al-farat',
-    'al-faris',
-    'al-farisi',
-    'al-fateh',
-    'al-fattah',
-    'al-fayed',
-    'al-fayeds',
-    'al-fayiz',
-    'al-feisal',
-    'al-feisel',
     'al-filastini',
-    'al-fitr',
-    'al-fresco',
-    'al-furat',
-    'al-furs',
-    'al-futtaim',
-    'al-gadir',
-    'al-gailani',
-    'al-gar',
-    'al-geredi',
-    'al-ghababishah',
-    'al-gharbi',
-    'al-ghareeb',
-    'al-ghouri',
-    'al-ghusayn',
-    'al-ghussein',
     'al-habara',
-    'al-habash',
-    'al-haditha',
-    'al-hafez',
-    'al-haidari',
-    'al-haj',
-    'al-hakem',
-    'al-hakkim',
-    'al-hamadani',
-    'al-hammuri',
-    'al-hamra',
-    'al-haram',
-    'al-harthy',
-    'al-hasan',
-    'al-hashemi',
-    'al-hashimi',
     'al-hashimihigher',
-    'al-hawamidah',
-    'al-hayah',
-    'al-hijara',
-    'al-hikmah',
-    'al-hithiminister',
-    'al-hiyat',
-    'al-huda',
-    'al-hufni',
-    'al-hujaylan',
-    'al-hukuma',
-    'al-hussein',
-    'al-imadi',
-    'al-imanabu',
-    'al-ink&iacute;shafi',
-    'al-insherah',
     'al-iraq',
-    'al-iskandariya',
-    'al-islam',
-    'al-islamiya',
-    'al-islamiyah',
-    'al-islamiyahshaikh',
-    'al-islamiyya',
-    'al-istishari',
-    'al-ittihad',
-    'al-izzi',
-    'al-jabr',
-    'al-jaburidefence',
-    'al-jaish',
-    'al-jamahiriya',
-    'al-jamal',
-    'al-jamiabi',
     'al-jarwan',
-    'al-jazair',
-    'al-jazairiyya',
-    'al-jazari',
-    'al-jubail',
-    'al-jubouri',
-    'al-jumaa',
-    'al-jumhouriya',
-    'al-juri',
-    'al-jurjani',
-    'al-kabab',
-    'al-kabariti',
-    'al-kadi',
-    'al-kadiri',
-    'al-kafrawi',
-    'al-kafuri',
     'al-kaisy/businessman',
-    'al-kalbani',
-    'al-kamal',
-    'al-karakiculture',
-    'al-karamani',
-    'al-kataeb',
-    'al-kaysari',
-    'al-kazem',
-    'al-kelb',
-    'al-khaba\'ith',
-    'al-khadim',
-    'al-khaldi',
-    'al-khasawinah',
-    'al-khattab',
-    'al-khawaldeh',
-    'al-khazana',
     'al-khofous',
-    'al-khowarizimi',
-    'al-khubthi',
-    'al-khudri',
-    'al-khufra',
-    'al-khuri',
-    'al-kudsi',
-    'al-kurah',
-    'al-kurshumi',
-    'al-kuwaizi',
-    'al-l-fred',
-    'al-lail',
-    'al-lawati',
-    'al-lawzi',
-    'al-lihaydan',
-    'al-llah',
     'al-ma\'ari',
-    'al-ma\'initransport',
-    'al-ma\'mun',
-    'al-maarakah',
-    'al-maashani',
-    'al-mahdiyyah',
-    'al-mahmoud',
-    'al-maidah',
-    'al-majdalawi',
-    'al-majidinterior',
-    'al-makdess',
-    'al-makdisi',
-    'al-malat',
-    'al-maliki',
-    'al-malikijustice',
-    'al-mambasi',
     'al-mansouri',
-    'al-mansurah',
-    'al-maqdisi',
-    'al-marzouk',
-    'al-mashat',
-    'al-masriforeign',
-    'al-mawla',
-    'al-mawt',
-    'al-mitlaa',
-    'al-mizze',
-    'al-moayed',
-    'al-moqaddas',
-    'al-moslemeen',
-    'al-mu\'aysam',
-    'al-mu\'ayyad',
-    'al-mu\'izz',
     'al-muajiz',
-    'al-mudarrisi',
-    'al-muntasser',
-    'al-musawar',
-    'al-mussalah',
-    'al-mutawakkil',
-    'al-nahdha',
-    'al-nakura',
-    'al-naquib',
-    'al-nasara',
-    'al-naseri',
-    'al-nemery',
-    'al-noman',
-    'al-noor',
-    'al-nouman',
-    'al-nu\'mani',
     'al-nuaymi',
-    'al-nusur',
-    'al-othman',
-    'al-qabas',
-    'al-qadisiya',
-    'al-qadissiyah',
-    'al-qahira',
-    'al-qajji',
-    'al-qasbi',
-    'al-qaseer',
-    'al-qasim',
-    'al-qawmiya',
-    'al-ragheeb',
-    'al-rai',
-    'al-rantisi',
-    'al-rasas',
     'al-rau\'uf',
-    'al-rawabidah',
-    'al-rawabidahpublic',
-    'al-rawai',
-    'al-rawi',
-    'al-razaz',
-    'al-razi',
-    'al-ribat',
-    'al-rida',
-    'al-ruweished',
-    'al-saad',
-    'al-saadi',
-    'al-saadiq',
-    'al-sabahs',
-    'al-sabbaghagriculture',
-    'al-sabt',
     'al-saddiq',
-    'al-safwani',
-    'al-sahaf',
-    'al-sahhafminister',
-    'al-saiqa',
-    'al-sakhrah',
-    'al-sakit',
-    'al-salahi',
-    'al-salih',
-    'al-samarrai',
-    'al-samrah',
-    'al-saqqaf',
-    'al-sarah',
-    'al-sarayirah',
-    'al-sarraf',
-    'al-sattar',
     'al-sayed',
-    'al-sayyid',
-    'al-senoussi',
-    'al-shaabi',
-    'al-shaaf',
-    'al-shafi',
-    'al-shahadah',
-    'al-shahwani',
-    'al-shairi',
-    'al-shakshuki',
-    'al-shanshal',
-    'al-shar\'a',
-    'al-sharaa',
-    'al-sharief',
-    'al-sharim',
-    'al-sharq',
     'al-shatti',
-    'al-shayakh',
-    'al-shoura',
-    'al-shura',
-    'al-shuraydah',
-    'al-silm',
-    'al-siman',
-    'al-siyasa',
-    'al-srour',
-    'al-srourirrigation',
-    'al-sulaim',
-    'al-sulayman',
-    'al-sunna',
-    'al-surur',
-    'al-tajamm\'u',
-    'al-talabani',
     'al-talhigher',
-    'al-tarawinah',
-    'al-tarhouni',
-    'al-ter-nan-thera',
-    'al-thairenergy',
-    'al-thawara',
-    'al-thawra',
-    'al-tikriti',
-    'al-tinah',
-    'al-tofah',
-    'al-turki',
-    'al-ubaykan',
-    'al-ulufi',
-    'al-unsi',
-    'al-unsuriyin',
-    'al-usbu',
     'al-vida',
-    'al-wafa',
-    'al-wafd',
-    'al-wafra',
-    'al-wahab',
-    'al-wahabi',
-    'al-wahsh-alayh',
-    'al-wajih',
-    'al-wasat',
-    'al-watan',
-    'al-wimpey',
-    'al-yahya',
-    'al-yaqub',
-    'al-zabin',
-    'al-zabinmunicipal',
-    'al-zahawi',
     'al-zamil',
-    'al-zaydi',
-    'al-zayni',
-    'al-zubaidideputy',
-    'al-zubi',
-    'al.5',
-    'al42',
-    'al8',
-    'ala\'al-din',
-    'ala-kaila',
-    'ala101',
-    'ala103',
-    'ala2(nh)/asn102(co)',
-    'ala89',
-    'alab',
-    'alabamy',
     'alabanda',
-    'alabaster-smooth',
-    'alabasters',
-    'alacalufe',
-    'alacantra',
-    'alacatel',
-    'alack-a-day',
-    'alactel',
-    'aladdin\'s-cave',
-    'aladdins',
-    'aladics',
-    'alaemon',
-    'alageuz',
-    'alagi',
-    'alahdal',
-    'alai',
     'alaia-inspired',
-    'alain-fr&eacute;d&eacute;ric',
-    'alaister',
-    'alajuela',
-    'alala',
-    'alam&agrave;n',
-    'alam/pakistani',
-    'alamaba',
-    'alamagordo',
-    'alaman',
-    'alamanda',
-    'alamandas',
-    'alamanic',
-    'alamanni',
-    'alamannia',
-    'alamayahu',
     'alameida',
-    'alamin',
-    'alamine',
-    'alamode',
-    'alamosaurus',
-    'alampiev',
-    'alan-a-dale',
-    'alan-is-not-here',
-    'alan/gwen',
-    'alanah',
-    'alance',
-    'alanis',
-    'alanna',
-    'alanso-majia',
-    'alanzon',
-    'alao',
     'alaodin',
-    'alaomi',
-    'alar-free',
-    'alarm-bells',
-    'alarm-bird',
-    'alarm-call',
-    'alarm-clocks',
-    'alarm-quacks',
-    'alarm/clock',
-    'alarme',
-    'alarmed.',
-    'alarmes',
-    'alarming-sounding',
-    'alarmingly-high',
-    'alarmingly.',
-    'alarmism',
     'alarms.',
-    'alarum',
-    'alashiya',
-    'alassene',
-    'alast',
-    'alast-minute',
-    'alastairs',
-    'alastel',
-    'alaszewski',
-    'alatalo',
-    'alathea',
-    'alathia',
-    'alati',
-    'alatipes',
-    'alatri',
-    'alattin',
     'alatyn',
-    'alaudidae.',
-    'alaudipes',
-    'alaunus',
-    'alavesa',
-    'alawis',
-    'alawist',
-    'alawite-controlled',
-    'alawites',
-    'alawnehagriculture',
-    'alayh',
-    'alazarin',
-    'alazi',
-    'alazon',
-    'alb&eacute;ric',
-    'alb24',
     'alb41',
-    'albacini',
-    'albacom',
-    'albacores',
-    'albania1',
-    'albanian-chinese',
-    'albanian-greek',
-    'albanian-italian',
-    'albanian-run',
-    'albanian-yugoslav',
-    'albans.',
-    'albanta',
-    'albar',
-    'albarelli',
-    'albarello',
-    'albari&ntilde;o',
     'albaro',
-    'albarracin',
-    'albarrazin',
-    'albaston',
-    'albatross-corpse',
-    'albatross-eagle',
-    'albatross-like',
-    'albaveraenergy',
-    'albazin',
-    'albe',
-    'albeans',
-    'albedo-temperature',
-    'albela',
-    'albenga',
-    'albeniz',
-    'albeola',
     'alber',
-    'alberecht',
-    'alberes',
-    'alberford',
-    'albergo-osteria',
-    'albermale',
-    'alberola',
-    'alberqueque',
-    'alberro',
-    'albert-1er',
-    'albert-finney-grim-up-north-\'60s-kitchen-sink',
-    'albert-the-dwarf',
-    'alberta-based',
-    'albertie',
-    'albertillery',
-    'albertson',
     'albertyn',
-    'albery/master/university',
-    'albian',
-    'albians',
-    'albicauda',
-    'albicocche',
-    'albid',
-    'albide',
-    'albignac',
-    'albimonus',
-    'albino-white',
-    'albion\'',
-    'albionis',
-    'albionites',
-    'albir',
-    'albireonidae',
     'albisguetli',
-    'albiston',
-    'albite/oligoclase',
-    'albo-marginata',
-    'albonubes',
-    'albopicta',
-    'albor',
-    'albornoz',
-    'albou',
-    'albourne',
-    'albout',
-    'albowitz',
-    'albray',
-    'albreda',
-    'albricci',
-    'albrich',
     'albrizzi',
-    'albro',
-    'albrough',
-    'albuhera',
-    'album-addled',
-    'album-by-album',
-    'album-oriented',
-    'album-selling',
-    'albumares',
-    'albumbl&auml;tter',
-    'albumin(bsa)',
-    'albumin/',
-    'albumin/1%',
-    'albumine',
-    'albumins',
-    'alc&aacute;zar',
     'alc-free',
-    'alcachofas',
-    'alcadena',
-    'alcama',
-    'alcamo',
-    'alcar',
-    'alcaraz',
-    'alcasa',
-    'alcatorda',
-    'alcaydes',
-    'alcebiades',
-    'alcedinidae',
-    'alceron',
-    'alceu',
-    'alchata',
-    'alchemal',
     'alchemic',
-    'alchemie',
-    'alchemillas',
-    'alchemise',
-    'alchemised',
-    'alchemising',
-    'alchian-demsetz',
-    'alchima',
-    'alchimia',
-    'alchimy',
-    'alcimus',
-    'alcinous',
-    'alciphron',
-    'alcl3',
-    'alclad-covered',
-    'alcmaria',
     'alcock/consultant',
-    'alcoho',
-    'alcohol&rehy;released',
-    'alcohol-abuse',
-    'alcohol-blending',
-    'alcohol-by-volume',
-    'alcohol-divining',
-    'alcohol-fuelled',
-    'alcohol-guzzling',
-    'alcohol-inspired',
-    'alcohol-laden',
-    'alcohol-linked',
-    'alcohol-powered',
-    'alcohol-soaked',
-    'alcohol-vapour',
-    'alcohol-washed',
     'alcohol/diesel',
-    'alcohol/drugs/suicide',
-    'alcohol/petrol',
-    'alcohol:chloroform',
-    'alcohol:concentrated',
-    'alcohol:diethyl',
-    'alcoholicbeverages',
-    'alcoholico',
-    'alcoholics.',
-    'alcoholised',
-    'alcolea',
-    'alcometer',
-    'alcools',
-    'alcothon',
-    'alcotts',
-    'alcove-like',
     'alcoy',
-    'alcs',
-    'alcuin.',
-    'alcy',
-    'alda&ntilde;a',
-    'aldabrensis',
-    'aldanti',
-    'aldarion',
-    'aldate\'s.',
-    'aldebert',
-    'aldeburgh/thorpeness',
-    'aldec',
-    'aldegond',
-    'alden/birmingham',
-    'alden/taylors',
-    'aldens',
     'alder-bodied',
-    'alder-fringed',
-    'alder-strewn',
-    'alder-wood',
-    'alderbourne',
-    'alderfield',
-    'alderford',
-    'alderleys',
-    'aldermanni',
-    'aldermaston-based',
-    'alderney-southampton',
-    'alderneys',
-    'aldershits',
-    'alderside',
-    'alderson/aid',
-    'alderson/rare',
     'alderston',
-    'alderton/gloucestershire',
-    'aldhs',
-    'aldines',
-    'aldingtondid',
-    'aldino',
-    'aldis-type',
-    'aldius',
-    'aldlerman',
-    'aldobrandini',
-    'aldomovar',
-    'aldorandini',
-    'aldrdige',
-    'aldrichian',
-    'aldridges',
-    'aldrigde',
     'aldrington',
-    'alds-related',
-    'aldus/microsoft',
-    'aldusa',
-    'aldwarke',
-    'aldwinckle',
-    'aldwinkle',
-    'aldy',
-    'aldys',
-    'ale-cart',
-    'ale-casks',
-    'ale-coloured',
-    'ale-conner',
-    'ale-cup',
-    'ale-horn',
-    'ale-jug',
     'ale-kegs',
-    'ale-only',
-    'ale-scented',
-    'ale-soaked',
-    'ale-taster',
-    'ale-type',
-    'ale-women',
-    'ale/cider',
-    'aleaflet',
-    'aleandro',
-    'aleatoricism',
-    'aleck',
-    'aleconners',
-    'alectoria',
-    'alectricity',
-    'alectura',
     'aledby',
-    'alegal',
-    'alegbe',
-    'alegret',
-    'alehook',
-    'alehousekeepers',
-    'aleix',
-    'alejack',
-    'alejacks',
-    'alejandra',
-    'alejandrino',
-    'alejchem',
-    'aleksandrovsk-sakhalinsky',
-    'aleksandru',
-    'aleksey',
-    'alekum',
     'alella',
-    'aleluia',
-    'alem',
-    'alemania',
-    'alemannian',
-    'alemayehu',
-    'alembick',
-    'alemka',
-    'alena',
-    'alende',
-    'alene',
-    'alenuihaha',
-    'aler',
-    'alerent',
-    'alero',
-    'alert.warning',
     'alerter',
-    'alertmanager',
-    'alesanaprime',
-    'aleshkovsky',
-    'alesina',
-    'alesjandro',
-    'alessandria',
-    'alessandro.',
-    'aleta',
-    'alethopteris',
-    'aletsch',
-    'aleuin',
-    'aleurites',
-    'aleut',
-    'aleveraged',
-    'aleves',
     'alevi',
-    'alevin',
-    'alex/aged',
-    'alexanco',
-    'alexand',
-    'alexander-historians',
-    'alexander-vanenburg',
-    'alexander/barclay',
-    'alexander/lion',
-    'alexander/pearce',
-    'alexander/solicitor',
-    'alexander/wiltshire',
-    'alexandersen',
-    'alexandr',
-    'alexandria-brindisi',
-    'alexandrian-roman',
     'alexandrian-theoretical',
-    'alexandrianism',
-    'alexandrine',
-    'alexandrines',
-    'alexandrins',
-    'alexandros',
-    'alexanko',
-    'alexei.',
-    'alexeievich',
-    'alexeivitch',
-    'alexendrinum',
-    'alexr',
-    'alexsey',
-    'aleyeska',
-    'alezia',
-    'alf&acirc;ndega',
     'alf&ouml;ld',
-    'alf&ouml;ldi',
-    'alf(9)',
-    'alfa-laval/tetrapak',
-    'alfa-romeos',
-    'alfabetical',
-    'alfac',
-    'alfandanga',
-    'alfed',
-    'alfeyo',
-    'alfi',
-    'alfieri.',
-    'alflora',
-    'alfoldean',
-    'alfonsist',
-    'alfoxton',
     'alfred-wegener-institut',
-    'alfredson',
-    'alfreston',
-    'alfreton/mansfield',
-    'alfsen',
-    'alfwen',
-    'alfwy',
-    'alfy',
-    'alg&eacute;brique',
-    'algae-bloom',
-    'algae-busters',
-    'algae-control',
-    'algae-eating',
-    'algae-encrusted',
-    'algae-free',
-    'algae-laden',
     'algae-like',
-    'algae-preventing',
-    'algae-smothered',
-    'algae-wise',
-    'algae/hydra',
-    'algal/plant',
-    'algalogist',
-    'algarth',
-    'alge&rehy;rian',
-    'algebra.',
-    'algebraicae',
-    'algebriques',
-    'algen',
-    'algenkulturen',
-    'algeo',
-    'algerian-supported',
     'algerian.and',
-    'algerie',
-    'algerienne',
-    'algeriet',
-    'alghouth',
-    'algicides/fish',
-    'algidae',
-    'algigator',
-    'algimantas',
-    'algistat',
-    'algizin-p',
-    'algol68',
-    'algolagnia',
-    'algometric',
-    'algon',
-    'algorithm1',
     'alguacil',
-    'alhadra',
-    'alhambrinal',
-    'alhamdulillah',
-    'alhena',
-    'alhenc-gelas',
-    'alhmund',
-    'alho',
-    'ali\'i',
-    'ali-al-arabi',
-    'ali-ashgar',
-    'ali-i',
-    'ali-khan',
-    'ali-nassar',
-    'ali-rachedi',
-    'ali-shavers',
     'ali-style',
-    'aliaga',
-    'alias-created',
-    'alias-format',
-    'alias.',
-    'aliasmanager',
-    'aliasmapper',
-    'aliastime',
-    'alibar',
-    'alibert',
-    'aliberti',
-    'alibi\'',
-    'alicata',
-    'alice-band',
-    'alice-his',
-    'alice/do',
     'alicia-jane',
-    'alicja',
-    'alicommerce',
-    'alicyclic',
-    'alicyclics',
-    'alie',
-    'alien&amp;sup3',
-    'alien-ated',
-    'alien-excluding',
-    'alien-fever',
-    'alien-infested',
-    'alien-mashing',
-    'alien/human',
-    'aliena',
-    'alienating-reconciling',
-    'alienation\'',
     'alienation-effect',
-    'alienees',
-    'alienists',
-    'aliens.',
-    'alientative/coercive',
-    'alienum',
-    'alieu',
-    'alif',
-    'aligen',
-    'alighed',
-    'alighiero',
-    'alihan',
-    'alii',
-    'aliis',
-    'alijon',
-    'alikuona',
     'alim',
-    'alimbaev',
-    'alimenta',
-    'alimentarium',
-    'alimentation',
-    'alimenticios',
-    'aliminium',
-    'alimonies',
-    'alimony/maintenance',
-    'alimunium',
-    'alimzhanov',
-    'alingsas',
-    'alioli',
-    'aliorum',
-    'alioth',
-    'alip',
     'aliphatics',
-    'alipio',
-    'aliqout',
-    'aliquantum',
-    'aliquid',
-    'aliran',
-    'alis&eacute;e',
-    'alis-moy-days',
-    'alisdairs',
-    'alise-sainte-reine',
-    'alisky',
-    'alisma',
-    'alismoides',
-    'aliso',
-    'alison&mdash;john',
-    'alison/ayr',
     'alisons',
-    'aliss',
-    'alissa',
-    'alisya',
-    'alit',
-    'aliterioi',
-    'alitia',
-    'alititudes',
-    'alittle',
-    'alium',
-    'alivardi',
-    'alive-oh',
-    'alive.and',
-    'alive.but',
-    'alive.frankie',
-    'aliviate',
     'alix-haunts',
-    'aliyah',
-    'alizanza',
-    'alization',
-    'aljmas',
-    'aljos',
-    'alka&rehy;seltzer',
-    'alkal',
-    'alkali-aggregate',
-    'alkali-olivine',
-    'alkaline-phospatase',
-    'alkaline-phosphatase',
-    'alkaline-phosphatase-conjugated',
-    'alkaline-preferring',
-    'alkalinization.',
-    'alkalisation',
     'alkalising',
-    'alkaptonuria',
-    'alkartasuna-ea',
-    'alkaseltzer',
-    'alkborough',
-    'alkem',
-    'alkemade',
-    'alkenes.',
-    'alkerton',
-    'alkhattat',
-    'alkie',
-    'alkin',
-    'alkmaar',
-    'alkmaionid',
-    'alkoxy',
-    'alkozamah',
     'alkul',
-    'alky',
-    'alkyl-phospholipds',
-    'alkylamines',
-    'alkylbenzene',
-    'alkyne',
-    'alkynes.',
-    'all&eacute;gretto',
-    'all&mdash;a',
-    'all&mdash;electric',
-    'all&mdash;if',
-    'all&mdash;night',
-    'all&mdash;she',
-    'all&mdash;the',
-    'all&ndash;seating',
-    'all&rehy;and',
     'all&rehy;female',
-    'all&rehy;lowed',
-    'all&rehy;or-none',
-    'all&rehy;perhaps',
-    'all&rehy;pervading',
-    'all&rehy;pervasive',
-    'all&rehy;singing',
-    'all&rehy;steel',
-    'all&rehy;too-often',
-    'all&rehy;victorian',
-    'all\'-inclusive',
-    'all\'n',
-    'all\'s-well-that-ends-well',
-    'all\'uovo',
-    'all(a)',
-    'all-a',
     'all-accepting',
-    'all-accommodating',
-    'all-acoustic',
-    'all-aged',
-    'all-ages',
-    'all-aldeburgh',
-    'all-amateur',
-    'all-americans',
-    'all-amhara',
-    'all-and',
-    'all-and-sundry',
-    'all-appraising',
-    'all-arab',
-    'all-arable',
-    'all-army',
-    'all-arrhythmic',
     'all-asia',
-    'all-asian',
-    'all-assuming',
-    'all-auto',
-    'all-bar',
-    'all-barking',
-    'all-bbc',
-    'all-beauty',
-    'all-beholding',
-    'all-bells-and-whistles',
-    'all-berlin',
-    'all-blessed',
-    'all-boy',
-    'all-britain',
-    'all-brown',
-    'all-bsp',
     'all-burma',
-    'all-bust-and-bum',
-    'all-but-island',
-    'all-but-naked',
-    'all-but-spoken',
-    'all-but-sterile',
-    'all-but-written',
-    'all-canadian',
-    'all-cartier',
-    'all-cash',
-    'all-ceylon',
-    'all-change-is-for-the-worse',
-    'all-channel',
-    'all-chrome',
-    'all-chub',
-    'all-city',
     'all-civilian',
-    'all-class',
-    'all-cleansing',
-    'all-coats',
-    'all-concealing',
-    'all-conclusive',
-    'all-connecting',
-    'all-conqu\'ring',
-    'all-containing',
-    'all-corners',
-    'all-corridor',
-    'all-covered',
-    'all-covering',
-    'all-creating',
-    'all-cylinders',
-    'all-dazzling',
     'all-decisive',
-    'all-devouring',
-    'all-dinghy',
-    'all-dissolving',
-    'all-dredge',
-    'all-drive',
-    'all-dublin',
-    'all-ecuadorian',
-    'all-edinburgh',
-    'all-employee',
-    'all-encroaching',
-    'all-english',
-    'all-engrossing',
-    'all-entertaining',
-    'all-essex',
-    'all-exclusive',
     'all-expenses-paid-honeymooners',
-    'all-explaining',
-    'all-family-reunion',
-    'all-fire',
-    'all-first',
-    'all-fish',
-    'all-flying',
-    'all-freight',
-    'all-fresh',
-    'all-gay',
-    'all-gershwin',
-    'all-girl-trio',
-    'all-giving',
-    'all-gloucester',
-    'all-go',
-    'all-good',
     'all-governing',
-    'all-grassed',
-    'all-gudgeon',
-    'all-happening',
-    'all-hazards-at-a-place',
-    'all-heal',
-    'all-highland',
-    'all-hindemith',
-    'all-holy',
-    'all-howler',
-    'all-illuminating',
-    'all-importance',
-    'all-in-1',
-    'all-in-ones',
-    'all-in-the-mind',
-    'all-in-white',
     'all-in-wrestling',
-    'all-including',
-    'all-informing',
-    'all-innocent',
-    'all-internal',
-    'all-interval',
-    'all-invasive',
-    'all-irish',
-    'all-iron',
-    'all-ischaemic',
-    'all-island',
-    'all-italian',
-    'all-just',
-    'all-laminate',
-    'all-laughing',
-    'all-leather',
     'all-lite',
-    'all-live',
-    'all-london',
-    'all-loving',
-    'all-loving-',
-    'all-lurgan',
-    'all-macedonian',
-    'all-manchester',
-    'all-marble',
-    'all-masculine',
-    'all-merseyside',
-    'all-military',
-    'all-mod-cons',
-    'all-modern',
-    'all-mothering',
-    'all-my-worldly-goods',
     'all-national',
-    'all-navy',
-    'all-north',
-    'all-nude',
-    'all-of-a-piece',
-    'all-or',
-    'all-ordinaries',
-    'all-painting',
-    'all-pale',
-    'all-pals-together',
-    'all-penetrating',
-    'all-pensioner',
-    'all-permeating',
-    'all-persons',
-    'all-pervasively',
-    'all-pervasiveness',
     'all-pink',
-    'all-planet',
-    'all-planetary',
-    'all-polish',
-    'all-pop',
-    'all-possible',
-    'all-preceding',
-    'all-premier',
-    'all-present',
-    'all-pro',
-    'all-programme',
-    'all-protective',
-    'all-racial',
-    'all-resigned',
-    'all-ri-i-ighhttt',
-    'all-right-squire',
     'all-risks',
-    'all-ruling',
-    'all-rutshire',
-    'all-sacrificing',
-    'all-sand',
-    'all-satellite',
-    'all-saying',
-    'all-scotland',
-    'all-second',
-    'all-serb',
-    'all-sheltering',
-    'all-sided',
-    'all-singing-all-dancing',
-    'all-smothering',
-    'all-snow',
-    'all-socialist',
     'all-soldier',
-    'all-solid',
-    'all-sort',
-    'all-southern',
-    'all-standing',
-    'all-state',
-    'all-stations',
-    'all-street',
-    'all-strong-form',
-    'all-stupid',
-    'all-sufficient',
-    'all-swallowing',
-    'all-swearing',
-    'all-swinging',
-    'all-synchro',
-    'all-synthetic',
     'all-syrian',
-    'all-system',
-    'all-talking',
-    'all-the-',
-    'all-they',
-    'all-things-in-one',
-    'all-time-low',
-    'all-together',
-    'all-told',
-    'all-too&rehy;nearly-public',
-    'all-too-accepting',
-    'all-too-active',
-    'all-too-apparent',
-    'all-too-appropriate',
-    'all-too-audible',
-    'all-too-authentic',
     'all-too-believable',
-    'all-too-close',
-    'all-too-close-to-home',
-    'all-too-competent',
-    'all-too-comprehensible',
-    'all-too-conscientiously',
-    'all-too-easily',
-    'all-too-easy',
-    'all-too-evident',
-    'all-too-few',
-    'all-too-flimsy',
-    'all-too-heavy',
-    'all-too-infrequent',
-    'all-too-many',
-    'all-too-neat',
-    'all-too-personal',
     'all-too-precious',
-    'all-too-real',
-    'all-too-reasonable',
-    'all-too-regular',
-    'all-too-short',
-    'all-too-solid',
-    'all-too-successful',
-    'all-too-sure-of-himself',
-    'all-too-tempting',
-    'all-too-terribly',
-    'all-too-typical',
-    'all-too-vulnerable',
-    'all-torness',
-    'all-trans',
-    'all-transforming',
-    'all-tripura',
     'all-triumphant',
-    'all-twisting',
-    'all-uk',
-    'all-ulster',
-    'all-vegetable',
-    'all-vocal',
-    'all-way',
-    'all-welded',
-    'all-well',
-    'all-welsh',
-    'all-whites',
-    'all-winners',
-    'all-wooden',
-    'all-worrying',
-    'all-xxxx',
-    'all-yellow',
     'all-you-can-eat',
-    'all-you-can-remember',
-    'all-yugoslav',
-    'all.important',
-    'all.in',
-    'all.that',
-    'all.the',
-    'all.you',
-    'all/channel',
-    'all/female',
-    'all/given',
-    'all/i',
-    'all/part/',
-    'all/some',
-    'all/the',
-    'all/why',
     'all:james',
-    'all_,_all_right',
-    'all_all_of_a_sudden',
-    'all_all_the_same',
-    'all_at',
-    'all_in_all',
-    'all_know',
-    'all_up',
-    'allaaaaah',
-    'allab',
-    'alladin',
-    'allafouza',
-    'allaghi',
-    'allah-o-akbar',
-    'allah/',
-    'allahbad',
     'allahedin',
-    'allahgreen',
-    'allahumma',
-    'allaker',
-    'allakhverdiyev',
-    'allaleh',
-    'allama',
-    'allamand',
-    'allambie',
-    'allamby',
-    'allampo',
-    'allan.',
-    'allan/course',
-    'allan/managing',
-    'allante',
-    'allanville',
     'allanwater',
-    'allapeens',
-    'allards',
-    'allato.cathy',
-    'allatonceness',
-    'allatson',
-    'allatsons',
-    'allbreeds',
-    'allbut',
-    'allc',
-    'allcock/world',
-    'allconlablib',
-    'allcorn',
-    'alldayer',
-    'allder',
-    'alldis',
     'allean',
-    'alleberg',
-    'alled',
-    'alleg',
-    'allega-tions',
-    'allegaert',
-    'allegaten',
-    'allegation(s)',
-    'allegations.',
-    'alleged&lsqb',
-    'allegedinsisted',
-    'allegiance\'',
-    'allegiance-',
-    'allegorisation',
-    'allegorised',
-    'allegorist',
     'allegre',
-    'allegtes',
-    'allekto',
-    'allelopathic',
-    'allelopathy',
-    'allelotype',
-    'allelujah',
-    'alleluya',
-    'allemanie',
-    'allemann',
-    'allemansratt',
-    'allemant',
-    'allement',
-    'allemoniere',
-    'allen-headed',
-    'allen-key',
     'allen-martin',
-    'allen/boat',
-    'allen/bristol',
-    'allen/conservator',
-    'allen/mother',
-    'allen/neighbour',
-    'allen/transplant',
-    'allenbury',
-    'allenchecks',
-    'allender',
-    'allendiscovers',
-    'allendy',
-    'allengunge',
-    'allenheads',
-    'alleni',
-    'allenstein-marienwerder',
     'allepeen',
-    'allerdings',
-    'allerdyce',
-    'allergan',
-    'allergen-sensitized',
-    'allergic-type',
-    'allergy-exclusion',
-    'allergy-like',
-    'allergy-prone',
-    'allergy-tested',
-    'allergy.',
-    'allerheigen',
-    'allerley',
-    'allermuir',
-    'allerod',
-    'allers',
     'allerted',
-    'allertext',
-    'allesborough',
-    'alletsons',
-    'alletti',
-    'alleva',
-    'alleway',
-    'alley&rehy;ways',
-    'alley-cats',
-    'alley-cropped',
-    'alley-cropping',
-    'alley-fighter',
-    'alley-kid',
-    'alley-sneakers',
-    'alley-style',
-    'alleymen',
     'alleynes',
-    'alleynian',
-    'alleynians',
-    'allez-henri',
-    'allford',
-    'allfoxden',
-    'allfree',
-    'allgemeiner',
-    'allgrove',
-    'alliali',
-    'alliance&mdash;pa',
-    'alliance&mdash;wa',
-    'alliance-building',
-    'alliance-inclined',
-    'alliance-led',
-    'alliance-making',
     'alliance-opposition',
-    'alliance/violence',
-    'alliance6.84.0104',
-    'allianceabu',
-    'allicin',
-    'allied-maples',
-    'allied-protected',
-    'allied2n/a',
-    'alliedsignal',
-    'allies.',
-    'alligarh',
-    'alligator-hide',
-    'alligator-infested',
-    'alligazoos',
-    'alliin',
-    'allimportant',
     'allinclusive',
-    'allinger',
-    'allinson/gp',
-    'allinsonsaimed',
-    'allio',
-    'allionii',
-    'allipio',
-    'allis/brother',
-    'allison-powered',
-    'allison/asbestosis',
-    'allisons',
-    'alliss/widow',
-    'allistair',
-    'allistragh',
-    'allit-eration',
-    'alliterate',
     'alliterated',
-    'alliterative-itis',
-    'alliteratively',
-    'alll',
-    'allll',
-    'alllll',
-    'allmark',
-    'allmetal',
-    'allmilm&ouml',
-    'alln&auml;chtlich',
-    'allnat',
-    'allness',
-    'allnight',
-    'allnutt',
-    'alloa-based',
-    'alloantigen',
     'alloantigens',
-    'alloc',
-    'alloca&rehy;tion',
-    'allocated.',
-    'allocation-by-voice',
-    'allochemical',
-    'allochthon',
-    'allochthonists',
-    'allograph',
-    'allographs',
-    'alloiance',
-    'allolobophora',
-    'allomerus',
-    'allometries',
-    'allomorphs',
-    'allons',
     'alloone',
-    'allopathically',
-    'allopathists',
-    'allophenic',
-    'allopolyploidy',
-    'allori',
-    'allorto',
-    'allosterically',
-    'allotechnology',
-    'allotment-holding',
-    'allotment-sized',
-    'allotmenteer',
-    'allotoca',
-    'allottees',
-    'allouatta',
-    'allow&rehy;ance',
     'allow.the',
-    'allow_a',
-    'allow_for',
-    'allowability',
-    'allowance.cheltenham',
-    'allowance/accommodation',
-    'allowanceas',
-    'allowances/benefits',
-    'allowant',
-    'allowe',
-    'allowed&mdash;which',
-    'allowed/seen',
-    'allowedamendment',
-    'alloxan-induced',
-    'alloxydim-sodium',
-    'alloy*',
     'allozymic',
-    'allplot',
-    'allrbeste',
-    'alls',
-    'allsebrook',
-    'allshot',
-    'allso',
-    'allsop/friend',
-    'allsopp/inventor',
-    'allsopp/newhnam',
-    'allsopps',
-    'allspeeds',
-    'allspice.',
-    'allstate',
-    'allsworthy',
-    'allt&auml;glichkeit',
     'allua',
-    'allula',
-    'alluminium',
-    'allureth',
-    'allusionary',
-    'allway',
-    'allwoods',
-    'allwork',
-    'allworth',
-    'allwyn',
-    'ally:margaret',
-    'allyl',
-    'allyne',
-    'alm&eacute',
-    'alm&iacute;lcar',
-    'almades',
     'almaguey',
-    'almah',
-    'almahan',
-    'almains',
-    'alman',
-    'almandines',
-    'almansi',
-    'almanzar',
-    'almanzora',
-    'almara',
-    'almayo',
-    'almaza',
-    'almegi&agrave',
-    'almeh',
-    'almendro',
-    'almer',
     'almere',
-    'almeri&aacute',
-    'almerino',
-    'almetevsk',
-    'almeyreda',
-    'almightily',
-    'almightly',
-    'almind',
-    'almond-flavoured',
-    'almond-scented',
-    'almond-slitted',
-    'almond-stone',
-    'almond-stuffed',
-    'almond/cramond',
-    'almond/modern',
-    'almond/slate',
     'almondbury',
-    'almondesque',
-    'almondwood',
-    'almondy',
-    'almoners',
-    'almoro',
-    'almost&rehy;evangelical',
-    'almost-',
-    'almost-accidental',
-    'almost-blind',
-    'almost-built',
-    'almost-country',
-    'almost-defunct',
-    'almost-deserted',
-    'almost-ex-wife',
-    'almost-finished',
     'almost-friends',
-    'almost-gold',
-    'almost-historic',
-    'almost-instant',
-    'almost-level',
-    'almost-lost',
-    'almost-lover',
-    'almost-mechanical',
-    'almost-naked',
-    'almost-official',
-    'almost-original',
-    'almost-pain',
-    'almost-parodied',
-    'almost-privacy',
-    'almost-respectable',
-    'almost-shrillness',
     'almost-sleep',
-    'almost-smile',
-    'almost-straight',
-    'almost-too-good-to-be-true',
-    'almost-truth',
-    'almost-unanimous',
-    'almost.following',
-    'almost_no',
-    'alms-giving',
-    'alms-man',
-    'almsboat',
-    'almscliff',
-    'almudena',
-    'almunia',
-    'almut',
-    'alnae',
     'alnemri',
-    'alney',
-    'alnham',
-    'alnico-v',
-    'alnie',
-    'alnifolia',
-    'alnifolio',
-    'alnilam',
-    'alno10c',
-    'alnod',
-    'alnwickhill',
-    'aloba',
-    'alocholic',
-    'alocohol',
-    'aloe-vera',
-    'aloft-\'means',
     'alogo',
-    'alohura',
-    'aloizas',
-    'aloka',
-    'alokut',
-    'alomar',
-    'alombie',
-    'alomost',
-    'alon/film',
-    'alone&mdash;she',
-    'alone\'',
-    'alone-\'solo\'-all',
-    'alone-53',
-    'alone-ness',
-    'alone.',
-    'alone.if',
     'alone/all',
-    'alone1',
-    'along&mdash;it',
-    'along-',
-    'along-just',
-    'along-strike',
-    'along-track',
-    'along.',
-    'alongee',
-    'alongees',
-    'alongi',
-    'alongide',
-    'alongs',
-    'alongwith',
-    'alonmg',
-    'aloo',
     'aloof.',
-    'alooking',
-    'aloon',
-    'aloplast',
-    'alopochen',
-    'alor',
-    'alorna',
-    'aloroso',
-    'alotta',
-    'alotted',
-    'alou',
-    'alouettes',
-    'aloussine',
-    'aloutte',
-    'alowing',
-    'aloxe-corton',
     'alp&emacr;nos',
-    'alp-dominated',
-    'alp-green',
-    'alp-like',
-    'alp-watchers',
-    'alpac',
-    'alpallana',
-    'alpalo',
-    'alpani',
-    'alpargatas',
-    'alpart',
-    'alpbach',
-    'alpdruek',
-    'alpenglow',
-    'alpenie',
-    'alpenl&auml;ndische',
     'alpenstein',
-    'alpenstocked',
-    'alper',
-    'alperns',
-    'alperrecords',
-    'alpers',
-    'alperton',
-    'alpestre',
-    'alpestris',
-    'alpex',
-    'alpha&amp;sup1',
-    'alpha&amp;sup2',
-    'alpha&ndash;numeric',
-    'alpha-1-acid',
-    'alpha-1-antichymotrypsin',
-    'alpha-1-antitrypsin',
     'alpha-2-antiplasmin',
-    'alpha-acid',
-    'alpha-adrenergic',
-    'alpha-adrenoceptor',
-    'alpha-grade',
-    'alpha-helical',
-    'alpha-helices',
-    'alpha-level',
-    'alpha-lobe',
-    'alpha-nt',
-    'alpha-only',
-    'alpha-purple',
-    'alpha-rated',
-    'alpha-receptor',
-    'alpha-shaped',
-    'alpha-vax',
     'alpha/open',
-    'alphabet-land',
-    'alphabet.',
-    'alphabet=61',
-    'alphabetically-adaptable',
-    'alphabetise',
-    'alphabetised',
-    'alphabetises',
-    'alphabetising',
-    'alphabtically',
-    'alphabungarotoxin',
-    'alphacell',
-    'alphachloralose',
-    'alphage',
-    'alphahatim',
-    'alphajet',
     'alphandery',
-    'alpharel',
-    'alphatronic',
-    'alphege',
-    'alphi-11',
-    'alphie',
-    'alphington',
-    'alphoid',
-    'alphons',
-    'alphonse-jourdain',
-    'alphonsia',
-    'alphonsines',
-    'alphorn',
-    'alpiger',
-    'alpine-clear',
-    'alpine-himalayan',
     'alpiniste',
-    'alpins',
-    'alpnacher',
-    'alpnachstad',
-    'alpnet',
-    'alportian',
-    'alps-sized',
-    'alps92&ndash;1',
-    'alpspitz',
-    'alpstobete',
-    'alpuk',
-    'alquila',
-    'alrad',
-    'alrakis',
-    'alrea',
-    'already&mdash;well',
     'already-advanced',
-    'already-assumed',
-    'already-boiling',
-    'already-dead',
-    'already-depleted',
-    'already-done',
-    'already-estranged',
-    'already-excellent',
-    'already-existent',
-    'already-flourishing',
-    'already-fragile',
-    'already-held',
-    'already-high',
-    'already-honed',
-    'already-hot',
-    'already-it',
     'already-nervous',
-    'already-notable',
-    'already-opened',
-    'already-paid',
-    'already-perceptible',
-    'already-processed',
-    'already-published',
-    'already-submitted',
-    'already-traded',
-    'already-urbanized',
-    'already-victorious',
-    'already-wealthy',
-    'already-widespread',
-    'alred',
-    'alredy',
-    'alreeady',
     'alreet',
-    'alridge',
-    'alright\'',
-    'alrightness',
-    'alrighty',
-    'alrighty-tighty',
-    'alrins',
-    'alroth&commat;cix:compulink.co.uk.ac',
-    'alrouse',
-    'alroy',
-    'als&commat;vl.ts.kiev.ua',
-    'alsaadoum',
-    'alsabti',
-    'alsace&rehy;lorraine',
-    'alsao',
-    'alsatian-collie',
     'alsatian-type',
-    'alsatian/labrador',
-    'alsations',
-    'alsbroke',
-    'alschuler',
-    'alse',
-    'alsecure',
-    'alsek',
-    'alshemist',
-    'alsikes',
-    'alsing',
-    'also\'/\'in',
-    'also-enclosed',
-    'also-manager',
-    'also-of',
-    'also-probably',
     'also.',
-    'also.so',
-    'also/specifically',
-    'alsoft',
-    'alsoo',
-    'alst',
-    'alstadt',
-    'alstemus',
-    'alsthom-atlantique',
-    'alstoe',
-    'alstonefield',
-    'alstroemaria',
-    'alstromerias',
-    'alt(g)',
-    'alt(g1)',
-    'alt+ctrl',
     'alt+esc',
-    'alt+f7',
-    'alt+m',
-    'alt+print',
-    'alt+t',
-    'alt-255',
-    'alt-berlin',
-    'alt-c&ouml;lln',
-    'alt-enter',
-    'alt-r',
-    'alt-wiener',
-    'alt.suit.att-bsdi',
-    'altagoan',
-    'altai&oacute',
-    'altaians.',
-    'altal-sayan',
     'altamkahuyag',
-    'altamura',
-    'altar-candle',
-    'altar-cloth',
-    'altar-cloths',
-    'altar-flame',
-    'altar-frieze',
+)
+
+blocks_89 = (
+    '$"u.#)acmasteri$&ritima"$n.c.$"f.$"l.$%other$"r.#&icosia$&jsseni""o.$"a.$"r.")p.f./mill$"j.',
+    '&%james$"u.#%erson#$iece"$r.b.$"c.$"g.$$p.s.%$enck$\'wallace"#s.a$"b.$!l$$m.e.$"o.',
+    '#\'essilis#$hell##ome#(taircase$*reetwalker"$t.j.$"v."-understanding"$v.r.#$illa##olz"(w.a.c.s.$$o.l.#"hy#%ilson',
+    '+!2+!3+!4+!5+!7+!8*"10+!1+!2+!3+!4+!5+!6+!7+!8',
+    '*"20+!1+!2+!3+!4+!5+!6+!8)#103&&5/0003+!5#+2/28/0001-1#)8/25/0001#!9$(/25/0006',
+    '*"12+!3+!6"!1#)6/25/0001+!2"*23/32/0004*"16+!7*"21+!2+!4+!5+!8+!9',
+    '+!3+!4+!5+!6#)7/63/0001"$33/2&&5/0004*"11*"26*"32+!5+!6+!9*"42+!6',
+    '+!8#)5/25/0002+#7-1#)8/26/0011"!4#)4/25/0013+!8&&6/0005"!8""al#!z"(b-hybrid"(cn.9/265"!d"#g=c',
+    '""me"!o#$/r/c"%party"#sew#\'hanghai#(ingapore"#the$$ough##ype!$0-a7"!1"!2",620&ndash;00%#-00',
+    '!*1&ndash;a3*!8".-bloody-mighty#$plus"".5"!/#"a2#&m62/m1#"y1"%0-u25#"0m#"33#"44$!9#"58',
+    '"#120$!7#!3#+92&ndash;01"#214#"53""31$"23#!3#!4#!9""48#!9"-501/89(t1093)#,28/89(t1102)',
+    '#!4"%6-199$(year-old##.50#!6#&9/a170""77#!8#!9""81#!5""98"!m"!s!+2&mdash;001',
+    '"#-a4$!6"".1#!4"#037"\'1/a2100#"00"%3/m23#"17$-87-stimulated"!4#"31#,82/89(t1102)#!9""50',
+    '#*8blv-5085n")6(france)#%0/280#!4#!7""71#!2#!3#!5$!."!9#!9"$:a53")b5-coated"$c4e2',
+    '!#3\'s"#(2)"#-a4#(c2-b4-a6"%.t14\'"$/m25#"y3"#000#!2#"66""10$$-300$!s#!6"#21s',
+    '#!8"$4/m4$+oxfordshire#&4/a360#!5#!6"-531/89(t1104)$+2/89(t1101)"!6#"0p"!7""86""99#"ac"<:5\'-ggaaatttggagcctactgag-3\'',
+    '"!m"%x/ah4!"4+"&-a5-a6$4nd-a-bit-on-the-side"#.00"#/y4"-0/oxfordshire#!1#"31#!4$!1$!2$!3#"59',
+    '#!s""10$!7#!3$!0$!6#!9""24""32#!3""49""51#!3""66"$7409',
+    '""93!%5-a49#$size"$.38m#!5"$/a55##m42"#025#!5#"96"#105#!3#!5$!2#!7',
+    '#"23#!3"!3#!4""42""64""70""90#!2#!3"<i:5\'-gcaggcctgggatacggatc-3\'!$6(m)""-2"#007#"89',
+    '#!s"#106#"16""23#!5"!3#!5#!6#!7#!9""43#!6""56""64""92',
+    '#!8"!a""m5#!8!"7+"#/a8#"y7""00#!2#!6#!7#!8"\'1/b7031"*3&ndash;39*"40',
+    '""55#!8"!6"$7003""e7!+8&ndash;a10"!+"#/y8""14"!3#!6"!4""56"%6/d86#!7',
+    '""83#!7"!9#!0#!4#!6!"9\'"#/24""37""41""50"!6""81#!5!%:0,25',
+    '"%not-a"/qbasic.ex&mdash)*hl&mdash;c)(in&mdash"%share"!x!&=0.505$#999"#421"%53.56"\'average""b=$%111.4%%21.35"!c',
+    '"$less"\'openout!!_",,_been_a_bit$+do_a_little$5for_a_,_for_a_,_a_few*#few$*he\'s_a_bit&9_had_a_,_he_had_a_,_a_lot$)i\'m_a_bit%+s_a_,_a_lot$-with_a_little")a_,_a_few$%a_few$*great_deal',
+    '#$rand"$coup"/er_a_little_bit"8great_to_do_a_great_deal"4i_can_think_of_a_few#)t\'s_a_bit"*just_a_few"(l&agrave#&ittle_)"at")matter_of+%_fact"(on_a_bit"+quite_a_few"$rock',
+    '#$reat"0you_get_a_little!)a&ndash;8"#+ba""-9"+/23/32/0004+"16,!7+"21,!2,!4,!5,!8,!9+"32',
+    ',!4,!5,!6#*33/25/0042#$avis"!2"!4"\'a-rated#8.gct.tcc.att.tta.ggt.tgt#$/aaa#!2#!3#(aa-rated%=aaaaaaaaaahhhhhhhhhhhhhhhhhhh*"gh',
+    '\'!h\'&rrrrgh&"gh&!h%&ggghhh&!h%#rgh&(rrggghhh$"ck$#ges$$oooo$"rg&"hh(!h%\'rggghhh',
+    '#!b#\'eeeyaaa#$ghhh%#rrr#\'h&mdash$!s#!l#\'rrgghhh&$hhhh%#ree&\'rhhhhhh\'2rrrrggggggghhhhhhh#4tgctgactaaggaacaaggt##www""ba',
+    '$!a$"cc&"dd#"cc#!y"$c(n)#-r2-compatible((nformant%!r#!s""dd#,emodontoidea"=eeeyurrgghaaaaaaaaaaaahhhhhhh"%gaard$#gag',
+    '1Igataatacgactcactataagggattttttttttttttttt$"hh&!h#/ttcttatgtgtgaag"(h-tishoo##hhh&%hhhhh$#ing#*ng-ung-ung"*i&uacute;n#!e""ke"&lenian#%smeer$%treep',
+    '"!n##doo#!n#%onsen"%orrgh#!w"#pam#!o#"so"%rango#$dman$!s#!g$"hh#$onis',
+    '%%vitch#!p##row#$vold"&sfjord#(ociation#!s##wdu",t.cca.ccc.at#!a#3gctaatgccaacaatgctg##hin#!s"$ughh")yamuguchi',
+    '#$ella!*b&icirc;me"(-bracket#$sent"!."*/alleghany""11"&2-type"#313""41$!9#!3""57"#910"#:cb',
+    '#&bababa(&cccdcd$"ba$#cdc#&c/babc$!a%"ba%"da$!i$%onian$-us-for-brains#*d-tempered$"eh$!i$!o',
+    '$\'anowicz$%humov$\'onowicz#!l$)li/zamora$)one/pearl#!n$!a%#zer$#cay$"da%/oned-in-transit)".l)(/ignored(#mtn',
+    '$"ji$!o$!u%%maque#"ra$"im$&rister$!t##ses$"ha%"um$"ic%!n$"to#&t-jour',
+    '$$ahun$%ellis$#ted#$xial##yas#"za%!h".b&eacute;ville#(a-dagnaw$&bashti$\'cadabra%$ourt$%esque$&gnales$$side',
+    '%(minister%!s&#ids&!y\'"ia%%waqfs$\'tangelo%#ial&#bus&"ni%$oirs%$toir$#zia#%eduto$&museum',
+    '%2ley/worcestershire(!s%$rant$(y-church&%gates%*/cavendish%%lands&#eix%$more%&shrule##ies$"tt#$litt#(ot/devon&5headteacher/pittville',
+    '%%:2.20%$abad%$rule%1s/gloucestershire&"ey&%holme&#ide&&onians%)t-compton\'(inspired&,/association\'.pre-admissions&1s/gloucestershire$"ud$#xry',
+    '%%viata)$edly)$ion.)#ory)"um#(s/roller"(c-harris$%style$#the#&abcabc#"da$!e##ess#\'hasicus$$urch',
+    '#&zynski",d&uuml;laziz##\'el$(ul-kerim#*-ar-rahman#!a$"li%"la\'$h&gt(!i%!y#&ehamid$&l-baqi&&fattah&%ghani',
+    '(#mid&&jabber&&maguid(#jid\'%ohsin&%qader&%rahim($zzaq&%wahab%&fattah%$hadi\'!k%%karim%%majid&%oumem',
+    '(#man\'#sik%%wahab%#zar$$nour$%rahim%%ezzak$!s%#lam%%salam("em##ick$"el$$ldin$&rrahim',
+    '#%nouri#(olhassan$-men-straining%*inoprineal$$ulay&&gassin&%kerim#\'rahmane$#upt#/ucted-by-aliens\'!e&&ion/of&!s$\'l-\'aziz&%dahab',
+    '(!q\'#osn&&wahhab%"ah%%hamid\'$shim%&jabbar%\'khashim%)lah-owned((planning\'$shim&(odzhanov\'%janov&%rahim%%malik',
+    '%%raham\'$khim$\'rachman&#him%%raham#"yl"$ecor#&d-nego$!e$$nego#"et#!f#"id$$lles##kas',
+    '#(l&eacute$!e%!s&!z$#ian%"ne%"uk$"la&!*$(software#!n$\'alfarax$%dberg&$latt%)dammerung',
+    '%%stern$&efited$\'omatous$$sour#"r.$$aman%#rth$(brothick$%canny&#rne%$eiro%&hirder%%ombie%$rave&*ombie-like',
+    '%$ywyn$%dares%$een+(*-inverness(1/glasgow-plymouth)\'lerwick(!s)*hire-based&"nn%&onense$#ech%$deen&!w$%fedly%$frau',
+    '&(le-based%$wili&(yngregyn$%hosan$"le&$ssie%$long$$mort$%nithy$%rance)!s\'"t\'&&tional%&higian$$thow',
+    '$&uthven$:ystwyth-chester-birmingham,*manchester\'#yth&$wyth#%samis$%ement$$sole#3talipoproteinaernia$!e%!d$#ter%$ing-%"or%!s',
+    '$)ewickreme$+goonasekara$&sekera"!f#)&auml;lle"!g#"ar"#hal%!l$(ndlungen$!y#\'idhamma#+omynaciouns$+rr&egrave;d&%ences',
+    '\'!s#*y&amacr;sa",i-compatible(%liant#$/bsa##ang$!r$$thar$!w#$dine&#gly$)jan-matin\'!.#$etis$#zer',
+    '$"ne#"hu#"ko#!l$"io%&tating&"es&$ies.*!7&*y-grouping(*orientated(%range($wise\'+/disability(*impairment',
+    '$!l$"ty$$ugan##maq$$bola##nee$!g%$hall#+o-energetic$!g%&enesis$\'tically#"ru#$shai#%tante',
+    '$!o%&vabore$.unentenzeugnis#!y"!k"%l-brp#!a$"rk$#tes%#ing&#ons#\'e&mdash$!-%/bodied/disabled%&labels',
+    '&!b&!c%#s01\'!2$\'/unable$%gatus$#ism$%marle$#son#(iguritor$%ngton#"js#$ondi$"om#"ur',
+    '#$ythe"$maj7$#phd#!s""nd#&egated%"et##orm&)al-normal("is)%ties.(!s$"ut"%odala$%rites',
+    '#%larin$%endam$$fazi$"ie%+sh&rehy;ing\',ed&mdash;the)#.it\'$ment%1tion/emancipation)#_of$&qassem$$tins#/minable-entered\'#tes##nae',
+    '%#ano%"io#!o$!n#+r&rehy;tion$%atory$$bing$\'iginese$$ning$&ted-by\'!.%+ion-causing)(decision))on-demand(!.',
+    '(#ism#!s#%trite$%sbery%!i$!u#&uchdid$!e$%l-ela$%ndeth$,t&mdash;that%!-&"my&"so&$them',
+    '(#-be+*-ex-lit-ed/$wife,(murdered*$urst)-go-on-holiday)$open)&retire%#.is&#the%%/this%#0.5%!4%\'_rather%!e',
+    '%#why%!y#(ve&mdash&.rehy;mentioned%"\'/%!-&#all\')nd-beyond\'(veragely&*board-well("ot&)discussed&+equilibrium&)indicated\'%t-all',
+    '&&normal(#ted&%party&&quoted&&stated&0the&rehy;average)%-ruck*%water&&window%".d\')iscussion&$they%!/&%below&%would',
+    '%&14,550%%:paul%%board##wte#$xcd1#)yne-based"!p#!i"#qar#$uaiq"\'ra(ha)m$#bam$&cadata%\'hmanova%"os',
+    '&$mian(!c\'$sson%%msohn$#ira$&movich%#sky&#ohn%%tsevo$"sh$$wang$#xas#"dn#$eact$$skov',
+    '#(idgments$/efhistoryoftime$#nes%"ia#&oad-in\'\'notably\'"on$$gado$%komes$#oks$"se$*tanifolium$$ziak#!s#&uption',
+    '$%zzesi"+s-modulated##:in#%a\'tze$#lon$$roke#%cence&!t%%ssing$$hied&(rmdienst$%issic("on$\'ondings#$eil.',
+    '$!n%%ce(s)\')/presence%"se%"t\'&$-for\'-without-leave&&eeism.&"ia&#ly.&*mindedness$$stos$!y##hir#$idal',
+    '%$thum#%luley#$olue&\'tamente\'"e\'(%-zero()/relative((ly-other("no("st\'$isms)"t\'("ve(#zed*!s',
+    '$#rb.&$able\'$nces(!t&%edand\'#nt.)!s\'/rs/regenerators&#in\'&%ption%/ptio-metrically)&metric)+n-stripping*#/24+(emission',
+    '$&tption#*tentionism,"ts$/ract-figurative)(sounding()/concrete)\'realist(&edness($ible)#on-+$ists(#ual&$ktes%%usely#"ue',
+    '\'\'looking&!a&!e\'!r&!o&!s$!s#\'w/glaxo$"ap#$ymal$%nthii")ta-bonded$%/atol$$lion#&eiberg',
+    ')(srechner##ion#!s"#u\'l#"-2$\'ghazala$%salih%#uer#%2(nh)$"nh#%bacar%#ker&#kar#&defduf$#get',
+    '#"if#\'l-abbas$$adze$#eia$"la#!n$"ch$.dance-bringers)!.%"ed&#nce#\'rahamon#!s$$able$"e\'',
+    '%".1%#_in%"d.$$ivis#&tement%#ndi$!t#&zayyad"(vailable##erb&!\'"\'ysinian$&s-like%%inia.("ca',
+    '"!z!+c&amp;sharp#*rehy;quire"!-#"10#"30#"47#"dc#"in#"pc"$/173$"88#$750v##acg#\'dc-like',
+    '#!0")a-english#!b$"us#"ce$#ia-#+d&eacute;me-%icien&)grave;mie$#amy$$emes&!i\',c&rehy;style(,-centredness)\'looking',
+    ')-parliamentary*,hilosophical)+territorial**heoretical)*vocational)$year(./criminologist)*industrial)(research),sociological**pecialised)*vocational(+ally-gifted-&minded-*orientated',
+    '\'"sm&#jic&*y/dumfries(*leverhulme(\'wolfson\'"12\'#ish$"ia$#s10#!k#%lypha#%mpora#&nthina&)ocephalan/!s',
+    '\'$dian\'%lysis\'#mis&\'us-leaf*#ike#%pella#%rigua$%nania$(odomatia$!s$"te#!w"*bt-2/3/7/5\'!5%#3/7',
+    '#/aattaaattatgaaa(*gattatgcaa$#ron$(stillage#&cident$(ommodate#%dient#&el-123%(arazione%*eration-60,!/*"ve\'&ometer%(lerating%"r8',
+    '%)t-perfect&-uated-crested$"p-%+t&rehy;ance&"ab(\'le/full\'&nce(s)*%-note*!.*&/usage*"s.(!t&#ed\'\'"rs&#ive',
+    '$\'ss&lsqb&!-\'\'deficit\'%level\'\'to-cash&4/mastercard/eurocard\'#use\'+visa/diners&#ary&#ble&#ed.&-i&rehy;bility\'(bilities,*y/mobility\'%on&gt',
+    '&"or(\'ies-tea+!.)#ser,!s)#zed(,y&mdash;with)(-cooling#)i-hindiii$)accaturas%%iuoli$!d%*ent&eacute(!-(%.both',
+    ')#the,!y()/sickness*%ystem(&alists("s.%"ia&#ent%#net$%jnzen$"on$&pitres(%idae.$!s$"us',
+    '$&erator$(imations%&vities$"om#%odata%#ing$#lis%"ta$,m&rehy;plish0"ed%\'adation%9modation&mdash;assistance-$.the-(/toilets-#ism',
+    '%!o&$data)$ions%!p&+a&rehy;nies\'#gny\'\'niment.-&/stage)\'st-wife(#ued&"li(!\'(,sh-measuring*,ed&mdash;the&"te',
+    '$.rd&mdash;which&#ed.\'!n\'!r&#ian)!s\'#ng\')&_er_to)!e)#lie("ly\'*on-bashing*&folded*&player)$ists',
+    '&"ic$"t.$!u%%cheur%,n&rehy;temps&+t&rehy;ants\'+-by-account(#has)(older(s)\'#.if\')/password\'!6\'#_of)!n\'(ability/',
+    '("cy(%nc\'sy**y/customer+"is)\'t\'s-eye*$-led*!/+"md*\'s/banks,\'systems\'\'holders\'$ing\'*--dictionaries+(oriented+$wise',
+    '+*commercial+)financial*#for\'"s\'((-related)&system(\'.macari(//administration))forecasts))statutory+)ockbroker(%where%!s%%t\'red&$ants',
+    '#(ra-north$\'ediaton\'2tation/recognition(\'isation%&tative&%ional\'"ve$(oachment%%chage*!s$%uable&&l-type\'\'s-based)$type#"t.',
+    '#\'u-clear$)lturative$(mmulated%#ula(#te.*"d.),ion/activity),or-and-store,.to-accumulator+!.)$tion$#net$*puncturist$/rate/up-to-date(/ly&rehy;mounted',
+    '+*measurable+%timed*!.\'"ge%#ist%#red%!s&#ius$#sal&%tion.%#can%#ed\'\'!.%#in\'%%tions',
+    '"!d#!e",e-compatible(%liant$&funded$$high$*inhibitors$$king#!.#%/agit%"rc\'*-compliant$/chemical-resist##ite#%ldama',
+    '#%ntral&"ic%\'ury-old#%phale\'#ous$(romazine$!t#\'r/altos$$amic%#rc1%#tus$+bic-looking&$ties$$enza%"ro',
+    '$%power$"ra$&tained%"cm#&tabula%/l/styrene/ester&%dehye%$mide%#ria%&te-koh\'*/pyridine/$#her$%icism%(fication$,oacetylation',
+    '%!n&--precipitated&)e-cleaned$"um$6yl-ala-ala-pro-ala-amc91idomethylcoumarin&.aminosalicylic\'"se\'"te(#ing&&cholin,3e-receptor-inducing&$enic&(hydolase&$ides',
+    '\')/solvents"$fion$!s"0gaattagattatgaaa/#caa#\'ca/tgcg#!s#!t"&haanak$$boun$%cachi$"da$$eans%\'meniann%"us',
+    '%%menes%"us$&llader$$more&!u$&narras$!r%!e%)yaforests\'$land$(shverosh$$tine#&eilles&\'ognathi%#ved',
+    '$%llies$%nbaum$"s.$#ter#!h#!i$"ba$"ee%"ng%!v&\'ability&,ed&mdash;see(#_by\'#ing\'2ment&rehy;oriented',
+    ',*orientated+!.("nt&$ieng&%ments$!l%!i%$lean$&nbowie$#ved#&medijn%!t#$naba%\'claiche%%haird',
+    '%.sheen-achanalt$%elith#\'onachie%)draplasia\'$itic\'\'oplasia%!g$"rd%#tle#&r-like$"ay$#ome\'!s&\'obacter#*selschwang',
+    '&#man#$urch"(icularis#\'d&mdash$&\'n\'art$(-alcohol%0citrate-dextrose&&leaned%(dropping%$edta&%luted&*xtractable,"ed%\'forming%#gas',
+    '&$reen*\'-yellow%$head%\'igneous%&levels&%overs%(mediated%\'na2hpo4&&eutral%&phenol%,rain-causing&\'eacting%&seared\'\'nsitive&&prayed',
+    '&$weet%$trip%%water&(eirdness$(/alcohol\'$kali%\'mercury&!l%,phospholipid$*:distilled%,formaldehyde$&=6:3:1$\'ication%)fication.\'&edwith',
+    ')!s(!s%$sing%)ties.ever&,y-alkalinity\'+/alkalinity$%proof$,ul&eacute;es#*egodefence$#ved#!i$#eed#$lius#"ng$$onyx',
+    '#%reale#$sclo$%trate#$tity%&vities#$vity"1k&rehy;nowledging#\'-acking$#tor#&apella#&cherly#&ehurst$$mman$#rit%$leys',
+    '%*s/regional%!t##ham#$ling\'#ton$"om#$nell%!y$\'oweldge&$ledg*"e.+$d-in+"s.*%ment.(%gment',
+    '*$ment#(roydiana#"te%\'wrally."#let#!m#!r"%m-129##e24$!s#!h#"in#!l"\'ne-free%&necked',
+    '%$type#+pv-infected"$ocks#&herent##irn#(madation$(madation$&panied%$line#\'nacagua$$itum$)servation%$umer$%tract&(oversial',
+    '#"rd%#ing(#_to$%n-fed\'#ull&&headed&$worm%!.$"ss$"te#!t$!t##unt&"ed&#ing',
+    '$(smatique%/tic-equivalence))phonetics(!.()/electric(+ally-driven)$ster($ubes\'%guide\'+que/musique&)o-optical-!s\'%icube"$p/ih"*qquisition',
+    '($ence%&ntance%%queta%%relle%#sac%#ynt$$eous$)iantances%$esed%+re/purchase\'"d.()/improved\'!e%,sition-proof,$rich',
+    '+#ing(#ons&$tion*!s%\'ttances$&sition"%r-mcr##awl#&e-feet&#oot$!/$"s.%./180&ndash;200#*id-tasting%!a',
+    '%"ly$%tarch#)oceolites&&phalus%\'yanosis$)delphidae+!s$&lectal%$oxus$\'megalic+!s%#ion$,nym-slinging)$peak(*to-acronym',
+    '\'&ically)!s\'%ously$&phobia)!c$/ss&rehy;country&&-class(&ountry\'\'section\',the-atlantic+%bored+%fence+%range$(whatsits#"ss',
+    '$$/guy$$cial#5ylamide/bisacrylamide*.:bisacrylamide+!n&!n&#te-(!s%&ic-10%(\'dentine(&fibres\'&/glass%!o""s.#!c',
+    '$!n#"ni#"si"/t&mdash;finance#+(1986)-date$"s)#&-alike$&finale$+of-creation$%style#".4$&gareth#-/distribution##_in#$able',
+    '$$ully#!d#"ea$$llic$"ur#(i-vities$$lyse$\'ng-back\'(director\'\'knowing\'%space&\'/taking&#_as%#ian&&n-type',
+    '%\'odoscus&$lite&&mycete+"in)#in-$#on*&!-\'/after-the-event\'$cube\',descriptions))velopment\',facilitating(%igure)$lled\'%leeds',
+    '\'(modelled\'$plan\'+rationality(%eplay(#ose\'&scenes(&eeking(#how(&tatues)\'ructure\'&taking&#.if\'"ps\'\'tonight\'*yetdoctors',
+    '\')adventure($fter\'\'control\'%equal\'\'granada\'$over\'*reflection\'\'support&$book&!e&#ist&0s&mdash;defences.$that\'#(c)\')/measures',
+    '&$wise$!s$$vatd\'&edness\'.ion-inhibition+)synthesis*!.*!/\'#or/%&e-duty\'\'elderly\'&issues\'\'looking)!w\'&minded',
+    '(#ide\'%still&\'/causal(,ontemplative\'$male\'*reflective&#ly\'((-focused),seeking-work&(nitrogen&$page&!x%!i&(&rehy;ty&"es',
+    '&*st&rehy;or(1s-turned-officers)!.&(t&eacute.";s\'$ies.*,/description+$jobs+(products*%_once("on(!s(#tes\',y&rehy;based(!-',
+    ')"in+%duced)"no)%rates)*supporting($.the(-/angle-strain)%coach)+involvement)&purity))reduction+(laxation(#_in#!o$(r-dancer',
+    '&\'husband&(murderer&)neighbour&,participants\'(resident&%speak&/turned-producer-&writer&\'wankers%%/fine&\'manager&)president&&singer\')oundtrack%"s.',
+    '#\'raphane$*ess-dancer(&mother(&singer#\'s/bills$#_in#"tm#%u\'lly$!a%#lar&%ising(!t\'%zable&#ly-(#.it',
+    '%#nce%#ral&0ially-determined\'"ly&+y-dominated$#els$#lly$$rial#%would"(u-dunlop##bol#%erdos#"ff##gen#$ired',
+    '%$y/es##lei#"ma$"os#&phobia$/uncturist\'swith&$ture#!s$"ed$#sed$%tical#-te-on-chronic&\'service%#and%1graft-versus-host',
+    '$)istriatum$)orostrata""wo$!s"+xcumulation"%ylcoa#%ually"+zel-pozsgay!*d&atilde;o#+eacute;lies*#mar$\'grave;s#0mdash;democratic#-rehy;minister0"ed',
+    '"!+"!-##get##hod#$land$%ibber##man$"en#%space%&ending#$team%"ch#$vich%%sor-y"+.ed/borough',
+    '""08")1100-1300#"21#%3,500#&44,400$%9,000#!5$%/3200$#8-9#"6v##752$%6,000#&89,500##974"#200',
+    '#"53%#-60#"70#"86"#300#"12##50.#"81""45"#500%%-2000#"25#"37#$4-68#"70',
+    '""61#"64##8-9""70#"31##528#!7"\'8-style#"00#!2#"57"#900#"60$!5"%_lib.',
+    '$\'related#*/softbench#$base$!o#"do##gia%&o-like&!s$!p#,ir/historian#%kites#&lberti(!o$"ia#$m\'sa',
+    '%.schw&auml;tzer)&aetzer&$tyle$!a%#nat%$stor$"ek%"nt$"ic%"ya$#kus$"on%$vich%$wicz$\'s(1981)',
+    '&&morgan&$type&&webber%&/award&&brewer&%chief&%david&&farmer&*hitchikers&&mother\'\'ultiple&#raf&(scotland\'%pider%$down',
+    '$!u#!n$"as$"de$%gling$"te#!o#&pation$$idae$"so$*t&eacute;s%(ationist%(ed&mdash\'#-to&*r-director',
+    '\'"/a%%ivity%.or-independent\'(/charger#$quan##rga$!o#$sani$$tral#%uctus#(ventures#"ws#$xial#$yoma$#tum',
+    '"%bomen%$inal$%nimal%&nyshig#"ul"%cocks#!s")d&rehy;on#(-a-plane$"ed$$list$"to$"up&!s$%value',
+    '$"ie$\'ms-like$"wo$!x#!b#\'dresses#%ed-on%).although$!n%&brooks$*r\'s-tongue%%-land%$/and%$ley\'%&noydle',
+    '#*header.com#!i$$coat%$ting\'#on.)&/inner\'#ve.$%ewell$+ng/deleting$!o%!s$(son-ross\'!.\'*/churchill$!t',
+    '\'\'n-cured(#als("s.\'$rial&(ve-based(,/subtractive\'#ity%"on#*le-brained%!s&%field#$onix$$rsed#!p#%resed',
+    '&#ing&0s&mdash;capt.j.c..rev.j.mcfadyen\'(-holders\'$/key(%phone)%ostal(+status/text\'":7\'#ed.))/resolved(-e/participant(+r-addressee*1message-addressee\'$ing.',
+    '\'&ograph&!t#*s-and-ends$#.so#!u$#ce.&"d.%$t/10&"s/""e2#!6#+bicarcinoma#&crease#$deji#"em',
+    '$!s#$gasn$$unle#&kounti#&laide\'%&ntados(&miento%"rd$$brau$$eine%#kan$$hard$!i%!e%"za',
+    '$$wold#"mi$"oa%#nas#\'n-based$\'anthera%!u$"et$%field$$ines&#ide$!o%-carcinomatous&\'ellular%$mas.',
+    '%-sine-mediated%\'viruses$"yl#"po$#tio#$qual\'!y&!n&*tely-acted#%rdice$#ley%!y$!s$&tising#!s',
+    '$"so$"te#"us#%varul#$wumi#&yfield"\'f&amp;g#(/vor/vdf#%orton"\'gestone"$h2*2#!5##ear$%rants%$eing',
+    '$&simole&!n&+on-inducing.$tion&)ve-bonded((/sealant-"er#$ibit$$kary#$maid#(ocracies$&rtatio#%yatma"\'iantums#"bo',
+    '#$das.$!e##ent##gun#$kari$#ibi#"na$!e$"ia#&oynder&#ing#$padi\'#gyi$1osally-challenged&#ity',
+    '#"re#(s\'mother$"ok$$pute##tex$%ional#%unaku$"va#"wa"+jacent-note(&_er_to$"ho$!n#(ectives.#$igon',
+    '$#int$!u%"di&"ji%#nt.%$rnal\'&ed-12.#%udges%,ication-take,!.$"ik$&nction($vely$"re$-st&rehy;ments',
+    '&#ed.\',r/stabiliser&$ible\'#ces\'#ng.&*ment&mdash*#.18*!/*"s.$&vandum"&kisson")lercreutz#$h2*2"$mags$!p',
+    '$"n\'%"is\'+&rehy;tered\'%tator(-raci&oacute;n*#ive*#ndo*#ors*&t-xxxx+!e+!i,,on&mdash;see.\'-backed1#sed/!i',
+    '/)sponsored.-/distribution/\'records."em."of,/ve-bureaucratic/%class/#law.2/business/clerical/(clerical/\'service0&tudent.-ly-convenient1(oriented.!s',
+    '.)dominated-%/head.*programmer.)secretary-$s-of+"um)"ed)"ix%!s&%tered$"ra&"al&"l\'\'(-general\'$ties',
+    '%"e.&+d&mdash;the%#in\'$#sit%4sibility&lsqb;3&rsqb\'%on(s))!.)*/discharge*&review)&s.this&"us$"t\'%!.%"ed%#red',
+    '%&tances\'#tis&.edly-dwindling*!.$#xed&!s#!t"#nam#"ew#$isus#(ormality"(obe-less&%style%)/linotype%!s',
+    '##chi#7lescence-as-career-move+!s)"t\'*)-grown-up*"is$#foi$$lars$$miro$#pho#"mi$#nan\'(\'&sacute#$nais$!e',
+    '&"es#$pshn$*t-a-player($roll($vine\'(n-orphan%*/proposals%#ant%!e%,ion/purchase#%rably%"ls%#mus%"ta&$ions',
+    '$"na%!e%"o\'#\'srbents#%urned&#ing#"wa",p-stimulated##ase#&ressed$!t##ted")radzhenne#"ea$#eja',
+    '$.nalin-boosting*\'charged*\'fuelled*$rush*\'sapping+%oaked))e-fuelled+(inducing*!s("ze%/ergic-dependent%.ocorticotropin&.leukodystrophy$!p$$sses',
+    '%$ctic%#ene%#n\'s&&-types&"na\'!e&&opolis&!s&"us&"za$"ko$#les#"on#&spatch#"ug',
+    '#%56289#$cene#%ersen$#tts##gey##hed#"it#!o$!n$)rbability\'#tes&#ers&#ing%\'ptivity#&p-210x',
+    '$#end#$team$$itit$3ock/buckinghamshire#%urdum"$ugna#"ku#&lators$!s$+t&egrave;re%!\'%$-ape&)education&+intelligent&\'looking',
+    '&%proof\'$upil&$size&(to-adult\'#ype%)/business&\'student%"er\'$ates)#ing\'%esses\'#ine\'%ously&!s%%hood.',
+    '#$ncum##sta"#val$,n&rehy;tages%%-tage%4ce&mdash;mortgagee\'s\'(-parties)\'lanning(\'warning\'#.in\'\'/retard\'"d-)$area)&cooled)\'economy',
+    '\'"s.%\'tage+11,&+11+26,"11)"s.)"th$$tech#-en&rehy;turer%$iens%\'tageous&%erous&#ide\'$tial)%ously&&ure(s)',
+    '*\'romance*(scotland+&eekers))/activity*#rpg)%ously)$sses($line(.ous-picaresque$!r%"b\'%%ising%!s&#ane\'1rial-adjudicative',
+    '&%iding\'/ty-unemployment%%tiing\'"ng\'!s(2ed/selection-based)-ment-inspired.&ridden-$/job-(s-points.(/posters)+r-dependent(.ing-management+*/promotion5"al',
+    '+\'ws22-251!9&)s/notices%(visement$"st#)ice&ndash&(-seeking(&pewing&)/delivery\'$home&"31&"as$!n$!s%#ari',
+    '&"d.\'\'/warned&"es&$ment&%r-led\'+/supervisor\'+s&mdash;are($--on(+/inspectors&"th%#ion%-or/consultant\'#ate\'"s.\'\'y-staff',
+    '$%cados&%te(s)(!.\'"us$%gadro"#yar$%suren#!l#!r#"ta$"on""za#\'e-blade$!d##har',
+    '##oic$"pe!+e-2/windows#!3#%ea/rt"!1#$/ae3#"0-""3s"%4052v#"50"!6"#700"#800"#900',
+    '$&funded#!c"\'bischer"#com#!s"!d##200#"di#%icule$\'ficamus("re(#vit"\'f-1&bgr$!2#!.',
+    '"#gae#"ed$#ria#%olius$&n-type$&sthena#&uidens##ypt&#ica"(hrenthal""id"!j"%kyung\'#-pq"%lbert',
+    '#$fred$$stan$&thryth$#vin$#win#"ia%"na#"lo#"st#"tc##wyn"&milian""na#!d#"ea',
+    '"&olians%!d#$nius$-s-old-coin-op#/rol&iacute;neas"#qua$)inoctalis$!o%#rin"$r24l#$adio$$tor.#\'denhout#(eobatica$!s',
+    '#2ial-reconnaissance&"ly%#ted$"el%!n$(ological##mac&#chi)!s\'(lu-339as#*o-delights&&ynamic,!s%(engineer-#ing',
+    '&&utures%)intensive%*technology$+/industrial$$3gen$$back&#sic&\'tically("ng\'$ting%)ics-class\'$ycle%$rain\'#ked(#ing',
+    '%$hago%$raft$$deck%&romes.%$uets&$stry%0ynamically-sound1%tyled*$sche+!m$\'elastic$\'faciens%$ilms%*oil-shaped)$type',
+    '$&ginosa%%ramme(!s%#ulf$#jet%%umble$!l%%eneas%#ite$&metric$/nautical/marine,"ly&$vali%#omy$$peru',
+    '*&makers*\'related*&shaped)$sque%$ract%%uerto$&quatic$/smith-permanent%*ol-induced\'"ed\'#led%,pace-defence*%owned**to-medical)$/car',
+    '*+thomson-csf\'-tiale/alcatel%%tatic&(ructures%$ucre%&ystems$$tech%#ows%#rap##sol#*tiological$#sen"&s-type#"ch%$ines',
+    '$$wine#!t$+henospheric&*te-recluse\'#ic\'))-cultural*\'looking)"al+\'ly-numb.\'sterile)$ises*&zation$&imatio%#val\'$ting',
+    '""t.#&atibus#9dqledeksalqteianllkekekle#%ernae$!s#\'heistic%(stically$&ilwalh%&opians(#cum$*oxysclerol#"ia$&mology$&ologic*$ally',
+    '%,pathogenetic#&olians$)sauroides""uc#!w"%v1043#!s"$w.2s$!3!(f&eacute"&-finis#!i""10"!6"#aep',
+    '#%ilure$!r#!l#-n&aacute;siev$"dy$%tchao#!q#+r-inhabited$"ia%%stoun"$c124#!f#!s"#dal#!s',
+    '"#ecs$#ted#!e#$werk""fa$%davit$,ir&mdash;the&#-as&\'/acne/a\'&caused&#ist)"es&#s**\'!.("ps',
+    '$!n%!e$!r%!e%!i&"es#!e$"ar$!c%-&rehy;tionate%%cioun%1ioun/ymaginacioun%"td&$ed.a)%moody',
+    '\'\'on-love*\'starved)!.)$ally&#ual\'!s$*npinschers$%rence%"ty#$fair#%iants$)cionadoes+!s$)davits-of$)liational',
+    '),ve/dependent("on$(n&eacute%!a&#lly%$itas(#tis\'0y-chromatography%)opurified%!s$&rmable\'%tion.)-ve-to-the-max$$xes.#%lates',
+    '$3uent-but-screwed-up)\'looking)&worker("ly%!x#1ordable&mdash;and%%esayd*!e\'$ting%$said%!t#$raid$$ight%"ne%"ts',
+    '#!s#"tc$"er"!g#*-sponsored#\'anistan#&hanaid&.istan-pakistan+$.the#"ie#"oi$"ye#$shar")hq/eighth"(icianado',
+    '#$laka%!s#!n$!a%!l#"rm#!s$!o#+ve-year-old"#laq%!i$\'tunense#!i#&otoxin)!s',
+    '%"er##ush"&ma-ata"!n#!e"$olbi##nzo#"ra$%etime&#yme$!i"$pfls#!s"!r#!a',
+    '$(id&ndash&(-to-rock$#nil$"yd##een$!m$#nch#!i$"ad$!c%.a&mdash;called&!*&)-american\'%based\'%cairo',
+    '\'#get&/.worcestershire&&/ghana&!_&"an&"in&&n-back($held(*influenced*&spired)"sh(#led)%inked(%music(%owned',
+    '(*registered)"un()supported(*traditions+$ined\'*/caribbean(\'english\'$ders\'#gus\'#ise)!m)"ts(&zation&!s$"di',
+    '$)kaanerdom&%korps&-ner-volksunie##lca#)o-america&%sians%*carribbean+#ean&&harlie%!d%\'eurasia%$funk%(guyanese%%house%+mauritanian',
+    '%&saxons&%tyled%,trinidadians%$west$%asian$*caribbeans$%nauts%#ted#"um"%sharm#&prengi""t\'#\'-hinged#!c#!e',
+    '$!n%&posten$+r&rehy;care+$noon%!\'%)-acquired($tion\'&ffects\'&uction&(benefits\'$irth\'&urners&)christmas&*employment\'%vents',
+    '\'&imself&$load&$meal((dication\'\'idnight&#ops&\'product\'&uberty(#lse&*r&acirc;le\'\'eaction&%smell&&tastes\'\'he-fact*$sale',
+    '&#use&$wall(#rds\'$orld%!.%!/&%until%$1800%!=%"_a%!a%&battle&$eing&+urner-style)#ing',
+    ')"le)!s%&dinner%&effect%!f&$ires&#low%%glows%%hatch\'$ving%%image%%lives%%match&&eeting&&oments',
+    '&#non&$oon.*"if)!/)#ish%#oon%\'pannage%&seeing&%hafts(-ve-commercial*!d%$tang%%ward.)"s.+"if',
+    '&#ork$%wards#!m"!v"\'willite"&zal/vg#&eliana!,g&aacute;des#0lsqb;ains&rsqb;t#(uuml;ica"!+"$-125#$6200##cat#\'derived',
+    '#&pilots"\'.gurney""20"#350"&a-type#/agagaatcaactgcc$$inst#"ce%!s$$gtct##dez#1gttacatggtgtctgcc#!h#"id$\'n&mdash',
+    ',&surely&)rehy;they%,-fashionable&$same&$that&$with%$.her&$more&\'richard&#the("is&"we%\'/curves&!i&$just',
+    '%#_in%(st&mdash-(;perhaps\'%-note()the-grain,$odds\'%/rail(\'tobacco&!y%!t&!s%!y#&lactia$-ev&mdash;live&!n',
+    '#!n$"cy#!o$%nidae\'!s#(p&eacute$#e/1%&monism$#ito\'!s#&r-agar%&coated%$like$%batti%!i',
+    '$+ose-coupled\'&/0.22m*#92m$!s##sse%#iz\'$#tya#!t$*e-coloured&&veined$&histic%!o&$kles&#nos#"wa',
+    '#"yn%!e%"st#"za%!n"$babi#:hjtyowlnmpasddqgtuitlmdjex#$iamo#$rigg"\'ca/tgct$#oli$%s/law#!g$%/cgct$&gcgcgt',
+    '#"us"&distis#"or"\'e&mdash$1rehy;distribution)%group#$-195$$band&$rred(#ier%(lackened%$ound%#ump%%y-sex$\'changes',
+    '%(orrected$(diameter&,scrimination$$free$&graded)!s(#ing&\'oupings$(hardened%&eaping%#old$-inappropriate$$life&$nked$%match',
+    '(!s%$ixed%&ottled$.of-acquisition%!r$%phase$)relations&)strictive%$oles$%scale%\'hifting%#pan&+ecification&#ots%+tandardised',
+    '%#wap$$type(!s#$.new#+/experience$)pregnancy$\'service&)x/marital($type%#ize#\':mining##_in#"be#)d-matched$+19&ndash;65',
+    '#!e$$ment#$have$"ot#$ing.$,sm-awareness#%laius$&enidae#"ma$#und#&ncies-)#the(".2()/business)&groups',
+    '\'(provided\')sponsored((tructure&\'/client&#has$!d%\'a&pound&$less&\'s&ndash\'!.\'&etting%"le$+t&mdash;not%#(s)%)-in-place',
+    '&&object&+provocateur%)/employer&\'patient%!e&!d%#ing%"s-\'(in-place\',provocateurs&$/3rd\'&estate&":b%"ur##old',
+    '#&ratums$!e$$pres%\'ublicus$%sborg#&s-long%#old$&idamos"*fa-gevaert$!s#$cc\'c""g.#$/ljh#%aatcg$0cctggttgcaaggaac',
+    '$"tt#>ggggggggghhhhhhhhhhhhhhhhhhhhh$"hh#$hhhh##ie.$!s#$lom-&&erates$\'utinate*$ives(.in-horseradish#/r&eacute;gation$(adations%$ndir("se',
+    '("ze*!d*%ments)#ing%\'vation.("or$(egometry%"ko%$sion&-sion-arousing*#ist()ve\'&ndash*(-looking*!.*,/anti-social',
+    '*)ly-priced\'#or5$"o.%!s"%halee$&nistan$$stly#$hhhh#"ia$"on##rus"%ianst$!s#%dihof#&lanico',
+    '$\'ity.and#$nast#*p-operated#!s#"t-%\'popping$)ator-pads$#pop"%kagat"(landular%#tha$%onema#%immer$)n-jarrett$#pay',
+    '$%phone"&matans#(ondesham#"x1"$naou#"el$\'skirche%!s$"te#\'ificent#%olini$!n$$sias%+tic/atheist)\'sceptic',
+    '#"st"+o&mdash;and$\'rehy;in#%-\'ave$#and$*industries#$.and$#but$(forensic$"it$#now$#the#&141213#&788173#"al',
+    '#"do#!e##gic$!o#$mbar#"ne$+ist-induced\'+/antagonist%!z&$edly\'"rs\'"s.$&y-aunt&(inducing#!p',
+    '%$zein$#dat$#ius#&sta-90%$inho%#oli##ura$,ti-dispersed\')pink-eyed#(vernment""pc#%lanes"/r&eacute;gation#!-#-a&ndash;delhi',
+    '$"ha$"nu$0rian-nationalism)&reform($ists&!o&"us$"te#)ciutlural#&eables$"da$-e&lsqb;d&rsqb%)ably-warm%*d&mdash;as&#-on',
+    '&!.&%which%"ed%#men()t&mdash;b0)popularly0#see0$wife)!\')--consensus-on*,in-principle)".3)!/**compromise*)signature',
+    '*#all*"ee*$this&$nent$$gado$%meent$!n$%ssion\'$vely%"te#"i-%(chemical-!s%$econ&%xport',
+    '$#ada$\'buggies$!c%!.%(hemicals%$oles%!u&\'l-tural\'%tores(*ural-based-+development-)implement-%rural-%style,!/',
+    '-(military,#ism,(ly-based+!m*\'e4-64.6$&frames$!n$$pino$-silvicultural/!e#"o-%)chemcials%(division%&export+!s',
+    '%(monetary%*processing%\'service%$xxxx$*biological$(cultural$)ecosystem$%kipia$\'mineral$\'nomical)!s$(pastoral%(inopines%$olis$"se',
+    '&*is-festuca(!/)\'festuca$"up$$vata$$wing"%scene#&ostart"$t-3\'#/cctccccgtcagacc"&uacate$"da%!o$$runa$*scalientes',
+    '$!d%!a$#nit$"ro#$iari$#ded$$naco$"sh#!s$"ta#!t#"wa"!v#.aanjantsangiyn"!w',
+    '#!i"%ydeus!%h-200#%ah-ah(#-ah\'"re##er-##huh##lah&%-deen##men#%oo:or"+/00/22/0003\'&3/0006+"12',
+    ',!8+"47)$2002+"10+"24+"35,!7,!8,!9+"44,!8+"50,!5,!9\'&4/2002',
+    ',!8\'&6/0038\'&8/0062$+1/05/0001-3#*11/25/0002,#5-1,!6$#ah2"#001"#250"#300#"50#!x"$500x"\'8189/20',
+    '""ad$\'/jaipur#$gger#"lf$#oth##mad$"ed#!n#!r$"on#!t#"va"$cima#)lorhydric"#daf',
+    ')(the-game%$sums#!d#%rdane$#loe"!f"!g"#haa#(hcapella$%herrr%%gnhhh%#hhh("hh&!m$#ooo',
+    '"&i-tere#$auzu#!i#"lo#(mataotao$!e#"ng$#ici##qar#!s"#l-e#&ahdeen#%brand#"en"\'madabad',
+    '$,tinformation#(ed/asian%(abad-380%.communications%%nagar%#zai$"nd$!s#-ose-nefertari$%undou$#vic""nd#$g-ha##ung""oi',
+    '#$mely#"oi#"ra$"ey$#tly#"ut#"yo"!r##-eh#"ar#$ends%#ses#&jinder#$onot"$teha',
+    '"!u#!e#!m"!w"(zelgrove!&i(kij)"%-anon#%based#\'skilled"+/00/25/0001\'&6/0037+"52$)1/23/0008+"10,!1',
+    ',!4,!5+"20,!1,!6"$akos"\'b/first#"bf#!d##ert#$ling"(c-71lv80%#770##c-7#%hatou',
+    '"(d-agency$%donor)!s$(financed%%unded$%giver)!s$%spain$$tied%%o-gnp\'+recruitment$$user#!.#)/c.e.e.c.%#eec',
+    '$(scotland$%trade##_of#"ab%"le$!m#%croft#5e&rehy;m&eacute;moire$!-%/m&eacute;emoire.\'moireto$(_de_camp$%burgh$!e$&rgrove',
+    '-!s$!z##gap#"in$!t##ley##rie#.s-acclimatised&)ssociated&(wareness%)concerned()taminated%(epidemic&"ra%$free',
+    '%\'induced%*prevention%(sufferer%&tested)#ing$!.$(/malaria%%safer$\'out.com#!y""ee$!e%!e#$ng91""fe',
+    '"#gai$+leos-parnes#,burththieves#%ialos$#na.%$etan#"le%!s##ner#%rette#!u$(eblanche%!r%(s-mortes$\'illette',
+    '$&lettes$!n"$hits"!i#!i""jv""ke#\'i-jitsu$%doist""la$%nthus#\'efroide$+ron-spoiler\'\'/rudder##ias',
+    '$"ll$"n\'$"ss#"le%#urs##ort#"si#!y""m-$(directed#$/aug$$july#!4#"an%!t',
+    '#%ed-at$#luk$"rs$!s#%iable$!n%\'g-point#!o#"s.$&/goals*6/priorities/intentions$$leys"$n\'t\'#*-el-hilweh#$cent',
+    '%"er#%geala$"le#+iktozoonids$!s#"na$"it##ort#)slie/fish$(t0:keele%"ey#$tura#.ulindal&eacute#$wick"$olis',
+    '#+n-supported"#pac#&edaile#"im##ort#%tasia"&r&lsqb$/mdash;hostesses$%ndash$/rehy;mail-paper#$-bag\'!s&#sed&$ttle%"ed',
+    '%\'ladders\'"st&#own%%ottle*!s%&rained\'#kes(#ing&$icks&%ushed)#ing%&ubbles$#can&!r\'%rying',
+    '%$ells%%hills%%ombat&+nditiioning+$ning+&oning/%$rews%&urrent+!s&%shion+"ed$$date%\'irected&\'spersal(&lacing',
+    '&$iven&\'oppable$&empire$%ferry%%ields&%lters%$luid%%orces%%rames\'#nce&"ee%#uel$&ground%"un&#sts',
+    '("ed&\'ll-lair(#air%$orns%%unger$(inflated&!g&\'tercept%&oniser$$jets$$kiss$#law%\'ighting&"ne\'"ks',
+    '(#ing$$mail&&rshals&&ttress%(ovements$%naval$%obics%#nly%\'perated%"ur$\'package("ed%$hone\'(tographs%%lants',
+    '&\'llutant*#ion&#wer%#uff&&nching$)raid.when%)esistance%#ink$#sac\'!s&$fety&&mpling%%cream%(ensitive%$haft',
+    '%\'niffers%%paces&#eed&\'litting&$rung%&tation&#eam\'!p\'\'wardess&$ream\'"ip%&ucking\'$tion&\'premacy&*rveillance',
+    '&$sted%\'hermals%%icket%%o-sea%(ransport$$vice$#war\'#den&#ter%%orthy#!.$"it#&/cabin$1diet/underclothes%#ust',
+    '$$rail$*sea/rescue%8krowaczewski/wallenstein%&urface#!a$%cobra#,bag-equipped%%lloon$#orn\'\'e&mdash%!x$%raked%\'eathers)#ing%%idges',
+    '$*us-slaying#$call%!m$$hair$%oupes%#ver$!r%#act&#ft-)%based*\'uilders)+engineering)(fuelling)$kits)&making',
+    '+#yle)$type()/avionics)\'because)\'systems(#ers(#men(&swoman%#ete&$wmen#\'d/crime$"am$&isplay$,rie-bathgate\'!s',
+    '$\'-calder%&sur-la$"s.#$fair$\'ield(s)(,/oxfordshire%%ghter%$lter$#lor&"ws$#ood%&rcemen$(reighted&\'sheners#%graph',
+    '#%icide##jet#(knockers#$leys$$fted$#ies%#ft\'%%ne(s)\'#-it(&safety)\'tandard($type\'\'r-style)$type$$oads',
+    '#%mails%$ster$$iles%!n%$sses%!x$$ount#!o$%drome#$path$&istols$)lane-like$&ockets%%rt(s)\'\'-\'which',
+    '(#nec(\'seaport(%today\'+s-authority)%peals(!.(&/ports%%wered#%rifle#%scoop$%hafts%"ed%*ip-related%"ot$$kate',
+    '%$orts$$tair&"rt%(rip/farm$%upply#$test%#xed$#our\'(s-owners%"ys$#rak&#vel$!s#"uk#%vents',
+    '#$wair%#ys.\'(/british$$ells$%heels$#ick\'#ers$$omen%"rk&"ld$&recked#,y&rehy;fairy$!-%&faerie$%holme',
+    '##ch.#$holt##ian$!e#(ne-marne##ons##ton"+t-laoussine#$ched%-ison/chairman#"er%&native%!s#%islie#,ken/business',
+    '\'&former\'\'glasgow\'&singer#$olia\'!n(!s$!r##s-n"!u#!k"\'vanzian#&erlaur"+x-marseille-!s$$os/2',
+    '$)supported#!/$(6000/3.2$#dce$"es$$unix##3.2#%oneis#\'windows""ya#"er"$zawa#&elwood#$puru#!u',
+    '!#j26"#469""ai$"ki#!j##lan#$ngle#"x\'"$dayt#!p#(ukiewicz"#een#%gunle#"ly##nda',
+    '#"na$#gle"!m#"al##eri##one"!o#!b#!e#$hida#&ngpong#)ur&eacute%&nalist"!p#!8',
+    '##ria#&stable"!w!*k&rehy;47s"&-ak-ak#(wa-ti-ka%%t-ica""2a"#899"%a-boy##ash##bar#!d$!.$#ake',
+    '\'%scher$%impex##fia#-ileheducation#\'kievich$"po##mas#(negakubo#!o#\'pekabou#%rcali$"oa$#uru$!y#$saka',
+    ')#twa$!t#&thisia#%ufaka"$bari%!s$!y#"el$!r#"uk"#cay##ije"#des"$ebar#3l&mdash;progressive',
+    '%!r%!y#"na$&dengue$$side%"on#*rs-douglas"#fed#-m-fanavoazana%%kdrsm&\'ongresi"!g"(haimenid#$boob#$elia',
+    '%$aten#%issar##laq##mim#&sarbak\'"ek#&tarini$"er&%/shop$"ra#!u$"nd&%zadeh"+i-ku-lar-is#&habara',
+    '#$kiwe#"l.#$nand$"ci$$esia%#tic$#fii$!o#$rebi\'%mines$$keby#!s#"va""ka$%dians',
+    '$"ya#"id""li#$onis"&madzic##ene"%ohito#\'l/world$!i#%mfrah#!n#%sombo#"to"&pamgbo""qi',
+    '#$aman$*si-sarpong#"os$$ydon&!s"!s#\'ai-chin$$kovo#%elrod$(ntijevic$!s#*ionairnoye#(u-caykoy$$nite"&tinson',
+    '#&ubinsk#\'yubinsk"&ubussi#!e##lov#"mu#!n#$rana#&tagawa"$ward#&esasne"&yarlar#"ma!,l&egrave;gre#*rehy;karim',
+    '(&watani#%sup3+"!\'#(askalani"&(1992)"$-\'am&#ara%$zzaz#"88#(abdullah%"id$#dha%#wan$%emmah$#gha',
+    '&"li%!d%"ly%*medhousing$$jili$$kbar%"ra\'"mi$#lam&"wi%!i%$ousi$%maoui&%riyah&$yyah',
+    '%!n$#nba%%dalus%!i%"on%$qari%#war$$qqad$$raba&*shicabinet%#qam%%rayed$#sad%$hari%&sad&gt',
+    '%#wad$%tassi%#har%%rushi%"ti$$wsat%#wal$%yyubi$#zem%$mani%#zaz#"ba%"ba%"di%#ida',
+    '%%merni%#nbi%"qi%&rajneh&%ghuti%%shiri%$tawi\'%yinah&"en&"in%#yan%-zzazeducation$%eidah%%shari$$ireh',
+    '%#zri$\'usa\'idi\'#idi%$tush#$dali%"wa&"la%#yri$%hairi%%uhiri$$ibal%\'moqrati%$nawi$+ughmilabour%#rar',
+    '%%hahil&"um%"iz%&lasifa($tini%#rat&"is(!i%#teh&#tah%#yed(!s&"iz$%eisal\'"el',
+    '%"tr$%resco$$urat&!s%%ttaim#%gadir%%ilani%!r$%eredi$*hababishah&#rbi\'#eeb%$ouri%%usayn\'$sein',
+    '\'"sh%%ditha%#fez%%idari%!j%#kem&#kim%&madani&$muri&"ra%#ram&#thy%#san&$hemi\'#imi',
+    '%\'wamidah%#yah$%ijara%$kmah%+thiminister%#yat$#uda%#fni%&jaylan%$kuma%%ssein#%imadi&$nabu$/nk&iacute;shafi%&sherah',
+    '$*skandariya%#lam(#iya+!h,&shaikh*"ya%\'tishari$&ttihad$#zzi#$jabr&*uridefence%#ish%(mahiriya\'!l&$iabi',
+    '%$zair)$iyya\'"ri$%ubail&$ouri%#maa&\'houriya%"ri&$jani#%kabab\'$riti%"di\'"ri%%frawi&#uri',
+    '%%lbani%#mal%+rakiculture\'$mani%$taeb%%ysari%#zem$#elb$(haba\'ith&#dim&#ldi&\'sawinah&$ttab&&waldeh&$zana',
+    '&(warizimi%%ubthi&#dri&#fra&"ri$$udsi%#rah&%shumi%%waizi#&l-fred$#ail%$wati&"zi$\'ihaydan$#lah',
+    '&,initransport&#mun%&arakah&%shani%\'hdiyyah&$moud%$idah%\'jdalawi&*idinterior%%kdess\'#isi%#lat&#iki)\'justice%%mbasi',
+    '\'$urah%%qdisi%%rzouk%$shat&)riforeign%#wla&!t$%itlaa%#zze$%oayed%&qaddas%\'slemeen$\'u\'aysam(#yad&#izz',
+    '%\'darrisi%\'ntasser%%sawar&%salah%(tawakkil#&nahdha%$kura%$quib%$sara&#eri$%emery$$oman%"or%$uman$&u\'mani',
+    '%#sur#&othman#%qabas%&disiya(%siyah%$hira%#jji%#sbi&#eer&"im%%wmiya#\'ragheeb%!i%%ntisi%#sas',
+    '%\'wabidah,&public\'!i&!i%#zaz&!i$$ibat%"da$(uweished#$saad\'!i(!q%$bahs&/baghagriculture&!t',
+    '%%fwani%#haf&+hafminister%#iqa%%khrah&"it%$lahi&"ih%&marrai&#rah%$qqaf%#rah\'%yirah&#raf%$ttar',
+    '&#yid$\'enoussi$%haabi\'!f&"fi&%hadah\'$wani&#iri&&kshuki&%nshal&#r\'a\'"aa\'#ief(!m\'!q',
+    '&$yakh%$oura%#ura($ydah$#ilm%#man%$yasa$$rour(*irrigation$%ulaim\'$yman%#nna%#rur#(tajamm\'u%&labani',
+    '%\'rawinah&%houni$,er-nan-thera$*hairenergy&$wara\'"ra$&ikriti%#nah$$ofah$$urki#\'ubaykan$$lufi$#nsi&&uriyin$#sbu',
+    '#$wafa&!d&"ra%#hab(!i&(sh-alayh%#jih%#sat%#tan$%impey#%yahya%#qub#%zabin()municipal%$hawi',
+    '%#ydi&"ni$,ubaidideputy&!i"".5""42"!8"(a\'al-din#&-kaila##101%!3#02(nh)/asn102(co)#"89#!b$#amy',
+    '%+ster-smooth)!s#&calufe%$ntra%#tel$\'k-a-day$#tel#+ddin\'s-cave\'!s$#ics#$emon#$geuz$!i#$hdal#!i',
+    '$8n-fr&eacute;d&eacute;ric$$ster#%juela#"la#*m&agrave;n$*/pakistani$#aba%%gordo%!n&"da(!s&"ic&"ni(!a%$yahu',
+    '$"in&!e$#ode%&saurus$$piev#(n-a-dale%+is-not-here$%/gwen$"ah$"ce$"is$"na$(so-majia$#zon#!o',
+    '$"mi#&r-free$\'m-bells\'#ird&$call\'%locks&&quacks%&/clock%!e&"d.&!s%,ing-sounding(\'ly-high*!.&"sm',
+    '$"um#%shiya$$sene$!t%\'-minute%$airs%"el$&zewski#$talo$#hea%"ia$!i%#pes$"ri$#tin',
+    '#\'udidae.&#pes$#nus#$vesa##wis&!t%-te-controlled\'!s$.nehagriculture#"yh#%zarin$!i$"on",b&eacute;ric#"24',
+    '#%acini%"om&#res$$nia1\')n-chinese)%greek)\'italian)#run)(yugoslav%"s.%"ta$!r%$elli(!o%*i&ntilde;o',
+    '%%racin\'#zin$$ston$,tross-corpse*%eagle*$like$*veraenergy$#zin#!e$#ans$.do-temperature$"la$#nga%"iz$#ola',
+    '%$echt&!s%$ford%*go-osteria%$male%#ola%&queque%"ro%%t-1er\'Ffinney-grim-up-north-\'60s-kitchen-sink\')the-dwarf&\'a-based&"ie\'%llery&#son',
+    '%3y/master/university##ian&!s$%cauda%%ocche$!d%!e$$gnac$%monus$(no-white$#on\'&"is\'#tes$!r%\'eonidae',
+    '%#ton$-te/oligoclase#+o-marginata$%nubes$%picta$!r%#noz$!u%#rne%!t$$witz##ray$#eda$$icci&!h',
+    '$!o%#ugh#%uhera$(m-addled&(by-album&(oriented&\'selling%$ares%,bl&auml;tter%\'in(bsa)\'!/("1%\'!e\'!s",c&aacute;zar',
+    '#\'achofas$$dena$"ma%!o$!r%"az$"sa$%torda$$ydes#\'ebiades$\'dinidae$#ron$!u#$hata$$emal',
+    '\'!e\'$llas\'"se)!d(#ing$+ian-demsetz%"ma&"ia&!y#$imus$$nous$%phron#"l3$*ad-covered#%maria',
+    '$"ho&/l&rehy;released\'&-abuse((blending)(y-volume((divining(\'fuelled((guzzling((inspired(%laden)%inked(\'powered(&soaked(&vapour(&washed',
+    '),rugs/suicide(&petrol\'+:chloroform)+oncentrated(\'diethyl\'+icbeverages)!o)"s.(#sed$#lea$%meter$#ols$$thon%"ts$\'ve-like',
+    '#!s#$uin.#!y"+da&ntilde;a$\'brensis$#nti$$rion$%te\'s.#%ebert%/urgh/thorpeness$!c$$gond$,n/birmingham&\'taylors%!s',
+    '&\'fringed&&strewn&$wood%&bourne%%field&#ord%$leys%%manni\'*ston-based%/ney-southampton(!s%%shits&#ide&&on/aid)$rare',
+    '%3ton/gloucestershire#"hs#$ines%\'gtondid%!o$&s-type$"us#&lerman#)obrandini$%movar$\'randini#%rdige$&ichian%$dges%#gde',
+    '#)s-related#,us/microsoft%!a#%warke$&inckle&#kle#!y$!s"&e-cart&#sks%\'oloured&$nner%"up$$horn$#jug',
+    '$$only$\'scented%%oaked$&taster%#ype$%women#&/cider#%aflet$$ndro$(toricism#"ck$&onners$%toria%&ricity%#ura',
+    '##gal$"be$#ret#$hook%*usekeepers#"ix#$jack\'!s%$ndra(#ino$$chem#6ksandrovsk-sakhalinsky)!u%"ey$"um',
+    '$#uia#!m$$ania&$nian%$yehu$$bick$"ka#"na$"de$!e$&uihaha#!r$#ent$!o$)t.warning',
+    '%\'manager#)sanaprime$\'hkovsky$#ina$&jandro$\'sandria)"o.#"ta$(hopteris$#sch##uin$%rites$!t#\'veraged%!s',
+    '%!n#&x/aged$$anco&!d\'-er-historians*)vanenburg)(/barclay*$lion*&pearce*)solicitor*)wiltshire)#sen\'!r(+ia-brindisi*\'n-roman',
+    '+#ism)"ne+!s*!s("os&"ko$#ei.&%evich&%vitch%\'ndrinum$!r$#sey#%yeska##zia"-f&acirc;ndega',
+    '+!i##(9)#0a-laval/tetrapak%&romeos$\'betical$!c$&ndanga#"ed$"yo#!i$$eri.#$lora#&oldean$%nsist$$xton',
+    '&#son%$ston%-ton/mansfield##sen##wen$!y#!y"/g&eacute;brique#(ae-bloom\'&usters&\'control&&eating\'(ncrusted&$free&%laden',
+    '&*preventing&)smothered&$wise%&/hydra$\'l/plant%%ogist$#rth#+e&rehy;rian$$bra.\'$icae&%iques$!n%(kulturen$!o$.rian-supported',
+    '&!e\'#nne\'!t#%houth#+icides/fish$#dae$%gator$&mantas$$stat$%zin-p#$ol68%%agnia$&metric$!n$&rithm1',
+    '"%hadra$\'mbrinal%(dulillah##ena%\'c-gelas#$mund#!o"#i\'i#)-al-arabi%%shgar$!i$$khan$&nassar$\'rachedi$\'shavers',
+    '##aga$)s-created&&format%!.%\'manager\'$pper%$time##bar$#ert\'!i$"i\'#$cata$&e-band&#his%#/do',
+    '$"ja$\'ommerce$%yclic)!s#!e$*n&amp;sup3%%-ated&)excluding&%fever&(infested&\'mashing%&/human%!a&0ting-reconciling(#on\'',
+    '%#ees%$ists%"s.%/tative/coercive%"um$!u#!f##gen$#hed%$iero##han#!i$!s##jon#%kuona',
+    '$$baev$$enta($rium($tion\'%icios$%inium$%onies&-y/maintenance$%unium$&zhanov#%ngsas##oli$#rum$"th#!p',
+    '$"io#$qout$&uantum%"id##ran#*s&eacute;e$)-moy-days$%dairs$.e-sainte-reine$"ky$"ma%%oides$!o%,n&mdash;john&$/ayr',
+    '$!s%!a$"ya#!t$%erioi$"ia%%tudes$#tle#"um#%vardi$$e-oh%$.and&#but&\'frankie$$iate',
+    '##yah#%zanza%$tion"$jmas#"os"/ka&rehy;seltzer$!l%+i-aggregate\'\'olivine&-ne-phospatase.&hatase4+-conjugated*)referring\'(ization.&&sation',
+    '$(ptonuria$*rtasuna-ea$\'seltzer#\'borough#"em%#ade$$nes.$$rton#&hattat#"ie$!n#$maar%%ionid##oxy$%zamah',
+    '#!y$.l-phospholipds%&amines%\'benzene$"ne&"s."/l&eacute;gretto$\'mdash;a*(electric*"if*%night*#she*#the$-ndash;seating$(rehy;and',
+    ')%lowed)\'or-none)\'perhaps,&vading.$sive)\'singing*$teel))too-often))victorian#+\'-inclusive$!n$5s-well-that-ends-well$$uovo##(a)#"-a',
+    '\'*ommodating&&oustic%#ged\'!s%(ldeburgh%&mateur&\'ericans&$hara%"nd\'\'-sundry%)ppraising%#rab("le&"my&(rhythmic',
+    '(!n&&suming%#uto$#bar\'$king%"bc%%eauty&\'holding&0lls-and-whistles&$rlin%&lessed%"oy%&ritain&#own%"sp',
+    '&*st-and-bum&(t-island(%naked(&spoken)&terile(\'written$(canadian&%rtier&"sh%%eylon%6hange-is-for-the-worse(#nel&$rome&"ub%#ity',
+    '%$lass&\'eansing%$oats&(ncealing(&lusive\'\'necting\'\'qu\'ring\'\'taining&%rners\'%ridor&%vered)#ing%\'reating%(ylinders$(dazzling',
+    '&\'vouring%%inghy&(ssolving%%redge&#ive%%ublin$*ecuadorian%(dinburgh%\'mployee%*ncroaching&%glish\'\'rossing&*tertaining%$ssex%(xclusive',
+    '\'\'laining$.family-reunion%#ire\'"st&"sh%%lying%&reight\'"sh$#gay%\'ershwin%(irl-trio&$ving%)loucester%!o&"od',
+    '%&rassed%&udgeon$)happening&0zards-at-a-place%#eal%\'ighland&\'ndemith%#oly&$wler$,illuminating%)mportance%#n-1\'$ones\'(the-mind\'%white',
+    '&\'cluding&\'forming&&nocent&&ternal)#val&&vasive%$rish&"on%(schaemic&$land%&talian$$just$(laminate&&ughing%&eather',
+    '&"ve%%ondon&$ving*!-%%urgan$*macedonian&(nchester&$rble&\'sculine%)erseyside%\'ilitary%\'od-cons\'#ern&\'thering%/y-worldly-goods',
+    '&"vy%$orth%#ude$*of-a-piece%!r&(dinaries$(painting&"le\'*s-together%*enetrating\'&sioner&(rmeating\'$sons\'(vasively-$ness',
+    '%%lanet*#ary%%olish&!p&&ssible%(receding\'$mier\'$sent&!o\'&gramme\'\'tective$&racial%\'esigned%+i-i-ighhttt&*ght-squire',
+    '%%uling&&tshire$+sacrificing&"nd&\'tellite&$ying%\'cotland%%econd&"rb%)heltering%$ided&1nging-all-dancing%)mothering%#now%(ocialist',
+    '\'"id&"rt&&uthern%\'tanding\'"te($ions&$reet\'(ong-form&$upid%)ufficient%)wallowing&&earing&&inging%&ynchro\'&thetic',
+    '&$stem$\'talking%#he-\'!y&+ings-in-one%\'ime-low%\'ogether&"ld&4o&rehy;nearly-public\'*-accepting*$tive)\'pparent+(ropriate)&udible*\'thentic',
+    '(%close-(-to-home)(ompetent,*rehensible*-nscientiously(&easily+!y)&vident(#few)%limsy(%heavy(*infrequent($many($neat((personal',
+    '($real+\'sonable*%gular(%short)$olid))uccessful*-re-of-himself((tempting*&rribly)&ypical(*vulnerable&%rness%$rans)\'forming&%ipura',
+    '%\'wisting$"uk%%lster$)vegetable%$ocal$#way%%elded\'!l\'"sh%%hites%&inners%%ooden&&rrying$$xxxx$&yellow',
+    ',(remember%\'ugoslav#*.important%!n$$that&!e$#you#(/channel$&female$%given$!i$%part/$$some$#the$#why',
+    '#,_,_all_right$/all_of_a_sudden((the_same%!t$&in_all$$know$"up#&aaaaah$!b$#din$%fouza$#ghi$)h-o-akbar%!/%#bad',
+    '%%green%$umma$#ker%)hverdiyev$#leh$"ma&"nd%#bie&!y%"po$"n.%\'/course&(managing%"te%%ville',
+    '$%peens$#rds$(to.cathy&\'nceness%#son(!s#&breeds$"ut#!c$)ock/world%\'nlablib%"rn#%dayer$"er$"is',
+    '$$berg$!d$!g%\'a-tions&#ert&#ten\'&ion(s)*"s.%\'ed&lsqb\'(insisted%&iance\'*!-%)orisation)"ed)!t',
+    '%#tes$#kto$(lopathic*!y&$type%$ujah&"ya$%manie\'!n\'%sratt\'!t%#ent%&oniere$(n-headed&#key',
+    '%%/boat\'&ristol&+conservator&&mother&)neighbour&*transplant%$bury%&checks%#der&(iscovers&!y%%gunge%%heads%!i%2stein-marienwerder',
+    '$&rdings&#yce%#gan&-en-sensitized&\'ic-type&+y-exclusion($like(%prone(&tested\'!.%&heigen%#ley%$muir%"od%!s',
+    '\'"xt$(sborough$%tsons%"ti$"va$#way$+y&rehy;ways%%-cats\'&ropped+#ing&\'fighter&#kid&(sneakers\'$tyle%#men',
+    '&#ian)!s$\'z-henri#$ford%$xden$#ree#(gemeiner$$rove#$iali%,nce&mdash;pa/"wa()-building)(inclined)#led)&making',
+    '()/violence()6.84.0104(#abu$#cin$)ed-maples\')protected&$2n/a&&signal%"s.$$garh&(tor-hide*(infested&$zoos$"in$(mportant',
+    '%#ger%&son/gp(&saimed$!o%#nii$#pio$)s/brother%*on-powered\'+/asbestosis\'!s%\'s/widow%$tair&$ragh$)t-eration%%erate',
+    ')(ive-itis,"ly#!l$!l%!l#$mark$$etal$(ilm&ouml#.n&auml;chtlich$"at$#ess$$ight$#utt#(oa-based%&ntigen',
+    '$!c%+a&rehy;tion&$ted.\',ion-by-voice%\'hemical&$thon*$ists$%graph)!s$%iance$)lobophora$%merus&%tries%%orphs$"ns',
+    '$*pathically)#sts%%henic%)olyploidy$"ri%"to$*sterically$*technology%,ment-holding*%sized)#eer%#oca%$tees$%uatta$+w&rehy;ance',
+    '%"_a&#for%\'ability&.nce.cheltenham)./accommodation)"as)*s/benefits\'!t%!e&-d&mdash;which\'%/seen\')amendment$+xan-induced%+ydim-sodium$"y*',
+    '#$plot#&rbeste#!s$&ebrook$#hot$!o%(p/friend&*p/inventor(\'newhnam\'!s$%peeds%$ice.$$tate$&worthy#0t&auml;glichkeit',
+    '$"la$&minium$$reth$\'sionary##way$$oods%"rk&"th$"yn#*y:margaret$!l$"ne"(m&eacute$+iacute;lcar#$ades',
+    '$!h%"an$#ins$!n%%dines%"si%#zar&#ora$"ra$"yo$"za#*egi&agrave$!h$$ndro$!r',
+    '%(i&aacute&"no$%tevsk$%yreda#\'ightily\'"ly$"nd#-ond-flavoured\'\'scented(&litted($tone)%uffed&(/cramond\'&modern\'%slate',
+    '&%esque&$wood&!y%#ers$"ro$3st&rehy;evangelical&!-\'*accidental\'%blind($uilt\'\'country\'\'defunct)&serted\'\'ex-wife\'(finished',
+    '\'$gold\'(historic\'\'instant\'%level(#ost)#ver\'*mechanical\'%naked\'(official(\'riginal\'$pain)&rodied(&rivacy\'+respectable\'*shrillness',
+    '($mile(\'traight\'3too-good-to-be-true($ruth\')unanimous&*.following&#_no#(s-giving%#man$$boat$%cliff#%udena$#nia$!t"#nae',
+    '$!y##ham#%ico-v$!e$%folia(!o$#lam#$o10c$!d#(wickhill"#oba#&cholic$$ohol#&e-vera#)ft-\'means',
+    '#$hura#$izas#"ka$"ut##mar$#bie$#ost#&n/film$+e&mdash;she%!\'%+-\'solo\'-all&"53&$ness%!.&"if',
+    '%!1$*g&mdash;it%!-&$just&&strike&%track%!.%"ee\'!s%!i&"de%!s%$with$"mg#!o',
+    '$$king$!n#%plast$%ochen#!r$"na$#oso##tta%"ed#!u$%ettes$%ssine$#tte#$wing#)xe-corton',
+    '#*-dominated$%green$$like$(watchers#"ac$%llana%!o$"ni$&rgatas%!t#$bach#%druek#&englow%"ie%.l&auml;ndische',
+    '\'%ocked$!r%"ns%\'records%!s%#ton$$stre\'"is$!x#+ha&amp;sup1-!2&-ndash;numeric%\'-1-acid)/ntichymotrypsin,\'trypsin',
+    '&$acid\')drenergic+\'oceptor&%grade&\'helical+"es&%level\'#obe&"nt&$only&&purple&%rated\'\'eceptor&&shaped&#vax',
+    '%(bet-land(!.(#=61(0ically-adaptable)"se+!d+!s*#ing&\'tically&+ungarotoxin%$cell&)hloralose%"ge%%hatim%#jet',
+    '%#rel%&tronic$#ege$$i-11%!e%%ngton$#oid%"ns\'*e-jourdain\'"ia(#nes%"rn#$iger$(ne-clear\')himalayan',
+    '%!s#&nacher\'$stad$"et#&ortian#\'s-sized$*92&ndash;1$$pitz$&tobete#"uk"%quila"#rad$#kis#"ea%-dy&mdash;well',
+    ')&ssumed(\'boiling($dead*&pleted)#one()estranged)(xcellent*&istent(+flourishing)&ragile($held)#igh)$oned*!t("it',
+    ')&otable(&opened($paid)*erceptible)(rocessed)(ublished()submitted(&traded()urbanized(*victorious(\'wealthy))idespread$!d%!y$$eady',
+    '#$idge$$ght\'\'$ness\'!y(\'-tighty$"ns#Aoth&commat;cix:compulink.co.uk.ac$#use$!y"6s&commat;vl.ts.kiev.ua#&aadoum$#bti$0ce&rehy;lorraine$!o$+tian-collie',
+    '()/labrador&#ons#%broke#&chuler#!e$$cure$!k#&hemist#$ikes$"ng#&o\'/\'in$)-enclosed%\'manager%"of%(probably',
+    '%"so$-/specifically$"ft$!o#!t$#adt$$emus$.hom-atlantique$"oe%\'nefield$(roemaria&&merias"$t(g)%"1)#%+ctrl',
+    '$"f7$!m$%print$!t#$-255$&berlin$*c&ouml;lln$%enter$!r$&wiener#..suit.att-bsdi#%agoan$(i&oacute%$ans.$\'l-sayan',
+    '%#ura$(r-candle\'$loth+!s&%flame',
 )
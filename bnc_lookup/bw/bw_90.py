@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_90 = (
+count_90 = 6694
+
+heads_90 = (
     '75%-25%',
-    '75%-95%',
-    '75%-owned',
-    '75&deg;-85&deg',
-    '75&deg;s',
-    '75&deg;w',
-    '75&mdash;84',
-    '75&mdash;88',
-    '75&mgr;molmol',
-    '75&micro',
-    '75&micro;g',
-    '75&ndash;125ml/4&ndash;5fl',
-    '75&ndash;138',
-    '75&ndash;1480',
-    '75&ndash;150',
-    '75&ndash;175',
     '75&ndash;175km',
-    '75&ndash;201',
-    '75&ndash;25',
-    '75&ndash;254',
-    '75&ndash;5',
-    '75&ndash;7',
-    '75&ndash;78',
-    '75&ndash;780',
-    '75&ndash;79&deg;f',
-    '75&ndash;80&deg;f',
-    '75&ndash;81',
-    '75&ndash;82',
-    '75&ndash;85',
-    '75&ndash;88',
-    '75&ndash;91',
-    '75&percnt',
     '75&times;12',
-    '75(1)',
-    '75(1)&mdash',
-    '75,00',
-    '75,00,000&ndash;85,00,000',
-    '75,000-acre',
-    '75,000-strong',
-    '75,000.',
-    '75,000t',
-    '75,031',
-    '75,210',
-    '75,223',
-    '75,300',
-    '75,540',
-    '75,700',
-    '75,76',
     '75-0',
-    '75-154',
-    '75-25',
-    '75-71-67-63',
-    '75-76',
-    '75-80-71-69',
-    '75-85',
-    '75-acre',
-    '75-ball',
-    '75-bed',
-    '75-break',
-    '75-degree',
-    '75-foot',
-    '75-lane',
-    '75-millimetre',
-    '75-odd',
     '75-page',
-    '75-per-cent',
-    '75-person',
-    '75-pound',
-    '75-seat',
-    '75-seater',
-    '75-ton',
-    '75.00',
-    '75.1%',
-    '75.16',
-    '75.2',
-    '75.2%',
-    '75.25',
-    '75.3%',
-    '75.5%',
-    '75.6%',
     '75.68',
-    '75.68cm',
-    '75.68m',
-    '75.68pccm',
-    '75.7',
-    '75.71',
-    '75.8%',
-    '75/',
-    '75/117',
-    '75/271',
-    '75/390',
-    '75/55',
-    '75/76',
-    '750%',
-    '750&mgr;mx525&mgr;m',
-    '750&ndash;1548',
     '750&ndash;2,150m',
-    '750&ndash;850kg',
-    '750&ndash;8750',
-    '750&ndash;950',
-    '750,000th',
-    '750-',
-    '750-hectare',
-    '750-strong',
-    '750000',
-    '750050',
-    '75009',
-    '7500bp',
-    '7500gn',
-    '7500rpm',
-    '75010',
-    '75013',
     '75017',
-    '75027',
-    '7506',
-    '750750',
-    '750ad',
-    '750b',
-    '750b/w',
-    '750bp',
-    '750cs',
-    '750ft',
-    '750g&ndash;h',
-    '750g/1&frac14;lb',
-    '750gal',
-    '750ha',
-    '750kph',
-    '750lb',
     '750mb',
-    '750ml/1&frac12;pt/3&frac34;cups',
-    '750mw',
-    '750n.',
-    '750nm',
-    '750rpm',
-    '750th',
-    '751&ndash;2',
-    '751&ndash;834/1350&ndash;1431',
-    '751/april-may',
-    '7510',
-    '7511',
-    '75116',
-    '751235',
-    '751393',
-    '7515',
     '7516',
-    '75170',
-    '751844',
-    '752,422',
-    '752,823',
-    '752-member',
-    '752-page',
-    '752.5',
-    '752000',
-    '752045',
-    '7521',
-    '75222',
-    '75227574',
-    '75230',
-    '752371',
-    '752501',
     '75252',
-    '75257',
-    '752662',
-    '7529',
-    '752h',
-    '753,000,000',
-    '7530',
-    '753045',
-    '7531',
-    '7533',
-    '753bc',
-    '754&ndash;5',
-    '754&ndash;75',
-    '754/5',
-    '7541',
-    '7544',
     '754400',
-    '754497',
-    '7545',
-    '754500',
-    '755000',
-    '755049',
-    '7551',
-    '755352',
-    '755399',
-    '755441',
-    '7555',
-    '7555th',
-    '7557',
-    '755b',
-    '756&ndash;788',
-    '756385',
     '7564',
-    '7567-82209-2',
-    '75674',
-    '756813',
-    '7569',
-    '756gb',
-    '756khz',
-    '757&ndash;758',
-    '7570/91',
-    '7572',
-    '7573/91',
-    '75780',
-    '757e&ndash;g',
-    '757v',
-    '758&ndash;9',
-    '7583',
     '7588',
-    '758c',
-    '758mw',
-    '759&ndash;302595',
-    '759,460',
-    '759/1358',
-    '75959',
-    '759606',
-    '759p',
-    '75:100',
-    '75:100000',
-    '75:15:10:10',
-    '75cals',
-    '75cms',
-    '75g/3oz/1&frac12',
-    '75g/oz',
     '75ha',
-    '75km',
-    '75kph',
-    '75mg',
-    '75mins',
-    '75mm&ndash;300mm',
-    '75mw',
-    '75no',
-    '75p&ndash;80p',
-    '75p.',
-    '75sq',
-    '75w',
-    '75x25mm',
-    '75xxx',
-    '76&mdash;7',
-    '76&ndash;3',
     '76&ndash;4',
-    '76&ndash;67',
-    '76&ndash;77',
-    '76&ndash;78&deg;f',
-    '76&ndash;79',
-    '76&ndash;8',
-    '76&ndash;84',
-    '76&ndash;86',
-    '76(4)',
-    '76,267',
-    '76,293',
-    '76,331',
-    '76,350',
-    '76,360,000',
-    '76,600,000',
-    '76,680',
     '76,764',
-    '76,800',
-    '76,835',
-    '76-100',
-    '76-146',
-    '76-3',
-    '76-68-67-63-69',
-    '76-77',
-    '76-82',
-    '76-fold',
-    '76-m',
-    '76-member',
-    '76-page',
-    '76-run',
-    '76-seat',
-    '76-tooth',
     '76.',
-    '76.19',
-    '76.2&times;55.8',
-    '76.2&times;76.2',
-    '76.3',
-    '76.5',
-    '76.5%',
-    '76.66',
-    '76.71',
-    '76.8m',
-    '76.9%',
-    '76/140',
-    '76/17',
-    '76/207/',
-    '76/207is',
-    '76/308/eec',
     '76/455:482',
-    '76/654',
-    '760&ndash;0660',
-    '760&ndash;1',
-    '760.',
-    '76001',
-    '76003',
-    '76007/26',
-    '7601005',
-    '76012/13',
-    '76016/10',
-    '76025/16',
-    '76027/26',
-    '76028/29',
-    '76029',
-    '76031',
     '760316',
-    '76033',
-    '76035',
-    '7605',
-    '76054/37/07',
-    '7606',
-    '760hz',
-    '760m',
-    '760mm',
-    '760p',
-    '761&ndash;2',
-    '761.8',
-    '761186',
-    '76130',
-    '7615',
-    '76150',
     '761600',
-    '762,000',
-    '762.',
-    '7620',
-    '76213',
-    '762222',
-    '762c',
-    '763&ndash;4',
-    '763,000',
-    '763/1361',
-    '763171',
-    '7634',
-    '763936',
-    '763d',
-    '763f&ndash;h',
-    '764&ndash;793',
     '764,000',
-    '764,900',
-    '7641&ndash;7675',
-    '7642',
-    '7644',
-    '764519',
-    '764521',
-    '764591',
-    '76460',
-    '764758',
-    '765&ndash;785',
-    '765&ndash;85',
-    '765,000',
-    '765,951',
-    '7651',
-    '7655',
     '765862',
-    '765g',
-    '766,000',
-    '766.49',
-    '7660',
-    '7661',
-    '7662',
-    '766333',
-    '7666',
-    '766660',
-    '766666',
-    '766774',
-    '76679',
-    '76697',
-    '766:659.3',
-    '766a',
     '766mb',
-    '767,610',
-    '767-300',
-    '767/1326',
-    '7670',
-    '767053',
-    '767140',
-    '7672',
-    '767541',
-    '767602',
-    '7678',
-    '767c',
-    '767x',
-    '768&mdash;814',
-    '768&ndash;2460',
-    '768&ndash;6460',
     '768&ndash;814',
-    '768-pixel',
-    '768/1366&ndash;7',
-    '7685',
-    '7686',
-    '768f&ndash;g',
-    '768k',
-    '768mb',
-    '76920',
-    '769505',
-    '769922',
-    '769g&ndash;h',
-    '76hz',
-    '76ins',
-    '76m/',
-    '76pp',
     '76s',
-    '76th-minute',
-    '76th.',
-    '76year-old',
-    '77&deg;c',
-    '77&deg;s',
-    '77&ft',
-    '77&ins',
-    '77&mdash;8',
-    '77&mdash;84',
-    '77&mdash;89',
-    '77&ndash;119',
-    '77&ndash;49',
-    '77&ndash;5',
-    '77&ndash;78',
-    '77&ndash;78&deg;f',
     '77&ndash;80',
-    '77&ndash;80&deg;f',
-    '77&ndash;80&deg;s',
-    '77&ndash;84',
-    '77&ndash;87',
-    '77&ndash;90',
-    '77&percnt',
-    '77&plus;38',
-    '77(4)',
-    '77,000-acre',
-    '77,190',
-    '77,297',
-    '77,300',
-    '77,500',
-    '77,500,000',
-    '77,906',
     '77,923',
-    '77-54',
-    '77-8',
-    '77-90',
-    '77-ball',
-    '77-bp',
-    '77-count',
-    '77-footer',
-    '77-lap',
-    '77-member',
-    '77-minute',
-    '77-page',
-    '77-volume',
-    '77.0',
-    '77.1%',
-    '77.2',
     '77.22',
-    '77.28',
-    '77.4%',
-    '77.4m',
-    '77.57',
-    '77.5kg',
-    '77.7%',
-    '77.73',
-    '77.76',
-    '77.8',
-    '77.8m',
-    '77.90p',
-    '77/108',
-    '77/1438',
-    '77/187/eec',
-    '77/388',
     '77/467',
-    '77/62',
-    '77/78',
-    '77/91',
-    '770&ndash;1',
-    '770/may',
-    '77000',
-    '770000t/y',
-    '770088',
-    '7704',
-    '770531',
-    '7707',
-    '770771',
-    '7708',
-    '770892',
-    '770b&ndash;d',
     '770cc',
-    '770kg',
-    '770km_',
-    '770m',
-    '770p',
-    '771&ndash;814',
-    '771,162',
-    '7710',
-    '77102',
-    '7711',
-    '771203',
-    '771300',
-    '771333',
-    '771336',
-    '771444',
-    '7715lb',
     '772-2',
-    '772/1370',
-    '77204',
-    '77207',
-    '772134',
-    '7722',
-    '772233',
-    '772251',
-    '77230',
-    '772728',
-    '7729',
-    '772a&ndash;c',
-    '772p',
-    '773,084',
-    '773/1371',
-    '773075',
     '7731/91',
-    '773131',
-    '7733',
-    '773603',
-    '7740',
-    '7740101',
-    '7741',
-    '774177',
-    '7744',
-    '77445',
-    '7746',
-    '7746,1979',
-    '774c&ndash;d',
-    '774p',
-    '775&ndash;4018',
-    '775&ndash;900kg',
     '7751',
-    '77510',
-    '7754',
-    '775454',
-    '7754b',
-    '775545421',
-    '775602',
-    '7759',
-    '775g/1',
-    '775h',
-    '775kg',
-    '776,000',
-    '7764048',
-    '776464',
-    '776484',
-    '77660',
     '776634',
-    '7767',
-    '7769',
-    '776929',
-    '776a',
-    '777&ndash;4150',
-    '777.',
-    '777252',
-    '7773',
-    '777300',
-    '777326',
-    '777349',
-    '7774',
-    '7776',
-    '77777',
-    '777888',
     '777f&ndash;g',
-    '777s',
-    '778/1376&ndash;7',
-    '77822',
-    '778271',
-    '778313',
-    '7786',
-    '7788',
-    '778p',
-    '779/1377&ndash;8',
-    '779321',
-    '7794',
-    '779911',
-    '779a',
-    '77bp',
-    '77f.',
     '77g',
-    '77lb',
-    '77lbs',
-    '77m',
-    '77min',
-    '77s',
-    '78&deg',
-    '78&frac34',
-    '78&ins&times;94&ins',
-    '78&mdash;9',
-    '78&ndash;3',
-    '78&ndash;66',
-    '78&ndash;79',
-    '78&ndash;80&deg;s',
-    '78&ndash;82&deg;f',
-    '78&ndash;83',
     '78&ndash;84cm',
-    '78&ndash;85',
-    '78&ndash;92',
-    '78&ndash;i',
-    '78+',
-    '78,000,000',
-    '78,000ff',
-    '78,014',
-    '78,017',
-    '78,200',
-    '78,300',
-    '78,400',
-    '78,699',
-    '78,726',
-    '78,835',
-    '78-',
     '78-0',
-    '78-153',
-    '78-37',
-    '78-73',
-    '78-84',
-    '78-page',
-    '78-r.p.m.',
-    '78-rpm',
-    '78-run',
-    '78.',
-    '78.05',
-    '78.1',
-    '78.2%',
-    '78.26',
-    '78.4&percnt',
-    '78.4ins',
     '78.57%',
-    '78.7',
-    '78/594',
-    '78/660/eec',
-    '78/77',
-    '78/91',
-    '780&dollar;c',
-    '780&ndash;790',
-    '780.00',
-    '7800&ndash;200',
-    '7800&ndash;350',
-    '7801p',
-    '780499',
-    '78060',
-    '780b&ndash;e',
-    '781,478',
     '7810',
-    '781b&ndash;e',
-    '782.78',
-    '782215/782887',
-    '7824',
-    '782455',
-    '782501',
-    '7825535',
-    '782a',
-    '782p',
-    '783&ndash;785',
-    '783,883',
-    '783/1381&ndash;2',
-    '783/4',
-    '783131',
-    '783221',
     '7833',
-    '78350',
-    '78356',
-    '7837',
-    '78370',
-    '784,000',
-    '784-ounce',
-    '784/5',
-    '7840',
-    '7840/7842',
-    '78430',
-    '784567',
-    '7846',
-    '784p',
-    '785&ndash;9',
-    '78511',
     '7851m',
-    '78528',
-    '7854',
-    '785a',
-    '785p',
-    '786,992',
-    '786-page',
-    '786/1384&ndash;5',
-    '7862',
-    '786567/780897',
-    '7866',
-    '786868',
-    '786g&ndash;h',
-    '787&ndash;2928',
-    '787&ndash;6858',
-    '787&ndash;8',
     '787,247',
-    '787.5',
-    '7870',
-    '78700',
-    '78700199',
-    '78710',
-    '787174',
-    '78720',
-    '78759',
-    '788&ndash;807',
-    '788.0',
-    '788343',
-    '788858',
-    '789&ndash;90',
-    '789-4372',
-    '789/1387',
     '7891',
-    '7892',
-    '789321',
-    '78939',
-    '789413',
-    '789721',
-    '78bp',
-    '78f',
-    '78ff',
-    '78gb',
-    '78ills.',
-    '78m',
-    '78pp',
-    '78x127',
-    '78year-old',
-    '79%-95%',
     '79&mdash;80',
-    '79&mdash;82',
-    '79&ndash;10781',
-    '79&ndash;4',
-    '79&ndash;85',
-    '79&ndash;86',
-    '79&ndash;87',
-    '79&ndash;95',
-    '79(1)',
-    '79(2)',
-    '79(3)',
-    '79,065',
-    '79,100',
-    '79,112,831*',
-    '79,200',
-    '79,297',
     '79,498,240',
-    '79,557',
-    '79,900',
-    '79-10',
-    '79-148',
-    '79-154',
-    '79-78',
-    '79-83',
-    '79-seat',
-    '79-year',
-    '79.',
-    '79.04',
-    '79.06.11.80',
-    '79.1',
-    '79.1%',
-    '79.2%',
     '79.29',
-    '79.2n',
-    '79.2p',
-    '79.3',
-    '79.33',
-    '79.36',
-    '79.37',
-    '79.4',
-    '79.4%',
-    '79.46',
-    '79.5',
-    '79.5%',
-    '79.5kw',
-    '79.5p',
-    '79.6%',
-    '79.66',
     '79.8',
-    '79.8%',
-    '79.9',
-    '79/279/eec',
-    '79/473',
-    '79/80',
-    '79/83',
-    '79/88',
-    '790,000',
-    '790,754',
-    '790303',
-    '7903282',
-    '7905',
-    '790969',
-    '790p',
-    '791/1389',
     '7911',
-    '791791',
-    '7919',
-    '792/1389&ndash;90',
-    '7920',
-    '7920&ndash;9900m',
-    '792106',
-    '792226',
-    '792838',
-    '792991',
-    '792p',
-    '793&ndash;6',
-    '793,000',
-    '793/1391',
-    '79330',
-    '793770',
     '7938',
-    '794,637',
-    '7944',
-    '7945',
-    '795-page',
-    '7950',
-    '79530',
-    '795b&ndash;f',
-    '795p',
-    '796&ndash;821',
-    '796&ndash;840',
-    '796,000',
-    '796,802',
-    '796,970',
-    '796039',
-    '7963',
     '796483',
-    '796f&ndash;h',
-    '796p',
-    '797&ndash;8',
-    '797&ndash;802',
-    '797,195',
-    '797000',
-    '7976',
-    '7978',
-    '79780',
-    '7979',
-    '797b&ndash;f',
-    '7980-3',
-    '7981',
-    '798895',
-    '798a&ndash;b',
     '798g',
-    '799.7',
-    '799021',
-    '7992ft',
-    '799391',
-    '7994',
-    '79970',
-    '7999',
-    '79998',
-    '79999',
-    '799a',
-    '799b&ndash;g',
-    '799g',
-    '799p',
-    '79a',
-    '79cm',
     '79dba',
-    '79ff',
-    '79ff.',
-    '79ft',
-    '79in',
-    '79mm',
-    '79pm',
-    '79pp.',
-    '79s',
-    '7:00',
-    '7:10pm',
-    '7:11&ndash;36',
-    '7:11ff.',
-    '7:12',
-    '7:13ff',
-    '7:14&ndash;16',
     '7:14&ndash;24',
-    '7:15pm',
-    '7:17:00',
-    '7:18&ndash;19',
-    '7:19',
-    '7:19ff.',
-    '7:21',
-    '7:21&ndash;2',
-    '7:21&ndash;23',
-    '7:21&ndash;24',
-    '7:22&ndash;23',
-    '7:22ff',
-    '7:23:58',
-    '7:24',
-    '7:24&mdash;5',
-    '7:25&ndash;8:15',
     '7:26',
-    '7:27',
-    '7:28',
-    '7:3',
-    '7:3&ndash;5',
-    '7:30pm',
-    '7:31',
-    '7:33',
-    '7:35',
-    '7:38',
-    '7:39',
-    '7:4',
-    '7:40am',
-    '7:42',
-    '7:44&ndash;45',
-    '7:48',
     '7:50.20',
-    '7:54.41',
-    '7:55',
-    '7:59',
-    '7:6&ndash;11',
-    '7:6&ndash;13',
-    '7:6&ndash;8',
-    '7:7&ndash;8',
-    '7:84\'s',
-    '7:8f',
-    '7:jg',
-    '7=0',
-    '7=all',
-    '7=very',
-    '7a(1)',
-    '7a(2)',
     '7a-plus',
-    '7a.',
-    '7aa',
-    '7ab',
-    '7ac',
-    '7ad',
-    '7aj',
-    '7am&ndash;8pm',
-    '7am-10pm',
-    '7am10pm',
-    '7and',
-    '7ap',
-    '7aq',
-    '7as',
-    '7at',
-    '7aw.',
     '7b+',
-    '7b.',
-    '7b1',
-    '7b5',
-    '7ba',
-    '7bb',
-    '7bn',
-    '7bq',
-    '7bs',
-    '7c%',
-    '7da',
-    '7de',
-    '7development',
-    '7dh',
-    '7dj',
-    '7ds.',
     '7dt',
-    '7dx',
-    '7e-1072',
-    '7ea',
-    '7ed',
-    '7ej',
-    '7er',
-    '7eu',
-    '7floz',
-    '7ft.',
-    '7gb',
-    '7ge',
-    '7ghz',
-    '7gv.',
-    '7h',
-    '7h5',
     '7hd',
-    '7hf',
-    '7hj',
-    '7hp',
-    '7hu',
-    '7hx',
-    '7hy',
-    '7hz',
-    '7ins.',
-    '7ja',
-    '7jb',
-    '7jj',
-    '7jj.',
-    '7jn',
-    '7jr',
-    '7js',
     '7jur.1121',
-    '7k',
-    '7kyr',
-    '7l/n',
-    '7lb.',
-    '7lb/3kg',
-    '7le',
-    '7ln',
-    '7ls',
-    '7lv',
-    '7m-barrel',
-    '7m-strong',
-    '7m.',
-    '7manufacture',
-    '7min',
-    '7minus4',
     '7mm/&frac12;in',
-    '7mm/&frac13;in',
-    '7mn',
-    '7myr',
-    '7n',
-    '7na',
-    '7ne',
-    '7nf',
-    '7ng',
-    '7nj',
-    '7nn',
-    '7np',
-    '7nts',
-    '7nw',
-    '7nx',
-    '7ooo',
     '7oz.',
-    '7oz/200g',
-    '7ozs',
-    '7p.',
-    '7p.m',
-    '7p.m.',
-    '7pa',
-    '7pension',
-    '7pf',
-    '7ph',
-    '7pm&ndash;10pm',
-    '7pm-10pm',
-    '7pm-8.30pm',
-    '7pn',
-    '7pw',
-    '7q',
     '7qg',
-    '7qr',
-    '7qw',
-    '7r',
-    '7rd',
-    '7re',
-    '7rh',
-    '7rl',
-    '7ru',
-    '7ry',
-    '7s.6d.',
-    '7se',
-    '7shilling',
-    '7sl',
-    '7sl-rna',
-    '7sr',
     '7sw.',
-    '7sy',
-    '7t/ha',
-    '7td',
-    '7tel',
-    '7tem',
-    '7th&ndash;13th',
-    '7th&ndash;15th',
-    '7th-century',
-    '7th/',
-    '7th/8th',
-    '7the',
-    '7tj',
-    '7tp',
-    '7tr',
-    '7tw',
     '7tw.',
-    '7tz',
-    '7u',
-    '7ua',
-    '7ud',
-    '7uh',
-    '7uu',
-    '7w',
-    '7x1mm',
-    '7x2.5m',
-    '7x3ft',
-    '7xf',
-    '7xp',
-    '7ya',
-    '7yr',
-    '8&amp;1/2',
     '8&aring',
-    '8&cent',
-    '8&deg;dgh',
-    '8&deg;dh',
-    '8&frac12;d.',
-    '8&frac12;ins.',
-    '8&frac12;lbs',
-    '8&frac14',
-    '8&frac14&times;9&frac34&ins',
-    '8&frac34&ins',
-    '8&frac34;in',
-    '8&ft;6&ins',
-    '8&lt;1/2',
-    '8&mdash',
-    '8&mdash;12',
-    '8&mdash;13',
     '8&mgr;g',
-    '8&micro;m',
-    '8&middot;0',
-    '8&middot;2',
-    '8&ndash&verbar',
-    '8&ndash;0&ndash;27&ndash;0',
-    '8&ndash;0-20&ndash;0',
-    '8&ndash;00',
-    '8&ndash;03',
-    '8&ndash;04',
-    '8&ndash;08',
-    '8&ndash;09',
-    '8&ndash;1/2',
-    '8&ndash;1/2ft',
-    '8&ndash;1/4in',
-    '8&ndash;10&deg;dh',
     '8&ndash;10,000',
-    '8&ndash;10.',
-    '8&ndash;10.45pm',
-    '8&ndash;10/931',
-    '8&ndash;1000',
-    '8&ndash;104',
-    '8&ndash;10m',
-    '8&ndash;10mm',
-    '8&ndash;10th',
-    '8&ndash;11&ndash;0',
-    '8&ndash;11th',
-    '8&ndash;12&ndash;0',
-    '8&ndash;12-year-olds',
-    '8&ndash;12cycledeg',
-    '8&ndash;12oz',
-    '8&ndash;13&ndash;0',
     '8&ndash;14%',
-    '8&ndash;15&ndash;0',
-    '8&ndash;17',
-    '8&ndash;19',
-    '8&ndash;1a',
-    '8&ndash;1b',
-    '8&ndash;1c',
-    '8&ndash;2&ndash;0',
-    '8&ndash;2&ndash;22&ndash;0',
-    '8&ndash;20%',
-    '8&ndash;21',
-    '8&ndash;256',
-    '8&ndash;30',
-    '8&ndash;32',
-    '8&ndash;32%',
-    '8&ndash;32\'',
     '8&ndash;366',
-    '8&ndash;376',
-    '8&ndash;40',
-    '8&ndash;40&ndash;0',
-    '8&ndash;41',
-    '8&ndash;45',
-    '8&ndash;5&ndash;8',
-    '8&ndash;5\'',
-    '8&ndash;54',
-    '8&ndash;56',
-    '8&ndash;58',
-    '8&ndash;61',
-    '8&ndash;7&ndash;0',
-    '8&ndash;8&ndash;8',
-    '8&ndash;8.30am',
-    '8&ndash;8.4',
     '8&ndash;80',
-    '8&ndash;81',
-    '8&ndash;9%',
-    '8&ndash;9a',
-    '8&ndash;9am',
-    '8&ndash;9c',
-    '8&ndash;9cm',
-    '8&ndash;9ft',
-    '8&ndash;9mm',
-    '8&ndash;9th',
-    '8&ndash;to',
-    '8&ohm',
-    '8&plus;2',
-    '8&plus;3',
-    '8&plusmn',
-    '8&prime;10&prime',
     '8&prime;40&prime',
-    '8&prime;41&prime',
-    '8&shilling;.',
-    '8&shilling;6d',
-    '8&shilling;to',
-    '8&sol;74',
-    '8&sol;83',
-    '8&times;10&frac34&ins',
-    '8&times;12',
-    '8&times;2&times;1in',
-    '8&times;20b',
-    '8&times;6in',
-    '8&times;8&times;5',
-    '8(2)&mdash',
-    '8(4)',
-    '8(5)',
     '8+1',
-    '8+7=',
-    '8,000&ndash;10,000',
-    '8,000&ndash;9,000',
-    '8,000,000-10,000,000',
-    '8,000-10,000',
-    '8,000-dollar',
-    '8,000-employee',
-    '8,000-er',
-    '8,000-foot-plus',
-    '8,000-hour',
-    '8,000-ton',
-    '8,000gns',
-    '8,00pm',
-    '8,013',
-    '8,018',
     '8,025',
-    '8,061',
-    '8,064',
-    '8,070',
-    '8,081',
-    '8,088',
-    '8,10,17',
-    '8,100&ndash;8,000yrbp',
-    '8,111',
-    '8,114',
-    '8,115',
-    '8,119',
-    '8,13',
-    '8,145',
-    '8,146',
-    '8,150',
     '8,155,000',
-    '8,159',
-    '8,165',
-    '8,172',
-    '8,182',
-    '8,186',
-    '8,188',
-    '8,189',
-    '8,195',
-    '8,1991',
-    '8,1992',
-    '8,2.43',
-    '8,200&ft',
-    '8,200-8,300',
-    '8,206',
-    '8,212,000',
     '8,221',
-    '8,230,000',
-    '8,231',
-    '8,245',
-    '8,255,056',
-    '8,261',
-    '8,280,000',
-    '8,293',
-    '8,300,000',
-    '8,3000',
-    '8,309pts',
-    '8,315',
-    '8,334',
-    '8,337',
-    '8,348th',
-    '8,350',
     '8,364,883',
-    '8,366.8',
-    '8,371',
-    '8,374',
-    '8,380,000',
-    '8,383',
-    '8,384',
-    '8,389,512',
-    '8,390',
-    '8,390,000',
-    '8,400lbs',
-    '8,412pts',
-    '8,420',
-    '8,426',
-    '8,441',
-    '8,442',
     '8,459,000',
-    '8,470',
-    '8,472',
-    '8,488',
-    '8,500-member',
-    '8,500ft',
-    '8,500gns',
-    '8,512,000',
-    '8,536',
-    '8,546,000',
-    '8,565',
-    '8,571',
-    '8,576',
-    '8,585',
-    '8,587',
-    '8,592-strong',
     '8,595',
-    '8,610',
-    '8,611pts',
-    '8,617',
-    '8,619',
-    '8,634,000',
-    '8,641',
-    '8,648',
-    '8,656,473',
-    '8,675',
-    '8,700,000',
-    '8,709',
-    '8,716,000',
-    '8,720',
-    '8,730',
-    '8,740,000',
     '8,747',
-    '8,765,432',
-    '8,774',
-    '8,776,000',
-    '8,781',
-    '8,782',
-    '8,790,000',
-    '8,800&ndash;8,500yrbp',
-    '8,801',
-    '8,819',
-    '8,829,606',
-    '8,833',
-    '8,838,000',
-    '8,842',
-    '8,855',
-    '8,875ft',
     '8,896',
-    '8,933,000',
-    '8,946',
-    '8,958',
-    '8,970',
-    '8,989,000',
-    '8,993',
-    '8-&frac12',
-    '8-0-58-2',
-    '8-10%',
-    '8-10,000',
-    '8-16',
-    '8-17',
-    '8-26',
-    '8-3-93',
-    '8-5',
     '8-9am',
-    '8-9pm',
-    '8-a-side',
-    '8-acre',
-    '8-and',
-    '8-azaquinolonecarboxylic',
-    '8-bar',
-    '8-bars',
-    '8-base-pair',
-    '8-bed',
-    '8-bits',
-    '8-byte',
-    '8-cd',
-    '8-cell/early',
-    '8-cells',
-    '8-column',
     '8-dihydroxyanthraquinone',
-    '8-dimensional',
-    '8-er',
-    '8-goal',
-    '8-gun',
-    '8-handicap',
-    '8-horse',
-    '8-hydroxyquinoline-5-sulphonate',
-    '8-i2oz',
-    '8-in',
-    '8-in-a',
-    '8-irons',
-    '8-is',
-    '8-ive',
-    '8-jan',
-    '8-l9',
     '8-la',
-    '8-level',
-    '8-litre',
-    '8-man',
-    '8-megawatt',
-    '8-metre-diameter',
-    '8-mile',
-    '8-mono',
-    '8-month',
-    '8-month-old',
-    '8-new',
-    '8-o',
-    '8-ounce',
-    '8-oxop7-hydrodeoxyguanosine',
-    '8-screen',
-    '8-second',
     '8-sided',
-    '8-stringers',
-    '8-teacher',
-    '8-till-late',
-    '8-ton',
-    '8-tread',
-    '8-under',
-    '8-wheel',
-    '8-wheeled',
-    '8.0&ndash;40.3',
-    '8.0&ndash;9.0',
-    '8.00%',
-    '8.00&ndash;11.00',
-    '8.00-9.00pm',
-    '8.00am-9.00pm',
-    '8.00p.m',
     '8.0156',
-    '8.018p',
-    '8.02',
-    '8.02pm',
-    '8.0583',
-    '8.05am',
-    '8.08',
-    '8.09',
-    '8.09%',
-    '8.0bn',
-    '8.0d.p.c.',
-    '8.0secs',
-    '8.0x',
-    '8.1&ndash;29',
-    '8.1&ndash;58.5mm',
-    '8.1(3)',
     '8.1(d)',
-    '8.1(e)',
-    '8.1.1.',
-    '8.1.2.',
-    '8.1.5',
-    '8.1.89',
-    '8.10&mdash;8.13',
-    '8.10(c)',
-    '8.10.1',
-    '8.10.2',
-    '8.10.3',
-    '8.10.4',
-    '8.10.5',
-    '8.10.6',
-    '8.10.62',
-    '8.10.90',
     '8.10.92',
-    '8.106.51&mdash;2',
-    '8.106.75&mdash;6',
-    '8.10pm',
-    '8.11(c)',
-    '8.12(a)',
-    '8.120',
-    '8.120.31&mdash;2',
-    '8.13.1',
-    '8.13.2',
-    '8.14.0',
-    '8.14.6',
-    '8.15%',
-    '8.15.1',
-    '8.15.2',
-    '8.15.3',
     '8.15.4',
-    '8.15.5',
-    '8.15.6',
-    '8.15.7',
-    '8.15.9',
-    '8.16.1',
-    '8.16.2',
-    '8.16.3',
-    '8.16.4',
-    '8.16.5',
-    '8.16.6',
-    '8.16am',
-    '8.17.2',
-    '8.17.6',
-    '8.18%',
-    '8.18b',
     '8.18c',
-    '8.18d',
-    '8.18e',
-    '8.19a',
-    '8.19b',
-    '8.1c',
-    '8.1k',
-    '8.1m',
-    '8.1mm',
-    '8.1secs',
-    '8.1v',
-    '8.2(2)',
-    '8.2(b)',
-    '8.2(c)',
-    '8.2(d)',
-    '8.2(e)',
     '8.2(f)',
-    '8.2-acre',
-    '8.2.2.1',
-    '8.2.2.2',
-    '8.2.6',
-    '8.20.9',
-    '8.20pm',
-    '8.22&ndash;24',
-    '8.23m',
-    '8.24b',
-    '8.25cm',
-    '8.25p',
-    '8.26',
-    '8.2829',
-    '8.283a.',
-    '8.28p',
     '8.29am',
-    '8.2a',
-    '8.2b',
-    '8.2bn',
-    '8.2ft',
-    '8.2k',
-    '8.2secs',
-    '8.3&ndash;100',
-    '8.3-litre',
-    '8.3.',
-    '8.3.1.',
-    '8.3.2.',
-    '8.3.3.',
-    '8.3.3.1',
-    '8.3.3.2',
-    '8.3.6',
     '8.30&ndash;11',
-    '8.30&ndash;11.40',
-    '8.30&ndash;12.30',
-    '8.3062',
-    '8.30a.m.',
-    '8.30am&ndash;5.30pm',
-    '8.30pm-midnight',
-    '8.30pm.',
-    '8.33p',
-    '8.34m',
-    '8.358',
-    '8.35a',
-    '8.35c',
-    '8.35pm',
-    '8.36%',
-    '8.36.9',
     '8.38.12',
-    '8.39am',
-    '8.3bn',
-    '8.3dbm',
-    '8.3pc',
-    '8.3x4.5m',
-    '8.4&ndash;5',
-    '8.4-1-45-0',
-    '8.4.4.1',
-    '8.4.4.2',
-    '8.4.4.3',
-    '8.4.4.4',
-    '8.4.4.5',
-    '8.4.5.1',
-    '8.4.5.10',
-    '8.4.5.11',
     '8.4.5.12',
-    '8.4.5.13',
-    '8.4.5.14',
-    '8.4.5.2',
-    '8.4.5.3',
-    '8.4.5.4',
-    '8.4.5.5',
-    '8.4.5.6',
-    '8.4.5.7',
-    '8.4.5.8',
-    '8.4.5.9',
-    '8.4.6',
-    '8.4.92',
-    '8.40&ndash;56',
-    '8.40&ndash;9.00',
-    '8.40am',
     '8.40p',
-    '8.40pm',
-    '8.412',
-    '8.45.',
-    '8.49',
-    '8.49%',
-    '8.49pm',
-    '8.4cm',
-    '8.4kb',
-    '8.4km',
-    '8.4pc',
-    '8.4secs',
-    '8.4v',
-    '8.5&amp;percent',
-    '8.5&ndash;10.5',
-    '8.5&ndash;68.8',
     '8.5.',
-    '8.5.3',
-    '8.53',
-    '8.54p',
-    '8.54pm',
-    '8.55%',
-    '8.55pm',
-    '8.5:1',
-    '8.5cc',
-    '8.5cm/3&frac14;in',
-    '8.5hz',
-    '8.5in',
-    '8.5k',
-    '8.5km',
-    '8.5mm',
-    '8.5x8.5x4.3mm',
     '8.6.2.1',
-    '8.6.2.3',
-    '8.6.3',
-    '8.6.3.1',
-    '8.62',
-    '8.625%',
-    '8.63',
-    '8.64m',
-    '8.65%',
-    '8.653',
-    '8.67',
-    '8.67m',
-    '8.69',
-    '8.6b',
-    '8.6c',
-    '8.6k',
     '8.6m',
-    '8.6p',
-    '8.6pc',
-    '8.7\'',
-    '8.7.5',
-    '8.7.8',
-    '8.7.91',
-    '8.71',
-    '8.73%',
-    '8.75m',
-    '8.76',
-    '8.77',
-    '8.78',
-    '8.78pc',
-    '8.7mph',
-    '8.8&deg;c',
     '8.8-9.0',
-    '8.8-fold',
-    '8.8.1',
-    '8.8.2',
-    '8.8.3',
-    '8.8.4',
-    '8.8.5',
-    '8.8/1000',
-    '8.80',
-    '8.81',
-    '8.85&ins',
-    '8.858',
-    '8.85lbs',
-    '8.875%',
-    '8.878',
-    '8.87m',
     '8.88',
-    '8.8a',
-    '8.8b',
-    '8.8c',
-    '8.8fl',
-    '8.9&times;20.3',
-    '8.9(b)',
-    '8.9.0',
-    '8.9.1',
-    '8.94',
-    '8.95',
-    '8.95%',
-    '8.95&mgr;m',
-    '8.96',
-    '8.97',
-    '8.98',
     '8.9p',
-    '8.9secs',
-    '8/',
-    '8/0',
-    '8/100',
-    '8/103',
-    '8/11',
-    '8/116',
-    '8/141',
-    '8/186',
-    '8/200',
-    '8/204',
-    '8/23',
-    '8/230&deg;c/450&deg;f',
-    '8/250&deg;c/450&deg;f',
-    '8/30',
     '8/319',
-    '8/33',
-    '8/38',
-    '8/480',
-    '8/5/41',
-    '8/586,26/604,53/631,91/669',
-    '8/67',
-    '8/7',
-    '8/7/87',
-    '8/74',
-    '8/8/1941',
-    '8/8/92',
-    '8/83',
-    '8/86',
-    '8/89',
-    '8/90',
     '8/92',
-    '8/acre',
-    '8/face',
-    '8/finished',
-    '8/kg',
-    '8/kg21',
-    '8/sc',
-    '8/standard',
-    '8/x',
-    '80%&ndash;100%',
-    '80%&ndash;90%',
-    '80%-20%',
-    '80%-mainly',
-    '80%/20%',
-    '80&amp%',
-    '80&deg:f',
     '80&deg;n',
-    '80&dollar;degree',
-    '80&dollar;f',
-    '80&ins;1',
-    '80&mdash;85&deg;s',
-    '80&mgr;gal',
-    '80&mgr;l',
-    '80&mgr;s',
-    '80&ndash;100%',
-    '80&ndash;100&deg;k',
-    '80&ndash;100,000',
-    '80&ndash;100/min',
-    '80&ndash;100mph',
-    '80&ndash;110',
-    '80&ndash;12',
-    '80&ndash;120',
     '80&ndash;120hp',
-    '80&ndash;130',
-    '80&ndash;180myr',
-    '80&ndash;200',
-    '80&ndash;200hp',
-    '80&ndash;250,000',
-    '80&ndash;41',
-    '80&ndash;46',
-    '80&ndash;460',
-    '80&ndash;500',
-    '80&ndash;63',
-    '80&ndash;82&deg;s',
-    '80&ndash;83',
-    '80&ndash;85mph',
-    '80&ndash;89',
-    '80&ndash;90k',
     '80&ndash;90km/50&ndash;60mls',
-    '80&ndash;90pc',
-    '80&ndash;91',
-    '80&ndash;92',
-    '80&ndash;94',
-    '80&ndash;95-myr-old',
-    '80&ndash;95myr',
-    '80&ndash;97%',
-    '80&plus;2',
-    '80&times',
-    '80(1)',
-    '80,000-100,000',
-    '80,000-acre',
-    '80,000-odd',
-    '80,000-seater',
-    '80,000-square-foot',
     '80,000-ton',
-    '80,000-word',
-    '80,000ft',
-    '80,135',
-    '80,288.5',
-    '80,404',
-    '80,600',
-    '80-',
-    '80-1',
-    '80-140',
-    '80-53',
-    '80-75',
-    '80-81',
-    '80-90mph',
-    '80-acre',
-    '80-and-over',
     '80-billion-dollar',
-    '80-day',
-    '80-degree',
-    '80-dollar',
-    '80-gun',
-    '80-inch',
-    '80-kilometre',
-    '80-line',
-    '80-mile',
-    '80-peg',
-    '80-per-cent',
-    '80-point',
-    '80-sheet',
-    '80-to',
-    '80-ton',
-    '80-year-',
     '80-years-and-older',
-    '80.0%',
-    '80.000',
-    '80.08',
-    '80.1453',
-    '80.16%',
-    '80.2',
-    '80.2%',
-    '80.22',
-    '80.2p',
-    '80.3',
-    '80.4/229.8',
-    '80.5',
-    '80.5%',
-    '80.53',
-    '80.56',
     '80.5ins',
-    '80.76',
-    '80.8%',
-    '80.9%',
-    '80.95%',
-    '80/-strength',
-    '80/10&mdash;1&frac14',
-    '80/100',
-    '80/102',
-    '80/3',
-    '80/48',
-    '80/503',
-    '80/509:544',
-    '80/512',
-    '80/515:550',
-    '80/70',
     '80/778/eec',
-    '80/81/82',
-    '80/90',
-    '800&micro;l',
-    '800&ndash;1',
-    '800&ndash;1,000',
-    '800&ndash;1,000myr',
-    '800&ndash;1,200kg',
-    '800&ndash;1,400m',
-    '800&ndash;1000',
-    '800&ndash;1000myr',
-    '800&ndash;200',
-    '800&ndash;899',
-    '800&ndash;900kg',
-    '800&rehy;capacity',
-    '800,000-transistor',
     '800-1,000',
-    '800-900',
-    '800-bp',
-    '800-fathom',
-    '800-its-unix',
-    '800-lb',
-    '800-member',
-    '800-mile',
-    '800-odd',
-    '800-seat',
-    '800-series',
-    '800-sq',
-    '800-year',
-    '800.4million',
-    '800/',
-    '800/700s',
     '8000&ndash;4500',
-    '8000&times',
-    '8000-foot',
-    '8000-year',
-    '80000',
-    '800000',
-    '80000000000000',
-    '80000km',
-    '8000gn',
-    '8000hz',
-    '800424',
-    '800484',
-    '8005',
-    '800688',
-    '800777',
-    '8008',
     '800ad',
-    '800b',
-    '800bn',
-    '800c',
-    '800ft/244m',
-    '800g/1&frac34;lb',
-    '800ha',
-    '800hpa',
-    '800km/500mls',
-    '800kms',
-    '800kwh',
-    '800mb',
-    '800mbytes',
-    '800mhz',
-    '800ml',
-    '800p',
     '800ppm',
-    '800se',
-    '800w',
-    '800yds',
-    '801&ndash;668',
-    '8010',
-    '8011',
-    '8012',
-    '80136',
-    '8015',
-    '8016000',
-    '8016001',
-    '8017',
-    '80170nx',
-    '801m',
-    '802&ndash;39',
     '802&ndash;811',
-    '802.1f',
-    '802.3k',
-    '802/1400',
-    '802/68',
-    '8020',
-    '8021004458',
-    '8025',
-    '80268',
-    '80286-based',
-    '8029',
-    '802s',
-    '803,540',
-    '803/68',
-    '8030',
-    '80300',
     '80309&ndash;0287',
-    '803680',
-    '80374/n7629c',
-    '80376',
-    '80386&ndash;80486',
-    '80386-',
-    '80386-80486',
-    '80386dx',
-    '80386s',
-    '80386sx-25mhz',
-    '80386sx-based',
-    '80386sx/33',
-    '80386x',
-    '8039',
-    '8039-8618-1',
-    '803c&ndash;d',
     '804,000',
-    '804/126',
-    '804/183',
-    '804/5',
-    '804/july',
-    '804/march',
-    '80400',
-    '80420',
-    '8045',
-    '80472',
-    '80486/33',
-    '80486/unix',
-    '80486dx/2',
-    '80486dx2&ndash;50',
-    '80486dx2-50',
-    '80486dx2-based',
     '80486sx-25',
-    '80487sx',
-    '804b',
-    '804ft',
-    '805&ndash;6',
-    '805/summer',
-    '80513&ndash;80523',
-    '8058',
-    '805b',
-    '806&ndash;8',
-    '806,900',
-    '806.30',
-    '8060',
-    '806486/33',
-    '8065',
-    '8067',
     '807,000,000',
-    '80703&ndash;80763',
-    '807807',
-    '808&mdash;883',
-    '808&ndash;10',
-    '808,000',
-    '808/december',
-    '8081',
-    '8083',
-    '808486',
-    '8086-compatible',
-    '8086/80286/80386/80486',
-    '8086/8088',
-    '80860-',
-    '80860xr',
-    '8087',
     '8088-powered',
-    '8088/8086',
-    '8088/86',
-    '8088/86/286',
-    '80890',
-    '808p',
-    '809,800',
-    '809-2',
-    '80903&ndash;80953',
-    '809386sl',
-    '80960-based',
-    '80960ca',
-    '80969',
-    '80c',
-    '80c286',
-    '80c51zx',
     '80c88',
-    '80cms',
-    '80e',
-    '80ha',
-    '80hz',
-    '80inches',
-    '80kg/200lb',
-    '80km/50mls',
-    '80kv',
-    '80l/h',
-    '80lb(36kg)',
-    '80lbs',
-    '80ma',
-    '80mbytes-per-second',
-    '80mg/',
-    '80min',
     '80mpg',
-    '80pcr',
-    '80per',
-    '80pp',
-    '80s/90s',
-    '80th-birthday',
-    '80ths',
-    '80w',
-    '80x70',
-    '80x86',
-    '80yds',
-    '81&deg',
-    '81&mdash;2',
-    '81&ndash;1/2',
-    '81&ndash;117',
-    '81&ndash;120',
     '81&ndash;13',
-    '81&ndash;741',
-    '81&ndash;83',
-    '81&ndash;89',
-    '81&ndash;90',
-    '81&ndash;91',
-    '81&ndash;92',
-    '81&ndash;93',
-    '81&ndash;94',
-    '81&ndash;96',
-    '81&ndash;iii',
-    '81&ndash;year-old',
-    '81(2)',
-    '81,000,000',
-    '81,333',
-    '81,400',
     '81,500',
-    '81,524',
-    '81,557,000',
-    '81,624,324,048,566,472,808',
-    '81,840,000',
-    '81,900',
-    '81,900.1',
-    '81,956',
-    '81,980',
-    '81-foot',
-    '81-inch',
-    '81-lap',
-    '81-mile',
-    '81-second',
-    '81.1',
-    '81.1&percnt',
     '81.2%',
-    '81.34',
-    '81.4',
-    '81.4%',
-    '81.55',
-    '81.59',
-    '81.73&ndash;100',
-    '81.75',
-    '81.9',
-    '81/2in',
-    '81/308',
-    '81/i&ndash;xxx',
-    '810,000',
-    '81000',
-    '8101',
-    '8101/8101m',
     '81015',
-    '81020',
-    '810224',
-    '81040',
-    '810446',
-    '81052',
-    '81063',
-    '810654',
-    '810771',
-    '81095',
-    '810e',
-    '810g',
-    '810gns',
-    '810kg',
-    '810m',
-    '811&mdash;clause',
     '811,000',
-    '8110',
-    '811107',
-    '811153',
-    '811247',
-    '8119',
-    '811e&ndash;f',
-    '812&ndash;876',
-    '81200',
-    '81200&ndash;81202',
-    '812018',
-    '812021',
-    '81203&ndash;81205',
-    '81203&ndash;81243',
-    '81206&ndash;81208',
-    '81209&ndash;81211',
     '81212',
-    '81212&ndash;81214',
-    '812134',
-    '81215&ndash;81217',
-    '81218',
-    '81218&ndash;81219',
-    '8122/91',
-    '81222&ndash;81223',
-    '81224&ndash;81225',
-    '81226&ndash;81227',
-    '812271',
-    '81228&ndash;81229',
-    '8125237',
-    '812540',
-    '8126',
-    '81270',
     '812b',
-    '812p',
-    '813&ndash;33',
-    '813164',
-    '813456',
-    '813p',
-    '814&ndash;815',
-    '81401',
-    '8141',
-    '8143',
-    '814317',
-    '8143656',
-    '8144764',
-    '814555',
-    '81460',
-    '814866',
     '814880',
-    '815&ndash;24/1412&ndash;21',
-    '815,000',
-    '815.13',
-    '8150',
-    '8151',
-    '8158',
-    '815881',
-    '815d',
-    '815kyr',
-    '816&ndash;24/1413&ndash;21',
-    '816,302',
-    '816/1413&ndash;14',
-    '816065',
-    '816344',
-    '8165',
     '816b',
-    '817&mdash;18',
-    '817,053',
-    '817,633',
-    '817-member',
-    '817/1414',
-    '8170',
-    '817200',
-    '8173',
-    '817771',
-    '818,364',
-    '818/1415',
-    '818/1415&ndash;16',
-    '818/may',
-    '8180',
-    '8181',
     '81818',
-    '818564',
-    '8188',
-    '81890',
-    '818p',
-    '819&ndash;822',
-    '8190',
-    '81:4',
-    '81a&ndash;e',
-    '81a-81e',
-    '81c&ndash;f',
-    '81cm',
-    '81esc&lsqb;11hesc',
-    '81f',
-    '81ft',
-    '81gb',
     '81ha',
-    '81min',
-    '81pc',
-    '81st-minute',
-    '82&frac12',
-    '82&mdash;6',
-    '82&ndash;086',
-    '82&ndash;1',
-    '82&ndash;127',
-    '82&ndash;134%',
-    '82&ndash;2',
-    '82&ndash;5',
-    '82&ndash;84&deg;s',
-    '82\'s',
-    '82(5)',
-    '82,000,000',
     '82,250',
-    '82,329',
-    '82,347,875',
-    '82,910',
-    '82-and-a-half',
-    '82-foot',
-    '82-test',
-    '82.0%',
-    '82.1%',
-    '82.3m',
-    '82.4%',
-    '82.5&deg;n',
-    '82.54mph',
-    '82.5p',
-    '82.6',
-    '82.6%',
     '82.63p',
-    '82.71.0myr',
-    '82.8%',
-    '82.86',
-    '82.88',
-    '82.9%',
-    '82/03520',
-    '82/04169',
-    '82/04174',
-    '82/524',
-    '82/83',
-    '82/90',
-    '820,500',
-    '820,760',
-    '820162',
-    '820250',
     '820261',
-    '8204',
-    '8206.14',
-    '820623',
-    '820p',
-    '820si',
-    '821&mdash;2',
-    '821&ndash;3',
-    '821,419',
-    '821/89,914/89',
-    '821/early',
-    '821/late',
-    '82100',
-    '82104',
-    '8211/8234',
-    '821212',
     '82130',
-    '821356',
-    '8214',
-    '821588',
-    '821s',
-    '822&mdash;3',
-    '822&ndash;1229',
-    '822&ndash;1700',
-    '822&ndash;42',
-    '822/1459',
-    '8220',
-    '822005',
-    '82203',
-    '822218',
-    '822241',
-    '822244',
     '822747',
-    '822777',
-    '822812',
-    '822840',
-    '822845',
-    '822857',
-    '822903',
-    '822937',
-    '822b&ndash;c',
-    '823&mdash;877',
-    '823&ndash;4004',
-    '823&ndash;4w',
-    '823&ndash;840',
-    '823/1420',
-    '823/19',
-    '823/may-june',
     '823/tuesday',
-    '823171',
-    '823202',
-    '823262',
-    '823322',
-    '8235',
-    '823579',
-    '823915',
-    '823b',
-    '823c&ndash;e',
-    '823g&ndash;h',
-    '823m/900yds',
-    '823p',
-    '824&ndash;1906',
-    '824,269',
-    '824,292',
     '8240',
-    '82414',
-    '824207',
-    '824215',
-    '8243',
-    '82440',
-    '824608',
-    '824646',
-    '824683',
-    '824927',
-    '824b&ndash;d',
-    '824d&ndash;f',
-    '824f',
-    '825(4)',
-    '825,000',
-    '825,000,000',
     '825-metres',
-    '825/1422',
-    '825/late',
-    '8250',
-    '8250.4',
-    '82530',
-    '825336',
-    '8255.',
-    '825604',
-    '825711',
-    '825c&ndash;d',
-    '825kg',
-    '825n',
-    '826,959',
-    '826-a\'s',
-    '8264',
     '826d&ndash;f',
-    '827&mdash;8',
-    '827/15',
-    '8276',
-    '827733',
-    '82789',
-    '827s',
-    '828&ndash;29',
-    '828,311',
-    '828/may-june',
-    '828/mid-february',
-    '828/mid-september',
-    '8280',
-    '82802',
-    '8281',
-    '8281651',
     '8285',
-    '8288',
-    '8289',
-    '829&mdash;30',
-    '829/1425&ndash;6',
-    '8290',
-    '829121',
-    '8294&ndash;7',
-    '8299',
-    '829934',
-    '82:9',
-    '82:artist',
-    '82a&ndash;i',
-    '82b',
-    '82b&ndash;82i',
-    '82c',
     '82c735',
-    '82c805',
-    '82c928',
-    '82cm',
-    '82d',
-    '82e',
-    '82ff',
-    '82ft',
-    '82g',
-    '82i',
-    '82j',
-    '82m',
-    '82mins',
-    '82n',
-    '82no',
-    '82x40x1&frac38;in',
     '83&ins',
-    '83&mdash;4',
-    '83&ndash;1',
-    '83&ndash;102',
-    '83&ndash;102%',
-    '83&ndash;103',
-    '83&ndash;105',
-    '83&ndash;106',
-    '83&ndash;119',
-    '83&ndash;86',
-    '83&ndash;9',
-    '83&plus;5',
-    '83(22)',
-    '83(5)',
-    '83(c)',
-    '83,215',
     '83,400',
-    '83,417',
-    '83,858',
-    '83,981',
-    '83-0',
-    '83-10-9',
-    '83-34',
-    '83-84',
-    '83-mile',
-    '83-point',
-    '83.1%',
-    '83.13',
-    '83.1p',
-    '83.2',
-    '83.2%',
-    '83.4&plusmn;2.6',
     '83.5p',
-    '83.8',
-    '83.8&times;66',
-    '83.81',
-    '83.87',
-    '83.9%',
-    '83.96',
-    '83/112',
-    '83/349/eec',
-    '83/4p',
-    '83/517',
-    '83/l',
-    '83/w',
-    '830&mdash;1',
-    '830&ndash;41',
-    '83010',
     '830315',
-    '830404',
-    '830868',
-    '830888',
-    '830e',
-    '830f&ndash;g',
-    '830m',
-    '830mm',
-    '831/1427&ndash;8',
-    '831/august',
-    '8313',
-    '8315',
-    '831890',
-    '831914',
-    '831b',
-    '832/1428&ndash;9',
     '832/1429',
-    '832/august',
-    '8320',
-    '832055/6',
-    '832223',
-    '8324',
-    '832425',
-    '8325917',
-    '832600',
-    '832666',
-    '832766',
-    '832787',
-    '833,000',
-    '833,421,982',
-    '833.5',
-    '833/august-september',
     '833/march-april',
-    '8330',
-    '833223',
-    '8333',
-    '8335/6',
-    '834&mdash;40',
-    '834&mdash;5',
-    '834&ndash;839',
-    '834(1)',
-    '834/1431',
-    '8340',
-    '83438',
-    '834466',
-    '8345',
-    '834641',
-    '834713',
     '8348',
-    '8349',
-    '834p',
-    '8350',
-    '83508',
-    '8356/90',
-    '8359',
-    '835c',
-    '836&mdash;7',
-    '836/1433',
-    '8360',
-    '836090',
-    '83657',
-    '8368',
-    '83690',
-    '836f',
     '837&mdash;8',
-    '837(3)',
-    '837,000,000',
-    '837,905',
-    '837/june',
-    '8370',
-    '837501',
-    '837742',
-    '8378',
-    '837b&ndash;d',
-    '838&mdash;40',
-    '838/',
-    '838/1434',
-    '838/24',
-    '838/mid-november',
-    '838080',
     '83817m',
-    '838191',
-    '838329',
-    '838362',
-    '8388',
-    '83882',
-    '838e',
-    '839&ndash;10',
-    '8390',
-    '8393/12975',
-    '83966',
-    '83985',
-    '83_per',
-    '83e',
-    '83ff',
-    '83hp',
     '83ills.',
-    '83km',
-    '83m',
-    '83min',
-    '83nm',
-    '83pp',
-    '83rd-ranked',
-    '84&deg;c',
-    '84&ins',
-    '84&ndash;100cm',
-    '84&ndash;204',
-    '84&ndash;6',
-    '84&ndash;86&deg;f',
-    '84&ndash;89',
-    '84&ndash;89%',
-    '84&ndash;95',
     '84&ndash;99',
-    '84,080,000',
-    '84,100',
-    '84,178',
-    '84,382',
-    '84,453,60',
-    '84,500',
-    '84,800',
-    '84,85',
-    '84-86',
-    '84-87',
-    '84-ball',
-    '84-pages',
-    '84-piece',
-    '84-pin',
-    '84-seat',
     '84-tonne',
-    '84-yard',
-    '84.',
-    '84.1%',
-    '84.3',
-    '84.4%',
-    '84.43',
-    '84.8%',
-    '84.83',
-    '84.9%',
-    '84.91',
-    '84/',
-    '84/169/eec',
-    '84/662',
-    '84/85',
-    '840&mdash;1',
     '840&mdash;42',
-    '840&mdash;77',
-    '840&ndash;4065',
-    '840&ndash;843',
-    '840,750',
-    '840/july',
-    '8400s',
-    '840151',
-    '8402',
-    '8405',
-    '840555',
-    '840710.',
-    '8408',
-    '840b&ndash;d',
-    '840m',
-    '840s-wrote',
     '841&mdash;2',
-    '841&ndash;870',
-    '841,507',
-    '841/1438',
-    '841/4',
-    '8410',
-    '841580',
-    '841myr',
-    '842&ndash;3',
-    '842&ndash;50',
-    '842/1438&ndash;9',
-    '8420',
-    '8420/21',
-    '842219',
-    '84260',
-    '84272',
     '8429',
-    '842h',
-    '842p',
-    '843&ndash;4',
-    '843,930,861',
-    '843-mhz',
-    '8430',
-    '8430-9345',
-    '84330',
-    '84393',
-    '843b',
-    '843m',
-    '843p',
-    '844,000',
-    '844/1441',
-    '844/july',
     '844/saturday',
-    '84424',
-    '844335',
-    '844m',
-    '845&ndash;846',
-    '845.4',
-    '845/1441&ndash;2',
-    '845000',
-    '8455ff.',
-    '84580',
-    '845p',
-    '846,000',
-    '846/may-july',
-    '8460',
-    '846000',
-    '84649',
     '84650',
-    '8467',
-    '846874',
-    '846a&ndash;e',
-    '846b',
-    '846d&ndash;f',
-    '846p',
-    '847,000',
-    '8470',
-    '84710',
-    '8472',
-    '84737',
-    '848&ndash;50/1444&ndash;6',
-    '848,000',
-    '84800',
-    '84889',
     '84891',
-    '849&ndash;901',
-    '849000',
-    '849737',
-    '84:11',
-    '84b',
-    '84in',
-    '84m',
-    '84mph',
-    '84pc',
-    '84pts',
-    '84th-minute',
-    '84w',
-    '84x60cm',
-    '84year-old',
-    '85%-95%',
     '85&deg;-90&deg;c',
-    '85&deg;s',
-    '85&ndash;100',
-    '85&ndash;103',
-    '85&ndash;105,000',
-    '85&ndash;135',
-    '85&ndash;22',
-    '85&ndash;7',
-    '85&ndash;79',
-    '85&ndash;8',
-    '85&ndash;9',
-    '85&ndash;90',
-    '85&ndash;90f',
-    '85&ndash;92',
-    '85&ndash;93',
-    '85&ndash;95',
     '85&ndash;95myr',
-    '85&percnt',
-    '85&sol;566/e.e.c.',
-    '85(2)',
-    '85,000-seat',
-    '85,200',
-    '85,250',
-    '85,513',
-    '85,686',
-    '85,750',
-    '85,942',
-    '85-.6',
-    '85-79',
-    '85-91',
-    '85-and-over',
-    '85-cm',
     '85-june',
-    '85-knot',
-    '85-man',
-    '85-member',
-    '85-mile',
-    '85-ox6',
-    '85-strong',
-    '85-year',
-    '85.',
-    '85.0',
-    '85.0%',
-    '85.07',
-    '85.08%',
-    '85.19&mdash;21',
-    '85.25',
-    '85.3%',
     '85.355a&mdash;6a.',
-    '85.37',
-    '85.5bhp',
-    '85.6',
-    '85.8%',
-    '85.9%',
-    '85/\'86',
-    '85/20',
-    '85/25',
-    '85/3',
-    '85/375/eec',
-    '85/577',
-    '85/577/eec',
-    '85/837',
-    '85/89',
-    '850%',
     '850&deg;f',
-    '850&mdash;a',
-    '850&ndash;1494',
-    '850&ndash;350yrbp',
-    '850\'s',
-    '850,000,000',
-    '850-bed',
-    '850-odd',
-    '850-page',
-    '850-piece',
-    '850-strong',
-    '850.5p',
-    '85000',
-    '8500000',
-    '85013',
-    '8503',
     '8503002',
-    '85049',
-    '85057',
-    '8506',
-    '850628',
-    '85067',
-    '850789',
-    '850977',
-    '850csi',
-    '850p',
-    '850s',
-    '850va',
-    '850w',
-    '851/1447',
-    '851005',
-    '8510t',
     '851175',
-    '85120',
-    '8514a',
-    '8517',
-    '8517-18',
-    '851803',
-    '85186',
-    '851896',
-    '85198',
-    '851a',
-    '851b-29x-5',
-    '852/1449',
-    '852/march',
-    '852335',
-    '85238',
-    '85245',
     '8527',
-    '852c',
-    '852mb',
-    '853,100,000',
-    '8530',
-    '8531',
-    '8533',
-    '85337',
-    '8535',
-    '853552',
-    '85359',
-    '85368',
-    '8537',
-    '853a',
-    '853p',
-    '854&ndash;6366',
     '854/1021',
-    '854/4',
-    '854/october',
-    '854014',
-    '85410',
-    '854157',
-    '85422',
-    '8544',
-    '85442',
-    '85455',
-    '85480',
-    '85498',
-    '854986',
-    '855&ndash;6',
-    '855&ndash;86/1451&ndash;81',
-    '855,000',
     '855,100',
-    '8553',
-    '8554',
-    '855600',
-    '85562',
-    '85597',
-    '855e&ndash;g',
-    '855e&ndash;h',
-    '855p',
-    '85605',
-    '856212',
-    '85626',
-    '856324',
-    '856672',
-    '8569',
-    '856y',
     '857/june',
-    '8570',
-    '85702',
-    '85730',
-    '85760',
-    '85780',
-    '85793',
-    '85797',
-    '858p',
-    '859,000',
-    '8591&ndash;8631',
-    '859598',
-    '85:5:10',
-    '85a',
-    '85b',
-    '85bn',
     '85c',
-    '85ci/mmol',
-    '85cm.',
-    '85db',
-    '85dbs',
-    '85ff',
-    '85gm',
-    '85k',
-    '85kjmol',
-    '85kms',
-    '85m',
-    '85mb/s',
-    '85min',
-    '85mph',
-    '85ms',
-    '85percent',
     '85pp',
-    '85s',
-    '85th-minute',
-    '85y',
-    '86%&ndash;120%',
-    '86%-158%',
-    '86%2.2',
-    '86&mdash;7',
-    '86&ndash;118',
-    '86&ndash;3',
-    '86&ndash;6',
-    '86&ndash;89',
-    '86&ndash;9',
-    '86&ndash;90',
-    '86&ndash;93',
-    '86&ndash;94',
     '86&ndash;95',
-    '86&ndash;96%',
-    '86&percnt',
-    '86&sol;566/e.e.c',
-    '86&sol;566/e.e.c.',
-    '86&sol;653',
-    '86&times;54&times;3',
-    '86(2)',
-    '86(c)',
-    '86,366,019',
-    '86,400',
-    '86,692',
-    '86,700',
-    '86-66-86cm',
-    '86-7',
-    '86-8',
     '86-85',
-    '86-87',
-    '86-91',
-    '86-ball',
-    '86-based',
-    '86-day',
-    '86-june',
-    '86-kilometre',
-    '86-mile',
-    '86-minute',
-    '86-storey',
-    '86-strong',
-    '86.0',
-    '86.1',
-    '86.356b.',
-    '86.4',
     '86.4cm',
-    '86.6',
-    '86/141',
-    '86/2s',
-    '86/398/eec',
-    '86/457/eec',
-    '86/635/eec',
-    '86/88',
-    '86/96',
-    '860-bed',
-    '860.00',
-    '8600095',
-    '860055',
-    '860066',
-    '8605',
-    '86051',
     '860555',
-    '8606',
-    '860633',
-    '86077',
-    '86085',
-    '86087',
-    '86088',
-    '86094',
-    '86095',
-    '86096',
-    '860c&ndash;d',
-    '860k',
-    '860p',
-    '861&ndash;086',
-    '861&ndash;1635',
-    '8610',
     '861101',
-    '86117',
-    '8612',
-    '861545',
-    '861868',
-    '861b',
-    '862,300',
-    '862.5',
-    '8620',
-    '86221',
-    '862222',
-    '8624',
-    '86242',
-    '86244',
-    '862444',
-    '86247',
     '862829',
-    '862d&ndash;e',
-    '862h',
-    '863/1458&ndash;9',
-    '86304',
-    '86318',
-    '8633',
-    '863333',
-    '863351',
-    '863530',
-    '863584',
-    '8639',
-    '86393',
-    '863a',
-    '863b&ndash;c',
-    '863bc',
     '863d',
-    '864,379,000',
-    '864.4',
-    '864/early',
-    '8640',
-    '864084',
-    '86410',
-    '8642',
-    '86427',
-    '864373',
-    '864513',
-    '86480',
-    '864a',
-    '864c',
-    '864e',
-    '864mhz',
     '865,978',
-    '865/',
-    '8650',
-    '865133',
-    '8652',
-    '865212',
-    '865727',
-    '866&ndash;7',
-    '866&ndash;870cm',
-    '866&ndash;909',
-    '866,556',
-    '8661',
-    '866294',
-    '8665',
-    '866613',
-    '86675',
     '8669',
-    '866cm',
-    '867&ndash;89',
-    '867/1462&ndash;3',
-    '867430',
-    '8675',
-    '86767',
-    '8678',
-    '868011',
-    '868113',
-    '86821',
-    '8684',
-    '86870',
-    '868mhz',
-    '869&ndash;70',
-    '869/864',
     '869/february',
-    '8691',
-    '86933534',
-    '86990',
-    '86:92:5',
-    '86c911',
-    '86cm',
-    '86h',
-    '86m',
-    '86n',
-    '86pp',
-    '86th-minute',
-    '87&deg;c',
-    '87&frac12;in',
-    '87&mdash;8',
-    '87&ndash\'88',
     '87&ndash;101',
-    '87&ndash;102',
-    '87&ndash;134',
-    '87&ndash;14&ndash;73',
-    '87&ndash;383',
-    '87&ndash;384',
-    '87&ndash;4',
-    '87&ndash;8',
-    '87&ndash;91%',
-    '87&ndash;94',
-    '87&ndash;96',
-    '87&ndash;99',
-    '87(1)',
-    '87(3)',
-    '87(4)',
-    '87(9)',
     '87(ii)',
-    '87,000,000',
-    '87,300',
-    '87,470',
-    '87,555',
-    '87,652',
-    '87,859',
-    '87,868',
-    '87-101',
-    '87-bed',
-    '87-cpu',
-    '87-page',
-    '87-piece',
-    '87-room',
-    '87.',
-    '87.0%',
     '87.01',
-    '87.1',
-    '87.2p',
-    '87.33p',
-    '87.4%',
-    '87.49',
-    '87.55',
-    '87.56',
-    '87.5kg',
-    '87.5p',
-    '87.7',
-    '87.8%',
-    '87.97-day',
-    '87/102/eec',
-    '87/1565&ndash;79',
-    '87/54/eec',
     '87/625',
-    '87/91',
-    '870&frac14',
-    '870.5',
-    '870/october-november',
-    '870000',
-    '87005',
-    '87028',
-    '870532',
-    '87063',
-    '8708',
-    '870cm',
-    '870d&ndash;e',
-    '8712',
-    '87125',
-    '871363',
     '871414',
-    '871500',
-    '87151',
-    '871721',
-    '8719/91',
-    '871a',
-    '871a&ndash;c',
-    '871ad',
-    '871m',
-    '872,000',
-    '872101',
-    '872122',
-    '872321',
-    '872342',
-    '8725',
-    '872519',
     '872522',
-    '8726',
-    '872664',
-    '8727',
-    '872720',
-    '872853',
-    '872p',
-    '873&ndash;874',
-    '873,290',
-    '8730',
-    '873030',
-    '8731',
-    '87340',
-    '873490',
-    '873666',
-    '873g',
     '873h',
-    '873lb',
-    '873p',
-    '874,000',
-    '874/mid-august',
-    '87400',
-    '874146',
-    '874201',
-    '874641',
-    '874848',
-    '874c',
-    '874f&ndash;g',
-    '875&ndash;8366',
-    '875,000',
-    '875,972',
-    '875/1470',
     '875123',
-    '875hp',
-    '876&ndash;7',
-    '876&ndash;877',
-    '876,960',
-    '876/early',
-    '87610',
-    '876333',
-    '87658765',
-    '876722',
-    '876881',
-    '876m',
-    '876p',
-    '877/1472&ndash;3',
-    '877/23',
-    '877/early',
     '877/march',
-    '877/mid-march',
-    '877/saturday',
-    '8771',
-    '877146',
-    '87750',
-    '877881',
-    '878058',
-    '8783/071&ndash;962',
-    '8787',
-    '878818',
-    '878977-445',
-    '87898',
-    '879&ndash;92',
-    '879,290',
-    '879/1474&ndash;5',
     '8790',
-    '8793',
-    '8797',
-    '8799',
-    '879b',
-    '879m',
-    '87:1',
-    '87a',
-    '87b',
-    '87cm',
-    '87db',
-    '87lb',
-    '87m',
-    '87mph',
-    '87r-4',
-    '87rpm',
     '87th-minute',
-    '88&deg',
-    '88&mdash;90',
-    '88&ndash;103',
-    '88&ndash;2',
-    '88&ndash;253',
-    '88&ndash;53',
-    '88&ndash;93',
-    '88&ndash;94',
-    '88&sol;361/e.e.c',
-    '88&sol;361/e.e.c.',
-    '88,100',
-    '88,400',
-    '88,514,501',
-    '88,600,000',
-    '88,798',
     '88-12',
-    '88-65',
-    '88-83',
-    '88-89',
-    '88-acre',
-    '88-feb',
-    '88-key',
-    '88-member',
-    '88-year',
-    '88.0%',
-    '88.1%',
-    '88.18',
-    '88.3',
-    '88.3%',
-    '88.4',
-    '88.5%',
     '88.63%',
-    '88.7',
-    '88.71mph',
-    '88.8%',
-    '88.8m',
-    '88.9',
-    '88/361',
-    '88/7',
-    '88/840',
-    '880,000',
-    '8800x',
-    '880114',
-    '8802/3',
-    '8802/5',
-    '88038',
-    '880473',
     '880482',
-    '8805',
-    '88050',
-    '880697',
-    '880pen',
-    '881&ndash;2722',
-    '881,000',
-    '881.',
-    '881480',
-    '8815',
-    '88160',
-    '881779',
-    '881881',
-    '881882',
-    '881884',
-    '8819',
     '881d&ndash;e',
-    '882&ndash;6/1477&ndash;81',
-    '8820',
-    '882483',
-    '882811',
-    '88285',
-    '882:1973',
-    '882a&ndash;b',
-    '882lb',
-    '883&ndash;612bc',
-    '883/1478',
-    '883/saturday',
-    '8830',
-    '8833',
-    '8833346',
-    '8834',
     '883403',
-    '883737',
-    '883838',
-    '883c&ndash;e',
-    '884188',
-    '884340',
-    '884477',
-    '8845',
-    '8845/2',
-    '884p',
-    '885,789',
-    '885/1480',
-    '885331',
-    '8856',
-    '885654',
-    '8859',
     '885923',
-    '885950',
-    '885991',
-    '885g&ndash;h',
-    '886,000',
-    '886-which',
-    '886/1481',
-    '886214',
-    '886331',
-    '8865.70',
-    '8866',
-    '887&ndash;6409',
-    '887/20',
-    '88724',
-    '8875',
-    '8876',
     '8877',
-    '88783',
-    '8879',
-    '888,000',
-    '888/1483&ndash;4',
-    '888432',
-    '8886/91',
-    '889,629',
-    '889.2',
-    '889112',
-    '88916',
-    '8894',
-    '889885',
-    '88ft',
-    '88gb',
-    '88mjy',
     '88mph',
-    '88open-compliant',
-    '88open-like',
-    '88pc',
-    '88pp.',
-    '88pts',
-    '89&frac12;p',
-    '89&ft',
-    '89&lsqb;1&rsqb',
-    '89&mdash;208',
-    '89&ndash;107',
-    '89&ndash;19&ndash;70',
-    '89&ndash;191',
-    '89&ndash;91',
-    '89&ndash;96',
-    '89&plusmn;14',
     '89(4)',
-    '89(a)',
-    '89,316',
-    '89,875',
-    '89-75',
-    '89-88',
-    '89-90',
-    '89-july',
-    '89-june',
-    '89-member',
-    '89-metre',
-    '89.',
-    '89.0',
-    '89.12',
-    '89.18%',
-    '89.1pc',
     '89.2',
-    '89.21',
-    '89.52',
-    '89.6',
-    '89.66m',
-    '89.75',
-    '89.8%',
-    '89/104/eec',
-    '89/299/eec',
-    '89/336/eec',
-    '89/46',
-    '89/48/eec',
-    '89/6',
-    '89/646',
-    '89/66.',
-    '89/667/eec',
     '89/686/eec',
-    '890/200',
-    '8900c',
-    '890286',
-    '8903',
-    '890366',
-    '8909',
-    '890d&ndash;g',
-    '890m',
-    '890s/400',
-    '891/1486',
-    '891030',
-    '891055',
-    '891146',
-    '891505',
-    '89160',
     '891919',
-    '891980',
-    '891a&ndash;d',
-    '892087',
-    '89240',
-    '8928',
-    '893&ndash;895',
-    '893&ndash;927',
-    '893,000',
-    '893,309',
-    '893/1485',
-    '8931977',
-    '8932',
-    '893828',
-    '893980',
-    '894333',
     '894418',
-    '89450',
-    '894693',
-    '8949',
-    '895&ndash;1,300/630&ndash;825kg',
-    '895&ndash;6/1490&ndash;1',
-    '895,000',
-    '895/1021',
-    '895/l',
-    '8956',
-    '895b&ndash;e',
-    '895p',
-    '896,000',
-    '896/1491',
-    '896/may-june',
-    '896363',
     '896a',
-    '896mb',
-    '896p',
-    '896pts',
-    '897&ndash;8',
-    '8970',
-    '89710',
-    '8973',
-    '897333',
-    '8976',
-    '8977s',
-    '898,718',
-    '898.31',
-    '898/10',
-    '898p',
-    '899,942',
     '8992',
-    '8993',
-    '8995',
-    '899th',
-    '89:26',
-    '89fm',
-    '89hp',
-    '89min',
-    '89pc',
-    '89pts',
-    '89year-old',
-    '8:00',
-    '8:00am',
-    '8:07:23&ndash;0500',
-    '8:1&ndash;2',
-    '8:13',
     '8:15ff',
-    '8:16',
-    '8:16&ndash;32',
-    '8:17',
-    '8:1ff',
-    '8:20',
-    '8:20&ndash;23',
-    '8:211',
-    '8:22',
-    '8:23&ndash;27',
-    '8:249',
-    '8:26&ndash;39',
-    '8:26,39,40',
-    '8:26f',
-    '8:27am',
-    '8:3',
     '8:3,4',
-    '8:31',
-    '8:32am',
-    '8:33',
-    '8:35',
-    '8:38',
-    '8:38am',
-    '8:39,40',
-    '8:4&ndash;7,14',
-    '8:40.9',
-    '8:42.26',
-    '8:43',
-    '8:45pm',
-    '8:47',
-    '8:48.0',
-    '8:5',
     '8:5&ndash;13',
-    '8:54:19&ndash;0400',
-    '8:7',
-    '8:7ff',
-    '8:8',
-    '8=-\'r/6p',
-    '8=-n/6p',
-    '8=-sn/6p',
-    '8=2n/3p',
-    '8=3+4+1',
-    '8=8',
-    '8=n/3p',
-    '8a&plusmn',
-    '8a,9,10,11',
-    '8a-c',
-    '8a.m.',
     '8aa',
-    '8ad',
-    '8ae.',
-    '8ah',
-    '8am&ndash;10pm',
-    '8am&ndash;4pm',
-    '8am-10pm',
-    '8am-8pm',
-    '8am-9pm',
-    '8am.',
-    '8am.they',
-    '8arcsec',
-    '8as',
-    '8ax',
-    '8b(1)',
-    '8be',
     '8bhp',
-    '8bl',
-    '8bq',
-    '8c+',
-    '8cd',
-    '8cm/3in',
-    '8d.per',
-    '8db',
-    '8de',
-    '8dh',
-    '8dj',
-    '8dp',
-    '8ds',
-    '8dy',
-    '8dz',
-    '8e12',
     '8e2/3200',
-    '8el',
-    '8er',
-    '8ex',
-    '8ez',
-    '8f\'',
-    '8f\'s',
-    '8fl.oz',
-    '8fp',
-    '8ft-wide',
-    '8gflops',
-    '8ghz',
-    '8gu',
-    '8gw',
-    '8hf',
-    '8hx',
     '8in-5ft',
-    '8in.',
-    '8inches',
-    '8j&times;16ins',
-    '8jf',
-    '8jn',
-    '8jt',
-    '8ju',
-    '8km.',
-    '8km/smls',
-    '8kms',
-    '8la',
-    '8lb0oz',
-    '8lg.',
-    '8lh',
-    '8lmm',
     '8lq',
-    '8lu',
-    '8m-bit',
-    '8m/26ft',
-    '8m/s',
-    '8mbps',
-    '8mg',
-    '8mgl-1',
-    '8ml',
-    '8mls',
-    '8mm-format',
-    '8mph',
-    '8myr',
-    '8n',
-    '8nb',
-    '8nj',
     '8nl',
-    '8nn',
-    '8nq',
-    '8nu',
-    '8ny',
-    '8nz',
-    '8ohm',
-    '8oz/&pound;6.69',
-    '8p.m.',
-    '8pb',
-    '8pd',
-    '8pe',
-    '8ph',
-    '8plea',
-    '8pm-12midnight',
-    '8pr',
     '8pz',
-    '8q',
-    '8qe',
-    '8qg',
-    '8qg.',
-    '8qh',
-    '8qn',
-    '8qt',
-    '8re.',
-    '8rj',
-    '8rp',
-    '8rr',
-    '8rt',
-    '8ru',
-    '8s.4d',
-    '8s.9d',
     '8sb',
-    '8sd',
-    '8sn',
-    '8st-4-oz',
-    '8su',
-    '8sz',
-    '8ta',
-    '8tbsp',
-    '8tc',
-    '8tev',
-    '8th&ndash;10th',
-    '8th&ndash;14th',
-    '8th&ndash;9th',
-    '8th-9th',
-    '8thvs9th',
-    '8tr',
     '8tt',
-    '8tu',
-    '8ub',
-    '8uj',
-    '8ut',
-    '8uu',
-    '8v1&ndash;6',
-    '8va',
-    '8x10x3in',
-    '8x12inch',
-    '8x40',
-    '8x8',
-    '8xb',
-    '8xf',
-    '8xn',
-    '8xp',
     '8xu.',
-    '8yds',
-    '8ye',
-    '8yrd',
-    '8yx',
-    '9%+15%=24%',
-    '9%120',
-    '9&amp',
-    '9&deg;c',
-    '9&frac12;-5&frac12',
-    '9&frac12;-minute',
-    '9&frac12;d',
-    '9&frac14;p',
-    '9&frac15;cm',
-    '9&frac34;d.',
-    '9&frac58',
     '9&ft&times;6&ft&times;4.5&ft',
-    '9&ft;3&ins',
-    '9&ft;6&ins',
-    '9&half;x12x3in',
-    '9&mdash',
-    '9&mdash;10',
-    '9&middot;1',
-    '9&middot;2',
-    '9&ndash&frac12',
-    '9&ndash;09',
-    '9&ndash;1&ndash;26&ndash;3',
-    '9&ndash;1-1',
-    '9&ndash;10&deg;c',
-    '9&ndash;108',
-    '9&ndash;10ft',
-    '9&ndash;10h',
     '9&ndash;11%',
-    '9&ndash;11.30',
-    '9&ndash;11th',
-    '9&ndash;12&ndash;0',
-    '9&ndash;12&ndash;1',
-    '9&ndash;12&ndash;18',
-    '9&ndash;12.30',
-    '9&ndash;12ft',
-    '9&ndash;12ghz',
-    '9&ndash;12m',
-    '9&ndash;12th',
-    '9&ndash;13%',
-    '9&ndash;14&ndash;0',
-    '9&ndash;14-year-olds',
-    '9&ndash;15&ndash;0',
-    '9&ndash;15&ndash;8',
     '9&ndash;15in',
-    '9&ndash;15m',
-    '9&ndash;17',
-    '9&ndash;17a',
-    '9&ndash;18',
-    '9&ndash;18kg',
-    '9&ndash;18kg.',
-    '9&ndash;19',
-    '9&ndash;1pm',
-    '9&ndash;2&ndash;0',
-    '9&ndash;2.2v',
-    '9&ndash;20b',
-    '9&ndash;225',
-    '9&ndash;23',
-    '9&ndash;24',
-    '9&ndash;25kg',
     '9&ndash;3(b)',
-    '9&ndash;30&ndash;51',
-    '9&ndash;30am',
-    '9&ndash;31',
-    '9&ndash;34&ndash;0',
-    '9&ndash;35&ndash;0',
-    '9&ndash;367',
-    '9&ndash;37',
-    '9&ndash;38',
-    '9&ndash;4&ndash;0',
-    '9&ndash;4.30',
-    '9&ndash;43&ndash;1',
-    '9&ndash;45',
-    '9&ndash;49',
-    '9&ndash;5&ndash;10&ndash;2',
-    '9&ndash;51&ndash;0',
     '9&ndash;7(a)',
-    '9&ndash;8&ndash;1904',
-    '9&ndash;85',
-    '9&ndash;87',
-    '9&ndash;9(a)',
-    '9&ndash;9(b)',
-    '9&ndash;hole',
-    '9&plus;1',
-    '9&prime;52&prime',
-    '9&prime;54&prime',
-    '9&prime;55&prime',
-    '9&shilling;7d',
-    '9&sol;9a',
-    '9&times;10',
-    '9&times;12cm',
-    '9\'',
     '9\'03',
-    '9(1b)',
-    '9(4)&mdash',
-    '9(6)',
-    '9(9)',
-    '9(d)',
-    '9(f)',
-    '9(g)',
-    '9+10',
-    '9,000&mdash;10,000',
-    '9,000&ndash;10,000',
-    '9,000+',
-    '9,000-acre',
-    '9,000-litre',
-    '9,000-name',
-    '9,000-s',
     '9,000ft',
-    '9,000kg',
-    '9,000lb',
-    '9,000m',
-    '9,000t',
-    '9,029',
-    '9,073',
-    '9,089,659',
-    '9,1',
-    '9,10,11,12',
-    '9,100m',
-    '9,116,877',
-    '9,119',
-    '9,122',
-    '9,124',
-    '9,175',
     '9,180,000',
-    '9,19',
-    '9,192,631,770',
-    '9,196',
-    '9,200,000',
-    '9,203',
-    '9,205',
-    '9,215',
-    '9,220',
-    '9,229',
-    '9,238',
-    '9,240',
-    '9,250',
-    '9,250lbs',
-    '9,257,000',
-    '9,260,761',
     '9,278',
-    '9,280ft',
-    '9,286',
-    '9,290',
-    '9,295',
-    '9,3',
-    '9,300,000',
-    '9,300,000,000',
-    '9,319',
-    '9,337',
-    '9,342',
-    '9,350',
-    '9,353,006',
-    '9,359,656',
-    '9,369',
-    '9,376',
     '9,391',
-    '9,400,000',
-    '9,419,108',
-    '9,421,000',
-    '9,426',
-    '9,434',
-    '9,449',
-    '9,450',
-    '9,473',
-    '9,478',
-    '9,487',
-    '9,489',
-    '9,500,000',
-    '9,519',
-    '9,546',
-    '9,560',
     '9,562',
-    '9,567,000',
-    '9,572',
-    '9,581',
-    '9,595',
-    '9,600-ton',
-    '9,600kbps',
-    '9,618,696',
-    '9,644',
-    '9,660',
-    '9,668,454',
-    '9,672',
-    '9,679',
-    '9,686',
-    '9,694,000',
-    '9,700-ton',
     '9,706',
-    '9,714',
-    '9,734',
-    '9,750',
-    '9,775',
-    '9,780lb',
-    '9,784',
-    '9,799',
-    '9,808',
-    '9,820',
-    '9,830',
-    '9,834',
-    '9,850',
-    '9,867,000',
-    '9,874',
-    '9,906',
     '9,920',
-    '9,926',
-    '9,927,000',
-    '9,929',
-    '9,950&ndash;15,050',
-    '9,966',
-    '9,999,433',
-    '9-(2-hydroxyethoxymethyl)',
-    '9-0-48-0',
-    '9-068314343',
-    '9-23',
-    '9-3-2',
-    '9-3-93',
-    '9-5-1',
-    '9-5-2',
-    '9-6-1',
     '9-6-2',
-    '9-6-3',
-    '9-9',
-    '9-academic',
-    '9-acre',
-    '9-anilinoacridine',
-    '9-dec.',
-    '9-deoxy-6',
-    '9-dimensional',
-    '9-epoxy-&dgr',
-    '9-for-4',
-    '9-hydroxyprostaglandin',
-    '9-m',
-    '9-month',
-    '9-o',
-    '9-point',
     '9-r',
-    '9-row',
-    '9-track',
-    '9-vectors',
-    '9.0&ndash;12.5',
-    '9.0&ndash;9.5d.p.c.',
-    '9.00%',
-    '9.00&ndash;10.00pm',
-    '9.00&ndash;9.30',
-    '9.00a.m.',
-    '9.01am',
-    '9.03.53',
-    '9.033',
-    '9.04.05',
-    '9.07',
-    '9.08',
     '9.0kb',
-    '9.1&ndash;28.0',
-    '9.1&ndash;9.1.2',
-    '9.1&ndash;9.7',
-    '9.1(a)',
-    '9.1(c)',
-    '9.1.',
-    '9.1.1.1',
-    '9.1.1.3',
-    '9.1.10',
-    '9.1.4.1',
-    '9.1.4.2',
-    '9.1.5',
-    '9.1.95&ndash;17.3.95',
-    '9.104',
-    '9.10a',
     '9.10am',
-    '9.10b',
-    '9.11a',
-    '9.13%',
-    '9.13.1',
-    '9.13.2',
-    '9.13.3',
-    '9.13p.c',
-    '9.14(b)',
-    '9.14.04',
-    '9.14m',
-    '9.14p',
-    '9.15&ndash;10.30',
-    '9.15&ndash;5.15',
-    '9.15(a)',
-    '9.15.1',
     '9.15am-9.45pm',
-    '9.15p.m',
-    '9.16%',
-    '9.16(b)',
-    '9.16(c)',
-    '9.18&ndash;26',
-    '9.19&ndash;9.20',
-    '9.1kg',
-    '9.1oa',
-    '9.1p',
-    '9.1secs',
-    '9.1x9.1m',
-    '9.2(1)',
-    '9.2.5',
-    '9.2.6',
-    '9.20&ndash;27',
     '9.20am',
-    '9.22.6&mgr;acm',
-    '9.22.9',
-    '9.24&ndash;27',
-    '9.24.32',
-    '9.25:1cr',
-    '9.25pc',
-    '9.26&ndash;28',
-    '9.26.9',
-    '9.26m',
-    '9.26p',
-    '9.27%',
-    '9.27.4',
-    '9.27.59',
-    '9.29%',
-    '9.2a',
     '9.2b',
-    '9.2p',
-    '9.3&ndash;4&ndash;9&ndash;3',
-    '9.3(a)',
-    '9.3(c)',
-    '9.3-metre-wide',
-    '9.3.',
-    '9.3.4',
-    '9.3.90',
-    '9.30%',
-    '9.30&ndash;10',
-    '9.30&ndash;10.00',
-    '9.30&ndash;10.30',
-    '9.30&ndash;12',
-    '9.30&ndash;13',
-    '9.30&ndash;17.00',
     '9.30&ndash;17.30',
-    '9.30&ndash;18.30',
-    '9.30&ndash;18.45',
-    '9.30-10am',
-    '9.30.5kyr',
-    '9.304pm',
-    '9.30am&ndash;1.30pm',
-    '9.30am&ndash;12.30pm',
-    '9.30am&ndash;4.30pm',
-    '9.30am&ndash;5pm',
-    '9.30am-1.30pm',
-    '9.30am-12.45pm',
-    '9.30am-6.00pm',
-    '9.30am-7.30',
-    '9.30am-7pm',
-    '9.30am-noon',
     '9.30an-4.30pm',
-    '9.31&ndash;11.7/1000',
-    '9.31&ndash;4',
-    '9.31.25',
-    '9.32am',
-    '9.33%',
-    '9.34',
-    '9.34.30',
-    '9.35.1',
-    '9.35:1',
-    '9.35am',
-    '9.35pm',
-    '9.36',
-    '9.36.11',
-    '9.37',
-    '9.37.2',
     '9.375%',
-    '9.3kw',
-    '9.3oam',
-    '9.3opm',
-    '9.3secs',
-    '9.4&ndash;12.6/1000',
-    '9.4&times;10',
-    '9.4/1000',
-    '9.40%',
-    '9.4066',
-    '9.40am',
-    '9.44p',
-    '9.45%',
-    '9.45&ndash;10.45',
-    '9.45.53',
-    '9.4516',
     '9.45p',
-    '9.46&ndash;50',
-    '9.47&deg;n',
-    '9.4d',
-    '9.4pc',
-    '9.5&deg',
-    '9.5&deg;x3.2&deg',
-    '9.5&ndash;10.5',
-    '9.5&ndash;24.5%',
-    '9.5(a)',
-    '9.5(b)',
-    '9.5(c)',
-    '9.5.3',
-    '9.500',
-    '9.50am.',
-    '9.50pm',
     '9.51.06',
-    '9.56',
-    '9.57p',
-    '9.58',
-    '9.59',
-    '9.5:1',
-    '9.5in',
-    '9.5inch',
-    '9.5kg',
-    '9.5kyr',
-    '9.6&ins',
-    '9.6.1.',
-    '9.6.1.1',
-    '9.6.1.2',
-    '9.6.1.3',
-    '9.6.3',
     '9.6.4',
-    '9.60',
-    '9.62',
-    '9.625%',
-    '9.62p',
-    '9.63%',
-    '9.64',
-    '9.67%',
-    '9.6gb',
-    '9.6kg',
-    '9.6ozs',
-    '9.6pc',
-    '9.6secs',
-    '9.7.1',
-    '9.7.2',
-    '9.70',
     '9.70.2kyr',
-    '9.712%',
-    '9.73',
-    '9.75m',
-    '9.75p',
-    '9.75pc',
-    '9.76',
-    '9.7610186961045hz',
-    '9.7:1',
-    '9.7pc',
-    '9.8&ndash;46.5',
-    '9.8(c)',
-    '9.8.3',
-    '9.8.89',
-    '9.805',
-    '9.81',
     '9.82',
-    '9.84',
-    '9.85m',
-    '9.86%',
-    '9.88',
-    '9.8:1',
-    '9.8a',
-    '9.8b',
-    '9.8cm',
-    '9.8p',
-    '9.8secs',
-    '9.9(c)',
-    '9.90',
-    '9.91p',
-    '9.92%',
-    '9.96s',
     '9.97',
-    '9.9oz',
-    '9.9secs',
-    '9/-',
-    '9/10/11/12th',
-    '9/10/90',
-    '9/100',
-    '9/11/82',
-    '9/115(8%)',
-    '9/12b',
-    '9/14',
-    '9/186',
-    '9/2/41',
-    '9/24',
-    '9/289',
-    '9/3/41',
     '9/4',
-    '9/4/93',
-    '9/46',
-    '9/5/41',
-    '9/56',
-    '9/6',
-    '9/63',
-    '9/8',
-    '9/8/87',
-    '9/81',
-    '9/810',
-    '9/822',
-    '9/86',
-    '9/89',
-    '9/8a',
-    '9/91',
     '9/9b',
-    '9/face',
-    '9/kg',
-    '9/lg',
-    '9/tube',
-    '9/working',
-    '9/zg',
-    '9/zg26',
-    '90%--mainly',
-    '90%-plus',
-    '90&deg;-angle',
-    '90&deg;.',
-    '90&deg;e.',
-    '90&divide;300',
-    '90&frac12;in',
-    '90&mdash;1',
     '90&micro;v',
-    '90&ndash;10',
-    '90&ndash;100%',
-    '90&ndash;100&deg;c',
-    '90&ndash;1002',
-    '90&ndash;110mph',
-    '90&ndash;116',
-    '90&ndash;13',
-    '90&ndash;130',
-    '90&ndash;2',
-    '90&ndash;240',
-    '90&ndash;3',
-    '90&ndash;34',
-    '90&ndash;34t',
-    '90&ndash;43',
-    '90&ndash;5',
     '90&ndash;7',
-    '90&ndash;8',
-    '90&ndash;92',
-    '90&ndash;94%',
-    '90&ndash;95%',
-    '90&ndash;95lbs',
-    '90&ndash;98',
-    '90&ndash;98%',
-    '90&ndash;years',
-    '90&rehy;minute',
-    '90+m',
-    '90,000+',
-    '90,000-100,000',
-    '90,000-mile',
-    '90,000-strong',
-    '90,000.',
     '90,000rpm',
-    '90,500',
-    '90,630,000',
-    '90,700',
-    '90,710-acre',
-    '90,800',
-    '90,843',
-    '90-10',
-    '90-105',
-    '90-95%',
-    '90-acre',
-    '90-claim',
-    '90-day-notice',
-    '90-hour',
-    '90-june',
-    '90-min',
     '90-minutes',
-    '90-mph',
-    '90-page',
-    '90-pegger',
-    '90-per-cent',
-    '90-port',
-    '90-pupil',
-    '90-strong',
-    '90-thousand',
-    '90-volt',
-    '90.',
-    '90.1',
-    '90.1%',
-    '90.26%',
-    '90.32',
-    '90.6',
     '90.7%',
-    '90.75',
-    '90.79',
-    '90/',
-    '90/100000',
-    '90/109',
-    '90/141',
-    '90/142',
-    '90/314/eec',
-    '90/423',
-    '90/50',
-    '90/547',
-    '90/55',
-    '90/619/eec',
-    '90/95mph',
-    '90/e',
     '90/hickox',
-    '90/mm',
-    '900&deg',
-    '900&ft/270m',
-    '900&ndash;1',
-    '900&ndash;1,100kg',
-    '900&ndash;1,300',
-    '900&ndash;1000',
-    '900&ndash;1100m',
-    '900&ndash;1300',
-    '900&ndash;1700',
-    '900&ndash;600',
-    '900&ndash;800bc',
-    '900&ndash;8500',
-    '900&ndash;950',
-    '900&ndash;999',
     '900,000,000',
-    '900-foot-high',
-    '900-hp',
-    '900-kg',
-    '900-km',
-    '900-m',
-    '900-megawatt',
-    '900-million',
-    '900-page',
-    '900-series',
-    '900-square',
-    '900-year',
-    '900/march-',
-    '9000&ndash;8x0',
-    '9000+',
-    '9000-year-old',
     '9000/1200',
-    '9000/400s',
-    '9000/700',
-    '9000/700/800',
-    '9000/705',
-    '9000/710',
-    '9000/730',
-    '9000/800',
-    '9000/8000',
-    '90001700',
-    '90006',
-    '900091',
-    '900092',
-    '9000cs',
-    '9000l',
-    '9000mvs/esa',
     '9000xs',
-    '900102',
-    '9003',
-    '90048172',
-    '900853',
-    '900871',
-    '900cm',
-    '900e',
-    '900gns',
-    '900hp',
-    '900kb/sec',
-    '900kms',
-    '900kw',
-    '900mg',
-    '900mm/3',
-    '900mw',
     '900mwe',
-    '900p',
-    '900p.p.t.v.',
-    '900pc',
-    '900rpm',
-    '900x',
-    '900yrbp',
-    '901&mdash;928',
-    '901.66',
-    '901/1496',
-    '901/march-april',
-    '9011',
-    '90110300a',
-    '9012',
-    '90120',
-    '901271',
     '90129',
-    '901298',
-    '9015',
-    '90168943a',
-    '90174036b',
-    '90181',
-    '90182',
-    '9019',
-    '901b',
-    '901c&ndash;d',
-    '902.',
-    '902.45',
-    '902.5',
-    '902/1497',
-    '9020',
-    '90215',
     '9021mp',
-    '9021s',
-    '9025',
-    '90258',
-    '902659',
-    '9028',
-    '902h',
-    '903/1497&ndash;8',
-    '903/1498',
-    '9032',
-    '90360',
-    '903880',
-    '903a',
-    '904,000',
-    '904-881',
-    '9040',
     '90432',
-    '9045n',
-    '905,000',
-    '905/1499',
-    '9050',
-    '90502',
-    '905183',
-    '905bp',
-    '906,000',
-    '906/907',
-    '9060',
-    '9062',
-    '906g/day',
-    '907,000',
-    '907/1501&ndash;2',
-    '907023',
     '9072',
-    '90722&ndash;2',
-    '90734',
-    '9074',
-    '90790',
-    '907c&ndash;d',
-    '907g',
-    '907p',
-    '908,000',
-    '908/1502&ndash;3',
-    '908p',
-    '909,377',
-    '909364',
-    '9094',
-    '90940',
-    '9097',
     '9098',
-    '909d&ndash;g',
-    '90_per',
-    '90bhp',
-    '90degs',
-    '90f',
-    '90gal',
-    '90hz',
-    '90iii387a',
-    '90k',
-    '90km',
-    '90kms',
-    '90kph',
-    '90kts',
-    '90kyr',
-    '90l',
     '90lv',
-    '90m/100yds',
-    '90mb/s',
-    '90ml/3fl',
-    '90mmol/l',
-    '90mp',
-    '90n',
-    '90ng',
-    '90p&mdash&pound;1.05',
-    '90p&ndash&pound;1.69',
-    '90per',
-    '90sq',
-    '90st',
-    '90sx',
-    '90th-minute',
-    '90year-old',
     '91&frac12&deg',
-    '91&frac12;7degree',
-    '91&frac14&deg',
-    '91&mdash;2',
-    '91&ndash;08',
-    '91&ndash;100%',
-    '91&ndash;229',
-    '91&ndash;23',
-    '91&ndash;255',
-    '91&ndash;4',
-    '91&ndash;56',
-    '91&ndash;88',
-    '91&ndash;94',
-    '91&ndash;95%',
-    '91(10)',
-    '91(14)',
     '91,000-member',
-    '91,440',
-    '91,740',
-    '91,802',
-    '91-85',
-    '91-92',
-    '91-dec',
-    '91-seat',
-    '91-year',
-    '91.',
-    '91.02',
-    '91.2%',
-    '91.2&ndash;97.5%',
-    '91.21.4myr',
-    '91.3',
-    '91.33',
     '91.34',
-    '91.39',
-    '91.44',
-    '91.5&times;122',
-    '91.50',
-    '91.517',
-    '91.5cm',
-    '91.66',
-    '91.7',
-    '91.9',
-    '91.9p',
-    '91/\'92',
-    '91/03',
-    '91/06',
-    '91/118',
-    '91/123',
     '91/187',
-    '91/250/eec',
-    '91/27',
-    '91/287',
-    '91/29',
-    '91/325/eec',
-    '91/l',
-    '91/p.352',
-    '91/p.376',
-    '91/p.398',
-    '91/p.452',
-    '91/p.456',
-    '91/p.466',
-    '91/p.484',
-    '910&ndash;30',
-    '910,950/950i',
     '9100',
-    '91004',
-    '91007',
-    '91008',
-    '91009',
-    '910d',
-    '910in',
-    '910m',
-    '9114',
-    '9116',
-    '911646',
-    '91170',
-    '9119',
-    '912&ndash;13',
-    '912&ndash;13/1506&ndash;8',
-    '912.00',
     '9120',
-    '9120547.6',
-    '9121s',
-    '9122',
-    '91234',
-    '9125',
-    '91260',
-    '912kms',
-    '912s',
-    '913,000',
-    '913.5',
-    '9136/91',
-    '913675',
-    '91370&ndash;71',
-    '913d&ndash;g',
-    '914.4',
     '914501',
-    '914666',
-    '914a',
-    '915&ndash;3210',
-    '915,552',
-    '915,979',
-    '915c&ndash;d',
-    '915mm',
-    '916,000',
-    '916,377',
-    '916,771',
-    '916/1127',
-    '9161',
-    '9166',
-    '917&ndash;604',
-    '917,116',
     '917/1511',
-    '9172/30',
-    '9173',
-    '9175',
-    '9177',
-    '917ff',
-    '918&ndash;26/1512&ndash;20',
-    '918,000',
-    '918.1',
-    '918/1512',
-    '918m',
-    '919&mdash;30',
-    '9194',
-    '9195',
-    '919595',
-    '9196',
     '91960',
-    '91963',
-    '91964',
-    '91972',
-    '91975',
-    '91988-89',
-    '91993',
-    '91:4',
-    '91a',
-    '91cm',
-    '91cm&times;1.5m',
-    '91e&ndash;g',
-    '91k',
-    '91mm',
-    '91no',
-    '91pts',
     '91s',
-    '92&deg;c',
-    '92&deg;f',
-    '92&formula;km/h',
-    '92&frac12;p',
-    '92&ft',
-    '92&ins',
-    '92&ndash',
-    '92&ndash\'93',
-    '92&ndash;104',
-    '92&ndash;12',
-    '92&ndash;120',
-    '92&ndash;226v',
-    '92&ndash;6',
-    '92&ndash;94',
-    '92&ndash;97%',
     '92\'',
-    '92(3)',
-    '92,104',
-    '92,400',
-    '92,500',
-    '92,600,000',
-    '92,658',
-    '92,660',
-    '92,775',
-    '92,93',
-    '92-93',
-    '92-member',
-    '92-nov',
-    '92-octane',
-    '92-piece',
-    '92-seat',
     '92-year',
-    '92.',
-    '92.0',
-    '92.00',
-    '92.1',
-    '92.1%',
-    '92.4',
-    '92.4g',
-    '92.56',
-    '92.6%',
-    '92.66',
-    '92.6m',
-    '92.7',
-    '92.8%',
-    '92.8p',
-    '92.9',
     '92/',
-    '92/27/eec',
-    '92/421',
-    '92/56',
-    '92/c',
-    '920&ndash;1',
-    '920,297',
-    '920-acre',
-    '920/l',
-    '920/october',
-    '9200',
-    '92000',
-    '92010',
-    '92032',
-    '920624',
-    '92091',
     '920kms',
-    '920metres',
-    '920p',
-    '920s',
-    '921%',
-    '921&ndash;2/1515&ndash;16',
-    '921,030',
-    '921.',
-    '921.3%',
-    '921/1515',
-    '921/18',
-    '9213984',
-    '92180',
-    '92185/',
-    '92190',
-    '922&mdash;whilst',
     '922&ndash;3',
-    '922/1516',
-    '922/27',
-    '92201',
-    '9221s',
-    '9222',
-    '92230',
-    '92240',
-    '9225',
-    '9226',
-    '923,000',
-    '9238',
-    '92399',
-    '924/1113',
-    '924/february',
-    '9240',
     '92401',
-    '92402',
-    '92404',
-    '92406',
-    '9241',
-    '9244',
-    '925&ndash;940',
-    '925,000',
-    '925,600',
-    '925-3600',
-    '9251',
-    '92512',
-    '925km',
-    '925p',
-    '926&ndash;7',
-    '926,293',
     '926,939',
-    '926.',
-    '9260',
-    '926019',
-    '9262',
-    '926f',
-    '926h',
-    '926m',
-    '926p',
-    '927&ndash;8',
-    '927&ndash;8/1521',
-    '927/1521',
-    '927837',
-    '9279',
-    '927a',
-    '927g',
     '927km',
-    '928,000',
-    '928/early',
-    '9280',
-    '928a',
-    '928gts',
-    '928s',
-    '929&ndash;30/1523',
-    '929&ndash;3528',
-    '929/june',
-    '9290',
-    '9292',
-    '9297',
-    '92a',
-    '92a=blue',
-    '92c',
     '92d',
-    '92d&ndash;e',
-    '92e',
-    '92ev',
-    '92ff',
-    '92ft',
-    '92lb',
-    '92mar14',
-    '92mm',
-    '92pts',
-    '93&deg',
-    '93&mdash;106',
-    '93&ndash;1',
-    '93&ndash;101',
-    '93&ndash;113',
-    '93&ndash;7',
     '93&ndash;98',
-    '93&percnt',
-    '93&plus;2',
-    '93&rehy;year-old',
-    '93+',
-    '93,000,000',
-    '93,100',
-    '93,170',
-    '93,177,050,000',
-    '93,215',
-    '93,367',
-    '93,400',
-    '93,500',
-    '93,570',
-    '93,720',
-    '93,800',
     '93-34',
-    '93-member',
-    '93.',
-    '93.0%',
-    '93.1%',
-    '93.12',
-    '93.13',
-    '93.2',
-    '93.26',
-    '93.44',
-    '93.6',
-    '93.7ins',
-    '93.9%',
-    '93.9pc',
-    '93/067',
-    '93/3/07',
     '93/58',
-    '930&ndash;1700',
-    '930&ndash;40',
-    '930,000',
-    '930.00',
-    '930/940/900/270',
-    '93000',
-    '930214',
-    '930215',
-    '930216',
-    '930218',
-    '930220',
-    '930222',
-    '930223',
-    '930224',
-    '9303',
     '9303.',
-    '930314',
-    '930318',
-    '930321',
-    '930322',
-    '930323',
-    '930324',
-    '930325',
-    '930410',
-    '9306',
-    '93070',
-    '930s',
-    '931,000',
-    '93130',
-    '9317',
-    '931862',
     '931d&ndash;e',
-    '932&ndash;2330',
-    '932/1525&ndash;6',
-    '9320',
-    '9321',
-    '933&ndash;4',
-    '9334',
-    '9337',
-    '933f&ndash;g',
-    '934/1',
-    '934/2',
-    '93450',
-    '934b',
-    '935,643',
-    '935/1528&ndash;9',
-    '9354',
     '93570',
-    '935h',
-    '936,338',
-    '936,653',
-    '9363.6',
-    '937,000',
-    '937/1530&ndash;1',
-    '93727',
-    '9374',
-    '938.7',
-    '9380',
-    '9381',
-    '9385',
-    '9390',
-    '9394',
-    '9396',
     '939879',
-    '939f',
-    '93:1',
-    '93:4',
-    '93:66',
-    '93bhp',
-    '93c&ndash;f',
-    '93f',
-    '93ff.',
-    '93g',
-    '93km',
-    '93km.',
-    '93mins',
-    '93mph',
-    '93rd-best',
-    '94%-',
     '94&deg;f',
-    '94&frac12;in',
-    '94&lsqb;2&rsqb',
-    '94&mdash;5',
-    '94&ndash;0',
-    '94&ndash;100',
-    '94&ndash;110',
-    '94&ndash;127',
-    '94&ndash;128',
-    '94&ndash;400',
-    '94&ndash;52',
-    '94&ndash;99',
-    '94&ndash;year-old',
-    '94&percnt',
-    '94&plus;11',
-    '94&times;45&times;66cm',
     '94(1)',
-    '94(2)',
-    '94(=924)',
-    '94,240',
-    '94,267',
-    '94,742',
-    '94,768',
-    '94,800,000',
-    '94-107',
-    '94-run',
-    '94-strong',
-    '94-year-old',
-    '94-year-olds',
-    '94.07&plusmn;0.06%',
-    '94.1%',
-    '94.10%',
     '94.3%',
-    '94.39',
-    '94.44',
-    '94.48',
-    '94.49',
-    '94.5',
-    '94.5x245x64&ins',
-    '94.6%',
-    '94.8',
-    '94.9%',
-    '940,000,000',
-    '940/1533&ndash;4',
-    '940/1534',
-    '9402',
-    '9408',
-    '940lb',
     '940s',
-    '940t',
-    '941&mdash;58',
-    '941/1534',
-    '94103',
-    '94107',
-    '94109',
-    '94133',
-    '9416',
-    '9417',
-    '9418',
-    '941a&ndash;b',
-    '942&ndash;4/1536&ndash;7',
-    '942.073',
-    '942/l',
-    '9420',
     '9423',
-    '9424',
-    '9427',
-    '9428',
-    '94280',
-    '942a&ndash;b',
-    '943/1536',
-    '9432',
-    '94330',
-    '9434',
-    '9435/1',
-    '9436',
-    '94366',
-    '943b',
-    '943p',
-    '944,000',
     '944/1537',
-    '9443',
-    '9444/1',
-    '9447',
-    '944c',
-    '944s2',
-    '945&ndash;6',
-    '945,000',
-    '945,350',
-    '945/1538&ndash;9',
-    '945/1539',
-    '9450',
-    '9453',
-    '946&mdash;55',
-    '946&ndash;955',
-    '946,900,000',
     '94615',
-    '9464/1',
-    '94661',
-    '946645',
-    '9468944',
-    '947&ndash;4814',
-    '947,000',
-    '947,356',
-    '947/1540&ndash;1',
-    '9475/1',
-    '9477/1',
-    '9479/1',
-    '947982',
-    '947m',
-    '9480',
-    '9480/1',
     '9486/1',
-    '9488',
-    '949-',
-    '9494',
-    '9494/1',
-    '9495/1',
-    '94_per',
-    '94ft',
-    '94h',
-    '94ills.',
-    '94ins',
-    '94lb',
-    '94m',
-    '94m/123m',
-    '94mm',
-    '94pc',
     '94pp',
-    '94pp.',
-    '94x84.5cm',
-    '94year-old',
-    '95%-rated',
-    '95%:5%',
-    '95%ile',
-    '95&deg;f',
-    '95&mdash;6',
-    '95&mdash;7',
-    '95&mgr;ms',
-    '95&middot;1',
-    '95&middot;4',
-    '95&ndash;110',
-    '95&ndash;120',
-    '95&ndash;400',
     '95&ndash;55',
-    '95&ndash;8',
-    '95&ndash;97',
-    '95&ndash;97%',
-    '95&percnt',
-    '95&plus',
-    '95(1)',
-    '95,100',
-    '95,200',
-    '95,245',
-    '95,500.10',
-    '95,600',
-    '95,654',
-    '95,694',
-    '95,800',
-    '95-100',
     '95-18',
-    '95-92',
-    '95-mips',
-    '95-omt',
-    '95-page',
-    '95-year',
-    '95.07p',
-    '95.1%',
-    '95.19',
-    '95.2',
-    '95.2&aring',
-    '95.2&ndash;111',
-    '95.20',
-    '95.30',
-    '95.38f',
-    '95.50c',
     '95.57&plusmn;0.08%',
-    '95.6%',
-    '95.7',
-    '95.8',
-    '95.8%',
-    '95.8fm',
-    '95.9',
-    '95/520',
-    '95/55a',
-    '95/55b',
-    '950&mgr;v',
-    '950,100',
-    '950,782',
-    '950-year',
-    '950/1544',
-    '95000',
     '9506/1',
-    '9507/1',
-    '950m',
-    '950p',
-    '951&ndash;2',
-    '951&ndash;952',
-    '9510',
-    '9511',
-    '9512',
-    '951300',
-    '9515',
-    '9517',
-    '9517/1',
-    '9518',
-    '952&ndash;3',
-    '952,000',
     '952/1545',
-    '952/1545&ndash;6',
-    '95291',
-    '952f&ndash;h',
-    '953&ndash;65',
-    '95301',
-    '9531/1',
-    '9533/1',
-    '9539/1',
-    '953a',
-    '953b',
-    '953p',
-    '954&ndash;6',
-    '9540/1',
-    '95403',
-    '954b&ndash;c',
     '955&ndash;959',
-    '955,000',
-    '955/1548',
-    '9551',
-    '9551/1',
-    '9556',
-    '9556/1',
-    '95562',
-    '9558/1',
-    '955f&ndash;g',
-    '956&ndash;7',
-    '956,000',
-    '956,330',
-    '956.',
-    '956/1549',
-    '9560/1',
     '9562',
-    '9565',
-    '9566/1',
-    '9567/1',
-    '9568/1',
-    '956m',
-    '957&ndash;4829',
-    '9571/1',
-    '9575/1',
-    '9577',
-    '958&ndash;64/1551',
-    '958/1551',
-    '9582/1',
-    '9584',
-    '9586/1',
-    '9587/1',
     '959&ndash;63',
-    '959&ndash;960',
-    '959,450',
-    '959-1',
-    '959.8',
-    '959.9',
-    '9590',
-    '9595',
-    '9597/1',
-    '95980',
-    '95:1',
-    '95:1&ndash;8a',
-    '95:100',
-    '95:3',
-    '95a',
-    '95a=red',
     '95dba',
-    '95f',
-    '95fm',
-    '95ft',
-    '95kcals',
-    '95m',
-    '95ma',
-    '95s',
-    '96&deg;c',
-    '96&frac12;points',
-    '96&mdash;98%',
-    '96&mgr;m',
-    '96&ndash;00',
-    '96&ndash;105',
-    '96(11a)',
-    '96(3)',
     '96,231',
-    '96,575',
-    '96,610',
-    '96-5',
-    '96-71',
-    '96-97%',
-    '96-article',
-    '96-km',
-    '96-like',
-    '96-member',
-    '96-minute',
-    '96-run',
-    '96.',
-    '96.0fm',
-    '96.1',
-    '96.12',
     '96.22',
-    '96.25',
-    '96.3%',
-    '96.5&ndash;100',
-    '96.5&times;213.4',
-    '96.6',
-    '96.63',
-    '96.7%',
-    '96.79',
-    '96.8',
-    '96.8%',
-    '96.84',
-    '96.9%',
-    '96/120',
-    '96/97',
-    '960&dollar;c',
     '960&ndash;1',
-    '960&ndash;1126',
-    '960&ndash;1279ad',
-    '960-like',
-    '960/1127',
-    '9600/receive',
-    '96000',
-    '96002',
-    '9602/1',
-    '96022',
-    '96067',
-    '960781/2',
-    '960cf',
-    '960mb',
-    '960p',
-    '961.2%',
     '96140',
-    '9618/1',
-    '9623',
-    '9624/1',
-    '9626/1',
-    '96280',
-    '962e',
-    '962h',
-    '962nd',
-    '963/10',
-    '963/1556',
-    '9630',
-    '9631/1',
-    '9636/1',
-    '963a',
-    '963b&ndash;c',
     '963m',
-    '964/august',
-    '9642',
-    '9649/1',
-    '96490',
-    '965&ndash;6',
-    '965,400',
-    '965-1040',
-    '965/1557&ndash;8',
-    '9651/1',
-    '9652',
-    '9652/1',
-    '96588',
-    '965bx',
-    '965p',
-    '965th',
     '966&ndash;968',
-    '966/1558',
-    '966/1559',
-    '9662',
-    '9662/1',
-    '9663',
-    '9666',
-    '9666/1',
-    '9667/1',
-    '9668/1',
-    '9669/1',
-    '96690',
-    '966b',
-    '966kg',
-    '966km',
-    '967&mdash;70',
     '967/1560',
-    '9671/1',
-    '9672/1',
-    '968,000,000',
-    '968/1561',
-    '968/august-september',
-    '9681',
-    '9686',
-    '9688/1',
-    '969.4',
-    '9690/1',
-    '9692',
-    '9696',
-    '9697/1',
-    '969a&ndash;c',
-    '969p',
     '96_per',
-    '96b',
-    '96b/mw',
-    '96bhp',
-    '96g&ndash;h',
-    '96ins',
-    '96mb.',
-    '96pc',
-    '96th',
-    '97&ndash;100',
-    '97&ndash;101',
-    '97&ndash;104',
-    '97&ndash;105',
-    '97&ndash;110',
-    '97&ndash;116',
-    '97&ndash;142',
     '97&ndash;57',
-    '97&ndash;64',
-    '97&ndash;98',
-    '97&ndash;99',
-    '97(1)&mdash',
-    '97,000,000',
-    '97,307',
-    '97,486',
-    '97,715',
-    '97,754',
-    '97,900',
-    '97-91',
-    '97-93',
-    '97-day',
-    '97-mph',
-    '97-octane',
     '97-per-cent',
-    '97-run',
-    '97-yard',
-    '97.05',
-    '97.1',
-    '97.125',
-    '97.1p',
-    '97.2',
-    '97.22',
-    '97.25',
-    '97.540',
-    '97.6%',
-    '97.60mph',
-    '97.65',
-    '97.66',
-    '97.6p',
     '97.7%',
-    '97.9%',
-    '97.91',
-    '97.96',
-    '97/117',
-    '97/681&ndash;2',
-    '97/98',
-    '970&ndash;933',
-    '970&ndash;971',
-    '970,000',
-    '970.00',
-    '970/1563',
-    '9700',
-    '9700-rb',
-    '9701',
-    '9702/1',
     '9704',
-    '9704/1',
-    '9706/1',
-    '9709/1',
-    '971,627',
-    '971/2p',
-    '9711',
-    '9714,1986',
-    '97150',
-    '972&ndash;973',
-    '972-2-868165',
-    '972/1565',
-    '9720-t',
-    '9721-22',
-    '9723',
-    '97251',
     '973&ndash',
-    '973&ndash;1048',
-    '973&ndash;8799',
-    '973/8',
-    '973/march',
-    '97390',
-    '973f&ndash;h',
-    '973p',
-    '974&mdash;6',
-    '974,000',
-    '974-952',
-    '974-page',
-    '974/1566',
-    '974/5566',
-    '9742',
-    '9748',
     '974a&ndash;b',
-    '975&ndash;1011',
-    '975.73',
-    '975/1567',
-    '97532',
-    '97550',
-    '9758',
-    '9759',
-    '976&ndash;1014',
-    '976-loca',
-    '976-page',
-    '976/1569',
-    '976:283',
-    '976g',
-    '977&ndash;9',
-    '977.000',
     '9770',
-    '977b&ndash;d',
-    '977m',
-    '978,000',
-    '978,112',
-    '978/1570',
-    '978/1570&ndash;1',
-    '979/1571',
-    '979/1572',
-    '9794',
-    '9797',
-    '979c&ndash;f',
-    '97cm',
-    '97ft',
-    '97k',
-    '97km/60mls',
     '97mins',
-    '97mm',
-    '97mph',
-    '98&deg',
-    '98&deg;c',
-    '98&mdash;100',
-    '98&mdash;9',
-    '98&ndash;08',
-    '98&ndash;1108',
-    '98&ndash;121',
-    '98&ndash;16',
-    '98&ndash;8',
-    '98(1)',
-    '98,100',
-    '98,143',
-    '98,270',
     '98,280',
-    '98,620',
-    '98,694',
-    '98,874',
-    '98-bedroom',
-    '98-mile',
-    '98-run',
-    '98.106%',
-    '98.17',
-    '98.19',
-    '98.25',
-    '98.3%',
-    '98.36',
-    '98.4',
-    '98.4%',
-    '98.4%/1.6%',
     '98.6%',
-    '98.6k/h',
-    '98.6p',
-    '98.7%',
-    '98.8',
-    '98.8%',
-    '98.83',
-    '98.92',
-    '98.93',
-    '98.9p',
-    '98/1',
-    '98/386',
-    '98/437',
-    '98/689',
-    '980&ndash;3120',
-    '980,000',
     '980,700',
-    '980/1572',
-    '98000',
-    '9800s',
-    '9800xl',
-    '9802',
-    '980a',
-    '980bp',
-    '980e&ndash;g',
-    '980kg',
-    '980kg/m',
-    '980kms',
-    '981/1573',
-    '98118',
-    '9813b',
-    '9815',
     '981f&ndash;g',
-    '981t',
-    '982&ndash;07',
-    '982&ndash;1003/1574&ndash;95',
-    '9820',
-    '98225',
-    '982b',
-    '982m',
-    '983&ft',
-    '983,045',
-    '983/october',
-    '9830',
-    '983112',
-    '9836',
-    '9836569',
-    '9837',
     '98380',
-    '98382',
-    '983c&ndash;d',
-    '984/1577',
-    '9840',
-    '984000',
-    '98401',
-    '9842',
-    '98460',
-    '984a',
-    '984c&ndash;e',
-    '984pp',
-    '985,094',
-    '9855khz',
-    '9856',
-    '985a',
     '985b&ndash;c',
-    '986,000',
-    '986-foot',
-    '986/1578',
-    '986/1579',
-    '9860',
-    '9861',
-    '9866',
-    '986h',
-    '987&ndash;9400',
-    '987/april',
-    '9870',
-    '987665723',
-    '9879',
-    '987a',
-    '987m',
     '988,928',
-    '988/1580',
-    '98804',
-    '988c&ndash;e',
-    '988cc',
-    '989&ndash;96',
-    '989,000',
-    '989/march',
-    '989b&ndash;c',
-    '98a=white',
-    '98bhp',
-    '98d',
-    '98fm',
-    '98ins',
-    '98km',
-    '98m',
     '98mb',
-    '98mph',
-    '98pts',
-    '99&mdash;101',
-    '99&ndash;101',
-    '99&ndash;103',
-    '99&ndash;104',
-    '99&ndash;107',
-    '99&ndash;108/20&ndash;25',
-    '99&ndash;117',
-    '99&ndash;125',
-    '99&ndash;9',
-    '99(0.9)',
-    '99+4',
-    '99,300',
-    '99,479',
     '99,500-strong',
-    '99,592',
-    '99-/o',
-    '99-100',
-    '99-3',
-    '99-48',
-    '99-83',
-    '99-89',
-    '99-acre',
-    '99.',
-    '99.0%',
-    '99.04',
-    '99.08&plusmn;0.03%',
-    '99.09',
-    '99.1',
-    '99.17',
     '99.23&plusmn;0.02%',
-    '99.25',
-    '99.28%',
-    '99.3',
-    '99.4',
-    '99.7',
-    '99.73',
-    '99.765',
-    '99.85p',
-    '99.86',
-    '99.87',
-    '99.87%',
-    '99.96',
-    '99.975%',
-    '99.98%',
-    '99.99%',
     '99.999%',
-    '99.9995',
-    '99.99z',
-    '99/5',
-    '99/711',
-    '99/982',
-    '990&ndash;1',
-    '990&ndash;2',
-    '990,000',
-    '990,000,000',
-    '9909',
-    '990cc',
-    '991,601',
-    '99190',
-    '991b&ndash;c',
-    '991p',
     '992/100',
-    '992/1161',
-    '992/1584',
-    '992/400',
-    '9920',
-    '99210',
-    '9922',
-    '992f&ndash;h',
-    '992s',
-    '993&ndash;2',
-    '993,090',
-    '9930',
-    '99326025',
-    '9934',
-    '993b',
-    '993b&ndash;e',
     '993cc',
-    '994&mdash;5',
-    '994&ndash;2',
-    '994&ndash;2282',
-    '994/1585&ndash;6',
-    '9948',
-    '994g',
-    '994m',
-    '995/1587',
-    '995/6',
-    '9950',
-    '9958',
-    '995kb',
-    '996&mdash;1031',
-    '996&ndash;2',
-    '997&ndash;2',
     '997,500',
-    '9970',
-    '99720',
-    '9973',
-    '9977',
-    '998&ndash;5700/5090',
-    '998,256.10',
-    '9980',
-    '9985',
-    '9986/4175',
-    '999&ndash;1000',
-    '999,400',
-    '99900',
-    '9993',
-    '99:2',
-    '99a',
     '99ft',
-    '99kg',
-    '99km',
-    '99kw',
-    '99lb',
-    '99mmol/l',
-    '99mph',
-    '99p-&pound;4.25',
-    '99p-a-pint',
-    '99p/15g',
-    '9:00am',
-    '9:04.4',
-    '9:06',
-    '9:1&ndash;12',
-    '9:1&ndash;14',
-    '9:11ff',
     '9:13',
-    '9:13&ndash;35',
-    '9:14',
-    '9:15&ndash;23',
-    '9:17',
-    '9:18&ndash;29',
-    '9:2&ndash;8',
-    '9:20',
-    '9:21',
-    '9:22',
-    '9:23',
-    '9:24.6',
-    '9:28.7',
-    '9:28am',
-    '9:3,15,12:24',
-    '9:30&ndash;12:00',
     '9:30.9',
-    '9:30am',
-    '9:30am-4:00pm',
-    '9:34.42',
-    '9:35-',
-    '9:36.37',
-    '9:37&ndash;38',
-    '9:39.8',
-    '9:40',
-    '9:43&ndash;48',
-    '9:47.27',
-    '9:5',
-    '9:52',
-    '9:56.62',
-    '9:57',
-    '9:57:06',
     '9:57:30',
-    '9:59:51',
-    '9:6.8',
-    '9:62',
-    '9:6:1',
-    '9=3',
-    '9ab',
-    '9act',
-    '9ag',
-    '9al',
-    '9al.',
-    '9am&ndash;5',
-    '9am&ndash;7pm',
-    '9am&ndash;9pm',
-    '9am-11.30pm',
-    '9am-12noon',
     '9am-5.30pm',
-    '9am-6pm',
-    '9am-7.30pm',
-    '9am-7pm',
-    '9aq',
-    '9b-10',
-    '9bg',
-    '9bp',
-    '9bq',
-    '9bx',
-    '9by',
-    '9cadukm470257',
-    '9cadukm500107',
-    '9cm/3&frac12;in',
-    '9ct',
-    '9dl',
     '9dr',
-    '9ds',
-    '9du',
-    '9dw',
-    '9e',
-    '9eb',
-    '9ee',
-    '9enclose',
-    '9ep',
-    '9et',
-    '9ew',
-    '9fd',
-    '9fg',
-    '9ft-high',
-    '9ft.',
-    '9ft3in',
     '9g',
-    '9gb',
-    '9hb',
-    '9hh',
-    '9hh&ndash;10hh',
-    '9hl',
-    '9hn',
-    '9ht.',
-    '9hw.',
-    '9hx',
-    '9in.',
-    '9ins.',
-    '9ix',
-    '9j2',
-    '9kb',
-    '9kg',
     '9l6',
-    '9la',
-    '9lf',
-    '9lj.',
-    '9lr',
-    '9lt',
-    '9lx',
-    '9m-bytes',
-    '9mjy',
-    '9mm/&frac38;in',
-    '9modifying',
-    '9myr',
-    '9nf',
-    '9nm',
-    '9nn',
-    '9nu',
     '9nx',
-    '9ocms',
-    '9p-12p',
-    '9pd',
-    '9pj',
-    '9pn',
-    '9pz',
-    '9qa',
-    '9qg',
-    '9qu',
-    '9qw',
-    '9rj',
-    '9rl',
-    '9rt',
-    '9ru',
-    '9rz',
     '9s.2d.',
-    '9s.6d.',
-    '9sa',
-    '9secs',
-    '9sinclair-stevenson',
-    '9sr',
-    '9ta',
-    '9tb',
-    '9th&ndash;13th',
-    '9th&ndash;23rd',
-    '9th&ndash;sunday',
-    '9th-11th',
-    '9th-8th',
-    '9th/12th',
-    '9tj',
-    '9tl',
     '9tx',
-    '9uh',
-    '9un',
-    '9uq',
-    '9v-0v-9v',
-    '9wl',
-    '9x',
-    '9x10cm',
-    '9x11cm',
-    '9x12in',
-    '9x12inch',
-    '9xa',
-    '9xp',
-    '9xs',
-    ';1.1(39)',
-    '=&dollar;e1/2',
     '=+&bgr',
-    '=+=+=+=+=+=+',
-    '=-0.23',
-    '=-0.25',
-    '=-0.47',
-    '=-2',
-    '=-20mv',
-    '=-30.81',
-    '=-40',
-    '=-44&deg;14\'29.2',
-    '=-971',
-    '=.',
-    '=0&deg',
-    '=0.000',
-    '=0.004',
-    '=0.01110',
     '=0.05',
-    '=0.05cm',
-    '=0.08',
-    '=0.10',
-    '=0.16',
-    '=0.17',
-    '=0.18',
-    '=0.19',
-    '=0.22',
-    '=0.24',
-    '=0.28',
-    '=0.318',
-    '=0.37',
-    '=0.380',
-    '=0.4',
-    '=0.40',
     '=0.41',
-    '=0.43',
-    '=0.45',
-    '=0.475',
-    '=0.48',
-    '=0.5',
-    '=0.502',
-    '=0.51',
-    '=0.527',
-    '=0.54',
-    '=0.61',
-    '=0.615',
-    '=0.63',
-    '=0.7',
-    '=0.70',
-    '=0.71',
     '=0.716',
-    '=0.717',
-    '=0.72',
-    '=0.74',
-    '=0.79',
-    '=0.80',
-    '=0.80m',
-    '=0.82',
-    '=0.83',
-    '=0.84',
-    '=0.86',
-    '=0.88',
-    '=0.9412',
-    '=0mv',
-    '=1,322',
-    '=1.1',
     '=1.1bn',
-    '=1.22',
-    '=1.25',
-    '=1.29',
-    '=1.32',
-    '=1.33',
-    '=1.5x106',
-    '=1.67',
-    '=1.84',
-    '=1.9',
-    '=1.98',
-    '=10.5',
-    '=10.6',
-    '=10.7',
-    '=10.90',
-    '=103',
     '=103&ndash;1.23',
-    '=103.5&aring',
-    '=107',
-    '=10mm',
-    '=11.4',
-    '=110',
-    '=114',
-    '=119.5',
-    '=12.89',
-    '=12h16',
-    '=12v',
-    '=13.32',
-    '=130',
-    '=131.1',
-    '=133',
-    '=138',
     '=14.00',
-    '=14.6',
-    '=14.97',
-    '=15&deg',
-    '=15.2',
-    '=15.21',
-    '=15.38',
-    '=15.99',
-    '=150,000',
-    '=15p',
-    '=16',
-    '=16.5',
-    '=17.05',
-    '=17.14',
-    '=178,640,000',
-    '=18.6',
     '=18.82',
-    '=19.32',
-    '=19.4',
-    '=2%',
-    '=2&deg',
-    '=2.05',
-    '=2.084',
-    '=2.10',
-    '=2.15',
-    '=2.16',
-    '=2.42',
-    '=2.5',
-    '=2.52',
-    '=2.58',
-    '=2.6',
-    '=2.8',
     '=2.90',
-    '=2/p',
-    '=20',
-    '=20.2',
-    '=20.9',
-    '=200',
-    '=201',
-    '=203',
-    '=21',
-    '=21.7',
-    '=216',
-    '=22.5',
-    '=23',
-    '=23.58',
-    '=24',
-    '=243',
     '=247',
-    '=24mv',
-    '=25',
-    '=25,25',
-    '=25.7',
-    '=26',
-    '=26,984,176',
-    '=26.4',
-    '=26.6',
-    '=27.2',
-    '=27.72',
-    '=27.8',
-    '=275',
-    '=28.1',
-    '=28.8',
-    '=280.0a',
     '=288',
-    '=29',
-    '=29.16',
-    '=29.92',
-    '=2r-n',
-    '=3.11',
-    '=3.28',
-    '=3.35',
-    '=3.5',
-    '=3.55',
-    '=3.6',
-    '=3.673',
-    '=3.7',
-    '=3.8',
-    '=30,000',
-    '=30.5',
     '=31.9',
-    '=32.22.9g',
-    '=33.2',
-    '=33.4',
-    '=34.66',
-    '=35.7',
-    '=355',
-    '=36.0',
-    '=36.6',
-    '=37.47',
-    '=38.4',
-    '=38pc',
-    '=3u',
-    '=4,000',
-    '=4.00',
-    '=4.1',
     '=4.17',
-    '=4.2',
-    '=4.4',
-    '=4.54',
-    '=4.6',
-    '=4.7',
-    '=4.87',
-    '=41',
-    '=42.6',
-    '=44.3',
-    '=45%',
-    '=451',
-    '=47&deg;34',
-    '=479001',
-    '=48',
-    '=5.07',
     '=5.1',
-    '=5.5',
-    '=5.8',
-    '=50',
-    '=514',
-    '=519',
-    '=536',
-    '=56.6&aring',
-    '=6.0',
-    '=6.03',
-    '=6.3',
-    '=6.8',
-    '=6.9',
-    '=60',
-    '=60&deg',
-    '=60.52',
     '=602.7',
-    '=61.2',
-    '=62.7&aring',
-    '=63.8',
-    '=6561',
-    '=67.0',
-    '=67.57',
-    '=7.05',
-    '=7.306',
-    '=7.58',
-    '=70&mgr;v',
-    '=70.5',
-    '=711',
-    '=74',
-    '=74&deg',
-    '=78',
     '=78.79',
-    '=791',
-    '=8',
-    '=8.0',
-    '=8.02',
-    '=8.3',
-    '=8.39',
-    '=8.9',
-    '=8/3',
-    '=86.6',
-    '=8x7x6x5x4x3x2x1=40320',
-    '=9',
-    '=9,438',
-    '=9,928,740',
-    '=9.2',
-    '=9.3%',
     '=9.37',
-    '=9.4',
-    '=9.5',
-    '=91%',
-    '=910/500',
-    '=9495',
-    '=95.3&deg',
-    '=a',
-    '=az',
-    '=b',
-    '=b/rt',
-    '=banks',
-    '=body',
-    '=clock',
-    '=commodat',
-    '=d',
     '=diesel',
-    '=dm.2.86',
-    '=double-six',
-    '=eagle',
-    '=em',
-    '=fb',
-    '=field',
-    '=frog',
-    '=go',
-    '=i',
-    '=ieth',
-    '=if',
-    '=if(principal&gt;taxthresh',
-    '=ime',
-    '=in',
-    '=infinity',
     '=lay',
-    '=liarly',
-    '=log',
-    '=log2',
-    '=lys295',
-    '=m21',
-    '=manipulate',
-    '=maximum',
-    '=mem',
-    '=minister',
-    '=mitoxin',
-    '=mote',
-    '=n',
-    '=nd',
-    '=not',
-    '=nother',
     '=noun',
-    '=only',
-    '=p4',
-    '=pec',
-    '=plied',
-    '=pounds',
-    '=premier',
-    '=q',
-    '=r',
-    '=r/p',
-    '=right',
-    '=rl',
-    '=rrrr',
-    '=sand',
-    '=set',
-    '=sic',
     '=sitting',
-    '=standing',
-    '=stantly',
-    '=thing',
-    '=til',
-    '=tinue',
-    '=university',
-    '=ut',
-    '=verb',
-    '=vesting',
-    '=x',
-    '=z',
-    '=z3,166.05',
-    '^',
-    '`n',
-    'a%=&amp;7fffffff',
-    'a%=2147483647',
     'a&agr;a&bgr',
-    'a&amp;l',
-    'a&amp;r\'',
-    'a&amp;sup2',
-    'a&bsol',
-    'a&bsol;sac',
-    'a&bsol;tbc',
-    'a&dgr&egr',
-    'a&dollar;1,200',
-    'a&dollar;1,250,000',
-    'a&dollar;1,300',
-    'a&dollar;1,706,000',
-    'a&dollar;1,900',
-    'a&dollar;1.2',
-    'a&dollar;1.45',
-    'a&dollar;1.5',
     'a&dollar;1.5bn',
-    'a&dollar;1.65billion',
-    'a&dollar;1.78',
-    'a&dollar;1.87',
-    'a&dollar;10&ndash;20',
-    'a&dollar;10,000',
-    'a&dollar;10,000,000',
-    'a&dollar;10.20',
-    'a&dollar;1000,000',
-    'a&dollar;101,063',
-    'a&dollar;109,900',
-    'a&dollar;11',
-    'a&dollar;120',
-    'a&dollar;13,400',
-    'a&dollar;13,990',
-    'a&dollar;137,000',
     'a&dollar;14.95',
-    'a&dollar;144m',
-    'a&dollar;15,000,000',
-    'a&dollar;15.9',
-    'a&dollar;150million',
-    'a&dollar;156',
-    'a&dollar;16,000,000',
-    'a&dollar;160m',
-    'a&dollar;17,400',
-    'a&dollar;18,000',
-    'a&dollar;180,000',
-    'a&dollar;183',
-    'a&dollar;19,000',
-    'a&dollar;190m',
-    'a&dollar;191m',
-    'a&dollar;1bn',
     'a&dollar;1m',
-    'a&dollar;2,100',
-    'a&dollar;2,300',
-    'a&dollar;2,500',
-    'a&dollar;2,850,000',
-    'a&dollar;2.5',
-    'a&dollar;2.5bn',
-    'a&dollar;2.6m',
-    'a&dollar;20',
-    'a&dollar;20,000',
-    'a&dollar;20,000,000',
-    'a&dollar;20,700',
-    'a&dollar;200',
-    'a&dollar;200million',
-    'a&dollar;20m',
-    'a&dollar;21,000',
     'a&dollar;21,000,000',
-    'a&dollar;212,796',
-    'a&dollar;216.1m',
-    'a&dollar;226,000,000',
-    'a&dollar;235',
-    'a&dollar;24,000',
-    'a&dollar;25,000,000',
-    'a&dollar;250,000',
-    'a&dollar;27',
-    'a&dollar;28',
-    'a&dollar;2billion',
-    'a&dollar;3',
-    'a&dollar;3&ndash;4',
-    'a&dollar;3,000',
-    'a&dollar;3,400',
-    'a&dollar;3,500',
     'a&dollar;3.30',
-    'a&dollar;3.50',
-    'a&dollar;3.5million',
-    'a&dollar;300',
-    'a&dollar;300,000,000',
-    'a&dollar;32&frac12;m',
-    'a&dollar;323,000,000',
-    'a&dollar;325,000',
-    'a&dollar;34,400,000',
-    'a&dollar;343,420',
-    'a&dollar;357,540',
-    'a&dollar;35m',
-    'a&dollar;370m',
-    'a&dollar;375,000',
-    'a&dollar;3bn',
-    'a&dollar;4,500',
     'a&dollar;4.00',
-    'a&dollar;40',
-    'a&dollar;40&ndash&dollar;52k',
-    'a&dollar;400',
-    'a&dollar;400,000',
-    'a&dollar;400,000,000',
-    'a&dollar;445,000,000',
-    'a&dollar;45',
-    'a&dollar;464m',
-    'a&dollar;496m',
-    'a&dollar;4million',
-    'a&dollar;5',
-    'a&dollar;5,000',
-    'a&dollar;5,200',
-    'a&dollar;5,468',
-    'a&dollar;5,600,000',
     'a&dollar;50',
-    'a&dollar;50,000',
-    'a&dollar;500',
-    'a&dollar;506,000',
-    'a&dollar;508',
-    'a&dollar;508,650,000',
-    'a&dollar;53',
-    'a&dollar;580',
-    'a&dollar;59',
-    'a&dollar;6,200,000',
-    'a&dollar;6,500',
-    'a&dollar;6,600,000',
-    'a&dollar;6,800',
-    'a&dollar;60m',
-    'a&dollar;630,000',
-    'a&dollar;7',
     'a&dollar;7.26',
-    'a&dollar;7.95',
-    'a&dollar;700',
-    'a&dollar;700,000',
-    'a&dollar;703.317',
-    'a&dollar;71,200,000',
-    'a&dollar;72',
-    'a&dollar;780',
-    'a&dollar;8,000',
-    'a&dollar;8,107',
-    'a&dollar;80,000,000',
-    'a&dollar;814million',
-    'a&dollar;880',
-    'a&dollar;880million',
-    'a&dollar;8m',
-    'a&dollar;9,300',
     'a&dollar;900',
-    'a&dollar;92,956',
-    'a&dollar;96,500',
-    'a&dollar;97.3m',
-    'a&dollar;970',
-    'a&dollar;970,000,0000',
-    'a&dollar;979,000,000',
-    'a&eacute;rea',
-    'a&eacute;reas',
-    'a&eacute;rienne.',
-    'a&eacute;ro',
-    'a&gt;b',
-    'a&gt;g&gt',
-    'a&igrave;n&eacute',
-    'a&iuml',
-    'a&iuml;ah',
     'a&lcub;gs&rcub',
-    'a&lowbar',
-    'a&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar;occurrence',
-    'a&lowbar;term',
-    'a&lsqb;g&rsqb;nel',
-    'a&lsqb;n&rsqb',
-    'a&lsqb;rgyl&rsqb;e',
-    'a&lsqb;rse&rsqb',
-    'a&lsqb;s&rsqb;niel',
-    'a&lt&gt;2',
-    'a&lt;f(x)&lt;b',
-    'a&mdash;2',
-    'a&mdash;e',
-    'a&mdash;few',
-    'a&mdash;j',
-    'a&mdash;no.',
     'a&mdash;term',
-    'a&mdash;whole',
-    'a&ndash;10s',
-    'a&ndash;2',
-    'a&ndash;20g&ndash;45&ndash;do',
-    'a&ndash;20j&ndash;15&ndash;do',
-    'a&ndash;24a',
-    'a&ndash;26b',
-    'a&ndash;4',
-    'a&ndash;b',
-    'a&ndash;in',
-    'a&ndash;m',
-    'a&ndash;r',
-    'a&ndash;sledge-hammer',
-    'a&plus;e',
-    'a&pound;92million',
     'a&rarr;b',
-    'a&rgr',
-    'a&rgr;e',
-    'a&times;b&times;27',
-    'a&times;b&times;27&times;14',
-    'a\'-c\'',
-    'a\'-d\'',
-    'a\'-f\'',
-    'a\'-god',
-    'a\'-level',
-    'a\':b\'',
-    'a\'=415',
-    'a\'a\'',
-    'a\'begging',
-    'a\'bhaigh',
-    'a\'bhaird',
     'a\'changin\'',
-    'a\'changing',
-    'a\'chaorachain',
-    'a\'chaorachian',
-    'a\'chir',
-    'a\'feared',
-    'a\'gahil',
-    'a\'ghlas',
-    'a\'ghlinne',
-    'a\'gogo',
-    'a\'haha',
-    'a\'hunting',
-    'a\'in-i-akbari',
-    'a\'level',
-    'a\'levels',
-    'a\'ll\'av',
     'a\'logical',
-    'a\'mhachair',
-    'a\'mhain',
-    'a\'mhuiridh',
-    'a\'mouldering',
-    'a\'pence',
-    'a\'roving',
-    'a\'sleek',
-    'a\'spinning',
-    'a\'thing',
-    'a\'udhu',
-    'a\'workin\'',
-    'a(19)',
-    'a(4)',
-    'a(429)four',
-    'a(ax)',
     'a(bc)',
-    'a(k)',
-    'a(le2)l/2',
-    'a(lpha)',
-    'a(r)',
-    'a(t)r',
-    'a***',
-    'a+b',
-    'a+b+c-',
-    'a+b-',
-    'a+bx+cx',
-    'a+ib',
-    'a-1\'s',
-    'a-1-plus',
-    'a-12s',
-    'a-1450',
     'a-18',
-    'a-1p',
-    'a-2&mdash;3&mdash;4',
-    'a-2&mdash;4&mdash;5',
-    'a-20',
-    'a-21sj',
-    'a-24',
-    'a-3',
-    'a-30',
-    'a-32',
-    'a-321',
-    'a-4-2-8',
-    'a-41563',
-    'a-435',
-    'a-440hz',
-    'a-442',
     'a-5',
-    'a-587',
-    'a-6522',
-    'a-817',
-    'a-863',
-    'a-:b',
-    'a-ach',
-    'a-actually',
-    'a-agh',
-    'a-al-l-fred',
-    'a-allotrope',
-    'a-amanitin',
-    'a-and',
-    'a-ant',
-    'a-aozzz',
-    'a-apologise',
     'a-assad',
-    'a-associated',
-    'a-b+c-',
-    'a-b-',
-    'a-b-x-d-e',
-    'a-bc',
-    'a-beating',
-    'a-bed',
-    'a-bit',
-    'a-bloody-men',
-    'a-bloring',
-    'a-bombs',
-    'a-boogie',
-    'a-braggin\'',
-    'a-branched',
-    'a-brantingham',
     'a-bubble',
-    'a-bustle',
-    'a-c-d',
-    'a-centralized',
-    'a-changin',
-    'a-changin\'',
-    'a-chitin',
-    'a-clack',
-    'a-clinkin\'',
-    'a-clock',
-    'a-clutter',
-    'a-coordinate',
-    'a-corner',
-    'a-couple',
-    'a-coupled',
-    'a-cryin\'',
     'a-cup',
-    'a-dance',
-    'a-dandelion',
-    'a-deck',
-    'a-dependent',
-    'a-different',
-    'a-digging',
-    'a-disadvantage',
-    'a-disk',
-    'a-doin\'',
-    'a-dot-out',
-    'a-down',
-    'a-drainhole',
-    'a-drawin\'',
-    'a-drive',
-    'a-driving',
     'a-dryin\'',
-    'a-dying',
-    'a-e-a',
-    'a-e-f',
-    'a-f-bout',
-    'a-few',
-    'a-fiddling',
-    'a-fishing',
-    'a-flapping',
-    'a-flush',
-    'a-fluttering',
-    'a-form',
-    'a-format',
-    'a-forty-six',
-    'a-four-one-three-six',
-    'a-four-two-eight',
     'a-four-two-four',
-    'a-frames',
-    'a-front',
-    'a-fusions',
-    'a-gleam',
-    'a-gley',
-    'a-gnashing',
-    'a-gnawing',
-    'a-goin\'',
-    'a-grades',
-    'a-growing',
-    'a-haarr-h',
-    'a-half-hour',
-    'a-hallo',
-    'a-harrowing',
-    'a-head',
     'a-helical',
-    'a-hem',
-    'a-herborising',
-    'a-hibs',
-    'a-higher',
-    'a-historical',
-    'a-hoeing',
-    'a-hoggin\'',
-    'a-hold',
-    'a-howlin\'',
-    'a-huh',
-    'a-i',
-    'a-i-d-s',
-    'a-initio',
-    'a-jivin\'',
-    'a-jrud',
     'a-k',
-    'a-keto',
-    'a-knocking',
-    'a-korus',
-    'a-l-g-a-r',
-    'a-l/b',
-    'a-la-mode',
-    'a-la-porcupine',
-    'a-land-roving',
-    'a-laughing',
-    'a-leaping',
-    'a-levelled',
-    'a-like',
-    'a-line.',
-    'a-little',
-    'a-lm',
     'a-loft',
-    'a-lofty',
-    'a-long',
-    'a-looking',
-    'a-m',
-    'a-mami',
-    'a-measures',
-    'a-mile',
-    'a-moment',
-    'a-mouldering',
-    'a-munching',
-    'a-names',
-    'a-neissa',
-    'a-new',
-    'a-oct-11',
-    'a-oct-2',
     'a-particular',
-    'a-path-y',
-    'a-philosophising',
-    'a-pictures',
-    'a-pillars',
-    'a-planning',
-    'a-ploughin\'',
-    'a-ploughing',
-    'a-plus-rated',
-    'a-poem',
-    'a-port',
-    'a-pulling',
-    'a-purpose',
-    'a-quoted',
-    'a-r\'s',
-    'a-rab',
     'a-rabbiting',
-    'a-rattling',
-    'a-raving',
-    'a-ray',
-    'a-re',
-    'a-reg',
-    'a-registered',
-    'a-repairing',
-    'a-respectively',
-    'a-ringing',
-    'a-rip-off\'',
-    'a-rolling',
-    'a-rootin\'',
-    'a-roving',
-    'a-row',
-    'a-ruagh',
     'a-rumble',
-    'a-s',
-    'a-sa-sa-ra',
-    'a-screwing',
-    'a-scuttlin\'',
-    'a-second',
-    'a-seeded',
-    'a-seeing',
-    'a-sepharose',
-    'a-shape',
-    'a-shaped',
-    'a-shining',
-    'a-shock',
-    'a-singing',
-    'a-slither',
-    'a-small',
     'a-sodden',
-    'a-spinning',
-    'a-spoolin\'',
-    'a-straddle',
-    'a-stream',
-    'a-subunit',
-    'a-subunits',
-    'a-swaying',
-    'a-t-rich',
-    'a-tag',
-    'a-tapping',
-    'a-taunto',
-    'a-tech',
-    'a-tens',
-    'a-terrible',
-    'a-thinking',
     'a-thirst',
-    'a-throwing',
-    'a-tingle',
-    'a-tinkling',
-    'a-to',
-    'a-to-ds',
-    'a-took',
-    'a-top',
-    'a-tracing',
-    'a-tracts.the',
-    'a-train',
-    'a-trait',
-    'a-tremble',
-    'a-trembling',
-    'a-tryin\'',
-    'a-twenty-seven-year-old',
     'a-twirling',
-    'a-twitch',
-    'a-typical',
-    'a-unit',
-    'a-victims',
-    'a-vis',
-    'a-wailin\'',
-    'a-waiting',
-    'a-wandering',
-    'a-ward',
-    'a-way',
-    'a-weeping',
-    'a-weighted',
-    'a-whoring',
-    'a-wop-bop-a-sidgwick-a-lop-bam-pan',
-    'a-word',
     'a-year',
-    'a-z-u-l',
-    'a-zed-bee',
-    'a.-a.',
-    'a.1.',
-    'a.1.1',
-    'a.1.2',
-    'a.13',
-    'a.22',
-    'a.3.3',
-    'a.32',
-    'a.4.',
-    'a.444',
-    'a.447',
-    'a.52',
-    'a.836',
     'a.83s',
-    'a.881',
-    'a.884',
-    'a.887',
-    'a.9',
-    'a.a.milne',
-    'a.a.u.',
-    'a.acad&eacute;mie',
-    'a.b.c.',
-    'a.b.f.i.',
-    'a.b.n',
-    'a.bairoch',
-    'a.berk',
-    'a.berlin',
-    'a.bitaeniata',
-    'a.borellii',
     'a.bullock',
-    'a.c.417',
-    'a.c.c.',
-    'a.c.d.',
-    'a.c.e.',
-    'a.c.s.',
-    'a.d.47',
-    'a.d.800',
-    'a.d.j.',
-    'a.e',
-    'a.e.a.',
-    'a.e.b.',
-    'a.e.i.o.u.',
-    'a.e.r.e.',
-    'a.e.w.',
-    'a.e.warner',
     'a.elizabethae',
-    'a.f.budge',
-    'a.f.walls',
-    'a.fp',
-    'a.g.l.',
-    'a.g.spalding',
-    'a.general',
-    'a.gephyra',
-    'a.h.m.',
-    'a.h.mckeag',
-    'a.h.t.',
-    'a.hird',
-    'a.i.a.',
-    'a.i.c.',
-    'a.i.m.',
-    'a.i.s',
     'a.i.t.',
-    'a.isa',
-    'a.isa.',
-    'a.j.b.',
-    'a.j.h.',
-    'a.j.s.',
-    'a.j.wilson',
-    'a.k.c.',
-    'a.k.p.',
-    'a.keyell',
-    'a.khaliq',
-    'a.kjellberg',
-    'a.l.',
-    'a.l.f.',
-    'a.l.j.',
-    'a.large',
     'a.limassol',
-    'a.long',
-    'a.m.a.',
-    'a.m.buchberg',
-    'a.m.m.',
+)
+
+blocks_90 = (
+    '$#95%$%owned",&deg;-85&deg\'!s\'!w#(mdash;84*!8$)gr;molmol$$icro(";g#7ndash;125ml/4&ndash;5fl*"38*#480*"50*"75',
+    ')#201*!5+!4)!5)!7*!8+!0*\'9&deg;f)(80&deg;f*!1*!2*!5*!8)"91#&percnt',
+    '"#(1)%&&mdash"#,00%4,000&ndash;85,00,000%&0-acre\'&strong&!.&!t$"31##210$"23##300##540##700$!6',
+    '##154#"25#(71-67-63$!6#(80-71-69$!5#$acre#$ball$"ed$$reak#&degree#$foot#$lane#*millimetre##odd',
+    '$\'er-cent&#son$$ound#$seat\'"er##ton"#.00#"1%$!6#!2$!%$!5#"3%#"5%#"6%',
+    '%"cm%!m%$pccm#!7$!1#"8%"!/##117##271##390#"55#"76""0%#0&mgr;mx525&mgr;m$*ndash;1548',
+    '*%850kg+#750*#950#&,000th#!-$\'hectare$&strong##000$"50$!9$"bp$"gn$#rpm#"10$!3',
+    '#"27#!6##750#"ad#!b$"/w$!p#"cs#"ft#)g&ndash;h$,/1&frac14;lb$"al#"ha##kph#"lb',
+    '$;l/1&frac12;pt/3&frac34;cups$!w#"n.$!m##rpm#"th")1&ndash;2*3834/1350&ndash;1431#*/april-may#!0#!1$!6##235##393#!5',
+    '#"70##844"%2,422$#823#\'-member$$page#".5##000$"45#!1#"22$$7574#"30$"71##501',
+    '$!7##662#!9#!h")3,000,000#!0$"45#!1#!3#"bc")4&ndash;5*"75#"/5#!1#!4',
+    '$"97#!5$"00"$5000$"49#!1##352$"99##441#!5$"th#!7#!b"+6&ndash;788##385',
+    '#)7-82209-2$!4##813#!9#"gb##khz"+7&ndash;758#$0/91#!2#$3/91#"80#)e&ndash;g#!v")8&ndash;9#!3',
+    '#!c#"mw".9&ndash;302595#$,460#%/1358#"59##606#!p"$:100&#000$\'5:10:10"$cals#"ms".g/3oz/1&frac12$"oz',
+    '""km#"ph""mg##ins#-m&ndash;300mm#!w""no"+p&ndash;80p#!.""sq"!w"%x25mm#"xx!)6&mdash;7#\'ndash;3',
+    ')"67)"77*\'8&deg;f*!9)!8*!4*!6"#(4)"$,267$"93##331$"50$&60,000#\'600,000$"80',
+    '##800$"35"$-100$"46#!3#+68-67-63-69#"77#"82#$fold#!m$%ember#$page##run#$seat#%tooth',
+    '#"19#,2&times;55.8+$76.2#!3#!5$!%#"66#"71#"8m#"9%"$/140$!7#$207/&"is#\'308/eec',
+    '##654",0&ndash;0660*!1#!.#"01$!3$$7/26#$1005$$2/13$$6/10#%25/16$$7/26$$8/29$!9#"31',
+    '$!3$!5#!5$\'4/37/07#!6#"hz#!m$!m#!p")1&ndash;2#".8##186#"30#!5$!0',
+    '"%2,000#!.#!0#"13##222#!c")3&ndash;4#$,000#%/1361##171#!4##936#!d#)f&ndash;h"+4&ndash;793',
+    '$#900#,1&ndash;7675#!2#!4##519$"21$"91#"60##758"+5&ndash;785*"85#$,000$#951#!1#!5',
+    '#!g"%6,000##.49#!0#!1#!2##333#!6$"60%!6##774$!9#"97#&:659.3#!a',
+    '"%7,610#$-300#%/1326#!0$"53##140#!2##541##602#!8#!c#!x"+8&mdash;814$*ndash;2460*$6460',
+    '#&-pixel#-/1366&ndash;7#!5#!6#)f&ndash;g#!k#"mb"#920##505##922#)g&ndash;h""hz"#ins""m/""pp',
+    '")th-minute$!."(year-old!\'7&deg;c\'!s#"ft##ins#\'mdash;8*!4*!9#)ndash;119)"49)!5)"78+&&deg;f',
+    '+&&deg;f0!s*!4*!7)"90#&percnt$&lus;38"#(4)"),000-acre##190##297##300##500&$,000##906',
+    '"#-54#!8#"90#$ball$!p#%count#&footer##lap#&member$%inute#$page#&volume"".0#"1%#!2',
+    '$!8#"4%$!m#"57$"kg#"7%$!3$!6#!8$!m##90p"$/108$#438$&87/eec##388',
+    '#"62#"78#"91")0&ndash;1#$/may#"00%$0t/y$"88#!4##531#!7$"71#!8$"92#)b&ndash;d',
+    '#"kg$"m_#!m#!p"+1&ndash;814#$,162#!0$!2#!1##203##300$"33%!6##444##5lb',
+    '#%/1370#"04$!7##134#!2$"33$"51#"30##728#!9#)a&ndash;c#!p"%3,084#%/1371##075',
+    '$"31#!3##603""40$#101#!1$"77#!4$!5#!6$%,1979#)c&ndash;d#!p",5&ndash;4018*%900kg',
+    '$!0#!4$"54$!b#&545421##602#!9##g/1#!h#"kg"%6,000#$4048$"64$"84#"60',
+    '#!7#!9$"29#!a",7&ndash;4150#!.##252#!3$"00$"26$"49#!4#!6#"77##888',
+    '#!s".8/1376&ndash;7#"22$"71##313#!6#!8#!p".9/1377&ndash;8##321#!4##911#!a""bp""f.',
+    '""lb$!s"!m#"in"!s!%8&deg#&frac34#0ins&times;94&ins#\'mdash;9#\'ndash;3)"66)"79)(80&deg;s*\'2&deg;f*!3',
+    '*!5)"92)!i"!+"(,000,000&"ff$"14%!7##200##300##400##699##726##835"!-',
+    '##153#"37#"73#"84#$page#&r.p.m.$"pm$"un"!.#"05#!1#"2%$!6#(4&percnt$#ins',
+    '#!7"$/594#\'660/eec#"77#"91"*0&dollar;c$)ndash;790##.00#+0&ndash;200+#350#"1p##499#"60#)b&ndash;e"%1,478',
+    '#)b&ndash;e"$2.78#*215/782887#!4$"55##501$#535#!a#!p"+3&ndash;785#$,883#-/1381&ndash;2$!4##131##221',
+    '#"50$!6#!7$!0"%4,000#&-ounce#"/5#!0$%/7842#"30##567#!6#!p")5&ndash;9#"11',
+    '#"28#!4#!a#!p"%6,992#%-page#-/1384&ndash;5#!2#*567/780897#!6##868#)g&ndash;h",7&ndash;2928*$6858*!8',
+    '#".5#!0$!0%#199#"10$"74#"20#"59"+8&ndash;807#".0##343##858"*9&ndash;90#%-4372#%/1387',
+    '#!2##321$!9##413##721""bp"!f#!f""gb"%ills."!m""pp"$x127"(year-old!&9%-95%',
+    '*!2#+ndash;10781)!4)"85*!6*!7)"95"#(1)#"2)#"3)"$,065##100$\'12,831*##200$"97',
+    '##557##900"#-10$"48$"54#"78#"83#$seat#$year"!.#"04$\'6.11.80#!1$!%#"2%',
+    '$!n$!p#!3$!3$!6$!7#!4$!%$!6#!5$!%$"kw$!p#"6%$!6',
+    '$!%#!9"(/279/eec##473#"80$!3$!8"%0,000$#754##303$#282#!5##969#!p"&1/1389',
+    '##791#!9"/2/1389&ndash;90#!0$,&ndash;9900m##106##226##838##991#!p")3&ndash;6#$,000#%/1391#"30##770',
+    '"%4,637#!4#!5"&5-page#!0#"30#)b&ndash;f#!p"+6&ndash;821+"40#$,000$#802$#970##039#!3',
+    '#)f&ndash;h#!p")7&ndash;8+"02#$,195##000#!6#!8$!0#!9#)b&ndash;f"$80-3#!1##895#)a&ndash;b',
+    '"#9.7##021##2ft##391#!4#"70#!9$!8$!9#!a#)b&ndash;g#!g#!p"!a""cm',
+    '""ff$!.#!t""in""mm""pm#"p."!s!#:00"$10pm#*1&ndash;36$#ff.#!2##3ff#*4&ndash;16',
+    '##5pm#$7:00#*8&ndash;19#!9$#ff.""21$(&ndash;2,!3,!4#*2&ndash;23$"ff#$3:58#!4$(&mdash;5#,5&ndash;8:15',
+    '#!7#!8"!3#(&ndash;5##0pm#!1#!3#!5#!8#!9"!4##0am#!2#*4&ndash;45#!8',
+    '#$4.41#!5#!9"*6&ndash;11+!3*!8")7&ndash;8"$84\'s#!f""jg!"=0"#all"$very!$a(1)#"2)',
+    '"!."!a"!b"!c"!d"!j"+m&ndash;8pm#%-10pm#$10pm""nd"!p"!q"!s"!t""w.',
+    '"!."!1"!5"!a"!b"!n"!q"!s!"c%!"da"!e#)velopment"!h"!j""s.',
+    '"!x!&e-1072"!a"!d"!j"!r"!u!$floz""t.!"gb"!e""hz""v.!!h"!5',
+    '"!f"!j"!p"!u"!x"!y"!z!$ins.!"ja"!b"!j#!."!n"!r"!s',
+    '!!k""yr!#l/n""b.#$/3kg"!e"!n"!s"!v!(m-barrel#&strong"!."*anufacture""in$#us4',
+    '*$3;in"!n""yr!!n"!a"!e"!f"!g"!j"!n"!p""ts"!w"!x!#ooo',
+    '#%/200g#!s!"p.#!m$!."!a"&ension"!f"!h",m&ndash;10pm#%-10pm$&8.30pm"!n"!w!!q',
+    '"!r"!w!!r"!d"!e"!h"!l"!u"!y!%s.6d."!e"\'hilling"!l#$-rna"!r',
+    '"!y!$t/ha"!d""el#!m",h&ndash;13th+#5th#(-century#!/$#8th#!e"!j"!p"!r"!w',
+    '"!z!!u"!a"!d"!h"!u!!w!$x1mm"$2.5m"#3ft"!f"!p!"ya"!r )8&amp;1/2',
+    '"$cent"\'deg;dgh\'!h")frac12;d.)$ins.)#lbs\'!4(3&times;9&frac34&ins&&34&ins(#;in#\'t;6&ins"&lt;1/2"%mdash\'#;12)!3',
+    '#&icro;m$&ddot;0)!2",ndash&verbar\'3;0&ndash;27&ndash;0)+-20&ndash;0)!0)!3)!4)!8)!9(#1/2+"ft*#4in)(0&deg;dh',
+    '*!.+$45pm*$/931*"00*!4*!m+!m*"th))1&ndash;0*"th))2&ndash;0**-year-olds*(cycledeg*"oz))3&ndash;0',
+    '))5&ndash;0)!7)!9)!a)!b)!c()2&ndash;00*22&ndash;0)"0%)!1)"56("30)!2*!%*!\'',
+    ')"76("40*(&ndash;0)!1)!5()5&ndash;8)!\')!4)!6)!8("61()7&ndash;0()8&ndash;8)%.30am*!4',
+    ')!1("9%)!a*!m)!c*!m)"ft)"mm)"th("to"#ohm"&plus;2\'!3&"mn#-rime;10&prime',
+    ')\'1&prime"*shilling;.+"6d+"to#%ol;74&"83"3times;10&frac34&ins)!2(+2&times;1in)"0b(#6in()8&times;5!)(2)&mdash""4)""5)',
+    '""7=!1,000&ndash;10,000,%9,000%/,000-10,000,000%\'-10,000&&dollar&(employee\'!r&)foot-plus&$hour&#ton%#gns$"pm#"13$!8',
+    '#"61$!4#"70#"81$!8"%10,17$10&ndash;8,000yrbp#"11$!4$!5$!9#!3#"45$!6#"50',
+    '$!9#"65#"72#"82$!6$!8$!9#"95$"91%!2"$2.43#%00&ft%&-8,300$!6#&12,000',
+    '#&30,000$!1#"45#&55,056#"61#&80,000#"93"\'300,000%!0$$9pts#"15#"34$!7#$48th#"50',
+    '$#6.8#"71$!4#&80,000$!3$!4$%9,512#"90%$,000"&400lbs#%12pts#"20$!6#"41$!2',
+    '#"70$!2#"88"*500-member%"ft%#gns#&12,000#"36#&46,000#"65#"71$!6#"85$!7#)92-strong',
+    '"#610$$1pts$!7$!9#&34,000#"41$!8#&56,473#"75"\'700,000$!9#&16,000#"20#"30#&40,000',
+    '#&65,432#"74$%6,000#"81$!2#&90,000"3800&ndash;8,500yrbp$!1#"19#&29,606#"33$%8,000#"42#"55#$75ft',
+    '"\'933,000#"46#"58#"70#&89,000#"93!(-&frac12"&0-58-2"#10%$$,000#!6#!7""26"$3-93"!5',
+    '#"pm"&a-side##cre#"nd#5zaquinolonecarboxylic"#bar%!s$\'se-pair#"ed##its##yte""cd#)ell/early&!s#%olumn',
+    '$)mensional""er"$goal#"un"(handicap#$orse#<ydroxyquinoline-5-sulphonate"$i2oz#!n$"-a#$rons#!s#"ve"#jan""l9',
+    '#$evel#$itre"#man#\'egawatt$,tre-diameter##ile##ono%"th\'$-old"#new"!o#$unce#8xop7-hydrodeoxyguanosine"&screen#%econd',
+    '#(tringers"\'teacher#(ill-late#"on#$read"%under"%wheel\'"ed!-.0&ndash;40.3*#9.0#"0%$,&ndash;11.00$\'-9.00pm$)am-9.00pm$#p.m',
+    '$"8p#!2$"pm##583$"am#!8#!9$!%#"bn#&d.p.c.#$secs#!x"*1&ndash;29*&58.5mm##(3)',
+    '$"e)##.1.$"2.$!5$"89#,0&mdash;8.13$#(c)$".1%!2%!3%!4%!5%!6&!2%"90',
+    '$,6.51&mdash;2&*75&mdash;6$"pm#$1(c)#$2(a)$!0%+.31&mdash;2##3.1%!2##4.0%!6#"5%$".1%!2%!3',
+    '%!5%!6%!7%!9##6.1%!2%!3%!4%!5%!6$"am##7.2%!6#"8%$!b',
+    '$!d$!e#"9a$!b#!c#!k#!m$!m#$secs#!v"$2(2)$"b)$"c)$"d)$"e)',
+    '#%-acre#$.2.1&!2$!6##0.9$"pm#*2&ndash;24#"3m#"4b##5cm$!p#!6##829$#3a.$!p',
+    '#!a#!b$!n#"ft#!k#$secs"+3&ndash;100#&-litre#!.$"1.$"2.$"3.&!1&!2$!6',
+    '-#.40,$2.30$"62$$a.m.%.m&ndash;5.30pm$+pm-midnight&!.#"3p#"4m#"58$!a$!c$"pm#"6%$".9',
+    '##9am#"bn##dbm#"pc#%x4.5m")4&ndash;5#\'-1-45-0#$.4.1&!2&!3&!4&!5$#5.1\'!0\'!1',
+    '\'!3\'!4&!2&!3&!4&!5&!6&!7&!8&!9$!6$"92#*0&ndash;56+$9.00$"am',
+    '%!m#"12#"5.#!9$!%$"pm#"cm#"kb$!m#"pc#$secs#!v"-5&amp;percent$*ndash;10.5*$68.8',
+    '$!3#!3#"4p%!m#"5%$"pm#":1#"cc$-m/3&frac14;in#"hz#"in#!k$!m#"mm#*x8.5x4.3mm',
+    '&!3$!3%".1#!2$"5%#!3#"4m#"5%$!3#!7$!m#!9#!b#!c#!k',
+    '#!p$!c""7\'#".5$!8$"91#!1#"3%#"5m#!6#!7#!8$"pc##mph"\'8&deg;c',
+    '$$fold#".1$!2$!3$!4$!5#%/1000#!0#!1#%5&ins$!8$#lbs##75%$!8$!m',
+    '#!a#!b#!c#"fl",9&times;20.3##(b)#".0$!1#!4#!5$!%$&&mgr;m#!6#!7#!8',
+    '#$secs!!/"!0"#100$!3#!1$!6#"41#"86"#200$!4#!3$10&deg;c/450&deg;f#250&deg;c/450&deg;f""30',
+    '#!3#!8"#480"$5/41#786,26/604,53/631,91/669""67"!7##/87#!4"&8/1941$"92#!3#!6#!9""90',
+    '"$acre"$face#\'inished""kg$"21""sc#\'tandard"!x!-0%&ndash;100%*#90%#$-20%$&mainly#$/20%"%&amp%#%deg:f',
+    '$,ollar;degree*!f#%ins;1#.mdash;85&deg;s$&gr;gal\'!l\'!s#*ndash;100%,&&deg;k,$,000,$/min,#mph*"10*!2+!0',
+    '*"30*%80myr)#200,"hp*&50,000)"41*!6+!0)#500)"63)(82&deg;s*!3*$5mph*!9)#90k',
+    '+"pc*!1*!2*!4*)5-myr-old+#myr*"7%#&plus;2#%times"#(1)",,000-100,000\'$acre\'#odd\'&seater(*quare-foot',
+    '\'$word&"ft##135#%288.5##404##600"!-#!1$"40#"53#"75#"81#%90mph#$acre$\'nd-over',
+    '##day$%egree$%ollar##gun#$inch#)kilometre#$line#$mile##peg%&r-cent$$oint#%sheet#"to%!n#%year-',
+    '"#.0%$"00$!8#$1453$"6%#!2$!%$!2$!p#!3#\'4/229.8#!5$!%$!3$!6',
+    '#"76#"8%#"9%$"5%"*/-strength#110&mdash;1&frac14%!0%!2#!3#"48##503%%9:544$"12%%5:550#"70',
+    '#%81/82#"90")0&micro;l$\'ndash;1+$,000/#myr,%200kg,$400m+#000.#myr*#200*#899*%900kg$-rehy;capacity#/,000-transistor',
+    '$#900$"bp$&fathom$(its-unix$"lb$&member%#ile$#odd$$seat&$ries%!q$$year#).4million#!/$$700s',
+    '%%times$%-foot%$year$!0%!0&(00000000%"km$"gn$"hz##424$"84#!5##688##777#!8',
+    '#!b$!n#!c#\'ft/244m#-g/1&frac34;lb#"ha$"pa#)km/500mls%!s$"wh#"mb%$ytes$"hz$!l#!p',
+    '#"se#!w##yds"+1&ndash;668#!0#!1#!2#"36#!5#$6000&!1#!7$#0nx#!m"*2&ndash;39',
+    '##.1f$"3k#%/1400$"68#!0#\'1004458#!5#"68#(86-based#!9#!s"%3,540##/68#!0$!0',
+    '##680#)74/n7629c$!6#.86&ndash;80486%!-&%80486%"dx%!s&\'x-25mhz(%based\'#/33%!x#!9$\'-8618-1#)c&ndash;d',
+    '#$/126%"83$!5$$july$%march#"00#"20#!5#"72#%86/33&$unix%$dx/2\'*2&ndash;50(#-50)%based',
+    '$#7sx#!b#"ft")5&ndash;6#\'/summer#.13&ndash;80523#!8#!b")6&ndash;8#$,900##.30#!0#&486/33#!5#!7',
+    '#.03&ndash;80763##807"+8&mdash;883$(ndash;10#$,000#)/december#!1#!3##486#,6-compatible$2/80286/80386/80486\'"88$"0-%"xr#!7',
+    '$%/8086&!6\'$/286#"90#!p"%9,800#"-2#.03&ndash;80953#%386sl#(60-based%"ca$!9"!c##286#$51zx',
+    '#"ms"!e""ha#!z"&inches"(kg/200lb#\'m/50mls#!v"#l/h#\'b(36kg)$!s""ma#0bytes-per-second#"g/#"in',
+    '"#pcr#"er#!p"%s/90s"+th-birthday$!s"!w"#x70#"86"#yds!%1&deg#\'mdash;2#)ndash;1/2*"17*"20',
+    ')#741)"83*!9)"90*!1*!2*!3*!4*!6)#iii)(year-old"#(2)"(,000,000##333##400',
+    '$"24$&57,000#7624,324,048,566,472,808#\'840,000##900&".1$"56$"80"%-foot#$inch##lap#$mile#&second"".1$\'&percnt',
+    '#"34#!4$!%#"55$!9#,73&ndash;100$!5#!9"$/2in##308#+i&ndash;xxx"%0,000#"00#!1$&/8101m',
+    '#"20$"24#"40$"46#"52#"63$"54##771#"95#!e#!g$"ns#"kg#!m".1&mdash;clause',
+    '#!0##107$"53##247#!9#)e&ndash;f"+2&ndash;876#"00%,&ndash;81202$"18$"21$-3&ndash;81205/"43$-6&ndash;81208$-9&ndash;81211',
+    '%,&ndash;81214$"34$-5&ndash;81217$!8%,&ndash;81219#$2/91$-2&ndash;81223$-4&ndash;81225$-6&ndash;81227$"71$-8&ndash;81229#$5237$"40#!6#"70',
+    '#!p"*3&ndash;33##164##456#!p"+4&ndash;815#"01#!1#!3$"17$#656#$4764##555#"60##866',
+    '"85&ndash;24/1412&ndash;21#$,000##.13#!0#!1#!8$"81#!d##kyr"86&ndash;24/1413&ndash;21#$,302#./1413&ndash;14##065##344#!5',
+    '"*7&mdash;18#$,053$#633#\'-member#%/1414#!0##200#!3##771"%8,364#%/1415()&ndash;16$#may#!0#!1',
+    '##564#!8#"90#!p"+9&ndash;822#!0"":4")a&ndash;e#$-81e")c&ndash;f#!m"/esc&lsqb;11hesc"!f#!t""gb',
+    '"#min""pc")st-minute!(2&frac12#\'mdash;6#)ndash;086)!1*"27*#34%)!2)!5)(84&deg;s""\'s"#(5)"(,000,000',
+    '##329$&47,875##910"+-and-a-half#$foot#$test"#.0%#"1%#"3m#"4%#\'5&deg;n$$4mph$!p#!6$!%',
+    '#\'71.0myr#"8%$!6$!8#"9%"&/03520$$4169&"74##524#"83#"90"%0,500$#760##162##250',
+    '#!4#$6.14$"23#!p#"si")1&mdash;2$\'ndash;3#$,419#*/89,914/89$%early$$late#"00$!4#&1/8234##212',
+    '$"56#!4##588#!s")2&mdash;3$*ndash;1229+#700*"42#%/1459#!0$"05$!3##218$"41%!4',
+    '$"77##812$"40%!5$"57##903$"37#)b&ndash;c"+3&mdash;877$*ndash;4004+!w*#840#%/1420%!9$(may-june',
+    '##171##202$"62##322#!5$"79##915#!b#)c&ndash;e#)g&ndash;h#(m/900yds#!p",4&ndash;1906#$,269%"92',
+    '#"14##207$"15#!3#"40##608$"46$"83##927#)b&ndash;d#)d&ndash;f#!f"$5(4)#$,000\'$,000',
+    '#%/1422$$late#!0$".4#"30$"36#"5.##604##711#)c&ndash;d#"kg#!n"%6,959#$-a\'s#!4',
+    '")7&mdash;8##/15#!6##733#"89#!s"*8&ndash;29#$,311#)/may-june%+id-february()september#!0$!2#!1$#651',
+    '#!8#!9"*9&mdash;30#-/1425&ndash;6#!0##121#)4&ndash;7#!9$"34"":9#&artist")a&ndash;i"!b#*&ndash;82i"!c',
+    '##805##928#!m"!d"!e""ff#!t"!g"!i"!j"!m##ins"!n#!o"/x40x1&frac38;in',
+    '#\'mdash;4#\'ndash;1*"02,!%+!3+!5+!6*"19)"86)!9#&plus;5"$(22)#"5)#"c)"$,215',
+    '$"17##858##981""-0#$10-9#"34#"84#$mile#%point"#.1%$!3$!p#!2$!%#,4&plusmn;2.6',
+    '#!8$)&times;66$!1$!7#"9%$!6"$/112#\'349/eec#"4p##517#!l#!w")0&mdash;1$(ndash;41#"10',
+    '##404##868$"88#!e#)f&ndash;g#!m$!m".1/1427&ndash;8$&august#!3#!5##890##914#!b".2/1428&ndash;9',
+    '$&august#!0$$55/6##223#!4$"25#$5917##600$"66##766$"87"%3,000$\'421,982#".5#1/august-september',
+    '#!0##223#!3##5/6"*4&mdash;40*!5$)ndash;839##(1)#%/1431#!0#"38##466#!5##641##713',
+    '#!9#!p""50$!8#$6/90#!9#!c")6&mdash;7#%/1433#!0$"90#"57#!8#"90#!f',
+    '##(3)#(,000,000$#905#%/june#!0##501##742#!8#)b&ndash;d"*8&mdash;40#!/$$1434$"24$,mid-november##080',
+    '$"91##329$"62#!8$!2#!e"*9&ndash;10#!0#\'3/12975#"66#"85"$_per"!e""ff""hp',
+    '""km"!m#"in""nm""pp")rd-ranked!\'4&deg;c##ins#+ndash;100cm)#204)!6)(86&deg;f*!9+!%)"95',
+    '"(,080,000##100$"78##382#&453,60##500##800$!5"#-86$!7#$ball#%pages$$iece%!n#$seat',
+    '#$yard"!.#"1%#!3#"4%$!3#"8%$!3#"9%$!1"!/#\'169/eec##662#"85")0&mdash;1',
+    '*"77$*ndash;4065*#843#$,750#%/july#"0s##151#!2#!5$"55#$710.#!8#)b&ndash;d#!m#\'s-wrote',
+    '$)ndash;870#$,507#%/1438$!4#!0##580##myr")2&ndash;3*"50#-/1438&ndash;9#!0$#/21##219#"60#"72',
+    '#!h#!p")3&ndash;4#(,930,861#$-mhz#!0$%-9345#"30#"93#!b#!m#!p"%4,000#%/1441$$july',
+    '#"24##335#!m"+5&ndash;846#".4#-/1441&ndash;2##000#$5ff.#"80#!p"%6,000#)/may-july#!0$"00#"49',
+    '#!7##874#)a&ndash;e#!b#)d&ndash;f#!p"%7,000#!0#"10#!2#"37"78&ndash;50/1444&ndash;6#$,000#"00#"89',
+    '"+9&ndash;901##000##737"#:11"!b""in"!m#"ph""pc#"ts")th-minute"!w"%x60cm"(year-old!&5%-95%',
+    '\'!s#)ndash;100+!3+%5,000*"35)"22)!7*!9)!8)!9*!0+!f*!2*!3*!5',
+    '#&percnt#.sol;566/e.e.c."#(2)"),000-seat##200$"50##513##686##750##942"#-.6#"79#"91#(and-over#"cm',
+    '#$knot##man$%ember$#ile##ox6#&strong#$year"!.#!0$!%$!7$"8%#+19&mdash;21#"25#"3%',
+    '$!7#$5bhp#!6#"8%#"9%"$/\'86#"20$!5#!3$&75/eec##577&$/eec##837$!9""0%',
+    '$\'mdash;a$*ndash;1494*\'350yrbp#"\'s#(,000,000#$-bed$#odd$$page%$iece$&strong##.5p#"00%"00#"13#!3',
+    '#"49#"57#!6$"28$!7##789##977##csi#!p#!s#"va#!w"&1/1447##005$!t',
+    '#"20#"4a#!7$#-18##803$!6$"96#"98#!a#\'b-29x-5"&2/1449$%march##335$!8#"45',
+    '#!c#"mb")3,100,000#!0#!1#!3$!7#!5$"52$!9#"68#!7#!a#!p",4&ndash;6366',
+    '$!4$\'october##014#"10$"57#"22#!4$!2#"55#"80#"98%!6")5&ndash;6*086/1451&ndash;81#$,000',
+    '#!3#!4##600$!2#"97#)e&ndash;g+!h#!p"#605##212$!6##324##672#!9#!y',
+    '#!0$!2#"30#"60#"80#"93$!7""8p"%9,000#,1&ndash;8631##598"%:5:10"!a"!b#!n',
+    '#&i/mmol#"m.""db$!s""ff""gm"!k#$jmol#"ms"!m##b/s#"in#"ph#!s"\'percent',
+    '"!s")th-minute"!y!-6%&ndash;120%#%-158%##2.2"(&mdash;7#)ndash;118)!3)!6)"89)!9*!0*!3*!4',
+    '*"6%#&percnt#-sol;566/e.e.c0!.\'#653#0times;54&times;3"#(2)#"c)"(,366,019##400##692##700"(-66-86cm#!7#!8',
+    '$!7#"91#$ball%#sed##day#$june#)kilometre#$mile%$nute#&storey%$rong"".0#!1#%356b.#!4',
+    '#!6"$/141#"2s#\'398/eec#\'457/eec#\'635/eec#"88#"96"%0-bed##.00#$0095$"55$"66#!5$!1',
+    '#!6$"33#"77#"85$!7$!8#"94$!5$!6#)c&ndash;d#!k#!p"+1&ndash;086*$1635#!0',
+    '$!7#!2##545##868#!b"%2,300#".5#!0#"21$"22#!4$!2$!4%!4$!7',
+    '#)d&ndash;e#!h".3/1458&ndash;9#"04#"18#!3$"33$"51##530$"84#!9$!3#!a#)b&ndash;c$!c',
+    '")4,379,000#".4#&/early#!0$"84#"10#!2$!7##373##513#"80#!a#!c#!e##mhz',
+    '#!/#!0##133#!2$"12##727")6&ndash;7*%870cm*#909#$,556#!1##294#!5##613#"75',
+    '#"cm"*7&ndash;89#-/1462&ndash;3##430#!5#"67#!8"$8011##113#"21#!4#"70##mhz"*9&ndash;70#$/864',
+    '#!1#%33534#"90"%:92:5"$c911#!m"!h"!m"!n""pp")th-minute!\'7&deg;c#)frac12;in#\'mdash;8#(ndash\'88',
+    '+!2*"34**4&ndash;73)#383+!4)!4)!8)#91%*!4*!6*!9"#(1)#"3)#"4)#"9)',
+    '"(,000,000##300##470##555##652##859$"68"$-101##bed##cpu#$page$$iece#$room"!.#"0%',
+    '#!1#"2p##33p#"4%$!9#"55$!6$"kg$!p#!7#"8%#&97-day"(/102/eec$,565&ndash;79#&54/eec',
+    '#"91"(0&frac14#".5#1/october-november##000$!5#"28##532#"63#!8#"cm#)d&ndash;e""12$!5##363',
+    '##500$!1##721#$9/91#!a$(&ndash;c$!d#!m"%2,000##101$"22##321$"42#!5$"19',
+    '#!6$"64#!7$"20##853#!p"+3&ndash;874#$,290#!0$"30#!1#"40$"90##666#!g',
+    '#"lb#!p"%4,000#+/mid-august#"00##146##201##641##848#!c#)f&ndash;g",5&ndash;8366#$,000$#972#%/1470',
+    '#"hp")6&ndash;7*#877#$,960#&/early#"10##333#%58765##722##881#!m#!p".7/1472&ndash;3$"23$%early',
+    '%(id-march$(saturday#!1$"46#"50##881"$8058#/3/071&ndash;962#!7##818#\'977-445$!8"*9&ndash;92#$,290#-/1474&ndash;5',
+    '#!3#!7#!9#!b#!m"":1"!a"!b""cm""db""lb"!m#"ph"#r-4#"pm',
+    '!%8&deg#(mdash;90#)ndash;103)!2*"53)"53)"93*!4#-sol;361/e.e.c0!."$,100##400#\'514,501#\'600,000##798',
+    '#"65#"83$!9#$acre##feb##key#&member#$year"#.0%#"1%$!8#!3$!%#!4#"5%',
+    '#!7$$1mph#"8%$!m#!9"$/361#!7##840"%0,000#"0x##114##2/3%!5#"38##473',
+    '#!5$!0##697##pen",1&ndash;2722#$,000#!.##480#!5#"60##779##881%!2%!4#!9',
+    '"72&ndash;6/1477&ndash;81#!0##483##811$!5#%:1973#)a&ndash;b#"lb"-3&ndash;612bc#%/1478$(saturday#!0#!3$#346#!4',
+    '##737##838#)c&ndash;e"$4188##340##477#!5$"/2#!p"%5,789#%/1480##331#!6$"54#!9',
+    '$"50$"91#)g&ndash;h"%6,000#&-which#%/1481##214##331#$5.70#!6",7&ndash;6409##/20#"24#!5#!6',
+    '#"83#!9"%8,000#-/1483&ndash;4##432#$6/91"%9,629#".2##112$!6#!4##885""ft""gb"#mjy',
+    '".open-compliant\'$like""pc#"p.#"ts!*9&frac12;p$!t#+lsqb;1&rsqb#)mdash;208#)ndash;107**9&ndash;70+!1)"91*!6#)plusmn;14',
+    '#"a)"$,316##875"#-75#"88#"90#$july%"ne#&member%#tre"!.#!0#"12$"8%$"pc',
+    '$!1#"52#!6$"6m#"75#"8%"(/104/eec#\'299/eec#\'336/eec#"46$%8/eec#!6$"46$"6.%%7/eec',
+    '"%0/200#"0c##286#!3$"66#!9#)d&ndash;g#!m#%s/400"&1/1486##030$"55##146##505#"60',
+    '$"80#)a&ndash;d"$2087#"40#!8"+3&ndash;895*#927#$,000$#309#%/1485#$1977#!2##828##980"$4333',
+    '#"50##693#!9"=5&ndash;1,300/630&ndash;825kg*.6/1490&ndash;1#$,000#%/1021$!l#!6#)b&ndash;e#!p"%6,000#%/1491$(may-june##363',
+    '#"mb#!p$"ts")7&ndash;8#!0#"10#!3$"33#!6#"7s"%8,718##.31##/10#!p"%9,942',
+    '#!3#!5#"th"#:26""fm""hp"#min""pc#"ts"(year-old!#:00$"am#/7:23&ndash;0500")1&ndash;2#!3',
+    '#!6$)&ndash;32#!7#"ff""20$)&ndash;23#"11#!2#*3&ndash;27#"49#*6&ndash;39$&,39,40$!f##7am"!3',
+    '#!1##2am#!3#!5#!8$"am#$9,40",4&ndash;7,14##0.9#$2.26#!3##5pm#!7##8.0"!5',
+    '#/4:19&ndash;0400"!7#"ff"!8!\'=-\'r/6p#$n/6p#%sn/6p"%2n/3p"%3+4+1"!8"$n/3p!(a&plusmn"(,9,10,11""-c"#.m.',
+    '"!d""e."!h",m&ndash;10pm*#4pm#%-10pm$#8pm$#9pm#!.$$they"%rcsec"!s"!x!$b(1)"!e',
+    '"!l"!q!"c+"!d"%m/3in!%d.per"!b"!e"!h"!j"!p"!s"!y"!z!#e12',
+    '"!l"!r"!x"!z!"f\'#!s"$l.oz"!p"&t-wide!&gflops""hz"!u"!w!"hf"!x',
+    '#!.#$ches!-j&times;16ins"!f"!n"!t"!u!#km.#%/smls#!s!"la"$b0oz""g."!h""mm',
+    '"!u!%m-bit"%/26ft#!s"#bps"!g##l-1"!l#!s"(m-format""ph""yr!!n"!b"!j',
+    '"!n"!q"!u"!y"!z!#ohm"-z/&pound;6.69!$p.m."!b"!d"!e"!h"#lea",m-12midnight"!r',
+    '!!q"!e"!g#!."!h"!n"!t!#re."!j"!p"!r"!t"!u!$s.4d#"9d',
+    '"!d"!n"&t-4-oz"!u"!z!"ta"#bsp"!c""ev",h&ndash;10th+#4th*#9th#$-9th#%vs9th"!r',
+    '"!u!"ub"!j"!t"!u!*v1&ndash;6"!a!\'x10x3in#%2inch""40"!8"!b"!f"!n"!p',
+    '!#yds"!e""rd"!x *9%+15%=24%"#120!$&amp"%deg;c"0frac12;-5&frac12*&minute)!d\'#4;p\'$5;cm&%34;d.&"58',
+    '$&;3&ins%%6&ins",half;x12x3in"%mdash\'#;10#\'iddot;1)!2",ndash&frac12\'#;09(21&ndash;26&ndash;3)"-1)\'0&deg;c*!8*"ft*!h',
+    '*#.30*"th))2&ndash;01!12!8*#.30*"ft*#ghz*!m*"th)"3%))4&ndash;0**-year-olds))5&ndash;01!8',
+    '*!m)!7*!a)!8*"kg,!.)!9)"pm()2&ndash;0)#.2v)"0b)"25)!3)!4)#5kg',
+    ')*0&ndash;51*"am)!1))4&ndash;0))5&ndash;0)"67)!7)!8()4&ndash;0)#.30))3&ndash;1)!5)!9(25&ndash;10&ndash;2))1&ndash;0',
+    '(,8&ndash;1904)!5)!7($9(a)*"b)($hole"&plus;1#-rime;52&prime)\'4&prime)\'5&prime"+shilling;7d#%ol;9a"(times;10)#2cm!!\'',
+    '!$(1b)"(4)&mdash""6)""9)""d)""f)""g)!#+10!1,000&mdash;10,000&,ndash;10,000%!+%%-acre&%litre&$name&!s',
+    '%"kg%"lb%!m%!t#"29#"73#&89,659"!1#\'0,11,12$"0m#&16,877$!9#"22$!4#"75',
+    '#!9$)2,631,770$!6"\'200,000$!3$!5#"15#"20$!9#"38#"40#"50%#lbs$%7,000#&60,761',
+    '#$80ft$!6#"90$!5"!3#&00,000)$,000#"19#"37#"42#"50$%3,006$%9,656#"69#"76',
+    '"\'400,000#&19,108#&21,000$!6#"34#"49#"50#"73$!8#"87$!9"\'500,000#"19#"46#"60',
+    '$%7,000#"72#"81#"95"\'600-ton%$kbps#&18,696#"44#"60$%8,454#"72$!9#"86#&94,000"\'700-ton',
+    '#"14#"34#"50#"75#$80lb$!4#"99"#808#"20#"30$!4#"50#&67,000#"74"#906',
+    '$!6$%7,000$!9#/50&ndash;15,050#"66#&99,433!8-(2-hydroxyethoxymethyl)"&0-48-0#(68314343""23"#3-2$"93"#5-1$!2"#6-1',
+    '$!3"!9"(academic$"re#.nilinoacridine"$dec.$%oxy-6#*imensional"*epoxy-&dgr"%for-4"4hydroxyprostaglandin"!m#$onth"!o"%point',
+    '#"ow"%track"\'vectors!-.0&ndash;12.5*)9.5d.p.c.#"0%$.&ndash;10.00pm+$9.30$$a.m.##1am#$3.53$!3#$4.05#!7#!8',
+    '",1&ndash;28.0*%9.1.2,!7##(a)$"c)#!.$#1.1&!3%!0$#4.1&!2$!5$095&ndash;17.3.95#"04$!a',
+    '$!b#"1a#"3%$".1%!2%!3$#p.c#$4(b)$#.04$!m$!p#-5&ndash;10.30+$5.15$#(a)$".1',
+    '$#p.m#"6%$#(b)%"c)#*8&ndash;26#,9&ndash;9.20#"kg#"oa#!p#$secs#%x9.1m"$2(1)#".5$!6#*0&ndash;27',
+    '#+2.6&mgr;acm%!9#*4&ndash;27$#.32#%5:1cr$"pc#*6&ndash;28$".9$!m$!p#"7%$".4%"59#"9%#!a',
+    '#!p"93&ndash;4&ndash;9&ndash;3##(a)$"c)#+-metre-wide#!.$!4$"90#"0%$)&ndash;10-#.00."30,!2,!3,$7.00',
+    ',$8.30."45$%-10am$%.5kyr$#4pm$/am&ndash;1.30pm.&2.30pm-&4.30pm-#5pm&\'-1.30pm(&2.45pm\'&6.00pm\'$7.30("pm\'$noon',
+    '#11&ndash;11.7/1000+!4$#.25##2am#"3%#!4$#.30##5.1$":1$"am$"pm#!6$#.11#!7$".2',
+    '#"kw##oam$"pm#$secs"14&ndash;12.6/1000$(times;10#%/1000#"0%$"66$"am#"4p#"5%$,&ndash;10.45$#.53$"16',
+    '#*6&ndash;50#\'7&deg;n#!d#"pc"%5&deg\');x3.2&deg$*ndash;10.5*%24.5%##(a)$"b)$"c)#".3#"00$#am.$"pm',
+    '#!6#"7p#!8#!9#":1#"in%"ch#"kg$"yr"%6&ins##.1.&!1&!2&!3$!3',
+    '#!0#!2$"5%$!p#"3%#!4#"7%#"gb#"kg##ozs#"pc#$secs"#7.1$!2#!0',
+    '##12%#!3#"5m$!p%!c#!6$-10186961045hz#":1#"pc",8&ndash;46.5##(c)#".3$"89#"05#!1',
+    '#!4#"5m#"6%#!8#":1#!a#!b#"cm#!p#$secs"$9(c)#!0#"1p#"2%#"6s',
+    '#"oz#$secs!"/-"*10/11/12th%"90$!0#$1/82$%5(8%)#"2b#!4#"86"$2/41#!4#"89"$3/41',
+    '##/93#!6"$5/41#!6"!6#!3"!8##/87#!1$!0#"22#!6#!9#!a""91',
+    '"$face""kg""lg"$tube"\'working""zg$"26!*0%--mainly$$plus"+&deg;-angle\'!.\'"e.$)ivide;300#)frac12;in#\'mdash;1',
+    '#(ndash;10+"0%,&&deg;c,!2*%10mph+!6*!3+!0)!2*"40)!3*!4+!t)"43)!5',
+    ')!8)"92*"4%*"5%+#lbs*!8+!%)%years#+rehy;minute""+m"%,000+&(-100,000\'$mile\'&strong&!.',
+    '##500#\'630,000##700$\'10-acre##800$"43"#-10%!5##95%#$acre#%claim#*day-notice#$hour#$june##min',
+    '$"ph#$page$%egger%&r-cent$#ort$$upil#&strong#(thousand#$volt"!.#!1$!%##26%#"32#!6',
+    '$!5$!9"!/#&100000%!9$"41%!2#\'314/eec##423#"50$"47$!5#\'619/eec#%95mph#!e',
+    '#"mm"%0&deg$\'ft/270m$\'ndash;1+&,100kg,#300+#000+$100m+#300+#700*#600*%800bc+#500*#950+"99',
+    '#*-foot-high$"hp$"kg%!m$!m%\'egawatt%&illion$$page$&series%%quare$$year#\'/march-#+0&ndash;8x0$!+$)-year-old',
+    '%$400s%#700($/800\'!5&"10&"30%#800(!0$$1700$!6$"91%!2$"cs$!l$\'mvs/esa',
+    '##102#!3#%48172##853$"71#"cm#!e##gns#"hp#&kb/sec$"ms$!w#"mg$#m/3$!w',
+    '#!p$\'.p.t.v.$!c##rpm#!x#$yrbp"+1&mdash;928##.66#%/1496$+march-april#!1$%0300a#!2$!0$"71',
+    '%!8#!5#&68943a#&74036b#"81$!2#!9#!b#)c&ndash;d""2.$"45$!5#%/1497#!0#"15',
+    '$!s#!5$!8##659#!8#!h".3/1497&ndash;8\'!8#!2#"60##880#!a"%4,000#$-881#!0',
+    '#"5n"%5,000#%/1499#!0$!2##183#"bp"%6,000#$/907#!0#!2#%g/day"%7,000#-/1501&ndash;2##023',
+    '$)2&ndash;2#"34#!4#"90#)c&ndash;d#!g#!p"%8,000#-/1502&ndash;3#!p"%9,377##364#!4$!0#!7',
+    '#)d&ndash;g"$_per"#bhp"$degs"!f"#gal""hz"\'iii387a"!k#!m$!s#"ph#"ts#"yr"!l',
+    '"(m/100yds##b/s#%l/3fl#%mol/l#!p"!n#!g"2p&mdash&pound;1.05$0ndash&pound;1.69#"er""sq#!t#!x")th-minute"(year-old',
+    ')(;7degree(%4&deg#\'mdash;2#(ndash;08)$100%)#229*!3*"55)!4)"56)"88)"94*"5%"$(10)$"4)',
+    '##440##740##802"#-85#"92##dec#$seat#$year"!.#"02#"2%$,&ndash;97.5%$&1.4myr#!3$!3',
+    '$!9#"44#+5&times;122$!0$"17$"cm#"66#!7#!9$!p"$/\'92#"03$!6##118$"23',
+    '#\'250/eec$!7$"87$!9#\'325/eec#!l#%p.352&"76&"98%#452\'!6&"66&"84"*0&ndash;30#),950/950i',
+    '$!4$!7$!8$!9#!d#"in#!m""14#!6$"46#"70#!9"*2&ndash;13,-/1506&ndash;8##.00',
+    '$%547.6#"1s#!2#"34#!5#"60##kms#!s"%3,000#".5#$6/91$"75#+70&ndash;71#)d&ndash;g"#4.4',
+    '##666#!a",5&ndash;3210#$,552$#979#)c&ndash;d#"mm"%6,000$#377$#771#%/1127#!1#!6"+7&ndash;604#$,116',
+    '#$2/30#!3#!5#!7#"ff"88&ndash;26/1512&ndash;20#$,000#".1#%/1512#!m"*9&mdash;30#!4#!5$"95#!6',
+    '$!3$!4#"72$!5#%88-89#"93"":4"!a""cm$+&times;1.5m")e&ndash;g"!k""mm""no"#pts',
+    '!\'2&deg;c\'!f#,formula;km/h$\'rac12;p$!t##ins#%ndash(#\'93($;104*!2+!0)$226v)!6)"94*"7%',
+    '"#(3)"$,104##400##500#\'600,000$"58$"60##775#"93"#-93#&member##nov#&octane#%piece#$seat',
+    '"!.#!0$!0#!1$!%#!4$!g#"56#"6%$!6$!m#!7#"8%$!p#!9',
+    '#&27/eec##421#"56#!c")0&ndash;1#$,297#%-acre#"/l$\'october#!0$!0#"10#"32##624#"91',
+    '#&metres#!p#!s""1%#6&ndash;2/1515&ndash;16#$,030#!.$"3%#%/1515%!8#$3984#"80$"5/#"90".2&mdash;whilst',
+    '#%/1516$"27#"01#"1s#!2#"30#"40#!5#!6"%3,000#!8#"99"&4/1113$(february#!0',
+    '$!2$!4$!6#!1#!4"+5&ndash;940#$,000$#600#%-3600#!1$!2#"km#!p")6&ndash;7#$,293',
+    '#!.#!0$"19#!2#!f#!h#!m#!p")7&ndash;8+%/1521#%/1521##837#!9#!a#!g',
+    '"%8,000#&/early#!0#!a##gts#!s"/9&ndash;30/1523+#528#%/june#!0#!2#!7"!a#%=blue"!c',
+    '#(&ndash;e"!e#!v""ff#!t""lb"%mar14#!m"#pts!%3&deg#)mdash;106#\'ndash;1*"01*"13)!7',
+    '#&percnt$%lus;2#-rehy;year-old"!+"(,000,000##100$"70%)7,050,000##215##367##400##500$"70##720##800',
+    '#&member"!.#"0%#"1%$!2$!3#!2$!6#"44#!6#$7ins#"9%$"pc"$/067#$3/07',
+    '",0&ndash;1700*"40#$,000##.00#,/940/900/270#"00##214%!5%!6%!8$"20%!2%!3%!4#!3',
+    '$"14%!8$"21%!2%!3%!4%!5##410#!6#"70#!s"%1,000#"30#!7##862',
+    '",2&ndash;2330#-/1525&ndash;6#!0#!1")3&ndash;4#!4#!7#)f&ndash;g"#4/1$!2#"50#!b"%5,643#-/1528&ndash;9#!4',
+    '#!h"%6,338$#653##3.6"%7,000#-/1530&ndash;1#"27#!4"#8.7#!0#!1#!5""90#!4#!6',
+    '#!f"":1#!4#"66"#bhp")c&ndash;f"!f#"f."!g""km$!."$mins#"ph"\'rd-best!#4%-',
+    '#)frac12;in#+lsqb;2&rsqb#\'mdash;5#\'ndash;0)#100*"10*"27+!8)#400)"52)"99)(year-old#&percnt$&lus;11#3times;45&times;66cm',
+    '#"2)#%=924)"$,240$"67##742$"68#\'800,000"$-107##run#&strong#(year-old+!s"0.07&plusmn;0.06%#"1%$"0%',
+    '$!9#"44$!8$!9#!5$+x245x64&ins#"6%#!8#"9%")0,000,000#-/1533&ndash;4\'!4#!2#!8#"lb',
+    '#!t"*1&mdash;58#%/1534#"03$!7$!9#"33#!6#!7#!8#)a&ndash;b"62&ndash;4/1536&ndash;7#$.073#"/l#!0',
+    '#!4#!7#!8$!0#)a&ndash;b"&3/1536#!2#"30#!4##5/1#!6$!6#!b#!p"%4,000',
+    '#!3##4/1#!7#!c#"s2")5&ndash;6#$,000$#350#-/1538&ndash;9\'!9#!0#!3"*6&mdash;55$)ndash;955#(,900,000',
+    '##4/1#"61$"45#$8944",7&ndash;4814#$,000$#356#-/1540&ndash;1##5/1##7/1##9/1$"82#!m""80$"/1',
+    '#!8""9-#!4$"/1##5/1"$_per""ft"!h"%ills.#"ns""lb"!m#%/123m#!m""pc',
+    '$!."\'x84.5cm"(year-old!(5%-rated##:5%##ile"&&deg;f#\'mdash;6)!7$%gr;ms$\'iddot;1*!4#)ndash;110*"20)#400',
+    ')!8)"97+!%#&percnt$#lus"#(1)"$,100##200$"45#&500.10##600$"54$"94##800"$-100',
+    '#"92#$mips##omt#$page#$year"$.07p#"1%$!9#!2$&&aring%)ndash;111$!0#"30$"8f##50c',
+    '#"6%#!7#!8$!%$"fm#!9"$/520$"5a%!b"\'0&mgr;v#$,100$#782#%-year#%/1544#"00',
+    '##7/1#!m#!p")1&ndash;2*#952#!0#!1#!2##300#!5#!7$"/1#!8")2&ndash;3#$,000',
+    '((&ndash;6#"91#)f&ndash;h"*3&ndash;65#"01##1/1##3/1##9/1#!a#!b#!p")4&ndash;6##0/1$!3#)b&ndash;c',
+    '#$,000#%/1548#!1$"/1#!6$"/1$!2##8/1#)f&ndash;g")6&ndash;7#$,000$#330#!.#%/1549##0/1',
+    '#!5##6/1##7/1##8/1#!m",7&ndash;4829##1/1##5/1#!7"/8&ndash;64/1551#%/1551##2/1#!4##6/1##7/1',
+    '*#960#$,450#"-1#".8$!9#!0#!5##7/1#"80"":1$)&ndash;8a$"00#!3"!a#$=red',
+    '"!f#!m#!t"%kcals"!m#!a"!s!\'6&deg;c#-frac12;points#)mdash;98%$$gr;m#(ndash;00)#105"%(11a)#"3)',
+    '##575##610""-5#"71##97%#\'article#"km#$like#&member$%inute##run"!.##0fm#!1$!2',
+    '$!5#"3%#+5&ndash;100%+times;213.4#!6$!3#"7%$!9#!8$!%$!4#"9%"$/120#"97"*0&dollar;c',
+    '+#126+%279ad#%-like#%/1127#)0/receive$!0$!2##2/1$!2#"67#%781/2#"cf#"mb#!p"$1.2%',
+    '##8/1""23##4/1##6/1#"80#!e#!h#"nd"$3/10%#556#!0##1/1##6/1#!a#)b&ndash;c',
+    '"(4/august#!2##9/1$!0")5&ndash;6#$,400#%-1040#-/1557&ndash;8##1/1#!2$"/1#"88#"bx#!p#"th',
+    '#%/1558\'!9#!2$"/1#!3#!6$"/1##7/1##8/1##9/1$!0#!b#"kg$!m"*7&mdash;70',
+    '##1/1##2/1")8,000,000#%/1561$0august-september#!1#!6##8/1"#9.4##0/1#!2#!6##7/1#)a&ndash;c#!p',
+    '"!b##/mw#"hp")g&ndash;h"#ins"#mb.""pc""th!+7&ndash;100+!1+!4+!5*"10+!6*"42',
+    ')"64)"98*!9")(1)&mdash"(,000,000##307##486##715$"54##900"#-91$!3##day##mph#&octane',
+    '##run#$yard"#.05#!1$"25$!p#!2$!2$!5##540#"6%$$0mph$!5$!6$!p',
+    '#"9%$!1$!6"$/117#+681&ndash;2#"98"+0&ndash;933+"71#$,000##.00#%/1563#!0$#-rb#!1##2/1',
+    '$"/1##6/1##9/1"%1,627##/2p#!1#&4,1986#"50"+2&ndash;973#)-2-868165#%/1565##0-t#$1-22#!3#"51',
+    ')%;1048*$8799#"/8$%march#"90#)f&ndash;h#!p")4&mdash;6#$,000#$-952$$page#%/1566$$5566#!2#!8',
+    '",5&ndash;1011##.73#%/1567#"32#"50#!8#!9",6&ndash;1014#%-loca$$page#%/1569#$:283#!g")7&ndash;9#$.000',
+    '#)b&ndash;d#!m"%8,000$#112#%/1570((&ndash;1"&9/1571\'!2#!4#!7#)c&ndash;f""cm""ft"!k#\'m/60mls',
+    '#!m#"ph!%8&deg&";c#)mdash;100)!9#(ndash;08)$1108*"21*!6)!8"#(1)"$,100$"43##270',
+    '##620$"94##874"(-bedroom#$mile##run"%.106%$!7$!9#"25#"3%$!6#!4$!%%%/1.6%',
+    '$#k/h$!p#"7%#!8$!%$!3#"92$!3$!p""/1##386##437##689",0&ndash;3120#$,000',
+    '#%/1572#"00$!s$"xl#!2#!a#"bp#)e&ndash;g#"kg%"/m$"ms"&1/1573#"18#"3b#!5',
+    '#!t"*2&ndash;07*21003/1574&ndash;95#!0#"25#!b#!m"$3&ft#$,045#(/october#!0##112#!6$#569#!7',
+    '$!2#)c&ndash;d"&4/1577#!0$"00$!1#!2#"60#!a#)c&ndash;e#"pp"%5,094#$5khz#!6#!a',
+    '"%6,000#%-foot#%/1578\'!9#!0#!1#!6#!h",7&ndash;9400#&/april#!0#&665723#!9#!a#!m',
+    '#%/1580#"04#)c&ndash;e$!c"*9&ndash;96#$,000#&/march#)b&ndash;c"\'a=white"#bhp"!d""fm"#ins""km"!m',
+    '#"ph"#pts!+9&mdash;101#)ndash;101+!3+!4+!7+-8/20&ndash;25*"17*"25)!9"%(0.9)""+4"$,300##479',
+    '$"92"#-/o##100#!3#"48#"83$!9#$acre"!.#"0%$!4$.8&plusmn;0.03%$!9#!1$!7',
+    '$!5$"8%#!3#!4#!7$!3$"65##85p$!6$!7%!%#"96$#75%$"8%$"9%',
+    '&!5%!z""/5##711##982")0&ndash;1*!2#$,000\'$,000#!9#"cc"%1,601#"90#)b&ndash;c#!p',
+    '%#161%#584$#400#!0#"10#!2#)f&ndash;h#!s")3&ndash;2#$,090#!0#%26025#!4#!b$(&ndash;e',
+    '")4&mdash;5$\'ndash;2+#282#-/1585&ndash;6#!8#!g#!m"&5/1587$!6#!0#!8#"kb",6&mdash;1031$\'ndash;2")7&ndash;2',
+    '#!0#"20#!3#!7"18&ndash;5700/5090#\',256.10#!0#!5#&6/4175",9&ndash;1000#$,400#"00#!3"":2"!a',
+    '""kg#!m#!w""lb"&mmol/l#"ph"-p-&pound;4.25$&a-pint#$/15g!%:00am##4.4#!6"*1&ndash;12+!4##1ff',
+    '$)&ndash;35#!4#*5&ndash;23#!7#*8&ndash;29")2&ndash;8#!0#!1#!2#!3##4.6##8.7$"am"*3,15,12:24#-0&ndash;12:00',
+    '$"am&\'-4:00pm#$4.42#"5-#$6.37#*7&ndash;38##9.8""40#*3&ndash;48#$7.27"!5#!2#$6.62#!7$#:06',
+    '#$9:51"#6.8#!2#":1!"=3!"ab""ct"!g"!l#!.")m&ndash;5*#7pm*#9pm#(-11.30pm%%2noon',
+    '$#6pm$&7.30pm%"pm"!q!$b-10"!g"!p"!q"!x"!y!,cadukm470257\'&500107"-m/3&frac12;in"!t!"dl',
+    '"!s"!u"!w!!e"!b"!e"&nclose"!p"!t"!w!"fd"!g"&t-high#!.##3in',
+    '"!b!"hb"!h#+&ndash;10hh"!l"!n""t.""w."!x!#in.#"s."!x!"j2!"kb"!g',
+    '"!a"!f""j."!r"!t"!x!\'m-bytes""jy",m/&frac38;in"(odifying""yr!"nf"!m"!n"!u',
+    '!$ocms!%p-12p"!d"!j"!n"!z!"qa"!g"!u"!w!"rj"!l"!t"!u"!z',
+    '##6d."!a"#ecs"1inclair-stevenson"!r!"ta"!b",h&ndash;13th*$23rd*&sunday#%-11th$#8th#%/12th"!j"!l',
+    '!"uh"!n"!q!\'v-0v-9v!"wl!!x"$10cm##1cm##2in&"ch"!a"!p"!s (;1.1(39) -=&dollar;e1/2',
+    '"*=+=+=+=+=+!%-0.23%!5$"47"!2##0mv"%30.81""40#-4&deg;14\'29.2"#971!!.!%0&deg"$.000%!4$$1110',
+    '%"cm$!8#"10$!6$!7$!8$!9#"22$!4$!8##318$!7$"80#!4$!0',
+    '$!3$!5$"75$!8#!5$"02$!1$"27$!4#"61%!5$!3#!7$!0$!1',
+    '%!7$!2$!4$!9#"80%!m$!2$!3$!4$!6$!8#$9412""mv!%1,322"".1',
+    '#"22$!5$!9#"32$!3#%5x106#"67#"84#!9$!8"#0.5$!6$!7$"90#!3',
+    '$(.5&aring#!7#"mm"#1.4#!0#!4##9.5"$2.89##h16#!v"$3.32#!0##1.1#!3#!8',
+    '$!6$"97"%5&deg#".2%!1$"38$"99#%0,000#!p"!6#".5"$7.05$"14#)8,640,000"#8.6',
+    '"$9.32$!4!"2%"$&deg"#.05$"84#"10$!5$!6#"42#!5$!2$!8#!6#!8',
+    '""/p"!0#".2$!9#!0#!1#!3"!1#".7#!6"#2.5"!3##.58"!4#!3',
+    '#"mv"!5##,25#".7"!6#(,984,176#".4$!6"#7.2$"72$!8#!5"#8.1$!8#$0.0a',
+    '"!9##.16$"92"#r-n!$3.11#"28#"35#!5$!5#!6$"73#!7#!8"%0,000#".5',
+    '"\'2.22.9g"#3.2$!4"$4.66"#5.7#!5"#6.0$!6"$7.47"#8.4#"pc"!u!%4,000"#.00#!1',
+    '#!2#!4#"54#!6#!7#"87"!1"#2.6"#4.3""5%#!1"(7&deg;34#$9001"!8!$5.07',
+    '#!5#!8"!0""14#!9""36")6.6&aring!#6.0$!3#!3#!8#!9"!0#$&deg##.52',
+    '"#1.2")2.7&aring"#3.8"#561"#7.0$"57!$7.05##306#"58"\'0&mgr;v#".5""11"!4#$&deg"!8',
+    '""91!!8"".0$!2#!3$!9#!9""/3"#6.6"4x7x6x5x4x3x2x1=40320!!9"$,438#\'928,740"".2#"3%',
+    '#!4#!5""1%#%0/500"#495"\'5.3&deg!!a"!z!!b"#/rt"$anks"#ody!%clock"\'ommodat!!d',
+    '"&m.2.86")ouble-six!%eagle"!m!"fb"$ield"#rog!"go!!i"#eth"!f#7(principal&gt;taxthresh""me"!n#&finity',
+    '"%iarly""og$!2"%ys295!#m21")anipulate#%ximum""em"\'inister#%toxin"#ote!!n"!d""ot$#her',
+    '!$only!"p4""ec"$lied"%ounds"&remier!!q!!r""/p"$ight"!l"#rrr!$sand""et""ic',
+    '"\'tanding%#tly!%thing""il##nue!*university"!t!$verb#%sting!!x!!z"(3,166.05 !^ 0a%=&amp;7fffffff#*2147483647',
+    '#$mp;l&"r\'&$sup2"$bsol&$;sac\'#tbc"\'dgr&egr#+ollar;1,200,&50,000+#300+\'706,000+#900*".2+"45+!5',
+    '+)65billion+"78+"87**0&ndash;20+$,000/$,000+#.20+&00,000+%1,063+%9,900*!1*"20*%3,400,#990+%7,000',
+    '+"4m*)5,000,000+".9+(0million+!6*)6,000,000+"0m*%7,400*%8,000+%0,000+!3*%9,000+"0m+"1m*"bn',
+    ')%2,100+#300+#500+\'850,000*".5,"bn+"6m*!0+$,000/$,000,#700+!0,\'million+!m*%1,000',
+    '+%2,796+$6.1m**26,000,000*"35*%4,000*)5,000,000+%0,000*!7*!8*\'billion)!3*(&ndash;4*$,000+#400+#500',
+    '+"50,\'million*"00,(,000,000**2&frac12;m+)3,000,000+%5,000*)4,400,000+%3,420*&57,540+!m*#70m+%5,000*"bn)%4,500',
+    '*!0+1&ndash&dollar;52k+!0,$,0000$,000**45,000,000*!5*#64m*#96m*\'million)!5*$,000+#200+#468+\'600,000',
+    '+$,000+!0+%6,000+!8,(,650,000*!3*"80*!9))6,200,000+#500+\'600,000+#800*"0m*&30,000)!7',
+    '+"95*"00,$,000+%3.317*)1,200,000*!2*"80)%8,000+#107*)0,000,000*)14million*"80,\'million*!m)%9,300',
+    '*%2,956*%6,500*$7.3m+!0,),000,0000+)9,000,000"*eacute;rea,!s*&ienne.*!o"$gt;b%$g&gt"/igrave;n&eacute##uml&#;ah',
+    '#%owbar(c&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar&lowbar;occurrence(%;term#.sqb;g&rsqb;nel\'&n&rsqb\'+rgyl&rsqb;e(\'se&rsqb\'+s&rsqb;niel#&t&gt;2$*;f(x)&lt;b"\'mdash;2(!e(#few(!j(#no.',
+    '(%whole")ndash;10s(!2)40g&ndash;45&ndash;do*3j&ndash;15&ndash;do)"4a)"6b(!4(!b("in(!m(!r(-sledge-hammer"&plus;e#.ound;92million',
+    '#"gr%";e"0times;b&times;272)&times;14!$\'-c\'#"d\'#"f\'##god#%level"#:b\'"$=415""a\'"\'begging#%haigh&"rd',
+    ')!g%(orachain*#ian$"ir"&feared"%gahil#$hlas%$inne##ogo"$haha#&unting"+in-i-akbari"%level\'!s#$l\'av',
+    '"(mhachair%"in$&uiridh#)ouldering"%pence"&roving"%sleek#\'pinning"%thing"$udhu"\'workin\'!$(19)""4)#\'29)four"#ax)',
+    '""k)"\'le2)l/2#$pha)""r)"#t)r!#***!"+b##+c-#!-#$x+cx""ib!$-1\'s#%-plus#"2s##450',
+    '#!p"12&mdash;3&mdash;4*)4&mdash;5#!0##1sj#!4"!3#!0#!2$!1"%4-2-8#$1563#"35#$40hz$!2',
+    '#"87"$6522"#817#"63"":b"#ach$&tually#"gh#(l-l-fred$\'lotrope#\'manitin#"nd$!t#$ozzz#(pologise',
+    '%\'ociated"$b+c-#!-$%x-d-e#!c#&eating$!d#"it#)loody-men%$ring#$ombs$$ogie#\'raggin\'%%nched&\'tingham',
+    '$$stle"#c-d#*entralized#&hangin)!\'$$itin#$lack$&inkin\'$#ock$%utter#)oordinate$$rner$$uple(!d#%ryin\'',
+    '"%dance%&delion##eck$\'pendent#(ifferent$%gging$*sadvantage%!k#$oin\'$%t-out$"wn#(rainhole%$win\'$#ive&#ing',
+    '#$ying"#e-a$!f"&f-bout#"ew#\'iddling$%shing#\'lapping$#ush%\'ttering##orm&"at%&ty-six$0ur-one-three-six\')two-eight',
+    '#%rames$#ont#&usions"%gleam%!y#\'nashing%$wing#$oin\'#%rades$%owing"\'haarr-h$\'lf-hour%"lo$\'rrowing##ead',
+    '$!m$)rborising##ibs$$gher$(storical#%oeing$%ggin\'$"ld$%wlin\'#"uh"!i#$-d-s#%nitio"&jivin\'##rud',
+    '##eto#\'nocking#$orus"\'l-g-a-r#"/b#&a-mode%)porcupine$)nd-roving$&ughing#&eaping$&velled##ike$#ne.$$ttle#!m',
+    '&!y$"ng$%oking"!m##ami#\'easures##ile#%oment$(uldering#\'unching"%names#%eissa$!w"&oct-11&!2',
+    '$$th-y#-hilosophising#\'ictures$%llars#\'lanning$\'oughin\'*!g$(us-rated##oem$"rt#&ulling$%rpose"&quoted"#r\'s#"ab',
+    '$&ttling$$ving$!y#!e$!g%\'istered$\'pairing$*spectively#&inging$&p-off\'#&olling$%otin\'$$ving$!w#$uagh',
+    '"!s#\'a-sa-ra#\'crewing$\'uttlin\'#%econd$$eded%#ing$\'pharose#$hape\'!d$%ining$#ock#&inging#&lither#$mall',
+    '#\'pinning$&oolin\'#\'traddle%#eam#&ubunit)!s#&waying"&t-rich#"ag$%pping$$unto##ech$"ns$&rrible#\'hinking',
+    '$&rowing#%ingle%%kling#!o$#-ds$"ok$!p#&racing&&ts.the%"in&!t$%emble(#ing$$yin\'#4wenty-seven-year-old',
+    '%#tch#&ypical"$unit"\'victims$!s"\'wailin\'%$ting$\'ndering$"rd$!y#&eeping$&ighted#&horing#?op-bop-a-sidgwick-a-lop-bam-pan$"rd',
+    '"%z-u-l#&ed-bee!$.-a.""1.$!1$!2#!3""22"#3.3#!2""4.#"44$!7""52"#836',
+    '#"81$!4$!7"!9"\'a.milne$"u.#.cad&eacute;mie"$b.c.$$f.i.$!n#&airoch##erk%#lin#)itaeniata#\'orellii',
+    '"%c.417$"c.$"d.$"e.$"s."$d.47$#800$"j."!e##.a.$"b.$&i.o.u.$$r.e.$"w.%%arner',
+    '"\'f.budge$%walls#!p"$g.l.$(spalding#&eneral$%phyra"$h.m.%%ckeag$"t.##ird"$i.a.$"c.$"m.$!s',
+    '#"sa%!."$j.b.$"h.$"s.$&wilson"$k.c.$"p.#%eyell#%haliq#(jellberg""l.$"f.$"j.#$arge',
+    '##ong"$m.a.$(buchberg$"m.!+ltar-frieze',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_91 = (
+count_91 = 6694
+
+heads_91 = (
     '520kcals',
-    '520m',
-    '520n',
-    '520st',
-    '520st-fm',
-    '520watt',
-    '52100',
-    '521235',
-    '521382',
-    '52140',
-    '521521',
-    '52153',
-    '5217',
-    '522&ndash;1',
-    '522&ndash;4',
-    '522&ndash;485',
     '522&ndash;5',
-    '522&ndash;5186',
-    '522&ndash;523',
-    '522,000',
-    '522,684',
-    '522032',
-    '5222',
-    '5225',
-    '5226&ndash;31',
-    '5226.25i',
-    '522872',
-    '522h\'s',
-    '523&ndash;4',
-    '523,000',
-    '523,670',
-    '523/l',
     '523012',
-    '52336',
-    '523523',
-    '5236',
-    '523759',
-    '52394',
-    '523p',
-    '524&ndash;525',
-    '524&ndash;527',
-    '5240',
-    '5241',
-    '52420',
-    '52428',
-    '525&ndash;456',
-    '525&ndash;625kg',
-    '525,100',
     '525-codon',
-    '525-cubic',
-    '525.4%',
-    '5250-based',
-    '525000',
-    '52511',
-    '5252',
-    '52525',
-    '5254',
-    '525488',
-    '525528',
-    '525555',
-    '52570',
-    '525hp',
-    '525p',
-    '525td',
     '526&ndash;35',
-    '526&ndash;7',
-    '526,000',
-    '526,000-square-foot',
-    '526.5khz',
-    '5260',
-    '52600',
-    '52620',
-    '526306',
-    '526464',
-    '5267(4)',
-    '52693',
-    '52699',
-    '527&ndash;565',
-    '527\'s',
-    '527.08',
     '52720',
-    '5272648',
-    '52729',
-    '5273',
-    '5277-5249',
-    '527a&ndash;c',
-    '527h',
-    '527p',
-    '528&ndash;529',
-    '528,000',
-    '528,764',
-    '528.00',
-    '52820',
-    '528421',
-    '528788',
-    '528800',
     '528b&ndash;d',
-    '528h',
-    '529,000',
-    '5291',
-    '52910',
-    '529292',
-    '5293',
-    '529m',
-    '52:10',
-    '52:48',
-    '52:diagram/figure',
-    '52b/w',
-    '52bc',
-    '52c',
-    '52ff.',
-    '52ft.',
     '52g',
-    '52in',
-    '52mbps',
-    '52mhz',
-    '52min',
-    '52mph',
-    '52pp',
-    '52sec',
-    '52xx',
-    '53&deg;n',
-    '53&deg;s',
-    '53&frac12;p',
-    '53&ft',
-    '53&ins',
-    '53&mdash;68',
-    '53&mdash;7',
     '53&middot;2',
-    '53&ndash;130',
-    '53&ndash;150',
-    '53&ndash;36',
-    '53&ndash;54:diagram/figure',
-    '53&ndash;55',
-    '53&ndash;6.7',
-    '53&ndash;60',
-    '53&ndash;67',
-    '53&ndash;68',
-    '53&ndash;70&ndash;33',
-    '53&ndash;83',
-    '53&ndash;84',
-    '53&percnt',
-    '53&times;10/l',
-    '53\'n',
     '53\'w',
-    '53(2)ta88',
-    '53(4)',
-    '53+5',
-    '53,000in',
-    '53,200',
-    '53,297',
-    '53,340',
-    '53,37',
-    '53,500,000',
-    '53,502',
-    '53,514',
-    '53,549',
-    '53,642',
-    '53,644',
-    '53,681',
     '53,772,000',
-    '53,800',
-    '53,900',
-    '53,971',
-    '53,999,998',
-    '53-',
-    '53-50',
-    '53-byte',
-    '53-footer',
-    '53-member',
-    '53-mile',
-    '53-point',
-    '53-run',
-    '53-seat',
-    '53-state',
-    '53-word',
     '53.03',
-    '53.09',
-    '53.16',
-    '53.19sec',
-    '53.27',
-    '53.3&percnt',
-    '53.31',
-    '53.32',
-    '53.38sec',
-    '53.47',
-    '53.54',
-    '53.55',
-    '53.5m',
-    '53.637',
-    '53.70',
-    '53.74',
     '53.78pc',
-    '53.96',
-    '53/',
-    '53/1&ndash;2',
-    '53/12&ndash;3',
-    '53/447',
-    '53/447,123/517,148/542,154/548',
-    '53/5&ndash;1',
-    '53/631',
-    '53/79',
-    '530&ndash;520',
-    '530&ndash;533',
-    '530&ndash;70',
-    '530,050',
-    '530.2',
-    '530.20',
     '5300rpm',
-    '53040',
-    '53045',
-    '530478',
-    '5306',
-    '530bhp',
-    '530bp',
-    '530d&ndash;e',
-    '530f',
-    '530i',
-    '530i/540i',
-    '530lbs',
-    '530nm',
-    '531&ndash;4610',
-    '531,400',
-    '531,445',
     '5311',
-    '531b&ndash;d',
-    '531p',
-    '532&ndash;40',
-    '532&ndash;537',
-    '532&ndash;6',
-    '532&ndash;7',
-    '532,000,000',
-    '532,370',
-    '532-page',
-    '532.5',
-    '532044',
-    '5323',
-    '5325:1983',
-    '5327',
-    '53277',
     '5328',
-    '532crm721',
-    '533,000&ndash;666,000',
-    '5332',
-    '533223',
-    '533322',
-    '5335',
-    '5336',
-    '533mm',
-    '533rd',
-    '534&mdash;47',
-    '534&ndash;509',
-    '534,000',
-    '534,996',
-    '534.63&ndash;6',
-    '5340',
     '53400',
-    '534054',
-    '5342',
-    '53430',
-    '53443',
-    '5346',
-    '53461',
-    '5348',
-    '53490',
-    '534khz',
-    '535&ndash;537',
-    '535(2)',
-    '535.3',
-    '5350',
-    '53500',
-    '5350rpm',
     '53510',
-    '535174',
-    '5355',
-    '535596',
-    '5356',
-    '5357',
-    '5358',
-    '53580',
-    '535959',
-    '535cc',
-    '535hp',
-    '536&ndash;7',
-    '536/1584',
-    '536053&sol;23',
-    '53619/54492',
-    '53628&sol;53931',
     '53652',
-    '5366',
-    '5369',
-    '536b',
-    '536p',
-    '537&ndash;556',
-    '537&ndash;8',
-    '537,000',
-    '537.4%',
-    '5371',
-    '53720',
-    '537254',
-    '5374',
-    '5375',
-    '537681',
-    '5378',
     '5378/e',
-    '5379',
-    '538-code',
-    '53808',
-    '53809',
-    '5381',
-    '538333',
-    '53835',
-    '53844',
-    '5388',
-    '538p',
-    '539&ndash;554',
-    '539,000',
-    '539,410',
-    '539,690',
-    '539.1+621.039',
     '539.71',
-    '539.731',
-    '5391',
-    '5392',
-    '5393',
-    '539bc',
-    '539p',
-    '53:5',
-    '53c810',
-    '53cm',
-    '53e',
-    '53ff',
-    '53km',
-    '53mpg',
-    '53no',
-    '53pp',
     '53rd-floor',
-    '53s.',
-    '53sec',
-    '54&deg;f',
-    '54&deg;s',
-    '54&frac12;p',
-    '54&ft',
-    '54&ins',
-    '54&ins;.',
-    '54&mdash;5',
-    '54&mdash;57',
-    '54&ndash;1',
-    '54&ndash;114',
-    '54&ndash;157',
-    '54&ndash;21',
-    '54&ndash;3',
     '54&ndash;34%',
-    '54&ndash;41',
-    '54&ndash;46',
-    '54&ndash;55kg/hl',
-    '54&ndash;56&deg;c',
-    '54&ndash;60',
-    '54&ndash;68',
-    '54&ndash;72',
-    '54&percnt',
-    '54\'n',
-    '54(03)',
-    '54(13)',
-    '54(5)',
-    '54,000,000',
-    '54,037',
-    '54,054',
     '54,206',
-    '54,274',
-    '54,360',
-    '54,469,000',
-    '54,539',
-    '54,600',
-    '54,600,000',
-    '54,625,000',
-    '54,758',
-    '54,777,615',
-    '54,780,000',
-    '54,800',
-    '54,800,000',
-    '54,807,420',
-    '54,825.0',
-    '54,825.00km',
     '54,826',
-    '54,843',
-    '54,888,444',
-    '54-',
-    '54-1',
-    '54-16',
-    '54-3',
-    '54-56',
-    '54-57',
-    '54-cap',
-    '54-copy',
-    '54-mile',
-    '54-runs',
-    '54-slot',
-    '54-vehicle',
-    '54.04',
     '54.12',
-    '54.13',
-    '54.14',
-    '54.156',
-    '54.2%',
-    '54.21',
-    '54.30',
-    '54.33',
-    '54.37',
-    '54.4%',
-    '54.41',
-    '54.44',
-    '54.46sec',
-    '54.4pc',
-    '54.50p',
-    '54.55%',
     '54.5p',
-    '54.671',
-    '54.7%',
-    '54.7.2',
-    '54.786',
-    '54.804',
-    '54.86%',
-    '54.9%',
-    '54.97',
-    '54/250',
-    '540&ndash;1000',
-    '540&ndash;2',
-    '540&ndash;510',
-    '540&ndash;541',
-    '540&ndash;600kg',
-    '540&ndash;620kg',
     '540&ndash;650nm',
-    '540,000,000',
-    '540-km',
-    '540-metre',
-    '540-r',
-    '540-strong',
-    '5400m',
-    '5401',
-    '54043',
-    '540766',
-    '540959',
-    '540i',
-    '540kcals',
-    '540kg',
-    '540mm',
-    '540pto',
     '540sq',
-    '540x480',
-    '541&ndash;544',
-    '541-day',
-    '541.6',
-    '5410',
-    '54106',
-    '5411',
-    '541204',
-    '54128',
-    '54137',
-    '5415',
-    '54150',
-    '541du',
-    '541p',
-    '542,000',
     '542,300',
-    '542.2p',
-    '5422',
-    '54220',
-    '5423',
-    '5424',
-    '54260',
-    '542654',
-    '5427',
-    '542815',
-    '542b',
-    '542km',
-    '542nd',
-    '543&ndash;630',
-    '543,000',
-    '543-member',
     '543.8',
-    '543/69',
-    '5431',
-    '543250',
-    '5434',
-    '543500',
-    '54380',
-    '543fx',
-    '544&ndash;5',
-    '544,000',
-    '544-members',
-    '544.1mph',
-    '544.2m',
-    '544099',
-    '544699',
-    '544804',
     '5449',
-    '544pp.',
-    '545%',
-    '545,000',
-    '545,000,000',
-    '545-members',
-    '545-yard',
-    '545.00',
-    '545.7',
-    '5450',
-    '5454-4743',
-    '5454.5',
-    '545535',
-    '545kg',
-    '546&ndash;7',
-    '546,200',
     '5462',
-    '546398',
-    '546g',
-    '546mm',
-    '546p',
-    '547&mdash;55',
-    '547&ndash;1420',
-    '547&ndash;1764',
-    '547,000',
-    '547.6',
-    '5470',
-    '5471',
-    '5473',
-    '5477',
-    '54770',
-    '5478',
     '547e',
-    '548&ndash;53',
-    '548,502',
-    '548.25km',
-    '5480',
-    '548046',
-    '54853',
-    '548g',
-    '548p',
-    '548pp.',
-    '549&ndash;50',
-    '549.5',
-    '549/791',
-    '54909/512526',
-    '5497',
-    '549911',
     '549a',
-    '54:4',
-    '54b',
-    '54bc',
-    '54c',
-    '54e',
-    '54ff',
-    '54g',
-    '54kb',
-    '54km',
-    '54mpg',
-    '54mph',
-    '54o',
-    '54pa',
-    '54sec',
-    '55&deg;59',
     '55&deg;s',
-    '55&mdash;60&deg;s',
-    '55&mdash;84',
-    '55&ndash;110',
-    '55&ndash;117',
-    '55&ndash;20',
-    '55&ndash;3',
-    '55&ndash;43',
-    '55&ndash;44',
-    '55&ndash;45',
-    '55&ndash;59-year',
-    '55&ndash;60%',
-    '55&ndash;65myr',
-    '55&ndash;67',
-    '55&ndash;71%',
-    '55&ndash;75',
     '55&ndash;8',
-    '55&ndash;88',
-    '55\'s',
-    '55(2)',
-    '55(a)',
-    '55(i)',
-    '55+161',
-    '55,000,000',
-    '55,061',
-    '55,200',
-    '55,300',
-    '55,383',
-    '55,400',
-    '55,457',
-    '55,462',
-    '55,598',
     '55,600',
-    '55,65',
-    '55,681',
-    '55,700,000',
-    '55,800',
-    '55,868',
-    '55,873,000',
-    '55,893',
-    '55,896',
-    '55,900,000',
-    '55,937,000',
-    '55,946',
-    '55-3',
-    '55-47',
-    '55-57',
-    '55-59',
     '55-60',
-    '55-75',
-    '55-904',
-    '55-day',
-    '55-gallon',
-    '55-lb',
-    '55-mile-two-day',
-    '55-nation',
-    '55-over',
-    '55-overs',
-    '55-piece',
-    '55-plus',
-    '55-pluses',
-    '55-seat',
-    '55-seater',
-    '55-strong',
     '55-vote',
-    '55-yard',
-    '55.08',
-    '55.0p',
-    '55.1%',
-    '55.10',
-    '55.11',
-    '55.16',
-    '55.3%',
-    '55.42',
-    '55.44%',
-    '55.45',
-    '55.46',
-    '55.56',
-    '55.5mhz',
-    '55.64',
     '55.68',
-    '55.74',
-    '55.8&times;91.5cm',
-    '55.9',
-    '55.9x40.6',
-    '55/449',
-    '55/56',
-    '55/683',
-    '55/76',
-    '55/77',
-    '550%',
-    '550&ndash;554',
-    '550&ndash;600',
-    '550&ndash;750',
-    '550&ndash;8725',
-    '550,00',
     '550,181',
-    '550,310',
-    '550,734',
-    '550-',
-    '550-bp',
-    '550-mile',
-    '550-space',
-    '550-torr',
-    '550-uses',
-    '55000',
-    '55002',
-    '55003',
-    '5500s',
-    '5502',
-    '55032',
-    '550341',
     '5504',
-    '55040',
-    '550555',
-    '55057',
-    '550630',
-    '550bp',
-    '550cc',
-    '550ft',
-    '550g',
-    '550ha',
-    '550hp',
-    '550hz',
-    '550k',
-    '550kb',
-    '550kcals',
-    '550km',
     '550kw',
-    '550lb',
-    '550ml',
-    '550sq',
-    '550watt',
-    '551&ndash;479',
-    '551&ndash;74',
-    '551.3',
-    '551.509',
-    '551.577',
-    '551.578',
-    '551.579',
-    '551/2',
-    '5510',
-    '5511',
-    '55151',
     '552&ndash;601',
-    '552&ndash;61',
-    '552,000',
-    '552.0',
-    '552/1317',
-    '552/61t',
-    '552080',
-    '552099',
-    '5522',
-    '5525',
-    '55251',
-    '55267',
-    '55281',
-    '553-2700',
-    '553.8',
-    '5532',
     '5535.3400',
-    '55352',
-    '5536',
-    '553622',
-    '553b',
-    '554&frac12;p',
-    '554,000',
-    '554,000,000',
-    '554,015',
-    '5540',
-    '554060',
-    '5541',
-    '554144',
-    '5544',
-    '55440',
-    '55443',
     '5546',
-    '55476',
-    '554854',
-    '554988',
-    '554p',
-    '555&ndash;556',
-    '555&ndash;72',
-    '555&ndash;740',
-    '555\'s',
-    '555,000',
-    '555,1989',
-    '555,600',
-    '5550',
-    '55503/55523',
-    '5551',
-    '555100',
     '555120',
-    '555123',
-    '555545',
-    '55558',
-    '55562',
-    '555822',
-    '555aaaa',
-    '555m',
-    '556&ndash;3',
-    '556,000',
-    '5561',
-    '556107',
-    '5562618',
-    '556610',
-    '556962',
-    '557&ndash;559',
     '557,000',
-    '557291',
-    '557b',
-    '557c&ndash;f',
-    '558.2%',
-    '5580',
-    '5583&ndash;5584',
-    '5584&ndash;5586',
-    '5587',
-    '5589',
-    '559&ndash;60',
-    '559-568',
-    '5590',
-    '559404',
-    '5595',
-    '55970',
     '55972',
-    '55982',
-    '559855',
-    '559922',
-    '559944',
-    '55:24',
-    '55:8',
-    '55a',
-    '55b',
-    '55bc',
-    '55cm',
-    '55f&deg',
-    '55ff.',
-    '55in',
-    '55k',
-    '55kg/n/ha',
     '55lb',
-    '55lbs',
-    '55m/60yds',
-    '55mpg',
-    '55mscfd',
-    '55no',
-    '55o',
-    '55p-72',
-    '55sgi6007.15.5',
-    '55x',
-    '55year-old',
-    '56&deg;f',
-    '56&ft',
-    '56&ndash;120',
-    '56&ndash;17',
-    '56&ndash;37',
     '56&ndash;43',
-    '56&ndash;58',
-    '56&ndash;59',
-    '56&ndash;6',
-    '56&ndash;64',
-    '56&ndash;65',
-    '56&ndash;66',
-    '56&ndash;68',
-    '56&ndash;78%',
-    '56&ndash;82%',
-    '56&ndash;93',
-    '56&percnt',
-    '56(2)',
-    '56,219',
-    '56,300',
-    '56,500',
     '56,653',
-    '56,700',
-    '56,795',
-    '56,826',
-    '56,837',
-    '56,884',
-    '56-13',
-    '56-43050',
-    '56-56',
-    '56-58',
-    '56-60',
-    '56-78',
-    '56-974',
-    '56-acre',
-    '56-b2930',
-    '56-day',
     '56-input',
-    '56-mile',
-    '56-minute',
-    '56-seat',
-    '56-secon',
-    '56-shot',
-    '56.04m',
-    '56.11%',
-    '56.14',
-    '56.2&deg;c.',
-    '56.25',
-    '56.3%',
-    '56.41',
-    '56.41.',
-    '56.46',
-    '56.46.',
     '56.49',
-    '56.4p',
-    '56.53',
-    '56.6',
-    '56.67',
-    '56.87',
-    '56.91',
-    '56/1984',
-    '56/60',
-    '56/65',
-    '56/ni',
-    '560,026',
-    '560,500',
-    '560,875',
-    '560-kilometre',
-    '560-km',
     '560.87',
-    '56000',
-    '5600lbs',
-    '5600m',
-    '5600rpm',
-    '56014',
-    '56015',
-    '560178',
-    '56030',
-    '56041',
-    '560423',
-    '56070',
-    '56071',
-    '560777',
-    '560794',
-    '560c&ndash;e',
     '560g',
-    '560mbps',
-    '560mph',
-    '560mv',
-    '560myr',
-    '560pp.',
-    '561&mdash;7',
-    '561&mdash;75',
-    '561&mdash;84',
-    '561&mdash;92',
-    '561&ndash;1048',
-    '561&ndash;2',
-    '561&ndash;87',
-    '561,800',
-    '561.7%',
-    '561/2',
     '5610',
-    '561066',
-    '5611',
-    '561180',
-    '5612',
-    '5614',
-    '5615',
-    '561545',
-    '5616',
-    '5617',
-    '5619',
-    '56210',
-    '5621m',
-    '5622',
-    '56220',
-    '56240',
     '562633',
-    '56283',
-    '562mw',
-    '562p',
-    '563&ndash;571',
-    '563&ndash;6',
-    '563.4',
-    '56321',
-    '5633',
-    '5634',
-    '5637\'s',
-    '563890',
-    '5639',
-    '563b&ndash;e',
-    '563h',
-    '563km/350mls',
     '563m',
-    '563p',
-    '564,000,000',
-    '564,100',
-    '564,655',
-    '564,739',
-    '564.5m',
-    '56400',
-    '564084',
-    '5642',
-    '5643052',
-    '5644',
-    '56480',
-    '564f',
-    '565%',
-    '565&deg',
     '565&ndash;566',
-    '565&ndash;578',
-    '565,000',
-    '565-km',
-    '56510',
-    '5652',
-    '5654',
-    '565656',
-    '565953',
-    '565bc',
-    '566,994',
-    '566.2%',
-    '566.7%',
-    '566262',
-    '56679',
-    '56690',
     '566b',
-    '566b&ndash;c',
-    '567-yard',
-    '567/73',
-    '567123',
-    '56720',
-    '567595',
-    '5676',
-    '56777',
-    '5678',
-    '567k',
-    '567p',
-    '568&ndash;9',
-    '568&plus;3',
-    '568,000',
-    '568,474',
     '5683',
-    '5683/4',
-    '56830',
-    '568664',
-    '568b',
-    '568ml',
-    '568p',
-    '569,259',
-    '569-yard',
-    '5690',
-    '5694',
-    '5695',
-    '5696',
-    '5696-7146',
-    '569652',
-    '56:18',
     '56:22',
-    '56:25',
-    '56:7',
-    '56a',
-    '56b&ndash;c',
-    '56c',
-    '56cm',
-    '56cm&times;76cm',
-    '56e',
-    '56ff.',
-    '56g',
-    '56in',
-    '56kb',
-    '56kbps',
-    '56kg',
-    '56lb',
     '56per',
-    '56s.',
-    '56secs',
-    '57%.',
-    '57&deg;c',
-    '57&deg;c/km',
-    '57&deg;f',
-    '57&mdash;9',
-    '57&middot;3',
-    '57&ndash;0',
-    '57&ndash;1',
-    '57&ndash;3',
-    '57&ndash;33',
-    '57&ndash;58',
-    '57&ndash;58:diagram/figure',
-    '57&ndash;60',
     '57&ndash;62',
-    '57&ndash;621',
-    '57&ndash;68',
-    '57&ndash;71',
-    '57&ndash;82',
-    '57&ndash;87',
-    '57&ndash;ball',
-    '57\'',
-    '57(78%)',
-    '57**',
-    '57,000-strong',
-    '57,019,000',
-    '57,065,000',
-    '57,100,000',
-    '57,170',
-    '57,200,000',
     '57,300',
-    '57,379',
-    '57,403',
-    '57,470,000',
-    '57,500',
-    '57,500,000',
-    '57,649',
-    '57,684',
-    '57,700',
-    '57,800',
-    '57,900',
-    '57-10',
-    '57-37',
-    '57-ball',
-    '57-megaton',
-    '57-run',
     '57-seat',
-    '57-years-old',
-    '57.00m',
-    '57.01',
-    '57.08',
-    '57.1',
-    '57.1&ndash;10',
-    '57.15',
-    '57.18',
-    '57.19',
-    '57.1kg',
-    '57.2m',
-    '57.30',
-    '57.4&deg;c',
-    '57.40',
-    '57.41',
     '57.4p',
-    '57.50m',
-    '57.55',
-    '57.5kw',
-    '57.62sec',
-    '57.63%',
-    '57.74',
-    '57.8%',
-    '57.84%',
-    '57.88',
-    '57.95%',
-    '57/015',
-    '57/539',
-    '570&ndash;526',
-    '570&ndash;572',
-    '570\'s',
     '570-acre',
-    '57000',
-    '5701',
-    '5705',
-    '570600',
-    '5709',
-    '570983',
-    '570k',
-    '570m',
-    '571.',
-    '571.2',
-    '571.3',
-    '571.5',
-    '571.6',
-    '571.9',
-    '5711',
     '57120',
-    '571228',
-    '571611',
-    '5717',
-    '57180',
-    '571818',
-    '5719',
-    '572,000',
-    '572.2',
-    '572.8',
-    '5721.11',
-    '5723',
-    '5724',
-    '5725',
-    '5728',
-    '572:608',
     '572p',
-    '572pp',
-    '573,604',
-    '573,810',
-    '573.9',
-    '573/102',
-    '57300',
-    '57310',
-    '5733',
-    '57350',
-    '573560',
-    '573653',
-    '573725',
-    '5738',
-    '573882',
-    '573rd',
     '574,000',
-    '574255',
-    '57435',
-    '574548',
-    '57461',
-    '5748',
-    '57482',
-    '574995',
-    '574ff.',
-    '575&ndash;600',
-    '575,800',
-    '575/388',
-    '5750/i.s.o.',
-    '57510',
-    '575237',
-    '5755',
     '5755/5756/5739',
-    '575618',
-    '57590',
-    '575c&ndash;g',
-    '575e',
-    '575g/1&frac14;lb',
-    '575p',
-    '576&ndash;578',
-    '576,000',
-    '576,555',
-    '576-mile',
-    '5763',
-    '57645',
-    '5768',
-    '576920',
-    '576a&ndash;c',
     '577&ndash;590',
-    '577-member',
-    '577.38',
-    '577.8%',
-    '5770',
-    '577000',
-    '5773',
-    '5774',
-    '57740',
-    '5775',
-    '57755',
-    '57773',
-    '5779',
-    '577c&ndash;d',
-    '5786',
-    '579&ndash;580',
     '579,000',
-    '579,380',
-    '579-2424',
-    '5791',
-    '579110',
-    '579226',
-    '5793',
-    '579313',
-    '579e',
-    '579p',
-    '579th-ranked',
-    '57:32',
-    '57:42',
-    '57c',
-    '57iii504',
-    '57k',
     '57km',
-    '57no',
-    '57s',
-    '57s.',
-    '57th-minute',
-    '57x68&ins',
-    '58&amp;c',
-    '58&deg&ndash;60&deg;f',
-    '58&deg&ndash;70&deg;f',
-    '58&deg;f',
-    '58&ft',
-    '58&mdash;61',
-    '58&mdash;85',
-    '58&mdash;9',
-    '58&middot;4',
-    '58&middot;9',
     '58&ndash;0',
-    '58&ndash;233',
-    '58&ndash;24',
-    '58&ndash;240',
-    '58&ndash;25',
-    '58&ndash;291',
-    '58&ndash;32',
-    '58&ndash;37',
-    '58&ndash;42',
-    '58&ndash;46.',
-    '58&ndash;52',
-    '58&ndash;58',
-    '58&ndash;60',
-    '58&ndash;61',
-    '58&ndash;65',
-    '58&ndash;66',
     '58&ndash;838',
-    '58&sol;154',
-    '58&times;10/l',
-    '58\'s',
-    '58(2)',
-    '58(3)',
-    '58,000,000',
-    '58,160',
-    '58,497',
-    '58,533',
-    '58,592',
-    '58,991',
-    '58-0',
-    '58-3',
-    '58-53',
-    '58-acre',
     '58-fight',
-    '58-footer',
-    '58-inch',
-    '58-member',
-    '58-minute',
-    '58-page',
-    '58.0',
-    '58.00.',
-    '58.024.5gm',
-    '58.04',
-    '58.09',
-    '58.09.',
-    '58.1%',
-    '58.14',
-    '58.1x47.5',
-    '58.2',
     '58.25',
-    '58.42',
-    '58.4pc',
-    '58.55',
-    '58.6%',
-    '58.62',
-    '58.64',
-    '58.64-day',
-    '58.67',
-    '58.6sec',
-    '58.85%',
-    '58.9%',
-    '58/120',
-    '58/198',
-    '58/636',
-    '58/78',
     '58/898',
-    '580&deg;c',
-    '580&ndash;560myr',
-    '580&ndash;8197',
-    '580,000,000',
-    '580,297',
-    '580/340',
-    '580/l',
-    '5800m',
-    '5801',
-    '580100',
-    '58016',
-    '58017',
-    '58018',
-    '5801s3',
-    '58020',
     '58026',
-    '580405',
-    '5808',
-    '58081',
-    '580880',
-    '580a',
-    '580ft',
-    '580k',
-    '580kcals',
-    '581&ndash;584',
-    '581,000',
-    '581,069',
-    '5810',
-    '58110',
-    '5812005',
-    '58140',
     '581404',
-    '58154',
-    '5817m',
-    '581983',
-    '581b',
-    '581f&ndash;g',
-    '582,262',
-    '582.00',
-    '5820',
-    '5822',
-    '58260',
-    '5828',
-    '5829139',
-    '582a',
-    '582e',
-    '582kbytes',
     '583,647',
-    '583-strong',
-    '583.92',
-    '5830',
-    '583064',
-    '5831',
-    '5833',
-    '5835',
-    '58359',
-    '583619',
-    '5839',
-    '583928',
-    '583m',
-    '584&ndash;585',
-    '584&ndash;971',
-    '584,000',
     '584/5',
-    '5840ft/1780m',
-    '584380',
-    '584620',
-    '585,383',
-    '585-91',
-    '585/757',
-    '5850',
-    '5851/3',
-    '58510',
-    '58540',
-    '58551',
-    '5856',
-    '585820',
-    '585858',
-    '5859',
     '585mm',
-    '586&divide;2',
-    '586&ndash;1077',
-    '586&ndash;588',
-    '586,018',
-    '586,412',
-    '58610',
-    '5869451',
-    '587&ndash;3304',
-    '5870',
-    '587773',
-    '5878',
-    '587863',
-    '588&ndash;663',
-    '588,000',
-    '588.73',
     '588.8k',
-    '588.99',
-    '5880',
-    '58815',
-    '5882',
-    '588305',
-    '5888',
-    '588b&ndash;h',
-    '588cc',
-    '588y',
-    '589&ndash;590',
-    '589,000',
-    '589-seat',
-    '589.5',
-    '589.5&deg;c',
-    '5890a',
     '5893-5873',
-    '5894-5914',
-    '5895',
-    '5896',
-    '5897',
-    '58980',
-    '589b&ndash;f',
-    '589ff',
-    '58:28',
-    '58:42',
-    '58a&ndash;b',
-    '58c',
-    '58f',
-    '58ff',
-    '58k',
-    '58km',
     '58lb',
-    '58mpg',
-    '58sec',
-    '59&frac12;p',
-    '59&ndash;12',
-    '59&ndash;14&ndash;0',
-    '59&ndash;2',
-    '59&ndash;55',
-    '59&ndash;61',
-    '59&ndash;62',
-    '59&ndash;64',
-    '59&ndash;65',
-    '59&ndash;68&deg;f',
-    '59&ndash;70',
-    '59&ndash;73',
-    '59&ndash;79',
     '59&times;10',
-    '59,150',
-    '59,300',
-    '59,336',
-    '59,400',
-    '59,500',
-    '59,60',
-    '59,686,000',
-    '59,690',
-    '59,745',
-    '59,962',
-    '59-51',
-    '59-day',
-    '59-ft',
-    '59-match',
-    '59-minute',
     '59.0k',
-    '59.14m',
-    '59.18',
-    '59.24',
-    '59.2f',
-    '59.3%',
-    '59.33',
-    '59.35',
-    '59.4%',
-    '59.40',
-    '59.42',
-    '59.5%',
-    '59.542',
-    '59.5p',
-    '59.6',
-    '59.86',
     '59.90',
-    '59.94',
-    '59.99',
-    '59/1536',
-    '59/57th',
-    '59/618',
-    '59/637,110/688,116/694',
-    '590&ndash;2',
-    '590/l',
-    '59000',
-    '59001',
-    '59004',
-    '5900s',
-    '5903',
-    '590323',
-    '590650',
     '590682',
-    '5907',
-    '5909',
-    '590cm.',
-    '590mm',
-    '590p&ndash;600p',
-    '590p.',
-    '590s',
-    '591%',
-    '591&ndash;2',
-    '591&ndash;592',
-    '591&ndash;593',
-    '591(285)',
-    '591.8%',
-    '591/l',
-    '5911',
     '59120',
-    '59190',
-    '591pp.',
-    '592,000',
-    '5922',
-    '59240',
-    '5925',
-    '59250',
-    '59260',
-    '592a&ndash;c',
-    '592p',
-    '592pp.',
-    '592y',
-    '593&ndash;599',
-    '593,000',
-    '593,000,000',
     '593-member',
-    '593000',
-    '593024',
-    '593111',
-    '5932',
-    '593601',
-    '59370',
-    '594&mdash;6',
-    '594&ndash;597',
-    '594,857',
-    '594/804',
-    '59400',
-    '59410',
-    '594914',
-    '594cc',
-    '594mm',
     '594p',
-    '595&ndash;6',
-    '595&ndash;625',
-    '595/91',
-    '59528',
-    '5954',
-    '595613',
-    '5957',
-    '5958',
-    '595904',
-    '595ft',
-    '595km',
-    '595p',
-    '595th',
-    '596&mdash;612',
-    '596&mdash;613',
     '596.5p',
-    '59640',
-    '59680',
-    '596:570=52%:48%',
-    '597,000',
-    '597,258',
-    '5970',
-    '59700',
-    '597000',
-    '5973',
-    '59740',
-    '597636',
-    '597826',
-    '597p',
-    '598&ndash;601',
-    '598&ndash;602',
     '59840',
-    '59880',
-    '5990-1400',
-    '5990-1400as',
-    '599443',
-    '5995',
-    '5995a',
-    '5995s',
-    '59970',
-    '5998',
-    '599909',
-    '599922',
-    '599a&ndash;c',
-    '599kms',
-    '59a',
-    '59b',
     '59c',
-    '59f',
-    '59f&ndash;g',
-    '59f.',
-    '59g',
-    '59km',
-    '59m',
-    '59min',
-    '59mjy',
-    '5:08.7',
-    '5:1&ndash;11',
-    '5:1&ndash;15',
-    '5:1&ndash;21',
-    '5:1&ndash;7',
-    '5:10&ndash;16',
-    '5:10ff',
     '5:11',
-    '5:12ff',
-    '5:13&ndash;14',
-    '5:13.4',
-    '5:14&ndash;15',
-    '5:14&ndash;6:7',
-    '5:15&ndash;19',
-    '5:15ff',
-    '5:16&ndash;21',
-    '5:18&ndash;26',
-    '5:1:4',
-    '5:1ff',
-    '5:2&ndash;5',
-    '5:22&ndash;6:9',
-    '5:24',
-    '5:25&mdash;34',
     '5:25&ndash;33',
-    '5:29',
-    '5:29:59',
-    '5:3&ndash;4',
-    '5:3,4',
-    '5:30pm',
-    '5:33',
-    '5:40',
-    '5:43',
-    '5:43,16:28',
-    '5:45pm',
-    '5:5,7',
-    '5:50:945',
-    '5:6',
-    '5:7',
-    '5=&amp;50',
     '5=2',
-    '5=excellent',
-    '5=nearly',
-    '5a.17',
-    '5a.4',
-    '5a.7',
-    '5aa',
-    '5aaa',
-    '5acc',
-    '5af.',
-    '5ag',
-    '5ah',
-    '5ap',
-    '5asa-containing',
-    '5aw',
-    '5ax',
     '5b-11a',
-    '5ba',
-    '5bd',
-    '5bg',
-    '5bh',
-    '5bq',
-    '5bx',
-    '5bz',
-    '5c+/6a',
-    '5c6',
-    '5cm-(2inches)',
-    '5cm/2&frac12;in',
-    '5cm/2&ins',
-    '5cu',
-    '5cv',
-    '5cwt',
     '5cwt/acre',
-    '5dd',
-    '5dddddddddddddd6',
-    '5de',
-    '5deg',
-    '5dk',
-    '5dl',
-    '5dm',
-    '5dn',
-    '5ds',
-    '5dz',
-    '5e-16e',
-    '5ea',
-    '5eb',
-    '5el',
-    '5eq',
     '5er.',
-    '5ess-200',
-    '5fa',
-    '5fe',
-    '5fh',
-    '5ft2in',
-    '5ft4in',
-    '5ft8in',
-    '5gals',
-    '5gbps',
-    '5gdc',
-    '5gm',
-    '5hb.',
-    '5hiaa',
-    '5hj',
-    '5hn',
     '5ht-like',
-    '5htid',
-    '5hz',
-    '5i',
-    '5inging',
-    '5ins.',
-    '5ive',
-    '5jd',
-    '5je',
-    '5jj',
-    '5jp',
-    '5jx13',
-    '5jy',
-    '5kb',
-    '5kcal',
-    '5kg/11lb',
     '5kjmol',
-    '5km.',
-    '5kv/div',
-    '5kw',
-    '5la',
-    '5lb&frac12;oz',
-    '5le',
-    '5li',
-    '5lr',
-    '5lw',
-    '5m(16ft)',
-    '5m-high',
-    '5m2',
-    '5mbps',
-    '5meg',
-    '5mg',
     '5mg/kg',
-    '5mhz',
-    '5million',
-    '5ml/1tsp',
-    '5mm/&frac14;inch',
-    '5mpa',
-    '5ms',
-    '5mv',
-    '5n',
-    '5ne',
-    '5nf',
-    '5ng/&micro;l',
-    '5np',
-    '5nq',
-    '5nw',
-    '5oc',
     '5ocm',
-    '5omm',
-    '5ooo',
-    '5oth',
-    '5p.m',
-    '5p.m.',
-    '5p4f',
-    '5pf',
-    '5ph',
-    '5pm&ndash;9.30pm',
-    '5pm.the',
-    '5pn',
-    '5pp',
-    '5pr',
-    '5ps',
-    '5q.21',
     '5q31',
-    '5qa',
-    '5qd',
-    '5qp',
-    '5qs',
-    '5rb',
-    '5rd',
-    '5re',
-    '5realisation',
-    '5rf',
-    '5s-genes',
-    '5s.3d.',
-    '5sd',
-    '5sh',
-    '5shillings',
-    '5sz',
     '5t-taf',
-    '5td',
-    '5th-8th',
-    '5th-century',
-    '5th.',
-    '5ts',
-    '5tsp',
-    '5tw',
-    '5tx',
-    '5tz',
-    '5ug',
-    '5ul',
-    '5x+10y+20z=45',
-    '5x12&middot;5cm',
-    '5x15cm',
-    '5x2',
     '5x20cm',
-    '5x9inch',
-    '5xf6',
-    '5xl',
-    '5xsspe',
-    '5y',
-    '5yy',
-    '5yz',
-    '6%&ndash;55%',
-    '6%-7%',
-    '6%.',
-    '6%/0.97=6.19%',
-    '6&amp;1/4%',
-    '6&amp;7',
-    '6&deg;s',
-    '6&frac12&ndash;2&frac12',
     '6&frac12&ndash;7',
-    '6&frac12&times;10&frac14&ins',
-    '6&frac12;-mile',
-    '6&frac12;d.',
-    '6&frac12;days',
-    '6&frac12;in',
-    '6&frac12;ins.',
-    '6&frac12;lbs',
-    '6&frac12;oz',
-    '6&frac12;p',
-    '6&frac14;p',
-    '6&frac34',
-    '6&frac34&times;10&frac14&ins',
-    '6&frac34;d',
-    '6&frac58',
-    '6&ft&ndash;15&ft',
     '6&ft&times;2&ft&times;2&ft',
-    '6&ft;6&ins',
-    '6&ft;x',
-    '6&ft;x6&ft',
-    '6&ft;x8&ft;x3&ft',
-    '6&gt;8&gt;4',
-    '6&half;x10x3in',
-    '6&ins/2&ft',
-    '6&ins;to',
-    '6&mdash;12',
-    '6&mdash;7',
-    '6&mdash;8',
-    '6&mdash;see',
-    '6&middot;29',
-    '6&middot;5',
-    '6&middot;5x10cm',
     '6&ndash',
-    '6&ndash&frac12',
-    '6&ndash;0&ndash;0',
-    '6&ndash;0&ndash;18&ndash;0',
-    '6&ndash;0&ndash;26&ndash;0',
-    '6&ndash;0,6&ndash;0',
-    '6&ndash;00',
-    '6&ndash;05',
-    '6&ndash;06',
-    '6&ndash;1,6&ndash;2',
-    '6&ndash;1/2',
-    '6&ndash;1/2lb',
-    '6&ndash;10%',
-    '6&ndash;10&deg',
-    '6&ndash;10,000',
-    '6&ndash;107',
     '6&ndash;10ft',
-    '6&ndash;10pm',
-    '6&ndash;10s',
-    '6&ndash;113',
-    '6&ndash;12&ndash;2',
-    '6&ndash;12g',
-    '6&ndash;12mgml',
-    '6&ndash;12mm',
-    '6&ndash;13&ndash;0',
-    '6&ndash;13&ndash;8',
-    '6&ndash;14-year-olds',
-    '6&ndash;19',
-    '6&ndash;19&ndash;1',
-    '6&ndash;2&ndash;0',
-    '6&ndash;2,5&ndash;7',
-    '6&ndash;2-',
     '6&ndash;219',
-    '6&ndash;2237',
-    '6&ndash;224',
-    '6&ndash;28',
-    '6&ndash;29',
-    '6&ndash;33',
-    '6&ndash;331',
-    '6&ndash;34',
-    '6&ndash;349',
-    '6&ndash;35',
-    '6&ndash;358',
-    '6&ndash;36',
-    '6&ndash;37',
-    '6&ndash;37&ndash;19',
-    '6&ndash;38',
-    '6&ndash;390',
     '6&ndash;4&ndash;12',
-    '6&ndash;4.',
-    '6&ndash;43',
-    '6&ndash;45',
-    '6&ndash;45pm',
-    '6&ndash;47',
-    '6&ndash;48',
-    '6&ndash;50',
-    '6&ndash;59',
-    '6&ndash;6&ndash;0',
-    '6&ndash;6&ndash;8',
-    '6&ndash;6.6',
-    '6&ndash;6.8',
-    '6&ndash;62',
-    '6&ndash;63',
-    '6&ndash;64',
     '6&ndash;7&deg;c',
-    '6&ndash;7&frac12;cms',
-    '6&ndash;7.30',
-    '6&ndash;700,000',
-    '6&ndash;76',
-    '6&ndash;7g',
-    '6&ndash;7pm',
-    '6&ndash;8&ndash;1880',
-    '6&ndash;8000',
-    '6&ndash;8s',
-    '6&ndash;9/4/41',
-    '6&ndash;90',
-    '6&ndash;91.',
-    '6&ndash;93',
-    '6&ndash;9:17',
-    '6&ndash;9ft/1.8&ndash;2.7m',
     '6&ndash;overs',
-    '6&percnt',
-    '6&plus;1',
-    '6&plus;3',
-    '6&prime;14&prime',
-    '6&prime;30&prime',
-    '6&prime;54&prime',
-    '6&shilling;0d.',
-    '6&shilling;8',
-    '6&times',
-    '6&times;10',
-    '6&times;2ft',
-    '6&times;4',
-    '6&times;5',
-    '6&times;7&frac34&ins',
-    '6&times;8&ins',
     '6\'09',
-    '6\'6',
-    '6(12)',
-    '6(6&ndash;7)',
-    '6(a)',
-    '6(d).',
-    '6*',
-    '6*109',
-    '6*3*1*4',
-    '6*5*4*3*2*1',
-    '6,000&ndash;6,500',
-    '6,000&ndash;7,000',
-    '6,000&rehy;feet',
-    '6,000&rehy;strong',
-    '6,000,000-8,000,000',
-    '6,000-10,000',
     '6,000-7,000',
-    '6,000-8,000',
-    '6,000-9,000',
-    '6,000-acre',
-    '6,000-pound',
-    '6,000-tonne',
-    '6,000-warhead',
-    '6,000cc',
-    '6,000fr',
-    '6,000gns',
-    '6,000hp-plus',
-    '6,000m',
-    '6,000rpm',
-    '6,00pm',
-    '6,020',
-    '6,034',
     '6,042',
-    '6,047',
-    '6,048',
-    '6,050',
-    '6,066',
-    '6,080,000',
-    '6,089,000',
-    '6,094yard',
-    '6,097',
-    '6,10',
-    '6,111',
-    '6,114',
-    '6,12,15',
-    '6,129',
-    '6,130',
-    '6,136',
     '6,148',
-    '6,149',
-    '6,15,18',
-    '6,150',
-    '6,153',
-    '6,16',
-    '6,160',
-    '6,160,000',
-    '6,169',
-    '6,199',
-    '6,2,4',
-    '6,200-metre',
-    '6,211',
-    '6,211,007',
-    '6,214.5',
-    '6,215',
     '6,219',
-    '6,220kg',
-    '6,223',
-    '6,228,298.1',
-    '6,241',
-    '6,247-yard',
-    '6,254,000',
-    '6,260',
-    '6,275kg',
-    '6,278',
-    '6,279',
-    '6,298',
-    '6,299',
-    '6,3',
-    '6,304',
-    '6,304km',
     '6,314',
-    '6,320',
-    '6,323',
-    '6,333',
-    '6,336',
-    '6,347',
-    '6,349',
-    '6,352',
-    '6,356',
-    '6,359',
-    '6,368',
-    '6,373',
-    '6,380',
-    '6,387',
-    '6,389ft',
-    '6,400m/',
     '6,404',
-    '6,409',
-    '6,440kg',
-    '6,445-yard',
-    '6,447ft',
-    '6,450',
-    '6,458',
-    '6,464',
-    '6,467',
-    '6,471',
-    '6,489',
-    '6,499',
-    '6,50',
-    '6,500&ft',
-    '6,500-pound',
-    '6,500-strong',
     '6,500ft',
-    '6,500rpm',
-    '6,517',
-    '6,523',
-    '6,530',
-    '6,543',
-    '6,549',
-    '6,560',
-    '6,569,889',
-    '6,575.34',
-    '6,580',
-    '6,584',
-    '6,589.07',
-    '6,592,441',
-    '6,5oo',
-    '6,6',
     '6,6&percnt',
-    '6,600,000(1990)',
-    '6,600-word',
-    '6,606',
-    '6,617',
-    '6,621',
-    '6,624',
-    '6,626',
-    '6,631',
-    '6,641,000',
-    '6,643',
-    '6,650',
-    '6,652',
-    '6,657',
-    '6,657,000',
-    '6,658,422',
     '6,660-yard',
-    '6,661,855',
-    '6,666',
-    '6,673',
-    '6,673,000',
-    '6,681',
-    '6,7,8',
-    '6,7,8,15,28&ndash;29',
-    '6,7,8,9',
-    '6,700,000',
-    '6,700-vote',
-    '6,700kg',
-    '6,705',
-    '6,713-delegate',
-    '6,715',
-    '6,718',
     '6,722',
-    '6,730,935',
-    '6,733',
-    '6,737',
-    '6,737,215',
-    '6,744-acre',
-    '6,747',
-    '6,750',
-    '6,750cc',
-    '6,759,860',
-    '6,776',
-    '6,780',
-    '6,784',
-    '6,786',
-    '6,796',
-    '6,8',
     '6,81',
-    '6,810,000',
-    '6,823',
-    '6,830',
-    '6,838,033',
-    '6,840',
-    '6,840,000',
-    '6,850',
-    '6,859,000',
-    '6,860-name',
-    '6,873',
-    '6,893,000',
-    '6,895,963',
-    '6,9',
-    '6,900,000',
-    '6,917,000',
     '6,921',
-    '6,925',
-    '6,928',
-    '6,929km',
-    '6,939',
-    '6,940',
-    '6,952',
-    '6,954ft',
-    '6,959,276',
-    '6,976,620',
-    '6-0-42-0',
-    '6-0-6',
-    '6-0.',
-    '6-10pm',
-    '6-16',
-    '6-18',
     '6-20',
-    '6-21',
-    '6-27',
-    '6-29',
-    '6-3-93',
-    '6-33',
-    '6-7-foot',
-    '6-7pm',
-    '6-8th',
-    '6-9-6-7',
-    '6-9-year-old',
-    '6-9pm',
-    '6-amino',
-    '6-australia',
-    '6-billingham',
-    '6-cum-paul',
     '6-cyano-7-nitroquinoxaline-2,3-dione',
-    '6-days',
-    '6-diamidino-2-phenylindole',
-    '6-glucuronides',
-    '6-handicap',
-    '6-his',
-    '6-hz',
-    '6-inch-long',
-    '6-into-1',
-    '6-kb',
-    '6-methylpurine',
-    '6-mile',
-    '6-monthly',
-    '6-o',
-    '6-part',
-    '6-piece',
     '6-point',
-    '6-pounders',
-    '6-run',
-    '6-telford',
-    '6-tetrachlorodibenzo-p-dioxin',
-    '6-to-8',
-    '6-tuple',
-    '6-up',
-    '6-valve',
-    '6-watt',
-    '6-way',
-    '6-wheeled',
-    '6-year-olds',
-    '6.0&ndash;6.3',
-    '6.0&ndash;6.8',
-    '6.0.2',
     '6.0.36',
-    '6.0.4',
-    '6.0.5',
-    '6.0.6',
-    '6.00%',
-    '6.00&ndash',
-    '6.00&ndash;18.00',
-    '6.00&ndash;9.15',
-    '6.01%',
-    '6.03%',
-    '6.05am',
-    '6.096',
-    '6.0hours',
-    '6.0kb',
-    '6.0p',
-    '6.1&mdash;6.3',
     '6.1&ndash;2',
-    '6.1&ndash;6.3',
-    '6.1.0',
-    '6.1.7',
-    '6.10(4)',
-    '6.10(5)',
-    '6.10-petition',
-    '6.10.1',
-    '6.10.2',
-    '6.10.91',
-    '6.102&mdash;3.214&mdash;2',
-    '6.107',
-    '6.108',
-    '6.109',
-    '6.10am',
-    '6.11(2)',
     '6.11(4)',
-    '6.11(5)',
-    '6.11(8)',
-    '6.11(8).',
-    '6.11.1',
-    '6.112(1)',
-    '6.112(2)',
-    '6.113(2)',
-    '6.113(3)',
-    '6.114',
-    '6.116',
-    '6.118',
-    '6.119',
-    '6.11p',
-    '6.12(a)',
-    '6.12(b)',
     '6.12.0',
-    '6.120(2)',
-    '6.120(4)',
-    '6.120(5)',
-    '6.125%',
-    '6.126',
-    '6.126(3)',
-    '6.126(4)',
-    '6.127(3)',
-    '6.127(7)',
-    '6.128',
-    '6.129(3)',
-    '6.13(b)',
-    '6.13(o)',
-    '6.13.0',
-    '6.130',
     '6.133',
-    '6.138(3)',
-    '6.14.9',
-    '6.144mbps',
-    '6.148(1)',
-    '6.15(a)',
-    '6.150(3)',
-    '6.151',
-    '6.151(3)',
-    '6.152(1)',
-    '6.152(2)',
-    '6.153(1)',
-    '6.153(2)',
-    '6.154',
-    '6.155',
-    '6.156(2)',
     '6.157',
-    '6.158',
-    '6.159',
-    '6.15p',
-    '6.16(a)',
-    '6.16(b)',
-    '6.160',
-    '6.162(1)',
-    '6.162(3)',
-    '6.162(4)',
-    '6.163',
-    '6.164',
-    '6.165(2)',
-    '6.165(3)',
-    '6.16a',
-    '6.172',
     '6.173&ndash;77',
-    '6.175',
-    '6.17a',
-    '6.17b',
-    '6.18(1)',
-    '6.18(2)',
-    '6.18a',
-    '6.18b',
-    '6.19&ndash;21',
-    '6.191',
-    '6.194',
-    '6.1k',
-    '6.1m',
-    '6.1pc',
-    '6.1secs',
-    '6.1x10',
     '6.2&ndash;24',
-    '6.2&ndash;6.4',
-    '6.2&ndash;6.7',
-    '6.2&ndash;63.8',
-    '6.2&ndash;7.5',
-    '6.2(c)',
-    '6.2-debt',
-    '6.2-hour',
-    '6.2.12',
-    '6.2.3(b)',
-    '6.2.3.2',
-    '6.2.3.4',
-    '6.2.3.5',
-    '6.2.3.6',
-    '6.2.4.1',
-    '6.2.4.2',
     '6.2.7',
-    '6.2/1000',
-    '6.20%',
-    '6.20&ndash;7.40',
-    '6.206',
-    '6.206(4)',
-    '6.207(2)',
-    '6.207(3)',
-    '6.207(4)',
-    '6.208',
-    '6.209',
-    '6.21,22',
-    '6.21.4',
-    '6.211(3)',
-    '6.211(4)',
-    '6.212',
     '6.213(1)',
-    '6.220',
-    '6.221',
-    '6.224',
-    '6.22c',
-    '6.22e',
-    '6.22p',
-    '6.23(4)',
-    '6.230',
-    '6.236',
-    '6.23p',
-    '6.24a',
-    '6.24b',
-    '6.25&ndash;9.10',
-    '6.25&times;10',
-    '6.25(1)',
     '6.25(2)',
-    '6.25(3)',
-    '6.25.2',
-    '6.25/ha',
-    '6.25am',
-    '6.25m',
-    '6.26(c)',
-    '6.26am',
-    '6.27&ndash;42',
-    '6.275%',
-    '6.27b',
-    '6.2a',
-    '6.2bn',
-    '6.2lb',
-    '6.2lbs',
-    '6.2m',
     '6.2mph',
-    '6.2p%',
-    '6.2pc',
-    '6.3%-6.8%',
-    '6.3&deg',
-    '6.3&ndash;6.1',
-    '6.3&ndash;6.11',
-    '6.3(2)',
-    '6.3(3)',
-    '6.3(a)',
-    '6.3(b)',
-    '6.3-debt',
-    '6.3.2.1',
-    '6.3.2.2',
-    '6.3.20',
-    '6.3.7',
     '6.3.8',
-    '6.3.87',
-    '6.3/4in',
-    '6.30&ndash;11',
-    '6.30&ndash;7pm',
-    '6.30&ndash;8.00',
-    '6.30&ndash;9.30pm',
-    '6.301',
-    '6.308pm',
-    '6.30a',
-    '6.30d',
-    '6.31%',
-    '6.31(3)',
-    '6.31a',
-    '6.31d',
-    '6.32(1)',
     '6.32(2)',
-    '6.32(3)',
-    '6.34%',
-    '6.34(3)',
-    '6.34a',
-    '6.34b',
-    '6.35-mm',
-    '6.35:24',
-    '6.35am',
-    '6.35mm',
-    '6.35pm',
-    '6.36%',
-    '6.36p',
-    '6.375%',
-    '6.37p',
-    '6.39(1)',
     '6.39(i)',
-    '6.39(ii)',
-    '6.3opm',
-    '6.3p',
-    '6.3pc',
-    '6.3secs',
-    '6.4&ndash;40.3',
-    '6.4&ndash;6.6',
-    '6.4.1.',
-    '6.4.1.1',
-    '6.4.1.2',
-    '6.4.2.1',
-    '6.4.2.2',
-    '6.4.73',
-    '6.40(3)',
-    '6.40pm',
     '6.42.6',
-    '6.45p',
-    '6.45pm&ndash;9.15pm',
-    '6.46(2)',
-    '6.464102',
-    '6.48',
-    '6.49%',
-    '6.49.39',
-    '6.4a',
-    '6.4bn',
-    '6.4c',
-    '6.4cm',
-    '6.4k',
-    '6.4kg',
-    '6.4km/4mls',
-    '6.4pc',
     '6.4sec',
-    '6.5&deg',
-    '6.5&ins',
-    '6.5&ndash;2.8&aring',
-    '6.5&ndash;28&ndash;1',
-    '6.5(4)',
-    '6.5(a)',
-    '6.5(b)',
-    '6.5(c)',
-    '6.5-magnitude',
-    '6.5.1.1',
-    '6.5.1.2',
-    '6.5.1.3',
-    '6.5.1987',
-    '6.5.6',
-    '6.5.7',
     '6.5.8',
-    '6.5.9',
-    '6.5.91',
-    '6.50%',
-    '6.50p',
-    '6.53(1)',
-    '6.53.11',
-    '6.54.3',
-    '6.55%',
-    '6.55p',
-    '6.56.8',
-    '6.57.5',
-    '6.57.53',
-    '6.59.53',
-    '6.59p',
-    '6.59pm',
     '6.59sec',
-    '6.5a-d',
-    '6.5c',
-    '6.5d',
-    '6.5d-e',
-    '6.5f-g',
-    '6.5ha',
-    '6.5kg',
-    '6.5kg/14lb',
-    '6.5oz',
-    '6.5sq',
-    '6.6&aring',
-    '6.6&ndash;6.6',
-    '6.6&ndash;7',
-    '6.6&ndash;7.2',
-    '6.6&ndash;7.6',
     '6.6(c)',
-    '6.6-kb',
-    '6.6-litre',
-    '6.6.77',
-    '6.6/100000/year',
-    '6.60683',
-    '6.615',
-    '6.63(1)',
-    '6.63(2)',
-    '6.64&ndash;6.66',
-    '6.64sec',
-    '6.65p',
-    '6.666',
-    '6.67%',
-    '6.678',
-    '6.68',
     '6.68%',
-    '6.69',
-    '6.69(3)',
-    '6.69p',
-    '6.6:1',
-    '6.6mpc',
-    '6.6v/470&ohm',
-    '6.7&deg',
-    '6.7&ndash;500',
-    '6.7(3)',
-    '6.7(a)',
-    '6.7(b)',
-    '6.7-petition',
-    '6.7.4',
-    '6.7.8.10.12.',
-    '6.7.88',
     '6.707%',
-    '6.71',
-    '6.72',
-    '6.73',
-    '6.73sec',
-    '6.74',
-    '6.75-litre',
-    '6.75cm',
-    '6.76',
-    '6.78m',
-    '6.79(1)',
-    '6.79(2)',
-    '6.79(3)',
-    '6.79(4)',
-    '6.79(5)',
-    '6.79(6)',
     '6.7b',
-    '6.7ft',
-    '6.7secs',
-    '6.7x',
-    '6.7x10',
-    '6.8&mgr;m',
-    '6.8&ndash;7.5t/ha',
-    '6.8(2)',
-    '6.8(i)',
-    '6.8-petition',
-    '6.8.',
-    '6.8.4&mdash;6.8.6',
-    '6.8.7',
-    '6.80(2)',
-    '6.83',
-    '6.838',
     '6.83992',
-    '6.85',
-    '6.85684',
-    '6.85pc',
-    '6.86',
-    '6.86%',
-    '6.86(1)',
-    '6.86(2)',
-    '6.87',
-    '6.875%',
-    '6.87p',
-    '6.88',
-    '6.88(2)',
-    '6.89',
-    '6.8a',
-    '6.8c',
     '6.8kb',
-    '6.8m',
-    '6.8pc',
-    '6.8sec',
-    '6.8t/ha',
-    '6.8v',
-    '6.9&ndash;45.6',
-    '6.9&ndash;7.',
-    '6.9&ndash;7.0',
-    '6.9(2)',
-    '6.9(3)',
-    '6.9(4)',
-    '6.9(a)',
-    '6.9-petition',
-    '6.9.',
-    '6.90',
     '6.90%',
-    '6.90.3kyr',
-    '6.90403',
-    '6.91(2)',
-    '6.91(3)',
-    '6.92',
-    '6.93(1)',
-    '6.93(4)',
-    '6.93p',
-    '6.94(3)',
-    '6.94(4)',
-    '6.95',
-    '6.95p',
-    '6.96(1)',
-    '6.96(2)',
-    '6.97(2)',
     '6.98',
-    '6.98(1)',
-    '6.98(3)',
-    '6.9c',
-    '6/11/89',
-    '6/12/86',
-    '6/122',
-    '6/13',
-    '6/15',
-    '6/1969',
-    '6/20',
-    '6/200&amp;c/400&amp;f',
-    '6/286',
-    '6/3',
-    '6/30',
-    '6/33',
     '6/37',
-    '6/4/91',
-    '6/477',
-    '6/5/41',
-    '6/584',
-    '6/6/87',
-    '6/61',
-    '6/62',
-    '6/64',
-    '6/65',
-    '6/7/8/9th',
-    '6/70',
-    '6/73',
-    '6/8&frac12;d.',
-    '6/8/13/15/22/29',
-    '6/9',
     '6/92',
-    '6/93',
-    '6/932',
-    '6/95',
-    '6/all',
-    '6/colour',
-    '6/highlights',
-    '6/i',
-    '6/the',
-    '60%-70%',
-    '60%-plus',
-    '60%.',
-    '60%.4',
-    '60%to',
-    '60&deg&ndash;60&deg;f',
-    '60&deg&ndash;65&deg;f',
     '60&deg&ndash;74&deg',
-    '60&deg&ndash;74&deg;f',
-    '60&deg&ndash;76&deg;f',
-    '60&deg&ndash;80&deg;f',
-    '60&deg/25',
-    '60&deg;-70&deg;f',
-    '60&deg;00\'',
-    '60&deg;c-1min',
-    '60&deg;fs',
-    '60&deg;s',
-    '60&mdash;1',
-    '60&mdash;70p',
-    '60&micro;g/ml',
-    '60&ndash;02',
-    '60&ndash;100m',
-    '60&ndash;180',
     '60&ndash;400',
-    '60&ndash;4000',
-    '60&ndash;5',
-    '60&ndash;58',
-    '60&ndash;64-year-olds',
-    '60&ndash;65,000',
-    '60&ndash;65mph',
-    '60&ndash;68',
-    '60&ndash;69.9',
-    '60&ndash;70&deg;c',
-    '60&ndash;73',
-    '60&ndash;80-year-old',
-    '60&ndash;800x',
-    '60&ndash;80c',
-    '60&ndash;81',
-    '60&ndash;85%',
     '60&ndash;9',
-    '60&ndash;90%',
-    '60&ndash;90,000',
-    '60&ndash;98',
-    '60&ndash;overs',
-    '60&percnt;of',
-    '60&rehy;minute',
-    '60&sol;61',
-    '60&sol;86',
-    '60\'s/70\'s/80',
-    '60(1)',
-    '60(6)',
-    '60,000&ndash;100,000',
-    '60,000&ndash;105,000',
-    '60,000&ndash;75,000',
-    '60,000&ndash;80,000',
     '60,000&ndash;90,000',
-    '60,000,000-yen',
-    '60,000-100,000',
-    '60,000-70,000',
-    '60,000-acre',
-    '60,000-hectare',
-    '60,000-tonne',
-    '60,000-user',
-    '60,000-x',
-    '60,000.00',
-    '60,000interest',
-    '60,000s',
-    '60,000sq',
-    '60,062',
-    '60,144',
-    '60,15',
     '60,191',
-    '60,221',
-    '60,372',
-    '60,400',
-    '60,449',
-    '60-07-24t',
-    '60-18',
-    '60-2',
-    '60-40',
-    '60-51',
-    '60-64',
-    '60-65',
-    '60-65%',
-    '60-69',
-    '60-69.9',
-    '60-70,000',
     '60-90',
-    '60-90pc',
-    '60-a-day-smoker',
-    '60-acre',
-    '60-bedroom',
-    '60-bit',
-    '60-c',
-    '60-cap',
-    '60-clause',
-    '60-cm',
-    '60-date',
-    '60-feet',
-    '60-gram',
-    '60-hole',
-    '60-inch',
-    '60-litre',
     '60-man',
-    '60-miles-per-hour',
-    '60-million-year',
-    '60-myr-old',
-    '60-page',
-    '60-pointer',
-    '60-pounder',
-    '60-pupil',
-    '60-room',
-    '60-storey',
-    '60-vehicle',
-    '60-watt',
-    '60-year-olds',
-    '60-years',
-    '60.',
-    '60.05',
     '60.2%',
-    '60.25',
-    '60.3%',
-    '60.4&ndash;26&ndash;81&ndash;8',
-    '60.4x73.5cm',
-    '60.5p',
-    '60.6',
-    '60.68',
-    '60.6mpg',
-    '60.70',
-    '60.75',
-    '60.8%',
-    '60.84',
-    '60.9',
-    '60.9%-owned',
-    '60.90',
     '60.9pc',
-    '60/65&ndash;74',
-    '60/68',
-    '60/86',
-    '60/90',
-    '60/min',
-    '60/sq',
-    '600&micro;m',
-    '600&ndash;1000m',
-    '600&ndash;1500&deg;c',
-    '600&ndash;1950',
-    '600&ndash;2000',
-    '600&ndash;300',
-    '600&ndash;500',
-    '600&ndash;601',
-    '600&ndash;607',
     '600&ndash;630',
-    '600&ndash;635kg',
-    '600&ndash;699',
-    '600&ndash;700km',
-    '600&ndash;800',
-    '600&ndash;900&deg;c',
-    '600&ndash;905',
-    '600\'s',
-    '600,000&ndash;800,000',
-    '600,000-a-year',
-    '600,000-hectare',
-    '600,000-rated',
-    '600-1000',
-    '600-bed',
-    '600-entry',
-    '600-feet-long',
     '600-km',
-    '600-megawatt',
-    '600-mw',
-    '600-odd',
-    '600-series',
-    '600-space',
-    '600-word',
-    '600-year',
-    '600.16',
-    '600.30',
-    '600.38',
-    '600.6mph',
-    '600/611',
-    '6000&ndash;8000',
-    '6000-acre',
-    '6000/100',
     '6000/75',
-    '60000/km',
-    '60002',
-    '60005',
-    '60006',
-    '60007',
-    '60009',
-    '6000bc',
-    '6000ft',
-    '6000m',
-    '6000mm',
-    '60010',
-    '60020',
-    '60022',
-    '600235',
-    '60030',
     '60040',
-    '60059',
-    '60070',
-    '6008',
-    '60080',
-    '6009',
-    '60099',
-    '600:1',
-    '600bhp',
-    '600es',
-    '600ff/-livestock',
-    '600g',
-    '600gb',
-    '600js',
-    '600kcals',
-    '600kg',
     '600kg/ha',
-    '600kms',
-    '600kv',
-    '600lbs',
-    '600ml/',
-    '600odd',
-    '600psi',
-    '600sq',
-    '600v',
-    '600w',
-    '600yd',
-    '601,730',
-    '601/2p',
-    '60108&ndash;0218',
-    '60108&ndash;1035',
-    '6011',
     '60120',
-    '601222',
-    '60128',
-    '60150',
-    '60159',
-    '6016',
-    '60161',
-    '6017',
-    '601733',
-    '60191',
-    '601a',
-    '601p',
-    '602&ndash;3',
-    '602-1',
-    '602/3',
-    '6026',
     '60260',
-    '60269',
-    '60273',
-    '6028',
-    '602912',
-    '603&mdash;4',
-    '603&ndash;604',
-    '603,550',
-    '60302',
-    '6031',
-    '6032',
-    '603271',
-    '6035',
-    '60360',
-    '603731',
-    '603753',
     '604,000',
-    '604,500',
-    '604,869',
-    '604.',
-    '6040',
-    '60400',
-    '604060',
-    '6043',
-    '6044',
-    '6046.2',
-    '6048',
-    '604kbytes',
-    '605&ndash;609',
-    '605,000',
-    '605-2',
-    '605.27',
     '6050',
-    '6051.0',
-    '6052',
-    '6053',
-    '605411',
-    '605a',
-    '605sv1',
-    '606&ndash;607',
-    '606&ndash;609',
-    '606&ndash;8',
-    '606,000',
-    '606,300',
-    '606.25',
-    '606174',
-    '606189',
-    '6065',
     '6066',
-    '606606',
-    '6067',
-    '6068',
-    '606852',
-    '606933',
-    '607,000',
-    '607224',
-    '607659',
-    '607750',
-    '607865',
-    '607909',
-    '607g',
-    '608&ndash;9',
-    '608,881',
-    '608-gramme',
     '608.00',
-    '608.301',
-    '608.5p',
-    '60815',
-    '608218',
-    '60831',
-    '608311',
-    '6085',
-    '60864',
-    '608661',
-    '6087',
-    '60896',
-    '609&ndash;619',
-    '60910',
-    '6092',
-    '60939',
     '6097',
-    '609841',
-    '609cm',
-    '609p',
-    '60:1',
-    '60:3',
-    '60:50:5',
-    '60:diagram/figure',
-    '60_',
-    '60_per',
-    '60a(1-4)',
-    '60b',
-    '60bc',
-    '60bhp',
-    '60bp',
-    '60c.',
     '60c/bbl',
-    '60cc',
-    '60cm-long',
-    '60cm/24&ins',
-    '60cm/2ft',
-    '60cmx&times;27cm',
-    '60deg',
-    '60ff',
-    '60ft-plus',
-    '60ft.',
-    '60ft/18m',
-    '60g',
-    '60g/2&amp;oz',
-    '60gal',
-    '60ghz',
-    '60gm',
     '60gy',
-    '60ha',
-    '60hp',
-    '60km/40mls',
-    '60kts',
-    '60l',
-    '60m-bytes',
-    '60mg/100ml',
-    '60myr',
-    '60ngml',
-    '60p-a-share',
-    '60pp',
-    '60ps',
-    '60s-inspired',
-    '60s-style',
-    '60s.',
     '60s/70s',
-    '60to-70',
-    '60x36&ins',
-    '61&amp;times28',
-    '61&ndash;100',
-    '61&ndash;100%',
-    '61&ndash;117',
-    '61&ndash;17',
-    '61&ndash;2&ndash',
-    '61&ndash;2&ndash;416',
-    '61&ndash;32',
-    '61&ndash;4',
-    '61&ndash;6',
-    '61&ndash;62',
-    '61&ndash;63',
-    '61&ndash;65',
     '61&ndash;65%',
-    '61&ndash;66',
-    '61&ndash;677',
-    '61&ndash;7',
-    '61&ndash;71',
-    '61&ndash;76',
-    '61&ndash;85',
-    '61&ndash;86',
-    '61&ndash;86%',
-    '61&ndash;v',
-    '61&ndash;vii',
-    '61&ndash;viii',
-    '61&percnt',
-    '61&times;10/l',
-    '61&times;61',
-    '61&times;76.2',
     '61(2)',
-    '61(5)',
-    '61,000,000',
-    '61,049,000',
-    '61,258',
-    '61,400',
-    '61,700',
-    '61,722',
-    '61,850',
-    '61-54',
-    '61-90',
-    '61-footer',
-    '61-knot',
-    '61-milers',
-    '61-vi',
-    '61.03',
     '61.1',
-    '61.10',
-    '61.3%',
-    '61.33',
-    '61.34',
-    '61.36',
-    '61.43',
-    '61.59',
-    '61.5g',
-    '61.6m',
-    '61.86',
-    '61.8pc',
-    '61.9',
-    '61.94',
-    '61/63',
-    '61/63,100/102,104&ndash;5/106&ndash;7',
     '61/63,74/76,128/130,184/186,196/198',
-    '61/67',
-    '610&ndash;50',
-    '610&ndash;614',
-    '610&ndash;615kb',
-    '610,000',
-    '610,989',
-    '610-cm',
-    '610-mhz',
-    '61000',
-    '6100s',
-    '6101581',
-    '6103',
-    '61030',
-    '6104',
-    '6104821',
     '61050&ndash;2',
-    '6107',
-    '610815',
-    '610c',
-    '610k',
-    '610kwh',
-    '610mhz',
-    '610p',
-    '610s',
-    '611.17',
-    '611032',
-    '61111',
-    '61122',
-    '611222',
-    '61127',
-    '61147',
     '61152',
-    '6116',
-    '611625',
-    '61173',
-    '61179',
-    '6118',
-    '61181',
-    '611881',
-    '61189',
-    '6119',
-    '61191',
-    '61193',
-    '611a.',
-    '611th',
-    '612,000',
-    '612,083',
     '61202',
-    '61212',
-    '61222',
-    '612233',
-    '612248',
-    '61225',
-    '612323',
-    '612439',
-    '6125.12',
-    '6128',
-    '61283',
-    '612km',
-    '612th',
-    '613,000',
-    '6132',
-    '6134',
     '6134992',
-    '6135',
-    '613577',
-    '61360',
-    '61367',
-    '61383',
-    '6139',
-    '61390',
-    '614,220',
-    '614,937',
-    '61402',
-    '61408',
-    '6142',
-    '61423m',
-    '614450',
-    '6147',
     '614839',
-    '61490',
-    '614f',
-    '615&ndash;617',
-    '615&ndash;618',
-    '615\'s',
-    '615,377',
-    '6150',
-    '6150-t25',
-    '615353',
-    '615615',
-    '61570',
-    '615p',
-    '616&ndash;40',
-    '6163',
-    '616410',
     '616453',
-    '6166',
-    '61698',
-    '617\'s',
-    '617,007',
-    '6170040',
-    '61710',
-    '6173',
-    '6173&ndash;6174',
-    '6175',
-    '61760',
-    '6177',
-    '61780',
-    '6179',
-    '6180',
-    '61808',
     '61870',
-    '619%',
-    '619&ndash;627',
-    '619,387,000',
-    '619-636',
-    '61905',
-    '6193',
-    '61960',
-    '619666',
-    '619p',
-    '61:1',
-    '61:1&ndash;2',
-    '61:23',
-    '61c',
-    '61d(3)',
-    '61f.',
     '61lb',
-    '61mm',
-    '61p&ndash;65p',
-    '61pp',
-    '61s',
-    '61st-minute',
-    '61th',
-    '61v1&ndash;11',
-    '61v3',
-    '61x61cm',
-    '62%&mdash;36%roman',
-    '62&amp;shilling',
-    '62&deg&ndash;64&deg;f',
-    '62&deg&ndash;68&deg;f',
-    '62&deg&ndash;80&deg;f',
-    '62&deg;40',
     '62&deg;41',
-    '62&deg;n',
-    '62&deg;w',
-    '62&frac12;p',
-    '62&ft',
-    '62&ins',
-    '62&mdash;3',
-    '62&mdash;5',
-    '62&ndash;1',
-    '62&ndash;1500',
-    '62&ndash;205',
-    '62&ndash;207',
-    '62&ndash;21',
-    '62&ndash;40',
-    '62&ndash;5',
-    '62&ndash;645',
     '62&ndash;66%',
-    '62&ndash;7',
-    '62&ndash;73',
-    '62&ndash;8',
-    '62&ndash;83',
-    '62&ndash;91',
-    '62&ndash;91/l',
-    '62&ndash;99',
-    '62&ndash;ix',
-    '62(091)',
-    '62(2)',
-    '62(3)',
-    '62(b)',
-    '62,063',
-    '62,300,000',
-    '62,400,000',
     '62,600',
-    '62,679,035',
-    '62,767',
-    '62,780',
-    '62,800,000',
-    '62,900',
-    '62,926',
-    '62,967,000',
-    '62-inch',
-    '62-node',
-    '62-storey',
-    '62.',
-    '62.00',
-    '62.01',
-    '62.02',
-    '62.04',
     '62.05',
-    '62.1%',
-    '62.12',
-    '62.26',
-    '62.2m',
-    '62.3%',
-    '62.32',
-    '62.4',
-    '62.40',
-    '62.5-mhz',
-    '62.55',
-    '62.5p',
-    '62.75',
-    '62.8',
-    '62/120',
-    '62/24/1',
     '62/3/2',
-    '62/49',
-    '62/6/2',
-    '62/72',
-    '62/l',
-    '620&ndash;700',
-    '620,000,000',
-    '620,627',
-    '620-metre',
-    '620-mw',
-    '620006',
-    '6200bp',
-    '6200km',
-    '620137',
-    '620357',
-    '6205',
     '620736',
-    '6208',
-    '620986',
-    '620c&ndash;g',
-    '620ft',
-    '620i',
-    '620k',
-    '620kb',
-    '620kg',
-    '621&ndash;638',
-    '621.',
-    '621.3',
-    '621.48',
-    '62100',
-    '62110',
-    '62114',
     '6212',
-    '6213',
-    '621381',
-    '621414',
-    '621501',
-    '62161.6',
-    '6217',
-    '62193',
-    '621e&ndash;g',
-    '621k',
-    '621p',
-    '622&ndash;629',
-    '622,000',
-    '622.4mev',
-    '622.6',
-    '622200',
     '622228',
-    '62231',
-    '6224',
-    '6225',
-    '622520',
-    '622548',
-    '622936',
-    '622c&ndash;623e',
-    '622f',
-    '623&ndash;624',
-    '623,700,000',
-    '623.07',
-    '623.4',
-    '623.821',
-    '623004',
-    '623074',
     '62330',
-    '6234',
-    '62350',
-    '62352',
-    '62353',
-    '62356',
-    '62358',
-    '62359',
-    '6236',
-    '62360',
-    '62380',
-    '623c',
-    '623rd',
-    '623x',
-    '624-base-pair',
-    '624-page',
     '624.150724',
-    '624.151',
-    '624.15109',
-    '624.15109411',
-    '624.90',
-    '6240',
-    '624400',
-    '624414',
-    '624672',
-    '6247',
-    '624ft',
-    '624kg',
-    '624pp.',
-    '625&ndash;34',
-    '625&ndash;671',
-    '625-lint',
     '625-member',
-    '625-strong',
-    '625599',
-    '62560',
-    '625acre',
-    '625m',
-    '625mhz',
-    '626-mw',
-    '626.8',
-    '626/',
-    '6260',
-    '62601',
-    '6262',
-    '626262',
-    '626316',
-    '626404',
     '6265',
-    '62664/3',
-    '62666',
-    '62667',
-    '62668',
-    '626kg',
-    '626t',
-    '627&ndash;628',
-    '627&ndash;636',
-    '627\'s',
-    '627,000',
-    '627,552',
-    '62709',
-    '6272',
-    '62720',
-    '6272m',
     '627402',
-    '627703',
-    '6279',
-    '627m',
-    '628&ndash;31',
-    '628,000',
-    '628.16850941',
-    '628.57',
-    '6280',
-    '62800m',
-    '62805',
-    '628512',
-    '62852',
-    '6286',
-    '628p',
-    '629,400,000',
     '629.1333404269973',
-    '629274',
-    '62959',
-    '62974',
-    '629914',
-    '629c&ndash;g',
-    '62c',
-    '62f',
-    '62km',
-    '62no',
-    '62year-old',
-    '63&deg',
-    '63&frac12',
-    '63&ft',
-    '63&mdash',
-    '63&mdash;5',
     '63&mdash;72',
-    '63&ndash;39',
-    '63&ndash;47',
-    '63&ndash;5',
-    '63&ndash;64',
-    '63&ndash;66',
-    '63&ndash;7',
-    '63&ndash;70',
-    '63&ndash;73',
-    '63&ndash;8',
-    '63&ndash;83',
-    '63&ndash;85',
-    '63&ndash;91',
-    '63&percnt',
-    '63(22%)',
-    '63(4)',
     '63(a)',
-    '63,077',
-    '63,147,266',
-    '63,181',
-    '63,27',
-    '63,418',
-    '63,669',
-    '63,985',
-    '63-6',
-    '63-cap',
-    '63-date',
-    '63-point',
-    '63-strong',
-    '63.00',
-    '63.09',
-    '63.1%',
     '63.15',
-    '63.2',
-    '63.20',
-    '63.27%',
-    '63.28m',
-    '63.29',
-    '63.31',
-    '63.37',
-    '63.39',
-    '63.3years',
-    '63.4%',
-    '63.5&ndash;206.2',
-    '63.5&ndash;98.5',
-    '63.5p',
-    '63.75',
-    '63.8',
     '63.91',
-    '63/737',
-    '630&ndash;1',
-    '630-nm',
-    '630-seat',
-    '630.',
-    '630.0',
-    '630.8%',
-    '630/1',
-    '630/l',
-    '63038',
-    '63049',
-    '6305166',
-    '630530',
-    '630730',
-    '6308',
     '630a',
-    '630ad',
-    '630mp',
-    '630p',
-    '630vs',
-    '631&ndash;633',
-    '631-648',
-    '631.589.2',
-    '6310',
-    '6310s',
-    '631100',
-    '63123',
-    '6313',
-    '6317',
-    '631756',
-    '63181',
     '631a',
-    '631m',
-    '631nm',
-    '632&ndash;3',
-    '632&ndash;634',
-    '632/3',
-    '6320',
-    '632222',
-    '63240',
-    '6327',
-    '6329',
-    '63298',
-    '632e',
-    '632ft',
-    '632p',
-    '633&ndash;55',
     '633&ndash;598',
-    '633.3%',
-    '6330',
-    '633038',
-    '6331',
-    '63349',
-    '63350',
-    '633542',
-    '63360',
-    '63381',
-    '633844',
-    '63396',
-    '634&ndash;56',
-    '634.84',
-    '6340',
-    '63405&ndash;2',
     '63412',
-    '6345',
-    '63456',
-    '6346',
-    '635&ndash;735kg',
-    '635&ndash;9550',
-    '635/6',
-    '6350',
-    '63508',
-    '6351',
-    '6353',
-    '635666',
-    '6357',
-    '63573',
-    '635dpi',
-    '635g',
     '635kg',
-    '635mm',
-    '636&ndash;8',
-    '636,000',
-    '636.7',
-    '636/7',
-    '6360',
-    '63604',
-    '6360703&sol;4',
-    '6361',
-    '6362',
-    '636311',
-    '636414',
-    '63648',
-    '636547',
-    '63678',
     '636e',
-    '636f',
-    '637-8',
-    '637.50',
-    '637.50.',
-    '6370',
-    '63701',
-    '63734',
-    '63749',
-    '63770',
-    '6378',
-    '637d',
-    '638,000-name',
-    '638,364',
-    '638,800',
-    '63827',
     '6384',
-    '63854a',
-    '638575',
-    '6386',
-    '63871',
-    '63880',
-    '638918',
-    '638e',
-    '638kg',
-    '639,000',
-    '639-46',
-    '639.',
-    '6390',
-    '6390&ndash;3',
-    '63902',
-    '6391',
     '63910',
-    '639170',
-    '6391m',
-    '63930',
-    '63978',
-    '63:10',
-    '63:16',
-    '63a.',
-    '63b.',
-    '63bhp',
-    '63bp',
-    '63c',
-    '63cm',
-    '63cp2e',
-    '63cpe',
-    '63gb',
     '63kb',
-    '63km',
-    '63m',
-    '63mscfd',
-    '63no',
-    '63th',
-    '63w',
-    '63year-old',
-    '64&deg&ndash;60&deg;f',
-    '64&deg&ndash;72&deg;f',
-    '64&deg;58\'',
-    '64&deg;c',
-    '64&frac12',
-    '64&mdash',
-    '64&mdash;5',
-    '64&mdash;75',
     '64&ndash;15',
-    '64&ndash;280',
-    '64&ndash;6',
-    '64&ndash;650',
-    '64&ndash;66',
-    '64&ndash;72',
-    '64&ndash;77',
-    '64&ndash;77%',
-    '64&ndash;81',
-    '64&ndash;91',
-    '64&times;64',
-    '64\'s',
-    '64,000bps',
-    '64,087',
-    '64,100',
-    '64,186',
     '64,453',
-    '64,453,600',
-    '64,488',
-    '64,589',
-    '64,619',
-    '64-10',
-    '64-36',
-    '64-6',
-    '64-67',
-    '64-bed',
-    '64-character',
-    '64-day',
-    '64-foot',
-    '64-gun',
-    '64-kilobyte',
-    '64-m',
     '64-metre',
-    '64-room',
-    '64-seat',
-    '64-to',
-    '64-user',
-    '64-way',
-    '64-wide',
-    '64-year',
-    '64-year-olds',
-    '64.',
-    '64.00',
-    '64.02',
-    '64.12',
-    '64.19',
-    '64.20',
-    '64.26',
     '64.2mpg',
-    '64.3',
-    '64.40',
-    '64.46',
-    '64.47',
-    '64.49',
-    '64.4p',
-    '64.50m',
-    '64.51',
-    '64.6%',
-    '64.67',
-    '64.74',
-    '64.78',
-    '64.8ins',
-    '64.91',
-    '64/120',
     '64/128',
-    '64/66',
-    '640%',
-    '640&ndash;1440',
-    '640&ndash;4',
-    '640&ndash;41',
-    '640&ndash;645',
-    '640-kb',
-    '640-metres',
-    '640-pupil',
-    '640/480',
-    '640/88',
-    '6400-km',
-    '640000',
-    '6400kg',
-    '6400rpm',
     '64027',
-    '64032',
-    '6404',
-    '640529',
-    '64075',
-    '640a',
-    '640kg',
-    '640km',
-    '640x80',
-    '641&ndash;52',
-    '641&ndash;642',
-    '641.4',
-    '641.41641.47',
-    '641.453',
-    '641.49',
-    '641.493',
     '641.49353',
-    '641.738',
-    '6410',
-    '641121',
-    '6412',
-    '641465',
-    '64148',
-    '641535',
-    '64162',
-    '6417',
-    '64181',
-    '64183',
-    '641972',
-    '641m',
-    '642,000',
-    '642/l',
     '6420',
-    '64210',
-    '642155',
-    '64232',
-    '642350',
-    '64244',
-    '6428',
-    '642827',
-    '642p',
-    '6430',
-    '64305',
-    '64310',
-    '6434',
-    '643719',
-    '643a&ndash;b',
-    '644,000',
     '644-b',
-    '644.82',
-    '6440',
-    '6440113',
-    '644026',
-    '6442',
-    '644300',
-    '6445',
-    '644592',
-    '6446',
-    '6447',
-    '64489',
-    '64490',
-    '64491',
-    '644km/400mls',
-    '644kyr',
     '644p',
-    '645&ndash;646',
-    '645&ndash;685',
-    '645,000',
-    '645,266',
-    '64500',
-    '6450718-55mgcl2',
-    '6452887',
-    '6453',
-    '6459',
-    '646&ndash;1850',
-    '646/1507',
-    '6460',
-    '6461m',
-    '6463',
-    '6464',
     '6465',
-    '646e&ndash;g',
-    '646ff',
-    '647,000',
-    '647,369',
-    '647,400',
-    '647,878',
-    '647-2366',
-    '647/53',
-    '6471',
-    '6472',
-    '647531',
-    '647858',
-    '6479',
-    '647p',
-    '648&ndash;2',
     '648&ndash;649',
-    '648,000',
-    '648.5',
-    '6480',
-    '64811',
-    '648111',
-    '64820',
-    '64830',
-    '64831',
-    '64872',
-    '64880',
-    '64887',
-    '649&mdash;50',
-    '649&ndash;1',
-    '649&ndash;650',
-    '649-bedroom',
     '649.9',
-    '649/50',
-    '64906',
-    '6494',
-    '64ad',
-    '64b',
-    '64e',
-    '64f.',
-    '64ff',
-    '64ft',
-    '64ft.',
-    '64ins',
-    '64kb/second',
-    '64m-byte',
-    '64mm&formula',
-    '64no',
     '64ps',
-    '64r',
-    '64s',
-    '65%-owned',
-    '65&deg&ndash;70&deg;f',
-    '65&deg&ndash;72&deg;f',
-    '65&deg&ndash;74&deg;f',
-    '65&deg&ndash;76&deg;f',
-    '65&deg&ndash;80&deg;f',
-    '65&deg;.',
-    '65&deg;s',
-    '65&frac34',
-    '65&ft',
-    '65&ins',
-    '65&mdash',
-    '65&mdash;66.158&mdash;9',
     '65&mdash;69',
-    '65&mdash;74',
-    '65&mdash;85',
-    '65&ndash;100',
-    '65&ndash;120',
-    '65&ndash;190',
-    '65&ndash;226',
-    '65&ndash;35',
-    '65&ndash;43',
-    '65&ndash;64',
-    '65&ndash;650',
-    '65&ndash;66',
-    '65&ndash;70%',
-    '65&ndash;70p',
-    '65&ndash;71',
-    '65&ndash;75',
     '65&ndash;75%',
-    '65&ndash;8',
-    '65&ndash;80',
-    '65&ndash;80%',
-    '65&ndash;80&deg;f',
-    '65&ndash;85g',
-    '65\'s',
-    '65(1)',
-    '65,000,000',
-    '65,000-processor',
-    '65,000sq',
-    '65,100',
-    '65,200',
-    '65,300',
-    '65,346',
-    '65,353,000',
     '65,384',
-    '65,384-processor',
-    '65,400',
-    '65,500,000',
-    '65,534',
-    '65,550,000',
-    '65,577',
-    '65,623',
-    '65,66',
-    '65,700',
-    '65,815',
-    '65,931',
-    '65,945',
-    '65-40',
-    '65-56',
-    '65-64',
     '65-80mph',
-    '65-foot',
-    '65-gallon',
-    '65-lap',
-    '65-metre',
-    '65-mile',
-    '65-piece',
-    '65-room',
-    '65-strong',
-    '65-year-olds',
-    '65.',
-    '65.11&ndash;12',
-    '65.15',
-    '65.19',
-    '65.2%',
-    '65.298&ndash;91',
     '65.33',
-    '65.41',
-    '65.5p',
-    '65.63',
-    '65.79pc',
-    '65.7mpg',
-    '65.9',
-    '65/030',
-    '65/038',
-    '65/3/7&mdash;65/3/15',
-    '65/4/16',
-    '65/45',
-    '65/70',
-    '650&deg;c',
-    '650&ndash;1050',
-    '650&ndash;3',
     '650&ndash;60',
-    '650&ndash;675p',
-    '650&ndash;678',
-    '650&ndash;700',
-    '650&ndash;730nm',
-    '650&ndash;800kg',
-    '650\'s',
-    '650,374',
-    '650,900',
-    '650-mile',
-    '650-odd',
-    '650-word',
-    '650/1',
-    '6500gn',
-    '6500gns',
-    '6500l',
     '6500s',
-    '6502-type',
-    '65048',
-    '650891',
-    '650bp',
-    '650hp',
-    '650k',
-    '650kg',
-    '650km',
-    '650m',
-    '650mile',
-    '650th',
-    '650w',
-    '651&ndash;04',
-    '651&ndash;676',
-    '651/2',
     '651055',
-    '6511',
-    '651175',
-    '6515th',
-    '651981',
-    '651st',
-    '652&ndash;653',
-    '652,306',
-    '6520',
-    '65201',
-    '6521',
-    '65211',
-    '652155',
-    '652185',
-    '6523',
-    '6524',
     '65247',
-    '6525',
-    '652724',
-    '65281',
-    '65290',
-    '652m',
-    '652p',
-    '653&ndash;1,453',
-    '653,123',
-    '653-4',
-    '653022',
-    '6531/g&ndash;bsks',
-    '653338',
-    '653345',
-    '6535',
-    '6537-7674',
     '65390',
-    '653920',
-    '654&ft',
-    '654&ndash;655',
-    '6540',
-    '6541',
-    '654366',
-    '654398',
-    '6544',
-    '65489',
-    '654ft',
-    '654h',
-    '655&ndash;732',
-    '655&ndash;8',
-    '655000',
-    '6551',
     '655201',
-    '6553',
-    '6554',
-    '65540',
-    '6556',
-    '6557/8/9/0',
-    '655kg',
-    '656&ndash;9',
-    '656,000,000',
-    '656,702',
-    '656.',
-    '656.1',
-    '6560',
-    '65611',
-    '656194',
-    '6563',
     '656438',
-    '656476.',
-    '6565',
-    '656d&ndash;f',
-    '656p.',
-    '657&ndash;60',
-    '6575',
-    '6576',
-    '6579',
-    '657p',
-    '658&ndash;60',
-    '658,000',
-    '658.562',
-    '658828',
-    '658m/720yds',
-    '658p',
     '659&ndash;75',
-    '659&ndash;93',
-    '659-amino-acid',
-    '659.3',
-    '659.3:766',
-    '6595',
-    '6596',
-    '659771',
-    '659966',
-    '65999',
-    '659p',
-    '65:21ff',
-    '65:25:4',
-    '65:c',
-    '65b&ndash;c',
-    '65bhp',
     '65c',
-    '65e',
-    '65f',
-    '65g/2&frac12',
-    '65gm/sq.',
-    '65hp',
-    '65kts',
-    '65no',
-    '65s.',
-    '65tb',
-    '65th-minute',
-    '65u',
-    '65w',
-    '66&aring',
-    '66&frac12;points',
-    '66&frac23',
     '66&mdash;9',
-    '66&ndash;127',
-    '66&ndash;16579',
-    '66&ndash;67',
-    '66&ndash;68',
-    '66&ndash;7&deg',
-    '66&ndash;70',
-    '66&ndash;71',
-    '66&ndash;73',
-    '66&ndash;79',
-    '66&ndash;8',
-    '66&ndash;89',
-    '66&ndash;91',
-    '66&plus;8',
-    '66(3xa)',
-    '66(4)',
     '66,000year-old',
-    '66,236,791',
-    '66,417',
-    '66,454',
-    '66,560',
-    '66,600',
-    '66,600,000',
-    '66,700,000',
-    '66,800',
-    '66,820,544',
-    '66,885',
-    '66,898',
-    '66,900',
-    '66,900,000',
-    '66-0',
-    '66-106',
     '66-3',
-    '66-53',
-    '66-55',
-    '66-70ad',
-    '66-75',
-    '66-ear-old',
-    '66-hours',
-    '66-plus',
-    '66-years-old',
-    '66.',
-    '66.04',
-    '66.09',
-    '66.1',
-    '66.1%',
-    '66.19',
-    '66.31',
     '66.4',
-    '66.43',
-    '66.6&percnt',
-    '66.60',
-    '66.67%',
-    '66.7kg',
-    '66.7mhz/70',
-    '66.82%',
-    '66/17',
-    '66/46',
-    '66/68',
-    '66/73',
-    '66/76',
-    '660%',
-    '660&ft',
-    '660&ndash;4',
     '660-665',
-    '6600-6581',
-    '66000',
-    '660000',
-    '6600rpm',
-    '6602159',
-    '660377',
-    '6604',
-    '6605',
-    '66063',
-    '6608/10&ndash;3',
-    '660978',
-    '660cc',
-    '660e',
-    '660g',
-    '660gal',
     '660k',
-    '660mw',
-    '660nm',
-    '660p.p.m.v',
-    '660pc',
-    '660x0-based',
-    '6610',
-    '66109',
-    '66110',
-    '6614',
-    '661421',
-    '661488',
-    '6615121',
-    '6617',
-    '661880',
-    '661d',
     '662,000',
-    '662/663',
-    '6622',
-    '662233',
-    '662244',
-    '662266',
-    '6627',
-    '662883',
-    '662ff',
-    '662p',
-    '663(3)',
-    '663,000',
-    '663-2',
-    '663.10',
-    '663012',
-    '66314',
     '663298',
-    '6633',
-    '663374',
-    '663494',
-    '66350',
-    '663566',
-    '66380',
-    '663812',
-    '663820',
-    '663c',
-    '663d&ndash;f',
-    '663e',
-    '664&ndash;6',
-    '664&ndash;73',
-    '664,000',
-    '664,271',
     '664164',
-    '66450',
-    '664944',
-    '665&ndash;8',
-    '665/6',
-    '6654',
-    '66540',
-    '66561',
-    '665721',
-    '6658',
-    '665g',
-    '665mm',
-    '665p',
-    '666&ndash;4',
-    '6663',
-    '66634',
     '6665-hours',
-    '66662',
-    '666677',
-    '666686',
-    '6667',
-    '666b',
-    '667&ndash;4842',
-    '667&ndash;669',
-    '667,000',
-    '667,811',
-    '667-share',
-    '6670',
-    '6674',
-    '667473',
-    '6676',
-    '667687',
     '667788',
-    '667799',
-    '66797',
-    '667ff',
-    '667g',
-    '667x',
-    '668&ndash;9',
-    '668,000',
-    '66808',
-    '668242',
-    '6684',
-    '6686',
-    '66883',
-    '668d',
-    '668e&ndash;f',
-    '669,073',
     '669,532',
-    '669/1156=58%',
-    '6690',
-    '669000',
-    '669857',
-    '6699',
-    '66990',
-    '669977',
-    '66ad',
-    '66af',
-    '66b',
-    '66c',
-    '66f',
-    '66f-73f',
-    '66f.',
-    '66ff.',
     '66ft',
-    '66ft.',
-    '66g',
-    '66h',
-    '66in',
-    '66kd',
-    '66kg',
-    '66kjmol',
-    '66kv',
-    '66mhz/64-bit',
-    '66mhzs',
-    '66mind',
-    '66mm',
-    '66no',
-    '66pp',
-    '66w',
     '67&ft',
-    '67&mdash;8',
-    '67&ndash;174',
-    '67&ndash;3',
-    '67&ndash;68:diagram/figure',
-    '67&ndash;70',
-    '67&ndash;71',
-    '67&ndash;75',
-    '67&ndash;77',
-    '67&ndash;85',
-    '67&ndash;87%',
-    '67&ndash;9',
-    '67&ndash;90',
-    '67(1)',
-    '67(2)',
-    '67(23%)',
     '67(8)',
-    '67,054',
-    '67,100',
-    '67,167',
-    '67,378',
-    '67,423',
-    '67,450',
-    '67,663',
-    '67,68',
-    '67,68,69',
-    '67,704',
-    '67,788',
-    '67-65',
-    '67-member',
-    '67-years-of-age',
-    '67-years-old',
     '67.02',
-    '67.1',
-    '67.11',
-    '67.16',
-    '67.27%',
-    '67.31',
-    '67.32',
-    '67.4',
-    '67.6pc',
-    '67.7',
-    '67.7%',
-    '67.8pc',
-    '67.9',
-    '67/\'68',
-    '67/100,000',
-    '67/49',
     '67/77',
-    '670&times;10/l',
-    '670,000',
-    '670,359,429',
-    '670,828',
-    '670.9',
-    '670092',
-    '6700ft',
-    '6700rpm',
-    '67022',
-    '670392',
-    '67040',
-    '67042',
-    '6705',
-    '6707',
-    '670h',
     '670m',
-    '670mb',
-    '671/1480',
-    '6710',
-    '671116',
-    '6712',
-    '671264',
-    '6713054',
-    '6714',
-    '67140',
-    '672&ndash;3',
-    '672&ndash;5',
-    '672,087',
-    '672-c.',
-    '6722',
-    '672224',
     '672480',
-    '672641',
-    '672772',
-    '672kg',
-    '672nd',
-    '673&ndash;735',
-    '673&times;10/l',
-    '673,684',
-    '673,700',
-    '6732',
-    '6733',
-    '67373',
-    '673ff',
-    '673p',
-    '674&ndash;5',
-    '674(3)',
     '67414',
-    '67420',
-    '674210',
-    '67430',
-    '674357',
-    '6744m',
-    '674774',
-    '6749',
-    '674p',
-    '675&mdash;90/1',
-    '675&ndash;676',
-    '675&ndash;704',
-    '675,290',
-    '675.00',
-    '67555',
-    '67557',
     '675571',
-    '675760',
-    '675823',
-    '6759',
-    '675f',
-    '675g/1&frac12;lb/3',
-    '675hp',
-    '675kg',
-    '675p',
-    '676,000',
-    '676641',
-    '676926',
-    '676p',
-    '677&ndash;680',
-    '677(5)',
-    '677,100',
     '677052',
-    '67740',
-    '677601260',
-    '67770',
-    '677f',
-    '678&ndash;680',
-    '678&ndash;89',
-    '678,000',
-    '678,268',
-    '678-9',
-    '67801',
-    '67809',
-    '67811',
-    '6785',
-    '67870',
-    '67896',
     '679178',
-    '6791968',
-    '6793',
-    '6794',
-    '679447',
-    '67949',
-    '6796',
-    '6798',
-    '679a&ndash;f',
-    '679p',
-    '67:11',
-    '67:22',
-    '67a',
-    '67f.',
-    '67ff.',
-    '67pc',
     '67pp',
-    '67th-minute',
-    '67year-old',
-    '68&deg',
-    '68&deg&ndash;70&deg;f',
-    '68&deg&ndash;72&deg;f',
-    '68&deg&ndash;75&deg;f',
-    '68&deg;c',
-    '68&frac12',
-    '68&frac12;ft',
-    '68&frac45;km',
-    '68&ins',
-    '68&ndash;0',
-    '68&ndash;07',
-    '68&ndash;110',
-    '68&ndash;115',
     '68&ndash;2',
-    '68&ndash;5',
-    '68&ndash;67',
-    '68&ndash;68',
-    '68&ndash;69',
-    '68&ndash;70&ndash;68&ndash;73',
-    '68&ndash;71',
-    '68&ndash;74',
-    '68&ndash;76',
-    '68&ndash;80',
-    '68&ndash;85',
-    '68&ndash;87',
-    '68\'s',
-    '68(2)',
-    '68(i)',
-    '68,000,000',
     '68,000-member',
-    '68,000km',
-    '68,099',
-    '68,100',
-    '68,151',
-    '68,2',
-    '68,679',
-    '68,800,000ecu',
-    '68,856',
-    '68,966',
-    '68-',
-    '68-79',
-    '68-94',
-    '68-bedroom',
-    '68-day',
-    '68-metre',
     '68-mile-long',
-    '68-storey',
-    '68-ton',
-    '68-yard',
-    '68-year',
-    '68-years-old',
-    '68.0',
-    '68.0%',
-    '68.06m',
-    '68.07',
-    '68.1',
-    '68.1%',
-    '68.1ins',
-    '68.2%',
-    '68.30pm',
-    '68.32',
     '68.36%',
-    '68.55%',
-    '68.5kw',
-    '68.76',
-    '68.77',
-    '68.7secs',
-    '68.7x92',
-    '68.8/100000',
-    '68.8x94',
-    '68/1612',
-    '68/2',
-    '68/360/ec',
-    '68/68',
-    '680&ndash;700',
-    '68000-',
-    '68000-style',
     '68000s',
-    '6800rpm',
-    '68020s',
-    '68030/480dx',
-    '68030s',
-    '680551',
-    '68060-based',
-    '68070',
-    '6808m',
-    '680c&ndash;g',
-    '680d',
-    '680g/1&frac12',
-    '680p',
-    '680x0s',
-    '681&ndash;1',
-    '681(1)',
     '681,000',
-    '681,511',
-    '681-907',
-    '681.945.6',
-    '681155',
-    '68120',
-    '6814',
-    '68160',
-    '68188',
-    '6819',
-    '6819456',
-    '681999',
-    '682&ndash;683',
-    '682,000-strong',
-    '6820p',
-    '6821',
     '682207',
-    '682272',
-    '6824',
-    '682895',
-    '683&ndash;4',
-    '683&ndash;685',
-    '683.3%',
-    '68300',
-    '68302',
-    '683195',
-    '683311',
-    '68342',
-    '68349',
-    '6839',
-    '683924',
-    '683b&ndash;c',
     '683mw',
-    '684&ndash;686',
-    '684.01',
-    '6840',
-    '6841',
-    '6841.2',
-    '6846',
-    '68470',
-    '684884',
-    '685&ndash;6',
-    '685(4b)',
-    '685,000,000',
-    '6850',
-    '685222',
-    '685652',
-    '685e&ndash;f',
     '686&ndash;8',
-    '686,000',
-    '686,018',
-    '686.',
-    '686.12',
-    '6860',
-    '6860-yard',
-    '68600',
-    '686479',
-    '6868',
-    '6869',
-    '687,000',
-    '687/1',
-    '687/bapc.181',
-    '687/l',
-    '68733',
     '6876',
-    '687602',
-    '6879',
-    '688,000',
-    '688,430',
-    '688000',
-    '688101',
-    '688258',
-    '688292',
-    '688481',
-    '6889',
-    '688p',
-    '689966',
-    '689c&ndash;d',
-    '689f',
-    '689th',
     '68_per',
-    '68a',
-    '68cm',
-    '68d-e',
-    '68f&ndash;h',
-    '68ff',
-    '68ff.',
-    '68h',
-    '68kg/hl',
-    '68km',
-    '68lb',
-    '68lc040',
-    '68mhz',
-    '68s',
-    '68th-minute',
-    '68x110cm',
     '68x210cm',
-    '68year-old',
-    '69&frac12',
-    '69&ndash;0',
-    '69&ndash;100',
-    '69&ndash;103',
-    '69&ndash;162',
-    '69&ndash;76',
-    '69&ndash;77',
-    '69&ndash;86',
-    '69&ndash;87',
-    '69&ndash;91',
-    '69&ndash;92',
-    '69&ndash;96',
-    '69(2)',
-    '69(4)',
     '69(5)',
-    '69(a)',
-    '69,000,000',
-    '69,171',
-    '69,200',
-    '69,200,000',
-    '69,281',
-    '69,370,000',
-    '69,490,000',
-    '69,520',
-    '69,542',
-    '69,574',
-    '69,600',
-    '69,900,000',
-    '69-',
-    '69-67',
     '69-70',
-    '69-73',
-    '69-77',
-    '69-ball',
-    '69-minute',
-    '69-year',
-    '69.01',
-    '69.02',
-    '69.10',
-    '69.14p',
-    '69.2&ndash;81.9/1000',
-    '69.261&mdash;2',
-    '69.284&mdash;5',
-    '69.3',
-    '69.3%',
-    '69.315',
     '69.4',
-    '69.46',
-    '69.5%',
-    '69.52',
-    '69.6%',
-    '69.62',
-    '69.8',
-    '69.85%',
-    '69/670',
-    '69/73',
-    '69/96',
-    '690%',
-    '69001',
-    '69009',
-    '69021',
-    '69025',
     '690c',
-    '690m',
-    '690mff',
-    '691.26',
-    '691/4',
-    '6910',
-    '691024',
-    '691122',
-    '691211',
-    '69123/4/5',
-    '691400',
-    '691554',
-    '69191',
-    '691996',
-    '692,000',
-    '692,946',
     '69225',
-    '692269',
-    '692351',
-    '6926293',
-    '69292',
-    '693&ndash;704',
-    '693,624',
-    '693,700',
-    '693.14',
-    '693.97',
-    '693/4',
-    '6933',
-    '69330',
-    '6936',
-    '693rd',
-    '694,500',
     '6940',
-    '69400',
-    '694242',
-    '694m',
-    '695&ndash;98',
-    '695,000,000',
-    '69523',
-    '69535',
-    '6958',
-    '6959',
-    '696&ndash;8030',
-    '6960',
-    '696000',
-    '696155',
-    '69621',
-    '696551',
     '696697',
-    '6969',
-    '696969',
-    '696m',
-    '696p',
-    '697498/690227',
-    '6977',
-    '697m',
-    '698&ndash;700',
-    '698-0421.81',
-    '698.00',
-    '6980',
-    '69810',
-    '6983',
-    '698315',
-    '69833',
     '699,562',
-    '6990',
-    '6991',
-    '69950',
-    '69960',
-    '699609',
-    '699785',
-    '699930',
-    '69cm',
-    '69ff',
-    '69ff.',
-    '69ft',
-    '69lb',
-    '69m',
-    '69min',
-    '69mm',
     '69mph',
-    '69off',
-    '69th-minute',
-    '69year-old',
-    '6:00',
-    '6:00pm',
-    '6:1&ndash;2',
-    '6:1&ndash;21',
-    '6:10&ndash;19',
-    '6:11-17',
-    '6:13',
-    '6:14&ndash;18',
-    '6:14&ndash;27',
-    '6:15&ndash;17',
-    '6:177',
-    '6:18',
     '6:18f',
-    '6:19',
-    '6:19ff',
-    '6:1ff',
-    '6:2',
-    '6:2,6:4',
-    '6:22&ndash;27',
-    '6:24&ndash;30',
-    '6:25.0',
-    '6:25pm',
-    '6:28&ndash;10:29',
-    '6:3,5,10',
-    '6:32',
-    '6:33',
-    '6:34',
-    '6:35pm',
     '6:38',
-    '6:39',
-    '6:4&ndash;5',
-    '6:4&ndash;8:13',
-    '6:41',
-    '6:45',
-    '6:45f',
-    '6:48,51',
-    '6:5&ndash;9',
-    '6:50',
-    '6:51&ndash;52',
-    '6:52',
-    '6:54,56,63',
-    '6:8&ndash;12',
-    '6:8&ndash;13',
-    '6:8&ndash;17',
     '6a(3)',
-    '6a,6a',
-    '6a-p-m',
-    '6a-p-u',
-    '6a.',
-    '6a.m.',
-    '6ab.',
-    '6ae.',
-    '6ah',
-    '6an',
-    '6at',
-    '6au',
-    '6ax',
-    '6b&plus',
-    '6b\'s',
-    '6b,6c',
     '6b=',
-    '6bd',
-    '6bl',
-    '6bt',
-    '6by',
-    '6c+',
-    '6cc',
-    '6cm/',
-    '6cm/2&frac12;in',
-    '6cu',
-    '6db/oct',
-    '6dh',
-    '6dl',
-    '6dp',
-    '6ds',
-    '6dy',
     '6e5',
-    '6ea',
-    '6ee',
-    '6ez',
-    '6ft+.i',
-    '6ft-long',
-    '6ft-plus',
-    '6ft.2in.',
-    '6ft.4in',
-    '6ft10in',
-    '6ft8in',
-    '6ft9in',
-    '6g+er',
-    '6g+kr',
-    '6g+pr',
-    '6ghz',
     '6ha',
-    '6have',
-    '6hf',
-    '6hj',
-    '6hj.',
-    '6hp',
-    '6ht',
-    '6hy',
-    '6hz',
-    '6i',
-    '6ins.',
-    '6ish',
-    '6j',
-    '6jb',
-    '6jf',
-    '6jg',
     '6jh',
-    '6jl',
-    '6jp',
-    '6jr',
-    '6k5',
-    '6l/2',
-    '6l6-powered',
-    '6l6gc',
-    '6l6gcs',
-    '6ld',
-    '6lj',
-    '6ln',
-    '6ls',
-    '6m&sup2/litre',
-    '6m/20ft',
-    '6ma',
     '6mbps',
-    '6mg/1',
-    '6ml',
-    '6mm-thick',
-    '6mm.',
-    '6mmol',
-    '6ms',
-    '6n',
-    '6n-pentyl-2',
-    '6n3',
-    '6na',
-    '6nb',
-    '6nb.',
-    '6nf.',
-    '6november',
-    '6np',
     '6nq',
-    '6nu',
-    '6omph',
-    '6ozs',
-    '6p.',
-    '6p.m.',
-    '6p21',
-    '6p21.1-pter',
-    '6p21.3',
-    '6pf',
-    '6ph',
-    '6pj',
-    '6pm-8pm',
-    '6ppm',
-    '6pq',
-    '6ps',
     '6q',
-    '6qa',
-    '6qb',
-    '6qd',
-    '6qp',
-    '6qs',
-    '6qt.',
-    '6qx',
-    '6r',
-    '6rb',
-    '6rb.',
-    '6rg',
-    '6rp',
-    '6ru',
-    '6ry',
-    '6sec.',
     '6secs',
-    '6sf',
-    '6sl',
-    '6sn',
-    '6sq.m',
-    '6sr',
-    '6st',
-    '6sw',
-    '6sy',
-    '6t0',
-    '6tbsp',
-    '6te',
-    '6tg',
-    '6th&ndash;11th',
-    '6th&ndash;14th',
-    '6th/12th',
     '6th/7th',
-    '6ther',
-    '6ty',
-    '6uf',
-    '6univ',
-    '6up',
-    '6ux',
-    '6v1&ndash;4',
-    '6v395tb93',
-    '6va',
-    '6viiib',
-    '6x10evcm',
-    '6x14inch',
-    '6x1ml',
-    '6x3/4x1/4in',
-    '6x3in',
     '6x8',
-    '6xg',
-    '6xp',
-    '6xssc',
-    '6yds',
-    '6yn',
-    '6z',
-    '7%-of-gdp',
-    '7&agr;-hydroxycholesterol',
-    '7&amp;14total',
-    '7&amp;18',
-    '7&amp;frac12',
-    '7&commat;1/2-fold',
-    '7&deg;dh',
-    '7&formula',
-    '7&frac12&deg',
     '7&frac12&ins',
-    '7&frac12&times;10&frac12&ins',
-    '7&frac12;d.',
-    '7&frac12;ft',
-    '7&frac12;in.',
-    '7&frac12;ins',
-    '7&frac12;lb',
-    '7&frac12;lb.',
-    '7&frac12;points',
-    '7&frac14',
-    '7&frac34;p',
-    '7&ft&times;6&ft',
-    '7&khgr',
-    '7&mdash',
-    '7&mdash;11',
-    '7&mdash;13',
     '7&mdash;8',
-    '7&mdash;ie',
-    '7&middot;1',
-    '7&middot;4',
-    '7&middot;5cm/3inch',
-    '7&middot;5x15cm',
-    '7&middot;9',
-    '7&ndash;03',
-    '7&ndash;07',
-    '7&ndash;09',
-    '7&ndash;1&ndash;0',
-    '7&ndash;1&ndash;1893',
-    '7&ndash;1/7&ndash;2',
-    '7&ndash;10&ndash;1874',
-    '7&ndash;10-',
-    '7&ndash;10/100000',
     '7&ndash;102',
-    '7&ndash;103',
-    '7&ndash;10g/litre',
-    '7&ndash;10kcs',
-    '7&ndash;11&ndash;0',
-    '7&ndash;11&ndash;1885',
-    '7&ndash;11-year-old',
-    '7&ndash;12&ndash;2',
-    '7&ndash;13%',
-    '7&ndash;13th',
-    '7&ndash;14&ndash;0',
-    '7&ndash;140',
-    '7&ndash;15&ndash;0',
-    '7&ndash;16',
-    '7&ndash;187',
-    '7&ndash;1a',
     '7&ndash;1b',
-    '7&ndash;20km',
-    '7&ndash;25',
-    '7&ndash;25a',
-    '7&ndash;30a',
-    '7&ndash;30b',
-    '7&ndash;364',
-    '7&ndash;366',
-    '7&ndash;37',
-    '7&ndash;371',
-    '7&ndash;43',
-    '7&ndash;48',
-    '7&ndash;53',
-    '7&ndash;54',
-    '7&ndash;57',
-    '7&ndash;60',
     '7&ndash;7.30',
-    '7&ndash;7000',
-    '7&ndash;75',
-    '7&ndash;76',
-    '7&ndash;8&deg;c',
-    '7&ndash;8&mgr;g',
-    '7&ndash;86',
-    '7&ndash;8cm',
-    '7&ndash;8g/dl',
-    '7&ndash;8in',
-    '7&ndash;8min',
-    '7&ndash;8now',
-    '7&ndash;9.5',
-    '7&ndash;9/',
-    '7&ndash;90',
-    '7&ndash;9a',
     '7&ndash;a.d.',
-    '7&ndash;at',
-    '7&ndash;loa.m.',
-    '7&ndash;oct',
-    '7&plus',
-    '7&plusmn',
-    '7&pound',
-    '7&prime;00&prime',
-    '7&prime;19&prime',
-    '7&prime;53&prime',
-    '7&rehy;year-old',
-    '7&sharp;5',
-    '7&sol;8',
-    '7&times;10&ins',
-    '7&times;14&ins',
-    '7(1)&mdash',
     '7(10)',
-    '7(15)',
-    '7(1a)',
-    '7(8)',
-    '7(9)',
-    '7(a-c)',
-    '7(e)',
-    '7(i)',
-    '7+1',
-    '7+160',
-    '7+2',
-    '7+2+1',
-    '7+7',
-    '7,000,000-strong',
-    '7,000-hour',
-    '7,000-kilometre',
     '7,000-metre',
-    '7,000-or-so',
-    '7,000-population',
-    '7,000-room',
-    '7,000ft.',
-    '7,000km',
-    '7,000m3',
-    '7,000rpm',
-    '7,000yds',
-    '7,001',
-    '7,002,000',
-    '7,010',
-    '7,020,000',
-    '7,033-name',
-    '7,035',
-    '7,050',
     '7,072',
-    '7,083',
-    '7,1',
-    '7,10',
-    '7,100lbst',
-    '7,101',
-    '7,104',
-    '7,106',
-    '7,114-yard',
-    '7,134',
-    '7,144,884',
-    '7,154,000',
-    '7,157',
-    '7,17,7',
-    '7,183ft',
-    '7,187.72',
     '7,197',
-    '7,200,000',
-    '7,200bps',
-    '7,200gn',
-    '7,206ft',
-    '7,210',
-    '7,211,000',
-    '7,213ft',
-    '7,214',
-    '7,216,800,000',
-    '7,224-ton',
-    '7,225',
-    '7,230',
-    '7,243',
-    '7,245ft',
-    '7,246,317',
     '7,250,000',
-    '7,261',
-    '7,263',
-    '7,267',
-    '7,275',
-    '7,280',
-    '7,283,75',
-    '7,289-yard',
-    '7,295ft',
-    '7,296',
-    '7,3',
-    '7,316',
-    '7,327,439th',
-    '7,330&ndash;12,330',
-    '7,331',
-    '7,354,796',
     '7,358',
-    '7,362',
-    '7,363',
-    '7,370',
-    '7,374',
-    '7,375',
-    '7,376',
-    '7,378',
-    '7,384',
-    '7,394',
-    '7,427',
-    '7,429',
-    '7,430',
-    '7,433',
-    '7,459',
-    '7,460,000',
     '7,465',
-    '7,475',
-    '7,479,000',
-    '7,490',
-    '7,500-strong',
-    '7,500gn',
-    '7,500rpm',
-    '7,500sq.',
-    '7,509',
-    '7,512',
-    '7,540',
-    '7,550',
-    '7,563,000',
-    '7,574',
-    '7,582',
-    '7,597',
     '7,598',
-    '7,6',
-    '7,600-mile',
-    '7,625',
-    '7,637',
-    '7,646ft',
-    '7,647',
-    '7,650',
-    '7,655',
-    '7,656',
-    '7,667,769',
-    '7,671',
-    '7,676',
-    '7,682',
-    '7,698ft',
-    '7,7.5',
     '7,700,000',
-    '7,712',
-    '7,715',
-    '7,716lb',
-    '7,740',
-    '7,741ft',
-    '7,748',
-    '7,750',
-    '7,753',
-    '7,754pts',
-    '7,757',
-    '7,758',
-    '7,775',
-    '7,776',
-    '7,777,400',
-    '7,780',
     '7,781',
-    '7,787',
-    '7,790',
-    '7,798',
-    '7,8,9,10',
-    '7,804',
-    '7,812.5hz',
-    '7,816',
-    '7,837,000',
-    '7,840',
-    '7,848',
-    '7,853',
-    '7,855',
-    '7,874',
-    '7,875,448',
-    '7,880,000',
     '7,9',
-    '7,900m',
-    '7,921',
-    '7,931',
-    '7,932',
-    '7,960',
-    '7,964',
-    '7,974ft',
-    '7,989,000',
-    '7,995',
-    '7-0-29-2',
-    '7-11th',
-    '7-17',
-    '7-21',
-    '7-26',
-    '7-30pm',
     '7-4-93',
-    '7-52',
-    '7-7.45pm',
-    '7-8,000',
-    '7-82',
-    '7-84',
-    '7-alpha-dehydroxylase',
-    '7-amino-4-methylcoumarin-3-acetic',
-    '7-april',
-    '7-aside',
-    '7-band',
-    '7-chesterfield',
-    '7-chlorokynurenic',
-    '7-cm',
-    '7-cycle',
-    '7-days',
     '7-diphenyl-1.10-phenanthroline',
-    '7-in',
-    '7-ish',
-    '7-kpc-long',
-    '7-lap',
-    '7-litre',
-    '7-metre',
-    '7-monosulphate',
-    '7-month-long',
-    '7-nights',
-    '7-o',
-    '7-oct.',
-    '7-s9',
-    '7-seater',
-    '7-string',
-    '7-subunit',
     '7-term',
-    '7-tonne',
-    '7-tuple',
-    '7-wood',
-    '7.0&ndash;7.2',
-    '7.0&ndash;7.5',
-    '7.0&ndash;7.8',
-    '7.0&ndash;8.6',
-    '7.0&ndash;9.0',
-    '7.0.',
-    '7.00&ndash',
-    '7.00&ndash;21.00',
-    '7.00&ndash;8.00',
-    '7.000',
-    '7.00p.m',
-    '7.01.36',
     '7.02',
-    '7.02.56',
-    '7.03',
-    '7.03.32',
-    '7.04',
-    '7.04.28',
-    '7.05pm',
-    '7.05pm.',
-    '7.06',
-    '7.07',
-    '7.09',
-    '7.09.34',
-    '7.0bn',
-    '7.0d.p.c.',
-    '7.0g',
-    '7.0p',
     '7.0p.m',
-    '7.0x10',
-    '7.1&ins',
-    '7.1(a)',
-    '7.1.',
-    '7.1.6',
-    '7.1.7',
-    '7.10.92',
-    '7.100',
-    '7.104.39&mdash;40',
-    '7.10mhz',
-    '7.11(1)',
-    '7.11(2)-(4)',
-    '7.11(5)',
-    '7.11(a)',
-    '7.11(b)',
     '7.11.49',
-    '7.117',
-    '7.118.28',
-    '7.119.5',
-    '7.12(b)',
-    '7.12.',
-    '7.12.0',
-    '7.12/1',
-    '7.125',
-    '7.125%',
-    '7.15%',
-    '7.15&ndash;1.00a.m',
-    '7.15&ndash;9.15pm',
-    '7.15(2)',
-    '7.15(b)',
-    '7.15.5',
     '7.15a',
-    '7.15p',
-    '7.16p',
-    '7.19%',
-    '7.19m',
-    '7.1_per',
-    '7.1m',
-    '7.1p',
-    '7.1pc',
-    '7.1s.',
-    '7.1secs',
-    '7.2&deg;c',
-    '7.2&ndash;7.4',
-    '7.2&ndash;7.6',
-    '7.2-600',
-    '7.2.',
     '7.2.0',
-    '7.2.5.1',
-    '7.2.5.2',
-    '7.2.5.3',
-    '7.2.7&ndash;7.2.8',
-    '7.20pm',
-    '7.21&ndash;2',
-    '7.21.9',
-    '7.219',
-    '7.24&ndash;30',
-    '7.245',
-    '7.24p',
-    '7.25&ins',
-    '7.25&ndash;8.30',
-    '7.25ablimmin',
-    '7.25pc',
     '7.25pm',
-    '7.26(2)',
-    '7.26pm',
-    '7.277%',
-    '7.28&ndash;3.74',
-    '7.28(2)',
-    '7.282a.',
-    '7.29p',
-    '7.2b',
-    '7.2d',
-    '7.2km',
-    '7.2m',
-    '7.2oz',
-    '7.2p',
-    '7.2sec',
-    '7.2ve',
     '7.3&ndash;7.5',
-    '7.3&ndash;8.9',
-    '7.3(10)',
-    '7.3-7.5',
-    '7.3-kg',
-    '7.3.1.1',
-    '7.3.1.2',
-    '7.30&mdash;16.00',
-    '7.30&ndash;10.45pm',
-    '7.30&ndash;10pm',
-    '7.30&ndash;11',
-    '7.30&ndash;13',
-    '7.30&ndash;9,00pm',
-    '7.30&ndash;9.00pm',
-    '7.30&ndash;9.15pm',
-    '7.30&ndash;9.30',
     '7.30&ndash;9.30pm',
-    '7.308pm',
-    '7.30a.m.',
-    '7.30ish',
-    '7.30mhz',
-    '7.30p.m.',
-    '7.30pm&ndash;midnight',
-    '7.30pm.',
-    '7.313',
-    '7.32',
-    '7.331',
-    '7.34(4)',
-    '7.34(5)',
-    '7.340',
-    '7.347',
-    '7.348',
     '7.35&ndash;9.00',
-    '7.35gb',
-    '7.36&ndash;50',
-    '7.369',
-    '7.36sec',
-    '7.375%',
-    '7.376',
-    '7.38',
-    '7.382',
-    '7.38b',
-    '7.38kw',
-    '7.39%',
-    '7.3c',
-    '7.3d',
-    '7.3e',
-    '7.3p',
     '7.3pc',
-    '7.4&ndash;7.4.1',
-    '7.4(6)',
-    '7.4(c)',
-    '7.4(h)',
-    '7.4-litre',
-    '7.4.',
-    '7.4.2.',
-    '7.4.8',
-    '7.4/1000',
-    '7.4/a',
-    '7.40%',
-    '7.40pm',
-    '7.419',
-    '7.42sec',
-    '7.45%',
     '7.45&ndash;9.20',
-    '7.45am.',
-    '7.45m',
-    '7.46:1',
-    '7.47',
-    '7.48(1)',
-    '7.48(2)',
-    '7.49%',
-    '7.49(3)',
-    '7.4kb',
-    '7.4kms',
-    '7.4m/s',
-    '7.4p',
-    '7.4secs',
-    '7.5%.',
-    '7.5&ndash;10cm/3&ndash;4in',
     '7.5&ndash;38.4',
-    '7.5&ndash;7.8',
-    '7.5&ndash;8.5',
-    '7.5&ndash;9',
-    '7.5&ndash;9.0',
-    '7.5,7.5homesitters',
-    '7.5-',
-    '7.5-cm',
-    '7.5.2.1',
-    '7.5.5',
-    '7.5.6',
-    '7.5.7',
-    '7.5.9',
-    '7.50%',
-    '7.50pc',
-    '7.50x',
     '7.51',
-    '7.51410',
-    '7.51pm',
-    '7.52',
-    '7.52p',
-    '7.53p',
-    '7.54',
-    '7.58p',
-    '7.58pm',
-    '7.59',
-    '7.5bn',
-    '7.5ev',
-    '7.5ghz',
-    '7.5kg',
-    '7.5kyr',
-    '7.5m-wide',
     '7.5ml',
-    '7.5mm',
-    '7.5mph',
-    '7.5oz',
-    '7.5v',
-    '7.5x4cm/3x1&frac12;in',
-    '7.6&ins',
-    '7.6&ndash;8.0',
-    '7.6&ndash;8.5',
-    '7.6&ndash;9.0',
-    '7.6(1)',
-    '7.6(2)',
-    '7.6(3)',
-    '7.6(4)',
-    '7.6(a)',
-    '7.6-cm',
     '7.6.3.1',
-    '7.6.3.2',
-    '7.6.3.3',
-    '7.6.3.4',
-    '7.6.3.5',
-    '7.6.3.6',
-    '7.6.6.1',
-    '7.6.6.2',
-    '7.625',
-    '7.64',
-    '7.64p',
-    '7.6627',
-    '7.67',
-    '7.68%',
-    '7.69sec',
-    '7.6g/t',
     '7.6mm',
-    '7.6x10',
-    '7.7&ndash;30.3',
-    '7.7(1)',
-    '7.7(2)',
-    '7.7-percentage-points',
-    '7.7.3',
-    '7.7.5',
-    '7.7.6',
-    '7.7.7',
-    '7.7.8',
-    '7.7.9.1',
-    '7.70',
-    '7.70%',
-    '7.71%',
-    '7.71p',
     '7.73',
-    '7.74',
-    '7.75p',
-    '7.76%',
-    '7.77921',
-    '7.786',
-    '7.79845',
-    '7.7a',
-    '7.7kb',
-    '7.7km',
-    '7.7lbs',
-    '7.7p',
-    '7.7secs',
-    '7.8&ndash;15.4',
-    '7.8&ndash;8',
-    '7.8&ndash;8.1',
     '7.8(a)',
-    '7.8(b)',
-    '7.8.0',
-    '7.8.81',
-    '7.80',
-    '7.80%',
-    '7.83',
-    '7.83%',
-    '7.83p',
-    '7.85212',
-    '7.87',
-    '7.8bn',
-    '7.8pc',
-    '7.8ph',
-    '7.9&deg',
-    '7.9&times;10/l',
     '7.9(1)',
-    '7.9.12',
-    '7.93',
-    '7.94',
-    '7.95pc',
-    '7.99mmol',
-    '7.99pc',
-    '7.9g/t',
-    '7.9m',
-    '7/',
-    '7/-',
-    '7/1/87',
-    '7/10/91',
-    '7/100',
-    '7/11',
-    '7/11/87',
     '7/16',
-    '7/174',
-    '7/19',
-    '7/1973',
-    '7/225&deg;c/425&deg;f',
-    '7/3&frac12;d.',
-    '7/3/41',
-    '7/3/87',
-    '7/345',
-    '7/37',
-    '7/4',
-    '7/4/92',
-    '7/467',
-    '7/47',
-    '7/5',
-    '7/5/41',
     '7/501',
-    '7/58',
-    '7/63',
-    '7/7/87',
-    '7/71',
-    '7/72',
-    '7/76',
-    '7/77',
-    '7/80',
-    '7/87.',
-    '7/8th',
-    '7/9/87',
-    '7/90',
-    '7/901',
-    '7/92',
-    '7/93',
     '7/930',
-    '7/details',
-    '7/jg/26',
-    '7/lg',
-    '7/the',
-    '70%-88%',
-    '70&amp;degree:c',
-    '70&deg&ndash;75&deg;f',
-    '70&deg&ndash;80&deg;f',
-    '70&deg;f.',
-    '70&ft',
-    '70&ins',
-    '70&mdash;1',
-    '70&mdash;2',
-    '70&mdash;71',
-    '70&mdash;75%',
     '70&mdash;75p',
-    '70&mdash;78',
-    '70&mdash;80p',
-    '70&mdash;96',
-    '70&mgr;v',
-    '70&ndash;125',
-    '70&ndash;130',
-    '70&ndash;135',
-    '70&ndash;19',
-    '70&ndash;210mm',
-    '70&ndash;350',
-    '70&ndash;50',
-    '70&ndash;570',
-    '70&ndash;67',
-    '70&ndash;71%',
-    '70&ndash;73',
     '70&ndash;74',
-    '70&ndash;75f',
-    '70&ndash;78%',
-    '70&ndash;80&deg;c',
-    '70&ndash;80,000',
-    '70&ndash;810',
-    '70&ndash;82',
-    '70&ndash;84ha',
-    '70&ndash;9',
-    '70&times;48&ins',
-    '70\'s.',
-    '70\'x100\'',
-    '70(65)',
-    '70,000&ndash;90,000',
-    '70,000-capacity',
-    '70,000-copy',
     '70,000-watt',
-    '70,026',
-    '70,347,000',
-    '70,361',
-    '70,476,500',
-    '70,498',
-    '70,500',
-    '70,553',
-    '70,676',
-    '70,71',
-    '70,714',
-    '70,975.8',
-    '70-42',
-    '70-66',
-    '70-71',
-    '70-71-77-67',
     '70-71mph',
-    '70-75',
-    '70-85',
-    '70-89',
-    '70-90',
-    '70-90mm',
-    '70-acre',
-    '70-bed',
-    '70-bedroom',
-    '70-berth',
-    '70-c',
-    '70-day',
-    '70-degree',
-    '70-fold',
-    '70-foot',
-    '70-kilometre',
     '70-km',
-    '70-minute',
-    '70-page',
-    '70-seater',
-    '70-something',
-    '70-store',
-    '70-string',
-    '70-ton',
-    '70-wicket',
-    '70.0',
-    '70.0%',
-    '70.150',
-    '70.23',
-    '70.4',
-    '70.43',
-    '70.5',
     '70.6%',
-    '70.61',
-    '70.7',
-    '70.8%',
-    '70/1',
-    '70/1251',
-    '70/71',
-    '700&ft',
-    '700&micro;mol',
-    '700&micro;s',
-    '700&ndash;1,000',
-    '700&ndash;1,000rpm',
-    '700&ndash;1050',
-    '700&ndash;200',
-    '700&ndash;701',
-    '700&ndash;712',
     '700&ndash;799',
-    '700&ndash;800m',
-    '700&ndash;900',
-    '700&ndash;900%',
-    '700\'s',
-    '700,000,000',
-    '700-750',
-    '700-800',
-    '700-acre',
-    '700-feet-long',
-    '700-km',
-    '700-litre',
-    '700-metre',
-    '700-odd',
-    '700-seat',
-    '700-seater',
     '700-terminal',
-    '700-watt',
-    '700.70',
-    '700/13/a/92',
-    '700/13a/92',
-    '700/47/93',
-    '700/900',
-    '700/92',
-    '700/rxs',
-    '7000-acre',
-    '700000',
-    '700009',
-    '700047',
-    '70007,5557',
-    '70009',
-    '7000i/nt',
     '7000k',
-    '7000rpm',
-    '70010',
-    '70014',
-    '70014/49',
-    '7002',
-    '700433',
-    '70048',
-    '7008',
-    '70080',
-    '700896',
-    '7009',
-    '700c',
-    '700f',
-    '700ft/min',
-    '700hp',
     '700hz',
-    '700m-1300m',
-    '700mg',
-    '700millimetres',
-    '700myr',
-    '700nm',
-    '700pc',
-    '700x170mm',
-    '700yds',
-    '701,000',
-    '701,645',
-    '701.2',
-    '7010',
-    '701069',
-    '7011',
-    '7012',
     '70120',
-    '70131',
-    '701314',
-    '701338',
-    '701660',
-    '701668',
-    '701693',
-    '7017',
-    '7018',
-    '701a&ndash;d',
-    '701es',
-    '702&ndash;3',
-    '702&ndash;7',
-    '702.5',
-    '7022/06',
-    '7023',
     '702316',
-    '7025',
-    '7025/12ax7a',
-    '702534',
-    '7026',
-    '7027',
-    '7028',
-    '7029',
-    '702972',
-    '702bp',
-    '702e&ndash;f',
-    '702h',
-    '702mb',
-    '703,000',
-    '703,700',
-    '70307',
     '70309536',
-    '703131',
-    '703212',
-    '70332',
-    '70333',
-    '703410',
-    '70370',
-    '703948',
-    '703a',
-    '703ff',
-    '704&ndash;5',
-    '704&ndash;681',
-    '704&ndash;9',
-    '704,350',
-    '7040',
-    '704112',
     '7043',
-    '7044',
-    '7045',
-    '70466',
-    '704ad',
-    '704c&ndash;d',
-    '705&ndash;15',
-    '705&ndash;170',
-    '705&ndash;7',
-    '705&ndash;706',
-    '705&ndash;9',
-    '705,000',
-    '7050/75',
-    '7052xc',
-    '7053',
-    '705524',
     '7056',
-    '705601',
-    '705676',
-    '7057.3',
-    '7058',
-    '705ft',
-    '705m',
-    '705mt',
-    '706&ndash;1232',
-    '706&ndash;707',
-    '706-v',
-    '706/2',
-    '7060.',
-    '7061',
-    '7062',
-    '706527',
     '706844',
-    '706999',
-    '707&ndash;300',
-    '707-loads',
-    '707/1',
-    '707/100',
-    '707/400',
-    '707/436',
-    '7071',
-    '7072',
-    '7073',
-    '7074',
-    '7076',
-    '707712',
-    '7078',
-    '708,759,748',
     '708,790,691',
-    '708,840,126',
-    '708-0338',
-    '7080m3',
-    '709&ndash;16',
-    '709100',
-    '709200',
-    '7092714',
-    '70930',
-    '7094',
-    '7095',
-    '7099',
-    '709m',
-    '709p',
-    '70:100',
-    '70:20:10',
     '70_per',
-    '70ad',
-    '70bp',
-    '70cc',
-    '70cms',
-    '70cu',
-    '70d',
-    '70db',
-    '70ff.',
-    '70hz',
-    '70in',
-    '70kbp',
-    '70kton',
-    '70lb.',
-    '70ma',
-    '70mg',
     '70mh',
-    '70mins',
-    '70no',
-    '70ns',
-    '70o',
-    '70pv',
-    '70r.',
-    '70s&deg;f',
-    '70s-orientated',
-    '70yds',
-    '70yearsscharge',
-    '70yrs',
-    '71&deg;10\'',
-    '71&deg;c',
-    '71&frac12&ndash;8cms',
-    '71&mdash;2',
     '71&mdash;no',
-    '71&ndash;10',
-    '71&ndash;4',
-    '71&ndash;52',
-    '71&ndash;6',
-    '71&ndash;61',
-    '71&ndash;7',
-    '71&ndash;73',
-    '71&ndash;74',
-    '71&ndash;85',
-    '71&ndash;95',
-    '71&times;10/l',
-    '71(2)',
-    '71(4)',
-    '71,279',
-    '71,305',
     '71,355',
-    '71,489',
-    '71,500',
-    '71,527',
-    '71,730,000',
-    '71,75',
-    '71-1',
-    '71-45',
-    '71-72mph',
-    '71-article',
-    '71-year-olds',
-    '71.0',
-    '71.03',
-    '71.09',
-    '71.1',
-    '71.1&times;106.7',
     '71.25',
-    '71.27%',
-    '71.274',
-    '71.31',
-    '71.33',
-    '71.34',
-    '71.3m',
-    '71.5%',
-    '71.59',
-    '71.5x49cm',
-    '71.6%',
-    '71.61',
-    '71.69',
-    '71.7%',
-    '71.70',
-    '71/115',
     '71/1408',
-    '71/73',
-    '71/75',
-    '71/sps/211/209',
-    '710,000',
-    '710,850',
-    '71000\'s',
-    '7101',
-    '710276',
-    '7103',
-    '710353',
-    '710414',
-    '71046',
-    '710472',
-    '710527',
-    '7106',
     '7108',
-    '710971',
-    '710lbs',
-    '710m',
-    '711,800',
-    '71111',
-    '711121',
-    '71127',
-    '711333',
-    '711398',
-    '711623',
-    '71171',
-    '7118',
-    '711pm',
-    '712&ndash;13',
-    '712036',
     '712291',
-    '7123',
-    '712406',
-    '7125',
-    '71260',
-    '712794',
-    '71290',
-    '712910',
-    '712mw',
-    '713&ndash;20',
-    '713,700',
-    '713-711',
-    '713.',
-    '7132',
-    '713215',
-    '7133',
     '71344',
-    '7134m',
-    '71369',
-    '713822',
-    '713828',
-    '713838',
-    '713895',
-    '7139',
-    '71390',
-    '713p',
-    '714,286',
-    '714,647',
-    '714.67',
-    '714073',
-    '714108',
-    '714167',
     '714340',
-    '714342',
-    '714548',
-    '715%',
-    '715\'s',
-    '715,000,000',
-    '715-mile',
-    '715/l',
-    '7150',
-    '715422',
-    '715454',
-    '715735',
-    '715e',
-    '715ff.',
-    '715s',
-    '716&ndash;18',
     '716&ndash;7',
-    '7160',
-    '716021',
-    '71619',
-    '71626',
-    '71631',
-    '71638',
-    '71658',
-    '7168',
-    '7170',
-    '717277',
-    '717521',
-    '71770',
-    '71790',
-    '717962',
-    '717g&ndash;h',
     '718,1975&ndash;6',
-    '718,300',
-    '718/769',
-    '7180',
-    '7181',
-    '7182',
-    '718267',
-    '7188',
-    '718c',
-    '718f',
-    '719&ndash;22',
-    '719,000',
-    '719,502',
-    '719-strong',
-    '7190-2770-5',
-    '71900',
     '71926',
-    '719276',
-    '71960',
-    '719842',
-    '719922',
-    '719b&ndash;c',
-    '71a',
-    '71b',
-    '71min',
-    '71no',
-    '71w',
-    '71year-old',
-    '72&deg',
-    '72&deg&ndash;80&deg;f',
-    '72&ins;x24%ins',
-    '72&mdash;5',
     '72&ndash;10',
-    '72&ndash;154',
-    '72&ndash;6',
-    '72&ndash;7',
-    '72&ndash;73&deg;f',
-    '72&ndash;74',
-    '72&ndash;78',
-    '72&ndash;82&deg;f',
-    '72&ndash;85&deg;s',
-    '72(1)',
-    '72(2)',
-    '72(27%)',
-    '72(3)',
-    '72,000-capacity',
-    '72,000-gate',
-    '72,000-mile',
     '72,200,000',
-    '72,220,000',
-    '72,500',
-    '72,559',
-    '72,900',
-    '72-145',
-    '72-20',
-    '72-65',
-    '72-78',
-    '72-90',
-    '72-deg',
-    '72-ft',
-    '72-hour-limit',
-    '72-km',
-    '72-mile',
-    '72-month',
     '72-nation',
-    '72-period',
-    '72-year',
-    '72-years-of-age',
-    '72.0',
-    '72.05',
-    '72.06',
-    '72.15',
-    '72.2%',
-    '72.2.3',
-    '72.3',
-    '72.3%',
-    '72.32',
-    '72.42',
-    '72.61',
-    '72.7',
     '72.73%',
-    '72.8',
-    '72.8%',
-    '72.85',
-    '72.94%',
-    '72.9m',
-    '72/194',
-    '72/38',
-    '72/574',
-    '72/650',
-    '720%',
-    '720&times;10/l',
-    '720-',
-    '720-tonne',
-    '720/730',
-    '7200m',
     '720391',
-    '720460',
-    '7208',
-    '720849',
-    '7209',
-    '720hp',
-    '720hz',
-    '720mm',
-    '721&mdash;2177/2288',
-    '721&ndash;2',
-    '72110',
-    '721121',
-    '721262',
-    '721583',
-    '72190',
-    '721937',
     '721c',
-    '721st',
-    '722&ndash;705',
-    '722(2)',
-    '722089',
-    '7221',
-    '722159',
-    '722212',
-    '722611',
-    '72272',
-    '722891',
-    '7229',
-    '722c',
-    '723&ndash;4',
-    '723&ndash;725',
-    '723&ndash;726',
     '723,900',
-    '723021',
-    '72314',
-    '723176',
-    '723238',
-    '7234',
-    '723507',
-    '72351',
-    '723557',
-    '723625',
-    '723785',
-    '723799',
-    '723814',
-    '723888',
-    '723922',
-    '724&ndash;2992',
     '7240',
-    '724226',
-    '724369',
-    '7244-5627',
-    '7245',
-    '724546',
-    '724648',
-    '724698',
-    '7249',
-    '72496',
-    '725&mdash;6',
-    '725&ndash;67',
-    '725(1)',
-    '725,00',
-    '725/6',
-    '725001',
     '725218',
-    '725224',
-    '725453',
-    '725544',
-    '72571.1341',
-    '725741',
-    '725757',
-    '725961',
-    '725k',
-    '725kg',
-    '725p',
-    '726.00',
-    '726/1326',
-    '7260',
-    '7260m',
-    '726234',
     '7265',
-    '726lb',
-    '727&ndash;214',
-    '727&ndash;728',
-    '727.2%',
-    '7270',
-    '7271',
-    '7277',
-    '72780',
-    '727855',
-    '72791',
-    '728,000',
-    '728612',
-    '728728',
-    '728822',
-    '728890',
     '728b',
-    '728p',
-    '729&ndash;2300',
-    '729&ndash;3200',
-    '729&ndash;37',
-    '7290',
-    '729904',
-    '729905',
-    '72997058',
-    '729p',
-    '72:10',
-    '72:25',
-    '72:55&ndash;59',
-    '72a',
-    '72cm',
-    '72f',
     '72hrs',
-    '72kg/hl',
-    '72km',
-    '72mcs',
-    '72min',
-    '72mm',
-    '72nd-minute',
-    '72nd-scale',
-    '72pp.',
-    '72s',
-    '72storey',
-    '72v',
-    '72xx',
-    '73&deg&ndash;77&deg;f',
-    '73&deg;cmyr',
-    '73&deg;n',
     '73&frac12;p',
-    '73&mdash;4',
-    '73&ndash;103%',
-    '73&ndash;35',
-    '73&ndash;48',
-    '73&ndash;5',
-    '73&ndash;7',
-    '73&ndash;72',
-    '73&ndash;74',
-    '73&ndash;74&deg;f',
-    '73&ndash;74&ndash;71',
-    '73&ndash;77',
-    '73&ndash;78',
-    '73&ndash;79&deg;f',
-    '73&ndash;82',
-    '73&ndash;82&deg;f',
     '73&ndash;83',
-    '73&ndash;84',
-    '73&ndash;92',
-    '73&ndash;98',
-    '73&percnt',
-    '73(1)',
-    '73,106',
-    '73,267',
-    '73,295',
-    '73,310',
-    '73,370',
-    '73,400',
-    '73,487',
-    '73,600',
-    '73,800',
-    '73,887',
     '73,979',
-    '73-24',
-    '73-59',
-    '73-68-70',
-    '73-86',
-    '73-and-a-quarter',
-    '73-lap',
-    '73-yard',
-    '73.1%',
-    '73.1pc',
-    '73.21',
-    '73.25',
-    '73.3%',
-    '73.33',
-    '73.4',
-    '73.4bn',
     '73.51p',
-    '73.5p',
-    '73.91',
-    '73/148',
-    '73/74',
-    '73/84',
-    '730&ndash;4',
-    '730&ndash;8490',
-    '730-mile',
-    '730431',
-    '7305111',
-    '730760',
-    '730m',
-    '731-2',
-    '731/2',
-    '7310',
     '731133',
-    '73117',
-    '73120',
-    '73123',
-    '73142',
-    '731566',
-    '7319',
-    '731c&ndash;d',
-    '731m',
-    '732&mdash;3',
-    '732-1',
-    '732/989',
-    '7320',
-    '732272',
-    '7325',
-    '7325m',
     '732716',
-    '733,450',
-    '733076',
-    '7331476',
-    '733411',
-    '733583',
-    '7337256',
-    '733733',
-    '733842',
-    '733855',
-    '73390',
-    '733987',
-    '734&ndash;40',
-    '734&ndash;5',
-    '734,000,000',
-    '734-0111',
     '734085',
-    '73452',
-    '7347018',
-    '7349708',
-    '734ft',
-    '734p',
-    '735&ndash;804',
-    '7350340',
-    '73511',
-    '735226',
-    '735272',
-    '735299',
-    '7353',
-    '73547',
-    '73592',
-    '735e&ndash;f',
     '735p',
-    '736&ndash;737',
-    '736.71',
-    '736403',
-    '7368/91',
-    '73680',
-    '73692',
-    '736a',
-    '736b&ndash;c',
-    '736f',
-    '736p',
-    '736pp.',
-    '737\'s',
-    '737,1&ndash;11',
-    '737,757',
-    '737-300',
     '7375',
-    '737555',
-    '737e&ndash;f',
-    '738&ndash;40',
-    '7380',
-    '7381',
-    '73850',
-    '73873',
-    '73880',
-    '7389',
-    '738g',
-    '739&mdash;residence',
-    '739&ndash;1111',
-    '739&ndash;740',
-    '739(2)',
-    '739(3)',
     '73900',
-    '739190',
-    '739447',
-    '739501',
-    '739596',
-    '739a&ndash;c',
-    '73a-d',
-    '73bhp',
-    '73cm',
-    '73d',
-    '73ft',
-    '73no',
-    '73pstg',
-    '73si',
-    '74&deg&ndash;80&deg;f',
-    '74&deg;42\'n',
     '74&frac34;in',
-    '74&ins;x&times;78&ins',
-    '74&ndash\'79',
-    '74&ndash;3',
-    '74&ndash;485',
-    '74&ndash;75',
-    '74&ndash;8',
-    '74&ndash;80',
-    '74&ndash;82',
-    '74&ndash;84',
-    '74&ndash;93%',
-    '74&rehy;year-old',
-    '74\'s',
-    '74,000,000',
-    '74,297',
-    '74,300',
     '74,311',
-    '74,531',
-    '74,535',
-    '74,627',
-    '74,726',
-    '74,824',
-    '74-145',
-    '74-149',
-    '74-75',
-    '74-country',
-    '74-gun',
-    '74-year',
-    '74-year-olds',
-    '74.0',
-    '74.00',
-    '74.2%',
     '74.25',
-    '74.6%',
-    '74.66',
-    '74.7',
-    '74.7%',
-    '74.8%',
-    '74/',
-    '74/208',
-    '74/428:455',
-    '740\'s',
-    '740,832',
-    '740/1339&ndash;40',
-    '740/l',
-    '74001',
-    '7400kg',
-    '7400rpm',
     '7404',
-    '740606',
-    '7407',
-    '74075',
-    '740g',
-    '740g/1&frac34;lb',
-    '740kb',
-    '740mp',
-    '740pp.',
-    '741&ndash;742',
-    '741&ndash;880w',
-    '7410',
-    '7411',
-    '741111',
-    '741f',
-    '741h',
     '742&ndash;743',
-    '742(8)',
-    '742(9)',
-    '742,207',
-    '7420',
-    '742027',
-    '742048',
-    '742070',
-    '742d',
-    '743(3)',
-    '743(5)',
-    '743.03',
-    '743000',
-    '743141',
-    '743199',
-    '7433221',
     '7438',
-    '743ft',
-    '744,000',
-    '7440',
-    '744161',
-    '744198',
-    '744230',
-    '7443',
-    '7444',
-    '7448',
-    '7450',
-    '745102.',
-    '74537',
-    '7454',
-    '7455',
-    '745575',
     '7456',
-    '746&ndash;7',
-    '746&ndash;749',
-    '746.1',
-    '746/7',
-    '7460',
-    '7460452',
-    '7462/1',
-    '74632',
-    '7466',
-    '74680',
-    '74689',
-    '747&ndash;200',
-    '747&ndash;50',
-    '747&ndash;748',
-    '747,304',
     '747,390',
-    '747-400',
-    '747-sr46',
-    '747-type',
-    '747.00',
-    '74720515',
-    '747707',
-    '747800',
-    '74790',
-    '748&ndash;2190',
-    '748,000,000',
-    '748,019',
-    '748-including',
-    '7480',
-    '748000',
-    '7482',
     '7485/91',
-    '7485056',
-    '74880',
-    '748p',
-    '749&ndash;750',
-    '749(hl)',
-    '7495',
-    '7499',
-    '749ad',
-    '749d',
-    '749h',
-    '74:skk864',
-    '74b',
-    '74bed',
-    '74c541',
-    '74d',
     '74f',
-    '74ills.',
-    '74l7',
-    '74ls74',
-    '74mph',
-    '74w',
+)
+
+blocks_91 = (
+    '#!m#!n#"st%#-fm#$watt"#100##235##382#"40##521$!3#!7")2&ndash;1*!4+"85',
+    '+#186+"23#$,000$#684##032#!2#!5#*6&ndash;31$$.25i##872##h\'s")3&ndash;4#$,000$#670#"/l',
+    '#"36##523#!6##759#"94#!p"+4&ndash;525,!7#!0#!1#"20$!8"+5&ndash;456*%625kg#$,100',
+    '%$ubic##.4%#\'0-based$"00#"11#!2$!5#!4$"88##528$"55#"70#"hp#!p#"td',
+    '*!7#$,000\',-square-foot#%.5khz#!0$!0#"20##306##464#$7(4)#"93$!9"+7&ndash;565#"\'s##.08',
+    '$#648$!9#!3#&7-5249#)a&ndash;c#!h#!p"+8&ndash;529#$,000$#764##.00#"20##421##788##800',
+    '#!h"%9,000#!1$!0##292#!3#!m"#:10#"48#.diagram/figure"#b/w#!c"!c"#ff.#"t.',
+    '""in"$mbps#"hz#"in#"ph""pp"#sec""xx!\'3&deg;n\'!s#(frac12;p$!t##ins#(mdash;68)!7',
+    '#)ndash;130*"50)"36)154:diagram/figure*!5)#6.7*!0*!7*!8)+70&ndash;33)"83*!4#&percnt#*times;10/l""\'n',
+    '"\'(2)ta88#"4)""+5"&,000in##200$"97##340$!7#\'500,000%!2$"14$"49##642%!4$"81',
+    '##800##900$"71$&99,998"!-#"50#$byte#&footer#&member$#ile#%point##run#$seat$$tate#$word',
+    '$!9#"16$$9sec#"27#(3&percnt$!1$!2$$8sec#"47#"54$!5$!m##637#"70$!4',
+    '#"96"!/#)1&ndash;2$)2&ndash;3##447&8,123/517,148/542,154/548#)5&ndash;1##631#"79"+0&ndash;520+"33*"70#$,050#".2%!0',
+    '#"40$!5$"78#!6##bhp$!p#)d&ndash;e#!f#!i$%/540i##lbs#"nm",1&ndash;4610#$,400%"45',
+    '#)b&ndash;d#!p"*2&ndash;40*#537*!6*!7#(,000,000$#370#%-page#".5##044#!3#&5:1983#!7$!7',
+    '#&crm721"33,000&ndash;666,000#!2$"23##322#!5#!6#"mm#"rd"*4&mdash;47$)ndash;509#$,000$#996#+.63&ndash;6#!0',
+    '$"54#!2#"30#"43#!6$!1#!8#"90##khz"+5&ndash;537##(2)#".3#!0$!0$#rpm',
+    '$"74#!5$"96#!6#!7#!8$!0##959#"cc#"hp")6&ndash;7#%/1584#*053&sol;23#(19/54492#,28&sol;53931',
+    '#!6#!9#!b#!p"+7&ndash;556*!8#$,000##.4%#!1#"20$"54#!4#!5##681#!8',
+    '#!9"&8-code#"08$!9#!1##333$!5#"44#!8#!p"+9&ndash;554#$,000$#410$#690#*.1+621.039',
+    '%"31#!1#!2#!3#"bc#!p"":5"$c810#!m"!e""ff""km"#mpg""no""pp',
+    '""s.#"ec!\'4&deg;f\'!s#(frac12;p$!t##ins&";.#\'mdash;5*!7#\'ndash;1*"14*"57)"21)!3',
+    ')"41*!6)\'55kg/hl*\'6&deg;c)"60*!8)"72#&percnt""\'n"$(03)##13)#"5)"(,000,000$"37$"54',
+    '$"74##360#\'469,000##539##600&$,000$&25,000##758$&77,615$&80,000##800&$,000%%7,420$$25.0(#0km',
+    '$"43$&88,444"!-#!1$!6#!3#"56$!7##cap$#opy#$mile#$runs#$slot#\'vehicle"#.04',
+    '$!3$!4$"56#"2%$!1#"30$!3$!7#"4%$!1$!4$$6sec$"pc##50p$"5%',
+    '##671#"7%$".2$"86##804$"6%#"9%$!7"$/250",0&ndash;1000*!2*#510+"41*%600kg+$20kg',
+    '#(,000,000##-km$%metre$!r$&strong#"0m#!1#"43##766##959#!i#%kcals$!g#"mm##pto',
+    '#$x480"+1&ndash;544#$-day#".6#!0$!6#!1##204$!8#"37#!5$!0#"du#!p"%2,000',
+    '##.2p#!2$!0#!3#!4#"60$"54#!7##815#!b#"km#"nd"+3&ndash;630#$,000#\'-member',
+    '##/69#!1##250#!4##500#"80#"fx")4&ndash;5#$,000#(-members#%.1mph$"2m##099##699##804',
+    '##pp.""5%#$,000\'$,000#(-members$$yard##.00$!7#!0#&4-4743$".5##535#"kg")6&ndash;7#$,200',
+    '##398#!g#"mm#!p"*7&mdash;55$*ndash;1420+#764#$,000#".6#!0#!1#!3#!7$!0#!8',
+    '"*8&ndash;53#$,502#%.25km#!0$"46#"53#!g#!p$"p."*9&ndash;50#".5#$/791#)09/512526#!7##911',
+    '"":4"!b#!c"!c"!e""ff"!g""kb#!m"#mpg$!h"!o""pa"#sec!(5&deg;59',
+    '#.mdash;60&deg;s)"84#)ndash;110+!7)"20)!3)"43*!4*!5)\'59-year)#60%*$5myr*!7)#71%*!5',
+    '*!8""\'s"#(2)#"a)#"i)"$+161"(,000,000$"61##200##300$"83##400$"57$"62##598',
+    '$!5$"81#\'700,000##800$"68$&73,000$"93%!6#\'900,000$&37,000$"46""-3#"47#"57$!9',
+    '#"75##904##day#&gallon#"lb#,mile-two-day#&nation#$over\'!s#%piece$#lus\'"es#$seat\'"er$%trong',
+    '#$yard"#.08$!p#"1%$!0$!1$!6#"3%#"42$"4%$!5$!6#"56$#mhz#"64',
+    '#"74#.8&times;91.5cm#!9$%x40.6"$/449#"56##683#"76$!7""0%#*&ndash;554*#600*#750*$8725##,00',
+    '$#310$#734#!-$"bp$$mile$%space$$torr$$uses#"00$!2$!3$!s#!2#"32$"41',
+    '$!0##555$!7##630#"bp#"cc#"ft#!g#"ha$!p$!z#!k$!b$$cals$!m',
+    '#"lb#"ml#"sq#$watt"+1&ndash;479*"74#".3$#509%"77&!8&!9#"/2#!0#!1#"51',
+    '+!1#$,000#".0#%/1317$#61t##080$"99#!2#!5$!1#"67#"81"&3-2700#".8#!2',
+    '$!2#!6$"22#!b"*4&frac12;p#$,000\'$,000%"15#!0$"60#!1$"44#!4$!0$!3',
+    '#"76##854##988#!p"+5&ndash;556*"72+"40#"\'s#$,000$$1989$#600#!0$\'3/55523#!1$"00',
+    '%!3##545$!8#"62##822#$aaaa#!m")6&ndash;3#$,000#!1$"07#$2618##610##962"+7&ndash;559',
+    '##291#!b#)c&ndash;f"$8.2%#!0#,3&ndash;5584#,4&ndash;5586#!7#!9"*9&ndash;60#$-568#!0##404#!5#"70',
+    '#"82$"55##922$"44"#:24#!8"!a"!b#!c""cm"%f&deg#"f.""in"!k#&g/n/ha',
+    '$!s"\'m/60yds#"pg#$scfd""no"!o"$p-72",sgi6007.15.5"!x"(year-old!\'6&deg;f#"ft#)ndash;120*!7)"37',
+    ')"58*!9)!6*!4*!5*!6*!8)#78%)#82%)"93#&percnt"#(2)"$,219##300##500',
+    '##700$"95##826$"37$"84"#-13#%43050#"56$!8#"60#"78##974#$acre#%b2930##day',
+    '#$mile%$nute#$seat%#con$#hot"$.04m##11%$!4#(2&deg;c.$!5#"3%#"41%!.$!6%!.',
+    '$!p#"53#!6$!7#"87#"91"%/1984#"60$!5#"ni"%0,026$#500$#875#*-kilometre%!m',
+    '#"00$#lbs$!m$#rpm#"14$!5$"78#"30#"41$"23#"70$!1$"77$"94#)c&ndash;e',
+    '#$mbps$"ph$!v$"yr##pp.")1&mdash;7+!5*"84*"92$*ndash;1048*!2*"87#$,800##.7%#"/2',
+    '$"66#!1$"80#!2#!4#!5$"45#!6#!7#!9"#210$!m#!2$!0#"40',
+    '#"83#"mw#!p"+3&ndash;571*!6#".4#"21#!3#!4##7\'s##890#!9#)b&ndash;e#!h#)km/350mls',
+    '#!p")4,000,000$#100$#655$#739##.5m#"00$"84#!2#$3052#!4#"80#!f""5%#$&deg',
+    '+"78#$,000##-km#"10#!2#!4##656##953#"bc"%6,994##.2%$"7%##262#"79#"90',
+    '$(&ndash;c"&7-yard##/73##123#"20##595#!6#"77#!8#!k#!p")8&ndash;9$&plus;3#$,000$#474',
+    '$"/4$!0##664#!b#"ml#!p"%9,259#%-yard#!0#!4#!5#!6$%-7146$"52"#:18',
+    '$!5#!7"!a")b&ndash;c"!c#!m$+&times;76cm"!e"#ff."!g""in""kb$"ps#!g""lb',
+    '""s.##ecs!#7%."&&deg;c(#/km\'!f#\'mdash;9$\'iddot;3#\'ndash;0)!1)!3*!3)"58+/:diagram/figure)"60',
+    '+!1*!8)"71)"82*!7)$ball"!\'"%(78%)""**"+,000-strong$&19,000$&65,000#\'100,000$"70#\'200,000',
+    '$"79##403$&70,000##500&$,000##649$"84##700##800##900"#-10#"37#$ball#\'megaton##run',
+    '#)years-old"$.00m$!1$!8#!1$)&ndash;10$!5$!8$!9$"kg#"2m#"30#\'4&deg;c$!0$!1',
+    '##50m$!5$"kw#%62sec$"3%#"74#"8%$"4%$!8##95%"$/015##539"+0&ndash;526+"72#"\'s',
+    '#"00#!1#!5##600#!9$"83#!k#!m""1.$!2$!3$!5$!6$!9#!1',
+    '$"28##611#!7#"80$"18#!9"%2,000#".2$!8#$1.11#!3#!4#!5#!8#$:608',
+    '$!p"%3,604$#810#".9#$/102#"00#"10#!3#"50$"60##653##725#!8$"82#"rd',
+    '##255#"35##548#"61#!8$!2##995##ff."+5&ndash;600#$,800#$/388#(0/i.s.o.#"10##237#!5',
+    '##618#"90#)c&ndash;g#!e#-g/1&frac14;lb#!p"+6&ndash;578#$,000$#555#%-mile#!3#"45#!8##920#)a&ndash;c',
+    '#\'-member##.38$"8%#!0$"00#!3#!4$!0#!5$!5#"73#!9#)c&ndash;d""86"+9&ndash;580',
+    '$#380#%-2424#!1$"10##226#!3$"13#!e#!p#)th-ranked"#:32#"42"!c"&iii504"!k',
+    '""no"!s#!.")th-minute"\'x68&ins!\'8&amp;c#2deg&ndash;60&deg;f-(70&deg;f&";f#"ft#(mdash;61)"85)!9$\'iddot;4*!9',
+    ')#233*!4+!0*!5*"91)"32*!7)"42*"6.)"52*!8)"60*!1*!5*!6',
+    '#\'sol;154#*times;10/l""\'s"#(2)#"3)"(,000,000##160##497##533$"92##991""-0#!3#"53#$acre',
+    '$%ooter#$inch#&member$%inute#$page"".0$"0.$&24.5gm$!4$!9%!.#"1%$!4$%x47.5#!2',
+    '#"42$"pc#"55#"6%$!2$!4%$-day$!7$#sec##85%#"9%"$/120$"98##636#"78',
+    '"\'0&deg;c$,ndash;560myr*$8197#(,000,000$#297#$/340$!l#"0m#!1$"00$!6$!7$!8$"s3#"20',
+    '##405#!8$!1$"80#!a#"ft#!k$$cals"+1&ndash;584#$,000%"69#!0#"10#$2005#"40',
+    '#"54#"7m##983#!b#)f&ndash;g"%2,262##.00#!0#!2#"60#!8#$9139#!a#!e#&kbytes',
+    '#\'-strong##.92#!0$"64#!1#!3#!5$!9##619#!9$"28#!m"+4&ndash;585*#971#$,000',
+    '#)0ft/1780m##380##620"%5,383##-91#$/757#!0##1/3$!0#"40#"51#!6##820$"58#!9',
+    '"*6&divide;2$*ndash;1077*#588#$,018$#412#"10#$9451",7&ndash;3304#!0##773#!8$"63"+8&ndash;663#$,000##.73',
+    '$"99#!0#"15#!2##305#!8#)b&ndash;h#"cc#!y"+9&ndash;590#$,000#%-seat#".5%&&deg;c#"0a',
+    '#&4-5914#!5#!6#!7#"80#)b&ndash;f#"ff"#:28#"42")a&ndash;b"!c"!f#!f"!k#!m',
+    '"#mpg"#sec!*9&frac12;p#(ndash;12*)4&ndash;0)!2)"55)"61*!2*!4*!5*\'8&deg;f)"70*!3*!9',
+    '"$,150##300$"36##400##500#"60$&86,000$"90##745##962"#-51##day#"ft#%match$%inute',
+    '##14m$!8#"24$!f#"3%$!3$!5#"4%$!0$!2#"5%$"42$!p#!6#"86',
+    '$!4$!9"%/1536#$57th##618$237,110/688,116/694")0&ndash;2#"/l#"00$!1$!4$!s#!3$"23##650',
+    '#!7#!9##cm.#"mm#,p&ndash;600p$!.#!s""1%#(&ndash;2*#592,!3#%(285)##.8%#"/l#!1',
+    '#"90##pp."%2,000#!2#"40#!5$!0#"60#)a&ndash;c#!p$"p.#!y"+3&ndash;599#$,000\'$,000',
+    '##000$"24##111#!2##601#"70")4&mdash;6$)ndash;597#$,857#$/804#"00#"10##914#"cc#"mm',
+    '")5&ndash;6+"25##/91#"28#!4##613#!7#!8##904#"ft#"km#!p#"th"+6&mdash;612,!3',
+    '#"40#"80#,:570=52%:48%"%7,000$#258#!0$!0%!0#!3#"40##636##826#!p"+8&ndash;601,!2',
+    '#"80"\'90-1400)"as##443#!5$!a$!s#"70#!8##909$"22#)a&ndash;c##kms"!a"!b',
+    '"!f#(&ndash;g#!."!g""km"!m#"in#"jy!%:08.7"*1&ndash;11+!5*"21*!7#*0&ndash;16$"ff',
+    '##2ff#*3&ndash;14$".4#*4&ndash;15+#6:7#*5&ndash;19$"ff#*6&ndash;21#*8&ndash;26#":4#"ff")2&ndash;5#+2&ndash;6:9#!4#*5&mdash;34',
+    '#!9$#:59")3&ndash;4#",4##0pm#!3""40#!3$&,16:28##5pm"#5,7#%0:945"!6"!7!(=&amp;50',
+    '")excellent"&nearly!$a.17#!4#!7"!a#!a""cc""f."!g"!h"!p"-sa-containing"!w"!x',
+    '"!a"!d"!g"!h"!q"!x"!z!%c+/6a"!6"+m-(2inches)#,/2&frac12;in&#ins"!u"!v""wt',
+    '!"dd#-dddddddddddd6"!e#!g"!k"!l"!m"!n"!s"!z!%e-16e"!a"!b"!l"!q',
+    '"&ss-200!"fa"!e"!h"$t2in##4in##8in!$gals"#bps""dc"!m!#hb."#iaa"!j"!n',
+    '#"id"!z!!i"%nging#"s.""ve!"jd"!e"!j"!p"#x13"!y!"kb"#cal"&g/11lb',
+    '""m."%v/div"!w!"la"+b&frac12;oz"!e"!i"!r"!w!\'m(16ft)"%-high"!2"#bps""eg"!g',
+    '""hz"&illion"&l/1tsp".m/&frac14;inch""pa"!s"!v!!n"!e"!f"*g/&micro;l"!p"!q"!w!"oc',
+    '""mm""oo""th!#p.m$!.""4f"!f"!h".m&ndash;9.30pm#$.the"!n"!p"!r"!s!$q.21',
+    '"!a"!d"!p"!s!"rb"!d"!e#)alisation"!f!\'s-genes"$.3d."!d"!h#\'illings"!z',
+    '"!d"%h-8th$\'century#!."!s#!p"!w"!x"!z!"ug"!l!,x+10y+20z=45"-12&middot;5cm##5cm"!2',
+    '"%9inch""f6"!l"$sspe!!y"!y"!z ,6%&ndash;55%"#-7%"!."+/0.97=6.19%!)&amp;1/4%&!7"%deg;s"5frac12&ndash;2&frac12',
+    ')3times;10&frac14&ins(&;-mile)"d.*#ays)"in+"s.)#lbs)"oz)!p\'#4;p&"34(4&times;10&frac14&ins(";d&"58#-t&ndash;15&ft',
+    '$&;6&ins%!x&$6&ft&*8&ft;x3&ft")gt;8&gt;4",half;x10x3in"(ins/2&ft%#;to"(mdash;12(!7(!8(#see#(iddot;29)!5*%x10cm',
+    '\'\'&frac12\'*;0&ndash;00*18&ndash;00*26&ndash;0)*,6&ndash;0)!0)!5)!6(+1,6&ndash;2)"/2+"lb)"0%*$&deg*$,000*!7',
+    '*"pm*!s)"13))2&ndash;2*!g*$mgml+!m))3&ndash;01!8)+4-year-olds)!9*(&ndash;1()2&ndash;0)*,5&ndash;7)!-',
+    ')#237*!4)!8)!9("33*!1)!4*!9)!5*!8)!6)!7*)&ndash;19)!8)"90',
+    ')!.)!3)!5*"pm)!7)!8("50)!9()6&ndash;00!8)".6*!8)!2)!3)!4',
+    '**frac12;cms)#.30)&00,000)!6)!g)"pm(,8&ndash;1880)#000)!s(&9/4/41)!0)"1.)!3)#:17)1ft/1.8&ndash;2.7m',
+    '"&percnt#%lus;1\'!3#-rime;14&prime((30&prime((54&prime",shilling;0d.+!8"%times\'#;10(#2ft(!4(!5(,7&frac34&ins(%8&ins',
+    '"!6!$(12)"*6&ndash;7)""a)"#d).!!*"#109"%3*1*4")5*4*3*2*1!0,000&ndash;6,500,%7,000&)rehy;feet+&strong%.,000-8,000,000%\'-10,000',
+    '&%8,000&%9,000&$acre&%pound&%tonne&\'warhead%"cc%"fr%#gns%\'hp-plus%!m%#rpm$"pm#"20#"34',
+    '$!7$!8#"50#"66#&80,000$%9,000#&94yard$!7""10#"11$!4#$2,15$!9#"30$!6',
+    '$!9#$5,18$!0$!3#!6$!0%$,000$!9#"99"#2,4#(00-metre#"11%$,007$#4.5$!5',
+    '#$20kg$!3$\'8,298.1#"41$&7-yard#&54,000#"60#$75kg$!8$!9#"98$!9"!3#"04%"km',
+    '#"20$!3#"33$!6#"47$!9#"52$!6$!9#"68#"73#"80$!7$#9ft"%400m/',
+    '$!9#$40kg$&5-yard$#7ft#"50$!8#"64$!7#"71#"89#"99""50$$0&ft%&-pound&&strong',
+    '%#rpm#"17#"23#"30#"43$!9#"60$%9,889#%75.34#"80$!4$$9.07#&92,441#"oo"!6',
+    '#,00,000(1990)%%-word$!6#"17#"21$!4$!6#"31#&41,000$!3#"50$!2$!7%$,000$%8,422',
+    '$%1,855$!6#"73%$,000#"81"#7,8%/,15,28&ndash;29&!9#&00,000%%-vote%"kg$!5#+13-delegate$!5$!8',
+    '#&30,935$!3$!7%$,215#\'44-acre$!7#"50%"cc$%9,860#"76#"80$!4$!6#"96"!8',
+    '$%0,000#"23#"30$%8,033#"40%$,000#"50$%9,000#\'60-name#"73#&93,000$%5,963"!9#&00,000#&17,000',
+    '$!5$!8$#9km#"39#"40#"52$#4ft$%9,276#&76,620!\'-0-42-0$!6#!."$10pm#!6#!8',
+    '#!1#!7#!9"$3-93#!3"&7-foot#"pm"#8th"%9-6-7$(year-old#"pm"%amino#(ustralia"*billingham"(cum-paul',
+    '"$days#7iamidino-2-phenylindole",glucuronides"(handicap#"is#!z")inch-long$$to-1""kb",methylpurine##ile#&onthly"!o"$part#$iece',
+    '$&unders"#run"\'telford$9trachlorodibenzo-p-dioxin##o-8#$uple""up"%valve"$watt$!y#&heeled")year-olds!,.0&ndash;6.3,!8#".2',
+    '$!4$!5$!6#"0%$&&ndash*&;18.00+$9.15#"1%#"3%##5am#"96#%hours#"kb#!p"+1&mdash;6.3',
+    '*#6.3#".0$!7#$0(4)%"5)$)-petition$".1%!2%"91$52&mdash;3.214&mdash;2$!7$!8$!9$"am#$1(2)',
+    '%"5)%"8)\'!.$".1$$2(1)&"2)$$3(2)&"3)$!4$!6$!8$!9$!p#$2(a)%"b)',
+    '$$0(2)&"4)&"5)$"5%$!6%#(3)&"4)$$7(3)&"7)$!8$$9(3)#$3(b)%"o)$".0$!0',
+    '$$8(3)##4.9$%4mbps$$8(1)#$5(a)$$0(3)$!1%#(3)$$2(1)&"2)$$3(1)&"2)$!4$!5$$6(2)',
+    '$!8$!9$!p#$6(a)%"b)$!0$$2(1)&"3)&"4)$!3$!4$$5(2)&"3)$!a#"72',
+    '$!5$!a$!b#$8(1)%"2)$!a$!b#*9&ndash;21$!1$!4#!k#!m#"pc#$secs##x10',
+    '*#6.4,!7+#3.8*#7.5##(c)#%-debt$$hour##.12$$3(b)%".2&!4&!5&!6$#4.1&!2',
+    '#%/1000#"0%$+&ndash;7.40$!6%#(4)$$7(2)&"3)&"4)$!8$!9#$1,22$".4$$1(3)&"4)$!2',
+    '#"20$!1$!4$!c$!e$!p#$3(4)$!0$!6$!p#"4a$!b#,5&ndash;9.10%(times;10$#(1)',
+    '%"3)$".2$#/ha$"am$!m#$6(c)$"am#*7&ndash;42$"5%$!b#!a#"bn#"lb%!s#!m',
+    '#"p%$!c"\'3%-6.8%#$&deg$)ndash;6.1-!1##(2)$"3)$"a)$"b)#%-debt#$.2.1&!2%!0$!7',
+    '%!7#$/4in#*0&ndash;11+#7pm+$8.00+&9.30pm$!1$#8pm$!a$!d#"1%$#(3)$!a$!d#$2(1)',
+    '%"3)#"4%$#(3)$!a$!b#$5-mm$#:24$"am$"mm$"pm#"6%$!p##75%$!p#$9(1)',
+    '&"i)##opm#!p$!c#$secs",4&ndash;40.3*#6.6##.1.&!1&!2$#2.1&!2$"73#$0(3)$"pm',
+    '#"5p%.m&ndash;9.15pm#$6(2)$$4102#!8#"9%$#.39#!a#"bn#!c$!m#!k$!g$&m/4mls#"pc',
+    '"%5&deg$#ins$/ndash;2.8&aring+)8&ndash;1##(4)$"a)$"b)$"c)#*-magnitude#$.1.1&!2&!3%#987$!6$!7',
+    '$!9%!1#"0%$!p#$3(1)$#.11##4.3#"5%$!p##6.8##7.5&!3#$9.53$!p%!m',
+    '##a-d#!c#!d$"-e##f-g#"ha#"kg%%/14lb#"oz#"sq"\'6&aring$)ndash;6.6*!7+".2,!6',
+    '##-kb$%litre##.77#,/100000/year#$0683#"15#$3(1)%"2)#,4&ndash;6.66$#sec#"5p#"66#"7%$!8#!8',
+    '#!9$#(3)$!p#":1##mpc#)v/470&ohm"%7&deg$)ndash;500##(3)$"a)$"b)#)-petition#".4$(8.10.12.%!8',
+    '#!1#!2#!3$#sec#!4#\'5-litre$"cm#!6#"8m#$9(1)%"2)%"3)%"4)%"5)%"6)',
+    '#"ft#$secs#!x$"10"\'8&mgr;m$-ndash;7.5t/ha##(2)$"i)#)-petition#!.$-4&mdash;6.8.6$!7#$0(2)#!3$!8',
+    '#!5$#684$"pc#!6$!%$#(1)%"2)#!7$"5%$!p#!8$#(2)#!9#!a#!c',
+    '#!m#"pc##sec#$t/ha#!v",9&ndash;45.6*"7.,!0##(2)$"3)$"4)$"a)#)-petition#!.#!0',
+    '$%.3kyr$#403#$1(2)%"3)#!2#$3(1)%"4)$!p#$4(3)%"4)#!5$!p#$6(1)%"2)#$7(2)',
+    '$#(1)%"3)#!c!&/11/89#$2/86$!2#!3#!5##969""20$10&amp;c/400&amp;f#"86"!3#!0#!3',
+    '"$4/91#"77"$5/41#"84"$6/87#!1#!2#!4#!5"\'7/8/9th#!0#!3"+8&frac12;d.#,/13/15/22/29"!9',
+    '#!3$!2#!5"#all"&colour"*highlights"!i"#the!&0%-70%$$plus#!.$!4#"to"3&deg&ndash;60&deg;f.\'5&deg;f',
+    '3";f.\'6&deg;f-(80&deg;f&#/25&*;-70&deg;f\'#00\'\'&c-1min\'"fs\'!s#\'mdash;1)#70p$)icro;g/ml#(ndash;02)$100m*"80',
+    ',!0)!5*!8),64-year-olds*%5,000+#mph*!8*#9.9)(70&deg;c*!3)+80-year-old+"0x+!c*!1*"5%',
+    '*"0%+$,000*!8)%overs#)percnt;of#+rehy;minute#&sol;61\'"86"*\'s/70\'s/80"#(1)#"6)"2,000&ndash;100,000/%5,000-&75,000-&80,000',
+    '&(,000-yen&(-100,000\'&70,000\'$acre\'\'hectare\'%tonne\'$user\'!x&#.00&(interest&!s\'!q$"62##144$!5',
+    '##221##372##400$"49"\'-07-24t#"18#!2#"40#"51#"64$!5%!%$!9%".9#&70,000',
+    '%"pc#,a-day-smoker$#cre#\'bedroom$"it#!c$"ap$%lause$!m#$date#$feet#$gram#$hole#$inch#%litre',
+    '$-iles-per-hour&)lion-year$&yr-old#$page$&ointer%%under$$upil#$room#&storey#\'vehicle#$watt#)year-olds\'!s"!.#"05',
+    '$!5#"3%#;4&ndash;26&ndash;81&ndash;8$\'x73.5cm#"5p#!6$!8$#mpg#"70$!5#"8%$!4#!9$\'%-owned$!0',
+    '",/65&ndash;74$!8#"86#"90##min#"sq")0&micro;m$+ndash;1000m+)500&deg;c+#950*$2000*#300*#500*#601,!7',
+    ',#5kg+"99*%700km*#800*)900&deg;c,!5#"\'s#2,000&ndash;800,000\'\'-a-year(\'hectare(%rated#%-1000$#bed$%entry$)feet-long',
+    '$(megawatt%!w$#odd$&series%$pace$$word$$year##.16$"30%!8$$6mph#$/611#,0&ndash;8000$%-acre$$/100',
+    '$$0/km$!2$!5$!6$!7$!9$"bc$"ft$!m%!m#"10#"20$!2$"35#"30',
+    '#"59#"70#!8$!0#!9$!9#":1##bhp#"es#-ff/-livestock#!g$!b#"js#%kcals$!g',
+    '$"ms$!v##lbs##ml/##odd##psi#"sq#!v#!w#"yd"%1,730##/2p#-08&ndash;0218,$1035#!1',
+    '$"22$!8#"50$!9#!6$!1#!7$"33#"91#!a#!p")2&ndash;3#"-1#"/3#!6',
+    '$!9#"73#!8##912")3&mdash;4$)ndash;604#$,550#"02#!1#!2$"71#!5#"60##731$"53',
+    '$#500$#869#!.#!0$!0$"60#!3#!4##6.2#!8#&kbytes"+5&ndash;609#$,000#"-2##.27',
+    '##1.0#!2#!3##411#!a##sv1"+6&ndash;607,!9*!8#$,000$#300##.25##174$"89#!5',
+    '$"06#!7#!8$"52##933"%7,000##224##659##750##865##909#!g")8&ndash;9#$,881#\'-gramme',
+    '$#301$"5p#"15##218#"31%!1#!5#"64$"61#!7#"96"+9&ndash;619#"10#!2#"39',
+    '##841#"cm#!p"":1#!3#$50:5#.diagram/figure"!_##per"&a(1-4)"!b#!c#"hp#!p""c.',
+    '#!c#&m-long$\'/24&ins&"ft$,x&times;27cm"#deg""ff#&t-plus$!.$$/18m"!g#)/2&amp;oz#"al#"hz#!m',
+    '""ha#!p"(km/40mls#"ts"!l"\'m-bytes#\'g/100ml#"yr"$ngml")p-a-share#!p#!s"*s-inspired$%style#!.',
+    '"%to-70"\'x36&ins!-1&amp;times28#)ndash;100,!%*"17*!7)\'2&ndash0$;416)"32)!4)!6*!2*!3*!5',
+    '*!6*"77)!7*!1*!6)"85*!6+!%)!v*"ii,!i#&percnt#*times;10/l)"61)$76.2',
+    '#"5)"(,000,000$&49,000##258##400##700$"22##850"#-54#"90#&footer#$knot#&milers#"vi"#.03',
+    '$!0#"3%$!3$!4$!6#"43#"59$!g#"6m#"86$"pc#!9$!4"#/63%@,100/102,104&ndash;5/106&ndash;7',
+    '$!7"*0&ndash;50*#614,#5kb#$,000$#989##-cm$#mhz#"00$!s#$1581#!3$!0#!4$#821',
+    '#!7##815#!c#!k$"wh##mhz#!p#!s"$1.17##032#"11#"22%!2$!7#"47',
+    '#!6$"25#"73$!9#!8$!1$"81$!9#!9$!1$!3#"a.#"th"%2,000%"83',
+    '#"12#"22$"33$"48$!5##323##439#$5.12#!8$!3#"km#"th"%3,000#!2#!4',
+    '#!5$"77#"60$!7#"83#!9$!0"%4,220$#937#"02$!8#!2$"3m##450#!7',
+    '#"90#!f"+5&ndash;617,!8#"\'s#$,377#!0$$-t25##353##615#"70#!p"*6&ndash;40#!3##410',
+    '#!6#"98"#7\'s#$,007#$0040#"10#!3$+&ndash;6174#!5#"60#!7#"80#!9""80$!8',
+    '""9%#*&ndash;627#(,387,000#$-636#"05#!3#"60$"66#!p"":1$(&ndash;2#"23"!c"$d(3)""f.',
+    '""mm"+p&ndash;65p#!p"!s#(t-minute""th"+v1&ndash;11#!3"%x61cm!12%&mdash;36%roman"-&amp;shilling#2deg&ndash;64&deg;f.\'8&deg;f-(80&deg;f&#;40',
+    '\'!n\'!w#(frac12;p$!t##ins#\'mdash;3)!5#\'ndash;1*#500)#205+!7*!1)"40)!5)#645',
+    ')!7*!3)!8*!3)"91+"/l*!9)"ix"%(091)#"2)#"3)#"b)"$,063#\'300,000#\'400,000',
+    '$&79,035##767$"80#\'800,000##900$"26$&67,000"%-inch#$node#&storey"!.#"00$!1$!2$!4',
+    '#"1%$!2#"26$!m#"3%$!2#!4$!0#%5-mhz$!5$!p#"75#!8"$/120#$24/1',
+    '#"49##6/2#"72#!l"+0&ndash;700#(,000,000$#627#&-metre%!w##006$"bp$"km##137##357#!5',
+    '#!8##986#)c&ndash;g#"ft#!i#!k$!b$!g"+1&ndash;638#!.$!3$"48#"00#"10$!4',
+    '#!3$"81##414##501#$61.6#!7#"93#)e&ndash;g#!k#!p"+2&ndash;629#$,000#%.4mev$!6##200',
+    '#"31#!4#!5$"20$"48##936#,c&ndash;623e#!f"+3&ndash;624#(,700,000##.07$!4$#821##004$"74',
+    '#!4#"50$!2$!3$!6$!8$!9#!6$!0#"80#!c#"rd#!x"+4-base-pair$$page',
+    '&!1\'"09)#411$"90#!0##400$"14##672#!7#"ft#"kg##pp."*5&ndash;34*#671#%-lint',
+    '$&strong##599#"60#$acre#!m$"hz"$6-mw#".8#!/#!0$!1#!2$"62##316##404',
+    '#$64/3$!6$!7$!8#"kg#!t"+7&ndash;628+"36#"\'s#$,000$#552#"09#!2$!0$!m',
+    '##703#!9#!m"*8&ndash;31#$,000#).16850941$"57#!0$"0m$!5##512$!2#!6#!p")9,400,000',
+    '##274#"59#"74##914#)c&ndash;g"!c"!f""km""no"(year-old!%3&deg#&frac12$!t#%mdash(";5',
+    '#(ndash;39)"47)!5)"64*!6)!7*!0*!3)!8*!3*!5)"91#&percnt"%(22%)#"4)',
+    '"$,077#\'147,266$"81#"27##418##669##985""-6##cap#$date#%point#&strong"#.00$!9#"1%',
+    '#!2$!0$"7%$"8m$!9#"31$!7$!9$%years#"4%#-5&ndash;206.2+$98.5$!p#"75#!8',
+    '"$/737")0&ndash;1##-nm$$seat#!.$!0$"8%#"/1$!l#"38#"49#$5166$"30##730#!8',
+    '$!d#"mp#!p#"vs"+1&ndash;633#$-648#&.589.2#!0$!s##100#"23#!3#!7$"56#"81',
+    '#!m#"nm")2&ndash;3*#634#"/3#!0##222#"40#!7#!9$!8#!e#"ft#!p"*3&ndash;55',
+    '##.3%#!0$"38#!1#"49#"50$"42#"60#"81$"44#"96"*4&ndash;56##.84#!0$)5&ndash;2',
+    '#!5$!6#!6"-5&ndash;735kg*$9550#"/6#!0$!8#!1#!3##666#!7$!3##dpi#!g',
+    '#"mm")6&ndash;8#$,000#".7#"/7#!0$!4$)703&sol;4#!1#!2##311##414$!8##547#"78',
+    '#!f"#7-8##.50&!.#!0$!1#"34#"49#"70#!8#!d"*8,000-name$#364$#800#"27',
+    '##54a$"75#!6#"71#"80##918#!e#"kg"%9,000##-46#!.#!0$(&ndash;3$!2#!1',
+    '$"70$!m#"30#"78"#:10$!6""a.""b.#"hp#!p"!c#!m##p2e$!e""gb',
+    '#!m"!m#$scfd""no""th"!w"(year-old!44&deg&ndash;60&deg;f-(72&deg;f&$;58\'\'!c#&frac12#%mdash(";5)"75',
+    ')#280)!6*"50*!6)"72*!7+!%)"81)"91#(times;64""\'s"\',000bps$"87##100$"86',
+    '&$,600$"88##589##619"#-10#"36#!6$!7##bed#)character##day#$foot##gun#(kilobyte#!m',
+    '#$room#$seat#"to#$user##way$#ide#$year\'%-olds"!.#"00$!2#"12$!9#"20$!6',
+    '#!3#"40$!6$!7$!9$!p##50m$!1#"6%$!7#"74$!8#$8ins#"91"$/120',
+    '#"66""0%#+&ndash;1440*!4+!1*#645##-kb$&metres$%pupil#$/480$"88#$0-km$"00$"kg$#rpm',
+    '#"32#!4##529#"75#!a#"kg$!m##x80"*1&ndash;52*#642#".4%\'1641.47%"53%!9&!3',
+    '$#738#!0##121#!2##465$!8##535#"62#!7#"81$!3##972#!m"%2,000#"/l',
+    '#"10$"55#"32$"50#"44#!8$"27#!p""30$!5#"10#!4##719#)a&ndash;b"%4,000',
+    '##.82#!0$#113$"26#!2##300#!5$"92#!6#!7#"89#"90$!1#)km/400mls$"yr',
+    '"+5&ndash;646+"85#$,000$#266#"00$+718-55mgcl2#$2887#!3#!9",6&ndash;1850#%/1507#!0#"1m#!3#!4',
+    '#)e&ndash;g#"ff"%7,000$#369$#400$#878#%-2366##/53#!1#!2##531##858#!9#!p")8&ndash;2',
+    '#$,000#".5#!0#"11%!1#"20#"30$!1#"72#"80$!7"*9&mdash;50$\'ndash;1*#650#(-bedroom',
+    '##/50#"06#!4""ad"!b"!e""f.#!f#!t$!."#ins")kb/second"&m-byte#)m&formula""no',
+    '"!r"!s!(5%-owned"3&deg&ndash;70&deg;f.\'2&deg;f.\'4&deg;f.\'6&deg;f-(80&deg;f&";.\'!s#&frac34$!t##ins#%mdash(/;66.158&mdash;9',
+    ')"74)"85#)ndash;100*"20*"90)#226)"35)"43)"64*"50*!6)#70%+!p*!1*!5',
+    ')!8*!0+!%+&&deg;f*"5g""\'s"#(1)"(,000,000&*-processor&"sq##100##200##300$"46$&53,000',
+    '&*-processor##400#\'500,000$"34$&50,000$"77##623$!6##700##815##931$"45"#-40#"56#"64',
+    '#$foot#&gallon##lap#%metre$#ile#%piece#$room#&strong#)year-olds"!.#+11&ndash;12$!5$!9#"2%$+98&ndash;91',
+    '#"41#"5p#"63#$79pc$#mpg#!9"$/030%!8#13/7&mdash;65/3/15#$4/16$!5#"70"\'0&deg;c$*ndash;1050*!3',
+    '+#75p,!8*#700+$30nm*%800kg#"\'s#$,374$#900#%-mile$#odd$$word#"/1##0gn&!s$!l',
+    '#&2-type#"48##891#"bp#"hp#!k$!g$!m#!m$#ile#"th#!w"*1&ndash;04*#676#"/2',
+    '#!1$"75##5th##981#"st"+2&ndash;653#$,306#!0$!1#!1$!1$"55$"85#!3#!4',
+    '#!5##724#"81#"90#!m#!p"-3&ndash;1,453#$,123#"-4##022#.1/g&ndash;bsks##338$"45#!5#&7-7674',
+    '$"20"$4&ft$)ndash;655#!0#!1##366$"98#!4#"89#"ft#!h"+5&ndash;732*!8##000#!1',
+    '#!3#!4$!0#!6#\'7/8/9/0#"kg")6&ndash;9#(,000,000$#702#!.$!1#!0#"11$"94#!3',
+    '$#76.#!5#)d&ndash;f#"p."*7&ndash;60#!5#!6#!9#!p"*8&ndash;60#$,000#$.562##828#(m/720yds#!p',
+    '*"93#+-amino-acid#".3%$:766#!5#!6##771##966$!9#!p"%:21ff$#5:4#!c")b&ndash;c#"hp',
+    '"!e"!f"*g/2&frac12#%m/sq.""hp"#kts""no""s.""tb#(h-minute"!u"!w!\'6&aring#-frac12;points\'"23',
+    '#)ndash;127*$6579)"67*!8)%7&deg*!0*!1*!3*!9)!8*!9)"91#&plus;8"%(3xa)#"4)',
+    '#\'236,791##417$"54##560##600&$,000#\'700,000##800$&20,544$"85$"98##900&$,000""-0##106',
+    '#"53$!5#$70ad$!5#\'ear-old#%hours#$plus#)years-old"!.#"04$!9#!1$!%$!9#"31',
+    '$!3#(6&percnt$!0$"7%##7kg$&mhz/70##82%"#/17#"46#"68#"73$!6""0%##&ft$\'ndash;4',
+    '#&0-6581$!0%!0$#rpm#$2159##377#!4#!5#"63#,8/10&ndash;3##978#"cc#!e#!g$"al',
+    '#"mw#"nm#\'p.p.m.v$!c#(x0-based""10$!9#"10#!4$"21$"88#$5121#!7##880#!d',
+    '#$/663#!2$"33$"44$"66#!7##883#"ff#!p"$3(3)#$,000#"-2##.10##012#"14',
+    '#!3$"74##494#"50$"66#"80$"12$"20#!c#)d&ndash;f#!e")4&ndash;6*"73#$,000$#271',
+    '#"50##944")5&ndash;8#"/6#!4$!0#"61##721#!8#!g#"mm#!p")6&ndash;4#!3$!4',
+    '#"62$"77$"86#!7#!b",7&ndash;4842*#669#$,000$#811#&-share#!0#!4$"73#!6$"87',
+    '$"99#"97#"ff#!g#!x")8&ndash;9#$,000#"08##242#!4#!6#"83#!d#)e&ndash;f"%9,073',
+    '#)/1156=58%#!0$"00##857#!9$!0$"77""ad#!f"!b"!c"!f#$-73f#!.#"f.',
+    '$!."!g"!h""in""kd#!g#$jmol#!v"*mhz/64-bit%!s##ind#!m""no""pp"!w',
+    '#\'mdash;8#)ndash;174)!3)168:diagram/figure)"70*!1*!5*!7)"85*"7%)!9*!0"#(1)#"2)$#3%)',
+    '"$,054##100$"67##378##423$"50##663$!8%#,69##704$"88"#-65#&member#,years-of-age*"ld',
+    '#!1$!1$!6##27%#"31$!2#!4##6pc#!7$!%##8pc#!9"$/\'68#\'100,000#"49',
+    '",0&times;10/l#$,000$\'359,429$#828#".9##092$"ft$#rpm#"22##392#"40$!2#!5#!7#!h',
+    '$!b"&1/1480#!0##116#!2$"64#$3054#!4$!0")2&ndash;3*!5#$,087##-c.#!2$"24',
+    '##641##772#"kg#"nd"+3&ndash;735$*times;10/l#$,684$#700#!2#!3#"73#"ff#!p")4&ndash;5##(3)',
+    '#"20$"10#"30$"57#"4m##774#!9#!p",5&mdash;90/1$)ndash;676*#704#$,290##.00#"55$!7',
+    '##760##823#!9#!f#/g/1&frac12;lb/3#"hp#"kg#!p"%6,000##641##926#!p"+7&ndash;680##(5)#$,100',
+    '#"40#&601260#"70#!f"+8&ndash;680*"89#$,000$#268#"-9#"01$!9#"11#!5#"70#"96',
+    '$#968#!3#!4$"47$!9#!6#!8#)a&ndash;f#!p"#:11#"22"!a""f.#"f.""pc',
+    '")th-minute"(year-old!%8&deg&/&ndash;70&deg;f.\'2&deg;f.\'5&deg;f&";c#&frac12)#;ft\'%45;km##ins#\'ndash;0*!7)#110+!5',
+    ')!5)"67*!8*!9)470&ndash;68&ndash;73*!1*!4*!6)"80*!5*!7""\'s"#(2)#"i)"(,000,000',
+    '&"km$"99##100$"51#!2##679#*800,000ecu$"56##966"!-#"79#"94#\'bedroom##day#%metre',
+    '#&storey##ton#$yard$#ear\'%s-old"".0$!%$"6m$!7#!1$!%$#ins#"2%#$30pm$!2',
+    '##55%$"kw#"76$!7$$secs$#x92#(8/100000$#x94"%/1612#!2#&360/ec#"68"+0&ndash;700##00-&%style',
+    '$#rpm##20s#(30/480dx%!s##551#(60-based#"70#"8m#)c&ndash;g#!d#*g/1&frac12#!p##x0s")1&ndash;1##(1)',
+    '$#511#$-907#&.945.6##155#"20#!4#"60#"88#!9$#456$"99"+2&ndash;683#+,000-strong#"0p#!1',
+    '$"72#!4##895")3&ndash;4*#685##.3%#"00$!2##195##311#"42$!9#!9$"24#)b&ndash;c',
+    '"+4&ndash;686##.01#!0#!1$".2#!6#"70##884")5&ndash;6#$(4b)#(,000,000#!0##222##652#)e&ndash;f',
+    '#$,000%"18#!.$"12#!0$%-yard$!0##479#!8#!9"%7,000#"/1$(bapc.181$!l#"33',
+    '$"02#!9"%8,000$#430##000##101##258$"92##481#!9#!p"$9966#)c&ndash;d#!f#"th',
+    '"!a""cm"#d-e")f&ndash;h#!f$!."!h"%kg/hl#!m""lb#$c040"#mhz"!s")th-minute"&x110cm',
+    '"(year-old!(9&frac12#\'ndash;0)#100+!3*"62)"76*!7)"86*!7)"91*!2*!6"#(2)#"4)',
+    '#"a)"(,000,000##171##200&$,000$"81#\'370,000#\'490,000##520$"42$"74##600#\'900,000"!-#"67',
+    '$!3$!7#$ball#&minute#$year"#.01$!2#"10$"4p#12&ndash;81.9/1000$*61&mdash;2$*84&mdash;5#!3$!%$"15',
+    '$!6#"5%$!2#"6%$!2#!8$"5%"$/670#"73#"96""0%#"01$!9#"21$!5',
+    '#!m$"ff"$1.26#"/4#!0$"24##122##211$%3/4/5##400##554#"91$"96"%2,000$#946',
+    '$"69##351#$6293#"92"+3&ndash;704#$,624$#700##.14$"97#"/4#!3$!0#!6#"rd"%4,500',
+    '$!0##242#!m"*5&ndash;98#(,000,000#"23#"35#!8#!9",6&ndash;8030#!0$"00##155#"21##551',
+    '#!9$"69#!m#!p"+7498/690227#!7#!m"+8&ndash;700#(-0421.81##.00#!0#"10#!3$"15$!3',
+    '#!0#!1#"50#"60%!9##785##930""cm""ff$!.#!t""lb"!m#"in#!m',
+    '"#off")th-minute"(year-old!#:00$"pm")1&ndash;2+!1#*0&ndash;19#$1-17#!3#*4&ndash;18+"27#*5&ndash;17#"77#!8',
+    '#!9$"ff#"ff"!2#$,6:4#*2&ndash;27#*4&ndash;30##5.0$"pm#-8&ndash;10:29"&3,5,10#!2#!3#!4##5pm',
+    '#!9")4&ndash;5*$8:13#!1#!5$!f#$8,51")5&ndash;9#!0#*1&ndash;52#!2#\'4,56,63"*8&ndash;12+!3+!7',
+    '"#,6a"$-p-m%!u"!.#"m.""b.""e."!h"!n"!t"!u"!x!&b&plus""\'s"#,6c',
+    '"!d"!l"!t"!y!"c+"!c""m/$+2&frac12;in"!u!&db/oct"!h"!l"!p"!s"!y',
+    '"!a"!e"!z!%ft+.i#%-long$$plus#%.2in.$#4in#$10in##8in##9in!$g+er#"kr#"pr""hz',
+    '#"ve"!f"!j#!."!p"!t"!y"!z!!i"#ns.""sh!!j"!b"!f"!g',
+    '"!l"!p"!r!"k5!#l/2")6-powered#"gc%!s"!d"!j"!n"!s!,m&sup2/litre"%/20ft"!a',
+    '"#g/1"!l"\'m-thick#!.#"ol"!s!!n")-pentyl-2"!3"!a"!b#!.""f."\'ovember"!p',
+    '"!u!$omph""zs!"p.#"m.""21$\'.1-pter%!3"!f"!h"!j"%m-8pm""pm"!q"!s',
+    '"!a"!b"!d"!p"!s""t."!x!!r"!b#!."!g"!p"!u"!y!$sec.',
+    '"!f"!l"!n"#q.m"!r"!t"!w"!y!"t0"#bsp"!e"!g",h&ndash;11th+#4th#%/12th',
+    '#"er"!y!"uf"#niv"!p"!x!*v1&ndash;4"\'395tb93"!a"$iiib!\'x10evcm#%4inch#"ml")3/4x1/4in#"in',
+    '"!g"!p"#ssc!#yds"!n!!z )7%-of-gdp!8&agr;-hydroxycholesterol#*mp;14total\'!8&&frac12"/commat;1/2-fold"&deg;dh"\'formula#)rac12&deg',
+    ')3times;10&frac12&ins(#;d.)"ft)#in.+!s)"lb+!.)&points\'!4&$34;p#,t&times;6&ft"$khgr"%mdash\'#;11)!3',
+    '("ie#\'iddot;1)!4))5cm/3inch*%x15cm)!9"(ndash;03)!7)!9()1&ndash;00$1893)*/7&ndash;2),0&ndash;1874*!-*\'/100000',
+    '*!3*\'g/litre*#kcs))1&ndash;01$1885*)-year-old))2&ndash;2)"3%*"th))4&ndash;0*!0))5&ndash;0)!6)"87)!a',
+    '($20km)!5*!a(#30a*!b)"64*!6)!7*!1("43)!8("53)!4)!7("60',
+    ')#000)!5)!6(\'8&deg;c*%mgr;g)!6)"cm)$g/dl)"in)#min)#now(#9.5)!/)!0)!a',
+    ')!t(&loa.m.(#oct"$plus&"mn#$ound#-rime;00&prime((19&prime((53&prime"-rehy;year-old"\'sharp;5#$ol;8",times;10&ins)%4&ins!)(1)&mdash',
+    '#"5)#"a)""8)""9)"$a-c)""e)""i)!"+1#"60"!2#"+1"!7!/,000,000-strong%%-hour&)kilometre',
+    '&%or-so&*population&$room%#ft.%"km%"m3%#rpm%#yds$!1$%2,000#"10#&20,000#\'33-name$!5#"50',
+    '#"83"!1#!0$%0lbst$!1$!4$!6#\'14-yard#"34#&44,884#&54,000$!7##7,7#$83ft$$7.72',
+    '"\'200,000%#bps%"gn$#6ft#"10$%1,000$#3ft$!4$)6,800,000#&24-ton$!5#"30#"43$#5ft$%6,317',
+    '#"61$!3$!7#"75#"80$$3,75$&9-yard#$95ft$!6"!3#"16#(27,439th#/30&ndash;12,330$!1#&54,796',
+    '#"62$!3#"70$!4$!5$!6$!8#"84#"94"#427$!9#"30$!3#"59#&60,000',
+    '#"75$%9,000#"90"*500-strong%"gn%#rpm%#sq.$!9#"12#"40#"50#&63,000#"74#"82#"97',
+    '"!6#\'00-mile#"25#"37#$46ft$!7#"50$!5$!6#&67,769#"71$!6#"82#$98ft"#7.5',
+    '#"12$!5$#6lb#"40$#1ft$!8#"50$!3$$4pts$!7$!8#"75$!6$%7,400#"80',
+    '$!7#"90$!8"&8,9,10#"04#&12.5hz$!6#&37,000#"40$!8#"53$!5#"74$%5,448#&80,000',
+    '##00m#"21#"31$!2#"60$!4#$74ft#&89,000#"95!\'-0-29-2"$11th#!7""21#!6"$30pm',
+    '""52"&7.45pm"%8,000#!2#!4"3alpha-dehydroxylase#>mino-4-methylcoumarin-3-acetic#$pril#$side"$band",chesterfield$-lorokynurenic#!m#$ycle"$days',
+    '""in#"sh"(kpc-long"#lap#$itre"%metre#+onosulphate%\'th-long"&nights"!o##ct.""s9#%eater#%tring#&ubunit',
+    '#$onne#$uple"$wood!,.0&ndash;7.2,!5,!8*#8.6*#9.0#!.#\'0&ndash*&;21.00+$8.00$!0$#p.m#$1.36',
+    '$#.56#!3$#.32#!4$#.28##5pm&!.#!6#!7#!9$#.34#"bn#&d.p.c.#!g#!p',
+    '##x10"%1&ins##(a)#!.$!6$!7#$0.92$!0$-4.39&mdash;40$#mhz#$1(1)%&2)-(4)%"5)%"a)%"b)',
+    '$!7$$8.28$#9.5#$2(b)$!.%!0$"/1$!5%!%#"5%$.&ndash;1.00a.m+&9.15pm$#(2)%"b)$".5',
+    '$!p#"6p#"9%$!m#$_per#!m#!p$!c#"s.$#ecs"\'2&deg;c$)ndash;7.4,!6#$-600#!.',
+    '$#5.1&!2&!3$-7&ndash;7.2.8##0pm#)1&ndash;2$".9$!9#*4&ndash;30$!5$!p#%5&ins%*ndash;8.30$(ablimmin$"pc',
+    '#$6(2)$"pm##77%#,8&ndash;3.74$#(2)$#2a.#"9p#!b#!d#"km#!m#"oz#!p##sec#"ve',
+    '*#8.9#$(10)#$-7.5$"kg#$.1.1&!2#-0&mdash;16.00%-ndash;10.45pm-"pm,!1,!3+&9,00pm,%.00pm-$15pm-"30',
+    '$#8pm$$a.m.$#ish$#mhz$$p.m.%0m&ndash;midnight&!.#"13#!2#"31#$4(4)%"5)$!0$!7$!8',
+    '$"gb#*6&ndash;50$!9$#sec##75%$!6#!8$!2$!b$"kw#"9%#!c#!d#!e#!p',
+    '"-4&ndash;7.4.1##(6)$"c)$"h)#&-litre#!.$"2.$!8#%/1000$!a#"0%$"pm#"19#$2sec#"5%',
+    '$#am.$!m##6:1#!7#$8(1)%"2)#"9%$#(3)#"kb$"ms##m/s#!p#$secs"#5%.#7&ndash;10cm/3&ndash;4in',
+    '*#7.8*#8.5*!9+".0#/,7.5homesitters#!-$"cm#$.2.1$!5$!6$!7$!9#"0%$"pc$!x',
+    '$#410$"pm#!2$!p#"3p#!4#"8p%!m#!9#"bn#"ev##ghz#"kg$"yr#&m-wide',
+    '$!m$"ph#"oz#!v#2x4cm/3x1&frac12;in"%6&ins$)ndash;8.0,!5*#9.0##(1)$"2)$"3)$"4)$"a)##-cm',
+    '&!2&!3&!4&!5&!6$#6.1&!2#"25#!4$!p##627#!7#"8%#$9sec##g/t',
+    '##x10",7&ndash;30.3##(1)$"2)#2-percentage-points#".3$!5$!6$!7$!8$#9.1#!0$!%#"1%$!p',
+    '#!4#"5p#"6%#$7921#"86#$9845#!a#"kb$!m##lbs#!p#$secs",8&ndash;15.4*!8+".1',
+    '$"b)#".0$"81#!0$!%#!3$!%$!p#$5212#!7#"bn#"pc$!h"%9&deg$*times;10/l',
+    '##.12#!3#!4##5pc#%9mmol$"pc##g/t#!m!!/"!-"$1/87#$0/91$!0#!1$#/87',
+    '#"74#!9$"73"3225&deg;c/425&deg;f"+3&frac12;d.##/41$"87#"45#!7"!4##/92#"67#!7"!5##/41',
+    '#!8""63"$7/87#!1#!2#!6#!7""80#"7.#"th"$9/87#!0$!1#!2#!3',
+    '"\'details"%jg/26""lg"#the!&0%-88%"-&amp;degree:c#2deg&ndash;75&deg;f-(80&deg;f&#;f.#"ft##ins#\'mdash;1)!2)"71*"5%',
+    '*!8)#80p)"96$$gr;v#)ndash;125*"30+!5*!9)%210mm)#350)"50*"70)"67)#71%*!3',
+    '*"5f*"8%)(80&deg;c+$,000*"10*!2*#4ha)!9#,times;48&ins"#\'s.#%x100\'"$(65)"1,000&ndash;90,000&)-capacity(#opy',
+    '$"26#\'347,000$"61#\'476,500$"98##500$"53##676#"71%!4#%975.8"#-42#"66#"71%&-77-67',
+    '$!5#"85$!9#"90%"mm#$acre##bed&$room%#rth#!c##day$%egree#$fold%"ot#)kilometre',
+    '#&minute#$page#&seater$(omething$$tore%$ring##ton#&wicket"".0$!%##150#"23#!4$!3#!5',
+    '$!1#!7#"8%""/1$#251#"71"$0&ft$)micro;mol*!s$+ndash;1,000/#rpm+#050*#200*#701+"12',
+    '*$800m*#900-!%#"\'s#(,000,000#$-750$#800$$acre$)feet-long$"km$%litre$%metre$#odd$$seat("er',
+    '$$watt##.70#(/13/a/92&$a/92$%47/93$#900%!2$#rxs#&0-acre$"00%!9$"47$&7,5557$!9$$i/nt',
+    '$#rpm#"10$!4%#/49#!2##433$!8#!8$!0$"96#!9#!c#!f$%t/min#"hp',
+    '#\'m-1300m$!g$*illimetres$"yr#"nm#"pc#&x170mm##yds"%1,000$#645#".2#!0$"69#!1#!2',
+    '#"31%!4$"38##660%!8$"93#!7#!8#)a&ndash;d#"es")2&ndash;3*!7#".5#$2/06#!3',
+    '#!5$\'/12ax7a$"34#!6#!7#!8#!9$"72#"bp#)e&ndash;f#!h#"mb"%3,000$#700#"07',
+    '##131##212#"32$!3##410#"70##948#!a#"ff")4&ndash;5*#681*!9#$,350#!0##112',
+    '#!4#!5#"66#"ad#)c&ndash;d"*5&ndash;15+"70*!7+"06*!9#$,000#$0/75##2xc#!3##524',
+    '$"01$"76##7.3#!8#"ft#!m$!t",6&ndash;1232*#707#"-v#"/2#"0.#!1#!2##527',
+    '##999"+7&ndash;300#&-loads#"/1%"00$#400%"36#!1#!2#!3#!4#!6##712#!8")8,759,748',
+    '$\'840,126#%-0338##0m3"*9&ndash;16##100##200$#714#"30#!4#!5#!9#!m#!p"$:100#%20:10',
+    '""ad""bp""cc#"ms#!u"!d#!b"#ff.""hz""in"#kbp##ton"#lb.""ma#!g',
+    '##ins""no#!s"!o""pv""r."\'s&deg;f#+-orientated"#yds#+earsscharge#"rs!)1&deg;10\'\'!c#1frac12&ndash;8cms#\'mdash;2',
+    '#(ndash;10)!4)"52)!6*!1)!7*!3*!4)"85)"95#*times;10/l"#(2)#"4)"$,279##305',
+    '##489##500$"27#\'730,000$!5""-1#"45#%72mph#\'article#)year-olds"".0$!3$!9#!1$,&times;106.7',
+    '$"7%%!4#"31$!3$!4$!m#"5%$!9$%x49cm#"6%$!1$!9#"7%$!0"$/115',
+    '#"73$!5#+sps/211/209"%0,000$#850#$00\'s#!1##276#!3$"53##414$!6$"72##527#!6',
+    '##971##lbs#!m"%1,800#"11$"21#"27##333$"98##623#"71#!8#"pm"*2&ndash;13##036',
+    '#!3##406#!5#"60##794#"90$"10#"mw"*3&ndash;20#$,700#$-711#!.#!2$"15#!3',
+    '$!m#"69##822%!8$"38$"95#!9$!0#!p"%4,286$#647##.67##073##108$"67',
+    '%!2##548""5%#"\'s#(,000,000#%-mile#"/l#!0##422$"54##735#!e##ff.#!s"*6&ndash;18',
+    '#!0$"21#"19#"26#"31$!8#"58#!8""70##277##521#"70#"90$"62#)g&ndash;h',
+    '$#300#$/769#!0#!1#!2$"67#!8#!c#!f"*9&ndash;22#$,000$#502#\'-strong#(0-2770-5$!0',
+    '$"76#"60##842##922#)b&ndash;c"!a"!b"#min""no"!w"(year-old!%2&deg&/&ndash;80&deg;f#+ins;x24%ins#\'mdash;5',
+    '*"54)!6)!7*\'3&deg;f*!4*!8)(82&deg;f*\'5&deg;s"#(1)#"2)$#7%)#"3)"-,000-capacity\'$gate\'$mile',
+    '$&20,000##500$"59##900"$-145#"20#"65#"78#"90##deg#"ft#*hour-limit#"km#$mile$$onth',
+    '#&period#$year\'(s-of-age"".0$!5$!6#"15#"2%$".3#!3$!%$!2#"42#"61#!7',
+    '#!8$!%$!5##94%$!m"$/194#"38##574##650""0%#+&times;10/l#!-$%tonne#$/730#"0m',
+    '##460#!8$"49#!9#"hp$!z#"mm"11&mdash;2177/2288$\'ndash;2#"10$"21##262##583#"90$"37',
+    '#"st"+2&ndash;705##(2)##089#!1$"59##212##611#"72##891#!9#!c")3&ndash;4*#725,!6',
+    '##021#"14$"76##238#!4##507$!1$"57##625##785$"99##814$"88##922",4&ndash;2992',
+    '##226##369#&4-5627#!5$"46##648$"98#!9$!6")5&mdash;6$(ndash;67##(1)##,00#"/6##001',
+    '$"24##453##544#\'71.1341$"41$"57##961#!k$!g#!p"$6.00#%/1326#!0$!m##234',
+    '#"lb"+7&ndash;214*#728##.2%#!0#!1#!7#"80$"55#"91"%8,000##612##728##822$"90',
+    '#!p",9&ndash;2300*$3200+!7#!0##904%!5$$7058#!p"#:10#"25#+55&ndash;59"!a""cm"!f',
+    '"%kg/hl#!m"#mcs#"in#!m")nd-minute%%scale"#pp."!s#%torey"!v""xx!43&deg&ndash;77&deg;f&%;cmyr\'!n',
+    '#\'mdash;4#*ndash;103%)"35)"48)!5)!7*!2*!4+&&deg;f,(ndash;71*!7*!8*\'9&deg;f)"82+&&deg;f',
+    '*!4)"92*!8#&percnt"#(1)"$,106##267$"95##310$"70##400$"87##600##800$"87',
+    '"#-24#"59#%68-70#"86#-and-a-quarter##lap#$yard"#.1%$"pc#"21$!5#"3%$!3#!4$"bn',
+    '$!p#"91"$/148#"74#"84")0&ndash;4*$8490#%-mile##431#$5111##760#!m"#1-2#"/2#!0',
+    '$!7#"20$!3#"42##566#!9#)c&ndash;d#!m")2&mdash;3#"-1#$/989#!0##272#!5$!m',
+    '"%3,450##076#$1476##411##583#$7256$"33##842$"55#"90$"87"*4&ndash;40*!5#(,000,000#%-0111',
+    '#"52#$7018#$9708#"ft#!p"+5&ndash;804#$0340#"11##226$"72$"99#!3#"47#"92#)e&ndash;f',
+    '"+6&ndash;737##.71##403#$8/91$!0#"92#!a#)b&ndash;c#!f#!p$"p."#7\'s#+,1&ndash;11$#757#$-300',
+    '$"55#)e&ndash;f"*8&ndash;40#!0#!1#"50#"73#"80#!9#!g"19&mdash;residence$*ndash;1111*#740##(2)$"3)',
+    '##190##447##501$"96#)a&ndash;c"#a-d"#bhp""cm"!d""ft""no"$pstg""si!44&deg&ndash;80&deg;f&%;42\'n',
+    '#2ins;x&times;78&ins#(ndash\'79(";3)#485)"75)!8*!0*!2*!4)#93%#-rehy;year-old""\'s"(,000,000##297##300',
+    '##531%!5##627##726##824"$-145%!9#"75#\'country##gun#$year\'%-olds"".0$!0#"2%',
+    '#"6%$!6#!7$!%#"8%"!/##208#\'428:455"#0\'s#$,832#./1339&ndash;40$!l#"01$"kg$#rpm',
+    '##606#!7$!5#!g$,/1&frac34;lb#"kb#"mp##pp."+1&ndash;742*$880w#!0#!1$"11#!f#!h',
+    '##(8)$"9)#$,207#!0$"27$"48$"70#!d"$3(3)$"5)##.03##000##141$"99#$3221',
+    '#"ft"%4,000#!0##161$"98##230#!3#!4#!8""50#$102.#"37#!4#!5$"75',
+    '")6&ndash;7+"49#".1#"/7#!0$#452##2/1#"32#!6#"80$!9"+7&ndash;200*"50*#748#$,304',
+    '#$-400$$sr46$$type##.00#%20515##707##800#"90",8&ndash;2190#(,000,000%"19#*-including#!0$"00#!2',
+    '$#056#"80#!p"+9&ndash;750#$(hl)#!5#!9#"ad#!d#!h"\':skk864"!b#"ed"$c541"!d',
+    '"%ills.""l7##s74"#mph"!w',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_92 = (
+count_92 = 6694
+
+heads_92 = (
     '384b&ndash;d',
-    '384h',
-    '384kbps',
-    '385&ndash;6',
-    '385(410)',
-    '385,640',
-    '385-foot',
-    '385-page',
-    '385.2%',
-    '38500',
-    '38503',
-    '38504',
-    '38507',
-    '38512-13',
-    '38513-14',
-    '38513-15',
     '38514',
-    '38515',
-    '38518-19',
-    '3852',
-    '38523-24',
-    '38525',
-    '38526-27',
-    '38529-30',
-    '38538-39',
-    '3854&ndash;3855',
-    '38540-41',
-    '38542-43',
-    '38543-44',
-    '38544-55',
-    '38546',
-    '38552',
     '38552-54',
-    '38558-59',
-    '3856',
-    '38561',
-    '38562',
-    '38564',
-    '38564-65',
-    '38570',
-    '38573-74',
-    '38574-75',
-    '38578-79',
-    '3857850',
-    '38579',
-    '3858',
-    '38582-83',
-    '38583-84',
     '38587-88',
-    '38596',
-    '38597',
-    '38598-99',
-    '385mph',
-    '386%',
-    '386,071',
-    '386-389',
-    '386-40',
-    '386-class',
-    '386-megabyte',
-    '386.',
-    '386.4%',
-    '386.57',
-    '386/17000',
-    '386/25',
     '386/smp',
-    '38603',
-    '3861',
-    '3862',
-    '38621',
-    '38626',
-    '38626-27',
-    '3863',
-    '38630',
-    '38638-73',
-    '3864',
-    '38642',
-    '38646',
-    '38654-55',
-    '38658-9',
-    '38664-64',
     '38665-66',
-    '38667',
-    '3867',
-    '38670-71',
-    '38673-74',
-    '38675-76',
-    '3868',
-    '38686',
-    '38689',
-    '386dx-20',
-    '386dx-40mhz',
-    '386dxl',
-    '386dxs',
-    '386link',
-    '386pp.',
-    '386s',
     '386slc',
-    '386ssx/25c',
-    '386sx/16',
-    '386sx/33',
-    '387&ndash;405',
-    '387&ndash;8',
-    '387,386',
-    '387-413',
-    '3870',
-    '38702-703',
-    '38704&mdash;and',
-    '38705-06',
-    '38709-10',
-    '38711-13',
-    '38714',
-    '38723',
     '38724',
-    '38725-26',
-    '38727-28',
-    '38728',
-    '38728-29',
-    '38730-31',
-    '38735',
-    '38741-42',
-    '38742-43',
-    '38748',
-    '38752',
-    '38757',
-    '38762-63',
-    '38763',
-    '38768-69',
-    '38774-75',
     '38776-77',
-    '38777-78',
-    '3878',
-    '38784',
-    '38794',
-    '38798-99',
-    '387d',
-    '387ft-tall',
-    '387pp',
-    '387sx',
-    '388&mdash;410',
-    '388&ndash;92',
-    '388&ndash;93',
-    '388(1)',
-    '388,013',
-    '388-b',
     '388.75',
-    '3880',
-    '38802-03',
-    '3880515',
-    '3880s',
-    '38813-14',
-    '38816-17',
-    '38817',
-    '38818',
-    '38823',
-    '38826-27',
-    '38828-29',
-    '3883',
-    '38830-31',
-    '38833-34',
-    '3885',
     '38851-52',
-    '38853-4',
-    '38858',
-    '3886',
-    '38860-61',
-    '38861-62',
-    '38862',
-    '38863',
-    '38864-65',
-    '38865-66',
-    '38867',
-    '38867-68',
-    '38868',
-    '38868-69',
-    '38869-70',
-    '38870-71',
     '38871',
-    '38871-72',
-    '38875-76',
-    '38879',
-    '38879-80',
-    '38880-81',
-    '38882-83',
-    '3889',
-    '38898-99',
-    '388b',
-    '388p',
-    '389&ndash;91',
-    '389&ndash;92',
-    '389&ndash;93',
-    '389,600',
-    '389000',
     '38907-08',
-    '38909',
-    '38918-19',
-    '3892',
-    '38920',
-    '38921-22',
-    '38922-3',
-    '38924-25',
-    '38932-33',
-    '38940',
-    '38944',
-    '38949',
-    '38957-58',
-    '38960',
-    '38966',
-    '38971-72',
     '38973-74',
-    '38976-77',
-    '38977-78',
-    '38979',
-    '3898',
-    '38980-81',
-    '38983',
-    '38995',
-    '38995-96',
-    '38998',
-    '38999-39000',
-    '389b',
-    '38:1',
-    '38:1f',
-    '38:20',
-    '38:4,7',
     '38bc',
-    '38bn',
-    '38cm/10',
-    '38d',
-    '38e',
-    '38ff',
-    '38hp',
-    '38hz',
-    '38in',
-    '38k',
-    '38kg',
-    '38km',
-    '38kw',
-    '38l',
-    '38mb',
-    '38mg',
     '38minute',
-    '38mm-90mm',
-    '38myr',
-    '38p/min',
-    '38pp',
-    '38r',
-    '38s',
-    '38s.',
-    '38s5',
-    '38secs',
-    '38xxx',
-    '39&deg;c',
-    '39&mdash;41',
-    '39&mdash;62',
-    '39&ndash;18',
-    '39&ndash;24',
     '39&ndash;3',
-    '39&ndash;40&deg;c',
-    '39&ndash;45',
-    '39&ndash;46',
-    '39&ndash;47',
-    '39&ndash;49',
-    '39&ndash;50',
-    '39&ndash;59',
-    '39&ndash;6',
-    '39&ndash;67%',
-    '39&ndash;72',
-    '39&ndash;9',
-    '39&ndash;97',
-    '39(5)',
-    '39,000-capacity',
-    '39,100',
     '39,106',
-    '39,200,000',
-    '39,211',
-    '39,231',
-    '39,302',
-    '39,395',
-    '39,400',
-    '39,417',
-    '39,500,920,000',
-    '39,502',
-    '39,630',
-    '39,646',
-    '39,651',
-    '39,760',
-    '39,832',
-    '39,868',
     '39,888',
-    '39,90',
-    '39,988',
-    '39-',
-    '39-0',
-    '39-14',
-    '39-22',
-    '39-24',
-    '39-3',
-    '39-41',
-    '39-copy',
-    '39-delivery',
-    '39-member',
-    '39-member-strong',
-    '39-metre-high',
-    '39-nation',
     '39-run',
-    '39-seat',
-    '39-year',
-    '39-year&rehy;old',
-    '39.0',
-    '39.0%',
-    '39.00',
-    '39.03',
-    '39.04',
-    '39.1%',
-    '39.11',
-    '39.15',
-    '39.16',
-    '39.1pc',
-    '39.2&deg;c',
-    '39.20',
     '39.21',
-    '39.25',
-    '39.2p',
-    '39.2x10',
-    '39.3%.',
-    '39.30',
-    '39.32',
-    '39.37in',
-    '39.3k',
-    '39.4&deg;c',
-    '39.41',
-    '39.42p',
-    '39.43p',
-    '39.450&mdash;1',
-    '39.47',
-    '39.4ins',
     '39.4p',
-    '39.50',
-    '39.52',
-    '39.53',
-    '39.6',
-    '39.6bn',
-    '39.70',
-    '39.77m',
-    '39.9',
-    '39.95',
-    '39/103',
-    '39/11',
-    '39/11d',
-    '39/125',
-    '39/126',
-    '39/13/1',
     '39/40',
-    '39/41',
-    '39/42',
-    '39/dx',
-    '390&ndash;2',
-    '390&ndash;459',
-    '390,401',
-    '390-based',
-    '390-foot',
-    '390-on-a-chip',
-    '390000',
-    '39001-02',
-    '39005-06',
-    '39009',
-    '3900lb',
-    '39012-13',
     '39016-17',
-    '39017-18',
-    '39018',
-    '39018-19',
-    '39019-20',
-    '39021-22',
-    '39022',
-    '39026-27',
-    '39029-30',
-    '39031-32',
-    '39032',
-    '39032-33',
-    '39034',
-    '39036-37',
-    '3904',
-    '39044-45',
     '39049-10',
-    '39049-50',
-    '3905',
-    '39051',
-    '39052',
-    '39055',
-    '39057for',
-    '39058-59',
-    '3906.25',
-    '39062',
-    '39067-68',
-    '39068',
-    '39068-69',
-    '39071-72',
-    '39078',
-    '39080-82',
     '39082-83',
-    '39084-85',
-    '39087',
-    '39088',
-    '39091',
-    '39091-92',
-    '39092',
-    '39093',
-    '390999',
-    '390c',
-    '390f',
-    '390f&ndash;391d',
-    '390yds',
-    '391,000',
-    '391,442',
-    '391.7%',
     '391/020',
-    '391/l',
-    '3910',
-    '39100',
-    '391009',
-    '39106',
-    '3910s-04',
-    '3911/92',
-    '39110-11',
-    '39111-12',
-    '39118-19',
-    '3912',
-    '39123',
-    '39126',
-    '39128-29',
-    '39129,44',
     '39132-33',
-    '39134',
-    '39134-35',
-    '39135',
-    '39136-37',
-    '39139',
-    '39140-41',
-    '39141',
-    '39142',
-    '39146-47',
-    '39150',
-    '39150-51',
-    '39151-52',
-    '39152',
-    '39154-55',
-    '39161-62',
     '39165-66',
-    '39167-68',
-    '39168-69',
-    '39170-71',
-    '39171',
-    '39174-76',
-    '39176-77',
-    '39177-78',
-    '39181-82',
-    '39182',
-    '39183',
-    '39186-87',
-    '39188',
-    '39189',
-    '39189-90',
-    '3919',
     '39190',
-    '39191-92',
-    '39192',
-    '39196',
-    '39199',
-    '391c',
-    '391p',
-    '392&mdash;30',
-    '392&ndash;1580',
-    '392&ndash;3',
-    '39203',
-    '39211',
-    '39214-15',
-    '39220',
-    '392226',
-    '39223',
     '3923',
-    '39234',
-    '39236',
-    '39244',
-    '39251',
-    '3926',
-    '392611',
-    '3926668',
-    '3929',
-    '392e',
-    '392f',
-    '392kgs',
-    '392mm.',
-    '392p',
-    '393&ndash;4',
-    '393&ndash;423',
     '393(8)',
-    '393,615',
-    '393.4%',
-    '393020',
-    '3932',
-    '39323',
-    '3937',
-    '39380',
-    '39384',
-    '393a(b)',
-    '394&ndash;424',
-    '394.25',
-    '39417',
-    '3942',
-    '394325',
-    '3944',
     '394555',
-    '395&ndash;6',
-    '395/l',
-    '3951',
-    '3952&mdash;5',
-    '39520',
-    '3954',
-    '39540',
-    '3954lb',
-    '39570',
-    '3959',
-    '395k',
-    '395mm',
-    '395mph',
-    '396&ndash;397',
-    '396&ndash;7',
     '396,532',
-    '396,785',
-    '396.6',
-    '396/397',
-    '3960',
-    '39610',
-    '3966',
-    '396c',
-    '396c&ndash;e',
-    '397&ndash;227',
-    '397&ndash;4440',
-    '397&ndash;465',
-    '397,073',
-    '39766',
-    '397951',
-    '397c',
     '398&ndash;401',
-    '398(54e)',
-    '398.881',
-    '39804',
-    '3981',
-    '39822',
-    '3984&sol;7429',
-    '3984143',
-    '39880',
-    '3989',
-    '39890',
-    '398nm',
-    '398p.',
-    '399,184.46',
-    '399.000.000,00',
-    '399.2m',
     '3990-4',
-    '3990-6',
-    '3990-9',
-    '39900',
-    '3990s',
-    '39910',
-    '39930',
-    '39964',
-    '39970',
-    '39980',
-    '399th',
-    '39:1',
-    '39:9&ndash;10',
-    '39_per',
-    '39b',
-    '39lb',
     '39lbs',
-    '39m',
-    '39mm',
-    '39secs',
-    '39years-old',
-    '3:00:56',
-    '3:03',
-    '3:07:18',
-    '3:08:14',
-    '3:1&ndash;4',
-    '3:1,3',
-    '3:1,5&ndash;16',
-    '3:13&ndash;16',
-    '3:13f',
-    '3:14&ndash;16',
-    '3:14&ndash;20',
     '3:15pm',
-    '3:16&ndash;21',
-    '3:16f',
-    '3:17&ndash;18',
-    '3:1ff',
-    '3:2,3,5,14',
-    '3:20&ndash;30',
-    '3:20&ndash;4',
-    '3:20pm',
-    '3:21f.',
-    '3:23&ndash;26',
-    '3:23&ndash;4:7',
-    '3:27',
-    '3:28ff',
-    '3:2:1',
-    '3:2f',
     '3:3,5',
-    '3:30',
-    '3:34.73',
-    '3:36',
-    '3:3:1',
-    '3:4&ndash;11',
-    '3:4&ndash;7',
-    '3:40.7',
-    '3:45',
-    '3:45.82',
-    '3:47',
-    '3:49',
-    '3:50.70',
-    '3:50am',
-    '3:52.47',
-    '3:53',
     '3:54.9',
-    '3:57.0',
-    '3:58',
-    '3:7ff',
-    '3:8&ndash;15',
-    '3:9&ndash;20',
-    '3:9,10',
-    '3:diagram/figure',
-    '3:payments',
-    '3:s',
-    '3=1',
-    '3=100',
-    '3=all',
-    '3=blood',
-    '3=discrete',
-    '3=gross',
     '3=high',
-    '3=incapacitating',
-    '3=interlobular',
-    '3=mild',
-    '3=more',
-    '3=urgency',
-    '3a(a)',
-    '3a(b)',
-    '3a(f)',
-    '3a(i)',
-    '3a(ii)',
-    '3a-e',
-    '3a-hydroxysteroid',
-    '3a.',
-    '3a.true',
-    '3ability',
     '3ad.',
-    '3ae.',
-    '3af',
-    '3ag',
-    '3ai',
-    '3aj',
-    '3aq',
-    '3ar',
-    '3au',
-    '3awill',
-    '3ax',
-    '3b(1)',
-    '3b2s',
-    '3bd',
-    '3bh',
-    '3bj',
     '3bl',
-    '3bl.',
-    '3brs',
-    '3bs',
-    '3bt',
-    '3bu',
-    '3bx',
-    '3c(6)',
-    '3c8',
-    '3cm.',
-    '3comm',
-    '3cs',
-    '3d&rehy;aav',
-    '3d-searching',
-    '3d-square',
-    '3d10',
     '3d6&ins',
-    '3dd',
-    '3de',
-    '3dg',
-    '3dj',
-    '3dp',
-    '3dp.',
-    '3dq',
-    '3dscale',
-    '3during',
-    '3dw',
-    '3dy',
-    '3dz',
-    '3e1',
-    '3e2',
-    '3e6',
     '3en',
-    '3eq',
-    '3et',
-    '3fb',
-    '3fd',
-    '3fg',
-    '3fl',
-    '3floz',
-    '3ft-long',
-    '3ft.',
-    '3g1',
-    '3g110',
-    '3g114',
-    '3g2',
-    '3g8.',
-    '3gg',
     '3gips',
-    '3h.',
-    '3h9',
-    '3hb',
-    '3hb-',
-    '3he',
-    '3hfm',
-    '3hg',
-    '3hj',
-    '3hn',
-    '3hn.',
-    '3hours',
-    '3hq',
-    '3ht',
-    '3hv',
-    '3i-backed',
     '3if',
-    '3in-long',
-    '3inch',
-    '3jd',
-    '3jf',
-    '3jg',
-    '3jh',
-    '3jn',
-    '3ju',
-    '3k4',
-    '3kev',
-    '3kg/s/ha',
-    '3kgs',
-    '3km/2mls',
-    '3kpc&mdash;consistent',
-    '3le',
     '3lje',
-    '3lp',
-    '3lsmoy',
-    '3lw',
-    '3m&amp;sup2',
-    '3m-strong',
-    '3m-transistor',
-    '3m.',
-    '3m/10ft',
-    '3mev',
-    '3mil',
-    '3min23-28',
-    '3mins',
-    '3mv/cm',
-    '3mw',
-    '3myr',
     '3n8',
-    '3nb',
-    '3nd',
-    '3net',
-    '3nj',
-    '3nm',
-    '3nu',
-    '3nz',
-    '3o-1',
-    '3o-odd',
-    '3oft',
-    '3om',
-    '3ookg',
-    '3ooo-14oobc',
-    '3p.m.',
-    '3p.p.t.v',
     '3p/kwh',
-    '3pa',
-    '3pf',
-    '3pm-5pm',
-    '3portions',
-    '3ppm',
-    '3pq',
-    '3ps',
-    '3pu',
-    '3q21',
-    '3q93',
-    '3qb',
-    '3qe',
-    '3qg',
-    '3qh',
-    '3qr',
     '3qt',
-    '3r/2',
-    '3rb',
-    '3rd&ndash;12th',
-    '3rd&ndash;5th',
-    '3rd&ndash;6th',
-    '3rd&ndash;9th',
-    '3rd-19th',
-    '3rd-century-bc',
-    '3rd-year',
-    '3rip',
-    '3rr',
-    '3s9d',
-    '3secs',
-    '3si',
-    '3space',
     '3tb',
-    '3tbs',
-    '3the',
-    '3three',
-    '3tq',
-    '3tsp',
-    '3tw',
-    '3ud',
-    '3ue',
-    '3uy',
-    '3uz',
-    '3v14&ndash;21',
-    '3v26&ndash;29',
-    '3vely',
-    '3w/mac',
-    '3wk',
     '3wlr',
-    '3wlr1103',
-    '3would',
-    '3wq.',
-    '3x10evcm',
-    '3x1in',
-    '3x20min',
-    '3x3',
-    '3x6inch',
-    '3x74',
-    '3x80',
-    '3xb',
-    '3xu',
-    '3y',
-    '3yb',
-    '3yg',
     '3yy',
-    '3yz',
-    '4%-8%',
-    '4&agr;-phorbol',
-    '4&amp;frac12',
-    '4&amp;i/2',
-    '4&ast',
-    '4&deg;-25&deg',
-    '4&deg;c.',
-    '4&deg;c/ambient',
-    '4&egrave;me',
-    '4&frac12&ft;deep',
-    '4&frac12&mdash;8',
-    '4&frac12&ndash;11',
-    '4&frac12&times;7&ins',
-    '4&frac12/4',
     '4&frac12/4&frac12',
-    '4&frac12;-foot',
-    '4&frac12;-litre',
-    '4&frac12;-year-old',
-    '4&frac12;-year-olds',
-    '4&frac12;d',
-    '4&frac12;feet',
-    '4&frac12;jd',
-    '4&frac12;kg',
-    '4&frac12;l',
-    '4&frac12;lb',
-    '4&frac12;m',
-    '4&frac14&ins',
-    '4&frac34&ins',
-    '4&frac47',
-    '4&ft;6',
     '4&ft;6&ins',
-    '4&ft;7',
-    '4&ft;8&frac12&ins',
-    '4&ft;long',
-    '4&half;x7inches',
-    '4&ins;-6&ins',
-    '4&ins;.',
-    '4&mdash',
-    '4&mdash;10',
-    '4&mdash;30',
-    '4&mdash;to',
-    '4&micro;s',
-    '4&middot;0',
-    '4&middot;5',
-    '4&ndash&frac12',
-    '4&ndash;-7&ndash;0',
     '4&ndash;0&ndash;8',
-    '4&ndash;03.5',
-    '4&ndash;1&ndash;1883',
-    '4&ndash;1&ndash;3',
-    '4&ndash;1&ndash;7&ndash;5',
-    '4&ndash;1&ndash;8',
-    '4&ndash;1-4&ndash;1',
-    '4&ndash;10&ndash;8',
-    '4&ndash;10/1000',
-    '4&ndash;12%',
-    '4&ndash;12&ndash;12',
-    '4&ndash;12&ndash;8',
-    '4&ndash;13%',
-    '4&ndash;14&ndash;0',
-    '4&ndash;14th',
-    '4&ndash;15&ndash;0',
     '4&ndash;17&ndash;2',
-    '4&ndash;179',
-    '4&ndash;1865',
-    '4&ndash;2&ndash;2',
-    '4&ndash;20',
-    '4&ndash;23',
-    '4&ndash;25',
-    '4&ndash;26',
-    '4&ndash;27',
-    '4&ndash;27%',
-    '4&ndash;278',
-    '4&ndash;28',
-    '4&ndash;28%',
-    '4&ndash;3&ndash;10',
-    '4&ndash;3/4in',
-    '4&ndash;30pm',
     '4&ndash;31',
-    '4&ndash;316',
-    '4&ndash;32',
-    '4&ndash;330',
-    '4&ndash;35',
-    '4&ndash;354',
-    '4&ndash;36.6',
-    '4&ndash;38',
-    '4&ndash;38.8',
-    '4&ndash;39.0',
-    '4&ndash;39.1',
-    '4&ndash;4&frac12',
-    '4&ndash;4&ndash;1900',
-    '4&ndash;4&ndash;6&ndash;0\'s',
-    '4&ndash;4.5',
-    '4&ndash;4.5m',
     '4&ndash;40',
-    '4&ndash;40.4',
-    '4&ndash;41',
-    '4&ndash;45%',
-    '4&ndash;5&ins',
-    '4&ndash;5&ndash;10',
-    '4&ndash;5&ndash;6',
-    '4&ndash;5.',
-    '4&ndash;52',
-    '4&ndash;55',
-    '4&ndash;58',
-    '4&ndash;5cms',
-    '4&ndash;5cwt',
-    '4&ndash;5ft',
-    '4&ndash;5in',
-    '4&ndash;5km',
     '4&ndash;6%',
-    '4&ndash;6&ndash;2\'s',
-    '4&ndash;6&ndash;2+2&ndash;6&ndash;4',
-    '4&ndash;61',
-    '4&ndash;6:7',
-    '4&ndash;6ft',
-    '4&ndash;71',
-    '4&ndash;71\'s',
-    '4&ndash;78',
-    '4&ndash;7th',
-    '4&ndash;8&ndash;0',
-    '4&ndash;8&ndash;1864',
-    '4&ndash;8&ndash;4',
-    '4&ndash;8&ndash;8',
-    '4&ndash;8ins',
-    '4&ndash;8mcg/kg/hour',
     '4&ndash;90',
-    '4&ndash;95',
-    '4&ndash;caps',
-    '4&ndash;cep',
-    '4&ndash;chome',
-    '4&ndash;epb',
-    '4&pgr',
-    '4&plus;2',
-    '4&prime;18&prime',
-    '4&prime;20&prime',
-    '4&prime;25&prime',
-    '4&prime;28&prime',
-    '4&prime;43&prime',
-    '4&shilling;11d',
-    '4&shilling;1d',
-    '4&shilling;6',
     '4&sol;1989',
-    '4&sol;1990',
-    '4&times',
-    '4&times;10',
-    '4&times;15',
-    '4&times;2',
-    '4&times;20',
-    '4&times;3',
-    '4&times;5&frac34&ins',
-    '4\',6',
-    '4\',6-diamidino-2-phenylindole',
-    '4\'05',
-    '4\'33',
-    '4()',
-    '4(9)&mdash',
-    '4(a)rf',
     '4(b)',
-    '4(i)',
-    '4(m)',
-    '4**',
-    '4*2*1*3',
-    '4+2',
-    '4+pockets',
-    '4,0',
-    '4,000&ft',
-    '4,000&ndash;2,000',
-    '4,000&ndash;25,000',
-    '4,000&ndash;5,000kg',
-    '4,000-16,000',
-    '4,000-6,000',
-    '4,000-customer',
-    '4,000-metre',
     '4,000-mile',
-    '4,000-odd',
-    '4,000-room',
-    '4,000-seat',
-    '4,000-signature',
-    '4,000-student',
-    '4,000-ton',
-    '4,000.00',
-    '4,000g',
-    '4,000gn',
-    '4,000gns',
-    '4,000km',
-    '4,000m',
-    '4,000mm',
-    '4,000rpm',
-    '4,000sq',
     '4,000yrbp',
-    '4,001,353',
-    '4,012',
-    '4,013',
-    '4,015',
-    '4,024',
-    '4,026',
-    '4,028',
-    '4,032',
-    '4,040,000',
-    '4,042,000',
-    '4,049',
-    '4,050',
-    '4,062',
-    '4,068',
-    '4,080',
     '4,080,000',
-    '4,085',
-    '4,091',
-    '4,095',
-    '4,096:1',
-    '4,10(a)',
-    '4,100,000',
-    '4,100-strong',
-    '4,106',
-    '4,120ft',
-    '4,123',
-    '4,125',
-    '4,131',
-    '4,131,000',
-    '4,140',
-    '4,148',
     '4,159,000',
-    '4,160',
-    '4,166',
-    '4,174',
-    '4,190,000',
-    '4,193',
-    '4,194',
-    '4,195',
-    '4,198ft',
-    '4,2',
-    '4,200,000,000',
-    '4,200ft',
-    '4,200gns',
-    '4,200m',
-    '4,202,000',
-    '4,212',
     '4,214',
-    '4,216',
-    '4,219',
-    '4,221',
-    '4,230',
-    '4,236',
-    '4,237',
-    '4,237hz',
-    '4,244',
-    '4,247th',
-    '4,252',
-    '4,258',
-    '4,258,000',
-    '4,260',
-    '4,265',
-    '4,265ft',
     '4,267',
-    '4,275,000',
-    '4,278',
-    '4,283',
-    '4,288',
-    '4,3,6',
-    '4,300m',
-    '4,304',
-    '4,310',
-    '4,315',
-    '4,318',
-    '4,320,000',
-    '4,332',
-    '4,332,000',
-    '4,334',
-    '4,337,487',
     '4,338-km',
-    '4,339',
-    '4,343',
-    '4,346',
-    '4,355',
-    '4,360',
-    '4,371',
-    '4,373',
-    '4,387',
-    '4,389',
-    '4,390,200',
-    '4,393',
-    '4,394',
-    '4,395,000',
-    '4,4\'-diisothiocyanatostilbene-2,2\'-disulphonic',
-    '4,4\'-tetra-methyldiaminodiphenylmethane',
     '4,40',
-    '4,400,000',
-    '4,400-acre',
-    '4,400gns',
-    '4,400kg',
-    '4,401',
-    '4,419',
-    '4,420',
-    '4,429',
-    '4,430,000',
-    '4,432',
-    '4,437,364',
-    '4,442',
-    '4,444,000',
-    '4,446kg',
-    '4,450',
     '4,450,000',
-    '4,460',
-    '4,462',
-    '4,463',
-    '4,465',
-    '4,467',
-    '4,472',
-    '4,482',
-    '4,487',
-    '4,5,7&ndash;10',
-    '4,500%',
-    '4,500-mile',
-    '4,500-million',
-    '4,500-year-old',
-    '4,500cc',
-    '4,500km',
     '4,500rpm',
-    '4,500tyr',
-    '4,504',
-    '4,505',
-    '4,514,000',
-    '4,522,463',
-    '4,526',
-    '4,532',
-    '4,538',
-    '4,547.4',
-    '4,550',
-    '4,553',
-    '4,558,000',
-    '4,572',
-    '4,574,048',
-    '4,583',
     '4,583,000',
-    '4,587',
-    '4,589',
-    '4,592,000',
-    '4,593,000',
-    '4,6,19',
-    '4,6,8',
-    '4,600-strong',
-    '4,601',
-    '4,603',
-    '4,611',
-    '4,613',
-    '4,620',
-    '4,630',
-    '4,630ft',
-    '4,631',
     '4,633',
-    '4,636',
-    '4,637',
-    '4,653',
-    '4,656',
-    '4,657.80',
-    '4,677.40',
-    '4,683',
-    '4,688',
-    '4,690',
-    '4,7,10,11,12,13,15',
-    '4,7,25',
-    '4,700kg',
-    '4,700m',
-    '4,718',
-    '4,719',
     '4,720',
-    '4,727',
-    '4,729.39',
-    '4,737',
-    '4,748,145',
-    '4,763',
-    '4,768',
-    '4,770',
-    '4,770,000',
-    '4,774',
-    '4,781',
-    '4,782',
-    '4,785',
-    '4,8',
-    '4,800-yard',
-    '4,800bps/2,400bps',
     '4,800kg',
-    '4,802',
-    '4,808',
-    '4,809',
-    '4,811',
-    '4,812,000',
-    '4,814',
-    '4,817',
-    '4,822,000',
-    '4,825',
-    '4,827',
-    '4,828',
-    '4,835',
-    '4,837',
-    '4,845',
-    '4,850',
     '4,870',
-    '4,875',
-    '4,876',
-    '4,877',
-    '4,892',
-    '4,892,242',
-    '4,894',
-    '4,896,200',
-    '4,900,000',
-    '4,900,675',
-    '4,900kg',
-    '4,910',
-    '4,916',
-    '4,917',
-    '4,921,000',
-    '4,923',
     '4,923%',
-    '4,928',
-    '4,936',
-    '4,940',
-    '4,948',
-    '4,949',
-    '4,950,000',
-    '4,953',
-    '4,959',
-    '4,960,000',
-    '4,972,338',
-    '4,986',
-    '4,990',
-    '4-&agr;tpa',
-    '4-0-26-0',
-    '4-11',
     '4-12',
-    '4-13',
-    '4-134',
-    '4-15',
-    '4-159',
-    '4-16',
-    '4-2-3-3-4-4-3-5-5-(33)',
-    '4-2-4',
-    '4-210',
-    '4-22',
-    '4-24',
-    '4-25',
-    '4-27',
-    '4-3-3',
-    '4-3-4-3-5-3-2-4-5-(33)',
-    '4-4-0s',
     '4-4-6',
-    '4-4-93',
-    '4-5%',
-    '4-5,000',
-    '4-5-1',
-    '4-5-5',
-    '4-5-6',
-    '4-5-93',
-    '4-500',
-    '4-5pm',
-    '4-6-0s',
-    '4-66',
-    '4-8-4t',
-    '4-90',
-    '4-a-clock',
-    '4-aminobenzoic/phosphoric',
     '4-aminophenazone',
-    '4-aminopyridine',
-    '4-aminoquinolines',
-    '4-arch',
-    '4-bedded',
-    '4-binary',
-    '4-birdie',
-    '4-bis(3-methyl-2-butenyloxy)chalcone',
-    '4-branched',
-    '4-byte',
-    '4-cd',
-    '4-cell',
-    '4-cep',
-    '4-ceps',
-    '4-chloro',
-    '4-cigs',
     '4-colour',
-    '4-cornered',
-    '4-dimensional',
-    '4-disease',
-    '4-door',
-    '4-drawer',
-    '4-er',
-    '4-ethenylheptane',
-    '4-haps',
-    '4-hp',
-    '4-humberside',
-    '4-hydroxy-5-iodo-3-nitrophenacetyl',
-    '4-i',
-    '4-img',
-    '4-inch-high',
-    '4-irons',
     '4-kb',
-    '4-lb/&pound;12.50',
-    '4-leg',
-    '4-letter',
-    '4-level',
-    '4-line',
-    '4-linkages',
-    '4-match',
-    '4-medway',
-    '4-mee-ta',
-    '4-member',
-    '4-methacryloxyethyl',
-    '4-methyl',
-    '4-mm',
-    '4-month-old',
-    '4-nz',
     '4-ohms',
-    '4-over',
-    '4-oz.',
-    '4-pack',
-    '4-part',
-    '4-person',
-    '4-plus',
-    '4-pointer',
-    '4-pole',
-    '4-pounder',
-    '4-pounds',
-    '4-processor',
-    '4-reps',
-    '4-series',
-    '4-sheets',
-    '4-speaker',
     '4-square',
-    '4-stereo',
-    '4-stereo-input',
-    '4-stranded',
-    '4-strings',
-    '4-stroke',
-    '4-sub',
-    '4-subs',
-    '4-syllable',
-    '4-t',
-    '4-thousand',
-    '4-to-3',
-    '4-too',
-    '4-tuple',
-    '4-under-par',
-    '4-up',
     '4-veps',
-    '4-volume',
-    '4-ways',
-    '4-wheeled',
-    '4-wheelers',
-    '4-wood',
-    '4-wrap',
-    '4-year&rehy;old',
-    '4.0&aring',
-    '4.0&ndash;4.4kb',
-    '4.0&ndash;5.0',
-    '4.0&ndash;5.5',
-    '4.0&ndash;5.8',
-    '4.0\'s',
-    '4.0-litre',
-    '4.0.0',
     '4.0.1',
-    '4.0.4',
-    '4.0/1000',
-    '4.00&ndash;5.00pm',
-    '4.00/4.30',
-    '4.00p',
-    '4.01%',
-    '4.02kg',
-    '4.03',
-    '4.05%',
-    '4.07%',
-    '4.0bn',
-    '4.0kcal',
-    '4.0m',
-    '4.0s',
-    '4.1&deg;c',
     '4.1&ndash;12.8',
-    '4.1&ndash;16',
-    '4.1&ndash;26',
-    '4.1.13',
-    '4.1.2.1',
-    '4.10.0',
-    '4.10.1',
-    '4.10.8',
-    '4.10.88',
-    '4.108',
-    '4.10am',
-    '4.10pm',
-    '4.11(7)',
-    '4.11(c)',
-    '4.11.9',
-    '4.11.93',
     '4.12&ndash;4.15',
-    '4.13(a)',
-    '4.13.1',
-    '4.13.2',
-    '4.13.6',
-    '4.14&ndash;15',
-    '4.14(4)',
-    '4.14.17',
-    '4.14p',
-    '4.15&ndash;16',
-    '4.15(a)',
-    '4.15(c)',
-    '4.152',
-    '4.15p.m',
-    '4.16(c)',
-    '4.16(d)',
     '4.17(a)',
-    '4.17countss',
-    '4.18&ndash;4.24',
-    '4.184',
-    '4.19&ndash;24',
-    '4.19(b)',
-    '4.19(c)',
-    '4.1in',
-    '4.1introduction',
-    '4.1pcm',
-    '4.1secs',
-    '4.2&ndash;4.7',
-    '4.2&ndash;5.2',
-    '4.2&ndash;5.7',
-    '4.2(14)',
-    '4.2(a)',
     '4.2(b)',
-    '4.2-cm-high',
-    '4.2.',
-    '4.2.1.3',
-    '4.2.10',
-    '4.2.10(ii)',
-    '4.2.2,4.2.3',
-    '4.203',
-    '4.21(a)',
-    '4.21(b)',
-    '4.21(c)',
-    '4.22%',
-    '4.22&ndash;24',
-    '4.22ff',
-    '4.23cm',
-    '4.23countss',
     '4.25&ndash;4.30kms',
-    '4.25&ndash;5.5m',
-    '4.25m',
-    '4.27.36',
-    '4.27ff',
-    '4.28.13',
-    '4.29c',
-    '4.2c',
-    '4.2ff',
-    '4.2in',
-    '4.2km',
-    '4.2ms',
-    '4.2p.the',
-    '4.2pc',
-    '4.2relationship',
-    '4.2sec',
     '4.3(1)',
-    '4.3(d)',
-    '4.3-based',
-    '4.3.5.3.5.4.3.4.5(36)',
-    '4.3.7',
-    '4.3.8',
-    '4.3.9',
-    '4.30&ndash;5.45',
-    '4.30&ndash;6.30',
-    '4.30-6.30',
-    '4.30a.m.',
-    '4.30pm.',
-    '4.31p',
-    '4.325',
-    '4.34%',
-    '4.34p',
     '4.35.26',
-    '4.35.4',
-    '4.35m',
-    '4.35p',
-    '4.365',
-    '4.36am',
-    '4.37.34',
-    '4.375',
-    '4.37in',
-    '4.37pm',
-    '4.38ish',
-    '4.3:1',
-    '4.3a',
-    '4.3bsd',
-    '4.3bsd-compatible',
-    '4.3ftl',
     '4.3secs',
-    '4.4&deg',
-    '4.4&ins',
-    '4.4&ndash;16',
-    '4.4&ndash;75',
-    '4.4&ndash;9.8%',
-    '4.4(i)',
-    '4.4.10',
-    '4.4.11',
-    '4.4.12',
-    '4.4.13',
-    '4.4.17',
-    '4.4.8',
-    '4.4.9',
-    '4.4.90',
-    '4.41%',
     '4.45&ndash',
-    '4.45&ndash;5.45',
-    '4.45am',
-    '4.45in',
-    '4.45l',
-    '4.46',
-    '4.47am',
-    '4.483',
-    '4.48sec',
-    '4.49',
-    '4.49%',
-    '4.4:1',
-    '4.4f',
-    '4.4ghz',
-    '4.4lbs/2kg',
-    '4.4m/s',
     '4.4million',
-    '4.4oz',
-    '4.5&aring',
-    '4.5&ndash;15',
-    '4.5&ndash;26.3%',
-    '4.5&ndash;5',
-    '4.5&ndash;6.5kg/10&ndash;14lb',
-    '4.5&ndash;6m',
-    '4.5&times;10',
-    '4.5*',
-    '4.5-6',
-    '4.5-ton',
-    '4.5-tonne',
-    '4.5.',
-    '4.5.0',
-    '4.5.1.1',
     '4.5.2.1',
-    '4.5.2.2',
-    '4.5.6',
-    '4.5.7',
-    '4.5.8',
-    '4.5.84',
-    '4.500',
-    '4.510/l',
-    '4.51p',
-    '4.54',
-    '4.56',
-    '4.56%',
-    '4.57.4',
-    '4.57p',
-    '4.59%',
-    '4.5:1',
     '4.5c',
-    '4.5cu',
-    '4.5d',
-    '4.5jy',
-    '4.5k',
-    '4.5kg/10lb',
-    '4.5km/24mls',
-    '4.5kw',
-    '4.5million',
-    '4.6&aring',
-    '4.6&ndash;14%',
-    '4.6&ndash;8.7',
-    '4.6.5',
-    '4.6.6',
-    '4.6.91',
-    '4.60',
     '4.64&times;10/l',
-    '4.65&ndash;6.7',
-    '4.65p',
-    '4.669',
-    '4.6875',
-    '4.68pc',
-    '4.69x10',
-    '4.6a',
-    '4.6b',
-    '4.6c',
-    '4.6p',
-    '4.7&ndash;42',
-    '4.7-litre',
-    '4.7.4',
-    '4.7.58',
-    '4.7.8',
     '4.71%',
-    '4.71&ndash;2.10',
-    '4.73',
-    '4.74&ndash;2.15&ndash;2.67',
-    '4.74&ndash;2.74',
-    '4.740',
-    '4.75%',
-    '4.75bn',
-    '4.75p',
-    '4.76p',
-    '4.77mhz',
-    '4.77p',
-    '4.78',
-    '4.78&ndash;97.',
-    '4.79p',
-    '4.7bn',
     '4.7in',
-    '4.7kg',
-    '4.7km',
-    '4.7litre',
-    '4.7mb',
-    '4.8&aring',
-    '4.8&ins',
-    '4.8&ndash;10.8&times;10/l',
-    '4.8&ndash;4.10',
-    '4.8&ndash;4.12',
-    '4.8(a)',
-    '4.8(b)',
-    '4.8(c)',
-    '4.8(d)',
-    '4.8(e)',
-    '4.8-5.2',
     '4.8-6.1m',
-    '4.8-km',
-    '4.8.0',
-    '4.8/min',
-    '4.80',
-    '4.82',
-    '4.82&ndash;10.56',
-    '4.8284',
-    '4.82m',
-    '4.82p',
-    '4.83&mgr;m',
-    '4.844',
-    '4.85',
-    '4.86&ndash;2.67',
-    '4.86.379',
-    '4.88m',
     '4.8pc',
-    '4.9.',
-    '4.9.4',
-    '4.9.5',
-    '4.9.6',
-    '4.9.7',
-    '4.91',
-    '4.95',
-    '4.95.1',
-    '4.95.19&mdash;22',
-    '4.9595',
-    '4.96',
-    '4.96&ndash;1',
-    '4.96&ndash;2.15',
-    '4.96.46&mdash;7',
-    '4.97p',
     '4.98',
-    '4.98%',
-    '4.996',
-    '4.997',
-    '4.998',
-    '4.9987',
-    '4.999',
-    '4.9b',
-    '4.9f',
-    '4.9oz/140g',
-    '4.9p',
-    '4.9seconds',
-    '4.x.',
-    '4/-',
-    '4/1',
-    '4/1+',
     '4/10',
-    '4/10/76',
-    '4/11/18/25th',
-    '4/12/86',
-    '4/127',
-    '4/129',
-    '4/14:18',
-    '4/15',
-    '4/16',
-    '4/16mbps',
-    '4/176',
-    '4/18',
-    '4/180&deg;c/350&deg;f',
-    '4/181',
-    '4/183',
-    '4/188',
     '4/1992',
-    '4/2/87',
-    '4/2/89',
-    '4/208',
-    '4/25',
-    '4/25c',
-    '4/26',
-    '4/287',
-    '4/3/3',
-    '4/31',
-    '4/334/8',
-    '4/33s',
-    '4/36',
-    '4/4&frac12',
-    '4/4&frac12;d.',
-    '4/4/87',
     '4/40',
-    '4/48',
-    '4/485',
-    '4/5&ndash;11',
-    '4/506',
-    '4/50d',
-    '4/579',
-    '4/58',
-    '4/582',
-    '4/5in',
-    '4/66',
-    '4/66d',
-    '4/6w',
-    '4/7',
-    '4/7/86',
-    '4/79',
     '4/83',
-    '4/85',
-    '4/cx',
-    '4/dry',
-    '4/kg',
-    '4/northcote',
-    '4/now',
-    '4/st.g',
-    '4/tim',
-    '4/vdc',
-    '40%-50%',
-    '40%-a',
-    '40%-ish',
-    '40&deg;60',
-    '40&deg;c-1min',
-    '40&dollar',
     '40&ft;x25&ft',
-    '40&mdash;2',
-    '40&mdash;41',
-    '40&mdash;45p',
-    '40&mdash;50km',
-    '40&mdash;60',
-    '40&mgr;g',
-    '40&mgr;g&mgr;l',
-    '40&mgr;l',
-    '40&mgr;v',
-    '40&micro;m',
-    '40&middot;8',
-    '40&ndash;0',
-    '40&ndash;105',
-    '40&ndash;120',
-    '40&ndash;1310',
     '40&ndash;150',
-    '40&ndash;170',
-    '40&ndash;249',
-    '40&ndash;2857',
-    '40&ndash;48',
-    '40&ndash;48%',
-    '40&ndash;49',
-    '40&ndash;50,000.',
-    '40&ndash;50ppm',
-    '40&ndash;56',
-    '40&ndash;60&deg;ckm',
-    '40&ndash;60,000',
-    '40&ndash;65',
-    '40&ndash;75',
-    '40&ndash;8&ndash;0',
-    '40&ndash;80myr',
     '40&ndash;9',
-    '40&ndash;90',
-    '40&rehy;year',
-    '40\'',
-    '40\'s-look',
-    '40\'w',
-    '40(14%)',
-    '40(4)',
-    '40+3',
-    '40,00',
-    '40,000&ndash;60,000',
-    '40,000,000-strong',
-    '40,000,000ecu',
-    '40,000-50,000',
-    '40,000-capacity',
-    '40,000-plus',
     '40,000sq',
-    '40,002',
-    '40,055',
-    '40,178',
-    '40,187',
-    '40,194',
-    '40,231',
-    '40,300',
-    '40,400',
-    '40,41',
-    '40,451,732',
-    '40,50,60,90,120',
-    '40,558',
-    '40,591',
-    '40,598',
-    '40,600',
     '40,674',
-    '40,700',
-    '40,752',
-    '40,808',
-    '40,860,000',
-    '40,900',
-    '40,931',
-    '40,942',
-    '40,960',
-    '40-15',
-    '40-16',
-    '40-24',
-    '40-24-36',
-    '40-38',
-    '40-38-44ins',
-    '40-50%',
     '40-50,000',
-    '40-50,000,000',
-    '40-80',
-    '40-a-day',
-    '40-and',
-    '40-bed',
-    '40-bedroom',
-    '40-c',
-    '40-cent',
-    '40-cm',
-    '40-cow',
-    '40-day-old',
-    '40-feet',
-    '40-foot-high',
-    '40-footer',
-    '40-goal',
     '40-inch',
-    '40-kd',
-    '40-kg',
-    '40-km',
-    '40-km/25-ml',
-    '40-lamp',
-    '40-length',
-    '40-limit',
-    '40-love',
-    '40-man',
-    '40-metre-high',
-    '40-milligram',
-    '40-million-dollar',
-    '40-million-year-old',
-    '40-min',
-    '40-mton',
     '40-night',
-    '40-ounce',
-    '40-over',
-    '40-per-cent',
-    '40-place',
-    '40-pleat',
-    '40-plusers',
-    '40-seat',
-    '40-serum',
-    '40-square',
-    '40-to-44',
-    '40-track',
-    '40-week',
-    '40-word',
-    '40-yarder',
-    '40-years-old',
     '40.00',
-    '40.000',
-    '40.01sec',
-    '40.05',
-    '40.07',
-    '40.0x10',
-    '40.1&ndash;11&ndash;90&ndash;4',
-    '40.11',
-    '40.14',
-    '40.17',
-    '40.1p',
-    '40.21',
-    '40.24',
-    '40.28',
-    '40.29',
-    '40.2p',
     '40.3.3',
-    '40.30m.',
-    '40.31',
-    '40.34&ndash;8',
-    '40.34m.',
-    '40.36',
-    '40.458',
-    '40.46',
-    '40.47',
-    '40.5.56',
-    '40.51',
-    '40.52',
-    '40.55',
-    '40.56',
-    '40.6&deg;c.',
-    '40.6&times;30.5',
     '40.6&times;30.5cm',
-    '40.6304',
-    '40.632s',
-    '40.68',
-    '40.6cm',
-    '40.74',
-    '40.82',
-    '40.90sec',
-    '40/115',
-    '40/115(35%)',
-    '40/60',
-    '40/792',
-    '40/97',
-    '400&deg',
-    '400&ft',
-    '400&mdash;2',
     '400&micro;l',
-    '400&ndash;24',
-    '400&ndash;350',
-    '400&ndash;425',
-    '400&ndash;450g',
-    '400&ndash;450kg',
-    '400&ndash;475kg',
-    '400&ndash;499',
-    '400&ndash;500,000',
-    '400&ndash;500k',
-    '400&ndash;600',
-    '400&ndash;600m',
-    '400&ndash;900',
-    '400&ndash;99gm',
-    '400&ndash;year',
-    '400,000&ndash;500,000',
     '400,000,000-an',
-    '400,000-odd',
-    '400,000-strong',
-    '400,00018-year-old',
-    '400,000ft',
-    '400,600,800,1000',
-    '400-&mgr;gal',
-    '400-450',
-    '400-600',
-    '400-600-megawatt',
-    '400-bed',
-    '400-bedroom',
-    '400-element',
-    '400-lap',
-    '400-mesh',
-    '400-million-year-old',
     '400-pupil',
-    '400-series',
-    '400-square',
-    '400-square-yard',
-    '400-word',
-    '400-yard',
-    '400.80',
-    '400/43',
-    '400/8',
-    '400/s',
-    '400/xe',
-    '4000&ft',
-    '4000&ndash;1500',
-    '4000&ndash;200',
-    '4000&ndash;4500',
-    '4000&ndash;60',
     '4000&ndash;6000',
-    '4000-',
-    '4000-compatible',
-    '4000/200s',
-    '4000000',
-    '4000bc',
-    '4000bhp',
-    '4000bp',
-    '4000ers',
-    '4000hz',
-    '4000km',
-    '4000lb',
-    '4000s',
-    '4000sq',
-    '40010',
-    '400100',
     '40012',
-    '40027',
-    '4003',
-    '4003/s',
-    '40034',
-    '40035',
-    '400417',
-    '400478',
-    '400651',
-    '4008',
-    '40092',
-    '40098',
-    '400a',
-    '400bc',
-    '400bhp',
-    '400bp',
     '400cu',
-    '400ers',
-    '400f',
-    '400g/14',
-    '400g/14ox',
-    '400gflop',
-    '400gflops.',
-    '400gt',
-    '400k+',
-    '400kb',
-    '400kcals',
-    '400khz',
-    '400kj',
-    '400km/',
-    '400kwh',
-    '400m-bytes-per-second',
     '400m-ecu',
-    '400mbytes',
-    '400metres',
-    '400mg',
-    '400million',
-    '400ml/14',
-    '400mm.',
-    '400ppm',
-    '400rb',
-    '400x400',
-    '401&ndash;2',
-    '401&ndash;540',
-    '401,000',
-    '40110',
-    '40118',
-    '401222',
     '40124',
-    '4013\'s',
-    '401525',
-    '40170',
-    '401760',
-    '401830',
-    '4019e',
-    '401pp.',
-    '402-476ad',
-    '402/404',
-    '4021a',
-    '40220',
-    '4023099',
-    '4024',
-    '4025',
-    '402509',
     '4027',
-    '4027174',
-    '402m',
-    '403%',
-    '403&ndash;404',
-    '403.1',
-    '403.1mph',
-    '403/0522',
-    '403/0523',
-    '4030',
-    '4032',
-    '40320',
-    '4032601209',
-    '40340',
-    '40355',
-    '40360',
     '4038',
-    '404&ndash;3',
-    '40436/40060',
-    '404387',
-    '4044',
-    '40442',
-    '40464',
-    '4046b',
-    '4047',
-    '4048',
-    '404:253',
-    '404p',
-    '404s',
-    '405&mdash;12',
-    '405&ndash;7',
-    '405,500',
     '405-yard',
-    '405.5',
-    '4052',
-    '4052h',
-    '4057&mdash;66',
-    '4059',
-    '405kg',
-    '405p',
-    '405sri',
-    '405th',
-    '406&mdash;8',
-    '406&ndash;407',
-    '406&ndash;411',
-    '406&ndash;7',
-    '406,000',
-    '406,211',
     '406.41',
-    '406.65',
-    '4060',
-    '40639',
-    '4064/89/eec',
-    '40646',
-    '4064mm',
-    '4066',
-    '40660',
-    '406f',
-    '406mm',
-    '406p',
-    '407,222',
-    '407,900',
-    '407,900,000',
-    '407-423',
     '407-yard',
-    '407139',
-    '4072',
-    '40747',
-    '40757',
-    '40759',
-    '40770',
-    '407a',
-    '408&ndash;12',
-    '408&ndash;9',
-    '408,000',
-    '408,200',
-    '408.',
-    '408.25',
-    '4082',
-    '40820',
     '4083',
-    '4085',
-    '4087/88',
-    '40872',
-    '408b',
-    '408bhp',
-    '408bn',
-    '408bph',
-    '408g.',
-    '408k',
-    '409&ndash;15',
-    '409&ndash;24',
-    '409,660',
-    '4090',
-    '40908',
-    '4091',
     '40910,44',
-    '40927',
-    '4093',
-    '4094',
-    '4096-bit',
-    '409640-bit',
-    '40970',
-    '409p',
-    '409pp',
-    '40:100',
-    '40:16ff.',
-    '40:28',
-    '40:34',
-    '40:34&ndash;38',
-    '40:35',
-    '40:36',
     '40:40:20',
-    '40:6&ndash;8',
-    '40:60',
-    '40:7',
-    '40a.',
-    '40a/h',
-    '40bn',
-    '40cms',
-    '40cu',
-    '40d.',
-    '40date',
-    '40e',
-    '40ghz',
-    '40gph',
-    '40ha',
-    '40hour',
     '40hz',
-    '40ish',
-    '40kb',
-    '40kbps',
-    '40khz',
-    '40kw',
-    '40kwh',
-    '40m&sup2',
-    '40m3',
-    '40mg',
-    '40ml/1&frac12;fl',
-    '40mpg',
-    '40ms',
-    '40o',
-    '40p.p.t.v.',
-    '40pc-plus',
     '40per',
-    '40pf',
-    '40s-style',
-    '40s/50s/60s',
-    '40sq.',
-    '40v',
-    '40x',
-    '40x22&ins',
-    '40x27.9',
-    '40x30.5',
-    '40x36&ins',
-    '40yards',
-    '41&deg',
-    '41&deg;f',
-    '41&deg;s',
-    '41&frac12',
     '41&mdash;46',
-    '41&ndash;13251',
-    '41&ndash;14',
-    '41&ndash;16',
-    '41&ndash;19511',
-    '41&ndash;33',
-    '41&ndash;4',
-    '41&ndash;45',
-    '41&ndash;45f',
-    '41&ndash;46',
-    '41&ndash;47',
-    '41&ndash;5',
-    '41&ndash;50',
-    '41&ndash;51',
-    '41&ndash;52',
-    '41&ndash;54',
     '41&ndash;55',
-    '41&ndash;67',
-    '41&ndash;9',
-    '41(16%)',
-    '41(4)',
-    '41(5)',
-    '41+16',
-    '41,200',
-    '41,200,000',
-    '41,247',
-    '41,250',
-    '41,27',
-    '41,299',
-    '41,300',
-    '41,400',
-    '41,401',
     '41,42',
-    '41,42,43,44,45',
-    '41,440',
-    '41,484',
-    '41,670',
-    '41,700',
-    '41,700,000',
-    '41,800',
-    '41,900',
-    '41-17',
-    '41-39-extra',
-    '41-42',
-    '41-44',
-    '41-a-rob',
-    '41-n',
-    '41-nation',
     '41-page',
-    '41-point',
-    '41-ship',
-    '41-strong',
-    '41-unit',
-    '41.0&ndash;89.4',
-    '41.1',
-    '41.1&deg;c',
-    '41.1&ndash;64.4',
-    '41.13',
-    '41.17',
-    '41.2&ndash;64.0',
-    '41.20',
-    '41.25%',
-    '41.256',
-    '41.27',
     '41.3',
-    '41.3&ndash;65.0',
-    '41.3.2',
-    '41.312a.',
-    '41.33',
-    '41.38',
-    '41.3kg',
-    '41.3m',
-    '41.472',
-    '41.48',
-    '41.5&ndash;87',
-    '41.52',
-    '41.58',
-    '41.60',
-    '41.61',
-    '41.63',
     '41.715.1gm',
-    '41.77',
-    '41.8bn',
-    '41.8kg',
-    '41.8m',
-    '41.8secs',
-    '41.90',
-    '41.99',
-    '41.9p',
-    '41/1',
-    '41/2',
-    '41/2&ndash;6',
-    '41/24',
-    '41/24&ndash;3',
-    '41/435',
-    '41/95',
     '410&deg;f.',
-    '410&ndash;490',
-    '410&times;10/l',
-    '410,713',
-    '410,928',
-    '410-yard',
-    '410.2m',
-    '41000',
-    '410000',
-    '410044',
-    '4101',
-    '4102',
-    '41033',
-    '410406',
-    '410414',
-    '4105',
     '4106',
-    '41060',
-    '41080',
-    '410g',
-    '410x533',
-    '411,000',
-    '411,378',
-    '411,516',
-    '411,900',
-    '411000',
-    '4111',
-    '4112',
-    '41130',
-    '411500',
-    '411506',
-    '4117',
     '4117m',
-    '4119',
-    '411bp',
-    '411ff',
-    '411m',
-    '412&ndash;413',
-    '412,579',
-    '412.40',
-    '412.9%',
-    '412000',
-    '41222',
-    '4124',
-    '412551',
-    '4128',
-    '412831',
-    '4129',
     '412e',
-    '412p',
-    '413&mdash;9000',
-    '413&ndash;14',
-    '413&ndash;16',
-    '413&ndash;27',
-    '413&ndash;399',
-    '413,337',
-    '413.5',
-    '413/2',
-    '4132',
-    '413344',
-    '413366',
-    '4134',
-    '413416',
-    '4135',
     '41370',
-    '413869',
-    '414&ndash;16',
-    '414&ndash;19',
-    '414&ndash;810',
-    '414,000,000',
-    '414,825',
-    '414-yard',
-    '414.3',
-    '41410',
-    '414191',
-    '4142m',
-    '41450',
-    '41470',
-    '4149',
-    '414b&ndash;c',
     '4152',
-    '415424',
-    '4156&mdash;7',
-    '41586',
-    '415c',
-    '415d',
-    '415e&ndash;f',
-    '415iops',
-    '415kg',
-    '416&ndash;0',
-    '416&ndash;57',
-    '416,300',
-    '416,882',
-    '416.',
-    '416.3',
-    '416.7%',
     '416/l',
-    '4162',
-    '4163',
-    '41630',
-    '4165&ndash;4864',
-    '41660',
-    '4167m',
-    '4168',
-    '416880',
-    '416a&ndash;b',
-    '416th',
-    '417&ndash;19',
-    '417&ndash;36',
-    '417,000',
-    '417,300',
-    '417,314',
     '417-20',
-    '41708',
-    '4171',
-    '4174',
-    '4174/4175/4182',
-    '417417',
-    '417777',
-    '4178',
-    '41790',
-    '417b',
-    '417p',
-    '418&ndash;22',
-    '418&ndash;417',
-    '418,000',
-    '418,403',
-    '418.',
     '418/85',
-    '4181',
-    '4182',
-    '4183',
-    '418739',
-    '418875',
-    '418888',
-    '418a&ndash;c',
-    '418kg',
-    '418metres',
-    '418r',
-    '419&ndash;21',
-    '419.2&ndash;543.1',
-    '41920',
-    '419842',
-    '4199&mdash;209',
     '41992',
-    '419p.',
-    '41:10',
-    '41:14',
-    '41:19',
-    '41:38',
-    '41:56&ndash;57',
-    '41_per',
-    '41a.',
-    '41cm',
-    '41f',
-    '41f-45',
-    '41h',
-    '41h8004855',
-    '41h8009579',
-    '41ins',
     '41k',
-    '41km',
-    '41lb',
-    '41m',
-    '41mhz',
-    '41pts',
-    '41q7003657',
-    '42&amp&frac12',
-    '42&ft',
-    '42&mdash;4',
-    '42&mdash;92',
-    '42&ndash;10',
-    '42&ndash;106918',
-    '42&ndash;10877',
-    '42&ndash;108773',
-    '42&ndash;120',
     '42&ndash;12417',
-    '42&ndash;17',
-    '42&ndash;22614',
-    '42&ndash;29643',
-    '42&ndash;31983',
-    '42&ndash;41',
-    '42&ndash;45',
-    '42&ndash;46',
-    '42&ndash;47',
-    '42&ndash;5',
-    '42&ndash;53',
-    '42&ndash;60817',
-    '42&ndash;68864/nx163rp',
-    '42&ndash;69654',
-    '42&ndash;73',
-    '42&ndash;8',
     '42&ndash;88',
-    '42&ndash;9',
-    '42&ndash;90',
-    '42&ndash;92320',
-    '42&rehy;year-old',
-    '42\'00',
-    '42\'s',
-    '42(3)',
-    '42+36+41+45',
-    '42,000-ton',
-    '42,028',
-    '42,200',
-    '42,43',
-    '42,506',
-    '42,520',
-    '42,550,000',
     '42,633',
-    '42,695',
-    '42,703,019',
-    '42,820',
-    '42-15',
-    '42-16',
-    '42-44',
-    '42-46',
-    '42-7',
-    '42-arch',
-    '42-clause',
-    '42-count',
-    '42-country',
-    '42-foot',
-    '42-gallon',
-    '42-man',
     '42-match',
-    '42-member',
-    '42-over-a-side',
-    '42-strong',
-    '42-ton',
-    '42-yard',
-    '42.0&ndash;80.0',
-    '42.02',
-    '42.0639',
-    '42.07',
-    '42.08',
-    '42.12%',
-    '42.13',
-    '42.1679',
-    '42.195',
-    '42.2%',
     '42.28',
-    '42.2pc',
-    '42.33',
-    '42.34',
-    '42.37',
-    '42.3bn',
-    '42.4%',
-    '42.44',
-    '42.4582',
-    '42.48',
-    '42.50',
-    '42.53',
-    '42.55',
-    '42.5m',
-    '42.5pc',
-    '42.6%',
     '42.62',
-    '42.67mm',
-    '42.7&ndash;56.9',
-    '42.75',
-    '42.8mb',
-    '42.91',
-    '42/',
-    '42/02',
-    '42/1000',
-    '42/1992',
-    '42/215',
-    '42/63',
-    '42/84',
-    '420&ndash;390',
-    '420&ndash;440',
-    '420&ndash;589',
     '420,000,000',
-    '420,100',
-    '420,127',
-    '420,500',
-    '42000',
-    '42000m',
-    '420066',
-    '420088',
-    '4200b.c.',
-    '4200ft',
-    '4202',
-    '420202',
-    '42050',
-    '420517',
-    '4206',
-    '420650',
     '4207',
-    '4208',
-    '420gsi',
-    '420hp',
-    '420in',
-    '420kg',
-    '420m.',
-    '420m/1,378ft',
-    '420mmx297mm',
-    '420th',
-    '421,000',
-    '421,775',
-    '42100',
-    '42106',
-    '42150',
-    '4216&ndash;010',
     '421752',
-    '421d&ndash;f',
-    '421h',
-    '422,000',
-    '422,500,000',
-    '422.5',
-    '4220',
-    '42210',
-    '42218',
-    '4222',
-    '42224',
-    '422288',
-    '4223',
-    '42230',
-    '4224',
-    '422423',
     '4225',
-    '42260',
-    '422699',
-    '4227/4229',
-    '4228',
-    '42286',
-    '4229',
-    '422a',
-    '422s',
-    '423&ndash;42',
-    '423&ndash;424',
-    '423/1115',
-    '42313',
-    '4232',
-    '4233.4m',
-    '423486',
     '423611',
-    '423740',
-    '423rd',
-    '424&ndash;5',
-    '424,000',
-    '424,124',
-    '424/3',
-    '4242',
-    '424209',
-    '424272',
-    '4244',
-    '42440',
-    '42495',
-    '424pp.',
-    '424th',
-    '425%',
     '425&mdash;9',
-    '425&ndash;1244',
-    '425&ndash;818',
-    '425(1)',
-    '425,000,000',
-    '425-member',
-    '425-minute',
-    '425.8',
-    '4252&ndash;5315',
-    '4253/88',
-    '425501',
-    '42570',
-    '425f/220c/gas',
-    '425p',
-    '426(1)',
-    '426(1)-(3)',
     '426(10)',
-    '426(4)',
-    '426/1326',
-    '426044',
-    '4262.0',
-    '426485',
-    '4267',
-    '42670',
-    '426801',
-    '4269',
-    '427&ndash;31',
-    '427&ndash;347',
-    '427&ndash;41',
-    '427.1',
-    '4271',
-    '4274',
     '42741',
-    '4275181',
-    '4276',
-    '42765',
-    '42765\'s',
-    '427697',
-    '427700',
-    '427830',
-    '4279',
-    '427k',
-    '428&ndash;9',
-    '428,000',
-    '428,712',
-    '428.58',
-    '428370',
-    '4284',
     '42840',
-    '428428',
-    '42890',
-    '42899',
-    '429&ndash;347',
-    '429-2900',
-    '429-3636',
-    '429.937mph',
-    '4291',
-    '4294ft',
-    '42978',
-    '429869',
-    '42990',
-    '429f',
-    '429ft',
-    '429h',
     '429p',
-    '42:13',
-    '42:21&ndash;22',
-    '42:3',
-    '42a',
-    '42a.',
-    '42km/h',
-    '42mb',
-    '42mpg',
-    '42no',
-    '42pts',
-    '42s.',
-    '42sec',
-    '42x',
-    '43&commat;1/2',
-    '43&deg;7\'w',
     '43&deg;n',
-    '43&ins',
-    '43&mdash;47',
-    '43&mdash;7',
-    '43&ndash;1',
-    '43&ndash;103',
-    '43&ndash;115',
-    '43&ndash;11728',
-    '43&ndash;12',
-    '43&ndash;21709',
-    '43&ndash;22197',
-    '43&ndash;25',
-    '43&ndash;29854',
-    '43&ndash;3',
-    '43&ndash;48541',
-    '43&ndash;5',
     '43&ndash;51',
-    '43&ndash;6',
-    '43&ndash;67',
-    '43&ndash;77',
-    '43&ndash;9',
-    '43&plus;1',
-    '43&times;10',
-    '43()23',
-    '43(1a)',
-    '43(4)',
-    '43(a)',
-    '43,000,000',
-    '43,000-strong',
-    '43,075',
-    '43,093',
-    '43,200',
     '43,347,231',
-    '43,533',
-    '43,556',
-    '43,600',
-    '43,601',
-    '43,659',
-    '43,668',
-    '43,697',
-    '43,728,375',
-    '43,747',
-    '43,750',
-    '43,801',
-    '43,911',
-    '43,981',
-    '43,984',
-    '43-0',
     '43-50',
-    '43-day',
-    '43-foot',
-    '43-over-par',
-    '43-point',
-    '43-pupil',
-    '43-square-mile',
-    '43-years-old',
-    '43.0%',
-    '43.03',
-    '43.04',
-    '43.12',
-    '43.13',
-    '43.14s',
-    '43.16',
-    '43.19',
     '43.2\'c',
-    '43.23',
-    '43.26',
-    '43.29%',
-    '43.29sec',
-    '43.2gb',
-    '43.314b.',
-    '43.3in',
-    '43.3mm',
-    '43.4.1',
-    '43.46',
-    '43.4p-a-mile',
-    '43.50',
-    '43.56',
-    '43.57',
-    '43.5cm',
     '43.5p',
-    '43.61',
-    '43.75%',
-    '43.75mm',
-    '43.8m',
-    '43.90',
-    '43.98',
-    '43/120',
-    '43/123',
-    '43/128',
-    '43/177',
-    '43/185',
-    '43/196',
-    '43/212',
-    '43/232',
-    '43/33',
     '43/43',
-    '43/437',
-    '43/53',
-    '43/55',
-    '43/75',
-    '43/76',
-    '43/802',
-    '43/83',
-    '430%',
-    '430&ndash;1',
-    '430&ndash;2640',
-    '430&ndash;40',
-    '430,000,000',
-    '430-member',
-    '430-mhz',
-    '430-tonne',
     '430-yard',
-    '430.',
-    '430.015mph',
-    '430000',
-    '430003',
-    '4300s',
-    '430120kyr',
-    '43017&ndash;0702',
-    '430327',
-    '4304',
-    '43040',
-    '43050',
-    '43060',
-    '4307',
-    '4308',
-    '430808',
     '43086',
-    '4309',
-    '430905',
-    '430bhp',
-    '430d',
-    '430f',
-    '430m',
-    '430mm',
-    '430nm',
-    '430va',
-    '431&mdash;2',
-    '431&ndash',
-    '431&ndash;2',
-    '431&ndash;421',
-    '431,000',
-    '431-strong',
     '4310',
-    '431102',
-    '431155',
-    '43119+43065',
-    '431212',
-    '4314',
-    '4315',
-    '43156',
-    '4316',
-    '43160',
-    '43170',
-    '43193',
-    '431c&ndash;e',
-    '432&ndash;0292',
-    '432&ndash;40',
-    '432,000',
     '432,819',
-    '432034',
-    '43210',
-    '432132',
-    '432464',
-    '4325',
-    '43260',
-    '43270',
-    '432:459',
-    '432g',
-    '432p',
-    '432s',
-    '433&mdash;50',
-    '433&ndash;46',
-    '433&ndash;460',
-    '433,440',
     '433-437',
-    '433/2',
-    '433/me0',
-    '4331',
-    '4333',
-    '4335',
-    '433553',
-    '433978',
-    '433979',
-    '433dx',
-    '433f',
-    '433million',
-    '434&ndash;435',
-    '434&ndash;5',
-    '434&ndash;6',
-    '434(5)',
     '434,798',
-    '434,924',
-    '434.',
-    '434/3',
-    '4340',
-    '434110',
-    '434313',
-    '434370',
-    '43440',
-    '43443',
-    '43460',
-    '434a',
-    '434b',
-    '434c',
-    '434mb',
-    '435&ndash;436',
     '435&ndash;440',
-    '435&ndash;444',
-    '435\'',
-    '435(11)',
-    '435(6)',
-    '435,000',
-    '435-member',
-    '435.',
-    '435/78',
-    '43502',
-    '4350m',
-    '4353',
-    '43530',
-    '4355',
-    '4356',
-    '435765818',
     '4358',
-    '435th',
-    '436,000',
-    '436,973',
-    '436/798',
-    '43606',
-    '436078',
-    '4363',
-    '436335',
-    '4364',
-    '43640',
-    '437%',
-    '437,000',
-    '4370',
-    '43710',
-    '43730',
     '43738',
-    '4378658',
-    '437a&ndash;b',
-    '438&ndash;42',
-    '438&ndash;434',
-    '438,990',
-    '438-point',
-    '438100',
-    '4388',
-    '438a',
-    '439&ndash;41',
-    '439,000',
-    '4391',
-    '43924',
-    '4393',
-    '4394',
     '43945',
-    '4395',
-    '4397',
-    '439831',
-    '43:14',
-    '43:32',
-    '43a.',
-    '43a.314.',
-    '43ad',
-    '43b.314.',
-    '43bc-ad118',
-    '43c',
-    '43gm/sq.',
-    '43kg',
-    '43kg/s/ha',
-    '43km',
     '43kph',
-    '43kw',
-    '43mins',
-    '43pts',
-    '43sec',
-    '43x31&ins',
-    '44&deg',
-    '44&deg&plusmn;5&deg',
-    '44&dollar',
-    '44&frac12',
-    '44&frac12&ins',
-    '44&ft',
-    '44&mdash;5',
-    '44&ndash;001',
-    '44&ndash;100%',
-    '44&ndash;113',
     '44&ndash;20',
-    '44&ndash;22656',
-    '44&ndash;38',
-    '44&ndash;41747',
-    '44&ndash;45&deg;s',
-    '44&ndash;48kg',
-    '44&ndash;67',
-    '44&ndash;70',
-    '44&ndash;71',
-    '44&ndash;73',
-    '44&ndash;8',
-    '44&ndash;84',
-    '44&ndash;9',
-    '44&ndash;94%',
-    '44&rehy;year-old',
-    '44\'',
     '44(2)&mdash',
-    '44(b)',
-    '44,068',
-    '44,080',
-    '44,100',
-    '44,137',
-    '44,142',
-    '44,169',
-    '44,294',
-    '44,342',
-    '44,400,000',
-    '44,444',
-    '44,448',
-    '44,477',
-    '44,600',
-    '44,62',
     '44,642',
-    '44,69',
-    '44,700',
-    '44,969',
-    '44-20',
-    '44-46',
-    '44-foot',
-    '44-gallon',
-    '44-gun',
-    '44-hour',
-    '44-l',
-    '44-match',
-    '44-pin',
-    '44-points',
-    '44-pounder',
-    '44-seater',
     '44-seconds',
-    '44-strong',
-    '44-times',
-    '44-volume',
-    '44.0%',
-    '44.04s',
-    '44.09sec',
-    '44.15',
-    '44.15f',
-    '44.15p',
-    '44.28',
-    '44.3%',
-    '44.316a.',
-    '44.34',
-    '44.3m',
-    '44.416.6gm',
     '44.49%',
-    '44.6m',
-    '44.8',
-    '44.95',
-    '44/105',
-    '44/106',
-    '44/112',
-    '44/115',
-    '44/116',
-    '44/117',
-    '44/119',
-    '44/140',
-    '44/141',
-    '44/193',
-    '44/195',
-    '44/202',
     '44/21',
-    '44/217',
-    '44/21a',
-    '44/22',
-    '44/224',
-    '44/226',
-    '44/228',
-    '44/236',
-    '44/240',
-    '44/29',
-    '44/302',
-    '44/306',
-    '44/308',
-    '44/309',
-    '44/312',
-    '44/39',
     '44/39/92',
-    '44/406',
-    '44/410',
-    '44/42',
-    '44/44',
-    '44/45',
-    '44/47',
-    '44/81',
-    '44/88',
-    '440&deg;f.',
-    '440&mgr;m',
-    '440&ndash;5',
-    '440&ndash;570',
-    '440&ndash;80',
-    '440\'s',
-    '440-acre',
     '440-day',
-    '440-m4',
-    '440-page',
-    '440/39',
-    '440/625',
-    '4400&ndash;450',
-    '440000',
-    '44000t',
-    '4400gns',
-    '4400rpm',
-    '4400s',
-    '4402',
-    '4405',
-    '440552',
-    '4406',
-    '440964',
     '440971',
-    '440g',
-    '440ha',
-    '440kg',
-    '440lb',
-    '440nm',
-    '440y',
-    '441&ndash;11',
-    '441(2)',
-    '441,515',
-    '441/457',
-    '441122',
-    '441200',
-    '4414',
-    '4416',
-    '44165,44',
     '4418',
-    '441cm',
-    '442&ndash;4',
-    '442&ndash;438',
-    '442.8m',
-    '442000',
-    '4421',
-    '4429',
-    '443&ndash;1',
-    '443,000',
-    '443-4',
-    '443-kilometre',
-    '443-yard',
-    '443.',
-    '44313',
-    '4435',
     '444&ndash;1',
-    '444,825',
-    '444.73',
-    '444/553030',
-    '444059',
-    '4441',
-    '444136',
-    '44416.0',
-    '44420',
-    '444242',
-    '444298',
-    '444308',
-    '444408',
-    '444477',
-    '444516',
-    '44455',
     '444818',
-    '444g&ndash;h',
-    '444lbs',
-    '444p',
-    '445&ndash;61',
-    '445&ndash;7',
-    '445-person',
-    '445.',
-    '445/4',
-    '445326',
-    '4454',
-    '445555',
-    '4456',
-    '445657',
-    '44577',
-    '4458',
     '445922',
-    '445e',
-    '445ha',
-    '445kcals',
-    '445mm',
-    '445th',
-    '446&ndash;4666',
-    '446&ndash;9',
-    '4460',
-    '446034',
-    '446328',
-    '446557',
-    '446d',
-    '446e&ndash;g',
-    '446e.',
-    '447&ndash;5',
     '447,352',
-    '447,933',
-    '447-pin',
-    '447.6',
-    '44700',
-    '4472\'s',
-    '44760',
-    '44779',
-    '447kg',
-    '447m',
-    '448&ndash;451',
-    '448&ndash;50',
-    '448&ndash;9',
-    '448,000',
-    '448,500',
-    '448,922',
     '448148',
-    '4482',
-    '44829',
-    '44850',
-    '4488',
-    '44880',
-    '449&ndash;50',
-    '449&ndash;52',
-    '449&ndash;6600',
-    '449,350',
-    '449,964',
-    '449.5%',
-    '4490',
-    '44900',
-    '449066',
-    '44913',
     '4494052',
-    '449733',
-    '44981',
-    '4499',
-    '44990',
-    '44:0.8',
-    '44:13',
-    '44:2',
-    '44:8',
-    '44c',
-    '44dec8009.111.8',
-    '44e',
-    '44ff',
-    '44gb',
-    '44ha',
-    '44km',
     '44m&dollar;p&dollar;g',
-    '44mm-thick',
-    '44p/4',
-    '44th-minute',
-    '45&amp;degree',
-    '45&amp;shilling',
-    '45&deg;c/ambient',
-    '45&deg;f',
-    '45&deg;n',
-    '45&ft;8&ins',
-    '45&mdash;55p',
-    '45&mdash;6',
-    '45&mdash;64',
-    '45&ndash;0',
-    '45&ndash;05688',
-    '45&ndash;1',
     '45&ndash;105s',
-    '45&ndash;109kg',
-    '45&ndash;12&ndash;118&ndash;4',
-    '45&ndash;16',
-    '45&ndash;26',
-    '45&ndash;30',
-    '45&ndash;46',
-    '45&ndash;48',
-    '45&ndash;49',
-    '45&ndash;50ft',
-    '45&ndash;51',
-    '45&ndash;54-year',
-    '45&ndash;57300',
-    '45&ndash;60cm',
-    '45&ndash;60ml',
-    '45&ndash;69',
     '45&ndash;70',
-    '45&ndash;74',
-    '45&ndash;9',
-    '45&ndash;92',
-    '45&rehy;year',
-    '45&shilling',
-    '45&sol;54',
-    '45&times;55cm&times;40mm',
-    '45\'n',
-    '45\'s',
-    '45(c)',
-    '45,00',
-    '45,000-member',
-    '45,000-seater',
-    '45,000-strong',
-    '45,1()0',
     '45,100',
-    '45,106',
-    '45,159',
-    '45,169',
-    '45,268',
-    '45,286',
-    '45,300',
-    '45,350,000',
-    '45,361',
-    '45,400',
-    '45,552,041',
-    '45,625',
-    '45,680',
-    '45,759',
-    '45,762',
-    '45,840',
     '45-0',
-    '45-1',
-    '45-10',
-    '45-47',
-    '45-50',
-    '45-54',
-    '45-55',
-    '45-60',
-    '45-7',
-    '45-acre',
-    '45-akce',
-    '45-bit',
-    '45-cm',
-    '45-gallon',
-    '45-kg',
-    '45-metre-deep',
     '45-piece',
-    '45-pop-804',
-    '45-run',
-    '45-truck',
-    '45-vote',
-    '45.02',
-    '45.03p',
-    '45.1&ndash;124.6',
-    '45.16',
-    '45.26secs',
-    '45.2mpg',
-    '45.3,45.2',
-    '45.3p',
-    '45.4&ndash;11',
-    '45.44',
-    '45.56',
     '45.56.',
-    '45.60sec',
-    '45.65',
-    '45.720',
-    '45.75',
-    '45.77',
-    '45.7m',
-    '45.8.8',
-    '45.85',
-    '45.87',
-    '45.91',
-    '45.95',
-    '45/12',
-    '45/139',
-    '45/146',
-    '45/149',
     '45/15',
-    '45/154',
-    '45/156',
-    '45/157',
-    '45/159',
-    '45/160',
-    '45/161',
-    '45/170',
-    '45/172',
-    '45/174',
-    '45/178',
-    '45/179',
-    '45/193',
-    '45/198',
-    '45/21',
-    '45/211',
     '45/212',
-    '45/214',
-    '45/223',
-    '45/224',
-    '45/226',
-    '45/227',
-    '45/228',
-    '45/229',
-    '45/230',
-    '45/231',
-    '45/232',
-    '45/233',
-    '45/236',
-    '45/255',
-    '45/3',
-    '45/306',
     '45/307',
-    '45/308',
-    '45/311',
-    '45/319',
-    '45/45',
-    '45/49',
-    '45/51',
-    '45/53',
-    '45/54',
-    '45/57',
-    '45/58',
-    '45/6',
-    '45/62',
-    '45/63',
-    '45/68',
-    '45/69',
     '45/7',
-    '45/74',
-    '45/79',
-    '45/94',
-    '45/9771',
-    '450%',
-    '450&deg',
-    '450&dollar;c',
-    '450&ndash;1',
-    '450&ndash;2440',
-    '450&ndash;675g',
-    '450&ndash;720',
-    '450&ndash;900g/1&ndash;2lb',
-    '450\'s',
-    '450,000,000',
-    '450,000sq',
     '450,630',
-    '450-acre',
-    '450-bp',
-    '450-kg',
-    '450-megawatt',
-    '450-metres',
-    '450-mile',
-    '450-mile-long',
-    '450-strong',
-    '450-volt',
-    '450-yards',
-    '450-year',
-    '450.835mph',
-    '450/40',
-    '4500-person',
-    '45005',
     '4500hz',
-    '4500km',
-    '4500m',
-    '4501',
-    '450123',
-    '4502',
-    '4505',
-    '45060',
-    '45070',
-    '450780',
-    '450841',
-    '4509',
-    '450f/230c/gas',
-    '450ft',
-    '450g/1-lb',
-    '450g/1lb/2',
     '450km',
-    '450mg',
-    '450ml/&frac14',
-    '450p',
-    '450pc',
-    '450pp.',
-    '450ppm',
-    '450sq',
-    '451&ndash;3',
-    '451&ndash;6',
-    '451&ndash;8801',
-    '4510',
-    '45104',
-    '45106',
-    '45123',
-    '4513',
     '45156',
-    '451781',
-    '4518',
-    '451958',
-    '451m',
-    '452&ndash;3',
-    '452.1m',
-    '452/l',
-    '4520',
-    '452022',
-    '452071',
-    '4522',
-    '45222&ndash;1800',
-    '452373',
-    '452481',
-    '4525',
     '45253',
-    '45260',
-    '452692',
-    '45283',
-    '4529',
-    '452mph',
-    '452nd',
-    '453&ndash;455',
-    '453&ndash;5',
-    '453-member',
-    '453.00',
-    '453/2',
-    '4530',
-    '45339',
-    '4534',
-    '4535',
     '453534',
-    '45370',
-    '453p',
-    '454&ndash;63',
-    '454,000',
-    '454,000kg/',
-    '454,900',
-    '454-1',
-    '454-471',
-    '454-member',
-    '454.53',
-    '4540',
-    '4541',
-    '45410',
-    '45411',
-    '4542',
     '4544',
-    '454444',
-    '454522',
-    '4547665',
-    '45491',
-    '455&ndash;74',
-    '455,500',
-    '455,633',
-    '455-8281',
-    '455-yard',
-    '455.5',
-    '455/704',
-    '45530',
-    '45550',
-    '455505',
-    '455725',
     '455732',
-    '455777',
-    '455bhp',
-    '455kg',
-    '456&ndash;457',
-    '456,000',
-    '456.7',
-    '456.789',
-    '4560/xe',
-    '4561',
-    '45620',
-    '456220',
-    '45650',
-    '4569',
-    '456b',
-    '456mw',
     '457&mdash;74',
-    '457&ndash;458',
-    '4570',
-    '4571',
-    '45716',
-    '45730',
-    '45752',
-    '45753',
-    '45754',
-    '45755',
-    '45756',
-    '45757',
-    '45758',
-    '45759',
-    '45760',
-    '45761',
     '45762',
-    '457m',
-    '457mm',
-    '457mw',
-    '457th',
-    '458&ndash;60',
-    '458,300',
-    '458,730',
-    '458,818',
-    '458/l',
-    '458065',
-    '458496',
-    '458497',
-    '4585m',
-    '4587',
-    '458742',
     '4588',
-    '458p',
-    '459(g)',
-    '459,621',
-    '459351',
-    '4594',
-    '459461',
-    '459707',
-    '4598300',
-    '459a&ndash;d',
-    '459nm',
-    '45:1',
-    '45:10',
-    '45:18',
-    '45:4',
-    '45:5ff',
     '45amp',
-    '45bc',
-    '45bhp',
-    '45cm-high',
-    '45cm/',
-    '45cms',
-    '45d',
-    '45gal',
-    '45in',
-    '45kd',
-    '45kph',
-    '45kv',
-    '45mgp',
-    '45no',
-    '45p&ndash;49p',
-    '45p/minute',
     '45p/per',
-    '45pp',
-    '45ppm',
-    '45th-minute',
-    '46%-owned',
-    '46&deg',
-    '46&frac12;p',
-    '46&ins',
-    '46&mdash;48',
-    '46&mdash;7',
-    '46&ndash;0',
-    '46&ndash;101',
-    '46&ndash;120',
-    '46&ndash;14',
-    '46&ndash;2005',
-    '46&ndash;48',
     '46&ndash;50kg',
-    '46&ndash;52',
-    '46&ndash;56',
-    '46&ndash;56cm',
-    '46&ndash;56cm/18&ndash;22',
-    '46&ndash;65',
-    '46&ndash;69',
-    '46&ndash;8',
-    '46&ndash;8&ndash;0',
-    '46&ndash;9',
-    '46&percnt',
-    '46(1)',
-    '46(3)',
-    '46(4)',
-    '46(7)',
-    '46+2',
     '46,003',
-    '46,052',
-    '46,071',
-    '46,114',
-    '46,144,000',
-    '46,182',
-    '46,256',
-    '46,269',
-    '46,300',
-    '46,498',
-    '46,500,000',
-    '46,528',
-    '46,545',
-    '46,652',
-    '46,700',
-    '46,800',
     '46,800,000',
-    '46,935',
-    '46,976',
-    '46-',
-    '46-12',
-    '46-13',
-    '46-18',
-    '46-37',
-    '46-acre',
-    '46-minute',
-    '46-six-year',
-    '46-times',
-    '46.07',
-    '46.1',
-    '46.139r.',
-    '46.15',
     '46.15%',
-    '46.1m',
-    '46.2%',
-    '46.3%',
-    '46.319a.',
-    '46.35268km',
-    '46.36pc',
-    '46.3mpg',
-    '46.43',
-    '46.45.',
-    '46.46secs',
-    '46.55secs',
-    '46.5m',
-    '46.5pc',
-    '46.75',
-    '46.78',
     '46.875',
-    '46.99',
-    '46/010',
-    '46/018',
-    '46/053',
-    '46/077',
-    '46/115',
-    '46/47',
-    '460&formula',
-    '460&ndash',
-    '460&ndash;3100',
-    '460&ndash;370',
-    '460&ndash;700',
-    '460,884',
-    '460-km',
-    '460-metre',
     '460.',
-    '460.60',
-    '460.75',
-    '460055',
-    '46009',
-    '4600rpm',
-    '4600s',
-    '4602',
-    '460300',
-    '460339',
-    '4606',
-    '46060',
-    '460666',
-    '46080',
-    '4609',
-    '460ft',
     '460g',
-    '460g&ndash;h',
-    '460k',
-    '460km',
-    '460kms',
-    '460m',
-    '461&mdash;5',
-    '461,100',
-    '461,250',
-    '4611',
-    '461111',
-    '461131',
-    '46143',
-    '46151',
-    '461520',
-    '46156',
     '4617',
-    '461a&ndash;c',
-    '461p',
-    '462%',
-    '462&ndash;452',
-    '462\'',
-    '462,000',
-    '462,060',
-    '462.5',
-    '46202',
-    '4621',
-    '46210',
-    '46229',
-    '4625',
-    '462660',
-    '462b',
     '462m',
-    '462p',
-    '463.6%',
-    '463231',
-    '463283',
-    '463344',
-    '463351-1',
-    '463418',
-    '463437',
-    '4635',
-    '46370',
-    '463971',
-    '464&ndash;8718',
-    '464&times;524mm',
-    '46410',
-    '46456',
     '464664',
-    '46475',
-    '464900',
-    '464bp',
-    '464k',
-    '464kg',
-    '464m',
-    '464mm',
-    '464xx',
-    '465&ndash;23&ndash;11',
-    '465&ndash;455',
-    '465&ndash;460',
-    '465&ndash;466',
-    '465&ndash;511',
-    '465,000',
-    '465-day',
     '4650',
-    '465000',
-    '465023',
-    '465071',
-    '465084',
-    '4650mm',
-    '465152',
-    '4654',
-    '4655',
-    '4655111',
-    '465516',
-    '465522',
-    '4656',
-    '46560',
-    '465p',
-    '465pp.',
     '466,300',
-    '466,631',
-    '466-page',
-    '466-yard',
-    '466/me',
-    '466055',
-    '4661',
-    '4663',
-    '4667',
-    '4667-69',
-    '46690',
-    '466dx2',
-    '466edx2',
-    '466iops',
-    '466mph',
-    '466y',
     '467&ndash;3532',
-    '467&ndash;8',
-    '467/880',
-    '4670',
-    '4671',
-    '467203',
-    '467444',
-    '4675',
-    '46760',
-    '467681',
-    '46770',
-    '46771',
-    '4678',
-    '467ml',
-    '467th',
-    '468,9000,000',
     '468.',
-    '4680&ndash;300',
-    '4680mp',
-    '4680s',
-    '46820',
-    '468233',
-    '468287',
-    '4683',
-    '46840',
-    '468884',
-    '469&ndash;399',
-    '469&ndash;70',
-    '469.5',
-    '4690',
-    '4692',
-    '469448',
     '4695',
-    '469f.',
-    '469mph',
-    '46:13',
-    '46:2',
-    '46:26',
-    '46:34',
-    '46a.',
-    '46bc',
-    '46c',
-    '46cwt/acre',
-    '46ff.',
-    '46in',
-    '46kb',
-    '46kg',
-    '46km/h',
     '46kph',
-    '46lb',
-    '46lbs',
-    '46min',
-    '46mins',
-    '46mm',
-    '46pp',
-    '46s.',
-    '46th-minute',
-    '46v',
-    '46x',
-    '46x50',
-    '46x66',
-    '46year-old',
-    '47%&ndash;63%',
-    '47%-owned',
     '47&deg&plusmn;5&deg',
-    '47&deg;c',
-    '47&deg;s',
-    '47&frac12',
-    '47&frac34',
-    '47&ft',
-    '47&mdash;8',
-    '47&middot;2',
-    '47&ndash;13',
-    '47&ndash;172',
-    '47&ndash;2&ndash;470558',
-    '47&ndash;2&ndash;470570',
-    '47&ndash;2&ndash;47075',
-    '47&ndash;29',
-    '47&ndash;49',
-    '47&ndash;50',
     '47&ndash;51',
-    '47&ndash;54',
-    '47&ndash;56',
-    '47&ndash;62',
-    '47&ndash;84',
-    '47(3)',
-    '47(8)',
-    '47+153',
-    '47,000-xstones',
-    '47,055,200',
-    '47,078',
-    '47,080',
-    '47,177',
-    '47,25',
-    '47,400,000',
-    '47,404',
     '47,439',
-    '47,48',
-    '47,498',
-    '47,541',
-    '47,63',
-    '47,643',
-    '47,657million',
-    '47,777',
-    '47,800',
-    '47,890',
-    '47-0',
-    '47-3',
-    '47-33',
-    '47-day',
-    '47-footer',
-    '47-page',
     '47-piece',
-    '47-point',
-    '47-round',
-    '47-run',
-    '47-second',
-    '47-strong',
-    '47-ton',
-    '47.0',
-    '47.0,45.2',
-    '47.00',
-    '47.06m',
-    '47.07',
-    '47.15',
-    '47.29s',
-    '47.29secs',
-    '47.3%',
     '47.33',
-    '47.34',
-    '47.40',
-    '47.5&ndash;51.3',
-    '47.50',
-    '47.53',
-    '47.53s',
-    '47.558',
-    '47.5m',
-    '47.63',
-    '47.66',
-    '47.67',
-    '47.7kb',
-    '47.8%',
-    '47.82',
-    '47.87',
     '47.8pc',
-    '47.9',
-    '47.9%',
-    '47/052',
-    '47/233',
-    '47/4s',
-    '47/57',
-    '47/8p',
-    '470&mdash;1',
-    '470&ndash;80',
-    '470&ohm',
-    '470-81',
-    '470-acre',
-    '470.30',
-    '470/l',
-    '470/v7',
     '47000',
-    '470000',
-    '47010',
-    '4703',
-    '47046',
-    '47047',
-    '4705',
-    '4705m',
-    '4707',
-    '47079',
-    '47080',
-    '470k',
-    '470mhz-850mhz',
-    '470p',
-    '470th',
-    '471&mdash;2',
     '471&ndash;6',
-    '471,000',
-    '471/2',
-    '47100',
-    '47102',
-    '4712',
-    '47133',
-    '471410',
-    '47146',
-    '4717',
-    '471745',
-    '4718',
-    '471p',
-    '472,000',
-    '472-594',
-    '472-633',
     '4720',
-    '47200',
-    '47200/146',
-    '472211',
-    '472249',
-    '4724',
-    '47248',
-    '4724mm',
-    '4725',
-    '472884',
-    '4729/bs8000',
-    '472m',
-    '472mph',
-    '473&ndash;474',
-    '47302',
-    '473314',
     '47374',
-    '473a',
-    '474&ndash;484',
-    '474&ndash;489',
-    '474&ndash;5',
-    '474,160',
-    '4740',
-    '47402\'s',
-    '47411',
-    '4743',
-    '47446',
-    '474491',
-    '47457',
-    '47472',
-    '47475',
-    '4748',
     '47487',
-    '474mph',
-    '475&ndash;2dh',
-    '475&ndash;6',
-    '475&ndash;98',
-    '475,00',
-    '475,968',
-    '475-525',
-    '475.8',
-    '475/5',
-    '4750rpm',
-    '47522',
-    '47523',
-    '47525',
-    '4755',
-    '47567',
     '47570',
-    '47580',
-    '475bc',
-    '475ff',
-    '475m',
-    '475ml/16fl',
-    '475mph',
-    '475th',
-    '476&ndash;7',
-    '476&ndash;80',
-    '476/5',
-    '476/l',
-    '4760',
-    '47600',
-    '476446',
-    '4767',
     '476894',
-    '476m',
-    '476pp',
-    '477&ndash;503',
-    '477&ndash;66',
-    '477-strong',
-    '477/6',
-    '47716',
-    '4778',
-    '477a/120a',
-    '477e',
-    '478%',
-    '478&ndash;460',
-    '478,394',
-    '4780',
-    '478060',
     '47818',
-    '47861a',
-    '4789',
-    '47890',
-    '479&ndash;323',
-    '479&ndash;440',
-    '479&ndash;80',
-    '4790',
-    '479111',
-    '4792',
-    '479250',
-    '479500',
-    '47961',
-    '47:04',
-    '47:16&ndash;19',
-    '47:3',
     '47:53',
-    '47c',
-    '47e',
-    '47ff',
-    '47hour',
-    '47in',
-    '47ins',
-    '47kw',
-    '47m',
-    '47mb',
-    '47min',
-    '47mph',
-    '47ohm',
-    '47pp',
-    '47pts',
-    '48%&ndash;83%',
     '48&deg',
-    '48&deg;f',
-    '48&frac12;inch',
-    '48&ft',
-    '48&ins&times;12&ins&times;18&ins',
-    '48&ins&times;24&ins&times;24&ins',
-    '48&ins&times;57&ins',
-    '48&ins;x12&ins',
-    '48&ins;x12&ins;x15&ins',
-    '48&ins;x18&ins;x18&ins',
-    '48&mdash;51',
-    '48&mdash;9',
-    '48&ndash;10&ndash;0',
-    '48&ndash;12',
-    '48&ndash;153',
-    '48&ndash;18',
     '48&ndash;20',
-    '48&ndash;52',
-    '48&ndash;54',
-    '48&ndash;56',
-    '48&ndash;60',
-    '48&ndash;60-bed',
-    '48&ndash;61',
-    '48&ndash;626',
-    '48&ndash;634',
-    '48&ndash;66',
-    '48&ndash;68',
-    '48&sol;1',
-    '48&sol;2',
-    '48&times;5mm/',
-    '48(3)',
-    '48(6)',
     '48+150',
-    '48,161',
-    '48,368',
-    '48,400',
-    '48,403',
-    '48,500',
-    '48,555,000',
-    '48,609',
-    '48,750',
-    '48,861,000',
-    '48,892',
-    '48,924',
-    '48-',
-    '48-0',
-    '48-16',
-    '48-3',
     '48-39',
-    '48-4',
-    '48-50',
-    '48-53',
-    '48-7',
-    '48-72',
-    '48-8',
-    '48-bit',
-    '48-city',
-    '48-copy',
-    '48-km',
-    '48-km/',
-    '48-plane',
-    '48-round',
-    '48-seater',
-    '48-sheet',
     '48-warplane',
-    '48-well',
-    '48-yard',
-    '48-year',
-    '48.0',
-    '48.01sec',
-    '48.1',
-    '48.12',
-    '48.12&ndash;13',
-    '48.17',
-    '48.3cm',
-    '48.4/100000',
-    '48.40',
-    '48.40sec',
-    '48.4sec',
-    '48.55',
     '48.6',
-    '48.63',
-    '48.79',
-    '48.84',
-    '48.85',
-    '48.8p',
-    '48.95',
-    '48/160',
-    '48/171',
-    '48/20b',
-    '48/22&ndash;1',
-    '48/22&ndash;2',
-    '48/78',
-    '480%',
-    '480&deg;c',
-    '480&ndash;406',
     '480&ndash;524',
-    '480+km',
-    '480,000lbs',
-    '480-km',
-    '480-strong',
-    '480.7',
-    '480/79',
-    '4800-ft',
-    '4800/210',
-    '480000',
-    '4800gns',
-    '480130',
-    '480500',
-    '48060yrbp',
-    '48070',
-    '4808',
     '480kg',
-    '480mph',
-    '480pp.',
-    '480z',
-    '481&mdash;511',
-    '481&ndash;0',
-    '481-o',
-    '481.2',
-    '481014',
-    '48108326',
-    '48109',
-    '48110',
-    '4813',
-    '48130',
-    '4814',
-    '48141',
     '48142',
-    '481441',
-    '481444',
-    '48151',
-    '48166',
-    '481813',
-    '481859',
-    '481877',
-    '481mph',
-    '482&ndash;3',
-    '482&ndash;4',
-    '482&ndash;979',
-    '482,118',
-    '482.52',
-    '482.892mph',
-    '4820',
     '4821',
-    '482285',
-    '482466',
-    '4825120',
-    '482514',
-    '4828',
-    '48280',
-    '4828728',
-    '482nd',
-    '483&ndash;8',
-    '483,000',
-    '48305',
-    '4833',
-    '483390',
-    '4836',
-    '483b&ndash;h',
     '484&ndash;5',
-    '484.',
-    '4840',
-    '48400',
-    '484123',
-    '4843',
-    '4844',
-    '48441',
-    '48445',
-    '48460',
-    '484848',
-    '484c',
-    '484n.',
-    '485&ndash;488',
-    '485&ndash;489',
-    '485(3)',
     '485-seat',
-    '4850lb',
-    '4851',
-    '4852',
-    '4854',
-    '48540',
-    '48580',
-    '4859',
-    '485hp',
-    '485th',
-    '486&ndash;510',
-    '486&ndash;7',
-    '486.',
-    '486/25',
-    '486/25s',
-    '486/33',
     '486/33m',
-    '486/d',
-    '486/de',
-    '486/me',
-    '486/p',
-    '486/p5',
-    '486/pg',
-    '486/se',
-    '48620',
-    '48680',
-    '48690',
-    '48699',
-    '486a',
-    '486b',
-    '486dx2s',
-    '486dxs',
     '486eisawb',
-    '486ft',
-    '486lc2',
-    '486se',
-    '486sl-based',
-    '486sx-25',
-    '486sx/',
-    '487&ndash;457',
-    '487,000',
-    '487.07',
-    '487/1141',
-    '4872',
-    '487354',
-    '4874',
-    '4875',
-    '487722',
     '487ff.',
-    '488&ndash;9',
-    '488/l',
-    '4880',
-    '48820',
-    '488219',
-    '4887',
-    '4887m',
-    '489&ndash;92',
-    '489,000,000',
-    '489,500',
-    '489,822,000',
-    '489.5',
-    '4893748',
-    '4894',
-    '4898',
     '48986',
-    '48990',
-    '489p',
-    '48:16',
-    '48:17',
-    '48:21&ndash;22',
-    '48:3',
-    '48:30',
-    '48:52',
-    '48b',
-    '48cm',
-    '48d',
-    '48e',
-    '48f&ndash;g',
-    '48hr',
-    '48hrs',
     '48kg',
-    '48km',
-    '48km/',
-    '48km/130mls',
-    '48kmh',
-    '48kw',
-    '48lb',
-    '48mb',
-    '48mhz',
-    '48min',
-    '48no',
-    '48th-minute',
-    '48week',
-    '48x54&ins',
-    '48z02',
-    '49&ft',
     '49&mdash;51',
-    '49&ndash;0',
-    '49&ndash;13',
-    '49&ndash;1360',
-    '49&ndash;19',
-    '49&ndash;3',
-    '49&ndash;40',
-    '49&ndash;433',
-    '49&ndash;50',
-    '49&ndash;51',
-    '49&ndash;54',
-    '49&ndash;59',
-    '49&ndash;7',
-    '49&ndash;70',
-    '49&ndash;72',
-    '49&ndash;79',
     '49&ndash;88',
-    '49(1)',
-    '49(2)',
-    '49,200',
-    '49,200-strong',
-    '49,271',
-    '49,280',
-    '49,50',
-    '49,657',
-    '49,729',
-    '49,890,273',
-    '49,979',
-    '49-221',
-    '49-days',
-    '49-goal',
-    '49-hour',
     '49-inch',
-    '49-mer',
-    '49-old',
-    '49-strong',
-    '49-x',
-    '49.0%',
-    '49.00',
-    '49.09sec',
-    '49.1%',
-    '49.12',
-    '49.20m.',
-    '49.22',
-    '49.24',
-    '49.27p',
-    '49.29',
-    '49.3-14-175-10',
     '49.322b.',
-    '49.33',
-    '49.34',
-    '49.4%',
-    '49.4/',
-    '49.40',
-    '49.42',
-    '49.45',
-    '49.49',
-    '49.50',
-    '49.52pc',
-    '49.57',
-    '49.57%',
-    '49.60',
-    '49.78sec',
-    '49.8%',
     '49.81',
-    '49.87s',
-    '49.8sec',
-    '49.97',
-    '49/2',
-    '49/245',
-    '49/50/51',
-    '490&ndash;479',
-    '490&ndash;480',
-    '49000',
-    '4900000',
-    '4902',
-    '4904',
-    '4905',
-    '490k',
-    '491.1m',
     '49100',
-    '491011',
-    '491547',
-    '49180',
-    '491e',
-    '491p.',
-    '492&ndash;3',
-    '492&ndash;5700',
-    '4920',
-    '492211',
-    '49224',
-    '4925',
-    '492592',
-    '492593',
-    '4926',
-    '492602',
     '492629312',
-    '492882',
-    '492ft',
-    '492p',
-    '493188',
-    '493260',
-    '4934.5',
-    '4939',
-    '493c&ndash;d',
-    '493mph',
-    '493p',
-    '493rd',
-    '494,000',
-    '494,300',
-    '494/l',
-    '4940',
     '4942',
-    '49420',
-    '49423',
-    '494394',
-    '494407',
-    '495&ndash;3305',
-    '495,000',
-    '495,952',
-    '495-326',
-    '495-member',
-    '49500',
-    '495028',
-    '49555',
-    '49563',
-    '495m',
-    '496&ndash;406',
     '496,000',
-    '49635-2',
-    '4966',
-    '49664',
-    '496666',
-    '49686',
-    '49690',
-    '496k',
-    '497&ndash;505',
-    '49720',
-    '4974400',
-    '4975',
-    '49770',
-    '497739',
-    '498&ndash;446',
-    '498&ndash;503',
     '498,576',
-    '4980',
-    '4981',
-    '4982',
-    '4988',
-    '49890',
-    '498k',
-    '498m',
-    '499&ndash;502',
-    '499,000',
-    '499-member',
-    '4990',
-    '4991',
-    '4992',
-    '49930',
-    '49970',
     '4998',
-    '49980',
-    '4999',
-    '499c&ndash;e',
-    '499mph',
-    '499th',
-    '49:22ff',
-    '49:25',
-    '49:5ff',
-    '49_out',
-    '49bc',
-    '49d&ndash;e',
-    '49ft',
-    '49in',
-    '49km',
-    '49min',
     '49o',
-    '49pp',
-    '49sec',
-    '49year-old',
-    '4:00',
-    '4:00pm',
-    '4:01',
-    '4:02.5',
-    '4:03.7.',
-    '4:04.0',
-    '4:05.6.',
-    '4:06.83',
-    '4:07:32',
-    '4:09.94',
-    '4:1&ndash;11',
-    '4:1&ndash;13',
     '4:1&ndash;16',
-    '4:1&ndash;3',
-    '4:1&ndash;5',
-    '4:1&ndash;5:13',
-    '4:1&ndash;6',
-    '4:1,18',
-    '4:103',
-    '4:11,1',
-    '4:11,12',
-    '4:12&ndash;16',
-    '4:13&ndash;16',
-    '4:13.1',
-    '4:15.1',
-    '4:16',
-    '4:16&ndash;30',
-    '4:16.4',
     '4:17',
-    '4:17&ndash;19',
-    '4:17&ndash;29',
-    '4:17&ndash;32',
-    '4:18&ndash;19',
-    '4:18&ndash;21',
-    '4:1f',
-    '4:20',
-    '4:20&ndash;21',
-    '4:20&ndash;4',
-    '4:21.5',
-    '4:22',
-    '4:22&ndash;23',
-    '4:22ff.',
-    '4:23.08',
-    '4:24',
     '4:25',
-    '4:26&ndash;27',
-    '4:26&ndash;7',
-    '4:27&ndash;31',
-    '4:27.0',
-    '4:27.9',
-    '4:29',
-    '4:29&ndash;31',
-    '4:2:1',
-    '4:2:2',
-    '4:2:6',
-    '4:3&ndash;5:2',
-    '4:3&ndash;8',
-    '4:3,4',
-    '4:31.3',
-    '4:32',
     '4:32&ndash;35',
-    '4:32.5',
-    '4:33',
-    '4:33.0',
-    '4:34.9',
-    '4:35',
-    '4:36',
-    '4:37.8',
-    '4:39',
-    '4:39.7',
-    '4:4&ndash;6',
-    '4:4&ndash;7',
-    '4:40',
-    '4:41',
-    '4:42.1',
-    '4:42.7',
     '4:45am',
-    '4:49.6',
-    '4:5&ndash;7',
-    '4:5&ndash;8',
-    '4:5,6',
-    '4:50.2',
-    '4:51.0',
-    '4:52:34',
-    '4:53.1',
-    '4:58',
-    '4:58.8',
-    '4:8&ndash;13',
-    '4:8ff',
-    '4:9',
-    '4=severe',
-    '4a(2)',
     '4a(ii)',
-    '4a-d',
-    '4a.',
-    '4a8',
-    '4aa.',
-    '4aaa',
-    '4ab',
-    '4ability',
-    '4ad-ish',
-    '4ah.',
-    '4ap',
-    '4aq',
-    '4as',
-    '4asr',
-    '4au',
-    '4aw',
     '4bmj',
-    '4bp',
-    '4br',
-    '4c-956',
-    '4c/5c/5b+',
-    '4c4',
-    '4c7',
-    '4cm(1&half;inch)',
-    '4cm-long',
-    '4cs',
-    '4cv',
-    '4cwt',
-    '4d+ct',
-    '4d+fs',
-    '4d._per',
-    '4d/480',
     '4dj',
-    '4dos',
-    '4dp',
-    '4dt',
-    '4du',
-    '4dw',
-    '4dx',
-    '4dy',
-    '4ea',
-    '4ef',
-    '4et',
-    '4ev',
-    '4ex',
-    '4f11e',
-    '4f2',
-    '4facilities',
     '4ft-6ft',
-    '4ft-long',
-    '4ft.',
-    '4ft.0ins.',
-    '4g-bytes',
-    '4g-words',
-    '4g2',
-    '4ghz',
-    '4gl-based',
-    '4gl/rf',
-    '4h2',
-    '4ha',
-    '4he',
-    '4hh',
-    '4hl',
-    '4hp',
     '4hrs',
-    '4hu',
-    '4hu.',
-    '4hy',
-    '4j',
-    '4jb',
-    '4jf',
-    '4ju',
-    '4jw',
-    '4jx',
-    '4jy',
-    '4k',
-    '4k/2k',
-    '4kb',
-    '4kcalmol',
-    '4kg/9lbs',
     '4khz',
-    '4km-',
-    '4km/2&frac12;mls',
-    '4kms',
-    '4kpc',
-    '4kt',
-    '4kv',
-    '4l&deg;c',
-    '4l.t.704',
-    '4l74',
-    '4la.',
-    '4lj',
-    '4lr',
-    '4lt',
-    '4lz',
-    '4m&sup2/litre',
     '4m-',
-    '4m-acre',
-    '4m54',
-    '4ma',
-    '4mbps',
-    '4mbyte',
-    '4mg/ml',
-    '4million',
-    '4mins',
-    '4mms',
-    '4mph',
-    '4myr',
-    '4n',
-    '4na',
-    '4nj',
-    '4now',
     '4np',
-    '4nt',
-    '4o.8',
-    '4o0km/h',
-    '4oo',
-    '4oog',
-    '4os',
-    '4oz.',
-    '4ozs.',
-    '4p.m.',
-    '4pd',
-    '4ph',
-    '4pl',
-    '4pm.',
-    '4pr',
-    '4py',
     '4q',
-    '4qf',
-    '4qp',
-    '4r2c1',
-    '4rb',
-    '4ru',
-    '4s-briefcase',
-    '4s.3d',
-    '4s.6d',
-    '4sd',
-    '4sec',
-    '4secs',
-    '4shillings',
-    '4sight',
-    '4sj',
-    '4speed',
     '4sq',
-    '4ss',
-    '4t.',
-    '4t/acre',
-    '4t/in2',
-    '4ta',
-    '4td',
-    '4tf',
-    '4th&ndash;5th',
-    '4th&ndash;7th',
-    '4th-22nd',
-    '4th-placed',
-    '4th/5th',
-    '4to',
-    '4tr',
-    '4tu',
     '4u-hour',
-    '4ua.',
-    '4ug',
-    '4ut',
-    '4v10&ndash;20',
-    '4w118',
-    '4wds',
-    '4wt',
-    '4x&agr',
-    '4x10&amp;sup-13',
-    '4x10&ins',
-    '4x10s',
-    '4x2&middot;5cm',
-    '4x4&ft',
-    '4x4in',
-    '4x5cm',
     '4x5inches',
-    '4x6&half;inches',
-    '4x8inch',
-    '4x90g',
-    '4xtimes200g',
-    '4y',
-    '4ya',
-    '4yh',
-    '5%.',
-    '5%co',
-    '5&aring',
-    '5&ast',
-    '5&bsol;a',
-    '5&commat;1/2',
-    '5&commat;1/3',
-    '5&deg;.',
     '5&egrave;me',
-    '5&formula;x11&frac25;inch',
-    '5&frac12/5',
-    '5&frac12;-',
-    '5&frac12;-month',
-    '5&frac12;.',
-    '5&frac12;d',
-    '5&frac12;d.',
-    '5&frac12;ft',
-    '5&frac12;lb',
-    '5&frac12;m',
-    '5&frac12;mile',
-    '5&frac12;oz',
-    '5&frac14;-inch',
-    '5&frac14;d',
-    '5&frac34;d',
     '5&frac58',
-    '5&ft&times;6&ft',
-    '5&ft/6&ft',
-    '5&ft;10&ins',
-    '5&ft;4&ins',
-    '5&ft;5&ins',
-    '5&ft;8&ins;-5&ft;9&ins',
-    '5&ft;9&ins;-5&ft;10&ins',
-    '5&gt;7',
-    '5&ins&times;4&ins',
-    '5&mdash',
-    '5&mdash;009',
-    '5&mdash;009/6',
-    '5&mdash;011',
-    '5&mdash;1',
-    '5&mdash;10p',
     '5&mdash;12',
-    '5&mdash;14',
-    '5&mdash;16',
-    '5&mdash;18',
-    '5&mdash;23',
-    '5&mdash;23(4)',
-    '5&mdash;24',
-    '5&mdash;27',
-    '5&mdash;28',
-    '5&mdash;30(2)',
-    '5&mdash;33(2)',
-    '5&mdash;34',
-    '5&mdash;34(2)',
-    '5&mdash;36(2)',
-    '5&mdash;43',
-    '5&mdash;5(4)',
     '5&mdash;6p',
-    '5&mdash;6s',
-    '5&mgr;v',
-    '5&middot;0',
-    '5&middot;4',
-    '5&middot;5cm',
-    '5&middot;8',
-    '5&middot;9',
-    '5&ndash&frac12',
-    '5&ndash;07',
-    '5&ndash;1&ndash;12&ndash;0',
-    '5&ndash;1/2',
-    '5&ndash;1/2&ins',
-    '5&ndash;10cm',
-    '5&ndash;10g',
-    '5&ndash;10km',
     '5&ndash;10mbps',
-    '5&ndash;10min',
-    '5&ndash;10mins',
-    '5&ndash;10ppm',
-    '5&ndash;12%',
-    '5&ndash;12&ndash;1877',
-    '5&ndash;12&ndash;1891',
-    '5&ndash;12&ndash;8',
-    '5&ndash;14&ndash;8',
-    '5&ndash;15&deg;c',
-    '5&ndash;15&deg;dh',
-    '5&ndash;15cms',
-    '5&ndash;165',
-    '5&ndash;17&deg',
-    '5&ndash;180',
-    '5&ndash;1ocm',
     '5&ndash;1s',
-    '5&ndash;2&ndash;0',
-    '5&ndash;2&ndash;8',
-    '5&ndash;20&deg;c',
-    '5&ndash;21',
-    '5&ndash;23',
-    '5&ndash;25',
-    '5&ndash;25%',
-    '5&ndash;25mph',
-    '5&ndash;27',
-    '5&ndash;2f',
-    '5&ndash;3&ndash;9&ndash;0',
-    '5&ndash;3-2',
-    '5&ndash;31',
-    '5&ndash;323',
-    '5&ndash;339',
     '5&ndash;4&ndash;1887',
-    '5&ndash;4&ndash;3&ndash;2&ndash;1&ndash;stop',
-    '5&ndash;45',
-    '5&ndash;5&ndash;1895',
-    '5&ndash;5&ndash;1900',
-    '5&ndash;5.5m',
-    '5&ndash;54',
-    '5&ndash;56',
-    '5&ndash;57',
-    '5&ndash;6&deg;c',
-    '5&ndash;600',
-    '5&ndash;61',
-    '5&ndash;64',
-    '5&ndash;6:13',
-    '5&ndash;6cm',
-    '5&ndash;6in',
     '5&ndash;6ins/12&ndash;15cm',
-    '5&ndash;6min',
-    '5&ndash;6mph',
-    '5&ndash;6p',
-    '5&ndash;7&ndash;0',
-    '5&ndash;7&ndash;9',
-    '5&ndash;7,000',
-    '5&ndash;7.5',
-    '5&ndash;7c',
-    '5&ndash;8\'',
-    '5&ndash;80',
-    '5&ndash;877',
-    '5&ndash;8cm',
-    '5&ndash;8min',
-    '5&ndash;8mm',
-    '5&ndash;9-',
     '5&ndash;9th',
-    '5&ndash;oct',
-    '5&plus;1',
-    '5&plus;10',
-    '5&prime;35&prime',
-    '5&prime;38&prime',
-    '5&rehy;year-old',
-    '5&shilling;6',
-    '5&shilling;6d.',
-    '5&times',
-    '5&times;10/l',
-    '5&times;5&frac34&ins',
-    '5&times;denhardt',
-    '5&times;denhart',
-    '5\'-',
-    '5\'-aacagctatgaccatg-3',
     '5\'-aat',
-    '5\'-aatacgactcactatag-3\'',
-    '5\'-acggatccacttacctgtccggctctccggctccggcagctt-3\'',
-    '5\'-actgctagagatttttac-3\'',
-    '5\'-actggaagggttagtttg-3\'',
-    '5\'-adjacent',
-    '5\'-agaccaagatcaatcccacc-3\'',
-    '5\'-attaaccctcactaaag-3',
-    '5\'-atttgttctaagtcgccatattctct',
-    '5\'-caat-3\'',
-    '5\'-catacagctgaagcttgtagacacact',
-    '5\'-ccat',
-    '5\'-ccatatccatgctgttctgcaatccc-3\'',
-    '5\'-cccagcctgacccatgtggtgg-3\'',
-    '5\'-ccctggcattcatcttgatc-3\'',
-    '5\'-cgcggatcca(ag)',
     '5\'-cgcggatcccc(acgt)aa(ct)ac(acgt)ca(ct)tt(ct)gt-3\'',
-    '5\'-cgcggatcccccaacacgcattttgtg-3\'',
-    '5\'-cgcggatcccctgcgggcctgctg',
-    '5\'-cgcggatcccctgcgggcctgctg-3\'',
-    '5\'-cgcggatccttcagcgctgccgacaaccac',
-    '5\'-cpa',
-    '5\'-ct',
-    '5\'-ctagagaacccactgcttaac-3\'',
-    '5\'-ctattaagtggagatgtgcc-3\'',
-    '5\'-ctcgcaaacaccttatgtac-3\'',
-    '5\'-ctg',
-    '5\'-ctgattgagatctgacgc-3\'',
-    '5\'-cttcatcacggaggttcctg-3\'',
-    '5\'-d(cgcaatcg)',
-    '5\'-d(cgcaatcg).3\'-d(gcgttagc)',
-    '5\'-dephosphorylation',
     '5\'-gacattcaactcaatgttcg',
-    '5\'-gaggtcgatcgcccacgtga-3\'',
-    '5\'-gagtttactgcagcggagataaagctcagc-3\'',
-    '5\'-gatcaagctttccctgcgagcccgtggagactgc-3\'',
-    '5\'-gatcagatctacttacctgtcgacgggggg-gtcacgggcaggac-3\'',
-    '5\'-gatcggatccacttacctgtaaaggtctggagctggtagggggc-3',
-    '5\'-gatcggatccacttacctgtctggctgtccgacacaggctcata-3\'',
-    '5\'-gcc',
-    '5\'-ggcgggacttcattgggtgaacaatagccaggtatcgatc-3\'',
-    '5\'-ggtggttcccattcgcgcatcatagatacc-3\'',
-    '5\'-gt',
-    '5\'-gtaaaacgacggccagt-3\'',
-    '5\'-gtgaaattcttccttcacac',
-    '5\'-gtgaattcccaaagaacctgg-3\'',
-    '5\'-gtggaatgt-3\'',
-    '5\'-gttcggggccgtcgcttagg-3\'',
     '5\'-half',
-    '5\'-nucleotides',
-    '5\'-protruding',
-    '5\'-pyrimidine',
-    '5\'-regulated',
-    '5\'-regulating',
-    '5\'-t',
-    '5\'-taa',
-    '5\'-terminal',
-    '5\'-ttagacgtctagacgtcta-3\'',
-    '5\'-ttagcaatccggccgccct-3\'',
-    '5\'-ttt',
-    '5\'08',
-    '5\'3',
-    '5\'3\'',
-    '5\'3200',
     '5\'9',
-    '5\'aaa.gct.ttc.att.aca.tga.cga.agt.ggt.agg.tga.tgt',
-    '5\'aacgatcagagtagtggtatttcacc',
-    '5\'ad13:accaaagccacagttgggca',
-    '5\'agggccctagaggggccctag3\'',
-    '5\'atgattctcaactcttctactgaagatggt-3\'',
-    '5\'c',
-    '5\'cggaggggccctagagggccctagagggccccccaaaaacccccaaaaacccccc3\'',
-    '5\'end',
-    '5\'gaggggccctagagggccctagagggccc3\'',
-    '5\'ggg.aat.tcg.aca.tgg.tag.atc.tgc.cac',
-    '5\'ggggcccc3\'',
-    '5\'gtcatccagtacctggccg',
-    '5\'nucleotidase',
-    '5\'t(-1)',
-    '5\'tacaa',
     '5\'tcgagcactaaaacaattcaagcccgggg',
-    '5\'tgtaa',
-    '5\'to',
-    '5(10)',
-    '5(2)&mdash',
-    '5(5).',
-    '5(5,6)',
-    '5(9)',
-    '5(e)',
-    '5+1',
-    '5+1=6',
-    '5+3',
-    '5,00',
-    '5,000&ndash;500,000',
-    '5,000&ndash;6,000kg',
-    '5,000&ndash;7,000',
     '5,000,000,000',
-    '5,000,000th',
-    '5,000,070',
-    '5,000-',
-    '5,000-1',
-    '5,000-10,000',
-    '5,000-15,000',
-    '5,000-acre',
-    '5,000-hectare',
-    '5,000-house',
-    '5,000-kg',
-    '5,000-member',
-    '5,000-metre',
-    '5,000-page',
-    '5,000-piece',
-    '5,000-plus',
     '5,000-tonne',
-    '5,000-year',
-    '5,000bc',
-    '5,000gn',
-    '5,000km',
-    '5,000lb',
-    '5,000ngml',
-    '5,000rpm',
-    '5,000s',
-    '5,000th',
-    '5,001',
-    '5,004,000',
-    '5,006',
-    '5,020',
-    '5,022',
-    '5,049',
     '5,060',
-    '5,061',
-    '5,062',
-    '5,086',
-    '5,090',
-    '5,090,000',
-    '5,090-pound',
-    '5,092',
-    '5,10,15,20,25,30,35',
-    '5,100,000',
-    '5,103,772',
-    '5,107',
-    '5,11-13',
-    '5,113',
-    '5,119',
-    '5,120,000',
     '5,121,000',
-    '5,124',
-    '5,124,931',
-    '5,133,000',
-    '5,140',
-    '5,146,000',
-    '5,15,143',
-    '5,152kg',
-    '5,154',
-    '5,156',
-    '5,158',
-    '5,164',
-    '5,172',
-    '5,174',
-    '5,180',
-    '5,190',
     '5,198',
-    '5,1986',
-    '5,2',
-    '5,20&ndash;22',
-    '5,200gn',
-    '5,201',
-    '5,201,919',
-    '5,205',
-    '5,211',
-    '5,223',
-    '5,240-word',
-    '5,245',
-    '5,248ft',
-    '5,25-inch',
-    '5,250',
-    '5,250,000',
     '5,250kg',
-    '5,27',
-    '5,273,000',
-    '5,283,220',
-    '5,284ft',
-    '5,288',
-    '5,293',
-    '5,295',
-    '5,297',
-    '5,298',
-    '5,299,000',
-    '5,3',
-    '5,3,7',
-    '5,304',
-    '5,308,510',
-    '5,310,000',
     '5,316',
-    '5,321',
-    '5,322',
-    '5,328',
-    '5,332',
-    '5,334',
-    '5,345',
-    '5,350',
-    '5,362',
-    '5,368',
-    '5,372',
-    '5,380,000',
-    '5,392',
-    '5,396,000',
-    '5,410',
-    '5,415',
     '5,416',
-    '5,417,464',
-    '5,418',
-    '5,419ft',
-    '5,434,000',
-    '5,443',
-    '5,450,000',
-    '5,451',
-    '5,456',
-    '5,460',
-    '5,472',
-    '5,473',
-    '5,476',
-    '5,478',
-    '5,480',
-    '5,487',
     '5,5',
-    '5,500-odd',
-    '5,500-strong',
-    '5,500kg',
-    '5,500rpm',
-    '5,501',
-    '5,516',
-    '5,523',
-    '5,534',
-    '5,536',
-    '5,537,000',
-    '5,539',
-    '5,542',
-    '5,543,700',
-    '5,545',
-    '5,547,000',
     '5,553',
-    '5,564',
-    '5,566',
-    '5,57',
-    '5,576',
-    '5,582',
-    '5,600gns',
-    '5,600kg',
-    '5,600yr',
-    '5,606',
-    '5,633,456',
-    '5,653',
-    '5,660,000',
-    '5,660,619',
-    '5,672',
-    '5,674,000',
     '5,680',
-    '5,685',
-    '5,688',
-    '5,693',
-    '5,700kg',
-    '5,701',
-    '5,705',
-    '5,710',
-    '5,712',
-    '5,716',
-    '5,720',
-    '5,730',
-    '5,734',
-    '5,751,000',
-    '5,764,801',
-    '5,768',
     '5,769',
-    '5,774',
-    '5,782',
-    '5,783,200',
-    '5,789',
-    '5,790',
-    '5,791,700',
-    '5,794',
-    '5,7b',
-    '5,8',
-    '5,8,13,14',
-    '5,800,000',
-    '5,800,000,000',
-    '5,800gns',
-    '5,800kg',
-    '5,800m',
     '5,811',
-    '5,825',
-    '5,826',
-    '5,827',
-    '5,832',
-    '5,850hp',
-    '5,851',
-    '5,854',
-    '5,860,000',
-    '5,869km',
-    '5,877',
-    '5,879',
-    '5,881',
-    '5,882,000',
-    '5,9,26',
-    '5,900,000',
     '5,904ft',
-    '5,920',
-    '5,925,9',
-    '5,928m',
-    '5,935',
-    '5,948',
-    '5,950',
-    '5,953',
-    '5,954',
-    '5,970kg',
-    '5,974',
-    '5,978',
-    '5,987cc',
-    '5,997',
-    '5-&mgr;l',
-    '5-&mgr;m',
     '5-1-32-0',
-    '5-10s',
-    '5-10sec',
-    '5-15%',
-    '5-20%',
-    '5-24',
-    '5-240',
-    '5-26',
-    '5-3-93',
-    '5-30',
-    '5-32',
-    '5-384',
-    '5-4-3-2-1-zero',
-    '5-5-3',
-    '5-5-5',
-    '5-52',
     '5-55',
-    '5-6lb',
-    '5-7,000',
-    '5-7c',
-    '5-adenosine',
-    '5-aminosalicyclic',
-    '5-aminosalicylicacid',
-    '5-aminosalycilate',
-    '5-aminosalyclylic',
-    '5-asa/ac-asa',
-    '5-at',
-    '5-azacytosine',
-    '5-ball',
-    '5-bearing',
-    '5-bp',
-    '5-branched',
     '5-bromo',
-    '5-bromo-2\'-deoxyuridine',
-    '5-bromo-4-chloro-3-indolyl-&bgr;-d-galactoside',
-    '5-bromodeoxyuridine',
-    '5-centimetre',
-    '5-channel',
-    '5-chelmsford',
-    '5-colour',
-    '5-column',
-    '5-cycle',
-    '5-figure',
-    '5-fluoro-2\'-deoxycycytidine',
-    '5-fluoro-2\'-dexoyuridine-5\'-monophosphate',
-    '5-fluouracil',
-    '5-foot',
-    '5-furrow',
     '5-gallon',
-    '5-ghz',
-    '5-h',
-    '5-hete',
-    '5-ht3',
-    '5-hydroperoxy-eicosatetraenoic',
-    '5-hydroxyindole',
-    '5-hydroxytrytamine',
-    '5-in',
-    '5-in-a-row',
-    '5-in.',
-    '5-inch',
-    '5-issue',
-    '5-july',
-    '5-l',
-    '5-language',
     '5-link',
-    '5-megaton',
-    '5-methylcytosine',
-    '5-mm',
-    '5-mm-diameter',
-    '5-mm-long',
-    '5-month',
-    '5-node',
-    '5-nottingham',
-    '5-o',
-    '5-page',
-    '5-period',
-    '5-phase',
-    '5-piece',
-    '5-pounder',
-    '5-quarter',
     '5-second',
-    '5-shape',
-    '5-shilling',
-    '5-storey',
-    '5-to-4',
-    '5-ton',
-    '5-tonne',
-    '5-tuple',
-    '5-under',
-    '5-user',
-    '5-volume',
-    '5-way',
-    '5-weekly',
-    '5-x',
-    '5.0&aring',
-    '5.0&ndash;0',
     '5.0&ndash;7.5%',
-    '5.0&ndash;75%',
-    '5.0.',
-    '5.00.42',
-    '5.00.50',
-    '5.000',
-    '5.005',
-    '5.00p.m',
-    '5.00p/kwh',
-    '5.01',
-    '5.01-run',
-    '5.01x10',
-    '5.03bn',
-    '5.03ghz',
-    '5.03pc',
-    '5.04',
     '5.040,80',
-    '5.05p',
-    '5.0726',
-    '5.08mm',
-    '5.0m',
-    '5.0mg/l',
-    '5.0mm',
-    '5.0ng',
-    '5.1(12)',
-    '5.1(b)',
-    '5.1-ii',
-    '5.1-iii',
-    '5.1.1.1.',
-    '5.1.1.3.',
-    '5.1.10',
-    '5.1.15',
     '5.1.2.2',
-    '5.1.7.1',
-    '5.1.7.2',
-    '5.1.7.3',
-    '5.1.94',
-    '5.10(1)',
-    '5.10(a)',
-    '5.10.0',
-    '5.101(2)',
-    '5.10pm.',
-    '5.11.79',
-    '5.11.90',
-    '5.119',
-    '5.11a',
-    '5.12&ndash;5.14',
-    '5.12.0',
     '5.12.3',
-    '5.128',
-    '5.12d',
-    '5.12pm',
-    '5.13.1',
-    '5.13.2',
-    '5.133',
-    '5.139',
-    '5.13am',
-    '5.13pm',
-    '5.14&ndash;5.16',
-    '5.14(a)',
-    '5.14.1',
-    '5.14.2',
-    '5.14ff',
-    '5.15&deg',
     '5.15&ndash;17',
-    '5.15.3',
-    '5.15a',
-    '5.15c',
-    '5.15e',
-    '5.16&ndash;21',
-    '5.16(2)',
-    '5.160',
-    '5.16d',
-    '5.17(2)',
-    '5.17(4)',
-    '5.17(b)',
-    '5.17.1',
-    '5.17.2',
-    '5.17.3',
-    '5.17a',
     '5.17b',
-    '5.18(3)',
-    '5.18.1',
-    '5.180.05myr',
-    '5.18b',
-    '5.18c',
-    '5.18pm',
-    '5.19a',
-    '5.19c-e',
-    '5.19m',
-    '5.1b(s)',
-    '5.1pc',
-    '5.2&ndash;6.1',
-    '5.2&ndash;9',
-    '5.2-litre',
-    '5.2.',
     '5.2.3.1',
-    '5.2.3.2',
-    '5.2.3.3',
-    '5.2.3.4',
-    '5.2.9',
-    '5.20(a-d)',
-    '5.20(c)',
-    '5.202',
-    '5.204',
-    '5.20a',
-    '5.20am',
-    '5.20b',
-    '5.20c',
-    '5.20d',
-    '5.20pm',
-    '5.21c',
     '5.22&ndash;23',
-    '5.22.4',
-    '5.22a',
-    '5.22d',
-    '5.22f',
-    '5.246663',
-    '5.25(3)',
-    '5.25.1',
-    '5.25.2',
-    '5.25in',
-    '5.25oz',
-    '5.26(3)',
-    '5.266',
-    '5.26a',
-    '5.26landlord',
-    '5.27&ndash;2.74',
     '5.27c',
-    '5.27d',
-    '5.282',
-    '5.283',
-    '5.2bn',
-    '5.2d',
-    '5.2ev',
-    '5.2gb',
-    '5.2kg',
-    '5.2m',
-    '5.2mmol',
-    '5.2pc',
-    '5.3&ndash;13.0',
-    '5.3(d)',
-    '5.3,5.4',
-    '5.3.1.1',
     '5.3.1.2',
-    '5.3.1.3',
-    '5.3.11',
-    '5.3.12',
-    '5.3.13',
-    '5.3.14',
-    '5.3.15',
-    '5.3.16',
-    '5.3.17',
-    '5.3.18',
-    '5.3.19',
-    '5.3.20',
-    '5.3.21',
-    '5.3.22',
-    '5.3.23',
-    '5.3.3.3',
     '5.3.5.3.4.4.3.5.4.',
-    '5.3.92.',
-    '5.3.93',
-    '5.3/100000',
-    '5.3/100000/year',
-    '5.30&ndash;7.30pm',
-    '5.30b',
-    '5.30d',
-    '5.30pm-11pm',
-    '5.31b',
-    '5.31f',
-    '5.330m',
-    '5.33a',
-    '5.33b',
-    '5.35a',
-    '5.35b',
     '5.35c',
-    '5.35p',
-    '5.36(d)',
-    '5.36a',
-    '5.36c',
-    '5.36p',
-    '5.39166',
-    '5.39a',
-    '5.39c',
-    '5.3a',
-    '5.3b',
-    '5.3c',
-    '5.3million',
-    '5.3min',
-    '5.3p',
-    '5.4&ins',
     '5.4&ndash;11',
-    '5.4&ndash;16.6',
-    '5.4&ndash;9.7',
-    '5.4()d',
-    '5.4(2)',
-    '5.4(c)',
-    '5.4-magnitude',
-    '5.4.3.1',
-    '5.4.3.2',
-    '5.4.3.3',
-    '5.4.3.4',
-    '5.4.4.1',
-    '5.4.4.2',
-    '5.4.6.1',
-    '5.4.6.2',
-    '5.4.7.1',
     '5.4.7.2',
-    '5.4.8.1',
-    '5.4.8.2',
-    '5.4.8.3',
-    '5.4.83',
-    '5.4.9',
-    '5.40(a)',
-    '5.40(b)',
-    '5.40a',
-    '5.40e',
-    '5.41(2)',
-    '5.41(i)',
-    '5.414',
-    '5.41a',
-    '5.42pm',
-    '5.43a',
     '5.47p',
-    '5.4c',
-    '5.4gb',
-    '5.4secs',
-    '5.5&deg;c',
-    '5.5&ndash;24',
-    '5.5&ndash;6.0',
-    '5.5&ndash;6.8',
-    '5.5&ndash;6m',
-    '5.5(c)',
-    '5.5-6',
-    '5.5-9.5',
-    '5.5.1988',
-    '5.5.4',
-    '5.5.5',
-    '5.5.7',
     '5.5.9',
-    '5.50p.m.',
-    '5.50pm',
-    '5.51.1',
-    '5.515047',
-    '5.522m',
-    '5.52am',
-    '5.54',
-    '5.555',
-    '5.56%',
-    '5.56mm',
-    '5.56p',
-    '5.57pm',
-    '5.57x10',
-    '5.589',
-    '5.5:1',
     '5.5bn',
-    '5.5kb',
-    '5.5kev',
-    '5.5kg',
-    '5.5km',
-    '5.5lbs',
-    '5.5nm.',
-    '5.5secs',
-    '5.5v',
-    '5.6&deg;c',
-    '5.6&ndash;5.8p.p.m.',
-    '5.6&ndash;6.6',
-    '5.6(3)',
-    '5.6(a)',
-    '5.6(b)',
-    '5.6(c)',
     '5.6(d)',
-    '5.6(e)',
-    '5.61%',
-    '5.61p',
-    '5.62%',
-    '5.625',
-    '5.625%',
-    '5.63',
-    '5.635%',
-    '5.63p',
-    '5.64',
-    '5.65p',
-    '5.66',
-    '5.68',
-    '5.68%',
-    '5.6a',
     '5.6b',
-    '5.6f',
-    '5.6k',
-    '5.6m',
-    '5.6mbps',
-    '5.6myr',
-    '5.6oz',
-    '5.6pc',
-    '5.7&ins',
-    '5.70m',
-    '5.71',
-    '5.72516',
-    '5.74',
-    '5.74-day',
-    '5.75-ms',
-    '5.75m',
     '5.75ms',
-    '5.75p',
-    '5.76',
-    '5.76p',
-    '5.77',
-    '5.77%',
-    '5.776%',
-    '5.78',
-    '5.7m.',
-    '5.7t/ha',
-    '5.7x107',
-    '5.8&ndash;5.10',
-    '5.8&ndash;5.1myr',
-    '5.8&times;10/l',
-    '5.8(a)',
-    '5.8(b)',
     '5.8(d)',
-    '5.8.4',
-    '5.8.5',
-    '5.8.92',
-    '5.81%',
-    '5.81m',
-    '5.82',
-    '5.83%',
-    '5.83lbs',
-    '5.84',
-    '5.84(5)',
-    '5.85mm',
-    '5.86',
-    '5.875%',
-    '5.88',
-    '5.882',
     '5.89',
-    '5.8ins',
-    '5.9&ins',
-    '5.9&ndash;10',
-    '5.9&ndash;11.8',
-    '5.9&ndash;25.0',
-    '5.9(b)',
-    '5.9(c)',
-    '5.9(d)',
-    '5.9-inch',
-    '5.9.0',
-    '5.9.12',
-    '5.9.6.4',
-    '5.9.6.4imposing',
-    '5.9.9.1',
-    '5.9.9.2',
     '5.9.9.3',
-    '5.9.9.4',
-    '5.9.9.5',
-    '5.9.9.6',
-    '5.90',
-    '5.91',
-    '5.93p',
-    '5.94/1.65',
-    '5.95p',
-    '5.96.1',
-    '5.97p',
-    '5.9mm',
-    '5.9secs',
-    '5/008/11',
-    '5/1/87',
-    '5/10',
     '5/1000/year',
-    '5/101',
-    '5/175',
-    '5/18',
-    '5/182',
-    '5/190&amp;c/375&amp;f',
-    '5/20',
-    '5/209',
-    '5/256',
-    '5/270',
-    '5/3/2',
-    '5/3/41',
-    '5/399',
-    '5/40',
-    '5/45',
-    '5/466',
     '5/5/41',
-    '5/583,14/592,25/602,26/603,27/605,32/610',
-    '5/583,72/650,120/698',
-    '5/6,1982',
-    '5/6-th',
-    '5/60',
-    '5/600',
-    '5/601',
-    '5/64',
-    '5/68',
-    '5/69',
-    '5/6ths',
-    '5/8&ins',
-    '5/83',
-    '5/86',
-    '5/8in-thick',
     '5/9',
-    '5/9/7',
-    '5/91',
-    '5/bridge',
-    '5/day',
-    '5/first',
-    '5/in',
-    '5/kg',
-    '5/kg26',
-    '5/many',
-    '5/my',
-    '5/so',
-    '5/the',
-    '5/zg26',
-    '50%-50%',
-    '50%when',
     '50&aring',
-    '50&deg&ndash;76&deg;f',
-    '50&frac14&times;30&frac14&ins',
-    '50&mdash;1',
-    '50&mdash;100',
-    '50&mdash;2',
-    '50&mdash;60',
-    '50&mdash;80',
-    '50&mgr;mx50&mgr;m',
-    '50&micro;g',
-    '50&micro;g/ml',
-    '50&middot;8',
-    '50&ndash;1,000',
-    '50&ndash;100m',
-    '50&ndash;100mcg/kg',
-    '50&ndash;100mv',
     '50&ndash;12,000',
-    '50&ndash;120',
-    '50&ndash;13',
-    '50&ndash;130',
-    '50&ndash;14',
-    '50&ndash;1480',
-    '50&ndash;15.5&ndash;34.5',
-    '50&ndash;150,000',
-    '50&ndash;17.9',
-    '50&ndash;17163',
-    '50&ndash;2.8',
-    '50&ndash;2727',
-    '50&ndash;300',
-    '50&ndash;3000',
-    '50&ndash;300nm',
-    '50&ndash;500/l',
     '50&ndash;55,000',
-    '50&ndash;56',
-    '50&ndash;59.9',
-    '50&ndash;60&deg;f',
-    '50&ndash;60km',
-    '50&ndash;60p',
-    '50&ndash;60specmarks',
-    '50&ndash;64',
-    '50&ndash;70&deg',
-    '50&ndash;70&deg;f',
-    '50&ndash;75mph',
-    '50&ndash;82%',
-    '50&ndash;88',
-    '50&ndash;9',
-    '50&ndash;90%',
-    '50&ndash;plus',
     '50&ndash;strong',
-    '50&rehy;odd',
-    '50&sol;50',
-    '50&times',
-    '50&times;25mm',
-    '50&times;50mm',
-    '50\'',
-    '50\'n',
-    '50\'w',
-    '50,00,000&ndash;60,00,000',
-    '50,000&ndash;60,000',
-    '50,000&ndash;88,000',
-    '50,000,000-70,000,000',
-    '50,000-100,000',
-    '50,000-strong',
-    '50,000-word',
     '50,000kms',
-    '50,000lbs',
-    '50,000m.',
-    '50,000sq',
-    '50,001st',
-    '50,204,000',
-    '50,3000',
-    '50,311',
-    '50,320',
-    '50,400',
-    '50,407',
-    '50,486',
-    '50,500,000',
-    '50,622',
-    '50,653',
-    '50,692',
     '50,80',
-    '50,800,000',
-    '50,900',
-    '50,980',
-    '50-1,000',
-    '50-1,000/g',
-    '50-100&micro;g',
-    '50-200',
-    '50-4',
-    '50-5000',
-    '50-52',
-    '50-54',
-    '50-55',
-    '50-59.9',
-    '50-60mph',
-    '50-70kta',
     '50-70m',
-    '50-9',
-    '50-90,000',
-    '50-a-day',
-    '50-and',
-    '50-branch',
-    '50-c',
-    '50-cm',
-    '50-cm-wide',
-    '50-deg.',
-    '50-employee',
-    '50-feet',
-    '50-footers',
-    '50-forward',
-    '50-frigate',
-    '50-gun',
     '50-kilogramme',
-    '50-megawatt',
-    '50-metres',
-    '50-microwatt',
-    '50-mm',
-    '50-mm-thick',
-    '50-overs-a-side',
-    '50-overs-per-side',
-    '50-per-cent',
-    '50-pin',
-    '50-place',
-    '50-point',
-    '50-rouble',
-    '50-run',
-    '50-second',
-    '50-series',
     '50-share',
-    '50-state',
-    '50-test',
-    '50-times',
-    '50-tonne',
-    '50-user',
-    '50-watt',
-    '50-way',
-    '50-wicket',
-    '50-wickets-a-season',
-    '50-x',
-    '50-yards',
-    '50-year-long',
-    '50-year-olds',
-    '50-years-old',
-    '50.',
     '50.00%',
-    '50.000,00',
-    '50.05hz',
-    '50.06',
-    '50.11',
-    '50.19',
-    '50.2%',
-    '50.20',
-    '50.23',
-    '50.24',
-    '50.323a.',
-    '50.36',
-    '50.36sec',
-    '50.3p',
-    '50.43%',
-    '50.46',
     '50.50',
-    '50.56',
-    '50.57',
-    '50.6%',
-    '50.66',
-    '50.76',
-    '50.9%',
-    '50.95',
-    '50.96',
-    '50.98',
-    '50.9ins',
-    '50/',
-    '50/-in',
-    '50/1',
-    '50/1&mdash;9/23',
-    '50/100000',
     '50/192',
-    '50/374',
-    '50/40',
-    '50/52',
-    '50/60hz',
-    '50/635',
-    '50/66mhz',
-    '50/70',
-    '50/l',
-    '500&mgr;bar',
-    '500&mgr;l',
-    '500&mgr;v',
-    '500&micro;l',
-    '500&ndash;2,200',
-    '500&ndash;2000',
-    '500&ndash;520',
     '500&ndash;560',
-    '500&ndash;599',
-    '500&ndash;600-c',
-    '500&ndash;600mm',
-    '500&ndash;700g',
-    '500&ndash;700kg',
-    '500&ndash;750',
-    '500&ndash;800,000',
-    '500&times',
-    '500,000&ndash;1',
-    '500,000&ndash;600,000',
-    '500,000-1,000,000',
-    '500,000-tonne',
-    '500-',
-    '500-2,000',
-    '500-700',
     '500-800',
-    '500-acre',
-    '500-bedroom',
-    '500-character',
-    '500-feet',
-    '500-foot',
-    '500-gauge',
-    '500-horsepower',
-    '500-kw',
-    '500-litre',
-    '500-lorry',
-    '500-metre-long',
-    '500-mg',
-    '500-node',
-    '500-pounds',
-    '500-sheet',
     '500-space',
-    '500-stock',
-    '500-style',
-    '500-tps',
-    '500-trial',
-    '500-vehicle',
-    '500-watt',
-    '500.0',
-    '500.000',
-    '500.6',
-    '500/0',
-    '500/600',
-    '500/l',
-    '500/s',
-    '5000&deg;c',
-    '5000&ndash;10',
     '5000&ndash;10000',
-    '5000&ndash;8000',
-    '5000-',
-    '5000-metre',
-    '5000-series',
-    '5000-year',
-    '500000km',
-    '50007',
-    '50008',
-    '5000bf',
-    '5000gns',
-    '5000km',
-    '5000lbs',
-    '5000ppm',
-    '5000sq',
-    '50021',
     '50034',
-    '5004',
-    '50041',
-    '500741',
-    '50090',
-    '500919',
-    '500ad',
-    '500b',
-    '500cl',
-    '500du',
-    '500ff',
-    '500ff.',
-    '500g/1lb',
-    '500gm',
-    '500is',
-    '500kcals',
     '500kgs',
-    '500kph',
-    '500m-bits',
-    '500m2',
-    '500ma',
-    '500mbar',
-    '500mbps',
-    '500ml/18fl',
-    '500mms',
-    '500mph',
-    '500ms',
-    '500ngml',
-    '500ns',
-    '500pf',
-    '500pg',
-    '500ppm',
     '500psi',
-    '500quid',
-    '500se',
-    '500sec',
-    '500sel',
-    '500t',
-    '500watt',
-    '500x250mm',
-    '500yd',
-    '501\'s',
-    '501(c)',
-    '501,000',
-    '501,272',
-    '50116',
-    '50120',
-    '50121',
     '501212',
-    '5015',
-    '50190',
-    '50265',
-    '50272',
-    '5028714',
-    '502890',
-    '5029\'s',
-    '502b',
-    '502d',
-    '502nd',
-    '502pp',
-    '503&ndash;504',
-    '503&ndash;524',
-    '503,977',
-    '503-bp',
     '503-member',
-    '503-yard',
-    '503.8%',
-    '503/25',
-    '503034',
-    '50307495',
-    '50330',
-    '5035',
-    '50360',
-    '50370',
-    '503867/505124',
-    '5039',
-    '503p',
-    '504&ndash;5',
-    '504,000.',
-    '504,056',
     '504,142',
-    '504-646',
-    '504.4',
-    '5040',
-    '5041',
-    '50427',
-    '50440',
-    '504492',
-    '50450',
-    '504764',
-    '50480',
-    '504s',
-    '505%',
-    '505&ndash;510',
-    '505,024',
-    '505,500',
     '505.5hz',
-    '505196',
-    '5056',
-    '50570',
-    '505d',
-    '505p',
-    '506&ndash;507',
-    '506,000',
-    '506,900',
-    '506.3',
-    '5060',
-    '50600',
-    '5061',
-    '506733',
-    '506:540',
-    '506b&ndash;d',
     '506bc',
-    '506kg',
-    '506p',
-    '506s',
-    '507&ndash;510',
-    '507.2',
-    '507.7',
-    '507498',
-    '50761/52019',
-    '5078',
-    '507:541',
-    '507mm',
-    '507s',
-    '507x464x362mm',
-    '508%',
-    '508.43',
     '508.6',
-    '508.66',
-    '5081',
-    '5084',
-    '50870',
-    '5088',
-    '508dpi',
-    '508p',
-    '508s',
-    '508x356mm',
-    '5090',
-    '509220',
-    '50935',
-    '5096',
-    '50980',
-    '509c',
     '509p',
-    '50:16',
-    '50:24&ndash;25',
-    '50:30:20',
-    '50:4',
-    '50:4,5',
-    '50:48:2',
-    '50=50',
-    '50ah',
-    '50b(1)',
-    '50bc',
-    '50bhp',
-    '50bn',
-    '50bp',
-    '50bpm',
-    '50c(2)',
     '50cu',
-    '50db',
-    '50ft-high',
-    '50ft.',
-    '50ft/15.2m',
-    '50g/2oz/&amp',
-    '50g/2oz/&frac13',
-    '50g/2oz/1',
-    '50gflops',
-    '50gr/2oz',
-    '50gsm',
-    '50k&ohm',
-    '50kb',
-    '50kcal',
-    '50kg/t',
-    '50kgm',
     '50khz',
-    '50kjmol-1',
-    '50kts',
-    '50lbs',
-    '50m1',
-    '50ma',
-    '50mbps',
-    '50metre',
-    '50mg/100ml',
-    '50mg/ml',
-    '50mhz/25mhz',
-    '50mhz/35.6',
-    '50mma-',
-    '50myr',
-    '50nm',
-    '50no',
     '50o',
-    '50ohm',
-    '50p&mdash&pound;1.25',
-    '50pmol',
-    '50ps',
-    '50s&ndash;early',
-    '50s-',
-    '50seat',
-    '50sec',
-    '50sex',
-    '50sq',
-    '50strong',
-    '50va',
-    '50x25mm',
-    '50x50',
-    '50z',
     '51%-owned',
-    '51&amp;times76.2',
-    '51&deg',
-    '51&deg;c',
-    '51&ins&times;55.5&ins&times;52.5&ins',
-    '51&mgr;m',
-    '51&ndash;1',
-    '51&ndash;11836a/n8389h',
-    '51&ndash;14',
-    '51&ndash;14470',
-    '51&ndash;16622',
-    '51&ndash;25',
-    '51&ndash;4',
-    '51&ndash;53',
-    '51&ndash;54',
-    '51&ndash;55',
     '51&ndash;59',
-    '51&ndash;6',
-    '51&ndash;61',
-    '51&ndash;66',
-    '51&ndash;74',
-    '51&ndash;79',
-    '51&ndash;8',
-    '51&ndash;98',
-    '51&ndash;l',
-    '51&times;37&times;51cm',
-    '51(3.6)',
-    '51(5)',
-    '51(7)',
-    '51(9)',
-    '51,000-member',
-    '51,224',
     '51,250',
-    '51,390,000',
-    '51,449,000',
-    '51,52',
-    '51-35',
-    '51-4',
-    '51-49',
-    '51-56',
-    '51-6',
-    '51-country',
-    '51-foot',
-    '51-footer',
-    '51-hour',
-    '51-mile',
-    '51-minute',
-    '51-nation',
     '51-seat',
-    '51-unit',
-    '51-yearold',
-    '51.0',
-    '51.02',
-    '51.04',
-    '51.10',
-    '51.12',
-    '51.13',
-    '51.1secs',
-    '51.20',
-    '51.29',
-    '51.31',
-    '51.37',
-    '51.40',
-    '51.45',
     '51.50',
-    '51.53',
-    '51.6%',
-    '51.60',
-    '51.65',
-    '51.7%',
-    '51.7/1000',
-    '51.75',
-    '51.76',
-    '51.77',
-    '51.80',
-    '51.856',
-    '51.8kb',
-    '51.9%',
-    '51.9&ndash;95.7',
-    '51.90m.',
     '51.96',
-    '51/2',
-    '51/21',
-    '51/320',
-    '51/53',
-    '51/623',
-    '51/90',
-    '51/km&amp;sup2',
-    '510&ndash;11',
-    '510&ndash;15',
-    '510&ndash;19',
-    '510&ndash;550',
-    '510&ndash;600',
-    '510,976-token',
-    '5100/359',
-    '5100m',
     '5100s',
-    '5101',
-    '510160&ndash;2',
-    '51022',
-    '510230c-86',
-    '510294',
-    '5104',
-    '51054',
-    '5106',
-    '510740',
-    '5108',
-    '510823',
-    '51090',
-    '510c',
-    '510hp',
-    '510mb',
     '510mm',
-    '511&mdash;33',
-    '511&mdash;34',
-    '511&mdash;613',
-    '511&ndash;792',
-    '511.',
-    '511.1',
-    '511019c',
-    '51103',
-    '5110430',
-    '5110460',
-    '5110490',
-    '5111',
-    '511120',
-    '511125',
-    '511293',
     '51130',
-    '5115',
-    '5116',
-    '5117790b',
-    '5118',
-    '51180',
-    '51181',
-    '511894',
-    '511909',
-    '511c',
-    '512&ndash;2pme8',
-    '512&ndash;513',
-    '512,000',
-    '512-bedroom',
-    '512-byte',
-    '512/11',
     '512/l',
-    '5121',
-    '512121',
-    '512244',
-    '512266',
-    '5123',
-    '51240',
-    '512526',
-    '5127',
-    '512843',
-    '5129',
-    '512b',
-    '512kbps',
-    '512p',
-    '513,673',
-    '5131',
     '51317',
-    '51360',
-    '513625',
-    '513786',
-    '514&ndash;2',
-    '514&ndash;21',
-    '514,000',
-    '514.51.',
-    '514.61',
-    '51430',
-    '515&ndash;21',
-    '515&ndash;620w',
-    '515,000',
-    '515,700',
-    '515.81',
-    '51520',
     '5154',
-    '515495',
-    '5156',
-    '5157',
-    '51570',
-    '515ff.',
-    '515mb',
-    '515mm',
-    '515p',
-    '516,000',
-    '516,2000',
-    '516,400',
-    '516/l',
-    '5160',
-    '5161',
-    '5163',
     '5164',
-    '516477',
-    '51650',
-    '51671',
-    '5168',
-    '516b&ndash;g',
-    '516p',
-    '517&ndash;28',
-    '517&ndash;521',
-    '517,000',
-    '5170',
-    '517000',
-    '51720',
-    '51749',
-    '5175',
-    '517756',
     '5179&ndash;i',
-    '5179-i',
-    '5179-ii',
-    '517d&ndash;f',
-    '518%',
-    '518&ndash;527',
-    '518(1)',
-    '518,058.3',
-    '518-strong',
-    '518.2%',
-    '5184',
-    '518662',
-    '51880',
-    '518e&ndash;f',
-    '518ft',
-    '518th',
     '519&ndash;567',
-    '519.5',
-    '519166',
-    '51922/51562',
-    '519292',
-    '519902',
-    '51995',
-    '519c',
-    '51:11',
-    '51:55',
-    '51:56',
-    '51:9&ndash;11',
-    '51=',
-    '51c',
-    '51db',
-    '51in',
     '51lb',
-    '51s.',
-    '51sec',
-    '51xx',
-    '52&deg',
-    '52&deg&ndash;58&deg;f',
-    '52&deg;2\'n',
-    '52&frac12',
-    '52&mdash;3',
-    '52&mdash;8',
-    '52&ndash;12.5',
-    '52&ndash;17',
-    '52&ndash;1927',
-    '52&ndash;22',
-    '52&ndash;27',
-    '52&ndash;4',
     '52&ndash;5',
-    '52&ndash;5/54&ndash;7',
-    '52&ndash;51',
-    '52&ndash;55',
-    '52&ndash;55%',
-    '52&ndash;6',
-    '52&ndash;68',
-    '52&ndash;7',
-    '52&ndash;79',
-    '52&ndash;82',
-    '52&ndash;84&deg;10',
-    '52&ndash;87',
-    '52&ndash;88',
-    '52&percnt',
-    '52\'s',
-    '52(2)',
     '52(4)',
-    '52,109',
-    '52,200,000',
-    '52,219',
-    '52,600',
-    '52,994',
-    '52-0',
-    '52-3',
-    '52-36=24',
-    '52-6',
-    '52-page',
-    '52-place',
-    '52-strong',
-    '52-year',
-    '52.0',
-    '52.0%',
     '52.02',
-    '52.06',
-    '52.07',
-    '52.21',
-    '52.23',
-    '52.25s',
-    '52.29',
-    '52.2p',
-    '52.3%',
-    '52.324b.',
-    '52.3s',
-    '52.45',
-    '52.54',
-    '52.5p',
-    '52.64',
-    '52.65',
     '52.70',
-    '52.74',
-    '52.77',
-    '52/1000',
-    '52/305',
-    '52/630',
-    '52/69',
-    '520-537',
-    '520-acre',
-    '520-mile',
-    '520-yard',
-    '520044',
-    '52010',
-    '52017',
-    '520303',
-    '5208',
     '52085',
-    '520b&ndash;c',
-    '520b.',
-    '520c.',
-    '520d.',
-    '520e.',
+)
+
+blocks_92 = (
+    '#!h#$kbps")5&ndash;6#%(410)#$,640#%-foot$$page##.2%#"00$!3$!4$!7#%12-13$$3-14\'!5',
+    '$!5$$8-19#!2$$3-24$!5$$6-27$$9-30#%38-39#,4&ndash;3855$$0-41$$2-43$$3-44$$4-55$!6#"52',
+    '$$8-59#!6$!1$!2$!4%#-65#"70$$3-74$$4-75$$8-79%"50$!9#!8$$2-83$$3-84',
+    '#"96$!7$$8-99##mph""6%#$,071#$-389$"40$%class$(megabyte#!.$"4%$"57#&/17000$"25',
+    '#"03#!1#!2$!1$!6%#-27#!3$!0$$8-73#!4$!2$!6#%54-55$#8-9#%64-64',
+    '$!7#!7$$0-71$$3-74$$5-76#!8$!6$!9#%dx-20&%40mhz%!l%!s#$link##pp.#!s',
+    '$&sx/25c$$x/16&"33"+7&ndash;405*!8#$,386#$-413#!0$%2-703$+4&mdash;and$$5-06$$9-10#%11-13$!4#"23',
+    '$$5-26$$7-28$!8%#-29#%30-31$!5#%41-42$$2-43$!8#"52$!7#%62-63$!3$$8-69#%74-75',
+    '$$7-78#!8$!4#"94$$8-99#!d#\'ft-tall#"pp#"sx"+8&mdash;410$(ndash;92+!3##(1)#$,013#"-b',
+    '#!0$$2-03$#515$!s#%13-14$$6-17$!7$!8#"23$$6-27$$8-29#!3$$0-31$$3-34#!5',
+    '$#3-4$!8#!6$$0-61$$1-62$!2$!3$$4-65$$5-66$!7%#-68$!8%#-69$$9-70#%70-71',
+    '%#-72$$5-76$!9%#-80#%80-81$$2-83#!9$$8-99#!b#!p"*9&ndash;91+!2+!3#$,600##000',
+    '$!9#%18-19#!2$!0$$1-22$#2-3$$4-25#%32-33#"40$!4$!9#%57-58#"60$!6#%71-72',
+    '$$6-77$$7-78$!9#!8$$0-81$!3#"95%#-96$!8$\'9-39000#!b"":1$!f#"20##4,7',
+    '#!n"%cm/10"!d"!e""ff""hp#!z""in"!k#!g#!m#!w"!l""mb#!g',
+    '#&m-90mm#"yr"%p/min#!p"!r"!s#!.#!5##ecs"#xxx!\'9&deg;c#(mdash;41)"62#(ndash;18)"24',
+    ')(40&deg;c*!5*!6*!7*!9)"50*!9)!6*"7%)"72)!9*!7"#(5)"-,000-capacity##100',
+    '#\'200,000$"11$"31##302$"95##400$"17#+500,920,000%!2##630$"46$"51##760##832$"68',
+    '#"90$"88"!-#!0#"14#"22$!4#!3#"41#$copy#(delivery#&member)\'-strong%(tre-high#&nation',
+    '#$seat#$year\')&rehy;old"".0$!%$!0$!3$!4#"1%$!1$!5$!6$"pc#\'2&deg;c$!0',
+    '$!5$!p$#x10##3%.$!0$!2$#7in$!k#\'4&deg;c$!1$"2p$"3p$*50&mdash;1$!7$#ins',
+    '#"50$!2$!3#!6$"bn#"70$"7m#!9$!5"$/103$!1%!d$"25%!6$#3/1',
+    '$!1$!2#"dx")0&ndash;2*#459#$,401#&-based$$foot$)on-a-chip##000$$1-02$$5-06$!9$"lb#%12-13',
+    '$$7-18$!8%#-19$$9-20#%21-22$!2$$6-27$$9-30#%31-32$!2%#-33$!4$$6-37#!4$$4-45',
+    '&"50#!5$!1$!2$!5$$7for$$8-59#$6.25$!2$$7-68$!8%#-69#%71-72$!8#%80-82',
+    '$$4-85$!7$!8#"91%#-92$!2$!3$"99#!c#!f$+&ndash;391d##yds"%1,000$#442##.7%',
+    '$!l#!0$!0%!9$!6$$s-04#$1/92$$0-11$$1-12$$8-19#!2$!3$!6$$8-29$$9,44',
+    '$!4%#-35$!5$$6-37$!9#%40-41$!1$!2$$6-47#"50%#-51$$1-52$!2$$4-55#%61-62',
+    '$$7-68$$8-69#%70-71$!1$$4-76$$6-77$$7-78#%81-82$!2$!3$$6-87$!8$!9%#-90#!9',
+    '$$1-92$!2$!6$!9#!c#!p"*2&mdash;30$*ndash;1580*!3#"03#"11$$4-15#"20$"26$!3',
+    '$!4$!6#"44#"51#!6$"11$#668#!9#!e#!f##kgs##mm.#!p")3&ndash;4+"23',
+    '#$,615##.4%##020#!2$!3#!7#"80$!4#$a(b)"+4&ndash;424##.25#"17#!2##325#!4',
+    '")5&ndash;6#"/l#!1#)2&mdash;5$!0#!4$!0$"lb#"70#!9#!k#"mm$"ph"+6&ndash;397*!7',
+    '$#785#".6#$/397#!0#"10#!6#!c$(&ndash;e"+7&ndash;227*$4440+"65#$,073#"66##951#!c',
+    '#%(54e)#$.881#"04#!1#"22#*4&sol;7429$#143#"80#!9$!0#"nm#"p."(9,184.46#+.000.000,00$"2m',
+    '%!6%!9$!0$!s#"10#"30#"64#"70#"80#"th"":1#*9&ndash;10"$_per"!b""lb',
+    '"!m#!m"$secs")years-old!&:00:56#!3#$7:18#$8:14")1&ndash;4#",3$*5&ndash;16#*3&ndash;16$!f#*4&ndash;16+"20',
+    '#*6&ndash;21$!f#*7&ndash;18#"ff"(2,3,5,14#*0&ndash;30+!4$"pm##1f.#*3&ndash;26+#4:7#!7##8ff#":1#!f',
+    '#!0#$4.73#!6#":1"*4&ndash;11*!7##0.7#!5$#.82#!7#!9"%50.70$"am#$2.47#!3',
+    '##7.0#!8"#7ff"*8&ndash;15"*9&ndash;20##,10".diagram/figure"(payments"!s!"=1#"00"#all"%blood"(discrete"%gross',
+    '".incapacitating$*terlobular"$mild##ore"\'urgency!$a(a)#"b)#"f)#"i)$"i)""-e#.hydroxysteroid"!.#$true"&bility',
+    '""e."!f"!g"!i"!j"!q"!r"!u"$will"!x!$b(1)""2s"!d"!h"!j',
+    '#!.""rs"!s"!t"!u"!x!$c(6)"!8""m."#omm"!s!*d&rehy;aav"*-searching$%quare""10',
+    '"!d"!e"!g"!j"!p#!."!q"%scale"%uring"!w"!y"!z!"e1"!2"!6',
+    '"!q"!t!"fb"!d"!g"!l#"oz"&t-long#!.!"g1#"10$!4"!2""8."!g',
+    '!"h."!9"!b#!-"!e""fm"!g"!j"!n#!."$ours"!q"!t"!v!(i-backed',
+    '"&n-long#"ch!"jd"!f"!g"!h"!n"!u!"k4""ev"&g/s/ha#!s"&m/2mls"3pc&mdash;consistent!"le',
+    '"!p"$smoy"!w!*m&amp;sup2"\'-strong#*transistor"!."%/10ft""ev""il#&n23-28$!s"$v/cm"!w""yr',
+    '"!b"!d""et"!j"!m"!u"!z!#o-1##odd""ft"!m"#okg#(o-14oobc!$p.m.#%p.t.v',
+    '"!a"!f"%m-5pm"\'ortions""pm"!q"!s"!u!#q21""93"!b"!e"!g"!h"!r',
+    '!#r/2"!b",d&ndash;12th*#5th*#6th*#9th#%-19th$*century-bc$$year""ip"!r!#s9d"#ecs"!i"$pace',
+    '#!s""he##ree"!q""sp"!w!"ud"!e"!y"!z!,v14&ndash;21"+26&ndash;29"#ely!%w/mac"!k',
+    '$$1103"$ould""q.!\'x10evcm#"in"%20min"!3"%6inch""74""80"!b"!u!!y"!b"!g',
+    '"!z %4%-8%!-&agr;-phorbol#)mp;frac12&#i/2#"st"+deg;-25&deg&"c.\'(/ambient")egrave;me".frac12&ft;deep)\'mdash;8)(ndash;11)+times;7&ins("/4',
+    '(&;-foot*%litre*(year-old2!s)!d)$feet)"jd)"kg)!l*!b)!m\'%4&ins&&34&ins&"47##t;6',
+    '%!7%,8&frac12&ins%$long"-half;x7inches"*ins;-6&ins&!."%mdash\'#;10("30("to#&icro;s$&ddot;0)!5",ndash&frac12\'+;-7&ndash;0',
+    ')#3.5(,1&ndash;18830!30)7&ndash;50!8)*-4&ndash;1))0&ndash;8*%/1000)"2%*)&ndash;121!8)"3%))4&ndash;0*"th))5&ndash;0',
+    '*!9)#865()2&ndash;2)!0)!3)!5)!6)!7*!%*!8)!8*!%(*3&ndash;10)$/4in)#0pm',
+    '*!6)!2)"30)!5*!4)#6.6)!8*".8)#9.0+!1((4&frac12**ndash;19000+6&ndash;0\'s)".5+!m',
+    '*".4)!1)"5%(%5&ins*(ndash;100!6)!.)!2)!5)!8)#cms*"wt)"ft)"in)"km',
+    ')*&ndash;2\'s12+2&ndash;6&ndash;4)!1)":7)"ft("71*"\'s)!8)"th()8&ndash;00$18640!40!8)#ins)+mcg/kg/hour',
+    ')!5($caps)"ep)$home(#epb"#pgr#%lus;2#-rime;18&prime((20&prime)\'5&prime)\'8&prime((43&prime",shilling;11d,!d+!6',
+    '("90"%times\'#;10)!5(!2)!0(!3(,5&frac34&ins!#\',6$9-diamidino-2-phenylindole""05""33!"()"(9)&mdash"$a)rf',
+    '""i)""m)!"**"%2*1*3!"+2"\'pockets!",0#%00&ft&+ndash;2,000-%5,000,\'5,000kg%\'-16,000&%6,000&(customer&%metre',
+    '&#odd&$room&$seat\'(ignature\'&tudent&#ton%#.00%!g&!n\'!s%"km%!m&!m%#rpm%"sq',
+    '$%1,353#"12$!3$!5#"24$!6$!8#"32#&40,000$%2,000$!9#"50#"62$!8#"80',
+    '$!5#"91$!5$#6:1"%10(a)$%0,000%\'-strong$!6#$20ft$!3$!5#"31%$,000#"40$!8',
+    '#"60$!6#"74#&90,000$!3$!4$!5$#8ft"!2#*00,000,000%"ft%#gns%!m$%2,000#"12',
+    '$!6$!9#"21#"30$!6$!7%"hz#"44$#7th#"52$!8%$,000#"60$!5%"ft',
+    '#&75,000$!8#"83$!8"#3,6##00m$!4#"10$!5$!8#&20,000#"32%$,000$!4$%7,487',
+    '$!9#"43$!6#"55#"60#"71$!3#"87$!9#&90,200$!3$!4$%5,000"L4\'-diisothiocyanatostilbene-2,2\'-disulphonic%Btetra-methyldiaminodiphenylmethane',
+    '$%0,000%%-acre%#gns%"kg$!1#"19#"20$!9#&30,000$!2$%7,364#"42$%4,000$#6kg#"50',
+    '#"60$!2$!3$!5$!7#"72#"82$!7",5,7&ndash;10##00%%%-mile)$lion&(year-old%"cc%"km',
+    '%#tyr$!4$!5#&14,000#&22,463$!6#"32$!8#$47.4#"50$!3$%8,000#"72$%4,048#"83',
+    '$!7$!9#&92,000$%3,000"$6,19$!8#)00-strong$!1$!3#"11$!3#"20#"30%"ft$!1',
+    '$!6$!7#"53$!6$$7.80#%77.40#"83$!8#"90"07,10,11,12,13,15$"25#$00kg%!m#"18$!9',
+    '$!7$$9.39#"37#&48,145#"63$!8#"70%$,000$!4#"81$!2$!5"!8#\'00-yard%,bps/2,400bps',
+    '$!2$!8$!9#"11$%2,000$!4$!7#&22,000$!5$!7$!8#"35$!7#"45#"50',
+    '$!5$!6$!7#"92%$,242$!4$%6,200"\'900,000&#675%"kg#"10$!6$!7#&21,000$!3',
+    '$!8#"36#"40$!8$!9#&50,000$!3$!9#&60,000#&72,338#"86#"90!)-&agr;tpa"&0-26-0""11',
+    '#!3$!4#!5$!9#!6"42-3-3-4-4-3-5-5-(33)$!4#"10#!2#!4#!5#!7"#3-3$24-3-5-3-2-4-5-(33)"$4-0s',
+    '$"93""5%#$,000#"-1$!5$!6$"93#"00#"pm"$6-0s#!6"$8-4t""90"\'a-clock#6minobenzoic/phosphoric',
+    '(\'yridine\'*quinolines##rch"&bedded#%inary$$rdie$@s(3-methyl-2-butenyloxy)chalcone#\'ranched##yte""cd##ell$!p%!s#%hloro##igs',
+    '$&rnered"+dimensional$%sease##oor#%rawer""er#-thenylheptane"$haps#!p#)umberside#?ydroxy-5-iodo-3-nitrophenacetyl"!i#"mg#(nch-high#$rons',
+    '"/lb/&pound;12.50#"eg$$tter$#vel##ine%%kages"%match#%edway$$e-ta$$mber$/thacryloxyethyl&"yl#!m#(onth-old""nz',
+    '##ver#"z."$pack$"rt#%erson##lus#&ointer$"le$%under\'!s#(rocessor"$reps"&series#%heets#&peaker',
+    '#%tereo(&-input$&randed%$ings%#oke#"ub%!s#\'yllable"!t#\'housand##o-3$!o#$uple")under-par#!p',
+    '#%olume"$ways#&heeled("rs##ood##rap"-year&rehy;old!(.0&aring$+ndash;4.4kb*#5.0,!5,!8#"\'s#&-litre#".0',
+    '$!4#%/1000#.0&ndash;5.00pm$%/4.30$!p#"1%##2kg#!3#"5%#"7%#"bn#$kcal#!m#!s"\'1&deg;c',
+    '+!6*"26##.13$#2.1##0.0%!1%!8&!8$!8$"am$"pm#$1(7)%"c)$".9&!3',
+    '#$3(a)$".1%!2%!6#*4&ndash;15$#(4)$#.17$!p#*5&ndash;16$#(a)%"c)$!2$#p.m#$6(c)%"d)',
+    '$\'countss#,8&ndash;4.24$!4#*9&ndash;24$#(b)%"c)#"in%*troduction##pcm#$secs"+2&ndash;4.7*#5.2,!7#$(14)$"a)',
+    '#(-cm-high#!.$#1.3%!0&$(ii)$\'2,4.2.3#"03#$1(a)%"b)%"c)#"2%$)&ndash;24$"ff##3cm%&ountss',
+    '+$5.5m$!m#$7.36$"ff#$8.13#"9c#!c#"ff#"in#"km#"ms#%p.the$!c#,relationship##sec',
+    '$"d)#&-based#2.5.3.5.4.3.4.5(36)$!7$!8$!9#,0&ndash;5.45+$6.30$%-6.30$$a.m.$#pm.#"1p#"25#"4%$!p',
+    '%!4$!m$!p#"65$"am#$7.34$!5$"in$"pm#$8ish#":1#!a##bsd&+-compatible##ftl',
+    '"%4&deg$#ins$(ndash;16*"75*$9.8%##(i)##.10%!1%!2%!3%!7$!8$!9%!0#"1%',
+    '*%;5.45$"am$"in$!l#!6##7am#"83$#sec#!9$!%#":1#!f##ghz#\'lbs/2kg##m/s',
+    '#"oz"\'5&aring$(ndash;15*%26.3%*!5*36.5kg/10&ndash;14lb+!m$(times;10#!*#"-6$#ton\'"ne#!.$!0$#1.1',
+    '&!2$!6$!7$!8%!4#"00#$10/l$!p#!4#!6$!%##7.4$!p#"9%#":1',
+    '$!u#!d#"jy#!k$&g/10lb$\'m/24mls$!w#\'million"\'6&aring$)ndash;14%*#8.7#".5$!6$"91#!0',
+    '#+5&ndash;6.7$!p#"69##875$"pc#$9x10#!a#!b#!c#!p"*7&ndash;42#&-litre#".4$"58$!8',
+    '$+&ndash;2.10#!3#74&ndash;2.15&ndash;2.67-"74$!0#"5%$"bn$!p#"6p#$7mhz$!p#!8$*&ndash;97.#"9p#"bn',
+    '#"kg$!m#%litre#"mb"\'8&aring$#ins$5ndash;10.8&times;10/l*$4.10-!2##(a)$"b)$"c)$"d)$"e)#$-5.2',
+    '$"km#".0#$/min#!0#!2$,&ndash;10.56$"84$!m$!p#\'3&mgr;m#"44#!5#,6&ndash;2.67$$.379#"8m',
+    '""9.$!4$!5$!6$!7#!1#!5$".1&*9&mdash;22$"95#!6$(&ndash;1+$2.15$+.46&mdash;7#"7p',
+    '$!%#"96$!7$!8%!7$!9#!b#!f#\'oz/140g#!p#\'seconds""x.!"/-"!1#!+',
+    '$#/76#)1/18/25th#$2/86$!7$!9#$4:18#!5#!6$$mbps#"76#!8$10&deg;c/350&deg;f$!1$!3$!8',
+    '"$2/87%!9#"08#!5$!c#!6#"87"#3/3#!1#$34/8$!s#!6"(4&frac12*#;d.##/87',
+    '#!8$!5"*5&ndash;11#"06$!d#"79#!8$!2#"in""66$!d#!w"!7##/86#!9',
+    '#!5""cx"#dry""kg")northcote$!w"$st.g"#tim"#vdc!&0%-50%$!a$#ish"\'&deg;60\'&c-1min$%ollar',
+    '#\'mdash;2)"41*"5p)$50km)"60$$gr;g(&&mgr;l\'!l\'!v$&icro;m%&ddot;8#\'ndash;0)#105*"20*#310',
+    '*"70)#249*#857)"48+!%*!9)\'50,000.+#ppm*!6)*60&deg;ckm+$,000*!5)"75))8&ndash;0*$0myr',
+    '*!0#)rehy;year"!\'#&s-look#!w"%(14%)#"4)""+3"#,00%.0&ndash;60,000&+,000-strong*#ecu&\'-50,000\'(capacity\'$plus',
+    '%!2$"55##178$"87$"94##231##300##400$!1$&51,732#,50,60,90,120$"58$"91%!8##600',
+    '##700$"52##808$&60,000##900$"31$"42$"60"#-15$!6#"24%#-36#"38%&-44ins##50%',
+    ')$,000#"80#%a-day$"nd##bed&$room#!c$#ent$!m$"ow#\'day-old#$feet$(oot-high\'"er#$goal',
+    '#"kd$!g$!m%&/25-ml#$lamp$%ength$$imit$#ove##man$)etre-high$(illigram()on-dollar+(year-old%!n$#ton',
+    '#%ounce$#ver#(per-cent$$lace%#eat%%users#$seat%#rum$%quare#%to-44$$rack#$week$#ord#&yarder$(ears-old',
+    '%!0$$1sec$!5$!7$#x10#;1&ndash;11&ndash;90&ndash;4$!1$!4$!7$!p#"21$!4$!8$!9$!p',
+    '$#0m.$!1$)4&ndash;8%"m.$!6##458$!6$!7#$5.56$!1$!2$!5$!6#(6&deg;c.%*times;30.5',
+    '$#304%"2s$!8$"cm#"74#"82#%90sec"$/115&%(35%)#"60##792#"97"%0&deg$"ft$\'mdash;2',
+    '$(ndash;24*#350*#425+#50g-"kg+$75kg+"99*\'500,000-!k*#600-!m*#900+#9gm*$year#2,000&ndash;500,000',
+    '\'$-odd(&strong\'+18-year-old\'"ft$,600,800,1000#)-&mgr;gal$#450$#600\')-megawatt$#bed\'$room$\'element$#lap$$mesh%/illion-year-old',
+    '$&series%%quare*%-yard$$word$$yard##.80##/43$!8$!s$"xe#$0&ft%*ndash;1500+#200+$4500+"60',
+    '$!-%*compatible$%/200s$#000$"bc%"hp%!p$#ers$"hz$"km$"lb$!s%!q#"10%!0',
+    '#"27#!3$"/s$!4$!5##417$"78##651#!8#"92$!8#!a#"bc$"hp$!p',
+    '##ers#!f#$g/14\'"ox$$flop("s.$!t#"k+$!b$$cals$"hz$!j$"m/$"wh#2m-bytes-per-second',
+    '$%bytes$%etres$!g$&illion$$l/14$"m.##ppm#"rb#$x400")1&ndash;2*#540#$,000#"10$!8##222',
+    '##3\'s##525#"70$"60##830#"9e##pp."\'2-476ad#$/404#"1a#"20#$3099#!4#!5$"09',
+    '$#174#!m""3%#*&ndash;404#".1%#mph#%/0522\'!3#!0#!2$!0$&601209#"40#"55#"60',
+    '")4&ndash;3#(36/40060$"87#!4$!2#"64$!b#!7#!8#$:253#!p#!s"*5&mdash;12$\'ndash;7#$,500',
+    '#".5#!2$!h#*7&mdash;66#!9#"kg#!p##sri#"th")6&mdash;8$)ndash;407+"11*!7#$,000$#211',
+    '$"65#!0#"39#(4/89/eec$!6$"mm#!6$!0#!f#"mm#!p"%7,222$#900\'$,000#$-423',
+    '##139#!2#"47#"57$!9#"70#!a"*8&ndash;12*!9#$,000$#200#!.$"25#!2$!0',
+    '#!5#$7/88$!2#!b$"hp$!n$"ph#"g.#!k"*9&ndash;15*"24#$,660#!0$!8#!1',
+    '#"27#!3#!4#%6-bit$&40-bit#"70#!p$!p"$:100$$6ff.#"28#"34%)&ndash;38$!5$!6',
+    '#)6&ndash;8$!0#!7""a.#"/h""bn"#cms#!u""d.##ate"!e"#ghz#"ph""ha##our',
+    '"#ish""kb$"ps#"hz#!w$!h"&m&sup2#!3#!g#-l/1&frac12;fl#"pg#!s"!o"(p.p.t.v.#&c-plus',
+    '#!f"\'s-style#(/50s/60s#"q."!v"!x#&22&ins$#7.9#$30.5$%6&ins"%yards!%1&deg&";f\'!s#&frac12',
+    '#+ndash;13251*!4*!6*$9511)"33)!4*!5+!f*!6*!7)!5*!0*!1*!2*!4',
+    ')"67)!9"%(16%)#"4)#"5)"#+16"$,200&$,000$"47$"50$!7$"99##300##400%!1',
+    '%),43,44,45$"40$"84##670##700&$,000##800##900"#-17#(39-extra#"42$!4#%a-rob#!n$%ation',
+    '$$oint#$ship$%trong#$unit"-.0&ndash;89.4#!1$&&deg;c%*ndash;64.4$!3$!7#,2&ndash;64.0$!0$"5%%!6$!7',
+    '$+&ndash;65.0$".2$$12a.$!3$!8$"kg$!m##472$!8#*5&ndash;87$!2$!8#"60$!1$!3',
+    '$!7##8bn$"kg$!m$$secs#"90$!9$!p""/1#!2$(&ndash;6$!4%(&ndash;3##435#"95',
+    '$)ndash;490$*times;10/l#$,713$#928#%-yard##.2m#"00%!0$"44#!1#!2#"33##406$"14#!5',
+    '$!0#"80#!g#$x533"%1,000$#378$#516$#900##000#!1#!2#"30##500%!6#!7',
+    '#!9#"bp#"ff#!m"+2&ndash;413#$,579##.40$"9%##000#"22#!4##551#!8$"31#!9',
+    '#!p",3&mdash;9000$(ndash;14+!6*"27*#399#$,337#".5#"/2#!2##344$"66#!4$"16#!5',
+    '##869"*4&ndash;16+!9*#810#(,000,000$#825#%-yard#".3#"10$"91#"2m#"50#"70#!9#)b&ndash;c',
+    '##424#)6&mdash;7#"86#!c#!d#)e&ndash;f#$iops#"kg")6&ndash;0*"57#$,300$#882#!.$!3$"7%',
+    '#!2#!3$!0#,5&ndash;4864#"60#"7m#!8$"80#)a&ndash;b#"th"*7&ndash;19*"36#$,000$#300%"14',
+    '#"08#!1#!4$*/4175/4182$"17##777#!8#"90#!b#!p"*8&ndash;22*#417#$,000$#403#!.',
+    '#!1#!2#!3##739##875$"88#)a&ndash;c#"kg#&metres#!r"*9&ndash;21#..2&ndash;543.1#"20##842#+9&mdash;209',
+    '#"p."#:10$!4$!9#"38#+56&ndash;57"$_per""a.""cm"!f##-45"!h#\'8004855&$9579"#ins',
+    '#!m""lb"!m#"hz"#pts"(q7003657!,2&amp&frac12#"ft#\'mdash;4)"92#(ndash;10+$6918+#877.!3*"20',
+    '*!7)%22614*$9643)%31983)"41*!5*!6*!7)!5*!3)%60817*,8864/nx163rp*$9654)"73)!8',
+    ')!9*!0*$2320#-rehy;year-old"#\'00#!s"#(3)")+36+41+45"(,000-ton$"28##200#"43##506$"20$&50,000',
+    '$"95#\'703,019##820"#-15$!6#"44$!6#!7#$arch#&clause$$ount("ry#$foot#&gallon##man',
+    '$%ember#+over-a-side#&strong##ton#$yard"-.0&ndash;80.0$!2$#639$!7$!8##12%$!3$#679$"95#"2%',
+    '$"pc#"33$!4$!7$"bn#"4%$!4$#582$!8#"50$!3$!5$!m$"pc#"6%',
+    '$#7mm#,7&ndash;56.9$!5##8mb#"91"!/#"02#$1000$#992##215#"63#"84"+0&ndash;390*#440*#589',
+    '$#100%"27$#500#"00%!m$"66$"88$$b.c.$"ft#!2$"02#"50$"17#!6$"50',
+    '#!8##gsi#"hp#"in#"kg#"m.$(/1,378ft$\'mx297mm#"th"%1,000$#775#"00$!6#"50#+6&ndash;010',
+    '#)d&ndash;f#!h"%2,000$\'500,000#".5#!0#"10$!8#!2$!4$"88#!3$!0#!4$"23',
+    '#"60$"99#&7/4229#!8$!6#!9#!a#!s"*3&ndash;42,!4#%/1115#"13#!2#$3.4m##486',
+    '##740#"rd")4&ndash;5#$,000$#124#"/3#!2$"09$"72#!4$!0#"95##pp.#"th""5%',
+    '$*ndash;1244*#818##(1)#(,000,000#\'-member%%inute#".8#,2&ndash;5315#$3/88##501#"70#*f/220c/gas#!p"$6(1)&$-(3)',
+    '$"4)#%/1326##044##2.0##485#!7$!0##801#!9"*7&ndash;31+"47*"41#".1#!1#!4',
+    '#$5181#!6$!5%"\'s$"97##700##830#!9#!k")8&ndash;9#$,000$#712##.58##370#!4',
+    '$"28#"90$!9"+9&ndash;347#%-2900$$3636#\'.937mph#!1##4ft#"78##869#"90#!f$!t#!h',
+    '"#:13#+21&ndash;22#!3"!a#!."$km/h""mb#"pg""no"#pts""s.#"ec"!x!,3&commat;1/2#\'deg;7\'w',
+    '##ins#(mdash;47)!7#\'ndash;1*"03*"15+#728*!2)%21709*$2197*!5*$9854)!3)%48541)!5',
+    ')!6*!7)"77)!9#&plus;1#(times;10"$()23##1a)#"4)#"a)"(,000,000&\'-strong$"75$"93##200',
+    '##533$"56##600%!1$"59$"68$"97#\'728,375$"47$"50##801##911$"81%!4""-0',
+    '##day#$foot#(over-par#%point$$upil#+square-mile#)years-old"#.0%$!3$!4#"12$!3$"4s$!6$!9',
+    '$!3$!6$"9%%#sec$"gb#%314b.$"in$"mm##4.1$!6$(p-a-mile#"50$!6$!7$"cm',
+    '#"61##75%%"mm#"8m#"90$!8"$/120%!3%!8$"77$"85$"96##212$"32#"33',
+    '%!7#"53$!5#"75$!6##802$!3""0%#(&ndash;1*$2640*"40#(,000,000#\'-member%"hz$%tonne',
+    '#!.$&015mph##000%!3$!s#&120kyr$,7&ndash;0702##327#!4$!0#"50#"60#!7#!8$"08',
+    '#!9$"05##bhp#!d#!f#!m$!m#"nm#"va")1&mdash;2$%ndash)";2*#421#$,000#\'-strong',
+    '##102$"55$\'9+43065##212#!4#!5$!6#!6$!0#"70#"93#)c&ndash;e",2&ndash;0292*"40#$,000',
+    '##034#"10$"32##464#!5#"60#"70#$:459#!g#!p#!s"*3&mdash;50$(ndash;46,!0#$,440',
+    '#"/2$#me0#!1#!3#!5$"53##978%!9#"dx#!f#\'million"+4&ndash;435*!5*!6##(5)',
+    '$#924#!.#"/3#!0##110##313$"70#"40$!3#"60#!a#!b#!c#"mb"+5&ndash;436',
+    ',!4#!\'#$(11)$"6)#$,000#\'-member#!.##/78#"02$!m#!3$!0#!5#!6#&765818',
+    '#"th"%6,000$#973#$/798#"06$"78#!3$"35#!4$!0""7%#$,000#!0#"10#"30',
+    '#$8658#)a&ndash;b"*8&ndash;42+"34#$,990#&-point##100#!8#!a"*9&ndash;41#$,000#!1#"24#!3#!4',
+    '#!5#!7##831"#:14#"32""a.$$314.#!d"&b.314.#\'c-ad118"!c"&gm/sq.""kg$%/s/ha#!m',
+    '#!w"$mins"#pts"#sec"\'x31&ins!%4&deg&-&plusmn;5&deg$%ollar#&frac12)$&ins$!t#\'mdash;5#)ndash;001)$100%*"13',
+    '*$2656)"38)%41747*\'5&deg;s*#8kg)"67)"70*!1*!3)!8*!4)!9*"4%#-rehy;year-old"!\'',
+    '#"b)"$,068$"80##100$"37$"42$"69##294##342#\'400,000$"44%!8$"77##600$!2',
+    '$!9##700##969"#-20#"46#$foot#&gallon$"un#$hour#!l#%match##pin$%oints%%under#&seater',
+    '$%trong#%times#&volume"#.0%$"4s$$9sec#"15%!f%!p#"28#"3%$$16a.$!4$!m#\'416.6gm',
+    '#"6m#!8#"95"$/105%!6$"12%!5%!6%!7%!9$"40%!1$"93%!5##202',
+    '%!7%!a$!2%!4%!6%!8$"36$"40$!9##302%!6%!8%!9$"12$!9',
+    '##406$"10$!2$!4$!5$!7#"81$!8"(0&deg;f.$%mgr;m$\'ndash;5+"70*"80#"\'s#%-acre',
+    '$"m4$$page##/39$#625#+0&ndash;450$"00%!t$#gns$#rpm$!s#!2#!5$"52#!6##964',
+    '#!g#"ha#"kg#"lb#"nm#!y"*1&ndash;11##(2)#$,515#$/457##122##200#!4#!6$$5,44',
+    '#"cm")2&ndash;4+"38##.8m##000#!1#!9")3&ndash;1#$,000#"-4$)kilometre$$yard#!.#"13#!5',
+    '#$,825##.73#\'/553030##059#!1$"36$#6.0#"20$"42$"98##308##408$"77##516$!5',
+    '#)g&ndash;h##lbs#!p"*5&ndash;61*!7#\'-person#!.#"/4##326#!4##555#!6$"57#"77#!8',
+    '#!e#"ha#%kcals#"mm#"th",6&ndash;4666*!9#!0$"34##328##557#!d#)e&ndash;g$!.")7&ndash;5',
+    '$#933#$-pin#".6#"00##2\'s#"60#"79#"kg#!m"+8&ndash;451*"50*!9#$,000$#500$#922',
+    '#!2$!9#"50#!8$!0"*9&ndash;50+!2*$6600#$,350$#964##.5%#!0$!0$"66#"13',
+    '##733#"81#!9$!0"$:0.8#"13#!2#!8"!c"-dec8009.111.8"!e""ff""gb""ha""km',
+    '#\'m-thick"#p/4")th-minute!,5&amp;degree\'(shilling#-deg;c/ambient\'!f\'!n#(ft;8&ins#)mdash;55p)!6*!4#\'ndash;0*$5688)!1',
+    '+#9kg*32&ndash;118&ndash;4*!6)"26)"30)"46*!8*!9)$50ft*!1*&4-year*$7300)$60cm+"ml*!9',
+    '*!4)!9*!2#)rehy;year#(shilling$%ol;54#5times;55cm&times;40mm""\'n#!s"#(c)"#,00%(0-member\'&seater(%trong#$1()0',
+    '%!6$"59$"69##268$"86##300$&50,000$"61##400#\'552,041##625$"80##759$"62##840',
+    '#!1$!0#"47#"50$!4$!5#"60#!7#$acre$#kce##bit#"cm#&gallon#"kg#*metre-deep',
+    '$&op-804##run#%truck#$vote"#.02$"3p#-1&ndash;124.6$!6#&26secs$#mpg#&3,45.2$!p#*4&ndash;11$!4#"56',
+    '#%60sec$!5##720$!5$!7$!m##8.8$!5$!7#"91$!5"#/12$"39$"46%!9',
+    '%!4%!6%!7%!9$"60%!1$"70%!2%!4%!8%!9$"93%!8#"21%!1',
+    '%!4$"23%!4%!6%!7%!8%!9$"30%!1%!2%!3%!6$"55#!3$"06',
+    '%!8$"11%!9#"45$!9#"51$!3$!4$!7$!8#!6$!2$!3$!8$!9',
+    '$!4$!9#"94$#771""0%#$&deg%\'ollar;c$\'ndash;1*$2440*$675g*#720*0900g/1&ndash;2lb#"\'s#(,000,000\'"sq',
+    '#%-acre$"bp$"kg$(megawatt&$tres%#ile(%-long$&strong$$volt$%yards%#ear#\'.835mph##/40#(0-person$!5',
+    '$"km$!m#!1$"23#!2#!5#"60#"70$"80##841#!9#*f/230c/gas$!t#&g/1-lb&$lb/2',
+    '#"mg$)l/&frac14#!p$!c$"p.%!m#"sq")1&ndash;3*!6*$8801#!0$!4$!6#"23#!3',
+    '##781#!8##958#!m")2&ndash;3##.1m#"/l#!0$"22$"71#!2$,2&ndash;1800##373##481#!5',
+    '#"60$"92#"83#!9##mph#"nd"+3&ndash;455*!5#\'-member##.00#"/2#!0#"39#!4#!5',
+    '#"70#!p"*4&ndash;63#$,000\'#kg/$#900#"-1$#471$&member##.53#!0#!1$!0$!1#!2',
+    '$"44##522#$7665#"91"*5&ndash;74#$,500$#633#%-8281$$yard#".5#$/704#"30#"50%!5##725',
+    '$"77##bhp#"kg"+6&ndash;457#$,000#".7%"89#$0/xe#!1#"20$"20#"50#!9#!b#"mw',
+    '$)ndash;458#!0#!1$!6#"30#"52$!3$!4$!5$!6$!7$!8$!9#"60$!1',
+    '#!m$!m$!w#"th"*8&ndash;60#$,300$#730$#818#"/l##065##496%!7#"5m#!7$"42',
+    '#!p"$9(g)#$,621##351#!4$"61##707#$8300#)a&ndash;d#"nm"":1$!0$!8#!4##5ff',
+    '""bc#"hp"\'cm-high$!/$!s"!d"#gal""in""kd#"ph#!v"#mgp""no"+p&ndash;49p#\'/minute',
+    '#!p$!m")th-minute!(6%-owned"$&deg#(frac12;p##ins#(mdash;48)!7#\'ndash;0)#101*"20*!4)$2005)"48',
+    '*!2*!6+"cm-,/18&ndash;22)"65*!9)!8*(&ndash;0)!9#&percnt"#(1)#"3)#"4)#"7)""+2',
+    '$"52$"71##114$&44,000$"82##256$"69##300##498#\'500,000$"28$"45##652##700##800',
+    '##935$"76"!-#"12$!3$!8#"37#$acre#&minute#(six-year#%times"#.07#!1$$39r.$!5',
+    '$!m#"2%#"3%$$19a.$&5268km$#6pc$#mpg#"43$"5.$%6secs#&55secs$!m$"pc#"75$!8',
+    '#"99"$/010%!8$"53$"77##115#"47")0&formula$%ndash)%;3100+"70*#700#$,884##-km$%metre',
+    '$"60$"75##055$!9$#rpm$!s#!2##300$"39#!6$!0$"66#"80#!9#"ft',
+    '$(&ndash;h#!k$!m%!s#!m")1&mdash;5#$,100$#250#!1$"11$"31#"43#"51$"20$!6',
+    '#)a&ndash;c#!p""2%#*&ndash;452#!\'#$,000%"60#".5#"02#!1$!0#"29#!5##660#!b',
+    '#!p"$3.6%##231$"83##344$$51-1##418$"37#!5#"70##971",4&ndash;8718$+times;524mm#"10#"56',
+    '#"75##900#"bp#!k$!g#!m$!m#"xx"35&ndash;23&ndash;11*#455+"60,!6*#511#$,000#$-day',
+    '$"00$"23$"71$"84$"mm##152#!4#!5$#111%!6$"22#!6$!0#!p$"p.',
+    '$#631#%-page$$yard##/me##055#!1#!3#!7$#-69#"90##dx2#$edx2#$iops##mph#!y',
+    '*!8#$/880#!0#!1##203##444#!5#"60$"81#"70$!1#!8#"ml#"th"*8,9000,000',
+    '#+0&ndash;300$"mp$!s#"20$"33$"87#!3#"40##884"+9&ndash;399*"70#".5#!0#!2##448',
+    '#"f.##mph"#:13#!2$!6#"34""a.""bc"!c#\'wt/acre"#ff.""in""kb#!g##m/h',
+    '""lb$!s"#min%!s#!m""pp""s.")th-minute"!v"!x#"50#"66"(year-old!,7%&ndash;63%#&-owned',
+    '&";c\'!s#&frac12\'"34$!t#\'mdash;8$\'iddot;2#(ndash;13*"72).2&ndash;4705585"704"75*!9)"49)"50',
+    '*!4*!6)"62)"84"#(3)#"8)"$+153",,000-xstones$&55,200$"78$"80##177#"25#\'400,000%!4',
+    '$!8$"98##541#"63$"43$)57million##777##800$"90""-0#!3$!3##day#&footer#$page',
+    '$$oint#%round$"un#&second$%trong##ton"".0$%,45.2$!0$"6m$!7#"15##29s&#ecs#"3%',
+    '$!4#"40#,5&ndash;51.3$!0$!3%!s$"58$!m#"63$!6$!7##7kb#"8%$!2$!7',
+    '#!9$!%"$/052##233#"4s#"57#"8p")0&mdash;1$(ndash;80$#ohm##-81$$acre##.30#"/l$"v7',
+    '%!0#"10#!3#"46$!7#!5$!m#!7$!9#"80#!k#*mhz-850mhz#!p#"th")1&mdash;2',
+    '#$,000#"/2#"00$!2#!2#"33##410$!6#!7$"45#!8#!p"%2,000#$-594$#633',
+    '$!0%$/146##211$"49#!4$!8$"mm#!5##884#(9/bs8000#!m$"ph"+3&ndash;474#"02##314',
+    '#!a"+4&ndash;484,!9*!5#$,160#!0$#2\'s#"11#!3#"46$"91#"57#"72$!5#!8',
+    '##mph"+5&ndash;2dh*!6*"98##,00$#968#$-525#".8#"/5#$0rpm#"22$!3$!5#!5#"67',
+    '#"80#"bc#"ff#!m$&l/16fl$"ph#"th")6&ndash;7*"80#"/5$!l#!0$!0##446#!7',
+    '#!m#"pp"+7&ndash;503*"66#\'-strong#"/6#"16#!8#&a/120a#!e""8%#*&ndash;460#$,394#!0$"60',
+    '##61a#!9$!0"+9&ndash;323*#440*"80#!0##111#!2$"50##500#"61"#:04#+16&ndash;19#!3',
+    '"!c"!e""ff"$hour""in$!s""kw"!m#!b#"in#"ph"#ohm""pp#"ts!,8%&ndash;83%',
+    '&";f#+frac12;inch$!t#=ins&times;12&ins&times;18&ins-324&ins&times;24&ins-&57&ins&(;x12&ins.(;x15&ins)-8&ins;x18&ins#(mdash;51)!9#0ndash;10&ndash;0*!2*"53*!8',
+    ')"52*!4*!6)"60+$-bed*!1*"26*"34*!6*!8#%sol;1\'!2#*times;5mm/"#(3)#"6)',
+    '"$,161##368##400%!3##500$&55,000##609##750#\'861,000$"92##924"!-#!0#"16#!3',
+    '#!4#"50$!3#!7$!2#!8##bit#$city$#opy#"km%!/#%plane#%round#&seater$$heet',
+    '$#ell#$yard$#ear"".0$$1sec#!1$!2%)&ndash;13$!7##3cm#(4/100000$!0%#sec$#sec#"55',
+    '$!3#"79#"84$!5$!p#"95"$/160$"71##20b$)2&ndash;1,!2#"78""0%#&&deg;c$)ndash;406',
+    '##+km#\',000lbs##-km$&strong#".7##/79#$0-ft$$/210$"00$#gns##130##500#&60yrbp#"70#!8',
+    '##mph##pp.#!z"+1&mdash;511$\'ndash;0#"-o#".2##014$$8326$!9#"10#!3$!0#!4$!1',
+    '$"41%!4#"51#"66##813$"59$"77##mph")2&ndash;3*!4*#979#$,118##.52$&892mph#!0',
+    '##285##466#$5120%!4#!8$!0$#728#"nd")3&ndash;8#$,000#"05#!3$"90#!6#)b&ndash;h',
+    '#!.#!0$!0##123#!3#!4$!1$!5#"60##848#!c#"n."+5&ndash;488,!9##(3)',
+    '##0lb#!1#!2#!4$!0#"80#!9#"hp#"th"+6&ndash;510*!7#!.##/25&!s$"33',
+    '$!d%!e$"me$!p%!5%!g$"se#"20#"80#"90$!9#!a#!b#$dx2s%!s',
+    '#"ft##lc2#"se$\'l-based$$x-25%!/"+7&ndash;457#$,000##.07#%/1141#!2##354#!4#!5##722',
+    '")8&ndash;9#"/l#!0#"20$"19#!7$!m"*9&ndash;92#(,000,000$#500$\'822,000#".5#$3748#!4#!8',
+    '#"90#!p"#:16$!7#+21&ndash;22#!3$!0#"52"!b""cm"!d"!e")f&ndash;g""hr$!s',
+    '#!m$!/%&130mls$!h#!w""lb""mb#"hz#"in""no")th-minute"$week"\'x54&ins"#z02!$9&ft',
+    '#\'ndash;0)"13+"60*!9)!3)"40*"33)"50*!1*!4*!9)!7*!0*!2*!9',
+    '"#(1)#"2)"$,200&\'-strong$"71$"80#"50##657##729#\'890,273##979"$-221#$days#$goal#$hour',
+    '##mer##old#&strong#!x"#.0%$!0$$9sec#"1%$!2#$20m.$!2$!4$"7p$!9#+3-14-175-10',
+    '$!3$!4#"4%$!/$!0$!2$!5$!9#"50$#2pc$!7%!%#"60#%78sec#"8%',
+    '$"7s$#sec#"97""/2$"45#%50/51"+0&ndash;479+"80#"00%"00#!2#!4#!5#!k"$1.1m',
+    '$"11##547#"80#!e#"p.")2&ndash;3*$5700#!0##211$!4#!5$"92%!3#!6$"02',
+    '##882#"ft#!p"$3188##260##4.5#!9#)c&ndash;d##mph#!p#"rd"%4,000$#300#"/l#!0',
+    '$!0$!3##394##407",5&ndash;3305#$,000$#952#$-326$&member#"00$"28#"55#"63#!m"+6&ndash;406',
+    '#$35-2#!6$!4$"66#"86#"90#!k"+7&ndash;505#"20#$4400#!5#"70$"39"+8&ndash;446*#503',
+    '#!0#!1#!2#!8#"90#!k#!m"+9&ndash;502#$,000#\'-member#!0#!1#!2#"30#"70',
+    '$!0#!9#)c&ndash;e##mph#"th"%:22ff$!5##5ff"$_out""bc")d&ndash;e""ft""in""km"#min',
+    '""pp"#sec"(year-old!#:00$"pm#!1##2.5#$3.7.##4.0#$5.6.#$6.83#$7:32#$9.94"*1&ndash;11+!3',
+    '*!3*!5+#:13*!6##,18#"03##1,1&!2#*2&ndash;16#*3&ndash;16$".1##5.1#!6$)&ndash;30$".4',
+    '$)&ndash;19+"29+"32#*8&ndash;19+"21#!f""20$)&ndash;21+!4##1.5#!2$)&ndash;23$#ff.#$3.08#!4',
+    '#*6&ndash;27+!7#*7&ndash;31$".0%!9#!9$)&ndash;31#":1$!2$!6"+3&ndash;5:2*!8#",4##1.3#!2',
+    '$".5#!3$".0##4.9#!5#!6##7.8#!9$".7")4&ndash;6*!7#!0#!1##2.1%!7',
+    '##9.6")5&ndash;7*!8#",6##0.2##1.0#$2:34##3.1#!8$".8"*8&ndash;13#"ff"!9!\'=severe!$a(2)',
+    '""-d"!."!8""a.#!a"!b#%ility"%d-ish""h."!p"!q"!s#!r"!u"!w',
+    '"!p"!r!%c-956"\'/5c/5b+"!4"!7".m(1&half;inch)#%-long"!s"!v""wt!$d+ct#"fs"%._per"$/480',
+    '""os"!p"!t"!u"!w"!x"!y!"ea"!f"!t"!v"!x!$f11e"!2")acilities',
+    '$$long#!.$%0ins.!\'g-bytes#%words"!2""hz"\'l-based##/rf!"h2"!a"!e"!h"!l"!p',
+    '"!u#!."!y!!j"!b"!f"!u"!w"!x"!y!!k"#/2k"!b"&calmol"&g/9lbs',
+    '""m-#-/2&frac12;mls#!s""pc"!t"!v!\'l&deg;c"&.t.704""74""a."!j"!r"!t"!z!,m&sup2/litre',
+    '#$acre""54"!a"#bps##yte"$g/ml"&illion#"ns""ms""ph""yr!!n"!a"!j""ow',
+    '"!t!#o.8"%0km/h"!o#!g"!s""z.#"s.!$p.m."!d"!h"!l""m."!r"!y',
+    '"!f"!p!$r2c1"!b"!u!+s-briefcase"#.3d#"6d"!d""ec$!s"(hillings"$ight"!j"$peed',
+    '"!s!"t."%/acre##in2"!a"!d"!f"+h&ndash;5th*#7th#%-22nd$&placed#$/5th"!o"!r"!u',
+    '""a."!g"!t!,v10&ndash;20!$w118""ds"!t!%x&agr"-10&amp;sup-13%#ins$!s",2&middot;5cm"$4&ft#"in"#5cm',
+    '"-6&half;inches"%8inch"#90g")times200g!!y"!a"!h #5%.""co!&&aring#"st"&bsol;a"*commat;1/2+!3"%deg;.',
+    '"7formula;x11&frac25;inch#\'rac12/5(";-*%month)!.)!d*!.)"ft)"lb)!m*#ile)"oz\'\'4;-inch)!d&$34;d',
+    '#,t&times;6&ft$%/6&ft$\';10&ins%%4&ins%%5&ins%18&ins;-5&ft;9&ins%29&ins;-5&ft;10&ins"$gt;7"/ins&times;4&ins"%mdash\'$;009+"/6)"11(!1)"0p',
+    ')!4)!6)!8("23*#(4))!4)!7)!8(%30(2))$3(2))!4*#(2))$6(2)("43($5(4)',
+    ')!s#$gr;v#\'iddot;0)!4)#5cm)!8)!9",ndash&frac12\'#;07(21&ndash;12&ndash;0)"/2+$&ins)#0cm*!g*"km',
+    '+"in-!s*#ppm)"2%*+&ndash;18773"911!8))4&ndash;8)\'5&deg;c/"dh*#cms)"65)%7&deg)"80)#ocm',
+    '()2&ndash;00!8)\'0&deg;c)!1)!3)!5*!%*#mph)!7)!f(13&ndash;9&ndash;0)"-2)!1)"23)"39',
+    '0<3&ndash;2&ndash;1&ndash;stop)!5(,5&ndash;18951#900)#.5m)!4)!6)!7(\'6&deg;c)"00)!1)!4)#:13)"cm)"in',
+    ')#min*"ph)!p()7&ndash;00!9)$,000)".5)!c("8\')!0)"77)"cm)#min*!m("9-',
+    '(#oct"&plus;1(!0#-rime;35&prime)\'8&prime"-rehy;year-old"*shilling;6,"d."%times\'%;10/l(,5&frac34&ins((denhardt.!t!"\'-#2aacagctatgaccatg-3',
+    '&1acgactcactatag-3\'$Lcggatccacttacctgtccggctctccggctccggcagctt-3\'%3tgctagagatttttac-3\'\'1gaagggttagtttg-3\'$\'djacent$6gaccaagatcaatcccacc-3\'$2ttaaccctcactaaag-3&7tgttctaagtcgccatattctct#\'caat-3\'%9tacagctgaagcttgtagacacact$#cat\'9atccatgctgttctgcaatccc-3\'%7cagcctgacccatgtggtgg-3\'&4tggcattcatcttgatc-3\'$-gcggatcca(ag)',
+    '.3caacacgcattttgtg-3\'.-tgcgggcctgctg;#-3\',5ttcagcgctgccgacaaccac$"pa$!t%6agagaacccactgcttaac-3\'&4ttaagtggagatgtgcc-3\'%5cgcaaacaccttatgtac-3\'%!g&2attgagatctgacgc-3\'%5tcatcacggaggttcctg-3\'#+d(cgcaatcg)./.3\'-d(gcgttagc)$0ephosphorylation',
+    '%5ggtcgatcgcccacgtga-3\'&>tttactgcagcggagataaagctcagc-3\'%Ctcaagctttccctgcgagcccgtggagactgc-3\'(Kgatctacttacctgtcgacgggggg-gtcacgggcaggac-3\'\'Jggatccacttacctgtaaaggtctggagctggtagggggc-37;ctggctgtccgacacaggctcata-3\'$"cc$Jgcgggacttcattgggtgaacaatagccaggtatcgatc-3\'%?tggttcccattcgcgcatcatagatacc-3\'$!t%2aaaacgacggccagt-3\'%2gaaattcttccttcacac(3ttcccaaagaacctgg-3\'&)gaatgt-3\'%5tcggggccgtcgcttagg-3\'',
+    '#+nucleotides#*protruding$)yrimidine#)regulated*#ing#!t$"aa$\'erminal$5tagacgtctagacgtcta-3\'\'2caatccggccgccct-3\'%!t""08"!3#!\'##200',
+    '"Oaaa.gct.ttc.att.aca.tga.cga.agt.ggt.agg.tga.tgt$8cgatcagagtagtggtatttcacc#8d13:accaaagccacagttgggca#6gggccctagaggggccctag3\'#@tgattctcaactcttctactgaagatggt-3\'"!c#Xggaggggccctagagggccctagagggccccccaaaaacccccaaaaacccccc3\'"#end"?gaggggccctagagggccctagagggccc3\'#Bgg.aat.tcg.aca.tgg.tag.atc.tgc.cac%\'gcccc3\'#2tcatccagtacctggccg",nucleotidase"%t(-1)#$acaa',
+    '#$gtaa#!o!$(10)"(2)&mdash"#5).##,6)""9)""e)!"+1#"=6"!3!#,00$/0&ndash;500,000,\'6,000kg,%7,000',
+    ')"th\'"70%!-&!1\'%0,000\'%5,000&$acre&\'hectare\'$ouse&"kg&&member(#tre&$page\'$iece\'#lus',
+    '&$year%"bc%"gn%"km%"lb%$ngml%#rpm%!s%"th$!1$%4,000$!6#"20$!2#"49',
+    '$!1$!2#"86#"90%$,000%&-pound$!2"110,15,20,25,30,35$%0,000$%3,772$!7#$1-13$!3$!9#&20,000',
+    '$!4%$,931#&33,000#"40$%6,000#%5,143$#2kg$!4$!6$!8#"64#"72$!4#"80#"90',
+    '%!6"!2#*0&ndash;22$#0gn$!1%$,919$!5#"11#"23#\'40-word$!5$#8ft#&5-inch$!0%$,000',
+    '#!7$%3,000#&83,220$#4ft$!8#"93$!5$!7$!8$%9,000"!3#",7#"04$%8,510#&10,000',
+    '#"21$!2$!8#"32$!4#"45#"50#"62$!8#"72#&80,000#"92$%6,000"#410$!5',
+    '$%7,464$!8$#9ft#&34,000#"43#&50,000$!1$!6#"60#"72$!3$!6$!8#"80$!7',
+    '#&00-odd&&strong%"kg%#rpm$!1#"16#"23#"34$!6$%7,000$!9#"42$%3,700$!5$%7,000',
+    '#"64$!6#!7$!6#"82"&600gns%"kg%"yr$!6#&33,456#"53#&60,000&#619#"72$%4,000',
+    '$!5$!8#"93"%700kg$!1$!5#"10$!2$!6#"20#"30$!4#&51,000#&64,801$!8',
+    '#"74#"82$%3,200$!9#"90$%1,700$!4#!b"!8#&,13,14#&00,000)$,000%#gns%"kg%!m',
+    '#"25$!6$!7#"32#$50hp$!1$!4#&60,000$#9km#"77$!9#"81$%2,000"$9,26#&00,000',
+    '#"20$#5,9$"8m#"35#"48#"50$!3$!4#$70kg$!4$!8#$87cc#"97!\'-&mgr;l\'!m',
+    '#"0s%"ec#"5%"#20%#!4$!0#!6"$3-93#!0#!2#"84",4-3-2-1-zero"#5-3$!5#!2',
+    '"#6lb"%7,000#!c")adenosine#.minosalicyclic-\'licacid*\'ycilate,%lylic#)sa/ac-asa#!t#*zacytosine"$ball#&earing#!p#\'ranched',
+    '\'0-2\'-deoxyuridine(F4-chloro-3-indolyl-&bgr;-d-galactoside\',deoxyuridine"*centimetre#&hannel$(elmsford#%olour%#umn#$ycle"&figure#8luoro-2\'-deoxycycytidine.;xoyuridine-5\'-monophosphate&&uracil##oot#%urrow',
+    '#"hz"!h##ete#"t3#;ydroperoxy-eicosatetraenoic\'(xyindole))trytamine""in$&-a-row$!.$"ch#$ssue"$july"!l#\'anguage',
+    '"\'megaton$,thylcytosine#!m$)-diameter%$long#$onth"$node$(ttingham"!o"$page#%eriod#$hase#$iece#&ounder"\'quarter',
+    '#$hape$&illing#%torey"$to-4$!n%"ne#$uple"%under##ser"&volume"#way#%eekly"!x!(.0&aring$\'ndash;0',
+    '+"5%#!.#$0.42%"50$!0$!5$#p.m%$/kwh#!1$$-run$#x10##3bn$#ghz$"pc#!4',
+    '#"5p##726##8mm#!m$#g/l$!m#"ng"%1(12)$"b)##-ii&!i#%.1.1.&"3.%!0%!5',
+    '$#7.1&!2&!3$"94#$0(1)%"a)$".0$$1(2)$#pm.#$1.79%"90$!9$!a#,2&ndash;5.14$".0',
+    '$!8$!d$"pm##3.1%!2$!3$!9$"am$"pm#,4&ndash;5.16$#(a)$".1%!2$"ff#%5&deg',
+    '$".3$!a$!c$!e#*6&ndash;21$#(2)$!0$!d#$7(2)%"4)%"b)$".1%!2%!3$!a',
+    '#$8(3)$".1$\'0.05myr$!b$!c$"pm#"9a$#c-e$!m#$b(s)#"pc"+2&ndash;6.1*!9#&-litre#!.',
+    '&!2&!3&!4$!9#&0(a-d)%"c)$!2$!4$!a%!m$!b$!c$!d$"pm#"1c',
+    '$".4$!a$!d$!f#%46663#$5(3)$".1%!2$"in$"oz#$6(3)$!6$!a$(landlord#,7&ndash;2.74',
+    '$!d#"82$!3#"bn#!d#"ev#"gb#"kg#!m$#mol#"pc",3&ndash;13.0##(d)#$,5.4#$.1.1',
+    '&!3%!1%!2%!3%!4%!5%!6%!7%!8%!9$"20%!1%!2%!3$#3.3',
+    '$#92.%!3#\'/100000*%/year#.0&ndash;7.30pm$!b$!d$\'pm-11pm#"1b$!f##30m$!a$!b#"5a$!b',
+    '$!p#$6(d)$!a$!c$!p#$9166$!a$!c#!a#!b#!c#\'million%!n#!p"%4&ins',
+    '+#6.6*#9.7##()d$"2)$"c)#*-magnitude#$.3.1&!2&!3&!4$#4.1&!2$#6.1&!2$#7.1',
+    '$#8.1&!2&!3%!3$!9#$0(a)%"b)$!a$!e#$1(2)%"i)$!4$!a##2pm#"3a',
+    '#!c#"gb#$secs"\'5&deg;c$(ndash;24*#6.0,!8+!m##(c)#"-6$#9.5#%.1988$!4$!5$!7',
+    '#%0p.m.%!m##1.1$$5047##22m$"am#!4#"55#"6%$"mm$!p##7pm$#x10#"89#":1',
+    '#"kb$"ev$!g$!m##lbs##nm.#$secs#!v"\'6&deg;c$/ndash;5.8p.p.m.*#6.6##(3)$"a)$"b)$"c)',
+    '$"e)#"1%$!p#"2%$!5%!%#!3$"5%$!p#!4#"5p#!6#!8$!%#!a',
+    '#!f#!k#!m$#bps$"yr#"oz#"pc"%7&ins#"0m#!1#$2516#!4$$-day#$5-ms$!m',
+    '$!p#!6$!p#!7$!%$"6%#!8#"m.#$t/ha#$x107",8&ndash;5.10-#myr$*times;10/l##(a)$"b)',
+    '#".4$!5$"92#"1%$!m#!2#"3%$#lbs#!4$#(5)##5mm#!6##75%#!8$!2',
+    '##ins"%9&ins$(ndash;10+#1.8*$25.0##(b)$"c)$"d)#%-inch#".0$"12$#6.4\'(imposing$#9.1&!2',
+    '&!4&!5&!6#!0#!1#"3p#&4/1.65#"5p##6.1#"7p#"mm#$secs!\'/008/11"$1/87#!0',
+    '$!1#"75#!8$!2#290&amp;c/375&amp;f""20$!9#"56#"70"#3/2$"41#"99""40#!5#"66',
+    '#E83,14/592,25/602,26/603,27/605,32/610&.72/650,120/698"&6,1982##-th#!0$!0$!1#!4#!8#!9##ths"%8&ins#!3#!6#(in-thick',
+    '#"/7#!1"&bridge"#day"%first""in""kg$"26"$many#!y""so"#the"$zg26!&0%-50%#$when',
+    '#2deg&ndash;76&deg;f#:frac14&times;30&frac14&ins#\'mdash;1*"00)!2)"60)"80$-gr;mx50&mgr;m$&icro;g*#/ml%&ddot;8#+ndash;1,000*#00m-%cg/kg-!v',
+    '+!0*!3+!0*!4+"80*.5.5&ndash;34.5+%0,000*#7.9+#163)#2.8*#727)#300,!0,"nm)%500/l',
+    '*!6*#9.9)(60&deg;f+"km+!p+)specmarks*!4)&70&deg/";f*$5mph)#82%*!8)!9*"0%)$plus',
+    '#(rehy;odd#&sol;50#%times(%;25mm)$50mm"!\'#!n#!w"7,00,000&ndash;60,00,000%.0&ndash;60,000-&88,000&/,000-70,000,000&(-100,000\'&strong\'$word',
+    '&#lbs&"m.&"sq%#1st#\'204,000#$3000$"11$"20##400%!7$"86#\'500,000##622$"53$"92',
+    '%%0,000##900$"80"&-1,000("/g$*00&micro;g##200#!4#$5000$!2$!4$!5$#9.9#%60mph#%70kta',
+    '#!9$%0,000#%a-day$"nd#&branch#!c$!m%%-wide#$deg.#(employee#$feet$&ooters%%rward$&rigate##gun',
+    '#(megawatt%$tres$(icrowatt$!m%&-thick#,overs-a-side)(per-side#(per-cent$"in$$lace$$oint#&rouble$"un#&second%$ries',
+    '$$tate#$test$$imes$$onne#$user#$watt%!y$%icket)*s-a-season#!x#%yards$(ear-long($olds\'%s-old"!.',
+    '%$0,00$#5hz$!6#"11$!9#"2%$!0$!3$!4#%323a.$!6%#sec$!p##43%$!6',
+    '$!6$!7#"6%$!6#"76#"9%$!5$!6$!8$#ins"!/##-in#!1$+&mdash;9/23$%00000',
+    '##374#"40#"52#$60hz$"35$$6mhz#"70#!l")0&mgr;bar(!l(!v%&icro;l$+ndash;2,200+#000*#520',
+    '+"99*%600-c-"mm*$700g-"kg+"50*\'800,000$%times#,,000&ndash;1.\'600,000\'*-1,000,000(%tonne#!-$%2,000$#700',
+    '$$acre$\'bedroom$)character$$feet%#oot$%gauge$*horsepower$"kw$%litre%$orry$*metre-long%!g$$node$&pounds$%sheet',
+    '%$tock&#yle$#tps%$rial$\'vehicle$$watt#".0%"00$!6#"/0$#600$!l$!s#\'0&deg;c%(ndash;10',
+    '+$8000$!-%%metre%&series%$year$$00km$!7$!8$"bf$#gns$"km$#lbs$#ppm$"sq#"21',
+    '#!4$!1##741#"90$"19#"ad#!b#"cl#"du#"ff%!.#%g/1lb$!m#"is#%kcals',
+    '$"ph#&m-bits$!2$!a$#bar%"ps$&l/18fl$"ms$"ph$!s#$ngml$!s#"pf$!g$"pm',
+    '#$quid#"se%!c%!l#!t#$watt#&x250mm#"yd"#1\'s##(c)#$,000$#272#"16#"20$!1',
+    '#!5#"90"#265#"72#$8714$"90##9\'s#!b#!d#"nd#"pp"+3&ndash;504+"24#$,977##-bp',
+    '$$yard##.8%##/25##034$$7495#"30#!5#"60#"70#*867/505124#!9#!p")4&ndash;5#%,000.%"56',
+    '#$-646#".4#!0#!1#"27#"40$"92#"50##764#"80#!s""5%#*&ndash;510#$,024$#500',
+    '##196#!6#"70#!d#!p"+6&ndash;507#$,000$#900#".3#!0$!0#!1##733#$:540#)b&ndash;d',
+    '#"kg#!p#!s"+7&ndash;510#".2$!7##498#(61/52019#!8#$:541#"mm#!s#*x464x362mm""8%##.43',
+    '%!6#!1#!4#"70#!8##dpi#!p#!s#&x356mm""90##220#"35#!6#"80#!c',
+    '"#:16#+24&ndash;25#%30:20#!4$",5$#8:2"#=50""ah"$b(1)#!c#"hp#!n#!p$!m"$c(2)',
+    '""db"\'ft-high$!.$&/15.2m"*g/2oz/&amp)&frac13(!1#%flops#%r/2oz#"sm"%k&ohm#!b##cal##g/t$!m',
+    '#&jmol-1#"ts"#lbs""m1#!a##bps#$etre#\'g/100ml%"ml#(hz/25mhz&$35.6##ma-#"yr""nm#!o',
+    '#"hm"2p&mdash&pound;1.25##mol#!s"-s&ndash;early#!-##eat$!c$!x#!q#%trong""va"%x25mm#"50"!z',
+    '".&amp;times76.2##deg&";c#Ains&times;55.5&ins&times;52.5&ins#%mgr;m#\'ndash;1*,1836a/n8389h*!4+#470*$6622)"25)!4)"53*!4*!5',
+    ')!6*!1*!6)"74*!9)!8)"98)!l#3times;37&times;51cm"%(3.6)#"5)#"7)#"9)"+,000-member##224',
+    '#\'390,000#\'449,000#"52"#-35#!4$!9#"56#!6#\'country#$foot\'"er#$hour#$mile%$nute#&nation',
+    '#$unit#\'yearold"".0$!2$!4#"10$!2$!3$$secs#"20$!9#"31$!7#"40$!5',
+    '$!3#"6%$!0$!5#"7%$%/1000$!5$!6$!7#"80$"56$"kb#"9%$+&ndash;95.7$#0m.',
+    '""/2$!1##320#"53##623#"90#+km&amp;sup2"*0&ndash;11+!5+!9*#550*#600#*,976-token#%0/359$!m',
+    '#!1$*60&ndash;2#"22$&30c-86$"94#!4#"54#!6##740#!8$"23#"90#!c#"hp#"mb',
+    '"*1&mdash;33+!4*#613$)ndash;792#!.$!1#$019c$!3$#430%"60%"90#!1$"20%!5##293',
+    '#!5#!6#%7790b#!8$!0$!1$"94##909#!c"-2&ndash;2pme8*#513#$,000#(-bedroom%#yte##/11',
+    '#!1$"21##244$"66#!3#"40##526#!7##843#!9#!b#$kbps#!p"%3,673#!1',
+    '#"60$"25##786")4&ndash;2+!1#$,000#$.51.$"61#"30"*5&ndash;21*$620w#$,000$#700##.81#"20',
+    '$"95#!6#!7$!0##ff.#"mb$!m#!p"%6,000$$2000$#400#"/l#!0#!1#!3',
+    '$"77#"50#"71#!8#)b&ndash;g#!p"*7&ndash;28*#521#$,000#!0$"00#"20#"49#!5##756',
+    '$"-i&!i#)d&ndash;f""8%#*&ndash;527##(1)#&,058.3#\'-strong##.2%#!4##662#"80#)e&ndash;f#"ft#"th',
+    '#".5##166#(22/51562$"92##902$!5#!c"#:11#"55$!6#*9&ndash;11"!="!c""db""in',
+    '""s.#"ec""xx!%2&deg&/&ndash;58&deg;f&$;2\'n#&frac12#\'mdash;3)!8#*ndash;12.5*!7*#927)"22*!7)!4',
+    '*+/54&ndash;7*!1*!5+!%)!6*!8)!7*!9)"82*(4&deg;10*!7*!8#&percnt""\'s"#(2)',
+    '"$,109#\'200,000$"19##600##994""-0#!3$$6=24#!6#$page$$lace#&strong#$year"".0$!%',
+    '$!6$!7#"21$!3$"5s$!9$!p#"3%$$24b.$!s#"45#"54$!p#"64$!5',
+    '$!4$!7"%/1000##305##630$!9"%0-537$$acre$$mile$$yard##044#"10$!7##303#!8',
+    '#)b&ndash;c$!.#"c.#"d.#"e.',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_93 = (
+count_93 = 6694
+
+heads_93 = (
     '2901',
-    '29012',
-    '2901m',
-    '29020',
-    '290294',
-    '2903.4',
-    '2904.8',
-    '290586',
-    '2906',
-    '2907.60',
-    '290bhp',
-    '290f',
-    '290g',
-    '290g/10oz',
-    '290kcals',
-    '290m',
     '290s',
-    '291&ndash;2',
-    '291&ndash;349',
-    '291&ndash;3650',
-    '291&ndash;7221',
-    '291,920',
-    '291,923',
-    '291-5',
-    '291-ball',
-    '291.1p',
-    '2911',
-    '2912&mdash;17',
-    '29140',
-    '2915.9',
-    '29160',
-    '2917.6',
     '29170',
-    '291768',
-    '29180',
-    '29197',
-    '291p',
-    '292&ndash;293',
-    '292&ndash;3',
-    '292&ndash;306',
-    '292,210',
-    '292-309',
-    '2921',
-    '29210',
-    '2922.1',
-    '2922.4',
-    '29250',
-    '2926.5',
     '29288',
-    '2929',
-    '292c&ndash;g',
-    '292x451',
-    '293&ndash;304',
-    '293&ndash;4',
-    '293&ndash;8',
-    '293(1)',
-    '293(2)',
-    '293,000',
-    '293.',
-    '293.3p',
-    '293/91',
-    '2930',
-    '29310',
-    '29320',
     '293228',
-    '2933',
-    '2934',
-    '2935',
-    '2936',
-    '29360',
-    '2937',
-    '29380',
-    '29390',
-    '293f',
-    '293ff',
-    '293kyr',
-    '293pp.',
-    '294&ndash;5',
-    '294&ndash;6',
-    '294,000,000',
     '294,003',
-    '294-74',
-    '294.4',
-    '2940.0028',
-    '2941.30',
-    '2941.7',
-    '29420',
-    '294267',
-    '294271',
-    '2943.4',
-    '29430',
-    '294441',
-    '29448',
-    '2945.0',
-    '29450',
-    '29454',
     '29463',
-    '29465-66',
-    '29470',
-    '29473',
-    '29487',
-    '2949.9',
-    '29495-96',
-    '294g/sq',
-    '295&ndash;763',
-    '295,794',
-    '295-312',
-    '295-acre',
-    '295-name',
-    '295-yard',
-    '295.8%',
-    '2950',
     '29500',
-    '29510',
-    '2953',
-    '29540',
-    '29550',
-    '2956.7',
-    '29560',
-    '2957.3',
-    '2958',
-    '295913',
-    '295ft',
-    '295m',
-    '295p',
-    '296%',
-    '296&ndash;305',
-    '296&ndash;307',
     '296&ndash;4',
-    '296\'s',
-    '296,000',
-    '296/488',
-    '2960',
-    '2960cc',
-    '2962',
-    '296200',
-    '29630',
-    '29645',
-    '29649',
-    '2965',
-    '29654-57',
-    '29654-60',
-    '29654-69',
-    '2966',
     '29660',
-    '296733',
-    '29680',
-    '29687',
-    '29690',
-    '29692',
-    '296925',
-    '296a',
-    '296a(1)',
-    '297,862',
-    '297.1',
-    '297.25',
-    '297.2p',
-    '2970',
-    '2971.6',
-    '29710',
     '29717',
-    '297297',
-    '2973',
-    '29730',
-    '29740',
-    '29740-44',
-    '2975',
-    '2975cc',
-    '29760',
-    '29770',
-    '29780',
-    '297810',
-    '2979',
-    '297g',
-    '297gb',
-    '297pp',
     '298&ndash;299',
-    '298&ndash;301',
-    '298&ndash;302',
-    '298&ndash;9',
-    '298(1)',
-    '298(7)',
-    '298,000',
-    '298,372',
-    '298.5',
-    '298.50.15',
-    '29803',
-    '29806',
-    '2981',
-    '29817',
-    '2985',
-    '29852',
     '29860',
-    '298656',
-    '29869-76',
-    '2987',
-    '29870',
-    '2988',
-    '2989.4',
-    '298mm',
-    '298p',
-    '299&ndash;4',
-    '299&ndash;59',
-    '299&ndash;9',
-    '299,014',
-    '299,560',
-    '299,681',
-    '299.8',
     '299/150',
-    '29924',
-    '299380',
-    '29953',
-    '29956',
-    '2997',
-    '2997&ndash;1826',
-    '299811',
-    '29991',
-    '29996',
-    '299g',
-    '299th',
-    '29:10',
-    '29:13',
-    '29:14',
-    '29:18',
     '29:26',
-    '29:28',
-    '29:42ff.',
-    '29:43&ndash;46',
-    '29:49.0',
-    '29ab',
-    '29b-30',
-    '29by',
-    '29july',
-    '29k',
-    '29km',
-    '29m',
-    '29million',
-    '29mins',
-    '29mm',
-    '29mpg',
     '29mph',
-    '29o',
-    '29pp',
-    '29pstg.',
-    '29sec',
-    '29secs',
-    '29th/45th',
-    '2:00',
-    '2:01.5',
-    '2:02',
-    '2:03.2',
-    '2:05.36',
-    '2:07.2',
-    '2:08.9',
-    '2:09.21',
-    '2:09:55',
     '2:0:0',
-    '2:1&ndash;22',
-    '2:1&ndash;23',
-    '2:1&ndash;52',
-    '2:1&ndash;8',
-    '2:10&ndash;13',
-    '2:10,11',
-    '2:10:42',
-    '2:11&ndash;12',
-    '2:11&ndash;18',
-    '2:11&ndash;22',
-    '2:11.01',
-    '2:11:04',
-    '2:12&ndash;18',
-    '2:12.9',
-    '2:12:17',
     '2:12:20',
-    '2:12:28',
-    '2:12:53',
-    '2:13&ndash;18',
-    '2:13,14',
-    '2:13.23',
-    '2:13.45',
-    '2:14,18',
-    '2:14.00',
-    '2:14:04',
-    '2:14:19/&dollar;7000',
-    '2:14:22',
-    '2:14:30',
-    '2:14:50',
-    '2:15&ndash;21',
-    '2:15:26',
     '2:15:27',
-    '2:15ff',
-    '2:15pm',
-    '2:16:29',
-    '2:16ff',
-    '2:17.49',
-    '2:17.5',
-    '2:17.6',
-    '2:17:22',
-    '2:17:37',
-    '2:19&ndash;22',
-    '2:19&ndash;23',
-    '2:19.7',
-    '2:20,2',
-    '2:20.51',
-    '2:20:36',
     '2:21',
-    '2:21&ndash;0',
-    '2:21&ndash;39',
-    '2:21&ndash;40',
-    '2:21.15',
-    '2:21m',
-    '2:22.3',
-    '2:22ff',
-    '2:22ff.',
-    '2:23.0',
-    '2:23.01',
-    '2:23.7',
-    '2:25',
-    '2:25&ndash;36',
-    '2:26.7',
-    '2:27.6',
     '2:27:34',
-    '2:27:58',
-    '2:28,1',
-    '2:28.5',
-    '2:28f',
-    '2:28ff',
-    '2:29&ndash;32',
-    '2:29.0',
-    '2:29.9',
-    '2:2:1-hsdr:hsdm:hsds',
-    '2:3&ndash;12',
-    '2:3&ndash;14',
-    '2:3&ndash;4',
-    '2:30.5',
-    '2:30:55',
-    '2:31.4',
     '2:31:36',
-    '2:32',
-    '2:32&ndash;34',
-    '2:32.4',
-    '2:32:58',
-    '2:32f',
-    '2:32ff',
-    '2:33:15',
-    '2:33:18',
-    '2:34',
-    '2:37&ndash;41',
-    '2:38',
-    '2:38.7',
-    '2:38:05',
-    '2:39',
-    '2:42&ndash;47',
     '2:42:31',
-    '2:44',
-    '2:44&ndash;5',
-    '2:45',
-    '2:46:00',
-    '2:49',
-    '2:4:1',
-    '2:5&ndash;11',
-    '2:5&ndash;25',
-    '2:5&ndash;3:24',
-    '2:5&ndash;8',
-    '2:5,6',
-    '2:51n3',
-    '2:55',
-    '2:57',
-    '2:6-diaminopurine',
     '2:9,10,15',
-    '2:l',
-    '2:n',
-    '2=230',
-    '2=25&ndash;50%',
-    '2=a',
-    '2=blood',
-    '2=coarse',
-    '2=granularity',
-    '2=intact',
-    '2=medium',
-    '2=occasionally',
-    '2=pain',
-    '2a&mdash;personal',
-    '2a.',
-    '2a.true',
     '2aaa',
-    '2ability',
-    '2ag',
-    '2al',
-    '2am-5.45pm',
-    '2are',
-    '2ax',
-    '2az',
-    '2b&mdash;medical',
-    '2b+d',
-    '2b-2d',
-    '2b.',
-    '2b8',
-    '2bc',
-    '2bh',
-    '2bl',
     '2bu',
-    '2bx',
-    '2byte',
-    '2c-f',
-    '2c1b2',
-    '2c3f',
-    '2c7',
-    '2c8&ndash;10',
-    '2c=0.075cm',
-    '2cb',
-    '2cg195+04',
-    '2ci2',
-    '2cxa',
-    '2d&ndash;566',
-    '2d-',
-    '2d-3d',
     '2d-silver',
-    '2d-tlc',
-    '2d/3d',
-    '2d10',
-    '2d4+1',
-    '2db.',
-    '2dd',
-    '2de',
-    '2dh',
-    '2dm.85',
-    '2e0',
-    '2e1',
-    '2ed',
-    '2ee',
-    '2eh',
-    '2ej',
     '2en',
-    '2ep',
-    '2ff',
-    '2fm',
-    '2fs',
-    '2fse',
-    '2ft-high',
-    '2ft-square',
-    '2g/-1g',
-    '2g26-formation',
-    '2g6',
-    '2g7',
-    '2g80',
-    '2gal/acre',
-    '2gm/c',
-    '2gm/rc',
     '2gn',
-    '2h2',
-    '2ha',
-    '2hd',
-    '2hesc&lsqb;7iesc',
-    '2hh',
-    '2hj',
-    '2hl',
-    '2ht',
-    '2hv',
-    '2hw',
-    '2hx',
-    '2ii',
-    '2j',
-    '2jg',
-    '2jl',
     '2july',
-    '2jy',
-    '2k-1',
-    '2k6',
-    '2kev',
-    '2kg-sunflower',
-    '2kg.',
-    '2kg/',
-    '2kg/4&ndash;4&frac12;lb',
-    '2kg/4lb',
-    '2khz',
-    '2khz-5khz',
-    '2kpc',
-    '2kw',
-    '2l-2',
-    '2la',
     '2length',
-    '2lg.',
-    '2ll',
-    '2loe',
-    '2lq',
-    '2lr',
-    '2ltr',
-    '2lw',
-    '2m&sup2/kg',
-    '2m,6d',
-    '2m-',
-    '2m-1',
-    '2m-15m',
-    '2m-bytes',
-    '2m-deep',
-    '2m-strong',
     '2mb-8mb',
-    '2mbus',
-    '2mbyte',
-    '2mcg/kg/hour',
-    '2metres',
-    '2mev',
-    '2mg',
-    '2mgml',
-    '2mhz',
-    '2mi',
-    '2million',
-    '2min09-15',
-    '2min3secs',
-    '2min54secs',
-    '2min5secs',
-    '2mins10secs',
     '2mins1sec',
-    '2mins22secs',
-    '2mr/47/a/d4/h1',
-    '2mw',
-    '2n\'s',
-    '2n+3',
-    '2n+3+',
-    '2n-',
-    '2n-1',
-    '2n-level',
-    '2n/np',
-    '2n/p',
-    '2n3055',
-    '2n3904',
-    '2na',
-    '2nb',
     '2ncamp',
-    '2nd&ndash;31st',
-    '2nd&ndash;6th',
-    '2nd-3rd',
-    '2nd-5th',
-    '2nd-class',
-    '2nd/5th',
-    '2nd/9th',
-    '2ndvs10',
-    '2nh',
-    '2nmf/2n=mf',
-    '2nr',
-    '2ns',
-    '2ny',
-    '2o-4o',
-    '2o5',
     '2oe&ft',
-    '2oha',
-    '2om',
-    '2oz/sq',
-    '2p&gt;0.50',
-    '2p-sized',
-    '2p.m',
-    '2p.m.',
-    '2p11-12',
-    '2p2',
-    '2p=0.023',
-    '2p=0.036',
-    '2p=0.038',
-    '2p=0.14',
-    '2pacalypsenow',
-    '2pe',
     '2pg',
-    '2pint',
-    '2pm&mdash;4pm',
-    '2pm&ndash;2.35pm',
-    '2pm&ndash;4pm',
-    '2pm&ndash;5pm',
-    '2pm-3.30pm',
-    '2pm-4pm',
-    '2pm-5pm',
-    '2pm-6pm',
-    '2pm-9pm',
-    '2pm.',
-    '2pn',
-    '2port',
-    '2pw',
-    '2py',
     '2q',
-    '2qg',
-    '2qn',
-    '2qr',
-    '2qz',
-    '2re',
-    '2rf',
-    '2rl',
-    '2rp',
-    '2rq',
-    '2ru',
-    '2rv',
-    '2s-2p',
-    '2s.3d',
-    '2s.8d',
-    '2s.e',
     '2s1705&ndash;440',
-    '2sd',
-    '2sg',
-    '2shilling',
-    '2sio4',
-    '2sj',
-    '2sq',
-    '2ss',
-    '2t+1',
-    '2t-1',
-    '2t-2',
-    '2t/acre',
-    '2tbspns',
-    '2tp',
-    '2tr/s',
-    '2tsps',
     '2tx',
-    '2ty',
-    '2ue',
-    '2uf',
-    '2un',
-    '2uu',
-    '2uy',
-    '2uz',
-    '2vrms',
-    '2w12-14',
-    '2wenty-eight',
-    '2wk',
-    '2wks',
-    '2x10&ins',
-    '2x106km',
-    '2x15ml',
     '2x15s',
-    '2x1in',
-    '2x256x0.125mhz',
-    '2x2in',
-    '2x2x3x5',
-    '2x5inches',
-    '2x5ml',
-    '2x6',
-    '2x64x5mhz',
-    '2x6inches',
-    '2x8inches',
-    '2yds',
-    '2year-old',
-    '2yrs',
-    '2yy',
-    '3%-4%',
     '3%-plus',
-    '3%/yr',
-    '3&agr;-flu',
-    '3&amp',
-    '3&amp;2',
-    '3&bsol;3',
-    '3&bsol;45',
-    '3&commat/1/2',
-    '3&commat;1&bsol;2',
-    '3&commat;1/2-year',
-    '3&deg/minute',
-    '3&deg;10',
-    '3&deg;per',
-    '3&deg;w',
-    '3&frac12&ndash;1',
-    '3&frac12&ndash;2&frac12',
     '3&frac12&ndash;4hr',
-    '3&frac12&times;',
-    '3&frac12&times;8&ins',
-    '3&frac12;cm',
-    '3&frac12;id.',
-    '3&frac12;ins',
-    '3&frac12;ins&ndash;5ins',
-    '3&frac12;kg',
-    '3&frac12;lb',
-    '3&frac12;m',
-    '3&frac12;m/12ft',
-    '3&frac13',
-    '3&frac14&ins',
-    '3&frac14/3',
-    '3&frac14;-4',
-    '3&frac14;d',
     '3&frac14;lb',
-    '3&frac14;oz',
-    '3&frac14;p',
-    '3&frac14;pc',
-    '3&frac14;pt',
-    '3&frac34;d',
-    '3&frac34;kg',
-    '3&frac34;lb',
-    '3&frac58&ins',
-    '3&ft&ndash;4&ft',
-    '3&half',
-    '3&half;inch',
-    '3&half;inches',
-    '3&half;x4&half;inch',
-    '3&half;x4inch',
-    '3&lsqb;h&rsqb',
     '3&mdash;13',
-    '3&mdash;if',
-    '3&mdash;no',
-    '3&mgr;gml',
-    '3&mgr;l',
-    '3&mgr;m',
-    '3&micro',
-    '3&micro;l',
-    '3&micro;s',
-    '3&micro;v/&deg;c',
-    '3&middot;1',
-    '3&middot;2',
-    '3&middot;3',
-    '3&middot;5',
-    '3&middot;7',
-    '3&ndash;0&ndash;0',
     '3&ndash;0&ndash;11&ndash;0',
-    '3&ndash;0&ndash;15',
-    '3&ndash;04',
-    '3&ndash;07',
-    '3&ndash;070',
-    '3&ndash;08',
-    '3&ndash;1&ndash;0',
-    '3&ndash;1&ndash;10',
-    '3&ndash;1&ndash;8',
-    '3&ndash;1.',
-    '3&ndash;1/2',
-    '3&ndash;10&mgr;ms',
-    '3&ndash;10&ndash;12',
-    '3&ndash;104',
-    '3&ndash;1070',
-    '3&ndash;10cm',
     '3&ndash;10mm',
-    '3&ndash;11&ndash;1881',
-    '3&ndash;11&ndash;1898',
-    '3&ndash;11s',
-    '3&ndash;13&ndash;0',
-    '3&ndash;13&ndash;4',
-    '3&ndash;13&ndash;8',
-    '3&ndash;16%',
-    '3&ndash;194',
-    '3&ndash;2&ndash;1',
-    '3&ndash;200',
-    '3&ndash;203',
-    '3&ndash;213',
-    '3&ndash;22',
-    '3&ndash;29',
-    '3&ndash;3&frac12',
     '3&ndash;3&frac12;cm',
-    '3&ndash;3&frac12;in',
-    '3&ndash;3&half',
-    '3&ndash;3&ndash;4',
-    '3&ndash;3&ndash;8',
-    '3&ndash;3.5%',
-    '3&ndash;3.5kg/7&ndash;8lb',
-    '3&ndash;35&deg',
-    '3&ndash;37',
-    '3&ndash;37%',
-    '3&ndash;38',
-    '3&ndash;4&frac12',
-    '3&ndash;4&mgr;m',
-    '3&ndash;4-year',
-    '3&ndash;40',
-    '3&ndash;405',
     '3&ndash;41',
-    '3&ndash;46',
-    '3&ndash;46.47',
-    '3&ndash;48',
-    '3&ndash;4:1',
-    '3&ndash;4cu',
-    '3&ndash;4hr',
-    '3&ndash;4in',
-    '3&ndash;4in-wide',
-    '3&ndash;4mm',
-    '3&ndash;4mm/100',
-    '3&ndash;4myr',
-    '3&ndash;4tbs',
-    '3&ndash;4th',
-    '3&ndash;5&ndash;3',
-    '3&ndash;5,000,000,000',
     '3&ndash;5.4%',
-    '3&ndash;51',
-    '3&ndash;52',
-    '3&ndash;53',
-    '3&ndash;54',
-    '3&ndash;58',
-    '3&ndash;5ft',
-    '3&ndash;5g',
-    '3&ndash;5m',
-    '3&ndash;5min',
-    '3&ndash;5s',
-    '3&ndash;5th',
-    '3&ndash;6&deg',
-    '3&ndash;6&ndash;0',
-    '3&ndash;6,000',
-    '3&ndash;6-day-old',
     '3&ndash;61',
-    '3&ndash;65',
-    '3&ndash;6ff.',
-    '3&ndash;6ft',
-    '3&ndash;6h',
-    '3&ndash;6in',
-    '3&ndash;6pm',
-    '3&ndash;8-week',
-    '3&ndash;8/min',
-    '3&ndash;80',
-    '3&ndash;9&ndash;0',
-    '3&ndash;november',
-    '3&ndash;victory',
-    '3&pgr',
-    '3&prime;10&prime',
-    '3&prime;17&prime',
     '3&prime;29&prime',
-    '3&prime;33&prime',
-    '3&prime;34&prime',
-    '3&prime;40&prime',
-    '3&prime;41&prime',
-    '3&prime;54&prime',
-    '3&rehy;star',
-    '3&shilling;2d.',
-    '3&shilling;6d.',
-    '3&times',
-    '3&times;100',
-    '3&times;2',
-    '3&times;200',
-    '3&times;5',
-    '3\'-',
-    '3\'-5\'',
     '3\'-d',
-    '3\'-half',
-    '3\'-nucleotides',
-    '3\'-o-methylnucleotides',
-    '3\'-side',
-    '3\'-untranslated',
-    '3\'5316:ctggtctgagtcttggttccgtcc',
-    '3\'8e2:gctgtcaaaggcattctccgatgcc',
-    '3\'ad15',
-    '3\'gordon',
-    '3()',
-    '3(10)',
-    '3(1a)',
-    '3(9)',
-    '3(e)',
-    '3(g)',
     '3(k)',
-    '3+1-dimensional',
-    '3+4',
-    '3+7=7+1',
-    '3,00,000',
-    '3,000&deg',
-    '3,000&ndash;3,500',
-    '3,000&ndash;6,000',
-    '3,000+km',
-    '3,000,000-4,000,000',
-    '3,000,000-signature',
-    '3,000-1',
-    '3,000-4000',
-    '3,000-employee',
-    '3,000-ft',
-    '3,000-hectare',
     '3,000-home',
-    '3,000-house',
-    '3,000-man',
-    '3,000-metre',
-    '3,000-mw',
-    '3,000-plus',
-    '3,000-sales-and-you\'re-a-star',
-    '3,000-year',
-    '3,000-year-old',
-    '3,000c',
-    '3,000ft-high',
-    '3,000gph',
-    '3,000hp',
-    '3,000km',
-    '3,000lb',
-    '3,000seater',
     '3,000sq',
-    '3,001st',
-    '3,004,000',
-    '3,007',
-    '3,010',
-    '3,010,000',
-    '3,014,000',
-    '3,017,128',
-    '3,039',
-    '3,040',
-    '3,040m',
-    '3,042,614',
-    '3,044',
-    '3,045',
-    '3,047ft',
-    '3,056',
     '3,059',
-    '3,062',
-    '3,062,065',
-    '3,063',
-    '3,063,000',
-    '3,068',
-    '3,073',
-    '3,075&ndash;3,678',
-    '3,075&ndash;3,685',
-    '3,076',
-    '3,079&ndash;3,660',
-    '3,080',
-    '3,085',
-    '3,090,020',
-    '3,091',
-    '3,095',
     '3,096,125',
-    '3,099',
-    '3,0oo',
-    '3,1,2,4',
-    '3,1,4',
-    '3,100,000',
-    '3,100.00.',
-    '3,102',
-    '3,103,000',
-    '3,106',
-    '3,11',
-    '3,115',
-    '3,116,000',
-    '3,117',
-    '3,123',
-    '3,124%',
     '3,125',
-    '3,128',
-    '3,129',
-    '3,129.1m',
-    '3,132',
-    '3,133',
-    '3,140,000',
-    '3,143',
-    '3,146',
-    '3,150',
-    '3,151',
-    '3,152',
-    '3,154',
-    '3,163',
-    '3,164,908',
-    '3,167&ndash;3,851',
     '3,173',
-    '3,175',
-    '3,177',
-    '3,179,380',
-    '3,190,000',
-    '3,191',
-    '3,197',
-    '3,197,000',
-    '3,198',
-    '3,1981',
-    '3,2',
-    '3,2,3',
-    '3,200&ndash;3,600kg',
-    '3,200km',
-    '3,200rpm',
-    '3,200ton',
     '3,200yrbp',
-    '3,204,955',
-    '3,205ft',
-    '3,206ft',
-    '3,207',
-    '3,212&ndash;1',
-    '3,213.55',
-    '3,215',
-    '3,217',
-    '3,221',
-    '3,224',
-    '3,224.96',
-    '3,229,000',
-    '3,231',
-    '3,232,000',
-    '3,234',
     '3,239',
-    '3,24',
-    '3,241',
-    '3,242%',
-    '3,243,000',
-    '3,244',
-    '3,244.3%',
-    '3,246',
-    '3,247ft',
-    '3,250',
-    '3,250m',
-    '3,251',
-    '3,252',
-    '3,253',
-    '3,260',
-    '3,260ft',
     '3,265,000',
-    '3,268m',
-    '3,275,000',
-    '3,276',
-    '3,278',
-    '3,282,061',
-    '3,284',
-    '3,286',
-    '3,286ft',
-    '3,288',
-    '3,290',
-    '3,292',
-    '3,292,000',
-    '3,293',
-    '3,295.00',
-    '3,299',
     '3,3&prime;-dimethyl',
-    '3,3\',5,5\'',
-    '3,3-diaminobenzidinetetrahydrochloride',
-    '3,300,000&ndash;3,500,000',
-    '3,300ft',
-    '3,300kg',
-    '3,304,000',
-    '3,306',
-    '3,315',
-    '3,316,453',
-    '3,319',
-    '3,319,333.8',
-    '3,323,000',
-    '3,324',
-    '3,325',
-    '3,327',
     '3,332',
-    '3,333',
-    '3,334',
-    '3,335%',
-    '3,339,250',
-    '3,340ft',
-    '3,343km',
-    '3,344',
-    '3,345',
-    '3,355',
-    '3,356',
-    '3,360',
-    '3,361,140',
-    '3,362,000',
-    '3,363,000',
-    '3,364453',
     '3,367,052',
-    '3,368ft',
-    '3,371,000',
-    '3,373,100',
-    '3,381',
-    '3,385ft',
-    '3,386',
-    '3,387',
-    '3,388',
-    '3,393.00',
-    '3,4,5,6',
-    '3,4,6,9,12,14',
-    '3,4-methylene',
-    '3,400gn',
-    '3,400hp',
-    '3,400kg',
     '3,401',
-    '3,403',
-    '3,409,000',
-    '3,409,737',
-    '3,411',
-    '3,418',
-    '3,420',
-    '3,422',
-    '3,423',
-    '3,424',
-    '3,425m',
-    '3,428,000',
-    '3,430,000',
-    '3,432',
-    '3,433',
-    '3,434',
     '3,437',
-    '3,442',
-    '3,444',
-    '3,450-mile',
-    '3,452.4',
-    '3,458',
-    '3,465-million-year-old',
-    '3,466m',
-    '3,478',
-    '3,488',
-    '3,490,000',
-    '3,492.00',
-    '3,493',
-    '3,5,12',
-    '3,5,6&ndash;8,9&ndash;11',
-    '3,5-camp',
     '3,5.1.',
-    '3,500%',
-    '3,500&ndash;5,000',
-    '3,500-10,000',
-    '3,500-4,000',
-    '3,500-km',
-    '3,500-man',
-    '3,500-mile',
-    '3,500-plus',
-    '3,500-strong',
-    '3,500-year-old',
-    '3,500bc',
-    '3,500gns',
-    '3,500yrbp',
-    '3,501',
-    '3,503,103',
     '3,503ft',
-    '3,507,000',
-    '3,508',
-    '3,509',
-    '3,512,000',
-    '3,517',
-    '3,518',
-    '3,525',
-    '3,540',
-    '3,542',
-    '3,544',
-    '3,545',
-    '3,546',
-    '3,547',
-    '3,548',
-    '3,553',
     '3,562',
-    '3,564',
-    '3,565',
-    '3,568',
-    '3,574,000',
-    '3,575,032',
-    '3,575,516',
-    '3,576',
-    '3,580',
-    '3,583.7',
-    '3,592',
-    '3,6,7',
-    '3,6,9,12',
-    '3,600,000',
-    '3,600-member',
-    '3,606',
     '3,608ft',
-    '3,614',
-    '3,614m',
-    '3,615,123',
-    '3,617,026',
-    '3,618',
-    '3,629',
-    '3,636',
-    '3,637',
-    '3,640',
-    '3,64080',
-    '3,647',
-    '3,650',
-    '3,650,000',
-    '3,652,225',
-    '3,666',
     '3,671',
-    '3,673,000',
-    '3,678',
-    '3,681',
-    '3,684',
-    '3,688',
-    '3,690,000',
-    '3,693,098',
-    '3,697',
-    '3,700+km',
-    '3,700ft',
-    '3,701,661',
-    '3,704',
-    '3,704,000',
-    '3,712',
-    '3,715,800',
     '3,717,006',
-    '3,725',
-    '3,727',
-    '3,728',
-    '3,729',
-    '3,733m',
-    '3,734',
-    '3,736',
-    '3,737',
-    '3,737.50',
-    '3,754m',
-    '3,759',
-    '3,774',
-    '3,787',
-    '3,788',
-    '3,797,605',
     '3,8',
-    '3,8,9,15,29',
-    '3,802ft',
-    '3,804,000',
-    '3,812',
-    '3,815',
-    '3,816.1',
-    '3,818',
-    '3,822',
-    '3,825',
-    '3,828ft',
-    '3,832',
-    '3,836',
-    '3,839',
-    '3,842m',
-    '3,850',
     '3,850kms',
-    '3,852ft',
-    '3,857,400',
-    '3,861',
-    '3,862',
-    '3,865',
-    '3,866,659',
-    '3,872',
-    '3,877',
-    '3,881',
-    '3,898',
-    '3,899',
-    '3,9',
-    '3,900,00',
-    '3,900-hour',
-    '3,903',
     '3,903,000',
-    '3,907',
-    '3,917-mile',
-    '3,920',
-    '3,925',
-    '3,928.55',
-    '3,935',
-    '3,935,786',
-    '3,936',
-    '3,937,000',
-    '3,938,000',
-    '3,940',
-    '3,945',
-    '3,948',
-    '3,957',
-    '3,962',
     '3,965',
-    '3,984',
-    '3,990',
-    '3,991',
-    '3,992,000',
-    '3,995',
-    '3-&gt;12',
-    '3-(4-hydroxy-3-methoxyphenyl)propene',
-    '3-.25',
-    '3-11',
-    '3-12-91',
-    '3-149',
-    '3-17',
-    '3-18',
-    '3-189',
-    '3-19',
     '3-2-3-3',
-    '3-22',
-    '3-23',
-    '3-28',
-    '3-3&frac34',
-    '3-3,500',
-    '3-3-93',
-    '3-4-3',
-    '3-4-day',
-    '3-4lb',
-    '3-500,000',
-    '3-51',
-    '3-540534865',
-    '3-545',
-    '3-5c',
-    '3-764327820',
     '3-a-side',
-    '3-a-week',
-    '3-all',
-    '3-alpha-hydroxysteroid',
-    '3-amino-9-ethylcarbazol',
-    '3-aminopropyl-triethoxyl-silane',
-    '3-aminopropyltriethoxysilane',
-    '3-arched',
-    '3-b',
-    '3-bell',
-    '3-bit',
-    '3-bond',
-    '3-book',
-    '3-bp',
-    '3-bromo-5-&lsqb;n-phenyl-',
-    '3-byte',
     '3-car',
-    '3-cell',
-    '3-channel',
-    '3-cholamidopropyl',
-    '3-colour',
-    '3-com',
-    '3-consultant',
-    '3-core',
-    '3-corner',
-    '3-cornered',
-    '3-cresol',
-    '3-cycles',
-    '3-cylinder',
-    '3-deaza-2\'-deoxyadenosine',
-    '3-deazaadenine:thymine',
-    '3-deazaadenylic',
     '3-density',
-    '3-digit',
-    '3-er',
-    '3-event',
-    '3-fathoms',
-    '3-feb.',
-    '3-finger',
-    '3-for-10',
-    '3-ft',
-    '3-game',
-    '3-glucuronide:6-glucuronide',
-    '3-h',
-    '3-hydroxycamphor',
-    '3-hydroxyechinenone',
-    '3-hydroxykynurenine',
-    '3-hydroxypropane-1,2,3-tricarboxylic',
     '3-isobutyl-1-methyl',
-    '3-isobutyl-1-methylxanthine',
-    '3-km-wide',
-    '3-lb/&pound;10.49',
-    '3-lb/&pound;10.99',
-    '3-lb/&pound;14.75',
-    '3-lb/&pound;9.49',
-    '3-letter',
-    '3-link',
-    '3-litres',
-    '3-lobed',
-    '3-man',
-    '3-manual',
-    '3-masted',
-    '3-megabyte',
-    '3-methyl-2-hexenoic',
     '3-mev',
-    '3-minute',
-    '3-mm-thick',
-    '3-monosulphate',
-    '3-oh',
-    '3-over',
-    '3-oxapentane',
-    '3-oxford',
-    '3-oz.',
-    '3-person',
-    '3-phase',
-    '3-phosphate',
-    '3-piece',
-    '3-plus',
-    '3-pu',
-    '3-putted',
     '3-putts',
-    '3-rail',
-    '3-s',
-    '3-shaft',
-    '3-space',
-    '3-spreader',
-    '3-state',
-    '3-streatham',
-    '3-syllable',
-    '3-tier',
-    '3-tiered',
-    '3-to-5',
-    '3-volume',
-    '3-week-',
-    '3-weeks',
-    '3-wheeler',
     '3-wing',
-    '3-yard',
-    '3-yearly',
-    '3-yeast',
-    '3.0&ndash;3.49',
-    '3.0&ndash;3.5%',
-    '3.0&ndash;3.6',
-    '3.0&ndash;4.4',
-    '3.0&ndash;4.9%',
-    '3.0&ndash;6.4',
-    '3.0-5.0',
-    '3.0-supported',
-    '3.000',
-    '3.00:david',
-    '3.00:this',
-    '3.01',
     '3.01%',
-    '3.02',
-    '3.02p',
-    '3.03:1',
-    '3.03pm',
-    '3.04p',
-    '3.05/7.32',
-    '3.05:the',
-    '3.05a.m.',
-    '3.07:1',
-    '3.0bn',
-    '3.0d',
-    '3.0kw',
-    '3.0mgm',
-    '3.0mm',
-    '3.0p',
     '3.0pm',
-    '3.0secs',
-    '3.0x10',
-    '3.1&mdash;3.9',
-    '3.1&ndash;2',
-    '3.1&ndash;23.2',
-    '3.1&ndash;3',
-    '3.1&ndash;6%',
-    '3.1()',
-    '3.1(a)',
-    '3.1(d)',
-    '3.1-compliant',
-    '3.1.2.1',
-    '3.1.2.2',
-    '3.1.6.1',
-    '3.1.6.1.1',
     '3.1.6.2',
-    '3.1.6.2.1',
-    '3.1.6.2.2',
-    '3.1.8',
-    '3.10.1',
-    '3.10.3',
-    '3.10.5(iii)',
-    '3.10.8',
-    '3.10.90',
-    '3.10:northern',
-    '3.10:top',
-    '3.10a',
-    '3.10b',
-    '3.10p',
-    '3.10pm',
-    '3.11&mdash;3.17',
     '3.11&ndash;3.12',
-    '3.11(e)',
-    '3.11.1',
-    '3.12.10',
-    '3.12.2',
-    '3.12.685',
-    '3.12countss',
-    '3.13(c)',
-    '3.136',
-    '3.13b',
-    '3.13c',
-    '3.14%',
-    '3.14&ndash;15',
-    '3.14,16',
-    '3.140',
-    '3.1412',
     '3.14159265',
-    '3.15%',
-    '3.15&ndash',
-    '3.150',
-    '3.15:outsider',
-    '3.15am',
-    '3.15b',
-    '3.16(c)',
-    '3.16.',
-    '3.16a',
-    '3.16c',
-    '3.18&ndash;3.45',
-    '3.18.',
-    '3.181',
-    '3.18m',
-    '3.19&mdash;20',
     '3.19.51',
-    '3.19p',
-    '3.1m-strong',
-    '3.2&deg',
-    '3.2&ndash;3.4',
-    '3.2&ndash;3.5',
-    '3.2(d)',
-    '3.2+8.6/',
-    '3.2-based',
-    '3.2-kb',
-    '3.2-litre',
-    '3.2-mile',
-    '3.2.14',
-    '3.2.3.1',
-    '3.2.3.2',
-    '3.2.6',
     '3.2.7&ndash;10',
-    '3.2.8',
-    '3.2/intel',
-    '3.20&ndash;3.36',
-    '3.20(b)',
-    '3.20(e)',
-    '3.20(f)',
-    '3.201',
-    '3.20pm',
-    '3.21%',
-    '3.21a',
-    '3.22p',
-    '3.23%',
-    '3.23&ndash;25',
-    '3.232',
-    '3.23oz',
     '3.24%',
-    '3.24.85',
-    '3.24.93',
-    '3.25&percnt',
-    '3.25in',
-    '3.25kg',
-    '3.26%',
-    '3.27%',
-    '3.27(c)',
-    '3.28&mdash;65',
-    '3.28.2',
-    '3.280.24jy',
-    '3.2a',
-    '3.2b',
-    '3.2bn',
-    '3.2gbps',
     '3.2gflops',
-    '3.2km/2mls',
-    '3.2kpc',
-    '3.2pc',
-    '3.2pkwh-1',
-    '3.2secs',
-    '3.2static',
-    '3.2x.',
-    '3.3&amp;c',
-    '3.3&ndash;3.4&deg;c',
-    '3.3(i)',
-    '3.3(m)',
-    '3.3-inch',
-    '3.3.',
-    '3.3.1.4',
-    '3.3.2.1',
     '3.3.3.1',
-    '3.3.3.2',
-    '3.3.5.1',
-    '3.3.5.2',
-    '3.3.5.3',
-    '3.3.7',
-    '3.3.7.1',
-    '3.3.7.2',
-    '3.3.90',
-    '3.3.92',
-    '3.3/1000',
-    '3.3/1000deliveries',
-    '3.30&ndash;4pm',
-    '3.30&ndash;5.30pm',
-    '3.30&ndash;6.00',
-    '3.30.',
     '3.30a.m.',
-    '3.30p.m',
-    '3.31-3.35',
-    '3.31a',
-    '3.31b',
-    '3.32.3',
-    '3.33(a)',
-    '3.33(b)',
-    '3.333',
-    '3.35:triumph',
-    '3.35am',
-    '3.35c',
-    '3.35m',
-    '3.36-3.52',
-    '3.36m',
-    '3.375m',
     '3.39+-(0.58)',
-    '3.3:1-compared',
-    '3.3a',
-    '3.3b',
-    '3.3bn',
-    '3.3cm',
-    '3.3km/4ml',
-    '3.3lb',
-    '3.3million',
-    '3.3secs',
-    '3.4&mdash;6',
-    '3.4&mgr;m',
-    '3.4&times;10/l',
-    '3.4(1)',
-    '3.4.10',
-    '3.4.17',
     '3.4.19',
-    '3.4.3.1',
-    '3.4.3.2',
-    '3.4.4&ndash;6',
-    '3.4.5(f)',
-    '3.4.92',
-    '3.4/100000/year',
-    '3.40-3.42',
-    '3.40.2',
-    '3.40:top',
-    '3.41p',
-    '3.42am',
-    '3.43pm',
-    '3.455ghz',
-    '3.45:not',
-    '3.45a',
     '3.47.42',
-    '3.47.43',
-    '3.480',
-    '3.48a',
-    '3.48b',
-    '3.49.6',
-    '3.49a',
-    '3.4:1',
-    '3.4hz',
-    '3.4kg',
-    '3.4m',
-    '3.4secs',
-    '3.4x10',
-    '3.5&aring',
-    '3.5&deg;c',
-    '3.5&ndash;1.5',
     '3.5&ndash;1.8',
-    '3.5&ndash;3.99',
-    '3.5&ndash;4.0',
-    '3.5&ndash;5',
-    '3.5&ndash;6.5',
-    '3.5&ndash;6m',
-    '3.5&ndash;7.5',
-    '3.5&ndash;8',
-    '3.5(a)',
-    '3.5(b)',
-    '3.5-dimensional',
-    '3.5-kg',
-    '3.5-kilobase',
-    '3.5-volt',
-    '3.50-3.56',
-    '3.500kg',
     '3.50m',
-    '3.51b',
-    '3.51m',
-    '3.51p',
-    '3.52%',
-    '3.53%',
-    '3.55am',
-    '3.55p',
-    '3.55pm',
-    '3.55x10',
-    '3.5bn',
-    '3.5c',
-    '3.5fl.',
-    '3.5gb',
-    '3.5ghz',
-    '3.5h',
     '3.5kg/8lb',
-    '3.5kw',
-    '3.5lb',
-    '3.5m/12ft',
-    '3.5mb',
-    '3.5million',
-    '3.5mm',
-    '3.5oz',
-    '3.5p/kwh',
-    '3.5v',
-    '3.6&deg',
-    '3.6&ndash;17.5',
-    '3.6&ndash;3.16',
-    '3.6(a)',
-    '3.6(b)',
-    '3.6-kg',
     '3.6-litre',
-    '3.6.12',
-    '3.6.4',
-    '3.6.5',
-    '3.6/1000',
-    '3.6/100000/year',
-    '3.60&ndash;3.75m',
-    '3.62%',
-    '3.620p',
-    '3.63%',
-    '3.64%',
-    '3.64m',
-    '3.64p',
-    '3.66%',
-    '3.66/7.32',
-    '3.66m',
     '3.6:1',
-    '3.6b-d',
-    '3.6c',
-    '3.6d',
-    '3.6fl',
-    '3.6ghz',
-    '3.6lb',
-    '3.6load',
-    '3.6mls',
-    '3.6mm',
-    '3.6ms',
-    '3.6secs',
-    '3.6x10',
-    '3.7&ndash;35.0',
-    '3.7&ndash;5.4',
-    '3.7&ndash;5.7',
     '3.7-inch',
-    '3.7.16',
-    '3.7.2.1',
-    '3.7.2.2',
-    '3.7.8',
-    '3.70&ndash;15.80',
-    '3.704',
-    '3.72%',
-    '3.73',
-    '3.732',
-    '3.75.',
-    '3.75million',
-    '3.75pc',
-    '3.77',
-    '3.77%',
-    '3.78km',
     '3.79',
-    '3.795p',
-    '3.7in',
-    '3.7mg',
-    '3.7secs',
-    '3.7t/ha',
-    '3.8&ndash;19.7',
-    '3.8&ndash;7.3',
-    '3.8&ndash;8.2',
-    '3.8-metre',
-    '3.8.',
-    '3.8.4',
-    '3.8.5',
-    '3.8/ha',
-    '3.81oz',
-    '3.82',
     '3.827',
-    '3.83',
-    '3.84',
-    '3.85',
-    '3.86%',
-    '3.86pc',
-    '3.88&ndash;3.92',
-    '3.890',
-    '3.89bf',
-    '3.89p',
-    '3.89pc',
-    '3.8:1',
-    '3.8b',
-    '3.8ftl',
-    '3.8in',
-    '3.8kb',
     '3.8km',
-    '3.8mm',
-    '3.8pc',
-    '3.9&ndash;10',
-    '3.9&ndash;3.11',
-    '3.9-kb',
-    '3.9-litre',
-    '3.9-metre',
-    '3.9.1',
-    '3.9.16',
-    '3.9.2',
-    '3.9/100000',
-    '3.91',
-    '3.92',
-    '3.92kg',
-    '3.94.39',
     '3.96',
-    '3.97%',
-    '3.98',
-    '3.98&ndash;402',
-    '3.98.4.02',
-    '3.98p',
-    '3.99%',
-    '3.9:1',
-    '3.9ise',
-    '3.9kb',
-    '3.9sec',
-    '3/-',
-    '3/0',
-    '3/11d.',
-    '3/12/91',
-    '3/142',
     '3/160&amp;c/325&amp;f',
-    '3/162',
-    '3/16in',
-    '3/175',
-    '3/1965',
-    '3/2/92',
-    '3/222',
-    '3/232',
-    '3/2411',
-    '3/25',
-    '3/25c',
-    '3/25sl',
-    '3/3&frac12',
-    '3/335',
-    '3/35',
-    '3/4+',
     '3/4-ton',
-    '3/4/41',
-    '3/437',
-    '3/4d',
-    '3/4in(5cm)',
-    '3/4oz',
-    '3/4p',
-    '3/55',
-    '3/602',
-    '3/60s',
-    '3/62',
-    '3/625',
-    '3/7/92&ndash;5/7/92',
-    '3/80',
-    '3/80ths',
-    '3/83',
     '3/8500',
-    '3/86',
-    '3/89',
-    '3/9/65',
-    '3/91',
-    '3/97',
-    '3/99',
-    '3/an',
-    '3/brain',
-    '3/i',
-    '3/kg2',
-    '3/paint',
-    '3/slowly',
-    '3/take',
-    '3/week',
-    '30%&ndash;75%',
     '30%-50%',
-    '30%:50%',
-    '30&amp;degree',
-    '30&deg/60&deg',
-    '30&deg;c/km',
-    '30&deg;c/r.t.',
-    '30&deg;f',
-    '30&deg;s',
-    '30&deg;w',
-    '30&divide;300',
-    '30&frac12&ins',
-    '30&frac12;ins',
-    '30&frac12;p',
-    '30&ins&times;18&ins&times;12&ins',
-    '30&ins;x12&ins;x12&ins',
-    '30&mdash;1',
     '30&mdash;1.342&mdash;3',
-    '30&mdash;35p',
-    '30&mdash;36',
-    '30&mdash;40',
-    '30&mdash;45p',
-    '30&mdash;9650',
-    '30&mdash;gallon',
-    '30&mdash;produced',
-    '30&mgr;gal',
-    '30&mgr;gml',
-    '30&micro;g/dl',
-    '30&ndash;100',
-    '30&ndash;104',
-    '30&ndash;108',
-    '30&ndash;120',
-    '30&ndash;14',
     '30&ndash;16',
-    '30&ndash;18',
-    '30&ndash;18&ndash;0&ndash;36',
-    '30&ndash;2',
-    '30&ndash;200',
-    '30&ndash;21',
-    '30&ndash;28',
-    '30&ndash;3&ndash;1884',
-    '30&ndash;3&ndash;1885',
-    '30&ndash;30',
-    '30&ndash;3000',
-    '30&ndash;31&deg;c',
-    '30&ndash;33',
-    '30&ndash;33.',
-    '30&ndash;35&deg;c/km',
-    '30&ndash;35cm',
     '30&ndash;35kg',
-    '30&ndash;35p',
-    '30&ndash;38',
-    '30&ndash;4&ndash;106&ndash;1',
-    '30&ndash;40&deg;c',
-    '30&ndash;40&percnt',
-    '30&ndash;4000',
-    '30&ndash;40ft',
-    '30&ndash;40kg',
-    '30&ndash;40kms',
-    '30&ndash;43',
-    '30&ndash;45%',
-    '30&ndash;45&deg;s',
-    '30&ndash;45ml',
-    '30&ndash;46',
-    '30&ndash;49',
     '30&ndash;5',
-    '30&ndash;50&deg',
-    '30&ndash;50mg/kg',
-    '30&ndash;53',
-    '30&ndash;54',
-    '30&ndash;55',
-    '30&ndash;58',
-    '30&ndash;60%',
-    '30&ndash;60&deg',
-    '30&ndash;601',
-    '30&ndash;62',
-    '30&ndash;7-',
-    '30&ndash;74',
-    '30&ndash;77',
-    '30&ndash;78',
-    '30&ndash;8&ndash;1856',
     '30&ndash;8&ndash;1907',
-    '30&ndash;80%',
-    '30&ndash;81',
-    '30&ndash;85%',
-    '30&ndash;9',
-    '30&ndash;9&ndash;1&ndash;19',
-    '30&ndash;90m/100&ndash;300ft',
-    '30&ndash;95',
-    '30&ndash;96',
-    '30&ndash;99',
-    '30&ndash;november',
-    '30&ndash;oct',
-    '30&pound',
-    '30&rehy;day',
-    '30&rehy;odd',
-    '30&rehy;plus',
     '30&times;10',
-    '30&times;22&ins',
-    '30&times;25cm/12&times;10in',
-    '30&times;30&ins',
-    '30&times;30cm',
-    '30&times;45cm/12&times;18in',
-    '30\'n',
-    '30\'w',
-    '30(10%)',
-    '30(3)',
-    '30(4)',
-    '30(5)',
-    '30(8)',
-    '30+km',
-    '30,000&ndash;35,000',
-    '30,000&ndash;45,000',
     '30,000-a-year',
-    '30,000-capacity',
-    '30,000-odd',
-    '30,000-plus',
-    '30,000-square-foot',
-    '30,000-ton',
-    '30,0000',
-    '30,000gns',
-    '30,000lbs',
-    '30,000m',
-    '30,000t',
-    '30,001st',
-    '30,006',
-    '30,007,000',
-    '30,083',
-    '30,100',
     '30,127',
-    '30,246',
-    '30,31,74',
-    '30,340',
-    '30,347',
-    '30,351',
-    '30,364',
-    '30,464',
-    '30,468',
-    '30,479',
-    '30,500',
-    '30,500,000',
-    '30,550',
-    '30,651',
-    '30,786',
-    '30,80',
     '30,875',
-    '30,908',
-    '30,950',
-    '30,980',
-    '30-.46',
-    '30-0',
-    '30-16',
-    '30-30-20-20',
-    '30-30cm',
-    '30-40,000',
-    '30-40,000,000',
-    '30-40cm',
-    '30-59',
-    '30-9-93',
-    '30-97',
-    '30-99&deg;c',
     '30-all',
-    '30-aug.',
-    '30-billion',
-    '30-cm-wide',
-    '30-date',
-    '30-dec.1',
-    '30-dec.4',
-    '30-december',
-    '30-denier',
-    '30-entry',
-    '30-foot-high',
-    '30-foot-wide',
-    '30-game',
-    '30-gauge',
-    '30-in',
-    '30-item',
     '30-key',
-    '30-kilometer',
-    '30-kilowatt',
-    '30-km',
-    '30-knot',
-    '30-love',
-    '30-m',
-    '30-mesh',
-    '30-metre-long',
-    '30-micrometre',
-    '30-mile-long',
-    '30-milers',
-    '30-million-dollar',
-    '30-million-ton',
-    '30-ml',
-    '30-mph',
     '30-over',
-    '30-pfennig',
-    '30-prison',
-    '30-right',
-    '30-rocket',
-    '30-room',
-    '30-runner',
-    '30-share',
-    '30-shilling',
-    '30-stone',
-    '30-stretch',
-    '30-vehicle',
-    '30-week',
-    '30-year-affair',
-    '30-yearold',
-    '30.0%',
     '30.00',
-    '30.000,00',
-    '30.003s',
-    '30.05',
-    '30.06',
-    '30.06sec',
-    '30.07.93',
-    '30.1&times;10/l',
-    '30.1.1.1',
-    '30.10.64',
-    '30.102v.',
-    '30.103r.',
-    '30.1076',
-    '30.11.92',
-    '30.139&mdash;40',
-    '30.18&ndash;20',
     '30.1pc',
-    '30.21',
-    '30.22',
-    '30.24',
-    '30.2k',
-    '30.2pc',
-    '30.33',
-    '30.36',
-    '30.4&percnt',
-    '30.40',
-    '30.44',
-    '30.475',
-    '30.49',
-    '30.4p',
-    '30.5&times;20.2',
-    '30.5&times;25.4cm',
     '30.5&times;41.8',
-    '30.53',
-    '30.6.92',
-    '30.60.64',
-    '30.61',
-    '30.63p',
-    '30.66',
-    '30.7&deg;c',
-    '30.7.87',
-    '30.78',
-    '30.80',
-    '30.88',
-    '30.8km',
-    '30.8m',
-    '30.8pc',
-    '30.9.1991',
     '30.9.86',
-    '30.9.91',
-    '30.92',
-    '30/-40%',
-    '30/1/86',
-    '30/10/86',
-    '30/115',
-    '30/16&ndash;1',
-    '30/3/41',
-    '30/3/87',
-    '30/35',
-    '30/4/41',
-    '30/4/87',
-    '30/4/90',
-    '30/43',
-    '30/567',
     '30/58',
-    '30/60ths',
-    '30/7/87',
-    '30/83',
-    '30/92',
-    '300&amp;degree',
-    '300&amp;degree:c',
-    '300&deg;m',
-    '300&dollar;c',
-    '300&micro',
-    '300&micro;g',
-    '300&ndash;10,000',
-    '300&ndash;1000',
-    '300&ndash;1324',
-    '300&ndash;15',
-    '300&ndash;1500',
     '300&ndash;3',
-    '300&ndash;307',
-    '300&ndash;325',
-    '300&ndash;350',
-    '300&ndash;350kg',
-    '300&ndash;359',
-    '300&ndash;400,000',
-    '300&ndash;400kw',
-    '300&ndash;400mw',
-    '300&ndash;450',
-    '300&ndash;450mm',
-    '300&ndash;6',
-    '300&ndash;600',
-    '300&ndash;600km',
-    '300&ndash;700kg',
-    '300&sol;600',
     '300(2)',
-    '300+',
-    '300,00',
-    '300,000&ndash;400,000',
-    '300,000&ndash;450,000',
-    '300,000&ndash;500,000',
-    '300,000,000,000,000',
-    '300,000-400,000',
-    '300,000-a-year',
-    '300,000-hectare',
-    '300,000km',
-    '300-1',
-    '300-330',
-    '300-500lbs',
-    '300-berth',
-    '300-ft',
     '300-goal',
-    '300-hour',
-    '300-kilometre',
-    '300-mw',
-    '300-name',
-    '300-person',
-    '300-point',
-    '300-pounds',
-    '300-pupil',
-    '300-run',
-    '300-seat',
-    '300-signature',
-    '300-tonne',
-    '300-watt',
-    '300-work',
-    '300-years-old',
     '300.',
-    '300/15',
-    '300/400',
-    '3000&deg;f',
-    '3000&ndash;4500',
-    '3000&ndash;5000',
-    '3000&ndash;8000',
-    '3000\'er',
-    '3000\'ers',
-    '3000+',
-    '3000-',
-    '3000-acre',
-    '3000-based',
-    '3000-fold',
-    '3000-year-old',
-    '3000/2130',
     '3000/3100',
-    '3000/500',
-    '3000/800',
-    '300000000',
-    '300072',
-    '3000ad',
-    '3000gns',
-    '3000gt',
-    '3000kg',
-    '3000lb',
-    '3000mm',
-    '3000mp',
-    '3000ppm',
-    '3000psi',
-    '3000rpm',
-    '3001.3',
     '3001.6',
-    '30010-11',
-    '300150&deg;f',
-    '30028',
-    '3003',
-    '3003.9',
-    '30030',
-    '300399kg',
-    '3004.5',
-    '30045-46',
-    '3005.2',
-    '3005.5',
-    '3006.1',
-    '3006/19',
-    '3007.5',
-    '300770',
     '3008.3',
-    '30080',
-    '3009&ndash;3010',
-    '3009.1',
-    '30099',
-    '300bc',
-    '300bp',
-    '300c',
-    '300cals',
-    '300cc',
-    '300d',
-    '300e-24',
-    '300kjmol',
-    '300km/h',
-    '300kms',
-    '300kph',
     '300kw',
-    '300kwh',
-    '300kyr',
-    '300lbs',
-    '300m2',
-    '300mile',
-    '300ml/&frac12;pint',
-    '300mls',
-    '300mm-long',
-    '300mw',
-    '300oc',
-    '300pa',
-    '300rpm',
-    '300sl-224',
-    '300t',
-    '300x300',
     '301&ndash;3',
-    '301&ndash;4',
-    '301,455',
-    '301.34',
-    '3010&ndash;r50b',
-    '3010.1',
-    '3010ft',
-    '301183',
-    '3012',
-    '30120',
-    '30129',
-    '30131',
-    '301314',
-    '3015',
-    '301551',
-    '30159-60',
     '3016',
-    '30165',
-    '30165-75',
-    '3016611',
-    '301739',
-    '301831',
-    '301833',
-    '301933',
-    '30194',
-    '302&ndash;3',
-    '302&ndash;303',
-    '302&ndash;5',
-    '302&ndash;8',
-    '302(2)',
-    '302-day',
-    '302.30',
     '302.5.140(6)',
-    '3020',
-    '30200',
-    '30205-12',
-    '302249',
-    '302264',
-    '30229',
-    '302332',
-    '3024.8',
-    '3025.0',
-    '3025.3',
-    '30250',
-    '30253',
-    '302606',
-    '302634',
-    '30270',
     '3028.0',
-    '30287-90',
-    '3029',
-    '302f',
-    '302mv',
-    '303&ndash;305',
-    '303&ndash;5',
-    '303(5)',
-    '303,000',
-    '303,200',
-    '303,504',
-    '303-6',
-    '303.1',
-    '303/31',
-    '3031.0',
-    '3031.2',
     '30311&ndash;0741',
-    '3032.1',
-    '303205',
-    '30322',
-    '30323',
-    '30324',
-    '3034',
-    '3035',
-    '3035.4',
-    '30353',
-    '30359-61',
-    '3036/',
-    '30367-75',
-    '3037.00',
-    '3037.2',
-    '3037.5',
     '3038',
-    '3038.6',
-    '3038.7',
-    '3039.3',
-    '303a',
-    '303p',
-    '303x',
-    '304&ndash;305',
-    '304,000',
-    '304,660',
-    '304.2',
-    '3040.1',
-    '30400',
-    '304027',
-    '30408528',
-    '3041,3042',
     '30411',
-    '3042',
-    '3042.00',
-    '3044',
-    '3044.6',
-    '304546',
-    '30460',
-    '30472-73',
-    '30474-75',
-    '3047ft',
-    '3048,3049,3051,3052',
-    '3048mm',
-    '3049.3',
-    '30495-96',
-    '304ff',
-    '304k',
     '304s',
-    '305&ndash;10',
-    '305&ndash;282',
-    '305&ndash;315',
-    '305&ndash;330kg',
-    '305&ndash;6',
-    '305&ndash;610mm',
-    '305&ndash;691',
-    '305\'s',
-    '305,140',
-    '305,344',
-    '305-6',
-    '305.65',
-    '3050/resv',
-    '30506-07',
-    '3051.1',
     '3051.6',
-    '3052',
-    '3052.1',
-    '30520',
-    '3053,3129,3130,3135',
-    '3053.1',
-    '30530',
-    '30535-36',
-    '30541-55',
-    '30548',
-    '30550',
-    '305545',
-    '305567',
-    '30560',
-    '3057.6',
-    '30574-75',
     '3058',
-    '30584',
-    '30585',
-    '3059.00',
-    '305a',
-    '305b',
-    '305kg',
-    '305mm',
-    '305pp',
-    '306&ndash;281',
-    '306&ndash;613',
-    '306,000',
-    '3060',
-    '30600',
-    '30606-07',
-    '3061',
     '30619',
-    '30619-20',
-    '3063',
-    '30630',
-    '30642-44',
-    '3065.5',
-    '306640',
-    '3067.2',
-    '3067.7',
-    '30685',
-    '3069',
-    '3069.3',
-    '306ff',
-    '306khz',
-    '306m',
-    '306s',
     '307&ndash;20',
-    '307&ndash;337',
-    '307&ndash;37',
-    '307&ndash;9',
-    '307,000',
-    '307,472',
-    '3070',
-    '3070.6',
-    '30700-02',
-    '307009',
-    '30708',
-    '3072',
-    '3072.6',
-    '3072.7',
-    '30720',
-    '3073.6',
     '30740',
-    '30748',
-    '30756',
-    '3076',
-    '30763-64',
-    '3077',
-    '3077.6',
-    '30777',
-    '3078',
-    '3078642',
-    '30787',
-    '307f',
-    '308&ndash;16',
-    '308&ndash;24',
-    '308&ndash;312',
-    '308&ndash;61',
     '308&times;10/l',
-    '30811',
-    '30817',
-    '3082',
-    '30833-36',
-    '308334003',
-    '308352',
-    '3085.2',
-    '3085.6',
-    '3086',
-    '3089',
-    '30890',
-    '308b',
-    '308bhp',
-    '308d',
-    '308gtb',
     '308k',
-    '308lb',
-    '308p',
-    '309&ndash;316',
-    '309(1)',
-    '309(2)',
-    '309,000',
-    '309-day',
-    '309-room',
-    '309.5%',
-    '3090&ndash;600',
-    '3090-200',
-    '3090-300s',
-    '3090-compatible',
-    '3090-comppatible',
-    '3090-e',
     '3090-es',
-    '3090-s',
-    '30900',
-    '30911-12',
-    '3092',
-    '3092.4',
-    '3093',
-    '3093.1',
-    '30931',
-    '3094&sol;86',
-    '3094.7',
-    '3095',
-    '3095.9',
-    '30957-58',
-    '309605',
-    '3097',
     '3098',
-    '3098.5',
-    '30980',
-    '30982',
-    '30991',
-    '30994',
-    '30994-96',
-    '309f.',
-    '309p.',
-    '309s',
-    '30:00',
-    '30:00.4',
-    '30:1&ndash;6',
-    '30:13.74',
-    '30:14',
-    '30:16',
     '30:28.4.',
-    '30:3',
-    '30:33',
-    '30:37ff.',
-    '30:49.30',
-    '30:70',
-    '30b',
-    '30b+d',
-    '30bhp',
-    '30bp',
-    '30c1',
-    '30cm/12-inch',
-    '30cm/12in',
-    '30cwt/acre',
-    '30cycles.',
-    '30ev',
     '30ft-high',
-    '30ft.',
-    '30g/t',
-    '30ghz',
-    '30gph',
-    '30ha',
-    '30hmz',
-    '30hrs',
-    '30in&ndash;41in',
-    '30inch',
-    '30jy',
-    '30km.',
-    '30kms',
-    '30kph',
-    '30l.j.q.b.321',
-    '30mg-may',
     '30mg/100ml',
-    '30million',
-    '30mins',
-    '30minute',
-    '30ml/1fl',
-    '30mls',
-    '30mpg',
-    '30mt',
-    '30ng/ml',
-    '30ngml',
-    '30no',
-    '30o',
-    '30o-segments',
-    '30p-a-share',
-    '30pas',
-    '30ppm',
     '30r.p.m.',
-    '30room',
-    '30sq',
-    '30sq.ft',
-    '30th&ndash;31st',
-    '30th/1st',
-    '30wb',
-    '30x2x2in',
-    '30x30&ins',
-    '30x30ft',
-    '31&deg;c',
-    '31&deg;f',
-    '31&frac12;in',
-    '31&mdash;2.',
-    '31&mdash;7',
-    '31&middot;2',
     '31&ndash;10',
-    '31&ndash;104778240',
-    '31&ndash;104894120',
-    '31&ndash;12&ndash;79',
-    '31&ndash;12&ndash;84',
-    '31&ndash;120',
-    '31&ndash;14',
-    '31&ndash;15&ndash;0&ndash;30',
-    '31&ndash;2&ndash;1&ndash;5',
-    '31&ndash;27',
-    '31&ndash;28',
-    '31&ndash;35',
-    '31&ndash;36',
-    '31&ndash;37',
-    '31&ndash;4',
-    '31&ndash;40',
     '31&ndash;43%',
-    '31&ndash;46',
-    '31&ndash;49',
-    '31&ndash;5',
-    '31&ndash;51',
-    '31&ndash;53',
-    '31&ndash;55',
-    '31&ndash;57',
-    '31&ndash;67',
-    '31&ndash;70',
-    '31&ndash;78',
-    '31&ndash;83',
-    '31&ndash;85',
-    '31&shilling;7d',
-    '31(6)',
-    '31(9)',
     '31+2',
-    '31+2+8',
-    '31,033',
-    '31,050',
-    '31,098',
-    '31,138',
-    '31,170',
-    '31,171',
-    '31,172',
-    '31,180',
-    '31,184',
-    '31,1992',
-    '31,207',
-    '31,310',
-    '31,32,33,34,28',
-    '31,33',
     '31,35,65,66,71,76,77,78,79,84,85,87,88',
-    '31,506,000',
-    '31,563',
-    '31,578',
-    '31,667',
-    '31,723',
-    '31,760,000',
-    '31,782',
-    '31,800',
-    '31,801',
-    '31,814',
-    '31,875',
-    '31,942',
-    '31-',
-    '31-13',
-    '31-14',
     '31-24',
-    '31-27',
-    '31-33',
-    '31-4',
-    '31-5',
-    '31-6',
-    '31-aug',
-    '31-bit',
-    '31-fight',
-    '31-frame',
-    '31-gram',
-    '31-issue',
-    '31-jan.',
-    '31-match',
-    '31-nov.1',
-    '31-page',
     '31-points',
-    '31-treated',
-    '31.00',
-    '31.02',
-    '31.04',
-    '31.06',
-    '31.10.',
-    '31.10.89',
-    '31.106v&mdash;258',
-    '31.12.88',
-    '31.13',
-    '31.142',
-    '31.15sec',
-    '31.188',
-    '31.21.6',
-    '31.22.1&ndash;4',
     '31.23.8&ndash;9',
-    '31.25.5',
-    '31.26.9',
-    '31.28',
-    '31.29',
-    '31.2mb',
-    '31.3.93',
-    '31.31',
-    '31.34',
-    '31.35',
-    '31.36',
-    '31.3p',
-    '31.3pc',
-    '31.4120',
-    '31.46',
-    '31.49',
     '31.4kg/s/ha',
-    '31.5&ins',
-    '31.5.1865',
-    '31.5.91',
-    '31.50',
-    '31.52',
-    '31.5p',
-    '31.62',
-    '31.64',
-    '31.69',
-    '31.6p',
-    '31.7.1871',
-    '31.7kg',
-    '31.8.92',
-    '31.80',
-    '31.83',
     '31.8mpg',
-    '31.93',
-    '31/1/87',
-    '31/1/93',
-    '31/10.15',
-    '31/10/92',
-    '31/12/89',
-    '31/2',
-    '31/2:1',
-    '31/3/87',
-    '31/33',
-    '31/39',
-    '31/40',
-    '31/585',
-    '31/60',
-    '31/8/78',
     '31/837',
-    '31/92',
-    '310%',
-    '310&deg;c',
-    '310&mgr;gml',
-    '310&ndash;12',
-    '310&ndash;15',
-    '310&ndash;6',
-    '310-265',
-    '310-325',
-    '310-member',
-    '310.55',
-    '310.60',
-    '310.65',
-    '310/312',
-    '310/l',
     '3100.0',
-    '31000',
-    '31005',
-    '31008',
-    '3100s',
-    '3101.9',
-    '3103.9',
-    '31039',
-    '31040',
-    '31045-46',
-    '31045-47',
-    '310455',
-    '3106',
-    '31071-72',
-    '310731',
-    '31077',
     '3108.0',
-    '3108.6',
-    '31087',
-    '3109',
-    '31090',
-    '310ff',
-    '310ft',
-    '310mm',
-    '310s',
-    '310x82mm',
-    '311&ndash;12',
-    '311&ndash;13',
-    '311&ndash;36',
-    '311,000',
-    '311,650',
-    '311/585',
     '3111',
-    '3111.4',
-    '311103',
-    '31123',
-    '311288',
-    '3114',
-    '3115&mdash;19',
-    '3115.1',
-    '311555',
-    '311600',
-    '311611',
-    '31165',
-    '31165-66',
-    '31170',
-    '31180',
-    '31197',
     '31198/9210',
-    '311b',
-    '311h',
-    '312&ndash;13',
-    '312&ndash;8',
-    '312,800',
-    '312-pound',
-    '312.8mm',
-    '312/1',
-    '312/311',
-    '31205',
-    '31206',
-    '31213',
-    '31220',
-    '312245',
-    '312350',
     '3124',
-    '31246',
-    '31246-47',
-    '3125.5',
-    '31253',
-    '31253-54',
-    '31256',
-    '31265',
-    '312793/784',
-    '31282',
-    '3129.6',
-    '31290',
-    '312bc',
-    '312pp',
-    '312t4',
-    '313&ndash;14',
     '313&ndash;315',
-    '313&ndash;39',
-    '313&times;10',
-    '313,000',
-    '313,683',
-    '313-foot',
-    '313.64',
-    '313000',
-    '31304/9983',
-    '31312',
-    '313131',
-    '313133',
-    '3132&ndash;3133',
-    '31331',
-    '31337',
-    '313437',
     '3135.8',
-    '31352',
-    '31352-53',
-    '31353-54',
-    '3136',
-    '3137',
-    '3137.6',
-    '31370',
-    '31377-78',
-    '313810',
-    '31389-401',
-    '3139jd7104',
-    '313s',
-    '314%',
-    '314&ndash;17',
-    '314&ndash;243',
     '314&ndash;315',
-    '314,707',
-    '314.8%',
-    '3142,3150',
-    '3143',
-    '3143/4',
-    '31439',
-    '314408',
-    '314411',
-    '31445',
-    '3145',
-    '31460',
-    '31466',
-    '31470',
-    '3148',
-    '31486',
     '314868',
-    '3149',
-    '3149.0',
-    '31490',
-    '31497',
-    '314cm',
-    '314kg',
-    '314p',
-    '315&ndash;18',
-    '315&ndash;22',
-    '315,000',
-    '315,600',
-    '315,800',
-    '315-cartridge',
-    '315-km',
-    '315-seat',
     '315-yard',
-    '315.29',
-    '315.89',
-    '3151',
-    '3151&mdash;62',
-    '31510',
-    '31513-15',
-    '31515',
-    '3152',
-    '31520',
-    '31525-37',
-    '3153',
-    '3154',
-    '3154.3',
-    '31541',
-    '3155',
     '315556',
-    '31563',
-    '31565-71',
-    '315850',
-    '31592-93',
-    '31596',
-    '315lbs',
-    '316&ndash;17',
-    '316&ndash;24',
-    '316-',
-    '3160',
-    '31604',
-    '31605-07',
-    '3161',
-    '31620',
-    '31627',
     '3163',
-    '3163.3',
-    '31630',
-    '31634',
-    '3164',
-    '3164.1',
-    '3164.4',
-    '3165',
-    '3165.',
-    '3165.3',
-    '31658',
-    '3166',
-    '3166.9',
-    '31677-79',
-    '31677-80',
-    '31682',
     '31684',
-    '316a.',
-    '316i',
-    '316mbar',
-    '316nm',
-    '316pp.',
-    '316s.',
-    '316sw',
-    '316th',
-    '317&mdash;20',
-    '317&ndash;21',
-    '317&ndash;324',
-    '317&ndash;8',
-    '317,841',
-    '317.4',
-    '317.6',
     '317.7',
-    '317.893',
-    '317/0',
-    '317/337',
-    '317/5167=6.1%',
-    '3170&mdash;86',
-    '31707',
-    '31709-18',
-    '3171.0',
-    '3172',
-    '3172&mdash;8',
-    '3173.33',
-    '317315',
-    '317317',
-    '3174016',
-    '31749',
     '3174s',
-    '31765-66',
-    '3177',
-    '317i&egrave;me',
-    '317kg.',
-    '317p',
-    '318&mdash;19',
-    '318&mdash;36',
-    '318&mdash;51',
-    '318&micro',
-    '318&ndash;23',
-    '318&ndash;47',
-    '318&ndash;9',
-    '318,317',
-    '318-335',
-    '318-ton',
     '318.9',
-    '3180',
-    '3180&micro',
-    '318000',
-    '3181.35',
-    '318171',
-    '3183',
-    '3183.9',
-    '31831',
-    '31837',
-    '3184',
-    '3185',
-    '3187',
-    '3188.3',
-    '31880',
-    '3188429',
     '31889',
-    '318990',
-    '318k',
-    '318kcals',
-    '318s',
-    '319&ndash;20',
-    '319&ndash;31',
-    '319,000,000',
-    '319-member',
-    '319/321',
-    '319/82',
-    '3190&mdash;220',
-    '3190&ndash;202',
-    '319036',
-    '319041',
-    '31908',
     '319099',
-    '3191&mdash;6',
-    '31914-20',
-    '31920',
-    '319232',
-    '3193&mdash;6',
-    '3193/4',
-    '31930',
-    '3194',
-    '31940',
-    '319448',
-    '31947',
-    '3195',
-    '31950',
-    '31950-51',
-    '31950-52',
     '3197',
-    '3199',
-    '3199.0',
-    '319p',
-    '31:1&ndash;11',
-    '31:10ff',
-    '31:12&ndash;18',
-    '31:13',
-    '31:14',
-    '31:16',
-    '31:17',
-    '31:19',
-    '31:30',
-    '31:31ff',
-    '31:44',
-    '31:8',
     '31a\'s',
-    '31a.',
-    '31april',
-    '31bc-ad',
-    '31bn',
-    '31cm&times;17cm',
-    '31e',
-    '31e-55e',
-    '31f',
-    '31f.',
-    '31ff',
-    '31g',
-    '31k',
-    '31kg/s/ha',
-    '31mw',
-    '31pp',
     '31secs',
-    '31st-minute',
-    '31tel',
-    '31typewriter',
-    '31year-old',
-    '32&deg;22\'20\'\'n',
-    '32&deg;c/km',
-    '32&egrave;me',
-    '32&mdash;3',
-    '32&mdash;40',
-    '32&middot;5cm',
-    '32&middot;5x38cm',
-    '32&middot;8',
-    '32&ndash;34%',
-    '32&ndash;36',
-    '32&ndash;40',
     '32&ndash;46',
-    '32&ndash;47',
-    '32&ndash;4730',
-    '32&ndash;48',
-    '32&ndash;5',
-    '32&ndash;51&ndash;94&ndash;65',
-    '32&ndash;55',
-    '32&ndash;63%',
-    '32&ndash;64',
-    '32&ndash;8',
-    '32&ohm',
-    '32&shilling;6d',
-    '32\'',
-    '32\'s',
-    '32(3)',
-    '32(4)',
     '32(a)',
-    '32(c)',
-    '32(h)',
-    '32+',
-    '32,000,000',
-    '32,000-man',
-    '32,000-strong',
-    '32,020',
-    '32,027',
-    '32,195',
-    '32,273',
-    '32,300,000',
-    '32,33',
-    '32,350',
-    '32,400',
-    '32,44',
     '32,450',
-    '32,513',
-    '32,611',
-    '32,669',
-    '32,767',
-    '32-1',
-    '32-10',
-    '32-17',
-    '32-34&deg',
-    '32-37%',
-    '32-38',
-    '32-46',
-    '32-8',
-    '32-box',
-    '32-channel',
-    '32-episode',
     '32-fold',
-    '32-footers',
-    '32-gallon',
-    '32-hour',
-    '32-house',
-    '32-its',
-    '32-km/20-ml',
-    '32-length',
-    '32-player',
-    '32-pounder',
-    '32-pounders',
-    '32-seat',
-    '32-thousandths',
-    '32-tonners',
-    '32.04',
-    '32.09',
     '32.0sec',
-    '32.10',
-    '32.13',
-    '32.1p',
-    '32.20',
-    '32.24',
-    '32.28',
-    '32.3&deg;c',
-    '32.34.3',
-    '32.35',
-    '32.3m',
-    '32.3p',
-    '32.3pc',
-    '32.4&ndash;33.9',
-    '32.40',
-    '32.45',
     '32.48',
-    '32.49',
-    '32.4kg',
-    '32.50-&pound;5',
-    '32.54',
-    '32.5p',
-    '32.63',
-    '32.6mpg',
-    '32.75',
-    '32.768khz',
-    '32.7p',
-    '32.84m.',
-    '32.94',
-    '32.9p',
-    '32/',
-    '32/21',
     '32/33',
-    '32/357',
-    '32/426',
-    '32/74',
-    '32/81',
-    '32/92',
-    '320&deg',
-    '320&mdash;21',
-    '320&mgr;m',
-    '320&ndash;50',
-    '320&ndash;525mb',
-    '320&ndash;8190',
-    '320(4)',
-    '320-350',
-    '320-mile',
-    '320-yard',
     '320.2',
-    '320.97',
-    '320/515',
-    '3200&ndash;2100',
-    '3200&ndash;400',
-    '3200&ndash;600',
-    '320000',
-    '320000000',
-    '32003-04',
-    '3200km',
-    '3201',
-    '32014',
-    '3202&ndash;0494',
-    '32020',
-    '320333',
-    '320365',
     '32040',
-    '32050',
-    '320522',
-    '320744',
-    '32076-78',
-    '3208',
-    '32080',
-    '320881',
-    '320a',
-    '320bhp',
-    '320h',
-    '320i',
-    '320kcals',
-    '320km',
-    '320km/',
-    '320m-bytes',
     '320mb/525mb',
-    '320mm',
-    '320nt',
-    '321&ndash;322',
-    '321&ndash;324',
-    '321-member',
-    '321-seat',
-    '321-type',
-    '321.5',
-    '321.7',
-    '321/1077',
-    '3211',
-    '321242/ext',
-    '32130',
-    '321307',
-    '321334',
     '32140',
-    '321462',
-    '3215',
-    '3215&mdash;55',
-    '321535',
-    '321590',
-    '3216',
-    '32163',
-    '3217',
-    '32179',
-    '32180',
-    '32180-81',
-    '321nm',
-    '321p',
-    '322&ndash;32',
-    '322&ndash;323',
     '322&ndash;342',
-    '322&ndash;6',
-    '322,000',
-    '322,572',
-    '322,600',
-    '322,800',
-    '322-page',
-    '322.32',
-    '322.7',
-    '322064',
-    '3220km',
-    '3221',
-    '3221&mdash;32',
-    '32210',
-    '32218',
-    '3222',
     '32221',
-    '3223.9',
-    '32239-40',
-    '32256-57',
-    '322571',
-    '32262',
-    '3227/3228',
-    '32271',
-    '32278/9734',
-    '322782',
-    '32297',
-    '32299-300',
-    '322a',
-    '322a(7)ca',
-    '322b',
-    '322kms/200mls',
     '322lbs',
-    '322n',
-    '323&mdash;4',
-    '323&ndash;4',
-    '323&ndash;5998',
-    '323,653',
-    '323-170',
-    '323.',
-    '323.31',
-    '323/534',
-    '3230',
-    '323000',
-    '32327-28',
-    '3233.2',
-    '32338',
-    '3234',
     '3234.2',
-    '32340',
-    '32342',
-    '3235',
-    '32350',
-    '3235374',
-    '323546',
-    '323587',
-    '3236&mdash;41',
-    '3238&mdash;9',
-    '3238.0',
-    '323a',
-    '323bp',
-    '323p',
-    '323pp.',
-    '324&ndash;2',
     '324&ndash;326',
-    '324&ndash;340',
-    '324&ndash;5',
-    '324&ndash;7',
-    '324(3)',
-    '324,000',
-    '324,200',
-    '324,400',
-    '324,500',
-    '324-yard',
-    '324.62',
-    '324.75',
-    '324.87',
-    '324/86',
-    '3240',
-    '32400',
     '3240s48405',
-    '3241',
-    '32410',
-    '32430',
-    '32458',
-    '3246=7',
-    '3247',
-    '32482',
-    '32494-96',
-    '324c',
-    '324h',
-    '325%',
-    '325&deg',
-    '325&mdash',
-    '325&ndash;1036',
-    '325&ndash;350kg',
     '325&ndash;450g/12&ndash;16oz',
-    '325&ndash;7',
-    '325(2)',
-    '325,000,000',
-    '325-328',
-    '325-member',
-    '325.26',
-    '325.5',
-    '325.8',
-    '325/l',
-    '32503',
-    '32505',
-    '32510',
-    '32513-17',
-    '32513-7',
-    '3253',
     '3255&mdash;6',
-    '32553-55',
-    '325620',
-    '3257&mdash;8',
-    '3258',
-    '32588',
-    '3259',
-    '32592072',
-    '325921',
-    '32599',
-    '325f',
-    '325f/160c/gas',
-    '325ft',
-    '325g',
-    '325ha',
-    '325ise',
     '325l',
-    '325lp',
-    '325pp.',
-    '325sli',
-    '325sq',
-    '325sx',
-    '325td',
-    '326&ndash;327',
-    '326&ndash;7',
-    '326&ndash;8',
-    '326&ndash;9',
-    '326,217.75',
-    '326,866',
-    '326.5',
-    '326.8p',
-    '3260',
     '326117',
-    '32614',
-    '32614-15',
-    '32614-18',
-    '326180',
-    '32620',
-    '32622',
-    '326378',
-    '32643',
-    '32646',
-    '32646-47',
-    '32659',
-    '3266',
-    '3267',
-    '32674',
-    '32675',
     '32676',
-    '32680',
-    '326803',
-    '32690',
-    '326bhp',
-    '327&ndash;32',
-    '327&ndash;33',
-    '327&ndash;9',
-    '327,000',
-    '327,027',
-    '327,737',
-    '327-member',
-    '3270-emulating',
-    '3270-sna',
-    '3270-type',
-    '3270/3770',
     '3271',
-    '32717-18',
-    '3272',
-    '32722',
-    '327272',
-    '32741',
-    '32755-56',
-    '32756-57',
-    '327583',
-    '3276&mdash;8',
-    '327603',
-    '3277',
-    '32778',
-    '32781',
-    '3279ft',
-    '327d',
     '328%',
-    '328&ndash;37-reply',
-    '328\'s',
-    '328(4)',
-    '328.',
-    '328.13',
-    '328.6%',
-    '32803',
-    '32804',
-    '32806',
-    '32808',
-    '32809',
-    '32816',
-    '3282',
-    '3282&mdash;7',
-    '32823',
     '328260',
-    '328290',
-    '3284',
-    '32860',
-    '3288&mdash;93',
-    '32898',
-    '32899',
-    '32899-900',
-    '328f',
-    '328ff',
-    '328ft',
-    '328p',
-    '328pp',
-    '329&ndash;2839',
-    '329&ndash;325',
-    '329&ndash;330',
     '329&ndash;334',
-    '329&ndash;335',
-    '329&ndash;389',
-    '329,000',
-    '329.',
-    '329.4164.3gm',
-    '32919-20',
-    '32927-28',
-    '3293&mdash;4',
-    '32938',
-    '3294',
-    '3294&mdash;00',
-    '3294&mdash;302',
-    '32942',
-    '329556',
-    '3298',
     '32980',
-    '32981',
-    '32990',
-    '32998',
-    '329b',
-    '32:00',
-    '32:14&ndash;20',
-    '32:18b-23',
-    '32:2',
-    '32:27',
-    '32:44',
-    '32:7&ndash;14',
-    '32a&ndash;d',
-    '32a(2)',
-    '32b&ndash;38c',
-    '32bn',
     '32cm',
-    '32d&ndash;h',
-    '32dm2',
-    '32e',
-    '32f',
-    '32kg/s/ha',
-    '32kmh',
-    '32lb',
-    '32no',
-    '32pp.',
-    '32pts',
-    '32secs',
-    '32tbps',
-    '32tp1',
-    '32w',
-    '32x32x8cm',
     '33%&ndash;40%',
-    '33%-43%',
-    '33&commat;2/3',
-    '33&deg;6\'50\'\'n',
-    '33&deg;c/km',
-    '33&frac12;in',
-    '33&frac12;ins',
-    '33&frac58',
-    '33&frac58;in',
-    '33&ins',
-    '33&mgr;m',
-    '33&ndash&frac12',
-    '33&ndash;0',
-    '33&ndash;10',
-    '33&ndash;14',
-    '33&ndash;15',
     '33&ndash;283',
-    '33&ndash;35',
-    '33&ndash;37',
-    '33&ndash;39',
-    '33&ndash;41',
-    '33&ndash;42',
-    '33&ndash;47',
-    '33&ndash;50',
-    '33&ndash;61',
-    '33&ndash;62',
-    '33&ndash;67',
-    '33&ndash;68',
-    '33&ndash;7',
-    '33&ndash;77',
-    '33&ndash;77%',
-    '33&ndash;8',
     '33&ndash;9',
-    '33&ndash;91',
-    '33&percnt',
-    '33&times;23cm/13&times;9in',
-    '33&times;26&ins',
-    '33\'s',
-    '33(b)',
-    '33*',
-    '33,00-strong',
-    '33,000-signature',
-    '33,000-strong',
-    '33,048',
-    '33,085',
-    '33,088',
-    '33,111.6',
-    '33,113',
     '33,145,074',
-    '33,170lbs',
-    '33,274',
-    '33,315,528',
-    '33,35',
-    '33,352',
-    '33,400',
-    '33,432',
-    '33,460',
-    '33,500',
-    '33,505',
-    '33,532',
-    '33,615,000',
-    '33,629',
-    '33,700',
-    '33,750-',
     '33,800',
-    '33,821',
-    '33,938,000',
-    '33-12',
-    '33-17',
-    '33-27',
-    '33-3',
-    '33-42',
-    '33-employee',
-    '33-kiosk',
-    '33-match',
-    '33-mhz',
-    '33-mile',
-    '33-pounds',
-    '33-station',
-    '33-strong',
     '33-week',
-    '33.0%',
-    '33.0&ndash;14.7',
-    '33.05',
-    '33.07',
-    '33.11',
-    '33.15',
-    '33.18&ndash;19',
-    '33.1p',
-    '33.2.34.1',
-    '33.20',
-    '33.21',
-    '33.25',
-    '33.2pc',
-    '33.32',
-    '33.33',
     '33.34',
-    '33.374&mdash;5',
-    '33.38',
-    '33.3ft',
-    '33.3mpg',
-    '33.42',
-    '33.43',
-    '33.49',
-    '33.53',
-    '33.54',
-    '33.5m',
-    '33.5p',
-    '33.7%',
-    '33.70',
-    '33.73',
-    '33.74m',
     '33.75%',
-    '33.78',
-    '33.7pc',
-    '33.83',
-    '33.837.5gm',
-    '33.8p',
-    '33.90',
-    '33.92',
-    '33.96',
-    '33.98',
-    '33/2',
-    '33/240',
-    '33/32',
-    '33/33',
-    '33/40',
-    '33/422',
     '33/47',
-    '33/66mhz',
-    '33/68',
-    '33/92',
-    '330%',
-    '330&deg;c',
-    '330&deg;f',
-    '330&ndash;1',
-    '330&ndash;50',
-    '330,000-man',
-    '330,453',
-    '330-360',
-    '330-member',
-    '330-metre',
-    '330-p.p.m.v.',
-    '330-strong',
     '330-volt',
-    '330-yard',
-    '33001-02',
-    '33004-05',
-    '3300m',
-    '3301',
-    '33010',
-    '33017',
-    '33018',
-    '33020',
-    '33021',
-    '33023',
-    '3303',
-    '33036-37',
-    '33039',
-    '330405',
     '33042',
-    '3305&mdash;6',
-    '3306.13',
-    '33075-76',
-    '33077',
-    '3309',
-    '33098',
-    '330a-1',
-    '330f',
-    '330gt',
-    '330hz',
-    '331&ndash;3',
-    '331&ndash;333',
-    '331.4',
-    '331/3',
-    '3310',
     '3310.7',
-    '331111',
-    '331144',
-    '3312&mdash;38',
-    '33124',
-    '33146/9625',
-    '33151',
-    '33154',
-    '33161',
-    '3317',
-    '33174',
-    '3319&mdash;40',
-    '33190',
-    '33190-91',
-    '331b',
-    '332&ndash;333',
     '332,000',
-    '332,546',
-    '332,567',
-    '332,888',
-    '332.00',
-    '332.5%',
-    '332.70',
-    '33202-03',
-    '33204-05',
-    '33220',
-    '33220-21',
-    '33221-24',
-    '33223',
-    '33223-24',
-    '33224',
-    '332255',
     '332266',
-    '3323-24',
-    '332301',
-    '332354',
-    '33239',
-    '33244',
-    '33248',
-    '33258',
-    '33268',
-    '3327',
-    '33279',
-    '3328/3329',
-    '33287',
-    '332900',
-    '33298',
-    '332h',
     '332mb',
-    '333,333',
-    '333,500',
-    '333,732',
-    '333-acre',
-    '333.3%',
-    '333.8%',
-    '333012',
-    '33322',
-    '33322-23',
-    '33327-28',
-    '333306',
-    '33340',
-    '33350',
-    '33357',
-    '3336',
     '333644',
-    '33365',
-    '3338',
-    '33382-84',
-    '33385',
-    '333bhp',
-    '333s/l',
-    '333t.',
-    '334%',
-    '334&ndash;250',
-    '334&ndash;338',
-    '334&ndash;5',
-    '334&ndash;54',
-    '334&ndash;68',
-    '334,200',
-    '334-337',
     '334.3%',
-    '334.37',
-    '33400',
-    '33401-02',
-    '33403',
-    '33423',
-    '334244',
-    '3343',
-    '33430',
-    '33434',
-    '33435-36',
-    '3344',
-    '33445',
-    '33448',
-    '3345',
-    '33450',
     '33456',
-    '33460',
-    '33464-66',
-    '33466',
-    '33470',
-    '33476-77',
-    '33477',
-    '33485-87',
-    '33486-87',
-    '334pp',
-    '335&ndash;394',
-    '335,000,000',
-    '335,153',
-    '335.28',
-    '33500',
-    '3350kg',
     '33511',
-    '33516',
-    '33522',
-    '3353.76',
-    '3354',
-    '33544',
-    '335496',
-    '33550-55',
-    '335501',
-    '335502',
-    '3357',
-    '33570',
-    '3358',
-    '3359',
-    '33592',
-    '335947',
     '335bc',
-    '335gm',
-    '335khz',
-    '335pp.',
-    '336&mdash;7',
-    '336&ndash;323bc',
-    '336&ndash;7',
-    '336&ndash;7&ndash',
-    '336,869',
-    '336,880',
-    '33600',
-    '33605',
-    '33618-19',
-    '33619-20',
-    '33620',
-    '336262',
     '3364',
-    '3365',
-    '33653',
-    '33656-57',
-    '3366',
-    '33660',
-    '33662',
-    '33670',
-    '33681',
-    '33683',
-    '33685',
-    '336978',
-    '336bc',
-    '336kg',
-    '336p',
-    '337&mdash;46',
     '337&ndash;289',
-    '337&ndash;338',
-    '337&ndash;46',
-    '337&ndash;51',
-    '337&ndash;61',
-    '337,100',
-    '337,250',
-    '337,394',
-    '337-339',
-    '3371',
-    '33724',
-    '3373',
-    '33730',
-    '33738',
-    '3374',
-    '33740',
     '33746',
-    '33747',
-    '33750',
-    '33768',
-    '33769',
-    '33778',
-    '33786',
-    '33788',
-    '33789',
-    '33794',
-    '33799',
-    '337lbs',
-    '337x',
-    '338&ndash;340',
-    '338&ndash;344',
-    '338,500',
     '338,750',
-    '338-page',
-    '3380-k',
-    '3380ks',
-    '3381',
-    '33812-13',
-    '33823',
-    '33828',
-    '33837',
-    '33840',
-    '33842',
-    '33844',
-    '33849-50',
-    '33850',
-    '33852-53',
-    '33855',
     '33856.61',
-    '33858',
-    '33867',
-    '33874-75',
-    '3388',
-    '33880',
-    '33881',
-    '33895',
-    '338bc',
-    '338f&ndash;g',
-    '338km',
-    '338m',
-    '339&ndash;340',
-    '339&ndash;341',
-    '339&ndash;4',
-    '339,700',
     '3390',
-    '3390-3',
-    '33902',
-    '3391',
-    '33920',
-    '3392513&sol;3392562',
-    '33932-33',
-    '33935-36',
-    '3393704',
-    '33940',
-    '33942',
-    '33955',
-    '33959-60',
-    '33963',
-    '33970-71',
-    '33975-76',
     '33980',
-    '33982',
-    '33995-96',
-    '339b27',
-    '33:11',
-    '33:12&ndash;13',
-    '33:29',
-    '33:38f.',
-    '33:39',
-    '33:4',
-    '33c',
-    '33cl',
-    '33cm/13in',
-    '33cx',
-    '33er',
-    '33f',
     '33h',
-    '33hp',
-    '33ibm1,70018.415.8',
-    '33in',
-    '33kb',
-    '33kg',
-    '33km',
-    '33lbs',
-    '33mb-per-second',
-    '33mflop',
-    '33mhz-40mhz',
-    '33nt',
-    '33pounds',
-    '33pts',
-    '33rpm',
-    '33s.',
     '33sec',
-    '33sex',
-    '33x',
-    '33x45.8',
-    '33year-old',
-    '34%-45%',
-    '34&deg',
-    '34&mdash;40',
-    '34&mdash;7',
-    '34&mgr;m',
-    '34&ndash;103',
-    '34&ndash;12',
-    '34&ndash;18',
-    '34&ndash;180',
-    '34&ndash;21',
-    '34&ndash;30',
     '34&ndash;31',
-    '34&ndash;35&deg;c',
-    '34&ndash;41',
-    '34&ndash;42',
-    '34&ndash;44',
-    '34&ndash;45',
-    '34&ndash;47',
-    '34&ndash;50%',
-    '34&ndash;55',
-    '34&ndash;58',
-    '34&ndash;6',
-    '34&ndash;7',
-    '34&ndash;73',
-    '34&ndash;80',
-    '34&ndash;99',
-    '34&percnt',
     '34&rehy;year-old',
-    '34(4)',
-    '34(5)',
-    '34(6)',
-    '34(8)',
-    '34+3',
-    '34,000,000',
-    '34,000-mile',
-    '34,068',
-    '34,104',
-    '34,166',
-    '34,200',
-    '34,209',
-    '34,300',
-    '34,300,000',
-    '34,35',
     '34,421',
-    '34,442,000',
-    '34,497',
-    '34,521',
-    '34,539',
-    '34,588',
-    '34,630',
-    '34,690',
-    '34,701',
-    '34,707',
-    '34,795.34',
-    '34,812',
-    '34,925,000',
-    '34,974',
-    '34-0',
-    '34-1',
     '34-15',
-    '34-18',
-    '34-26-34ins',
-    '34-36',
-    '34-37',
-    '34-6',
-    '34-all',
-    '34-bedroom',
-    '34-d',
-    '34-day',
-    '34-footer',
-    '34-frame',
-    '34-inch',
-    '34-m',
-    '34-odd',
-    '34-page',
     '34-strong',
-    '34-year&rehy;old',
-    '34.0%',
-    '34.00',
-    '34.07',
-    '34.08',
-    '34.0secs',
-    '34.1&deg',
-    '34.1&ndash;28',
-    '34.111r.',
-    '34.13',
-    '34.13%',
-    '34.14',
-    '34.17',
-    '34.2%',
-    '34.2.33',
     '34.2.4',
-    '34.200,00',
-    '34.23',
-    '34.25',
-    '34.28',
-    '34.3.28.1',
-    '34.33.4',
-    '34.33.5',
-    '34.34',
-    '34.35',
-    '34.36',
-    '34.39',
-    '34.4.1&ndash;2',
-    '34.40',
-    '34.44',
-    '34.47',
     '34.48',
-    '34.4pc',
-    '34.5&deg;c',
-    '34.5&ndash;34.7',
-    '34.5&ndash;51.2',
-    '34.50',
-    '34.5278',
-    '34.5bn',
-    '34.5m',
-    '34.5ppt',
-    '34.67',
-    '34.76',
-    '34.78',
-    '34.84',
-    '34.84&ndash;34.87',
-    '34.86',
     '34.89&ndash;34.90',
-    '34.8ft',
-    '34.8sec',
-    '34.915',
-    '34.925',
-    '34.94',
-    '34.94&deg;c',
-    '34.99',
-    '34.9m',
-    '34.9mph',
-    '34.9ppt',
-    '34/115',
-    '34/35',
-    '34/418',
-    '34/569',
-    '34/60',
     '34/66',
-    '340%',
-    '340&deg',
-    '340&ndash;250',
-    '340&ndash;343',
-    '340&ndash;370cm',
-    '340&ndash;380',
-    '340,000.',
-    '340,400',
-    '340,800',
-    '340-343',
-    '340-370',
-    '340-bar',
-    '340-bedroom',
-    '340-ish',
-    '340-yard',
     '340020',
-    '34003',
-    '34004-05',
-    '34005',
-    '3400bc',
-    '3401',
-    '34010',
-    '34012',
-    '340127',
-    '340176',
-    '34020&ndash;32',
-    '34020-21',
-    '34023-24',
-    '34025',
-    '34026',
-    '34027\'s',
     '34029',
-    '3403',
-    '34032-33',
-    '34039',
-    '34059',
-    '3406',
-    '34060',
-    '34067-68',
-    '34070-71',
-    '340755',
-    '34077-78',
-    '34077-79',
-    '3408',
-    '340ft',
-    '340h',
-    '340hz',
     '340k',
-    '340kcals',
-    '340ma',
-    '340mw',
-    '340p.p.m',
-    '340p.p.m.',
-    '340r',
-    '340s',
-    '341%',
-    '341&ndash;2',
-    '341&ndash;5',
-    '341&ndash;8',
-    '341,000,000',
-    '341,478',
-    '341,650',
-    '341.6',
     '341.6&divide;2',
-    '341/2+20',
-    '3410',
-    '34100',
-    '341000',
-    '341001',
-    '34101',
-    '34104',
-    '34105',
-    '34107',
-    '34112-13',
-    '34113',
-    '341131',
-    '34114',
-    '3412',
-    '34120',
     '34121',
-    '34123',
-    '34130',
-    '34133',
-    '34146',
-    '34146-48',
-    '34147',
-    '34149',
-    '34149-50',
-    '34152-53',
-    '341552',
-    '34162-63',
-    '34163',
-    '34165-66',
-    '34175',
-    '34179',
     '34182',
-    '34183-84',
-    '34187-88',
-    '34192-96',
-    '341b',
-    '341ff.',
-    '341g',
-    '341h',
-    '341p',
-    '341pp.',
-    '342&mdash;64',
-    '342&ndash;270',
-    '342&ndash;293',
-    '342&ndash;3',
-    '342&ndash;347',
-    '342,092',
     '342,880,000',
-    '342,882',
-    '342-4',
-    '342/462/000',
-    '3420',
-    '34200',
-    '342020',
-    '34203-04',
-    '342152',
-    '342154',
-    '34216',
-    '34217',
-    '34222',
-    '34233',
-    '34235',
-    '342386',
     '342392',
-    '3423rd',
-    '34243',
-    '34244',
-    '34249',
-    '3425',
-    '3425&ndash;3584m',
-    '34256',
-    '34260-64',
-    '34265',
-    '342669',
-    '34285',
-    '34285-86',
-    '34287',
-    '34288-89',
-    '34291-92',
     '34294',
-    '34295',
-    '34297-98',
-    '342a',
-    '342ha',
-    '342mb',
-    '342pp.',
-    '343&ndash;290',
-    '343&ndash;345',
-    '343&ndash;4',
-    '343&ndash;6666',
-    '343&ndash;7297',
-    '343(1a)',
-    '343,000',
-    '343-364',
-    '343.0&deg',
     '343.5',
-    '343.6',
-    '343.8p',
-    '343/l',
-    '34305',
-    '34309',
-    '3433',
-    '34337',
-    '34345',
-    '34347',
-    '34350',
-    '3436',
-    '34363',
-    '3438',
-    '3439',
-    '343a',
     '343b&ndash;d',
-    '343cxe',
-    '343d&ndash;e',
-    '343m',
-    '344,263',
-    '344/190',
-    '344/g&rehy;ixcc',
-    '3440\'s',
-    '34407',
-    '34415',
-    '344161',
-    '34418',
-    '3442131',
-    '344222',
-    '34423',
-    '34423-24',
     '34435-36',
-    '34440',
-    '34441',
-    '34444',
-    '34445',
-    '34446-47',
-    '3445',
-    '34451-52',
-    '34454-59',
-    '34458',
-    '34459',
-    '34462',
-    '34466',
-    '34471-72',
-    '3448&mdash;91',
-    '34485',
     '34489',
-    '34499',
-    '344bp',
-    '344pp',
-    '344pp.',
-    '345&ndash;347',
-    '345&ndash;399',
-    '345&ndash;6',
-    '345&ndash;8',
-    '345,000,000',
-    '345-yard',
-    '345.04',
-    '345/352',
-    '34502-03',
-    '34505-06',
-    '34507',
     '34509-10',
-    '3450s',
-    '3451',
-    '34515',
-    '3452',
-    '34522-23',
-    '34524-25',
-    '34540',
-    '34541',
-    '345443',
-    '34559',
-    '34560',
-    '34565',
-    '3456712601',
-    '34570',
-    '3458',
     '34580',
-    '346&ndash;47',
-    '346&ndash;7',
-    '346(1)',
-    '346(2)',
-    '346(3)',
-    '346(5)',
-    '346-354',
-    '3460',
-    '34606',
-    '34607-08',
-    '34611',
-    '34618',
-    '34625-26',
-    '3463',
-    '3463/6012',
     '34637',
-    '34640',
-    '34651',
-    '3466',
-    '34662',
-    '34667',
-    '34669',
-    '34673',
-    '34675',
-    '34677-78',
-    '34678',
-    '34680',
-    '34687',
-    '34688',
-    '34691-92',
-    '34695',
     '346w',
-    '347&ndash;407',
-    '347&ndash;6',
-    '347&ndash;8',
-    '347&ndash;9',
-    '347(8)',
-    '347,133',
-    '347,511',
-    '347,525',
-    '347.9',
-    '347/267',
-    '34700',
-    '34722',
-    '34727-28',
-    '3473',
-    '34730',
     '34736-37',
-    '34740',
-    '34742-43',
-    '34743',
-    '34751',
-    '34751-52',
-    '34754',
-    '34758',
-    '34760',
-    '34766',
-    '34767',
-    '34773-74',
-    '34775',
-    '34779-81',
-    '34784',
-    '34786-88',
     '34786-89',
-    '347884',
-    '34791',
-    '348&ndash;349',
-    '348&ndash;7',
-    '348&ndash;9',
-    '348\'s',
-    '348,687',
-    '348-602',
-    '348/1',
-    '348/742',
-    '34803',
-    '3480s',
-    '34810',
-    '34812',
-    '3482',
     '34828.',
-    '34829',
-    '3483&sol;88',
-    '34832-33',
-    '34841',
-    '34856',
-    '34870-72',
-    '34875',
-    '348765',
-    '34884',
-    '34885',
-    '3489',
-    '34892',
-    '34893',
-    '34898',
-    '348tb',
     '349&ndash;4',
-    '349&ndash;50',
-    '349&ndash;7',
-    '349,109',
-    '349.5',
-    '349.5p',
-    '3490',
-    '3490e',
-    '34914-17',
-    '349225',
-    '34923',
-    '34927',
-    '3493',
-    '34931-32',
-    '3494',
-    '34940',
     '34943',
-    '34946',
-    '34956',
-    '34960',
-    '34961',
-    '3498',
-    '34985',
-    '34986',
-    '34988',
-    '34:13ff.',
-    '34:14',
-    '34:18',
-    '34:301',
-    '34:4',
-    '34:5&ndash;8',
-    '34:6ff.',
     '34:9',
-    '34cm',
-    '34f',
-    '34ff',
-    '34g',
-    '34gb',
-    '34k',
-    '34mb',
-    '34min',
-    '34mph',
-    '34p/minute',
-    '34p/per',
-    '34pts',
-    '34sec',
-    '34second',
-    '35%:65%',
     '35&dollar;degree',
-    '35&frac12',
-    '35&frac12;p',
-    '35&mdash;9.397&mdash;449',
-    '35&mgr;molmol',
-    '35&ndash;10',
-    '35&ndash;127',
-    '35&ndash;135',
-    '35&ndash;14',
-    '35&ndash;18',
-    '35&ndash;224',
-    '35&ndash;250mmmin',
-    '35&ndash;33',
-    '35&ndash;36%',
-    '35&ndash;38',
-    '35&ndash;40&deg;c/km',
     '35&ndash;40,000',
-    '35&ndash;41',
-    '35&ndash;45,000',
-    '35&ndash;454',
-    '35&ndash;45ft',
-    '35&ndash;45p',
-    '35&ndash;5-',
-    '35&ndash;50%',
-    '35&ndash;54-year',
-    '35&ndash;58',
-    '35&ndash;6&ndash;0',
-    '35&ndash;63',
-    '35&ndash;64',
-    '35&ndash;65',
-    '35&ndash;66',
-    '35&ndash;8',
     '35&percnt',
-    '35&rehy;mile',
-    '35&times;40cm/14&times;16in',
-    '35\'s',
-    '35(a)',
-    '35+',
-    '35,000&ndash;40,000',
-    '35,000-36,000',
-    '35,000-man',
-    '35,000lbs',
-    '35,000s',
-    '35,051',
-    '35,059',
-    '35,062',
-    '35,116',
-    '35,116.02',
     '35,209.35',
-    '35,218',
-    '35,270.46',
-    '35,293',
-    '35,345',
-    '35,350',
-    '35,359',
-    '35,366.37',
-    '35,376.35',
-    '35,382.8',
-    '35,40,44,45,46,47,50',
-    '35,400',
-    '35,434.00',
-    '35,522.99',
-    '35,532.00',
-    '35,622.97',
     '35,656',
-    '35,657.42',
-    '35,663.20',
-    '35,710',
-    '35,810',
-    '35,836',
-    '35,874',
-    '35,989',
-    '35-12',
-    '35-13',
-    '35-20',
-    '35-21',
-    '35-36,000,000',
-    '35-38',
-    '35-40%',
-    '35-49',
     '35-50',
-    '35-54',
-    '35-6',
-    '35-64',
-    '35-and-over',
-    '35-bank',
-    '35-bed',
-    '35-council',
-    '35-counties',
-    '35-fold',
-    '35-foot-long',
-    '35-footers',
-    '35-frame',
-    '35-ft',
-    '35-game',
-    '35-horse',
     '35-kiloton',
-    '35-litre',
-    '35-man',
-    '35-metre',
-    '35-point',
-    '35-ton',
-    '35-tube',
-    '35-under-par',
-    '35-yearold',
-    '35-years-old',
-    '35.00',
-    '35.01',
-    '35.02',
-    '35.04',
-    '35.05',
-    '35.07',
     '35.09',
-    '35.10',
-    '35.13.3',
-    '35.154',
-    '35.16',
-    '35.18',
-    '35.19',
-    '35.20',
-    '35.22',
-    '35.25',
-    '35.25.4',
-    '35.29',
-    '35.2fl.',
-    '35.2p',
-    '35.32',
-    '35.34',
     '35.39',
-    '35.44',
-    '35.4pc',
-    '35.53',
-    '35.56',
-    '35.59',
-    '35.5cm/14in',
-    '35.5p',
-    '35.6&deg;c/96&deg;f',
-    '35.6ft',
-    '35.75%',
-    '35.8&deg;c',
-    '35.8c',
-    '35.93sec',
-    '35/21',
-    '35/429',
     '35/6&ndash;36/4',
-    '35/92',
-    '350%',
-    '350&deg;f.',
-    '350&deg;f/180&deg;c/gas',
-    '350&deg;s;f',
-    '350&ndash;200&mgr;molmol',
-    '350&ndash;400',
-    '350&ndash;400,000',
-    '350&ndash;450',
-    '350&ndash;450g/12oz&ndash;16oz',
-    '350&ndash;450kg',
-    '350&ndash;500',
-    '350&ndash;70',
-    '350&ndash;700',
-    '350&times;10',
     '350,000&ndash;400,000',
-    '350,000,000',
-    '350,000-400,000',
-    '350,000-tonne',
-    '350,000km',
-    '350,500',
-    '350-400',
-    '350-acre',
-    '350-caravan',
-    '350-page',
-    '350-plus',
-    '350-seater',
-    '350-space',
-    '350-vehicle',
-    '350-watt',
-    '350-year',
     '350.00',
-    '3500&ndash;3200',
-    '3500&ndash;4000rpm',
-    '3500-odd',
-    '3500-signature',
-    '35000000',
-    '35002',
-    '35002-03',
-    '35003',
-    '35004',
-    '3500ft',
-    '35010',
-    '35014',
-    '35015-16',
-    '350222',
-    '35024-25',
     '350249',
-    '35025',
-    '35026-28',
-    '35028-29-which',
-    '350392',
-    '35040',
-    '35047',
-    '35060',
-    '35060kyr',
-    '35063-64',
-    '35067-8',
-    '35068',
-    '35078565',
-    '35084',
-    '35085-86',
-    '35087-88',
     '35089',
-    '35091-92',
-    '35097',
-    '350cm',
-    '350e',
-    '350f/180c/gas',
-    '350f/gas',
-    '350ff/lu',
-    '350g/m',
-    '350gr/12oz',
-    '350kbps',
-    '350kcals',
-    '350km',
-    '350lb',
-    '350mb',
-    '350ml',
     '350o',
-    '350of',
-    '350yds',
-    '351&mdash;2,360&mdash;1',
-    '351&ndash;3',
-    '351,200',
-    '351,357',
-    '351.9',
-    '3510',
-    '35101',
-    '35110',
-    '35110-12',
-    '35111',
-    '351111',
-    '35118',
-    '3512',
     '35127',
-    '35130',
-    '35136',
-    '351362',
-    '35138-39',
-    '35160',
-    '3517',
-    '35175',
-    '351795',
-    '3518',
-    '35181',
-    '35182',
-    '35183',
-    '35187-8',
-    '351a&ndash;b',
-    '351m',
     '352&ndash;577',
-    '352,000',
-    '352,205',
-    '352,335',
-    '352,400',
-    '3520',
-    '352000',
-    '35203',
-    '35213-14',
-    '35214',
-    '35215-16',
-    '3522&mdash;3',
-    '35224-25',
-    '35225',
-    '35232-33',
-    '35234',
     '35237-38',
-    '352397',
-    '35246',
-    '35247-48',
-    '35249',
-    '35251',
-    '35252',
-    '35255',
-    '35267',
-    '3527',
-    '35271-72',
-    '35280',
-    '35283',
-    '35285',
-    '35286',
-    '35292',
     '35293',
-    '35294',
-    '352c',
-    '352c&ndash;d',
-    '352du',
-    '352i',
-    '352l',
-    '352mm',
-    '352pp.',
-    '353&ndash;7',
-    '353-acre',
-    '3530',
-    '353005',
-    '35309',
-    '353107',
-    '35313',
     '353132',
-    '35324',
-    '35334',
-    '353341',
-    '35338',
-    '35341-42',
-    '35348',
-    '35352',
-    '35360',
-    '35365',
-    '35367-68',
-    '35371',
-    '35372-73',
-    '35381-82',
-    '35384',
-    '35385',
     '35386',
-    '35387',
-    '35390',
-    '35392',
-    '353g&ndash;h',
-    '353rd',
-    '354&mdash;7',
-    '354&ndash;4454',
-    '354&ndash;5',
-    '354(3)',
-    '354,000',
-    '354.01',
-    '3540',
-    '354000',
-    '35401',
-    '35401-02',
     '35414',
-    '35416',
-    '35421-42',
-    '35429-30',
-    '35430',
-    '35435',
-    '35436',
-    '3544',
-    '35451',
-    '35452',
-    '354540',
-    '35457-58',
-    '35462-63',
-    '35463',
-    '35469',
-    '3547',
     '35488',
-    '35489',
-    '35491',
-    '35495',
-    '354a&ndash;b',
-    '354b',
-    '354ft',
-    '354lb',
-    '354m-bytes',
-    '354p',
-    '355&deg',
-    '355&ndash;72',
-    '355,000',
-    '35502-03',
-    '35503',
-    '3550s',
     '35510',
-    '355111',
-    '35519',
-    '35520-21',
-    '35522',
-    '35523',
-    '35524',
-    '35525-26',
-    '35527',
-    '35527-30',
-    '35528',
-    '3553',
-    '35533-35',
-    '35534-35',
-    '35537-39',
-    '35539',
     '35541-42',
-    '35547-50',
-    '35552',
-    '35554-55',
-    '35561',
-    '35562-63',
-    '35570-71',
-    '35571',
-    '35571-73',
-    '35576-77',
-    '35576-78',
-    '35577',
-    '35587',
-    '35589',
-    '35590',
-    '35591-92',
     '35593',
-    '35597',
-    '355th',
-    '356&ndash;323',
-    '356&ndash;323bc',
-    '356&ndash;7',
-    '356,000',
-    '356.12',
-    '35602',
-    '35603',
-    '35606-07',
-    '35609',
-    '3560ft',
-    '35622-23',
-    '35629',
-    '3563',
     '3564',
-    '35647',
-    '35648',
-    '35657',
-    '35669',
-    '35677',
-    '35680',
-    '35684',
-    '35691',
-    '35693',
-    '35695',
-    '35695-99',
-    '357&dollar;c',
-    '357&ndash;337',
-    '357&ndash;358',
-    '357&ndash;517',
     '357&ndash;60',
-    '357&ndash;8',
-    '357&ndash;96',
-    '357,041',
-    '357-member',
-    '357.',
-    '3570',
-    '35703',
-    '35708',
-    '35709-12',
-    '35717',
-    '35722',
-    '35724',
-    '35727-28',
-    '35730',
-    '35737',
     '3574',
-    '35740-41',
-    '35746',
-    '3575&mdash;6',
-    '35750',
-    '35752',
-    '35753',
-    '35755',
-    '35757',
-    '35758',
-    '35758-59',
-    '35763',
-    '35764-65',
-    '3577',
-    '35772',
-    '35772-73',
     '35773',
-    '3578/3574',
-    '35780',
-    '35782',
-    '35782-83',
-    '35783-84',
-    '35785',
-    '357851',
-    '357f&ndash;g',
-    '358&frac12;p',
-    '358&ndash;3,070',
-    '358&ndash;359',
-    '358&ndash;360',
-    '358&ndash;60',
-    '358&ndash;735',
-    '358,667',
     '358,864',
-    '358-bed',
-    '3580',
-    '35800',
-    '35801',
-    '358062',
-    '35808',
-    '35812-13',
-    '35822',
-    '35823-24',
-    '358262',
-    '35828-29',
-    '358342',
-    '35836',
-    '35839-40',
-    '3584',
     '35842',
-    '35845',
-    '3585',
-    '35853',
-    '35853-54',
-    '35856-60',
-    '35856-61',
-    '35857365f',
-    '35868',
-    '3589',
-    '35890-95',
-    '35892',
-    '35894',
-    '35895',
-    '358f&ndash;g',
-    '358g&ndash;h',
     '359&mdash;60',
-    '359,000',
-    '359,034',
-    '3590',
-    '35900',
-    '35900-01',
-    '35907-08',
-    '35909-10',
-    '35912',
-    '35913-14',
-    '35925',
-    '3593',
-    '35940-41',
-    '35945',
-    '359454',
-    '35946',
     '3595',
-    '35950',
-    '35952-53',
-    '35956',
-    '35958-59',
-    '35962',
-    '35963-64',
-    '35967-68',
-    '3597',
-    '35972',
-    '35975',
-    '35978-79',
-    '35978-81',
-    '35979',
-    '35980',
-    '35981-82',
     '35982',
-    '35985',
-    '35987-88',
-    '359890',
-    '35992',
-    '359a&ndash;b',
-    '359c&ndash;e',
-    '359p',
-    '35:1',
-    '35:11',
-    '35:2',
-    '35:20ff',
-    '35:22',
-    '35:39',
-    '35:3ff',
-    '35:57',
     '35a(1)',
-    '35a(3)ca',
-    '35cms',
-    '35ff',
-    '35ft.',
-    '35g/1oz',
-    '35in',
-    '35kd',
-    '35kyr',
-    '35lb',
-    '35ma',
-    '35ma.',
-    '35mer',
-    '35mev',
-    '35mw',
-    '35no',
     '35off/livestock',
-    '35pts',
-    '35rd',
-    '35s5s',
-    '35sq',
-    '35v',
-    '35x',
-    '35x28cm/14x11in',
-    '35x50cms',
-    '36&deg;n',
-    '36&frac12',
-    '36&frac13',
-    '36&ins&mdash;48&ins',
-    '36&ins&times;12&ins&times;15&ins',
-    '36&ins;x15&ins;x12&ins;.',
-    '36&ins;x15&ins;x15&ins',
     '36&middot;1',
-    '36&ndash;1484',
-    '36&ndash;15',
-    '36&ndash;20',
-    '36&ndash;22&ndash;36',
-    '36&ndash;24',
-    '36&ndash;3',
-    '36&ndash;31',
-    '36&ndash;34',
-    '36&ndash;40%',
-    '36&ndash;41',
-    '36&ndash;42in',
-    '36&ndash;44',
-    '36&ndash;50',
-    '36&ndash;51s',
-    '36&ndash;8',
     '36&times;22&ins',
-    '36&times;48&ins;.',
-    '36(1)',
-    '36(2)',
-    '36(3)',
-    '36(5)',
-    '36(64%)',
-    '36(97.3%)',
-    '36,000-watt',
-    '36,000km',
-    '36,016',
-    '36,025',
-    '36,0o0',
-    '36,148',
-    '36,201',
-    '36,230',
     '36,322',
-    '36,400',
-    '36,41',
-    '36,475',
-    '36,496',
-    '36,600',
-    '36,627',
-    '36,64&ndash;66',
-    '36,677',
-    '36,700',
-    '36,736',
-    '36,755',
-    '36,847',
-    '36,905',
-    '36,942',
-    '36,960',
     '36,984',
-    '36-11',
-    '36-12',
-    '36-2',
-    '36-22-36',
-    '36-23-36',
-    '36-24',
-    '36-35',
-    '36-38%',
-    '36-4',
-    '36-41f',
-    '36-50',
-    '36-acre',
-    '36-base',
-    '36-bed',
-    '36-bedroom',
     '36-bits',
-    '36-box',
-    '36-copy',
-    '36-cover',
-    '36-day',
-    '36-fathom',
-    '36-feet',
-    '36-foot-high',
-    '36-footer',
-    '36-gun',
-    '36-holes',
-    '36-inch',
-    '36-nation',
-    '36-point',
-    '36-seat',
-    '36-week',
     '36.09',
-    '36.10',
-    '36.11',
-    '36.136.4',
-    '36.14',
-    '36.16',
-    '36.20',
-    '36.21n',
-    '36.23',
-    '36.267',
-    '36.2mpg',
-    '36.2pc',
-    '36.3%',
-    '36.37',
-    '36.3p',
-    '36.44p',
     '36.5&deg;c',
-    '36.52',
-    '36.53',
-    '36.57%',
-    '36.5m',
-    '36.66',
-    '36.6pc',
-    '36.74',
-    '36.75',
-    '36.81',
-    '36.86',
-    '36.9&times;10/l',
-    '36.90',
-    '36.98',
-    '36.9f',
-    '36.9ft',
     '36.9p',
-    '36/1.65',
-    '36/37',
-    '36/41',
-    '36/430',
-    '36/51',
-    '36/587',
-    '36/72',
-    '36/92',
-    '360&deg/',
-    '360&deg;.',
-    '360&deg;280&deg',
-    '360&ndash;1',
-    '360&ndash;364',
-    '360&ndash;380cm',
-    '360&ndash;71',
     '360,000,000',
-    '360-2',
-    '360-2,400',
-    '360-capacity',
-    '360-member',
-    '360-mile',
-    '360-seat',
-    '360.',
-    '360/370',
-    '360/s',
-    '360000',
-    '36005',
-    '36006',
-    '36008-09',
-    '3600rpm',
-    '36010',
     '36011-12',
-    '36017',
-    '36017-18',
-    '36019',
-    '36019-21',
-    '36019-22',
-    '3602',
-    '36024-25',
-    '36027',
-    '36027-28',
-    '3603',
-    '360304',
-    '36031',
-    '36034-35',
-    '36036',
-    '36038',
     '36042',
-    '36045-46',
-    '36047-49',
-    '36048-49',
-    '3605/1732',
-    '36050-51',
-    '36053-54',
-    '36056-59',
-    '36060',
-    '36066',
-    '36069',
-    '36069-70',
-    '3607',
-    '36074',
-    '36077-78',
-    '36085-86',
     '36088',
-    '36091',
-    '360g',
-    '360gle',
-    '360hp',
-    '360j',
-    '360kb',
-    '360kcals',
-    '360kilometre',
-    '360mb',
-    '360mm',
-    '360sq',
-    '361/252',
-    '36100',
-    '36101',
-    '36102-03',
     '36103',
-    '36104',
-    '36105-06',
-    '36108',
-    '3611/12&mdash;13',
-    '36110',
-    '36117',
-    '36119',
-    '36120',
-    '36122',
-    '36123-24',
-    '36123-26',
-    '361312',
-    '36136',
-    '36136-37',
-    '36138',
     '36139',
-    '3614&mdash;17',
-    '36140',
-    '36142',
-    '36147',
-    '36148-50',
-    '36149-50',
-    '3615',
-    '36151',
-    '36152-54',
-    '36153',
-    '36153-54',
-    '36155-56',
-    '36167',
-    '36168-69',
-    '36178-79',
     '36189-90',
-    '36196-98',
-    '36199',
-    '361d&ndash;f',
-    '361p',
-    '362&ndash;8',
-    '362,485',
-    '362/90',
-    '3620',
-    '36204',
-    '36206',
-    '36211',
-    '3622',
-    '36221-24',
-    '36221-25',
-    '36224-25',
     '36226',
-    '36227-29',
-    '3623',
-    '36235',
-    '3624',
-    '36241',
-    '36242',
-    '36243',
-    '36250',
-    '36250-52',
-    '36251',
-    '36254',
-    '36259',
-    '36264',
-    '36270',
-    '36273',
     '36274',
-    '36279',
-    '36280',
-    '36290',
-    '36291-92',
-    '36292',
-    '36294-95',
-    '36295',
-    '362b',
-    '362g&ndash;h',
-    '362mm',
-    '363&ndash;408',
-    '363&ndash;97',
-    '363-7',
-    '363.39',
-    '363000',
     '36301',
-    '36304',
-    '36305',
-    '36306',
-    '36309',
-    '36313',
-    '36325',
-    '36331',
-    '36333',
-    '363386',
-    '36339',
-    '36340',
-    '363401',
-    '36341',
-    '36344',
-    '36344-45',
     '36345',
-    '3635',
-    '36353',
-    '36355-56',
-    '36358',
-    '36359',
-    '36359-60',
-    '36367-8',
-    '36371',
-    '36374',
-    '36391-92',
-    '36395',
-    '36396',
-    '36397',
-    '36397-98',
-    '363p',
     '364(1)',
-    '364,013',
-    '36400',
-    '36403-04',
-    '36405',
-    '36409',
-    '36416',
-    '36418',
-    '3642',
-    '36420',
-    '36421-22',
-    '36424',
-    '36429',
-    '3643',
-    '36432',
-    '36435',
     '36436',
-    '36436-38',
-    '36437',
-    '36439',
-    '36442',
-    '36448',
-    '36449-50',
-    '36457-58',
-    '36459-60',
-    '3646',
-    '36460-62',
-    '36461',
-    '36462-63',
-    '36462-64',
-    '36463',
-    '36467-68',
     '36469',
-    '3647',
-    '36472',
-    '36476',
-    '36478',
-    '36479',
-    '3648',
-    '36480-81',
-    '36483',
-    '36484',
-    '36493-94',
-    '36495',
-    '36497-98',
-    '364e&ndash;h',
-    '365&mdash;9',
-    '365&ndash;345',
     '365&ndash;72',
-    '365&ndash;9',
-    '365(1)',
-    '365,946',
-    '365-375',
-    '365-day-a-year',
-    '365-days-a-year',
-    '365-degree',
-    '365.242199',
-    '365/2',
-    '365000',
-    '36502-03',
-    '3650mm',
-    '36512',
-    '36512-13',
-    '36513',
     '36515-16',
-    '36517',
-    '3652',
-    '36536',
-    '36536-37',
-    '36537-38',
-    '36538-39',
-    '36543',
-    '36551',
-    '36554',
-    '36555-56',
-    '36556',
-    '36558-59',
-    '36559',
-    '36560',
-    '36563',
     '36566-68',
-    '36567',
-    '36568-69',
-    '36568-70',
-    '36570',
-    '36571',
-    '365744',
-    '36577-79',
-    '36579',
-    '36582-83',
-    '36583',
-    '36588',
-    '36590',
-    '36592',
-    '36592-93',
-    '36593',
     '36595',
-    '36597-98',
-    '36599-600',
-    '365bp',
-    '365m',
-    '365pp',
-    '365th',
-    '366(2)',
-    '366.1',
-    '366.50',
-    '3660',
-    '3660/3661',
-    '36605',
-    '36608',
-    '3661',
-    '36612',
     '36615',
-    '36615-16',
-    '36617',
-    '36618',
-    '36619',
-    '36619-20',
-    '3662',
-    '36620-21',
-    '36622',
-    '36626',
-    '36630',
-    '36630-31',
-    '36631',
-    '36632',
-    '36633',
-    '36636-37',
     '36637',
-    '36642',
-    '36646',
-    '36646-47',
-    '36649-50',
-    '36650-51',
-    '36653',
-    '36654',
-    '36655',
-    '36659',
-    '36659-60',
-    '36660-61',
-    '36661',
-    '36662-63',
-    '36664',
-    '36666',
     '36675-76',
-    '36677',
-    '36679-80',
-    '36680',
-    '36687',
-    '36691',
-    '36696',
-    '36697',
-    '36698',
-    '36699',
-    '366a',
-    '366mph',
-    '366th',
-    '367&ndash;68',
-    '367&ndash;80',
-    '367(4)',
     '367.7',
-    '3670',
-    '36702',
-    '36703',
-    '36705',
-    '36706-07',
-    '36707-08',
-    '36708',
-    '36708-09',
-    '36709',
-    '3671',
-    '36713',
-    '36716',
-    '36716-17',
-    '36717',
-    '36720',
     '36721',
-    '36721-22',
-    '36723',
-    '36724',
-    '36725',
-    '36727-28',
-    '36730',
-    '36731-32',
-    '36732',
-    '36732-33',
-    '36733',
-    '36733-34',
-    '36739',
-    '3674',
-    '36740',
-    '36740-41',
     '36742',
-    '36746',
-    '36748',
-    '36749',
-    '36750',
-    '367500',
-    '36752',
-    '36754',
-    '36755',
-    '36759-60',
-    '3676',
-    '36760',
-    '36761',
-    '36762',
-    '3677/8',
-    '367731',
     '36775-76',
-    '3678',
-    '36781',
-    '36782',
-    '36782-97',
-    '36785',
-    '36788',
-    '36789',
-    '36790',
-    '36791',
-    '367g',
-    '368&ndash;267',
-    '368&ndash;379',
-    '368&ndash;79',
-    '368&ndash;c.287',
-    '368,000',
     '368-word',
-    '368.4',
-    '368/7',
-    '36802',
-    '36805-06',
-    '36807',
-    '36808',
-    '3681',
-    '36813-14',
-    '36814',
-    '36818',
-    '36820-21',
-    '36824',
-    '36825',
-    '36826',
-    '36826-27',
     '368282',
-    '36829',
-    '3683',
-    '36831',
-    '36839',
-    '368463',
-    '36848',
-    '36849',
-    '3685',
-    '3685&mdash;6',
-    '3685&ndash;3686',
-    '36850',
-    '36851-52',
-    '36852-53',
-    '36854',
-    '36854-55',
     '36859',
-    '36860',
-    '36860-61',
-    '36862',
-    '36863-64',
-    '36864',
-    '36865',
-    '36866',
-    '36867',
-    '36868',
-    '36869',
-    '3687',
-    '3687/91',
-    '36871',
-    '36872',
-    '36873',
     '36876',
-    '36882',
-    '36883',
-    '36884',
-    '36886',
-    '36888',
-    '36890-91',
-    '36896',
-    '36896-97',
-    '36897',
-    '36899-90',
-    '368ft',
-    '368th',
-    '369&ndash;72',
-    '369&ndash;73',
-    '369,000',
     '369,178',
-    '369,300',
-    '369,606',
-    '369,640',
-    '369.',
-    '36902-03',
-    '36903',
-    '36904',
-    '36904-05',
-    '36906-07',
-    '36907',
-    '36908',
-    '3691',
-    '36911',
-    '36917-18',
-    '36919',
     '36919-21',
-    '3691x',
-    '3692',
-    '36920',
-    '36922',
-    '369222',
-    '36924',
-    '36926',
-    '36927-28',
-    '36935',
-    '36936',
-    '36937',
-    '36939-41',
-    '36944',
-    '36947-49',
-    '36947-50',
     '36961-63',
-    '36965-66',
-    '36970-71',
-    '36971',
-    '36974',
-    '36974-75',
-    '36978-79',
-    '36979',
-    '3698&mdash;707',
-    '3698&mdash;726',
-    '36982',
-    '36982-83',
-    '36985-86',
-    '36989-90',
-    '3699',
-    '36991-92',
     '36995',
-    '36:15&ndash;43',
-    '36:24&ndash;28',
-    '36:25f',
-    '36:25ff',
-    '36:9',
-    '36cms',
-    '36d',
-    '36hr',
-    '36kg',
-    '36km',
-    '36l',
-    '36mb',
-    '36mm',
-    '36mpg',
-    '36nt',
     '36per',
-    '36pp',
-    '36pp.',
-    '36sec',
-    '36x',
-    '36x48&ins',
-    '37%/h',
-    '37&bsol;38',
-    '37&deg&plusmn;8&deg',
-    '37&deg;c/5%co',
-    '37&deg;c/ambient',
-    '37&deg;e',
-    '37&deg;n',
-    '37&ndash;100',
-    '37&ndash;11',
-    '37&ndash;15&ndash;0',
     '37&ndash;19',
-    '37&ndash;190',
-    '37&ndash;24&ndash;35',
-    '37&ndash;28',
-    '37&ndash;3',
-    '37&ndash;31',
-    '37&ndash;36',
-    '37&ndash;3ast',
-    '37&ndash;40ft',
-    '37&ndash;45%',
-    '37&ndash;4i',
-    '37&ndash;50',
-    '37&ndash;55',
-    '37&ndash;6',
-    '37&ndash;60',
-    '37&ndash;62',
     '37&ndash;80',
-    '37&ndash;80%',
-    '37&ndash;81',
-    '37&ndash;95',
-    '37&percnt',
-    '37(a)',
-    '37,000ft',
-    '37,034',
-    '37,095',
-    '37,100,000',
-    '37,20',
-    '37,200',
-    '37,240',
-    '37,38',
-    '37,381',
-    '37,440',
     '37,494.17',
-    '37,530',
-    '37,600',
-    '37,665',
-    '37,699',
-    '37,702',
-    '37,724.06',
-    '37,732,178',
-    '37,752.67',
-    '37,800',
-    '37,803.53',
-    '37,873,000',
-    '37,960',
-    '37-14',
-    '37-36',
-    '37-38',
     '37-ed',
-    '37-member',
-    '37-metre',
-    '37-mile',
-    '37-mm',
-    '37-way',
-    '37.0%',
-    '37.000',
-    '37.01',
-    '37.02',
-    '37.05',
-    '37.1&aring',
-    '37.13',
-    '37.14',
-    '37.2.',
-    '37.21',
     '37.25',
-    '37.25%',
-    '37.26',
-    '37.3&deg;c',
-    '37.31',
-    '37.32',
-    '37.34',
-    '37.37',
-    '37.38',
-    '37.39sec',
-    '37.3m',
-    '37.3mm',
-    '37.4&deg;c',
-    '37.40',
-    '37.48p',
-    '37.4pc',
     '37.54.21',
-    '37.59',
-    '37.5g',
-    '37.5m',
-    '37.5mhz',
-    '37.5p',
-    '37.5pc',
-    '37.60.169',
-    '37.6m',
-    '37.6nmol',
-    '37.7%',
-    '37.74',
-    '37.77',
-    '37.77sec',
-    '37.78',
-    '37.81',
     '37.82',
-    '37.84',
-    '37.8pc',
-    '37.9p',
-    '37/23',
-    '37/3',
-    '37/40',
-    '37/41',
-    '37/4s',
-    '37/7',
-    '370%',
-    '370&deg;f.',
-    '370&ndash;371',
-    '370-bp',
-    '370-compatibility',
-    '370-compatible',
     '370-km',
-    '370-odd',
-    '370-s',
-    '370-series',
-    '370-type',
-    '370.',
-    '370/138',
-    '370/158',
-    '370/s',
-    '370001',
-    '37002-03',
-    '37003',
-    '37004',
-    '37006',
-    '3700925/wp',
-    '3700e',
     '37010',
-    '37014-15',
-    '37015',
-    '37018-19',
-    '37019-20',
-    '370191',
-    '37020',
-    '37020-21',
-    '370222',
-    '37026-27',
-    '37027',
-    '37027-28',
-    '37028-29',
-    '37028-30',
-    '37034-35',
-    '3704',
     '37044-45',
-    '370532',
-    '370540',
-    '370541',
-    '370555',
-    '37059-60',
-    '37060',
-    '37060-61',
-    '37064',
-    '37065',
-    '37068',
-    '37070',
-    '37070-72',
-    '37071-72',
-    '37073',
-    '37073-74',
     '37074-75',
-    '37083',
-    '37085-86',
-    '37086-87',
-    '37088-89',
-    '37091',
-    '37093',
-    '37094',
-    '37098-99',
-    '37099-100',
-    '37099-101',
-    '370du',
-    '370e&ndash;f',
-    '370ff',
-    '370ft',
-    '370gal',
     '370k',
-    '370ml',
-    '370mm',
-    '370nm',
-    '371&ndash;2',
-    '371&ndash;372',
-    '371&ndash;373',
-    '371&ndash;7',
-    '371,411',
-    '37100',
-    '37101',
-    '37104-10',
-    '37105',
-    '37106-07',
-    '37107-08',
-    '37108-09',
     '37109-10',
-    '3711',
-    '37110-11',
-    '37112-3',
-    '37113-14',
-    '37118-19',
-    '37121-2',
-    '371236',
-    '37124-26',
-    '37125-26',
-    '37131-33',
-    '37132-33',
-    '37133&mdash;and',
-    '37136-37',
-    '37137-38',
-    '37142-43',
     '3715,762',
-    '37151',
-    '37152',
-    '37153',
-    '37161',
-    '37165',
-    '37170-71',
-    '37170-72',
-    '37171-72',
-    '37174-15',
-    '37177-78',
-    '37182-83',
-    '371821',
-    '37185-86',
-    '37191',
-    '37192-93',
     '37195-96',
-    '37196.',
-    '37197-98',
-    '37199-00',
-    '371b&ndash;g',
-    '371km',
-    '372&ndash;389',
-    '372&ndash;4',
-    '372,240',
-    '372-foot',
-    '372.3',
-    '37200-01',
-    '372000',
-    '37211-12',
-    '37213-14',
-    '37214',
     '37216-17',
-    '3722',
-    '37224-25',
-    '37227-8',
-    '37228-29',
-    '37229',
-    '37232-33',
-    '372372',
-    '37238-39',
-    '37242-43',
-    '37245-46',
-    '37249-50',
-    '3725',
-    '37251-52',
-    '37252-53',
-    '372533',
     '37256-57',
-    '37257-58',
-    '37259-61',
-    '3726',
-    '37260-61',
-    '37262-63',
-    '37264',
-    '37269',
-    '37277',
-    '37279',
-    '37285',
-    '37287',
-    '37288',
-    '3729',
-    '37291',
-    '37293',
     '37297-98',
-    '37297-99',
-    '37298-99',
-    '372x280cm',
-    '373&ndash;7',
-    '373&ndash;8',
-    '373,751',
-    '373/',
-    '3730&mdash;43',
-    '37302-03',
-    '37305-06',
-    '373113',
-    '37314-15',
-    '37317-18',
-    '3732',
-    '37321-22',
     '37322-23',
-    '37324-25',
-    '373240',
-    '373270',
-    '3733',
-    '37330-31',
-    '373300',
-    '373307',
-    '373311',
-    '37336',
-    '37336-42',
-    '373366',
-    '37338',
-    '3734&mdash;5',
-    '37340',
-    '37341',
     '37343',
-    '37343-45',
-    '37346',
-    '37347',
-    '37350',
-    '37355',
-    '37355-56',
-    '37360-61.',
-    '37363-63',
-    '37366-67',
-    '37367-68',
-    '373684',
-    '3737',
-    '37372-73',
-    '37375-76',
-    '37376-77',
     '37377-78',
-    '37378-80',
-    '373792',
-    '37380-81',
-    '37381-82',
-    '37384',
-    '37384-85',
-    '37391-02',
-    '37391-2',
-    '37395',
-    '37399',
-    '373p',
-    '374&deg',
-    '374(1)',
-    '374,000',
-    '374,084',
     '374-1',
-    '374.073',
-    '3740',
-    '37400',
-    '37401-02',
-    '37402',
-    '37406-07',
-    '3740lb',
-    '37410',
-    '37411',
-    '37414',
-    '37415',
-    '37416-17',
-    '3742',
-    '37420',
-    '37422',
     '37422-23',
-    '37423',
-    '37425',
-    '37425-26',
-    '37426',
-    '37429',
-    '37441-37442',
-    '37441-42',
-    '37444-45',
-    '37448-49',
-    '37455',
-    '37455-55',
-    '37457',
-    '37461-62',
-    '37471-72',
-    '37479',
     '3748',
-    '37484-85',
-    '37485-86',
-    '37487-8',
-    '37487-88',
-    '3749-50',
-    '37492-93',
-    '37493-94',
-    '37496',
-    '37497',
-    '37499',
-    '374p',
-    '374th',
-    '375&deg',
-    '375&deg;f.',
-    '375&ndash;1055',
     '375&ndash;399',
-    '375(2)',
-    '375.00',
-    '37505-56',
-    '37506',
-    '37507',
-    '37507-08',
-    '37507-10',
-    '3750rpm',
-    '3751',
-    '37510-11',
-    '37511',
-    '37511-14',
-    '37516-17',
-    '37525-26',
-    '375254',
     '37528-29',
-    '37530-31',
-    '37531-32',
-    '37536-37',
-    '37536-7',
-    '37538',
-    '37538-39',
-    '37540',
-    '37543-44',
-    '37544',
-    '37545',
-    '37546-7',
-    '375547',
-    '37555',
-    '37560',
-    '37563',
     '37568',
-    '37570',
-    '37573',
-    '37575',
-    '37579',
-    '3758',
-    '37582-83',
-    '37584',
-    '37590',
-    '37590-91',
-    '37591-92',
-    '37599',
-    '375g/15fl',
-    '375hp',
-    '375kg',
-    '375m',
     '375ml',
-    '376&ndash;444',
-    '376&ndash;86',
-    '376-385',
-    '376/22',
-    '3760&mdash;85',
-    '37604-05',
-    '37614',
-    '37615',
-    '3762',
-    '37621-22',
-    '37625-26',
-    '37631-32',
-    '37635-41',
-    '37636',
-    '37637-38',
     '37638-39',
-    '37639-40',
-    '3764',
-    '37646',
-    '37646-47',
-    '3765,3380919',
-    '37657',
-    '37658-59',
-    '3766',
-    '37667',
-    '3767',
-    '37670',
-    '37672-73',
-    '37673',
-    '37674',
-    '37674-75',
     '37676-77&mdash;trude',
-    '37678',
-    '3768&mdash;9',
-    '37683-84',
-    '37684-85',
-    '37685',
-    '37686',
-    '37695-96',
-    '376h',
-    '376p',
-    '377&ndash;378',
-    '377,200',
-    '377,826',
-    '377.68396',
-    '37705-06',
-    '37706-07',
     '37707-08',
-    '37708-09',
-    '377103',
-    '37712-13',
-    '37712-3',
-    '377139',
-    '37717',
-    '37717-8',
-    '37719-20',
-    '37725-26',
-    '37728-29',
-    '3773',
-    '37730-31',
-    '37736',
-    '37740',
-    '37742-43',
     '37744',
-    '37747',
-    '37749-51',
-    '3775',
-    '37750',
-    '37750-60',
-    '37758-59',
-    '37762.',
-    '3777000',
-    '37778',
-    '37779-80',
-    '37781-82',
-    '37782-73',
-    '37787-88',
-    '37790-91',
-    '37793-94',
     '37794-95',
-    '37796-97',
-    '37798',
-    '37798-99',
-    '377b',
-    '377d',
-    '377p',
-    '378%',
-    '378&ndash;385',
-    '378,000',
-    '378.7p',
-    '3780',
-    '3780/3770',
-    '37803',
-    '37806',
-    '37808-09',
     '37810',
-    '37811',
-    '37811-12',
-    '37813-14',
-    '37814',
-    '37815',
-    '378181',
-    '37826-27',
-    '3783',
-    '37831',
-    '37831-35',
-    '37833',
-    '37834-35',
-    '37844-45',
-    '37846',
-    '37846-47',
     '3785',
-    '37851-52',
-    '37859-60',
-    '37862-63',
-    '37863',
-    '37863-64',
-    '37866-67',
-    '37871-72',
-    '37876',
-    '37879-80',
-    '37880',
-    '37881-82',
-    '37882-83',
-    '37884',
-    '37884-85',
-    '37885',
     '37885-86',
-    '378863',
-    '37889-90',
-    '3789',
-    '37893',
-    '37894-95',
-    '37896',
-    '378b',
-    '379&mdash;89',
-    '379&ndash;80',
-    '379&ndash;90',
-    '379(35e)',
-    '379.0',
-    '379.535',
-    '3790',
-    '37902-04',
     '37903-04',
-    '37904-5',
-    '37908-09',
-    '37918-19',
-    '37923-24',
-    '37929-30',
-    '37934-35',
-    '37936-37',
-    '37937',
-    '37945-46',
-    '3795',
-    '37953-54',
-    '37954',
-    '37954-55',
-    '3796&sol;81',
-    '3796/81',
     '37965-66',
-    '37973-74',
-    '37974-75',
-    '37976-97',
-    '37977',
-    '37977-98',
-    '3798',
-    '37980',
-    '37983',
-    '37985-86',
-    '37986-87',
-    '37987-88',
-    '37987-98',
-    '37990',
-    '37992',
-    '37992&mdash;that',
     '37992-93',
-    '37993-94',
-    '37996-97',
-    '37997',
-    '379b',
-    '379c',
-    '379d',
-    '379e',
-    '379p',
-    '37:1',
-    '37:26',
-    '37:29',
-    '37:3',
-    '37:39',
-    '37:4',
-    '37:4&ndash;7',
     '37ff.',
-    '37g/t',
-    '37gb',
-    '37h',
-    '37kb',
-    '37khz',
-    '37mb',
-    '37min',
-    '37mph',
-    '37no',
-    '37oz',
-    '37pts',
-    '37s.',
-    '38&amp;f',
-    '38&deg;f',
-    '38&lt;188',
     '38&mdash;04',
-    '38&mdash;9',
-    '38&ndash;115mm',
-    '38&ndash;23',
-    '38&ndash;260',
-    '38&ndash;27',
-    '38&ndash;4',
-    '38&ndash;40%',
-    '38&ndash;40/40&ndash;42/42&ndash;44',
-    '38&ndash;41&deg;c',
-    '38&ndash;43',
-    '38&ndash;43c/100&ndash;110f',
-    '38&ndash;45',
-    '38&ndash;47',
-    '38&ndash;48',
-    '38&ndash;67',
     '38&ndash;8',
-    '38&ndash;94%',
-    '38&percnt',
-    '38&times;119mm',
-    '38&times;12mm',
-    '38&times;38&ins',
-    '38&times;57',
-    '38&times;84&ins',
-    '38(2)',
-    '38(3)',
-    '38(a)',
-    '38+24',
-    '38,000,000',
-    '38,000-plus',
-    '38,072',
-    '38,167,416',
     '38,168',
-    '38,196',
-    '38,200',
-    '38,2003',
-    '38,26,39',
-    '38,270',
-    '38,305,534',
-    '38,354',
-    '38,400',
-    '38,400,000',
-    '38,445',
-    '38,493',
-    '38,512.00',
-    '38,544',
-    '38,586.18',
-    '38,600',
     '38,628',
-    '38,700',
-    '38,772',
-    '38,876.94',
-    '38,916',
-    '38,946',
-    '38,997,000',
-    '38-03-48',
-    '38-12',
-    '38-17',
-    '38-23-36',
-    '38-39',
-    '38-41',
-    '38-42',
-    '38-5',
-    '38-9',
     '38-bar',
-    '38-count',
-    '38-day',
-    '38-inch',
-    '38-m-long',
-    '38-mer',
-    '38-mile',
-    '38-minute',
-    '38-mm',
-    '38-point',
-    '38-pounder',
-    '38-prisoner-escape',
-    '38-set',
-    '38-square-high',
-    '38-storey',
-    '38-tonne',
     '38-tonner',
-    '38-track',
-    '38-under',
-    '38.0%',
-    '38.04',
-    '38.10',
-    '38.12',
-    '38.14',
-    '38.17.11',
-    '38.1p',
-    '38.21.1',
-    '38.26',
-    '38.2pc',
-    '38.30',
-    '38.35',
-    '38.50',
     '38.52',
-    '38.55',
-    '38.6mm',
-    '38.72',
-    '38.7pc',
-    '38.8&deg;c',
-    '38.86',
-    '38.89',
-    '38.9&deg;c',
-    '38/\'39',
-    '38/100000/year',
-    '38/172',
-    '38/36/1',
-    '38/432',
-    '38/64',
-    '38/77',
     '380&mdash;432',
-    '380&ndash;3,900',
-    '380&ndash;381',
-    '380(36e)',
-    '380,000+',
-    '38002-03',
-    '38005-06',
-    '38008-09',
-    '38009-10',
-    '3800kg',
-    '38011-12',
-    '380152',
-    '380180',
-    '38020-21',
-    '3803',
-    '38032',
     '38048',
-    '38048-49',
-    '38049',
-    '38052',
-    '38053',
-    '380539',
-    '38058',
-    '38063',
-    '38065',
-    '38069',
-    '3807',
-    '38071',
-    '38072',
-    '38075',
-    '3808',
-    '38082-83',
     '38087',
-    '38087-88',
-    '38088',
-    '38088-89',
-    '3809',
-    '3809&sol;2222',
-    '38093-94',
-    '38096-97',
-    '38097-98',
-    '380b',
-    '380ft',
-    '380k',
-    '380p',
-    '380pc',
-    '380pp',
-    '380th',
     '381,740',
-    '381,969',
-    '3810',
-    '38101-02',
-    '38103-04',
-    '38104',
-    '38107-108',
-    '38113-4',
-    '38120',
-    '381220',
-    '381222',
-    '38128',
-    '38130',
-    '38136-37',
-    '38138-39',
-    '3814',
     '381421',
-    '38144-45',
-    '38146-47',
-    '38148-49',
-    '38153-54',
-    '38156-57',
-    '38162-63',
-    '38184',
-    '38186',
-    '38191-92',
-    '38193-94',
-    '38196-97',
-    '38198-99',
-    '381st',
-    '382&ndash;336bc',
-    '382&ndash;358',
     '382,000',
-    '382,574',
-    '382.',
-    '382.5%',
-    '382.8',
-    '38204',
-    '38208-09',
-    '3822\'s',
-    '38223',
-    '38225',
-    '38226',
-    '38227',
-    '38228',
-    '3823',
-    '38233',
-    '38236',
     '38239',
-    '38239-41',
-    '38241',
-    '38242',
-    '38246',
-    '38248',
-    '38249',
-    '3825',
-    '38251',
-    '38257',
-    '38258',
-    '3826',
-    '38263',
-    '38267',
-    '38268',
-    '38274',
     '38276',
-    '38277-78',
-    '3828',
-    '38281-82',
-    '38282-83',
-    '38285-86',
-    '382878',
-    '38288-89',
-    '38290-91',
-    '38291-91',
-    '38296',
-    '38298-99',
-    '382p',
-    '383.8%',
-    '383.83',
-    '38300-31',
     '38302-03',
-    '38304-05',
-    '38308-09',
-    '383088',
-    '38309-10',
-    '3831',
-    '38322-23',
-    '383222',
-    '38323-24',
-    '38324-25',
-    '38326',
-    '38327-28',
-    '38329-30',
-    '3833',
-    '38331',
-    '38333',
     '38334',
-    '38334-35',
-    '38337-38',
-    '38341-42',
-    '38342-42',
-    '38344-45',
-    '38345.',
-    '38346',
-    '38348',
-    '38349-50',
-    '38350-51',
-    '38351-2',
-    '38358-59',
-    '38360-61',
-    '38362',
-    '38368',
     '38369',
-    '38370',
-    '38372-73',
-    '383746',
-    '38375',
-    '38382',
-    '38384',
-    '38394-95',
-    '38396-37',
-    '38397-98',
-    '383g',
-    '383h&mdash;384b',
-    '384&ndash;440',
-    '384&ndash;5',
-    '3840',
-    '38401-02',
     '38402-03',
-    '38404',
-    '38405-06',
-    '38406-07',
-    '38408',
-    '3841',
-    '38410',
-    '38414-15',
-    '38416',
-    '38426-27',
-    '38427-28',
-    '3843',
-    '38431',
-    '38441-38442',
-    '38441-42',
-    '38443',
     '38443-43',
-    '38446-47',
-    '38447-48',
-    '38448-49',
-    '38450-51',
-    '38453-54',
-    '38467',
-    '38468-69',
-    '3847',
-    '3847&mdash;9',
-    '38471',
-    '38472',
-    '38473',
-    '38476',
-    '38478',
-    '38480',
     '38481-82',
-    '38486',
-    '38488',
-    '3849',
-    '38492',
-    '38493',
+)
+
+blocks_93 = (
+    '$!2$!m#"20$"94##3.4##4.8##586#!6#$7.60##bhp#!f#!g$%/10oz#%kcals#!m',
+    '")1&ndash;2*#349+#650*$7221#$,920&!3#"-5$$ball##.1p#!1#*2&mdash;17#"40##5.9#"60##7.6',
+    '$"68#"80#"97#!p"+2&ndash;293*!3+"06#$,210#$-309#!1$!0##2.1%!4#"50##6.5',
+    '#!9#)c&ndash;g#$x451"+3&ndash;304*!4*!8##(1)$"2)#$,000#!.$"3p##/91#!0#"10#"20',
+    '#!3#!4#!5#!6$!0#!7#"80#"90#!f$!f##kyr##pp.")4&ndash;5*!6#(,000,000',
+    '##-74#".4#&0.0028#$1.30%!7#"20$"67$"71##3.4$!0##441$!8##5.0$!0$!4',
+    '$$5-66#"70$!3#"87##9.9$$5-96#$g/sq"+5&ndash;763#$,794#$-312$$acre$$name$$yard##.8%#!0',
+    '#"10#!3#"40#"50##6.7$!0##7.3#!8##913#"ft#!m#!p""6%#*&ndash;305,!7',
+    '#"\'s#$,000#$/488#!0$"cc#!2$"00#"30#"45$!9#!5$$4-57&"60\'!9#!6',
+    '##733#"80$!7#"90$!2%!5#!a$#(1)"%7,862#".1$"25%!p#!0##1.6$!0',
+    '##297#!3$!0#"40%#-44#!5$"cc#"60#"70#"80$"10#!9#!g$!b#"pp',
+    '*#301,!2*!9##(1)$"7)#$,000$#372#".5%$0.15#"03$!6#!1$!7#!5$!2',
+    '$"56$$9-76#!7$!0#!8##9.4#"mm#!p")9&ndash;4*"59*!9#$,014$#560$#681#".8',
+    '#"24##380#"53$!6#!7$+&ndash;1826##811#"91$!6#!g#"th"#:10$!3$!4$!8',
+    '$!8#%42ff.$*3&ndash;46$#9.0""ab"$b-30#!y"$july"!k#!m"!m#&illion$"ns#!m#"pg',
+    '"!o""pp#$stg."#sec%!s"\'th/45th!#:00##1.5#!2##3.2#$5.36##7.2##8.9#$9.21$#:55',
+    '"*1&ndash;22+!3*"52*!8#*0&ndash;13$#,11$#:42#*1&ndash;12,!8+"22$#.01$#:04#*2&ndash;18$".9$#:17',
+    '&!8%"53#*3&ndash;18$#,14$#.23%"45#$4,18$#.00$#:04%/19/&dollar;7000%"22%"30%"50#*5&ndash;21$#:26',
+    '$"ff$"pm#$6:29$"ff#$7.49%!5%!6$#:22%"37#*9&ndash;22,!3$".7"$20,2$#.51$#:36',
+    '$(&ndash;0+"39+"40$#.15$!m##2.3$"ff&!.##3.0&!1%!7#!5$)&ndash;36##6.7##7.6',
+    '%"58##8,1$".5$!f%!f#*9&ndash;32$".0%!9#1:1-hsdr:hsdm:hsds"*3&ndash;12+!4*!4##0.5$#:55##1.4',
+    '#!2$)&ndash;34$".4$#:58$!f%!f#$3:15&!8#!4#*7&ndash;41#!8$".7$#:05#!9"+42&ndash;47',
+    '#!4$(&ndash;5#!5#$6:00#!9#":1"*5&ndash;11*"25*$3:24*!8#",6##1n3#!5#!7"/6-diaminopurine',
+    '"!l"!n!$=230#+5&ndash;50%"!a"%blood"&coarse"+granularity"&intact"&medium",occasionally"$pain!0a&mdash;personal"!.#$true',
+    '"&bility"!g"!l"(m-5.45pm""re"!x"!z!/b&mdash;medical""+d"#-2d"!."!8"!c"!h"!l',
+    '"!x"#yte!#c-f"#1b2""3f"!7"*8&ndash;10"(=0.075cm"!b"\'g195+04""i2""xa!+d&ndash;566"!-#"3d',
+    '##tlc"#/3d""10"#4+1""b."!d"!e"!h"$m.85!"e0"!1"!d"!e"!h"!j',
+    '"!p!"ff"!m"!s#!e"&t-high$&square!%g/-1g",26-formation"!6"!7""80"\'al/acre"#m/c$"rc',
+    '!"h2"!a"!d".esc&lsqb;7iesc"!h"!j"!l"!t"!v"!w"!x!"ii!!j"!g"!l',
+    '"!y!#k-1"!6""ev"+g-sunflower#!.#!/$34&ndash;4&frac12;lb%"lb""hz$%-5khz""pc"!w!#l-2"!a',
+    '""g."!l""oe"!q"!r""tr"!w!)m&sup2/kg"#,6d"!-#!1$"5m#%bytes#$deep#&strong',
+    '#"us##yte"*cg/kg/hour"%etres#!v"!g#"ml""hz"!i#%llion#&n09-15$%3secs$&54secs%$secs$\'s10secs',
+    '%&22secs",r/47/a/d4/h1"!w!#n\'s""+3$!+"!-#!1#%level"#/np#!p"$3055##904"!a"!b',
+    '",d&ndash;31st*#6th#$-3rd$#5th$%class#$/5th$#9th#$vs10"!h"(mf/2n=mf"!r"!s"!y!$o-4o"!5',
+    '""ha"!m"$z/sq!)p&gt;0.50"&-sized"".m$!."%11-12"!2"&=0.023&"36\'!8%"14"+acalypsenow"!e',
+    '"#int"+m&mdash;4pm$,ndash;2.35pm*#4pm*#5pm#\'-3.30pm$#4pm$#5pm$#6pm$#9pm#!."!n"#ort"!w"!y',
+    '"!g"!n"!r"!z!"re"!f"!l"!p"!q"!u"!v!$s-2p"#.3d#"8d#!e',
+    '"!d"!g"\'hilling"#io4"!j"!q"!s!#t+1""-1#!2"%/acre"%bspns"!p"#r/s"#sps',
+    '"!y!"ue"!f"!n"!u"!y"!z!$vrms!&w12-14"*enty-eight"!k#!s!\'x10&ins$#6km##5ml',
+    '#"in",256x0.125mhz#"in#$x3x5"\'5inches#"ml"!6#&4x5mhz#&inches"\'8inches!#yds"\'ear-old""rs"!y %3%-4%',
+    '"#/yr!)&agr;-flu#"mp%";2"&bsol;3\'"45"*commat/1/2();1&bsol;2*\'/2-year"*deg/minute%#;10&#per&!w".frac12&ndash;1/(2&frac12',
+    ')&times;/%8&ins(#;cm)#id.*"ns,+&ndash;5ins)"kg)"lb)!m*%/12ft\'!3\'%4&ins("/3(#;-4)!d',
+    ')"oz)!p*!c*!t&$34;d)"kg)"lb&&58&ins#,t&ndash;4&ft"$half&%;inch+"es\',x4&half;inch)$inch"+lsqb;h&rsqb',
+    '("if("no#&gr;gml&!l&!m#$icro\'";l(!s((v/&deg;c$&ddot;1)!2)!3)!5)!7"/ndash;0&ndash;0',
+    '1!5)!4)!7*!0)!8()1&ndash;00"100!8)!.)"/2)(0&mgr;ms+(ndash;12*!4*"70*"cm',
+    '),1&ndash;18813"98*!s))3&ndash;01!41!8)"6%)"94()2&ndash;1)"00*!3)"13)!2)!9((3&frac12',
+    '1"in*$half*\'ndash;40!8)#.5%+.kg/7&ndash;8lb)%5&deg)!7*!%)!8((4&frac12*%mgr;m)%-year)!0*!5',
+    ')!6*#.47)!8)":1)"cu)"hr)"in+%-wide)"mm+$/100*"yr)#tbs*!h()5&ndash;3),,000,000,000',
+    ')!1)!2)!3)!4)!8)"ft)!g)!m*"in)!s)"th(%6&deg*\'ndash;0)$,000)(-day-old',
+    ')!5)#ff.*!t)!h)"in)"pm(&8-week)$/min)!0()9&ndash;0((november(\'victory"#pgr#-rime;10&prime)\'7&prime',
+    '((33&prime)\'4&prime((40&prime)\'1&prime((54&prime")rehy;star",shilling;2d.+#6d."%times\'$;100(!2)"00(!5!"\'-#"5\'',
+    '#$half#+nucleotides#3o-methylnucleotides#$side#,untranslated"=5316:ctggtctgagtcttggttccgtcc"=8e2:gctgtcaaaggcattctccgatgcc"$ad15"&gordon!"()"#10)#"a)""9)""e)""g)',
+    '!.+1-dimensional"!4"%7=7+1!\',00,000$%0&deg&+ndash;3,500,%6,000%#+km%.,000-4,000,000*)signature%"-1&$4000&(employee&"ft&\'hectare',
+    '(#use&#man\'$etre\'!w&$plus&7sales-and-you\'re-a-star&$year*$-old%!c%\'ft-high%#gph%"hp%"km%"lb%&seater',
+    '$#1st$%4,000$!7#"10%$,000$%4,000$%7,128#"39#"40%!m$%2,614$!4$!5$#7ft#"56',
+    '#"62%$,065$!3%$,000$!8#"73$-5&ndash;3,678/"85$!6$-9&ndash;3,660#"80$!5#&90,020$!1$!5',
+    '$!9#"oo"%1,2,4$!4#&00,000%$.00.$!2$%3,000$!6#!1$!5$%6,000$!7#"23$"4%',
+    '$!8$!9%#.1m#"32$!3#&40,000$!3$!6#"50$!1$!2$!4#"63$%4,908$-7&ndash;3,851',
+    '$!5$!7$%9,380#&90,000$!1$!7%$,000$!8%!1"!2#",3#000&ndash;3,600kg%"km%#rpm%#ton',
+    '$%4,955$#5ft$#6ft$!7#*12&ndash;1$$3.55$!5$!7#"21$!4%#.96$%9,000#"31$%2,000$!4',
+    '#!4$!1$"2%$%3,000$!4%#.3%$!6$#7ft#"50%!m$!1$!2$!3#"60%"ft',
+    '$"8m#&75,000$!6$!8#&82,061$!4$!6%"ft$!8#"90$!2%$,000$!3$$5.00$!9',
+    '#&\',5,5\'#C-diaminobenzidinetetrahydrochloride#600,000&ndash;3,500,000%"ft%"kg$%4,000$!6#"15$%6,453$!9%&,333.8#&23,000$!4$!5$!7',
+    '$!3$!4$"5%$%9,250#$40ft$#3km$!4$!5#"55$!6#"60$%1,140$%2,000$%3,000$$4453',
+    '$#8ft#&71,000$%3,100#"81$#5ft$!6$!7$!8#%93.00"%4,5,6$)6,9,12,14#*-methylene#$00gn%"hp%"kg',
+    '$!3$%9,000&#737#"11$!8#"20$!2$!3$!4$"5m$%8,000#&30,000$!2$!3$!4',
+    '#"42$!4#\'50-mile$#2.4$!8#365-million-year-old$"6m#"78#"88#&90,000$$2.00$!3"$5,12$46&ndash;8,9&ndash;11#%-camp',
+    '##00%%,&ndash;5,000%\'-10,000&%4,000&"km&#man\'#ile&$plus&&strong&(year-old%"bc%#gns%$yrbp$!1$%3,103',
+    '$%7,000$!8$!9#&12,000$!7$!8#"25#"40$!2$!4$!5$!6$!7$!8#"53',
+    '$!4$!5$!8#&74,000$%5,032&#516$!6#"80$#3.7#"92"#6,7$$9,12#&00,000%\'-member$!6',
+    '#"14%!m$%5,123$%7,026$!8#"29#"36$!7#"40%"80$!7#"50%$,000$%2,225#"66',
+    '$%3,000$!8#"81$!4$!8#&90,000$%3,098$!7"&700+km%"ft$%1,661$!4%$,000#"12$%5,800',
+    '#"25$!7$!8$!9##33m$!4$!6$!7%#.50##54m$!9#"74#"87$!8#&97,605',
+    '#(,9,15,29#$02ft$%4,000#"12$!5$#6.1$!8#"22$!5$#8ft#"32$!6$!9##42m#"50',
+    '$#2ft$%7,400#"61$!2$!5$%6,659#"72$!7#"81#"98$!9"!9#%00,00%%-hour$!3',
+    '$!7#\'17-mile#"20$!5$$8.55#"35%$,786$!6$%7,000$%8,000#"40$!5$!8#"57#"62',
+    '#"84#"90$!1$%2,000$!5!\'-&gt;12"B(4-hydroxy-3-methoxyphenyl)propene"#.25""11#$2-91#"49#!7#!8$!9#!9',
+    '#!2#!3#!8"(3&frac34#$,500##-93"#4-3$#day#"lb"\'500,000#!1#(40534865$!5#!c")764327820',
+    '$$week#"ll$2pha-hydroxysteroid#4mino-9-ethylcarbazol\'8propyl-triethoxyl-silane-/triethoxysilane#%rched"!b##ell#"it##ond$"ok#!p#6romo-5-&lsqb;n-phenyl-##yte',
+    '##ell#&hannel$-olamidopropyl#%olour$!m$(nsultant$"re%#ner("ed#%resol#%ycles$&linder"7deaza-2\'-deoxyadenosine\'/adenine:thymine+$ylic',
+    '#$igit""er#$vent"\'fathoms##eb.#%inger#%or-10#!t"$game#8lucuronide:6-glucuronide"!h#-ydroxycamphor)*echinenone)*kynurenine);propane-1,2,3-tricarboxylic',
+    '3(xanthine"\'km-wide"/lb/&pound;10.49/"99-$4.75,$9.49#%etter##ink$$tres#$obed"#man%#ual$$sted#\'egabyte$/thyl-2-hexenoic',
+    '#%inute#\'m-thick#+onosulphate""oh##ver#)xapentane$$ford#"z."&person#$hase$\'osphate#$iece##lus#!u$$tted',
+    '"$rail"!s#$haft#$pace$&reader#$tate$\'reatham#\'yllable"$tier&"ed##o-5"&volume"%week-&!s#&heeler',
+    '"$yard#%early%"st!-.0&ndash;3.49,"5%,!6*#4.4,"9%*#6.4#$-5.0$)supported#"00$&:david%$this#!1',
+    '#!2$!p##3:1$"pm#"4p#&5/7.32$$:the$$a.m.##7:1#"bn#!d#"kw##mgm$!m#!p',
+    '#$secs##x10"+1&mdash;3.9$\'ndash;2+#3.2*!3*"6%#"()$"a)$"d)#*-compliant#$.2.1&!2$#6.1\'".1',
+    '\'".1(!2$!8##0.1%!3%&5(iii)%!8%"90$):northern%#top$!a$!b$!p%!m#,1&mdash;3.17',
+    '$#(e)$".1#$2.10%!2%#685$\'countss#$3(c)$!6$!b$!c#"4%$)&ndash;15$#,16$!0$"12',
+    '#"5%$&&ndash$!0$):outsider$"am$!b#$6(c)$!.$!a$!c#,8&ndash;3.45$!.$!1$!m#*9&mdash;20',
+    '$!p#(m-strong"%2&deg$)ndash;3.4,!5##(d)#%+8.6/#&-based$"kb$%litre$$mile##.14$#3.1&!2$!6',
+    '$!8#&/intel#,0&ndash;3.36$#(b)%"e)%"f)$!1$"pm#"1%$!a#"2p#"3%$)&ndash;25$!2$"oz',
+    '$#.85%"93#(5&percnt$"in$"kg#"6%#"7%$#(c)#*8&mdash;65$".2$&0.24jy#!a#!b$!n#$gbps',
+    '#\'km/2mls$"pc#"pc$%kwh-1#$secs$%tatic#"x."\'3&amp;c$/ndash;3.4&deg;c##(i)$"m)#%-inch#!.$#1.4$#2.1',
+    '&!2$#5.1&!2&!3$!7%".1&!2$"90%!2#%/1000(*deliveries#+0&ndash;4pm+&5.30pm+$6.00$!.',
+    '$#p.m#&1-3.35$!a$!b##2.3#$3(a)%"b)$!3#)5:triumph$"am$!c$!m#&6-3.52$!m##75m',
+    '#+:1-compared#!a#!b$!n#"cm#&km/4ml#"lb#\'million#$secs")4&mdash;6%$gr;m$*times;10/l##(1)##.10%!7',
+    '$#3.1&!2$)4&ndash;6$$5(f)$"92#,/100000/year#&0-3.42$".2$$:top#"1p##2am##3pm#%55ghz$$:not$!a',
+    '&!3#"80$!a$!b##9.6$!a#":1#"hz#"kg#!m#$secs##x10"\'5&aring$%deg;c$)ndash;1.5',
+    '*$3.99*#4.0*!5*#6.5+!m*#7.5*!8##(a)$"b)#,-dimensional$"kg%\'ilobase$$volt#&0-3.56$#0kg',
+    '#"1b$!m$!p#"2%#"3%##5am$!p%!m$#x10#"bn#!c##fl.#"gb$"hz#!h',
+    '$!w#"lb#&m/12ft$!b$&illion$!m#"oz#%p/kwh#!v"%6&deg$*ndash;17.5*$3.16##(a)$"b)##-kg',
+    '##.12$!4$!5#%/1000(\'00/year#-0&ndash;3.75m#"2%$"0p#"3%#"4%$!m$!p#"6%$%/7.32$!m',
+    '##b-d#!c#!d#"fl##ghz#"lb$#oad##mls$!m$!s#$secs##x10",7&ndash;35.0*#5.4,!7',
+    '##.16$#2.1&!2$!8#-0&ndash;15.80$!4#"2%#!3$!2#"5.$\'million$"pc#!7$!%##8km',
+    '$"5p#"in#"mg#$secs#$t/ha",8&ndash;19.7*#7.3*#8.2#&-metre#!.$!4$!5##/ha##1oz#!2',
+    '#!3#!4#!5#"6%$"pc#,8&ndash;3.92#"90$"bf$!p%!c#":1#!b##ftl#"in#"kb',
+    '#"mm#"pc"*9&ndash;10*$3.11##-kb$%litre$%metre#".1%!6$!2#\'/100000#!1#!2$"kg#$4.39',
+    '#"7%#!8$*&ndash;402$%.4.02$!p#"9%#":1##ise#"kb##sec!"/-"!0"$11d.#$2/91#"42',
+    '$!2$"in#"75##965"$2/92#"22#"32##411#!5$!c$"sl"(3&frac12#"35#!5""4+',
+    '##/41#"37#!d#\'in(5cm)#"oz#!p""55"#602$!s#!2$!5"17/92&ndash;5/7/92""80$#ths#!3',
+    '#!6#!9"$9/65#!1#!7#!9""an"%brain"!i"#kg2"%paint"&slowly"$take"$week!,0%&ndash;75%',
+    '#$:50%"+&amp;degree#*deg/60&deg&%;c/km)$r.t.\'!f\'!s\'!w$)ivide;300#*frac12&ins)$;ins*!p#=ins&times;18&ins&times;12&ins&0;x12&ins;x12&ins#\'mdash;1',
+    ')#35p*!6)"40*"5p)$9650)&gallon)(produced$&gr;gal("ml$)icro;g/dl#)ndash;100+!4+!8*"20*!4',
+    '*!8+1&ndash;0&ndash;36)!2*"00*!1*!8),3&ndash;18844!5*!0+"00*\'1&deg;c*!3+!.**5&deg;c/km+"cm',
+    '+!p*!8)34&ndash;106&ndash;1*\'0&deg;c,&percnt+"00+"ft+"kg,"ms*!3*"5%+&&deg;s+"ml*!6*!9',
+    '*%0&deg+%mg/kg*!3*!4*!5*!8)#60%+$&deg+!1*!2)"7-*!4*!7*!8),8&ndash;1856',
+    '*"0%*!1*"5%)!9*1&ndash;1&ndash;19*20m/100&ndash;300ft*!5*!6*!9)(november)#oct#%pound#(rehy;day(#odd($plus',
+    ')&22&ins*15cm/12&times;10in)&30&ins+"cm)245cm/12&times;18in""\'n#!w"%(10%)#"3)#"4)#"5)#"8)"#+km"1,000&ndash;35,000-&45,000',
+    '\'(capacity\'#odd\'$plus\'+square-foot\'#ton&!0&#gns&#lbs&!m&!t%#1st%!6%%7,000$"83##100',
+    '##246#%31,74$"40%!7$"51$"64##464%!8$"79##500&$,000$"50##651##786#"80',
+    '##908$"50$"80"$-.46#!0#"16#(30-20-20%"cm#&40,000)$,000%"cm#"59#$9-93$!7$\'9&deg;c',
+    '$#ug.#\'billion#\'cm-wide#$date$$ec.1\'!4&%ember%$nier#%entry#)foot-high($wide#$game%#uge#"in$#tem',
+    '$(ilometer\'$watt$!m$#not#$love#!m$#esh%(tre-long$)icrometre%\'le-long\'"rs&+lion-dollar+#ton$!l$"ph',
+    '#\'pfennig$%rison#%right$%ocket%"om$%unner#%share%&illing$$tone%%retch#\'vehicle#$week#+year-affair\'#old"#.0%',
+    '%$0,00%"3s$!5$!6%#sec$$7.93#,1&times;10/l$$.1.1$$0.64%#2v.%#3r.%"76$$1.92$+39&mdash;40$*8&ndash;20',
+    '#"21$!2$!4$!k$"pc#"33$!6#(4&percnt$!0$!4$"75$!9$!p#,5&times;20.2,%5.4cm',
+    '$!3#$6.92$$0.64$!1$"3p$!6#\'7&deg;c$#.87$!8#"80$!8$"km$!m$"pc#&9.1991',
+    '%"91$!2"%/-40%#$1/86$$0/86$"15$)6&ndash;1#$3/41%"87$!5#$4/41%"87%"90$!3##567',
+    '#%60ths#$7/87#"83#"92",0&amp;degree.":c$%deg;m%\'ollar;c$%micro)";g$,ndash;10,000,"00+#324+!5,"00',
+    '+"07+"25+"50-"kg,!9*\'400,000-"kw-"mw+"50-"mm*!6+"00-"km*%700kg$\'sol;600',
+    '#!+##,00&/0&ndash;400,000/&50,000.\'500,000\',,000,000,000\'(-400,000(&a-year(\'hectare\'"km#"-1$#330$&500lbs$%berth$"ft',
+    '$$hour$)kilometre$"mw$$name$&person%$oint&$unds%$upil$#run$$seat%(ignature$%tonne$$watt%#ork$)years-old',
+    '##/15$#400#\'0&deg;f%*ndash;4500+$5000+$8000$#\'er\'!s$!+$!-%$acre%%based%$fold%(year-old$%/2130',
+    '%#500%#800$%00000$"72$"ad$#gns%!t$"kg$"lb$"mm%!p$#ppm%"si$#rpm##1.3',
+    '$$0-11$(50&deg;f#"28#!3$".9$!0$$99kg##4.5$$5-46##5.2%!5##6.1$#/19##7.5$"70',
+    '$!0#,9&ndash;3010$".1$!9#"bc$!p#!c$#als$!c#!d#$e-24#%kjmol$#m/h%!s$"ph',
+    '%!h$"yr##lbs#"m2$#ile$.l/&frac12;pint%!s$&m-long$!w#"oc#"pa##rpm#&sl-224#!t#$x300',
+    '*!4#$,455##.34#,0&ndash;r50b$".1$"ft##183#!2$!0$!9#"31%!4#!5$"51$$9-60',
+    '$!5%#-75$#611##739##831%!3##933$!4")2&ndash;3+"03*!5*!8##(2)#$-day##.30',
+    '#!0$!0$$5-12##249$"64$!9##332##4.8##5.0%!3$!0$!3##606$"34#"70',
+    '$$7-90#!9#!f#"mv"+3&ndash;305*!5##(5)#$,000$#200$#504#"-6#".1##/31##1.0%!2',
+    '##2.1$"05$!2$!3$!4#!4#!5$".4$!3$$9-61#"6/$$7-75#$7.00%!2%!5',
+    '$".6%!7##9.3#!a#!p#!x"+4&ndash;305#$,000$#660#".2##0.1$!0$"27$$8528#&1,3042',
+    '#!2$#.00#!4$".6##546#"60#%72-73$$4-75$"ft#08,3049,3051,3052$"mm##9.3$$5-96#"ff#!k',
+    '"*5&ndash;10*#282*#315+$30kg*!6+$10mm+"91#"\'s#$,140$#344#"-6##.65#&0/resv$$6-07##1.1',
+    '#!2$".1$!0#03,3129,3130,3135$".1$!0$$5-36#%41-55$!8#"50$"45$"67#"60##7.6$$4-75',
+    '$!4$!5#$9.00#!a#!b#"kg#"mm#"pp"+6&ndash;281*#613#$,000#!0$!0$$6-07#!1',
+    '%#-20#!3$!0#%42-44##5.5##640##7.2%!7#"85#!9$".3#"ff##khz#!m#!s',
+    '*#337+!7*!9#$,000$#472#!0$".6$$0-02%!9$!8#!2$".6%!7$!0##3.6',
+    '$!8#"56#!6$$3-64#!7$".6$!7#!8$#642$!7#!f"*8&ndash;16*"24*#312*"61',
+    '#"11$!7#!2#%33-36%$4003$"52##5.2%!6#!6#!9$!0#!b$"hp#!d##gtb',
+    '#"lb#!p"+9&ndash;316##(1)$"2)#$,000#$-day$$room##.5%#+0&ndash;600$$-200%$300s%*compatible)\'patible%!e',
+    '%!s$!0#%11-12#!2$".4#!3$".1$!1#(4&sol;86$".7#!5$".9$$7-58##605#!7',
+    '$".5$!0$!2#"91$!4%#-96#"f.#"p.#!s"#:00%".4#)1&ndash;6$$3.74$!4$!6',
+    '#!3$!3$$7ff.#%49.30#"70"!b#"+d#"hp#!p""c1#)m/12-inch\'"in#\'wt/acre#&ycles.""ev',
+    '$!."#g/t#"hz#"ph""ha#"mz#"rs"-in&ndash;41in$"ch""jy"#km.$!s#"ph"+l.j.q.b.321"&mg-may',
+    '#&illion$"ns%#ute#%l/1fl$!s#"pg#!t"%ng/ml$"ml#!o"!o#)-segments")p-a-share#"as#"pm',
+    '##oom""sq$#.ft"-th&ndash;31st$$/1st""wb"&x2x2in#&30&ins%"ft!\'1&deg;c\'!f#)frac12;in#(mdash;2.)!7$\'iddot;2',
+    '+\'4778240,&894120**2&ndash;792"84+!0*!4*25&ndash;0&ndash;30)12&ndash;1&ndash;5*!7*!8)"35*!6*!7)!4*!0',
+    '*!6*!9)!5*!1*!3*!5*!7)"67)"70*!8)"83*!5#+shilling;7d"#(6)#"9)',
+    '$"+8"$,033$"50$"98##138$"70%!1%!2$"80%!4$#992##207##310$*2,33,34,28$!3',
+    '#\'506,000$"63$"78##667##723$&60,000$"82##800%!1$"14$"75##942"!-#"13$!4',
+    '$!7#"33#!4#!5#!6##aug##bit#%fight$$rame#$gram#%issue#$jan.#%match#%nov.1#$page',
+    '#\'treated"#.00$!2$!4$!6##10.&"89%,6v&mdash;258$$2.88$!3$"42$$5sec$"88#$21.6$+2.1&ndash;4',
+    '$#5.5$#6.9$!8$!9$"mb#$3.93$!1$!4$!5$!6$!p%!c#$4120$!6$!9',
+    '#%5&ins$%.1865%"91$!0$!2$!p#"62$!4$!9$!p#&7.1871$"kg#$8.92$!0$!3',
+    '#"93"%/1/87%"93$$0.15%#/92$$2/89#!2$":1#$3/87$!3$!9#"40##585#"60#$8/78',
+    '#"92""0%#&&deg;c$\'mgr;gml$(ndash;12+!5*!6#$-265$#325$&member##.55$"60%!5#$/312$!l',
+    '$!0$!5$!8$!s##1.9##3.9$!9#"40$$5-46\'!7%!5#!6#%71-72$"31$!7',
+    '%!6$!7#!9$!0#"ff$!t#"mm#!s#%x82mm"*1&ndash;12+!3*"36#$,000$#650#$/585',
+    '$".4$"03#"23$"88#!4#*5&mdash;19$".1$"55##600$"11$!5%#-66#"70#"80#"97',
+    '#!b#!h"*2&ndash;13*!8#$,800#&-pound#$.8mm#"/1$#311#"05$!6#"13#"20$"45##350',
+    '$!6%#-47##5.5$!3%#-54$!6#"65#\'793/784#"82##9.6$!0#"bc#"pp#"t4"*3&ndash;14',
+    '+!9$(times;10#$,000$#683#%-foot##.64##000$&4/9983#"12$"31%!3#,2&ndash;3133#"31$!7##437',
+    '$!2%#-53$$3-54#!6#!7$".6$!0$$7-78##810$%9-401#\'9jd7104#!s""4%#)&ndash;17*#243',
+    '#$,707##.8%#&2,3150#!3$"/4$!9##408$"11$!5#!5#"60$!6#"70#!8$!6',
+    '#!9$".0$!0$!7#"cm#"kg#!p"*5&ndash;18*"22#$,000$#600$#800#*-cartridge$"km$$seat',
+    '##.29$"89#!1$)&mdash;62$!0$$3-15$!5#!2$!0$$5-37#!3#!4$".3$!1#!5',
+    '#"63$$5-71##850#%92-93$!6##lbs"*6&ndash;17*"24#!-#!0$!4$$5-07#!1#"20$!7',
+    '$".3$!0$!4#!4$".1%!4#!5$!.%!3$!8#!6$".9#%77-79&"80#"82',
+    '#"a.#!i#$mbar#"nm##pp.#"s.$!w#"th"*7&mdash;20$(ndash;21*#324*!8#$,841#".4$!6',
+    '$#893#"/0$#337$)5167=6.1%#*0&mdash;86$!7$$9-18##1.0#!2$(&mdash;8#$3.33$"15%!7#$4016$!9',
+    '#%65-66#!7#+i&egrave;me##kg.#!p"*8&mdash;19*"36*"51%$icro$(ndash;23*"47*!9#$,317#$-335$#ton',
+    '#!0$&&micro$"00#$1.35$"71#!3$".9$!1$!7#!4#!5#!7##8.3$!0$#429',
+    '##990#!k$$cals#!s"*9&ndash;20*"31#(,000,000#\'-member#$/321$"82#+0&mdash;220%)ndash;202$"36$"41$!8',
+    '#)1&mdash;6$$4-20#"20$"32#)3&mdash;6$"/4$!0#!4$!0$"48$!7#!5$!0%#-51\'!2',
+    '#!9$".0#!p"+:1&ndash;11$#0ff$*2&ndash;18$!3$!4$!6$!7$!9#"30$#1ff#"44#!8',
+    '#!.#$pril"%bc-ad#!n"-cm&times;17cm"!e#$-55e"!f#!.#!f"!g"!k#&g/s/ha""mw""pp',
+    '#(t-minute"#tel#)ypewriter"(year-old!.2&deg;22\'20\'\'n\'$c/km#)egrave;me#\'mdash;3)"40$)iddot;5cm+%x38cm*!8#)ndash;34%*!6)"40',
+    '*!7+"30*!8)!5*31&ndash;94&ndash;65*!5)#63%*!4)!8##ohm#+shilling;6d"!\'#!s"#(3)#"4)',
+    '#"c)#"h)"!+"(,000,000&$-man\'&strong$"20%!7##195##273#\'300,000$!3$"50##400$!4',
+    '##513##611$"69##767""-1$!0$!7#&34&deg$"7%$!8#"46#!8##box#\'channel#\'episode',
+    '%%oters#&gallon#$hour&"se##its#(km/20-ml#&length#&player$&ounder*!s#$seat#+thousandths$&onners"#.04$!9',
+    '#"10$!3$!p#"20$!4$!8#\'3&deg;c$#4.3$!5$!m$!p%!c#,4&ndash;33.9$!0$!5',
+    '$!9$"kg#+50-&pound;5$!4$!p#"63$#mpg#"75$%68khz$!p#$84m.#"94$!p"!/#"21',
+    '$"57##426#"74#"81#"92"%0&deg$(mdash;21%$gr;m$(ndash;50+$25mb*$8190##(4)#$-350$$mile$$yard',
+    '$"97#$/515#,0&ndash;2100+#400+#600$"00&#000$$3-04$"km#!1$!4#,2&ndash;0494$!0##333$"65',
+    '#"50$"22##744$$6-78#!8$!0$"81#!a##bhp#!h#!i#%kcals$!m%!/#\'m-bytes',
+    '$!m#"nt"+1&ndash;322,!4#\'-member$$seat$$type#".5$!7#%/1077#!1#\'242/ext#"30%!7$"34',
+    '$"62#!5$)&mdash;55$"35$"90#!6$!3#!7$!9#"80%#-81#"nm#!p"*2&ndash;32,!3',
+    '*!6#$,000$#572$#600$#800#%-page##.32$!7##064$"km#!1$)&mdash;32$!0$!8#!2',
+    '##3.9$$9-40#%56-57$"71#"62#&7/3228$!1$&8/9734%!2#"97$%9-300#!a$%(7)ca#!b#*kms/200mls',
+    '#!n")3&mdash;4$\'ndash;4*$5998#$,653#$-170#!.$"31#$/534#!0$"00#%27-28##3.2$!8#!4',
+    '$!0$!2#!5$!0$#374$"46$"87#*6&mdash;41#)8&mdash;9$".0#!a#"bp#!p$"p.")4&ndash;2',
+    '+"40*!5*!7##(3)#$,000$#200$#400$#500#%-yard##.62$"75$"87##/86#!0$!0',
+    '#!1$!0#"30#"58##6=7#!7#"82#%94-96#!c#!h""5%#$&deg$%mdash$*ndash;1036*%350kg',
+    '*!7##(2)#(,000,000#$-328$&member##.26$!5$!8#"/l#"03$!5#"10$$3-17&!7#!3',
+    '$$3-55##620#)7&mdash;8#!8$!8#!9$$2072%!1$!9#!f$)/160c/gas$!t#!g#"ha##ise',
+    '$!p##pp.##sli$!q$!x#"td"+6&ndash;327*!7*!8*!9#\',217.75$#866#".5$"8p#!0',
+    '$!4%#-15\'!8$"80#"20$!2##378#"43$!6%#-47#"59#!6#!7$!4$!5',
+    '#"80%!3#"90##bhp"*7&ndash;32+!3*!9#$,000%"27$#737#\'-member#+0-emulating%#sna%$type$%/3770',
+    '$$7-18#!2$!2$"72#"41#%55-56$$6-57$"83#)6&mdash;8$"03#!7$!8#"81##9ft#!d',
+    '#/&ndash;37-reply#"\'s##(4)#!.$"13$"6%#"03$!4$!6$!8$!9#"16#!2$(&mdash;7$!3',
+    '$"90#!4#"60#*8&mdash;93#"98$!9%$-900#!f$!f$!t#!p$!p",9&ndash;2839*#325+"30',
+    ',!5+"89#$,000#!.$(4164.3gm#%19-20#%27-28#)3&mdash;4$!8#!4$)&mdash;00+#302$!2##556#!8',
+    '$!1#"90$!8#!b"#:00#+14&ndash;20$%8b-23#!2$!7#"44#*7&ndash;14")a&ndash;d##(2)"+b&ndash;38c#!n',
+    '")d&ndash;h#"m2"!e"!f"\'kg/s/ha#"mh""lb""no"#pp.#"ts"$secs"$tbps#"p1"!w"\'x32x8cm',
+    '#$-43%"+&commat;2/3#+deg;6\'50\'\'n\'$c/km#)frac12;in,!s\'"58)#;in##ins#%mgr;m#,ndash&frac12(";0)"10*!4*!5',
+    ')"35*!7*!9)"41*!2*!7)"50)"61*!2*!7*!8)!7*!7+!%)!8',
+    '*!1#&percnt#7times;23cm/13&times;9in*%6&ins""\'s"#(b)"!*"*,00-strong%+0-signature(%trong$"48$"85%!8#%111.6%!3',
+    '$%70lbs##274#\'315,528$!5%!2##400$"32$"60##500%!5$"32#\'615,000$"29##700$#50-',
+    '$"21#\'938,000"#-12$!7#"27#!3#"42#(employee#%kiosk#%match$"hz$#ile#&pounds#\'station%$rong',
+    '"#.0%$+&ndash;14.7$!5$!7#"11$!5$*8&ndash;19$!p#&2.34.1$!0$!1$!5$"pc#"32$!3',
+    '$*74&mdash;5$!8$"ft$#mpg#"42$!3$!9#"53$!4$!m$!p#"7%$!0$!3$"4m',
+    '$!8$"pc#"83%%7.5gm$!p#"90$!2$!6$!8""/2$"40#"32$!3#"40$"22',
+    '#%66mhz$!8#"92""0%#&&deg;c(!f$\'ndash;1*"50#(,000-man$#453#$-360$&member&#tre$(p.p.m.v.$&strong',
+    '$$yard#%01-02$$4-05$!m#!1$!0$!7$!8#"20$!1$!3#!3$$6-37$!9##405',
+    '#)5&mdash;6#$6.13#%75-76$!7#!9$!8##a-1#!f#"gt#"hz")1&ndash;3+"33#".4#"/3#!0',
+    '##111$"44#*2&mdash;38$!4#\'46/9625#"51$!4#"61#!7$!4#*9&mdash;40$!0%#-91#!b"+2&ndash;333',
+    '$#546%"67$#888##.00$"5%$"70#%02-03$$4-05#"20%#-21$$1-24$!3%#-24$!4$"55',
+    '#$3-24$"01$"54$!9#"44$!8#"58#"68#!7$!9#&8/3329$!7##900$!8#!h',
+    '"%3,333$#500$#732#%-acre##.3%$"8%##012#"22%#-23$$7-28##306#"40#"50$!7#!6',
+    '$!5#!8$$2-84$!5##bhp##s/l#"t.""4%#*&ndash;250*#338*!5+!4*"68#$,200#$-337',
+    '%!7#"00$$1-02$!3#"23$"44#!3$!0$!4$$5-36#!4$!5$!8#!5$!0',
+    '#"60$$4-66$!6#"70$$6-77$!7#%85-87$$6-87#"pp"+5&ndash;394#(,000,000$#153##.28#"00$"kg',
+    '$!6#"22#$3.76#!4$!4$"96#%50-55%!1%!2#!7$!0#!8#!9$!2$"47',
+    '#"gm##khz##pp.")6&mdash;7$+ndash;323bc*!7+&&ndash#$,869%"80#"00$!5#%18-19$$9-20#"20$"62',
+    '#!5$!3$$6-57#!6$!0$!2#"70#"81$!3$!5##978#"bc#"kg#!p"*7&mdash;46',
+    '*#338*"46*"51*"61#$,100$#250$#394#$-339#!1#"24#!3$!0$!8#!4$!0',
+    '$!7#"50#"68$!9#"78#"86$!8$!9#"94$!9##lbs#!x"+8&ndash;340,!4#$,500',
+    '#%-page##0-k$"ks#!1$$2-13#"23$!8#"37#"40$!2$!4$$9-50#"50$$2-53$!5',
+    '$!8#"67#%74-75#!8$!0$!1#"95#"bc#)f&ndash;g#"km#!m"+9&ndash;340,!1*!4#$,700',
+    '$"-3$!2#!1#"20$/513&sol;3392562#%32-33$$5-36$#704#"40$!2#"55$$9-60#"63#%70-71$$5-76',
+    '$!2#%95-96##b27"#:11$*2&ndash;13#"29#$38f.$!9#!4"!c#!l#&m/13in#!x""er"!f',
+    '#!p"0ibm1,70018.415.8#!n""kb#!g#!m"#lbs"-mb-per-second#$flop#(hz-40mhz""nt"&pounds#"ts"#rpm""s.',
+    '$!x"!x#$45.8"(year-old!&4%-45%"$&deg#(mdash;40)!7$$gr;m#)ndash;103*!2*!8+!0)"21)"30',
+    '*\'5&deg;c)"41*!2*!4*!5*!7)#50%*!5*!8)!6)!7*!3)"80)"99#&percnt',
+    '"#(4)#"5)#"6)#"8)""+3"(,000,000&%-mile$"68##104$"66##200%!9##300&$,000$!5',
+    '$&42,000$"97##521$"39$"88##630$"90##701%!7$%95.34##812#\'925,000$"74""-0#!1',
+    '$!8#(26-34ins#"36$!7#!6##all#\'bedroom#!d$"ay#&footer$$rame#$inch#!m##odd#$page',
+    '#-year&rehy;old"#.0%$!0$!7$!8$$secs#%1&deg%(ndash;28$$11r.$!3%!%$!4$!7#"2%$#.33',
+    '$%00,00$!3$!5$!8#&3.28.1$#3.4&!5$!4$!5$!6$!9#+4.1&ndash;2$!0$!4$!7',
+    '$"pc#\'5&deg;c%*ndash;34.7+$51.2$!0$#278$"bn$!m$#ppt#"67#"76$!8#"84%,&ndash;34.87$!6',
+    '$"ft$#sec##915$"25$!4%&&deg;c$!9$!m%"ph$#ppt"$/115#"35##418##569#"60',
+    '""0%#$&deg$)ndash;250*#343+$70cm+"80#%,000.$#400$#800#$-343%"70$#bar%&edroom$#ish$$yard',
+    '$!3$$4-05$!5$"bc#!1$!0$!2%!7$"76#+20&ndash;32%#-21$$3-24$!5$!6$#7\'s',
+    '#!3$$2-33$!9#"59#!6$!0$$7-68#%70-71$"55$$7-78\'!9#!8#"ft#!h$!z',
+    '$$cals#"ma$!w#%p.p.m(!.#!r#!s""1%#(&ndash;2*!5*!8#(,000,000$#478$#650#".6',
+    '#%/2+20#!0$!0%!0%!1$!1$!4$!5$!7#%12-13$!3%!1$!4#!2$!0',
+    '$!3#"30$!3#"46%#-48$!7$!9%#-50#%52-53$"52#%62-63$!3$$5-66#"75$!9',
+    '$$3-84$$7-88#%92-96#!b##ff.#!g#!h#!p$"p."*2&mdash;64$)ndash;270+"93*!3+"47#$,092',
+    '&!2#"-4#(/462/000#!0$!0$"20$$3-04##152%!4$!6$!7#"22#"33$!5$"86',
+    '$"rd#"43$!4$!9#!5$,&ndash;3584m$!6#%60-64$!5$"69#"85%#-86$!7$$8-89#%91-92',
+    '$!5$$7-98#!a#"ha#"mb##pp."+3&ndash;290*#345*!4*$6666*$7297#$(1a)#$,000#$-364#&.0&deg',
+    '$!6$"8p#"/l#"05$!9#!3$!7#"45$!7#"50#!6$!3#!8#!9#!a',
+    '##cxe#)d&ndash;e#!m"%4,263#$/190$+g&rehy;ixcc##0\'s$!7#"15$"61$!8#$2131$"22$!3%#-24',
+    '#"40$!1$!4$!5$$6-47#!5$$1-52$$4-59$!8$!9#"62$!6#%71-72#*8&mdash;91$!5',
+    '#"99#"bp#"pp%!."+5&ndash;347+"99*!6*!8#(,000,000#%-yard##.04#$/352#%02-03$$5-06$!7',
+    '$!s#!1$!5#!2$$2-23$$4-25#"40$!1$"43#"59#"60$!5$&712601#"70#!8',
+    '"*6&ndash;47*!7##(1)$"2)$"3)$"5)#$-354#!0$!6$$7-08#"11$!8#%25-26#!3$%/6012',
+    '#"40#"51#!6$!2$!7$!9#"73$!5$$7-78$!8#"80$!7$!8#%91-92$!5',
+    '"+7&ndash;407*!6*!8*!9##(8)#$,133$#511%"25#".9#$/267#"00#"22$$7-28#!3$!0',
+    '#"40$$2-43$!3#"51%#-52$!4$!8#"60$!6$!7#%73-74$!5$$9-81#"84$$6-88',
+    '$"84#"91"+8&ndash;349*!7*!9#"\'s#$,687#$-602#"/1$#742#"03$!s#"10$!2#!2',
+    '$!9#(3&sol;88$$2-33#"41#"56#%70-72$!5$"65#"84$!5#!9$!2$!3$!8#"tb',
+    '*"50*!7#$,109#".5%!p#!0$!e#%14-17##225$!3$!7#!3$$1-32#!4$!0',
+    '$!6#"56#"60$!1#!8$!5$!6$!8"&:13ff.$!4$!8##301#!4#)5&ndash;8#$6ff.',
+    '""cm"!f#!f"!g#!b"!k""mb#"in#"ph"(p/minute$#per#"ts"#sec%#ond!&5%:65%',
+    '#&frac12)";p#5mdash;9.397&mdash;449$)gr;molmol#(ndash;10*"27*"35*!4*!8)#224*\'50mmmin)"33*"6%*!8)+40&deg;c/km',
+    '*!1*%5,000+!4+"ft+!p)"5-*"0%*&4-year*!8))6&ndash;0*!3*!4*!5*!6)!8',
+    '#)rehy;mile#8times;40cm/14&times;16in""\'s"#(a)"!+"1,000&ndash;40,000&\'-36,000\'#man&#lbs&!s$"51%!9$"62##116&#.02',
+    '$"18$%70.46$"93##345$"50%!9$%66.37$%76.35$$82.8#140,44,45,46,47,50%!0$%34.00#&522.99$%32.00#&622.97',
+    '%$7.42$%63.20##710##810$"36$"74##989"#-12$!3#"20$!1#*36,000,000$!8##40%$!9',
+    '$!4#!6$!4#(and-over#$bank$"ed#\'council\'$ties#$fold%\'ot-long\'#ers$$rame$!t#$game#%horse',
+    '#%litre##man$$etre#%point##ton$#ube#)under-par#\'yearold\'%s-old"#.00$!1$!2$!4$!5$!7',
+    '#"10$#3.3$"54$!6$!8$!9#"20$!2$!5%".4$!9$#fl.$!p#"32$!4',
+    '#"44$"pc#"53$!6$!9$\'cm/14in$!p#06&deg;c/96&deg;f$"ft##75%#\'8&deg;c$!c#%93sec"#/21##429',
+    '#"92""0%#\'&deg;f.)./180&deg;c/gas(#s;f$4ndash;200&mgr;molmol*#400-$,000+"50-1g/12oz&ndash;16oz-"kg*#500*"70,!0$(times;10',
+    '\'$,000\'(-400,000(%tonne\'"km$#500#$-400$$acre$\'caravan$$page%#lus$&seater%$pace$\'vehicle$$watt$$year',
+    '#,0&ndash;3200+\'4000rpm$$-odd%)signature$$0000$!2%#-03$!3$!4$"ft#"10$!4$$5-16##222$$4-25',
+    '$!5$$6-28$*8-29-which##392#"40$!7#"60%#kyr$$3-64$#7-8$!8#%78565#"84$$5-86$$7-88',
+    '#%91-92$!7#"cm#!e#*f/180c/gas%#gas$$f/lu##g/m$&r/12oz#$kbps$$cals$!m#"lb#"mb$!l',
+    '$!f##yds"51&mdash;2,360&mdash;1$\'ndash;3#$,200$#357#".9#!0$!1#"10%#-12$!1%!1$!8#!2',
+    '#"30$!6%!2$$8-39#"60#!7$!5$"95#!8$!1$!2$!3$#7-8#)a&ndash;b#!m',
+    '#$,000$#205$#335$#400#!0$"00$!3#%13-14$!4$$5-16#)2&mdash;3$$4-25$!5#%32-33$!4',
+    '$"97#"46$$7-48$!9#"51$!2$!5#"67#!7$$1-72#"80$!3$!5$!6#"92',
+    '$!4#!c$(&ndash;d#"du#!i#!l#"mm##pp.")3&ndash;7#%-acre#!0$"05$!9##107$!3',
+    '#"24#"34%!1$!8#%41-42$!8#"52#"60$!5$$7-68#"71$$2-73#%81-82$!4$!5',
+    '$!7#"90$!2#)g&ndash;h#"rd")4&mdash;7$*ndash;4454*!5##(3)#$,000##.01#!0$"00$!1%#-02',
+    '$!6#%21-42$$9-30#"30$!5$!6#!4#"51$!2$"40$$7-58#%62-63$!3$!9#!7',
+    '$!9#"91$!5#)a&ndash;b#!b#"ft#"lb#\'m-bytes#!p"%5&deg$(ndash;72#$,000#%02-03$!3$!s',
+    '$"11$!9#%20-21$!2$!3$!4$$5-26$!7%#-30$!8#!3$$3-35$$4-35$$7-39$!9',
+    '$$7-50#"52$$4-55#"61$$2-63#%70-71$!1%#-73$$6-77\'!8$!7#"87$!9#"90$$1-92',
+    '$!7#"th"+6&ndash;323-"bc*!7#$,000##.12#"02$!3$$6-07$!9$"ft#%22-23$!9#!3',
+    '$!7$!8#"57#"69#"77#"80$!4#"91$!3$!5%#-99"*7&dollar;c$)ndash;337+"58*#517',
+    '*!8*"96#$,041#\'-member#!.#!0$!3$!8$$9-12#"17#"22$!4$$7-28#"30$!7',
+    '$$0-41$!6#)5&mdash;6$!0$!2$!3$!5$!7$!8%#-59#"63$$4-65#!7$!2%#-73',
+    '#&8/3574$!0$!2%#-83$$3-84$!5%!1#)f&ndash;g"*8&frac12;p$+ndash;3,070+"59+"60*"60*#735#$,667',
+    '#$-bed#!0$!0$!1$"62$!8#%12-13#"22$$3-24$"62$$8-29##342$!6$$9-40#!4',
+    '$!5#!5$!3%#-54$$6-60\'!1$%7365f#"68#!9$$0-95$!2$!4$!5#)f&ndash;g#)g&ndash;h',
+    '#$,000%"34#!0$!0%#-01$$7-08$$9-10#"12$$3-14#"25#!3#%40-41$!5%!4$!6',
+    '$!0$$2-53$!6$$8-59#"62$$3-64$$7-68#!7$!2$!5$$8-79&"81$!9#"80$$1-82',
+    '$!5$$7-88$"90#"92#)a&ndash;b#)c&ndash;e#!p"":1$!1#!2$#0ff$!2#"39$"ff#"57',
+    '$$3)ca"#cms""ff#"t."%g/1oz""in""kd#"yr""lb""ma$!.#"er$!v#!w""no',
+    '"#pts""rd"#s5s#!q"!v"!x#,28cm/14x11in#%50cms!\'6&deg;n#&frac12(!3#0ins&mdash;48&ins\'9times;12&ins&times;15&ins&2;x15&ins;x12&ins;.1%5&ins',
+    '#*ndash;1484*!5)"20**2&ndash;36*!4)!3*!1*!4)#40%*!1*#2in*!4)"50*"1s)!8',
+    ')(48&ins;."#(1)#"2)#"3)#"5)#$64%)#&97.3%)"),000-watt&"km$"16$"25$"o0##148##201$"30',
+    '##400$!1$"75$"96##600$"27$*4&ndash;66$"77##700$"36$"55##847##905$"42$"60',
+    '"#-11$!2#!2$$2-36$$3-36$!4#"35$"8%#!4$"1f#"50#$acre#$base$"ed&$room',
+    '$"ox#$copy%#ver##day#&fathom$#eet$(oot-high\'"er##gun#%holes#$inch#&nation#%point#$seat#$week',
+    '#"10$!1$$36.4$!4$!6#"20$"1n$!3$"67$#mpg$"pc#"3%$!7$!p##44p',
+    '$!2$!3$"7%$!m#"66$"pc#"74$!5#"81$!6#,9&times;10/l$!0$!8$!f%!t',
+    '"%/1.65#"37#"41$"30#"51$"87#"72#"92"&0&deg/\'";.(\'280&deg$\'ndash;1*#364+$80cm*"71',
+    '#"-2%$,400$(capacity$&member%#ile$$seat#!.#$/370$!s##000$!5$!6$$8-09$#rpm#"10',
+    '$!7%#-18$!9%#-21\'!2#!2$$4-25$!7%#-28#!3$"04$!1$$4-35$!6$!8',
+    '$$5-46$$7-49$$8-49#&5/1732$$0-51$$3-54$$6-59#"60$!6$!9%#-70#!7$!4$$7-78#%85-86',
+    '#"91#!g$"le#"hp#!j#"kb$$cals$(ilometre#"mb$!m#"sq"%1/252#"00$!1$$2-03',
+    '$!4$$5-06$!8#-1/12&mdash;13$!0$!7$!9#"20$!2$$3-24\'!6##312$!6%#-37$!8',
+    '#*4&mdash;17$!0$!2$!7$$8-50$$9-50#!5$!1$$2-54$!3%#-54$$5-56#"67$$8-69#%78-79',
+    '#%96-98$!9#)d&ndash;f#!p")2&ndash;8#$,485##/90#!0$!4$!6#"11#!2$$1-24\'!5$$4-25',
+    '$$7-29#!3$!5#!4$!1$!2$!3#"50%#-52$!1$!4$!9#"64#"70$!3',
+    '$!9#"80#"90$$1-92$!2$$4-95$!5#!b#)g&ndash;h#"mm"+3&ndash;408*"97#"-7##.39##000',
+    '$!4$!5$!6$!9#"13#"25#"31$!3$"86$!9#"40%!1$!1$!4%#-45',
+    '#!5$!3$$5-56$!8$!9%#-60#$67-8#"71$!4#%91-92$!5$!6$!7%#-98#!p',
+    '#$,013#"00$$3-04$!5$!9#"16$!8#!2$!0$$1-22$!4$!9#!3$!2$!5',
+    '%#-38$!7$!9#"42$!8$$9-50#%57-58$$9-60#!6$$0-62$!1$$2-63\'!4$!3$$7-68',
+    '#!7$!2$!6$!8$!9#!8$$0-81$!3$!4#%93-94$!5$$7-98#)e&ndash;h")5&mdash;9$)ndash;345',
+    '*!9##(1)#$,946#$-375$*day-a-year\'(s-a-year%%egree#\'.242199#"/2##000$$2-03$"mm#"12%#-13$!3',
+    '$!7#!2#"36%#-37$$7-38$$8-39#"43#"51$!4$$5-56$!6$$8-59$!9#"60$!3',
+    '$!7$$8-69&"70#"70$!1$"44$$7-79$!9#%82-83$!3$!8#"90$!2%#-93$!3',
+    '$$7-98$%9-600#"bp#!m#"pp#"th"$6(2)#".1$"50#!0$%/3661$!5$!8#!1$!2',
+    '%#-16$!7$!8$!9%#-20#!2$$0-21$!2$!6#"30%#-31$!1$!2$!3$$6-37',
+    '#"42$!6%#-47$$9-50#%50-51$!3$!4$!5$!9%#-60#%60-61$!1$$2-63$!4$!6',
+    '$!7$$9-80#"80$!7#"91$!6$!7$!8$!9#!a##mph#"th"*7&ndash;68*"80##(4)',
+    '#!0$!2$!3$!5$$6-07$$7-08$!8%#-09$!9#!1$!3$!6%#-17$!7#"20',
+    '%#-22$!3$!4$!5$$7-28#"30$$1-32$!2%#-33$!3%#-34$!9#!4$!0%#-41',
+    '$!6$!8$!9#"50%!0$!2$!4$!5$$9-60#!6$!0$!1$!2##7/8$"31',
+    '#!8$!1$!2%#-97$!5$!8$!9#"90$!1#!g"+8&ndash;267*#379*"79*%c.287#$,000',
+    '#".4#"/7#"02$$5-06$!7$!8#!1$$3-14$!4$!8#%20-21$!4$!5$!6%#-27',
+    '$!9#!3$!1$!9##463$!8$!9#!5$(&mdash;6%*ndash;3686$!0$$1-52$$2-53$!4%#-55',
+    '#"60%#-61$!2$$3-64$!4$!5$!6$!7$!8$!9#!7$#/91$!1$!2$!3',
+    '#"82$!3$!4$!6$!8#%90-91$!6%#-97$!7$$9-90#"ft#"th"*9&ndash;72+!3#$,000',
+    '$#300$#606%"40#!.#%02-03$!3$!4%#-05$$6-07$!7$!8#!1$!1$$7-18$!9',
+    '$!x#!2$!0$!2%!2$!4$!6$$7-28#"35$!6$!7$$9-41#"44$$7-49&"50',
+    '$$5-66#%70-71$!1$!4%#-75$$8-79$!9#+8&mdash;707,"26$!2%#-83$$5-86$$9-90#!9$$1-92',
+    '",:15&ndash;43#+24&ndash;28$"5f&!f#!9"#cms"!d""hr""kg#!m"!l""mb#!m#"pg""nt',
+    '#!p$!."#sec"!x#&48&ins!$7%/h"(&bsol;38#0deg&plusmn;8&deg&\';c/5%co)\'ambient\'!e\'!n#)ndash;100*!1*)5&ndash;0',
+    '+!0)+24&ndash;35*!8)!3*!1*!6*#ast)$40ft*"5%*!i)"50*!5)!6*!0*!2',
+    '+!%*!1)"95#&percnt"#(a)"&,000ft$"34$"95#\'100,000#"20%!0$"40#"38%!1##440',
+    '##530##600$"65$"99##702$%24.06$&32,178$%52.67##800%$3.53$&73,000##960"#-14#"36$!8',
+    '#&member%#tre$#ile$!m##way"#.0%$"00$!1$!2$!5#\'1&aring$!3$!4#"2.$!1',
+    '%!%$!6#\'3&deg;c$!1$!2$!4$!7$!8$$9sec$!m%!m#\'4&deg;c$!0$"8p$"pc',
+    '$!9$!g$!m%"hz$!p%!c#&60.169$!m$$nmol#"7%$!4$!7%#sec$!8#"81',
+    '$!4$"pc#"9p"#/23#!3#"40$!1$!s#!7""0%#\'&deg;f.$)ndash;371##-bp$-compatibility,"le',
+    '$#odd$!s%%eries$$type#!.#$/138%"58$!s##001$$2-03$!3$!4$!6$&925/wp$!e',
+    '$$4-15$!5$$8-19$$9-20%!1#"20%#-21$"22$$6-27$!7%#-28$$8-29&"30#%34-35#!4',
+    '##532$"40%!1$"55$$9-60#"60%#-61$!4$!5$!8#"70%#-72$$1-72$!3%#-74',
+    '#"83$$5-86$$6-87$$8-89#"91$!3$!4$$8-99$%9-100(!1#"du#)e&ndash;f#"ff$!t##gal',
+    '#"ml$!m#"nm")1&ndash;2*#372,!3*!7#$,411#"00$!1$$4-10$!5$$6-07$$7-08$$8-09',
+    '#!1$$0-11$#2-3$$3-14$$8-19#$21-2$"36$$4-26$$5-26#%31-33$$2-33$+3&mdash;and$$6-37$$7-38#%42-43',
+    '$!1$!2$!3#"61$!5#%70-71\'!2$$1-72$$4-15$$7-78#%82-83%!1$$5-86#"91$$2-93',
+    '$"6.$$7-98$$9-00#)b&ndash;g#"km"+2&ndash;389*!4#$,240#%-foot#".3#%00-01%!0#%11-12$$3-14$!4',
+    '#!2$$4-25$#7-8$$8-29$!9#%32-33$"72$$8-39#%42-43$$5-46$$9-50#!5$$1-52$$2-53$"33',
+    '$$7-58$$9-61#!6$$0-61$$2-63$!4$!9#"77$!9#"85$!7$!8#!9$!1$!3',
+    '\'!9$$8-99#&x280cm")3&ndash;7*!8#$,751#!/#*0&mdash;43$$2-03$$5-06##113$$4-15$$7-18#!2$$1-22',
+    '$$4-25%!0$"70#!3$$0-31%!0%!7$"11$!6%#-42%!6$!8#)4&mdash;5$!0$!1',
+    '%#-45$!6$!7#"50$!5%#-56#&60-61.$$3-63$$6-67$$7-68$"84#!7$$2-73$$5-76$$6-77',
+    '$$8-80$"92#%80-81$$1-82$!4%#-85#%91-02&!2$!5$!9#!p"%4&deg##(1)#$,000%"84',
+    '#$.073#!0$!0$$1-02$!2$$6-07$"lb#"10$!1$!4$!5$$6-17#!2$!0$!2',
+    '$!3$!5%#-26$!6$!9#(41-37442&"42$$4-45$$8-49#"55%#-55$!7#%61-62#%71-72$!9',
+    '$$4-85$$5-86$#7-8\'!8#$9-50$$2-93$$3-94$!6$!7$!9#!p#"th"%5&deg\'#;f.$*ndash;1055',
+    '##(2)##.00#%05-56$!6$!7%#-08&"10$#rpm#!1$$0-11$!1%#-14$$6-17#%25-26%!4',
+    '#%30-31$$1-32$$6-37&!7$!8%#-39#"40$$3-44$!4$!5$#6-7##547$!5#"60$!3',
+    '#"70$!3$!5$!9#!8$$2-83$!4#"90%#-91$$1-92$!9#&g/15fl#"hp#"kg#!m',
+    '"+6&ndash;444*"86#$-385##/22#*0&mdash;85$$4-05#"14$!5#!2$$1-22$$5-26#%31-32$$5-41$!6$$7-38',
+    '$$9-40#!4$!6%#-47#)5,3380919$!7$$8-59#!6$!7#!7$!0$$2-73$!3$!4%#-75',
+    '$!8#)8&mdash;9$$3-84$$4-85$!5$!6#%95-96#!h#!p"+7&ndash;378#$,200$#826#&.68396#%05-06$$6-07',
+    '$$8-09##103$$2-13&!3$"39$!7%"-8$$9-20#%25-26$$8-29#!3$$0-31$!6#"40$$2-43',
+    '$!7$$9-51#!5$!0%#-60$$8-59##62.#$7000$!8$$9-80#%81-82$$2-73$$7-88#%90-91$$3-94',
+    '$$6-97$!8%#-99#!b#!d#!p""8%#*&ndash;385#$,000##.7p#!0$%/3770$!3$!6$$8-09',
+    '$!1%#-12$$3-14$!4$!5$"81#%26-27#!3$!1%#-35$!3$$4-35#%44-45$!6%#-47',
+    '$$1-52$$9-60#%62-63$!3%#-64$$6-67#%71-72$!6$$9-80#"80$$1-82$$2-83$!4%#-85$!5',
+    '$"63$$9-90#!9$!3$$4-95$!6#!b"*9&mdash;89$(ndash;80*"90#%(35e)#".0$#535#!0$$2-04',
+    '$#4-5$$8-09#%18-19#%23-24$$9-30#%34-35$$6-37$!7#%45-46#!5$$3-54$!4%#-55#(6&sol;81$#/81',
+    '#%73-74$$4-75$$6-97$!7%#-98#!8$!0$!3$$5-86$$6-87$$7-88&"98#"90$!2%+&mdash;that',
+    '$$3-94$$6-97$!7#!b#!c#!d#!e#!p"":1#"26$!9#!3$!9#!4$(&ndash;7',
+    '"#g/t#!b"!h""kb#"hz""mb#"in#"ph""no""oz"#pts""s.!\'8&amp;f#%deg;f#&lt;188',
+    ')!9#+ndash;115mm)"23*"60*!7)!4*"0%+8/40&ndash;42/42&ndash;44*\'1&deg;c*!3+0c/100&ndash;110f*!5*!7*!8)"67',
+    ')#94%#&percnt#+times;119mm*#2mm)&38&ins)"57)&84&ins"#(2)#"3)#"a)"#+24"(,000,000&%-plus$"72#\'167,416',
+    '$"96##200&!3$$6,39$"70#\'305,534$"54##400&$,000$"45$"93#&512.00$"44$%86.18##600',
+    '##700$"72#&876.94##916$"46$&97,000"&-03-48#"12$!7#%23-36#"39#"41$!2#!5#!9',
+    '#%count##day#$inch#&m-long$"er$#ile%$nute$!m#%point%%under$.risoner-escape##set$*quare-high$%torey#%tonne',
+    '$$rack#%under"#.0%$!4#"10$!2$!4$$7.11$!p#$21.1$!6$"pc#"30$!5#"50',
+    '$!5##6mm#"72$"pc#\'8&deg;c$!6$!9#\'9&deg;c"$/\'39#+100000/year$"72#$36/1##432#"64#"77',
+    '$+ndash;3,900+"81#%(36e)#%,000+#%02-03$$5-06$$8-09$$9-10$"kg#%11-12$"52$"80#%20-21#!3$!2',
+    '%#-49$!9#"52$!3%!9$!8#"63$!5$!9#!7$!1$!2$!5#!8$$2-83',
+    '%#-88$!8%#-89#!9$)&sol;2222$$3-94$$6-97$$7-98#!b#"ft#!k#!p$!c$!p#"th',
+    '$#969#!0$$1-02$$3-04$!4$%7-108#$13-4#"20$"20%!2$!8#"30$$6-37$$8-39#!4',
+    '$$4-45$$6-47$$8-49#%53-54$$6-57#%62-63#"84$!6#%91-92$$3-94$$6-97$$8-99#"st"-2&ndash;336bc+"58',
+    '$#574#!.$"5%$!8#"04$$8-09##2\'s$!3$!5$!6$!7$!8#!3$!3$!6',
+    '%#-41#"41$!2$!6$!8$!9#!5$!1$!7$!8#!6$!3$!7$!8#"74',
+    '$$7-78#!8$$1-82$$2-83$$5-86$"78$$8-89#%90-91$$1-91$!6$$8-99#!p"$3.8%%!3#%00-31',
+    '$$4-05$$8-09%!8$$9-10#!1#%22-23%!2$$3-24$$4-25$!6$$7-28$$9-30#!3$!1$!3',
+    '%#-35$$7-38#%41-42$$2-42$$4-45$"5.$!6$!8$$9-50#%50-51$#1-2$$8-59#%60-61$!2$!8',
+    '#"70$$2-73$"46$!5#"82$!4#%94-95$$6-37$$7-98#!g#,h&mdash;384b"+4&ndash;440*!5#!0$$1-02',
+    '$!4$$5-06$$6-07$!8#!1$!0$$4-15$!6#%26-27$$7-28#!3$!1#(41-38442&"42$!3',
+    '$$6-47$$7-48$$8-49#%50-51$$3-54#"67$$8-69#!7$(&mdash;9$!1$!2$!3$!6$!8#"80',
+    '$!6$!8#!9$!2$!3',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_94 = (
-    '2,569ft',
-    '2,570',
-    '2,572.3',
-    '2,573',
-    '2,579',
-    '2,580',
-    '2,580.5',
-    '2,580kg',
-    '2,581',
-    '2,593ft',
-    '2,594,606',
-    '2,598,500',
-    '2,5kb',
-    '2,600-km',
-    '2,600-year-old',
+count_94 = 6695
+
+heads_94 = (
+    '1800&ndash;1950',
     '2,600ft',
-    '2,600rpm',
-    '2,601.0',
-    '2,604,000',
-    '2,604,100',
-    '2,606',
-    '2,606,429',
-    '2,606,602',
-    '2,609',
-    '2,610.6',
-    '2,612,000',
-    '2,615,508',
-    '2,621.2',
-    '2,625.61',
-    '2,626',
-    '2,627ft',
     '2,628,928',
-    '2,631ft',
-    '2,632',
-    '2,634',
-    '2,638',
-    '2,639',
-    '2,639,000',
-    '2,640.2',
-    '2,640ft',
-    '2,641,152',
-    '2,641,900',
-    '2,647,000',
-    '2,647,300',
-    '2,649',
-    '2,652,000',
-    '2,654ft',
     '2,655',
-    '2,656.78',
-    '2,660m',
-    '2,664',
-    '2,665,000',
-    '2,667,000',
-    '2,668',
-    '2,670',
-    '2,671',
-    '2,672',
-    '2,673',
-    '2,673,864',
-    '2,675',
-    '2,677,764',
-    '2,681,000',
-    '2,682',
     '2,683',
-    '2,683,877',
-    '2,685',
-    '2,686',
-    '2,687.93',
-    '2,690',
-    '2,691.13',
-    '2,695.61',
-    '2,700-seat',
-    '2,700m',
-    '2,701',
-    '2,707,477',
-    '2,713,442',
-    '2,713.72',
-    '2,714',
-    '2,715,000',
     '2,716,600',
-    '2,718',
-    '2,719,757',
-    '2,720',
-    '2,721',
-    '2,725',
-    '2,728',
-    '2,731',
-    '2,731.23',
-    '2,732',
-    '2,735',
-    '2,736.77',
-    '2,737.8',
-    '2,738',
-    '2,738.09',
-    '2,739',
     '2,740%',
-    '2,740,000',
-    '2,744',
-    '2,745',
-    '2,746',
-    '2,746.7',
-    '2,749',
-    '2,750rpm',
-    '2,753.20',
-    '2,754.11',
-    '2,755',
-    '2,756.12',
-    '2,756.39',
-    '2,756ft',
-    '2,759',
-    '2,759.84',
     '2,763.33',
-    '2,764.44',
-    '2,765,000',
-    '2,766',
-    '2,769',
-    '2,770&ft',
-    '2,771.09',
-    '2,772.80',
-    '2,773.56',
-    '2,775%',
-    '2,776.86',
-    '2,777',
-    '2,778',
-    '2,781.44',
-    '2,782.30',
-    '2,784',
     '2,785.33',
-    '2,785.52',
-    '2,786.65',
-    '2,789',
-    '2,791.41',
-    '2,794,000',
-    '2,796',
-    '2,798',
-    '2,800-man',
-    '2,800-member',
-    '2,800kgm',
-    '2,800revs',
-    '2,807',
-    '2,807,000',
-    '2,809.58',
-    '2,810',
     '2,811',
-    '2,812',
-    '2,812.2',
-    '2,814.0',
-    '2,816',
-    '2,817.0',
-    '2,818.0',
-    '2,818.60',
-    '2,819,200',
-    '2,820ft',
-    '2,822ft/8603m',
-    '2,825',
-    '2,826.21',
-    '2,828',
-    '2,828.7',
-    '2,830,000',
     '2,831%',
-    '2,833&ndash;3,427',
-    '2,833-hectare',
-    '2,835',
-    '2,835,073',
-    '2,836.57',
-    '2,838',
-    '2,838.3',
-    '2,840',
-    '2,840.0',
-    '2,843.0',
-    '2,844.04',
-    '2,846',
-    '2,851.0',
-    '2,853',
-    '2,855',
     '2,858',
-    '2,859,000',
-    '2,860.6',
-    '2,861.1',
-    '2,863,302',
-    '2,863.9',
-    '2,863ft',
-    '2,864,069',
-    '2,866',
-    '2,866ft',
-    '2,867',
-    '2,868.49',
-    '2,870',
-    '2,875',
-    '2,876',
-    '2,877',
     '2,879.7',
-    '2,882',
-    '2,887',
-    '2,889.9',
-    '2,89080yrbp',
-    '2,895.43',
-    '2,899,473',
-    '2,9',
-    '2,9-dimethyl-4',
-    '2,90',
-    '2,900.1',
-    '2,900ft',
-    '2,908',
-    '2,908,900',
-    '2,911',
-    '2,914',
     '2,915.9',
-    '2,917',
-    '2,919.30',
-    '2,920,000',
-    '2,920lbs',
-    '2,922.4',
-    '2,925,000',
-    '2,928',
-    '2,928,259',
-    '2,930,000',
-    '2,934',
-    '2,938',
-    '2,940',
-    '2,949ft',
-    '2,951',
-    '2,951,000',
     '2,952',
-    '2,953,908',
-    '2,960',
-    '2,960ft',
-    '2,961',
-    '2,963',
-    '2,963,000',
-    '2,964,971',
-    '2,966',
-    '2,969,511',
-    '2,971,100',
-    '2,973,264',
-    '2,974',
-    '2,974,700',
-    '2,975cc',
-    '2,976',
     '2,977',
-    '2,978',
-    '2,980',
-    '2,982',
-    '2,984',
-    '2,985',
-    '2,986',
-    '2,988',
-    '2,995,100',
-    '2,999/46,000',
-    '2-(1,2,3,4-tetrahydro-2-isoquinolyl-carbonyloxy)ethyl',
-    '2-0-0',
-    '2-0319&sol;88',
-    '2-1-2',
-    '2-10',
-    '2-101',
     '2-107',
-    '2-10pm',
-    '2-12-91',
-    '2-142',
-    '2-15',
-    '2-16',
-    '2-2-2',
-    '2-2-2wts',
-    '2-25',
-    '2-3-2',
-    '2-3-4',
-    '2-3-93',
-    '2-3-year',
-    '2-300',
-    '2-3lb',
-    '2-4-0t',
     '2-4-d',
-    '2-5-.57',
-    '2-5.50pm',
-    '2-5pm',
-    '2-8-0-',
-    '2-8-0s',
-    '2-8-0t',
-    '2-8-2t',
-    '2-8-ot',
-    '2-90',
-    '2-activated',
-    '2-amino-3-phosphonopropionate',
-    '2-amino-4-phosphonobutanoate',
-    '2-amino-5-phosphonopentanoate',
-    '2-arachidonyl',
-    '2-axes',
     '2-bar',
-    '2-based',
-    '2-car',
-    '2-carboxy-2-hydroxy-5-sulphoformazobenzene',
-    '2-carboxymethoxy-4',
-    '2-centre',
-    '2-chome',
-    '2-club',
-    '2-cm',
-    '2-component',
-    '2-day-a-week',
-    '2-deoxy-glucose',
-    '2-deoxygalactose',
-    '2-deoxyuridine',
-    '2-direction',
-    '2-directions',
     '2-egg',
-    '2-ers',
-    '2-gang',
-    '2-goal',
-    '2-gram',
-    '2-gram-a-day',
-    '2-grams',
-    '2-handicapper',
-    '2-hap',
-    '2-hydroxy-3-methacryloxy-propyl',
-    '2-hydroxyethyl-2-methylpropenoate',
-    '2-hydroxyethyldithiocarbamate',
-    '2-in-1',
-    '2-irons',
-    '2-kg',
-    '2-layer',
     '2-lb/&pound;4.25',
-    '2-lb/&pound;4.39',
-    '2-lb/&pound;4.49',
-    '2-lb/&pound;6.95',
-    '2-letter',
-    '2-lieut',
-    '2-like',
-    '2-link',
-    '2-megaton',
-    '2-mercaptoethanl',
-    '2-methoxy-4-allylphenol',
-    '2-methyl-2,4-pentanediol',
-    '2-methylpropane',
-    '2-metre-wide',
-    '2-mm',
-    '2-mm-diameter',
     '2-norwich',
-    '2-oz.',
-    '2-page',
-    '2-pences',
-    '2-phenyl-5-oxazolone',
-    '2-pole',
-    '2-port',
-    '2-propanol',
-    '2-r',
-    '2-romford',
-    '2-round',
-    '2-s',
-    '2-seater',
-    '2-second',
-    '2-sheffield',
-    '2-speed',
     '2-state',
-    '2-stone',
-    '2-swindon',
-    '2-syllable',
-    '2-term',
-    '2-thirds',
-    '2-tier',
-    '2-to',
-    '2-track',
-    '2-trafford',
-    '2-type',
-    '2-wing',
-    '2-wood',
-    '2-years',
-    '2.0&ndash;161',
-    '2.0&ndash;2.3m',
     '2.0&ndash;2.5%',
-    '2.0&ndash;200.0',
-    '2.0&ndash;3.010',
-    '2.0&ndash;3.0pm',
-    '2.0&ndash;6.0',
-    '2.0-2.7',
-    '2.0-3.0',
-    '2.0-4.0',
-    '2.0-compliant',
-    '2.0-for-sparc',
-    '2.0.1',
-    '2.0/0.5',
-    '2.00&ndash',
-    '2.00&ndash;2.30pm',
-    '2.00&ndash;3.00pm',
-    '2.00&ndash;4.25',
     '2.00:impressive',
-    '2.00:last',
-    '2.00:the',
-    '2.00am',
-    '2.00m',
-    '2.01%',
-    '2.010',
-    '2.015',
-    '2.01p',
-    '2.021',
-    '2.03942',
-    '2.04446',
-    '2.048mbps',
-    '2.05.27',
-    '2.050',
-    '2.05853',
     '2.05:john',
-    '2.05:top',
-    '2.05pm',
-    '2.068-mile',
-    '2.06pm',
-    '2.075',
-    '2.075p',
-    '2.07p',
-    '2.086',
-    '2.08pm',
-    '2.09&times;10/l',
-    '2.09oz/82g',
-    '2.0bcf',
-    '2.0c',
-    '2.0e',
-    '2.0gb',
     '2.0j',
-    '2.0sd',
-    '2.0x10',
-    '2.1&ndash;11',
-    '2.1&ndash;12',
-    '2.1&ndash;3',
-    '2.1(3)',
-    '2.1,4,6',
-    '2.1-based',
-    '2.1-kb',
-    '2.1-on-intel',
-    '2.1.0',
-    '2.1.1.',
-    '2.1.1.1',
-    '2.1.1.2',
-    '2.1.1.3',
     '2.1.10',
-    '2.1.13',
-    '2.1.15',
-    '2.1.2.1',
-    '2.1.2.2',
-    '2.1.2.3',
-    '2.1.6',
-    '2.1.8',
-    '2.1.9',
-    '2.1/2',
-    '2.10,12',
-    '2.10.1.12',
-    '2.10.1.13',
-    '2.10.2',
-    '2.10.2.1',
-    '2.10.2.5',
     '2.10.28',
-    '2.10.3.1',
-    '2.10.3.2',
-    '2.10.3.3',
-    '2.10.3.4',
-    '2.10.3.5',
-    '2.10.4.1',
-    '2.10.45',
-    '2.10.46',
-    '2.10.5',
-    '2.10.5.1',
-    '2.104',
-    '2.107',
-    '2.109',
-    '2.10:one',
-    '2.11.12',
     '2.11.93',
-    '2.112',
-    '2.11m',
-    '2.12%',
-    '2.124',
-    '2.128',
-    '2.12p',
-    '2.13.0',
-    '2.148',
-    '2.14p',
-    '2.15&ndash;16',
-    '2.15&ndash;3.20',
-    '2.15&ndash;3.45',
-    '2.15&ndash;4.30pm',
-    '2.15.1',
-    '2.15.2',
     '2.15.3',
-    '2.15.4',
-    '2.15.5',
-    '2.15.6',
-    '2.15.8',
-    '2.15.9',
-    '2.15:lynda',
-    '2.15a',
-    '2.15b',
-    '2.15k',
-    '2.16&ndash;13.4',
-    '2.16&ndash;13.67',
-    '2.16.08',
-    '2.17(b)',
-    '2.17(c)',
-    '2.17(d)',
     '2.17(e)',
-    '2.17(f)',
-    '2.17.20',
-    '2.17.39',
-    '2.17m',
-    '2.18.13',
-    '2.19&ndash;28',
-    '2.19/150ml',
-    '2.190',
-    '2.19132',
-    '2.19oz',
-    '2.1b',
-    '2.1bn',
-    '2.1c',
-    '2.1d',
-    '2.1gbps',
     '2.1k',
-    '2.1kg',
-    '2.1million',
-    '2.1s',
-    '2.2&ins',
-    '2.2&ndash;2.7kb',
-    '2.2&ndash;4',
-    '2.2&times;10/l',
-    '2.2(15)',
-    '2.2(a)',
-    '2.2(b)',
-    '2.2(e)',
-    '2.2.1.1',
-    '2.2.10',
-    '2.2.11',
-    '2.2.12',
     '2.2.13',
-    '2.2.14',
-    '2.2.15',
-    '2.2.16',
-    '2.2.17',
-    '2.2.18',
-    '2.2.19',
-    '2.2.2.5',
-    '2.2.2.6',
-    '2.2.20',
-    '2.2.3.1.1',
-    '2.2.3.1.2',
-    '2.2.3.1.3',
-    '2.2.3.1.4',
-    '2.2.3.1.5',
-    '2.2.3.2.1',
     '2.2.3a',
-    '2.2.4.1',
-    '2.2.41',
-    '2.2.8',
-    '2.2.9',
-    '2.2.93',
-    '2.200',
-    '2.200rpm',
-    '2.2057',
-    '2.20:this',
-    '2.20am',
-    '2.20d',
-    '2.21.59',
-    '2.21.6',
-    '2.2125',
-    '2.21958',
     '2.21b',
-    '2.22%',
-    '2.22&deg',
-    '2.22&mdash;2.24',
-    '2.22&ndash;31',
-    '2.22.15',
-    '2.220',
-    '2.22m',
-    '2.23&ndash;4',
-    '2.23.87',
-    '2.23m',
-    '2.24.',
-    '2.24.05',
-    '2.24.1',
-    '2.24.16&ndash;17',
-    '2.24m',
     '2.25.',
-    '2.25.00',
-    '2.25.46',
-    '2.258',
-    '2.25:ferdie',
-    '2.25:gold',
-    '2.25am',
-    '2.25kg/5lb',
-    '2.25mg',
-    '2.25million',
-    '2.26.47',
-    '2.265',
-    '2.2654',
-    '2.2698',
-    '2.27&ndash;2.30',
-    '2.27m',
     '2.28&mgr;m',
-    '2.28.27',
-    '2.2875',
-    '2.28kg',
-    '2.29.20',
-    '2.29789',
-    '2.2:1',
-    '2.2a',
-    '2.2gb',
-    '2.2k',
-    '2.2kb',
-    '2.2km',
-    '2.2lb',
-    '2.2lbs',
-    '2.2ms',
-    '2.2s',
     '2.2v',
-    '2.2w',
-    '2.3%+',
-    '2.3&ndash;2.6',
-    '2.3&ndash;4',
-    '2.3*10',
-    '2.3.0',
-    '2.3.1.5',
-    '2.3.10',
-    '2.3.11',
-    '2.3.12',
-    '2.3.14',
-    '2.3.15',
-    '2.3.16',
-    '2.3.17',
-    '2.3.18',
     '2.3.19',
-    '2.3.2.2',
-    '2.3.20',
-    '2.3.21',
-    '2.3.22',
-    '2.3.23',
-    '2.3.24',
-    '2.3.25',
-    '2.3.26',
-    '2.3.3.1',
-    '2.3.5.1',
-    '2.3.5.2',
-    '2.3.9',
-    '2.3/1000',
-    '2.30&ndash;4.00',
-    '2.30&ndash;5.30pm',
     '2.30&ndash;6.30',
-    '2.30-3.30pm',
-    '2.30-4pm',
-    '2.30-5.30pm',
-    '2.30-5pm',
-    '2.300gph',
-    '2.30358',
-    '2.304.30pm',
-    '2.305',
-    '2.30:as',
-    '2.30:leading',
-    '2.30am.',
-    '2.30pm&ndash;4.45pm',
-    '2.30pm-5pm',
-    '2.30s',
-    '2.31.13',
     '2.31943',
-    '2.31p',
-    '2.32.01',
-    '2.32sec',
-    '2.33(b)',
-    '2.33.110v.',
-    '2.33.23',
-    '2.34.19',
-    '2.3486',
-    '2.34m',
-    '2.3565',
-    '2.35:keen',
-    '2.35:staunch',
-    '2.35pm',
-    '2.366',
-    '2.36m',
     '2.36pm',
-    '2.37m',
-    '2.37pc',
-    '2.39.00',
-    '2.39.50',
-    '2.3a',
-    '2.3c',
-    '2.3ghz',
-    '2.3in',
-    '2.3k',
-    '2.3kw',
-    '2.3m-transistor',
-    '2.3pc',
-    '2.3w7',
-    '2.3x',
-    '2.4&mdash;7',
     '2.4&ndash;2.8%',
-    '2.4&ndash;2.8p/kwh',
-    '2.4&ndash;24.9',
-    '2.4&ndash;3.6',
-    '2.4&ndash;5.5%',
-    '2.4&times;10/l',
-    '2.4(a)',
-    '2.4(b)',
-    '2.4-fold',
-    '2.4.1.',
-    '2.4.2.1',
-    '2.4.2.2',
-    '2.4.2.3',
-    '2.4.2.5',
-    '2.4.3.1',
-    '2.4.3.2',
     '2.4.3.3',
-    '2.4.4.1',
-    '2.4.4.2',
-    '2.4.4.3',
-    '2.4.6(a)',
-    '2.4.7',
-    '2.4.92',
-    '2.4/100',
-    '2.400',
-    '2.409',
-    '2.40:former',
-    '2.40:leading',
-    '2.411',
-    '2.414',
-    '2.4158',
-    '2.4166',
     '2.4192',
-    '2.426',
-    '2.4339',
-    '2.438',
-    '2.45&ndash;6.00',
-    '2.45.',
-    '2.45:by',
-    '2.45:oliver',
-    '2.45am',
-    '2.45ghz',
-    '2.45v',
-    '2.4607',
-    '2.4620',
-    '2.465',
-    '2.4655',
-    '2.4668',
     '2.46p',
-    '2.4758',
-    '2.4760',
-    '2.4764',
-    '2.48.49',
-    '2.4829',
-    '2.4a',
-    '2.4cu',
-    '2.4ftl',
-    '2.4gb',
-    '2.4kg',
-    '2.4kilobases',
-    '2.4l',
-    '2.4m/6ft',
-    '2.4mg',
-    '2.4secs',
     '2.4w',
-    '2.5%triton',
-    '2.5&deg',
-    '2.5&mgr;g',
-    '2.5&ndash;11',
-    '2.5&ndash;12.5',
-    '2.5&ndash;16',
-    '2.5&ndash;2.8%',
-    '2.5&ndash;3.5',
-    '2.5&ndash;3.7',
-    '2.5&ndash;35',
-    '2.5&ndash;4%',
-    '2.5&ndash;5%',
-    '2.5&ndash;5.0%',
-    '2.5&ndash;5.3',
-    '2.5&ndash;7.5',
     '2.5&ndash;7.5mph',
-    '2.5&times;2.5',
-    '2.5(a).',
-    '2.5(c)',
-    '2.5-3',
-    '2.5-4.5',
-    '2.5-5.0',
-    '2.5-inch',
-    '2.5-metre',
-    '2.5-mile',
-    '2.5-min',
-    '2.5-tonne',
-    '2.5-turns',
-    '2.5.1.1',
-    '2.5.4.3',
-    '2.5.6',
     '2.5/100000/year',
-    '2.50/2.00',
-    '2.50:david',
-    '2.50p',
-    '2.5139',
-    '2.5153',
-    '2.52',
-    '2.52.12',
-    '2.53p',
-    '2.54%',
-    '2.54pm',
-    '2.54v',
-    '2.55pm',
-    '2.56.',
-    '2.576',
-    '2.57m',
     '2.57p',
-    '2.58p',
-    '2.59',
-    '2.59808',
-    '2.5983',
-    '2.5b',
-    '2.5barr',
-    '2.5bn',
-    '2.5cm/1inch',
-    '2.5cm/3',
-    '2.5e07',
-    '2.5gbps',
-    '2.5gflops',
-    '2.5i',
-    '2.5in',
-    '2.5kpc',
     '2.5m-3m',
-    '2.5m.',
-    '2.5m/s',
-    '2.5mbps',
-    '2.5metre',
-    '2.5metres',
-    '2.5mg',
-    '2.5mton',
-    '2.5sq',
-    '2.5wm',
-    '2.5x10',
-    '2.6&ndash;2.8',
-    '2.6&ndash;8',
-    '2.6&percnt',
-    '2.6-fold',
-    '2.6-litre',
     '2.6-metre',
-    '2.6-mile-long',
-    '2.6-mm',
-    '2.6.',
-    '2.6.0',
-    '2.6.1.4',
-    '2.6.3.1',
-    '2.6.3.2',
-    '2.60%/',
-    '2.6123',
-    '2.617',
-    '2.62%',
-    '2.625%',
-    '2.62p',
-    '2.652ff',
-    '2.65cm',
     '2.66m',
-    '2.66mm',
-    '2.67m',
-    '2.687-mile',
-    '2.68m',
-    '2.6ft',
-    '2.6gb',
-    '2.6ii',
-    '2.6mv',
-    '2.6pc',
-    '2.6sa',
-    '2.7&ins',
-    '2.7&ndash;3m',
-    '2.7&ndash;3t/acre',
-    '2.7&ndash;8.0%',
-    '2.7&times;10/l',
     '2.7.10',
-    '2.7.2(v)',
-    '2.7.2.',
-    '2.7.2.2',
-    '2.7.2.6',
-    '2.7.28',
-    '2.7.6.12',
-    '2.7.6.7',
-    '2.7.8.',
-    '2.7.81',
-    '2.7.92',
-    '2.7/1000',
-    '2.704',
-    '2.70m',
-    '2.70oz',
-    '2.70p',
     '2.71',
-    '2.718',
-    '2.71828',
-    '2.7183',
-    '2.72ft',
-    '2.742',
-    '2.74gb',
-    '2.75%',
-    '2.7528',
-    '2.75cu',
-    '2.75in',
-    '2.75kg/6lb',
-    '2.75km',
-    '2.75pc',
-    '2.75sq.m',
-    '2.7611',
     '2.7683',
-    '2.7750',
-    '2.7784',
-    '2.7790',
-    '2.7800',
-    '2.7880',
-    '2.78x10',
-    '2.7:1',
-    '2.7bn',
-    '2.7c',
-    '2.7cm',
-    '2.7gb',
-    '2.7l',
-    '2.7mgml',
-    '2.7t/acre',
-    '2.8&ndash;14.3%',
     '2.8&ndash;4.2',
-    '2.8&ndash;4.4',
-    '2.8-a',
-    '2.8-mile',
-    '2.8-tonne',
-    '2.8.0',
-    '2.8.3.4',
-    '2.8.4',
-    '2.8.4.1',
-    '2.8.748a',
-    '2.8.79',
-    '2.8.8',
-    '2.8.89',
-    '2.8/acre',
-    '2.80p',
-    '2.81',
     '2.82%',
-    '2.8224mhz',
-    '2.8280',
-    '2.83&deg;c',
-    '2.8308',
-    '2.835',
-    '2.8365',
-    '2.8370',
-    '2.8389',
-    '2.8426',
-    '2.8436',
-    '2.845',
-    '2.85&ndash;2.99',
-    '2.85&ndash;3.80%',
-    '2.85&ndash;7.07',
-    '2.8505',
     '2.85ff',
-    '2.865',
-    '2.878',
-    '2.87m',
-    '2.88m',
-    '2.88mb',
-    '2.88p',
-    '2.89',
-    '2.89%',
-    '2.8:0',
-    '2.8bn',
-    '2.8i',
-    '2.8kg',
-    '2.8pc',
-    '2.9&ndash;11',
-    '2.9(b)',
     '2.9-ton',
-    '2.9.',
-    '2.9.1.1',
-    '2.9.1.2',
-    '2.9.1.3',
-    '2.9.2.1',
-    '2.9.3.1',
-    '2.9.3.1.',
-    '2.9.3.2',
-    '2.9.3.3',
-    '2.9.4718',
-    '2.9.5',
-    '2.9/1000',
-    '2.90_per',
-    '2.90p',
-    '2.92sec',
     '2.938',
-    '2.93:1',
-    '2.94m',
-    '2.98bn',
-    '2.99m',
-    '2.99oz',
-    '2.9:1',
-    '2.9b',
-    '2.9bn',
-    '2.9x',
-    '2/-',
-    '2/10',
-    '2/1000/year',
-    '2/12/90',
-    '2/135',
-    '2/143',
     '2/162',
-    '2/165',
-    '2/17',
-    '2/189',
-    '2/19',
-    '2/2/87',
-    '2/211,213',
-    '2/258',
-    '2/3/41',
-    '2/3/87',
-    '2/303',
-    '2/322',
-    '2/36',
-    '2/3:14',
-    '2/3d',
-    '2/4/90',
     '2/40',
-    '2/465',
-    '2/486',
-    '2/5/92',
-    '2/55',
-    '2/553',
-    '2/6/87',
-    '2/65',
-    '2/6a',
-    '2/7',
-    '2/7&ndash;22',
-    '2/7&ndash;29',
-    '2/76',
-    '2/80',
-    '2/81',
-    '2/82',
     '2/87',
-    '2/88',
-    '2/89',
-    '2/8s',
-    '2/9/16/23/30/31',
-    '2/91',
-    '2/92',
-    '2/d',
-    '2/f',
-    '2/having',
-    '2/i',
-    '2/in',
-    '2/iso9002',
-    '2/mix',
-    '2/next',
-    '2/one',
     '2/using',
-    '2/value',
-    '2/w',
-    '2/with',
-    '20%&ndash;35%',
-    '20%-80%',
-    '20%.',
-    '20%/0.92=21.74%',
-    '20%glycerol',
-    '20%percnt',
-    '20&amp%',
-    '20&deg;kh',
-    '20&divide;180',
-    '20&divide;30',
-    '20&divide;90',
-    '20&frac12&ins',
     '20&frac12;p',
-    '20&gt',
-    '20&ins&times;16&ins',
-    '20&mdash;19',
-    '20&mdash;2',
-    '20&mdash;21',
-    '20&mdash;3',
-    '20&mdash;35',
-    '20&mgr;g',
-    '20&mgr;l',
-    '20&micro/&micro;l',
-    '20&micro;l',
-    '20&micro;w',
-    '20&ndash;10&ndash;0',
-    '20&ndash;100',
-    '20&ndash;11',
     '20&ndash;11&ndash;0',
-    '20&ndash;13',
-    '20&ndash;14',
-    '20&ndash;142',
-    '20&ndash;15p',
-    '20&ndash;16',
-    '20&ndash;165',
-    '20&ndash;199',
-    '20&ndash;2&frac12',
-    '20&ndash;200',
-    '20&ndash;21/5/41',
-    '20&ndash;23cm',
-    '20&ndash;24-year-olds',
-    '20&ndash;24.9',
-    '20&ndash;25/min',
-    '20&ndash;25000',
     '20&ndash;25cm/8&ndash;10in',
-    '20&ndash;25g',
-    '20&ndash;25min',
-    '20&ndash;25p',
-    '20&ndash;27%',
-    '20&ndash;3&ndash;1877',
-    '20&ndash;30-year',
-    '20&ndash;300&mgr;m',
-    '20&ndash;30000',
-    '20&ndash;301b',
-    '20&ndash;30hp/leg',
-    '20&ndash;30km',
-    '20&ndash;30p',
-    '20&ndash;30ppm',
-    '20&ndash;32',
-    '20&ndash;35%',
     '20&ndash;35mm',
-    '20&ndash;4&aring',
-    '20&ndash;4&ndash;1881',
-    '20&ndash;4&ndash;1882',
-    '20&ndash;4&ndash;1906',
-    '20&ndash;4&ndash;8',
-    '20&ndash;43',
-    '20&ndash;44',
-    '20&ndash;45%',
-    '20&ndash;45&deg',
-    '20&ndash;500',
-    '20&ndash;50ns',
-    '20&ndash;55',
-    '20&ndash;55lbs',
-    '20&ndash;57',
-    '20&ndash;5myr',
     '20&ndash;6&ndash;1860',
-    '20&ndash;67',
-    '20&ndash;68',
-    '20&ndash;73',
-    '20&ndash;77',
-    '20&ndash;80%',
-    '20&ndash;82',
-    '20&ndash;86',
-    '20&ndash;88%',
-    '20&ndash;9',
-    '20&ndash;february',
-    '20&ndash;june',
-    '20&ndash;may',
-    '20&prime;57&prime',
-    '20&rehy;month',
-    '20&rehy;year-old',
     '20&times;20',
-    '20&times;30cm/8&times;12in',
-    '20&times;40',
-    '20\'n',
-    '20\'s/30',
-    '20(-)',
-    '20(17)',
-    '20(19)',
-    '20(6)',
-    '20(g)',
-    '20+%',
-    '20,000%',
-    '20,000&ndash;100,000',
-    '20,000&ndash;25,000',
-    '20,000&ndash;350,000',
-    '20,000,000-30,000,000',
     '20,000,000-tonne',
-    '20,000-30,000',
-    '20,000-a-year',
-    '20,000-acre',
-    '20,000-sq',
-    '20,000-up',
-    '20,000ft',
-    '20,000ha',
-    '20,000km',
-    '20,000kw/hr',
-    '20,008',
-    '20,012',
-    '20,028',
-    '20,033',
-    '20,049,290',
-    '20,053',
     '20,099',
-    '20,100',
-    '20,114',
-    '20,120',
-    '20,135',
-    '20,200,000',
-    '20,203',
-    '20,235',
-    '20,24',
-    '20,24,25,27',
-    '20,260',
-    '20,285',
-    '20,286',
-    '20,343',
-    '20,35,55',
-    '20,40',
     '20,400',
-    '20,409',
-    '20,412,740',
-    '20,435',
-    '20,442',
-    '20,445',
-    '20,454',
-    '20,475',
-    '20,500,000',
-    '20,500-ton',
-    '20,500ft',
-    '20,533',
-    '20,578',
-    '20,600',
-    '20,650',
-    '20,681,000',
     '20,700,000',
-    '20,701',
-    '20,719',
-    '20,74,136',
-    '20,755',
-    '20,770',
-    '20,773,950',
-    '20,811',
-    '20,870',
-    '20,881,900',
-    '20,891',
-    '20,899',
-    '20,900',
-    '20,906',
-    '20,910kb',
-    '20,941',
     '20,992',
-    '20-&mgr;m',
-    '20-10',
-    '20-19',
-    '20-20',
-    '20-27',
-    '20-29',
-    '20-3',
-    '20-3-91',
-    '20-3-93',
-    '20-30,000',
-    '20-30p',
-    '20-4',
-    '20-40',
-    '20-40cm',
-    '20-49',
     '20-5',
-    '20-50cm',
-    '20-60',
-    '20-60%',
-    '20-70',
-    '20-8',
-    '20-a-side',
-    '20-april',
-    '20-ball',
-    '20-by-60-foot',
-    '20-carbon',
-    '20-cent',
-    '20-characters',
-    '20-client',
-    '20-cm',
-    '20-copy',
     '20-cpu',
-    '20-dollar',
-    '20-entry',
-    '20-f',
-    '20-feet',
-    '20-fight',
-    '20-frame',
-    '20-ft',
-    '20-ft-square',
-    '20-goal-a-season',
-    '20-goals-a-season',
-    '20-grid',
-    '20-horsepower',
-    '20-hour-a-week',
-    '20-hp',
-    '20-jul-1990',
     '20-jun-1990',
-    '20-k',
-    '20-lamp',
-    '20-length',
-    '20-m',
-    '20-march',
-    '20-match',
-    '20-megaton',
-    '20-metre',
-    '20-metre-long',
-    '20-miler',
-    '20-million',
-    '20-min',
-    '20-number/name',
-    '20-oh',
-    '20-over',
     '20-oz.',
-    '20-partner',
-    '20-passenger',
-    '20-patient',
-    '20-per-cent',
-    '20-pin',
-    '20-pitch',
-    '20-pounder',
-    '20-pupil',
-    '20-round',
-    '20-run',
-    '20-runner',
-    '20-shot',
-    '20-song',
-    '20-stroke',
-    '20-team',
     '20-to-30&deg',
-    '20-vehicle',
-    '20-voiced',
-    '20-well',
-    '20-year-high',
-    '20-years-old',
-    '20.01',
-    '20.02',
-    '20.02.1',
-    '20.02.2',
-    '20.02.5',
-    '20.07',
-    '20.09sec',
-    '20.0p',
-    '20.1.91',
-    '20.11.89',
     '20.13',
-    '20.13%',
-    '20.14',
-    '20.16',
-    '20.16&ndash;17',
-    '20.167',
-    '20.18',
-    '20.1kd',
-    '20.2&ndash;1',
-    '20.2&ndash;3',
-    '20.2&ndash;44.0',
-    '20.2.74',
-    '20.22',
-    '20.2p/litre',
-    '20.3&times;27.3',
-    '20.3.81',
     '20.30&ndash;22.00',
-    '20.31',
-    '20.32%',
-    '20.35',
-    '20.35mm',
-    '20.36',
-    '20.37',
-    '20.38',
-    '20.4.2',
-    '20.42',
-    '20.42mb',
-    '20.46',
-    '20.48',
-    '20.48.',
-    '20.5&ins;w',
-    '20.5(1)',
     '20.5.',
-    '20.5.91',
-    '20.51',
-    '20.52',
-    '20.54',
-    '20.557',
-    '20.58',
-    '20.59',
-    '20.5bn',
-    '20.5m',
-    '20.6&deg;c',
-    '20.63sec',
-    '20.6mg',
-    '20.6mpg',
-    '20.7&ndash;47.1',
-    '20.7.86',
     '20.7.90',
-    '20.75%',
-    '20.77',
-    '20.78',
-    '20.7bn',
-    '20.7m',
-    '20.7mjy',
-    '20.7p',
-    '20.80',
-    '20.80.',
-    '20.87',
-    '20.8p',
-    '20.9,11,12,13',
-    '20.9.83',
-    '20.91',
-    '20.9gms',
     '20.b.vii',
-    '20/07/93',
-    '20/1/88',
-    '20/10',
-    '20/100000',
-    '20/11/86',
-    '20/110',
-    '20/15',
-    '20/184',
-    '20/2',
-    '20/2/88',
-    '20/214',
-    '20/25/40/45/47/50',
-    '20/25hp',
-    '20/277',
-    '20/3',
     '20/3/80',
-    '20/30/40/50/60/70',
-    '20/32',
-    '20/4',
-    '20/4/41',
-    '20/4/93',
-    '20/40mhz',
-    '20/5&mdash;8/1',
-    '20/5&mdash;8/2',
-    '20/50/100',
-    '20/536',
-    '20/548',
-    '20/562',
-    '20/60',
-    '20/8/87',
-    '20/80ths',
     '20/91',
-    '20/ns',
-    '20/sq',
-    '200&deg;c&ndash;220&deg;c',
-    '200&ft',
-    '200&mgr;ci',
-    '200&mgr;gml',
-    '200&mgr;jy',
-    '200&micro;g',
-    '200&micro;g/ml',
-    '200&ndash;1000',
-    '200&ndash;1010nm',
-    '200&ndash;140,000',
-    '200&ndash;212',
-    '200&ndash;220k',
-    '200&ndash;224',
     '200&ndash;225',
-    '200&ndash;250',
-    '200&ndash;250,000',
-    '200&ndash;250mg',
-    '200&ndash;275',
-    '200&ndash;299',
-    '200&ndash;300,000',
-    '200&ndash;300-birds',
-    '200&ndash;300j',
-    '200&ndash;300m',
-    '200&ndash;31',
-    '200&ndash;330',
-    '200&ndash;400m',
-    '200&ndash;5',
-    '200&ndash;50g',
-    '200&ndash;510',
     '200&ndash;600%',
-    '200&ndash;600m',
-    '200&ndash;8',
-    '200&ndash;800',
-    '200&percnt',
-    '200&pgr',
-    '200&plus',
-    '200&rehy;year-old',
-    '200&times',
-    '200&times;150mm',
-    '200,000-piece',
-    '200,000-plus',
-    '200,000-strong',
-    '200,000-tonnes-a-year',
-    '200,000gal',
-    '200,000m',
     '200,000th',
-    '200,668',
-    '200-',
-    '200-1000',
-    '200-350',
-    '200-500',
-    '200-a-week',
-    '200-bed',
-    '200-bomber',
-    '200-capacity',
-    '200-day',
-    '200-fold',
-    '200-foot',
-    '200-foot-long',
-    '200-head',
-    '200-heavy',
     '200-kg.',
-    '200-line',
-    '200-machine',
-    '200-megaton',
-    '200-megawatt',
-    '200-metre-deep',
-    '200-metre-long',
-    '200-mflops',
-    '200-micrometre',
-    '200-mile-an-hour',
-    '200-mile-long',
-    '200-millilitre',
-    '200-mips',
-    '200-mm',
-    '200-plus-pound',
-    '200-point',
     '200-program',
-    '200-room',
-    '200-seat',
-    '200-seater',
-    '200-series',
-    '200-tonner',
-    '200-watt',
-    '200-winner',
-    '200-year-revolution',
-    '200.000',
-    '200/210hp',
-    '200/267',
-    '200/300',
-    '200/400',
-    '200/honda',
-    '2000&deg;c',
     '2000&ft',
-    '2000&ndash;1',
-    '2000&ndash;2',
-    '2000&ndash;2100',
-    '2000&ndash;3500',
-    '2000-acre',
-    '2000-odd',
-    '2000-sq',
-    '2000-strong',
-    '2000-year-old',
-    '2000.0',
-    '2000/200',
-    '2000/2016',
-    '2000/c',
-    '2000000',
-    '20004',
     '20005',
-    '20006&ndash;7',
-    '20007',
-    '2000b/d',
-    '2000c',
-    '2000ft.',
-    '2000gsi',
-    '2000km',
-    '2000lb',
-    '2000mm',
-    '2000tp',
-    '2001&mdash;a',
-    '2001:a',
-    '2001b',
-    '2002-2006',
-    '20020',
     '200222',
-    '2003&ndash;05',
-    '2003&ndash;07',
-    '2003-07',
-    '2003-2007',
-    '20030/64',
-    '20032',
-    '20036.',
-    '20039',
-    '20040',
-    '200436',
-    '2004m',
-    '2005\'s',
-    '2005.',
-    '2005/6',
-    '20053',
     '20056',
-    '2006&ndash;3345',
-    '200700',
-    '200:1',
-    '200a',
-    '200af',
-    '200c/425f/gas',
-    '200cals',
-    '200cm',
-    '200ev',
-    '200ft/min',
-    '200gev',
-    '200ghz',
-    '200gsm',
-    '200ib.',
-    '200in',
     '200j',
-    '200k-bytes',
-    '200kda',
-    '200khz',
-    '200kms',
-    '200m-byte',
-    '200m.',
-    '200m/1km',
-    '200metre',
-    '200metres',
-    '200mg',
-    '200ml/8fl',
-    '200ml/8oz/1',
-    '200mls',
-    '200mph-plus',
-    '200no',
     '200p.p.b.',
-    '200pf',
-    '200pg',
-    '200rpm',
-    '200strong',
-    '200t',
-    '200v',
-    '200x200',
-    '200yd',
-    '200yr',
-    '201&mdash;204',
-    '201&ndash;211',
-    '201&ndash;250',
-    '201&ndash;26',
-    '201&ndash;5',
-    '201&ndash;7',
     '201&ndash;8th',
-    '201&ndash;9',
-    '201,387',
-    '201,837,000',
-    '201-seat',
-    '201.4mph',
-    '201.7p',
-    '201.9',
-    '2012&ndash;15',
-    '20120',
-    '20124',
-    '2012cc',
-    '20130',
-    '20150',
-    '20154',
-    '2017&ndash;2019',
     '20190',
-    '201a&ndash;b',
-    '201c-210d',
-    '201pp',
-    '201st',
-    '201x',
-    '202&ndash;10',
-    '202&ndash;120',
-    '202&ndash;203',
-    '202&ndash;32',
-    '202&ndash;6',
-    '202&ndash;7',
-    '202&ndash;9',
-    '202&plus;19',
-    '202,750',
-    '202.32',
     '202.59',
-    '2020-40',
-    '20202',
-    '20207/147',
-    '20209',
-    '2020s',
-    '2021/2',
-    '20210',
-    '20210/l',
-    '20220',
-    '202274',
-    '202400',
-    '20245-46',
-    '20267',
-    '2027',
-    '2028',
     '2028.',
-    '20280',
-    '202:60',
-    '202:c',
-    '202b',
-    '202b&ndash;c',
-    '202bhp',
-    '203&ndash;4',
-    '203&ndash;5',
-    '203(2)',
-    '203,442',
-    '203,599',
-    '203-186',
-    '203.',
-    '203.988',
-    '203/507',
     '203/79',
-    '2030%',
-    '20302',
-    '203070',
-    '2030mm',
-    '2032',
-    '2033a/b/c',
-    '20341',
-    '20359',
-    '20366',
-    '20373',
-    '20389-90',
-    '2039',
-    '203:i',
-    '203a',
-    '203b&ndash;d',
     '203cm',
-    '203pp',
-    '203rd',
-    '204&ndash;7',
-    '204&ndash;8',
-    '204,500',
-    '204-run',
-    '204.1p',
-    '204/20',
-    '204/20&ndash;1',
-    '204/24&ndash;1',
-    '204033',
-    '20404',
-    '2040s',
-    '2041&frac12',
-    '20418',
     '204211',
-    '2043',
-    '20433',
-    '2043370',
-    '2043772',
-    '20440',
-    '204400',
-    '2044532',
-    '204631',
-    '20469',
-    '2047',
-    '2048,32',
-    '2048b',
-    '204bhp',
-    '204cm',
-    '204hp',
     '204kda',
-    '204lb',
-    '205&mdash;12',
-    '205&ndash;3',
-    '205&ndash;31',
-    '205&ndash;36',
-    '205,300',
-    '205,600',
-    '205,698',
-    '205,737',
-    '205-1',
-    '205-litre',
-    '205-yard',
-    '205.',
-    '205.5',
-    '205/16',
     '205/45',
-    '205/60r15',
-    '205/82',
-    '20500',
-    '2050g/fs',
-    '2050s',
-    '2051',
-    '20520',
-    '20530',
-    '20535',
-    '205353',
-    '20556',
-    '2056',
-    '2056&ndash;3307',
-    '20560',
-    '20569',
     '20577',
-    '205775',
-    '2058',
-    '20591',
-    '205bn',
-    '205g',
-    '205kg',
-    '205m',
-    '205v',
-    '206&ndash;11',
-    '206&ndash;119',
-    '206&ndash;12',
-    '206&ndash;207',
-    '206&ndash;5',
-    '206&ndash;8',
-    '206-7',
     '206-article',
-    '20600',
-    '2060th',
-    '2062',
-    '206281',
-    '20633',
-    '206531',
-    '206666',
-    '2067',
-    '206755',
-    '20685',
-    '206a',
-    '206ff.',
-    '206ft',
-    '206gt',
-    '206metre',
     '207&ndash;10',
-    '207&ndash;18',
-    '207&ndash;309',
-    '207&ndash;6',
-    '207(2)',
-    '207(3)',
-    '207,217',
-    '207,461,000',
-    '207-4',
-    '207-yard',
-    '20700',
-    '2070mph',
-    '2072',
-    '2072390',
-    '20740',
-    '20749',
     '2076.',
-    '2077',
-    '2077/4341',
-    '20771',
-    '2078/92',
-    '207:j',
-    '207c',
-    '207g',
-    '207pp',
-    '207s',
-    '208&ndash;10',
-    '208&ndash;11',
-    '208&ndash;209',
-    '208&ndash;210',
-    '208&ndash;332',
-    '208&ndash;5',
     '208,476.57',
-    '208,500',
-    '208,557',
-    '208-2',
-    '208-acre',
-    '208-page',
-    '208.',
-    '208.20',
-    '208.6',
-    '208/80',
-    '2081',
-    '20819',
-    '208191',
-    '2084261',
-    '20844',
-    '2086',
     '2086/30',
-    '20860',
-    '20884',
-    '20890',
-    '208962',
-    '208:h',
-    '208bn',
-    '208f',
-    '208m',
-    '208pp.',
-    '208th',
-    '209%',
-    '209&ndash;10',
-    '209&ndash;12',
-    '209&ndash;15',
-    '209&ndash;20',
     '209&ndash;22',
-    '209&ndash;225',
-    '209&ndash;8',
-    '209(1)',
-    '209(2)',
-    '209,000',
-    '209,600',
-    '209,800',
-    '209-9',
-    '209-member',
-    '2090',
-    '20900',
-    '20900/stx',
-    '2090s',
-    '2091',
-    '2092/91',
     '20923253',
-    '2093',
-    '209432',
-    '2096',
-    '20963-64-but',
-    '20963-68',
-    '20964',
-    '2097',
-    '20970',
-    '20972',
-    '2098&ndash;3540',
-    '20980',
-    '2098950',
-    '209:m',
-    '209cm',
-    '20:1&ndash;11a',
     '20:1&ndash;13',
-    '20:1&ndash;17',
-    '20:1&ndash;21',
-    '20:1&ndash;8',
-    '20:12',
-    '20:13',
-    '20:14',
-    '20:14&ndash;21',
-    '20:15:15',
-    '20:16',
-    '20:17&ndash;38',
-    '20:19&ndash;23',
-    '20:2',
-    '20:2&ndash;13',
-    '20:20',
-    '20:20&ndash;23',
     '20:20&ndash;26',
-    '20:22',
-    '20:22&ndash;23:33',
-    '20:22&ndash;26',
-    '20:22f',
-    '20:23',
-    '20:25&ndash;28',
-    '20:25ff',
-    '20:27&ndash;30',
-    '20:27&ndash;40',
-    '20:28',
-    '20:29',
-    '20:3',
-    '20:3&ndash;5',
-    '20:31',
-    '20:35',
     '20:41&ndash;44',
-    '20:45&ndash;47',
-    '20:54:04',
-    '20:56',
-    '20:7',
-    '20:7,8',
-    '20:8ff.',
-    '20:9&ndash;19',
-    '20_per',
-    '20b',
-    '20baud',
-    '20bc',
-    '20bhp',
-    '20c-g',
-    '20cc',
-    '20cm/7in',
     '20cmx20cm',
-    '20cwt',
-    '20d',
-    '20deg',
-    '20dhahran5',
-    '20dm',
-    '20eg',
-    '20f',
-    '20ff',
-    '20floz/570ml',
-    '20fr',
-    '20ft/6m',
-    '20g-operations',
-    '20gev',
-    '20hp',
-    '20ish',
     '20kb',
-    '20kcals',
-    '20kg/n/ha',
-    '20kilogauss',
-    '20mb/second',
-    '20mbar',
-    '20mbps',
-    '20mbq',
-    '20mbyte-per-second',
-    '20mer',
-    '20mev',
-    '20mgml',
-    '20mins',
-    '20minute',
-    '20month-old',
-    '20ne',
     '20november',
-    '20oz',
-    '20p-off',
-    '20p.',
-    '20p.p.m.',
-    '20p16n02',
-    '20pg',
-    '20pm',
-    '20s&deg;c',
-    '20s-style',
-    '20s.w.g.',
-    '20s/n',
-    '20second',
-    '20secs',
-    '20sex',
-    '20st',
     '20t',
-    '20tev',
-    '20th-21st',
-    '20th-24th',
-    '20th-fox',
-    '20thcentury',
-    '20v-0v-20v',
-    '20v8',
-    '20v8h-5',
-    '20vi',
-    '20w/50',
-    '20wb',
-    '20x',
-    '20x20',
-    '20x25x7&middot;5cm',
-    '20x25x75',
     '20x30cm',
-    '20xssc',
-    '20yard',
-    '20yds',
-    '20years-old',
-    '20yr',
-    '20z',
-    '21%-arises',
-    '21&deg;c/70&deg;f',
-    '21&deg;s',
-    '21&frac14;in',
-    '21&ft',
-    '21&ins;w',
-    '21&ndash',
-    '21&ndash;1',
-    '21&ndash;103',
     '21&ndash;26mm',
-    '21&ndash;29',
-    '21&ndash;30cm',
-    '21&ndash;31',
-    '21&ndash;33',
-    '21&ndash;36',
-    '21&ndash;40',
-    '21&ndash;43',
-    '21&ndash;55%',
-    '21&ndash;60',
-    '21&ndash;64',
-    '21&ndash;71',
-    '21&ndash;82',
-    '21&ndash;aug',
-    '21&ndash;august',
-    '21&ndash;jul',
     '21&percnt',
-    '21&rehy;year-old',
-    '21&shilling;8d',
-    '21&sol;76',
-    '21&times;24.7',
-    '21\'s',
-    '21(22)',
-    '21(3)',
-    '21(4.5)',
-    '21(p)',
-    '21(v)ta',
-    '21,000-gallon',
-    '21,000-sq',
-    '21,000-wrd',
-    '21,019',
-    '21,123',
     '21,144',
-    '21,1982',
-    '21,200',
-    '21,211',
-    '21,23',
-    '21,25',
-    '21,25,26',
-    '21,25,31',
-    '21,255',
-    '21,266,000',
-    '21,286',
-    '21,31',
-    '21,320',
-    '21,35.55',
-    '21,367',
-    '21,382',
     '21,400,000',
-    '21,400ft',
-    '21,425',
-    '21,428',
-    '21,433',
-    '21,481',
-    '21,5',
-    '21,501',
-    '21,552',
-    '21,600,000',
-    '21,672,000',
-    '21,679',
-    '21,776',
-    '21,788',
-    '21,796',
-    '21,800,000',
     '21,838',
-    '21,850',
-    '21,861',
-    '21,882',
-    '21,950',
-    '21-21',
-    '21-22nd',
-    '21-27',
-    '21-3',
-    '21-34',
-    '21-4',
-    '21-april',
-    '21-bay',
-    '21-bed',
-    '21-country',
-    '21-end',
     '21-february',
-    '21-gallon',
-    '21-gear',
-    '21-goal',
-    '21-jan',
-    '21-jun',
-    '21-mile',
-    '21-months',
-    '21-nation',
-    '21-over',
-    '21-page',
-    '21-plus',
-    '21-room',
-    '21-runner',
-    '21-sat',
-    '21-spline',
     '21-year&rehy;old',
-    '21-years-old',
-    '21-years-olds',
-    '21.0%',
-    '21.07',
-    '21.10.93sna',
-    '21.12.1865',
-    '21.12.90',
-    '21.179',
-    '21.18(b)',
-    '21.19(a)',
-    '21.19(b)',
-    '21.2.9',
-    '21.2259',
-    '21.286',
-    '21.2cc',
     '21.2fl.',
-    '21.2m',
-    '21.2p',
-    '21.30sec',
-    '21.31',
-    '21.34',
-    '21.38',
-    '21.39',
-    '21.3bn',
-    '21.4&ndash;9',
-    '21.4.12',
-    '21.4.13',
-    '21.4.8&ndash;9',
-    '21.40',
-    '21.41',
-    '21.494',
     '21.4p',
-    '21.4pc',
-    '21.5.92',
-    '21.50',
-    '21.54',
-    '21.59p',
-    '21.5:1',
-    '21.5k',
-    '21.6(a)',
-    '21.6(b)',
-    '21.6.80',
-    '21.6.85,65-6',
-    '21.6/',
-    '21.6/50',
-    '21.63',
-    '21.65',
     '21.69',
-    '21.6m',
-    '21.6mm',
-    '21.6pc',
-    '21.6sec',
-    '21.7&deg;c/71&deg;f',
-    '21.7.93',
-    '21.71',
-    '21.72',
-    '21.75',
-    '21.76',
-    '21.76,9.845',
-    '21.78',
-    '21.7khz',
-    '21.7p',
-    '21.8.90',
     '21.87',
-    '21.87%',
-    '21.87p',
-    '21.8ff',
-    '21.8m',
-    '21.8mm',
-    '21.90',
-    '21.92',
-    '21.95m',
-    '21.9mmolmol',
-    '21.9p',
-    '21.9pc',
-    '21/1/84',
-    '21/100000/year',
-    '21/11/92',
-    '21/118',
     '21/12',
-    '21/12/2012',
-    '21/1269',
-    '21/156',
-    '21/15b',
-    '21/24',
-    '21/2in',
-    '21/2p',
-    '21/30',
-    '21/365=0.058',
-    '21/4/56',
-    '21/40',
-    '21/46',
-    '21/4in',
-    '21/60',
-    '21/64',
     '21/82',
-    '21/86',
-    '21/91',
-    '21/92',
-    '21/feb19',
-    '210&deg;.',
-    '210&deg;c',
-    '210&mdash;11',
-    '210&mgr;v',
-    '210&ndash;205',
-    '210&ndash;240',
-    '210&ndash;329',
-    '210&ndash;410',
-    '210&ndash;42',
-    '210&ndash;995',
-    '210\'s',
     '210,720',
-    '210-9',
-    '210-ft',
-    '210-page',
-    '210.2',
-    '210.3p',
-    '210.9%',
-    '210/l',
-    '2100&ndash;2215',
-    '2100&ndash;2580',
-    '21000',
-    '210002',
-    '21000hz',
-    '21002-pe-cesar',
-    '2100ft',
-    '21010',
     '210173.',
-    '210179.',
-    '210197.',
-    '210199',
-    '21020',
-    '2102610',
-    '21030',
-    '210319',
-    '210349.',
-    '210393',
-    '21045',
-    '210497.',
-    '21050',
-    '210505.',
-    '210523.',
-    '2106',
     '21060',
-    '210695',
-    '210765',
-    '21080',
-    '21084',
-    '2109mw',
-    '210:r',
-    '210bhp',
-    '210c',
-    '210ins',
-    '210lb',
-    '210ml',
-    '210mph',
-    '210p&ndash;217p',
-    '210pp',
-    '210pp.',
     '210x46mm',
-    '211&ndash;12',
-    '211&ndash;212',
-    '211&ndash;213',
-    '211&ndash;215',
-    '211&ndash;25',
-    '211&ndash;8',
-    '211+27',
-    '211,100,000',
-    '211.2',
-    '211.8',
-    '211.84',
-    '211/2',
-    '211022',
-    '21108.5',
-    '211360',
     '211364',
-    '2115',
-    '21150',
-    '2117.9',
-    '211797',
-    '2119',
-    '211:p',
-    '211cm',
-    '211ff',
-    '211lb',
-    '211m',
-    '212%',
-    '212&frac12',
-    '212&mdash;48',
-    '212&ndash;122',
-    '212&ndash;16',
     '212&ndash;17',
-    '212&ndash;29',
-    '212&ndash;460',
-    '212&ndash;628',
-    '212-mile',
-    '212-page',
-    '212-residue',
-    '2121',
-    '2121&ndash;3',
-    '21210',
-    '212119',
-    '2122',
-    '2122hz',
-    '212354',
-    '2125528',
-    '2129',
     '212:o',
-    '212a,103',
-    '212b',
-    '212b.',
-    '212p',
-    '212w',
-    '213&ndash;15',
-    '213&ndash;16',
-    '213&ndash;165',
-    '213&ndash;1651',
-    '213&ndash;210',
-    '213&ndash;215',
-    '213&ndash;496',
-    '213&ndash;5',
-    '213&ndash;7',
-    '213(4)',
     '213,700',
-    '213,817',
-    '213.32',
-    '213.86',
-    '2130&ndash;1700',
-    '21300',
-    '2130mm',
-    '2131',
-    '21310',
-    '21319',
-    '2133',
-    '2134',
-    '21340',
-    '21345',
-    '21350',
-    '2138',
     '2138/2139',
-    '2139119',
-    '21394',
-    '213:p',
-    '213e&ndash;h',
-    '213ff',
-    '213ff.',
-    '213g',
-    '214&ndash;15',
-    '214&ndash;19',
-    '214&ndash;212bc',
-    '214&ndash;216',
-    '214&ndash;2f',
-    '214&ndash;7',
-    '214&plus;15',
-    '214,139',
     '214-9',
-    '214-run',
-    '214.',
-    '214.5x143',
-    '21404',
-    '2141',
-    '21410',
-    '214141',
-    '21418',
-    '21419',
-    '214196',
-    '21420',
-    '21428',
-    '2145',
-    '214582',
-    '2146',
     '2147',
-    '2149',
-    '214:p',
-    '214b&ndash;c',
-    '214cm',
-    '214km',
-    '214nm',
-    '214si',
-    '215%',
-    '215&deg',
-    '215&ndash;1',
-    '215&ndash;16',
-    '215&ndash;44',
-    '215&ndash;7',
-    '215-page',
-    '215/82',
     '21500',
-    '2152.2',
-    '215309',
-    '2154',
-    '215555',
-    '215631',
-    '21566',
-    '21590',
-    '21594',
-    '2159ft',
-    '215:b',
-    '215ff',
-    '215mm/8&frac12;in',
-    '215p.',
-    '215s',
-    '215sq',
     '215x236cm',
-    '216&mdash;22',
-    '216&ndash;17',
-    '216&ndash;20',
-    '216&ndash;221',
-    '216&ndash;7',
-    '216,021',
-    '216,670',
-    '216-8',
-    '216-room',
-    '216.7',
-    '216.7%',
-    '2160',
-    '21601',
-    '21605-10',
-    '216082',
     '21621',
-    '21623',
-    '2165',
-    '21650',
-    '2168',
-    '21690',
-    '2169m',
-    '216:j',
-    '216a',
-    '216n',
-    '216pp',
-    '216pp.',
-    '216sli',
-    '216th',
-    '217%',
-    '217,277',
     '217-member',
-    '217-mile',
-    '217.9%',
-    '2171cd',
-    '2175',
-    '2179',
-    '21797-99',
-    '217a',
-    '217b',
-    '217p',
-    '218%',
-    '218&ndash;201bc',
-    '218&ndash;219',
-    '218,000',
-    '218,038',
-    '218,783',
     '218-ft',
-    '218.5',
-    '2181.5',
-    '218121',
-    '2182',
-    '21833',
-    '2186',
-    '2187',
-    '21879',
-    '21882',
-    '218956',
-    '218:m',
-    '218a&ndash;c',
-    '218bc',
-    '218f.',
-    '218m',
     '218p',
-    '218sld',
-    '219&ndash;21',
-    '219&ndash;269',
-    '219&ndash;53',
-    '219&ndash;54',
-    '219&plus;3',
-    '219.03',
-    '219.2%',
-    '219.7%',
-    '219.80',
-    '2190',
-    '21933',
-    '21936',
-    '219444',
-    '219467',
     '219560',
-    '2196m',
-    '219911',
-    '219ff',
-    '219m',
-    '219mph',
-    '219pp',
-    '21:00:16',
-    '21:04',
-    '21:1&ndash;11',
-    '21:1&ndash;23:13',
-    '21:1&ndash;9',
-    '21:10&ndash;15',
-    '21:10&ndash;17',
-    '21:11',
-    '21:12&ndash;32',
     '21:14',
-    '21:18&ndash;19',
-    '21:18:37',
-    '21:2&ndash;7',
-    '21:20&ndash;22',
-    '21:21',
-    '21:22&ndash;34',
-    '21:23&ndash;27',
-    '21:26:37',
-    '21:26:47',
-    '21:33',
-    '21:33&ndash;22:15',
-    '21:33&ndash;46',
-    '21:4',
-    '21:42:45&ndash;0500',
-    '21:45',
     '21:5&ndash;9',
-    '21=33%',
-    '21_per',
-    '21cm/8&frac12',
-    '21cms',
-    '21d-e',
-    '21em',
-    '21g',
-    '21h',
-    '21in&ndash;42in',
-    '21ish',
-    '21kd',
-    '21km',
-    '21kw',
-    '21lb.',
-    '21lbs',
     '21min',
-    '21month',
-    '21no',
-    '21o',
-    '21officers',
-    '21os',
-    '21pp',
-    '21q',
-    '21q22.2',
-    '21riyadh2-11',
-    '21sst',
-    '21st&ndash;25th',
-    '21st-26th',
-    '21st-minute',
-    '21st.',
-    '21st/23rd',
     '21stone',
-    '22&amp&frac12',
-    '22&deg',
-    '22&frac12',
-    '22&frac12&deg',
-    '22&frac12;-litre',
-    '22&half',
-    '22&half;-cent',
-    '22&mdash;004',
-    '22&mdash;25',
-    '22&ndash',
-    '22&ndash;06',
-    '22&ndash;07',
-    '22&ndash;1/2ft',
-    '22&ndash;10/9',
-    '22&ndash;102',
     '22&ndash;105',
-    '22&ndash;109',
-    '22&ndash;16.',
-    '22&ndash;17',
-    '22&ndash;175',
-    '22&ndash;18',
-    '22&ndash;19',
-    '22&ndash;2&ndash;68&ndash;2',
-    '22&ndash;24&deg',
-    '22&ndash;24-hour',
-    '22&ndash;25&deg;s',
-    '22&ndash;28mpg',
-    '22&ndash;29a',
-    '22&ndash;30cm',
-    '22&ndash;31',
-    '22&ndash;36',
     '22&ndash;37',
-    '22&ndash;41',
-    '22&ndash;421',
-    '22&ndash;46',
-    '22&ndash;46lb',
-    '22&ndash;5',
-    '22&ndash;51',
-    '22&ndash;55',
-    '22&ndash;6&ndash;1866',
-    '22&ndash;61',
-    '22&ndash;8',
-    '22&ndash;9',
-    '22&ndash;931',
-    '22&ndash;dec',
-    '22&ndash;oct',
-    '22&ndash;sun',
     '22&percnt',
-    '22&shilling;6d',
-    '22\'',
-    '22(4)',
-    '22(7)',
-    '22(c)',
-    '22,000-foot',
-    '22,000-ft',
-    '22,000-member',
-    '22,000-mile',
-    '22,000-strong',
-    '22,000km',
-    '22,000kwh',
-    '22,000lb',
-    '22,048',
-    '22,113',
     '22,123',
-    '22,125',
-    '22,197',
-    '22,225',
-    '22,23',
-    '22,24',
-    '22,24,25',
-    '22,26,27',
-    '22,27,32',
-    '22,282',
-    '22,320',
-    '22,35',
-    '22,350lb',
-    '22,370-acre',
-    '22,400',
-    '22,431',
     '22,433',
-    '22,439',
-    '22,449',
-    '22,466',
-    '22,469',
-    '22,486',
-    '22,491,000',
-    '22,521,223',
-    '22,530',
-    '22,531',
-    '22,580',
-    '22,649',
-    '22,667,000',
-    '22,689,000',
-    '22,691',
-    '22,700',
     '22,750,000',
-    '22,810,000',
-    '22,902',
-    '22,925',
-    '22-',
-    '22-10',
-    '22-13',
-    '22-20',
-    '22-260c',
-    '22-26oc',
-    '22-287009',
-    '22-3',
-    '22-34',
-    '22-7',
-    '22-9',
-    '22-acre',
     '22-bay',
-    '22-bedroomed',
-    '22-cd',
-    '22-dec',
-    '22-division',
-    '22-fddi',
-    '22-fight',
-    '22-fold',
-    '22-foot',
-    '22-headed',
-    '22-jan',
-    '22-january',
-    '22-jul',
-    '22-jun',
-    '22-jun22',
-    '22-km-long',
     '22-miles',
-    '22-nucleotide',
-    '22-oct.',
-    '22-storey',
-    '22-ton',
-    '22-week',
-    '22-yard',
-    '22-year-man',
-    '22-year-olds',
-    '22.0%',
-    '22.00',
-    '22.000',
-    '22.01',
-    '22.06',
-    '22.06.93',
-    '22.08',
     '22.09',
-    '22.09.',
-    '22.0secs',
-    '22.1.5.3',
-    '22.1.8',
-    '22.1.91',
-    '22.10',
-    '22.12',
-    '22.12&ndash;22.14',
-    '22.16',
-    '22.17',
-    '22.18',
-    '22.19',
-    '22.2.91',
-    '22.20',
-    '22.23508ghz',
     '22.27',
-    '22.27%',
-    '22.295b.',
-    '22.296a.',
-    '22.2m',
-    '22.2pc',
-    '22.3%',
-    '22.3&ndash;75.0',
-    '22.32',
-    '22.34',
-    '22.35',
-    '22.37,39',
-    '22.3cm',
-    '22.3kg',
-    '22.4.92',
-    '22.4.92b',
     '22.46',
-    '22.46mph',
-    '22.47',
-    '22.4cm',
-    '22.4pc',
-    '22.5&ndash;80.1',
-    '22.50',
-    '22.59',
-    '22.5cm',
-    '22.5k',
-    '22.5khz',
-    '22.5m',
-    '22.5mph/1000rpm',
-    '22.5pc',
-    '22.6&ndash;22.8',
-    '22.6/100000',
     '22.65',
-    '22.69',
-    '22.6mpg',
-    '22.6oz',
-    '22.6p',
-    '22.6pc',
-    '22.7&aring',
-    '22.73',
-    '22.80m',
-    '22.81',
-    '22.86',
-    '22.87r.',
-    '22.8secs',
-    '22.95',
-    '22.9m',
-    '22/1/88',
     '22/10/90',
-    '22/2/87',
-    '22/20',
-    '22/218,51/247',
-    '22/24',
-    '22/3',
-    '22/3/41',
-    '22/3/93',
-    '22/4/41',
-    '22/563',
-    '22/59',
-    '22/7/76',
-    '22/7/87',
-    '22/89',
-    '22/feb/90',
-    '220&deg;c/425&deg;f',
     '220&deg;c/425&deg;f/gas',
-    '220&micro;s',
-    '220&ndash;225',
-    '220&ndash;3180',
-    '220&ndash;340',
-    '220&ndash;6',
-    '220(1)',
-    '220-m',
-    '220-mile',
-    '220-name',
-    '220-year-old',
-    '220.255',
-    '220/240v',
-    '2200&ndash;1700',
-    '2200&ndash;2300',
-    '2200&ndash;2400/&pound;1',
     '2200&ndash;4400',
-    '2200/22/6',
-    '2200/400',
-    '220000',
-    '2200gns',
-    '2200hrs',
-    '2200kg',
-    '2200s',
-    '22011',
-    '2201b',
-    '2202.4',
-    '22030',
-    '220406',
-    '2204lb',
-    '22070',
-    '220:i',
     '220b',
-    '220bp',
-    '220c/400f/gas',
-    '220c/425f/gas7',
-    '220ft',
-    '220mw',
-    '220p&ndash;221p',
-    '220pc',
-    '220th',
-    '221&ndash',
-    '221&ndash;25',
-    '221&ndash;5',
-    '221&plus;16',
-    '221,000',
-    '221,600',
-    '221,900',
     '221-day',
-    '221/45',
-    '2210',
-    '22108',
-    '2212',
-    '22122&ndash;1190',
-    '2213',
-    '22130',
-    '221311',
-    '221312',
-    '2214',
-    '22144',
-    '221473',
-    '2215&ndash;0030',
-    '2217',
-    '221717',
     '2218',
-    '221850',
-    '221f',
-    '221lb/ft',
-    '221x299.7',
-    '222&ndash;225',
-    '222(5)',
-    '222,500',
-    '222,800',
-    '222-processor',
-    '222/898',
-    '222045',
-    '22209',
-    '2220mm',
-    '22214.83%',
-    '222141',
     '222272',
-    '2223.7',
-    '2225kg',
-    '22260',
-    '222601',
-    '2227',
-    '22278-79',
-    '2228',
-    '2229',
-    '222907',
-    '222:o',
-    '222ft',
-    '222lbs',
-    '222n',
-    '223&mdash;5',
-    '223&ndash;187',
     '223&ndash;7',
-    '223&ndash;85',
-    '223(2)',
-    '223(4)',
-    '223(5)',
-    '223,283',
-    '223-seat',
-    '223.414',
-    '223.967',
-    '223.967mph',
-    '223/036',
-    '223000',
-    '223096',
-    '2231',
-    '2231/2',
-    '22314',
     '2232.68',
-    '223284',
-    '2233355',
-    '223616',
-    '2237.0',
-    '223791',
-    '2239',
-    '22390',
-    '223c&ndash;e',
-    '223e11',
-    '223g',
-    '223pp',
-    '223rd',
-    '224&mdash;48',
-    '224&ndash;31',
-    '224(3)',
     '224(4)',
-    '224,618',
-    '224,950',
-    '2241&sol;87',
-    '2241.2',
-    '224161',
-    '2242',
-    '224231',
-    '224400',
-    '22452',
-    '2245302',
-    '22461',
-    '2247.0',
-    '22474',
-    '2249',
-    '22490',
     '224970',
-    '224ff',
-    '224lb',
-    '224mb',
-    '224pp.',
-    '224th',
-    '225&deg;f',
-    '225&mgr;mol',
-    '225&ndash;215',
-    '225&ndash;236',
-    '225&ndash;250',
-    '225&ndash;275',
-    '225&ndash;275g/8&ndash;10oz',
-    '225&ndash;3',
-    '225&ndash;325g/8&ndash;12oz',
-    '225&ndash;33',
     '225(6)',
-    '225,000-square-foot',
-    '225,000m',
-    '225-page',
-    '225-share',
-    '225-space',
-    '225.28',
-    '225.3%',
-    '225.6',
-    '225/55',
-    '225/6',
-    '22500',
-    '225000',
-    '22505',
-    '22505-07',
-    '2250ft',
     '2251.32',
-    '2251402',
-    '225158',
-    '22520',
-    '22524-26',
-    '22527',
-    '22528',
-    '2254&ndash;2218',
-    '2257',
-    '22580',
-    '2259cc',
-    '225b',
-    '225bp',
-    '225d',
-    '225g/8oz/1',
-    '225kcals',
     '225kg',
-    '225kph',
-    '225m',
-    '225ml',
-    '225pp.',
-    '225s',
-    '225th',
-    '226&ndash;1075',
-    '226&ndash;301',
-    '226&ndash;32',
-    '226&ndash;4',
-    '226&ndash;651',
-    '226&ndash;7',
-    '226&ndash;8',
-    '226&ndash;9',
-    '226(1)',
     '226(1a)',
-    '226(4)',
-    '226(5)',
-    '226,545,805',
-    '226,723',
-    '226-seconds',
-    '226.9%',
-    '226.90',
-    '226/1141',
-    '226/347',
-    '22600',
-    '2261',
-    '226101',
-    '2262',
-    '2262.6',
-    '226226',
     '2263',
-    '226354',
-    '22636',
-    '22637',
-    '22637-38',
-    '22650',
-    '2265m/s',
-    '22672/91',
-    '2269.9',
-    '226911',
-    '226bhp',
-    '226c&ndash;e',
-    '226f&ndash;g',
-    '226h',
-    '227&ndash;31',
-    '227&ndash;34',
     '227&ndash;37',
-    '227&ndash;8',
-    '227(6)',
-    '227,000,000',
-    '227,437',
-    '227,832',
-    '227,863',
-    '227-54',
-    '227.',
-    '227.5',
-    '227.6%',
-    '227.9',
-    '2270',
-    '22700',
-    '2271-1',
-    '22710',
     '22720',
-    '227254',
-    '2275',
-    '227570',
-    '22760',
-    '227799',
-    '2278',
-    '22784',
-    '22787',
-    '2279',
-    '227bhp',
-    '227c&ndash;d',
-    '227d&ndash;e',
-    '227e&ndash;g',
-    '227g',
-    '228&ndash;231',
     '228&ndash;270',
-    '228&ndash;5',
-    '228&ndash;6',
-    '228&plus;3',
-    '228,455',
-    '228-6',
-    '2280/821',
-    '2281.0',
-    '2281.6',
-    '2283',
-    '2285.0',
-    '2286hd',
-    '228727',
-    '2288',
-    '22883',
-    '228844',
     '2289',
-    '228pp.',
-    '229&ndash;30',
-    '229&ndash;32',
-    '229&ndash;35',
-    '229&ndash;491',
-    '229(2)',
-    '229,000',
-    '229,027',
-    '229,077',
-    '229,100',
-    '229,378',
-    '229.4%',
-    '229/0629',
-    '22900',
-    '22909',
     '22909-17',
-    '2291',
-    '2292&ndash;45247&ndash;2',
-    '2292&ndash;45689&ndash;2',
-    '2294',
-    '22940',
-    '22944',
-    '2295',
-    '22950',
-    '2296',
-    '2297',
-    '2298.4',
-    '22987',
-    '229889',
-    '2299-mile',
-    '229c7',
     '229m',
-    '229p',
-    '229pp',
-    '22:05:07',
-    '22:1&ndash;2',
-    '22:1&ndash;4',
-    '22:13',
-    '22:15&ndash;20',
-    '22:15&ndash;22',
-    '22:16&ndash;31',
-    '22:17ff',
-    '22:18',
-    '22:19',
-    '22:19b',
-    '22:20:03',
-    '22:21&ndash;23',
     '22:23&ndash;33',
-    '22:28&ndash;30',
-    '22:30',
-    '22:31&ndash;4',
-    '22:34',
-    '22:36',
-    '22:36&ndash;40',
-    '22:36:04&ndash;0500',
-    '22:37&ndash;40',
-    '22:38',
-    '22:40&ndash;46',
-    '22:41&ndash;23:10',
-    '22:41&ndash;46',
-    '22:43&ndash;44',
-    '22:47&ndash;53',
-    '22:50:02',
     '22:53',
-    '22:54&ndash;62',
-    '22:55&mdash;62',
-    '22:66&ndash;71',
-    '22:67&ndash;70',
-    '22:7&ndash;13',
-    '22:fretter',
-    '22=4096',
-    '22d11',
-    '22g',
-    '22ghz',
-    '22hp1,80019.818.3',
-    '22in.',
-    '22ins',
-    '22k',
-    '22k-105k',
     '22km',
-    '22kohm',
-    '22mb',
-    '22min',
-    '22mm&frac34&ins',
-    '22mm/&frac34&ins',
-    '22myr',
-    '22nd&ndash;24th',
-    '22pp',
-    '22q',
-    '22tel',
-    '22th',
-    '22v10-type',
-    '22v10h-7',
-    '22v10z',
-    '22x',
     '22x40&ins',
-    '23%-55%',
-    '23%.',
-    '23&frac12;x15&frac12&ins',
-    '23&frac38;in',
-    '23&frac58;in',
-    '23&ft',
-    '23&ins;h',
-    '23&mdash;004',
-    '23&mdash;005',
-    '23&mdash;24',
-    '23&mdash;26',
-    '23&mdash;4',
-    '23&middot;2',
-    '23&middot;4',
-    '23&middot;8',
     '23&ndash;11',
-    '23&ndash;115',
-    '23&ndash;12-',
-    '23&ndash;14',
-    '23&ndash;14&ndash;0',
-    '23&ndash;144',
-    '23&ndash;17',
-    '23&ndash;21',
-    '23&ndash;23',
-    '23&ndash;25,000',
-    '23&ndash;25cm/9&ndash;10in',
-    '23&ndash;25th',
-    '23&ndash;26&deg;c',
-    '23&ndash;27&deg;c',
-    '23&ndash;27&deg;s',
-    '23&ndash;28&deg;c',
     '23&ndash;28th',
-    '23&ndash;31',
-    '23&ndash;32',
-    '23&ndash;33',
-    '23&ndash;331',
-    '23&ndash;4&ndash;1875',
-    '23&ndash;42',
-    '23&ndash;47',
-    '23&ndash;50',
-    '23&ndash;55',
-    '23&ndash;6',
-    '23&ndash;7&ndash;1867',
-    '23&ndash;7&ndash;1870',
-    '23&ndash;77',
-    '23&ndash;8',
-    '23&ndash;8&ndash;1871',
     '23&ndash;aug',
-    '23&ndash;august',
-    '23&ndash;december',
-    '23&ndash;january',
-    '23&ndash;sep',
-    '23&shilling;4d.',
-    '23\'',
-    '23\'04',
-    '23\'s',
-    '23(2)',
-    '23(7)',
-    '23(v)ta',
-    '23+1',
-    '23+kg',
-    '23,00',
-    '23,000,000-27,000,000',
     '23,021,000',
-    '23,022',
-    '23,040',
-    '23,056',
-    '23,088',
-    '23,100',
-    '23,108',
-    '23,118',
-    '23,195',
-    '23,2',
-    '23,200,000',
-    '23,24,25',
-    '23,24,25,26',
-    '23,24,26,27,28',
-    '23,251',
-    '23,28',
     '23,300',
-    '23,300,000',
-    '23,300ft',
-    '23,304',
-    '23,31',
-    '23,325',
-    '23,331',
-    '23,400,000',
-    '23,416',
-    '23,428',
-    '23,438',
-    '23,492',
-    '23,497',
-    '23,497,200',
-    '23,531',
-    '23,550',
     '23,577',
-    '23,585',
-    '23,594',
-    '23,646',
-    '23,67',
-    '23,678',
-    '23,681',
-    '23,688,000',
-    '23,700.00',
-    '23,710,000',
-    '23,730',
-    '23,739,000',
-    '23,753',
-    '23,786',
-    '23,838',
-    '23,958',
     '23,992',
-    '23-16',
-    '23-2-93',
-    '23-3',
-    '23-35',
-    '23-austria',
-    '23-country',
-    '23-day',
-    '23-december',
-    '23-fold',
-    '23-kilometre',
-    '23-litre',
-    '23-mer',
-    '23-month',
-    '23-nov',
-    '23-november',
     '23-points',
-    '23-run',
-    '23-runner',
-    '23-second',
-    '23-storey',
-    '23-track',
-    '23-vii-64',
-    '23-years-old',
-    '23.04',
-    '23.06.',
-    '23.07%',
-    '23.1.6',
-    '23.11',
-    '23.12.91',
-    '23.13',
-    '23.17&ndash;18',
     '23.1b',
-    '23.1mpg',
-    '23.2.1.5',
-    '23.24',
-    '23.2m',
-    '23.2secs',
-    '23.3&aring',
-    '23.30pm',
-    '23.31',
-    '23.32',
-    '23.33',
-    '23.37',
-    '23.38',
-    '23.3p',
-    '23.4.91',
-    '23.4.92',
     '23.40',
-    '23.41',
-    '23.46',
-    '23.48',
-    '23.49',
-    '23.4m',
-    '23.4p',
-    '23.5&aring',
-    '23.5.83',
-    '23.5.90',
-    '23.50',
-    '23.55',
-    '23.56',
-    '23.58',
-    '23.5khz',
-    '23.5km',
     '23.5secs',
-    '23.6(b)',
-    '23.65',
-    '23.69%',
-    '23.700',
-    '23.72',
-    '23.77',
-    '23.7bn',
-    '23.7kg',
-    '23.83',
-    '23.86',
-    '23.89',
-    '23.8m',
-    '23.8p',
-    '23.9.91',
-    '23.9kg',
     '23/',
-    '23/10/86',
-    '23/16a',
-    '23/24june',
-    '23/26',
-    '23/3/41',
-    '23/3/92',
-    '23/33',
-    '23/339',
-    '23/39',
-    '23/4',
-    '23/4&ndash;3',
-    '23/4/86',
-    '23/4/87',
-    '23/592',
-    '23/6d',
     '23/81',
-    '23/92',
-    '230&deg;c/450&deg;f',
-    '230&formula',
-    '230&mdash;1',
-    '230&mgr;v',
-    '230&middot;9',
-    '230&ndash;1',
-    '230&ndash;231',
-    '230&ndash;800',
-    '230&ndash;9',
-    '230(2)',
-    '230,000,000',
-    '230,795',
-    '230-207',
-    '230-9',
     '230-acre',
-    '230-km',
-    '230-ms',
-    '230-page',
-    '230-pounds',
-    '230-seat',
-    '230-year-old',
-    '230.0',
-    '230.6&ndash;279.7',
-    '230.64',
-    '230.80',
-    '230/240',
-    '2300&ndash;0700',
-    '2300&ndash;4250',
-    '23000-strong',
-    '2300000',
     '2301',
-    '23018',
-    '2302/2303',
-    '230220',
-    '230260',
-    '230292',
-    '2303.1',
-    '2303.2',
-    '2303.8',
-    '230310',
-    '230431',
-    '23063',
-    '23077',
-    '2309.6',
-    '230af',
-    '230e',
     '230g/sq',
-    '230hp',
-    '230hz',
-    '230m.',
-    '230myr',
-    '230v',
-    '231&ndash;2',
-    '231&ndash;48',
-    '231&ndash;5400',
-    '231&ndash;7378',
-    '231&ndash;78',
-    '231,800',
-    '231-ball',
-    '231-member',
-    '231.012mph',
-    '231.3%',
     '231.362',
-    '231.4p',
-    '231/252',
-    '2311',
-    '2311.1',
-    '2312',
-    '231212',
-    '2313.0',
-    '23140',
-    '231557',
-    '23170',
-    '2318.0',
-    '23180',
-    '231824',
-    '23186',
-    '23187',
     '23192',
-    '231b',
-    '231c',
-    '232%',
-    '232&deg;c',
-    '232&dollar;c',
-    '232&middot;7',
-    '232&ndash;56',
-    '232(2)',
-    '232(3)',
-    '232,255',
-    '232.438mph',
-    '232.6%',
-    '232.98',
-    '23200',
-    '232064',
     '2321',
-    '23210',
-    '232232',
-    '2323',
-    '23230',
-    '23231',
-    '2324',
-    '2325.7',
-    '2325000',
-    '2326',
-    '23260',
-    '2327.5',
-    '23273',
-    '2328',
-    '2329551',
-    '232c',
     '232gb',
-    '232nd',
-    '232p',
-    '232pp',
-    '232pp.',
-    '233&ndash;237',
-    '233&ndash;4',
-    '233&ndash;5',
-    '233&ndash;6',
-    '233&ndash;72',
-    '233.3%',
-    '23301',
-    '2331/2310',
-    '233122',
-    '233166',
-    '233200',
     '2332129',
-    '2332457',
-    '23337',
-    '23355',
-    '2336',
-    '233641',
-    '2336m',
-    '2338196',
-    '233950',
-    '233ff.',
-    '234&ndash;149',
-    '234&ndash;244',
-    '234&ndash;41',
-    '234(5)',
-    '234-236',
-    '2340.6',
     '2340mm',
-    '234180',
-    '23430',
-    '234331',
-    '2344',
-    '23460',
-    '23467',
-    '2348.0',
-    '2348/89(t1255)',
-    '234cm',
-    '234h',
-    '234kg/516lb',
-    '234km',
-    '234qq3662002',
-    '234v',
-    '235%',
     '235&middot;3',
-    '235&middot;5',
-    '235&ndash;3',
-    '235&ndash;41',
-    '235&ndash;52',
-    '235&ndash;60',
-    '235&ndash;7',
-    '235&ndash;8',
-    '235&plus;2',
-    '235(6)',
-    '235,501',
-    '235,833',
-    '235-30',
-    '235.02',
-    '2350.1',
-    '2351',
     '235141',
-    '2352000',
-    '23526-27',
-    '23530',
-    '2354',
-    '2354.7',
-    '235451',
-    '2355',
-    '2356.8',
-    '23560',
-    '235678',
-    '23580',
-    '2359&ndash;2362',
-    '2359.4',
-    '23590',
-    '235a',
     '235bhp',
-    '235th',
-    '236%',
-    '236&ndash;244',
-    '236&ndash;44',
-    '236&ndash;7',
-    '236,000,000',
-    '236.',
-    '236.5%',
-    '236.5bn',
-    '236.9p',
-    '236/256&ndash;7',
-    '2360',
-    '236000',
-    '23600870a',
-    '23610',
     '236111',
-    '23618',
-    '2362.2',
-    '2362ft',
-    '236470',
-    '2365.7',
-    '2366',
-    '236757',
-    '2369',
-    '2369m',
-    '236a',
-    '236a11',
-    '236m',
-    '236mph',
-    '237%',
-    '237&ndash;240',
     '237&ndash;280',
-    '237&ndash;8',
-    '237(3)',
-    '237,216',
-    '237.2%',
-    '237.6',
-    '2370.0',
-    '2370.9',
-    '23703',
-    '2371a',
-    '2372.2',
-    '2373.4',
-    '23740',
-    '2375a',
-    '2376',
-    '2376.1',
     '237660',
-    '2377.2',
-    '2377.6',
-    '2378.3',
-    '23784',
-    '2379.5',
-    '237c&ndash;e',
-    '237e&ndash;f',
-    '237g&ndash;h',
-    '237kg',
-    '237ml',
-    '237th',
-    '238&ndash;245',
-    '238&ndash;41',
-    '238&ndash;49',
-    '238\'s',
     '238(1)',
-    '238,533',
-    '238,537',
-    '238,590',
-    '238-',
-    '238-257',
-    '238.',
-    '238.09',
-    '238.10p',
-    '238.175',
-    '238/259',
-    '2380',
-    '2381',
-    '2381.9',
-    '23818',
-    '23830',
     '2384',
-    '238449/233088',
-    '23845-48',
-    '23853',
-    '238532',
-    '23865',
-    '2387.9',
-    '238888',
-    '238a&ndash;b',
-    '238ff.',
-    '238g/kwhr',
-    '238pts',
-    '239&ndash;41',
-    '239&plus;16',
-    '239(4)',
-    '239,000',
     '239,301',
-    '239-322',
-    '239.05',
-    '23900',
-    '23910/l',
-    '23912',
-    '23916',
-    '2392a',
-    '2393',
-    '2394/2941/2942',
-    '23941',
-    '23949',
-    '2395',
-    '23950',
-    '23960',
-    '2397',
     '23970',
-    '2399.5',
-    '2399.6',
-    '239cc',
-    '239gb',
-    '23:00',
-    '23:1&ndash;36',
-    '23:1&ndash;5',
-    '23:10',
-    '23:12',
-    '23:13&ndash;24',
-    '23:15&ndash;21',
-    '23:2&ndash;7',
-    '23:20&ndash;33',
-    '23:25&ndash;26',
-    '23:26&ndash;32',
     '23:27',
-    '23:27&ndash;24&ndash;9',
-    '23:3',
-    '23:31',
-    '23:31:00&ndash;0500',
-    '23:34',
-    '23:36:42',
-    '23:39&ndash;43',
-    '23:4,14',
-    '23:44&ndash;18',
-    '23:45:00&ndash;0500',
-    '23:47',
-    '23:48',
-    '23:49',
-    '23:50',
-    '23:50&ndash;24:11',
     '23:50&ndash;56',
-    '23:5ff',
-    '23:6&ndash;12',
-    '23:9&ndash;20',
-    '23chairman',
-    '23cm/9in&times;33cm/13in',
-    '23cm/9inch',
-    '23d',
-    '23ft',
-    '23g/t',
-    '23gb',
-    '23h',
-    '23i-',
-    '23ins',
-    '23kb',
-    '23kg',
     '23lb',
-    '23min',
-    '23mpg',
-    '23mph',
-    '23n.',
-    '23pts',
-    '23rd\'',
-    '23rd-29th',
-    '23rd/24th',
-    '23s.',
-    '23tel',
-    '23th',
-    '23x33cm/9x13in',
-    '23year',
-    '24%.',
-    '24&deg;s',
     '24&frac12&ins',
-    '24&frac34&ins',
-    '24&ins;x12&ins;x12&ins',
-    '24&mdash;25',
-    '24&mdash;26',
-    '24&mdash;29',
-    '24&mdash;36',
-    '24&micro;g/ml',
-    '24&ndash;1/2ft',
-    '24&ndash;13',
-    '24&ndash;16',
-    '24&ndash;177',
-    '24&ndash;18',
-    '24&ndash;2',
-    '24&ndash;20',
-    '24&ndash;23',
     '24&ndash;24',
-    '24&ndash;25/13/41',
-    '24&ndash;25km',
-    '24&ndash;26&deg;c',
-    '24&ndash;27&deg;c',
-    '24&ndash;28%',
-    '24&ndash;3',
-    '24&ndash;34',
-    '24&ndash;4&ndash;53&ndash;3',
-    '24&ndash;46',
-    '24&ndash;48-h',
-    '24&ndash;48h',
-    '24&ndash;5/418&ndash;19',
-    '24&ndash;56',
-    '24&ndash;60',
-    '24&ndash;74',
     '24&ndash;82',
-    '24&ndash;9&ndash',
-    '24&ndash;92',
-    '24&ndash;august',
-    '24&ndash;october',
-    '24&ndash;september',
-    '24&rehy;hour',
-    '24&shilling',
-    '24&sol;5&sol;14',
-    '24&times;11&ins',
-    '24&times;24&ins',
-    '24&times;30',
-    '24&times;30&ins',
-    '24(9%)',
-    '24(a)',
-    '24(b)',
     '24(c)',
-    '24+',
-    '24,000-hectare',
-    '24,000-strong',
-    '24,000rpm',
-    '24,032',
-    '24,058',
-    '24,075',
-    '24,100',
-    '24,100,000',
-    '24,12',
-    '24,170',
-    '24,191',
-    '24,1980',
-    '24,1981',
-    '24,25',
     '24,26',
-    '24,28,29',
-    '24,300,000',
-    '24,34',
-    '24,376',
-    '24,400',
-    '24,423,000',
-    '24,425',
-    '24,445',
-    '24,46',
-    '24,500ft',
-    '24,500lb',
-    '24,567,000',
-    '24,580,000',
-    '24,591',
-    '24,604.5',
     '24,620',
-    '24,639',
-    '24,680',
-    '24,704',
-    '24,716',
-    '24,728',
-    '24,751',
-    '24,752',
-    '24,850',
-    '24,896',
-    '24,900,000',
-    '24,946,073',
-    '24,985',
-    '24,992',
-    '24-14',
-    '24-2',
     '24-2-93',
-    '24-21',
-    '24-22',
-    '24-23',
-    '24-24',
-    '24-3',
-    '24-31',
-    '24-35',
-    '24-4',
-    '24-5',
-    '24-7',
-    '24-all',
-    '24-aug23',
-    '24-august',
-    '24-bit-colour',
-    '24-carat-gold-plated',
     '24-cent',
-    '24-cm',
-    '24-cpu',
-    '24-dot',
-    '24-going-on-14',
-    '24-gun',
-    '24-hour-a',
-    '24-hour-party-people',
-    '24-key',
-    '24-litre',
-    '24-man-troupe',
-    '24-may',
-    '24-october',
-    '24-packs',
-    '24-part',
-    '24-pointed',
     '24-port',
-    '24-race',
-    '24-runner',
-    '24-sept',
-    '24-sept23',
-    '24-september',
-    '24-storey',
-    '24-strong',
-    '24-team',
-    '24-test',
-    '24-times',
-    '24-turbine',
-    '24-turns',
-    '24-valves',
-    '24-volt',
-    '24-yard',
     '24-years-old',
-    '24.00',
-    '24.02',
-    '24.03',
-    '24.06&lcub',
-    '24.06.',
-    '24.1&ndash;24.3',
-    '24.10.1865',
-    '24.10.83',
-    '24.10.90',
-    '24.11',
-    '24.16',
-    '24.2(d)&mdash;see',
-    '24.2.93',
-    '24.21',
-    '24.25',
     '24.27',
-    '24.3(b)',
-    '24.3.84',
-    '24.30',
-    '24.3pc',
-    '24.42',
-    '24.4p',
-    '24.5.88',
-    '24.5.91',
-    '24.57%',
-    '24.5m',
-    '24.5mt',
-    '24.6(a)',
-    '24.62',
-    '24.66',
-    '24.6p',
     '24.71',
-    '24.8(a)',
-    '24.8(d)',
-    '24.84',
-    '24.87p',
-    '24.89v.',
-    '24.9(a)',
-    '24.90',
-    '24.90r.',
-    '24.9568',
-    '24.95680',
-    '24.99',
-    '24.9p',
-    '24/10/80',
-    '24/11/86',
-    '24/160',
     '24/2/41',
-    '24/24',
-    '24/25',
-    '24/3',
-    '24/30',
-    '24/33',
-    '24/47',
-    '24/48hr',
-    '24/6/87',
-    '24/7/89',
-    '24/78',
-    '24/8/93',
-    '24/92',
-    '240&deg',
-    '240&deg;.',
-    '240&ndash;1',
     '240&ndash;2',
-    '240&ndash;200',
-    '240&ndash;230',
-    '240&ndash;280',
-    '240&ndash;300',
-    '240&ndash;7',
-    '240&times;10/l',
-    '240(11)',
-    '240(l)',
-    '240,200',
-    '240,200,000',
-    '240,600',
-    '240,866',
-    '240,963',
-    '240-',
-    '240-236',
     '240-foot',
-    '240-litre',
-    '240-mile',
-    '240-plate',
-    '240-seat',
-    '240-yard',
-    '240-year',
-    '240.',
-    '240.5%',
-    '240.9p',
-    '240/335',
-    '240/410',
-    '240/87',
-    '2400.0',
-    '2400/9600',
-    '2400/sq',
     '24000&ndash;115000',
-    '240000',
-    '2400ft',
-    '2400m',
-    '2400rpm',
-    '2400xt',
-    '240258',
-    '2403.7',
-    '2403k',
-    '240483',
-    '2405.4',
-    '2406',
-    '24060',
-    '24061&ndash;0106',
-    '24062',
-    '2407',
     '2407.5',
-    '240725',
-    '2408',
-    '2408.6',
-    '24088',
-    '240888',
-    '2409',
-    '240d',
-    '240du',
-    '240g/8&frac12;oz',
-    '240g/8oz/carton',
-    '240g/approx',
-    '240hp',
-    '240kg',
-    '240lb',
-    '240mm',
     '240mph',
-    '241&ndash;7',
-    '241,000',
-    '241,200',
-    '241-2',
-    '241.3',
-    '24102',
-    '2411.6',
-    '24110',
-    '24111',
-    '24114302b',
-    '241180',
-    '24120',
-    '241321',
-    '2415',
-    '2415.6',
     '2416',
-    '24160',
-    '241741',
-    '2418',
-    '2419',
-    '241919',
-    '241980',
-    '241r',
-    '242&ndash;246',
-    '242&ndash;52',
-    '242\'s',
-    '242,000',
-    '242,000,000',
-    '242,193',
-    '242.3%',
-    '242.39',
     '2420&ndash;2424',
-    '2420.2',
-    '242095',
-    '2421',
-    '24210',
-    '2422.1',
-    '2423.2',
-    '24239-41',
-    '2425',
-    '24257-58',
-    '242993',
-    '242km',
-    '242pp.',
-    '243&mdash;54',
-    '243&ndash;58',
-    '243&ndash;85',
     '243,048',
-    '243.',
-    '243.43&deg',
-    '243.5p',
-    '243/429',
-    '2430',
-    '243000',
-    '2431.5',
-    '24310',
-    '24314',
-    '2433',
-    '2435',
-    '2437',
-    '243cx',
-    '243f&ndash;g',
-    '243pp',
     '244&ndash;5',
-    '244&ndash;61',
-    '244&ndash;63',
-    '244(1)',
-    '244(3)',
-    '244,000,000',
-    '244.5%',
-    '2440.1',
-    '24400',
-    '2441.0',
-    '244192',
-    '2442',
-    '24420',
-    '2443',
-    '2445',
-    '244544',
     '2446.3',
-    '24460',
-    '244614',
-    '2447.9',
-    '24470',
-    '244744',
-    '244860',
-    '2448658.5',
-    '24490',
-    '24492',
-    '244a&ndash;c',
-    '244cm',
-    '244d2',
-    '244lb',
-    '245&ndash;0036',
-    '245&ndash;246',
     '245&ndash;254',
-    '245&ndash;275',
-    '245&ndash;59',
-    '245&ndash;62',
-    '245(4)',
-    '245,340',
-    '245,392',
-    '245-t',
-    '245.91',
-    '2450&ndash;3350',
-    '24500',
-    '245151',
-    '2452',
-    '2452&ndash;3659',
-    '2452.9',
-    '24520',
     '245385',
-    '2454',
-    '2456.6',
-    '245729',
-    '2458.7',
-    '245879',
-    '24592635',
-    '245a',
-    '245a-245c',
-    '245c',
-    '245cm',
-    '245f',
-    '245mm',
-    '246&ndash;1964',
-    '246&ndash;254',
-    '246&ndash;3',
     '246&ndash;9',
-    '246(4)',
-    '246-litre',
-    '246.2',
-    '246.3(1)',
-    '246.5',
-    '246.8%',
-    '246/365',
-    '2460',
-    '24600',
-    '2461',
-    '246113',
-    '246236',
-    '2463',
-    '24630',
-    '2464',
     '2464.7',
-    '2464.9',
-    '246400',
-    '246559',
-    '2466',
-    '2467.1',
-    '2467.6',
-    '246767',
-    '2468',
-    '246830',
-    '2469.0',
-    '246a',
-    '246gts',
-    '246m',
-    '246p',
-    '247&ndash;53',
     '247&ndash;54',
-    '247&ndash;8',
-    '247(1)',
-    '247,400',
-    '247-249',
-    '247-member',
-    '247.4/',
-    '247.8',
-    '2472.2',
-    '2472.6',
-    '247248',
-    '24729-31',
-    '2476.0',
-    '2476.1',
-    '2477.9',
-    '24778',
     '2478.3',
-    '2479',
-    '2479.9',
-    '24790',
-    '247904',
-    '24797-98',
-    '247d',
-    '247g&ndash;h',
-    '247jy',
-    '247p',
-    '248&ndash;51',
-    '248&ndash;6',
-    '248(2)',
-    '248(4)',
-    '248,231,030',
-    '248,700,000',
     '248,709',
-    '248,713',
-    '248.',
-    '248.43',
-    '24803',
-    '248033',
-    '248092',
-    '2481',
-    '24811',
-    '248127',
-    '248184',
-    '2482.9',
-    '24820',
-    '2483.4',
-    '2483.9',
-    '248328',
     '24833',
-    '2484.0',
-    '2486',
-    '2486.4',
-    '24860',
-    '248735',
-    '2488.4',
-    '248968',
-    '248a',
-    '248cps',
-    '248pp',
-    '249&ndash;250',
-    '249&ndash;254',
-    '249&ndash;276',
-    '249&ndash;56',
-    '249,000',
     '249-member',
-    '249.6p',
-    '2490.8',
-    '24902',
-    '2491.2',
-    '249129',
-    '2493',
-    '2493.1',
-    '2493.2',
-    '2493.6',
-    '2493.7',
-    '24950',
-    '2497.1',
-    '2497.9',
-    '2497000',
-    '24980',
     '249911',
-    '24995',
-    '249cm',
-    '24:00',
-    '24:13',
-    '24:14',
-    '24:15&ndash;24',
-    '24:17',
-    '24:19',
-    '24:2',
-    '24:23',
-    '24:24',
-    '24:34',
-    '24:38',
-    '24:46',
-    '24:46f',
     '24:49',
-    '24:6',
-    '24:7',
-    '24:8',
-    '24:9',
-    '24:diagram/figure',
-    '24a&ndash;b',
-    '24b',
-    '24bit',
-    '24cms',
-    '24d&ndash;f',
-    '24f',
-    '24ft.',
-    '24ha',
-    '24hp',
-    '24in.',
     '24ins.',
-    '24kd',
-    '24km',
-    '24kml/15smls',
-    '24kph',
-    '24mar93',
-    '24mb',
-    '24mhz',
-    '24mpg',
-    '24mth',
-    '24pt',
-    '24rd',
-    '24th&ndash;25th',
-    '24th&ndash;28th',
-    '24th&ndash;30th',
-    '24th/25th',
     '24th/26th',
-    '24x',
-    '24x1&ndash;1/2x1/2in',
-    '24x30x7&middot;5cm',
-    '25%&sol',
-    '25%-35%',
-    '25%-owned',
-    '25%1',
-    '25%very',
-    '25&cent',
-    '25&deg&rehy;75&deg',
-    '25&deg;c/ambient',
-    '25&deg;f',
-    '25&deg;s',
-    '25&frac12&ins;',
-    '25&frac12;cm',
     '25&frac12;in',
-    '25&ins&times;30&ins',
-    '25&mdash;35p',
-    '25&mdash;6',
-    '25&mdash;6.273&mdash;88',
-    '25&mdash;7',
-    '25&mdash;8',
-    '25&mgr;g',
-    '25&micro;g',
-    '25&micro;g/ml',
-    '25&micro;m',
-    '25&ndash;0',
-    '25&ndash;1.0',
-    '25&ndash;10',
-    '25&ndash;11',
-    '25&ndash;15',
     '25&ndash;19',
-    '25&ndash;20',
-    '25&ndash;21',
-    '25&ndash;210',
-    '25&ndash;23',
-    '25&ndash;24',
-    '25&ndash;25',
-    '25&ndash;25&deg;c',
-    '25&ndash;258',
-    '25&ndash;26th',
-    '25&ndash;27&deg;c',
-    '25&ndash;28&deg;s',
-    '25&ndash;30g',
-    '25&ndash;30kg',
-    '25&ndash;30min',
-    '25&ndash;30p',
     '25&ndash;30pc',
-    '25&ndash;33',
-    '25&ndash;35&deg;c',
-    '25&ndash;40',
-    '25&ndash;40-year-old',
-    '25&ndash;40g',
-    '25&ndash;44-year-olds',
-    '25&ndash;45',
-    '25&ndash;50%',
-    '25&ndash;50g/1&ndash;2oz',
-    '25&ndash;50mcg/kg',
-    '25&ndash;55',
-    '25&ndash;60%',
-    '25&ndash;68',
-    '25&ndash;69',
-    '25&ndash;7',
     '25&ndash;71',
-    '25&ndash;80khz',
-    '25&ndash;84',
-    '25&ndash;9&ndash;1897',
-    '25&ndash;95',
-    '25&ndash;july',
-    '25&ndash;o',
-    '25&ndash;year',
-    '25&times;12',
-    '25&times;30cm/10&times;12in',
-    '25\'s',
-    '25()',
-    '25(5)',
-    '25(7)',
-    '25(a)',
-    '25,000&ndash;30,000',
     '25,000&ndash;30,000k',
-    '25,000,000-30,000,000',
-    '25,000-acre',
-    '25,000-gate',
-    '25,000-km',
-    '25,000-strong',
-    '25,000-tonne',
-    '25,000-volt',
-    '25,000km',
-    '25,000t',
-    '25,058',
-    '25,113',
-    '25,118',
-    '25,145',
-    '25,146',
-    '25,158',
     '25,177',
-    '25,21,24',
-    '25,215',
-    '25,226',
-    '25,26,38,39',
-    '25,289',
-    '25,29,40',
-    '25,300',
-    '25,300,000',
-    '25,355',
-    '25,377',
-    '25,400',
-    '25,400ft',
-    '25,430',
-    '25,500,000',
-    '25,512',
     '25,527',
-    '25,571',
-    '25,572',
-    '25,600',
-    '25,600,000',
-    '25,605,579',
-    '25,627,000',
-    '25,678,059',
-    '25,700',
-    '25,718',
-    '25,749',
-    '25,766',
-    '25,771',
-    '25,837',
-    '25,894',
-    '25,993',
     '25-&mgr;m',
-    '25-11',
-    '25-12',
-    '25-125',
-    '25-15',
-    '25-16',
-    '25-2-93',
-    '25-21',
-    '25-22',
-    '25-23',
-    '25-24',
-    '25-27&deg;c',
-    '25-30%',
-    '25-30mm',
-    '25-35-year-olds',
-    '25-39',
     '25-4-48',
-    '25-40%',
-    '25-5',
-    '25-9',
-    '25-bed',
-    '25-bedroom',
-    '25-cap',
-    '25-category',
-    '25-cm',
-    '25-country',
-    '25-cover',
-    '25-date',
-    '25-foot-long',
-    '25-gallon',
-    '25-goals',
-    '25-gun',
     '25-hydroxyvitamin',
-    '25-ish',
-    '25-item',
-    '25-kilometre',
-    '25-length',
-    '25-line',
-    '25-litre',
-    '25-man',
-    '25-megawatt',
-    '25-miler',
-    '25-milers',
-    '25-ml',
-    '25-page',
-    '25-points',
-    '25-pounds',
-    '25-shilling',
     '25-stall',
-    '25-stone',
-    '25-times',
-    '25-to-50',
-    '25-ton',
-    '25-watt',
-    '25-week',
-    '25-well',
-    '25-word',
-    '25-yearold',
-    '25.0%',
-    '25.01',
-    '25.05',
-    '25.08',
-    '25.1.88',
-    '25.1/2',
     '25.10',
-    '25.10.93',
-    '25.11.91',
-    '25.13',
-    '25.17',
-    '25.1p',
-    '25.2.91',
-    '25.21',
-    '25.22e',
-    '25.23%',
-    '25.26',
-    '25.27',
-    '25.29&ndash;34',
-    '25.2kg',
-    '25.3&percnt',
-    '25.3&times;35.5',
     '25.3.93',
-    '25.33.6',
-    '25.38',
-    '25.4&times;28',
-    '25.4&times;35.6cm',
-    '25.4&times;40.6cm',
-    '25.4,14',
-    '25.4.1957',
-    '25.42',
-    '25.5&divide;2',
-    '25.51%',
-    '25.52',
-    '25.53',
-    '25.562',
-    '25.5kg',
-    '25.5mpg',
     '25.5pc',
-    '25.61in.',
-    '25.64',
-    '25.7&times;19.3',
-    '25.72',
-    '25.75',
-    '25.7pc',
-    '25.7secs',
-    '25.87sec',
-    '25.89',
-    '25.8m',
-    '25.8pc',
-    '25.9.90',
-    '25.9/47.1/37.2mpg',
-    '25.92v.',
-    '25.93r.',
     '25.9mpg',
-    '25/&frac14',
-    '25/07/89',
-    '25/1',
-    '25/1/5',
-    '25/1/6',
-    '25/2/41',
-    '25/221',
-    '25/26/',
-    '25/373',
-    '25/4',
-    '25/40',
-    '25/5/41',
-    '25/6/2',
-    '25/6/87',
-    '25/67',
     '25/7/86',
-    '25/75',
-    '25/85',
-    '25/9/87',
-    '250&amp;degreec',
-    '250&deg/22kts',
-    '250&ft',
-    '250&mdash;67',
-    '250&mgr;l',
-    '250&mgr;m',
-    '250&micro;l',
-    '250&ndash;1000',
-    '250&ndash;125',
-    '250&ndash;280pmh',
-    '250&ndash;3000x',
-    '250&ndash;350&ndash;400cc',
     '250&ndash;350ml/8&ndash;12fl',
-    '250&ndash;375g',
-    '250&ndash;400',
-    '250&ndash;500',
-    '250&ndash;500mb',
-    '250&times;4.5',
-    '250,00',
-    '250,000&ndash;350.000',
-    '250,000-tonne',
-    '250,0000',
-    '250,535',
-    '250,946',
-    '250,970',
-    '250-1',
-    '250-196',
-    '250-300',
     '250-400',
-    '250-bedded',
-    '250-bedroom',
-    '250-bp',
-    '250-fold',
-    '250-ft',
-    '250-gram',
-    '250-kilometre',
-    '250-mark',
-    '250-metre-high',
-    '250-mile-long',
-    '250-name',
-    '250-person',
-    '250-plus',
-    '250-record',
-    '250-seater',
     '250-shop',
-    '250-strong',
-    '250-year',
-    '250.2%',
-    '2500&ndash;2510',
-    '2500&ndash;2539',
-    '2500-foot',
-    '250016',
-    '2500bp',
-    '2500cc',
-    '2500km',
-    '2500m2',
-    '2500s',
-    '2501',
-    '250150',
-    '2503&ndash;7',
     '250325',
-    '2504',
-    '2504.1',
-    '250405',
-    '25040kyr',
-    '2505',
-    '250739',
-    '25080',
-    '2509&ndash;2513',
-    '25090',
-    '250=110',
-    '250bc',
-    '250cc-350cc',
-    '250cu',
-    '250gm',
-    '250gr',
     '250gto',
-    '250hz',
-    '250is',
-    '250k',
-    '250kev',
-    '250kg',
-    '250kjmol',
-    '250kms',
-    '250mbps',
-    '250mhz-300mhz',
-    '250mjy',
-    '250ml/&frac14',
-    '250ml/10oz/1&frac14',
-    '250ml/8floz',
-    '250mls',
-    '250mm&ndash;600mm',
     '250p.',
-    '250v/hr',
-    '251&ndash;253',
-    '251&ndash;3',
-    '251,134',
-    '251,568',
-    '251,865',
-    '251-bp',
-    '251-page',
-    '251.',
-    '251.202',
-    '2510',
-    '2510.4',
-    '25105-06',
-    '251050',
-    '25110',
     '2511198',
-    '251144',
-    '2512&ndash;2515',
-    '251251',
-    '2513',
-    '2513.9',
-    '251402',
-    '2515',
-    '2515.8',
-    '25156',
-    '2516',
-    '2516.13',
-    '2517.2',
-    '25190',
-    '251lb',
-    '252%',
     '252&divide;2',
-    '252&mdash;4',
-    '252&times;10/l',
-    '252\'s',
-    '252,120',
-    '252,497',
-    '252-member',
-    '252-processor',
-    '252-seat',
-    '252-tank',
-    '252.7',
-    '252/277',
-    '2520',
-    '252050',
-    '2521',
-    '2521.2',
     '25213-14',
-    '252144',
-    '2522.0',
-    '2522.4',
-    '2522.6',
-    '252235',
-    '2523.7',
-    '25237-39',
-    '2525.3',
-    '252525',
-    '252545',
-    '2526',
-    '2527',
-    '252701',
-    '252g',
-    '252p',
     '252s',
-    '253&ndash;4',
-    '253&ndash;68',
-    '253&ndash;7',
-    '253&ndash;8',
-    '253.010&plusmn;496',
-    '253.7p',
-    '253.8%',
-    '25300',
-    '25303',
-    '253030',
-    '2531',
-    '2532.6',
-    '2533',
-    '2533.1',
-    '2533.91',
     '25330',
-    '253320',
-    '2534.1',
-    '2534.3',
-    '2535',
-    '25360',
-    '25370',
-    '25372',
-    '25373',
-    '2538.2',
-    '2538.4',
-    '2538.8',
-    '2539.9',
-    '25390',
-    '253c',
-    '253pp',
     '253pp.',
-    '253r',
-    '254&frac12;p',
-    '254&ndash;255',
-    '254&ndash;4',
-    '254&ndash;5',
-    '254,078',
-    '254,389',
-    '254.254',
-    '25400',
-    '254004',
-    '2540dpi',
-    '2541',
-    '2541.0',
-    '2541.2',
-    '2541.6',
     '25412',
-    '2542',
-    '2542.3',
-    '25420',
-    '2543',
-    '25432-33',
-    '2544.9',
-    '2546',
-    '2546.5',
-    '2546.6',
-    '2546.8',
-    '25469-70',
-    '25473',
-    '25476-79',
-    '25485-86',
-    '2549',
     '2549.7',
-    '25493-96',
-    '254b4',
-    '254bn',
-    '254cm',
-    '254ff',
-    '254jy',
-    '255&frac12;p',
-    '255&plus;5',
-    '255,000,000',
-    '255,285',
-    '255,667',
-    '255,821',
-    '255-page',
-    '255.6%',
-    '255.8%',
     '255/60x16',
-    '255/85&mdash;16',
-    '2550.3',
-    '2550.7',
-    '2550.8',
-    '255000000',
-    '2550rpm',
-    '255141',
-    '2552.0',
-    '2553',
-    '2553.0',
-    '2554.3',
-    '2555',
-    '2555.9',
-    '25558',
-    '2556.8',
     '25566',
-    '2557',
-    '2557.2',
-    '2557.3',
-    '25570',
-    '2558.4',
-    '2559.7',
-    '255m',
-    '255pp',
-    '255ppm',
-    '256&ndash;257',
-    '256&ndash;64',
-    '256&ndash;70',
-    '256-byte',
-    '256-kilobit',
-    '256-level',
     '256.2bn',
-    '256.6',
-    '256.8',
-    '2560&ndash;2537',
-    '2560.0',
-    '2560.1',
-    '2560.2',
-    '2560.6',
-    '25600',
-    '256155',
-    '2562.0',
-    '2562.2',
-    '2563',
-    '2563.9',
-    '25637-38',
-    '25640',
     '2565.0',
-    '2565.4',
-    '2565.5',
-    '2566',
-    '25660',
-    '25698-99',
-    '256:289:12',
-    '256ft',
-    '256g',
-    '256gb',
-    '256h',
-    '256hz',
-    '256k.',
-    '256kbps',
-    '256mb/sec',
-    '256pp',
     '256pts',
-    '256th',
-    '257&ndash;268',
-    '257&ndash;65',
-    '257&ndash;67',
-    '257,092',
-    '257,397',
-    '25706',
-    '257077',
-    '2571',
-    '2572',
-    '2572.3',
-    '25720',
-    '257244',
-    '2574.7',
-    '2574.8',
     '2576',
-    '25786',
-    '2579',
-    '257927',
-    '257th',
-    '258&ndash;268',
-    '258&ndash;389',
-    '258&ndash;60',
-    '258&ndash;68',
-    '258&ndash;71',
-    '258(2)',
-    '258(4)',
-    '258,750,000',
-    '258-63',
-    '258.8',
-    '2580.5',
     '25810',
-    '25814',
-    '25820',
-    '2584.7',
-    '2584.8',
-    '25840',
-    '258478',
-    '25850',
-    '2586.0',
-    '25890',
-    '258b',
-    '258bc',
-    '258bn',
-    '259%',
-    '259&mdash;60',
-    '259&ndash;294',
     '259&ndash;324',
-    '259&ndash;328',
-    '259&ndash;6',
-    '259&ndash;60',
-    '259&ndash;61',
-    '259&ndash;62',
-    '259,339',
-    '259-strong',
-    '259.4',
-    '259.9',
-    '259.94',
-    '2592',
-    '2593.6',
-    '2595',
-    '2595&ndash;7999',
-    '2595/6',
     '25965',
-    '2597.13',
-    '2598',
-    '2598.4',
-    '2599',
-    '259pp.',
-    '25:1&ndash;46',
-    '25:1&ndash;7',
-    '25:10',
-    '25:12',
-    '25:17ff.',
-    '25:19&ndash;26:35',
-    '25:20&ndash;40',
-    '25:24:1',
-    '25:25',
-    '25:28',
     '25:31&ndash;34',
-    '25:33',
-    '25:4',
-    '25:5',
-    '25:5&ndash;6',
-    '25:59.96',
-    '25:5:90',
-    '25:8&ndash;34',
-    '25bhp',
-    '25bp',
-    '25cm/10&ins',
-    '25cm/10in&ndash;28cm/11in',
-    '25cm/10inches',
-    '25dvt',
-    '25f9',
-    '25ft-30ft',
     '25g/1',
-    '25g/1oz/',
-    '25gb',
-    '25gr/1oz',
-    '25hp',
-    '25in.',
-    '25ins',
-    '25khz',
-    '25kph',
-    '25kyr',
-    '25l',
-    '25lbs',
-    '25ma',
-    '25mg',
-    '25mgml',
-    '25ml/1',
     '25mm-thick',
-    '25mm-timber',
-    '25mmoldm',
-    '25ms',
-    '25nm',
-    '25not',
-    '25o-65occ',
-    '25occ',
-    '25oft',
-    '25om',
-    '25p.',
-    '25p/min',
-    '25pm',
-    '25pp',
-    '25ppm',
-    '25r',
     '25runner',
-    '25secs',
-    '25tel',
-    '25th&ndash;26th',
-    '25th&ndash;27th',
-    '25th&ndash;28th',
-    '25th-26th',
-    '25th-30th',
-    '25thies',
-    '25watt',
-    '25x20&deg',
-    '25x25x3mm',
-    '25yarder',
-    '25years',
-    '25years-old',
-    '26%-54%',
     '26&deg;s',
-    '26&frac12',
-    '26&frac12;in',
-    '26&mdash;1',
-    '26&mdash;7',
-    '26&mdash;9365',
-    '26&middot;6',
-    '26&ndash;11&ndash;0',
-    '26&ndash;12-',
-    '26&ndash;136',
-    '26&ndash;15',
-    '26&ndash;18',
-    '26&ndash;1b',
-    '26&ndash;27&deg;c',
-    '26&ndash;28&deg;c',
-    '26&ndash;30/min',
     '26&ndash;32',
-    '26&ndash;33',
-    '26&ndash;331',
-    '26&ndash;38kg',
-    '26&ndash;39',
-    '26&ndash;4',
-    '26&ndash;5',
-    '26&ndash;5&ndash;95&ndash;2',
-    '26&ndash;50%',
-    '26&ndash;53',
-    '26&ndash;59',
-    '26&ndash;61',
-    '26&ndash;62',
-    '26&ndash;65041',
-    '26&ndash;7',
-    '26&ndash;8',
     '26&ndash;9',
-    '26&ndash;december',
-    '26&ndash;end',
-    '26&ndash;year',
-    '26&percnt',
-    '26&sol;1&sol;17',
-    '26(2)',
-    '26(27)',
-    '26(3)',
-    '26(b)',
-    '26,000-acre',
-    '26,000ft',
-    '26,097',
-    '26,27,29',
-    '26,28&ndash;30',
-    '26,31,32',
     '26,310,836',
-    '26,320',
-    '26,391',
-    '26,455',
-    '26,500,000',
-    '26,513',
-    '26,549',
-    '26,600',
-    '26,618',
-    '26,698',
-    '26,708',
-    '26,838',
-    '26,870',
-    '26,885',
-    '26,987',
-    '26-',
     '26-12',
-    '26-23',
-    '26-24',
-    '26-26',
-    '26-60',
-    '26-bedroom',
-    '26-but',
-    '26-c',
-    '26-copy',
-    '26-county',
-    '26-inch',
-    '26-jan',
-    '26-m',
-    '26-man',
-    '26-member',
-    '26-million',
     '26-month',
-    '26-nation',
-    '26-nil',
-    '26-oct.',
-    '26-odd',
-    '26-page',
-    '26-part',
-    '26-person',
-    '26-point',
-    '26-room',
-    '26-seat',
-    '26-valve',
-    '26-volume',
-    '26-year-olds',
-    '26-yearold',
-    '26.02',
     '26.11.92',
-    '26.12.93',
-    '26.13',
-    '26.14',
-    '26.16',
-    '26.22',
-    '26.26p',
-    '26.2a',
-    '26.2ms',
-    '26.30',
-    '26.34',
-    '26.35',
-    '26.353',
-    '26.4kd',
-    '26.5&ndash;6',
-    '26.5&times;37',
     '26.50',
-    '26.51/10.75',
-    '26.53',
-    '26.59',
-    '26.5mpg',
-    '26.5oz',
-    '26.5p',
-    '26.6.92',
-    '26.60',
-    '26.64',
-    '26.64sec',
-    '26.65',
-    '26.6ft',
-    '26.6mpg',
-    '26.6mph',
-    '26.6pc',
     '26.7&deg;s',
-    '26.70',
-    '26.71',
-    '26.73',
-    '26.77',
-    '26.7p',
-    '26.7pc',
-    '26.92p',
-    '26.97mph',
-    '26.99',
-    '26.9mph',
-    '26/&frac14',
-    '26/0',
-    '26/10/76',
-    '26/10/93/cde',
-    '26/100,000',
     '26/11/45',
-    '26/2/41',
-    '26/27th',
-    '26/28',
-    '26/296',
-    '26/3/77',
-    '26/30',
-    '26/4/86',
-    '26/4/89',
-    '26/44',
-    '26/5/91',
-    '26/9/90',
-    '260&deg/15',
-    '260&deg;cmyr',
-    '260&divide;2',
-    '260&ndash;2300',
     '260&ndash;390',
-    '260&ndash;520',
-    '260&ndash;9700',
-    '260,268',
-    '260-bp',
-    '260-member',
-    '260-pupil',
-    '260-yard',
-    '2600+',
-    '2600.5',
-    '2600/minute',
-    '26005',
-    '26007',
-    '2600lb',
-    '2600m',
-    '26015',
     '26019',
-    '2602',
-    '26020',
-    '260206',
-    '26022',
-    '26023',
-    '26027',
-    '260284',
-    '2603.7',
-    '26043',
-    '2605.63',
-    '26050',
-    '26060',
-    '26062',
-    '2607',
-    '26080',
     '260e',
-    '260e&ndash;f',
-    '260ff.',
-    '260ft',
-    '260mhz',
-    '260s',
-    '260tc',
-    '260x270cm',
-    '261&ndash;2',
-    '261&ndash;82',
-    '261-member',
-    '261.53',
-    '261.6',
-    '261.88',
-    '261.9%',
-    '2610',
     '261004',
-    '2610381',
-    '26107266',
-    '26110',
-    '26120',
-    '261228',
-    '261275',
-    '26131-32',
-    '2614',
-    '2614.1',
-    '2615.7',
-    '2616033',
-    '2617.0',
-    '2618',
-    '2619093',
-    '2619mm',
     '261b',
-    '261lb',
-    '261mm',
-    '262%',
-    '262&ndash;174',
-    '262&ndash;4',
-    '262&ndash;71',
-    '262-6',
-    '262.5%',
-    '2620',
-    '26209-10',
-    '2621',
-    '2621.2',
-    '26222',
-    '262305',
-    '2624',
     '262422',
-    '262433',
-    '2625',
-    '2626',
-    '262664',
-    '262739',
-    '262844',
-    '262941',
-    '262pp.',
-    '263&ndash;4',
-    '263,096',
-    '263,400',
-    '263-11',
-    '263-bedroom',
-    '263-strong',
-    '263/1326',
     '2630',
-    '26301-04',
-    '26341-42',
-    '2635.4',
-    '26350',
-    '2636',
-    '2636.1',
-    '263749',
-    '2638.6',
-    '2639',
-    '26390',
-    '264&ndash;265',
-    '264&ndash;283',
-    '264&ndash;5',
-    '264&ndash;69',
-    '264&ndash;92',
     '264(1)',
-    '264,000',
-    '264,154',
-    '264,200',
-    '264,500',
-    '264.1',
-    '2640.2',
-    '264083',
-    '26409-10',
-    '2640m',
-    '26410',
-    '264102',
-    '2643',
-    '2644',
-    '264491',
-    '2645.7',
     '2645.8',
-    '26458',
-    '2646',
-    '26480',
-    '26486-97',
-    '26496-97',
-    '264e&ndash;f',
-    '264kgs',
-    '264mb',
-    '264p',
-    '264pp.',
-    '265&ndash;6',
-    '265&ndash;66',
-    '265,763',
-    '265.2p',
-    '26512',
     '265200',
-    '2653',
-    '2654',
-    '2654.1',
-    '265511',
-    '2655970',
-    '2656',
-    '26572',
-    '2658',
-    '2658.1',
-    '26585-86',
-    '265858',
-    '2659',
-    '2659.8',
-    '265a&ndash;b',
-    '265f&ndash;g',
     '265g/kwhr.',
-    '265k',
-    '265lbs',
-    '265th',
-    '266%',
-    '266&ndash;71',
-    '266&sol;85',
-    '266(2)',
-    '266(3)',
-    '266,090',
-    '266,098',
-    '266,728',
-    '266-6',
-    '266.7%',
-    '2660',
-    '26601',
     '2660m',
-    '2661',
-    '266172',
-    '2662.2',
-    '266266',
-    '2663',
-    '26630',
-    '2664',
-    '2664.64',
-    '2665',
-    '26650',
-    '266561',
-    '2666',
-    '266657',
-    '26668',
-    '26670',
     '2668.5',
-    '26688',
-    '2669',
-    '2669.7',
-    '266g',
-    '266m',
-    '266mbps',
-    '267(1)',
-    '267(2)',
-    '267,000',
-    '267,339',
-    '267.15',
-    '26709-10',
-    '267284',
-    '26733-36',
-    '26755',
     '2676',
-    '26762',
-    '2677',
-    '26770',
-    '2678',
-    '26781',
-    '2679.6',
-    '267m-flops',
-    '267mbps',
-    '267pp',
-    '268%',
-    '268&ndash;83',
-    '268&ndash;92',
-    '268,720',
-    '268.5',
-    '2680.',
     '2680.9',
-    '268027',
-    '2681.9',
-    '26810',
-    '2682',
-    '26820',
-    '26840',
-    '26850',
-    '26850-51',
-    '268621',
-    '2687&ndash;2688',
-    '268g',
-    '268s',
-    '269&ndash;273',
-    '269&ndash;70',
-    '269&ndash;74',
     '269(b)',
-    '269,000',
-    '269,300',
-    '269028',
-    '2692',
-    '26930',
-    '269318',
-    '2694.2',
-    '2695.4',
-    '26953390',
-    '2697.6',
-    '26973-75',
-    '2698.7',
-    '26989-91',
-    '26:1&ndash;37',
-    '26:1&ndash;4',
     '26:1&ndash;5',
-    '26:16',
-    '26:17&ndash;19',
-    '26:17ff',
-    '26:20&ndash;25',
-    '26:23',
-    '26:26',
-    '26:28',
-    '26:29',
-    '26:30',
-    '26:30&ndash;5',
-    '26:31',
-    '26:36&ndash;46',
-    '26:47&ndash;56',
-    '26:56',
-    '26:57',
     '26:57&ndash;68',
-    '26:59',
-    '26:6&ndash;13',
-    '26:60&ndash;61',
-    '26:64',
-    '26:67&ndash;68',
-    '26:69&ndash;75',
-    '26:9',
-    '26:diagram/figure',
-    '26b-31',
-    '26bx',
-    '26c',
-    '26er',
-    '26gb',
-    '26hp',
-    '26hp/tonne',
     '26kgm',
-    '26lbs',
-    '26m56s',
-    '26mph',
-    '26o',
-    '26pp',
-    '26pt',
-    '26sl',
-    '26tel',
-    '26th&ndash;29th',
-    '26th-27th',
-    '26th-29th',
-    '26th-minute',
-    '27&deg;s',
-    '27&dollar;c',
-    '27&mdash;28',
     '27&mdash;8',
-    '27&mdash;9',
-    '27&ndash;04',
-    '27&ndash;10&ndash;1851',
-    '27&ndash;11',
-    '27&ndash;15',
-    '27&ndash;15&ndash;0&ndash;30',
-    '27&ndash;15p',
-    '27&ndash;189',
-    '27&ndash;23',
-    '27&ndash;246',
-    '27&ndash;25',
-    '27&ndash;28th',
-    '27&ndash;29&deg;c',
-    '27&ndash;29/5/41',
-    '27&ndash;3',
     '27&ndash;32',
-    '27&ndash;36',
-    '27&ndash;37',
-    '27&ndash;38',
-    '27&ndash;4',
-    '27&ndash;40',
-    '27&ndash;410',
-    '27&ndash;42',
-    '27&ndash;43',
-    '27&ndash;45',
-    '27&ndash;46',
-    '27&ndash;5',
-    '27&ndash;60%',
-    '27&ndash;61',
-    '27&ndash;67',
-    '27&ndash;7&ndash;71&ndash;0',
     '27&ndash;78',
-    '27&shilling;6d',
-    '27\'s',
-    '27(9)',
-    '27(a)',
-    '27(c)',
-    '27(d)',
-    '27(e)',
-    '27,000&ndash;15000',
-    '27,000-square-foot',
-    '27,000-strong',
-    '27,000-ton',
-    '27,000sq',
-    '27,044',
-    '27,062',
-    '27,100',
     '27,182,500',
-    '27,1991',
-    '27,200',
-    '27,219',
-    '27,234',
-    '27,244.6',
-    '27,28,33',
-    '27,310',
-    '27,34',
-    '27,35,40',
-    '27,393',
-    '27,398',
-    '27,400',
-    '27,41',
-    '27,43',
-    '27,440',
     '27,449',
-    '27,473',
-    '27,480',
-    '27,500,000',
-    '27,500rev/min',
-    '27,594',
-    '27,600',
-    '27,637',
-    '27,672',
-    '27,700',
-    '27,700,000',
-    '27,752',
-    '27,758',
-    '27,777',
-    '27,797',
-    '27,837',
     '27,86.3',
-    '27,861',
-    '27,900',
-    '27,975,000',
-    '27-12',
-    '27-13',
-    '27-15',
-    '27-17',
-    '27-20',
-    '27-35sec',
-    '27-august',
-    '27-day',
-    '27-degree',
-    '27-fold',
-    '27-footer',
-    '27-ft',
     '27-goal',
-    '27-hour',
-    '27-kilometre',
-    '27-match',
-    '27-metre',
-    '27-point',
-    '27-run',
-    '27-sept.',
-    '27-share',
-    '27-storey',
-    '27-strong',
-    '27-tonne',
-    '27-tournament',
-    '27-yearold',
-    '27.0%',
-    '27.0mpg',
     '27.1&ndash;2',
-    '27.10',
-    '27.10.90',
-    '27.128',
-    '27.13&ndash;19',
-    '27.14',
-    '27.2.87',
-    '27.25',
-    '27.27',
-    '27.28',
-    '27.28&ndash;9',
-    '27.3&times;20.3',
-    '27.3.1991',
-    '27.3.91',
-    '27.33',
-    '27.34',
     '27.37%',
-    '27.39&ndash;40',
-    '27.3p',
-    '27.3secs',
-    '27.4.90',
-    '27.4.93',
-    '27.40',
-    '27.4kg',
-    '27.5&deg;n',
-    '27.5&ins',
-    '27.5.91',
-    '27.5.92',
-    '27.50',
-    '27.5m',
-    '27.5myr',
-    '27.6.90',
     '27.61',
-    '27.65',
-    '27.68',
-    '27.69',
-    '27.6mpg',
-    '27.6pc',
-    '27.7-mile',
-    '27.7.80',
-    '27.74',
-    '27.76',
-    '27.77',
-    '27.789',
-    '27.8.81',
-    '27.86m',
-    '27.87',
-    '27.88',
     '27.8p',
-    '27.96',
-    '27.96v.',
-    '27.97r.',
-    '27.98r.',
-    '27.9f',
-    '27.9mpg',
-    '27.9pc',
-    '27/0',
-    '27/10/87',
-    '27/32',
-    '27/37',
-    '27/4/41',
-    '27/43',
-    '27/605',
-    '27/64',
     '27/8/93',
-    '27/80',
-    '27/87',
-    '270%',
-    '270&mdash;2',
-    '270&ndash;1',
-    '270&ndash;2',
-    '270&ndash;240',
-    '270&ndash;6',
-    '270&ndash;81',
-    '270&ndash;83',
-    '270-bedroom',
-    '270.',
-    '270/202',
-    '270/454',
-    '2700&ndash;1300',
     '2700.6',
-    '270000',
-    '2700031',
-    '27001',
-    '27006',
-    '2701.9',
-    '270170',
-    '27019',
-    '2702',
-    '2703.6',
-    '27033-35',
-    '2704',
-    '2704.0',
-    '2704.5',
-    '2704.6',
-    '27043',
     '27050',
-    '27053-54',
-    '2706',
-    '27068',
-    '2707.6',
-    '27075',
-    '2708',
-    '270860',
-    '27090',
-    '270gb',
-    '270gb.',
-    '270k',
-    '270m',
-    '270mb',
-    '270ml',
-    '270mph',
     '270s',
-    '271%',
-    '271&ndash;6',
-    '271&ndash;767',
-    '271&ndash;87',
-    '271&plus;5',
-    '271(1)',
-    '271(2)',
-    '271,759',
-    '271-minute',
-    '271.',
-    '271/8',
-    '271034',
-    '2711.9',
-    '27120',
-    '271233',
     '271293',
-    '2712ft',
-    '2713.4',
-    '27130',
-    '27131',
-    '2714',
-    '2714.6',
-    '2716.2',
-    '271672',
-    '2717.9',
-    '2718',
-    '2719.7',
-    '271:156',
-    '271a&ndash;b',
-    '271b&ndash;d',
-    '271pp.',
     '272&ndash;3',
-    '272&ndash;4',
-    '272&ndash;6',
-    '272(1)',
-    '272,817',
-    '272.58',
-    '2720.5',
-    '27203',
-    '2721.8',
-    '272131',
-    '2722',
-    '2722.9',
-    '272200',
-    '2723436',
-    '2725.6',
-    '2726',
     '2726.4',
-    '27262',
-    '27265',
-    '272671',
-    '27269',
-    '272726',
-    '27287',
-    '272894',
-    '2729',
-    '272a',
-    '272ff',
-    '273&deg;c',
-    '273&ndash;274',
-    '273&ndash;80',
-    '273,000,000',
-    '273-ton',
     '273.05&deg;c',
-    '273.15',
-    '273.16',
-    '273.16&deg;c',
-    '273.68-point',
-    '27301',
-    '273140',
-    '273223',
-    '2733',
-    '27330',
-    '273330',
-    '2733ft',
-    '2734',
-    '27346',
-    '2736&ndash;4151',
-    '2737.6',
     '27380',
-    '273a',
-    '273a&ndash;275b',
-    '273ev',
-    '273ff',
-    '273k',
-    '274&ndash;279',
-    '274&ndash;6',
-    '274&ndash;7',
-    '274&ndash;89',
-    '274,000',
-    '274,500',
-    '274,914',
-    '274-room',
-    '2740.3',
-    '27403',
     '2741',
-    '2742',
-    '274284',
-    '2743',
-    '27430',
-    '2744',
-    '2745',
-    '2745.2',
-    '2748.7',
-    '27487',
-    '27487-88',
-    '274g',
-    '274pp.',
-    '275&deg;f/gas',
-    '275&mgr;molmol',
-    '275&ndash;276',
     '275&ndash;4475',
-    '275(3)',
-    '275,000,000',
-    '275,350',
-    '275,500',
-    '275-30',
-    '275-i/iii',
-    '275-kph',
-    '275-yard',
-    '2750.7',
-    '27500',
-    '2750m',
-    '2750rpm',
-    '2752.13',
-    '27535',
-    '27541-43',
     '2756',
-    '2757.9',
-    '27580',
-    '2759.2',
-    '27590',
-    '27595',
-    '275ff.',
-    '275kg',
-    '275lb',
-    '275mcg',
-    '275th',
-    '276&ndash;277',
-    '276&ndash;324',
-    '276&ndash;5',
-    '276,921',
-    '276-113',
     '276-156',
-    '276-member',
-    '276-year-old',
-    '276.33',
-    '276.3mph',
-    '276/5',
-    '2760',
-    '276122',
-    '2762',
-    '27620',
-    '2763.1',
-    '2764.5',
-    '2764.9',
-    '27640',
-    '27660',
-    '2769&mdash;70',
     '2769.9',
-    '276mm',
-    '276pp.',
-    '277&ndash;279',
-    '277&ndash;87',
-    '277-6',
-    '277.',
-    '277.6',
-    '277/6',
-    '2770',
-    '2770rpm',
-    '2771.9',
-    '2773',
-    '2773.3',
-    '2773920',
-    '27741-43',
     '27747',
-    '27750',
-    '2777',
-    '277b&ndash;f',
-    '277h',
-    '277p',
-    '278%',
-    '278&middot;5',
-    '278&ndash;279',
-    '278&ndash;84',
-    '278&ndash;88',
-    '278-9',
-    '278-day',
-    '278.5',
-    '2780',
-    '27800',
     '2781.2',
-    '2783',
-    '27830',
-    '27835-36',
-    '278371',
-    '2784',
-    '2784168',
-    '27853',
-    '2786',
-    '2786.8',
-    '27860',
-    '27870',
-    '278802',
-    '2789.7',
-    '278b',
-    '278c&ndash;d',
     '278p',
-    '278th',
-    '279&ndash;2',
-    '279&ndash;7514',
-    '279&ndash;80',
-    '279&ndash;94',
-    '279(1)',
-    '279(2)',
-    '279-2',
-    '2790',
-    '2790/2791',
-    '27900',
-    '2791',
-    '2791.9',
-    '2792.0',
-    '27920',
     '27930',
-    '279300',
-    '27933',
-    '279484',
-    '2795',
-    '2796.5',
-    '2797',
-    '2797.3',
-    '2798',
-    '27980',
-    '279p',
-    '27:08',
-    '27:1',
-    '27:1&ndash;19',
-    '27:1&ndash;26',
-    '27:16',
     '27:24',
-    '27:27&ndash;31',
-    '27:32',
-    '27:33&ndash;44',
-    '27:3:1',
-    '27:45&ndash;54',
-    '27:46',
-    '27:50',
-    '27:51&ndash;53',
-    '27:51.76',
-    '27:54',
-    '27:55&ndash;56',
-    '27:57',
-    '27:57&ndash;61',
-    '27:6',
-    '27:66',
     '27:8',
-    '27bc',
-    '27cm',
-    '27cms',
-    '27g',
-    '27g/4005',
-    '27in',
-    '27ins',
-    '27iraqi',
-    '27k',
-    '27kda',
-    '27l',
-    '27lbs',
-    '27m/90ft',
-    '27mpg',
-    '27mph',
     '27p-per-week',
-    '27strong',
-    '27th&ndash;29th',
-    '27th-29th',
-    '27th-30th',
-    '27th-minute',
-    '27th/28th',
-    '27the',
-    '27year',
-    '28%of',
-    '28&deg;s',
-    '28&frac58',
-    '28&mdash;29',
-    '28&mdash;30',
-    '28&mdash;36',
-    '28&ndash;11',
     '28&ndash;16',
-    '28&ndash;16&ndash;1&ndash;33',
-    '28&ndash;17',
-    '28&ndash;19',
-    '28&ndash;2&ndash;1&ndash;5',
-    '28&ndash;26b&ndash;1zq',
-    '28&ndash;3',
-    '28&ndash;3&ndash;0',
-    '28&ndash;30f',
-    '28&ndash;36',
-    '28&ndash;38',
-    '28&ndash;3o',
-    '28&ndash;40%',
-    '28&ndash;40ft',
-    '28&ndash;6',
-    '28&ndash;63',
     '28&ndash;64',
-    '28&ndash;65',
-    '28&ndash;7&ndash;1845',
-    '28&ndash;72',
-    '28&ndash;78',
-    '28&ndash;8&ndash;1866',
-    '28&ndash;80',
-    '28&ndash;82',
-    '28&ndash;9&ndash;0&ndash;18',
-    '28&ndash;91',
-    '28&ndash;thu',
-    '28&shilling;4d',
-    '28&times;42&ins',
-    '28(4)',
-    '28(a)',
-    '28(f)',
     '28,000&ft',
-    '28,000-plus',
-    '28,000-seat',
-    '28,000-strong',
-    '28,097',
-    '28,100',
-    '28,12',
-    '28,150',
-    '28,201,743',
-    '28,32&ndash;34',
-    '28,345',
-    '28,350',
-    '28,355',
-    '28,429',
-    '28,545',
-    '28,600,000',
     '28,648',
-    '28,683',
-    '28,722',
-    '28,750',
-    '28,788',
-    '28,794',
-    '28,877',
-    '28,910',
-    '28,935',
-    '28,970',
-    '28-',
-    '28-.9',
-    '28-11',
-    '28-12',
-    '28-22',
-    '28-3',
     '28-38',
-    '28-61',
-    '28-april',
-    '28-bedroom',
-    '28-country',
-    '28-days-old',
-    '28-dec.',
-    '28-inch',
-    '28-mar',
-    '28-march',
-    '28-mers',
-    '28-mile',
-    '28-month',
-    '28-page',
-    '28-part',
-    '28-person',
     '28-point',
-    '28-seat',
-    '28-sept.',
-    '28-step',
-    '28-stone',
-    '28-ton',
-    '28-tonne',
-    '28-track',
-    '28-turns',
-    '28-under-par',
-    '28-volt',
-    '28.01',
-    '28.01%',
-    '28.01.92',
-    '28.02m',
-    '28.047',
     '28.1.86',
-    '28.10&ndash;22',
-    '28.10.91',
-    '28.11.90',
-    '28.16',
-    '28.23',
-    '28.24',
-    '28.265',
-    '28.3%',
-    '28.33sec',
-    '28.34p',
-    '28.36',
-    '28.3pc',
-    '28.3secs',
-    '28.4.76',
-    '28.4.77',
     '28.4.92',
-    '28.4m',
-    '28.4mpg',
-    '28.5&deg;c',
-    '28.5.1966',
-    '28.53',
-    '28.53m',
-    '28.556',
-    '28.5cm',
-    '28.5ff',
-    '28.5kd',
-    '28.66%',
-    '28.67',
-    '28.6p',
-    '28.75',
-    '28.8%',
     '28.8.89',
-    '28.85',
-    '28.9&deg;c/84&deg;f',
-    '28.9.1992',
-    '28.92',
-    '28.9mph/1000rpm',
-    '28/',
-    '28/11/92',
-    '28/12/92',
-    '28/2/',
-    '28/3/41',
-    '28/3/87',
-    '28/300',
-    '28/4/1987',
-    '28/4/41',
-    '28/422',
     '28/6/91',
-    '28/67',
-    '28/84',
-    '28/9',
-    '28/april',
-    '280&deg;c',
-    '280&deg;f',
-    '280&mdash',
-    '280&mdash;337',
-    '280&ndash;1',
-    '280&ndash;150',
-    '280&ndash;2',
-    '280&ndash;270',
-    '280&ndash;275',
-    '280&ndash;281',
-    '280&ndash;300kg',
     '280&ndash;308',
-    '280&ndash;320',
-    '280&ndash;93',
-    '280(1)',
-    '280,600',
-    '280-acre',
-    '280-hp',
-    '280.4%',
-    '280.9p',
-    '280/290',
-    '280/l',
-    '2800.0',
-    '28007',
-    '2801a',
-    '28020',
-    '28040',
     '28047-48',
-    '280613',
-    '2807.2',
-    '2807.7',
-    '28080',
-    '28087',
-    '2808844',
-    '2809.5',
-    '280f',
-    '280g/10oz',
-    '280gm',
-    '280k',
-    '280nm',
-    '280ppt',
-    '280sq',
-    '280th',
     '281&ndash;2',
-    '281&ndash;358',
-    '281&ndash;377',
-    '281&plus;3',
-    '281,285',
-    '281,500',
-    '281-5',
-    '28102-03',
-    '28106',
-    '2810ft',
-    '2811/8014',
-    '28110',
-    '281130',
-    '2812',
-    '2812.5',
-    '2812.6',
     '2812.9',
-    '28120',
-    '2813',
-    '2813.1',
-    '2814',
-    '2814.0',
-    '2814.1',
-    '281544',
-    '2816.2',
-    '2816.5',
-    '2816.8',
-    '2816.9',
-    '28160',
-    '281660',
-    '2817',
-    '2817.0',
     '2818.00',
-    '28180',
-    '28184',
-    '2819.70',
-    '281953',
-    '281b/square',
-    '281m',
-    '281pp',
-    '282&deg',
-    '282&ndash;1406',
-    '282&ndash;286',
-    '282&ndash;327',
-    '282(3)',
-    '282,755',
-    '282.',
-    '2820.1',
     '28202',
-    '2821',
-    '2821.8',
-    '282101',
-    '2822.10',
-    '2822.3',
-    '28221',
-    '282250',
-    '2823.90',
-    '282387',
-    '282394',
-    '2824.4',
-    '2825',
-    '2825.5',
-    '2826.6',
-    '28260',
     '28264-66',
-    '28270',
-    '2828',
-    '2828.7',
-    '2828.9',
-    '2829',
-    '2829.8',
-    '2829.9',
-    '28296',
-    '28298',
-    '282a&ndash;285d',
-    '282p',
-    '283&ndash;4',
-    '283&ndash;9',
-    '283,220',
-    '283-page',
     '283-shop',
-    '283.',
-    '2830.0',
-    '2830.9',
-    '28301',
-    '2831.3',
-    '2831.7',
-    '28310',
-    '283133',
-    '2832.3',
-    '2832.50',
-    '2833.0',
-    '2833.6',
-    '28330',
-    '2834.3',
-    '283400',
     '28343',
-    '2835.7',
-    '2836.1',
-    '2836.3',
-    '2837.1',
-    '2837.5',
-    '28371',
-    '2838',
-    '2838.3',
-    '2838.5',
-    '2838.8',
-    '2839',
-    '2839.7',
-    '283b&ndash;c',
-    '283gb',
-    '283lb.',
     '283p',
-    '284&ndash;303',
-    '284&ndash;305',
-    '284&ndash;5,318&ndash;19',
-    '284&ndash;91',
-    '284(1)-(3)',
-    '284(4)',
-    '284,000',
-    '2840',
-    '2840.0',
-    '2842.0',
-    '2842.1',
-    '2842.9',
-    '2842/2281',
-    '28420',
-    '2843',
     '2843.2',
-    '2843.3',
-    '2843.8',
-    '2843.9900',
-    '2844.20',
-    '2844.4',
-    '2844.8',
-    '2844186',
-    '2845.3',
-    '2846.8',
-    '28462',
-    '2847.0',
-    '2847.3',
-    '2848.1',
-    '2848.3',
-    '28482',
     '28485-86',
-    '28489',
-    '2849.20',
-    '2849.3',
-    '28497-98',
-    '28498',
-    '28499',
-    '28499-500',
-    '284ff.',
-    '284g&ndash;h',
-    '285&ndash;265bc',
-    '285&ndash;9',
-    '285&times;10/l',
-    '285(1)',
-    '285(2)',
-    '285(3)',
     '285,000-member',
-    '285,462',
-    '285,659,000',
-    '285,700,000',
-    '285,700-strong',
-    '285.77',
-    '28500',
-    '2851562',
-    '2852.8',
-    '2852.9',
-    '28520',
-    '285210',
-    '28533-38',
-    '2855.3',
-    '2856.1',
-    '28565',
     '2857.7',
-    '28570',
-    '28576',
-    '2858.1',
-    '2858.10',
-    '285e&ndash;f',
-    '285g',
-    '285mhz',
-    '285ml',
-    '286&ndash;120',
-    '286&ndash;12mhz',
-    '286&ndash;1722',
-    '286&ndash;2',
-    '286&ndash;20mhz',
-    '286&ndash;90',
-    '286&ndash;91',
     '286(1)',
-    '286(3)',
-    '286-xt',
-    '286.2',
-    '286.269mph',
-    '286/386/486',
-    '286/40',
-    '2860',
-    '2860.6',
-    '2861.0',
-    '2861.1',
-    '2861.5',
-    '2861.8',
-    '2862.3',
-    '2862.9',
-    '28620',
     '28629-30',
-    '2863.0',
-    '2863.9',
-    '2863860',
-    '2866.9',
-    '28660',
-    '28663',
-    '2867',
-    '28670',
-    '286876',
-    '2869.6',
-    '2869.9',
-    '286bp',
-    '286cm',
-    '286e&ndash;f',
-    '286hp',
     '286p',
-    '287%',
-    '287&ndash;212',
-    '287&ndash;288',
-    '287&ndash;361',
-    '287&ndash;9',
-    '287&ndash;98',
-    '287(3)',
-    '287,876',
-    '2870',
-    '2870.0',
-    '28700',
-    '2871.7',
-    '28710',
-    '28722',
-    '287224',
     '2873.8',
-    '28737',
-    '28742',
-    '28743',
-    '2875.7',
-    '2876',
-    '2878.4',
-    '2878.7',
-    '28780',
-    '2879',
-    '2879.7',
-    '28793-97',
-    '287b',
-    '287e',
-    '287g',
-    '287k',
     '287m',
-    '287pp',
-    '287th',
-    '288&ndash;9',
-    '288(3)',
-    '288(4)',
-    '288,600,000',
-    '288.0',
-    '288.44',
-    '2880',
-    '288031',
-    '28808',
-    '2881.10',
-    '2882.3',
-    '2882.6',
-    '2883.0',
     '28840',
-    '2885',
-    '2885.6',
-    '2886.0',
-    '28861-62',
-    '2887.40',
-    '28870',
-    '2888.80',
-    '28888',
-    '2889.9',
-    '288ff',
-    '288gto',
-    '288mw',
-    '289&mdash;291',
-    '289&mdash;90',
-    '289&ndash;311',
     '289&ndash;315',
-    '289&ndash;92',
-    '289(5)',
-    '289,343',
-    '289-261',
-    '289.3',
-    '289.5%',
-    '289.6%',
-    '289000',
-    '28907-08',
-    '28910',
-    '289115',
-    '28913',
-    '28917',
-    '28917-18',
-    '28918',
     '2892',
-    '28922',
-    '28931',
-    '2894.7',
-    '289404',
-    '28950',
-    '28960',
-    '2897.0',
-    '28970',
-    '289978',
-    '289cu',
-    '28:1',
-    '28:11&ndash;15',
-    '28:16&ndash;31',
-    '28:17',
-    '28:20',
     '28:23',
-    '28:25&ndash;28',
-    '28:31',
-    '28:33&ndash;34',
-    '28:3f.',
-    '28:7',
-    '28:7,8',
-    '28b.',
-    '28bout',
-    '28c&ndash;1',
-    '28c(e)',
-    '28c-31',
-    '28ff',
-    '28k',
-    '28kb',
-    '28mb',
     '28o',
-    '28oz',
-    '28pp',
-    '28s-',
-    '28s.',
-    '28s.6d.',
-    '28tel',
-    '28th-30th',
-    '28th-minute',
-    '28th.',
-    '28th/29th',
-    '28x45.5cm',
-    '29&deg',
-    '29&formula;kg',
-    '29&frac12;ins',
-    '29&mdash;33',
     '29&mdash;see',
-    '29&middot;3',
-    '29&ndash;10',
-    '29&ndash;15',
-    '29&ndash;19&ndash;2&ndash;40',
-    '29&ndash;19&ndash;3&ndash;41',
-    '29&ndash;1982',
-    '29&ndash;20',
-    '29&ndash;24&ndash;1&ndash;49',
-    '29&ndash;3&ndash;0',
-    '29&ndash;3&ndash;1883',
-    '29&ndash;30&deg;c',
-    '29&ndash;34',
-    '29&ndash;35',
-    '29&ndash;38',
-    '29&ndash;49ft',
     '29&ndash;67',
-    '29&ndash;67%',
-    '29&ndash;68',
-    '29&ndash;74%',
-    '29&ndash;75.9',
-    '29&ndash;87',
-    '29&ndash;april',
-    '29&percnt',
-    '29&rehy;year-old',
-    '29(5)',
-    '29(6)',
-    '29(a)',
-    '29(d)',
-    '29,000-30,000-odd',
-    '29,000tyr',
-    '29,000votes',
     '29,021',
-    '29,028-ft',
-    '29,028ft',
-    '29,040',
-    '29,058',
-    '29,059',
-    '29,100',
-    '29,100,000',
-    '29,1917',
-    '29,1941',
-    '29,224',
-    '29,370',
-    '29,431',
-    '29,476',
-    '29,500,000',
-    '29,562',
     '29,594',
-    '29,600',
-    '29,617',
-    '29,676',
-    '29,800',
-    '29,804',
-    '29,819',
-    '29,822',
-    '29,843',
-    '29,855',
-    '29,900,000',
-    '29,972',
-    '29-0',
-    '29-1',
-    '29-16',
-    '29-17',
     '29-27',
-    '29-3',
-    '29-39',
-    '29-6',
-    '29-aug.',
-    '29-bedroom',
-    '29-country',
-    '29-feb-1999',
-    '29-footer',
-    '29-june',
-    '29-key',
-    '29-m',
-    '29-month',
-    '29-nation',
-    '29-nov.1',
-    '29-page',
     '29-race',
-    '29-room',
-    '29-seat',
-    '29-sept.',
-    '29-stone',
-    '29-strong',
-    '29-times',
-    '29-wellingborough',
-    '29-year-olds',
-    '29.0&amp;percent',
-    '29.00',
-    '29.03',
-    '29.04',
-    '29.06',
-    '29.07',
-    '29.09',
     '29.1%',
-    '29.1.82',
-    '29.1.92',
-    '29.12',
-    '29.12.92',
-    '29.12.927',
-    '29.13',
-    '29.14%',
-    '29.16',
-    '29.1pc',
-    '29.2.12',
-    '29.20&ndash;21',
-    '29.21',
-    '29.213.6gm',
-    '29.27',
-    '29.2kda',
     '29.3.93',
-    '29.32',
-    '29.32%',
-    '29.36',
-    '29.36s',
-    '29.4.1987',
-    '29.4.91',
-    '29.40',
-    '29.44',
-    '29.5&aring',
-    '29.5&deg',
-    '29.5&deg;c',
-    '29.5-point',
-    '29.51',
-    '29.56%',
-    '29.58',
     '29.5gb',
-    '29.5mm',
-    '29.5p',
-    '29.6-day',
-    '29.64',
-    '29.65',
-    '29.710',
-    '29.73',
-    '29.7cm',
-    '29.7mhz',
-    '29.8.77',
-    '29.8.89',
-    '29.8.90',
-    '29.85',
-    '29.9.1922',
-    '29.9.92',
     '29.92',
-    '29.93%',
-    '29.95',
-    '29.99',
-    '29.9mph',
-    '29/10/1(f)',
-    '29/102',
-    '29/25&ndash;1',
-    '29/3/41',
-    '29/3/93',
-    '29/31',
-    '29/38',
-    '29/39',
-    '29/4/41',
-    '29/42',
-    '29/5/87',
     '29/607',
-    '29/74',
-    '29/92',
-    '29/a/90/8',
-    '290&deg;c',
-    '290&ndash;270',
-    '290&ndash;296',
-    '290(1)',
-    '290(3)',
-    '290(4)',
-    '290(5)',
-    '290,435',
-    '290-page',
-    '290.000,00',
-    '290.4&ndash;521.8',
-    '290/20',
     '2900.0',
-    '2900.1',
-    '2900.21',
-    '2900.7',
-    '29000-based',
-    '29000000',
-    '29000s',
+)
+
+blocks_94 = (
+    ' \'2,569ft#"70$#2.3$!3$!9#"80%".5%"kg$!1#$93ft$%4,606$%8,500#"kb"&600-km&(year-old',
+    '%#rpm$#1.0$%4,000&#100$!6%$,429&#602$!9#$10.6$%2,000$%5,508#$21.2$$5.61$!6$#7ft',
+    '#$31ft$!2$!4$!8$!9%$,000#$40.2%"ft$%1,152&#900$%7,000&#300$!9#&52,000$#4ft',
+    '$$6.78##60m$!4$%5,000$%7,000$!8#"70$!1$!2$!3%$,864$!5$%7,764#&81,000$!2',
+    '%$,877$!5$!6$$7.93#"90$$1.13$$5.61"(700-seat%!m$!1$%7,477#&13,442%#.72$!4$%5,000',
+    '$!8$%9,757#"20$!1$!5$!8#"31%#.23$!2$!5$$6.77$#7.8$!8%#.09$!9',
+    '%$,000$!4$!5$!6%".7$!9#%50rpm$$3.20$$4.11$!5$$6.12&"39%"ft$!9%#.84',
+    '$$4.44$%5,000$!6$!9#%70&ft$$1.09$$2.80$$3.56$"5%$$6.86$!7$!8#%81.44$$2.30$!4',
+    '&"52$$6.65$!9#%91.41$%4,000$!6$!8"\'800-man\'%ember%#kgm%$revs$!7%$,000$$9.58#"10',
+    '$!2%".2$#4.0$!6$#7.0$#8.0&"60$%9,200#$20ft$)2ft/8603m$!5$$6.21$!8%".7#&30,000',
+    '$-3&ndash;3,427%(-hectare$!5%$,073$$6.57$!8%".3#"40%".0$#3.0$$4.04$!6#$51.0$!3$!5',
+    '$%9,000#$60.6$#1.1$%3,302%".9%"ft$%4,069$!6%"ft$!7$$8.49#"70$!5$!6$!7',
+    '#"82$!7$#9.9#(9080yrbp$$5.43$%9,473"!9#+-dimethyl-4#!0$#0.1%"ft$!8%$,900#"11$!4',
+    '$!7$$9.30#&20,000%#lbs$#2.4$%5,000$!8%$,259#&30,000$!4$!8#"40$#9ft#"51%$,000',
+    '$%3,908#"60%"ft$!1$!3%$,000$%4,971$!6$%9,511#&71,100$%3,264$!4%$,700$#5cc$!6',
+    '$!8#"80$!2$!4$!5$!6$!8#&95,100$(9/46,000!T-(1,2,3,4-tetrahydro-2-isoquinolyl-carbonyloxy)ethyl"#0-0#*319&sol;88"#1-2#!0$!1',
+    '$"pm#$2-91#"42#!5#!6"#2-2%#wts#!5"#3-2$!4$"93$$year#"00#"lb"$4-0t',
+    '"%5-.57#%.50pm#"pm"$8-0-%!s%!t$"2t$"ot""90")activated#:mino-3-phosphonopropionate(44-phosphonobutanoate(55-phosphonopentanoate#*rachidonyl##xes',
+    '$#sed"#car%Eboxy-2-hydroxy-5-sulphoformazobenzene))methoxy-4#%entre#$home##lub#!m#(omponent"*day-a-week#,eoxy-glucose\')galactose\'\'uridine#(irection+!s',
+    '#"rs"$gang##oal##ram&&-a-day&!s"+handicapper$!p#<ydroxy-3-methacryloxy-propyl)8ethyl-2-methylpropenoate./dithiocarbamate"$in-1#$rons""kg"%layer',
+    '."39."49,$6.95#%etter#$ieut$"ke$"nk"\'megaton$,rcaptoethanl$3thoxy-4-allylphenol&2yl-2,4-pentanediol(\'propane%\'re-wide#!m$)-diameter',
+    '"#oz."$page#%ences#1henyl-5-oxazolone##ole$"rt#\'ropanol"!r#&omford$#und"!s#%eater$$cond#(heffield#$peed',
+    '$#one#&windon#\'yllable"$term#%hirds##ier#!o#$rack%%fford##ype"$wing##ood"%years!,.0&ndash;161*$2.3m',
+    '+$00.0*%3.010-"pm*#6.0#$-2.7$#3.0$#4.0$)compliant$)for-sparc#".1#$/0.5#\'0&ndash*\';2.30pm+&3.00pm+$4.25',
+    '%$last%#the$"am$!m#"1%$!0$!5$!p#"21#$3942#$4446$%8mbps#$5.27$!0$#853',
+    '%#top$"pm#\'68-mile$"pm#"75%!p$!p#"86$"pm#,9&times;10/l$&oz/82g##bcf#!c#!e#"gb',
+    '#"sd##x10"*1&ndash;11+!2*!3##(3)#$,4,6#&-based$"kb$(on-intel#".0$"1.&!1&!2&!3',
+    '%!3%!5$#2.1&!2&!3$!6$!8$!9#"/2#$0,12$%.1.12(!3%!2&".1\'!5',
+    '%#3.1\'!2\'!3\'!4\'!5%#4.1&!5&!6%!5&".1$!4$!7$!9$$:one#$1.12',
+    '$!2$!m#"2%$!4$!8$!p##3.0#"48$!p#*5&ndash;16+$3.20-"45+&4.30pm$".1%!2',
+    '%!4%!5%!6%!8%!9$&:lynda$!a$!b$!k#,6&ndash;13.4."67$#.08#$7(b)%"c)%"d)',
+    '%"f)$#.20%"39$!m#$8.13#*9&ndash;28$&/150ml$!0$#132$"oz#!b$!n#!c#!d#$gbps',
+    '$!g#\'million#!s"%2&ins$+ndash;2.7kb*!4$*times;10/l#$(15)$"a)$"b)$"e)#$.1.1%!0%!1%!2',
+    '%!4%!5%!6%!7%!8%!9$#2.5&!6%!0$%3.1.1(!2(!3(!4(!5&#2.1',
+    '$#4.1%!1$!8$!9%!3#"00%#rpm$"57$%:this$"am$!d#$1.59%!6$"25$#958',
+    '#"2%$$&deg%*mdash;2.24%(ndash;31$#.15$!0$!m#)3&ndash;4$#.87$!m#"4.%"05%!1&*6&ndash;17$!m',
+    '%"00%"46$!8$\':ferdie%$gold$"am$&kg/5lb$"mg%&illion#$6.47$!5%!4$"98#,7&ndash;2.30$!m',
+    '$#.27$"75$"kg#$9.20$#789#":1#!a#"gb#!k$!b$!m#"lb%!s#"ms#!s',
+    '#!w"#3%+#*&ndash;2.6*!4##*10#".0$#1.5%!0%!1%!2%!4%!5%!6%!7%!8',
+    '$#2.2%!0%!1%!2%!3%!4%!5%!6$#3.1$#5.1&!2$!9#%/1000#,0&ndash;4.00+&5.30pm',
+    '$\'-3.30pm%#4pm%&5.30pm&"pm$$0gph$#358$&4.30pm$!5$#:as%\'leading$#am.$/pm&ndash;4.45pm&$-5pm$!s#$1.13',
+    '$!p#$2.01$#sec#$3(b)$&.110v.%"23#$4.19$"86$!m##565$%:keen%\'staunch$"pm#"66$!m',
+    '#"7m$"pc#$9.00%"50#!a#!c##ghz#"in#!k$!w#,m-transistor#"pc#"w7#!x")4&mdash;7',
+    '-%p/kwh+#4.9*#3.6*$5.5%$*times;10/l##(a)$"b)#%-fold##.1.$#2.1&!2&!3&!5$#3.1&!2',
+    '$#4.1&!2&!3$$6(a)$!7$"92#$/100#"00$!9$\':former%\'leading#"11$!4$"58$"66',
+    '#"26##339$!8#,5&ndash;6.00$!.$#:by%&oliver$"am$#ghz$!v##607$"20$!5%!5$"68',
+    '##758$"60%!4#$8.49$"29#!a#"cu##ftl#"gb#"kg$(ilobases#!l#%m/6ft$!g#$secs',
+    '"(5%triton#$&deg$%mgr;g$(ndash;11+#2.5+!6*$2.8%*#3.5,!7+!5*"4%*"5%+#.0%,!3*#7.5',
+    '$)times;2.5#$(a).$"c)#"-3$#4.5$#5.0$$inch$%metre%#ile&!n$%tonne%$urns#$.1.1$#4.3$!6',
+    '#&0/2.00$&:david$!p##139$"53#!2$#.12#"3p#"4%$"pm$!v##5pm#"6.#"76$!m',
+    '#"8p#!9$#808%!3#!b$#arr$!n#(cm/1inch&!3##e07#$gbps$%flops#!i$!n##kpc',
+    '$!.$"/s$#bps$$etre(!s$!g$#ton#"sq#"wm##x10"+6&ndash;2.8*!8$&percnt#%-fold$%litre',
+    '%(ile-long%!m#!.$!0$#1.4$#3.1&!2##0%/##123$!7#"2%$"5%$!p#$52ff$"cm',
+    '%!m#"7m#\'87-mile$!m#"ft#"gb#"ii#"mv#"pc#"sa"%7&ins$(ndash;3m+&t/acre*$8.0%$*times;10/l',
+    '$$2(v)%!.&!2&!6%!8$$6.12&!7$"8.%!1$"92#%/1000#"04$!m$"oz$!p',
+    '$!8%"28%!3##2ft#"42$"gb#"5%$"28$"cu$"in$&kg/6lb%!m$"pc$$sq.m##611',
+    '##750$"84$"90##800$"80$#x10#":1#"bn#!c$!m#"gb#!l#$mgml#&t/acre"-8&ndash;14.3%',
+    ',!4#"-a$$mile$%tonne#".0$#3.4$!4%".1$$748a%!9$!8%!9#%/acre#"0p#!1',
+    '$%24mhz$"80#\'3&deg;c$"08$!5$"65$"70$"89##426$"36$!5#,5&ndash;2.99+%3.80%+$7.07$"05',
+    '#"65#"78$!m#"8m%!b$!p#!9$!%#":0#"bn#!i#"kg#"pc"*9&ndash;11##(b)',
+    '#!.$#1.1&!2&!3$#2.1$#3.1\'!.&!2&!3$$4718$!5#%/1000#%0_per$!p#$2sec',
+    '$":1#"4m##8bn#"9m$"oz#":1#!b$!n#!x!"/-""10$\'00/year#$2/90#"35#"43',
+    '$!5#!7#"89#!9"$2/87#&11,213#"58"$3/41$"87#"03#"22#!6##:14#!d"$4/90',
+    '#"65#"86"$5/92#!5$!3"$6/87#!5#!a"!7#)&ndash;22+!9#!6""80#!1#!2',
+    '#!8#!9#!s"-9/16/23/30/31#!1#!2"!d"!f"&having"!i#!n#&so9002"#mix"$next"#one',
+    '"%value"!w##ith!,0%&ndash;35%#$-80%#!.#,/0.92=21.74%#(glycerol#&percnt"%&amp%#&deg;kh$)ivide;180*"30*"90#*frac12&ins',
+    '#"gt#0ins&times;16&ins#(mdash;19)!2*!1)!3*!5$$gr;g\'!l$-icro/&micro;l(";l)!w#0ndash;10&ndash;0+!0*!1',
+    '*!3*!4+!2*"5p*!6+!5*"99)(2&frac12*"00*&1/5/41*#3cm*+4-year-olds+".9*%5/min+#000',
+    '+!g+#min+!p*"7%),3&ndash;1877*&0-year+\'0&mgr;m,"00+"1b+&hp/leg+"km+!p,"pm*!2*"5%',
+    ')\'4&aring+*ndash;18814!22#9061!8*!3*!4*"5%+$&deg)#500+"ns*!5+#lbs*!7*#myr',
+    '*!7*!8)"73*!7)#80%*!2*!6*"8%)!9)(february)$june)#may#.prime;57&prime#*rehy;month((year-old',
+    ')130cm/8&times;12in)"40""\'n#$s/30"#(-)##17)$"9)#"6)#"g)""+%"%,000%&.&ndash;100,000-&25,000-\'350,000&/,000-30,000,000',
+    '&\'-30,000\'&a-year(#cre\'"sq\'"up&"ft&"ha&"km\'$w/hr%!8$"12$"28$"33$&49,290$"53',
+    '##100$"14$"20$"35#\'200,000%!3$"35$!4%&,25,27$"60$"85%!6##343$$5,55#"40',
+    '%!9$&12,740$"35$"42%!5$"54$"75#\'500,000&$-ton&"ft$"33$"78##600$"50$&81,000',
+    '%!1$"19$%4,136$"55$"70%%3,950##811$"70$&81,900$"91%!9##900%!6$$10kb$"41',
+    '"\'-&mgr;m#"10$!9#"20$!7$!9#!3$#-91&!3$%0,000%!p#!4$!0%"cm$!9',
+    '$#0cm#"60%!%#"70#!8#&a-side$$pril#$ball$)y-60-foot#&carbon$#ent$)haracters$%lient$!m$#opy',
+    '#&dollar#%entry#!f$#eet$$ight$$rame$!t%\'-square#-goal-a-season\'*s-a-season$#rid#*horsepower%)ur-a-week$!p#(jul-1990',
+    '#!k#$lamp$%ength#!m$$arch%#tch$&egaton%#tre(%-long$$iler&$lion%!n#+number/name#"oh$#ver',
+    '#\'partner%\'ssenger%%tient$\'er-cent$"in%#tch$&ounder$$upil#%round$"un&#ner#$shot$#ong$%troke#$team',
+    '#\'vehicle$%oiced#$well#)year-high\'%s-old"#.01$!2%".1&!2&!5$!7$$9sec$!p#$1.91$$1.89',
+    '%!%$!4$!6%)&ndash;17%!7$!8$"kd#)2&ndash;1+!3+$44.0$#.74$!2$\'p/litre#,3&times;27.3$#.81',
+    '$!1$"2%$!5%"mm$!6$!7$!8##4.2$!2%"mb$!6$!8%!.#\'5&ins;w$#(1)',
+    '%"91$!1$!2$!4$"57$!8$!9$"bn$!m#\'6&deg;c$$3sec$"mg%"pg#,7&ndash;47.1$#.86',
+    '$"5%$!7$!8$"bn$!m%"jy$!p#"80%!.$!7$!p#*9,11,12,13$#.83$!1$#gms',
+    '"&/07/93#$1/88$!0%$0000$$1/86%!0$!5$"84#!2$#/88$"14$-5/40/45/47/50%"hp$"77#!3',
+    '$-0/40/50/60/70$!2#!4$#/41%"93$$0mhz#+5&mdash;8/1-!2$%0/100$"36$"48$"62#"60#$8/87$$0ths',
+    '#"ns#"sq"70&deg;c&ndash;220&deg;c$"ft$&mgr;ci(#gml("jy%&icro;g+#/ml$*ndash;1000,$10nm+&40,000*#212+#20k,!4',
+    '+"50-$,000-"mg+"75+"99*\'300,000-&-birds-!j-!m+!1+"30*$400m*!5+"0g+"10',
+    '-!m*!8+"00$&percnt%"gr%#lus$-rehy;year-old$%times)&;150mm#*,000-piece)#lus(&strong(-tonnes-a-year\'#gal\'!m',
+    '$#668#!-$$1000$#350$#500$&a-week$#bed%%omber$(capacity$#day$$fold&"ot(%-long$$head\'"vy',
+    '$$line$\'machine%&egaton($watt&(tre-deep*$long%%flops%)icrometre&*le-an-hour)$long\'\'lilitre&"ps%!m$*plus-pound%$oint',
+    '$$room$$seat("er&$ries$&tonner$$watt%%inner$/year-revolution#$.000#&/210hp%"67$#300$#400$%honda#\'0&deg;c',
+    '%\'ndash;1+!2,#100+$3500$%-acre%#odd%"sq&%trong%(year-old$".0$$/200\'"16%!c$#000$!4',
+    '$)6&ndash;7$!7$#b/d$!c$#ft.$#gsi$"km$"lb$"mm$"tp#)1&mdash;a$":a$!b#&2-2006$!0',
+    '#*3&ndash;05,!7$#-07%$2007$$0/64$!2$"6.$!9#"40$"36$!m##5\'s$!.$"/6$!3',
+    '#,6&ndash;3345##700#":1#!a$!f#*c/425f/gas$#als$!m#"ev#&ft/min##gev$"hz$"sm##ib.$!n',
+    '#\'k-bytes$"da$"hz$"ms#&m-byte$!.$$/1km$$etre(!s$!g$%l/8fl\'$oz/1%!s$\'ph-plus#"no',
+    '$!f$!g##rpm#&strong#!t#!v#$x200#"yd$!r"+1&mdash;204$)ndash;211+"50+!6*!5*!7',
+    '*!9#$,387$\'837,000#%-seat#%.4mph$"7p$!9#*2&ndash;15$!0$!4$"cc#"30#"50$!4#,7&ndash;2019',
+    '#)a&ndash;b#&c-210d#"pp#"st#!x"*2&ndash;10+"20*#203*"32*!6*!7*!9$\'plus;19#$,750##.32',
+    '#$0-40$!2$%7/147$!9$!s##1/2$!0%"/l#"20$"74##400$$5-46#"67#!7#!8',
+    '$!0##:60$!c#!b$(&ndash;c$"hp")3&ndash;4*!5##(2)#$,442$#599#$-186#!.$#988#$/507',
+    '#"0%$!2$"70$"mm#!2#&3a/b/c#"41#"59#"66#"73#%89-90#!9#":i#!a#)b&ndash;d',
+    '#"pp#"rd")4&ndash;7*!8#$,500#$-run##.1p##/20&(&ndash;1%)4&ndash;1##033$!4$!s#(1&frac12$!8',
+    '#!3$!3%"70$#772#"40%!0$#532##631$!9#!7#$8,32$!b##bhp#"cm#"hp',
+    '#"lb"*5&mdash;12$\'ndash;3+!1+!6#$,300$#600%"98$#737#"-1$%litre$$yard#!.$!5##/16',
+    '$%60r15$"82#"00$$g/fs$!s#!1#"20#"30$!5%!3#"56#!6$+&ndash;3307$!0$!9',
+    '%!5#!8#"91#"bn#!g#"kg#!m#!v"*6&ndash;11,!9+!2*#207*!5*!8#"-7',
+    '#"00$"th#!2$"81#"33##531##666#!7$"55#"85#!a##ff.$!t#"gt#%metre',
+    '+!8*#309*!6##(2)$"3)#$,217$\'461,000#"-4$$yard#"00$#mph#!2$#390#"40$!9',
+    '#!7$%/4341$!1#$8/92#":j#!c#!g#"pp#!s"*8&ndash;10+!1*#209+"10*#332*!5',
+    '$#500%"57#"-2$$acre$$page#!.$"20$!6##/80#!1$!9%!1#$4261$!4#!6',
+    '$!0#"84#"90$"62#":h#"bn#!f#!m##pp.#"th""9%#)&ndash;10+!2+!5*"20',
+    ',!5*!8##(1)$"2)#$,000$#600$#800#"-9$&member#!0$!0%$/stx$!s#!1#$2/91',
+    '#!3##432#!6$(3-64-but\'!8$!4#!7$!0$!2#,8&ndash;3540$!0$#950#":m#"cm",:1&ndash;11a',
+    ',!7+"21+!8$!2$!3$!4%)&ndash;21$$5:15$!6$*7&ndash;38$*9&ndash;23#!2$)&ndash;13$!0%)&ndash;23',
+    '$!2%,&ndash;23:33-!6%!f$!3$*5&ndash;28%"ff$*7&ndash;30,"40$!8$!9#!3$(&ndash;5$!1$!5',
+    '$*5&ndash;47#%54:04$!6#!7$",8#$8ff.#*9&ndash;19"$_per"!b##aud#!c#"hp"#c-g#!c#%m/7in',
+    '#"wt"!d#"eg#\'hahran5#!m""eg"!f#!f#)loz/570ml#!r#$t/6m",g-operations#"ev""hp"#ish',
+    '#$cals#&g/n/ha#(ilogauss")mb/second$"ar$"ps$!q$.yte-per-second#"er$!v##gml##ins%#ute#(onth-old""ne',
+    '""oz"%p-off#!.$$p.m.#%16n02#!g#!m"\'s&deg;c#&-style#%.w.g.#"/n#%econd%!s$!x#!t',
+    '#"ev#&h-21st&#4th%#fox$\'century"(v-0v-20v#!8$#h-5#!i"$w/50#!b"!x#"20$.5x7&middot;5cm\'!5',
+    '##ssc"$yard#"ds#(ears-old#!r"!z!)1%-arises"/&deg;c/70&deg;f\'!s#)frac14;in$!t#%ins;w#%ndash(";1*"03',
+    '*!9)$30cm*!1*!3*!6)"40*!3)#55%)"60*!4)"71)"82)#aug,#ust)#jul',
+    '#-rehy;year-old#+shilling;8d$%ol;76#*times;24.7""\'s"$(22)#"3)#$4.5)#"p)#$v)ta"+,000-gallon\'"sq\'#wrd$"19##123',
+    '$#982##200$"11$!3$!5%#,26&"31%!5$&66,000$"86#"31$"20$$5.55$"67$"82',
+    '&"ft$"25%!8$"33$"81#!5$"01$"52#\'600,000$&72,000%!9##776$"88$"96#\'800,000',
+    '$"50$"61$"82##950"#-21$#2nd$!7#!3$!4#!4#%april##bay$"ed#\'country##end',
+    '#&gallon$#ear$#oal##jan$"un#$mile$%onths#&nation#$over#$page$#lus#$room$%unner##sat$%pline',
+    '\'%s-old,!s"#.0%$!7#(10.93sna$&2.1865&"90$"79$$8(b)$$9(a)&"b)##2.9$#259$"86$"cc',
+    '$!m$!p#%30sec$!1$!4$!8$!9$"bn#)4&ndash;9$#.12&!3%)8&ndash;9$!0$!1$"94',
+    '%!c#$5.92$!0$!4$"9p$":1$!k#$6(a)%"b)$#.80&&5,65-6$!/%"50$!3$!5',
+    '$!m%!m$"pc$#sec#07&deg;c/71&deg;f$#.93$!1$!2$!5$!6%&,9.845$!8$#khz$!p#$8.90',
+    '%!%%!p$"ff$!m%!m#"90$!2$"5m$\'mmolmol$!p%!c"%/1/84$*00000/year$$1/92%!8',
+    '%%/2012%"69$"56%!b#"24$"in$!p#"30$(65=0.058#$4/56$!0$!6$"in#"60$!4',
+    '$!6#"91$!2#%feb19"\'0&deg;.(!c$(mdash;11%$gr;v$)ndash;205+"40*#329*#410+!2*#995#"\'s',
+    '#"-9$"ft$$page#".2$"3p$"9%#"/l#,0&ndash;2215,#580$!0%!2%"hz$*2-pe-cesar$"ft#"10',
+    '%"9.$#97.%!9#"20$#610#"30$"19$#49.$"93#"45$#97.#"50%"5.$#23.#!6',
+    '$"95##765#"80$!4##9mw#":r##bhp#!c##ins#"lb#"ml$"ph#,p&ndash;217p$!p%!.',
+    '"*1&ndash;12*#212,!3,!5+!5*!8##+27#(,100,000#".2$!8%!4#"/2##022$#8.5##360',
+    '#!5$!0##7.9$"97#!9#":p#"cm#"ff#"lb#!m""2%#\'&frac12$(mdash;48$)ndash;122+!6',
+    '*"29*#460*#628#%-mile$$page$\'residue#!1$(&ndash;3$!0$"19#!2$"hz##354#$5528#!9',
+    '#%a,103#!b$!.#!p#!w"*3&ndash;15+!6,!5-!1*#210,!5*#496*!5*!7##(4)',
+    '$#817##.32$"86#,0&ndash;1700$!0$"mm#!1$!0$!9#!3#!4$!0$!5#"50#!8',
+    '#$9119$!4#":p#)e&ndash;h#"ff%!.#!g"*4&ndash;15+!9*%212bc,!6+!f*!7$\'plus;15#$,139',
+    '$#run#!.$%5x143#"04#!1$!0$"41$!8$!9%!6#"20$!8#!5$"82#!6',
+    '#!9#":p#)b&ndash;c#"cm#"km#"nm#"si""5%#$&deg$\'ndash;1+!6*"44*!7#%-page##/82',
+    '##2.2##309#!4##555##631$!6#"90$!4$"ft#":b#"ff#.mm/8&frac12;in#"p.#!s$!q',
+    '"*6&mdash;22$(ndash;17*"20+"21*!7#$,021$#670#"-8$$room#".7%!%#!0$!1$$5-10$"82',
+    '$!3#!5$!0#!8#"90$!m#":j#!a#!n#"pp%!.##sli#"th""7%#$,277',
+    '%#ile##.9%##1cd#!5#!9$$7-99#!a#!b#!p""8%#,&ndash;201bc+"19#$,000%"38$#783',
+    '#".5##1.5$"21#!2#"33#!6#!7$!9#"82##956#":m#)a&ndash;c#"bc#"f.#!m',
+    '##sld"*9&ndash;21+"69*"53+!4$&plus;3##.03$"2%$"7%$"80#!0#"33$!6##444$"67',
+    '#"6m##911#"ff#!m$"ph#"pp"&:00:16$!4#*1&ndash;11+%23:13+!9$*0&ndash;15-!7$!1$*2&ndash;32',
+    '$*8&ndash;19%#:37#)2&ndash;7$*0&ndash;22$!1$*2&ndash;34$*3&ndash;27$$6:37&"47#"33%,&ndash;22:15,"46#!4$/2:45&ndash;0500$!5',
+    '"$=33%"$_per"+cm/8&frac12$!s"#d-e""em"!g"!h"-in&ndash;42in#"sh""kd#!m#!w"#lb.$!s',
+    '#$onth""no"!o#\'fficers#!s""pp"!q#$22.2"*riyadh2-11"#sst#,t&ndash;25th$%-26th%&minute$!.$%/23rd',
+    '!,2&amp&frac12##deg#&frac12)$&deg)\';-litre#$half\'&;-cent#)mdash;004)"25#%ndash(#;06*!7)%1/2ft*#0/9+!2',
+    '+!9*"6.*!7+!5*!8*!9)22&ndash;68&ndash;2*%4&deg+%-hour*\'5&deg;s*$8mpg*"9a)$30cm*!1*!6',
+    ')"41*"21*!6+"lb)!5*!1*!5),6&ndash;1866*!1)!8)!9*"31)#dec)#oct)#sun',
+    '#+shilling;6d"!\'"#(4)#"7)#"c)"),000-foot(!t\'&member(#ile\'&strong&"km\'"wh&"lb$"48##113',
+    '%!5$"97##225$!3$!4%#,25$$6,27$$7,32$"82##320$!5%#0lb$\'70-acre##400$"31',
+    '%!9$"49$"66%!9$"86$&91,000#\'521,223$"30%!1$"80##649$&67,000$&89,000$"91##700',
+    '#\'810,000##902$"25"!-#"10$!3#"20$#60c%"oc$%87009#!3$!4#!7#!9#$acre',
+    '$(edroomed#"cd##dec$\'ivision#$fddi$$ight$#old%"ot#&headed##jan&$uary$"ul%!n&"22#\'km-long',
+    '#*nucleotide#$oct.#&storey##ton#$week#$yard$\'ear-man($olds"#.0%$!0%!0$!1$!6%#.93$!8',
+    '%!.$$secs#%1.5.3%!8%"91$!0$!2%,&ndash;22.14$!6$!7$!8$!9#$2.91$!0$\'3508ghz',
+    '%!%$$95b.%#6a.$!m$"pc#"3%$+&ndash;75.0$!2$!4$!5$$7,39$"cm$"kg#$4.92\'!b',
+    '%#mph$!7$"cm$"pc#,5&ndash;80.1$!0$!9$"cm$!k%"hz$!m%*ph/1000rpm$"pc#,6&ndash;22.8$\'/100000',
+    '$!9$#mpg$"oz$!p%!c#\'7&aring$!3##80m$!1$!6$#7r.$$secs#"95$!m"%/1/88',
+    '#$2/87$!0$)18,51/247$!4#!3$#/41%"93#$4/41##563$!9#$7/76%"87#"89#&feb/90"10&deg;c/425&deg;f',
+    '$\'micro;s$)ndash;225*$3180+"40*!6##(1)#"-m%#ile$$name$(year-old#$.255#%/240v#,0&ndash;1700+$2300,,400/&pound;1',
+    '$%/22/6%#400$"00$#gns$#hrs$"kg$!s#"11$!b##2.4#"30##406$"lb#"70#":i',
+    '$!p#*c/400f/gas&(25f/gas7#"ft#"mw#,p&ndash;221p$!c#"th"\'1&ndash)#;25*!5$\'plus;16#$,000$#600$#900',
+    '##/45#!0$!8#!2$,2&ndash;1190#!3$!0$"11%!2#!4$!4$"73#,5&ndash;0030#!7$"17',
+    '$"50#!f#%lb/ft#&x299.7"+2&ndash;225##(5)#$,500$#800#*-processor#$/898##045$!9$"mm#&14.83%%!1',
+    '##3.7##5kg#"60%!1#!7$$8-79#!8#!9$"07#":o#"ft##lbs#!n")3&mdash;5$)ndash;187',
+    '*"85##(2)$"4)$"5)#$,283#%-seat#$.414$#967\'#mph#$/036##000$"96#!1$"/2$!4',
+    '$"84#$3355##616##7.0$"91#!9$!0#)c&ndash;e##e11#!g#"pp#"rd"*4&mdash;48$(ndash;31##(3)',
+    '#$,618$#950#(1&sol;87$".2$"61#!2$"31##400#"52$#302#"61##7.0$!4#!9$!0',
+    '#"ff#"lb#"mb##pp.#"th"\'5&deg;f$\'mgr;mol$)ndash;215+"36+"50+"75-.g/8&ndash;10oz*!3+025g/8&ndash;12oz+!3',
+    '#0,000-square-foot\'!m#%-page$%share%$pace##.28$"3%$!6##/55$!6#"00%!0$!5%#-07$"ft',
+    '$#402$"58#"20$$4-26$!7$!8#,4&ndash;2218#!7#"80##9cc#!b$!p#!d#\'g/8oz/1#%kcals',
+    '$"ph#!m$!l##pp.#!s#"th",6&ndash;1075*#301+!2*!4*#651*!7*!8*!9##(1)',
+    '$"4)$"5)#(,545,805$#723#(-seconds##.9%%!0#%/1141$#347#"00#!1$"01#!2$".6$"26',
+    '$"54$!6$!7%#-38#"50$#m/s#%72/91##9.9$"11##bhp#)c&ndash;e#)f&ndash;g#!h"*7&ndash;31+!4',
+    '*!8##(6)#(,000,000$#437$#832%"63##-54#!.$!5$"6%$!9#!0$!0##1-1$!0',
+    '$"54#!5$"70#"60##799#!8$!4$!7#!9##bhp#)c&ndash;d#)d&ndash;e#)e&ndash;g#!g"+8&ndash;231',
+    '*!5*!6$&plus;3#$,455#"-6#%0/821##1.0%!6#!3##5.0##6hd##727#!8$!3$"44',
+    '##pp."*9&ndash;30+!2+!5*#491##(2)#$,000%"27%"77$#100$#378##.4%#%/0629#"00$!9',
+    '#!1#52&ndash;45247&ndash;2-+689&ndash;2#!4$!0$!4#!5$!0#!6#!7##8.4$!7$"89#&9-mile#"c7',
+    '#!p$!p"&:05:07#)1&ndash;2+!4$!3$*5&ndash;20-!2$*6&ndash;31$#7ff$!8$!9%!b#%20:03$*1&ndash;23',
+    '$*8&ndash;30#"30$)1&ndash;4$!4$!6%)&ndash;40%.:04&ndash;0500$*7&ndash;40$!8#+40&ndash;46$-1&ndash;23:10,"46$*3&ndash;44$*7&ndash;53#%50:02',
+    '$*4&ndash;62$*5&mdash;62#+66&ndash;71$*7&ndash;70#*7&ndash;13#\'fretter"%=4096"#d11"!g#"hz"/hp1,80019.818.3"#in.$!s"!k#%-105k',
+    '##ohm""mb#"in#,m&frac34&ins$,/&frac34&ins#"yr"-nd&ndash;24th""pp"!q"#tel#!h"(v10-type%#h-7%!z"!x',
+    '!&3%-55%#!."6&frac12;x15&frac12&ins\'%38;in\'%58;in$!t#%ins;h#)mdash;004+!5)"24*!6)!4$\'iddot;2*!4*!8',
+    '+!5*"2-*!4+(&ndash;0+!4*!7)"21*!3*%5,000+/cm/9&ndash;10in+"th*\'6&deg;c*\'7&deg;c0!s*\'8&deg;c',
+    ')"31*!2*!3+!1),4&ndash;1875*!2*!7)"50*!5)!6),7&ndash;18673"70*!7)!8*+&ndash;1871',
+    ',#ust)(december)\'january)#sep#,shilling;4d."!\'#"04#!s"#(2)#"7)#$v)ta""+1#"kg"#,00%00,000-27,000,000',
+    '%!2$"40$"56$"88##100%!8$"18$"95#!2$&00,000$$4,25(#,26\'\'6,27,28$"51$!8',
+    '&$,000&"ft%!4$!1$"25$"31#\'400,000$"16$"28$"38$"92%!7&$,200##531$"50',
+    '$"85$"94##646$!7%!8$"81%%8,000#&700.00$&10,000$"30%%9,000$"53$"86##838##958',
+    '"#-16#$2-93#!3$!5#\'austria#\'country##day$\'ecember#$fold#)kilometre#%litre##mer$$onth##nov&%ember',
+    '##run&#ner#&second$%torey#%track#&vii-64#)years-old"#.04$"6.$"7%##1.6$!1$$2.91$!3$*7&ndash;18',
+    '$#mpg#%2.1.5$!4$!m$$secs#\'3&aring$#0pm$!1$!2$!3$!7$!8$!p#$4.91&!2',
+    '$!1$!6$!8$!9$!m$!p#\'5&aring$#.83%"90$!0$!5$!6$!8$#khz%!m',
+    '#$6(b)$!5$"9%##700$!2$!7$"bn$"kg#"83$!6$!9$!m$!p#$9.91$"kg',
+    '#%10/86$"6a#&24june$!6#$3/41%"92$!3%!9$!9#!4$(&ndash;3$#/86&!7##592#"6d',
+    '#"92"10&deg;c/450&deg;f$\'formula$\'mdash;1%$gr;v%\'iddot;9$\'ndash;1*#231*#800*!9##(2)#(,000,000$#795#$-207$!9',
+    '$"km$"ms$$page%%ounds$$seat$(year-old#".0$-6&ndash;279.7%!4$"80#$/240#,0&ndash;0700+$4250$(0-strong%"00',
+    '$!8#&2/2303$"20$"60$"92##3.1%!2%!8$"10##431#"63#"77##9.6#"af#!e',
+    '#"hp$!z#"m.$"yr#!v")1&ndash;2*"48*$5400*$7378+!8#$,800#%-ball$&member#\'.012mph$"3%',
+    '$"4p#$/252#!1$".1#!2$"12##3.0#"40##557#"70##8.0$!0$"24$!6$!7',
+    '#!b#!c""2%#&&deg;c%\'ollar;c$(middot;7$(ndash;56##(2)$"3)#$,255#\'.438mph$"6%$"98#"00$"64',
+    '$!0##232#!3$!0$!1#!4##5.7$#000#!6$!0##7.5$!3#!8#$9551#!c',
+    '#"nd#!p$!p%!."+3&ndash;237*!4*!5*!6*"72##.3%#"01#&1/2310$"22$"66##200',
+    '$#457#"37#"55#!6$"41$!m#$8196##950##ff."+4&ndash;149*#244*"41##(5)#$-236##0.6',
+    '##180#"30$"31#!4#"60$!7##8.0$*/89(t1255)#"cm#!h#(kg/516lb$!m#)qq3662002#!v""5%',
+    '+!5$\'ndash;3*"41*"52*"60*!7*!8$&plus;2##(6)#$,501$#833##-30##.02##0.1#!1',
+    '#$2000$$6-27#"30#!4$".7$"51#!5##6.8$!0$"78#"80#,9&ndash;2362$".4$!0#!a',
+    '#"th""6%#*&ndash;244*"44*!7#(,000,000#!.$"5%%"bn$"9p#,/256&ndash;7#!0$"00%$870a#"10',
+    '$!8##2.2$"ft##470##5.7#!6##757#!9$!m#!a$"11#!m$"ph""7%#*&ndash;240',
+    '*!8##(3)#$,216##.2%$!6##0.0%!9$!3#"1a##2.2##3.4#"40#"5a#!6$".1',
+    '##7.2%!6##8.3$!4##9.5#)c&ndash;e#)e&ndash;f#)g&ndash;h#"kg#"ml#"th"+8&ndash;245*"41+!9#"\'s',
+    '#$,533&!7%"90#!-$#257#!.$"09$#10p%"75#$/259#!0#!1$".9$!8#"30',
+    '$)49/233088$$5-48#"53%!2#"65##7.9##888#)a&ndash;b##ff.#&g/kwhr##pts"*9&ndash;41$\'plus;16##(4)#$,000',
+    '#$-322##.05#"00#$10/l$!2$!6#"2a#!3#+4/2941/2942$!1$!9#!5$!0#"60#!7',
+    '##9.5%!6#"cc#"gb"#:00#*1&ndash;36+!5$!0$!2$*3&ndash;24$*5&ndash;21#)2&ndash;7$*0&ndash;33$*5&ndash;26$*6&ndash;32',
+    '%1&ndash;24&ndash;9#!3$!1%.:00&ndash;0500$!4$$6:42$*9&ndash;43#$4,14$*4&ndash;18$/5:00&ndash;0500$!7$!8$!9#"50%,&ndash;24:11',
+    '$"ff#*6&ndash;12#*9&ndash;20"(chairman#5m/9in&times;33cm/13in("ch"!d""ft"#g/t#!b"!h""i-#"ns""kb#!g',
+    '"#min#"pg$!h""n."#pts"#rd\'$%-29th$%/24th""s."#tel#!h",x33cm/9x13in"$year!#4%."&&deg;s',
+    '\'&34&ins#3ins;x12&ins;x12&ins#(mdash;25*!6*!9)"36$)icro;g/ml#+ndash;1/2ft*!3*!6*"77*!8)!2*!0*!3',
+    '*\'5/13/41+"km*\'6&deg;c*\'7&deg;c*"8%)!3*!4)24&ndash;53&ndash;3*!6*#8-h+!h).5/418&ndash;19*!6)"60)"74',
+    ')\'9&ndash*!2)&august)\'october))september#)rehy;hour#(shilling$+ol;5&sol;14#,times;11&ins)&24&ins)"30+$&ins"$(9%)#"a)#"b)',
+    '"!+",,000-hectare\'&strong&#rpm$"32$"58$"75##100&$,000$!2$"70$"91%"80&!1#"25',
+    '$$8,29#\'300,000$!4$"76##400$&23,000%!5$"45$!6#%500ft&"lb$&67,000$&80,000$"91#%604.5',
+    '$"39$"80##704$"16$"28$"51%!2##850$"96#\'900,000$&46,073$"85$"92"#-14#!2',
+    '$!1$!2$!3$!4#!3$!1$!5#!4#!5#!7##all$$ug23&#ust#*bit-colour#1carat-gold-plated',
+    '$!m$"pu##dot#+going-on-14$"un#&hour-a(,party-people##key#%litre#*man-troupe%!y#\'october#%packs%"rt$&ointed',
+    '#$race$%unner#$sept\'"23\'%ember$%torey%$rong#$team%"st$$imes$&urbine&"ns#&valves$#olt#$yard',
+    '"#.00$!2$!3$&6&lcub%!.#,1&ndash;24.3$&0.1865&"83&"90$!1$!6#.2(d)&mdash;see$#.93$!1$!5',
+    '#$3(b)$#.84$!0$"pc#"42$!p#$5.88%"91$"7%$!m%!t#$6(a)$!2$!6$!p',
+    '#$8(a)%"d)$!4$"7p$#9v.#$9(a)$!0%"r.$#568\'!0$!9$!p"&/10/80$$1/86$"60',
+    '$!4$!5#!3$!0$!3#"47$#8hr#$6/87#$7/89$!8#$8/93#"92"%0&deg\'";.$\'ndash;1',
+    '+"00+"30+"80*#300*!7$*times;10/l#$(11)$"l)#$,200\'$,000$#600$#866$#963#!-$#236',
+    '$%litre$$mile$%plate$$seat$$yard%#ear#!.$"5%$"9p#$/335$#410$"87##0.0$%/9600%"sq',
+    '%!0$"ft$!m$#rpm$"xt##258##3.7$!k##483##5.4#!6$!0$,1&ndash;0106$!2#!7',
+    '$"25#!8$".6$!8%!8#!9#!d$!u#-g/8&frac12;oz&)oz/carton%&approx#"hp#"kg#"lb#"mm',
+    '")1&ndash;7#$,000$#200#"-2#".3#"02##1.6$!0$!1$%4302b$"80#"20##321#!5$".6',
+    '$!0##741#!8#!9$"19$"80#!r"+2&ndash;246*"52#"\'s#$,000\'$,000$#193##.3%%!9',
+    '$".2$"95#!1$!0##2.1##3.2$$9-41#!5$$7-58##993#"km##pp."*3&mdash;54$(ndash;58*"85',
+    '#!.$&43&deg$"5p#$/429#!0$"00##1.5$!0$!4#!3#!5#!7#"cx#)f&ndash;g#"pp',
+    '*"61+!3##(1)$"3)#(,000,000##.5%##0.1$!0##1.0$"92#!2$!0#!3#!5$"44',
+    '$!0$"14##7.9$!0$"44##860%$58.5#"90$!2#)a&ndash;c#"cm#"d2#"lb",5&ndash;0036*#246',
+    '+"75*"59*"62##(4)#$,340%"92#"-t##.91#,0&ndash;3350$!0##151#!2$+&ndash;3659$".9$!0',
+    '#!4##6.6##729##8.7$"79#%92635#!a$%-245c#!c$!m#!f#"mm",6&ndash;1964*#254*!3',
+    '##(4)#&-litre#".2$$3(1)$!5$"8%#$/365#!0$!0#!1$"13##236#!3$!0#!4',
+    '%!9$"00##559#!6##7.1%!6$"67#!8$"30##9.0#!a##gts#!m#!p"*7&ndash;53',
+    '*!8##(1)#$,400#$-249$&member##.4/$!8##2.2%!6$"48$$9-31##6.0%!1##7.9$!8',
+    '#!9$".9$!0%!4$$7-98#!d#)g&ndash;h#"jy#!p"*8&ndash;51*!6##(2)$"4)#(,231,030$\'700,000',
+    '%"13#!.$"43#"03%!3$"92#!1$!1$"27$"84##2.9$!0##3.4%!9$"28',
+    '##4.0#!6$".4$!0##735##8.4##968#!a##cps#"pp"+9&ndash;250,!4+"76*"56#$,000',
+    '##.6p##0.8$!2##1.2$"29#!3$".1%!2%!6%!7#"50##7.1%!9$#000#"80',
+    '$!5#"cm"#:00#"13$!4$*5&ndash;24$!7$!9#!2$!3$!4#"34$!8#"46%!f',
+    '#!6#!7#!8#!9#.diagram/figure")a&ndash;b"!b#"it"#cms")d&ndash;f"!f#"t.""ha#!p"#in.',
+    '""kd#!m$(l/15smls#"ph"%mar93#!b#"hz#"pg#"th""pt""rd"-th&ndash;25th,#8th+$30th$%/25th',
+    '"!x#11&ndash;1/2x1/2in#/30x7&middot;5cm!&5%&sol#$-35%$%owned#!1#$very"%&cent#/deg&rehy;75&deg&*;c/ambient\'!f\'!s#+frac12&ins;)#;cm',
+    '#0ins&times;30&ins#)mdash;35p)!6*-.273&mdash;88)!7)!8$$gr;g$&icro;g*#/ml)!m#\'ndash;0)#1.0*!0*!1*!5',
+    ')"20*!1+!0*!3*!4*!5+&&deg;c+!8*#6th*\'7&deg;c*\'8&deg;s)#30g+"kg+#min+!p',
+    '*!3*\'5&deg;c)"40+)-year-old+!g*+4-year-olds*!5)#50%+-g/1&ndash;2oz+&mcg/kg*!5)#60%*!8*!9)!7',
+    ')%80khz*!4),9&ndash;1897*!5)$july)!o)$year#(times;12)230cm/10&times;12in""\'s""()#"5)#"7)#"a)"1,000&ndash;30,000',
+    '&/,000-30,000,000&%-acre\'$gate\'"km\'&strong\'%tonne\'$volt&"km&!t$"58##113%!8$"45%!6$"58',
+    '#%21,24%!5$"26$\'6,38,39$"89$$9,40##300&$,000$"55$"77##400&"ft$"30#\'500,000$"12',
+    '$"71%!2##600&$,000%%5,579$&27,000$&78,059##700$"18$"49$"66$"71##837$"94##993',
+    '#"11$!2%!5$!5$!6#$2-93$!1$!2$!3$!4$\'7&deg;c##30%%"mm$+5-year-olds$!9',
+    '$"0%#!5#!9##bed&$room##cap%&tegory$!m$&ountry%#ver#$date#)foot-long#&gallon$$oals$"un',
+    '##ish$#tem#)kilometre#&length$#ine%#tre##man$\'egawatt$$iler(!s$!l#$page$%oints%$unds#(shilling',
+    '%#one#%times$$o-50%!n#$watt$#eek%"ll$#ord#\'yearold"#.0%$!1$!5$!8#$1.88$"/2',
+    '%#.93$$1.91$!3$!7$!p#$2.91$!1$"2e$"3%$!6$!7$*9&ndash;34$"kg#(3&percnt%*times;35.5',
+    '$#3.6$!8#*4&times;28+&35.6cm+&40.6cm$#,14$%.1957$!2#*5&divide;2$"1%$!2$!3$"62$"kg$#mpg',
+    '#%61in.$!4#,7&times;19.3$!2$!5$"pc$$secs#%87sec$!9$!m$"pc#$9.90$-/47.1/37.2mpg$#2v.$#3r.',
+    '"(/&frac14#%07/89#!1$"/5%!6#$2/41$"21$"6/##373#!4$!0#$5/41##6/2%"87$!7',
+    '$!5#"85#$9/87"-0&amp;degreec$)deg/22kts$"ft$(mdash;67%$gr;l(!m%&icro;l$*ndash;1000+"25*&280pmh*%3000x+.50&ndash;400cc',
+    '+#75g*#400*#500-"mb$)times;4.5##,00&/0&ndash;350.000\'&-tonne\'!0$#535$#946%"70#"-1%"96$#300',
+    '$&bedded\'$room%!p$$fold%!t$$gram$)kilometre$$mark%)etre-high%(ile-long$$name$&person%#lus$&record$&seater',
+    '%%trong$$year##.2%#,0&ndash;2510-"39$%-foot$"16$"bp$"cc$"km$"m2$!s#!1$"50#)3&ndash;7',
+    '#!4$".1$"05%#kyr#!5##739#"80#,9&ndash;2513$!0#$=110#"bc#(cc-350cc$!u#"gm$!r',
+    '#"hz#"is#!k$"ev$!g$$jmol$"ms#$mbps$)hz-300mhz$"jy$)l/&frac14&-10oz/1&frac14&%8floz%!s$-m&ndash;600mm',
+    '#$v/hr"+1&ndash;253*!3#$,134$#568$#865##-bp$$page#!.$#202#!0$".4$$5-06%!0#"10',
+    '$"44#,2&ndash;2515$"51#!3$".9##402#!5$".8$!6#!6$#.13##7.2#"90#"lb""2%',
+    '$\'mdash;4$*times;10/l#"\'s#$,120$#497#\'-member$)processor$$seat$$tank#".7#$/277#!0$"50#!1$".2',
+    '$"44##2.0%!4%!6$"35##3.7$$7-39##5.3$"25$"45#!6#!7$"01#!g#!p',
+    '")3&ndash;4*"68*!7*!8#/.010&plusmn;496$"7p$"8%#"00$!3%!0#!1##2.6#!3$".1%"91',
+    '$"20##4.1%!3#!5#"60#"70$!2$!3##8.2%!4%!8##9.9$!0#!c#"pp',
+    '#!r"*4&frac12;p$)ndash;255*!4*!5#$,078$#389#$.254#"00%!4$#dpi#!1$".0%!2%!6',
+    '#!2$".3$!0#!3$$2-33##4.9#!6$".5%!6%!8$$9-70#"73$$6-79#%85-86#!9',
+    '$$3-96#"b4$!n#"cm#"ff#"jy"*5&frac12;p$&plus;5#(,000,000$#285$#667$#821#%-page##.6%$"8%',
+    '$+85&mdash;16##0.3%!7%!8$%00000$#rpm##141##2.0#!3$".0##4.3#!5$".9$!8##6.8',
+    '#!7$".2%!3$!0##8.4##9.7#!m#"pp%!m"+6&ndash;257*"64*"70#%-byte$\'kilobit$%level',
+    '$!6$!8#,0&ndash;2537$".0%!1%!2%!6$!0##155##2.0%!2#!3$".9$$7-38#"40',
+    '%!4%!5#!6$!0#%98-99#\':289:12#"ft#!g$!b#!h$!z#"k.$#bps#&mb/sec#"pp',
+    '#"th"+7&ndash;268*"65+!7#$,092$#397#"06$"77#!1#!2$".3$!0$"44##4.7%!8',
+    '#"86#!9$"27#"th"+8&ndash;268*#389*"60+!8*"71##(2)$"4)#(,750,000##-63#".8##0.5',
+    '$!4#"20##4.7%!8$!0$"78#"50##6.0#"90#!b$!c$!n""9%#)&mdash;60$)ndash;294',
+    ',!8*!6+!0+!1+!2#$,339#\'-strong#".4$!9%!4#!2##3.6#!5$+&ndash;7999$"/6',
+    '#$7.13#!8$".4#!9##pp."+:1&ndash;46+!7$!0$!2$$7ff.$-9&ndash;26:35#+20&ndash;40$#4:1$!5$!8',
+    '$!3#!4#!5$(&ndash;6$$9.96$#:90#*8&ndash;34"#bhp#!p")cm/10&ins\'2in&ndash;28cm/11in)$ches"#dvt""f9#&t-30ft',
+    '%#oz/#!b#%r/1oz""hp"#in.$!s"#khz#"ph#"yr"!l#"bs""ma#!g$"ml##l/1',
+    '&%imber$$oldm#!s""nm#"ot"\'o-65occ#"cc#"ft#!m""p.#$/min#!m#!p$!m"!r',
+    '"$secs"#tel#,h&ndash;26th,#7th,#8th$%-26th%$30th$#ies"$watt"\'x20&deg$%5x3mm"&yarder#$ears\'$-old!&6%-54%',
+    '#&frac12)#;in#\'mdash;1)!7)$9365$\'iddot;6#0ndash;11&ndash;0*"2-*"36*!5*!8*!b)(27&deg;c*\'8&deg;c)&30/min',
+    '*!3+!1*#8kg*!9)!4)!5*1&ndash;95&ndash;2*"0%*!3*!9)"61*!2*$5041)!7)!8',
+    ')(december)#end)$year#&percnt#,sol;1&sol;17"#(2)$"7)#"3)#"b)"),000-acre&"ft$"97#%27,29$*8&ndash;30#%31,32',
+    '$"20$"91##455#\'500,000$"13$"49##600$"18$"98##708##838$"70$"85##987"!-',
+    '#"23$!4$!6#"60#\'bedroom$"ut#!c$#opy%$unty#$inch##jan#!m$"an$%ember$&illion',
+    '#&nation$"il#$oct.$"dd#$page%"rt$%erson$$oint#$room#$seat#%valve$%olume#)year-olds\'#old"#.02',
+    '$$2.93$!3$!4$!6#"22$"6p$!a$"ms#"30$!4$!5%!3##4kd#)5&ndash;6%(times;37',
+    '$\'1/10.75$!3$!9$#mpg$"oz$!p#$6.92$!0$!4%#sec$!5$"ft$#mpg&!h$"pc',
+    '$!0$!1$!3$!7$!p%!c##92p$$7mph$!9$#mph"(/&frac14#!0#%10/76&&93/cde%%0,000',
+    '#$2/41$#7th$!8$"96#$3/77$!0#$4/86&!9$!4#$5/91#$9/90"(0&deg/15\'%;cmyr%\'ivide;2$*ndash;2300',
+    '*#520*$9700#$,268##-bp$&member$%pupil$$yard#"0+$".5$\'/minute$!5$!7$"lb$!m#"15',
+    '#!2$!0%!6$!2$!3$!7$"84##3.7#"43#$5.63$!0#"60$!2#!7#"80',
+    '$(&ndash;f##ff.$!t##mhz#!s#"tc#&x270cm")1&ndash;2*"82#\'-member##.53$!6$"88$"9%#!0',
+    '$#381$$7266#"10#"20$"28$"75#%31-32#!4$".1##5.7#$6033##7.0#!8#$9093$"mm',
+    '#"lb#"mm""2%#*&ndash;174*!4*"71#"-6##.5%#!0$$9-10#!1$".2#"22##305#!4',
+    '$"33#!5#!6$"64##739##844##941##pp.")3&ndash;4#$,096$#400##-11$\'bedroom$&strong#%/1326',
+    '$$1-04#%41-42##5.4$!0#!6$".1##749##8.6#!9$!0"+4&ndash;265+"83*!5*"69*"92',
+    '#$,000$#154$#200$#500#".1##0.2$"83$$9-10$!m#"10%!2#!3#!4$"91##5.7',
+    '$!8#!6#"80$$6-97#%96-97#)e&ndash;f##kgs#"mb#!p$"p.")5&ndash;6+!6#$,763##.2p#"12',
+    '#!3#!4$".1##511$#970#!6#"72#!8$".1$$5-86%!8#!9$".8#)a&ndash;b#)f&ndash;g',
+    '#!k##lbs#"th""6%#)&ndash;71$&sol;85##(2)$"3)#$,090&!8$#728#"-6##.7%#!0$!1',
+    '#!1$"72##2.2$"66#!3$!0#!4$#.64#!5$!0$"61#!6$"57$!8#"70',
+    '$!8#!9$".7#!g#!m$#bps"$7(1)$"2)#$,000$#339##.15#%09-10##284#%33-36#"55',
+    '$!2#!7$!0#!8$!1##9.6#\'m-flops$#bps#"pp""8%#)&ndash;83*"92#$,720#".5#"0.',
+    '$"27##1.9$!0#!2$!0#"40#"50%#-51##621#,7&ndash;2688#!g#!s"+9&ndash;273*"70+!4',
+    '#$,000$#300##028#!2#"30$"18##4.2##5.4$$3390##7.6$$3-75##8.7$$9-91"+:1&ndash;37+!4',
+    '$!6$*7&ndash;19%"ff#+20&ndash;25$!3$!6$!8$!9#"30%(&ndash;5$!1$*6&ndash;46#+47&ndash;56#"56$!7',
+    '$!9#*6&ndash;13$*0&ndash;61$!4$*7&ndash;68$*9&ndash;75#!9#.diagram/figure"$b-31#!x"!c""er""gb""hp$&/tonne',
+    '"#lbs"$m56s#"ph"!o""pp#!t""sl"#tel#,h&ndash;29th$%-27th&#9th%&minute!\'7&deg;s$\'ollar;c#(mdash;28',
+    ')!9#(ndash;04)-10&ndash;1851*!1*!5+1&ndash;0&ndash;30+!p*"89)"23*"46*!5*#8th*\'9&deg;c+%/5/41)!3',
+    '*!6*!7*!8)!4*!0*"10*!2*!3*!5*!6)!5)#60%*!1*!7)27&ndash;71&ndash;0',
+    '#+shilling;6d""\'s"#(9)#"a)#"c)#"d)#"e)"0,000&ndash;15000&,-square-foot(%trong\'#ton&"sq$"44$"62##100',
+    '$#991##200$"19$"34$$44.6$$8,33##310$!4$$5,40$"93%!8##400$!1$!3$"40',
+    '$"73$"80#\'500,000&\'rev/min$"94##600$"37$"72##700&$,000$"52%!8$"77$"97##837',
+    '%!1##900$&75,000"#-12$!3$!5$!7#"20#%35sec#&august##day$%egree#$fold%$oter$!t',
+    '#$hour#)kilometre#%match$$etre#%point##run#%sept.$$hare$%torey%$rong#%tonne%(urnament#\'yearold"#.0%$#mpg',
+    '$!0%#.90$"28$*3&ndash;19$!4#$2.87$!5$!7$!8%(&ndash;9#,3&times;20.3$%.1991%"91$!3$!4',
+    '$*9&ndash;40$!p$$secs#$4.90&!3$!0$"kg#\'5&deg;n%#ins$#.91&!2$!0$!m%"yr#$6.90',
+    '$!5$!8$!9$#mpg$"pc#&7-mile$#.80$!4$!6$!7$"89#$8.81$"6m$!7$!8',
+    '#"96%"v.$#7r.$#8r.$!f$#mpg$"pc""/0#%10/87#"32$!7#$4/41$!3##605$!4',
+    '$!0$!7""0%#(&mdash;2$\'ndash;1*!2+"40*!6*"81+!3#(-bedroom#!.#$/202$#454#,0&ndash;1300',
+    '$"00%"31$!1$!6##1.9$"70$!9#!2##3.6$$3-35#!4$".0%!5%!6$!3',
+    '$$3-54#!6$!8##7.6$!5#!8$"60#"90#"gb%!.#!k#!m$!b$!l$"ph',
+    '""1%#(&ndash;6*#767*"87$&plus;5##(1)$"2)#$,759#\'-minute#!.#"/8##034##1.9#"20$"33',
+    '$"ft##3.4$!0$!1#!4$".6##6.2$"72##7.9#!8##9.7#$:156#)a&ndash;b#)b&ndash;d##pp.',
+    '*!4*!6##(1)#$,817##.58##0.5$!3##1.8$"31#!2$".9$"00#$3436##5.6#!6',
+    '$!2$!5$"71$!9##726#"87$"94#!9#!a#"ff"\'3&deg;c$)ndash;274*"80#(,000,000#$-ton',
+    '$"15%!6&&&deg;c$(68-point#"01##140##223#!3$!0$"30$"ft#!4$!6#,6&ndash;4151##7.6',
+    '#!a$+&ndash;275b#"ev#"ff#!k"+4&ndash;279*!6*!7*"89#$,000$#500$#914#%-room##0.3$!3',
+    '#!2$"84#!3$!0#!4#!5$".2##8.7$!7%#-88#!g##pp."+5&deg;f/gas$*mgr;molmol$)ndash;276',
+    '##(3)#(,000,000$#350$#500##-30$%i/iii$#kph$$yard##0.7$!0$!m$#rpm#$2.13#"35#%41-43',
+    '##7.9#"80##9.2$!0$!5##ff.#"kg#"lb##mcg#"th"+6&ndash;277*#324*!5#$,921#$-113',
+    '$&member$(year-old##.33%#mph#"/5#!0##122#!2$!0##3.1##4.5%!9$!0#"60#*9&mdash;70',
+    '#"mm##pp."+7&ndash;279*"87#"-6#!.$!6#"/6#!0$#rpm##1.9#!3$".3$#920#%41-43',
+    '#"50#!7#)b&ndash;f#!h#!p""8%#)&middot;5$)ndash;279*"84+!8#"-9$#day#".5#!0$!0',
+    '#!3$!0$$5-36$"71#!4$#168#"53#!6$".8$!0#"70##802##9.7#!b#)c&ndash;d',
+    '#"th")9&ndash;2*$7514*"80*"94##(1)$"2)#"-2#!0$%/2791$!0#!1$".9##2.0$!0',
+    '%!0$!3##484#!5##6.5#!7$".3#!8$!0#!p"#:08#!1$)&ndash;19+"26$!6',
+    '$*7&ndash;31#"32$*3&ndash;44$":1#+45&ndash;54$!6#"50$*1&ndash;53%#.76$!4$*5&ndash;56$!7%)&ndash;61#!6$!6',
+    '""bc""cm$!s"!g#%/4005""in$!s#$raqi"!k#"da"!l#"bs"&m/90ft#"pg$!h',
+    '"&strong"-th&ndash;29th$%-29th%$30th%&minute$%/28th$!e"$year!$8%of"&&deg;s#&frac58#(mdash;29)"30*!6#(ndash;11',
+    '+1&ndash;1&ndash;33*!7*!9)12&ndash;1&ndash;5*,6b&ndash;1zq)!3*(&ndash;0*"0f*!6*!8*!o)#40%+"ft)!6*!3',
+    '*!5),7&ndash;1845*!2*!8),8&ndash;1866*!0*!2)29&ndash;0&ndash;18*!1)#thu#+shilling;4d#,times;42&ins"#(4)#"a)#"f)',
+    '&%-plus\'$seat(%trong$"97##100$!2$"50#\'201,743#+32&ndash;34$"45$"50%!5##429##545#\'600,000',
+    '$"83##722$"50$"88$"94##877##910$"35$"70"!-#".9#"11$!2#"22#!3',
+    '#"61#%april#\'bedroom#\'country#(days-old$#ec.#$inch##mar&"ch$#ers$#ile$$onth#$page%"rt$%erson',
+    '#$seat%#pt.$#tep%#one##ton&"ne$$rack$$urns#)under-par#$volt"#.01%!%%#.92$"2m$"47',
+    '$*0&ndash;22%#.91$$1.90$!6#"23$!4$"65#"3%$$3sec$"4p$!6$"pc$$secs#$4.76&!7',
+    '$!m%"pg#\'5&deg;c$%.1966$!3%!m$"56$"cm$"ff$"kd##66%$!7$!p#"75#"8%',
+    '$!5#09&deg;c/84&deg;f$%.1992$!2$+mph/1000rpm"!/#%11/92$$2/92#"2/#$3/41%"87$"00#&4/1987%"41$"22',
+    '$!7#"84#!9#%april"\'0&deg;c(!f$%mdash)$;337$\'ndash;1+"50*!2+"70,!5+"81*%300kg',
+    '+"20*"93##(1)#$,600#%-acre$"hp##.4%$"9p#$/290$!l##0.0$!7#"1a#"20#"40',
+    '##613##7.2%!7#"80$!7$#844##9.5#!f#&g/10oz$!m#!k#"nm##ppt#"sq#"th',
+    '*#358+"77$&plus;3#$,285$#500#"-5#%02-03$!6$"ft#&1/8014$!0$"30#!2$".5%!6',
+    '$!0#!3$".1#!4$".0%!1##544##6.2%!5%!8%!9$!0$"60#!7$".0',
+    '$!0$!4#$9.70$"53#(b/square#!m#"pp"%2&deg$*ndash;1406*#286*#327##(3)#$,755#!.##0.1',
+    '#!1$".8$"01#$2.10%!3$!1$"50#$3.90$"87$"94##4.4#!5$".5##6.6$!0',
+    '#"70#!8$".7%!9#!9$".8%!9$!6$!8#,a&ndash;285d#!p")3&ndash;4*!9#$,220#%-page',
+    '#!.##0.0%!9$!1##1.3%!7$!0$"33##2.3%"50##3.0%!6$!0##4.3$"00',
+    '##5.7##6.1%!3##7.1%!5$!1#!8$".3%!5%!8#!9$".7#)b&ndash;c#"gb##lb.',
+    '"+4&ndash;303,!5*.5,318&ndash;19*"91#\'(1)-(3)$"4)#$,000#!0$".0##2.0%!1%!9$%/2281$!0#!3',
+    '%!3%!8%$9900#$4.20%!4%!8$#186##5.3##6.8$!2##7.0%!3##8.1%!3$!2',
+    '$!9#$9.20%!3$$7-98$!8$!9%$-500##ff.#)g&ndash;h"-5&ndash;265bc*!9$*times;10/l##(1)$"2)$"3)',
+    '$#462$\'659,000$\'700,000\'\'-strong##.77#"00#$1562##2.8%!9$!0$"10#%33-38##5.3##6.1$!5',
+    '$!0$!6##8.1&!0#)e&ndash;f#!g##mhz$!l"+6&ndash;120,#mhz+#722*!2+$0mhz*"90+!1',
+    '$"3)##-xt#".2%%69mph#(/386/486$"40#!0$".6##1.0%!1%!5%!8##2.3%!9$!0',
+    '##3.0%!9$#860##6.9$!0$!3#!7$!0##876##9.6%!9#"bp#"cm#)e&ndash;f#"hp',
+    '""7%#*&ndash;212+"88*#361*!9+!8##(3)#$,876#!0$".0$!0##1.7$!0#"22%!4',
+    '$!7#"42$!3##5.7#!6##8.4%!7$!0#!9$".7$$3-97#!b#!e#!g#!k',
+    '#"pp#"th")8&ndash;9##(3)$"4)#(,600,000#".0$"44#!0$"31$!8#$1.10##2.3%!6##3.0',
+    '#!5$".6##6.0$$1-62#$7.40$!0#$8.80$!8##9.9#"ff##gto#"mw"+9&mdash;291*"90$)ndash;311',
+    '*"92##(5)#$,343#$-261#".3$"5%$"6%##000$$7-08#"10$"15$!3$!7%#-18$!8',
+    '$!2#"31##4.7$"04#"50#"60##7.0$!0##978#"cu"":1$*1&ndash;15$*6&ndash;31$!7#"20',
+    '$*5&ndash;28#"31$*3&ndash;34$"f.#!7$",8""b.##out")c&ndash;1##(e)##-31""ff"!k#!b""mb',
+    '#!z""pp""s-#!.$#6d."#tel#&h-30th%&minute$!.$%/29th"\'x45.5cm!%9&deg#*formula;kg$)rac12;ins#(mdash;33',
+    '$\'iddot;3#(ndash;10*!5*29&ndash;2&ndash;402*3&ndash;41+"82)"20*24&ndash;1&ndash;49))3&ndash;01$1883*\'0&deg;c*!4*!5*!8)$49ft',
+    '+!%*!8)#74%*#5.9)"87)%april#&percnt#-rehy;year-old"#(5)#"6)#"a)#"d)"/,000-30,000-odd&#tyr&%votes',
+    '%$8-ft&"ft$"40$"58%!9##100&$,000$#917%"41##224##370##431$"76#\'500,000$"62',
+    '##600$"17$"76##800%!4$"19$"22$"43$"55#\'900,000$"72""-0#!1$!6$!7',
+    '#!3$!9#!6#$aug.#\'bedroom#\'country#(feb-1999$%ooter#$june##key#!m$$onth#&nation$$ov.1#$page',
+    '$#oom#$seat%#pt.$$tone%$rong#%times#.wellingborough#)year-olds"..0&amp;percent$!0$!3$!4$!6$!7$!9',
+    '$#.82%"92$!2%#.92(!7$!3$"4%$!6$"pc#$2.12$*0&ndash;21$!1%%3.6gm$!7$#kda',
+    '$!2%!%$!6%!s#&4.1987%"91$!0$!4#\'5&aring%#deg(";c$&-point$!1$"6%$!8',
+    '$"mm$!p#%6-day$!4$!5##710$!3$"cm$#mhz#$8.77%"89%"90$!5#&9.1922%"92',
+    '$"3%$!5$!9$#mph"(/10/1(f)%!2#*25&ndash;1#$3/41%"93$!1$!8$!9#$4/41$!2#$5/87',
+    '#"74#"92#&a/90/8"\'0&deg;c$)ndash;270+"96##(1)$"3)$"4)$"5)#$,435#%-page#\'.000,00$-4&ndash;521.8##/20',
+    '%!1%"21%!7$\'0-based%#000%!s',
 )
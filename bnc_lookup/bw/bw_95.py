@@ -2,6700 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_95 = (
-    '1800&ndash;1950',
+count_95 = 6694
+
+heads_95 = (
     '1800&ndash;2300',
-    '1800&ndash;40',
-    '1800&ndash;42',
-    '1800&ndash;62',
-    '1800&ndash;66',
-    '1800&ndash;70',
-    '1800&ndash;72',
-    '1800&ndash;77',
-    '1800&ndash;82',
-    '1800&ndash;89',
-    '1800&ndash;92',
-    '1800-',
-    '1800-1860',
-    '1800-1900',
-    '1800-1920',
-    '1800-1950',
     '1800-1980',
-    '1800-strong',
-    '1800.',
-    '1800.57',
-    '1800/sq',
-    '1800cc',
-    '1800hz',
-    '1800k',
-    '1800m',
-    '1800mg',
-    '1800mw',
-    '1800n',
-    '1801&ndash;02',
-    '1801&ndash;1803',
-    '1801&ndash;1847',
-    '1801&ndash;1860',
     '1801&ndash;1865',
-    '1801&ndash;1880',
-    '1801&ndash;1883',
-    '1801&ndash;1890',
-    '1801&ndash;2',
-    '1801&ndash;6',
-    '1801&ndash;71',
-    '1801&ndash;77',
-    '1801&ndash;82',
-    '1801&ndash;90',
-    '1801-2',
-    '1801/h',
-    '1802&mdash;6',
-    '1802&ndash;13',
-    '1802&ndash;15',
-    '1802&ndash;1871',
     '1802&ndash;1874',
-    '1802&ndash;1876',
-    '1802&ndash;3',
-    '1802&ndash;42',
-    '1802&ndash;5',
-    '1802&ndash;56',
-    '1802&ndash;67',
-    '1802&ndash;71',
-    '1802&ndash;81',
-    '1802&ndash;90',
-    '1802&ndash;94',
-    '1802.',
-    '1803&mdash;15',
-    '1803&ndash;10',
-    '1803&ndash;15',
-    '1803&ndash;1815',
     '1803&ndash;1873',
-    '1803&ndash;1876',
-    '1803&ndash;1877',
-    '1803&ndash;1880',
-    '1803&ndash;1883',
-    '1803&ndash;1884',
-    '1803&ndash;1947',
-    '1803&ndash;4',
-    '1803&ndash;40',
-    '1803&ndash;49',
-    '1803&ndash;5',
-    '1803&ndash;6',
-    '1803&ndash;69',
-    '1803&ndash;86',
-    '1803/04',
-    '18033',
     '1804&mdash;6',
-    '1804&ndash;11',
-    '1804&ndash;14',
-    '1804&ndash;17',
-    '1804&ndash;1854',
-    '1804&ndash;1867',
-    '1804&ndash;1876',
-    '1804&ndash;1894',
-    '1804&ndash;24',
-    '1804&ndash;69',
-    '1804&ndash;72',
-    '1804&ndash;81',
-    '1804&ndash;94',
-    '1804/5&ndash;1890',
-    '1805&ndash;1823',
-    '1805&ndash;1861',
     '1805&ndash;1863',
-    '1805&ndash;1872',
-    '1805&ndash;1886',
-    '1805&ndash;1891',
-    '1805&ndash;6',
-    '1805&ndash;68',
-    '1805&ndash;79',
-    '1805&ndash;8',
-    '1805&ndash;81',
-    '1805&ndash;9',
-    '1805-73',
-    '1805.7&ndash;13.135',
-    '1806&ndash;11',
-    '1806&ndash;12',
-    '1806&ndash;1873',
-    '1806&ndash;1877',
     '1806&ndash;1880',
-    '1806&ndash;1883',
-    '1806&ndash;1890',
-    '1806&ndash;93',
-    '18060',
-    '1807&mdash;09',
-    '1807&mdash;10',
-    '1807&ndash;11',
-    '1807&ndash;12',
-    '1807&ndash;13',
-    '1807&ndash;1858',
-    '1807&ndash;1885',
-    '1807&ndash;1899',
-    '1807&ndash;34',
-    '1807&ndash;72',
-    '1807&ndash;83',
     '1807&ndash;86',
-    '1807&ndash;87',
-    '1808&mdash;9',
-    '1808&ndash;1809',
-    '1808&ndash;1810',
-    '1808&ndash;1814',
-    '1808&ndash;1865',
-    '1808&ndash;1882',
-    '1808&ndash;1891',
-    '1808&ndash;1936',
-    '1808&ndash;65',
-    '1808&ndash;74',
-    '1808&ndash;93',
-    '1808&ndash;95',
-    '18081814',
-    '1809&ndash;10',
     '1809&ndash;13',
-    '1809&ndash;14',
-    '1809&ndash;1814',
-    '1809&ndash;1845',
-    '1809&ndash;1856',
-    '1809&ndash;52',
-    '1809&ndash;72',
-    '1809&ndash;98',
-    '1809&ndash;march',
-    '1809.50',
-    '18090',
-    '180c/',
-    '180c/350c/gas',
-    '180c/350f/gas4',
-    '180ha',
-    '180hz',
     '180j',
-    '180km/h',
-    '180kwh',
-    '180m/600ft',
-    '180mile',
-    '180ml',
-    '180mm',
-    '180o',
-    '180oc',
-    '180yd',
-    '181&mdash;3',
-    '181&ndash;145',
-    '181&ndash;2',
-    '181&ndash;7',
-    '181&plus;3',
-    '181-bed',
     '181-i/ii',
-    '181.8',
-    '181/89',
-    '1810&ndash;11',
-    '1810&ndash;16',
-    '1810&ndash;17',
-    '1810&ndash;1811',
-    '1810&ndash;1813',
-    '1810&ndash;1820',
-    '1810&ndash;1890',
-    '1810&ndash;1910',
-    '1810&ndash;30',
-    '1810&ndash;48',
-    '1810&ndash;86',
-    '1810&ndash;89',
-    '1810-',
     '1810-77',
-    '1810.42',
-    '18100',
-    '1811&mdash;16',
-    '1811&ndash;12',
-    '1811&ndash;15',
-    '1811&ndash;1883',
-    '1811&ndash;1899',
-    '1811&ndash;1900',
-    '1811&ndash;27',
-    '1811&ndash;48',
-    '1811&ndash;50',
-    '1811&ndash;77',
-    '1811&ndash;88',
-    '18110',
-    '18112-pound',
     '1812&mdash;13',
-    '1812&ndash;13',
-    '1812&ndash;16',
-    '1812&ndash;18',
-    '1812&ndash;1814',
-    '1812&ndash;1820',
-    '1812&ndash;1873',
-    '1812&ndash;1878',
-    '1812&ndash;1888',
-    '1812&ndash;1889',
-    '1812&ndash;1904',
-    '1812&ndash;27',
-    '1812&ndash;43',
-    '1812&ndash;70',
-    '1812&ndash;71',
-    '1812&ndash;96',
     '1812\'s',
-    '1812.5',
-    '1813&mdash;14',
-    '1813&ndash;16',
-    '1813&ndash;1781',
-    '1813&ndash;18',
-    '1813&ndash;1814',
-    '1813&ndash;1855',
-    '1813&ndash;1858',
-    '1813&ndash;1870',
-    '1813&ndash;1881',
-    '1813&ndash;1895',
-    '1813&ndash;1898',
-    '1813&ndash;19',
-    '1813&ndash;1909',
-    '1813&ndash;20',
     '1813&ndash;21',
-    '1813&ndash;47',
-    '1813&ndash;55',
-    '1813&ndash;73',
-    '1813&ndash;74',
-    '1813&ndash;78',
-    '1813.12&ndash;1.1',
-    '181385',
-    '1814&mdash;21',
-    '1814&mdash;30',
-    '1814&ndash;17',
-    '1814&ndash;1820',
-    '1814&ndash;1833',
-    '1814&ndash;1860',
-    '1814&ndash;1873',
-    '1814&ndash;1893',
     '1814&ndash;1896',
-    '1814&ndash;1897',
-    '1814&ndash;1900',
-    '1814&ndash;20',
-    '1814&ndash;21',
-    '1814&ndash;22',
-    '1814&ndash;23',
-    '1814&ndash;73',
-    '1814&ndash;76',
-    '181440',
-    '1815&mdash;60',
-    '1815&ndash;16',
-    '1815&ndash;1852',
-    '1815&ndash;1880',
-    '1815&ndash;1899',
-    '1815&ndash;1901',
     '1815&ndash;1902',
-    '1815&ndash;1914',
-    '1815&ndash;1951',
-    '1815&ndash;20',
-    '1815&ndash;27',
-    '1815&ndash;54',
-    '1815&ndash;65',
-    '1815&ndash;97',
-    '18151',
-    '18151-55',
-    '181565',
-    '18159',
-    '1816&mdash;18',
-    '1816&ndash;18',
-    '1816&ndash;1879',
-    '1816&ndash;1882',
     '1816&ndash;1886',
-    '1816&ndash;1888',
-    '1816&ndash;1893',
-    '1816&ndash;1894',
-    '1816&ndash;1899',
-    '1816&ndash;1919',
-    '1816&ndash;20',
-    '1816&ndash;44',
-    '1816&ndash;86',
-    '1816&ndash;96',
-    '1816&ndash;july',
-    '1816.',
-    '1817&mdash;18',
-    '1817&ndash;1834',
-    '1817&ndash;1840',
-    '1817&ndash;1872',
     '1817&ndash;1892',
-    '1817&ndash;1905',
-    '1817&ndash;1911',
-    '1817&ndash;22',
-    '1817&ndash;26',
-    '1817&ndash;35',
-    '1817&ndash;41',
-    '1817&ndash;58',
-    '1817&ndash;81',
-    '1817&ndash;92',
-    '1817&ndash;93',
-    '1817&ndash;97',
-    '181793',
-    '1818&ndash;1883',
-    '1818&ndash;1884',
-    '1818&ndash;1890',
     '1818&ndash;1906',
-    '1818&ndash;1914',
-    '1818&ndash;24',
-    '1818&ndash;25',
-    '1818&ndash;26',
-    '1818&ndash;45',
-    '1818&ndash;81',
-    '1818&ndash;86',
-    '1818&ndash;87',
-    '1818&ndash;90',
-    '1818&ndash;96',
-    '18180',
-    '18187-90',
-    '1818mm',
-    '1819&ndash;1822',
-    '1819&ndash;1861',
     '1819&ndash;1875',
-    '1819&ndash;1878',
-    '1819&ndash;1883',
-    '1819&ndash;1893',
-    '1819&ndash;1905',
-    '1819&ndash;1916',
-    '1819&ndash;21',
-    '1819&ndash;22',
-    '1819&ndash;24',
-    '1819&ndash;29',
-    '1819&ndash;93',
-    '181b',
-    '181ft',
-    '181g',
-    '181ins',
-    '181pp',
     '181st',
-    '182&ndash;4',
-    '182&ndash;8',
-    '182&ndash;92',
-    '182(2)',
-    '182,300,000',
-    '182,700',
-    '182-4',
-    '182-seat',
-    '182.194',
-    '182.4',
-    '182.8',
-    '182.9',
-    '182/352',
-    '182/90',
-    '1820&mdash;1',
     '1820&ndash;1',
-    '1820&ndash;1832',
-    '1820&ndash;1883',
-    '1820&ndash;1885',
-    '1820&ndash;1891',
-    '1820&ndash;1895',
-    '1820&ndash;1896',
-    '1820&ndash;1912',
-    '1820&ndash;1973',
-    '1820&ndash;33',
-    '1820&ndash;37',
-    '1820&ndash;55',
-    '1820&ndash;60',
-    '1820&ndash;7',
-    '1820&ndash;77',
-    '1820&ndash;87',
     '1820-1892',
-    '1820.0',
-    '182024',
-    '1820a',
-    '1821&ndash;1825',
-    '1821&ndash;1875',
-    '1821&ndash;1880',
-    '1821&ndash;1881',
-    '1821&ndash;1889',
-    '1821&ndash;1890',
-    '1821&ndash;1902',
-    '1821&ndash;1911',
-    '1821&ndash;1914',
-    '1821&ndash;22',
-    '1821&ndash;28',
-    '1821&ndash;34',
     '1821&ndash;4',
-    '1821&ndash;68',
-    '1821&ndash;81',
-    '1821&ndash;94',
-    '1821-1911',
-    '1821/2',
-    '1822&mdash;27',
-    '1822&ndash;1876',
-    '1822&ndash;1896',
-    '1822&ndash;1898',
-    '1822&ndash;1903',
-    '1822&ndash;1911',
-    '1822&ndash;30',
-    '1822&ndash;4',
-    '1822&ndash;5',
-    '1822&ndash;6',
     '1822&ndash;84',
-    '1822&ndash;89',
-    '1822&ndash;94',
-    '1823&ndash;1865',
-    '1823&ndash;1893',
-    '1823&ndash;1901',
-    '1823&ndash;1904',
-    '1823&ndash;1906',
-    '1823&ndash;1907',
-    '1823&ndash;24',
-    '1823&ndash;31',
-    '1823&ndash;33',
-    '1823&ndash;6',
-    '1823&ndash;86',
-    '1823&ndash;87',
-    '1823&ndash;92',
     '1823&ndash;93',
-    '1823&ndash;99',
-    '1823/4&ndash;1872',
-    '18230',
-    '1824&ndash;1882',
-    '1824&ndash;1905',
-    '1824&ndash;20',
-    '1824&ndash;25',
-    '1824&ndash;26',
-    '1824&ndash;28',
-    '1824&ndash;32',
-    '1824&ndash;33',
-    '1824&ndash;44',
-    '1824&ndash;75',
-    '1824&ndash;80',
-    '1824&ndash;81',
     '1825&mdash;50',
-    '1825&ndash;1893',
-    '1825&ndash;1895',
-    '1825&ndash;1903',
-    '1825&ndash;1904',
-    '1825&ndash;1910',
-    '1825&ndash;1911',
-    '1825&ndash;1914',
-    '1825&ndash;1917',
-    '1825&ndash;37',
-    '1825&ndash;55',
-    '1825&ndash;89',
-    '1825&ndash;9',
-    '1825&ndash;92',
-    '1825&ndash;95',
-    '1825-1880',
     '182595',
-    '1826&ndash;1877',
-    '1826&ndash;1882',
-    '1826&ndash;1883',
-    '1826&ndash;1884',
-    '1826&ndash;1893',
-    '1826&ndash;1896',
-    '1826&ndash;1905',
-    '1826&ndash;1907',
-    '1826&ndash;1910',
-    '1826&ndash;1913',
-    '1826&ndash;43',
-    '1826&ndash;66',
-    '1826&ndash;8',
-    '1826/7',
-    '18260',
     '1827&ndash;1829',
-    '1827&ndash;1861',
-    '1827&ndash;1881',
-    '1827&ndash;1894',
-    '1827&ndash;1904',
-    '1827&ndash;1906',
-    '1827&ndash;1907',
-    '1827&ndash;1912',
-    '1827&ndash;31',
-    '1827&ndash;35',
-    '18270',
-    '18279',
-    '1828&ndash;1892',
-    '1828&ndash;1896',
-    '1828&ndash;1913',
-    '1828&ndash;1914',
     '1828&ndash;1921',
-    '1828&ndash;32',
-    '1828&ndash;34',
-    '1828&ndash;79',
-    '1828&ndash;89',
-    '1828&ndash;93',
-    '1829&ndash;1860',
-    '1829&ndash;1862',
-    '1829&ndash;1888',
-    '1829&ndash;1904',
-    '1829&ndash;1907',
-    '1829&ndash;1913',
-    '1829&ndash;1916',
-    '1829&ndash;1921',
-    '1829&ndash;31',
-    '1829&ndash;32',
     '1829&ndash;34',
-    '1829&ndash;49',
-    '1829&ndash;60',
-    '1829&ndash;69',
-    '1829&ndash;76',
-    '1829&ndash;96',
-    '1829-1856',
-    '1829-52',
-    '1829/30',
-    '182b',
-    '182kg',
-    '182pp',
-    '183&deg;c',
-    '183&deg;m',
-    '183&ndash;184',
-    '183&ndash;5',
     '183&ndash;6',
-    '183&times;122cm',
-    '183(5)',
-    '183,000,000',
-    '183,400',
-    '183,474',
-    '183,557',
-    '183,743',
-    '183-92',
-    '183-seat',
-    '183.6%',
-    '183.7%',
-    '183/89',
-    '1830&ndash;1',
-    '1830&ndash;1833',
-    '1830&ndash;1857',
     '1830&ndash;1865',
-    '1830&ndash;1886',
-    '1830&ndash;1900',
-    '1830&ndash;1903',
-    '1830&ndash;1905',
-    '1830&ndash;1950',
-    '1830&ndash;2030',
-    '1830&ndash;32',
-    '1830&ndash;40',
-    '1830&ndash;41',
-    '1830&ndash;70',
-    '1830&ndash;80',
-    '1830&ndash;95',
-    '1830.',
-    '1830.48',
-    '1830/1',
     '1830/1930',
-    '1830/31',
-    '18300',
-    '1831&ndash;1835',
-    '1831&ndash;1877',
-    '1831&ndash;1879',
-    '1831&ndash;1892',
-    '1831&ndash;1895',
-    '1831&ndash;1901',
-    '1831&ndash;1904',
-    '1831&ndash;1906',
-    '1831&ndash;1907',
-    '1831&ndash;1908',
-    '1831&ndash;1916',
-    '1831&ndash;1923',
-    '1831&ndash;35',
     '1831&ndash;4',
-    '1831&ndash;41',
-    '1831&ndash;45',
-    '1831&ndash;60',
-    '1831&ndash;65',
-    '1831&ndash;79',
-    '1831&ndash;9',
-    '1831&ndash;91',
-    '1831-1907',
-    '1832&mdash;33',
-    '1832&ndash;1845',
-    '1832&ndash;1847',
-    '1832&ndash;1856',
-    '1832&ndash;1857',
-    '1832&ndash;1868',
-    '1832&ndash;1883',
     '1832&ndash;1898',
-    '1832&ndash;1901',
-    '1832&ndash;1902',
-    '1832&ndash;1905',
-    '1832&ndash;1920',
-    '1832&ndash;3',
-    '1832&ndash;4',
-    '1832&ndash;47\'',
-    '1832&ndash;5',
-    '1832&ndash;7',
-    '18320',
-    '18323',
-    '1833&ndash;1883',
-    '1833&ndash;1889',
-    '1833&ndash;1901',
-    '1833&ndash;1907',
     '1833&ndash;1913',
-    '1833&ndash;1916',
-    '1833&ndash;1917',
-    '1833&ndash;1919',
-    '1833&ndash;1922',
-    '1833&ndash;4',
-    '1833&ndash;7',
-    '1833-68',
-    '1834&ndash;1891',
-    '1834&ndash;1900',
-    '1834&ndash;1907',
-    '1834&ndash;1914',
-    '1834&ndash;1915',
-    '1834&ndash;1921',
-    '1834&ndash;1924',
-    '1834&ndash;40',
     '1834&ndash;5',
-    '1834&ndash;66',
-    '1834&ndash;7',
-    '1834-68',
-    '1835&mdash;41',
-    '1835&ndash',
-    '1835&ndash;1895',
-    '1835&ndash;1900',
-    '1835&ndash;1901',
-    '1835&ndash;1902',
-    '1835&ndash;1910',
-    '1835&ndash;1917',
-    '1835&ndash;1918',
-    '1835&ndash;40',
-    '1835&ndash;48',
-    '1835&ndash;6',
     '1835&ndash;9',
-    '1835-',
-    '1835-1910',
-    '1835-1918',
-    '1835-6',
-    '1835.',
-    '18355',
-    '1836&ndash;1865',
-    '1836&ndash;1909',
-    '1836&ndash;1918',
-    '1836&ndash;1923',
-    '1836&ndash;37',
-    '1836&ndash;40',
-    '1836&ndash;42',
-    '1836&ndash;61',
-    '1836&ndash;70',
     '1836&ndash;8',
-    '1836&ndash;93',
-    '1836-1922',
-    '1836-nov.',
-    '1836/7',
-    '18360',
-    '1837&ndash;1897',
-    '1837&ndash;1898',
-    '1837&ndash;1900',
-    '1837&ndash;1901',
-    '1837&ndash;1905',
-    '1837&ndash;1907',
-    '1837&ndash;1911',
-    '1837&ndash;1913',
-    '1837&ndash;1914',
-    '1837&ndash;1915',
     '1837&ndash;1917',
-    '1837&ndash;1937',
-    '1837&ndash;1947',
-    '1837&ndash;41',
-    '1837&ndash;48',
-    '1837&ndash;49',
-    '1837&ndash;97',
-    '1837&ndash;apr.',
-    '18375-77',
-    '1838&ndash;1900',
-    '1838&ndash;1902',
-    '1838&ndash;1912',
-    '1838&ndash;1917',
-    '1838&ndash;1918',
-    '1838&ndash;1922',
-    '1838&ndash;39',
     '1838&ndash;44',
-    '1838&ndash;47',
-    '1838&ndash;48',
-    '1839&mdash;42',
-    '1839&ndash;1844',
-    '1839&ndash;1853',
-    '1839&ndash;1899',
-    '1839&ndash;1901',
-    '1839&ndash;1903',
-    '1839&ndash;1905',
-    '1839&ndash;1914',
-    '1839&ndash;1915',
-    '1839&ndash;1916',
-    '1839&ndash;1917',
-    '1839&ndash;1919',
-    '1839&ndash;1921',
     '1839&ndash;1967',
-    '1839&ndash;42',
-    '183cm',
-    '183m',
-    '184&frac12;p',
-    '184&ndash;254',
-    '184&ndash;7',
-    '184&ndash;87',
-    '184&ndash;89',
-    '184&ndash;92',
-    '184,000,000',
-    '184,200',
-    '184,300,000',
-    '184,445',
-    '184,459,363',
-    '184,500',
     '184,746.41',
-    '184,877,623',
-    '184-litre',
-    '184-member',
-    '184.3',
-    '184.5',
-    '184.55',
-    '184.7%',
-    '184.8',
-    '184.82',
-    '184.8mg',
-    '1840&mdash;70',
-    '1840&ndash;1842',
-    '1840&ndash;1851',
-    '1840&ndash;1868',
-    '1840&ndash;1879',
     '1840&ndash;1900',
-    '1840&ndash;1909',
-    '1840&ndash;1912',
-    '1840&ndash;1913',
-    '1840&ndash;1917',
-    '1840&ndash;1919',
-    '1840&ndash;1921',
-    '1840&ndash;1927',
-    '1840&ndash;41',
-    '1840&ndash;44',
-    '1840&ndash;6',
-    '1840&ndash;60',
-    '1840&ndash;68',
-    '1840&ndash;70',
-    '1840&ndash;93',
-    '1840&ndash;97',
     '1840\'s-1860',
-    '1840\'s-50',
-    '1840-',
-    '1840-1860',
-    '184000',
-    '1840010',
-    '18405',
-    '1840s&ndash;1880s',
-    '1840s&ndash;70s',
-    '1841&mdash;60',
-    '1841&ndash;1843',
-    '1841&ndash;1886',
-    '1841&ndash;1889',
-    '1841&ndash;1891',
-    '1841&ndash;1917',
-    '1841&ndash;1921',
     '1841&ndash;1924',
-    '1841&ndash;1961',
-    '1841&ndash;1986',
-    '1841&ndash;1991',
-    '1841&ndash;2',
-    '1841&ndash;4',
-    '1841&ndash;5',
-    '1841&ndash;52',
-    '1841&ndash;60',
-    '1841&ndash;69',
-    '1841&ndash;70',
-    '1841&ndash;71',
-    '1841&ndash;81',
-    '1841-1881',
-    '1841-71',
-    '1842&mdash;although',
     '1842&ndash;1854',
-    '1842&ndash;1896',
-    '1842&ndash;1904',
-    '1842&ndash;1910',
-    '1842&ndash;1914',
-    '1842&ndash;1918',
-    '1842&ndash;1920',
-    '1842&ndash;1923',
-    '1842&ndash;1930',
-    '1842&ndash;6',
-    '1842&ndash;75',
-    '1843&mdash;60',
-    '1843&ndash;1798',
-    '1843&ndash;1844',
-    '1843&ndash;1872.',
-    '1843&ndash;1883.2',
     '1843&ndash;1900',
-    '1843&ndash;1908',
-    '1843&ndash;1910',
-    '1843&ndash;1913',
-    '1843&ndash;1921',
-    '1843&ndash;1928',
-    '1843&ndash;1932',
-    '1843&ndash;53',
-    '1843&ndash;6',
-    '1843&ndash;7',
-    '1843&ndash;98',
-    '1843-1932',
-    '18437-40',
-    '1844%',
-    '1844&ndash;1847',
-    '1844&ndash;1889',
     '1844&ndash;1890',
-    '1844&ndash;1894',
-    '1844&ndash;1896',
-    '1844&ndash;1898',
-    '1844&ndash;1906',
-    '1844&ndash;1913',
-    '1844&ndash;1917',
-    '1844&ndash;1919',
-    '1844&ndash;1920',
-    '1844&ndash;1926',
-    '1844&ndash;1927',
-    '1844&ndash;1930',
-    '1844&ndash;1939',
-    '1844&ndash;1950',
-    '1844&ndash;45',
-    '1844&ndash;49',
     '1844&ndash;53',
-    '1844&ndash;61',
-    '1844&ndash;7',
-    '1844&ndash;86',
-    '1844-1889',
-    '1844-56',
-    '1844-july',
-    '1844.',
-    '18440',
-    '1845&ndash;1855',
-    '1845&ndash;1906',
-    '1845&ndash;1918',
-    '1845&ndash;1922',
-    '1845&ndash;1929',
-    '1845&ndash;1935',
-    '1845&ndash;46',
     '1845&ndash;54',
-    '1845&ndash;7',
-    '1845&ndash;8',
-    '1845-1846',
-    '1845.',
-    '18451915',
-    '1846&ndash;1881',
-    '1846&ndash;1913',
-    '1846&ndash;1914',
-    '1846&ndash;1915',
-    '1846&ndash;1916',
-    '1846&ndash;1917',
-    '1846&ndash;1922',
-    '1846&ndash;1927',
-    '1846&ndash;1934',
-    '1846&ndash;47',
     '1846&ndash;48',
-    '1846&ndash;53',
-    '1846&ndash;78',
-    '18460',
-    '1846sx',
-    '1847&ndash;1859',
-    '1847&ndash;1871.',
-    '1847&ndash;1887',
-    '1847&ndash;1912',
-    '1847&ndash;1922',
-    '1847&ndash;1927',
-    '1847&ndash;1933',
-    '1847&ndash;1934',
-    '1847&ndash;1950',
-    '1847&ndash;48',
-    '1847&ndash;50',
     '1847&ndash;51',
-    '1847&ndash;63',
-    '1847&ndash;68',
-    '1847&ndash;82',
-    '1847&ndash;89',
-    '1847&ndash;9',
-    '1847-1933',
-    '1847.',
-    '1847/48',
-    '1848&mdash;9',
-    '1848&ndash;1850',
-    '1848&ndash;1906',
-    '1848&ndash;1911',
-    '1848&ndash;1919',
-    '1848&ndash;1921',
-    '1848&ndash;1926',
     '1848&ndash;1937',
-    '1848&ndash;49',
-    '1848&ndash;80',
-    '1848,52',
-    '1848,65',
-    '1848-1914',
-    '1848.12',
-    '1849&mdash;51',
-    '1849&mdash;52',
-    '1849&ndash;1901',
-    '1849&ndash;1913',
-    '1849&ndash;1915',
-    '1849&ndash;1916',
-    '1849&ndash;1917',
-    '1849&ndash;1919',
-    '1849&ndash;1922',
     '1849&ndash;1924',
-    '1849&ndash;1929',
-    '1849&ndash;1930',
-    '1849&ndash;84',
-    '1849-54',
-    '1849.6&ndash;27.20',
-    '184:105:7.5:7.5',
-    '184lb',
-    '184p.',
-    '184pc',
-    '184pp',
-    '184th',
-    '185&deg;c',
-    '185&deg;m',
-    '185&ndash;1214',
-    '185&ndash;186',
     '185&ndash;203',
-    '185&ndash;215',
-    '185&ndash;6',
-    '185&ndash;7',
-    '185&ndash;8',
-    '185&times;292',
-    '185(1)',
-    '185,195',
-    '185,340,000',
-    '185,437',
-    '185,647,355',
-    '185,900',
-    '185-10',
-    '185-match',
-    '185-metre',
-    '185-ton',
     '185.00',
-    '185.4',
-    '185.6',
-    '185/60x14',
-    '185/92',
-    '1850&ndash;1851',
-    '1850&ndash;1870',
-    '1850&ndash;1880',
-    '1850&ndash;1898',
-    '1850&ndash;1907',
-    '1850&ndash;1914',
-    '1850&ndash;1918',
-    '1850&ndash;1928',
-    '1850&ndash;1939',
-    '1850&ndash;1945',
-    '1850&ndash;1957',
     '1850&ndash;1983',
-    '1850&ndash;1988',
-    '1850&ndash;3',
-    '1850&ndash;60',
-    '1850&ndash;70',
-    '1850&ndash;9',
-    '1850-',
-    '1850-1920',
-    '1850-1939',
-    '1850.',
-    '1850gns',
-    '1850m',
-    '1851&ndash;1919',
-    '1851&ndash;1920',
-    '1851&ndash;1930',
-    '1851&ndash;1935',
     '1851&ndash;1937',
-    '1851&ndash;1939',
-    '1851&ndash;1942',
-    '1851&ndash;2001',
-    '1851&ndash;2021',
-    '1851&ndash;4',
-    '1851&ndash;52',
-    '1851&ndash;53',
-    '1851&ndash;7',
-    '1851&ndash;81',
-    '1851&ndash;82',
-    '1851&ndash;86',
-    '1851-',
-    '1851-that',
-    '1852&ndash;1853',
-    '1852&ndash;1857',
     '1852&ndash;1906',
-    '1852&ndash;1908',
-    '1852&ndash;1915',
-    '1852&ndash;1916',
-    '1852&ndash;1928',
-    '1852&ndash;1935',
-    '1852&ndash;4',
-    '1852&ndash;5',
-    '1852&ndash;54',
-    '1852&ndash;67',
-    '1852&ndash;7',
-    '1852&ndash;70',
-    '1852-1913',
-    '1852.',
-    '1852.11&ndash;29.2',
-    '18528',
     '1853&ndash;1895',
-    '1853&ndash;1918',
-    '1853&ndash;1919',
-    '1853&ndash;1922',
-    '1853&ndash;1925',
-    '1853&ndash;1929',
-    '1853&ndash;1932',
-    '1853&ndash;1933',
-    '1853&ndash;1935',
-    '1853&ndash;1940',
-    '1853&ndash;1941',
-    '1853&ndash;1942',
-    '1853&ndash;1953',
-    '1853&ndash;54',
-    '1853&ndash;8',
-    '1853&ndash;95',
     '18531e',
-    '1854&mdash;58',
-    '1854&mdash;71',
-    '1854&ndash;1858',
-    '1854&ndash;1875',
-    '1854&ndash;1916',
-    '1854&ndash;1919',
-    '1854&ndash;1921',
-    '1854&ndash;1924',
-    '1854&ndash;1928',
-    '1854&ndash;5',
-    '1854&ndash;6',
-    '1854&ndash;74',
-    '18548',
-    '1855&ndash;1892',
-    '1855&ndash;1893',
     '1855&ndash;1901',
-    '1855&ndash;1905',
-    '1855&ndash;1914',
-    '1855&ndash;1916',
-    '1855&ndash;1920',
-    '1855&ndash;1930',
-    '1855&ndash;1935',
-    '1855&ndash;1936',
-    '1855&ndash;1939',
-    '1855&ndash;1942',
-    '1855&ndash;1955',
-    '1855&ndash;56',
-    '1855&ndash;58',
-    '1855&ndash;65',
-    '1855&ndash;81',
-    '1855&ndash;9',
     '1855.',
-    '1856&ndash;1901',
-    '1856&ndash;1918',
-    '1856&ndash;1920',
-    '1856&ndash;1921',
-    '1856&ndash;1926',
-    '1856&ndash;1927',
-    '1856&ndash;1929',
-    '1856&ndash;1941',
-    '1856&ndash;60',
-    '1856&ndash;63',
-    '1856&ndash;65',
-    '1856&ndash;69',
-    '1856-1964',
-    '1856-57',
-    '1856-founded',
     '185628',
-    '185661',
-    '1857&ndash;1861',
-    '1857&ndash;1913',
-    '1857&ndash;1915',
-    '1857&ndash;1929',
-    '1857&ndash;1930',
-    '1857&ndash;1932',
-    '1857&ndash;1933',
-    '1857&ndash;1934',
-    '1857&ndash;1936',
-    '1857&ndash;1940',
-    '1857&ndash;1956',
-    '1857&ndash;61',
-    '1857&ndash;62',
-    '1857&ndash;74',
     '1857&ndash;9',
-    '1857a',
-    '1857b',
-    '1858&ndash;1899',
-    '1858&ndash;1913',
-    '1858&ndash;1919',
-    '1858&ndash;1936',
-    '1858&ndash;1940',
-    '1858&ndash;1941',
-    '1858&ndash;1943',
-    '1858&ndash;1945',
-    '1858&ndash;62',
-    '1858&ndash;68',
-    '1858&ndash;95',
-    '1858.',
-    '1858/1605',
     '1859&ndash;1863',
-    '1859&ndash;1891',
-    '1859&ndash;1893',
-    '1859&ndash;1917',
-    '1859&ndash;1923',
-    '1859&ndash;1927',
-    '1859&ndash;1932',
-    '1859&ndash;1935',
-    '1859&ndash;1947',
-    '1859&ndash;62',
-    '1859&ndash;65',
-    '1859&ndash;74',
-    '1859,1871',
-    '1859-1914',
-    '1859-1941',
-    '1859-1943',
     '1859/60',
-    '185bhp',
-    '185c',
-    '185g',
-    '185gt',
-    '185i',
-    '185kcals',
-    '185ps',
-    '185th',
-    '186%',
-    '186&ndash;3',
-    '186&ndash;5',
-    '186&ndash;6',
-    '186&ndash;91',
-    '186&ndash;911',
-    '186,046',
     '186,488',
-    '186,660',
-    '186,711',
-    '186-mile',
-    '186-year',
-    '1860&ndash;1869.',
-    '1860&ndash;1875',
-    '1860&ndash;1880',
-    '1860&ndash;1904',
-    '1860&ndash;1906',
-    '1860&ndash;1917',
-    '1860&ndash;1925',
-    '1860&ndash;1927',
-    '1860&ndash;1931',
-    '1860&ndash;1933',
-    '1860&ndash;1938',
     '1860&ndash;1942',
-    '1860&ndash;1948',
-    '1860&ndash;1950',
-    '1860&ndash;1954',
-    '1860&ndash;1980',
-    '1860&ndash;2',
-    '1860&ndash;5',
-    '1860&ndash;6',
-    '1860&ndash;65',
-    '1860&ndash;70',
-    '1860-1914',
-    '1860-1970',
-    '1860-1980',
-    '1860-acre',
-    '1860.',
-    '186000',
     '18605,6',
-    '1860s-80s',
-    '1861&mdash;2',
-    '1861&ndash;1865',
-    '1861&ndash;1913',
-    '1861&ndash;1926',
-    '1861&ndash;1933',
-    '1861&ndash;1934',
-    '1861&ndash;1936',
-    '1861&ndash;1944',
-    '1861&ndash;1949',
-    '1861&ndash;1985',
-    '1861&ndash;2',
-    '1861&ndash;4',
-    '1861&ndash;62',
-    '1861&ndash;75',
     '1861&ndash;76',
-    '1861,25',
-    '1861.',
-    '1862&ndash;1866',
-    '1862&ndash;1890',
-    '1862&ndash;1898',
-    '1862&ndash;1900',
-    '1862&ndash;1910',
-    '1862&ndash;1917',
-    '1862&ndash;1920',
-    '1862&ndash;1921',
-    '1862&ndash;1928',
-    '1862&ndash;1941',
-    '1862&ndash;1943',
-    '1862&ndash;1944',
-    '1862&ndash;1950',
     '1862&ndash;1952',
-    '1862&ndash;4',
-    '1862&ndash;4252',
-    '1862&ndash;5',
-    '1862-for',
-    '186262&ndash;011b',
-    '1863&ndash;1902',
-    '1863&ndash;1914',
-    '1863&ndash;1917',
-    '1863&ndash;1918',
-    '1863&ndash;1924',
-    '1863&ndash;1929',
-    '1863&ndash;1931',
-    '1863&ndash;1944',
-    '1863&ndash;1946',
-    '1863&ndash;1947',
     '1863&ndash;6',
-    '1863&ndash;64',
-    '1863&ndash;66',
-    '1863&ndash;72',
-    '1863&ndash;86',
-    '1863&ndash;9',
-    '1863-1950',
-    '186344',
-    '1864&ndash;1901',
-    '1864&ndash;1913',
-    '1864&ndash;1919',
-    '1864&ndash;1922',
-    '1864&ndash;1932',
-    '1864&ndash;1935',
-    '1864&ndash;1939',
-    '1864&ndash;1944',
     '1864&ndash;1945',
-    '1864&ndash;1960',
-    '1864&ndash;7',
-    '1864&ndash;70',
-    '1864&ndash;71',
-    '1864&ndash;76',
-    '1864&ndash;8',
-    '1864&ndash;86',
-    '1864&ndash;90',
-    '1864&ndash;nov.',
-    '1864-',
-    '1864-mile',
-    '18640',
-    '1865&ndash;1886',
-    '1865&ndash;1905',
-    '1865&ndash;1914',
     '1865&ndash;1916',
-    '1865&ndash;1920',
-    '1865&ndash;1921',
-    '1865&ndash;1923',
-    '1865&ndash;1926',
-    '1865&ndash;1927',
-    '1865&ndash;1934',
-    '1865&ndash;1937',
-    '1865&ndash;1941',
-    '1865&ndash;1943',
-    '1865&ndash;1991',
-    '1865&ndash;6',
-    '1865&ndash;7',
-    '1865&ndash;74',
-    '1865&ndash;8',
-    '1865,89',
     '1865/6',
-    '186500',
-    '1866&ndash;1913',
-    '1866&ndash;1921',
-    '1866&ndash;1928',
-    '1866&ndash;1932',
-    '1866&ndash;1937',
-    '1866&ndash;1938',
-    '1866&ndash;1941',
-    '1866&ndash;1945',
-    '1866&ndash;1953',
-    '1866&ndash;68',
-    '1866&ndash;73',
-    '1866&ndash;8',
-    '1866-1931',
-    '1866-1946',
     '1867&ndash;1899',
-    '1867&ndash;1900',
-    '1867&ndash;1918',
-    '1867&ndash;1920',
-    '1867&ndash;1929',
-    '1867&ndash;1931',
-    '1867&ndash;1934',
-    '1867&ndash;1939',
-    '1867&ndash;1954',
-    '1867&ndash;1960',
-    '1867&ndash;69',
-    '1867&ndash;70',
-    '1867&ndash;71',
-    '1867&ndash;79',
-    '1867,1992',
-    '1867b',
     '1868&ndash;1912',
-    '1868&ndash;1917',
-    '1868&ndash;1928',
-    '1868&ndash;1934',
-    '1868&ndash;1939',
-    '1868&ndash;1942',
-    '1868&ndash;1947',
-    '1868&ndash;71',
-    '1868&ndash;72',
-    '1868&ndash;74',
-    '1868&ndash;80',
-    '1868&ndash;81',
-    '1868&ndash;84',
-    '186870',
-    '1869&mdash;87',
-    '1869&ndash;1907',
     '1869&ndash;1912',
-    '1869&ndash;1923',
-    '1869&ndash;1928',
-    '1869&ndash;1931',
-    '1869&ndash;1932',
-    '1869&ndash;1933',
-    '1869&ndash;1934',
-    '1869&ndash;1939',
-    '1869&ndash;1940',
-    '1869&ndash;1942',
-    '1869&ndash;1944',
-    '1869&ndash;1953',
-    '1869&ndash;1955',
-    '1869&ndash;70',
-    '1869&ndash;79',
-    '1869&ndash;91',
     '1869-',
-    '1869.',
-    '1869/70',
-    '186a',
-    '186bn',
-    '186f',
-    '186ff',
-    '186g/6&frac12;oz',
-    '186k',
-    '186mph',
-    '186p',
-    '186th',
-    '186w',
-    '187%',
-    '187&mdash;208',
-    '187&ndash;238',
     '187&ndash;4',
-    '187&ndash;5',
-    '187&ndash;9',
-    '187&ndash;91',
-    '187.056',
-    '187.2',
-    '187.2x',
-    '187.5km',
-    '187.6',
-    '187.83',
-    '187/215',
-    '1870&ndash;1900',
-    '1870&ndash;1920',
-    '1870&ndash;1926',
-    '1870&ndash;1930',
-    '1870&ndash;1937',
     '1870&ndash;1938',
-    '1870&ndash;1944',
-    '1870&ndash;1945',
-    '1870&ndash;1958',
-    '1870&ndash;1964',
-    '1870&ndash;1984',
-    '1870&ndash;1988',
-    '1870&ndash;2',
-    '1870&ndash;3',
-    '1870&ndash;4',
-    '1870&ndash;75',
-    '1870&ndash;83',
-    '1870-',
-    '1870-1',
-    '1870-1914',
-    '1870-1930',
     '1870-1970',
-    '1870.',
-    '18700',
-    '1870s-80s',
-    '1871&mdash;1914',
-    '1871&mdash;79',
-    '1871&ndash;1878',
-    '1871&ndash;1918',
-    '1871&ndash;1930',
-    '1871&ndash;1931',
-    '1871&ndash;1937',
-    '1871&ndash;1948',
-    '1871&ndash;1951',
-    '1871&ndash;1955',
-    '1871&ndash;1956',
-    '1871&ndash;1960',
     '1871&ndash;1982',
-    '1871&ndash;3',
-    '1871&ndash;6',
-    '1871&ndash;73',
-    '1871&ndash;75',
-    '1871&ndash;8',
-    '1871&ndash;80',
-    '1871&ndash;81',
-    '1871&ndash;94',
-    '1871&ndash;99',
-    '1871-1935',
-    '1871.',
-    '18710',
-    '18711930',
-    '1872&mdash;73',
-    '1872&ndash;1875',
     '1872&ndash;1875.',
-    '1872&ndash;1887',
-    '1872&ndash;1913',
-    '1872&ndash;1934',
-    '1872&ndash;1941',
-    '1872&ndash;1944',
-    '1872&ndash;1947',
-    '1872&ndash;1951',
-    '1872&ndash;1961',
-    '1872&ndash;1970',
-    '1872&ndash;4',
-    '1872&ndash;5',
-    '1872&ndash;7',
-    '1872&ndash;83',
-    '1872/3',
-    '1873&ndash;1875',
     '1873&ndash;1876',
-    '1873&ndash;1883',
-    '1873&ndash;1904',
-    '1873&ndash;192',
-    '1873&ndash;1923',
-    '1873&ndash;1924',
-    '1873&ndash;1931',
-    '1873&ndash;1932',
-    '1873&ndash;1934',
-    '1873&ndash;1939',
-    '1873&ndash;1942',
-    '1873&ndash;1944',
-    '1873&ndash;1949',
-    '1873&ndash;1955',
-    '1873&ndash;1957',
-    '1873&ndash;1964',
     '1873&ndash;74',
-    '1873&ndash;78',
-    '1874&ndash;1879.',
-    '1874&ndash;1900',
-    '1874&ndash;1926',
-    '1874&ndash;1937',
-    '1874&ndash;1943',
-    '1874&ndash;1952',
-    '1874&ndash;1958',
-    '1874&ndash;1963',
-    '1874&ndash;1965',
-    '1874&ndash;1967',
-    '1874&ndash;6',
-    '1874&ndash;85',
-    '1874&ndash;86',
-    '1874&ndash;96',
     '18740',
-    '1875&mdash',
-    '1875&ndash;1885.',
-    '1875&ndash;1899',
-    '1875&ndash;1905',
-    '1875&ndash;1913',
-    '1875&ndash;1914',
-    '1875&ndash;1921',
-    '1875&ndash;1947',
-    '1875&ndash;1950',
-    '1875&ndash;1956',
-    '1875&ndash;1960',
-    '1875&ndash;1965',
-    '1875&ndash;1967',
-    '1875&ndash;1968',
-    '1875&ndash;1975',
     '1875&ndash;7',
-    '1875&ndash;78',
-    '1875&ndash;83',
-    '1875&ndash;88',
-    '1875&ndash;9',
-    '1875&ndash;90',
-    '1875&ndash;94',
-    '1876&ndash;1885',
-    '1876&ndash;1896.',
-    '1876&ndash;1909',
-    '1876&ndash;1914',
-    '1876&ndash;1919',
-    '1876&ndash;1922',
-    '1876&ndash;1930',
-    '1876&ndash;1939',
-    '1876&ndash;1941',
     '1876&ndash;1951',
-    '1876&ndash;1952',
-    '1876&ndash;1953',
-    '1876&ndash;1955',
-    '1876&ndash;1957',
-    '1876&ndash;1965',
-    '1876&ndash;1966',
-    '1876&ndash;1972',
-    '1876&ndash;7',
-    '1876&ndash;77',
-    '1876&ndash;83',
-    '1876&ndash;84',
-    '1876&ndash;87',
-    '1876&ndash;9',
-    '1877&ndash;1892',
-    '1877&ndash;1904',
     '1877&ndash;1910',
-    '1877&ndash;1930',
-    '1877&ndash;1944',
-    '1877&ndash;1945',
-    '1877&ndash;1946',
-    '1877&ndash;1950',
-    '1877&ndash;1957',
-    '1877&ndash;1959',
-    '1877&ndash;1970',
-    '1877&ndash;1977',
-    '1877&ndash;78',
-    '1877&ndash;80',
-    '1877&ndash;81',
-    '1877&ndash;82',
-    '1877&ndash;83',
-    '1877&ndash;84',
     '1877&ndash;85',
-    '1877&ndash;89',
-    '1877&ndash;9',
-    '1877&ndash;93',
-    '1877-1943',
-    '18775',
-    '18779&ndash;80',
-    '1878&ndash;1903',
-    '1878&ndash;1905',
-    '1878&ndash;1917',
-    '1878&ndash;1936',
-    '1878&ndash;1940',
-    '1878&ndash;1954',
-    '1878&ndash;1959',
-    '1878&ndash;1967',
-    '1878&ndash;1972',
     '1878&ndash;1974',
-    '1878&ndash;1985',
-    '1878&ndash;80',
-    '1878&ndash;81',
-    '1878&ndash;82',
-    '1878&ndash;85',
-    '1878&ndash;89',
-    '1878&ndash;90',
-    '1878-1967',
-    '1879&ndash;1902',
-    '1879&ndash;1903',
-    '1879&ndash;1916',
-    '1879&ndash;1918',
-    '1879&ndash;1919',
-    '1879&ndash;1921',
-    '1879&ndash;1923',
     '1879&ndash;1943',
-    '1879&ndash;1955',
-    '1879&ndash;1959',
-    '1879&ndash;1971',
-    '1879&ndash;82',
-    '1879&ndash;84',
-    '1879&ndash;86',
-    '1879-83',
-    '1879/1980',
-    '187:1',
-    '187f',
-    '187p.',
-    '188%',
-    '188&ndash;189',
-    '188&ndash;3',
-    '188&ndash;4',
     '188&ndash;90',
-    '188(1)',
-    '188,000',
-    '188,000-strong',
-    '188,500',
-    '188-6',
-    '188-seat',
-    '188-yard',
-    '188.3',
-    '188.4mph',
-    '188.6ft',
-    '188/730',
-    '1880&ndash;1901',
-    '1880&ndash;1904',
-    '1880&ndash;1913',
-    '1880&ndash;1918',
     '1880&ndash;1921',
-    '1880&ndash;1923',
-    '1880&ndash;1943',
-    '1880&ndash;1946',
-    '1880&ndash;1947',
-    '1880&ndash;1948',
-    '1880&ndash;1966',
-    '1880&ndash;1971',
-    '1880&ndash;1976',
-    '1880&ndash;1980',
-    '1880&ndash;4',
-    '1880&ndash;5',
-    '1880&ndash;6',
-    '1880&ndash;82',
-    '1880&ndash;84',
-    '1880&ndash;85',
     '1880&ndash;96',
-    '1880-1939',
-    '1880-1948',
-    '1880.',
-    '1880.30',
-    '18805',
-    '1880s&mdash;1960s',
-    '1880s/',
-    '1881&mdash;94',
-    '1881&ndash;1894',
-    '1881&ndash;1900',
-    '1881&ndash;1902',
-    '1881&ndash;1906',
-    '1881&ndash;1929',
-    '1881&ndash;1931',
-    '1881&ndash;1932',
     '1881&ndash;1938',
-    '1881&ndash;1939',
-    '1881&ndash;1947',
-    '1881&ndash;1948',
-    '1881&ndash;1950',
-    '1881&ndash;1954',
-    '1881&ndash;1960',
-    '1881&ndash;1968',
-    '1881&ndash;2021',
-    '1881&ndash;4',
-    '1881&ndash;92',
-    '1881&ndash;94',
-    '1881&ndash;95',
-    '1881-',
-    '1881/late',
-    '18812&ndash;16',
     '18813',
-    '1882&ndash;1900',
-    '1882&ndash;1920',
-    '1882&ndash;1922',
-    '1882&ndash;1940',
-    '1882&ndash;1953',
-    '1882&ndash;1956',
-    '1882&ndash;1960',
-    '1882&ndash;1962',
-    '1882&ndash;1970',
-    '1882&ndash;1977',
-    '1882&ndash;4',
-    '1882&ndash;86,78',
-    '1882&ndash;91',
-    '1882&ndash;94',
-    '18820',
     '1883&ndash;1',
-    '1883&ndash;1903',
-    '1883&ndash;1904',
-    '1883&ndash;1928',
-    '1883&ndash;1929',
-    '1883&ndash;1938',
-    '1883&ndash;1943',
-    '1883&ndash;1945',
-    '1883&ndash;1946',
-    '1883&ndash;1962',
-    '1883&ndash;1963',
-    '1883&ndash;1967',
-    '1883&ndash;1985',
-    '1883&ndash;1989',
-    '1883&ndash;6',
-    '1883&ndash;84',
     '1883&ndash;92',
-    '1883&ndash;94',
-    '1883&ndash;97',
-    '1883-1937',
-    '1883-1955',
-    '1883.11&ndash;6.9',
-    '1883/4',
-    '1884&ndash;1912',
-    '1884&ndash;1920',
-    '1884&ndash;1928',
-    '1884&ndash;1929',
-    '1884&ndash;1943',
-    '1884&ndash;1960',
-    '1884&ndash;1970',
-    '1884&ndash;1974',
-    '1884&ndash;1982',
     '1884&ndash;6',
-    '1884&ndash;8',
-    '1884&ndash;90',
-    '1884&ndash;92',
-    '1884-1947',
-    '1884/85',
-    '1885&ndash;1905',
-    '1885&ndash;1910',
-    '1885&ndash;1940',
-    '1885&ndash;1941',
-    '1885&ndash;1958',
-    '1885&ndash;1965',
-    '1885&ndash;1966',
-    '1885&ndash;1974',
-    '1885&ndash;1985',
-    '1885&ndash;8',
     '1885&ndash;87',
-    '1885&ndash;99',
-    '1885-1938',
-    '18851990',
-    '1886&ndash;189',
-    '1886&ndash;1890.',
-    '1886&ndash;1926',
-    '1886&ndash;1936',
-    '1886&ndash;1945',
-    '1886&ndash;1946',
-    '1886&ndash;1947',
-    '1886&ndash;1949',
-    '1886&ndash;1957',
-    '1886&ndash;1968',
-    '1886&ndash;1974',
-    '1886&ndash;1975',
     '1886&ndash;1978',
-    '1886&ndash;1982',
-    '1886&ndash;7',
-    '1886&ndash;92',
-    '1886&ndash;96',
-    '18860',
-    '188670',
-    '1887&mdash;88',
-    '1887&ndash;1888',
-    '1887&ndash;1894',
-    '1887&ndash;1894.',
-    '1887&ndash;1927',
-    '1887&ndash;1938',
-    '1887&ndash;1940',
-    '1887&ndash;1945',
-    '1887&ndash;1958',
     '1887&ndash;1964',
-    '1887&ndash;1968',
-    '1887&ndash;1969',
-    '1887&ndash;8&ndash;9',
-    '1887&ndash;90',
-    '1887&ndash;94',
-    '1888&ndash;1889',
-    '1888&ndash;1891',
-    '1888&ndash;1893',
-    '1888&ndash;1897',
-    '1888&ndash;1910',
-    '1888&ndash;1915',
-    '1888&ndash;1949',
-    '1888&ndash;1959',
-    '1888&ndash;1964',
-    '1888&ndash;1971',
     '1888&ndash;1973',
-    '1888&ndash;1979',
-    '1888&ndash;1983',
-    '1888&ndash;90',
-    '1888&ndash;91',
-    '1888-89',
-    '1889&ndash;1905',
-    '1889&ndash;1924',
-    '1889&ndash;1949',
-    '1889&ndash;1953',
-    '1889&ndash;1955',
-    '1889&ndash;1956',
-    '1889&ndash;1957',
-    '1889&ndash;1959',
-    '1889&ndash;1966',
-    '1889&ndash;1970',
     '1889&ndash;1978',
-    '1889&ndash;92',
-    '1889-1940',
-    '1889:188',
-    '1889a',
-    '188bhp',
-    '188h&ndash;189b',
-    '188ha',
-    '188os',
-    '188pp',
-    '188th',
-    '189&deg',
-    '189&ndash;213',
-    '189&ndash;4',
-    '189&ndash;5',
-    '189&ndash;8',
     '189&ndash;97',
-    '189,550,000',
-    '189,777',
-    '189.26mm',
-    '189.6',
-    '189.67',
-    '189.9',
-    '1890&ndash;1',
-    '1890&ndash;1895',
-    '1890&ndash;1900',
-    '1890&ndash;1901',
-    '1890&ndash;1920',
-    '1890&ndash;1937',
-    '1890&ndash;1938',
-    '1890&ndash;1940',
-    '1890&ndash;1945',
     '1890&ndash;1953',
-    '1890&ndash;1957',
-    '1890&ndash;1962',
-    '1890&ndash;1965',
-    '1890&ndash;1967',
-    '1890&ndash;1981',
-    '1890&ndash;7',
-    '1890&ndash;8',
-    '1890&ndash;9',
-    '1890\'s&ndash;1990',
-    '1890-1910',
-    '1890-1914',
-    '1890-1941',
-    '18908',
-    '1890s.',
-    '1891&ndash;1892',
     '1891&ndash;1893',
-    '1891&ndash;1905',
-    '1891&ndash;1908',
-    '1891&ndash;1948',
-    '1891&ndash;1954',
-    '1891&ndash;1958',
-    '1891&ndash;1969',
-    '1891&ndash;1991',
-    '1891&ndash;5',
-    '1891&ndash;8',
-    '1891&ndash;92.',
-    '1891&ndash;95',
-    '1891-1981',
-    '1892&mdash;95',
-    '1892&ndash;1893',
-    '1892&ndash;1950',
     '1892&ndash;1963',
-    '1892&ndash;1964',
-    '1892&ndash;1967',
-    '1892&ndash;1968',
-    '1892&ndash;1973',
-    '1892&ndash;1978',
-    '1892&ndash;1979',
-    '1892&ndash;1985',
-    '1892&ndash;5',
-    '1892&ndash;8',
-    '1892&ndash;93',
-    '1892&ndash;95',
-    '1892,14,000',
-    '1893&mdash;1906',
-    '1893&ndash;1903',
-    '1893&ndash;1913',
     '1893&ndash;1932',
-    '1893&ndash;1938',
-    '1893&ndash;1954',
-    '1893&ndash;1963',
-    '1893&ndash;1976',
-    '1893&ndash;1977',
-    '1893&ndash;1979',
-    '1893&ndash;1981',
-    '1893&ndash;1983',
-    '1893&ndash;1993',
-    '1893&ndash;6',
-    '1893&ndash;8',
-    '1893&ndash;94',
-    '1893.',
-    '18934',
-    '1894&mdash;95',
     '1894&ndash;1895',
-    '1894&ndash;1901',
-    '1894&ndash;1903',
-    '1894&ndash;1911',
-    '1894&ndash;1912',
-    '1894&ndash;1955',
-    '1894&ndash;1969',
-    '1894&ndash;1970',
-    '1894&ndash;1975',
-    '1894&ndash;1978',
-    '1894&ndash;1979',
-    '1894&ndash;1982',
-    '1894&ndash;1984',
-    '1894&ndash;1985',
-    '1894&ndash;1991',
-    '1894&ndash;33',
     '1894&ndash;7',
-    '1894/6',
-    '18940',
-    '18942',
-    '1895&ndash;1897',
-    '1895&ndash;1899',
-    '1895&ndash;1900',
-    '1895&ndash;1901',
-    '1895&ndash;1915',
-    '1895&ndash;1930',
-    '1895&ndash;1935',
-    '1895&ndash;1941',
-    '1895&ndash;1945',
-    '1895&ndash;1956',
-    '1895&ndash;1974',
-    '1895&ndash;1979',
     '1895&ndash;1980',
-    '1895&ndash;1982',
-    '1895&ndash;1983',
-    '1895&ndash;1988',
-    '1895&ndash;8',
-    '1895&ndash;99',
-    '1895/',
-    '18950',
-    '1896&mdash;1900',
-    '1896&ndash;1900',
-    '1896&ndash;1905',
-    '1896&ndash;1913',
-    '1896&ndash;1921',
-    '1896&ndash;1930',
-    '1896&ndash;1952',
-    '1896&ndash;1959',
     '1896&ndash;1966',
-    '1896&ndash;1967',
-    '1896&ndash;1971',
-    '1896/7',
-    '189620',
-    '1897&ndash;1898',
-    '1897&ndash;1903',
-    '1897&ndash;1913',
-    '1897&ndash;1918',
-    '1897&ndash;1956',
-    '1897&ndash;1957',
-    '1897&ndash;1987',
-    '1897&ndash;98',
-    '1897-1899',
-    '1897-1940',
-    '1897-1948',
     '1897.',
-    '1897m',
-    '1898&ndash;1',
-    '1898&ndash;1901',
-    '1898&ndash;1907',
-    '1898&ndash;1921',
-    '1898&ndash;1923',
-    '1898&ndash;1935',
-    '1898&ndash;1940',
-    '1898&ndash;1961',
-    '1898&ndash;1968',
-    '1898&ndash;1971',
-    '1898&ndash;1975',
-    '1898&ndash;1981',
-    '1898&ndash;90',
-    '1898/1899',
     '1898/9',
-    '1899&ndash;1904',
-    '1899&ndash;1926',
-    '1899&ndash;1953',
-    '1899&ndash;1962',
-    '1899&ndash;1963',
-    '1899&ndash;1966',
-    '1899&ndash;1972',
-    '1899&ndash;1978',
-    '1899&ndash;1982',
-    '1899&ndash;1986',
-    '1899-',
-    '1899-1932',
-    '1899.5',
-    '1899/1900',
-    '1899/1990',
     '18996',
-    '189a&ndash;h',
-    '189a-1',
-    '189bpm',
-    '189f.',
-    '189mm',
-    '189mph',
-    '189o',
-    '18:00',
-    '18:03',
-    '18:05:07',
-    '18:05:27',
-    '18:05:36&ndash;0500',
-    '18:06:17',
-    '18:07:28',
-    '18:08:08',
     '18:08:26',
-    '18:09:40',
-    '18:1&ndash;8',
-    '18:10,11',
-    '18:10:42',
-    '18:11:16',
-    '18:11:18&ndash;0500',
-    '18:12',
-    '18:12:36',
-    '18:12:53',
-    '18:13',
-    '18:13:23',
-    '18:15&ndash;17',
-    '18:16:33',
-    '18:17',
-    '18:17:28',
     '18:17:51&ndash;0500',
-    '18:21',
-    '18:21:28',
-    '18:22ff',
-    '18:23:13',
-    '18:27',
-    '18:28',
-    '18:31&ndash;33',
-    '18:32',
-    '18:33',
-    '18:36',
-    '18:36:43',
-    '18:42',
-    '18:44:20',
-    '18:44:24',
-    '18:46',
     '18:49',
-    '18:49:06',
-    '18:49:52',
-    '18:5',
-    '18:52:19',
-    '18:53:11',
-    '18:54:39',
-    '18:55:08',
-    '18:57:38',
-    '18:59:15&ndash;0500',
-    '18=1+9+7+1',
-    '18_per',
-    '18b&ndash;19',
-    '18b-in',
-    '18bn',
-    '18c/65f',
     '18cu',
-    '18d.',
-    '18ft.',
-    '18g',
-    '18ha',
-    '18hh&ndash;19hh',
-    '18in(45cm)',
-    '18in-tall',
-    '18in.',
-    '18inch',
-    '18k',
-    '18kg',
-    '18km/',
-    '18kms',
-    '18kw',
-    '18ma',
     '18mb',
-    '18month',
-    '18mpa',
-    '18mpg',
-    '18ms',
-    '18mth',
-    '18mths',
-    '18mths&ndash;2yrs',
-    '18pp.',
-    '18ppm',
-    '18q11.2',
-    '18s.w.g.',
-    '18sec',
-    '18st',
-    '18t',
-    '18th&ndash;century',
     '18th&rehy;century',
-    '18th-minute',
-    '18th-ranked',
-    '18th/19th',
-    '18thand',
-    '18x16in',
-    '18year-olds',
-    '18years-old',
-    '19%&ndash;91%',
-    '19&frac12%',
-    '19&frac12&ins',
-    '19&lsqb&rsqb',
-    '19&mdash;20',
-    '19&mdash;22',
-    '19&mdash;24',
-    '19&mgr;m',
     '19&middot;4',
-    '19&ndash;0',
-    '19&ndash;00',
-    '19&ndash;1&ndash;1914',
-    '19&ndash;10&ndash',
-    '19&ndash;100',
-    '19&ndash;11',
-    '19&ndash;15',
-    '19&ndash;24&deg;c',
-    '19&ndash;27',
-    '19&ndash;28',
-    '19&ndash;30th',
-    '19&ndash;36',
-    '19&ndash;39',
-    '19&ndash;43',
-    '19&ndash;53',
     '19&ndash;56',
-    '19&ndash;6',
-    '19&ndash;6&ndash;45&ndash;0',
-    '19&ndash;60',
-    '19&ndash;7',
-    '19&ndash;71',
-    '19&ndash;8&ndash;0',
-    '19&ndash;82',
-    '19&ndash;9',
-    '19&ndash;end',
-    '19&prime;27&prime',
-    '19&shilling;11&frac34',
-    '19&sol;20',
-    '19&times;26.5cm',
-    '19(-)',
-    '19(15)',
     '19(17)',
-    '19(18)',
-    '19(l)',
-    '19,015',
-    '19,021',
-    '19,034',
-    '19,056',
-    '19,067',
-    '19,073',
-    '19,100,000',
-    '19,148,502',
-    '19,173,961',
-    '19,197',
-    '19,1991',
-    '19,20,21',
-    '19,20,24,25',
     '19,22,23,24,26,27,28',
-    '19,23,30',
-    '19,237',
-    '19,237,247',
-    '19,24',
-    '19,296',
-    '19,300,000',
-    '19,32',
-    '19,320',
-    '19,326',
-    '19,352',
-    '19,358',
-    '19,40',
-    '19,409',
-    '19,451',
-    '19,493,000',
     '19,496',
-    '19,500,000',
-    '19,600',
-    '19,672,612',
-    '19,685',
-    '19,700,000',
-    '19,722',
-    '19,745',
-    '19,778',
-    '19,808,000',
-    '19,826',
-    '19,835',
-    '19,840,000',
-    '19,848',
-    '19,863',
-    '19,892',
     '19,900,000',
-    '19,905',
-    '19,907',
-    '19,988',
-    '19-10',
-    '19-11',
-    '19-13',
-    '19-15',
-    '19-18',
-    '19-28',
-    '19-36-1968',
-    '19-4',
-    '19-8',
-    '19-89',
-    '19-9',
-    '19-90',
     '19-91',
-    '19-april',
-    '19-base',
-    '19-bed',
-    '19-club',
-    '19-column',
-    '19-country',
-    '19-dec.',
-    '19-fold',
-    '19-foot',
-    '19-gauge',
-    '19-hour',
-    '19-jan',
-    '19-man',
-    '19-month-old',
-    '19-nation',
     '19-old',
-    '19-page',
-    '19-piece',
-    '19-race',
-    '19-run',
-    '19-sep-1988',
-    '19-storey',
-    '19-team',
-    '19-week-old',
-    '19.00&ndash;21.00',
-    '19.01',
-    '19.01.8',
-    '19.02',
-    '19.03',
-    '19.08',
-    '19.09',
     '19.1.1991',
-    '19.11',
-    '19.11.82',
-    '19.11.90',
-    '19.12.88',
-    '19.13,16',
-    '19.17',
-    '19.19',
-    '19.1m',
-    '19.1p',
-    '19.24',
-    '19.25in',
-    '19.29',
-    '19.29%',
-    '19.2kbps',
-    '19.2p',
     '19.2secs',
-    '19.3&amp;percent',
-    '19.3.',
-    '19.3.2',
-    '19.3.91',
-    '19.3.92',
-    '19.30&ndash;21.30',
-    '19.31',
-    '19.32',
-    '19.34p',
-    '19.39',
-    '19.4(c)',
-    '19.415',
-    '19.44',
-    '19.46sec',
-    '19.49p',
     '19.4bn',
-    '19.4mm',
-    '19.4pc',
-    '19.5.',
-    '19.5.0',
-    '19.5.87',
-    '19.52',
-    '19.57',
-    '19.58',
-    '19.5cm',
-    '19.5kg',
-    '19.5p',
-    '19.6.0',
-    '19.66%',
-    '19.6bn',
-    '19.6m',
     '19.6p',
-    '19.7.90',
-    '19.71',
-    '19.72p',
-    '19.73%',
-    '19.73sec',
-    '19.74',
-    '19.76',
-    '19.78p',
-    '19.79&ndash;38.74',
-    '19.7ft',
-    '19.7khz',
-    '19.7m',
-    '19.8.89',
-    '19.81p',
-    '19.837',
     '19.8k',
-    '19.8m',
-    '19.8p',
-    '19.9.',
-    '19.93',
-    '19.94',
-    '19.99khz',
-    '19.9g/t',
-    '19.9p',
-    '19/1/93',
-    '19/12/92',
-    '19/196',
-    '19/20th',
-    '19/23',
-    '19/27',
-    '19/3/90',
     '19/3/93',
-    '19/31',
-    '19/347',
-    '19/40',
-    '19/413',
-    '19/5/90',
-    '19/6/92&ndash;21/6/92',
-    '19/8/93',
-    '19/83',
-    '19/91',
-    '19/92',
-    '190&deg',
-    '190&mdash;2',
-    '190&ndash;1',
-    '190&ndash;1000nm',
-    '190&ndash;14',
     '190&ndash;170',
-    '190&ndash;185',
-    '190&ndash;188',
-    '190&ndash;200',
-    '190&ndash;210',
-    '190&ndash;225',
-    '190&ndash;4.',
-    '190&ndash;550',
-    '190&ndash;7',
-    '190\'s',
-    '190()',
-    '190(1)',
-    '190,000-strong',
-    '190-200',
-    '190-myr-old',
-    '190-point',
     '190-pound',
-    '190.000',
-    '190.08',
-    '190.2',
-    '190/375f/gas',
-    '1900&mdash;09',
-    '1900&mdash;12',
-    '1900&ndash;04',
-    '1900&ndash;1',
-    '1900&ndash;11',
-    '1900&ndash;15',
-    '1900&ndash;1902',
-    '1900&ndash;1905',
-    '1900&ndash;1914',
-    '1900&ndash;1919',
-    '1900&ndash;1920',
     '1900&ndash;1921',
-    '1900&ndash;1937',
-    '1900&ndash;1939',
-    '1900&ndash;1941',
-    '1900&ndash;1950',
-    '1900&ndash;1960',
-    '1900&ndash;1968',
-    '1900&ndash;1970',
-    '1900&ndash;1978',
-    '1900&ndash;1979',
-    '1900&ndash;1990',
-    '1900&ndash;20',
-    '1900&ndash;21',
-    '1900&ndash;26',
-    '1900&ndash;3',
-    '1900&ndash;4',
     '1900&ndash;41',
-    '1900&ndash;5',
-    '1900&ndash;60',
-    '1900&ndash;70',
-    '1900&ndash;75',
-    '1900,32',
-    '1900,51',
-    '1900,69',
-    '1900,71',
-    '1900,86',
-    '1900-1923',
-    '1900-1931',
-    '1900-1980',
-    '1900-20',
-    '1900-39',
-    '1900-acre',
     '1900-strong',
-    '1900.',
-    '1900.0',
-    '1900.7',
-    '1900cc',
-    '1900ft',
-    '1900m',
-    '1900mm',
-    '1900s-',
-    '1901&ndash;02',
-    '1901&ndash;03',
-    '1901&ndash;10',
-    '1901&ndash;15',
-    '1901&ndash;1902',
-    '1901&ndash;1910',
-    '1901&ndash;1914',
     '1901&ndash;1932',
-    '1901&ndash;1966',
-    '1901&ndash;1971',
-    '1901&ndash;1985',
-    '1901&ndash;1991',
-    '1901&ndash;20',
-    '1901&ndash;2001',
-    '1901&ndash;2025',
-    '1901&ndash;2041',
-    '1901&ndash;3',
-    '1901&ndash;5',
-    '1901&ndash;6',
-    '1901&ndash;70',
-    '1901&ndash;78',
-    '1901&ndash;79',
-    '1901&ndash;9',
     '1901.2',
-    '19010',
-    '1901174',
-    '1902&ndash;05',
-    '1902&ndash;06',
-    '1902&ndash;08',
-    '1902&ndash;12',
-    '1902&ndash;1902',
-    '1902&ndash;1906',
-    '1902&ndash;1936',
-    '1902&ndash;1945',
-    '1902&ndash;1953',
-    '1902&ndash;1958',
-    '1902&ndash;1965',
-    '1902&ndash;1966',
-    '1902&ndash;1975',
     '1902&ndash;1983',
-    '1902&ndash;1984',
-    '1902&ndash;1990',
-    '1902&ndash;4',
-    '1902&ndash;59',
-    '1902&ndash;6',
-    '1902&ndash;73',
-    '1902/1903',
-    '19020',
-    '19026',
-    '1903&ndash;04',
-    '1903&ndash;07',
-    '1903&ndash;11',
-    '1903&ndash;14',
-    '1903&ndash;17',
-    '1903&ndash;18',
     '1903&ndash;1905',
-    '1903&ndash;1913',
-    '1903&ndash;1930',
-    '1903&ndash;1931',
-    '1903&ndash;1937',
-    '1903&ndash;1939',
-    '1903&ndash;1942',
-    '1903&ndash;1950',
-    '1903&ndash;1961',
-    '1903&ndash;1971',
-    '1903&ndash;1984',
-    '1903&ndash;22',
-    '1903&ndash;37',
-    '1903&ndash;4',
-    '1903&ndash;57',
-    '1903-1956',
     '1903-wea-1953',
-    '1903.',
-    '19030',
-    '1904&mdash;05',
-    '1904&mdash;06',
-    '1904&ndash;10',
-    '1904&ndash;1907',
-    '1904&ndash;1917',
-    '1904&ndash;1944',
-    '1904&ndash;1976',
-    '1904&ndash;1979',
-    '1904&ndash;6',
-    '1904&ndash;7',
-    '1904&ndash;8',
-    '1904&ndash;91',
-    '1904&ndash;august',
     '1904-5',
-    '1904e',
-    '1905&mdash;10',
-    '1905&ndash;09',
-    '1905&ndash;09.',
-    '1905&ndash;11',
-    '1905&ndash;14',
-    '1905&ndash;16',
-    '1905&ndash;1914',
-    '1905&ndash;1929',
-    '1905&ndash;1943',
-    '1905&ndash;1962',
-    '1905&ndash;1991',
-    '1905&ndash;37',
-    '1905&ndash;42',
-    '1905&ndash;59',
     '1905&ndash;8',
-    '1905-20',
-    '1905/06',
-    '1905/6',
-    '190506',
-    '190582',
-    '1905b',
-    '1906&mdash;14',
-    '1906&ndash',
-    '1906&ndash;10',
-    '1906&ndash;11',
-    '1906&ndash;12',
-    '1906&ndash;1914',
-    '1906&ndash;1928',
-    '1906&ndash;1946',
-    '1906&ndash;1964',
     '1906&ndash;1979',
-    '1906&ndash;34',
-    '1906&ndash;68',
-    '1906&ndash;7',
-    '1906-09',
-    '1906-1911',
-    '1906-1914',
-    '1906-1926',
-    '1906.20',
-    '1906s',
-    '1907&ndash;10',
-    '1907&ndash;11',
-    '1907&ndash;17',
-    '1907&ndash;1950',
-    '1907&ndash;1969',
-    '1907&ndash;1975',
     '1907&ndash;1985',
-    '1907&ndash;90',
-    '1907&ndash;may',
-    '19078',
-    '1908&mdash;09',
-    '1908&ndash;12',
-    '1908&ndash;14',
-    '1908&ndash;15',
-    '1908&ndash;1909',
-    '1908&ndash;1914',
-    '1908&ndash;1920',
-    '1908&ndash;1940',
-    '1908&ndash;1943',
-    '1908&ndash;1948',
-    '1908&ndash;1989',
-    '1908&ndash;25',
     '1908&ndash;31',
-    '1908&ndash;90',
-    '1908-1984',
-    '19088',
-    '1909&mdash;13',
-    '1909&ndash;12',
-    '1909&ndash;14',
-    '1909&ndash;15',
-    '1909&ndash;1910',
-    '1909&ndash;1914',
-    '1909&ndash;1925',
-    '1909&ndash;1933',
-    '1909&ndash;1973',
-    '1909&ndash;1981',
-    '1909&ndash;29',
-    '1909&ndash;55',
     '1909-1949',
-    '1909.',
-    '1909.23',
-    '190a',
-    '190a&ndash;3s',
-    '190a&ndash;c',
-    '190a-4/u8',
-    '190a-5',
-    '190c/375g/gas',
-    '190d',
-    '190f-8',
-    '190ff',
-    '190ft',
-    '190gns',
-    '190hp',
-    '190kph',
     '190mph',
-    '190mw',
-    '190myr',
-    '190nm-1000nm',
-    '190p=37p',
-    '190pp',
-    '190th',
-    '191&ndash;19',
-    '191&ndash;1918',
-    '191&ndash;2/387&ndash;8',
-    '191&ndash;5',
-    '191,000,000',
-    '191,500',
-    '191.4%',
-    '191.5',
-    '191.6mph',
     '191.717',
-    '191.848pts',
-    '191/387',
-    '1910&ndash;1915',
-    '1910&ndash;1917',
-    '1910&ndash;1924',
-    '1910&ndash;1928',
-    '1910&ndash;1930',
-    '1910&ndash;1944',
-    '1910&ndash;1945',
-    '1910&ndash;1948',
-    '1910&ndash;1953',
-    '1910&ndash;1977',
-    '1910&ndash;1988',
-    '1910&ndash;26',
-    '1910&ndash;33',
     '1910&ndash;35',
-    '1910&ndash;41',
-    '1910-1920',
-    '1910-1945',
-    '1910-20',
-    '1910-45',
-    '1910.',
-    '19101',
-    '19103',
-    '1911&ndash;12.',
-    '1911&ndash;17',
-    '1911&ndash;1914',
-    '1911&ndash;1920',
-    '1911&ndash;1928',
-    '1911&ndash;1940',
-    '1911&ndash;1941',
     '1911&ndash;1945',
-    '1911&ndash;1960',
-    '1911&ndash;1963',
-    '1911&ndash;1968',
-    '1911&ndash;1989',
-    '1911&ndash;27',
-    '1911&ndash;30',
-    '1911&ndash;39',
-    '1911&ndash;78',
-    '1911-vintage',
-    '1912&ndash;17',
-    '1912&ndash;1936',
-    '1912&ndash;1945',
-    '1912&ndash;1964',
-    '1912&ndash;1970',
-    '1912&ndash;1973',
     '1912&ndash;31',
-    '1912&ndash;42',
-    '1912&ndash;56',
-    '1912-15',
-    '1912-1956',
-    '1912.',
-    '19122',
-    '1912a',
-    '1913&ndash;1945',
-    '1913&ndash;1946',
-    '1913&ndash;1971',
-    '1913&ndash;1976',
-    '1913&ndash;1988',
-    '1913&ndash;25',
-    '1913&ndash;26',
-    '1913&ndash;27',
     '1913&ndash;71',
-    '1913-1945',
-    '1913/14',
-    '19130',
-    '1913204',
-    '19135',
-    '1913is',
-    '1914&mdash;18',
-    '1914&ndash;1923',
-    '1914&ndash;1929',
-    '1914&ndash;1948',
-    '1914&ndash;1953',
-    '1914&ndash;1956',
-    '1914&ndash;1969',
-    '1914&ndash;2&ndash;23',
-    '1914&ndash;24',
     '1914&ndash;29',
-    '1914&ndash;32',
-    '1914&ndash;45',
-    '1914-',
-    '1914-15',
-    '1914-18-',
-    '1914-1960',
-    '1914-pattern',
-    '1914-type',
-    '1914/',
-    '1914/18',
-    '19141,200,000',
-    '19144',
-    '1915&ndash;17',
-    '1915&ndash;1919',
-    '1915&ndash;1921',
     '1915&ndash;1922',
-    '1915&ndash;1936',
-    '1915&ndash;1944',
-    '1915&ndash;1948',
-    '1915&ndash;1951',
-    '1915&ndash;1955',
-    '1915&ndash;1966',
-    '1915&ndash;1973',
-    '1915&ndash;20',
-    '1915&ndash;21',
-    '1915&ndash;26',
-    '1915&ndash;55',
-    '1915&ndash;january',
-    '1915-23',
-    '1915/1957',
-    '1915:204',
     '1915a',
-    '1915b',
-    '1916&ndash;1971',
-    '1916&ndash;1983',
-    '1916&ndash;1986',
-    '1916&ndash;27',
-    '1916&ndash;37',
-    '1916&ndash;49',
-    '1916&ndash;62',
-    '1916,1922',
-    '1916-23',
-    '1916-the',
-    '19160',
-    '1917&ndash;1918',
-    '1917&ndash;1935',
-    '1917&ndash;1956',
     '1917&ndash;1992',
-    '1917&ndash;22',
-    '1917&ndash;33',
-    '1917\'',
-    '1917-18',
-    '1917-29',
-    '19170',
-    '1918&mdash;19',
-    '1918&ndash;1919',
-    '1918&ndash;1920',
-    '1918&ndash;1939',
-    '1918&ndash;1950',
-    '1918&ndash;21',
-    '1918&ndash;23',
-    '1918&ndash;27',
-    '1918&ndash;33',
     '1918&ndash;37',
-    '1918&ndash;38',
-    '1918&ndash;48',
-    '1918&ndash;52',
-    '1918&ndash;87',
-    '1918-19',
-    '1918-1958',
-    '1918-1981',
-    '1918-20',
-    '1918-21',
-    '1918-85',
-    '1918.1&ndash;1.113',
-    '1918/19',
-    '1918a',
-    '1919&ndash;1931',
-    '1919&ndash;1936',
     '1919&ndash;1943',
-    '1919&ndash;1945',
-    '1919&ndash;1990',
-    '1919&ndash;1993',
-    '1919&ndash;22',
-    '1919&ndash;50',
-    '1919&ndash;63',
-    '1919-1965',
-    '1919-24',
-    '1919.',
-    '1919/1932',
-    '19190',
-    '191o',
-    '191p',
-    '191pp',
-    '191st',
     '192&ndash;6',
-    '192&ndash;7',
-    '192&plus;1',
-    '192(3)',
-    '192,700',
-    '192-page',
-    '192-ranked',
-    '192-room',
-    '192.',
-    '192.1%',
-    '192.8%',
-    '1920&mdash;to',
-    '1920&ndash;1946',
-    '1920&ndash;1955',
-    '1920&ndash;1958',
-    '1920&ndash;1974',
     '1920&ndash;2050',
-    '1920&ndash;23',
-    '1920&ndash;25',
-    '1920&ndash;33',
-    '1920&ndash;34',
-    '1920&ndash;39',
-    '1920&ndash;52',
-    '1920&ndash;6',
-    '1920&ndash;67',
-    '1920&ndash;9',
-    '1920\'s/30',
-    '1920-',
-    '1920-1932',
-    '1920-1955',
-    '1920-1972',
-    '1920.',
     '192050-pence',
-    '1920:21',
-    '1920s.',
-    '1920s/1930s',
-    '1921&ndash;1922',
-    '1921&ndash;1939',
-    '1921&ndash;1945',
-    '1921&ndash;1951',
-    '1921&ndash;1980',
-    '1921&ndash;1988',
-    '1921&ndash;26',
-    '1921&ndash;30',
-    '1921&ndash;31',
-    '1921&ndash;37',
-    '1921&ndash;38',
-    '1921&ndash;39',
     '1921&ndash;7',
-    '1921,50',
-    '1921-1931',
-    '1921-22',
-    '1921-23',
-    '1921/2',
-    '1922&ndash;1927',
-    '1922&ndash;1943',
-    '1922&ndash;1972',
-    '1922&ndash;27',
-    '1922&ndash;36',
-    '1922&ndash;44',
-    '1922&ndash;56',
-    '1922&ndash;60',
-    '1922&ndash;72',
-    '1922-1926',
     '1922/23',
-    '19227',
-    '1923&mdash;30',
-    '1923&ndash;1926',
-    '1923&ndash;26',
-    '1923&ndash;31',
-    '1923&ndash;32',
-    '1923&ndash;56',
-    '1923&ndash;74',
-    '1923\'s',
-    '1923-27',
-    '1923-4',
-    '1924&ndash;1936',
-    '1924&ndash;29',
-    '1924&ndash;30',
-    '1924&ndash;39',
     '1924&ndash;6',
-    '1924&ndash;7',
-    '1924,1980',
-    '1924-27',
-    '1924-31',
-    '1924.',
-    '1925&ndash;1957',
-    '1925&ndash;1959',
-    '1925&ndash;1962',
-    '1925&ndash;1988',
-    '1925&ndash;29',
-    '1925&ndash;30',
-    '1925&ndash;32',
-    '1925&ndash;37',
-    '1925&ndash;39',
-    '1925&ndash;43',
     '1925&ndash;46',
-    '1925&ndash;54',
-    '1925&ndash;68',
-    '1925&ndash;74',
-    '1925&ndash;9',
-    '1925&ndash;90',
-    '1925-33',
-    '192533',
-    '1925not',
-    '1926&ndash;1929',
-    '1926&ndash;1937',
-    '1926&ndash;1961',
-    '1926&ndash;1994',
-    '1926&ndash;35',
-    '1926-1937',
-    '1926-41',
     '1926-54',
-    '1926/1959',
-    '1926/7',
-    '19261',
-    '19261-62',
-    '1927&ndash;1928',
-    '1927&ndash;1939',
-    '1927&ndash;1975',
-    '1927&ndash;1991',
-    '1927&ndash;1992',
-    '1927&ndash;29',
-    '1927&ndash;32',
-    '1927&ndash;35',
-    '1927&ndash;38',
-    '1927&ndash;40',
-    '1927&ndash;54',
     '1927&ndash;69',
-    '1927&ndash;82',
-    '1927&sol;8',
-    '1927-46',
-    '1927/28',
-    '192755',
-    '1927p',
-    '1928&ndash;1969',
-    '1928&ndash;34',
-    '1928&ndash;35',
-    '1928&ndash;49',
-    '1928/29',
-    '19280',
-    '1928b:29',
-    '1929&mdash;54',
-    '1929&ndash;1931',
     '1929&ndash;1935',
-    '1929&ndash;3',
-    '1929&ndash;39',
-    '1929&ndash;40',
-    '1929&ndash;89',
-    '1929-1941',
-    '1929-33',
-    '1929-style',
-    '1929.2',
-    '1929/30',
-    '192f',
-    '192ff',
-    '192nd',
-    '192pp',
-    '193&ndash;199',
-    '193&ndash;208',
     '193&ndash;273',
-    '193&ndash;4',
-    '193&ndash;6',
-    '193()s',
-    '193,430',
-    '193,516',
-    '193,800',
-    '193-861',
-    '193.5',
-    '193.50',
-    '193.893mph',
-    '1930&ndash;190',
-    '1930&ndash;1932',
-    '1930&ndash;1936',
-    '1930&ndash;1939',
-    '1930&ndash;1970',
     '1930&ndash;1992',
-    '1930&ndash;34',
-    '1930&ndash;47',
-    '1930&ndash;5',
-    '1930&ndash;50',
-    '1930&ndash;59',
-    '1930&ndash;60',
-    '1930&ndash;68',
-    '1930&ndash;8',
-    '1930&ndash;82',
-    '1930&ndash;9',
-    '1930&ndash;june',
-    '1930*',
-    '1930-',
-    '1930-1932',
-    '1930-45',
     '1930-he',
-    '1930.11&ndash;6.1',
-    '1930.12',
-    '1930b',
-    '1930s&mdash;even',
-    '1930s-1940s',
-    '1930s-1950s',
-    '1930s-doubts',
-    '1930s-type',
-    '1930s-vintage',
-    '1930s/early',
-    '1930sphotograph',
-    '1931&ndash;1935',
-    '1931&ndash;1936',
-    '1931&ndash;1969',
-    '1931&ndash;1992',
     '1931&ndash;33',
-    '1931&ndash;35',
-    '1931&ndash;4',
-    '1931&ndash;48',
-    '1931&ndash;58',
-    '1931&ndash;62',
-    '1931&ndash;7',
-    '1931-3',
-    '1931-37',
-    '1931/2',
-    '1931:246&ndash;54',
-    '1932&ndash;1963',
-    '1932&ndash;1974',
-    '1932&ndash;34',
-    '1932&ndash;36',
-    '1932&ndash;47',
     '1932&ndash;53',
-    '1932&ndash;6',
-    '1932&ndash;65',
-    '1932&ndash;67',
-    '1932&ndash;7',
-    '1932&ndash;8',
-    '1932&ndash;9',
-    '1932-1973',
-    '1932-36',
-    '1932.',
-    '1932/33',
-    '19320',
-    '1933&ndash;1945',
-    '1933&ndash;1954',
-    '1933&ndash;39',
-    '1933&ndash;42',
     '1933&ndash;49',
-    '1933&ndash;53',
-    '1933&ndash;57',
-    '1933&ndash;62',
-    '1933&ndash;74',
-    '1933&ndash;83',
-    '1933&ndash;87',
-    '1933&ndash;9',
-    '1933-1941',
-    '1933.',
-    '1933/4',
-    '1933/4/5',
-    '1934&ndash;1937',
-    '1934&ndash;37',
-    '1934&ndash;39',
-    '1934&ndash;40',
     '1934&ndash;52',
-    '1934&ndash;53',
-    '1934&ndash;61',
-    '1934&ndash;7',
-    '1934&sol;35',
-    '1934-37',
-    '1934-6',
-    '1934-although',
-    '1934-built',
-    '1934.',
-    '1934/5',
-    '19340',
-    '1935&ndash;1939',
-    '1935&ndash;1945',
-    '1935&ndash;1975',
-    '1935&ndash;1992',
     '1935&ndash;37',
-    '1935&ndash;61',
-    '1935&ndash;72',
-    '1935&ndash;8',
-    '1935&ndash;87',
-    '1935-',
-    '1935-1984',
-    '1935-36',
-    '1935-37',
-    '1935-39',
-    '1935sc',
-    '1936&mdash;39',
-    '1936&ndash;1939',
-    '1936&ndash;1958',
-    '1936&ndash;1991',
-    '1936&ndash;37&ndash;38',
     '1936&ndash;39',
-    '1936&ndash;42',
-    '1936&ndash;46',
-    '1936&ndash;49',
-    '1936&ndash;58',
-    '1936&ndash;76',
-    '1936-1989',
-    '1936-37',
-    '1936-39',
-    '1936-52',
-    '1936-57',
-    '1936-before',
-    '1936.',
-    '1936/1937',
-    '1936/37',
-    '1936/72',
     '1936:94',
-    '1936:96',
-    '1937&mdash;42',
-    '1937&ndash;1938',
-    '1937&ndash;1944',
-    '1937&ndash;39',
-    '1937&ndash;41',
-    '1937&ndash;46',
-    '1937&ndash;51',
-    '1937+21',
-    '19370',
-    '19371',
-    '1937a',
-    '1937b',
-    '1938&mdash;1965',
-    '1938&ndash;1948',
     '1938&ndash;41',
-    '1938&ndash;43',
-    '1938&ndash;48',
-    '1938&ndash;50',
-    '1938&ndash;64',
-    '1938&ndash;june',
-    '1938-41',
-    '1938-built',
-    '1938-design',
-    '1938/39',
-    '1938b',
-    '1939&ndash\'45',
-    '1939&ndash;1941',
-    '1939&ndash;1942',
-    '1939&ndash;1962',
-    '1939&ndash;42',
     '1939&ndash;44',
-    '1939&ndash;51',
-    '1939&ndash;85',
-    '1939&ndash;armistice',
-    '1939&sol;40',
-    '1939,118',
-    '1939-1940',
-    '1939-1945',
-    '1939-1950',
-    '1939-1965',
-    '1939-1966',
-    '1939-40',
-    '1939-46',
-    '1939/40',
-    '1939/45',
-    '1939/81',
     '1939:25',
-    '193a',
-    '193bhp',
-    '193f',
-    '193o728',
-    '193os',
-    '193s-vintage',
-    '194%',
-    '194&ndash;197',
-    '194&ndash;217',
-    '194&ndash;219',
-    '194&ndash;227',
-    '194&ndash;257',
-    '194&ndash;6',
-    '194&ndash;98',
-    '194,500',
     '194.1%',
-    '194.5',
-    '194/78',
-    '1940&mdash;41',
-    '1940&ndash;1950',
-    '1940&ndash;1992',
-    '1940&ndash;42',
-    '1940&ndash;44',
-    '1940&ndash;50',
-    '1940&ndash;70',
-    '1940&ndash;92',
-    '1940&ndash;june/august',
-    '1940-1971',
-    '1940-1986',
-    '1940-67',
-    '1940-86',
     '1940.',
-    '1940/1941',
-    '1940/41',
-    '194000',
-    '194056',
-    '1940s&ndash;1950s',
-    '1940s.',
-    '1941&ndash;1946',
-    '1941&ndash;1965',
-    '1941&ndash;43',
-    '1941&ndash;47',
-    '1941&ndash;73',
-    '1941&sol;2',
-    '1941-59',
-    '1941/2m',
-    '19410',
     '1942&mdash;june',
-    '1942&ndash;44',
-    '1942&ndash;5',
-    '1942&ndash;7',
-    '1942&ndash;74',
-    '1942-45',
-    '1942.',
-    '1942/1943',
-    '1942/1945',
-    '1942/malaya',
-    '194250',
-    '1943&mdash;44',
-    '1943&ndash;1987',
-    '1943&ndash;49',
-    '1943&ndash;57',
-    '1943&ndash;6',
     '1943&ndash;64',
-    '1943&ndash;7',
-    '1943-1951',
-    '1943-44',
-    '1943-built',
-    '1943.35',
-    '1943/44',
-    '19430',
-    '1943:24',
-    '1943:72',
-    '1944&ndash;1949',
-    '1944&ndash;1980',
-    '1944&ndash;50',
-    '1944&ndash;51',
-    '1944&ndash;53',
-    '1944&ndash;7',
     '1944&ndash;9',
-    '1944-1947',
-    '1944-73',
-    '1944-january',
-    '1944/5',
-    '1944/thurleigh/bedfordshire',
-    '194445',
-    '1944:138',
-    '1945&mdash;53',
-    '1945&mdash;january',
-    '1945&ndash',
-    '1945&ndash;1951',
-    '1945&ndash;1956',
-    '1945&ndash;1959',
-    '1945&ndash;1960',
-    '1945&ndash;1962',
     '1945&ndash;1979',
-    '1945&ndash;47',
-    '1945&ndash;49',
-    '1945&ndash;5',
-    '1945&ndash;53',
-    '1945&ndash;54',
-    '1945&ndash;58',
-    '1945&ndash;59',
-    '1945&ndash;60',
-    '1945&ndash;61',
-    '1945&ndash;62',
-    '1945&ndash;75',
-    '1945&ndash;76',
-    '1945&ndash;80(%)',
-    '1945&ndash;81',
-    '1945&ndash;84',
     '1945\'s',
-    '1945-1950',
-    '1945-1951',
-    '1945-1965',
-    '1945-1967',
-    '1945-1981',
-    '1945-47',
-    '1945-48',
-    '1945-68',
-    '1945-73',
-    '1945/1990',
-    '1945/6',
-    '194510',
-    '19455',
-    '19456',
-    '1946&mdash;47',
     '1946&mdash;50',
-    '1946&mdash;58',
-    '1946&ndash;1947',
-    '1946&ndash;1948',
-    '1946&ndash;1949',
-    '1946&ndash;1952',
-    '1946&ndash;51',
-    '1946&ndash;53',
-    '1946&ndash;58',
-    '1946&ndash;65',
-    '1946&ndash;77',
-    '1946&ndash;81',
-    '1946&ndash;83',
-    '1946&ndash;c.',
-    '1946-1951',
-    '1946-1981',
     '1946-1986',
-    '1946-49',
-    '1946-54',
-    '1946-62',
-    '1947&mdash;48',
-    '1947&mdash;49',
-    '1947&mdash;50',
-    '1947&ndash;1948',
-    '1947&ndash;1951',
-    '1947&ndash;1961',
-    '1947&ndash;1964',
-    '1947&ndash;1971',
-    '1947&ndash;1977',
-    '1947&ndash;1989',
-    '1947&ndash;50',
-    '1947&ndash;54',
     '1947&ndash;57',
-    '1947&ndash;58',
-    '1947&ndash;65',
-    '1947&ndash;72',
-    '1947&ndash;77',
-    '1947&ndash;79',
-    '1947&ndash;90',
-    '1947-',
-    '1947-53',
-    '1947-62',
-    '1947.',
-    '1947/1948',
-    '1947/48',
-    '19470',
-    '1948&ndash;1975',
-    '1948&ndash;1976',
     '1948&ndash;1989',
-    '1948&ndash;51',
-    '1948&ndash;57',
-    '1948&ndash;63',
-    '1948&ndash;65',
-    '1948&ndash;85',
-    '1948&ndash;86',
-    '1948&ndash;87',
-    '1948-1988',
-    '1948-51',
-    '1948-52',
-    '1948-64',
-    '1948-ish',
-    '1948.',
-    '1948/1949',
-    '19480',
     '19483',
-    '1948:165',
-    '1948:76',
-    '1948:97',
-    '1949&mdash;50',
-    '1949&ndash;1951',
-    '1949&ndash;1952',
-    '1949&ndash;1958',
-    '1949&ndash;1974',
-    '1949&ndash;55',
-    '1949&ndash;63',
-    '1949&ndash;64',
-    '1949&ndash;67',
-    '1949&ndash;87',
-    '1949&ndash;90',
-    '1949,120',
     '1949-1952',
-    '1949-51',
-    '1949-56',
-    '1949/1978',
-    '1949/abbey',
-    '1949:210',
-    '1949:235&ndash;3',
-    '1949:69ff',
-    '194i',
-    '195&frac34',
-    '195&ndash;215',
-    '195&ndash;6',
-    '195&ndash;7',
-    '195&ndash;97',
-    '195,743',
-    '195-20',
     '195-goal',
-    '195-member',
-    '195.5p',
-    '195.7',
-    '195/50',
-    '195/55',
-    '195/60',
-    '1950&mdash',
-    '1950&mdash;51',
-    '1950&mdash;55',
-    '1950&ndash;1952',
-    '1950&ndash;1956',
-    '1950&ndash;1970s',
-    '1950&ndash;1974',
-    '1950&ndash;1980',
-    '1950&ndash;1987',
     '1950&ndash;55',
-    '1950&ndash;56',
-    '1950&ndash;57',
-    '1950&ndash;6',
-    '1950&ndash;65',
-    '1950&ndash;69',
-    '1950&ndash;71',
-    '1950&ndash;80s',
-    '1950&ndash;85',
-    '1950&ndash;87',
-    '1950&ndash;90',
-    '1950\'s-1960',
-    '1950-1970',
-    '1950-1982',
-    '1950-54',
-    '1950-70',
     '1950-83',
-    '1950.0',
-    '1950ls',
-    '1950s&mdash;as',
-    '1950s&ndash;1980s',
-    '1950s&ndash;60s',
-    '1950s-1960s',
-    '1950s-60s',
-    '1950s-revivalist',
-    '1950s-style',
-    '1950s.',
-    '1950s/early',
-    '1951&mdash;52',
-    '1951&ndash;1954',
-    '1951&ndash;1959',
-    '1951&ndash;1963',
     '1951&ndash;1969',
-    '1951&ndash;1974',
-    '1951&ndash;1976',
-    '1951&ndash;1987',
-    '1951&ndash;4',
-    '1951&ndash;53',
-    '1951&ndash;55',
-    '1951&ndash;56',
-    '1951&ndash;57',
-    '1951&ndash;58',
-    '1951&ndash;61',
-    '1951&ndash;63',
-    '1951&ndash;66',
-    '1951&ndash;67',
-    '1951&ndash;71',
-    '1951&ndash;73',
     '1951&ndash;78',
-    '1951&ndash;8',
-    '1951&sol;52',
-    '1951,1968',
-    '1951-1979',
-    '1951-1991',
-    '1951-80',
-    '1951-jan.',
-    '1951.',
-    '19512',
-    '1951:156',
-    '1951:42',
-    '1951a',
-    '1952&ndash\'92',
-    '1952&ndash;1964',
-    '1952&ndash;1975',
     '1952&ndash;1982',
-    '1952&ndash;58',
-    '1952&ndash;61',
-    '1952&ndash;67',
-    '1952&ndash;68',
-    '1952&ndash;74',
-    '1952&ndash;8',
-    '1952&ndash;83',
-    '1952&ndash;9',
-    '1952&ndash;91',
-    '1952-1962',
-    '1952-1972',
-    '1952-73',
-    '1952.2-14.1',
-    '1952/1953',
-    '1952/3',
     '1952:221',
-    '1952:224',
-    '1952:46',
-    '1952m',
-    '1953&ndash;1962',
-    '1953&ndash;1979',
-    '1953&ndash;1993',
-    '1953&ndash;5',
-    '1953&ndash;56',
-    '1953&ndash;58',
-    '1953&ndash;6',
-    '1953&ndash;60',
-    '1953&ndash;65',
-    '1953&ndash;8',
-    '1953&ndash;90',
-    '1953&ndash;91',
     '1953&ndash;sept.',
-    '1953(2)',
-    '1953-.65',
-    '1953-58',
-    '1953.',
-    '1953/54',
-    '19538',
-    '1953:196',
-    '1953:218',
-    '1953:5',
-    '1953a',
-    '1953b',
-    '1954&ndash\'57',
-    '1954&ndash;1957',
-    '1954&ndash;1959',
-    '1954&ndash;1974',
     '1954&ndash;1993',
-    '1954&ndash;57',
-    '1954&ndash;61',
-    '1954&ndash;64',
-    '1954&ndash;69',
-    '1954&ndash;74',
-    '1954&ndash;78',
-    '1954&ndash;79',
-    '1954&ndash;86',
-    '1954,1958',
-    '1954-59',
-    '1954-71',
-    '1954-84',
-    '1954-style',
-    '1954/5',
-    '19540',
     '1954:246',
-    '1954:97',
-    '1954b',
-    '1955&mdash;56',
-    '1955&ndash;1962',
-    '1955&ndash;1963',
-    '1955&ndash;1967',
-    '1955&ndash;58',
-    '1955&ndash;59',
-    '1955&ndash;64',
-    '1955&ndash;68',
-    '1955&ndash;74.',
-    '1955&ndash;75',
-    '1955&ndash;8',
-    '1955&ndash;81',
-    '1955,1959',
     '1955-57',
-    '1955-62',
-    '1955/6',
-    '19553-60',
-    '1955:223',
-    '1955:49',
-    '1955:50',
-    '1955:83',
-    '1955a',
-    '1955a:45',
-    '1955a:75',
-    '1955a:77',
-    '1956&ndash;1957',
-    '1956&ndash;1959',
-    '1956&ndash;1986',
-    '1956&ndash;58',
     '1956&ndash;59',
-    '1956&ndash;64',
-    '1956&ndash;66',
-    '1956&ndash;68',
-    '1956&ndash;8',
-    '1956&ndash;87',
-    '1956,542',
-    '1956-',
-    '1956-1958',
-    '1956-1965',
-    '1956-57',
-    '1956-61',
-    '1956-63',
-    '1956this',
-    '1957&mdash;60',
-    '1957&ndash',
     '1957&ndash;1965',
-    '1957&ndash;1969',
-    '1957&ndash;60',
-    '1957&ndash;61',
-    '1957&ndash;63',
-    '1957&ndash;65',
-    '1957&ndash;74',
-    '1957&ndash;76',
-    '1957&ndash;81',
-    '1957,7',
-    '1957-',
-    '1957-58',
-    '1957-66',
-    '1957/58',
-    '1957/8',
-    '19570',
     '19571',
-    '19579',
-    '1957:141',
-    '1957:196&ndash;200',
-    '1957:24',
-    '1957:39&ndash;40',
-    '1957:469',
-    '1957:470',
-    '1957:491',
-    '1957:62',
-    '1957:629',
-    '1957:69',
-    '1957:90',
-    '1958&mdash;59',
-    '1958&mdash;61',
-    '1958&ndash\'63',
     '1958&ndash;1967',
-    '1958&ndash;1969',
-    '1958&ndash;1976',
-    '1958&ndash;1992',
-    '1958&ndash;65',
-    '1958&ndash;67',
-    '1958&ndash;72',
-    '1958&ndash;74',
-    '1958&ndash;79',
-    '1958&ndash;80',
-    '1958&ndash;84',
-    '1958-',
-    '1958-59',
-    '1958-60',
-    '1958-61',
-    '1958-62',
     '1958-71',
-    '1958-82',
-    '1958-85',
-    '19580',
-    '1958:132',
-    '1958:201',
-    '1958:202',
-    '1958:216',
-    '1958:500',
-    '1958:557',
-    '1958:86',
-    '1958:viii',
-    '1958a:15',
-    '1958a:208',
-    '1958a:209',
-    '1958a:23&ndash;5',
     '1958b',
-    '1959&ndash;1917',
-    '1959&ndash;1960',
-    '1959&ndash;1975',
-    '1959&ndash;1978',
-    '1959&ndash;1981',
-    '1959&ndash;1987',
-    '1959&ndash;1990',
-    '1959&ndash;62',
-    '1959&ndash;65',
-    '1959&ndash;66',
-    '1959&ndash;69',
-    '1959&ndash;75',
-    '1959&ndash;78',
-    '1959,1260a',
-    '1959,1961',
     '1959,1987',
-    '1959-1972',
-    '1959-60',
-    '1959-64',
-    '1959-66',
-    '1959-81',
-    '1959-type',
-    '1959.12&ndash;3.1',
-    '19590',
-    '1959:16',
-    '1959:25',
-    '1959:27',
-    '1959:38',
-    '1959:43',
-    '1959a:45',
-    '195bhp',
     '195ff',
-    '195k',
-    '195km/h',
-    '196&ndash;197',
-    '196&ndash;205',
-    '196&ndash;221',
-    '196&ndash;7',
-    '196&ndash;8',
-    '196()s',
-    '196(3)',
-    '196(4)',
-    '196,000lbs',
-    '196-acre',
-    '196-member',
-    '196.6',
-    '196.80',
     '1960&ndash;1970',
-    '1960&ndash;1976',
-    '1960&ndash;1980',
-    '1960&ndash;1986',
-    '1960&ndash;2',
-    '1960&ndash;200',
-    '1960&ndash;5',
-    '1960&ndash;6',
-    '1960&ndash;62',
-    '1960&ndash;66',
-    '1960&ndash;7',
-    '1960&ndash;78',
-    '1960&ndash;8',
-    '1960&ndash;81',
-    '1960&ndash;85',
-    '1960&ndash;86',
     '1960&ndash;90',
-    '1960&ndash;99',
-    '1960&ndash;sept.',
-    '1960-',
-    '1960-1976',
-    '1960-1983',
-    '1960-1989',
-    '1960-1990',
-    '1960-1991',
-    '1960-74',
-    '1960-75',
-    '1960-78',
-    '1960-80',
-    '1960-82',
-    '1960-i',
-    '1960-july',
     '1960-may',
-    '1960.',
-    '1960/5',
-    '19600&ndash;00',
-    '19600&ndash;10',
-    '196060',
-    '1960:1',
-    '1960:154&ndash;5',
-    '1960:173',
-    '1960:233',
-    '1960:346',
-    '1960:65',
-    '1960:673',
-    '1960s-that',
-    '1960s-vintage',
-    '1960s/1970s',
     '1961&ndash;1965',
-    '1961&ndash;1981',
-    '1961&ndash;1983',
-    '1961&ndash;62',
-    '1961&ndash;67',
-    '1961&ndash;73',
-    '1961&ndash;86',
-    '1961&ndash;9',
-    '1961&ndash;90',
-    '1961&ndash;feb.',
-    '1961&rehy;or',
-    '1961(1843)',
-    '1961-',
-    '1961-1970',
-    '1961-1984',
-    '1961-64',
     '1961-81',
-    '1961-82',
-    '1961/62',
-    '19612',
-    '1961:1486',
-    '1961:27',
-    '1961:297',
-    '1961:306',
-    '1961:316',
-    '1961:332',
-    '1961:465',
-    '1961:51',
-    '1961:74',
-    '1961:98',
-    '1962&mdash;66',
-    '1962&ndash;1969',
     '1962&ndash;1970',
-    '1962&ndash;1988',
-    '1962&ndash;65',
-    '1962&ndash;69',
-    '1962&ndash;70',
-    '1962&ndash;72',
-    '1962&ndash;73',
-    '1962&ndash;75',
-    '1962&ndash;78',
-    '1962&ndash;79',
-    '1962&ndash;83',
-    '1962&ndash;88',
-    '1962&ndash;9',
-    '1962,1964',
-    '1962-\'64',
-    '1962-1979',
     '1962-3',
-    '1962-71',
-    '1962-87',
-    '19626',
-    '1962:126&ndash;7,135&ndash;6',
-    '1962:4',
-    '1962:41',
-    '1962:555',
-    '1962:683',
-    '1962b',
-    '1962m',
-    '1963&mdash;65',
-    '1963&mdash;66',
-    '1963&mdash;67',
-    '1963&mdash;69',
-    '1963&ndash;1967',
     '1963&ndash;1968',
-    '1963&ndash;1971',
-    '1963&ndash;6',
-    '1963&ndash;66',
-    '1963&ndash;69',
-    '1963&ndash;71',
-    '1963&ndash;73',
-    '1963&ndash;74',
-    '1963&ndash;75',
-    '1963&ndash;78',
-    '1963&ndash;9',
-    '1963-',
-    '1963-1965',
-    '1963-1990',
-    '1963-6',
-    '1963-64',
     '1963-78',
-    '1963-83',
-    '1963/4',
-    '1963/mike',
-    '19630',
-    '1963:12',
-    '1963:126',
-    '1963:2',
-    '1963:227',
-    '1963:6',
-    '1963:62',
-    '1963:9',
-    '1963:91',
-    '1963:93',
-    '1964&mdash;70',
-    '1964&ndash;1920',
     '1964&ndash;1973',
-    '1964&ndash;1979',
-    '1964&ndash;1983',
-    '1964&ndash;6',
-    '1964&ndash;67',
-    '1964&ndash;69',
-    '1964&ndash;71',
-    '1964&ndash;72',
-    '1964&ndash;79',
-    '1964&ndash;80',
-    '1964&ndash;81',
-    '1964&ndash;82',
-    '1964&ndash;89',
-    '1964&ndash;9',
-    '1964,1965',
-    '1964,1966,1971',
     '1964-1985',
-    '1964-1986',
-    '1964-79',
-    '1964-see',
-    '1964.4',
-    '1964/41',
-    '196448',
-    '196480',
-    '1964:161',
-    '1964:204&ndash;5',
-    '1964:22',
-    '1964:356',
-    '1964:4',
-    '1964:73',
-    '1964aprilnow',
-    '1964wk',
     '1965&mdash;66',
-    '1965&ndash;1971',
-    '1965&ndash;1976',
-    '1965&ndash;1990',
-    '1965&ndash;74',
-    '1965&ndash;8',
-    '1965&ndash;83',
-    '1965&ndash;84',
-    '1965&ndash;85',
-    '1965&ndash;86',
-    '1965&ndash;89',
-    '1965,1976',
-    '1965-1966',
-    '1965-1977',
-    '1965-1978',
-    '1965-1990',
     '1965-78',
-    '1965/6',
-    '1965/london',
-    '19650',
-    '1965:31',
-    '1965:60',
-    '1965:63',
-    '1965a:93',
-    '1966&mdash;68',
-    '1966&mdash;7',
-    '1966&mdash;70',
-    '1966&ndash\'69',
-    '1966&ndash;1968',
-    '1966&ndash;1976',
-    '1966&ndash;68',
-    '1966&ndash;69',
     '1966&ndash;75',
-    '1966&ndash;78',
-    '1966&ndash;80',
-    '1966&ndash;86',
-    '1966&ndash;aug.',
-    '1966,1979',
-    '1966-68',
-    '1966-69',
-    '1966-80',
-    '1966-see',
-    '1966.',
-    '1966/aberfan/wales',
-    '1966/early',
-    '196608',
-    '19665024',
-    '19668',
     '1966:121',
-    '1966:17',
-    '1966:210',
-    '1966:241',
-    '1966:279',
-    '1966:29&ndash;31',
-    '1966:464',
-    '1966:48',
-    '1966:49',
-    '1966:49&ndash;51',
-    '1966:55',
-    '1966:800',
-    '1966:805',
-    '1966:813',
-    '1967&mdash;87',
-    '1967&ndash;1972',
     '1967&ndash;1991',
-    '1967&ndash;1992',
-    '1967&ndash;72',
-    '1967&ndash;77',
-    '1967&ndash;80',
-    '1967&ndash;82',
-    '1967&ndash;87',
-    '1967,1970',
-    '1967-70',
-    '1967-72',
-    '1967-74',
-    '1967-89',
-    '1967.',
-    '1967/1968',
-    '1967/9',
-    '19670',
     '19671',
-    '19675',
-    '1967:104',
-    '1967:37',
-    '1967:37&ndash;8',
-    '1967:55&ndash;68',
-    '1967:56',
-    '1967:58',
-    '1967:67&ndash;8',
-    '1967:iii',
-    '1967the',
-    '1968&mdash;1978',
-    '1968&mdash;69',
-    '1968&ndash;1971',
-    '1968&ndash;1973',
-    '1968&ndash;1982',
     '1968&ndash;76',
-    '1968&ndash;78',
-    '1968&ndash;81',
-    '1968&ndash;86',
-    '1968&ndash;90',
-    '1968&ndash;91',
-    '1968\'s',
-    '1968,1970',
-    '1968,1977b',
-    '1968-',
-    '1968-.80',
-    '1968-1969',
-    '1968-1973',
-    '1968-1986',
-    '1968-and-all-that',
-    '1968-ish',
     '1968.',
-    '1968/9',
-    '19689',
-    '1968:202',
-    '1968:259',
-    '1968:273',
-    '1968:283&mdash;4',
-    '1968:299',
-    '1968:31',
-    '1969&ndash;1879',
-    '1969&ndash;1970',
-    '1969&ndash;1973',
-    '1969&ndash;1989',
-    '1969&ndash;75',
-    '1969&ndash;77',
-    '1969&ndash;79',
     '1969&ndash;81',
-    '1969&ndash;82',
-    '1969&ndash;92',
-    '1969\'',
-    '1969,1975',
-    '1969,1977',
-    '1969,1978&ndash;79',
-    '1969,1980',
-    '1969-1972',
-    '1969-71',
-    '1969-72',
-    '1969-79',
-    '1969-82',
-    '1969/1842',
-    '1969/71',
-    '1969/caernarfon/wales',
     '19694',
-    '1969:105&ndash;6',
-    '1969:107',
-    '1969:17',
-    '1969:176',
-    '1969:196',
-    '1969:206',
-    '1969:221',
-    '1969:224',
-    '1969:230',
-    '1969:25',
-    '1969:256',
-    '1969:26',
-    '1969:27&ndash;8',
-    '1969:278',
-    '1969:287',
     '1969:291&ndash;2',
-    '1969:292',
-    '1969:328',
-    '1969:332',
-    '1969:337',
-    '1969:5',
-    '1969:6',
-    '1969:73',
-    '1969:84',
-    '1969:92,141&ndash;4',
-    '1969:93',
-    '1969:94',
-    '1969:ch.',
-    '1969:vol',
-    '1969c',
-    '1969conferred',
     '196bn',
-    '196ff.',
-    '196ft',
-    '196k',
-    '196l',
-    '196p',
-    '196pp',
-    '196pp.',
-    '197&ndash;201',
-    '197&ndash;203',
-    '197&ndash;213',
-    '197&ndash;222',
-    '197&ndash;227',
-    '197&ndash;8',
-    '197()s',
-    '197-9',
     '197-yard',
-    '197.7%',
-    '197.9',
-    '197/87',
-    '1970&ndash;1977',
-    '1970&ndash;1979',
-    '1970&ndash;1981',
-    '1970&ndash;1987',
-    '1970&ndash;7',
-    '1970&ndash;73',
-    '1970&ndash;78',
-    '1970&ndash;84',
-    '1970&ndash;9',
-    '1970&ndash;91',
-    '1970\'s.',
-    '1970,16',
     '1970,1977',
-    '1970,1977a',
-    '1970-',
-    '1970-1973',
-    '1970-1980',
-    '1970-1983',
-    '1970-80',
-    '1970-81',
-    '1970-83',
-    '1970-87',
-    '1970-91',
-    '1970-i',
-    '1970-s',
-    '1970-style',
-    '1970.',
-    '1970/1846',
     '1970/81',
-    '1970/992',
-    '19704721',
-    '1970:12',
-    '1970:143',
-    '1970:15',
-    '1970:160',
-    '1970:186&ndash;91',
-    '1970:193',
-    '1970:198',
-    '1970:222',
-    '1970:229',
-    '1970:233',
-    '1970:24',
-    '1970:291',
-    '1970:299',
     '1970:302',
-    '1970:34',
-    '1970:38',
-    '1970:54',
-    '1970:58&ndash;9',
-    '1970:66',
-    '1970:8',
-    '1970:80',
-    '1970:83',
-    '1970:86',
-    '1970:92',
-    '1970a:90',
-    '1970b:48',
-    '1970b:74',
-    '1970s*',
-    '1970s-',
     '1970s-to-present',
-    '1970s.',
-    '1970s.he',
-    '1970s/80s',
-    '1971&mdash;1990',
-    '1971&mdash;73',
-    '1971&ndash;1973',
-    '1971&ndash;1977',
-    '1971&ndash;1978',
-    '1971&ndash;1981',
-    '1971&ndash;1989',
-    '1971&ndash;5',
-    '1971&ndash;74',
-    '1971&ndash;8',
-    '1971&ndash;85',
-    '1971(4)',
     '1971,1975',
-    '1971,1977',
-    '1971-1981',
-    '1971-1989',
-    '1971-2',
-    '1971-73',
-    '1971-76',
-    '1971-79',
-    '1971-82',
-    '1971-84',
-    '1971/2',
-    '1971/73',
-    '1971/81',
-    '19710',
-    '1971:116',
-    '1971:127',
     '1971:343',
-    '1971:35',
-    '1971:350',
-    '1971:38',
-    '1971:5',
-    '1971:7',
-    '1971:9',
-    '1971:9&ndash;34',
-    '1971a:163',
-    '1971b:369',
-    '1971c',
-    '1971m',
-    '1972&mdash;and',
-    '1972&ndash\'73',
-    '1972&ndash\'92',
-    '1972&ndash;1976',
     '1972&ndash;1984',
-    '1972&ndash;1989',
-    '1972&ndash;1992',
-    '1972&ndash;74',
-    '1972&ndash;77',
-    '1972&ndash;78',
-    '1972&ndash;84',
-    '1972&ndash;87',
-    '1972&ndash;90',
-    '1972-',
-    '1972-1980',
-    '1972-1984',
-    '1972-77',
-    '1972-82',
-    '1972/4',
-    '1972/41',
     '1972/74',
-    '1972/82/92',
-    '1972/85',
-    '19720',
-    '1972:2',
-    '1972:22',
-    '1972:277',
-    '1972:288',
-    '1972:36',
-    '1972:39',
-    '1972:420',
-    '1972:446',
-    '1972:457',
-    '1972:468',
-    '1972:48',
-    '1972:51',
     '1972:55',
-    '1972:84',
-    '1972:9',
-    '1972:90',
-    '1972:93',
-    '1972b:277&ndash;8',
-    '1972c:14',
-    '1973&mdash;1980',
-    '1973&ndash;1975',
-    '1973&ndash;7',
-    '1973&ndash;76',
-    '1973&ndash;77',
-    '1973&ndash;8',
-    '1973&ndash;81',
-    '1973&ndash;84',
-    '1973&ndash;85',
     '1973&ndash;86',
-    '1973&ndash;87',
-    '1973&ndash;88',
-    '1973&ndash;89',
-    '1973&ndash;9',
-    '1973&sol;74',
-    '1973,1974',
-    '1973-1977',
-    '1973-1981',
-    '1973-4',
-    '1973-75',
-    '1973-77',
-    '1973-78',
-    '1973-79',
-    '1973-85',
-    '1973-registered',
     '1973.',
-    '1973.7&ndash;26.4',
-    '1973/1974',
-    '1973/1979',
-    '1973/334',
-    '1973:123',
-    '1973:16',
-    '1973:177&ndash;7',
-    '1973:21',
-    '1973:218',
-    '1973:230',
-    '1973:231',
-    '1973:32',
-    '1973:36&ndash;7',
-    '1973a:177&ndash;9',
-    '1973b:614',
     '1974&ndash',
-    '1974&ndash;1976',
-    '1974&ndash;1978',
-    '1974&ndash;1990',
-    '1974&ndash;1992',
-    '1974&ndash;76',
-    '1974&ndash;83',
-    '1974&ndash;86',
-    '1974&ndash;87',
-    '1974&ndash;89',
-    '1974&ndash;8i',
-    '1974&ndash;90',
-    '1974\'s',
-    '1974,1975',
-    '1974,1980',
-    '1974,1r',
     '1974-',
-    '1974-1979',
-    '1974-1987',
-    '1974-76',
-    '1974-78',
-    '1974-81',
-    '1974-83',
-    '1974-89',
-    '1974-onwards',
-    '1974/2140',
-    '1974/420',
-    '1974/82',
-    '19744516',
-    '19745',
-    '19747',
-    '1974:105',
     '1974:137',
-    '1974:178',
-    '1974:191',
-    '1974:2',
-    '1974:22&ndash;30',
-    '1974:28',
-    '1974:353',
-    '1974:45',
-    '1974:48',
-    '1974:56',
-    '1974:57',
-    '1974:602',
-    '1974:66&ndash;71',
-    '1974:67',
-    '1974:70',
-    '1974:71&ndash;7',
     '1974:80',
-    '1974:81',
-    '1975&mdash;79',
-    '1975&mdash;85',
-    '1975&mdash;90',
-    '1975&ndash;1977',
-    '1975&ndash;1980',
-    '1975&ndash;1985',
-    '1975&ndash;1986',
-    '1975&ndash;2026',
-    '1975&ndash;6&ndash;7',
-    '1975&ndash;8',
-    '1975&ndash;83',
-    '1975&ndash;84',
-    '1975&ndash;89',
-    '1975&ndash;90',
     '1975&sol;6',
-    '1975,1976',
-    '1975,1979',
-    '1975-',
-    '1975-1979',
-    '1975-1990',
-    '1975-83',
-    '1975-85',
-    '1975-9',
-    '1975-90',
-    '1975-onwards',
-    '1975-to-1977',
-    '1975/79',
-    '19750',
-    '19757',
-    '1975:124',
     '1975:125',
-    '1975:19&ndash;24',
-    '1975:257',
-    '1975:262',
-    '1975:33',
-    '1975:37&ndash;11',
-    '1975:43',
-    '1975:44',
-    '1975:54',
-    '1975:642',
-    '1975:77',
-    '1975:78',
-    '1975:9',
-    '1975b:76',
-    '1975b:84',
-    '1975excluded',
     '1976&mdash;81',
-    '1976&ndash',
-    '1976&ndash;1977',
-    '1976&ndash;1980',
-    '1976&ndash;1988',
-    '1976&ndash;1991',
-    '1976&ndash;78',
-    '1976&ndash;8',
-    '1976&ndash;83',
-    '1976&ndash;84',
-    '1976&ndash;85',
-    '1976&ndash;88',
-    '1976&ndash;89',
-    '1976&ndash;91',
-    '1976&ndash;92',
-    '1976&sol;7',
     '1976\'s',
-    '1976-',
-    '1976-1983',
-    '1976-68',
-    '1976-77',
-    '1976-82',
-    '1976/6',
-    '1976/67',
-    '19760',
-    '19761',
-    '19763',
-    '1976:104',
-    '1976:12',
-    '1976:151',
-    '1976:170',
-    '1976:183',
     '1976:190',
-    '1976:196',
-    '1976:207',
-    '1976:25',
-    '1976:28&ndash;7',
-    '1976:348',
-    '1976:39',
-    '1976:40',
-    '1976:417',
-    '1976:46',
-    '1976:61',
-    '1976:74',
-    '1976:76',
-    '1976:81',
-    '1976:9',
-    '1976:97&ndash;100',
     '1976:ch',
-    '1976a:114',
-    '1976a:16',
-    '1976a:17',
-    '1976d',
-    '1976k:15',
-    '1976k:18',
-    '1976k:21&ndash;2',
-    '1976k:4&ndash;5',
-    '1977&ndash;1978',
-    '1977&ndash;1980',
-    '1977&ndash;1981',
-    '1977&ndash;1983',
-    '1977&ndash;1985',
-    '1977&ndash;1990',
-    '1977&ndash;83',
     '1977&ndash;86',
-    '1977&ndash;88',
-    '1977&ndash;90',
-    '1977&ndash;91',
-    '1977&rehy;giddens',
-    '1977-1978',
-    '1977-78',
-    '1977-87',
-    '1977-91',
-    '1977-a',
-    '1977-series',
-    '197711622',
-    '1977:120',
-    '1977:124',
-    '1977:136&ndash;7',
-    '1977:14',
     '1977:144',
-    '1977:176',
-    '1977:18',
-    '1977:18&ndash;20',
-    '1977:180&ndash;82',
-    '1977:205',
-    '1977:206',
-    '1977:223',
-    '1977:244',
-    '1977:247',
-    '1977:27',
-    '1977:29',
-    '1977:30',
-    '1977:31',
-    '1977:348',
-    '1977:38',
     '1977:677',
-    '1977:73&ndash;4',
-    '1977:75',
-    '1977:756',
-    '1977:v',
-    '1977a:129',
-    '1977a:134',
-    '1978&ndash;1988',
-    '1978&ndash;1990',
-    '1978&ndash;2018.',
-    '1978&ndash;78',
-    '1978&ndash;93',
-    '1978&ndash;9a',
-    '1978&sol;9',
-    '1978,1981',
-    '1978,24',
     '1978-1984',
-    '1978-82',
-    '1978-83',
-    '1978-85',
-    '1978-based',
-    '1978.',
-    '1978.5.7',
-    '1978/',
-    '1978/1979',
-    '1978/88',
-    '1978/9a',
-    '1978/birmingham',
-    '1978/l979',
-    '19780',
-    '197879',
-    '1978:1',
     '1978:10',
-    '1978:110',
-    '1978:117',
-    '1978:12',
-    '1978:122',
-    '1978:13',
-    '1978:134',
-    '1978:137',
-    '1978:139',
-    '1978:145',
-    '1978:153',
-    '1978:169',
-    '1978:173',
-    '1978:174',
-    '1978:176',
-    '1978:178',
     '1978:18',
-    '1978:2',
-    '1978:200',
-    '1978:202',
-    '1978:218',
-    '1978:225',
-    '1978:229',
-    '1978:3',
-    '1978:36',
-    '1978:42',
-    '1978:43',
-    '1978:58',
-    '1978:83',
-    '1978:86',
-    '1978and',
-    '1978d',
     '1979&mdash;81',
-    '1979&mdash;ucta',
-    '1979&ndash;11',
-    '1979&ndash;1984',
-    '1979&ndash;1987',
-    '1979&ndash;1989',
-    '1979&ndash;1992',
-    '1979&ndash;91',
-    '1979&sol;80',
-    '1979\'s',
-    '1979,1985',
-    '1979,6',
-    '1979-1983',
-    '1979-1984',
-    '1979-1985',
-    '1979-1986',
     '1979-1987',
-    '1979-1991',
-    '1979-82',
-    '1979-84',
-    '1979-85',
-    '1979-86',
-    '1979-87',
-    '1979-december',
-    '1979-january',
-    '1979/1080',
-    '1979/591',
-    '19790',
-    '19791',
-    '19794211',
-    '1979:105',
-    '1979:113',
     '1979:113&ndash;115',
-    '1979:114',
-    '1979:125',
-    '1979:128',
-    '1979:130',
-    '1979:131',
-    '1979:133&ndash;142',
-    '1979:134',
-    '1979:148',
-    '1979:164',
-    '1979:169',
-    '1979:17',
-    '1979:170&ndash;1',
-    '1979:183',
-    '1979:204',
-    '1979:206',
     '1979:215',
-    '1979:24',
-    '1979:28',
-    '1979:2f',
-    '1979:30',
-    '1979:32&ndash;36',
-    '1979:39',
-    '1979:43-4',
-    '1979:48',
-    '1979:49',
-    '1979:49&ndash;50',
-    '1979:68',
-    '1979:7149',
-    '1979:86',
-    '1979:ch.',
-    '1979=',
     '1979a:22',
-    '1979b:173',
-    '1979c:59',
-    '1979c:97',
-    '1979onwards',
-    '1979r',
-    '197bhp',
-    '197f&ndash;g',
-    '197g',
-    '197km',
-    '197l',
-    '197o',
-    '197os',
-    '198&ndash;197',
-    '198&ndash;201',
-    '198&ndash;205',
     '198&ndash;206',
-    '198&ndash;224',
-    '198&ndash;230',
-    '198&ndash;2888',
-    '198&ndash;6',
-    '198&ndash;87',
-    '198&times;10/l',
-    '198()s',
-    '198,000',
-    '198,006',
-    '198,200',
-    '198,225',
-    '198-',
-    '198-8',
-    '198-member',
-    '198-run',
     '198-seat',
-    '198-yard',
-    '1980&mdash;1991',
-    '1980&mdash;81',
-    '1980&ndash;1983',
-    '1980&ndash;1985',
-    '1980&ndash;1986',
-    '1980&ndash;1988',
-    '1980&ndash;1989',
-    '1980&ndash;1991',
-    '1980&ndash;1992',
-    '1980&ndash;22',
-    '1980&ndash;3',
-    '1980&ndash;88',
-    '1980&sol;81',
-    '1980,1981',
     '1980-1',
-    '1980-1982',
-    '1980-1985',
-    '1980-1988',
-    '1980-1990',
-    '1980-1991',
-    '1980-83',
-    '1980-90',
-    '1980.',
-    '1980/81-1983/84',
-    '19801989',
-    '19802',
-    '19806',
-    '1980:1',
-    '1980:108',
-    '1980:11',
     '1980:111',
-    '1980:126',
-    '1980:135',
-    '1980:157&ndash;67',
-    '1980:16',
-    '1980:201',
-    '1980:24',
-    '1980:247',
-    '1980:248',
-    '1980:261',
-    '1980:262',
-    '1980:267',
-    '1980:269',
-    '1980:273',
-    '1980:276',
-    '1980:287',
     '1980:289',
-    '1980:296',
-    '1980:298',
-    '1980:30',
-    '1980:302',
-    '1980:31',
-    '1980:316',
-    '1980:33',
-    '1980:399',
-    '1980:4',
-    '1980:423',
-    '1980:483',
-    '1980:77',
-    '1980:8',
-    '1980:90',
-    '1980:97',
     '1980:98',
-    '1980:part',
-    '1980:x&ndash;xi',
-    '1980m',
-    '1980mm',
-    '1980r',
-    '1980s*',
-    '1980s-style',
-    '1981&mdash;3',
-    '1981&mdash;82',
-    '1981&mdash;87',
-    '1981&mdash;see',
-    '1981&ndash;1934',
-    '1981&ndash;1983',
-    '1981&ndash;1987',
-    '1981&ndash;7',
     '1981&ndash;88',
-    '1981,49&ndash;50',
-    '1981-',
-    '1981-1982',
-    '1981-1983',
-    '1981-1991',
-    '1981-1993',
-    '1981-4',
-    '1981-6',
-    '1981-92',
-    '1981.1',
-    '1981/1573',
-    '1981/1794',
-    '1981/1794&mdash;the',
-    '1981/1982',
-    '1981/898',
     '19816',
-    '19816.5',
-    '1981:1',
-    '1981:101&ndash;7',
-    '1981:114',
-    '1981:117',
-    '1981:121&ndash;31',
-    '1981:156',
-    '1981:166',
-    '1981:179',
-    '1981:203&ndash;5',
-    '1981:282',
-    '1981:308',
-    '1981:324',
-    '1981:329',
-    '1981:342',
     '1981:35',
-    '1981:388',
-    '1981:413',
-    '1981:448ff',
-    '1981:60',
-    '1981:70',
-    '1981:86',
-    '1981:p.',
-    '1981from',
-    '1981m',
-    '1981p.',
-    '1981s',
-    '1982&ndash;1984',
-    '1982&ndash;1985',
-    '1982&ndash;1991',
-    '1982&ndash;29',
     '1982&ndash;8',
-    '1982&ndash;91',
-    '1982(a)',
-    '1982(b)',
-    '1982,1985,1986',
-    '1982-1985',
-    '1982-1986',
-    '1982-1990',
-    '1982-1992',
-    '1982-3',
-    '1982-5',
-    '1982-6',
-    '1982-87',
-    '1982-88',
-    '1982-89',
-    '1982-ish',
     '1982/6',
-    '1982/84',
-    '1982/87',
-    '1982/early',
-    '19821',
-    '1982:106&ndash;26',
-    '1982:133,148&ndash;9',
-    '1982:148',
-    '1982:153',
-    '1982:157&ndash;8',
-    '1982:158',
-    '1982:163&ndash;4',
-    '1982:166',
-    '1982:169',
-    '1982:17',
-    '1982:170',
     '1982:191',
-    '1982:2',
-    '1982:20',
-    '1982:241',
-    '1982:243',
-    '1982:33',
-    '1982:33&ndash;5',
-    '1982:35',
-    '1982:4',
-    '1982:44',
-    '1982:45',
-    '1982:47',
-    '1982:6',
-    '1982:7',
-    '1982:laczko',
-    '1982a:26',
     '1982a:27',
-    '1982a:44',
-    '1982a:53',
-    '1982a:55',
-    '1982a:60',
-    '1982a:69',
-    '1982a:76',
-    '1982a:ch.',
-    '1982a:ch.3',
-    '1982b:18',
-    '1982b:38',
-    '1982b:46',
-    '1982b:63',
-    '1982b:67',
-    '1982b:69',
-    '1982did',
     '1982m',
-    '1983&mdash;february',
-    '1983&ndash;1984',
-    '1983&ndash;1986',
-    '1983&ndash;1987',
-    '1983&ndash;89',
-    '1983&sol;4',
-    '1983&sol;84',
-    '1983,149',
-    '1983,1985',
-    '1983,61',
-    '1983-',
-    '1983-1985',
-    '1983-1986',
-    '1983-1989',
-    '1983-8',
     '1983-90',
-    '1983/stoke-on-trent/staffordshire',
-    '19830',
-    '198319871992',
-    '19833711',
-    '19836',
-    '1983:10&ndash;11',
-    '1983:101',
-    '1983:109',
-    '1983:112',
-    '1983:117',
-    '1983:119',
-    '1983:146',
-    '1983:152',
-    '1983:16',
-    '1983:198',
     '1983:2',
-    '1983:21',
-    '1983:21&mdash;2',
-    '1983:214',
-    '1983:227',
-    '1983:230',
-    '1983:286',
-    '1983:287',
-    '1983:3',
-    '1983:39',
-    '1983:42',
-    '1983:426',
-    '1983:58&ndash;9',
-    '1983:64',
-    '1983:81',
-    '1983:83&mdash;84',
     '1983:90&ndash;1',
-    '1983:95',
-    '1983:97',
-    '1983:99&ndash;100',
-    '1983a:5',
-    '1983b:288',
-    '1983b:3',
-    '1983b:6',
-    '1983b:9',
-    '1983b:99',
-    '1984&lsqb',
-    '1984&mdash;1994',
-    '1984&ndash;1985',
-    '1984&ndash;1987',
-    '1984&ndash;2000',
-    '1984&ndash;31',
     '1984&ndash;5.',
-    '1984&ndash;91',
-    '1984&ndash;96',
-    '1984&sol;5',
-    '1984\'s',
-    '1984,145',
-    '1984,1985',
-    '1984,1987',
-    '1984,1988',
-    '1984,2',
-    '1984,20',
-    '1984,5',
-    '1984-1985',
-    '1984-1986',
-    '1984-1987',
-    '1984-1989',
     '1984-5',
-    '1984-54',
-    '1984-84',
-    '1984-87',
-    '1984-89',
-    '1984-90',
-    '1984-93',
-    '1984.5',
-    '1984/032',
-    '1984/062',
-    '1984/1015',
-    '1984/193,1986/019',
-    '1984/1990',
-    '1984/32',
-    '1984/83',
-    '1984/93',
     '1984/cowley/oxford',
-    '1984/leicestershire',
-    '198400',
-    '19841',
-    '19845',
-    '19849',
-    '1984:108',
-    '1984:128&ndash;9',
-    '1984:157&ndash;9',
-    '1984:16',
-    '1984:198',
-    '1984:199',
-    '1984:204',
-    '1984:206&ndash;7',
-    '1984:283',
-    '1984:328',
     '1984:335',
-    '1984:336',
-    '1984:340',
-    '1984:345',
-    '1984:38&ndash;9',
-    '1984:41&ndash;2',
-    '1984:44',
-    '1984:50',
-    '1984:6',
-    '1984:67',
-    '1984:78',
-    '1984:84',
-    '1984:85',
-    '1984:89',
-    '1984=88',
-    '1984d',
     '1984s',
-    '1985&lsqb',
-    '1985&mdash;1987',
-    '1985&ndash;1989',
-    '1985&ndash;1991',
-    '1985&ndash;2025',
-    '1985\'s',
-    '1985,14-15',
-    '1985,3',
-    '1985,75',
-    '1985,81-3',
-    '1985-69',
-    '1985-based',
-    '1985/062',
-    '1985/1986',
-    '1985/31',
     '1985/5',
-    '1985/birmingham',
-    '19850',
-    '198515',
-    '19852',
-    '19856',
-    '19857',
-    '19858',
-    '1985:10',
-    '1985:103',
-    '1985:104',
-    '1985:106',
-    '1985:135',
-    '1985:147',
-    '1985:154&mdash;7',
-    '1985:180',
     '1985:254',
-    '1985:3',
-    '1985:3&mdash;33',
-    '1985:39',
-    '1985:41',
-    '1985:473',
-    '1985:48',
-    '1985:51',
-    '1985:53',
-    '1985:62',
-    '1985:76',
-    '1985:83',
-    '1985:86',
-    '1985:88',
-    '1985:89',
-    '1985_according',
     '1985a:143',
-    '1985a:149',
-    '1985b:35',
-    '1985r',
-    '1986&lsqb',
-    '1986&mdash;87',
-    '1986&ndash;1988',
-    '1986&ndash;7a',
-    '1986*',
-    '1986,1988',
-    '1986,6',
-    '1986,80',
-    '1986-1991',
-    '1986-9',
-    '1986/',
-    '1986/\'97',
     '1986/019',
-    '1986/109',
-    '1986/gareth',
-    '1986/loscoe/derbyshire',
-    '1986/stroud/gloucestershire',
-    '1986:1',
-    '1986:1&ndash;2',
-    '1986:10',
-    '1986:103',
-    '1986:112',
-    '1986:113',
-    '1986:114&ndash;15',
-    '1986:127',
-    '1986:131',
-    '1986:139&ndash;40',
-    '1986:148',
     '1986:150f',
-    '1986:161',
-    '1986:164',
-    '1986:17',
-    '1986:173&ndash;4',
-    '1986:187',
-    '1986:23',
-    '1986:24',
-    '1986:30',
-    '1986:45',
-    '1986:45&mdash;6',
-    '1986:55',
-    '1986:59',
-    '1986:6',
-    '1986:62',
-    '1986:69',
     '1986:77',
-    '1986a:195',
-    '1986and',
-    '1986e',
-    '1986m',
-    '1987&mdash;1995',
-    '1987&mdash;88',
-    '1987&mdash;89',
-    '1987&ndash;1991',
-    '1987&ndash;1992',
-    '1987&ndash;2000',
-    '1987&ndash;30',
-    '1987&ndash;91',
-    '1987&ndash;figures',
-    '1987,11.8%',
-    '1987,1988,1990a',
     '1987,543',
-    '1987,58%',
-    '1987-',
-    '1987-2001',
-    '1987-90',
-    '1987-91',
-    '1987-94',
-    '1987-date',
-    '1987-era',
-    '1987-see',
-    '1987.10&ndash;5.1',
-    '1987/',
-    '1987/1988',
-    '1987/aylesbury/buckinghamshire',
-    '1987/beirut',
-    '19873613',
     '198741',
-    '19877',
-    '1987:106&ndash;11',
-    '1987:121',
-    '1987:214&ndash;18',
-    '1987:224',
-    '1987:23',
-    '1987:276',
-    '1987:31',
-    '1987:35',
-    '1987:463',
-    '1987:490',
-    '1987:56',
-    '1987:59',
-    '1987:64&ndash;8',
-    '1987:66',
     '1987:67',
-    '1987:70',
-    '1987:8',
-    '1987:93',
-    '1987:97',
-    '1987:ch.',
-    '1987=100',
-    '1987and',
-    '1987apr',
-    '1987requiring',
-    '1987the',
-    '1988&lsqb;q.b.',
-    '1988&mdash;1992',
-    '1988&mdash;89',
-    '1988&mdash;90',
-    '1988&mdash;91',
     '1988&mdash;92',
-    '1988&mdash;ibid',
-    '1988&ndash;1991',
-    '1988&ndash;1992',
-    '1988&ndash;1997',
-    '1988&ndash;93',
-    '1988,1989',
-    '1988,1991',
-    '1988-\'89',
-    '1988-9',
-    '1988-91',
-    '1988-91.',
-    '1988-october',
-    '1988.3',
-    '1988.37',
-    '1988/24803',
     '1988/89/90/91',
-    '1988/birmingham',
-    '1988/itn',
-    '1988/seoul/south',
-    '198866',
-    '19887',
-    '1988:113',
-    '1988:116',
-    '1988:117',
-    '1988:123',
-    '1988:126',
-    '1988:130&ndash;1',
-    '1988:134&ndash;5',
-    '1988:140&mdash;1',
-    '1988:145',
-    '1988:159',
     '1988:16',
-    '1988:163',
-    '1988:168&ndash;9',
-    '1988:17',
-    '1988:170',
-    '1988:175',
-    '1988:176',
-    '1988:2',
-    '1988:213',
-    '1988:23',
-    '1988:231',
-    '1988:273',
-    '1988:31',
-    '1988:327',
-    '1988:37',
-    '1988:4',
     '1988:59',
-    '1988:61',
-    '1988:69',
-    '1988:7',
-    '1988:8',
-    '1988:85',
-    '1988:88',
-    '1988:89',
-    '1988:90',
-    '1988:95',
-    '1988a:129',
-    '1988a:133',
-    '1988a:137',
-    '1988a:2',
-    '1988a:6',
-    '1988i',
     '1988s',
-    '1989&mdash;2001',
-    '1989&mdash;91',
-    '1989&mdash;see',
-    '1989&mdash;the',
-    '1989&ndash\'90',
-    '1989&ndash;16',
-    '1989&ndash;1993',
-    '1989&ndash;31',
-    '1989(a)',
-    '1989-90*',
-    '1989-april',
-    '1989-ibid',
-    '1989-june',
-    '1989-march',
-    '1989-october',
     '1989/1081',
-    '1989/1082',
-    '1989/1990',
-    '1989/1992',
-    '1989/379',
-    '1989/4',
-    '1989/90/91',
-    '1989/a34/oxfordshire',
-    '1989/cotswold',
-    '1989/early',
-    '1989/heathrow',
-    '1989/kate',
-    '1989/littlehaven/west',
-    '1989/milton',
-    '1989/november',
-    '1989/oxford',
     '1989/turweston/buckinghamshire',
-    '19890',
-    '19891',
-    '1989364',
-    '19894',
-    '19898',
-    '1989:109',
-    '1989:118',
-    '1989:120',
-    '1989:126',
-    '1989:127',
-    '1989:14',
-    '1989:143',
-    '1989:144',
-    '1989:16',
-    '1989:165',
     '1989:167',
-    '1989:168',
-    '1989:169',
-    '1989:17&ndash;18',
-    '1989:172',
-    '1989:173',
-    '1989:18',
-    '1989:184',
-    '1989:202',
-    '1989:203',
-    '1989:208&ndash;9',
-    '1989:22&mdash;3',
-    '1989:23',
-    '1989:26',
-    '1989:260',
-    '1989:261',
     '1989:27',
-    '1989:270',
-    '1989:273',
-    '1989:273&ndash;4',
-    '1989:281',
-    '1989:29',
-    '1989:290&ndash;1',
-    '1989:297',
-    '1989:298',
-    '1989:322',
-    '1989:33',
-    '1989:337',
-    '1989:343',
-    '1989:345',
-    '1989:43',
-    '1989:48',
     '1989:50',
-    '1989:57',
-    '1989:76&ndash;7',
-    '1989:92',
-    '1989:ch.6',
-    '1989=100',
-    '1989a:10',
-    '1989a:21',
-    '1989ab',
-    '1989b:13',
-    '1989b:180',
-    '1989b:22',
-    '1989e:11',
-    '1989e:15',
-    '1989e:8',
-    '1989e:83',
     '1989e:84',
-    '1989g',
-    '1989h',
-    '198o',
-    '198os',
-    '198pp',
-    '198pp.',
-    '198th',
-    '199&frac23',
-    '199&ndash;201',
-    '199&ndash;205',
-    '199&ndash;207',
-    '199&ndash;227',
-    '199,000',
-    '199,160',
-    '199,700',
     '199-264',
-    '199-5',
-    '199.6',
-    '1990&mdash&pound;2,057,000',
-    '1990&mdash;a',
-    '1990&mdash;well',
-    '1990&ndash;1994',
-    '1990&ndash;1995',
-    '1990&ndash;2',
-    '1990&ndash;912.7%',
-    '1990&ndash;92\'',
-    '1990&ndash;94',
-    '1990&ndash;95',
-    '1990*',
-    '1990-',
-    '1990--&dollar;5,000,000',
     '1990-1',
-    '1990-1993',
-    '1990-2',
-    '1990-2010',
-    '1990-90',
-    '1990-91commitments',
-    '1990-early',
-    '1990-june',
-    '1990-march',
-    '1990-see',
-    '1990-speak',
-    '1990/brian',
-    '1990/cinderford/gloucestershire',
-    '1990/drayton/oxfordshire',
-    '1990/gary',
-    '1990/gloucestershire',
     '1990/malvern',
-    '1990/pucklechurch/avon',
-    '1990/swindon',
-    '1990/swindon/wiltshire',
-    '199010,228',
-    '199091',
-    '1990:112',
-    '1990:115',
-    '1990:12',
-    '1990:121',
-    '1990:148',
-    '1990:156&mdash;7',
-    '1990:157',
-    '1990:203',
-    '1990:208',
-    '1990:22',
     '1990:237',
-    '1990:246',
-    '1990:26',
-    '1990:275',
-    '1990:315',
-    '1990:316',
-    '1990:362',
-    '1990:365',
-    '1990:48',
-    '1990:49',
-    '1990:77',
-    '1990:9',
-    '1990:9&mdash;10',
-    '1990:99',
-    '1990a:12',
-    '1990a:18',
     '1990a:25',
-    '1990a:8',
-    '1990a:9',
-    '1990by',
-    '1990c:32',
-    '1990d',
-    '1990e:31',
-    '1990nov',
-    '1990s.',
-    '1991&bsol;92',
-    '1991&mdash;1992',
-    '1991&mdash;most',
-    '1991&mdash;official',
-    '1991&ndash;1937',
-    '1991&ndash;1995',
-    '1991&ndash;1999',
     '1991&ndash;2000',
-    '1991&ndash;2001',
-    '1991&ndash;2004',
-    '1991&ndash;2051',
-    '1991&ndash;4',
-    '1991&ndash;92/',
-    '1991&ndash;924.7%',
-    '1991&ndash;94',
-    '1991&ndash;january',
-    '1991&sol;205',
-    '1991&sol;318',
-    '1991&sol;422',
-    '1991&sol;423',
-    '1991&sol;434',
-    '1991&sol;440',
-    '1991&sol;454',
     '1991&sol;654',
-    '1991,5',
-    '1991-1994',
-    '1991-91',
-    '1991-92.',
-    '1991-97',
-    '1991-april',
-    '1991-jan.',
-    '1991-june',
-    '1991-late',
-    '1991/',
-    '1991/2128',
-    '1991/2705',
-    '1991/4',
-    '1991/93',
-    '1991/birdlip',
     '1991/birdlip/',
-    '1991/blackbird',
-    '1991/brize',
-    '1991/cheltenham',
-    '1991/culham/oxfordshire',
-    '1991/gareth',
-    '1991/gavin',
-    '1991/great',
-    '1991/kelly',
-    '1991/kim',
-    '1991/lower',
-    '1991/m4/wiltshire',
-    '1991/m40/northamptonshire',
-    '1991/mount',
-    '1991/northampton',
-    '1991/northmoor/oxfordshire',
     '1991/nuneham',
-    '1991/raf',
-    '1991/simon',
-    '1991/stroud/gloucestershire',
-    '1991/tetbury/gloucestershire',
-    '1991/toot',
-    '1991/winslow/buckinghamshire',
-    '19911987',
-    '19911987199119871991',
-    '19912,21,419&ndash;25',
-    '199192',
-    '1991:118',
-    '1991:138',
-    '1991:139',
-    '1991:142',
-    '1991:170',
     '1991:189',
-    '1991:218',
-    '1991:6',
-    '1991:93&ndash;144',
-    '1991a:14',
-    '1991a:165',
-    '1991a:189',
-    '1991a:191&ndash;203',
-    '1991a:241',
-    '1991a:247',
-    '1991a:249',
-    '1991a:250&ndash;64',
-    '1991a:256&ndash;7',
-    '1991a:7',
-    '1991a:70&ndash;1',
-    '1991b:12',
     '1991b:2&mdash;7',
-    '1991c:13',
-    '1991did',
-    '1991e',
-    '1992&mdash;3',
-    '1992&ndash;1994',
-    '1992&ndash;1997',
-    '1992&ndash;22',
-    '1992&ndash;9',
-    '1992&ndash;96',
-    '1992&ndash;97',
-    '1992(7.30pm)',
-    '1992,12,3',
-    '1992-2001',
-    '1992-isms',
-    '1992/1420',
     '1992/1438',
-    '1992/1440',
-    '1992/1524',
-    '1992/1531',
-    '1992/1547',
-    '1992/1555',
-    '1992/1611',
-    '1992/1612',
-    '1992/1619',
-    '1992/1752',
-    '1992/1901',
-    '1992/1941',
-    '1992/1942',
-    '1992/1943',
-    '1992/1966',
-    '1992/2051',
     '1992/2073',
-    '1992/2075',
-    '1992/2355',
-    '1992/2452',
-    '1992/246',
-    '1992/258',
-    '1992/2792',
-    '1992/2793',
-    '1992/2915',
-    '1992/2932',
-    '1992/2966',
-    '1992/3003',
-    '1992/3004',
-    '1992/333',
-    '1992/9',
-    '1992/92',
     '1992/93.',
-    '1992/abingdon/oxfordshire',
-    '1992/andrew',
-    '1992/appleford/oxfordshire',
-    '1992/banbury/oxfordshire',
-    '1992/barton',
-    '1992/bicester/oxfordshire',
-    '1992/brian',
-    '1992/chipping',
-    '1992/chris',
-    '1992/churchdown/gloucestershire',
-    '1992/coleford/forest',
-    '1992/cumnor/oxfordshire',
-    '1992/cyril',
-    '1992/deanna',
-    '1992/diane',
     '1992/didcot/oxfordshire',
-    '1992/enstone/oxfordshire',
-    '1992/gareth',
-    '1992/hereford',
-    '1992/ian',
-    '1992/insp',
-    '1992/j',
-    '1992/jonathan',
-    '1992/karen',
-    '1992/london',
-    '1992/maria',
-    '1992/mike',
-    '1992/mitcheldean/gloucestershire',
-    '1992/neville',
-    '1992/reading',
-    '1992/robin',
     '1992/ross',
-    '1992/ruth',
-    '1992/silverstone/northamptonshire',
-    '1992/simon',
-    '1992/sqd',
-    '1992/st',
-    '1992/stoke',
-    '1992/stonebench',
-    '1992/stonebench/gloucestershire',
-    '1992/swindon',
-    '1992/the',
-    '1992/upper',
-    '1992/woodford/manchester',
-    '19920s',
-    '19923711',
-    '1992:mixed',
     '1992:most',
-    '1992ad',
-    '1992d',
-    '1992qb',
-    '1992s',
-    '1993&mdash;4',
-    '1993&mdash;on',
-    '1993&mdash;see',
-    '1993&ndash',
-    '1993&ndash;12',
-    '1993&ndash;18',
-    '1993&ndash;1996',
-    '1993&ndash;2',
-    '1993&ndash;2000',
-    '1993&ndash;2003',
-    '1993&ndash;31st',
     '1993&ndash;6',
-    '1993&ndash;9',
-    '1993,34,2',
-    '1993-1994',
-    '1993-2002',
-    '1993-96',
-    '1993-model',
-    '1993/',
-    '1993/4(2)',
-    '1993/94.',
-    '1993/abi',
-    '1993/burford/oxfordshire',
-    '1993/chris',
-    '1993/crowmarsh',
-    '1993/donald',
-    '1993/ellen',
     '1993/january',
-    '1993/karen',
-    '1993/leintwardine/herefordshire',
-    '1993/lester',
-    '1993/london',
-    '1993/mike',
-    '1993/milton',
-    '1993/northampton',
-    '1993/rape',
-    '1993/robin',
-    '1993/sharpness/gloucestershire',
-    '1993/stonehouse/gloucestershire',
-    '19931',
-    '19934',
-    '19938',
-    '199394',
     '1993b',
-    '1993fw',
-    '1994&mdash;96',
-    '1994&ndash;16th',
-    '1994&ndash;1998',
-    '1994&ndash;2004',
-    '1994-96',
-    '1994-97',
-    '1994a',
-    '1994b',
-    '1995&ndash;15th',
-    '1995&ndash;17th',
-    '1995&ndash;2040',
-    '1995&ndash;23rd',
-    '1995-1996',
-    '1995-6',
     '1995-98',
-    '19950',
-    '1996&ndash;15th',
-    '1996&ndash;21st',
-    '1996-7',
-    '1996/2001',
-    '19960',
-    '19965',
-    '1997-1999',
-    '1997-2007',
-    '1997-oriented',
-    '1997.',
-    '1997/8',
-    '1998-2001',
-    '1998.',
-    '19983',
     '1998cc',
-    '1999\'s',
-    '1999-2000',
-    '1999-2003',
-    '1999.',
-    '1999/2004',
-    '1999/purple',
-    '19990',
-    '19992/93',
-    '199f',
-    '199ff',
-    '199l',
-    '199o/cinderford/gloucestershire',
-    '199os',
-    '199th',
-    '19:07:00&ndash;0500',
     '19:08:52',
-    '19:1&ndash;8',
-    '19:11',
-    '19:13:41&ndash;0500',
-    '19:16&ndash;20',
-    '19:17',
-    '19:20',
-    '19:21&ndash;22',
-    '19:22',
-    '19:28&ndash;38',
-    '19:28:21',
-    '19:36',
-    '19:38',
-    '19:39&ndash;44',
-    '19:4&ndash;6',
-    '19:45&ndash;48',
     '19:46',
-    '19:47',
-    '19:5',
-    '19:55:37',
-    '19:58',
-    '19:7',
-    '19:8ff.',
-    '19a(2)',
-    '19a(3)',
-    '19ab',
-    '19as',
-    '19b&ndash;e',
-    '19b.',
-    '19b5',
-    '19bc',
-    '19bn',
     '19c-23c',
-    '19c.',
-    '19cm',
-    '19dx',
-    '19e&ndash;f',
-    '19f',
-    '19ff',
-    '19ft.',
-    '19g',
-    '19inch',
-    '19khz',
-    '19l4',
-    '19l5',
-    '19l8',
-    '19lbs',
-    '19ma',
     '19microsoft',
-    '19mm.',
-    '19months',
-    '19mph',
-    '19ms',
-    '19o',
-    '19o1',
-    '19o2',
-    '19o4',
-    '19o9sc',
-    '19pts',
-    '19s5',
-    '19secs',
-    '19tel',
-    '19th&ndash;21st',
-    '19th&ndash;22nd',
     '19th&ndash;25th',
-    '19th-22nd',
-    '19th-26th',
-    '19th-lap',
-    '19th.',
-    '19thc',
-    '19w',
-    '19w8',
-    '19w9',
-    '19x',
-    '19x44mm',
-    '19x7',
-    '19x8',
-    '19y2',
-    '19year-old',
-    '1:0',
     '1:0.9',
-    '1:02',
-    '1:02:39',
-    '1:02:50',
-    '1:02secs',
-    '1:03secs',
-    '1:04:10',
-    '1:04:45',
-    '1:04:56',
-    '1:05:14',
-    '1:05:29',
-    '1:06',
-    '1:06:09',
-    '1:06secs',
-    '1:07',
-    '1:07:21',
     '1:08',
-    '1:09',
-    '1:1&ndash;3',
-    '1:1&ndash;4',
-    '1:1,000',
-    '1:1.5',
-    '1:1.618',
-    '1:1.65',
-    '1:1.7',
-    '1:1.80',
-    '1:10&amp;sup9',
-    '1:10,560',
-    '1:1067',
-    '1:10k',
-    '1:10secs',
-    '1:11&ndash;12',
     '1:11,12',
-    '1:11-1:16',
-    '1:11.6',
-    '1:1120',
-    '1:12800',
-    '1:12o',
-    '1:1365',
-    '1:14.041',
-    '1:14.370',
-    '1:15&ndash;16',
-    '1:15&ndash;23',
-    '1:15&ndash;2:10',
-    '1:15.114',
-    '1:15.210',
-    '1:1563',
-    '1:15f',
     '1:16&ndash;20',
-    '1:16.078',
-    '1:16.091',
-    '1:16.440',
-    '1:16.727',
-    '1:16.8',
-    '1:16.863',
-    '1:16.937',
-    '1:16.944',
-    '1:160',
-    '1:160000',
-    '1:17.037',
-    '1:17.047',
-    '1:17.231',
-    '1:1745',
-    '1:17f',
     '1:18,20',
-    '1:18f',
-    '1:19',
-    '1:19&ndash;25',
-    '1:19.49',
-    '1:192',
-    '1:1:1',
-    '1:1:2',
-    '1:1:2.',
-    '1:1:40',
-    '1:1ff',
-    '1:2&ndash;38',
-    '1:2,500',
-    '1:2.4',
-    '1:2.9',
-    '1:20.80',
     '1:200000',
-    '1:21.491',
-    '1:21.552',
-    '1:21.825',
-    '1:21.948',
-    '1:2300',
-    '1:239,300',
-    '1:2430',
-    '1:24:25',
-    '1:25,000-scale',
-    '1:250,000',
-    '1:26&mdash;7',
-    '1:26&ndash;27',
-    '1:26&ndash;38',
-    '1:26,28',
-    '1:26secs',
     '1:29&ndash;50',
-    '1:296',
-    '1:2:3:2:1',
-    '1:2:5:6-dibenzanthracene',
-    '1:2:6',
-    '1:3&ndash;14',
-    '1:3&ndash;4',
-    '1:3,4',
-    '1:3.5',
-    '1:30000',
-    '1:300000',
-    '1:3082',
-    '1:30pm',
-    '1:31',
-    '1:31secs',
-    '1:32,33',
     '1:32:22',
-    '1:32secs',
-    '1:35&ndash;39',
-    '1:36',
-    '1:38.962',
-    '1:3802',
-    '1:39',
-    '1:4,5',
-    '1:4.5',
-    '1:40&ndash;42',
-    '1:40&ndash;5',
-    '1:42',
-    '1:440',
-    '1:45.85',
-    '1:45am',
-    '1:45pm',
     '1:46',
-    '1:46&ndash;55',
-    '1:47',
-    '1:47.62',
-    '1:47:29',
-    '1:4888',
-    '1:49',
-    '1:5&ndash;7',
-    '1:5&ndash;80',
-    '1:5,000',
-    '1:500000',
-    '1:50:00',
-    '1:51',
-    '1:51.34',
-    '1:528',
-    '1:52:35',
     '1:52:52',
-    '1:54',
-    '1:56.0',
-    '1:56.1',
-    '1:575',
-    '1:59.1',
-    '1:59.5',
-    '1:5f',
-    '1:60000',
-    '1:610',
-    '1:625',
-    '1:625,000',
-    '1:63,360',
-    '1:6400',
-    '1:65000',
-    '1:68',
     '1:68&ndash;79',
-    '1:6d',
-    '1:7500',
-    '1:8,10',
-    '1:80',
-    '1:80,000',
-    '1:82',
-    '1:9&ndash;11',
-    '1:906,530',
-    '1:975',
-    '1:9ff',
-    '1:iii',
-    '1:market',
-    '1:mobile',
-    '1=150',
-    '1=blood',
     '1=e',
-    '1=hardly',
-    '1=interlobular',
-    '1=less',
-    '1=loss',
-    '1=low',
-    '1=normal',
-    '1=not',
-    '1=occasional',
-    '1=one',
-    '1=pain',
-    '1=poor',
-    '1=the',
-    '1=urgency',
-    '1=us&dollar;1.24787',
-    '1a(2)',
     '1a(3)',
-    '1a,2a,2b',
-    '1a-09008',
-    '1a-c',
-    '1a2',
-    '1a5',
-    '1ackley',
-    '1after',
-    '1ah',
-    '1aj',
-    '1all',
-    '1am.',
-    '1andrew',
-    '1arge',
-    '1au',
-    '1ax',
     '1b(5)',
-    '1b+d',
-    '1b-1d',
-    '1bc',
-    '1bq',
-    '1br.',
-    '1bs',
-    '1bt',
-    '1bu',
-    '1byte',
-    '1cm-&frac12;in',
-    '1cm/&half;inch',
-    '1cms',
-    '1co&ndash;col',
-    '1co-col',
-    '1consumer',
     '1cwt',
-    '1cycledeg',
-    '1d1',
-    '1d4',
-    '1db',
-    '1dm',
-    '1dn',
-    '1dq.there',
-    '1dr',
-    '1ds',
-    '1dw',
-    '1dx',
-    '1dz',
-    '1e-3e',
-    '1e1415.6+2557',
-    '1ed',
     '1ee',
-    '1eh',
-    '1eh.',
-    '1el',
-    '1ep',
-    '1es',
-    '1ey',
-    '1ff.',
-    '1fh',
-    '1floz',
-    '1fn',
-    '1ft.',
-    '1g-byte',
-    '1g6',
-    '1gal',
-    '1gal/acre',
     '1gb/sec',
-    '1gcm',
-    '1gf',
-    '1gflops',
-    '1gg',
-    '1gl',
-    '1gm',
-    '1gm/1',
-    '1gyr',
-    '1h+fm',
-    '1h7',
-    '1haverhill',
-    '1hb',
-    '1hco',
-    '1he',
-    '1hj',
     '1hl',
-    '1hq',
-    '1hu',
-    '1hx',
-    '1hy',
-    '1in-6ft',
-    '1in-thick',
-    '1inter',
-    '1ix.88',
-    '1j6',
-    '1ja',
-    '1jf',
-    '1jk',
-    '1jl',
-    '1jp',
-    '1jrm1305618',
     '1jz',
-    '1k&ohm',
-    '1k2',
-    '1k3',
-    '1k8',
-    '1kb',
-    '1kg/2',
-    '1kg/day',
-    '1kick-off',
-    '1kms',
-    '1kv',
-    '1lb-11',
-    '1lb.',
-    '1lb12oz',
-    '1le',
-    '1lf',
     '1ll',
-    '1lq',
-    '1lr',
-    '1lt.',
-    '1lts',
-    '1lw',
-    '1lz',
-    '1m&ohm',
-    '1m-',
-    '1m-2m',
-    '1m-pixel',
-    '1mbp',
-    '1mbyte',
-    '1mg',
-    '1mg/1',
-    '1million',
     '1min12secs',
-    '1min16secs',
-    '1min18secs',
-    '1min1secs',
-    '1min20secs',
-    '1min28secs',
-    '1min29secs',
-    '1min45secs',
-    '1min46secs',
-    '1min4secs',
-    '1min50secs',
-    '1min5secs',
-    '1min8secs',
-    '1mph',
-    '1n4148s',
-    '1n7',
     '1n914s',
-    '1na',
-    '1nf.',
-    '1ngml',
-    '1nh',
-    '1nr',
-    '1o%',
-    '1o&ins',
-    '1o\'clock',
-    '1o,ooo',
-    '1o-2o',
-    '1o.15',
-    '1o.3oam',
-    '1o.50',
-    '1o2b',
-    '1oa',
     '1oam',
-    '1ooml',
-    '1oox',
-    '1opm',
-    '1oth',
-    '1oz,9lb',
-    '1oz/sq',
-    '1p&ndash;2p',
-    '1p.',
-    '1p/kg',
-    '1p9',
-    '1pa',
-    '1parsec',
-    '1pb',
-    '1pc-4pc',
-    '1pc.',
     '1pe',
-    '1pint',
-    '1pl',
-    '1pl.',
-    '1pm&ndash;2pm',
-    '1pm&ndash;5pm',
-    '1pm-2pm',
-    '1pm-4pm',
-    '1pm-5pm',
-    '1pn',
-    '1pu',
-    '1pwo',
-    '1q25',
-    '1q42&ndash;43',
-    '1q43&ndash;43',
-    '1qe',
     '1qj',
-    '1qp',
-    '1qq',
-    '1qx',
-    '1qz',
-    '1r',
-    '1rangers',
-    '1re',
-    '1rj',
-    '1rr',
-    '1rt',
-    '1rw',
-    '1rx',
-    '1s,3r-acpd',
-    '1s,3r-enantiomer',
-    '1s-16s',
     '1s.10d.',
-    '1s.1d',
-    '1s.6d',
-    '1s.d.',
-    '1s6',
-    '1sd',
-    '1sn',
-    '1sp',
-    '1ss',
-    '1st&ndash;4th',
-    '1st&ndash;8th',
-    '1st/11th',
-    '1stxi',
-    '1sx',
-    '1t',
-    '1t-bits',
     '1t1',
-    '1t82',
-    '1tbs',
-    '1td',
-    '1tev',
-    '1th&ins',
-    '1they',
-    '1times',
-    '1tl',
-    '1total',
-    '1tq',
-    '1tr.',
-    '1tt.',
-    '1ud',
-    '1ud.',
-    '1ue',
     '1up',
-    '1uq',
-    '1uw',
-    '1uy',
-    '1v.ii.26ff',
-    '1viii',
-    '1wt',
-    '1x106km',
-    '1x1o7km',
-    '1x23',
-    '1x2oz',
-    '1x32m',
-    '1x3in',
-    '1x5inches',
-    '1x5ml',
-    '1xg',
     '1xp',
-    '1xsscp',
-    '1xsspe',
-    '1xw',
-    '1yb',
-    '1yg',
-    '1yj',
-    '1yn',
-    '1yq.',
-    '1ys',
-    '1za',
-    '1zu',
-    '2%+15%=17%',
-    '2&amp;1',
-    '2&amp;1/2',
-    '2&amp;3',
     '2&amp;frac12;&ndash;3oz',
-    '2&amp;sup40',
-    '2&amp;times1',
-    '2&aring',
-    '2&bsol;3',
-    '2&commat;1/2-year',
-    '2&commat;2/3',
-    '2&deg,4&deg,6&deg,8&deg',
-    '2&deg;-5&deg',
-    '2&deg;15\'',
-    '2&deg;c/minute',
-    '2&formula;m.what',
-    '2&frac12&ft',
-    '2&frac12&mdash;5p',
-    '2&frac12&ndash&frac12',
-    '2&frac12&ndash;1&frac12',
     '2&frac12&ndash;3hr',
-    '2&frac12&ndash;5',
-    '2&frac12&percnt',
-    '2&frac12;-half',
-    '2&frac12;-week',
-    '2&frac12;-year',
-    '2&frac12;cwt',
-    '2&frac12;hours',
-    '2&frac12;hr',
-    '2&frac12;in.',
-    '2&frac12;m',
-    '2&frac12;miles',
-    '2&frac12;oz/70g',
-    '2&frac12;points',
-    '2&frac12;years',
-    '2&frac14%',
     '2&frac14&ins',
-    '2&frac14;d',
-    '2&frac14;in.',
-    '2&frac14;inch',
-    '2&frac14;m',
-    '2&frac18',
-    '2&frac34&ins',
-    '2&frac34;in',
-    '2&frac34;in-thick',
-    '2&frac38',
-    '2&frac58',
-    '2&frac58;m',
-    '2&ft;6&ins',
-    '2&gt',
-    '2&half;x4inch',
-    '2&lcub',
     '2&mgr;-cyc1',
-    '2&mgr;l',
-    '2&micro;g',
-    '2&micro;g/cu.m',
-    '2&middot;14',
-    '2&middot;2',
-    '2&middot;5x12&middot;5cm',
-    '2&ndash&frac12',
-    '2&ndash&frac12;in',
-    '2&ndash&frac14',
-    '2&ndash;0&ndash;0',
-    '2&ndash;02.49',
-    '2&ndash;08.37',
-    '2&ndash;09.13',
-    '2&ndash;09.30',
-    '2&ndash;1&ndash;0',
     '2&ndash;1&ndash;4&ndash;1',
-    '2&ndash;1&ndash;8',
-    '2&ndash;1/2&ins',
-    '2&ndash;1/4',
-    '2&ndash;10&ndash;0',
-    '2&ndash;10&ndash;1905',
-    '2&ndash;10&ndash;36',
-    '2&ndash;10&ndash;4',
-    '2&ndash;10&ndash;8',
-    '2&ndash;10pm',
-    '2&ndash;11&ndash;0',
-    '2&ndash;11&ndash;1911',
-    '2&ndash;11&ndash;1916',
-    '2&ndash;111b',
-    '2&ndash;12&ndash;14',
-    '2&ndash;12&ndash;8',
     '2&ndash;1200',
-    '2&ndash;126',
-    '2&ndash;12m',
-    '2&ndash;13&ndash;0',
-    '2&ndash;14&ndash;11',
-    '2&ndash;14.68',
-    '2&ndash;153',
-    '2&ndash;15pm',
-    '2&ndash;16.36',
-    '2&ndash;16.45',
-    '2&ndash;17.33',
-    '2&ndash;18.5%',
-    '2&ndash;190',
-    '2&ndash;1970s-disco-feel',
-    '2&ndash;2.30',
-    '2&ndash;2.5%',
     '2&ndash;20th',
-    '2&ndash;21',
-    '2&ndash;23.07',
-    '2&ndash;24',
-    '2&ndash;25',
-    '2&ndash;258',
-    '2&ndash;26',
-    '2&ndash;26%',
-    '2&ndash;27',
-    '2&ndash;29&ndash;15',
-    '2&ndash;3&deg;c',
-    '2&ndash;3&frac12',
-    '2&ndash;3&ndash;0',
-    '2&ndash;3&ndash;18',
-    '2&ndash;3&ndash;2',
-    '2&ndash;3&times;10',
     '2&ndash;3,000',
-    '2&ndash;3-18',
-    '2&ndash;3-5',
-    '2&ndash;3-fold',
-    '2&ndash;3/4in',
-    '2&ndash;3/5/41',
-    '2&ndash;3000',
-    '2&ndash;300mg',
-    '2&ndash;304',
-    '2&ndash;31&ndash;32',
-    '2&ndash;33',
-    '2&ndash;35',
-    '2&ndash;35%',
-    '2&ndash;35&ndash;11',
-    '2&ndash;37.14',
-    '2&ndash;3h',
     '2&ndash;3hours',
-    '2&ndash;3inches',
-    '2&ndash;3ins',
-    '2&ndash;3mm',
-    '2&ndash;3p.m',
-    '2&ndash;4&deg;c',
-    '2&ndash;4-year-olds',
-    '2&ndash;4.30',
-    '2&ndash;4.30pm',
-    '2&ndash;40.153',
-    '2&ndash;41',
-    '2&ndash;41.6',
-    '2&ndash;44%',
-    '2&ndash;45pm',
-    '2&ndash;47',
-    '2&ndash;47.42',
     '2&ndash;4cmkyr',
-    '2&ndash;4ft(0.6&ndash;1.2m)',
-    '2&ndash;4h',
-    '2&ndash;4mg/hr',
-    '2&ndash;5&ndash;1846',
-    '2&ndash;5.6%',
-    '2&ndash;51',
-    '2&ndash;55',
-    '2&ndash;6&mgr;m',
-    '2&ndash;64',
-    '2&ndash;6ins',
-    '2&ndash;7&ndash;0',
-    '2&ndash;705',
-    '2&ndash;7hz',
-    '2&ndash;7pm',
-    '2&ndash;8&ndash;0&ndash;7',
     '2&ndash;8&ndash;0\'s',
-    '2&ndash;8&ndash;02',
-    '2&ndash;8&ndash;1862',
-    '2&ndash;80',
-    '2&ndash;82',
-    '2&ndash;8pm',
-    '2&ndash;9&ndash;0',
-    '2&ndash;9&ndash;4',
-    '2&ndash;9&ndash;41',
-    '2&ndash;98',
-    '2&ndash;epb',
-    '2&ndash;may',
-    '2&ndash;o',
-    '2&pgr/',
-    '2&plus;3',
-    '2&pound;4',
     '2&prime;20&prime',
-    '2&prime;27&prime;ff',
-    '2&prime;30&prime',
-    '2&prime;45&prime',
-    '2&prime;51&prime',
-    '2&rehy;millisecond',
-    '2&rehy;year-old',
-    '2&sect;46',
-    '2&shilling;11&frac34',
-    '2&shilling;6d.',
-    '2&shilling;9',
-    '2&times;2&times;10',
-    '2&times;20',
-    '2&times;230',
-    '2&times;65g',
-    '2&times;denhardt',
     '2&times;k',
-    '2&times;n',
-    '2&times;ssc',
-    '2&times;standard',
-    '2\'-deoxyadenosine',
-    '2\'-deoxyuridine-5\'-monophosphate',
-    '2\'-oh',
-    '2\'07',
-    '2\'16',
-    '2\'2\'-azinobis(3-ethylbenzthiazolone)sulphonic',
-    '2\'x2\'',
-    '2(1-k)*k*w2',
-    '2(1-k)*k*w3',
-    '2(3)a',
-    '2(3)b',
-    '2(4)b',
     '2(c--h)',
-    '2(k)',
-    '2(wo2)',
-    '2*/3*/4*',
-    '2*/3*/4*/5*',
-    '2+1',
-    '2+166',
-    '2+2+2+4',
-    '2+wait',
-    '2,000%',
-    '2,000&mdash;3,000',
-    '2,000&ndash;2,300',
-    '2,000&ndash;2,500',
-    '2,000&ndash;4,000',
-    '2,000&ndash;5,000',
-    '2,000\'',
     '2,000,000-6,000,000',
-    '2,000,000-tonne',
-    '2,000-1',
-    '2,000-2,500',
-    '2,000-4,000',
-    '2,000-5,000',
-    '2,000-acre',
-    '2,000-fish',
-    '2,000-foot',
-    '2,000-lot',
-    '2,000-member',
-    '2,000-mw',
-    '2,000-name',
-    '2,000-pub',
-    '2,000-sq',
-    '2,000-tonne',
     '2,000-word',
-    '2,000gal',
-    '2,000gb',
-    '2,000hp',
-    '2,000k',
-    '2,000kms',
-    '2,000m2',
-    '2,000rpm',
-    '2,003',
-    '2,004',
-    '2,006',
-    '2,008,137.60',
-    '2,009',
-    '2,00lb',
-    '2,010,807',
-    '2,012&deg;f',
     '2,014,135',
-    '2,015,731',
-    '2,022,319',
-    '2,025',
-    '2,028,339',
-    '2,029',
-    '2,030,000',
-    '2,034',
-    '2,036m',
-    '2,037',
-    '2,037,500',
-    '2,041',
-    '2,043',
-    '2,044',
-    '2,045,000',
-    '2,045.7',
     '2,047',
-    '2,048-channel',
-    '2,050ft',
-    '2,052.5',
-    '2,054',
-    '2,056',
-    '2,057.2',
-    '2,061',
-    '2,061st',
-    '2,063,000',
-    '2,064',
-    '2,070',
-    '2,071,600',
-    '2,072',
-    '2,072.2',
-    '2,073',
     '2,078.2',
-    '2,078m',
-    '2,079',
-    '2,07i',
-    '2,080ft',
-    '2,081',
-    '2,081,000',
-    '2,085',
-    '2,086,000',
-    '2,087,528',
-    '2,090,000',
-    '2,095',
-    '2,096',
-    '2,097,146',
-    '2,1,0',
-    '2,10',
     '2,100%',
-    '2,100,000&ndash;2,500,000',
-    '2,100hp',
-    '2,100pc',
-    '2,102',
-    '2,103',
-    '2,103,000',
-    '2,103,938',
-    '2,109',
-    '2,114m',
-    '2,117,900',
-    '2,1180',
-    '2,120,000',
-    '2,120m',
-    '2,121',
-    '2,124,126',
     '2,124,900',
-    '2,127',
-    '2,13&ndash;20',
-    '2,130,525',
-    '2,135',
-    '2,136',
-    '2,139',
-    '2,146,000',
-    '2,147,000',
-    '2,148ft',
-    '2,149,690',
-    '2,150km',
-    '2,153',
-    '2,153,493',
-    '2,154',
-    '2,155,000',
     '2,157cc',
-    '2,1620',
-    '2,165lb',
-    '2,169',
-    '2,170',
-    '2,172m',
-    '2,174,860',
-    '2,175,100',
-    '2,179481',
-    '2,181',
-    '2,181,514',
-    '2,186,567',
-    '2,188',
-    '2,190',
-    '2,190m',
-    '2,193',
     '2,196',
-    '2,197m',
-    '2,198',
-    '2,199m',
-    '2,2\'-azobis(2-amidinopropane)',
-    '2,2\'-diquinolyl',
-    '2,2,3,3',
-    '2,2,3-trimethylpentane',
-    '2,2,5,6',
-    '2,200-acre',
-    '2,200-kilometre',
-    '2,200/25',
-    '2,200gns',
-    '2,200hp',
-    '2,200kg',
-    '2,200rpm',
     '2,203,000',
-    '2,207',
-    '2,208',
-    '2,208,000',
-    '2,212',
-    '2,214',
-    '2,217',
-    '2,219',
-    '2,22',
-    '2,222',
-    '2,223',
-    '2,224m',
-    '2,228',
-    '2,231',
-    '2,235,197,406,895,366,368,301,559,999',
-    '2,236',
     '2,237.8',
-    '2,238',
-    '2,240,000',
-    '2,240ft',
-    '2,241',
-    '2,242',
-    '2,244',
-    '2,244,000',
-    '2,245,000',
-    '2,245hp',
-    '2,246',
-    '2,250hp',
-    '2,251',
-    '2,252',
-    '2,254.0',
-    '2,257',
     '2,26',
-    '2,267,878',
-    '2,268',
-    '2,269',
-    '2,270',
-    '2,271',
-    '2,275,000',
-    '2,277.1',
-    '2,277.5',
-    '2,279',
-    '2,280',
-    '2,281ft',
-    '2,288',
-    '2,289.2',
-    '2,290lbs',
-    '2,292',
     '2,292,846',
-    '2,294',
-    '2,294-yard',
-    '2,296',
-    '2,299.4',
-    '2,3,18',
-    '2,3,4,5,6,7',
-    '2,3,4,5,6,7,8',
-    '2,3,5',
-    '2,3,7',
-    '2,3-dimercapto-1-propan-sulphonic',
-    '2,3-dioxygenase',
-    '2,300-mile',
-    '2,300-strong',
-    '2,300ft',
-    '2,300kg',
     '2,300km',
-    '2,300kms',
-    '2,300mhz',
-    '2,300t',
-    '2,301',
-    '2,302',
-    '2,302ft',
-    '2,310',
-    '2,317',
-    '2,317,000',
-    '2,319',
-    '2,321',
-    '2,324',
-    '2,325,100',
-    '2,327,600',
-    '2,329ft',
     '2,330hp',
-    '2,331.1',
-    '2,331m',
-    '2,332',
-    '2,333',
-    '2,335',
-    '2,336',
-    '2,337',
-    '2,338',
-    '2,339',
-    '2,339,000',
-    '2,340',
-    '2,341,646',
-    '2,342.1',
-    '2,343',
-    '2,343,000',
     '2,345',
-    '2,345,678',
-    '2,347m',
-    '2,350,000',
-    '2,351,041',
-    '2,352',
-    '2,353',
-    '2,355',
-    '2,355,174',
-    '2,356.8',
-    '2,358,583',
-    '2,360',
-    '2,360.7',
-    '2,360m',
-    '2,363',
-    '2,370',
     '2,373,053',
-    '2,374',
-    '2,375',
-    '2,380,000',
-    '2,381,741',
-    '2,383',
-    '2,384',
-    '2,390',
-    '2,392',
-    '2,393.2',
-    '2,396',
-    '2,396,000',
-    '2,397',
-    '2,398,000',
-    '2,399',
-    '2,4,5t',
     '2,4,6',
-    '2,4,6,8,10',
-    '2,4,6,8,10,12,13',
-    '2,4,6-trinitrobenzenesulphonic',
-    '2,4,8',
-    '2,4-diamino-5-',
-    '2,4-dinitrophenol',
-    '2,400-strong',
-    '2,400-ton',
-    '2,400-tonne',
-    '2,400-watt',
-    '2,400strong',
-    '2,403ft',
-    '2,404.2',
-    '2,405',
-    '2,406',
     '2,408ft',
-    '2,409-bp',
-    '2,410,000',
-    '2,411',
-    '2,417',
-    '2,420',
-    '2,423',
-    '2,423.9',
-    '2,425',
-    '2,426',
-    '2,428',
-    '2,429,000',
-    '2,430',
-    '2,431m',
-    '2,435',
-    '2,436.5',
     '2,440',
-    '2,440%',
-    '2,442',
-    '2,443',
-    '2,443.4',
-    '2,445',
-    '2,447',
-    '2,449',
-    '2,450',
-    '2,450m',
-    '2,457',
-    '2,459',
-    '2,46',
-    '2,462',
-    '2,466.7%',
-    '2,468',
     '2,470',
-    '2,471',
-    '2,471.4%',
-    '2,472,900',
-    '2,475',
-    '2,475&ft',
-    '2,475,000',
-    '2,476,149',
-    '2,477,000',
-    '2,478',
-    '2,479,000',
-    '2,480',
-    '2,487',
-    '2,488',
-    '2,492',
-    '2,494',
     '2,5,35&ndash;38',
-    '2,5,8,11',
-    '2,5-di-',
-    '2,500%',
-    '2,500&ndash;1,200yrbp',
-    '2,500&ndash;3000',
-    '2,500&ndash;4,500',
-    '2,500-3,000',
-    '2,500-km',
-    '2,500-megaton',
-    '2,500-mile',
-    '2,500-million-mile',
-    '2,500-nautical',
-    '2,500-odd',
-    '2,500-seat',
-    '2,500-seater',
     '2,500-watt',
-    '2,500hp',
-    '2,500kg',
-    '2,500m',
-    '2,501',
-    '2,501,943',
-    '2,506,000',
-    '2,510ft',
-    '2,512',
-    '2,515',
-    '2,516',
-    '2,517',
-    '2,518',
-    '2,522',
-    '2,524',
-    '2,525',
     '2,525-metre',
-    '2,526',
-    '2,53060',
-    '2,531',
-    '2,533',
-    '2,534',
-    '2,540pmolmg',
-    '2,545',
-    '2,545,553',
-    '2,546',
-    '2,546,000',
-    '2,549,096',
-    '2,550,000',
-    '2,550bc',
-    '2,552',
-    '2,554',
     '2,560-km',
-    '2,560bp',
-    '2,561.8%',
-    '2,563',
-    '2,565',
-    '2,569',
+)
+
+blocks_95 = (
+    '+"40,!2+"62,!6+"70,!2,!7+"82,!9+"92$!-%$1860&#900\'"20\'"50',
+    '%&strong$!.%"57$#/sq$"cc$"hz$!k$!m%!g%!w$!n#*1&ndash;02+$1803-"47-"60',
+    '-"80.!3-"90+!2+!6+"71,!7+"82+"90$"-2$"/h#)2&mdash;6%(ndash;13,!5,#871',
+    '.!6+!3+"42+!5,!6+"67+"71+"81+"90,!4$!.#*3&mdash;15%(ndash;10,!5,#815',
+    '.!6.!7-"80.!3.!4,#947+!4,!0,!9+!5+!6,!9+"86$#/04$!3',
+    '%(ndash;11,!4,!7,#854-"67-"76-"94+"24+"69+"72+"81+"94$-/5&ndash;1890#,5&ndash;1823-"61',
+    '-"72-"86-"91+!6,!8+"79+!8,!1+!9$#-73$/.7&ndash;13.135#*6&ndash;11,!2,#873.!7',
+    '.!3-"90+"93$!0#*7&mdash;09+"10%(ndash;11,!2,!3,#858-"85-"99+"34+"72+"83',
+    ',!7#)8&mdash;9%*ndash;1809-"10.!4-"65-"82-"91,#936+"65+"74+"93,!5$$1814#*9&ndash;10',
+    ',!4,#814-"45-"56+"52+"72+"98+%march$#.50$!0#"c/%(350c/gas(&f/gas4#"ha$!z',
+    '#$km/h$"wh#\'m/600ft$#ile$!l$!m#!o$!c#"yd")1&mdash;3$)ndash;145*!2*!7$&plus;3#$-bed',
+    '#".8##/89#*0&ndash;11,!6,!7,#811.!3-"20-"90,#910+"30+"48+"86,!9$!-',
+    '$#.42$!0#*1&mdash;16%(ndash;12,!5,#883-"99,#900+"27+"48+"50+"77+"88$!0$\'2-pound',
+    '%(ndash;13,!6,!8-"14-"20-"73.!8-"88.!9,#904+"27+"43+"70,!1+"96',
+    '$".5#*3&mdash;14%(ndash;16,#781,!8-"14-"55.!8-"70-"81-"95.!8,!9-"09+"20',
+    '+"47+"55+"73,!4,!8$-.12&ndash;1.1$"85#*4&mdash;21+"30%(ndash;17,#820-"33-"60-"73-"93',
+    '.!7,#900+"20,!1,!2,!3+"73,!6$"40#*5&mdash;60%(ndash;16,#852-"80-"99,#901',
+    '-"14-"51+"20,!7+"54+"65+"97$!1%#-55$"65$!9#*6&mdash;18%(ndash;18-"79-"82',
+    '.!8-"93.!4.!9,#919+"20+"44+"86+"96+$july$!.#*7&mdash;18%*ndash;1834-"40-"72',
+    ',#905-"11+"22,!6+"35+"41+"58+"81+"92,!3,!7$"93#,8&ndash;1883.!4-"90',
+    '-"14+"24,!5,!6+"45+"81,!6,!7+"90,!6$!0$$7-90$"mm#,9&ndash;1822-"61',
+    '.!8-"83-"93,#905-"16+"21,!2,!4,!9+"93#!b#"ft#!g##ins#"pp',
+    '")2&ndash;4*!8*"92##(2)#(,300,000$#700#"-4$$seat#$.194$!4$!8$!9#$/352$"90#)0&mdash;1',
+    ',#832-"83.!5-"91.!5.!6,#912-"73+"33,!7+"55+"60+!7,!7+"87',
+    '$".0$"24$!a#,1&ndash;1825-"75-"80.!1.!9-"90,#902-"11.!4+"22,!8+"34',
+    '+"68+"81+"94$%-1911$"/2#*2&mdash;27%*ndash;1876-"96.!8,#903-"11+"30+!4+!5+!6',
+    ',!9+"94#,3&ndash;1865-"93,#901.!4.!6.!7+"24+"31,!3+!6+"86,!7+"92',
+    ',!9$-/4&ndash;1872$!0#,4&ndash;1882,#905+"20,!5,!6,!8+"32,!3+"44+"75+"80,!1',
+    '%*ndash;1893.!5,#903.!4-"10.!1.!4.!7+"37+"55+"89+!9,!2,!5$%-1880',
+    '#,6&ndash;1877-"82.!3.!4-"93.!6,#905.!7-"10.!3+"43+"66+!8$"/7$!0',
+    '-"61-"81-"94,#904.!6.!7-"12+"31,!5$!0$!9#,8&ndash;1892.!6,#913.!4',
+    '+"32,!4+"79+"89+"93#,9&ndash;1860.!2-"88,#904.!7-"13.!6-"21+"31,!2',
+    '+"49+"60,!9+"76+"96$%-1856%"52$#/30#!b#"kg#"pp"\'3&deg;c(!m$)ndash;184*!5',
+    '$+times;122cm##(5)#(,000,000$#400%"74$#557$#743##-92$$seat##.6%$"7%##/89#)0&ndash;1,#833-"57',
+    '-"86,#900.!3.!5-"50+$2030+"32+"40,!1+"70+"80+"95$!.%"48$"/1',
+    '%"31$!0#,1&ndash;1835-"77.!9-"92.!5,#901.!4.!6.!7.!8-"16-"23+"35',
+    ',!1,!5+"60,!5+"79+!9,!1$%-1907#*2&mdash;33%*ndash;1845.!7-"56.!7-"68-"83',
+    ',#901.!2.!5-"20+!3+!4,"7\'+!5+!7$!0$!3#,3&ndash;1883.!9,#901.!7',
+    '.!6.!7.!9-"22+!4+!7$#-68#,4&ndash;1891,#900.!7-"14.!5-"21.!4+"40',
+    '+"66+!7$#-68#*5&mdash;41%%ndash*%;1895,#900.!1.!2-"10.!7.!8+"40,!8+!6',
+    '$!-%$1910(!8%!6$!.$!5#,6&ndash;1865,#909-"18-"23+"37+"40,!2+"61+"70',
+    '+"93$%-1922%$nov.$"/7$!0#,7&ndash;1897.!8,#900.!1.!5.!7-"11.!3.!4.!5',
+    '-"37-"47+"41,!8,!9+"97+$apr.$$5-77#,8&ndash;1900.!2-"12.!7.!8-"22+"39',
+    ',!7,!8#*9&mdash;42%*ndash;1844-"53-"99,#901.!3.!5-"14.!5.!6.!7.!9-"21',
+    '+"42#"cm#!m"*4&frac12;p$)ndash;254*!7*"87+!9*"92#(,000,000$#200$\'300,000$#445%&59,363$#500',
+    '$\'877,623#&-litre$&member#".3$!5%!5$"7%$!8%!2%"mg#*0&mdash;70%*ndash;1842-"51-"68-"79',
+    '.!9-"12.!3.!7.!9-"21.!7+"41,!4+!6,!0,!8+"70+"93,!7',
+    '\'"50$!-%$1860$"00%"10$!5$-s&ndash;1880s,#70s#*1&mdash;60%*ndash;1843-"86.!9-"91,#917-"21',
+    '-"61-"86-"91+!2+!4+!5,!2+"60,!9+"70,!1+"81$%-1881%"71#02&mdash;although',
+    '-"96,#904-"10.!4.!8-"20.!3-"30+!6+"75#*3&mdash;60%*ndash;1798,#844-#72.-$83.2',
+    '.!8-"10.!3-"21.!8-"32+"53+!6+!7+"98$%-1932$$7-40#"4%$+&ndash;1847-"89',
+    '.!4.!6.!8,#906-"13.!7.!9-"20.!6.!7-"30.!9-"50+"45,!9',
+    '+"61+!7+"86$%-1889%"56%$july$!.$!0#,5&ndash;1855,#906-"18-"22.!9-"35+"46',
+    '+!7+!8$%-1846$!.$$1915#,6&ndash;1881,#913.!4.!5.!6.!7-"22.!7-"34+"47',
+    '+"53+"78$!0$"sx#,7&ndash;1859-#71.-"87,#912-"22.!7-"33.!4-"50+"48+"50',
+    '+"63,!8+"82,!9+!9$%-1933$!.$#/48#)8&mdash;9%*ndash;1850,#906-"11.!9-"21.!6',
+    '+"49+"80$#,52%"65$%-1914$#.12#*9&mdash;51,!2%*ndash;1901-"13.!5.!6.!7.!9-"22',
+    '.!9-"30+"84$#-54$..6&ndash;27.20#,:105:7.5:7.5#"lb#"p.$!c$!p#"th"\'5&deg;c(!m$*ndash;1214+"86',
+    '+"15*!6*!7*!8$)times;292##(1)#$,195$\'340,000$#437$\'647,355$#900##-10$%match%$etre$#ton',
+    '$!4$!6#&/60x14$"92#,0&ndash;1851-"70-"80-"98,#907-"14.!8-"28-"39-"45-"57',
+    '.!8+!3+"60+"70+!9$!-%$1920\'"39$!.$#gns$!m#,1&ndash;1919-"20-"30.!5',
+    '.!9-"42+$2001-"21+!4+"52,!3+!7+"81,!2,!6$!-%$that#,2&ndash;1853.!7',
+    '.!8-"15.!6-"28-"35+!4+!5,!4+"67+!7,!0$%-1913$!.%-11&ndash;29.2$!8',
+    ',#918.!9-"22.!5.!9-"32.!3.!5-"40.!1.!2-"53+"54+!8+"95',
+    '#*4&mdash;58+"71%*ndash;1858-"75,#916.!9-"21.!4.!8+!5+!6+"74$!8#,5&ndash;1892.!3',
+    '.!5-"14.!6-"20-"30.!5.!6.!9-"42-"55+"56,!8+"65+"81+!9',
+    '#,6&ndash;1901-"18-"20.!1.!6.!7.!9-"41+"60,!3,!5,!9$%-1964%"57%\'founded',
+    '$"61#,7&ndash;1861,#913.!5-"29-"30.!2.!3.!4.!6-"40-"56+"61,!2+"74',
+    '$!a$!b#,8&ndash;1899,#913.!9-"36-"40.!1.!3.!5+"62,!8+"95$!.$%/1605',
+    '-"91.!3,#917-"23.!7-"32.!5-"47+"62,!5+"74$%,1871$%-1914\'"41(!3',
+    '##bhp#!c#!g$!t#!i#%kcals#"ps#"th""6%#(&ndash;3*!5*!6*"91,!1#$,046',
+    '$#660$#711#%-mile$$year#-0&ndash;1869.-"75-"80,#904.!6-"17-"25.!7-"31.!3.!8',
+    '.!8-"50.!4-"80+!2+!5+!6,!5+"70$%-1914\'"70\'"80%$acre$!.$"00',
+    '$%s-80s#)1&mdash;2%*ndash;1865,#913-"26-"33.!4.!6-"44.!9-"85+!2+!4+"62+"75',
+    '$#,25$!.#,2&ndash;1866-"90.!8,#900-"10.!7-"20.!1.!8-"41.!3.!4-"50',
+    '+!4,#252+!5$$-for$-62&ndash;011b#,3&ndash;1902-"14.!7.!8-"24.!9-"31-"44.!6.!7',
+    ',!4,!6+"72+"86+!9$%-1950$"44#,4&ndash;1901-"13.!9-"22-"32.!5.!9-"44',
+    '-"60+!7,!0,!1,!6+!8,!6+"90+$nov.$!-%$mile$!0#,5&ndash;1886,#905-"14',
+    '-"20.!1.!3.!6.!7-"34.!7-"41.!3-"91+!6+!7,!4+!8$#,89',
+    '$"00#,6&ndash;1913-"21.!8-"32.!7.!8-"41.!5-"53+"68+"73+!8$%-1931\'"46',
+    ',#900-"18-"20.!9-"31.!4.!9-"54-"60+"69+"70,!1,!9$%,1992$!b',
+    '.!7-"28-"34.!9-"42.!7+"71,!2,!4+"80,!1,!4$"70#*9&mdash;87%*ndash;1907',
+    '-"23.!8-"31.!2.!3.!4.!9-"40.!2.!4-"53.!5+"70,!9+"91',
+    '$!.$#/70#!a#"bn#!f$!f#-g/6&frac12;oz#!k##mph#!p#"th#!w""7%#*&mdash;208$)ndash;238',
+    '*!5*!9+!1#$.056$!2%!x$#5km$!6$"83#$/215#,0&ndash;1900-"20.!6-"30.!7',
+    '-"44.!5-"58-"64-"84.!8+!2+!3+!4+"75+"83$!-%!1&#914\'"30',
+    '$!.$!0$%s-80s#,1&mdash;1914+"79%*ndash;1878,#918-"30.!1.!7-"48-"51.!5.!6-"60',
+    '+!3+!6+"73,!5+!8,!0,!1+"94,!9$%-1935$!.$!0$$1930#*2&mdash;73%*ndash;1875',
+    '-"87,#913-"34-"41.!4.!7-"51-"61-"70+!4+!5+!7+"83$"/3#,3&ndash;1875',
+    '-"83,#904-!2.!3.!4-"31.!2.!4.!9-"42.!4.!9-"55.!7-"64',
+    ',!8#-4&ndash;1879.,#900-"26-"37-"43-"52.!8-"63.!5.!7+!6+"85,!6+"96',
+    '#\'5&mdash%+ndash;1885.-"99,#905-"13.!4-"21-"47-"50.!6-"60.!5.!7.!8-"75',
+    ',!8+"83,!8+!9,!0,!4#,6&ndash;1885-#96.,#909-"14.!9-"22-"30.!9-"41',
+    '.!2.!3.!5.!7-"65.!6-"72+!7,!7+"83,!4,!7+!9#,7&ndash;1892,#904',
+    '-"30-"44.!5.!6-"50.!7.!9-"70.!7+"78+"80,!1,!2,!3,!4',
+    ',!9+!9,!3$%-1943$!5$*9&ndash;80#,8&ndash;1903.!5-"17-"36-"40-"54.!9-"67-"72',
+    '-"85+"80,!1,!2,!5,!9+"90$%-1967#,9&ndash;1902.!3-"16.!8.!9-"21.!3',
+    '-"55.!9-"71+"82,!4,!6$#-83$%/1980#":1#!f#"p.""8%#*&ndash;189*!3*!4',
+    '##(1)#$,000\'\'-strong$#500#"-6$$seat$$yard#".3$$4mph$#6ft#$/730#,0&ndash;1901.!4-"13.!8',
+    '.!3-"43.!6.!7.!8-"66-"71.!6-"80+!4+!5+!6+"82,!4,!5',
+    '$%-1939\'"48$!.%"30$!5$-s&mdash;1960s%!/#*1&mdash;94%*ndash;1894,#900.!2.!6-"29-"31.!2',
+    '.!9-"47.!8-"50.!4-"60.!8+$2021+!4+"92,!4,!5$!-$%/late$*2&ndash;16',
+    '#,2&ndash;1900-"20.!2-"40-"53.!6-"60.!2-"70.!7+!4+%86,78+"91,!4$!0',
+    ',#903.!4-"28.!9-"38-"43.!5.!6-"62.!3.!7-"85.!9+!6+"84',
+    ',!4,!7$%-1937\'"55$-.11&ndash;6.9$"/4#,4&ndash;1912-"20.!8.!9-"43-"60-"70.!4-"82',
+    '+!8+"90,!2$%-1947$#/85#,5&ndash;1905-"10-"40.!1-"58-"65.!6-"74-"85+!8',
+    '+"99$%-1938$$1990#+6&ndash;189."0.,#926-"36-"45.!6.!7.!9-"57-"68-"74.!5',
+    '-"82+!7+"92,!6$!0$"70#*7&mdash;88%*ndash;1888-"94/!.,#927-"38-"40.!5-"58',
+    '.!8.!9+)8&ndash;9+"90,!4#,8&ndash;1889-"91.!3.!7,#910.!5-"49-"59-"64-"71',
+    '.!9-"83+"90,!1$#-89#,9&ndash;1905-"24-"49-"53.!5.!6.!7.!9-"66-"70',
+    '+"92$%-1940$$:188$!a##bhp#,h&ndash;189b$!a#"os#"pp#"th"%9&deg$)ndash;213*!4*!5*!8',
+    '#(,550,000$#777#%.26mm$!6%!7$!9#)0&ndash;1,#895,#900.!1-"20-"37.!8-"40.!5',
+    '.!7-"62.!5.!7-"81+!7+!8+!9$-\'s&ndash;1990$%-1910(!4\'"41$!8$"s.#,1&ndash;1892',
+    ',#905.!8-"48-"54.!8-"69-"91+!5+!8+#92.,!5$%-1981#*2&mdash;95%*ndash;1893,#950',
+    '.!4.!7.!8-"73.!8.!9-"85+!5+!8+"93,!5$\',14,000#,3&mdash;1906%*ndash;1903-"13',
+    '.!8-"54-"63-"76.!7.!9-"81.!3-"93+!6+!8+"94$!.$!4#*4&mdash;95',
+    ',#901.!3-"11.!2-"55-"69-"70.!5.!8.!9-"82.!4.!5-"91+"33',
+    '$"/6$!0$!2#,5&ndash;1897.!9,#900.!1-"15-"30.!5-"41.!5-"56-"74.!9',
+    '.!2.!3.!8+!8+"99$!/$!0#,6&mdash;1900%*ndash;1900.!5-"13-"21-"30-"52.!9',
+    '.!7-"71$"/7$"20#,7&ndash;1898,#903-"13.!8-"56.!7-"87+"98$%-1899&#940(!8',
+    '$!m#)8&ndash;1,#901.!7-"21.!3-"35-"40-"61.!8-"71.!5-"81+"90$%/1899',
+    '#,9&ndash;1904-"26-"53-"62.!3.!6-"72.!8-"82.!6$!-%$1932$".5$%/1900\'"90',
+    '#)a&ndash;h$"-1##bpm#"f.#"mm$"ph#!o"#:00$!3$$5:07&"27&-36&ndash;0500$$6:17$$7:28$$8:08',
+    '$$9:40#)1&ndash;8$$0,11%#:42$$1:16\',8&ndash;0500$!2%#:36&"53$!3%#:23$*5&ndash;17$$6:33$!7%#:28',
+    '#"21%#:28$#2ff$$3:13$!7$!8#+31&ndash;33$!2$!3$!6%#:43#"42$$4:20\'!4$!6',
+    '%#:06&"52#!5$$2:19$$3:11$$4:39$$5:08$$7:38$/9:15&ndash;0500"(=1+9+7+1"$_per"*b&ndash;19##-in#!n"%c/65f',
+    '""d."#ft."!g""ha#,h&ndash;19hh"(in(45cm)$%-tall$!.$"ch"!k#!g#"m/$!s#!w""ma',
+    '#$onth#"pa$!g#!s#"th%!s&+&ndash;2yrs"#pp.$!m"%q11.2"&s.w.g.#"ec#!t"!t#/h&ndash;century',
+    '$\'-minute%&ranked$%/19th$#and"%x16in")year-olds&%s-old!,9%&ndash;91%"(&frac12%)$&ins#)lsqb&rsqb#(mdash;20*!2*!4$$gr;m',
+    '#\'ndash;0*!0),1&ndash;1914*\'0&ndash+!0*!1*!5)(24&deg;c*!7*!8)$30th*!6*!9)"43)"53',
+    ')!6*1&ndash;45&ndash;0*!0)!7*!1))8&ndash;0*!2)!9)#end#.prime;27&prime#2shilling;11&frac34$%ol;20#,times;26.5cm"#(-)##15)',
+    '$"8)#"l)"$,015$"21$"34$"56$"67$"73#\'100,000$&48,502$&73,961$"97%"91#%20,21\'$4,25',
+    '$$3,30%!7&$,247$!4$"96#\'300,000$!2%!0%!6$"52%!8#"40%!9$"51$&93,000',
+    '#\'500,000##600$&72,612$"85#\'700,000$"22$"45$"78#\'808,000$"26$"35$&40,000%!8$"63$"92',
+    '%!5%!7$"88"#-10$!1$!3$!5$!8#"28#\'36-1968#!4#!8$!9#!9$!0',
+    '#%april#$base$"ed#$club$%olumn%%untry#$dec.#$fold%"ot#%gauge#$hour##jan##man$(onth-old#&nation',
+    '#$page$$iece#$race$"un#(sep-1988$%torey#$team#(week-old"/.00&ndash;21.00$!1%".8$!2$!3$!8$!9',
+    '$!1%#.82&"90$$2.88$$3,16$!7$!9$!m$!p#"24$#5in$!9%!%$$kbps$!p',
+    '#-3&amp;percent$!.%!2%"91&!2$-0&ndash;21.30$!1$!2$"4p$!9#$4(c)$"15$!4$$6sec$"9p',
+    '$"mm$"pc#"5.%!0%"87$!2$!7$!8$"cm$"kg$!p##6.0$"6%$"bn$!m',
+    '#$7.90$!1$"2p$"3%%#sec$!4$!6$"8p$-9&ndash;38.74$"ft$#khz$!m#$8.89$"1p$"37',
+    '$!m$!p#"9.$!3$!4$$9khz$#g/t$!p"%/1/93$$2/92$"96#$20th$!3$!7#$3/90',
+    '$!1$"47#"40$"13#$5/90#26/92&ndash;21/6/92#$8/93$!3#"91$!2"%0&deg$\'mdash;2$\'ndash;1+%000nm+!4',
+    '+"85,!8*#200+"10+"25*"4.*#550*!7#"\'s#"()$"1)#+,000-strong#$-200$\'myr-old$%point',
+    '#$.000%!8$!2#)/375f/gas#*0&mdash;09+"12%(ndash;04+!1,!1,!5,#902.!5-"14.!9-"20',
+    '-"37.!9-"41-"50-"60.!8-"70.!8.!9-"90+"20,!1,!6+!3+!4',
+    '+!5+"60+"70,!5$#,32%"51%"69%"71%"86$%-1923\'"31\'"80%"20%"39%$acre',
+    '$!.%!0%!7$"cc$"ft$!m%!m$"s-#*1&ndash;02,!3+"10,!5,#902-"10.!4',
+    '-"66-"71-"85-"91+"20-"01-"25-"41+!3+!5+!6+"70,!8,!9+!9',
+    '$!0$#174#*2&ndash;05,!6,!8+"12,#902.!6-"36-"45-"53.!8-"65.!6-"75',
+    '.!4-"90+!4+"59+!6+"73$%/1903$!0$!6#*3&ndash;04,!7+"11,!4,!7,!8',
+    '-"13-"30.!1.!7.!9-"42-"50-"61-"71-"84+"22+"37+!4+"57$%-1956',
+    '$!.$!0#*4&mdash;05,!6%(ndash;10,#907-"17-"44-"76.!9+!6+!7+!8+"91+&august',
+    '$!e#*5&mdash;10%(ndash;09-!.+"11,!4,!6,#914-"29-"43-"62-"91+"37+"42+"59',
+    '$#-20$#/06%!6$"06$"82$!b#*6&mdash;14%%ndash*#;10,!1,!2,#914-"28-"46-"64',
+    '+"34+"68+!7$#-09%$1911(!4\'"26$#.20$!s#*7&ndash;10,!1,!7,#950-"69-"75',
+    '+"90+#may$!8#*8&mdash;09%(ndash;12,!4,!5,#909-"14-"20-"40.!3.!8-"89+"25',
+    '+"90$%-1984$!8#*9&mdash;13%(ndash;12,!4,!5,#910.!4-"25-"33-"73-"81+"29+"55',
+    '$!.%"23#!a$)&ndash;3s+!c$%-4/u8%!5#*c/375g/gas#!d##f-8$!f$!t##gns#"hp##kph',
+    '$!w$"yr#)nm-1000nm#%p=37p$!p#"th"*1&ndash;19,"18*-2/387&ndash;8*!5#(,000,000$#500##.4%$!5$$6mph',
+    '$&848pts#$/387#,0&ndash;1915.!7-"24.!8-"30-"44.!5.!8-"53-"77-"88+"26+"33',
+    '+"41$%-1920\'"45%"20%"45$!.$!1$!3#+1&ndash;12.,!7,#914-"20.!8-"40.!1',
+    '-"60.!3.!8-"89+"27+"30,!9+"78$(-vintage#*2&ndash;17,#936-"45-"64-"70.!3',
+    '+"42+"56$#-15&#956$!.$!2$!a#,3&ndash;1945.!6-"71.!6-"88+"25,!6,!7',
+    '$%-1945$#/14$!0$#204$!5$"is#*4&mdash;18%*ndash;1923.!9-"48-"53.!6-"69+*2&ndash;23,!4',
+    '+"32+"45$!-%"15&"8-&#960%\'pattern%$type$!/%"18$)1,200,000$!4#*5&ndash;17,#919-"21',
+    '-"36-"44.!8-"51.!5-"66-"73+"20,!1,!6+"55+\'january$#-23$%/1957$$:204',
+    '$!b#,6&ndash;1971-"83.!6+"27+"37+"49+"62$%,1922$#-23%#the$!0#,7&ndash;1918-"35-"56',
+    '+"22+"33$!\'$#-18%"29$!0#*8&mdash;19%*ndash;1919-"20-"39-"50+"21,!3,!7+"33',
+    ',!8+"48+"52+"87$#-19\'"58\'"81%"20&!1%"85$..1&ndash;1.113$#/19$!a#,9&ndash;1931.!6',
+    '.!5-"90.!3+"22+"50+"63$%-1965%"24$!.$%/1932$!0#!o#!p$!p#"st',
+    '*!7$&plus;1##(3)#$,700#%-page$&ranked%#oom#!.$"1%$"8%#*0&mdash;to%*ndash;1946-"55.!8-"74',
+    ',!3,!5+"33,!4,!9+"52+!6,!7+!9$%\'s/30$!-%$1932\'"55\'"72$!.',
+    '$#:21$"s.%&/1930s#,1&ndash;1922-"39-"45-"51-"80.!8+"26+"30,!1,!7,!8,!9',
+    '$#,50$%-1931%"22&!3$"/2#,2&ndash;1927-"43-"72+"27+"36+"44+"56+"60+"72$%-1926',
+    '$!7#*3&mdash;30%*ndash;1926+"26+"31,!2+"56+"74$"\'s$#-27%!4#,4&ndash;1936+"29+"30,!9',
+    '+!7$%,1980$#-27%"31$!.#,5&ndash;1957.!9-"62-"88+"29+"30,!2,!7,!9+"43',
+    '+"54+"68+"74+!9,!0$#-33$"33$#not#,6&ndash;1929-"37-"61-"94+"35$%-1937%"41',
+    '$%/1959%!7$!1%#-62#,7&ndash;1928-"39-"75-"91.!2+"29+"32,!5,!8+"40+"54',
+    '+"82%%sol;8$#-46$#/28$"55$!p#,8&ndash;1969+"34,!5+"49$#/29$!0$$b:29#*9&mdash;54%*ndash;1931',
+    '+!3,!9+"40+"89$%-1941%"33%%style$".2$#/30#!f$!f#"nd#"pp"+3&ndash;199*#208',
+    '*!4*!6##()s#$,430$#516$#800#$-861#".5%!0$&893mph#+0&ndash;190-"32.!6.!9-"70',
+    '+"34+"47+!5,!0,!9+"60,!8+!8,!2+!9+$june$!*$!-%$1932%"45',
+    '$-.11&ndash;6.1&!2$!b$,s&mdash;even%&-1940s(#50s&&doubts&$type&\'vintage%&/early%*photograph#,1&ndash;1935.!6-"69-"92',
+    ',!5+!4,!8+"58+"62+!7$"-3&!7$"/2$-:246&ndash;54#,2&ndash;1963-"74+"34,!6+"47',
+    '+!6,!5,!7+!7+!8+!9$%-1973%"36$!.$#/33$!0#,3&ndash;1945-"54+"39+"42',
+    '+"53,!7+"62+"74+"83,!7+!9$%-1941$!.$"/4&"/5#,4&ndash;1937+"37,!9+"40',
+    ',!3+"61+!7%&sol;35$#-37%!6%(although%%built$!.$"/5$!0#,5&ndash;1939-"45-"75-"92',
+    '+"61+"72+!8,!7$!-%$1984%"36&!7&!9$"sc#*6&mdash;39%*ndash;1939-"58-"91++37&ndash;38',
+    '+"42,!6,!9+"58+"76$%-1989%"37&!9%"52&!7%&before$!.$%/1937%"37%"72',
+    '&!6#*7&mdash;42%*ndash;1938-"44+"39+"41,!6+"51$#+21$!0$!1$!a$!b#,8&mdash;1965%*ndash;1948',
+    ',!3,!8+"50+"64+$june$#-41%%built%&design$#/39$!b#*9&ndash\'45*%;1941.!2-"62+"42',
+    '+"51+"85+)armistice%&sol;40$$,118$%-1940(!5\'"50\'"65(!6%"40&!6$#/40&!5%"81',
+    '#!a##bhp#!f#$o728$!s#)s-vintage""4%#*&ndash;197*#217,!9+"27+"57*!6*"98#$,500',
+    '$!5##/78#*0&mdash;41%*ndash;1950-"92+"42,!4+"50+"70+"92++june/august$%-1971\'"86%"67%"86',
+    '$%/1941%"41$"00$"56$-s&ndash;1950s%!.#,1&ndash;1946-"65+"43,!7+"73%%sol;2$#-59$#/2m$!0',
+    '%(ndash;44+!5+!7,!4$#-45$!.$%/1943(!5%&malaya$"50#*3&mdash;44%*ndash;1987+"49+"57+!6',
+    '+!7$%-1951%"44%%built$#.35$#/44$!0$#:24%"72#,4&ndash;1949-"80+"50,!1,!3+!7',
+    '$%-1947%"73%\'january$"/5%6thurleigh/bedfordshire$"45$$:138#*5&mdash;53+\'january%%ndash*%;1951.!6.!9-"60.!2',
+    '+"47,!9+!5,!3,!4,!8,!9+"60,!1,!2+"75,!6+%80(%),!1,!4',
+    '$%-1950(!1\'"65(!7\'"81%"47&!8%"68%"73$%/1990%!6$"10$!5$!6#*6&mdash;47',
+    ',!8%*ndash;1947.!8.!9-"52+"51,!3,!8+"65+"77+"81,!3+"c.$%-1951\'"81',
+    '%"49%"54%"62#*7&mdash;48,!9+"50%*ndash;1948-"51-"61.!4-"71.!7-"89+"50,!4',
+    ',!8+"65+"72,!7,!9+"90$!-%"53%"62$!.$%/1948%"48$!0#,8&ndash;1975.!6',
+    '+"51,!7+"63,!5+"85,!6,!7$%-1988%"51&!2%"64%#ish$!.$%/1949$!0',
+    '$$:165%"76%"97#*9&mdash;50%*ndash;1951.!2.!8-"74+"55+"63,!4,!7+"87+"90$$,120',
+    '%"51&!6$%/1978%%abbey$$:210&*35&ndash;3%$69ff#!i"(5&frac34$)ndash;215*!6*!7*"97#$,743##-20',
+    '$&member##.5p$!7##/50%!5$"60#\'0&mdash*#;51,!5%*ndash;1952.!6-#70s.!4-"80.!7',
+    ',!6,!7+!6,!5,!9+"71+#80s,!5,!7+"90$\'\'s-1960$%-1970\'"82%"54%"70',
+    '$".0$"ls$*s&mdash;as&+ndash;1980s,#60s%&-1960s&#60s&*revivalist&%style%!.%&/early#*1&mdash;52%*ndash;1954.!9-"63',
+    '-"74.!6-"87+!4+"53,!5,!6,!7,!8+"61,!3,!6,!7+"71,!3',
+    '+!8%&sol;52$%,1968$%-1979\'"91%"80%$jan.$!.$!2$$:156%"42$!a#*2&ndash\'92*%;1964-"75',
+    '+"58+"61,!7,!8+"74+!8,!3+!9,!1$%-1962\'"72%"73$\'.2-14.1$%/1953%!3',
+    '\'!4%"46$!m#,3&ndash;1962-"79-"93+!5,!6,!8+!6,!0,!5+!8+"90,!1',
+    '$#(2)$$-.65%"58$!.$#/54$!8$$:196%#218%!5$!a$!b#*4&ndash\'57*%;1957.!9-"74',
+    '+"57+"61,!4,!9+"74,!8,!9+"86$%,1958$#-59%"71%"84%%style$"/5$!0',
+    '%"97$!b#*5&mdash;56%*ndash;1962.!3.!7+"58,!9+"64,!8+#74.,!5+!8,!1$%,1959',
+    '%"62$"/6$$3-60$$:223%"49%"50%"83$!a%#:45&"75\'!7#,6&ndash;1957.!9-"86+"58',
+    '+"64,!6,!8+!8,!7$$,542$!-%$1958\'"65%"57%"61&!3$$this#*7&mdash;60%%ndash',
+    '.!9+"60,!1,!3,!5+"74,!6+"81$",7$!-%"58%"66$#/58%!8$!0',
+    '$!9$$:141&,96&ndash;200%"24%+39&ndash;40%#469&"70&"91%"62\'!9&!9%"90#*8&mdash;59+"61%(ndash\'63',
+    '.!9-"76-"92+"65,!7+"72,!4,!9+"80,!4$!-%"59%"60&!1&!2',
+    '%"82&!5$!0$$:132%#201\'!2&"16%#500&"57%"86%$viii$$a:15&#208(!9\')3&ndash;5',
+    '#,9&ndash;1917-"60-"75.!8-"81.!7-"90+"62,!5,!6,!9+"75,!8$&,1260a&#961',
+    '$%-1972%"60&!4&!6%"81%$type$-.12&ndash;3.1$!0$#:16%"25&!7%"38%"43$$a:45##bhp',
+    '#!k$#m/h"+6&ndash;197*#205+"21*!7*!8##()s$"3)$"4)#\',000lbs#%-acre$&member#".6$"80',
+    '.!6-"80.!6+!2,"00+!5+!6,!2,!6+!7,!8+!8,!1,!5,!6',
+    ',!9+%sept.$!-%$1976\'"83(!9\'"90(!1%"74&!5&!8%"80&!2%!i%$july',
+    '$!.$"/5$*0&ndash;00,"10$"60$":1&*54&ndash;5&"73%#233%#346%"65&"73$&s-that&\'vintage%&/1970s',
+    '-"81.!3+"62,!7+"73+"86+!9,!0+$feb.%\'rehy;or$&(1843)$!-%$1970\'"84%"64',
+    '&!2$#/62$!2$%:1486%"27&"97%#306&"16&"32%#465%"51%"74%"98#*2&mdash;66%*ndash;1969',
+    '-"88+"65,!9+"70,!2,!3,!5,!8,!9+"83,!8+!9$%,1964$$-\'64%$1979',
+    '%"71%"87$!6$8:126&ndash;7,135&ndash;6%!4&!1%#555%#683$!b$!m#*3&mdash;65,!6,!7,!9%*ndash;1967',
+    '-"71+!6,!6,!9+"71,!3,!4,!5,!8+!9$!-%$1965\'"90%!6&!4',
+    '%"83$"/4%$mike$!0$#:12\'!6%!2&"27%!6&!2%!9&!1&!3#*4&mdash;70%*ndash;1920',
+    '.!9-"83+!6,!7,!9+"71,!2,!9+"80,!1,!2,!9+!9$%,1965(&6,1971',
+    '(!6%"79%#see$".4$#/41$"48$"80$$:161%+204&ndash;5&!2%#356%!4%"73$(aprilnow$"wk',
+    '%*ndash;1971.!6-"90+"74+!8,!3,!4,!5,!6,!9$%,1976$%-1966\'"77(!8\'"90',
+    '$"/6%&london$!0$#:31%"60&!3$$a:93#*6&mdash;68+!7,!0%(ndash\'69*%;1968-"76+"68,!9',
+    ',!8+"80,!6+$aug.$%,1979$#-68&!9%"80%#see$!.$./aberfan/wales%%early$"08$$5024$!8',
+    '&!7%#210&"41&"79&*9&ndash;31%#464&!8&!9\')&ndash;51%"55%#800\'!5&"13#*7&mdash;87%*ndash;1972',
+    '.!2+"72,!7+"80,!2,!7$%,1970$#-70&!2&!4%"89$!.$%/1968%!9$!0',
+    '$!5$$:104%"37\'(&ndash;8%+55&ndash;68&!6&!8%*67&ndash;8%#iii$#the#,8&mdash;1978+"69%*ndash;1971.!3-"82',
+    ',!8+"81,!6+"90,!1$"\'s$%,1970("7b$!-%#.80%$1969\'"73\'"86%,and-all-that%#ish',
+    '$"/9$!9$$:202&"59&"73&*83&mdash;4&"99%"31#,9&ndash;1879,#970.!3-"89+"75,!7,!9',
+    ',!2+"92$!\'$%,1975(!7(*8&ndash;79\'"80$%-1972%"71&!2&!9%"82$%/1842%"71%0caernarfon/wales',
+    '$,:105&ndash;6\'!7&!7\'!6&"96%#206&"21\'!4&"30&!5\'!6&!6&)7&ndash;8\'!8&"87',
+    '\'!2%#328&"32\'!7%!5%!6%"73%"84%.92,141&ndash;4&!3&!4%#ch.%#vol$!c%(onferred',
+    '##ff.$!t#!k#!l#!p$!p%!."+7&ndash;201,!3+"13+"22,!7*!8##()s#"-9',
+    '##.7%$!9##/87#,0&ndash;1977.!9-"81.!7+!7,!3,!8+"84+!9,!1$#\'s.$#,16',
+    ')!a$!-%$1973\'"80(!3%"80&!1&!3&!7%"91%!i%!s&$tyle$!.$%/1846',
+    '%#992$$4721$#:12&"43&!5&"60&+86&ndash;91&"93\'!8%#222\'!9&"33&!4&"91\'!9',
+    '&!4&!8%"54&)8&ndash;9%"66%!8&!0&!3&!6%"92$$a:90$$b:48&"74$"s*%!-',
+    '%!.&"he%$/80s#,1&mdash;1990+"73%*ndash;1973.!7.!8-"81.!9+!5+"74+!8,!5$#(4)',
+    '(!7$%-1981(!9%!2%"73&!6&!9%"82&!4$"/2%"73%"81$!0$$:116&"27',
+    '&!5\'!0&!8%!5%!7%!9&)&ndash;34$%a:163$%b:369$!c$!m#+2&mdash;and%(ndash\'73+"92*%;1976',
+    '.!9-"92+"74,!7,!8+"84,!7+"90$!-%$1980(!4%"77%"82$"/4&!1',
+    '%%82/92&!5$!0$":2&!2&"77&"88%"36&!9%#420&"46&"57&"68&!8%"51',
+    '%"84%!9&!0&!3$-b:277&ndash;8$$c:14#,3&mdash;1980%*ndash;1975+!7,!6,!7+!8,!1,!4,!5',
+    ',!7,!8,!9+!9%&sol;74$%,1974$%-1977\'"81%!4%"75&!7&!8&!9%"85%*registered',
+    '%,7&ndash;26.4$%/1974(!9%#334$$:123&!6&*77&ndash;7%"21\'!8&"30\'!1%"32&)6&ndash;7$-a:177&ndash;9$%b:614',
+    '*%;1976.!8-"90.!2+"76+"83,!6,!7,!9,!i+"90$"\'s$%,1975\'"80&!r',
+    '%$1979\'"87%"76&!8%"81&!3&!9%\'onwards$%/2140%#420%"82$$4516$!5$!7$$:105',
+    '&"78&"91%!2&*2&ndash;30&!8%#353%"45&!8%"56&!7%#602&*6&ndash;71&!7%"70&)1&ndash;7',
+    '&!1#*5&mdash;79+"85+"90%*ndash;1977-"80.!5.!6+$2026+)6&ndash;7+!8,!3,!4,!9+"90',
+    '$%,1976(!9$!-%$1979\'"90%"83&!5%!9&!0%\'onwards%\'to-1977$#/79$!0$!7$$:124',
+    '&*9&ndash;24%#257&"62%"33&*7&ndash;11%"43&!4%"54%#642%"77&!8%!9$$b:76&"84$(excluded',
+    '%%ndash*%;1977-"80.!8-"91+"78+!8,!3,!4,!5,!8,!9+"91,!2%%sol;7',
+    '$!-%$1983%"68%"77%"82$"/6&!7$!0$!1$!3$$:104&!2&"51&"70&"83',
+    '\'!6%#207&!5&)8&ndash;7%#348&!9%"40&"17&!6%"61%"74&!6%"81%!9&+7&ndash;100',
+    '$%a:114\'!6\'!7$!d$$k:15\'!8&*21&ndash;2&)4&ndash;5#,7&ndash;1978-"80.!1.!3.!5-"90+"83',
+    ',!8+"90,!1%,rehy;giddens$%-1978%"78%"87%"91%!a%&series$%11622$$:120\'!4&*36&ndash;7&!4',
+    '&"76&!8\')&ndash;20\'*0&ndash;82%#205\'!6&"23&"44\'!7&!7&!9%"30&!1&"48&!8',
+    '%*73&ndash;4&!5\'!6%!v$%a:129\'"34#,8&ndash;1988-"90+%2018.+"78+"93,!a%%sol;9$%,1981%"24',
+    '%"82&!3&!5%%based$!.%#5.7$!/%$1979%"88%"9a%*birmingham%$l979$!0$"79$":1',
+    '&"10\'!7&!2\'!2&!3\'!4\'!7\'!9&"45&"53&"69&"73\'!4\'!6\'!8',
+    '%!2&"00\'!2&"18&"25\'!9%!3&!6%"42&!3%"58%"83&!6$#and$!d',
+    '+$ucta%(ndash;11,#984.!7.!9-"92+"91%&sol;80$"\'s$%,1985%!6$%-1983(!4(!5(!6',
+    '\'"91%"82&!4&!5&!6&!7%(december%\'january$%/1080%#591$!0$!1$$4211$$:105&"13',
+    '\'!4&"25\'!8&"30\'!1\'+3&ndash;142\'!4&"48&"64\'!9&!7\')0&ndash;1&"83%#204\'!6',
+    '&!4&!8&!f%"30&*2&ndash;36&!9%$43-4&!8&!9\')&ndash;50%"68%$7149%"86%#ch.$!=',
+    '$%b:173$$c:59&"97$\'onwards$!r##bhp#)f&ndash;g#!g#"km#!l#!o$!s"+8&ndash;197*#201,!5',
+    '+"24+"30+#888*!6*"87$*times;10/l##()s#$,000&!6$#200%"25#!-$!8$&member$#run',
+    '$$yard#,0&mdash;1991+"81%*ndash;1983.!5.!6.!8.!9-"91.!2+"22+!3+"88%&sol;81$%,1981',
+    '&#982(!5(!8\'"90(!1%"83%"90$!.$+/81-1983/84$$1989$!2$!6$":1&"08&!1',
+    '&"26&"35&+57&ndash;67&!6%#201&!4\'!7\'!8&"61\'!2\'!7\'!9&"73\'!6&"87',
+    '&"96\'!8%"30\'!2&!1\'!6&!3&"99%!4&"23&"83%"77%!8%"90&!7',
+    '%$part%*x&ndash;xi$!m%!m$!r$"s*%&-style#)1&mdash;3+"82,!7+#see%*ndash;1934-"83.!7+!7',
+    '$,,49&ndash;50$!-%$1982(!3\'"91(!3%!4%!6%"92$".1$%/1573&#794)*&mdash;the&#982%#898',
+    '%".5$":1&*01&ndash;7&"14\'!7&+21&ndash;31&"56&"66&"79%+203&ndash;5&"82%#308&"24\'!9&"42',
+    '&"88%#413&$48ff%"60%"70%"86%"p.$$from$!m$"p.$!s#,2&ndash;1984.!5-"91+"29',
+    '+"91$#(a)%"b)$*,1985,1986$%-1985(!6\'"90(!2%!3%!5%!6%"87&!8&!9%#ish',
+    '%"84&!7%%early$!1$-:106&ndash;26&.33,148&ndash;9&"48&"53\')7&ndash;8\'!8&*63&ndash;4\'!6\'!9&!7\'!0',
+    '%!2&!0&"41\'!3%"33\'(&ndash;5&!5%!4&!4&!5&!7%!6%!7%&laczko$$a:26',
+    '&"44&"53\'!5&"60\'!9&"76&#ch.)!3$$b:18&"38&"46&"63\'!7\'!9$#did',
+    '#03&mdash;february%*ndash;1984.!6.!7+"89%%sol;4)"84$$,149&#985%"61$!-%$1985(!6(!9%!8',
+    '$=/stoke-on-trent/staffordshire$!0$(19871992$$3711$!6$,:10&ndash;11\'!1\'!9&"12\'!7\'!9&"46&"52&!6&"98',
+    '&!1\'(&mdash;2\'!4&"27&"30&"86\'!7%!3&!9%"42\'!6%*58&ndash;9%"64%"81&*3&mdash;84',
+    '&!5&!7&+9&ndash;100$#a:5$%b:288&!3&!6&!9\'!9#&4&lsqb%*mdash;1994%*ndash;1985.!7+$2000+"31',
+    '+"91,!6%%sol;5$"\'s$$,145&#985(!7(!8%!2&!0%!5$%-1985(!6(!7(!9',
+    '&!4%"84&!7&!9%"90&!3$".5$$/032&"62%$1015&+93,1986/019\'"90%"32%"83%"93',
+    '%.leicestershire$"00$!1$!5$!9$$:108&*28&ndash;9&*57&ndash;9&!6&"98\'!9%#204\')6&ndash;7&"83%#328',
+    '\'!6&"40\'!5&)8&ndash;9%*41&ndash;2&!4%"50%!6&!7%"78%"84&!5&!9$#=88$!d',
+    '#&5&lsqb%*mdash;1987%*ndash;1989-"91+$2025$"\'s$&,14-15%!3%"75%$81-3$#-69%%based$$/062%$1986%"31',
+    '%*birmingham$!0$"15$!2$!6$!7$!8$#:10\'!3\'!4\'!6&"35&"47&*54&mdash;7&"80',
+    '%!3&)&mdash;33&!9%"41&"73&!8%"51&!3%"62%"76%"83&!6&!8&!9$*_according',
+    '(!9$$b:35$!r#&6&lsqb%(mdash;87%*ndash;1988+"7a$!*$%,1988%!6%"80$%-1991%!9$!/%#\'97',
+    '%#109%&gareth%1loscoe/derbyshire%6stroud/gloucestershire$":1&(&ndash;2&!0\'!3&"12\'!3\'*4&ndash;15&"27&"31\'*9&ndash;40&"48',
+    '&"61\'!4&!7\')3&ndash;4&"87%"23&!4%"30%"45\'(&mdash;6%"55&!9%!6&!2&!9',
+    '$%a:195%"nd$!e$!m#,7&mdash;1995+"88,!9%*ndash;1991.!2+$2000+"30+"91+\'figures$&,11.8%&)988,1990a',
+    '&"8%$!-%$2001%"90&!1&!4%$date%#era%#see$-.10&ndash;5.1$!/%$1988%9aylesbury/buckinghamshire%&beirut$$3613',
+    '$!7$-:106&ndash;11&"21%,214&ndash;18&"24&!3&"76%"31&!5%#463&"90%"56&!9%*64&ndash;8&!6',
+    '%"70%!8%"93&!7%#ch.$$=100$#and%"pr$)requiring$#the#+8&lsqb;q.b.%*mdash;1992+"89+"90,!1',
+    '+$ibid%*ndash;1991.!2.!7+"93$%,1989\'"91$$-\'89%!9&!1\'!.%\'october$".3&!7$&/24803',
+    '%*birmingham%#itn%+seoul/south$"66$!7$$:113\'!6\'!7&"23\'!6&*30&ndash;1\')4&ndash;5&*40&mdash;1\'!5&"59',
+    '\'!3\')8&ndash;9&!7\'!0\'!5\'!6%!2&"13&!3\'!1&"73%"31&"27&!7%!4',
+    '%"61&!9%!7%!8&!5&!8&!9%"90&!5$%a:129\'"33(!7&!2&!6$!i',
+    '#,9&mdash;2001+"91+#see+#the%(ndash\'90*#;16,#993+"31$#(a)$$-90*%%april%$ibid%$june%%march%\'october',
+    '(!2&#990(!2%#379%!4%%90/91%/a34/oxfordshire%(cotswold%%early%(heathrow%$kate%0littlehaven/west%&milton%(november%&oxford',
+    '$!0$!1$#364$!4$!8$$:109&"18&"20\'!6\'!7&!4\'!3\'!4&!6\'!5',
+    '\'!8\'!9&*7&ndash;18\'!2\'!3&!8\'!4%#202\'!3\')8&ndash;9&)2&mdash;3&!3&!6\'!0\'!1',
+    '\'!0\'!3((&ndash;4&"81&!9\')0&ndash;1\'!7\'!8%#322&!3\'!7&"43\'!5%"43&!8',
+    '&!7%*76&ndash;7%"92%$ch.6$$=100$$a:10&"21%!b$$b:13\'"80&"22$$e:11\'!5&!8\'!3',
+    '$!g$!h#!o$!s#"pp%!.#"th"(9&frac23$)ndash;201,!5,!7+"27#$,000$#160$#700',
+    '$!5#".6#70&mdash&pound;2,057,000*";a+$well%*ndash;1994.!5+!2+&912.7%,"2\',!4,!5$!*$!-%2-&dollar;5,000,000',
+    '&#993%!2&#010%"90&,1commitments%%early%$june%%march%#see&$peak$&/brian%:cinderford/gloucestershire%3drayton/oxfordshire%$gary&.loucestershire',
+    '%1pucklechurch/avon%\'swindon,*/wiltshire$&10,228$"91$$:112\'!5&!2\'!1&"48&*56&mdash;7\'!7%#203\'!8&!2',
+    '&"46&!6&"75%#315\'!6&"62\'!5%"48&!9%"77%!9&)&mdash;10&!9$$a:12\'!8',
+    '&!8&!9$"by$$c:32$!d$$e:31$#nov$"s.#)1&bsol;92%*mdash;1992+$most+(official%*ndash;1937-"95.!9',
+    '.!1.!4-"51+!4+#92/-$4.7%,!4+\'january%\'sol;205)#318)#422+!3*"34*"40*"54',
+    '$",5$%-1994%"91&"2.&!7%%april%$jan.&#une%$late$!/%$2128&#705%!4%"93%\'birdlip',
+    '&(lackbird&$rize%*cheltenham&1ulham/oxfordshire%&gareth\'#vin&$reat%%kelly&"im%%lower%,m4/wiltshire\'20/northamptonshire&$ount%+northampton*0moor/oxfordshire',
+    '%#raf%%simon&5troud/gloucestershire%7tetbury/gloucestershire&#oot%7winslow/buckinghamshire$$1987(,199119871991$12,21,419&ndash;25$"92$$:118&"38\'!9&"42&"70',
+    '%#218%!6%,93&ndash;144$$a:14\'"65\'"89\',91&ndash;203&#241(!7(!9\'+50&ndash;64()6&ndash;7&!7\')0&ndash;1$$b:12',
+    '$$c:13$#did$!e#)2&mdash;3%*ndash;1994.!7+"22+!9,!6,!7$((7.30pm)$%,12,3$%-2001%$isms$%/1420',
+    '\'"40&#524\'"31\'"47\'"55&#611(!2(!9&#752&#901\'"41(!2(!3\'"66%$2051',
+    '(!5&#355&#452\'!6&"58&#792(!3&#915\'"32\'"66%$3003(!4&"33%!9&!2',
+    '%4abingdon/oxfordshire&%ndrew&4ppleford/oxfordshire%3banbury/oxfordshire\'$rton&3icester/oxfordshire&$rian%(chipping\'#ris\'8urchdown/gloucestershire&.oleford/forest&1umnor/oxfordshire&$yril%&deanna&$iane',
+    '%3enstone/oxfordshire%&gareth%(hereford%#ian&#nsp%!j&\'onathan%%karen%&london%%maria&#ike\'9tcheldean/gloucestershire%\'neville%\'reading&$obin',
+    '&#uth%<silverstone/northamptonshire\'#mon&"qd&!t\'#oke(\'nebench/0/gloucestershire&&windon%#the%%upper%3woodford/manchester$"0s$$3711$&:mixed',
+    '$"ad$!d$"qb$!s#)3&mdash;4+"on+#see%%ndash*#;12,!8,#996+!2,#000.!3+$31st',
+    '+!9$%,34,2$%-1994%$2002%"96%%model$!/%$4(2)%#94.%#abi%3burford/oxfordshire%%chris&(rowmarsh%&donald%%ellen',
+    '%%karen%:leintwardine/herefordshire\'$ster&%ondon%$mike\'$lton%+northampton%$rape&$obin%9sharpness/gloucestershire&9tonehouse/gloucestershire$!1$!4$!8$"94',
+    '$"fw#*4&mdash;96%*ndash;16th,#998+$2004$#-96&!7$!a$!b#,5&ndash;15th,#7th+$2040,#3rd$%-1996%!6',
+    '$!0#,6&ndash;15th+$21st$"-7$%/2001$!0$!5#&7-1999%$2007%(oriented$!.$"/8#&8-2001$!.$!3',
+    '##9\'s$%-2000(!3$!.$%/2004%&purple$!0$$2/93#!f$!f#!l#<o/cinderford/gloucestershire$!s#"th"1:07:00&ndash;0500',
+    '#)1&ndash;8$!1$/3:41&ndash;0500$*6&ndash;20$!7#"20$*1&ndash;22$!2$*8&ndash;38%#:21#"36$!8$*9&ndash;44#)4&ndash;6$*5&ndash;48',
+    '$!7#!5$$5:37$!8#!7#$8ff."$a(2)$"3)#!b#!s")b&ndash;e#!.#!5#!c#!n',
+    '#!.#!m""dx")e&ndash;f"!f#!f#"t."!g"$inch"#khz""l4#!5#!8#"bs""ma',
+    '#"m.#%onths#"ph#!s"!o#!1#!2#!4##9sc"#pts""s5##ecs"#tel#,h&ndash;21st,#2nd',
+    '$%-22nd&#6th%#lap$!.$!c"!w#!8#!9"!x#$44mm#!7#!8""y2#\'ear-old!":0',
+    '#!2$#:39%"50$$secs#%3secs#$4:10%"45%"56#$5:14%"29#!6$#:09$$secs#!7$#:21',
+    '#!9")1&ndash;3*!4#$,000#".5$#618%!5$!7$"80#*0&amp;sup9$$,560$"67$!k$$secs#*1&ndash;12',
+    '$%-1:16$".6$"20#$2800$!o##365#%4.041%#370#*5&ndash;16+"23,#:10$$.114%#210$"63$!f',
+    '$$.078&"91%#440%#727%!8&"63%#937&"44$!0%#000#%7.037&"47%#231$"45$!f',
+    '$!f#!9$)&ndash;25$#.49$!2#":1$!2%!.$"40#"ff"*2&ndash;38#$,500#".4$!9#$0.80',
+    '#%1.491%#552%#825%#948##300$%9,300##430$#:25#+5,000-scale$%0,000#)6&mdash;7%(ndash;27+"38$#,28$$secs',
+    '$!6#&:3:2:1$45:6-dibenzanthracene$!6"*3&ndash;14*!4#",4#".5#$0000\'!0$"82$"pm#!1$$secs#$2,33',
+    '$$secs#*5&ndash;39#!6#%8.962$"02#!9"#4,5#".5#*0&ndash;42+!5#!2#"40#$5.85$"am$"pm',
+    '$)&ndash;55#!7$#.62$#:29##888#!9")5&ndash;7*"80#$,000#%00000$#:00#!1$#.34#"28$#:35',
+    '#!4##6.0%!1#"75##9.1%!5#!f"%60000#"10#"25%$,000#%3,360##400#$5000#!8',
+    '#!d"$7500"$8,10#!0$$,000#!2"*9&ndash;11#&06,530#"75#"ff"#iii"&market#%obile!$=150"%blood',
+    '"&hardly",interlobular"$less##oss$!w"&normal$!t"*occasional#"ne"$pain##oor"#the"\'urgency#0s&dollar;1.24787!$a(2)',
+    '"&,2a,2b"&-09008#!c"!2"!5"%ckley"$fter"!h"!j""ll""m."%ndrew"#rge"!u"!x',
+    '""+d"#-1d"!c"!q""r."!s"!t"!u"#yte!-cm-&frac12;in#+/&half;inch#!s"+o&ndash;col#$-col#&nsumer',
+    '"\'ycledeg!"d1"!4"!b"!m"!n"\'q.there"!r"!s"!w"!x"!z!$e-3e"+1415.6+2557"!d',
+    '"!h#!."!l"!p"!s"!y!#ff."!h"#loz"!n""t.!&g-byte"!6""al$%/acre',
+    '""cm"!f#$lops"!g"!l"!m#"/1""yr!$h+fm"!7"(averhill"!b""co"!e"!j',
+    '"!q"!u"!x"!y!&in-6ft$%thick##ter"$x.88!"j6"!a"!f"!k"!l"!p")rm1305618',
+    '!%k&ohm"!2"!3"!8"!b"#g/2$#day"\'ick-off""ms"!v!%lb-11#!.#$12oz"!e"!f',
+    '"!q"!r""t.#!s"!w"!z!%m&ohm"!-#"2m#%pixel""bp##yte"!g#"/1"&illion',
+    '%%6secs%%8secs%$secs$&20secs%%8secs%%9secs$&45secs%%6secs%$secs$&50secs%$secs$%8secs""ph!&n4148s"!7',
+    '"!a""f."#gml"!h"!r!"o%"$&ins"&\'clock"$,ooo"#-2o"#.15#$3oam#"50""2b"!a',
+    '"#oml#!x""pm""th"%z,9lb##/sq!*p&ndash;2p"!."#/kg"!9"!a#$rsec"!b"%c-4pc#!.',
+    '"#int"!l#!."+m&ndash;2pm*#5pm#$-2pm$#4pm$#5pm"!n"!u""wo!#q25"+42&ndash;43#*3&ndash;43"!e',
+    '"!p"!q"!x"!z!!r"&angers"!e"!j"!r"!t"!w"!x!)s,3r-acpd&*enantiomer"$-16s',
+    '$!d#"6d#"d."!6"!d"!n"!p"!s"+t&ndash;4th*#8th#%/11th#"xi"!x!!t"%-bits',
+    '""82""bs"!d""ev"%h&ins#"ey"$imes"!l"$otal"!q""r.""t.!"ud#!."!e',
+    '"!q"!w"!y!)v.ii.26ff"#iii!"wt!&x106km#$o7km""23#"oz"#32m#"in"\'5inches#"ml"!g',
+    '"$sscp$"pe"!w!"yb"!g"!j"!n""q."!s!"za"!u *2%+15%=17%!&&amp;1\'"/2&!3',
+    '&%sup40&&times1#$ring"&bsol;3"/commat;1/2-year)#2/3"5deg,4&deg,6&deg,8&deg%\';-5&deg&#15\'&(c/minute".formula;m.what#(rac12&ft)(mdash;5p),ndash&frac12.);1&frac12',
+    '/!5)&percnt(&;-half*$week*$year)#cwt)%hours*!r)#in.)!m*$iles)&oz/70g)&points)%years\'"4%',
+    '(";d)#in.+"ch)!m\'!8&&34&ins(#;in+&-thick\'!8&"58(";m#\'t;6&ins""gt"+half;x4inch"$lcub',
+    '&!l#&icro;g)%/cu.m$\'ddot;14)!2)/5x12&middot;5cm",ndash&frac12.#;in-!4\'*;0&ndash;0)$2.49)$8.37)$9.13+"30()1&ndash;0',
+    '0!8)&/2&ins*!4))0&ndash;01$19051"361!41!8*"pm))1&ndash;01$19114!6*"1b)*2&ndash;141!8',
+    '*!6*!m))3&ndash;0)*4&ndash;11*#.68)"53*"pm)$6.36+"45)$7.33)$8.5%)"90*.70s-disco-feel($2.30*"5%',
+    ')!1)$3.07)!4)!5*!8)!6*!%)!7)*9&ndash;15(\'3&deg;c*&frac12*\'ndash;00"180!2*(times;10',
+    ')#-18*!5*$fold)$/4in*$5/41)#000+"mg*!4)*1&ndash;32)!3)!5*!%*)&ndash;11)$7.14)!h',
+    ')&inches+!s)"mm)#p.m(\'4&deg;c)*-year-olds)#.30,"pm)%0.153)!1*".6)"4%)#5pm)!7*#.42',
+    ')2ft(0.6&ndash;1.2m))!h)%mg/hr(,5&ndash;1846)#.6%)!1)!5(\'6&mgr;m)!4)#ins()7&ndash;0)"05)"hz)"pm(18&ndash;0&ndash;7',
+    '1!20$1862)!0)!2)"pm()9&ndash;00!41!1)!8(#epb(#may(!o"$pgr/#%lus;3#&ound;4',
+    ')*7&prime;ff((30&prime((45&prime((51&prime"0rehy;millisecond\'(year-old"\'sect;46#1hilling;11&frac34+#6d.+!9"0times;2&times;10)!0)"30(#65g((denhardt',
+    '(!n(#ssc)\'tandard!0\'-deoxyadenosine(8uridine-5\'-monophosphate#"oh""07""16"K2\'-azinobis(3-ethylbenzthiazolone)sulphonic"#x2\'!*(1-k)*k*w2*!3"#3)a$!b"#4)b',
+    '""k)"$wo2)!\'*/3*/4*(#/5*!"+1#"66"%2+2+4"$wait!%,000%%,&mdash;3,000&+ndash;2,300.#500,%4,000,%5,000%!\'',
+    '*%tonne%"-1&%2,500&%4,000&%5,000&$acre&$fish\'#oot&#lot&&member\'!w&$name&#pub&"sq&%tonne',
+    '%#gal&!b%"hp%!k&"ms%"m2%#rpm$!3$!4$!6$(8,137.60$!9$"lb#&10,807$\'2&deg;f',
+    '$%5,731#&22,319$!5$%8,339$!9#&30,000$!4$"6m$!7%$,500#"41$!3$!4$%5,000%".7',
+    '$)8-channel#$50ft$#2.5$!4$!6$#7.2#"61%"st$%3,000$!4#"70$%1,600$!2%".2$!3',
+    '%!m$!9$!i#$80ft$!1%$,000$!5$%6,000$%7,528#&90,000$!5$!6$%7,146"#1,0#!0',
+    '%4,000&ndash;2,500,000%"hp%"pc$!2$!3%$,000&#938$!9##14m$%7,900$"80#&20,000%!m$!1$%4,126',
+    '$!7#*3&ndash;20$%0,525$!5$!6$!9#&46,000$%7,000$#8ft$%9,690#$50km$!3%$,493$!4$%5,000',
+    '##620$#5lb$!9#"70$"2m$%4,860$%5,100$$9481#"81%$,514$%6,567$!8#"90%!m$!3',
+    '$"7m$!8$"9m";2\'-azobis(2-amidinopropane)%*diquinolyl#$,3,3%1-trimethylpentane$#5,6#\'00-acre&)kilometre%#/25%#gns%"hp%"kg%#rpm',
+    '$!7$!8%$,000#"12$!4$!7$!9#!2$!2$!3$"4m$!8#"31$A5,197,406,895,366,368,301,559,999$!6',
+    '$!8#&40,000%"ft$!1$!2$!4%$,000$%5,000%"hp$!6#$50hp$!1$!2$#4.0$!7',
+    '$%7,878$!8$!9#"70$!1$%5,000$#7.1&!5$!9#"80$#1ft$!8$#9.2#%90lbs$!2',
+    '$!4%%-yard$!6$#9.4"$3,18$\'4,5,6,7+",8$!5$!7#>-dimercapto-1-propan-sulphonic&)oxygenase#\'00-mile&&strong%"ft%"kg',
+    '\'!s%#mhz%!t$!1$!2%"ft#"10$!7%$,000$!9#"21$!4$%5,100$%7,600$#9ft',
+    '$#1.1%!m$!2$!3$!5$!6$!7$!8$!9%$,000#"40$%1,646$#2.1$!3%$,000',
+    '%$,678$"7m#&50,000$%1,041$!2$!3$!5%$,174$#6.8$%8,583#"60%".7%!m$!3#"70',
+    '$!4$!5#&80,000$%1,741$!3$!4#"90$!2$#3.2$!6%$,000$!7$%8,000$!9"$4,5t',
+    '%%,8,10*&,12,13%9-trinitrobenzenesulphonic$!8#+-diamino-5-&+nitrophenol#)00-strong&#ton)"ne&$watt%&strong$#3ft$#4.2$!5$!6',
+    '$$9-bp#&10,000$!1$!7#"20$!3%".9$!5$!6$!8$%9,000#"30$"1m$!5$#6.5',
+    '%!%$!2$!3%".4$!5$!7$!9#"50%!m$!7$!9#!6$!2$$6.7%$!8',
+    '$!1%#.4%$%2,900$!5%#&ft%$,000$%6,149$%7,000$!8$%9,000#"80$!7$!8#"92$!4',
+    '$$8,11#$-di-##00%%0&ndash;1,200yrbp,$3000,%4,500%&-3,000&"km&\'megaton\'#ile))lion-mile&(nautical&#odd&$seat*"er',
+    '%"hp%"kg%!m$!1%$,943$%6,000#$10ft$!2$!5$!6$!7$!8#"22$!4$!5',
+    '$!6#$3060$!1$!3$!4#(40pmolmg$!5%$,553$!6%$,000$%9,096#&50,000%"bc$!2$!4',
+    '%"bp$$1.8%$!3$!5$!9',
 )
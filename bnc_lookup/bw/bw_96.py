@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_96 = (
+count_96 = 6694
+
+heads_96 = (
     '13.63',
-    '13.65p',
-    '13.67',
-    '13.6m',
-    '13.6mg',
-    '13.6mpg',
-    '13.7(a)',
-    '13.7(b)',
-    '13.7.1',
-    '13.7.3',
-    '13.7.5',
-    '13.7.6',
-    '13.7.86',
-    '13.7.90',
-    '13.732sec',
-    '13.7503',
     '13.75p',
-    '13.78',
-    '13.79%',
-    '13.79p',
-    '13.7k',
-    '13.7m',
-    '13.7mpg',
-    '13.7x11.3',
-    '13.8&ndash;14.6%',
-    '13.8.4',
-    '13.85',
-    '13.875',
-    '13.8gb',
-    '13.8p',
-    '13.9.1',
-    '13.9.2',
     '13.9.3',
-    '13.94',
-    '13.96p',
-    '13.9c',
-    '13.9p',
-    '13.9pc',
-    '13.9secs',
-    '13.a.t.',
-    '13/-',
-    '13/11',
-    '13/115',
-    '13/14-year-old',
-    '13/15',
-    '13/16in',
-    '13/171',
-    '13/19',
     '13/199',
-    '13/2&ndash;93',
-    '13/25',
-    '13/28',
-    '13/3/90',
-    '13/31',
-    '13/34',
-    '13/35',
-    '13/4',
-    '13/4/41',
-    '13/407,20/414,112/506,139/533,164/558',
-    '13/41',
-    '13/417,110/504',
-    '13/457',
-    '13/5/41',
-    '13/5/93',
     '13/50',
-    '13/57',
-    '13/597',
-    '13/7',
-    '13/82',
-    '13/84',
-    '13/87',
-    '13/9/87',
-    '13/90',
-    '13/disinformation',
-    '130&deg;c',
-    '130&ft',
-    '130&mgr;g',
-    '130&ndash;134',
-    '130&ndash;137cm',
-    '130&ndash;149',
     '130&ndash;220kg',
-    '130&ndash;63',
-    '130&ndash;77',
-    '130&ndash;98',
-    '130&times',
-    '130(6)',
-    '130,000-strong',
-    '130,400',
-    '130-',
-    '130-100',
-    '130-180.',
-    '130-day',
-    '130-foot',
-    '130-km',
-    '130-odd',
-    '130-page',
     '130-seat',
-    '130-strong',
-    '130-yard',
-    '130-year',
-    '130-year-old',
-    '130.0',
-    '130.2',
-    '130.5',
-    '130.65',
-    '130.8',
-    '130/10',
-    '130/bhp/tonne',
-    '130/l',
-    '130/min',
-    '1300&deg;c',
-    '1300&deg;s',
     '1300&ndash;1030',
-    '1300&ndash;1360',
-    '1300&ndash;1400',
-    '1300&ndash;1450',
-    '1300&ndash;1500&deg;c',
-    '1300&ndash;1550',
-    '1300&ndash;1900',
-    '1300&ndash;200',
-    '1300&ndash;2034',
-    '1300&ndash;39',
-    '1300&ndash;61',
-    '1300&ndash;800',
-    '1300-1400',
-    '1300-1600',
-    '1300-page',
-    '1300-plus',
     '1300-word',
-    '13000&deg;c',
-    '1300bc',
-    '1300ft',
-    '1300mw',
-    '1300mwe',
-    '1300sel',
-    '1300sl',
-    '1301&ndash;1314',
-    '1301&ndash;1550',
-    '13010&ndash;1879',
-    '13010/l',
-    '1302&ndash;73',
-    '13029',
-    '1303&ndash;5',
-    '130370',
     '1303a',
-    '1304&ndash;5',
-    '1304&ndash;8',
-    '1304hf',
-    '1305&ndash;34',
-    '1305,676',
-    '1307&ndash;13',
-    '1307&ndash;1327',
-    '1307&ndash;1660',
-    '1307&ndash;24',
-    '1307&ndash;27',
-    '13077-79',
-    '1308&ndash;10',
-    '1308&ndash;9',
-    '130870',
-    '130a-130e',
     '130b',
-    '130bp',
-    '130g',
-    '130kg',
-    '130kyr',
-    '130lbs',
-    '130m',
-    '130mjy',
-    '130ml',
-    '130mmcfd',
-    '130mph-plus',
-    '130pc',
-    '130s',
-    '130y',
-    '131&ins',
-    '131&ndash;133',
     '131&ndash;3',
-    '131&ndash;8',
-    '131,000,000',
-    '131,400',
-    '131,760',
-    '131-level',
-    '131-lot',
-    '131-mile',
-    '131-page',
-    '131.05',
-    '131.2p',
-    '131.50',
-    '131/3',
-    '131/86',
-    '1310&ndash;12',
-    '13100',
     '131040',
-    '1311&ndash;12',
-    '1312&ndash;15',
-    '1313&ndash;14',
-    '1313&ndash;16',
-    '1313&ndash;54',
-    '13130',
-    '13135',
-    '1313b38',
-    '1314&ndash;1347',
-    '1314&ndash;38',
-    '131440',
-    '1315&ndash;22',
-    '1315&ndash;23',
-    '1315&ndash;43',
-    '13152',
     '1316&ndash;17',
-    '1316&ndash;26',
-    '1316&ndash;40',
-    '1316&ndash;70',
-    '13161',
-    '131628',
-    '1317&ndash;2427',
-    '1317&ndash;25',
-    '131755',
-    '13177',
-    '1318&ndash;19',
-    '13180',
-    '131800',
-    '1319&ndash;44',
-    '1319&ndash;52',
-    '1319&ndash;73',
     '1319b',
-    '131mph',
-    '131st',
-    '132%',
-    '132&ndash;383',
-    '132&ndash;8',
-    '132&ndash;89',
-    '132,000-volt',
-    '132,726',
-    '132-135',
-    '132-strong',
-    '132.00',
-    '132.562',
-    '132.5p',
-    '132.889',
-    '132.8p',
     '1320&ndash;1',
-    '1320&ndash;2',
-    '13206',
-    '1321&ndash;2',
-    '1321&ndash;26',
-    '1322&ndash;3',
-    '1322&ndash;37',
-    '1322&ndash;7',
-    '13220',
-    '1323&ndash;1338',
-    '1323&ndash;1349',
-    '1323&ndash;30',
-    '1323&ndash;4',
-    '1323&ndash;82',
-    '1323.5',
-    '13239',
     '1324&ndash;6',
-    '1325&ndash;6',
-    '1326&ndash;31',
-    '1326/89',
-    '1327&ndash;52',
-    '1327&ndash;77',
-    '1328&ndash;1992',
-    '1328&ndash;47',
-    '1328&ndash;69',
-    '1328-.44',
-    '132:2',
-    '132a',
-    '132bp',
-    '132bpm',
-    '132ft',
-    '132g&ndash;h',
     '132gb',
-    '132mph',
-    '132pp',
-    '133&deg;w',
-    '133&middot;3',
-    '133&ndash;4,620',
-    '133&ndash;5',
-    '133&ndash;6',
-    '133&ndash;9',
-    '133&plus;5',
-    '133*',
-    '133,136',
-    '133,4,9',
-    '133,400',
-    '133,700',
-    '133,890,100',
     '133,951',
-    '133-282',
-    '133-member',
-    '133-page',
-    '133-run',
-    '133.3',
-    '133.504*',
-    '133.7',
-    '133/329',
-    '133/65',
-    '133/km&amp;sup2',
-    '1330&mdash;1350',
-    '1330&ndash;1411',
-    '1330&ndash;38',
-    '13300',
-    '1331&ndash;55',
     '13311kyr',
-    '1333&ndash;5',
-    '13333',
-    '1335&ndash;1395',
-    '133540',
-    '1336&ndash;7',
-    '133660',
-    '1337&ndash;1360',
-    '1337&ndash;1494',
-    '1337&ndash;41',
-    '1337&ndash;64',
-    '1337&ndash;8',
-    '133722/nx1337a',
-    '133772',
-    '1338&ndash;62',
-    '133828',
     '1339&ndash;40',
-    '1339&ndash;71',
-    '133b&ndash;e',
-    '133bhp',
-    '133lb.',
-    '133mb',
-    '133mm',
-    '133pp',
-    '133rd',
-    '134&ndash;135',
-    '134&ndash;136',
-    '134&ndash;137',
-    '134&ndash;150',
-    '134&ndash;8',
-    '134&plus;2',
-    '134&times;10/l',
     '134(5)',
-    '134,480',
-    '134-95',
-    '134-96',
-    '134-acre',
-    '134-page',
-    '134-year',
-    '134/l',
-    '1340&ndash;1425',
-    '13400',
-    '1341&ndash;1391',
-    '1341&ndash;2',
-    '1341&ndash;64',
-    '1342&ndash;1416',
-    '1342&ndash;1420',
-    '1342&ndash;3',
     '134213421342',
-    '13432',
-    '1344&ndash;5',
-    '1344213',
-    '1344m',
-    '1345&ndash;6',
-    '1345&ndash;7',
-    '13450',
-    '1347&ndash;80',
-    '1347\'',
-    '1348&ndash;50',
-    '1348&ndash;58',
-    '1348&ndash;9',
-    '1348/9',
-    '13480',
-    '134820',
     '1349&ndash;66',
-    '13490',
-    '134a.',
-    '134b/w',
-    '134cm',
-    '134f',
-    '134ff',
-    '134ft',
-    '134hp',
-    '134mhz',
-    '135%',
-    '135&deg;m/3.7',
-    '135&mdash;8',
-    '135&ndash;138',
-    '135&ndash;140',
-    '135&ndash;180',
     '135&ndash;2',
-    '135&ndash;41',
-    '135&ndash;45',
-    '135&ndash;46',
-    '135&ndash;5',
-    '135&ndash;6',
-    '135&ndash;68',
-    '135&ndash;799',
-    '135&ndash;87',
-    '135(1062)',
-    '135,502',
-    '135-1',
-    '135-10',
-    '135-150',
-    '135-34',
-    '135-man',
     '135-member',
-    '135-million-year-old',
-    '135-page',
-    '135.2',
-    '135.2%',
-    '135.5p.',
-    '1350&ndash;1',
-    '1350&ndash;1416',
-    '1350&ndash;1530',
-    '1350&ndash;5',
-    '1350,000',
-    '135000t',
-    '1350gns',
-    '1350mm',
-    '1351/h',
-    '135180',
     '1352&ndash;1336',
-    '13523',
-    '1353&ndash;91',
-    '13540',
-    '1355&ndash;1424',
-    '1355&ndash;71',
-    '1356&ndash;7',
-    '13568',
-    '1357.9.7.5.31',
-    '1358&ndash;9',
-    '13580',
-    '135850',
-    '1359/181',
-    '135a',
-    '135c&ndash;f',
-    '135f',
     '135ff.',
-    '135g',
-    '135h',
-    '135ha',
-    '135th.',
-    '136&amp;f',
-    '136&ndash;1',
-    '136&ndash;140',
-    '136&ndash;140cm',
-    '136&ndash;40',
-    '136&ndash;43',
-    '136&ndash;47',
-    '136&ndash;77',
-    '136&ndash;8/138&ndash;9',
-    '136(4)',
-    '136,421',
     '136,545',
-    '136-aminoacid',
-    '136-pin',
-    '136.5p',
-    '136.9',
-    '136.975',
-    '1360&ndash;1396',
-    '1360&ndash;1405',
-    '1360&ndash;2',
-    '1360&ndash;5',
-    '1360&ndash;78',
-    '1360cc',
-    '1361473',
-    '13625',
-    '136341',
-    '1364&ndash;1398',
     '1364&ndash;65',
-    '1364&ndash;89',
-    '13642',
-    '136450',
-    '13650',
-    '13660',
-    '1367&ndash;74',
-    '13670',
-    '13677-81',
-    '1368/9&ndash;1426',
-    '1368750',
-    '136:7',
-    '136bhp',
-    '136ff.',
-    '136mb',
-    '136mph',
     '136pp',
-    '137%',
-    '137&frac12',
-    '137&mdash;8',
-    '137&ndash;1',
-    '137&ndash;140',
-    '137&ndash;42',
-    '137,400',
-    '137,668',
-    '137,700',
-    '137-km',
-    '137-year',
-    '137-year-old',
-    '137.0',
-    '137.01p',
-    '137.035',
     '137.1',
-    '137.3%',
-    '137.5p',
-    '137.7',
-    '137/14',
-    '137/166',
-    '1371&mdash;90',
-    '1371&ndash;2',
-    '1371&ndash;6',
-    '13710',
-    '1373&ndash;4',
-    '1373-',
-    '1374&ndash;5',
-    '1375&ndash;1358',
-    '1375&ndash;6',
-    '1375&ndash;77',
     '1375&ndash;81',
-    '1375&ndash;95',
-    '1375&plusmn',
-    '1376&ndash;8',
-    '1376-1420',
-    '137640',
-    '1377&ndash;1485',
-    '1377-81',
-    '1377:1975',
-    '1378&ndash;1417',
-    '137a',
-    '137ft',
-    '137pc',
-    '137pp',
-    '137x183cm',
-    '138%',
     '138&ndash;139',
-    '138&ndash;142',
-    '138(1)&mdash',
-    '138(4)',
-    '138(8)',
-    '138(9)',
-    '138(9a)',
-    '138,000,000',
-    '138,317',
-    '138,379',
-    '138,400,000',
-    '138-106',
-    '138-8',
-    '138-82',
-    '138.5p.',
-    '138/499',
     '138/back',
-    '1380&ndash;1',
-    '1380&ndash;1000',
-    '1380&ndash;1400',
-    '1380&ndash;1472',
-    '1380/1',
-    '13800',
-    '1381&ndash;1394',
-    '1381&ndash;1453/58',
-    '1381&ndash;96',
-    '1382&ndash;1392',
-    '1382&ndash;18',
-    '1383&ndash;84',
-    '1384&ndash;5',
-    '1384&ndash;85',
-    '1385&ndash;1390',
     '1385&ndash;6',
-    '1385&ndash;95',
-    '13850',
-    '1386&ndash;88',
-    '13860',
-    '1387&ndash;1455',
-    '1387&ndash;8',
-    '1388&ndash;95',
-    '138800',
-    '138870',
-    '1389.',
-    '1389/90',
-    '138x200cm',
-    '139&ndash;1050',
-    '139&ndash;140',
-    '139&ndash;142',
     '139&ndash;270g',
-    '139&ndash;4',
-    '139&ndash;40',
-    '139&ndash;42',
-    '139&ndash;43',
-    '139&ndash;44',
-    '139&ndash;64',
-    '139(i)',
-    '139,400',
-    '139,517',
-    '139,700',
-    '139,959',
-    '139-141',
-    '139-3',
-    '139-run',
-    '139.',
     '139.0',
-    '139.2',
-    '139.33',
-    '139.5',
-    '139.7',
-    '139.9',
-    '139/533',
-    '1390&mdash;1406',
-    '1390&ndash;1490',
-    '1390&ndash;4',
-    '1390cc',
-    '1391&ndash;1353',
-    '1391&ndash;1447',
-    '1392/3',
-    '1393&ndash;1431',
-    '1393&ndash;1464',
     '1394&ndash;5',
-    '1395&mdash;96',
-    '13950',
-    '1396&ndash;1405',
-    '1396&ndash;1407',
-    '1396&ndash;1422',
-    '13960',
-    '1397&ndash;1403',
-    '1397&ndash;98',
-    '13971',
-    '1398/9',
-    '1398cc',
-    '1399&ndash;1400',
-    '139lbf',
-    '13:00&ndash;13:30.',
-    '13:00:48',
     '13:00:54',
-    '13:01:15',
-    '13:01:24',
-    '13:01:34',
-    '13:03:12',
-    '13:03:13',
-    '13:03:14',
-    '13:04:29',
-    '13:04:47',
-    '13:04:48',
-    '13:05',
-    '13:05:29',
-    '13:07:53',
-    '13:08:05',
-    '13:08:09',
-    '13:08:16',
     '13:08:39',
-    '13:09',
-    '13:09:53',
-    '13:1&ndash;16',
-    '13:1&ndash;17',
-    '13:1&ndash;8',
-    '13:10&ndash;15',
-    '13:10:31',
-    '13:11:08',
-    '13:11:22',
-    '13:12:08',
-    '13:13:55&ndash;0500',
-    '13:14:14',
-    '13:14:26&ndash;0500',
-    '13:14:34',
-    '13:14:46',
     '13:15&ndash;22',
-    '13:15:17',
-    '13:15:46',
-    '13:16:38',
-    '13:16f.',
-    '13:17:04',
-    '13:17:31',
-    '13:18&ndash;23',
-    '13:19',
-    '13:19:15',
-    '13:19:32',
-    '13:1ff',
-    '13:2,4',
-    '13:20',
-    '13:20:06&ndash;0500',
-    '13:21:04',
     '13:21:05',
-    '13:21:36',
-    '13:22',
-    '13:22.39',
-    '13:23:21',
-    '13:23:48',
-    '13:23:55',
-    '13:24:04',
-    '13:24:09',
-    '13:25&ndash;27',
-    '13:28:35',
-    '13:29',
-    '13:29:38',
-    '13:30:57',
-    '13:31&ndash;35',
-    '13:31:16',
     '13:32',
-    '13:32:34',
-    '13:34',
-    '13:34&ndash;35',
-    '13:35',
-    '13:35:25',
-    '13:37:01',
-    '13:37:33',
-    '13:37:45',
-    '13:37:50',
-    '13:38:01',
-    '13:38:53',
-    '13:39:00&ndash;0400',
-    '13:39:04',
-    '13:39:21',
-    '13:4',
     '13:4&ndash;8a',
-    '13:40:07',
-    '13:41',
-    '13:42:28',
-    '13:42:30',
-    '13:42:34',
-    '13:43',
-    '13:43:41',
-    '13:44:59',
-    '13:45',
-    '13:45:12',
-    '13:45:28',
-    '13:46',
-    '13:46:48',
-    '13:47',
-    '13:48:25',
     '13:48:58',
-    '13:49:38',
-    '13:49:40',
-    '13:49:52',
-    '13:49:58',
-    '13:50:27',
-    '13:50:28',
-    '13:53:34',
-    '13:53:48',
-    '13:55',
-    '13:56',
-    '13:56:05&ndash;0500',
-    '13:56:19',
-    '13:56:56',
-    '13:57:22',
-    '13:59:12',
     '13:6',
-    '13:6&ndash;9',
-    '13:7',
-    '13:7&ndash;8',
-    '13:8',
-    '13:9&ndash;13',
-    '13:linguistics',
-    '13_per',
-    '13cms',
-    '13dm',
-    '13ft-14ft',
-    '13inches',
-    '13kg',
-    '13km.',
-    '13km/',
-    '13km/8mls',
     '13l',
-    '13lbs',
-    '13mg',
-    '13min',
-    '13myr',
-    '13ozs.',
-    '13pts',
-    '13q',
-    '13q14',
-    '13sec',
-    '13th&ndash;14th',
-    '13th&ndash;16th',
-    '13th&ndash;19th',
-    '13th&rehy;seeded',
-    '13th-14th',
-    '13th-16thc',
     '13th-18th',
-    '13th-floor',
-    '13u',
-    '13v',
-    '13x',
-    '13x15inches',
-    '14&commat;1/2',
-    '14&commat;1/2-year',
-    '14&deg;dh',
-    '14&deg;f',
-    '14&divide;8.5',
-    '14&frac12;-year-olds',
-    '14&frac12;ins',
-    '14&frac12;l',
-    '14&frac12;oz',
-    '14&frac12;p',
     '14&frac14&ins&times;14&frac14&ins',
-    '14&frac34&ins',
-    '14&frac34;in',
-    '14&frac34;lb',
-    '14&ins&times;13.5&ins',
-    '14&ins&times;16&ins',
-    '14&mdash;066',
-    '14&mdash;15',
-    '14&mdash;19',
-    '14&mdash;21',
-    '14&mdash;24',
-    '14&middot;2x29cm',
-    '14&ndash;03',
-    '14&ndash;04',
-    '14&ndash;12&ndash;0',
-    '14&ndash;14.5ael',
     '14&ndash;15&ndash;0',
-    '14&ndash;15,000',
-    '14&ndash;15m',
-    '14&ndash;16-year',
-    '14&ndash;16-year-old',
-    '14&ndash;16th',
-    '14&ndash;17%',
-    '14&ndash;17-year-olds',
-    '14&ndash;18c',
-    '14&ndash;18ft',
-    '14&ndash;20%',
-    '14&ndash;21.',
-    '14&ndash;25%',
-    '14&ndash;27/1s',
-    '14&ndash;28',
-    '14&ndash;29',
     '14&ndash;30',
-    '14&ndash;331',
-    '14&ndash;35',
-    '14&ndash;4&ndash;0',
-    '14&ndash;46',
-    '14&ndash;5&ndash;1844',
-    '14&ndash;5&ndash;1863',
-    '14&ndash;54',
-    '14&ndash;56',
-    '14&ndash;76',
-    '14&ndash;81',
-    '14&ndash;83',
-    '14&ndash;9',
-    '14&ndash;aug',
-    '14&ndash;oct',
-    '14&plus',
     '14&plus;1',
-    '14&shilling',
-    '14&sol;77',
-    '14&times;19&frac12&ins',
-    '14\'w',
-    '14(13)',
-    '14(2)&mdash',
-    '14(3)-(4)',
-    '14(5)',
-    '14(a)',
-    '14(c)',
-    '14,000ft',
-    '14,000gns',
-    '14,000m2',
-    '14,000rpm',
-    '14,014',
     '14,016,000',
-    '14,026',
-    '14,033',
-    '14,040,000',
-    '14,080',
-    '14,087',
-    '14,091,034',
-    '14,102',
-    '14,116',
-    '14,120',
-    '14,145,163',
-    '14,15,48',
-    '14,17,18,20,21,25,29',
-    '14,177ft/4321m',
-    '14,191',
-    '14,192',
     '14,1942',
-    '14,200,000',
-    '14,203',
-    '14,22,23',
-    '14,224',
-    '14,250',
-    '14,300',
-    '14,322',
-    '14,330',
-    '14,333',
-    '14,372',
-    '14,4',
-    '14,400ft',
-    '14,42',
-    '14,425,000',
-    '14,450',
     '14,467',
-    '14,469',
-    '14,470',
-    '14,521',
-    '14,530',
-    '14,544',
-    '14,550',
-    '14,616',
-    '14,647',
-    '14,664ft',
-    '14,688',
-    '14,719',
-    '14,724',
-    '14,732',
-    '14,737',
-    '14,760,000',
     '14,762',
-    '14,8',
-    '14,825,013',
-    '14,826,616',
-    '14,852',
-    '14,859',
-    '14,900',
-    '14,906',
-    '14,910',
-    '14,912',
-    '14,948',
-    '14,958',
-    '14,967,000',
-    '14,976',
-    '14,989',
-    '14-11',
     '14-12-12',
-    '14-16cm',
-    '14-23',
-    '14-29-year-olds',
-    '14-5',
-    '14-aircraft',
-    '14-amino',
-    '14-and-a-half',
-    '14-and-under',
-    '14-ball',
-    '14-bank',
-    '14-bedroomed',
-    '14-berth',
-    '14-bit',
-    '14-carat',
-    '14-coach',
     '14-country',
-    '14-days',
-    '14-eicosatetraenoic',
-    '14-er',
-    '14-footer',
-    '14-gallon',
-    '14-game',
-    '14-group',
-    '14-h',
-    '14-handicapper',
-    '14-hours',
-    '14-kilometre',
-    '14-km-wide',
-    '14-line',
-    '14-match',
-    '14-megawatt',
     '14-mer',
-    '14-months-old',
-    '14-part',
-    '14-person',
-    '14-piece',
-    '14-pin',
-    '14-place',
-    '14-portion',
-    '14-run',
-    '14-stage',
-    '14-tonne',
-    '14-tracker',
-    '14-under',
-    '14-under-par',
-    '14-watt',
-    '14-year&rehy;old',
     '14-year-girl',
-    '14-year-long',
-    '14.0&ndash;0',
-    '14.00&ndash;17.00.',
-    '14.00&ndash;19.00',
-    '14.00&ndash;21.00',
-    '14.003',
-    '14.03',
-    '14.04',
-    '14.04p',
-    '14.0c',
-    '14.1&ndash;17.9',
-    '14.10.',
-    '14.10sec',
-    '14.11&ndash;12',
-    '14.11.3',
     '14.11.4',
-    '14.11.5',
-    '14.11.8',
-    '14.12.93',
-    '14.14',
-    '14.15&ndash;14.30',
-    '14.15.3',
-    '14.18',
-    '14.19',
-    '14.1fl',
-    '14.1hh',
-    '14.1oz',
-    '14.1pc',
-    '14.2-m',
-    '14.2-point',
-    '14.2.7',
     '14.2.8',
-    '14.2.85/21.2.85',
-    '14.21',
-    '14.22',
-    '14.23',
-    '14.24%',
-    '14.25%',
-    '14.255',
-    '14.26',
-    '14.26a',
-    '14.26b',
-    '14.2ghz',
-    '14.2ms',
-    '14.3&ins',
-    '14.3&percnt',
-    '14.3.1991',
     '14.30&ndash;15.30',
-    '14.30&ndash;17.00',
-    '14.31',
-    '14.32',
-    '14.33%',
-    '14.33a',
-    '14.33b',
-    '14.33c',
-    '14.34a',
-    '14.34b',
-    '14.34c',
-    '14.34d',
-    '14.36',
-    '14.38',
-    '14.3hh',
-    '14.3pc',
     '14.3secs',
-    '14.4.4',
-    '14.40p',
-    '14.41',
-    '14.45pc',
-    '14.4c',
-    '14.4kbps',
-    '14.4kbs',
-    '14.4mpg',
-    '14.4pc',
-    '14.5&ndash;22%',
-    '14.5-5.5',
-    '14.5.4',
-    '14.514.11',
-    '14.52',
-    '14.56',
     '14.57',
-    '14.59',
-    '14.5khz',
-    '14.5km()',
-    '14.5p',
-    '14.5pc',
-    '14.5pstg.',
-    '14.6(a)',
-    '14.6.1',
-    '14.6.2',
-    '14.6.3',
-    '14.6.5',
-    '14.6.6',
-    '14.6.7',
-    '14.6.92',
-    '14.64',
     '14.67',
-    '14.69',
-    '14.6p',
-    '14.7&mdash;14.10',
-    '14.7(a)',
-    '14.7.4',
-    '14.7.6',
-    '14.7.8',
-    '14.7.9',
-    '14.74',
-    '14.75%',
-    '14.76',
-    '14.77r.',
-    '14.79%',
-    '14.7k',
-    '14.7m',
     '14.7mg',
-    '14.8&mdash;10',
-    '14.8-',
-    '14.8.1',
-    '14.8.2',
-    '14.8.3',
-    '14.8.4',
-    '14.8.5',
-    '14.8.6',
-    '14.8.89',
-    '14.81',
-    '14.85p',
-    '14.878',
-    '14.8cm',
-    '14.8secs',
-    '14.9.1',
     '14.9.3',
-    '14.9.4',
-    '14.93.4',
-    '14.95%',
-    '14.96',
-    '14.99p',
-    '14.9p',
-    '14.9pc',
-    '14.9secs',
-    '14.e.iii',
-    '14/',
-    '14/05/93',
-    '14/1',
-    '14/10',
-    '14/100000/year',
-    '14/11/1981',
     '14/11/91',
-    '14/158',
-    '14/16',
-    '14/161',
-    '14/16th',
-    '14/17',
-    '14/180',
-    '14/23',
-    '14/29b',
-    '14/300',
-    '14/335',
-    '14/4/41',
-    '14/4/65',
-    '14/4/93',
-    '14/40',
-    '14/5/41',
     '14/5/92&ndash;17/5/92',
-    '14/592,26/604,54/632,59/637',
-    '14/6',
-    '14/83',
-    '14/86',
-    '14/9/90',
-    '14/91',
-    '14/98',
-    '140&deg;c',
-    '140&deg;c.',
-    '140&ndash;10001',
-    '140&ndash;1500',
-    '140&ndash;150cm',
-    '140&ndash;170',
-    '140&ndash;200g',
-    '140&ndash;202',
     '140&ndash;41',
-    '140&ndash;73',
-    '140&ndash;80',
-    '140&ndash;9',
-    '140&rehy;strong',
-    '140,000-square-foot',
-    '140-',
-    '140-160',
-    '140-4',
-    '140-beats-per-minute',
-    '140-metre',
-    '140-odd',
-    '140-page',
-    '140-strong',
-    '140-yard',
-    '140.0',
     '140.19',
-    '140.5',
-    '140.5p',
-    '140.8',
-    '140.9',
-    '140/144',
-    '140/90',
-    '1400&ndash;1800',
-    '1400&ndash;1830',
-    '1400&ndash;2',
-    '1400-1600',
-    '1400-feet',
-    '1400-ft',
-    '1400-km',
-    '1400/01',
-    '14000&ndash;17000',
     '14000hz',
-    '140010',
-    '14003',
-    '14004',
-    '140049',
-    '1400ft',
-    '1400gns',
-    '1400hz',
-    '1400kcal',
-    '1400kg',
-    '1400km',
-    '1400mm',
-    '1401&ndash;1405',
-    '1401&ndash;2',
-    '1402&ndash;19',
-    '1403/981',
     '1405&ndash;1450',
-    '1405-january',
-    '1405/6',
-    '14051&ndash;0430',
-    '1406&ndash;37',
-    '1406&ndash;7',
-    '1407&ndash;24',
-    '1407&ndash;9',
-    '1408/9',
-    '1409&ndash;14',
-    '140a',
-    '140bp',
-    '140bpm',
-    '140dobson',
-    '140f',
-    '140g',
     '140km',
-    '140mbps',
-    '140mhz',
-    '140mhz-200mhz',
-    '140ms',
-    '140ps',
-    '140s',
-    '140x140cm',
-    '141%',
-    '141&deg;c',
-    '141&mdash;8.',
-    '141&ndash;1200m',
-    '141&ndash;143',
-    '141&ndash;145',
-    '141&ndash;221',
-    '141&ndash;3mph',
     '141&ndash;42',
-    '141&ndash;72',
-    '141&ndash;75',
-    '141&ndash;9',
-    '141&ndash;92',
-    '141(2)',
-    '141,344.97',
-    '141,377',
-    '141,471',
-    '141,530',
-    '141-',
-    '141-4',
-    '141.02p',
-    '141.25',
-    '141.2p',
-    '141.4p',
     '141.74',
-    '141/1333',
-    '141/2',
-    '1410&ndash;11',
-    '1410&ndash;1482',
-    '1410&ndash;1700',
-    '1410&ndash;2282',
-    '1410&ndash;5280',
-    '1410/11',
-    '1410m',
-    '1411&ndash;0',
-    '14117',
-    '1412.',
-    '1412/13',
-    '1413&ndash;14',
-    '1413/14',
     '1413/5',
-    '1414&ndash;18',
-    '1414/15',
-    '1415&ndash;1450',
-    '1415&ndash;16,1430&ndash;31',
-    '1416&ndash;17',
-    '1416&ndash;45',
-    '1416&ndash;46',
-    '14180',
-    '14181-84',
-    '1419&ndash;20',
-    '14190',
-    '141b',
-    '141cm',
-    '141gb',
-    '141m',
     '141mph',
-    '141s',
-    '142&frac12',
-    '142&ndash;147cm',
-    '142&ndash;5',
-    '142&ndash;52',
-    '142&ndash;57',
-    '142&ndash;7',
-    '142&ndash;9',
-    '142&plus;1',
-    '142&plus;3',
-    '142&plus;9',
-    '142(1)',
-    '142,723',
-    '142-point',
-    '142.7',
     '1420&ndash;30',
-    '1420&ndash;50',
-    '14200',
-    '14205',
-    '14206',
-    '142073',
-    '1421&ndash;22',
-    '1421&ndash;3',
-    '1421&ndash;30',
-    '14210',
-    '1422&ndash;1453',
-    '1424&ndash;1542',
-    '1424&ndash;2512,232',
-    '14249-51',
-    '1425&ndash;1935',
-    '1425&ndash;75',
     '14250-51',
-    '1425w',
-    '1427',
-    '1427&ndash;56',
-    '14270',
-    '1428&ndash;29',
-    '14282',
-    '14288',
-    '1429&ndash',
-    '1429&ndash;30,1437&ndash;38',
-    '142920',
-    '1429k',
-    '1429mph',
-    '142cm/130cm',
-    '142in',
-    '142ml',
     '142nd',
-    '142nm',
-    '142x140cm',
-    '143%',
-    '143&ndash;144',
-    '143&ndash;150',
-    '143&ndash;242',
-    '143&ndash;50',
-    '143&ndash;56',
-    '143&ndash;7',
-    '143&ndash;74',
-    '143&ndash;9',
-    '143(1)',
-    '143,100',
-    '143,115',
-    '143,1224',
     '143,323',
-    '143,380',
-    '143,500',
-    '143,583',
-    '143,826',
-    '143-member',
-    '143.',
-    '143.0',
-    '143.16p',
-    '143.2%',
-    '143.386',
-    '143.44',
-    '143.5%',
-    '143.6',
-    '143/4p',
-    '143/77',
     '143/margins',
-    '1430&ndash;1',
-    '1430-c.',
-    '143022',
-    '143056',
-    '14307',
-    '1431&ndash;76',
-    '14320',
-    '1433&ndash;99',
-    '14331',
-    '1434&ndash;1489',
-    '1435&ndash;9',
-    '1438&ndash;39',
-    '14396',
-    '143968',
-    '143bhp/ton',
     '143k',
-    '143s',
-    '144&ndash;145',
-    '144&ndash;146',
-    '144&ndash;5',
-    '144&ndash;51',
-    '144&ndash;58',
-    '144&ndash;6',
-    '144&ndash;7',
-    '144&ndash;76',
-    '144&ndash;8',
-    '144(1)',
-    '144(2)',
-    '144,240',
-    '144,369,000',
-    '144,950',
     '144-639',
-    '144-pin',
-    '144.',
-    '144.0',
-    '144.1',
-    '144.4%',
-    '144.4p',
-    '144.5',
-    '144.6',
-    '144.8',
-    '144.9',
-    '1440&ndash;1508',
-    '1440&ndash;50',
-    '1440-1740',
-    '14400',
-    '1441h',
     '1444&ndash;49',
-    '1444&ndash;5',
-    '144428',
-    '1446&ndash;1515',
-    '1447',
-    '1447.',
-    '14470',
-    '1448&ndash;49',
-    '1448&ndash;9',
-    '1449&ndash;50',
-    '14490-14141',
-    '144d',
-    '144ff',
-    '144mb',
-    '144mm',
-    '144p.',
     '144pp.',
-    '144s',
-    '145&deg;c',
-    '145&deg;f',
-    '145&ndash;1700',
-    '145&ndash;213',
-    '145&ndash;50',
-    '145&ndash;7',
-    '145&ndash;8',
-    '145&ndash;9',
-    '145&plus;6',
-    '145(1)',
-    '145(2)',
-    '145,000+',
-    '145,000,000',
-    '145,140',
     '145,200',
-    '145-',
-    '145-90',
-    '145-day',
-    '145-horsepower',
-    '145-member',
-    '145-office',
-    '145.25',
-    '145.5p',
-    '145.825',
-    '145/3/30',
-    '145/87',
-    '1450&ndash;1515',
-    '1450&ndash;1524',
-    '1450&ndash;1530',
-    '1450&ndash;60',
     '1450&ndash;61',
-    '1450-1700',
-    '14500',
-    '145000',
-    '145065',
-    '1450bp',
-    '1451&ndash;81',
-    '1454.3',
-    '1455&ndash;60',
-    '1456&ndash;8',
-    '1457&ndash;1557',
-    '14570',
-    '145a&ndash;h',
-    '145ff.',
-    '145ft',
-    '145hp',
     '145lb',
-    '145pc',
-    '145pp.',
-    '145x180cm',
-    '146%',
-    '146&mdash;7',
-    '146&mdash;82',
-    '146&ndash;147',
-    '146&ndash;150',
-    '146&ndash;4',
-    '146&ndash;51',
-    '146&ndash;80',
-    '146&ndash;9',
-    '146(3)',
-    '146,400',
-    '146,600',
     '146,700',
-    '146-link',
-    '146-long',
-    '146-page',
-    '146-qt',
-    '146.022.4gm',
-    '146.169.2.1',
-    '146.2p',
-    '146.5',
-    '146.5p.',
-    '146.6m',
-    '146.88',
-    '146/342',
-    '146/724',
-    '146/train',
-    '1460&ndash;1527',
     '1460&ndash;70',
-    '1460-m',
-    '1461&ndash;83',
-    '14617',
-    '1463/90',
-    '1465&ndash;1527',
-    '1465&ndash;66',
-    '1465\'',
-    '14670',
-    '1468&ndash;1504',
-    '1468&ndash;88',
-    '146e',
-    '146f',
-    '146s',
-    '147&mdash;8',
-    '147&mdash;and',
     '147&ndash;160',
-    '147&ndash;6',
-    '147&ndash;61',
-    '147&ndash;63',
-    '147&ndash;68',
-    '147&ndash;7',
-    '147&ndash;9',
-    '147,034',
-    '147,040',
-    '147,386,000',
-    '147,950',
-    '147.24p',
-    '147.5p',
-    '147.7%',
-    '147.75p',
-    '147/149',
     '1470&ndash;1380',
-    '1471&ndash;72',
-    '1472&ndash;1553',
-    '1473&ndash;1543',
-    '1474&ndash;7',
-    '1475&ndash;1509',
-    '1475&ndash;1564',
-    '1475&ndash;1640',
-    '1475&ndash;1900',
-    '1475&ndash;9',
-    '1475-:83',
-    '1475/801528',
-    '14750',
-    '1476&ndash;1477',
-    '1476&ndash;1499',
-    '1476&ndash;1516',
     '1476&ndash;85',
-    '1476/7',
-    '14760',
-    '1477&ndash;8',
-    '1477.',
-    '1478&ndash;2170',
-    '1479&ndash;1565',
-    '147bhp',
-    '147i',
-    '147lb',
-    '147p',
-    '147vote',
-    '147x147cm',
-    '148&mdash;9',
-    '148&ndash;53',
-    '148&ndash;70',
     '148&ndash;71',
-    '148&ndash;75',
-    '148&ndash;8',
-    '148,000',
-    '148,263',
-    '148,463',
-    '148,500',
-    '148,754',
-    '148-115',
-    '148-seat',
-    '148.0',
-    '148.2',
-    '148.5p',
-    '148/88',
-    '148/89',
-    '1480&ndash;1',
     '1480&ndash;1500',
-    '1480&ndash;1660',
-    '1480&ndash;c.',
-    '1481&ndash;1504',
-    '1482&ndash;1485',
-    '1482&ndash;1519',
-    '1482&ndash;83',
-    '1482&ndash;90',
-    '1483&ndash;1520',
-    '1483&ndash;1530',
-    '1483&ndash;5',
-    '1484&ndash;1531',
-    '1485&ndash',
-    '1485&ndash;1507',
-    '1485&ndash;1544',
-    '1485&ndash;1566',
     '1485&ndash;90',
-    '1485-1509',
-    '1486&ndash;1559',
-    '1486&ndash;c.',
-    '14866',
-    '1487&ndash;after',
-    '1487.07',
-    '148788',
-    '1488&mdash;1513',
-    '1488&mdash;1542',
-    '1488&ndash;1534',
-    '1488&ndash;1561',
-    '1488&ndash;90',
-    '1489&ndash;1552',
-    '1489&ndash;1556',
-    '1489&ndash;1794',
     '148e',
-    '148ff',
-    '148mm',
-    '148mph',
-    '148p.',
-    '148pp',
-    '148pp.',
-    '148th',
-    '149&ndash;150',
-    '149&ndash;166',
-    '149&ndash;50/151&ndash;2',
-    '149&ndash;58',
-    '149&ndash;7',
-    '149\'ers',
-    '149,990',
-    '149-aircraft',
     '149.02p',
-    '149.76p',
-    '149/151',
-    '149/727',
-    '1490&ndash;1545',
-    '1490&ndash;1546',
-    '1490&ndash;1548',
-    '1490&ndash;1550',
-    '1490&ndash;1554',
-    '1490&ndash;1555',
-    '1490&ndash;1557',
-    '1490&ndash;1562',
-    '1490&ndash;1940',
-    '1490&ndash;5',
-    '1490&ndash;post',
-    '1490/1',
     '14900',
-    '1491&ndash;1525',
-    '1491&ndash;1556',
-    '1492&ndash;1558',
-    '1492&ndash;1992',
-    '1493&ndash;1541',
-    '1493&ndash;1548',
-    '1493-',
-    '14930',
-    '1494-',
-    '149430',
-    '1495&ndash;1528',
-    '1495&ndash;1541',
-    '1495&ndash;1544',
-    '1495&ndash;1545',
-    '1495&ndash;1562',
     '1495-96',
-    '1495bc',
-    '1496&ndash;1544',
-    '1496&ndash;1570',
-    '14960',
-    '1496cc',
-    '1496kg',
-    '1497&ndash;1543',
-    '1497&ndash;1552',
-    '1497&ndash;1560',
-    '1497&ndash;98',
-    '149730',
-    '1498&ndash;1579',
-    '14980',
-    '14987',
-    '149870',
     '14988',
-    '1499&ndash;1546',
-    '149950',
-    '149cm',
-    '149e',
-    '149ff',
-    '149ff.',
-    '149mm',
-    '14:00',
-    '14:00:21',
-    '14:01:25',
-    '14:02',
-    '14:02:17',
-    '14:02:42',
-    '14:03:29',
-    '14:03:32',
     '14:05:10',
-    '14:06:09',
-    '14:06:57',
-    '14:07',
-    '14:07:05',
-    '14:07:08',
-    '14:07:11',
-    '14:08:01',
-    '14:08:23',
-    '14:09',
-    '14:09:20',
-    '14:09:28',
-    '14:09:34',
-    '14:09:38',
-    '14:09:51',
-    '14:1&ndash;2',
     '14:10:03',
-    '14:11:30',
-    '14:11:39',
-    '14:12',
-    '14:12&ndash;16',
-    '14:12:04',
-    '14:12:36',
-    '14:13',
-    '14:13:18',
-    '14:14:06',
-    '14:15',
-    '14:15&ndash;18',
-    '14:15&ndash;24',
-    '14:15-17',
-    '14:15:34',
-    '14:15:37',
     '14:15ff.',
-    '14:16',
-    '14:16:02',
-    '14:16:18',
-    '14:16:25',
-    '14:16:30',
-    '14:16:32',
-    '14:17&ndash;21',
-    '14:17,18,21,23',
-    '14:17:05',
-    '14:17:21',
-    '14:17:31',
-    '14:17:46',
-    '14:18:09',
-    '14:18:19',
-    '14:18:32',
     '14:18:52',
-    '14:18:57',
-    '14:19',
-    '14:19:23',
-    '14:2',
-    '14:20:43',
-    '14:21&ndash;24',
-    '14:21:17',
-    '14:21:20',
-    '14:22&ndash;16:4',
-    '14:22:24',
-    '14:23&ndash;9',
-    '14:25',
-    '14:25&ndash;7',
-    '14:26&ndash;31',
-    '14:26:36',
     '14:26:39',
-    '14:26:55',
-    '14:28&ndash;31',
-    '14:28.75',
-    '14:28:54',
-    '14:29',
-    '14:29:44',
-    '14:3',
-    '14:3&ndash;9',
-    '14:30:01',
-    '14:30:28',
-    '14:30:39',
-    '14:30:50&ndash;0500',
-    '14:31',
-    '14:31:30',
-    '14:31:32',
     '14:31:41',
-    '14:32&ndash;33',
-    '14:32&ndash;42',
-    '14:33',
-    '14:33:25',
-    '14:33:52',
-    '14:34',
-    '14:34ff.',
-    '14:35:34',
-    '14:35:45',
-    '14:35:48',
-    '14:36:01',
-    '14:36:21',
-    '14:37',
-    '14:37:20',
-    '14:38',
     '14:38:16&ndash;0600',
-    '14:39',
-    '14:39:00',
-    '14:39:20',
-    '14:39:37',
-    '14:3f',
-    '14:40',
-    '14:40:20',
-    '14:41:50',
-    '14:42',
-    '14:43&ndash;52',
-    '14:43:07',
-    '14:43:21',
-    '14:43:26',
-    '14:43:39',
-    '14:43:44',
     '14:43:46',
-    '14:43:57',
-    '14:45',
-    '14:45.12',
-    '14:45:15',
-    '14:45:23',
-    '14:46',
-    '14:47:35',
-    '14:48:04',
-    '14:48:27',
-    '14:49:48',
-    '14:51',
-    '14:51:12',
-    '14:51:22',
-    '14:51:31',
-    '14:52',
     '14:52:08',
-    '14:53',
-    '14:53&ndash;65',
-    '14:53:53',
-    '14:54:13',
-    '14:54:28',
-    '14:54:46',
-    '14:55:10',
-    '14:55:52',
-    '14:56&ndash;7',
-    '14:56:05',
-    '14:56:45',
-    '14:56:54',
-    '14:57:38',
-    '14:57:59',
-    '14:58.0',
     '14:58:43',
-    '14:59',
-    '14:59:27',
-    '14:6&ndash;15',
-    '14:6,17',
-    '14:62',
-    '14:65',
-    '14:66&ndash;72',
-    '14:6ff.',
-    '14:7',
-    '14car.ii.c.',
-    '14days',
-    '14f',
-    '14fl',
-    '14ft-deep',
-    '14ft.',
     '14g/t',
-    '14gb',
-    '14inch',
-    '14inches',
-    '14july',
-    '14kpc',
-    '14l',
-    '14ma',
-    '14ma/150',
-    '14may',
-    '14mb',
-    '14mg',
-    '14mile',
-    '14mins',
-    '14month',
-    '14mpg',
     '14mw',
-    '14myr',
-    '14oz&ndash;1lb',
-    '14oz.',
-    '14pm',
-    '14pp',
-    '14pt',
-    '14r',
-    '14s.6d',
-    '14te',
-    '14th-21st',
-    '14th-26th',
-    '14th-minute',
-    '14th-ranked',
-    '14th-safest',
-    '14th/15th',
     '14th/15th-century',
-    '14th/15th.',
-    '14tzd',
-    '14v12&ndash;17',
-    '14w',
-    '14x10',
-    '14year-old',
-    '14year-olds',
-    '15%-10%',
-    '15%-55%',
-    '15%l',
-    '15&deg;f',
-    '15&deg;gh',
-    '15&formula',
-    '15&frac12;-inch',
-    '15&frac12;in',
     '15&frac14',
-    '15&frac34;in',
-    '15&frac78',
-    '15&mdash;17',
-    '15&mdash;20',
-    '15&mgr;g',
-    '15&mgr;ms',
-    '15&mgr;s',
-    '15&ndash&frac12&times;11in',
-    '15&ndash;1&ndash;0',
-    '15&ndash;10&ndash;0',
-    '15&ndash;100',
-    '15&ndash;11',
-    '15&ndash;11&ndash;0',
-    '15&ndash;110',
-    '15&ndash;119',
     '15&ndash;12%',
-    '15&ndash;15',
-    '15&ndash;16&deg;c',
-    '15&ndash;16/2/41',
-    '15&ndash;16/3/41',
-    '15&ndash;168',
-    '15&ndash;18m',
-    '15&ndash;20&deg;c',
-    '15&ndash;20,000',
-    '15&ndash;20-',
-    '15&ndash;20-year-olds',
-    '15&ndash;20c',
-    '15&ndash;20ft',
-    '15&ndash;20g',
-    '15&ndash;20th',
-    '15&ndash;24-year&rehy;olds',
     '15&ndash;25-year-old',
-    '15&ndash;27%',
-    '15&ndash;28&deg;w',
-    '15&ndash;29',
-    '15&ndash;3&ndash;0',
-    '15&ndash;30,000hz',
-    '15&ndash;30mm',
-    '15&ndash;35',
-    '15&ndash;35-year-old',
-    '15&ndash;41%',
-    '15&ndash;45',
-    '15&ndash;46',
-    '15&ndash;48',
-    '15&ndash;5&ndash;0',
-    '15&ndash;50%',
-    '15&ndash;54',
     '15&ndash;57',
-    '15&ndash;58',
-    '15&ndash;59',
-    '15&ndash;5o',
-    '15&ndash;60',
-    '15&ndash;62',
-    '15&ndash;7&ndash;1882',
-    '15&ndash;70%',
-    '15&ndash;72',
-    '15&ndash;78',
-    '15&ndash;80%',
-    '15&ndash;april',
-    '15&ndash;dec',
-    '15&ndash;july',
-    '15&ndash;nov',
-    '15&ndash;thu',
     '15&plus;1',
-    '15&plus;2',
-    '15&plus;3',
-    '15&rehy;year-old',
-    '15&shilling;10d.',
-    '15&times;22&frac12',
-    '15&times;36',
-    '15\'s',
-    '15(-)',
-    '15(1)&mdash',
-    '15(15)',
-    '15(18)',
-    '15(5)',
-    '15(a)',
-    '15(a)&mdash;information',
-    '15(b)',
     '15(b)&mdash;complaints',
-    '15(c)&mdash;general',
-    '15(inclusive)',
-    '15+8+6+7',
-    '15,00',
-    '15,000&ndash;1',
-    '15,000-20,000',
-    '15,000-odd',
-    '15,000-plus',
-    '15,000-rouble',
-    '15,000-ton',
-    '15,000-unit',
-    '15,000.00',
-    '15,000ff',
-    '15,000ft',
-    '15,000gns',
     '15,000kg',
-    '15,000rpm',
-    '15,001',
-    '15,005',
-    '15,012',
-    '15,032km',
-    '15,042',
-    '15,100,000',
-    '15,105',
-    '15,118',
-    '15,122',
-    '15,136',
-    '15,168',
-    '15,18,21',
-    '15,20',
-    '15,240,000',
     '15,257',
-    '15,28',
-    '15,29',
-    '15,291',
-    '15,300',
-    '15,310',
-    '15,328',
-    '15,334,000',
-    '15,357,000',
-    '15,358',
-    '15,360',
-    '15,360,000',
-    '15,361',
-    '15,372',
-    '15,430',
-    '15,442',
     '15,446',
-    '15,493',
-    '15,500,000',
-    '15,500-ton',
-    '15,529',
-    '15,536',
-    '15,547',
-    '15,551',
-    '15,618',
-    '15,623',
-    '15,636,000',
-    '15,648',
-    '15,670',
-    '15,694',
-    '15,698',
-    '15,700,000',
     '15,716',
-    '15,728',
-    '15,739.4',
-    '15,748ft',
-    '15,762',
-    '15,771ft',
-    '15,796',
-    '15,8',
-    '15,888',
-    '15,895',
-    '15,920',
-    '15,931',
-    '15,949',
-    '15-16,000,000',
-    '15-18-year-olds',
-    '15-2',
     '15-20,000,000',
-    '15-20ft',
-    '15-22',
-    '15-26',
-    '15-29',
-    '15-59',
-    '15-70cm',
-    '15-amp',
-    '15-article',
-    '15-aug',
-    '15-bedroom',
-    '15-bill',
-    '15-centimetre',
-    '15-cert',
-    '15-date',
-    '15-deep',
     '15-denier',
-    '15-er',
-    '15-feet-high',
-    '15-footer',
-    '15-for-34',
-    '15-ft',
-    '15-game',
-    '15-gun',
-    '15-handicapper',
-    '15-hundredweight',
-    '15-hydroperoxide',
-    '15-hydroxy',
-    '15-in',
-    '15-inch-radius',
-    '15-incher',
-    '15-km',
     '15-megaton',
-    '15-miles',
-    '15-night',
-    '15-note',
-    '15-over',
-    '15-partner',
-    '15-per-cent',
-    '15-piece',
-    '15-pint',
-    '15-plus',
-    '15-pound',
-    '15-race',
-    '15-republic',
-    '15-s',
-    '15-scriptwriters',
-    '15-series',
     '15-square-feet',
-    '15-teacher',
-    '15-track',
-    '15-unit',
-    '15-watt',
-    '15-way',
-    '15-week-old',
-    '15-word',
-    '15-year&rehy;old',
-    '15-year-old/lorna',
-    '15.0&divide;2',
-    '15.04',
-    '15.043',
-    '15.04p',
-    '15.06',
-    '15.08',
     '15.09p',
-    '15.1&ndash;2',
-    '15.1&ndash;4&ndash;39&ndash;5',
-    '15.1.1',
-    '15.1.2',
-    '15.1.63',
-    '15.10.1',
-    '15.10.2',
-    '15.10.3',
-    '15.10.5',
-    '15.10.6',
-    '15.10.92',
-    '15.11.2',
-    '15.11.3',
-    '15.11.4',
-    '15.11.5',
     '15.11.89',
-    '15.14%',
-    '15.16&ndash;72',
-    '15.17',
-    '15.17.18',
-    '15.18',
-    '15.19&ndash;24',
-    '15.1c',
-    '15.2&times;19.7',
-    '15.2&times;20.3',
-    '15.2.4',
-    '15.2.5',
-    '15.2.6',
-    '15.20%',
-    '15.20&ndash;21',
-    '15.20sec',
     '15.22&ndash;7',
-    '15.22ff',
-    '15.25%',
-    '15.25&ndash;6',
-    '15.27f',
-    '15.28',
-    '15.28&ndash;31',
-    '15.288a.',
-    '15.2hh',
-    '15.2khz',
-    '15.2oz',
-    '15.3&ndash;4&ndash;21&ndash;5',
-    '15.3.5',
-    '15.32',
-    '15.33',
-    '15.36',
     '15.36p',
-    '15.37',
-    '15.39',
-    '15.3p',
-    '15.4&mdash;15.9',
-    '15.4&ndash;59.0',
-    '15.4,5',
-    '15.4.1',
-    '15.4.1(3)',
-    '15.4.1.2',
-    '15.4.12',
-    '15.4.2',
-    '15.4.89',
-    '15.4.92',
-    '15.40',
-    '15.42',
     '15.43',
-    '15.44',
-    '15.48&deg;c',
-    '15.49',
-    '15.4cu',
-    '15.4m',
-    '15.5&deg',
-    '15.5&deg;c',
-    '15.5&ndash;37.0',
-    '15.5&times;10/l',
-    '15.5.',
-    '15.5.1',
-    '15.5.3',
-    '15.5.5',
-    '15.5.7',
-    '15.53',
     '15.54',
-    '15.55',
-    '15.56',
-    '15.57',
-    '15.5bn',
-    '15.5m',
-    '15.5p/litre',
-    '15.6.1',
-    '15.6.2',
-    '15.6.4',
-    '15.6.5&mdash;7',
-    '15.6.6',
-    '15.6.7',
-    '15.6.8',
-    '15.6.89',
-    '15.6.90',
     '15.60',
-    '15.63',
-    '15.65%',
-    '15.680.3',
-    '15.6mg',
-    '15.6mpg',
-    '15.7.1',
-    '15.7.2',
-    '15.7.3',
-    '15.7.4',
-    '15.7.5',
-    '15.7.86',
-    '15.70',
-    '15.703sec',
-    '15.70m',
-    '15.75',
     '15.75%',
-    '15.75in',
-    '15.75p',
-    '15.78',
-    '15.79',
-    '15.8.1',
-    '15.8.2',
-    '15.8.4',
-    '15.8.93',
-    '15.8mpg',
-    '15.8oz',
-    '15.8pc',
-    '15.9.1',
-    '15.9.2',
-    '15.9.3',
-    '15.90%',
     '15.9m',
-    '15/10/73',
-    '15/10/90',
-    '15/100000/year',
-    '15/115',
-    '15/115ths',
-    '15/17th',
-    '15/18',
-    '15/19',
-    '15/198',
-    '15/20',
-    '15/23',
-    '15/24b',
-    '15/25',
-    '15/26a',
-    '15/26b',
     '15/27',
-    '15/277',
-    '15/3/93',
-    '15/30',
-    '15/4/41',
-    '15/463',
-    '15/5/1987',
-    '15/5/41',
-    '15/5/93',
-    '15/57',
-    '15/580',
-    '15/596',
-    '15/605',
-    '15/8',
-    '15/87',
-    '15/88',
     '15/90',
-    '15/91',
-    '15/97',
-    '15/colour/114',
-    '150&deg;.',
-    '150&deg;c.',
-    '150&deg;m',
-    '150&deg;w',
-    '150&mdash;67',
-    '150&mgr;g',
-    '150&micro;s',
-    '150&ndash;1200',
-    '150&ndash;160',
-    '150&ndash;175',
-    '150&ndash;180',
-    '150&ndash;185',
     '150&ndash;200m',
-    '150&ndash;230mm',
-    '150&ndash;3',
-    '150&ndash;300&formula',
-    '150&ndash;400&times;10/l',
-    '150&ndash;440&times',
-    '150&ndash;50',
-    '150&ndash;7',
-    '150&ndash;70',
-    '150&ndash;800',
-    '150&ndash;mile',
-    '150&rehy;page',
-    '150&times;25mm',
-    '150,00',
-    '150,000,160',
-    '150,000-170,000',
     '150,000-200,000',
-    '150,000-acre',
-    '150,000-mile',
-    '150,000-plus',
-    '150,000kg',
-    '150,400,000',
-    '150,929',
-    '150-1',
-    '150-151',
-    '150-2',
-    '150-200',
-    '150-250',
-    '150-4-pk',
-    '150-bedroom',
-    '150-city',
-    '150-foot',
     '150-hour',
-    '150-m.p.h.',
-    '150-metre',
-    '150-metre-long',
-    '150-miles-per-hour',
-    '150-mm',
-    '150-odd',
-    '150-picture',
-    '150-point',
-    '150-r',
-    '150-run',
-    '150-watt',
-    '150-yard',
-    '150.',
-    '150.0',
-    '150.6',
     '150/',
-    '150/1,000',
-    '150/136cm',
-    '150/152',
-    '150/152s',
-    '1500&ndash;1',
-    '1500&ndash;1515',
-    '1500&ndash;1553',
-    '1500&ndash;1558',
-    '1500&ndash;1563',
-    '1500&ndash;1566',
-    '1500&ndash;1571',
-    '1500&ndash;1573',
-    '1500&ndash;1697',
-    '1500&ndash;1700\'',
-    '1500&ndash;1750',
     '1500&ndash;1850',
-    '1500&ndash;1900',
-    '1500&ndash;1970',
-    '1500&ndash;22',
-    '1500&ndash;3000',
-    '1500&ndash;c.',
-    '1500\'s',
-    '1500-1700',
-    '1500-1850',
-    '1500-horsepower',
-    '1500-metre',
-    '1500-mile',
-    '1500/1515',
-    '150010',
-    '1500h',
-    '1500kcals',
     '1500km',
-    '1500mw',
-    '1500psi',
-    '1500sc',
-    '1501b',
-    '1502&ndash;9',
-    '150230',
-    '150242',
-    '150279',
-    '150284',
-    '1503&ndash;1821',
-    '1503&ndash;19',
-    '1504&ndash;73',
-    '1505&ndash;1577',
-    '1505&ndash;1585',
-    '1505&ndash;6',
     '1505&ndash;post',
-    '1506&ndash;13',
-    '1506&ndash;1539',
-    '1506&ndash;1544',
-    '1506&ndash;1552',
-    '15063',
-    '1507&ndash;76',
-    '1508&ndash;63',
-    '1508&ndash;67',
-    '1508&ndash;70',
-    '1508&ndash;9',
-    '1509&ndash;10',
-    '1509&ndash;1547',
-    '1509&ndash;47',
-    '1509&ndash;64',
-    '150bn',
     '150db',
-    '150dpi',
-    '150du',
-    '150f',
-    '150f.',
-    '150ff',
-    '150ff/livestock',
-    '150k',
-    '150ka',
-    '150kg',
-    '150m.',
-    '150mg/100ml',
-    '150ml/100ml',
-    '150ml/5fl',
-    '150ml/6',
-    '150mmin',
     '150mw',
-    '150myr',
-    '150ns',
-    '150p-a-share',
-    '150units/ml',
-    '150v',
-    '150x.',
-    '151&ndash;152',
-    '151&ndash;163',
-    '151&ndash;2',
-    '151&ndash;4',
-    '151,100',
-    '151,582',
-    '151-152',
-    '151-point',
-    '151-year',
     '151.',
-    '151.2',
-    '151.2%',
-    '151.5x151.5cm',
-    '151/2',
-    '1510&ndash;1563',
-    '1510&ndash;1564',
-    '1510&ndash;1571',
-    '1510&ndash;1587',
-    '1510&ndash;20',
-    '1510&ndash;85',
-    '1510&ndash;c.',
-    '1510-1568',
-    '1510/20',
-    '1511&ndash;53',
-    '1511&ndash;76',
     '15113&ndash;054',
-    '1512&ndash;15',
-    '1512&ndash;1567',
-    '1512&ndash;1594',
-    '1512&ndash;17',
-    '1512&ndash;18',
-    '1513&ndash;42',
-    '1514&ndash;1559',
-    '1514&ndash;1572',
-    '1514&ndash;74',
-    '1515&ndash;1560',
-    '1515&ndash;1586',
-    '1515&ndash;16',
-    '1515&ndash;53',
-    '1515&ndash;68',
-    '1515&ndash;82',
     '1515&ndash;86',
-    '1515-.82',
-    '1515/16&ndash;1564',
-    '1516&ndash;23',
-    '1516&ndash;65',
-    '1517&ndash;70',
-    '1517&ndash;80',
-    '1517&ndash;90',
-    '15171',
-    '1518&ndash;1580',
-    '1518&ndash;33',
-    '1519&ndash;56',
-    '1519&ndash;59',
-    '151a',
-    '151fs',
-    '151ft',
     '151m',
-    '151pp',
-    '152%',
-    '152&deg;f',
-    '152&mdash;4',
-    '152&ndash;3',
-    '152&ndash;4',
-    '152,200',
-    '152,230',
-    '152,952',
-    '152-match',
-    '152-mm',
-    '152-page',
-    '152-room',
-    '152-year',
-    '152.2',
     '152.33',
-    '152.4',
-    '152.5',
-    '152.5p',
-    '1520&ndash;1593',
-    '1520&ndash;1600',
-    '1520&ndash;1610',
-    '1520&ndash;30',
-    '1520&ndash;50',
-    '1520&ndash;8',
-    '1520&ndash;89',
-    '1520&ndash;98',
-    '1521&ndash;1898',
-    '1521&ndash;26',
-    '15210',
-    '1522&ndash;1591',
     '1522&ndash;5',
-    '1522&ndash;57',
-    '1522fs',
-    '1523&ndash;83',
-    '15233',
-    '1524&ndash;1609',
-    '1524&ndash;76',
-    '1525&ndash;1560',
-    '1525&ndash;1581',
-    '1525&ndash;1591',
-    '1525&ndash;1594',
-    '1525&ndash;1700',
-    '1525&ndash;60',
-    '1525&ndash;7',
-    '15250',
-    '1526&ndash;30',
     '1526&ndash;7',
-    '1527&ndash;1599',
-    '1527&ndash;1608',
-    '1527&ndash;32',
-    '1527&ndash;75',
-    '1527&ndash;8',
-    '15271',
-    '1528&ndash;6',
-    '1529&ndash;1590',
-    '1529&ndash;30',
-    '1529&ndash;36',
-    '1529&ndash;c.',
-    '152c',
-    '152f',
-    '152nd',
-    '152x203cm',
     '153%',
-    '153&ndash;156',
-    '153&ndash;7',
-    '153&plus;1',
-    '153\'s',
-    '153,595',
-    '153,600',
-    '153,800',
-    '153,870',
-    '153-bedroom',
-    '153.1%',
-    '1530&ndash;1574',
-    '1530&ndash;1592',
-    '1530&ndash;1600',
-    '1530&ndash;1604',
-    '1530&ndash;1790',
     '1530&ndash;1987',
-    '15301604',
-    '15303-04',
-    '1531&ndash;1606',
-    '15315',
-    '1532&ndash',
-    '1532&ndash;1591',
-    '1532&ndash;1594',
-    '1532&ndash;1825',
-    '1533&ndash;1604',
-    '1533&ndash;1918',
-    '1533-1824',
-    '15330',
-    '1534&ndash;1604',
-    '1534&ndash;1608',
-    '1534&ndash;43',
     '1534&ndash;45',
-    '1534&ndash;58',
-    '1534/5&ndash;1614',
-    '1535%',
-    '1535&ndash;38',
-    '1535&ndash;40',
-    '1535&ndash;c.',
-    '1535c.',
-    '1536&ndash;1601',
-    '1536&ndash;1832',
-    '1536&ndash;7',
-    '1537&ndash;38',
-    '1538&ndash;1801',
-    '15388',
-    '1539&ndash;1557,57',
-    '1539&ndash;1597',
     '1539&ndash;1611',
-    '1539&ndash;56',
-    '153a',
-    '153b10',
-    '153cm',
-    '153m',
-    '154%',
-    '154&mdash;5',
-    '154&mdash;6',
-    '154&ndash;2',
-    '154&ndash;5',
-    '154&ndash;6',
-    '154&ndash;60',
-    '154&ndash;64',
-    '154&ndash;8',
-    '154&ndash;93',
     '154(1)',
-    '154,208',
-    '154,530',
-    '154.41.',
-    '154.5',
-    '154.5in',
-    '154.61',
-    '154.784.2gm',
-    '1540&mdash;42',
-    '1540&ndash;1547',
-    '1540&ndash;1573',
-    '1540&ndash;1616/17',
-    '1540&ndash;1853',
-    '1540\'s',
-    '1541&ndash;2',
-    '1541&ndash;2350',
     '1541&ndash;3100',
-    '1541&ndash;45',
-    '1541b',
-    '1542&ndash;1632',
-    '1542&ndash;50',
-    '1542&ndash;58',
-    '1542&ndash;91',
-    '1543&ndash;1623',
-    '1543&ndash;88',
-    '154310',
-    '1543lb',
-    '1544&ndash;95',
-    '15440',
-    '1545&ndash;1607',
-    '1545&ndash;47',
-    '1546&ndash;1601',
     '1546&ndash;8',
-    '1546&ndash;87',
-    '1547&ndash;1592',
-    '1547&ndash;1611',
-    '1547&ndash;53',
-    '1547&ndash;59',
-    '1547&ndash;84',
-    '1547&ndash;97',
-    '15477',
-    '1548&ndash;1611',
-    '1548&ndash;60',
-    '15487m',
-    '1549&ndash;1609',
-    '1549&ndash;1620',
-    '154kcals',
-    '154km',
     '154lb',
-    '154lbs',
-    '154pp',
-    '154th',
-    '154x180cm',
-    '155&mdash;7',
-    '155&ndash;160',
-    '155&ndash;222',
-    '155&ndash;75',
-    '155&ndash;88',
-    '155&sol;80',
-    '155\'s',
-    '155,000,000',
-    '155,500',
-    '155,74(48%)',
-    '155-a/67-ha',
     '155-yard',
-    '155-year',
-    '155.',
-    '155.6p',
-    '155.7p',
-    '155.9%',
-    '155/70',
-    '155/733',
-    '1550&ndash',
-    '1550&ndash;1',
-    '1550&ndash;1470',
-    '1550&ndash;1500',
-    '1550&ndash;1602',
-    '1550&ndash;1605',
-    '1550&ndash;1610',
-    '1550&ndash;1623',
     '1550&ndash;1631',
-    '1550&ndash;1950',
-    '1550&ndash;5',
-    '1550&ndash;91',
-    '15500',
-    '1551&ndash;1614',
-    '1551&ndash;1617',
-    '1551&ndash;1623',
-    '1551&ndash;1700',
-    '15510',
-    '1552&ndash;1618',
-    '1552&ndash;1630',
-    '1552&ndash;4',
-    '1552/53',
-    '1553&ndash;1600',
-    '1553&ndash;1611',
     '1553&ndash;4',
-    '1553&ndash;99',
-    '155302',
-    '15533',
-    '1554&ndash;1555',
-    '1554&ndash;1640',
-    '1554&ndash;60',
-    '1555&ndash;1626',
-    '1555&ndash;1628',
-    '1555&ndash;1636',
-    '1555&ndash;6',
-    '15550',
-    '1556&ndash;1574',
-    '1556&ndash;1605',
-    '1556&ndash;1948',
-    '1556/57',
     '15560',
-    '1557&ndash;1602',
-    '1557&ndash;1609',
-    '1557&ndash;1620',
-    '1557&ndash;1627',
-    '1557&ndash;59',
-    '1557&ndash;61',
-    '1557&ndash;8',
-    '1557&ndash;9',
-    '1558&mdash;59',
-    '1558&ndash;1643',
-    '1558&ndash;1649',
-    '1558&ndash;1714',
-    '1558&ndash;81',
-    '1558&ndash;83',
-    '1558&ndash;89',
     '1558&ndash;9',
-    '1559&ndash;6',
-    '1559&ndash;60',
-    '1559&ndash;94',
-    '155cm',
-    '155m',
-    '155nm',
-    '155pp',
-    '156&amp;degree',
-    '156&deg;e',
-    '156&mdash;9',
-    '156&ndash;162',
-    '156&ndash;63',
-    '156&ndash;8',
-    '156&ndash;9',
-    '156,648',
     '156-8',
-    '156-ton',
-    '156.2p',
-    '156/03',
-    '1560&ndash;1614',
-    '1560&ndash;1615',
-    '1560&ndash;1621',
-    '1560&ndash;1623',
-    '1560&ndash;1627',
-    '1560&ndash;1628',
-    '1560&ndash;1629',
-    '1560&ndash;1630',
-    '1560&ndash;2',
-    '1560&ndash;3548',
-    '1560&ndash;90',
-    '1560&ndash;c.1610',
     '1560-1630',
-    '1561&ndash;1632',
-    '1561&ndash;1633',
-    '1561&ndash;4',
-    '1561&ndash;5',
-    '1561&ndash;62',
-    '1562&ndash;1613',
-    '1562&ndash;1637',
-    '1562&ndash;63',
-    '15621621',
-    '1563&ndash;1626',
-    '1563&ndash;1628',
-    '1563&ndash;1631',
-    '1563&ndash;1640',
-    '1563&ndash;post',
-    '15630',
     '156370',
-    '1564&ndash;1570',
-    '1564&ndash;1616',
-    '1564&ndash;1621',
-    '1564&ndash;1642',
-    '1564&ndash;8',
-    '1565&ndash',
-    '1565&ndash;1613',
-    '1565&ndash;1628',
-    '1565-1799',
-    '1565-1948',
-    '1566&ndash;1640',
-    '1566&ndash;7',
-    '1566&ndash;89',
-    '15660',
-    '1567&ndash;1620',
     '1567&ndash;1630',
-    '1567&ndash;1634',
-    '1567&ndash;70',
-    '1567&ndash;8',
-    '1567&ndash;9',
-    '1567p',
-    '1568&ndash;1623',
-    '1568&ndash;1624',
-    '1569&ndash;1645',
-    '15692',
-    '156bhp',
-    '156ff',
-    '156g',
-    '156ins',
-    '156m',
-    '156mph',
     '156pp',
-    '157&ndash;1033',
-    '157&ndash;159',
-    '157&ndash;207',
-    '157&ndash;60',
-    '157&ndash;8',
-    '157&ndash;9',
-    '157,500',
-    '157,768',
-    '157-2',
-    '157-95',
-    '157-member',
-    '157.0',
-    '157.1%',
-    '157.4%',
-    '157.5',
     '157.5m',
-    '157.62',
-    '1570&ndash',
-    '1570&ndash;1',
-    '1570&ndash;1602',
-    '1570&ndash;1605',
-    '1570&ndash;1623',
-    '1570&ndash;1635',
-    '1570&ndash;1800',
-    '1570.',
-    '1571&ndash;1621',
-    '1571&ndash;1630',
-    '1571&ndash;1633',
-    '15719',
-    '1572&ndash;1596',
-    '1572&ndash;1634',
     '1572&ndash;1650',
-    '1572&ndash;1656',
-    '1572&ndash;724101',
-    '15720',
-    '157260',
-    '1573&ndash;1645',
-    '1573&ndash;4',
-    '1573&ndash;79',
-    '1573&ndash;92',
-    '1574&ndash;1638',
-    '1575&ndash;1623',
-    '1575&ndash;1626',
-    '1575&ndash;1628',
-    '1575&ndash;1630',
-    '1575&ndash;3018',
-    '1575&ndash;after',
     '15750',
-    '1576&ndash;1612',
-    '1576&ndash;8',
-    '15769',
-    '1577&ndash;1635',
-    '1577&ndash;1640',
-    '1577&ndash;2220',
-    '1577&ndash;80',
-    '15777',
-    '1578&ndash;81',
-    '157830',
-    '1579&ndash;1654',
-    '1579&ndash;1659',
-    '1579&ndash;87',
-    '157cm',
-    '157jy',
     '158%',
-    '158&mdash;9',
-    '158&ndash;159',
-    '158&ndash;162',
-    '158&ndash;3',
-    '158&ndash;63',
-    '158&ndash;78',
-    '158,000,000',
-    '158,400',
-    '158,693',
-    '158,970',
-    '158.2%',
-    '1580&ndash;1619',
-    '1580&ndash;1620',
-    '1580&ndash;1629',
-    '1580&ndash;1639',
     '1580&ndash;1657',
-    '1580&ndash;90',
-    '1580&ndash;after',
-    '1580-1780',
-    '1580.6',
-    '158000',
-    '1580kg',
-    '1581&ndash;1628',
-    '1581&ndash;84',
-    '1582&ndash',
-    '1582&ndash;1637',
-    '1582&ndash;after',
-    '1583&ndash;1625',
-    '1583&ndash;1658',
-    '1583/92',
-    '1584&ndash;1630',
     '1584&ndash;1645',
-    '1585&ndash;1590',
-    '1585&ndash;1623',
-    '1585&ndash;1640',
-    '1585&ndash;1646',
-    '1585&ndash;1654',
-    '1585&ndash;1656',
-    '1585&ndash;1662',
-    '1585&ndash;1672',
-    '1585&ndash;6',
-    '1585p',
-    '1586&ndash;1630',
-    '1586&ndash;1643',
-    '1586&ndash;1665',
-    '1586&ndash;after',
-    '1587&ndash;1629',
     '1587&ndash;1987',
-    '1587&ndash;92',
-    '1587&ndash;c.',
-    '15870',
-    '158701',
-    '1588&ndash;1629',
-    '1588&ndash;1638',
-    '1588&ndash;1659',
-    '1588&ndash;1666',
-    '1588&ndash;1667',
-    '1588&ndash;1676',
-    '1588-1679',
-    '1589&ndash;1638',
-    '1589&ndash;90',
-    '1589&ndash;91',
-    '15899-902',
     '158b',
-    '158nm',
-    '158th',
-    '159&ndash;163',
-    '159&ndash;5',
-    '159&ndash;65',
-    '159&ndash;69',
-    '159&ndash;8',
-    '159&ndash;80',
-    '159(1)',
-    '159(2)',
-    '159,000',
-    '159,210,000',
-    '159-169',
-    '159-member',
-    '159.',
     '159.4',
-    '159.5',
-    '159.5p',
-    '159.9%',
-    '159/47',
-    '1590&ndash;1626',
-    '1590&ndash;1649',
-    '1590&ndash;1651',
-    '1590c.',
-    '1591&ndash;1652',
-    '1591&ndash;1668',
-    '1591&ndash;2',
-    '1592&ndash;1637',
-    '1592&ndash;1645',
-    '1592&ndash;1665',
-    '15924',
     '15927-30',
-    '1593&ndash;1633',
-    '1593&ndash;1662',
-    '1594&ndash;1632',
-    '1594&ndash;6',
-    '15940',
-    '1595&ndash;1622',
-    '1595&ndash;1665',
-    '1595&ndash;1667',
-    '1595&ndash;1674',
-    '1595&ndash;1675',
-    '1595&ndash;1677',
-    '1595&ndash;6',
-    '1595&ndash;c.',
-    '15951',
-    '15951-56',
     '1596&ndash;1632',
-    '1596&ndash;1654',
-    '1596&ndash;1662',
-    '1596&ndash;1668',
-    '1596&ndash;1992',
-    '1596&ndash;98',
-    '1597&ndash;1646',
-    '1597&ndash;1665',
-    '1597&ndash;1670',
-    '1597&ndash;1681',
-    '1597/98',
-    '15977',
-    '1598&ndash;1653',
-    '1598&ndash;1670',
-    '15981653',
-    '1599&ndash;1605',
     '1599&ndash;1648',
-    '1599&ndash;1650',
-    '1599&ndash;1657',
-    '1599&ndash;1663',
-    '1599/60',
-    '159g',
-    '159k',
-    '159lb',
-    '159p',
-    '159pp.',
-    '15:0',
-    '15:00:04',
-    '15:00:14',
-    '15:00:56',
-    '15:01.71',
-    '15:01:18',
     '15:01:31',
-    '15:01:57',
-    '15:02:12',
-    '15:03:03',
-    '15:03:21',
-    '15:03:22',
-    '15:03:57',
-    '15:04:28',
-    '15:04:32',
-    '15:04:43',
-    '15:05',
-    '15:05:29',
-    '15:05:48',
-    '15:06',
-    '15:06.47',
-    '15:06:14',
     '15:07',
-    '15:07:21',
-    '15:07:36',
-    '15:07:42',
-    '15:07:51',
-    '15:08:00',
-    '15:09:08',
-    '15:1&ndash;15',
-    '15:1&ndash;21',
-    '15:10:20',
-    '15:10:28',
-    '15:11:03',
-    '15:11:16',
-    '15:11:26',
-    '15:11:27',
-    '15:11:34',
     '15:12',
-    '15:12:44',
-    '15:13&ndash;14',
-    '15:13:39',
-    '15:14:31',
-    '15:14:46',
-    '15:15:07&ndash;0500',
-    '15:15:46',
-    '15:16&ndash;20',
-    '15:16:58',
-    '15:18',
-    '15:18:11',
-    '15:18:33',
-    '15:19:37',
-    '15:19:38',
-    '15:1ff.',
     '15:20,23',
-    '15:20.12',
-    '15:20:36',
-    '15:21&ndash;22',
-    '15:21.25',
-    '15:21:07',
-    '15:22&ndash;17:7',
-    '15:22&ndash;23',
-    '15:22:40',
-    '15:22:56',
-    '15:23',
-    '15:23&ndash;25',
-    '15:23&ndash;32',
-    '15:23:10',
-    '15:24:30',
-    '15:25:48',
     '15:26,2',
-    '15:26,27',
-    '15:26,7',
-    '15:26:11',
-    '15:26:39',
-    '15:27',
-    '15:27&ndash;31',
-    '15:27:31',
-    '15:27:42',
-    '15:28',
-    '15:28:19',
-    '15:29:50',
-    '15:3&ndash;40',
-    '15:3&ndash;6',
-    '15:30:38',
-    '15:32',
     '15:32:08',
-    '15:33&ndash;9',
-    '15:33:02',
-    '15:34:35',
-    '15:34:44',
-    '15:34:49',
-    '15:35',
-    '15:35:59',
-    '15:36:01',
-    '15:36:37',
-    '15:37:07&ndash;0400',
-    '15:37:50',
-    '15:38:58',
-    '15:39',
-    '15:40&ndash;41',
-    '15:40:05',
     '15:40:34',
-    '15:41:02',
-    '15:41:53',
-    '15:42',
-    '15:42&ndash;47',
-    '15:42:07',
-    '15:42:15',
-    '15:42:31',
-    '15:43:32',
-    '15:44:44',
-    '15:44:51',
-    '15:45:54',
-    '15:46',
-    '15:46:04',
-    '15:46:09',
-    '15:48',
     '15:48:40',
-    '15:48:56',
-    '15:49:05',
-    '15:49:21',
-    '15:50',
-    '15:50:10',
-    '15:50:35',
-    '15:50:39',
-    '15:50:44',
-    '15:50:58',
-    '15:51:17',
-    '15:51:51',
-    '15:51:59',
-    '15:52',
-    '15:52:17',
-    '15:53',
     '15:53:06',
-    '15:53:14',
-    '15:56:24',
-    '15:56:26',
-    '15:56:57',
-    '15:57:57',
-    '15:58:34',
-    '15:59',
-    '15:59:29',
-    '15:5:3:2',
-    '15:6',
-    '15:7&ndash;8',
-    '15:8ff',
-    '15=',
-    '15announced',
-    '15bc',
     '15cv',
-    '15cwt',
-    '15d03073a',
-    '15dbm',
-    '15f',
-    '15ff.',
-    '15ft.',
-    '15ghz',
-    '15ha',
-    '15hh&ndash;15.2hh',
-    '15hr',
-    '15km.',
-    '15l',
-    '15m.',
-    '15man',
-    '15mbytes',
     '15mcg/kg',
-    '15mcg/kg/hour',
-    '15mers',
-    '15ml/1',
-    '15ml/100ml',
-    '15mm-wide',
-    '15mpg',
-    '15n',
-    '15oml',
-    '15ozs',
-    '15p.p.b.v.',
-    '15p.p.m',
-    '15p/mile',
-    '15point',
-    '15psi',
-    '15pt',
     '15sec',
-    '15sec.',
-    '15th&ndash;19th',
-    '15th&ndash;25th',
-    '15th-16th',
-    '15th-18th',
-    '15th-20th',
-    '15th-seeded',
-    '15th/19th',
-    '15thc',
-    '15uml',
-    '15v14&ndash;33',
-    '15wt%',
-    '15x35cm',
-    '15x4.8',
-    '15xo',
     '15yds',
-    '15year-old',
-    '16&aring',
-    '16&commat;1/2',
-    '16&deg;16\'30\'\'w',
-    '16&frac12;in/59',
-    '16&frac14',
-    '16&frac34;p',
-    '16&frac38',
-    '16&frac38;in',
-    '16&ins&times;21&ins',
-    '16&ins;d',
-    '16&ins;x9&ins',
-    '16&mdash;19',
-    '16&mdash;22',
-    '16&mdash;64',
     '16&mdash;65',
-    '16&mdash;foot',
-    '16&mgr;gml',
-    '16&middot;5',
-    '16&ndash;0',
-    '16&ndash;00',
-    '16&ndash;05',
-    '16&ndash;11-',
-    '16&ndash;17%',
-    '16&ndash;17,000',
-    '16&ndash;17-year-olds',
-    '16&ndash;17/5/41',
-    '16&ndash;17h',
-    '16&ndash;18%',
-    '16&ndash;18th',
-    '16&ndash;19-age-working',
     '16&ndash;1g',
-    '16&ndash;2&ndash;1910',
-    '16&ndash;22&deg;c',
-    '16&ndash;27',
-    '16&ndash;3&ndash;49&ndash;6',
-    '16&ndash;34',
-    '16&ndash;34-year-old',
-    '16&ndash;4&ndash;1879',
-    '16&ndash;4&ndash;19&ndash;7',
-    '16&ndash;44',
-    '16&ndash;49',
-    '16&ndash;5&ndash;31&ndash;5',
-    '16&ndash;55',
-    '16&ndash;6&ndash;1843',
-    '16&ndash;62',
-    '16&ndash;63',
     '16&ndash;637',
-    '16&ndash;7',
-    '16&ndash;7&ndash;15',
-    '16&ndash;7-',
-    '16&ndash;72',
-    '16&ndash;8-',
-    '16&ndash;jan',
-    '16&ndash;page',
-    '16&plus;1',
-    '16&prime;38&prime',
-    '16&prime;40&prime',
-    '16&times;10cm/4in',
-    '16&times;9',
-    '16(14)',
-    '16(3)',
-    '16(4)',
     '16(5)',
-    '16(6%)',
-    '16(8)',
-    '16+action',
-    '16+s',
-    '16,00()',
-    '16,000-channel',
-    '16,000-processor',
-    '16,000yr',
-    '16,002',
-    '16,092,883',
-    '16,130',
-    '16,138',
-    '16,188',
-    '16,1991',
-    '16,20',
     '16,200ft',
-    '16,202',
-    '16,21',
-    '16,23,24,39&ndash;42',
-    '16,250',
-    '16,270',
-    '16,273,616',
-    '16,295',
-    '16,300',
-    '16,308',
-    '16,314',
-    '16,315,227',
-    '16,337',
-    '16,384-cpu',
-    '16,384hz',
-    '16,389',
     '16,397',
-    '16,400,000',
-    '16,412,000',
-    '16,416',
-    '16,421',
-    '16,428.55',
-    '16,433,796',
-    '16,457',
-    '16,463,000',
-    '16,475',
-    '16,5000',
-    '16,500ft',
-    '16,508',
-    '16,567',
-    '16,598.15',
-    '16,636',
     '16,642',
-    '16,700fft',
-    '16,700km',
-    '16,726',
-    '16,769',
-    '16,779',
-    '16,800,000',
-    '16,804,000',
-    '16,825',
-    '16,828',
-    '16,881,130',
-    '16,900,000',
-    '16,921,000',
-    '16,923',
-    '16,949',
-    '16,982',
     '16-.26',
-    '16-11',
-    '16-16',
-    '16-18year-olds',
-    '16-2',
-    '16-2-93',
-    '16-20-',
-    '16-20ft',
-    '16-24-year-old',
-    '16-256',
-    '16-31',
-    '16-35',
-    '16-4',
-    '16-7',
-    '16-and',
-    '16-belgium',
     '16-channel',
-    '16-club',
-    '16-colour',
-    '16-cpu',
-    '16-cylinder',
-    '16-date',
-    '16-day-hunger',
-    '16-day-old',
-    '16-dollars',
-    '16-feet',
-    '16-gauge',
-    '16-home',
-    '16-lane',
-    '16-million',
-    '16-minute',
-    '16-month-old',
     '16-nation',
-    '16-oz.',
-    '16-part',
-    '16-party',
-    '16-pensionable',
-    '16-phase',
-    '16-runner',
-    '16-second',
-    '16-ship',
-    '16-slot',
-    '16-team',
-    '16-to',
-    '16-to-1,024-sparc',
-    '16-tonne',
-    '16-tonnes',
-    '16-under-par',
     '16-yard',
-    '16-year-earlier',
-    '16.02',
-    '16.05',
-    '16.06',
-    '16.07',
-    '16.08',
-    '16.08m',
-    '16.0c',
-    '16.0p',
-    '16.1&ndash;2',
-    '16.1&ndash;8',
-    '16.1.2',
-    '16.10.92',
-    '16.11.4',
-    '16.11.88',
     '16.14',
-    '16.16%',
-    '16.18',
-    '16.19',
-    '16.1hh',
-    '16.1hh-16.3hh',
-    '16.1p',
-    '16.1pc',
-    '16.2.2',
-    '16.2.6',
-    '16.23',
-    '16.26',
-    '16.28%',
-    '16.2m',
-    '16.2pc',
-    '16.3&ndash;6',
     '16.3.2',
-    '16.3.4',
-    '16.30&ndash;17.30',
-    '16.30&ndash;19.30',
-    '16.31',
-    '16.32',
-    '16.33',
-    '16.36',
-    '16.38',
-    '16.3kg',
-    '16.3p',
-    '16.3pc',
-    '16.4,16.5',
-    '16.4.1',
-    '16.4.2',
-    '16.4.3',
     '16.4.4',
-    '16.4.5',
-    '16.4/2',
-    '16.41',
-    '16.42',
-    '16.44%',
-    '16.450,00',
-    '16.48%',
-    '16.4bn',
-    '16.4mmol',
-    '16.4p',
-    '16.4x',
-    '16.5&ndash;500',
-    '16.5&times;26',
-    '16.5&times;5',
-    '16.5.1',
     '16.5.2',
-    '16.5.3',
-    '16.5.4',
-    '16.5.5',
-    '16.5.68',
-    '16.5.91',
-    '16.51',
-    '16.54',
-    '16.56',
-    '16.59',
-    '16.5ft',
-    '16.5in',
-    '16.5k',
-    '16.5pc',
-    '16.5x',
-    '16.60',
     '16.61',
-    '16.63',
-    '16.63&deg;c',
-    '16.67',
-    '16.6ff',
-    '16.6p',
-    '16.70',
-    '16.7m',
-    '16.7pc',
-    '16.8&deg',
-    '16.8(a)',
-    '16.8(b)',
-    '16.8.1',
-    '16.8.2',
-    '16.8.3',
-    '16.8.4',
     '16.81%',
-    '16.83',
-    '16.87',
-    '16.894sec',
-    '16.8kg',
-    '16.8kgs',
-    '16.8m',
-    '16.8mhz',
-    '16.8sec',
-    '16.92',
-    '16.99',
-    '16.9m',
-    '16.x.',
-    '16/1/93',
-    '16/10/90',
-    '16/15',
     '16/16',
-    '16/17/18',
-    '16/17th',
-    '16/19',
-    '16/2',
-    '16/2/87',
-    '16/20mhz',
-    '16/212',
-    '16/23',
-    '16/25',
-    '16/28',
-    '16/29',
-    '16/32',
-    '16/4/91',
-    '16/4/93',
-    '16/4mbps',
     '16/5/41',
-    '16/552',
-    '16/56',
-    '16/580',
-    '16/6/92',
-    '16/6a',
-    '16/8/90',
-    '16/80',
-    '16/87',
-    '16/92',
-    '160&mgr;molmol',
-    '160&ndash;162',
-    '160&ndash;200',
-    '160&ndash;200%',
-    '160&ndash;220',
-    '160&ndash;3',
     '160&ndash;360&deg;c',
-    '160&ndash;4',
-    '160&ndash;60',
-    '160&ndash;61',
-    '160&ndash;62',
-    '160&ndash;650',
-    '160(2)',
-    '160,600,000',
-    '160,931',
-    '160-',
-    '160-1',
-    '160-7',
-    '160-a-week',
-    '160-kilometre',
-    '160-km',
-    '160-minute',
     '160-yard',
-    '160.061.3gm',
-    '160.2',
-    '160.5p',
-    '160.6%',
-    '160.8p',
-    '160.9%',
-    '160/100',
-    '160/69',
-    '160/95',
-    '1600&ndash;1639',
-    '1600&ndash;1647',
-    '1600&ndash;1658',
-    '1600&ndash;1678',
-    '1600&ndash;1679',
-    '1600&ndash;1683',
     '1600&ndash;1720',
-    '1600&ndash;1838',
-    '1600&ndash;1850',
-    '1600&ndash;1982/3',
-    '1600&ndash;1990',
-    '1600&ndash;22',
-    '1600&ndash;61',
-    '1600&ndash;after',
-    '1600&ndash;c.',
-    '1600\'s',
-    '1600,1606',
-    '1600-1774',
-    '1600-1914',
-    '1600-kilometre',
-    '1600-present',
-    '160000',
     '16005',
-    '1600a',
-    '1600bc',
-    '1600hrs',
-    '1600mw',
-    '1601&mdash;03',
-    '1601&ndash;03',
-    '1601&ndash;10',
-    '1601&ndash;1683',
-    '1601&ndash;65',
-    '1601/02',
-    '1602&ndash;03',
-    '1602&ndash;1650',
-    '1602&ndash;1676',
-    '1602&ndash;45',
-    '1602&ndash;59',
     '1602&ndash;76',
-    '1603&ndash;12',
-    '1603&ndash;1643',
-    '1603&ndash;1652',
-    '1603&ndash;1654',
-    '1603&ndash;1675',
-    '1603&ndash;1697',
-    '1603&ndash;1701',
-    '1603&ndash;1867',
-    '1603&ndash;7',
-    '1603&ndash;84',
-    '1603/4',
-    '1604&ndash;1676',
-    '1604&ndash;29',
-    '1604&ndash;51',
-    '16042',
     '1605&ndash;1671',
-    '1605&ndash;1675',
-    '1605&ndash;1679',
-    '1605&ndash;21',
-    '1605&ndash;74',
-    '16057',
-    '16058',
-    '1606&ndash;07',
-    '1606&ndash;1607',
-    '1606&ndash;1675',
-    '1606&ndash;1865',
-    '1606&ndash;56',
-    '1606&ndash;57',
-    '1606&ndash;69',
-    '1606&ndash;87',
-    '1607&ndash;1651',
     '1607&ndash;1693',
-    '1607&ndash;1701',
-    '1607&ndash;1900',
-    '1607&ndash;55',
-    '1607&ndash;67',
-    '1607&ndash;8',
-    '1607/08',
-    '1608&ndash;1685',
-    '1608&ndash;1691',
-    '1608&ndash;1870',
-    '1609&ndash;11',
-    '1609&ndash;13',
-    '1609&ndash;15',
-    '1609&ndash;1683',
-    '1609&ndash;1704',
-    '1609&ndash;20',
     '1609&ndash;76',
-    '160bn',
-    '160bpm',
-    '160c/320f/gas',
-    '160cc-engined',
-    '160cm',
-    '160f',
-    '160ft',
-    '160in',
-    '160km/100mls',
-    '160kph',
-    '160kts',
-    '160lb/73kg',
-    '160myr',
-    '160p.',
-    '160pp',
     '160rpm',
-    '160x300cm',
-    '161%',
-    '161&mdash;2',
-    '161&ndash;4',
-    '161&ndash;49',
-    '161&ndash;73',
-    '161&ndash;8',
-    '161,000,000',
-    '161,500,000',
-    '161-member',
-    '161-seat',
-    '161-yard',
-    '161.2%',
-    '161.27',
-    '161.5m',
     '161.9%',
-    '161/2',
-    '1610&ndash;11',
-    '1610&ndash;1665',
-    '1610&ndash;1674',
-    '1610&ndash;32',
-    '1610&ndash;60',
-    '1610&ndash;84',
-    '1611&ndash;14',
-    '1611&ndash;1644',
-    '1611&ndash;75',
-    '1612&ndash;1663',
-    '1612&ndash;1670',
-    '1612&ndash;1671',
-    '1613&ndash',
-    '1613&ndash;14',
     '1613&ndash;16',
-    '1613&ndash;1667',
-    '1613&ndash;1685/6',
-    '1614&ndash;1648',
-    '1614&ndash;1661',
-    '1614&ndash;1665',
-    '1615&ndash;1662',
-    '1615&ndash;1674',
-    '1615&ndash;1675',
-    '1615&ndash;1690',
-    '1615&ndash;1691',
-    '1615&ndash;17',
-    '1615&ndash;1742',
-    '1615&ndash;20',
-    '1615&ndash;73',
-    '1615&ndash;91',
     '1615/1630',
-    '1616&ndash',
-    '1616&ndash;1672',
-    '1616&ndash;1683',
-    '1616&ndash;1703',
-    '1616&ndash;76',
-    '1617&ndash;1662',
-    '1617&ndash;1675',
-    '1617&ndash;1683',
-    '1617&ndash;1701',
-    '1617&ndash;22',
-    '1617&ndash;30',
-    '1618&ndash;1648',
-    '1618&ndash;1680',
-    '1618p',
-    '1619&ndash;1694',
     '1619&ndash;21',
-    '1619&ndash;24',
-    '1619&ndash;62',
-    '161h',
-    '161o',
-    '161p',
-    '162&mdash;3',
-    '162&ndash;165',
-    '162&ndash;226',
-    '162&ndash;3',
-    '162&ndash;3&deg',
-    '162&ndash;4',
-    '162&ndash;6',
-    '162&ndash;64',
-    '162&ndash;74',
-    '162&ndash;82',
     '162,000-tonne',
-    '162,000ff',
-    '162,148',
-    '162,500',
-    '162.09',
-    '162.6',
-    '162.7',
-    '1620&ndash;1667',
-    '1620&ndash;1689',
-    '1620&ndash;1706',
-    '1620&ndash;1800',
-    '1620&ndash;1920',
-    '1620&ndash;30',
-    '1620&ndash;69',
-    '1620-1705',
-    '16200',
     '1621&ndash;1629',
-    '1621&ndash;1677',
-    '1621&ndash;1684',
-    '1621&ndash;1685',
-    '1621&ndash;3',
-    '1621&ndash;8',
-    '1621&ndash;84',
-    '1621&ndash;post',
-    '1622&ndash;1687',
-    '1622&ndash;23',
-    '1622&ndash;post',
-    '16220',
-    '162240',
-    '1623&ndash;1662',
-    '1623&ndash;1683',
-    '1623&ndash;24',
     '1623&ndash;62',
-    '1624&ndash;1665/7',
-    '1624&ndash;1701',
-    '1624&ndash;35',
-    '1624&ndash;40',
-    '1624&ndash;5',
-    '1624&ndash;50',
-    '1624&ndash;6',
-    '1624&ndash;7',
-    '1624.',
-    '16245',
-    '1625&ndash;1642',
-    '1625&ndash;1684',
-    '1625&ndash;1685',
-    '1625&ndash;1712',
-    '1625&ndash;41',
     '1625&ndash;49',
-    '1625&ndash;6',
-    '1625&ndash;8',
-    '1626&mdash;50',
-    '1626&ndash;1628',
-    '1626&ndash;1660',
-    '1626&ndash;1697',
-    '1626&ndash;1707',
-    '1626&ndash;31',
-    '1626&ndash;76',
-    '1627&ndash;1699',
-    '1627&ndash;1705',
-    '1627&ndash;1712',
-    '1627&ndash;1800',
-    '1627&ndash;3',
-    '1627&ndash;37',
     '1627&ndash;91',
-    '1627/8',
-    '1628&ndash;1652',
-    '1628&ndash;1676',
-    '1628&ndash;1677',
-    '1628&ndash;1688',
-    '1628&ndash;1702',
-    '1628&ndash;1703',
-    '1628&ndash;1704',
-    '1628&ndash;1715',
-    '1628&ndash;88',
-    '1628-1644',
-    '1629&ndash;1679',
-    '1629&ndash;1692',
-    '1629&ndash;1698',
-    '1629&ndash;30',
     '162a',
-    '162m',
-    '162nd',
-    '163&deg',
-    '163&deg;m',
-    '163&ndash;1',
-    '163&ndash;166',
-    '163&ndash;236',
-    '163&ndash;5',
-    '163&ndash;7',
-    '163&ndash;70',
-    '163&ndash;74',
-    '163&ndash;8',
-    '163&ndash;9',
-    '163(2)',
-    '163,000,000',
     '163,066',
-    '163,481ff',
-    '163,500',
-    '163-3',
-    '163.2ins',
-    '163.60',
-    '163.8',
-    '163.9%',
-    '163/557',
-    '163/b-17s',
-    '1630&ndash;1665',
-    '1630&ndash;1677',
-    '1630&ndash;1685',
-    '1630&ndash;1713',
-    '1630&ndash;1714',
-    '1630&ndash;85',
     '1630-1800',
-    '1630-33',
-    '16300',
-    '1630mm',
-    '1630p',
-    '1631&ndash;1685',
-    '1631&ndash;1700',
-    '1631&ndash;1789',
-    '1631&ndash;2',
-    '1632&ndash;1715',
-    '1632&ndash;3',
-    '1632&ndash;34',
-    '1632&ndash;47',
-    '1632&ndash;54',
-    '1632&ndash;77',
-    '1632&ndash;87',
     '16320',
-    '1633&ndash;1634',
-    '1633&ndash;1685',
-    '1633&ndash;1689',
-    '1633&ndash;95',
-    '1633.',
-    '1633/34',
-    '1634&ndash;1704',
-    '1634&ndash;41',
-    '1634&ndash;66',
-    '163473',
-    '1635&mdash;36',
-    '1635&ndash;1693',
-    '1635&ndash;1702',
-    '1635&ndash;1721',
-    '1635&ndash;1723',
     '1635&ndash;40',
-    '1635&ndash;42',
-    '1636&ndash;8',
-    '1636&ndash;9',
-    '1636.61',
-    '1637&mdash;57',
-    '1637&ndash;1688',
-    '1637&ndash;1711',
-    '1637&ndash;1767',
-    '1637&ndash;74',
-    '163723',
-    '1638&ndash;50',
-    '1638/39',
-    '163840',
-    '16386',
-    '1639&ndash;1651',
     '1639&ndash;1699',
-    '1639&ndash;1705',
-    '1639&ndash;1720',
-    '1639&ndash;42',
-    '1639&ndash;47',
-    '1639&ndash;49',
-    '1639&ndash;98',
-    '163b',
-    '163cm',
-    '163p.',
-    '163rd',
-    '164&ndash;171',
-    '164&ndash;214',
-    '164&ndash;5',
-    '164&ndash;7',
-    '164&ndash;8',
     '164,150',
-    '164,508',
-    '164-8',
-    '164-acre',
-    '164-based',
-    '164-mile',
-    '164-miles',
-    '164.',
-    '164.40',
-    '164.5p',
-    '164.7',
-    '164.80',
-    '164/110',
-    '1640&mdash;1660',
-    '1640&ndash;1714',
-    '1640&ndash;1716',
     '1640&ndash;1723',
-    '1640&ndash;1730',
-    '1640&ndash;1750',
-    '1640&ndash;50',
-    '1640&ndash;92',
-    '1640-50',
-    '1640/1512',
-    '164076',
-    '164083',
-    '1641&ndash;1653',
-    '1641&ndash;1700',
-    '1641&ndash;9',
-    '1642&mdash;48',
-    '1642&ndash',
-    '1642&ndash;1651',
-    '1642&ndash;1660',
     '1642&ndash;1710',
-    '1642&ndash;1722',
-    '1642&ndash;1726',
-    '1642&ndash;1737',
-    '1642&ndash;3',
-    '1642&ndash;46',
-    '1642&ndash;55',
-    '1642&ndash;7',
-    '1642-',
-    '1642-92',
-    '16420',
-    '1643&ndash;1706',
-    '1643&ndash;4',
-    '1643&ndash;52',
-    '1643&ndash;56',
-    '1643&ndash;6',
     '1643/45',
-    '164363',
-    '1644&ndash;47',
-    '1644&ndash;5',
-    '1644&ndash;6',
-    '1645&mdash;48',
-    '1645&ndash;1660',
-    '1645&ndash;1701',
-    '1645&ndash;54',
-    '1645&ndash;6',
-    '164500',
-    '1646&ndash;1610',
-    '1646&ndash;52',
-    '16460',
-    '1647&ndash;1655',
-    '1647&ndash;1696',
     '1647&ndash;1711',
-    '1647&ndash;53',
-    '1647&ndash;60',
-    '1647&ndash;9',
-    '1648&ndash;1660',
-    '1648&ndash;1710',
-    '1648&ndash;50',
-    '1648&ndash;53',
-    '1648.',
-    '16480',
-    '1649&mdash;60',
-    '1649&ndash;1714',
-    '1649&ndash;50',
-    '1649&ndash;51',
-    '1649&ndash;60',
-    '1649/51&ndash;1710',
     '164bhp',
-    '164f.',
-    '164ff',
-    '164n',
-    '165&ndash;171',
-    '165&ndash;183',
-    '165,400',
-    '165-d',
-    '165-person',
-    '165-ton',
-    '165-year-old',
-    '165.2gb',
-    '165.4lb',
-    '165.6',
-    '165.8m',
-    '165.9',
     '165/110',
-    '165/70',
-    '1650&ndash;1690',
-    '1650&ndash;1695',
-    '1650&ndash;1705',
-    '1650&ndash;1710',
-    '1650&ndash;1722',
-    '1650&ndash;1730',
-    '1650&ndash;1750',
-    '1650&ndash;1760',
-    '1650&ndash;1850',
-    '1650&ndash;1900',
-    '1650&ndash;1964',
-    '1650&ndash;5',
-    '1650&ndash;6',
-    '1650&ndash;99',
     '1650-',
-    '1650/1650(f)',
-    '1651&mdash;75',
-    '1651&ndash;1797',
-    '1651&ndash;2',
-    '1651&ndash;8',
-    '16514',
-    '1652&ndash;1720',
-    '1652&ndash;1727',
-    '1652&ndash;1737',
-    '1652&ndash;55',
-    '1653&mdash;54',
-    '1653&ndash;1704',
-    '1653&ndash;1723',
-    '1653&ndash;1731',
-    '1653&ndash;1985',
     '1653&ndash;5',
-    '16530',
-    '1653p',
-    '1654&mdash;67',
-    '1654&ndash;1742',
-    '1654&ndash;6',
-    '1654&ndash;9',
-    '1655&ndash;1660',
-    '1655&ndash;1695',
-    '1655&ndash;1731',
-    '1655&ndash;57',
-    '1655&ndash;6',
-    '1655&ndash;7',
-    '1655&ndash;73',
-    '16550',
-    '1656&ndash;1730',
     '1656&ndash;1743',
-    '1656&ndash;86',
-    '165655',
-    '165667',
-    '1657&ndash;1659',
-    '1657&ndash;8',
-    '1657&ndash;9',
-    '1658&ndash;1713',
-    '1658&ndash;1726',
-    '1658&ndash;1958',
-    '1658&ndash;75',
-    '1659&ndash;1723',
-    '1659&ndash;1726',
-    '1659&ndash;1727',
-    '1659&ndash;1739',
-    '1659&ndash;62',
     '1659&ndash;96',
-    '165c',
-    '165c&ndash;e',
-    '165cm',
-    '165d',
-    '165f',
-    '165ff',
-    '165h',
-    '165hp',
-    '165kg',
-    '165km',
-    '165m',
-    '165ml',
-    '165mm',
-    '165o&ndash;1760',
-    '166%',
     '166&ndash;1100',
-    '166&ndash;172',
-    '166&ndash;182',
-    '166&ndash;204',
-    '166&ndash;301',
-    '166&ndash;67',
-    '166&ndash;9',
-    '166,500',
-    '166,786',
-    '166,825',
-    '166,910',
-    '166-base-pair',
-    '166-bedroom',
-    '166-strong',
-    '166-year-old',
-    '166.0',
     '166.8m',
-    '1660&mdash;2',
-    '1660&ndash',
-    '1660&ndash;1689',
-    '1660&ndash;1702',
-    '1660&ndash;1722',
-    '1660&ndash;1731',
-    '1660&ndash;1734',
-    '1660&ndash;1820',
-    '1660&ndash;1870',
-    '1660&ndash;1886',
-    '1660&ndash;1900',
-    '1660&ndash;1914',
-    '1660&ndash;3',
-    '1660&ndash;83',
-    '1660&ndash;88',
     '1660,800',
-    '1660-1780',
-    '1660-1850',
-    '1660-1914',
-    '1660-1980',
-    '1660.',
-    '1661&ndash;1710',
-    '1661&ndash;1722',
-    '1661&ndash;1727',
-    '1661&ndash;1728',
-    '1661&ndash;1741',
-    '1661&ndash;3',
-    '1661&ndash;79',
-    '1661&ndash;after',
-    '16610',
-    '1662&ndash;1668',
     '1662&ndash;1692',
-    '1662&ndash;1729',
-    '1662&ndash;1741',
-    '1662&ndash;1742',
-    '1662&ndash;1752',
-    '1662&ndash;3',
-    '1662&ndash;4',
-    '1662s',
-    '1663&ndash;1737',
-    '1663&ndash;1741',
-    '1664&ndash;1726',
-    '1664&ndash;173',
-    '1665&ndash;1717',
-    '1665&ndash;1724',
-    '1665&ndash;1745',
-    '1665&ndash;6',
     '1665&ndash;66',
-    '1666&ndash;1668',
-    '1666&ndash;1726',
-    '1666&ndash;1737',
-    '1666&ndash;1738',
-    '1666&ndash;1885',
-    '1666&ndash;8',
-    '16667',
-    '1666mph',
-    '1667&ndash;1723',
-    '1667&ndash;1729',
-    '1667&ndash;1731',
-    '1667&ndash;1733',
-    '1667&ndash;68',
-    '1667&ndash;8',
-    '166713',
     '1667th',
-    '1668&ndash;1672',
-    '1668&ndash;1720',
-    '1668&ndash;1728',
-    '1668&ndash;71',
-    '1668&ndash;73',
-    '1668&ndash;74',
-    '1668&ndash;78',
-    '1669&ndash;1687',
-    '1669&ndash;74',
-    '1669&ndash;76',
-    '1669.',
-    '1669/70',
-    '16690',
-    '166c',
-    '166ins',
     '166kg',
-    '166lb',
-    '166pp',
-    '166sq.ft',
-    '167&deg;e',
-    '167&ndash;176',
-    '167&ndash;183',
-    '167&ndash;187',
-    '167&ndash;68',
-    '167&ndash;70',
-    '167&ndash;79',
-    '167&plus;10',
-    '167,000',
-    '167-clause',
-    '167-minute',
-    '167-year-old',
     '167.1',
-    '167.5p',
-    '167.6',
-    '167.9',
-    '167/169',
-    '1670%',
-    '1670&ndash;1',
-    '1670&ndash;1673',
-    '1670&ndash;1723',
-    '1670&ndash;1732',
-    '1670&ndash;1733',
-    '1670&ndash;1738',
-    '1670&ndash;1742',
-    '1670&ndash;1750',
-    '1670&ndash;5',
-    '1670/71',
     '1670m',
-    '1671&ndash;1713',
-    '1671&ndash;9',
-    '16710',
-    '167157',
-    '1672&ndash;1719',
-    '1672&ndash;1738',
-    '1672&ndash;1746',
-    '1672&ndash;1765',
-    '1672&ndash;3',
-    '1672&ndash;82',
-    '16720',
-    '1673&ndash;1733',
-    '1673&ndash;4',
-    '1674&ndash;1704',
-    '1674&ndash;1714',
     '1674&ndash;1726',
-    '1674&ndash;1738',
-    '1674&ndash;1756',
-    '1674&ndash;5',
-    '1674&ndash;6',
-    '1674&ndash;84',
-    '1674&ndash;86',
-    '16740',
-    '1675&ndash;1678',
-    '1675&ndash;1741',
-    '1675&ndash;1748',
-    '1675&ndash;1751',
-    '1675&ndash;7',
-    '1675&ndash;82',
-    '1675&ndash;88',
-    '1676&mdash;1700',
     '1676&ndash;88',
-    '1676,193',
-    '1677&ndash;1720',
-    '1677&ndash;1761',
-    '1678&ndash;1707',
-    '1678&ndash;88',
-    '16781315',
-    '16781323',
-    '1679&ndash;1729',
-    '1679&ndash;1747',
-    '1679&ndash;86',
-    '1679&ndash;89',
-    '1679.',
-    '1679/80',
-    '16790',
-    '167ft',
     '167g',
-    '167g1',
-    '167pp',
-    '167pp.',
-    '168&deg',
-    '168&ndash;5',
-    '168&ndash;560',
-    '168&ndash;70',
-    '168&ndash;71',
-    '168&ndash;72',
-    '168(3)',
-    '168(5)',
-    '168,000,000',
-    '168,298',
-    '168,300',
-    '168,600',
     '168-mile',
-    '168-page',
-    '168-pin',
-    '168-yard',
-    '168.5&ndash;193.8',
-    '1680&mdash;1715',
-    '1680&ndash;1',
-    '1680&ndash;1720',
-    '1680&ndash;1900',
-    '1680/1',
-    '1681&mdash;5',
-    '1681-1734',
-    '168102',
-    '168103',
-    '168104',
-    '168105',
     '168106',
-    '168107',
-    '168111',
-    '168113',
-    '168114',
-    '16818&ndash;2',
-    '1682&mdash;3',
-    '1682&ndash;1749',
-    '1682&ndash;1761',
-    '1682&ndash;1769',
-    '1682&ndash;1882',
-    '1682&ndash;3',
-    '1682&ndash;6',
-    '16826',
-    '1683&mdash;4',
-    '1683&ndash;1753',
     '1683&ndash;1765',
-    '1683&ndash;1894',
-    '1683&ndash;1983',
-    '16830',
-    '1684&ndash;1733',
-    '1684&ndash;5',
-    '1684&ndash;91',
-    '1684/678',
-    '1685&ndash;1700',
-    '1685&ndash;1717',
-    '1685&ndash;1753',
-    '1685&ndash;1759',
-    '1685&ndash;1772',
-    '1685&ndash;90',
-    '16851m',
-    '1686&ndash;1761',
     '1687&ndash;1743',
-    '1687&ndash;1765',
-    '1688&ndash',
-    '1688&ndash;1772',
-    '1688&ndash;1988',
-    '1688&ndash;71',
-    '1688&ndash;89',
-    '1688-1872',
-    '1688/9',
-    '16887',
-    '1689&mdash;1713',
-    '1689&mdash;90',
-    '1689&ndash;1700',
-    '1689&ndash;1728',
-    '1689&ndash;1761',
-    '1689&ndash;1775',
     '1689&ndash;1789',
-    '1689&ndash;1796',
-    '1689&ndash;1833',
-    '1689&ndash;1989',
-    '1689&ndash;91',
-    '1689&ndash;92',
-    '1689-1748',
-    '168mph',
-    '169&ndash;171',
-    '169&ndash;81',
-    '169,486',
-    '169,785',
-    '169-member',
-    '169-pin',
-    '169.40',
-    '1690&ndash;1',
     '1690&ndash;1692',
-    '1690&ndash;1695',
-    '1690&ndash;1720',
-    '1690&ndash;1740',
-    '1690&ndash;1745',
-    '1690&ndash;1760',
-    '1690&ndash;1766',
-    '1690&ndash;1840',
-    '1690&ndash;1850',
-    '1690&ndash;2',
-    '1690-1870',
-    '1690.76',
-    '16900',
-    '1691&ndash;1745',
-    '1691&ndash;1755',
-    '1691&ndash;1781',
     '1691,1692',
-    '169110',
-    '1692&mdash;98',
-    '1692&ndash;1733',
-    '1692\'5',
-    '1693&mdash;4',
-    '1693&ndash;1698',
-    '1693&ndash;4',
-    '1693&ndash;94',
-    '1694&mdash;96',
-    '1694&ndash;1702',
-    '1694&ndash;1746',
-    '1694&ndash;1764',
-    '1694&ndash;1768',
-    '1694&ndash;1775',
-    '1694&ndash;5',
     '1694-',
-    '1695&ndash;1709',
-    '1695&ndash;1713',
-    '1695&ndash;1730',
-    '1695&ndash;1733',
-    '1695&ndash;1743',
-    '1695&ndash;1749',
-    '1695&ndash;1763',
-    '1695&ndash;6',
-    '1695&ndash;8',
-    '16950',
-    '1696&ndash;1759',
-    '1696&ndash;1782',
-    '1696257',
-    '1697&ndash;1700',
-    '1697&ndash;1708',
     '1697&ndash;1711',
-    '1697&ndash;1717',
-    '1697&ndash;1748',
-    '1697&ndash;1750',
-    '1697&ndash;1769',
-    '1697&ndash;8',
-    '1698&mdash;1708',
-    '1698&ndash;1770',
-    '1698&ndash;1782',
-    '1698&ndash;9',
-    '1698-1787',
-    '1699&ndash;1708',
-    '1699&ndash;1779',
-    '16993',
-    '169c&ndash;d',
-    '169lb',
     '16:0',
-    '16:00.63.',
-    '16:00:02',
-    '16:00:25',
-    '16:00:31',
-    '16:02:05',
-    '16:02:18&ndash;0400',
-    '16:02:48',
-    '16:02:57',
-    '16:03:08',
-    '16:03:50',
-    '16:04',
-    '16:04:30',
-    '16:04:31',
-    '16:05:12',
-    '16:06:38',
     '16:07:13',
-    '16:07:31',
-    '16:07:44',
-    '16:09:03',
-    '16:09:25',
-    '16:1&ndash;2',
-    '16:10:05',
-    '16:10:45',
-    '16:12:44',
-    '16:13&ndash;15',
-    '16:13f',
-    '16:14&ndash;23',
-    '16:14,15',
-    '16:14:41',
-    '16:14:58',
-    '16:15',
     '16:15:12',
-    '16:15:28',
-    '16:15:52',
-    '16:16:13',
-    '16:17',
-    '16:17:26',
-    '16:19',
-    '16:19&ndash;31',
-    '16:19:01',
-    '16:19:27.69',
-    '16:19:32',
-    '16:19:43',
-    '16:19:46',
-    '16:19:53',
-    '16:20:04',
-    '16:21:07',
     '16:21:09',
-    '16:21:32',
-    '16:22:42',
-    '16:23',
-    '16:24:08.81',
-    '16:24:22',
-    '16:24:25',
-    '16:25',
-    '16:25:07',
-    '16:26',
-    '16:26f',
-    '16:27:09',
-    '16:27:31',
-    '16:27:36',
-    '16:27:58',
-    '16:28',
     '16:28:00',
-    '16:28:18&ndash;0500',
-    '16:28:19',
-    '16:28:35',
-    '16:29:10&ndash;0400',
-    '16:30:26',
-    '16:31:23',
-    '16:32',
-    '16:32:28',
-    '16:32:33',
-    '16:34:09',
-    '16:34:34',
-    '16:34:44',
-    '16:35',
-    '16:36',
-    '16:36:33',
     '16:37:53',
-    '16:38',
-    '16:38:20',
-    '16:38:30',
-    '16:41&ndash;48',
-    '16:41:36',
-    '16:42',
-    '16:42:09',
-    '16:42:37',
-    '16:43:05',
-    '16:43:11',
-    '16:43:30',
-    '16:43:54',
-    '16:44:12',
-    '16:44:55',
-    '16:45:08',
     '16:46',
-    '16:46:18',
-    '16:46:49',
-    '16:47',
-    '16:47:24&ndash;0400',
-    '16:47:41',
-    '16:48:59',
-    '16:49',
-    '16:49:49',
-    '16:5',
-    '16:50:06',
-    '16:51:32',
-    '16:51:56',
-    '16:52:20',
-    '16:52:22',
-    '16:52:28',
     '16:52:46',
-    '16:53',
-    '16:53:08',
-    '16:54:37&ndash;0400',
-    '16:54:50',
-    '16:55:02&ndash;0500',
-    '16:55:05',
-    '16:55:47',
-    '16:57:40&ndash;0500',
-    '16:58',
-    '16:58:36',
-    '16:58:42',
-    '16:59',
-    '16:59:02',
-    '16:6,7',
-    '16:7&ndash;11',
     '16:7f.',
-    '16_per',
-    '16bit',
-    '16c54',
-    '16d',
-    '16ff',
-    '16ft-high',
-    '16g',
-    '16hp',
-    '16hz',
-    '16i',
-    '16ins',
-    '16ka',
-    '16kg/s/ha',
-    '16khz',
-    '16km/60mls',
     '16kv',
-    '16l/2',
-    '16m&sup2/litre',
-    '16mbits',
-    '16miles',
-    '16min',
-    '16ml',
-    '16mpg',
-    '16p.christmas',
-    '16pc/16pc(f)',
-    '16r8',
-    '16rpm',
-    '16s-18s',
-    '16th&ndash;17th',
-    '16th-17th',
-    '16th-18th',
     '16th-placed',
-    '16th-seed',
-    '16thcentury',
-    '16the',
-    '16v.',
-    '16v8h-5',
-    '16v8z',
-    '16vi',
-    '16year-olds',
-    '17&aring',
-    '17&deg;16\'38\'\'w',
-    '17&frac12%',
-    '17&frac12;in',
-    '17&frac13&times;23&frac12&ins',
-    '17&frac14',
-    '17&frac34&ins',
     '17&frac34&times;23&frac12&ins',
-    '17&ft;6&ins',
-    '17&mdash;19',
-    '17&middot;2',
-    '17&middot;9',
-    '17&ndash;01&ndash;584',
-    '17&ndash;02',
-    '17&ndash;06',
-    '17&ndash;08&ndash;8184',
-    '17&ndash;08&ndash;8522',
-    '17&ndash;11-',
-    '17&ndash;12',
-    '17&ndash;18.30',
-    '17&ndash;18:diagram/figure',
-    '17&ndash;18th',
-    '17&ndash;19.30',
     '17&ndash;19th',
-    '17&ndash;2&ndash;66&ndash;1',
-    '17&ndash;21&ndash;967',
-    '17&ndash;23/2/41',
-    '17&ndash;25',
-    '17&ndash;25th',
-    '17&ndash;28',
-    '17&ndash;29',
-    '17&ndash;29%',
-    '17&ndash;31',
-    '17&ndash;34',
-    '17&ndash;35-year-old',
-    '17&ndash;37',
-    '17&ndash;39',
-    '17&ndash;45',
-    '17&ndash;5&ndash;42&ndash;5',
     '17&ndash;55',
-    '17&ndash;59',
-    '17&ndash;6&ndash;1848',
-    '17&ndash;7-',
-    '17&ndash;70',
-    '17&ndash;74',
-    '17&ndash;oct',
-    '17&ndash;sept',
-    '17&ndash;wednesday',
-    '17&plus',
-    '17&plus;1',
-    '17&sol;74',
-    '17\'',
-    '17\'n',
-    '17(-)',
-    '17(10)',
     '17(12)',
-    '17(15)',
-    '17(5)',
-    '17(i)',
-    '17(ii)',
-    '17**',
-    '17+2',
-    '17,000-foot',
-    '17,000-seat',
-    '17,000km',
-    '17,000rpm',
-    '17,035',
-    '17,039',
-    '17,057',
-    '17,071',
-    '17,084',
     '17,103,588',
-    '17,138',
-    '17,174',
-    '17,175.53',
-    '17,18',
-    '17,18,19,20,21,22,25',
-    '17,18,20',
-    '17,185',
-    '17,187',
-    '17,1987',
-    '17,1992',
-    '17,200,000',
-    '17,200,722',
-    '17,280',
-    '17,29',
-    '17,290',
     '17,300yr',
-    '17,351',
-    '17,367',
-    '17,379',
-    '17,415',
-    '17,430',
-    '17,439',
-    '17,462',
-    '17,495',
-    '17,500,000',
-    '17,500,000&mdash;more',
-    '17,500ft',
-    '17,512,610',
-    '17,528',
-    '17,585',
-    '17,600',
     '17,600,000',
-    '17,640',
-    '17,657',
-    '17,657,000',
-    '17,787',
-    '17,791.55',
-    '17,850',
-    '17,850.66',
-    '17,868',
-    '17,880',
-    '17,936',
-    '17,948.01',
-    '17,977',
-    '17-13',
-    '17-14',
-    '17-16',
     '17-24',
-    '17-25',
-    '17-27',
-    '17-29',
-    '17-30',
-    '17-31',
-    '17-6',
-    '17-7',
-    '17-8',
-    '17-9',
-    '17-and-a-half',
-    '17-bar',
-    '17-bed',
-    '17-day-old',
-    '17-er',
-    '17-fold',
     '17-foot',
-    '17-goal',
-    '17-horse',
-    '17-km',
-    '17-mile',
-    '17-month-long',
-    '17-nation',
-    '17-page',
-    '17-per-cent',
-    '17-percentage-point',
-    '17-state',
-    '17-stop',
-    '17-to-18',
-    '17-ton',
-    '17-under',
-    '17-week',
     '17-year&rehy;olds',
-    '17-years-old',
-    '17.00&ndash;18.45',
-    '17.00.',
-    '17.000',
-    '17.04',
-    '17.05%',
-    '17.06',
-    '17.07',
-    '17.08',
-    '17.09',
-    '17.09.1',
-    '17.1&ndash;7',
-    '17.1&times;26',
-    '17.1.3',
-    '17.1.89',
     '17.10-11',
-    '17.10.1',
-    '17.12.92',
-    '17.16m',
-    '17.1g-bytes-per-second',
-    '17.1hh',
-    '17.1pc',
-    '17.2(a)',
-    '17.2(b)',
-    '17.2(c)',
-    '17.2.1',
-    '17.2.2.2',
-    '17.2.2.2.',
-    '17.2.6',
-    '17.2.6.1',
-    '17.2.7',
     '17.2.92',
-    '17.21',
-    '17.22',
-    '17.25h',
-    '17.25p',
-    '17.27',
-    '17.27pc',
-    '17.2hh',
-    '17.2pc',
-    '17.3(a)',
-    '17.3(b)',
-    '17.3.1',
-    '17.3.2',
-    '17.3.3',
-    '17.3.4',
-    '17.3.49',
     '17.3.5',
-    '17.3.6',
-    '17.30&ndash;18.30',
-    '17.3147',
-    '17.33',
-    '17.36',
-    '17.3701',
-    '17.38',
-    '17.39',
-    '17.3hh',
-    '17.3kg',
-    '17.4&times;10',
-    '17.4.86',
-    '17.4.95&ndash;23.6.95',
-    '17.44p',
-    '17.46',
     '17.47%',
-    '17.4k',
-    '17.5&deg;dh',
-    '17.5&ndash;38.3',
-    '17.5&ndash;48.3',
-    '17.5.3',
-    '17.5.4',
-    '17.51',
-    '17.52',
-    '17.54',
-    '17.55',
-    '17.563',
-    '17.58',
-    '17.5_per',
-    '17.5cm',
-    '17.5kg',
     '17.5kgs',
-    '17.5mb',
-    '17.5mpg',
-    '17.5mph',
-    '17.5pts',
-    '17.6&ndash;17.8',
-    '17.6-gallon',
-    '17.6.1',
-    '17.6.2',
-    '17.6.4',
-    '17.6.89',
-    '17.62',
-    '17.63',
-    '17.64',
-    '17.64%',
-    '17.66',
     '17.68',
-    '17.68%',
-    '17.69',
-    '17.6fl.',
-    '17.6p',
-    '17.6pc',
-    '17.7.81',
-    '17.70',
-    '17.71',
-    '17.74in',
-    '17.75',
-    '17.75in',
-    '17.7secs',
-    '17.7x',
-    '17.8&ndash;38.7',
-    '17.8&times;25.4',
     '17.8&times;35.5',
-    '17.8+53.2/-13.8%',
-    '17.8.93',
-    '17.83',
-    '17.83p',
-    '17.85p',
-    '17.85pc',
-    '17.9.91',
-    '17.98%',
-    '17/',
-    '17/10/89',
-    '17/10/92',
-    '17/2',
-    '17/2/87',
-    '17/21',
-    '17/29',
     '17/3/41',
-    '17/3/93',
-    '17/321',
-    '17/34',
-    '17/551',
-    '17/595',
-    '17/68',
-    '17/8/93',
-    '17/9/90',
-    '17/92',
-    '17/93',
-    '17/971',
-    '17/l',
-    '17/napp',
-    '170&deg',
-    '170&deg;c/325&deg;f/gas',
     '170&frac12',
-    '170&mdash;1',
-    '170&mdash;3',
-    '170&mgr;m',
-    '170&micro;a',
-    '170&micro;h',
-    '170&ndash',
-    '170&ndash;1348',
-    '170&ndash;2',
-    '170&sol;82',
-    '170(1)',
-    '170,000,000',
-    '170-180.',
-    '170-member',
-    '170-metre',
-    '170-mph',
     '170-odd',
-    '170-place',
-    '170-seat',
-    '170-yard',
-    '170.0',
-    '170.25',
-    '170.4',
-    '170.5',
-    '170.8',
-    '170/105',
-    '170/127',
-    '170/181',
-    '1700%',
-    '1700&mdash',
-    '1700&ndash;1100',
-    '1700&ndash;1600',
     '1700&ndash;1710',
-    '1700&ndash;1744',
-    '1700&ndash;1746',
-    '1700&ndash;1752',
-    '1700&ndash;1776',
-    '1700&ndash;1780',
-    '1700&ndash;1789',
-    '1700&ndash;1830',
-    '1700&ndash;1850',
-    '1700&ndash;2',
-    '1700&ndash;25',
-    '1700&ndash;48',
-    '1700&ndash;63',
-    '1700\'s',
-    '1700000',
-    '17000259',
     '17000260',
-    '1700km',
-    '1700n',
-    '1700rpm',
-    '1700s/early',
-    '1701&mdash;2',
-    '1701&ndash;1760',
-    '1701&ndash;1776',
-    '1701&ndash;1981',
-    '1701&ndash;8',
-    '1701-75',
-    '1702&mdash;4',
-    '1702&ndash;11',
-    '1702&ndash;1711',
-    '1702&ndash;1714',
-    '1702&ndash;1768',
     '1702&ndash;1777',
-    '1702&ndash;24',
-    '1702&ndash;5',
-    '1702&ndash;8',
-    '1702&ndash;89',
-    '1702-1714',
-    '1703&ndash;13',
-    '1703&ndash;17',
-    '1703&ndash;1752',
-    '1703&ndash;1758',
-    '1703&ndash;1761',
-    '1703&ndash;1791',
-    '1703&ndash;84',
-    '1704&ndash;06',
-    '1704&ndash;1741',
-    '1704&ndash;1786',
     '1704&ndash;1804',
-    '1704&ndash;5',
-    '1704&ndash;8',
-    '170430',
-    '1705&mdash;06',
-    '1705&ndash;1731',
-    '1705&ndash;1747',
-    '1705&ndash;1752',
-    '1705&ndash;1780',
-    '1705&ndash;1785',
-    '1705&ndash;57',
-    '1705&ndash;8',
-    '1706&ndash;11',
-    '1706&ndash;12',
-    '1706&ndash;14',
-    '1706&ndash;1790',
     '1706&ndash;32',
-    '1706&ndash;44',
-    '1706&ndash;50',
-    '1706&ndash;7',
-    '1706&ndash;75',
-    '1706&ndash;84',
-    '1706,1707',
-    '17060',
-    '170600671',
-    '1707&ndash;10',
-    '1707&ndash;14',
-    '1707&ndash;1712',
-    '1707&ndash;1764',
-    '1707&ndash;1778',
-    '1707&ndash;1780',
-    '1707&ndash;54',
     '1707&ndash;98',
-    '1707.',
-    '1708&mdash;10',
-    '1708&ndash;13',
-    '1708&ndash;1770',
-    '1708&ndash;1788',
-    '1708&ndash;1789',
-    '1708&ndash;22',
-    '1708&ndash;78',
-    '1708&ndash;9',
-    '17088522',
-    '1709&ndash;10',
-    '1709&ndash;11',
-    '1709&ndash;1784',
-    '1709&ndash;84',
-    '1709-31',
     '17090',
-    '170968',
-    '170:1',
-    '170a',
-    '170c/340f',
-    '170cm',
-    '170g/6oz',
-    '170lb',
-    '170ml',
-    '170mm',
-    '170mw',
-    '170o',
-    '170x170mm',
-    '171&frac12',
-    '171&mdash;172',
-    '171&ndash;172',
     '171&ndash;210',
-    '171&ndash;3',
-    '171&ndash;82',
-    '171&ndash;89',
-    '171&ndash;9',
-    '171-km',
-    '171-yard',
-    '171.7%',
-    '1710&mdash;23',
-    '1710&ndash;11',
-    '1710&ndash;1570',
-    '1710&ndash;1714',
-    '1710&ndash;1754/5',
-    '1710&ndash;1762',
-    '1710&ndash;1779',
-    '1710&ndash;1781',
     '1710&ndash;1796',
-    '1710&ndash;21',
-    '1710&ndash;62',
-    '1710&ndash;87',
-    '1711&mdash;12',
-    '1711&mdash;13',
-    '1711&mdash;14',
-    '1711&ndash;12',
-    '1711&ndash;1783',
-    '1711&ndash;65',
-    '1711&ndash;74',
-    '1711&ndash;87',
-    '1711&ndash;89',
-    '1712&ndash;13',
-    '1712&ndash;15',
-    '1712&ndash;1778',
     '1712&ndash;1779',
-    '1712&ndash;1780',
-    '1712&ndash;1790',
-    '1712&ndash;1792',
-    '17120',
-    '17121',
-    '1713&mdash;14',
-    '1713&ndash;1763',
-    '1713&ndash;1782',
-    '1713&ndash;1786',
-    '1713&ndash;19',
-    '1713&ndash;23',
-    '1713&ndash;40',
-    '1713&ndash;42',
-    '1713/14',
-    '1714&mdash;17',
     '1714&mdash;21',
-    '1714&ndash;15',
-    '1714&ndash;16',
-    '1714&ndash;1794',
-    '1714&ndash;18',
-    '1714&ndash;1830',
-    '1714&ndash;21',
-    '1714&ndash;60',
-    '1714&ndash;61',
-    '1714&ndash;87',
-    '1714&ndash;99',
-    '1714-1800',
-    '1714/15',
-    '1715&ndash;16',
-    '1715&ndash;17',
-    '1715&ndash;1756',
     '1715&ndash;1759',
-    '1715&ndash;1786',
-    '1715&ndash;18',
-    '1715&ndash;20',
-    '1715&ndash;21',
-    '1715&ndash;45',
-    '17159-61',
-    '1716&ndash;1772',
-    '1716&ndash;1794',
-    '1716&ndash;18',
-    '1716&ndash;35',
-    '1716&ndash;93',
-    '1717&mdash;1810',
-    '1717&mdash;30',
-    '1717&ndash;1788',
-    '1717&ndash;18',
     '1717&ndash;19',
-    '1717&ndash;24',
-    '1717&ndash;38',
-    '1717&ndash;80',
-    '1717-1ga',
-    '1717/18&ndash;1772',
-    '1718&mdash;22',
-    '1718&ndash;1800',
-    '1718&ndash;1838',
-    '1718&ndash;1843',
-    '1718&ndash;19',
-    '1718&ndash;82',
-    '1718579',
-    '1719&mdash;21',
-    '1719&ndash;1784',
-    '1719&ndash;1787',
     '1719&ndash;1792',
-    '1719&ndash;1800',
-    '1719&ndash;21',
-    '1719&ndash;81',
-    '1719&ndash;88',
-    '1719&ndash;96',
-    '171a',
-    '171e',
-    '171th',
-    '172%',
-    '172&ndash;4',
-    '172&ndash;6',
-    '172&ndash;73',
-    '172&ndash;8',
-    '172&ndash;82',
-    '172&ndash;83',
     '172&ndash;9',
-    '172,000,000',
-    '172-tonne',
-    '172.1',
-    '172.72',
-    '172/112',
-    '1720&mdash;40',
-    '1720&ndash;1',
-    '1720&ndash;1742',
-    '1720&ndash;1760',
-    '1720&ndash;1783/4',
-    '1720&ndash;1789',
-    '1720&ndash;1808',
-    '1720&ndash;2',
-    '1720&ndash;21',
-    '1720&ndash;39',
     '1720&ndash;72',
-    '1720&ndash;78',
-    '1720&ndash;95',
-    '1721&ndash;1739',
-    '1721&ndash;1765',
-    '1721&ndash;1802',
-    '1721&ndash;2',
-    '1721&ndash;42',
-    '1721&ndash;6',
-    '1722&ndash;1746',
-    '1722&ndash;1799',
-    '1722&ndash;1800',
-    '1722&ndash;1839',
-    '1722&ndash;63',
-    '1722&ndash;71',
-    '1722-1844',
     '17221',
-    '17223',
-    '1723&ndash;1761',
-    '1723&ndash;1777',
-    '1723&ndash;1790',
-    '1723&ndash;1796',
-    '1723&ndash;38',
-    '1723&ndash;5',
-    '1723&ndash;7',
-    '1723&ndash;76',
-    '1723&ndash;90',
-    '1723&ndash;91',
-    '1723&ndash;post',
-    '1723\'s',
-    '1724&ndash',
-    '1724&ndash;25',
     '1724&ndash;40',
-    '1724&ndash;6',
-    '1724&ndash;8',
-    '1724&ndash;9',
-    '17246m',
-    '172470',
-    '1725&mdash;6',
-    '1725&ndash;1801',
-    '1725&ndash;1803',
-    '1725&ndash;1809',
-    '1725&ndash;1810',
-    '1725&ndash;1813',
-    '1725&ndash;27',
-    '1725&ndash;29',
-    '1725&ndash;30',
-    '1725&ndash;38',
     '1725&ndash;44',
-    '1725&ndash;47',
-    '1725&ndash;6',
-    '1725&ndash;75',
-    '1725&ndash;9',
-    '1725&ndash;95',
-    '1725mw',
-    '1726&ndash;1782',
-    '1726&ndash;1804',
-    '1726&ndash;43',
-    '1726&ndash;84',
-    '1726&ndash;9',
-    '1726&ndash;95',
-    '1726-1989',
-    '17260',
-    '17261727',
     '1727&mdash;9',
-    '1727&ndash;1784',
-    '1727&ndash;1793',
-    '1727&ndash;1805',
-    '1727&ndash;55',
-    '1727&ndash;83',
-    '1727&ndash;9',
-    '1727&ndash;96',
-    '1727&ndash;99',
-    '1727-80',
-    '1728&ndash;1788',
-    '1728&ndash;1793',
-    '1728&ndash;31',
-    '1728&ndash;32',
-    '1728&ndash;79',
-    '1728&ndash;9',
     '1728&ndash;90',
-    '1728&ndash;92',
-    '1728&ndash;95',
-    '1728-1800',
-    '1729&ndash;1777',
-    '1729&ndash;1804',
-    '1729&ndash;1865',
-    '1729&ndash;30',
-    '1729&ndash;39',
-    '1729&ndash;40',
-    '1729&ndash;47',
-    '1729&ndash;81',
-    '1729&ndash;97',
-    '172ff',
-    '172ft',
-    '172lb',
     '173%',
-    '173&deg',
-    '173&ndash;174',
-    '173&ndash;176',
-    '173&ndash;7',
-    '173&ndash;8',
-    '173&ndash;96',
-    '173,015',
-    '173,062',
-    '173,700,000',
-    '173,800',
-    '173-175',
-    '173.0g',
-    '173.5x173',
-    '173.8%',
-    '173.9%',
     '173/175',
-    '1730&ndash;1793',
-    '1730&ndash;1803',
-    '1730&ndash;1860',
-    '1730&ndash;1960',
-    '1730&ndash;40',
-    '1730&ndash;45',
-    '1730&ndash;47',
-    '1730&ndash;54',
-    '1730&ndash;65',
-    '1730&ndash;74',
-    '1730&ndash;8',
-    '1730&ndash;82',
-    '1730-1990',
-    '1730/1830',
-    '1731&ndash;1800',
     '1731&ndash;1808',
-    '1731&ndash;2',
-    '1731&ndash;40',
-    '1731&ndash;92',
-    '1731.',
-    '17310',
-    '1732&ndash;1799',
-    '1732&ndash;1811',
-    '1732&ndash;1812',
-    '1732&ndash;34',
-    '1732&ndash;40',
-    '1732&ndash;5',
-    '1732&ndash;96',
-    '1733&ndash;1801',
-    '1733&ndash;1804',
-    '1733&ndash;1806',
     '1733&ndash;1821',
-    '1733&ndash;34',
-    '1733&ndash;5',
-    '1733&ndash;6',
-    '17332',
-    '1734&ndash;1771',
-    '1734&ndash;1793',
-    '1734&ndash;1794',
-    '1734&ndash;48',
-    '1734&ndash;5',
-    '1735&ndash;1753',
-    '1735&ndash;1782',
-    '1735&ndash;1803',
-    '1735&ndash;1805',
-    '1735&ndash;1812',
-    '1735&ndash;1814',
     '1735&ndash;1819',
-    '1735&ndash;1821',
-    '1735&ndash;1835',
-    '1735&ndash;6',
-    '1735&ndash;82',
-    '1735-1818',
-    '1736&ndash;1802',
-    '1736&ndash;1814',
-    '1736&ndash;1816',
-    '1736&ndash;65',
-    '1736&ndash;82',
-    '1736()/n/164',
-    '1737&ndash;1799',
-    '1737&ndash;1805',
-    '1737&ndash;1806',
-    '1737&ndash;1807',
     '1737&ndash;94',
-    '1737.',
-    '1738&ndash;1822',
-    '1738&ndash;1839',
-    '1738&ndash;40',
-    '1738&ndash;9',
-    '1738&ndash;94',
-    '1738-1804',
-    '1738/9&ndash;1810',
-    '1739&mdash;40',
-    '1739&ndash;1763',
-    '1739&ndash;43',
-    '1739&ndash;48',
-    '1739&ndash;97',
-    '1739/40',
-    '173d12',
     '173f',
-    '173m',
-    '173x98.5',
-    '174%',
-    '174&ndash;87',
-    '174&plusmn;27',
-    '174,832,000',
-    '174-member',
-    '174-seater',
-    '174.',
-    '174.4%',
-    '174.5km',
-    '174/l',
-    '1740&mdash;1',
-    '1740&ndash;1755',
-    '1740&ndash;1794',
     '1740&ndash;1795',
-    '1740&ndash;1803',
-    '1740&ndash;1818',
-    '1740&ndash;1821',
-    '1740&ndash;2',
-    '1740&ndash;4',
-    '1740&ndash;44',
-    '1740&ndash;93',
-    '1740\'s',
-    '1740/1',
-    '17400',
-    '1741&ndash;1789',
-    '1741&ndash;1811',
-    '1741&ndash;1820',
-    '1741&ndash;1825',
-    '1741&ndash;1828',
     '1741&ndash;42',
-    '1741&ndash;48',
-    '1741&ndash;61',
-    '1741&ndash;90',
-    '1741&ndash;99',
-    '17410',
-    '1742&ndash;1801',
-    '1742&ndash;1810',
-    '1742&ndash;5',
-    '1742&ndash;7',
-    '17420',
-    '1743&ndash;1803',
-    '1743&ndash;1811',
-    '1743&ndash;1813',
-    '1743&ndash;1821',
-    '1743&ndash;1826',
     '1743&ndash;1830',
-    '1743&ndash;57',
-    '17430',
-    '1744&ndash;1829',
-    '1744&ndash;1835',
-    '1744&ndash;47',
-    '1744&ndash;5',
-    '1744&ndash;63',
-    '1744&ndash;8',
-    '1744-1786',
-    '17449',
-    '1745&ndash;1816',
-    '1745&ndash;1824',
-    '1745&ndash;1828',
-    '1745&ndash;1829',
-    '1745&ndash;1831',
     '1745&ndash;1832',
-    '1745&ndash;1856',
-    '1745&ndash;46',
-    '1745&ndash;7',
-    '1745&ndash;9',
-    '1745-49',
-    '1746&ndash;1799',
-    '1746&ndash;8',
-    '1746&ndash;94',
-    '1746&ndash;post',
-    '1747&ndash;1765',
-    '1747&ndash;1823',
-    '1747&ndash;1833',
-    '1747&ndash;48',
-    '1747&ndash;54',
-    '1747&ndash;83',
     '1747&ndash;92',
-    '1747&ndash;94',
-    '17470',
-    '1748&ndash;1804',
-    '1748&ndash;1810',
-    '1748&ndash;89',
-    '1748-1816',
-    '17480',
-    '1749&mdash',
-    '1749&ndash;1799',
-    '1749&ndash;1802',
-    '1749&ndash;1830',
-    '1749&ndash;1836',
-    '1749&ndash;1932',
-    '1749&ndash;60',
-    '1749/50',
     '174e',
-    '174lbs',
-    '174th',
-    '175&deg;5\'e',
-    '175&mdash;half',
-    '175&mgr;gml',
-    '175&ndash;176',
-    '175&ndash;2',
-    '175&ndash;225g/6&ndash;8oz',
-    '175&ndash;6',
-    '175&ndash;8',
-    '175&ndash;82',
-    '175&ndash;85',
-    '175&ndash;92',
-    '175(1)',
-    '175,301',
     '175,800,000',
-    '175,925',
-    '175-10',
-    '175-bed',
-    '175-hectare',
-    '175.2',
-    '175.5',
-    '175.8',
-    '175/569',
-    '175/60',
-    '175/65',
-    '1750&mdash;70',
-    '1750&ndash;1',
-    '1750&ndash;1780',
-    '1750&ndash;1793',
-    '1750&ndash;1811',
     '1750&ndash;1818',
-    '1750&ndash;1825',
-    '1750&ndash;1830',
-    '1750&ndash;1900',
-    '1750&ndash;191',
-    '1750&ndash;1918',
-    '1750&ndash;1920',
-    '1750&ndash;1993',
-    '1750&ndash;51',
-    '1750&ndash;56',
-    '1750&ndash;58',
-    '1750&ndash;63',
-    '1750&ndash;77',
-    '1750&ndash;90',
-    '1750&ndash;91',
-    '1750-',
     '1750-1815',
-    '17501-05',
-    '17505',
-    '1751&ndash;1771',
-    '1751&ndash;1812',
-    '1751&ndash;1829',
-    '1751&ndash;1836',
-    '1751&ndash;1851',
-    '1751&ndash;2',
-    '1751&ndash;3',
-    '1751&ndash;50',
-    '1751&ndash;64',
-    '1751&ndash;7',
-    '1751-65',
-    '1751/2',
-    '1752&ndash;1812',
     '1752&ndash;1817',
-    '1752&ndash;1826',
-    '1752&ndash;1831',
-    '1752&ndash;1832',
-    '1752&ndash;1837',
-    '1752&ndash;1842',
-    '1752&ndash;3',
-    '1752&ndash;4',
-    '1753&ndash;1781',
-    '1753&ndash;1828',
-    '1753&ndash;1833',
-    '1753&ndash;4',
-    '1753.',
-    '17531828',
-    '1754&mdash;5',
-    '1754&mdash;7',
     '1754&ndash;1828',
-    '1754&ndash;1832',
-    '1754&ndash;1835',
-    '1754&ndash;55',
-    '1754&ndash;60',
-    '1754&ndash;61',
-    '1755&ndash;1794',
-    '1755&ndash;1826',
-    '1755&ndash;1831',
-    '1755&ndash;1832',
-    '1755&ndash;56',
-    '1755&ndash;6',
-    '1755&ndash;65',
-    '1755&ndash;67',
-    '1755&ndash;7',
-    '17550',
     '1756&mdash;1836',
-    '1756&mdash;61',
-    '1756&ndash;1778',
-    '1756&ndash;1811',
-    '1756&ndash;1816',
-    '1756&ndash;1829',
-    '1756&ndash;1832',
-    '1756&ndash;1835',
-    '1756&ndash;1837',
-    '1756&ndash;1871',
-    '1756&ndash;78',
-    '1756&ndash;91',
-    '1757&mdash;1834',
-    '1757&ndash;1822',
-    '1757&ndash;1833',
-    '1757&ndash;1836',
     '1757&ndash;1844',
-    '1757&ndash;58',
-    '1757&ndash;63',
-    '1757&ndash;67',
-    '1758&ndash;1773',
-    '1758&ndash;1826',
-    '1758&ndash;1832',
-    '1758&ndash;60',
-    '1758&ndash;62',
-    '1758&ndash;70',
-    '1758.',
-    '1759&ndash;1806',
-    '1759&ndash;1808',
-    '1759&ndash;1813',
-    '1759&ndash;1819',
-    '1759&ndash;1824',
     '1759&ndash;1829',
-    '1759&ndash;1834',
-    '1759&ndash;1835',
-    '1759&ndash;1857',
-    '1759&ndash;1918',
-    '1759&ndash;66',
-    '1759&ndash;88',
-    '1759&ndash;96',
-    '1759&ndash;97',
-    '17590',
-    '175b&ndash;c',
-    '175g(6oz)',
-    '175g/6oz/&frac23',
-    '175g/6oz/1',
-    '175g/6oz/1&frac12',
-    '175kcals',
     '175kg',
-    '175kts',
-    '175m',
-    '175o',
-    '176&ndash;177',
-    '176&ndash;196',
-    '176&ndash;8',
-    '176&ndash;9',
-    '176&ndash;96',
-    '176,228',
-    '176,700',
-    '176,800',
-    '176,900',
-    '176-pin',
-    '176/111',
-    '176/207',
     '1760&mdash;1770',
-    '1760&mdash;1820',
-    '1760&mdash;5',
-    '1760&ndash;1790',
-    '1760&ndash;1823',
-    '1760&ndash;1825',
-    '1760&ndash;1836',
-    '1760&ndash;1839',
-    '1760&ndash;1843',
-    '1760&ndash;1930',
-    '1760&ndash;66',
-    '1760&ndash;80',
-    '1760&ndash;95',
-    '1760-1837',
-    '176000',
-    '17605',
     '1761&mdash;90',
-    '1761&ndash;1807',
-    '1761&ndash;1810',
-    '1761&ndash;1843',
-    '1761&ndash;1844',
-    '1761&ndash;62',
-    '1761&ndash;80',
-    '1761171',
-    '1761cc',
-    '1762&ndash;1800',
-    '1762&ndash;1812',
-    '1762&ndash;1814',
-    '1762&ndash;1834',
-    '1762&ndash;1842',
-    '1762&ndash;1850',
-    '1762&ndash;1851',
     '1762&ndash;1911',
-    '1762&ndash;1929',
-    '1762&ndash;72',
-    '1762&ndash;96',
-    '1763&ndash;1766',
-    '1763&ndash;1769',
-    '1763&ndash;1804',
-    '1763&ndash;1808',
-    '1763&ndash;1823',
-    '1763&ndash;1833',
-    '1763&ndash;1843',
-    '1763/4',
-    '17630',
-    '1764&ndash;1802',
-    '1764&ndash;1823',
-    '1764&ndash;1826',
     '1764&ndash;1828',
-    '1764&ndash;1839',
-    '1764&ndash;1840',
-    '1764&ndash;5',
-    '1764&ndash;72',
-    '1764&ndash;8',
-    '17640',
-    '1764cc',
-    '1765&mdash;6',
-    '1765&ndash;1817',
-    '1765&ndash;1837',
-    '1765&ndash;1838',
-    '1765&ndash;1841',
-    '1765&ndash;1845',
-    '1765&ndash;1846',
-    '1765&ndash;1985',
     '1765&ndash;4106',
-    '1765-66',
-    '1766&mdash;7',
-    '1766&ndash;1824',
-    '1766&ndash;1826',
-    '1766&ndash;1837',
-    '1766&ndash;1838',
-    '1766&ndash;73',
-    '1766&ndash;77',
-    '1766&ndash;90',
-    '1766-67',
-    '176651',
-    '1767&mdash',
-    '1767&ndash;1769',
-    '1767&ndash;1794',
-    '1767&ndash;1800',
     '1767&ndash;1825',
-    '1767&ndash;1827',
-    '1767&ndash;1840',
-    '1767&ndash;1849',
-    '1768&ndash;1771',
-    '1768&ndash;1834',
-    '1768&ndash;1835',
-    '1768&ndash;1842',
-    '1768&ndash;1847',
-    '1768&ndash;1851',
-    '1768&ndash;1854',
-    '1768&ndash;1855',
-    '1768&ndash;69',
-    '1768&ndash;71',
-    '1768&ndash;72',
-    '1768&ndash;74',
     '1768&ndash;78',
-    '17680',
-    '1769&mdash;73',
-    '1769&ndash;1771',
-    '1769&ndash;1773',
-    '1769&ndash;1821',
-    '1769&ndash;1833',
-    '1769&ndash;1837',
-    '1769&ndash;1859',
-    '1769&ndash;1897',
-    '1769&ndash;74',
-    '1769&ndash;75',
-    '1769&ndash;76',
-    '1769&ndash;90',
-    '1769/70',
-    '17691859',
     '176:8',
-    '176d&ndash;e',
-    '176lb',
-    '176m',
-    '176mb',
-    '176w',
-    '177%',
-    '177&deg',
-    '177&mdash;82',
-    '177&ndash;179',
-    '177&ndash;183&deg;c',
-    '177&ndash;4',
-    '177&ndash;83',
-    '177(2)',
-    '177,352',
-    '177,631,159',
     '177,942',
-    '177-member',
-    '177.305',
-    '177.7m',
-    '177.8&deg',
-    '1770&ndash',
-    '1770&ndash;1',
-    '1770&ndash;1812',
-    '1770&ndash;1813',
-    '1770&ndash;1827',
-    '1770&ndash;1830',
-    '1770&ndash;1835',
-    '1770&ndash;1840',
-    '1770&ndash;1843',
-    '1770&ndash;1844',
-    '1770&ndash;1845',
     '1770&ndash;1847',
-    '1770&ndash;1851',
-    '1770&ndash;1870',
-    '1770&ndash;5',
-    '1770&ndash;71',
-    '1770&ndash;74',
-    '1770&ndash;82',
-    '1770&ndash;88',
-    '1770&ndash;89',
-    '1770&ndash;97',
-    '1770/1',
-    '1770/71',
-    '17700',
-    '1770kg',
-    '1771&mdash;3',
-    '1771&ndash;1832',
     '1771&ndash;1843',
-    '1771&ndash;1845',
-    '1771&ndash;1848',
-    '1771&ndash;1850',
-    '1771&ndash;1858',
-    '1771&ndash;1862',
-    '1771&ndash;74',
-    '1771\'s',
-    '177110',
-    '1772&ndash',
-    '1772&ndash;1808',
-    '1772&ndash;1827',
-    '1772&ndash;1828',
-    '1772&ndash;1842',
-    '1772&ndash;1844',
-    '1772&ndash;3',
     '1772&ndash;5',
-    '1772&ndash;6',
-    '1772&ndash;73',
-    '1772&ndash;74',
-    '1772-page',
-    '1773&mdash;in',
-    '1773&ndash;1774',
-    '1773&ndash;1777',
-    '1773&ndash;1812',
-    '1773&ndash;1814',
-    '1773&ndash;1822',
-    '1773&ndash;1829',
-    '1773&ndash;1855',
-    '1773&ndash;1857',
-    '1773&ndash;1860',
-    '1773&ndash;1861',
     '1773&ndash;5',
-    '1773&ndash;85',
-    '1773&ndash;89',
-    '1773&ndash;92',
-    '1773.',
-    '1773/4',
-    '1774&mdash;5',
-    '1774&mdash;76',
-    '1774&ndash;1775',
-    '1774&ndash;1834',
-    '1774&ndash;1841',
-    '1774&ndash;1842',
-    '1774&ndash;1862',
-    '1774&ndash;5',
-    '1774&ndash;75',
-    '1774&ndash;8',
     '1774&ndash;80',
-    '1774&ndash;87',
-    '1775&mdash;8',
-    '1775&ndash;1777',
-    '1775&ndash;1802',
-    '1775&ndash;1804',
-    '1775&ndash;1830',
-    '1775&ndash;1833',
-    '1775&ndash;1848',
-    '1775&ndash;1851',
-    '1775&ndash;80',
-    '1775&ndash;83',
-    '1775&ndash;84',
-    '1775&ndash;89',
-    '1775&ndash;9',
-    '177519',
     '1775c',
-    '1776&mdash;83',
-    '1776&ndash;1792',
-    '1776&ndash;1801',
-    '1776&ndash;1806',
-    '1776&ndash;1832',
-    '1776&ndash;1845',
-    '1776&ndash;1847',
-    '1776&ndash;1851',
-    '1776&ndash;1860',
-    '1776&ndash;7',
-    '1776&ndash;80',
-    '1776&ndash;92',
-    '1776-7',
-    '1777&ndash;1779',
-    '1777&ndash;1836',
     '1777&ndash;1837',
-    '1777&ndash;1853',
-    '1777&ndash;9',
-    '1777&ndash;98',
-    '177722',
-    '177770',
-    '1778&ndash;1837',
-    '1778&ndash;1841',
-    '1778&ndash;1846',
-    '1778&ndash;1847',
-    '1778&ndash;1848',
-    '1778&ndash;1849',
-    '1778&ndash;1850',
-    '1778&ndash;1855',
-    '1778&ndash;1868',
-    '1778&ndash;1978',
     '1778&ndash;83',
-    '1778&ndash;88',
-    '17780',
-    '1779&mdash;82',
-    '1779&ndash;1830',
-    '1779&ndash;1835',
-    '1779&ndash;1844',
-    '1779&ndash;1851',
-    '1779&ndash;1878',
-    '1779&ndash;81',
-    '177b/177rg',
-    '177c',
-    '177ff.',
-    '178&ndash;182',
-    '178&ndash;3',
-    '178&ndash;4',
     '178&ndash;81',
-    '178&ndash;87',
-    '178&ndash;91',
-    '178(1)',
-    '178-seat',
-    '178-wicket',
-    '178.1',
-    '178.1%',
-    '178.3%',
-    '178.7%',
-    '178/180',
-    '178/182',
-    '1780&mdash;81',
-    '1780&mdash;90',
-    '1780&ndash;1812',
-    '1780&ndash;1820',
     '1780&ndash;1824',
-    '1780&ndash;1836',
-    '1780&ndash;1838',
-    '1780&ndash;1849',
-    '1780&ndash;1890',
-    '1780&ndash;1914',
-    '1780&ndash;1920',
-    '1780&ndash;2',
-    '1780&ndash;4',
-    '1780&ndash;81',
-    '1780&ndash;85',
-    '1780-',
-    '1780-1880',
-    '1780/1',
-    '1781&ndash;1803',
-    '1781&ndash;1833',
     '1781&ndash;1841',
-    '1781&ndash;1852',
-    '1781&ndash;1858',
-    '1781&ndash;83',
-    '1781&ndash;91',
-    '1781.',
-    '1781/7',
-    '17810',
-    '1781cc',
-    '1782&mdash;4',
-    '1782&ndash;1801',
-    '1782&ndash;1835',
-    '1782&ndash;1843',
-    '1782&ndash;1847',
-    '1782&ndash;1851',
-    '1782&ndash;1857',
     '1782&ndash;1863',
-    '1782&ndash;3',
-    '1782&ndash;4',
-    '1782&ndash;5',
-    '1782&ndash;83',
-    '1782&ndash;90',
-    '1782/3',
-    '1782/3&ndash;1818',
-    '1783&ndash;1791',
-    '1783&ndash;1801',
-    '1783&ndash;1826',
-    '1783&ndash;1852',
-    '1783&ndash;1857',
-    '1783&ndash;1861',
-    '1783&ndash;1870',
-    '1783&ndash;1965',
     '1783&ndash;1983',
-    '1783&ndash;9',
-    '1783-',
-    '178370',
-    '1784&mdash;5',
-    '1784&mdash;6',
-    '1784&ndash;1801',
-    '1784&ndash;1818',
-    '1784&ndash;1843',
-    '1784&ndash;1865',
-    '1784&ndash;1870',
-    '1784&ndash;8',
-    '1784&ndash;89',
-    '1784&ndash;93',
-    '1785&mdash;9',
-    '1785&ndash;1846',
     '1785&ndash;1859',
-    '1785&ndash;1863',
-    '1785&ndash;1865',
-    '1785&ndash;1866',
-    '1785&ndash;1868',
-    '1785&ndash;1872',
-    '1785&ndash;1937',
-    '1785&ndash;1985',
-    '1785&ndash;6',
-    '1785&ndash;7',
-    '1785&ndash;86',
-    '1785&ndash;87',
-    '1785&ndash;88',
-    '1785&ndash;9',
-    '1785&ndash;90',
-    '17850',
     '1786&ndash;1816',
-    '1786&ndash;1826',
-    '1786&ndash;1845',
-    '1786&ndash;1846',
-    '1786&ndash;1850',
-    '1786&ndash;1853',
-    '1786&ndash;1854',
-    '1786&ndash;1855',
-    '1786&ndash;1861',
-    '1786&ndash;1867',
-    '1786&ndash;1868',
-    '1786&ndash;91',
-    '1787&ndash;1827',
-    '1787&ndash;1851',
-    '1787&ndash;1852',
-    '1787&ndash;1860',
     '1787&ndash;1864',
-    '1787&ndash;1869',
-    '1787&ndash;8',
-    '1787&ndash;89',
-    '1787&ndash;9',
-    '1787&ndash;92',
-    '1788&mdash;1803',
-    '1788&mdash;9',
-    '1788&ndash;1824',
-    '1788&ndash;1857',
-    '1788&ndash;1860',
-    '1788&ndash;1868',
-    '1788&ndash;1870',
-    '1788&ndash;1871',
-    '1788&ndash;1886',
-    '1788&ndash;89',
     '1788&ndash;9',
-    '1788&ndash;91',
-    '1788-1850',
-    '1788-95',
-    '1788/89',
-    '1789&mdash;1814',
-    '1789&mdash;1919',
-    '1789&mdash;90',
-    '1789&mdash;92',
-    '1789&ndash;1805',
-    '1789&ndash;1807',
-    '1789&ndash;1815',
-    '1789&ndash;1828',
-    '1789&ndash;1846',
-    '1789&ndash;1847',
-    '1789&ndash;1848',
     '1789&ndash;1851',
-    '1789&ndash;1857',
-    '1789&ndash;1859',
-    '1789&ndash;1866',
-    '1789&ndash;1881',
-    '1789&ndash;90',
-    '1789&ndash;91',
-    '17896',
-    '178bhp',
-    '178cm',
-    '178ft',
-    '178h',
-    '178kg',
-    '178m',
-    '178p',
-    '179&mdash;84',
     '179&ndash;181',
-    '179&ndash;183',
-    '179&ndash;187',
-    '179&ndash;191',
-    '179&ndash;196',
-    '179&ndash;5',
-    '179&ndash;85',
-    '179&ndash;87',
-    '179(2)',
-    '179,000',
-    '179,052',
-    '179,280,000',
-    '179,388',
-    '179,500',
-    '179-222',
-    '179-member',
     '179-pin',
-    '179-run',
-    '179.3&ndash;207.9',
-    '179.6p',
-    '179.839',
-    '179/92',
-    '1790&ndash;1',
-    '1790&ndash;1794',
-    '1790&ndash;1800',
-    '1790&ndash;1808',
-    '1790&ndash;1832',
-    '1790&ndash;1846',
-    '1790&ndash;1852',
-    '1790&ndash;1854',
-    '1790&ndash;1858',
-    '1790&ndash;1870',
     '1790&ndash;1990',
-    '1790&ndash;4',
-    '1790&ndash;6',
-    '1790\'s',
-    '1790.9',
-    '17901',
-    '17905',
-    '17907e',
-    '1791&mdash;1820',
-    '1791&ndash;1',
-    '1791&ndash;1823',
-    '1791&ndash;1844',
-    '1791&ndash;1851',
-    '1791&ndash;1859',
-    '1791&ndash;1868',
-    '1791&ndash;1873',
     '1791&ndash;1948',
-    '1791&ndash;5',
-    '1792&mdash;3',
-    '1792&mdash;6',
-    '1792&mdash;at',
-    '1792&ndash;1797',
-    '1792&ndash;1841',
-    '1792&ndash;1843',
-    '1792&ndash;1848',
-    '1792&ndash;1863',
-    '1792&ndash;1864',
-    '1792&ndash;1866',
-    '1792&ndash;1867',
-    '1792&ndash;1869',
-    '1792&ndash;1876',
-    '1792&ndash;1878',
     '1792&ndash;1882',
-    '1792&ndash;5',
-    '1792&ndash;93',
-    '1792,1794',
-    '1792-1868',
-    '1792-9',
-    '1793&mdash;4',
-    '1793&mdash;over',
-    '1793&ndash;1807',
-    '1793&ndash;1834',
-    '1793&ndash;1860',
-    '1793&ndash;1862',
-    '1793&ndash;1872',
-    '1793&ndash;1874',
-    '1793&ndash;6',
-    '1793&ndash;94',
     '1793&ndash;98',
-    '1793-february',
-    '1794&ndash;1804',
-    '1794&ndash;1806',
-    '1794&ndash;1839',
-    '1794&ndash;1852',
-    '1794&ndash;1866',
-    '1794&ndash;1868',
-    '1794&ndash;1948',
-    '1794&ndash;5',
-    '1794&ndash;7',
-    '1794&ndash;8',
-    '1795&ndash;1803',
-    '1795&ndash;1820',
-    '1795&ndash;1837',
-    '1795&ndash;1844',
     '1795&ndash;1854',
-    '1795&ndash;1865',
-    '1795&ndash;1877',
-    '1795&ndash;1885',
-    '1796&mdash;7',
-    '1796&ndash;1800',
-    '1796&ndash;1816',
-    '1796&ndash;1853',
-    '1796&ndash;1871',
-    '1796&ndash;1878',
-    '1796&ndash;1880',
-    '1796&ndash;99/1800',
-    '17960',
-    '1797&ndash;1804',
-    '1797&ndash;1848',
-    '1797&ndash;1851',
     '1797&ndash;1854',
-    '1797&ndash;1856',
-    '1797&ndash;1874',
-    '1797&ndash;1875',
-    '1797/1801',
-    '1798&mdash;9',
-    '1798&ndash;1801',
-    '1798&ndash;1815',
-    '1798&ndash;1816',
-    '1798&ndash;1828',
-    '1798&ndash;1859',
-    '1798&ndash;1866',
-    '1798&ndash;1868',
-    '1798&ndash;1873',
-    '1798&ndash;1881',
-    '1798&ndash;1883',
     '1798.',
-    '1799&mdash;1801',
-    '1799&ndash;1800',
-    '1799&ndash;1837',
-    '1799&ndash;1868',
-    '1799&ndash;1870',
-    '1799&ndash;1871',
-    '1799&ndash;1877',
-    '1799-1871',
-    '17990',
-    '179a',
-    '179ff.',
-    '179m',
-    '179run',
-    '17:00',
-    '17:00:39',
     '17:01:42',
-    '17:02:57',
-    '17:03',
-    '17:03:40',
-    '17:04:25',
-    '17:04:44',
-    '17:04:54',
-    '17:04:59',
-    '17:05',
-    '17:05:08',
-    '17:06',
-    '17:06:05',
-    '17:06:39',
-    '17:07:03',
-    '17:07:26',
-    '17:08:20',
     '17:08:32',
-    '17:1&ndash;7',
-    '17:10&ndash;14',
-    '17:10ff.',
-    '17:11:01',
-    '17:11:16',
-    '17:11:52',
-    '17:12&ndash;23',
-    '17:12:06',
-    '17:12:43',
-    '17:13:36',
-    '17:14',
-    '17:14:07',
-    '17:14:13',
-    '17:15:03',
-    '17:15:36',
     '17:15:37',
-    '17:16:01&ndash;0400',
-    '17:16:24',
-    '17:16:52',
-    '17:17',
-    '17:17.48',
-    '17:18',
-    '17:18:22',
-    '17:18:31',
-    '17:18:49',
-    '17:19&mdash;34',
-    '17:19:22',
-    '17:19:38',
-    '17:1f.',
-    '17:2',
-    '17:20',
     '17:22:03',
-    '17:24',
-    '17:25:37',
-    '17:25:55',
-    '17:26',
-    '17:26:02',
-    '17:26:48',
-    '17:26:50&ndash;0500',
-    '17:27',
-    '17:27&ndash;8',
-    '17:27:43',
-    '17:28:53',
-    '17:29',
-    '17:29:42',
-    '17:29:48&ndash;0500',
-    '17:3',
     '17:31:05',
-    '17:31:51',
-    '17:31:54',
-    '17:32:55',
-    '17:33:13',
-    '17:33:55',
-    '17:34:53',
-    '17:35:16',
-    '17:35:55',
-    '17:36:38',
-    '17:37',
-    '17:37:01',
-    '17:37:58',
-    '17:38',
-    '17:38:30',
-    '17:38:56',
     '17:43',
-    '17:44:27',
-    '17:45:52',
-    '17:46:48',
-    '17:46:58',
-    '17:48:24',
-    '17:48:27',
-    '17:51:54',
-    '17:52:19.90',
-    '17:52:54',
-    '17:53:18',
-    '17:54:47',
-    '17:56',
-    '17:56:17',
-    '17:56:39&ndash;0400',
-    '17:58',
     '17:58:11',
-    '17:59:23',
-    '17:7f',
-    '17:8&ndash;16',
-    '17:9',
-    '17:9:1',
-    '17:9ff.',
-    '17_per',
-    '17b',
-    '17cm',
-    '17cu',
-    '17d',
-    '17db',
-    '17dh',
-    '17ff.',
-    '17ft.',
     '17h03min',
-    '17h03min22s',
-    '17h04min30s',
-    '17h04min51.79s',
-    '17h06min05.27s',
-    '17hh',
-    '17ins',
-    '17kw',
-    '17mgml',
-    '17min',
-    '17ml',
-    '17month',
-    '17month-old',
-    '17q',
-    '17q13',
-    '17sec',
     '17secs',
-    '17strong',
-    '17tel',
-    '17th/21st',
-    '17u/ml',
-    '17x25x7&middot;5cm',
-    '17year-old',
-    '17zs',
-    '18%.',
-    '18&divide;3',
-    '18&frac12&ins;h',
-    '18&frac12;p',
-    '18&ft;x',
-    '18&half',
-    '18&mdash;12',
-    '18&mdash;20',
     '18&mdash;21',
-    '18&mdash;25',
-    '18&mdash;30',
-    '18&mgr;m',
-    '18&ndash;1&ndash;1915',
-    '18&ndash;10&ndash;0',
-    '18&ndash;10-',
-    '18&ndash;12-',
-    '18&ndash;171',
-    '18&ndash;19-year-old',
-    '18&ndash;20ft',
-    '18&ndash;20h',
-    '18&ndash;20th',
-    '18&ndash;21&deg;c',
-    '18&ndash;22&deg',
-    '18&ndash;24-year-old',
     '18&ndash;24h',
-    '18&ndash;24ins(46&ndash;61',
-    '18&ndash;25%',
-    '18&ndash;26',
-    '18&ndash;27&deg;c',
-    '18&ndash;28th',
-    '18&ndash;29',
-    '18&ndash;2i',
-    '18&ndash;3',
-    '18&ndash;30-year-olds',
-    '18&ndash;30.',
-    '18&ndash;30s',
-    '18&ndash;32',
-    '18&ndash;33',
-    '18&ndash;34132',
-    '18&ndash;36',
     '18&ndash;36%',
-    '18&ndash;4&ndash;1865',
-    '18&ndash;40',
-    '18&ndash;45',
-    '18&ndash;457',
-    '18&ndash;47%',
-    '18&ndash;49',
-    '18&ndash;49%',
-    '18&ndash;5',
-    '18&ndash;50',
-    '18&ndash;53',
-    '18&ndash;54',
-    '18&ndash;56',
-    '18&ndash;58%',
-    '18&ndash;60',
-    '18&ndash;67',
     '18&ndash;68',
-    '18&ndash;7',
-    '18&ndash;7&ndash;0',
-    '18&ndash;70',
-    '18&ndash;71',
-    '18&ndash;74',
-    '18&ndash;76',
-    '18&ndash;8&ndash;8',
-    '18&ndash;80',
-    '18&ndash;84',
-    '18&ndash;85',
-    '18&ndash;9',
-    '18&ndash;thu',
-    '18&ndash;year-old',
-    '18&plus',
-    '18&prime',
     '18&rehy;month',
-    '18&rehy;year-old',
-    '18&shilling;0d.',
-    '18&shilling;4&frac12;d',
-    '18&shilling;4d',
-    '18&sol;2',
-    '18&times;10',
-    '18&times;18in',
-    '18&times;21in',
-    '18\'',
-    '18\'s',
-    '18(14)',
-    '18(16)',
-    '18(18)',
-    '18(1a)',
-    '18(c)',
     '18*',
-    '18,00',
-    '18,000-acre',
-    '18,000-staff',
-    '18,000-strong',
-    '18,000-ton',
-    '18,0000',
-    '18,000km',
-    '18,000sq',
-    '18,027,432',
-    '18,100',
-    '18,100ft',
-    '18,128',
-    '18,148',
-    '18,155ft',
-    '18,173',
     '18,192hz',
-    '18,1953',
-    '18,215',
-    '18,22,24',
-    '18,231,588',
-    '18,237',
-    '18,257',
-    '18,271,000',
-    '18,276',
-    '18,298',
-    '18,306',
-    '18,337',
-    '18,343',
-    '18,361',
-    '18,380ft',
-    '18,400',
     '18,400,000',
-    '18,414',
-    '18,420',
-    '18,446,744,073,709,551,615',
-    '18,500&ft',
-    '18,500,000',
-    '18,510ft',
-    '18,544',
-    '18,559.71',
-    '18,560',
-    '18,564',
-    '18,600,000',
-    '18,617,841',
-    '18,690',
-    '18,699,884',
-    '18,730',
     '18,757',
-    '18,759,000',
-    '18,766',
-    '18,768',
-    '18,800-lexicon',
-    '18,81',
-    '18,811',
-    '18,822',
-    '18,830',
-    '18,840',
-    '18,876',
-    '18,900',
-    '18,963',
-    '18-1',
-    '18-11',
-    '18-13',
     '18-16',
-    '18-17',
-    '18-19-1/2ft',
-    '18-19.',
-    '18-19th',
-    '18-2',
-    '18-2-93',
-    '18-20-years-old',
-    '18-24-',
-    '18-260c',
-    '18-27',
-    '18-29',
-    '18-3',
-    '18-34',
-    '18-34-year-olds',
-    '18-36',
     '18-4',
-    '18-5-86',
-    '18-8',
-    '18-acre',
-    '18-base-pair',
-    '18-bedroom',
-    '18-bit',
-    '18-carat-gold',
-    '18-carbon',
-    '18-chromosome',
-    '18-cm',
-    '18-colour',
-    '18-cow',
-    '18-date',
-    '18-fight',
-    '18-first-class',
     '18-fold',
-    '18-gallon',
-    '18-game',
-    '18-gauge',
-    '18-gift',
-    '18-goal',
-    '18-gun',
-    '18-hand',
-    '18-in',
-    '18-kg',
-    '18-km',
-    '18-knot',
-    '18-light',
-    '18-minute',
-    '18-over-par',
-    '18-party',
     '18-pluses',
-    '18-second',
-    '18-stoned',
-    '18-to-24',
-    '18-ton',
-    '18-try',
-    '18-week',
-    '18-who',
-    '18-year-old-fun-loving',
-    '18-year-old-german',
-    '18-year-old-guy',
-    '18-years',
-    '18-years-old',
-    '18.01',
-    '18.02',
-    '18.03',
     '18.06',
-    '18.07',
-    '18.09.91',
-    '18.0p',
-    '18.1(b)',
-    '18.1.75',
-    '18.10&ndash;15',
-    '18.10.0',
-    '18.11.87',
-    '18.12.3&ndash;5',
-    '18.14',
-    '18.14.0',
-    '18.16',
-    '18.17',
-    '18.18',
-    '18.18%',
     '18.19',
-    '18.1m',
-    '18.2.1988',
-    '18.2.2',
-    '18.2.2.2',
-    '18.2.4',
-    '18.23',
-    '18.25p',
-    '18.27%',
-    '18.2m',
-    '18.3.93',
-    '18.30&ndash;21.30',
-    '18.31pts',
-    '18.32',
-    '18.33',
-    '18.34',
     '18.36',
-    '18.38',
-    '18.3m',
-    '18.3mpg',
-    '18.3p',
-    '18.3pc',
-    '18.4%by',
-    '18.4&ndash;29.4',
-    '18.40',
-    '18.41',
-    '18.42',
-    '18.44',
-    '18.4pc',
-    '18.5.1',
-    '18.5.12',
-    '18.5.14',
     '18.5.7',
-    '18.5.83',
-    '18.51',
-    '18.551',
-    '18.5mm',
-    '18.5pc',
-    '18.6&ndash;19.9',
-    '18.6&ndash;20',
-    '18.6-ks',
-    '18.61',
-    '18.6kb',
-    '18.73',
-    '18.73p',
-    '18.7mpg',
-    '18.7ms',
-    '18.8&ndash;31.4',
     '18.82p',
-    '18.86',
-    '18.8mpg',
-    '18.9&ndash;18.12',
-    '18.9(a)',
-    '18.9(b)',
-    '18.9.92',
-    '18.9.93',
-    '18.91',
-    '18.95',
-    '18.9mpg',
-    '18/1,000',
-    '18/10',
-    '18/10.93',
-    '18/115',
-    '18/183',
     '18/20',
-    '18/213',
-    '18/24',
-    '18/3/41',
-    '18/3/93',
-    '18/30',
-    '18/33',
-    '18/39',
-    '18/40',
-    '18/402',
-    '18/5/93',
-    '18/550',
-    '18/69',
-    '18/7',
-    '18/70',
-    '18/8/10',
     '18/84',
-    '18/92',
-    '18/colour/102',
-    '18/colour/subtitles/100',
-    '180&deg&aring',
-    '180&deg;-359&deg;.',
-    '180&deg;c/',
-    '180&deg;c/325&deg;f',
-    '180&deg;s;c',
-    '180&divide;300',
-    '180&dollar;c',
-    '180&ndash;210&deg',
-    '180&ndash;225',
-    '180&ndash;235',
-    '180&ndash;250/min',
-    '180&ndash;3',
     '180&ndash;356',
-    '180&ndash;400',
-    '180&ndash;439',
-    '180&ndash;600',
-    '180&ndash;7',
-    '180&ndash;8',
-    '180&ndash;92',
-    '180(1)',
-    '180+2+45=262',
-    '180,000&lsqb;00&rsqb',
-    '180,000,000',
-    '180,000-tonnes',
-    '180-240',
-    '180-cow',
-    '180-fold',
-    '180-kilometre',
     '180-litre',
-    '180-odd',
-    '180-pupil',
-    '180-volume',
-    '180-yard',
-    '180-year-old',
-    '180.7%',
-    '180/pi.',
-    '1800&ndash;1',
-    '1800&ndash;1600bc',
-    '1800&ndash;1803',
-    '1800&ndash;1814',
-    '1800&ndash;1823',
-    '1800&ndash;1850\'s',
-    '1800&ndash;1853',
-    '1800&ndash;1867',
     '1800&ndash;1870',
-    '1800&ndash;1881',
-    '1800&ndash;1920',
-    '1800&ndash;1929',
-    '1800&ndash;1933',
-    '1800&ndash;1948',
+)
+
+blocks_96 = (
+    '$"5p$!7$!m%!g%"pg#$7(a)%"b)$".1%!3%!5%!6%"86%"90$%32sec$#503',
+    '$!8$"9%%!p$!k$!m%"pg$%x11.3#-8&ndash;14.6%$".4$!5$"75$"gb$!p##9.1%!2',
+    '$!4$"6p$!c$!p%!c$$secs#$a.t.""/-#"11%!5$*4-year-old$!5$#6in$"71$!9',
+    '#*2&ndash;93$!5$!8#$3/90$!1$!4$!5#!4$#/41$A07,20/414,112/506,139/533,164/558$!1%)7,110/504$"57#$5/41%"93',
+    '$!7$"97#!7#"82$!4$!7#$9/87$!0#.disinformation"\'0&deg;c$"ft$%mgr;g$)ndash;134,#7cm+"49',
+    '*"63*"77*"98$%times##(6)#+,000-strong$#400#!-$#100%#80.$#day$$foot$"km$#odd$$page',
+    '%%trong$$yard%#ear($-old#".0$!2$!5$"65$!8##/10$)bhp/tonne$!l$#min#\'0&deg;c)!s',
+    ',#360,#400-"50,)500&deg;c-"50,#900+#200-"34+"39+"61+#800$%-1400&#600%$page&#lus',
+    '$\'0&deg;c$"bc$"ft$"mw&!e$#sel%!l#,1&ndash;1314,#550$,0&ndash;1879%"/l#*2&ndash;73$!9#)3&ndash;5$"70',
+    '#)4&ndash;5+!8$"hf#*5&ndash;34$$,676#*7&ndash;13-"27,#660+"24,!7$$7-79#*8&ndash;10+!9$"70#&a-130e',
+    '$!p#!g#"kg$"yr##lbs#!m$"jy$!l$$mcfd$\'ph-plus#"pc#!s#!y"%1&ins$)ndash;133',
+    '*!8#(,000,000$#400$#760#&-level%"ot$$mile$$page##.05$"2p$"50#"/3$"86#*0&ndash;12$!0',
+    '#*1&ndash;12#*2&ndash;15#*3&ndash;14,!6+"54$!0$!5$#b38#,4&ndash;1347+"38$"40#*5&ndash;22,!3+"43$!2',
+    '+"26+"40+"70$!1$"28#,7&ndash;2427,!5$"55$!7#*8&ndash;19$!0%!0#*9&ndash;44+"52+"73',
+    '##mph#"st""2%#*&ndash;383*!8+!9#),000-volt$#726#$-135$&strong##.00$#562%!p$#889%!p',
+    '+!2$!6#)1&ndash;2,!6#)2&ndash;3,!7+!7$!0#,3&ndash;1338-"49+"30+!4+"82$".5$!9',
+    '#)5&ndash;6#*6&ndash;31$#/89#*7&ndash;52+"77#,8&ndash;1992+"47+"69$$-.44#":2#!a#"bp%!m#"ft#)g&ndash;h',
+    '##mph#"pp"\'3&deg;w$(middot;3$+ndash;4,620*!5*!6*!9$&plus;5#!*#$,136$#4,9%"00$#700$\'890,100',
+    '#$-282$&member$$page$#run#".3$$504*$!7#$/329$"65$+km&amp;sup2#,0&mdash;1350%*ndash;1411+"38$!0#*1&ndash;55',
+    '#)3&ndash;5$!3#,5&ndash;1395$"40#)6&ndash;7$"60#,7&ndash;1360,#494+"41+"64+!8$*22/nx1337a$"72#*8&ndash;62$"28',
+    '+"71#)b&ndash;e$"hp##lb.#"mb$!m#"pp#"rd"+4&ndash;135,!6,!7+"50*!8$&plus;2$*times;10/l',
+    '#$,480##-95%!6$$acre$$page$$year#"/l#,0&ndash;1425$!0#,1&ndash;1391+!2+"64#,2&ndash;1416-"20+!3',
+    '#"32#)4&ndash;5$#213$!m#)5&ndash;6+!7$!0#*7&ndash;80$!\'#*8&ndash;50,!8+!9$"/9$!0$"20',
+    '$!0#"a.##b/w#"cm#!f$!f$!t#"hp##mhz""5%#*&deg;m/3.7$\'mdash;8$)ndash;138+"40+"80',
+    '*"41+!5+!6*!5*!6+!8*#799*"87#&(1062)#$,502#"-1%!0%"50$"34$#man',
+    '%/illion-year-old$$page#".2%!%$#5p.#)0&ndash;1,#416,#530+!5$$,000$#00t$#gns$"mm##1/h$"80',
+    '$!3#*3&ndash;91#"40#,5&ndash;1424+"71#)6&ndash;7$!8#*7.9.7.5.31#)8&ndash;9$!0$"50#%9/181#!a#)c&ndash;f#!f',
+    '#!g#!h$!a##th."\'6&amp;f$\'ndash;1+"40-"cm*"40+!3+!7*"77*-8/138&ndash;9##(4)#$,421',
+    '#*-aminoacid$#pin##.5p$!9%"75#,0&ndash;1396,#405+!2+!5+"78$"cc#$1473#"25##341#,4&ndash;1398',
+    '+"89$!2$"50#"50#"60#*7&ndash;74$!0$$7-81#.8/9&ndash;1426$#750#":7##bhp##ff.#"mb$"ph',
+    '""7%#\'&frac12$\'mdash;8$\'ndash;1+"40*"42#$,400$#668$#700##-km$$year($-old#".0%"1p%"35',
+    '$"3%$"5p$!7##/14%"66#*1&mdash;90%\'ndash;2+!6$!0#)3&ndash;4$!-#)4&ndash;5#,5&ndash;1358+!6+"77',
+    '+"95%&plusmn#)6&ndash;8$%-1420$"40#,7&ndash;1485$#-81$%:1975#,8&ndash;1417#!a#"ft#"pc$!p#&x183cm""8%',
+    '+"42#)(1)&mdash$"4)$"8)$"9)%"a)#(,000,000$#317%"79$\'400,000#$-106$!8%!2#$.5p.#$/499',
+    '#)0&ndash;1,#000,#400-"72$"/1$!0#,1&ndash;1394,&453/58+"96#,2&ndash;1392,!8#*3&ndash;84#)4&ndash;5+"85#,5&ndash;1390',
+    '+"95$!0#*6&ndash;88$!0#,7&ndash;1455+!8#*8&ndash;95$"00$"70#"9.$#/90#&x200cm",9&ndash;1050+"40,!2',
+    '*!4+!0+!2+!3+!4*"64##(i)#$,400$#517$#700$#959#$-141$!3$#run#!.',
+    '$!2$"33$!5$!7$!9#$/533#,0&mdash;1406%*ndash;1490+!4$"cc#,1&ndash;1353,#447##2/3#,3&ndash;1431-"64',
+    '#*5&mdash;96$!0#,6&ndash;1405.!7-"22$!0#,7&ndash;1403+"98$!1##8/9$"cc#,9&ndash;1400##lbf"0:00&ndash;13:30.%#:48',
+    '$$1:15&"24&"34$$3:12\'!3\'!4$$4:29&"47\'!8$!5%#:29$$7:53$$8:05\'!9&"16',
+    '$!9%#:53#*1&ndash;16,!7+!8$*0&ndash;15%#:31$$1:08&"22$$2:08$/3:55&ndash;0500$$4:14&-26&ndash;0500&"34&"46',
+    '%#:17&"46$$6:38%"f.$$7:04&"31$*8&ndash;23$!9%#:15&"32$"ff##2,4$!0%.:06&ndash;0500$$1:04',
+    '&"36$!2%#.39$$3:21&"48&"55$$4:04\'!9$*5&ndash;27$$8:35$!9%#:38#%30:57$*1&ndash;35%#:16',
+    '%#:34$!4%)&ndash;35$!5%#:25$$7:01&"33&"45&"50$$8:01&"53$/9:00&ndash;0400\'!4&"21#!4',
+    '$$0:07$!1$$2:28&"30\'!4$!3%#:41$$4:59$!5%#:12&"28$!6%#:48$!7$$8:25',
+    '$$9:38&"40&"52\'!8#%50:27\'!8$$3:34&"48$!5$!6%.:05&ndash;0500&"19&"56$$7:22$$9:12',
+    '$(&ndash;9#!7$(&ndash;8#!8#*9&ndash;13#+linguistics"$_per"#cms""dm"\'ft-14ft"&inches""kg#"m.$!/%$8mls',
+    '#"bs""mg#"in#"yr"$ozs."#pts"!q#"14"#sec"-th&ndash;14th,#6th,#9th%+rehy;seeded$%-14th&$6thc',
+    '%%floor"!u"!v"!x#(15inches!,4&commat;1/2-%-year#&deg;dh\'!f$)ivide;8.5#1frac12;-year-olds*#ins*!l*"oz*!p',
+    '\'&34&ins)#;in*"lb#2ins&times;13.5&ins.%6&ins#)mdash;066)"15*!9)"21*!4$,iddot;2x29cm#(ndash;03*!4)*12&ndash;0*&4.5ael',
+    '+$,000+!m*&6-year0$-old+"th*"7%+*-year-olds*"8c+"ft)#20%*"1.*"5%*$7/1s*!8*!9',
+    '*"31*!5))4&ndash;0*!6),5&ndash;18443"63*!4*!6)"76)"81*!3)!9)#aug)#oct#$plus',
+    '#(shilling$%ol;77#3times;19&frac12&ins""\'w"$(13)#(2)&mdash#&3)-(4)#"5)#"a)#"c)"&,000ft&#gns&"m2&#rpm$"14',
+    '$"26$"33$&40,000$"80%!7$&91,034##102$"16$"20$&45,163$$5,48$07,18,20,21,25,29%)7ft/4321m$"91%!2',
+    '#\'200,000%!3$$2,23%!4$"50##300$"22$"30%!3$"72#!4$$00ft$!2%%5,000$"50',
+    '%!9$"70##521$"30$"44$"50##616$"47$$64ft$"88##719$"24$"32%!7$&60,000',
+    '#!8$&25,013%%6,616$"52%!9##900%!6$"10%!2$"48$"58$&67,000$"76$"89"#-11',
+    '$#6cm#"23$+9-year-olds#!5#(aircraft$$mino$)nd-a-half\'%under#$ball%"nk$(edroomed%#rth$"it#%carat$$oach',
+    '#$days#0eicosatetraenoic$!r#&footer#&gallon%"me$$roup#!h$*andicapper$$ours#)kilometre$&m-wide#$line#%match$\'egawatt',
+    '$)onths-old#$part$%erson$$iece%!n$$lace$&ortion##run#%stage#%tonne$&racker#%under($-par#$watt#-year&rehy;old',
+    '($long"*.0&ndash;0$.0&ndash;17.00.-$9.00,%21.00%!3$!3$!4%!p$!c#,1&ndash;17.9$"0.%#sec$*1&ndash;12%".3',
+    '&!5&!8$$2.93$!4$-5&ndash;14.30%".3$!8$!9$"fl$"hh$"oz$"pc##2-m%%point$".7',
+    '&)5/21.2.85$!1$!2$!3$"4%$"5%%!5$!6%!a%!b$#ghz$"ms#%3&ins%&percnt$%.1991',
+    '-$7.00$!1$!2$"3%%!a%!b%!c$"4a%!b%!c%!d$!6$!8$"hh$"pc',
+    '##4.4$"0p$!1$#5pc$!c$$kbps&!s$#mpg$"pc#+5&ndash;22%$$-5.5$".4$%14.11$!2$!6',
+    '$!9$#khz%#m()$!p%!c%$stg.#$6(a)$".1%!2%!3%!5%!6%!7%"92$!4',
+    '$!9$!p#-7&mdash;14.10$#(a)$".4%!6%!8%!9$!4$"5%$!6$#7r.$"9%$!k$!m',
+    '#*8&mdash;10$!-$".1%!2%!3%!4%!5%!6%"89$!1$"5p$"78$"cm$$secs##9.1',
+    '%!4$#3.4$"5%$!6$"9p$!p%!c$$secs#%e.iii"!/#%05/93#!1$!0%)0000/year$&1/1981',
+    '$"58$!6%!1%"th$!7$"80#"23$"9b##300$"35#$4/41%"65%"93$!0#$5/41',
+    '$792,26/604,54/632,59/637#!6#"83$!6#$9/90$!1$!8"\'0&deg;c)!.$+ndash;10001+#500-"cm+"70*$200g,!2',
+    '*"73*"80*!9$+rehy;strong#0,000-square-foot#!-$#160$!4$0beats-per-minute$%metre$#odd$$page$&strong$$yard#".0',
+    '$!5%!p$!8$!9#$/144$"90#,0&ndash;1800-"30+!2$%-1600%$feet&!t%"km$#/01$-0&ndash;17000',
+    '$"10$!3$!4%!9$"ft$#gns$"hz$$kcal%!g%!m$"mm#,1&ndash;1405+!2#*2&ndash;19#%3/981',
+    '$(-january$"/6$,1&ndash;0430#*6&ndash;37+!7#*7&ndash;24+!9##8/9#*9&ndash;14#!a#"bp%!m#&dobson#!f#!g',
+    '#$mbps$"hz&\'-200mhz$!s#"ps#!s#&x140cm""1%#&&deg;c$(mdash;8.$+ndash;1200m+"43,!5*#221*$3mph',
+    '*"72+!5*!9+!2##(2)#\',344.97%"77$#471$#530#!-$!4#$.02p$"25%!p$"4p',
+    '#%/1333$!2#*0&ndash;11,#482,#700+$2282+$5280$#/11$!m#)1&ndash;0$!7#"2.$#/13#*3&ndash;14$#/14',
+    '#*4&ndash;18$#/15#,5&ndash;1450,/6,1430&ndash;31#*6&ndash;17+"45,!6#"80$$1-84#*9&ndash;20$!0#!b#"cm#"gb#!m',
+    '#!s"(2&frac12$+ndash;147cm*!5+!2+!7*!7*!9$&plus;1)!3)!9##(1)#$,723#&-point#".7',
+    '+"50$!0$!5$!6$"73#*1&ndash;22+!3,!0$!0#,2&ndash;1453#,4&ndash;1542+(2512,232$$9-51#,5&ndash;1935+"75',
+    '$!w#!7$)&ndash;56$!0#*8&ndash;29$!2$!8#\'9&ndash*1;30,1437&ndash;38$"20$!k$#mph#(cm/130cm#"in#"ml',
+    '$!m#&x140cm""3%#*&ndash;144+"50*#242*"50+!6*!7+!4*!9##(1)#$,100%"15%#224',
+    '%"80$#500%"83$#826#\'-member#!.$!0$#16p$"2%$#386$"44$"5%$!6##/4p$"77',
+    '#)0&ndash;1$#-c.$"22$"56$!7#*1&ndash;76#"20#*3&ndash;99$!1#,4&ndash;1489#)5&ndash;9#*8&ndash;39#"96%!8#\'bhp/ton',
+    '#!s"+4&ndash;145,!6*!5+!1+!8*!6*!7+!6*!8##(1)$"2)#$,240$\'369,000$#950',
+    '$#pin#!.$!0$!1$"4%%!p$!5$!6$!8$!9#,0&ndash;1508+"50$%-1740$!0#"1h',
+    '+!5$"28#,6&ndash;1515#!7$!.$!0#*8&ndash;49+!9#*9&ndash;50$\'0-14141#!d#"ff#"mb$!m#"p.',
+    '#!s"\'5&deg;c(!f$*ndash;1700*#213*"50*!7*!8*!9$&plus;6##(1)$"2)#%,000+\'$,000$#140',
+    '#!-$"90$#day$*horsepower$&member$&office##.25$"5p$#825#%/3/30$"87#,0&ndash;1515-"24-"30+"60',
+    '$%-1700$!0%!0$"65$"bp#*1&ndash;81##4.3#*5&ndash;60#)6&ndash;8#,7&ndash;1557$!0#)a&ndash;h##ff.$!t#"hp',
+    '#"pc$"p.#&x180cm""6%#(&mdash;7*"82$)ndash;147+"50*!4*"51*"80*!9##(3)#$,400$#600',
+    '#%-link%#ong$$page$"qt#(.022.4gm$\'169.2.1$"2p$!5%"p.$"6m$"88#$/342$#724$%train#,0&ndash;1527',
+    '$"-m#*1&ndash;83$!7#$3/90#,5&ndash;1527+"66$!\'#"70#,8&ndash;1504+"88#!e#!f#!s")7&mdash;8*#and',
+    '*!6+!1+!3+!8*!7*!9#$,034%"40$\'386,000$#950#$.24p$"5p$"7%%"5p#$/149',
+    '#*1&ndash;72#,2&ndash;1553#,3&ndash;1543#)4&ndash;7#,5&ndash;1509-"64,#640,#900+!9$$-:83$\'/801528$!0#,6&ndash;1477-"99,#516',
+    '$"/7$!0#)7&ndash;8$!.#,8&ndash;2170#,9&ndash;1565##bhp#!i#"lb#!p#$vote#&x147cm")8&mdash;9$(ndash;53*"70',
+    '+!5*!8#$,000$#263$#463$#500$#754#$-115$$seat#".0$!2$"5p##/88%!9#)0&ndash;1',
+    ',#660+"c.#,1&ndash;1504#,2&ndash;1485,#519+"83+"90#,3&ndash;1520-"30+!5#,4&ndash;1531#\'5&ndash*%;1507-"44-"66',
+    '$%-1509#,6&ndash;1559+"c.$!6#-7&ndash;after$#.07$"88#,8&mdash;1513-"42%*ndash;1534-"61+"90#,9&ndash;1552.!6,#794',
+    '#"ff#"mm$"ph#"p.$!p%!.#"th"+9&ndash;150+"66*.50/151&ndash;2+!8*!7#$\'ers#$,990#)-aircraft',
+    '$#76p#$/151$#727#,0&ndash;1545.!6.!8-"50.!4.!5.!7-"62,#940+!5+$post$"/1',
+    '#,1&ndash;1525-"56#,2&ndash;1558,#992#,3&ndash;1541.!8$!-$!0#"4-$"30#,5&ndash;1528-"41.!4.!5-"62',
+    '$"bc#,6&ndash;1544-"70$!0$"cc$"kg#,7&ndash;1543-"52-"60+"98$"30#,8&ndash;1579$!0$!7%!0',
+    '#,9&ndash;1546$"50#"cm#!e#"ff%!.#"mm"#:00%#:21$$1:25$!2%#:17&"42$$3:29&"32',
+    '$$6:09&"57$!7%#:05\'!8&"11$$8:01&"23$!9%#:20\'!8&"34\'!8&"51#)1&ndash;2',
+    '$$1:30\'!9$!2%)&ndash;16%#:04&"36$!3%#:18$$4:06$!5%)&ndash;18,"24%#-17%#:34\'!7',
+    '$!6%#:02&"18&"25&"30\'!2$*7&ndash;21%),18,21,23%#:05&"21&"31&"46$$8:09&"19&"32',
+    '\'!7$!9%#:23#!2$$0:43$*1&ndash;24%#:17&"20$,2&ndash;16:4%#:24$)3&ndash;9$!5%(&ndash;7$*6&ndash;31%#:36',
+    '&"55$*8&ndash;31%#.75%#:54$!9%#:44#!3$(&ndash;9$$0:01&"28&"39&-50&ndash;0500$!1%#:30\'!2',
+    '$*2&ndash;33,"42$!3%#:25&"52$!4%#ff.$$5:34&"45\'!8$$6:01&"21$!7%#:20$!8',
+    '$!9%#:00&"20&"37$!f#"40%#:20$$1:50$!2$*3&ndash;52%#:07&"21\'!6&"39&"44',
+    '&"57$!5%#.12%#:15&"23$!6$$7:35$$8:04&"27$$9:48#"51%#:12&"22&"31$!2',
+    '$!3%)&ndash;65%#:53$$4:13&"28&"46$$5:10&"52$)6&ndash;7%#:05&"45&"54$$7:38&"59$#8.0',
+    '$!9%#:27#*6&ndash;15$#,17$!2$!5$*6&ndash;72$#ff.#!7")car.ii.c."$days"!f#!l#&t-deep$!.',
+    '#!b"$inch&"es"$july"#kpc"!l""ma$$/150$!y#!b#!g##ile$"ns#$onth#"pg',
+    '#"yr",oz&ndash;1lb$!.""pm#!p#!t"!r"$s.6d""te#&h-21st&#6th%&minute%&ranked%&safest$%/15th',
+    ')!.#"zd",v12&ndash;17"!w"#x10"(year-old*!s!&5%-10%$#55%#!l"&&deg;f\'"gh#\'formula$+rac12;-inch*"in',
+    '\'%34;in\'"78#(mdash;17)"20$$gr;g\'"ms\'!s#7ndash&frac12&times;11in(*;1&ndash;0*)0&ndash;0+!0*!1+(&ndash;0+!0+!9',
+    '*!5*\'6&deg;c+%/2/41,$3/41+!8*"8m)(20&deg;c+$,000+!-,)year-olds+!c+"ft+!g+"th*04-year&rehy;olds',
+    '*"7%*\'8&deg;w*!9))3&ndash;0*\'0,000hz+"mm*!5+)-year-old)#41%*!5*!6*!8))5&ndash;0*"0%*!4',
+    '*!8*!9*!o)"60*!2),7&ndash;1882*"0%*!2*!8)#80%)%april)#dec)$july)#nov)#thu',
+    '(!2(!3#-rehy;year-old#-shilling;10d.#/times;22&frac12)"36""\'s"#(-)#(1)&mdash$"5)$"8)#"5)#"a)%2&mdash;information#"b)',
+    '#0c)&mdash;general#*inclusive)"&+8+6+7"#,00%)0&ndash;1&\'-20,000\'#odd\'$plus\'&rouble\'#ton\'$unit&#.00&"ff\'!t&#gns',
+    '&#rpm%!1%!5$"12$$32km$"42#\'100,000%!5$"18$"22$"36$"68$$8,21#"20$&40,000',
+    '$!8$!9%!1##300$"10$"28$&34,000$&57,000%!8$"60&$,000%!1$"72##430$"42',
+    '$"93#\'500,000&$-ton$"29$"36$"47$"51##618$"23$&36,000$"48$"70$"94%!8#\'700,000',
+    '$"28$$39.4$$48ft$"62$$71ft$"96#!8$"88$"95##920$"31$"49"+-16,000,000$+8-year-olds#!2',
+    '%"ft$!2$!6$!9#"59#$70cm##amp$&rticle$"ug#\'bedroom$#ill#*centimetre%"rt#$date$#eep',
+    '#"er#)feet-high$%ooter%$r-34$!t#$game$"un#+handicapper$,undredweight$,ydroperoxide("xy#"in%)ch-radius\'"er#"km',
+    '$$iles#%night$#ote#$over#\'partner$\'er-cent$$iece%"nt$#lus$$ound#$race$\'epublic#!s$,criptwriters$%eries',
+    '#\'teacher$$rack#$unit#$watt%!y$\'eek-old$#ord#-year&rehy;old\'*-old/lorna"+.0&divide;2$!4%!3%!p$!6$!8',
+    '#)1&ndash;2+24&ndash;39&ndash;5$".1%!2%"63$#0.1&!2&!3&!5&!6&"92$#1.2&!3&!4&!5',
+    '$"4%$*6&ndash;72$!7%#.18$!8$*9&ndash;24$!c#,2&times;19.7+$20.3$".4%!5%!6$"0%%)&ndash;21%#sec',
+    '%"ff$"5%%(&ndash;6$"7f$!8%)&ndash;31%#8a.$"hh$#khz$"oz#:3&ndash;4&ndash;21&ndash;5$".5$!2$!3$!6',
+    '$!7$!9$!p#,4&mdash;15.9%*ndash;59.0$",5$".1&#(3)&".2&!2%!2%"89%"92$!0$!2',
+    '$!4$\'8&deg;c$!9$"cu$!m#%5&deg(";c%*ndash;37.0%*times;10/l$!.%!1%!3%!5%!7$!3',
+    '$!5$!6$!7$"bn$!m$\'p/litre##6.1%!2%!4%)5&mdash;7%!6%!7%!8&!9%"90',
+    '$!3$"5%$$80.3$"mg%"pg##7.1%!2%!3%!4%!5%"86$!0%$3sec%!m$!5',
+    '%"in%!p$!8$!9##8.1%!2%!4%"93$#mpg$"oz$"pc##9.1%!2%!3$"0%',
+    '"&/10/73&"90%)0000/year$"15&#ths$#7th$!8$!9%!8#"20$!3$"4b$!5$"6a%!b',
+    '%!7#$3/93$!0#$4/41$"63#&5/1987%"41%"93$!7$"80$"96##605#!8$!7$!8',
+    '$!1$!7#*colour/114"\'0&deg;.("c.(!m(!w$(mdash;67%$gr;g%&icro;s$*ndash;1200+"60+"75+"80,!5',
+    '+$30mm*!3+*00&formula*.400&times;10/l+(40&times*"50*!7+!0*#800*$mile$)rehy;page$*times;25mm##,00&%0,160\'(-170,000',
+    '($acre($mile($plus\'"kg$\'400,000$#929#"-1%"51$!2%"00%"50$$4-pk$\'bedroom$$city$$foot',
+    '$&m.p.h.%$etre)%-long%-iles-per-hour%!m$#odd$\'picture%$oint$!r%"un$$watt$$yard#!.$!0$!6',
+    '$%1,000%$36cm%"52\'!s#)0&ndash;1,#515-"53.!8-"63.!6-"71.!3,#697,$700\'-"50',
+    ',#900-"70+"22+$3000+"c.$"\'s$%-1700&#850%*horsepower%%metre&#ile$%/1515$"10$!h$%kcals',
+    '$"mw$#psi$"sc#"1b#)2&ndash;9$"30$"42$"79$"84#,3&ndash;1821,!9#*4&ndash;73#,5&ndash;1577-"85+!6',
+    '#*6&ndash;13,#539-"44-"52$!3#*7&ndash;76#*8&ndash;63,!7+"70+!9#*9&ndash;10,#547+"47+"64#"bn',
+    '$"pi$!u#!f$!.$!f%*/livestock#!k$!a$!g#"m.$\'g/100ml$\'l/100ml&#5fl&!6$#min',
+    '$"yr#"ns#)p-a-share#(units/ml#!v#"x."+1&ndash;152+"63*!2*!4#$,100$#582#$-152$%point$$year',
+    '$!2%!%$)5x151.5cm#"/2#,0&ndash;1563.!4-"71-"87+"20+"85+"c.$%-1568$#/20#*1&ndash;53+"76',
+    '#*2&ndash;15-"67-"94,!7,!8#*3&ndash;42#,4&ndash;1559-"72+"74#,5&ndash;1560-"86,!6+"53+"68+"82',
+    '$$-.82$./16&ndash;1564#*6&ndash;23+"65#*7&ndash;70+"80+"90$!1#,8&ndash;1580+"33#*9&ndash;56,!9#!a#"fs$!t',
+    '#"pp""2%#&&deg;f$\'mdash;4$\'ndash;3*!4#$,200%"30$#952#&-match%!m$$page$$room$$year#".2',
+    '$!4$!5%!p#,0&ndash;1593,#600-"10+"30+"50+!8,!9+"98#,1&ndash;1898+"26$!0#,2&ndash;1591',
+    ',!7$"fs#*3&ndash;83$!3#,4&ndash;1609+"76#,5&ndash;1560-"81-"91.!4,#700+"60+!7$!0#*6&ndash;30',
+    '#,7&ndash;1599,#608+"32+"75+!8$!1#)8&ndash;6#,9&ndash;1590+"30,!6+"c.#!c#!f#"nd#&x203cm',
+    '#*&ndash;156*!7$&plus;1#"\'s#$,595$#600$#800%"70#(-bedroom##.1%#,0&ndash;1574-"92,#600.!4,#790',
+    '$$1604$$3-04#,1&ndash;1606$!5#\'2&ndash*%;1591.!4,#825#,3&ndash;1604,#918$%-1824$!0#,4&ndash;1604.!8+"43',
+    '+"58$-/5&ndash;1614#"5%$)&ndash;38+"40+"c.$"c.#,6&ndash;1601,#832+!7#*7&ndash;38#,8&ndash;1801$!8#/9&ndash;1557,57-"97',
+    '+"56#!a##b10#"cm#!m""4%#(&mdash;5*!6$\'ndash;2*!5*!6+!0+!4*!8*"93',
+    '#$,208$#530#$.41.$!5%"in$"61$\'784.2gm#*0&mdash;42%*ndash;1547-"73,&616/17,#853$"\'s#)1&ndash;2,#350',
+    '+"45$!b#,2&ndash;1632+"50,!8+"91#,3&ndash;1623+"88$"10$"lb#*4&ndash;95$!0#,5&ndash;1607+"47#,6&ndash;1601',
+    ',!7#,7&ndash;1592,#611+"53,!9+"84+"97$!7#,8&ndash;1611+"60$"7m#,9&ndash;1609-"20#%kcals$!m',
+    '%!s#"pp#"th#&x180cm")5&mdash;7$)ndash;160*#222*"75*"88$&sol;80#"\'s#(,000,000$#500$\'74(48%)#(-a/67-ha',
+    '%#ear#!.$"6p$"7p$"9%##/70%"33#\'0&ndash*";1,#470,#500,#602.!5-"10-"23',
+    ',#950+!5+"91$!0#,1&ndash;1614.!7-"23,#700$!0#,2&ndash;1618-"30+!4$#/53#,3&ndash;1600-"11',
+    '+"99$"02$!3#,4&ndash;1555,#640+"60#,5&ndash;1626.!8-"36+!6$!0#,6&ndash;1574,#605,#948$#/57',
+    '#,7&ndash;1602.!9-"20.!7+"59+"61+!8+!9#*8&mdash;59%*ndash;1643.!9,#714+"81,!3,!9',
+    '#)9&ndash;6,!0+"94#"cm#!m#"nm#"pp",6&amp;degree$%deg;e$\'mdash;9$)ndash;162*"63*!8*!9#$,648',
+    '$#ton##.2p##/03#,0&ndash;1614.!5-"21.!3.!7.!8.!9-"30+!2+$3548+"90+&c.1610',
+    '#,1&ndash;1632.!3+!4+!5+"62#,2&ndash;1613-"37+"63$$1621#,3&ndash;1626.!8-"31-"40+$post$!0',
+    '#,4&ndash;1570,#616-"21-"42+!8#\'5&ndash*%;1613-"28$%-1799&#948#,6&ndash;1640+!7+"89$!0#,7&ndash;1620',
+    '.!4+"70+!8+!9$!p#,8&ndash;1623.!4#,9&ndash;1645$!2##bhp#"ff#!g##ins#!m$"ph',
+    '",7&ndash;1033+"59*#207*"60*!8*!9#$,500$#768#"-2$"95$&member#".0$"1%$"4%$!5',
+    '$"62#\'0&ndash*";1,#602.!5-"23-"35,#800$!.#,1&ndash;1621-"30.!3$!9#,2&ndash;1596,#634',
+    '.!6+&724101$!0$"60#,3&ndash;1645+!4+"79+"92#,4&ndash;1638#,5&ndash;1623.!6.!8-"30+$3018+%after',
+    '#,6&ndash;1612+!8$!9#,7&ndash;1635-"40+$2220+"80$!7#*8&ndash;81$"30#,9&ndash;1654.!9+"87#"cm#"jy',
+    '#(&mdash;9$)ndash;159+"62*!3*"63*"78#(,000,000$#400$#693$#970##.2%#,0&ndash;1619-"20.!9-"39',
+    '+"90+%after$%-1780$".6$"00$"kg#,1&ndash;1628+"84#\'2&ndash*%;1637+%after#,3&ndash;1625-"58$#/92#,4&ndash;1630',
+    '#,5&ndash;1590,#623-"40.!6-"54.!6-"62-"72+!6$!p#,6&ndash;1630-"43-"65+%after#,7&ndash;1629',
+    '+"92+"c.$!0%!1#,8&ndash;1629-"38-"59-"66.!7-"76$%-1679#,9&ndash;1638+"90,!1$%9-902',
+    '#"nm#"th"+9&ndash;163*!5*"65+!9*!8+!0##(1)$"2)#$,000$\'210,000#$-169$&member#!.',
+    '$!5%!p$"9%##/47#,0&ndash;1626-"49-"51$"c.#,1&ndash;1652-"68+!2#,2&ndash;1637-"45-"65$!4',
+    '#,3&ndash;1633-"62#,4&ndash;1632+!6$!0#,5&ndash;1622-"65.!7-"74.!5.!7+!6+"c.$!1%#-56',
+    '-"54-"62.!8,#992+"98#,7&ndash;1646-"65-"70-"81$#/98$!7#,8&ndash;1653-"70$$1653#,9&ndash;1605',
+    '-"50.!7-"63$#/60#!g#!k#"lb#!p$"p."":0$$0:04&"14&"56$$1.71%#:18',
+    '&"57$$2:12$$3:03&"21\'!2&"57$$4:28&"32&"43$!5%#:29&"48$!6%#.47%#:14',
+    '%#:21&"36&"42&"51$$8:00$$9:08#*1&ndash;15+"21$$0:20\'!8$$1:03&"16&"26\'!7&"34',
+    '%#:44$*3&ndash;14%#:39$$4:31&"46$/5:07&ndash;0500&"46$*6&ndash;20%#:58$!8%#:11&"33$$9:37\'!8$#ff.',
+    '%#.12%#:36$*1&ndash;22%#.25%#:07$,2&ndash;17:7,"23%#:40&"56$!3%)&ndash;25,"32%#:10$$4:30$$5:48',
+    '\'!7&!7%#:11&"39$!7%)&ndash;31%#:31&"42$!8%#:19$$9:50#*3&ndash;40+!6$$0:38$!2',
+    '$)3&ndash;9%#:02$$4:35&"44\'!9$!5%#:59$$6:01&"37$/7:07&ndash;0400&"50$$8:58$!9#+40&ndash;41%#:05',
+    '$$1:02&"53$!2%)&ndash;47%#:07&"15&"31$$3:32$$4:44&"51$$5:54$!6%#:04\'!9$!8',
+    '&"56$$9:05&"21#"50%#:10&"35\'!9&"44&"58$$1:17&"51\'!9$!2%#:17$!3',
+    '&"14$$6:24\'!6&"57$$7:57$$8:34$!9%#:29$$:3:2#!6#)7&ndash;8##8ff"!=")announced""bc',
+    '#"wt"\'d03073a#"bm"!f#"f.#"t."#ghz""ha#.h&ndash;15.2hh#!r"#km."!l""m.#"an#%bytes',
+    '(%/hour##ers##l/1&$00ml#&m-wide#"pg"!n"#oml#"zs"(p.p.b.v.&!m#%/mile#$oint#"si#!t',
+    '%!."-th&ndash;19th+$25th$%-16th&#8th%$20th%&seeded$%/19th$!c"#uml",v14&ndash;33"#wt%"%x35cm##4.8#!o',
+    '#\'ear-old!\'6&aring#*commat;1/2#,deg;16\'30\'\'w#,frac12;in/59(!4\'$34;p(!8)#;in#0ins&times;21&ins&";d\'&x9&ins#(mdash;19)"22)"64',
+    ')$foot$&gr;gml$\'iddot;5#\'ndash;0*!0*!5)#11-*"7%+$,000+*-year-olds+%/5/41+!h*"8%+"th*-9-age-working',
+    '),2&ndash;1910*\'2&deg;c*!7)23&ndash;49&ndash;6*!4+)-year-old),4&ndash;18792)9&ndash;7*!4*!9)25&ndash;31&ndash;5*!5),6&ndash;1843*!2*!3',
+    ')!7*)&ndash;15*!-*!2)"8-)#jan)$page#&plus;1$-rime;38&prime)(40&prime#.times;10cm/4in)!9"$(14)#"3)#"4)',
+    '##6%)#"8)"\'+action#!s"%,00()%)0-channel\')processor&"yr%!2$&92,883##130%!8$"88$#991#"20',
+    '%!2$!1$03,24,39&ndash;42$"50$"70%%3,616$"95##300%!8$"14%%5,227$"37$&84-cpu&"hz%!9',
+    '#\'400,000$&12,000%!6$"21%$8.55$&33,796$"57$&63,000$"75#$5000&"ft%!8$"67$%98.15##636',
+    '#&700fft&"km$"26$"69$"79#\'800,000%%4,000$"25%!8$&81,130#\'900,000$&21,000%!3$"49$"82',
+    '#"11$!6$*8year-olds#!2$#-93$"0-%"ft$*4-year-old$"56#"31$!5#!4#!7##and#\'belgium',
+    '$#lub$%olour$"pu$\'ylinder#$date%(y-hunger\'#old$&ollars#$feet#%gauge#$home#$lane#\'million%$nute$(onth-old',
+    '##oz.#$part\'!y$*ensionable$$hase#&runner#&second$#hip$#lot#$team$!o%,-1,024-sparc%#nne(!s#)under-par',
+    '$+ear-earlier"#.02$!5$!6$!7$!8%!m$!c$!p#)1&ndash;2+!8$".2$$0.92$#1.4&"88',
+    '$"6%$!8$!9$"hh&\'-16.3hh$!p%!c##2.2%!6$!3$!6$"8%$!m$"pc#)3&ndash;6',
+    '%!4$-0&ndash;17.30-$9.30$!1$!2$!3$!6$!8$"kg$!p%!c#&4,16.5$".1%!2%!3',
+    '%!5$"/2$!1$!2$"4%$%50,00$"8%$"bn$$mmol$!p$!x#+5&ndash;500%(times;26+!5$".1',
+    '%!3%!4%!5%"68%"91$!1$!4$!6$!9$"ft$"in$!k$"pc$!x#"60',
+    '$!3%&&deg;c$!7$"ff$!p#"70$!m$"pc#%8&deg$#(a)%"b)$".1%!2%!3%!4',
+    '$!3$!7$%94sec$"kg&!s$!m%"hz$#sec#"92$!9$!m#"x."%/1/93$$0/90$!5',
+    '$$7/18%"th$!9#!2$#/87$$0mhz$"12$!3$!5$!8$!9#"32#$4/91&!3$$mbps',
+    '$"52$!6$"80#$6/92$!a#$8/90$!0$!7#"92",0&mgr;molmol$)ndash;162*#200-!%+"20*!3',
+    '*!4*"60+!1+!2+"50##(2)#(,600,000$#931#!-$!1$!7$&a-week$)kilometre%!m$&minute',
+    '#(.061.3gm$!2$"5p$"6%$"8p$"9%#$/100$"69$"95#,0&ndash;1639-"47-"58-"78.!9-"83',
+    ',#838-"50,%982/3-"90+"22+"61+%after+"c.$"\'s$%,1606$%-1774&#914%)kilometre%\'present$"00',
+    '$!a$"bc$#hrs$"mw#*1&mdash;03%(ndash;03+"10,#683+"65$#/02#*2&ndash;03+$1650-"76+"45+"59',
+    '#*3&ndash;12,#643-"52.!4-"75-"97,#701,#867+!7+"84$"/4#,4&ndash;1676+"29+"51$!2',
+    '.!5.!9+"21+"74$!7$!8#*6&ndash;07+$1607-"75,#865+"56,!7+"69+"87#,7&ndash;1651',
+    ',#701,#900+"55+"67+!8$#/08#,8&ndash;1685-"91,#870#*9&ndash;11,!3,!5,#683,#704+"20',
+    '#"bn$"pm#*c/320f/gas$)c-engined$!m#!f$!t#"in#)km/100mls$"ph$"ts#\'lb/73kg##myr#"p.$!p',
+    '#&x300cm""1%#(&mdash;2$\'ndash;4+!9*"73*!8#(,000,000$\'500,000#\'-member$$seat$$yard##.2%%!7$"5m',
+    '#"/2#*0&ndash;11,#665-"74+"32+"60+"84#*1&ndash;14,#644+"75#,2&ndash;1663-"70.!1#\'3&ndash*#;14',
+    '-"67-$85/6#,4&ndash;1648-"61.!5#,5&ndash;1662-"74.!5-"90.!1,!7-"42+"20+"73+"91',
+    '#\'6&ndash*%;1672-"83,#703+"76#,7&ndash;1662-"75-"83,#701+"22+"30#,8&ndash;1648-"80$!p#,9&ndash;1694',
+    ',!4+"62#!h#!o#!p")2&mdash;3$)ndash;165*#226*!3+$&deg*!4*!6+!4*"74*"82',
+    '\'"ff$#148$#500##.09$!6$!7#,0&ndash;1667-"89,#706,#800,#920+"30+"69$%-1705$!0',
+    '-"77-"84.!5+!3+!8,!4+$post#,2&ndash;1687+"23+$post$!0$"40#,3&ndash;1662-"83+"24',
+    '#.4&ndash;1665/7,#701+"35+"40+!5,!0+!6+!7$!.$!5#,5&ndash;1642-"84.!5,#712+"41',
+    '+!6+!8#*6&mdash;50%*ndash;1628-"60-"97,#707+"31+"76#,7&ndash;1699,#705-"12,#800+!3,!7',
+    '$"/8#,8&ndash;1652-"76.!7-"88,#702.!3.!4-"15+"88$%-1644#,9&ndash;1679-"92.!8+"30',
+    '#!m#"nd"%3&deg\'";m$\'ndash;1+"66*#236*!5*!7+!0+!4*!8*!9##(2)#(,000,000',
+    '$%481ff$#500#"-3#%.2ins$"60$!8$"9%#$/557$%b-17s#,0&ndash;1665-"77-"85,#713.!4+"85',
+    '%"33$!0$"mm$!p#,1&ndash;1685,#700-"89+!2#,2&ndash;1715+!3,!4+"47+"54+"77+"87',
+    '#,3&ndash;1634-"85.!9+"95$!.$#/34#,4&ndash;1704+"41+"66$"73#*5&mdash;36%*ndash;1693,#702-"21.!3',
+    ',!2#)6&ndash;8+!9$#.61#*7&mdash;57%*ndash;1688,#711-"67+"74$"23#*8&ndash;50$#/39$"40$!6#,9&ndash;1651',
+    ',#705-"20+"42,!7,!9+"98#!b#"cm#"p.#"rd"+4&ndash;171*#214*!5*!7*!8',
+    '$#508#"-8$$acre$%based$$mile(!s#!.$"40$"5p$!7$"80#$/110#,0&mdash;1660%*ndash;1714.!6',
+    '-"30-"50+"50+"92$#-50$%/1512$"76$"83#,1&ndash;1653,#700+!9#*2&mdash;48%%ndash*%;1651-"60',
+    '-"22.!6-"37+!3+"46+"55+!7$!-%"92$!0#,3&ndash;1706+!4+"52,!6+!6',
+    '$"63#*4&ndash;47+!5+!6#*5&mdash;48%*ndash;1660,#701+"54+!6$"00#,6&ndash;1610+"52$!0#,7&ndash;1655-"96',
+    '+"53+"60+!9#,8&ndash;1660,#710+"50,!3$!.$!0#*9&mdash;60%*ndash;1714+"50,!1+"60$./51&ndash;1710',
+    '#"f.$!f#!n"+5&ndash;171+"83#$,400#"-d$&person$#ton$(year-old#$.2gb$#4lb$!6$"8m$!9',
+    '$"70#,0&ndash;1690.!5,#705-"10-"22-"30-"50-"60,#850,#900-"64+!5+!6+"99',
+    '$(/1650(f)#*1&mdash;75%*ndash;1797+!2+!8$!4#,2&ndash;1720.!7-"37+"55#*3&mdash;54%*ndash;1704-"23-"31,#985',
+    '$!0$!p#*4&mdash;67%*ndash;1742+!6+!9#,5&ndash;1660-"95,#731+"57+!6+!7,!3$!0#,6&ndash;1730',
+    '+"86$"55$"67#,7&ndash;1659+!8+!9#,8&ndash;1713-"26,#958+"75#,9&ndash;1723.!6.!7-"39+"62',
+    '#!c$(&ndash;e$!m#!d#!f$!f#!h$!p#"kg$!m#!m$!l$!m#,o&ndash;1760""6%',
+    '+"72+"82*#204*#301*"67*!9#$,500$#786$#825$#910#*-base-pair%&edroom$&strong$(year-old#".0',
+    '#)0&mdash;2%%ndash*%;1689,#702-"22-"31.!4,#820-"70-"86,#900-"14+!3+"83,!8',
+    '$%-1780&#850&#914\'"80$!.#,1&ndash;1710-"22.!7.!8-"41+!3+"79+%after$!0#,2&ndash;1668',
+    ',#729-"41.!2-"52+!3+!4$!s#,3&ndash;1737-"41#,4&ndash;1726-!3#,5&ndash;1717-"24-"45+!6',
+    '#,6&ndash;1668,#726-"37.!8,#885+!8$!7$#mph#,7&ndash;1723.!9-"31.!3+"68+!8$"13',
+    '#,8&ndash;1672,#720.!8+"71,!3,!4,!8#,9&ndash;1687+"74,!6$!.$#/70$!0#!c##ins',
+    '#"lb#"pp#%sq.ft"\'7&deg;e$)ndash;176+"83,!7*"68*"70+!9$\'plus;10#$,000#\'-clause$&minute$(year-old',
+    '$"5p$!6$!9#$/169#"0%$(&ndash;1,#673,#723-"32.!3.!8-"42-"50+!5$#/71',
+    '#,1&ndash;1713+!9$!0$"57#,2&ndash;1719-"38-"46-"65+!3+"82$!0#,3&ndash;1733+!4#,4&ndash;1704-"14',
+    '-"38-"56+!5+!6+"84,!6$!0#,5&ndash;1678,#741.!8-"51+!7+"82,!8#,6&mdash;1700',
+    '$$,193#,7&ndash;1720-"61#,8&ndash;1707+"88$$1315&"23#,9&ndash;1729-"47+"86,!9$!.$#/80$!0#"ft',
+    '$!1#"pp%!."%8&deg$\'ndash;5+"60*"70+!1+!2##(3)$"5)#(,000,000$#298$#300$#600',
+    '$$page%"in$$yard#..5&ndash;193.8#,0&mdash;1715%\'ndash;1,#720,#900$"/1#)1&mdash;5$%-1734$"02%!3%!4%!5',
+    '%!7$"11%!3%!4$)8&ndash;2#)2&mdash;3%*ndash;1749-"61.!9,#882+!3+!6$!6#)3&mdash;4%*ndash;1753',
+    ',#894,#983$!0#,4&ndash;1733+!5+"91$$/678#,5&ndash;1700-"17-"53.!9-"72+"90$"1m#,6&ndash;1761',
+    '-"65#\'8&ndash*%;1772,#988+"71+"89$%-1872$"/9$!7#,9&mdash;1713+"90%*ndash;1700-"28-"61-"75',
+    '-"96,#833,#989+"91,!2$%-1748##mph"+9&ndash;171*"81#$,486$#785#\'-member$#pin##.40#)0&ndash;1',
+    '.!5,#720-"40.!5-"60.!6,#840-"50+!2$%-1870$#.76$!0#,1&ndash;1745-"55-"81',
+    '$"10#*2&mdash;98%*ndash;1733$"\'5#)3&mdash;4%*ndash;1698+!4+"94#*4&mdash;96%*ndash;1702-"46-"64.!8-"75+!5',
+    '#,5&ndash;1709-"13-"30.!3-"43.!9-"63+!6+!8$!0#,6&ndash;1759-"82$#257#,7&ndash;1700.!8',
+    '.!7-"48-"50-"69+!8#,8&mdash;1708%*ndash;1770-"82+!9$%-1787#,9&ndash;1708-"79$!3#)c&ndash;d#"lb',
+    '$%0.63.%#:02&"25&"31$$2:05&-18&ndash;0400&"48&"57$$3:08&"50$!4%#:30\'!1$$5:12$$6:38',
+    '&"31&"44$$9:03&"25#)1&ndash;2$$0:05&"45$$2:44$*3&ndash;15%!f$*4&ndash;23%#,15%#:41&"58$!5',
+    '&"28&"52$$6:13$!7%#:26$!9%)&ndash;31%#:01&%27.69&"32&"43\'!6&"53#%20:04$$1:07',
+    '&"32$$2:42$!3$\'4:08.81&"22\'!5$!5%#:07$!6%!f$$7:09&"31\'!6&"58$!8',
+    '&-18&ndash;0500\'!9&"35$/9:10&ndash;0400#%30:26$$1:23$!2%#:28&"33$$4:09&"34&"44$!5$!6%#:33',
+    '$!8%#:20&"30#+41&ndash;48%#:36$!2%#:09&"37$$3:05&"11&"30&"54$$4:12&"55$$5:08',
+    '%#:18&"49$!7%.:24&ndash;0400&"41$$8:59$!9%#:49#!5$$0:06$$1:32&"56$$2:20\'!2\'!8',
+    '$!3%#:08$/4:37&ndash;0400&"50$/5:02&ndash;0500\'!5&"47$/7:40&ndash;0500$!8%#:36&"42$!9%#:02##6,7#*7&ndash;11',
+    '"$_per"#bit"#c54"!d""ff#&t-high"!g""hp#!z"!i#"ns""ka#&g/s/ha#"hz#\'m/60mls',
+    '"#l/2",m&sup2/litre#$bits#$iles$!n#!l#"pg"+p.christmas#)c/16pc(f)""r8#"pm"%s-18s"-th&ndash;17th$%-17th&#8th',
+    '%$seed$\'century$!e""v.#$8h-5$!z#!i")year-olds!\'7&aring#,deg;16\'38\'\'w#\'frac12%)#;in(53&times;23&frac12&ins(!4\'&34&ins',
+    '$\'t;6&ins#(mdash;19$\'iddot;2*!9#2ndash;01&ndash;584*!2*!6*,8&ndash;81843#522)#11-*!2*$8.30+/:diagram/figure+"th*$9.30',
+    ')22&ndash;66&ndash;1*+1&ndash;967*&3/2/41*!5+"th*!8*!9+!%)"31*!4**5-year-old*!7*!9)"45)25&ndash;42&ndash;5',
+    '*!9),6&ndash;1848)"7-*!0*!4)#oct)$sept))wednesday#$plus\'";1#&sol;74"!\'#!n"#(-)##10)',
+    '$"5)#"5)#"i)$"i)""**""+2"),000-foot\'$seat&"km&#rpm$"35%!9$"57$"71$"84',
+    '$"38$"74%$5.53$!8%/,19,20,21,22,25&"20%!5%!7$#987%"92#\'200,000\'#722$"80$!9%!0',
+    '$"51$"67$"79##415$"30%!9$"62$"95#\'500,000*+&mdash;more&"ft$&12,610$"28$"85##600',
+    '$"40$"57&$,000##787$%91.55##850&#.66$"68$"80##936$%48.01$"77"#-13$!4$!6',
+    '$!5$!7$!9#"30$!1#!6#!7#!8#!9#*and-a-half##bar$"ed#\'day-old#"er#$fold',
+    '#$goal#%horse#"km#$mile$)onth-long#&nation#$page$\'er-cent&-centage-point#%state%"op#%to-18%!n#%under#$week',
+    '\'%s-old"/.00&ndash;18.45%!.%!0$!4$"5%$!6$!7$!8$!9%".1#)1&ndash;7%(times;26$".3%"89',
+    '%".1$$2.92$"6m$2g-bytes-per-second$"hh$"pc#$2(a)%"b)%"c)$".1%#2.2(!.%!6&".1%!7',
+    '$!1$!2$"5h%!p$!7%"pc$"hh$"pc#$3(a)%"b)$".1%!2%!3%!4&!9',
+    '%!6$-0&ndash;18.30$#147$!3$!6$#701$!8$!9$"hh$"kg#*4&times;10$#.86%095&ndash;23.6.95$"4p$!6',
+    '$!k#(5&deg;dh%*ndash;38.3+$48.3$".3%!4$!1$!2$!4$!5$"63$!8$$_per$"cm$"kg',
+    '$"mb%"pg&!h$#pts#,6&ndash;17.8$\'-gallon$".1%!2%!4%"89$!2$!3$!4%!%$!6',
+    '%!%$!9$#fl.$!p%!c#$7.81$!0$!1$#4in$!5%"in$$secs$!x#,8&ndash;38.7%*times;25.4',
+    '$,+53.2/-13.8%$#.93$!3%!p$"5p&!c#$9.91$"8%"!/#%10/89&"92#!2$#/87$!1$!9',
+    '%"93$"21$!4##551$"95#"68#$8/93#$9/90$!2$!3$"71#!l#$napp"%0&deg\'0;c/325&deg;f/gas',
+    '$\'mdash;1*!3%$gr;m%&icro;a*!h$%ndash)%;1348*!2$&sol;82##(1)#(,000,000#%-180.$&member&#tre%"ph',
+    '$%place$$seat$$yard#".0$"25$!4$!5$!8#$/105%"27%"81#"0%$&&mdash%*ndash;1100,#600',
+    '-"44.!6-"52-"76-"80.!9,#830-"50+!2,!5+"48+"63$"\'s$#000%#259',
+    '$"km$!n$#rpm$\'s/early#)1&mdash;2%*ndash;1760-"76,#981+!8$#-75#)2&mdash;4%(ndash;11,#711.!4-"68',
+    '+"24+!5+!8,!9$%-1714#*3&ndash;13,!7-"52.!8-"61-"91+"84#*4&ndash;06+$1741-"86',
+    '+!5+!8$"30#*5&mdash;06%*ndash;1731-"47-"52-"80.!5+"57+!8#*6&ndash;11,!2,!4,#790',
+    '+"44+"50+!7,!5+"84$%,1707$!0%$0671#*7&ndash;10,!4,#712-"64-"78-"80+"54',
+    '$!.#*8&mdash;10%(ndash;13,#770-"88.!9+"22+"78+!9$$8522#*9&ndash;10,!1,#784+"84$#-31',
+    '$"68#":1#!a#&c/340f$!m#%g/6oz#"lb#"ml$!m$!w#!o#&x170mm"(1&frac12$)mdash;172$)ndash;172',
+    '*!3*"82+!9*!9##-km$$yard##.7%#*0&mdash;23%(ndash;11,#570,#714-$54/5-"62-"79-"81',
+    '+"21+"62+"87#*1&mdash;12,!3,!4%(ndash;12,#783+"65+"74+"87,!9#*2&ndash;13,!5,#778',
+    '-"80-"90.!2$!0$!1#*3&mdash;14%*ndash;1763-"82.!6,!9+"23+"40,!2$#/14#*4&mdash;17',
+    '%(ndash;15,!6,#794,!8-"30+"21+"60,!1+"87+"99$%-1800$#/15#*5&ndash;16,!7-"56',
+    '-"86,!8+"20,!1+"45$$9-61#,6&ndash;1772-"94,!8+"35+"93#,7&mdash;1810+"30%*ndash;1788,!8',
+    '+"24+"38+"80$$-1ga$./18&ndash;1772#*8&mdash;22%*ndash;1800-"38-"43,!9+"82$#579#*9&mdash;21%*ndash;1784.!7',
+    ',#800+"21+"81,!8+"96#!a#!e#"th""2%#(&ndash;4*!6*"73*!8+!2+!3',
+    '#(,000,000#&-tonne#".1$"72#$/112#*0&mdash;40%\'ndash;1,#742-"60-$83/4.!9,#808+!2,!1+"39',
+    ',!8+"95#,1&ndash;1739-"65,#802+!2+"42+!6#,2&ndash;1746-"99,#800-"39+"63+"71$%-1844',
+    '$!3#,3&ndash;1761-"77-"90.!6+"38+!5+!7,!6+"90,!1+$post$"\'s#\'4&ndash*#;25',
+    '+!6+!8+!9$"6m$"70#)5&mdash;6%*ndash;1801.!3.!9-"10.!3+"27,!9+"30,!8',
+    ',!7+!6+"75+!9,!5$"mw#,6&ndash;1782,#804+"43+"84+!9,!5$%-1989$!0$$1727',
+    '%*ndash;1784-"93,#805+"55+"83+!9,!6,!9$#-80#,8&ndash;1788-"93+"31,!2+"79+!9',
+    ',!2,!5$%-1800#,9&ndash;1777,#804-"65+"30,!9+"40,!7+"81+"97#"ff$!t#"lb',
+    '#$&deg$)ndash;174,!6*!7*!8*"96#$,015%"62$\'700,000$#800#$-175##.0g$%5x173$"8%$"9%',
+    '#,0&ndash;1793,#803-"60,#960+"40,!5,!7+"54+"65+"74+!8,!2$%-1990$%/1830#,1&ndash;1800',
+    '+!2+"40+"92$!.$!0#,2&ndash;1799,#811.!2+"34+"40+!5+"96#,3&ndash;1801.!4.!6',
+    '+"34+!5+!6$!2#,4&ndash;1771-"93.!4+"48+!5#,5&ndash;1753-"82,#803.!5-"12.!4',
+    '-"21-"35+!6+"82$%-1818#,6&ndash;1802-"14.!6+"65+"82$(()/n/164#,7&ndash;1799,#805.!6.!7',
+    '$!.#,8&ndash;1822-"39+"40+!9,!4$%-1804$-/9&ndash;1810#*9&mdash;40%*ndash;1763+"43,!8+"97$#/40##d12',
+    '#!m#%x98.5""4%#)&ndash;87$)plusmn;27#(,832,000#\'-member$&seater#!.$"4%$#5km#"/l#)0&mdash;1%*ndash;1755-"94',
+    ',#803-"18-"21+!2+!4,!4+"93$"\'s$"/1$!0#,1&ndash;1789,#811-"20.!5.!8',
+    ',!8+"61+"90,!9$!0#,2&ndash;1801-"10+!5+!7$!0#,3&ndash;1803-"11.!3-"21.!6',
+    '+"57$!0#,4&ndash;1829-"35+"47+!5+"63+!8$%-1786$!9#,5&ndash;1816-"24.!8.!9-"31',
+    '-"56+"46+!7+!9$#-49#,6&ndash;1799+!8+"94+$post#,7&ndash;1765,#823-"33+"48+"54+"83',
+    ',!4$!0#,8&ndash;1804-"10+"89$%-1816$!0#\'9&mdash%*ndash;1799,#802-"30.!6,#932+"60$#/50',
+    '##lbs#"th")5&deg;5\'e$*mdash;half%&gr;gml$)ndash;176*!2+/25g/6&ndash;8oz*!6*!8+!2+!5*"92##(1)#$,301',
+    '$#925##-10$#bed$\'hectare#".2$!5$!8#$/569$"60%!5#*0&mdash;70%\'ndash;1,#780-"93,#811',
+    '-"25-"30,#900-!1.!8-"20-"93+"51,!6,!8+"63+"77+"90,!1$!-',
+    '$$1-05$!5#,1&ndash;1771,#812-"29-"36-"51+!2+!3+"50+"64+!7$#-65$"/2#,2&ndash;1812',
+    '-"26-"31.!2.!7-"42+!3+!4#,3&ndash;1781,#828-"33+!4$!.$$1828#)4&mdash;5+!7',
+    '-"32.!5+"55+"60,!1#,5&ndash;1794,#826-"31.!2+"56+!6,!5,!7+!7$!0',
+    '+"61%*ndash;1778,#811.!6-"29-"32.!5.!7-"71+"78+"91#,7&mdash;1834%*ndash;1822-"33.!6',
+    '+"58+"63,!7#,8&ndash;1773,#826-"32+"60,!2+"70$!.#,9&ndash;1806.!8-"13.!9-"24',
+    '-"34.!5-"57,#918+"66+"88+"96,!7$!0#)b&ndash;c#&g(6oz)$,/6oz/&frac23)!1*\'&frac12#%kcals',
+    '$"ts#!m#!o"+6&ndash;177+"96*!8*!9+!6#$,228$#700$#800$#900#$-pin#$/111$#207',
+    ',#820+!5%*ndash;1790,#823.!5-"36.!9-"43,#930+"66+"80+"95$%-1837$"00$!5',
+    '%*ndash;1807-"10-"43.!4+"62+"80$#171$"cc#,2&ndash;1800-"12.!4-"34-"42-"50.!1',
+    '-"29+"72+"96#,3&ndash;1766.!9,#804.!8-"23-"33-"43$"/4$!0#,4&ndash;1802-"23.!6',
+    '-"39-"40+!5+"72+!8$!0$"cc#)5&mdash;6%*ndash;1817-"37.!8-"41.!5.!6,#985',
+    '$#-66#)6&mdash;7%*ndash;1824.!6-"37.!8+"73,!7+"90$#-67$"51#\'7&mdash%*ndash;1769-"94,#800',
+    '.!7-"40.!9#,8&ndash;1771,#834.!5-"42.!7-"51.!4.!5+"69+"71,!2,!4',
+    '$!0#*9&mdash;73%*ndash;1771.!3,#821-"33.!7-"59-"97+"74,!5,!6+"90$#/70$$1859',
+    '#)d&ndash;e#"lb#!m$!b#!w""7%#$&deg$(mdash;82$)ndash;179+(83&deg;c*!4*"83##(2)#$,352$\'631,159',
+    '#\'-member#$.305$"7m$%8&deg#\'0&ndash*";1,#812.!3-"27-"30.!5-"40.!3.!4.!5',
+    '-"51-"70+!5+"71,!4+"82,!8,!9+"97$"/1%"71$!0$"kg#)1&mdash;3%*ndash;1832',
+    '.!5.!8-"50.!8-"62+"74$"\'s$"10#\'2&ndash*%;1808-"27.!8-"42.!4+!3',
+    '+!6+"73,!4$%-page#*3&mdash;in%*ndash;1774.!7,#812.!4-"22.!9-"55.!7-"60.!1',
+    '+"85,!9+"92$!.$"/4#)4&mdash;5+"76%*ndash;1775,#834-"41.!2-"62+!5+"75+!8',
+    ',!7#)5&mdash;8%*ndash;1777,#802.!4-"30.!3-"48-"51+"80,!3,!4,!9+!9$"19',
+    '#*6&mdash;83%*ndash;1792,#801.!6-"32-"45.!7-"51-"60+!7+"80+"92$"-7#,7&ndash;1779,#836',
+    '-"53+!9,!8$"22$"70#,8&ndash;1837-"41.!6.!7.!8.!9-"50.!5-"68,#978',
+    ',!8$!0#*9&mdash;82%*ndash;1830.!5-"44-"51-"78+"81#\'b/177rg#!c##ff."+8&ndash;182*!3*!4',
+    '+!7*"91##(1)#%-seat$&wicket#".1%!%$"3%$"7%#$/180&!2#*0&mdash;81+"90%*ndash;1812-"20',
+    '-"36.!8-"49-"90,#914-"20+!2+!4+"81,!5$!-%$1880$"/1#,1&ndash;1803-"33',
+    '-"52.!8+"83+"91$!.$"/7$!0$"cc#)2&mdash;4%*ndash;1801-"35-"43.!7-"51.!7',
+    '+!3+!4+!5+"83+"90$"/3&+&ndash;1818#,3&ndash;1791,#801-"26-"52.!7-"61-"70,#965',
+    '+!9$!-$"70#)4&mdash;5+!6%*ndash;1801-"18-"43-"65-"70+!8,!9+"93#)5&mdash;9%*ndash;1846',
+    '-"63.!5.!6.!8-"72,#937-"85+!6+!7+"86,!7,!8+!9,!0$!0',
+    '-"26-"45.!6-"50.!3.!4.!5-"61.!7.!8+"91#,7&ndash;1827-"51.!2-"60',
+    '.!9+!8,!9+!9,!2#,8&mdash;1803+!9%*ndash;1824-"57-"60.!8-"70.!1-"86+"89',
+    ',!1$%-1850%"95$#/89#,9&mdash;1814,#919+"90,!2%*ndash;1805.!7-"15-"28-"46.!7.!8',
+    '.!7.!9-"66-"81+"90,!1$!6##bhp#"cm#"ft#!h#"kg#!m#!p"*9&mdash;84',
+    ',!3,!7+"91,!6*!5*"85+!7##(2)#$,000%"52$\'280,000$#388$#500#$-222$&member',
+    '$#run#..3&ndash;207.9$"6p$#839##/92#)0&ndash;1,#794,#800.!8-"32-"46-"52.!4.!8-"70',
+    '+!4+!6$"\'s$".9$!1$!5$"7e#,1&mdash;1820%\'ndash;1,#823-"44-"51.!9-"68-"73',
+    '+!5#)2&mdash;3+!6+"at%*ndash;1797,#841.!3.!8-"63.!4.!6.!7.!9-"76.!8',
+    '+!5+"93$%,1794$%-1868%!9#)3&mdash;4+$over%*ndash;1807-"34-"60.!2-"72.!4+!6+"94',
+    '$)-february#,4&ndash;1804.!6-"39-"52-"66.!8,#948+!5+!7+!8#,5&ndash;1803-"20-"37-"44',
+    '-"65-"77-"85#)6&mdash;7%*ndash;1800-"16-"53-"71.!8-"80+\'99/1800$!0#,7&ndash;1804-"48-"51',
+    '.!6-"74.!5$%/1801#)8&mdash;9%*ndash;1801-"15.!6-"28-"59-"66.!8-"73-"81.!3',
+    '#,9&mdash;1801%*ndash;1800-"37-"68-"70.!1.!7$%-1871$!0#!a##ff.#!m##run"#:00%#:39',
+    '$$2:57$!3%#:40$$4:25&"44&"54\'!9$!5%#:08$!6%#:05&"39$$7:03&"26$$8:20',
+    '#)1&ndash;7$*0&ndash;14%#ff.$$1:01&"16&"52$*2&ndash;23%#:06&"43$$3:36$!4%#:07&"13$$5:03&"36',
+    '$/6:01&ndash;0400&"24&"52$!7%#.48$!8%#:22&"31&"49$*9&mdash;34%#:22&"38$"f.#!2$!0',
+    '$!4$$5:37&"55$!6%#:02&"48&-50&ndash;0500$!7%(&ndash;8%#:43$$8:53$!9%#:42\',8&ndash;0500#!3',
+    '&"51\'!4$$2:55$$3:13&"55$$4:53$$5:16&"55$$6:38$!7%#:01&"58$!8%#:30&"56',
+    '$$4:27$$5:52$$6:48&"58$$8:24\'!7#%51:54$\'2:19.90&"54$$3:18$$4:47$!6%#:17&-39&ndash;0400$!8',
+    '$$9:23#"7f#*8&ndash;16#!9$":1$#ff."$_per"!b""cm#!u"!d#!b#!h"#ff.#"t.',
+    '(#22s$\'4min30s(&51.79s$*6min05.27s#!h"#ins""kw"$mgml#"in#!l#$onth\'$-old"!q#"13"#sec',
+    '#%trong"#tel#&h/21st"$u/ml"0x25x7&middot;5cm"(year-old""zs!#8%.")&divide;3#,frac12&ins;h)";p$#t;x#$half#(mdash;12)"20',
+    '*!5)"30$$gr;m#2ndash;1&ndash;1915*)0&ndash;0+!-*"2-*"71**9-year-old)$20ft+!h+"th*\'1&deg;c*%2&deg**4-year-old',
+    '+/ins(46&ndash;61*"5%*!6*\'7&deg;c*#8th*!9*!i)!3*+0-year-olds+!.+!s*!2*!3*$4132*!6',
+    '),4&ndash;1865*!0*!5+!7*"7%*!9+!%)!5*!0*!3*!4*!6*"8%)"60*!7',
+    ')!7*(&ndash;0*!0*!1*!4*!6))8&ndash;8*!0*!4*!5)!9)#thu)(year-old#$plus$$rime',
+    '((year-old#,shilling;0d.,*4&frac12;d-!d$$ol;2#(times;10*#8in)$21in"!\'#!s"$(14)$"6)$"8)$"a)#"c)',
+    '"#,00%&0-acre\'%staff)$rong\'#ton&!0&"km&"sq$&27,432##100&"ft$"28$"48$$55ft$"73',
+    '%"53##215$$2,24$&31,588%!7$"57$&71,000%!6$"98##306$"37$"43$"61$$80ft##400',
+    '$"14$"20$646,744,073,709,551,615#&500&ft&$,000$$10ft$"44$%59.71$"60%!4#\'600,000$&17,841$"90%%9,884##730',
+    '%%9,000$"66%!8#+800-lexicon$!1%!1$"22$"30$"40$"76##900$"63""-1$!1$!3',
+    '$!7$\'9-1/2ft%!.%"th#!2$#-93$+0-years-old$"4-$#60c$!7$!9#!3$!4%*-year-olds$!6',
+    '#$5-86#!8#$acre#)base-pair$&edroom$"it#*carat-gold&#bon$)hromosome$!m$%olour%!w#$date#%fight%)rst-class',
+    '#&gallon%"me%#uge$#ift$#oal$"un#$hand#"in#"kg$!m$#not#%light#&minute#(over-par#%party',
+    '#&second$%toned#%to-24%!n$"ry#$week$"ho#3year-old-fun-loving,&german-"uy\'!s($-old"#.01$!2$!3',
+    '$!7$$9.91$!p#$1(b)$#.75$*0&ndash;15%".0$$1.87$+2.3&ndash;5$!4%".0$!6$!7$!8%!%',
+    '$!m#&2.1988%!2&".2%!4$!3$"5p$"7%$!m#$3.93$-0&ndash;21.30$$1pts$!2$!3$!4',
+    '$!8$!m%"pg$!p%!c#$4%by$+&ndash;29.4$!0$!1$!2$!4$"pc##5.1&!2&!4',
+    '%"83$!1$"51$"mm$"pc#,6&ndash;19.9+"20$#-ks$!1$"kb#"73%!p$#mpg%!s#,8&ndash;31.4',
+    '$!6$#mpg#-9&ndash;18.12$#(a)%"b)$#.92&!3$!1$!5$#mpg"&/1,000$!0%#.93$"15$"83',
+    '$"13$!4#$3/41%"93$!0$!3$!9#"40%!2#$5/93$"50#"69#!7$!0#$8/10',
+    '#"92#*colour/102*-subtitles/100"+0&deg&aring\'+;-359&deg;.("c/*)325&deg;f(#s;c%)ivide;300%\'ollar;c$-ndash;210&deg+"25+"35+&50/min*!3',
+    '*#400+"39*#600*!7*!8*"92##(1)#)+2+45=262#1,000&lsqb;00&rsqb\'$,000\'\'-tonnes#$-240$#cow$$fold$)kilometre',
+    '$#odd$%pupil$&volume$$yard%\'ear-old##.7%#$/pi.#)0&ndash;1,%600bc,#803-"14-"23-$50\'s.!3-"67',
+    '-"81,#920.!9-"33-"48',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_97 = (
+count_97 = 6694
+
+heads_97 = (
     '1,000&ndash;1,200',
-    '1,000&ndash;1,200kg',
-    '1,000&ndash;1,300cc',
-    '1,000&ndash;1,320kg',
-    '1,000&ndash;2,000',
-    '1,000\'s',
-    '1,000,000&ndash;1,200,000',
-    '1,000,000,000',
-    '1,000,000-1,500,000',
-    '1,000,000-mw',
-    '1,000,000t',
-    '1,000-1',
-    '1,000-bomber',
-    '1,000-calorie',
-    '1,000-gallon',
-    '1,000-lb',
     '1,000-mark',
-    '1,000-mile',
-    '1,000-mw',
-    '1,000-number',
-    '1,000-odd',
-    '1,000-pupil',
-    '1,000-seat',
-    '1,000-signature',
-    '1,000-the',
-    '1,000-to-one',
-    '1,000-tonne',
-    '1,000-watt',
-    '1,000-year-out-of-print',
-    '1,000-years-old',
-    '1,000.',
-    '1,000cc',
     '1,000ff/year',
-    '1,000g',
-    '1,000m2',
-    '1,000mbq',
-    '1,000mile',
-    '1,000mpc',
-    '1,000myr',
-    '1,000nm',
-    '1,000p',
-    '1,000p.p.m.',
-    '1,000pg',
-    '1,000rpm',
-    '1,000va',
-    '1,000yrbp',
-    '1,002',
-    '1,004,353',
     '1,004,831.44',
-    '1,004m',
-    '1,005,500',
-    '1,007',
-    '1,007,856.16',
-    '1,009.6%',
-    '1,00bomb',
-    '1,010,000',
-    '1,011.9m',
-    '1,012.5',
-    '1,013',
-    '1,013-hectare',
-    '1,014',
-    '1,014,621.23',
-    '1,014-member',
-    '1,015',
     '1,015,007.80',
-    '1,020',
-    '1,020,304,050,607,080,910,100',
-    '1,021.9m',
-    '1,024-node',
-    '1,024k',
-    '1,024kb',
-    '1,024mb',
-    '1,025',
-    '1,027.7%',
-    '1,031',
-    '1,031ft',
-    '1,033,000',
-    '1,033-member',
-    '1,033.7',
-    '1,034',
     '1,035',
-    '1,037.1%',
-    '1,038',
-    '1,040',
-    '1,040,000',
-    '1,040,325',
-    '1,041',
-    '1,042',
-    '1,047lbs',
-    '1,048',
-    '1,048,000',
-    '1,048,185',
-    '1,049',
-    '1,050,000',
-    '1,050g',
-    '1,052,000',
     '1,052,500',
-    '1,054',
-    '1,055.4',
-    '1,055hp',
-    '1,056',
-    '1,056,000',
-    '1,057,000',
-    '1,057,030',
-    '1,057,833',
-    '1,058',
-    '1,060,000',
-    '1,060.50',
-    '1,060m',
-    '1,061',
-    '1,062,000',
-    '1,064,906',
     '1,066-mw',
-    '1,067,170',
-    '1,069.5%',
-    '1,070k',
-    '1,070m',
-    '1,072',
-    '1,072%',
-    '1,074',
-    '1,074,500',
-    '1,075sq',
-    '1,077,000',
-    '1,078',
-    '1,080,001',
-    '1,080,100',
-    '1,081,000',
-    '1,081,600',
     '1,082p',
-    '1,084',
-    '1,085,000',
-    '1,085m',
-    '1,086',
-    '1,087',
-    '1,090,460',
-    '1,091,942',
-    '1,095',
-    '1,096',
-    '1,097',
-    '1,099',
-    '1,1\'-dioctadecyl-3,3,3\',3\'',
-    '1,1,0',
-    '1,1,1-trichloro-2,2,2-trifluoroethane',
-    '1,1,2,3',
     '1,1,3,3-trimethoxypropane',
-    '1,100%',
-    '1,100&ndash;1,200kg',
-    '1,100-acre',
-    '1,100-km',
-    '1,100-member',
-    '1,100-room',
-    '1,100-space',
-    '1,100-sq',
-    '1,100-strong',
-    '1,100c',
-    '1,100ft',
-    '1,100kg',
-    '1,100rpm',
-    '1,101',
-    '1,102',
     '1,105,000',
-    '1,105,099',
-    '1,106,000',
-    '1,107&ndash;8',
-    '1,107.2',
-    '1,108',
-    '1,109',
-    '1,111',
-    '1,111,000',
-    '1,112,298,677',
-    '1,113',
-    '1,115,963',
-    '1,116',
-    '1,116-bp',
-    '1,119.2',
-    '1,12-14',
     '1,12-19',
-    '1,120,517',
-    '1,122',
-    '1,123p',
-    '1,124',
-    '1,124,000',
-    '1,126,181',
-    '1,128m',
-    '1,130kg',
-    '1,133,000',
-    '1,134,220',
-    '1,134p',
-    '1,134th',
-    '1,137',
-    '1,139,100,000',
-    '1,140',
     '1,140m',
-    '1,141',
-    '1,142',
-    '1,144',
-    '1,145-branch',
-    '1,148',
-    '1,150,000',
-    '1,150-gallon',
-    '1,150-mile',
-    '1,150-piece',
-    '1,151,411',
-    '1,151439',
-    '1,153,300',
-    '1,153,502',
-    '1,153p',
-    '1,154g/day',
     '1,155',
-    '1,157',
-    '1,157,000',
-    '1,157.5',
-    '1,159',
-    '1,159m',
-    '1,160&ndash;1,250hp',
-    '1,160,000',
-    '1,160p',
-    '1,161',
-    '1,161.2',
-    '1,162',
-    '1,165',
-    '1,166',
-    '1,166,000',
-    '1,166-1,008',
     '1,167',
-    '1,167m',
-    '1,169',
-    '1,170,000',
-    '1,171',
-    '1,171-mile',
-    '1,171p',
-    '1,172',
-    '1,175p',
-    '1,176,175',
-    '1,178.8',
-    '1,179',
-    '1,180,000',
-    '1,182.4%',
-    '1,185',
-    '1,186',
     '1,187',
-    '1,189',
-    '1,190,000',
-    '1,19070yrbp',
-    '1,190p.p.m',
-    '1,1939',
-    '1,194',
-    '1,194.3',
-    '1,196',
-    '1,196.5',
-    '1,1961',
-    '1,1975',
-    '1,1979',
-    '1,198,000',
-    '1,1982',
-    '1,199',
     '1,2,1',
-    '1,2,3,4,5,6,9',
-    '1,2,3,4,5,7',
-    '1,2,3,4,5,7,9,11,15,20,25,30',
-    '1,2,3,4,6,12',
-    '1,2,3,5,7',
-    '1,2,3,5-dithiadiazole',
-    '1,2,3,6,7',
-    '1,2,3.',
-    '1,2,6,7',
-    '1,2-dibromoethane.this',
-    '1,2-dimethylhydrazine',
-    '1,2-disulphur',
-    '1,2-dithiadiazolium',
-    '1,2-dithiadiazoliums',
-    '1,2-isomer',
     '1,2-isomers',
-    '1,2-rings',
-    '1,200&ft',
-    '1,200-2,000',
-    '1,200-acre',
-    '1,200-mile',
-    '1,200-plus',
-    '1,2000',
-    '1,200bp',
-    '1,200cc',
-    '1,200hz',
-    '1,200kbps',
-    '1,200kg/2,645lb',
-    '1,200mm',
-    '1,200p',
-    '1,200v',
     '1,200yrbp',
-    '1,202,000',
-    '1,210',
-    '1,211',
-    '1,212,898',
-    '1,213',
-    '1,213,073',
-    '1,214ft',
-    '1,215',
-    '1,217,000',
-    '1,219',
-    '1,220,000',
-    '1,221',
-    '1,223g/day',
-    '1,224',
-    '1,225%',
     '1,226',
-    '1,227km',
-    '1,230,262',
-    '1,232,750',
-    '1,234',
-    '1,236',
-    '1,237',
-    '1,239',
-    '1,240,937',
-    '1,240km',
-    '1,241,000',
-    '1,243',
-    '1,245',
-    '1,246.83',
-    '1,247',
-    '1,248,900',
     '1,249',
-    '1,249,000',
-    '1,250,600',
-    '1,250kg',
-    '1,250lb',
-    '1,251',
-    '1,252.51',
-    '1,255',
-    '1,256,000',
-    '1,256m',
-    '1,260,000',
-    '1,261',
-    '1,261,000',
-    '1,262,000',
-    '1,262nd',
-    '1,265',
     '1,265,000',
-    '1,267',
-    '1,269',
-    '1,270',
-    '1,270,000',
-    '1,271',
-    '1,274',
-    '1,275,000',
-    '1,275,830',
-    '1,278g/day',
-    '1,279,212',
-    '1,280km',
-    '1,280m',
-    '1,282',
-    '1,284',
-    '1,284%',
     '1,284.00',
-    '1,285',
-    '1,285&deg',
-    '1,287',
-    '1,288',
-    '1,291',
-    '1,294,388',
-    '1,295,029',
-    '1,298,000',
-    '1,298,538',
-    '1,3%',
-    '1,3,2',
-    '1,3,2,4-dithiadiazole',
-    '1,3,2,4-dithiadiazolium',
-    '1,3,4,9,26',
-    '1,3,5,7,9',
     '1,3,9',
-    '1,3-compounds',
-    '1,3-dithiadiazolium',
-    '1,3-dithiadiazoliums',
-    '1,3-isomers',
-    '1,3-radicals',
-    '1,3-rings',
-    '1,300%',
-    '1,300&deg',
-    '1,300&deg;c',
-    '1,300&ndash;1,600',
-    '1,300-1,500',
-    '1,300-acre',
-    '1,300-member',
-    '1,300-ton',
-    '1,3000',
     '1,300ft',
-    '1,300lb',
-    '1,301.',
-    '1,303',
-    '1,303,469',
-    '1,304,365',
-    '1,306',
-    '1,31,36',
-    '1,310,000',
-    '1,310-megawatt',
-    '1,312ft',
-    '1,317',
-    '1,317g/day',
-    '1,320',
-    '1,321',
-    '1,322,000',
     '1,322,902',
-    '1,322kms',
-    '1,325hp',
-    '1,327',
-    '1,329',
-    '1,330',
-    '1,332,000',
-    '1,333',
-    '1,338',
-    '1,339',
-    '1,341,247',
-    '1,344',
-    '1,344%',
-    '1,344,639',
-    '1,345',
-    '1,347,636',
     '1,348',
-    '1,349-page',
-    '1,350g',
-    '1,350g/3lb',
-    '1,350gph',
-    '1,351',
-    '1,352',
-    '1,353,000',
-    '1,357',
-    '1,358,000',
-    '1,359',
-    '1,360',
-    '1,360,000',
-    '1,360cc',
-    '1,360kg',
-    '1,362',
     '1,363.5',
-    '1,364,788',
-    '1,364p',
-    '1,365',
-    '1,368',
-    '1,369',
-    '1,370,000',
-    '1,370-mile',
-    '1,371,632',
-    '1,372',
-    '1,374',
-    '1,374,000',
-    '1,375',
-    '1,375.25',
-    '1,376',
-    '1,376,000',
     '1,377',
-    '1,38',
-    '1,382,000',
-    '1,383',
-    '1,385,300',
-    '1,385kms',
-    '1,388.32',
-    '1,390',
-    '1,394',
-    '1,394,000',
-    '1,394.32',
-    '1,394ft',
-    '1,395,000',
-    '1,398',
-    '1,398,330',
-    '1,399.8',
     '1,3oo',
-    '1,4',
-    '1,4,5-trisphosphate',
-    '1,4,7,10',
-    '1,4,9',
-    '1,4-',
-    '1,4-addition',
-    '1,4-diacetoxymercuri-2,3-dimethoxybutane',
-    '1,4-dihydro-4-oxo-3-quinolinecarboxylic',
-    '1,400-1,500',
-    '1,400-1,600',
-    '1,400-bed',
-    '1,400-strong',
-    '1,400-word',
-    '1,400-year-old',
-    '1,400ft-high',
     '1,401',
-    '1,402,000',
-    '1,402,515',
-    '1,404.98',
-    '1,405,000',
-    '1,406,796just',
-    '1,407,774',
-    '1,408',
-    '1,408.26',
-    '1,413',
-    '1,413.15',
-    '1,415',
-    '1,416',
-    '1,417',
-    '1,418',
-    '1,420',
     '1,420.18',
-    '1,420.91',
-    '1,420g/day',
-    '1,422',
-    '1,424',
-    '1,424shp',
-    '1,425',
-    '1,426',
-    '1,428,500',
-    '1,430m',
-    '1,431.85',
-    '1,433',
-    '1,434',
-    '1,434,000',
-    '1,436',
-    '1,437',
     '1,437,233',
-    '1,439',
-    '1,440,000',
-    '1,440-member',
-    '1,440-vote',
-    '1,440mhz',
-    '1,441&ndash;1,449',
-    '1,442',
-    '1,443,000',
-    '1,447',
-    '1,448,000',
-    '1,450,000',
-    '1,450hp',
-    '1,450km/900mls',
-    '1,453',
-    '1,454',
     '1,456',
-    '1,459',
-    '1,460-metre',
-    '1,461',
-    '1,461st',
-    '1,464',
-    '1,466',
-    '1,466ft',
-    '1,468',
-    '1,471',
-    '1,472',
-    '1,473',
-    '1,475',
-    '1,475,000',
-    '1,476ft',
-    '1,477',
     '1,479',
-    '1,480,000',
-    '1,480p',
-    '1,481',
-    '1,483.58',
-    '1,486,000',
-    '1,487',
-    '1,487.07',
-    '1,488',
-    '1,489',
-    '1,490',
-    '1,491',
-    '1,495',
-    '1,496.69',
-    '1,497',
-    '1,5,1,3',
     '1,5,6,7',
-    '1,5-bisphosphate',
-    '1,500&shilling',
-    '1,500+',
-    '1,500,000-piece',
-    '1,500-bus',
-    '1,500-foot',
-    '1,500-kilometre',
-    '1,500-metre',
-    '1,500-mile',
-    '1,500-page',
-    '1,500-seat',
-    '1,500-watt',
-    '1,500-word',
-    '1,500-year-old',
-    '1,500db',
     '1,500km',
-    '1,500mhz',
-    '1,500ms',
-    '1,500pc',
-    '1,500sq',
-    '1,500w',
-    '1,501',
-    '1,510',
-    '1,514',
-    '1,514,025',
-    '1,515',
-    '1,517',
-    '1,518,764',
-    '1,522',
-    '1,525',
-    '1,525,410',
     '1,527',
-    '1,529',
-    '1,529,000',
-    '1,529,188',
-    '1,529.70',
-    '1,530,269',
-    '1,530-strong',
-    '1,531',
-    '1,534,122',
-    '1,535',
-    '1,537',
-    '1,541',
-    '1,543',
-    '1,5431,382',
-    '1,543m',
-    '1,544,000',
     '1,546',
-    '1,547,000',
-    '1,548-acre',
-    '1,548ft',
-    '1,549',
-    '1,550-tonne',
-    '1,551',
-    '1,552',
-    '1,554',
-    '1,556',
-    '1,558',
-    '1,565.2',
-    '1,566,000',
-    '1,569',
-    '1,570',
-    '1,573,000',
     '1,574',
-    '1,574,130',
-    '1,575,637',
-    '1,576',
-    '1,576,640',
-    '1,577',
-    '1,577.8',
-    '1,579,671',
-    '1,581',
-    '1,582',
-    '1,583',
-    '1,584',
-    '1,584,482',
-    '1,585',
-    '1,585,495',
-    '1,585hz',
     '1,588cc',
-    '1,589.34',
-    '1,591',
-    '1,592m',
-    '1,595',
-    '1,599',
-    '1,6,21',
-    '1,6,7',
-    '1,600&ndash;2,000',
-    '1,600&ndash;2,500',
-    '1,600,000&ndash;1,800,000',
-    '1,600-page',
-    '1,6000',
-    '1,600cc',
-    '1,600g/3&frac12;lb',
-    '1,600kms',
     '1,600lb',
-    '1,600w',
-    '1,602.4',
-    '1,603',
-    '1,605',
-    '1,607',
-    '1,607,000',
-    '1,608',
-    '1,609,788',
-    '1,611.6',
-    '1,611m',
-    '1,612.78',
-    '1,613',
-    '1,613.27',
-    '1,614',
-    '1,616.21',
     '1,617,129',
-    '1,617,556',
-    '1,618',
-    '1,619',
-    '1,621,000',
-    '1,624',
-    '1,626,220',
-    '1,628',
-    '1,630',
-    '1,631',
-    '1,631,631',
-    '1,632',
-    '1,633',
-    '1,636,630,000',
-    '1,637',
-    '1,638',
     '1,639',
-    '1,639,369',
-    '1,640&ft',
-    '1,640,000',
-    '1,641-base',
-    '1,643',
-    '1,644',
-    '1,645',
-    '1,650,000',
-    '1,652m',
-    '1,654,994',
-    '1,655',
-    '1,656.6',
-    '1,658.12',
-    '1,659',
-    '1,661',
     '1,662',
-    '1,665,960',
-    '1,666,993',
-    '1,672,000',
-    '1,673',
-    '1,673,000',
-    '1,675,805',
-    '1,680,000',
-    '1,682',
-    '1,687,200',
-    '1,688',
-    '1,690,000',
-    '1,692',
-    '1,692,000',
-    '1,694',
-    '1,694,930',
     '1,696ft',
-    '1,697',
-    '1,697cc',
-    '1,698,221',
-    '1,7&ndash;9,13&ndash;15',
-    '1,7,5,4',
-    '1,700,000&ndash;2,500,000',
-    '1,700,001',
-    '1,700ft.',
-    '1,700rpm',
-    '1,700t',
-    '1,704ft',
-    '1,705',
-    '1,707,000',
-    '1,714',
-    '1,715',
     '1,716,757',
-    '1,720.00',
-    '1,721',
-    '1,722,000',
-    '1,725,000',
-    '1,727',
-    '1,729',
-    '1,730.4',
-    '1,730hp',
-    '1,732',
-    '1,732,000',
-    '1,737,000',
-    '1,738.41',
-    '1,740',
-    '1,740-metre',
-    '1,741',
     '1,741.9',
-    '1,742',
-    '1,743.4',
-    '1,745',
-    '1,750ft',
-    '1,754',
-    '1,755.8',
-    '1,756',
-    '1,758',
-    '1,763',
-    '1,763,000',
-    '1,765%',
-    '1,769',
-    '1,769cc',
-    '1,770',
-    '1,770,000',
     '1,772.1',
-    '1,772.5',
-    '1,773',
-    '1,773.2',
-    '1,774.80',
-    '1,775.6',
-    '1,777',
-    '1,779',
-    '1,780',
-    '1,782.8',
-    '1,785',
-    '1,786',
-    '1,786,000',
-    '1,788',
-    '1,790',
-    '1,791',
     '1,792',
-    '1,793.1',
-    '1,793th',
-    '1,794',
-    '1,794kg',
-    '1,796',
-    '1,796.7',
-    '1,798',
-    '1,799,146',
-    '1,8',
-    '1,8-',
-    '1,8-naphthyridonecarboxylic',
-    '1,800%',
-    '1,800&ndash;1,900',
-    '1,800-2,000',
-    '1,800-acre',
     '1,800-capacity',
-    '1,8000',
-    '1,800g/4lb',
-    '1,800lbs',
-    '1,800rpm',
-    '1,806',
-    '1,806ft',
-    '1,808',
-    '1,810',
-    '1,810,000',
-    '1,814',
-    '1,815',
-    '1,815,670',
-    '1,816,421',
-    '1,817',
-    '1,817.7',
     '1,818',
-    '1,818.0',
-    '1,819',
-    '1,821',
-    '1,822.50',
-    '1,822.9',
-    '1,824,000',
-    '1,827,306',
-    '1,831',
-    '1,834',
-    '1,834.83',
-    '1,835',
-    '1,835,421',
-    '1,836',
-    '1,837,500',
-    '1,839',
     '1,840,000',
-    '1,842',
-    '1,842nd',
-    '1,845',
-    '1,847',
-    '1,847,000',
-    '1,847,310',
-    '1,848',
-    '1,85',
-    '1,853',
-    '1,857.8',
-    '1,859,119ff',
-    '1,860',
-    '1,860cc',
-    '1,860m',
-    '1,863',
     '1,865',
-    '1,866',
-    '1,866.2',
-    '1,872',
-    '1,874',
-    '1,875',
-    '1,876',
-    '1,876,957',
-    '1,876.24',
-    '1,876.9',
-    '1,877',
-    '1,882',
-    '1,884',
-    '1,885,000',
-    '1,886',
-    '1,886m',
     '1,890',
-    '1,890.2',
-    '1,892',
-    '1,895',
-    '1,8950/91',
-    '1,896',
-    '1,898',
-    '1,899',
-    '1,9',
-    '1,900,00-hectare',
-    '1,900-capacity',
-    '1,900-page',
-    '1,900-pupil',
-    '1,900-year-old',
-    '1,900ft',
-    '1,900lb/860kg',
     '1,902,706',
-    '1,907,000',
-    '1,908',
-    '1,916',
-    '1,917',
-    '1,918',
-    '1,918.41',
-    '1,919',
-    '1,919,000',
-    '1,919,338',
-    '1,920kbps',
-    '1,921',
-    '1,923,520',
-    '1,926',
-    '1,928',
-    '1,931',
     '1,931,025',
-    '1,941',
-    '1,942.73',
-    '1,945',
-    '1,948',
-    '1,948m',
-    '1,949',
-    '1,950%',
-    '1,951',
-    '1,956',
-    '1,958,660',
-    '1,961.74',
-    '1,963',
-    '1,963,528',
-    '1,963,909',
-    '1,964',
     '1,966',
-    '1,969',
-    '1,972,416',
-    '1,974b',
-    '1,975',
-    '1,977&ndash;2,461',
-    '1,978%',
-    '1,978.38',
-    '1,980&ndash;1,985',
-    '1,981',
-    '1,983',
-    '1,984kbps',
-    '1,984lb',
-    '1,985.8',
-    '1,987',
-    '1,987.30',
     '1,988',
-    '1,989',
-    '1,990',
-    '1,992',
-    '1,993',
-    '1,996',
-    '1,999',
-    '1-&frac12&thgr',
-    '1-&mgr;m',
-    '1-(2,4-difluorophenyl)-azaquinolone-carboxylic',
-    '1-(2,4-difluorophenyl)-quinolone-carboxylic',
-    '1-00pm',
-    '1-03-48',
-    '1-0a',
-    '1-1-1',
-    '1-10-15',
     '1-100',
-    '1-12',
-    '1-14',
-    '1-147',
-    '1-163/8',
-    '1-17galway',
-    '1-2-3-',
-    '1-200',
-    '1-21',
-    '1-2pm',
-    '1-2tbsp',
-    '1-3-03',
-    '1-3-93',
-    '1-4%',
-    '1-44-30',
-    '1-50',
     '1-500',
-    '1-65',
-    '1-69',
-    '1-78',
-    '1-850830282',
-    '1-878058-25-8',
-    '1-878058-37-1',
-    '1-878058-61-4',
-    '1-878058-63-0',
-    '1-9',
-    '1-98',
-    '1-990',
-    '1-a-m',
-    '1-adamantyl',
-    '1-all',
-    '1-alpha',
     '1-aminoquinolone',
-    '1-aryl',
-    '1-beta',
-    '1-chloro-2,4-dinitrobenzene',
-    '1-component',
-    '1-cycloalkyl',
-    '1-cyclopropyl-6-fluoro-1,4-dihydro-4-oxo-7-(1-piperazinyl)-3-quinoline-carboxylic',
-    '1-cyclopropyl-quinolone-carboxylic',
-    '1-day',
-    '1-deoxymannojirimycin',
-    '1-desoxynojirimycin',
-    '1-down',
-    '1-ethoxypentane',
-    '1-ethyl-3(3-dimethylaminopropyl)-carbodiimide',
-    '1-ff',
-    '1-foot',
     '1-gram',
-    '1-heteroaryl',
-    '1-hydroxyanthraquinone',
-    '1-hz',
-    '1-in-17',
-    '1-in-2',
-    '1-in-20',
-    '1-in-300',
-    '1-in-33',
-    '1-in-500',
-    '1-in-eight',
-    '1-jan-90',
-    '1-jan-92',
-    '1-kilometre',
-    '1-lb.',
-    '1-lb/&pound;8.50',
     '1-listed',
-    '1-may',
-    '1-methyl-1,4-dihydro-4-oxo-3-quinolinecarboxylic',
-    '1-methyl-4-phenyl-1,2,5,6-tetrahydropyridine',
-    '1-metre-wide',
-    '1-minute',
-    '1-mm',
-    '1-mm-long',
-    '1-naphthylamine-7-sulphonic',
-    '1-nil',
-    '1-o-alkyl-sn-glycero-3-phosphocholine',
-    '1-on-1',
-    '1-over-3s',
-    '1-page',
-    '1-prefix',
-    '1-s',
     '1-stage',
-    '1-stearoyl',
-    '1-style',
-    '1-t',
-    '1-top',
-    '1-unsubstituted',
-    '1-ups',
-    '1-year-old',
-    '1-year-only',
-    '1.0&ins',
-    '1.0&mgr;g',
-    '1.0&mgr;m',
-    '1.0&ndash;1.2%',
-    '1.0&ndash;1.3%',
-    '1.0&ndash;1.5%',
-    '1.0&ndash;10',
     '1.0&ndash;13.3',
-    '1.0&ndash;3.0',
-    '1.0&ndash;4.7',
-    '1.0&ndash;7.1',
-    '1.0-2.5',
-    '1.0-2.8',
-    '1.0-litre',
-    '1.0-to-solaris',
-    '1.0.3',
-    '1.00&ndash;2.55',
-    '1.00,0.61',
-    '1.00.38',
-    '1.000',
-    '1.00000',
-    '1.00002',
-    '1.0015',
     '1.005%',
-    '1.007',
-    '1.0075',
-    '1.0095',
-    '1.00:david',
-    '1.00:top',
-    '1.00=0.9166',
-    '1.00=292.6197',
-    '1.00=53,733',
-    '1.00=7',
-    '1.00=ad',
-    '1.00=epounds',
-    '1.00=ld',
-    '1.00=md',
-    '1.00=rs',
-    '1.00=taka',
     '1.00=usdollars',
-    '1.00a.m.',
-    '1.00mm',
-    '1.00ms',
-    '1.00ms.',
-    '1.00p',
-    '1.00pm&ndash;4.00pm',
-    '1.01%',
-    '1.01.3',
-    '1.014',
-    '1.0147',
-    '1.01p',
-    '1.02.24',
-    '1.02.35',
-    '1.021',
-    '1.021&ndash;23',
     '1.02oz',
-    '1.03.08',
-    '1.030%',
-    '1.0333,1',
-    '1.039',
-    '1.03p',
-    '1.03pm',
-    '1.04%',
-    '1.04ms',
-    '1.04pm',
-    '1.055',
-    '1.056',
-    '1.05am',
-    '1.05gb',
-    '1.05p',
-    '1.05sec',
     '1.06%',
-    '1.06.98',
-    '1.0625gbps',
-    '1.065',
-    '1.06567',
-    '1.068',
-    '1.07m',
-    '1.0897',
-    '1.08m',
-    '1.09565',
-    '1.09m',
-    '1.09pm',
-    '1.09sex',
-    '1.0a',
-    '1.0atm',
-    '1.0gb',
     '1.0kb',
-    '1.0l',
-    '1.0mg/l',
-    '1.0mm',
-    '1.0p.m.',
-    '1.0ppm',
-    '1.1&aring',
-    '1.1&deg;c',
-    '1.1&ins',
-    '1.1&ndash;94',
-    '1.1&times;10',
-    '1.1(a)',
-    '1.1-based',
-    '1.1.1.27',
-    '1.1.2.1',
-    '1.1.2.2',
     '1.1.6',
-    '1.1.7',
-    '1.1.79',
-    '1.1.88',
-    '1.1.89',
-    '1.1.9',
-    '1.1.91',
-    '1.1.93',
-    '1.10&ndash;2.05pm',
-    '1.10.13',
-    '1.10.2',
-    '1.10.29',
-    '1.10.90',
-    '1.100kg',
-    '1.1026',
-    '1.107',
     '1.10:useful',
-    '1.10a',
-    '1.10am',
-    '1.10h',
-    '1.10m',
-    '1.10pm',
-    '1.11&ndash;2.00',
-    '1.11.1(i)',
-    '1.11.2',
-    '1.11.4',
-    '1.11.5',
-    '1.11.8',
-    '1.11.9',
-    '1.11.91',
-    '1.11.93',
-    '1.11661',
     '1.11a',
-    '1.11b',
-    '1.11c',
-    '1.11d',
-    '1.12-fold',
-    '1.12.1',
-    '1.12.2',
-    '1.12/1.19',
-    '1.125ft',
-    '1.12p',
-    '1.13%',
-    '1.13.6',
-    '1.131e',
-    '1.137',
-    '1.13ft.',
-    '1.13kpa',
     '1.14.55',
-    '1.14.61',
-    '1.142',
-    '1.14p',
-    '1.15%',
-    '1.15&ndash;1.45',
-    '1.15&ndash;2.30',
-    '1.15.1',
-    '1.151',
-    '1.154',
-    '1.155',
-    '1.15:1',
-    '1.15:if',
-    '1.15:wonder',
-    '1.15lt',
-    '1.15m',
     '1.15min',
-    '1.15p',
-    '1.16(a)',
-    '1.16.3',
-    '1.16.38',
-    '1.16.4',
-    '1.163',
-    '1.16p',
-    '1.175',
-    '1.17m',
-    '1.18.27',
-    '1.1886',
-    '1.18p/kwh',
-    '1.192:1',
-    '1.194',
-    '1.1b',
     '1.1d',
-    '1.1d.',
-    '1.1k',
-    '1.1kb',
-    '1.1kg',
-    '1.1l',
-    '1.1ltr',
-    '1.1ms',
-    '1.1p',
-    '1.1p.p.b.v.',
-    '1.1sec',
-    '1.1secs',
-    '1.1x10',
-    '1.1z',
-    '1.2&deg;c',
-    '1.2&ndash;1.3%',
     '1.2&ndash;1.4',
-    '1.2&ndash;1.8m',
-    '1.2&ndash;3',
-    '1.2&ndash;3.1',
-    '1.2&ndash;3.7',
-    '1.2&ndash;6.6',
-    '1.2&ndash;8.4',
-    '1.2&times;the',
-    '1.2(b)',
-    '1.2(i)',
-    '1.2-',
-    '1.2-kb',
-    '1.2.1(i)',
-    '1.2.1.1.1',
-    '1.2.1.2',
-    '1.2.10',
     '1.2.20',
-    '1.2.54',
-    '1.2.54.',
-    '1.2.7',
-    '1.2.8',
-    '1.205',
-    '1.206',
-    '1.20:david',
-    '1.20:this',
-    '1.21%',
-    '1.21.010',
-    '1.21.14',
-    '1.214+0.036',
-    '1.22-1.49',
-    '1.22.65',
-    '1.222:1',
     '1.225',
-    '1.22pc',
-    '1.235',
-    '1.236',
-    '1.236+0.051',
-    '1.23e+8',
-    '1.23kg',
-    '1.24&ndash;2.85m',
-    '1.240',
-    '1.241',
-    '1.24am',
-    '1.24p',
-    '1.25&ndash;1.50',
-    '1.25-centimetre',
-    '1.25.41',
-    '1.25:wonder',
     '1.25am',
-    '1.25e11',
-    '1.25kg',
-    '1.25ml',
-    '1.25mm',
-    '1.25sq',
-    '1.26.90',
-    '1.27%',
-    '1.28%',
-    '1.28.52',
-    '1.280',
-    '1.29.32',
-    '1.291',
-    '1.29m',
-    '1.2:1.0',
-    '1.2b',
     '1.2cu',
-    '1.2ff',
-    '1.2gbps',
-    '1.2gflops',
-    '1.2gw',
-    '1.2iii',
-    '1.2in',
-    '1.2iv',
-    '1.2k',
-    '1.2km',
-    '1.2km.',
-    '1.2kw',
-    '1.2litre/2',
-    '1.2mb/sec',
-    '1.2mbps',
-    '1.2mhz',
     '1.2oz',
-    '1.2s',
-    '1.2x10',
-    '1.3%.',
-    '1.3&ndash;0.7',
-    '1.3&ndash;1.7',
-    '1.3&ndash;2.5',
-    '1.3(b)',
-    '1.3,1.4',
-    '1.3,6,9',
-    '1.3-',
-    '1.3-1.7',
-    '1.3-8.0',
-    '1.3-gflops',
-    '1.3-kb',
-    '1.3.1.1',
     '1.3.5(i)',
-    '1.30&ndash',
-    '1.30&ndash;2.15',
-    '1.30&ndash;3',
-    '1.30&ndash;3.30pm.',
-    '1.30&ndash;3pm',
-    '1.30-5pm',
-    '1.30.05',
-    '1.30/5.35pm',
-    '1.3032131',
-    '1.306',
-    '1.30:impressive',
-    '1.30:talented',
-    '1.30:these',
-    '1.30am.',
-    '1.30pm&ndash;5pm',
     '1.30pm-3.30pm',
-    '1.30pm-4.30pm',
-    '1.30pm/5.35pm',
-    '1.31%',
-    '1.32&ndash;2.08',
-    '1.32p.m',
-    '1.32pts',
-    '1.35&times;10',
-    '1.35-kilo',
-    '1.35:a',
-    '1.35gb',
-    '1.35kg',
-    '1.366',
-    '1.36kg',
-    '1.36p',
-    '1.37%',
     '1.37&ndash;1.86%',
-    '1.37&ndash;3.85',
-    '1.37.86',
-    '1.370',
-    '1.375m',
-    '1.38%',
-    '1.39.13',
-    '1.39.56',
-    '1.39p',
-    '1.3ff',
-    '1.3gl',
-    '1.3kb',
-    '1.3mb/sec',
-    '1.3mg',
-    '1.3mm',
-    '1.3x10',
     '1.4&ins',
-    '1.4&ndash;2.3',
-    '1.4&ndash;2.4',
-    '1.4&ndash;3.5',
-    '1.4,1.6',
-    '1.4-fold',
-    '1.4-kb',
-    '1.4-kg',
-    '1.4-litres',
-    '1.4.1869',
-    '1.4.24',
-    '1.4.3&mdash;but',
-    '1.4.6.1',
-    '1.4.6.2',
-    '1.4.6.3',
-    '1.4.6.4',
     '1.4.7',
-    '1.4.7(i)',
-    '1.4.92',
-    '1.4.94.',
-    '1.4.95',
-    '1.40pm.',
-    '1.41%',
-    '1.410/l',
-    '1.410:1',
-    '1.414',
-    '1.41p',
-    '1.42%/yr',
-    '1.431',
-    '1.432',
-    '1.43c',
-    '1.43m',
     '1.44&ins',
-    '1.4410',
-    '1.44m',
-    '1.44oz',
-    '1.44p',
-    '1.45.46',
-    '1.45/6pm',
-    '1.45:improving',
-    '1.45:kim',
-    '1.45:the',
-    '1.45p.m.',
-    '1.45pm/6.00pm',
-    '1.46&ndash;47',
-    '1.46m',
-    '1.47&mgr;m',
-    '1.4780',
     '1.47am',
-    '1.47m',
-    '1.4820',
-    '1.4843',
-    '1.4849',
-    '1.489',
-    '1.48m.',
-    '1.49.35',
-    '1.49.43',
-    '1.4970',
-    '1.4:1',
-    '1.4:1.0',
-    '1.4c',
-    '1.4e',
-    '1.4f',
-    '1.4g',
     '1.4g/t',
-    '1.4gb',
-    '1.4ghz',
-    '1.4h',
-    '1.4kb',
-    '1.4kw',
-    '1.4l',
-    '1.4lx',
-    '1.4n',
-    '1.4rt',
-    '1.4sec',
-    '1.4v',
-    '1.5%-2.6%',
-    '1.5&deg;c',
-    '1.5&mgr;g',
-    '1.5&micro;l',
     '1.5&ndash;1.8%',
-    '1.5&ndash;2%',
-    '1.5&ndash;2mg',
-    '1.5&ndash;35',
-    '1.5&ndash;4.5',
-    '1.5&ndash;4.5&deg;c',
-    '1.5&ndash;4p',
-    '1.5&ndash;5&mgr;m',
-    '1.5&ndash;7',
-    '1.5&times;10',
-    '1.5&times;3',
-    '1.5(b)',
-    '1.5-&gt;2',
-    '1.5-.5',
-    '1.5-2',
-    '1.5-2%',
     '1.5-2.0',
-    '1.5-2.5',
-    '1.5-fold',
-    '1.5-kb',
-    '1.5-ltr',
-    '1.5-ml',
-    '1.5.0',
-    '1.5.1.',
-    '1.5.11',
-    '1.5.12',
-    '1.5.16',
-    '1.5.2party',
-    '1.5.7',
-    '1.5.7party',
-    '1.5.9',
-    '1.5/1000/year',
     '1.50&ndash;4.20pm',
-    '1.50/2.00',
-    '1.50am',
-    '1.50p',
-    '1.50x10',
-    '1.50z',
-    '1.51%',
-    '1.5128',
-    '1.5150',
-    '1.5170',
-    '1.5174',
-    '1.5182',
-    '1.5198',
-    '1.52.65',
-    '1.52.76',
-    '1.52/1.83',
     '1.5230',
-    '1.525p',
-    '1.5280',
-    '1.52p',
-    '1.52x10',
-    '1.53%',
-    '1.53.6',
-    '1.539',
-    '1.54.02',
-    '1.5438',
-    '1.5456',
-    '1.5473',
-    '1.548',
-    '1.54oz',
-    '1.54pc',
-    '1.55.',
     '1.5560',
-    '1.5561',
-    '1.5578',
-    '1.55:impressive',
-    '1.55:nicky',
-    '1.55:this',
-    '1.55am',
-    '1.57&ndash;2.64',
-    '1.57.40',
-    '1.58-2.11',
-    '1.59p',
-    '1.5cm.',
-    '1.5cm/&frac12;in',
-    '1.5d',
-    '1.5degs',
-    '1.5e',
     '1.5f',
-    '1.5gbps',
-    '1.5hz/s',
-    '1.5i',
-    '1.5kg/3&frac12;lb',
-    '1.5kg/3&ndash;3&frac12;lb',
-    '1.5kg/3lb',
-    '1.5lbs',
-    '1.5mb/sec',
-    '1.5ml',
-    '1.5ms',
-    '1.5oz/sq.yd',
-    '1.5sq',
-    '1.5t',
-    '1.5t/acre',
-    '1.5td',
     '1.5x',
-    '1.5x28cm',
-    '1.6&ndash;1.8kg',
-    '1.6&ndash;2.8',
-    '1.6&ndash;3.9',
-    '1.6&ndash;4.3%',
-    '1.6&ndash;6.4kml/1&ndash;4mls',
-    '1.6-',
-    '1.6-kb',
-    '1.6-mm',
-    '1.6.1(ii)',
-    '1.6.74',
-    '1.6.8',
-    '1.6.88',
-    '1.600',
-    '1.60m',
     '1.61',
-    '1.610/l',
-    '1.615m',
-    '1.616ff',
-    '1.6180',
-    '1.61sec',
-    '1.65&ndash;1.85m',
-    '1.650p',
-    '1.65kg',
-    '1.65mm',
-    '1.65v',
-    '1.675m',
-    '1.67m',
-    '1.68&deg',
-    '1.680',
-    '1.692p',
     '1.69a',
-    '1.69m',
-    '1.6a',
-    '1.6c',
-    '1.6e',
-    '1.6g',
-    '1.6gb',
-    '1.6gflop',
-    '1.6gflops',
-    '1.6h-j',
-    '1.6hz',
-    '1.6kb',
-    '1.6km',
-    '1.6ls',
-    '1.6p.p.b.v.',
-    '1.6sa',
     '1.6secs',
-    '1.6treatment',
-    '1.6w',
-    '1.6xl',
-    '1.7&ndash;1.10',
-    '1.7&ndash;2.1',
-    '1.7-fold',
-    '1.7-kb',
-    '1.7-kilobase',
-    '1.7-mile',
-    '1.7-square',
-    '1.7.1.1',
-    '1.7.1.2',
-    '1.7.1.3',
-    '1.7.1.4',
-    '1.7.2(v)',
     '1.7.2.2',
-    '1.7.2.3',
-    '1.7.2.4',
-    '1.7.3.1',
-    '1.7.3.2',
-    '1.7.3.3',
-    '1.7.4',
-    '1.7.6',
-    '1.700',
-    '1.707',
-    '1.71%',
-    '1.717',
-    '1.71c',
-    '1.71pc',
-    '1.72.4',
-    '1.7215',
     '1.7263',
-    '1.727',
-    '1.72oz',
-    '1.72p',
-    '1.73&ndash;1',
-    '1.732',
-    '1.74%',
-    '1.75&ndash;2',
-    '1.75-metre',
-    '1.754',
-    '1.757',
-    '1.75g',
-    '1.75kg/3&frac12;lb',
-    '1.75kg/4lb',
-    '1.75lbs',
-    '1.75litre/3',
     '1.760',
-    '1.76p',
-    '1.77&ins',
-    '1.78m',
-    '1.794',
-    '1.79p',
-    '1.7:1',
-    '1.7billion',
-    '1.7ft',
-    '1.7kb',
-    '1.7mm',
-    '1.8&deg',
-    '1.8&ndash;1.13',
-    '1.8&ndash;2.5',
-    '1.8&percnt',
-    '1.8\'s',
     '1.8-cm-wide',
-    '1.8-kb',
-    '1.8-metre',
-    '1.8-metre-square',
-    '1.8.3',
-    '1.8.6',
-    '1.8/2.8',
-    '1.80&ndash;4.00',
-    '1.800.000',
-    '1.81',
-    '1.81p',
-    '1.82m',
-    '1.83%',
-    '1.83/2.44m',
-    '1.83m',
-    '1.83x10',
     '1.84m',
-    '1.85-mile',
-    '1.85.19&mdash;21',
-    '1.8523',
-    '1.85m',
-    '1.85p',
-    '1.85x10',
-    '1.86&ndash;4.62',
-    '1.86m',
-    '1.86pc',
-    '1.87&ins',
-    '1.875',
-    '1.879',
-    '1.88-acre',
-    '1.88-m',
-    '1.884',
     '1.88ghz',
-    '1.89oz',
-    '1.8a-g',
-    '1.8gw',
-    '1.8h',
-    '1.8j-k',
-    '1.8k',
-    '1.8kb',
-    '1.8kg',
-    '1.8khz',
-    '1.8kpc',
-    '1.8l',
-    '1.8m/6',
-    '1.8million',
-    '1.8sec',
-    '1.8secs',
     '1.8v',
-    '1.9%.',
-    '1.9&ndash;3.4',
-    '1.9&ndash;66.7%',
-    '1.9-',
-    '1.9.1',
-    '1.9.11',
-    '1.9.12',
-    '1.9.13',
-    '1.9.14',
-    '1.9.17',
-    '1.9.2',
-    '1.9.3(i)',
-    '1.9.4',
-    '1.9.4(i)',
-    '1.9.6',
     '1.9.7',
-    '1.9.87',
-    '1.9.9',
-    '1.9.9.',
-    '1.90.1',
-    '1.90.5cm',
-    '1.9279',
-    '1.92p',
-    '1.9466',
-    '1.95%',
-    '1.95-4',
-    '1.9517',
-    '1.96992',
-    '1.98%',
-    '1.980',
-    '1.983',
     '1.995x10',
-    '1.999&micro;f',
-    '1.99p',
-    '1.9a',
-    '1.9b,h,i,n,t',
-    '1.9c,o,u',
-    '1.9d',
-    '1.9d-f,1.10c',
-    '1.9g',
-    '1.9ghz',
-    '1.9i',
-    '1.9j-1',
-    '1.9kb',
-    '1.9kg/4lb',
-    '1.9km',
-    '1.9l',
     '1.9lbs',
-    '1.9ps',
-    '1.9v',
-    '1.9x10',
-    '1/&radic;2',
-    '1/0',
-    '1/02',
-    '1/06',
-    '1/1,000',
-    '1/10,000',
-    '1/10/84-31/12/87',
-    '1/10/88-31/9/92',
-    '1/100,000,000th',
-    '1/10000',
-    '1/100th',
-    '1/10d',
     '1/1187',
-    '1/11d',
-    '1/12,000',
-    '1/12/92',
-    '1/13',
-    '1/15',
-    '1/15&ndash;1/50',
-    '1/150',
-    '1/15a',
-    '1/15b',
-    '1/17',
-    '1/173',
-    '1/186',
-    '1/19',
-    '1/190',
-    '1/2%',
     '1/2&lsqb;a&rsqb;o',
-    '1/2-hour',
-    '1/2-inch',
-    '1/2-year-old',
-    '1/2/3/4',
-    '1/2/85',
-    '1/2/86',
-    '1/201',
-    '1/20th',
-    '1/21',
-    '1/22',
-    '1/250',
-    '1/269',
-    '1/273',
-    '1/2ins',
-    '1/2million',
     '1/2oz-sq',
-    '1/2pt',
-    '1/2st',
-    '1/2vrf',
-    '1/3/87',
-    '1/3/93',
-    '1/30,000',
-    '1/32in',
-    '1/338',
-    '1/35',
-    '1/3p',
-    '1/3rd',
-    '1/3rpm',
-    '1/3s',
-    '1/4&ins',
-    '1/4&ndash;1/2in',
     '1/4,000',
-    '1/4/93',
-    '1/471',
-    '1/475',
-    '1/490',
-    '1/4950',
-    '1/498',
-    '1/4m',
-    '1/4p',
-    '1/5,000',
-    '1/5/41',
-    '1/50,000th',
-    '1/500',
-    '1/5000',
-    '1/500th',
-    '1/501',
     '1/50th',
-    '1/540b',
-    '1/579,22/600,42/620',
-    '1/5th',
-    '1/6.',
-    '1/6/41',
-    '1/64th.',
-    '1/66',
-    '1/69',
-    '1/7',
-    '1/729',
-    '1/743',
-    '1/77',
-    '1/84',
-    '1/8hp',
-    '1/9/60',
     '1/9/87',
-    '1/953',
-    '1/96-stater',
-    '1/98',
-    '1/cash',
-    '1/draw',
-    '1/history',
-    '1/jg77',
-    '1/key',
-    '1/lay',
-    '1/m',
-    '1/my',
-    '1/njg',
-    '1/on',
-    '1/os',
-    '1/pantone',
     '1/scottish',
-    '1/sunday',
-    '1/the',
-    '1/trainee',
-    '1/value',
-    '10%&ndash;20%',
-    '10%-12%',
-    '10%.',
-    '10%/0.97=10.31%',
-    '10%o',
-    '10%plus',
-    '10&amp;sup13',
-    '10&amp;sup15-',
-    '10&amp;sup18',
-    '10&amp;sup4',
-    '10&amp;sup5',
     '10&amp;sup6',
-    '10&amp;sup60',
-    '10&aring;u.',
-    '10&cent',
-    '10&deg&ndash;15&deg;c',
-    '10&deg;-25&deg',
-    '10&deg;c/50&deg;f',
-    '10&deg;n',
-    '10&deg;wide',
-    '10&dollar',
-    '10&frac12%',
-    '10&frac12&amp;in',
-    '10&frac12;-mile',
-    '10&frac12;-month-old',
-    '10&frac12;d',
-    '10&frac12;ins',
     '10&frac14&times;14&frac12&ins',
-    '10&frac14;p',
-    '10&frac34&times;8&ins',
-    '10&frac34;sq',
-    '10&ft&times;12&ft',
-    '10&ft&times;20&ft',
-    '10&lt;p7m',
-    '10&mdash;12&frac12;p',
-    '10&mdash;15',
-    '10&mdash;15%',
-    '10&mdash;19',
-    '10&mdash;20p',
-    '10&mdash;bull',
-    '10&mgr;l',
-    '10&micro',
-    '10&micro;g/dl',
     '10&middot;5',
-    '10&ndash;0&ndash;0',
-    '10&ndash;01',
-    '10&ndash;04',
-    '10&ndash;07',
-    '10&ndash;08',
-    '10&ndash;1&ndash;33&ndash;1',
-    '10&ndash;10.5',
-    '10&ndash;10.5d.p.c.',
-    '10&ndash;100&mgr;a',
-    '10&ndash;1000',
-    '10&ndash;100g',
-    '10&ndash;100m',
-    '10&ndash;100ngml',
-    '10&ndash;11&ndash;12',
-    '10&ndash;11-year-olds',
     '10&ndash;11.30am',
-    '10&ndash;11/404&ndash;5',
-    '10&ndash;11hz',
-    '10&ndash;12&mgr;m',
-    '10&ndash;12&ndash;0',
-    '10&ndash;12in',
-    '10&ndash;12mm',
-    '10&ndash;13cm',
-    '10&ndash;13s',
-    '10&ndash;14&deg;c',
-    '10&ndash;14-year-olds',
-    '10&ndash;15&mgr;m',
-    '10&ndash;15&ndash;0',
-    '10&ndash;15-year-old',
-    '10&ndash;15/100000',
-    '10&ndash;15g',
     '10&ndash;15in',
-    '10&ndash;15min',
-    '10&ndash;15ppm',
-    '10&ndash;16&deg;c',
-    '10&ndash;2&ndash;0',
-    '10&ndash;2.8&aring',
-    '10&ndash;20&deg;c',
-    '10&ndash;20,000',
-    '10&ndash;20:1',
-    '10&ndash;20cm',
-    '10&ndash;20cms',
-    '10&ndash;20km',
-    '10&ndash;20m',
-    '10&ndash;20mm',
-    '10&ndash;20s',
-    '10&ndash;21%',
     '10&ndash;24',
-    '10&ndash;24%',
-    '10&ndash;28',
-    '10&ndash;2j',
-    '10&ndash;3&ndash;27&ndash;0',
-    '10&ndash;30am',
-    '10&ndash;32',
-    '10&ndash;36',
-    '10&ndash;39',
-    '10&ndash;4(a)',
-    '10&ndash;4(b)',
-    '10&ndash;40hz',
-    '10&ndash;47',
-    '10&ndash;5&ndash;0',
-    '10&ndash;5-',
-    '10&ndash;50mg',
     '10&ndash;50ng',
-    '10&ndash;55%',
-    '10&ndash;58',
-    '10&ndash;6&ndash;8',
-    '10&ndash;6(a)',
-    '10&ndash;6(c)',
-    '10&ndash;7&ndash;0',
-    '10&ndash;7(a)',
-    '10&ndash;70%',
-    '10&ndash;80',
-    '10&ndash;88',
-    '10&ndash;90',
-    '10&ndash;december',
-    '10&ndash;in.',
-    '10&ndash;jan',
-    '10&ohm',
     '10&prime;12&prime',
-    '10&rehy;month-old',
-    '10&rehy;nm',
-    '10&rehy;year',
-    '10&times',
-    '10&times;1',
-    '10&times;11&ins',
-    '10&times;16&ins',
-    '10&times;20m',
-    '10&times;25',
-    '10&times;25b',
-    '10&times;330',
-    '10&times;8&ins',
-    '10(10)',
-    '10(11)',
-    '10(50g)',
     '10(7)',
-    '10(co)',
-    '10(d)',
-    '10,000&micro;f',
-    '10,000&ndash;15,000',
-    '10,000&ndash;400,000',
-    '10,000&rehy;mile',
-    '10,000(o0.1)=',
-    '10,000+',
-    '10,000,000,000',
-    '10,000-1',
-    '10,000-11,000',
-    '10,000-12,000',
-    '10,000-acre',
-    '10,000-ft',
-    '10,000-gallon',
     '10,000-pound',
-    '10,000-run/1000-wicket',
-    '10,000-seater',
-    '10,000-sq-km',
-    '10,000-square',
-    '10,000g',
-    '10,000kg',
-    '10,000strong',
-    '10,000yrbp',
-    '10,001&ndash;17,000',
-    '10,004',
-    '10,010',
-    '10,025.07',
-    '10,030,000',
-    '10,042',
-    '10,044',
     '10,075',
-    '10,084,885',
-    '10,1&ndash;42',
-    '10,10.25',
-    '10,102',
-    '10,11,13',
-    '10,121',
-    '10,13',
-    '10,138kg',
-    '10,14',
-    '10,149,000',
-    '10,15,31,32',
-    '10,150,000',
-    '10,154,000',
-    '10,159',
-    '10,16',
     '10,162,000',
-    '10,178',
-    '10,20',
-    '10,204',
-    '10,209',
-    '10,221,700',
-    '10,222',
-    '10,25',
-    '10,250',
-    '10,281',
-    '10,287,938',
-    '10,299',
-    '10,300,000',
-    '10,300tyr',
-    '10,309',
-    '10,337',
     '10,375,000',
-    '10,380',
-    '10,394,000',
-    '10,4',
-    '10,403',
-    '10,412',
-    '10,419',
-    '10,445',
-    '10,446',
-    '10,467',
-    '10,470',
-    '10,473',
-    '10,487',
-    '10,490,000',
-    '10,495,000',
-    '10,500,000',
     '10,500-ton',
-    '10,5000',
-    '10,535',
-    '10,545',
-    '10,547',
-    '10,553',
-    '10,554',
-    '10,561',
-    '10,562',
-    '10,576',
-    '10,589',
-    '10,600,000',
-    '10,614',
-    '10,615',
-    '10,620',
-    '10,622,696',
     '10,625',
-    '10,635',
-    '10,639',
-    '10,650',
-    '10,669',
-    '10,678',
-    '10,689',
-    '10,691',
-    '10,71',
-    '10,729',
-    '10,739%',
-    '10,750',
-    '10,752',
-    '10,759',
-    '10,773',
-    '10,781',
     '10,800gn',
-    '10,818',
-    '10,833',
-    '10,850,000',
-    '10,860,000',
-    '10,882',
-    '10,900',
-    '10,913',
-    '10,920,000',
-    '10,948,468',
-    '10,948-foot',
-    '10,950',
-    '10-&ndash;15',
-    '10-10',
-    '10-10-02-13',
-    '10-10-10-10',
     '10-1000',
-    '10-12ft',
-    '10-13ft',
-    '10-13lb',
-    '10-15c',
-    '10-2-10-4',
-    '10-2-93',
-    '10-20%',
-    '10-20pc',
-    '10-23',
-    '10-26',
-    '10-27',
-    '10-27-90',
-    '10-32',
-    '10-4pm',
-    '10-5-1',
     '10-5-2',
-    '10-5-3',
-    '10-5-4',
-    '10-5-91',
-    '10-7-1',
-    '10-7-2',
-    '10-7-3',
-    '10-70cm',
-    '10-a-side',
-    '10-acre',
-    '10-band',
-    '10-barrel',
-    '10-bedroom',
-    '10-billionths',
-    '10-bracknell',
-    '10-child',
     '10-city',
-    '10-club',
-    '10-colour',
-    '10-d',
-    '10-dab',
-    '10-day-old',
-    '10-dose',
-    '10-employee',
-    '10-er',
-    '10-footers',
-    '10-for-one',
-    '10-giganeurone',
-    '10-goal',
-    '10-hectare',
-    '10-hiroshima',
-    '10-horse',
     '10-jan-1994',
-    '10-kb',
-    '10-key',
-    '10-km',
-    '10-kw',
-    '10-kyr',
-    '10-l(a)',
-    '10-lane',
-    '10-language',
-    '10-line',
-    '10-litre',
-    '10-mark',
-    '10-may-1990',
-    '10-megaton',
-    '10-mg',
-    '10-miles',
     '10-minute-rule',
-    '10-molecular',
-    '10-month&rehy;old',
-    '10-months',
-    '10-mton',
-    '10-music',
-    '10-mw',
-    '10-nation',
-    '10-oct.',
-    '10-only',
-    '10-out-of-10',
-    '10-pack',
-    '10-person',
-    '10-pixel',
-    '10-plus',
-    '10-rod',
     '10-room',
-    '10-roomed',
-    '10-s',
-    '10-screen',
-    '10-seat',
-    '10-set',
-    '10-sheffield',
-    '10-shilling',
-    '10-shot',
-    '10-site-licensed',
-    '10-station',
-    '10-string',
-    '10-stringed',
-    '10-stroke',
-    '10-team',
-    '10-times',
     '10-times-capped',
-    '10-to',
-    '10-to-11',
-    '10-top',
-    '10-try',
-    '10-way',
-    '10-wheel',
-    '10-worth',
-    '10-year-lag',
-    '10-yearly',
-    '10-years-old',
-    '10.0&micro;g/ml',
-    '10.00&ndash;11.30am',
-    '10.00&ndash;11.40',
-    '10.00&ndash;11.45',
-    '10.00&ndash;12.00',
     '10.00&ndash;14.00',
-    '10.00&ndash;16.00',
-    '10.00&ndash;17.20',
-    '10.00&ndash;17.45',
-    '10.00&ndash;18.30',
-    '10.00&ndash;18.45',
-    '10.00&ndash;19.30',
-    '10.00&ndash;6.00',
-    '10.00&ndash;8.00',
-    '10.00,10.25',
-    '10.00/8.23/8.54',
-    '10.000&ndash;20.000',
-    '10.0017.00',
-    '10.00am&ndash;1.00pm',
-    '10.00am&ndash;4.00p.m.',
-    '10.00am&ndash;8.00pm',
     '10.00am-2.00pm',
-    '10.00p.m.',
-    '10.01%',
-    '10.04am',
-    '10.05am',
-    '10.08%',
-    '10.08b',
-    '10.0d.p.c.',
-    '10.1&ndash;10.4',
-    '10.1&times;14.6',
-    '10.1.',
-    '10.1.2',
-    '10.1.3',
-    '10.1.4',
-    '10.1.5',
-    '10.1.6',
     '10.1.7',
-    '10.1.75',
-    '10.1/4',
-    '10.10(b)',
-    '10.10.94&ndash;16.12.94',
-    '10.103',
-    '10.110.56&mdash;72',
-    '10.116.258&mdash;9',
-    '10.11b',
-    '10.11secs',
-    '10.14(a)',
-    '10.14(b)',
-    '10.14(c)',
-    '10.14(d)',
-    '10.149',
-    '10.15am-4.30pm',
     '10.15m',
-    '10.16(a)',
-    '10.16(b)',
-    '10.16p',
-    '10.18.13',
-    '10.18.7',
-    '10.1a',
-    '10.1m',
-    '10.1p',
-    '10.1pc',
-    '10.2&ndash;54.2',
-    '10.2.1866',
-    '10.2.6',
-    '10.2.7',
-    '10.21.1',
-    '10.21p',
     '10.22&times;10/l',
-    '10.25am',
-    '10.25pc',
-    '10.26sec',
-    '10.27p',
-    '10.28am',
-    '10.2gb',
-    '10.2m',
-    '10.2mpg',
-    '10.3.5',
-    '10.3.6',
-    '10.3.7',
-    '10.3.93',
-    '10.30&ndash;11.30',
-    '10.30&ndash;16.30',
-    '10.30&ndash;17.00',
     '10.30&ndash;19.30',
-    '10.30&ndash;4.00',
-    '10.30&ndash;4pm',
-    '10.30&ndash;5.00',
-    '10.30&ndash;5.30',
-    '10.30-11.30am',
-    '10.30am&ndash;12.15pm',
-    '10.30am&ndash;2.30pm',
-    '10.30am&ndash;4pm',
-    '10.30p.m.',
-    '10.31am',
-    '10.32&ndash;34',
-    '10.32.7&ndash;52',
-    '10.34%',
-    '10.35pm',
-    '10.36am',
     '10.36pm',
-    '10.380',
-    '10.4(a)',
-    '10.4(c)',
-    '10.4-fold',
-    '10.4-in',
-    '10.4.1',
-    '10.4.1984',
-    '10.4.3',
-    '10.4.6',
-    '10.4.7',
-    '10.4015',
-    '10.40am',
-    '10.40pc',
-    '10.40pm.',
-    '10.45.',
     '10.4623',
-    '10.4bn',
-    '10.4cm',
-    '10.4gb',
-    '10.4m',
-    '10.4p',
-    '10.4pc',
-    '10.5&ndash;12p.p.m.',
-    '10.5&ndash;9.5',
-    '10.5&ndash;9.5myr',
-    '10.5&times;14.8cm',
-    '10.5(b)',
-    '10.5.',
-    '10.5.1',
-    '10.5.2',
-    '10.5.4',
     '10.5.91',
-    '10.50am',
-    '10.53&deg;c',
-    '10.597',
-    '10.5:1',
-    '10.5in',
-    '10.5oz',
-    '10.5v',
-    '10.6.1',
-    '10.6.2',
-    '10.6.3',
-    '10.61',
-    '10.62,63',
-    '10.6383',
-    '10.65%',
-    '10.65pc',
     '10.6p',
-    '10.6secs',
-    '10.7-million',
-    '10.7.10',
-    '10.7.2.3',
-    '10.7.5',
-    '10.7.7',
-    '10.7.7.2',
-    '10.7.8',
-    '10.7.9',
-    '10.73%',
-    '10.76',
-    '10.7c',
-    '10.7p',
-    '10.8&deg',
-    '10.8&ins',
     '10.8.1',
-    '10.8.11',
-    '10.8.12',
-    '10.8.13',
-    '10.8.2',
-    '10.8.3',
-    '10.8.4',
-    '10.80%',
-    '10.80p',
-    '10.82',
-    '10.83',
-    '10.85%',
-    '10.86m',
-    '10.870mm',
-    '10.89',
-    '10.89m',
     '10.8kb',
-    '10.8pc',
-    '10.9&ndash;12',
-    '10.9(a)',
-    '10.9.92',
-    '10.93',
-    '10.95%',
-    '10.9527',
-    '10.98',
-    '10.99%',
-    '10.99pc',
-    '10.9mpg',
-    '10.9oz',
-    '10.9pc',
-    '10/0',
-    '10/10th',
     '10/11th.',
-    '10/12/74',
-    '10/122',
-    '10/154',
-    '10/15cm',
-    '10/17',
-    '10/18',
-    '10/2/1990',
-    '10/2/41',
-    '10/3',
-    '10/3/41',
-    '10/36',
-    '10/378',
-    '10/5/41',
-    '10/53',
-    '10/6',
     '10/6/87',
-    '10/62',
-    '10/64',
-    '10/6d.',
-    '10/74/vmf',
-    '10/8/92',
-    '10/86',
-    '10/87',
-    '10/90',
-    '10/92',
-    '10/93',
-    '10/the',
-    '100%\'',
-    '100%-backed',
-    '100%-rated',
-    '100&amp;degree:c',
     '100&deg;c/200&deg;f',
-    '100&divide;90',
-    '100&mdash;2',
-    '100&mdash;4',
-    '100&mdash;5',
-    '100&mgr;g',
-    '100&mgr;l',
-    '100&micro;g',
-    '100&micro;g/mg',
-    '100&micro;mol/l/l',
-    '100&ndash;1,000',
-    '100&ndash;10',
-    '100&ndash;1000',
-    '100&ndash;103',
-    '100&ndash;105',
-    '100&ndash;108',
     '100&ndash;109',
-    '100&ndash;110',
-    '100&ndash;110%',
-    '100&ndash;110cm',
-    '100&ndash;110g',
-    '100&ndash;112cm',
-    '100&ndash;115',
-    '100&ndash;125',
-    '100&ndash;1250',
-    '100&ndash;15',
-    '100&ndash;150m',
-    '100&ndash;199',
-    '100&ndash;200,000',
-    '100&ndash;200a/9',
-    '100&ndash;200lbs',
-    '100&ndash;200ms',
     '100&ndash;227',
-    '100&ndash;240',
-    '100&ndash;27',
-    '100&ndash;3',
-    '100&ndash;30',
-    '100&ndash;300-fold',
-    '100&ndash;435',
-    '100&ndash;45',
-    '100&ndash;4721',
-    '100&ndash;500mm',
-    '100&ndash;600&deg;c',
-    '100&ndash;86',
-    '100&plus;6',
-    '100&rehy;per-cent',
-    '100&sol;60',
-    '100&times;25mm',
     '100&times;number',
-    '100(1.07)',
-    '100+mb',
-    '100,00',
-    '100,000&ndash;150,000',
-    '100,000&ndash;160,000',
-    '100,000&ndash;181,500',
-    '100,000&rehy;circulation',
-    '100,000-',
-    '100,000-120,000',
-    '100,000-154,000',
-    '100,000-170,000',
-    '100,000-250,000',
-    '100,000-dollar',
-    '100,000-word',
-    '100,000s',
     '100,020',
-    '100,165',
-    '100,297',
-    '100,6',
-    '100,800ff',
-    '100,944',
-    '100-120',
-    '100-17',
-    '100-170',
-    '100-250',
-    '100-300',
-    '100-4-ss',
-    '100-500',
-    '100-7',
-    '100-acre-plus',
-    '100-acres',
     '100-bedroom',
-    '100-bp',
-    '100-branch',
-    '100-ca.',
-    '100-cover',
-    '100-degree',
-    '100-dollar',
-    '100-drachma',
-    '100-feet',
-    '100-fields-per-second',
-    '100-g',
-    '100-gun',
-    '100-horsepower',
-    '100-hour',
-    '100-hr',
-    '100-km',
     '100-knot',
-    '100-metre-high',
-    '100-mhz',
-    '100-mips/10-watt',
-    '100-mm',
-    '100-mph',
-    '100-node',
-    '100-point',
-    '100-pounds',
-    '100-proof',
-    '100-room',
-    '100-run',
-    '100-s',
-    '100-shot',
-    '100-sq-km.',
-    '100-tonne',
     '100-trial',
-    '100-truck',
-    '100-volt',
-    '100-wicket',
-    '100.000.000.000.000.000.000.000.000.000.000.000.000,00',
-    '100.1%',
-    '100.21',
-    '100.24',
-    '100.25',
-    '100.4f',
-    '100.5',
-    '100.5%',
-    '100.53p',
-    '100.58',
-    '100.59',
-    '100.5p.',
     '100.69p',
-    '100.75%',
-    '100.85',
-    '100.9',
-    '100/102',
-    '100/109',
-    '100/110',
-    '100/394.5',
-    '100/719',
-    '1000&ndash;1050&deg;f',
-    '1000&ndash;1066',
-    '1000&ndash;1100',
-    '1000&ndash;1600',
-    '1000&ndash;2500',
-    '1000&ndash;3000',
-    '1000&ndash;35',
     '1000&ndash;4000',
-    '1000&ndash;999999',
-    '1000&plus',
-    '1000&times',
-    '1000-1',
-    '1000-2000',
-    '1000-acre',
-    '1000-capacity',
-    '1000-km',
-    '1000-light-year',
-    '1000-megawatt',
-    '1000-metre',
-    '1000-odd',
-    '1000-storey',
-    '1000-strong',
-    '1000-type',
     '1000-year',
-    '1000-year-old',
-    '1000.00',
-    '1000/1592',
-    '1000/200',
-    '1000/5',
-    '1000/500',
-    '10000&ndash;11000',
-    '10000&times',
-    '100011',
-    '10003/1',
-    '10005',
-    '100087',
-    '10009',
-    '1000:1',
-    '1000asa',
     '1000f',
-    '1000ha',
-    '1000hrs',
-    '1000hz',
-    '1000kcals',
-    '1000mhz',
-    '1000n.',
-    '1000ppm',
-    '1000ths',
-    '1000y',
-    '1001&ndash;8',
-    '10010&ndash;10052',
-    '10019',
-    '1001m',
-    '1001st',
-    '1002&mdash;24',
     '1002&ndash;1003',
-    '1002.4',
-    '10020',
-    '10022',
-    '100230',
-    '100288',
-    '1003&ndash;7180',
-    '1003.1x',
-    '1003.2a',
-    '1003.3',
-    '1003.4/d',
-    '1003.7.1-compatible',
-    '10030',
-    '100318',
-    '1004&ndash;1005',
-    '1004&ndash;30',
     '1004.1',
-    '1004.2',
-    '1004.4',
-    '100485',
-    '1004m',
-    '1005&mdash;34',
-    '100545',
-    '1006&mdash;42',
-    '1006.1',
-    '1006x11',
-    '1007&ndash;78',
-    '1007d&ndash;e',
-    '1008&mdash;9',
-    '10080',
-    '1008a',
-    '1009&ndash;11',
     '1009.1',
-    '1009.2',
-    '1009.3',
-    '100a(3)',
-    '100asa',
-    '100bp',
-    '100cxii',
-    '100db',
-    '100dpi',
-    '100e',
-    '100ft-wide',
-    '100g/3&frac12;oz',
-    '100g/4',
-    '100gev',
-    '100gm',
-    '100gn',
     '100grams',
-    '100grand',
-    '100in',
-    '100inches',
-    '100kcals',
-    '100kms',
-    '100kva',
-    '100l',
-    '100lt',
-    '100m-transistor',
-    '100m.',
-    '100mcg/kg',
-    '100metres',
-    '100mg',
-    '100mg/litre',
-    '100mm(wash)',
     '100mmhg',
-    '100mmna',
-    '100mmoll',
-    '100mms',
-    '100mv',
-    '100mw/channel',
-    '100nx',
-    '100per',
-    '100plus',
-    '100pp',
-    '100ppm',
-    '100rb',
-    '100revs',
-    '100room',
-    '100seat',
-    '100st',
     '100strong',
-    '100th-birthday',
-    '100ug/l',
-    '100v/div',
-    '100va',
-    '100watt',
-    '100x100&mgr;m',
-    '100x15km',
-    '100x2mm',
-    '100y',
-    '100year-old',
-    '100yet',
-    '101&deg',
-    '101&ndash;03',
-    '101&ndash;141',
-    '101&ndash;2245',
     '101&ndash;2750',
-    '101&ndash;3',
-    '101&ndash;34',
-    '101&ndash;5',
-    '101&ndash;8',
-    '101&plus;16',
-    '101&times;82&times;35mm',
-    '101(2)',
-    '101,201',
-    '101,400',
-    '101,475',
-    '101,526',
-    '101,557',
-    '101,800',
-    '101-9',
-    '101-ball',
     '101-foot',
-    '101.0',
-    '101.03',
-    '101.05',
-    '101.1%',
-    '101.3',
-    '101.4%',
-    '101.472mph',
-    '101.4m',
-    '101.5',
-    '101.55%',
-    '101.59%',
-    '101.64',
-    '101.6p',
-    '101.8',
-    '101.900mph',
     '101/2&ndash;71/2',
-    '101/4',
-    '101/722:75',
-    '1010/1',
-    '10100',
-    '101011010011000011000000',
-    '1010a',
-    '1010b',
-    '1010m',
-    '1011.30am',
-    '10115&ndash;0050',
-    '1012/1604',
-    '10120',
-    '1013&ndash;1014',
-    '1013&ndash;14',
-    '1013.2',
     '10130',
-    '101339',
-    '1013h',
-    '1014&mdash;15',
-    '1014&ndash;24',
-    '1014&ndash;42',
-    '1014.',
-    '1014a',
-    '1015.5',
-    '10157/91',
-    '101591',
-    '1015b',
-    '1015g',
-    '1016&mdash;51',
-    '1016/1608',
-    '10160',
     '10168',
-    '1016b',
-    '1017&mdash;22',
-    '1017&mdash;35',
-    '1017&ndash;18',
-    '10175',
-    '101754',
-    '101770',
-    '1018576',
-    '1019/1161',
-    '10190',
-    '10199',
-    '101:725:77',
-    '101ers',
-    '101ff',
-    '101lbf',
     '101p.',
-    '101pc',
-    '101year-old',
-    '102&deg',
-    '102&deg;f',
-    '102&ndash;08',
-    '102&ndash;114',
-    '102&ndash;16',
-    '102&ndash;2',
-    '102&ndash;38',
-    '102&ndash;4',
-    '102&ndash;6',
-    '102&ndash;8',
-    '102&ndash;90',
-    '102(2)',
-    '102,000-capacity',
     '102,200',
-    '102,350',
-    '102,600',
-    '102,800',
-    '102,820',
-    '102,875',
-    '102,890',
-    '102-96-112cm',
-    '102-nation',
-    '102-strong',
-    '102.095',
-    '102.1%',
-    '102.4ms',
-    '102.4p',
-    '102.5',
-    '102.5%',
     '102.5&deg',
-    '102.53',
-    '102.6',
-    '102.7',
-    '102.9%',
-    '102/1416',
-    '1020&mdash;4',
-    '1020&ndash;1077',
-    '1020&ndash;1101',
-    '10200',
-    '1020kg',
-    '1020x1022',
-    '1021m',
-    '1022h',
-    '1023a',
-    '1024&mdash;39',
     '1024&ndash;39',
-    '1024-fold',
-    '1024/1229',
-    '1024g',
-    '1024ste',
-    '1024x',
-    '1025b',
-    '1026&mdash;7',
-    '1026.',
-    '10260',
-    '1027&mdash;35',
-    '1027&ndash;34',
-    '102810',
-    '102884',
-    '102886',
-    '1029e&ndash;f',
     '102b',
-    '102cm',
-    '102ins',
-    '102mm/4in',
-    '102mph',
-    '102p/kg',
-    '103&mdash;13',
-    '103&mdash;7',
-    '103&ndash;10',
-    '103&ndash;104',
-    '103&ndash;105',
-    '103&ndash;107',
-    '103&ndash;12',
-    '103&ndash;4',
-    '103&ndash;8',
-    '103&ndash;80',
     '103&ndash;9',
-    '103&plus;5',
-    '103(3)',
-    '103(36%)',
-    '103(5)',
-    '103,000,000',
-    '103,076',
-    '103,078',
-    '103,244',
-    '103,300',
-    '103,415',
-    '103,500',
-    '103,57',
-    '103,600',
-    '103,823',
-    '103,894',
     '103-57',
-    '103-97',
-    '103-branch',
-    '103-key',
-    '103-member',
-    '103-nation',
-    '103.01',
-    '103.15&ndash;16',
-    '103.2',
-    '103.2%',
-    '103.23%',
-    '103.27',
-    '103.2p',
-    '103.3',
-    '103.3%',
-    '103.3p',
     '103.52',
-    '103.56%',
-    '103.59%',
-    '103.5fm',
-    '103.6s.8d.',
-    '103.8%',
-    '103.80',
-    '103.9',
-    '103/14',
-    '103/2',
-    '103/299',
-    '103/600',
-    '103/736',
-    '1030&ndash;1036',
-    '1030&ndash;1036&deg',
-    '1030a',
     '1031/1622',
-    '103105',
-    '1031e',
-    '1032&ndash;33',
-    '1032m',
-    '1033&deg;og',
-    '1033&ndash;1107',
-    '1033&ndash;1109',
-    '1033/1623&ndash;4',
-    '1034&ndash;1039',
-    '1034&ndash;1039&deg',
-    '103410',
-    '1034m',
-    '1035&mdash;40',
-    '1035.29',
-    '10350',
     '1036%degree',
-    '1036&deg',
-    '1036&ndash;1037',
-    '1036a&ndash;b',
-    '1036c&ndash;e',
-    '1037&ndash;1039',
-    '10370',
-    '1037d&ndash;e',
-    '10380',
-    '10388',
-    '1039&ndash;1169',
-    '10390',
-    '1039b',
-    '103a',
-    '103f&ndash;105f',
-    '103ff',
     '103gb',
-    '103m',
-    '103mb',
-    '103mm',
-    '103pm',
-    '103pp',
-    '103s',
-    '104&ndash;10',
-    '104&ndash;105',
-    '104&ndash;11',
-    '104&ndash;23',
-    '104&ndash;382',
-    '104&ndash;83',
-    '104,300',
-    '104,375',
-    '104,977',
     '104-amino-acid',
-    '104-member',
-    '104-mile',
-    '104-seat',
-    '104-year',
-    '104-year-old',
-    '104.16',
-    '104.24%',
-    '104.37%',
-    '104.375',
-    '104.4%',
-    '104.5',
-    '104.5p',
-    '104.77',
-    '104.8',
-    '104.8%',
     '104.84',
-    '104.84%',
-    '104.87',
-    '104.8in',
-    '104/42/',
-    '104/745',
-    '104/86',
-    '1040&mdash;2',
-    '1040&ndash;1041',
-    '1040&ndash;1048',
-    '1040&ndash;1048&deg',
-    '1040-stfm',
-    '104000',
-    '10400778',
-    '10405-06',
-    '1040e&ndash;f',
     '1041&deg',
-    '1041m',
-    '1042&deg',
-    '1042&mdash;66',
-    '1042&ndash;1216',
-    '10420',
-    '104230',
-    '104325',
-    '1043a',
-    '1043cc',
-    '1043g',
-    '1045&deg',
-    '104536',
-    '104580',
-    '1046&ndash;1069',
-    '104686',
     '10470',
-    '10477',
-    '10478.7',
-    '1048&deg',
-    '104857',
-    '1049&ndash;50/1640',
-    '10490',
-    '104980',
-    '104a',
-    '104c',
-    '104cm',
-    '104f.',
-    '104ff',
-    '104ft',
-    '104k',
-    '104m/s',
     '104mph',
-    '104pp',
-    '104pp.',
-    '104year-old',
-    '105&aring',
-    '105&deg',
-    '105&deg;f',
-    '105&frac12',
-    '105&frac12;p',
-    '105&mdash;33',
-    '105&ndash;113',
-    '105&ndash;2',
-    '105&ndash;31',
-    '105&ndash;77',
-    '105&ndash;9',
-    '105(1)',
     '105,336',
-    '105,643,364',
-    '105-104',
-    '105-83',
-    '105-cover',
-    '105-hour',
-    '105-seat',
-    '105-year-old',
-    '105.0',
-    '105.21',
-    '105.3',
-    '105.45',
-    '105.5',
-    '105.5%',
-    '105.55%',
-    '105.6',
     '105.63',
-    '105.7%',
-    '105.79%',
-    '105.86mph',
-    '105.89mph',
-    '105.9%',
-    '105/151/39',
-    '105/152/20',
-    '105/166',
-    '105/3',
-    '105/746:98',
-    '105/84',
-    '1050&deg',
-    '1050&deg;og',
-    '1050&ndash;1132',
-    '1050&ndash;1250',
     '1050&ndash;52&deg',
-    '1050mm',
-    '1051&mdash;2',
-    '1051s',
-    '105375',
-    '10540',
-    '1055/106',
-    '10550',
-    '1056/1229',
-    '1056a&ndash;c',
-    '1056h',
-    '1057p',
-    '105850',
-    '1059&ndash;1063',
-    '10590',
-    '10591',
     '10598',
-    '105a',
-    '105ft',
-    '105gb',
-    '105ghz',
-    '105k',
-    '105ml',
-    '105mton',
-    '105pc',
-    '105s',
-    '106&deg',
-    '106&ndash;12',
-    '106&ndash;143',
-    '106&ndash;143c-myc-er',
-    '106&ndash;4',
-    '106&ndash;43',
     '106&ndash;9',
-    '106(4)',
-    '106,244',
-    '106,300',
-    '106,320',
-    '106,500,000',
-    '106,902',
-    '106-113',
-    '106-91',
-    '106-ball',
-    '106-strong',
-    '106-year-old',
-    '106.0',
-    '106.2',
-    '106.33',
-    '106.3in',
     '106.3p',
-    '106.4',
-    '106.5',
-    '106.53&mdash;4',
-    '106.627mph',
-    '106.75',
-    '106.7p',
-    '106.8',
-    '106.9',
-    '106.9%',
-    '106.93p',
-    '106.96p',
-    '106.9p',
-    '106/753&ndash;54',
-    '106/89',
-    '106025',
     '1061&mdash;1073',
-    '1061&ndash;5',
-    '10610',
-    '1061a&ndash;b',
-    '1061e&ndash;f',
-    '10620',
-    '106270',
-    '10637',
-    '10639/g&ndash;ustv',
-    '1063a',
-    '1063f&ndash;g',
-    '10640',
-    '106446',
-    '10646',
-    '10647-mso',
-    '106470',
     '1064a',
-    '1064p',
-    '10650',
-    '1066&ndash;1235',
-    '1066&ndash;1307',
-    '1066&ndash;1348',
-    '1066&ndash;77',
-    '1066-1272',
-    '10660',
-    '10665',
-    '10667',
-    '10670',
-    '10674-11525',
-    '1067a',
-    '1067mm',
-    '10680',
     '1069&ndash;70',
-    '1069m',
-    '1069p',
-    '106a',
-    '106bhp',
-    '106ft',
-    '106h',
-    '106pp.',
-    '107&mdash;10',
-    '107&mdash;9',
-    '107&ndash',
-    '107&ndash;108',
-    '107&ndash;108/303&ndash;4',
-    '107&ndash;109',
-    '107&ndash;111',
-    '107&ndash;114',
     '107&ndash;117/102&ndash;107cm',
-    '107&ndash;131',
-    '107&ndash;3',
-    '107&ndash;44',
-    '107\'',
-    '107(1)',
-    '107(2)',
-    '107(4)',
-    '107,000-xstone',
-    '107,088',
-    '107,187',
-    '107,720',
-    '107-8',
-    '107-mile',
-    '107-page',
-    '107-year',
     '107.0',
-    '107.2%',
-    '107.25',
-    '107.2m',
-    '107.3p',
-    '107.54p',
-    '107.5p',
-    '107.5p/kg',
-    '107.7%',
-    '107.75',
-    '107.83&mdash;5',
-    '107.9',
-    '107/2',
-    '107/303',
-    '107/685,120/69',
-    '107/757&ndash;58',
     '107/759',
-    '1070&deg',
-    '1070&ndash;712',
-    '1070&ndash;72',
-    '107060',
-    '1070mm',
-    '1071&mdash;9',
-    '1071&ndash;1127',
-    '1071&ndash;1152',
-    '1072&ndash;1073',
-    '1072-',
-    '10720',
-    '1072bp',
-    '1073&mdash;85',
-    '10730',
-    '107344',
     '1073f',
-    '1074&ndash;7',
-    '1074x1075',
-    '1075&ndash;1109',
-    '10750',
-    '1076g&ndash;h',
-    '1076m',
-    '1076p',
-    '1077&ndash;1108',
-    '10770',
-    '10780',
-    '107899',
-    '1078h',
-    '1079pp',
-    '107:29&ndash;30',
-    '107b',
     '107cm',
-    '107g&ndash;h',
-    '107k',
-    '107mm',
-    '107mph',
-    '107nm',
-    '107pp',
-    '107sup6',
-    '107x137',
-    '108&deg;c',
-    '108&ndash;1',
-    '108&ndash;11',
-    '108&ndash;112',
-    '108&ndash;46',
-    '108&plus;1',
-    '108,000,000',
     '108,000-a-year',
-    '108,100',
-    '108,310',
-    '108,330',
-    '108,333',
-    '108,500',
-    '108,900',
-    '108,982',
-    '108-bolt',
-    '108-tonne',
-    '108-year-old',
-    '108.',
-    '108.1p',
-    '108.42',
-    '108.4p',
-    '108.5',
     '108.5%',
-    '108.52',
-    '108.8',
-    '108.94',
-    '108/209',
-    '108/70',
-    '108/77',
-    '1080&ndash;1116',
-    '1080&ndash;1152',
-    '1080/',
-    '10806-07',
-    '1080c&ndash;f',
-    '1081&ndash;1137',
-    '1081&ndash;1151',
-    '10810',
-    '1081c&ndash;d',
     '1081p',
-    '10820',
-    '10828',
-    '1083/1672',
-    '10830',
-    '1083m',
-    '1084&mdash;5',
-    '1084&ndash;1155',
-    '1084/1673&ndash;4',
-    '1086&ndash;1113',
-    '1086-1066',
-    '108654',
-    '108784',
-    '1088&mdash;1099',
-    '1088&ndash;91',
-    '10880',
     '10890',
-    '108cm(42.5in)in',
-    '108km',
-    '108m',
-    '108mm',
-    '108mph',
-    '109&deg',
-    '109&formula;km/h',
-    '109&ins',
-    '109&mdash;14',
-    '109&ndash;10',
-    '109&ndash;110',
-    '109&ndash;112',
-    '109&ndash;12',
-    '109&ndash;14',
-    '109&ndash;16',
     '109&ndash;42',
-    '109&ndash;7',
-    '109\'s',
-    '109(1)',
-    '109(5)',
-    '109(a)',
-    '109,090',
-    '109,100,000',
-    '109,124',
-    '109,370',
-    '109,414',
-    '109,585',
-    '109,600',
-    '109,631',
-    '109,696',
-    '109,705',
     '109,812',
-    '109,998',
-    '109-122',
-    '109-a',
-    '109-run',
-    '109-set',
-    '109-sets',
-    '109.05',
-    '109.09',
-    '109.2',
-    '109.4',
-    '109.52p',
-    '109.58p',
-    '109.5p',
-    '109.69',
-    '109.82',
     '109.86p',
-    '109.9%',
-    '109/',
-    '109/111',
-    '109/503',
-    '109/774',
-    '1091&ndash;1092',
-    '1091&ndash;1119',
-    '1091&ndash;2',
-    '1091&ndash;35',
-    '1091/4',
-    '1092mm',
-    '1093&ndash;1109',
-    '1093&ndash;4',
-    '1093&ndash;7',
-    '10930',
     '109300',
-    '1094&ndash;7',
-    '1095&deg',
-    '1095&ndash;1116',
-    '1095&ndash;1154',
-    '1095&ndash;1588',
-    '1095/1684',
-    '10950',
-    '10954&ndash;5',
-    '10958',
-    '10960',
-    '10972',
-    '10990',
-    '10997',
-    '1099m',
-    '109b',
     '109e',
-    '109f',
-    '109f-1',
-    '109ff.',
-    '109j(i)',
-    '109w',
-    '109x138cm',
-    '109year',
-    '10:00.7',
-    '10:00:41',
-    '10:00:59',
-    '10:01:18',
-    '10:01:46',
-    '10:02:02',
-    '10:02:18',
-    '10:02:57',
     '10:03:17',
-    '10:04:04',
-    '10:04:07&ndash;0400',
-    '10:04:16',
-    '10:04:34',
-    '10:04:43',
-    '10:05.49',
-    '10:05:33',
-    '10:06.66',
-    '10:06:21',
-    '10:07:31',
-    '10:07:47',
-    '10:08:21',
-    '10:08:39',
-    '10:08:59',
-    '10:09&ndash;10:12ut',
     '10:09:15',
-    '10:09:42',
-    '10:09:51',
-    '10:1&ndash;10',
-    '10:1&ndash;18',
-    '10:1&ndash;2',
-    '10:1&ndash;20',
-    '10:1,6',
-    '10:10:28',
-    '10:10:54',
-    '10:11',
-    '10:11&ndash;12:16',
-    '10:11&ndash;36',
-    '10:11:00',
-    '10:11:15ut',
-    '10:11:30ut',
     '10:11ut',
-    '10:12',
-    '10:12:14',
-    '10:12ut',
-    '10:13:13',
-    '10:13:27',
-    '10:14',
-    '10:14:00',
-    '10:14:15',
-    '10:14:38',
-    '10:14:46',
-    '10:14ut',
-    '10:15.28',
-    '10:15:11',
-    '10:15:13',
-    '10:16:10',
     '10:16:34',
-    '10:16:49',
-    '10:17:00',
-    '10:17:06',
-    '10:17:14',
-    '10:17:20',
-    '10:17:38',
-    '10:18:47',
-    '10:19',
-    '10:19&ndash;24',
-    '10:19:08',
-    '10:1:0.5',
-    '10:1ff',
-    '10:20:27',
-    '10:21&ndash;29',
-    '10:21:01',
     '10:21:49',
-    '10:22&ndash;21:35',
-    '10:22&ndash;29',
-    '10:22:09',
-    '10:23',
-    '10:23:09',
-    '10:23:49',
-    '10:23:51',
-    '10:24.21.',
-    '10:24:01',
-    '10:24:20',
-    '10:24:55',
-    '10:25&ndash;28',
-    '10:25:23',
-    '10:26:32',
-    '10:26:57',
     '10:27:13&ndash;0800',
-    '10:27:21',
-    '10:27:36',
-    '10:27:54',
-    '10:27:55',
-    '10:28',
-    '10:28:36',
-    '10:28:51',
-    '10:28:59',
-    '10:29&ndash;37',
-    '10:29.3',
-    '10:29:02',
-    '10:29:25',
-    '10:30&ndash;35',
-    '10:30:16',
-    '10:30am',
     '10:30pm',
-    '10:31',
-    '10:31:16',
-    '10:32:10&ndash;0500',
-    '10:32:22',
-    '10:33',
-    '10:33:22',
-    '10:33:34',
-    '10:34&ndash;5',
-    '10:34:24',
-    '10:34:28',
-    '10:35',
-    '10:35.2',
-    '10:35:32',
-    '10:36',
-    '10:36:05',
     '10:36:39',
-    '10:37:07',
-    '10:37:28',
-    '10:37:54',
-    '10:38&mdash;42',
-    '10:38&ndash;42',
-    '10:38:26',
-    '10:38:53',
-    '10:39:15',
-    '10:39:46',
-    '10:4&ndash;5',
-    '10:40:13',
-    '10:40:47',
-    '10:41',
-    '10:41:37',
-    '10:42:33',
     '10:42:34',
-    '10:42:36',
-    '10:43',
-    '10:43:20',
-    '10:44:34',
-    '10:44:46',
-    '10:44f',
-    '10:45:38',
-    '10:45:54',
-    '10:45pm',
-    '10:46:06',
-    '10:46:20',
-    '10:46:27',
-    '10:46:30',
-    '10:46:49',
-    '10:47:42&ndash;0500',
     '10:48:16',
-    '10:48:30',
-    '10:49:04',
-    '10:49:27',
-    '10:5',
-    '10:5&ndash;7',
-    '10:50',
-    '10:50:00',
-    '10:50:09',
-    '10:50:35',
-    '10:50:41',
-    '10:51:08',
-    '10:51:21',
-    '10:51:28',
-    '10:51:59',
-    '10:52:36',
     '10:53',
-    '10:54:29',
-    '10:54:33',
-    '10:54:35',
-    '10:55:13',
-    '10:55:16',
-    '10:55:36',
-    '10:56:09',
-    '10:56:10',
-    '10:56:12',
-    '10:56:37',
-    '10:57:13',
-    '10:57:59',
-    '10:57am',
-    '10:58:33',
-    '10:58am',
     '10:59:06&ndash;0800',
-    '10:59:19',
-    '10:59:26',
-    '10:59:28',
-    '10:59:40',
-    '10:59:58',
-    '10:7&ndash;11',
-    '10:7&ndash;13',
-    '10:8',
-    '10:90',
-    '10_',
-    '10_per',
-    '10a.m',
-    '10a=',
-    '10am&ndash;3pm',
-    '10am&ndash;6.30pm',
     '10am&ndash;7pm',
-    '10am-12',
-    '10am-2.30pm',
-    '10am-2pm',
-    '10am-4.05',
-    '10am-5.30pm',
-    '10am-5.50pm',
-    '10am-8pm',
-    '10am-9pm',
-    '10am.',
-    '10am4.30pm',
-    '10am4pm',
-    '10am8pm',
-    '10base-5',
-    '10base-t/10base2',
-    '10base2&ndash;10base5&ndash;10baset',
     '10base3',
-    '10baset-thinnet-thicknet',
-    '10bbase-2',
-    '10billion',
-    '10bn',
-    '10cm.',
-    '10cm/4inches',
-    '10cmkyr',
-    '10d8y',
-    '10evcm',
-    '10f',
-    '10ff.',
-    '10ft-long',
-    '10g/t',
-    '10gbps',
-    '10gflop',
     '10gms',
-    '10gw',
-    '10h8',
-    '10hrs',
-    '10ins+',
-    '10k&ndash;450k',
-    '10k&ohm',
-    '10kg/s/ha',
-    '10km.',
-    '10km/h',
-    '10km/h.',
-    '10kw',
-    '10length',
-    '10m&ohm',
-    '10m-12m',
-    '10m-bytes',
     '10m/33ft',
-    '10ma',
-    '10mb/sec',
-    '10mbits',
-    '10mbyte-per-second',
-    '10mcg/kg/hour',
-    '10million',
-    '10minute',
-    '10mjy',
-    '10mmna',
-    '10mtdna',
-    '10mton',
-    '10ng',
-    '10no',
-    '10ns',
-    '10oc',
     '10p-containing',
-    '10p-only',
-    '10p.p.m',
-    '10p.p.t.v',
-    '10p/mile',
-    '10p11.2.',
-    '10perm2',
-    '10pg',
-    '10pm-to-6am',
-    '10point',
-    '10s.6d',
-    '10sec',
-    '10sq',
-    '10stone',
-    '10th&ndash;15th',
-    '10th&ndash;17th',
     '10th-',
-    '10th-16th',
-    '10to',
-    '10to9',
-    '10w',
-    '10w/40',
-    '10x10',
-    '10x10&mgr;m',
-    '10x12&middot;5cm',
-    '10x15m',
-    '10x16&middot',
-    '10x35cm/4x14inches',
-    '10x40',
-    '10y',
-    '10yd',
-    '10yds',
     '10year-old',
-    '11%&ndash;83%',
-    '11&amp;12',
-    '11&frac12&ndash;4&frac12',
-    '11&frac12;-hour',
-    '11&frac12;d.',
-    '11&frac12;ins.',
-    '11&frac12;mph',
-    '11&frac14%',
-    '11&frac14;d',
-    '11&frac18',
-    '11&frac34',
-    '11&frac34&ins',
-    '11&frac34;d',
-    '11&frac34;in',
-    '11&frac34;p.c.',
     '11&mdash;07.',
-    '11&mdash;16',
-    '11&mdash;19',
-    '11&mdash;20',
-    '11&ndash',
-    '11&ndash;0&ndash;55&ndash;5',
-    '11&ndash;0764',
-    '11&ndash;1/2',
-    '11&ndash;1/2ft',
-    '11&ndash;10&ndash;0',
-    '11&ndash;12,000',
-    '11&ndash;12-year-old',
-    '11&ndash;12/4/41',
-    '11&ndash;12:36',
-    '11&ndash;12km',
-    '11&ndash;12m',
     '11&ndash;13&ndash;0',
-    '11&ndash;13-year-olds',
-    '11&ndash;13th',
-    '11&ndash;14%',
-    '11&ndash;146',
-    '11&ndash;15%',
-    '11&ndash;15-year-old',
-    '11&ndash;150',
-    '11&ndash;15s',
-    '11&ndash;16-year-olds',
-    '11&ndash;189',
-    '11&ndash;2&ndash;1903',
-    '11&ndash;20cm',
-    '11&ndash;221',
-    '11&ndash;23',
-    '11&ndash;231',
     '11&ndash;27',
-    '11&ndash;28s',
-    '11&ndash;30am',
-    '11&ndash;31',
-    '11&ndash;35',
-    '11&ndash;4&ndash;1908',
-    '11&ndash;4&ndash;8',
-    '11&ndash;40',
-    '11&ndash;4pm',
-    '11&ndash;50',
-    '11&ndash;55',
-    '11&ndash;7&ndash;0',
-    '11&ndash;9&ndash;0',
-    '11&ndash;9.5',
-    '11&ndash;july',
-    '11&ndash;sat',
     '11&ndash;wednesday',
-    '11&ndash;year-olds',
-    '11&prime;30&prime',
-    '11&shilling',
-    '11&shilling;8d.',
-    '11(-)',
-    '11(1)&mdash',
-    '11(3)&mdash',
-    '11(6)',
-    '11(9)',
-    '11(d)',
-    '11**',
-    '11,000&ndash;1',
-    '11,000&ndash;14,600',
-    '11,000-mile',
-    '11,000-plus',
     '11,000-strong',
-    '11,0001.',
-    '11,000ft',
-    '11,000t',
-    '11,032',
-    '11,060',
-    '11,072',
-    '11,073',
-    '11,080',
-    '11,090',
-    '11,098',
-    '11,110',
-    '11,113kg',
-    '11,174,000',
-    '11,179',
-    '11,18',
     '11,1985',
-    '11,204',
-    '11,207,000',
-    '11,21',
-    '11,213',
-    '11,213,000',
-    '11,218',
-    '11,220,735',
-    '11,234ft',
-    '11,247,000',
-    '11,259,000',
-    '11,265',
-    '11,275',
-    '11,280',
-    '11,29&ndash;32',
-    '11,329',
     '11,334',
-    '11,356,803',
-    '11,358',
-    '11,359',
-    '11,373',
-    '11,379',
-    '11,410',
-    '11,411',
-    '11,442',
-    '11,460,000',
-    '11,465',
-    '11,480',
-    '11,482ft',
-    '11,493',
-    '11,494',
-    '11,498',
     '11,500,000',
-    '11,5000',
-    '11,500ft',
-    '11,500km',
-    '11,503',
-    '11,533',
-    '11,541,155',
-    '11,554,000',
-    '11,558',
-    '11,560',
-    '11,563',
-    '11,577',
-    '11,580ft./350m',
-    '11,596',
-    '11,600,000',
-    '11,603',
     '11,604,418',
-    '11,624',
-    '11,661,391',
-    '11,667,000',
-    '11,676',
-    '11,680',
-    '11,713,000',
-    '11,720',
-    '11,750',
-    '11,768',
-    '11,795',
-    '11,799',
-    '11,820,000',
-    '11,832',
-    '11,844',
-    '11,854ft&',
     '11,856',
-    '11,857',
-    '11,860',
-    '11,867',
-    '11,871',
-    '11,877',
-    '11,878',
-    '11,904',
-    '11,908',
-    '11,910.',
-    '11,923',
-    '11,958',
-    '11,978',
-    '11,998',
-    '11-0',
-    '11-0-43-0',
     '11-0-59-0',
-    '11-1-37-1',
-    '11-1-52-1',
-    '11-1-57-1',
-    '11-12th',
-    '11-13,000,000',
-    '11-13s',
-    '11-16-year-olds',
-    '11-18-07-61',
-    '11-19',
-    '11-2-91',
-    '11-2-93',
-    '11-20',
-    '11-3',
-    '11-3-93',
-    '11-4-1',
     '11-4-12-2',
-    '11-4-2',
-    '11-5-1',
-    '11-5-2',
-    '11-6',
-    '11-6-1',
-    '11-6-2',
-    '11-6pm',
-    '11-7-1',
-    '11-7-2',
-    '11-7-3',
-    '11-bay',
-    '11-bedroom',
-    '11-boat',
-    '11-cd',
-    '11-channel',
     '11-count',
-    '11-country',
-    '11-episode',
-    '11-er',
-    '11-fence',
-    '11-ghz',
-    '11-handicapper',
-    '11-hectare',
-    '11-hour-old',
-    '11-judge',
-    '11-khan',
-    '11-m',
-    '11-metre',
-    '11-mile',
-    '11-minute',
-    '11-night',
     '11-over',
-    '11-party',
-    '11-player',
-    '11-pounder',
-    '11-run',
-    '11-sep',
-    '11-stone',
-    '11-storey',
-    '11-sung',
-    '11-tests',
-    '11-tone',
-    '11-try',
-    '11-under-par',
-    '11-years',
-    '11.0&ndash;14.0',
-    '11.00&ndash;11.30pm',
     '11.00&ndash;13.00',
-    '11.00&ndash;19.00',
-    '11.00am&ndash;4.45pm',
-    '11.01',
-    '11.01.10',
-    '11.02p',
-    '11.03',
-    '11.04',
-    '11.0584',
-    '11.05am',
-    '11.08',
-    '11.09',
-    '11.1&ins',
-    '11.1&ndash;2',
-    '11.1&ndash;9',
-    '11.1.1',
     '11.1.2',
-    '11.1.3',
-    '11.10.90',
-    '11.10.92',
-    '11.11%',
-    '11.11.91y6',
-    '11.11m',
-    '11.12.93',
-    '11.123&mdash;4.26,32,5',
-    '11.123.30',
-    '11.125%',
-    '11.13am',
-    '11.15&ndash;17',
-    '11.1653&ndash;4',
-    '11.19615',
-    '11.1a',
     '11.1p',
-    '11.2&ndash;11.4',
-    '11.2(1)',
-    '11.2(1a)',
-    '11.2(2)',
-    '11.2(3)',
-    '11.2(b)',
-    '11.2.',
-    '11.2.4',
-    '11.2.5',
-    '11.2.50',
-    '11.2.6',
-    '11.2/100000',
-    '11.20&ndash;12.45',
-    '11.20in',
-    '11.21&deg;c',
     '11.22am',
-    '11.22am.',
-    '11.22pm',
-    '11.24&ndash;6',
-    '11.26m',
-    '11.2:1',
-    '11.2pc',
-    '11.2secs',
-    '11.3&times;10/l',
-    '11.3(1)',
-    '11.3(2)',
-    '11.3.16',
-    '11.3.1913',
-    '11.3.3',
-    '11.3.5',
-    '11.3.5.3',
     '11.3.5.7',
-    '11.3.92',
-    '11.3/100000/',
-    '11.30-8.30',
-    '11.30a.m',
-    '11.30am&ndash;1pm',
-    '11.30am-3.30pm',
-    '11.30am-3pm',
-    '11.30am-4.30pm',
-    '11.33am',
-    '11.34am',
-    '11.35am',
-    '11.35p',
-    '11.37%',
-    '11.375p',
-    '11.37am',
     '11.39',
-    '11.3oam',
-    '11.3p',
-    '11.3secs',
-    '11.4(b)',
-    '11.40pm',
-    '11.40sec',
-    '11.42',
-    '11.43',
-    '11.48',
-    '11.49pc',
-    '11.4pc',
-    '11.5&ins',
-    '11.5(2)',
-    '11.5(a)',
-    '11.5(b)',
     '11.5(c)',
-    '11.5(d)',
-    '11.5-mile',
-    '11.5.1',
-    '11.5.2',
-    '11.5.4',
-    '11.50p',
-    '11.52',
-    '11.55-point',
-    '11.55p',
-    '11.56',
-    '11.56am',
-    '11.57/3',
-    '11.59',
-    '11.5cm',
-    '11.5f',
     '11.5mpg',
-    '11.5pc',
-    '11.5secs',
-    '11.6&ins',
-    '11.6(1)',
-    '11.6(2)',
-    '11.6(4)',
-    '11.6(a)',
-    '11.6(b)',
-    '11.6-megawatt',
-    '11.6.1',
-    '11.6.2',
-    '11.6.2.',
-    '11.6.4',
-    '11.6.5',
-    '11.625%',
     '11.63p',
-    '11.65',
-    '11.6b',
-    '11.6kpc',
-    '11.6p.p.m.',
-    '11.7&ins',
-    '11.7&percnt',
-    '11.7(a)',
-    '11.7(b)',
-    '11.7-point',
-    '11.7.1',
-    '11.73',
-    '11.75%',
-    '11.76',
-    '11.77',
-    '11.79%',
     '11.7a',
-    '11.7b',
-    '11.7c',
-    '11.7d',
-    '11.7g-bytes-per-second',
-    '11.7p',
-    '11.7pc',
-    '11.7secs',
-    '11.8.1',
-    '11.8.2',
-    '11.81',
-    '11.84',
-    '11.856',
-    '11.85in',
-    '11.88',
-    '11.89',
     '11.8g/kw/hr',
-    '11.8p',
-    '11.90.6kyr',
-    '11.92sec',
-    '11.952in',
-    '11/10/93',
-    '11/11',
-    '11/11/87',
-    '11/17',
-    '11/199',
-    '11/21',
-    '11/285',
-    '11/31',
-    '11/395/67',
-    '11/4',
-    '11/4/41',
     '11/459',
-    '11/4m',
-    '11/5/41',
-    '11/6/83',
-    '11/61',
-    '11/68',
-    '11/785',
-    '11/8',
-    '11/8/92',
-    '11/86',
-    '11/9/1993',
-    '11/9/78',
-    '11/91p24',
-    '11/92',
-    '11/93',
-    '11/ac',
     '110&deg',
-    '110&deg;f',
-    '110&deg;w',
-    '110&dollar',
-    '110&mgr;gml',
-    '110&ndash;112',
-    '110&ndash;172',
-    '110&ndash;2',
-    '110&ndash;26',
-    '110&ndash;9',
-    '110&pound',
-    '110(2)',
-    '110,00',
-    '110,000,000',
-    '110,169',
-    '110,287',
     '110,320',
-    '110,407,376',
-    '110,600',
-    '110,900,000',
-    '110-101',
-    '110-1086',
-    '110-120',
-    '110-125&deg;c',
-    '110-132',
-    '110-day',
-    '110-metre',
-    '110-mile',
-    '110-page',
-    '110-point',
-    '110-storey',
-    '110.',
     '110.25',
-    '110.3%',
-    '110.34mph',
-    '110.42',
-    '110.5%',
-    '110.50%',
-    '110.53',
-    '110.64mph',
-    '110.8',
-    '110.84p',
-    '110.97p',
-    '110/0.5',
-    '110/120',
-    '110/120v',
-    '110/15',
-    '110/172',
     '1100&deg',
-    '1100&ndash;1154',
-    '1100&ndash;1171',
-    '1100&ndash;1200',
-    '1100&ndash;1700',
-    '1100&ndash;39',
-    '110000',
-    '110006',
-    '110044',
-    '11005',
-    '1100kcal',
-    '110181',
-    '1101902',
-    '1102.',
-    '1102.10',
-    '11022',
     '1102nd',
-    '1103/1691&ndash;2',
-    '1103813',
-    '1103m',
-    '11040st',
-    '11041',
-    '11043',
-    '11044',
-    '11046',
-    '1105&ndash',
-    '1105&ndash;1184',
-    '11060',
-    '1107&ndash;41',
-    '1107&ndash;81',
-    '1107mw',
-    '1108&deg',
     '1108&ndash;1180',
-    '1108&ndash;9',
-    '1108,000',
-    '1108.',
-    '1108.3',
-    '1108.5',
-    '1109.',
-    '1109.4',
-    '110944',
-    '1109f',
-    '110:4',
-    '110as',
-    '110b',
-    '110bhp',
-    '110c&ndash;g',
-    '110cm',
     '110ff',
-    '110ft',
-    '110kb',
-    '110lb',
-    '110ml',
-    '110mls',
-    '110mph-plus',
-    '110pc',
-    '110pp',
-    '110sq',
-    '110x220cm',
-    '110zs',
-    '111%',
-    '111&mdash;12',
-    '111&mdash;12.99&mdash;137',
-    '111&mdash;13',
     '111&ndash;103',
-    '111&ndash;112',
-    '111&ndash;113',
-    '111&ndash;115',
-    '111&ndash;116',
-    '111&ndash;122',
-    '111&ndash;152',
-    '111&ndash;17',
-    '111&ndash;2',
-    '111&ndash;22',
-    '111&ndash;23',
-    '111&ndash;5',
-    '111&ndash;7',
-    '111(43%)',
-    '111,200,000',
-    '111,493',
     '111,800',
-    '111-117',
-    '111-77',
-    '111-member',
-    '111.0',
-    '111.0%',
-    '111.144',
-    '111.2',
-    '111.25',
-    '111.34',
-    '111.45',
-    '111.7',
-    '111.8',
-    '111.9',
-    '111.96&mdash;7',
-    '1110&ndash;1111',
     '1110&ndash;1175',
-    '111000',
-    '11101-04',
-    '1110h',
-    '1110st',
-    '1111&ndash;0',
-    '1111&ndash;1112',
-    '111100',
-    '11111111',
-    '1111a',
-    '1111e',
-    '1112&ndash;47',
-    '11120',
-    '111330',
-    '11145',
-    '1114m',
     '11150',
-    '1115m',
-    '1116&ndash;42',
-    '1116d',
-    '1117\'',
-    '1118&mdash;21',
-    '1118&ndash;1127',
-    '111860',
-    '1118p',
-    '1119&ndash;30',
-    '1119&ndash;46',
-    '111:106',
-    '111a',
-    '111a.',
-    '111b&ndash;c',
-    '111bhp',
     '111e',
-    '111ff',
-    '111mph',
-    '111p',
-    '111p.',
-    '112&frac12&percnt',
-    '112&mdash;13.138&mdash;70',
-    '112&ndash',
-    '112&ndash;115',
-    '112&ndash;129',
-    '112&ndash;21',
-    '112&ndash;3',
-    '112&ndash;7',
-    '112&ndash;99',
-    '112&plus;2',
-    '112(3)',
     '112,424',
-    '112,500',
-    '112-',
-    '112-122',
-    '112-62',
-    '112-ball',
-    '112-bhp',
-    '112-company',
-    '112-lot',
-    '112-strand',
-    '112.',
-    '112.01',
-    '112.11',
-    '112.25%',
-    '112.3',
-    '112.31',
     '112.3p',
-    '112.42%',
-    '112.5%',
-    '112.5in',
-    '112.5p',
-    '112.6',
-    '112.65',
-    '112.65mph',
-    '112.67',
-    '112.7%',
-    '112.76p',
-    '112.8p',
-    '112.97',
-    '112.9p',
-    '112/506',
-    '1120&ndash;21',
     '112000',
-    '1121&ndash;1122',
-    '1121&ndash;48',
-    '112114',
-    '112180',
-    '1121g&ndash;h',
-    '1122.32.21',
-    '112360',
-    '1124&ndash;44',
-    '1124h',
-    '1125&ndash;40',
-    '1125-line',
-    '1125000',
-    '11259',
-    '1125b',
-    '1125h',
     '1126&deg',
-    '1126a',
-    '1126c&ndash;d',
-    '1127&ndash;8',
-    '1127-megawatt',
-    '112720',
-    '1128&ndash;32',
-    '1129&ndash;1130',
-    '112955',
-    '1129h',
-    '112b',
-    '112bhp/tonne',
-    '112e',
-    '112ft',
-    '112k',
-    '112kbps',
     '112kts',
-    '112m',
-    '112mm&times;62mm&times;31mm',
-    '112mpg',
-    '112pp',
-    '112pp.',
-    '112th',
-    '112x142cm',
-    '113&ndash;114',
-    '113&ndash;127',
-    '113&ndash;24',
-    '113&ndash;9',
-    '113(1)',
-    '113,211',
-    '113,615',
-    '113,665,000',
     '113,800',
-    '113,898',
-    '113-106',
-    '113-118',
-    '113.01p',
-    '113.1',
-    '113.104',
-    '113.171f.',
-    '113.3%',
-    '113.6',
-    '113.6%',
-    '113.69mph',
-    '113.6p',
-    '113.8',
-    '113/115',
-    '113/29',
     '113/4p.c.',
-    '113/75',
-    '1130&mdash;43',
-    '1130&ndash;1200',
-    '1130&ndash;50',
-    '1130a',
-    '1130m',
-    '1131&ndash;48',
-    '1132&ndash;48',
-    '1132.',
-    '1132m',
-    '11338',
-    '1133b',
-    '1135&ndash;9',
-    '113540',
-    '1136/e/l',
     '113680',
-    '11370',
-    '11386303',
-    '113a',
-    '113f',
-    '113ff',
-    '113hp',
-    '113kg',
-    '113mm',
-    '113s',
-    '113s.',
-    '113th',
-    '114&frac12;p',
-    '114&ndash;15',
-    '114&ndash;17',
-    '114&ndash;18',
     '114&ndash;19',
-    '114&ndash;33',
-    '114&ndash;5',
-    '114&ndash;6',
-    '114(2)',
-    '114,500',
-    '114,718,395',
-    '114-2',
-    '114-mile',
-    '114-person',
-    '114-point',
-    '114-seat',
-    '114.1p',
-    '114.25',
-    '114.3',
-    '114.3%',
     '114.4%',
-    '114.4p',
-    '114.5',
-    '114.65p',
-    '114.680mph',
-    '114.6gflops',
-    '114.6p',
-    '114.84mph',
-    '114.9',
-    '114.95',
-    '114/187',
-    '114/83',
-    '1140&ndash;1221',
-    '1140&ndash;98',
-    '1140-foot',
-    '1140.00',
     '114000',
-    '11402',
-    '1140hrs',
-    '1140hs',
-    '1140s/1730s',
-    '11411',
-    '1143&ndash;1530',
-    '114475',
-    '1145&ndash;1202',
-    '1145&ndash;70',
-    '114530',
-    '1146&ndash;74',
-    '11470',
-    '1148&ndash;56',
-    '11480',
-    '114bhp',
     '114bhp/tonne',
-    '114cm',
-    '114ff',
-    '114ff.',
-    '114ills.',
-    '114kg',
-    '114mm',
-    '114pp',
-    '115&mdash;16',
-    '115&ndash;112',
-    '115&ndash;121%',
-    '115&ndash;170g',
-    '115&ndash;18',
-    '115&ndash;21',
-    '115&ndash;24',
-    '115&ndash;28',
     '115&ndash;6',
-    '115(2)',
-    '115,000,000',
-    '115,171',
-    '115,315,902',
-    '115,446',
-    '115-86',
-    '115-decibel',
-    '115-foot',
-    '115-foot-long',
-    '115-test',
-    '115-year-old',
-    '115.0',
-    '115.04',
-    '115.13mph',
-    '115.2%',
     '115.22',
-    '115.2bps',
-    '115.2kbps',
-    '115.44mph',
-    '115.45mph',
-    '115.5',
-    '115.5mm',
-    '115.7p',
-    '115.859',
-    '115.86',
-    '115.88',
-    '115.90',
-    '115.9p',
-    '115/240',
-    '1150&ndash;1600',
-    '1150&ndash;1750',
     '115000',
-    '11501270',
-    '1150kg',
-    '1151&ndash;96',
-    '11513',
-    '115288',
-    '1154&ndash;5',
-    '11540',
-    '115403',
-    '1155\'s',
-    '1155.5',
-    '1155c',
-    '1155mw',
-    '1156420',
-    '115670',
-    '1157&ndash;1217',
     '115:150',
-    '115:9',
-    '115a',
-    '115d',
-    '115ft',
-    '115l',
-    '115m',
-    '115ma',
-    '115mb',
-    '115mph',
-    '116&frac12',
-    '116&mdash;17',
-    '116&ndash;112',
-    '116&ndash;113',
-    '116&ndash;117',
-    '116&ndash;122cm',
     '116&ndash;17',
-    '116&ndash;25',
-    '116&ndash;27',
-    '116&ndash;8',
-    '116,18,19,21,22',
-    '116,500',
-    '116,775',
-    '116-111',
-    '116-114',
-    '116-mile',
-    '116-miles',
-    '116-officer',
-    '116.04p',
-    '116.1khz',
-    '116.23%',
-    '116.2p',
     '116.2x88.7cm',
-    '116.31',
-    '116.3p',
-    '116.5',
-    '116.5%',
-    '116.5p',
-    '116.6',
-    '116.74p',
-    '116.78',
-    '116.8',
-    '116.83p',
-    '116/62',
-    '116/77',
-    '116/800',
-    '1160&divide;2',
-    '1160&ndash;1225',
     '1160&ndash;1240',
-    '11600',
-    '116090',
-    '1161&ndash;3',
-    '1162&ndash;96',
-    '11620',
-    '1162m',
-    '1163&ndash;1235',
-    '1163&ndash;65',
-    '1164&ndash;1168',
-    '1165&ndash;1230',
-    '1165&ndash;1378',
-    '1165&ndash;1547',
-    '1165&ndash;2081',
-    '1165p',
-    '1167&ndash;1174',
     '1167&ndash;77',
-    '116700001',
-    '116700041',
-    '116750',
-    '1168&ndash;88',
-    '11680',
-    '1168cc',
-    '1169&ndash;73',
-    '116b/117',
-    '116cps',
-    '116km',
-    '116yds.',
-    '117&frac12',
-    '117&ndash;110',
-    '117&ndash;122',
-    '117&ndash;126',
     '117&ndash;131',
-    '117&ndash;18',
-    '117&ndash;19',
-    '117&ndash;3',
-    '117&ndash;33',
-    '117&ndash;57',
-    '117&ndash;7',
-    '117&ndash;8',
-    '117&ndash;9',
-    '117,180',
-    '117,372',
-    '117-1',
-    '117-110',
-    '117-112',
-    '117-121',
-    '117-192',
     '117-67',
-    '117-minute',
-    '117-seat',
-    '117-year-old',
-    '117.0',
-    '117.1%',
-    '117.3p',
-    '117.443',
-    '117.617',
-    '117.790',
-    '117.9',
-    '117/119,118/120,172/174',
-    '117/121',
-    '117/695',
-    '1170&ndash;1217',
-    '1170&ndash;1235/6',
     '1170&ndash;1560',
-    '11710',
-    '1172&ndash;1173',
-    '1172&ndash;89',
-    '11733',
-    '1175&ndash;6',
-    '1175&ndash;84',
-    '1177&ndash;84',
-    '1177&ndash;85',
-    '1177m',
-    '117a',
-    '117a&ndash;e',
-    '117ff',
-    '117km',
-    '117lb',
-    '117m',
     '117th',
-    '118&deg',
-    '118&frac12;-116',
-    '118&ft',
-    '118&ndash;105bc',
-    '118&ndash;119',
-    '118&ndash;123',
-    '118&ndash;124',
-    '118&ndash;124cm',
-    '118&ndash;20',
-    '118&ndash;21',
-    '118&ndash;25',
-    '118&ndash;358',
-    '118&ndash;8',
-    '118&ndash;99',
-    '118(1)',
     '118(2)',
-    '118,00',
-    '118,700',
-    '118,813',
-    '118-105',
-    '118-110',
-    '118-117',
-    '118.0',
-    '118.00',
-    '118.04p',
-    '118.085mph',
-    '118.1',
-    '118.191',
-    '118.3&ndash;169.4',
-    '118.4',
-    '118.46&mdash;7',
     '118.5',
-    '118.5p',
-    '118.6',
-    '118.6%',
-    '118.64p',
-    '118.68p',
-    '118.7',
-    '118.82p',
-    '118.85mph',
-    '118/3',
-    '118/512',
-    '1180&ndash;1223',
-    '1180&ndash;1224',
-    '1180&ndash;1247',
-    '1180&ndash;1350',
-    '11805',
     '1181&ndash;2',
-    '11810',
-    '1182&ndash;3',
-    '118210',
-    '1183&ndash;4',
-    '1183&ndash;5',
-    '1184.',
-    '118460',
-    '1186/21389',
-    '1187&mdash;91',
-    '1187&ndash;1191',
-    '1187&ndash;99',
-    '11874',
-    '11880',
-    '1189-',
-    '118:26',
     '118bp',
-    '118f',
-    '118ff',
-    '118ff.',
-    '118hp',
-    '118lb',
-    '118m',
-    '118mph',
-    '118pp',
-    '118runs',
-    '119%',
-    '119&ndash;0',
-    '119&ndash;120',
-    '119&ndash;140',
-    '119&ndash;34',
-    '119&ndash;46',
     '119&ndash;5',
-    '119&ndash;50',
-    '119(1)',
-    '119,630',
-    '119-',
-    '119-118',
-    '119-90',
-    '119-mile',
-    '119-seats',
-    '119.0',
-    '119.00',
-    '119.0p',
-    '119.3',
-    '119.49',
-    '119.68&mdash;9',
-    '119.7',
     '119.7%',
-    '119.76p',
-    '119.81p',
-    '119.85p',
-    '119.9',
-    '119.9%',
-    '119/121',
-    '1190&ndash;1251',
-    '1190&ndash;1258',
-    '1190&ndash;1275',
-    '1190&ndash;1320',
-    '11900',
-    '11904',
-    '11905-10',
-    '1191/2',
-    '1191/2p',
     '11927',
-    '11929',
-    '1193&ndash;1205',
-    '11935',
-    '1194/1195',
-    '1194b',
-    '1194d',
-    '11952',
-    '1196&ndash;1204',
-    '119611',
-    '119640',
-    '11965',
-    '11966',
-    '11979',
-    '1198&mdash;1304',
-    '1198&ndash;1212',
     '1198&ndash;1213',
-    '1198,030',
-    '11980',
-    '1199&mdash;1200',
-    '1199&ndash;1200',
-    '119930',
-    '119ff.',
-    '119kcalmol',
-    '119m/170m',
-    '119mph',
-    '119pp',
-    '119s.',
-    '119th-minute',
-    '11:00:06',
-    '11:00:30',
-    '11:00:35',
     '11:02:27',
-    '11:02:58',
-    '11:03:38',
-    '11:04:14',
-    '11:06',
-    '11:07:27&ndash;0500',
-    '11:07:39',
-    '11:07:56',
-    '11:08',
-    '11:08:15',
-    '11:08:44&ndash;0500',
-    '11:08:56',
-    '11:09:04',
-    '11:09:93',
-    '11:1&ndash;11',
-    '11:1&ndash;2',
     '11:1&ndash;3',
-    '11:1&ndash;9',
-    '11:100000',
-    '11:10:32',
-    '11:10:50',
-    '11:11',
-    '11:11:10',
-    '11:11:14',
-    '11:12&ndash;14',
-    '11:12:37',
-    '11:12:42',
-    '11:13',
-    '11:13:04',
-    '11:13:47',
-    '11:13:50',
-    '11:14,15',
     '11:15&ndash;19',
-    '11:15:33&ndash;0600',
-    '11:15:37',
-    '11:16',
-    '11:16&ndash;17',
-    '11:16:17',
-    '11:17:06.52',
-    '11:17:12',
-    '11:17:27',
-    '11:18:00',
-    '11:18:09',
-    '11:18:29&ndash;0500',
-    '11:18:43',
-    '11:18:54',
-    '11:19:23',
-    '11:19:41',
     '11:20&ndash;26',
-    '11:20,1',
-    '11:20:08',
-    '11:20:11',
-    '11:20:20',
-    '11:20:28',
-    '11:20:45',
-    '11:21:06',
-    '11:21:56',
-    '11:22',
-    '11:23',
-    '11:23:06',
-    '11:23:16',
-    '11:23:29',
-    '11:23:49',
-    '11:23:57',
     '11:24',
-    '11:24&ndash;25',
-    '11:24:20',
-    '11:25:13',
-    '11:25:24',
-    '11:25:58',
-    '11:26',
-    '11:26:26',
-    '11:26:58',
-    '11:27',
-    '11:27&ndash;33',
-    '11:27:29',
-    '11:28:14',
-    '11:28:48',
-    '11:29:02&ndash;0500',
-    '11:29:26',
     '11:29:41',
-    '11:29:54',
-    '11:3&ndash;4',
-    '11:30:13',
-    '11:30pm',
-    '11:31',
-    '11:32',
-    '11:32:59',
-    '11:33:59&ndash;0500',
-    '11:34:23',
-    '11:35:01',
-    '11:35:21',
-    '11:35:41',
-    '11:35:43',
-    '11:36:08',
-    '11:36:52',
     '11:37',
-    '11:37:15',
-    '11:38:15',
-    '11:38:36&ndash;0400',
-    '11:39:35',
-    '11:40:19',
-    '11:40:46',
-    '11:41:00',
-    '11:41:20',
-    '11:41:52',
-    '11:42',
-    '11:42:39',
-    '11:42:48',
-    '11:42:55',
-    '11:42:59',
-    '11:43:13',
     '11:43:58',
-    '11:44:12',
-    '11:45',
-    '11:45:03',
-    '11:45:49',
-    '11:45pm',
-    '11:46',
-    '11:46:25',
-    '11:48:54',
-    '11:48:56',
-    '11:49',
-    '11:49:00',
-    '11:49:07',
-    '11:5',
-    '11:5&ndash;9',
-    '11:50',
     '11:50:08',
-    '11:50:39',
-    '11:50:47',
-    '11:50:50',
-    '11:50pm',
-    '11:51:01',
-    '11:51:48',
-    '11:52:08',
-    '11:52:19',
-    '11:52:20',
-    '11:52:53',
-    '11:53:18',
-    '11:53:50',
-    '11:54',
-    '11:54:16',
-    '11:54:20',
     '11:55:11',
-    '11:55:26',
-    '11:56:40',
-    '11:57:21',
-    '11:59:01',
-    '11:59:10',
-    '11:6&ndash;9',
-    '11:89',
-    '11=9%',
-    '11a(3)',
-    '11a(4)',
-    '11a.1',
-    '11a.3',
-    '11a.m.',
-    '11am&ndash;1.30pm',
-    '11am&ndash;2pm',
     '11am&ndash;5.30pm',
-    '11am&ndash;8pm',
-    '11am-1pm',
-    '11am-2pm',
-    '11am-3pm',
-    '11am-4pm',
-    '11cm',
-    '11es',
-    '11f&ndash;g',
-    '11fl',
-    '11fn',
-    '11gm',
-    '11h',
-    '11ha',
-    '11inches',
-    '11ish',
     '11k',
-    '11kg',
-    '11kg/25lb',
-    '11khz',
-    '11kph',
-    '11kv',
-    '11kyr',
-    '11lbs',
-    '11m-3pm',
-    '11m-strong',
-    '11min',
-    '11mls',
-    '11month-old',
-    '11n',
-    '11o',
-    '11ozs',
     '11pp',
-    '11q',
-    '11q13',
-    '11q23',
-    '11sq',
-    '11sun2,90031.629.9',
-    '11th&ndash;13th',
-    '11th&rehy;seeded',
-    '11th-15th',
-    '11th-22nd',
-    '11th-minute',
-    '11th-ranked',
-    '11th-round',
-    '11th.',
-    '11th./12th.',
-    '11v',
     '11w',
-    '11x18cm',
-    '11year-old',
-    '11yr',
-    '12%&ndash;15%',
-    '12%percnt',
-    '12&amp;13',
-    '12&commat;1/2',
-    '12&deg;dh',
-    '12&deg;kh',
-    '12&frac12&ins',
-    '12&frac12;in',
-    '12&frac12;ins',
-    '12&frac14',
-    '12&frac14&ins',
-    '12&ft;6&ins',
     '12&ft;x12&ft',
-    '12&ins&times;18&ins',
-    '12&ins;x8&ins',
-    '12&mdash',
-    '12&mdash;16',
-    '12&mdash;19',
-    '12&mdash;25',
-    '12&micro;g',
-    '12&middot;08',
-    '12&middot;5x23cm',
-    '12&ndash&frac38',
-    '12&ndash;0&ndash;0',
-    '12&ndash;00',
-    '12&ndash;1&ndash;1847',
-    '12&ndash;1&ndash;1858',
-    '12&ndash;1&ndash;53&ndash;0',
     '12&ndash;10&ndash;0',
-    '12&ndash;10-',
-    '12&ndash;11-',
-    '12&ndash;12.30',
-    '12&ndash;12.5h',
-    '12&ndash;1237',
-    '12&ndash;13,000',
-    '12&ndash;13cm',
-    '12&ndash;14&ins',
-    '12&ndash;14-year-old',
-    '12&ndash;15.5',
-    '12&ndash;15min',
-    '12&ndash;15p',
-    '12&ndash;16%',
-    '12&ndash;18-month-old',
-    '12&ndash;2&ndash;31&ndash;1',
     '12&ndash;2&ndash;8',
-    '12&ndash;2(a)',
-    '12&ndash;2(b)',
-    '12&ndash;21',
-    '12&ndash;21st',
-    '12&ndash;24in',
-    '12&ndash;25',
-    '12&ndash;25%',
-    '12&ndash;250',
-    '12&ndash;25:18',
-    '12&ndash;267',
-    '12&ndash;27',
-    '12&ndash;3&ndash;1892',
-    '12&ndash;30%',
-    '12&ndash;300',
-    '12&ndash;31',
     '12&ndash;33',
-    '12&ndash;48',
-    '12&ndash;5&ndash;17&ndash;5',
-    '12&ndash;5&ndash;1861',
-    '12&ndash;50',
-    '12&ndash;54',
-    '12&ndash;5pm',
-    '12&ndash;63',
-    '12&ndash;65',
-    '12&ndash;7&ndash',
-    '12&ndash;72',
-    '12&ndash;79',
-    '12&ndash;7kyr',
-    '12&ndash;82',
-    '12&percnt',
-    '12&rehy;inches',
     '12&rehy;team',
-    '12&shilling;11d',
-    '12&shilling;5d',
-    '12&sol;13',
-    '12&sol;76',
-    '12&times;10&ins',
-    '12&times;12&ft',
-    '12&times;16&frac12&ins',
-    '12&times;16in',
-    '12&times;17&frac12&ins',
-    '12&times;8&ins',
-    '12\'2',
-    '12\'s',
-    '12\'w',
-    '12()',
-    '12(-)',
     '12(13)',
-    '12(7)',
-    '12(9)',
-    '12(a)',
-    '12(i)',
-    '12+',
-    '12+1',
-    '12,00',
-    '12,000&ndash;18,000',
-    '12,000&ndash;20,000',
-    '12,000&ndash;220,000',
-    '12,000-16,000',
-    '12,000-kilogram',
-    '12,000-mile',
-    '12,000-seater',
-    '12,000bc',
     '12,000gns',
-    '12,000kg',
-    '12,000m',
-    '12,000mw',
-    '12,000opm',
-    '12,000rpm',
-    '12,000th',
-    '12,000yrbp',
-    '12,028,000',
-    '12,035',
-    '12,038',
-    '12,063',
-    '12,076',
-    '12,087',
-    '12,100',
-    '12,106',
     '12,114',
-    '12,12s',
-    '12,13',
-    '12,144',
-    '12,16,17',
-    '12,16,23',
-    '12,178',
-    '12,19',
-    '12,196',
-    '12,1992',
-    '12,209',
-    '12,21',
-    '12,23',
-    '12,232,498',
-    '12,293',
-    '12,3,6',
     '12,300',
-    '12,315',
-    '12,319,787',
-    '12,331',
-    '12,336',
-    '12,34',
-    '12,340',
-    '12,343',
-    '12,348',
-    '12,349ft',
-    '12,357',
-    '12,359',
-    '12,370',
-    '12,371',
-    '12,390',
-    '12,395',
     '12,400lb',
-    '12,405',
-    '12,408',
-    '12,426,000',
-    '12,426,443',
-    '12,430',
-    '12,460',
-    '12,500&ft',
-    '12,5000',
-    '12,500km',
-    '12,525,000',
-    '12,533',
-    '12,560',
-    '12,570,000',
-    '12,596,124',
-    '12,618',
     '12,623,582',
-    '12,627',
-    '12,650',
-    '12,657',
-    '12,675',
-    '12,705',
-    '12,712',
-    '12,715',
-    '12,743',
-    '12,760,000',
-    '12,765',
-    '12,769',
-    '12,782',
-    '12,800,000',
-    '12,828',
-    '12,848',
     '12,858',
-    '12,859',
-    '12,860',
-    '12,884',
-    '12,889.8',
-    '12,890',
-    '12,910',
-    '12,914',
-    '12,915',
-    '12,920',
-    '12-,13-',
-    '12-12-14',
-    '12-139',
-    '12-1pm',
-    '12-20',
-    '12-21',
     '12-22',
-    '12-23',
-    '12-25',
-    '12-26',
-    '12-28',
-    '12-3-1',
-    '12-3-2',
-    '12-3-3',
-    '12-3-4',
-    '12-3-5',
-    '12-3-6',
-    '12-3-7',
-    '12-3-8',
-    '12-3-93',
-    '12-30th',
-    '12-36',
     '12-4-1',
-    '12-4-2',
-    '12-4-93',
-    '12-5',
-    '12-9-91',
-    '12-a-side',
-    '12-aug-1993',
-    '12-bedroom',
-    '12-bores',
-    '12-breakfast-bar',
-    '12-car',
-    '12-colour',
-    '12-count',
-    '12-date',
-    '12-denier',
-    '12-egg-box',
     '12-feed',
-    '12-feet',
-    '12-foot-high',
-    '12-footer',
-    '12-footers',
-    '12-ft',
-    '12-game',
-    '12-gauge',
-    '12-gear',
-    '12-h',
-    '12-horsepower',
-    '12-hydroxy-5.8.10-hepta-decatrienoic',
-    '12-in',
-    '12-ins',
-    '12-issue',
-    '12-j5',
     '12-jul-92',
-    '12-key',
-    '12-km',
-    '12-km-long',
-    '12-l',
-    '12-l-hydroperoxy-5,8,10',
-    '12-length',
-    '12-letter',
-    '12-line',
-    '12-mile-long',
-    '12-miles',
-    '12-month-long',
-    '12-per',
-    '12-piece',
-    '12-pin',
-    '12-points',
     '12-port',
-    '12-ppm',
-    '12-rounder',
-    '12-section',
-    '12-ship',
-    '12-shot',
-    '12-sided',
-    '12-slot',
-    '12-speed',
-    '12-star',
-    '12-starred',
-    '12-stitches',
-    '12-team',
-    '12-to-15',
-    '12-to-16',
-    '12-tog',
     '12-ton',
-    '12-tooth',
-    '12-toothed',
-    '12-unit',
-    '12-v',
-    '12-vehicle',
-    '12-week-old',
-    '12-well',
-    '12-y-o',
-    '12-year-prison',
-    '12.00&ndash;12.30',
-    '12.00&ndash;16.00',
-    '12.00&ndash;17.30',
-    '12.00&ndash;18.0',
-    '12.00&ndash;18.45',
-    '12.000',
     '12.00am',
-    '12.00pm',
-    '12.04',
-    '12.08%',
-    '12.1&ndash;14.9',
-    '12.1&ndash;3',
-    '12.1&ndash;8',
-    '12.1(c)',
-    '12.1(d)',
-    '12.1.90',
-    '12.10am',
-    '12.10sec',
-    '12.11&ndash;12',
-    '12.119.76-7',
-    '12.11b-13',
-    '12.12(1)',
     '12.12.8',
-    '12.12.88',
-    '12.12.91',
-    '12.123&mdash;4',
-    '12.125%',
-    '12.127.10',
-    '12.127.16&mdash;28',
-    '12.127.25',
-    '12.13.0',
-    '12.138&ndash;44',
-    '12.145&ndash;6',
-    '12.15a.m',
-    '12.16&ndash;18',
-    '12.160',
-    '12.18(b)',
-    '12.1m',
     '12.1mm',
-    '12.1secs',
-    '12.2&ndash;33.2',
-    '12.2(c)',
-    '12.2.1.1',
-    '12.2.3',
-    '12.2.4',
-    '12.22p',
-    '12.23pm',
-    '12.25%',
-    '12.25pm',
-    '12.260',
-    '12.27am',
-    '12.29b',
-    '12.2ff',
-    '12.2hh',
     '12.2mm',
-    '12.2p',
-    '12.2secs',
-    '12.3(2)',
-    '12.3.93',
-    '12.30&ndash;14.30',
-    '12.30&ndash;2',
-    '12.30&ndash;2.30',
-    '12.30&ndash;31',
-    '12.30&ndash;5pm',
-    '12.30-1.30',
-    '12.30p.m.',
-    '12.30pm&ndash;2pm',
-    '12.30pm.',
-    '12.33%',
-    '12.33p',
     '12.35&ndash;48',
-    '12.35am',
-    '12.36fl',
-    '12.3ft',
-    '12.3oz',
-    '12.3p.',
-    '12.4&ins',
-    '12.4-hour',
-    '12.4.1',
-    '12.4.1931',
-    '12.4.2',
-    '12.4.4',
-    '12.40am',
-    '12.45:it',
-    '12.45:the',
-    '12.45am',
     '12.45d.',
-    '12.47pm',
-    '12.49',
-    '12.49am',
-    '12.4a',
-    '12.4m',
-    '12.4p',
-    '12.4pc',
-    '12.4secs',
-    '12.5,25',
-    '12.5-cm',
-    '12.5.1',
-    '12.5.2',
-    '12.5/0.5',
-    '12.50:hot',
-    '12.50:whitbread',
     '12.50am',
-    '12.51pm',
-    '12.52',
-    '12.54',
-    '12.547a',
-    '12.55:this',
-    '12.57%',
-    '12.5cm',
-    '12.5k',
-    '12.5kg-bulk',
-    '12.5khz',
-    '12.5km',
-    '12.5m',
-    '12.6&times;10/l',
-    '12.6.1',
-    '12.6.2',
     '12.6.3',
-    '12.6/',
-    '12.625%',
-    '12.64',
-    '12.65',
-    '12.65%',
-    '12.68%',
-    '12.69',
-    '12.6b',
-    '12.7&times;10/l',
-    '12.7&times;14.6',
-    '12.7(3)',
-    '12.7,13,23',
-    '12.7.1',
-    '12.7.2',
-    '12.70.6kyr',
     '12.75%',
-    '12.75p',
-    '12.77p',
-    '12.7kg',
-    '12.7mm',
-    '12.8&times;10',
-    '12.8-18.4',
-    '12.83',
-    '12.84m',
-    '12.86p',
-    '12.89:2',
-    '12.8m',
-    '12.8p',
-    '12.8secs',
-    '12.9&deg;c',
-    '12.9&times;10/l',
     '12.9.1865',
-    '12.90',
-    '12.92',
-    '12.95&ndash;16.69',
-    '12.9v',
-    '12/10',
-    '12/10/84',
-    '12/12/92',
-    '12/123',
-    '12/14',
-    '12/14th',
-    '12/155',
-    '12/16',
-    '12/2&ndash;3',
-    '12/2/41',
-    '12/210',
     '12/22',
-    '12/259',
-    '12/3/83',
-    '12/32',
-    '12/321',
-    '12/4/88',
-    '12/458',
-    '12/472',
-    '12/5/41',
-    '12/5/92',
-    '12/50',
-    '12/51',
-    '12/558',
-    '12/590',
-    '12/6&frac12;was',
-    '12/606',
     '12/639',
-    '12/85',
-    '12/87',
-    '12/88',
-    '12/89',
-    '12/9/88',
-    '12/90',
-    '12/carterton/oxfordshire',
-    '120&deg;.',
-    '120&deg;c',
-    '120&deg;e',
-    '120&frac12;km',
-    '120&ft',
-    '120&ins',
-    '120&mdash',
-    '120&mdash;2',
     '120&ndash;1',
-    '120&ndash;121',
-    '120&ndash;122hp',
-    '120&ndash;130',
-    '120&ndash;130&deg;c',
-    '120&ndash;140-kyr',
-    '120&ndash;150%',
-    '120&ndash;150cm',
-    '120&ndash;2',
-    '120&ndash;240',
-    '120&ndash;3',
-    '120&ndash;36',
-    '120&ndash;38',
-    '120&ndash;40',
-    '120&ndash;5',
-    '120&ndash;67',
     '120&ndash;8',
-    '120&ndash;9',
-    '120(3)',
-    '120+',
-    '120+n/a',
-    '120,000,000',
-    '120,000-a-year',
-    '120,000-capacity',
-    '120,000b/d',
-    '120,000m',
-    '120,038.07',
-    '120,300',
-    '120,600',
-    '120-107',
-    '120-109',
-    '120-160',
     '120-berth',
-    '120-degree',
-    '120-depleted',
-    '120-foot',
-    '120-knot',
-    '120-metre',
-    '120-mm',
-    '120-odd',
-    '120-pin',
-    '120-point',
-    '120-seater',
-    '120-square-foot',
-    '120-watt',
-    '120-year-old',
-    '120.0',
-    '120.1',
     '120.464.3',
-    '120.4p',
-    '120.5%',
-    '120.5ins',
-    '120.77p',
-    '120.8',
-    '120/',
-    '120/80',
-    '120/91',
-    '120/972',
-    '120/min',
-    '1200&deg;c',
-    '1200&mdash;1201',
-    '1200&mdash;1400',
-    '1200&ndash;1000',
-    '1200&ndash;1274',
     '1200&ndash;1304',
-    '1200&ndash;1600',
-    '1200&ndash;68',
-    '1200&ndash;75',
-    '1200-mm',
-    '1200/75bps',
-    '12000&ndash;14000',
-    '12000-mile',
-    '120000ha',
-    '12000ft',
-    '12000sx',
-    '1200cals',
-    '1200cc',
-    '1200ft',
-    '1200km',
-    '1200mjy',
     '1200mwe',
-    '1200n',
-    '1200ppm',
-    '1200th',
-    '1200z',
-    '120120',
-    '1201e&ndash;f',
-    '1202.',
-    '12020',
-    '1202e',
-    '1203&ndash;4',
-    '1203-4',
-    '1204&mdash;5',
-    '1204&mdash;advertisement',
-    '1204&ndash;59',
-    '1205&mdash;6',
     '1205&ndash;1206',
-    '1205&ndash;1265',
-    '1206&ndash;1258',
-    '1208&ndash;11',
-    '1208&ndash;9',
-    '120970',
-    '120:1',
-    '120:160:5:5',
-    '120c',
-    '120c/250f/gas',
-    '120cms',
-    '120ff',
-    '120ft2',
-    '120g/4&frac12;oz',
-    '120k',
-    '120kg',
     '120lbs',
-    '120m3',
-    '120ma',
-    '120mins',
-    '120mph-plus',
-    '120ns',
-    '120p.',
-    '120ppm',
-    '120sq',
-    '121&deg;08\'&ndash;122&deg;44\'',
-    '121&deg;c',
-    '121&mdash;2',
-    '121&middot;9',
-    '121&ndash;180',
-    '121&ndash;3',
-    '121&ndash;31',
     '121&ndash;32',
-    '121&ndash;49',
-    '121&ndash;878',
-    '121&plus;2',
-    '121,215',
-    '121,600',
-    '121-122',
-    '121-based',
-    '121.36mph',
-    '121.3p',
-    '121.57',
-    '121.5p',
-    '121.65',
-    '121.9',
-    '121.9p',
-    '121.9x137.2cm',
     '121/2',
-    '1210&ndash;1274',
-    '12110',
-    '121121',
-    '1211g',
-    '12120kyr',
-    '12121-12',
-    '121270',
-    '1212a&mdash;g',
-    '1212k',
-    '1212p',
-    '1213/180',
-    '1213x1214',
-    '1214&ndash;94',
-    '12140',
-    '121400',
     '1214m',
-    '1215&ndash;1295',
-    '1215&ndash;17',
-    '1216/l',
-    '1217&ndash;18',
-    '1217&ndash;23',
-    '1219&ndash;20',
-    '1219&ndash;21',
-    '12190',
-    '121:1',
-    '121bhp',
-    '121f.',
-    '121ff',
-    '121lb',
-    '121p',
-    '122&mdash;4',
     '122&ndash;124',
-    '122&ndash;127',
-    '122&ndash;129',
-    '122&ndash;210',
-    '122&ndash;40',
-    '122&ndash;52',
-    '122,131',
-    '122,200',
-    '122,243',
-    '122,600,000',
-    '122,802',
-    '122,890',
-    '122-&frac12',
-    '122-litre',
-    '122-mm',
-    '122-point',
     '122.000,00',
-    '122.1&ndash;174.5',
-    '122.2p',
-    '122.301',
-    '122.4',
-    '122.49mph',
-    '122.56',
-    '122.79p',
-    '122.91',
-    '1220&ndash;1280',
-    '1220&ndash;4220',
-    '1220&ndash;88',
-    '1221&ndash;1284',
-    '1221&ndash;1921',
-    '1223m',
-    '1224&ndash;37',
     '1224&ndash;6',
-    '122450',
-    '12247',
-    '1225&ndash;1274',
-    '1225-x',
-    '1225:39',
-    '1226&ndash;70',
-    '1227&mdash;41',
-    '1227&ndash;59',
-    '1227:05',
-    '1228&ndash;1277',
-    '1228:23',
-    '1229&ndash;1856',
-    '1229:16',
-    '122b&ndash;e',
-    '122cm(48in)',
     '122pc',
-    '122pp',
-    '122yds',
-    '123%',
-    '123&deg;e',
-    '123&mdash;4',
-    '123&mdash;8',
-    '123&ndash;5',
-    '123&ndash;74',
-    '123&plus;2',
-    '123(2)',
-    '123,220,129',
-    '123,229',
-    '123,456',
-    '123,611,541',
-    '123,973',
     '123-point',
-    '123-talk',
-    '123-year-old',
-    '123.2%',
-    '123.3%',
-    '123.30,35',
-    '123.4',
-    '123.46',
-    '123.77',
-    '123.94',
-    '123.9p',
-    '123/125',
-    '123/4',
-    '123/w',
-    '1230&ndash;1260',
-    '1230&ndash;1309',
     '1230&ndash;1430',
-    '1230&ndash;9',
-    '1232&ndash;1284',
-    '1232&ndash;1307',
-    '1232&ndash;4',
-    '1232&ndash;59',
-    '1233&ndash;40',
-    '1234&ndash;1244',
-    '1234\'',
-    '123456',
-    '1234567890',
-    '123456a',
-    '1235&ndash;1257',
-    '1235&ndash;1296',
-    '1235-x',
-    '12350',
     '1235789',
-    '1235987',
-    '1236&ndash;1294',
-    '1237&ndash;9',
-    '1238&ndash;1328',
-    '1238&ndash;46',
-    '123a',
-    '123bhp',
-    '123cm',
-    '123ff',
-    '123in',
-    '123mph',
-    '123p',
-    '124&mdash;125',
-    '124&ndash;135',
-    '124&ndash;32',
     '124&ndash;35',
-    '124&ndash;6',
-    '124(1)',
-    '124,080',
-    '124,342',
-    '124-',
-    '124-2',
-    '124-200',
-    '124-strong',
-    '124.2',
-    '124.2%',
-    '124.3',
-    '124.3p',
-    '124.4',
-    '124.6p',
-    '124.7',
     '124.8',
-    '124/50/91',
-    '124/77',
-    '124/78',
-    '1240&ndash;1275',
-    '1240&ndash;1304',
-    '1240-c.1291',
-    '1241&ndash;54',
-    '1241&ndash;65',
-    '12430',
-    '1244&ndash;5',
-    '1244&ndash;8',
-    '1245&ndash;56',
-    '124500',
-    '1245m',
-    '1246&ndash;1248',
     '12460',
-    '12467',
-    '1247&ndash;79',
-    '12478',
-    '1248&ndash',
-    '12481',
-    '124830',
-    '124896',
-    '1249&ndash;1301',
-    '1249&ndash;50',
-    '1249&ndash;59',
-    '12490',
-    '124940',
-    '124cm.',
-    '124p.',
-    '124p/kg',
     '124r.r.',
-    '124th',
-    '125&mdash;8',
-    '125&ndash;128cm',
-    '125&ndash;131',
-    '125&ndash;150',
-    '125&ndash;175g',
-    '125&ndash;200cc',
-    '125&ndash;2870',
-    '125&ndash;4721',
-    '125&ndash;7',
-    '125&ndash;8',
-    '125&ndash;84',
-    '125&rehy;year-old',
-    '125(1)',
-    '125,000&ndash;13,500',
     '125,000-mile',
-    '125,000-tonne',
-    '125,432',
-    '125,500',
-    '125-16',
-    '125-165',
-    '125-acre',
-    '125-odd',
-    '125-seat',
-    '125.2',
-    '125.2p',
-    '125.33',
-    '125.34-5',
-    '125.4',
-    '125.59',
-    '125.5p',
     '125.6%',
-    '125.8%',
-    '125.9',
-    '125/519',
-    '1250&ndash;1285',
-    '1250&ndash;900',
-    '1250-1500',
-    '12500',
-    '1250km',
-    '1250ma',
-    '1251&ndash;60',
-    '1251&ndash;74',
-    '1252&ndash;3',
-    '12524',
-    '1253&ndash;54',
-    '125300',
     '125343',
-    '1256&ndash;1302',
-    '1256&ndash;7',
-    '1256&ndash;8',
-    '1256&ndash;85',
-    '1256&ndash;9',
-    '1257&ndash;1379',
-    '1257&ndash;8',
-    '12570',
-    '1259&ndash;1294',
-    '1259&ndash;65',
-    '12593',
-    '125a',
-    '125bp',
-    '125cc-200cc',
-    '125f',
     '125ft(38m)',
-    '125g/4oz/&frac23',
-    '125g/4oz/&frac34',
-    '125g/4oz/2',
-    '125gr',
-    '125hp',
-    '125kg',
-    '125kjmol',
-    '125km',
-    '125lb/ft',
-    '125m',
-    '125mb',
-    '125mgdl',
-    '125mw',
-    '125myr',
-    '125t',
     '126&ndash;127',
-    '126&ndash;128',
-    '126&ndash;130cm',
-    '126&ndash;131',
-    '126&ndash;136',
-    '126&shilling;6d.',
-    '126,000,000',
-    '126,554',
-    '126,687',
-    '126,984',
-    '126-101',
-    '126-bed',
-    '126.3%',
-    '126.30p',
-    '126.5',
-    '126.6p',
     '126.9',
-    '1260&ndash;1278',
-    '1260&ndash;1322',
-    '1260&ndash;1327',
-    '1260&ndash;1390',
-    '1260&ndash;2',
-    '1260&ndash;70',
-    '126000',
-    '12601',
-    '1261&ndash;3',
-    '12610',
-    '1262/3',
-    '1263&ndash;1742',
-    '1263&ndash;5',
-    '1263/4',
-    '12634',
     '1265&ndash;81',
-    '12653m',
-    '1266-x',
-    '1267&mdash;1337',
-    '1267&ndash;8',
-    '126706',
-    '1268&ndash;1538',
-    '1268&ndash;72',
-    '1268&ndash;9',
-    '126f&ndash;g',
-    '126km',
-    '126lbs',
-    '126m',
-    '126p.',
-    '127%',
-    '127&ndash;128',
     '127&ndash;132',
-    '127&ndash;135cm',
-    '127&ndash;148',
-    '127&ndash;3',
-    '127&ndash;30',
-    '127&ndash;39',
-    '127&ndash;49',
-    '127&ndash;5',
-    '127&ndash;84',
-    '127,250',
-    '127,500',
-    '127,900',
-    '127-147',
-    '127-223',
-    '127-9',
-    '127-mile',
     '127-yard',
-    '127-year',
-    '127.0p',
-    '127.27',
-    '127.2p',
-    '127.5p',
-    '127.6&times;76.8',
-    '127.7',
-    '127.8',
-    '127.88',
-    '1270&ndash;2',
-    '1270&ndash;71',
-    '1270dpi',
-    '1270mm',
-    '1272&ndash;1337',
-    '1272&ndash;3',
     '1272&ndash;4',
-    '127391',
-    '1274&ndash;5',
-    '1275&ndash;1321',
-    '1275&ndash;1322',
-    '1275&ndash;1350',
-    '1275&ndash;1352',
-    '1275&ndash;8',
-    '1275&ndash;84',
-    '1275b',
-    '1275cc',
-    '127660',
-    '1277&ndash;1284',
-    '1277&ndash;1330',
-    '12779&ndash;81',
-    '1278&ndash;1283',
     '1278&ndash;87',
-    '1278&ndash;9',
-    '1278a25',
-    '1279&mdash;92',
-    '1279&ndash;1353',
-    '127:1',
-    '127ff',
-    '127hp',
-    '127pp',
-    '127x170cm',
-    '127x177cm',
-    '127x180cm',
-    '128&ndash;105',
-    '128&ndash;130',
-    '128&ndash;132',
-    '128&ndash;30',
     '128&ndash;36',
-    '128&ndash;6',
-    '128(1)',
-    '128+x',
-    '128+y',
-    '128,054',
-    '128,167',
-    '128,281',
-    '128,500',
-    '128,600',
-    '128-multiport',
-    '128-nozzle',
-    '128-port',
-    '128-year',
-    '128.1%',
-    '128.47p',
     '128.9',
-    '128/79',
-    '128/km',
-    '1280&ndash;1300',
-    '1280&ndash;1340',
-    '128000',
-    '1280c',
-    '1280o',
-    '1282&ndash;1321',
-    '1282/3',
-    '1282k',
-    '1283&ndash;1284',
-    '1283&ndash;1328',
-    '12840',
-    '1285&ndash;1319',
-    '1285&ndash;1331',
     '12850',
-    '1287&ndash;9',
-    '1289&ndash;90',
-    '1289&ndash;91',
-    '1289&ndash;93',
-    '128950',
-    '128i',
-    '128kbytes',
-    '128mhz',
-    '128pp.123',
-    '128th-ranked',
-    '129&mdash;30',
-    '129&ndash;1',
-    '129&ndash;152',
-    '129&ndash;30',
-    '129&ndash;34',
     '129&ndash;4',
-    '129&ndash;45',
-    '129(1)',
-    '129,300,000',
-    '129,578,000',
-    '129,765',
-    '129,920',
-    '129-130',
-    '129-signature',
-    '129.33',
-    '129.4%',
-    '129.70',
-    '129/olaxbalb/c',
-    '129/olaxc57bl/6',
-    '129/r',
-    '129/rl',
     '129/rl-',
-    '129/svxc57bl/6',
-    '1290&ndash;1',
-    '1290&ndash;1300',
-    '1290&ndash;1344',
-    '1290&ndash;1349',
-    '1290&ndash;1350',
-    '129000',
-    '1291&ndash;1347',
-    '1291&ndash;2',
-    '1291&ndash;4',
-    '1292&ndash;1342',
-    '1292&ndash;1369',
-    '1293-',
-    '1293.',
-    '12938',
     '1294&ndash;5',
-    '1295&ndash;1306',
-    '1295&ndash;1316',
-    '1295&ndash;1329',
-    '1295&ndash;6',
-    '1295&ndash;7',
-    '1296&ndash;1337',
-    '1296&ndash;7',
-    '1296&ndash;8',
-    '1296&ndash;9',
-    '1297&ndash;1307',
-    '1297&ndash;1308',
-    '1297&ndash;8',
-    '1297&ndash;9',
-    '1298&mdash;99',
-    '12980',
     '129bhp/ton',
-    '129e',
-    '129pp',
-    '12:00:15',
-    '12:00:26',
-    '12:01:08',
-    '12:01:34',
-    '12:01:38',
-    '12:03:12',
-    '12:03:33&ndash;0500',
-    '12:04:14',
-    '12:04:25',
-    '12:04:37',
-    '12:05:12',
-    '12:05:14',
-    '12:06',
     '12:06:08',
-    '12:06:10',
-    '12:06:26',
-    '12:06:54',
-    '12:07:35',
-    '12:09:47',
-    '12:1&ndash;12',
-    '12:1&ndash;20',
-    '12:1&ndash;9',
-    '12:10&ndash;20',
-    '12:10:23',
-    '12:10:36',
-    '12:10:50',
-    '12:11',
-    '12:11:46',
-    '12:12:28',
     '12:12ff',
-    '12:13&ndash;17',
-    '12:13:13',
-    '12:14:10',
-    '12:14:41',
-    '12:15&ndash;21',
-    '12:15:45',
-    '12:16:02',
-    '12:16:08',
-    '12:16:32',
-    '12:17:00',
-    '12:17:43',
-    '12:18&ndash;25',
-    '12:18&ndash;27',
-    '12:18:44',
-    '12:19:17',
     '12:19:57',
-    '12:20:20',
-    '12:20:24',
-    '12:20:31',
-    '12:20:53',
-    '12:20:59',
-    '12:21:09',
-    '12:21:33',
-    '12:22',
-    '12:22:53',
-    '12:22:54',
-    '12:23:09',
-    '12:23:17',
-    '12:24:28',
-    '12:24:33',
-    '12:25:12',
     '12:25:28&ndash;0500',
-    '12:26',
-    '12:26:16',
-    '12:26:36',
-    '12:27',
-    '12:27:01',
-    '12:27:10',
-    '12:28&ndash;34',
-    '12:28:32&ndash;0500',
-    '12:28:58',
-    '12:29',
-    '12:29&ndash;30',
-    '12:29.5',
-    '12:30:32',
-    '12:31:13',
-    '12:31:54',
     '12:34:06',
-    '12:34:11',
-    '12:34:47',
-    '12:35&ndash;36',
-    '12:35&ndash;37',
-    '12:37&ndash;13:21',
-    '12:37&ndash;19:25',
-    '12:37:17',
-    '12:38&ndash;40',
-    '12:38:03',
-    '12:38:16',
-    '12:38:27',
-    '12:39:59',
-    '12:3:3',
-    '12:4&ndash;6',
-    '12:40',
     '12:40:34&ndash;0500',
-    '12:40pm',
-    '12:41&ndash;44',
-    '12:41:31',
-    '12:41:41',
-    '12:41:52',
-    '12:42',
-    '12:42:57',
-    '12:42pm',
-    '12:43',
-    '12:43&ndash;45',
-    '12:43:58',
-    '12:44:06',
-    '12:45',
-    '12:45:14',
-    '12:46',
     '12:47:03',
-    '12:47:55',
-    '12:48',
-    '12:48:40',
-    '12:49',
-    '12:5',
-    '12:50am',
-    '12:52:55',
-    '12:53',
-    '12:53:21',
-    '12:53:27',
-    '12:53:51',
-    '12:54:45&ndash;0400',
-    '12:55:07',
-    '12:56:31',
-    '12:57',
     '12:57:18',
-    '12:57:39',
-    '12:58:42',
-    '12:58:50',
-    '12:59:30',
-    '12:6f',
-    '12:7f',
-    '12:8:1',
-    '12:9',
-    '12=very',
-    '12am',
-    '12ax7-ecc83',
-    '12ax7/ecc83s',
-    '12ax7as',
-    '12bay',
-    '12bp',
     '12cm&formula',
-    '12cm/4&frac12;in',
-    '12deg',
-    '12dh',
-    '12e',
-    '12f',
-    '12f.22',
-    '12game',
-    '12ghz',
-    '12gkm/30mls',
-    '12gph',
-    '12gw',
-    '12ha',
-    '12hr',
-    '12inch',
-    '12inches',
     '12j&auml;hrige',
-    '12k',
-    '12kb',
-    '12khz',
-    '12lb.s',
-    '12m&sup2/litre',
-    '12m.',
-    '12mg',
-    '12mg/kg',
-    '12microsoft',
-    '12midnight',
-    '12mm&ndash;25mm',
-    '12month',
-    '12ms',
-    '12mths',
-    '12mv/gauss',
     '12myr',
-    '12n/12s',
-    '12nm',
-    '12noon-4.30pm',
-    '12noon-4pm',
-    '12nts',
-    '12oz/&pound;4.99',
-    '12oz/&pound;6.75',
-    '12point',
-    '12pp',
-    '12ppm',
-    '12round',
-    '12s-13s',
-    '12s.0d.',
-    '12s.2d',
-    '12s.6d',
     '12sq.in.',
-    '12th-14th',
-    '12w',
-    '12x12&ins',
-    '12x17&ft',
-    '12x32',
-    '12year-olds',
-    '12z',
-    '13&frac12;in',
-    '13&frac12;oz',
-    '13&frac12;p',
-    '13&frac14',
-    '13&frac18;p',
-    '13&frac34&times;15&frac18&ins',
-    '13&ft;3&ins',
-    '13&ins;d',
     '13&mdash;15',
-    '13&mdash;19',
-    '13&mgr;g',
-    '13&micro;l',
-    '13&ndash;00',
-    '13&ndash;05',
-    '13&ndash;1&ndash;1877',
-    '13&ndash;1&ndash;1906',
-    '13&ndash;1&ndash;1908',
-    '13&ndash;1&ndash;50&ndash;0',
-    '13&ndash;10&ndash;1888',
-    '13&ndash;103',
-    '13&ndash;11&ndash;8',
-    '13&ndash;13&ndash;0',
-    '13&ndash;15&ndash;8',
-    '13&ndash;15cm/5&ndash;6in',
     '13&ndash;15hz',
-    '13&ndash;16-year-olds',
-    '13&ndash;17.11.89',
-    '13&ndash;18a',
-    '13&ndash;20:21',
-    '13&ndash;22',
-    '13&ndash;25',
-    '13&ndash;26',
-    '13&ndash;30',
-    '13&ndash;35',
-    '13&ndash;36',
-    '13&ndash;39',
-    '13&ndash;4%',
-    '13&ndash;41',
-    '13&ndash;42',
-    '13&ndash;49',
     '13&ndash;54',
-    '13&ndash;56',
-    '13&ndash;568',
-    '13&ndash;6&ndash;0',
-    '13&ndash;6&ndash;1866',
-    '13&ndash;60',
-    '13&ndash;69',
-    '13&ndash;year',
-    '13&percnt',
-    '13&plus;1',
-    '13&plus;6',
-    '13&prime;29&prime',
-    '13&times;10cm/5&times;4in',
-    '13\'',
-    '13\'s',
-    '13(14)',
     '13(3)county',
-    '13(6)',
-    '13(7)',
-    '13(c)',
-    '13+',
-    '13+2',
-    '13,00',
-    '13,000-plus',
-    '13,000-ton',
-    '13,000km',
-    '13,000lb',
-    '13,000mw',
-    '13,000rpm-plus',
-    '13,019',
-    '13,046',
-    '13,081,935',
     '13,100',
-    '13,116',
-    '13,14,15',
-    '13,14,16,29',
-    '13,15,17,20',
-    '13,150',
-    '13,155',
-    '13,156,288.6',
-    '13,16',
-    '13,162,992',
-    '13,166',
-    '13,170,000',
-    '13,200,000',
-    '13,200ft',
-    '13,205kg',
-    '13,21,38',
     '13,213',
-    '13,221',
-    '13,235',
-    '13,25',
-    '13,26',
-    '13,282',
-    '13,318',
-    '13,319',
-    '13,377',
-    '13,381',
-    '13,393',
-    '13,395,335',
-    '13,400',
-    '13,430',
-    '13,432',
-    '13,446',
     '13,500,000',
-    '13,500-strong',
-    '13,500ft',
-    '13,500opm',
-    '13,538',
-    '13,550',
-    '13,562,000',
-    '13,642',
-    '13,650',
-    '13,655',
-    '13,662',
-    '13,677',
-    '13,684lb',
-    '13,789',
-    '13,800',
-    '13,801',
     '13,849',
-    '13,865',
-    '13,870th',
-    '13,887',
-    '13,888',
-    '13,891',
-    '13,900',
-    '13,924',
-    '13,934',
-    '13,937,000',
-    '13,971',
-    '13,974,414',
-    '13-16lb',
-    '13-19',
-    '13-21',
-    '13-27',
     '13-4-93',
-    '13-5',
-    '13-6',
-    '13-9',
-    '13-ace',
-    '13-acre',
-    '13-and-a-half',
-    '13-aug.',
-    '13-count',
-    '13-country',
-    '13-durham',
-    '13-fold',
-    '13-foot',
-    '13-goal',
-    '13-handicap',
-    '13-in',
     '13-j5',
-    '13-kilobase',
-    '13-km',
-    '13-km/8-ml',
-    '13-knot',
-    '13-mers',
-    '13-metre',
-    '13-million-square-kilometre',
-    '13-million-strong',
-    '13-over-par',
-    '13-race',
-    '13-slot',
-    '13-stone',
-    '13-storey',
-    '13-stringed',
-    '13-ton',
     '13-try',
-    '13-union',
-    '13-week-old',
-    '13-weeks',
-    '13-word',
-    '13-years-old',
-    '13-years-olds',
-    '13.0&ndash;53.7',
-    '13.00&ndash;16.30',
-    '13.00&ndash;17.00',
-    '13.00&ndash;18.00',
-    '13.00-18.00',
-    '13.01',
-    '13.03',
-    '13.04secs',
-    '13.09',
     '13.0p',
-    '13.1(b)',
-    '13.1.1',
-    '13.1.2',
-    '13.1.89',
-    '13.1.93',
-    '13.1.94',
-    '13.10&mdash;13.13',
-    '13.10.1',
-    '13.10.2',
-    '13.10.78',
-    '13.11.',
-    '13.12.2',
-    '13.12.3',
-    '13.12.88',
-    '13.125',
     '13.13%',
-    '13.13.1',
-    '13.13.3',
-    '13.14.0',
-    '13.14.1',
-    '13.14.2',
-    '13.14.3',
-    '13.14secs',
-    '13.19&ndash;22',
-    '13.1p',
-    '13.2&deg;c',
-    '13.2(a)',
-    '13.2(b)',
-    '13.2.13',
-    '13.2.2.1',
-    '13.2.2.2',
     '13.2.2.3',
-    '13.2.8',
-    '13.2.92',
-    '13.25%',
-    '13.25p',
-    '13.29p',
-    '13.2hh',
-    '13.3&ndash;16.6km/8&frac14&ndash;10&frac14;mls',
-    '13.3(a)',
-    '13.3.1.1',
-    '13.3.17',
-    '13.3.18.4',
-    '13.30%',
-    '13.30hrs',
-    '13.31',
-    '13.319&mdash;320',
     '13.32p',
-    '13.33&mgr;m',
-    '13.34',
-    '13.39',
-    '13.39p/litre',
-    '13.3bn',
-    '13.4&deg;x6.3&deg',
-    '13.4.1',
-    '13.4.2',
-    '13.45&ndash;6',
-    '13.49',
-    '13.4cm',
-    '13.4m',
-    '13.4mt',
-    '13.4pc',
-    '13.5%of',
     '13.5&ndash;22',
-    '13.5&ndash;61.5',
-    '13.5&times;38.5',
-    '13.5-acre',
-    '13.5.1',
-    '13.5.89',
-    '13.51',
-    '13.52',
-    '13.54',
-    '13.55',
-    '13.57p',
-    '13.5h',
-    '13.5in',
-    '13.5km',
-    '13.6.2',
-    '13.6.3',
     '13.6.5',
-    '13.6.6',
-    '13.6.7',
-    '13.6.88',
-    '13.6.9',
-    '13.625%',
+)
+
+blocks_97 = (
+    '1"kg.%300cc/$20kg,%2,000%"\'s%4,000&ndash;1,200,000)$,000)*-1,500,000*"mw)!t%"-1&&bomber&\'calorie&&gallon&"lb',
+    '\'#ile\'!w&&number&#odd&%pupil&$seat\'(ignature&#the\'%o-one(#nne&$watt&1year-out-of-print*%s-old%!.%"cc',
+    '%!g%"m2&"bq&#ile&"pc&"yr%"nm%!p&%.p.m.&!g%#rpm%"va%$yrbp$!2$%4,353',
+    '%!m$%5,500$!7%\',856.16$$9.6%$$bomb#&10,000$$1.9m$#2.5$!3%(-hectare$!4%\',621.23%\'-member$!5',
+    '#"20%8,304,050,607,080,910,100$$1.9m$&4-node%!k&!b%"mb$!5$$7.7%#"31%"ft$%3,000%\'-member%".7$!4',
+    '$$7.1%$!8#"40%$,000&#325$!1$!2$$7lbs$!8%$,000&#185$!9#&50,000%!g$%2,000',
+    '$!4$#5.4%"hp$!6%$,000$%7,000\'"30&#833$!8#&60,000%#.50%!m$!1$%2,000$%4,906',
+    '$%7,170$$9.5%##70k%!m$!2%!%$!4%$,500$#5sq$%7,000$!8#&80,001&#100$%1,000&#600',
+    '$!4$%5,000%!m$!6$!7#&90,460$%1,942$!5$!6$!7$!9"81\'-dioctadecyl-3,3,3\',3\'#",0$A1-trichloro-2,2,2-trifluoroethane$#2,3',
+    '##00%%.&ndash;1,200kg%%-acre&"km&&member&$room&%space\'!q\'%trong%!c%"ft%"kg%#rpm$!1$!2',
+    '\'"99$%6,000$)7&ndash;8%".2$!8$!9#"11%$,000$)2,298,677$!3$%5,963$!6%#-bp$#9.2#$2-14',
+    '$%0,517$!2$"3p$!4%$,000$%6,181$"8m#$30kg$%3,000$%4,220%!p%"th$!7$)9,100,000#"40',
+    '$!1$!2$!4$(5-branch$!8#&50,000%\'-gallon&$mile&%piece$%1,411%#439$%3,300&#502%!p$&4g/day',
+    '$!7%$,000%".5$!9%!m#060&ndash;1,250hp%$,000%!p$!1%".2$!2$!5$!6%$,000%&-1,008',
+    '%!m$!9#&70,000$!1%%-mile%!p$!2$"5p$%6,175$#8.8$!9#&80,000$$2.4%$!5$!6',
+    '$!9#&90,000%&70yrbp%%p.p.m$"39$!4%".3$!6%".5%!1$"75%!9$%8,000%!2$!9',
+    '$)3,4,5,6,9*!7+1,9,11,15,20,25,30($6,12&#5,7\'.-dithiadiazole&#6,7%!.$#6,7#3-dibromoethane.this&/methylhydrazine&\'sulphur&-thiadiazolium3!s$&isomer',
+    '$%rings#%00&ft%&-2,000&$acre&$mile&$plus%!0%"bp%"cc%"hz%$kbps&)g/2,645lb%"mm%!p%!v',
+    '$%2,000#"10$!1$%2,898$!3%$,073$#4ft$!5$%7,000$!9#&20,000$!1$&3g/day$!4$"5%',
+    '$#7km#&30,262$%2,750$!4$!6$!7$!9#&40,937%"km$%1,000$!3$!5$$6.83$!7$%8,900',
+    '%$,000#&50,600%"kg%"lb$!1$$2.51$!5$%6,000%!m#&60,000$!1%$,000$%2,000%"nd$!5',
+    '$!7$!9#"70%$,000$!1$!4$%5,000&#830$&8g/day$%9,212#$80km%!m$!2$!4%!%',
+    '$!5%$&deg$!7$!8#"91$%4,388$%5,029$%8,000&#538""3%#",2%0,4-dithiadiazole4#ium$&4,9,26$%5,7,9',
+    '#*-compounds$/dithiadiazolium3!s$\'isomers$(radicals%$ings##00%%$&deg)";c&+ndash;1,600%&-1,500&$acre&&member&#ton%!0',
+    '%"lb$"1.$!3%$,469$%4,365$!6#$1,36$%0,000%)-megawatt$#2ft$!7%%g/day#"20$!1$%2,000',
+    '%#kms$#5hp$!7$!9#"30$%2,000$!3$!8$!9#&41,247$!4%!%%$,639$!5$%7,636',
+    '$&9-page##50g&$/3lb&"ph$!1$!2$%3,000$!7$%8,000$!9#"60%$,000%"cc%"kg$!2',
+    '$%4,788%!p$!5$!8$!9#&70,000%%-mile$%1,632$!2$!4%$,000$!5%#.25$!6%$,000',
+    '#!8$%2,000$!3$%5,300%#kms$$8.32#"90$!4%$,000%#.32%"ft$%5,000$!8%$,330$#9.8',
+    '"!4#0,5-trisphosphate$$7,10$!9#!-$(addition$Ddiacetoxymercuri-2,3-dimethoxybutane&Ahydro-4-oxo-3-quinolinecarboxylic#(00-1,500(#600&#bed&&strong&$word&(year-old%\'ft-high',
+    '$%2,000&#515$$4.98$%5,000$)6,796just$%7,774$!8%#.26#"13%#.15$!5$!6$!7$!8#"20',
+    '&"91%%g/day$!2$!4%#shp$!5$!6$%8,500##30m$$1.85$!3$!4%$,000$!6$!7',
+    '$!9#&40,000%\'-member&$vote%#mhz$-1&ndash;1,449$!2$%3,000$!7$%8,000#&50,000%"hp%)km/900mls$!3$!4',
+    '$!9#(60-metre$!1%"st$!4$!6%"ft$!8#"71$!2$!3$!5%$,000$#6ft$!7',
+    '#&80,000%!p$!1$$3.58$%6,000$!7%#.07$!8$!9#"90$!1$!5$$6.69$!7"%5,1,3',
+    '#--bisphosphate#+00&shilling%!+%*,000-piece%$-bus&$foot&)kilometre&%metre\'#ile&$page&$seat&$watt\'#ord&(year-old%"db',
+    '%#mhz&!s%"pc%"sq%!w$!1#"10$!4%$,025$!5$!7$%8,764#"22$!5%$,410',
+    '$!9%$,000&#188%#.70#&30,269%\'-strong$!1$%4,122$!5$!7#"41$!3%%1,382%!m$%4,000',
+    '$%7,000$&8-acre%"ft$!9#(50-tonne$!1$!2$!4$!6$!8#$65.2$%6,000$!9#"70$%3,000',
+    '%$,130$%5,637$!6%$,640$!7%".8$%9,671#"81$!2$!3$!4%$,482$!5%$,495%"hz',
+    '$$9.34#"91$"2m$!5$!9"$6,21$!7#.00&ndash;2,000.#500%4,000&ndash;1,800,000%%-page%!0%"cc%-g/3&frac12;lb%#kms',
+    '%!w$#2.4$!3$!5$!7%$,000$!8$%9,788#$11.6%!m$$2.78$!3%#.27$!4$$6.21',
+    '&#556$!8$!9#&21,000$!4$%6,220$!8#"30$!1%$,631$!2$!3$)6,630,000$!7$!8',
+    '%$,369#%40&ft%$,000$&1-base$!3$!4$!5#&50,000$"2m$%4,994$!5$#6.6$$8.12$!9#"61',
+    '$%5,960$%6,993#&72,000$!3%$,000$%5,805#&80,000$!2$%7,200$!8#&90,000$!2%$,000$!4%$,930',
+    '$!7%"cc$%8,221"57&ndash;9,13&ndash;15#$,5,4#600,000&ndash;2,500,000(!1%#ft.%#rpm%!t$#4ft$!5$%7,000#"14$!5',
+    '#%20.00$!1$%2,000$%5,000$!7$!9#$30.4%"hp$!2%$,000$%7,000$$8.41#"40%&-metre$!1',
+    '$!2$#3.4$!5#$50ft$!4$#5.8$!6$!8#"63%$,000$"5%$!9%"cc#"70%$,000',
+    '&!5$!3%".2$$4.80$#5.6$!7$!9#"80$#2.8$!5$!6%$,000$!8#"90$!1',
+    '$#3.1%"th$!4%"kg$!6%".7$!8$%9,146"!8#!-$7naphthyridonecarboxylic##00%%,&ndash;1,900%&-2,000&$acre',
+    '%!0%%g/4lb%#lbs%#rpm$!6%"ft$!8#"10%$,000$!4$!5%$,670$%6,421$!7%".7',
+    '%".0$!9#"21$$2.50&!9$%4,000$%7,306#"31$!4%#.83$!5%$,421$!6$%7,500$!9',
+    '$!2%"nd$!5$!7%$,000&#310$!8#!5$!3$#7.8$\'9,119ff#"60%"cc%!m$!3',
+    '$!6%".2#"72$!4$!5$!6%$,957%#.24&!9$!7#"82$!4$%5,000$!6%!m',
+    '%".2$!2$!5%$0/91$!6$!8$!9"!9#-00,00-hectare%)-capacity&$page\'$upil&(year-old%"ft%(lb/860kg',
+    '$%7,000$!8#"16$!7$!8%#.41$!9%$,000&#338#&20kbps$!1$%3,520$!6$!8#"31',
+    '#"41$$2.73$!5$!8%!m$!9##50%$!1$!6$%8,660#%61.74$!3%$,528&#909$!4',
+    '$!9#&72,416$"4b$!5$-7&ndash;2,461$"8%%#.38#.80&ndash;1,985$!1$!3$%4kbps%"lb$#5.8$!7%#.30',
+    '$!9#"90$!2$!3$!6$!9!--&frac12&thgr#%mgr;m"L(2,4-difluorophenyl)-azaquinolone-carboxylic74quinolone-carboxylic"$00pm#$3-48#!a"#1-1#$0-15',
+    '#!2#!4$!7#$63/8#\'7galway"$2-3-#"00#!1#"pm#$tbsp"$3-03$"93""4%#$4-30""50',
+    '""65#!9""78")850830282#*78058-25-8)$37-1)$61-4*#3-0"!9#!8#"90"#a-m#(damantyl#"ll$#pha',
+    '##ryl"$beta"9chloro-2,4-dinitrobenzene#(omponent#)ycloalkyl\'jpropyl-6-fluoro-1,4-dihydro-4-oxo-7-(1-piperazinyl)-3-quinoline-carboxylic.4quinolone-carboxylic"#day#2eoxymannojirimycin$/soxynojirimycin##own"-ethoxypentane%Hyl-3(3-dimethylaminopropyl)-carbodiimide""ff##oot',
+    '"*heteroaryl#3ydroxyanthraquinone#!z"%in-17%!2&!0%#300&!3%#500%%eight"&jan-90\'!2")kilometre"#lb.$,/&pound;8.50',
+    '"#may#Methyl-1,4-dihydro-4-oxo-3-quinolinecarboxylic)C4-phenyl-1,2,5,6-tetrahydropyridine%\'re-wide#%inute#!m$%-long"9naphthylamine-7-sulphonic#"il"Co-alkyl-sn-glycero-3-phosphocholine##n-1#&ver-3s"$page#%refix"!s',
+    '$&earoyl$#yle"!t#"op"-unsubstituted#"ps"(year-old(#nly!&.0&ins$%mgr;g(!m$*ndash;1.2%,"3%,"5%+!0',
+    '*#3.0*#4.7*#7.1#$-2.5&!8$%litre$*to-solaris#".3#,0&ndash;2.55$%,0.61$#.38$!0%"00&!2$"15',
+    '$!7%!5$"95$&:david%#top$\'=0.9166%(292.6197%&53,733%!7%"ad%\'epounds%"ld%"md%"rs%$taka',
+    '$$a.m.$"mm%!s&!.$!p%.m&ndash;4.00pm#"1%$".3$!4%!7$!p#$2.24%"35$!1%)&ndash;23',
+    '#$3.08$"0%$$33,1$!9$!p%!m#"4%$"ms$"pm#"55$!6$"am$"gb$!p$#sec',
+    '$#.98$&25gbps$!5%"67$!8#"7m##897$!m#$9565$!m$"pm$#sex#!a$"tm#"gb',
+    '#!l#$mg/l$!m#$p.m.$"pm"\'1&aring$%deg;c$#ins$(ndash;94$(times;10##(a)#&-based#%.1.27$#2.1&!2',
+    '$!7%!9$"88%!9$!9%!1%!3#.0&ndash;2.05pm$#.13%!2&!9%"90$#0kg$"26$!7',
+    '$!a%!m$!h$!m$"pm#,1&ndash;2.00$%.1(i)%!2%!4%!5%!8%!9&!1&!3$#661',
+    '$!b$!c$!d#&2-fold$".1%!2$%/1.19$#5ft$!p#"3%$".6$"1e$!7$#ft.$#kpa',
+    '%"61$!2$!p#"5%$+&ndash;1.45+$2.30$".1$!1$!4$!5$":1%"if%&wonder$"lt$!m',
+    '$!p#$6(a)$".3&!8%!4$!3$!p#"75$!m#$8.27$"86$%p/kwh#$92:1$!4#!b',
+    '$!.#!k$!b$!g#!l$"tr#"ms#!p$\'.p.b.v.##sec&!s##x10#!z"\'2&deg;c$*ndash;1.3%',
+    ',"8m*!3+".1,!7*#6.6*#8.4$)times;the##(b)$"i)#!-$"kb#%.1(i)%$.1.1&!2%!0',
+    '$"54&!.$!7$!8#"05$!6$&:david%$this#"1%$$.010%"14$\'4+0.036#&2-1.49$#.65$#2:1',
+    '$"pc#"35$!6%&+0.051$#e+8$"kg#-4&ndash;2.85m$!0$!1$"am$!p#,5&ndash;1.50$+-centimetre$#.41$\':wonder',
+    '$#e11$"kg$"ml%!m$"sq#$6.90#"7%#"8%$#.52$!0#$9.32$!1$!m#$:1.0#!b',
+    '#"ff#$gbps$%flops$!w##iii$!n$!v#!k$!m%!.$!w#\'litre/2#&mb/sec%"ps$"hz',
+    '#!s##x10"#3%.#*&ndash;0.7*#1.7*#2.5##(b)#$,1.4$#6,9#!-$#1.7$#8.0$&gflops$"kb#$.1.1',
+    '#\'0&ndash*%;2.15+!3,&.30pm.,"pm$$-5pm$#.05$\'/5.35pm$%32131$!6$+:impressive%(talented&$hese$#am.$,pm&ndash;5pm',
+    '\'&4.30pm&\'/5.35pm#"1%#,2&ndash;2.08$#p.m%"ts#*5&times;10$%-kilo$":a$"gb$"kg#"66$"kg$!p#"7%',
+    '+$3.85$#.86$!0$"5m#"8%#$9.13%"56$!p#"ff#"gl#"kb#&mb/sec$!g$!m##x10',
+    '$)ndash;2.3,!4*#3.5#$,1.6#%-fold$"kb%!g$&litres#%.1869$"24$+3&mdash;but$#6.1&!2&!3&!4',
+    '%#(i)$"92%"4.%!5#$0pm.#"1%$#0/l%":1$!4$!p#%2%/yr#"31$!2$!c$!m',
+    '$"10$!m$"oz$!p#$5.46$$/6pm$*:improving%#kim%#the$$p.m.%(m/6.00pm#*6&ndash;47$!m#\'7&mgr;m$"80',
+    '$!m##820$"43%!9$!9$"m.#$9.35%"43$"70#":1%".0#!c#!e#!f#!g',
+    '$!b$"hz#!h#"kb$!w#!l$!x#!n#"rt##sec#!v"\'5%-2.6%#&&deg;c$%mgr;g%&icro;l',
+    '*"2%+"mg*"35*#4.5-&&deg;c+!p*\'5&mgr;m*!7$(times;10*!3##(b)#&-&gt;2$".5$!2%!%',
+    '&!5$$fold$"kb$#ltr$"ml#".0$"1.%!1%!2%!6$&2party$!7%%party$!9#*/1000/year',
+    '$%/2.00$"am$!p$#x10$!z#"1%$"28$"50$"70%!4$"82$"98#$2.65%"76$%/1.83',
+    '$"5p$"80$!p$#x10#"3%$".6$!9#$4.02$"38$"56$"73$!8$"oz$"pc#"5.',
+    '%!1$"78$+:impressive%%nicky%$this$"am#,7&ndash;2.64$#.40#&8-2.11#"9p##cm.%+/&frac12;in#!d$#egs#!e',
+    '#$gbps#$hz/s#!i#.kg/3&frac12;lb(1ndash;3&frac12;lb\'"lb##lbs#&mb/sec$!l$!s#(oz/sq.yd#"sq#!t$%/acre$!d',
+    '$$28cm"-6&ndash;1.8kg*#2.8*#3.9*$4.3%*36.4kml/1&ndash;4mls#!-$"kb$"mm#&.1(ii)$"74$!8%!8#"00$!m',
+    '$#0/l$"5m$#6ff$"80$#sec#-5&ndash;1.85m$"0p$"kg$"mm$!v##75m$!m#%8&deg$!0##92p',
+    '$!m#!a#!c#!e#!g$!b$$flop(!s##h-j$!z#"kb$!m#"ls#(p.p.b.v.#"sa',
+    '#)treatment#!w#"xl",7&ndash;1.10*#2.1#%-fold$"kb%\'ilobase$$mile$&square#$.1.1&!2&!3&!4$$2(v)',
+    '&!3&!4$#3.1&!2&!3$!4$!6#"00$!7#"1%$!7$!c$"pc##2.4$"15',
+    '$!7$"oz$!p#)3&ndash;1$!2#"4%#)5&ndash;2$&-metre$!4$!7$!g$.kg/3&frac12;lb\'#4lb$#lbs%&itre/3',
+    '$!p#%7&ins#"8m#"94$!p#":1#\'billion#"ft#"kb#"mm"%8&deg$*ndash;1.13*#2.5$&percnt#"\'s',
+    '$"kb$%metre)\'-square#".3$!6#$/2.8#,0&ndash;4.00$%0.000#!1$!p#"2m#"3%$&/2.44m$!m$#x10',
+    '#&5-mile$,.19&mdash;21$"23$!m$!p$#x10#,6&ndash;4.62$!m$"pc#%7&ins$!5$!9#&8-acre%!m$!4',
+    '##9oz##a-g#"gw#!h##j-k#!k$!b$!g$"hz$"pc#!l##m/6$&illion##sec&!s',
+    '"#9%.#*&ndash;3.4*%66.7%#!-#".1%!1%!2%!3%!4%!7$!2$$3(i)$!4%#(i)$!6',
+    '$"87$!9%!.##0.1%#5cm##279$!p##466#"5%$"-4$"17#$6992#"8%$!0$!3',
+    '$)9&micro;f$!p#!a#)b,h,i,n,t#%c,o,u#!d$(-f,1.10c#!g$"hz#!i##j-1#"kb$%g/4lb$!m#!l',
+    '#"ps#!v##x10!)/&radic;2"!0#!2#!6"%1,000#%0,000$,/84-31/12/87&)8-31/9/92$+0,000,000th%"00%"th$!d',
+    '$!d#%2,000$#/92#!3#!5$+&ndash;1/50$!0$!a$!b#!7$!3#"86#!9$!0""2%',
+    '#%-hour$$inch$(year-old#$/3/4$"85%!6#"01$"th#!1#!2#"50#"69#"73##ins#\'million',
+    '#"pt#"st##vrf"$3/87$"93#%0,000##2in#"38#!5#!p#"rd$"pm#!s"%4&ins$+ndash;1/2in',
+    '##/93#"71$!5#"90$"50$!8#!m#!p"%5,000##/41#\'0,000th$!0%!0%"th$!1',
+    '##40b#079,22/600,42/620#"th""6.##/41#$4th.#!6#!9"!7#"29#"43#!7""84#"hp"$9/60',
+    '#"53#(6-stater#!8"$cash"$draw"\'history"$jg77"#key"#lay"!m#!y"#njg""on#!s"\'pantone',
+    '#%unday"#the#&rainee"%value!,0%&ndash;20%#$-12%#!.#,/0.97=10.31%#!o#$plus"*&amp;sup13+"5-+!8*!4*!5',
+    '+!0$\'ring;u.#$cent#2deg&ndash;15&deg;c&(;-25&deg\'*c/50&deg;f\'!n\'$wide$%ollar#\'frac12%)\'&amp;in)&;-mile,(onth-old*!d*#ins',
+    ')";p\'.34&times;8&ins)#;sq$-t&times;12&ft,%20&ft#&lt;p7m#1mdash;12&frac12;p*!5+!%*!9)#20p)$bull$$gr;l$$icro(%;g/dl',
+    '#/ndash;0&ndash;0*!1*!4*!7*!8)21&ndash;33&ndash;1*#0.5-&d.p.c.+\'0&mgr;a,!0,!g,!m,$ngml**1&ndash;12+*-year-olds',
+    '+,/404&ndash;5+"hz*\'2&mgr;m,\'ndash;0+"in+"mm*#3cm+!s*\'4&deg;c+*-year-olds*\'5&mgr;m,\'ndash;0+)-year-old+\'/100000+!g',
+    '+#min+#ppm*\'6&deg;c))2&ndash;0*(.8&aring*\'0&deg;c+$,000+":1+"cm-!s+"km+!m,!m+!s*"1%',
+    '+!%*!8*!j)23&ndash;27&ndash;0*#0am*!2*!6*!9)$4(a)+"b)*#0hz*!7))5&ndash;0*!-*#0mg',
+    '*"5%*!8))6&ndash;8*#(a)+"c)))7&ndash;0*#(a)*"0%)"80*!8)"90)(december)#in.)#jan##ohm',
+    '#.rehy;month-old("nm($year#%times(";1*%1&ins*%6&ins)#20m*!5+!b)#330)%8&ins"$(10)$"1)#$50g)',
+    '##co)#"d)",,000&micro;f\',ndash;15,000-\'400,000\')rehy;mile&\'(o0.1)=&!+&(,000,000&"-1(%1,000(%2,000\'$acre\'"ft\'&gallon',
+    '\'/run/1000-wicket\'&seater($q-km)$uare&!g&"kg&&strong&$yrbp%.1&ndash;17,000%!4$"10$%25.07$&30,000$"42%!4',
+    '$&84,885#*1&ndash;42$$0.25%!2$$1,13$"21$!3%#8kg$!4%%9,000$\'5,31,32%%0,000%%4,000%!9$!6',
+    '$"78#"20%!4%!9$&21,700%!2$!5%!0$"81%%7,938$"99#\'300,000&#tyr%!9$"37',
+    '$"80$&94,000#!4$"03$"12%!9$"45%!6$"67$"70%!3$"87$&90,000%%5,000#\'500,000',
+    '&!0$"35$"45%!7$"53%!4$"61%!2$"76$"89#\'600,000$"14%!5$"20%%2,696',
+    '$"35%!9$"50$"69$"78$"89$"91#"71$"29$#39%$"50%!2%!9$"73$"81',
+    '$"18$"33$&50,000$&60,000$"82##900$"13$&20,000$&48,468&%-foot$"50"*-&ndash;15#"10%&-02-13&%10-10',
+    '$#2ft$#3ft%"lb$"5c#&2-10-4%"93$"0%%"pc$!3$!6$!7%#-90#"32##4pm##5-1',
+    '%!3%!4%"91##7-1%!2%!3$#0cm#&a-side$#cre#$band%$rrel$&edroom$)illionths$(racknell#%child',
+    '$#lub$%olour#!d$"ab%%y-old$#ose#(employee$!r#\'footers%%r-one#+giganeurone$#oal#\'hectare$(iroshima$$orse',
+    '#"kb$"ey$!m$!w$"yr#$l(a)$#ane&%guage$#ine%#tre#$mark%&y-1990$&egaton$!g$$iles',
+    '$(olecular%,nth&rehy;old(!s$#ton$$usic$!w#&nation#$oct.$#nly$(ut-of-10#$pack$%erson$$ixel$#lus##rod',
+    '\'"ed#!s$%creen$#eat%!t$(heffield%&illing%"ot$,ite-licensed$&tation%$ring)"ed&#oke#$team$$imes',
+    '$!o%#-11%!p$"ry##way$$heel$$orth#(year-lag\'"ly\'%s-old"-.0&micro;g/ml$/0&ndash;11.30am/"400!5-$2.00',
+    '-$6.00-$7.20/"45-$8.30/"45-$9.30,$6.00,$8.00%&,10.25%*/8.23/8.54%.0&ndash;20.000%%17.00%/am&ndash;1.00pm.(4.00p.m..&8.00pm',
+    '%$p.m.$"1%$#4am$#5am$"8%%!b$&d.p.c.#,1&ndash;10.4%*times;14.6$!.%!2%!3%!4%!5%!6',
+    '&!5$"/4$$0(b)%2.94&ndash;16.12.94%!3$.10.56&mdash;72%-6.258&mdash;9%!b%$secs$$4(a)&"b)&"c)&"d)%!9$*5am-4.30pm',
+    '$$6(a)&"b)%!p$$8.13&!7$!a$!m$!p%!c#,2&ndash;54.2$%.1866%!6%!7$#1.1%!p',
+    '$#5am%"pc$$6sec$"7p$#8am$"gb$!m%"pg##3.5%!6%!7%"93$-0&ndash;11.30-$6.30-$7.00',
+    ',$4.00-"pm,$5.00."30%(-11.30am%0am&ndash;12.15pm.&2.30pm.#4pm%$p.m.$#1am$*2&ndash;34%+.7&ndash;52$"4%$#5pm$#6am',
+    '$"80#$4(a)%"c)$%-fold%"in$".1&#984%!3%!6%!7$#015%"am%"pc&"m.$"5.',
+    '$"bn$"cm$"gb$!m$!p%!c#05&ndash;12p.p.m.+#9.5.#myr%,times;14.8cm$#(b)$!.%!1%!2%!4',
+    '$#0am$\'3&deg;c$"97$":1$"in$"oz$!v##6.1%!2%!3$!1$$2,63$#383$"5%%"pc',
+    '$$secs#)7-million$#.10%#2.3%!5%!7&".2%!8%!9$"3%$!6$!c$!p#%8&deg%#ins',
+    '&!1&!2&!3%!2%!3%!4$"0%%!p$!2$!3$"5%$"6m$$70mm$!9%!m',
+    '$"pc#*9&ndash;12$#(a)$#.92$!3$"5%%"27$!8$"9%%"pc$#mpg$"oz$"pc""/0#$10th',
+    '$$2/74%!2$"54%"cm$!7$!8#&2/1990%"41#!3$#/41$!6$"78#$5/41$!3#!6',
+    '$!2$!4$"d.#&74/vmf#$8/92$!6$!7#"90$!2$!3##the"#0%\'$\'-backed%%rated#-&amp;degree:c',
+    '%(ivide;90$\'mdash;2*!4*!5%$gr;g(!l%&icro;g+#/mg*\'mol/l/l$+ndash;1,000+!0,"00,!3,!5,!8',
+    '+"10-!%-"cm-!g,#2cm,!5+"25-!0+!5,"0m+"99*\'200,000-#a/9-#lbs-"ms',
+    '+"40+!7*!3+!0,&0-fold*#435+!5+#721*%500mm*)600&deg;c*"86$&plus;6$-rehy;per-cent$&sol;60$*times;25mm',
+    '#&(1.07)##+mb##,00&/0&ndash;150,000/&60,000/&81,500(0rehy;circulation\'!-(\'120,000)&54,000)&70,000(\'250,000(&dollar($word\'!s',
+    '$#165$#297$!6$%800ff$#944#$-120%!7&!0$#250$#300$$4-ss$#500$!7$)acre-plus(!s',
+    '%!p%%ranch$#ca.%$over$&degree%%ollar%&rachma$$feet%0ields-per-second$!g%"un$*horsepower&"ur%!r$"km',
+    '$*metre-high%"hz%+ips/10-watt%!m%"ph$$node$%point&$unds%$roof$$room%"un$!s%#hot%%q-km.$%tonne',
+    '&#uck$$volt$&wicket#S.000.000.000.000.000.000.000.000.000.000.000.000,00$"1%$"21%!4%!5$"4f$!5%!%%"3p%!8%!9%"p.',
+    '$#75%$"85$!9#$/102&!9%"10$%394.5$#719#20&ndash;1050&deg;f-"66,#100,#600+$2500+$3000,!5',
+    '+&999999%$plus%%times$"-1%$2000%$acre%(capacity%"km%*light-year%(megawatt\'#tre%#odd%&storey\'$rong%$type',
+    ')$-old$#.00$%/1592%#200%!5&"00$-0&ndash;11000&%times$"11$#3/1$!5$"87$!9$":1$#asa',
+    '$"ha%"rs%!z$%kcals$#mhz$"n.$#ppm$#ths$!y#)1&ndash;8$-0&ndash;10052$!9$!m$"st#*2&mdash;24',
+    '$".4$!0$!2$"30$"88#,3&ndash;7180$#.1x%"2a%!3%#4/d%.7.1-compatible$!0$"18#,4&ndash;1005+"30',
+    '%!2%!4$"85$!m#*5&mdash;34$"45#*6&mdash;42$".1$#x11#*7&ndash;78$)d&ndash;e#)8&mdash;9$!0$!a#*9&ndash;11',
+    '%!2%!3#$a(3)$"sa#"bp#$cxii#"db$"pi#!e#\'ft-wide#-g/3&frac12;oz%!4$"ev$!m$!n',
+    '&"nd#"in%$ches#%kcals$"ms$"va#!l$!t#,m-transistor$!.$%cg/kg$%etres$!g%&/litre$\'m(wash)',
+    '%"na%#oll%!s$!v$)w/channel#"nx##per$#lus$!p%!m#"rb$#evs$#oom#$seat$!t',
+    '#+th-birthday#$ug/l#%v/div$!a#$watt#*x100&mgr;m%#5km$#2mm#!y$\'ear-old%!t"%1&deg$(ndash;03*#141*$2245',
+    '*!3+!4*!5*!8$\'plus;16$3times;82&times;35mm##(2)#$,201$#400%"75$#526%"57$#800#"-9$$ball',
+    '#".0%!3%!5$"1%$!3$"4%%%72mph%!m$!5%"5%%"9%$"64%!p$!8$&900mph',
+    '$!4$&722:75##0/1$!0$411010011000011000000$!a$!b$!m#&1.30am$,5&ndash;0050#&2/1604$!0#,3&ndash;1014,!4$".2',
+    '$"39$!h#*4&mdash;15%(ndash;24+"42$!.$!a##5.5$$7/91$"91$!b$!g#*6&mdash;51$%/1608$!0',
+    '$!b#*7&mdash;22+"35%(ndash;18$!5%!4$"70#$8576#&9/1161$!0$!9#\':725:77##ers#"ff##lbf',
+    '$!c#(year-old"%2&deg\'";f$(ndash;08*#114+!6*!2*"38*!4*!6*!8*"90##(2)#-,000-capacity',
+    '$#350$#600$#800%"20%"75%"90#)-96-112cm$&nation$&strong#$.095$"1%$#4ms%!p$!5%!%',
+    '%!3$!6$!7$"9%#%/1416#)0&mdash;4%*ndash;1077,#101$!0$"kg$%x1022#"1m#"2h#"3a#*4&mdash;39',
+    '$%-fold$%/1229$!g$#ste$!x#"5b#)6&mdash;7$!.$!0#*7&mdash;35%(ndash;34##810$"84%!6#*9e&ndash;f',
+    '#"cm##ins#&mm/4in$"ph#$p/kg"*3&mdash;13*!7$(ndash;10,!4,!5,!7+!2*!4*!8+!0',
+    '$&plus;5##(3)%#6%)$"5)#(,000,000%"76&!8$#244$#300$#415$#500%!7$#600$#823%"94',
+    '$"97$&branch$#key$&member$&nation##.01$+15&ndash;16$!2%!%%"3%%!7%!p$!3%!%%!p',
+    '%"6%%"9%%"fm$&6s.8d.$"8%%!0$!9##/14$!2%"99$#600$#736#,0&ndash;1036/$&deg$!a',
+    '$"05$!e#*2&ndash;33$!m#(3&deg;og%*ndash;1107.!9$-/1623&ndash;4#,4&ndash;1039/$&deg$"10$!m#*5&mdash;40$#.29$!0',
+    '$$&deg%*ndash;1037$)a&ndash;b$)c&ndash;e#,7&ndash;1039$!0$)d&ndash;e#"80$!8#,9&ndash;1169$!0$!b#!a#,f&ndash;105f$!f',
+    '#!m$!b$!m#"pm$!p#!s"*4&ndash;10,!5+!1*"23*#382*"83#$,300%"75$#977',
+    '$&member%#ile$$seat$$year($-old##.16$#24%$#37%&!5$"4%$!5%!p$"77$!8%!%',
+    '&!%%!7%"in#$/42/$#745$"86#)0&mdash;2%*ndash;1041.!8/$&deg$%-stfm$"00%#778$$5-06$)e&ndash;f',
+    '$!m#%2&deg%(mdash;66%*ndash;1216$!0$"30##325$!a$"cc$!g#%5&deg$"36$"80#,6&ndash;1069$"86',
+    '$!7$#8.7#%8&deg$"57#/9&ndash;50/1640$!0$"80#!a#!c$!m#"f.$!f$!t#!k##m/s',
+    '#"pp%!.#(year-old"\'5&aring$#deg\'";f$&frac12*";p$(mdash;33$)ndash;113*!2*"31*"77*!9##(1)',
+    '$\'643,364#$-104$"83$%cover$$hour$$seat$(year-old#".0$"21$!3$"45$!5%!%%"5%$!6',
+    '$"7%%"9%$%86mph%$9mph$"9%#\'/151/39&$2/20%"66$!3$&746:98$"84#%0&deg(#;og%*ndash;1132,#250',
+    '$"mm#)1&mdash;2$!s##375#"40#%5/106$!0#&6/1229$)a&ndash;c$!h#"7p##850#,9&ndash;1063$!0$!1',
+    '#!a#"ft#"gb$"hz#!k#"ml$#ton#"pc#!s"%6&deg$(ndash;12+"43-(c-myc-er*!4+!3',
+    '##(4)#$,244$#300%"20$\'500,000$#902#$-113$"91$$ball$&strong$(year-old#".0$!2$"33%"in',
+    '$!4$!5%)3&mdash;4$&627mph$"75%!p$!8$!9%!%%"3p%"6p%!p#-/753&ndash;54$"89##025',
+    '%\'ndash;5$!0$)a&ndash;b$)e&ndash;f#"20$"70#"37$.9/g&ndash;ustv$!a$)f&ndash;g#"40$"46$!6$%7-mso%!0',
+    '$!p#"50#,6&ndash;1235,#307-"48+"77$%-1272$!0$!5$!7#"70$\'4-11525$!a$"mm#"80',
+    '$!m$!p#!a##bhp#"ft#!h##pp."*7&mdash;10*!9$%ndash)$;108-,/303&ndash;4,!9+"11,!4',
+    '+"31*!3*"44#!\'##(1)$"2)$"4)#+,000-xstone%"88$#187$#720#"-8$$mile$$page$$year',
+    '$"2%%!5%!m$"3p$#54p%!p&#/kg$"7%%!5$*83&mdash;5$!9#"/2$#303$*685,120/69$,757&ndash;58',
+    '#%0&deg%)ndash;712,!2$"60$"mm#)1&mdash;9%*ndash;1127-"52#,2&ndash;1073$!-$!0$"bp#*3&mdash;85$!0$"44',
+    '#)4&ndash;7$%x1075#,5&ndash;1109$!0#*6g&ndash;h$!m$!p#,7&ndash;1108$!0#"80$"99$!h##9pp#,:29&ndash;30#!b',
+    '#)g&ndash;h#!k#"mm$"ph#"nm#"pp#$sup6#$x137"\'8&deg;c$\'ndash;1+!1,!2*"46$&plus;1#(,000,000',
+    '$#100$#310%"30&!3$#500$#900%"82#%-bolt$%tonne$(year-old#!.$"1p$"42%!p$!5',
+    '%!2$!8$"94#$/209$"70%!7#,0&ndash;1116-"52$!/$$6-07$)c&ndash;f#,1&ndash;1137-"51$!0$)c&ndash;d',
+    '#"20$!8#&3/1672$!0$!m#)4&mdash;5%*ndash;1155$-/1673&ndash;4#,6&ndash;1113$%-1066$"54##784#,8&mdash;1099%(ndash;91$!0',
+    '#,cm(42.5in)in#"km#!m$!m$"ph"%9&deg$,formula;km/h$#ins$(mdash;14$(ndash;10+"10,!2+!2+!4+!6',
+    '*!7#"\'s##(1)$"5)$"a)#$,090$\'100,000%"24$#370$#414$#585$#600%"31%"96$#705',
+    '$#998#$-122$!a$#run$#set\'!s##.05%!9$!2$!4$#52p%"8p%!p$"69$"82',
+    '$"9%#!/$#111$#503$#774#,1&ndash;1092,#119+!2+"35$"/4##2mm#,3&ndash;1109+!4+!7$!0',
+    '#)4&ndash;7#%5&deg%*ndash;1116-"54,#588$%/1684$!0$)4&ndash;5$!8#"60#"72#"90$!7$!m#!b',
+    '#!f$"-1$"f.#$j(i)#!w#&x138cm#$year"%:00.7%#:41&"59$$1:18&"46$$2:02&"18&"57',
+    '$$4:04\',7&ndash;0400&"16&"34&"43$$5.49%#:33$$6.66%#:21$$7:31&"47$$8:21&"39&"59$/9&ndash;10:12ut',
+    '&"42&"51#*1&ndash;10,!8+!2,!0$",6$$0:28&"54$!1%,&ndash;12:16,"36%#:00&$15ut&$30ut',
+    '$!2%#:14%"ut$$3:13&"27$!4%#:00&"15&"38&"46%"ut$$5.28%#:11\'!3$$6:10',
+    '&"49$$7:00\'!6&"14&"20&"38$$8:47$!9%)&ndash;24%#:08$$:0.5$"ff#%20:27$*1&ndash;29%#:01',
+    '$-2&ndash;21:35-!9%#:09$!3%#:09&"49&"51$%4.21.%#:01&"20&"55$*5&ndash;28%#:23$$6:32&"57',
+    '&"21&"36&"54\'!5$!8%#:36&"51\'!9$*9&ndash;37%".3%#:02&"25#+30&ndash;35%#:16%"am',
+    '$!1%#:16$/2:10&ndash;0500&"22$!3%#:22&"34$)4&ndash;5%#:24\'!8$!5%".2%#:32$!6%#:05',
+    '$$7:07&"28&"54$*8&mdash;42&(ndash;42%#:26&"53$$9:15&"46#)4&ndash;5$$0:13&"47$!1%#:37$$2:33',
+    '\'!6$!3%#:20$$4:34&"46%!f$$5:38&"54%"pm$$6:06&"20\'!7&"30&"49$/7:42&ndash;0500',
+    '&"30$$9:04&"27#!5$(&ndash;7$!0%#:00\'!9&"35&"41$$1:08&"21\'!8&"59$$2:36',
+    '$$4:29&"33\'!5$$5:13\'!6&"36$$6:09&"10\'!2&"37$$7:13&"59%"am$$8:33%"am',
+    '&"19&"26\'!8&"40&"58#*7&ndash;11,!3#!8#"90"!_##per"#a.m#!=#+m&ndash;3pm+&6.30pm',
+    '$#-12%&2.30pm&"pm%$4.05%&5.30pm\'$50pm%#8pm%#9pm$!.$&4.30pm%"pm$#8pm"&base-5\')t/10base2&=2&ndash;10base5&ndash;10baset',
+    '&2t-thinnet-thicknet#&base-2#&illion#!n"#cm.$(/4inches$#kyr"#d8y"$evcm"!f#"f.#&t-long"#g/t##bps#$flop',
+    '#!w""h8#"rs"$ins+",k&ndash;450k$#ohm#&g/s/ha#"m.$"/h&!.#!w"&length"%m&ohm#$-12m$%bytes',
+    '#!a#%b/sec$#its$.yte-per-second#*cg/kg/hour#&illion$$nute#"jy##mna#$tdna$"on""ng#!o#!s""oc',
+    '$$only#$.p.m&#t.v#%/mile#%11.2.#$erm2#!g#(m-to-6am#$oint"$s.6d#"ec#!q#$tone"-th&ndash;15th,#7th',
+    '%$16th#!o$!9"!w##/40"#x10%&&mgr;m$,2&middot;5cm$"5m$(6&middot#/35cm/4x14inches#"40"!y#!d$!s',
+    '!,1%&ndash;83%"\'&amp;12#5frac12&ndash;4&frac12)&;-hour*"d.*$ins.*#mph("4%)";d(!8\'"34)$&ins)";d*"in*$p.c.',
+    ')"16*!9)"20#%ndash(3;0&ndash;55&ndash;5*#764)#1/2,"ft*)0&ndash;0*%2,000+)-year-old+%/4/41+#:36+"km+!m',
+    '+*-year-olds+"th*"4%+!6*"5%+)-year-old+!0+!s*+6-year-olds*"89),2&ndash;1903*#0cm*"21*!3+!1',
+    '*"8s)$30am*!1*!5),4&ndash;19081!8*!0*"pm)"50*!5))7&ndash;0))9&ndash;0*".5)$july)#sat',
+    '))year-olds#.prime;30&prime#(shilling+$;8d."#(-)#(1)&mdash#(3)&mdash#"6)#"9)#"d)""**",,000&ndash;1.%4,600&%-mile\'$plus',
+    '&"1.&"ft&!t$"32$"60$"72%!3$"80$"90%!8##110%#3kg$&74,000%!9$!8',
+    '##204%%7,000$!1%!3&$,000%!8$&20,735$$34ft$&47,000$&59,000$"65$"75$"80$*9&ndash;32##329',
+    '$&56,803%!8%!9$"73%!9##410%!1$"42$&60,000%!5$"80%#2ft$"93%!4%!8',
+    '&!0&"ft&"km%!3$"33$&41,155$&54,000%!8$"60%!3$"77$*80ft./350m$"96#\'600,000%!3',
+    '$"24$&61,391%%7,000$"76$"80#\'713,000$"20$"50$"68$"95%!9#\'820,000$"32$"44$%54ft&',
+    '%!7$"60%!7$"71%!7%!8##904%!8$#10.$"23$"58$"78$"98""-0$%-43-0',
+    '#&1-37-1%$52-1&#7-1$#2th$)3,000,000%!s$+6-year-olds$\'8-07-61$!9#$2-91&!3$!0#!3$#-93##4-1',
+    '%!2##5-1%!2#!6$"-1%!2$"pm##7-1%!2%!3##bay$&edroom$#oat#"cd$&hannel',
+    '("ry#\'episode$!r#%fence##ghz#+handicapper$&ectare$\'our-old#%judge#$khan#!m$$etre$#ile%$nute#%night',
+    '#%party$%layer$&ounder##run##sep$$tone&#rey$#ung#%tests$#one$"ry#)under-par#%years"-.0&ndash;14.0$/0&ndash;11.30pm',
+    '-$9.00%/am&ndash;4.45pm$!1%#.10$"2p$!3$!4$#584%"am$!8$!9#%1&ins%\'ndash;2+!9$".1',
+    '%!3$$0.90\'!2$"1%%%.91y6%!m$$2.93%13&mdash;4.26,32,5&#.30%"5%$#3am$*5&ndash;17$+653&ndash;4$$9615$!a',
+    '#,2&ndash;11.4$#(1)&"a)%"2)%"3)%"b)$!.%!4%!5&!0%!6$\'/100000$-0&ndash;12.45%"in$\'1&deg;c',
+    '\'!.%"pm$)4&ndash;6$"6m$":1$"pc$$secs#,3&times;10/l$#(1)%"2)$#.16&#913%!3%!5&".3',
+    '%"92$(/100000/$&0-8.30%#a.m&+m&ndash;1pm\'\'-3.30pm)"pm(&4.30pm$#3am$#4am$#5am%!p$"7%%"5p%"am',
+    '$#oam$!p$$secs#$4(b)$#0pm%#sec$!2$!3$!8$#9pc$"pc#%5&ins$#(2)%"a)%"b)',
+    '%"d)$%-mile$".1%!2%!4$"0p$!2$\'5-point%!p$!6%"am$#7/3$!9$"cm$!f',
+    '$"pc$$secs#%6&ins$#(1)%"2)%"4)%"a)%"b)$)-megawatt$".1%!2&!.%!4%!5$#25%',
+    '$!5$!b$#kpc$&p.p.m.#%7&ins%&percnt$#(a)%"b)$&-point$".1$!3$"5%$!6$!7$"9%',
+    '$!b$!c$!d$2g-bytes-per-second$!p%!c$$secs##8.1%!2$!1$!4$"56%"in$!8$!9',
+    '$!p#\'90.6kyr$$2sec$$52in"&/10/93$!1%#/87$!7$"99#"21$"85#"31$%95/67#!4$#/41',
+    '$!m#$5/41#$6/83$!1$!8##785#!8$#/92$!6#&9/1993%"78$$1p24$!2$!3#"ac',
+    '\'";f(!w%%ollar$\'mgr;gml$)ndash;112+"72*!2+!6*!9$%pound##(2)##,00&%0,000$#169$#287',
+    '$\'407,376$#600$\'900,000#$-101&"86%"20&\'5&deg;c%"32$#day$%metre%#ile$$page%$oint$&storey#!.',
+    '$"3%%$4mph$"42$"5%%"0%%!3$%64mph$!8%"4p$#97p#$/0.5$#120\'!v%!5%"72',
+    '%*ndash;1154-"71,#200,#700+"39$"00%!6$"44$!5$$kcal##181$#902#"2.%"10$!2',
+    '#.3/1691&ndash;2$#813$!m#$40st$!1$!3$!4$!6#\'5&ndash*%;1184#"60#*7&ndash;41+"81$"mw#%8&deg',
+    '+!9$$,000$!.%!3%!5#"9.%!4$"44$!f#":4#"as#!b$"hp#)c&ndash;g$!m',
+    '$!t#"kb#"lb#"ml%!s$\'ph-plus#"pc$!p#"sq#&x220cm#"zs""1%#)&mdash;12,-.99&mdash;137+!3',
+    '+"12,!3,!5,!6+"22+"52+!7*!2+!2+!3*!5*!7#%(43%)#(,200,000$#493',
+    '#$-117$"77$&member#".0%!%$#144$!2%!5$"34$"45$!7$!8$!9%)6&mdash;7#,0&ndash;1111',
+    '$"00$$1-04$!h$"st#)1&ndash;0+$1112$"00$$1111$!a$!e#*2&ndash;47$!0##330#"45$!m',
+    '$!m#*6&ndash;42$!d#"7\'#*8&mdash;21%*ndash;1127$"60$!p#*9&ndash;30+"46#$:106#!a$!.#)b&ndash;c$"hp',
+    '#"ff##mph#!p$!."/2&frac12&percnt$5mdash;13.138&mdash;70$%ndash)$;115+"29*"21*!3*!7*"99$&plus;2##(3)',
+    '$#500#!-$#122$"62$$ball%"hp$\'company$#lot$&strand#!.$"01$"11$#25%$!3%!1',
+    '$#42%$"5%%"in%!p$!6%!5&#mph%!7$"7%%"6p$"8p$"97%!p#$/506#*0&ndash;21',
+    '#,1&ndash;1122+"48$"14$"80$)g&ndash;h#\'2.32.21##360#*4&ndash;44$!h#*5&ndash;40$%-line$#000$!9$!b$!h',
+    '$!a$)c&ndash;d#)7&ndash;8$)-megawatt$"20#*8&ndash;32#,9&ndash;1130$"55$!h#!b$(hp/tonne#!e#"ft#!k$#bps',
+    '#!m$7m&times;62mm&times;31mm$"pg#"pp%!.#"th#&x142cm"+3&ndash;114+"27*"24*!9##(1)#$,211$#615%&65,000',
+    '%"98#$-106%"18#$.01p$!1%"04%$71f.$"3%$!6%!%%$9mph%!p$!8#$/115$"29',
+    '$"75#*0&mdash;43%*ndash;1200+"50$!a$!m#*1&ndash;48#*2&ndash;48$!.$!m#"38$!b#)5&ndash;9$"40#%6/e/l',
+    '#"70#%86303#!a#!f$!f#"hp#"kg#"mm#!s$!.#"th"*4&frac12;p$(ndash;15+!7+!8',
+    '*"33*!5*!6##(2)#$,500$\'718,395#"-2$$mile$&person%$oint$$seat##.1p$"25$!3%!%',
+    '%!p$!5$#65p%%80mph%&gflops%!p$%84mph$!9%!5#$/187$"83#,0&ndash;1221+"98$%-foot$#.00',
+    '$!2$#hrs%!s$\'s/1730s#"11#,3&ndash;1530##475#,5&ndash;1202+"70$"30#*6&ndash;74#"70#*8&ndash;56$!0##bhp',
+    '#"cm#"ff%!.#%ills.#"kg#"mm#"pp"*5&mdash;16$)ndash;112+#21%+#70g+!8*"21+!4+!8',
+    '##(2)#(,000,000$#171$\'315,902$#446##-86$\'decibel$$foot(%-long$$test$(year-old#".0%!4$%13mph$"2%',
+    '%#bps%$kbps$%44mph%$5mph$!5%"mm$"7p$#859%!6%!8$"90%!p#$/240#,0&ndash;1600,#750',
+    '$$1270$"kg#*1&ndash;96$!3##288#)4&ndash;5$!0%!3##5\'s$".5$!c$"mw#$6420$"70#,7&ndash;1217',
+    '$!9#!a#!d#"ft#!l#!m$!a$!b$"ph"(6&frac12$(mdash;17$)ndash;112,!3,!7+$22cm',
+    '*"25+!7*!8#,,18,19,21,22$#500$#775#$-111&!4$$mile(!s$\'officer#$.04p$$1khz$#23%%!p',
+    '$"31%!p$!5%!%%!p$!6$#74p%!8$!8%"3p##/62$"77$#800#*0&divide;2%*ndash;1225',
+    '$!0$"90#)1&ndash;3#*2&ndash;96$!0$!m#,3&ndash;1235+"65#,4&ndash;1168#,5&ndash;1230,#378,#547+$2081$!p#,7&ndash;1174',
+    '$%00001\'"41$"50#*8&ndash;88$!0$"cc#*9&ndash;73#%b/117##cps#"km#$yds."(7&frac12$)ndash;110+"22,!6',
+    '+!8+!9*!3+!3*"57*!7*!8*!9#$,180$#372#"-1%"10&!2%"21%"92',
+    '$&minute$$seat$(year-old#".0$"1%$"3p$#443$#617$#790$!9#4/119,118/120,172/174%"21$#695#,0&ndash;1217-$35/6',
+    '#"10#,2&ndash;1173+"89#"33#)5&ndash;6+"84#*7&ndash;84,!5$!m#!a$(&ndash;e#"ff#"km#"lb#!m',
+    '"%8&deg$+frac12;-116%!t$+ndash;105bc+"19+"23,!4-"cm*"20+!1+!5*#358*!8*"99##(1)',
+    '##,00$#700$#813#$-105%"10&!7#".0%!0%"4p%%85mph$!1%"91$-3&ndash;169.4$!4%)6&mdash;7',
+    '%!p$!6%!%%"4p%"8p$!7$#82p%$5mph#"/3$#512#,0&ndash;1223.!4-"47,#350$!5',
+    '$!0#)2&ndash;3$"10#)3&ndash;4+!5#"4.$"60#\'6/21389#*7&mdash;91%*ndash;1191+"99$!4#"80#"9-##:26',
+    '#!f$!f%!.#"hp#"lb#!m$"ph#"pp#$runs""9%#(&ndash;0*#120+"40*"34*"46',
+    '+!0##(1)#$,630#!-$#118$"90$$mile$%seats#".0%!0%!p$!3$"49$*68&mdash;9$!7',
+    '%"6p$#81p%"5p$!9%!%#$/121#,0&ndash;1251.!8-"75,#320$!0$!4$$5-10##1/2&!p',
+    '$!9#,3&ndash;1205$!5#&4/1195$!b$!d#"52#,6&ndash;1204$"11$"40$!5$!6#"79#,8&mdash;1304%*ndash;1212',
+    '$$,030$!0#,9&mdash;1200%*ndash;1200$"30##ff.#\'kcalmol#&m/170m$"ph#"pp#"s.#)th-minute"&:00:06&"30\'!5',
+    '&"58$$3:38$$4:14$!6$/7:27&ndash;0500&"39&"56$!8%#:15&-44&ndash;0500&"56$$9:04&"93#*1&ndash;11+!2',
+    '+!9$%00000%#:32&"50$!1%#:10\'!4$*2&ndash;14%#:37&"42$!3%#:04&"47&"50$$4,15',
+    '%.:33&ndash;0600\'!7$!6%)&ndash;17%#:17$\'7:06.52&"12&"27$$8:00\'!9&-29&ndash;0500&"43&"54$$9:23&"41',
+    '%",1%#:08&"11&"20\'!8&"45$$1:06&"56$!2$!3%#:06&"16&"29&"49&"57',
+    '%)&ndash;25%#:20$$5:13&"24&"58$!6%#:26&"58$!7%)&ndash;33%#:29$$8:14&"48$/9:02&ndash;0500&"26',
+    '&"54#)3&ndash;4$$0:13%"pm$!1$!2%#:59$/3:59&ndash;0500$$4:23$$5:01&"21&"41\'!3$$6:08&"52',
+    '%#:15$$8:15&-36&ndash;0400$$9:35#%40:19&"46$$1:00&"20&"52$!2%#:39&"48&"55\'!9$$3:13',
+    '$$4:12$!5%#:03&"49%"pm$!6%#:25$$8:54\'!6$!9%#:00\'!7#!5$(&ndash;9$!0',
+    '&"39&"47&"50%"pm$$1:01&"48$$2:08&"19&"20&"53$$3:18&"50$!4%#:16&"20',
+    '&"26$$6:40$$7:21$$9:01&"10#)6&ndash;9#"89"#=9%"$a(3)$"4)#".1$!3$"m.#.m&ndash;1.30pm+#2pm',
+    '+#8pm$$-1pm%#2pm%#3pm%#4pm""cm""es")f&ndash;g#!l#!n""gm"!h#!a"&inches#"sh',
+    '#!g$%/25lb#"hz#"ph#!v#"yr"#lbs"%m-3pm$&strong#"in#"ls#(onth-old"!n"!o#"zs',
+    '"!q#"13#"23""sq#/un2,90031.629.9"-th&ndash;13th%+rehy;seeded$%-15th%$22nd%&minute%&ranked&$ound$!.%&/12th."!v',
+    '"%x18cm"(year-old#!r!,2%&ndash;15%#&percnt"\'&amp;13#*commat;1/2#&deg;dh\'"kh#*frac12&ins)#;in,!s(!4)$&ins$\'t;6&ins',
+    '#0ins&times;18&ins&\';x8&ins#%mdash(#;16*!9)"25$&icro;g%\'ddot;08*&5x23cm#,ndash&frac38(*;0&ndash;0*!0),1&ndash;18473"581*53&ndash;0',
+    '+!-*"1-*$2.30,"5h+"37*%3,000+"cm*%4&ins+)-year-old*#5.5+#min+!p*"6%*+8-month-old)22&ndash;31&ndash;1',
+    '*#(a)+"b)*!1+"st*#4in*!5+!%+!0+#:18*"67*!7),3&ndash;1892*"0%+!0*!1',
+    ')"48)25&ndash;17&ndash;52#861*!0*!4*"pm)"63*!5)\'7&ndash*!2*!9*#kyr)"82#&percnt#+rehy;inches',
+    '#,shilling;11d,"5d$%ol;13\'"76#,times;10&ins*$2&ft*,6&frac12&ins+"in*,7&frac12&ins)%8&ins""\'2#!s#!w""()#"-)',
+    '#"7)#"9)#"a)#"i)"!+#!1"#,00%.0&ndash;18,000-&20,000.&20,000&\'-16,000\'(kilogram\'$mile\'&seater&"bc',
+    '&"kg&!m\'!w&#opm&#rpm&"th&$yrbp$&28,000$"35%!8$"63$"76$"87##100%!6',
+    '$"2s$!3$"44$$6,17&"23$"78$!9%!6%"92##209$!1$!3%%2,498$"93##3,6',
+    '$"15%%9,787$"31%!6$!4%!0%!3%!8%#9ft$"57%!9$"70%!1$"90%!5',
+    '%!5%!8$&26,000\'#443$"30$"60#&500&ft&!0&"km$&25,000$"33$"60$&70,000$&96,124##618',
+    '%!7$"50%!7$"75##705$"12%!5$"43$&60,000%!5%!9$"82#\'800,000$"28$"48',
+    '%!9$"60$"84%#9.8$"90##910%!4%!5$"20"%-,13-#%12-14$"39$"pm#"20$!1',
+    '$!3$!5$!6$!8##3-1%!2%!3%!4%!5%!6%!7%!8%"93$#0th$!6',
+    '%!2%"93#!5#$9-91#&a-side$\'ug-1993#\'bedroom$$ores$,reakfast-bar##car$%olour%#unt#$date$%enier#\'egg-box',
+    '&!t$(oot-high\'"er)!s$!t#$game%#uge$#ear#!h$)orsepower$@ydroxy-5.8.10-hepta-decatrienoic#"in%!s$$ssue#"j5',
+    '##key$!m%%-long#!l$3-hydroperoxy-5,8,10$%ength%$tter$#ine#)mile-long\'!s$)onth-long##per$$iece%!n$%oints',
+    '$"pm#\'rounder#\'section$#hip%"ot$$ided$#lot$$peed$#tar\'#red%&itches#$team$$o-15\'!6%!g',
+    '%#oth("ed#$unit#!v$&ehicle#(week-old%"ll##y-o$*ear-prison"/.00&ndash;12.30-$6.00-$7.30-#8.0/"45%!0',
+    '%"pm$!4$"8%#,1&ndash;14.9+!3+!8$#(c)%"d)$#.90$#0am%#sec$*1&ndash;12%&9.76-7%$b-13$$2(1)',
+    '\'!8&"91%)3&mdash;4%"5%%$7.10(*6&mdash;28\'"25$#3.0%*8&ndash;44$*45&ndash;6$$5a.m$*6&ndash;18%!0$$8(b)$!m',
+    '$$secs#,2&ndash;33.2$#(c)$$.1.1%!3%!4$"2p$#3pm$"5%%"pm$"60$#7am$"9b$"ff$"hh',
+    '$!p$$secs#$3(2)$#.93$-0&ndash;14.30,!2-#.30,"31,#5pm%%-1.30%$p.m.&+m&ndash;2pm\'!.$"3%%!p',
+    '%"am$#6fl$"ft$"oz$"p.#%4&ins$%-hour$".1&#931%!2%!4$#0am$$5:it&#the%"am',
+    '$#7pm$!9%"am$!a$!m$!p%!c$$secs#$5,25$#-cm$".1%!2$$/0.5$%0:hot&)whitbread',
+    '$#1pm$!2$!4%"7a$&5:this$"7%$"cm$!k%&g-bulk%"hz%!m$!m#,6&times;10/l$".1%!2',
+    '$!/$#25%$!4$!5%!%$"8%$!9$!b#,7&times;10/l,#4.6$#(3)$&,13,23$".1%!2$&0.6kyr',
+    '%!p$"7p$"kg$"mm#*8&times;10$%-18.4$!3$"4m$"6p$#9:2$!m$!p$$secs#\'9&deg;c%*times;10/l',
+    '$!0$!2$-5&ndash;16.69$!v"#/10%#/84$$2/92%!3$!4%"th$"55$!6#)2&ndash;3$#/41$"10',
+    '$"59#$3/83$!2%!1#$4/88$"58$"72#$5/41%"92$!0$!1$"58$"90#,6&frac12;was$"06',
+    '#"85$!7$!8$!9#$9/88$!0#5carterton/oxfordshire"\'0&deg;.(!c(!e$)frac12;km%!t$#ins$%mdash)";2',
+    '+"21,#2hp+"30-&&deg;c+&40-kyr+#50%-"cm*!2+"40*!3+!6+!8*"40*!5*"67',
+    '*!9##(3)#!+$#n/a#(,000,000\'\'-a-year((capacity\'#b/d\'!m%%38.07$#300$#600#$-107&!9%"60',
+    '$&degree&&pleted$$foot$$knot$%metre%!m$#odd$#pin%$oint$&seater%*quare-foot$$watt$(year-old#".0$!1',
+    '%!p$"5%%#ins$#77p$!8#!/$"80$"91%"72$#min#\'0&deg;c%*mdash;1201,#400%*ndash;1000,#274',
+    ',#600+"68+"75$#-mm$&/75bps$-0&ndash;14000%%-mile%#0ha%"ft%"sx$$cals%!c$"ft$"km$#mjy',
+    '$!n$#ppm$"th$!z##120$)e&ndash;f#"2.$!0$!e#)3&ndash;4$"-4#)4&mdash;5+-advertisement%(ndash;59#)5&mdash;6',
+    '-"65#,6&ndash;1258#*8&ndash;11+!9##970#":1%&60:5:5#!c$)/250f/gas$"ms#"ff$"t2#-g/4&frac12;oz#!k$!g',
+    '#"m3$!a$#ins$\'ph-plus#"ns#"p.$"pm#"sq";1&deg;08\'&ndash;122&deg;44\'(!c$\'mdash;2%\'iddot;9$)ndash;180*!3+!1',
+    '*"49*#878$&plus;2#$,215$#600#$-122$%based#&.36mph%!p$"57%!p$"65$!9%!p%(x137.2cm',
+    '#,0&ndash;1274#"10$"21$!g#%20kyr$$1-12$"70$)a&mdash;g$!k$!p#%3/180$%x1214#*4&ndash;94$!0%!0',
+    '#,5&ndash;1295,!7##6/l#*7&ndash;18+"23#*9&ndash;20,!1$!0#":1##bhp#"f.$!f#"lb#!p")2&mdash;4',
+    ',!7,!9*#210*"40*"52#$,131$#200%"43$\'600,000$#802%"90#(-&frac12$%litre$"mm$%point',
+    '$-1&ndash;174.5$"2p$#301$!4%$9mph$"56$#79p$"91#,0&ndash;1280+$4220+"88#,1&ndash;1284,#921#"3m#*4&ndash;37',
+    '$"50$!7#,5&ndash;1274$"-x$#:39#*6&ndash;70#*7&mdash;41%(ndash;59$#:05#,8&ndash;1277$#:23#,9&ndash;1856$#:16#)b&ndash;e#(cm(48in)',
+    '$!p##yds""3%#&&deg;e$\'mdash;4*!8$\'ndash;5*"74$&plus;2##(2)#(,220,129&!9$#456$\'611,541$#973',
+    '$$talk$(year-old##.2%$"3%%$0,35$!4%!6$"77$"94%!p#$/125$!4$!w#,0&ndash;1260,#309',
+    '+!9#,2&ndash;1284,#307+!4+"59#*3&ndash;40#,4&ndash;1244$!\'$"56&$7890&!a#,5&ndash;1257-"96$"-x$!0',
+    '$#987#,6&ndash;1294#)7&ndash;9#,8&ndash;1328+"46#!a##bhp#"cm#"ff#"in##mph#!p"+4&mdash;125$)ndash;135*"32',
+    '*!6##(1)#$,080$#342#!-$!2%"00$&strong#".2%!%$!3%!p$!4$"6p$!7',
+    '#&/50/91$"77%!8#,0&ndash;1275,#304$\'-c.1291#*1&ndash;54+"65#"30#)4&ndash;5+!8#*5&ndash;56$"00$!m#,6&ndash;1248',
+    '$!7#*7&ndash;79$!8#\'8&ndash$!1$"30$"96#,9&ndash;1301+"50,!9$!0$"40##cm.#"p.$#/kg',
+    '#"th")5&mdash;8$+ndash;128cm+"31+"50+#75g*%200cc+#870*$4721*!7*!8+!4$-rehy;year-old##(1)#1,000&ndash;13,500',
+    '(%tonne$#432$#500##-16&!5$$acre$#odd$$seat#".2%!p$"33%#4-5$!4$"59%!p',
+    '$"8%$!9#$/519#,0&ndash;1285+#900$%-1500$!0$"km$"ma#*1&ndash;60+"74#)2&ndash;3$!4#*3&ndash;54$"00',
+    '#,6&ndash;1302+!7+!8,!5+!9#,7&ndash;1379+!8$!0#,9&ndash;1294+"65$!3#!a#"bp#(cc-200cc#!f',
+    '#-g/4oz/&frac23."34)!2$!r#"hp#"kg$$jmol$!m#%lb/ft#!m$!b$#gdl$!w$"yr#!t',
+    ',!8+$30cm,!1,!6$,shilling;6d.#(,000,000$#554$#687$#984#$-101$#bed##.3%%"0p$!5$"6p',
+    '#,0&ndash;1278,#322.!7-"90+!2+"70$"00$!1#)1&ndash;3$!0##2/3#,3&ndash;1742+!5$"/4$!4',
+    '$"3m##6-x#,7&mdash;1337%\'ndash;8$"06#,8&ndash;1538+"72+!9#)f&ndash;g#"km##lbs#!m#"p.""7%#*&ndash;128',
+    ',#5cm+"48*!3+!0+!9*"49*!5*"84#$,250$#500$#900#$-147$#223$!9$$mile',
+    '%#ear##.0p$"27%!p$"5p$,6&times;76.8$!7$!8%!8#)0&ndash;2+"71$#dpi$"mm#,2&ndash;1337+!3',
+    '##391#)4&ndash;5#,5&ndash;1321.!2-"50.!2+!8,!4$!b$"cc##660#,7&ndash;1284,#330$*9&ndash;81#,8&ndash;1283',
+    '+!9$#a25#*9&mdash;92%*ndash;1353#":1#"ff#"hp#"pp#&x170cm&#7cm%$80cm"+8&ndash;105+"30,!2*"30',
+    '*!6##(1)#"+x$!y#$,054$#167$#281$#500$#600#*-multiport$&nozzle$$port$$year##.1%$#47p',
+    '##/79$"km#,0&ndash;1300-"40$"00$!c$!o#,2&ndash;1321$"/3$!k#,3&ndash;1284,#328#"40#,5&ndash;1319-"31',
+    '#)7&ndash;9#*9&ndash;90,!1,!3$"50#!i#&kbytes##mhz#&pp.123#)th-ranked"*9&mdash;30$\'ndash;1+"52*"30+!4',
+    '+!5##(1)#(,300,000$\'578,000$#765$#920#$-130$)signature##.33$"4%$"70#+/olaxbalb/c(\'c57bl/6$!r%!l',
+    '$*svxc57bl/6#)0&ndash;1,#300-"44.!9-"50$"00#,1&ndash;1347+!2+!4#,2&ndash;1342-"69#"3-$!.$!8',
+    '#,5&ndash;1306-"16-"29+!6+!7#,6&ndash;1337+!7+!8+!9#,7&ndash;1307.!8+!8+!9#*8&mdash;99$!0',
+    '#!e#"pp"&:00:15&"26$$1:08&"34\'!8$$3:12&-33&ndash;0500$$4:14&"25&"37$$5:12\'!4$!6',
+    '&"10&"26&"54$$7:35$$9:47#*1&ndash;12+"20+!9$*0&ndash;20%#:23&"36&"50$!1%#:46$$2:28',
+    '$*3&ndash;17%#:13$$4:10&"41$*5&ndash;21%#:45$$6:02\'!8&"32$$7:00&"43$*8&ndash;25-!7%#:44$$9:17',
+    '#%20:20\'!4&"31&"53\'!9$$1:09&"33$!2%#:53\'!4$$3:09&"17$$4:28&"33$$5:12',
+    '$!6%#:16&"36$!7%#:01&"10$*8&ndash;34%.:32&ndash;0500&"58$!9%)&ndash;30%".5#%30:32$$1:13&"54',
+    '&"11&"47$*5&ndash;36-!7$-7&ndash;13:21-$9:25%#:17$*8&ndash;40%#:03&"16&"27$$9:59$":3#)4&ndash;6$!0',
+    '%"pm$*1&ndash;44%#:31&"41&"52$!2%#:57%"pm$!3%)&ndash;45%#:58$$4:06$!5%#:14$!6',
+    '&"55$!8%#:40$!9#!5$#0am$$2:55$!3%#:21\'!7&"51$/4:45&ndash;0400$$5:07$$6:31$!7',
+    '&"39$$8:42&"50$$9:30#"6f#"7f##8:1#!9"%=very""am#(x7-ecc83%\'/ecc83s%"as"#bay#!p',
+    '$,/4&frac12;in"#deg#!h"!e"!f##.22"$game#"hz#(km/30mls#"ph#!w""ha#!r"$inch&"es',
+    '"!k#!b#"hz"$lb.s",m&sup2/litre#!.#!g$#/kg#(icrosoft$&dnight#,m&ndash;25mm#$onth#!s##ths#\'v/gauss',
+    '"%n/12s#!m#*oon-4.30pm("pm#"ts".oz/&pound;4.99,$6.75"%point#!p$!m"%round"%s-13s#$.0d.$"2d$"6d',
+    '"\'th-14th"!w"\'x12&ins$$7&ft#"32")year-olds"!z!+3&frac12;in*"oz*!p(!4(#8;p\'634&times;15&frac18&ins$\'t;3&ins#%ins;d',
+    '*!9$$gr;g$&icro;l#(ndash;00*!5),1&ndash;18772#9064!81*50&ndash;0*,0&ndash;1888+!3*)1&ndash;8*)3&ndash;0*)5&ndash;8+.cm/5&ndash;6in',
+    '*+6-year-olds*\'7.11.89*"8a)%20:21*!2*!5*!6)"30*!5*!6*!9)"4%*!1*!2*!9',
+    '*!6+!8))6&ndash;01$1866*!0*!9)$year#&percnt$%lus;1(!6$-rime;29&prime#6times;10cm/5&times;4in"!\'#!s"$(14)',
+    '#"6)#"7)#"c)"!+#!2"#,00%&0-plus\'#ton&"km&"lb&"mw&(rpm-plus$"19$"46$&81,935',
+    '$"16$$4,15\'$6,29$\'5,17,20%!0%!5%\'6,288.6$!6%%2,992%!6$&70,000#\'200,000&"ft%#5kg$$1,38',
+    '$"21$"35$!5$!6$"82##318%!9$"77$"81$"93%%5,335##400$"30%!2$"46',
+    '&\'-strong&"ft&#opm$"38$"50$&62,000##642$"50%!5$"62$"77$$84lb##789##800%!1',
+    '$"65$$70th$"87%!8$"91##900$"24$"34%%7,000$"71%%4,414"%-16lb$!9#"21$!7',
+    '#!5#!6#!9##ace%"re$)nd-a-half$#ug.#%count("ry#&durham#$fold%"ot#$goal#(handicap#"in',
+    '#(kilobase$!m%%/8-ml$#not#$mers%#tre$7illion-square-kilometre,%trong#(over-par#$race#$slot$$tone&#rey%&ringed##ton',
+    '#%union#(week-old\'!s$#ord#)years-old,!s"-.0&ndash;53.7$-0&ndash;16.30-$7.00-$8.00%&-18.00$!1$!3$%4secs$!9',
+    '#$1(b)$".1%!2%"89%"93&!4$-0&mdash;13.13%".1&!2&"78$"1.$#2.2&!3&"88%!5',
+    '%".1&!3$#4.0&!1&!2&!3%$secs$*9&ndash;22$!p#\'2&deg;c$#(a)%"b)$#.13%#2.1\'!2',
+    '%!8%"92$"5%%!p$"9p$"hh#K3&ndash;16.6km/8&frac14&ndash;10&frac14;mls$#(a)$$.1.1&!7&#8.4$"0%%#hrs$!1%+9&mdash;320',
+    '$\'3&mgr;m$!4$!9%\'p/litre$"bn#.4&deg;x6.3&deg$".1%!2$)5&ndash;6$!9$"cm$!m%!t$"pc#$5%of',
+    '+$61.5%*times;38.5$%-acre$".1%"89$!1$!2$!4$!5$"7p$!h$"in$"km##6.2%!3',
+    '%!6%!7%"88%!9$#25%',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_98 = (
+count_98 = 6694
+
+heads_98 = (
     '\'s_on',
-    '\'s_over',
-    '\'sack\'',
-    '\'sale',
-    '\'samatter',
-    '\'saucepans',
-    '\'say',
-    '\'says',
-    '\'scape',
-    '\'scaped',
-    '\'scene-setting',
-    '\'schools',
-    '\'scissors',
-    '\'scope',
-    '\'scoring',
-    '\'scripts',
     '\'scum',
-    '\'seemed',
-    '\'self-talk',
-    '\'sell',
-    '\'seller',
-    '\'semantically',
-    '\'sense',
-    '\'sense-group\'',
-    '\'sensible',
-    '\'sensitive',
-    '\'sergeant',
-    '\'sergei',
-    '\'serve',
-    '\'set',
-    '\'sets',
-    '\'settle',
     '\'severe',
-    '\'sexism\'',
-    '\'sexuality',
-    '\'sgothan',
-    '\'shadow',
-    '\'shaggy',
-    '\'sham',
-    '\'share',
-    '\'shelter',
-    '\'should',
-    '\'shoulder',
-    '\'show',
-    '\'showcase',
-    '\'shuffled',
-    '\'sick',
-    '\'sides',
     '\'signpost',
-    '\'silent',
-    '\'silly',
-    '\'simple',
-    '\'singers',
-    '\'sir\'',
-    '\'sister',
-    '\'sit',
-    '\'six',
-    '\'sixty-three',
-    '\'skins',
-    '\'skip-refers',
-    '\'slavenski',
-    '\'slough\'',
-    '\'slowly.',
-    '\'small',
     '\'smoother',
-    '\'smuggling',
-    '\'snappy',
-    '\'soccer',
-    '\'soever',
-    '\'sold',
-    '\'solid',
-    '\'solve',
-    '\'sometimes',
-    '\'sonnets',
-    '\'soulful',
-    '\'sounding',
-    '\'speak',
-    '\'speciation\'',
-    '\'spect',
-    '\'splits',
     '\'spose',
-    '\'spring',
-    '\'spruce',
-    '\'sri',
-    '\'sright',
-    '\'stakeholder',
-    '\'starlings',
-    '\'static',
-    '\'stealthily',
-    '\'stepson',
-    '\'still',
-    '\'stoke',
-    '\'stood',
-    '\'stopping',
-    '\'story-like',
-    '\'stow',
     '\'street',
-    '\'strongman',
-    '\'struck\'',
-    '\'structurally',
-    '\'students',
-    '\'stuffing\'',
-    '\'style-palais-style-ritz',
-    '\'sub-christians',
-    '\'sub-exercise',
-    '\'subsidiary',
-    '\'substantial',
-    '\'such-and-such',
-    '\'suffering',
-    '\'suggest',
-    '\'suggests',
-    '\'suitably',
     '\'sulaco\'',
-    '\'summarising',
-    '\'sure',
-    '\'surface',
-    '\'surplus-value',
-    '\'surrealistic',
-    '\'sweet',
-    '\'syllables',
-    '\'symbolic',
-    '\'symmetrical',
-    '\'t\'',
-    '\'tables',
-    '\'taches',
-    '\'tai',
-    '\'take\'',
-    '\'talent',
     '\'talk',
-    '\'talked',
-    '\'tankan',
-    '\'tato',
-    '\'tatoe',
-    '\'tectors',
-    '\'tell',
-    '\'thanking\'',
-    '\'thanks',
-    '\'thanks.',
-    '\'ther',
-    '\'these',
-    '\'thets',
-    '\'thirties',
-    '\'thisisgood',
-    '\'thought',
     '\'three',
-    '\'thrush\'',
-    '\'thwacker\'',
-    '\'tilda',
-    '\'tim',
-    '\'too',
-    '\'topic\'',
-    '\'toxemia\'',
-    '\'tranquillity\'',
-    '\'trumper',
-    '\'trying',
-    '\'tutelle\'',
-    '\'twelve',
-    '\'ukrainian',
-    '\'ullabaloo',
-    '\'umble',
     '\'umbly',
-    '\'umping',
-    '\'unable',
-    '\'under',
-    '\'understand',
-    '\'unter',
-    '\'unting',
-    '\'urting',
-    '\'ury\'s',
-    '\'uzzy',
-    '\'vantage',
-    '\'ve_no',
-    '\'very',
-    '\'visitor',
-    '\'void',
-    '\'w\'',
     '\'was',
-    '\'wash\'',
-    '\'wax\'',
-    '\'weak\'',
-    '\'weald',
-    '\'wealth\'',
-    '\'wednesday\'',
-    '\'whaddayoumean',
-    '\'wherein',
-    '\'which',
-    '\'whisky\'',
-    '\'white\'',
-    '\'wicked\'',
-    '\'wide',
-    '\'wight',
-    '\'wilfully\'',
     '\'windows',
-    '\'wing',
-    '\'with\'',
-    '\'wobbles',
-    '\'women',
-    '\'wonderful',
-    '\'woodbine',
-    '\'woodruffe',
-    '\'working',
-    '\'wt',
-    '\'ye',
-    '\'yea',
-    '\'yesterday\'',
-    '\'yuk',
-    '\'z',
-    '\'zbo',
     '\'zebra',
-    '(2.2.i)',
-    '(91)15',
-    '(hl)3o',
-    '(in)flu(enza)',
-    '(omni)bus',
-    '(re)frig(erator)',
-    '(re)planting',
-    '(s)he',
-    '(ssp1&lsqb;l&rsqb)',
-    '(tele)phone',
-    '(wo)man',
-    ')',
-    ')and',
-    '*&amp',
-    '*&pound&dollar%',
     '*&pound;8',
-    '***&ouml;dp',
-    '********',
-    '*****900',
-    '****allied',
-    '****appointed',
-    '****hungarian',
-    '****ona',
-    '****previously',
-    '****shiv',
-    '****the',
-    '****zabit',
-    '***1',
-    '***after',
-    '***angela',
-    '***asen',
     '***autonomous',
-    '***bernard',
-    '***bramante',
-    '***calogero',
-    '***changed',
-    '***christian',
-    '***did',
-    '***dominique',
-    '***east',
-    '***fatos',
-    '***forward',
-    '***g&uuml;nther',
-    '***german',
-    '***held',
-    '***includes',
-    '***left',
     '***liberal',
-    '***mananga',
-    '***medlearnf***',
-    '***michel',
-    '***mino',
-    '***mojkom',
-    '***muduka',
-    '***no',
-    '***outgoing',
-    '***rainer',
-    '***rear',
-    '***resigned',
-    '***retained',
-    '***revolutionary',
-    '***riccardo',
-    '***seat',
     '***the',
-    '**+pauline',
-    '**3.4',
-    '**328',
-    '**5',
-    '**5.55.31213',
-    '**a.i',
-    '**abd',
-    '**abdel-karim',
-    '**abdel-rahman',
-    '**abdol',
-    '**abdul',
-    '**adamou',
-    '**adolphe',
-    '**ahmed',
-    '**albert',
     '**alfredo',
-    '**ali',
-    '**all-india',
-    '**allan',
-    '**ambrosio',
-    '**an',
-    '**anders',
-    '**annette',
-    '**anterea',
-    '**anuwat',
-    '**anwar',
-    '**argaw',
-    '**badr',
-    '**baitika',
-    '**barbara',
-    '**belcho',
     '**beno&icirc;t',
-    '**binata',
-    '**boanareke',
-    '**brice',
-    '**brief',
-    '**brig.',
-    '**carlos',
-    '**carlye',
-    '**catherine',
-    '**cengiz',
-    '**charles',
-    '**chaudhary',
-    '**chen',
-    '**chien',
-    '**cho',
-    '**choe',
     '**choi',
-    '**choudhry',
-    '**christopher',
-    '**chuan',
-    '**cleopa',
-    '**col.',
-    '**commodore',
-    '**comprised',
-    '**congress',
-    '**damian',
-    '**dan',
-    '**dawud',
-    '**defence',
-    '**democratic',
-    '**dermott',
-    '**derog',
     '**deryck',
-    '**dieudonn&eacute',
-    '**ding',
-    '**douglas',
-    '**dr',
-    '**drini',
-    '**edwige',
-    '**elie',
-    '**eric',
-    '**eugen',
-    '**ewaryst',
-    '**faith',
-    '**fakhuri',
-    '**faqir',
-    '**fazl',
-    '**ferdinando',
     '**filipe',
-    '**fran&ccedil;ois',
-    '**francis',
-    '**frank',
-    '**frederick',
-    '**g',
-    '**george',
-    '**georges',
-    '**german',
-    '**gilbert',
-    '**gillian',
-    '**gowkarran',
-    '**graham',
-    '**greger',
-    '**guy',
-    '**hamidollah',
     '**hamud',
-    '**harald',
-    '**hassan',
-    '**houmadi',
-    '**hubert',
-    '**hugh',
-    '**husamettin',
-    '**ibrahim',
-    '**ijlal',
-    '**ilhan',
-    '**imren',
-    '**inatoa',
-    '**indian',
-    '**innovation',
-    '**ioannis',
-    '**islam',
     '**itar-tass',
-    '**j&uuml;rgen',
-    '**james',
-    '**janata',
-    '**jean',
-    '**jean-louis',
-    '**jean-marie',
-    '**jean-pierre',
-    '**jean-robert',
-    '**jenner',
-    '**johanna',
-    '**jonathan',
-    '**julie',
-    '**justice',
-    '**justin',
-    '**k',
     '**kamil',
-    '**kenneth',
-    '**kerala',
-    '**keramat',
-    '**khondaker',
-    '**krzysztof',
-    '**kurt',
-    '**lalith',
-    '**lee',
-    '**leontjev',
-    '**lionel',
-    '**list',
-    '**lodongiyn',
-    '**ludwig',
-    '**madigbe',
-    '**mahmud',
     '**maj.',
-    '**malik',
-    '**marcel',
-    '**marwan',
-    '**mary',
-    '**maynard',
-    '**mehr',
-    '**melchior',
-    '**member',
-    '**michalis',
-    '**miet',
-    '**mihai',
-    '**muhammad',
-    '**namatollah',
-    '**nasir',
-    '**neal',
     '**newly',
-    '**nikolaos',
-    '**not',
-    '**number',
-    '**nzanda',
-    '**o',
-    '**okitakula',
-    '**oscar',
-    '**others',
-    '**out',
-    '**paek',
-    '**park',
-    '**patriotic',
-    '**pdc',
-    '**pencho',
-    '**percentages',
     '**philippe',
-    '**pramual',
-    '**pres',
-    '**previously',
-    '**rafiqul',
-    '**ralph',
-    '**ranil',
-    '**ranjan',
-    '**ratu',
-    '**remuera',
-    '**ren&eacute',
-    '**represents',
-    '**reshuffled',
-    '**roedad',
-    '**romanus',
-    '**ros',
     '**rupert',
-    '**s',
-    '**sa\'adoun',
-    '**saad',
-    '**saifur',
-    '**sardar',
-    '**sarjang',
-    '**sayd',
-    '**scenes',
-    '**secretary',
-    '**separate',
-    '**seyoum',
-    '**shane',
-    '**shaykh',
-    '**sheikh',
-    '**sidi',
     '**sikkim',
-    '**simon',
-    '**sin',
-    '**socialist',
-    '**sotiris',
-    '**stanley',
-    '**stephen',
-    '**stephenson',
-    '**subin',
-    '**sulayman',
-    '**taher',
-    '**tariq',
-    '**tariqul',
-    '**teaiwa',
-    '**theodore',
-    '**thomas',
     '**tofilau',
-    '**u',
-    '**uk',
-    '**unix',
-    '**unofficial',
-    '**vatiliai',
-    '**vere',
-    '**vice-adml',
-    '**victor',
-    '**viliame',
-    '**virginia',
-    '**vito',
-    '**w',
-    '**wen',
-    '**william',
-    '**willy',
     '**winston',
-    '**withdrew',
-    '**women',
-    '**wrongly',
-    '**yi',
-    '**ylli',
-    '**zamiruddin',
-    '**zegeye',
-    '**ziyad',
-    '**zydi',
-    '*++',
-    '*10.113.41920',
-    '*100%',
-    '*11.65%',
-    '*15%',
-    '*193o728',
     '*1987',
-    '*2',
-    '*2.53',
-    '*220',
-    '*24',
-    '*3',
-    '*32',
-    '*3200',
-    '*343,854',
-    '*5316',
-    '*80/',
-    '*8e2',
-    '*9',
-    '*abdal-majid',
-    '*abdou',
-    '*abdul',
     '*abdulkadir',
-    '*abdulrahman',
-    '*abel',
-    '*abkhazia',
-    '*absalon',
-    '*abukar',
-    '*accuracy',
-    '*achilleas',
-    '*actual',
-    '*actual*',
-    '*ad13',
-    '*ad15',
-    '*adanech',
-    '*advices',
-    '*africa',
-    '*ahmed',
     '*ahn',
-    '*aicha',
-    '*aim&eacute',
-    '*air',
-    '*akira',
-    '*al-daawah',
-    '*alamgir',
-    '*albert',
-    '*albertino',
-    '*alberto',
-    '*aleks',
-    '*aleksander',
-    '*aleksandur',
-    '*alex',
-    '*alexandros',
-    '*alexandru',
     '*alfonso',
-    '*all*',
-    '*alphonse',
-    '*already',
-    '*aluminium',
-    '*andaman',
-    '*andr&eacute',
-    '*andre',
-    '*andreas',
-    '*andrew',
-    '*andrzej',
-    '*anna',
-    '*annuar',
-    '*ant&oacute;nio',
-    '*antonio',
-    '*anwar',
     '*appears*',
-    '*appointment',
-    '*ariel',
-    '*asleep',
-    '*asom',
-    '*assad',
-    '*assifat',
-    '*assumption',
-    '*astere',
-    '*audrius',
-    '*augusto',
-    '*aurel',
-    '*avila',
-    '*avner',
-    '*avni',
-    '*awni',
     '*bandar',
-    '*barbara',
-    '*bashir',
-    '*basil',
-    '*basprog',
-    '*bbc',
-    '*begum',
-    '*bekele',
-    '*belachew',
-    '*beno&icirc;t',
-    '*bill',
-    '*bob',
-    '*bonaventure',
-    '*both',
-    '*boyko',
-    '*bp',
     '*branford',
-    '*bruno',
-    '*budragchaagiyn',
-    '*bui',
-    '*burchell',
-    '*by',
-    '*candidate',
-    '*candido',
-    '*cao',
-    '*carl-dieter',
-    '*carmelo',
-    '*cclo',
-    '*central',
-    '*cfup',
-    '*cfup/cclo',
-    '*chahe',
     '*chandigarh',
-    '*change',
-    '*chart',
-    '*chavanne',
-    '*chen',
-    '*cheques',
-    '*cherif',
-    '*chi',
-    '*chou',
-    '*choudhary',
-    '*chris',
-    '*christoforos',
-    '*christos',
-    '*claude',
-    '*claudio',
-    '*clinton',
     '*clive',
-    '*col',
-    '*combined',
-    '*conc&eacute;pcion',
-    '*conclusions',
-    '*constantin',
-    '*contents',
-    '*corneliu',
-    '*d.w.',
-    '*dancing/cabaret',
-    '*dari',
-    '*datuk',
-    '*dau',
-    '*delhi',
-    '*delphin',
-    '*dennis',
     '*desperate*',
-    '*developing',
-    '*dhari',
-    '*didymus',
-    '*dima',
-    '*dimitrij',
-    '*dimitris',
-    '*diversion',
-    '*dmitry',
-    '*donald',
-    '*dora',
-    '*ec',
-    '*edbas',
-    '*edim',
-    '*eely',
-    '*efthymios',
     '*egidio',
-    '*eight',
-    '*el',
-    '*elahi',
-    '*elias',
-    '*else',
-    '*emil',
-    '*emile',
-    '*energy',
-    '*erskine',
-    '*europe',
-    '*european',
-    '*ewaryst',
-    '*exactly*',
-    '*example',
-    '*faasootauloa',
     '*faqir',
-    '*far',
-    '*fateh',
-    '*fatos',
-    '*faustin',
-    '*fiame',
-    '*figures',
-    '*financial',
-    '*first',
-    '*first*',
-    '*florian',
-    '*former',
-    '*formerly',
-    '*fran',
-    '*france',
-    '*francesco',
     '*francisco',
-    '*franjo',
-    '*freddy',
-    '*fu',
-    '*fuimaono',
-    '*gabriel',
-    '*generally',
-    '*gennady',
-    '*germany',
-    '*gerry',
-    '*ghazi',
-    '*ghulam',
-    '*gianni',
-    '*gilles',
-    '*giorgio',
-    '*giovanni',
     '*giulio',
-    '*given',
-    '*gojko',
-    '*gonzalo',
-    '*gordon',
-    '*government',
-    '*graham',
-    '*green',
-    '*greenpeace',
-    '*grethe',
-    '*gross',
-    '*guardian',
-    '*guinea',
-    '*gulf',
-    '*ha',
-    '*haji',
     '*hamid',
-    '*hannan',
-    '*hannelore',
-    '*hanson',
-    '*harold',
-    '*harvie',
-    '*haryana',
-    '*hasan',
-    '*hassan',
-    '*have',
-    '*hayatollah',
-    '*henri',
-    '*henry',
-    '*heskeith',
-    '*hideyuki',
-    '*hikmat',
     '*himachal',
-    '*ho',
-    '*hodge*',
-    '*hsu',
-    '*huang',
-    '*hubert',
-    '*i',
-    '*iacovos',
-    '*ian',
-    '*ibrahima',
-    '*ibsa',
-    '*id',
-    '*ieremia',
-    '*igor',
-    '*iliya',
-    '*ilkka',
     '*includes',
-    '*independent',
-    '*independents',
-    '*indicates',
-    '*input',
-    '*international',
-    '*internet*',
-    '*ioannis',
-    '*ira',
-    '*irmgard',
-    '*is',
-    '*isaac',
-    '*ishimatsu',
-    '*it',
-    '*izz',
-    '*j&oacute;hanna',
     '*jacob',
-    '*jakaya',
-    '*james',
-    '*jan',
-    '*janata',
-    '*janez',
-    '*january',
-    '*japan',
-    '*jean-maurice',
-    '*jean-michel',
-    '*jean-pierre',
-    '*jelko',
-    '*jerzy',
-    '*jiang',
-    '*jiri',
-    '*joao',
     '*job',
-    '*jozica',
-    '*julio',
-    '*jun',
-    '*jund',
-    '*justino',
-    '*kabun',
-    '*kaj',
-    '*kamran',
-    '*kang',
-    '*kazi',
-    '*keiwa',
-    '*kenneth',
-    '*kerala',
-    '*khalif',
-    '*kico',
     '*kiichi',
-    '*klaus',
-    '*koffi',
-    '*kosuke',
-    '*kozo',
-    '*krzystof',
-    '*krzysztof',
-    '*kuma',
-    '*kvetoslava',
-    '*lakshadweep',
-    '*lasmo',
-    '*laurent',
-    '*laurette',
-    '*lawrence',
-    '*leafa',
-    '*left*',
     '*leo',
-    '*leonard',
-    '*leszek',
-    '*leule',
-    '*li',
-    '*like*',
-    '*lim',
-    '*lojze',
-    '*lord',
-    '*lorraine',
-    '*lothar',
-    '*low',
-    '*lowell',
-    '*lsqb',
-    '*lt-gen',
-    '*lu',
     '*ludovic',
-    '*lyuben',
-    '*m&eacute;dard',
-    '*mahmud',
-    '*mai',
-    '*majed',
-    '*majid',
-    '*makale',
-    '*malcolm',
-    '*mamadou',
-    '*mamduh',
-    '*manuel',
-    '*many',
-    '*mao',
-    '*map',
-    '*marc-henri',
     '*marcian',
-    '*margaret',
-    '*marian',
-    '*marjan',
-    '*masami',
-    '*masoma',
-    '*mate',
-    '*matooq',
-    '*mauri',
-    '*maurice',
-    '*me',
-    '*me*',
-    '*meanwhile',
-    '*michio',
-    '*mieke',
-    '*miftah',
     '*miguel',
-    '*miha',
-    '*min',
-    '*minimum',
-    '*miroslav',
-    '*mohamed',
-    '*mohamoud',
-    '*molwyn',
-    '*monday',
-    '*mongolian',
-    '*monique',
-    '*more',
-    '*moriyoshi',
-    '*movement',
-    '*muerto',
-    '*muhamet',
     '*muhsin',
-    '*mustafa',
-    '*mustapha',
-    '*n-2*',
-    '*nabbi',
-    '*najmul',
-    '*nalaila',
-    '*nantenin',
-    '*nasri',
-    '*nayma',
-    '*nazih',
-    '*neal',
-    '*negaso',
-    '*nelson',
-    '*nick',
-    '*nikolaus',
     '*noise',
-    '*non-binding',
-    '*non-participant',
-    '*nong',
-    '*norberto',
-    '*norman',
-    '*note',
-    '*nuclear',
-    '*nur',
-    '*nuri',
-    '*observed',
-    '*offer',
-    '*oleg',
-    '*olegario',
-    '*on',
-    '*only',
     '*ope',
-    '*oscli',
-    '*other',
-    '*over',
-    '*own',
-    '*panagiotis',
-    '*paolo',
-    '*park',
-    '*pavlos',
-    '*pc',
-    '*pci',
-    '*peck',
-    '*pencho',
-    '*peoples',
-    '*per',
-    '*perrin',
     '*pertti',
-    '*pesticides',
-    '*petr',
-    '*petur',
-    '*philippe',
-    '*phillip',
-    '*pierluigi',
-    '*piet',
-    '*please',
-    '*plh',
-    '*pollidori',
-    '*pondicherry',
-    '*population',
-    '*por',
-    '*pregnant',
-    '*prior',
     '*provisional',
-    '*q',
-    '*qemal',
-    '*qian',
-    '*qu&eacute',
-    '*rabbian',
-    '*raif',
-    '*rainer',
-    '*raising',
-    '*ralph',
-    '*rameshwar',
-    '*rana',
-    '*rashid',
-    '*ratu',
-    '*rear-adml',
-    '*rehman',
     '*remo',
-    '*ren',
-    '*ren&eacute;-lambert',
-    '*reports',
-    '*research',
-    '*resigned',
-    '*results',
-    '*retained',
-    '*richard',
-    '*ro',
-    '*roberto',
-    '*robin',
-    '*rodney',
-    '*roland',
-    '*ros',
-    '*rosa',
     '*rufus',
-    '*rumen',
-    '*rupasena',
-    '*ryutaro',
-    '*s&eacute;gol&egrave;ne',
-    '*sabit',
-    '*said',
-    '*sakvador',
-    '*sala',
-    '*saleha',
-    '*salifou',
-    '*salim',
-    '*salvatore',
-    '*sam',
-    '*samuel',
-    '*sanduyjavyn',
     '*save',
-    '*sebastien',
-    '*second',
-    '*served',
-    '*shabib',
-    '*shah',
-    '*shahzada',
-    '*shane',
-    '*sharad',
-    '*shaykh',
-    '*sheikh',
-    '*shelter',
-    '*shiferaw',
-    '*shigetami',
-    '*shih',
-    '*shin',
     '*shirley',
-    '*shunpei',
-    '*sikkim',
-    '*simon',
-    '*sir',
-    '*siye',
-    '*slavomir',
-    '*social',
-    '*soldiers',
-    '*song',
-    '*soriba',
-    '*sound*',
-    '*source',
-    '*sow',
-    '*ssw',
-    '*state',
     '*stelian',
-    '*subhi',
-    '*succeeded',
-    '*suleiman',
-    '*svend',
-    '*sym',
-    '*synthamin',
-    '*taher',
-    '*takashi',
-    '*tamil',
-    '*tamisuke',
-    '*taomati',
-    '*taro',
-    '*taysir',
-    '*teatao',
-    '*technical',
     '*telegu',
-    '*teofil',
-    '*text',
-    '*thai',
-    '*theo',
-    '*theodor',
-    '*theodore',
-    '*there',
-    '*think*',
-    '*this',
-    '*thiudoreiks',
-    '*thongyod',
-    '*tichaendepi',
-    '*timothy',
-    '*ting',
-    '*toi',
     '*tomio',
-    '*tomoji',
-    '*toshiki',
-    '*toumani',
-    '*town&rehy;send',
-    '*traian',
-    '*trinidad',
-    '*trip',
-    '*trong',
-    '*true*',
-    '*tseng',
-    '*ugo',
-    '*unchanged.',
-    '*under',
-    '*united',
-    '*until',
     '*us',
-    '*us&dollar;1.00=4.7191',
-    '*usamah',
-    '*uttar',
-    '*v&iacute;ctor',
-    '*valentin',
-    '*valeri',
-    '*valeriu',
-    '*vassilis',
-    '*vehbi',
-    '*victoire',
-    '*victor',
-    '*vincent',
-    '*vincenzo',
-    '*vinci',
-    '*virabongsa',
     '*virginio',
-    '*vladimir',
-    '*vo',
-    '*volodymyr',
-    '*voting',
-    '*vp',
-    '*vu',
-    '*wahiduddin',
-    '*waldemar',
-    '*walid',
-    '*walter',
-    '*washing',
-    '*water',
-    '*we',
-    '*weerasinghe',
-    '*wen',
     '*wendy',
-    '*were*',
-    '*werner',
-    '*wesley',
-    '*west',
-    '*western',
-    '*when',
-    '*william',
-    '*with',
-    '*won\'t*',
-    '*xie',
-    '*yadira',
-    '*yang',
-    '*yeazuddin',
-    '*yegor',
-    '*yi',
     '*ylli',
-    '*yoon',
-    '*yousef',
-    '*yousuf',
-    '*yozo',
-    '*yu',
-    '*yugoslavia',
-    '*yuji',
-    '*yury',
-    '*yuval',
-    '*zahiruddin',
-    '*zaki',
-    '*zbigniew',
-    '*zdenko',
-    '*zhu',
-    '*ziyad',
     '*zou',
-    '+&agr+&bgr',
-    '+&egr',
-    '+&pound;10',
-    '+&pound;100',
-    '+&pound;1455.72',
-    '+&pound;15',
-    '+&pound;17',
-    '+&pound;18',
-    '+&pound;2.25',
-    '+&pound;214.63',
-    '+&pound;482.93',
-    '+&pound;55',
-    '+&pound;900.63',
-    '+&pound;946.85',
-    '+\'circle\'',
     '++appointed',
-    '++elected',
-    '++elisabeth',
-    '+-',
-    '+-0.005%',
-    '+-0.25%',
-    '+-12v',
-    '+-30mv',
-    '+-5%',
-    '+-l',
-    '+/&mdash',
-    '+/-0.11',
-    '+/-0.31',
-    '+/-180',
-    '+/-3v',
-    '+/-pi',
     '+/sales',
-    '+0.0',
-    '+0.01',
-    '+0.05',
-    '+0.08p',
-    '+0.1',
-    '+0.16',
-    '+0.2',
-    '+0.25',
-    '+0.32',
-    '+0.35',
-    '+0.37p',
-    '+0.40p.',
-    '+0.58',
-    '+0.638',
-    '+0.7%',
     '+0.78p.cutters',
-    '+0.8%',
-    '+0.85p.baconers',
-    '+0.92',
-    '+026',
-    '+0700',
-    '+1%',
-    '+1&deg',
-    '+1&deg;10',
-    '+1.0',
-    '+1.06',
-    '+1.11p',
-    '+1.3',
-    '+1.42%/yr',
-    '+1.5kb',
-    '+1.7',
     '+1.72p',
-    '+1/',
-    '+10.7',
-    '+10.80',
-    '+100&deg',
-    '+10db',
-    '+11',
-    '+11.1',
-    '+11.5',
-    '+11.6',
-    '+11.7',
-    '+1121',
-    '+1190',
-    '+12.4',
-    '+120&deg;c',
-    '+13.0',
     '+13.1',
-    '+13.5',
-    '+13.8',
-    '+14.0',
-    '+14.00',
-    '+14.5',
-    '+14.6',
-    '+14.9',
-    '+15.4',
-    '+1503',
-    '+16.2',
-    '+16.8',
-    '+17.7',
-    '+170%',
-    '+179',
-    '+17mv',
     '+18%',
-    '+18&deg',
-    '+18.22%',
-    '+18.3',
-    '+18.7',
-    '+180%',
-    '+19%',
-    '+19.3',
-    '+19.5',
-    '+190',
-    '+1and',
-    '+2&aring',
-    '+2,650kms',
-    '+2.0',
-    '+2.1',
-    '+2.26',
     '+2.4',
-    '+2.5v',
-    '+2.60%/yr',
-    '+2.7%',
-    '+20&deg;c',
-    '+20.3',
-    '+20.4',
-    '+20.95',
-    '+200bp',
-    '+21.4',
-    '+21.72%',
-    '+2147483647',
-    '+2163',
-    '+224.701',
-    '+23.7',
-    '+24.80%',
     '+25',
-    '+25.00%',
-    '+25.4',
-    '+25.9',
-    '+252',
-    '+25v',
-    '+26&deg',
-    '+26.1',
-    '+28',
-    '+28.4',
-    '+28.7',
-    '+280%',
-    '+29',
-    '+29.9',
-    '+290%',
-    '+2b',
     '+2wm',
-    '+3&phgr',
-    '+3,978',
-    '+3.0',
-    '+3.31p.liveweight',
-    '+3.6%',
-    '+3.8%',
-    '+30&deg',
-    '+30.3',
-    '+32.0',
-    '+32.2',
-    '+33%',
-    '+33.4',
-    '+337',
-    '+34.5',
-    '+3400bp',
     '+35/100%',
-    '+36.3',
-    '+3600bp',
-    '+370%',
-    '+377.68396',
-    '+39',
-    '+3v',
-    '+4%',
-    '+4&deg;c',
-    '+4.15',
-    '+4.68p',
-    '+41',
-    '+412',
-    '+413',
-    '+42.1',
-    '+46',
     '+49.8',
-    '+5&deg;c',
-    '+5-3',
-    '+5.6',
-    '+5.7',
-    '+5.8',
-    '+500',
-    '+500%',
-    '+5000bp',
-    '+50mv',
-    '+51',
-    '+510%',
-    '+520%',
-    '+58&deg;c',
-    '+59.17%',
-    '+5v',
     '+6.2',
-    '+6.3',
-    '+6.5mm/-4.0mm',
-    '+6.64p',
-    '+6.8',
-    '+62',
-    '+63.8',
-    '+65',
-    '+66.3',
-    '+68.9',
-    '+7+21',
-    '+7,500=',
-    '+7.3',
-    '+70&deg;c',
-    '+720%',
-    '+8%',
     '+8.3',
-    '+8.49',
-    '+8.5',
-    '+8.8',
-    '+8.9',
-    '+80',
-    '+85',
-    '+903kg',
-    '+92',
-    '+991',
-    '+_1855',
-    '+a5',
-    '+a5-&commat;int(a5)',
-    '+ah',
-    '+and',
-    '+appointed',
     '+b1*b3*12',
-    '+b13/b8',
-    '+b4-b5',
-    '+b7/',
-    '+b7/b6',
-    '+b8-b11',
-    '+brig',
-    '+bt',
-    '+c10&lt&commat;datevalue(',
-    '+carlos',
-    '+chris',
-    '+college',
-    '+commodore',
-    '+crp',
-    '+d6',
-    '+def.',
     '+e',
-    '+e2/',
-    '+eddison',
-    '+english',
-    '+enos',
-    '+er',
-    '+fay',
-    '+female',
-    '+friedrich',
-    '+front',
-    '+g10&gt;10',
-    '+gerhard',
-    '+herbert',
-    '+his',
-    '+il-6',
-    '+in',
     '+j&uuml;rgen',
-    '+jk',
-    '+joshua',
-    '+juli&aacute;n',
-    '+krebs-henseleit',
-    '+kumbirai',
-    '+low',
-    '+matti',
-    '+n',
-    '+o=h',
-    '+open',
-    '+or',
-    '+p&amp;p',
-    '+pedro',
-    '+pure',
-    '+r',
     '+r2,800',
-    '+r4,100',
-    '+radiation',
-    '+re-election',
-    '+richard',
-    '+roberto',
-    '+sch200',
-    '+short',
-    '+simbi',
-    '+sydney',
-    '+tarja',
-    '+tuulikki',
-    '+ulises',
-    '+us&dollar;0.1',
-    '+us&dollar;1,000',
-    '+us&dollar;1,100',
     '+us&dollar;1,106',
-    '+us&dollar;1,160',
-    '+us&dollar;1,309',
-    '+us&dollar;1,646',
-    '+us&dollar;1,704',
-    '+us&dollar;1,800',
-    '+us&dollar;1,802',
-    '+us&dollar;1,861',
-    '+us&dollar;1,962',
-    '+us&dollar;1.4',
-    '+us&dollar;105.9',
-    '+us&dollar;11,000',
-    '+us&dollar;11,800,000',
-    '+us&dollar;11.3',
-    '+us&dollar;119.3',
-    '+us&dollar;12,400',
     '+us&dollar;13',
-    '+us&dollar;143',
-    '+us&dollar;16',
-    '+us&dollar;16,100',
-    '+us&dollar;2,010,000',
-    '+us&dollar;2,520',
-    '+us&dollar;2,670',
-    '+us&dollar;2,766',
-    '+us&dollar;2,840',
-    '+us&dollar;200',
-    '+us&dollar;212',
-    '+us&dollar;225.7',
-    '+us&dollar;241',
-    '+us&dollar;25',
-    '+us&dollar;255',
-    '+us&dollar;270',
     '+us&dollar;3,163,265',
-    '+us&dollar;3,270',
-    '+us&dollar;3,410,000',
-    '+us&dollar;3,545',
-    '+us&dollar;3,750',
-    '+us&dollar;3,910',
-    '+us&dollar;342',
-    '+us&dollar;356',
-    '+us&dollar;36',
-    '+us&dollar;389.2',
-    '+us&dollar;4,120',
-    '+us&dollar;4,300',
-    '+us&dollar;4,414',
-    '+us&dollar;4.9',
-    '+us&dollar;417',
-    '+us&dollar;439,000',
     '+us&dollar;450',
-    '+us&dollar;461',
-    '+us&dollar;48,400',
-    '+us&dollar;5',
-    '+us&dollar;5,000',
-    '+us&dollar;5,340',
-    '+us&dollar;5,410',
-    '+us&dollar;5,550',
-    '+us&dollar;5,800',
-    '+us&dollar;5,915',
-    '+us&dollar;50,000',
-    '+us&dollar;6,990',
-    '+us&dollar;6.3',
-    '+us&dollar;60.3',
-    '+us&dollar;600',
-    '+us&dollar;63.2',
     '+us&dollar;660',
-    '+us&dollar;696',
-    '+us&dollar;7,200',
-    '+us&dollar;71',
-    '+us&dollar;72',
-    '+us&dollar;734.6',
-    '+us&dollar;75',
-    '+us&dollar;76.1',
-    '+us&dollar;78,000',
-    '+us&dollar;78,800',
-    '+us&dollar;79',
-    '+us&dollar;792',
-    '+us&dollar;800',
-    '+us&dollar;87,000',
-    '+us&dollar;891',
-    '+us&dollar;908,000,000',
     '+us&dollar;94,790',
-    '+us&dollar;95',
-    '+victoria',
-    '+wait',
-    '+witness',
-    '+wolfgang',
-    '+z',
-    '+zk',
-    ',_a_great_deal',
-    ',_as_though',
-    ',_away_from',
-    ',_each_other',
-    ',_er_over_there',
-    ',_in_as_much_as',
-    ',_in_order',
-    ',_on_the_part_of',
     ',_on_to',
-    '-',
-    '-&bgr&ggr',
-    '-&bgr\'',
-    '-&dollar;24m',
-    '-&dollar;85,000',
-    '-&frac12&deg',
-    '-&frac23',
-    '-&ggr',
-    '-&lcub;gm&rcub',
-    '-&pound;10',
-    '-&pound;120pp',
-    '-&pound;20,850',
-    '-&pound;23,100',
-    '-&pound;250k',
-    '-&pound;30',
     '-&pound;60pp',
-    '-&psgr',
-    '-(1&times;2)-o',
-    '-(2-cyanoethyl)-',
-    '-(2.31)',
-    '-(2.85)',
-    '-(3)',
-    '-(4)',
-    '-(4,4\'-dimethoxytrityl)-3-deaza-2\'-deoxy-adenosine-3\'-',
-    '-(40)',
-    '-(7)',
-    '-(a.b)',
-    '-(d)',
-    '-(e)',
-    '-(i)',
-    '-(iii)',
     '-(v+1)',
-    '------',
-    '--------------------&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound',
-    '----ing',
-    '---n--',
-    '--are',
-    '--to',
-    '--which',
-    '-0.0015,1',
-    '-0.002',
-    '-0.007',
-    '-0.01%',
-    '-0.016',
-    '-0.025',
-    '-0.03',
-    '-0.035',
     '-0.04',
-    '-0.043',
-    '-0.065',
-    '-0.08',
-    '-0.08&deg;c',
-    '-0.083',
-    '-0.09',
-    '-0.1%',
-    '-0.11%',
-    '-0.15&deg',
-    '-0.15&deg;c',
-    '-0.17',
-    '-0.2',
-    '-0.2%',
-    '-0.21',
-    '-0.21%',
     '-0.25',
-    '-0.26',
-    '-0.27',
-    '-0.29',
-    '-0.316',
-    '-0.332',
-    '-0.332&divide;4',
-    '-0.34',
-    '-0.367',
-    '-0.42&deg;c',
-    '-0.47',
-    '-0.481',
-    '-0.482',
-    '-0.486',
-    '-0.4978',
-    '-0.4992',
     '-0.5,0,1',
-    '-0.597',
-    '-0.5e',
-    '-0.5wm',
-    '-0.6&deg',
-    '-0.60',
-    '-0.61%',
-    '-0.63',
-    '-0.67',
-    '-0.698',
-    '-0.7',
-    '-0.7%',
-    '-0.71',
-    '-0.75',
-    '-0.76',
-    '-0.76732',
     '-0.8&deg;c',
-    '-0.80',
-    '-0.85',
-    '-0.88',
-    '-0.9&deg',
-    '-0.91',
-    '-0.99',
-    '-0/-9',
-    '-07',
-    '-1%',
-    '-1&deg',
-    '-1&deg;c',
-    '-1,0,1,2,3',
-    '-1,2',
-    '-1,200',
-    '-1,357',
     '-1-piperazine',
-    '-1-propanesulphonate',
-    '-1-propylpyridinium',
-    '-1.01',
-    '-1.02',
-    '-1.05',
-    '-1.09',
-    '-1.1',
-    '-1.11',
-    '-1.19',
-    '-1.1kb',
-    '-1.2kb',
-    '-1.3%',
-    '-1.4',
-    '-1.5&deg;c',
-    '-1.56',
     '-1.76&deg',
-    '-1.7kb',
-    '-1.8&deg',
-    '-1.9%',
-    '-1/',
-    '-10&mdash;28&deg;c',
-    '-10,000',
-    '-10,300',
-    '-10.05',
-    '-10.2',
-    '-10.22%',
-    '-100&deg;c',
-    '-100,000',
-    '-103.4',
-    '-107',
-    '-1075',
     '-1086&ndash;1801',
-    '-10c',
-    '-11&deg;c',
-    '-11.2',
-    '-11.27',
-    '-11.3',
-    '-11.6%',
-    '-11.8',
-    '-11.8%',
-    '-110&deg;c',
-    '-110bp',
-    '-112',
-    '-118',
-    '-12%',
-    '-12&deg',
-    '-12.3',
     '-122',
-    '-123',
-    '-125',
-    '-126&deg;c',
-    '-127',
-    '-12d.',
-    '-13.2',
-    '-14-strong',
-    '-14.2',
-    '-14.81',
-    '-1406',
-    '-147',
-    '-15.5',
-    '-15.72',
-    '-15.82',
-    '-150&deg',
     '-16&deg',
-    '-16&deg;c',
-    '-16.0',
-    '-16.072',
-    '-16.4',
-    '-160&deg;c',
-    '-1607',
-    '-1679',
-    '-167deg',
-    '-17.2',
-    '-17.4%',
-    '-1725',
-    '-176',
-    '-1797',
-    '-18.1',
-    '-18.2',
     '-180',
-    '-180&deg',
-    '-1810.5',
-    '-1812.5',
-    '-186',
-    '-18c',
-    '-19.3',
-    '-190',
-    '-1944',
-    '-1966',
-    '-1980',
-    '-1984',
-    '-1987',
-    '-1kb',
-    '-1mm',
-    '-2&deg;c',
     '-2&frac12&deg',
-    '-2&phgr',
-    '-2,1',
-    '-2,10',
-    '-2,2,0',
-    '-2,2,2',
-    '-2.00',
-    '-2.03',
-    '-2.07',
-    '-2.1',
-    '-2.1%',
-    '-2.18%',
-    '-2.195',
-    '-2.2',
-    '-2.2&deg',
-    '-2.39',
     '-2.3c',
-    '-2.3kb',
-    '-2.68p.',
-    '-2.7%',
-    '-2.8',
-    '-2.8%',
-    '-2.81',
-    '-2.83&deg',
-    '-20-c',
-    '-20.4',
-    '-200',
-    '-200.8',
-    '-208',
-    '-20bp',
-    '-20c',
-    '-21.2&deg;c',
     '-21.4',
-    '-21.5',
-    '-2147483648',
-    '-217',
-    '-218',
-    '-22.0',
-    '-22.9',
-    '-22.9&deg;c',
-    '-222',
-    '-225&deg;c',
-    '-23&deg;c',
-    '-23.8',
-    '-2300',
-    '-230bp',
-    '-24.2',
-    '-24.4',
     '-243.01',
-    '-249',
-    '-25.5',
-    '-250',
-    '-250&deg;c',
-    '-250bp',
-    '-25c',
-    '-261',
-    '-269c',
-    '-27%',
-    '-27.6',
-    '-27.7',
-    '-270&deg;c',
-    '-273&deg;c',
-    '-273c',
-    '-2750',
     '-28&deg;c',
-    '-28.881',
-    '-280',
-    '-2800',
-    '-285bp',
-    '-28c',
-    '-29.2',
-    '-2cl',
-    '-2kb',
-    '-3\'',
-    '-3.01',
-    '-3.2%',
-    '-3.2bn',
-    '-3.5',
-    '-3.5%',
-    '-3.7',
     '-3.7bn',
-    '-3.8',
-    '-30.81',
-    '-300sal',
-    '-302',
-    '-306',
-    '-31%',
-    '-31.4',
-    '-31.67',
-    '-32%',
-    '-325',
-    '-32kms',
-    '-33%',
-    '-33.7',
-    '-34%',
-    '-340',
     '-35&deg',
-    '-3506',
-    '-35c',
-    '-35mv',
-    '-36&deg',
-    '-36&deg;c',
-    '-36.5',
-    '-36.7',
-    '-37&deg',
-    '-37&plusmn;4',
-    '-37.4',
-    '-37.7',
-    '-38.5',
-    '-381',
-    '-3c',
-    '-3h_',
     '-3hv',
-    '-4%',
-    '-4,724',
-    '-4-methyl-l-threonine',
-    '-4.2',
-    '-4.3',
-    '-4.6',
-    '-4.69',
-    '-4.8',
-    '-4.9',
-    '-40db',
-    '-42&deg',
-    '-42.5',
-    '-43',
-    '-43.16',
-    '-43.5',
     '-44&deg;06\'30',
-    '-44&deg;10\'',
-    '-44&deg;25\'20.2',
-    '-4466',
-    '-45.97%',
-    '-450',
-    '-46&deg',
-    '-460kms',
-    '-47%',
-    '-479',
-    '-4799',
-    '-48',
-    '-48%',
-    '-48&deg;c',
-    '-49',
-    '-491',
     '-4920',
-    '-494',
-    '-495',
-    '-5\'10',
-    '-5,000',
-    '-5,833',
-    '-5.3',
-    '-5.3%',
-    '-5.4',
-    '-5.5%',
-    '-5.98%',
-    '-5/3',
-    '-50%',
-    '-51&deg',
-    '-54.5',
-    '-540',
     '-549',
-    '-557&ndash;3194',
-    '-56&deg',
-    '-57',
-    '-57.1',
-    '-571.6',
-    '-573',
-    '-59.6',
-    '-5b',
-    '-5o&deg;c',
-    '-6%',
-    '-6.069984',
-    '-6.2',
-    '-6.3%',
-    '-6.4',
-    '-6.5%',
     '-6.7%',
-    '-60&deg',
-    '-600',
-    '-60db',
-    '-61',
-    '-62&deg;c',
-    '-62/-60',
-    '-63%',
-    '-639',
-    '-63f',
-    '-643',
-    '-65ar',
-    '-67r',
-    '-68&deg&ndash;77&deg;f',
-    '-693',
-    '-6h2o',
     '-7,442',
-    '-7,900',
-    '-7.4',
-    '-7.56',
-    '-70bp',
-    '-71&deg;c',
-    '-73.9',
-    '-74',
-    '-741',
-    '-75&deg;c',
-    '-76%',
-    '-760',
-    '-766',
-    '-769',
-    '-78%',
-    '-78&deg;c',
     '-78db',
-    '-7s.',
-    '-8.0',
-    '-8.00%',
-    '-8.1%',
-    '-8.2&deg;c',
-    '-8.5',
-    '-8.8%',
-    '-8.8&deg',
-    '-81',
-    '-81&ndash;748',
-    '-81.5',
-    '-81r.',
-    '-82.5',
-    '-83mv',
-    '-84',
     '-84.2',
-    '-84.8',
-    '-85&deg;c',
-    '-85.5',
-    '-86%',
-    '-8c',
-    '-9.0',
-    '-9.3',
-    '-9.5',
-    '-9.5%',
-    '-9.7',
-    '-9.734492',
-    '-9.9%',
-    '-900bp',
-    '-90bp',
-    '-90db',
     '-90mv',
-    '-921',
-    '-95',
-    '-96',
-    '-a(16&ndash;27)',
-    '-a(2&ndash;8)',
-    '-a-e',
-    '-a-half',
-    '-according',
-    '-account',
-    '-acetate',
-    '-achieving',
-    '-acpd',
-    '-acquisition',
-    '-across',
-    '-actions',
     '-activated',
-    '-activation',
-    '-actually',
-    '-ad',
-    '-adan',
-    '-adenosine-mediated',
-    '-adenosylhomocysteine',
-    '-adh',
-    '-advertising',
-    '-advising',
-    '-after',
-    '-akce',
-    '-al',
-    '-albeit',
-    '-alfred',
-    '-algae',
     '-ality',
-    '-alkyl',
-    '-along',
-    '-alright',
-    '-aluminium-arsenide',
-    '-always',
-    '-america',
-    '-american',
-    '-amine',
-    '-amino-4.hydroxy.pteridines',
-    '-aminocaproic',
-    '-aminoethyl',
-    '-aminosalicylic',
-    '-among',
-    '-amps',
-    '-anglicised',
     '-animal',
-    '-animate',
-    '-anion',
-    '-another-time',
-    '-ant',
-    '-anthony',
-    '-antiplasmin',
-    '-antitrypsin',
-    '-apr.',
-    '-arg-gly-asp-tripeptide',
-    '-arg-pro-ser-gln-',
-    '-arginine',
-    '-aristo',
-    '-aristotle',
-    '-armed',
-    '-ary\'',
     '-asconius',
-    '-ase',
-    '-asian',
-    '-aspartate',
-    '-aspartic',
-    '-astpase',
-    '-at',
-    '-atsuta',
-    '-b(32&ndash;36)',
-    '-b(46&ndash;52)',
-    '-b/2',
-    '-b2/12',
-    '-b35',
-    '-bal',
-    '-bathurst',
-    '-batsman',
     '-bc',
-    '-bed',
-    '-bedspace',
-    '-before',
-    '-begins',
-    '-begun',
-    '-behaviourist',
-    '-benzene',
-    '-benzoyl-l-tyrosine',
-    '-better-at-his-age',
-    '-biangu',
-    '-big',
-    '-bill',
-    '-biotin-pe',
-    '-birthday',
-    '-bis(l-aziridinyl)-n',
     '-biting',
-    '-ble',
-    '-bloc',
-    '-bloody-buggering-',
-    '-blue',
-    '-bolkow-blohm',
-    '-boot',
-    '-bought',
-    '-brain',
-    '-brie',
-    '-bromodeoxyuridine',
-    '-brought',
-    '-browne',
-    '-buildings',
-    '-built',
-    '-business',
     '-butylether',
-    '-bye',
-    '-c(40&ndash;44)',
-    '-c(69&ndash;84)',
-    '-c-c-c-c-',
-    '-c.c',
-    '-callisth',
-    '-capitalism',
-    '-carbon',
-    '-carboxylic',
-    '-carrying',
-    '-catalysed',
-    '-cattle',
-    '-cd3',
-    '-ceau&scedil;escu',
-    '-centred',
     '-ch',
-    '-chaff',
-    '-change',
-    '-cheek',
-    '-cheerful',
-    '-chen',
-    '-cheque',
-    '-chest-deep',
-    '-children',
-    '-cho',
-    '-cholesterol',
-    '-cides',
-    '-ck',
-    '-ck-',
-    '-claims',
-    '-clause',
     '-client',
-    '-cluster',
-    '-co',
-    '-co-nh-',
-    '-coachman',
-    '-coat',
-    '-col',
-    '-coloured',
-    '-columns',
-    '-combined',
-    '-commissural',
-    '-committees',
-    '-common',
-    '-compliant',
-    '-component',
-    '-compounds',
     '-congolese',
-    '-conjugated',
-    '-conscious',
-    '-consensus',
-    '-containing',
-    '-contributing',
-    '-control',
-    '-cooh',
-    '-cooks',
-    '-cote',
-    '-count',
-    '-counting',
-    '-covered',
-    '-crazed',
-    '-creet',
-    '-ct',
     '-cum-',
-    '-cw4',
-    '-d&lsqb;br2&rsqb/dt',
-    '-d(58&ndash;66)',
-    '-dame',
-    '-datp',
-    '-daughters',
-    '-dctp',
-    '-de-bigorre',
-    '-de-nil',
-    '-de-vie',
-    '-decay',
-    '-decisions',
-    '-decorated',
-    '-def.',
-    '-deleting',
     '-deletion',
-    '-dementia',
-    '-denis',
-    '-deploying',
-    '-depth',
-    '-desire',
-    '-despite',
-    '-destroying',
-    '-devices',
-    '-diamidino-2-phenylindole',
-    '-diamindino-2-phenylindole',
-    '-diamminedichloro-platinum(ii)',
-    '-dibenzoyl-5\'-',
-    '-dibromoindigotin',
-    '-diene',
-    '-digit',
     '-diisopropylphosphoramidite',
-    '-diketo',
-    '-dimensional',
-    '-dimethylammonio',
-    '-dimethylguanosine',
-    '-divisions',
-    '-dixon',
-    '-do',
-    '-dome',
-    '-dominant',
-    '-double',
-    '-doublethink\'',
-    '-doubling',
-    '-dp',
-    '-dq',
-    '-dressed',
     '-drive',
-    '-during',
-    '-dxs94-dxs17-tel',
-    '-e-',
-    '-e-n-bt',
-    '-ea-',
-    '-eane',
-    '-ease',
-    '-educated',
-    '-education',
-    '-ee',
-    '-eene',
-    '-eese',
-    '-eeze',
-    '-effect',
-    '-efficiency',
     '-eg',
-    '-egta',
-    '-eight',
-    '-eize',
-    '-emission',
-    '-employee',
-    '-employers',
-    '-en',
-    '-enable',
-    '-energy',
-    '-ensure',
-    '-enterprise',
-    '-ep',
-    '-ephedrine',
-    '-epithelial',
-    '-equal',
     '-equivalent',
-    '-ers',
-    '-ess',
-    '-ethanesulfonic',
-    '-european',
-    '-evaluation',
-    '-even',
-    '-exist',
-    '-expansionism',
-    '-experienced',
-    '-experiments',
-    '-extinction',
-    '-eze',
-    '-faced',
-    '-factors',
-    '-falling',
     '-false',
-    '-father',
-    '-fertilisers',
-    '-fetched',
-    '-ffr',
-    '-financed',
-    '-five',
-    '-fluorescein',
-    '-for',
-    '-forgotten',
-    '-forming',
-    '-fortune',
-    '-france',
-    '-friend',
-    '-fucopentaose',
-    '-fulness',
     '-funded',
-    '-fusion',
-    '-ga',
-    '-gal',
-    '-galactosidase-stained',
-    '-gastrin-17',
-    '-gate',
-    '-generating',
-    '-genes',
-    '-genpgkefdtpl-cooh',
-    '-gerlach',
-    '-german',
-    '-girl',
-    '-give',
-    '-glutamyltranspeptidase',
-    '-gly',
     '-glycerol',
-    '-go',
-    '-good',
-    '-granodiorite',
-    '-groups',
-    '-guangzhou',
-    '-h-',
-    '-halo-(het)aroyl',
-    '-haunting',
-    '-hcl-soluble',
-    '-headings',
-    '-helical',
-    '-helixes',
-    '-heraldic',
-    '-heregulins',
-    '-hilary',
     '-his',
-    '-holders',
-    '-however',
-    '-hung',
-    '-husband',
-    '-hydroxethyl',
-    '-hydroxy-4-cholesten-3-one',
-    '-hydroxyl',
-    '-i-e',
-    '-i-earned-it',
-    '-ible',
-    '-ieze',
-    '-il-6',
-    '-ill',
-    '-imaging',
-    '-in-file',
     '-in-file&lsqb;file',
-    '-incidents',
-    '-incomers',
-    '-inducing',
-    '-inefficient',
-    '-infiltration',
-    '-ingham',
-    '-innen',
-    '-input',
-    '-inschr',
-    '-inspired',
-    '-integrins',
-    '-into',
-    '-intrinsic',
-    '-invariably',
-    '-involved',
     '-iraqi',
-    '-isomer',
-    '-israeli',
-    '-it\'s-mine.',
-    '-ity',
-    '-ium',
-    '-jacques',
-    '-jean',
-    '-jean-paul',
-    '-jim',
-    '-john',
-    '-june',
-    '-justa',
-    '-keeping',
-    '-kg',
-    '-kid',
     '-kilometre',
-    '-kin',
-    '-king',
-    '-king/king',
-    '-koh',
-    '-kt',
-    '-ku',
-    '-lactoglobulin',
-    '-lacz',
-    '-land',
-    '-latent',
-    '-later',
-    '-launched',
-    '-law',
-    '-le',
-    '-lead',
     '-learned',
-    '-learning',
-    '-leben',
-    '-lee',
-    '-leg-theory',
-    '-leu-gly-gln-gly-ser-phe-arg-pro-ser-gln-gln-asn-',
-    '-ley',
-    '-line',
-    '-lined',
-    '-ling',
-    '-linguistic',
-    '-little',
-    '-locate',
-    '-long',
-    '-look',
-    '-looked',
     '-looking',
-    '-low',
-    '-lt.',
-    '-ltd',
-    '-luxembourg',
-    '-lying',
-    '-m2',
-    '-maintaining',
-    '-man',
-    '-managed',
-    '-manufactured',
-    '-margaret',
-    '-mariano',
-    '-maribor',
-    '-market',
-    '-mask',
     '-master',
-    '-may',
-    '-mediated',
-    '-meets-',
-    '-meets-brothers',
-    '-mem',
-    '-mem+offset',
-    '-men',
-    '-ment',
-    '-methionine',
-    '-methyl',
-    '-methyl-(4r)-4-',
-    '-methyl-d-aspartic',
-    '-methyl-d-glucamine',
-    '-methylation',
-    '-methylcytosine',
     '-methylguanine',
-    '-methyltransferase',
-    '-mi',
-    '-mickey',
-    '-microglobulin/',
-    '-mind',
-    '-minded',
-    '-mj&ouml;sen',
-    '-mom',
-    '-monomethyl-d-orginine',
-    '-monomethyl-l-orginine',
-    '-months',
-    '-more',
-    '-most',
-    '-mounted',
-    '-mounting',
     '-mr',
-    '-mutation',
-    '-my',
-    '-myc',
-    '-names',
-    '-ndi',
-    '-neuromuscular',
-    '-neutrino',
-    '-nien/-ney',
-    '-nine',
-    '-nitro-l-larginine',
-    '-nitroaniline',
-    '-nitrophenol',
-    '-njit',
-    '-no',
-    '-nor',
     '-norpa',
-    '-npc',
-    '-nya',
-    '-o-',
-    '-o-c-c-c-',
-    '-o-c-c-o-',
-    '-o-e',
-    '-o-okles',
-    '-occurrence',
-    '-oestradiol-activated',
-    '-of-ministry&rehy;fund',
-    '-official',
-    '-oge',
-    '-oic',
-    '-ol',
-    '-olide',
     '-ologies',
-    '-ologist',
-    '-on',
-    '-on-tees',
-    '-once',
-    '-ones',
-    '-only',
-    '-opera',
-    '-operated',
-    '-orang-utan',
-    '-ordinary',
-    '-organism',
-    '-other',
-    '-ous.',
-    '-out',
-    '-over',
     '-overlapping',
-    '-oxidation',
-    '-p1',
-    '-palimony',
-    '-paralysed',
-    '-parrhasius',
-    '-part',
-    '-parties',
-    '-pcr',
-    '-pen',
-    '-pentanolide',
-    '-people',
-    '-permeable',
-    '-person',
-    '-personal',
-    '-peterborough',
     '-phalloidin',
-    '-phenotype',
-    '-phenyl',
-    '-phenylglycine',
-    '-photochemical',
-    '-pink',
-    '-played',
-    '-ply',
-    '-policy',
-    '-pop',
-    '-possibly',
-    '-poste',
-    '-pq',
-    '-prefixing',
-    '-prepared',
-    '-preserved',
     '-price',
-    '-principal+taxthresh',
-    '-pro-ser-gln-gln-',
-    '-process',
-    '-producing',
-    '-products',
-    '-profits',
-    '-pronouncing',
-    '-proper',
-    '-prostaglandin',
-    '-protection',
-    '-pseudoephedrine',
-    '-pt&lcub;110&rcub',
-    '-pure',
-    '-pyran-2-one',
-    '-qdpliakadaqesrl-cooh',
     '-quinone',
-    '-r&eacute;citatif-ariette',
-    '-ranging',
-    '-rather',
-    '-reactive',
-    '-realised',
-    '-rearing',
-    '-rediffusion',
-    '-reducing',
-    '-reflection',
-    '-regarded',
-    '-regulation',
-    '-remains',
-    '-renault',
-    '-required',
-    '-resin-coated',
     '-resistant',
-    '-retinoic',
-    '-returning',
-    '-ria',
-    '-rich',
-    '-richard',
-    '-right',
-    '-ring',
-    '-rise',
-    '-room',
-    '-roundel',
-    '-rows',
-    '-royal',
-    '-ruled',
-    '-run',
-    '-running',
     '-s.t-',
-    '-saturated',
-    '-saver',
-    '-say',
-    '-scale',
-    '-scan',
-    '-scarce',
-    '-sce',
-    '-sch85,900',
-    '-schematic',
-    '-schemed',
-    '-seat',
-    '-section',
-    '-sectoral',
-    '-seeking',
-    '-seen',
     '-senile',
-    '-sense',
-    '-sentimental',
-    '-sergeant',
-    '-seven',
-    '-shape',
-    '-shapes',
-    '-shetland',
-    '-ship',
-    '-short',
-    '-shrug',
-    '-side',
-    '-sion',
-    '-sister',
-    '-sisters',
-    '-sk-/',
     '-slo-vak-i-a',
-    '-smelling',
-    '-so-vak-',
-    '-sodium',
-    '-something',
-    '-son',
-    '-sounding',
-    '-source',
-    '-speak',
-    '-spot',
-    '-squeezing',
-    '-staff',
-    '-stained',
-    '-star',
-    '-status',
-    '-ster',
     '-sters',
-    '-stiglitz',
-    '-still',
-    '-subfamily',
-    '-substrate',
-    '-subunit',
-    '-successful',
-    '-sulphate',
-    '-superimposed',
-    '-sussex',
-    '-swedish',
-    '-system',
-    '-t8',
-    '-tactile',
-    '-tailed',
-    '-tak',
     '-talking',
-    '-taxthresh',
-    '-teeth',
-    '-ter',
-    '-tetradecanoylphorbol-13-acetate',
-    '-tetrathiafulvalene',
-    '-their',
-    '-them',
-    '-then',
-    '-these',
-    '-thial',
-    '-thinking',
-    '-thiol',
-    '-thirsty',
-    '-thomas',
-    '-thorp',
     '-through',
-    '-thus',
-    '-ti',
-    '-till',
-    '-time',
-    '-timetable',
-    '-to-evolutionary',
-    '-to-present',
-    '-tocopherol',
-    '-toluenesulphonate',
-    '-ton',
-    '-too',
-    '-towards',
-    '-transcendental',
-    '-transfected',
-    '-transmitting',
     '-triine',
-    '-tris(hydroxymethyl)methyl-2-aminoethane-sulphonic',
-    '-trisphosphate',
-    '-ture',
-    '-twelve',
-    '-types',
-    '-under',
-    '-understanding',
-    '-une',
-    '-unless',
-    '-urokinase',
-    '-us&dollar;1,028.6',
-    '-us&dollar;1,045',
-    '-us&dollar;1,060',
-    '-us&dollar;1,112',
-    '-us&dollar;1,142.85',
     '-us&dollar;1,176',
-    '-us&dollar;1,182.5',
-    '-us&dollar;1,202',
-    '-us&dollar;1,260',
-    '-us&dollar;1,300',
-    '-us&dollar;1,312',
-    '-us&dollar;1,326',
-    '-us&dollar;1,444.4',
-    '-us&dollar;1,499',
-    '-us&dollar;1,584',
-    '-us&dollar;1,600',
-    '-us&dollar;1,800',
-    '-us&dollar;1.170',
-    '-us&dollar;1.3',
-    '-us&dollar;1.65',
-    '-us&dollar;10,932',
     '-us&dollar;101.7',
-    '-us&dollar;103',
-    '-us&dollar;107',
-    '-us&dollar;108,600',
-    '-us&dollar;11,640',
-    '-us&dollar;111',
-    '-us&dollar;115,000',
-    '-us&dollar;12,280',
-    '-us&dollar;1200',
-    '-us&dollar;122',
-    '-us&dollar;127.5',
-    '-us&dollar;127.8',
-    '-us&dollar;129',
-    '-us&dollar;13',
-    '-us&dollar;13.6',
-    '-us&dollar;130',
     '-us&dollar;131',
-    '-us&dollar;133',
-    '-us&dollar;138',
-    '-us&dollar;14',
-    '-us&dollar;147.5',
-    '-us&dollar;15,677',
-    '-us&dollar;164.4',
-    '-us&dollar;165,000,000',
-    '-us&dollar;17',
-    '-us&dollar;170',
-    '-us&dollar;174,400,000',
-    '-us&dollar;179',
-    '-us&dollar;18',
-    '-us&dollar;18.9',
-    '-us&dollar;183',
-    '-us&dollar;19.2',
     '-us&dollar;19.4',
-    '-us&dollar;191',
-    '-us&dollar;198.6',
-    '-us&dollar;199',
-    '-us&dollar;2,000',
-    '-us&dollar;2,025',
-    '-us&dollar;2,029',
-    '-us&dollar;2,400',
-    '-us&dollar;2,500',
-    '-us&dollar;2,998',
-    '-us&dollar;20',
-    '-us&dollar;200',
-    '-us&dollar;203.7',
-    '-us&dollar;206.3',
-    '-us&dollar;210',
-    '-us&dollar;225',
     '-us&dollar;228',
-    '-us&dollar;23.9',
-    '-us&dollar;24.2',
-    '-us&dollar;245',
-    '-us&dollar;25.2',
-    '-us&dollar;250',
-    '-us&dollar;258',
-    '-us&dollar;261',
-    '-us&dollar;266',
-    '-us&dollar;267',
-    '-us&dollar;278.5',
-    '-us&dollar;28',
-    '-us&dollar;281,000,000',
-    '-us&dollar;285',
-    '-us&dollar;286.5',
-    '-us&dollar;288.7',
     '-us&dollar;29,000',
-    '-us&dollar;29.2',
-    '-us&dollar;3,100',
-    '-us&dollar;3,152',
-    '-us&dollar;3,200',
-    '-us&dollar;3,230',
-    '-us&dollar;3,262',
-    '-us&dollar;3,522',
-    '-us&dollar;3,647',
-    '-us&dollar;3,678',
-    '-us&dollar;3,756',
-    '-us&dollar;3.8',
-    '-us&dollar;300,000,000',
-    '-us&dollar;304',
-    '-us&dollar;307',
-    '-us&dollar;307.2',
     '-us&dollar;31',
-    '-us&dollar;310',
-    '-us&dollar;316',
-    '-us&dollar;330.6',
-    '-us&dollar;35',
-    '-us&dollar;350',
-    '-us&dollar;358',
-    '-us&dollar;359',
-    '-us&dollar;37',
-    '-us&dollar;372',
-    '-us&dollar;373,300,000',
-    '-us&dollar;380',
-    '-us&dollar;394',
-    '-us&dollar;4,000',
-    '-us&dollar;4,097',
-    '-us&dollar;4,201',
     '-us&dollar;4,500',
-    '-us&dollar;4,900',
-    '-us&dollar;4.5',
-    '-us&dollar;403.7',
-    '-us&dollar;405',
-    '-us&dollar;42.7',
-    '-us&dollar;424',
-    '-us&dollar;43',
-    '-us&dollar;436',
-    '-us&dollar;44.3',
-    '-us&dollar;443',
-    '-us&dollar;46.4',
-    '-us&dollar;464',
-    '-us&dollar;467',
-    '-us&dollar;476',
-    '-us&dollar;48.9',
     '-us&dollar;485',
-    '-us&dollar;489.9',
-    '-us&dollar;5,000',
-    '-us&dollar;5,200',
-    '-us&dollar;5,905',
-    '-us&dollar;5.2',
-    '-us&dollar;5.4',
-    '-us&dollar;516',
-    '-us&dollar;52',
-    '-us&dollar;52,074,829',
-    '-us&dollar;520',
-    '-us&dollar;53.9',
-    '-us&dollar;54.2',
-    '-us&dollar;544.2',
-    '-us&dollar;554',
-    '-us&dollar;556.3',
     '-us&dollar;6,646',
-    '-us&dollar;600',
-    '-us&dollar;600,000',
-    '-us&dollar;61.7',
-    '-us&dollar;62',
-    '-us&dollar;650',
-    '-us&dollar;699',
-    '-us&dollar;7',
-    '-us&dollar;7.6',
-    '-us&dollar;70.6',
-    '-us&dollar;705',
-    '-us&dollar;714.5',
-    '-us&dollar;72.8',
-    '-us&dollar;739',
-    '-us&dollar;740',
-    '-us&dollar;75.3',
     '-us&dollar;760',
-    '-us&dollar;763',
-    '-us&dollar;8,100',
-    '-us&dollar;8,330',
-    '-us&dollar;810',
-    '-us&dollar;82.3',
-    '-us&dollar;850',
-    '-us&dollar;859',
-    '-us&dollar;86',
-    '-us&dollar;886,000,000',
-    '-us&dollar;89',
-    '-us&dollar;9,570',
-    '-us&dollar;9.4',
-    '-us&dollar;9.6',
-    '-us&dollar;90',
-    '-us&dollar;91.6',
     '-us&dollar;926',
-    '-us&dollar;957',
-    '-us&dollar;96.8',
-    '-us&dollar;966',
-    '-us&dollar;987',
-    '-us&dollar;99.9',
-    '-uv',
-    '-v-',
-    '-v-ascomit',
-    '-v-bastington',
-    '-v-bentall',
-    '-v-berkshire',
-    '-v-c.i.e.',
-    '-v-commercial',
-    '-v-courtaulds',
-    '-v-cray',
     '-v-de',
-    '-v-eccleston',
-    '-v-evenett',
-    '-v-f',
-    '-v-islington',
-    '-v-lodge',
-    '-v-longridge',
-    '-v-mcdermott',
-    '-v-mediterranean',
-    '-v-merton',
-    '-v-metropolitan',
-    '-v-michael',
-    '-v-morley',
-    '-v-national',
-    '-v-nigel',
-    '-v-scottish',
     '-v-southern',
-    '-v-targus',
-    '-v-templar',
-    '-v-thompson',
-    '-v-torfaen',
-    '-v-wade',
-    '-v-webb',
-    '-value',
-    '-valve',
-    '-variables',
-    '-variants',
-    '-venereologists',
-    '-vine',
-    '-voice',
-    '-voiced',
-    '-washington',
     '-week-old',
-    '-went',
-    '-what-this-refit-has-just-cost-us',
-    '-where',
-    '-which',
-    '-who',
-    '-wielding',
-    '-wife',
-    '-winged',
-    '-wise',
-    '-woman',
-    '-women',
-    '-wordsworth/lso',
-    '-would',
-    '-wycombe',
-    '-xxxx',
     '-year-old',
-    '-yi',
-    '-ymps',
-    '-yne',
-    '...',
-    '.000',
-    '.008&ins',
-    '.009&ins',
-    '.009&ins;s',
-    '.009s',
-    '.010&ins;s',
-    '.010-.047',
-    '.011',
-    '.011-.52',
-    '.012',
-    '.013',
     '.013-.056',
-    '.013-.60',
-    '.016',
-    '.017',
-    '.03',
-    '.039',
-    '.040&ins',
-    '.046',
-    '.047cm',
-    '.058',
-    '.05mm',
-    '.07%',
-    '.073',
-    '.096cm',
-    '.098&ins',
-    '.0999999',
     '.1,350',
-    '.1.6(b)',
-    '.1000',
-    '.1070',
-    '.1080',
-    '.11',
-    '.110&ins',
-    '.1108.4',
-    '.1110',
-    '.1125',
-    '.1130&ndash;1197',
-    '.1136',
-    '.1150',
-    '.1160',
-    '.1170',
-    '.12',
     '.1226',
-    '.1230&ndash;60',
-    '.1235',
-    '.1240',
-    '.1245',
-    '.1245&ndash;8',
-    '.1253&ndash;6',
-    '.1267&ndash',
-    '.1282',
-    '.1284',
-    '.1290',
-    '.1296',
-    '.1297',
-    '.1307&ndash;12',
-    '.1309&ndash;32',
-    '.1310&ndash;19',
     '.1311',
-    '.1326',
-    '.1350',
-    '.1410',
-    '.1423',
-    '.1440',
-    '.145',
-    '.1469',
-    '.1470',
-    '.1478&ndash;1503',
-    '.1485&ndash;1547',
-    '.1489&ndash;99',
-    '.1497',
-    '.1505',
-    '.1510',
-    '.1525',
     '.1532',
-    '.1539&ndash;40',
-    '.1543',
-    '.1547',
-    '.1550',
-    '.1556',
-    '.1568',
-    '.1575',
-    '.1588',
-    '.1590&ndash;1640',
-    '.1591',
-    '.1592',
-    '.1596',
-    '.15p',
-    '.1608',
-    '.1615',
     '.1618',
-    '.1621&ndash;46',
-    '.1633',
-    '.1634&ndash;8',
-    '.1635',
-    '.1637',
-    '.1637&ndash',
-    '.1647&ndash;1704',
-    '.1650',
-    '.1657',
-    '.1659',
-    '.166',
-    '.1660',
-    '.1662',
-    '.1666',
-    '.1669',
     '.1675',
-    '.1681&ndash;1734',
-    '.1698',
-    '.1699',
-    '.1708',
-    '.1725',
-    '.1726',
-    '.1730',
-    '.1732&ndash;9',
-    '.1735',
-    '.1736',
-    '.1738&ndash;1826',
-    '.1739',
-    '.1744',
-    '.1746',
-    '.1750',
     '.1750&ndash;2',
-    '.1751',
-    '.1752',
-    '.1753',
-    '.1754',
-    '.1756',
-    '.1759',
-    '.1760',
-    '.1765',
-    '.1768',
-    '.1770',
-    '.1773',
-    '.1774',
-    '.1780',
-    '.1782',
-    '.1783',
     '.1783/4',
-    '.1784',
-    '.1786',
-    '.1787',
-    '.1788',
-    '.1789&ndash;1857',
-    '.1791',
-    '.1792&ndash;1871',
-    '.1793',
-    '.1794',
-    '.1798',
-    '.1799',
-    '.1803',
-    '.1806',
-    '.1816&ndash;18',
-    '.1818',
     '.1821',
-    '.1827',
-    '.1828',
-    '.1834',
-    '.1840',
-    '.1846',
-    '.1853',
-    '.1855',
-    '.1858',
-    '.1881',
-    '.1886/7',
-    '.1901',
-    '.1910&ndash;14',
-    '.1982',
-    '.1984',
-    '.1985',
     '.1986',
-    '.2(b)',
-    '.2.1',
-    '.20',
-    '.200&ndash;120',
-    '.22+',
-    '.24',
-    '.242199',
-    '.254&ndash;184',
-    '.28',
-    '.2h2o',
-    '.2l',
-    '.3&ndash',
-    '.3&ndash;8',
-    '.3(b)',
-    '.30',
     '.303-in',
-    '.303s',
-    '.30am-4.30pm',
-    '.333',
-    '.33mm',
-    '.34.4',
-    '.350',
-    '.35m',
-    '.367&ndash;282',
-    '.38\'s',
-    '.39',
-    '.397',
-    '.40',
-    '.44&ndash;40',
-    '.450',
-    '.45s',
     '.5%',
-    '.5&ndash;1%',
-    '.5-.75',
-    '.5.6',
-    '.500',
-    '.54',
-    '.550',
-    '.590',
-    '.5kg',
-    '.5m',
-    '.5p/kwh',
-    '.6(a)',
-    '.600',
-    '.625',
-    '.63',
-    '.65',
     '.66',
-    '.678&ndash;9',
-    '.6mm',
-    '.71',
-    '.72.3',
-    '.720',
-    '.72sec',
-    '.74',
-    '.75p',
-    '.77',
-    '.7h',
-    '.7m',
-    '.7mph',
-    '.805',
-    '.810',
-    '.82',
     '.820&ndash;30',
-    '.830',
-    '.84p',
-    '.860',
-    '.8pc',
-    '.904',
-    '.999',
-    '.cgm',
-    '.cut',
-    '.dxf',
-    '.eps',
-    '.gif',
-    '.img',
-    '.pic',
-    '.scv',
-    '.scx',
     '/&bgr',
-    '/&dgr',
-    '/&dgr/',
-    '/&dgr;d',
-    '/&dgr;s',
-    '/&egr/&gt',
-    '/&micro',
-    '/&sgr;c',
-    '/&tgr',
-    '/-s.p-',
-    '//t/',
-    '/0',
-    '/1/',
-    '/10',
-    '/12',
-    '/162b',
     '/200pc',
-    '/2m',
-    '/3',
-    '/31',
-    '/3220',
-    '/39',
-    '/4in',
-    '/5',
-    '/5%co',
-    '/500ml',
-    '/59',
-    '/60',
-    '/8',
-    '/8&ndash;57\'',
-    '/884979',
-    '/8in',
     '/95%',
-    '/a/&gt',
-    '/adviser',
-    '/advocation',
-    '/afternoon',
-    '/ai',
-    '/album',
-    '/all',
-    '/an',
-    '/and/',
-    '/animal',
-    '/anti-fasciclin',
-    '/anti-nazi',
-    '/ap',
-    '/appearance/',
-    '/application',
     '/ars',
-    '/as',
-    '/au/',
-    '/auto',
-    '/ay/',
-    '/b',
-    '/babyliss',
-    '/barbirolli',
-    '/bassist',
-    '/beaulieu',
-    '/been',
-    '/best',
-    '/bike',
-    '/birds',
-    '/bo:t/',
-    '/body',
     '/bookshelf',
-    '/bradstone',
-    '/bre',
-    '/brit',
-    '/british',
-    '/bsco',
-    '/but',
-    '/ca',
-    '/calmodulin-dependent',
-    '/camera',
-    '/can',
-    '/canderel',
-    '/carousel',
-    '/cd3',
-    '/cherwell',
-    '/children',
     '/clayton-birmingham-northampton',
-    '/cm',
-    '/co',
-    '/communist',
-    '/community',
-    '/company',
-    '/compar',
-    '/comparison',
-    '/conds',
-    '/conflict',
-    '/coral',
-    '/crania',
-    '/cutty',
-    '/cyclophilin',
-    '/d2',
-    '/da/',
     '/dark',
-    '/deceleration',
-    '/dei/',
-    '/del',
-    '/devised',
-    '/dictionary',
-    '/dip.',
-    '/director',
-    '/discussion',
-    '/dl',
-    '/dna',
-    '/doll',
-    '/don',
-    '/doz/',
-    '/dr/',
-    '/drive',
     '/dt',
-    '/dutoit',
-    '/e&bgr',
-    '/e/',
-    '/econ/soc',
-    '/ed',
-    '/efamolia',
-    '/ei',
-    '/end',
-    '/energy',
-    '/enfolding',
-    '/f\'',
-    '/fa/',
-    '/fallen',
-    '/famennian',
-    '/family',
     '/feb.',
-    '/fighting',
-    '/fl/',
-    '/flying',
-    '/follow',
-    '/foreign',
-    '/formal',
-    '/fri',
-    '/frigoverre',
-    '/from',
-    '/fs',
-    '/full',
-    '/fvc',
-    '/gdp',
-    '/general',
-    '/get',
     '/glacial',
-    '/glenmuir',
-    '/global',
-    '/gnc',
-    '/good',
-    '/graph',
-    '/gs-ana',
-    '/gyro',
-    '/h-2',
-    '/ha',
-    '/ha/p.a.',
-    '/ha457',
-    '/had',
-    '/hair',
-    '/hang',
-    '/harrison',
     '/harvard',
-    '/he',
-    '/heat',
-    '/her',
-    '/hereford',
-    '/herreweghe',
-    '/hi',
-    '/homonym',
-    '/hv',
-    '/i//',
-    '/id=&lt;process',
-    '/if',
-    '/insp',
-    '/it',
-    '/january',
-    '/jersey',
     '/keep',
-    '/kew',
-    '/kh',
-    '/kiddibitz',
-    '/kidlington',
-    '/kill',
-    '/kl/',
-    '/kodak',
-    '/kooshies',
-    '/kpmg',
-    '/ks/',
-    '/label=ll0323',
-    '/lambda',
-    '/lancashire',
-    '/last',
-    '/length',
     '/les',
-    '/levi',
-    '/lifespan&mdash;user/',
-    '/like',
-    '/litre',
-    '/lovers',
-    '/lp1',
-    '/lst/',
-    '/lwoc',
-    '/mada/',
-    '/made',
-    '/mardi',
-    '/matchstick',
-    '/mbl/',
-    '/mcnab',
-    '/mean',
     '/mechanisms',
-    '/meik/',
-    '/moby',
-    '/mol',
-    '/moschino',
-    '/most',
-    '/moth',
-    '/mps/',
-    '/munch',
-    '/my',
-    '/myxomatosis',
-    '/need',
-    '/neks',
-    '/new',
-    '/night',
-    '/nk',
     '/nk/',
-    '/noilly',
-    '/nor',
-    '/notebook',
-    '/now',
-    '/nz/',
-    '/open/shared',
-    '/or',
-    '/output',
-    '/output&lsqb=file-name&rsqb',
-    '/oxford',
-    '/p.m',
-    '/pa/',
-    '/passing',
-    '/penberi',
-    '/pg',
     '/phospholipid-dependent',
-    '/pi',
-    '/pi:s',
-    '/pitman',
-    '/pornos',
-    '/praising',
-    '/pre-training',
-    '/price',
-    '/prince',
-    '/probal',
-    '/prokoviev',
-    '/proteinase',
-    '/provider',
-    '/pub/case/casemsg.ps',
-    '/public',
-    '/pulling',
     '/r/-dropping',
-    '/r3',
-    '/rada',
-    '/rape',
-    '/ravel',
-    '/reason',
-    '/return&mdash;detail/',
-    '/rn50',
-    '/sa',
-    '/salary/',
-    '/sands',
-    '/saxby',
-    '/se:z/',
-    '/seminar',
-    '/she',
-    '/sir',
     '/sirm',
-    '/sk/in',
-    '/so:r/',
-    '/something',
-    '/songwriter',
-    '/sounds',
-    '/speak',
-    '/special',
-    '/srrna',
-    '/st',
-    '/standard',
-    '/status&mdash;return/',
-    '/stomatal',
-    '/strain',
-    '/studied',
-    '/suh/',
     '/superman',
-    '/t/.',
-    '/teik',
-    '/telephone',
-    '/telkr',
-    '/tem',
-    '/their',
-    '/then',
-    '/thou',
-    '/though',
-    '/thy',
-    '/ting/',
-    '/to',
-    '/took',
-    '/toshiba',
-    '/total',
     '/towards',
-    '/translation=concealed',
-    '/traveller',
-    '/trends',
-    '/tri',
-    '/triacs',
-    '/ueilz/',
-    '/und',
-    '/user&mdash;input/',
-    '/ushers/bridesmaids/pageboys',
-    '/v',
-    '/vendors',
-    '/verbar',
-    '/voice',
-    '/wa/',
-    '/waitress',
     '/wallace',
-    '/walter',
-    '/wed',
-    '/weetabix',
-    '/weilz/',
-    '/wella',
-    '/wengen/murren',
-    '/whatever',
-    '/while',
-    '/whitefly',
-    '/why',
-    '/winter',
-    '/wiv/',
-    '/wnt-1',
-    '/woods',
-    '/xt/',
     '/y',
-    '/y/',
-    '/you',
-    '/younger-brother',
-    '/your',
-    '/youth',
-    '/z',
-    '/zero',
-    '0&deg&ndash;45&deg',
-    '0&deg/180&deg',
-    '0&mdash;1mmday',
-    '0&mdash;22&deg;c',
-    '0&mgr;m',
-    '0&middot;0001',
-    '0&middot;0005&ndash;0&middot;85',
-    '0&middot;002',
     '0&middot;004',
-    '0&middot;005',
-    '0&middot;01%',
-    '0&middot;02',
-    '0&middot;03',
-    '0&middot;035',
-    '0&middot;07',
-    '0&middot;08',
-    '0&middot;1%',
-    '0&middot;125',
-    '0&middot;13',
-    '0&middot;30',
-    '0&middot;33',
-    '0&middot;34',
-    '0&middot;36',
-    '0&middot;38',
     '0&middot;45',
-    '0&middot;55',
-    '0&middot;56',
-    '0&middot;58',
-    '0&middot;63',
-    '0&middot;68',
-    '0&middot;7',
-    '0&middot;717',
-    '0&middot;75',
-    '0&middot;87',
-    '0&middot;98',
-    '0&middot;99',
-    '0&ndash;0&ndash;4',
-    '0&ndash;0-10',
-    '0&ndash;0.033',
-    '0&ndash;0.1',
     '0&ndash;0.4',
-    '0&ndash;0.52',
-    '0&ndash;0000',
-    '0&ndash;00017',
-    '0&ndash;002',
-    '0&ndash;0040',
-    '0&ndash;05',
-    '0&ndash;1&ndash;0',
-    '0&ndash;1&ndash;0&ndash;5%',
-    '0&ndash;1,15min',
-    '0&ndash;1.0',
-    '0&ndash;1.2',
-    '0&ndash;1000',
-    '0&ndash;1000m',
-    '0&ndash;1023',
-    '0&ndash;11&ndash;0',
     '0&ndash;11&ndash;8',
-    '0&ndash;110mph',
-    '0&ndash;12',
-    '0&ndash;120',
-    '0&ndash;13%',
-    '0&ndash;142',
-    '0&ndash;15&ndash;0',
-    '0&ndash;150',
-    '0&ndash;15v',
-    '0&ndash;160',
-    '0&ndash;17',
-    '0&ndash;2%',
-    '0&ndash;2&deg;c',
-    '0&ndash;2&ndash;8',
-    '0&ndash;2.6',
-    '0&ndash;20',
     '0&ndash;22%',
-    '0&ndash;270&deg',
-    '0&ndash;29',
-    '0&ndash;2900',
-    '0&ndash;2a',
-    '0&ndash;2cm',
-    '0&ndash;3&ndash;0',
-    '0&ndash;3&ndash;11',
-    '0&ndash;3.3',
-    '0&ndash;30,000rpm',
-    '0&ndash;303',
-    '0&ndash;31',
-    '0&ndash;316',
-    '0&ndash;32',
-    '0&ndash;320',
-    '0&ndash;35',
     '0&ndash;36',
-    '0&ndash;37.6',
-    '0&ndash;39.8',
-    '0&ndash;4&deg;c',
-    '0&ndash;400rpm',
-    '0&ndash;45&deg',
-    '0&ndash;4940',
-    '0&ndash;4pc',
-    '0&ndash;5&ndash;0',
-    '0&ndash;5&ndash;8',
-    '0&ndash;50&deg;c',
-    '0&ndash;52',
-    '0&ndash;5a',
-    '0&ndash;6&ndash;0t',
-    '0&ndash;6&ndash;2t',
-    '0&ndash;7%',
     '0&ndash;7&ndash;2',
-    '0&ndash;72%',
-    '0&ndash;740',
-    '0&ndash;75%',
-    '0&ndash;8%',
-    '0&ndash;8&ndash;12',
-    '0&ndash;8.9%',
-    '0&ndash;800&ndash;444&ndash;888',
-    '0&ndash;800&ndash;89&ndash;1390',
-    '0&ndash;85',
-    '0&ndash;8:1',
-    '0&ndash;8tpk',
-    '0&ndash;9&ndash;8',
-    '0&ndash;955',
-    '0&ndash;99',
-    '0&prime;44&prime',
     '0&prime;45&prime',
-    '0&prime;53&prime',
-    '0&rarr;0',
-    '0&times;20',
-    '0\'0',
-    '0\'hare',
-    '0\'leary',
-    '0\'shaughnessey',
-    '0(b)',
-    '0,00',
-    '0,1&frac12',
-    '0,1&frac13,0',
-    '0,1,4',
-    '0,14',
-    '0,5',
-    '0-0-0&verbar&verbar;b4&verbar&verbar;16',
     '0-002550202',
-    '0-04-445773-1.',
-    '0-07-881658-0',
-    '0-071054170',
-    '0-0a',
-    '0-1.5',
-    '0-10',
-    '0-10&deg;c',
-    '0-100',
-    '0-11-494196-3',
-    '0-11-630953-9',
-    '0-11-630954-7',
-    '0-132',
-    '0-136563724',
-    '0-19-506238-8.',
-    '0-19-820219-9.',
     '0-19-822651-9',
-    '0-192618849',
-    '0-192619403',
-    '0-2-7',
-    '0-241-12999-0.',
-    '0-30',
-    '0-300056834',
-    '0-333-44256-3',
-    '0-333-49458-x',
-    '0-333-49854-2',
-    '0-333-49855-0',
-    '0-335-09946-7',
-    '0-340553022',
-    '0-340557389',
-    '0-393710130',
-    '0-397511213',
     '0-39751297x',
-    '0-397513135',
-    '0-4',
-    '0-4-0-',
-    '0-4-2s',
-    '0-4-4-0',
-    '0-4-ost',
-    '0-4-owt',
-    '0-40cm',
-    '0-412-32530-6',
-    '0-412-32730-9',
-    '0-412-33540-9',
-    '0-45cm',
-    '0-50',
-    '0-521413230',
-    '0-540-e4c5',
     '0-6-0-',
-    '0-6-0-q',
-    '0-6-0wt',
-    '0-6-2s',
-    '0-6-4t',
-    '0-6-odh',
-    '0-6-osts',
-    '0-60',
-    '0-7',
-    '0-702015741',
-    '0-702017361',
-    '0-7137',
-    '0-7190-2258-4',
-    '0-721648126',
-    '0-7457-0234-1',
-    '0-7486-0319-2.',
     '0-8-0',
-    '0-8240-7818-7.',
-    '0-84934915x',
-    '0-849355052',
-    '0-865420904',
-    '0-890895465',
-    '0-90cm',
-    '0-945776-18-7',
-    '0-95',
-    '0-9508900-4-9.',
-    '0-bahn',
-    '0-deethylase',
-    '0-l2off/livestock',
-    '0-law',
-    '0-prefix',
-    '0-ring',
     '0-s',
-    '0-to-60',
-    '0-year-old',
-    '0-z',
-    '0.0&ndash;0.4',
-    '0.0&ndash;0.9',
-    '0.0&ndash;1.7',
-    '0.0&ndash;2.2',
-    '0.0&ndash;2.3',
-    '0.0&ndash;75%',
-    '0.000',
-    '0.00000001%',
-    '0.0000001',
-    '0.00004',
-    '0.00004%',
-    '0.0001%',
     '0.0001557',
-    '0.000252',
-    '0.0003',
-    '0.0004',
-    '0.00041',
-    '0.0005%',
-    '0.0006',
-    '0.00064',
-    '0.0008',
-    '0.001%',
-    '0.001&lt;p&lt;0.0001',
-    '0.001&ndash;0.1',
-    '0.001&ndash;0.169',
-    '0.001,52',
-    '0.001,58',
-    '0.001.',
     '0.0014r',
-    '0.0015%',
-    '0.002&ndash;0.03wt%',
-    '0.002,25',
-    '0.0020',
-    '0.0022&aring',
-    '0.0025',
-    '0.0025%',
-    '0.0025wt%',
-    '0.002mgml',
-    '0.0037',
-    '0.005&deg;c',
-    '0.005&ndash;0.05',
-    '0.005&ndash;0.846',
-    '0.0050',
-    '0.006%',
     '0.0062',
-    '0.0067',
-    '0.007%',
-    '0.007&aring',
-    '0.0095',
-    '0.0098',
-    '0.00p',
-    '0.01&lt;p&lt;0.001',
-    '0.01&ndash;0.05',
-    '0.01&ndash;0.1',
-    '0.01&ndash;1',
-    '0.010',
-    '0.011&aring',
-    '0.0119',
-    '0.012',
-    '0.012&aring',
     '0.01230',
-    '0.01383in',
-    '0.014%',
-    '0.015%',
-    '0.015&aring',
-    '0.015&ndash;0.25',
-    '0.01555',
-    '0.0162',
-    '0.018&aring',
-    '0.0198',
-    '0.01gcm',
-    '0.01m',
-    '0.02&lt;p&lt;0.05',
-    '0.02&ndash;0.03',
-    '0.021&aring',
-    '0.0212',
     '0.021614583',
-    '0.022&ndash;0.143',
-    '0.0225%',
-    '0.023&aring',
-    '0.024&times;10/l',
-    '0.02410/l',
-    '0.025&ndash;1.25',
-    '0.025mgml',
-    '0.025mm',
-    '0.027',
-    '0.027%',
-    '0.027ph-1',
-    '0.02n',
-    '0.02oz',
-    '0.02sec',
-    '0.03&ndash;0.2oz',
     '0.030',
-    '0.031',
-    '0.032',
-    '0.033&ndash;0.067',
-    '0.036',
-    '0.037',
-    '0.037s',
-    '0.038',
-    '0.039',
-    '0.03m',
-    '0.03p',
-    '0.04&ndash;0.03',
-    '0.04&percnt',
-    '0.040',
-    '0.041&deg',
-    '0.048',
     '0.049',
-    '0.04pc',
-    '0.04sec',
-    '0.05%/edetic',
-    '0.05&lt;p&lt;0.1',
-    '0.05&mgr;gml',
-    '0.05.',
-    '0.051',
-    '0.0513',
-    '0.0527',
-    '0.057',
-    '0.058',
-    '0.059',
-    '0.05mg',
-    '0.05mgml',
-    '0.05mm',
     '0.05mmes',
-    '0.05p',
-    '0.05sec',
-    '0.06&ndash;0.02',
-    '0.061',
-    '0.065',
-    '0.0675',
-    '0.06cm',
-    '0.06gev',
-    '0.06s',
-    '0.07&ndash;0.62',
-    '0.072',
-    '0.073',
-    '0.074',
-    '0.075m',
-    '0.078',
     '0.079',
-    '0.07m',
-    '0.07p/kwh',
-    '0.08%',
-    '0.08&deg;c',
-    '0.08&ndash;0.05',
-    '0.081',
-    '0.0865',
-    '0.0875',
-    '0.08cycledeg',
-    '0.08mm',
-    '0.08x0.08x0.3mm',
-    '0.09%',
-    '0.094',
-    '0.096',
-    '0.097',
     '0.09sec',
-    '0.1%/dnase',
-    '0.1%sds',
-    '0.1&deg;c',
-    '0.1&gt;p&gt;0.05',
-    '0.1&mgr;g',
-    '0.1&micro;m',
-    '0.1&ndash;0.01mg',
-    '0.1&ndash;0.3mm',
-    '0.1&ndash;0.48',
-    '0.1&ndash;0.8',
-    '0.1&ndash;10',
-    '0.1&ndash;10.',
-    '0.1&ndash;100',
-    '0.1&ndash;12.4',
-    '0.1&ndash;16',
     '0.1&ndash;2.0',
-    '0.1&ndash;2kev',
-    '0.1&ndash;3.0',
-    '0.1&ndash;5.7',
-    '0.1&ndash;7.9',
-    '0.1&ndash;800ngml',
-    '0.1&times',
-    '0.10%',
-    '0.10&aring',
-    '0.100',
-    '0.10000g',
-    '0.101%',
-    '0.104',
-    '0.104v',
-    '0.108',
-    '0.10mm',
     '0.10sec',
-    '0.11&times;10/l',
-    '0.110',
-    '0.1111',
-    '0.1125',
-    '0.113',
-    '0.117',
-    '0.118',
-    '0.118&ndash;0.003',
-    '0.11sec',
-    '0.12&micro;v/gamma',
-    '0.124',
-    '0.125k',
-    '0.12776',
-    '0.12mm',
-    '0.12p',
     '0.13&ndash;0.15',
-    '0.1330',
-    '0.139',
-    '0.13p',
-    '0.13ph-1',
-    '0.14&ndash;0.55',
-    '0.1429',
-    '0.144',
-    '0.147',
-    '0.14m',
-    '0.15&aring',
-    '0.15&deg;c',
-    '0.1507579',
-    '0.151',
-    '0.158',
-    '0.159',
     '0.15ftl',
-    '0.15l',
-    '0.15mcrab',
-    '0.16%',
-    '0.165',
-    '0.166',
-    '0.166in',
-    '0.167',
-    '0.168',
-    '0.16sec',
-    '0.17&ndash;0.60%',
-    '0.17&ndash;0.78',
-    '0.178',
-    '0.18/1000',
-    '0.180',
-    '0.181',
     '0.1819',
-    '0.1825418',
-    '0.184',
-    '0.185',
-    '0.187',
-    '0.189&ndash;0.355',
-    '0.18gpa',
-    '0.19%',
-    '0.193',
-    '0.197',
-    '0.19m',
-    '0.19oz',
-    '0.1cms',
-    '0.1db',
-    '0.1in.',
-    '0.1k',
     '0.1mgg',
-    '0.1n',
-    '0.1ng',
-    '0.1nm',
-    '0.1p',
-    '0.1sm',
-    '0.1tev',
-    '0.1w',
-    '0.1xsspe',
-    '0.2&aring',
-    '0.2&deg;c',
-    '0.2&mgr;m',
-    '0.2&ndash;0.4',
-    '0.2&ndash;0.4m',
-    '0.2&ndash;0.5',
-    '0.2&ndash;1',
     '0.2&ndash;17',
-    '0.2&ndash;24',
-    '0.2&ndash;36',
-    '0.2&ndash;7.4%',
-    '0.2&times;ssc',
-    '0.2-&mgr;m',
-    '0.2-0.5',
-    '0.2-1',
-    '0.2/tube',
-    '0.20&ndash;0.26',
-    '0.20&ndash;0.66',
-    '0.204',
-    '0.21%',
-    '0.22%',
-    '0.22&ndash;1.02',
-    '0.22/1000',
     '0.220',
-    '0.224p',
-    '0.22ohms',
-    '0.23%',
-    '0.23&deg;c',
-    '0.23&ndash;4.55',
-    '0.236',
-    '0.24%',
-    '0.24&ndash;7.95',
-    '0.240',
-    '0.245g',
-    '0.24oz',
-    '0.25&ins',
-    '0.25&ndash;12',
-    '0.25&ndash;4',
-    '0.25&ndash;6',
     '0.25&ndash;7',
-    '0.25-&micro;m',
-    '0.250',
-    '0.251',
-    '0.25=',
-    '0.25mg/ml',
-    '0.25p/litre',
-    '0.25ps',
-    '0.25x10',
-    '0.26&aring',
-    '0.26-mm',
-    '0.262',
-    '0.266&ndash;0.172',
-    '0.27&aring',
-    '0.274',
-    '0.279',
     '0.28%',
-    '0.28&deg;c',
-    '0.287',
-    '0.28kev',
-    '0.29&ndash;0.90',
-    '0.2933',
-    '0.295',
-    '0.29cd',
-    '0.29mgml',
-    '0.2cum',
-    '0.2db',
-    '0.2k',
-    '0.2mg/l',
-    '0.2mgml',
-    '0.2ml',
-    '0.2n',
     '0.2nm',
-    '0.2p.p.b.v.',
-    '0.2sec',
-    '0.2secs',
-    '0.2t/acre',
-    '0.2tev',
-    '0.2wt%',
-    '0.2xssc',
-    '0.3&aring',
-    '0.3&deg',
-    '0.3&mgr;m',
-    '0.3&ndash;0.4',
-    '0.3&ndash;0.5',
-    '0.3&ndash;0.5%',
-    '0.3&ndash;0.6m',
-    '0.3&ndash;0.7',
     '0.3&ndash;0.7%',
-    '0.3&ndash;1.3',
-    '0.3&ndash;17.5',
-    '0.3&ndash;2.6',
-    '0.3&ndash;3.6',
-    '0.3&ndash;39.6',
-    '0.3&ndash;5',
-    '0.3&times;ssc/0.1%',
-    '0.3-0.4&deg',
-    '0.3.1',
-    '0.3.2',
-    '0.3.3',
-    '0.3.4',
-    '0.3.5',
-    '0.30&ndash;0.75',
-    '0.300',
     '0.303',
-    '0.306',
-    '0.307',
-    '0.31&ndash;0.54kgyr',
-    '0.31&ndash;1.72',
-    '0.31026m3',
-    '0.319',
-    '0.32&ndash;0.94%',
-    '0.321',
-    '0.32193',
-    '0.32p',
-    '0.333',
-    '0.333333',
-    '0.34047m3',
-    '0.342',
-    '0.35&ndash;0.5oz',
     '0.35&ndash;0.69',
-    '0.35&ndash;0.95%',
-    '0.35&ndash;1.00',
-    '0.35&times;10/l',
-    '0.35(+/-0.13)for',
-    '0.35-micron',
-    '0.3537',
-    '0.355',
-    '0.359',
-    '0.36%',
-    '0.361',
-    '0.362',
-    '0.364',
-    '0.366',
-    '0.36sec',
-    '0.37&aring',
     '0.372',
-    '0.375m',
-    '0.37p/kwh',
-    '0.38&ndash;2.03',
-    '0.38/100000',
-    '0.3809',
-    '0.385',
-    '0.3871',
-    '0.391',
-    '0.392',
-    '0.396',
-    '0.3cm',
-    '0.3gcm',
-    '0.3kg',
-    '0.3secs',
-    '0.4&aring',
     '0.4&deg',
-    '0.4&ins',
-    '0.4&mgr;m',
-    '0.4&micro;g',
-    '0.4&ndash;0.8',
-    '0.4&ndash;0.8ml/hour',
-    '0.4&ndash;1',
-    '0.4&ndash;1.0',
-    '0.4&ndash;1.0%',
-    '0.4&ndash;1.1',
-    '0.4&ndash;2.1',
-    '0.4&ndash;2.3',
-    '0.4&ndash;20.4',
-    '0.4&ndash;3.0',
-    '0.4&ndash;3.0%',
-    '0.4.1',
     '0.4/l',
-    '0.40%',
-    '0.40&ndash;1.05',
-    '0.40/0.85',
-    '0.404',
-    '0.407',
-    '0.4091',
-    '0.41&ndash;1.04',
-    '0.414',
-    '0.42-0.44',
-    '0.430',
-    '0.4311',
-    '0.433&ndash;0.391',
-    '0.43301',
-    '0.436',
-    '0.43p',
     '0.445',
-    '0.44p',
-    '0.44x',
-    '0.45&mdash;0.95%',
-    '0.45(+/-0.15)for',
-    '0.45-litre',
-    '0.45-m-wide',
-    '0.454',
-    '0.45m',
-    '0.45p',
-    '0.45p/kwh',
-    '0.46%',
-    '0.4605',
-    '0.466',
-    '0.47&ndash;0.92',
-    '0.47ohms',
     '0.480',
-    '0.48343',
-    '0.48p',
-    '0.49%',
-    '0.4:1',
-    '0.4g/t',
-    '0.4i',
-    '0.4in',
-    '0.4k',
-    '0.4mg/litre',
-    '0.4mm',
-    '0.4oz',
-    '0.4pc',
-    '0.4secs',
-    '0.4v/186&micro;a',
-    '0.5&deg',
     '0.5&mgr;l',
-    '0.5&micro;g',
-    '0.5&micro;g/ml',
-    '0.5&ndash;0.7%',
-    '0.5&ndash;1.0x10',
-    '0.5&ndash;1.3',
-    '0.5&ndash;1.4',
-    '0.5&ndash;1.5',
-    '0.5&ndash;10',
-    '0.5&ndash;10%',
-    '0.5&ndash;2.0x10',
-    '0.5&ndash;2.2',
-    '0.5&ndash;2.5',
-    '0.5&ndash;33',
-    '0.5&ndash;4.0%',
-    '0.5&ndash;7',
     '0.5&times;14',
-    '0.5-',
-    '0.5-&mgr;l',
-    '0.5-&mgr;m',
-    '0.5-0.75',
-    '0.5-1',
-    '0.5-kb',
-    '0.5-ltr',
-    '0.5-ml',
-    '0.5-o.6',
-    '0.5-o.7oz',
-    '0.5-per-cent',
-    '0.5.',
-    '0.50%',
-    '0.501',
-    '0.509',
     '0.50oz',
-    '0.50t',
-    '0.51%',
-    '0.518',
-    '0.51m',
-    '0.521',
-    '0.525%',
-    '0.5327706575',
-    '0.533',
-    '0.54&ndash;0.92',
-    '0.541',
-    '0.543',
-    '0.544',
-    '0.55&ndash;0.63',
-    '0.55&ndash;0.90',
-    '0.55(+/-0.11)',
     '0.55mg',
-    '0.55mm',
-    '0.55p',
-    '0.56%',
-    '0.564',
-    '0.57,1',
-    '0.57t',
-    '0.58&ndash;0.77',
-    '0.58&ndash;3.50',
-    '0.58&times;10/l',
-    '0.59%',
-    '0.59&ndash;0.92',
-    '0.597',
-    '0.5:1',
-    '0.5bhp',
-    '0.5cm',
     '0.5dh',
-    '0.5in.',
-    '0.5ins',
-    '0.5km',
-    '0.5kw',
-    '0.5l',
-    '0.5mg/kg',
-    '0.5mg/l',
-    '0.5mg/ml',
-    '0.5mjy',
-    '0.5mm.',
-    '0.5n',
-    '0.5ng',
-    '0.5ngml',
-    '0.5o',
-    '0.5pmol',
     '0.5r',
-    '0.5secs',
-    '0.5sq',
-    '0.5t/ha',
-    '0.5u',
-    '0.5v',
-    '0.5x0.5mm',
-    '0.6&ndash;0.7',
-    '0.6&ndash;0.7%',
-    '0.6&ndash;0.8',
-    '0.6&ndash;0.8m',
-    '0.6&ndash;1.2',
-    '0.6&ndash;1.2m',
-    '0.6&ndash;1.5',
-    '0.6&ndash;1.6%',
-    '0.6&ndash;5.3',
     '0.6-m-high',
-    '0.607',
-    '0.61%',
-    '0.61&aring',
-    '0.610',
-    '0.626',
-    '0.63%',
-    '0.631x10',
-    '0.633',
-    '0.6452116',
-    '0.64585',
-    '0.64p',
-    '0.654r',
-    '0.65d.',
-    '0.65p',
-    '0.66&ndash;0.48',
     '0.663',
-    '0.66324',
-    '0.6673',
-    '0.67%',
-    '0.674',
-    '0.67654',
-    '0.67p',
-    '0.691328',
-    '0.693',
-    '0.69p',
-    '0.6bn',
-    '0.6g',
-    '0.6in',
-    '0.6m-00',
-    '0.6mjy',
-    '0.6v',
     '0.7&ins',
-    '0.7&ndash;0.8',
-    '0.7&ndash;0.88oz',
-    '0.7&ndash;1.1',
-    '0.7&ndash;1.3',
-    '0.7&ndash;2.4',
-    '0.7&ndash;250',
-    '0.7&ndash;4.1',
-    '0.7&ndash;4.6',
-    '0.7&times;the',
-    '0.7-1.0',
-    '0.7-i',
-    '0.70&ndash;1.33',
-    '0.702',
-    '0.707',
-    '0.70p',
     '0.71&ndash;1.00',
-    '0.71&ndash;1.15',
-    '0.713',
-    '0.719/0.237',
-    '0.727',
-    '0.72p',
-    '0.73&ndash;5.04',
-    '0.73&ndash;6.63',
-    '0.73-kg',
-    '0.732r',
-    '0.734',
-    '0.735334',
-    '0.736',
-    '0.73p',
-    '0.74&ndash;38.7',
-    '0.74/100000',
     '0.741',
-    '0.742&ndash;0.946',
-    '0.743',
-    '0.744',
-    '0.746',
-    '0.747',
-    '0.75&deg',
-    '0.75&ndash;1.25',
-    '0.75&ndash;1.8',
-    '0.75-1.5',
-    '0.755',
-    '0.75in',
-    '0.75oz',
-    '0.75oz/sq',
-    '0.75pc',
-    '0.76-m-deep',
     '0.760',
-    '0.761276',
-    '0.763',
-    '0.763159',
-    '0.765',
-    '0.766',
-    '0.768411',
-    '0.769',
-    '0.76in',
-    '0.76l',
-    '0.77%',
-    '0.7784',
-    '0.782',
-    '0.78201',
-    '0.78p',
-    '0.78r',
     '0.79%',
-    '0.792:1',
-    '0.79p',
-    '0.7arcsec',
-    '0.7bn',
-    '0.7i',
-    '0.7kb',
-    '0.7kg',
-    '0.7m',
-    '0.7p.p.b.v.',
-    '0.7x10',
-    '0.8%-6.3%',
-    '0.8&aring',
-    '0.8&ndash;1.6',
-    '0.8&ndash;4.5',
-    '0.8&ndash;40nm',
     '0.8-point',
-    '0.8/1000',
-    '0.800',
-    '0.805748',
-    '0.807',
-    '0.8150',
-    '0.816',
-    '0.81p',
-    '0.82&aring',
-    '0.82&ndash;1.37',
-    '0.83&aring',
-    '0.83&ndash;1.07',
-    '0.830',
-    '0.832',
-    '0.83tpx',
-    '0.840&ndash;0.860',
     '0.848',
-    '0.85%',
-    '0.85x',
-    '0.86%',
-    '0.860',
-    '0.867',
-    '0.869',
-    '0.86mm',
-    '0.877',
-    '0.878',
-    '0.87sec',
-    '0.88%',
-    '0.88&ndash;0.99',
-    '0.88-3.22',
-    '0.88p',
-    '0.89&ndash;0.99',
     '0.89&ndash;1.00',
-    '0.891',
-    '0.898',
-    '0.899',
-    '0.8e',
-    '0.8in',
-    '0.8km/',
-    '0.8m&ndash;1.0m',
-    '0.8mg',
-    '0.8pt',
-    '0.8v',
-    '0.9&ins',
-    '0.9&ndash;1.4',
-    '0.9&percnt',
-    '0.9&times;100',
-    '0.9&times;43',
     '0.9-kb',
-    '0.9-kilobase',
-    '0.909',
-    '0.90a',
-    '0.91&aring',
-    '0.91-',
-    '0.91/1.52',
-    '0.910',
-    '0.913',
-    '0.918',
-    '0.919',
-    '0.92%',
-    '0.925',
-    '0.9333,0.0333',
-    '0.9375',
-    '0.93p',
     '0.93pc',
-    '0.940',
-    '0.9400',
-    '0.945',
-    '0.948',
-    '0.949',
-    '0.95&times;10/l',
-    '0.95+13.0/-0.9&times;10',
-    '0.95+5.2/-1.2%',
-    '0.95oz/sq',
-    '0.96%',
-    '0.9675',
-    '0.975',
-    '0.981',
-    '0.988',
-    '0.98sec',
     '0.99%',
-    '0.990',
-    '0.998',
-    '0.9cu',
-    '0.9ft',
-    '0.9mgml',
-    '0.9ms',
-    '0.9nm',
-    '0.9p',
-    '0.9pts',
-    '0.9tpk',
-    '0/1/5',
-    '0/13',
-    '0/20',
-    '0/30',
-    '0/400',
     '0/5',
-    '0/59',
-    '0/6.',
-    '0/null',
-    '00&ndash;5169',
-    '00\'ish',
-    '00,01',
-    '00-gauge',
-    '00-sized',
-    '00.01a',
-    '00.30',
-    '000&deg;-179&deg',
-    '000&deg;c',
-    '000&mdash;lifespan.ftaf',
-    '000&ndash&pound;400',
-    '000&ndash;099',
     '000&ndash;100',
-    '000&ndash;16',
-    '000&ndash;16m',
-    '000&ndash;2',
-    '000&ndash;20',
-    '000&ndash;200',
-    '000&ndash;25',
-    '000&ndash;70',
-    '000&ndash;8',
-    '000&ndash;80',
-    '000\'s',
-    '000+',
-    '000-&pound;80',
-    '000-gev',
-    '000-strong',
-    '000-word',
     '000.000.000s',
-    '000.000s',
-    '000/57=',
-    '000/km',
-    '00000000',
-    '000007',
-    '00001111000010010100011111011011',
-    '00001500101609',
-    '00001:902',
-    '00006',
-    '000075',
-    '000076',
-    '0001&ndash;0002',
-    '00010100',
-    '00011000',
-    '00012',
     '0002&ndash;2446',
-    '0005:062e',
-    '0006&ndash;0003',
-    '0007',
-    '0007&ndash;0004',
-    '0008',
-    '000833',
-    '0009055',
-    '000ft',
-    '000kcal',
-    '000km',
-    '000th',
-    '0010',
-    '0010&ndash;0008',
-    '0010&ndash;0010',
-    '00100000',
     '00100001',
-    '00100010',
-    '001010011000',
-    '0010101101110001',
-    '0011&ndash;0010',
-    '0012',
-    '0013',
-    '0014',
-    '0016&ndash;0011',
-    '001697',
-    '0017&ndash;0011',
-    '0017&ndash;0012',
-    '0018',
-    '00184',
-    '00185',
-    '00186',
     '001a/',
-    '002',
-    '0020',
-    '002090',
-    '0022',
-    '002292',
-    '0025',
-    '00258',
-    '0027',
-    '002813',
-    '0029',
-    '0030&ndash;0145',
-    '00329',
-    '0033',
-    '00330',
-    '00352',
     '0036',
-    '0038',
-    '004-000',
-    '0040',
-    '0041',
-    '0042',
-    '0043',
-    '0043.',
-    '0044',
-    '0045',
-    '0045.',
-    '0047.',
-    '0048',
-    '0048.',
-    '0049.',
-    '004b',
     '005041',
-    '0051',
-    '005104',
-    '0052',
-    '0053',
-    '0054',
-    '005623',
-    '00569798',
-    '006-000',
-    '0060',
-    '0066',
-    '0068',
-    '0071',
-    '0071&ndash;439',
-    '0077580',
-    '0078',
     '0081',
-    '0082',
-    '0086',
-    '0089',
-    '00891',
-    '0090',
-    '0092',
-    '009s',
-    '00:00&ndash;04:00',
-    '00:00gmt',
-    '00:39',
-    '00:44',
-    '00:47',
-    '00:51',
-    '00:53',
-    '00:57',
     '00:59',
-    '00h',
-    '00pm',
-    '00s20883',
-    '01&ndash;02',
-    '01&ndash;200',
-    '01&ndash;211&ndash;5261&ndash;102',
-    '01&ndash;214',
-    '01&ndash;222',
-    '01&ndash;240',
-    '01&ndash;242',
-    '01&ndash;2886/2864',
-    '01&ndash;351',
-    '01&ndash;353',
-    '01&ndash;353&ndash;5252',
-    '01&ndash;370',
     '01&ndash;407',
-    '01&ndash;434',
-    '01&ndash;435',
-    '01&ndash;4809&ndash;9539',
-    '01&ndash;482',
-    '01&ndash;499',
-    '01&ndash;528',
-    '01&ndash;568',
-    '01&ndash;568&ndash;4757',
-    '01&ndash;580',
-    '01&ndash;584',
-    '01&ndash;589',
-    '01&ndash;589&ndash;3456',
-    '01&ndash;602',
-    '01&ndash;629',
-    '01&ndash;637',
     '01&ndash;644',
-    '01&ndash;700',
-    '01&ndash;723',
-    '01&ndash;73',
-    '01&ndash;734',
-    '01-09-17',
-    '01-223',
-    '01-229',
-    '01-235',
-    '01-240',
-    '01-247',
-    '01-248',
-    '01-253',
-    '01-262-6711',
-    '01-267',
-    '01-278',
     '01-289',
-    '01-352-2149',
-    '01-377',
-    '01-379',
-    '01-380',
-    '01-403',
-    '01-408',
-    '01-436',
-    '01-437',
-    '01-444',
-    '01-458',
-    '01-466',
-    '01-468',
-    '01-480',
-    '01-491',
-    '01-493-1977',
     '01-499',
-    '01-567',
-    '01-580',
-    '01-603',
-    '01-607',
-    '01-622',
-    '01-630',
-    '01-631',
-    '01-640',
-    '01-661',
-    '01-679',
-    '01-706',
-    '01-725',
-    '01-737-4764',
-    '01-821',
-    '01-8284111',
     '01-831',
-    '01-834',
-    '01-863',
-    '01-879',
-    '01-897',
-    '01-928-6363',
-    '01-969',
-    '01-976',
-    '01-978',
-    '01-986-4316',
-    '01-jan-1990',
-    '01.',
-    '01.0091',
-    '01.00a',
-    '01.01&circ',
-    '01.02',
     '01.02c',
-    '01.12',
-    '01.223',
-    '01.302.9021',
-    '01.393.3385',
-    '01.398.5819',
-    '01.455.1268',
-    '01.45sec',
-    '01.644.8443',
-    '01.653.6622',
-    '01.668.7655',
-    '01.722.5151',
-    '01.725.4157',
-    '01.725.4461',
-    '01.794.6295',
-    '01.794.6395',
     '01.8',
-    '01.90',
-    '01.969.2391',
-    '01/252',
-    '010&ndash;7&ndash;812',
-    '010-33-41',
-    '01001100',
-    '010011001010010010',
-    '01001101010101110101010010110101110010',
-    '01003',
-    '0101011001',
-    '010110',
-    '010111',
-    '0101514',
-    '0107',
-    '010s',
     '011-242909&ndash;2',
-    '0110100',
-    '0112',
-    '0115',
-    '0117',
-    '0120',
-    '0127',
-    '0127:h6',
-    '0128',
-    '012892uprog(3)',
-    '01309',
-    '0133',
-    '01335',
-    '0137',
-    '0140',
-    '0142:h6',
     '0145&ndash;0300',
-    '01477',
-    '015099',
-    '0156',
-    '0164',
-    '0168',
-    '016802',
-    '016809',
-    '017&ndash;371',
-    '0170',
-    '0171640',
-    '0177',
-    '017818',
-    '0179',
-    '0180',
-    '0183',
     '0188',
-    '0196',
-    '0199',
-    '01:00',
-    '01:04',
-    '01:08',
-    '01:15',
-    '01:16',
-    '01:17',
-    '01:20',
-    '01:24',
-    '01:25:57',
-    '01:26',
-    '01:27',
-    '01:29',
-    '01:33',
     '01:36',
-    '01:37',
-    '01:44',
-    '01:45',
-    '01:47',
-    '01:49',
-    '01:55',
-    '01:56',
-    '01:57',
-    '01:58',
-    '01:59',
-    '01:h7',
-    '01nn',
-    '01soon',
-    '01v',
-    '02&mdash;standards',
     '02&ndash;2172125',
-    '02&ndash;825&ndash;4368',
-    '02.00',
-    '02.53',
-    '02/2172300',
-    '02/2176290',
-    '02/2177580',
-    '02/5022525',
-    '02/5118244',
-    '02/5118888',
-    '02/5119815',
-    '02/5122921',
-    '02/5129759',
-    '02/86/0554',
-    '02/90/1065',
-    '02/91/0055',
     '02/91/0180',
-    '02/91/0992',
-    '02/91/1298',
-    '02/91/1361',
-    '02/91/1574',
-    '02/92/0065',
-    '02/92/0237',
-    '02/92/0377',
-    '02/92/0580',
-    '02/92/0948',
-    '02/92/1435',
-    '02/92/1629',
-    '02/92/1805',
-    '02/93/0378',
-    '02/93/0526',
-    '02/93/0552',
     '02/93/0553',
-    '02/93/0597',
-    '020&commat',
-    '0201.1',
-    '0201.2',
-    '0202-',
-    '0202-23525',
-    '0202-884372',
-    '0203&ndash;225545',
-    '0203&ndash;303517',
-    '0203&ndash;523741',
-    '0203&ndash;712014',
-    '0203.1',
-    '0203.2',
-    '0203.3',
-    '0203.4',
     '0204&ndash;853360',
-    '0206&ndash;42242',
-    '0206&ndash;48833',
-    '0206&ndash;761660',
-    '0206&ndash;834641',
-    '0206&ndash;873387',
-    '0207521133',
-    '021&ndash;235',
-    '021&ndash;353',
-    '021&ndash;359',
-    '021&ndash;414',
-    '021&ndash;426',
-    '021&ndash;523',
-    '021&ndash;550',
-    '021&ndash;554',
-    '021&ndash;585',
     '021&ndash;631',
-    '021&ndash;643',
-    '021&ndash;722',
-    '021&ndash;781',
-    '021-200',
-    '021-440',
-    '021-456',
-    '021-525',
-    '021-625',
-    '021-632',
-    '021-780',
-    '02139',
-    '021793bull(5)',
-    '021993programme',
-    '021v',
-    '022',
     '0220',
-    '0221&ndash;519',
-    '0222-371566',
-    '0223&ndash;402463',
-    '0223-336540',
-    '0223-420066',
-    '0224-635',
-    '0224-641-122',
-    '022492pogramme',
-    '0225&ndash;442215',
-    '0225&ndash;448844',
-    '0225-428144',
-    '0225-469371',
-    '0227&ndash;763336',
-    '0229',
-    '0232&ndash;241919',
     '0232&ndash;242819',
-    '0232&ndash;329241',
-    '0232-381251',
-    '0233&ndash;820',
-    '0234',
-    '0234&ndash;266966',
-    '0235&ndash;520202',
-    '0235&ndash;520361',
-    '0235&ndash;836141',
-    '0235&ndash;863141',
-    '0235-554123',
-    '0237',
-    '0239',
-    '02407',
-    '0242&ndash;521381',
-    '0242&ndash;578666',
     '0245&ndash;283030',
-    '0245&ndash;493131',
-    '0246&ndash;582204',
-    '0248',
-    '0248361267',
-    '0248c',
-    '024973&ndash;230',
-    '0251',
-    '02518',
-    '0252&ndash;850040',
-    '0252-24431',
-    '025222580',
-    '0253-27786',
-    '0256&ndash;68551',
-    '0257',
-    '0258',
     '026/3822/b',
-    '0261',
-    '0262',
-    '026583',
-    '0268-532',
-    '0268-541126',
-    '02688',
-    '0270&ndash;626554',
-    '0273&ndash;605310',
-    '0274&ndash;568234',
-    '0274-390955',
-    '0276',
-    '0280',
-    '0280&ndash;706003',
-    '0281',
-    '0284&ndash;763100',
     '0284-',
-    '02843900',
-    '0285&ndash;659918',
-    '0286',
-    '0287&ndash;642361',
-    '0288',
-    '0289',
-    '0291',
-    '02912',
-    '029265',
-    '0293&ndash;572821',
-    '0293&ndash;599977',
-    '0293&ndash;617181',
-    '0294',
-    '02944',
-    '02945',
     '0295&ndash;812088',
-    '0298-814543',
-    '02:00',
-    '02:03',
-    '02:06',
-    '02:17',
-    '02:18',
-    '02:21',
-    '02:23',
-    '02:28',
-    '02:31:51',
-    '02:44',
-    '02:46',
-    '02:49',
-    '02:50',
-    '02:51',
     '02:54',
-    '02:58',
-    '02:sociology',
-    '02sec',
-    '03&mdash;engagement&mdash;letter',
-    '03-row',
-    '03.',
-    '03.062',
-    '03.10',
-    '03.17',
-    '03.45',
-    '03.50',
-    '03.82sec',
-    '03009',
-    '0301.2',
-    '0304-360897',
     '0306.1',
-    '0306.3',
-    '0307',
-    '03073',
-    '03090',
-    '030in',
-    '031&ndash;228',
-    '031&ndash;229',
-    '031&ndash;315',
-    '031&ndash;317',
-    '031&ndash;336',
-    '031&ndash;442',
-    '031&ndash;550',
-    '031-225',
-    '031-453-3366',
-    '031-469-3879',
     '031-550',
-    '031-553-8294',
-    '031-554',
-    '031-556',
-    '031-557&ndash;3194',
-    '031-668-2019',
-    '031.443.2865',
-    '031.453.3366',
-    '031.652.1114',
-    '0310',
-    '0311',
-    '03112',
-    '031192programme',
-    '0312',
-    '0314',
-    '0315',
     '0316',
-    '0317',
-    '0318',
-    '031892programme',
-    '0319',
-    '032&deg',
-    '0320',
-    '032088',
-    '0322',
-    '0325&ndash;300700',
-    '0325&ndash;483168',
-    '0325&ndash;483472',
-    '0328&ndash;830460',
-    '033',
-    '0333',
-    '0333e-e',
     '0334',
-    '0335',
-    '03397',
-    '0341',
-    '0342&ndash;319111',
-    '03430',
-    '03431',
-    '0345&ndash;543555',
-    '0345-089599',
-    '0345-100200',
-    '0348',
-    '0350',
-    '0352',
-    '0361',
-    '0362',
-    '03656',
     '0366',
-    '0372&ndash;376161',
-    '037202',
-    '03722',
-    '03727',
-    '0373',
-    '0373&ndash;864775',
-    '0379',
-    '0379&ndash;888282',
-    '0380',
-    '0382&ndash;23530',
-    '0384',
-    '0386&ndash;871159',
-    '0386-',
-    '0388&ndash;602754',
-    '0388&ndash;603566',
     '0393',
-    '03931',
-    '0395',
-    '0396',
-    '039667',
-    '039686&ndash;668',
-    '0397',
-    '0399',
-    '03:03',
-    '03:04',
-    '03:05',
-    '03:06',
-    '03:14',
-    '03:15',
-    '03:16',
-    '03:19',
     '03:22',
-    '03:23',
-    '03:25',
-    '03:28',
-    '03:30',
-    '03:32',
-    '03:33',
-    '03:34',
-    '03:35',
-    '03:36',
-    '03:37',
-    '03:38',
-    '03:40',
-    '03:41',
-    '03:42',
-    '03:43',
     '03:44',
-    '03:49',
-    '03:50',
-    '03:51',
-    '03:52',
-    '03:53',
-    '03:59',
-    '03shiva',
-    '04&mdash;fsa',
-    '04.43',
-    '04.98',
-    '040&deg',
-    '0400hrs.',
-    '0401.1',
-    '0401.2',
-    '0401.4',
     '0401.5',
-    '0401.6',
-    '0401.7',
-    '0402.1',
-    '0402.2',
-    '0402.4',
-    '04023',
-    '04024',
-    '04027',
-    '0403.2',
-    '0403.3',
-    '040372&ndash;2883',
-    '0404.3',
-    '0405.1',
-    '0405.2',
-    '0405.3',
     '0405.4',
-    '0405.41',
-    '0405.42',
-    '0405.44',
-    '0405.5',
-    '0406.1',
-    '0406.2',
-    '0406.3',
-    '0406.4',
-    '0407.1',
-    '0407.2',
-    '041&ndash',
-    '041&ndash;226',
-    '041&ndash;429',
-    '041&ndash;639',
-    '041-226',
     '041-227-5511',
-    '041-357-1659',
-    '0410',
-    '0415',
-    '0422',
-    '0423&ndash;501002',
-    '0423&ndash;564881',
-    '0424&ndash;212456',
-    '0424&ndash;754192',
-    '0425',
-    '04252-78921',
-    '0429&ndash;271275',
-    '042u',
-    '04300',
-    '043092prog(4)',
-    '0432',
     '04337',
-    '0439&ndash;71111',
-    '043the',
-    '04422185',
-    '0450',
-    '0453',
-    '0455',
-    '04562-573',
-    '0459',
-    '046&ndash;2dc6',
-    '0461',
-    '0464',
-    '0466',
-    '0471',
-    '04712487',
-    '04716',
     '0479',
-    '0482-41567',
-    '0482-473616',
-    '0483&ndash;271211',
-    '0483&ndash;721121',
-    '04868',
-    '0487',
-    '048890',
-    '049',
-    '0490',
-    '0493',
-    '0497',
-    '04:00',
-    '04:00&ndash;08:00',
-    '04:11',
-    '04:20',
     '04:24',
-    '04:28',
-    '04:31',
-    '04:34',
-    '04:46',
-    '04:48',
-    '04:50',
-    '04:52',
-    '04:54',
-    '04:55',
-    '04:57',
-    '04:58',
-    '04sec',
-    '05%ile',
-    '05.15',
-    '05.30',
     '05.30&ndash;07.00',
-    '05.31',
-    '05.31sec',
-    '05.40',
-    '05.47',
-    '05.55',
-    '05.57',
-    '050-1031-sq-br/sp',
-    '0500&ndash;0600',
-    '0500-404-000',
-    '0501.1',
-    '0501.2',
-    '0501.3',
-    '0502.1',
-    '0502.2',
-    '0502.21',
     '0502.23',
-    '0502.3',
-    '0502.4',
-    '0502.41',
-    '0502.42',
-    '0502.51',
-    '0502.52',
-    '0502.54',
-    '0502.55',
-    '0502.56',
-    '0502.57',
-    '0503.1',
-    '0503.2',
-    '0503.21',
-    '0503.22',
-    '0503.23',
     '05036',
-    '0504.1',
-    '0504.3',
-    '0504.33',
-    '0504.34',
-    '0504.42',
-    '0505.1',
-    '0505.2',
-    '0505.21',
-    '0505.3',
-    '0505.31',
-    '0505.4',
-    '0505.41',
-    '0505.46',
-    '0505.48',
-    '0505.6',
     '0505.7',
-    '0506-824507',
-    '0506.1',
-    '0506.11',
-    '0506.2',
-    '0507&ndash;463468',
-    '0507.1',
-    '0508.1',
-    '0508.3',
-    '0509.1',
-    '0509.3',
-    '0509.4',
-    '0509.5',
-    '051&ndash;207',
-    '051&ndash;220',
-    '051&ndash;480',
     '051&ndash;608',
-    '051-207',
-    '051-220',
-    '051-228',
-    '051-336-3569',
-    '051-355-8923',
-    '051-424-2508',
-    '051-427-6713',
-    '051-443',
-    '051-666',
-    '051-727',
-    '051-777-4688',
-    '051-920-0998',
-    '051-928-6372',
-    '051083',
-    '051934-2095',
     '052',
-    '0520',
-    '0521',
-    '0522',
-    '0523.4',
-    '0531',
-    '0531+21',
-    '0532&ndash;311055',
-    '0532&ndash;706844',
-    '05320',
-    '0533&ndash;763171',
-    '05346',
-    '0535&ndash;618014',
-    '053759-2068',
-    '0538&ndash;75784',
-    '05395-67475',
     '0542',
-    '0543&ndash;481612',
-    '05434',
-    '05435',
-    '0544',
-    '0546',
-    '05464',
-    '0548',
-    '054852',
-    '05508',
-    '0553',
-    '0560',
-    '05601',
-    '0563',
-    '0564',
-    '0565&ndash;633844',
     '0571',
-    '0572.',
-    '0574',
-    '05749',
-    '0576',
-    '0578-757442',
-    '05784',
-    '058/635230',
-    '05827',
-    '0583&ndash;890287',
-    '0584-877090',
-    '0588-638-446',
-    '0588-638436',
-    '058s',
-    '0596',
-    '059=',
     '05:00',
-    '05:02',
-    '05:19',
-    '05:20',
-    '05:32',
-    '05:44',
-    '05:50',
-    '05:52',
-    '05:59',
-    '05:political',
-    '05sec',
-    '06&mdash;buying',
-    '06,93',
-    '06.06',
-    '06.30',
-    '06.30&ndash;24.00',
     '06.30.',
-    '06.36',
-    '06.44',
-    '0600&ndash;0730',
-    '0600hrs',
-    '0601.1',
-    '0601.2',
-    '0601.3',
-    '0602&ndash;452202',
-    '0602-503635',
-    '0602.2',
-    '0602.21',
-    '0602.23',
-    '0602.24',
-    '0602.3',
-    '0602.42',
     '0603-660352',
-    '0604&ndash;770711',
-    '060492prog(2)',
-    '0606&ndash;592',
-    '0606.1',
-    '060874&ndash;219',
-    '0609&ndash;773964',
-    '0609.1',
-    '0609.2',
-    '0609771139',
-    '0609779465',
-    '061&ndash;274',
-    '061&ndash;338',
-    '061&ndash;437',
-    '061&ndash;480',
-    '061&ndash;628',
     '061&ndash;736&ndash;5843',
-    '061&ndash;740',
-    '061&ndash;794',
-    '061&ndash;831',
-    '061&ndash;834',
-    '061&ndash;881',
-    '061&ndash;881&ndash;9041',
-    '061&ndash;941',
-    '061&ndash;953',
-    '061-228',
-    '061-236',
-    '061-237',
-    '061-831',
-    '061-832',
-    '061-833',
-    '0610.2',
     '0612.1',
-    '0612.2',
-    '0612.3',
-    '0612.4',
-    '061273',
-    '0614',
-    '06153',
-    '061793prog',
-    '062',
-    '0622-820519',
-    '0622-872408',
-    '0625-859333',
-    '0626',
-    '06261',
-    '06262',
-    '06285',
     '063',
-    '0630hrs',
-    '0631',
-    '0632',
-    '063670997',
-    '0638&ndash;560445',
-    '0640',
-    '0642&ndash;240170',
-    '0642&ndash;326326',
-    '0642&ndash;343430',
-    '0642&ndash;361608',
-    '0642-456418',
-    '0645hrs',
-    '0647',
-    '0647001879',
-    '0647001880',
     '0647001890',
-    '0647015213',
-    '0647015651',
-    '0647028886',
-    '0648',
-    '0649',
-    '065',
-    '06510',
-    '06511&ndash;1968',
-    '06511&ndash;2167',
-    '0652',
-    '0656',
-    '0657',
-    '066',
-    '0660',
-    '0661224',
     '0662',
-    '0663',
-    '067',
-    '06700',
-    '067182-357',
-    '0672-55333',
-    '06760',
-    '0679',
-    '0680',
-    '0681',
-    '0682',
-    '0684-293175',
-    '06856&ndash;5116',
-    '0689&ndash;225534',
-    '0689-730284',
-    '068o',
     '0691',
-    '0695-576971',
-    '0696',
-    '06973',
-    '0699',
-    '06998',
-    '06:01',
-    '06:03',
-    '06:08',
-    '06:11',
-    '06:15',
-    '06:23',
-    '06:26',
-    '06:32',
-    '06:50',
-    '06:53',
     '06:55:28',
-    '06:56',
-    '06:58:54',
-    '06:59',
-    '06s',
-    '06sec',
-    '07&mdash;salepurchase&mdash;agreements',
-    '07.00&ndash;11.00',
-    '07.00-23.00',
-    '07.15',
-    '07.19',
-    '07.45',
-    '07.45&ndash;08.10',
-    '07.50',
-    '07.59',
-    '07.90sec',
     '0700&ndash;0800',
-    '0700&ndash;1400',
-    '0700hrs',
-    '0701.1',
-    '0701.2',
-    '0701.3',
-    '0702.1',
-    '0702.2',
-    '0702.3',
-    '0702.4',
-    '0702.559922',
-    '0702.6',
-    '0702.7',
-    '0703&ndash;3326611',
-    '0703&ndash;872267',
-    '0703-333042',
     '0703-832769',
-    '0703.1',
-    '0703.10',
-    '0703.11',
-    '0703.12',
-    '0703.2',
-    '0703.3',
-    '0703.4',
-    '0703.5',
-    '0703.6',
-    '0703.7',
-    '0703.8',
-    '0703.9',
-    '0704.1',
-    '0704.10',
-    '0704.11',
     '0704.12',
-    '0704.13',
-    '0704.14',
-    '0704.15',
-    '0704.16',
-    '0704.2',
-    '0704.4',
-    '0704.5',
-    '0704.6',
-    '0704.7',
-    '0704.8',
-    '0704.9',
-    '07048',
-    '0705&ndash;210152',
-    '0705&ndash;219109',
-    '0706&ndash;260',
     '0706&ndash;843677',
-    '07063',
-    '0706hrs',
-    '0708',
-    '0709&ndash;558701',
-    '071&lowbar;235',
-    '071&ndash;200',
-    '071&ndash;215',
-    '071&ndash;219',
-    '071&ndash;220',
-    '071&ndash;221',
-    '071&ndash;225',
-    '071&ndash;229',
-    '071&ndash;231&ndash;6598',
-    '071&ndash;235-3149',
-    '071&ndash;242',
     '071&ndash;252',
-    '071&ndash;253',
-    '071&ndash;259',
-    '071&ndash;260',
-    '071&ndash;261',
-    '071&ndash;263',
-    '071&ndash;267',
-    '071&ndash;270',
-    '071&ndash;272',
-    '071&ndash;274',
-    '071&ndash;283',
-    '071&ndash;288',
-    '071&ndash;320',
-    '071&ndash;352',
-    '071&ndash;355',
-    '071&ndash;359',
     '071&ndash;370',
-    '071&ndash;371',
-    '071&ndash;377',
-    '071&ndash;380',
-    '071&ndash;385',
-    '071&ndash;386',
-    '071&ndash;401',
-    '071&ndash;402',
-    '071&ndash;405',
-    '071&ndash;411',
-    '071&ndash;435',
-    '071&ndash;436',
-    '071&ndash;4398717',
-    '071&ndash;480',
-    '071&ndash;488',
-    '071&ndash;489',
     '071&ndash;490',
-    '071&ndash;4936786',
-    '071&ndash;494',
-    '071&ndash;586',
-    '071&ndash;587',
-    '071&ndash;606',
-    '071&ndash;608',
-    '071&ndash;621',
-    '071&ndash;631',
-    '071&ndash;633',
-    '071&ndash;639',
-    '071&ndash;702',
-    '071&ndash;706',
-    '071&ndash;726',
-    '071&ndash;731',
-    '071&ndash;732',
     '071&ndash;733',
-    '071&ndash;737&ndash;2798',
-    '071&ndash;739',
-    '071&ndash;753',
-    '071&ndash;757',
-    '071&ndash;782',
-    '071&ndash;796',
-    '071&ndash;798',
-    '071&ndash;822',
-    '071&ndash;823',
-    '071&ndash;828&ndash;1313',
-    '071&ndash;830',
-    '071&ndash;927',
-    '071&ndash;935',
-    '071&ndash;973',
-    '071-215-8668',
     '071-222',
-    '071-245',
-    '071-248',
-    '071-251',
-    '071-253',
-    '071-258',
-    '071-287',
-    '071-321',
-    '071-333',
-    '071-353',
-    '071-359',
-    '071-374',
-    '071-385',
-    '071-387',
-    '071-387-2233',
-    '071-388',
     '071-405',
-    '071-408',
-    '071-409',
-    '071-409-3518',
-    '071-433',
-    '071-437',
-    '071-488',
-    '071-489',
-    '071-490',
-    '071-495',
-    '071-499',
-    '071-538',
-    '071-581',
-    '071-583',
-    '071-602',
-    '071-606',
     '071-607-8851',
-    '071-609',
-    '071-626',
-    '071-629',
-    '071-630',
-    '071-636',
-    '071-700-5771',
-    '071-703',
-    '071-724',
-    '071-726',
-    '071-727',
-    '071-738',
-    '071-822',
-    '071-823',
-    '071-828',
-    '071-832',
     '071-837-1600',
-    '071-867',
-    '071-928-3232',
-    '07102',
-    '071393bulletin',
-    '071530131',
-    '0718',
-    '0720',
-    '0722&ndash;744268',
-    '07293',
-    '072993programme',
-    '0730&ndash;1000',
-    '0730&ndash;69112',
-    '0733&ndash;370777',
-    '0734&ndash;819973',
-    '0734-303322',
     '0734-591591',
-    '0738',
-    '074',
-    '074085',
-    '0740hrs',
-    '0742&ndash;701668',
-    '0742&ndash;769922',
-    '0744',
-    '0745',
-    '0746',
-    '0747&ndash;870155',
-    '0747/93',
-    '074783',
-    '07478350',
-    '0748hrs',
-    '0752-668000',
     '0752-669595',
-    '0753&ndash;516',
-    '0753-549442',
-    '0755hrs',
-    '0756-700500',
-    '0757',
-    '076',
-    '0762-325144',
-    '0767',
-    '07684',
-    '0769',
-    '07695',
-    '077',
-    '0777',
-    '077q',
-    '078',
     '0786',
-    '0786-71917',
-    '078888&ndash;578214',
-    '0792&ndash;2081',
-    '0793-514514',
-    '0794&ndash;68733',
-    '0796',
-    '0797',
-    '0797&ndash;270784',
-    '07974&ndash;2070',
-    '079882',
-    '07:01',
-    '07:02:00',
-    '07:02:21',
-    '07:04:48',
-    '07:06:49',
     '07:08',
-    '07:12:04',
-    '07:13',
-    '07:14',
-    '07:15:26',
-    '07:17',
-    '07:24:46',
-    '07:25',
-    '07:26',
-    '07:27',
-    '07:29',
-    '07:31',
-    '07:35',
-    '07:46',
-    '07:51',
-    '07:52',
     '07:53',
-    '07:54',
-    '07:56',
-    '07:58',
-    '07:58:30&ndash;0500',
-    '07:59',
-    '08-nov-1993',
-    '08.02',
-    '08.05',
-    '08.07',
-    '08.10&ndash;08.15',
-    '08.15&ndash;08.25',
-    '08.18',
-    '08.20',
-    '08.22',
-    '08.30&ndash;17.30',
     '08.34',
-    '08.39',
-    '08.55',
-    '08.57',
-    '08.79',
-    '08.79.30',
-    '08.82',
-    '08/18',
-    '0800&ndash',
-    '0800&ndash;1100',
-    '0800&ndash;1200',
-    '0800&ndash;214000',
-    '0800&ndash;289330',
-    '0800&ndash;555',
-    '0800-',
-    '0800-289',
     '0800-777333',
-    '0800.521.382',
-    '0801.1',
-    '0801.2',
-    '0801.3',
-    '0801.4',
-    '0801.5',
-    '0801.6',
-    '08010',
-    '0802.1',
-    '0802.2',
-    '0802.3',
-    '0802.36',
-    '0803.1',
-    '0803.2',
-    '0803941951.',
     '0804.2',
-    '0804.3',
-    '0804.4',
-    '0804.5',
-    '0804.6',
-    '0805.1',
-    '0805.2',
-    '0805.3',
-    '0805.4',
-    '0805.5',
-    '0806.1',
-    '0806.3',
-    '0806.4',
-    '0806.5',
-    '0806.6',
-    '0806.7',
     '08060',
-    '0807.1',
-    '0807.2',
-    '0807.3',
-    '0807.4',
-    '0807.5',
-    '0808',
-    '081&ndash;335',
-    '081&ndash;367',
-    '081&ndash;399',
-    '081&ndash;450',
-    '081&ndash;455',
-    '081&ndash;518',
-    '081&ndash;550',
-    '081&ndash;558',
-    '081&ndash;563',
     '081&ndash;568',
-    '081&ndash;571',
-    '081&ndash;675',
-    '081&ndash;679',
-    '081&ndash;680',
-    '081&ndash;686',
-    '081&ndash;694',
-    '081&ndash;740',
-    '081&ndash;747',
-    '081&ndash;769',
-    '081&ndash;778',
-    '081&ndash;780',
-    '081&ndash;804',
-    '081&ndash;809',
-    '081&ndash;840',
-    '081&ndash;845',
     '081&ndash;847',
-    '081&ndash;848',
-    '081&ndash;863',
-    '081&ndash;863&ndash;8819',
-    '081&ndash;864',
-    '081&ndash;871',
-    '081&ndash;875',
-    '081&ndash;878',
-    '081&ndash;882',
-    '081&ndash;883',
-    '081&ndash;891',
-    '081&ndash;892',
-    '081&ndash;904',
-    '081&ndash;906',
-    '081&ndash;942',
-    '081&ndash;946',
     '081&ndash;947&ndash;1607',
-    '081&ndash;948',
-    '081&ndash;958',
-    '081&ndash;960',
-    '081&ndash;981',
-    '081&ndash;983',
-    '081&ndash;995',
-    '081&ndash;997',
-    '081-287',
-    '081-313',
-    '081-318',
-    '081-330-7216',
-    '081-332',
-    '081-335',
-    '081-341',
-    '081-398',
     '081-399',
-    '081-459',
-    '081-643',
-    '081-658',
-    '081-663',
-    '081-669',
-    '081-682',
-    '081-686',
-    '081-742',
-    '081-742-6600',
-    '081-767',
-    '081-846',
-    '081-866',
-    '081-875',
-    '081-886',
-    '081-888',
     '081-897',
-    '081-902',
-    '081-952',
-    '081-960',
-    '081-969-0453',
-    '081/071',
-    '0810',
-    '081000',
-    '081893programme',
-    '08206&ndash;62260',
-    '0820hrs',
-    '0823',
-    '082592prgoramme',
-    '0828',
-    '083,000',
-    '0830&ndash;1550',
     '0830&ndash;2230',
-    '0831',
-    '0833&ndash;45',
-    '0839&ndash;666875',
-    '0839/6',
-    '08391987',
-    '0840hrs',
-    '0844',
-    '0845/1015',
-    '0847',
-    '08509',
-    '0851',
-    '0853',
-    '08542',
-    '08552',
-    '0856&ndash;851186',
     '0856:58',
-    '0858',
-    '0860919838.',
-    '0862',
-    '0863',
-    '0865&ndash;244614',
-    '0874',
-    '0878',
-    '08793',
-    '0880',
-    '088078',
-    '0885',
-    '0885-82285',
-    '0886&ndash;32369',
-    '0890',
-    '0891&ndash;121680',
     '0891-888657',
-    '0891525',
-    '0892-20331',
-    '08926',
-    '089282',
-    '0893&ndash;141414',
-    '0898&ndash;666629',
-    '0898-style',
-    '0898-type',
-    '08:00:19&ndash;0600',
-    '08:02',
-    '08:05:37',
-    '08:07:06&ndash;0600',
-    '08:10',
-    '08:14',
-    '08:14:56&ndash;0500',
     '08:15:17',
-    '08:15:29',
-    '08:16:34',
-    '08:17',
-    '08:17:07',
-    '08:17:54',
-    '08:19',
-    '08:20',
-    '08:20:35',
-    '08:21',
-    '08:23:09',
-    '08:24:32',
-    '08:25:33&ndash;0500',
-    '08:27',
-    '08:30:58',
-    '08:31:30',
     '08:31:41',
-    '08:32',
-    '08:35:56',
-    '08:36',
-    '08:37',
-    '08:37:27',
-    '08:37:38',
-    '08:40',
-    '08:40:19&ndash;0600',
-    '08:43',
-    '08:46',
-    '08:46:16&ndash;0500',
-    '08:47',
-    '08:47:49&ndash;0500',
-    '08:48',
-    '08:49:22',
     '08:49:33',
-    '08:50:56',
-    '08:52',
-    '08:52:51',
-    '08:53',
-    '08:54:43&ndash;0500',
-    '08:56:09',
-    '08:57',
-    '08:57:56',
-    '08:58:26',
-    '08:58:49&ndash;0600',
-    '08:59',
-    '08s',
-    '09-sep',
-    '09-set',
-    '09.00&ndash;17.30',
     '09.00&ndash;21.00',
-    '09.00&ndash;23.00',
-    '09.02',
-    '09.03',
-    '09.10',
-    '09.22',
-    '09.30&ndash;12.30',
-    '09.30&ndash;18.00',
-    '09.30&ndash;19.00',
-    '09.30&ndash;19.30',
-    '09.43',
-    '09.46',
-    '09.55',
-    '09.76',
-    '09.86',
-    '09/94',
     '0900092',
-    '0902the',
-    '0904&ndash;629745',
-    '0904558',
-    '0906.1',
-    '0906.2',
-    '0906.3',
-    '0906.4',
-    '0906.5',
-    '0906.6',
-    '0906.7',
-    '0907.1',
-    '0907.2',
-    '0907.3',
-    '091&ndash;225',
-    '091&ndash;236',
     '091&ndash;261',
-    '091&ndash;281',
-    '091&ndash;373',
-    '091&ndash;378',
-    '091&ndash;386',
-    '091&ndash;3869531',
-    '091&ndash;388',
-    '091&ndash;415',
-    '091&ndash;490',
-    '091&ndash;491',
-    '091&ndash;528&ndash;0353',
-    '091&ndash;584&ndash;1148',
-    '091&ndash;81',
-    '091-477',
-    '091.644.8470',
-    '0910.1',
     '0910.2',
-    '0910.3',
-    '0910.4',
-    '0910.5',
-    '0910.6',
-    '0911:25',
-    '0914773600',
-    '091567&ndash;6155',
-    '0919',
-    '0920&ndash;870811',
-    '0924&ndash;278027',
-    '09253',
-    '0929',
-    '093&ndash;14444',
-    '0930&ndash;1630',
-    '0930&ndash;1700',
     '0930hrs',
-    '09323',
-    '0933',
-    '0937&ndash;581603',
-    '0937832972',
-    '0942',
-    '0945&ndash;1145',
-    '0945hrs',
-    '095&deg',
-    '0951596403',
-    '0951894412.',
-    '095245',
-    '0953',
-    '09530',
-    '0954',
-    '0955',
     '0960',
-    '09603&ndash;51580',
-    '0963',
-    '0965',
-    '0966',
-    '09662',
-    '09665',
-    '096m',
-    '09734',
-    '0977',
-    '0980',
-    '0981',
-    '0985&ndash;212312',
-    '0986',
-    '0989&ndash;767600',
-    '0993&ndash;702616',
     '0993&ndash;778531',
-    '0995&ndash;605384',
-    '09:00:04',
-    '09:00:14',
-    '09:03',
-    '09:05:27&ndash;0600',
-    '09:07',
-    '09:07:00',
-    '09:07:09',
-    '09:07:53&ndash;0400',
-    '09:08:08',
-    '09:08:10',
-    '09:09:35',
-    '09:10:59',
-    '09:11:05',
-    '09:12:04',
     '09:13:28',
-    '09:15:01',
-    '09:16:07',
-    '09:16:41&ndash;0500',
-    '09:17',
-    '09:17:37',
-    '09:17:42&ndash;0600',
-    '09:18',
-    '09:19:26',
-    '09:20',
-    '09:20:52',
-    '09:22:15',
-    '09:22:20',
-    '09:22:33',
-    '09:23',
-    '09:23:20',
     '09:23:48',
-    '09:24:31',
-    '09:25:05',
-    '09:25:33',
-    '09:26:16',
-    '09:26:55',
-    '09:27:07',
-    '09:28:01',
-    '09:29:44',
-    '09:30',
-    '09:30:39&ndash;0500',
-    '09:33:08',
-    '09:33:22',
-    '09:33:28&ndash;0500',
-    '09:33:47',
-    '09:33:48',
     '09:34:06',
-    '09:34:09',
-    '09:34:43',
-    '09:34:53',
-    '09:34:55',
-    '09:35',
-    '09:36ut',
-    '09:37',
-    '09:37:01',
-    '09:37:17',
-    '09:37:37',
-    '09:38:54',
-    '09:40:42',
-    '09:40:43',
-    '09:41',
-    '09:41:11',
     '09:41:33',
-    '09:42',
-    '09:42:02&ndash;0500',
-    '09:42:46',
-    '09:43',
-    '09:43:00',
-    '09:43:13',
-    '09:44',
-    '09:44:02',
-    '09:45',
-    '09:46:40',
-    '09:46:46',
-    '09:46:50',
-    '09:47:18',
-    '09:47:21',
-    '09:47:54',
     '09:48',
-    '09:49',
-    '09:50',
-    '09:50:28',
-    '09:50:40',
-    '09:51:02',
-    '09:51:25',
-    '09:52',
-    '09:52:03',
-    '09:52:15',
-    '09:52:39',
-    '09:52:44',
-    '09:53:02',
-    '09:53:17',
-    '09:53:37',
-    '09:53:44',
     '09:54',
-    '09:54:12',
-    '09:55',
-    '09:55:03',
-    '09:55:04',
-    '09:55:14',
-    '09:55:17',
-    '09:57:53',
-    '09:57:54',
-    '09:58:40',
-    '09:58:58',
-    '0:01',
-    '0:01secs',
-    '0:03secs',
-    '0:04secs',
-    '0:11',
     '0:13',
-    '0:13secs',
-    '0:14',
-    '0:15',
-    '0:15secs',
-    '0:22',
-    '0:23secs',
-    '0:26',
-    '0:27',
-    '0:28',
-    '0:29',
-    '0:31secs',
-    '0:32',
-    '0:34',
-    '0:36secs',
-    '0:38',
     '0:41',
-    '0:42',
-    '0:42secs',
-    '0:44',
-    '0:45',
-    '0:48secs',
-    '0:50',
-    '0:51secs',
-    '0:52',
-    '0:52secs',
-    '0:54',
-    '0:55w2(5q/5e)',
-    '0:57',
-    '0:93sec',
-    '0=1,2,3,4,5',
-    '0=20',
     '0=absent',
-    '0=all3',
-    '0=closed',
-    '0=formed',
-    '0=never',
-    '0=none',
-    '0=quiet',
-    '0a0314f',
-    '0a60018852',
-    '0aa',
-    '0ad',
-    '0ah',
-    '0al',
-    '0aq.',
-    '0ar',
-    '0bb',
     '0bu',
-    '0bz',
-    '0cm',
-    '0ctel',
-    '0dbm',
-    '0df',
-    '0dp',
-    '0du',
-    '0e27021079',
-    '0e27047362',
-    '0ee',
-    '0ep',
-    '0eq',
-    '0et',
-    '0f',
-    '0fq',
     '0ha',
-    '0hb.',
-    '0hd',
-    '0hh',
-    '0hp',
-    '0in',
-    '0je',
-    '0jh',
-    '0jj',
-    '0jt',
-    '0kesc&lsqb',
-    '0ll',
-    '0lq',
-    '0lr',
-    '0lt',
-    '0lw',
     '0lz',
-    '0mg',
-    '0mg/l',
-    '0mm',
-    '0n',
-    '0ne',
-    '0ne-off',
-    '0ng',
-    '0nly',
-    '0nt',
-    '0nz',
-    '0o',
-    '0pn',
-    '0pp',
-    '0ppm.',
-    '0ps',
     '0pw',
-    '0py',
-    '0q',
-    '0qp',
-    '0qt',
-    '0rb',
-    '0rl.',
-    '0rp',
-    '0rt',
-    '0sa',
-    '0sd',
-    '0st',
-    '0su',
-    '0sx',
-    '0thers',
-    '0thinks',
     '0tn',
-    '0troops',
-    '0ts',
-    '0us',
-    '0use',
-    '0ver',
-    '0ws',
-    '0wy',
-    '0x14',
-    '0x9',
-    '0xf',
-    '0xford',
-    '0xw',
-    '0xx',
-    '0yb',
-    '0z',
     '0zr',
-    '1%-',
-    '1%-3%',
-    '1%-4%',
-    '1&amp&ndash;2hr',
-    '1&amp;1/2',
-    '1&amp;1/4',
-    '1&amp;15',
-    '1&amp;frac14',
-    '1&amp;in',
-    '1&amp;shilling.',
-    '1&aring;u',
-    '1&bsol;2',
-    '1&deg;w',
-    '1&divide&phgr;th',
-    '1&divide;3',
     '1&divide;5',
-    '1&formula',
-    '1&formula&ins',
-    '1&frac12&deg',
-    '1&frac12&ndash;2&frac12;-year-olds',
-    '1&frac12&ndash;3&frac12',
-    '1&frac12&ndash;4',
-    '1&frac12&pound&deg',
-    '1&frac12&times;&frac12',
-    '1&frac12/7',
-    '1&frac12;-2',
-    '1&frac12;-hour',
-    '1&frac12;-hours',
-    '1&frac12;-millisecond',
-    '1&frac12;-page',
-    '1&frac12;d.',
     '1&frac12;hours',
-    '1&frac12;kg',
-    '1&frac12;lbs',
-    '1&frac12;lbs.',
-    '1&frac12;mm',
-    '1&frac12;pt',
-    '1&frac12;pts',
-    '1&frac13',
-    '1&frac14&deg',
-    '1&frac14;-acre',
-    '1&frac14;hours',
-    '1&frac14;kw',
-    '1&frac14;p',
-    '1&frac15;kg',
-    '1&frac34&ins',
-    '1&frac34&ndash;2',
     '1&frac34;d.',
-    '1&frac34;in',
-    '1&frac34;in.',
-    '1&frac35',
-    '1&frac58&ins',
-    '1&frac78%',
-    '1&frac78&ins',
-    '1&gt',
-    '1&half;inches',
-    '1&half;x1inch',
-    '1&half;x2inches',
-    '1&lt',
-    '1&mdash;1.5',
-    '1&mdash;1.5%',
-    '1&mdash;154',
-    '1&mdash;17',
     '1&mdash;2%',
-    '1&mdash;2p',
-    '1&mdash;4',
-    '1&mdash;41',
-    '1&mdash;5',
-    '1&mdash;50',
-    '1&mdash;9',
-    '1&mdash;98',
-    '1&mdash;gandhi',
-    '1&mgr;gml',
-    '1&mgr;jk',
-    '1&micro;ci',
-    '1&micro;v',
-    '1&middot;1',
-    '1&middot;1ltr',
-    '1&middot;2',
     '1&middot;25ml/&frac14;tsp',
-    '1&middot;65',
-    '1&middot;7',
-    '1&middot;85ltr',
-    '1&ndash&frac14',
-    '1&ndash&frac14&ins',
-    '1&ndash;0&ndash;1&ndash;0',
-    '1&ndash;0&ndash;30&ndash;1',
-    '1&ndash;0-alkly-',
-    '1&ndash;0-alkyl-2&ndash;0-acetyl-sn-glycero-3-phospho-choline',
-    '1&ndash;0-alyl-2&ndash;0-acetyl-',
-    '1&ndash;01&ndash;01',
-    '1&ndash;06&ndash;25',
-    '1&ndash;07',
-    '1&ndash;1&amp;frac12',
-    '1&ndash;1&amp;hr',
     '1&ndash;1&frac12;hr',
-    '1&ndash;1&frac12;in',
-    '1&ndash;1&frac14',
-    '1&ndash;1&ndash;12',
-    '1&ndash;1,86min',
-    '1&ndash;1.25&deg;c',
-    '1&ndash;1.25kg/2&ndash;2&frac12;lb',
-    '1&ndash;1/2oz',
-    '1&ndash;1/4',
-    '1&ndash;104',
-    '1&ndash;10:10',
-    '1&ndash;10cm',
-    '1&ndash;10mw',
-    '1&ndash;11&ndash;0',
-    '1&ndash;11&ndash;8',
-    '1&ndash;11-',
     '1&ndash;111',
-    '1&ndash;114',
-    '1&ndash;1189',
-    '1&ndash;119',
-    '1&ndash;11s',
-    '1&ndash;12:36',
-    '1&ndash;13%',
-    '1&ndash;13&ndash;0',
-    '1&ndash;14&ndash;0',
-    '1&ndash;14&ndash;28',
-    '1&ndash;145',
-    '1&ndash;15.703',
-    '1&ndash;1566',
-    '1&ndash;16.31',
-    '1&ndash;16.6',
-    '1&ndash;17.591',
     '1&ndash;171',
-    '1&ndash;179',
-    '1&ndash;18.51',
-    '1&ndash;192',
-    '1&ndash;2&deg;kh',
-    '1&ndash;2&ins',
-    '1&ndash;2&ndash;1',
-    '1&ndash;2&ndash;12',
-    '1&ndash;2&ndash;8',
-    '1&ndash;2,90min',
-    '1&ndash;2.30',
-    '1&ndash;2.38',
-    '1&ndash;2.5',
-    '1&ndash;21.146',
-    '1&ndash;229',
-    '1&ndash;235myc-srf',
     '1&ndash;27',
-    '1&ndash;29',
-    '1&ndash;2:4',
-    '1&ndash;2a/9&mdash',
-    '1&ndash;2cm/&frac12&ndash&frac34;in',
-    '1&ndash;2in',
-    '1&ndash;2s',
-    '1&ndash;3&deg;c',
-    '1&ndash;3&ins',
-    '1&ndash;3&ndash;1859',
-    '1&ndash;3&ndash;54',
-    '1&ndash;3,5,6,35,45',
-    '1&ndash;3/4',
-    '1&ndash;3/579&ndash;81',
-    '1&ndash;300',
-    '1&ndash;304',
     '1&ndash;36',
-    '1&ndash;38',
-    '1&ndash;381',
-    '1&ndash;3g',
-    '1&ndash;3km',
-    '1&ndash;3oz',
-    '1&ndash;412',
-    '1&ndash;42',
-    '1&ndash;43',
-    '1&ndash;44',
-    '1&ndash;45',
-    '1&ndash;46.4',
-    '1&ndash;46.48',
-    '1&ndash;47',
-    '1&ndash;476',
-    '1&ndash;48.05',
     '1&ndash;49.03',
-    '1&ndash;5,22&ndash;9',
-    '1&ndash;5-2',
-    '1&ndash;50.07',
-    '1&ndash;50.21',
-    '1&ndash;50100',
-    '1&ndash;51',
-    '1&ndash;51.20',
-    '1&ndash;53',
-    '1&ndash;53.40',
-    '1&ndash;53s',
-    '1&ndash;550',
-    '1&ndash;57',
-    '1&ndash;57.35',
-    '1&ndash;598',
-    '1&ndash;5kev',
     '1&ndash;5s',
-    '1&ndash;6%',
-    '1&ndash;6&deg;gh',
-    '1&ndash;6&ndash;1',
-    '1&ndash;6&ndash;8',
-    '1&ndash;6-2',
-    '1&ndash;603',
-    '1&ndash;65',
-    '1&ndash;652',
-    '1&ndash;66',
-    '1&ndash;660',
-    '1&ndash;6g',
-    '1&ndash;7&ndash;0',
-    '1&ndash;7&ndash;25',
-    '1&ndash;7&ndash;8',
-    '1&ndash;7.5',
     '1&ndash;75,000',
-    '1&ndash;755',
-    '1&ndash;75:1',
-    '1&ndash;8%',
-    '1&ndash;800&ndash;24-levis',
-    '1&ndash;800&ndash;759&ndash;7253',
-    '1&ndash;82',
-    '1&ndash;9%',
-    '1&ndash;9&ndash;0',
-    '1&ndash;930',
-    '1&ndash;94',
-    '1&ndash;98',
-    '1&ndash;9pm',
-    '1&ndash;thu',
-    '1&plus;1',
-    '1&pound;954',
     '1&prime',
-    '1&prime;12&prime',
-    '1&prime;20&prime',
-    '1&prime;21&prime',
-    '1&prime;23&prime',
-    '1&prime;25&prime',
-    '1&prime;44&prime',
-    '1&prime;47&prime',
-    '1&rarr;2&rarr;6&rarr;4&rarr;3&rarr;5&rarr;1',
-    '1&shilling/11',
-    '1&shilling/6',
-    '1&shilling;11&frac34',
-    '1&shilling;3',
-    '1&shilling;4',
-    '1&shilling;4d',
-    '1&shilling;6d.',
     '1&shilling;8',
-    '1&shilling;9d',
-    '1&shilling;9d.',
-    '1&sol;10th',
-    '1&sol;25th',
-    '1&sup2',
-    '1&times',
-    '1&times;1&times;10',
-    '1&times;10/l',
-    '1&times;150',
-    '1&times;2',
-    '1&times;3in',
-    '1&times;95',
-    '1&times;ssc',
-    '1\'-104\'',
-    '1\'08',
     '1\'2\'3',
-    '1\'24',
-    '1\'32',
-    '1\'51',
-    '1\'entrepreneurial\'',
-    '1()0',
-    '1()00-acre',
-    '1(-12)+5',
-    '1(1).',
-    '1(13&ndash;14)(27)(43)(49)',
-    '1(47)',
-    '1(6)(8)(20)(40)(48)',
-    '1(7).',
-    '1(9)',
-    '1+&dollar;b&dollar;2',
-    '1+1+1',
     '1+9',
-    '1+b2',
-    '1+i',
-    '1,000&deg;c',
-    '1,000&deg;c&mdash;sufficient',
-    '1,000&ft',
+)
+
+blocks_98 = (
+    '$#ver"$ack\'#"le#&matter#\'ucepans#!y$!s"$cape&!d#+ene-setting#%hools#&issors##ope$$ring#%ripts',
+    '"%eemed#\'lf-talk$!l%"er#*mantically##nse&\'-group\'%$ible&$tive#&rgeant&!i$"ve#!t$!s$#tle',
+    '#%xism\'$&uality"&gothan"%hadow$#ggy$!m$"re#%elter#$ould\'"er$!w%$case#&uffled"#ick##des',
+    '#$lent$"ly#$mple#%ngers#"r\'#$ster#!t#!x$(ty-three"$kins$(p-refers"(lavenski#%ough\'$$wly."$mall',
+    '#\'uggling"%nappy"%occer#$ever#"ld$"id$"ve#\'metimes#%nnets#%ulful$%nding"$peak$(ciation\'%!t#$lits',
+    '#$ring$#uce""ri$#ght"*takeholder$&rlings$#tic#(ealthily$$pson##ill##oke$"od$%pping$\'ry-like$!w',
+    '$&ongman$$uck\'&\'turally#&udents$&ffing\'#5yle-palais-style-ritz"-ub-christians%(exercise$\'sidiary%\'tantial#+ch-and-such#\'ffering#%ggest(!s#&itably',
+    '#)mmarising#"re$$face$*plus-value$)realistic"$weet"(yllables#&mbolic$(metrical!"t\'"%ables#$ches#!i##ke\'#$lent',
+    '%"ed#$nkan#"to%!e"&ectors#"ll"(hanking\'&!s\'!.#"er$"se$"ts#&irties$\'sisgood#%ought',
+    '$$ush\'#\'wacker\'"$ilda#!m""oo#$pic\'#&xemia\'",ranquillity\'#%umper#$ying"\'utelle\'"%welve!)ukrainian"(llabaloo"$mble',
+    '#$ping"%nable##der&%stand##ter$#ing"%rting##y\'s"#zzy!\'vantage"$e_no#"ry"&isitor"#oid!"w\'',
+    '$"h\'#"x\'"$eak\'$"ld%#th\'#(dnesday\'",haddayoumean#%erein##ich$$sky\'$#te\'"&icked\'#"de##ght#\'lfully\'',
+    '$!g##th\'"&obbles##men#\'nderful#&odbine%%ruffe#%rking"!t!"ye#!a#(sterday\'""uk!!z""bo',
+    ' \'(2.2.i)!%91)15!%hl)3o!,in)flu(enza)!(omni)bus!/re)frig(erator)$(planting!$s)he"0sp1&lsqb;l&rsqb)!*tele)phone!&wo)man !)!#and %*&amp"-pound&dollar%',
+    '!***&ouml;dp#%*****%#900$&allied%(ppointed$)hungarian$#ona$*previously$$shiv$#the$%zabit#!1#%after$%ngela$#sen',
+    '#\'bernard$\'ramante#(calogero$&hanged%\'ristian##did$(ominique#$east#%fatos$&orward#,g&uuml;nther$%erman#$held#(includes#$left',
+    '#\'mananga$+edlearnf***$%ichel%"no$%ojkom$%uduka#"no#(outgoing#&rainer$#ear%&signed%&tained%+volutionary$\'iccardo#$seat',
+    '"(+pauline"#3.4#"28"!5#).55.31213"#a.i#"bd%(el-karim(&rahman%"ol%"ul#%damou$%olphe#$hmed#%lbert',
+    '$!i$\'l-india%"an#\'mbrosio#!n$$ders$%nette$%terea$$uwat$#war#$rgaw"$badr$%itika$%rbara#%elcho',
+    '#%inata#(oanareke#$rice%"ef%"g."&carlos&"ye$\'therine#%engiz#&harles%&udhary$"en$#ien$!o%!e',
+    '%%udhry$)ristopher$#uan#%leopa##ol.$\'mmodore%&prised$&ngress"&damian$!n$#wud#&efence$(mocratic$%rmott%"og',
+    '#.ieudonn&eacute$"ng#&ouglas#!r$#ini"&edwige##lie##ric#$ugen#&waryst"%faith$%khuri$#qir$"zl#)erdinando',
+    '#.ran&ccedil;ois&#cis&!k$\'ederick"!g#%eorge(!s$$rman#&ilbert%$lian#(owkarran#%raham$$eger#"uy"*hamidollah',
+    '$$rald$$ssan#&oumadi#%ubert$"gh$(samettin"\'ibrahim#$jlal#$lhan#$mren#%natoa$$dian$(novation#&oannis#$slam',
+    '"+j&uuml;rgen#$ames$$nata##ean&&-louis\'%marie\'&pierre\'&robert$$nner#&ohanna$&nathan#$ulie$%stice\'!n"!k',
+    '#&enneth$$rala&#mat#(hondaker#(rzysztof##urt"&lalith#"ee$&ontjev#%ionel$"st#(odongiyn#%udwig"\'madigbe$$hmud',
+    '$#lik$$rcel%#wan%!y$%ynard##ehr$&lchior$$mber#\'ichalis$"et$#hai#\'uhammad"*namatollah$#sir##eal',
+    '#\'ikolaos#"ot#%umber#%zanda"!o#(kitakula#$scar#%thers#"ut"$paek$"rk$\'triotic#"dc#%encho$)rcentages',
+    '#&ramual$"es%\'viously"\'rafiqul$#lph$#nil%#jan$"tu#&emuera$(n&eacute$(presents$(shuffled#%oedad$%manus$!s',
+    '"!s#\'a\'adoun$"ad$$ifur$$rdar%$jang$"yd#%cenes#(ecretary$&parate$$youm#$hane%#ykh$$eikh##idi',
+    '$#mon$!n#(ocialist$%tiris#&tanley$%ephen)#son#$ubin$&layman"%taher$#riq\'"ul#%eaiwa#\'heodore$$omas',
+    '"!u#!k##nix$(official"(vatiliai##ere#(ice-adml%#tor$%liame$&rginia$"to"!w#"en#&illiam&!y',
+    '$&thdrew#$omen#&rongly""yi##lli"*zamiruddin#%egeye#$iyad##ydi!"++!,10.113.41920#"0%"%1.65%""5%"&93o728',
+    '!!2"#.53""20"!4!!3"!2#"00"&43,854!$5316!#80/""e2!!9!+abdal-majid$"ou$"ul',
+    '&&rahman#"el#&khazia#%salon#$ukar"\'ccuracy#\'hilleas#$tual\'!*"#d13$!5#%anech#%vices"%frica"$hmed',
+    '"$icha#(m&eacute#!r"$kira"(l-daawah#%amgir#$bert\'#ino\'!o##eks&%ander)"ur$!x%&andros)!u',
+    '#"l*#&phonse#%ready#\'uminium"&ndaman$(r&eacute%!e&"as&!w%#zej#"na$#uar#,t&oacute;nio$$onio##war',
+    '$(ointment"$riel"%sleep#"om##sad$$ifat$\'umption#$tere"&udrius#%gusto##rel"$vila##ner$!i"#wni',
+    '#%rbara#$shir$"il$$prog""bc"$egum#$kele#&lachew#*no&icirc;t"#ill""ob#)naventure#"th##yko"!p',
+    '##uno"-udragchaagiyn#!i#&rchell"!y!)candidate\'!o#!o#)rl-dieter$$melo"#clo"&entral"#fup%%/cclo"$hahe',
+    '%"ge$"rt$%vanne#"en$$ques$#rif#!i#"ou%%dhary##ris&\'toforos(!s"%laude&"io#%inton',
+    '""ol#&mbined#/nc&eacute;pcion%\'lusions$\'stantin$%tents#&rneliu!$d.w.".ancing/cabaret#"ri##tuk#!u"$elhi$$phin#$nnis',
+    '#(veloping"$hari"&idymus#"ma$%itrij(!s#\'version"%mitry"%onald#"ra!"ec"$dbas#"im"#ely"(fthymios',
+    '"$ight"!l##ahi##ias#"se"#mil%!e"%nergy"&rskine"%urope\'"an"&waryst"\'xactly*$$mple!,faasootauloa',
+    '#!r##teh$"os#%ustin"$iame#%gures#\'nancial##rst&!*"&lorian"%ormer\'"ly"#ran%"ce\'#sco',
+    '%"jo#$eddy"!u#&imaono!\'gabriel"(enerally$$nady#%rmany$"ry"$hazi#$ulam"%ianni#$lles#%orgio$%vanni',
+    '##ven"$ojko#%nzalo#$rdon#(vernment"%raham##een&%peace$#the##oss"\'uardian#$inea#"lf!"ha#"ji',
+    '#$nnan%%elore$#son#$rold$#vie$$yana##san$#san#"ve#(yatollah"$enri%!y#&skeith"\'ideyuki#$kmat',
+    '"!o#$dge*""su"$uang#$bert!!i"&acovos#!n"\'brahima#"sa"!d"&eremia"#gor"$liya##kka',
+    '#)dependent,!s$&icates##put#+ternational\'#et*"&oannis""ra#%mgard"!s##aac#\'himatsu"!t""zz!.j&oacute;hanna',
+    '#$kaya##mes#!n$#ata$"ez$$uary##pan"+ean-maurice\'%ichel&&pierre##lko##rzy"$iang#"ri"#oao',
+    '#$zica"$ulio#!n$!d#%stino!%kabun#!j#$mran#"ng#"zi"$eiwa#%nneth#$rala"%halif"#ico',
+    '"$laus"$offi#$suke#"zo"\'rzystof&$ztof"#uma")vetoslava!+lakshadweep##smo#%urent&#tte#&wrence"$eafa##ft*',
+    '$$nard#$szek##ule"!i##ke*#!m"$ojze#"rd$%raine#$thar#!w$#ell"#sqb"%t-gen"!u',
+    '"%yuben!-m&eacute;dard"%ahmud#!i##jed$"id#$kale#%lcolm#%madou$#duh#$nuel$!y#!o#!p#(rc-henri',
+    '$%garet$#ian$#jan#$sami$#oma#"te$#ooq##uri&"ce"!e#!*#\'anwhile"%ichio##eke#$ftah',
+    '#"ha#!n$$imum#&roslav"&ohamed&#oud#$lwyn#$nday$&golian$$ique#"re$&iyoshi#&vement"%uerto#%hamet',
+    '#%stafa&#pha!$n-2*"$abbi#$jmul#%laila#&ntenin##sri##yma##zih"#eal#$gaso#$lson"#ick#&kolaus',
+    '#)n-binding%+participant$!g#&rberto$#man#"te"&uclear#!r$!i!(observed"$ffer"#leg%$ario"!n#"ly',
+    '"$scli"$ther"#ver""wn!*panagiotis##olo#"rk#$vlos"!c#!i"#eck#$ncho#%oples#!r$#rin',
+    '#(sticides#"tr$"ur"\'hilippe%#lip"(ierluigi$!t"%lease#!h"(ollidori#)ndicherry#(pulation#!r"\'regnant##ior',
+    '!!q"$emal"#ian"(u&eacute!\'rabbian#"if$#ner$$sing##lph#\'meshwar#"na#$shid#"tu"(ear-adml#$hman',
+    '#!n$0&eacute;-lambert#%ports#&search$%igned$$ults#&tained"&ichard"!o#%berto$"in#$dney#$land#!s$!a',
+    '##men#&pasena"&yutaro!6s&eacute;gol&egrave;ne"$abit#"id#&kvador#"la$#eha$$ifou%!m$&vatore#!m$#uel#)nduyjavyn',
+    '"(ebastien#$cond#$rved"%habib$!h%$zada$"ne$#rad$#ykh#$eikh$$lter#&iferaw$&getami$!h$!n',
+    '#%unpei"%ikkim##mon#!r#"ye"\'lavomir"%ocial#&ldiers#"ng#$riba#$und*$#rce#!w""sw"$tate',
+    '"$ubhi#\'cceeded#&leiman"$vend""ym#\'nthamin!%taher#%kashi##mil%$suke#%omati#"ro#$ysir"%eatao#\'chnical',
+    '#$ofil#"xt"#hai#"eo%#dor(!e$"re#$ink*$!s$(udoreiks#&ongyod"*ichaendepi#%mothy#"ng""oi',
+    '$#oji#%shiki#%umani#,wn&rehy;send"%raian#&inidad$!p##ong##ue*"$seng!#ugo")nchanged.##der#$ited##til',
+    '#3&dollar;1.00=4.7191#$amah"$ttar!-v&iacute;ctor"\'alentin%"ri\'!u#&ssilis"$ehbi"\'ictoire&!r#%ncent\'"zo%!i#(rabongsa',
+    '"\'ladimir"!o#\'lodymyr#$ting"!p"!u!*wahiduddin#&ldemar$"id$#ter#%shing##ter"!e#)erasinghe#!n',
+    '##re*$#ner#$sley$!t%#ern"#hen"&illiam#"th"%on\'t*!#xie!&yadira#"ng"(eazuddin##gor"!i',
+    '"#oon#$usef%"uf#"zo"!u#(goslavia#"ji#"ry##val!*zahiruddin#"ki"\'bigniew"%denko""hu"$iyad',
+    ' *+&agr+&bgr"#egr"(pound;10*!0)&455.72)!5)!7)!8($2.25)%14.63(&482.93("55(&900.63)%46.85!(\'circle\'',
+    '"\'elected$\'isabeth!!-"&0.005%$#25%"#12v"$30mv""5%"!l!\'/&mdash"%-0.11%"31##180#"3v#"pi',
+    '!#0.0$!1$!5$"8p#!1$!6#!2$!5#"32$!5$"7p#$40p.#"58##638#"7%',
+    '#"8%$+5p.baconers#"92""26"#700!"1%"$&deg&#;10"".0$!6##11p#!3#&42%/yr##5kb#!7',
+    '"!/"#0.7$"80#%0&deg#"db"!1#".1$!5$!6$!7#"21#"90"#2.4#\'0&deg;c"#3.0',
+    '$!5$!8"#4.0%!0$!5$!6$!9"#5.4#"03"#6.2$!8"#7.7#"0%#!9#"mv',
+    '#$&deg#$.22%$!3$!7#"0%""9%#".3$!5#!0"#and!\'2&aring"\',650kms"".0#!1#"26',
+    '#"5v#&60%/yr#"7%"\'0&deg;c#".3$!4$"95##0bp"#1.4$#72%#(47483647#"63"&24.701"#3.7"%4.80%',
+    '#$.00%$!4$!9#!2#!v"%6&deg#".1"!8#".4$!7#"0%"!9#".9#"0%"!b',
+    '!&3&phgr"$,978"".0#.31p.liveweight#"6%#"8%"%0&deg#".3"#2.0$!2""3%#".4#!7"#4.5#$00bp',
+    '"#6.3#$00bp"#70%#\'7.68396"!9"!v!"4%"&&deg;c"#.15##68p"!1#!2#!3"#2.1"!6',
+    '!\'5&deg;c""-3"".6#!7#!8""00$!%$#0bp#"mv"!1#"0%"#20%"\'8&deg;c"%9.17%"!v',
+    '#!3#*5mm/-4.0mm##64p#!8"!2"#3.8"!5"#6.3"#8.9!$7+21"%,500="".3"\'0&deg;c"#20%!"8%',
+    '#"49#!5#!8#!9"!0"!5!%903kg"!2""91!%_1855!"a5#0-&commat;int(a5)"!h""nd"(ppointed',
+    '#$3/b8"$4-b5""7/$"b6"%8-b11"#rig"!t!8c10&lt&commat;datevalue("%arlos"$hris"&ollege#\'mmodore""rp!"d6"#ef.',
+    '""2/"&ddison"&nglish#"os"!r!#fay"%emale"(riedrich##ont!)g10&gt;10"&erhard!\'herbert""is!$il-6"!n',
+    '"!k"%oshua",uli&aacute;n!/krebs-henseleit"\'umbirai!#low!%matti!!n!#o=h"#pen"!r!\'p&amp;p"$edro"#ure!!r',
+    '"%4,100"(adiation"*e-election"&ichard"&oberto!&sch200"$hort"$imbi"%ydney!%tarja"\'uulikki!&ulises",s&dollar;0.1+%1,000-#100',
+    '."60-#309-#646-#704-#800/!2."61-#962,".4,$05.9,%1,000.\'800,000-".3-#9.3,%2,400',
+    ',"43,!6-$,100+)2,010,000-#520-#670-#766-#840,"00,"12,$25.7,"41,!5-!5,"70',
+    '-#270-\'410,000-#545-#750-#910,"42,"56,!6,$89.2+%4,120-#300-#414,".9,"17,&39,000',
+    ',"61,%8,400+!5,$,000-#340-#410-#550-#800-#915,%0,000+%6,990,".3,#0.3-!0,#3.2',
+    ',"96+%7,200,!1,!2,$34.6,!5,#6.1,%8,000.#800,!9-!2+#800,%7,000,"91++908,000,000',
+    ',!5!(victoria!$wait"&itness"\'olfgang!!z"!k .,_a_great_deal#(s_though#(way_from"*each_other#,r_over_there"-in_as_much_as%%order".on_the_part_of',
+    ' !-!(&bgr&ggr%!\'"*dollar;24m)&85,000"*frac12&deg&"23"#ggr",lcub;gm&rcub"(pound;10)$20pp(&20,850)%3,100)#50k("30',
+    '##sgr!-(1&times;2)-o".2-cyanoethyl)-#$.31)$#85)""3)""4)#S,4\'-dimethoxytrityl)-3-deaza-2\'-deoxy-adenosine-3\'-#"0)""7)"$a.b)""d)""e)""i)##ii)',
+    '!%-----&\xa6--------------&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound&pound$#ing##n--"#are""to"%which!(0.0015,1%!2%!7$"1%%!6$"25$!3%!5',
+    '%!3$"65$!8%&&deg;c%!3$!9#"1%$"1%$%5&deg)";c$!7#!2$!%$!1%!%',
+    '$!6$!7$!9##316$"32&)&divide;4$!4$"67#(42&deg;c$!7$"81%!2%!6$#978%"92',
+    '$"97$!e$"wm#%6&deg$!0$"1%$!3$!7$"98#!7$!%$!1$!5$!6%#732',
+    '$!0$!5$!8#%9&deg$!1$!9"#/-9"!7!"1%"$&deg&";c"(,0,1,2,3#!2$"00##357',
+    '$0ropanesulphonate\',ylpyridinium"#.01$!2$!5$!9#!1$!1$!9$"kb##2kb#"3%#!4#\'5&deg;c$!6',
+    '$"kb#%8&deg#"9%"!/"00&mdash;28&deg;c#$,000$#300##.05$!2%"2%#\'0&deg;c$$,000##3.4#!7$!5',
+    '#!c"\'1&deg;c#".2%!7$!3$"6%$!8%!%#\'0&deg;c$"bp#!2#!8""2%#$&deg#".3',
+    '#!3#!5#\'6&deg;c#!7#"d."#3.2"(4-strong#".2$"81#"06#!7"#5.5$"72$"82#%0&deg',
+    '\'";c#".0%"72$!4#\'0&deg;c$!7#"79$#deg"#7.2$"4%#"25#!6#"97"#8.1$!2',
+    '$$&deg#$10.5$#2.5#!6#!c"#9.3#!0#"44#"66#"80$!4$!7""kb""mm!\'2&deg;c',
+    '#$phgr"",1$!0##2,0%!2"#.00$!3$!7#!1$!%$"8%$"95#!2$$&deg#"39',
+    '$"kb#$68p.#"7%#!8$!%$!1$%3&deg"#0-c#".4#!0$".8#!8#"bp#!c")1.2&deg;c',
+    '$!5#(47483648#!7#!8"#2.0$!9%&&deg;c#!2#\'5&deg;c"\'3&deg;c#".8#"00$"bp"#4.2$!4',
+    '#!9"#5.5#!0$&&deg;c$"bp#!c""61#"9c""7%#".6$!7#\'0&deg;c#\'3&deg;c$!c#"50',
+    '#$.881#!0$!0##5bp#!c"#9.2""cl""kb!"3\'"#.01#"2%$"bn#!5$!%#!7',
+    '#!8"$0.81#$0sal#!2#!6""1%#".4$"67""2%#!5##kms""3%#".7""4%#!0',
+    '#"06#!c#"mv"%6&deg\'";c#".5$!7"%7&deg$(plusmn;4#".4$!7"#8.5#!1"!c""h_',
+    '!"4%"$,724"3-methyl-l-threonine"".2#!3#!6$!9#!8#!9"#0db"%2&deg#".5"!3##.16$!5',
+    '(#10\'(\'25\'20.2#"66"%5.97%#!0"%6&deg#$0kms""7%#!9$!9"!8#!%#&&deg;c"!9#!1',
+    '#!4#!5!$5\'10"$,000##833"".3$!%#!4#"5%##98%""/3""0%"%1&deg"#4.5#!0',
+    '"-57&ndash;3194"%6&deg"!7#".1##1.6#!3"#9.6"!b"\'o&deg;c!"6%"\'.069984#!2#"3%#!4#"5%',
+    '"%0&deg#!0#"db"!1"\'2&deg;c#$/-60""3%#!9#!f""43"#5ar""7r"48&deg&ndash;77&deg;f""93"#h2o',
+    '##900"".4#"56"#0bp"\'1&deg;c"#3.9"!4#!1"\'5&deg;c""6%#!0#!6#!9""8%#&&deg;c',
+    '""s.!#8.0$"0%#"1%#\'2&deg;c#!5#"8%$$&deg"!1#*&ndash;748#".5#"r."#2.5"#3mv"!4',
+    '$!8"\'5&deg;c#".5""6%"!c!#9.0#!3#!5$!%#!7$%34492#"9%"$00bp#"bp#"db',
+    '""21"!5"!6!.a(16&ndash;27)#*2&ndash;8)""-e#$half"(ccording%#unt#%etate#\'hieving#"pd#)quisition#$ross#%tions',
+    '(#ion$%ually"!d#"an#0enosine-mediated\'.ylhomocysteine#!h#)vertising$%ising"$fter"#kce"!l#$beit#$fred##gae',
+    '##kyl##ong#%right#0uminium-arsenide#$ways"&merica(!n##ine%6o-4.hydroxy.pteridines&\'caproic&%ethyl&)salicylic##ong#"ps")nglicised',
+    '&"te$"on#*other-time#!t$$hony$(iplasmin%\'trypsin"#pr."5rg-gly-asp-tripeptide%,pro-ser-gln-$%inine#$isto\'#tle##med#"y\'',
+    '#!e##ian#\'partate\'"ic#%tpase"!t#$suta!.b(32&ndash;36)#,46&ndash;52)""/2"$2/12""35""al#&thurst$$sman',
+    '""ed$%space#$fore#$gins$"un#*haviourist#%nzene%.oyl-l-tyrosine#/tter-at-his-age"%iangu#!g#"ll#\'otin-pe#&rthday#1s(l-aziridinyl)-n',
+    '""le#"oc$.ody-buggering-#"ue"+olkow-blohm#"ot#$ught"$rain#"ie#/omodeoxyuridine$$ught$#wne"(uildings%!t#&siness',
+    '""ye!.c(40&ndash;44)#,69&ndash;84)"\'-c-c-c-"".c"\'allisth#(pitalism#$rbon&%xylic$%rying#\'talysed$#tle""d3"/eau&scedil;escu#%ntred',
+    '##aff$#nge##eek%$rful$!n$#que$\'st-deep#&ildren#!o$(lesterol"$ides"!k#!-"%laims$#use',
+    '#%uster"!o#$-nh-#&achman$!t#!l$%oured$$umns#&mbined$(missural&%ttees%"on$&pliant%%onent&$unds',
+    '$\'jugated$&scious%%ensus$\'taining%(ributing&"ol#"oh$"ks#"te##unt&#ing#%vered"%razed##eet"!t',
+    '""w4!2d&lsqb;br2&rsqb/dt"-(58&ndash;66)"#ame#"tp#\'ughters"#ctp")e-bigorre$#nil$#vie##cay$&isions$&orated#"f.#&leting',
+    '#&mentia##nis#\'ploying$"th#$sire$$pite$\'troying#%vices"7iamidino-2-phenylindole&4ndino-2-phenylindole%9minedichloro-platinum(ii)#+benzoyl-5\'-$-romoindigotin##ene##git',
+    '#$keto#)mensional%+thylammonio))guanosine#\'visions##xon"!o#"me$%inant#$uble\'&think\'&#ing"!p"!q"&ressed',
+    '"%uring".xs94-dxs17-tel!"e-#$n-bt""a-#"ne#"se"\'ducated\'#ion"!e#"ne#"se#"ze"%ffect$\'iciency',
+    '#"ta"$ight#"ze"\'mission#&ployee("rs"!n#$able#$ergy#$sure#(terprise"!p#\'hedrine#(ithelial"$qual',
+    '""rs""ss"-thanesulfonic"\'uropean")valuation#"en"$xist#*pansionism$(erienced\'%ments#(tinction""ze!%faced$$tors#%lling',
+    '#$ther"*ertilisers#%tched""fr"\'inanced#"ve"*luorescein""or$&gotten$$ming$$tune"%rance#$iend"+ucopentaose#%lness',
+    '#$sion!"ga#!l$2actosidase-stained#(strin-17#"te")enerating%!s$.pgkefdtpl-cooh#%rlach$#man"#irl#"ve"5lutamyltranspeptidase#!y',
+    '"!o#"od"+ranodiorite#$oups"(uangzhou!"h-".alo-(het)aroyl#&unting"*cl-soluble"\'eadings#%lical%#xes#&raldic$\'egulins"%ilary',
+    '"&olders#%wever"#ung#%sband"*ydroxethyl\'3y-4-cholesten-3-one(!l!#i-e$(arned-it"#ble"#eze"#l-6#!l"&maging"&n-file',
+    '#\'cidents$%omers#&ducing#)efficient#*filtration#$gham##nen##put#$schr$%pired#\'tegrins$!o$&rinsic#(variably$%olved',
+    '"%somer#%raeli")t\'s-mine.#!y""um!\'jacques"#ean%%-paul""im"#ohn"#une##sta!\'keeping"!g""id',
+    '#!n$!g%%/king""oh"!t"!u!-lactoglobulin$!z#"nd#$tent%!r#&unched#!w"!e#"ad',
+    '&#ing##ben#!e#(g-theory#Nu-gly-gln-gly-ser-phe-arg-pro-ser-gln-gln-asn-#!y"#ine%!d$!g%&uistic#$ttle"%ocate#"ng#"ok%"ed',
+    '#!w""t.#!d")uxembourg"$ying!"m2"*aintaining#!n$$aged$)ufactured#&rgaret$$iano%#bor$#ket#"sk',
+    '#!y"\'ediated#$ets-\'(brothers#!m$\'+offset#!n$!t#(thionine%"yl\'(-(4r)-4-(*d-aspartic*)glucamine\'%ation\'(cytosine',
+    '\'+transferase"!i#$ckey$+roglobulin/#"nd%"ed"*j&ouml;sen""om#3nomethyl-d-orginine,*l-orginine$#ths#"re#"st#%unted&#ing',
+    '"\'utation"!y#!c!%names""di",euromuscular$%trino"(ien/-ney#"ne#/tro-l-larginine&\'aniline&&phenol"#jit"!o#!r',
+    '""pc""ya!"o-#&c-c-c-\'"o-#!e#%okles")ccurrence"3estradiol-activated"4f-ministry&rehy;fund#&ficial""ge""ic"!l##ide',
+    '&"st"!n#%-tees#"ce#"es#"ly"$pera&#ted")rang-utan#&dinary#&ganism"$ther"#us.#!t"#ver',
+    '"(xidation!"p1"\'alimony#\'ralysed$\'rhasius$!t%#ies""cr""en$(tanolide#$ople#\'rmeable$#son\'"al#*terborough',
+    '#\'enotype%"yl\'\'glycine#+otochemical"#ink"%layed#!y"%olicy#!p#&ssibly$"te"!q"(refixing$%pared$&served',
+    '$0ncipal+taxthresh#.o-ser-gln-gln-$$cess$&ducing\'"ts$$fits$(nouncing$#per$*staglandin$\'tection".seudoephedrine"/t&lcub;110&rcub"#ure"*yran-2-one!4qdpliakadaqesrl-cooh',
+    '!8r&eacute;citatif-ariette"&anging#$ther"\'eactive$%lised$$ring#)diffusion$%ucing#(flection#&garded$\'ulation#%mains#%nault#&quired#*sin-coated',
+    '#&tinoic$&urning""ia#"ch%#ard##ght#"ng#"se"#oom#%undel#"ws##yal"$uled#!n$$ning',
+    '"(aturated##ver#!y"$cale$!n$#rce#!e#\'h85,900$&ematic&"ed"#eat#%ction%$oral#%eking$!n',
+    '$"se$(timental#&rgeant##ven"$hape&!s#&etland#"ip##ort##rug"#ide#"on#$ster\'!s"#k-/',
+    '"\'melling"&o-vak-#$dium#\'mething#!n#&unding$#rce"$peak#"ot"(queezing"$taff$$ined$!r$#tus#"er',
+    '#&iglitz$"ll"(ubfamily$&strate$$unit#(ccessful#&lphate#*perimposed#$ssex"&wedish"%ystem!"t8"&actile#$iled#!k',
+    '#\'xthresh"$eeth#!r#=tradecanoylphorbol-13-acetate&-thiafulvalene"$heir$!m$!n$"se##ial$%nking$"ol$$rsty#$omas$"rp',
+    '#"us"!i#"ll#"me%%table".o-evolutionary$\'present#(copherol#/luenesulphonate#!n#!o#%wards"-ranscendental&&fected&\'mitting',
+    '$Ns(hydroxymethyl)methyl-2-aminoethane-sulphonic%)phosphate"#ure"%welve"$ypes!%under&(standing#!e#$less"(rokinase"0s&dollar;1,028.6."45."60-#112.%42.85',
+    '.$82.5-#202."60-#300."12."26-%444.4."99-#584-#600-#800,$.170-!3-"65,%0,932',
+    '-!3-!7-%8,600,%1,640-!1-%5,000,%2,280-"00-!2-#7.5/!8-!9,!3-".6-!0',
+    '-!3-!8,!4-#7.5,%5,677,$64.4-)5,000,000,!7-!0-)4,400,000-!9,!8-".9-!3,#9.2',
+    '-!1-#8.6-!9+%2,000."25/!9-#400-#500-#998,!0-!0-#3.7-#6.3,"10,"25',
+    ',#3.9,#4.2-!5,#5.2-!0-!8,"61-!6-!7,$78.5,!8-)1,000,000-!5-#6.5-#8.7',
+    '-".2+%3,100."52-#200."30."62-#522-#647."78-#756,".8,*00,000,000-!4-!7.".2',
+    '-!0-!6,$30.6,!5-!0-!8-!9,!7-!2-)3,300,000,"80,"94+%4,000."97-#201',
+    '-#900,".5,$03.7-!5,#2.7-!4,!3-!6,#4.3-!3,#6.4-!4-!7,"76,#8.9',
+    '-#9.9+%5,000-#200-#905,".2-!4,"16,!2-(,074,829-!0,#3.9,#4.2-#4.2,"54-#6.3',
+    ',"00.$,000,#1.7,!2,"50,"99+!7,".6,#0.6-!5,$14.5,#2.8,"39,"40,#5.3',
+    '-!3+%8,100-#330,"10,#2.3,"50-!9,!6,*86,000,000,!9+%9,570,".4-!6,!0,#1.6',
+    ',"57,#6.8-!6,"87,#9.9"!v!"v-#\'ascomit#*bastington$&entall%\'rkshire#&c.i.e.$)ommercial%(urtaulds$#ray',
+    '#)eccleston$&venett#!f#)islington#%lodge%\'ngridge#)mcdermott$,editerranean%$rton%*tropolitan$&ichael$%orley#(national$$igel#(scottish',
+    '#&targus$&emplar$\'hompson$&orfaen#$wade$#ebb"$alue$"ve#\'riables&#nts"-enereologists"#ine"$oice&!d!*washington',
+    '#"nt"?hat-this-refit-has-just-cost-us##ere##ich#!o"\'ielding#"fe#$nged#"se"$oman$"en#,rdsworth/lso##uld"&ycombe!$xxxx',
+    '"!i"#mps""ne #...!#000#%8&ins#%9&ins(";s$!s"(10&ins;s$%-.047#!1$$-.52#!2#!3',
+    '&"60#!6#!7"!3#!9"&40&ins#!6##7cm""58#"mm""7%#!3"$96cm#%8&ins#%99999',
+    '"%.6(b)"#000#"70#"80"!1#%0&ins$#8.4#"10#"25#-30&ndash;1197$!6#"50#"60#"70"!2',
+    '#+30&ndash;60$!5#"40$!5%(&ndash;8#*53&ndash;6#(67&ndash#"82$!4#"90$!6$!7",307&ndash;12$*9&ndash;32#+10&ndash;19',
+    '#"26#"50"#410#"23#"40#!5#"69#"70$,8&ndash;1503#-85&ndash;1547$*9&ndash;99#"97"#505#"10#"25',
+    '$*9&ndash;40#"43$!7#"50$!6#"68#"75#"88#-90&ndash;1640$!1$!2$!6#!p"#608#"15',
+    '#+21&ndash;46#"33$)4&ndash;8$!5$!7%&&ndash#-47&ndash;1704#"50$!7$!9#!6$!0$!2$!6$!9',
+    '#-81&ndash;1734#"98$!9"#708#"25$!6#"30$)2&ndash;9$!5$!6$,8&ndash;1826$!9#"44$!6#"50',
+    '$!1$!2$!3$!4$!6$!9#"60$!5$!8#"70$!3$!4#"80$!2$!3',
+    '$!4$!6$!7$!8$,9&ndash;1857#"91$,2&ndash;1871$!3$!4$!8$!9"#803$!6#+16&ndash;18$!8',
+    '$!7$!8#"34#"40$!6#"53$!5$!8#"81$#6/7"#901#+10&ndash;14#"82$!4$!5',
+    '!$2(b)"".1"!0#+0&ndash;120""2+"!4#$2199",54&ndash;184"!8"#h2o"!l!\'3&ndash(";8"#(b)"!0',
+    '$!s#)am-4.30pm""33#"mm"#4.4""50#!m",67&ndash;282"#8\'s"!9#!7!"40"*4&ndash;40""50#!s',
+    '")&ndash;1%"$-.75"".6""00"!4""50""90""kg"!m"%p/kwh!$6(a)""00""25"!3"!5',
+    '"*78&ndash;9""mm!"71"#2.3#!0##sec"!4""5p"!7"!h"!m#"ph!#805""10"!2',
+    '""30""4p""60""pc!#904""99!#cgm""ut!#dxf!#eps!#gif!#img!#pic!#scv#!x',
+    '"#dgr%!/%";d&!s"\'egr/&gt"%micro"%sgr;c"#tgr!%-s.p-!#/t/!!0!"1/"!0"!2"#62b',
+    '"!m!!3"!1"#220"!9!#4in!!5"#%co"$00ml"!9!"60!!8"*&ndash;57\'"%84979""in',
+    '!%a/&gt"&dviser$\'ocation"(fternoon"!i"$lbum#!l"!n#"d/#$imal#,ti-fasciclin&$nazi"!p#)pearance/$(lication',
+    '"!s""u/#"to""y/!!b"\'abyliss#(rbirolli#%ssist"\'eaulieu#"en#"st"#ike##rds"$o:t/#"dy',
+    '"(radstone#!e#"it%#ish"#sco""ut!"ca#2lmodulin-dependent#$mera#!n$%derel#&rousel""d3"\'herwell#&ildren',
+    '"!m"!o#\'mmunist("ty$$pany&!r\'$ison##nds$%flict##ral"%rania"$utty"*yclophilin!"d2""a/',
+    '"+eceleration#"i/#!l#%vised")ictionary#"p.#&rector#(scussion"!l""na"#oll#!n#"z/""r/##ive',
+    '"%utoit!%e&bgr"!/"\'con/soc"!d"\'famolia"!i""nd#$ergy#\'folding!"f\'""a/#$llen#\'mennian$#ily',
+    '"\'ighting""l/#$ying"%ollow#%reign$#mal""ri$\'goverre#"om"!s"#ull""vc!#gdp"&eneral#!t',
+    '#&enmuir#$obal""nc"#ood"$raph"%s-ana"#yro!#h-2"!a#%/p.a.##457#!d#"ir#"ng#&rrison',
+    '"!e#"at#!r$%eford$\'reweghe"!i"&omonym"!v!#i//"-d=&lt;process"!f"#nsp"!t!\'january"%ersey',
+    '#!w"!h"(iddibitz$\'lington#"ll""l/"$odak#&oshies"#pmg""s/!,label=ll0323#$mbda#(ncashire#"st"%ength',
+    '#"vi"3ifespan&mdash;user/#"ke##tre"%overs""p1"#st/"#woc!%mada/$!e##rdi#(tchstick"#bl/"$cnab"#ean',
+    '##ik/"#oby#!l#&schino$!t#"th"#ps/"$unch"!y#)xomatosis!$need#"ks#!w"$ight"!k',
+    '"%oilly#!r#&tebook#!w""z/!+open/shared"!r"%utput\'4&lsqb=file-name&rsqb"%xford!#p.m""a/#%ssing"&enberi"!g',
+    '"!i#":s#$tman"%ornos"\'raising#*e-training##ice$#nce#$obal$&koviev$\'teinase$%vider"2ub/case/casemsg.ps$#lic#%lling',
+    '"!3"#ada#"pe##vel"%eason#2turn&mdash;detail/"#n50!"sa#%lary/##nds##xby"$e:z/#%minar""he""ir',
+    '"$k/in"$o:r/#\'mething#(ngwriter#$unds"$peak$$cial"$rrna"!t#&andard$1tus&mdash;return/#&omatal#$rain#%udied"#uh/',
+    '!#t/."#eik#\'lephone$"kr#!m"$heir$!n#"ou%"gh#!y"$ing/"!o#"ok#%shiba##tal',
+    '"4ranslation=concealed$&veller#$ends#!i$#acs!&ueilz/""nd"0ser&mdash;input/#9hers/bridesmaids/pageboys!!v"&endors#$rbar"$oice!#wa/#&itress',
+    '$#ter""ed#&etabix#$ilz/##lla#+ngen/murren"\'hatever##ile$%tefly#!y"%inter#"v/"$nt-1"$oods!#xt/',
+    '"!/""ou$,nger-brother$!r$"th!!z"#ero 20&deg&ndash;45&deg%(/180&deg",mdash;1mmday((22&deg;c#$gr;m#*iddot;0001,35&ndash;0&middot;85+!2',
+    '+!5*"1%*!2*!3+!5*!7*!8)"1%*"25*!3)"30*!3*!4*!6*!8',
+    ')"55*!6*!8)"63*!8)!7*"17*!5)"87)"98*!9"/ndash;0&ndash;4)#-10)$.033*!1',
+    '*"52)#000+"17*!2*"40)!5()1&ndash;01)&ndash;5%)&,15min)".0*!2)#000,!m*"23))1&ndash;0',
+    '*$0mph)!2*!0)"3%)"42))5&ndash;0*!0*!v)"60)!7("2%)&&deg;c*\'ndash;8)".6)!0',
+    ')&70&deg)!9*"00)!a)"cm()3&ndash;00"11)".3)(0,000rpm*!3)!1*!6)!2*!0)!5',
+    ')#7.6)#9.8(\'4&deg;c)%00rpm)%5&deg)#940)"pc()5&ndash;00!8)\'0&deg;c)!2)!a(*6&ndash;0t0"2t("7%',
+    ')"2%)"40)"5%("8%))&ndash;12)#.9%)600&ndash;444&ndash;8882-89&ndash;1390)!5)":1)#tpk()9&ndash;8)"55)!9".prime;44&prime',
+    '((53&prime"&rarr;0"(times;20!"\'0"$hare"%leary",shaughnessey!#(b)!#,00"(1&frac12)#3,0#",4#!4"!5!F-0-0&verbar&verbar;b4&verbar&verbar;16',
+    '#+4-445773-1.#*7-881658-0$\'1054170#!a"#1.5#!0$&&deg;c$!0#*1-494196-3%(630953-9*#4-7#"32$\'6563724#+9-506238-8.%)820219-9.',
+    '$\'2618849\'$9403"#2-7#+41-12999-0.""30$\'0056834#*33-44256-3\'&9458-x(%854-2*#5-0$)5-09946-7#(40553022\'$7389#(93710130$\'7511213',
+    '\'$3135"!4##-0-$"2s$#4-0$#ost%"wt##0cm#*12-32530-6(%730-9\'&3540-9##5cm""50#(21413230#\'40-e4c5',
+    '&!q%"wt$"2s$"4t$#odh%#sts#!0"!7#(02015741\'$7361##137$)90-2258-4#(21648126#*457-0234-1$*86-0319-2.',
+    '#+240-7818-7.#(4934915x&%55052#(65420904#(90895465"$90cm#*45776-18-7#!5$*08900-4-9."$bahn"*deethylase"/l2off/livestock#"aw"&prefix"$ring',
+    '"%to-60"(year-old"!z!,.0&ndash;0.4,!9*#1.7*#2.2,!3*#75%#"00%&00001%(!1&!4\'!%%"1%',
+    '%#252%!3%!4&!1%"5%%!6&!4%!8$"1%%/&lt;p&lt;0.0001&)ndash;0.1/"69%#,52\'!8%!.',
+    '%"5%$/2&ndash;0.03wt%%#,25%!0%\'2&aring%!5&!%&#wt%%$mgml$"37$\'5&deg;c&*ndash;0.05.#846%!0$"6%',
+    '%!7$"7%%&&aring$"95%!8$!p#/1&lt;p&lt;0.001%*ndash;0.05-!1+!1$!0$\'1&aring%!9$!2%&&aring',
+    '$%383in$"4%$"5%%&&aring&*ndash;0.25%"55$"62$\'8&aring$"98$#gcm$!m#.2&lt;p&lt;0.05%*ndash;0.03$\'1&aring%!2',
+    '$-2&ndash;0.143%"5%$\'3&aring$,4&times;10/l%$10/l$,5&ndash;1.25%$mgml&!m$!7%!%%$ph-1$!n$"oz$#sec#-3&ndash;0.2oz',
+    '$!1$!2$-3&ndash;0.067$!6$!7%!s$!8$!9$!m$!p#,4&ndash;0.03%&percnt$!0$%1&deg$!8',
+    '$"pc$#sec#)5%/edetic$,&lt;p&lt;0.1%\'mgr;gml$!.$!1%!3$"27$!7$!8$!9$"mg&"ml%!m',
+    '$!p$#sec#,6&ndash;0.02$!1$!5$"75$"cm$#gev$!s#,7&ndash;0.62$!2$!3$!4$"5m$!8',
+    '$!m$%p/kwh#"8%$&&deg;c%*ndash;0.05$!1$"65$"75$(cycledeg$"mm$+x0.08x0.3mm#"9%$!4$!6$!7',
+    '"(1%/dnase$#sds#&&deg;c$,gt;p&gt;0.05$%mgr;g%&icro;m$,ndash;0.01mg,#3mm,"48,!8*"10,!.,!0+#2.4+!6',
+    '+#kev*#3.0*#5.7*#7.9*\'800ngml$%times#"0%$&&aring$!0%#00g$"1%$!4%!v$!8$"mm',
+    '#,1&times;10/l$!0$"11$"25$!3$!7$!8%,&ndash;0.003$#sec#/2&micro;v/gamma$!4$"5k$#776$"mm$!p',
+    '$"30$!9$!p%#h-1#,4&ndash;0.55$"29$!4$!7$!m#\'5&aring%%deg;c$%07579$!1$!8$!9',
+    '$!l$%mcrab#"6%$!5$!6%"in$!7$!8$#sec#-7&ndash;0.60%-"78$!8#&8/1000$!0$!1',
+    '$%25418$!4$!5$!7$-9&ndash;0.355$#gpa#"9%$!3$!7$!m$"oz##cms#"db##in.#!k',
+    '#!n$!g$!m#!p#"sm##tev#!w#%xsspe"\'2&aring$%deg;c$%mgr;m$)ndash;0.4-!m,!5*!1',
+    '*"24*"36*$7.4%$)times;ssc#\'-&mgr;m$#0.5$!1#%/tube#,0&ndash;0.26-"66$!4#"1%#"2%$+&ndash;1.02$%/1000',
+    '$"4p$$ohms#"3%$&&deg;c%*ndash;4.55$!6#"4%$+&ndash;7.95$!0$"5g$"oz#%5&ins%(ndash;12+!4+!6',
+    '$)-&micro;m$!0$!1$!=$%mg/ml$\'p/litre%!s$#x10#\'6&aring$#-mm$!2$-6&ndash;0.172#\'7&aring$!4$!9',
+    '$&&deg;c$!7$#kev#,9&ndash;0.90$"33$!5$"cd$$mgml##cum#"db#!k#$mg/l%"ml$!l#!n',
+    '#(p.p.b.v.##sec&!s#&t/acre$"ev##wt%#$xssc"\'3&aring$#deg$%mgr;m$)ndash;0.4,!5-!%,"6m,!7',
+    '*#1.3+#7.5*#2.6*#3.6+#9.6*!5$.times;ssc/0.1%#(-0.4&deg#".1$!2$!3$!4$!5#,0&ndash;0.75$!0',
+    '$!6$!7#01&ndash;0.54kgyr+$1.72$%026m3$!9#-2&ndash;0.94%$!1%"93$!p#"33%#333#&4047m3$!2#-5&ndash;0.5oz',
+    '-#95%+$1.00%*times;10/l$,(+/-0.13)for$\'-micron$"37$!5$!9#"6%$!1$!2$!4$!6$#sec#\'7&aring',
+    '$"5m$%p/kwh#,8&ndash;2.03$\'/100000$"09$!5$"71#"91$!2$!6#"cm##gcm#"kg#$secs"\'4&aring',
+    '$#ins$%mgr;m%&icro;g$)ndash;0.8-\'ml/hour*!1+".0-!%,!1*#2.1,!3+#0.4*#3.0-!%#".1',
+    '#"0%$+&ndash;1.05$%/0.85$!4$!7$"91#,1&ndash;1.04$!4#&2-0.44#"30$"11$-3&ndash;0.391%"01$!6$!p',
+    '$!p$!x#-5&mdash;0.95%$,(+/-0.15)for$&-litre%&m-wide$!4$!m$!p%$/kwh#"6%$"05$!6#,7&ndash;0.92$$ohms',
+    '$#343$!p#"9%#":1##g/t#!i$!n#!k#(mg/litre$!m#"oz#"pc#$secs#-v/186&micro;a"%5&deg',
+    '%&icro;g+#/ml$*ndash;0.7%*&1.0x10,!3,!4,!5+!0,!%*&2.0x10,!2,!5*"33*$4.0%*!7',
+    '#!-$&&mgr;l)!m$$0.75$!1$"kb$#ltr$"ml$#o.6&#7oz$(per-cent#!.#"0%$!1$!9',
+    '$!t#"1%$!8$!m#"21$"5%#)327706575$!3#,4&ndash;0.92$!1$!3$!4#,5&ndash;0.63-"90$)(+/-0.11)',
+    '%!m$!p#"6%$!4##7,1$!t#,8&ndash;0.77+$3.50%*times;10/l#"9%$+&ndash;0.92$!7#":1##bhp#"cm',
+    '##in.%!s#"km$!w#!l#%mg/kg&!l&"ml$"jy$"m.#!n$!g%"ml#!o#$pmol',
+    '#$secs$!q#$t/ha#!u#!v#&x0.5mm"+6&ndash;0.7-!%,!8-!m*#1.2-!m,!5,"6%*#5.3',
+    '#"07#"1%$&&aring$!0#"26#"3%$$1x10$!3#&452116%"85$!p##54r$"d.$!p#,6&ndash;0.48',
+    '%"24$"73#"7%$!4$#654$!p#%91328$!3$!p#"bn#!g#"in#$m-00$"jy#!v',
+    '$)ndash;0.8-#8oz*#1.1,!3*#2.4+"50*#4.1,!6$)times;the#$-1.0$!i#,0&ndash;1.33$!2$!7$!p',
+    '-"15$!3$\'9/0.237#"27$!p#,3&ndash;5.04+$6.63$#-kg$"2r$!4$$5334$!6$!p#,4&ndash;38.7$\'/100000',
+    '$-2&ndash;0.946$!3$!4$!6$!7#%5&deg%*ndash;1.25-!8$$-1.5$!5$"in$"oz&#/sq$"pc#(6-m-deep',
+    '$$1276$!3%#159$!5$!6$$8411$!9$"in$!l#"7%$"84#"82%"01$!p$!r',
+    '$#2:1$!p#&arcsec#"bn#!i#"kb$!g#!m#(p.p.b.v.##x10"\'8%-6.3%#&&aring$)ndash;1.6*#4.5+#0nm',
+    '#%/1000#"00$$5748$!7##150$!6$!p#\'2&aring%*ndash;1.37#\'3&aring%*ndash;1.07$!0$!2$#tpx#.40&ndash;0.860',
+    '#"5%$!x#"6%$!0$!7$!9$"mm#"77$!8$#sec#"8%$+&ndash;0.99$%-3.22$!p#,9&ndash;0.99',
+    '$!1$!8$!9#!e#"in##km/#,m&ndash;1.0m$!g#"pt#!v"%9&ins$)ndash;1.4$&percnt$)times;100*"43',
+    '%\'ilobase#"09$!a#\'1&aring$!-$%/1.52$!0$!3$!8$!9#"2%$!5#*333,0.0333$"75$!p',
+    '#"40%!0$!5$!8$!9#,5&times;10/l$3+13.0/-0.9&times;10%)5.2/-1.2%$%oz/sq#"6%$"75#"75#"81$!8$#sec',
+    '$!0$!8#"cu#"ft#$mgml$!s#"nm#!p$"ts##tpk!$/1/5#!3""20""30"#400',
+    '#!9""6."$null!,0&ndash;5169"$\'ish"#,01"&-gauge#%sized"$.01a#"30".0&deg;-179&deg(!c$3mdash;lifespan.ftaf$/ndash&pound;400)$;099',
+    '+!6,!m*!2+!0,!0+!5*"70*!8+!0#"\'s#!+#*-&pound;80$#gev$&strong$$word',
+    '\'!s#$/57=$"km#%00000%!7$<1111000010010100011111011011%)500101609%$:902$!6$"75%!6#,1&ndash;0002$$0100$$1000$!2',
+    '#&5:062e#,6&ndash;0003#!7$+&ndash;0004#!8$"33#$9055#"ft#$kcal$!m#"th""10$+&ndash;0008-"10$$0000',
+    '&"10$(10011000&*1101110001#,1&ndash;0010#!2#!3#!4#,6&ndash;0011$"97#,7&ndash;0011.!2#!8$!4$!5$!6',
+    '"!2#!0$"90#!2$"92#!5$!8#!7##813#!9"-30&ndash;0145#"29#!3$!0#"52',
+    '#!8"%4-000#!0#!1#!2#!3$!.#!4#!5$!.#"7.#!8$!.#"9.#!b',
+    '#!1$"04#!2#!3#!4##623$$9798"%6-000#!0#!6#!8""71$*&ndash;439#$7580#!8',
+    '#!2#!6#!9$!1""90#!2#!s"/:00&ndash;04:00%#gmt#"39#"44$!7#"51$!3$!7',
+    '"!h""pm"&s20883!*1&ndash;02)#200*711&ndash;5261&ndash;102+!4*"22*"40+!2*(886/2864)#351+!3,+&ndash;5252*"70',
+    '*"34+!5*.809&ndash;9539+!2*"99)#528*"68,+&ndash;4757*"80+!4+!9,+&ndash;3456)#602*"29*"37',
+    ')#700*"23*!3+!4"&-09-17##223%!9$"35$"40%!7%!8$"53$\'62-6711%!7$"78',
+    '#(352-2149$"77%!9$"80##403%!8$"36%!7$"44$"58$"66%!8$"80$"91%&3-1977',
+    '##567$"80##603%!7$"22$"30%!1$"40$"61$"79##706$"25$\'37-4764##821%%84111',
+    '%!4$"63$"79$"97#(928-6363$"69$"76%!8$\'86-4316#(jan-1990"!.#$0091%!a$&1&circ$!2',
+    '#"12##223#(302.9021$\'93.3385%&8.5819#(455.1268%#sec#(644.8443$\'53.6622$\'68.7655#(722.5151%&5.4157(#461$\'94.6295(#395',
+    '#"90$\'69.2391"$/252"30&ndash;7&ndash;812#&-33-41#%01100(*1010010010\'?1010101110101010010110101110010$!3#\'1011001$"10%!1$#514#!7#!s',
+    '#$0100#!2#!5#!7""20#!7$#:h6#!8$*92uprog(3)"#309#!3$!5#!7""40#$2:h6',
+    '#"77"$5099#!6""64#!8$"02%!9"+7&ndash;371#!0#$1640#!7##818#!9""80#!3',
+    '""96#!9"#:00$!4$!8#"15$!6$!7#"20$!4$$5:57$!6$!7$!9#"33',
+    '$!7#"44$!5$!7$!9#"55$!6$!7$!8$!9#"h7""nn"$soon"!v!12&mdash;standards',
+    ').825&ndash;4368"#.00#"53"(/2172300&$6290&$7580#\'5022525$&118244\'#888&$9815%%22921&$9759#\'86/0554#\'90/1065$&1/0055',
+    '\'#992&$1298\'#361\'#574$&2/0065\'#237\'#377\'#580\'#948&$1435\'#629\'#805$&3/0378\'#526("52',
+    '("97"(0&commat##1.1%!2#"2-%%23525%&884372#.3&ndash;225545+&303517+&523741+&712014$".1%!2%!3%!4',
+    '#-6&ndash;42242,$8833+&761660+&834641,%73387#\'7521133"+1&ndash;235*#353,!9*#414+"26*#523+"50,!4+"85',
+    '+"43*#722+"81#$-200$#440%"56$#525$#625%"32$#780#"39#*793bull(5)#,993programme#!v"!2',
+    '#+1&ndash;519#(2-371566#.3&ndash;402463$\'-336540%&420066#%4-635&&41-122$*92pogramme#.5&ndash;442215-$8844$\'-428144&%69371#.7&ndash;763336#!9"/32&ndash;241919',
+    '+&329241$\'-381251#+3&ndash;820#!4$-&ndash;266966#.5&ndash;520202.#361+&836141,%63141$\'-554123#!7#!9"#407#.2&ndash;521381,%78666',
+    '+&493131#.6&ndash;582204#!8$&361267$!c#-973&ndash;230""51$!8#.2&ndash;850040$&-24431$%22580#\'3-27786#-6&ndash;68551#!7#!8',
+    '#!1#!2##583#%8-532&%41126$!8"/70&ndash;626554#.3&ndash;605310#.4&ndash;568234$\'-390955#!6""80$-&ndash;706003#!1#.4&ndash;763100',
+    '$$3900#.5&ndash;659918#!6#.7&ndash;642361#!8#!9""91$!2##265#.3&ndash;572821,%99977+&617181#!4$!4$!5',
+    '#(8-814543"#:00$!3$!6#"17$!8#"21$!3$!8#%31:51#"44$!6$!9#"50$!1',
+    '$!8#)sociology"#sec!?3&mdash;engagement&mdash;letter"$-row"!.##062#"10$!7#"45#"50#%82sec"#009##1.2#(4-360897',
+    '%!3#!7$!3#"90#"in"+1&ndash;228,!9*#315,!7+"36*#442*#550#$-225$(453-3366%\'69-3879',
+    '&&3-8294&!4&!6&,7&ndash;3194$(668-2019#).443.2865%\'53.3366$(652.1114#!0#!1$!2$+92programme#!2#!4#!5',
+    '#!7#!8$+92programme#!9"%2&deg#!0$"88#!2#.5&ndash;300700+&483168.#472#.8&ndash;830460"!3#!3$#e-e',
+    '#!5#"97""41#.2&ndash;319111#"30$!1#.5&ndash;543555$\'-089599%&100200#!8""50#!2""61#!2#"56',
+    '"/72&ndash;376161$"02$!2$!7#!3$-&ndash;864775#!9$-&ndash;888282""80#-2&ndash;23530#!4#.6&ndash;871159$!-#.8&ndash;602754-$3566',
+    '$!1#!5#!6$"67$,86&ndash;668#!7#!9"#:03$!4$!5$!6#"14$!5$!6$!9',
+    '$!3$!5$!8#"30$!2$!3$!4$!5$!6$!7$!8#"40$!1$!2$!3',
+    '$!9#"50$!1$!2$!3$!9"%shiva!+4&mdash;fsa"#.43#"98"%0&deg#%0hrs.##1.1%!2%!4',
+    '%!6%!7##2.1%!2%!4$!3$!4$!7##3.2%!3$-72&ndash;2883##4.3##5.1%!2%!3',
+    '&!1&!2&!4%!5##6.1%!2%!3%!4##7.1%!2"\'1&ndash)$;226*#429*#639#$-226',
+    '$(357-1659#!0#!5""22#.3&ndash;501002,%64881#.4&ndash;212456+&754192#!5$\'2-78921#.9&ndash;271275#!u"#300$)92prog(4)#!2',
+    '#-9&ndash;71111##the"&422185""50#!3#!5#&62-573#!9",6&ndash;2dc6#!1#!4#!6""71$$2487$!6',
+    '"(82-41567&%73616#.3&ndash;271211+&721121#"68#!7##890"!9#!0#!3#!7"#:00%,&ndash;08:00#"11#"20',
+    '$!8#"31$!4#"46$!8#"50$!2$!4$!5$!7$!8"#sec!%5%ile"#.15#"30',
+    '$!1%#sec#"40$!7#"55$!7"/0-1031-sq-br/sp#,0&ndash;0600$(-404-000##1.1%!2%!3##2.1%!2&!1',
+    '%!3%!4&!1&!2%"51&!2&!4&!5&!6&!7##3.1%!2&!1&!2&!3',
+    '##4.1%!3&!3&!4%"42##5.1%!2&!1%!3&!1%!4&!1&!6&!8%!6',
+    '#(6-824507$".1&!1%!2#.7&ndash;463468$".1##8.1%!3##9.1%!3%!4%!5"+1&ndash;207+"20*#480',
+    '#$-207%"20&!8$(336-3569%\'55-8923$(424-2508&&7-6713%"43$#666$#727%\'77-4688$(920-0998&&8-6372##083#(934-2095',
+    '#!0#!1#!2##3.4""31$#+21#.2&ndash;311055+&706844$!0#.3&ndash;763171#"46#.5&ndash;618014#(759-2068#-8&ndash;75784#(95-67475',
+    '#.3&ndash;481612$!4$!5#!4#!6$!4#!8$"52"#508#!3""60$!1#!3#!4#.5&ndash;633844',
+    '#"2.#!4$!9#!6#(8-757442$!4"(8/635230#"27#.3&ndash;890287#(4-877090#)8-638-446(#436#!s""96#!=',
+    '$!2#"19#"20#"32#"44#"50$!2$!9#)political"#sec!.6&mdash;buying"#,93"#.06#"30%,&ndash;24.00',
+    '$!6#"44"-00&ndash;0730$#hrs##1.1%!2%!3#.2&ndash;452202$\'-503635$".2&!1&!3&!4%!3%"42',
+    '#.4&ndash;770711$)92prog(2)#+6&ndash;592$".1#-874&ndash;219#.9&ndash;773964$".1%!2$&771139&$9465"+1&ndash;274*#338*#437+"80*#628',
+    '+"40+"94*#831,!4+"81-+&ndash;9041*#941+"53#$-228%"36&!7$#831&!2&!3##0.2',
+    '%!2%!3%!4$"73#!4#"53#\'793prog"!2#(2-820519&%72408#(5-859333#!6$!1$!2#"85',
+    '#$0hrs#!1#!2#&670997#.8&ndash;560445""40#.2&ndash;240170+&326326,%43430,%61608$\'-456418#$5hrs#!7$&001879("80',
+    '%%15213\'#651%%28886#!8#!9"!5#"10$,1&ndash;1968,$2167#!2#!6#!7"!6#!0#$1224',
+    '#!3"!7#"00#\'182-357#\'2-55333#"60#!9""80#!1#!2#(4-293175#-56&ndash;5116#.9&ndash;225534$\'-730284#!o',
+    '#(5-576971#!6#"73#!9$!8"#:01$!3$!8#"11$!5#"23$!6#"32#"50$!3',
+    '$!6$$8:54$!9"!s#"ec!E7&mdash;salepurchase&mdash;agreements"/.00&ndash;11.00%&-23.00#"15$!9#"45%,&ndash;08.10#"50$!9#%90sec',
+    '+$1400$#hrs##1.1%!2%!3##2.1%!2%!3%!4%&559922%!6%!7#/3&ndash;3326611+&872267$\'-333042',
+    '$".1&!0&!1&!2%!2%!3%!4%!5%!6%!7%!8%!9##4.1&!0&!1',
+    '&!3&!4&!5&!6%!2%!4%!5%!6%!7%!8%!9$!8#.5&ndash;210152-$9109#+6&ndash;260',
+    '$!3$#hrs#!8#.9&ndash;558701",1&lowbar;235$)ndash;200+"15,!9+"20,!1,!5,!9+-31&ndash;6598,&5-3149+"42',
+    ',!3,!9+"60,!1,!3,!7+"70,!2,!4+"83,!8*#320+"52,!5,!9',
+    ',!1,!7+"80,!5,!6*#401,!2,!5+"11+"35,!6,%98717+"80,!8,!9',
+    ',%36786,!4*#586,!7*#606,!8+"21+"31,!3,!9*#702,!6+"26+"31,!2',
+    ',,7&ndash;2798,!9+"53,!7+"82+"96,!8*#822,!3,,8&ndash;1313+"30*#927+"35+"73#)-215-8668',
+    '%"45&!8%"51&!3&!8%"87$#321%"33%"53&!9%"74%"85&!7\'%-2233&!8',
+    '&!8&!9\'%-3518%"33&!7%"88&!9%"90&!5&!9$#538%"81&!3$#602&!6',
+    '&!9%"26&!9%"30&!6$(700-5771&!3%"24&!6&!7%"38$#822&!3&!8%"32',
+    '%"67$(928-3232#"02#+393bulletin#&530131#!8""20#.2&ndash;744268#"93$+93programme"-30&ndash;1000+%69112#.3&ndash;370777#.4&ndash;819973$\'-303322',
+    '#!8"!4##085$#hrs#.2&ndash;701668,%69922#!4#!5#!6#.7&ndash;870155$#/93$"83&"50#$8hrs")52-668000',
+    '#+3&ndash;516$\'-549442#$5hrs#(6-700500#!7"!6#(2-325144#!7#"84#!9$!5"!7#!7#!q"!8',
+    '$&-71917#0888&ndash;578214"-92&ndash;2081#(3-514514#-4&ndash;68733#!6#!7$-&ndash;270784$,4&ndash;2070##882"#:01$$2:00&"21$$4:48$$6:49',
+    '#%12:04$!3$!4$$5:26$!7#%24:46$!5$!6$!7$!9#"31$!5#"46#"51$!2',
+    '$!4$!6$!8%.:30&ndash;0500$!9!*8-nov-1993"#.02$!5$!7#.10&ndash;08.15$-5&ndash;08.25$!8#"20$!2#.30&ndash;17.30',
+    '$!9#"55$!7#"79%#.30#"82"#/18"(00&ndash*%;1100,#200+&214000,%89330+#555$!-%#289',
+    '$(.521.382##1.1%!2%!3%!4%!5%!6$!0##2.1%!2%!3&!6##3.1%!2$\'941951.',
+    '%!3%!4%!5%!6##5.1%!2%!3%!4%!5##6.1%!3%!4%!5%!6%!7',
+    '##7.1%!2%!3%!4%!5#!8"+1&ndash;335+"67+"99*#450,!5*#518+"50,!8+"63',
+    '+"71*#675,!9+"80,!6+"94*#740,!7+"69+"78+"80*#804,!9+"40,!5',
+    ',!8+"63-+&ndash;8819,!4+"71,!5,!8+"82,!3+"91,!2*#904,!6+"42,!6',
+    ',!8+"58+"60+"81,!3+"95,!7#$-287$#313&!8%\'30-7216&!2&!5%"41%"98',
+    '$#459$#643%"58%"63&!9%"82&!6$#742\'%-6600%"67$#846%"66%"75%"86&!8',
+    '$#902%"52%"60&&9-0453#$/071#!0$"00#,893programme"/206&ndash;62260$#hrs#!3#,592prgoramme#!8"%3,000#,0&ndash;1550',
+    '#!1#*3&ndash;45#.9&ndash;666875$"/6$$1987"%40hrs#!4#&5/1015#!7"#509#!1#!3#"42#"52#.6&ndash;851186',
+    '#!8")60919838.#!2#!3#.5&ndash;244614""74#!8#"93""80$"78#!5$&-82285#-6&ndash;32369""90#.1&ndash;121680',
+    '$#525#\'2-20331$!6$"82#.3&ndash;141414#.8&ndash;666629$&-style%$type"1:00:19&ndash;0600$!2$$5:37$/7:06&ndash;0600#"10$!4%.:56&ndash;0500',
+    '&"29$$6:34$!7%#:07&"54$!9#"20%#:35$!1$$3:09$$4:32$/5:33&ndash;0500$!7#%30:58$$1:30',
+    '$!2$$5:56$!6$!7%#:27&"38#"40%.:19&ndash;0600$!3$!6%.:16&ndash;0500$!7%.:49&ndash;0500$!8$$9:22',
+    '#%50:56$!2%#:51$!3$/4:43&ndash;0500$$6:09$!7%#:56$$8:26&-49&ndash;0600$!9"!s!%9-sep%!t"/.00&ndash;17.30',
+    '-$3.00$!2$!3#"10#"22#.30&ndash;12.30-$8.00-$9.00/"30#"43$!6#"55#"76#"86"#/94',
+    '#$2the#.4&ndash;629745$#558##6.1%!2%!3%!4%!5%!6%!7##7.1%!2%!3"+1&ndash;225+"36',
+    '+"81*#373,!8+"86-$9531,!8*#415+"90,!1*.528&ndash;0353+-84&ndash;1148*"81#$-477#).644.8470##0.1',
+    '%!3%!4%!5%!6#$1:25#\'4773600#.567&ndash;6155#!9"/20&ndash;870811#.4&ndash;278027#"53#!9"-3&ndash;14444#,0&ndash;1630,#700',
+    '#"23#!3#.7&ndash;581603$&832972""42#,5&ndash;1145$#hrs"%5&deg#\'1596403$\'894412.##245#!3$!0#!4#!5',
+    '$-3&ndash;51580#!3#!5#!6$!2$!5#!m"#734#!7""80#!1#.5&ndash;212312#!6#.9&ndash;767600"/93&ndash;702616',
+    '#.5&ndash;605384"&:00:04&"14$!3$/5:27&ndash;0600$!7%#:00\'!9&-53&ndash;0400$$8:08&"10$$9:35#%10:59$$1:05$$2:04',
+    '$$5:01$$6:07&-41&ndash;0500$!7%#:37&-42&ndash;0600$!8$$9:26#"20%#:52$$2:15&"20&"33$!3%#:20',
+    '$$4:31$$5:05&"33$$6:16&"55$$7:07$$8:01$$9:44#"30%.:39&ndash;0500$$3:08&"22\',8&ndash;0500&"47\'!8',
+    '\'!9&"43&"53\'!5$!5$#6ut$!7%#:01&"17&"37$$8:54#%40:42\'!3$!1%#:11',
+    '$!2%.:02&ndash;0500&"46$!3%#:00&"13$!4%#:02$!5$$6:40\'!6&"50$$7:18&"21&"54',
+    '$!9#"50%#:28&"40$$1:02&"25$!2%#:03&"15&"39&"44$$3:02&"17&"37&"44',
+    '%#:12$!5%#:03\'!4&"14\'!7$$7:53\'!4$$8:40&"58!#:01$$secs#%3secs#%4secs""11',
+    '$$secs#!4#!5$$secs""22#%3secs#!6#!7#!8#!9"&31secs#!2#!4#%6secs#!8',
+    '#!2$$secs#!4#!5#%8secs""50#%1secs#!2$$secs#!4#*5w2(5q/5e)#!7"%93sec!*=1,2,3,4,5""20',
+    '##ll3"&closed"&formed"%never##one"%quiet!&a0314f"(60018852"!a"!d"!h"!l""q."!r!"bb',
+    '"!z!"cm"#tel!#dbm"!f"!p"!u!)e27021079%%47362"!e"!p"!q"!t!!f"!q',
+    '""b."!d"!h"!p!"in!"je"!h"!j"!t!)kesc&lsqb!"ll"!q"!r"!t"!w',
+    '!"mg#"/l"!m!!n"!e#$-off"!g""ly"!t"!z!!o!"pn"!p#"m."!s',
+    '"!y!!q"!p"!t!"rb""l."!p"!t!"sa"!d"!t"!u"!x!%thers#$inks',
+    '"%roops"!s!"us#!e!#ver!"ws"!y!#x14"!9"!f##ord"!w"!x!"yb!!z',
+    ' #1%-#"3%#"4%!.&amp&ndash;2hr%$;1/2(!4\'!5&&frac14&"in&)shilling.#&ring;u"&bsol;2"%deg;w#-ivide&phgr;th(";3',
+    '"\'formula)$&ins#)rac12&deg)9ndash;2&frac12;-year-olds/(3&frac12/!4))pound&deg)-times;&frac12("/7(#;-2*$hour.!s*+millisecond*$page)"d.',
+    ')"kg)#lbs,!.)"mm)"pt+!s\'!3\'%4&deg(&;-acre)%hours)"kw)!p\'$5;kg&&34&ins)\'ndash;2',
+    ')"in+!.\'!5&&58&ins&#78%($&ins""gt"+half;inches\'&x1inch(\'2inches""lt")mdash;1.5+!%)"54)!7',
+    ')!p(!4)!1(!5)!0(!9)!8(&gandhi#&gr;gml&"jk#\'icro;ci(!v$&ddot;1*#ltr)!2',
+    ')"65)!7)%85ltr",ndash&frac14.$&ins\'2;0&ndash;1&ndash;00*30&ndash;1)\'-alkly--Pyl-2&ndash;0-acetyl-sn-glycero-3-phospho-choline,4yl-2&ndash;0-acetyl-)*1&ndash;01)*6&ndash;25)!7(,1&amp;frac12."hr',
+    '1"in/!4*(ndash;12)&,86min)).25&deg;c,6kg/2&ndash;2&frac12;lb)$/2oz*!4)"04*#:10*"cm*"mw))1&ndash;01!8*!-',
+    '*!4*"89*!9*!s)$2:36)"3%*(&ndash;0))4&ndash;01"28*!5)%5.703*"66)$6.31+!6)%7.591',
+    '*!9)$8.51)"92((2&deg;kh*#ins*\'ndash;11!20!8)&,90min)#.30+!8*!5)%1.146)"29))35myc-srf',
+    ')!9)":4))a/9&mdash):cm/&frac12&ndash&frac34;in)"in)!s(\'3&deg;c*#ins**ndash;18590"54)*,5,6,35,45)"/4*,579&ndash;81)"00*!4',
+    ')!8*!1)!g)"km)"oz(#412)!2)!3)!4)!5)#6.4,!8)!7*!6)$8.05',
+    '(,5,22&ndash;9)"-2)$0.07+"21*#100)!1*#.20)!3*#.40*!s)"50)!7*#.35)"98)#kev',
+    '("6%)\'&deg;gh*\'ndash;10!8)"-2)"03)!5*!2)!6*!0)!g()7&ndash;00"250!8)".5',
+    '*!5*":1("8%)100&ndash;24-levis2.759&ndash;7253)!2("9%)(&ndash;0)"30)!4)!8)"pm(#thu"&plus;1#(ound;954',
+    '\');12&prime((20&prime)\'1&prime)\'3&prime)\'5&prime((44&prime)\'7&prime"Irarr;2&rarr;6&rarr;4&rarr;3&rarr;5&rarr;1"+shilling/11+!6**;11&frac34+!3+!4,!d+#6d.',
+    '+"9d-!.#\'ol;10th&$25th##up2"%times\'+;1&times;10)#0/l)"50(!2(#3in("95(#ssc!&\'-104\'""08',
+    '#!4""32""51"0entrepreneurial\'!#()0$&0-acre"&-12)+5"#1).#73&ndash;14)(27)(43)(49)"#47)"16)(8)(20)(40)(48)"#7).""9)!3+&dollar;b&dollar;2"#1+1',
+    '""b2"!i!*,000&deg;c+1&mdash;sufficient&"ft',
 )
@@ -2,6699 +2,848 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-words_99 = (
+count_99 = 6694
+
+heads_99 = (
     '&pound;1204m',
-    '&pound;1209',
-    '&pound;120m.',
-    '&pound;121,750',
-    '&pound;121.20/ha',
-    '&pound;121.87',
-    '&pound;1219m',
-    '&pound;122,000',
-    '&pound;122,000&ndash;183,000',
-    '&pound;122,220',
-    '&pound;122,264',
-    '&pound;122,288',
-    '&pound;122,800',
-    '&pound;122,925',
-    '&pound;122.00',
-    '&pound;122.2',
     '&pound;122.26',
-    '&pound;122.3m',
-    '&pound;122.3million',
-    '&pound;122.4',
-    '&pound;122.5',
-    '&pound;122.64',
-    '&pound;122.97p',
-    '&pound;1221',
-    '&pound;1228.46',
-    '&pound;123,000',
-    '&pound;123,404',
-    '&pound;123,644',
-    '&pound;123,700',
-    '&pound;123,824',
-    '&pound;123,989',
-    '&pound;123.25',
     '&pound;123.30',
-    '&pound;123.38',
-    '&pound;123.7m',
-    '&pound;123m',
-    '&pound;124,320',
-    '&pound;124,900',
-    '&pound;124.13',
-    '&pound;124.4m',
-    '&pound;124.684m',
-    '&pound;124.86',
-    '&pound;124.9m',
-    '&pound;1243.72',
-    '&pound;125&ndash&pound;200',
-    '&pound;125&ndash&pound;210',
-    '&pound;125&ndash&pound;240',
-    '&pound;125,632',
     '&pound;125,647',
-    '&pound;125,750',
-    '&pound;125,903',
-    '&pound;125,940',
-    '&pound;125.00',
-    '&pound;125.30',
-    '&pound;125.48',
-    '&pound;125.70',
-    '&pound;1250.00',
-    '&pound;125000',
-    '&pound;125bn',
-    '&pound;125million',
-    '&pound;126,000',
-    '&pound;126,368',
-    '&pound;126,667',
-    '&pound;126.',
     '&pound;126.34',
-    '&pound;1262',
-    '&pound;1269.00',
-    '&pound;127,500',
-    '&pound;127,800',
-    '&pound;127,900',
-    '&pound;127,917',
-    '&pound;127.04',
-    '&pound;127.3m',
-    '&pound;127.40',
-    '&pound;127.65',
-    '&pound;127.7m',
-    '&pound;127m',
-    '&pound;128,000&ndash;146,000',
-    '&pound;128,081',
-    '&pound;128,301',
     '&pound;128,598',
-    '&pound;128.4',
-    '&pound;128.5million',
-    '&pound;128.70',
-    '&pound;128.8',
-    '&pound;128.9m',
-    '&pound;129,642',
-    '&pound;129.33',
-    '&pound;129.36',
-    '&pound;129.3m',
-    '&pound;129.41',
-    '&pound;129.4m',
-    '&pound;129.80',
-    '&pound;129.96',
-    '&pound;1290',
-    '&pound;12900m',
     '&pound;1299.00',
-    '&pound;12m-a-year',
-    '&pound;12milion',
-    '&pound;12mn',
-    '&pound;12p/m.sq.',
-    '&pound;13&ndash&pound;14',
-    '&pound;13,000&ndash&pound;20,000',
-    '&pound;13,000&ndash&pound;22,000',
-    '&pound;13,046',
-    '&pound;13,168',
-    '&pound;13,190',
-    '&pound;13,192',
-    '&pound;13,240m',
-    '&pound;13,242m',
-    '&pound;13,275',
-    '&pound;13,300',
     '&pound;13,402,061',
-    '&pound;13,426,000',
-    '&pound;13,440m',
-    '&pound;13,449',
-    '&pound;13,520',
-    '&pound;13,650',
-    '&pound;13,681,818',
-    '&pound;13,690',
-    '&pound;13,740',
-    '&pound;13,750',
-    '&pound;13,782',
-    '&pound;13,800',
-    '&pound;13,855',
-    '&pound;13,875',
-    '&pound;13,876',
-    '&pound;13,890&ndash&pound;15,010',
     '&pound;13,936',
-    '&pound;13,938',
-    '&pound;13,960',
-    '&pound;13,988',
-    '&pound;13,995',
-    '&pound;13-&pound;16',
-    '&pound;13.',
-    '&pound;13.03',
-    '&pound;13.069m',
-    '&pound;13.07',
-    '&pound;13.10',
-    '&pound;13.14',
-    '&pound;13.19m',
-    '&pound;13.1bn',
-    '&pound;13.25/100ml',
-    '&pound;13.25/125ml',
     '&pound;13.25m',
-    '&pound;13.28',
-    '&pound;13.2bn',
-    '&pound;13.2s.6d',
-    '&pound;13.36',
-    '&pound;13.37',
-    '&pound;13.3m',
-    '&pound;13.40',
-    '&pound;13.48',
-    '&pound;13.4billion',
-    '&pound;13.50/m',
-    '&pound;13.59',
-    '&pound;13.5bn',
-    '&pound;13.62p',
-    '&pound;13.65',
-    '&pound;13.78',
     '&pound;13.922m',
-    '&pound;13.95/125ml',
-    '&pound;13.98',
-    '&pound;13.99.',
-    '&pound;13/4m',
-    '&pound;130&ndash&pound;150',
-    '&pound;130&ndash&pound;220',
-    '&pound;130&ndash&pound;284',
-    '&pound;130&ndash;160,000',
-    '&pound;130&ndash;170,000',
-    '&pound;130&pound;150',
-    '&pound;130,000&ndash;196,000',
-    '&pound;130,500',
-    '&pound;130,600',
-    '&pound;130,728',
-    '&pound;130,800',
     '&pound;130,985.83',
-    '&pound;130-&pound;165',
-    '&pound;130.26',
-    '&pound;130.2m',
-    '&pound;130.43',
-    '&pound;130.7m',
-    '&pound;131,000',
-    '&pound;131.00',
-    '&pound;131.66',
-    '&pound;1316.00',
-    '&pound;132,613',
-    '&pound;132,911',
-    '&pound;132.11m',
-    '&pound;132.40',
-    '&pound;132.5',
-    '&pound;132.6m',
     '&pound;1320',
-    '&pound;1325',
-    '&pound;1325.00',
-    '&pound;133,000&ndash;200,000',
-    '&pound;133,300',
-    '&pound;133,333',
-    '&pound;133.10s.0d.',
-    '&pound;133.23',
-    '&pound;133.27',
-    '&pound;133.33',
-    '&pound;133.50',
-    '&pound;133.5m',
-    '&pound;133/t',
-    '&pound;1335',
-    '&pound;134,540',
-    '&pound;134.1',
     '&pound;134.40',
-    '&pound;134.5p',
-    '&pound;134.61',
-    '&pound;134.9m',
-    '&pound;1340',
-    '&pound;1340.60',
-    '&pound;1343',
-    '&pound;135&ndash;155,000',
-    '&pound;135&ndash;175,000',
-    '&pound;135,000&ndash;140,000',
-    '&pound;135,128',
-    '&pound;135,911',
-    '&pound;135,980',
-    '&pound;135.00',
-    '&pound;135.40',
-    '&pound;1352',
     '&pound;135million',
-    '&pound;136,474',
-    '&pound;136.33',
-    '&pound;136.4',
-    '&pound;136.50',
-    '&pound;136.5m',
-    '&pound;136.75',
-    '&pound;1368',
-    '&pound;136m',
-    '&pound;137,500',
-    '&pound;137,765',
-    '&pound;137,850',
-    '&pound;137.1',
-    '&pound;138,369',
-    '&pound;138,900',
-    '&pound;138-&pound;340',
     '&pound;138.00',
-    '&pound;138.60',
-    '&pound;138.70',
-    '&pound;1380',
-    '&pound;1385',
-    '&pound;139,000',
-    '&pound;139,000&ndash;158,600',
-    '&pound;139,950',
-    '&pound;139.18',
-    '&pound;139.50',
-    '&pound;1392',
-    '&pound;1395',
-    '&pound;1399',
-    '&pound;1399+vat',
-    '&pound;13m.',
-    '&pound;14&ndash;17,000',
     '&pound;14&ndash;18,000',
-    '&pound;14,000&ndash&pound;15,000',
-    '&pound;14,000&ndash;18,000',
-    '&pound;14,000m',
-    '&pound;14,001',
-    '&pound;14,055',
-    '&pound;14,059',
-    '&pound;14,087',
-    '&pound;14,093',
-    '&pound;14,130',
-    '&pound;14,133',
-    '&pound;14,267',
-    '&pound;14,340',
-    '&pound;14,356,595',
-    '&pound;14,381',
-    '&pound;14,382',
     '&pound;14,421',
-    '&pound;14,484',
-    '&pound;14,488',
-    '&pound;14,495',
-    '&pound;14,505',
-    '&pound;14,614',
-    '&pound;14,625',
-    '&pound;14,631',
-    '&pound;14,694',
-    '&pound;14,750',
-    '&pound;14,763',
-    '&pound;14,862',
-    '&pound;14,880',
-    '&pound;14,890',
-    '&pound;14,950',
-    '&pound;14,956',
     '&pound;14,962',
-    '&pound;14,974',
-    '&pound;14,999',
-    '&pound;14.',
-    '&pound;14.0',
-    '&pound;14.09',
-    '&pound;14.15',
-    '&pound;14.15.0',
-    '&pound;14.20',
-    '&pound;14.30',
-    '&pound;14.38m',
-    '&pound;14.4',
-    '&pound;14.40',
-    '&pound;14.52',
-    '&pound;14.55',
-    '&pound;14.59',
     '&pound;14.6bn',
-    '&pound;14.76',
-    '&pound;14.80',
-    '&pound;14.85',
-    '&pound;14.87',
-    '&pound;14.94',
-    '&pound;14.96',
-    '&pound;14.96m',
-    '&pound;14.9m',
-    '&pound;140&mdash;150m',
-    '&pound;140&ndash&pound;150',
-    '&pound;140&ndash&pound;230',
-    '&pound;140&ndash;210,000',
-    '&pound;140,00',
-    '&pound;140,000-&pound;160,000',
-    '&pound;140,500',
     '&pound;140,789',
-    '&pound;140-&pound;150',
-    '&pound;140-a-day',
-    '&pound;140.00',
-    '&pound;140.12',
-    '&pound;140.57',
-    '&pound;140.8',
-    '&pound;140.90',
-    '&pound;14000',
-    '&pound;140000',
-    '&pound;1400000',
-    '&pound;1406',
-    '&pound;140million',
-    '&pound;141,590',
-    '&pound;141,600',
-    '&pound;141,800',
     '&pound;141,858',
-    '&pound;141.38',
-    '&pound;141.52',
-    '&pound;141.61',
-    '&pound;1415.30',
-    '&pound;1417',
-    '&pound;142,280.53',
-    '&pound;142,600',
-    '&pound;142,987',
-    '&pound;142.2m',
-    '&pound;142.3',
-    '&pound;142.65',
-    '&pound;142.8',
-    '&pound;1420',
-    '&pound;142million',
-    '&pound;143,000',
     '&pound;143,986',
-    '&pound;143.26',
-    '&pound;143.82',
-    '&pound;144,000/0.45',
-    '&pound;144,200',
-    '&pound;144.50',
-    '&pound;144.6m',
-    '&pound;144.7',
-    '&pound;144/year',
-    '&pound;145&ndash;190,000',
-    '&pound;145,275',
-    '&pound;145,602',
-    '&pound;145.38',
-    '&pound;145.67',
-    '&pound;1452',
-    '&pound;146,000',
     '&pound;146,667',
-    '&pound;146,902',
-    '&pound;146,994',
-    '&pound;146-odd',
-    '&pound;146.4m',
-    '&pound;146.88',
-    '&pound;1460',
-    '&pound;146m',
-    '&pound;147,194',
-    '&pound;147,527.2',
-    '&pound;147,683',
-    '&pound;147,934',
-    '&pound;147.10',
-    '&pound;147.2',
-    '&pound;147.50',
-    '&pound;147.85',
     '&pound;147m',
-    '&pound;148,300',
-    '&pound;148,857',
-    '&pound;148,936',
-    '&pound;148.00',
-    '&pound;148.4',
-    '&pound;1480',
-    '&pound;148m',
-    '&pound;149,664',
-    '&pound;149.00',
-    '&pound;149.3',
-    '&pound;149.4',
-    '&pound;149.4m',
-    '&pound;149.50',
-    '&pound;149.90',
-    '&pound;149.99',
     '&pound;1495',
-    '&pound;1499',
-    '&pound;1499.00',
-    '&pound;149m',
-    '&pound;14billion',
-    '&pound;14bn',
-    '&pound;14s.',
-    '&pound;15&ndash;25',
-    '&pound;15&ndash;40',
-    '&pound;15,000-&pound;18,000',
-    '&pound;15,000.',
-    '&pound;15,012',
-    '&pound;15,034',
-    '&pound;15,036',
-    '&pound;15,036.57',
-    '&pound;15,100',
     '&pound;15,143',
-    '&pound;15,150',
-    '&pound;15,184',
-    '&pound;15,190',
-    '&pound;15,202',
-    '&pound;15,243',
-    '&pound;15,274',
-    '&pound;15,290',
-    '&pound;15,300',
-    '&pound;15,325',
-    '&pound;15,372',
-    '&pound;15,372&ndash&pound;20,469',
-    '&pound;15,383',
-    '&pound;15,400',
-    '&pound;15,400&ndash&pound;25,000',
-    '&pound;15,495',
     '&pound;15,500,000',
-    '&pound;15,553',
-    '&pound;15,570',
-    '&pound;15,599',
-    '&pound;15,600&ndash;21,800',
-    '&pound;15,645',
-    '&pound;15,686',
-    '&pound;15,700',
-    '&pound;15,714',
-    '&pound;15,778',
-    '&pound;15,790',
-    '&pound;15,800',
-    '&pound;15,840',
-    '&pound;15,887',
-    '&pound;15,99',
-    '&pound;15,995',
     '&pound;15,996',
-    '&pound;15-&pound;20',
-    '&pound;15-20',
-    '&pound;15-plus',
-    '&pound;15.0.0',
-    '&pound;15.03p',
-    '&pound;15.05m',
-    '&pound;15.10',
-    '&pound;15.12s.3d.',
-    '&pound;15.14',
-    '&pound;15.23m',
-    '&pound;15.25/100ml',
-    '&pound;15.35',
-    '&pound;15.38',
-    '&pound;15.40',
-    '&pound;15.42',
     '&pound;15.49/2.5',
-    '&pound;15.50/2.5',
-    '&pound;15.56/roll',
-    '&pound;15.57',
-    '&pound;15.60',
-    '&pound;15.64million',
-    '&pound;15.73',
-    '&pound;15.77',
-    '&pound;15.7billion',
-    '&pound;15.7m',
-    '&pound;15.7p',
-    '&pound;15.80',
-    '&pound;15.81',
-    '&pound;15.86',
-    '&pound;15.87',
-    '&pound;15.96',
     '&pound;15.9m',
-    '&pound;15/acre',
-    '&pound;150&ndash&pound;200',
-    '&pound;150&ndash;180,000',
-    '&pound;150&ndash;250,000',
-    '&pound;150,000&ndash&pound;250,000',
-    '&pound;150,000-&pound;200,000',
-    '&pound;150-&pound;280',
-    '&pound;150.00',
-    '&pound;150.1m',
-    '&pound;150.40',
-    '&pound;150.65',
-    '&pound;1500/acre',
-    '&pound;15000/km',
-    '&pound;150bn',
-    '&pound;150m-plus',
     '&pound;150m.the',
-    '&pound;151,500',
-    '&pound;151,650',
-    '&pound;151.2m',
-    '&pound;151.7m',
-    '&pound;151.83',
-    '&pound;152000',
-    '&pound;15250',
-    '&pound;152million',
-    '&pound;153,206',
-    '&pound;153,700',
-    '&pound;153.2m',
-    '&pound;153.90',
-    '&pound;1539',
-    '&pound;154,700',
-    '&pound;154.2m',
     '&pound;154.50',
-    '&pound;154.73',
-    '&pound;1545m',
-    '&pound;1549',
-    '&pound;155,308',
-    '&pound;155,500',
-    '&pound;155,749',
-    '&pound;155.1m',
-    '&pound;155.30',
-    '&pound;155.3m',
-    '&pound;155.5m',
-    '&pound;155.6m',
-    '&pound;1551',
-    '&pound;156,250&ndash;175,000',
-    '&pound;156,250&ndash;218,750',
-    '&pound;156-a-year',
     '&pound;156.40',
-    '&pound;156.63',
-    '&pound;1560',
-    '&pound;1566',
-    '&pound;157.16s.',
-    '&pound;157.3',
-    '&pound;157.90',
-    '&pound;1570',
-    '&pound;1574.50',
-    '&pound;1575',
-    '&pound;158.6m',
-    '&pound;158.8',
-    '&pound;158million',
-    '&pound;159.00',
-    '&pound;159.7m',
-    '&pound;1590',
     '&pound;1592',
-    '&pound;1595',
-    '&pound;1599.00',
-    '&pound;15billion',
-    '&pound;15m.',
-    '&pound;16&frac34',
-    '&pound;16&middot;2k',
-    '&pound;16&ndash;19&ndash;9',
-    '&pound;16,000-&pound;18,000',
-    '&pound;16,014',
-    '&pound;16,014&ndash&pound;20,469',
-    '&pound;16,116',
-    '&pound;16,120',
-    '&pound;16,150',
-    '&pound;16,200',
-    '&pound;16,250',
     '&pound;16,282',
-    '&pound;16,312',
-    '&pound;16,360',
-    '&pound;16,390',
-    '&pound;16,425',
-    '&pound;16,435',
-    '&pound;16,524',
-    '&pound;16,645',
-    '&pound;16,650',
-    '&pound;16,660',
-    '&pound;16,693',
-    '&pound;16,707',
-    '&pound;16,800',
-    '&pound;16,870',
-    '&pound;16,900',
-    '&pound;16,925',
     '&pound;16,930',
-    '&pound;16,963',
-    '&pound;16,991',
-    '&pound;16-a-night',
-    '&pound;16.',
-    '&pound;16.12s.10d.',
-    '&pound;16.16',
-    '&pound;16.19',
-    '&pound;16.1bn',
-    '&pound;16.2',
-    '&pound;16.24m',
-    '&pound;16.25m',
-    '&pound;16.28',
-    '&pound;16.2k',
-    '&pound;16.30',
-    '&pound;16.39',
     '&pound;16.45',
-    '&pound;16.49',
-    '&pound;16.4million',
-    '&pound;16.59',
-    '&pound;16.5billion',
-    '&pound;16.60',
-    '&pound;16.65',
-    '&pound;16.7',
-    '&pound;16.73',
-    '&pound;16.76',
-    '&pound;16.78',
-    '&pound;16.7m',
-    '&pound;16.95p',
-    '&pound;16.99/&pound;7.99',
-    '&pound;160&ndash;185,000',
-    '&pound;160,000-plus',
     '&pound;160,956',
-    '&pound;160-weekly',
-    '&pound;160.',
-    '&pound;160.00',
-    '&pound;160.13',
-    '&pound;160.30',
-    '&pound;160.30p',
-    '&pound;160.50',
-    '&pound;160000',
-    '&pound;1600m&ndash&pound;1800m',
-    '&pound;1606m',
-    '&pound;160million',
-    '&pound;161,000',
-    '&pound;161,100',
-    '&pound;161,481',
-    '&pound;161,564.30',
     '&pound;161,864.49',
-    '&pound;161.1m',
-    '&pound;161.54',
-    '&pound;161.86',
-    '&pound;162,150',
-    '&pound;162,500',
-    '&pound;16250',
-    '&pound;163,000&ndash;229,000',
-    '&pound;163,457',
-    '&pound;163.8',
-    '&pound;1635',
-    '&pound;164,465',
-    '&pound;164,950',
-    '&pound;164.50',
-    '&pound;164.99',
-    '&pound;164m',
     '&pound;164million',
-    '&pound;165.00',
-    '&pound;165.30',
-    '&pound;165.6m',
-    '&pound;165m',
-    '&pound;166,000',
-    '&pound;166,000&ndash;433,000',
-    '&pound;166,500&ndash;176,600',
-    '&pound;166,700',
-    '&pound;166.7',
-    '&pound;166.75',
-    '&pound;1660',
-    '&pound;1667',
-    '&pound;16675',
-    '&pound;167&frac12;m',
-    '&pound;167,000&ndash&pound;300,000',
     '&pound;167,360',
-    '&pound;167,625',
-    '&pound;167,695',
-    '&pound;167.44',
-    '&pound;168.3',
-    '&pound;168.3m',
-    '&pound;168.89',
-    '&pound;1686',
-    '&pound;169,827',
-    '&pound;169,871',
-    '&pound;169,950',
-    '&pound;169.50',
-    '&pound;169.66',
-    '&pound;1690',
-    '&pound;1692',
-    '&pound;1695.00',
     '&pound;169m',
-    '&pound;16:0s.:0d.',
-    '&pound;16:13:4',
-    '&pound;16m.',
-    '&pound;16million',
-    '&pound;17,000-a-year',
-    '&pound;17,000m',
-    '&pound;17,015',
-    '&pound;17,040',
-    '&pound;17,132',
-    '&pound;17,230',
-    '&pound;17,250',
-    '&pound;17,315',
-    '&pound;17,345,000',
-    '&pound;17,381',
-    '&pound;17,436',
     '&pound;17,447',
-    '&pound;17,450',
-    '&pound;17,469.12',
-    '&pound;17,475',
-    '&pound;17,500&ndash;21,000',
-    '&pound;17,500-&pound;20,000',
-    '&pound;17,550',
-    '&pound;17,560',
-    '&pound;17,580',
-    '&pound;17,582',
-    '&pound;17,590',
-    '&pound;17,595',
-    '&pound;17,600',
-    '&pound;17,700',
-    '&pound;17,700,000',
-    '&pound;17,712',
     '&pound;17,750',
-    '&pound;17,833',
-    '&pound;17,859',
-    '&pound;17,900m',
-    '&pound;17,925',
-    '&pound;17,989',
-    '&pound;17-a-head',
-    '&pound;17.000',
-    '&pound;17.068',
-    '&pound;17.10',
-    '&pound;17.16',
-    '&pound;17.2m',
-    '&pound;17.2million',
-    '&pound;17.35',
-    '&pound;17.39',
-    '&pound;17.4',
     '&pound;17.43',
-    '&pound;17.48',
-    '&pound;17.50&ndash&pound;25',
-    '&pound;17.52m',
-    '&pound;17.5million',
-    '&pound;17.6',
-    '&pound;17.65',
-    '&pound;17.70',
-    '&pound;17.7m',
-    '&pound;17.89',
-    '&pound;17.8m',
-    '&pound;17.9',
-    '&pound;17.93',
-    '&pound;17.953',
-    '&pound;17.95hb',
-    '&pound;17.9m',
     '&pound;170&ndash;250,000',
-    '&pound;170,500',
-    '&pound;170,800',
-    '&pound;1702',
-    '&pound;17029.00',
-    '&pound;170million',
-    '&pound;171,000',
-    '&pound;171,077',
-    '&pound;171,528',
-    '&pound;171.3m',
-    '&pound;1715',
-    '&pound;1718',
-    '&pound;172,304',
-    '&pound;172,652',
-    '&pound;172.3m',
-    '&pound;172.5',
     '&pound;1723-&pound;1785',
-    '&pound;1724',
-    '&pound;1725',
-    '&pound;172m',
-    '&pound;173,141',
-    '&pound;173,300',
-    '&pound;173,965',
-    '&pound;173.32',
-    '&pound;174&ndash&pound;282',
-    '&pound;174.25',
-    '&pound;174.6m',
-    '&pound;175&ndash;225,000',
-    '&pound;175,400',
-    '&pound;175,970',
-    '&pound;175.',
-    '&pound;175.00',
     '&pound;175.20',
-    '&pound;175.4',
-    '&pound;175.6m',
-    '&pound;176,235',
-    '&pound;176,765',
-    '&pound;176.37/sq',
-    '&pound;176.4',
-    '&pound;176.85',
-    '&pound;1760',
-    '&pound;1761405',
-    '&pound;1763.38',
-    '&pound;176m',
-    '&pound;177,250',
-    '&pound;177,461',
-    '&pound;177.14',
-    '&pound;177.6',
     '&pound;1776',
-    '&pound;177million',
-    '&pound;178,000',
-    '&pound;178,600',
-    '&pound;178.2',
-    '&pound;178.25',
-    '&pound;178.5m',
-    '&pound;178million',
-    '&pound;179,000',
-    '&pound;179.25',
-    '&pound;179.7m',
-    '&pound;179.93',
-    '&pound;1793.45',
-    '&pound;1795',
-    '&pound;17million',
-    '&pound;18&ndash&pound;20',
     '&pound;18&ndash;15,0000',
-    '&pound;18&ndash;20',
-    '&pound;18&ndash;25,000',
-    '&pound;18,000&ndash;24,000',
-    '&pound;18,000,000',
-    '&pound;18,000-&pound;20,000',
-    '&pound;18,000-a-year',
-    '&pound;18,000-plus',
-    '&pound;18,099',
-    '&pound;18,108',
-    '&pound;18,135',
-    '&pound;18,200',
-    '&pound;18,250',
-    '&pound;18,251',
-    '&pound;18,345',
-    '&pound;18,385',
     '&pound;18,414',
-    '&pound;18,450',
-    '&pound;18,571',
-    '&pound;18,624',
-    '&pound;18,640',
-    '&pound;18,700',
-    '&pound;18,700&ndash;28,000',
-    '&pound;18,744',
-    '&pound;18,800',
-    '&pound;18,840',
-    '&pound;18,850',
-    '&pound;18-&pound;24',
-    '&pound;18-&pound;40',
-    '&pound;18.11',
-    '&pound;18.12s.',
-    '&pound;18.16',
     '&pound;18.2',
-    '&pound;18.25',
-    '&pound;18.25m',
-    '&pound;18.275',
-    '&pound;18.36',
-    '&pound;18.37',
-    '&pound;18.3million',
-    '&pound;18.47',
-    '&pound;18.48m',
-    '&pound;18.4m',
-    '&pound;18.50/&pound;20',
-    '&pound;18.66',
-    '&pound;18.7',
-    '&pound;18.70',
-    '&pound;18.76',
-    '&pound;18.7m',
     '&pound;18.9',
-    '&pound;18.90',
-    '&pound;18.95/&dollar;29.95',
-    '&pound;18.96',
-    '&pound;18/150ml',
-    '&pound;18/double',
-    '&pound;180&ndash;200,000',
-    '&pound;180&ndash;240,000',
-    '&pound;180&ndash;260,000',
-    '&pound;180,000&ndash;240,000',
-    '&pound;180,000&ndash;250,000',
-    '&pound;180,0000',
-    '&pound;180,400&ndash;283,500',
-    '&pound;180,800',
-    '&pound;180,807',
-    '&pound;180.00',
     '&pound;180.99',
-    '&pound;18000',
-    '&pound;18020',
-    '&pound;18020-&pound;62100',
-    '&pound;18025',
-    '&pound;181,000',
-    '&pound;181.7',
-    '&pound;1816',
-    '&pound;181million',
-    '&pound;182,500',
-    '&pound;182,500,000',
-    '&pound;1821/ha',
-    '&pound;182m',
-    '&pound;183,000&ndash;244,000',
-    '&pound;183million',
-    '&pound;184,697',
     '&pound;184-&pound;259',
-    '&pound;184.6m',
-    '&pound;185.00',
-    '&pound;185.4m',
-    '&pound;1857.18',
-    '&pound;18575',
-    '&pound;186.3m',
-    '&pound;187,883',
-    '&pound;187.2',
-    '&pound;187.4m',
-    '&pound;187.66',
-    '&pound;187.8m',
-    '&pound;187million',
-    '&pound;188&ndash&pound;272',
-    '&pound;188.62',
-    '&pound;188.63',
     '&pound;189,000',
-    '&pound;189,975',
-    '&pound;189.9',
-    '&pound;1899.00',
-    '&pound;189m',
-    '&pound;18m.',
-    '&pound;19&ndash;25',
-    '&pound;19,000,000',
-    '&pound;19,000-a-year',
-    '&pound;19,047',
-    '&pound;19,141',
-    '&pound;19,252',
-    '&pound;19,285',
-    '&pound;19,312',
-    '&pound;19,350',
-    '&pound;19,428',
     '&pound;19,499',
-    '&pound;19,520',
-    '&pound;19,550',
-    '&pound;19,600,000',
-    '&pound;19,650',
-    '&pound;19,680',
-    '&pound;19,907',
-    '&pound;19,925',
-    '&pound;19,969',
-    '&pound;19,99',
-    '&pound;19.1',
-    '&pound;19.15',
-    '&pound;19.23',
-    '&pound;19.24',
-    '&pound;19.247',
-    '&pound;19.2m',
     '&pound;19.31',
-    '&pound;19.3billion',
-    '&pound;19.3m',
-    '&pound;19.4',
-    '&pound;19.40&ndash&pound;28.50',
-    '&pound;19.45',
-    '&pound;19.50/m',
-    '&pound;19.50p',
-    '&pound;19.55',
-    '&pound;19.56',
-    '&pound;19.58',
-    '&pound;19.65',
-    '&pound;19.66',
-    '&pound;19.68',
-    '&pound;19.7',
-    '&pound;19.70',
     '&pound;19.7m',
-    '&pound;19.8',
-    '&pound;19.80',
-    '&pound;19.9',
-    '&pound;19.95/150ml',
-    '&pound;19.97',
-    '&pound;19.99.',
-    '&pound;190&ndash;230,000',
-    '&pound;190,234',
-    '&pound;190,500',
-    '&pound;190.00',
-    '&pound;190.5m',
-    '&pound;191.1m',
-    '&pound;191.8',
-    '&pound;19141',
-    '&pound;191m',
     '&pound;192,000-worth',
-    '&pound;192.50',
-    '&pound;193.12',
-    '&pound;193.30',
-    '&pound;193.5m',
-    '&pound;193.88',
-    '&pound;194,000',
-    '&pound;194,315',
-    '&pound;194.2m',
-    '&pound;194m',
-    '&pound;194million',
-    '&pound;195,400',
-    '&pound;195,497',
-    '&pound;195.',
-    '&pound;195.00',
-    '&pound;195.1',
     '&pound;195.19p',
-    '&pound;195.1m',
-    '&pound;195.3',
-    '&pound;195.3m',
-    '&pound;1950',
-    '&pound;196,000',
-    '&pound;196,000&ndash;261,000',
-    '&pound;196,000&ndash;326,000',
-    '&pound;196,000&ndash;327,000',
-    '&pound;196,875',
-    '&pound;196,900&ndash;261,000',
-    '&pound;196.00',
-    '&pound;196.3m',
-    '&pound;196.50',
-    '&pound;196.52',
-    '&pound;197,366',
     '&pound;197.2',
-    '&pound;1973',
-    '&pound;1974',
-    '&pound;1976m',
-    '&pound;1978',
-    '&pound;198&ndash;270',
-    '&pound;198,000',
-    '&pound;198,546',
-    '&pound;198,599',
-    '&pound;198,800',
-    '&pound;198.73',
-    '&pound;1980',
-    '&pound;198m',
-    '&pound;199,000',
-    '&pound;199.50',
-    '&pound;199.58',
     '&pound;199.6p',
-    '&pound;199.90',
-    '&pound;1990&ndash;91',
-    '&pound;1995.00',
-    '&pound;19bn.',
-    '&pound;19o,000',
-    '&pound;1=',
-    '&pound;1=&dollar;1.8',
-    '&pound;1=&dollar;1.9515',
-    '&pound;1=dm2.75',
-    '&pound;1=dm2.95',
-    '&pound;1=sfr2.55',
-    '&pound;1=skr10.42',
-    '&pound;1bn-&pound;1.2bn',
-    '&pound;1bn-plus',
-    '&pound;1bn.',
     '&pound;1m&rehy&pound;25m',
-    '&pound;1million-plus',
-    '&pound;1o,250',
-    '&pound;1oo',
-    '&pound;1ooo',
-    '&pound;1x',
-    '&pound;2&frac14',
-    '&pound;2&ndash&pound;3',
-    '&pound;2&ndash&pound;4',
-    '&pound;2&ndash;12s',
-    '&pound;2&ndash;3',
-    '&pound;2&ndash;300',
-    '&pound;2&ndash;3000',
-    '&pound;2&ndash;3m',
-    '&pound;2&ndash;9',
-    '&pound;2,00',
     '&pound;2,000&ndash;4,000',
-    '&pound;2,000-&pound;4,000',
-    '&pound;2,000-&pound;9,999',
-    '&pound;2,000-a-head',
-    '&pound;2,000-a-night',
-    '&pound;2,000m',
-    '&pound;2,013',
-    '&pound;2,015,000',
-    '&pound;2,024,681',
-    '&pound;2,025',
-    '&pound;2,028',
-    '&pound;2,030',
-    '&pound;2,030,000',
-    '&pound;2,041',
-    '&pound;2,045,845',
-    '&pound;2,050',
     '&pound;2,050,000',
-    '&pound;2,053.27',
-    '&pound;2,060',
-    '&pound;2,065',
-    '&pound;2,067',
-    '&pound;2,070',
-    '&pound;2,075',
-    '&pound;2,084.19',
-    '&pound;2,087.8',
-    '&pound;2,095',
-    '&pound;2,100-a-term',
-    '&pound;2,111',
-    '&pound;2,112,000',
-    '&pound;2,114m',
-    '&pound;2,122',
-    '&pound;2,127',
     '&pound;2,133',
-    '&pound;2,144,000',
-    '&pound;2,145',
-    '&pound;2,145m',
-    '&pound;2,153',
-    '&pound;2,154,830',
-    '&pound;2,155',
-    '&pound;2,157',
-    '&pound;2,160',
-    '&pound;2,160,000',
-    '&pound;2,175',
-    '&pound;2,176,798',
-    '&pound;2,180',
-    '&pound;2,180m',
-    '&pound;2,184',
-    '&pound;2,185',
     '&pound;2,195',
-    '&pound;2,200,000',
-    '&pound;2,213',
-    '&pound;2,221,503',
-    '&pound;2,225',
-    '&pound;2,226',
-    '&pound;2,232',
-    '&pound;2,233m',
-    '&pound;2,234',
-    '&pound;2,238',
-    '&pound;2,244,000',
-    '&pound;2,255',
-    '&pound;2,256',
-    '&pound;2,266',
-    '&pound;2,270',
-    '&pound;2,276',
     '&pound;2,288',
-    '&pound;2,293',
-    '&pound;2,295',
-    '&pound;2,296',
-    '&pound;2,309,993',
-    '&pound;2,310,000',
-    '&pound;2,315',
-    '&pound;2,320',
-    '&pound;2,325,000',
-    '&pound;2,330',
-    '&pound;2,332,000',
-    '&pound;2,340',
-    '&pound;2,350,000',
-    '&pound;2,356',
-    '&pound;2,360',
-    '&pound;2,365',
     '&pound;2,370',
-    '&pound;2,371',
-    '&pound;2,390',
-    '&pound;2,392',
-    '&pound;2,400m',
-    '&pound;2,412',
-    '&pound;2,414',
-    '&pound;2,437',
-    '&pound;2,437,637',
-    '&pound;2,440',
-    '&pound;2,440,000',
-    '&pound;2,444',
-    '&pound;2,450m',
-    '&pound;2,452',
-    '&pound;2,453.24',
-    '&pound;2,460',
     '&pound;2,473',
-    '&pound;2,487million',
-    '&pound;2,500.',
-    '&pound;2,500/&pound;3,500',
-    '&pound;2,500/3,500',
-    '&pound;2,5000',
-    '&pound;2,500m',
-    '&pound;2,500worth',
-    '&pound;2,514',
-    '&pound;2,527,135',
-    '&pound;2,532',
-    '&pound;2,545',
-    '&pound;2,547',
-    '&pound;2,550,000',
-    '&pound;2,555',
-    '&pound;2,559',
     '&pound;2,560',
-    '&pound;2,562',
-    '&pound;2,568',
-    '&pound;2,585',
-    '&pound;2,588.0',
-    '&pound;2,594.70',
-    '&pound;2,595',
-    '&pound;2,596m',
-    '&pound;2,600,000',
-    '&pound;2,600-a-term',
-    '&pound;2,615.91',
-    '&pound;2,616',
-    '&pound;2,617',
-    '&pound;2,670',
-    '&pound;2,670million',
-    '&pound;2,685',
     '&pound;2,690',
-    '&pound;2,695',
-    '&pound;2,699',
-    '&pound;2,703',
-    '&pound;2,704',
-    '&pound;2,712',
-    '&pound;2,714,624',
-    '&pound;2,729.9m',
-    '&pound;2,75m',
-    '&pound;2,769',
-    '&pound;2,770',
-    '&pound;2,772,643',
-    '&pound;2,780',
-    '&pound;2,788',
-    '&pound;2,791,248',
-    '&pound;2,794',
     '&pound;2,795',
-    '&pound;2,800,000',
-    '&pound;2,809',
-    '&pound;2,866',
-    '&pound;2,880',
-    '&pound;2,910',
-    '&pound;2,914',
-    '&pound;2,915',
-    '&pound;2,923',
-    '&pound;2,928',
-    '&pound;2,935',
-    '&pound;2,937.50',
-    '&pound;2,940',
-    '&pound;2,952',
-    '&pound;2,965',
-    '&pound;2,99/200ml',
     '&pound;2,995.20',
-    '&pound;2,996m',
-    '&pound;2,998.1m',
-    '&pound;2,999',
-    '&pound;2,ooo',
-    '&pound;2-&pound;2.50',
-    '&pound;2-&pound;3',
-    '&pound;2-&pound;4',
-    '&pound;2-&pound;5',
-    '&pound;2-&pound;8.',
-    '&pound;2-3',
-    '&pound;2-3,000',
-    '&pound;2.0',
-    '&pound;2.01m',
-    '&pound;2.02m',
-    '&pound;2.03m',
     '&pound;2.054m',
-    '&pound;2.05m',
-    '&pound;2.0s.0d.',
-    '&pound;2.10s.0d.',
-    '&pound;2.11',
-    '&pound;2.116',
-    '&pound;2.12',
-    '&pound;2.12bn',
-    '&pound;2.12m',
-    '&pound;2.13',
-    '&pound;2.13s.',
-    '&pound;2.14m',
-    '&pound;2.15/85ml',
-    '&pound;2.16-per',
-    '&pound;2.16m',
-    '&pound;2.17&shilling;6d',
     '&pound;2.185',
-    '&pound;2.19/200ml',
-    '&pound;2.19m',
-    '&pound;2.1m.',
-    '&pound;2.2-million',
-    '&pound;2.20/100ml',
-    '&pound;2.205',
-    '&pound;2.21',
-    '&pound;2.22m',
-    '&pound;2.24',
-    '&pound;2.24m',
-    '&pound;2.251',
-    '&pound;2.254m',
-    '&pound;2.25million',
-    '&pound;2.26bn',
-    '&pound;2.28',
     '&pound;2.29',
-    '&pound;2.297m',
-    '&pound;2.29bn',
-    '&pound;2.2s.6d',
-    '&pound;2.30/50ml',
-    '&pound;2.31',
-    '&pound;2.32',
-    '&pound;2.328m',
-    '&pound;2.32m',
-    '&pound;2.34',
-    '&pound;2.341m',
-    '&pound;2.34p',
-    '&pound;2.35m',
-    '&pound;2.35p',
-    '&pound;2.361m',
-    '&pound;2.362m',
     '&pound;2.36m',
-    '&pound;2.37',
-    '&pound;2.38m',
-    '&pound;2.39/100ml',
-    '&pound;2.39/250ml',
-    '&pound;2.39m',
-    '&pound;2.3m.',
-    '&pound;2.41',
-    '&pound;2.41&ndash&pound;4.53',
-    '&pound;2.42',
-    '&pound;2.42p',
-    '&pound;2.43m',
-    '&pound;2.44',
-    '&pound;2.449',
-    '&pound;2.45/200ml',
-    '&pound;2.45m',
     '&pound;2.45million',
-    '&pound;2.46p',
-    '&pound;2.47',
-    '&pound;2.48',
-    '&pound;2.49/250g',
-    '&pound;2.49m',
-    '&pound;2.4billion',
-    '&pound;2.4s.6d',
-    '&pound;2.5&ndash;3.5',
-    '&pound;2.5&shilling;6',
-    '&pound;2.5/kg',
-    '&pound;2.50-&pound;7.50',
-    '&pound;2.50-a-week',
-    '&pound;2.50/&pound;2',
-    '&pound;2.51m',
-    '&pound;2.52million',
     '&pound;2.56',
-    '&pound;2.56m',
-    '&pound;2.58',
-    '&pound;2.59/500ml',
-    '&pound;2.5billion',
-    '&pound;2.5s',
-    '&pound;2.601bn',
-    '&pound;2.60p',
-    '&pound;2.625m',
-    '&pound;2.63',
-    '&pound;2.65/227g',
-    '&pound;2.67',
-    '&pound;2.69/250ml',
-    '&pound;2.6m.',
-    '&pound;2.6million',
-    '&pound;2.71',
     '&pound;2.71/50g',
-    '&pound;2.72',
-    '&pound;2.72m',
-    '&pound;2.73',
-    '&pound;2.73m',
-    '&pound;2.75/200ml',
-    '&pound;2.75bn',
-    '&pound;2.76',
-    '&pound;2.76million',
-    '&pound;2.77m',
-    '&pound;2.78m',
-    '&pound;2.792',
-    '&pound;2.7billion',
-    '&pound;2.81',
-    '&pound;2.814m',
-    '&pound;2.83million',
     '&pound;2.859bn',
-    '&pound;2.87',
-    '&pound;2.89/30',
-    '&pound;2.8s.6d.',
-    '&pound;2.90&ndash&pound;3.75',
-    '&pound;2.93',
-    '&pound;2.95/100ml',
-    '&pound;2.95/125ml',
-    '&pound;2.95/200ml',
-    '&pound;2.95million',
-    '&pound;2.96',
-    '&pound;2.97',
-    '&pound;2.981m',
-    '&pound;2.987m',
-    '&pound;2.99/100ml',
-    '&pound;2.99/250ml',
     '&pound;2.99/300ml',
-    '&pound;2.998',
-    '&pound;2/&pound;2.50',
-    '&pound;20&ndash&pound;22',
-    '&pound;20&ndash;25',
-    '&pound;20&ndash;40,000',
-    '&pound;20,00',
-    '&pound;20,000&ndash&pound;40,000',
-    '&pound;20,000&ndash;70,000',
-    '&pound;20,000-a-year',
-    '&pound;20,003',
-    '&pound;20,046',
-    '&pound;20,1',
-    '&pound;20,100',
-    '&pound;20,140',
-    '&pound;20,1897',
     '&pound;20,200',
-    '&pound;20,350',
-    '&pound;20,400',
-    '&pound;20,408',
-    '&pound;20,469',
-    '&pound;20,500-a-year',
-    '&pound;20,512,812',
-    '&pound;20,600',
-    '&pound;20,600&ndash;25,750',
-    '&pound;20,600&ndash;30,900',
-    '&pound;20,600&ndash;41,300',
-    '&pound;20,618,000',
-    '&pound;20,640',
-    '&pound;20,650',
-    '&pound;20,700',
-    '&pound;20,800',
     '&pound;20,820',
-    '&pound;20,830',
-    '&pound;20,872',
-    '&pound;20,895',
-    '&pound;20,975',
-    '&pound;20-&pound;25',
-    '&pound;20-&pound;25million',
-    '&pound;20-a-head',
-    '&pound;20-a-week',
-    '&pound;20-pound',
-    '&pound;20.02',
-    '&pound;20.05',
-    '&pound;20.07m',
-    '&pound;20.1',
-    '&pound;20.13',
-    '&pound;20.16&shilling;4d',
     '&pound;20.2bn',
-    '&pound;20.3m',
-    '&pound;20.40',
-    '&pound;20.40/200ml',
-    '&pound;20.45',
-    '&pound;20.47',
-    '&pound;20.55',
-    '&pound;20.59',
-    '&pound;20.6',
-    '&pound;20.60',
-    '&pound;20.634m',
-    '&pound;20.67',
-    '&pound;20.68',
-    '&pound;20.75',
-    '&pound;20.77',
-    '&pound;20.8bn',
     '&pound;20.90',
-    '&pound;20/&pound;15/&pound;10',
-    '&pound;20/t',
-    '&pound;200&ndash;250,000',
-    '&pound;200+',
-    '&pound;200,000&ndash;250,000',
-    '&pound;200,000-&pound;400,000',
-    '&pound;200,000-a-year',
-    '&pound;200,000-plus',
-    '&pound;200,000.',
-    '&pound;200,023',
-    '&pound;200-&pound;2,000',
-    '&pound;200-4,000',
-    '&pound;200-a-night',
-    '&pound;200-an-hour',
-    '&pound;200.',
     '&pound;200.318m',
-    '&pound;200/300',
-    '&pound;200/300,000',
-    '&pound;200/customer',
-    '&pound;200/t',
-    '&pound;2000+',
-    '&pound;200000',
-    '&pound;2000m',
-    '&pound;200k',
-    '&pound;200m-plus',
-    '&pound;200m-worth',
-    '&pound;201&frac12',
-    '&pound;201,881',
-    '&pound;201.4',
-    '&pound;201.9m',
-    '&pound;202,800',
     '&pound;202.1&shilling;8d',
-    '&pound;20216',
-    '&pound;203.6',
-    '&pound;204,510',
-    '&pound;204.5',
-    '&pound;204.6',
-    '&pound;204.7',
-    '&pound;204.76',
-    '&pound;204.90',
-    '&pound;2043',
-    '&pound;205,600',
-    '&pound;205,800',
-    '&pound;205.',
-    '&pound;205.1m',
-    '&pound;205.7m',
-    '&pound;205m',
     '&pound;206,000',
-    '&pound;206,200',
-    '&pound;206,200&ndash;309,300',
-    '&pound;2060979',
-    '&pound;207,192',
-    '&pound;207.13',
-    '&pound;207.90',
-    '&pound;2074',
-    '&pound;207m',
-    '&pound;208.8m',
-    '&pound;2083.72',
-    '&pound;2084',
-    '&pound;2085',
-    '&pound;208m',
-    '&pound;209,270.76',
-    '&pound;209.7',
     '&pound;209.99',
-    '&pound;209m',
-    '&pound;20bn-worth',
-    '&pound;20can',
-    '&pound;20k+',
-    '&pound;20m-30m',
-    '&pound;20o',
-    '&pound;21&ndash&pound;40',
-    '&pound;21&ndash;24,000',
-    '&pound;21,000,000',
-    '&pound;21,000.',
-    '&pound;21,087',
-    '&pound;21,125',
-    '&pound;21,200',
-    '&pound;21,234',
-    '&pound;21,270',
     '&pound;21,275',
-    '&pound;21,600',
-    '&pound;21,620',
-    '&pound;21,720',
-    '&pound;21,750',
-    '&pound;21,759',
-    '&pound;21,797',
-    '&pound;21,932',
-    '&pound;21,960',
-    '&pound;21,970',
-    '&pound;21,995',
-    '&pound;21.07',
-    '&pound;21.08m',
-    '&pound;21.28',
-    '&pound;21.30',
-    '&pound;21.32',
     '&pound;21.38',
-    '&pound;21.400',
-    '&pound;21.46',
-    '&pound;21.4m',
-    '&pound;21.51',
-    '&pound;21.53',
-    '&pound;21.56',
-    '&pound;21.624m',
-    '&pound;21.68',
-    '&pound;21.76',
-    '&pound;21.78',
-    '&pound;21.80',
-    '&pound;21.84',
-    '&pound;21.8m',
-    '&pound;21.98',
-    '&pound;21.9m',
     '&pound;210-&pound;250',
-    '&pound;210.60',
-    '&pound;210.9',
-    '&pound;211.20',
-    '&pound;211.25',
-    '&pound;211.50',
-    '&pound;211.6',
-    '&pound;2110.50',
-    '&pound;212,765',
-    '&pound;2125',
-    '&pound;213,208',
-    '&pound;213,800',
-    '&pound;213.5',
-    '&pound;213.67',
-    '&pound;213m',
-    '&pound;214,000',
     '&pound;214,019',
-    '&pound;214,307',
-    '&pound;214.95',
-    '&pound;215,145',
-    '&pound;215,377',
-    '&pound;215-a-night',
-    '&pound;215.00',
-    '&pound;215.31',
-    '&pound;215.38',
-    '&pound;216,000',
-    '&pound;216.42',
-    '&pound;216pp',
-    '&pound;217,000',
-    '&pound;217.00',
-    '&pound;218,400',
-    '&pound;218.00',
     '&pound;218.000',
-    '&pound;218.7m',
-    '&pound;218m',
-    '&pound;219,882',
-    '&pound;219,947',
-    '&pound;219-289',
-    '&pound;219.00',
-    '&pound;219.1',
-    '&pound;219.20',
-    '&pound;219.99',
-    '&pound;219.9m',
-    '&pound;21billion',
-    '&pound;21l',
-    '&pound;21million',
-    '&pound;22&frac12',
-    '&pound;22&frac12;m',
     '&pound;22&ndash&pound;27',
-    '&pound;22&ndash;32',
-    '&pound;22,000&ndash;28,300',
-    '&pound;22,000-a-year',
-    '&pound;22,125',
-    '&pound;22,135',
-    '&pound;22,191',
-    '&pound;22,200',
-    '&pound;22,244',
-    '&pound;22,250',
-    '&pound;22,300',
-    '&pound;22,363',
-    '&pound;22,464',
-    '&pound;22,548',
-    '&pound;22,555',
-    '&pound;22,615',
     '&pound;22,695',
-    '&pound;22,730',
-    '&pound;22,773',
-    '&pound;22,857',
-    '&pound;22,926',
-    '&pound;22,995',
-    '&pound;22-per-head',
-    '&pound;22.01m',
-    '&pound;22.16',
-    '&pound;22.1m',
-    '&pound;22.20',
-    '&pound;22.24',
-    '&pound;22.25',
-    '&pound;22.27',
-    '&pound;22.3m',
-    '&pound;22.43',
     '&pound;22.44',
-    '&pound;22.45',
-    '&pound;22.4m.',
-    '&pound;22.65m',
-    '&pound;22.6m',
-    '&pound;22.7',
-    '&pound;22.85m',
-    '&pound;22.9',
-    '&pound;22.96',
-    '&pound;22.994m',
-    '&pound;22/23',
-    '&pound;220,000&ndash;331,800',
-    '&pound;220.00',
-    '&pound;221,387',
-    '&pound;221,499',
-    '&pound;221,776',
     '&pound;221.40',
-    '&pound;221.9m',
-    '&pound;221m',
-    '&pound;222,200',
-    '&pound;223,000',
-    '&pound;223.6',
-    '&pound;223.7',
-    '&pound;223.7m',
-    '&pound;224.2m',
-    '&pound;224.7',
-    '&pound;224m',
-    '&pound;225,243',
-    '&pound;225,839',
-    '&pound;225.6',
-    '&pound;2250',
-    '&pound;225m.',
     '&pound;226,764',
-    '&pound;226.50',
-    '&pound;226m',
-    '&pound;227',
-    '&pound;227pp',
-    '&pound;228,000&ndash;326,000',
-    '&pound;228.6million',
-    '&pound;228730',
-    '&pound;228m',
-    '&pound;229,000',
-    '&pound;229,500',
-    '&pound;229.00',
-    '&pound;229.1m',
-    '&pound;229.4',
-    '&pound;2295',
-    '&pound;229m',
     '&pound;22bn',
-    '&pound;22fine',
-    '&pound;22million',
-    '&pound;22o',
-    '&pound;23&frac12;m',
-    '&pound;23,000,000',
-    '&pound;23,000m',
-    '&pound;23,025',
-    '&pound;23,1.0',
-    '&pound;23,140',
-    '&pound;23,220',
-    '&pound;23,297',
-    '&pound;23,388',
-    '&pound;23,392.80',
-    '&pound;23,400&ndash;32,700',
-    '&pound;23,423&ndash&pound;26,471',
     '&pound;23,500',
-    '&pound;23,523',
-    '&pound;23,526',
-    '&pound;23,7000',
-    '&pound;23,735',
-    '&pound;23,800&ndash;25,800',
-    '&pound;23,920',
-    '&pound;23,950',
-    '&pound;23-&pound;30',
-    '&pound;23.04',
-    '&pound;23.16',
-    '&pound;23.1billion',
-    '&pound;23.2',
-    '&pound;23.25',
-    '&pound;23.2m',
-    '&pound;23.3',
     '&pound;23.35',
-    '&pound;23.3m',
-    '&pound;23.45',
-    '&pound;23.49',
-    '&pound;23.5',
-    '&pound;23.55',
-    '&pound;23.58m',
-    '&pound;23.6',
-    '&pound;23.60',
-    '&pound;23.62',
-    '&pound;23.63',
-    '&pound;23.69m',
-    '&pound;23.6bn',
-    '&pound;23.6m',
-    '&pound;23.6million',
-    '&pound;23.79',
     '&pound;23.8',
-    '&pound;23.80',
-    '&pound;23.9',
-    '&pound;23.93',
-    '&pound;23.98',
-    '&pound;23.9m',
-    '&pound;23/kw/',
-    '&pound;23/tonne',
-    '&pound;230&ndash&pound;340',
-    '&pound;230,981',
-    '&pound;230-worth',
-    '&pound;230.1m',
-    '&pound;230.58',
-    '&pound;2300',
-    '&pound;23000',
-    '&pound;230million',
     '&pound;231,536',
-    '&pound;231.48',
-    '&pound;23163m',
-    '&pound;232,000',
-    '&pound;232,024',
-    '&pound;232,601',
-    '&pound;232,877',
-    '&pound;232k',
-    '&pound;232m',
-    '&pound;233,000',
-    '&pound;233,645',
-    '&pound;233.6s.',
-    '&pound;234.00',
-    '&pound;234.4',
-    '&pound;234.5',
-    '&pound;234.78',
     '&pound;235.9m',
-    '&pound;2353',
-    '&pound;236,000',
-    '&pound;236m',
-    '&pound;237,000',
-    '&pound;237,571',
-    '&pound;237.2',
-    '&pound;237.7m',
-    '&pound;237.99',
-    '&pound;238',
-    '&pound;238m',
-    '&pound;239.00+vat',
-    '&pound;239.1',
-    '&pound;239.50',
-    '&pound;2399',
-    '&pound;239m',
     '&pound;24&frac12;m',
-    '&pound;24&ndash&pound;27',
-    '&pound;24&ndash;30',
-    '&pound;24&ndash;80',
-    '&pound;24,000&ndash;30,000',
-    '&pound;24,000-a&rehy;man',
-    '&pound;24,041',
-    '&pound;24,100&ndash;38,500',
-    '&pound;24,200',
-    '&pound;24,200,000',
-    '&pound;24,230,968',
-    '&pound;24,300',
-    '&pound;24,319.44',
-    '&pound;24,379',
-    '&pound;24,407',
-    '&pound;24,470',
     '&pound;24,537',
-    '&pound;24,727',
-    '&pound;24,745',
-    '&pound;24,751.59',
-    '&pound;24,800',
-    '&pound;24,810',
-    '&pound;24,843',
-    '&pound;24,846',
-    '&pound;24,850',
-    '&pound;24,871',
-    '&pound;24,945',
-    '&pound;24,999',
-    '&pound;24-99',
-    '&pound;24.',
-    '&pound;24.10',
-    '&pound;24.22m',
     '&pound;24.38',
-    '&pound;24.3bn',
-    '&pound;24.3m',
-    '&pound;24.4',
-    '&pound;24.40',
-    '&pound;24.5m',
-    '&pound;24.61',
-    '&pound;24.69',
-    '&pound;24.70',
-    '&pound;24.74',
-    '&pound;24.75',
-    '&pound;24.75m',
-    '&pound;24.78',
-    '&pound;24.81',
-    '&pound;24.869m',
-    '&pound;24.9',
     '&pound;24.90',
-    '&pound;24.9m',
-    '&pound;240,310',
-    '&pound;240.00',
-    '&pound;240/acre',
-    '&pound;24000',
-    '&pound;24045',
-    '&pound;240million',
-    '&pound;241,000',
-    '&pound;241,248',
-    '&pound;241million',
-    '&pound;242,000',
-    '&pound;242,568',
-    '&pound;242,800',
-    '&pound;242.23',
-    '&pound;2425',
     '&pound;243,980',
-    '&pound;243-a-week',
-    '&pound;243.56',
-    '&pound;243.7m',
-    '&pound;243m',
-    '&pound;244,400',
-    '&pound;244.50',
-    '&pound;245,358',
-    '&pound;245,500',
-    '&pound;245,900',
-    '&pound;245.',
-    '&pound;245.00',
-    '&pound;2450',
-    '&pound;2453',
-    '&pound;246,000',
-    '&pound;246,285.27',
     '&pound;246,323',
-    '&pound;2465.33',
-    '&pound;246k',
-    '&pound;246m',
-    '&pound;247,300',
-    '&pound;2470m',
-    '&pound;247m',
-    '&pound;248,000',
-    '&pound;248,203',
-    '&pound;248.14',
-    '&pound;248.25',
-    '&pound;248.25m',
-    '&pound;248.43',
-    '&pound;2483',
-    '&pound;249,033.53',
-    '&pound;249,400',
     '&pound;249,483',
-    '&pound;249.00',
-    '&pound;249.99',
-    '&pound;249pp',
-    '&pound;24bn',
-    '&pound;24million',
-    '&pound;25&ndash&pound;30',
-    '&pound;25&ndash&pound;30ph',
-    '&pound;25&ndash;35,999',
-    '&pound;25&ndash;50,000',
-    '&pound;25,000&ndash;40,000',
-    '&pound;25,000,000',
-    '&pound;25,000-&pound;35,000',
-    '&pound;25,000-added',
-    '&pound;25,000-per-year',
-    '&pound;25,100',
     '&pound;25,256',
-    '&pound;25,338',
-    '&pound;25,400,000',
-    '&pound;25,438',
-    '&pound;25,539',
-    '&pound;25,600',
-    '&pound;25,680',
-    '&pound;25,688',
-    '&pound;25,700&ndash;36,100',
-    '&pound;25,714',
-    '&pound;25,775',
-    '&pound;25,837',
-    '&pound;25,995',
-    '&pound;25-&pound;30m',
-    '&pound;25-&pound;40',
-    '&pound;25-&pound;50',
     '&pound;25-sets',
-    '&pound;25.000',
-    '&pound;25.2',
-    '&pound;25.20/mp',
-    '&pound;25.25p',
-    '&pound;25.2m',
-    '&pound;25.4',
-    '&pound;25.45',
-    '&pound;25.4m',
-    '&pound;25.6',
-    '&pound;25.6m',
-    '&pound;25.7',
-    '&pound;25.70',
-    '&pound;25.85',
-    '&pound;25.9',
-    '&pound;25.90',
     '&pound;25.9m',
-    '&pound;250&ndash;300',
-    '&pound;250,00',
-    '&pound;250,000&ndash&pound;350,000',
-    '&pound;250,000&ndash;375,000',
-    '&pound;250,000-rated',
-    '&pound;250,000-worth',
-    '&pound;250,000.',
-    '&pound;250,000pa',
-    '&pound;250,200',
-    '&pound;250-&pound;300',
-    '&pound;250-odd',
-    '&pound;250.43',
-    '&pound;250.5',
-    '&pound;250.5m',
-    '&pound;250.75',
     '&pound;250/&pound;350',
-    '&pound;25000m',
-    '&pound;250bn',
-    '&pound;250m-300m',
-    '&pound;251,828',
-    '&pound;251.27',
-    '&pound;251.5',
-    '&pound;251.5m',
-    '&pound;251.8m',
-    '&pound;252.3',
-    '&pound;252.3m',
-    '&pound;252m',
-    '&pound;252pp',
-    '&pound;253.50',
-    '&pound;253.70',
-    '&pound;2532',
     '&pound;254bn',
-    '&pound;254m',
-    '&pound;255,500',
-    '&pound;255,699',
-    '&pound;255-a-week',
-    '&pound;255.41',
-    '&pound;255.5',
-    '&pound;255million',
-    '&pound;256',
-    '&pound;256,000',
-    '&pound;256.2',
-    '&pound;256.8',
-    '&pound;257,700&ndash;309,300',
-    '&pound;257,700&ndash;360,800',
-    '&pound;257.1m',
-    '&pound;257.2',
     '&pound;257.2m',
-    '&pound;257.5m',
-    '&pound;257million',
-    '&pound;258',
-    '&pound;258.50',
-    '&pound;259,800',
-    '&pound;25a',
-    '&pound;25a-week',
-    '&pound;25bn',
-    '&pound;25m.',
-    '&pound;25million',
-    '&pound;25om',
-    '&pound;25pp',
-    '&pound;26,000-a-year',
-    '&pound;26,052',
-    '&pound;26,150&ndash;39,200',
     '&pound;26,160',
-    '&pound;26,246',
-    '&pound;26,331',
-    '&pound;26,390',
-    '&pound;26,450',
-    '&pound;26,470',
-    '&pound;26,500',
-    '&pound;26,500,000',
-    '&pound;26,520',
-    '&pound;26,520,000.',
-    '&pound;26,523',
-    '&pound;26,600&ndash;40,000',
-    '&pound;26,622',
-    '&pound;26,700',
-    '&pound;26,719',
-    '&pound;26,720',
     '&pound;26,848',
-    '&pound;26,850',
-    '&pound;26,910',
-    '&pound;26.00',
-    '&pound;26.13s.',
-    '&pound;26.2',
-    '&pound;26.20/us',
-    '&pound;26.32',
-    '&pound;26.40',
-    '&pound;26.5',
-    '&pound;26.51',
-    '&pound;26.55',
-    '&pound;26.5s.',
-    '&pound;26.64',
-    '&pound;26.67',
-    '&pound;26.81',
     '&pound;26.88',
-    '&pound;26.97',
-    '&pound;260,000&ndash',
-    '&pound;260,000&ndash;400,000',
-    '&pound;260,658',
-    '&pound;260-&pound;342',
-    '&pound;2600',
-    '&pound;2603.63',
-    '&pound;260m',
-    '&pound;260pp',
-    '&pound;261,000',
-    '&pound;261,254',
-    '&pound;261,472',
-    '&pound;262.70',
-    '&pound;262m',
-    '&pound;263,900',
     '&pound;263.48',
-    '&pound;265,100',
-    '&pound;265-worth',
-    '&pound;265.00',
-    '&pound;265m',
-    '&pound;266,000',
-    '&pound;2669',
-    '&pound;267,000',
-    '&pound;267.62',
-    '&pound;267.80',
-    '&pound;2676',
-    '&pound;267m',
-    '&pound;268,400',
-    '&pound;268,497',
-    '&pound;269.50',
-    '&pound;27,015',
     '&pound;27,060',
-    '&pound;27,400',
-    '&pound;27,500,000',
-    '&pound;27,500-a-year',
-    '&pound;27,600',
-    '&pound;27,700',
-    '&pound;27,750',
-    '&pound;27,800',
-    '&pound;27.2m',
-    '&pound;27.3',
-    '&pound;27.36',
-    '&pound;27.3million',
-    '&pound;27.5',
-    '&pound;27.50+vat',
-    '&pound;27.53',
-    '&pound;27.5million',
     '&pound;27.60',
-    '&pound;27.68',
-    '&pound;27.6m',
-    '&pound;27.75',
-    '&pound;27.7m',
-    '&pound;27.80',
-    '&pound;27.9',
-    '&pound;27.95/&dollar;40.25',
-    '&pound;27.9m',
-    '&pound;270,000-&pound;320,000',
-    '&pound;270,816',
-    '&pound;270.',
-    '&pound;270.25',
-    '&pound;270.4',
-    '&pound;27065',
-    '&pound;271.88',
     '&pound;272,219.20',
-    '&pound;272.18&dollar;shilling',
-    '&pound;272.25',
-    '&pound;272m',
-    '&pound;2732.24',
-    '&pound;274.73',
-    '&pound;274m',
-    '&pound;275&ndash;320,000',
-    '&pound;275,000&ndash&pound;1,500,000',
-    '&pound;275,000,000',
-    '&pound;275,369',
-    '&pound;275-&pound;400',
-    '&pound;275.',
-    '&pound;277',
-    '&pound;277,000',
-    '&pound;277.4',
     '&pound;277.70',
-    '&pound;277000',
-    '&pound;278,000,000',
-    '&pound;278,371',
-    '&pound;278,600',
-    '&pound;278,629',
-    '&pound;278.00',
-    '&pound;278.16',
-    '&pound;278.6m',
-    '&pound;278.70',
-    '&pound;278.9',
-    '&pound;2785',
-    '&pound;278m',
-    '&pound;279-&pound;389',
-    '&pound;279.6m',
-    '&pound;279.90',
     '&pound;279.95',
-    '&pound;27m.',
-    '&pound;28&ndash&pound;32,000',
-    '&pound;28,000&ndash;37,400',
-    '&pound;28,002',
-    '&pound;28,085',
-    '&pound;28,100',
-    '&pound;28,300',
-    '&pound;28,497',
-    '&pound;28,500',
-    '&pound;28,600',
-    '&pound;28,650',
-    '&pound;28,960',
-    '&pound;28,964',
-    '&pound;28,995',
-    '&pound;28.00',
     '&pound;28.1m',
-    '&pound;28.20',
-    '&pound;28.23',
-    '&pound;28.25',
-    '&pound;28.28',
-    '&pound;28.30',
-    '&pound;28.4m',
-    '&pound;28.6',
-    '&pound;28.60',
-    '&pound;28.6m',
-    '&pound;28.7',
-    '&pound;28.7m',
-    '&pound;28.8m',
-    '&pound;28.9bn.',
-    '&pound;28/lu',
-    '&pound;280,445',
     '&pound;280.00',
-    '&pound;280.76',
-    '&pound;280.82',
-    '&pound;2800',
-    '&pound;28000',
-    '&pound;281mi1lion',
-    '&pound;282,869',
-    '&pound;282.2m',
-    '&pound;284,000',
-    '&pound;284,956',
-    '&pound;285,364',
-    '&pound;285.0m',
-    '&pound;286,000',
-    '&pound;287,887',
-    '&pound;287.15**',
-    '&pound;288,562',
     '&pound;289,000',
-    '&pound;289.5',
-    '&pound;289.98',
-    '&pound;289m',
-    '&pound;29,0009',
-    '&pound;29,073',
-    '&pound;29,120',
-    '&pound;29,316',
-    '&pound;29,400&ndash;44,000',
-    '&pound;29,478',
-    '&pound;29,525',
-    '&pound;29,555',
-    '&pound;29,565',
-    '&pound;29,850',
-    '&pound;29,867',
-    '&pound;29,949',
     '&pound;29,980',
-    '&pound;29,995',
-    '&pound;29,999',
-    '&pound;29.00',
-    '&pound;29.03',
-    '&pound;29.10',
-    '&pound;29.1m',
-    '&pound;29.25',
-    '&pound;29.5m',
-    '&pound;29.5million',
-    '&pound;29.65',
-    '&pound;29.67',
-    '&pound;29.7billion',
-    '&pound;29.90',
-    '&pound;29.92',
-    '&pound;29.95/&dollar;50',
     '&pound;290&ndash;350,000',
-    '&pound;290&ndash;405,000',
-    '&pound;290,000&ndash;400,000',
-    '&pound;290,900',
-    '&pound;290,966',
-    '&pound;290.76',
-    '&pound;290/',
-    '&pound;291.6m',
-    '&pound;291million',
-    '&pound;2920',
-    '&pound;293',
-    '&pound;294,000',
-    '&pound;294.90',
-    '&pound;2942.94',
-    '&pound;294m',
-    '&pound;295,048',
     '&pound;295,113',
-    '&pound;2962',
-    '&pound;297,000',
-    '&pound;297.3s.0d.',
-    '&pound;298.22',
-    '&pound;298.65',
-    '&pound;298.75',
-    '&pound;298m',
-    '&pound;299.00',
-    '&pound;299.90',
-    '&pound;2995.00',
-    '&pound;299million',
-    '&pound;29million',
-    '&pound;2:12:7&frac12',
-    '&pound;2:17:7',
-    '&pound;2and1/4',
     '&pound;2b',
-    '&pound;2bn-plus',
-    '&pound;2l',
-    '&pound;2m-plus',
-    '&pound;2million&pound;1.6m',
-    '&pound;2million-rated',
-    '&pound;2om',
-    '&pound;2xxmillion',
-    '&pound;3&ndash&pound;10',
-    '&pound;3&ndash;12p',
-    '&pound;3&ndash;4000',
-    '&pound;3+&pound;1',
-    '&pound;3,000&ndash&pound;6,000',
-    '&pound;3,000&ndash;4,000',
-    '&pound;3,000&ndash;5,000',
-    '&pound;3,000-&pound;4,000',
     '&pound;3,000-&pound;5,000',
-    '&pound;3,000-&pound;6,000',
-    '&pound;3,000-per-patient',
-    '&pound;3,000-worth',
-    '&pound;3,000.',
-    '&pound;3,008,327',
-    '&pound;3,017',
-    '&pound;3,020',
-    '&pound;3,037',
-    '&pound;3,038',
-    '&pound;3,065',
-    '&pound;3,083',
-    '&pound;3,083,000',
-    '&pound;3,091',
-    '&pound;3,100m',
-    '&pound;3,104,000',
     '&pound;3,125',
-    '&pound;3,130',
-    '&pound;3,137.33',
-    '&pound;3,141-a-year',
-    '&pound;3,143',
-    '&pound;3,144',
-    '&pound;3,160m',
-    '&pound;3,161',
-    '&pound;3,169',
-    '&pound;3,179.80',
-    '&pound;3,195',
-    '&pound;3,228',
-    '&pound;3,251',
-    '&pound;3,257',
-    '&pound;3,265',
-    '&pound;3,272',
     '&pound;3,279',
-    '&pound;3,290,474',
-    '&pound;3,295',
-    '&pound;3,300,000',
-    '&pound;3,340',
-    '&pound;3,366',
-    '&pound;3,393',
-    '&pound;3,399',
-    '&pound;3,400m',
-    '&pound;3,410',
-    '&pound;3,423',
-    '&pound;3,435',
-    '&pound;3,440',
-    '&pound;3,465-a-term',
-    '&pound;3,479.55',
-    '&pound;3,488',
     '&pound;3,500-&pound;8,000',
-    '&pound;3,500m',
-    '&pound;3,502',
-    '&pound;3,520.000',
-    '&pound;3,526',
-    '&pound;3,540,000',
-    '&pound;3,548',
-    '&pound;3,549,923',
-    '&pound;3,554',
-    '&pound;3,559',
-    '&pound;3,564',
-    '&pound;3,567',
-    '&pound;3,574',
-    '&pound;3,600,000',
-    '&pound;3,622,386',
-    '&pound;3,630',
     '&pound;3,630,000',
-    '&pound;3,640',
-    '&pound;3,644.47',
-    '&pound;3,648',
-    '&pound;3,649',
-    '&pound;3,660',
-    '&pound;3,663,000',
-    '&pound;3,665,000',
-    '&pound;3,670,739',
-    '&pound;3,675',
-    '&pound;3,679',
-    '&pound;3,680',
-    '&pound;3,690',
-    '&pound;3,691',
-    '&pound;3,732',
-    '&pound;3,750&mdash;is',
     '&pound;3,751m',
-    '&pound;3,766',
-    '&pound;3,783.50',
-    '&pound;3,790',
-    '&pound;3,807',
-    '&pound;3,826,470,000,000,000',
-    '&pound;3,826.47',
-    '&pound;3,834',
-    '&pound;3,845',
-    '&pound;3,850',
-    '&pound;3,850,000',
-    '&pound;3,880',
-    '&pound;3,897',
-    '&pound;3,908',
-    '&pound;3,918',
-    '&pound;3,920',
     '&pound;3,925',
-    '&pound;3,930',
-    '&pound;3,935',
-    '&pound;3,945',
-    '&pound;3-&pound;12',
-    '&pound;3-&pound;4',
-    '&pound;3-&pound;6',
-    '&pound;3-&pound;8',
-    '&pound;3-15-8',
-    '&pound;3-4,000',
-    '&pound;3-million',
-    '&pound;3.01',
-    '&pound;3.03m',
-    '&pound;3.05',
-    '&pound;3.05m',
-    '&pound;3.06',
     '&pound;3.07',
-    '&pound;3.07bn',
-    '&pound;3.08',
-    '&pound;3.09375',
-    '&pound;3.10s',
-    '&pound;3.11',
-    '&pound;3.12',
-    '&pound;3.12m',
-    '&pound;3.15s',
-    '&pound;3.16.6d',
-    '&pound;3.16m.',
-    '&pound;3.19',
-    '&pound;3.19m',
-    '&pound;3.1billion',
-    '&pound;3.25/200ml',
-    '&pound;3.25bn',
     '&pound;3.26',
-    '&pound;3.28',
-    '&pound;3.2billion',
-    '&pound;3.2m.',
-    '&pound;3.2million',
-    '&pound;3.30/60ml',
-    '&pound;3.31',
-    '&pound;3.31/boe',
-    '&pound;3.36m',
-    '&pound;3.40-an-hour',
-    '&pound;3.43m',
-    '&pound;3.44m',
-    '&pound;3.45/150ml',
-    '&pound;3.45/500ml',
-    '&pound;3.47',
-    '&pound;3.50&ndash&pound;4',
     '&pound;3.50-&pound;15',
-    '&pound;3.50/',
-    '&pound;3.50/&pound;2.00',
-    '&pound;3.50p',
-    '&pound;3.53',
-    '&pound;3.55/125ml',
-    '&pound;3.56',
-    '&pound;3.58',
-    '&pound;3.5s.',
-    '&pound;3.60/12',
-    '&pound;3.60m',
-    '&pound;3.62',
-    '&pound;3.63m',
-    '&pound;3.65/330ml',
-    '&pound;3.67',
-    '&pound;3.68m',
     '&pound;3.71',
-    '&pound;3.75+50p',
-    '&pound;3.75/200',
-    '&pound;3.75/95g',
-    '&pound;3.76m',
-    '&pound;3.78m',
-    '&pound;3.79m',
-    '&pound;3.7bn',
-    '&pound;3.7shillings',
-    '&pound;3.82m',
-    '&pound;3.83',
-    '&pound;3.83m',
-    '&pound;3.855m',
-    '&pound;3.85m',
-    '&pound;3.86',
-    '&pound;3.89',
     '&pound;3.89m',
-    '&pound;3.8bn-a-year',
-    '&pound;3.9.9d.',
-    '&pound;3.901m',
-    '&pound;3.90bn',
-    '&pound;3.93',
-    '&pound;3.94m',
-    '&pound;3.95-&pound;5.99',
-    '&pound;3.95/150ml',
-    '&pound;3.95/8oz',
-    '&pound;3.95m',
-    '&pound;3.96',
-    '&pound;3.99-&pound;4.49',
-    '&pound;3/&pound;2.25/&pound;1.50',
-    '&pound;30&ndash&pound;50',
-    '&pound;30&ndash;35',
     '&pound;30&ndash;35,000',
-    '&pound;30&ndash;45,000',
-    '&pound;30&ndash;50',
-    '&pound;30,000-a-man',
-    '&pound;30,000.00',
-    '&pound;30,000a-year',
-    '&pound;30,100',
-    '&pound;30,109',
-    '&pound;30,250',
-    '&pound;30,300&ndash;40,400',
-    '&pound;30,355',
-    '&pound;30,600',
-    '&pound;30,600,000',
-    '&pound;30,695',
-    '&pound;30,789.55',
-    '&pound;30,854-a-year',
     '&pound;30,927',
-    '&pound;30,952',
-    '&pound;30-&pound;35',
-    '&pound;30-&pound;50',
-    '&pound;30-&pound;80',
-    '&pound;30-a-day',
-    '&pound;30-a-head-plus',
-    '&pound;30-a-month',
-    '&pound;30-worth',
-    '&pound;30.',
-    '&pound;30.000',
-    '&pound;30.25',
-    '&pound;30.2m',
-    '&pound;30.30',
-    '&pound;30.34m',
-    '&pound;30.40',
     '&pound;30.4m',
-    '&pound;30.50',
-    '&pound;30.55',
-    '&pound;30.56',
-    '&pound;30.5m',
-    '&pound;30.6',
-    '&pound;30.60',
-    '&pound;30.64',
-    '&pound;30.6m',
-    '&pound;30.6million.this',
-    '&pound;30.70',
-    '&pound;30.8',
-    '&pound;30.80',
-    '&pound;30.91m',
-    '&pound;30.94p',
-    '&pound;30/&pound;32',
     '&pound;30/10',
-    '&pound;30/lu',
-    '&pound;30/week',
-    '&pound;300&ndash&pound;1500',
-    '&pound;300&ndash&pound;3,000',
-    '&pound;300&ndash&pound;350',
-    '&pound;300&ndash&pound;600',
-    '&pound;300&ndash;8,000',
-    '&pound;300,000&ndash;350,000',
-    '&pound;300,000&ndash;433,000',
-    '&pound;300,000-&pound;600,000',
-    '&pound;300,000-500,000',
-    '&pound;300,000-plus',
-    '&pound;300,000-rated',
-    '&pound;300,ooo',
-    '&pound;300-400',
     '&pound;300-a-month',
-    '&pound;300-a-year',
-    '&pound;300-worth',
-    '&pound;300.00',
-    '&pound;300.15',
-    '&pound;300.2m',
-    '&pound;300.38',
-    '&pound;300/&pound;350',
-    '&pound;300/350',
-    '&pound;300/400,000',
-    '&pound;3000-&pound;5000',
-    '&pound;3000.00',
-    '&pound;30000-&pound;35000',
-    '&pound;300000+',
-    '&pound;300bn',
-    '&pound;300m-&pound;350m',
     '&pound;300m-350m',
-    '&pound;301m',
-    '&pound;302m',
-    '&pound;302million',
-    '&pound;303',
-    '&pound;303,000',
-    '&pound;303.81',
-    '&pound;303m',
-    '&pound;3040',
-    '&pound;3042.31',
-    '&pound;305-a-week',
-    '&pound;306,200',
-    '&pound;306,794',
-    '&pound;306,898',
-    '&pound;306-&pound;535',
-    '&pound;3060-&pound;6790',
     '&pound;3064m',
-    '&pound;306m',
-    '&pound;306million',
-    '&pound;307,000',
-    '&pound;307,781',
-    '&pound;307.7m',
-    '&pound;3074m',
-    '&pound;308',
-    '&pound;308,000',
-    '&pound;309.34',
-    '&pound;309.99',
-    '&pound;309m',
-    '&pound;31,167',
-    '&pound;31,200',
-    '&pound;31,250&ndash;37,500',
-    '&pound;31,383',
     '&pound;31,650',
-    '&pound;31,726',
-    '&pound;31,747',
-    '&pound;31,750',
-    '&pound;31,758',
-    '&pound;31,76p',
-    '&pound;31,900',
-    '&pound;31,949',
-    '&pound;31.0',
-    '&pound;31.00',
-    '&pound;31.05',
-    '&pound;31.15',
-    '&pound;31.38',
-    '&pound;31.4',
-    '&pound;31.49',
-    '&pound;31.53',
     '&pound;31.5million',
-    '&pound;31.6',
-    '&pound;31.7',
-    '&pound;31.70',
-    '&pound;31.8',
-    '&pound;31.80',
-    '&pound;31.90',
-    '&pound;31.99',
-    '&pound;310&ndash;460,000',
-    '&pound;310,300',
-    '&pound;310.9m',
-    '&pound;312,330',
-    '&pound;312,500',
-    '&pound;312,500&ndash;437,500',
-    '&pound;312.5',
-    '&pound;3123',
     '&pound;3124',
-    '&pound;312m',
-    '&pound;313,908',
-    '&pound;313,946',
-    '&pound;315,000',
-    '&pound;315,616',
-    '&pound;3150',
-    '&pound;316,000',
-    '&pound;316,700',
-    '&pound;316.4m',
-    '&pound;317.3',
-    '&pound;317.5',
-    '&pound;318,750',
-    '&pound;318.2m',
-    '&pound;3180',
-    '&pound;318m',
     '&pound;319,400',
-    '&pound;319m',
-    '&pound;32&ndash&pound;36',
-    '&pound;32&ndash;33.5m',
-    '&pound;32,000-added',
-    '&pound;32,193',
-    '&pound;32,200,000',
-    '&pound;32,387.40',
-    '&pound;32,466',
-    '&pound;32,550',
-    '&pound;32,610',
-    '&pound;32,650',
-    '&pound;32,700',
-    '&pound;32,700&ndash;42,000',
-    '&pound;32,800',
-    '&pound;32,99',
     '&pound;32-worth',
-    '&pound;32.00(&pound;37.00)',
-    '&pound;32.1',
-    '&pound;32.25',
-    '&pound;32.2m',
-    '&pound;32.4',
-    '&pound;32.40',
-    '&pound;32.5-',
-    '&pound;32.5million',
-    '&pound;32.6',
-    '&pound;32.6bn',
-    '&pound;32.6million',
-    '&pound;32.6o',
-    '&pound;32.7',
-    '&pound;32.70',
-    '&pound;32.7m',
     '&pound;32.8',
-    '&pound;32.9',
-    '&pound;32.90',
-    '&pound;32.93m',
-    '&pound;32.98',
-    '&pound;32.99&ndash&pound;37.99',
-    '&pound;320,000-certainly',
-    '&pound;320-million',
-    '&pound;3200',
-    '&pound;321',
-    '&pound;321,715',
-    '&pound;321.3',
-    '&pound;321m',
-    '&pound;322',
-    '&pound;322,000',
-    '&pound;322,200',
     '&pound;323',
-    '&pound;323.00',
-    '&pound;323.6m',
-    '&pound;324.30',
-    '&pound;324.6',
-    '&pound;325.',
-    '&pound;325.50',
-    '&pound;3250',
-    '&pound;326.00',
-    '&pound;327.5m',
-    '&pound;3275',
-    '&pound;328',
-    '&pound;328m',
-    '&pound;328million',
-    '&pound;329.00',
-    '&pound;329.3m',
     '&pound;329.99',
-    '&pound;32bn',
-    '&pound;32million',
-    '&pound;33&frac12;m',
-    '&pound;33&ndash;6',
-    '&pound;33,000m',
-    '&pound;33,440',
-    '&pound;33,525',
-    '&pound;33,535',
-    '&pound;33,550',
-    '&pound;33,600',
-    '&pound;33,620',
-    '&pound;33,700',
-    '&pound;33,750',
-    '&pound;33,767',
-    '&pound;33,789',
     '&pound;33,857',
-    '&pound;33,929',
-    '&pound;33.',
-    '&pound;33.00+vat',
-    '&pound;33.05m',
-    '&pound;33.20',
-    '&pound;33.30',
-    '&pound;33.33',
-    '&pound;33.3m',
-    '&pound;33.4m',
-    '&pound;33.55',
-    '&pound;33.6',
-    '&pound;33.65',
-    '&pound;33.7',
-    '&pound;33.7million',
-    '&pound;33.8',
     '&pound;33.81',
-    '&pound;33.84',
-    '&pound;33.8m',
-    '&pound;33.90',
-    '&pound;33.95',
-    '&pound;33/4m',
-    '&pound;330,238',
-    '&pound;330,500',
-    '&pound;331,373.93',
-    '&pound;331m',
-    '&pound;332',
-    '&pound;332,000',
-    '&pound;332.35',
-    '&pound;3320',
-    '&pound;333,000&ndash;400,000',
-    '&pound;333.33',
     '&pound;333.5',
-    '&pound;333.5m',
-    '&pound;334,000',
-    '&pound;334,000-worth',
-    '&pound;334.65',
-    '&pound;335,000',
-    '&pound;336,000',
-    '&pound;336,203',
-    '&pound;337.5million',
-    '&pound;337m',
-    '&pound;338,462',
-    '&pound;338.2m',
-    '&pound;338m',
-    '&pound;339.4million',
-    '&pound;339.71',
-    '&pound;339million',
     '&pound;33k',
-    '&pound;33m.',
-    '&pound;33million',
-    '&pound;34,000-a-year',
-    '&pound;34,055',
-    '&pound;34,199',
-    '&pound;34,250',
-    '&pound;34,391',
-    '&pound;34,400',
-    '&pound;34,439',
-    '&pound;34,450',
-    '&pound;34,467',
-    '&pound;34,604,067',
-    '&pound;34,667',
-    '&pound;34,680',
-    '&pound;34,724',
     '&pound;34,812',
-    '&pound;34-&pound;38',
-    '&pound;34.0',
-    '&pound;34.20',
-    '&pound;34.3',
-    '&pound;34.34m',
-    '&pound;34.3m',
-    '&pound;34.45',
-    '&pound;34.6m',
-    '&pound;34.95+vat',
-    '&pound;34.96',
-    '&pound;34.97',
-    '&pound;34.99&ndash&pound;39.99',
-    '&pound;34.9m',
-    '&pound;340-&pound;350million',
-    '&pound;340.00',
     '&pound;340.97',
-    '&pound;340million',
-    '&pound;341,000',
-    '&pound;341.38',
-    '&pound;342,000',
-    '&pound;343,356',
-    '&pound;343,406',
-    '&pound;3435m',
-    '&pound;343m',
-    '&pound;344,000',
-    '&pound;344,586',
-    '&pound;344m',
-    '&pound;345,000,000',
-    '&pound;345.15',
-    '&pound;345.33',
-    '&pound;345.92',
     '&pound;3451.74',
-    '&pound;345m',
-    '&pound;345million',
-    '&pound;347,000',
-    '&pound;347.3m',
-    '&pound;347.4',
-    '&pound;347.4m',
-    '&pound;347m',
-    '&pound;348,763',
-    '&pound;349,000',
-    '&pound;349.95',
-    '&pound;34952.',
-    '&pound;34pa',
-    '&pound;35&ndash&pound;45',
-    '&pound;35&ndash;38,000',
-    '&pound;35&ndash;45',
     '&pound;35&ndash;9',
-    '&pound;35,000&ndash;45,000',
-    '&pound;35,000-worth',
-    '&pound;35,000m',
-    '&pound;35,231',
-    '&pound;35,300',
-    '&pound;35,302',
-    '&pound;35,500',
-    '&pound;35,520',
-    '&pound;35,670',
-    '&pound;35,682',
-    '&pound;35,700',
-    '&pound;35,750',
-    '&pound;35,760',
-    '&pound;35,836',
-    '&pound;35-&pound;125',
     '&pound;35-&pound;40k',
-    '&pound;35-a-week',
-    '&pound;35.',
-    '&pound;35.00/&dollar;50.00',
-    '&pound;35.15',
-    '&pound;35.24',
-    '&pound;35.25',
-    '&pound;35.28',
-    '&pound;35.2m',
-    '&pound;35.38',
-    '&pound;35.50',
-    '&pound;35.7',
-    '&pound;35.80',
-    '&pound;35.85',
-    '&pound;35.8m',
-    '&pound;35.9',
     '&pound;35/&dollar;50',
-    '&pound;350&ndash;465,000',
-    '&pound;350&ndash;500',
-    '&pound;350,000&ndash;450,000',
-    '&pound;350,000-a-year',
-    '&pound;350,000-worth',
-    '&pound;350-&pound;400',
-    '&pound;350-&pound;450',
-    '&pound;350-odd',
-    '&pound;35025',
-    '&pound;350k',
-    '&pound;350million',
-    '&pound;351,413',
-    '&pound;351.00',
-    '&pound;351.404m',
-    '&pound;351m',
     '&pound;353-a-head',
-    '&pound;3537.50',
-    '&pound;354,500',
-    '&pound;3540',
-    '&pound;355m',
-    '&pound;356m',
-    '&pound;358,587',
-    '&pound;358,837',
-    '&pound;358m',
-    '&pound;359,000',
-    '&pound;359.99',
-    '&pound;359m',
-    '&pound;35k',
-    '&pound;35m.',
-    '&pound;36,000-worth',
-    '&pound;36,100&ndash;46,400',
     '&pound;36,178',
-    '&pound;36,200',
-    '&pound;36,363.64',
-    '&pound;36,500',
-    '&pound;36,550',
-    '&pound;36,593.33',
-    '&pound;36,596',
-    '&pound;36,600&ndash;48,800',
-    '&pound;36,700',
-    '&pound;36-&pound;40m',
-    '&pound;36.17',
-    '&pound;36.23',
-    '&pound;36.36',
-    '&pound;36.3million',
-    '&pound;36.40',
-    '&pound;36.4bn',
     '&pound;36.588',
-    '&pound;36.6',
-    '&pound;36.6m',
-    '&pound;36.7m',
-    '&pound;36.80',
-    '&pound;36.84m',
-    '&pound;36.893m',
-    '&pound;36.8m',
-    '&pound;36.9',
-    '&pound;36.90',
-    '&pound;36/ha',
-    '&pound;360,623,000',
-    '&pound;360.00',
-    '&pound;360.95',
-    '&pound;3600',
-    '&pound;360m',
     '&pound;362,491',
-    '&pound;362.8k',
-    '&pound;362m',
-    '&pound;363,000',
-    '&pound;364.09',
-    '&pound;364.5',
-    '&pound;364.5m',
-    '&pound;3640',
-    '&pound;364m',
-    '&pound;364million',
-    '&pound;365.00',
-    '&pound;366,000',
-    '&pound;366,321',
-    '&pound;366.3m',
-    '&pound;367.00',
-    '&pound;367m',
     '&pound;368million',
-    '&pound;36m-&pound;40m',
-    '&pound;36m-a-year',
-    '&pound;36m.',
-    '&pound;37,000,000',
-    '&pound;37,000m',
-    '&pound;37,125',
-    '&pound;37,430',
-    '&pound;37,500&ndash;50,000',
-    '&pound;37,600',
-    '&pound;37,800',
-    '&pound;37,865',
-    '&pound;37.19',
-    '&pound;37.2',
-    '&pound;37.25',
-    '&pound;37.48',
     '&pound;37.5m.',
-    '&pound;37.6',
-    '&pound;37.67',
-    '&pound;37.7',
-    '&pound;37.77',
-    '&pound;37.98',
-    '&pound;37.99',
-    '&pound;370,000-a-day',
-    '&pound;371',
-    '&pound;371,000',
-    '&pound;371.50',
-    '&pound;372,340',
-    '&pound;372m',
-    '&pound;373,500',
-    '&pound;373,767',
-    '&pound;373.80',
     '&pound;374.09',
-    '&pound;374m',
-    '&pound;375,000&ndash;562,500',
-    '&pound;3750',
-    '&pound;375million',
-    '&pound;376,000',
-    '&pound;377,000',
-    '&pound;377,882',
-    '&pound;377m',
-    '&pound;378,000',
-    '&pound;3788',
-    '&pound;378million',
-    '&pound;379,033',
-    '&pound;3795',
-    '&pound;379k',
-    '&pound;37bn',
     '&pound;37million',
-    '&pound;38&frac12;m',
-    '&pound;38,000,000',
-    '&pound;38,100-a-year',
-    '&pound;38,250',
-    '&pound;38,382',
-    '&pound;38,667',
-    '&pound;38,769',
-    '&pound;38,800',
-    '&pound;38,880',
-    '&pound;38,900',
-    '&pound;38,906.19&shilling;11d',
-    '&pound;38-&pound;45',
-    '&pound;38.0',
-    '&pound;38.08',
-    '&pound;38.15',
     '&pound;38.1m',
-    '&pound;38.3m.',
-    '&pound;38.45',
-    '&pound;38.5',
-    '&pound;38.52',
-    '&pound;38.7',
-    '&pound;38.95',
-    '&pound;38.99',
-    '&pound;380+vat',
-    '&pound;3800',
-    '&pound;380m',
-    '&pound;382',
-    '&pound;382,500',
-    '&pound;383,000',
-    '&pound;383,030',
-    '&pound;383,500',
     '&pound;384.65',
-    '&pound;384pp',
-    '&pound;385+vat',
-    '&pound;385,000-worth',
-    '&pound;386,121',
-    '&pound;386.9m',
-    '&pound;3866',
-    '&pound;387,000',
-    '&pound;388,900',
-    '&pound;389.4',
-    '&pound;389.99',
-    '&pound;39,195',
-    '&pound;39,200',
-    '&pound;39,200m',
-    '&pound;39,285',
-    '&pound;39,500',
     '&pound;39,500,000',
-    '&pound;39,634',
-    '&pound;39,650',
-    '&pound;39,655',
-    '&pound;39,769',
-    '&pound;39,850',
-    '&pound;39,960',
-    '&pound;39,995',
-    '&pound;39.01',
-    '&pound;39.12s.1&frac14;d.',
-    '&pound;39.24',
-    '&pound;39.4',
-    '&pound;39.4m',
-    '&pound;39.50p.',
-    '&pound;39.55',
-    '&pound;39.69',
     '&pound;39.6m',
-    '&pound;39.7',
-    '&pound;39.74',
-    '&pound;39.75',
-    '&pound;39.9',
-    '&pound;39.985',
-    '&pound;39.99.',
-    '&pound;390/&pound;400',
-    '&pound;391,000',
-    '&pound;391,566',
-    '&pound;391,946',
-    '&pound;392.96',
-    '&pound;393,000',
-    '&pound;393m',
-    '&pound;394',
-    '&pound;394,000',
     '&pound;394.3',
-    '&pound;394m',
-    '&pound;395.00',
-    '&pound;395.1m',
-    '&pound;3950',
-    '&pound;396pp',
-    '&pound;397',
-    '&pound;397,000',
-    '&pound;398,000,000',
-    '&pound;398,445',
-    '&pound;398m',
-    '&pound;399.00',
-    '&pound;399.50',
-    '&pound;399.95',
-    '&pound;3999.00',
-    '&pound;399m',
     '&pound;3:6:8',
-    '&pound;3b',
-    '&pound;3m-worth',
-    '&pound;3million-rated',
-    '&pound;4&frac12',
-    '&pound;4&frac12;m',
-    '&pound;4&frac34;bn',
-    '&pound;4&ndash&pound;5',
-    '&pound;4&ndash;10&ndash;0',
-    '&pound;4&ndash;17s&rehy;6d',
-    '&pound;4&ndash;18',
-    '&pound;4&ndash;4.5m',
-    '&pound;4&ndash;40',
-    '&pound;4&ndash;5',
-    '&pound;4&ndash;5&ndash;0',
-    '&pound;4&ndash;5,000',
     '&pound;4&ndash;5,500',
-    '&pound;4&ndash;6',
-    '&pound;4&ndash;7/',
-    '&pound;4&ndash;8',
-    '&pound;4&ndash;84',
-    '&pound;4&ndash;95',
-    '&pound;4+&pound;1.50',
-    '&pound;4,000-&pound;5,000',
-    '&pound;4,000-&pound;6,000',
-    '&pound;4,000-a-month',
-    '&pound;4,000.',
-    '&pound;4,000/6,000',
-    '&pound;4,000m',
-    '&pound;4,016',
-    '&pound;4,050',
-    '&pound;4,060',
     '&pound;4,067m',
-    '&pound;4,128',
-    '&pound;4,140',
-    '&pound;4,14o',
-    '&pound;4,157million',
-    '&pound;4,165,667',
-    '&pound;4,170',
-    '&pound;4,181',
-    '&pound;4,250,000',
-    '&pound;4,260',
-    '&pound;4,267',
-    '&pound;4,312',
-    '&pound;4,319',
-    '&pound;4,327,000',
-    '&pound;4,330',
-    '&pound;4,346',
     '&pound;4,348',
-    '&pound;4,368',
-    '&pound;4,380,000',
-    '&pound;4,390',
-    '&pound;4,419',
-    '&pound;4,433',
-    '&pound;4,434',
-    '&pound;4,452.3m',
-    '&pound;4,455',
-    '&pound;4,460',
-    '&pound;4,460,000',
-    '&pound;4,491',
-    '&pound;4,499',
-    '&pound;4,500&ndash;5,500',
-    '&pound;4,500&ndash;5,800',
-    '&pound;4,500-&pound;10,000',
     '&pound;4,500m',
-    '&pound;4,513.50',
-    '&pound;4,520',
-    '&pound;4,524',
-    '&pound;4,567',
-    '&pound;4,575',
-    '&pound;4,59',
-    '&pound;4,5m',
-    '&pound;4,611',
-    '&pound;4,621',
-    '&pound;4,623,338',
-    '&pound;4,645',
-    '&pound;4,656',
-    '&pound;4,660',
-    '&pound;4,662',
-    '&pound;4,670.59',
     '&pound;4,682',
-    '&pound;4,685m',
-    '&pound;4,700m',
-    '&pound;4,702m',
-    '&pound;4,710',
-    '&pound;4,740',
-    '&pound;4,799',
-    '&pound;4,815',
-    '&pound;4,825',
-    '&pound;4,826',
-    '&pound;4,830',
-    '&pound;4,833',
-    '&pound;4,840m',
-    '&pound;4,870',
-    '&pound;4,878',
-    '&pound;4,891.46',
     '&pound;4,930',
-    '&pound;4,960',
-    '&pound;4,982',
-    '&pound;4,985',
-    '&pound;4-&pound;15',
-    '&pound;4-&pound;7',
-    '&pound;4-500',
-    '&pound;4-a-week',
-    '&pound;4.00/200ml',
-    '&pound;4.00bn',
-    '&pound;4.01m',
-    '&pound;4.06',
-    '&pound;4.06m',
-    '&pound;4.08bn',
-    '&pound;4.09',
-    '&pound;4.10.0',
     '&pound;4.100s.',
-    '&pound;4.10s',
-    '&pound;4.137',
-    '&pound;4.13m',
-    '&pound;4.14',
-    '&pound;4.16m',
-    '&pound;4.17',
-    '&pound;4.177',
-    '&pound;4.17m',
-    '&pound;4.197',
-    '&pound;4.1million',
-    '&pound;4.21',
-    '&pound;4.23m',
-    '&pound;4.24',
-    '&pound;4.25/m',
-    '&pound;4.25m',
     '&pound;4.27',
-    '&pound;4.275',
-    '&pound;4.2m.',
-    '&pound;4.2million',
-    '&pound;4.2s',
-    '&pound;4.31',
-    '&pound;4.33',
-    '&pound;4.34',
-    '&pound;4.34m',
-    '&pound;4.36',
-    '&pound;4.36m',
-    '&pound;4.38&ndash&pound;11.62',
-    '&pound;4.38m',
-    '&pound;4.3bn',
-    '&pound;4.40/acre',
-    '&pound;4.44',
     '&pound;4.44m',
-    '&pound;4.49/25ml',
-    '&pound;4.4bn',
-    '&pound;4.50&pound;10.50',
-    '&pound;4.50-&pound;20',
-    '&pound;4.50/250ml',
-    '&pound;4.50/hr',
-    '&pound;4.500',
-    '&pound;4.50p',
-    '&pound;4.524m',
-    '&pound;4.56',
-    '&pound;4.561m',
-    '&pound;4.58',
-    '&pound;4.62',
-    '&pound;4.62m',
-    '&pound;4.64',
     '&pound;4.66m',
-    '&pound;4.6million',
-    '&pound;4.74m',
-    '&pound;4.75/500ml',
-    '&pound;4.75m',
-    '&pound;4.7bn',
-    '&pound;4.7m.',
-    '&pound;4.81',
-    '&pound;4.83',
-    '&pound;4.85m',
-    '&pound;4.87bn',
-    '&pound;4.89',
-    '&pound;4.8billion',
-    '&pound;4.95/30ml',
-    '&pound;4.95m',
-    '&pound;4.97',
     '&pound;4.98',
-    '&pound;4.99/50ml',
-    '&pound;4/&pound;3/&pound;2/free',
-    '&pound;4/concs',
-    '&pound;4/hr',
-    '&pound;40&ndash&pound;50',
-    '&pound;40&ndash;45',
-    '&pound;40&ndash;65',
-    '&pound;40,00',
-    '&pound;40,000&ndash;50,000',
-    '&pound;40,000*',
-    '&pound;40,100',
-    '&pound;40,268',
-    '&pound;40,333',
-    '&pound;40,592',
-    '&pound;40,625',
     '&pound;40,650',
-    '&pound;40,676',
-    '&pound;40,875.16',
-    '&pound;40,929',
-    '&pound;40,995',
-    '&pound;40-&pound;50',
-    '&pound;40-&pound;60',
-    '&pound;40-&pound;99',
-    '&pound;40-a-year',
-    '&pound;40-million',
-    '&pound;40.',
-    '&pound;40.40',
-    '&pound;40.5',
-    '&pound;40.70',
-    '&pound;40.7m',
-    '&pound;40.8',
     '&pound;40.80',
-    '&pound;40.82',
-    '&pound;40.89',
-    '&pound;40.8m',
-    '&pound;40.9',
-    '&pound;40.90',
-    '&pound;40/60',
-    '&pound;40/60,000',
-    '&pound;400&ndash&pound;10,000',
-    '&pound;400&ndash&pound;800',
-    '&pound;400&ndash;1200',
-    '&pound;400&ndash;500',
-    '&pound;400&ndash;600',
-    '&pound;400,000&ndash;500,000',
-    '&pound;400,000&ndash;600,000',
-    '&pound;400,000-a-year',
     '&pound;400,000-plus',
-    '&pound;400,000-rated',
-    '&pound;400,000.',
-    '&pound;400-&pound;550',
-    '&pound;400-&pound;999',
-    '&pound;400-500',
-    '&pound;400-a-time',
-    '&pound;400-a-win',
-    '&pound;40000',
-    '&pound;400000',
-    '&pound;4000m',
-    '&pound;400million',
-    '&pound;401',
-    '&pound;401,000',
-    '&pound;401.62',
-    '&pound;401.88',
     '&pound;402,651',
-    '&pound;402m',
-    '&pound;403',
-    '&pound;403,000',
-    '&pound;403.00+vat',
-    '&pound;403.65',
-    '&pound;403m',
-    '&pound;404',
-    '&pound;4046',
-    '&pound;404m',
-    '&pound;405&ndash;465,000',
-    '&pound;405&ndash;525,000',
-    '&pound;405,000,000',
-    '&pound;405-&pound;2,000',
-    '&pound;405.38',
-    '&pound;405m',
     '&pound;406million',
-    '&pound;407.68m',
-    '&pound;408.25',
-    '&pound;409',
-    '&pound;40:0:0',
-    '&pound;40bn-&pound;50bn',
-    '&pound;40k&ndash;60k',
-    '&pound;40m-&pound;50m',
-    '&pound;41&ndash&pound;52',
-    '&pound;41&ndash&pound;60',
-    '&pound;41,350',
-    '&pound;41,600',
-    '&pound;41.1',
-    '&pound;41.10',
-    '&pound;41.2billion',
-    '&pound;41.3',
     '&pound;41.4m',
-    '&pound;41.6',
-    '&pound;41.60',
-    '&pound;41.62',
-    '&pound;41.64',
-    '&pound;41.66',
-    '&pound;41.7m',
-    '&pound;41.90',
-    '&pound;41.99',
-    '&pound;41/4m',
-    '&pound;410.9m',
-    '&pound;4100',
-    '&pound;410m',
-    '&pound;411',
-    '&pound;411,800&ndash;529,400',
-    '&pound;411.99',
     '&pound;413',
-    '&pound;415.0',
-    '&pound;415m',
-    '&pound;416,000',
-    '&pound;4179.81',
-    '&pound;418,700',
-    '&pound;4181.',
-    '&pound;418m',
-    '&pound;419',
-    '&pound;419,000',
-    '&pound;419.99',
-    '&pound;41million',
-    '&pound;42,000,000',
-    '&pound;42,303',
-    '&pound;42,500',
-    '&pound;42,724',
     '&pound;42,900,000',
-    '&pound;42,912',
-    '&pound;42,950',
-    '&pound;42.',
-    '&pound;42.10',
-    '&pound;42.10s.0d',
-    '&pound;42.2',
-    '&pound;42.37',
-    '&pound;42.5',
-    '&pound;42.55',
-    '&pound;42.6',
-    '&pound;42.65',
-    '&pound;42.6m',
-    '&pound;42.71',
-    '&pound;42.75',
-    '&pound;42.7m',
     '&pound;42.8',
-    '&pound;42.8m',
-    '&pound;42.90',
-    '&pound;42.95',
-    '&pound;42/lu',
-    '&pound;420.',
-    '&pound;420m.',
-    '&pound;422,000',
-    '&pound;422.50',
-    '&pound;422m',
-    '&pound;4234',
-    '&pound;424',
-    '&pound;424.2',
-    '&pound;424.8',
-    '&pound;424m',
-    '&pound;425,531',
     '&pound;425.95',
-    '&pound;4250',
-    '&pound;4261.55',
-    '&pound;427.00',
-    '&pound;427million',
-    '&pound;428',
-    '&pound;428,667',
-    '&pound;429',
-    '&pound;43,107,142',
-    '&pound;43,558',
-    '&pound;43,600',
-    '&pound;43,647',
-    '&pound;43-a-week',
-    '&pound;43.1m',
-    '&pound;43.2',
-    '&pound;43.24',
     '&pound;43.28',
-    '&pound;43.2m',
-    '&pound;43.5',
-    '&pound;43.56',
-    '&pound;43.5m',
-    '&pound;43.66',
-    '&pound;43.7',
-    '&pound;43.75m',
-    '&pound;43.7m',
-    '&pound;43.8',
-    '&pound;43.80',
-    '&pound;43.89',
-    '&pound;43.95',
-    '&pound;43.99',
-    '&pound;430.00',
-    '&pound;4300',
     '&pound;430m',
-    '&pound;431',
-    '&pound;431.7',
-    '&pound;432m',
-    '&pound;433.00',
-    '&pound;433m',
-    '&pound;434,000',
-    '&pound;434,941',
-    '&pound;434,952',
-    '&pound;435m',
-    '&pound;436.5m',
-    '&pound;4368',
-    '&pound;4369',
-    '&pound;437,000',
-    '&pound;437,500',
-    '&pound;437-&pound;513',
     '&pound;437.97',
-    '&pound;438,000',
-    '&pound;439,975',
-    '&pound;439000',
-    '&pound;439m',
-    '&pound;43million',
-    '&pound;44,000-&pound;46,000',
-    '&pound;44,050',
-    '&pound;44,100',
-    '&pound;44,183',
-    '&pound;44,300',
-    '&pound;44,400,000',
-    '&pound;44,611',
-    '&pound;44,700',
-    '&pound;44-99',
-    '&pound;44-an-hour',
     '&pound;44.',
-    '&pound;44.00',
-    '&pound;44.20',
-    '&pound;44.3',
-    '&pound;44.40',
-    '&pound;44.4m',
-    '&pound;44.50/lu',
-    '&pound;44.58',
-    '&pound;44.65',
-    '&pound;44.6m',
-    '&pound;44.7',
-    '&pound;44.75',
-    '&pound;44.8',
-    '&pound;44.80',
-    '&pound;44.8m',
-    '&pound;44.8million',
     '&pound;440,000.',
-    '&pound;4400',
-    '&pound;441,000',
-    '&pound;441,553',
-    '&pound;441m',
-    '&pound;442,000',
-    '&pound;443,000',
-    '&pound;443.86',
-    '&pound;444,000',
-    '&pound;444.68',
-    '&pound;445+vat',
-    '&pound;445,648',
-    '&pound;445.69',
-    '&pound;445m',
-    '&pound;446',
-    '&pound;446m',
     '&pound;447',
-    '&pound;447,000',
-    '&pound;448.4m',
-    '&pound;448.85',
-    '&pound;449.95',
-    '&pound;449.99',
-    '&pound;45&ndash&pound;60',
-    '&pound;45&ndash;25',
-    '&pound;45&ndash;50,000',
-    '&pound;45&ndash;70,000',
-    '&pound;45,000-&pound;55,000',
-    '&pound;45,000-a-year',
-    '&pound;45,220',
-    '&pound;45,260',
-    '&pound;45,300',
-    '&pound;45,420',
     '&pound;45,441',
-    '&pound;45,723',
-    '&pound;45,878',
-    '&pound;45,980',
-    '&pound;45-&pound;95',
-    '&pound;45-a-week',
-    '&pound;45.',
-    '&pound;45.1',
-    '&pound;45.1m',
-    '&pound;45.55',
-    '&pound;45.7',
-    '&pound;45.75',
-    '&pound;45.82',
-    '&pound;45.89',
-    '&pound;450,000&ndash&pound;550,000',
-    '&pound;450,000&ndash;550,000',
     '&pound;450-&pound;750',
-    '&pound;450-worth',
-    '&pound;450.',
-    '&pound;4500',
-    '&pound;45000',
-    '&pound;450million',
-    '&pound;451-8-6',
-    '&pound;452,400',
-    '&pound;453,000',
-    '&pound;454,361',
-    '&pound;456',
-    '&pound;4560',
-    '&pound;457,000',
-    '&pound;457m',
-    '&pound;458,300',
-    '&pound;459,000',
     '&pound;45bn',
-    '&pound;46&ndash;70,000',
-    '&pound;46,133',
-    '&pound;46,186',
-    '&pound;46,200',
-    '&pound;46,453',
-    '&pound;46,600',
-    '&pound;46,700&ndash;56,100',
-    '&pound;46,803',
-    '&pound;46,914',
-    '&pound;46,945,000',
-    '&pound;46.00',
-    '&pound;46.07',
-    '&pound;46.09m',
-    '&pound;46.3',
-    '&pound;46.36',
     '&pound;46.40',
-    '&pound;46.60',
-    '&pound;46.77',
-    '&pound;46.8m',
-    '&pound;46000',
-    '&pound;461m',
-    '&pound;462,000',
-    '&pound;462.6',
-    '&pound;462m',
-    '&pound;463',
-    '&pound;464m',
-    '&pound;465&ndash;580,000',
-    '&pound;466,000',
-    '&pound;466m',
-    '&pound;467',
-    '&pound;468,000',
     '&pound;468,750',
-    '&pound;4685m',
-    '&pound;468m',
-    '&pound;47,300&ndash;63,000',
-    '&pound;47,406.27',
-    '&pound;47,950',
-    '&pound;47,995',
-    '&pound;47.07m',
-    '&pound;47.1s.4d',
-    '&pound;47.1s.4d.',
-    '&pound;47.3',
-    '&pound;47.30',
-    '&pound;47.3m',
-    '&pound;47.425m',
-    '&pound;47.5',
-    '&pound;47.66',
     '&pound;47.6m',
-    '&pound;47.7',
-    '&pound;47.70',
-    '&pound;470,371',
-    '&pound;471,000',
-    '&pound;471m',
-    '&pound;472,200',
-    '&pound;472.6',
-    '&pound;4725',
-    '&pound;472m',
-    '&pound;473,000',
-    '&pound;473.60',
-    '&pound;474,000',
-    '&pound;474.1',
-    '&pound;474m',
-    '&pound;475,000',
     '&pound;475.',
-    '&pound;475.13',
-    '&pound;476',
-    '&pound;476&ndash;8,725',
-    '&pound;476,666',
-    '&pound;478,000',
-    '&pound;478.5m',
-    '&pound;478m',
-    '&pound;479',
-    '&pound;47bn',
-    '&pound;47million',
-    '&pound;48&frac12;m',
-    '&pound;48&ndash&pound;61',
-    '&pound;48,090',
-    '&pound;48,100',
-    '&pound;48,168',
     '&pound;48,494',
-    '&pound;48,800&ndash;61,000',
-    '&pound;48,956',
-    '&pound;48.0',
-    '&pound;48.10',
-    '&pound;48.2m',
-    '&pound;48.3',
-    '&pound;48.34m',
-    '&pound;48.40',
-    '&pound;48.4m',
-    '&pound;48.50/acre',
-    '&pound;48.60',
-    '&pound;48.6m',
-    '&pound;48.7',
-    '&pound;48.85',
-    '&pound;48.8m',
     '&pound;48.95',
-    '&pound;48.99',
-    '&pound;48.9m',
-    '&pound;4800',
-    '&pound;481',
-    '&pound;481,200',
-    '&pound;482',
-    '&pound;482,200',
-    '&pound;483',
-    '&pound;483,000',
-    '&pound;483.',
-    '&pound;484.1m',
-    '&pound;484m',
-    '&pound;487,000',
-    '&pound;487.63',
-    '&pound;488,000&ndash;610,000',
     '&pound;488,900',
-    '&pound;488.8m',
-    '&pound;48m.',
-    '&pound;49,215',
-    '&pound;49,400',
-    '&pound;49,500',
-    '&pound;49,752',
-    '&pound;49,900',
-    '&pound;49-99',
-    '&pound;49.',
-    '&pound;49.1m',
-    '&pound;49.2',
-    '&pound;49.20',
-    '&pound;49.40',
-    '&pound;49.60',
-    '&pound;49.6m',
     '&pound;49.7',
-    '&pound;49.78',
-    '&pound;49.8',
-    '&pound;49.8m',
-    '&pound;49.91',
-    '&pound;49.92',
-    '&pound;49.9m',
-    '&pound;490.00',
-    '&pound;4900',
-    '&pound;490258',
-    '&pound;4904.60',
-    '&pound;491,000',
-    '&pound;491.10',
-    '&pound;491.25',
-    '&pound;492',
-    '&pound;492m',
     '&pound;493',
-    '&pound;494',
-    '&pound;495.00',
-    '&pound;495m',
-    '&pound;496,000',
-    '&pound;496m',
-    '&pound;496million',
-    '&pound;497',
-    '&pound;497m',
-    '&pound;499.5',
-    '&pound;499.50',
-    '&pound;4995',
-    '&pound;4k',
-    '&pound;4o',
-    '&pound;4th',
-    '&pound;5&frac12',
     '&pound;5&frac34;m',
-    '&pound;5&ndash&pound;10',
-    '&pound;5&ndash&pound;20',
-    '&pound;5&ndash;10,000',
-    '&pound;5*',
-    '&pound;5,000&ndash&pound;50,000',
-    '&pound;5,000&ndash;7,000',
-    '&pound;5,000+vat',
-    '&pound;5,000-&pound;50,000',
-    '&pound;5,000-&pound;6,000',
-    '&pound;5,000-a-day',
-    '&pound;5,000-a-year',
-    '&pound;5,000-a-year-for-five',
-    '&pound;5,000.00',
-    '&pound;5,002',
-    '&pound;5,030',
     '&pound;5,075',
-    '&pound;5,095m',
-    '&pound;5,107',
-    '&pound;5,135.08',
-    '&pound;5,165',
-    '&pound;5,199.30',
-    '&pound;5,202',
-    '&pound;5,264,500',
-    '&pound;5,279',
-    '&pound;5,291.64p',
-    '&pound;5,307.25',
-    '&pound;5,309',
-    '&pound;5,316,286',
-    '&pound;5,320',
-    '&pound;5,330',
-    '&pound;5,335',
     '&pound;5,366',
-    '&pound;5,400-a-year',
-    '&pound;5,434',
-    '&pound;5,438,860',
-    '&pound;5,460',
-    '&pound;5,500&ndash;6,600',
-    '&pound;5,516m',
-    '&pound;5,531,000',
-    '&pound;5,535',
-    '&pound;5,540',
-    '&pound;5,544',
-    '&pound;5,547.50',
-    '&pound;5,554',
-    '&pound;5,568',
-    '&pound;5,569.',
-    '&pound;5,634',
     '&pound;5,661',
-    '&pound;5,666.32',
-    '&pound;5,682',
-    '&pound;5,729',
-    '&pound;5,750,000',
-    '&pound;5,760',
-    '&pound;5,764',
-    '&pound;5,783',
-    '&pound;5,795',
-    '&pound;5,798',
-    '&pound;5,820',
-    '&pound;5,850',
-    '&pound;5,912',
-    '&pound;5,950',
-    '&pound;5,954',
-    '&pound;5,960',
     '&pound;5,987',
-    '&pound;5,999,000',
-    '&pound;5-&pound;11/concs',
-    '&pound;5-&pound;12.50',
-    '&pound;5-&pound;15',
-    '&pound;5-&pound;19',
-    '&pound;5-&pound;6',
-    '&pound;5-&pound;7',
-    '&pound;5-10,000',
-    '&pound;5-5-0',
-    '&pound;5-a-head',
-    '&pound;5-a-week',
-    '&pound;5-pack',
-    '&pound;5-plus',
-    '&pound;5.02m',
-    '&pound;5.04',
     '&pound;5.04m',
-    '&pound;5.05',
-    '&pound;5.06',
-    '&pound;5.08m',
-    '&pound;5.13',
-    '&pound;5.13bn',
-    '&pound;5.14million',
-    '&pound;5.182m',
-    '&pound;5.22/200ml',
-    '&pound;5.22m',
-    '&pound;5.23',
-    '&pound;5.23m',
-    '&pound;5.24billion',
-    '&pound;5.25m',
-    '&pound;5.2bn',
-    '&pound;5.2mbid',
     '&pound;5.2million',
-    '&pound;5.33',
-    '&pound;5.36',
-    '&pound;5.38',
-    '&pound;5.3bn',
-    '&pound;5.46',
-    '&pound;5.48',
-    '&pound;5.4bn',
-    '&pound;5.5&shilling',
-    '&pound;5.5.0.',
-    '&pound;5.50-&pound;9',
-    '&pound;5.50/&pound;4.75',
-    '&pound;5.50p',
-    '&pound;5.52',
-    '&pound;5.53&ndash&pound;20.43',
-    '&pound;5.53p',
     '&pound;5.59',
-    '&pound;5.59&ndash&pound;6.09',
-    '&pound;5.5b',
-    '&pound;5.61',
-    '&pound;5.62million',
-    '&pound;5.64',
-    '&pound;5.67',
-    '&pound;5.75/&pound;3/free',
-    '&pound;5.7bn',
-    '&pound;5.84m',
-    '&pound;5.86',
-    '&pound;5.88',
-    '&pound;5.8bn',
-    '&pound;5.8s.6d.',
-    '&pound;5.9',
-    '&pound;5.92m',
     '&pound;5.93',
-    '&pound;5.94',
-    '&pound;5.94bn',
-    '&pound;5.95/100ml',
-    '&pound;5.95/15ml',
-    '&pound;5.95/15ml.',
-    '&pound;5.95/8oz',
-    '&pound;5.95p',
-    '&pound;5.97',
-    '&pound;5.99/15ml',
-    '&pound;5.991.47',
-    '&pound;5.9bn',
-    '&pound;50&ndash',
-    '&pound;50&ndash&pound;140',
-    '&pound;50&ndash&pound;70',
-    '&pound;50&ndash&pound;90',
     '&pound;50&ndash;100,000',
-    '&pound;50&ndash;60',
-    '&pound;50&ndash;80,000',
-    '&pound;50+per',
-    '&pound;50,000&mdash&pound;60,000',
-    '&pound;50,000&ndash&pound;100,000',
-    '&pound;50,000&ndash;100,000',
-    '&pound;50,000&ndash;62,500',
-    '&pound;50,000+',
-    '&pound;50,000,000',
-    '&pound;50,000-added',
-    '&pound;50,000-per-year',
-    '&pound;50,000-to-&pound;100,000',
-    '&pound;50,000-worth',
-    '&pound;50,250&ndash;62,800',
-    '&pound;50,400',
     '&pound;50,500&ndash;60,500',
-    '&pound;50,800',
-    '&pound;50-&pound;100',
-    '&pound;50-&pound;80',
-    '&pound;50-a-game',
-    '&pound;50-a-week',
-    '&pound;50.',
-    '&pound;50.1m',
-    '&pound;50.2m',
-    '&pound;50.36',
-    '&pound;50.59',
-    '&pound;50.5m',
-    '&pound;50.76',
-    '&pound;50.8',
-    '&pound;50.9m',
-    '&pound;500&ndash;15,000',
     '&pound;500&ndash;700,000',
-    '&pound;500\'',
-    '&pound;500+vat',
-    '&pound;500,00',
-    '&pound;500,000,000',
-    '&pound;500,000-a-month',
-    '&pound;500,000-plus',
-    '&pound;500,000-worth',
-    '&pound;500,0000',
-    '&pound;500-&pound;1,200',
-    '&pound;500-&pound;100,000',
-    '&pound;500-&pound;40,000',
-    '&pound;500-a-season',
-    '&pound;500-a-week',
-    '&pound;500-ish',
-    '&pound;500-to-the-winner',
     '&pound;500-worth',
-    '&pound;5000,000',
-    '&pound;500m.',
-    '&pound;501',
-    '&pound;501,415',
-    '&pound;502,811',
-    '&pound;503,000',
-    '&pound;503m',
-    '&pound;504,000',
-    '&pound;506,000',
-    '&pound;508,000',
-    '&pound;508,859',
-    '&pound;508.72',
-    '&pound;509,709',
-    '&pound;509m',
-    '&pound;50b',
     '&pound;50m-&pound;55m',
-    '&pound;50m-a-year',
-    '&pound;50m.',
-    '&pound;51,042',
-    '&pound;51,500,000',
-    '&pound;51,600',
-    '&pound;51,600&ndash;77,400',
-    '&pound;51,699',
-    '&pound;51,995',
-    '&pound;51.19',
-    '&pound;51.1m',
-    '&pound;51.2',
-    '&pound;51.55',
-    '&pound;51.5m',
-    '&pound;51.5million',
-    '&pound;51.75',
     '&pound;51.89',
-    '&pound;510,000,000',
-    '&pound;510m',
-    '&pound;511',
-    '&pound;511,000',
-    '&pound;511,867',
-    '&pound;512,000',
-    '&pound;512.80',
-    '&pound;514',
-    '&pound;514,000',
-    '&pound;514,558',
-    '&pound;515,000',
-    '&pound;518',
-    '&pound;519,520',
-    '&pound;5199',
-    '&pound;519m',
     '&pound;51million',
-    '&pound;52&frac12;m',
-    '&pound;52,000-plus',
-    '&pound;52,300',
-    '&pound;52,800',
-    '&pound;52,900',
-    '&pound;52.03',
-    '&pound;52.10*',
-    '&pound;52.10s.0d.',
-    '&pound;52.1m',
-    '&pound;52.3',
-    '&pound;52.37',
-    '&pound;52.3m',
-    '&pound;52.4',
-    '&pound;52.4m',
-    '&pound;52.5',
     '&pound;52.53',
-    '&pound;52.7',
-    '&pound;52.8',
-    '&pound;52.80',
-    '&pound;52.81',
-    '&pound;52.84',
-    '&pound;52.99',
-    '&pound;52.9m',
-    '&pound;520,000',
-    '&pound;520.00',
-    '&pound;520000',
-    '&pound;521,000',
-    '&pound;521.8',
-    '&pound;521m',
-    '&pound;522,000',
-    '&pound;523m',
     '&pound;524,008',
-    '&pound;524m',
-    '&pound;525.00',
-    '&pound;5250',
-    '&pound;52500',
-    '&pound;526',
-    '&pound;527m',
-    '&pound;528,000',
-    '&pound;528,540',
-    '&pound;529',
-    '&pound;52million',
-    '&pound;53&ndash&pound;66',
-    '&pound;53&ndash;24p',
-    '&pound;53&ndash;25',
-    '&pound;53,038',
-    '&pound;53,125',
     '&pound;53,400',
-    '&pound;53.',
-    '&pound;53.00',
-    '&pound;53.1',
-    '&pound;53.24',
-    '&pound;53.33',
-    '&pound;53.50',
-    '&pound;53.7',
-    '&pound;53.87',
-    '&pound;53.90',
-    '&pound;5304.',
-    '&pound;531',
-    '&pound;531.30',
-    '&pound;532',
-    '&pound;532.00',
-    '&pound;532.6',
     '&pound;533,000&ndash;666,000',
-    '&pound;533m',
-    '&pound;534s',
-    '&pound;535,122',
-    '&pound;535m',
-    '&pound;537',
-    '&pound;537,000',
-    '&pound;538,154',
-    '&pound;538.88',
-    '&pound;538m',
-    '&pound;539.40',
-    '&pound;54,000,000',
-    '&pound;54,150,000',
-    '&pound;54,166',
-    '&pound;54,196',
-    '&pound;54,224',
     '&pound;54,270',
-    '&pound;54,950',
-    '&pound;54.00',
-    '&pound;54.3',
-    '&pound;54.34',
-    '&pound;54.4',
-    '&pound;54.5m',
-    '&pound;54.6m',
-    '&pound;54.8m',
-    '&pound;54.9',
-    '&pound;54.9m',
-    '&pound;540,500',
-    '&pound;5400',
-    '&pound;54000',
-    '&pound;544,000',
-    '&pound;544m',
     '&pound;546',
-    '&pound;546,000',
-    '&pound;547',
-    '&pound;547.60',
-    '&pound;548',
-    '&pound;548.73',
-    '&pound;548.9m',
-    '&pound;5487',
-    '&pound;548m',
-    '&pound;54932',
-    '&pound;55&ndash;60,000',
-    '&pound;55&ndash;85,000',
-    '&pound;55,000,000',
-    '&pound;55,000-&pound;70,000',
-    '&pound;55,000-a-year',
-    '&pound;55,000-listed',
     '&pound;55,202',
-    '&pound;55,230',
-    '&pound;55,600',
-    '&pound;55.1',
-    '&pound;55.37m',
-    '&pound;55.50',
-    '&pound;55.50/column',
-    '&pound;55.60',
-    '&pound;55.7m',
-    '&pound;55.81',
-    '&pound;55.99',
-    '&pound;55.9m',
-    '&pound;550&ndash;650,000',
-    '&pound;550/&pound;600',
-    '&pound;550million',
-    '&pound;551,000',
     '&pound;551,680',
-    '&pound;553',
-    '&pound;553,000',
-    '&pound;553million',
-    '&pound;554,000',
-    '&pound;554.27.',
-    '&pound;555',
-    '&pound;5550',
-    '&pound;555m',
-    '&pound;556',
-    '&pound;556,000',
-    '&pound;556,930',
-    '&pound;556m',
-    '&pound;5570',
-    '&pound;558,100',
-    '&pound;558m',
     '&pound;55bn',
-    '&pound;55mbetting',
-    '&pound;56,000,000',
-    '&pound;56,100&ndash;70,100',
-    '&pound;56,273',
-    '&pound;56,300',
-    '&pound;56-a-week',
-    '&pound;56.13s.8d.',
-    '&pound;56.1m',
-    '&pound;56.22',
-    '&pound;56.25',
-    '&pound;56.2m',
-    '&pound;56.34',
-    '&pound;56.60',
-    '&pound;56.8m',
-    '&pound;56.95',
     '&pound;560,000,000',
-    '&pound;560.5',
-    '&pound;560.7',
-    '&pound;560.8million',
-    '&pound;561',
-    '&pound;561,000',
-    '&pound;561,044',
-    '&pound;562',
-    '&pound;562million',
-    '&pound;563',
-    '&pound;564,800',
-    '&pound;564.37',
-    '&pound;565m',
-    '&pound;566,019,006',
-    '&pound;567.18',
-    '&pound;568,000',
     '&pound;568.04',
-    '&pound;568.86m',
-    '&pound;569',
-    '&pound;57,500',
-    '&pound;57,750',
-    '&pound;57,995',
-    '&pound;57.00',
-    '&pound;57.3',
-    '&pound;57.57',
-    '&pound;57.5m',
-    '&pound;57.6',
-    '&pound;57.69',
-    '&pound;57.6m',
-    '&pound;57.7',
-    '&pound;57.75',
-    '&pound;57.7m',
     '&pound;57.80',
-    '&pound;57.87',
-    '&pound;57.88',
-    '&pound;57.8m',
-    '&pound;570,664',
-    '&pound;570,680',
-    '&pound;570m',
-    '&pound;571,000',
-    '&pound;571.86',
-    '&pound;572',
-    '&pound;574',
-    '&pound;575,000.',
-    '&pound;575,850',
-    '&pound;575.5m',
-    '&pound;5750000',
-    '&pound;576',
     '&pound;5783m',
-    '&pound;57million',
-    '&pound;58&ndash;115,000',
-    '&pound;58&ndash;87,000',
-    '&pound;58,320',
-    '&pound;58,330',
-    '&pound;58,400',
-    '&pound;58,754',
-    '&pound;58,830',
-    '&pound;58,995',
-    '&pound;58.10',
-    '&pound;58.17',
-    '&pound;58.2',
-    '&pound;58.2m',
-    '&pound;58.30',
-    '&pound;58.4',
     '&pound;58.54',
-    '&pound;58.5m',
-    '&pound;58.70',
-    '&pound;58.88',
-    '&pound;580.35',
-    '&pound;581,000',
-    '&pound;581,275',
-    '&pound;582,210',
-    '&pound;5822',
-    '&pound;584.',
-    '&pound;585,250',
-    '&pound;586',
-    '&pound;586.8m',
-    '&pound;5866',
-    '&pound;587',
-    '&pound;587,000',
     '&pound;587m',
-    '&pound;588m',
-    '&pound;59,039',
-    '&pound;59,125',
-    '&pound;59,400',
-    '&pound;59,602',
-    '&pound;59,800m',
-    '&pound;59,906',
-    '&pound;59,953',
-    '&pound;59,99',
-    '&pound;59.1',
-    '&pound;59.45',
-    '&pound;59.58',
-    '&pound;59.59',
-    '&pound;59.5million',
-    '&pound;59.77',
     '&pound;59.85',
-    '&pound;59.95+vat',
-    '&pound;590,966',
-    '&pound;591million',
-    '&pound;592,400',
-    '&pound;594,000',
-    '&pound;595m',
-    '&pound;596m',
-    '&pound;597m',
-    '&pound;598',
-    '&pound;599.2m',
-    '&pound;599.4',
-    '&pound;59900',
-    '&pound;5995m',
-    '&pound;59m',
-    '&pound;5b-worth',
     '&pound;5m+',
-    '&pound;5m-rated',
-    '&pound;5pa',
-    '&pound;5s',
-    '&pound;5s.',
-    '&pound;5th',
-    '&pound;5x',
-    '&pound;6&frac12',
-    '&pound;6&frac12;m',
-    '&pound;6&ndash&pound;10',
-    '&pound;6&ndash&pound;12',
-    '&pound;6&ndash;7',
-    '&pound;6&ndash;95',
-    '&pound;6,000&ndash;9,000',
-    '&pound;6,000-&pound;10,000',
-    '&pound;6,000-&pound;9,000',
     '&pound;6,000-to-the-winner',
-    '&pound;6,000-worth',
-    '&pound;6,000/8,000',
-    '&pound;6,020',
-    '&pound;6,030',
-    '&pound;6,040',
-    '&pound;6,052.5m',
-    '&pound;6,053.56',
-    '&pound;6,072',
-    '&pound;6,100million',
-    '&pound;6,141',
-    '&pound;6,155',
-    '&pound;6,165',
-    '&pound;6,175',
-    '&pound;6,208,000',
-    '&pound;6,215',
     '&pound;6,227',
-    '&pound;6,235',
-    '&pound;6,240',
-    '&pound;6,25',
-    '&pound;6,250,000',
-    '&pound;6,260',
-    '&pound;6,277,893',
-    '&pound;6,280',
-    '&pound;6,300&ndash&pound;11,370',
-    '&pound;6,344',
-    '&pound;6,354',
-    '&pound;6,415',
-    '&pound;6,438',
-    '&pound;6,439.72',
-    '&pound;6,460',
-    '&pound;6,470,000',
     '&pound;6,495',
-    '&pound;6,530',
-    '&pound;6,538',
-    '&pound;6,565,000',
-    '&pound;6,574,000',
-    '&pound;6,597,947',
-    '&pound;6,614',
-    '&pound;6,619',
-    '&pound;6,620',
-    '&pound;6,628',
-    '&pound;6,659',
-    '&pound;6,667',
-    '&pound;6,694',
-    '&pound;6,697',
-    '&pound;6,700',
-    '&pound;6,720',
     '&pound;6,730,000',
-    '&pound;6,774',
-    '&pound;6,777,622',
-    '&pound;6,783',
-    '&pound;6,801',
-    '&pound;6,848',
-    '&pound;6,850.',
-    '&pound;6,855',
-    '&pound;6,870,214',
-    '&pound;6,875',
-    '&pound;6,887',
-    '&pound;6,896',
-    '&pound;6,924',
-    '&pound;6,925.25',
-    '&pound;6,929',
-    '&pound;6,939,885.46',
     '&pound;6,950',
-    '&pound;6-&pound;12',
-    '&pound;6-&pound;15',
-    '&pound;6-&pound;7',
-    '&pound;6-&pound;8.50',
-    '&pound;6-10',
-    '&pound;6.00+vat',
-    '&pound;6.00-&ndash;9.00',
-    '&pound;6.01',
-    '&pound;6.05',
-    '&pound;6.06',
-    '&pound;6.06m',
-    '&pound;6.07',
-    '&pound;6.08/200ml',
-    '&pound;6.1',
-    '&pound;6.12',
     '&pound;6.13',
-    '&pound;6.14bn',
-    '&pound;6.155m.',
-    '&pound;6.176m',
-    '&pound;6.18.2',
-    '&pound;6.19',
-    '&pound;6.1m.',
-    '&pound;6.21',
-    '&pound;6.26',
-    '&pound;6.27',
-    '&pound;6.29/40ml',
-    '&pound;6.296m',
-    '&pound;6.29m',
-    '&pound;6.2bn',
-    '&pound;6.36m',
-    '&pound;6.37',
     '&pound;6.376m',
-    '&pound;6.3million',
-    '&pound;6.42',
-    '&pound;6.45/4oz',
-    '&pound;6.48',
-    '&pound;6.4billion',
-    '&pound;6.4bn',
-    '&pound;6.4million',
-    '&pound;6.50-&pound;15',
-    '&pound;6.50/200ml',
-    '&pound;6.50per',
-    '&pound;6.51m',
-    '&pound;6.54bn',
-    '&pound;6.57',
-    '&pound;6.5million',
-    '&pound;6.63million',
     '&pound;6.66',
-    '&pound;6.67',
-    '&pound;6.673m',
-    '&pound;6.67m',
-    '&pound;6.6million',
-    '&pound;6.70',
-    '&pound;6.71/t',
-    '&pound;6.72',
-    '&pound;6.72m',
-    '&pound;6.75p',
-    '&pound;6.77m',
-    '&pound;6.7m.',
-    '&pound;6.82',
-    '&pound;6.83p',
-    '&pound;6.86',
-    '&pound;6.88',
     '&pound;6.8million',
-    '&pound;6.9',
-    '&pound;6.902m.',
-    '&pound;6.94',
-    '&pound;6.95/12oz',
-    '&pound;6.9million',
-    '&pound;6/&pound;4.50/&pound;3/free',
-    '&pound;6/5&shilling',
-    '&pound;60&ndash&pound;600',
-    '&pound;60&ndash&pound;77',
-    '&pound;60&ndash;100,000',
-    '&pound;60&ndash;67m',
-    '&pound;60&ndash;90,000',
-    '&pound;60,000&ndash&pound;11,832',
-    '&pound;60,000&ndash;300,000',
-    '&pound;60,000.00',
     '&pound;60,025',
-    '&pound;60,260',
-    '&pound;60,300',
-    '&pound;60,500',
-    '&pound;60,760',
-    '&pound;60,837',
-    '&pound;60-&pound;100',
-    '&pound;60-&pound;70',
-    '&pound;60-a-week',
-    '&pound;60.1million',
-    '&pound;60.2',
-    '&pound;60.20',
-    '&pound;60.26',
-    '&pound;60.31',
-    '&pound;60.4mn',
-    '&pound;60/tonne',
     '&pound;600&ndash&pound;700',
-    '&pound;600&ndash;700',
-    '&pound;600&ndash;800',
-    '&pound;600,000,000',
-    '&pound;600-&pound;700',
-    '&pound;600-&pound;800',
-    '&pound;600.',
-    '&pound;600/ha',
-    '&pound;60000',
-    '&pound;600000',
-    '&pound;600bn',
-    '&pound;601',
-    '&pound;602,000',
-    '&pound;6024m',
-    '&pound;60273.46',
-    '&pound;603',
     '&pound;604m',
-    '&pound;605',
-    '&pound;606',
-    '&pound;606,000',
-    '&pound;607',
-    '&pound;607,500',
-    '&pound;607,645',
-    '&pound;607.20',
-    '&pound;60a-week',
-    '&pound;60billion',
-    '&pound;60bn',
-    '&pound;60m-70m',
-    '&pound;60m.',
-    '&pound;61,100',
-    '&pound;61,277',
-    '&pound;61,426.50',
     '&pound;61,462',
-    '&pound;61,505',
-    '&pound;61,800&ndash;92,800',
-    '&pound;61,891',
-    '&pound;61,950',
-    '&pound;61,965',
-    '&pound;61-a-week',
-    '&pound;61.25',
-    '&pound;61.30',
-    '&pound;61.4m',
-    '&pound;61.7',
-    '&pound;61.74',
-    '&pound;61.93',
-    '&pound;61.95',
-    '&pound;61.9m',
-    '&pound;610m',
     '&pound;612,000',
-    '&pound;613',
-    '&pound;613.7.3d',
-    '&pound;615',
-    '&pound;615,000,000',
-    '&pound;615million',
-    '&pound;616,000',
-    '&pound;61650',
-    '&pound;617,000',
-    '&pound;617,500',
-    '&pound;617m',
-    '&pound;618,000',
-    '&pound;618,637',
-    '&pound;618m',
-    '&pound;619.69',
-    '&pound;62,500&ndash;78,125',
     '&pound;62,543',
-    '&pound;62,663',
-    '&pound;62,750',
-    '&pound;62,800&ndash;83,750',
-    '&pound;62.1',
-    '&pound;62.1m',
-    '&pound;62.25',
-    '&pound;62.3',
-    '&pound;62.4million',
-    '&pound;62.5m',
-    '&pound;62.60',
-    '&pound;62.6m',
-    '&pound;62.75',
-    '&pound;62.8million',
-    '&pound;62.95',
-    '&pound;6200',
     '&pound;62025',
-    '&pound;621',
-    '&pound;621,400,000',
-    '&pound;621,800',
-    '&pound;62100',
-    '&pound;622,478',
-    '&pound;623',
-    '&pound;623,800',
-    '&pound;624',
-    '&pound;624m',
-    '&pound;625,000&ndash;937,500',
-    '&pound;627.37',
-    '&pound;628,611',
-    '&pound;629,000',
-    '&pound;629,371',
-    '&pound;63,150',
     '&pound;63,174',
-    '&pound;63,200',
-    '&pound;63,390',
-    '&pound;63,400',
-    '&pound;63,500',
-    '&pound;63,900',
-    '&pound;63.05',
-    '&pound;63.10',
-    '&pound;63.4m',
-    '&pound;63.50',
-    '&pound;63.8m',
-    '&pound;63.90',
-    '&pound;63.98',
-    '&pound;630million',
-    '&pound;631,000',
-    '&pound;631,681',
     '&pound;632',
-    '&pound;632m',
-    '&pound;633.15s.0d',
-    '&pound;633m',
-    '&pound;634,736',
-    '&pound;635,000',
-    '&pound;636,000m',
-    '&pound;636.2million',
-    '&pound;637,515.11&shilling;.11d',
-    '&pound;638.7',
-    '&pound;64,536',
-    '&pound;64,700',
-    '&pound;64,800',
-    '&pound;64,950.',
-    '&pound;64.021m',
-    '&pound;64.1m',
     '&pound;64.267m',
-    '&pound;64.2m',
-    '&pound;64.6m',
-    '&pound;64.86',
-    '&pound;64.9',
-    '&pound;64.92',
-    '&pound;64.95',
-    '&pound;6400',
-    '&pound;643.77',
-    '&pound;643.82',
-    '&pound;643million',
-    '&pound;644.8m',
-    '&pound;6450',
-    '&pound;646',
-    '&pound;649.90',
-    '&pound;65&ndash&pound;81',
     '&pound;65&ndash;10&ndash;0',
-    '&pound;65,000&ndash;85,000',
-    '&pound;65,000&ndash;98,000',
-    '&pound;65,000-a-year',
-    '&pound;65,048',
-    '&pound;65,058',
-    '&pound;65,226',
-    '&pound;65,356',
-    '&pound;65,360',
-    '&pound;65,800',
-    '&pound;65,988',
-    '&pound;65-a-second',
-    '&pound;65-an-hour',
-    '&pound;65.1m',
-    '&pound;65.3',
-    '&pound;65.4',
     '&pound;65.50',
-    '&pound;65.65',
-    '&pound;65.70',
-    '&pound;65.75',
-    '&pound;65.80',
-    '&pound;65.90',
-    '&pound;65.92',
-    '&pound;65/&dollar;90',
-    '&pound;650,000,000',
-    '&pound;650,000-plus',
-    '&pound;650.',
-    '&pound;650.1',
-    '&pound;6500',
-    '&pound;65000&ndash&pound;70000',
-    '&pound;651',
-    '&pound;651,000',
     '&pound;651.04p',
-    '&pound;652,000',
-    '&pound;653,886',
-    '&pound;653.04',
-    '&pound;653m',
-    '&pound;654',
-    '&pound;654,000',
-    '&pound;654.94',
-    '&pound;655.50',
-    '&pound;656,000',
-    '&pound;656,250',
-    '&pound;657,000',
-    '&pound;657,500',
-    '&pound;657m',
-    '&pound;658,000',
-    '&pound;659,000',
     '&pound;65million',
-    '&pound;66&frac12;m',
-    '&pound;66,030,816',
-    '&pound;66,150',
-    '&pound;66,300',
-    '&pound;66,417',
-    '&pound;66.50',
-    '&pound;66.500',
-    '&pound;66.5m',
-    '&pound;66.60',
-    '&pound;66.75',
-    '&pound;66.90',
-    '&pound;66.95',
-    '&pound;66.97',
-    '&pound;660,000,000',
-    '&pound;661',
     '&pound;663',
-    '&pound;663.97',
-    '&pound;665',
-    '&pound;665,000',
-    '&pound;666,000',
-    '&pound;666,000&ndash;1,200,000',
-    '&pound;666,000&ndash;800,000',
-    '&pound;666,666',
-    '&pound;666,700',
-    '&pound;666.',
-    '&pound;666.67',
-    '&pound;667.87',
-    '&pound;667.98',
-    '&pound;669',
-    '&pound;669.77',
-    '&pound;669.99',
     '&pound;67,000&ndash;79,000',
-    '&pound;67,444',
-    '&pound;67,445',
-    '&pound;67,5000',
-    '&pound;67,550',
-    '&pound;67,950',
-    '&pound;67.15',
-    '&pound;67.20',
-    '&pound;67.2m',
-    '&pound;67.4',
-    '&pound;67.45',
-    '&pound;67.50',
-    '&pound;67.55',
-    '&pound;67.5m',
-    '&pound;67.80',
-    '&pound;67.9',
     '&pound;670,365',
-    '&pound;670million',
-    '&pound;671,194',
-    '&pound;672,200',
-    '&pound;672.00',
-    '&pound;673',
-    '&pound;673,000',
-    '&pound;673.03',
-    '&pound;674,000',
-    '&pound;674,500',
-    '&pound;677',
-    '&pound;678',
-    '&pound;679,853',
-    '&pound;679.36',
-    '&pound;68,256',
-    '&pound;68,300',
     '&pound;68,500',
-    '&pound;68,750',
-    '&pound;68,908',
-    '&pound;68-&pound;42',
-    '&pound;68.0',
-    '&pound;68.05',
-    '&pound;68.1',
-    '&pound;68.15',
-    '&pound;68.4',
-    '&pound;68.48',
-    '&pound;68.6',
-    '&pound;68.8m',
-    '&pound;68.94',
-    '&pound;68.97',
-    '&pound;6800',
-    '&pound;68000',
     '&pound;681,700',
-    '&pound;682m',
-    '&pound;683.88',
-    '&pound;684',
-    '&pound;684,000',
-    '&pound;684,500',
-    '&pound;685.35',
-    '&pound;686.76',
-    '&pound;6878',
-    '&pound;689',
-    '&pound;69,160',
-    '&pound;69,220',
-    '&pound;69,900',
-    '&pound;69,995',
-    '&pound;69.',
-    '&pound;69.00',
     '&pound;69.000',
-    '&pound;69.1',
-    '&pound;69.10',
-    '&pound;69.16',
-    '&pound;69.3m',
-    '&pound;69.50',
-    '&pound;69.70',
-    '&pound;69.7m',
-    '&pound;69.90',
-    '&pound;69.92',
-    '&pound;69.96',
-    '&pound;690m',
-    '&pound;691',
-    '&pound;692,054',
-    '&pound;692m',
-    '&pound;693',
     '&pound;694,000',
-    '&pound;694m',
-    '&pound;696',
-    '&pound;696,000',
-    '&pound;697m',
-    '&pound;698,522',
-    '&pound;698507',
-    '&pound;699.95',
-    '&pound;6and3/4',
-    '&pound;7&frac12',
-    '&pound;7&frac12;m',
-    '&pound;7&ndash&pound;13',
-    '&pound;7&ndash&pound;15',
-    '&pound;7&ndash;8',
-    '&pound;7,000&ndash;9,000',
-    '&pound;7,000-&pound;12,000',
     '&pound;7,000-&pound;40,000',
-    '&pound;7,000-&pound;9,000',
-    '&pound;7,000-worth',
-    '&pound;7,000.',
-    '&pound;7,050',
-    '&pound;7,066',
-    '&pound;7,110',
-    '&pound;7,160',
-    '&pound;7,171',
-    '&pound;7,247',
-    '&pound;7,260',
-    '&pound;7,274',
-    '&pound;7,281',
-    '&pound;7,295',
-    '&pound;7,300&ndash;9,700',
-    '&pound;7,319',
     '&pound;7,326',
-    '&pound;7,331',
-    '&pound;7,346',
-    '&pound;7,360',
-    '&pound;7,420',
-    '&pound;7,425',
-    '&pound;7,426',
-    '&pound;7,480',
-    '&pound;7,500-a-year',
-    '&pound;7,500.',
-    '&pound;7,540',
-    '&pound;7,581',
-    '&pound;7,584',
-    '&pound;7,586',
-    '&pound;7,600',
-    '&pound;7,619.44',
     '&pound;7,644',
-    '&pound;7,653',
-    '&pound;7,674',
-    '&pound;7,690',
-    '&pound;7,722.11s.1&frac12;d',
-    '&pound;7,750',
-    '&pound;7,815.60',
-    '&pound;7,818',
-    '&pound;7,832',
-    '&pound;7,854,000',
-    '&pound;7,881',
-    '&pound;7,905',
-    '&pound;7,916',
-    '&pound;7,920',
-    '&pound;7,960',
-    '&pound;7,968',
     '&pound;7,995',
-    '&pound;7-0-0',
-    '&pound;7-5m',
-    '&pound;7-a-week',
-    '&pound;7-million',
-    '&pound;7.0',
-    '&pound;7.04',
-    '&pound;7.05',
-    '&pound;7.06',
-    '&pound;7.07',
-    '&pound;7.08',
-    '&pound;7.0s.0d.',
-    '&pound;7.11m',
-    '&pound;7.127m.',
-    '&pound;7.13',
-    '&pound;7.14',
     '&pound;7.14m',
-    '&pound;7.15',
-    '&pound;7.15m',
-    '&pound;7.16',
-    '&pound;7.17.10',
-    '&pound;7.19',
-    '&pound;7.21',
-    '&pound;7.24',
-    '&pound;7.25&ndash&pound;8.55',
-    '&pound;7.25m',
-    '&pound;7.26',
-    '&pound;7.27',
-    '&pound;7.29m',
-    '&pound;7.2s.6d',
-    '&pound;7.34m',
-    '&pound;7.39',
     '&pound;7.3bn',
-    '&pound;7.44',
-    '&pound;7.48',
-    '&pound;7.4bn',
-    '&pound;7.50&ndash&pound;8',
-    '&pound;7.500',
-    '&pound;7.51',
-    '&pound;7.52bn',
-    '&pound;7.57',
-    '&pound;7.5bn.',
-    '&pound;7.5o',
-    '&pound;7.5s.0d.',
-    '&pound;7.60/40oz',
-    '&pound;7.62',
-    '&pound;7.66',
-    '&pound;7.681m',
     '&pound;7.7',
-    '&pound;7.70',
-    '&pound;7.73',
-    '&pound;7.75/250ml',
-    '&pound;7.75inc.vat',
-    '&pound;7.76p',
-    '&pound;7.7bn',
-    '&pound;7.80p',
-    '&pound;7.8bn',
-    '&pound;7.96m',
-    '&pound;7.97',
-    '&pound;7.976',
-    '&pound;7.98',
-    '&pound;7.99.',
-    '&pound;7/50',
-    '&pound;70&ndash&pound;90',
     '&pound;70&ndash;80,000',
-    '&pound;70&ndash;85,000',
-    '&pound;70,000,000',
-    '&pound;70,000-&pound;80,000',
-    '&pound;70,000-a-man',
-    '&pound;70,000.',
-    '&pound;70.16&shilling;4d.',
-    '&pound;70.16s',
-    '&pound;70.1m',
-    '&pound;70.20',
-    '&pound;70.3m',
-    '&pound;70.42',
-    '&pound;70.46',
-    '&pound;70.5',
-    '&pound;70.50',
-    '&pound;70.5m',
     '&pound;70.7m',
-    '&pound;70.8',
-    '&pound;70.80',
-    '&pound;70.9m',
-    '&pound;70/kw/',
-    '&pound;700&ndash;800',
-    '&pound;700&ndash;900',
-    '&pound;700,000&ndash;900,000',
-    '&pound;700,000-rated',
-    '&pound;700-',
-    '&pound;700-a-night',
-    '&pound;700-a-week',
-    '&pound;700-per-term',
-    '&pound;700.',
-    '&pound;700.00',
-    '&pound;700million',
     '&pound;701',
-    '&pound;701,399',
-    '&pound;701,469',
-    '&pound;702,208',
-    '&pound;703,000',
-    '&pound;704,680',
-    '&pound;704.48',
-    '&pound;7049',
-    '&pound;705,128',
-    '&pound;708',
-    '&pound;708,000',
-    '&pound;708,522',
-    '&pound;708,853',
-    '&pound;709',
-    '&pound;709.3m',
-    '&pound;70pp',
     '&pound;71,500',
-    '&pound;71,769',
-    '&pound;71,950',
-    '&pound;71.2',
-    '&pound;71.20',
-    '&pound;71.2m',
-    '&pound;71.50',
-    '&pound;71.5m',
-    '&pound;71.60',
-    '&pound;71.7m',
-    '&pound;71.99',
-    '&pound;710.',
-    '&pound;710m',
-    '&pound;711',
-    '&pound;711,000',
-    '&pound;711m',
     '&pound;711million',
-    '&pound;712',
-    '&pound;712,000',
-    '&pound;713',
-    '&pound;713.57',
-    '&pound;714,300',
-    '&pound;7149',
-    '&pound;715,000',
-    '&pound;715,000,000',
-    '&pound;7150',
-    '&pound;716,000',
-    '&pound;717.4',
-    '&pound;717m',
-    '&pound;718',
-    '&pound;718.7m',
-    '&pound;719,000',
     '&pound;719.9',
-    '&pound;72,000&ndash;96,600',
-    '&pound;72,106',
-    '&pound;72,700',
-    '&pound;72.',
-    '&pound;72.00',
-    '&pound;72.20',
-    '&pound;72.57',
-    '&pound;72.80',
-    '&pound;720,280',
-    '&pound;721,000',
-    '&pound;722.9',
-    '&pound;723,320',
-    '&pound;723m',
-    '&pound;724',
-    '&pound;724,000',
     '&pound;7250',
-    '&pound;72million',
-    '&pound;73,000&ndash;97,000',
-    '&pound;73,300&ndash;83,750',
-    '&pound;73,350',
-    '&pound;73,400',
-    '&pound;73,578',
-    '&pound;73.10s',
-    '&pound;73.1m',
-    '&pound;73.32',
-    '&pound;73.5',
-    '&pound;73.8',
-    '&pound;730,000',
-    '&pound;7300',
-    '&pound;731',
-    '&pound;733,333',
     '&pound;733,500',
-    '&pound;733.80',
-    '&pound;733m',
-    '&pound;734',
-    '&pound;735.2',
-    '&pound;736.5m',
-    '&pound;736.67',
-    '&pound;737/acre',
-    '&pound;738m',
-    '&pound;739',
-    '&pound;73million',
-    '&pound;74,000m',
-    '&pound;74.26',
-    '&pound;74.30',
-    '&pound;74.6',
-    '&pound;74.7',
     '&pound;74.8m',
-    '&pound;74.95',
-    '&pound;740,000',
-    '&pound;740m',
-    '&pound;7411',
-    '&pound;742',
-    '&pound;743',
-    '&pound;743,000',
-    '&pound;744',
-    '&pound;744,900,000',
-    '&pound;746,000',
-    '&pound;746.5m',
-    '&pound;746m',
-    '&pound;748',
-    '&pound;748,440',
-    '&pound;749+vat',
     '&pound;75&ndash&pound;140',
-    '&pound;75&ndash&pound;170',
-    '&pound;75&ndash&pound;90,000',
-    '&pound;75,00',
-    '&pound;75,000-worth',
-    '&pound;75,134',
-    '&pound;75,186',
-    '&pound;75,500',
-    '&pound;75,789',
-    '&pound;75,800',
-    '&pound;75,862',
-    '&pound;75-&pound;115',
-    '&pound;75.000',
-    '&pound;75.10',
-    '&pound;75.3',
-    '&pound;75.5',
     '&pound;75.67',
-    '&pound;75.8m',
-    '&pound;75.9m',
-    '&pound;75/week',
-    '&pound;750&ndash&pound;800',
-    '&pound;750&ndash&pound;900',
-    '&pound;750,000-rated',
-    '&pound;750-&pound;1,000',
-    '&pound;750/acre',
-    '&pound;7500',
-    '&pound;750000',
-    '&pound;751,000',
-    '&pound;752m',
-    '&pound;753',
-    '&pound;753,000',
-    '&pound;754,000',
     '&pound;754,777',
-    '&pound;755m',
-    '&pound;757',
-    '&pound;7570',
-    '&pound;758,000',
-    '&pound;7585',
-    '&pound;758m',
-    '&pound;759m',
-    '&pound;76,234',
-    '&pound;76,324',
-    '&pound;76,500',
-    '&pound;76-worth',
-    '&pound;76.2.8&frac12;d',
-    '&pound;76.4m',
-    '&pound;76.6',
-    '&pound;76.85',
     '&pound;760m',
-    '&pound;762,000',
-    '&pound;763.15',
-    '&pound;763.8',
-    '&pound;764,000',
-    '&pound;7650',
-    '&pound;767,000',
-    '&pound;769',
-    '&pound;769,757',
-    '&pound;77,217',
-    '&pound;77,278',
-    '&pound;77,300&ndash;103,100',
-    '&pound;77,800',
-    '&pound;77,950',
-    '&pound;77.00',
-    '&pound;77.2k',
     '&pound;77.35',
-    '&pound;77.4m',
-    '&pound;77.50',
-    '&pound;77.6',
-    '&pound;77.8',
-    '&pound;7700',
-    '&pound;770000',
-    '&pound;771,815',
-    '&pound;772',
-    '&pound;773,00',
-    '&pound;778,683',
-    '&pound;779',
-    '&pound;779750',
-    '&pound;77bn',
-    '&pound;77million',
-    '&pound;78,000-a-year',
     '&pound;78,225',
-    '&pound;78,700',
-    '&pound;78,842',
-    '&pound;78.3',
-    '&pound;78.3m',
-    '&pound;78.50',
-    '&pound;78.60',
-    '&pound;78.6m',
-    '&pound;78.8',
-    '&pound;78.8m',
-    '&pound;78.9m',
-    '&pound;780,000',
-    '&pound;783.01',
-    '&pound;7833',
-    '&pound;784,000',
-    '&pound;785,000',
     '&pound;786',
-    '&pound;7860',
-    '&pound;787m',
-    '&pound;788,000',
-    '&pound;789,000',
-    '&pound;79.2m',
-    '&pound;79.4',
-    '&pound;79.49',
-    '&pound;79.4m',
-    '&pound;79.50',
-    '&pound;79.69',
-    '&pound;79.8',
-    '&pound;79.8m',
-    '&pound;791,499',
-    '&pound;792,000',
-    '&pound;792.1m',
     '&pound;792.70',
-    '&pound;798',
-    '&pound;799.99',
-    '&pound;79million',
-    '&pound;7:4:0',
-    '&pound;7k',
-    '&pound;7pp',
-    '&pound;8&frac12;m',
-    '&pound;8&ndash&pound;48',
-    '&pound;8,000&ndash;10,000',
-    '&pound;8,000m',
-    '&pound;8,050',
-    '&pound;8,120',
-    '&pound;8,143',
-    '&pound;8,144',
-    '&pound;8,150',
     '&pound;8,188',
-    '&pound;8,199',
-    '&pound;8,222',
-    '&pound;8,250,000',
-    '&pound;8,251',
-    '&pound;8,280',
-    '&pound;8,316,920',
-    '&pound;8,327',
-    '&pound;8,330',
-    '&pound;8,331,557',
-    '&pound;8,335',
-    '&pound;8,335.00',
-    '&pound;8,350',
-    '&pound;8,356',
-    '&pound;8,357',
-    '&pound;8,399',
     '&pound;8,404&ndash&pound;9,997',
-    '&pound;8,432',
-    '&pound;8,463',
-    '&pound;8,484',
-    '&pound;8,495',
-    '&pound;8,500&ndash;11,000',
-    '&pound;8,500-a-year',
-    '&pound;8,533',
-    '&pound;8,620',
-    '&pound;8,630',
-    '&pound;8,728',
-    '&pound;8,765',
-    '&pound;8,769',
-    '&pound;8,775',
-    '&pound;8,80',
-    '&pound;8,874',
     '&pound;8,889',
-    '&pound;8,925',
-    '&pound;8,950',
-    '&pound;8,957',
-    '&pound;8,976',
-    '&pound;8-12-6',
-    '&pound;8-17-0',
-    '&pound;8-a-pair',
-    '&pound;8.',
-    '&pound;8.00the',
-    '&pound;8.01/m',
-    '&pound;8.05',
-    '&pound;8.09',
-    '&pound;8.10/500ml',
-    '&pound;8.10s',
-    '&pound;8.12',
     '&pound;8.15/150ml',
-    '&pound;8.15/50ml',
-    '&pound;8.16',
-    '&pound;8.1million',
-    '&pound;8.23m',
-    '&pound;8.24',
-    '&pound;8.25+vat',
-    '&pound;8.34',
-    '&pound;8.36',
-    '&pound;8.36million',
-    '&pound;8.37million',
-    '&pound;8.38',
-    '&pound;8.42',
-    '&pound;8.47',
-    '&pound;8.49&ndash&pound;8.99',
-    '&pound;8.50+vat',
     '&pound;8.50/10oz',
-    '&pound;8.50/6.50',
-    '&pound;8.55',
-    '&pound;8.56',
-    '&pound;8.59',
-    '&pound;8.59&ndash&pound;8.99',
-    '&pound;8.5bn',
-    '&pound;8.62m',
-    '&pound;8.64',
-    '&pound;8.697m',
-    '&pound;8.73',
-    '&pound;8.73&ndash&pound;15.28',
-    '&pound;8.74',
-    '&pound;8.79',
-    '&pound;8.7bn',
-    '&pound;8.84',
     '&pound;8.883m',
-    '&pound;8.91m',
-    '&pound;8.95/120ml',
-    '&pound;8.95/125ml',
-    '&pound;8.95p',
-    '&pound;8.96',
-    '&pound;8.96m',
-    '&pound;8.98',
-    '&pound;8.9million',
-    '&pound;80&ndash;87m',
-    '&pound;80,000&ndash;93,300',
-    '&pound;80,000,000',
-    '&pound;80,000-&pound;100,000',
-    '&pound;80,000-&pound;120,000',
-    '&pound;80,000-per-season',
-    '&pound;80,029',
     '&pound;80,300',
-    '&pound;80,427',
-    '&pound;80,459',
-    '&pound;80,700&ndash;90,900',
-    '&pound;80-90',
-    '&pound;80-million-a-',
-    '&pound;80.15',
-    '&pound;80.4m',
-    '&pound;80.50',
-    '&pound;80.65',
-    '&pound;80.8',
-    '&pound;80.84',
-    '&pound;800&ndash;1,000',
-    '&pound;800&ndash;1,200',
-    '&pound;800&ndash;1.2m',
-    '&pound;800&ndash;900,000',
     '&pound;800-&pound;1,000',
-    '&pound;800-&pound;1,100',
-    '&pound;800-&pound;1,200',
-    '&pound;800-a',
-    '&pound;800million',
-    '&pound;801',
-    '&pound;801,000',
-    '&pound;803,088',
-    '&pound;804',
-    '&pound;805m',
-    '&pound;8063,36',
-    '&pound;807',
-    '&pound;8084',
-    '&pound;809',
-    '&pound;80m-a-year',
-    '&pound;80ma-year',
     '&pound;81,200',
-    '&pound;81,250',
-    '&pound;81,611',
-    '&pound;81.1',
-    '&pound;81.15.0d',
-    '&pound;81.20',
-    '&pound;81.69',
-    '&pound;81.6m',
-    '&pound;81.7m',
-    '&pound;81.84',
-    '&pound;81.88',
-    '&pound;81.8million',
-    '&pound;81.90',
-    '&pound;81.95',
-    '&pound;810m',
-    '&pound;811,942',
     '&pound;814',
-    '&pound;814,219',
-    '&pound;815.00',
-    '&pound;817,700',
-    '&pound;818',
-    '&pound;818,000',
-    '&pound;819,000',
-    '&pound;81k',
-    '&pound;82,000-a-year',
-    '&pound;82,600',
-    '&pound;82,612',
-    '&pound;82,680',
-    '&pound;82,750',
-    '&pound;82.0',
-    '&pound;82.00',
-    '&pound;82.02',
     '&pound;82.4',
-    '&pound;82.5',
-    '&pound;82.50',
-    '&pound;82.68',
-    '&pound;82.6m',
-    '&pound;82.89',
-    '&pound;82.95',
-    '&pound;820m',
-    '&pound;821,300',
-    '&pound;822.32',
-    '&pound;822m',
-    '&pound;823.9',
-    '&pound;8250',
-    '&pound;826.05',
-    '&pound;828,000',
-    '&pound;828,345',
     '&pound;829.83',
-    '&pound;82billion',
-    '&pound;83,330',
-    '&pound;83,604',
-    '&pound;83,812.00',
-    '&pound;83.00',
-    '&pound;83.29',
-    '&pound;83.3',
-    '&pound;83.50',
-    '&pound;83.5m',
-    '&pound;830.42',
-    '&pound;8300',
-    '&pound;830billion',
-    '&pound;831',
-    '&pound;831,000',
-    '&pound;832,500',
     '&pound;832.30',
-    '&pound;833',
-    '&pound;833,000',
-    '&pound;833.3',
-    '&pound;834.6m',
-    '&pound;834m',
-    '&pound;835,000',
-    '&pound;836,409',
-    '&pound;836million',
-    '&pound;837,000,000',
-    '&pound;837million',
-    '&pound;838.32',
-    '&pound;8390',
-    '&pound;8395',
-    '&pound;83k',
-    '&pound;84&ndash;00',
     '&pound;84+vat',
-    '&pound;84,600',
-    '&pound;84.15',
-    '&pound;84.32',
-    '&pound;84.3m',
-    '&pound;84.4m',
-    '&pound;84.75',
-    '&pound;84.7m',
-    '&pound;84.8',
-    '&pound;8405',
-    '&pound;8405&ndash&pound;9242',
-    '&pound;841',
-    '&pound;841.75',
-    '&pound;842,000',
-    '&pound;843',
-    '&pound;843,947',
     '&pound;844',
-    '&pound;844,000',
-    '&pound;845',
-    '&pound;845,000',
-    '&pound;846m',
-    '&pound;847',
-    '&pound;847million',
-    '&pound;848',
-    '&pound;848,000',
-    '&pound;849,000',
-    '&pound;849.00',
-    '&pound;849.95',
-    '&pound;849.99',
-    '&pound;84m.',
-    '&pound;84million',
-    '&pound;85&frac12;m',
     '&pound;85&ndash;115,000',
-    '&pound;85,800',
-    '&pound;85,800&ndash;126,000',
-    '&pound;85.10',
-    '&pound;85.5m',
-    '&pound;85.60',
-    '&pound;85.95',
-    '&pound;85.9m',
-    '&pound;850.',
-    '&pound;850.21',
-    '&pound;851,000',
-    '&pound;852m',
-    '&pound;855,00',
-    '&pound;856.00',
-    '&pound;857.50',
-    '&pound;857.75',
     '&pound;8570',
-    '&pound;857m',
-    '&pound;858',
-    '&pound;858m',
-    '&pound;86,154',
-    '&pound;86,192',
-    '&pound;86,375',
-    '&pound;86,400',
-    '&pound;86,950',
-    '&pound;86.2',
-    '&pound;86.3m',
-    '&pound;86.4',
-    '&pound;86.45p',
-    '&pound;86.6',
-    '&pound;8600',
-    '&pound;861,100',
     '&pound;863,013',
-    '&pound;863,350',
-    '&pound;864,700',
-    '&pound;8649',
-    '&pound;8650',
-    '&pound;866.00',
-    '&pound;867,000',
-    '&pound;867.29p',
-    '&pound;868,000',
-    '&pound;8680',
-    '&pound;8684',
-    '&pound;869,500',
-    '&pound;869.00',
-    '&pound;869.50',
-    '&pound;87,500',
-    '&pound;87,500&ndash;112,500',
     '&pound;87.2',
-    '&pound;87.4m',
-    '&pound;871',
-    '&pound;871,000',
-    '&pound;875,000',
-    '&pound;876,208',
-    '&pound;876.2',
-    '&pound;877.5million',
-    '&pound;879,026.73',
-    '&pound;879.1',
-    '&pound;87million',
-    '&pound;88,200',
-    '&pound;88,300',
-    '&pound;88,358',
-    '&pound;88,480',
-    '&pound;88,900',
     '&pound;88,950',
-    '&pound;88.14.11',
-    '&pound;88.2',
-    '&pound;88.2m',
-    '&pound;88.50',
-    '&pound;88.5m',
-    '&pound;88.68',
-    '&pound;88.7million',
-    '&pound;88.86',
-    '&pound;880m',
-    '&pound;881',
-    '&pound;881,000',
-    '&pound;881.16s.6d',
-    '&pound;882',
-    '&pound;883',
-    '&pound;885',
     '&pound;885,000',
-    '&pound;886',
-    '&pound;888.86',
-    '&pound;889',
-    '&pound;89,00',
-    '&pound;89,285',
-    '&pound;89.60',
-    '&pound;89.67',
-    '&pound;89.80',
-    '&pound;89.95+vat',
-    '&pound;890,000',
-    '&pound;891',
-    '&pound;892,000',
-    '&pound;893',
-    '&pound;894',
-    '&pound;895,000',
     '&pound;895.00',
-    '&pound;896,000',
-    '&pound;897',
-    '&pound;8970',
-    '&pound;898.56',
-    '&pound;898.98',
-    '&pound;899.',
-    '&pound;899.00',
-    '&pound;899.90',
-    '&pound;8:10:0',
-    '&pound;8l.4million',
-    '&pound;8m.',
-    '&pound;8oo',
-    '&pound;9&frac12;m.',
-    '&pound;9*',
-    '&pound;9,000&ndash;12,000',
     '&pound;9,000-&pound;2,000',
-    '&pound;9,000-a-year',
-    '&pound;9,000-worth',
-    '&pound;9,005',
-    '&pound;9,015',
-    '&pound;9,029.50',
-    '&pound;9,035.11s.0d.',
-    '&pound;9,147',
-    '&pound;9,150-a-year',
-    '&pound;9,160',
-    '&pound;9,170',
-    '&pound;9,175',
-    '&pound;9,180',
-    '&pound;9,180-worth',
-    '&pound;9,201',
-    '&pound;9,205',
     '&pound;9,215',
-    '&pound;9,230',
-    '&pound;9,234,276',
-    '&pound;9,239',
-    '&pound;9,239,000',
-    '&pound;9,300',
-    '&pound;9,350',
-    '&pound;9,354',
-    '&pound;9,356',
-    '&pound;9,360',
-    '&pound;9,375&ndash;12,500',
-    '&pound;9,399.',
-    '&pound;9,420',
-    '&pound;9,481',
-    '&pound;9,500-&pound;11,000',
-    '&pound;9,533',
     '&pound;9,600',
-    '&pound;9,625',
-    '&pound;9,700,000',
-    '&pound;9,712',
-    '&pound;9,801',
-    '&pound;9,807.17s.9d',
-    '&pound;9,816&ndash&pound;15,372',
-    '&pound;9,857',
-    '&pound;9,863',
-    '&pound;9,907&ndash&pound;13,262+',
-    '&pound;9,946.80',
-    '&pound;9,954',
-    '&pound;9,954&ndash&pound;12,438',
-    '&pound;9,956',
-    '&pound;9,970',
-    '&pound;9,977',
     '&pound;9,99',
-    '&pound;9-13',
-    '&pound;9.013',
-    '&pound;9.015',
-    '&pound;9.05',
-    '&pound;9.06m',
-    '&pound;9.08m',
-    '&pound;9.11m',
-    '&pound;9.14',
-    '&pound;9.14.6.',
-    '&pound;9.15',
-    '&pound;9.17',
-    '&pound;9.19',
-    '&pound;9.21m',
-    '&pound;9.26',
-    '&pound;9.28m',
     '&pound;9.3',
-    '&pound;9.33',
-    '&pound;9.33p',
-    '&pound;9.35',
-    '&pound;9.38',
-    '&pound;9.40',
-    '&pound;9.43',
-    '&pound;9.45m',
-    '&pound;9.4million',
-    '&pound;9.51',
-    '&pound;9.52',
-    '&pound;9.54m',
-    '&pound;9.55',
-    '&pound;9.57',
-    '&pound;9.59',
-    '&pound;9.59m',
     '&pound;9.64',
-    '&pound;9.64m',
-    '&pound;9.65p',
-    '&pound;9.71',
-    '&pound;9.75/150ml',
-    '&pound;9.79',
-    '&pound;9.79m',
-    '&pound;9.7m',
-    '&pound;9.803m',
-    '&pound;9.84',
-    '&pound;9.95.',
-    '&pound;9.99/4oz',
-    '&pound;9.9shillings',
-    '&pound;90,000&ndash;120,000',
-    '&pound;90,000,000',
-    '&pound;90,000-plus',
     '&pound;90-fine',
-    '&pound;90.5',
-    '&pound;90.50',
-    '&pound;90.91',
-    '&pound;900&ndash&pound;1,000',
-    '&pound;900&ndash&pound;19,000/week',
-    '&pound;900,000&ndash;1.2',
-    '&pound;900.3m',
-    '&pound;900million',
-    '&pound;9029.50',
-    '&pound;905.00',
-    '&pound;905.94',
-    '&pound;906,000',
-    '&pound;906.',
-    '&pound;9060',
-    '&pound;907',
     '&pound;908',
-    '&pound;909',
-    '&pound;909,000',
-    '&pound;90m-plus',
-    '&pound;91,500',
-    '&pound;91,660',
-    '&pound;91,700&ndash;128,000',
-    '&pound;91,900',
-    '&pound;91.16',
-    '&pound;91.3m',
-    '&pound;91.49',
-    '&pound;91.5m',
-    '&pound;91.9m',
-    '&pound;910',
-    '&pound;910m',
-    '&pound;911,608',
     '&pound;912',
-    '&pound;913,280',
-    '&pound;914,000',
-    '&pound;915m',
-    '&pound;917m',
-    '&pound;918m',
-    '&pound;919.65',
-    '&pound;919.9m',
-    '&pound;91million',
-    '&pound;92,464',
-    '&pound;92,900&ndash;113,500',
-    '&pound;92,950',
-    '&pound;92.00',
-    '&pound;92.3m',
-    '&pound;92.5',
-    '&pound;92.50',
     '&pound;92.6m',
-    '&pound;92.7',
-    '&pound;92.95',
-    '&pound;921,919',
-    '&pound;922m',
-    '&pound;923,000',
-    '&pound;923.57',
-    '&pound;926',
-    '&pound;927,500',
-    '&pound;9299',
-    '&pound;929m',
-    '&pound;92million',
-    '&pound;93,224',
-    '&pound;93,282',
-    '&pound;93,750&ndash;156,250',
-    '&pound;93,800',
     '&pound;93,859',
-    '&pound;93.0',
-    '&pound;93.00',
-    '&pound;93.1',
-    '&pound;93.2',
-    '&pound;93.20',
-    '&pound;93.3',
-    '&pound;93.40',
-    '&pound;93.7m',
-    '&pound;93/kilowatt/',
-    '&pound;93/kw/year',
-    '&pound;93/tonne',
-    '&pound;932',
-    '&pound;932,000',
-    '&pound;932m',
-    '&pound;933',
     '&pound;934.8m',
-    '&pound;936',
-    '&pound;937,000',
-    '&pound;937,500',
-    '&pound;9370',
-    '&pound;939',
-    '&pound;94,000',
-    '&pound;94,445',
-    '&pound;94.00',
-    '&pound;94.10',
-    '&pound;94.46m',
-    '&pound;94.47',
-    '&pound;94.4m',
-    '&pound;94.6',
-    '&pound;94.7m',
-    '&pound;940,403',
     '&pound;9400',
-    '&pound;942.1m',
-    '&pound;943',
-    '&pound;943,000',
-    '&pound;944,400',
-    '&pound;9442m',
-    '&pound;945m',
-    '&pound;946,000',
-    '&pound;947.8m',
-    '&pound;949,875',
-    '&pound;949.00',
-    '&pound;949.95',
-    '&pound;949m',
-    '&pound;94m.',
-    '&pound;94million',
-    '&pound;95,240&ndash;119,000',
     '&pound;95,776',
-    '&pound;95,810',
-    '&pound;95-&pound;150',
-    '&pound;95.28',
-    '&pound;95.50',
-    '&pound;95.7m',
-    '&pound;95.8m',
-    '&pound;950.',
-    '&pound;951,027',
-    '&pound;951.47',
-    '&pound;952,200',
-    '&pound;952.4',
-    '&pound;952m',
-    '&pound;954,000',
-    '&pound;955',
-    '&pound;955m',
     '&pound;956,000',
-    '&pound;956.71p',
-    '&pound;957',
-    '&pound;958',
-    '&pound;958,400',
-    '&pound;95million',
-    '&pound;96,000,000',
-    '&pound;96,144',
-    '&pound;96,500',
-    '&pound;96,678',
-    '&pound;96.1',
-    '&pound;96.15',
-    '&pound;96.4',
-    '&pound;96.50',
-    '&pound;96.55',
-    '&pound;96.5million',
     '&pound;960.2million',
-    '&pound;960m',
-    '&pound;961,000',
-    '&pound;963',
-    '&pound;963000',
-    '&pound;964.51',
-    '&pound;966',
-    '&pound;966,000',
-    '&pound;967m',
-    '&pound;968,000',
-    '&pound;97,070',
-    '&pound;97,500&ndash;122,000',
-    '&pound;97.30',
-    '&pound;97.5million',
-    '&pound;97.70',
-    '&pound;97.98',
     '&pound;970,000',
-    '&pound;9700m',
-    '&pound;970m',
-    '&pound;9710',
-    '&pound;972',
-    '&pound;9725',
-    '&pound;974',
-    '&pound;975,000',
-    '&pound;975m',
-    '&pound;976,000&ndash;1,220,000',
-    '&pound;976,800',
-    '&pound;977m',
-    '&pound;979m',
-    '&pound;98,000&ndash;163,000',
-    '&pound;98.0',
-    '&pound;98.00',
     '&pound;98.40',
-    '&pound;98.5',
-    '&pound;98.7m',
-    '&pound;98.85',
-    '&pound;98.8m',
-    '&pound;980,400',
-    '&pound;980m',
-    '&pound;981',
-    '&pound;982,000',
-    '&pound;985,000',
-    '&pound;986',
-    '&pound;987',
-    '&pound;987m',
-    '&pound;989',
-    '&pound;989,000',
-    '&pound;989.11',
     '&pound;989.46',
-    '&pound;98million',
-    '&pound;99,000',
-    '&pound;99,500&ndash;121,600',
-    '&pound;99,840',
-    '&pound;99.1m',
-    '&pound;99.35',
-    '&pound;99.5',
-    '&pound;99.90',
-    '&pound;99.95+vat',
-    '&pound;990,000',
-    '&pound;991,000',
-    '&pound;995.95',
-    '&pound;996,400',
-    '&pound;996m',
-    '&pound;997m',
     '&pound;998,000',
-    '&pound;999,999',
-    '&pound;9995',
-    '&pound;99pp',
-    '&pound;9oo',
-    '&pound;9th',
-    '&pound;as',
-    '&pound;barry',
-    '&pound;billions',
-    '&pound;concessionary',
-    '&pound;e',
-    '&pound;earnings',
-    '&pound;f',
-    '&pound;gg',
-    '&pound;h',
-    '&pound;hit-squad',
     '&pound;i.5',
-    '&pound;i30',
-    '&pound;i7.10&amp;shilling',
-    '&pound;ir&pound;6.7m',
-    '&pound;k',
-    '&pound;l.00',
-    '&pound;l.05',
-    '&pound;l.68',
-    '&pound;l.84m',
-    '&pound;l0,000',
-    '&pound;l00,000',
-    '&pound;l00m',
-    '&pound;l0m',
-    '&pound;l20',
-    '&pound;l25',
-    '&pound;l2m',
     '&pound;l4',
-    '&pound;l44',
-    '&pound;l4m',
-    '&pound;l65',
-    '&pound;l6m',
-    '&pound;l7',
-    '&pound;ll.29',
-    '&pound;m3',
-    '&pound;n/&pound;r',
-    '&pound;o',
-    '&pound;o.6',
-    '&pound;p/',
-    '&pound;p2,000',
-    '&pound;poa',
-    '&pound;pound1,100',
-    '&pound;pound1,500',
     '&pound;pound1,600',
-    '&pound;pound100',
-    '&pound;pound12.10s',
-    '&pound;pound150',
-    '&pound;pound16',
-    '&pound;pound18',
-    '&pound;pound2,243',
-    '&pound;pound2.10s',
-    '&pound;pound20',
-    '&pound;pound2500',
-    '&pound;pound32,000',
-    '&pound;pound394',
-    '&pound;pound4',
-    '&pound;pound4,596',
-    '&pound;pound4,930',
-    '&pound;pound4.15s',
     '&pound;pound500',
-    '&pound;pound6,202',
-    '&pound;pound6.10s',
-    '&pound;pound650',
-    '&pound;pound72,356',
-    '&pound;pound8.10s',
-    '&pound;pound800',
-    '&pound;pound9',
-    '&pound;pound9,000',
-    '&pound;pound94,000',
-    '&pound;poundl',
-    '&pound;rain',
-    '&pound;s1,000',
-    '&pound;s15,400',
-    '&pound;s16,100',
-    '&pound;s24,300',
     '&pound;s300',
-    '&pound;s37,575',
-    '&pound;s4,875',
-    '&pound;s61,875',
-    '&pound;s7,700',
-    '&pound;s84,690',
-    '&pound;syr10,430',
-    '&pound;syr61,875',
-    '&pound;there',
-    '&pound;w',
-    '&pound;x.99',
-    '&pound;xxxmillion',
-    '&prime=r&prime;f&prime',
-    '&psgr;40-synthesis',
-    '&psgr;defined',
-    '&psgr;f',
     '&psgr;i',
-    '&radic',
-    '&radic;2',
-    '&radic;3:2',
-    '&rarr;0',
-    '&rarr;bdr',
-    '&rarr;ch',
-    '&rarr;cu',
-    '&rarr;d',
-    '&rarr;drb',
-    '&rarr;fu',
-    '&rarr;fur',
-    '&rarr;head',
-    '&rarr;rfu',
-    '&rarr;ubr',
-    '&rarr;ufl',
     '&rarr;ulb',
-    '&rarr;urf',
-    '&rarr;x&rarr;o',
-    '&rarr;yeah',
-    '&rcaron&iacute;zky',
-    '&rcaron;et&ecaron;zov&aacute',
-    '&rehy;1783&ndash;1809',
-    '&rehy;additions',
-    '&rehy;between',
-    '&rehy;bibliographies',
-    '&rehy;centuries',
-    '&rehy;collective',
-    '&rehy;french',
-    '&rehy;his',
-    '&rehy;investment',
-    '&rehy;is',
     '&rehy;k',
-    '&rehy;like',
-    '&rehy;loss',
-    '&rehy;mates',
-    '&rehy;mean',
-    '&rehy;not',
-    '&rehy;populated',
-    '&rehy;requires',
-    '&rehy;some',
-    '&rehy;their',
-    '&rehy;this',
-    '&rehy;would',
-    '&rgr;c',
-    '&rgr_',
-    '&sacute;a&nacute;4kar',
-    '&sacute;ankara',
     '&sacute;iva',
-    '&sacute;lub',
-    '&sacute;mig&lstrok;y-rydz',
-    '&sacute;wibno',
-    '&scaron;aloun',
-    '&scaron;i&scaron;atovac',
-    '&scaron;i&scaron;ko',
-    '&scaron;im&aacute;k',
-    '&scaron;iptar',
-    '&scaron;kriljna',
-    '&scaron;kvoreck&yacute',
-    '&scaron;lik',
-    '&scaron;p&iacute;z',
-    '&scaron;pa&ccaron;ek',
-    '&scaron;tenc',
-    '&scaron;tokavski',
     '&scaron;torch',
-    '&scaron;tupartsk&aacute',
-    '&scaron;tursa',
-    '&scaron;vanda',
-    '&scaron;vankmajer',
-    '&scaron;vec',
-    '&scaron;vestkov&yacute',
-    '&scedil;eriat',
-    '&sect;.2',
-    '&sect;1.1',
-    '&sect;1.18',
-    '&sect;1.21',
-    '&sect;2.10.2',
-    '&sect;247',
-    '&sect;256',
-    '&sect;257',
     '&sect;273',
-    '&sect;276',
-    '&sect;277',
-    '&sect;280',
-    '&sect;283',
-    '&sect;286',
-    '&sect;5',
-    '&sect;568',
-    '&sect;591',
-    '&sect;594',
-    '&sect;888',
-    '&sect;935',
-    '&sect;s',
-    '&sgr;-character',
-    '&sgr;-component',
-    '&sgr;h',
     '&sgr;sub',
-    '&sgr_',
-    '&sharp;4',
-    '&sharp;4th',
-    '&sharp;5&ndash;10',
-    '&sharp;500',
-    '&sharp;5th',
-    '&shilling',
-    '&sim;0.2',
-    '&sim;1',
-    '&sim;100hz',
-    '&sim;10khz',
-    '&sim;1mg',
-    '&sim;1ng/ml',
-    '&sim;2%',
-    '&sim;2.5',
     '&sim;20mg',
-    '&sim;30',
-    '&sim;330',
-    '&sim;4%',
-    '&sim;400',
-    '&sim;5',
-    '&sim;5&micro;ci',
-    '&sim;5-fold',
-    '&sim;50',
-    '&sim;6',
-    '&sim;70%',
-    '&sim;zero',
-    '&sup1',
-    '&tcedil;uica',
-    '&tgr;.',
-    '&thgr&deg',
     '&thgr:1',
-    '&thgr=&pgr/2',
-    '&thgr=-&pgr/2',
-    '&thorn&aacute;ttr',
-    '&thorn&aelig;ttir',
-    '&thorn;&aelig;c',
-    '&thorn;eccean',
-    '&tilde;s',
-    '&times&dollar;2.50',
-    '&times;110',
-    '&times;12.50',
-    '&times;125.',
-    '&times;140',
-    '&times;142',
-    '&times;150',
-    '&times;15000',
     '&times;165',
-    '&times;17',
-    '&times;1ft',
-    '&times;225',
-    '&times;24',
-    '&times;250',
-    '&times;262',
-    '&times;27',
-    '&times;28',
-    '&times;3',
-    '&times;32',
-    '&times;33',
-    '&times;34',
-    '&times;35',
-    '&times;36',
-    '&times;37',
     '&times;47',
-    '&times;5&ins',
-    '&times;50',
-    '&times;57',
-    '&times;60',
-    '&times;65',
-    '&times;7.5',
-    '&times;85',
-    '&times;91',
-    '&times;94',
-    '&times;gf',
-    '&times;kg',
-    '&times;molal',
-    '&times;price',
-    '&uacute;jezd',
-    '&umacr;p',
     '&uml',
-    '&uuml;berlingen',
-    '&uuml;bermensch',
-    '&uuml;bersiedler',
-    '&uuml;berwachungs',
-    '&uuml;lemnoukogu',
-    '&verbar&lt&gt;top*&amp&amp&lt&gt;conf*&verbar',
-    '&verbar&verbar;dxe5&verbar&verbar',
-    '&verbar&verbar;fxe6&verbar&verbar',
-    '&verbar&verbar;qc8&verbar&verbar;21',
-    '&verbar;a',
-    '&verbar;c',
-    '&verbar;directory&verbar',
-    '&verbar;e&verbar',
-    '&verbar;guess',
-    '&verbar;hush',
     '&verbar;juice',
-    '&verbar;keegan',
-    '&verbar;kirkpatrick',
-    '&verbar;management',
-    '&verbar;mary',
-    '&verbar;menuhin',
-    '&verbar;mountain',
-    '&verbar;once',
-    '&verbar;r&verbar',
-    '&verbar;sir',
-    '&verbar;the',
-    '&verbar;x',
-    '&verbar;y&verbar',
-    '&yen/dm',
-    '&yen;1,600',
-    '&yen;1.7',
     '&yen;1.76',
-    '&yen;1.8',
-    '&yen;10',
-    '&yen;10,000',
-    '&yen;105',
-    '&yen;109',
-    '&yen;109.2',
-    '&yen;110.4',
-    '&yen;116',
-    '&yen;12',
-    '&yen;120',
-    '&yen;13',
-    '&yen;130.8',
-    '&yen;132',
-    '&yen;138',
-    '&yen;142',
     '&yen;150,000',
-    '&yen;16.2',
-    '&yen;192',
-    '&yen;2,000',
-    '&yen;2.1',
-    '&yen;2.5',
-    '&yen;2.6',
-    '&yen;2.8',
-    '&yen;20.9',
-    '&yen;203',
-    '&yen;206',
-    '&yen;20m',
-    '&yen;23.9',
-    '&yen;25',
-    '&yen;25&ndash;30',
-    '&yen;250m',
     '&yen;256',
-    '&yen;263',
-    '&yen;27',
-    '&yen;3',
-    '&yen;30',
-    '&yen;30.5',
-    '&yen;300',
-    '&yen;30m',
-    '&yen;31',
-    '&yen;317',
-    '&yen;33.4m',
-    '&yen;360',
-    '&yen;38',
-    '&yen;4,000',
-    '&yen;4,200',
-    '&yen;43',
     '&yen;44',
-    '&yen;44.6',
-    '&yen;45',
-    '&yen;5,000',
-    '&yen;500',
-    '&yen;570',
-    '&yen;6,400',
-    '&yen;6.7',
-    '&yen;64',
-    '&yen;642',
-    '&yen;675m',
-    '&yen;7.3',
-    '&yen;7.5m',
-    '&yen;70.3',
-    '&yen;8',
-    '&yen;843',
     '&yen;850',
-    '&yen;855',
-    '&yen;88.6',
-    '&yen;885',
-    '&yen;930',
-    '&yen;931',
-    '&yen;964.2',
-    '&zcaron;ampi&oacute;ny',
-    '&zcaron;elezn&aacute',
-    '&zcaron;i&ccaron;a',
-    '&zcaron;i&zcaron;kov',
-    '&zcaron;ivi',
-    '&zcaron;ivio',
-    '&zcaron;loutkovou',
-    '&zcaron;upanates',
-    '&zgr*',
     '\'\'ah',
-    '\'\'whizz',
-    '\'\'yes',
-    '\'-',
-    '\'-she',
-    '\'1',
-    '\'14&ndash\'18',
-    '\'16',
-    '\'190',
-    '\'1992\'',
-    '\'20/20',
-    '\'20s-style',
-    '\'28',
-    '\'32',
-    '\'33',
-    '\'34.95',
     '\'35',
-    '\'37',
-    '\'39',
-    '\'40',
-    '\'40s-style',
-    '\'41',
-    '\'42',
-    '\'49',
-    '\'50\'s',
-    '\'50s-style',
-    '\'50s/biker',
-    '\'50s/early',
-    '\'53&ndash\'61',
-    '\'54',
-    '\'558',
-    '\'57',
     '\'60\'s',
-    '\'683',
-    '\'69&ndash\'70',
-    '\'69/early',
-    '\'70&ndash\'71',
-    '\'70/\'71',
-    '\'70s-influenced',
-    '\'70s-ism',
-    '\'70s/i',
-    '\'71/early',
-    '\'72&ndash\'73',
-    '\'73&ndash\'74',
-    '\'75',
-    '\'78/79',
-    '\'78s',
-    '\'80\'s',
     '\'81/\'92',
-    '\'82s',
-    '\'86&dash;7',
-    '\'88/\'89',
-    '\'89&ndash\'90',
-    '\'9',
-    '\'90a',
-    '\'90ss',
-    '\'91&ndash\'92',
-    '\'9o',
-    '\'9os',
-    '\'=-0.20',
-    '\'=-0.23',
-    '\'=-0.24',
-    '\'=-152.2',
-    '\'=0.36',
     '\'=0.39',
-    '\'=0.44',
-    '\'=0.48',
-    '\'=0.50',
-    '\'=0.51',
-    '\'=0.54',
-    '\'=1131',
-    '\'a\'-level',
-    '\'aah',
-    '\'aber',
-    '\'access',
-    '\'accidents',
-    '\'acts',
-    '\'ae',
-    '\'after',
-    '\'aggression\'',
     '\'ah',
-    '\'ahd',
-    '\'ahrrys',
-    '\'ai',
-    '\'alf-past',
-    '\'all\'',
-    '\'alliance',
-    '\'alliance\'',
-    '\'almost',
-    '\'alternative',
-    '\'am\'',
-    '\'am.',
-    '\'ambrogio',
-    '\'ammers',
-    '\'among',
-    '\'ampstead',
     '\'ampton',
-    '\'amusez-vous',
-    '\'andbasin',
-    '\'andicap',
-    '\'andin\'',
-    '\'andiwork',
-    '\'andlin\'',
-    '\'andsomes',
-    '\'andy',
-    '\'andyman',
-    '\'angelina',
-    '\'angs',
-    '\'anky&rehy;panky',
-    '\'ansome',
-    '\'apennies',
-    '\'appenin\'',
     '\'appening',
-    '\'appier',
-    '\'appiness',
-    '\'arad',
-    '\'arassed',
-    '\'ard-\'earted',
-    '\'ard-earned',
-    '\'ard.',
-    '\'ardest',
-    '\'ardship',
-    '\'are-brained',
-    '\'argues',
-    '\'ark',
-    '\'armonic',
-    '\'artley',
-    '\'ated',
     '\'ations',
-    '\'attempting',
-    '\'attitude',
-    '\'author\'s',
-    '\'autumn\'',
-    '\'av',
-    '\'ave-a-go',
-    '\'aven\'',
-    '\'aw',
-    '\'awk',
-    '\'awke',
-    '\'b',
-    '\'back\'',
-    '\'badinage\'',
-    '\'band\'',
-    '\'bandy\'',
     '\'basic',
-    '\'be',
-    '\'because',
-    '\'before\'',
-    '\'belemnites',
-    '\'ben.',
-    '\'best\'',
-    '\'bible\'',
-    '\'biding',
-    '\'billykins',
-    '\'black',
-    '\'bloody',
-    '\'blown',
-    '\'blue\'',
-    '\'bonus',
-    '\'boot',
     '\'both',
-    '\'boxes',
-    '\'boys',
-    '\'breaking',
-    '\'bright',
-    '\'britain',
-    '\'burnt',
-    '\'bury',
-    '\'buses',
-    '\'by-eeee',
-    '\'ca',
-    '\'call',
-    '\'called\'',
-    '\'cane',
-    '\'canonists',
-    '\'capture\'',
     '\'cash',
-    '\'casion',
-    '\'centre',
-    '\'cepting',
-    '\'chagall.',
-    '\'champion',
-    '\'change',
-    '\'chaser',
-    '\'cheerfulness',
-    '\'children',
-    '\'chimneys',
-    '\'chutes',
-    '\'cigarette\'',
-    '\'civil',
-    '\'clip',
-    '\'close',
     '\'coke\'',
-    '\'cold',
-    '\'collective',
-    '\'colonialism\'',
-    '\'coming',
-    '\'communists',
-    '\'conclusive',
-    '\'consents',
-    '\'consider',
-    '\'conspiracy\'',
-    '\'continuous',
-    '\'continuum\'',
-    '\'contractual\'',
-    '\'copter',
-    '\'corse',
-    '\'countering',
     '\'crack',
-    '\'crap',
-    '\'creating',
-    '\'creted',
-    '\'crosscourse\'',
-    '\'cycle',
-    '\'daddy',
-    '\'daily',
-    '\'damnation\'',
-    '\'darling',
-    '\'darling\'',
-    '\'daz\'',
-    '\'debates',
-    '\'decreolisation\'',
-    '\'deep',
-    '\'dein-dividualisation\'',
     '\'deserter',
-    '\'destinations',
-    '\'dialogue',
-    '\'die',
-    '\'different',
-    '\'doesn',
-    '\'doh',
-    '\'don\'t.',
-    '\'door\'',
-    '\'down',
-    '\'dr',
-    '\'dupe\'',
-    '\'dupes',
-    '\'e\'',
-    '\'each',
-    '\'eadquarters',
     '\'ealth',
-    '\'ealthy',
-    '\'earse',
-    '\'eart-broken',
-    '\'eart-warmin\'',
-    '\'eart-warming',
-    '\'eartaches',
-    '\'earty',
-    '\'east',
-    '\'eating',
-    '\'eats',
-    '\'eavenly',
-    '\'eavier',
-    '\'eaving',
-    '\'ed',
-    '\'edward',
     '\'eeza',
-    '\'ef',
-    '\'ego',
-    '\'egotism',
-    '\'eight',
-    '\'eighteen',
-    '\'eighty-four',
-    '\'eighty-three',
-    '\'either',
-    '\'elpful',
-    '\'em_in_touch',
-    '\'emancipation',
-    '\'ems',
-    '\'emselves',
-    '\'encyclopedic',
-    '\'enjoyed',
     '\'enry',
-    '\'entity\'',
-    '\'epic',
-    '\'er.',
-    '\'erd',
-    '\'ernie',
-    '\'eroes',
-    '\'eroic',
-    '\'eroine',
-    '\'escape',
-    '\'essay\'',
-    '\'etic',
-    '\'europ',
-    '\'evenin\'',
-    '\'ever',
-    '\'everyfing',
     '\'ex',
-    '\'examine\'',
-    '\'except',
-    '\'existing',
-    '\'exit\'',
-    '\'explain',
-    '\'express',
-    '\'face-to-face',
-    '\'factory',
-    '\'failure',
-    '\'faith\'',
-    '\'fana',
-    '\'fart',
-    '\'favonius',
-    '\'fear',
-    '\'femininity\'',
     '\'femme\'',
-    '\'fingerprint\'',
-    '\'fish',
-    '\'five',
-    '\'following',
-    '\'footfall\'',
-    '\'forties',
-    '\'forty-five',
-    '\'forty-four',
-    '\'four',
-    '\'frank',
-    '\'fridge',
-    '\'fro',
-    '\'frye',
-    '\'fuck\'',
-    '\'g',
     '\'gardens',
-    '\'gays',
-    '\'generation\'',
-    '\'genuine\'',
-    '\'giant',
-    '\'give',
-    '\'given',
-    '\'global',
-    '\'go',
-    '\'golf',
-    '\'goodnight',
-    '\'got',
-    '\'grant\'',
-    '\'green',
-    '\'greenhouse\'',
-    '\'grief\'',
     '\'hail\'',
-    '\'hairs',
-    '\'halfpenny\'',
-    '\'hallow\'',
-    '\'hands',
-    '\'hang',
-    '\'hard',
-    '\'hard\'',
-    '\'hargazy',
-    '\'hark',
-    '\'hate\'',
-    '\'heavy',
-    '\'heavy\'',
-    '\'held\'',
-    '\'hen',
-    '\'hence\'',
     '\'herceg\'',
-    '\'hey',
-    '\'highest\'',
-    '\'hinds',
-    '\'hire',
-    '\'his',
-    '\'hole',
-    '\'home\'',
-    '\'homicide',
-    '\'hood',
-    '\'hoppers',
-    '\'hospital',
-    '\'hostel\'',
-    '\'hours',
-    '\'housekeeping\'',
-    '\'housework\'',
     '\'housing',
-    '\'hure',
-    '\'igh-falutin\'',
-    '\'ighest',
-    '\'illiberal',
-    '\'import',
-    '\'in-depth\'',
-    '\'including',
-    '\'indecency',
-    '\'indecent\'',
-    '\'independents',
-    '\'influencing',
-    '\'information',
-    '\'informative\'',
-    '\'inges',
-    '\'insisted',
     '\'intentions',
-    '\'international',
-    '\'intifada',
-    '\'ippidy\'oys.',
-    '\'issue\'',
-    '\'item\'',
-    '\'its',
-    '\'j',
-    '\'j\'',
-    '\'jacki\'',
-    '\'jackson-style\'',
-    '\'jama',
-    '\'janet',
-    '\'jc\'',
-    '\'jed',
-    '\'jenkins',
     '\'jesus',
-    '\'jizz\'',
-    '\'john',
-    '\'k&eacute;pi',
-    '\'katie',
-    '\'kay',
-    '\'keepers',
-    '\'keeping',
-    '\'kept',
-    '\'kingdom',
-    '\'kinship',
-    '\'l\'',
-    '\'ladies',
-    '\'lat\'n',
-    '\'lay',
-    '\'le',
     '\'leaking\'',
-    '\'leccy',
-    '\'lectrical',
-    '\'leila',
-    '\'les',
-    '\'lific',
-    '\'lightly',
-    '\'likely',
-    '\'linford',
-    '\'ll_even',
-    '\'llo',
-    '\'load',
-    '\'london',
-    '\'longside',
-    '\'longstanding',
-    '\'loody\'ell',
     '\'looking',
-    '\'lost',
-    '\'lowance',
-    '\'lower',
-    '\'m_at',
-    '\'m_no',
-    '\'mabel',
-    '\'magic',
-    '\'man',
-    '\'margaret',
-    '\'mariana',
-    '\'matoes',
-    '\'mazing',
-    '\'means',
-    '\'meg',
-    '\'men',
     '\'mention\'',
-    '\'message\'',
-    '\'mind',
-    '\'mini-groups',
-    '\'minuet\'',
-    '\'minus',
-    '\'miss',
-    '\'mlaen',
-    '\'mmmmmnnff',
-    '\'moderately\'',
-    '\'mongst',
-    '\'more',
-    '\'morning',
-    '\'mother\'',
-    '\'move',
-    '\'mozambique',
     '\'muffin',
-    '\'mummy',
-    '\'nana',
-    '\'nasty\'',
-    '\'navvies',
-    '\'need',
-    '\'negative\'',
-    '\'never',
-    '\'newer',
-    '\'news',
-    '\'nigs',
-    '\'nineties',
-    '\'nit',
-    '\'no.6\'',
-    '\'non-genuine\'',
-    '\'non-marketable',
     '\'normal\'',
-    '\'nos',
-    '\'notes',
-    '\'november',
-    '\'oak',
-    '\'obbs',
-    '\'obligatory',
-    '\'off-task\'',
-    '\'often\'',
-    '\'ok',
-    '\'ok\'',
-    '\'ol',
-    '\'oles',
-    '\'ologies',
-    '\'oly',
-    '\'ome-made',
     '\'ome.',
-    '\'one',
-    '\'one-offs',
-    '\'onest',
-    '\'oneymoon',
-    '\'only',
-    '\'ookey',
-    '\'ooligans',
-    '\'oomin',
-    '\'oover',
-    '\'oovered',
-    '\'oovering',
-    '\'opeless',
-    '\'orace',
-    '\'ordinary\'',
-    '\'orrors',
     '\'orse-an\'-cart',
-    '\'ospital.',
-    '\'ospitals',
-    '\'our\'',
-    '\'ousekeeping',
-    '\'overcome',
-    '\'overtrousers',
-    '\'pain\'',
-    '\'paradigm\'',
-    '\'pardon',
-    '\'part',
-    '\'partitioned',
-    '\'paul\'/squatters',
-    '\'pawnbroker',
-    '\'pdg\'',
-    '\'people',
     '\'peoplemeters',
-    '\'phyllosilicates',
-    '\'pictures',
-    '\'piece',
-    '\'places',
-    '\'planet',
-    '\'plastics',
-    '\'playing',
-    '\'pon',
-    '\'pooh',
-    '\'poor',
-    '\'possums',
-    '\'powah\'',
-    '\'powah\'&lt+&gt',
-    '\'power\'',
-    '\'pre-industrial',
     '\'pre-testing\'',
-    '\'preference',
-    '\'prelims',
-    '\'present',
-    '\'prime\'',
-    '\'prinny',
-    '\'prithie',
-    '\'private',
-    '\'privatisation\'',
-    '\'probably',
-    '\'proceed',
-    '\'profits',
-    '\'propelling\'',
-    '\'provisional\'',
-    '\'psychiatrists',
-    '\'psychological',
     '\'put',
-    '\'quack\'',
-    '\'queers',
-    '\'queers.',
-    '\'quick',
-    '\'quins',
-    '\'quotation',
-    '\'raider',
-    '\'rank\'',
-    '\'raoul',
-    '\'rat-running\'',
-    '\'re_a',
-    '\'re_a_little',
-    '\'re_sort',
-    '\'re_up',
-    '\'real',
     '\'really',
-    '\'reciprocal',
-    '\'recycling',
-    '\'referring',
-    '\'relative',
-    '\'renaissance\'',
-    '\'repeat',
-    '\'request',
-    '\'research',
-    '\'reserve',
-    '\'reswitching',
-    '\'revolution',
-    '\'rived',
-    '\'rob\'/producer',
-    '\'round',
-    '\'royal',
     '\'ruffles',
-    '\'runcie',
-    '\'s\'',
-    '\'s\'all',
-    '\'s\'much',
-    '\'s-hertogenbosch',
-    '\'s69',
-    '\'s_a_er',
-    '\'s_an',
-    '\'s_as',
-    '\'s_at',
-    '\'s_away',
-    '\'s_because',
-    '\'s_due',
-    '\'s_ever',
-    '\'s_getting_on',
     '\'s_grown',
-    '\'s_in',
-    '\'s_in_response',
-    '\'s_just',
-    '\'s_no',
-    '\'s_old',
+)
+
+blocks_99 = (
+    '*!9*"m.)%1,750*&.20/ha+"87*"9m)%2,000..&ndash;183,000+#220,"64,"88+#800+#925*#.00+!2',
+    '+"3m-&illion+!4+!5+"64+#97p*!1*$8.46)%3,000+#404+#644+#700+#824+#989*#.25',
+    ',!8+"7m*!m)%4,320+#900*#.13+"4m+$684m+"86+"9m*$3.72)15&ndash&pound;2008"108"40*$,632',
+    '+#750+#903,"40*#.00+"30+"48+"70*$0.00+"00*"bn*\'million)%6,000+#368+#667*!.',
+    '*!2*$9.00)%7,500+#800+#900,"17*#.04+"3m+"40+"65+"7m*!m)38,000&ndash;146,000,"81+#301',
+    '*".4+(5million+"70+!8+"9m)%9,642*#.33,!6,!m+"41,!m+"80+"96*!0+"0m',
+    ')(m-a-year*%ilion*!n)\'p/m.sq.(03&ndash&pound;14)7,000&ndash&pound;20,000;%2,000+"46*#168+"90,!2*$240m,"2m+"75*#300',
+    '+&26,000+#40m,!9*#520*#650+&81,818+"90*#740+"50+"82*#800+"55+"75,!6+590&ndash&pound;15,010',
+    ',!8+"60+"88+"95)*-&pound;16)!.*"03+#69m+!7*"10+!4+"9m+"bn*(25/100ml.$25ml',
+    '+!8+"bn+$s.6d*"36+!7+!m*"40+!8+\'billion*$50/m+!9+"bn*#62p+!5*"78',
+    '+\'5/125ml+!8+"9.)#/4m)10&ndash&pound;1507#2208"840(;160,0002&70,000+)pound;150*2,000&ndash;196,000+#500+#600+#728+#800',
+    '*+-&pound;165*#.26,!m+"43+"7m)%1,000*#.00+"66*$6.00)%2,613+#911*$.11m+"40+!5+"6m',
+    '*!5+#.00)33,000&ndash;200,000+#300,"33*(.10s.0d.+"23,!7+"33+"50,!m*"/t*!5)%4,540*".1',
+    '+"5p+"61+"9m*!0+#.60*!3)/5&ndash;155,0002&75,000*2,000&ndash;140,000+#128+#911,"80*#.00+"40*!2',
+    ')%6,474*#.33+!4+"50,!m+"75*!8*!m)%7,500+#765+#850*".1)%8,369+#900*+-&pound;340',
+    '+"60+"70*!0*!5)%9,000..&ndash;158,600+#950*#.18+"50*!2*!5*!9+$+vat)"m.(.4&ndash;17,000',
+    ')7,000&ndash&pound;15,0003\';18,000-!m,!1+"55,!9+"87+"93*#130,!3*#267*#340+&56,595+"81,!2',
+    '+"84,!8+"95*#505*#614+"25+"31+"94*#750+"63*#862+"80+"90*#950,!6',
+    '+"74+"99)!.*!0+!9*"15,".0*"20*"30+"8m*!4+!0*"52+!5+!9',
+    '*"76*"80+!5+!7*"94+!6,!m+!m),0&mdash;150m+/ndash&pound;1507#2300(;210,000*#,00-00-&pound;160,000+#500',
+    '*+-&pound;150+%a-day*#.00+"12+"57+!8+"90*"00,!0-!0*!6*\'million)%1,590+#600+#800',
+    '*#.38+"52+"61*$5.30*!7)(2,280.53+#600+#987*#.2m+!3+"65+!8*!0*\'million)%3,000',
+    '*#.26+"82)*4,000/0.45+#200*#.50+"6m+!7*%/year)/5&ndash;190,000*$,275+#602*#.38+"67*!2)%6,000',
+    '+#902,"94*$-odd*#.4m+"88*!0*!m)%7,194+%527.2+#683+#934*#.10+!2+"50+"85',
+    ')%8,300+#857+#936*#.00+!4*!0*!m)%9,664*#.00+!3+!4,!m+"50+"90,!9',
+    '*!9+#.00*!m)\'billion*!n)"s.(*5&ndash;250"40)2,000-&pound;18,000-!.+"12+"34,!6-#.57*#100',
+    '+"50+"84+"90*#202+"43+"74+"90*#300+"25+"72-3&ndash&pound;20,469+"83*#400-3&ndash&pound;25,000+"95',
+    '+"53+"70+"99*0600&ndash;21,800+"45+"86*#700+"14+"78+"90*#800+"40+"87*"99,!5',
+    ')*-&pound;20*"20*$plus)$.0.0+"3p+"5m*"10+&2s.3d.+!4*#23m+\'5/100ml*"35+!8*"40+!2',
+    '*&50/2.5+&6/roll+!7*"60+(4million*"73+!7+\'billion+!m+!p*"80+!1+!6+!7*"96',
+    ')%/acre)10&ndash&pound;2000(;180,0001\'250,000*8,000&ndash&pound;250,000./-&pound;200,000*+-&pound;280*#.00+"1m+"40+"65*&0/acre+$0/km*"bn*&m-plus',
+    ')%1,500+#650*#.2m+"7m+"83)$2000*"50*\'million)%3,206+#700*#.2m+"90*!9)%4,700*#.2m',
+    '+"73*"5m*!9)%5,308+#500+#749*#.1m+"30,!m+"5m+"6m*!1)36,250&ndash;175,0005\'218,750*\'-a-year',
+    '+"63*!0*!6)&7.16s.+!3+"90*!0*$4.50*!5)$8.6m+!8*\'million)$9.00+"7m*!0',
+    '*!5*$9.00)\'billion)"m.((6&frac34*)middot;2k*0ndash;19&ndash;9)2,000-&pound;18,000+"14-3&ndash&pound;20,469*#116+"20+"50*#200+"50',
+    '*#312+"60+"90*#425+"35*#524*#645+"50+"60+"93*#707*#800+"70*#900+"25',
+    '+"63+"91)(-a-night)!.*(12s.10d.+!6+!9+"bn*!2+"4m+"5m+!8+!k*"30+!9',
+    '+!9+\'million*"59+\'billion*"60+!5*!7+!3+!6+!8+!m*#95p+-9/&pound;7.99)/0&ndash;185,000*),000-plus',
+    '*\'-weekly*!.+"00+"13+"30-!p+"50*#000+3m&ndash&pound;1800m*"6m*\'million)%1,000+#100+#481+&564.30',
+    '*#.1m+"54+"86)%2,150+#500*"50)33,000&ndash;229,000+#457*".8*!5)%4,465+#950*#.50+"99*!m',
+    ')$5.00+"30+"6m*!m)%6,000..&ndash;433,000+1500&ndash;176,600+#700*".7,!5*!0*!7+!5)*7&frac12;m*8,000&ndash&pound;300,000',
+    '+#625,"95*#.44)#8.3,!m+"89*!6)%9,827,"71+#950*#.50+"66*!0*!2*$5.00',
+    ')(:0s.:0d.*$13:4)"m.*&illion(,7,000-a-year-!m+"15+"40*#132*#230+"50*#315+&45,000+"81*#436',
+    '+"50+%69.12+"75*0500&ndash;21,000-.-&pound;20,000+"50+"60+"80,!2+"90,!5*#600*#700-$,000+"12',
+    '*#833+"59*$900m+"25+"89)\'-a-head)$.000+"68*"10+!6*"2m,&illion*"35+!9*!4',
+    '+!8*150&ndash&pound;25+"2m+\'million*!6+!5*"70+!m*"89+!m*!9+!3+"53,"hb+!m',
+    '*$,500+#800*!2+$9.00*\'million)%1,000,"77+#528*#.3m*!5*!8)%2,304+#652*#.3m+!5',
+    '*!4*!5*!m)%3,141+#300+#965*#.32)14&ndash&pound;282*#.25+"6m)/5&ndash;225,000*$,400+#970*!.+"00',
+    '+!4+"6m)%6,235+#765*&.37/sq+!4+"85*!0*$1405*$3.38*!m)%7,250+#461*#.14+!6',
+    '*\'million)%8,000+#600*".2,!5+"5m*\'million)%9,000*#.25+"7m+"93*$3.45*!5)\'million(08&ndash&pound;20',
+    '0"201%5,000)1,000&ndash;24,000-$,000-.-&pound;20,000.&a-year.$plus+"99*#108+"35*#200+"50,!1*#345+"85',
+    '+"50*#571*#624+"40*#700--&ndash;28,000+"44*#800+"40+"50)*-&pound;241"40)#.11+#2s.+!6',
+    '+!5,!m+"75*"36+!7+\'million*"47+"8m+!m*,50/&pound;20*"66*!7+!0+!6+!m',
+    '+!0+/5/&dollar;29.95+!6)&/150ml*&double)/0&ndash;200,0002&40,0002&60,000*2,000&ndash;240,0006&50,000.!0+1400&ndash;283,500+#800-!7*#.00',
+    '*"00*"20,--&pound;62100+!5)%1,000*".7*!6*\'million)%2,500.$,000*$1/ha*!m)33,000&ndash;244,000*\'million)%4,697',
+    '*#.6m)$5.00+"4m*$7.18+!5)$6.3m)%7,883*".2+"4m+"66+"8m*\'million)18&ndash&pound;272*#.62,!3',
+    '+#975*".9*$9.00*!m)"m.(*9&ndash;25)(,000,000-\'-a-year+"47*#141*#252+"85*#312+"50*#428',
+    '*#520+"50*\'600,000+"50+"80*#907+"25+"69+!9)".1+!5*"23+!4,!7+!m',
+    '+\'billion+!m*!4+30&ndash&pound;28.50+!5*$50/m,!p+!5+!6+!8*"65+!6+!8*!7+!0',
+    '*!8+!0*!9+\'5/150ml+!7+"9.)/0&ndash;230,000*$,234+#500*#.00+"5m)$1.1m+!8*"41*!m',
+    '*#.50)$3.12+"30+"5m+"88)%4,000+#315*#.2m*!m+&illion)%5,400,"97*!.+"00+!1',
+    ',!m+!3,!m*!0)%6,000..&ndash;261,0005\'326,0007%7,000+#875+1900&ndash;261,000*#.00+"3m+"50,!2)%7,366',
+    '*!3*!4*"6m*!8)+8&ndash;270*$,000+#546,"99+#800*#.73*!0*!m)%9,000*#.50,!8',
+    '+"90**0&ndash;91*$5.00)#bn.)%o,000(!=)+&dollar;1.83$9515)&dm2.75-"95)\'sfr2.55*\'kr10.42(/bn-&pound;1.2bn+$plus*!.',
+    ')+illion-plus(%o,250)!o*!o(!x\'(2&frac14)-ndash&pound;35!4.$;12s/!30"002!00!m/!9(#,00',
+    ',--&pound;4,0004%9,999-&a-head/%night,!m*"13+%5,000*&24,681+!5+!8*"30,$,000*"41+%5,845*"50',
+    '+$3.27*"60+!5+!7*"70+!5*%84.19+#7.8*"95)*100-a-term*"11+%2,000+"4m*"22+!7',
+    '*&44,000+!5,!m*"53+%4,830+!5+!7*"60,$,000*"75+%6,798*"80,!m+!4+!5',
+    ')\'200,000*"13*&21,503+!5+!6*"32+"3m+!4+!8*&44,000*"55+!6*"66*"70+!6',
+    '*"93+!5+!6)\'309,993*&10,000+!5*"20+%5,000*"30+%2,000*"40*&50,000+!6*"60+!5',
+    '+!1*"90+!2)$400m*"12+!4*"37,$,637*"40,$,000+!4*#50m+!2+$3.24*"60',
+    '*)87million)$500.,-/&pound;3,500-%3,500,!0,!m,%worth*"14*&27,135*"32*"45+!7*&50,000+!5+!9',
+    '+!2+!8*"85+#8.0*%94.70+!5+"6m)\'600,000,\'-a-term*%15.91+!6+!7*"70,\'million*"85',
+    '+!5+!9)#703+!4*"12+%4,624*%29.9m*"5m*"69*"70+%2,643*"80+!8*&91,248+!4',
+    ')\'800,000+!9*"66*"80)#910+!4+!5*"23+!8*"35+$7.50*"40*"52*"65*\'9/200ml',
+    '+"6m+$8.1m+!9)#ooo(,-&pound;2.500!30!40!50"8.)!3*$,000(".0*"1m*"2m*"3m',
+    '+!m*%s.0d.)\'10s.0d.*!1+!6*!2+"bn+!m*!3+"s.*"4m*&5/85ml*%6-per+!m*-7&shilling;6d',
+    '*\'9/200ml+!m*"m.))2-million*\'0/100ml+!5*!1*"2m*!4+!m*"51+"4m+\'million*#6bn*!8',
+    '+"7m+"bn*$s.6d)\'30/50ml*!1*!2+"8m+!m*!4+"1m+!p*"5m+!p*#61m+"2m',
+    '*!7*"8m*\'9/100ml,%250ml+!m*"m.)"41+1&ndash&pound;4.53*!2+!p*"3m*!4+!9*\'5/200ml+!m',
+    '*"6p*!7*!8*&9/250g+!m*\'billion*$s.6d)+5&ndash;3.5+*shilling;6*#/kg*-0-&pound;7.50,&a-week+)/&pound;2*"1m*(2million',
+    '+!m*!8*\'9/500ml*\'billion*!s)%601bn+!p*#25m*!3*&5/227g*!7*\'9/250ml*"m.+&illion)"71',
+    '*!2+!m*!3+!m*\'5/200ml+"bn*!6+\'million*"7m*"8m*"92*\'billion)"81+"4m*(3million',
+    '*!7*$9/30*%s.6d.)390&ndash&pound;3.75*!3*\'5/100ml-$25ml,%200ml+\'million*!6*!7*#81m+"7m*\'9/100ml,%250ml',
+    '+!8(,/&pound;2.50(00&ndash&pound;22/#;250&40,000)#,00,40&ndash&pound;40,0003\';70,000-\'-a-year,!3+"46*!1+"00+"40+#897',
+    '*#350*#400,!8+"69**500-a-year+&12,812*#600--&ndash;25,7504&30,9004&41,300+&18,000+"40+"50*#700*#800',
+    '+"30+"72+"95*#975)*-&pound;253\'million*&a-head,$week*%pound)#.02+!5+"7m*!1+!3+-6&shilling;4d',
+    '*"3m*"40,&/200ml+!5+!7*"55+!9*!6+!0+#34m+!7+!8*"75+!7*#8bn',
+    ')4/&pound;15/&pound;10*!t)/0&ndash;250,000*!+*2,000&ndash;250,000./-&pound;400,000/&a-year/$plus.!.,"23*--&pound;2,000+%4,000+\'a-night,&n-hour*!.',
+    '*$/300.$,000+(customer+!t*"0++"00+!m*!k*&m-plus,%worth)(1&frac12*$,881*".4+"9m)%2,800',
+    '*"16)#3.6)%4,510*".5+!6+!7,!6+"90*!3)%5,600+#800*!.+"1m+"7m*!m',
+    '+#200..&ndash;309,300*$0979)%7,192*#.13+"90*!4*!m)$8.8m*$3.72*!4*!5*!m)(9,270.76*".7',
+    '*!m)(bn-worth)#can)"k+)%m-30m)!o(01&ndash&pound;40/\';24,000)(,000,000-!.+"87*#125*#200+"34+"70',
+    '*#600+"20*#720+"50,!9+"97*#932+"60+"70+"95)#.07+"8m*"28*"30+!2',
+    '*#400+!6+!m*"51+!3+!6*$624m+!8*"76+!8*"80+!4+!m*"98+!m',
+    '*#.60+!9)$1.20,!5+"50+!6*$0.50)%2,765*!5)%3,208+#800*".5+"67*!m)%4,000',
+    '+#307*#.95)%5,145+#377*(-a-night*#.00+"31,!8)%6,000*#.42*"pp)%7,000*#.00)%8,400*#.00',
+    '+"7m*!m)%9,882+#947*$-289*#.00+!1+"20+"99,!m)\'billion)!l)\'million((2&frac120";m',
+    '/#;32)1,000&ndash;28,300-\'-a-year*#125+"35+"91*#200+"44+"50*#300+"63*#464*#548+"55*#615',
+    '*#730+"73*#857*#926+"95))-per-head)$.01m*"16+!m*"20+!4+!5+!7*"3m*"43',
+    '+!5+"m.*#65m+!m*!7*#85m*!9+!6+#94m)#/23)30,000&ndash;331,800*#.00)%1,387+#499+#776',
+    '+"9m*!m)%2,200)%3,000*".6+!7,!m)$4.2m+!7*!m)%5,243+#839*".6*!0*"m.',
+    '*#.50*!m)!7*"pp)38,000&ndash;326,000*).6million*#730*!m)%9,000+#500*#.00+"1m+!4*!5*!m',
+    ')$fine)\'million)!o(*3&frac12;m)(,000,000-!m+"25*#1.0+"40*#220+"97*#388+%92.80*0400&ndash;32,700+523&ndash&pound;26,471',
+    '+"23,!6*$7000+"35*0800&ndash;25,800*#920+"50)*-&pound;30)#.04*"16+\'billion*!2+!5+!m*!3',
+    '+!m*"45+!9*!5+!5+"8m*!6+!0+!2+!3+"9m+"bn+!m,&illion*"79',
+    '+!0*!9+!3+!8+!m)$/kw/*%tonne)10&ndash&pound;340*$,981*&-worth*#.1m+"58*!0+!0*\'million',
+    '*#.48*#63m)%2,000,"24+#601+#877*!k*!m)%3,000+#645*$.6s.)$4.00+!4+!5+"78',
+    '*!3)%6,000*!m)%7,000+#571*".2+"7m+"99)!8*!m)(9.00+vat+!1+"50*!9*!m',
+    '*.ndash&pound;27/#;300"80)1,000&ndash;30,000-+-a&rehy;man+"41*0100&ndash;38,500*#200-$,000+&30,968*#300+%19.44+"79*#407+"70',
+    '*#727+"45+%51.59*#800+"10+"43,!6+"50+"71*#945+"99)#-99)!.*"10*#22m',
+    '+"bn+!m*!4+!0*"5m*"61+!9*"70+!4+!5,!m+!8*"81+#69m*!9',
+    '+!m)%0,310*#.00*%/acre*"00*"45*\'million)%1,000+#248*\'million)%2,000+#568+#800*#.23*!5',
+    '*\'-a-week*#.56+"7m*!m)%4,400*#.50)%5,358+#500+#900*!.+"00*!0*!3)%6,000+&285.27',
+    '*$5.33*!k*!m)%7,300*"0m*!m)%8,000+#203*#.14+"25-!m+"43*!3)(9,033.53+#400',
+    '*#.00+"99*"pp)"bn)\'million(05&ndash&pound;308"ph/\';35,9990&50,000)1,000&ndash;40,000-$,000-.-&pound;35,000.%added.(per-year*#100',
+    '*#338*\'400,000+"38*#539*#600+"80,!8*0700&ndash;36,100+"14+"75*#837*#995)+-&pound;30m1"401"50',
+    ')$.000*!2+$0/mp+"5p+!m*!4+!5+!m*!6+!m*!7+!0*"85*!9+!0',
+    ')+0&ndash;300*#,00-50&ndash&pound;350,0004(;375,000.&-rated/%worth.!.."pa+#200*+-&pound;300+#odd*#.43+!5,!m+"75',
+    '*#00m*"bn*&m-300m)%1,828*#.27+!5,!m+"8m)#2.3,!m*!m*"pp)$3.50+"70*!2',
+    '*!m)%5,500+#699*\'-a-week*#.41+!5*\'million)!6*$,000*".2+!8)37,700&ndash;309,3006&60,800*#.1m+!2',
+    '+"5m*\'million)!8*#.50)%9,800)!a*%-week)"bn)"m.*&illion)"om)"pp(,6,000-a-year+"52*0150&ndash;39,200',
+    '*#246*#331+"90*#450+"70*#500-$,000+"20-%,000.,!3*0600&ndash;40,000+"22*#700+"19+"20',
+    '+"50*#910)#.00*$13s.*!2+$0/us*"32*"40*!5+!1+!5+"s.*"64+!7*"81',
+    '*"97)+0,000&ndash4(;400,000+#658*+-&pound;342*!0*$3.63*!m*"pp)%1,000+#254+#472)$2.70*!m)%3,900',
+    ')%5,100*&-worth*#.00*!m)%6,000*!9)%7,000*#.62+"80*!6*!m)%8,400,"97)$9.50(%7,015',
+    '*#400*\'500,000-\'-a-year*#600*#700+"50*#800)#.2m*!3+!6+\'million*!5+%0+vat+!3+\'million',
+    '+!8+!m*"75+!m*"80*!9+/5/&dollar;40.25+!m)40,000-&pound;320,000+#816*!.+"25+!4*"65)$1.88',
+    '*3.18&dollar;shilling+"25*!m)%32.24)$4.73*!m)/5&ndash;320,000*:,000&ndash&pound;1,500,000.$,000+#369*+-&pound;400*!.)!7*$,000*".4',
+    '*#000))8,000,000+#371+#600,"29*#.00+"16+"6m+"70+!9*!5*!m),9-&pound;389*#.6m+"90',
+    ')"m.(48&ndash&pound;32,000)1,000&ndash;37,400,!2+"85*#100*#300*#497*#500*#600+"50*#960,!4+"95)#.00',
+    '*"20+!3+!5+!8*"30*"4m*!6+!0+!m*!7+!m*"8m*$9bn.)#/lu)%0,445',
+    '+"76+"82*!0+!0)(1mi1lion)%2,869*#.2m)%4,000+#956)%5,364*#.0m)%6,000)%7,887*%.15**)%8,562',
+    '*".5+"98*!m(&9,0009+"73*#120*#316*0400&ndash;44,000+"78*#525+"55+"65*#850+"67*#949',
+    '+"95,!9)#.00+!3*"10+!m*"25*"5m,&illion*"65+!7*(7billion*"90+!2+,5/&dollar;50',
+    '1\'405,000*2,000&ndash;400,000+#900,"66*#.76*!/)$1.6m*\'million)"20)!3)%4,000*#.90*$2.94*!m)%5,048',
+    ')"62)%7,000*\'.3s.0d.)$8.22+"65+"75*!m)$9.00+"90*$5.00*\'million)\'million(,:12:7&frac12*#7:7(&and1/4',
+    ')&n-plus(!l(&m-plus)1illion&pound;1.6m/&-rated("om()xxmillion\'03&ndash&pound;10.$;12p/$4000()+&pound;1(6,000&ndash&pound;6,0002&;4,0003%5,000,--&pound;4,000',
+    '4%6,000-+per-patient-%worth,!.+%8,327*"17*"20*"37+!8*"65*"83,$,000*"91)$100m+%4,000',
+    '*"30+$7.33*)41-a-year+!3+!4*#60m+!1+!9*%79.80*"95)#228*"51+!7*"65*"72',
+    '*&90,474+!5)\'300,000*"40*"66*"93+!9)$400m*"10*"23*"35*"40*)65-a-term*%79.55*"88',
+    ',!m+!2*&20.000+!6*&40,000+!8+%9,923*"54+!9*"64+!7*"74)\'600,000*&22,386*"30',
+    '*"40+$4.47+!8+!9*"60+%3,000+%5,000*&70,739+!5+!9*"80*"90+!1)#732*+50&mdash;is',
+    '*"66*%83.50*"90)#807*226,470,000,000,000,#.47*"34*"45*"50,$,000*"80*"97)#908*"18*"20',
+    '*"30+!5*"45(*-&pound;120!40!60!8)$15-8)%4,000)\'million(#.01*"3m*!5+!m*!6',
+    '+"bn*!8*$9375)#10s*!1*!2+!m*"5s*$6.6d+"m.*!9+!m*\'billion)(25/200ml+"bn',
+    '*!8*\'billion*"m.+&illion)\'30/60ml*!1+$/boe*"6m)*40-an-hour*"3m*"4m*\'5/150ml,%500ml*!7)050&ndash&pound;4',
+    '+!/,+&pound;2.00+!p*!3*\'5/125ml*!6*!8*"s.)%60/12+!m*!2*"3m*\'5/330ml*!7*"8m',
+    '*%5+50p+$/200,#95g*"6m*"8m*"9m*"bn*)shillings)#82m*!3+!m*#55m+!m*!6*!9',
+    '*)bn-a-year)%9.9d.*#01m+"bn*!3*"4m*-5-&pound;5.99+&/150ml,#8oz+!m*!6*-9-&pound;4.49(8/&pound;2.25/&pound;1.50(00&ndash&pound;50/#;35',
+    '0&45,0000"50)*,000-a-man-#.00-&a-year*#100,!9*#250*0300&ndash;40,400+"55*#600-$,000+"95*&789.55**854-a-year',
+    '+"52)*-&pound;351"501"80*%a-day,)head-plus,%month*%worth)!.*#000*"25+!m*"30+"4m*"40',
+    '*"50+!5+!6+!m*!6+!0+!4+!m,+illion.this*"70*!8+!0*#91m+"4p)*/&pound;32',
+    '*"lu*$week)20&ndash&pound;15007%3,0008"507#6000&;8,000*2,000&ndash;350,0005\'433,000./-&pound;600,000/\'500,000/$plus/%rated+#ooo*$-400',
+    '-$year+%worth*#.00+"15+"2m+"38*+/&pound;350+#350+\'400,000*-0-&pound;5000+#.00+.0-&pound;35000,"0+*"bn*-m-&pound;350m',
+    ')"1m)"2m+&illion)!3*$,000*#.81*!m)"40*$2.31)(5-a-week)%6,200+#794+#898*+-&pound;535*-0-&pound;6790',
+    '*!m+&illion)%7,000+#781*#.7m*"4m)!8*$,000)$9.34+"99*!m(%1,167*#200+/50&ndash;37,500*#383',
+    '*#726+"47+"50,!8+"6p*#900+"49)".0+!0+!5*"15*"38*!4+!9*"53',
+    '*!6*!7+!0*!8+!0*"90+!9)/0&ndash;460,000*$,300*#.9m)%2,330+#500..&ndash;437,500*".5*!3',
+    '*!m)%3,908,"46)%5,000+#616*!0)%6,000+#700*#.4m)#7.3+!5)%8,750*#.2m*!0*!m',
+    '*!m(02&ndash&pound;36/&;33.5m)*,000-added*#193*\'200,000*&387.40*#466*#550*#610+"50*#700--&ndash;42,000*#800*"99',
+    ')1.00(&pound;37.00)*!1*"25+!m*!4+!0*"5-+\'million*!6+"bn+\'million+!o*!7+!0+!m',
+    '*!9+!0+"3m+!8+39&ndash&pound;37.99)/0,000-certainly*(-million*!0)!1*$,715*".3*!m)!2*$,000+#200',
+    '*#.00+"6m)$4.30+!6)"5.+"50*!0)$6.00)$7.5m*!5)!8*!m+&illion)$9.00+"3m',
+    ')"bn)\'million(*3&frac12;m*\'ndash;6)%,000m*#440*#525+"35+"50*#600+"20*#700+"50+"67+"89',
+    '*#929)!.*&00+vat+"5m*"20*"30+!3+!m*"4m*"55*!6+!5*!7+\'million*!8',
+    '+!4+!m*"90+!5)#/4m)%0,238+#500)(1,373.93*!m)!2*$,000*#.35*!0)33,000&ndash;400,000*#.33',
+    ',!m)%4,000.&-worth*#.65)%5,000)%6,000+#203)*7.5million*!m)%8,462*#.2m*!m)*9.4million+"71*\'million',
+    ')"m.*&illion(,4,000-a-year+"55*#199*#250*#391*#400+"39+"50+"67*\'604,067+"67+"80*#724',
+    ')*-&pound;38)".0*"20*!3+"4m+!m*"45*"6m*&95+vat+!6+!7+39&ndash&pound;39.99+!m)30-&pound;350million*#.00',
+    '*\'million)%1,000*#.38)%2,000)%3,356+#406*"5m*!m)%4,000+#586*!m))5,000,000*#.15+"33+"92',
+    '*!m+&illion)%7,000*#.3m+!4,!m*!m)%8,763)%9,000*#.95*#52.)"pa(05&ndash&pound;45/\';38,0000"45',
+    ')1,000&ndash;45,000-&-worth-!m*#231*#300,!2*#500+"20*#670+"82*#700+"50+"60*#836)+-&pound;125',
+    '*&a-week)!.*000/&dollar;50.00*"15*"24+!5+!8+!m*"38*"50*!7*"80+!5+!m*!9',
+    ')/0&ndash;465,0001#500*2,000&ndash;450,000.\'-a-year/%worth*+-&pound;4003"50+#odd*"25*!k*\'million)%1,413*#.00+$404m*!m',
+    '*$7.50)%4,500*!0)"5m)"6m)%8,587+#837*!m)%9,000*#.99*!m)!k)"m.(+6,000-worth*0100&ndash;46,400',
+    '*#200*&363.64*#500+"50+%93.33,!6*0600&ndash;48,800*#700)+-&pound;40m)#.17*"23*"36+\'million*"40+"bn',
+    '*!6+!m*"7m*"80+"4m+#93m+!m*!9+!0)#/ha))0,623,000*#.00+"95*!0*!m',
+    '*#.8k*!m)%3,000)$4.09+!5,!m*!0*!m+&illion)$5.00)%6,000+#321*#.3m)$7.00*!m',
+    '),m-&pound;40m+&a-year*!.()7,000,000-!m*#125*#430*0500&ndash;50,000*#600*#800+"65)#.19*!2+!5*"48',
+    '*!6+!7*!7+!7*"98+!9)+0,000-a-day)!1*$,000*#.50)%2,340*!m)%3,500+#767*#.80',
+    '*!m)35,000&ndash;562,500*!0*\'million)%6,000)%7,000+#882*!m)%8,000*!8*\'million)%9,033*!5*!k)"bn',
+    '(*8&frac12;m)(,000,000**100-a-year*#250*#382*#667*#769*#800+"80*#900,16.19&shilling;11d)*-&pound;45)".0+!8*"15',
+    '*#3m.*"45*!5+!2*!7*"95+!9)%0+vat*!0*!m)!2*$,500)%3,000,"30+#500',
+    '*"pp)%5+vat**,000-worth)%6,121*#.9m*!6)%7,000)%8,900)#9.4+"99(%9,195*#200-!m+"85*#500',
+    '*#634+"50,!5*#769*#850*#960+"95)#.01*/12s.1&frac14;d.*"24*!4+!m*$50p.+!5*"69',
+    '*!7+!4+!5*!9+"85+"9.),0/&pound;400)%1,000+#566+#946)$2.96)%3,000*!m)!4*$,000',
+    '*!m)$5.00+"1m*!0)#6pp)!7*$,000))8,000,000+#445*!m)$9.00+"50+"95*$9.00*!m',
+    '(!b(\'m-worth),illion-rated\'(4&frac12/";m-%34;bn)-ndash&pound;5.+;10&ndash;00*7s&rehy;6d0!8/$4.5m0!0/!50(&ndash;00$,000',
+    '/!6/"7//!80!4/"95(,+&pound;1.50(1,000-&pound;5,0004%6,000-\'a-month,!.,&/6,000,!m*"16*"50*"60',
+    ')#128*"40+!o*)57million*&65,667*"70*"81)\'250,000*"60+!7)#312+!9*&27,000*"30*"46',
+    '*"68*&80,000*"90)#419*"33+!4*%52.3m+!5*"60,$,000*"91+!9)/500&ndash;5,5005#800,.-&pound;10,000',
+    '*%13.50*"20+!4*"67*"75*!9*!m)#611*"21+%3,338*"45*"56*"60+!2*%70.59',
+    '+"5m)$700m+"2m*"10*"40*"99)#815*"25+!6*"30+!3*#40m*"70+!8*%91.46',
+    '*"60*"82+!5(*-&pound;150!7)#500)&a-week().00/200ml+"bn*"1m*!6+!m*#8bn*!9)$10.0',
+    '+!s*"37+!m*!4*"6m*!7+!7+!m*"97*\'million)"21*"3m*!4*#5/m+!m',
+    '+!5*"m.+&illion*!s)"31*!3*!4+!m*!6+!m*38&ndash&pound;11.62+!m*"bn)\'40/acre*!4',
+    '*&9/25ml*"bn).50&pound;10.50+*-&pound;20+&/250ml,"hr+!0+!p*#24m*!6+"1m*!8)"62+!m*!4',
+    '*\'million)#74m*\'5/500ml+!m*"bn*"m.)"81*!3*"5m*#7bn*!9*\'billion)\'95/30ml+!m*!7',
+    '*&9/50ml(7/&pound;3/&pound;2/free)%concs)"hr(00&ndash&pound;50/#;450"65)#,00,.0&ndash;50,000-!**#100*#268*#333*#592*#625',
+    '+"76*&875.16*#929+"95)*-&pound;501"601"99*&a-year*\'million)!.*"40*!5*"70+!m*!8',
+    '+!2+!9+!m*!9+!0)#/60,$,000)40&ndash&pound;10,0007#8000%;12001#5001#600*2,000&ndash;500,0005\'600,000.\'-a-year',
+    '/%rated.!.*+-&pound;5502#999+#500+&a-time-#win*"00,!0+!m*\'million)!1*$,000*#.62+"88',
+    '*!m)!3*$,000*\'.00+vat+"65*!m)!4*!6*!m)/5&ndash;465,0001\'525,000*(,000,000*--&pound;2,000*#.38*!m',
+    ')%7.68m)$8.25)!9)$:0:0).bn-&pound;50bn)+k&ndash;60k),m-&pound;50m(01&ndash&pound;526"60)$,350*#600)".1+!0*(2billion*!3',
+    '*!6+!0+!2+!4+!6*"7m*"90+!9)#/4m)$0.9m*!0*!m)!1*2,800&ndash;529,400*#.99',
+    ')#5.0*!m)%6,000)%79.81)%8,700*"1.*!m)!9*$,000*#.99)\'million()2,000,000*#303*#500*#724',
+    '+"12+"50)!.*"10,$s.0d*!2*"37*!5+!5*!6+!5+!m*"71+!5+!m',
+    '+!m*"90+!5)#/lu)"0.*"m.)%2,000*#.50*!m)"34)!4*".2+!8*!m)%5,531',
+    '*!0)%61.55)$7.00*\'million)!8*$,667)!9()3,107,142*#558*#600+"47)\'-a-week)#.1m*!2+!4',
+    '+!m*!5+!6+!m*"66*!7+"5m+!m*!8+!0+!9*"95+!9)$0.00*!0',
+    ')!1*".7)"2m)$3.00*!m)%4,000+#941,"52)"5m)$6.5m*!8*!9)%7,000+#500*+-&pound;513',
+    ')%8,000)%9,975*#000*!m)\'million(34,000-&pound;46,000+"50*#100+"83*#300*\'400,000*#611*#700)#-99*\'an-hour',
+    '*"00*"20*!3*"40+!m*%50/lu+!8*"65+!m*!7+!5*!8+!0+!m,&illion',
+    '*!0)%1,000+#553*!m)%2,000)%3,000*#.86)%4,000*#.68)%5+vat*$,648*#.69*!m)!6*!m',
+    '*$,000)$8.4m+"85)$9.95,!9(05&ndash&pound;60/#;250&50,0000&70,000)2,000-&pound;55,000.&a-year*#220+"60*#300*#420',
+    '*#723*#878*#980)*-&pound;95*&a-week)!.*!1+!m*"55*!7+!5*"82+!9)90,000&ndash&pound;550,0004(;550,000',
+    '+%worth*!.*!0+!0*\'million)%1-8-6)%2,400)%3,000)%4,361)!6*!0)%7,000*!m)%8,300)%9,000',
+    '(.6&ndash;70,000)$,133+"86*#200*#453*#600*0700&ndash;56,100*#803*#914+&45,000)#.00+!7+"9m*!3+!6',
+    '*"60*"77*"8m)#000)"1m)%2,000*".6*!m)!3)"4m)/5&ndash;580,000)%6,000*!m)!7)%8,000',
+    '*"5m*!m(27,300&ndash;63,000*&406.27*#950+"95)$.07m*%1s.4d/!.*!3+!0+!m*$425m*!5*"66',
+    '*!7+!0)%0,371)%1,000*!m)%2,200*".6*!5*!m)%3,000*#.60)%4,000*".1*!m)%5,000',
+    '+"13)!6*,&ndash;8,725*$,666)%8,000*#.5m*!m)!9)"bn)\'million(*8&frac12;m*.ndash&pound;61)$,090*#100+"68',
+    '*0800&ndash;61,000*#956)".0*"10*"2m*!3+"4m*"40+!m*\'50/acre*"60+!m*!7*"85+!m',
+    '+!9+!m)"00)!1*$,200)!2*$,200)!3*$,000*!.)$4.1m*!m)%7,000*#.63)38,000&ndash;610,000',
+    '*#.8m)"m.(%9,215*#400*#500*#752*#900)#-99)!.*"1m*!2+!0*"40*"60+!m',
+    '+!8*!8+!m*"91+!2+!m)$0.00*!0*#258*$4.60)%1,000*#.10+"25)!2*!m',
+    ')!4)$5.00*!m)%6,000*!m+&illion)!7*!m)#9.5,!0*!5(!k(!o("th\'(5&frac12',
+    ').ndash&pound;105"20.\';10,000(!*(7,000&ndash&pound;50,0002&;7,000,$+vat,.-&pound;50,0004%6,000-%a-day/$year3)-for-five,#.00+!2*"30',
+    '*#95m)#107*%35.08*"65*%99.30)#202*&64,500*"79*&91.64p)&307.25+!9*&16,286*"20*"30+!5',
+    ')*400-a-year*"34+%8,860*"60)/500&ndash;6,600*#16m*&31,000+!5*"40+!4+$7.50*"54*"68+"9.)#634',
+    '+$6.32*"82)#729*&50,000*"60+!4*"83*"95+!8)#820*"50)#912*"50+!4*"60',
+    '*&99,000(0-&pound;11/concs1$2.501!51!90!60!7)&10,000)#5-0)&a-head+$week)$pack*#lus($.02m*!4',
+    '*!5*!6*"8m)"13+"bn*(4million*#82m)(22/200ml+!m*!3+!m*(4billion*"5m*"bn*$mbid',
+    ')"33*!6*!8*"bn)"46*!8*"bn)*5&shilling*#.0.**0-&pound;9+,/&pound;4.75+!p*!2*33&ndash&pound;20.43+!p',
+    '+1&ndash&pound;6.09*!b)"61*(2million*!4*!7)075/&pound;3/free*"bn)#84m*!6*!8*"bn*%s.6d.)!9*"2m',
+    '*!4+"bn*\'5/100ml-#5ml0!.,#8oz+!p*!7*&9/15ml+$1.47*"bn(\'0&ndash/*&pound;1406"706"90',
+    '0"600&80,000)$+per)7,000&mdash&pound;60,000.3ndash&pound;100,0003(;100,0004&62,500-!+-$,000-&-added.(per-year.1to-&pound;100,000.%worth*0250&ndash;62,800*#400',
+    '*#800)+-&pound;1001"80*&a-game,$week)!.*"1m*"2m*"36*"59+!m*"76*!8*"9m).0&ndash;15,000',
+    '*!\'*$+vat*#,00-%0,000.(-a-month/$plus/%worth.!0*--&pound;1,2003&00,0002&40,000+(a-season-$week+#ish+-to-the-winner',
+    '*%0,000*"m.)!1*$,415)%2,811)%3,000*!m)%4,000)%6,000)%8,000+#859*#.72)%9,709*!m)!b',
+    '+&a-year*!.(%1,042*\'500,000*#600--&ndash;77,400+"99*#995)#.19+!m*!2*"55+!m,&illion*"75',
+    '))0,000,000*!m)!1*$,000+#867)%2,000*#.80)!4*$,000+#558)%5,000)!8)%9,520*!9*!m',
+    '(*2&frac12;m)),000-plus*#300*#800*#900)#.03*#10*,%s.0d.+!m*!3+!7+!m*!4+!m*!5',
+    '*!7*!8+!0+!1+!4*"99+!m)%0,000*#.00*#000)%1,000*".8*!m)%2,000)"3m',
+    '*!m)$5.00*!0+!0)!6)"7m)%8,000+#540)!9)\'million(03&ndash&pound;66/$;24p1!5)$,038*#125',
+    ')!.*"00*!1*"24*"33*"50*!7*"87*"90)#04.)!1*#.30)!2*#.00+!6',
+    '*!m)"4s)%5,122*!m)!7*$,000)%8,154*#.88*!m)$9.40()4,000,000*\'150,000+"66+"96*#224',
+    '*#950)#.00*!3+!4*!4*"5m*"6m*"8m*!9+!m)%0,500*!0+!0)%4,000*!m',
+    '*$,000)!7*#.60)!8*#.73+"9m*!7*!m)#932(.5&ndash;60,0000&85,000)(,000,000-.-&pound;70,000.&a-year.&listed',
+    '+"30*#600)".1*#37m*"50,\'/column*"60*"7m*"81*"99+!m)/0&ndash;650,000*+/&pound;600*\'million)%1,000',
+    ')!3*$,000*\'million)%4,000*$.27.)!5*!0*!m)!6*$,000+#930*!m)"70)%8,100*!m',
+    ')(mbetting()6,000,000*0100&ndash;70,100*#273*#300)\'-a-week)(.13s.8d.+!m*"22+!5+!m*"34*"60*"8m*"95',
+    '*".5+!7+(8million)!1*$,000,"44)!2*\'million)!3)%4,800*#.37)"5m))6,019,006)$7.18)%8,000',
+    '+#86m)!9(%7,500*#750*#995)#.00*!3*"57+!m*!6+!9+!m*!7+!5+!m',
+    '+!7+!8+!m)%0,664,"80*!m)%1,000*#.86)!2)!4)&5,000.+#850*#.5m*$0000)!6',
+    ')\'million(/8&ndash;115,0000&87,000)$,320+"30*#400*#754*#830*#995)#.10+!7*!2+!m*"30*!4',
+    '+!m*"70*"88)$0.35)%1,000+#275)%2,210*!2)"4.)%5,250)!6*#.8m*!6)!7*$,000',
+    ')"8m(%9,039*#125*#400*#602*$800m*#906+"53+!9)".1*"45*"58+!9+\'million*"77',
+    '*&95+vat)%0,966)(1million)%2,400)%4,000)"5m)"6m)"7m)!8)$9.2m+!4*"00*"5m)!m(\'b-worth',
+    ')&-rated("pa(!s)!.("th(!x\'(6&frac12/";m).ndash&pound;106!2.";7/"95(0,000&ndash;9,000,.-&pound;10,0004%9,000',
+    '-%worth,&/8,000*"20*"30*"40*%52.5m+$3.56*"72)*100million*"41*"55*"65*"75)\'208,000*"15',
+    '*"35*"40*!5+%0,000*"60*&77,893*"80)6300&ndash&pound;11,370*"44*"54)#415*"38+$9.72*"60*&70,000',
+    ')#530+!8*&65,000*&74,000*&97,947)#614+!9*"20+!8*"59*"67*"94+!7)#700*"20',
+    '*"74+%7,622*"83)#801*"48*#50.+!5*&70,214+!5*"87*"96)#924+$5.25+!9*)39,885.46',
+    '(*-&pound;121!50!70$8.50)"10(\'.00+vat+,-&ndash;9.00*!1*!5*!6+!m*!7*\'8/200ml)!1*!2',
+    '*#4bn*$55m.*#76m*#8.2*!9*"m.)"21*!6*!7*&9/40ml+"6m+!m*"bn)#36m*!7',
+    '*\'million)"42*%5/4oz*!8*\'billion+!n*\'million),50-&pound;15+&/200ml+#per*"1m*#4bn*!7*\'million))63million',
+    '*!7+"3m+!m*\'million)"70*#1/t*!2+!m*"5p*"7m*"m.)"82*"3p*!6*!8',
+    ')!9*$02m.*!4*&5/12oz*\'million(:/&pound;4.50/&pound;3/free)*5&shilling(10&ndash&pound;6006"77/(;100,0000#67m0&90,000)7,000&ndash&pound;11,8323(;300,000-#.00',
+    '*#260*#300*#500*#760*#837)+-&pound;1001"70*&a-week)).1million*!2+!0+!6*"31*#4mn)&/tonne',
+    '0$;7001#800*(,000,000*+-&pound;7002#800*!.*#/ha*"00,!0*"bn)!1)%2,000*"4m*%73.46)!3',
+    ')!5)!6*$,000)!7*$,500+#645*#.20)&a-week)\'billion*!n)%m-70m*!.(%1,100*#277*&426.50',
+    '*#505*0800&ndash;92,800+"91*#950+"65)\'-a-week)#.25*"30*"4m*!7+!4*"93+!5+!m)"0m',
+    ')!3*%.7.3d)!5*(,000,000*\'million)%6,000*"50)%7,000+#500*!m)%8,000+#637*!m)$9.69(22,500&ndash;78,125',
+    '*#663*#750*0800&ndash;83,750)".1+!m*"25*!3*(4million*"5m*"60+!m*"75*(8million*"95)"00',
+    ')!1*(,400,000+#800*"00)%2,478)!3*$,800)!4*!m)35,000&ndash;937,500)$7.37)%8,611)%9,000+#371(%3,150',
+    '*#200*#390*#400*#500*#900)#.05*"10*"4m*"50*"8m*"90+!8)(0million)%1,000+#681',
+    '*!m)(3.15s.0d*!m)%4,736)%5,000)&6,000m*).2million)67,515.11&shilling;.11d)#8.7(%4,536*#700*#800*$950.)%.021m*"1m',
+    '+!m*"6m*"86*!9+!2+!5)"00)$3.77+"82*\'million)$4.8m)"50)!6)$9.90(05&ndash&pound;81',
+    ')1,000&ndash;85,0004&98,000-\'-a-year+"48+"58*#226*#356+"60*#800*#988))-a-second+&n-hour)#.1m*!3*!4',
+    '*"65*"70+!5*"80*"90+!2)+/&dollar;90))0,000,000.%-plus*!.+!1*!0+30&ndash&pound;70000)!1*$,000',
+    ')%2,000)%3,886*#.04*!m)!4*$,000*#.94)$5.50)%6,000+#250)%7,000+#500*!m)%8,000)%9,000',
+    '(*6&frac12;m)(,030,816*#150*#300*#417)#.50,!0+!m*"60*"75*"90+!5+!7))0,000,000)!1',
+    '*#.97)!5*$,000)%6,000.0&ndash;1,200,0005\'800,000+#666+#700*!.+"67)$7.87+"98)!9*#.77+"99',
+    '*#444,!5*$5000+"50*#950)#.15*"20+!m*!4+!5*"50+!5+!m*"80*!9',
+    '*\'million)%1,194)%2,200*#.00)!3*$,000*#.03)%4,000+#500)!7)!8)%9,853*#.36(%8,256*#300',
+    '*#750*#908)*-&pound;42)".0+!5*!1+!5*!4+!8*!6*"8m*"94+!7)"00+!0',
+    ')"2m)$3.88)!4*$,000+#500)$5.35)$6.76)"78)!9(%9,160*#220*#900+"95)!.*"00',
+    '*!1+!0+!6*"3m*"50*"70+!m*"90+!2+!6)"0m)!1)%2,054*!m)!3',
+    '*!m)!6*$,000)"7m)%8,522*#507)$9.95(&and3/4\'(7&frac12/";m).ndash&pound;136!5.";8(0,000&ndash;9,000,.-&pound;12,000',
+    '4%9,000-%worth,!.*"50*"66)#110*"60*"71)#247*"60*"74*"81*"95)/300&ndash;9,700*"19',
+    '*"31*"46*"60)#420+!5+!6*"80)*500-a-year,!.*"40*"81+!4+!6)#600*%19.44',
+    '*"53*"74*"90)2722.11s.1&frac12;d*"50)&815.60+!8*"32*&54,000*"81)#905*"16*"20*"60+!8',
+    '($-0-0)"5m)&a-week)\'million(".0*!4*!5*!6*!7*!8*%s.0d.)#11m*$27m.*!3*!4',
+    '*!5+!m*!6*$7.10*!9)"21*!4*25&ndash&pound;8.55+!m*!6*!7*"9m*$s.6d)#34m*!9',
+    ')"44*!8*"bn)050&ndash&pound;8+!0*!1*#2bn*!7*#bn.*!o*%s.0d.)\'60/40oz*!2*!6*#81m',
+    '*!0*!3*\'5/250ml+\'inc.vat*"6p*"bn)#80p*"bn)#96m*!7+!6*!8*"9.(#/50(00&ndash&pound;90',
+    '1%5,000)(,000,000-.-&pound;80,000.%a-man-!.)0.16&shilling;4d.,!s+!m*"20*"3m*"42+!6*!5+!0+!m',
+    '*!8+!0*"9m)$/kw/)+0&ndash;8001#900*2,000&ndash;900,000.&-rated*!-+\'a-night-$week+(per-term*!.+"00*\'million',
+    '*$,399+#469)%2,208)%3,000)%4,680*#.48*!9)%5,128)!8*$,000+#522+#853)!9*#.3m)"pp',
+    '*#769*#950)".2+!0+!m*"50+!m*"60*"7m*"99)"0.*!m)!1*$,000*!m',
+    ')!2*$,000)!3*#.57)%4,300*!9)%5,000.$,000*!0)%6,000)#7.4*!m)!8*#.7m)%9,000',
+    '(22,000&ndash;96,600*#106*#700)!.*"00*"20*"57*"80)%0,280)%1,000)#2.9)%3,320*!m)!4*$,000',
+    ')\'million(23,000&ndash;97,000*0300&ndash;83,750+"50*#400*#578)$.10s+!m*"32*!5*!8)%0,000*!0)!1)%3,333',
+    '*#.80*!m)!4)#5.2)$6.5m+"67)&7/acre)"8m)!9)\'million(&4,000m)#.26*"30*!6*!7',
+    '*"95)%0,000*!m)"11)!2)!3*$,000)!4*(,900,000)%6,000*#.5m*!m)!8*$,440)%9+vat',
+    '7"706&90,000)#,00,\'0-worth*#134+"86*#500*#789*#800+"62)+-&pound;115)$.000*"10*!3*!5',
+    '*"8m*"9m)%/week)10&ndash&pound;8007#900**,000-rated*--&pound;1,000*%/acre*!0+"00)%1,000)"2m)!3*$,000)%4,000',
+    ')"5m)!7*!0)%8,000*!5*!m)"9m(%6,234*#324*#500)&-worth)-.2.8&frac12;d*"4m*!6*"85',
+    ')%2,000)$3.15+!8)%4,000)"50)%7,000)!9*$,757(%7,217+"78*1300&ndash;103,100*#800*#950)#.00*"2k',
+    '*"4m*"50*!6*!8)"00+"00)%1,815)!2)$3,00)%8,683)!9*#750)"bn)\'million(,8,000-a-year',
+    '*#700*#842)".3+!m*"50*"60+!m*!8+!m*"9m)%0,000)$3.01*!3)%4,000)%5,000',
+    '*!0)"7m)%8,000)%9,000($9.2m*!4+!9+!m*"50*"69*!8+!m)%1,499)%2,000*#.1m',
+    ')!8)$9.99)\'million($:4:0(!k("pp\'*8&frac12;m).ndash&pound;48(1,000&ndash;10,000,!m*"50)#120*"43+!4*"50',
+    '*"99)#222*&50,000+!1*"80)\'316,920*"27*"30+%1,557+!5,#.00*"50+!6+!7*"99',
+    '*"32*"63*"84*"95)0500&ndash;11,000,\'-a-year*"33)#620*"30)#728*"65+!9*"75)"80*"74',
+    ')#925*"50+!7*"76(%-12-6*#7-0)&a-pair(!.)%00the*#1/m*!5*!9)(10/500ml+!s*!2',
+    ',$50ml*!6*\'million)#23m*!4*%5+vat)"34*!6+\'million*(7million*!8)"42*!7*29&ndash&pound;8.99)&50+vat',
+    ',$6.50*!5*!6*!9+1&ndash&pound;8.99*"bn)#62m*!4*#97m)"73+2&ndash&pound;15.28*!4*!9*"bn)"84',
+    ')#91m*\'5/120ml.#5ml+!p*!6+!m*!8*\'million(+0&ndash;87m)1,000&ndash;93,300-$,000-/-&pound;100,0006&20,000.*per-season+"29',
+    '*#427+"59*0700&ndash;90,900)#-90**million-a-)#.15*"4m*"50*"65*!8+!4)-0&ndash;1,0003#2002#.2m1\'900,000',
+    '4#1004#200+!a*\'million)!1*$,000)%3,088)!4)"5m)%63,36)!7)"84)!9)(m-a-year*&a-year',
+    '+"50*#611)".1+$5.0d*"20*"69+!m*"7m*"84+!8+\'million*"90+!5)"0m)%1,942',
+    '*$,219)$5.00)%7,700)!8*$,000)%9,000)!k(,2,000-a-year*#600+"12+"80*#750)".0+!0+!2',
+    '*!5+!0*"68+!m*"89*"95)"0m)%1,300)$2.32*!m)#3.9)"50)$6.05)%8,000+#345',
+    ')\'billion(%3,330*#604*&812.00)#.00*"29*!3*"50+!m)$0.42*!0*\'billion)!1*$,000)%2,500',
+    ')!3*$,000*".3)$4.6m*!m)%5,000)%6,409*\'million))7,000,000*\'million)$8.32)"90*!5)!k(*4&ndash;00',
+    ')$,600)#.15*"32+!m*"4m*"75+!m*!8)"05+1&ndash&pound;9242)!1*#.75)%2,000)!3*$,947',
+    '*$,000)!5*$,000)"6m)!7*\'million)!8*$,000)%9,000*#.00+"95,!9)"m.*&illion(*5&frac12;m',
+    ')$,800-.&ndash;126,000)#.10*"5m*"60*"95+!m)"0.+"21)%1,000)"2m)$5,00)$6.00)$7.50+"75',
+    '*!m)!8*!m(%6,154+"92*#375*#400*#950)".2*"3m*!4+"5p*!6)"00)%1,100',
+    '+#350)%4,700*!9)"50)$6.00)%7,000*$.29p)%8,000*!0*!4)%9,500*#.00+"50(%7,500-.&ndash;112,500',
+    '*"4m)!1*$,000)%5,000)%6,208*".2)*7.5million)(9,026.73*".1)\'million(%8,200*#300+"58*#480*#900',
+    ')&.14.11*!2+!m*"50+!m*"68*(7million*"86)"0m)!1*$,000*\'.16s.6d)!2)!3)!5',
+    ')!6)$8.86)!9($9,00*#285)#.60+!7*"80*&95+vat)%0,000)!1)%2,000)!3)!4)%5,000',
+    ')%6,000)!7*!0)$8.56+"98)"9.+"00+"90(%:10:0(*l.4million("m.("oo\'+9&frac12;m.(!*(1,000&ndash;12,000',
+    '-&a-year-%worth+!5*"15*%29.50**35.11s.0d.)#147*)50-a-year*"60*"70+!5*"80,&-worth)#201+!5',
+    '*"30+%4,276+!9,$,000)#300*"50+!4+!6*"60*/75&ndash;12,500*#99.)#420*"81)1500-&pound;11,000*"33',
+    '*"25)\'700,000*"12)#801+(7.17s.9d*516&ndash&pound;15,372*"57*"63)7907&ndash&pound;13,262+*%46.80*"54,3&ndash&pound;12,438+!6*"70+!7',
+    '(#-13($.013+!5*!5*"6m*"8m)#11m*!4+#.6.*!5*!7*!9)#21m*!6*"8m',
+    '*!3+!p*!5*!8)"40*!3*"5m*\'million)"51*!2*"4m*!5*!7*!9+!m',
+    '+!m*"5p)"71*\'5/150ml*!9+!m*!m)$803m*!4)#95.*%9/4oz*)shillings(30,000&ndash;120,000-$,000-%-plus',
+    ')".5+!0*"91)30&ndash&pound;1,0008*9,000/week*.,000&ndash;1.2*#.3m*\'million)%29.50)$5.00+"94)%6,000*!.*!0)!7',
+    ')!9*$,000)&m-plus(%1,500*#660*1700&ndash;128,000*#900)#.16*"3m*"49*"5m*"9m)!0*!m)%1,608',
+    ')%3,280)%4,000)"5m)"7m)"8m)$9.65+"9m)\'million(%2,464*1900&ndash;113,500+"50)#.00*"3m*!5+!0',
+    '*!7*"95)%1,919)"2m)%3,000*#.57)!6)%7,500)"99*!m)\'million(%3,224+"82*1750&ndash;156,250*#800',
+    ')".0+!0*!1*!2+!0*!3*"40*"7m)*/kilowatt/+&w/year*%tonne)!2*$,000*!m)!3',
+    ')!6)%7,000+#500*!0)!9(%4,000*#445)#.00*"10*#46m+!7+!m*!6*"7m)%0,403',
+    ')$2.1m)!3*$,000)%4,400*"2m)"5m)%6,000)$7.8m)%9,875*#.00+"95*!m)"m.*&illion(35,240&ndash;119,000',
+    '*#810)+-&pound;150)#.28*"50*"7m*"8m)"0.)%1,027*#.47)%2,200*".4*!m)%4,000)!5*!m',
+    '*$.71p)!7)!8*$,400)\'million()6,000,000*#144*#500*#678)".1+!5*!4*"50+!5+\'million',
+    '*!m)%1,000)!3*#000)$4.51)!6*$,000)"7m)%8,000(%7,070*1500&ndash;122,000)#.30*(5million*"70*"98',
+    '*"0m*!m)"10)!2*!5)!4)%5,000*!m)56,000&ndash;1,220,000+#800)"7m)"9m(38,000&ndash;163,000)".0+!0',
+    '*!5*"7m*"85+!m)%0,400*!m)!1)%2,000)%5,000)!6)!7*!m)!9*$,000*#.11',
+    ')\'million(%9,000*1500&ndash;121,600*#840)#.1m*"35*!5*"90+%5+vat)%0,000)%1,000)$5.95)%6,400*!m)"7m',
+    ')%9,999*!5)"pp("oo("th\'"as\'%barry(\'illions\'-concessionary\'!e(\'arnings\'!f\'"gg\'!h((it-squad',
+    '("30(17.10&amp;shilling(,r&pound;6.7m\'!k\'$l.00*!5)"68)#84m(%0,000)%0,000*!m)!m("20)!5)!m',
+    ')!4)!m("65)!m(!7($l.29\'"m3\'*n/&pound;r\'!o(".6\'"p/(%2,000("oa)(und1,100.#500',
+    '-"00-%2.10s-"50-!6-!8,%2,243-$.10s-!0-#500,&32,000-"94,!4-$,596.#930-$.15s',
+    ',%6,202-$.10s-"50,&72,356,%8.10s-"00,!9-$,000-%4,000,!l\'$rain\'&s1,000)%5,400)%6,100(&24,300',
+    ')%7,575(%4,875(&61,875(%7,700(&84,690((yr10,430*&61,875\'%there\'!w\'$x.99()xxmillion"4rime=r&prime;f&prime"0sgr;40-synthesis&\'defined&!f',
+    '!%radic&";2\'#3:2#$rr;0&#bdr&"ch\'!u&!d\'"rb&"fu(!r&$head&#rfu&#ubr\'"fl',
+    '\'"rf&(x&rarr;o&$yeah"0caron&iacute;zky\'5;et&ecaron;zov&aacute"3ehy;1783&ndash;1809&)additions&\'between\'-ibliographies&)centuries\')ollective&&french&#his&*investment\'!s',
+    '&$like\'#oss&%mates\'#ean&#not&)populated&(requires&$some&%their("is&%would"$gr;c$!_!4sacute;a&nacute;4kar)%nkara',
+    '(#lub(1mig&lstrok;y-rydz(%wibno"+caron;aloun(/i&scaron;atovac1"ko)*m&aacute;k)$ptar(\'kriljna)-voreck&yacute(#lik(*p&iacute;z)+a&ccaron;ek($tenc)\'okavski',
+    ').upartsk&aacute*#rsa(%vanda+&kmajer)"ec*,stkov&yacute#*edil;eriat"&ect;.2&#1.1)!8("21&&2.10.2\'"47\'"56(!7',
+    '(!6(!7\'"80(!3(!6&!5\'"68\'"91(!4&#888&#935&!s"-gr;-character\'(omponent%!h',
+    '$!_"&harp;4("th\'*5&ndash;10("00("th#&illing"&im;0.2%!1&$00hz\'#khz&"mg&%ng/ml%"2%&".5',
+    '%"30&"30%"4%&"00%!5&)&micro;ci&%-fold&!0%!6%#70%%$zero"#up1!+tcedil;uica"$gr;."\'hgr&deg',
+    '%\'=&pgr/2&\'-&pgr/2#.orn&aacute;ttr()elig;ttir&);&aelig;c\'&eccean"&ilde;s#/mes&dollar;2.50&$;110($2.50)"5.("40)!2("50*"00',
+    '(!7("ft\'#225(!4("50("62(!7(!8\'!3(!2(!3(!4(!5(!6(!7',
+    '\'%5&ins(!0(!7\'"60(!5\'#7.5\'"85\'"91(!4\'"gf\'"kg\'%molal\'%price!+uacute;jezd"&macr;p',
+    '"-uml;berlingen)&mensch)\'siedler)(wachungs&*lemnoukogu!Lverbar&lt&gt;top*&amp&amp&lt&gt;conf*&verbar(9verbar;dxe5&verbar&verbar/2fxe6&verbar&verbar/4qc8&verbar&verbar;21\'";a(!c(0directory&verbar((e&verbar(%guess($hush',
+    '(&keegan)*irkpatrick(*management*"ry)&enuhin)\'ountain($once((r&verbar(#sir(#the(!x((y&verbar!&yen/dm$&;1,600&".7',
+    '\'!8&!0\'$,000\'!5\'!9(".2&$10.4\'!6&!2\'!0&!3\'#0.8\'!2\'!8&"42',
+    '&#6.2&"92%%2,000&".1\'!5\'!6\'!8&#0.9\'!3\'!6\'!m&#3.9&!5\')&ndash;30\'"0m',
+    '&"63&!7%!3&!0\'".5\'!0\'!m&!1\'!7&$3.4m&"60&!8%%4,000\'#200&!3',
+    '\'".6&!5%%5,000&"00&"70%%6,400&".7&!4\'!2&#75m%#7.3\'"5m&#0.3%!8&"43',
+    '\'!5&#8.6\'!5%#930\'!1&$64.2!5zcaron;ampi&oacute;ny(,elezn&aacute(*i&ccaron;a**zcaron;kov)"vi+!o()loutkovou((upanates"#gr*',
+    '"%whizz"#yes!!-"#she!!1"*4&ndash\'18"!6""90##92\'!%20/20#\'s-style"!8!"32"!3"$4.95',
+    '"!7"!9!"40#\'s-style"!1"!2"!9!$50\'s#\'s-style$&/biker%%early"*3&ndash\'61"!4""58"!7',
+    '""83"*9&ndash\'70#&/early!+70&ndash\'71#$/\'71#,s-influenced&"sm$"/i"\'1/early"*2&ndash\'73"*3&ndash\'74"!5"$8/79#!s!$80\'s',
+    '""2s"(6&dash;7"%8/\'89"*9&ndash\'90!!9""0a#"ss"*1&ndash\'92"!o#!s!&=-0.20&!3&!4#%152.2"$0.36',
+    '$"44%!8$"50%!1%!4"$1131!(a\'-level""ah"#ber"%ccess$&idents#"ts"!e"$fter"*ggression\'',
+    '#!d#$rrys"!i"\'lf-past#"l\'$%iance)!\'#$most#)ternative""m\'#!.#&brogio#$mers##ong#&pstead',
+    '#)usez-vous"\'ndbasin$$icap%"n\'%$work$$lin\'$%somes$!y%#man#&gelina$!s#-ky&rehy;panky#$some"\'pennies#&penin\'',
+    '$#ier%$ness"#rad$$ssed#)d-\'earted%&earned$!.$#est$$ship#)e-brained#$gues#!k#%monic#$tley"#ted',
+    '#(tempting$%itude"\'uthor\'s$$umn\'"!v#&e-a-go$"n\'"!w#!k$!e!!b"$ack\'#\'dinage\'##nd\'%"y\'',
+    '"!e#%cause#%fore\'#(lemnites#"n.##st\'"%ible\'#$ding#\'llykins"$lack#$oody$"wn##ue\'"$onus#"ot',
+    '##xes#"ys"\'reaking#$ight$$tain"$urnt$!y##ses"&y-eeee!"ca#"ll%#ed\'#"ne$&onists#&pture\'',
+    '$#ion"%entre#%pting"\'hagall.$%mpion$#nge$#ser#*eerfulness#&ildren$%mneys#$utes")igarette\'##vil"#lip##ose',
+    '#"ld$\'lective$)onialism\'#$ming$\'munists#(nclusive$%sents%$ider%\'piracy\'$\'tinuous(#um\'%(ractual\'#$pter##rse#(untering',
+    '$!p#&eating$#ted#*osscourse\'"$ycle!%daddy##ily#(mnation\'#%rling(!\'#"z\'"&ebates#-creolisation\'#"ep#3in-dividualisation\'',
+    '$)tinations"\'ialogue#!e#\'fferent"$oesn#!h#$n\'t.##or\'#"wn"!r"$upe\'%!s!"e\'"#ach#)dquarters',
+    '&!y##rse$(t-broken&\'warmin\',!g%%aches%!y#"st#$ting$!s#%venly$#ier%"ng"!d#$ward',
+    '"!f""go$$tism"$ight&#een&&y-four(%three#$ther"%lpful"*m_in_touch#*ancipation#!s$%elves"+ncyclopedic#%joyed',
+    '#%tity\'"#pic""r.#!d##nie##oes$"ic%"ne"%scape#$say\'"#tic"$urop"&venin\'$!r%%yfing',
+    '#&amine\'#$cept#&isting$"t\'#%plain$$ress!,face-to-face$$tory#%ilure$#th\'#"na#"rt#&vonius"#ear#)mininity\'',
+    '"+ingerprint\'#"sh#"ve"(ollowing#\'otfall\'#%rties%&y-five(#our#"ur"$rank#$idge#!o#"ye"$uck\'!!g',
+    '#"ys"*eneration\'$%uine\'"$iant#"ve%!n"%lobal"!o#"lf#\'odnight#!t"%rant\'##een&&house\'#$ief\'',
+    '$"rs#(lfpenny\'$$low\'##nds$!g#"rd%!\'$$gazy$!k##te\'"$eavy&!\'##ld\'#!n$#ce\'',
+    '#!y"\'ighest\'##nds#"re#!s"#ole##me\'$%icide#"od#%ppers#&spital$$tel\'##urs$*sekeeping\'&%work\'',
+    '"#ure!,igh-falutin\'$#est"(lliberal"%mport"(n-depth\'#\'cluding#\'decency("t\'%(pendents#)fluencing$(ormation*#ve\'##ges#&sisted',
+    '%)rnational$%ifada"*ppidy\'oys."%ssue\'"$tem\'#!s!!j"!\'"%acki\'%*son-style\'#"ma##net""c\'""ed#%nkins',
+    '"$izz\'"#ohn!+k&eacute;pi"$atie#!y"&eepers%#ing#"pt"&ingdom$$ship!"l\'"%adies##t\'n#!y"!e',
+    '##ccy$&trical##ila#!s"$ific#%ghtly#$kely#%nford"&l_even#!o"#oad#$ndon$%gside&\'tanding#\'ody\'ell',
+    '#"st#%wance$"er!$m_at#"no"$abel##gic#!n#&rgaret$$iana#$toes#$zing"$eans#!g#!n',
+    '#&ssage\'"#ind$(i-groups$$uet\'%!s#"ss"$laen"(mmmmnnff"*oderately\'#$ngst#"re$$ning#%ther\'#"ve#(zambique',
+    '##mmy!$nana#$sty\'#%vvies"#eed#\'gative\'##ver##wer$!s"#igs#&neties#!t"$o.6\'#*n-genuine\'%*marketable',
+    '#!s##tes#&vember!#oak"#bbs#(ligatory"(ff-task\'#$ten\'"!k#!\'"!l#"es#%ogies#!y"\'me-made',
+    '""ne$%-offs$"st$%ymoon#"ly"$okey#&ligans##min##ver&"ed&#ing"&peless"$race#\'dinary\'#$rors',
+    '"\'spital.(!s"#ur\'#)sekeeping"\'vercome%(trousers!%pain\'#\'radigm\'$#don$!t%\'itioned#-ul\'/squatters#(wnbroker"#dg\'"%eople',
+    '".hyllosilicates"\'ictures##ece"%laces$#net$%stics$$ying""on#"oh$!r#%ssums#$wah\'\'\'&lt+&gt$#er\'"-re-industrial',
+    '$\'ference$$lims$$sent#$ime\'$#nny$$thie$$vate\'(isation\'#&obably$$ceed$$fits$(pelling\'$)visional\'",sychiatrists&(ological',
+    '!&quack\'#$eers\'!.##ick$"ns#\'otation!&raider##nk\'##oul#*t-running\'"#e_a%\'_little$$sort$"up#"al',
+    '#(ciprocal$&ycling#\'ferring#&lative#*naissance\'#$peat#%quest#&search%#rve$(witching#(volution"$ived",ob\'/producer##und##yal',
+    '#$ncie!"s\'##all#$much".-hertogenbosch""69"%_a_er$!n$!s$!t$#way#\'because##due#$ever#*getting_on',
+    '#"in%)_response#$just#"no##old',
 )
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# AUTO-GENERATED - DO NOT MODIFY
+
+# Number of words in each bucket (index 0 = bucket 1)
+sizes = (
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6695,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+    6694,
+)
@@ -7,34 +7,176 @@ Provides CLI access to all major API operations:
     bnc-bucket <word>              Get frequency bucket (1-100)
     bnc-freq <word>                Get relative frequency
     bnc-expected <word> <length>   Get expected count in text of given length
+    bnc-lookup serve               Run the lookup daemon
+    bnc-lookup http                Run the HTTP/JSON front-end
 
 All commands print results to stdout and exit with code 0 on success,
 1 if the word is not found in BNC.
+
+bnc-exists, bnc-bucket and bnc-freq also accept --stdin or --file PATH to
+answer a whole stream in one process: one token per line (or every
+whitespace-separated token with --tokenize), written as TSV (default) or
+JSON lines (--format jsonl). Streams go through FindBatch, so each distinct
+token is looked up once per run, and output is written one batch at a time.
+
+A word starting with '-' (e.g., the suffix token '-ing') is read as the
+word, not as an option, as long as no word was given before it; write
+'--' before the word to make this explicit (bnc-exists -- -ing).
+
+Single-word lookups are forwarded to the lookup daemon (see server.py) when
+one is listening, and answered in-process otherwise.
 """
 
+import argparse
+import json
+import os
+import signal
 import sys
 
 import bnc_lookup as bnc
+from bnc_lookup.find_batch import FindBatch
+from bnc_lookup.find_bnc import FALLBACK_MODES
+
+# Tokens answered per lookup call and per write in streaming mode
+BATCH_SIZE = 8192
+
+
+def _parse_args(prog: str, description: str) -> argparse.Namespace:
+    """Parse arguments shared by the single-word and streaming commands.
+
+    Args:
+        prog: Command name, used in usage messages.
+        description: One-line description for --help.
+
+    Returns:
+        Parsed arguments. Exits with code 2 if neither a word nor an input
+        stream was given, or on an unknown option.
+    """
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    parser.add_argument('word', nargs='?', help='word to look up')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--stdin', action='store_true', help='read tokens from standard input')
+    source.add_argument('--file', metavar='PATH', help='read tokens from a file')
+    parser.add_argument('--tokenize', action='store_true',
+                        help='split lines on whitespace instead of reading one token per line')
+    parser.add_argument('--format', choices=('tsv', 'jsonl'), default='tsv', help='streaming output format')
+    parser.add_argument('--fallback', choices=FALLBACK_MODES, default='plural', help='inflection fallback mode')
+    args, extra = parser.parse_known_args()
+    # A word such as '-ing' looks like an option to argparse; it is the word unless one was given
+    if len(extra) == 1 and args.word is None and not extra[0].startswith('--'):
+        args.word = extra[0]
+    elif extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    if args.word is None and not (args.stdin or args.file):
+        parser.print_usage(sys.stderr)
+        sys.exit(2)
+    return args
+
+
+def _read_tokens(stream, tokenize: bool):
+    """Yield tokens from a text stream.
+
+    Args:
+        stream: Text stream to read lines from.
+        tokenize: If True, yield every whitespace-separated token; otherwise
+            yield each non-blank line, stripped.
+
+    Yields:
+        Tokens in input order.
+    """
+    for line in stream:
+        if tokenize:
+            yield from line.split()
+        else:
+            token = line.strip()
+            if token:
+                yield token
+
+
+def _stream(args: argparse.Namespace, method: str, field: str, render) -> None:
+    """Answer every token of the input stream and write one line per token.
+
+    Args:
+        args: Parsed command-line arguments.
+        method: FindBatch method name ('exists', 'bucket' or 'relative_frequency').
+        field: Result key used in JSON lines output.
+        render: Formats a result for TSV output.
+    """
+    if args.stdin:
+        _write_results(sys.stdin, args, method, field, render)
+    else:
+        with open(args.file, encoding='utf-8', errors='replace') as stream:
+            _write_results(stream, args, method, field, render)
+
+
+def _write_results(stream, args: argparse.Namespace, method: str, field: str, render) -> None:
+    """Answer the tokens of an open text stream, one batch per write (see _stream())."""
+    finder = FindBatch(fallback=args.fallback)
+    out = sys.stdout
+    for batch, results in finder.windows(_read_tokens(stream, args.tokenize), method, BATCH_SIZE):
+        if args.format == 'jsonl':
+            lines = [json.dumps({'word': token, field: result}) for token, result in zip(batch, results)]
+        else:
+            lines = [f'{token}\t{render(result)}' for token, result in zip(batch, results)]
+        out.write('\n'.join(lines))
+        out.write('\n')
+    out.flush()
+
+
+def _forward(*fields: str) -> str | None:
+    """Answer a single-word request through the lookup daemon, if running.
+
+    Args:
+        *fields: Request fields (command followed by its arguments).
+
+    Returns:
+        The daemon's response line, or None if no daemon answered (or the
+        socket belongs to another user, or a field cannot be sent).
+    """
+    from bnc_lookup.server import Client, socket_path
+
+    path = socket_path()
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        with Client(path) as client:
+            response = client.request(*fields)
+    except (OSError, ValueError):
+        return None
+    return None if response.startswith('ERR\t') else response
+
+
+def _render_freq(result: float | None) -> str:
+    """Format a relative frequency for TSV output."""
+    return 'None' if result is None else f'{result:.6e}'
 
 
 def exists():
     """CLI entry point: check if a word exists in BNC."""
-    if len(sys.argv) < 2:
-        print('Usage: bnc-exists <word>', file=sys.stderr)
-        sys.exit(2)
-    word = sys.argv[1]
-    result = bnc.exists(word)
+    args = _parse_args('bnc-exists', 'Check if a word exists in the BNC.')
+    if args.word is None:
+        _stream(args, 'exists', 'exists', str)
+        return
+    response = _forward('exists', args.word, args.fallback)
+    if response is not None:
+        print(response)
+        sys.exit(0 if response == 'True' else 1)
+    result = bnc.exists(args.word, fallback=args.fallback)
     print(str(result))
     sys.exit(0 if result else 1)
 
 
 def bucket():
     """CLI entry point: get frequency bucket for a word."""
-    if len(sys.argv) < 2:
-        print('Usage: bnc-bucket <word>', file=sys.stderr)
-        sys.exit(2)
-    word = sys.argv[1]
-    result = bnc.bucket(word)
+    args = _parse_args('bnc-bucket', 'Get the frequency bucket (1-100) of a word.')
+    if args.word is None:
+        _stream(args, 'bucket', 'bucket', str)
+        return
+    response = _forward('bucket', args.word, args.fallback)
+    if response is not None:
+        print(response)
+        sys.exit(1 if response == 'None' else 0)
+    result = bnc.bucket(args.word, fallback=args.fallback)
     if result is None:
         print('None')
         sys.exit(1)
@@ -43,11 +185,15 @@ def bucket():
 
 def freq():
     """CLI entry point: get relative frequency for a word."""
-    if len(sys.argv) < 2:
-        print('Usage: bnc-freq <word>', file=sys.stderr)
-        sys.exit(2)
-    word = sys.argv[1]
-    result = bnc.relative_frequency(word)
+    args = _parse_args('bnc-freq', 'Get the relative frequency of a word.')
+    if args.word is None:
+        _stream(args, 'relative_frequency', 'relative_frequency', _render_freq)
+        return
+    response = _forward('freq', args.word, args.fallback)
+    if response is not None:
+        print(response)
+        sys.exit(1 if response == 'None' else 0)
+    result = bnc.relative_frequency(args.word, fallback=args.fallback)
     if result is None:
         print('None')
         sys.exit(1)
@@ -68,6 +214,11 @@ def expected():
             f"Error: text_length must be an integer, got '{sys.argv[2]}'", file=sys.stderr)
         sys.exit(2)
     rounded = '--rounded' in sys.argv
+    fields = ('expected', word, str(text_length)) + (('rounded',) if rounded else ())
+    response = _forward(*fields)
+    if response is not None:
+        print(response)
+        sys.exit(1 if response == 'None' else 0)
     result = bnc.expected_count(word, text_length, rounded=rounded)
     if result is None:
         print('None')
@@ -76,3 +227,32 @@ def expected():
         print(result)
     else:
         print(f'{result:.4f}')
+
+
+def main():
+    """CLI entry point: bnc-lookup <command>."""
+    parser = argparse.ArgumentParser(prog='bnc-lookup', description='BNC Lookup utilities.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve_parser = commands.add_parser('serve', help='keep the tables loaded and answer lookups over a Unix socket')
+    serve_parser.add_argument('--socket', metavar='PATH', help='socket path (default: $BNC_LOOKUP_SOCKET)')
+    serve_parser.add_argument('--no-preload', action='store_true', help='load shards on demand instead of at start-up')
+    http_parser = commands.add_parser('http', help='answer batched lookups over a local HTTP/JSON API')
+    http_parser.add_argument('--host', default='127.0.0.1', help='interface to bind (default: 127.0.0.1)')
+    http_parser.add_argument('--port', type=int, default=8765, help='TCP port (default: 8765)')
+    http_parser.add_argument('--no-preload', action='store_true', help='load shards on demand instead of at start-up')
+    args = parser.parse_args()
+    # Exit normally on SIGTERM so that the socket file is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        if args.command == 'http':
+            # Imported here so that the lookup commands do not pay for it
+            from bnc_lookup.http_server import serve_http
+            serve_http(args.host, args.port, preload=not args.no_preload)
+        else:
+            from bnc_lookup.server import serve
+            serve(args.socket, preload=not args.no_preload)
+    except (RuntimeError, OSError) as e:
+        print(f'Error: {e}', file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
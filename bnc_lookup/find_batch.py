@@ -0,0 +1,231 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Batch lookups over many tokens.
+
+Real token streams are highly repetitive: a few thousand types account for
+most tokens. FindBatch resolves each distinct token once through the
+regular lookup classes and remembers the answer for the lifetime of the
+instance, so a long run (e.g., the streaming CLI) pays the hash and
+fallback cost once per type rather than once per token. The shard caches
+of the underlying modules are shared by every instance.
+
+Deduplication and scatter happen in the same pass: a token seen before
+is one dict probe, and a new token is resolved once and its answer
+remembered for every later occurrence. A separate dedupe pass
+(dict.fromkeys over the input, then a map() back over it) was measured
+and is slower on CPython, because it hashes every token a second time.
+
+exists(), bucket() and relative_frequency() return one list for the whole
+input. windows() consumes its input lazily and yields the results window
+by window, so a token generator larger than memory is answered in bounded
+space.
+
+The remembered answers are dropped once more than MAX_MEMO distinct tokens
+have been seen, which bounds memory on unbounded streams, and whenever a
+domain overlay is loaded or cleared (see overlay.py) or another lexicon
+version is installed (see lexicon.py). A call (or window) that overlaps a
+lexicon swap is answered again on the new version.
+"""
+
+from itertools import islice
+
+from bnc_lookup import lexicon, overlay
+from bnc_lookup.find_bnc import FindBnc, _check_fallback
+from bnc_lookup.find_freq import FindFreq
+from bnc_lookup.find_rf import FindRF
+
+# Distinct tokens remembered per lookup type before the memo is reset
+MAX_MEMO = 1_000_000
+
+# Default number of tokens per window yielded by windows()
+WINDOW = 65_536
+
+# Lookup methods accepted by windows()
+METHODS = ('exists', 'bucket', 'relative_frequency')
+
+
+def _windows(tokens, size: int):
+    """Split an iterable of tokens into lists of at most size tokens.
+
+    Args:
+        tokens: Iterable of tokens (consumed lazily).
+        size: Maximum window length.
+
+    Yields:
+        Non-empty lists of tokens.
+    """
+    iterator = iter(tokens)
+    while window := list(islice(iterator, size)):
+        yield window
+
+
+def _resolve(tokens, memo: dict, lookup) -> list:
+    """Resolve tokens through a memo, calling lookup once per new token.
+
+    Args:
+        tokens: Iterable of raw tokens.
+        memo: Token -> result cache, updated in place.
+        lookup: Single-token lookup function.
+
+    Returns:
+        List of results aligned with tokens.
+    """
+    results = []
+    for token in tokens:
+        try:
+            results.append(memo[token])
+        except KeyError:
+            if len(memo) >= MAX_MEMO:
+                memo.clear()
+            result = memo[token] = lookup(token)
+            results.append(result)
+    return results
+
+
+class FindBatch:
+    """Memoized batch lookups for exists, bucket and relative frequency.
+
+    Each method takes an iterable of tokens and returns a list of results
+    in the same order, identical to calling the single-word API per token.
+    """
+
+    def __init__(self, fallback: str = 'plural'):
+        """Configure the batch lookups.
+
+        Args:
+            fallback: Inflection fallback mode applied to every token:
+                'none', 'plural' (default) or 'morph'.
+
+        Raises:
+            ValueError: If fallback is not a known mode.
+        """
+        _check_fallback(fallback)
+        self._fallback = fallback
+        self._version = (overlay.version, lexicon.version)
+        self._exists = {}
+        self._buckets = {}
+        self._rfs = {}
+
+    def _check_overlay(self, lexicon_version: int) -> None:
+        """Drop remembered answers if the active overlay or lexicon changed.
+
+        Args:
+            lexicon_version: lexicon.version the answers will come from.
+        """
+        version = (overlay.version, lexicon_version)
+        if self._version != version:
+            self._version = version
+            self._exists.clear()
+            self._buckets.clear()
+            self._rfs.clear()
+
+    def _answer(self, tokens, method: str) -> list:
+        """Resolve tokens, again if a lexicon swap overlapped the call.
+
+        Args:
+            tokens: Iterable of words.
+            method: One of METHODS.
+
+        Returns:
+            List of results aligned with tokens, all from one lexicon version.
+        """
+        if not isinstance(tokens, (list, tuple)):
+            tokens = list(tokens)
+        while True:
+            start = lexicon.version
+            if start & 1:
+                start = lexicon._stable_version()
+            self._check_overlay(start)
+            try:
+                results = _resolve(tokens, *self._lookup(method))
+            except Exception:
+                if lexicon.version == start:
+                    raise
+                results = None
+            if lexicon.version == start:
+                return results
+            # The memo may hold answers of both versions
+            self._version = None
+
+    def _lookup(self, method: str):
+        """Memo and single-token lookup function for a method.
+
+        Args:
+            method: One of METHODS.
+
+        Returns:
+            Tuple of (memo dict, lookup function).
+        """
+        fallback = self._fallback
+        if method == 'exists':
+            finder = FindBnc()
+            return self._exists, lambda t: finder.exists(t, fallback=fallback)
+        if method == 'bucket':
+            finder = FindFreq()
+            return self._buckets, lambda t: finder.bucket(t, fallback=fallback)
+        finder = FindRF()
+        return self._rfs, lambda t: finder.relative_frequency(t, fallback=fallback)
+
+    def exists(self, tokens) -> list:
+        """Check which tokens exist in the BNC.
+
+        Args:
+            tokens: Iterable of words.
+
+        Returns:
+            List of booleans aligned with tokens.
+        """
+        return self._answer(tokens, 'exists')
+
+    def bucket(self, tokens) -> list:
+        """Get the frequency bucket of every token.
+
+        Args:
+            tokens: Iterable of words.
+
+        Returns:
+            List aligned with tokens: bucket number (1-100) or None.
+        """
+        return self._answer(tokens, 'bucket')
+
+    def relative_frequency(self, tokens) -> list:
+        """Get the relative frequency of every token.
+
+        Args:
+            tokens: Iterable of words.
+
+        Returns:
+            List aligned with tokens: relative frequency or None.
+        """
+        return self._answer(tokens, 'relative_frequency')
+
+    def windows(self, tokens, method: str = 'exists', size: int = WINDOW):
+        """Answer a token stream window by window, in bounded memory.
+
+        The input is consumed lazily, so it may be a generator of any
+        length; only one window of tokens and results is held at a time,
+        besides the memo. The active overlay and lexicon are checked before
+        every window.
+
+        Args:
+            tokens: Iterable of words.
+            method: 'exists' (default), 'bucket' or 'relative_frequency'.
+            size: Tokens per window (default WINDOW).
+
+        Returns:
+            Iterator of (tokens, results) tuples: a list of consecutive
+            input tokens and the list of their results.
+
+        Raises:
+            ValueError: If method is not one of METHODS or size is not positive.
+        """
+        if method not in METHODS:
+            raise ValueError(f'method must be one of {METHODS}, got {method!r}')
+        if size < 1:
+            raise ValueError(f'size must be positive, got {size}')
+        return self._answer_windows(tokens, method, size)
+
+    def _answer_windows(self, tokens, method: str, size: int):
+        """Generator behind windows(), so its arguments are checked eagerly."""
+        for window in _windows(tokens, size):
+            yield window, self._answer(window, method)
@@ -13,12 +13,17 @@ the singular form (with trailing 's' removed) is also checked.
 Includes contraction fallback: if a contraction like "we'll" is not found,
 the components ("we" and "'ll") are checked separately. This accounts for
 the BNC's tokenization of contractions into separate parts.
+
+The inflection fallback is selectable per call: 'none' disables it,
+'plural' (the default) strips a trailing 's', and 'morph' consults the
+precomputed inflected-form index in find_lemma.py before the plural rule.
 """
 
 import hashlib
-import importlib
 
+from bnc_lookup import metrics, overlay
 from bnc_lookup.normalize import normalize
+from bnc_lookup.shard_loader import import_table, load_once
 
 _cache = {}
 
@@ -34,6 +39,22 @@ S_CONTRACTION_STEMS = frozenset({
     'nothing', 'someone', 'something', 'let', 'one',
 })
 
+# Inflection fallback modes accepted by the lookup methods
+FALLBACK_MODES = ('none', 'plural', 'morph')
+
+
+def _check_fallback(fallback: str) -> None:
+    """Validate an inflection fallback mode.
+
+    Args:
+        fallback: One of FALLBACK_MODES.
+
+    Raises:
+        ValueError: If fallback is not a known mode.
+    """
+    if fallback not in FALLBACK_MODES:
+        raise ValueError(f'fallback must be one of {FALLBACK_MODES}, got {fallback!r}')
+
 
 def _get_hash_set(prefix: str) -> frozenset:
     """Load and cache the hash suffix frozenset for a given 2-char hex prefix.
@@ -44,10 +65,10 @@ def _get_hash_set(prefix: str) -> frozenset:
     Returns:
         Frozenset of 30-character MD5 hash suffixes for words in this bucket.
     """
-    if prefix not in _cache:
-        module = importlib.import_module(f'bnc_lookup.hs.h_{prefix}')
-        _cache[prefix] = getattr(module, f'hashes_{prefix}')
-    return _cache[prefix]
+    try:
+        return _cache[prefix]
+    except KeyError:
+        return load_once(_cache, prefix, import_table, f'bnc_lookup.hs.h_{prefix}', f'hashes_{prefix}')
 
 
 def _calculate_md5(input_text: str) -> str:
@@ -68,18 +89,33 @@ def _calculate_md5(input_text: str) -> str:
 def _hash_exists(input_text: str) -> bool:
     """Check whether a word's hash suffix exists in its corresponding bucket.
 
+    An active overlay (see overlay.py) is checked first, with the same digest.
+
     Args:
         input_text: The word to look up (should already be normalized).
 
     Returns:
-        True if the word's hash suffix is found in its bucket frozenset.
+        True if the word is in the overlay or its hash suffix is found in
+        its bucket frozenset.
     """
     if not input_text:
         return False
-    h = _calculate_md5(input_text)
-    prefix, suffix = h[:2], h[2:]
+    return _digest_exists(_calculate_md5(input_text))
+
+
+def _digest_exists(h: str) -> bool:
+    """Check whether an MD5 hex digest belongs to a BNC (or overlay) word.
+
+    Args:
+        h: 32-character MD5 hex digest of a normalized word.
+
+    Returns:
+        True if the digest is in the overlay or its suffix is in its shard.
+    """
+    if overlay.entries and h in overlay.entries:
+        return True
     try:
-        return suffix in _get_hash_set(prefix)
+        return h[2:] in _get_hash_set(h[:2])
     except ModuleNotFoundError:
         return False
 
@@ -117,49 +153,103 @@ def _split_contraction(word: str) -> tuple[str, str] | None:
     return None
 
 
+def _split_unlisted(word: str) -> tuple[str, str] | None:
+    """Split a contraction missing from the precomputed contraction tables.
+
+    freq/contractions.py and rf/contractions.py list every BNC word form
+    ending in a contraction suffix, and the 's form of every stem in
+    S_CONTRACTION_STEMS. A form they lack is therefore not in the BNC, and
+    if it ends in 's it is a possessive, which is never split. No allowlist
+    check is needed here.
+
+    Args:
+        word: A normalized word that is not in the contraction tables.
+
+    Returns:
+        Tuple of (stem, suffix), or None if the word is not a contraction.
+    """
+    for suffix in CONTRACTION_SUFFIXES:
+        if word.endswith(suffix):
+            stem = word[:-len(suffix)]
+            if not stem or suffix == "'s":
+                return None
+            return (stem, suffix)
+    return None
+
+
+def _resolve_exists(input_text: str, fallback: str) -> tuple[bool, str]:
+    """Check existence and report which path resolved the word.
+
+    Args:
+        input_text: The word to check.
+        fallback: Inflection fallback mode (already validated).
+
+    Returns:
+        Tuple of (exists, path), where path is one of metrics.PATHS.
+    """
+    input_text = normalize(input_text)
+
+    if _hash_exists(input_text):
+        return True, 'direct'
+
+    if fallback == 'morph':
+        # Imported here: find_lemma builds on the table modules that import this one
+        from bnc_lookup.find_lemma import _lookup_lemma
+        if _lookup_lemma(input_text) is not None:
+            return True, 'morph'
+
+    if fallback != 'none' and input_text.endswith('s') and len(input_text) > 3:
+        if _hash_exists(input_text[:-1]):
+            return True, 'plural'
+
+    # Contraction fallback: check if both parts exist separately
+    parts = _split_contraction(input_text)
+    if parts:
+        stem, suffix = parts
+        if _hash_exists(stem) and _hash_exists(suffix):
+            return True, 'contraction'
+
+    return False, 'miss'
+
+
 class FindBnc:
-    """O(1) word existence checker against 669,417 BNC word forms.
+    """O(1) word existence checker against 669,416 BNC word forms.
 
     Lookup flow:
         1. Normalize input to lowercase
         2. Compute MD5 hash
         3. Use first 2 hex chars as bucket prefix, remaining 30 as suffix
         4. Check suffix membership in the bucket's frozenset
-        5. If not found and word ends with 's', retry with singular form
+        5. If not found, apply the selected inflection fallback
     """
 
     def __init__(self):
         pass
 
-    def exists(self, input_text: str) -> bool:
+    def exists(self, input_text: str, fallback: str = 'plural') -> bool:
         """Check if a word exists in the BNC corpus.
 
         Performs case-insensitive lookup with automatic fallbacks:
         1. Direct lookup of the normalized word
-        2. Plural fallback: if word ends with 's' (length > 3), try singular
-        3. Contraction fallback: if word is a contraction, check if both
+        2. Morphological fallback (fallback='morph' only): known inflection
+           of a BNC word (e.g., "tweeted" → "tweet")
+        3. Plural fallback (unless fallback='none'): if word ends with 's'
+           (length > 3), try singular
+        4. Contraction fallback: if word is a contraction, check if both
            components exist (e.g., "we'll" → "we" + "'ll")
 
         Args:
             input_text: The word to check.
+            fallback: Inflection fallback mode: 'none', 'plural' (default)
+                or 'morph'.
 
         Returns:
             True if the word exists in the BNC (directly or via fallback).
-        """
-        input_text = normalize(input_text)
-
-        if _hash_exists(input_text):
-            return True
-
-        if input_text.endswith('s') and len(input_text) > 3:
-            if _hash_exists(input_text[:-1]):
-                return True
 
-        # Contraction fallback: check if both parts exist separately
-        parts = _split_contraction(input_text)
-        if parts:
-            stem, suffix = parts
-            if _hash_exists(stem) and _hash_exists(suffix):
-                return True
-
-        return False
+        Raises:
+            ValueError: If fallback is not a known mode.
+        """
+        _check_fallback(fallback)
+        if metrics.enabled:
+            return metrics.observe('exists', _resolve_exists, input_text, fallback)
+        return _resolve_exists(input_text, fallback)[0]
@@ -0,0 +1,316 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Lookups on UTF-8 encoded tokens.
+
+Tokens read from memory-mapped files or message payloads arrive as bytes.
+Decoding each one to str only to normalize it and encode it again for
+MD5 costs two copies and a str object per token. FindBytes hashes the
+bytes directly:
+
+    ASCII token (the common case)  -> bytes.lower() and strip, then MD5
+    anything else                  -> decode, normalize(), encode, then MD5
+
+ASCII needs no apostrophe or accent normalization, except for the grave
+accent, which normalize() turns into an apostrophe. A token that is not
+valid UTF-8 is not a word and is never found.
+
+A direct hit is answered from the shard tables without creating a str.
+Misses, and words ending in a contraction suffix, go through the regular
+str resolvers with the normalized word, so fallbacks, contractions and
+domain overlays give exactly the answers of exists(), bucket() and
+relative_frequency().
+
+The buffer methods take one buffer (bytes, bytearray, mmap or memoryview)
+and an array of offsets in the Arrow string layout: token i is
+buffer[offsets[i]:offsets[i + 1]], with surrounding whitespace ignored, so
+n tokens need n + 1 offsets. The buffer is never copied or decoded as a
+whole; only each token is copied out, as a small bytes object.
+token_offsets() computes the offsets of the whitespace-separated tokens of
+a buffer. Without offsets, the tokens are split on ASCII whitespace by
+bytes.split(), which is faster than slicing by offsets in Python but
+copies a buffer that is not bytes once.
+"""
+
+import hashlib
+import mmap
+import re
+from array import array
+from itertools import islice
+
+from bnc_lookup import metrics
+from bnc_lookup.find_batch import _resolve
+from bnc_lookup.find_bnc import CONTRACTION_SUFFIXES, _check_fallback, _digest_exists, _resolve_exists
+from bnc_lookup.find_freq import _digest_bucket, _resolve_bucket
+from bnc_lookup.find_rf import _digest_rf, _resolve_rf
+from bnc_lookup.normalize import normalize
+
+# Bytes stripped by the ASCII path: what str.strip() removes from ASCII text
+_WHITESPACE = bytes(c for c in range(128) if chr(c).isspace())
+
+# Contraction suffixes as bytes, for endswith()
+_SUFFIXES = tuple(suffix.encode() for suffix in CONTRACTION_SUFFIXES)
+
+_TOKEN = re.compile(rb'\S+')
+
+
+def _normalize_bytes(token: bytes) -> bytes | None:
+    """Normalize a UTF-8 token to the ASCII bytes that are hashed.
+
+    Args:
+        token: UTF-8 encoded token.
+
+    Returns:
+        The normalized word as ASCII bytes, or None if the token is not
+        valid UTF-8.
+    """
+    if token.isascii() and b'`' not in token:
+        return token.lower().strip(_WHITESPACE)
+    try:
+        text = token.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    return normalize(text).encode('ascii')
+
+
+def _resolve_exists_bytes(token: bytes, fallback: str) -> tuple[bool, str]:
+    """Check existence of a UTF-8 token and report which path resolved it.
+
+    Args:
+        token: UTF-8 encoded token.
+        fallback: Inflection fallback mode (already validated).
+
+    Returns:
+        Tuple of (exists, path), where path is one of metrics.PATHS.
+    """
+    word = _normalize_bytes(token)
+    if not word:
+        return False, 'miss'
+    if _digest_exists(hashlib.md5(word).hexdigest()):
+        return True, 'direct'
+    return _resolve_exists(word.decode('ascii'), fallback)
+
+
+def _resolve_bucket_bytes(token: bytes, fallback: str) -> tuple[int | None, str]:
+    """Look up the bucket of a UTF-8 token and report which path resolved it.
+
+    Args:
+        token: UTF-8 encoded token.
+        fallback: Inflection fallback mode (already validated).
+
+    Returns:
+        Tuple of (bucket or None, path), where path is one of metrics.PATHS.
+    """
+    word = _normalize_bytes(token)
+    if not word:
+        return None, 'miss'
+    if not word.endswith(_SUFFIXES):
+        bucket = _digest_bucket(hashlib.md5(word).hexdigest())
+        if bucket is not None:
+            return bucket, 'direct'
+    return _resolve_bucket(word.decode('ascii'), fallback)
+
+
+def _resolve_rf_bytes(token: bytes, fallback: str) -> tuple[float | None, str]:
+    """Look up the relative frequency of a UTF-8 token and report the path.
+
+    Args:
+        token: UTF-8 encoded token.
+        fallback: Inflection fallback mode (already validated).
+
+    Returns:
+        Tuple of (relative frequency or None, path), where path is one of
+        metrics.PATHS.
+    """
+    word = _normalize_bytes(token)
+    if not word:
+        return None, 'miss'
+    if not word.endswith(_SUFFIXES):
+        rf = _digest_rf(hashlib.md5(word).hexdigest())
+        if rf is not None:
+            return rf, 'direct'
+    return _resolve_rf(word.decode('ascii'), fallback)
+
+
+def _sliceable(buffer, offsets=None):
+    """Prepare a buffer for slicing tokens out of it.
+
+    bytes and mmap objects are sliced directly; other buffers through a
+    byte memoryview, whose slices must be copied out with tobytes().
+
+    Args:
+        buffer: Object supporting the buffer protocol.
+        offsets: Token boundaries to check against the buffer, if any.
+
+    Returns:
+        The buffer, or a memoryview of it.
+
+    Raises:
+        ValueError: If an offset lies outside the buffer.
+    """
+    if not isinstance(buffer, (bytes, mmap.mmap)):
+        buffer = memoryview(buffer).cast('B')
+    if offsets is not None and len(offsets) and (min(offsets) < 0 or max(offsets) > len(buffer)):
+        raise ValueError(f'offsets must lie within the buffer (0-{len(buffer)})')
+    return buffer
+
+
+def token_offsets(buffer) -> array:
+    """Offsets of the whitespace-separated tokens of a UTF-8 buffer.
+
+    Tokens are separated by ASCII whitespace. Each token's span runs to
+    the start of the next one; the whitespace it includes is ignored by
+    the lookups.
+
+    Args:
+        buffer: bytes, bytearray, mmap or memoryview.
+
+    Returns:
+        array('q') of n + 1 offsets for n tokens (empty for no tokens).
+    """
+    buffer = _sliceable(buffer)
+    offsets = array('q', map(re.Match.start, _TOKEN.finditer(buffer)))
+    if offsets:
+        offsets.append(len(buffer))
+    return offsets
+
+
+class FindBytes:
+    """Lookups on UTF-8 byte tokens, singly or as offsets into one buffer.
+
+    Results are identical to the str API for the decoded token.
+    """
+
+    def __init__(self, fallback: str = 'plural'):
+        """Configure the lookups.
+
+        Args:
+            fallback: Inflection fallback mode: 'none', 'plural' (default)
+                or 'morph'.
+
+        Raises:
+            ValueError: If fallback is not a known mode.
+        """
+        _check_fallback(fallback)
+        self._fallback = fallback
+
+    def _answer(self, name: str, resolve, token: bytes):
+        """Run a bytes resolver, recording metrics when enabled."""
+        if metrics.enabled:
+            return metrics.observe(name, resolve, token, self._fallback)
+        return resolve(token, self._fallback)[0]
+
+    def exists(self, token: bytes) -> bool:
+        """Check if a UTF-8 token exists in the BNC.
+
+        Args:
+            token: UTF-8 encoded word (bytes, or bytes-like).
+
+        Returns:
+            True if the word exists in the BNC (directly or via fallback).
+        """
+        return self._answer('exists', _resolve_exists_bytes, bytes(token))
+
+    def bucket(self, token: bytes) -> int | None:
+        """Get the frequency bucket of a UTF-8 token.
+
+        Args:
+            token: UTF-8 encoded word (bytes, or bytes-like).
+
+        Returns:
+            Bucket number (1-100), or None if not found.
+        """
+        return self._answer('bucket', _resolve_bucket_bytes, bytes(token))
+
+    def relative_frequency(self, token: bytes) -> float | None:
+        """Get the relative frequency of a UTF-8 token.
+
+        Args:
+            token: UTF-8 encoded word (bytes, or bytes-like).
+
+        Returns:
+            Relative frequency, or None if not found.
+        """
+        return self._answer('relative_frequency', _resolve_rf_bytes, bytes(token))
+
+    def _buffer(self, name: str, resolve, buffer, offsets) -> list:
+        """Answer every token of a buffer, resolving each distinct token once.
+
+        Args:
+            name: Function name used by metrics.
+            resolve: Bytes resolver.
+            buffer: Object supporting the buffer protocol.
+            offsets: n + 1 token boundaries, or None for whitespace tokens.
+
+        Returns:
+            List of n results.
+        """
+        if offsets is None:
+            # bytes.split() runs in C: faster than slicing by offsets in Python
+            tokens = (buffer if isinstance(buffer, bytes) else bytes(buffer)).split()
+            return _resolve(tokens, {}, lambda token: self._answer(name, resolve, token))
+        buffer = _sliceable(buffer, offsets)
+        copy = isinstance(buffer, memoryview)
+        memo = {}
+        results = []
+        append = results.append
+        for start, end in zip(offsets, islice(offsets, 1, None)):
+            token = buffer[start:end]
+            if copy:
+                token = token.tobytes()
+            try:
+                append(memo[token])
+            except KeyError:
+                result = memo[token] = self._answer(name, resolve, token)
+                append(result)
+        return results
+
+    def exists_buffer(self, buffer, offsets=None) -> list:
+        """Check every token of a UTF-8 buffer.
+
+        Args:
+            buffer: bytes, bytearray, mmap or memoryview.
+            offsets: n + 1 token boundaries (e.g., from token_offsets()),
+                or None (default) for the tokens separated by ASCII
+                whitespace.
+
+        Returns:
+            List of n booleans.
+
+        Raises:
+            ValueError: If an offset lies outside the buffer.
+        """
+        return self._buffer('exists', _resolve_exists_bytes, buffer, offsets)
+
+    def bucket_buffer(self, buffer, offsets=None) -> list:
+        """Get the frequency bucket of every token of a UTF-8 buffer.
+
+        Args:
+            buffer: bytes, bytearray, mmap or memoryview.
+            offsets: n + 1 token boundaries (e.g., from token_offsets()),
+                or None (default) for the tokens separated by ASCII
+                whitespace.
+
+        Returns:
+            List of n results: bucket number (1-100) or None.
+
+        Raises:
+            ValueError: If an offset lies outside the buffer.
+        """
+        return self._buffer('bucket', _resolve_bucket_bytes, buffer, offsets)
+
+    def relative_frequency_buffer(self, buffer, offsets=None) -> list:
+        """Get the relative frequency of every token of a UTF-8 buffer.
+
+        Args:
+            buffer: bytes, bytearray, mmap or memoryview.
+            offsets: n + 1 token boundaries (e.g., from token_offsets()),
+                or None (default) for the tokens separated by ASCII
+                whitespace.
+
+        Returns:
+            List of n results: relative frequency or None.
+
+        Raises:
+            ValueError: If an offset lies outside the buffer.
+        """
+        return self._buffer('relative_frequency', _resolve_rf_bytes, buffer, offsets)
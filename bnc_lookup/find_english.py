@@ -0,0 +1,140 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Early-terminating "is this English?" test by sequential sampling.
+
+Filtering a web crawl only needs to know whether a document's
+in-vocabulary rate (the share of its tokens that exists() accepts) is
+above a threshold. Looking up every token of a long document spends most
+of its work confirming a decision that was clear after a few dozen tokens.
+
+FindEnglish samples tokens at random, without replacement, in small
+batches and runs Wald's sequential probability ratio test (SPRT) between
+
+    H0: rate = threshold - margin     (not English)
+    H1: rate = threshold + margin     (English)
+
+with error rates alpha = beta = 1 - confidence. Each sampled token adds
+ln(p1 / p0) to the log-likelihood ratio if it is a BNC word and
+ln((1 - p1) / (1 - p0)) if not; sampling stops as soon as the ratio
+crosses ln((1 - beta) / alpha) (English) or ln(beta / (1 - alpha)) (not
+English). Documents whose rate lies inside the margin can take longer to
+decide. When every token has been looked up the observed rate decides
+exactly.
+
+Tokens are whitespace-separated words. Surrounding punctuation is
+stripped from the sampled tokens only, so a long document costs one
+str.split() plus the lookups; tokens that are nothing but punctuation are
+skipped. Sampling is seeded, so a document always gets the same answer.
+"""
+
+import math
+import random
+import string
+
+from bnc_lookup.find_batch import FindBatch
+from bnc_lookup.find_bnc import _check_fallback
+
+# Tokens looked up together in one batch
+BATCH_SIZE = 16
+
+# Characters stripped from both ends of a token
+_PUNCTUATION = string.punctuation + '‘’“”–—…'
+
+
+def _sample_order(n: int, rng: random.Random):
+    """Visit the indexes 0..n-1 in random order, drawing them lazily.
+
+    Indexes are drawn by rejection while fewer than half are taken, so an
+    early stop costs only the draws it made; the remainder is shuffled.
+
+    Args:
+        n: Number of indexes.
+        rng: Random source.
+
+    Yields:
+        Every index exactly once.
+    """
+    seen = set()
+    while len(seen) < n // 2:
+        i = rng.randrange(n)
+        if i not in seen:
+            seen.add(i)
+            yield i
+    rest = [i for i in range(n) if i not in seen]
+    rng.shuffle(rest)
+    yield from rest
+
+
+class FindEnglish:
+    """Sequential test of whether a text's in-vocabulary rate is above a threshold."""
+
+    def __init__(self, threshold: float = 0.8, confidence: float = 0.95, margin: float = 0.05,
+                 fallback: str = 'plural'):
+        """Configure the test.
+
+        Args:
+            threshold: In-vocabulary rate above which a text counts as English.
+            confidence: Probability of a correct decision for texts whose rate
+                is at least `margin` away from the threshold (0.5-1).
+            margin: Half-width of the indifference region around the threshold.
+            fallback: Inflection fallback mode of the lookups: 'none',
+                'plural' (default) or 'morph'.
+
+        Raises:
+            ValueError: If the parameters are out of range.
+        """
+        _check_fallback(fallback)
+        if not 0 < margin < threshold < 1 - margin:
+            raise ValueError(f'need 0 < margin < threshold < 1 - margin, got threshold={threshold}, margin={margin}')
+        if not 0.5 < confidence < 1:
+            raise ValueError(f'confidence must be between 0.5 and 1, got {confidence}')
+        self.threshold = threshold
+        p0, p1 = threshold - margin, threshold + margin
+        error = 1 - confidence
+        self._hit = math.log(p1 / p0)
+        self._miss = math.log((1 - p1) / (1 - p0))
+        self._accept = math.log((1 - error) / error)
+        self._reject = math.log(error / (1 - error))
+        self._batch = FindBatch(fallback=fallback)
+
+    def likeness(self, text: str, seed: int | None = 0) -> dict:
+        """Decide whether a text is English by sampling its tokens.
+
+        Args:
+            text: Document text.
+            seed: Sampling seed (None for a random one).
+
+        Returns:
+            Dict with 'english' (bool), 'rate' (in-vocabulary rate of the
+            sampled words, None for a text without words), 'sampled'
+            (words looked up), 'tokens' (whitespace-separated tokens in the
+            text) and 'decided' ('sprt' if the test stopped early, else
+            'exhausted').
+        """
+        tokens = text.split()
+        order = _sample_order(len(tokens), random.Random(seed))
+        llr = 0.0
+        hits = sampled = 0
+        while True:
+            batch = []
+            for i in order:
+                word = tokens[i].strip(_PUNCTUATION)
+                if word:
+                    batch.append(word)
+                    if len(batch) == BATCH_SIZE:
+                        break
+            if not batch:
+                break
+            for found in self._batch.exists(batch):
+                sampled += 1
+                if found:
+                    hits += 1
+                    llr += self._hit
+                else:
+                    llr += self._miss
+                if llr >= self._accept or llr <= self._reject:
+                    return {'english': llr >= self._accept, 'rate': hits / sampled, 'sampled': sampled,
+                            'tokens': len(tokens), 'decided': 'sprt'}
+        rate = hits / sampled if sampled else None
+        return {'english': rate is not None and rate >= self.threshold, 'rate': rate, 'sampled': sampled,
+                'tokens': len(tokens), 'decided': 'exhausted'}
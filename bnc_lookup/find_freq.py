@@ -9,13 +9,22 @@ bucket 100 contains the bottom 1%.
 Uses the same MD5-based hash distribution as find_bnc.py, but stores
 bucket assignments (int) instead of existence flags. Each of the 256
 bucket files (f_00.py through f_ff.py) maps hash suffixes to bucket numbers.
+
+Contractions are resolved from freq/contractions.py, generated alongside
+the shards: every BNC form ending in a contraction suffix maps to its final
+bucket, so it costs one dict probe instead of hashing the word, its stem
+and its suffix. Other contractions hash only the stem.
 """
 
 import hashlib
-import importlib
 
+from bnc_lookup import metrics, overlay
+from bnc_lookup.find_bnc import CONTRACTION_SUFFIXES, _check_fallback, _split_contraction, _split_unlisted
+from bnc_lookup.find_lemma import _lookup_lemma
+from bnc_lookup.freq.contractions import buckets as _contractions
+from bnc_lookup.freq.contractions import suffix_buckets as _suffix_buckets
 from bnc_lookup.normalize import normalize
-from bnc_lookup.find_bnc import _split_contraction
+from bnc_lookup.shard_loader import import_table, load_once
 
 _cache = {}
 
@@ -29,10 +38,10 @@ def _get_bucket_dict(prefix: str) -> dict:
     Returns:
         Dictionary mapping 30-character MD5 hash suffixes to bucket numbers (1-100).
     """
-    if prefix not in _cache:
-        module = importlib.import_module(f'bnc_lookup.freq.f_{prefix}')
-        _cache[prefix] = getattr(module, f'buckets_{prefix}')
-    return _cache[prefix]
+    try:
+        return _cache[prefix]
+    except KeyError:
+        return load_once(_cache, prefix, import_table, f'bnc_lookup.freq.f_{prefix}', f'buckets_{prefix}')
 
 
 def _calculate_md5(input_text: str) -> str:
@@ -53,6 +62,8 @@ def _calculate_md5(input_text: str) -> str:
 def _lookup_bucket(input_text: str) -> int | None:
     """Look up the frequency bucket for a single word form.
 
+    An active overlay (see overlay.py) takes precedence over the BNC table.
+
     Args:
         input_text: The word to look up (should already be normalized).
 
@@ -61,14 +72,102 @@ def _lookup_bucket(input_text: str) -> int | None:
     """
     if not input_text:
         return None
-    h = _calculate_md5(input_text)
-    prefix, suffix = h[:2], h[2:]
+    return _digest_bucket(_calculate_md5(input_text))
+
+
+def _digest_bucket(h: str) -> int | None:
+    """Look up the frequency bucket of an MD5 hex digest.
+
+    Args:
+        h: 32-character MD5 hex digest of a normalized word.
+
+    Returns:
+        Bucket number (1-100) from the overlay or the BNC table, or None.
+    """
+    if overlay.entries:
+        entry = overlay.entries.get(h)
+        if entry is not None:
+            return entry[0]
     try:
-        return _get_bucket_dict(prefix).get(suffix)
+        return _get_bucket_dict(h[:2]).get(h[2:])
     except ModuleNotFoundError:
         return None
 
 
+def _resolve_contraction(word: str) -> tuple[int | None, str]:
+    """Look up the bucket of a word ending in a contraction suffix.
+
+    The split into stem and suffix (e.g., "we'll" -> "we" + "'ll") wins over
+    the word's own entry when it is more frequent (lower bucket number).
+    An active overlay can change the word, its stem or its suffix, so the
+    precomputed table is only used without one.
+
+    Args:
+        word: Normalized word ending in one of CONTRACTION_SUFFIXES.
+
+    Returns:
+        Tuple of (bucket or None, path), where path is 'direct',
+        'contraction' or 'miss'.
+    """
+    if overlay.entries:
+        direct = _lookup_bucket(word)
+        parts = _split_contraction(word)
+        if parts:
+            stem_bucket, suffix_bucket = _lookup_bucket(parts[0]), _lookup_bucket(parts[1])
+            if stem_bucket is not None and suffix_bucket is not None:
+                split_bucket = max(stem_bucket, suffix_bucket)
+                if direct is None or split_bucket < direct:
+                    return split_bucket, 'contraction'
+        return direct, 'miss' if direct is None else 'direct'
+
+    try:
+        return _contractions[word]
+    except KeyError:
+        pass
+    # Not in the BNC as a whole word: only the split can resolve it
+    parts = _split_unlisted(word)
+    if parts:
+        stem_bucket, suffix_bucket = _lookup_bucket(parts[0]), _suffix_buckets[parts[1]]
+        if stem_bucket is not None and suffix_bucket is not None:
+            return max(stem_bucket, suffix_bucket), 'contraction'
+    return None, 'miss'
+
+
+def _resolve_bucket(input_text: str, fallback: str) -> tuple[int | None, str]:
+    """Look up a word's bucket and report which path resolved it.
+
+    Args:
+        input_text: The word to look up.
+        fallback: Inflection fallback mode (already validated).
+
+    Returns:
+        Tuple of (bucket or None, path), where path is one of metrics.PATHS.
+    """
+    input_text = normalize(input_text)
+
+    if input_text.endswith(CONTRACTION_SUFFIXES):
+        direct, path = _resolve_contraction(input_text)
+        if direct is not None:
+            return direct, path
+    else:
+        direct = _lookup_bucket(input_text)
+        if direct is not None:
+            return direct, 'direct'
+
+    if fallback == 'morph':
+        lemma = _lookup_lemma(input_text)
+        if lemma is not None:
+            return lemma[0], 'morph'
+
+    # Try singular form if plural
+    if fallback != 'none' and input_text.endswith('s') and len(input_text) > 3:
+        result = _lookup_bucket(input_text[:-1])
+        if result is not None:
+            return result, 'plural'
+
+    return None, 'miss'
+
+
 class FindFreq:
     """O(1) frequency bucket lookup for BNC words.
 
@@ -77,46 +176,31 @@ class FindFreq:
     least frequent.
 
     Includes automatic plural fallback: if a word ending in 's' is not
-    found, the singular form is also checked.
+    found, the singular form is also checked. With fallback='morph', other
+    inflections resolve to their base form's bucket.
     """
 
     def __init__(self):
         pass
 
-    def bucket(self, input_text: str) -> int | None:
+    def bucket(self, input_text: str, fallback: str = 'plural') -> int | None:
         """Get frequency bucket for a word.
 
         Performs case-insensitive lookup with automatic plural fallback.
 
         Args:
             input_text: The word to look up.
+            fallback: Inflection fallback mode: 'none', 'plural' (default)
+                or 'morph'.
 
         Returns:
             1-100: Bucket number (1=most frequent, 100=least frequent)
             None: Word not found in BNC
-        """
-        input_text = normalize(input_text)
-
-        direct = _lookup_bucket(input_text)
 
-        # Contraction split: prefer higher frequency (lower bucket number)
-        parts = _split_contraction(input_text)
-        if parts:
-            stem, suffix = parts
-            stem_bucket = _lookup_bucket(stem)
-            suffix_bucket = _lookup_bucket(suffix)
-            if stem_bucket is not None and suffix_bucket is not None:
-                split_bucket = max(stem_bucket, suffix_bucket)
-                if direct is None or split_bucket < direct:
-                    return split_bucket
-
-        if direct is not None:
-            return direct
-
-        # Try singular form if plural
-        if input_text.endswith('s') and len(input_text) > 3:
-            result = _lookup_bucket(input_text[:-1])
-            if result is not None:
-                return result
-
-        return None
+        Raises:
+            ValueError: If fallback is not a known mode.
+        """
+        _check_fallback(fallback)
+        if metrics.enabled:
+            return metrics.observe('bucket', _resolve_bucket, input_text, fallback)
+        return _resolve_bucket(input_text, fallback)[0]
@@ -0,0 +1,235 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Morphological fallback index: inflected form -> BNC base form.
+
+The default plural fallback strips one trailing 's'. This module covers
+the remaining regular inflections (-es, -ies, -ed, -ied, -ing, consonant
+doubling, e-dropping) and productive irregular plurals (-men, -children,
+-feet, -mice, -ves, -ses, ...) with one precomputed map.
+
+The map is generated from the BNC word list itself: every alphabetic base
+word is inflected with the rules below, and each generated form that is
+not already a BNC word is recorded together with its base's bucket and
+relative frequency. A lookup is then a single binary search, instead of
+one hash per candidate base.
+
+Index layout (three parallel arrays, sorted by key):
+    keys     First 64 bits of the inflected form's MD5 digest
+    bases    Base bucket in the high 8 bits, position within the bucket's
+             sorted word list in the low 24 bits
+    rfs      Relative frequency of the base
+
+Building the map loads every table once and takes several seconds, so it
+is built lazily on first use and stored in the disk cache (see
+index_cache.py).
+"""
+
+import bisect
+import hashlib
+from array import array
+
+from bnc_lookup import front_coding, index_cache
+from bnc_lookup.find_rf import _get_rf_dict, _lookup_rf_batch
+from bnc_lookup.find_words import _get_bucket_blocks, _get_bucket_word
+from bnc_lookup.shard_loader import load_once
+
+_cache = {}
+
+VOWELS = frozenset('aeiou')
+
+# Suffix rewrites for irregular plurals: (singular ending, plural ending)
+IRREGULAR_PLURALS = (
+    ('man', 'men'),
+    ('child', 'children'),
+    ('foot', 'feet'),
+    ('tooth', 'teeth'),
+    ('goose', 'geese'),
+    ('mouse', 'mice'),
+    ('louse', 'lice'),
+    ('person', 'people'),
+    ('sis', 'ses'),
+    ('ife', 'ives'),
+    ('lf', 'lves'),
+    ('eaf', 'eaves'),
+)
+
+_INDEX_BITS = 24
+
+_INDEX_MASK = (1 << _INDEX_BITS) - 1
+
+
+def _is_cvc(word: str) -> bool:
+    """Whether a word ends consonant-vowel-consonant with a single vowel group.
+
+    Such words double their final consonant before -ed/-ing (stop -> stopped).
+
+    Args:
+        word: Lowercase alphabetic word.
+
+    Returns:
+        True if the final consonant should be doubled.
+    """
+    if len(word) < 3 or word[-1] in VOWELS or word[-1] in 'wxy':
+        return False
+    if word[-2] not in VOWELS or word[-3] in VOWELS:
+        return False
+    groups = sum(1 for i, c in enumerate(word) if c in VOWELS and (i == 0 or word[i - 1] not in VOWELS))
+    return groups == 1
+
+
+def _inflections(word: str) -> set:
+    """Generate the regular and irregular inflected forms of a base word.
+
+    Args:
+        word: Lowercase alphabetic base word (at least 3 characters).
+
+    Returns:
+        Set of inflected forms (not checked against the BNC).
+    """
+    forms = set()
+    last = word[-1]
+    consonant_y = last == 'y' and word[-2] not in VOWELS
+
+    # Plural / third person singular
+    if word.endswith(('s', 'x', 'z', 'ch', 'sh')):
+        forms.add(word + 'es')
+    elif consonant_y:
+        forms.add(word[:-1] + 'ies')
+    else:
+        forms.add(word + 's')
+        if last == 'o':
+            forms.add(word + 'es')
+
+    # Past tense / past participle
+    if last == 'e':
+        forms.add(word + 'd')
+    elif consonant_y:
+        forms.add(word[:-1] + 'ied')
+    else:
+        forms.add(word + 'ed')
+
+    # Progressive
+    if word.endswith('ie'):
+        forms.add(word[:-2] + 'ying')
+    elif last == 'e' and not word.endswith(('ee', 'ye', 'oe')):
+        forms.add(word[:-1] + 'ing')
+    else:
+        forms.add(word + 'ing')
+
+    if _is_cvc(word):
+        forms.add(word + last + 'ed')
+        forms.add(word + last + 'ing')
+
+    for singular, plural in IRREGULAR_PLURALS:
+        if word.endswith(singular):
+            forms.add(word[:-len(singular)] + plural)
+
+    return forms
+
+
+def _build_index() -> tuple:
+    """Build the inflected-form index over every BNC base word.
+
+    When a form can be derived from several bases, the most frequent base
+    (lowest bucket, then highest relative frequency) wins.
+
+    Returns:
+        Tuple of (keys, bases, rfs) arrays sorted by key.
+    """
+    best = {}
+    for bucket in range(1, 101):
+        words = front_coding.decode(*_get_bucket_blocks(bucket))
+        positions = [i for i, word in enumerate(words) if len(word) >= 3 and word.isalpha() and word.isascii()]
+        rfs = _lookup_rf_batch([words[i] for i in positions], layered=False)
+        for i, rf in zip(positions, rfs):
+            rank = (bucket, -(rf or 0.0))
+            packed = (bucket << _INDEX_BITS) | i
+            for form in _inflections(words[i]):
+                h = hashlib.md5(form.encode()).hexdigest()
+                if h[2:] in _get_rf_dict(h[:2]):
+                    continue
+                key = int(h[:16], 16)
+                current = best.get(key)
+                if current is None or rank < current[0]:
+                    best[key] = (rank, packed, rf or 0.0)
+
+    keys, bases, rfs = array('Q'), array('I'), array('d')
+    for key in sorted(best):
+        _, packed, rf = best[key]
+        keys.append(key)
+        bases.append(packed)
+        rfs.append(rf)
+    return keys, bases, rfs
+
+
+def _load_index() -> tuple:
+    """Read the index from the disk cache, building and saving it if absent.
+
+    Returns:
+        Tuple of (keys, bases, rfs) arrays sorted by key.
+    """
+    return index_cache.load_or_build('lemma', ('Q', 'I', 'd'), _build_index)
+
+
+def _get_index() -> tuple:
+    """Load and cache the inflected-form index.
+
+    Returns:
+        Tuple of (keys, bases, rfs) arrays sorted by key.
+    """
+    try:
+        return _cache['index']
+    except KeyError:
+        return load_once(_cache, 'index', _load_index)
+
+
+def _find_entry(input_text: str) -> int | None:
+    """Locate an inflected form in the index.
+
+    Args:
+        input_text: The word to look up (should already be normalized).
+
+    Returns:
+        Position of the entry in the index arrays, or None if absent.
+    """
+    if not input_text:
+        return None
+    keys = _get_index()[0]
+    key = int(hashlib.md5(input_text.encode()).hexdigest()[:16], 16)
+    i = bisect.bisect_left(keys, key)
+    if i == len(keys) or keys[i] != key:
+        return None
+    return i
+
+
+def _lookup_lemma(input_text: str) -> tuple[int, float] | None:
+    """Resolve an inflected form to its base form's frequency data.
+
+    Args:
+        input_text: The word to look up (should already be normalized).
+
+    Returns:
+        Tuple of (bucket, relative_frequency) of the base form, or None if
+        the word is not a known inflection of a BNC word.
+    """
+    i = _find_entry(input_text)
+    if i is None:
+        return None
+    _, bases, rfs = _get_index()
+    return bases[i] >> _INDEX_BITS, rfs[i]
+
+
+def _lookup_base(input_text: str) -> str | None:
+    """Resolve an inflected form to its base form.
+
+    Args:
+        input_text: The word to look up (should already be normalized).
+
+    Returns:
+        The BNC base word (e.g., 'tweet' for 'tweeted'), or None.
+    """
+    i = _find_entry(input_text)
+    if i is None:
+        return None
+    packed = _get_index()[1][i]
+    return _get_bucket_word(packed >> _INDEX_BITS, packed & _INDEX_MASK)
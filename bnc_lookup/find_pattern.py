@@ -0,0 +1,212 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Prefix, suffix and glob search over the BNC word list.
+
+The bucket word lists (bw_01.py through bw_100.py) are sorted alphabetically,
+so every bucket already behaves like a flattened trie: all words sharing a
+prefix occupy one contiguous range, located by binary search over the
+front-coded block heads without decoding the whole bucket. A second index
+of reversed words per bucket (built lazily on first suffix query) serves
+suffix searches the same way.
+
+Searches walk the buckets from most to least frequent and stop as soon as
+k results have been collected, so a query for a common prefix never touches
+the rare-word buckets. Within a bucket, matches are ordered by relative
+frequency (descending), then alphabetically.
+"""
+
+import bisect
+import fnmatch
+import re
+
+from bnc_lookup.find_rf import _lookup_rf
+from bnc_lookup.find_words import _get_bucket_words, _get_prefix_words
+from bnc_lookup.normalize import normalize
+from bnc_lookup.shard_loader import load_once
+
+_cache = {}
+
+# Sorts after every character that can appear in a BNC word form
+_RANGE_END = '\U0010ffff'
+
+_WILDCARDS = ('*', '?', '[')
+
+
+def _reverse_bucket(bucket: int) -> tuple:
+    """Build the reversed-word index for a bucket.
+
+    Args:
+        bucket: Bucket number (1-100).
+
+    Returns:
+        Tuple of the bucket's words spelled backwards, sorted alphabetically.
+    """
+    return tuple(sorted(word[::-1] for word in _get_bucket_words(bucket)))
+
+
+def _get_reversed_words(bucket: int) -> tuple:
+    """Load and cache the reversed-word index for a given bucket number.
+
+    Args:
+        bucket: Bucket number (1-100).
+
+    Returns:
+        Tuple of the bucket's words spelled backwards, sorted alphabetically.
+    """
+    try:
+        return _cache[bucket]
+    except KeyError:
+        return load_once(_cache, bucket, _reverse_bucket, bucket)
+
+
+def _prefix_range(words: tuple, prefix: str) -> tuple[int, int]:
+    """Locate the contiguous range of sorted words starting with a prefix.
+
+    Args:
+        words: Alphabetically sorted tuple of words.
+        prefix: The prefix to match.
+
+    Returns:
+        Tuple of (start, end) indices; empty when start == end.
+    """
+    start = bisect.bisect_left(words, prefix)
+    end = bisect.bisect_left(words, prefix + _RANGE_END, start)
+    return start, end
+
+
+def _split_pattern(pattern: str) -> tuple[str, str]:
+    """Extract the literal prefix and literal suffix of a glob pattern.
+
+    Args:
+        pattern: A glob pattern using '*', '?' and '[...]' wildcards.
+
+    Returns:
+        Tuple of (prefix, suffix): the text before the first wildcard and
+        after the last one. Both are empty strings if no such literal exists.
+    """
+    positions = [pattern.find(c) for c in _WILDCARDS if c in pattern]
+    if not positions:
+        return pattern, ''
+    head = pattern[:min(positions)]
+    last = max(pattern.rfind(c) for c in _WILDCARDS)
+    tail = pattern[last + 1:]
+    # A ']' in the tail means the last wildcard was inside a character class
+    if ']' in tail:
+        tail = tail[tail.rfind(']') + 1:]
+    return head, tail
+
+
+def _rank(matches: list) -> list:
+    """Order words from a single bucket by relative frequency.
+
+    Args:
+        matches: Words from one bucket.
+
+    Returns:
+        The words sorted by relative frequency (descending), then alphabetically.
+    """
+    return sorted(matches, key=lambda word: (-(_lookup_rf(word) or 0.0), word))
+
+
+def _collect(candidates, k: int | None) -> list:
+    """Gather ranked matches bucket by bucket with early termination.
+
+    Args:
+        candidates: Callable taking a bucket number and returning the list
+            of matching words in that bucket.
+        k: Maximum number of results, or None for all matches.
+
+    Returns:
+        Up to k matching words, most frequent first.
+    """
+    results = []
+    for bucket in range(1, 101):
+        if k is not None and len(results) >= k:
+            break
+        matches = candidates(bucket)
+        if matches:
+            results.extend(_rank(matches))
+    return results if k is None else results[:k]
+
+
+class FindPattern:
+    """Frequency-ordered prefix, suffix and glob search over BNC word forms.
+
+    Query flow:
+        1. Normalize the query the same way lookups are normalized
+        2. For each bucket (1 = most frequent), binary-search the sorted
+           word list (or reversed-word list) for the matching range
+        3. Rank the bucket's matches by relative frequency
+        4. Stop once k results have been collected
+    """
+
+    def __init__(self):
+        pass
+
+    def prefix(self, prefix: str, k: int | None = 10) -> list:
+        """Find words starting with a prefix.
+
+        Args:
+            prefix: The prefix to match (e.g., 'inter').
+            k: Maximum number of results (default 10), or None for all.
+
+        Returns:
+            List of matching words, most frequent first.
+        """
+        prefix = normalize(prefix)
+
+        def candidates(bucket: int) -> list:
+            return _get_prefix_words(bucket, prefix)
+
+        return _collect(candidates, k)
+
+    def suffix(self, suffix: str, k: int | None = 10) -> list:
+        """Find words ending with a suffix.
+
+        Args:
+            suffix: The suffix to match (e.g., 'ness').
+            k: Maximum number of results (default 10), or None for all.
+
+        Returns:
+            List of matching words, most frequent first.
+        """
+        reversed_suffix = normalize(suffix)[::-1]
+
+        def candidates(bucket: int) -> list:
+            words = _get_reversed_words(bucket)
+            start, end = _prefix_range(words, reversed_suffix)
+            return [word[::-1] for word in words[start:end]]
+
+        return _collect(candidates, k)
+
+    def glob(self, pattern: str, k: int | None = 10) -> list:
+        """Find words matching a shell-style glob pattern.
+
+        Supports '*' (any run of characters), '?' (any single character)
+        and '[...]' character classes. The literal prefix (or, failing
+        that, the literal suffix) of the pattern narrows each bucket to a
+        contiguous range before the full pattern is applied.
+
+        Args:
+            pattern: The glob pattern (e.g., 'colo*r', '*ness', 'b?t').
+            k: Maximum number of results (default 10), or None for all.
+
+        Returns:
+            List of matching words, most frequent first.
+        """
+        pattern = normalize(pattern)
+        matcher = re.compile(fnmatch.translate(pattern)).match
+        head, tail = _split_pattern(pattern)
+
+        def candidates(bucket: int) -> list:
+            if head:
+                pool = _get_prefix_words(bucket, head)
+            elif tail:
+                words = _get_reversed_words(bucket)
+                start, end = _prefix_range(words, tail[::-1])
+                pool = [word[::-1] for word in words[start:end]]
+            else:
+                pool = _get_bucket_words(bucket)
+            return [word for word in pool if matcher(word)]
+
+        return _collect(candidates, k)
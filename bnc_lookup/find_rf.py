@@ -12,13 +12,20 @@ The BNC corpus contains 100,106,029 tokens across 4,124 documents.
 Uses the same MD5-based hash distribution as find_bnc.py, but stores
 relative frequency floats. Each of the 256 bucket files (rf_00.py
 through rf_ff.py) maps hash suffixes to relative frequency values.
+
+Contractions are resolved from rf/contractions.py, as in find_freq.py:
+BNC forms ending in a contraction suffix cost one dict probe, and other
+contractions hash only the stem.
 """
 
 import hashlib
-import importlib
 
+from bnc_lookup import metrics, overlay
+from bnc_lookup.find_bnc import CONTRACTION_SUFFIXES, _check_fallback, _split_contraction, _split_unlisted
 from bnc_lookup.normalize import normalize
-from bnc_lookup.find_bnc import _split_contraction
+from bnc_lookup.rf.contractions import frequencies as _contractions
+from bnc_lookup.rf.contractions import suffix_frequencies as _suffix_frequencies
+from bnc_lookup.shard_loader import import_table, load_once
 
 _cache = {}
 
@@ -32,10 +39,10 @@ def _get_rf_dict(prefix: str) -> dict:
     Returns:
         Dictionary mapping 30-character MD5 hash suffixes to relative frequency floats.
     """
-    if prefix not in _cache:
-        module = importlib.import_module(f'bnc_lookup.rf.rf_{prefix}')
-        _cache[prefix] = getattr(module, f'frequencies_{prefix}')
-    return _cache[prefix]
+    try:
+        return _cache[prefix]
+    except KeyError:
+        return load_once(_cache, prefix, import_table, f'bnc_lookup.rf.rf_{prefix}', f'frequencies_{prefix}')
 
 
 def _calculate_md5(input_text: str) -> str:
@@ -56,6 +63,8 @@ def _calculate_md5(input_text: str) -> str:
 def _lookup_rf(input_text: str) -> float | None:
     """Look up the relative frequency for a single word form.
 
+    An active overlay (see overlay.py) takes precedence over the BNC table.
+
     Args:
         input_text: The word to look up (should already be normalized).
 
@@ -64,14 +73,143 @@ def _lookup_rf(input_text: str) -> float | None:
     """
     if not input_text:
         return None
-    h = _calculate_md5(input_text)
-    prefix, suffix = h[:2], h[2:]
+    return _digest_rf(_calculate_md5(input_text))
+
+
+def _digest_rf(h: str) -> float | None:
+    """Look up the relative frequency of an MD5 hex digest.
+
+    Args:
+        h: 32-character MD5 hex digest of a normalized word.
+
+    Returns:
+        Relative frequency from the overlay or the BNC table, or None.
+    """
+    if overlay.entries:
+        entry = overlay.entries.get(h)
+        if entry is not None:
+            return entry[1]
     try:
-        return _get_rf_dict(prefix).get(suffix)
+        return _get_rf_dict(h[:2]).get(h[2:])
     except ModuleNotFoundError:
         return None
 
 
+def _lookup_rf_batch(forms: list, layered: bool = True) -> list:
+    """Look up relative frequencies for many already-normalized word forms.
+
+    Equivalent to ``[_lookup_rf(f) for f in forms]`` without the per-call
+    overhead: no re-normalization, and the shard dictionary is fetched once
+    per distinct prefix.
+
+    Args:
+        forms: Normalized word forms.
+        layered: Whether an active overlay takes precedence (False reads
+            the BNC tables only, e.g. for indexes derived from them).
+
+    Returns:
+        List aligned with forms: relative frequency, or None if not found.
+    """
+    md5 = hashlib.md5
+    layered = overlay.entries if layered else None
+    shards = {}
+    results = []
+    for form in forms:
+        if not form:
+            results.append(None)
+            continue
+        h = md5(form.encode()).hexdigest()
+        if layered and h in layered:
+            results.append(layered[h][1])
+            continue
+        prefix = h[:2]
+        shard = shards.get(prefix)
+        if shard is None:
+            try:
+                shard = shards[prefix] = _get_rf_dict(prefix)
+            except ModuleNotFoundError:
+                shard = shards[prefix] = {}
+        results.append(shard.get(h[2:]))
+    return results
+
+
+def _resolve_contraction(word: str) -> tuple[float | None, str]:
+    """Look up the relative frequency of a word ending in a contraction suffix.
+
+    The split into stem and suffix (e.g., "we'll" -> "we" + "'ll") wins over
+    the word's own entry when it is more frequent. An active overlay can
+    change the word, its stem or its suffix, so the precomputed table is
+    only used without one.
+
+    Args:
+        word: Normalized word ending in one of CONTRACTION_SUFFIXES.
+
+    Returns:
+        Tuple of (relative frequency or None, path), where path is
+        'direct', 'contraction' or 'miss'.
+    """
+    if overlay.entries:
+        direct = _lookup_rf(word)
+        parts = _split_contraction(word)
+        if parts:
+            stem_rf, suffix_rf = _lookup_rf(parts[0]), _lookup_rf(parts[1])
+            if stem_rf is not None and suffix_rf is not None:
+                split_rf = min(stem_rf, suffix_rf)
+                if direct is None or split_rf > direct:
+                    return split_rf, 'contraction'
+        return direct, 'miss' if direct is None else 'direct'
+
+    try:
+        return _contractions[word]
+    except KeyError:
+        pass
+    # Not in the BNC as a whole word: only the split can resolve it
+    parts = _split_unlisted(word)
+    if parts:
+        stem_rf, suffix_rf = _lookup_rf(parts[0]), _suffix_frequencies[parts[1]]
+        if stem_rf is not None and suffix_rf is not None:
+            return min(stem_rf, suffix_rf), 'contraction'
+    return None, 'miss'
+
+
+def _resolve_rf(input_text: str, fallback: str) -> tuple[float | None, str]:
+    """Look up a word's relative frequency and report which path resolved it.
+
+    Args:
+        input_text: The word to look up.
+        fallback: Inflection fallback mode (already validated).
+
+    Returns:
+        Tuple of (relative frequency or None, path), where path is one of
+        metrics.PATHS.
+    """
+    input_text = normalize(input_text)
+
+    if input_text.endswith(CONTRACTION_SUFFIXES):
+        direct, path = _resolve_contraction(input_text)
+        if direct is not None:
+            return direct, path
+    else:
+        direct = _lookup_rf(input_text)
+        if direct is not None:
+            return direct, 'direct'
+
+    if fallback == 'morph':
+        # Imported here: find_lemma builds on this module
+        from bnc_lookup.find_lemma import _lookup_lemma
+        lemma = _lookup_lemma(input_text)
+        if lemma is not None:
+            return lemma[1], 'morph'
+
+    # Try singular form if plural
+    if fallback != 'none' and input_text.endswith('s') and len(input_text) > 3:
+        result = _lookup_rf(input_text[:-1])
+        if result is not None:
+            return result, 'plural'
+
+    return None, 'miss'
+
+
 class FindRF:
     """O(1) relative frequency lookup for BNC words.
 
@@ -80,50 +218,36 @@ class FindRF:
     for any target text length.
 
     Includes automatic plural fallback: if a word ending in 's' is not
-    found, the singular form is also checked.
+    found, the singular form is also checked. With fallback='morph', other
+    inflections resolve to their base form's relative frequency.
     """
 
     def __init__(self):
         pass
 
-    def relative_frequency(self, input_text: str) -> float | None:
+    def relative_frequency(self, input_text: str, fallback: str = 'plural') -> float | None:
         """Relative frequency of word in BNC (raw_count / corpus_size).
 
         Performs case-insensitive lookup with automatic plural fallback.
 
         Args:
             input_text: The word to look up.
+            fallback: Inflection fallback mode: 'none', 'plural' (default)
+                or 'morph'.
 
         Returns:
             Float in range (0, 1), or None if word not in BNC.
-        """
-        input_text = normalize(input_text)
-
-        direct = _lookup_rf(input_text)
-
-        # Contraction split: prefer higher frequency
-        parts = _split_contraction(input_text)
-        if parts:
-            stem, suffix = parts
-            stem_rf = _lookup_rf(stem)
-            suffix_rf = _lookup_rf(suffix)
-            if stem_rf is not None and suffix_rf is not None:
-                split_rf = min(stem_rf, suffix_rf)
-                if direct is None or split_rf > direct:
-                    return split_rf
-
-        if direct is not None:
-            return direct
 
-        # Try singular form if plural
-        if input_text.endswith('s') and len(input_text) > 3:
-            result = _lookup_rf(input_text[:-1])
-            if result is not None:
-                return result
-
-        return None
+        Raises:
+            ValueError: If fallback is not a known mode.
+        """
+        _check_fallback(fallback)
+        if metrics.enabled:
+            return metrics.observe('relative_frequency', _resolve_rf, input_text, fallback)
+        return _resolve_rf(input_text, fallback)[0]
 
-    def expected_count(self, input_text: str, text_length: int, rounded: bool = False) -> float | int | None:
+    def expected_count(self, input_text: str, text_length: int, rounded: bool = False,
+                       fallback: str = 'plural') -> float | int | None:
         """Expected number of occurrences of a word in a text of given length.
 
         Computes ``relative_frequency(word) * text_length`` to estimate how
@@ -134,11 +258,13 @@ class FindRF:
             input_text: The word to look up.
             text_length: Length of the target text in tokens.
             rounded: If True, return a rounded integer (e.g., 0.04 -> 0, 3090.7 -> 3091).
+            fallback: Inflection fallback mode: 'none', 'plural' (default)
+                or 'morph'.
 
         Returns:
             Expected count as a float (or int if rounded), or None if word not in BNC.
         """
-        rf = self.relative_frequency(input_text)
+        rf = self.relative_frequency(input_text, fallback=fallback)
         if rf is None:
             return None
         result = rf * text_length
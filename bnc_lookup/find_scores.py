@@ -0,0 +1,229 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Zipf scores and frequency percentiles as one-byte codes.
+
+Two continuous alternatives to the 100 frequency buckets:
+
+    zipf        log10 of the word's frequency per billion tokens
+                (log10(rf) + 9): about 1.0 for a word seen once in the
+                BNC, 7.79 for "the"
+    percentile  share of BNC word forms that are less frequent, counting
+                forms of equal frequency as half (0-100)
+
+Both are stored as codes in 1-255 (0 means "not found"), so a score is a
+table lookup rather than a math.log10() per call, and a batch of scores is
+a bytes object:
+
+    zipf code c        -> (c + 31) / 32       1.0 to 8.94 in steps of 1/32
+    percentile code c  -> (c - 1) * 100 / 254  0 to 100 in steps of 0.394
+
+Rounding to the nearest code bounds the quantization error at 1/64 (0.016)
+for Zipf scores and 50/254 (0.197) percentile points for percentiles.
+Zipf scores outside 1.0-8.94 are clamped, which no BNC word is.
+
+Both scores are functions of a word's relative frequency, and the rf
+tables hold only about 5,500 distinct values. So bnc-build writes the
+codes once per value (rf/scores.py), not once per word: a lookup resolves
+the relative frequency as relative_frequency() does, with the same
+fallbacks, contractions and overlays, then reads its codes from that
+table. Frequencies that are not in it (overlay words) are encoded on the
+fly.
+
+The batch methods return bytes, one code per token, rather than a list of
+floats; numpy.frombuffer() views them without a copy, and indexing
+ZIPF_VALUES or PERCENTILE_VALUES decodes a code. Each distinct token is resolved and encoded once, so a
+batch costs one dict probe per token.
+"""
+
+import bisect
+import math
+
+from bnc_lookup import metrics
+from bnc_lookup.find_batch import FindBatch
+from bnc_lookup.find_bnc import _check_fallback
+from bnc_lookup.find_rf import _resolve_rf
+from bnc_lookup.shard_loader import import_table, load_once
+
+# Code of the lowest Zipf score (1.0); the score of code c is (c + ZIPF_OFFSET) / ZIPF_SCALE
+ZIPF_SCALE = 32
+ZIPF_OFFSET = 31
+
+# Percentile codes 1-255 cover 0-100
+PERCENTILE_STEPS = 254
+
+# Score of every code; index 0 (not found) is None
+ZIPF_VALUES = (None, *((c + ZIPF_OFFSET) / ZIPF_SCALE for c in range(1, 256)))
+PERCENTILE_VALUES = (None, *((c - 1) * 100 / PERCENTILE_STEPS for c in range(1, 256)))
+
+# 'tables' -> (zipf codes, percentile codes, sorted frequencies, their percentile codes)
+_cache = {}
+
+
+def zipf_code(rf: float) -> int:
+    """Quantize a relative frequency to a Zipf code.
+
+    Args:
+        rf: Relative frequency; 0 (or less) gets the lowest code.
+
+    Returns:
+        Code in 1-255.
+    """
+    if rf <= 0:
+        return 1
+    code = round((math.log10(rf) + 9) * ZIPF_SCALE) - ZIPF_OFFSET
+    return min(255, max(1, code))
+
+
+def percentile_code(percentile: float) -> int:
+    """Quantize a percentile to a percentile code.
+
+    Args:
+        percentile: Percentile in 0-100.
+
+    Returns:
+        Code in 1-255.
+    """
+    return 1 + round(percentile * PERCENTILE_STEPS / 100)
+
+
+def _load_tables() -> tuple:
+    """Load the code tables generated by bnc-build and rank their frequencies."""
+    zipf_codes, percentile_codes = import_table('bnc_lookup.rf.scores', 'zipf_codes', 'percentile_codes')
+    rfs = sorted(percentile_codes)
+    return zipf_codes, percentile_codes, rfs, [percentile_codes[rf] for rf in rfs]
+
+
+def _get_tables() -> tuple:
+    """Code tables of the scores.
+
+    Returns:
+        Tuple of (rf -> zipf code, rf -> percentile code, sorted rfs,
+        percentile codes aligned with the sorted rfs).
+    """
+    try:
+        return _cache['tables']
+    except KeyError:
+        return load_once(_cache, 'tables', _load_tables)
+
+
+def _zipf(rf: float | None) -> int:
+    """Zipf code of a resolved relative frequency.
+
+    Args:
+        rf: Relative frequency, or None if the word was not found.
+
+    Returns:
+        Code in 1-255, or 0 for None.
+    """
+    if rf is None:
+        return 0
+    return _get_tables()[0].get(rf) or zipf_code(rf)
+
+
+def _percentile(rf: float | None) -> int:
+    """Percentile code of a resolved relative frequency.
+
+    A frequency that is not in the BNC tables (an overlay word) gets the
+    code of the closest BNC frequency at or below it.
+
+    Args:
+        rf: Relative frequency, or None if the word was not found.
+
+    Returns:
+        Code in 1-255, or 0 for None.
+    """
+    if rf is None:
+        return 0
+    _, codes, rfs, by_rank = _get_tables()
+    try:
+        return codes[rf]
+    except KeyError:
+        i = bisect.bisect_right(rfs, rf)
+        return by_rank[i - 1] if i else 1
+
+
+class FindScores:
+    """Zipf scores and frequency percentiles from precomputed one-byte codes."""
+
+    def __init__(self, fallback: str = 'plural'):
+        """Configure the lookups.
+
+        Args:
+            fallback: Inflection fallback mode: 'none', 'plural' (default)
+                or 'morph'.
+
+        Raises:
+            ValueError: If fallback is not a known mode.
+        """
+        _check_fallback(fallback)
+        self._fallback = fallback
+        self._batch = FindBatch(fallback=fallback)
+
+    def _rf(self, name: str, input_text: str) -> float | None:
+        """Resolve a word's relative frequency, recording metrics when enabled."""
+        if metrics.enabled:
+            return metrics.observe(name, _resolve_rf, input_text, self._fallback)
+        return _resolve_rf(input_text, self._fallback)[0]
+
+    def _codes(self, tokens, code) -> bytes:
+        """Encode many words, resolving and encoding each distinct word once.
+
+        Args:
+            tokens: Iterable of words.
+            code: _zipf or _percentile.
+
+        Returns:
+            One code byte per token.
+        """
+        if not isinstance(tokens, (list, tuple)):
+            tokens = list(tokens)
+        distinct = list(dict.fromkeys(tokens))
+        codes = dict(zip(distinct, map(code, self._batch.relative_frequency(distinct))))
+        return bytes(map(codes.__getitem__, tokens))
+
+    def zipf(self, input_text: str) -> float | None:
+        """Zipf score of a word, to within 1/64.
+
+        Args:
+            input_text: The word to look up.
+
+        Returns:
+            log10 of the word's frequency per billion tokens, or None if
+            the word is not in the BNC.
+        """
+        return ZIPF_VALUES[_zipf(self._rf('zipf', input_text))]
+
+    def percentile(self, input_text: str) -> float | None:
+        """Frequency percentile of a word among BNC word forms, to within 0.2.
+
+        Args:
+            input_text: The word to look up.
+
+        Returns:
+            Percentile (0-100), or None if the word is not in the BNC.
+        """
+        return PERCENTILE_VALUES[_percentile(self._rf('percentile', input_text))]
+
+    def zipf_codes(self, tokens) -> bytes:
+        """Zipf codes of many words; each distinct word is looked up once.
+
+        Args:
+            tokens: Iterable of words.
+
+        Returns:
+            One byte per token: code 1-255 (score ZIPF_VALUES[code]), or 0
+            if not found.
+        """
+        return self._codes(tokens, _zipf)
+
+    def percentile_codes(self, tokens) -> bytes:
+        """Percentile codes of many words; each distinct word is looked up once.
+
+        Args:
+            tokens: Iterable of words.
+
+        Returns:
+            One byte per token: code 1-255 (percentile
+            PERCENTILE_VALUES[code]), or 0 if not found.
+        """
+        return self._codes(tokens, _percentile)
@@ -0,0 +1,150 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Word segmentation of run-together text using BNC relative frequencies.
+
+Splits strings such as "thequickbrownfox" (hashtags, URLs, OCR output)
+into the most probable sequence of words. Each word costs -log(rf), where
+rf is its BNC relative frequency, and a Viterbi pass over all split points
+finds the sequence with the lowest total cost, i.e., the highest product
+of word probabilities.
+
+Unknown substrings get a cost that grows with their length (the classic
+estimate P = 10 / (N * 10^len), with N the corpus size), so a long unknown
+chunk is only chosen when no split into known words exists.
+
+All candidate substrings (up to max_word_length characters) are resolved
+in a single batch pass through find_rf._lookup_rf_batch, and their costs
+are memoized across calls (until the active overlay changes).
+"""
+
+import math
+
+from bnc_lookup import overlay
+from bnc_lookup.find_rf import _lookup_rf_batch
+from bnc_lookup.normalize import normalize
+
+# BNC corpus size in tokens
+CORPUS_SIZE = 100_106_029
+
+_LOG_CORPUS_SIZE = math.log(CORPUS_SIZE)
+
+_LOG_10 = math.log(10)
+
+# Memoized substring -> cost; cleared when it grows past _MAX_COSTS
+_costs = {}
+
+_MAX_COSTS = 1_000_000
+
+# overlay.version the memoized costs were computed with
+_costs_version = 0
+
+
+def _unknown_cost(length: int) -> float:
+    """Cost of a substring that is not a BNC word.
+
+    Args:
+        length: Length of the substring.
+
+    Returns:
+        -log(10 / (N * 10^length)).
+    """
+    return _LOG_CORPUS_SIZE + (length - 1) * _LOG_10
+
+
+def _resolve_costs(substrings: set) -> dict:
+    """Compute and memoize the cost of every substring not yet cached.
+
+    Args:
+        substrings: Candidate words (already normalized).
+
+    Returns:
+        The memo holding their costs. It is read once, so costs computed
+        across a lexicon swap go to the memo of the version they started
+        with.
+    """
+    global _costs_version
+    costs = _costs
+    if _costs_version != overlay.version:
+        costs.clear()
+        _costs_version = overlay.version
+    missing = [s for s in substrings if s not in costs]
+    if not missing:
+        return costs
+    if len(costs) + len(missing) > _MAX_COSTS:
+        costs.clear()
+    for word, rf in zip(missing, _lookup_rf_batch(missing)):
+        costs[word] = -math.log(rf) if rf else _unknown_cost(len(word))
+    return costs
+
+
+def _segment_chunk(text: str, max_word_length: int) -> list:
+    """Segment a single whitespace-free chunk of text.
+
+    Args:
+        text: Normalized text containing no whitespace.
+        max_word_length: Longest candidate word considered.
+
+    Returns:
+        List of words whose concatenation equals text.
+    """
+    n = len(text)
+    costs = _resolve_costs({text[j:i] for i in range(1, n + 1) for j in range(max(0, i - max_word_length), i)})
+
+    best = [0.0] + [math.inf] * n
+    split = [0] * (n + 1)
+    for i in range(1, n + 1):
+        for j in range(max(0, i - max_word_length), i):
+            cost = best[j] + costs[text[j:i]]
+            if cost < best[i]:
+                best[i] = cost
+                split[i] = j
+
+    words = []
+    i = n
+    while i > 0:
+        words.append(text[split[i]:i])
+        i = split[i]
+    words.reverse()
+    return words
+
+
+class FindSegments:
+    """Split run-together text into words using BNC frequencies.
+
+    Segmentation flow:
+        1. Normalize the text and split it on whitespace
+        2. Resolve the cost of every substring up to max_word_length
+           characters in one batch of hash lookups
+        3. Run a Viterbi pass choosing the split with the lowest total cost
+    """
+
+    def __init__(self, max_word_length: int = 20):
+        """Configure the segmenter.
+
+        Args:
+            max_word_length: Longest word considered as a candidate
+                (default 20). Longer unknown runs are split into pieces
+                no longer than this.
+
+        Raises:
+            ValueError: If max_word_length is less than 1.
+        """
+        if max_word_length < 1:
+            raise ValueError(f'max_word_length must be at least 1, got {max_word_length}')
+        self._max_word_length = max_word_length
+
+    def segment(self, text: str) -> list:
+        """Split text into its most probable sequence of words.
+
+        Existing whitespace is kept as a word boundary.
+
+        Args:
+            text: Run-together text (e.g., 'thequickbrownfox').
+
+        Returns:
+            List of normalized words, e.g. ['the', 'quick', 'brown', 'fox'].
+        """
+        words = []
+        for chunk in normalize(text).split():
+            words.extend(_segment_chunk(chunk, self._max_word_length))
+        return words
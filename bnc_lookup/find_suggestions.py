@@ -0,0 +1,408 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Spelling suggestions ranked by BNC frequency.
+
+Implements the symmetric delete algorithm (as popularized by SymSpell).
+Every indexed word is reduced to its first PREFIX_LENGTH characters, and
+every string obtainable from that prefix by deleting up to INDEX_DISTANCE
+characters is recorded in the index. At query time the same deletes are
+generated for the input; any indexed word sharing a delete is a candidate,
+and candidates are verified with a true edit distance. No insertions,
+substitutions or alphabet enumeration are needed at query time.
+
+Index layout:
+    Each entry pairs the CRC-32 of a delete string (in the keys array)
+    with a 32-bit payload (in the parallel payloads array): the word's
+    length in the high 8 bits and a word id in the low 24 bits. Entries
+    are sorted by key, then payload, and partitioned by the top byte of
+    the CRC, so a delete is resolved with a binary search inside one
+    partition. Its payloads are sorted by length, so those of each length
+    within the distance limit are found by binary search and copied with
+    one slice, in word id order, and candidates of other lengths are never
+    touched. Word ids count words in bucket order (bucket 1 first),
+    alphabetically within each bucket, and are decoded back to words from
+    the front-coded bucket files.
+
+    A parallel array holds a 32-bit character mask per word id (bit
+    ord(c) % 32 set for every character c). Characters of one word that are
+    missing from the other each need an edit, so masks reject most
+    candidates before they are decoded (see _mask_distance()).
+
+Building the full index takes several seconds, so it is built lazily on
+first use and stored in the disk cache (see index_cache.py). A bounded
+variant indexes only the first max_bucket buckets, which cuts memory and
+build time roughly in proportion.
+"""
+
+import bisect
+import heapq
+import sys
+import zlib
+from array import array
+
+from bnc_lookup import front_coding, index_cache
+from bnc_lookup.find_rf import _lookup_rf
+from bnc_lookup.find_word_ids import _direct_id
+from bnc_lookup.find_words import _get_bucket_blocks, _get_bucket_count
+from bnc_lookup.normalize import normalize
+from bnc_lookup.shard_loader import load_once
+
+_cache = {}
+
+# Only the first PREFIX_LENGTH characters of each word are indexed
+PREFIX_LENGTH = 7
+
+# Largest edit distance the index supports
+INDEX_DISTANCE = 2
+
+_PARTITIONS = 256
+
+_ID_BITS = 24
+
+_ID_MASK = (1 << _ID_BITS) - 1
+
+_LENGTH_MASK = 0xFF
+
+# Index of the high (key) half of a 64-bit entry viewed as two 32-bit words
+_HIGH = 1 if sys.byteorder == 'little' else 0
+
+# Character -> its bit in a word's character mask
+_char_bits = {}
+
+
+def _deletes(key: str, distance: int) -> set:
+    """Generate every string reachable from key by up to `distance` deletions.
+
+    Args:
+        key: The string to delete characters from.
+        distance: Maximum number of deletions.
+
+    Returns:
+        Set of strings, including key itself.
+    """
+    results = {key}
+    frontier = {key}
+    for _ in range(distance):
+        frontier = {s[:i] + s[i + 1:] for s in frontier for i in range(len(s))}
+        results |= frontier
+    return results
+
+
+def _char_mask(word: str) -> int:
+    """32-bit mask with bit ord(c) % 32 set for every character c of word."""
+    mask = 0
+    for c in word:
+        bit = _char_bits.get(c)
+        if bit is None:
+            bit = _char_bits[c] = 1 << (ord(c) & 31)
+        mask |= bit
+    return mask
+
+
+def _mask_distance(a: int, b: int) -> int:
+    """Lower bound on the edit distance of two words from their character masks.
+
+    Every character whose bit is set in one mask only must be deleted or
+    substituted, and an edit removes at most one character from each side.
+
+    Args:
+        a: Character mask of the first word.
+        b: Character mask of the second word.
+
+    Returns:
+        The larger number of bits set in one mask only.
+    """
+    return max((a & ~b).bit_count(), (b & ~a).bit_count())
+
+
+def _bucket_starts(max_bucket: int) -> list:
+    """Compute the first word id of every bucket.
+
+    Args:
+        max_bucket: Highest bucket included in the index.
+
+    Returns:
+        List where element b - 1 is the first word id of bucket b, with a
+        final element holding the total number of indexed words.
+    """
+    starts = [0]
+    for bucket in range(1, max_bucket + 1):
+        starts.append(starts[-1] + _get_bucket_count(bucket))
+    return starts
+
+
+def _build_index(max_bucket: int) -> tuple:
+    """Build the delete index over the first max_bucket buckets.
+
+    Args:
+        max_bucket: Highest bucket to index (1-100).
+
+    Returns:
+        Tuple of (offsets, keys, payloads, masks): partition boundaries,
+        the sorted entries split into keys and payloads, and the
+        character mask of every word id.
+    """
+    partitions = [array('Q') for _ in range(_PARTITIONS)]
+    masks = array('I')
+    hashes = {}
+    word_id = 0
+    for bucket in range(1, max_bucket + 1):
+        for word in front_coding.decode(*_get_bucket_blocks(bucket)):
+            masks.append(_char_mask(word))
+            key = word[:PREFIX_LENGTH]
+            keyed = hashes.get(key)
+            if keyed is None:
+                keyed = hashes[key] = [zlib.crc32(d.encode()) for d in _deletes(key, INDEX_DISTANCE)]
+            payload = (min(len(word), _LENGTH_MASK) << _ID_BITS) | word_id
+            for h in keyed:
+                partitions[h >> 24].append((h << 32) | payload)
+            word_id += 1
+    hashes.clear()
+
+    offsets = array('Q', [0])
+    keys, payloads = array('I'), array('I')
+    for i, part in enumerate(partitions):
+        # Split the sorted 64-bit entries into their 32-bit halves without a Python loop
+        halves = memoryview(array('Q', sorted(part))).cast('B').cast('I')
+        keys.frombytes(halves[_HIGH::2].tobytes())
+        payloads.frombytes(halves[1 - _HIGH::2].tobytes())
+        partitions[i] = None
+        offsets.append(len(keys))
+    return offsets, keys, payloads, masks
+
+
+def _load_index(max_bucket: int) -> tuple:
+    """Read the delete index from the disk cache, building and saving it if absent.
+
+    Args:
+        max_bucket: Highest bucket included in the index.
+
+    Returns:
+        Tuple of (offsets, keys, payloads, masks, starts).
+    """
+    name = f'suggest-{max_bucket}-{PREFIX_LENGTH}-{INDEX_DISTANCE}'
+    arrays = index_cache.load_or_build(name, ('Q', 'I', 'I', 'I'), _build_index, max_bucket)
+    return (*arrays, _bucket_starts(max_bucket))
+
+
+def _get_index(max_bucket: int) -> tuple:
+    """Load and cache the delete index for a given bucket limit.
+
+    Args:
+        max_bucket: Highest bucket included in the index.
+
+    Returns:
+        Tuple of (offsets, keys, payloads, masks, starts).
+    """
+    try:
+        return _cache[max_bucket]
+    except KeyError:
+        return load_once(_cache, max_bucket, _load_index, max_bucket)
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance with early termination.
+
+    Counts insertions, deletions, substitutions and transpositions of
+    adjacent characters. The common prefix and suffix are stripped first;
+    the first remaining characters then differ, so one of the four edits
+    applies to them, and each is tried with the limit lowered by one.
+    With limit at most INDEX_DISTANCE this explores a few short branches,
+    which is cheaper than filling a dynamic-programming band.
+
+    Args:
+        a: First string.
+        b: Second string.
+        limit: Largest distance of interest.
+
+    Returns:
+        The distance, or limit + 1 if it exceeds limit.
+    """
+    if a == b:
+        return 0
+    la, lb = len(a), len(b)
+    if abs(la - lb) > limit:
+        return limit + 1
+
+    start = 0
+    while start < la and start < lb and a[start] == b[start]:
+        start += 1
+    while la > start and lb > start and a[la - 1] == b[lb - 1]:
+        la -= 1
+        lb -= 1
+    if la == start or lb == start:
+        rest = la + lb - 2 * start
+        return rest if rest <= limit else limit + 1
+    if not limit:
+        return 1
+    a, b = a[start:la], b[start:lb]
+
+    # Substitution, deletion, insertion, then transposition of the first two characters
+    branches = [(a[1:], b[1:]), (a[1:], b), (a, b[1:])]
+    if len(a) > 1 and len(b) > 1 and a[0] == b[1] and a[1] == b[0]:
+        branches.append((a[2:], b[2:]))
+    if limit == 1:
+        return 1 if any(rest_a == rest_b for rest_a, rest_b in branches) else 2
+    best = limit + 1
+    for rest_a, rest_b in branches:
+        distance = 1 + _edit_distance(rest_a, rest_b, best - 2)
+        if distance < best:
+            if distance == 1:
+                return 1
+            best = distance
+    return best
+
+
+class FindSuggestions:
+    """Spelling suggestions for words, ranked by edit distance then frequency.
+
+    Lookup flow:
+        1. Normalize the input; if it is an indexed word, it is the first
+           suggestion (distance 0), whatever its bucket
+        2. Take its first PREFIX_LENGTH characters and generate up to
+           max_distance deletes of that prefix
+        3. Binary-search each delete's CRC in the index to collect word ids
+        4. Skip candidates whose length or character mask puts them beyond
+           the distance limit, then decode the others in bucket order and
+           verify their full edit distance, closest-looking first. Once k
+           suggestions within distance d are found, later buckets can only
+           contribute words closer than d, so the distance limit shrinks at
+           each bucket boundary and the scan stops when it reaches 0 (only
+           the word itself, settled in step 1, is closer)
+        5. Rank by (distance, bucket, relative frequency)
+    """
+
+    def __init__(self, max_bucket: int = 100):
+        """Select the index to query.
+
+        Args:
+            max_bucket: Only suggest words from buckets 1..max_bucket
+                (default 100 = every BNC word). Smaller values build a
+                smaller index.
+
+        Raises:
+            ValueError: If max_bucket is not in range 1-100.
+        """
+        if not 1 <= max_bucket <= 100:
+            raise ValueError(f'max_bucket must be 1-100, got {max_bucket}')
+        self._max_bucket = max_bucket
+
+    def suggest(self, input_text: str, max_distance: int = 2, k: int = 5) -> list:
+        """Suggest the most likely intended words for a (misspelled) word.
+
+        A word that exists in the index is returned as its own first
+        suggestion (distance 0).
+
+        Args:
+            input_text: The word to correct.
+            max_distance: Largest edit distance to consider (0-2, default 2).
+            k: Maximum number of suggestions (default 5).
+
+        Returns:
+            List of up to k words, closest and most frequent first.
+
+        Raises:
+            ValueError: If max_distance is not in range 0-2.
+        """
+        if not 0 <= max_distance <= INDEX_DISTANCE:
+            raise ValueError(f'max_distance must be 0-{INDEX_DISTANCE}, got {max_distance}')
+        word = normalize(input_text)
+        if not word or k <= 0:
+            return []
+
+        offsets, keys, payloads, masks, starts = _get_index(self._max_bucket)
+        # Payloads of every word sharing a delete with the input, one heap per word length (a
+        # delete's payloads are sorted by length, then word id); the scan usually stops after a
+        # few buckets, so only those payloads are put in order
+        longest = min(len(word) + max_distance, _LENGTH_MASK)
+        pools = {length: [] for length in range(max(len(word) - max_distance, 1), longest + 1)}
+        # Lengths are capped at _LENGTH_MASK, so a capped word may match whatever its true length
+        pools[_LENGTH_MASK] = []
+        for delete in _deletes(word[:PREFIX_LENGTH], max_distance):
+            h = zlib.crc32(delete.encode())
+            part = h >> 24
+            lo = bisect.bisect_left(keys, h, offsets[part], offsets[part + 1])
+            hi = bisect.bisect_right(keys, h, lo, offsets[part + 1])
+            for length, pool in pools.items():
+                lo = bisect.bisect_left(payloads, length << _ID_BITS, lo, hi)
+                stop = bisect.bisect_left(payloads, (length + 1) << _ID_BITS, lo, hi)
+                pool.extend(payloads[lo:stop])
+                lo = stop
+        for pool in pools.values():
+            heapq.heapify(pool)
+
+        candidates = []
+        # Candidates found per distance
+        found = [0] * (max_distance + 1)
+        # The word itself outranks everything, wherever its bucket is, so settle it before the scan
+        exact = _direct_id(word)
+        if exact is not None and exact < starts[-1]:
+            candidates.append((0, bisect.bisect_right(starts, exact), word))
+            found[0] = 1
+        limit = max_distance
+        mask = _char_mask(word)
+        decoded = {}
+        while True:
+            # A later bucket only matters through words closer than the k-th best so far
+            total = 0
+            for distance, count in enumerate(found[:limit + 1]):
+                total += count
+                if total >= k:
+                    limit = distance - 1
+                    break
+            if limit < 1:
+                break
+            active = [(length, pool) for length, pool in pools.items()
+                      if pool and (length == _LENGTH_MASK or abs(length - len(word)) <= limit)]
+            if not active:
+                break
+
+            # Candidates of the next bucket, with a lower bound on their distance (a word shares
+            # several deletes with the input, so its payload can appear more than once)
+            bucket = bisect.bisect_right(starts, min(pool[0] & _ID_MASK for _, pool in active))
+            end = starts[bucket]
+            group = {}
+            for length, pool in active:
+                stop = (length << _ID_BITS) | end
+                gap = 0 if length == _LENGTH_MASK else abs(length - len(word))
+                while pool and pool[0] < stop:
+                    word_id = heapq.heappop(pool) & _ID_MASK
+                    if word_id == exact or word_id in group:
+                        continue
+                    bound = max(gap, _mask_distance(mask, masks[word_id]))
+                    if bound <= limit:
+                        group[word_id] = bound
+
+            # Closest-looking candidates first, so that the limit tightens as early as possible
+            for bound, word_id in sorted((bound, word_id) for word_id, bound in group.items()):
+                if bound > limit:
+                    break
+                # Candidates cluster in blocks (shared prefixes), so decode each block once
+                block, offset = divmod(word_id - starts[bucket - 1], front_coding.BLOCK_SIZE)
+                words = decoded.get((bucket, block))
+                if words is None:
+                    heads, blocks = _get_bucket_blocks(bucket)
+                    words = decoded[bucket, block] = front_coding.decode_block(heads[block], blocks[block])
+                candidate = words[offset]
+                distance = _edit_distance(word, candidate, limit)
+                if distance <= limit:
+                    candidates.append((distance, bucket, candidate))
+                    found[distance] += 1
+                    # Within this bucket, only words as close as the k-th best can still rank among the first k
+                    total = 0
+                    for closer, count in enumerate(found[:limit + 1]):
+                        total += count
+                        if total >= k:
+                            limit = closer
+                            break
+        candidates.sort()
+
+        # Break ties within the last (distance, bucket) group by frequency
+        if len(candidates) > k:
+            boundary = candidates[k - 1][:2]
+            end = k
+            while end < len(candidates) and candidates[end][:2] == boundary:
+                end += 1
+            candidates = candidates[:end]
+        candidates.sort(key=lambda c: (c[0], c[1], -(_lookup_rf(c[2]) or 0.0), c[2]))
+        return [candidate for _, _, candidate in candidates[:k]]
@@ -0,0 +1,186 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Dense integer IDs for BNC word forms.
+
+Every BNC word form has an ID in 0..669,415: its position in the word
+lists of buckets 1 through 100, each sorted alphabetically. IDs therefore
+follow frequency order at bucket resolution (ID 0 is in bucket 1, the
+highest IDs are in bucket 100), and they are stable for as long as the
+tables are. No index is built: the bucket word lists (bw/) are already a
+packed, front-coded array in that order, and bw/sizes.py gives each
+bucket's starting ID.
+
+    word_id:      hash -> bucket (freq shard) -> binary search of the
+                  bucket's block heads, decode one block up to the word
+                  -> bucket offset + position
+    word_from_id: binary search of the bucket offsets -> decode one block
+
+Words resolve as in FindBnc.exists(): normalized, then through the
+selected inflection fallback, to the ID of the base form. A contraction
+that exists only as its split parts ("we'll" -> "we" + "'ll") has no ID
+of its own, and neither do domain overlay words.
+"""
+
+import bisect
+import hashlib
+from array import array
+from itertools import accumulate
+
+from bnc_lookup import front_coding
+from bnc_lookup.find_bnc import _check_fallback
+from bnc_lookup.find_freq import _get_bucket_dict
+from bnc_lookup.find_words import _get_bucket_blocks, _get_bucket_word
+from bnc_lookup.normalize import normalize
+from bnc_lookup.shard_loader import import_table, load_once
+
+# 'offsets' -> ID of the first word of each bucket (index 0 = bucket 1), then the total
+_cache = {}
+
+
+def _load_offsets() -> tuple:
+    """Accumulate the bucket sizes generated by bnc-build into offsets."""
+    return (0, *accumulate(import_table('bnc_lookup.bw.sizes', 'sizes')))
+
+
+def _get_offsets() -> tuple:
+    """First ID of every bucket, followed by the number of IDs.
+
+    Returns:
+        Tuple of 101 ints.
+    """
+    try:
+        return _cache['offsets']
+    except KeyError:
+        return load_once(_cache, 'offsets', _load_offsets)
+
+
+def _direct_id(word: str) -> int | None:
+    """ID of a normalized word that is itself a BNC word form.
+
+    Args:
+        word: The word (should already be normalized).
+
+    Returns:
+        The ID, or None if the word is not in the BNC tables.
+    """
+    if not word:
+        return None
+    h = hashlib.md5(word.encode()).hexdigest()
+    try:
+        bucket = _get_bucket_dict(h[:2]).get(h[2:])
+    except ModuleNotFoundError:
+        return None
+    if bucket is None:
+        return None
+    position = front_coding.index(*_get_bucket_blocks(bucket), word)
+    if position is None:
+        return None
+    return _get_offsets()[bucket - 1] + position
+
+
+def _resolve_id(input_text: str, fallback: str) -> int | None:
+    """ID of a word after normalization and the inflection fallback.
+
+    Args:
+        input_text: The word to look up.
+        fallback: Inflection fallback mode (already validated).
+
+    Returns:
+        The ID of the word or its base form, or None.
+    """
+    word = normalize(input_text)
+
+    word_id = _direct_id(word)
+    if word_id is not None:
+        return word_id
+
+    if fallback == 'morph':
+        from bnc_lookup.find_lemma import _INDEX_BITS, _INDEX_MASK, _find_entry, _get_index
+        i = _find_entry(word)
+        if i is not None:
+            packed = _get_index()[1][i]
+            return _get_offsets()[(packed >> _INDEX_BITS) - 1] + (packed & _INDEX_MASK)
+
+    if fallback != 'none' and word.endswith('s') and len(word) > 3:
+        return _direct_id(word[:-1])
+
+    return None
+
+
+class FindWordIds:
+    """Dense, stable integer IDs for the 669,416 BNC word forms.
+
+    IDs run from 0 to 669,415 in bucket order, alphabetically within a
+    bucket. Lookups decode a single front-coded block, so no per-process
+    word-to-ID dict is built.
+    """
+
+    def __init__(self):
+        pass
+
+    def __len__(self) -> int:
+        return _get_offsets()[-1]
+
+    def word_id(self, input_text: str, fallback: str = 'plural') -> int | None:
+        """ID of a word.
+
+        Args:
+            input_text: The word to look up.
+            fallback: Inflection fallback mode: 'none', 'plural' (default)
+                or 'morph'.
+
+        Returns:
+            ID in 0..669,415, or None if the word is not a BNC word form
+            (directly or via the fallback).
+
+        Raises:
+            ValueError: If fallback is not a known mode.
+        """
+        _check_fallback(fallback)
+        return _resolve_id(input_text, fallback)
+
+    def word_ids(self, tokens, fallback: str = 'plural') -> array:
+        """IDs of many words.
+
+        Each distinct token is resolved once.
+
+        Args:
+            tokens: Iterable of words.
+            fallback: Inflection fallback mode: 'none', 'plural' (default)
+                or 'morph'.
+
+        Returns:
+            array('i') aligned with tokens, with -1 for words without an ID.
+
+        Raises:
+            ValueError: If fallback is not a known mode.
+        """
+        _check_fallback(fallback)
+        memo = {}
+        ids = array('i')
+        for token in tokens:
+            try:
+                ids.append(memo[token])
+            except KeyError:
+                word_id = _resolve_id(token, fallback)
+                memo[token] = -1 if word_id is None else word_id
+                ids.append(memo[token])
+        return ids
+
+    def word_from_id(self, word_id: int) -> str:
+        """Word form with a given ID.
+
+        Args:
+            word_id: ID in 0..669,415.
+
+        Returns:
+            The word form.
+
+        Raises:
+            ValueError: If word_id is out of range.
+        """
+        offsets = _get_offsets()
+        if not 0 <= word_id < offsets[-1]:
+            raise ValueError(f'word_id must be 0-{offsets[-1] - 1}, got {word_id}')
+        bucket = bisect.bisect_right(offsets, word_id)
+        return _get_bucket_word(bucket, word_id - offsets[bucket - 1])
@@ -3,21 +3,61 @@
 """Reverse lookup: retrieve words by frequency bucket.
 
 Provides the inverse of find_freq.py: given a bucket number (1-100),
-returns all words assigned to that bucket. Words are stored as sorted
-tuples in 100 files (bw_01.py through bw_100.py), one per bucket.
+returns all words assigned to that bucket. Words are stored front-coded
+in 100 files (bw_01.py through bw_100.py), one per bucket: each file holds
+the block heads and packed blocks produced by front_coding.encode().
+
+Buckets are only decoded in full when the complete word list is requested.
+Membership and prefix queries binary-search the block heads and decode a
+single block (or the few blocks covering a prefix range).
 
 Supports random sampling for applications that need representative
 words from a frequency tier without loading the full list.
 """
 
-import importlib
 import random
 
+from bnc_lookup import front_coding
+from bnc_lookup.normalize import normalize
+from bnc_lookup.shard_loader import import_table, load_once
+
 _cache = {}
 
+_block_cache = {}
+
+_count_cache = {}
+
+
+def _get_bucket_blocks(bucket: int) -> tuple[tuple, tuple]:
+    """Load and cache the front-coded blocks for a given bucket number.
+
+    Args:
+        bucket: Bucket number (1-100).
+
+    Returns:
+        Tuple of (heads, blocks) as stored in the bucket file.
+    """
+    try:
+        return _block_cache[bucket]
+    except KeyError:
+        return load_once(_block_cache, bucket, import_table, f'bnc_lookup.bw.bw_{bucket:02d}',
+                         f'heads_{bucket:02d}', f'blocks_{bucket:02d}')
+
+
+def _decode_bucket(bucket: int) -> tuple:
+    """Decode every word of a bucket from its front-coded blocks.
+
+    Args:
+        bucket: Bucket number (1-100).
+
+    Returns:
+        Tuple of words in that bucket, sorted alphabetically.
+    """
+    return front_coding.decode(*_get_bucket_blocks(bucket))
+
 
 def _get_bucket_words(bucket: int) -> tuple:
-    """Load and cache the word tuple for a given bucket number.
+    """Decode and cache the word tuple for a given bucket number.
 
     Args:
         bucket: Bucket number (1-100).
@@ -25,10 +65,57 @@ def _get_bucket_words(bucket: int) -> tuple:
     Returns:
         Tuple of words in that bucket, sorted alphabetically.
     """
-    if bucket not in _cache:
-        module = importlib.import_module(f'bnc_lookup.bw.bw_{bucket:02d}')
-        _cache[bucket] = getattr(module, f'words_{bucket:02d}')
-    return _cache[bucket]
+    try:
+        return _cache[bucket]
+    except KeyError:
+        return load_once(_cache, bucket, _decode_bucket, bucket)
+
+
+def _get_bucket_count(bucket: int) -> int:
+    """Number of words in a bucket, without decoding it.
+
+    Args:
+        bucket: Bucket number (1-100).
+
+    Returns:
+        Count of words stored in the bucket file.
+    """
+    try:
+        return _count_cache[bucket]
+    except KeyError:
+        return load_once(_count_cache, bucket, import_table, f'bnc_lookup.bw.bw_{bucket:02d}', f'count_{bucket:02d}')
+
+
+def _get_bucket_word(bucket: int, index: int) -> str:
+    """Decode the word at a given position within a bucket.
+
+    Only the block containing the position is decoded.
+
+    Args:
+        bucket: Bucket number (1-100).
+        index: Zero-based position within the bucket's sorted word list.
+
+    Returns:
+        The word at that position.
+    """
+    if bucket in _cache:
+        return _cache[bucket][index]
+    heads, blocks = _get_bucket_blocks(bucket)
+    block, offset = divmod(index, front_coding.BLOCK_SIZE)
+    return front_coding.decode_block(heads[block], blocks[block])[offset]
+
+
+def _get_prefix_words(bucket: int, prefix: str) -> list:
+    """Collect the words in a bucket that start with a prefix.
+
+    Args:
+        bucket: Bucket number (1-100).
+        prefix: The prefix to match (should already be normalized).
+
+    Returns:
+        List of matching words, sorted alphabetically.
+    """
+    return front_coding.prefix_words(*_get_bucket_blocks(bucket), prefix)
 
 
 class FindWords:
@@ -36,6 +123,7 @@ class FindWords:
 
     Each bucket contains ~6,694 words sorted alphabetically. Bucket 1
     holds the most frequent words, bucket 100 the least frequent.
+    Buckets are decoded from their front-coded form on first full access.
     """
 
     def __init__(self):
@@ -73,3 +161,23 @@ class FindWords:
         words = self.by_bucket(bucket)
         n = min(n, len(words))
         return random.sample(words, n)
+
+    def contains(self, bucket: int, word: str) -> bool:
+        """Check whether a word is assigned to a frequency bucket.
+
+        Costs a binary search over the bucket's block heads plus decoding
+        one block; the bucket is not decoded in full.
+
+        Args:
+            bucket: Bucket number 1-100.
+            word: The word to look for.
+
+        Returns:
+            True if the normalized word is in the bucket.
+
+        Raises:
+            ValueError: If bucket is not in range 1-100.
+        """
+        if not 1 <= bucket <= 100:
+            raise ValueError(f'Bucket must be 1-100, got {bucket}')
+        return front_coding.contains(*_get_bucket_blocks(bucket), normalize(word))
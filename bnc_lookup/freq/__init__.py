@@ -2,518 +2,12 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-from .f_00 import buckets_00
-from .f_01 import buckets_01
-from .f_02 import buckets_02
-from .f_03 import buckets_03
-from .f_04 import buckets_04
-from .f_05 import buckets_05
-from .f_06 import buckets_06
-from .f_07 import buckets_07
-from .f_08 import buckets_08
-from .f_09 import buckets_09
-from .f_0a import buckets_0a
-from .f_0b import buckets_0b
-from .f_0c import buckets_0c
-from .f_0d import buckets_0d
-from .f_0e import buckets_0e
-from .f_0f import buckets_0f
-from .f_10 import buckets_10
-from .f_11 import buckets_11
-from .f_12 import buckets_12
-from .f_13 import buckets_13
-from .f_14 import buckets_14
-from .f_15 import buckets_15
-from .f_16 import buckets_16
-from .f_17 import buckets_17
-from .f_18 import buckets_18
-from .f_19 import buckets_19
-from .f_1a import buckets_1a
-from .f_1b import buckets_1b
-from .f_1c import buckets_1c
-from .f_1d import buckets_1d
-from .f_1e import buckets_1e
-from .f_1f import buckets_1f
-from .f_20 import buckets_20
-from .f_21 import buckets_21
-from .f_22 import buckets_22
-from .f_23 import buckets_23
-from .f_24 import buckets_24
-from .f_25 import buckets_25
-from .f_26 import buckets_26
-from .f_27 import buckets_27
-from .f_28 import buckets_28
-from .f_29 import buckets_29
-from .f_2a import buckets_2a
-from .f_2b import buckets_2b
-from .f_2c import buckets_2c
-from .f_2d import buckets_2d
-from .f_2e import buckets_2e
-from .f_2f import buckets_2f
-from .f_30 import buckets_30
-from .f_31 import buckets_31
-from .f_32 import buckets_32
-from .f_33 import buckets_33
-from .f_34 import buckets_34
-from .f_35 import buckets_35
-from .f_36 import buckets_36
-from .f_37 import buckets_37
-from .f_38 import buckets_38
-from .f_39 import buckets_39
-from .f_3a import buckets_3a
-from .f_3b import buckets_3b
-from .f_3c import buckets_3c
-from .f_3d import buckets_3d
-from .f_3e import buckets_3e
-from .f_3f import buckets_3f
-from .f_40 import buckets_40
-from .f_41 import buckets_41
-from .f_42 import buckets_42
-from .f_43 import buckets_43
-from .f_44 import buckets_44
-from .f_45 import buckets_45
-from .f_46 import buckets_46
-from .f_47 import buckets_47
-from .f_48 import buckets_48
-from .f_49 import buckets_49
-from .f_4a import buckets_4a
-from .f_4b import buckets_4b
-from .f_4c import buckets_4c
-from .f_4d import buckets_4d
-from .f_4e import buckets_4e
-from .f_4f import buckets_4f
-from .f_50 import buckets_50
-from .f_51 import buckets_51
-from .f_52 import buckets_52
-from .f_53 import buckets_53
-from .f_54 import buckets_54
-from .f_55 import buckets_55
-from .f_56 import buckets_56
-from .f_57 import buckets_57
-from .f_58 import buckets_58
-from .f_59 import buckets_59
-from .f_5a import buckets_5a
-from .f_5b import buckets_5b
-from .f_5c import buckets_5c
-from .f_5d import buckets_5d
-from .f_5e import buckets_5e
-from .f_5f import buckets_5f
-from .f_60 import buckets_60
-from .f_61 import buckets_61
-from .f_62 import buckets_62
-from .f_63 import buckets_63
-from .f_64 import buckets_64
-from .f_65 import buckets_65
-from .f_66 import buckets_66
-from .f_67 import buckets_67
-from .f_68 import buckets_68
-from .f_69 import buckets_69
-from .f_6a import buckets_6a
-from .f_6b import buckets_6b
-from .f_6c import buckets_6c
-from .f_6d import buckets_6d
-from .f_6e import buckets_6e
-from .f_6f import buckets_6f
-from .f_70 import buckets_70
-from .f_71 import buckets_71
-from .f_72 import buckets_72
-from .f_73 import buckets_73
-from .f_74 import buckets_74
-from .f_75 import buckets_75
-from .f_76 import buckets_76
-from .f_77 import buckets_77
-from .f_78 import buckets_78
-from .f_79 import buckets_79
-from .f_7a import buckets_7a
-from .f_7b import buckets_7b
-from .f_7c import buckets_7c
-from .f_7d import buckets_7d
-from .f_7e import buckets_7e
-from .f_7f import buckets_7f
-from .f_80 import buckets_80
-from .f_81 import buckets_81
-from .f_82 import buckets_82
-from .f_83 import buckets_83
-from .f_84 import buckets_84
-from .f_85 import buckets_85
-from .f_86 import buckets_86
-from .f_87 import buckets_87
-from .f_88 import buckets_88
-from .f_89 import buckets_89
-from .f_8a import buckets_8a
-from .f_8b import buckets_8b
-from .f_8c import buckets_8c
-from .f_8d import buckets_8d
-from .f_8e import buckets_8e
-from .f_8f import buckets_8f
-from .f_90 import buckets_90
-from .f_91 import buckets_91
-from .f_92 import buckets_92
-from .f_93 import buckets_93
-from .f_94 import buckets_94
-from .f_95 import buckets_95
-from .f_96 import buckets_96
-from .f_97 import buckets_97
-from .f_98 import buckets_98
-from .f_99 import buckets_99
-from .f_9a import buckets_9a
-from .f_9b import buckets_9b
-from .f_9c import buckets_9c
-from .f_9d import buckets_9d
-from .f_9e import buckets_9e
-from .f_9f import buckets_9f
-from .f_a0 import buckets_a0
-from .f_a1 import buckets_a1
-from .f_a2 import buckets_a2
-from .f_a3 import buckets_a3
-from .f_a4 import buckets_a4
-from .f_a5 import buckets_a5
-from .f_a6 import buckets_a6
-from .f_a7 import buckets_a7
-from .f_a8 import buckets_a8
-from .f_a9 import buckets_a9
-from .f_aa import buckets_aa
-from .f_ab import buckets_ab
-from .f_ac import buckets_ac
-from .f_ad import buckets_ad
-from .f_ae import buckets_ae
-from .f_af import buckets_af
-from .f_b0 import buckets_b0
-from .f_b1 import buckets_b1
-from .f_b2 import buckets_b2
-from .f_b3 import buckets_b3
-from .f_b4 import buckets_b4
-from .f_b5 import buckets_b5
-from .f_b6 import buckets_b6
-from .f_b7 import buckets_b7
-from .f_b8 import buckets_b8
-from .f_b9 import buckets_b9
-from .f_ba import buckets_ba
-from .f_bb import buckets_bb
-from .f_bc import buckets_bc
-from .f_bd import buckets_bd
-from .f_be import buckets_be
-from .f_bf import buckets_bf
-from .f_c0 import buckets_c0
-from .f_c1 import buckets_c1
-from .f_c2 import buckets_c2
-from .f_c3 import buckets_c3
-from .f_c4 import buckets_c4
-from .f_c5 import buckets_c5
-from .f_c6 import buckets_c6
-from .f_c7 import buckets_c7
-from .f_c8 import buckets_c8
-from .f_c9 import buckets_c9
-from .f_ca import buckets_ca
-from .f_cb import buckets_cb
-from .f_cc import buckets_cc
-from .f_cd import buckets_cd
-from .f_ce import buckets_ce
-from .f_cf import buckets_cf
-from .f_d0 import buckets_d0
-from .f_d1 import buckets_d1
-from .f_d2 import buckets_d2
-from .f_d3 import buckets_d3
-from .f_d4 import buckets_d4
-from .f_d5 import buckets_d5
-from .f_d6 import buckets_d6
-from .f_d7 import buckets_d7
-from .f_d8 import buckets_d8
-from .f_d9 import buckets_d9
-from .f_da import buckets_da
-from .f_db import buckets_db
-from .f_dc import buckets_dc
-from .f_dd import buckets_dd
-from .f_de import buckets_de
-from .f_df import buckets_df
-from .f_e0 import buckets_e0
-from .f_e1 import buckets_e1
-from .f_e2 import buckets_e2
-from .f_e3 import buckets_e3
-from .f_e4 import buckets_e4
-from .f_e5 import buckets_e5
-from .f_e6 import buckets_e6
-from .f_e7 import buckets_e7
-from .f_e8 import buckets_e8
-from .f_e9 import buckets_e9
-from .f_ea import buckets_ea
-from .f_eb import buckets_eb
-from .f_ec import buckets_ec
-from .f_ed import buckets_ed
-from .f_ee import buckets_ee
-from .f_ef import buckets_ef
-from .f_f0 import buckets_f0
-from .f_f1 import buckets_f1
-from .f_f2 import buckets_f2
-from .f_f3 import buckets_f3
-from .f_f4 import buckets_f4
-from .f_f5 import buckets_f5
-from .f_f6 import buckets_f6
-from .f_f7 import buckets_f7
-from .f_f8 import buckets_f8
-from .f_f9 import buckets_f9
-from .f_fa import buckets_fa
-from .f_fb import buckets_fb
-from .f_fc import buckets_fc
-from .f_fd import buckets_fd
-from .f_fe import buckets_fe
-from .f_ff import buckets_ff
+import importlib
 
-__all__ = [
-    'buckets_00',
-    'buckets_01',
-    'buckets_02',
-    'buckets_03',
-    'buckets_04',
-    'buckets_05',
-    'buckets_06',
-    'buckets_07',
-    'buckets_08',
-    'buckets_09',
-    'buckets_0a',
-    'buckets_0b',
-    'buckets_0c',
-    'buckets_0d',
-    'buckets_0e',
-    'buckets_0f',
-    'buckets_10',
-    'buckets_11',
-    'buckets_12',
-    'buckets_13',
-    'buckets_14',
-    'buckets_15',
-    'buckets_16',
-    'buckets_17',
-    'buckets_18',
-    'buckets_19',
-    'buckets_1a',
-    'buckets_1b',
-    'buckets_1c',
-    'buckets_1d',
-    'buckets_1e',
-    'buckets_1f',
-    'buckets_20',
-    'buckets_21',
-    'buckets_22',
-    'buckets_23',
-    'buckets_24',
-    'buckets_25',
-    'buckets_26',
-    'buckets_27',
-    'buckets_28',
-    'buckets_29',
-    'buckets_2a',
-    'buckets_2b',
-    'buckets_2c',
-    'buckets_2d',
-    'buckets_2e',
-    'buckets_2f',
-    'buckets_30',
-    'buckets_31',
-    'buckets_32',
-    'buckets_33',
-    'buckets_34',
-    'buckets_35',
-    'buckets_36',
-    'buckets_37',
-    'buckets_38',
-    'buckets_39',
-    'buckets_3a',
-    'buckets_3b',
-    'buckets_3c',
-    'buckets_3d',
-    'buckets_3e',
-    'buckets_3f',
-    'buckets_40',
-    'buckets_41',
-    'buckets_42',
-    'buckets_43',
-    'buckets_44',
-    'buckets_45',
-    'buckets_46',
-    'buckets_47',
-    'buckets_48',
-    'buckets_49',
-    'buckets_4a',
-    'buckets_4b',
-    'buckets_4c',
-    'buckets_4d',
-    'buckets_4e',
-    'buckets_4f',
-    'buckets_50',
-    'buckets_51',
-    'buckets_52',
-    'buckets_53',
-    'buckets_54',
-    'buckets_55',
-    'buckets_56',
-    'buckets_57',
-    'buckets_58',
-    'buckets_59',
-    'buckets_5a',
-    'buckets_5b',
-    'buckets_5c',
-    'buckets_5d',
-    'buckets_5e',
-    'buckets_5f',
-    'buckets_60',
-    'buckets_61',
-    'buckets_62',
-    'buckets_63',
-    'buckets_64',
-    'buckets_65',
-    'buckets_66',
-    'buckets_67',
-    'buckets_68',
-    'buckets_69',
-    'buckets_6a',
-    'buckets_6b',
-    'buckets_6c',
-    'buckets_6d',
-    'buckets_6e',
-    'buckets_6f',
-    'buckets_70',
-    'buckets_71',
-    'buckets_72',
-    'buckets_73',
-    'buckets_74',
-    'buckets_75',
-    'buckets_76',
-    'buckets_77',
-    'buckets_78',
-    'buckets_79',
-    'buckets_7a',
-    'buckets_7b',
-    'buckets_7c',
-    'buckets_7d',
-    'buckets_7e',
-    'buckets_7f',
-    'buckets_80',
-    'buckets_81',
-    'buckets_82',
-    'buckets_83',
-    'buckets_84',
-    'buckets_85',
-    'buckets_86',
-    'buckets_87',
-    'buckets_88',
-    'buckets_89',
-    'buckets_8a',
-    'buckets_8b',
-    'buckets_8c',
-    'buckets_8d',
-    'buckets_8e',
-    'buckets_8f',
-    'buckets_90',
-    'buckets_91',
-    'buckets_92',
-    'buckets_93',
-    'buckets_94',
-    'buckets_95',
-    'buckets_96',
-    'buckets_97',
-    'buckets_98',
-    'buckets_99',
-    'buckets_9a',
-    'buckets_9b',
-    'buckets_9c',
-    'buckets_9d',
-    'buckets_9e',
-    'buckets_9f',
-    'buckets_a0',
-    'buckets_a1',
-    'buckets_a2',
-    'buckets_a3',
-    'buckets_a4',
-    'buckets_a5',
-    'buckets_a6',
-    'buckets_a7',
-    'buckets_a8',
-    'buckets_a9',
-    'buckets_aa',
-    'buckets_ab',
-    'buckets_ac',
-    'buckets_ad',
-    'buckets_ae',
-    'buckets_af',
-    'buckets_b0',
-    'buckets_b1',
-    'buckets_b2',
-    'buckets_b3',
-    'buckets_b4',
-    'buckets_b5',
-    'buckets_b6',
-    'buckets_b7',
-    'buckets_b8',
-    'buckets_b9',
-    'buckets_ba',
-    'buckets_bb',
-    'buckets_bc',
-    'buckets_bd',
-    'buckets_be',
-    'buckets_bf',
-    'buckets_c0',
-    'buckets_c1',
-    'buckets_c2',
-    'buckets_c3',
-    'buckets_c4',
-    'buckets_c5',
-    'buckets_c6',
-    'buckets_c7',
-    'buckets_c8',
-    'buckets_c9',
-    'buckets_ca',
-    'buckets_cb',
-    'buckets_cc',
-    'buckets_cd',
-    'buckets_ce',
-    'buckets_cf',
-    'buckets_d0',
-    'buckets_d1',
-    'buckets_d2',
-    'buckets_d3',
-    'buckets_d4',
-    'buckets_d5',
-    'buckets_d6',
-    'buckets_d7',
-    'buckets_d8',
-    'buckets_d9',
-    'buckets_da',
-    'buckets_db',
-    'buckets_dc',
-    'buckets_dd',
-    'buckets_de',
-    'buckets_df',
-    'buckets_e0',
-    'buckets_e1',
-    'buckets_e2',
-    'buckets_e3',
-    'buckets_e4',
-    'buckets_e5',
-    'buckets_e6',
-    'buckets_e7',
-    'buckets_e8',
-    'buckets_e9',
-    'buckets_ea',
-    'buckets_eb',
-    'buckets_ec',
-    'buckets_ed',
-    'buckets_ee',
-    'buckets_ef',
-    'buckets_f0',
-    'buckets_f1',
-    'buckets_f2',
-    'buckets_f3',
-    'buckets_f4',
-    'buckets_f5',
-    'buckets_f6',
-    'buckets_f7',
-    'buckets_f8',
-    'buckets_f9',
-    'buckets_fa',
-    'buckets_fb',
-    'buckets_fc',
-    'buckets_fd',
-    'buckets_fe',
-    'buckets_ff',
-]
+
+def __getattr__(name):
+    kind, _, prefix = name.partition('_')
+    if kind == 'buckets' and len(prefix) == 2:
+        module = importlib.import_module(f'{__name__}.f_{prefix}')
+        return getattr(module, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,521 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# AUTO-GENERATED - DO NOT MODIFY
+
+# Contraction suffix -> bucket of the suffix token
+suffix_buckets = {
+    'n\'t': 1,
+    '\'ll': 1,
+    '\'re': 1,
+    '\'ve': 1,
+    '\'m': 1,
+    '\'d': 1,
+    '\'s': 1,
+}
+
+# Contraction form -> (resolved bucket, 'direct' or 'contraction')
+buckets = {
+    '&lt;sp&gt_&lt/sp&gt\'s': (100, 'direct'),
+    '&scaron;kvoreck&yacute\'s': (44, 'direct'),
+    '\'50\'s': (99, 'direct'),
+    '\'60\'s': (99, 'direct'),
+    '\'80\'s': (99, 'direct'),
+    '\'90\'s': (48, 'direct'),
+    '\'author\'s': (99, 'direct'),
+    '\'d': (1, 'direct'),
+    '\'ll': (1, 'direct'),
+    '\'m': (1, 'direct'),
+    '\'re': (1, 'direct'),
+    '\'s': (1, 'direct'),
+    '\'ury\'s': (98, 'direct'),
+    '\'ve': (1, 'direct'),
+    '.38\'s': (98, 'direct'),
+    '0\'s': (44, 'direct'),
+    '000\'s': (98, 'direct'),
+    '007\'s': (21, 'direct'),
+    '01\'s': (44, 'direct'),
+    '1\'s': (11, 'direct'),
+    '1,000\'s': (97, 'direct'),
+    '1.8\'s': (97, 'direct'),
+    '10\'s': (24, 'direct'),
+    '100\'s': (44, 'direct'),
+    '1000\'s': (44, 'direct'),
+    '109\'s': (97, 'direct'),
+    '11\'s': (44, 'direct'),
+    '1155\'s': (97, 'direct'),
+    '12\'s': (97, 'direct'),
+    '13\'s': (97, 'direct'),
+    '14\'s': (21, 'direct'),
+    '15\'s': (96, 'direct'),
+    '1500\'s': (96, 'direct'),
+    '153\'s': (96, 'direct'),
+    '1540\'s': (96, 'direct'),
+    '155\'s': (96, 'direct'),
+    '1560\'s': (32, 'direct'),
+    '16\'s': (16, 'direct'),
+    '1600\'s': (96, 'direct'),
+    '17\'s': (48, 'direct'),
+    '1700\'s': (96, 'direct'),
+    '1723\'s': (96, 'direct'),
+    '1740\'s': (96, 'direct'),
+    '1760\'s': (44, 'direct'),
+    '1770\'s': (44, 'direct'),
+    '1771\'s': (96, 'direct'),
+    '1780\'s': (44, 'direct'),
+    '1790\'s': (96, 'direct'),
+    '18&ndash;30\'s': (20, 'direct'),
+    '18\'s': (96, 'direct'),
+    '1800&ndash;1850\'s': (96, 'direct'),
+    '1800\'s': (21, 'direct'),
+    '1812\'s': (95, 'direct'),
+    '1830\'s': (18, 'direct'),
+    '1840\'s': (20, 'direct'),
+    '1850\'s': (21, 'direct'),
+    '1860\'s': (20, 'direct'),
+    '1870\'s': (32, 'direct'),
+    '1880\'s': (27, 'direct'),
+    '1890\'s': (24, 'direct'),
+    '19\'s': (44, 'direct'),
+    '190\'s': (95, 'direct'),
+    '1900\'s': (28, 'direct'),
+    '1920\'s': (11, 'direct'),
+    '1923\'s': (95, 'direct'),
+    '1930\'s': (8, 'direct'),
+    '1940\'s': (14, 'direct'),
+    '1945\'s': (95, 'direct'),
+    '1950\'s': (9, 'direct'),
+    '1960\'s': (8, 'direct'),
+    '1968\'s': (95, 'direct'),
+    '1970\'s': (8, 'direct'),
+    '1974\'s': (95, 'direct'),
+    '1976\'s': (95, 'direct'),
+    '1979\'s': (95, 'direct'),
+    '1980\'s': (8, 'direct'),
+    '1981\'s': (44, 'direct'),
+    '1982\'s': (32, 'direct'),
+    '1984\'s': (95, 'direct'),
+    '1985\'s': (95, 'direct'),
+    '1986\'s': (44, 'direct'),
+    '1987\'s': (44, 'direct'),
+    '1988\'s': (44, 'direct'),
+    '1989\'s': (21, 'direct'),
+    '1990\'s': (10, 'direct'),
+    '1991\'s': (14, 'direct'),
+    '1992\'s': (16, 'direct'),
+    '1993\'s': (24, 'direct'),
+    '1999\'s': (95, 'direct'),
+    '2&ndash;8&ndash;0\'s': (95, 'direct'),
+    '2\'s': (11, 'direct'),
+    '20\'s': (20, 'direct'),
+    '2000\'s': (21, 'direct'),
+    '2005\'s': (94, 'direct'),
+    '205\'s': (44, 'direct'),
+    '21\'s': (94, 'direct'),
+    '210\'s': (94, 'direct'),
+    '23\'s': (94, 'direct'),
+    '238\'s': (94, 'direct'),
+    '242\'s': (94, 'direct'),
+    '25\'s': (94, 'direct'),
+    '252\'s': (94, 'direct'),
+    '27\'s': (94, 'direct'),
+    '28\'s': (43, 'direct'),
+    '2807\'s': (43, 'direct'),
+    '296\'s': (93, 'direct'),
+    '2n\'s': (93, 'direct'),
+    '3\'s': (20, 'direct'),
+    '30\'s': (17, 'direct'),
+    '305\'s': (93, 'direct'),
+    '31\'s': (32, 'direct'),
+    '31a\'s': (93, 'direct'),
+    '32\'s': (93, 'direct'),
+    '325i\'s': (43, 'direct'),
+    '328\'s': (93, 'direct'),
+    '33\'s': (93, 'direct'),
+    '34027\'s': (93, 'direct'),
+    '3440\'s': (93, 'direct'),
+    '348\'s': (93, 'direct'),
+    '35\'s': (93, 'direct'),
+    '3822\'s': (93, 'direct'),
+    '3i\'s': (24, 'direct'),
+    '4&ndash;4&ndash;6&ndash;0\'s': (92, 'direct'),
+    '4&ndash;6&ndash;2\'s': (92, 'direct'),
+    '4&ndash;71\'s': (92, 'direct'),
+    '4\'s': (6, 'direct'),
+    '4.0\'s': (92, 'direct'),
+    '40\'s': (16, 'direct'),
+    '4013\'s': (92, 'direct'),
+    '42\'s': (92, 'direct'),
+    '42765\'s': (92, 'direct'),
+    '43\'s': (32, 'direct'),
+    '440\'s': (92, 'direct'),
+    '4472\'s': (92, 'direct'),
+    '45\'s': (92, 'direct'),
+    '450\'s': (92, 'direct'),
+    '47\'s': (32, 'direct'),
+    '47402\'s': (92, 'direct'),
+    '4b\'s': (43, 'direct'),
+    '5\'s': (12, 'direct'),
+    '50\'s': (12, 'direct'),
+    '501\'s': (92, 'direct'),
+    '5029\'s': (92, 'direct'),
+    '51\'s': (43, 'direct'),
+    '52\'s': (92, 'direct'),
+    '522h\'s': (91, 'direct'),
+    '527\'s': (91, 'direct'),
+    '53\'s': (43, 'direct'),
+    '55\'s': (91, 'direct'),
+    '555\'s': (91, 'direct'),
+    '5637\'s': (91, 'direct'),
+    '570\'s': (91, 'direct'),
+    '58\'s': (91, 'direct'),
+    '6\'s': (43, 'direct'),
+    '60\'s': (9, 'direct'),
+    '600\'s': (91, 'direct'),
+    '615\'s': (91, 'direct'),
+    '617\'s': (91, 'direct'),
+    '627\'s': (91, 'direct'),
+    '64\'s': (91, 'direct'),
+    '65\'s': (91, 'direct'),
+    '650\'s': (91, 'direct'),
+    '68\'s': (91, 'direct'),
+    '6b\'s': (91, 'direct'),
+    '7\'s': (18, 'direct'),
+    '70\'s': (10, 'direct'),
+    '700\'s': (91, 'direct'),
+    '71000\'s': (91, 'direct'),
+    '715\'s': (91, 'direct'),
+    '737\'s': (91, 'direct'),
+    '74\'s': (91, 'direct'),
+    '740\'s': (91, 'direct'),
+    '76\'s': (24, 'direct'),
+    '7:84\'s': (90, 'direct'),
+    '8\'s': (43, 'direct'),
+    '80\'s': (11, 'direct'),
+    '80486\'s': (43, 'direct'),
+    '80r\'s': (43, 'direct'),
+    '82\'s': (90, 'direct'),
+    '826-a\'s': (90, 'direct'),
+    '850\'s': (90, 'direct'),
+    '88\'s': (43, 'direct'),
+    '8f\'s': (90, 'direct'),
+    '9\'s': (32, 'direct'),
+    '90\'s': (10, 'direct'),
+    'a\'s': (3, 'direct'),
+    'a-1\'s': (90, 'direct'),
+    'a-r\'s': (90, 'direct'),
+    'a1\'s': (43, 'direct'),
+    'a2\'s': (18, 'direct'),
+    'a3\'s': (89, 'direct'),
+    'a4\'s': (20, 'direct'),
+    'adrian\'s': (89, 'direct'),
+    'advance&mdash;mortgagee\'s': (89, 'direct'),
+    'alzheimer\'s': (88, 'direct'),
+    'andy\'s': (88, 'direct'),
+    'ann\'d': (1, 'contraction'),
+    'anne\'s': (88, 'direct'),
+    'anybody\'s': (88, 'direct'),
+    'aren\'t': (1, 'contraction'),
+    'astro\'s': (87, 'direct'),
+    'b&eacute;r&eacute;govoy\'s': (42, 'direct'),
+    'b\'s': (3, 'direct'),
+    'b-1\'s': (87, 'direct'),
+    'b-52\'s': (87, 'direct'),
+    'baron\'s': (87, 'direct'),
+    'bonington\'s': (85, 'direct'),
+    'boy\'s': (42, 'direct'),
+    'bpx-a\'s': (42, 'direct'),
+    'bruce\'s': (85, 'direct'),
+    'bureaucracy\'s': (85, 'direct'),
+    'burton\'s': (85, 'direct'),
+    'c\'m': (1, 'contraction'),
+    'c\'s': (5, 'direct'),
+    'c.i.\'s': (84, 'direct'),
+    'c130\'s': (84, 'direct'),
+    'c3\'s': (84, 'direct'),
+    'c4\'s': (42, 'direct'),
+    'c60\'s': (84, 'direct'),
+    'c64\'s': (84, 'direct'),
+    'c_c\'s': (31, 'direct'),
+    'can\'t': (1, 'contraction'),
+    'captain\'s': (84, 'direct'),
+    'cc\'s': (31, 'direct'),
+    'cci\'s': (84, 'direct'),
+    'ccl\'s': (84, 'direct'),
+    'cd\'s': (17, 'direct'),
+    'chater\'s': (83, 'direct'),
+    'child\'s': (41, 'direct'),
+    'children\'s': (83, 'direct'),
+    'chippersmart\'s': (83, 'direct'),
+    'chomsky\'s': (83, 'direct'),
+    'christie\'s': (41, 'direct'),
+    'ci\'s': (41, 'direct'),
+    'clayton\'s': (83, 'direct'),
+    'cle-1\'s': (41, 'direct'),
+    'cmi\'s': (31, 'direct'),
+    'cml\'s': (83, 'direct'),
+    'cocky\'s': (26, 'direct'),
+    'couldn\'t': (1, 'contraction'),
+    'cuthbert\'s': (81, 'direct'),
+    'cv\'s': (81, 'direct'),
+    'd&eacute;sir&eacute;e\'s': (81, 'direct'),
+    'd\'s': (7, 'direct'),
+    'd12\'s': (41, 'direct'),
+    'dat\'s': (81, 'direct'),
+    'daughter\'s/son\'s/friend\'s': (81, 'direct'),
+    'davidson\'s': (81, 'direct'),
+    'dcf\'s': (81, 'direct'),
+    'di\'s': (31, 'direct'),
+    'didn\'t': (1, 'contraction'),
+    'dix\'s': (80, 'direct'),
+    'do\'s': (17, 'direct'),
+    'doesn\'t': (1, 'contraction'),
+    'don\'t': (1, 'contraction'),
+    'donaldson\'s': (80, 'direct'),
+    'duke\'s': (79, 'direct'),
+    'duncan\'s': (79, 'direct'),
+    'e\'s': (6, 'direct'),
+    'e111\'s': (79, 'direct'),
+    'e5\'s': (79, 'direct'),
+    'e6\'s': (41, 'direct'),
+    'e6000\'s': (79, 'direct'),
+    'eastwood/gloucestershire\'s': (79, 'direct'),
+    'eckhardt-gramatt&eacute\'s': (41, 'direct'),
+    'eckhardt-grammatt&eacute\'s': (79, 'direct'),
+    'eight\'s': (41, 'direct'),
+    'eleven\'s': (79, 'direct'),
+    'eliot\'s': (79, 'direct'),
+    'ellie\'s': (79, 'direct'),
+    'else\'s': (34, 'direct'),
+    'emperor\'s': (79, 'direct'),
+    'employer\'s': (79, 'direct'),
+    'everybody\'s': (1, 'contraction'),
+    'everyone\'s': (1, 'contraction'),
+    'everything\'s': (1, 'contraction'),
+    'f\'s': (10, 'direct'),
+    'f1\'s': (31, 'direct'),
+    'f61\'s': (40, 'direct'),
+    'father\'s': (31, 'direct'),
+    'fifty-one\'s': (77, 'direct'),
+    'five\'s': (15, 'direct'),
+    'four\'s': (14, 'direct'),
+    'g\'s': (12, 'direct'),
+    'g40\'s': (40, 'direct'),
+    'g60\'s': (76, 'direct'),
+    'g7\'s': (31, 'direct'),
+    'gec\'s': (76, 'direct'),
+    'germany\'s': (75, 'direct'),
+    'goldsmith\'s': (75, 'direct'),
+    'government\'s': (75, 'direct'),
+    'gr-1\'s': (40, 'direct'),
+    'great-great-grandfather\'s': (40, 'direct'),
+    'great-great-great-grandfather\'s': (75, 'direct'),
+    'great-great-great-great-grandfather\'s': (75, 'direct'),
+    'greenslade\'s': (75, 'direct'),
+    'gti\'s': (74, 'direct'),
+    'h\'s': (23, 'direct'),
+    'h167\'s': (74, 'direct'),
+    'h3\'s': (40, 'direct'),
+    'hadn\'t': (1, 'contraction'),
+    'hasn\'t': (1, 'contraction'),
+    'haven\'t': (1, 'contraction'),
+    'he\'d': (1, 'contraction'),
+    'he\'s': (1, 'contraction'),
+    'here\'s': (1, 'contraction'),
+    'hofland\'s': (73, 'direct'),
+    'hour-and-a-half\'s': (73, 'direct'),
+    'how\'s': (1, 'contraction'),
+    'husband\'s': (73, 'direct'),
+    'hvs\'s': (73, 'direct'),
+    'i\'d': (1, 'contraction'),
+    'i\'s': (5, 'direct'),
+    'i890\'s': (72, 'direct'),
+    'ici\'s': (72, 'direct'),
+    'ii\'s': (4, 'direct'),
+    'iii\'s': (5, 'direct'),
+    'infant\'s': (72, 'direct'),
+    'island\'s': (71, 'direct'),
+    'isn\'t': (1, 'contraction'),
+    'it\'d': (1, 'contraction'),
+    'it\'s': (1, 'contraction'),
+    'iv\'s': (10, 'direct'),
+    'ix\'s': (15, 'direct'),
+    'j\'s': (10, 'direct'),
+    'j_j\'s': (71, 'direct'),
+    'jane\'s': (71, 'direct'),
+    'jenny\'s': (71, 'direct'),
+    'jmp-1\'s': (30, 'direct'),
+    'jude\'s': (71, 'direct'),
+    'k\'s': (9, 'direct'),
+    'k0\'s': (71, 'direct'),
+    'kant\'s': (71, 'direct'),
+    'l\'s': (10, 'direct'),
+    'l2\'s': (70, 'direct'),
+    'l7\'s': (70, 'direct'),
+    'lazard\'s': (70, 'direct'),
+    'leonard\'s': (69, 'direct'),
+    'let\'s': (1, 'direct'),
+    'let_,_let\'s': (26, 'direct'),
+    'let_er_let\'s': (69, 'direct'),
+    'let_let\'s': (26, 'direct'),
+    'li\'s': (17, 'direct'),
+    'liz\'s': (69, 'direct'),
+    'lloyd\'s': (39, 'direct'),
+    'lord\'s': (69, 'direct'),
+    'loved-one\'s': (69, 'direct'),
+    'm&eacute;diterran&eacute;e\'s': (68, 'direct'),
+    'm\'s': (12, 'direct'),
+    'm.i.\'s': (68, 'direct'),
+    'm25\'s': (68, 'direct'),
+    'male\'s': (68, 'direct'),
+    'margaret\'s': (68, 'direct'),
+    'marie&rehy;ang&egrave;le\'s': (68, 'direct'),
+    'marie-h&eacute;l&egrave;ne\'s': (68, 'direct'),
+    'mark\'s': (68, 'direct'),
+    'martyr\'s': (68, 'direct'),
+    'maureen\'s': (68, 'direct'),
+    'mcc\'s': (68, 'direct'),
+    'mcd\'s': (67, 'direct'),
+    'mcdonald\'s': (28, 'direct'),
+    'mci\'s': (21, 'direct'),
+    'mdc\'s': (9, 'direct'),
+    'me&scaron;trovi&cacute\'s': (67, 'direct'),
+    'mi\'s': (67, 'direct'),
+    'mid-1990\'s': (67, 'direct'),
+    'mike\'s': (67, 'direct'),
+    'mmc\'s': (18, 'direct'),
+    'mohammed\'s': (66, 'direct'),
+    'mornin\'s': (66, 'direct'),
+    'mother\'s': (38, 'direct'),
+    'n\'s': (15, 'direct'),
+    'n\'t': (1, 'direct'),
+    'neighbour\'s': (65, 'direct'),
+    'nine\'s': (30, 'direct'),
+    'nobody\'s': (1, 'contraction'),
+    'non-one\'s': (65, 'direct'),
+    'nothing\'s': (1, 'contraction'),
+    'now-they-work-and-now-they-don\'t': (64, 'direct'),
+    'now-you-see-me-now-you-don\'t': (64, 'direct'),
+    'nvocc\'s': (12, 'direct'),
+    'o\'s': (6, 'direct'),
+    'oap\'s': (64, 'direct'),
+    'one\'s': (1, 'contraction'),
+    'original\'s': (64, 'direct'),
+    'osman\'s': (63, 'direct'),
+    'other\'s': (63, 'direct'),
+    'p&aacute;le&nacute;i&ccaron;ek\'s': (63, 'direct'),
+    'p\'s': (6, 'direct'),
+    'p11\'s': (63, 'direct'),
+    'p2\'s': (38, 'direct'),
+    'p25\'s': (63, 'direct'),
+    'p90\'s': (63, 'direct'),
+    'paul\'s': (38, 'direct'),
+    'peeler\'s': (62, 'direct'),
+    'pete\'s': (62, 'direct'),
+    'peter\'s': (62, 'direct'),
+    'pi\'s': (62, 'direct'),
+    'piece-turned-stuck-up-councillor\'s': (62, 'direct'),
+    'plc\'s': (62, 'direct'),
+    'powell&mdash;pressburger\'s': (30, 'direct'),
+    'pretender\'s': (61, 'direct'),
+    'pricewell\'s': (30, 'direct'),
+    'professional\'s': (60, 'direct'),
+    'q\'s': (10, 'direct'),
+    'q1692\'s': (60, 'direct'),
+    'q2\'s': (37, 'direct'),
+    'q3\'s': (60, 'direct'),
+    'queen\'s': (37, 'direct'),
+    'r\'s': (11, 'direct'),
+    'r25\'s': (37, 'direct'),
+    'r5868\'s': (30, 'direct'),
+    'r931\'s': (60, 'direct'),
+    'rat\'s': (59, 'direct'),
+    'reagan\'s': (59, 'direct'),
+    'remov\'d': (59, 'direct'),
+    'robin\'s': (58, 'direct'),
+    'rossetti\'s/dickens\'s/browning\'s': (58, 'direct'),
+    'rtf\'s': (58, 'direct'),
+    's\'s': (8, 'direct'),
+    's120\'s': (58, 'direct'),
+    's2\'s': (25, 'direct'),
+    's80\'s': (29, 'direct'),
+    'sainsbury\'s': (58, 'direct'),
+    'saviour\'s': (37, 'direct'),
+    'scobie\'s': (57, 'direct'),
+    'seven\'s': (21, 'direct'),
+    'seven-thirty\'s': (56, 'direct'),
+    'shan\'t': (2, 'contraction'),
+    'she\'d': (1, 'contraction'),
+    'she\'s': (1, 'contraction'),
+    'shouldn\'t': (1, 'contraction'),
+    'six\'s': (36, 'direct'),
+    'someone\'s': (1, 'contraction'),
+    'something\'s': (1, 'contraction'),
+    'something-or&rehy;other\'s': (55, 'direct'),
+    'sotheby\'s': (55, 'direct'),
+    'stanford\'s': (55, 'direct'),
+    'std\'s': (54, 'direct'),
+    'steen\'s': (7, 'direct'),
+    'stepmother\'s': (54, 'direct'),
+    'susan\'s': (54, 'direct'),
+    't\'s': (7, 'direct'),
+    't3\'s': (53, 'direct'),
+    't9000\'s': (36, 'direct'),
+    'takin\'s': (53, 'direct'),
+    'ten\'s': (23, 'direct'),
+    'that\'s': (1, 'contraction'),
+    'there\'s': (1, 'contraction'),
+    'they\'d': (1, 'contraction'),
+    'they\'ll': (1, 'contraction'),
+    'thirty\'s': (52, 'direct'),
+    'three\'s': (11, 'direct'),
+    'tiffany\'s': (52, 'direct'),
+    'tracy\'d': (3, 'contraction'),
+    'twelve\'s': (35, 'direct'),
+    'two\'s': (8, 'direct'),
+    'u\'s': (12, 'direct'),
+    'u12\'s': (51, 'direct'),
+    'u18\'s': (35, 'direct'),
+    'u2\'s': (17, 'direct'),
+    'u21\'s': (51, 'direct'),
+    'under-11\'s': (51, 'direct'),
+    'under-13\'s': (35, 'direct'),
+    'under-15\'s': (51, 'direct'),
+    'v\'s': (8, 'direct'),
+    'v16\'s': (50, 'direct'),
+    'v2\'s': (50, 'direct'),
+    'v6\'s': (50, 'direct'),
+    'v8\'s': (29, 'direct'),
+    'van\'t': (7, 'contraction'),
+    'vi\'s': (9, 'direct'),
+    'vii\'s': (9, 'direct'),
+    'viii\'s': (9, 'direct'),
+    'w\'s': (14, 'direct'),
+    'wasn\'t': (1, 'contraction'),
+    'watchman\'s': (49, 'direct'),
+    'we\'d': (1, 'contraction'),
+    'weren\'t': (1, 'contraction'),
+    'what\'s': (1, 'contraction'),
+    'where\'s': (1, 'contraction'),
+    'who\'d': (1, 'contraction'),
+    'who\'s': (1, 'contraction'),
+    'won\'t': (1, 'contraction'),
+    'wouldn\'t': (1, 'contraction'),
+    'x\'s': (4, 'direct'),
+    'x100\'s': (48, 'direct'),
+    'xi\'s': (21, 'direct'),
+    'xii\'s': (21, 'direct'),
+    'xiii\'s': (22, 'direct'),
+    'xiv\'s': (15, 'direct'),
+    'xv\'s': (21, 'direct'),
+    'xx\'s': (48, 'direct'),
+    'xxii\'s': (25, 'direct'),
+    'y\'s': (11, 'direct'),
+    'yamato-1\'s': (48, 'direct'),
+    'year\'s': (29, 'direct'),
+    'yo-yo\'s': (48, 'direct'),
+    'you\'d': (1, 'contraction'),
+    'your\'s': (48, 'direct'),
+    'z\'s': (16, 'direct'),
+    'z7015\'s': (48, 'direct'),
+    'z_\'s': (48, 'direct'),
+}
@@ -1725,7 +1725,7 @@ buckets_01 = {
     'ab609dc3e5ae7c1980e885353dcfa9': 81,
     'ab6f8fcbfc5237de5dd27dd3f34bff': 4,
     'ab718af1732f330a423bed62cb5293': 19,
-    'ab898d9083d264d1127322bc5edb8a': 12,
+    'ab898d9083d264d1127322bc5edb8a': 13,
     'abbaf35a058af3bbc19ba13fdddcfb': 41,
     'abca2fa7285f0e3373ef9e07a663e3': 66,
     'abd2d31c5315799ef7cdff056b29c3': 51,
@@ -359,7 +359,7 @@ buckets_03 = {
     '23eb544cad7d7dd9d9ecfa9666bc7b': 78,
     '2425de97765db63c8c256334b61ac7': 53,
     '2444a0c6e2bcbd66fb9c7a98760d8a': 78,
-    '24854e01cbd304a0129d307f1d56ec': 85,
+    '24854e01cbd304a0129d307f1d56ec': 86,
     '24a0c397842220140d6346d898929a': 70,
     '24d532dbf559d0432c906665e4c438': 69,
     '24df304c8294e739ab739c361ebae5': 48,
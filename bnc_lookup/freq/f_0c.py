@@ -409,7 +409,7 @@ buckets_0c = {
     '25939567ca8ba315a8e33172e0ea7f': 81,
     '2599f3b5a6bdf2f59eddab8c65a231': 37,
     '25b804908f42650671950d1467af71': 95,
-    '25e46984d40d005f50b5827d7fce5e': 95,
+    '25e46984d40d005f50b5827d7fce5e': 94,
     '260a2196af51aa59157df9e2a25c59': 63,
     '2616bc84f6c90ce7ea3e8fa5cbbe44': 78,
     '26239600544a8e5a672e34d7c52977': 86,
@@ -1834,7 +1834,7 @@ buckets_1a = {
     'af8f70791659677373e020c98bef52': 18,
     'af94e75d64b59f4fe06952e159d06f': 8,
     'afa970d9c6c360bd42804ea5aba860': 24,
-    'afbb1274fda265c4cb0620594d5a6c': 65,
+    'afbb1274fda265c4cb0620594d5a6c': 66,
     'afbf17ab4d080e7e4a335343ef236f': 13,
     'afcfcd9efdd2e7ac43e80ce77bba79': 2,
     'afd9e468674829233bb825c22a63dd': 97,
@@ -1929,7 +1929,7 @@ buckets_24 = {
     'c35ca9fe08cf259c5fe4778fdb796c': 18,
     'c377f67dc6e820f07d126ed3d8df3e': 66,
     'c37c9894960803016f815a46bdc362': 9,
-    'c383370c6256e0a21b75fff612821c': 31,
+    'c383370c6256e0a21b75fff612821c': 32,
     'c3b4a670b8ef75f93ab3712721ed2a': 67,
     'c3dc9f766e90b4ad02e99df90e3895': 93,
     'c3e2c31ad79b69b3ee5f49d40c8525': 96,
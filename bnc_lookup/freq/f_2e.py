@@ -2298,7 +2298,7 @@ buckets_2e = {
     'd99d8fb99753b3730cf6b8697be6fe': 13,
     'd9e35ee3d6aa8747132d70c815ad9e': 95,
     'da0102c31bbf3578b2b852bcd8f305': 71,
-    'da2e0e58beda89e744df8f085bd2da': 42,
+    'da2e0e58beda89e744df8f085bd2da': 43,
     'da52f76e22bce1838c0008942c0b7a': 23,
     'da73b3dd4e208084b2c575a5ff7907': 77,
     'dab185e109f564dee4bcb2f340d0e2': 77,
@@ -2352,7 +2352,7 @@ buckets_31 = {
     'e7812709cf3ef57644a8b8ad391273': 45,
     'e7a44ffa77feffd338a833a5aa396f': 80,
     'e7aa4e61d3140f8550414ed4dc62fd': 39,
-    'e7cacc9ee2621ddbe37cbc2ff13850': 71,
+    'e7cacc9ee2621ddbe37cbc2ff13850': 72,
     'e7e9af075e64e704f5a6c88d238707': 5,
     'e814e3d853e061c687e9e3d605b84c': 87,
     'e82fc5060897886e6ac665ff9d16b0': 81,
@@ -2066,7 +2066,7 @@ buckets_35 = {
     'c64f14db589c754572bdd910236044': 6,
     'c65238a855f8d6ab8b10b59b162699': 86,
     'c65fec61699880bf6231d34be74a3e': 91,
-    'c67f0f2964f3ce94208066895bc6d4': 87,
+    'c67f0f2964f3ce94208066895bc6d4': 88,
     'c6b5f178e864f67308df2e28e15e4c': 48,
     'c6b7d779f5845ea2b4b74a9bdb23c7': 97,
     'c6e725e508c8e8e60f59442934897d': 67,
@@ -845,7 +845,7 @@ buckets_39 = {
     '4c202fcedf329076f8e8025ff65106': 81,
     '4c5140dfc1120ca5f03771862b9f7e': 89,
     '4c6735de41513ff4353ce89cfe59aa': 38,
-    '4c6840a0d91021b50f517097241cf8': 60,
+    '4c6840a0d91021b50f517097241cf8': 61,
     '4ccbcc2d8afd138ed105676b89d540': 93,
     '4cdcab8290db76c9fb91d05a835210': 77,
     '4cddb539484ffa40f627f0bab31058': 18,
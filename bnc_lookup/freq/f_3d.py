@@ -1024,7 +1024,7 @@ buckets_3d = {
     '628a25e892b9935143372f9882c544': 68,
     '62a1be613ecc3dcf6dd3a33701420c': 26,
     '62c1b84f9eb67211b58278574279b6': 82,
-    '62cb1454dddf62c0797c373e6f3399': 59,
+    '62cb1454dddf62c0797c373e6f3399': 60,
     '62db7b0973d1aae4b8b89a2a96f4ed': 24,
     '630eac057912717bba1bf6204e4e5d': 11,
     '6347473e76fb1ead4b65234473857e': 7,
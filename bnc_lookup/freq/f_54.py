@@ -2350,7 +2350,7 @@ buckets_54 = {
     'e68f6f812e130300ae14f7beb539a3': 69,
     'e69c115c08eb58d31308b0187c59d6': 44,
     'e6a1d7635147a9419257f6948f3f48': 36,
-    'e6d87eee0f5cb46168de8e490dc3e0': 24,
+    'e6d87eee0f5cb46168de8e490dc3e0': 25,
     'e6ffe508539ada08f55ad0f9ab6397': 46,
     'e731e44c36aa1e070633f0f12e93ff': 70,
     'e74036943f9f10489319e6edd6c140': 8,
@@ -757,7 +757,7 @@ buckets_57 = {
     '4de77f590559ebc0e093b85a0955de': 9,
     '4df2c3eb594b7b229e6aaa31d97476': 27,
     '4df373f8b1129ee97149c4429b3326': 97,
-    '4e3355d7075bdfa213f6c59ea2b60a': 25,
+    '4e3355d7075bdfa213f6c59ea2b60a': 26,
     '4e36af160e52c529ad5bbc4e0bee6d': 41,
     '4e43c369580f1b903efc4fefc617e2': 34,
     '4e5200f0e497f4f7b34b80ca442555': 15,
@@ -313,7 +313,7 @@ buckets_64 = {
     '1ea1d8e7bbcbf80c5ed3ccf7877b2a': 76,
     '1ea36fe13e645f9a42391d6e38a869': 6,
     '1eaa0e9dbfa09aa8a9caff8275d746': 73,
-    '1ed2f1b55934b47e676ffd5078ed04': 50,
+    '1ed2f1b55934b47e676ffd5078ed04': 51,
     '1ee1e6ad56301ed02409a8831f8085': 62,
     '1ef878b0cbf1ad8414eb663d158227': 80,
     '1f516f0f6744d7dc314d74676e6cbb': 53,
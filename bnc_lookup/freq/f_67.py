@@ -924,7 +924,7 @@ buckets_67 = {
     '59f63f1d8729e9bc98e2b055fbe81c': 20,
     '59f73c07c979cc7e8a958cd4b8f7d5': 66,
     '59fc22c1029832b43f896634ab1d90': 26,
-    '5a17a79e294502a6954dfc69272c83': 56,
+    '5a17a79e294502a6954dfc69272c83': 57,
     '5a1eca6858000edbc38ed82514701a': 31,
     '5a26bd401a2bc1d1aaf0143a790e49': 71,
     '5a3af6906ca321afdaf6052fe42c17': 29,
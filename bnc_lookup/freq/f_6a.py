@@ -1235,11 +1235,10 @@ buckets_6a = {
     '6fe5296581b5fded9e1baa29219bb4': 46,
     '6feb990c58f9bf9871f3eac0536649': 49,
     '6ff036a9f16716fa5a792138edc57e': 27,
-    '6ff08a7b17f9595c53d5f0385f99ef': 37,
+    '6ff08a7b17f9595c53d5f0385f99ef': 38,
     '6ff3d2f1ca7cbbab7b0c7b416d9e61': 30,
     '70346552997d4aa7e4be1455a39189': 60,
     '703d548cd50af58a1a95926c0815f3': 26,
-    '7053103e4a7976bd2515681a0b00a9': 90,
     '707ba985b76ee2123c5e21c8ca0863': 6,
     '70b952ad96b036a2de6c36410b6680': 39,
     '70c29b669cc422e27c30489ae09ee7': 74,
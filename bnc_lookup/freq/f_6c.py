@@ -379,7 +379,7 @@ buckets_6c = {
     '231833966f1df2532d58e6b2e4d427': 85,
     '231bc2dc9324ec47c002e934ec5987': 45,
     '23418cbc0c67b6fd77872005afbb04': 49,
-    '23d747946ee9e8aacc1afc813575b1': 61,
+    '23d747946ee9e8aacc1afc813575b1': 62,
     '2412b0a49fdaca29ace6d4d00404fd': 53,
     '242031b25f6dcd4ea1df22b0f54ee7': 79,
     '242c90aa0ecba9c2abe1fb9a64a0a5': 85,
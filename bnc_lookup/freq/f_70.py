@@ -1899,7 +1899,7 @@ buckets_70 = {
     'b7bed63ef4cc1f828a7071f75a5c26': 78,
     'b7cc57298f0e0ee3bce37376ba4f14': 87,
     'b7d2f4bb1382b434991d5cdbf52c1b': 68,
-    'b7efbc69f58f682a0014b53d70f929': 66,
+    'b7efbc69f58f682a0014b53d70f929': 67,
     'b81d356d56de23f982e76275047320': 99,
     'b82f65fdf1fd271079f60883af76b8': 11,
     'b83cc317a4c6ebbbc5c37d9c528cbe': 30,
@@ -2252,7 +2252,7 @@ buckets_72 = {
     'd8c36fc281546a92033784be1c9425': 77,
     'd8cec7ea0a29973fb23b25d2f80eea': 37,
     'd8e1c4947c1bb56c3ffc5f43f5f7d9': 68,
-    'd8ecbdfd1f6cdd8fdca3c7ca996080': 48,
+    'd8ecbdfd1f6cdd8fdca3c7ca996080': 49,
     'd9050de4ade3564c7b3ab3d5ee553c': 25,
     'd91373c7f165b950f83efa2c2fea22': 36,
     'd92038961662ee1dfdc09648aa5971': 81,
@@ -957,7 +957,7 @@ buckets_77 = {
     '5986a338e42fcde73fc3fe7116bd99': 44,
     '599b4e66fb1f1d248a388b213449b9': 14,
     '59a5f4526ac8e9313f526fbb7df559': 13,
-    '59b108781af4aed5947114b6f8c3a8': 84,
+    '59b108781af4aed5947114b6f8c3a8': 85,
     '59bb103eb22c489717f17746696d98': 65,
     '59bd47e41cb517c4dd943e67d2be89': 42,
     '59cc70fea9c0cc63276c3d0c040246': 32,
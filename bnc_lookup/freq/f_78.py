@@ -64,7 +64,7 @@ buckets_78 = {
     '04ff452169b189063d7f83a44e15c0': 71,
     '05015553c5f585490eac8b50c87fe8': 57,
     '056902de522acb5c9a744e5940f749': 65,
-    '056988fde9f471190ac00940d8b430': 53,
+    '056988fde9f471190ac00940d8b430': 54,
     '056ebb02cffc14bb7ece14904812dc': 1,
     '057fb733c9c93ffbdc5f0ed15ef458': 3,
     '05d8207de7b7c4d5d4728137420254': 81,
@@ -905,7 +905,7 @@ buckets_86 = {
     '541c02869776b078b9276e66d043d5': 41,
     '546f77aa99d9a1a122bed5064c9c91': 88,
     '549f69249dec283e6ec02080e2ac29': 52,
-    '54b5dda07b2d9b5dac55e13578de10': 72,
+    '54b5dda07b2d9b5dac55e13578de10': 73,
     '54cd86cf0f2619b3d32cb58583fbfb': 90,
     '54e005b5183041da69ca2b38ba0b39': 52,
     '5502fc096226beca15c90b23cd0767': 57,
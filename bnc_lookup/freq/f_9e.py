@@ -437,7 +437,7 @@ buckets_9e = {
     '28c4b6dd9773f129b40cd71f281913': 74,
     '28cff6b96cec4970b482a4c6be0e55': 72,
     '292e98cd53dbe9a7d35b678a45cfa4': 84,
-    '293965297f39327090cee01211be71': 74,
+    '293965297f39327090cee01211be71': 75,
     '29459bd13aa44d09250ec64da7cd92': 79,
     '2947713878cdaa68d84834299f84bb': 62,
     '29761352278a4c21d0f40221653700': 100,
@@ -2249,7 +2249,7 @@ buckets_a2 = {
     'e1687722d8fb1cc5da48eb50d16c12': 41,
     'e1b72f33b06ae3bba74c334fe87904': 69,
     'e205ce41661cf87f2d46463d38fc9e': 42,
-    'e219463ec20389b8ef9ec915d6fd5b': 89,
+    'e219463ec20389b8ef9ec915d6fd5b': 90,
     'e2236fb4776c280f3b80e2eae96568': 87,
     'e22a56eb908b5e3a22bd910091d2b9': 13,
     'e2306f1ad216379e2b92dd28b25bf7': 14,
@@ -1502,7 +1502,7 @@ buckets_a3 = {
     '918661296eb3ecb85df5121331272d': 60,
     '918f11e8f888f30f1ab12b306065d8': 22,
     '9194b12a4e50bd7cf172a7d8527120': 71,
-    '91a4d34feca160f2b11a7af0e4899e': 36,
+    '91a4d34feca160f2b11a7af0e4899e': 37,
     '91a4ecbded0e6a658019dd8d83509d': 35,
     '91acaced0c9a0c4ca0ecebf95f38a0': 78,
     '91aeb83839b8f44cf47aff74998b24': 4,
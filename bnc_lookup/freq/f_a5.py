@@ -1419,7 +1419,7 @@ buckets_a5 = {
     '8c319266321110c0805528b4e47c61': 56,
     '8c416fcfc853e976a551f7bb9c5162': 41,
     '8c4b337b295a4274dd2cfc8e3b41bd': 13,
-    '8d14fdc0de5b30ad15b9e44090723a': 67,
+    '8d14fdc0de5b30ad15b9e44090723a': 68,
     '8d2b78a8c3ab140c36cf0f750e9216': 26,
     '8d2cd4f30c14b2b724c4dfd75d538a': 43,
     '8d5df2fef668510176d782c1caafaf': 5,
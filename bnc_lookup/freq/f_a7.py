@@ -723,7 +723,7 @@ buckets_a7 = {
     '489a46c604aa3da10e1187f52b00e5': 50,
     '48a01e8194585f3f731611e676166c': 82,
     '48d2907d57b766d7a1c1a63314c6c1': 31,
-    '48d4d0543f3ed2e61fd4f9e292cb92': 75,
+    '48d4d0543f3ed2e61fd4f9e292cb92': 76,
     '48dbc693e9ad15e316438119d320f2': 62,
     '4908bc3f0881d07b02489e7d4359c4': 66,
     '494c85ac80480cbccafe925c86a23f': 92,
@@ -488,7 +488,7 @@ buckets_b7 = {
     '2a45a9bc92f03376336cedc51e1e20': 30,
     '2a4f23134c0f82039976d853b73f9b': 15,
     '2a5a099433a2099fc3d92f6ad3accf': 91,
-    '2a86ab48e2d1c46ff59452a719cba9': 62,
+    '2a86ab48e2d1c46ff59452a719cba9': 63,
     '2a898a212e9a2e58ec89ff4173f9d1': 38,
     '2a97c32fda1c39e3bad2419ce52f1e': 23,
     '2aaaba54e6cda312609cd4a8b26836': 11,
@@ -20,7 +20,7 @@ buckets_bb = {
     '01cd573b7a853ef76fc8c5a4446b07': 30,
     '01d02d910aeda998f875a080ea108d': 71,
     '01da1e032a98b7fd501f4d230cb2ee': 9,
-    '01e5aece3eda37c58760fa9f28e338': 54,
+    '01e5aece3eda37c58760fa9f28e338': 55,
     '01effa2be3a33a6fd2e2cb90b62b23': 71,
     '01f00daaeac676313d2031dfd1e419': 96,
     '023f273e181b1520edddb245d0487a': 99,
@@ -608,7 +608,7 @@ buckets_bb = {
     '3ae9d7e05188e8c0a978d6032a0702': 34,
     '3aec0fdcdbc2974890f805c585d432': 1,
     '3b0b478daa485a4bc6ed09b2a75a5e': 69,
-    '3b264324291c7994c6d4b2722871b5': 86,
+    '3b264324291c7994c6d4b2722871b5': 87,
     '3b322e2202e551c113bef304c16db4': 91,
     '3b7120165076ab71989dd6631d950c': 45,
     '3b88c1c64f1f6da85b04f3f88fcc36': 87,
@@ -2444,7 +2444,7 @@ buckets_c8 = {
     'eeacdbb45168d34160c390c7415e15': 81,
     'eeb380ac8f15fb5b9c3b33362ad0a1': 33,
     'eec37acc44aa485aca4be2e42fce4d': 55,
-    'eeca8e60ffd46795932efcaef930f9': 18,
+    'eeca8e60ffd46795932efcaef930f9': 19,
     'eed216e9b9442c91f3be6574bf1540': 47,
     'eedca905a76c69b650779ddeb8939a': 38,
     'eeee71f0c0cba53f4114661e690351': 44,
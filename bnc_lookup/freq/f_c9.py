@@ -514,7 +514,7 @@ buckets_c9 = {
     '34967033dc2931534a5661d04d580f': 10,
     '34bb4f047e0d9e49b126df0dbfc589': 19,
     '34e7c6da08a36804ba7339c23644b5': 1,
-    '34f702647117bdf1ec8ea0331c061a': 77,
+    '34f702647117bdf1ec8ea0331c061a': 78,
     '3551623d229b5e44044ef43fd5ae02': 57,
     '359982e91bbd3979f672f2fa20dcea': 38,
     '359fae5940ff5018a2c628123fe23c': 84,
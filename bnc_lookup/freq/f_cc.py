@@ -2300,7 +2300,7 @@ buckets_cc = {
     'dd006b04f0cdb20dfe80d6b263a5ee': 72,
     'dd0c016df3ba22b4a3be31a55777a2': 87,
     'dd12760af4b5d992929187f788d0fb': 30,
-    'dd2fff2db952ce8fdf7ad125a9cc21': 80,
+    'dd2fff2db952ce8fdf7ad125a9cc21': 81,
     'dd98d00e1a7ee8e34194c6941f889d': 42,
     'ddadc6194a64c5d82298900a52f5db': 44,
     'ddd0640364c388e819d08633ee23f3': 5,
@@ -1467,7 +1467,7 @@ buckets_cf = {
     '8cde77986170b1f78bedd7f9a831ec': 69,
     '8cdf1dec526af1661f5f52456dc3df': 97,
     '8cffab60cb60184a1eac584cb71ae6': 46,
-    '8d096973db8ce5ee5d7ade8a0d9f17': 81,
+    '8d096973db8ce5ee5d7ade8a0d9f17': 82,
     '8d2948cf85da2d4c84477f94faf831': 38,
     '8d41bcf3b8a60697c16d63bb6da4f5': 57,
     '8d6ce381370e97aca9a9d5b37d92c5': 53,
@@ -1751,7 +1751,7 @@ buckets_d4 = {
     'abb1e428377f05a8dd6bf6e118b18f': 92,
     'abd3cab101c23f202f61f5db8d8514': 18,
     'abec37ca1aa093603975fd1f781a49': 99,
-    'ac0561b0380c2c291079d0876bdf4c': 6,
+    'ac0561b0380c2c291079d0876bdf4c': 7,
     'ac1478a4d8a4f591d35e3d75f3de65': 1,
     'ac3dbd0aa74ff216697e0585f52e3b': 47,
     'ac4e466ad1ddb02f82f223bac8cc76': 56,
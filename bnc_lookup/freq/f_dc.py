@@ -2289,7 +2289,7 @@ buckets_dc = {
     'e1b67b7740b4db1a06383b8487913d': 76,
     'e1c15c7fc3e2a838b8af2c687f86ca': 75,
     'e1eb286a06db76b6ef08e149e178d1': 77,
-    'e2028fff0acb37c7ceda9ffc32d7d0': 49,
+    'e2028fff0acb37c7ceda9ffc32d7d0': 50,
     'e22d40e2a3514d65b230d56d55edbf': 33,
     'e25c717f9a6f6342be8089683fba10': 89,
     'e293ea14731f542c86d704fd2c4497': 46,
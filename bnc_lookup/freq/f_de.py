@@ -2342,7 +2342,7 @@ buckets_de = {
     'e86ddba6cfea17470fd634cfb808d6': 45,
     'e874d3e4349ec862ed52692369c4d0': 17,
     'e89b7e727edb829ab4f781723395cd': 99,
-    'e8adfe19bf6b1ef1c94ae8e170b79d': 43,
+    'e8adfe19bf6b1ef1c94ae8e170b79d': 44,
     'e8b3ff7e1c978e181afd68577014fe': 63,
     'e8bc6a2a1766378214b563a8baff3a': 78,
     'e8d94d5aac735f81905c4211e35122': 15,
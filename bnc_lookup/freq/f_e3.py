@@ -1125,7 +1125,7 @@ buckets_e3 = {
     '72b5b663ac2061794069cbc32eee60': 32,
     '72c0a95fc8b34360521c89dde8c9bf': 33,
     '72c5c76b0735682fb05b9e963071c2': 28,
-    '730fc9db961496bf90e3b07ae9c0bb': 83,
+    '730fc9db961496bf90e3b07ae9c0bb': 84,
     '731b4e1125130a6ab82fa6dc9580eb': 44,
     '732fc41fbf5b45677c0f51a1cc8ccd': 86,
     '7398be33d51714b3804564be1857a0': 96,
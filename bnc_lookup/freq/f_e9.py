@@ -731,7 +731,7 @@ buckets_e9 = {
     '4ad12f14326c0ccf8bfe54ce527175': 53,
     '4aee61ecb1fe55a00e47faca55afdc': 64,
     '4b05267c174d3b767d21386c7cf4c3': 38,
-    '4b1621a7fde9bd7a7fba7a68f85abc': 30,
+    '4b1621a7fde9bd7a7fba7a68f85abc': 31,
     '4b3752eda845d7824abec5953c089d': 74,
     '4b3cc28ea70e4dc07dc4b04924d734': 57,
     '4b460edc672bb4b23e9b73cd88572e': 88,
@@ -1863,7 +1863,7 @@ buckets_e9 = {
     'ba68fdfe490565158560da5f84aae6': 14,
     'ba796155370b188c79f628f92aff82': 76,
     'ba8e4b59b746229bd8f458c66cd254': 96,
-    'babd359b2afa8a3fde88508357a628': 79,
+    'babd359b2afa8a3fde88508357a628': 80,
     'bac668739611f9050de7f2aac5dcd0': 92,
     'baccaf7a96dd736736889a0854c475': 13,
     'bad2a68ae92a72b49c3f7496e25e96': 59,
@@ -1513,7 +1513,7 @@ buckets_ed = {
     '92eff813a02a31a2677be0563a0739': 5,
     '930cf8750730114f9f1da8e883add4': 13,
     '9336343dfb0f787bc6defdb42b52bc': 78,
-    '933b254b2bff90222819a59af4019a': 78,
+    '933b254b2bff90222819a59af4019a': 79,
     '936c02f2b0594ab2f48011db76ac90': 14,
     '937f3ccd321e545ede503f3d5203c2': 65,
     '9394a4534148a5c681eb18ed602c60': 79,
@@ -1562,7 +1562,7 @@ buckets_ed = {
     '973cea6d685e660d6b792166694c5a': 75,
     '9748441d44f71008edabd0b0332aae': 59,
     '974a42724a7427cec56ca9564d89fb': 5,
-    '974cc031791096f9f9536d2bc96b8c': 73,
+    '974cc031791096f9f9536d2bc96b8c': 74,
     '975c816123531f417682540081204b': 16,
     '975f25460bdc0f6baabb25ac533d35': 42,
     '9773cd3f9c60c47b93225ac5b645de': 47,
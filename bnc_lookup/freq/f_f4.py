@@ -678,7 +678,7 @@ buckets_f4 = {
     '3c083e27e1ee87db322b7c090d4d21': 79,
     '3c16324e76c5b9643aadc31097057f': 83,
     '3c17b8c2d55fe4427f3e276ae3f47c': 42,
-    '3c3af89a9f607fae55109d66fe4691': 55,
+    '3c3af89a9f607fae55109d66fe4691': 56,
     '3c3bbca67ac009cc1c69635762c4df': 78,
     '3c3f662723c736793ded205d07b342': 86,
     '3c5bb8c7e472866497b89c690ae86f': 3,
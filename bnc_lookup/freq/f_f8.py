@@ -2135,7 +2135,7 @@ buckets_f8 = {
     'cec188f35d1eab0a2f81801fd42713': 46,
     'ced0396386e4d48a1dc69bdb4b6a05': 88,
     'ceee43786adfc32a6a619faf6659b9': 20,
-    'cf0b792e4f5885a1fb97b152e325df': 68,
+    'cf0b792e4f5885a1fb97b152e325df': 69,
     'cf1e2b67e1c964b21872b67cf62f36': 76,
     'cf3aab4d7812cd9df7c16aa3081480': 7,
     'cf57de7982df98c5c38ca046d02221': 42,
@@ -0,0 +1,191 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Front coding for sorted word lists.
+
+Alphabetically sorted words share long prefixes with their predecessor
+("interest", "interested", "interesting", ...). Front coding stores each
+word as the length of the prefix it shares with the previous word plus the
+remaining suffix, which shrinks the bucket word lists several-fold.
+
+Words are grouped into blocks of BLOCK_SIZE. The first word of each block
+(the head) is stored in full in a separate tuple, so a word can be located
+by binary search over the heads followed by decoding a single block. The
+rest of the block is packed into one string of entries:
+
+    chr(shared + 32) + chr(len(tail) + 32) + tail
+
+Offsetting by 32 keeps the control bytes printable in the generated
+modules. Shared prefixes are capped at MAX_SHARED so they stay in the
+ASCII range. Tails cannot be capped without splitting a word, so their
+length is limited to MAX_TAIL, which keeps the length character below the
+surrogate range (the longest BNC word has 140 characters).
+"""
+
+import bisect
+
+BLOCK_SIZE = 16
+
+MAX_SHARED = 94
+
+_OFFSET = 32
+
+# Longest tail whose length character is a valid, non-surrogate code point
+MAX_TAIL = 0xD7FF - _OFFSET
+
+
+def _shared_length(a: str, b: str) -> int:
+    """Length of the common prefix of two strings, capped at MAX_SHARED.
+
+    Args:
+        a: First string.
+        b: Second string.
+
+    Returns:
+        Number of leading characters the strings share.
+    """
+    limit = min(len(a), len(b), MAX_SHARED)
+    i = 0
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def encode(words: tuple) -> tuple[tuple, tuple]:
+    """Front-code an alphabetically sorted sequence of words.
+
+    Args:
+        words: Sorted sequence of words.
+
+    Returns:
+        Tuple of (heads, blocks): the first word of every block, and the
+        packed remainder of every block.
+
+    Raises:
+        ValueError: If a word's tail is longer than MAX_TAIL.
+    """
+    heads, blocks = [], []
+    for start in range(0, len(words), BLOCK_SIZE):
+        block = words[start:start + BLOCK_SIZE]
+        prev = block[0]
+        parts = []
+        for word in block[1:]:
+            shared = _shared_length(prev, word)
+            tail = word[shared:]
+            if len(tail) > MAX_TAIL:
+                raise ValueError(f'word of {len(word)} characters is too long to front-code')
+            parts.append(chr(shared + _OFFSET) + chr(len(tail) + _OFFSET) + tail)
+            prev = word
+        heads.append(block[0])
+        blocks.append(''.join(parts))
+    return tuple(heads), tuple(blocks)
+
+
+def decode_block(head: str, block: str) -> list:
+    """Decode a single front-coded block.
+
+    Args:
+        head: The first word of the block.
+        block: The packed remainder of the block.
+
+    Returns:
+        List of the block's words in sorted order.
+    """
+    words = [head]
+    prev = head
+    i, n = 0, len(block)
+    while i < n:
+        shared = ord(block[i]) - _OFFSET
+        end = i + 2 + ord(block[i + 1]) - _OFFSET
+        prev = prev[:shared] + block[i + 2:end]
+        words.append(prev)
+        i = end
+    return words
+
+
+def decode(heads: tuple, blocks: tuple) -> tuple:
+    """Decode every block of a front-coded word list.
+
+    Args:
+        heads: First word of every block.
+        blocks: Packed remainder of every block.
+
+    Returns:
+        Tuple of all words in sorted order.
+    """
+    words = []
+    for head, block in zip(heads, blocks):
+        words.extend(decode_block(head, block))
+    return tuple(words)
+
+
+def contains(heads: tuple, blocks: tuple, word: str) -> bool:
+    """Check whether a word is present in a front-coded word list.
+
+    Binary search over the block heads, then decode one block.
+
+    Args:
+        heads: First word of every block.
+        blocks: Packed remainder of every block.
+        word: The word to find.
+
+    Returns:
+        True if the word is in the list.
+    """
+    i = bisect.bisect_right(heads, word) - 1
+    if i < 0:
+        return False
+    return word in decode_block(heads[i], blocks[i])
+
+
+def index(heads: tuple, blocks: tuple, word: str) -> int | None:
+    """Position of a word in a front-coded word list.
+
+    Binary search over the block heads, then decode the block only up to
+    the word.
+
+    Args:
+        heads: First word of every block.
+        blocks: Packed remainder of every block.
+        word: The word to find.
+
+    Returns:
+        Zero-based position of the word, or None if absent.
+    """
+    i = bisect.bisect_right(heads, word) - 1
+    if i < 0:
+        return None
+    prev = heads[i]
+    position = i * BLOCK_SIZE
+    block = blocks[i]
+    k, n = 0, len(block)
+    while prev < word and k < n:
+        shared = ord(block[k]) - _OFFSET
+        end = k + 2 + ord(block[k + 1]) - _OFFSET
+        prev = prev[:shared] + block[k + 2:end]
+        position += 1
+        k = end
+    return position if prev == word else None
+
+
+def prefix_words(heads: tuple, blocks: tuple, prefix: str) -> list:
+    """Collect every word starting with a prefix from a front-coded list.
+
+    Only the blocks overlapping the prefix range are decoded.
+
+    Args:
+        heads: First word of every block.
+        blocks: Packed remainder of every block.
+        prefix: The prefix to match.
+
+    Returns:
+        List of matching words in sorted order.
+    """
+    i = max(bisect.bisect_left(heads, prefix) - 1, 0)
+    matches = []
+    for j in range(i, len(heads)):
+        for word in decode_block(heads[j], blocks[j]):
+            if word.startswith(prefix):
+                matches.append(word)
+            elif word > prefix:
+                return matches
+    return matches
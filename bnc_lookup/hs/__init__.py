@@ -2,518 +2,12 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-from .h_00 import hashes_00
-from .h_01 import hashes_01
-from .h_02 import hashes_02
-from .h_03 import hashes_03
-from .h_04 import hashes_04
-from .h_05 import hashes_05
-from .h_06 import hashes_06
-from .h_07 import hashes_07
-from .h_08 import hashes_08
-from .h_09 import hashes_09
-from .h_0a import hashes_0a
-from .h_0b import hashes_0b
-from .h_0c import hashes_0c
-from .h_0d import hashes_0d
-from .h_0e import hashes_0e
-from .h_0f import hashes_0f
-from .h_10 import hashes_10
-from .h_11 import hashes_11
-from .h_12 import hashes_12
-from .h_13 import hashes_13
-from .h_14 import hashes_14
-from .h_15 import hashes_15
-from .h_16 import hashes_16
-from .h_17 import hashes_17
-from .h_18 import hashes_18
-from .h_19 import hashes_19
-from .h_1a import hashes_1a
-from .h_1b import hashes_1b
-from .h_1c import hashes_1c
-from .h_1d import hashes_1d
-from .h_1e import hashes_1e
-from .h_1f import hashes_1f
-from .h_20 import hashes_20
-from .h_21 import hashes_21
-from .h_22 import hashes_22
-from .h_23 import hashes_23
-from .h_24 import hashes_24
-from .h_25 import hashes_25
-from .h_26 import hashes_26
-from .h_27 import hashes_27
-from .h_28 import hashes_28
-from .h_29 import hashes_29
-from .h_2a import hashes_2a
-from .h_2b import hashes_2b
-from .h_2c import hashes_2c
-from .h_2d import hashes_2d
-from .h_2e import hashes_2e
-from .h_2f import hashes_2f
-from .h_30 import hashes_30
-from .h_31 import hashes_31
-from .h_32 import hashes_32
-from .h_33 import hashes_33
-from .h_34 import hashes_34
-from .h_35 import hashes_35
-from .h_36 import hashes_36
-from .h_37 import hashes_37
-from .h_38 import hashes_38
-from .h_39 import hashes_39
-from .h_3a import hashes_3a
-from .h_3b import hashes_3b
-from .h_3c import hashes_3c
-from .h_3d import hashes_3d
-from .h_3e import hashes_3e
-from .h_3f import hashes_3f
-from .h_40 import hashes_40
-from .h_41 import hashes_41
-from .h_42 import hashes_42
-from .h_43 import hashes_43
-from .h_44 import hashes_44
-from .h_45 import hashes_45
-from .h_46 import hashes_46
-from .h_47 import hashes_47
-from .h_48 import hashes_48
-from .h_49 import hashes_49
-from .h_4a import hashes_4a
-from .h_4b import hashes_4b
-from .h_4c import hashes_4c
-from .h_4d import hashes_4d
-from .h_4e import hashes_4e
-from .h_4f import hashes_4f
-from .h_50 import hashes_50
-from .h_51 import hashes_51
-from .h_52 import hashes_52
-from .h_53 import hashes_53
-from .h_54 import hashes_54
-from .h_55 import hashes_55
-from .h_56 import hashes_56
-from .h_57 import hashes_57
-from .h_58 import hashes_58
-from .h_59 import hashes_59
-from .h_5a import hashes_5a
-from .h_5b import hashes_5b
-from .h_5c import hashes_5c
-from .h_5d import hashes_5d
-from .h_5e import hashes_5e
-from .h_5f import hashes_5f
-from .h_60 import hashes_60
-from .h_61 import hashes_61
-from .h_62 import hashes_62
-from .h_63 import hashes_63
-from .h_64 import hashes_64
-from .h_65 import hashes_65
-from .h_66 import hashes_66
-from .h_67 import hashes_67
-from .h_68 import hashes_68
-from .h_69 import hashes_69
-from .h_6a import hashes_6a
-from .h_6b import hashes_6b
-from .h_6c import hashes_6c
-from .h_6d import hashes_6d
-from .h_6e import hashes_6e
-from .h_6f import hashes_6f
-from .h_70 import hashes_70
-from .h_71 import hashes_71
-from .h_72 import hashes_72
-from .h_73 import hashes_73
-from .h_74 import hashes_74
-from .h_75 import hashes_75
-from .h_76 import hashes_76
-from .h_77 import hashes_77
-from .h_78 import hashes_78
-from .h_79 import hashes_79
-from .h_7a import hashes_7a
-from .h_7b import hashes_7b
-from .h_7c import hashes_7c
-from .h_7d import hashes_7d
-from .h_7e import hashes_7e
-from .h_7f import hashes_7f
-from .h_80 import hashes_80
-from .h_81 import hashes_81
-from .h_82 import hashes_82
-from .h_83 import hashes_83
-from .h_84 import hashes_84
-from .h_85 import hashes_85
-from .h_86 import hashes_86
-from .h_87 import hashes_87
-from .h_88 import hashes_88
-from .h_89 import hashes_89
-from .h_8a import hashes_8a
-from .h_8b import hashes_8b
-from .h_8c import hashes_8c
-from .h_8d import hashes_8d
-from .h_8e import hashes_8e
-from .h_8f import hashes_8f
-from .h_90 import hashes_90
-from .h_91 import hashes_91
-from .h_92 import hashes_92
-from .h_93 import hashes_93
-from .h_94 import hashes_94
-from .h_95 import hashes_95
-from .h_96 import hashes_96
-from .h_97 import hashes_97
-from .h_98 import hashes_98
-from .h_99 import hashes_99
-from .h_9a import hashes_9a
-from .h_9b import hashes_9b
-from .h_9c import hashes_9c
-from .h_9d import hashes_9d
-from .h_9e import hashes_9e
-from .h_9f import hashes_9f
-from .h_a0 import hashes_a0
-from .h_a1 import hashes_a1
-from .h_a2 import hashes_a2
-from .h_a3 import hashes_a3
-from .h_a4 import hashes_a4
-from .h_a5 import hashes_a5
-from .h_a6 import hashes_a6
-from .h_a7 import hashes_a7
-from .h_a8 import hashes_a8
-from .h_a9 import hashes_a9
-from .h_aa import hashes_aa
-from .h_ab import hashes_ab
-from .h_ac import hashes_ac
-from .h_ad import hashes_ad
-from .h_ae import hashes_ae
-from .h_af import hashes_af
-from .h_b0 import hashes_b0
-from .h_b1 import hashes_b1
-from .h_b2 import hashes_b2
-from .h_b3 import hashes_b3
-from .h_b4 import hashes_b4
-from .h_b5 import hashes_b5
-from .h_b6 import hashes_b6
-from .h_b7 import hashes_b7
-from .h_b8 import hashes_b8
-from .h_b9 import hashes_b9
-from .h_ba import hashes_ba
-from .h_bb import hashes_bb
-from .h_bc import hashes_bc
-from .h_bd import hashes_bd
-from .h_be import hashes_be
-from .h_bf import hashes_bf
-from .h_c0 import hashes_c0
-from .h_c1 import hashes_c1
-from .h_c2 import hashes_c2
-from .h_c3 import hashes_c3
-from .h_c4 import hashes_c4
-from .h_c5 import hashes_c5
-from .h_c6 import hashes_c6
-from .h_c7 import hashes_c7
-from .h_c8 import hashes_c8
-from .h_c9 import hashes_c9
-from .h_ca import hashes_ca
-from .h_cb import hashes_cb
-from .h_cc import hashes_cc
-from .h_cd import hashes_cd
-from .h_ce import hashes_ce
-from .h_cf import hashes_cf
-from .h_d0 import hashes_d0
-from .h_d1 import hashes_d1
-from .h_d2 import hashes_d2
-from .h_d3 import hashes_d3
-from .h_d4 import hashes_d4
-from .h_d5 import hashes_d5
-from .h_d6 import hashes_d6
-from .h_d7 import hashes_d7
-from .h_d8 import hashes_d8
-from .h_d9 import hashes_d9
-from .h_da import hashes_da
-from .h_db import hashes_db
-from .h_dc import hashes_dc
-from .h_dd import hashes_dd
-from .h_de import hashes_de
-from .h_df import hashes_df
-from .h_e0 import hashes_e0
-from .h_e1 import hashes_e1
-from .h_e2 import hashes_e2
-from .h_e3 import hashes_e3
-from .h_e4 import hashes_e4
-from .h_e5 import hashes_e5
-from .h_e6 import hashes_e6
-from .h_e7 import hashes_e7
-from .h_e8 import hashes_e8
-from .h_e9 import hashes_e9
-from .h_ea import hashes_ea
-from .h_eb import hashes_eb
-from .h_ec import hashes_ec
-from .h_ed import hashes_ed
-from .h_ee import hashes_ee
-from .h_ef import hashes_ef
-from .h_f0 import hashes_f0
-from .h_f1 import hashes_f1
-from .h_f2 import hashes_f2
-from .h_f3 import hashes_f3
-from .h_f4 import hashes_f4
-from .h_f5 import hashes_f5
-from .h_f6 import hashes_f6
-from .h_f7 import hashes_f7
-from .h_f8 import hashes_f8
-from .h_f9 import hashes_f9
-from .h_fa import hashes_fa
-from .h_fb import hashes_fb
-from .h_fc import hashes_fc
-from .h_fd import hashes_fd
-from .h_fe import hashes_fe
-from .h_ff import hashes_ff
+import importlib
 
-__all__ = [
-    'hashes_00',
-    'hashes_01',
-    'hashes_02',
-    'hashes_03',
-    'hashes_04',
-    'hashes_05',
-    'hashes_06',
-    'hashes_07',
-    'hashes_08',
-    'hashes_09',
-    'hashes_0a',
-    'hashes_0b',
-    'hashes_0c',
-    'hashes_0d',
-    'hashes_0e',
-    'hashes_0f',
-    'hashes_10',
-    'hashes_11',
-    'hashes_12',
-    'hashes_13',
-    'hashes_14',
-    'hashes_15',
-    'hashes_16',
-    'hashes_17',
-    'hashes_18',
-    'hashes_19',
-    'hashes_1a',
-    'hashes_1b',
-    'hashes_1c',
-    'hashes_1d',
-    'hashes_1e',
-    'hashes_1f',
-    'hashes_20',
-    'hashes_21',
-    'hashes_22',
-    'hashes_23',
-    'hashes_24',
-    'hashes_25',
-    'hashes_26',
-    'hashes_27',
-    'hashes_28',
-    'hashes_29',
-    'hashes_2a',
-    'hashes_2b',
-    'hashes_2c',
-    'hashes_2d',
-    'hashes_2e',
-    'hashes_2f',
-    'hashes_30',
-    'hashes_31',
-    'hashes_32',
-    'hashes_33',
-    'hashes_34',
-    'hashes_35',
-    'hashes_36',
-    'hashes_37',
-    'hashes_38',
-    'hashes_39',
-    'hashes_3a',
-    'hashes_3b',
-    'hashes_3c',
-    'hashes_3d',
-    'hashes_3e',
-    'hashes_3f',
-    'hashes_40',
-    'hashes_41',
-    'hashes_42',
-    'hashes_43',
-    'hashes_44',
-    'hashes_45',
-    'hashes_46',
-    'hashes_47',
-    'hashes_48',
-    'hashes_49',
-    'hashes_4a',
-    'hashes_4b',
-    'hashes_4c',
-    'hashes_4d',
-    'hashes_4e',
-    'hashes_4f',
-    'hashes_50',
-    'hashes_51',
-    'hashes_52',
-    'hashes_53',
-    'hashes_54',
-    'hashes_55',
-    'hashes_56',
-    'hashes_57',
-    'hashes_58',
-    'hashes_59',
-    'hashes_5a',
-    'hashes_5b',
-    'hashes_5c',
-    'hashes_5d',
-    'hashes_5e',
-    'hashes_5f',
-    'hashes_60',
-    'hashes_61',
-    'hashes_62',
-    'hashes_63',
-    'hashes_64',
-    'hashes_65',
-    'hashes_66',
-    'hashes_67',
-    'hashes_68',
-    'hashes_69',
-    'hashes_6a',
-    'hashes_6b',
-    'hashes_6c',
-    'hashes_6d',
-    'hashes_6e',
-    'hashes_6f',
-    'hashes_70',
-    'hashes_71',
-    'hashes_72',
-    'hashes_73',
-    'hashes_74',
-    'hashes_75',
-    'hashes_76',
-    'hashes_77',
-    'hashes_78',
-    'hashes_79',
-    'hashes_7a',
-    'hashes_7b',
-    'hashes_7c',
-    'hashes_7d',
-    'hashes_7e',
-    'hashes_7f',
-    'hashes_80',
-    'hashes_81',
-    'hashes_82',
-    'hashes_83',
-    'hashes_84',
-    'hashes_85',
-    'hashes_86',
-    'hashes_87',
-    'hashes_88',
-    'hashes_89',
-    'hashes_8a',
-    'hashes_8b',
-    'hashes_8c',
-    'hashes_8d',
-    'hashes_8e',
-    'hashes_8f',
-    'hashes_90',
-    'hashes_91',
-    'hashes_92',
-    'hashes_93',
-    'hashes_94',
-    'hashes_95',
-    'hashes_96',
-    'hashes_97',
-    'hashes_98',
-    'hashes_99',
-    'hashes_9a',
-    'hashes_9b',
-    'hashes_9c',
-    'hashes_9d',
-    'hashes_9e',
-    'hashes_9f',
-    'hashes_a0',
-    'hashes_a1',
-    'hashes_a2',
-    'hashes_a3',
-    'hashes_a4',
-    'hashes_a5',
-    'hashes_a6',
-    'hashes_a7',
-    'hashes_a8',
-    'hashes_a9',
-    'hashes_aa',
-    'hashes_ab',
-    'hashes_ac',
-    'hashes_ad',
-    'hashes_ae',
-    'hashes_af',
-    'hashes_b0',
-    'hashes_b1',
-    'hashes_b2',
-    'hashes_b3',
-    'hashes_b4',
-    'hashes_b5',
-    'hashes_b6',
-    'hashes_b7',
-    'hashes_b8',
-    'hashes_b9',
-    'hashes_ba',
-    'hashes_bb',
-    'hashes_bc',
-    'hashes_bd',
-    'hashes_be',
-    'hashes_bf',
-    'hashes_c0',
-    'hashes_c1',
-    'hashes_c2',
-    'hashes_c3',
-    'hashes_c4',
-    'hashes_c5',
-    'hashes_c6',
-    'hashes_c7',
-    'hashes_c8',
-    'hashes_c9',
-    'hashes_ca',
-    'hashes_cb',
-    'hashes_cc',
-    'hashes_cd',
-    'hashes_ce',
-    'hashes_cf',
-    'hashes_d0',
-    'hashes_d1',
-    'hashes_d2',
-    'hashes_d3',
-    'hashes_d4',
-    'hashes_d5',
-    'hashes_d6',
-    'hashes_d7',
-    'hashes_d8',
-    'hashes_d9',
-    'hashes_da',
-    'hashes_db',
-    'hashes_dc',
-    'hashes_dd',
-    'hashes_de',
-    'hashes_df',
-    'hashes_e0',
-    'hashes_e1',
-    'hashes_e2',
-    'hashes_e3',
-    'hashes_e4',
-    'hashes_e5',
-    'hashes_e6',
-    'hashes_e7',
-    'hashes_e8',
-    'hashes_e9',
-    'hashes_ea',
-    'hashes_eb',
-    'hashes_ec',
-    'hashes_ed',
-    'hashes_ee',
-    'hashes_ef',
-    'hashes_f0',
-    'hashes_f1',
-    'hashes_f2',
-    'hashes_f3',
-    'hashes_f4',
-    'hashes_f5',
-    'hashes_f6',
-    'hashes_f7',
-    'hashes_f8',
-    'hashes_f9',
-    'hashes_fa',
-    'hashes_fb',
-    'hashes_fc',
-    'hashes_fd',
-    'hashes_fe',
-    'hashes_ff',
-]
+
+def __getattr__(name):
+    kind, _, prefix = name.partition('_')
+    if kind == 'hashes' and len(prefix) == 2:
+        module = importlib.import_module(f'{__name__}.h_{prefix}')
+        return getattr(module, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1239,7 +1239,6 @@ hashes_6a = frozenset({
     '6ff3d2f1ca7cbbab7b0c7b416d9e61',
     '70346552997d4aa7e4be1455a39189',
     '703d548cd50af58a1a95926c0815f3',
-    '7053103e4a7976bd2515681a0b00a9',
     '707ba985b76ee2123c5e21c8ca0863',
     '70b952ad96b036a2de6c36410b6680',
     '70c29b669cc422e27c30489ae09ee7',
@@ -0,0 +1,208 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Local HTTP/JSON front-end for batched lookups.
+
+For services that are not written in Python. Built on the standard
+library only: http.server with one thread per connection, HTTP/1.1
+keep-alive, and the shard caches of this process shared by every request.
+
+Endpoints:
+    POST /lookup   Body: {"tokens": [...], "fallback": "plural"} (fallback
+                   optional) or a bare JSON array of tokens.
+                   Response: {"exists": [...], "bucket": [...], "rf": [...]},
+                   each aligned with the tokens.
+    GET  /stats    Per-endpoint request count and latency (mean, p50, p99,
+                   max in milliseconds, over the most recent requests).
+    GET  /health   {"status": "ok"}
+
+Errors are returned as {"error": "..."} with status 400 (bad request body),
+404 (unknown path) or 405 (wrong method).
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bnc_lookup.find_batch import FindBatch
+from bnc_lookup.find_bnc import FALLBACK_MODES
+from bnc_lookup.server import _preload
+
+# Latency samples kept per endpoint for the percentiles in /stats
+LATENCY_SAMPLES = 1024
+
+# Largest accepted request body in bytes
+MAX_BODY = 16 * 1024 * 1024
+
+
+class _Stats:
+    """Thread-safe per-endpoint request counts and recent latencies."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._samples = {}
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of one request.
+
+        Args:
+            endpoint: Endpoint name (e.g., 'POST /lookup').
+            seconds: Time spent handling the request.
+        """
+        with self._lock:
+            self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+            if endpoint not in self._samples:
+                self._samples[endpoint] = deque(maxlen=LATENCY_SAMPLES)
+            self._samples[endpoint].append(seconds * 1000)
+
+    def report(self) -> dict:
+        """Summarize the recorded latencies.
+
+        Returns:
+            Dict of endpoint -> {count, mean_ms, p50_ms, p99_ms, max_ms}.
+        """
+        with self._lock:
+            snapshot = {endpoint: (self._counts[endpoint], sorted(samples))
+                        for endpoint, samples in self._samples.items()}
+        report = {}
+        for endpoint, (count, samples) in snapshot.items():
+            n = len(samples)
+            report[endpoint] = {
+                'count': count,
+                'mean_ms': round(sum(samples) / n, 4),
+                'p50_ms': round(samples[n // 2], 4),
+                'p99_ms': round(samples[min(n - 1, n * 99 // 100)], 4),
+                'max_ms': round(samples[-1], 4),
+            }
+        return report
+
+
+def _parse_lookup(body: bytes) -> tuple[list, str]:
+    """Validate a /lookup request body.
+
+    Args:
+        body: Raw request body.
+
+    Returns:
+        Tuple of (tokens, fallback).
+
+    Raises:
+        ValueError: If the body is not valid JSON of the expected shape.
+    """
+    try:
+        payload = json.loads(body)
+    except RecursionError:
+        raise ValueError('request body is nested too deeply') from None
+    fallback = 'plural'
+    if isinstance(payload, dict):
+        fallback = payload.get('fallback', fallback)
+        payload = payload.get('tokens')
+    if not isinstance(payload, list) or not all(isinstance(t, str) for t in payload):
+        raise ValueError('expected a JSON array of strings or {"tokens": [...]}')
+    if fallback not in FALLBACK_MODES:
+        raise ValueError(f'fallback must be one of {", ".join(FALLBACK_MODES)}, got {fallback!r}')
+    return payload, fallback
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Route requests to the lookup, stats and health endpoints."""
+
+    protocol_version = 'HTTP/1.1'
+
+    # Headers and body are written separately; without TCP_NODELAY every
+    # keep-alive response waits for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        """Suppress per-request logging on stderr."""
+
+    def _send_json(self, status: int, payload) -> None:
+        body = json.dumps(payload, separators=(',', ':')).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        start = time.perf_counter()
+        if self.path == '/stats':
+            self._send_json(200, self.server.stats.report())
+        elif self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif self.path == '/lookup':
+            self._send_json(405, {'error': 'use POST /lookup'})
+            return
+        else:
+            self._send_json(404, {'error': f'unknown path {self.path}'})
+            return
+        self.server.stats.record(f'GET {self.path}', time.perf_counter() - start)
+
+    def do_POST(self):
+        start = time.perf_counter()
+        if self.path in ('/stats', '/health'):
+            self._send_json(405, {'error': f'use GET {self.path}'})
+            return
+        if self.path != '/lookup':
+            self._send_json(404, {'error': f'unknown path {self.path}'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_BODY:
+            # The body cannot be skipped reliably, so the connection ends here
+            self.close_connection = True
+            self._send_json(400, {'error': f'Content-Length must be an integer from 0 to {MAX_BODY}'})
+            return
+        try:
+            tokens, fallback = _parse_lookup(self.rfile.read(length))
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        batch = self.server.batches[fallback]
+        self._send_json(200, {
+            'exists': batch.exists(tokens),
+            'bucket': batch.bucket(tokens),
+            'rf': batch.relative_frequency(tokens),
+        })
+        self.server.stats.record('POST /lookup', time.perf_counter() - start)
+
+
+class LookupHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering batched BNC lookups.
+
+    One FindBatch per fallback mode is shared by all connections, so
+    repeated tokens are answered from memory across requests.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple):
+        """Bind the server.
+
+        Args:
+            address: (host, port) to listen on. Port 0 picks a free port.
+        """
+        super().__init__(address, _Handler)
+        self.stats = _Stats()
+        self.batches = {mode: FindBatch(fallback=mode) for mode in FALLBACK_MODES}
+
+
+def serve_http(host: str = '127.0.0.1', port: int = 8765, preload: bool = True) -> None:
+    """Run the HTTP front-end until interrupted.
+
+    Args:
+        host: Interface to bind (default 127.0.0.1, local only).
+        port: TCP port (default 8765).
+        preload: Load every shard before accepting connections (default True).
+    """
+    if preload:
+        _preload()
+    server = LookupHTTPServer((host, port))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
@@ -0,0 +1,146 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""On-disk cache for indexes derived from the BNC tables.
+
+Some indexes (e.g., the spelling-suggestion delete index) are built from
+the shipped word lists on first use. Building them takes seconds, so the
+result is written to a binary cache file as a sequence of typed arrays and
+read back with a single sequential read on later runs.
+
+The cache directory is taken from the BNC_LOOKUP_CACHE environment variable,
+defaulting to ~/.cache/bnc_lookup. Setting BNC_LOOKUP_CACHE to an empty
+string disables the disk cache; indexes are then rebuilt in every process.
+Any failure to read or write the cache is silently ignored.
+
+Indexes built from a lexicon version other than the installed tables (see
+lexicon.py) are cached under the version's tag, so versions never read
+each other's indexes.
+"""
+
+import os
+import struct
+import sys
+from array import array
+
+from bnc_lookup import lexicon
+
+# Bump when the layout of any cached index, or the shipped tables, change
+CACHE_VERSION = 3
+
+_MAGIC = b'BNCIDX'
+
+_HEADER = struct.Struct('<6sBBI')
+
+_LENGTH = struct.Struct('<Q')
+
+
+def cache_dir() -> str | None:
+    """Resolve the directory used for cached index files.
+
+    Returns:
+        Absolute directory path, or None if the disk cache is disabled.
+    """
+    path = os.environ.get('BNC_LOOKUP_CACHE')
+    if path is None:
+        path = os.path.join(os.path.expanduser('~'), '.cache', 'bnc_lookup')
+    return path or None
+
+
+def _cache_path(name: str) -> str | None:
+    """Build the file path for a named cache entry.
+
+    Args:
+        name: Cache entry name (e.g., 'suggest-100-7-2').
+
+    Returns:
+        File path, or None if the disk cache is disabled.
+    """
+    directory = cache_dir()
+    if directory is None:
+        return None
+    return os.path.join(directory, f'{name}-v{CACHE_VERSION}.bin')
+
+
+def load_arrays(name: str, typecodes: tuple) -> tuple | None:
+    """Read a tuple of typed arrays from the disk cache.
+
+    Args:
+        name: Cache entry name.
+        typecodes: Array typecode for each stored array, in order.
+
+    Returns:
+        Tuple of arrays, or None if the entry is missing or unreadable.
+    """
+    path = _cache_path(name)
+    if path is None:
+        return None
+    try:
+        with open(path, 'rb') as f:
+            magic, order, count, _ = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC or order != (sys.byteorder == 'little') or count != len(typecodes):
+                return None
+            arrays = []
+            for typecode in typecodes:
+                (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+                values = array(typecode)
+                values.fromfile(f, length)
+                arrays.append(values)
+            return tuple(arrays)
+    except (OSError, EOFError, ValueError, struct.error):
+        return None
+
+
+def save_arrays(name: str, arrays: tuple) -> None:
+    """Write a tuple of typed arrays to the disk cache.
+
+    The file is written to a temporary name and renamed into place so
+    concurrent readers never see a partial file.
+
+    Args:
+        name: Cache entry name.
+        arrays: Arrays to store, in order.
+    """
+    path = _cache_path(name)
+    if path is None:
+        return
+    tmp = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, sys.byteorder == 'little', len(arrays), 0))
+            for values in arrays:
+                f.write(_LENGTH.pack(len(values)))
+                values.tofile(f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def load_or_build(name: str, typecodes: tuple, build, *args) -> tuple:
+    """Read an index from the disk cache, building and saving it if absent.
+
+    An index built while a lexicon swap happened may mix two versions and
+    is not saved.
+
+    Args:
+        name: Cache entry name.
+        typecodes: Array typecode for each stored array, in order.
+        build: Function building the arrays.
+        *args: Arguments passed to build.
+
+    Returns:
+        Tuple of arrays.
+    """
+    tag = lexicon.current.tag
+    if tag:
+        name = f'{name}-{tag}'
+    arrays = load_arrays(name, typecodes)
+    if arrays is None:
+        version = lexicon.version
+        arrays = build(*args)
+        if version == lexicon.version and not version & 1:
+            save_arrays(name, arrays)
+    return arrays
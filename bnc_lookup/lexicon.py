@@ -0,0 +1,351 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Versioned lexicon data, swapped atomically in a running process.
+
+A Lexicon is one version of the data tables: a table archive written by
+bnc-build --archive, or, for Lexicon(), the installed tables. The lookup
+modules keep the active version's tables in their module-level caches,
+and installing a Lexicon rebinds all of them, so the lookups themselves
+(and memory_report()) follow the new version without an extra indirection
+on their hot path.
+
+Shipping a corrected or extended lexicon to a long-running service:
+
+    bnc-build all.num --output /srv/bnc/v2
+    bnc-build --archive /srv/bnc/v2.bnca --output /srv/bnc/v2
+
+    future = bnc.load_lexicon('/srv/bnc/v2.bnca')
+
+load_lexicon() opens the new version and loads every shard into its own
+caches in a background thread, while lookups keep answering from the old
+version. It then swaps the new version in, so no lookup after the swap
+pays for a cold shard. Indexes derived from the tables (lemma and
+suggestion indexes, decoded and reversed word lists) are rebuilt right
+after the swap, in the same thread, if the old version had built them.
+Both versions are resident while the new one warms.
+
+The swap is guarded by a sequence counter (version), which is odd while
+the caches are being rebound. The module-level functions and FindBatch
+read it before and after each call and run the call again if it changed,
+so every result comes from a single version, even for a call that
+overlaps the swap. Outside a swap, the check costs two integer reads.
+The coroutines of bnc_lookup.aio go through the same functions. The
+lookup classes (FindBnc, FindFreq, FindRF, ...) read the active caches
+directly and are not retried: a call on an instance that overlaps a swap
+can combine tables of both versions, so use the module-level functions
+or FindBatch where a swap can happen.
+"""
+
+import importlib
+import threading
+from functools import wraps
+
+from bnc_lookup import archive
+
+# Read as True by type checkers only; importing typing for it would cost more than the executor
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+# Incremented twice by every swap: odd while the caches are being rebound
+version = 0
+
+# Held by a swap while it rebinds the caches
+_swap_lock = threading.Lock()
+
+# Sharded tables: archive name prefix -> (module, cache attribute), keyed by shard prefix
+_SHARDS = {
+    'hashes': ('find_bnc', '_cache'),
+    'buckets': ('find_freq', '_cache'),
+    'frequencies': ('find_rf', '_cache'),
+}
+
+# Bucket word lists, keyed by bucket: (module, count cache, block cache)
+_WORD_LISTS = ('find_words', '_count_cache', '_block_cache')
+
+# Version-wide tables the modules bind at import: (module, attribute, generated module, table)
+_CONSTANTS = (
+    ('find_freq', '_contractions', 'bnc_lookup.freq.contractions', 'buckets'),
+    ('find_freq', '_suffix_buckets', 'bnc_lookup.freq.contractions', 'suffix_buckets'),
+    ('find_rf', '_contractions', 'bnc_lookup.rf.contractions', 'frequencies'),
+    ('find_rf', '_suffix_frequencies', 'bnc_lookup.rf.contractions', 'suffix_frequencies'),
+)
+
+# Caches derived from the tables: (module, attribute, loader, whether the loader takes the key).
+# A new version starts them empty; those in use are rebuilt after the swap.
+_DERIVED = (
+    ('find_word_ids', '_cache', '_get_offsets', False),
+    ('find_scores', '_cache', '_get_tables', False),
+    ('find_words', '_cache', '_get_bucket_words', True),
+    ('find_pattern', '_cache', '_get_reversed_words', True),
+    ('find_lemma', '_cache', '_get_index', False),
+    ('find_suggestions', '_cache', '_get_index', True),
+    ('find_segments', '_costs', None, False),
+)
+
+_executor = None
+
+_executor_lock = threading.Lock()
+
+
+def _module(name: str):
+    """Import a lookup module of the package by its short name."""
+    return importlib.import_module(f'bnc_lookup.{name}')
+
+
+class Lexicon:
+    """One version of the data tables, and the caches loaded from it.
+
+    Lexicon() is the installed tables (through their archive, if any; see
+    archive.use_archive()). Lexicon(path) reads an archive written by
+    bnc-build --archive and never falls back to the installed modules, so
+    lookups cannot mix the two. A Lexicon is installed at most once; to
+    return to a version, open its path again.
+    """
+
+    def __init__(self, path: str | None = None):
+        """Open a version of the tables.
+
+        Args:
+            path: Table archive, or None for the installed tables.
+
+        Raises:
+            OSError: If the archive cannot be opened.
+            ValueError: If the file is not a table archive, or lacks
+                tables (archives written before version-wide tables were
+                archived).
+        """
+        self.path = path
+        if path:
+            self.archive = archive.TableArchive(path, exclusive=True)
+            required = [archive.table_key(module_name, name)
+                        for module_name, names in (*archive.table_modules(), *archive.SINGLE_MODULES)
+                        for name in names]
+            missing = [key for key in required if key not in self.archive]
+            if missing:
+                raise ValueError(f'{path} lacks {len(missing)} tables (e.g., {missing[0]}); '
+                                 f'write it again with bnc-build --archive')
+            # Names this version's entries in the index disk cache
+            self.tag = self.archive.digest()[:16]
+        else:
+            self.archive = archive.installed
+            self.tag = ''
+        self._state = None
+        self._used = False
+
+    def __repr__(self) -> str:
+        return f'Lexicon({self.path!r})'
+
+    def _get_state(self) -> dict:
+        """Module attribute values of this version, created on first use.
+
+        Returns:
+            Dict of (module, attribute) -> value, in the order the swap
+            rebinds them: shards and tables before the derived caches.
+        """
+        if self._state is None:
+            state = {cache: {} for cache in _SHARDS.values()}
+            module, counts, blocks = _WORD_LISTS
+            state[module, counts] = {}
+            state[module, blocks] = {}
+            for module, attribute, module_name, name in _CONSTANTS:
+                state[module, attribute] = archive.read_tables(self.archive, module_name, (name,))[0]
+            for module, attribute, _, _ in _DERIVED:
+                state[module, attribute] = {}
+            self._state = state
+        return self._state
+
+    def warm(self) -> int:
+        """Load every shard of this version into its caches.
+
+        The caches are this version's own, so warming does not affect
+        lookups until the version is installed.
+
+        Returns:
+            Number of shard modules loaded.
+        """
+        state = self._get_state()
+        module, counts, blocks = _WORD_LISTS
+        loaded = 0
+        for module_name, names in archive.table_modules():
+            values = archive.read_tables(self.archive, module_name, names)
+            kind, key = names[0].rsplit('_', 1)
+            if kind == 'count':
+                bucket = int(key)
+                state[module, counts][bucket] = values[0]
+                state[module, blocks][bucket] = (values[1], values[2])
+            else:
+                state[_SHARDS[kind]][key] = values[0]
+            loaded += 1
+        return loaded
+
+    def _rebuild(self, in_use: dict) -> None:
+        """Rebuild the derived caches the previous version had built.
+
+        Args:
+            in_use: (module, attribute) -> keys present in the previous
+                version's cache.
+        """
+        for module, attribute, loader, keyed in _DERIVED:
+            keys = in_use[module, attribute]
+            if loader is None or not keys:
+                continue
+            load = getattr(_module(module), loader)
+            if keyed:
+                for key in keys:
+                    load(key)
+            else:
+                load()
+
+
+def _stable_version() -> int:
+    """The current version, once no swap is in progress.
+
+    Returns:
+        An even version number.
+    """
+    start = version
+    while start & 1:
+        with _swap_lock:
+            pass
+        start = version
+    return start
+
+
+def consistent(func):
+    """Make a lookup function answer from a single lexicon version.
+
+    The call is run again if a swap started or ended while it ran (an
+    exception raised during a swap counts as a result of the swap).
+
+    Args:
+        func: Function to wrap. Its arguments must allow running it again.
+
+    Returns:
+        The wrapped function.
+    """
+    @wraps(func)
+    def call(*args, **kwargs):
+        while True:
+            start = version
+            if start & 1:
+                start = _stable_version()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                if version == start:
+                    raise
+                continue
+            if version == start:
+                return result
+    return call
+
+
+def consistent_tokens(func):
+    """Like consistent(), for functions taking an iterable of tokens first.
+
+    The tokens are read into a list first, so a call that runs again sees
+    them again.
+
+    Args:
+        func: Function to wrap.
+
+    Returns:
+        The wrapped function.
+    """
+    call = consistent(func)
+
+    @wraps(func)
+    def call_tokens(tokens, *args, **kwargs):
+        if not isinstance(tokens, (list, tuple)):
+            tokens = list(tokens)
+        return call(tokens, *args, **kwargs)
+    return call_tokens
+
+
+def use_lexicon(lexicon: Lexicon) -> Lexicon:
+    """Install a lexicon version for every lookup, replacing the active one.
+
+    The caches of every lookup module are rebound together; calls that
+    overlap the swap run again on the new version (see consistent()).
+    Install a warmed Lexicon (see Lexicon.warm()) to avoid cold shards
+    afterwards. The derived indexes the previous version had built are
+    rebuilt before returning.
+
+    Args:
+        lexicon: The version to install.
+
+    Returns:
+        The previously active Lexicon.
+
+    Raises:
+        ValueError: If the Lexicon was installed before.
+    """
+    global current, version
+    state = lexicon._get_state()
+    modules = {name: _module(name) for name, _ in state}
+    with _swap_lock:
+        if lexicon._used:
+            raise ValueError(f'{lexicon!r} was installed before; open its path again to return to it')
+        in_use = {(module, attribute): list(getattr(modules[module], attribute))
+                  for module, attribute, _, _ in _DERIVED}
+        replaced = [getattr(modules[module], attribute) for module, attribute in state]
+        previous = current
+        version += 1
+        try:
+            archive.active = lexicon.archive
+            current = lexicon
+            for (module, attribute), value in state.items():
+                setattr(modules[module], attribute, value)
+        finally:
+            version += 1
+        lexicon._used = True
+    _module('shard_loader').discard_locks(replaced)
+    lexicon._rebuild(in_use)
+    return previous
+
+
+def _load(path: str | None) -> Lexicon:
+    """Open, warm and install a lexicon version (run in the loader thread)."""
+    lexicon = Lexicon(path)
+    lexicon.warm()
+    use_lexicon(lexicon)
+    return lexicon
+
+
+def _get_executor() -> 'ThreadPoolExecutor':
+    """Create the loader thread on first use.
+
+    A single thread, so versions requested in a row are installed in order.
+
+    Returns:
+        The module's ThreadPoolExecutor.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # Imported on first use: concurrent.futures is slow to import and most processes never swap
+            from concurrent.futures import ThreadPoolExecutor
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='bnc-lexicon')
+        return _executor
+
+
+def load_lexicon(path: str | None) -> 'Future':
+    """Load a lexicon version in the background and swap it in once warm.
+
+    Lookups keep answering from the active version until the swap.
+
+    Args:
+        path: Table archive written by bnc-build --archive, or None for
+            the installed tables.
+
+    Returns:
+        concurrent.futures.Future of the installed Lexicon. If the version
+        cannot be loaded, the Future holds the exception and the active
+        version stays in place.
+    """
+    return _get_executor().submit(_load, path)
+
+# The active version
+current = Lexicon()
+current._used = True
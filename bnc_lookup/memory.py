@@ -0,0 +1,122 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Memory accounting for the loaded tables and indexes.
+
+Every table module keeps what it has loaded in module-level cache dicts.
+memory_report() walks those caches and reports, per table, which shards
+are resident, how many entries they hold and their deep size: the
+container plus every key, value and nested object, each object counted
+once per table.
+
+Shards of a table are of similar size (MD5 prefixes spread words evenly;
+frequency buckets hold about the same number of words), so the size of a
+full load is projected by scaling the resident shards up to the table's
+shard count.
+
+Sizes come from sys.getsizeof() and cover Python object memory only, not
+allocator overhead or the bytecode of imported shard modules, so process
+RSS is somewhat higher.
+"""
+
+import sys
+
+from bnc_lookup import find_bnc, find_freq, find_lemma, find_pattern, find_rf, find_suggestions, find_words
+
+# Table name -> (module owning the cache, cache attribute, number of shards or None,
+# entry counter). bw entries are front-coded blocks of up to 16 words.
+_TABLES = {
+    'hs': (find_bnc, '_cache', 256, len),
+    'freq': (find_freq, '_cache', 256, len),
+    'rf': (find_rf, '_cache', 256, len),
+    'bw': (find_words, '_block_cache', 100, lambda blocks: len(blocks[1])),
+    'bw_counts': (find_words, '_count_cache', 100, lambda count: 1),
+    'words': (find_words, '_cache', 100, len),
+    'reversed': (find_pattern, '_cache', 100, len),
+    'lemma': (find_lemma, '_cache', 1, lambda index: len(index[0])),
+    'suggestions': (find_suggestions, '_cache', None, lambda index: len(index[1])),
+}
+
+_CONTAINERS = (tuple, list, set, frozenset)
+
+
+def deep_size(obj, seen: set | None = None) -> int:
+    """Size of an object and everything reachable through its containers.
+
+    Follows tuples, lists, sets, frozensets and dicts (keys and values).
+    Other objects, including arrays, are measured with sys.getsizeof(),
+    which counts their buffers.
+
+    Args:
+        obj: The object to measure.
+        seen: Ids of objects already counted; shared objects are counted
+            only once across calls that pass the same set.
+
+    Returns:
+        Size in bytes.
+    """
+    if seen is None:
+        seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, _CONTAINERS):
+            stack.extend(item)
+    return size
+
+
+def _table_report(cache: dict, shards: int | None, count) -> dict:
+    """Measure one table cache.
+
+    Args:
+        cache: The module cache dict.
+        shards: Number of shards in a full load, or None if open-ended.
+        count: Function returning the number of entries in a cached value.
+
+    Returns:
+        Dict with shards, resident, entries, bytes and projected_bytes.
+    """
+    # Copy first: other threads may load shards while we measure
+    items = sorted(dict(cache).items(), key=lambda item: str(item[0]))
+    seen = set()
+    size = sum(deep_size(value, seen) for _, value in items)
+    projected = None
+    if shards is not None and items:
+        projected = round(size * shards / len(items))
+    return {
+        'shards': shards,
+        'resident': [key for key, _ in items],
+        'entries': sum(count(value) for _, value in items),
+        'bytes': size,
+        'projected_bytes': projected,
+    }
+
+
+def memory_report() -> dict:
+    """Report the memory held by every loaded table and index.
+
+    Nothing is loaded by the report itself.
+
+    Returns:
+        Dict with 'tables' (table name -> shards, resident shard keys,
+        entries, bytes and projected_bytes for a full load, or None when
+        nothing is resident or the table has no fixed shard count),
+        'total_bytes' and 'projected_total_bytes' (the sum of the known
+        projections).
+    """
+    tables = {
+        name: _table_report(getattr(module, cache), shards, count)
+        for name, (module, cache, shards, count) in _TABLES.items()
+    }
+    return {
+        'tables': tables,
+        'total_bytes': sum(table['bytes'] for table in tables.values()),
+        'projected_total_bytes': sum(table['projected_bytes'] or 0 for table in tables.values()),
+    }
@@ -0,0 +1,207 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Opt-in instrumentation for lookups and shard loads.
+
+When enabled, records:
+    paths     How each exists/bucket/relative_frequency call was resolved:
+              'direct', 'contraction', 'morph', 'plural' or 'miss'
+    loads     Shard and index loads per table, with durations
+    latency   A log-linear (HDR-style) latency histogram per function
+
+Metrics are disabled by default. The lookup functions then only test the
+module-level `enabled` flag, so the overhead is one attribute read per
+call. Enable with enable() or by setting BNC_LOOKUP_METRICS=1 in the
+environment before bnc_lookup is imported.
+
+Usage:
+    from bnc_lookup import metrics
+
+    metrics.enable()
+    ...
+    print(metrics.snapshot())
+    metrics.reset()
+"""
+
+import os
+import threading
+import time
+
+# Checked by the instrumented functions; change it with enable() / disable()
+enabled = os.environ.get('BNC_LOOKUP_METRICS', '') not in ('', '0')
+
+# Resolution paths reported for every instrumented function
+PATHS = ('direct', 'contraction', 'morph', 'plural', 'miss')
+
+# Percentiles reported for each latency histogram
+PERCENTILES = (50, 90, 99, 99.9)
+
+# Values below 2**_PRECISION_BITS get their own histogram bucket; larger
+# values share buckets spanning 1/2**(_PRECISION_BITS - 1) of their power
+# of two, bounding the relative error at about 6%
+_PRECISION_BITS = 5
+
+_HALF = 1 << (_PRECISION_BITS - 1)
+
+_lock = threading.Lock()
+
+_paths = {}
+
+_loads = {}
+
+_histograms = {}
+
+
+def enable() -> None:
+    """Start recording metrics."""
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    """Stop recording metrics; recorded values are kept until reset()."""
+    global enabled
+    enabled = False
+
+
+def reset() -> None:
+    """Discard everything recorded so far."""
+    with _lock:
+        _paths.clear()
+        _loads.clear()
+        _histograms.clear()
+
+
+def _bucket_index(value: int) -> int:
+    """Histogram bucket of a non-negative integer value.
+
+    Args:
+        value: The value (e.g., nanoseconds).
+
+    Returns:
+        Bucket index; indexes increase with value.
+    """
+    shift = value.bit_length() - _PRECISION_BITS
+    if shift <= 0:
+        return value
+    return shift * _HALF + (value >> shift)
+
+
+def _bucket_upper(index: int) -> int:
+    """Largest value that falls into a histogram bucket.
+
+    Args:
+        index: Bucket index from _bucket_index().
+
+    Returns:
+        Inclusive upper bound of the bucket.
+    """
+    if index < 2 * _HALF:
+        return index
+    shift = index // _HALF - 1
+    top = index - shift * _HALF
+    return ((top + 1) << shift) - 1
+
+
+def record_latency(function: str, nanoseconds: int) -> None:
+    """Add one latency sample to a function's histogram.
+
+    Args:
+        function: Function name (e.g., 'bucket').
+        nanoseconds: Call duration.
+    """
+    index = _bucket_index(nanoseconds)
+    with _lock:
+        histogram = _histograms.setdefault(function, {})
+        histogram[index] = histogram.get(index, 0) + 1
+
+
+def record_path(function: str, path: str) -> None:
+    """Count one call resolved through a given path.
+
+    Args:
+        function: Function name (e.g., 'exists').
+        path: One of PATHS.
+    """
+    with _lock:
+        counts = _paths.setdefault(function, dict.fromkeys(PATHS, 0))
+        counts[path] += 1
+
+
+def record_load(table: str, seconds: float) -> None:
+    """Record one shard or index load.
+
+    Args:
+        table: What was loaded (e.g., 'bnc_lookup.hs' or
+            'bnc_lookup.find_lemma._load_index').
+        seconds: Load duration.
+    """
+    ms = seconds * 1000
+    with _lock:
+        stats = _loads.setdefault(table, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+        stats['count'] += 1
+        stats['total_ms'] += ms
+        stats['max_ms'] = max(stats['max_ms'], ms)
+
+
+def observe(function: str, resolve, *args):
+    """Run a resolver that returns (result, path) and record both metrics.
+
+    Args:
+        function: Function name used in the snapshot.
+        resolve: Callable returning a (result, path) tuple.
+        *args: Arguments passed to resolve.
+
+    Returns:
+        The result part of the resolver's return value.
+    """
+    start = time.perf_counter_ns()
+    result, path = resolve(*args)
+    record_latency(function, time.perf_counter_ns() - start)
+    record_path(function, path)
+    return result
+
+
+def _summarize(histogram: dict) -> dict:
+    """Summarize a histogram as count, bounds and percentiles.
+
+    Values are bucket upper bounds, so they overstate the true value by at
+    most one bucket width.
+
+    Args:
+        histogram: Bucket index -> count.
+
+    Returns:
+        Dict with count, min_ns, max_ns, pXX_ns and the non-empty buckets.
+    """
+    indexes = sorted(histogram)
+    count = sum(histogram.values())
+    summary = {'count': count, 'min_ns': _bucket_upper(indexes[0]), 'max_ns': _bucket_upper(indexes[-1])}
+    targets = [(p, p / 100 * count) for p in PERCENTILES]
+    seen = 0
+    for index in indexes:
+        seen += histogram[index]
+        while targets and seen >= targets[0][1]:
+            summary[f'p{targets.pop(0)[0]:g}_ns'] = _bucket_upper(index)
+    summary['buckets'] = {_bucket_upper(index): histogram[index] for index in indexes}
+    return summary
+
+
+def snapshot() -> dict:
+    """Copy of everything recorded so far.
+
+    Returns:
+        Dict with 'enabled', 'paths' (function -> path -> count), 'loads'
+        (table -> count, total_ms, max_ms) and 'latency' (function ->
+        count, min/max/percentiles in ns, and histogram buckets keyed by
+        their upper bound in ns).
+    """
+    with _lock:
+        paths = {function: dict(counts) for function, counts in _paths.items()}
+        loads = {table: dict(stats) for table, stats in _loads.items()}
+        histograms = {function: dict(histogram) for function, histogram in _histograms.items()}
+    return {
+        'enabled': enabled,
+        'paths': paths,
+        'loads': loads,
+        'latency': {function: _summarize(histogram) for function, histogram in histograms.items()},
+    }
@@ -96,12 +96,17 @@ def normalize(text: str) -> str:
     (e.g., U+2019 RIGHT SINGLE QUOTATION MARK) are preserved as ASCII
     apostrophes before the accent-stripping step encodes to ASCII.
 
+    Steps 1 and 2 leave ASCII text without a grave accent unchanged, so
+    such text skips straight to step 3.
+
     Args:
         text: Input text to normalize.
 
     Returns:
         Normalized text ready for BNC lookup.
     """
+    if text.isascii() and '`' not in text:
+        return text.lower().strip()
     text = normalize_apostrophes(text)
     text = normalize_unicode_accents(text)
     return text.lower().strip()
@@ -0,0 +1,194 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Domain lexicon overlays layered over the BNC tables.
+
+An overlay adds words the BNC lacks (product names, jargon) and can
+override the frequency of words it has. compile_overlay() turns a word
+list into a generated module keyed by the same MD5 digests as the BNC
+shards; load_overlay() activates it. exists(), bucket(), relative_frequency()
+and expected_count() (and everything built on them: batches, asyncio, the
+CLI and the servers) then check the overlay with the digest they already
+computed before probing the BNC shard, so a word costs one hash either way.
+
+Counts are re-based onto the BNC scale. A count from a corpus of `tokens`
+tokens becomes the relative frequency count / tokens, and the bucket is
+the rarest BNC bucket holding words with that many occurrences per BNC
+corpus. Buckets therefore stay comparable: an overlay word in bucket 40
+is about as common as the BNC words in bucket 40. Words listed without a
+count, or with a count of 0, are treated as occurring once in the BNC
+(bucket 100), so every overlay word has a relative frequency in (0, 1).
+
+Set BNC_LOOKUP_OVERLAY to the path of a compiled overlay to load it when
+bnc_lookup is imported.
+
+Usage:
+    from bnc_lookup import overlay
+
+    overlay.compile_overlay('terms.txt', 'terms_overlay.py', tokens=2_500_000)
+    overlay.load_overlay('terms_overlay.py')
+"""
+
+import hashlib
+import importlib.util
+import os
+
+from bnc_lookup.normalize import normalize
+
+# Active overlay: MD5 hex digest of the normalized word -> (bucket, relative frequency).
+# Replaced as a whole by load_overlay() / clear_overlay(), never mutated.
+entries = {}
+
+# Incremented whenever the active overlay changes, so memoized results can be dropped
+version = 0
+
+
+def rebase(count: float | None, tokens: int | None = None) -> tuple[int, float]:
+    """Map a word count onto the BNC bucket and relative frequency scales.
+
+    Args:
+        count: Occurrences of the word, or None for a word without a count
+            (None and 0 are treated as one occurrence in the BNC).
+        tokens: Size of the corpus the count comes from (default: counts
+            are per BNC corpus of 100,106,029 tokens).
+
+    Returns:
+        Tuple of (bucket, relative frequency).
+
+    Raises:
+        ValueError: If count is negative or tokens is not positive.
+    """
+    from bnc_lookup.shard_loader import import_table
+
+    max_counts, total = import_table('bnc_lookup.freq.bounds', 'max_counts', 'total')
+    if tokens is not None and tokens <= 0:
+        raise ValueError(f'tokens must be positive, got {tokens}')
+    if count is not None and count < 0:
+        raise ValueError(f'count must not be negative, got {count}')
+    # A listed word occurs: a zero frequency would not be comparable with any bucket
+    if not count:
+        count, tokens = 1, total
+    rf = count / (tokens or total)
+    bnc_count = rf * total
+    # Rarest bucket whose words occur at least this often; bucket 1 has no upper bound
+    bucket = 1
+    for index in range(len(max_counts) - 1, 0, -1):
+        if max_counts[index] >= bnc_count:
+            bucket = index + 1
+            break
+    return bucket, rf
+
+
+def _read_word_list(path: str):
+    """Stream a word list: one word per line, optionally followed by a count.
+
+    Blank lines and lines starting with '#' are skipped.
+
+    Args:
+        path: UTF-8 text file.
+
+    Yields:
+        Tuples of (word, count or None).
+
+    Raises:
+        ValueError: If a tab-separated count is not a number.
+    """
+    with open(path, encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if '\t' in line:
+                word, count = line.rsplit('\t', 1)
+                try:
+                    yield word.strip(), float(count)
+                except ValueError:
+                    raise ValueError(f'{path}:{number}: count must be a number, got {count!r}') from None
+                continue
+            # Space-separated: a trailing number is a count, anything else is part of the word
+            word, _, count = line.rpartition(' ')
+            try:
+                count = float(count) if word else None
+            except ValueError:
+                word, count = line, None
+            yield (word.strip() if count is not None else line), count
+
+
+def compile_overlay(source, output: str, tokens: int | None = None) -> int:
+    """Compile a word list into an overlay module.
+
+    Args:
+        source: Path to a word list (`word` or `word<TAB>count` per line),
+            or an iterable of words or (word, count) pairs.
+        output: Path of the module to write (e.g., 'terms_overlay.py').
+        tokens: Size of the corpus the counts come from (default: counts
+            are per BNC corpus).
+
+    Returns:
+        Number of distinct words written.
+
+    Raises:
+        ValueError: If a count or tokens is invalid.
+    """
+    from bnc_lookup.build import HEADER, _quote
+
+    if isinstance(source, (str, os.PathLike)):
+        source = _read_word_list(os.fspath(source))
+    counts = {}
+    for item in source:
+        word, count = (item, None) if isinstance(item, str) else item
+        word = normalize(word)
+        if not word:
+            continue
+        previous = counts.get(word)
+        if count is None:
+            counts.setdefault(word, None)
+        else:
+            counts[word] = count if previous is None else previous + count
+
+    compiled = {}
+    for word, count in counts.items():
+        compiled[hashlib.md5(word.encode()).hexdigest()] = rebase(count, tokens)
+    lines = ''.join(f'    {_quote(digest)}: ({bucket}, {rf:.6e}),\n'
+                    for digest, (bucket, rf) in sorted(compiled.items()))
+    with open(output, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(f'{HEADER}# Domain overlay: MD5 hex digest -> (bucket, relative frequency)\n'
+                f'entries = {{\n{lines}}}\n')
+    return len(compiled)
+
+
+def load_overlay(path: str) -> int:
+    """Activate a compiled overlay, replacing any active one.
+
+    Args:
+        path: Path of a module written by compile_overlay().
+
+    Returns:
+        Number of words in the overlay.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a compiled overlay.
+    """
+    global entries, version
+    spec = importlib.util.spec_from_file_location('bnc_lookup_overlay', path)
+    if spec is None:
+        raise ValueError(f'not a Python module: {path}')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    loaded = getattr(module, 'entries', None)
+    if not isinstance(loaded, dict):
+        raise ValueError(f'not a compiled overlay (no entries dict): {path}')
+    entries = loaded
+    version += 1
+    return len(loaded)
+
+
+def clear_overlay() -> None:
+    """Deactivate the overlay; lookups see the BNC tables only."""
+    global entries, version
+    entries = {}
+    version += 1
+
+
+if os.environ.get('BNC_LOOKUP_OVERLAY'):
+    load_overlay(os.environ['BNC_LOOKUP_OVERLAY'])
@@ -0,0 +1,170 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Multi-process corpus scoring.
+
+A single process scoring a large corpus with bucket() is bound to one
+core. score_files() splits the input files into byte ranges aligned to
+line boundaries and scores them in a ProcessPoolExecutor. Each worker
+loads the bucket tables once, in its initializer, and keeps a FindBatch
+memo across the chunks it scores. Results are yielded in input order
+(file by file, chunk by chunk), so the output is identical for any number
+of workers.
+
+Workers read their byte ranges from disk themselves, so only the scored
+tokens travel between processes. At most `workers * PREFETCH` chunks are
+in flight at any time, which bounds memory on large corpora.
+
+Usage:
+    from bnc_lookup.parallel import score_files
+
+    for path, tokens, buckets in score_files(paths, workers=8):
+        ...
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from bnc_lookup.find_batch import FindBatch
+from bnc_lookup.find_bnc import _check_fallback
+from bnc_lookup.find_freq import _get_bucket_dict
+
+# Default chunk size in bytes
+CHUNK_BYTES = 1 << 20
+
+# Chunks submitted ahead per worker
+PREFETCH = 4
+
+# Per-process FindBatch, created by the worker initializer
+_batch = None
+
+
+def _chunks(paths, chunk_bytes: int):
+    """Split files into nominal byte ranges.
+
+    Args:
+        paths: File paths, in output order.
+        chunk_bytes: Target chunk size in bytes.
+
+    Yields:
+        Tuples of (path, start, end).
+    """
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, size, chunk_bytes):
+            yield path, start, min(start + chunk_bytes, size)
+
+
+def _read_lines(path: str, start: int, end: int) -> list:
+    """Read the lines that begin within a byte range.
+
+    A line belongs to the range containing its first byte, so adjacent
+    ranges never share or lose a line.
+
+    Args:
+        path: File path.
+        start: First byte of the range.
+        end: End of the range (exclusive).
+
+    Returns:
+        List of raw lines (bytes).
+    """
+    lines = []
+    with open(path, 'rb') as f:
+        if start:
+            # Finish the line that began before this range
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            lines.append(line)
+    return lines
+
+
+def _init_worker(fallback: str) -> None:
+    """Load the bucket tables once per worker process.
+
+    Args:
+        fallback: Inflection fallback mode used by the worker.
+    """
+    global _batch
+    _batch = FindBatch(fallback=fallback)
+    for i in range(256):
+        _get_bucket_dict(f'{i:02x}')
+    if fallback == 'morph':
+        from bnc_lookup.find_lemma import _get_index
+        _get_index()
+
+
+def _score_chunk(path: str, start: int, end: int) -> tuple[list, list]:
+    """Tokenize and score one byte range of a file.
+
+    Args:
+        path: File path.
+        start: First byte of the range.
+        end: End of the range (exclusive).
+
+    Returns:
+        Tuple of (tokens, buckets), aligned.
+    """
+    tokens = []
+    for line in _read_lines(path, start, end):
+        tokens.extend(line.decode('utf-8', errors='replace').split())
+    return tokens, _batch.bucket(tokens)
+
+
+def _score(chunks, workers: int, fallback: str):
+    """Score chunks in order, in-process or in a bounded process pool.
+
+    Args:
+        chunks: Iterable of (path, start, end).
+        workers: Number of worker processes.
+        fallback: Inflection fallback mode.
+
+    Yields:
+        Tuples of (path, tokens, buckets) in chunk order.
+    """
+    if workers == 1:
+        _init_worker(fallback)
+        for path, start, end in chunks:
+            yield (path, *_score_chunk(path, start, end))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(fallback,)) as pool:
+        pending = deque()
+        for path, start, end in chunks:
+            pending.append((path, pool.submit(_score_chunk, path, start, end)))
+            if len(pending) >= workers * PREFETCH:
+                path, future = pending.popleft()
+                yield (path, *future.result())
+        for path, future in pending:
+            yield (path, *future.result())
+
+
+def score_files(paths, workers: int | None = None, fallback: str = 'plural', chunk_bytes: int = CHUNK_BYTES):
+    """Score every whitespace-separated token of a set of files.
+
+    Args:
+        paths: File paths (UTF-8 text).
+        workers: Number of worker processes (default: os.cpu_count()).
+            With 1, chunks are scored in the calling process.
+        fallback: Inflection fallback mode: 'none', 'plural' (default) or 'morph'.
+        chunk_bytes: Target chunk size in bytes (default 1 MiB).
+
+    Returns:
+        Iterator of (path, tokens, buckets) per chunk, in file and offset
+        order. buckets[i] is the bucket of tokens[i] (1-100) or None.
+
+    Raises:
+        ValueError: If fallback, workers or chunk_bytes is invalid.
+    """
+    _check_fallback(fallback)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f'workers must be at least 1, got {workers}')
+    if chunk_bytes < 1:
+        raise ValueError(f'chunk_bytes must be at least 1, got {chunk_bytes}')
+    return _score(_chunks(list(paths), chunk_bytes), workers, fallback)
@@ -2,518 +2,12 @@
 # -*- coding: UTF-8 -*-
 # AUTO-GENERATED - DO NOT MODIFY
 
-from .rf_00 import frequencies_00
-from .rf_01 import frequencies_01
-from .rf_02 import frequencies_02
-from .rf_03 import frequencies_03
-from .rf_04 import frequencies_04
-from .rf_05 import frequencies_05
-from .rf_06 import frequencies_06
-from .rf_07 import frequencies_07
-from .rf_08 import frequencies_08
-from .rf_09 import frequencies_09
-from .rf_0a import frequencies_0a
-from .rf_0b import frequencies_0b
-from .rf_0c import frequencies_0c
-from .rf_0d import frequencies_0d
-from .rf_0e import frequencies_0e
-from .rf_0f import frequencies_0f
-from .rf_10 import frequencies_10
-from .rf_11 import frequencies_11
-from .rf_12 import frequencies_12
-from .rf_13 import frequencies_13
-from .rf_14 import frequencies_14
-from .rf_15 import frequencies_15
-from .rf_16 import frequencies_16
-from .rf_17 import frequencies_17
-from .rf_18 import frequencies_18
-from .rf_19 import frequencies_19
-from .rf_1a import frequencies_1a
-from .rf_1b import frequencies_1b
-from .rf_1c import frequencies_1c
-from .rf_1d import frequencies_1d
-from .rf_1e import frequencies_1e
-from .rf_1f import frequencies_1f
-from .rf_20 import frequencies_20
-from .rf_21 import frequencies_21
-from .rf_22 import frequencies_22
-from .rf_23 import frequencies_23
-from .rf_24 import frequencies_24
-from .rf_25 import frequencies_25
-from .rf_26 import frequencies_26
-from .rf_27 import frequencies_27
-from .rf_28 import frequencies_28
-from .rf_29 import frequencies_29
-from .rf_2a import frequencies_2a
-from .rf_2b import frequencies_2b
-from .rf_2c import frequencies_2c
-from .rf_2d import frequencies_2d
-from .rf_2e import frequencies_2e
-from .rf_2f import frequencies_2f
-from .rf_30 import frequencies_30
-from .rf_31 import frequencies_31
-from .rf_32 import frequencies_32
-from .rf_33 import frequencies_33
-from .rf_34 import frequencies_34
-from .rf_35 import frequencies_35
-from .rf_36 import frequencies_36
-from .rf_37 import frequencies_37
-from .rf_38 import frequencies_38
-from .rf_39 import frequencies_39
-from .rf_3a import frequencies_3a
-from .rf_3b import frequencies_3b
-from .rf_3c import frequencies_3c
-from .rf_3d import frequencies_3d
-from .rf_3e import frequencies_3e
-from .rf_3f import frequencies_3f
-from .rf_40 import frequencies_40
-from .rf_41 import frequencies_41
-from .rf_42 import frequencies_42
-from .rf_43 import frequencies_43
-from .rf_44 import frequencies_44
-from .rf_45 import frequencies_45
-from .rf_46 import frequencies_46
-from .rf_47 import frequencies_47
-from .rf_48 import frequencies_48
-from .rf_49 import frequencies_49
-from .rf_4a import frequencies_4a
-from .rf_4b import frequencies_4b
-from .rf_4c import frequencies_4c
-from .rf_4d import frequencies_4d
-from .rf_4e import frequencies_4e
-from .rf_4f import frequencies_4f
-from .rf_50 import frequencies_50
-from .rf_51 import frequencies_51
-from .rf_52 import frequencies_52
-from .rf_53 import frequencies_53
-from .rf_54 import frequencies_54
-from .rf_55 import frequencies_55
-from .rf_56 import frequencies_56
-from .rf_57 import frequencies_57
-from .rf_58 import frequencies_58
-from .rf_59 import frequencies_59
-from .rf_5a import frequencies_5a
-from .rf_5b import frequencies_5b
-from .rf_5c import frequencies_5c
-from .rf_5d import frequencies_5d
-from .rf_5e import frequencies_5e
-from .rf_5f import frequencies_5f
-from .rf_60 import frequencies_60
-from .rf_61 import frequencies_61
-from .rf_62 import frequencies_62
-from .rf_63 import frequencies_63
-from .rf_64 import frequencies_64
-from .rf_65 import frequencies_65
-from .rf_66 import frequencies_66
-from .rf_67 import frequencies_67
-from .rf_68 import frequencies_68
-from .rf_69 import frequencies_69
-from .rf_6a import frequencies_6a
-from .rf_6b import frequencies_6b
-from .rf_6c import frequencies_6c
-from .rf_6d import frequencies_6d
-from .rf_6e import frequencies_6e
-from .rf_6f import frequencies_6f
-from .rf_70 import frequencies_70
-from .rf_71 import frequencies_71
-from .rf_72 import frequencies_72
-from .rf_73 import frequencies_73
-from .rf_74 import frequencies_74
-from .rf_75 import frequencies_75
-from .rf_76 import frequencies_76
-from .rf_77 import frequencies_77
-from .rf_78 import frequencies_78
-from .rf_79 import frequencies_79
-from .rf_7a import frequencies_7a
-from .rf_7b import frequencies_7b
-from .rf_7c import frequencies_7c
-from .rf_7d import frequencies_7d
-from .rf_7e import frequencies_7e
-from .rf_7f import frequencies_7f
-from .rf_80 import frequencies_80
-from .rf_81 import frequencies_81
-from .rf_82 import frequencies_82
-from .rf_83 import frequencies_83
-from .rf_84 import frequencies_84
-from .rf_85 import frequencies_85
-from .rf_86 import frequencies_86
-from .rf_87 import frequencies_87
-from .rf_88 import frequencies_88
-from .rf_89 import frequencies_89
-from .rf_8a import frequencies_8a
-from .rf_8b import frequencies_8b
-from .rf_8c import frequencies_8c
-from .rf_8d import frequencies_8d
-from .rf_8e import frequencies_8e
-from .rf_8f import frequencies_8f
-from .rf_90 import frequencies_90
-from .rf_91 import frequencies_91
-from .rf_92 import frequencies_92
-from .rf_93 import frequencies_93
-from .rf_94 import frequencies_94
-from .rf_95 import frequencies_95
-from .rf_96 import frequencies_96
-from .rf_97 import frequencies_97
-from .rf_98 import frequencies_98
-from .rf_99 import frequencies_99
-from .rf_9a import frequencies_9a
-from .rf_9b import frequencies_9b
-from .rf_9c import frequencies_9c
-from .rf_9d import frequencies_9d
-from .rf_9e import frequencies_9e
-from .rf_9f import frequencies_9f
-from .rf_a0 import frequencies_a0
-from .rf_a1 import frequencies_a1
-from .rf_a2 import frequencies_a2
-from .rf_a3 import frequencies_a3
-from .rf_a4 import frequencies_a4
-from .rf_a5 import frequencies_a5
-from .rf_a6 import frequencies_a6
-from .rf_a7 import frequencies_a7
-from .rf_a8 import frequencies_a8
-from .rf_a9 import frequencies_a9
-from .rf_aa import frequencies_aa
-from .rf_ab import frequencies_ab
-from .rf_ac import frequencies_ac
-from .rf_ad import frequencies_ad
-from .rf_ae import frequencies_ae
-from .rf_af import frequencies_af
-from .rf_b0 import frequencies_b0
-from .rf_b1 import frequencies_b1
-from .rf_b2 import frequencies_b2
-from .rf_b3 import frequencies_b3
-from .rf_b4 import frequencies_b4
-from .rf_b5 import frequencies_b5
-from .rf_b6 import frequencies_b6
-from .rf_b7 import frequencies_b7
-from .rf_b8 import frequencies_b8
-from .rf_b9 import frequencies_b9
-from .rf_ba import frequencies_ba
-from .rf_bb import frequencies_bb
-from .rf_bc import frequencies_bc
-from .rf_bd import frequencies_bd
-from .rf_be import frequencies_be
-from .rf_bf import frequencies_bf
-from .rf_c0 import frequencies_c0
-from .rf_c1 import frequencies_c1
-from .rf_c2 import frequencies_c2
-from .rf_c3 import frequencies_c3
-from .rf_c4 import frequencies_c4
-from .rf_c5 import frequencies_c5
-from .rf_c6 import frequencies_c6
-from .rf_c7 import frequencies_c7
-from .rf_c8 import frequencies_c8
-from .rf_c9 import frequencies_c9
-from .rf_ca import frequencies_ca
-from .rf_cb import frequencies_cb
-from .rf_cc import frequencies_cc
-from .rf_cd import frequencies_cd
-from .rf_ce import frequencies_ce
-from .rf_cf import frequencies_cf
-from .rf_d0 import frequencies_d0
-from .rf_d1 import frequencies_d1
-from .rf_d2 import frequencies_d2
-from .rf_d3 import frequencies_d3
-from .rf_d4 import frequencies_d4
-from .rf_d5 import frequencies_d5
-from .rf_d6 import frequencies_d6
-from .rf_d7 import frequencies_d7
-from .rf_d8 import frequencies_d8
-from .rf_d9 import frequencies_d9
-from .rf_da import frequencies_da
-from .rf_db import frequencies_db
-from .rf_dc import frequencies_dc
-from .rf_dd import frequencies_dd
-from .rf_de import frequencies_de
-from .rf_df import frequencies_df
-from .rf_e0 import frequencies_e0
-from .rf_e1 import frequencies_e1
-from .rf_e2 import frequencies_e2
-from .rf_e3 import frequencies_e3
-from .rf_e4 import frequencies_e4
-from .rf_e5 import frequencies_e5
-from .rf_e6 import frequencies_e6
-from .rf_e7 import frequencies_e7
-from .rf_e8 import frequencies_e8
-from .rf_e9 import frequencies_e9
-from .rf_ea import frequencies_ea
-from .rf_eb import frequencies_eb
-from .rf_ec import frequencies_ec
-from .rf_ed import frequencies_ed
-from .rf_ee import frequencies_ee
-from .rf_ef import frequencies_ef
-from .rf_f0 import frequencies_f0
-from .rf_f1 import frequencies_f1
-from .rf_f2 import frequencies_f2
-from .rf_f3 import frequencies_f3
-from .rf_f4 import frequencies_f4
-from .rf_f5 import frequencies_f5
-from .rf_f6 import frequencies_f6
-from .rf_f7 import frequencies_f7
-from .rf_f8 import frequencies_f8
-from .rf_f9 import frequencies_f9
-from .rf_fa import frequencies_fa
-from .rf_fb import frequencies_fb
-from .rf_fc import frequencies_fc
-from .rf_fd import frequencies_fd
-from .rf_fe import frequencies_fe
-from .rf_ff import frequencies_ff
+import importlib
 
-__all__ = [
-    'frequencies_00',
-    'frequencies_01',
-    'frequencies_02',
-    'frequencies_03',
-    'frequencies_04',
-    'frequencies_05',
-    'frequencies_06',
-    'frequencies_07',
-    'frequencies_08',
-    'frequencies_09',
-    'frequencies_0a',
-    'frequencies_0b',
-    'frequencies_0c',
-    'frequencies_0d',
-    'frequencies_0e',
-    'frequencies_0f',
-    'frequencies_10',
-    'frequencies_11',
-    'frequencies_12',
-    'frequencies_13',
-    'frequencies_14',
-    'frequencies_15',
-    'frequencies_16',
-    'frequencies_17',
-    'frequencies_18',
-    'frequencies_19',
-    'frequencies_1a',
-    'frequencies_1b',
-    'frequencies_1c',
-    'frequencies_1d',
-    'frequencies_1e',
-    'frequencies_1f',
-    'frequencies_20',
-    'frequencies_21',
-    'frequencies_22',
-    'frequencies_23',
-    'frequencies_24',
-    'frequencies_25',
-    'frequencies_26',
-    'frequencies_27',
-    'frequencies_28',
-    'frequencies_29',
-    'frequencies_2a',
-    'frequencies_2b',
-    'frequencies_2c',
-    'frequencies_2d',
-    'frequencies_2e',
-    'frequencies_2f',
-    'frequencies_30',
-    'frequencies_31',
-    'frequencies_32',
-    'frequencies_33',
-    'frequencies_34',
-    'frequencies_35',
-    'frequencies_36',
-    'frequencies_37',
-    'frequencies_38',
-    'frequencies_39',
-    'frequencies_3a',
-    'frequencies_3b',
-    'frequencies_3c',
-    'frequencies_3d',
-    'frequencies_3e',
-    'frequencies_3f',
-    'frequencies_40',
-    'frequencies_41',
-    'frequencies_42',
-    'frequencies_43',
-    'frequencies_44',
-    'frequencies_45',
-    'frequencies_46',
-    'frequencies_47',
-    'frequencies_48',
-    'frequencies_49',
-    'frequencies_4a',
-    'frequencies_4b',
-    'frequencies_4c',
-    'frequencies_4d',
-    'frequencies_4e',
-    'frequencies_4f',
-    'frequencies_50',
-    'frequencies_51',
-    'frequencies_52',
-    'frequencies_53',
-    'frequencies_54',
-    'frequencies_55',
-    'frequencies_56',
-    'frequencies_57',
-    'frequencies_58',
-    'frequencies_59',
-    'frequencies_5a',
-    'frequencies_5b',
-    'frequencies_5c',
-    'frequencies_5d',
-    'frequencies_5e',
-    'frequencies_5f',
-    'frequencies_60',
-    'frequencies_61',
-    'frequencies_62',
-    'frequencies_63',
-    'frequencies_64',
-    'frequencies_65',
-    'frequencies_66',
-    'frequencies_67',
-    'frequencies_68',
-    'frequencies_69',
-    'frequencies_6a',
-    'frequencies_6b',
-    'frequencies_6c',
-    'frequencies_6d',
-    'frequencies_6e',
-    'frequencies_6f',
-    'frequencies_70',
-    'frequencies_71',
-    'frequencies_72',
-    'frequencies_73',
-    'frequencies_74',
-    'frequencies_75',
-    'frequencies_76',
-    'frequencies_77',
-    'frequencies_78',
-    'frequencies_79',
-    'frequencies_7a',
-    'frequencies_7b',
-    'frequencies_7c',
-    'frequencies_7d',
-    'frequencies_7e',
-    'frequencies_7f',
-    'frequencies_80',
-    'frequencies_81',
-    'frequencies_82',
-    'frequencies_83',
-    'frequencies_84',
-    'frequencies_85',
-    'frequencies_86',
-    'frequencies_87',
-    'frequencies_88',
-    'frequencies_89',
-    'frequencies_8a',
-    'frequencies_8b',
-    'frequencies_8c',
-    'frequencies_8d',
-    'frequencies_8e',
-    'frequencies_8f',
-    'frequencies_90',
-    'frequencies_91',
-    'frequencies_92',
-    'frequencies_93',
-    'frequencies_94',
-    'frequencies_95',
-    'frequencies_96',
-    'frequencies_97',
-    'frequencies_98',
-    'frequencies_99',
-    'frequencies_9a',
-    'frequencies_9b',
-    'frequencies_9c',
-    'frequencies_9d',
-    'frequencies_9e',
-    'frequencies_9f',
-    'frequencies_a0',
-    'frequencies_a1',
-    'frequencies_a2',
-    'frequencies_a3',
-    'frequencies_a4',
-    'frequencies_a5',
-    'frequencies_a6',
-    'frequencies_a7',
-    'frequencies_a8',
-    'frequencies_a9',
-    'frequencies_aa',
-    'frequencies_ab',
-    'frequencies_ac',
-    'frequencies_ad',
-    'frequencies_ae',
-    'frequencies_af',
-    'frequencies_b0',
-    'frequencies_b1',
-    'frequencies_b2',
-    'frequencies_b3',
-    'frequencies_b4',
-    'frequencies_b5',
-    'frequencies_b6',
-    'frequencies_b7',
-    'frequencies_b8',
-    'frequencies_b9',
-    'frequencies_ba',
-    'frequencies_bb',
-    'frequencies_bc',
-    'frequencies_bd',
-    'frequencies_be',
-    'frequencies_bf',
-    'frequencies_c0',
-    'frequencies_c1',
-    'frequencies_c2',
-    'frequencies_c3',
-    'frequencies_c4',
-    'frequencies_c5',
-    'frequencies_c6',
-    'frequencies_c7',
-    'frequencies_c8',
-    'frequencies_c9',
-    'frequencies_ca',
-    'frequencies_cb',
-    'frequencies_cc',
-    'frequencies_cd',
-    'frequencies_ce',
-    'frequencies_cf',
-    'frequencies_d0',
-    'frequencies_d1',
-    'frequencies_d2',
-    'frequencies_d3',
-    'frequencies_d4',
-    'frequencies_d5',
-    'frequencies_d6',
-    'frequencies_d7',
-    'frequencies_d8',
-    'frequencies_d9',
-    'frequencies_da',
-    'frequencies_db',
-    'frequencies_dc',
-    'frequencies_dd',
-    'frequencies_de',
-    'frequencies_df',
-    'frequencies_e0',
-    'frequencies_e1',
-    'frequencies_e2',
-    'frequencies_e3',
-    'frequencies_e4',
-    'frequencies_e5',
-    'frequencies_e6',
-    'frequencies_e7',
-    'frequencies_e8',
-    'frequencies_e9',
-    'frequencies_ea',
-    'frequencies_eb',
-    'frequencies_ec',
-    'frequencies_ed',
-    'frequencies_ee',
-    'frequencies_ef',
-    'frequencies_f0',
-    'frequencies_f1',
-    'frequencies_f2',
-    'frequencies_f3',
-    'frequencies_f4',
-    'frequencies_f5',
-    'frequencies_f6',
-    'frequencies_f7',
-    'frequencies_f8',
-    'frequencies_f9',
-    'frequencies_fa',
-    'frequencies_fb',
-    'frequencies_fc',
-    'frequencies_fd',
-    'frequencies_fe',
-    'frequencies_ff',
-]
+
+def __getattr__(name):
+    kind, _, prefix = name.partition('_')
+    if kind == 'frequencies' and len(prefix) == 2:
+        module = importlib.import_module(f'{__name__}.rf_{prefix}')
+        return getattr(module, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,521 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# AUTO-GENERATED - DO NOT MODIFY
+
+# Contraction suffix -> relative frequency of the suffix token
+suffix_frequencies = {
+    'n\'t': 3.325034e-03,
+    '\'ll': 7.251511e-04,
+    '\'re': 8.341955e-04,
+    '\'ve': 8.905558e-04,
+    '\'m': 6.572232e-04,
+    '\'d': 6.669329e-04,
+    '\'s': 8.064519e-03,
+}
+
+# Contraction form -> (resolved relative frequency, 'direct' or 'contraction')
+frequencies = {
+    '&lt;sp&gt_&lt/sp&gt\'s': (9.989408e-09, 'direct'),
+    '&scaron;kvoreck&yacute\'s': (1.997882e-08, 'direct'),
+    '\'50\'s': (9.989408e-09, 'direct'),
+    '\'60\'s': (9.989408e-09, 'direct'),
+    '\'80\'s': (9.989408e-09, 'direct'),
+    '\'90\'s': (1.997882e-08, 'direct'),
+    '\'author\'s': (9.989408e-09, 'direct'),
+    '\'d': (6.669329e-04, 'direct'),
+    '\'ll': (7.251511e-04, 'direct'),
+    '\'m': (6.572232e-04, 'direct'),
+    '\'re': (8.341955e-04, 'direct'),
+    '\'s': (8.064519e-03, 'direct'),
+    '\'ury\'s': (9.989408e-09, 'direct'),
+    '\'ve': (8.905558e-04, 'direct'),
+    '.38\'s': (9.989408e-09, 'direct'),
+    '0\'s': (1.997882e-08, 'direct'),
+    '000\'s': (9.989408e-09, 'direct'),
+    '007\'s': (5.993645e-08, 'direct'),
+    '01\'s': (1.997882e-08, 'direct'),
+    '1\'s': (2.397458e-07, 'direct'),
+    '1,000\'s': (9.989408e-09, 'direct'),
+    '1.8\'s': (9.989408e-09, 'direct'),
+    '10\'s': (4.994704e-08, 'direct'),
+    '100\'s': (1.997882e-08, 'direct'),
+    '1000\'s': (1.997882e-08, 'direct'),
+    '109\'s': (9.989408e-09, 'direct'),
+    '11\'s': (1.997882e-08, 'direct'),
+    '1155\'s': (9.989408e-09, 'direct'),
+    '12\'s': (9.989408e-09, 'direct'),
+    '13\'s': (9.989408e-09, 'direct'),
+    '14\'s': (5.993645e-08, 'direct'),
+    '15\'s': (9.989408e-09, 'direct'),
+    '1500\'s': (9.989408e-09, 'direct'),
+    '153\'s': (9.989408e-09, 'direct'),
+    '1540\'s': (9.989408e-09, 'direct'),
+    '155\'s': (9.989408e-09, 'direct'),
+    '1560\'s': (2.996822e-08, 'direct'),
+    '16\'s': (9.989408e-08, 'direct'),
+    '1600\'s': (9.989408e-09, 'direct'),
+    '17\'s': (1.997882e-08, 'direct'),
+    '1700\'s': (9.989408e-09, 'direct'),
+    '1723\'s': (9.989408e-09, 'direct'),
+    '1740\'s': (9.989408e-09, 'direct'),
+    '1760\'s': (1.997882e-08, 'direct'),
+    '1770\'s': (1.997882e-08, 'direct'),
+    '1771\'s': (9.989408e-09, 'direct'),
+    '1780\'s': (1.997882e-08, 'direct'),
+    '1790\'s': (9.989408e-09, 'direct'),
+    '18&ndash;30\'s': (6.992586e-08, 'direct'),
+    '18\'s': (9.989408e-09, 'direct'),
+    '1800&ndash;1850\'s': (9.989408e-09, 'direct'),
+    '1800\'s': (5.993645e-08, 'direct'),
+    '1812\'s': (9.989408e-09, 'direct'),
+    '1830\'s': (7.991527e-08, 'direct'),
+    '1840\'s': (6.992586e-08, 'direct'),
+    '1850\'s': (5.993645e-08, 'direct'),
+    '1860\'s': (6.992586e-08, 'direct'),
+    '1870\'s': (2.996822e-08, 'direct'),
+    '1880\'s': (3.995763e-08, 'direct'),
+    '1890\'s': (4.994704e-08, 'direct'),
+    '19\'s': (1.997882e-08, 'direct'),
+    '190\'s': (9.989408e-09, 'direct'),
+    '1900\'s': (3.995763e-08, 'direct'),
+    '1920\'s': (2.297564e-07, 'direct'),
+    '1923\'s': (9.989408e-09, 'direct'),
+    '1930\'s': (3.895869e-07, 'direct'),
+    '1940\'s': (1.398517e-07, 'direct'),
+    '1945\'s': (9.989408e-09, 'direct'),
+    '1950\'s': (3.396399e-07, 'direct'),
+    '1960\'s': (4.695022e-07, 'direct'),
+    '1968\'s': (9.989408e-09, 'direct'),
+    '1970\'s': (4.395340e-07, 'direct'),
+    '1974\'s': (9.989408e-09, 'direct'),
+    '1976\'s': (9.989408e-09, 'direct'),
+    '1979\'s': (9.989408e-09, 'direct'),
+    '1980\'s': (3.995763e-07, 'direct'),
+    '1981\'s': (1.997882e-08, 'direct'),
+    '1982\'s': (2.996822e-08, 'direct'),
+    '1984\'s': (9.989408e-09, 'direct'),
+    '1985\'s': (9.989408e-09, 'direct'),
+    '1986\'s': (1.997882e-08, 'direct'),
+    '1987\'s': (1.997882e-08, 'direct'),
+    '1988\'s': (1.997882e-08, 'direct'),
+    '1989\'s': (5.993645e-08, 'direct'),
+    '1990\'s': (2.996822e-07, 'direct'),
+    '1991\'s': (1.298623e-07, 'direct'),
+    '1992\'s': (9.989408e-08, 'direct'),
+    '1993\'s': (4.994704e-08, 'direct'),
+    '1999\'s': (9.989408e-09, 'direct'),
+    '2&ndash;8&ndash;0\'s': (9.989408e-09, 'direct'),
+    '2\'s': (2.097776e-07, 'direct'),
+    '20\'s': (6.992586e-08, 'direct'),
+    '2000\'s': (5.993645e-08, 'direct'),
+    '2005\'s': (9.989408e-09, 'direct'),
+    '205\'s': (1.997882e-08, 'direct'),
+    '21\'s': (9.989408e-09, 'direct'),
+    '210\'s': (9.989408e-09, 'direct'),
+    '23\'s': (9.989408e-09, 'direct'),
+    '238\'s': (9.989408e-09, 'direct'),
+    '242\'s': (9.989408e-09, 'direct'),
+    '25\'s': (9.989408e-09, 'direct'),
+    '252\'s': (9.989408e-09, 'direct'),
+    '27\'s': (9.989408e-09, 'direct'),
+    '28\'s': (1.997882e-08, 'direct'),
+    '2807\'s': (1.997882e-08, 'direct'),
+    '296\'s': (9.989408e-09, 'direct'),
+    '2n\'s': (9.989408e-09, 'direct'),
+    '3\'s': (6.992586e-08, 'direct'),
+    '30\'s': (8.990467e-08, 'direct'),
+    '305\'s': (9.989408e-09, 'direct'),
+    '31\'s': (2.996822e-08, 'direct'),
+    '31a\'s': (9.989408e-09, 'direct'),
+    '32\'s': (9.989408e-09, 'direct'),
+    '325i\'s': (1.997882e-08, 'direct'),
+    '328\'s': (9.989408e-09, 'direct'),
+    '33\'s': (9.989408e-09, 'direct'),
+    '34027\'s': (9.989408e-09, 'direct'),
+    '3440\'s': (9.989408e-09, 'direct'),
+    '348\'s': (9.989408e-09, 'direct'),
+    '35\'s': (9.989408e-09, 'direct'),
+    '3822\'s': (9.989408e-09, 'direct'),
+    '3i\'s': (4.994704e-08, 'direct'),
+    '4&ndash;4&ndash;6&ndash;0\'s': (9.989408e-09, 'direct'),
+    '4&ndash;6&ndash;2\'s': (9.989408e-09, 'direct'),
+    '4&ndash;71\'s': (9.989408e-09, 'direct'),
+    '4\'s': (8.990467e-07, 'direct'),
+    '4.0\'s': (9.989408e-09, 'direct'),
+    '40\'s': (1.098835e-07, 'direct'),
+    '4013\'s': (9.989408e-09, 'direct'),
+    '42\'s': (9.989408e-09, 'direct'),
+    '42765\'s': (9.989408e-09, 'direct'),
+    '43\'s': (2.996822e-08, 'direct'),
+    '440\'s': (9.989408e-09, 'direct'),
+    '4472\'s': (9.989408e-09, 'direct'),
+    '45\'s': (9.989408e-09, 'direct'),
+    '450\'s': (9.989408e-09, 'direct'),
+    '47\'s': (2.996822e-08, 'direct'),
+    '47402\'s': (9.989408e-09, 'direct'),
+    '4b\'s': (1.997882e-08, 'direct'),
+    '5\'s': (1.897988e-07, 'direct'),
+    '50\'s': (1.997882e-07, 'direct'),
+    '501\'s': (9.989408e-09, 'direct'),
+    '5029\'s': (9.989408e-09, 'direct'),
+    '51\'s': (1.997882e-08, 'direct'),
+    '52\'s': (9.989408e-09, 'direct'),
+    '522h\'s': (9.989408e-09, 'direct'),
+    '527\'s': (9.989408e-09, 'direct'),
+    '53\'s': (1.997882e-08, 'direct'),
+    '55\'s': (9.989408e-09, 'direct'),
+    '555\'s': (9.989408e-09, 'direct'),
+    '5637\'s': (9.989408e-09, 'direct'),
+    '570\'s': (9.989408e-09, 'direct'),
+    '58\'s': (9.989408e-09, 'direct'),
+    '6\'s': (1.997882e-08, 'direct'),
+    '60\'s': (3.396399e-07, 'direct'),
+    '600\'s': (9.989408e-09, 'direct'),
+    '615\'s': (9.989408e-09, 'direct'),
+    '617\'s': (9.989408e-09, 'direct'),
+    '627\'s': (9.989408e-09, 'direct'),
+    '64\'s': (9.989408e-09, 'direct'),
+    '65\'s': (9.989408e-09, 'direct'),
+    '650\'s': (9.989408e-09, 'direct'),
+    '68\'s': (9.989408e-09, 'direct'),
+    '6b\'s': (9.989408e-09, 'direct'),
+    '7\'s': (7.991527e-08, 'direct'),
+    '70\'s': (2.697140e-07, 'direct'),
+    '700\'s': (9.989408e-09, 'direct'),
+    '71000\'s': (9.989408e-09, 'direct'),
+    '715\'s': (9.989408e-09, 'direct'),
+    '737\'s': (9.989408e-09, 'direct'),
+    '74\'s': (9.989408e-09, 'direct'),
+    '740\'s': (9.989408e-09, 'direct'),
+    '76\'s': (4.994704e-08, 'direct'),
+    '7:84\'s': (9.989408e-09, 'direct'),
+    '8\'s': (1.997882e-08, 'direct'),
+    '80\'s': (2.097776e-07, 'direct'),
+    '80486\'s': (1.997882e-08, 'direct'),
+    '80r\'s': (1.997882e-08, 'direct'),
+    '82\'s': (9.989408e-09, 'direct'),
+    '826-a\'s': (9.989408e-09, 'direct'),
+    '850\'s': (9.989408e-09, 'direct'),
+    '88\'s': (1.997882e-08, 'direct'),
+    '8f\'s': (9.989408e-09, 'direct'),
+    '9\'s': (2.996822e-08, 'direct'),
+    '90\'s': (2.497352e-07, 'direct'),
+    'a\'s': (2.727108e-06, 'direct'),
+    'a-1\'s': (9.989408e-09, 'direct'),
+    'a-r\'s': (9.989408e-09, 'direct'),
+    'a1\'s': (1.997882e-08, 'direct'),
+    'a2\'s': (7.991527e-08, 'direct'),
+    'a3\'s': (9.989408e-09, 'direct'),
+    'a4\'s': (6.992586e-08, 'direct'),
+    'adrian\'s': (9.989408e-09, 'direct'),
+    'advance&mdash;mortgagee\'s': (9.989408e-09, 'direct'),
+    'alzheimer\'s': (9.989408e-09, 'direct'),
+    'andy\'s': (9.989408e-09, 'direct'),
+    'ann\'d': (1.949933e-05, 'contraction'),
+    'anne\'s': (9.989408e-09, 'direct'),
+    'anybody\'s': (9.989408e-09, 'direct'),
+    'aren\'t': (3.325034e-03, 'contraction'),
+    'astro\'s': (9.989408e-09, 'direct'),
+    'b&eacute;r&eacute;govoy\'s': (1.997882e-08, 'direct'),
+    'b\'s': (2.227638e-06, 'direct'),
+    'b-1\'s': (9.989408e-09, 'direct'),
+    'b-52\'s': (9.989408e-09, 'direct'),
+    'baron\'s': (9.989408e-09, 'direct'),
+    'bonington\'s': (9.989408e-09, 'direct'),
+    'boy\'s': (1.997882e-08, 'direct'),
+    'bpx-a\'s': (1.997882e-08, 'direct'),
+    'bruce\'s': (9.989408e-09, 'direct'),
+    'bureaucracy\'s': (9.989408e-09, 'direct'),
+    'burton\'s': (9.989408e-09, 'direct'),
+    'c\'m': (1.651349e-04, 'contraction'),
+    'c\'s': (1.188740e-06, 'direct'),
+    'c.i.\'s': (9.989408e-09, 'direct'),
+    'c130\'s': (9.989408e-09, 'direct'),
+    'c3\'s': (9.989408e-09, 'direct'),
+    'c4\'s': (1.997882e-08, 'direct'),
+    'c60\'s': (9.989408e-09, 'direct'),
+    'c64\'s': (9.989408e-09, 'direct'),
+    'c_c\'s': (2.996822e-08, 'direct'),
+    'can\'t': (3.301000e-04, 'contraction'),
+    'captain\'s': (9.989408e-09, 'direct'),
+    'cc\'s': (2.996822e-08, 'direct'),
+    'cci\'s': (9.989408e-09, 'direct'),
+    'ccl\'s': (9.989408e-09, 'direct'),
+    'cd\'s': (9.989408e-08, 'direct'),
+    'chater\'s': (9.989408e-09, 'direct'),
+    'child\'s': (1.997882e-08, 'direct'),
+    'children\'s': (9.989408e-09, 'direct'),
+    'chippersmart\'s': (9.989408e-09, 'direct'),
+    'chomsky\'s': (9.989408e-09, 'direct'),
+    'christie\'s': (1.997882e-08, 'direct'),
+    'ci\'s': (1.997882e-08, 'direct'),
+    'clayton\'s': (9.989408e-09, 'direct'),
+    'cle-1\'s': (1.997882e-08, 'direct'),
+    'cmi\'s': (2.996822e-08, 'direct'),
+    'cml\'s': (9.989408e-09, 'direct'),
+    'cocky\'s': (3.995763e-08, 'direct'),
+    'couldn\'t': (1.682136e-03, 'contraction'),
+    'cuthbert\'s': (9.989408e-09, 'direct'),
+    'cv\'s': (9.989408e-09, 'direct'),
+    'd&eacute;sir&eacute;e\'s': (9.989408e-09, 'direct'),
+    'd\'s': (5.793857e-07, 'direct'),
+    'd12\'s': (1.997882e-08, 'direct'),
+    'dat\'s': (9.989408e-09, 'direct'),
+    'daughter\'s/son\'s/friend\'s': (9.989408e-09, 'direct'),
+    'davidson\'s': (9.989408e-09, 'direct'),
+    'dcf\'s': (9.989408e-09, 'direct'),
+    'di\'s': (2.996822e-08, 'direct'),
+    'didn\'t': (1.432771e-03, 'contraction'),
+    'dix\'s': (9.989408e-09, 'direct'),
+    'do\'s': (8.990467e-08, 'direct'),
+    'doesn\'t': (6.866819e-04, 'contraction'),
+    'don\'t': (2.804047e-03, 'contraction'),
+    'donaldson\'s': (9.989408e-09, 'direct'),
+    'duke\'s': (9.989408e-09, 'direct'),
+    'duncan\'s': (9.989408e-09, 'direct'),
+    'e\'s': (8.391103e-07, 'direct'),
+    'e111\'s': (9.989408e-09, 'direct'),
+    'e5\'s': (9.989408e-09, 'direct'),
+    'e6\'s': (1.997882e-08, 'direct'),
+    'e6000\'s': (9.989408e-09, 'direct'),
+    'eastwood/gloucestershire\'s': (9.989408e-09, 'direct'),
+    'eckhardt-gramatt&eacute\'s': (1.997882e-08, 'direct'),
+    'eckhardt-grammatt&eacute\'s': (9.989408e-09, 'direct'),
+    'eight\'s': (1.997882e-08, 'direct'),
+    'eleven\'s': (9.989408e-09, 'direct'),
+    'eliot\'s': (9.989408e-09, 'direct'),
+    'ellie\'s': (9.989408e-09, 'direct'),
+    'else\'s': (2.996822e-08, 'direct'),
+    'emperor\'s': (9.989408e-09, 'direct'),
+    'employer\'s': (9.989408e-09, 'direct'),
+    'everybody\'s': (6.077556e-05, 'contraction'),
+    'everyone\'s': (1.332287e-04, 'contraction'),
+    'everything\'s': (1.865522e-04, 'contraction'),
+    'f\'s': (2.697140e-07, 'direct'),
+    'f1\'s': (2.996822e-08, 'direct'),
+    'f61\'s': (1.997882e-08, 'direct'),
+    'father\'s': (2.996822e-08, 'direct'),
+    'fifty-one\'s': (9.989408e-09, 'direct'),
+    'five\'s': (1.098835e-07, 'direct'),
+    'four\'s': (1.398517e-07, 'direct'),
+    'g\'s': (1.997882e-07, 'direct'),
+    'g40\'s': (1.997882e-08, 'direct'),
+    'g60\'s': (9.989408e-09, 'direct'),
+    'g7\'s': (2.996822e-08, 'direct'),
+    'gec\'s': (9.989408e-09, 'direct'),
+    'germany\'s': (9.989408e-09, 'direct'),
+    'goldsmith\'s': (9.989408e-09, 'direct'),
+    'government\'s': (9.989408e-09, 'direct'),
+    'gr-1\'s': (1.997882e-08, 'direct'),
+    'great-great-grandfather\'s': (1.997882e-08, 'direct'),
+    'great-great-great-grandfather\'s': (9.989408e-09, 'direct'),
+    'great-great-great-great-grandfather\'s': (9.989408e-09, 'direct'),
+    'greenslade\'s': (9.989408e-09, 'direct'),
+    'gti\'s': (9.989408e-09, 'direct'),
+    'h\'s': (4.994704e-08, 'direct'),
+    'h167\'s': (9.989408e-09, 'direct'),
+    'h3\'s': (1.997882e-08, 'direct'),
+    'hadn\'t': (3.325034e-03, 'contraction'),
+    'hasn\'t': (2.591682e-03, 'contraction'),
+    'haven\'t': (3.325034e-03, 'contraction'),
+    'he\'d': (6.669329e-04, 'contraction'),
+    'he\'s': (6.806573e-03, 'contraction'),
+    'here\'s': (6.987791e-04, 'contraction'),
+    'hofland\'s': (9.989408e-09, 'direct'),
+    'hour-and-a-half\'s': (9.989408e-09, 'direct'),
+    'how\'s': (1.014095e-03, 'contraction'),
+    'husband\'s': (9.989408e-09, 'direct'),
+    'hvs\'s': (9.989408e-09, 'direct'),
+    'i\'d': (6.669329e-04, 'contraction'),
+    'i\'s': (1.068867e-06, 'direct'),
+    'i890\'s': (9.989408e-09, 'direct'),
+    'ici\'s': (9.989408e-09, 'direct'),
+    'ii\'s': (1.348570e-06, 'direct'),
+    'iii\'s': (1.188740e-06, 'direct'),
+    'infant\'s': (9.989408e-09, 'direct'),
+    'island\'s': (9.989408e-09, 'direct'),
+    'isn\'t': (3.325034e-03, 'contraction'),
+    'it\'d': (6.669329e-04, 'contraction'),
+    'it\'s': (8.064519e-03, 'contraction'),
+    'iv\'s': (2.797034e-07, 'direct'),
+    'ix\'s': (1.098835e-07, 'direct'),
+    'j\'s': (2.996822e-07, 'direct'),
+    'j_j\'s': (9.989408e-09, 'direct'),
+    'jane\'s': (9.989408e-09, 'direct'),
+    'jenny\'s': (9.989408e-09, 'direct'),
+    'jmp-1\'s': (2.996822e-08, 'direct'),
+    'jude\'s': (9.989408e-09, 'direct'),
+    'k\'s': (3.396399e-07, 'direct'),
+    'k0\'s': (9.989408e-09, 'direct'),
+    'kant\'s': (9.989408e-09, 'direct'),
+    'l\'s': (2.896928e-07, 'direct'),
+    'l2\'s': (9.989408e-09, 'direct'),
+    'l7\'s': (9.989408e-09, 'direct'),
+    'lazard\'s': (9.989408e-09, 'direct'),
+    'leonard\'s': (9.989408e-09, 'direct'),
+    'let\'s': (2.607036e-04, 'contraction'),
+    'let_,_let\'s': (3.995763e-08, 'direct'),
+    'let_er_let\'s': (9.989408e-09, 'direct'),
+    'let_let\'s': (3.995763e-08, 'direct'),
+    'li\'s': (8.990467e-08, 'direct'),
+    'liz\'s': (9.989408e-09, 'direct'),
+    'lloyd\'s': (1.997882e-08, 'direct'),
+    'lord\'s': (9.989408e-09, 'direct'),
+    'loved-one\'s': (9.989408e-09, 'direct'),
+    'm&eacute;diterran&eacute;e\'s': (9.989408e-09, 'direct'),
+    'm\'s': (1.798093e-07, 'direct'),
+    'm.i.\'s': (9.989408e-09, 'direct'),
+    'm25\'s': (9.989408e-09, 'direct'),
+    'male\'s': (9.989408e-09, 'direct'),
+    'margaret\'s': (9.989408e-09, 'direct'),
+    'marie&rehy;ang&egrave;le\'s': (9.989408e-09, 'direct'),
+    'marie-h&eacute;l&egrave;ne\'s': (9.989408e-09, 'direct'),
+    'mark\'s': (9.989408e-09, 'direct'),
+    'martyr\'s': (9.989408e-09, 'direct'),
+    'maureen\'s': (9.989408e-09, 'direct'),
+    'mcc\'s': (9.989408e-09, 'direct'),
+    'mcd\'s': (9.989408e-09, 'direct'),
+    'mcdonald\'s': (3.995763e-08, 'direct'),
+    'mci\'s': (5.993645e-08, 'direct'),
+    'mdc\'s': (3.496293e-07, 'direct'),
+    'me&scaron;trovi&cacute\'s': (9.989408e-09, 'direct'),
+    'mi\'s': (9.989408e-09, 'direct'),
+    'mid-1990\'s': (9.989408e-09, 'direct'),
+    'mike\'s': (9.989408e-09, 'direct'),
+    'mmc\'s': (7.991527e-08, 'direct'),
+    'mohammed\'s': (9.989408e-09, 'direct'),
+    'mornin\'s': (9.989408e-09, 'direct'),
+    'mother\'s': (1.997882e-08, 'direct'),
+    'n\'s': (1.198729e-07, 'direct'),
+    'n\'t': (3.325034e-03, 'direct'),
+    'neighbour\'s': (9.989408e-09, 'direct'),
+    'nine\'s': (2.996822e-08, 'direct'),
+    'nobody\'s': (6.222402e-05, 'contraction'),
+    'non-one\'s': (9.989408e-09, 'direct'),
+    'nothing\'s': (3.402792e-04, 'contraction'),
+    'now-they-work-and-now-they-don\'t': (9.989408e-09, 'direct'),
+    'now-you-see-me-now-you-don\'t': (9.989408e-09, 'direct'),
+    'nvocc\'s': (1.997882e-07, 'direct'),
+    'o\'s': (7.991527e-07, 'direct'),
+    'oap\'s': (9.989408e-09, 'direct'),
+    'one\'s': (2.910934e-03, 'contraction'),
+    'original\'s': (9.989408e-09, 'direct'),
+    'osman\'s': (9.989408e-09, 'direct'),
+    'other\'s': (9.989408e-09, 'direct'),
+    'p&aacute;le&nacute;i&ccaron;ek\'s': (9.989408e-09, 'direct'),
+    'p\'s': (8.890573e-07, 'direct'),
+    'p11\'s': (9.989408e-09, 'direct'),
+    'p2\'s': (1.997882e-08, 'direct'),
+    'p25\'s': (9.989408e-09, 'direct'),
+    'p90\'s': (9.989408e-09, 'direct'),
+    'paul\'s': (1.997882e-08, 'direct'),
+    'peeler\'s': (9.989408e-09, 'direct'),
+    'pete\'s': (9.989408e-09, 'direct'),
+    'peter\'s': (9.989408e-09, 'direct'),
+    'pi\'s': (9.989408e-09, 'direct'),
+    'piece-turned-stuck-up-councillor\'s': (9.989408e-09, 'direct'),
+    'plc\'s': (9.989408e-09, 'direct'),
+    'powell&mdash;pressburger\'s': (2.996822e-08, 'direct'),
+    'pretender\'s': (9.989408e-09, 'direct'),
+    'pricewell\'s': (2.996822e-08, 'direct'),
+    'professional\'s': (9.989408e-09, 'direct'),
+    'q\'s': (2.597246e-07, 'direct'),
+    'q1692\'s': (9.989408e-09, 'direct'),
+    'q2\'s': (1.997882e-08, 'direct'),
+    'q3\'s': (9.989408e-09, 'direct'),
+    'queen\'s': (1.997882e-08, 'direct'),
+    'r\'s': (2.397458e-07, 'direct'),
+    'r25\'s': (1.997882e-08, 'direct'),
+    'r5868\'s': (2.996822e-08, 'direct'),
+    'r931\'s': (9.989408e-09, 'direct'),
+    'rat\'s': (9.989408e-09, 'direct'),
+    'reagan\'s': (9.989408e-09, 'direct'),
+    'remov\'d': (9.989408e-09, 'direct'),
+    'robin\'s': (9.989408e-09, 'direct'),
+    'rossetti\'s/dickens\'s/browning\'s': (9.989408e-09, 'direct'),
+    'rtf\'s': (9.989408e-09, 'direct'),
+    's\'s': (3.995763e-07, 'direct'),
+    's120\'s': (9.989408e-09, 'direct'),
+    's2\'s': (3.995763e-08, 'direct'),
+    's80\'s': (2.996822e-08, 'direct'),
+    'sainsbury\'s': (9.989408e-09, 'direct'),
+    'saviour\'s': (1.997882e-08, 'direct'),
+    'scobie\'s': (9.989408e-09, 'direct'),
+    'seven\'s': (5.993645e-08, 'direct'),
+    'seven-thirty\'s': (9.989408e-09, 'direct'),
+    'shan\'t': (5.634026e-06, 'contraction'),
+    'she\'d': (6.669329e-04, 'contraction'),
+    'she\'s': (3.798812e-03, 'contraction'),
+    'shouldn\'t': (1.111192e-03, 'contraction'),
+    'six\'s': (1.997882e-08, 'direct'),
+    'someone\'s': (1.866121e-04, 'contraction'),
+    'something\'s': (5.239644e-04, 'contraction'),
+    'something-or&rehy;other\'s': (9.989408e-09, 'direct'),
+    'sotheby\'s': (9.989408e-09, 'direct'),
+    'stanford\'s': (9.989408e-09, 'direct'),
+    'std\'s': (9.989408e-09, 'direct'),
+    'steen\'s': (5.094598e-07, 'direct'),
+    'stepmother\'s': (9.989408e-09, 'direct'),
+    'susan\'s': (9.989408e-09, 'direct'),
+    't\'s': (6.393221e-07, 'direct'),
+    't3\'s': (9.989408e-09, 'direct'),
+    't9000\'s': (1.997882e-08, 'direct'),
+    'takin\'s': (9.989408e-09, 'direct'),
+    'ten\'s': (4.994704e-08, 'direct'),
+    'that\'s': (8.064519e-03, 'contraction'),
+    'there\'s': (3.276206e-03, 'contraction'),
+    'they\'d': (6.669329e-04, 'contraction'),
+    'they\'ll': (7.251511e-04, 'contraction'),
+    'thirty\'s': (9.989408e-09, 'direct'),
+    'three\'s': (2.197670e-07, 'direct'),
+    'tiffany\'s': (9.989408e-09, 'direct'),
+    'tracy\'d': (3.985774e-06, 'contraction'),
+    'twelve\'s': (1.997882e-08, 'direct'),
+    'two\'s': (4.695022e-07, 'direct'),
+    'u\'s': (1.997882e-07, 'direct'),
+    'u12\'s': (9.989408e-09, 'direct'),
+    'u18\'s': (1.997882e-08, 'direct'),
+    'u2\'s': (8.990467e-08, 'direct'),
+    'u21\'s': (9.989408e-09, 'direct'),
+    'under-11\'s': (9.989408e-09, 'direct'),
+    'under-13\'s': (1.997882e-08, 'direct'),
+    'under-15\'s': (9.989408e-09, 'direct'),
+    'v\'s': (3.895869e-07, 'direct'),
+    'v16\'s': (9.989408e-09, 'direct'),
+    'v2\'s': (9.989408e-09, 'direct'),
+    'v6\'s': (9.989408e-09, 'direct'),
+    'v8\'s': (2.996822e-08, 'direct'),
+    'van\'t': (6.393221e-07, 'contraction'),
+    'vi\'s': (3.296505e-07, 'direct'),
+    'vii\'s': (3.096717e-07, 'direct'),
+    'viii\'s': (3.296505e-07, 'direct'),
+    'w\'s': (1.398517e-07, 'direct'),
+    'wasn\'t': (3.325034e-03, 'contraction'),
+    'watchman\'s': (9.989408e-09, 'direct'),
+    'we\'d': (6.669329e-04, 'contraction'),
+    'weren\'t': (3.224901e-03, 'contraction'),
+    'what\'s': (2.492168e-03, 'contraction'),
+    'where\'s': (1.085060e-03, 'contraction'),
+    'who\'d': (6.669329e-04, 'contraction'),
+    'who\'s': (2.064081e-03, 'contraction'),
+    'won\'t': (1.654845e-04, 'contraction'),
+    'wouldn\'t': (2.549277e-03, 'contraction'),
+    'x\'s': (1.468443e-06, 'direct'),
+    'x100\'s': (9.989408e-09, 'direct'),
+    'xi\'s': (5.993645e-08, 'direct'),
+    'xii\'s': (5.993645e-08, 'direct'),
+    'xiii\'s': (4.994704e-08, 'direct'),
+    'xiv\'s': (1.198729e-07, 'direct'),
+    'xv\'s': (5.993645e-08, 'direct'),
+    'xx\'s': (9.989408e-09, 'direct'),
+    'xxii\'s': (3.995763e-08, 'direct'),
+    'y\'s': (2.197670e-07, 'direct'),
+    'yamato-1\'s': (9.989408e-09, 'direct'),
+    'year\'s': (2.996822e-08, 'direct'),
+    'yo-yo\'s': (9.989408e-09, 'direct'),
+    'you\'d': (6.669329e-04, 'contraction'),
+    'your\'s': (9.989408e-09, 'direct'),
+    'z\'s': (9.989408e-08, 'direct'),
+    'z7015\'s': (9.989408e-09, 'direct'),
+    'z_\'s': (9.989408e-09, 'direct'),
+}
@@ -1239,7 +1239,6 @@ frequencies_6a = {
     '6ff3d2f1ca7cbbab7b0c7b416d9e61': 2.996822e-08,
     '70346552997d4aa7e4be1455a39189': 9.989408e-09,
     '703d548cd50af58a1a95926c0815f3': 3.995763e-08,
-    '7053103e4a7976bd2515681a0b00a9': 9.989408e-09,
     '707ba985b76ee2123c5e21c8ca0863': 8.291209e-07,
     '70b952ad96b036a2de6c36410b6680': 1.997882e-08,
     '70c29b669cc422e27c30489ae09ee7': 9.989408e-09,
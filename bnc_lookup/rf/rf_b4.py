@@ -533,7 +533,7 @@ frequencies_b4 = {
     '339248ade0ec4d0d4285326b1002ff': 9.390044e-07,
     '33a0e67fde0ac546b70c21c392e0ba': 9.989408e-09,
     '33bdb534d0658c04a48eaf5168bad9': 9.989408e-09,
-    '33bf3a9909bf9ba6739f4489225fa1': 3.196611e-07,
+    '33bf3a9909bf9ba6739f4489225fa1': 3.296505e-07,
     '33c6c0e3cc1934a882dd485c7f0058': 1.798093e-07,
     '33d5095a689d36e39ceb6e6c136849': 2.996822e-08,
     '33e043d97cc54843b0fbce3858b47e': 8.690785e-07,
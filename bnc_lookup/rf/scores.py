@@ -0,0 +1,10987 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# AUTO-GENERATED - DO NOT MODIFY
+
+# Zipf code (1-255) of every relative frequency in the rf tables
+zipf_codes = {
+    9.989408e-09: 1,
+    1.997882e-08: 11,
+    2.996822e-08: 16,
+    3.995763e-08: 20,
+    4.994704e-08: 23,
+    5.993645e-08: 26,
+    6.992586e-08: 28,
+    7.991527e-08: 30,
+    8.990467e-08: 32,
+    9.989408e-08: 33,
+    1.098835e-07: 34,
+    1.198729e-07: 36,
+    1.298623e-07: 37,
+    1.398517e-07: 38,
+    1.498411e-07: 39,
+    1.598305e-07: 40,
+    1.698199e-07: 40,
+    1.798093e-07: 41,
+    1.897988e-07: 42,
+    1.997882e-07: 43,
+    2.097776e-07: 43,
+    2.197670e-07: 44,
+    2.297564e-07: 45,
+    2.397458e-07: 45,
+    2.497352e-07: 46,
+    2.597246e-07: 46,
+    2.697140e-07: 47,
+    2.797034e-07: 47,
+    2.896928e-07: 48,
+    2.996822e-07: 48,
+    3.096717e-07: 49,
+    3.196611e-07: 49,
+    3.296505e-07: 50,
+    3.396399e-07: 50,
+    3.496293e-07: 50,
+    3.596187e-07: 51,
+    3.696081e-07: 51,
+    3.795975e-07: 52,
+    3.895869e-07: 52,
+    3.995763e-07: 52,
+    4.095657e-07: 53,
+    4.195551e-07: 53,
+    4.295446e-07: 53,
+    4.395340e-07: 54,
+    4.495234e-07: 54,
+    4.595128e-07: 54,
+    4.695022e-07: 54,
+    4.794916e-07: 55,
+    4.894810e-07: 55,
+    4.994704e-07: 55,
+    5.094598e-07: 56,
+    5.194492e-07: 56,
+    5.294386e-07: 56,
+    5.394280e-07: 56,
+    5.494175e-07: 57,
+    5.594069e-07: 57,
+    5.693963e-07: 57,
+    5.793857e-07: 57,
+    5.893751e-07: 58,
+    5.993645e-07: 58,
+    6.093539e-07: 58,
+    6.193433e-07: 58,
+    6.293327e-07: 59,
+    6.393221e-07: 59,
+    6.493115e-07: 59,
+    6.593009e-07: 59,
+    6.692904e-07: 59,
+    6.792798e-07: 60,
+    6.892692e-07: 60,
+    6.992586e-07: 60,
+    7.092480e-07: 60,
+    7.192374e-07: 60,
+    7.292268e-07: 61,
+    7.392162e-07: 61,
+    7.492056e-07: 61,
+    7.591950e-07: 61,
+    7.691844e-07: 61,
+    7.791738e-07: 62,
+    7.891633e-07: 62,
+    7.991527e-07: 62,
+    8.091421e-07: 62,
+    8.191315e-07: 62,
+    8.291209e-07: 62,
+    8.391103e-07: 63,
+    8.490997e-07: 63,
+    8.590891e-07: 63,
+    8.690785e-07: 63,
+    8.790679e-07: 63,
+    8.890573e-07: 63,
+    8.990467e-07: 64,
+    9.090362e-07: 64,
+    9.190256e-07: 64,
+    9.290150e-07: 64,
+    9.390044e-07: 64,
+    9.489938e-07: 64,
+    9.589832e-07: 64,
+    9.689726e-07: 65,
+    9.789620e-07: 65,
+    9.889514e-07: 65,
+    9.989408e-07: 65,
+    1.008930e-06: 65,
+    1.018920e-06: 65,
+    1.028909e-06: 65,
+    1.038898e-06: 66,
+    1.048888e-06: 66,
+    1.058877e-06: 66,
+    1.068867e-06: 66,
+    1.078856e-06: 66,
+    1.088846e-06: 66,
+    1.098835e-06: 66,
+    1.108824e-06: 66,
+    1.118814e-06: 67,
+    1.128803e-06: 67,
+    1.138793e-06: 67,
+    1.148782e-06: 67,
+    1.158771e-06: 67,
+    1.168761e-06: 67,
+    1.178750e-06: 67,
+    1.188740e-06: 67,
+    1.198729e-06: 68,
+    1.208718e-06: 68,
+    1.218708e-06: 68,
+    1.228697e-06: 68,
+    1.238687e-06: 68,
+    1.248676e-06: 68,
+    1.258665e-06: 68,
+    1.268655e-06: 68,
+    1.278644e-06: 68,
+    1.288634e-06: 69,
+    1.298623e-06: 69,
+    1.308612e-06: 69,
+    1.318602e-06: 69,
+    1.328591e-06: 69,
+    1.338581e-06: 69,
+    1.348570e-06: 69,
+    1.358560e-06: 69,
+    1.368549e-06: 69,
+    1.378538e-06: 69,
+    1.388528e-06: 70,
+    1.398517e-06: 70,
+    1.408507e-06: 70,
+    1.418496e-06: 70,
+    1.428485e-06: 70,
+    1.438475e-06: 70,
+    1.448464e-06: 70,
+    1.458454e-06: 70,
+    1.468443e-06: 70,
+    1.478432e-06: 70,
+    1.488422e-06: 71,
+    1.498411e-06: 71,
+    1.508401e-06: 71,
+    1.518390e-06: 71,
+    1.528379e-06: 71,
+    1.538369e-06: 71,
+    1.548358e-06: 71,
+    1.558348e-06: 71,
+    1.568337e-06: 71,
+    1.578327e-06: 71,
+    1.588316e-06: 71,
+    1.598305e-06: 72,
+    1.608295e-06: 72,
+    1.618284e-06: 72,
+    1.628274e-06: 72,
+    1.638263e-06: 72,
+    1.648252e-06: 72,
+    1.658242e-06: 72,
+    1.668231e-06: 72,
+    1.678221e-06: 72,
+    1.688210e-06: 72,
+    1.698199e-06: 72,
+    1.708189e-06: 72,
+    1.718178e-06: 73,
+    1.728168e-06: 73,
+    1.738157e-06: 73,
+    1.748146e-06: 73,
+    1.758136e-06: 73,
+    1.768125e-06: 73,
+    1.778115e-06: 73,
+    1.788104e-06: 73,
+    1.798093e-06: 73,
+    1.808083e-06: 73,
+    1.818072e-06: 73,
+    1.828062e-06: 73,
+    1.838051e-06: 73,
+    1.848041e-06: 74,
+    1.858030e-06: 74,
+    1.868019e-06: 74,
+    1.878009e-06: 74,
+    1.887998e-06: 74,
+    1.897988e-06: 74,
+    1.907977e-06: 74,
+    1.917966e-06: 74,
+    1.927956e-06: 74,
+    1.937945e-06: 74,
+    1.947935e-06: 74,
+    1.957924e-06: 74,
+    1.967913e-06: 74,
+    1.977903e-06: 74,
+    1.987892e-06: 75,
+    1.997882e-06: 75,
+    2.007871e-06: 75,
+    2.017860e-06: 75,
+    2.027850e-06: 75,
+    2.037839e-06: 75,
+    2.047829e-06: 75,
+    2.057818e-06: 75,
+    2.067808e-06: 75,
+    2.077797e-06: 75,
+    2.087786e-06: 75,
+    2.097776e-06: 75,
+    2.107765e-06: 75,
+    2.117755e-06: 75,
+    2.127744e-06: 75,
+    2.137733e-06: 76,
+    2.147723e-06: 76,
+    2.157712e-06: 76,
+    2.167702e-06: 76,
+    2.177691e-06: 76,
+    2.187680e-06: 76,
+    2.197670e-06: 76,
+    2.207659e-06: 76,
+    2.217649e-06: 76,
+    2.227638e-06: 76,
+    2.237627e-06: 76,
+    2.247617e-06: 76,
+    2.257606e-06: 76,
+    2.267596e-06: 76,
+    2.277585e-06: 76,
+    2.287575e-06: 77,
+    2.297564e-06: 77,
+    2.307553e-06: 77,
+    2.317543e-06: 77,
+    2.327532e-06: 77,
+    2.337522e-06: 77,
+    2.347511e-06: 77,
+    2.357500e-06: 77,
+    2.367490e-06: 77,
+    2.377479e-06: 77,
+    2.387469e-06: 77,
+    2.397458e-06: 77,
+    2.407447e-06: 77,
+    2.417437e-06: 77,
+    2.427426e-06: 77,
+    2.437416e-06: 77,
+    2.447405e-06: 77,
+    2.457394e-06: 77,
+    2.467384e-06: 78,
+    2.477373e-06: 78,
+    2.487363e-06: 78,
+    2.497352e-06: 78,
+    2.507341e-06: 78,
+    2.517331e-06: 78,
+    2.527320e-06: 78,
+    2.537310e-06: 78,
+    2.547299e-06: 78,
+    2.557289e-06: 78,
+    2.567278e-06: 78,
+    2.577267e-06: 78,
+    2.587257e-06: 78,
+    2.597246e-06: 78,
+    2.607236e-06: 78,
+    2.617225e-06: 78,
+    2.627214e-06: 78,
+    2.637204e-06: 78,
+    2.647193e-06: 79,
+    2.657183e-06: 79,
+    2.667172e-06: 79,
+    2.677161e-06: 79,
+    2.687151e-06: 79,
+    2.697140e-06: 79,
+    2.707130e-06: 79,
+    2.717119e-06: 79,
+    2.727108e-06: 79,
+    2.737098e-06: 79,
+    2.747087e-06: 79,
+    2.757077e-06: 79,
+    2.767066e-06: 79,
+    2.777056e-06: 79,
+    2.787045e-06: 79,
+    2.797034e-06: 79,
+    2.807024e-06: 79,
+    2.817013e-06: 79,
+    2.827003e-06: 79,
+    2.836992e-06: 79,
+    2.846981e-06: 80,
+    2.856971e-06: 80,
+    2.866960e-06: 80,
+    2.876950e-06: 80,
+    2.886939e-06: 80,
+    2.896928e-06: 80,
+    2.906918e-06: 80,
+    2.916907e-06: 80,
+    2.926897e-06: 80,
+    2.936886e-06: 80,
+    2.946875e-06: 80,
+    2.956865e-06: 80,
+    2.966854e-06: 80,
+    2.976844e-06: 80,
+    2.986833e-06: 80,
+    2.996822e-06: 80,
+    3.006812e-06: 80,
+    3.016801e-06: 80,
+    3.026791e-06: 80,
+    3.036780e-06: 80,
+    3.046770e-06: 80,
+    3.056759e-06: 81,
+    3.066748e-06: 81,
+    3.076738e-06: 81,
+    3.086727e-06: 81,
+    3.096717e-06: 81,
+    3.106706e-06: 81,
+    3.116695e-06: 81,
+    3.126685e-06: 81,
+    3.136674e-06: 81,
+    3.146664e-06: 81,
+    3.156653e-06: 81,
+    3.166642e-06: 81,
+    3.176632e-06: 81,
+    3.186621e-06: 81,
+    3.196611e-06: 81,
+    3.206600e-06: 81,
+    3.216589e-06: 81,
+    3.226579e-06: 81,
+    3.236568e-06: 81,
+    3.246558e-06: 81,
+    3.256547e-06: 81,
+    3.266537e-06: 81,
+    3.276526e-06: 81,
+    3.286515e-06: 82,
+    3.296505e-06: 82,
+    3.306494e-06: 82,
+    3.316484e-06: 82,
+    3.326473e-06: 82,
+    3.336462e-06: 82,
+    3.346452e-06: 82,
+    3.356441e-06: 82,
+    3.366431e-06: 82,
+    3.376420e-06: 82,
+    3.386409e-06: 82,
+    3.396399e-06: 82,
+    3.406388e-06: 82,
+    3.416378e-06: 82,
+    3.426367e-06: 82,
+    3.436356e-06: 82,
+    3.446346e-06: 82,
+    3.456335e-06: 82,
+    3.466325e-06: 82,
+    3.476314e-06: 82,
+    3.486304e-06: 82,
+    3.496293e-06: 82,
+    3.506282e-06: 82,
+    3.516272e-06: 82,
+    3.526261e-06: 83,
+    3.536251e-06: 83,
+    3.546240e-06: 83,
+    3.556229e-06: 83,
+    3.566219e-06: 83,
+    3.576208e-06: 83,
+    3.586198e-06: 83,
+    3.596187e-06: 83,
+    3.606176e-06: 83,
+    3.616166e-06: 83,
+    3.626155e-06: 83,
+    3.636145e-06: 83,
+    3.646134e-06: 83,
+    3.656123e-06: 83,
+    3.666113e-06: 83,
+    3.676102e-06: 83,
+    3.686092e-06: 83,
+    3.696081e-06: 83,
+    3.706070e-06: 83,
+    3.716060e-06: 83,
+    3.726049e-06: 83,
+    3.736039e-06: 83,
+    3.746028e-06: 83,
+    3.756018e-06: 83,
+    3.766007e-06: 83,
+    3.775996e-06: 83,
+    3.785986e-06: 84,
+    3.795975e-06: 84,
+    3.805965e-06: 84,
+    3.815954e-06: 84,
+    3.825943e-06: 84,
+    3.835933e-06: 84,
+    3.845922e-06: 84,
+    3.855912e-06: 84,
+    3.865901e-06: 84,
+    3.875890e-06: 84,
+    3.885880e-06: 84,
+    3.895869e-06: 84,
+    3.905859e-06: 84,
+    3.915848e-06: 84,
+    3.925837e-06: 84,
+    3.935827e-06: 84,
+    3.945816e-06: 84,
+    3.955806e-06: 84,
+    3.965795e-06: 84,
+    3.975785e-06: 84,
+    3.985774e-06: 84,
+    3.995763e-06: 84,
+    4.005753e-06: 84,
+    4.015742e-06: 84,
+    4.025732e-06: 84,
+    4.035721e-06: 84,
+    4.045710e-06: 84,
+    4.055700e-06: 84,
+    4.065689e-06: 84,
+    4.075679e-06: 85,
+    4.085668e-06: 85,
+    4.095657e-06: 85,
+    4.105647e-06: 85,
+    4.115636e-06: 85,
+    4.125626e-06: 85,
+    4.135615e-06: 85,
+    4.145604e-06: 85,
+    4.155594e-06: 85,
+    4.165583e-06: 85,
+    4.175573e-06: 85,
+    4.185562e-06: 85,
+    4.195551e-06: 85,
+    4.205541e-06: 85,
+    4.215530e-06: 85,
+    4.225520e-06: 85,
+    4.235509e-06: 85,
+    4.245499e-06: 85,
+    4.255488e-06: 85,
+    4.265477e-06: 85,
+    4.275467e-06: 85,
+    4.285456e-06: 85,
+    4.295446e-06: 85,
+    4.305435e-06: 85,
+    4.315424e-06: 85,
+    4.325414e-06: 85,
+    4.335403e-06: 85,
+    4.345393e-06: 85,
+    4.355382e-06: 85,
+    4.365371e-06: 85,
+    4.375361e-06: 86,
+    4.385350e-06: 86,
+    4.395340e-06: 86,
+    4.405329e-06: 86,
+    4.415318e-06: 86,
+    4.425308e-06: 86,
+    4.435297e-06: 86,
+    4.445287e-06: 86,
+    4.455276e-06: 86,
+    4.465266e-06: 86,
+    4.475255e-06: 86,
+    4.485244e-06: 86,
+    4.495234e-06: 86,
+    4.505223e-06: 86,
+    4.515213e-06: 86,
+    4.525202e-06: 86,
+    4.535191e-06: 86,
+    4.545181e-06: 86,
+    4.555170e-06: 86,
+    4.565160e-06: 86,
+    4.575149e-06: 86,
+    4.585138e-06: 86,
+    4.595128e-06: 86,
+    4.605117e-06: 86,
+    4.615107e-06: 86,
+    4.625096e-06: 86,
+    4.635085e-06: 86,
+    4.645075e-06: 86,
+    4.655064e-06: 86,
+    4.665054e-06: 86,
+    4.675043e-06: 86,
+    4.685033e-06: 86,
+    4.695022e-06: 86,
+    4.705011e-06: 87,
+    4.715001e-06: 87,
+    4.724990e-06: 87,
+    4.734980e-06: 87,
+    4.744969e-06: 87,
+    4.754958e-06: 87,
+    4.764948e-06: 87,
+    4.774937e-06: 87,
+    4.784927e-06: 87,
+    4.794916e-06: 87,
+    4.804905e-06: 87,
+    4.814895e-06: 87,
+    4.824884e-06: 87,
+    4.834874e-06: 87,
+    4.844863e-06: 87,
+    4.854852e-06: 87,
+    4.864842e-06: 87,
+    4.874831e-06: 87,
+    4.884821e-06: 87,
+    4.894810e-06: 87,
+    4.904799e-06: 87,
+    4.914789e-06: 87,
+    4.924778e-06: 87,
+    4.934768e-06: 87,
+    4.944757e-06: 87,
+    4.954747e-06: 87,
+    4.964736e-06: 87,
+    4.974725e-06: 87,
+    4.984715e-06: 87,
+    4.994704e-06: 87,
+    5.004694e-06: 87,
+    5.014683e-06: 87,
+    5.024672e-06: 87,
+    5.034662e-06: 87,
+    5.044651e-06: 87,
+    5.054641e-06: 88,
+    5.064630e-06: 88,
+    5.074619e-06: 88,
+    5.084609e-06: 88,
+    5.094598e-06: 88,
+    5.104588e-06: 88,
+    5.114577e-06: 88,
+    5.124566e-06: 88,
+    5.134556e-06: 88,
+    5.144545e-06: 88,
+    5.154535e-06: 88,
+    5.164524e-06: 88,
+    5.174514e-06: 88,
+    5.184503e-06: 88,
+    5.194492e-06: 88,
+    5.204482e-06: 88,
+    5.214471e-06: 88,
+    5.224461e-06: 88,
+    5.234450e-06: 88,
+    5.244439e-06: 88,
+    5.254429e-06: 88,
+    5.264418e-06: 88,
+    5.274408e-06: 88,
+    5.284397e-06: 88,
+    5.294386e-06: 88,
+    5.304376e-06: 88,
+    5.314365e-06: 88,
+    5.324355e-06: 88,
+    5.334344e-06: 88,
+    5.344333e-06: 88,
+    5.354323e-06: 88,
+    5.364312e-06: 88,
+    5.374302e-06: 88,
+    5.384291e-06: 88,
+    5.394280e-06: 88,
+    5.404270e-06: 88,
+    5.414259e-06: 88,
+    5.424249e-06: 88,
+    5.434238e-06: 89,
+    5.444228e-06: 89,
+    5.454217e-06: 89,
+    5.464206e-06: 89,
+    5.474196e-06: 89,
+    5.484185e-06: 89,
+    5.494175e-06: 89,
+    5.504164e-06: 89,
+    5.514153e-06: 89,
+    5.524143e-06: 89,
+    5.534132e-06: 89,
+    5.544122e-06: 89,
+    5.554111e-06: 89,
+    5.564100e-06: 89,
+    5.574090e-06: 89,
+    5.584079e-06: 89,
+    5.594069e-06: 89,
+    5.604058e-06: 89,
+    5.614047e-06: 89,
+    5.624037e-06: 89,
+    5.634026e-06: 89,
+    5.644016e-06: 89,
+    5.654005e-06: 89,
+    5.663995e-06: 89,
+    5.673984e-06: 89,
+    5.683973e-06: 89,
+    5.693963e-06: 89,
+    5.703952e-06: 89,
+    5.713942e-06: 89,
+    5.723931e-06: 89,
+    5.733920e-06: 89,
+    5.743910e-06: 89,
+    5.753899e-06: 89,
+    5.763889e-06: 89,
+    5.773878e-06: 89,
+    5.783867e-06: 89,
+    5.793857e-06: 89,
+    5.803846e-06: 89,
+    5.813836e-06: 89,
+    5.823825e-06: 89,
+    5.833814e-06: 90,
+    5.843804e-06: 90,
+    5.853793e-06: 90,
+    5.863783e-06: 90,
+    5.873772e-06: 90,
+    5.883762e-06: 90,
+    5.893751e-06: 90,
+    5.903740e-06: 90,
+    5.913730e-06: 90,
+    5.923719e-06: 90,
+    5.933709e-06: 90,
+    5.943698e-06: 90,
+    5.953687e-06: 90,
+    5.963677e-06: 90,
+    5.973666e-06: 90,
+    5.983656e-06: 90,
+    5.993645e-06: 90,
+    6.003634e-06: 90,
+    6.013624e-06: 90,
+    6.023613e-06: 90,
+    6.033603e-06: 90,
+    6.043592e-06: 90,
+    6.053581e-06: 90,
+    6.063571e-06: 90,
+    6.073560e-06: 90,
+    6.083550e-06: 90,
+    6.093539e-06: 90,
+    6.103528e-06: 90,
+    6.113518e-06: 90,
+    6.123507e-06: 90,
+    6.133497e-06: 90,
+    6.143486e-06: 90,
+    6.153476e-06: 90,
+    6.163465e-06: 90,
+    6.173454e-06: 90,
+    6.183444e-06: 90,
+    6.193433e-06: 90,
+    6.203423e-06: 90,
+    6.213412e-06: 90,
+    6.223401e-06: 90,
+    6.233391e-06: 90,
+    6.243380e-06: 90,
+    6.253370e-06: 90,
+    6.263359e-06: 90,
+    6.273348e-06: 91,
+    6.283338e-06: 91,
+    6.293327e-06: 91,
+    6.303317e-06: 91,
+    6.313306e-06: 91,
+    6.323295e-06: 91,
+    6.333285e-06: 91,
+    6.343274e-06: 91,
+    6.353264e-06: 91,
+    6.363253e-06: 91,
+    6.373243e-06: 91,
+    6.383232e-06: 91,
+    6.393221e-06: 91,
+    6.403211e-06: 91,
+    6.413200e-06: 91,
+    6.423190e-06: 91,
+    6.433179e-06: 91,
+    6.443168e-06: 91,
+    6.453158e-06: 91,
+    6.463147e-06: 91,
+    6.473137e-06: 91,
+    6.483126e-06: 91,
+    6.493115e-06: 91,
+    6.503105e-06: 91,
+    6.513094e-06: 91,
+    6.523084e-06: 91,
+    6.533073e-06: 91,
+    6.543062e-06: 91,
+    6.553052e-06: 91,
+    6.563041e-06: 91,
+    6.573031e-06: 91,
+    6.583020e-06: 91,
+    6.593009e-06: 91,
+    6.602999e-06: 91,
+    6.612988e-06: 91,
+    6.622978e-06: 91,
+    6.632967e-06: 91,
+    6.642957e-06: 91,
+    6.652946e-06: 91,
+    6.662935e-06: 91,
+    6.672925e-06: 91,
+    6.682914e-06: 91,
+    6.692904e-06: 91,
+    6.702893e-06: 91,
+    6.712882e-06: 91,
+    6.722872e-06: 91,
+    6.732861e-06: 92,
+    6.742851e-06: 92,
+    6.752840e-06: 92,
+    6.762829e-06: 92,
+    6.772819e-06: 92,
+    6.782808e-06: 92,
+    6.792798e-06: 92,
+    6.802787e-06: 92,
+    6.812776e-06: 92,
+    6.822766e-06: 92,
+    6.832755e-06: 92,
+    6.842745e-06: 92,
+    6.852734e-06: 92,
+    6.862724e-06: 92,
+    6.872713e-06: 92,
+    6.882702e-06: 92,
+    6.892692e-06: 92,
+    6.902681e-06: 92,
+    6.912671e-06: 92,
+    6.922660e-06: 92,
+    6.932649e-06: 92,
+    6.942639e-06: 92,
+    6.952628e-06: 92,
+    6.962618e-06: 92,
+    6.972607e-06: 92,
+    6.982596e-06: 92,
+    6.992586e-06: 92,
+    7.002575e-06: 92,
+    7.012565e-06: 92,
+    7.022554e-06: 92,
+    7.032543e-06: 92,
+    7.042533e-06: 92,
+    7.052522e-06: 92,
+    7.062512e-06: 92,
+    7.072501e-06: 92,
+    7.082491e-06: 92,
+    7.092480e-06: 92,
+    7.102469e-06: 92,
+    7.112459e-06: 92,
+    7.122448e-06: 92,
+    7.132438e-06: 92,
+    7.142427e-06: 92,
+    7.152416e-06: 92,
+    7.162406e-06: 92,
+    7.172395e-06: 92,
+    7.182385e-06: 92,
+    7.192374e-06: 92,
+    7.202363e-06: 92,
+    7.212353e-06: 92,
+    7.222342e-06: 92,
+    7.232332e-06: 92,
+    7.242321e-06: 93,
+    7.252310e-06: 93,
+    7.262300e-06: 93,
+    7.272289e-06: 93,
+    7.282279e-06: 93,
+    7.292268e-06: 93,
+    7.302257e-06: 93,
+    7.312247e-06: 93,
+    7.322236e-06: 93,
+    7.332226e-06: 93,
+    7.342215e-06: 93,
+    7.352205e-06: 93,
+    7.362194e-06: 93,
+    7.372183e-06: 93,
+    7.382173e-06: 93,
+    7.392162e-06: 93,
+    7.402152e-06: 93,
+    7.412141e-06: 93,
+    7.422130e-06: 93,
+    7.432120e-06: 93,
+    7.442109e-06: 93,
+    7.452099e-06: 93,
+    7.462088e-06: 93,
+    7.472077e-06: 93,
+    7.482067e-06: 93,
+    7.492056e-06: 93,
+    7.502046e-06: 93,
+    7.512035e-06: 93,
+    7.522024e-06: 93,
+    7.532014e-06: 93,
+    7.542003e-06: 93,
+    7.551993e-06: 93,
+    7.561982e-06: 93,
+    7.571972e-06: 93,
+    7.581961e-06: 93,
+    7.591950e-06: 93,
+    7.601940e-06: 93,
+    7.611929e-06: 93,
+    7.621919e-06: 93,
+    7.631908e-06: 93,
+    7.641897e-06: 93,
+    7.651887e-06: 93,
+    7.661876e-06: 93,
+    7.671866e-06: 93,
+    7.681855e-06: 93,
+    7.691844e-06: 93,
+    7.701834e-06: 93,
+    7.711823e-06: 93,
+    7.721813e-06: 93,
+    7.731802e-06: 93,
+    7.741791e-06: 93,
+    7.751781e-06: 93,
+    7.761770e-06: 93,
+    7.771760e-06: 93,
+    7.781749e-06: 94,
+    7.791738e-06: 94,
+    7.801728e-06: 94,
+    7.811717e-06: 94,
+    7.821707e-06: 94,
+    7.831696e-06: 94,
+    7.841686e-06: 94,
+    7.851675e-06: 94,
+    7.861664e-06: 94,
+    7.871654e-06: 94,
+    7.881643e-06: 94,
+    7.891633e-06: 94,
+    7.901622e-06: 94,
+    7.911611e-06: 94,
+    7.921601e-06: 94,
+    7.931590e-06: 94,
+    7.941580e-06: 94,
+    7.951569e-06: 94,
+    7.961558e-06: 94,
+    7.971548e-06: 94,
+    7.981537e-06: 94,
+    7.991527e-06: 94,
+    8.001516e-06: 94,
+    8.011505e-06: 94,
+    8.021495e-06: 94,
+    8.031484e-06: 94,
+    8.041474e-06: 94,
+    8.051463e-06: 94,
+    8.061453e-06: 94,
+    8.071442e-06: 94,
+    8.081431e-06: 94,
+    8.091421e-06: 94,
+    8.101410e-06: 94,
+    8.111400e-06: 94,
+    8.121389e-06: 94,
+    8.131378e-06: 94,
+    8.141368e-06: 94,
+    8.151357e-06: 94,
+    8.161347e-06: 94,
+    8.171336e-06: 94,
+    8.181325e-06: 94,
+    8.191315e-06: 94,
+    8.201304e-06: 94,
+    8.211294e-06: 94,
+    8.221283e-06: 94,
+    8.231272e-06: 94,
+    8.241262e-06: 94,
+    8.251251e-06: 94,
+    8.261241e-06: 94,
+    8.271230e-06: 94,
+    8.281220e-06: 94,
+    8.291209e-06: 94,
+    8.301198e-06: 94,
+    8.311188e-06: 94,
+    8.321177e-06: 94,
+    8.331167e-06: 94,
+    8.341156e-06: 94,
+    8.351145e-06: 94,
+    8.361135e-06: 95,
+    8.371124e-06: 95,
+    8.381114e-06: 95,
+    8.391103e-06: 95,
+    8.401092e-06: 95,
+    8.411082e-06: 95,
+    8.421071e-06: 95,
+    8.431061e-06: 95,
+    8.441050e-06: 95,
+    8.451039e-06: 95,
+    8.461029e-06: 95,
+    8.471018e-06: 95,
+    8.481008e-06: 95,
+    8.490997e-06: 95,
+    8.500986e-06: 95,
+    8.510976e-06: 95,
+    8.520965e-06: 95,
+    8.530955e-06: 95,
+    8.540944e-06: 95,
+    8.550934e-06: 95,
+    8.560923e-06: 95,
+    8.570912e-06: 95,
+    8.580902e-06: 95,
+    8.590891e-06: 95,
+    8.600881e-06: 95,
+    8.610870e-06: 95,
+    8.620859e-06: 95,
+    8.630849e-06: 95,
+    8.640838e-06: 95,
+    8.650828e-06: 95,
+    8.660817e-06: 95,
+    8.670806e-06: 95,
+    8.680796e-06: 95,
+    8.690785e-06: 95,
+    8.700775e-06: 95,
+    8.710764e-06: 95,
+    8.720753e-06: 95,
+    8.730743e-06: 95,
+    8.740732e-06: 95,
+    8.750722e-06: 95,
+    8.760711e-06: 95,
+    8.770701e-06: 95,
+    8.780690e-06: 95,
+    8.790679e-06: 95,
+    8.800669e-06: 95,
+    8.810658e-06: 95,
+    8.820648e-06: 95,
+    8.830637e-06: 95,
+    8.840626e-06: 95,
+    8.850616e-06: 95,
+    8.860605e-06: 95,
+    8.870595e-06: 95,
+    8.880584e-06: 95,
+    8.890573e-06: 95,
+    8.900563e-06: 95,
+    8.910552e-06: 95,
+    8.920542e-06: 95,
+    8.930531e-06: 95,
+    8.940520e-06: 95,
+    8.950510e-06: 95,
+    8.960499e-06: 95,
+    8.970489e-06: 95,
+    8.980478e-06: 96,
+    8.990467e-06: 96,
+    9.000457e-06: 96,
+    9.010446e-06: 96,
+    9.020436e-06: 96,
+    9.030425e-06: 96,
+    9.040415e-06: 96,
+    9.050404e-06: 96,
+    9.060393e-06: 96,
+    9.070383e-06: 96,
+    9.080372e-06: 96,
+    9.090362e-06: 96,
+    9.100351e-06: 96,
+    9.110340e-06: 96,
+    9.120330e-06: 96,
+    9.130319e-06: 96,
+    9.140309e-06: 96,
+    9.150298e-06: 96,
+    9.160287e-06: 96,
+    9.170277e-06: 96,
+    9.180266e-06: 96,
+    9.190256e-06: 96,
+    9.200245e-06: 96,
+    9.210234e-06: 96,
+    9.220224e-06: 96,
+    9.230213e-06: 96,
+    9.240203e-06: 96,
+    9.250192e-06: 96,
+    9.260182e-06: 96,
+    9.270171e-06: 96,
+    9.280160e-06: 96,
+    9.290150e-06: 96,
+    9.300139e-06: 96,
+    9.310129e-06: 96,
+    9.320118e-06: 96,
+    9.330107e-06: 96,
+    9.350086e-06: 96,
+    9.360076e-06: 96,
+    9.370065e-06: 96,
+    9.380054e-06: 96,
+    9.390044e-06: 96,
+    9.400033e-06: 96,
+    9.410023e-06: 96,
+    9.420012e-06: 96,
+    9.430001e-06: 96,
+    9.439991e-06: 96,
+    9.449980e-06: 96,
+    9.459970e-06: 96,
+    9.469959e-06: 96,
+    9.479949e-06: 96,
+    9.489938e-06: 96,
+    9.499927e-06: 96,
+    9.509917e-06: 96,
+    9.519906e-06: 96,
+    9.529896e-06: 96,
+    9.539885e-06: 96,
+    9.549874e-06: 96,
+    9.559864e-06: 96,
+    9.569853e-06: 96,
+    9.579843e-06: 96,
+    9.589832e-06: 96,
+    9.599821e-06: 96,
+    9.609811e-06: 96,
+    9.619800e-06: 96,
+    9.629790e-06: 96,
+    9.639779e-06: 96,
+    9.649768e-06: 97,
+    9.659758e-06: 97,
+    9.669747e-06: 97,
+    9.679737e-06: 97,
+    9.689726e-06: 97,
+    9.699715e-06: 97,
+    9.709705e-06: 97,
+    9.719694e-06: 97,
+    9.729684e-06: 97,
+    9.739673e-06: 97,
+    9.749663e-06: 97,
+    9.759652e-06: 97,
+    9.769641e-06: 97,
+    9.779631e-06: 97,
+    9.789620e-06: 97,
+    9.799610e-06: 97,
+    9.809599e-06: 97,
+    9.819588e-06: 97,
+    9.829578e-06: 97,
+    9.839567e-06: 97,
+    9.849557e-06: 97,
+    9.859546e-06: 97,
+    9.869535e-06: 97,
+    9.879525e-06: 97,
+    9.889514e-06: 97,
+    9.899504e-06: 97,
+    9.909493e-06: 97,
+    9.919482e-06: 97,
+    9.929472e-06: 97,
+    9.939461e-06: 97,
+    9.949451e-06: 97,
+    9.959440e-06: 97,
+    9.969430e-06: 97,
+    9.979419e-06: 97,
+    9.989408e-06: 97,
+    9.999398e-06: 97,
+    1.000939e-05: 97,
+    1.001938e-05: 97,
+    1.002937e-05: 97,
+    1.003936e-05: 97,
+    1.004934e-05: 97,
+    1.005933e-05: 97,
+    1.006932e-05: 97,
+    1.007931e-05: 97,
+    1.008930e-05: 97,
+    1.009929e-05: 97,
+    1.010928e-05: 97,
+    1.011927e-05: 97,
+    1.012926e-05: 97,
+    1.013925e-05: 97,
+    1.014924e-05: 97,
+    1.015923e-05: 97,
+    1.016922e-05: 97,
+    1.017921e-05: 97,
+    1.018920e-05: 97,
+    1.019919e-05: 97,
+    1.020918e-05: 97,
+    1.021916e-05: 97,
+    1.022915e-05: 97,
+    1.023914e-05: 97,
+    1.024913e-05: 97,
+    1.025912e-05: 97,
+    1.026911e-05: 97,
+    1.027910e-05: 97,
+    1.028909e-05: 97,
+    1.029908e-05: 97,
+    1.030907e-05: 97,
+    1.031906e-05: 97,
+    1.032905e-05: 97,
+    1.033904e-05: 97,
+    1.034903e-05: 97,
+    1.035902e-05: 97,
+    1.036901e-05: 98,
+    1.037900e-05: 98,
+    1.038898e-05: 98,
+    1.039897e-05: 98,
+    1.040896e-05: 98,
+    1.041895e-05: 98,
+    1.042894e-05: 98,
+    1.043893e-05: 98,
+    1.044892e-05: 98,
+    1.045891e-05: 98,
+    1.046890e-05: 98,
+    1.047889e-05: 98,
+    1.048888e-05: 98,
+    1.049887e-05: 98,
+    1.050886e-05: 98,
+    1.051885e-05: 98,
+    1.052884e-05: 98,
+    1.053883e-05: 98,
+    1.054882e-05: 98,
+    1.055880e-05: 98,
+    1.056879e-05: 98,
+    1.057878e-05: 98,
+    1.058877e-05: 98,
+    1.059876e-05: 98,
+    1.060875e-05: 98,
+    1.061874e-05: 98,
+    1.062873e-05: 98,
+    1.063872e-05: 98,
+    1.064871e-05: 98,
+    1.065870e-05: 98,
+    1.066869e-05: 98,
+    1.067868e-05: 98,
+    1.068867e-05: 98,
+    1.069866e-05: 98,
+    1.070865e-05: 98,
+    1.071864e-05: 98,
+    1.072862e-05: 98,
+    1.073861e-05: 98,
+    1.074860e-05: 98,
+    1.075859e-05: 98,
+    1.076858e-05: 98,
+    1.077857e-05: 98,
+    1.078856e-05: 98,
+    1.079855e-05: 98,
+    1.080854e-05: 98,
+    1.081853e-05: 98,
+    1.082852e-05: 98,
+    1.083851e-05: 98,
+    1.084850e-05: 98,
+    1.085849e-05: 98,
+    1.086848e-05: 98,
+    1.087847e-05: 98,
+    1.088846e-05: 98,
+    1.089844e-05: 98,
+    1.090843e-05: 98,
+    1.091842e-05: 98,
+    1.092841e-05: 98,
+    1.093840e-05: 98,
+    1.094839e-05: 98,
+    1.095838e-05: 98,
+    1.096837e-05: 98,
+    1.097836e-05: 98,
+    1.098835e-05: 98,
+    1.099834e-05: 98,
+    1.100833e-05: 98,
+    1.101832e-05: 98,
+    1.102831e-05: 98,
+    1.103830e-05: 98,
+    1.104829e-05: 98,
+    1.105828e-05: 98,
+    1.106826e-05: 98,
+    1.107825e-05: 98,
+    1.108824e-05: 98,
+    1.109823e-05: 98,
+    1.110822e-05: 98,
+    1.111821e-05: 98,
+    1.112820e-05: 98,
+    1.113819e-05: 98,
+    1.114818e-05: 99,
+    1.115817e-05: 99,
+    1.116816e-05: 99,
+    1.117815e-05: 99,
+    1.118814e-05: 99,
+    1.119813e-05: 99,
+    1.120812e-05: 99,
+    1.121811e-05: 99,
+    1.122809e-05: 99,
+    1.123808e-05: 99,
+    1.124807e-05: 99,
+    1.125806e-05: 99,
+    1.126805e-05: 99,
+    1.127804e-05: 99,
+    1.129802e-05: 99,
+    1.130801e-05: 99,
+    1.131800e-05: 99,
+    1.132799e-05: 99,
+    1.133798e-05: 99,
+    1.134797e-05: 99,
+    1.135796e-05: 99,
+    1.136795e-05: 99,
+    1.137794e-05: 99,
+    1.138793e-05: 99,
+    1.139791e-05: 99,
+    1.140790e-05: 99,
+    1.141789e-05: 99,
+    1.142788e-05: 99,
+    1.143787e-05: 99,
+    1.144786e-05: 99,
+    1.145785e-05: 99,
+    1.146784e-05: 99,
+    1.147783e-05: 99,
+    1.148782e-05: 99,
+    1.149781e-05: 99,
+    1.150780e-05: 99,
+    1.151779e-05: 99,
+    1.152778e-05: 99,
+    1.153777e-05: 99,
+    1.154776e-05: 99,
+    1.155775e-05: 99,
+    1.156773e-05: 99,
+    1.157772e-05: 99,
+    1.158771e-05: 99,
+    1.159770e-05: 99,
+    1.160769e-05: 99,
+    1.161768e-05: 99,
+    1.162767e-05: 99,
+    1.163766e-05: 99,
+    1.164765e-05: 99,
+    1.165764e-05: 99,
+    1.166763e-05: 99,
+    1.167762e-05: 99,
+    1.168761e-05: 99,
+    1.169760e-05: 99,
+    1.170759e-05: 99,
+    1.171758e-05: 99,
+    1.172757e-05: 99,
+    1.173755e-05: 99,
+    1.174754e-05: 99,
+    1.175753e-05: 99,
+    1.176752e-05: 99,
+    1.178750e-05: 99,
+    1.179749e-05: 99,
+    1.180748e-05: 99,
+    1.181747e-05: 99,
+    1.182746e-05: 99,
+    1.183745e-05: 99,
+    1.184744e-05: 99,
+    1.185743e-05: 99,
+    1.186742e-05: 99,
+    1.187741e-05: 99,
+    1.188740e-05: 99,
+    1.189739e-05: 99,
+    1.190737e-05: 99,
+    1.191736e-05: 99,
+    1.192735e-05: 99,
+    1.193734e-05: 99,
+    1.194733e-05: 99,
+    1.195732e-05: 99,
+    1.196731e-05: 99,
+    1.197730e-05: 100,
+    1.198729e-05: 100,
+    1.199728e-05: 100,
+    1.200727e-05: 100,
+    1.201726e-05: 100,
+    1.202725e-05: 100,
+    1.203724e-05: 100,
+    1.204723e-05: 100,
+    1.205722e-05: 100,
+    1.206721e-05: 100,
+    1.207719e-05: 100,
+    1.208718e-05: 100,
+    1.209717e-05: 100,
+    1.210716e-05: 100,
+    1.212714e-05: 100,
+    1.213713e-05: 100,
+    1.214712e-05: 100,
+    1.215711e-05: 100,
+    1.216710e-05: 100,
+    1.217709e-05: 100,
+    1.218708e-05: 100,
+    1.219707e-05: 100,
+    1.220706e-05: 100,
+    1.221705e-05: 100,
+    1.222704e-05: 100,
+    1.223703e-05: 100,
+    1.224701e-05: 100,
+    1.225700e-05: 100,
+    1.226699e-05: 100,
+    1.227698e-05: 100,
+    1.228697e-05: 100,
+    1.229696e-05: 100,
+    1.230695e-05: 100,
+    1.231694e-05: 100,
+    1.232693e-05: 100,
+    1.233692e-05: 100,
+    1.234691e-05: 100,
+    1.235690e-05: 100,
+    1.236689e-05: 100,
+    1.237688e-05: 100,
+    1.238687e-05: 100,
+    1.239686e-05: 100,
+    1.240685e-05: 100,
+    1.241683e-05: 100,
+    1.242682e-05: 100,
+    1.243681e-05: 100,
+    1.244680e-05: 100,
+    1.245679e-05: 100,
+    1.246678e-05: 100,
+    1.247677e-05: 100,
+    1.248676e-05: 100,
+    1.249675e-05: 100,
+    1.250674e-05: 100,
+    1.251673e-05: 100,
+    1.252672e-05: 100,
+    1.253671e-05: 100,
+    1.254670e-05: 100,
+    1.255669e-05: 100,
+    1.256668e-05: 100,
+    1.257667e-05: 100,
+    1.258665e-05: 100,
+    1.259664e-05: 100,
+    1.260663e-05: 100,
+    1.261662e-05: 100,
+    1.262661e-05: 100,
+    1.263660e-05: 100,
+    1.264659e-05: 100,
+    1.265658e-05: 100,
+    1.266657e-05: 100,
+    1.267656e-05: 100,
+    1.268655e-05: 100,
+    1.269654e-05: 100,
+    1.270653e-05: 100,
+    1.271652e-05: 100,
+    1.272651e-05: 100,
+    1.273650e-05: 100,
+    1.274649e-05: 100,
+    1.275647e-05: 100,
+    1.276646e-05: 100,
+    1.277645e-05: 100,
+    1.278644e-05: 100,
+    1.279643e-05: 100,
+    1.280642e-05: 100,
+    1.281641e-05: 100,
+    1.282640e-05: 100,
+    1.283639e-05: 100,
+    1.284638e-05: 100,
+    1.285637e-05: 100,
+    1.286636e-05: 101,
+    1.287635e-05: 101,
+    1.288634e-05: 101,
+    1.289633e-05: 101,
+    1.290632e-05: 101,
+    1.291630e-05: 101,
+    1.292629e-05: 101,
+    1.293628e-05: 101,
+    1.294627e-05: 101,
+    1.295626e-05: 101,
+    1.296625e-05: 101,
+    1.297624e-05: 101,
+    1.298623e-05: 101,
+    1.299622e-05: 101,
+    1.300621e-05: 101,
+    1.301620e-05: 101,
+    1.302619e-05: 101,
+    1.303618e-05: 101,
+    1.304617e-05: 101,
+    1.305616e-05: 101,
+    1.306615e-05: 101,
+    1.307614e-05: 101,
+    1.308612e-05: 101,
+    1.309611e-05: 101,
+    1.310610e-05: 101,
+    1.311609e-05: 101,
+    1.312608e-05: 101,
+    1.313607e-05: 101,
+    1.314606e-05: 101,
+    1.315605e-05: 101,
+    1.316604e-05: 101,
+    1.317603e-05: 101,
+    1.318602e-05: 101,
+    1.319601e-05: 101,
+    1.320600e-05: 101,
+    1.321599e-05: 101,
+    1.322598e-05: 101,
+    1.323597e-05: 101,
+    1.324596e-05: 101,
+    1.325594e-05: 101,
+    1.326593e-05: 101,
+    1.327592e-05: 101,
+    1.328591e-05: 101,
+    1.329590e-05: 101,
+    1.330589e-05: 101,
+    1.331588e-05: 101,
+    1.332587e-05: 101,
+    1.333586e-05: 101,
+    1.335584e-05: 101,
+    1.336583e-05: 101,
+    1.337582e-05: 101,
+    1.338581e-05: 101,
+    1.339580e-05: 101,
+    1.340579e-05: 101,
+    1.341578e-05: 101,
+    1.342576e-05: 101,
+    1.343575e-05: 101,
+    1.344574e-05: 101,
+    1.346572e-05: 101,
+    1.347571e-05: 101,
+    1.349569e-05: 101,
+    1.351567e-05: 101,
+    1.352566e-05: 101,
+    1.353565e-05: 101,
+    1.354564e-05: 101,
+    1.355563e-05: 101,
+    1.356562e-05: 101,
+    1.357561e-05: 101,
+    1.358560e-05: 101,
+    1.359558e-05: 101,
+    1.360557e-05: 101,
+    1.361556e-05: 101,
+    1.362555e-05: 101,
+    1.363554e-05: 101,
+    1.364553e-05: 101,
+    1.365552e-05: 101,
+    1.366551e-05: 101,
+    1.367550e-05: 101,
+    1.368549e-05: 101,
+    1.369548e-05: 101,
+    1.370547e-05: 101,
+    1.371546e-05: 101,
+    1.372545e-05: 101,
+    1.373544e-05: 101,
+    1.374543e-05: 101,
+    1.375542e-05: 101,
+    1.376540e-05: 101,
+    1.377539e-05: 101,
+    1.378538e-05: 101,
+    1.379537e-05: 101,
+    1.380536e-05: 101,
+    1.381535e-05: 101,
+    1.382534e-05: 102,
+    1.383533e-05: 102,
+    1.384532e-05: 102,
+    1.385531e-05: 102,
+    1.386530e-05: 102,
+    1.388528e-05: 102,
+    1.389527e-05: 102,
+    1.391525e-05: 102,
+    1.393522e-05: 102,
+    1.394521e-05: 102,
+    1.395520e-05: 102,
+    1.396519e-05: 102,
+    1.397518e-05: 102,
+    1.398517e-05: 102,
+    1.399516e-05: 102,
+    1.400515e-05: 102,
+    1.401514e-05: 102,
+    1.402513e-05: 102,
+    1.403512e-05: 102,
+    1.404511e-05: 102,
+    1.405510e-05: 102,
+    1.406509e-05: 102,
+    1.407508e-05: 102,
+    1.408507e-05: 102,
+    1.410504e-05: 102,
+    1.411503e-05: 102,
+    1.412502e-05: 102,
+    1.413501e-05: 102,
+    1.414500e-05: 102,
+    1.416498e-05: 102,
+    1.417497e-05: 102,
+    1.418496e-05: 102,
+    1.419495e-05: 102,
+    1.420494e-05: 102,
+    1.421493e-05: 102,
+    1.422492e-05: 102,
+    1.423491e-05: 102,
+    1.424490e-05: 102,
+    1.425489e-05: 102,
+    1.426488e-05: 102,
+    1.427486e-05: 102,
+    1.428485e-05: 102,
+    1.429484e-05: 102,
+    1.430483e-05: 102,
+    1.431482e-05: 102,
+    1.432481e-05: 102,
+    1.434479e-05: 102,
+    1.435478e-05: 102,
+    1.436477e-05: 102,
+    1.437476e-05: 102,
+    1.438475e-05: 102,
+    1.439474e-05: 102,
+    1.440473e-05: 102,
+    1.441472e-05: 102,
+    1.442471e-05: 102,
+    1.444468e-05: 102,
+    1.445467e-05: 102,
+    1.446466e-05: 102,
+    1.447465e-05: 102,
+    1.448464e-05: 102,
+    1.449463e-05: 102,
+    1.450462e-05: 102,
+    1.451461e-05: 102,
+    1.452460e-05: 102,
+    1.453459e-05: 102,
+    1.454458e-05: 102,
+    1.455457e-05: 102,
+    1.456456e-05: 102,
+    1.457455e-05: 102,
+    1.458454e-05: 102,
+    1.459453e-05: 102,
+    1.460451e-05: 102,
+    1.461450e-05: 102,
+    1.462449e-05: 102,
+    1.463448e-05: 102,
+    1.464447e-05: 102,
+    1.465446e-05: 102,
+    1.467444e-05: 102,
+    1.468443e-05: 102,
+    1.469442e-05: 102,
+    1.470441e-05: 102,
+    1.471440e-05: 102,
+    1.472439e-05: 102,
+    1.473438e-05: 102,
+    1.474437e-05: 102,
+    1.475436e-05: 102,
+    1.476435e-05: 102,
+    1.477433e-05: 102,
+    1.478432e-05: 102,
+    1.479431e-05: 102,
+    1.480430e-05: 102,
+    1.481429e-05: 102,
+    1.482428e-05: 102,
+    1.483427e-05: 102,
+    1.484426e-05: 102,
+    1.485425e-05: 102,
+    1.486424e-05: 103,
+    1.488422e-05: 103,
+    1.489421e-05: 103,
+    1.490420e-05: 103,
+    1.491419e-05: 103,
+    1.492418e-05: 103,
+    1.493417e-05: 103,
+    1.494415e-05: 103,
+    1.496413e-05: 103,
+    1.497412e-05: 103,
+    1.498411e-05: 103,
+    1.499410e-05: 103,
+    1.500409e-05: 103,
+    1.501408e-05: 103,
+    1.502407e-05: 103,
+    1.503406e-05: 103,
+    1.505404e-05: 103,
+    1.506403e-05: 103,
+    1.507402e-05: 103,
+    1.508401e-05: 103,
+    1.509400e-05: 103,
+    1.510399e-05: 103,
+    1.511397e-05: 103,
+    1.512396e-05: 103,
+    1.513395e-05: 103,
+    1.514394e-05: 103,
+    1.515393e-05: 103,
+    1.516392e-05: 103,
+    1.517391e-05: 103,
+    1.518390e-05: 103,
+    1.519389e-05: 103,
+    1.520388e-05: 103,
+    1.521387e-05: 103,
+    1.522386e-05: 103,
+    1.523385e-05: 103,
+    1.524384e-05: 103,
+    1.525383e-05: 103,
+    1.526382e-05: 103,
+    1.528379e-05: 103,
+    1.529378e-05: 103,
+    1.530377e-05: 103,
+    1.531376e-05: 103,
+    1.532375e-05: 103,
+    1.533374e-05: 103,
+    1.534373e-05: 103,
+    1.535372e-05: 103,
+    1.536371e-05: 103,
+    1.537370e-05: 103,
+    1.538369e-05: 103,
+    1.539368e-05: 103,
+    1.540367e-05: 103,
+    1.541366e-05: 103,
+    1.542365e-05: 103,
+    1.543364e-05: 103,
+    1.544363e-05: 103,
+    1.545361e-05: 103,
+    1.546360e-05: 103,
+    1.547359e-05: 103,
+    1.549357e-05: 103,
+    1.550356e-05: 103,
+    1.551355e-05: 103,
+    1.552354e-05: 103,
+    1.553353e-05: 103,
+    1.555351e-05: 103,
+    1.556350e-05: 103,
+    1.557349e-05: 103,
+    1.558348e-05: 103,
+    1.559347e-05: 103,
+    1.560346e-05: 103,
+    1.561345e-05: 103,
+    1.562343e-05: 103,
+    1.563342e-05: 103,
+    1.564341e-05: 103,
+    1.565340e-05: 103,
+    1.566339e-05: 103,
+    1.567338e-05: 103,
+    1.569336e-05: 103,
+    1.570335e-05: 103,
+    1.571334e-05: 103,
+    1.572333e-05: 103,
+    1.573332e-05: 103,
+    1.574331e-05: 103,
+    1.575330e-05: 103,
+    1.576329e-05: 103,
+    1.577328e-05: 103,
+    1.578327e-05: 103,
+    1.579325e-05: 103,
+    1.580324e-05: 103,
+    1.581323e-05: 103,
+    1.582322e-05: 103,
+    1.584320e-05: 103,
+    1.585319e-05: 103,
+    1.586318e-05: 103,
+    1.587317e-05: 103,
+    1.589315e-05: 103,
+    1.590314e-05: 103,
+    1.591313e-05: 103,
+    1.592312e-05: 103,
+    1.593311e-05: 103,
+    1.594310e-05: 103,
+    1.595309e-05: 103,
+    1.597306e-05: 104,
+    1.598305e-05: 104,
+    1.599304e-05: 104,
+    1.600303e-05: 104,
+    1.601302e-05: 104,
+    1.602301e-05: 104,
+    1.603300e-05: 104,
+    1.604299e-05: 104,
+    1.605298e-05: 104,
+    1.606297e-05: 104,
+    1.607296e-05: 104,
+    1.608295e-05: 104,
+    1.609294e-05: 104,
+    1.610293e-05: 104,
+    1.611292e-05: 104,
+    1.612291e-05: 104,
+    1.613289e-05: 104,
+    1.614288e-05: 104,
+    1.615287e-05: 104,
+    1.617285e-05: 104,
+    1.618284e-05: 104,
+    1.619283e-05: 104,
+    1.621281e-05: 104,
+    1.622280e-05: 104,
+    1.623279e-05: 104,
+    1.624278e-05: 104,
+    1.625277e-05: 104,
+    1.626276e-05: 104,
+    1.627275e-05: 104,
+    1.628274e-05: 104,
+    1.629272e-05: 104,
+    1.630271e-05: 104,
+    1.631270e-05: 104,
+    1.632269e-05: 104,
+    1.633268e-05: 104,
+    1.634267e-05: 104,
+    1.635266e-05: 104,
+    1.636265e-05: 104,
+    1.637264e-05: 104,
+    1.638263e-05: 104,
+    1.639262e-05: 104,
+    1.640261e-05: 104,
+    1.641260e-05: 104,
+    1.642259e-05: 104,
+    1.643258e-05: 104,
+    1.644257e-05: 104,
+    1.645256e-05: 104,
+    1.646254e-05: 104,
+    1.647253e-05: 104,
+    1.649251e-05: 104,
+    1.650250e-05: 104,
+    1.651249e-05: 104,
+    1.652248e-05: 104,
+    1.653247e-05: 104,
+    1.654246e-05: 104,
+    1.656244e-05: 104,
+    1.657243e-05: 104,
+    1.658242e-05: 104,
+    1.659241e-05: 104,
+    1.660240e-05: 104,
+    1.661239e-05: 104,
+    1.662238e-05: 104,
+    1.663236e-05: 104,
+    1.664235e-05: 104,
+    1.665234e-05: 104,
+    1.666233e-05: 104,
+    1.667232e-05: 104,
+    1.668231e-05: 104,
+    1.669230e-05: 104,
+    1.670229e-05: 104,
+    1.671228e-05: 104,
+    1.672227e-05: 104,
+    1.673226e-05: 104,
+    1.674225e-05: 104,
+    1.675224e-05: 104,
+    1.676223e-05: 104,
+    1.677222e-05: 104,
+    1.678221e-05: 104,
+    1.679220e-05: 104,
+    1.681217e-05: 104,
+    1.683215e-05: 104,
+    1.684214e-05: 104,
+    1.685213e-05: 104,
+    1.688210e-05: 104,
+    1.689209e-05: 104,
+    1.690208e-05: 104,
+    1.691207e-05: 104,
+    1.692206e-05: 104,
+    1.693205e-05: 104,
+    1.694204e-05: 104,
+    1.695203e-05: 104,
+    1.696202e-05: 104,
+    1.697200e-05: 104,
+    1.698199e-05: 104,
+    1.699198e-05: 104,
+    1.700197e-05: 104,
+    1.701196e-05: 104,
+    1.702195e-05: 104,
+    1.703194e-05: 104,
+    1.704193e-05: 104,
+    1.705192e-05: 104,
+    1.706191e-05: 104,
+    1.707190e-05: 104,
+    1.708189e-05: 104,
+    1.709188e-05: 104,
+    1.710187e-05: 104,
+    1.711186e-05: 104,
+    1.713184e-05: 104,
+    1.714182e-05: 104,
+    1.715181e-05: 104,
+    1.717179e-05: 105,
+    1.718178e-05: 105,
+    1.719177e-05: 105,
+    1.720176e-05: 105,
+    1.721175e-05: 105,
+    1.722174e-05: 105,
+    1.723173e-05: 105,
+    1.724172e-05: 105,
+    1.725171e-05: 105,
+    1.726170e-05: 105,
+    1.727169e-05: 105,
+    1.728168e-05: 105,
+    1.729167e-05: 105,
+    1.730166e-05: 105,
+    1.731164e-05: 105,
+    1.732163e-05: 105,
+    1.733162e-05: 105,
+    1.734161e-05: 105,
+    1.735160e-05: 105,
+    1.736159e-05: 105,
+    1.737158e-05: 105,
+    1.738157e-05: 105,
+    1.740155e-05: 105,
+    1.741154e-05: 105,
+    1.742153e-05: 105,
+    1.743152e-05: 105,
+    1.744151e-05: 105,
+    1.745150e-05: 105,
+    1.746149e-05: 105,
+    1.747148e-05: 105,
+    1.748146e-05: 105,
+    1.749145e-05: 105,
+    1.750144e-05: 105,
+    1.751143e-05: 105,
+    1.752142e-05: 105,
+    1.753141e-05: 105,
+    1.754140e-05: 105,
+    1.755139e-05: 105,
+    1.756138e-05: 105,
+    1.757137e-05: 105,
+    1.758136e-05: 105,
+    1.759135e-05: 105,
+    1.760134e-05: 105,
+    1.761133e-05: 105,
+    1.762132e-05: 105,
+    1.763131e-05: 105,
+    1.764130e-05: 105,
+    1.766127e-05: 105,
+    1.767126e-05: 105,
+    1.768125e-05: 105,
+    1.769124e-05: 105,
+    1.770123e-05: 105,
+    1.771122e-05: 105,
+    1.772121e-05: 105,
+    1.773120e-05: 105,
+    1.774119e-05: 105,
+    1.776117e-05: 105,
+    1.777116e-05: 105,
+    1.778115e-05: 105,
+    1.779114e-05: 105,
+    1.780113e-05: 105,
+    1.781112e-05: 105,
+    1.782110e-05: 105,
+    1.783109e-05: 105,
+    1.784108e-05: 105,
+    1.785107e-05: 105,
+    1.786106e-05: 105,
+    1.787105e-05: 105,
+    1.788104e-05: 105,
+    1.789103e-05: 105,
+    1.790102e-05: 105,
+    1.791101e-05: 105,
+    1.792100e-05: 105,
+    1.794098e-05: 105,
+    1.795097e-05: 105,
+    1.796096e-05: 105,
+    1.798093e-05: 105,
+    1.799092e-05: 105,
+    1.800091e-05: 105,
+    1.801090e-05: 105,
+    1.802089e-05: 105,
+    1.803088e-05: 105,
+    1.804087e-05: 105,
+    1.805086e-05: 105,
+    1.807084e-05: 105,
+    1.808083e-05: 105,
+    1.810081e-05: 105,
+    1.811080e-05: 105,
+    1.812079e-05: 105,
+    1.813078e-05: 105,
+    1.814077e-05: 105,
+    1.816074e-05: 105,
+    1.817073e-05: 105,
+    1.819071e-05: 105,
+    1.820070e-05: 105,
+    1.821069e-05: 105,
+    1.822068e-05: 105,
+    1.823067e-05: 105,
+    1.824066e-05: 105,
+    1.825065e-05: 105,
+    1.826064e-05: 105,
+    1.827063e-05: 105,
+    1.828062e-05: 105,
+    1.829061e-05: 105,
+    1.831059e-05: 105,
+    1.833056e-05: 105,
+    1.834055e-05: 105,
+    1.835054e-05: 105,
+    1.836053e-05: 105,
+    1.837052e-05: 105,
+    1.838051e-05: 105,
+    1.839050e-05: 105,
+    1.840049e-05: 105,
+    1.841048e-05: 105,
+    1.844045e-05: 106,
+    1.846043e-05: 106,
+    1.848041e-05: 106,
+    1.849039e-05: 106,
+    1.850038e-05: 106,
+    1.851037e-05: 106,
+    1.852036e-05: 106,
+    1.853035e-05: 106,
+    1.854034e-05: 106,
+    1.855033e-05: 106,
+    1.856032e-05: 106,
+    1.857031e-05: 106,
+    1.858030e-05: 106,
+    1.859029e-05: 106,
+    1.860028e-05: 106,
+    1.861027e-05: 106,
+    1.862026e-05: 106,
+    1.863025e-05: 106,
+    1.864024e-05: 106,
+    1.865023e-05: 106,
+    1.866021e-05: 106,
+    1.867020e-05: 106,
+    1.868019e-05: 106,
+    1.869018e-05: 106,
+    1.871016e-05: 106,
+    1.872015e-05: 106,
+    1.873014e-05: 106,
+    1.874013e-05: 106,
+    1.876011e-05: 106,
+    1.877010e-05: 106,
+    1.878009e-05: 106,
+    1.880007e-05: 106,
+    1.881006e-05: 106,
+    1.882005e-05: 106,
+    1.883003e-05: 106,
+    1.884002e-05: 106,
+    1.886000e-05: 106,
+    1.886999e-05: 106,
+    1.887998e-05: 106,
+    1.888997e-05: 106,
+    1.889996e-05: 106,
+    1.890995e-05: 106,
+    1.891994e-05: 106,
+    1.892993e-05: 106,
+    1.893992e-05: 106,
+    1.894991e-05: 106,
+    1.895990e-05: 106,
+    1.896989e-05: 106,
+    1.897988e-05: 106,
+    1.898987e-05: 106,
+    1.899985e-05: 106,
+    1.900984e-05: 106,
+    1.901983e-05: 106,
+    1.902982e-05: 106,
+    1.904980e-05: 106,
+    1.905979e-05: 106,
+    1.906978e-05: 106,
+    1.907977e-05: 106,
+    1.909975e-05: 106,
+    1.910974e-05: 106,
+    1.911973e-05: 106,
+    1.912972e-05: 106,
+    1.913971e-05: 106,
+    1.915969e-05: 106,
+    1.916967e-05: 106,
+    1.917966e-05: 106,
+    1.918965e-05: 106,
+    1.919964e-05: 106,
+    1.921962e-05: 106,
+    1.922961e-05: 106,
+    1.925958e-05: 106,
+    1.926957e-05: 106,
+    1.927956e-05: 106,
+    1.928955e-05: 106,
+    1.929954e-05: 106,
+    1.930953e-05: 106,
+    1.931952e-05: 106,
+    1.932951e-05: 106,
+    1.933949e-05: 106,
+    1.934948e-05: 106,
+    1.937945e-05: 106,
+    1.938944e-05: 106,
+    1.939943e-05: 106,
+    1.941941e-05: 106,
+    1.942940e-05: 106,
+    1.943939e-05: 106,
+    1.945937e-05: 106,
+    1.947935e-05: 106,
+    1.948934e-05: 106,
+    1.949933e-05: 106,
+    1.951930e-05: 106,
+    1.952929e-05: 106,
+    1.953928e-05: 106,
+    1.954927e-05: 106,
+    1.955926e-05: 106,
+    1.956925e-05: 106,
+    1.957924e-05: 106,
+    1.958923e-05: 106,
+    1.959922e-05: 106,
+    1.960921e-05: 106,
+    1.961920e-05: 106,
+    1.962919e-05: 106,
+    1.963918e-05: 106,
+    1.964917e-05: 106,
+    1.965916e-05: 106,
+    1.966915e-05: 106,
+    1.967913e-05: 106,
+    1.968912e-05: 106,
+    1.969911e-05: 106,
+    1.970910e-05: 106,
+    1.972908e-05: 106,
+    1.973907e-05: 106,
+    1.974906e-05: 106,
+    1.975905e-05: 106,
+    1.976904e-05: 106,
+    1.977903e-05: 106,
+    1.978902e-05: 106,
+    1.979901e-05: 106,
+    1.980900e-05: 106,
+    1.981899e-05: 107,
+    1.982898e-05: 107,
+    1.983896e-05: 107,
+    1.984895e-05: 107,
+    1.985894e-05: 107,
+    1.986893e-05: 107,
+    1.987892e-05: 107,
+    1.988891e-05: 107,
+    1.989890e-05: 107,
+    1.990889e-05: 107,
+    1.991888e-05: 107,
+    1.992887e-05: 107,
+    1.994885e-05: 107,
+    1.995884e-05: 107,
+    1.996883e-05: 107,
+    1.997882e-05: 107,
+    1.998881e-05: 107,
+    1.999880e-05: 107,
+    2.000878e-05: 107,
+    2.001877e-05: 107,
+    2.002876e-05: 107,
+    2.003875e-05: 107,
+    2.004874e-05: 107,
+    2.005873e-05: 107,
+    2.006872e-05: 107,
+    2.007871e-05: 107,
+    2.008870e-05: 107,
+    2.009869e-05: 107,
+    2.011867e-05: 107,
+    2.012866e-05: 107,
+    2.013865e-05: 107,
+    2.015863e-05: 107,
+    2.016862e-05: 107,
+    2.017860e-05: 107,
+    2.019858e-05: 107,
+    2.020857e-05: 107,
+    2.021856e-05: 107,
+    2.022855e-05: 107,
+    2.023854e-05: 107,
+    2.024853e-05: 107,
+    2.026851e-05: 107,
+    2.030847e-05: 107,
+    2.032845e-05: 107,
+    2.034842e-05: 107,
+    2.035841e-05: 107,
+    2.036840e-05: 107,
+    2.039837e-05: 107,
+    2.040836e-05: 107,
+    2.042834e-05: 107,
+    2.043833e-05: 107,
+    2.045831e-05: 107,
+    2.046830e-05: 107,
+    2.047829e-05: 107,
+    2.048828e-05: 107,
+    2.049827e-05: 107,
+    2.051824e-05: 107,
+    2.053822e-05: 107,
+    2.054821e-05: 107,
+    2.056819e-05: 107,
+    2.057818e-05: 107,
+    2.058817e-05: 107,
+    2.059816e-05: 107,
+    2.060815e-05: 107,
+    2.061814e-05: 107,
+    2.062813e-05: 107,
+    2.063812e-05: 107,
+    2.065810e-05: 107,
+    2.066809e-05: 107,
+    2.067808e-05: 107,
+    2.068806e-05: 107,
+    2.071803e-05: 107,
+    2.072802e-05: 107,
+    2.073801e-05: 107,
+    2.074800e-05: 107,
+    2.075799e-05: 107,
+    2.076798e-05: 107,
+    2.077797e-05: 107,
+    2.078796e-05: 107,
+    2.079795e-05: 107,
+    2.081793e-05: 107,
+    2.082792e-05: 107,
+    2.084790e-05: 107,
+    2.085788e-05: 107,
+    2.086787e-05: 107,
+    2.087786e-05: 107,
+    2.088785e-05: 107,
+    2.089784e-05: 107,
+    2.091782e-05: 107,
+    2.092781e-05: 107,
+    2.093780e-05: 107,
+    2.095778e-05: 107,
+    2.096777e-05: 107,
+    2.097776e-05: 107,
+    2.098775e-05: 107,
+    2.099774e-05: 107,
+    2.100773e-05: 107,
+    2.101772e-05: 107,
+    2.102770e-05: 107,
+    2.103769e-05: 107,
+    2.104768e-05: 107,
+    2.105767e-05: 107,
+    2.106766e-05: 107,
+    2.107765e-05: 107,
+    2.108764e-05: 107,
+    2.109763e-05: 107,
+    2.110762e-05: 107,
+    2.112760e-05: 107,
+    2.114758e-05: 107,
+    2.115757e-05: 107,
+    2.116756e-05: 107,
+    2.118754e-05: 107,
+    2.119752e-05: 107,
+    2.120751e-05: 107,
+    2.121750e-05: 107,
+    2.122749e-05: 107,
+    2.123748e-05: 107,
+    2.124747e-05: 107,
+    2.125746e-05: 107,
+    2.126745e-05: 107,
+    2.127744e-05: 107,
+    2.128743e-05: 107,
+    2.129742e-05: 108,
+    2.130741e-05: 108,
+    2.132739e-05: 108,
+    2.133738e-05: 108,
+    2.134737e-05: 108,
+    2.137733e-05: 108,
+    2.138732e-05: 108,
+    2.140730e-05: 108,
+    2.141729e-05: 108,
+    2.144726e-05: 108,
+    2.145725e-05: 108,
+    2.146724e-05: 108,
+    2.147723e-05: 108,
+    2.148722e-05: 108,
+    2.150720e-05: 108,
+    2.151719e-05: 108,
+    2.152717e-05: 108,
+    2.154715e-05: 108,
+    2.155714e-05: 108,
+    2.156713e-05: 108,
+    2.157712e-05: 108,
+    2.158711e-05: 108,
+    2.159710e-05: 108,
+    2.160709e-05: 108,
+    2.161708e-05: 108,
+    2.162707e-05: 108,
+    2.163706e-05: 108,
+    2.164705e-05: 108,
+    2.165704e-05: 108,
+    2.166703e-05: 108,
+    2.167702e-05: 108,
+    2.170698e-05: 108,
+    2.172696e-05: 108,
+    2.173695e-05: 108,
+    2.174694e-05: 108,
+    2.175693e-05: 108,
+    2.176692e-05: 108,
+    2.177691e-05: 108,
+    2.179689e-05: 108,
+    2.180688e-05: 108,
+    2.181687e-05: 108,
+    2.184684e-05: 108,
+    2.185683e-05: 108,
+    2.186681e-05: 108,
+    2.187680e-05: 108,
+    2.188679e-05: 108,
+    2.190677e-05: 108,
+    2.191676e-05: 108,
+    2.193674e-05: 108,
+    2.194673e-05: 108,
+    2.195672e-05: 108,
+    2.197670e-05: 108,
+    2.198669e-05: 108,
+    2.199668e-05: 108,
+    2.200667e-05: 108,
+    2.201666e-05: 108,
+    2.202665e-05: 108,
+    2.203663e-05: 108,
+    2.204662e-05: 108,
+    2.206660e-05: 108,
+    2.207659e-05: 108,
+    2.208658e-05: 108,
+    2.209657e-05: 108,
+    2.211655e-05: 108,
+    2.212654e-05: 108,
+    2.213653e-05: 108,
+    2.215651e-05: 108,
+    2.216650e-05: 108,
+    2.217649e-05: 108,
+    2.218648e-05: 108,
+    2.220645e-05: 108,
+    2.221644e-05: 108,
+    2.223642e-05: 108,
+    2.224641e-05: 108,
+    2.225640e-05: 108,
+    2.228637e-05: 108,
+    2.229636e-05: 108,
+    2.230635e-05: 108,
+    2.231634e-05: 108,
+    2.232633e-05: 108,
+    2.234631e-05: 108,
+    2.237627e-05: 108,
+    2.238626e-05: 108,
+    2.239625e-05: 108,
+    2.240624e-05: 108,
+    2.242622e-05: 108,
+    2.244620e-05: 108,
+    2.246618e-05: 108,
+    2.247617e-05: 108,
+    2.250614e-05: 108,
+    2.251613e-05: 108,
+    2.252612e-05: 108,
+    2.253611e-05: 108,
+    2.255608e-05: 108,
+    2.256607e-05: 108,
+    2.257606e-05: 108,
+    2.259604e-05: 108,
+    2.260603e-05: 108,
+    2.261602e-05: 108,
+    2.262601e-05: 108,
+    2.263600e-05: 108,
+    2.265598e-05: 108,
+    2.266597e-05: 108,
+    2.268595e-05: 108,
+    2.269594e-05: 108,
+    2.270593e-05: 108,
+    2.271591e-05: 108,
+    2.272590e-05: 108,
+    2.273589e-05: 108,
+    2.274588e-05: 108,
+    2.275587e-05: 108,
+    2.277585e-05: 108,
+    2.279583e-05: 108,
+    2.280582e-05: 108,
+    2.281581e-05: 108,
+    2.282580e-05: 108,
+    2.283579e-05: 108,
+    2.285577e-05: 108,
+    2.287575e-05: 109,
+    2.288573e-05: 109,
+    2.289572e-05: 109,
+    2.290571e-05: 109,
+    2.291570e-05: 109,
+    2.292569e-05: 109,
+    2.293568e-05: 109,
+    2.294567e-05: 109,
+    2.295566e-05: 109,
+    2.296565e-05: 109,
+    2.297564e-05: 109,
+    2.298563e-05: 109,
+    2.300561e-05: 109,
+    2.301560e-05: 109,
+    2.302559e-05: 109,
+    2.303558e-05: 109,
+    2.304557e-05: 109,
+    2.307553e-05: 109,
+    2.308552e-05: 109,
+    2.309551e-05: 109,
+    2.310550e-05: 109,
+    2.313547e-05: 109,
+    2.314546e-05: 109,
+    2.316544e-05: 109,
+    2.317543e-05: 109,
+    2.318542e-05: 109,
+    2.320540e-05: 109,
+    2.321538e-05: 109,
+    2.322537e-05: 109,
+    2.323536e-05: 109,
+    2.324535e-05: 109,
+    2.325534e-05: 109,
+    2.326533e-05: 109,
+    2.327532e-05: 109,
+    2.328531e-05: 109,
+    2.330529e-05: 109,
+    2.331528e-05: 109,
+    2.332527e-05: 109,
+    2.333526e-05: 109,
+    2.334525e-05: 109,
+    2.335524e-05: 109,
+    2.336523e-05: 109,
+    2.337522e-05: 109,
+    2.338520e-05: 109,
+    2.340518e-05: 109,
+    2.341517e-05: 109,
+    2.342516e-05: 109,
+    2.343515e-05: 109,
+    2.344514e-05: 109,
+    2.345513e-05: 109,
+    2.346512e-05: 109,
+    2.347511e-05: 109,
+    2.348510e-05: 109,
+    2.349509e-05: 109,
+    2.350508e-05: 109,
+    2.351507e-05: 109,
+    2.352506e-05: 109,
+    2.353505e-05: 109,
+    2.354504e-05: 109,
+    2.357500e-05: 109,
+    2.358499e-05: 109,
+    2.359498e-05: 109,
+    2.360497e-05: 109,
+    2.362495e-05: 109,
+    2.365492e-05: 109,
+    2.366491e-05: 109,
+    2.367490e-05: 109,
+    2.368489e-05: 109,
+    2.369488e-05: 109,
+    2.370487e-05: 109,
+    2.371486e-05: 109,
+    2.374482e-05: 109,
+    2.375481e-05: 109,
+    2.379477e-05: 109,
+    2.380476e-05: 109,
+    2.381475e-05: 109,
+    2.384472e-05: 109,
+    2.385471e-05: 109,
+    2.388468e-05: 109,
+    2.389466e-05: 109,
+    2.390465e-05: 109,
+    2.395460e-05: 109,
+    2.396459e-05: 109,
+    2.399456e-05: 109,
+    2.401454e-05: 109,
+    2.402453e-05: 109,
+    2.404451e-05: 109,
+    2.405450e-05: 109,
+    2.406448e-05: 109,
+    2.407447e-05: 109,
+    2.408446e-05: 109,
+    2.409445e-05: 109,
+    2.411443e-05: 109,
+    2.412442e-05: 109,
+    2.415439e-05: 109,
+    2.416438e-05: 109,
+    2.419435e-05: 109,
+    2.420434e-05: 109,
+    2.421433e-05: 109,
+    2.423430e-05: 109,
+    2.424429e-05: 109,
+    2.425428e-05: 109,
+    2.426427e-05: 109,
+    2.428425e-05: 109,
+    2.429424e-05: 109,
+    2.430423e-05: 109,
+    2.431422e-05: 109,
+    2.432421e-05: 109,
+    2.433420e-05: 109,
+    2.435418e-05: 109,
+    2.437416e-05: 109,
+    2.438415e-05: 109,
+    2.439414e-05: 109,
+    2.440412e-05: 109,
+    2.444408e-05: 109,
+    2.445407e-05: 109,
+    2.446406e-05: 109,
+    2.448404e-05: 109,
+    2.450402e-05: 109,
+    2.453399e-05: 109,
+    2.456396e-05: 109,
+    2.457394e-05: 109,
+    2.458393e-05: 110,
+    2.460391e-05: 110,
+    2.461390e-05: 110,
+    2.462389e-05: 110,
+    2.463388e-05: 110,
+    2.465386e-05: 110,
+    2.466385e-05: 110,
+    2.467384e-05: 110,
+    2.468383e-05: 110,
+    2.469382e-05: 110,
+    2.470381e-05: 110,
+    2.471380e-05: 110,
+    2.472379e-05: 110,
+    2.473378e-05: 110,
+    2.474376e-05: 110,
+    2.476374e-05: 110,
+    2.477373e-05: 110,
+    2.479371e-05: 110,
+    2.481369e-05: 110,
+    2.482368e-05: 110,
+    2.486364e-05: 110,
+    2.490359e-05: 110,
+    2.491358e-05: 110,
+    2.492357e-05: 110,
+    2.493356e-05: 110,
+    2.495354e-05: 110,
+    2.497352e-05: 110,
+    2.498351e-05: 110,
+    2.499350e-05: 110,
+    2.501348e-05: 110,
+    2.502347e-05: 110,
+    2.503346e-05: 110,
+    2.504345e-05: 110,
+    2.506343e-05: 110,
+    2.507341e-05: 110,
+    2.508340e-05: 110,
+    2.510338e-05: 110,
+    2.513335e-05: 110,
+    2.515333e-05: 110,
+    2.516332e-05: 110,
+    2.517331e-05: 110,
+    2.518330e-05: 110,
+    2.519329e-05: 110,
+    2.522326e-05: 110,
+    2.525322e-05: 110,
+    2.526321e-05: 110,
+    2.528319e-05: 110,
+    2.531316e-05: 110,
+    2.533314e-05: 110,
+    2.534313e-05: 110,
+    2.535312e-05: 110,
+    2.536311e-05: 110,
+    2.538309e-05: 110,
+    2.540307e-05: 110,
+    2.542304e-05: 110,
+    2.543303e-05: 110,
+    2.544302e-05: 110,
+    2.545301e-05: 110,
+    2.548298e-05: 110,
+    2.549297e-05: 110,
+    2.550296e-05: 110,
+    2.552294e-05: 110,
+    2.554292e-05: 110,
+    2.555291e-05: 110,
+    2.556290e-05: 110,
+    2.557289e-05: 110,
+    2.558287e-05: 110,
+    2.559286e-05: 110,
+    2.560285e-05: 110,
+    2.561284e-05: 110,
+    2.562283e-05: 110,
+    2.563282e-05: 110,
+    2.564281e-05: 110,
+    2.565280e-05: 110,
+    2.566279e-05: 110,
+    2.569276e-05: 110,
+    2.570275e-05: 110,
+    2.573272e-05: 110,
+    2.575269e-05: 110,
+    2.576268e-05: 110,
+    2.578266e-05: 110,
+    2.579265e-05: 110,
+    2.580264e-05: 110,
+    2.582262e-05: 110,
+    2.583261e-05: 110,
+    2.585259e-05: 110,
+    2.586258e-05: 110,
+    2.587257e-05: 110,
+    2.588256e-05: 110,
+    2.589255e-05: 110,
+    2.591253e-05: 110,
+    2.593250e-05: 110,
+    2.596247e-05: 110,
+    2.598245e-05: 110,
+    2.599244e-05: 110,
+    2.604239e-05: 110,
+    2.605238e-05: 110,
+    2.606237e-05: 110,
+    2.610232e-05: 110,
+    2.612230e-05: 110,
+    2.613229e-05: 110,
+    2.615227e-05: 110,
+    2.617225e-05: 110,
+    2.620222e-05: 110,
+    2.621221e-05: 110,
+    2.622220e-05: 110,
+    2.625217e-05: 110,
+    2.627214e-05: 110,
+    2.630211e-05: 110,
+    2.632209e-05: 110,
+    2.633208e-05: 110,
+    2.634207e-05: 110,
+    2.635206e-05: 110,
+    2.636205e-05: 110,
+    2.637204e-05: 110,
+    2.639202e-05: 110,
+    2.640201e-05: 110,
+    2.641200e-05: 110,
+    2.642199e-05: 111,
+    2.645195e-05: 111,
+    2.646194e-05: 111,
+    2.647193e-05: 111,
+    2.648192e-05: 111,
+    2.649191e-05: 111,
+    2.650190e-05: 111,
+    2.651189e-05: 111,
+    2.653187e-05: 111,
+    2.654186e-05: 111,
+    2.655185e-05: 111,
+    2.656184e-05: 111,
+    2.657183e-05: 111,
+    2.659180e-05: 111,
+    2.660179e-05: 111,
+    2.662177e-05: 111,
+    2.664175e-05: 111,
+    2.665174e-05: 111,
+    2.667172e-05: 111,
+    2.671168e-05: 111,
+    2.672167e-05: 111,
+    2.673166e-05: 111,
+    2.675164e-05: 111,
+    2.676162e-05: 111,
+    2.677161e-05: 111,
+    2.680158e-05: 111,
+    2.681157e-05: 111,
+    2.682156e-05: 111,
+    2.683155e-05: 111,
+    2.684154e-05: 111,
+    2.690148e-05: 111,
+    2.691147e-05: 111,
+    2.692146e-05: 111,
+    2.693144e-05: 111,
+    2.696141e-05: 111,
+    2.697140e-05: 111,
+    2.699138e-05: 111,
+    2.701136e-05: 111,
+    2.702135e-05: 111,
+    2.703134e-05: 111,
+    2.705132e-05: 111,
+    2.706131e-05: 111,
+    2.707130e-05: 111,
+    2.710126e-05: 111,
+    2.711125e-05: 111,
+    2.712124e-05: 111,
+    2.714122e-05: 111,
+    2.715121e-05: 111,
+    2.716120e-05: 111,
+    2.717119e-05: 111,
+    2.719117e-05: 111,
+    2.720116e-05: 111,
+    2.721115e-05: 111,
+    2.724112e-05: 111,
+    2.725111e-05: 111,
+    2.726110e-05: 111,
+    2.727108e-05: 111,
+    2.728107e-05: 111,
+    2.732103e-05: 111,
+    2.734101e-05: 111,
+    2.735100e-05: 111,
+    2.737098e-05: 111,
+    2.742093e-05: 111,
+    2.743092e-05: 111,
+    2.744090e-05: 111,
+    2.749085e-05: 111,
+    2.753081e-05: 111,
+    2.755079e-05: 111,
+    2.756078e-05: 111,
+    2.757077e-05: 111,
+    2.765068e-05: 111,
+    2.767066e-05: 111,
+    2.768065e-05: 111,
+    2.772061e-05: 111,
+    2.773060e-05: 111,
+    2.775058e-05: 111,
+    2.778054e-05: 111,
+    2.780052e-05: 111,
+    2.781051e-05: 111,
+    2.782050e-05: 111,
+    2.784048e-05: 111,
+    2.785047e-05: 111,
+    2.786046e-05: 111,
+    2.788044e-05: 111,
+    2.789043e-05: 111,
+    2.792040e-05: 111,
+    2.794038e-05: 111,
+    2.796035e-05: 111,
+    2.798033e-05: 111,
+    2.799032e-05: 111,
+    2.800031e-05: 111,
+    2.802029e-05: 111,
+    2.804027e-05: 111,
+    2.808023e-05: 111,
+    2.810021e-05: 111,
+    2.811020e-05: 111,
+    2.812018e-05: 111,
+    2.813017e-05: 111,
+    2.814016e-05: 111,
+    2.816014e-05: 111,
+    2.819011e-05: 111,
+    2.820010e-05: 111,
+    2.822008e-05: 111,
+    2.824006e-05: 111,
+    2.825005e-05: 111,
+    2.827003e-05: 111,
+    2.828001e-05: 111,
+    2.829000e-05: 111,
+    2.829999e-05: 111,
+    2.830998e-05: 111,
+    2.832996e-05: 111,
+    2.833995e-05: 111,
+    2.834994e-05: 111,
+    2.836992e-05: 111,
+    2.837991e-05: 111,
+    2.838990e-05: 112,
+    2.839989e-05: 112,
+    2.840988e-05: 112,
+    2.841987e-05: 112,
+    2.842986e-05: 112,
+    2.844983e-05: 112,
+    2.845982e-05: 112,
+    2.846981e-05: 112,
+    2.848979e-05: 112,
+    2.849978e-05: 112,
+    2.851976e-05: 112,
+    2.852975e-05: 112,
+    2.853974e-05: 112,
+    2.854973e-05: 112,
+    2.855972e-05: 112,
+    2.859968e-05: 112,
+    2.860967e-05: 112,
+    2.861965e-05: 112,
+    2.862964e-05: 112,
+    2.863963e-05: 112,
+    2.864962e-05: 112,
+    2.865961e-05: 112,
+    2.867959e-05: 112,
+    2.868958e-05: 112,
+    2.872954e-05: 112,
+    2.875951e-05: 112,
+    2.877949e-05: 112,
+    2.878947e-05: 112,
+    2.879946e-05: 112,
+    2.880945e-05: 112,
+    2.882943e-05: 112,
+    2.888937e-05: 112,
+    2.889936e-05: 112,
+    2.893932e-05: 112,
+    2.894931e-05: 112,
+    2.896928e-05: 112,
+    2.897927e-05: 112,
+    2.898926e-05: 112,
+    2.901923e-05: 112,
+    2.902922e-05: 112,
+    2.906918e-05: 112,
+    2.907917e-05: 112,
+    2.908916e-05: 112,
+    2.909915e-05: 112,
+    2.910914e-05: 112,
+    2.912911e-05: 112,
+    2.914909e-05: 112,
+    2.916907e-05: 112,
+    2.917906e-05: 112,
+    2.918905e-05: 112,
+    2.919904e-05: 112,
+    2.920903e-05: 112,
+    2.921902e-05: 112,
+    2.924899e-05: 112,
+    2.925898e-05: 112,
+    2.926897e-05: 112,
+    2.927896e-05: 112,
+    2.928895e-05: 112,
+    2.932890e-05: 112,
+    2.933889e-05: 112,
+    2.934888e-05: 112,
+    2.936886e-05: 112,
+    2.937885e-05: 112,
+    2.942880e-05: 112,
+    2.944878e-05: 112,
+    2.947874e-05: 112,
+    2.950871e-05: 112,
+    2.952869e-05: 112,
+    2.954867e-05: 112,
+    2.956865e-05: 112,
+    2.957864e-05: 112,
+    2.958863e-05: 112,
+    2.961860e-05: 112,
+    2.962859e-05: 112,
+    2.966854e-05: 112,
+    2.968852e-05: 112,
+    2.969851e-05: 112,
+    2.970850e-05: 112,
+    2.973847e-05: 112,
+    2.974846e-05: 112,
+    2.976844e-05: 112,
+    2.977843e-05: 112,
+    2.978842e-05: 112,
+    2.982837e-05: 112,
+    2.983836e-05: 112,
+    2.985834e-05: 112,
+    2.986833e-05: 112,
+    2.989830e-05: 112,
+    2.990829e-05: 112,
+    2.992827e-05: 112,
+    2.993826e-05: 112,
+    2.994825e-05: 112,
+    2.996822e-05: 112,
+    3.000818e-05: 112,
+    3.001817e-05: 112,
+    3.002816e-05: 112,
+    3.004814e-05: 112,
+    3.005813e-05: 112,
+    3.006812e-05: 112,
+    3.007811e-05: 112,
+    3.010808e-05: 112,
+    3.011807e-05: 112,
+    3.012806e-05: 112,
+    3.013804e-05: 112,
+    3.014803e-05: 112,
+    3.016801e-05: 112,
+    3.019798e-05: 112,
+    3.021796e-05: 112,
+    3.022795e-05: 112,
+    3.023794e-05: 112,
+    3.026791e-05: 112,
+    3.027790e-05: 112,
+    3.028789e-05: 112,
+    3.030786e-05: 112,
+    3.031785e-05: 112,
+    3.034782e-05: 112,
+    3.035781e-05: 112,
+    3.039777e-05: 112,
+    3.040776e-05: 112,
+    3.043773e-05: 112,
+    3.044772e-05: 112,
+    3.045771e-05: 112,
+    3.046770e-05: 112,
+    3.048767e-05: 112,
+    3.050765e-05: 113,
+    3.052763e-05: 113,
+    3.054761e-05: 113,
+    3.057758e-05: 113,
+    3.059756e-05: 113,
+    3.060755e-05: 113,
+    3.062753e-05: 113,
+    3.064750e-05: 113,
+    3.068746e-05: 113,
+    3.069745e-05: 113,
+    3.071743e-05: 113,
+    3.076738e-05: 113,
+    3.078736e-05: 113,
+    3.079735e-05: 113,
+    3.083730e-05: 113,
+    3.086727e-05: 113,
+    3.089724e-05: 113,
+    3.090723e-05: 113,
+    3.091722e-05: 113,
+    3.093720e-05: 113,
+    3.094719e-05: 113,
+    3.095718e-05: 113,
+    3.096717e-05: 113,
+    3.097716e-05: 113,
+    3.098714e-05: 113,
+    3.101711e-05: 113,
+    3.105707e-05: 113,
+    3.106706e-05: 113,
+    3.107705e-05: 113,
+    3.109703e-05: 113,
+    3.112700e-05: 113,
+    3.113699e-05: 113,
+    3.114698e-05: 113,
+    3.116695e-05: 113,
+    3.117694e-05: 113,
+    3.122689e-05: 113,
+    3.123688e-05: 113,
+    3.124687e-05: 113,
+    3.125686e-05: 113,
+    3.126685e-05: 113,
+    3.128683e-05: 113,
+    3.129682e-05: 113,
+    3.130681e-05: 113,
+    3.131680e-05: 113,
+    3.133677e-05: 113,
+    3.135675e-05: 113,
+    3.136674e-05: 113,
+    3.137673e-05: 113,
+    3.140670e-05: 113,
+    3.141669e-05: 113,
+    3.143667e-05: 113,
+    3.144666e-05: 113,
+    3.146664e-05: 113,
+    3.148662e-05: 113,
+    3.150659e-05: 113,
+    3.151658e-05: 113,
+    3.152657e-05: 113,
+    3.155654e-05: 113,
+    3.156653e-05: 113,
+    3.158651e-05: 113,
+    3.160649e-05: 113,
+    3.162647e-05: 113,
+    3.163646e-05: 113,
+    3.164645e-05: 113,
+    3.166642e-05: 113,
+    3.168640e-05: 113,
+    3.169639e-05: 113,
+    3.171637e-05: 113,
+    3.172636e-05: 113,
+    3.173635e-05: 113,
+    3.174634e-05: 113,
+    3.175633e-05: 113,
+    3.177631e-05: 113,
+    3.179629e-05: 113,
+    3.180628e-05: 113,
+    3.181627e-05: 113,
+    3.182625e-05: 113,
+    3.187620e-05: 113,
+    3.188619e-05: 113,
+    3.195612e-05: 113,
+    3.197610e-05: 113,
+    3.198609e-05: 113,
+    3.199607e-05: 113,
+    3.201605e-05: 113,
+    3.203603e-05: 113,
+    3.204602e-05: 113,
+    3.206600e-05: 113,
+    3.207599e-05: 113,
+    3.209597e-05: 113,
+    3.211595e-05: 113,
+    3.212594e-05: 113,
+    3.214592e-05: 113,
+    3.218587e-05: 113,
+    3.220585e-05: 113,
+    3.221584e-05: 113,
+    3.222583e-05: 113,
+    3.223582e-05: 113,
+    3.224581e-05: 113,
+    3.225580e-05: 113,
+    3.226579e-05: 113,
+    3.227578e-05: 113,
+    3.228577e-05: 113,
+    3.230575e-05: 113,
+    3.231574e-05: 113,
+    3.232573e-05: 113,
+    3.233571e-05: 113,
+    3.235569e-05: 113,
+    3.238566e-05: 113,
+    3.239565e-05: 113,
+    3.241563e-05: 113,
+    3.242562e-05: 113,
+    3.243561e-05: 113,
+    3.244560e-05: 113,
+    3.247557e-05: 113,
+    3.248556e-05: 113,
+    3.249555e-05: 113,
+    3.251552e-05: 113,
+    3.253550e-05: 113,
+    3.256547e-05: 113,
+    3.258545e-05: 113,
+    3.263540e-05: 113,
+    3.264539e-05: 113,
+    3.269533e-05: 113,
+    3.270532e-05: 113,
+    3.271531e-05: 113,
+    3.272530e-05: 113,
+    3.274528e-05: 113,
+    3.276526e-05: 113,
+    3.278524e-05: 114,
+    3.279523e-05: 114,
+    3.281521e-05: 114,
+    3.282520e-05: 114,
+    3.284517e-05: 114,
+    3.285516e-05: 114,
+    3.289512e-05: 114,
+    3.290511e-05: 114,
+    3.291510e-05: 114,
+    3.292509e-05: 114,
+    3.293508e-05: 114,
+    3.300501e-05: 114,
+    3.301499e-05: 114,
+    3.302498e-05: 114,
+    3.305495e-05: 114,
+    3.306494e-05: 114,
+    3.309491e-05: 114,
+    3.311489e-05: 114,
+    3.312488e-05: 114,
+    3.313487e-05: 114,
+    3.314486e-05: 114,
+    3.318481e-05: 114,
+    3.320479e-05: 114,
+    3.322477e-05: 114,
+    3.323476e-05: 114,
+    3.324475e-05: 114,
+    3.326473e-05: 114,
+    3.327472e-05: 114,
+    3.331468e-05: 114,
+    3.332467e-05: 114,
+    3.334465e-05: 114,
+    3.335463e-05: 114,
+    3.338460e-05: 114,
+    3.344454e-05: 114,
+    3.345453e-05: 114,
+    3.348450e-05: 114,
+    3.354443e-05: 114,
+    3.355442e-05: 114,
+    3.356441e-05: 114,
+    3.359438e-05: 114,
+    3.363434e-05: 114,
+    3.369427e-05: 114,
+    3.370426e-05: 114,
+    3.371425e-05: 114,
+    3.373423e-05: 114,
+    3.374422e-05: 114,
+    3.375421e-05: 114,
+    3.376420e-05: 114,
+    3.377419e-05: 114,
+    3.378418e-05: 114,
+    3.381415e-05: 114,
+    3.385410e-05: 114,
+    3.386409e-05: 114,
+    3.387408e-05: 114,
+    3.390405e-05: 114,
+    3.391404e-05: 114,
+    3.392403e-05: 114,
+    3.393402e-05: 114,
+    3.394401e-05: 114,
+    3.395400e-05: 114,
+    3.398397e-05: 114,
+    3.399396e-05: 114,
+    3.400395e-05: 114,
+    3.401394e-05: 114,
+    3.404390e-05: 114,
+    3.405389e-05: 114,
+    3.407387e-05: 114,
+    3.410384e-05: 114,
+    3.413381e-05: 114,
+    3.414380e-05: 114,
+    3.415379e-05: 114,
+    3.417377e-05: 114,
+    3.418376e-05: 114,
+    3.420373e-05: 114,
+    3.422371e-05: 114,
+    3.426367e-05: 114,
+    3.428365e-05: 114,
+    3.430363e-05: 114,
+    3.431362e-05: 114,
+    3.433360e-05: 114,
+    3.434359e-05: 114,
+    3.438354e-05: 114,
+    3.439353e-05: 114,
+    3.441351e-05: 114,
+    3.442350e-05: 114,
+    3.445347e-05: 114,
+    3.446346e-05: 114,
+    3.448344e-05: 114,
+    3.451341e-05: 114,
+    3.452340e-05: 114,
+    3.459332e-05: 114,
+    3.462329e-05: 114,
+    3.466325e-05: 114,
+    3.467324e-05: 114,
+    3.468323e-05: 114,
+    3.469322e-05: 114,
+    3.475315e-05: 114,
+    3.477313e-05: 114,
+    3.481309e-05: 114,
+    3.482308e-05: 114,
+    3.483307e-05: 114,
+    3.485305e-05: 114,
+    3.487302e-05: 114,
+    3.488301e-05: 114,
+    3.490299e-05: 114,
+    3.492297e-05: 114,
+    3.493296e-05: 114,
+    3.494295e-05: 114,
+    3.495294e-05: 114,
+    3.496293e-05: 114,
+    3.498291e-05: 114,
+    3.500289e-05: 114,
+    3.502287e-05: 114,
+    3.503286e-05: 114,
+    3.505283e-05: 114,
+    3.507281e-05: 114,
+    3.508280e-05: 114,
+    3.511277e-05: 114,
+    3.512276e-05: 114,
+    3.513275e-05: 114,
+    3.514274e-05: 114,
+    3.518270e-05: 114,
+    3.520267e-05: 114,
+    3.522265e-05: 114,
+    3.523264e-05: 115,
+    3.524263e-05: 115,
+    3.527260e-05: 115,
+    3.529258e-05: 115,
+    3.532255e-05: 115,
+    3.533254e-05: 115,
+    3.534253e-05: 115,
+    3.535252e-05: 115,
+    3.537249e-05: 115,
+    3.539247e-05: 115,
+    3.541245e-05: 115,
+    3.542244e-05: 115,
+    3.543243e-05: 115,
+    3.544242e-05: 115,
+    3.545241e-05: 115,
+    3.546240e-05: 115,
+    3.548238e-05: 115,
+    3.553233e-05: 115,
+    3.554231e-05: 115,
+    3.557228e-05: 115,
+    3.558227e-05: 115,
+    3.559226e-05: 115,
+    3.560225e-05: 115,
+    3.564221e-05: 115,
+    3.565220e-05: 115,
+    3.567218e-05: 115,
+    3.568217e-05: 115,
+    3.569216e-05: 115,
+    3.571213e-05: 115,
+    3.572212e-05: 115,
+    3.574210e-05: 115,
+    3.576208e-05: 115,
+    3.577207e-05: 115,
+    3.578206e-05: 115,
+    3.580204e-05: 115,
+    3.584200e-05: 115,
+    3.585199e-05: 115,
+    3.586198e-05: 115,
+    3.587197e-05: 115,
+    3.589194e-05: 115,
+    3.591192e-05: 115,
+    3.593190e-05: 115,
+    3.596187e-05: 115,
+    3.600183e-05: 115,
+    3.601182e-05: 115,
+    3.602181e-05: 115,
+    3.603180e-05: 115,
+    3.605177e-05: 115,
+    3.606176e-05: 115,
+    3.609173e-05: 115,
+    3.610172e-05: 115,
+    3.611171e-05: 115,
+    3.614168e-05: 115,
+    3.615167e-05: 115,
+    3.616166e-05: 115,
+    3.617165e-05: 115,
+    3.628153e-05: 115,
+    3.629152e-05: 115,
+    3.631150e-05: 115,
+    3.632149e-05: 115,
+    3.634147e-05: 115,
+    3.640140e-05: 115,
+    3.642138e-05: 115,
+    3.643137e-05: 115,
+    3.644136e-05: 115,
+    3.645135e-05: 115,
+    3.647133e-05: 115,
+    3.648132e-05: 115,
+    3.649131e-05: 115,
+    3.652128e-05: 115,
+    3.654126e-05: 115,
+    3.655125e-05: 115,
+    3.656123e-05: 115,
+    3.657122e-05: 115,
+    3.659120e-05: 115,
+    3.661118e-05: 115,
+    3.663116e-05: 115,
+    3.665114e-05: 115,
+    3.666113e-05: 115,
+    3.667112e-05: 115,
+    3.668111e-05: 115,
+    3.669110e-05: 115,
+    3.670109e-05: 115,
+    3.671108e-05: 115,
+    3.673105e-05: 115,
+    3.674104e-05: 115,
+    3.677101e-05: 115,
+    3.678100e-05: 115,
+    3.680098e-05: 115,
+    3.684094e-05: 115,
+    3.685093e-05: 115,
+    3.687091e-05: 115,
+    3.689088e-05: 115,
+    3.690087e-05: 115,
+    3.692085e-05: 115,
+    3.696081e-05: 115,
+    3.697080e-05: 115,
+    3.700077e-05: 115,
+    3.701076e-05: 115,
+    3.702075e-05: 115,
+    3.705072e-05: 115,
+    3.709067e-05: 115,
+    3.710066e-05: 115,
+    3.713063e-05: 115,
+    3.715061e-05: 115,
+    3.716060e-05: 115,
+    3.718058e-05: 115,
+    3.720056e-05: 115,
+    3.721055e-05: 115,
+    3.727048e-05: 115,
+    3.728047e-05: 115,
+    3.729046e-05: 115,
+    3.730045e-05: 115,
+    3.734041e-05: 115,
+    3.736039e-05: 115,
+    3.737038e-05: 115,
+    3.738037e-05: 115,
+    3.743031e-05: 115,
+    3.744030e-05: 115,
+    3.748026e-05: 115,
+    3.749025e-05: 115,
+    3.750024e-05: 115,
+    3.751023e-05: 115,
+    3.754020e-05: 115,
+    3.764009e-05: 115,
+    3.766007e-05: 115,
+    3.767006e-05: 115,
+    3.769004e-05: 115,
+    3.770003e-05: 115,
+    3.772001e-05: 115,
+    3.773000e-05: 115,
+    3.773998e-05: 115,
+    3.774997e-05: 115,
+    3.776995e-05: 115,
+    3.777994e-05: 115,
+    3.783988e-05: 115,
+    3.786985e-05: 116,
+    3.793977e-05: 116,
+    3.794976e-05: 116,
+    3.797973e-05: 116,
+    3.798972e-05: 116,
+    3.800970e-05: 116,
+    3.802968e-05: 116,
+    3.806964e-05: 116,
+    3.811958e-05: 116,
+    3.815954e-05: 116,
+    3.816953e-05: 116,
+    3.818951e-05: 116,
+    3.819950e-05: 116,
+    3.820949e-05: 116,
+    3.821948e-05: 116,
+    3.825943e-05: 116,
+    3.826942e-05: 116,
+    3.827941e-05: 116,
+    3.828940e-05: 116,
+    3.830938e-05: 116,
+    3.834934e-05: 116,
+    3.836932e-05: 116,
+    3.837931e-05: 116,
+    3.839929e-05: 116,
+    3.842925e-05: 116,
+    3.844923e-05: 116,
+    3.849918e-05: 116,
+    3.852915e-05: 116,
+    3.857909e-05: 116,
+    3.863903e-05: 116,
+    3.865901e-05: 116,
+    3.866900e-05: 116,
+    3.868898e-05: 116,
+    3.873893e-05: 116,
+    3.874891e-05: 116,
+    3.876889e-05: 116,
+    3.878887e-05: 116,
+    3.880885e-05: 116,
+    3.886879e-05: 116,
+    3.889876e-05: 116,
+    3.894870e-05: 116,
+    3.898866e-05: 116,
+    3.899865e-05: 116,
+    3.900864e-05: 116,
+    3.901863e-05: 116,
+    3.903861e-05: 116,
+    3.904860e-05: 116,
+    3.905859e-05: 116,
+    3.908855e-05: 116,
+    3.910853e-05: 116,
+    3.913850e-05: 116,
+    3.914849e-05: 116,
+    3.920843e-05: 116,
+    3.921842e-05: 116,
+    3.922841e-05: 116,
+    3.925837e-05: 116,
+    3.926836e-05: 116,
+    3.928834e-05: 116,
+    3.929833e-05: 116,
+    3.932830e-05: 116,
+    3.933829e-05: 116,
+    3.934828e-05: 116,
+    3.936826e-05: 116,
+    3.937825e-05: 116,
+    3.938824e-05: 116,
+    3.940822e-05: 116,
+    3.942819e-05: 116,
+    3.946815e-05: 116,
+    3.947814e-05: 116,
+    3.950811e-05: 116,
+    3.954807e-05: 116,
+    3.955806e-05: 116,
+    3.956805e-05: 116,
+    3.958803e-05: 116,
+    3.960800e-05: 116,
+    3.961799e-05: 116,
+    3.962798e-05: 116,
+    3.966794e-05: 116,
+    3.967793e-05: 116,
+    3.968792e-05: 116,
+    3.969791e-05: 116,
+    3.970790e-05: 116,
+    3.972788e-05: 116,
+    3.974786e-05: 116,
+    3.977782e-05: 116,
+    3.980779e-05: 116,
+    3.991768e-05: 116,
+    3.993765e-05: 116,
+    3.994764e-05: 116,
+    3.996762e-05: 116,
+    3.997761e-05: 116,
+    3.998760e-05: 116,
+    3.999759e-05: 116,
+    4.000758e-05: 116,
+    4.001757e-05: 116,
+    4.003755e-05: 116,
+    4.005753e-05: 116,
+    4.008750e-05: 116,
+    4.010747e-05: 116,
+    4.013744e-05: 116,
+    4.019738e-05: 116,
+    4.020737e-05: 116,
+    4.023734e-05: 116,
+    4.025732e-05: 116,
+    4.027729e-05: 116,
+    4.034722e-05: 116,
+    4.036720e-05: 116,
+    4.040716e-05: 116,
+    4.041715e-05: 116,
+    4.042714e-05: 116,
+    4.044711e-05: 116,
+    4.047708e-05: 116,
+    4.054701e-05: 116,
+    4.055700e-05: 116,
+    4.057698e-05: 116,
+    4.059696e-05: 116,
+    4.063691e-05: 116,
+    4.064690e-05: 116,
+    4.065689e-05: 116,
+    4.067687e-05: 116,
+    4.071683e-05: 117,
+    4.074680e-05: 117,
+    4.076678e-05: 117,
+    4.078675e-05: 117,
+    4.080673e-05: 117,
+    4.084669e-05: 117,
+    4.085668e-05: 117,
+    4.087666e-05: 117,
+    4.091662e-05: 117,
+    4.096656e-05: 117,
+    4.098654e-05: 117,
+    4.100652e-05: 117,
+    4.104648e-05: 117,
+    4.105647e-05: 117,
+    4.109643e-05: 117,
+    4.112639e-05: 117,
+    4.113638e-05: 117,
+    4.116635e-05: 117,
+    4.117634e-05: 117,
+    4.120631e-05: 117,
+    4.121630e-05: 117,
+    4.122629e-05: 117,
+    4.127624e-05: 117,
+    4.131619e-05: 117,
+    4.133617e-05: 117,
+    4.135615e-05: 117,
+    4.139611e-05: 117,
+    4.140610e-05: 117,
+    4.142608e-05: 117,
+    4.145604e-05: 117,
+    4.146603e-05: 117,
+    4.147602e-05: 117,
+    4.149600e-05: 117,
+    4.152597e-05: 117,
+    4.158591e-05: 117,
+    4.166582e-05: 117,
+    4.170578e-05: 117,
+    4.171577e-05: 117,
+    4.172576e-05: 117,
+    4.173575e-05: 117,
+    4.177571e-05: 117,
+    4.178570e-05: 117,
+    4.181566e-05: 117,
+    4.183564e-05: 117,
+    4.185562e-05: 117,
+    4.186561e-05: 117,
+    4.188559e-05: 117,
+    4.190557e-05: 117,
+    4.194553e-05: 117,
+    4.195551e-05: 117,
+    4.201545e-05: 117,
+    4.202544e-05: 117,
+    4.204542e-05: 117,
+    4.205541e-05: 117,
+    4.211535e-05: 117,
+    4.213532e-05: 117,
+    4.214531e-05: 117,
+    4.216529e-05: 117,
+    4.217528e-05: 117,
+    4.218527e-05: 117,
+    4.221524e-05: 117,
+    4.223522e-05: 117,
+    4.226519e-05: 117,
+    4.228517e-05: 117,
+    4.233511e-05: 117,
+    4.234510e-05: 117,
+    4.235509e-05: 117,
+    4.236508e-05: 117,
+    4.237507e-05: 117,
+    4.242502e-05: 117,
+    4.246497e-05: 117,
+    4.247496e-05: 117,
+    4.248495e-05: 117,
+    4.249494e-05: 117,
+    4.250493e-05: 117,
+    4.254489e-05: 117,
+    4.260483e-05: 117,
+    4.264478e-05: 117,
+    4.269473e-05: 117,
+    4.273469e-05: 117,
+    4.277465e-05: 117,
+    4.284457e-05: 117,
+    4.286455e-05: 117,
+    4.291450e-05: 117,
+    4.292449e-05: 117,
+    4.293448e-05: 117,
+    4.295446e-05: 117,
+    4.296445e-05: 117,
+    4.300440e-05: 117,
+    4.302438e-05: 117,
+    4.303437e-05: 117,
+    4.304436e-05: 117,
+    4.310430e-05: 117,
+    4.312428e-05: 117,
+    4.313427e-05: 117,
+    4.316423e-05: 117,
+    4.317422e-05: 117,
+    4.319420e-05: 117,
+    4.322417e-05: 117,
+    4.325414e-05: 117,
+    4.327412e-05: 117,
+    4.328411e-05: 117,
+    4.332406e-05: 117,
+    4.333405e-05: 117,
+    4.335403e-05: 117,
+    4.339399e-05: 117,
+    4.341397e-05: 117,
+    4.343395e-05: 117,
+    4.346392e-05: 117,
+    4.347391e-05: 117,
+    4.350387e-05: 117,
+    4.351386e-05: 117,
+    4.352385e-05: 117,
+    4.353384e-05: 117,
+    4.355382e-05: 117,
+    4.367369e-05: 117,
+    4.368368e-05: 117,
+    4.369367e-05: 117,
+    4.370366e-05: 117,
+    4.371365e-05: 117,
+    4.373363e-05: 118,
+    4.374362e-05: 118,
+    4.375361e-05: 118,
+    4.377359e-05: 118,
+    4.380356e-05: 118,
+    4.383352e-05: 118,
+    4.384351e-05: 118,
+    4.385350e-05: 118,
+    4.387348e-05: 118,
+    4.388347e-05: 118,
+    4.391344e-05: 118,
+    4.393342e-05: 118,
+    4.394341e-05: 118,
+    4.395340e-05: 118,
+    4.396339e-05: 118,
+    4.401333e-05: 118,
+    4.404330e-05: 118,
+    4.407327e-05: 118,
+    4.410324e-05: 118,
+    4.411323e-05: 118,
+    4.412322e-05: 118,
+    4.416317e-05: 118,
+    4.417316e-05: 118,
+    4.419314e-05: 118,
+    4.420313e-05: 118,
+    4.424309e-05: 118,
+    4.425308e-05: 118,
+    4.430303e-05: 118,
+    4.431302e-05: 118,
+    4.433299e-05: 118,
+    4.440292e-05: 118,
+    4.444288e-05: 118,
+    4.446286e-05: 118,
+    4.450281e-05: 118,
+    4.451280e-05: 118,
+    4.452279e-05: 118,
+    4.458273e-05: 118,
+    4.459272e-05: 118,
+    4.464267e-05: 118,
+    4.467263e-05: 118,
+    4.468262e-05: 118,
+    4.470260e-05: 118,
+    4.473257e-05: 118,
+    4.474256e-05: 118,
+    4.475255e-05: 118,
+    4.477253e-05: 118,
+    4.478252e-05: 118,
+    4.480250e-05: 118,
+    4.481249e-05: 118,
+    4.485244e-05: 118,
+    4.487242e-05: 118,
+    4.488241e-05: 118,
+    4.490239e-05: 118,
+    4.493236e-05: 118,
+    4.497232e-05: 118,
+    4.504224e-05: 118,
+    4.505223e-05: 118,
+    4.506222e-05: 118,
+    4.510218e-05: 118,
+    4.511217e-05: 118,
+    4.512216e-05: 118,
+    4.514214e-05: 118,
+    4.518209e-05: 118,
+    4.519208e-05: 118,
+    4.525202e-05: 118,
+    4.528199e-05: 118,
+    4.529198e-05: 118,
+    4.531196e-05: 118,
+    4.533194e-05: 118,
+    4.540186e-05: 118,
+    4.543183e-05: 118,
+    4.547179e-05: 118,
+    4.550175e-05: 118,
+    4.551174e-05: 118,
+    4.552173e-05: 118,
+    4.553172e-05: 118,
+    4.555170e-05: 118,
+    4.558167e-05: 118,
+    4.560165e-05: 118,
+    4.561164e-05: 118,
+    4.562163e-05: 118,
+    4.564161e-05: 118,
+    4.565160e-05: 118,
+    4.569155e-05: 118,
+    4.570154e-05: 118,
+    4.574150e-05: 118,
+    4.575149e-05: 118,
+    4.576148e-05: 118,
+    4.582142e-05: 118,
+    4.585138e-05: 118,
+    4.588135e-05: 118,
+    4.589134e-05: 118,
+    4.602120e-05: 118,
+    4.606116e-05: 118,
+    4.607115e-05: 118,
+    4.613109e-05: 118,
+    4.620101e-05: 118,
+    4.622099e-05: 118,
+    4.624097e-05: 118,
+    4.625096e-05: 118,
+    4.626095e-05: 118,
+    4.628093e-05: 118,
+    4.630091e-05: 118,
+    4.634087e-05: 118,
+    4.640080e-05: 118,
+    4.642078e-05: 118,
+    4.645075e-05: 118,
+    4.647073e-05: 118,
+    4.650070e-05: 118,
+    4.651069e-05: 118,
+    4.652067e-05: 118,
+    4.658061e-05: 118,
+    4.660059e-05: 118,
+    4.661058e-05: 118,
+    4.662057e-05: 118,
+    4.664055e-05: 118,
+    4.666053e-05: 118,
+    4.668051e-05: 118,
+    4.670048e-05: 118,
+    4.671047e-05: 118,
+    4.672046e-05: 118,
+    4.679039e-05: 118,
+    4.685033e-05: 118,
+    4.689028e-05: 118,
+    4.690027e-05: 118,
+    4.696021e-05: 118,
+    4.698019e-05: 119,
+    4.703013e-05: 119,
+    4.711005e-05: 119,
+    4.713003e-05: 119,
+    4.715001e-05: 119,
+    4.716999e-05: 119,
+    4.719995e-05: 119,
+    4.722992e-05: 119,
+    4.723991e-05: 119,
+    4.726988e-05: 119,
+    4.727987e-05: 119,
+    4.728986e-05: 119,
+    4.734980e-05: 119,
+    4.742971e-05: 119,
+    4.744969e-05: 119,
+    4.745968e-05: 119,
+    4.746967e-05: 119,
+    4.747966e-05: 119,
+    4.748965e-05: 119,
+    4.751962e-05: 119,
+    4.752960e-05: 119,
+    4.759953e-05: 119,
+    4.761951e-05: 119,
+    4.763949e-05: 119,
+    4.764948e-05: 119,
+    4.765947e-05: 119,
+    4.766946e-05: 119,
+    4.767945e-05: 119,
+    4.769942e-05: 119,
+    4.770941e-05: 119,
+    4.772939e-05: 119,
+    4.779932e-05: 119,
+    4.782929e-05: 119,
+    4.783928e-05: 119,
+    4.792918e-05: 119,
+    4.794916e-05: 119,
+    4.796914e-05: 119,
+    4.800910e-05: 119,
+    4.803906e-05: 119,
+    4.807902e-05: 119,
+    4.808901e-05: 119,
+    4.811898e-05: 119,
+    4.817892e-05: 119,
+    4.819890e-05: 119,
+    4.821887e-05: 119,
+    4.823885e-05: 119,
+    4.825883e-05: 119,
+    4.826882e-05: 119,
+    4.827881e-05: 119,
+    4.834874e-05: 119,
+    4.838869e-05: 119,
+    4.839868e-05: 119,
+    4.842865e-05: 119,
+    4.843864e-05: 119,
+    4.845862e-05: 119,
+    4.851856e-05: 119,
+    4.852855e-05: 119,
+    4.855851e-05: 119,
+    4.856850e-05: 119,
+    4.858848e-05: 119,
+    4.859847e-05: 119,
+    4.860846e-05: 119,
+    4.861845e-05: 119,
+    4.862844e-05: 119,
+    4.863843e-05: 119,
+    4.864842e-05: 119,
+    4.868838e-05: 119,
+    4.872833e-05: 119,
+    4.873832e-05: 119,
+    4.878827e-05: 119,
+    4.883822e-05: 119,
+    4.893811e-05: 119,
+    4.894810e-05: 119,
+    4.901803e-05: 119,
+    4.904799e-05: 119,
+    4.906797e-05: 119,
+    4.907796e-05: 119,
+    4.912791e-05: 119,
+    4.913790e-05: 119,
+    4.914789e-05: 119,
+    4.918785e-05: 119,
+    4.924778e-05: 119,
+    4.929773e-05: 119,
+    4.935767e-05: 119,
+    4.938763e-05: 119,
+    4.939762e-05: 119,
+    4.940761e-05: 119,
+    4.946755e-05: 119,
+    4.948753e-05: 119,
+    4.949752e-05: 119,
+    4.953748e-05: 119,
+    4.959741e-05: 119,
+    4.961739e-05: 119,
+    4.962738e-05: 119,
+    4.965735e-05: 119,
+    4.966734e-05: 119,
+    4.967733e-05: 119,
+    4.970730e-05: 119,
+    4.975724e-05: 119,
+    4.981718e-05: 119,
+    4.982717e-05: 119,
+    4.984715e-05: 119,
+    4.990708e-05: 119,
+    4.995703e-05: 119,
+    5.002696e-05: 119,
+    5.006691e-05: 119,
+    5.010687e-05: 119,
+    5.018679e-05: 119,
+    5.020677e-05: 119,
+    5.023673e-05: 119,
+    5.025671e-05: 119,
+    5.026670e-05: 119,
+    5.032664e-05: 119,
+    5.034662e-05: 119,
+    5.037659e-05: 119,
+    5.041654e-05: 119,
+    5.048647e-05: 120,
+    5.051644e-05: 120,
+    5.052643e-05: 120,
+    5.054641e-05: 120,
+    5.060634e-05: 120,
+    5.061633e-05: 120,
+    5.066628e-05: 120,
+    5.071623e-05: 120,
+    5.072622e-05: 120,
+    5.076617e-05: 120,
+    5.077616e-05: 120,
+    5.079614e-05: 120,
+    5.080613e-05: 120,
+    5.082611e-05: 120,
+    5.083610e-05: 120,
+    5.084609e-05: 120,
+    5.085608e-05: 120,
+    5.086607e-05: 120,
+    5.092600e-05: 120,
+    5.093599e-05: 120,
+    5.102590e-05: 120,
+    5.105587e-05: 120,
+    5.108583e-05: 120,
+    5.109582e-05: 120,
+    5.110581e-05: 120,
+    5.111580e-05: 120,
+    5.113578e-05: 120,
+    5.114577e-05: 120,
+    5.115576e-05: 120,
+    5.118573e-05: 120,
+    5.119572e-05: 120,
+    5.121570e-05: 120,
+    5.122569e-05: 120,
+    5.127563e-05: 120,
+    5.131559e-05: 120,
+    5.134556e-05: 120,
+    5.135555e-05: 120,
+    5.139551e-05: 120,
+    5.142547e-05: 120,
+    5.146543e-05: 120,
+    5.147542e-05: 120,
+    5.148541e-05: 120,
+    5.151538e-05: 120,
+    5.152537e-05: 120,
+    5.157532e-05: 120,
+    5.160528e-05: 120,
+    5.164524e-05: 120,
+    5.180507e-05: 120,
+    5.192494e-05: 120,
+    5.198488e-05: 120,
+    5.199487e-05: 120,
+    5.205481e-05: 120,
+    5.206480e-05: 120,
+    5.212473e-05: 120,
+    5.223462e-05: 120,
+    5.226458e-05: 120,
+    5.236448e-05: 120,
+    5.238446e-05: 120,
+    5.239445e-05: 120,
+    5.242441e-05: 120,
+    5.253430e-05: 120,
+    5.257426e-05: 120,
+    5.259423e-05: 120,
+    5.262420e-05: 120,
+    5.264418e-05: 120,
+    5.265417e-05: 120,
+    5.270412e-05: 120,
+    5.274408e-05: 120,
+    5.276405e-05: 120,
+    5.279402e-05: 120,
+    5.280401e-05: 120,
+    5.286395e-05: 120,
+    5.287394e-05: 120,
+    5.290391e-05: 120,
+    5.299381e-05: 120,
+    5.300380e-05: 120,
+    5.302378e-05: 120,
+    5.303377e-05: 120,
+    5.309371e-05: 120,
+    5.310369e-05: 120,
+    5.321358e-05: 120,
+    5.323356e-05: 120,
+    5.325354e-05: 120,
+    5.329349e-05: 120,
+    5.331347e-05: 120,
+    5.332346e-05: 120,
+    5.334344e-05: 120,
+    5.340338e-05: 120,
+    5.346331e-05: 120,
+    5.347330e-05: 120,
+    5.348329e-05: 120,
+    5.349328e-05: 120,
+    5.350327e-05: 120,
+    5.351326e-05: 120,
+    5.353324e-05: 120,
+    5.356321e-05: 120,
+    5.358319e-05: 120,
+    5.362314e-05: 120,
+    5.373303e-05: 120,
+    5.376300e-05: 120,
+    5.377299e-05: 120,
+    5.380295e-05: 120,
+    5.388287e-05: 120,
+    5.389286e-05: 120,
+    5.392283e-05: 120,
+    5.393282e-05: 120,
+    5.396278e-05: 120,
+    5.397277e-05: 120,
+    5.398276e-05: 120,
+    5.399275e-05: 120,
+    5.403271e-05: 120,
+    5.407267e-05: 120,
+    5.408266e-05: 120,
+    5.409265e-05: 120,
+    5.410264e-05: 120,
+    5.412261e-05: 120,
+    5.413260e-05: 120,
+    5.415258e-05: 120,
+    5.419254e-05: 120,
+    5.423250e-05: 120,
+    5.425248e-05: 121,
+    5.430242e-05: 121,
+    5.431241e-05: 121,
+    5.435237e-05: 121,
+    5.440232e-05: 121,
+    5.441231e-05: 121,
+    5.445226e-05: 121,
+    5.446225e-05: 121,
+    5.456215e-05: 121,
+    5.457214e-05: 121,
+    5.459212e-05: 121,
+    5.460211e-05: 121,
+    5.465205e-05: 121,
+    5.466204e-05: 121,
+    5.467203e-05: 121,
+    5.468202e-05: 121,
+    5.474196e-05: 121,
+    5.478192e-05: 121,
+    5.479190e-05: 121,
+    5.487182e-05: 121,
+    5.506162e-05: 121,
+    5.507161e-05: 121,
+    5.512156e-05: 121,
+    5.518149e-05: 121,
+    5.520147e-05: 121,
+    5.523144e-05: 121,
+    5.524143e-05: 121,
+    5.528139e-05: 121,
+    5.529138e-05: 121,
+    5.534132e-05: 121,
+    5.538128e-05: 121,
+    5.546120e-05: 121,
+    5.548117e-05: 121,
+    5.550115e-05: 121,
+    5.551114e-05: 121,
+    5.552113e-05: 121,
+    5.560105e-05: 121,
+    5.561104e-05: 121,
+    5.569095e-05: 121,
+    5.573091e-05: 121,
+    5.579085e-05: 121,
+    5.580083e-05: 121,
+    5.587076e-05: 121,
+    5.588075e-05: 121,
+    5.597065e-05: 121,
+    5.600062e-05: 121,
+    5.604058e-05: 121,
+    5.606056e-05: 121,
+    5.608054e-05: 121,
+    5.613049e-05: 121,
+    5.616045e-05: 121,
+    5.628033e-05: 121,
+    5.629032e-05: 121,
+    5.632028e-05: 121,
+    5.638022e-05: 121,
+    5.640020e-05: 121,
+    5.643017e-05: 121,
+    5.647013e-05: 121,
+    5.648011e-05: 121,
+    5.650009e-05: 121,
+    5.654005e-05: 121,
+    5.660998e-05: 121,
+    5.663995e-05: 121,
+    5.665992e-05: 121,
+    5.666991e-05: 121,
+    5.668989e-05: 121,
+    5.675982e-05: 121,
+    5.677980e-05: 121,
+    5.681975e-05: 121,
+    5.683973e-05: 121,
+    5.685971e-05: 121,
+    5.688968e-05: 121,
+    5.692964e-05: 121,
+    5.694962e-05: 121,
+    5.696960e-05: 121,
+    5.703952e-05: 121,
+    5.705950e-05: 121,
+    5.706949e-05: 121,
+    5.720934e-05: 121,
+    5.730924e-05: 121,
+    5.732921e-05: 121,
+    5.736917e-05: 121,
+    5.737916e-05: 121,
+    5.743910e-05: 121,
+    5.756896e-05: 121,
+    5.758894e-05: 121,
+    5.759893e-05: 121,
+    5.764888e-05: 121,
+    5.771880e-05: 121,
+    5.773878e-05: 121,
+    5.775876e-05: 121,
+    5.780871e-05: 121,
+    5.781870e-05: 121,
+    5.783867e-05: 121,
+    5.786864e-05: 121,
+    5.788862e-05: 121,
+    5.789861e-05: 121,
+    5.792858e-05: 121,
+    5.796854e-05: 121,
+    5.798852e-05: 121,
+    5.800849e-05: 121,
+    5.806843e-05: 121,
+    5.808841e-05: 121,
+    5.813836e-05: 121,
+    5.817831e-05: 121,
+    5.820828e-05: 121,
+    5.822826e-05: 121,
+    5.826822e-05: 121,
+    5.828820e-05: 121,
+    5.831817e-05: 122,
+    5.832816e-05: 122,
+    5.833814e-05: 122,
+    5.837810e-05: 122,
+    5.838809e-05: 122,
+    5.840807e-05: 122,
+    5.843804e-05: 122,
+    5.846801e-05: 122,
+    5.848799e-05: 122,
+    5.849798e-05: 122,
+    5.853793e-05: 122,
+    5.860786e-05: 122,
+    5.862784e-05: 122,
+    5.868777e-05: 122,
+    5.887757e-05: 122,
+    5.888756e-05: 122,
+    5.891753e-05: 122,
+    5.894750e-05: 122,
+    5.896748e-05: 122,
+    5.899745e-05: 122,
+    5.901742e-05: 122,
+    5.905738e-05: 122,
+    5.908735e-05: 122,
+    5.909734e-05: 122,
+    5.912731e-05: 122,
+    5.913730e-05: 122,
+    5.915728e-05: 122,
+    5.919723e-05: 122,
+    5.923719e-05: 122,
+    5.926716e-05: 122,
+    5.928714e-05: 122,
+    5.930712e-05: 122,
+    5.931711e-05: 122,
+    5.932710e-05: 122,
+    5.936705e-05: 122,
+    5.937704e-05: 122,
+    5.941700e-05: 122,
+    5.944697e-05: 122,
+    5.945696e-05: 122,
+    5.950691e-05: 122,
+    5.958682e-05: 122,
+    5.960680e-05: 122,
+    5.961679e-05: 122,
+    5.967673e-05: 122,
+    5.972667e-05: 122,
+    5.976663e-05: 122,
+    5.985653e-05: 122,
+    5.992646e-05: 122,
+    5.995643e-05: 122,
+    6.005632e-05: 122,
+    6.006631e-05: 122,
+    6.007630e-05: 122,
+    6.008629e-05: 122,
+    6.011626e-05: 122,
+    6.021615e-05: 122,
+    6.028608e-05: 122,
+    6.030606e-05: 122,
+    6.031605e-05: 122,
+    6.037598e-05: 122,
+    6.047588e-05: 122,
+    6.050585e-05: 122,
+    6.053581e-05: 122,
+    6.056578e-05: 122,
+    6.061573e-05: 122,
+    6.064570e-05: 122,
+    6.070563e-05: 122,
+    6.071562e-05: 122,
+    6.077556e-05: 122,
+    6.085548e-05: 122,
+    6.087545e-05: 122,
+    6.092540e-05: 122,
+    6.101531e-05: 122,
+    6.102530e-05: 122,
+    6.103528e-05: 122,
+    6.115516e-05: 122,
+    6.118513e-05: 122,
+    6.137492e-05: 122,
+    6.139490e-05: 122,
+    6.147482e-05: 122,
+    6.150479e-05: 122,
+    6.152477e-05: 122,
+    6.156472e-05: 122,
+    6.158470e-05: 122,
+    6.161467e-05: 122,
+    6.164464e-05: 122,
+    6.166462e-05: 122,
+    6.194432e-05: 122,
+    6.196430e-05: 122,
+    6.201425e-05: 122,
+    6.207418e-05: 122,
+    6.209416e-05: 122,
+    6.210415e-05: 122,
+    6.213412e-05: 122,
+    6.215410e-05: 122,
+    6.216409e-05: 122,
+    6.218407e-05: 122,
+    6.220405e-05: 122,
+    6.222402e-05: 122,
+    6.227397e-05: 122,
+    6.229395e-05: 122,
+    6.231393e-05: 122,
+    6.234390e-05: 122,
+    6.239384e-05: 122,
+    6.243380e-05: 122,
+    6.244379e-05: 122,
+    6.247376e-05: 122,
+    6.251372e-05: 122,
+    6.252371e-05: 122,
+    6.254369e-05: 122,
+    6.255367e-05: 122,
+    6.259363e-05: 122,
+    6.263359e-05: 122,
+    6.271351e-05: 123,
+    6.278343e-05: 123,
+    6.287334e-05: 123,
+    6.289331e-05: 123,
+    6.291329e-05: 123,
+    6.298322e-05: 123,
+    6.302318e-05: 123,
+    6.305315e-05: 123,
+    6.308311e-05: 123,
+    6.317302e-05: 123,
+    6.318301e-05: 123,
+    6.319300e-05: 123,
+    6.326292e-05: 123,
+    6.332286e-05: 123,
+    6.337281e-05: 123,
+    6.339279e-05: 123,
+    6.340277e-05: 123,
+    6.345272e-05: 123,
+    6.346271e-05: 123,
+    6.352265e-05: 123,
+    6.381234e-05: 123,
+    6.386229e-05: 123,
+    6.389226e-05: 123,
+    6.395219e-05: 123,
+    6.397217e-05: 123,
+    6.400214e-05: 123,
+    6.403211e-05: 123,
+    6.408205e-05: 123,
+    6.411202e-05: 123,
+    6.413200e-05: 123,
+    6.423190e-05: 123,
+    6.430182e-05: 123,
+    6.440172e-05: 123,
+    6.441170e-05: 123,
+    6.461149e-05: 123,
+    6.464146e-05: 123,
+    6.468142e-05: 123,
+    6.469141e-05: 123,
+    6.472138e-05: 123,
+    6.474136e-05: 123,
+    6.481128e-05: 123,
+    6.483126e-05: 123,
+    6.490119e-05: 123,
+    6.498110e-05: 123,
+    6.505103e-05: 123,
+    6.506102e-05: 123,
+    6.508100e-05: 123,
+    6.510097e-05: 123,
+    6.511096e-05: 123,
+    6.513094e-05: 123,
+    6.515092e-05: 123,
+    6.516091e-05: 123,
+    6.520087e-05: 123,
+    6.524083e-05: 123,
+    6.527079e-05: 123,
+    6.530076e-05: 123,
+    6.531075e-05: 123,
+    6.532074e-05: 123,
+    6.535071e-05: 123,
+    6.536070e-05: 123,
+    6.555050e-05: 123,
+    6.558047e-05: 123,
+    6.560044e-05: 123,
+    6.562042e-05: 123,
+    6.569035e-05: 123,
+    6.572032e-05: 123,
+    6.575029e-05: 123,
+    6.579024e-05: 123,
+    6.585018e-05: 123,
+    6.595007e-05: 123,
+    6.601001e-05: 123,
+    6.602999e-05: 123,
+    6.615985e-05: 123,
+    6.620980e-05: 123,
+    6.621979e-05: 123,
+    6.622978e-05: 123,
+    6.624976e-05: 123,
+    6.625975e-05: 123,
+    6.629970e-05: 123,
+    6.631968e-05: 123,
+    6.636963e-05: 123,
+    6.640959e-05: 123,
+    6.641958e-05: 123,
+    6.643955e-05: 123,
+    6.651947e-05: 123,
+    6.655943e-05: 123,
+    6.658940e-05: 123,
+    6.670927e-05: 123,
+    6.675922e-05: 123,
+    6.676921e-05: 123,
+    6.677919e-05: 123,
+    6.682914e-05: 123,
+    6.690906e-05: 123,
+    6.694901e-05: 123,
+    6.695900e-05: 123,
+    6.696899e-05: 123,
+    6.704891e-05: 123,
+    6.706889e-05: 123,
+    6.710885e-05: 123,
+    6.713881e-05: 123,
+    6.714880e-05: 123,
+    6.722872e-05: 123,
+    6.733860e-05: 124,
+    6.737856e-05: 124,
+    6.738855e-05: 124,
+    6.741852e-05: 124,
+    6.749843e-05: 124,
+    6.751841e-05: 124,
+    6.754838e-05: 124,
+    6.759833e-05: 124,
+    6.760832e-05: 124,
+    6.761830e-05: 124,
+    6.762829e-05: 124,
+    6.764827e-05: 124,
+    6.766825e-05: 124,
+    6.770821e-05: 124,
+    6.777814e-05: 124,
+    6.781809e-05: 124,
+    6.790800e-05: 124,
+    6.792798e-05: 124,
+    6.796793e-05: 124,
+    6.802787e-05: 124,
+    6.804785e-05: 124,
+    6.807782e-05: 124,
+    6.808781e-05: 124,
+    6.813775e-05: 124,
+    6.814774e-05: 124,
+    6.821767e-05: 124,
+    6.830757e-05: 124,
+    6.836751e-05: 124,
+    6.837750e-05: 124,
+    6.841746e-05: 124,
+    6.843744e-05: 124,
+    6.855731e-05: 124,
+    6.859727e-05: 124,
+    6.863722e-05: 124,
+    6.865720e-05: 124,
+    6.868717e-05: 124,
+    6.886698e-05: 124,
+    6.888696e-05: 124,
+    6.897686e-05: 124,
+    6.900683e-05: 124,
+    6.902681e-05: 124,
+    6.905678e-05: 124,
+    6.909674e-05: 124,
+    6.918664e-05: 124,
+    6.925657e-05: 124,
+    6.928654e-05: 124,
+    6.929653e-05: 124,
+    6.951629e-05: 124,
+    6.955625e-05: 124,
+    6.965614e-05: 124,
+    6.977602e-05: 124,
+    6.979600e-05: 124,
+    6.980599e-05: 124,
+    6.988590e-05: 124,
+    6.994584e-05: 124,
+    6.998579e-05: 124,
+    7.015561e-05: 124,
+    7.018558e-05: 124,
+    7.020556e-05: 124,
+    7.024552e-05: 124,
+    7.028548e-05: 124,
+    7.031545e-05: 124,
+    7.042533e-05: 124,
+    7.045530e-05: 124,
+    7.052522e-05: 124,
+    7.054520e-05: 124,
+    7.056518e-05: 124,
+    7.066507e-05: 124,
+    7.067506e-05: 124,
+    7.070503e-05: 124,
+    7.080493e-05: 124,
+    7.086486e-05: 124,
+    7.088484e-05: 124,
+    7.102469e-05: 124,
+    7.107464e-05: 124,
+    7.117453e-05: 124,
+    7.139430e-05: 124,
+    7.147422e-05: 124,
+    7.148421e-05: 124,
+    7.156412e-05: 124,
+    7.159409e-05: 124,
+    7.163405e-05: 124,
+    7.172395e-05: 124,
+    7.173394e-05: 124,
+    7.174393e-05: 124,
+    7.192374e-05: 124,
+    7.205360e-05: 124,
+    7.206359e-05: 124,
+    7.208357e-05: 124,
+    7.217348e-05: 124,
+    7.219345e-05: 124,
+    7.220344e-05: 124,
+    7.224340e-05: 124,
+    7.228336e-05: 124,
+    7.229335e-05: 124,
+    7.232332e-05: 124,
+    7.241322e-05: 125,
+    7.250313e-05: 125,
+    7.260302e-05: 125,
+    7.263299e-05: 125,
+    7.265297e-05: 125,
+    7.266296e-05: 125,
+    7.268294e-05: 125,
+    7.279282e-05: 125,
+    7.281280e-05: 125,
+    7.282279e-05: 125,
+    7.283278e-05: 125,
+    7.293267e-05: 125,
+    7.307252e-05: 125,
+    7.308251e-05: 125,
+    7.312247e-05: 125,
+    7.317242e-05: 125,
+    7.327231e-05: 125,
+    7.329229e-05: 125,
+    7.330228e-05: 125,
+    7.335223e-05: 125,
+    7.336221e-05: 125,
+    7.344213e-05: 125,
+    7.345212e-05: 125,
+    7.349208e-05: 125,
+    7.351206e-05: 125,
+    7.356200e-05: 125,
+    7.367189e-05: 125,
+    7.382173e-05: 125,
+    7.390164e-05: 125,
+    7.402152e-05: 125,
+    7.421131e-05: 125,
+    7.429123e-05: 125,
+    7.430122e-05: 125,
+    7.453098e-05: 125,
+    7.454096e-05: 125,
+    7.456094e-05: 125,
+    7.458092e-05: 125,
+    7.467083e-05: 125,
+    7.470080e-05: 125,
+    7.472077e-05: 125,
+    7.478071e-05: 125,
+    7.488060e-05: 125,
+    7.489059e-05: 125,
+    7.492056e-05: 125,
+    7.493055e-05: 125,
+    7.494054e-05: 125,
+    7.501047e-05: 125,
+    7.508039e-05: 125,
+    7.515032e-05: 125,
+    7.519028e-05: 125,
+    7.522024e-05: 125,
+    7.533013e-05: 125,
+    7.536010e-05: 125,
+    7.541004e-05: 125,
+    7.547997e-05: 125,
+    7.551993e-05: 125,
+    7.564979e-05: 125,
+    7.572970e-05: 125,
+    7.578964e-05: 125,
+    7.580962e-05: 125,
+    7.586956e-05: 125,
+    7.589952e-05: 125,
+    7.595946e-05: 125,
+    7.596945e-05: 125,
+    7.597944e-05: 125,
+    7.598943e-05: 125,
+    7.608932e-05: 125,
+    7.611929e-05: 125,
+    7.612928e-05: 125,
+    7.620920e-05: 125,
+    7.628911e-05: 125,
+    7.630909e-05: 125,
+    7.632907e-05: 125,
+    7.637902e-05: 125,
+    7.638901e-05: 125,
+    7.641897e-05: 125,
+    7.649889e-05: 125,
+    7.650888e-05: 125,
+    7.651887e-05: 125,
+    7.656881e-05: 125,
+    7.697838e-05: 125,
+    7.700835e-05: 125,
+    7.709825e-05: 125,
+    7.717817e-05: 125,
+    7.718816e-05: 125,
+    7.721813e-05: 125,
+    7.732801e-05: 125,
+    7.752780e-05: 125,
+    7.754778e-05: 125,
+    7.755777e-05: 125,
+    7.762769e-05: 125,
+    7.773758e-05: 126,
+    7.774757e-05: 126,
+    7.779751e-05: 126,
+    7.782748e-05: 126,
+    7.783747e-05: 126,
+    7.784746e-05: 126,
+    7.795734e-05: 126,
+    7.808720e-05: 126,
+    7.817711e-05: 126,
+    7.823705e-05: 126,
+    7.831696e-05: 126,
+    7.854672e-05: 126,
+    7.892632e-05: 126,
+    7.900623e-05: 126,
+    7.903620e-05: 126,
+    7.905618e-05: 126,
+    7.910612e-05: 126,
+    7.912610e-05: 126,
+    7.918604e-05: 126,
+    7.926596e-05: 126,
+    7.935586e-05: 126,
+    7.936585e-05: 126,
+    7.941580e-05: 126,
+    7.945575e-05: 126,
+    7.946574e-05: 126,
+    7.948572e-05: 126,
+    7.950570e-05: 126,
+    7.955565e-05: 126,
+    7.964555e-05: 126,
+    7.966553e-05: 126,
+    7.971548e-05: 126,
+    7.988530e-05: 126,
+    7.992526e-05: 126,
+    7.999518e-05: 126,
+    8.000517e-05: 126,
+    8.004513e-05: 126,
+    8.019497e-05: 126,
+    8.021495e-05: 126,
+    8.028487e-05: 126,
+    8.031484e-05: 126,
+    8.037478e-05: 126,
+    8.038477e-05: 126,
+    8.040475e-05: 126,
+    8.043472e-05: 126,
+    8.045469e-05: 126,
+    8.049465e-05: 126,
+    8.050464e-05: 126,
+    8.051463e-05: 126,
+    8.069444e-05: 126,
+    8.070443e-05: 126,
+    8.071442e-05: 126,
+    8.077436e-05: 126,
+    8.087425e-05: 126,
+    8.101410e-05: 126,
+    8.104407e-05: 126,
+    8.105406e-05: 126,
+    8.115395e-05: 126,
+    8.117393e-05: 126,
+    8.121389e-05: 126,
+    8.132377e-05: 126,
+    8.133376e-05: 126,
+    8.145364e-05: 126,
+    8.152356e-05: 126,
+    8.155353e-05: 126,
+    8.160348e-05: 126,
+    8.166341e-05: 126,
+    8.172335e-05: 126,
+    8.174333e-05: 126,
+    8.188318e-05: 126,
+    8.199306e-05: 126,
+    8.214290e-05: 126,
+    8.220284e-05: 126,
+    8.222282e-05: 126,
+    8.223281e-05: 126,
+    8.229275e-05: 126,
+    8.236267e-05: 126,
+    8.238265e-05: 126,
+    8.240263e-05: 126,
+    8.241262e-05: 126,
+    8.256246e-05: 126,
+    8.296204e-05: 126,
+    8.301198e-05: 126,
+    8.303196e-05: 126,
+    8.309190e-05: 126,
+    8.311188e-05: 126,
+    8.314185e-05: 126,
+    8.322176e-05: 126,
+    8.329169e-05: 126,
+    8.332165e-05: 126,
+    8.333164e-05: 126,
+    8.337160e-05: 126,
+    8.340157e-05: 126,
+    8.355141e-05: 127,
+    8.360136e-05: 127,
+    8.368127e-05: 127,
+    8.380115e-05: 127,
+    8.385109e-05: 127,
+    8.386108e-05: 127,
+    8.396098e-05: 127,
+    8.403090e-05: 127,
+    8.404089e-05: 127,
+    8.410083e-05: 127,
+    8.411082e-05: 127,
+    8.415078e-05: 127,
+    8.431061e-05: 127,
+    8.438053e-05: 127,
+    8.439052e-05: 127,
+    8.477012e-05: 127,
+    8.480009e-05: 127,
+    8.511975e-05: 127,
+    8.519966e-05: 127,
+    8.522963e-05: 127,
+    8.536948e-05: 127,
+    8.559924e-05: 127,
+    8.560923e-05: 127,
+    8.561922e-05: 127,
+    8.570912e-05: 127,
+    8.571911e-05: 127,
+    8.572910e-05: 127,
+    8.575907e-05: 127,
+    8.578904e-05: 127,
+    8.595886e-05: 127,
+    8.597884e-05: 127,
+    8.601880e-05: 127,
+    8.602878e-05: 127,
+    8.604876e-05: 127,
+    8.609871e-05: 127,
+    8.612868e-05: 127,
+    8.616864e-05: 127,
+    8.626853e-05: 127,
+    8.627852e-05: 127,
+    8.639839e-05: 127,
+    8.641837e-05: 127,
+    8.646832e-05: 127,
+    8.651827e-05: 127,
+    8.653824e-05: 127,
+    8.654823e-05: 127,
+    8.660817e-05: 127,
+    8.672804e-05: 127,
+    8.677799e-05: 127,
+    8.683793e-05: 127,
+    8.693782e-05: 127,
+    8.694781e-05: 127,
+    8.702773e-05: 127,
+    8.710764e-05: 127,
+    8.732741e-05: 127,
+    8.733740e-05: 127,
+    8.737735e-05: 127,
+    8.740732e-05: 127,
+    8.747725e-05: 127,
+    8.750722e-05: 127,
+    8.769702e-05: 127,
+    8.774696e-05: 127,
+    8.788681e-05: 127,
+    8.791678e-05: 127,
+    8.796673e-05: 127,
+    8.804665e-05: 127,
+    8.810658e-05: 127,
+    8.815653e-05: 127,
+    8.816652e-05: 127,
+    8.818650e-05: 127,
+    8.823644e-05: 127,
+    8.825642e-05: 127,
+    8.827640e-05: 127,
+    8.841625e-05: 127,
+    8.847619e-05: 127,
+    8.863602e-05: 127,
+    8.868597e-05: 127,
+    8.870595e-05: 127,
+    8.872592e-05: 127,
+    8.874590e-05: 127,
+    8.895568e-05: 127,
+    8.899564e-05: 127,
+    8.900563e-05: 127,
+    8.906556e-05: 127,
+    8.912550e-05: 127,
+    8.915547e-05: 127,
+    8.918544e-05: 127,
+    8.928533e-05: 127,
+    8.930531e-05: 127,
+    8.943517e-05: 127,
+    8.947513e-05: 127,
+    8.960499e-05: 127,
+    8.965494e-05: 127,
+    8.966493e-05: 127,
+    8.967492e-05: 127,
+    8.981477e-05: 128,
+    8.986472e-05: 128,
+    8.999458e-05: 128,
+    9.001456e-05: 128,
+    9.017439e-05: 128,
+    9.022434e-05: 128,
+    9.060393e-05: 128,
+    9.064389e-05: 128,
+    9.068385e-05: 128,
+    9.078374e-05: 128,
+    9.081371e-05: 128,
+    9.086366e-05: 128,
+    9.092359e-05: 128,
+    9.098353e-05: 128,
+    9.103348e-05: 128,
+    9.106345e-05: 128,
+    9.109341e-05: 128,
+    9.112338e-05: 128,
+    9.122328e-05: 128,
+    9.125325e-05: 128,
+    9.128321e-05: 128,
+    9.142307e-05: 128,
+    9.157291e-05: 128,
+    9.184262e-05: 128,
+    9.189257e-05: 128,
+    9.200245e-05: 128,
+    9.201244e-05: 128,
+    9.214230e-05: 128,
+    9.222222e-05: 128,
+    9.224220e-05: 128,
+    9.228215e-05: 128,
+    9.236207e-05: 128,
+    9.256186e-05: 128,
+    9.260182e-05: 128,
+    9.277164e-05: 128,
+    9.282158e-05: 128,
+    9.301138e-05: 128,
+    9.323115e-05: 128,
+    9.329108e-05: 128,
+    9.331106e-05: 128,
+    9.335102e-05: 128,
+    9.340097e-05: 128,
+    9.343094e-05: 128,
+    9.354082e-05: 128,
+    9.362073e-05: 128,
+    9.387047e-05: 128,
+    9.389045e-05: 128,
+    9.395039e-05: 128,
+    9.399034e-05: 128,
+    9.408025e-05: 128,
+    9.419013e-05: 128,
+    9.420012e-05: 128,
+    9.423009e-05: 128,
+    9.425007e-05: 128,
+    9.427005e-05: 128,
+    9.432998e-05: 128,
+    9.434996e-05: 128,
+    9.439991e-05: 128,
+    9.459970e-05: 128,
+    9.473955e-05: 128,
+    9.497929e-05: 128,
+    9.507919e-05: 128,
+    9.516909e-05: 128,
+    9.528897e-05: 128,
+    9.533891e-05: 128,
+    9.542882e-05: 128,
+    9.546878e-05: 128,
+    9.563860e-05: 128,
+    9.564858e-05: 128,
+    9.567855e-05: 128,
+    9.579843e-05: 128,
+    9.582839e-05: 128,
+    9.586835e-05: 128,
+    9.604816e-05: 128,
+    9.609811e-05: 128,
+    9.610810e-05: 128,
+    9.613807e-05: 128,
+    9.633785e-05: 128,
+    9.661756e-05: 129,
+    9.665752e-05: 129,
+    9.668748e-05: 129,
+    9.690725e-05: 129,
+    9.701713e-05: 129,
+    9.704710e-05: 129,
+    9.705709e-05: 129,
+    9.711703e-05: 129,
+    9.735677e-05: 129,
+    9.738674e-05: 129,
+    9.779631e-05: 129,
+    9.796613e-05: 129,
+    9.801607e-05: 129,
+    9.806602e-05: 129,
+    9.807601e-05: 129,
+    9.835571e-05: 129,
+    9.843563e-05: 129,
+    9.845561e-05: 129,
+    9.861544e-05: 129,
+    9.866539e-05: 129,
+    9.868536e-05: 129,
+    9.887516e-05: 129,
+    9.895508e-05: 129,
+    9.898505e-05: 129,
+    9.907495e-05: 129,
+    9.930471e-05: 129,
+    9.937463e-05: 129,
+    9.940460e-05: 129,
+    9.942458e-05: 129,
+    9.961438e-05: 129,
+    9.973425e-05: 129,
+    9.974424e-05: 129,
+    9.982416e-05: 129,
+    9.985413e-05: 129,
+    9.996401e-05: 129,
+    9.997400e-05: 129,
+    1.001838e-04: 129,
+    1.002537e-04: 129,
+    1.002637e-04: 129,
+    1.002837e-04: 129,
+    1.003336e-04: 129,
+    1.004235e-04: 129,
+    1.005534e-04: 129,
+    1.005734e-04: 129,
+    1.006033e-04: 129,
+    1.006233e-04: 129,
+    1.008031e-04: 129,
+    1.010129e-04: 129,
+    1.010329e-04: 129,
+    1.011627e-04: 129,
+    1.013126e-04: 129,
+    1.013825e-04: 129,
+    1.015124e-04: 129,
+    1.015823e-04: 129,
+    1.015923e-04: 129,
+    1.016123e-04: 129,
+    1.016722e-04: 129,
+    1.018620e-04: 129,
+    1.018720e-04: 129,
+    1.021717e-04: 129,
+    1.022816e-04: 129,
+    1.022915e-04: 129,
+    1.024614e-04: 129,
+    1.026611e-04: 129,
+    1.028909e-04: 129,
+    1.029109e-04: 129,
+    1.030407e-04: 129,
+    1.031107e-04: 129,
+    1.035802e-04: 129,
+    1.036201e-04: 129,
+    1.036801e-04: 130,
+    1.037200e-04: 130,
+    1.037800e-04: 130,
+    1.039698e-04: 130,
+    1.040097e-04: 130,
+    1.040297e-04: 130,
+    1.040597e-04: 130,
+    1.040896e-04: 130,
+    1.041995e-04: 130,
+    1.042395e-04: 130,
+    1.042595e-04: 130,
+    1.042994e-04: 130,
+    1.043094e-04: 130,
+    1.044792e-04: 130,
+    1.046191e-04: 130,
+    1.046490e-04: 130,
+    1.046790e-04: 130,
+    1.046890e-04: 130,
+    1.047489e-04: 130,
+    1.048488e-04: 130,
+    1.049687e-04: 130,
+    1.051185e-04: 130,
+    1.051585e-04: 130,
+    1.052184e-04: 130,
+    1.053383e-04: 130,
+    1.054382e-04: 130,
+    1.056480e-04: 130,
+    1.056979e-04: 130,
+    1.057479e-04: 130,
+    1.057679e-04: 130,
+    1.057778e-04: 130,
+    1.058478e-04: 130,
+    1.058578e-04: 130,
+    1.058877e-04: 130,
+    1.059876e-04: 130,
+    1.061674e-04: 130,
+    1.062374e-04: 130,
+    1.065470e-04: 130,
+    1.065570e-04: 130,
+    1.066469e-04: 130,
+    1.066569e-04: 130,
+    1.068867e-04: 130,
+    1.069066e-04: 130,
+    1.069366e-04: 130,
+    1.069866e-04: 130,
+    1.070065e-04: 130,
+    1.071364e-04: 130,
+    1.071764e-04: 130,
+    1.073362e-04: 130,
+    1.073462e-04: 130,
+    1.074461e-04: 130,
+    1.074760e-04: 130,
+    1.075260e-04: 130,
+    1.079156e-04: 130,
+    1.079755e-04: 130,
+    1.081353e-04: 130,
+    1.084051e-04: 130,
+    1.084350e-04: 130,
+    1.086348e-04: 130,
+    1.086448e-04: 130,
+    1.087047e-04: 130,
+    1.087647e-04: 130,
+    1.088246e-04: 130,
+    1.089145e-04: 130,
+    1.089545e-04: 130,
+    1.089944e-04: 130,
+    1.090244e-04: 130,
+    1.090444e-04: 130,
+    1.090943e-04: 130,
+    1.092342e-04: 130,
+    1.092841e-04: 130,
+    1.096637e-04: 130,
+    1.097836e-04: 130,
+    1.099035e-04: 130,
+    1.099934e-04: 130,
+    1.100233e-04: 130,
+    1.103630e-04: 130,
+    1.105328e-04: 130,
+    1.107825e-04: 130,
+    1.108525e-04: 130,
+    1.109224e-04: 130,
+    1.110123e-04: 130,
+    1.110622e-04: 130,
+    1.110822e-04: 130,
+    1.113120e-04: 130,
+    1.115018e-04: 131,
+    1.115717e-04: 131,
+    1.118214e-04: 131,
+    1.119713e-04: 131,
+    1.120112e-04: 131,
+    1.120612e-04: 131,
+    1.121511e-04: 131,
+    1.124008e-04: 131,
+    1.125007e-04: 131,
+    1.126805e-04: 131,
+    1.130202e-04: 131,
+    1.130901e-04: 131,
+    1.131700e-04: 131,
+    1.132399e-04: 131,
+    1.132799e-04: 131,
+    1.133398e-04: 131,
+    1.134098e-04: 131,
+    1.134297e-04: 131,
+    1.135896e-04: 131,
+    1.138093e-04: 131,
+    1.140291e-04: 131,
+    1.141290e-04: 131,
+    1.141989e-04: 131,
+    1.142089e-04: 131,
+    1.142289e-04: 131,
+    1.142888e-04: 131,
+    1.142988e-04: 131,
+    1.143488e-04: 131,
+    1.145685e-04: 131,
+    1.147383e-04: 131,
+    1.148083e-04: 131,
+    1.148183e-04: 131,
+    1.148682e-04: 131,
+    1.149281e-04: 131,
+    1.149581e-04: 131,
+    1.151379e-04: 131,
+    1.151479e-04: 131,
+    1.152878e-04: 131,
+    1.154376e-04: 131,
+    1.155475e-04: 131,
+    1.155575e-04: 131,
+    1.155974e-04: 131,
+    1.156973e-04: 131,
+    1.157073e-04: 131,
+    1.157473e-04: 131,
+    1.158172e-04: 131,
+    1.158572e-04: 131,
+    1.158671e-04: 131,
+    1.158971e-04: 131,
+    1.160170e-04: 131,
+    1.163566e-04: 131,
+    1.164066e-04: 131,
+    1.165165e-04: 131,
+    1.169860e-04: 131,
+    1.171558e-04: 131,
+    1.171857e-04: 131,
+    1.172157e-04: 131,
+    1.174355e-04: 131,
+    1.176253e-04: 131,
+    1.177152e-04: 131,
+    1.177252e-04: 131,
+    1.178151e-04: 131,
+    1.178251e-04: 131,
+    1.178451e-04: 131,
+    1.181048e-04: 131,
+    1.181547e-04: 131,
+    1.181747e-04: 131,
+    1.184644e-04: 131,
+    1.185044e-04: 131,
+    1.188839e-04: 131,
+    1.191836e-04: 131,
+    1.194234e-04: 131,
+    1.196232e-04: 131,
+    1.197231e-04: 132,
+    1.200227e-04: 132,
+    1.202125e-04: 132,
+    1.203724e-04: 132,
+    1.206021e-04: 132,
+    1.208519e-04: 132,
+    1.209318e-04: 132,
+    1.209418e-04: 132,
+    1.210716e-04: 132,
+    1.211815e-04: 132,
+    1.213413e-04: 132,
+    1.215811e-04: 132,
+    1.216310e-04: 132,
+    1.218009e-04: 132,
+    1.218708e-04: 132,
+    1.219907e-04: 132,
+    1.220706e-04: 132,
+    1.221205e-04: 132,
+    1.221904e-04: 132,
+    1.224102e-04: 132,
+    1.224602e-04: 132,
+    1.224901e-04: 132,
+    1.225001e-04: 132,
+    1.226699e-04: 132,
+    1.227299e-04: 132,
+    1.229097e-04: 132,
+    1.230296e-04: 132,
+    1.230695e-04: 132,
+    1.233192e-04: 132,
+    1.233792e-04: 132,
+    1.236189e-04: 132,
+    1.236489e-04: 132,
+    1.237088e-04: 132,
+    1.238986e-04: 132,
+    1.239386e-04: 132,
+    1.239785e-04: 132,
+    1.239985e-04: 132,
+    1.241883e-04: 132,
+    1.244081e-04: 132,
+    1.245280e-04: 132,
+    1.245679e-04: 132,
+    1.246678e-04: 132,
+    1.247877e-04: 132,
+    1.247977e-04: 132,
+    1.248077e-04: 132,
+    1.250274e-04: 132,
+    1.252472e-04: 132,
+    1.252872e-04: 132,
+    1.253871e-04: 132,
+    1.255868e-04: 132,
+    1.258166e-04: 132,
+    1.260364e-04: 132,
+    1.264060e-04: 132,
+    1.264759e-04: 132,
+    1.268655e-04: 132,
+    1.268755e-04: 132,
+    1.269854e-04: 132,
+    1.272950e-04: 132,
+    1.273450e-04: 132,
+    1.273650e-04: 132,
+    1.278444e-04: 132,
+    1.279044e-04: 132,
+    1.285837e-04: 132,
+    1.286436e-04: 133,
+    1.287435e-04: 133,
+    1.291031e-04: 133,
+    1.291231e-04: 133,
+    1.292530e-04: 133,
+    1.293828e-04: 133,
+    1.296026e-04: 133,
+    1.296825e-04: 133,
+    1.297125e-04: 133,
+    1.298423e-04: 133,
+    1.300022e-04: 133,
+    1.300921e-04: 133,
+    1.301820e-04: 133,
+    1.303118e-04: 133,
+    1.304817e-04: 133,
+    1.307813e-04: 133,
+    1.308912e-04: 133,
+    1.309012e-04: 133,
+    1.310111e-04: 133,
+    1.311509e-04: 133,
+    1.312608e-04: 133,
+    1.313907e-04: 133,
+    1.314207e-04: 133,
+    1.316604e-04: 133,
+    1.316704e-04: 133,
+    1.317203e-04: 133,
+    1.321699e-04: 133,
+    1.322198e-04: 133,
+    1.322598e-04: 133,
+    1.325095e-04: 133,
+    1.326194e-04: 133,
+    1.327293e-04: 133,
+    1.327592e-04: 133,
+    1.329490e-04: 133,
+    1.332088e-04: 133,
+    1.332287e-04: 133,
+    1.332987e-04: 133,
+    1.336183e-04: 133,
+    1.338880e-04: 133,
+    1.341078e-04: 133,
+    1.342876e-04: 133,
+    1.342976e-04: 133,
+    1.347471e-04: 133,
+    1.348970e-04: 133,
+    1.351267e-04: 133,
+    1.352266e-04: 133,
+    1.352466e-04: 133,
+    1.353165e-04: 133,
+    1.358560e-04: 133,
+    1.358659e-04: 133,
+    1.361556e-04: 133,
+    1.364154e-04: 133,
+    1.365552e-04: 133,
+    1.365952e-04: 133,
+    1.366052e-04: 133,
+    1.366151e-04: 133,
+    1.366951e-04: 133,
+    1.368649e-04: 133,
+    1.370047e-04: 133,
+    1.371746e-04: 133,
+    1.372844e-04: 133,
+    1.377040e-04: 133,
+    1.377639e-04: 133,
+    1.380736e-04: 133,
+    1.381335e-04: 133,
+    1.382234e-04: 133,
+    1.382634e-04: 134,
+    1.383034e-04: 134,
+    1.383133e-04: 134,
+    1.389027e-04: 134,
+    1.395920e-04: 134,
+    1.396319e-04: 134,
+    1.398517e-04: 134,
+    1.408507e-04: 134,
+    1.408906e-04: 134,
+    1.409406e-04: 134,
+    1.421593e-04: 134,
+    1.425688e-04: 134,
+    1.429085e-04: 134,
+    1.429384e-04: 134,
+    1.429984e-04: 134,
+    1.431982e-04: 134,
+    1.432981e-04: 134,
+    1.433580e-04: 134,
+    1.434279e-04: 134,
+    1.438874e-04: 134,
+    1.440573e-04: 134,
+    1.442670e-04: 134,
+    1.443370e-04: 134,
+    1.443769e-04: 134,
+    1.445567e-04: 134,
+    1.451261e-04: 134,
+    1.452660e-04: 134,
+    1.453958e-04: 134,
+    1.454258e-04: 134,
+    1.455956e-04: 134,
+    1.457255e-04: 134,
+    1.457455e-04: 134,
+    1.457654e-04: 134,
+    1.458653e-04: 134,
+    1.462150e-04: 134,
+    1.465446e-04: 134,
+    1.467644e-04: 134,
+    1.469142e-04: 134,
+    1.470840e-04: 134,
+    1.474037e-04: 134,
+    1.475835e-04: 134,
+    1.478932e-04: 134,
+    1.482228e-04: 134,
+    1.486424e-04: 135,
+    1.488821e-04: 135,
+    1.491618e-04: 135,
+    1.494016e-04: 135,
+    1.495414e-04: 135,
+    1.496214e-04: 135,
+    1.496613e-04: 135,
+    1.499210e-04: 135,
+    1.499510e-04: 135,
+    1.500309e-04: 135,
+    1.501308e-04: 135,
+    1.507302e-04: 135,
+    1.508800e-04: 135,
+    1.509000e-04: 135,
+    1.509799e-04: 135,
+    1.510898e-04: 135,
+    1.511997e-04: 135,
+    1.514694e-04: 135,
+    1.516492e-04: 135,
+    1.516692e-04: 135,
+    1.518890e-04: 135,
+    1.519888e-04: 135,
+    1.520488e-04: 135,
+    1.528180e-04: 135,
+    1.530777e-04: 135,
+    1.533274e-04: 135,
+    1.535872e-04: 135,
+    1.538968e-04: 135,
+    1.541266e-04: 135,
+    1.541865e-04: 135,
+    1.543563e-04: 135,
+    1.543863e-04: 135,
+    1.544462e-04: 135,
+    1.544962e-04: 135,
+    1.545162e-04: 135,
+    1.548558e-04: 135,
+    1.548658e-04: 135,
+    1.553852e-04: 135,
+    1.554652e-04: 135,
+    1.557049e-04: 135,
+    1.557149e-04: 135,
+    1.561644e-04: 135,
+    1.562543e-04: 135,
+    1.563143e-04: 135,
+    1.570435e-04: 135,
+    1.570535e-04: 135,
+    1.571634e-04: 135,
+    1.573532e-04: 135,
+    1.574531e-04: 135,
+    1.584120e-04: 135,
+    1.585619e-04: 135,
+    1.587417e-04: 135,
+    1.587916e-04: 135,
+    1.588815e-04: 135,
+    1.588915e-04: 135,
+    1.590414e-04: 135,
+    1.595109e-04: 135,
+    1.596108e-04: 135,
+    1.598006e-04: 136,
+    1.599104e-04: 136,
+    1.603600e-04: 136,
+    1.606297e-04: 136,
+    1.610892e-04: 136,
+    1.618284e-04: 136,
+    1.618584e-04: 136,
+    1.619982e-04: 136,
+    1.621681e-04: 136,
+    1.623778e-04: 136,
+    1.625576e-04: 136,
+    1.627474e-04: 136,
+    1.630271e-04: 136,
+    1.632669e-04: 136,
+    1.632869e-04: 136,
+    1.633168e-04: 136,
+    1.635466e-04: 136,
+    1.637064e-04: 136,
+    1.639562e-04: 136,
+    1.643757e-04: 136,
+    1.644656e-04: 136,
+    1.644756e-04: 136,
+    1.645256e-04: 136,
+    1.646554e-04: 136,
+    1.651349e-04: 136,
+    1.651549e-04: 136,
+    1.654745e-04: 136,
+    1.654845e-04: 136,
+    1.658242e-04: 136,
+    1.660439e-04: 136,
+    1.664835e-04: 136,
+    1.668131e-04: 136,
+    1.672127e-04: 136,
+    1.672926e-04: 136,
+    1.674724e-04: 136,
+    1.675124e-04: 136,
+    1.677421e-04: 136,
+    1.684514e-04: 136,
+    1.685113e-04: 136,
+    1.695502e-04: 136,
+    1.696202e-04: 136,
+    1.697300e-04: 136,
+    1.699998e-04: 136,
+    1.708788e-04: 136,
+    1.709587e-04: 136,
+    1.717879e-04: 137,
+    1.722973e-04: 137,
+    1.725770e-04: 137,
+    1.725970e-04: 137,
+    1.729067e-04: 137,
+    1.729666e-04: 137,
+    1.730465e-04: 137,
+    1.731864e-04: 137,
+    1.733162e-04: 137,
+    1.734461e-04: 137,
+    1.740055e-04: 137,
+    1.745849e-04: 137,
+    1.747148e-04: 137,
+    1.747547e-04: 137,
+    1.750044e-04: 137,
+    1.753940e-04: 137,
+    1.754939e-04: 137,
+    1.758835e-04: 137,
+    1.759434e-04: 137,
+    1.760334e-04: 137,
+    1.761532e-04: 137,
+    1.769524e-04: 137,
+    1.769823e-04: 137,
+    1.770922e-04: 137,
+    1.773719e-04: 137,
+    1.779313e-04: 137,
+    1.781611e-04: 137,
+    1.785906e-04: 137,
+    1.791301e-04: 137,
+    1.799092e-04: 137,
+    1.808882e-04: 137,
+    1.810680e-04: 137,
+    1.812978e-04: 137,
+    1.815275e-04: 137,
+    1.817873e-04: 137,
+    1.819771e-04: 137,
+    1.820070e-04: 137,
+    1.821968e-04: 137,
+    1.822967e-04: 137,
+    1.825664e-04: 137,
+    1.828661e-04: 137,
+    1.832557e-04: 137,
+    1.838051e-04: 137,
+    1.838650e-04: 137,
+    1.839949e-04: 137,
+    1.841248e-04: 137,
+    1.845743e-04: 138,
+    1.846342e-04: 138,
+    1.848340e-04: 138,
+    1.855632e-04: 138,
+    1.858829e-04: 138,
+    1.862026e-04: 138,
+    1.862425e-04: 138,
+    1.862725e-04: 138,
+    1.863224e-04: 138,
+    1.865522e-04: 138,
+    1.866121e-04: 138,
+    1.875811e-04: 138,
+    1.880606e-04: 138,
+    1.883803e-04: 138,
+    1.886700e-04: 138,
+    1.890196e-04: 138,
+    1.895590e-04: 138,
+    1.895790e-04: 138,
+    1.897188e-04: 138,
+    1.898487e-04: 138,
+    1.901983e-04: 138,
+    1.903981e-04: 138,
+    1.905080e-04: 138,
+    1.905580e-04: 138,
+    1.906379e-04: 138,
+    1.908876e-04: 138,
+    1.912472e-04: 138,
+    1.912972e-04: 138,
+    1.913072e-04: 138,
+    1.914071e-04: 138,
+    1.928755e-04: 138,
+    1.929854e-04: 138,
+    1.931452e-04: 138,
+    1.934249e-04: 138,
+    1.935847e-04: 138,
+    1.938045e-04: 138,
+    1.939943e-04: 138,
+    1.946336e-04: 138,
+    1.948634e-04: 138,
+    1.952730e-04: 138,
+    1.952829e-04: 138,
+    1.956326e-04: 138,
+    1.959323e-04: 138,
+    1.967314e-04: 138,
+    1.971210e-04: 138,
+    1.978902e-04: 138,
+    1.981299e-04: 139,
+    1.981399e-04: 139,
+    1.982398e-04: 139,
+    1.994285e-04: 139,
+    1.995984e-04: 139,
+    1.999880e-04: 139,
+    2.005174e-04: 139,
+    2.015563e-04: 139,
+    2.017860e-04: 139,
+    2.018859e-04: 139,
+    2.021257e-04: 139,
+    2.021457e-04: 139,
+    2.025253e-04: 139,
+    2.033244e-04: 139,
+    2.033344e-04: 139,
+    2.034243e-04: 139,
+    2.035442e-04: 139,
+    2.040536e-04: 139,
+    2.044932e-04: 139,
+    2.046630e-04: 139,
+    2.049627e-04: 139,
+    2.050426e-04: 139,
+    2.052124e-04: 139,
+    2.059317e-04: 139,
+    2.067708e-04: 139,
+    2.077897e-04: 139,
+    2.084490e-04: 139,
+    2.090084e-04: 139,
+    2.100373e-04: 139,
+    2.110762e-04: 139,
+    2.112160e-04: 139,
+    2.116356e-04: 139,
+    2.117155e-04: 139,
+    2.117555e-04: 139,
+    2.131140e-04: 140,
+    2.131840e-04: 140,
+    2.135136e-04: 140,
+    2.135736e-04: 140,
+    2.137134e-04: 140,
+    2.145525e-04: 140,
+    2.145825e-04: 140,
+    2.147523e-04: 140,
+    2.149021e-04: 140,
+    2.149621e-04: 140,
+    2.158112e-04: 140,
+    2.158212e-04: 140,
+    2.160210e-04: 140,
+    2.160809e-04: 140,
+    2.168001e-04: 140,
+    2.177092e-04: 140,
+    2.178890e-04: 140,
+    2.183385e-04: 140,
+    2.191177e-04: 140,
+    2.198669e-04: 140,
+    2.199967e-04: 140,
+    2.200966e-04: 140,
+    2.207459e-04: 140,
+    2.207559e-04: 140,
+    2.209557e-04: 140,
+    2.210157e-04: 140,
+    2.212254e-04: 140,
+    2.216450e-04: 140,
+    2.219147e-04: 140,
+    2.225440e-04: 140,
+    2.228737e-04: 140,
+    2.229136e-04: 140,
+    2.229736e-04: 140,
+    2.233432e-04: 140,
+    2.262501e-04: 140,
+    2.266497e-04: 140,
+    2.266697e-04: 140,
+    2.267696e-04: 140,
+    2.269893e-04: 140,
+    2.283978e-04: 140,
+    2.286675e-04: 140,
+    2.291071e-04: 141,
+    2.292170e-04: 141,
+    2.299961e-04: 141,
+    2.306155e-04: 141,
+    2.314546e-04: 141,
+    2.314746e-04: 141,
+    2.315045e-04: 141,
+    2.315345e-04: 141,
+    2.315545e-04: 141,
+    2.318841e-04: 141,
+    2.319341e-04: 141,
+    2.322238e-04: 141,
+    2.323736e-04: 141,
+    2.327932e-04: 141,
+    2.333626e-04: 141,
+    2.333825e-04: 141,
+    2.338421e-04: 141,
+    2.342816e-04: 141,
+    2.343415e-04: 141,
+    2.354004e-04: 141,
+    2.360897e-04: 141,
+    2.365092e-04: 141,
+    2.367290e-04: 141,
+    2.368689e-04: 141,
+    2.370087e-04: 141,
+    2.371186e-04: 141,
+    2.372185e-04: 141,
+    2.372385e-04: 141,
+    2.377180e-04: 141,
+    2.378778e-04: 141,
+    2.380376e-04: 141,
+    2.381974e-04: 141,
+    2.396359e-04: 141,
+    2.397658e-04: 141,
+    2.409845e-04: 141,
+    2.418735e-04: 141,
+    2.428525e-04: 141,
+    2.437116e-04: 141,
+    2.441811e-04: 141,
+    2.452400e-04: 141,
+    2.452799e-04: 141,
+    2.456895e-04: 141,
+    2.462289e-04: 142,
+    2.463688e-04: 142,
+    2.463888e-04: 142,
+    2.479171e-04: 142,
+    2.479771e-04: 142,
+    2.487463e-04: 142,
+    2.487862e-04: 142,
+    2.490160e-04: 142,
+    2.490459e-04: 142,
+    2.493356e-04: 142,
+    2.495554e-04: 142,
+    2.501548e-04: 142,
+    2.507441e-04: 142,
+    2.517631e-04: 142,
+    2.527021e-04: 142,
+    2.533813e-04: 142,
+    2.549896e-04: 142,
+    2.551095e-04: 142,
+    2.555490e-04: 142,
+    2.565680e-04: 142,
+    2.568577e-04: 142,
+    2.572073e-04: 142,
+    2.575369e-04: 142,
+    2.579465e-04: 142,
+    2.587656e-04: 142,
+    2.594149e-04: 142,
+    2.596247e-04: 142,
+    2.598045e-04: 142,
+    2.605437e-04: 142,
+    2.607036e-04: 142,
+    2.619123e-04: 142,
+    2.621620e-04: 142,
+    2.622619e-04: 142,
+    2.627714e-04: 142,
+    2.631510e-04: 142,
+    2.636804e-04: 142,
+    2.660979e-04: 143,
+    2.670868e-04: 143,
+    2.671667e-04: 143,
+    2.674564e-04: 143,
+    2.684354e-04: 143,
+    2.695842e-04: 143,
+    2.696341e-04: 143,
+    2.700437e-04: 143,
+    2.707929e-04: 143,
+    2.715521e-04: 143,
+    2.727408e-04: 143,
+    2.729606e-04: 143,
+    2.737198e-04: 143,
+    2.743791e-04: 143,
+    2.746588e-04: 143,
+    2.752182e-04: 143,
+    2.758176e-04: 143,
+    2.768065e-04: 143,
+    2.772360e-04: 143,
+    2.773659e-04: 143,
+    2.773959e-04: 143,
+    2.776956e-04: 143,
+    2.778354e-04: 143,
+    2.782550e-04: 143,
+    2.784348e-04: 143,
+    2.787345e-04: 143,
+    2.801030e-04: 143,
+    2.822807e-04: 143,
+    2.829100e-04: 143,
+    2.844484e-04: 144,
+    2.856971e-04: 144,
+    2.872055e-04: 144,
+    2.874352e-04: 144,
+    2.896229e-04: 144,
+    2.905719e-04: 144,
+    2.908017e-04: 144,
+    2.922102e-04: 144,
+    2.964657e-04: 144,
+    2.967454e-04: 144,
+    2.975046e-04: 144,
+    2.980340e-04: 144,
+    2.982837e-04: 144,
+    2.987832e-04: 144,
+    3.004614e-04: 144,
+    3.025892e-04: 144,
+    3.033184e-04: 144,
+    3.034682e-04: 144,
+    3.037779e-04: 144,
+    3.046670e-04: 144,
+    3.053263e-04: 145,
+    3.061154e-04: 145,
+    3.074141e-04: 145,
+    3.088725e-04: 145,
+    3.090923e-04: 145,
+    3.104908e-04: 145,
+    3.131080e-04: 145,
+    3.155454e-04: 145,
+    3.187121e-04: 145,
+    3.197809e-04: 145,
+    3.199408e-04: 145,
+    3.201006e-04: 145,
+    3.202604e-04: 145,
+    3.218587e-04: 145,
+    3.237467e-04: 145,
+    3.255948e-04: 145,
+    3.281920e-04: 146,
+    3.300600e-04: 146,
+    3.301000e-04: 146,
+    3.303597e-04: 146,
+    3.313387e-04: 146,
+    3.338460e-04: 146,
+    3.350448e-04: 146,
+    3.357540e-04: 146,
+    3.371625e-04: 146,
+    3.373523e-04: 146,
+    3.400694e-04: 146,
+    3.402792e-04: 146,
+    3.414180e-04: 146,
+    3.425568e-04: 146,
+    3.435258e-04: 146,
+    3.436456e-04: 146,
+    3.438854e-04: 146,
+    3.445147e-04: 146,
+    3.447245e-04: 146,
+    3.475315e-04: 146,
+    3.486803e-04: 146,
+    3.494095e-04: 146,
+    3.500289e-04: 146,
+    3.504085e-04: 146,
+    3.510678e-04: 146,
+    3.512176e-04: 146,
+    3.514074e-04: 146,
+    3.517371e-04: 146,
+    3.523764e-04: 147,
+    3.531456e-04: 147,
+    3.543543e-04: 147,
+    3.551634e-04: 147,
+    3.563422e-04: 147,
+    3.572013e-04: 147,
+    3.575509e-04: 147,
+    3.593390e-04: 147,
+    3.623558e-04: 147,
+    3.649031e-04: 147,
+    3.693184e-04: 147,
+    3.719656e-04: 147,
+    3.732742e-04: 147,
+    3.750124e-04: 147,
+    3.758415e-04: 147,
+    3.760213e-04: 147,
+    3.770502e-04: 147,
+    3.786585e-04: 148,
+    3.793578e-04: 148,
+    3.796475e-04: 148,
+    3.816453e-04: 148,
+    3.834334e-04: 148,
+    3.861805e-04: 148,
+    3.870596e-04: 148,
+    3.885081e-04: 148,
+    3.888677e-04: 148,
+    3.907057e-04: 148,
+    3.911852e-04: 148,
+    3.922341e-04: 148,
+    3.945417e-04: 148,
+    3.973187e-04: 148,
+    3.987372e-04: 148,
+    4.007551e-04: 148,
+    4.009449e-04: 148,
+    4.023134e-04: 148,
+    4.026331e-04: 148,
+    4.069585e-04: 149,
+    4.074180e-04: 149,
+    4.112639e-04: 149,
+    4.141009e-04: 149,
+    4.150299e-04: 149,
+    4.181966e-04: 149,
+    4.222423e-04: 149,
+    4.225720e-04: 149,
+    4.238606e-04: 149,
+    4.309930e-04: 149,
+    4.323816e-04: 149,
+    4.359078e-04: 149,
+    4.396638e-04: 150,
+    4.405129e-04: 150,
+    4.440492e-04: 150,
+    4.462668e-04: 150,
+    4.499529e-04: 150,
+    4.506921e-04: 150,
+    4.516911e-04: 150,
+    4.523803e-04: 150,
+    4.607615e-04: 150,
+    4.613109e-04: 150,
+    4.617904e-04: 150,
+    4.622499e-04: 150,
+    4.631389e-04: 150,
+    4.655863e-04: 150,
+    4.703912e-04: 151,
+    4.712204e-04: 151,
+    4.736578e-04: 151,
+    4.803906e-04: 151,
+    4.805005e-04: 151,
+    4.828680e-04: 151,
+    4.832276e-04: 151,
+    4.859947e-04: 151,
+    4.887118e-04: 151,
+    4.898606e-04: 151,
+    4.933269e-04: 151,
+    4.959941e-04: 151,
+    5.016581e-04: 151,
+    5.041355e-04: 151,
+    5.074320e-04: 152,
+    5.082311e-04: 152,
+    5.087206e-04: 152,
+    5.142448e-04: 152,
+    5.234350e-04: 152,
+    5.239644e-04: 152,
+    5.240344e-04: 152,
+    5.430842e-04: 153,
+    5.455216e-04: 153,
+    5.573191e-04: 153,
+    5.583979e-04: 153,
+    5.614847e-04: 153,
+    5.617144e-04: 153,
+    5.656802e-04: 153,
+    5.658201e-04: 153,
+    5.682275e-04: 153,
+    5.748605e-04: 153,
+    5.812637e-04: 153,
+    5.896848e-04: 154,
+    5.957184e-04: 154,
+    6.043392e-04: 154,
+    6.054780e-04: 154,
+    6.096836e-04: 154,
+    6.134396e-04: 154,
+    6.174553e-04: 154,
+    6.203223e-04: 154,
+    6.219006e-04: 154,
+    6.220205e-04: 154,
+    6.286534e-04: 155,
+    6.313106e-04: 155,
+    6.572232e-04: 155,
+    6.634366e-04: 155,
+    6.669329e-04: 155,
+    6.689907e-04: 155,
+    6.836451e-04: 156,
+    6.846241e-04: 156,
+    6.866819e-04: 156,
+    6.873312e-04: 156,
+    6.945136e-04: 156,
+    6.987791e-04: 156,
+    7.009168e-04: 156,
+    7.009468e-04: 156,
+    7.106765e-04: 156,
+    7.165902e-04: 156,
+    7.200066e-04: 156,
+    7.210555e-04: 156,
+    7.249414e-04: 157,
+    7.251511e-04: 157,
+    7.369986e-04: 157,
+    7.469380e-04: 157,
+    7.544401e-04: 157,
+    7.811518e-04: 158,
+    7.939682e-04: 158,
+    7.972747e-04: 158,
+    8.070942e-04: 158,
+    8.329368e-04: 158,
+    8.341955e-04: 158,
+    8.398695e-04: 159,
+    8.509477e-04: 159,
+    8.754018e-04: 159,
+    8.818150e-04: 159,
+    8.876888e-04: 159,
+    8.897366e-04: 159,
+    8.905558e-04: 159,
+    8.956504e-04: 159,
+    8.998259e-04: 160,
+    9.012844e-04: 160,
+    9.044610e-04: 160,
+    9.056797e-04: 160,
+    9.125724e-04: 160,
+    9.175771e-04: 160,
+    9.204441e-04: 160,
+    9.310029e-04: 160,
+    9.428603e-04: 160,
+    9.490537e-04: 160,
+    9.592329e-04: 160,
+    9.617802e-04: 160,
+    9.865440e-04: 161,
+    9.940061e-04: 161,
+    1.014095e-03: 161,
+    1.022186e-03: 161,
+    1.085060e-03: 162,
+    1.087307e-03: 162,
+    1.111192e-03: 162,
+    1.170139e-03: 163,
+    1.173346e-03: 163,
+    1.185743e-03: 163,
+    1.186462e-03: 163,
+    1.229566e-03: 164,
+    1.231444e-03: 164,
+    1.239765e-03: 164,
+    1.240265e-03: 164,
+    1.247527e-03: 164,
+    1.250734e-03: 164,
+    1.253111e-03: 164,
+    1.283769e-03: 164,
+    1.294128e-03: 165,
+    1.321359e-03: 165,
+    1.376680e-03: 165,
+    1.381905e-03: 165,
+    1.388807e-03: 166,
+    1.419895e-03: 166,
+    1.432771e-03: 166,
+    1.524643e-03: 167,
+    1.527440e-03: 167,
+    1.536841e-03: 167,
+    1.548168e-03: 167,
+    1.551875e-03: 167,
+    1.559486e-03: 167,
+    1.606557e-03: 168,
+    1.629332e-03: 168,
+    1.632969e-03: 168,
+    1.648412e-03: 168,
+    1.682136e-03: 168,
+    1.711865e-03: 168,
+    1.732343e-03: 169,
+    1.849169e-03: 170,
+    1.969072e-03: 170,
+    2.016502e-03: 171,
+    2.064081e-03: 171,
+    2.093121e-03: 171,
+    2.097206e-03: 171,
+    2.119333e-03: 171,
+    2.140540e-03: 172,
+    2.360707e-03: 173,
+    2.368559e-03: 173,
+    2.492168e-03: 174,
+    2.542964e-03: 174,
+    2.549277e-03: 174,
+    2.591682e-03: 174,
+    2.606426e-03: 174,
+    2.621690e-03: 174,
+    2.684384e-03: 175,
+    2.804047e-03: 175,
+    2.910934e-03: 176,
+    3.224901e-03: 177,
+    3.266676e-03: 177,
+    3.276206e-03: 177,
+    3.325034e-03: 178,
+    3.436816e-03: 178,
+    3.584120e-03: 179,
+    3.704622e-03: 179,
+    3.716400e-03: 179,
+    3.798812e-03: 180,
+    4.130970e-03: 181,
+    4.330159e-03: 181,
+    4.331397e-03: 181,
+    4.449243e-03: 182,
+    4.555889e-03: 182,
+    4.622868e-03: 182,
+    4.627494e-03: 182,
+    4.704502e-03: 183,
+    4.731913e-03: 183,
+    4.776715e-03: 183,
+    5.125346e-03: 184,
+    5.172396e-03: 184,
+    6.513594e-03: 187,
+    6.640759e-03: 187,
+    6.806573e-03: 188,
+    6.948582e-03: 188,
+    7.234300e-03: 189,
+    8.064519e-03: 190,
+    8.508209e-03: 191,
+    9.043641e-03: 192,
+    9.229964e-03: 192,
+    9.978090e-03: 193,
+    1.088405e-02: 194,
+    1.114201e-02: 195,
+    1.881300e-02: 202,
+    2.148607e-02: 204,
+    2.557634e-02: 206,
+    2.680036e-02: 207,
+    2.938674e-02: 208,
+    6.181373e-02: 218,
+}
+
+# Percentile code (1-255) of every relative frequency in the rf tables
+percentile_codes = {
+    9.989408e-09: 68,
+    1.997882e-08: 152,
+    2.996822e-08: 176,
+    3.995763e-08: 188,
+    4.994704e-08: 196,
+    5.993645e-08: 202,
+    6.992586e-08: 206,
+    7.991527e-08: 209,
+    8.990467e-08: 212,
+    9.989408e-08: 214,
+    1.098835e-07: 216,
+    1.198729e-07: 218,
+    1.298623e-07: 220,
+    1.398517e-07: 221,
+    1.498411e-07: 222,
+    1.598305e-07: 223,
+    1.698199e-07: 224,
+    1.798093e-07: 225,
+    1.897988e-07: 226,
+    1.997882e-07: 227,
+    2.097776e-07: 227,
+    2.197670e-07: 228,
+    2.297564e-07: 229,
+    2.397458e-07: 229,
+    2.497352e-07: 230,
+    2.597246e-07: 230,
+    2.697140e-07: 231,
+    2.797034e-07: 231,
+    2.896928e-07: 232,
+    2.996822e-07: 232,
+    3.096717e-07: 232,
+    3.196611e-07: 233,
+    3.296505e-07: 233,
+    3.396399e-07: 233,
+    3.496293e-07: 234,
+    3.596187e-07: 234,
+    3.696081e-07: 234,
+    3.795975e-07: 235,
+    3.895869e-07: 235,
+    3.995763e-07: 235,
+    4.095657e-07: 235,
+    4.195551e-07: 236,
+    4.295446e-07: 236,
+    4.395340e-07: 236,
+    4.495234e-07: 236,
+    4.595128e-07: 237,
+    4.695022e-07: 237,
+    4.794916e-07: 237,
+    4.894810e-07: 237,
+    4.994704e-07: 237,
+    5.094598e-07: 238,
+    5.194492e-07: 238,
+    5.294386e-07: 238,
+    5.394280e-07: 238,
+    5.494175e-07: 238,
+    5.594069e-07: 238,
+    5.693963e-07: 239,
+    5.793857e-07: 239,
+    5.893751e-07: 239,
+    5.993645e-07: 239,
+    6.093539e-07: 239,
+    6.193433e-07: 239,
+    6.293327e-07: 239,
+    6.393221e-07: 240,
+    6.493115e-07: 240,
+    6.593009e-07: 240,
+    6.692904e-07: 240,
+    6.792798e-07: 240,
+    6.892692e-07: 240,
+    6.992586e-07: 240,
+    7.092480e-07: 240,
+    7.192374e-07: 241,
+    7.292268e-07: 241,
+    7.392162e-07: 241,
+    7.492056e-07: 241,
+    7.591950e-07: 241,
+    7.691844e-07: 241,
+    7.791738e-07: 241,
+    7.891633e-07: 241,
+    7.991527e-07: 241,
+    8.091421e-07: 241,
+    8.191315e-07: 242,
+    8.291209e-07: 242,
+    8.391103e-07: 242,
+    8.490997e-07: 242,
+    8.590891e-07: 242,
+    8.690785e-07: 242,
+    8.790679e-07: 242,
+    8.890573e-07: 242,
+    8.990467e-07: 242,
+    9.090362e-07: 242,
+    9.190256e-07: 242,
+    9.290150e-07: 242,
+    9.390044e-07: 243,
+    9.489938e-07: 243,
+    9.589832e-07: 243,
+    9.689726e-07: 243,
+    9.789620e-07: 243,
+    9.889514e-07: 243,
+    9.989408e-07: 243,
+    1.008930e-06: 243,
+    1.018920e-06: 243,
+    1.028909e-06: 243,
+    1.038898e-06: 243,
+    1.048888e-06: 243,
+    1.058877e-06: 243,
+    1.068867e-06: 243,
+    1.078856e-06: 243,
+    1.088846e-06: 244,
+    1.098835e-06: 244,
+    1.108824e-06: 244,
+    1.118814e-06: 244,
+    1.128803e-06: 244,
+    1.138793e-06: 244,
+    1.148782e-06: 244,
+    1.158771e-06: 244,
+    1.168761e-06: 244,
+    1.178750e-06: 244,
+    1.188740e-06: 244,
+    1.198729e-06: 244,
+    1.208718e-06: 244,
+    1.218708e-06: 244,
+    1.228697e-06: 244,
+    1.238687e-06: 244,
+    1.248676e-06: 244,
+    1.258665e-06: 244,
+    1.268655e-06: 244,
+    1.278644e-06: 245,
+    1.288634e-06: 245,
+    1.298623e-06: 245,
+    1.308612e-06: 245,
+    1.318602e-06: 245,
+    1.328591e-06: 245,
+    1.338581e-06: 245,
+    1.348570e-06: 245,
+    1.358560e-06: 245,
+    1.368549e-06: 245,
+    1.378538e-06: 245,
+    1.388528e-06: 245,
+    1.398517e-06: 245,
+    1.408507e-06: 245,
+    1.418496e-06: 245,
+    1.428485e-06: 245,
+    1.438475e-06: 245,
+    1.448464e-06: 245,
+    1.458454e-06: 245,
+    1.468443e-06: 245,
+    1.478432e-06: 245,
+    1.488422e-06: 245,
+    1.498411e-06: 245,
+    1.508401e-06: 246,
+    1.518390e-06: 246,
+    1.528379e-06: 246,
+    1.538369e-06: 246,
+    1.548358e-06: 246,
+    1.558348e-06: 246,
+    1.568337e-06: 246,
+    1.578327e-06: 246,
+    1.588316e-06: 246,
+    1.598305e-06: 246,
+    1.608295e-06: 246,
+    1.618284e-06: 246,
+    1.628274e-06: 246,
+    1.638263e-06: 246,
+    1.648252e-06: 246,
+    1.658242e-06: 246,
+    1.668231e-06: 246,
+    1.678221e-06: 246,
+    1.688210e-06: 246,
+    1.698199e-06: 246,
+    1.708189e-06: 246,
+    1.718178e-06: 246,
+    1.728168e-06: 246,
+    1.738157e-06: 246,
+    1.748146e-06: 246,
+    1.758136e-06: 246,
+    1.768125e-06: 246,
+    1.778115e-06: 246,
+    1.788104e-06: 246,
+    1.798093e-06: 246,
+    1.808083e-06: 246,
+    1.818072e-06: 246,
+    1.828062e-06: 247,
+    1.838051e-06: 247,
+    1.848041e-06: 247,
+    1.858030e-06: 247,
+    1.868019e-06: 247,
+    1.878009e-06: 247,
+    1.887998e-06: 247,
+    1.897988e-06: 247,
+    1.907977e-06: 247,
+    1.917966e-06: 247,
+    1.927956e-06: 247,
+    1.937945e-06: 247,
+    1.947935e-06: 247,
+    1.957924e-06: 247,
+    1.967913e-06: 247,
+    1.977903e-06: 247,
+    1.987892e-06: 247,
+    1.997882e-06: 247,
+    2.007871e-06: 247,
+    2.017860e-06: 247,
+    2.027850e-06: 247,
+    2.037839e-06: 247,
+    2.047829e-06: 247,
+    2.057818e-06: 247,
+    2.067808e-06: 247,
+    2.077797e-06: 247,
+    2.087786e-06: 247,
+    2.097776e-06: 247,
+    2.107765e-06: 247,
+    2.117755e-06: 247,
+    2.127744e-06: 247,
+    2.137733e-06: 247,
+    2.147723e-06: 247,
+    2.157712e-06: 247,
+    2.167702e-06: 247,
+    2.177691e-06: 247,
+    2.187680e-06: 247,
+    2.197670e-06: 247,
+    2.207659e-06: 247,
+    2.217649e-06: 247,
+    2.227638e-06: 247,
+    2.237627e-06: 247,
+    2.247617e-06: 248,
+    2.257606e-06: 248,
+    2.267596e-06: 248,
+    2.277585e-06: 248,
+    2.287575e-06: 248,
+    2.297564e-06: 248,
+    2.307553e-06: 248,
+    2.317543e-06: 248,
+    2.327532e-06: 248,
+    2.337522e-06: 248,
+    2.347511e-06: 248,
+    2.357500e-06: 248,
+    2.367490e-06: 248,
+    2.377479e-06: 248,
+    2.387469e-06: 248,
+    2.397458e-06: 248,
+    2.407447e-06: 248,
+    2.417437e-06: 248,
+    2.427426e-06: 248,
+    2.437416e-06: 248,
+    2.447405e-06: 248,
+    2.457394e-06: 248,
+    2.467384e-06: 248,
+    2.477373e-06: 248,
+    2.487363e-06: 248,
+    2.497352e-06: 248,
+    2.507341e-06: 248,
+    2.517331e-06: 248,
+    2.527320e-06: 248,
+    2.537310e-06: 248,
+    2.547299e-06: 248,
+    2.557289e-06: 248,
+    2.567278e-06: 248,
+    2.577267e-06: 248,
+    2.587257e-06: 248,
+    2.597246e-06: 248,
+    2.607236e-06: 248,
+    2.617225e-06: 248,
+    2.627214e-06: 248,
+    2.637204e-06: 248,
+    2.647193e-06: 248,
+    2.657183e-06: 248,
+    2.667172e-06: 248,
+    2.677161e-06: 248,
+    2.687151e-06: 248,
+    2.697140e-06: 248,
+    2.707130e-06: 248,
+    2.717119e-06: 248,
+    2.727108e-06: 248,
+    2.737098e-06: 248,
+    2.747087e-06: 248,
+    2.757077e-06: 248,
+    2.767066e-06: 248,
+    2.777056e-06: 248,
+    2.787045e-06: 248,
+    2.797034e-06: 248,
+    2.807024e-06: 248,
+    2.817013e-06: 248,
+    2.827003e-06: 248,
+    2.836992e-06: 249,
+    2.846981e-06: 249,
+    2.856971e-06: 249,
+    2.866960e-06: 249,
+    2.876950e-06: 249,
+    2.886939e-06: 249,
+    2.896928e-06: 249,
+    2.906918e-06: 249,
+    2.916907e-06: 249,
+    2.926897e-06: 249,
+    2.936886e-06: 249,
+    2.946875e-06: 249,
+    2.956865e-06: 249,
+    2.966854e-06: 249,
+    2.976844e-06: 249,
+    2.986833e-06: 249,
+    2.996822e-06: 249,
+    3.006812e-06: 249,
+    3.016801e-06: 249,
+    3.026791e-06: 249,
+    3.036780e-06: 249,
+    3.046770e-06: 249,
+    3.056759e-06: 249,
+    3.066748e-06: 249,
+    3.076738e-06: 249,
+    3.086727e-06: 249,
+    3.096717e-06: 249,
+    3.106706e-06: 249,
+    3.116695e-06: 249,
+    3.126685e-06: 249,
+    3.136674e-06: 249,
+    3.146664e-06: 249,
+    3.156653e-06: 249,
+    3.166642e-06: 249,
+    3.176632e-06: 249,
+    3.186621e-06: 249,
+    3.196611e-06: 249,
+    3.206600e-06: 249,
+    3.216589e-06: 249,
+    3.226579e-06: 249,
+    3.236568e-06: 249,
+    3.246558e-06: 249,
+    3.256547e-06: 249,
+    3.266537e-06: 249,
+    3.276526e-06: 249,
+    3.286515e-06: 249,
+    3.296505e-06: 249,
+    3.306494e-06: 249,
+    3.316484e-06: 249,
+    3.326473e-06: 249,
+    3.336462e-06: 249,
+    3.346452e-06: 249,
+    3.356441e-06: 249,
+    3.366431e-06: 249,
+    3.376420e-06: 249,
+    3.386409e-06: 249,
+    3.396399e-06: 249,
+    3.406388e-06: 249,
+    3.416378e-06: 249,
+    3.426367e-06: 249,
+    3.436356e-06: 249,
+    3.446346e-06: 249,
+    3.456335e-06: 249,
+    3.466325e-06: 249,
+    3.476314e-06: 249,
+    3.486304e-06: 249,
+    3.496293e-06: 249,
+    3.506282e-06: 249,
+    3.516272e-06: 249,
+    3.526261e-06: 249,
+    3.536251e-06: 249,
+    3.546240e-06: 249,
+    3.556229e-06: 249,
+    3.566219e-06: 249,
+    3.576208e-06: 249,
+    3.586198e-06: 249,
+    3.596187e-06: 249,
+    3.606176e-06: 249,
+    3.616166e-06: 249,
+    3.626155e-06: 249,
+    3.636145e-06: 249,
+    3.646134e-06: 249,
+    3.656123e-06: 249,
+    3.666113e-06: 250,
+    3.676102e-06: 250,
+    3.686092e-06: 250,
+    3.696081e-06: 250,
+    3.706070e-06: 250,
+    3.716060e-06: 250,
+    3.726049e-06: 250,
+    3.736039e-06: 250,
+    3.746028e-06: 250,
+    3.756018e-06: 250,
+    3.766007e-06: 250,
+    3.775996e-06: 250,
+    3.785986e-06: 250,
+    3.795975e-06: 250,
+    3.805965e-06: 250,
+    3.815954e-06: 250,
+    3.825943e-06: 250,
+    3.835933e-06: 250,
+    3.845922e-06: 250,
+    3.855912e-06: 250,
+    3.865901e-06: 250,
+    3.875890e-06: 250,
+    3.885880e-06: 250,
+    3.895869e-06: 250,
+    3.905859e-06: 250,
+    3.915848e-06: 250,
+    3.925837e-06: 250,
+    3.935827e-06: 250,
+    3.945816e-06: 250,
+    3.955806e-06: 250,
+    3.965795e-06: 250,
+    3.975785e-06: 250,
+    3.985774e-06: 250,
+    3.995763e-06: 250,
+    4.005753e-06: 250,
+    4.015742e-06: 250,
+    4.025732e-06: 250,
+    4.035721e-06: 250,
+    4.045710e-06: 250,
+    4.055700e-06: 250,
+    4.065689e-06: 250,
+    4.075679e-06: 250,
+    4.085668e-06: 250,
+    4.095657e-06: 250,
+    4.105647e-06: 250,
+    4.115636e-06: 250,
+    4.125626e-06: 250,
+    4.135615e-06: 250,
+    4.145604e-06: 250,
+    4.155594e-06: 250,
+    4.165583e-06: 250,
+    4.175573e-06: 250,
+    4.185562e-06: 250,
+    4.195551e-06: 250,
+    4.205541e-06: 250,
+    4.215530e-06: 250,
+    4.225520e-06: 250,
+    4.235509e-06: 250,
+    4.245499e-06: 250,
+    4.255488e-06: 250,
+    4.265477e-06: 250,
+    4.275467e-06: 250,
+    4.285456e-06: 250,
+    4.295446e-06: 250,
+    4.305435e-06: 250,
+    4.315424e-06: 250,
+    4.325414e-06: 250,
+    4.335403e-06: 250,
+    4.345393e-06: 250,
+    4.355382e-06: 250,
+    4.365371e-06: 250,
+    4.375361e-06: 250,
+    4.385350e-06: 250,
+    4.395340e-06: 250,
+    4.405329e-06: 250,
+    4.415318e-06: 250,
+    4.425308e-06: 250,
+    4.435297e-06: 250,
+    4.445287e-06: 250,
+    4.455276e-06: 250,
+    4.465266e-06: 250,
+    4.475255e-06: 250,
+    4.485244e-06: 250,
+    4.495234e-06: 250,
+    4.505223e-06: 250,
+    4.515213e-06: 250,
+    4.525202e-06: 250,
+    4.535191e-06: 250,
+    4.545181e-06: 250,
+    4.555170e-06: 250,
+    4.565160e-06: 250,
+    4.575149e-06: 250,
+    4.585138e-06: 250,
+    4.595128e-06: 250,
+    4.605117e-06: 250,
+    4.615107e-06: 250,
+    4.625096e-06: 250,
+    4.635085e-06: 250,
+    4.645075e-06: 250,
+    4.655064e-06: 250,
+    4.665054e-06: 250,
+    4.675043e-06: 250,
+    4.685033e-06: 250,
+    4.695022e-06: 250,
+    4.705011e-06: 250,
+    4.715001e-06: 250,
+    4.724990e-06: 250,
+    4.734980e-06: 250,
+    4.744969e-06: 250,
+    4.754958e-06: 250,
+    4.764948e-06: 250,
+    4.774937e-06: 250,
+    4.784927e-06: 250,
+    4.794916e-06: 250,
+    4.804905e-06: 250,
+    4.814895e-06: 250,
+    4.824884e-06: 250,
+    4.834874e-06: 250,
+    4.844863e-06: 250,
+    4.854852e-06: 250,
+    4.864842e-06: 250,
+    4.874831e-06: 250,
+    4.884821e-06: 250,
+    4.894810e-06: 250,
+    4.904799e-06: 250,
+    4.914789e-06: 250,
+    4.924778e-06: 250,
+    4.934768e-06: 250,
+    4.944757e-06: 250,
+    4.954747e-06: 250,
+    4.964736e-06: 250,
+    4.974725e-06: 250,
+    4.984715e-06: 250,
+    4.994704e-06: 250,
+    5.004694e-06: 250,
+    5.014683e-06: 250,
+    5.024672e-06: 250,
+    5.034662e-06: 250,
+    5.044651e-06: 251,
+    5.054641e-06: 251,
+    5.064630e-06: 251,
+    5.074619e-06: 251,
+    5.084609e-06: 251,
+    5.094598e-06: 251,
+    5.104588e-06: 251,
+    5.114577e-06: 251,
+    5.124566e-06: 251,
+    5.134556e-06: 251,
+    5.144545e-06: 251,
+    5.154535e-06: 251,
+    5.164524e-06: 251,
+    5.174514e-06: 251,
+    5.184503e-06: 251,
+    5.194492e-06: 251,
+    5.204482e-06: 251,
+    5.214471e-06: 251,
+    5.224461e-06: 251,
+    5.234450e-06: 251,
+    5.244439e-06: 251,
+    5.254429e-06: 251,
+    5.264418e-06: 251,
+    5.274408e-06: 251,
+    5.284397e-06: 251,
+    5.294386e-06: 251,
+    5.304376e-06: 251,
+    5.314365e-06: 251,
+    5.324355e-06: 251,
+    5.334344e-06: 251,
+    5.344333e-06: 251,
+    5.354323e-06: 251,
+    5.364312e-06: 251,
+    5.374302e-06: 251,
+    5.384291e-06: 251,
+    5.394280e-06: 251,
+    5.404270e-06: 251,
+    5.414259e-06: 251,
+    5.424249e-06: 251,
+    5.434238e-06: 251,
+    5.444228e-06: 251,
+    5.454217e-06: 251,
+    5.464206e-06: 251,
+    5.474196e-06: 251,
+    5.484185e-06: 251,
+    5.494175e-06: 251,
+    5.504164e-06: 251,
+    5.514153e-06: 251,
+    5.524143e-06: 251,
+    5.534132e-06: 251,
+    5.544122e-06: 251,
+    5.554111e-06: 251,
+    5.564100e-06: 251,
+    5.574090e-06: 251,
+    5.584079e-06: 251,
+    5.594069e-06: 251,
+    5.604058e-06: 251,
+    5.614047e-06: 251,
+    5.624037e-06: 251,
+    5.634026e-06: 251,
+    5.644016e-06: 251,
+    5.654005e-06: 251,
+    5.663995e-06: 251,
+    5.673984e-06: 251,
+    5.683973e-06: 251,
+    5.693963e-06: 251,
+    5.703952e-06: 251,
+    5.713942e-06: 251,
+    5.723931e-06: 251,
+    5.733920e-06: 251,
+    5.743910e-06: 251,
+    5.753899e-06: 251,
+    5.763889e-06: 251,
+    5.773878e-06: 251,
+    5.783867e-06: 251,
+    5.793857e-06: 251,
+    5.803846e-06: 251,
+    5.813836e-06: 251,
+    5.823825e-06: 251,
+    5.833814e-06: 251,
+    5.843804e-06: 251,
+    5.853793e-06: 251,
+    5.863783e-06: 251,
+    5.873772e-06: 251,
+    5.883762e-06: 251,
+    5.893751e-06: 251,
+    5.903740e-06: 251,
+    5.913730e-06: 251,
+    5.923719e-06: 251,
+    5.933709e-06: 251,
+    5.943698e-06: 251,
+    5.953687e-06: 251,
+    5.963677e-06: 251,
+    5.973666e-06: 251,
+    5.983656e-06: 251,
+    5.993645e-06: 251,
+    6.003634e-06: 251,
+    6.013624e-06: 251,
+    6.023613e-06: 251,
+    6.033603e-06: 251,
+    6.043592e-06: 251,
+    6.053581e-06: 251,
+    6.063571e-06: 251,
+    6.073560e-06: 251,
+    6.083550e-06: 251,
+    6.093539e-06: 251,
+    6.103528e-06: 251,
+    6.113518e-06: 251,
+    6.123507e-06: 251,
+    6.133497e-06: 251,
+    6.143486e-06: 251,
+    6.153476e-06: 251,
+    6.163465e-06: 251,
+    6.173454e-06: 251,
+    6.183444e-06: 251,
+    6.193433e-06: 251,
+    6.203423e-06: 251,
+    6.213412e-06: 251,
+    6.223401e-06: 251,
+    6.233391e-06: 251,
+    6.243380e-06: 251,
+    6.253370e-06: 251,
+    6.263359e-06: 251,
+    6.273348e-06: 251,
+    6.283338e-06: 251,
+    6.293327e-06: 251,
+    6.303317e-06: 251,
+    6.313306e-06: 251,
+    6.323295e-06: 251,
+    6.333285e-06: 251,
+    6.343274e-06: 251,
+    6.353264e-06: 251,
+    6.363253e-06: 251,
+    6.373243e-06: 251,
+    6.383232e-06: 251,
+    6.393221e-06: 251,
+    6.403211e-06: 251,
+    6.413200e-06: 251,
+    6.423190e-06: 251,
+    6.433179e-06: 251,
+    6.443168e-06: 251,
+    6.453158e-06: 251,
+    6.463147e-06: 251,
+    6.473137e-06: 251,
+    6.483126e-06: 251,
+    6.493115e-06: 251,
+    6.503105e-06: 251,
+    6.513094e-06: 251,
+    6.523084e-06: 251,
+    6.533073e-06: 251,
+    6.543062e-06: 251,
+    6.553052e-06: 251,
+    6.563041e-06: 251,
+    6.573031e-06: 251,
+    6.583020e-06: 251,
+    6.593009e-06: 251,
+    6.602999e-06: 251,
+    6.612988e-06: 251,
+    6.622978e-06: 251,
+    6.632967e-06: 251,
+    6.642957e-06: 251,
+    6.652946e-06: 251,
+    6.662935e-06: 251,
+    6.672925e-06: 251,
+    6.682914e-06: 251,
+    6.692904e-06: 251,
+    6.702893e-06: 251,
+    6.712882e-06: 251,
+    6.722872e-06: 251,
+    6.732861e-06: 251,
+    6.742851e-06: 251,
+    6.752840e-06: 251,
+    6.762829e-06: 251,
+    6.772819e-06: 251,
+    6.782808e-06: 251,
+    6.792798e-06: 251,
+    6.802787e-06: 251,
+    6.812776e-06: 251,
+    6.822766e-06: 251,
+    6.832755e-06: 251,
+    6.842745e-06: 251,
+    6.852734e-06: 251,
+    6.862724e-06: 251,
+    6.872713e-06: 251,
+    6.882702e-06: 251,
+    6.892692e-06: 251,
+    6.902681e-06: 251,
+    6.912671e-06: 251,
+    6.922660e-06: 251,
+    6.932649e-06: 251,
+    6.942639e-06: 251,
+    6.952628e-06: 251,
+    6.962618e-06: 251,
+    6.972607e-06: 251,
+    6.982596e-06: 251,
+    6.992586e-06: 251,
+    7.002575e-06: 251,
+    7.012565e-06: 251,
+    7.022554e-06: 251,
+    7.032543e-06: 251,
+    7.042533e-06: 251,
+    7.052522e-06: 251,
+    7.062512e-06: 251,
+    7.072501e-06: 251,
+    7.082491e-06: 251,
+    7.092480e-06: 251,
+    7.102469e-06: 251,
+    7.112459e-06: 251,
+    7.122448e-06: 251,
+    7.132438e-06: 251,
+    7.142427e-06: 251,
+    7.152416e-06: 251,
+    7.162406e-06: 251,
+    7.172395e-06: 251,
+    7.182385e-06: 251,
+    7.192374e-06: 251,
+    7.202363e-06: 251,
+    7.212353e-06: 251,
+    7.222342e-06: 251,
+    7.232332e-06: 251,
+    7.242321e-06: 251,
+    7.252310e-06: 251,
+    7.262300e-06: 251,
+    7.272289e-06: 251,
+    7.282279e-06: 251,
+    7.292268e-06: 251,
+    7.302257e-06: 251,
+    7.312247e-06: 252,
+    7.322236e-06: 252,
+    7.332226e-06: 252,
+    7.342215e-06: 252,
+    7.352205e-06: 252,
+    7.362194e-06: 252,
+    7.372183e-06: 252,
+    7.382173e-06: 252,
+    7.392162e-06: 252,
+    7.402152e-06: 252,
+    7.412141e-06: 252,
+    7.422130e-06: 252,
+    7.432120e-06: 252,
+    7.442109e-06: 252,
+    7.452099e-06: 252,
+    7.462088e-06: 252,
+    7.472077e-06: 252,
+    7.482067e-06: 252,
+    7.492056e-06: 252,
+    7.502046e-06: 252,
+    7.512035e-06: 252,
+    7.522024e-06: 252,
+    7.532014e-06: 252,
+    7.542003e-06: 252,
+    7.551993e-06: 252,
+    7.561982e-06: 252,
+    7.571972e-06: 252,
+    7.581961e-06: 252,
+    7.591950e-06: 252,
+    7.601940e-06: 252,
+    7.611929e-06: 252,
+    7.621919e-06: 252,
+    7.631908e-06: 252,
+    7.641897e-06: 252,
+    7.651887e-06: 252,
+    7.661876e-06: 252,
+    7.671866e-06: 252,
+    7.681855e-06: 252,
+    7.691844e-06: 252,
+    7.701834e-06: 252,
+    7.711823e-06: 252,
+    7.721813e-06: 252,
+    7.731802e-06: 252,
+    7.741791e-06: 252,
+    7.751781e-06: 252,
+    7.761770e-06: 252,
+    7.771760e-06: 252,
+    7.781749e-06: 252,
+    7.791738e-06: 252,
+    7.801728e-06: 252,
+    7.811717e-06: 252,
+    7.821707e-06: 252,
+    7.831696e-06: 252,
+    7.841686e-06: 252,
+    7.851675e-06: 252,
+    7.861664e-06: 252,
+    7.871654e-06: 252,
+    7.881643e-06: 252,
+    7.891633e-06: 252,
+    7.901622e-06: 252,
+    7.911611e-06: 252,
+    7.921601e-06: 252,
+    7.931590e-06: 252,
+    7.941580e-06: 252,
+    7.951569e-06: 252,
+    7.961558e-06: 252,
+    7.971548e-06: 252,
+    7.981537e-06: 252,
+    7.991527e-06: 252,
+    8.001516e-06: 252,
+    8.011505e-06: 252,
+    8.021495e-06: 252,
+    8.031484e-06: 252,
+    8.041474e-06: 252,
+    8.051463e-06: 252,
+    8.061453e-06: 252,
+    8.071442e-06: 252,
+    8.081431e-06: 252,
+    8.091421e-06: 252,
+    8.101410e-06: 252,
+    8.111400e-06: 252,
+    8.121389e-06: 252,
+    8.131378e-06: 252,
+    8.141368e-06: 252,
+    8.151357e-06: 252,
+    8.161347e-06: 252,
+    8.171336e-06: 252,
+    8.181325e-06: 252,
+    8.191315e-06: 252,
+    8.201304e-06: 252,
+    8.211294e-06: 252,
+    8.221283e-06: 252,
+    8.231272e-06: 252,
+    8.241262e-06: 252,
+    8.251251e-06: 252,
+    8.261241e-06: 252,
+    8.271230e-06: 252,
+    8.281220e-06: 252,
+    8.291209e-06: 252,
+    8.301198e-06: 252,
+    8.311188e-06: 252,
+    8.321177e-06: 252,
+    8.331167e-06: 252,
+    8.341156e-06: 252,
+    8.351145e-06: 252,
+    8.361135e-06: 252,
+    8.371124e-06: 252,
+    8.381114e-06: 252,
+    8.391103e-06: 252,
+    8.401092e-06: 252,
+    8.411082e-06: 252,
+    8.421071e-06: 252,
+    8.431061e-06: 252,
+    8.441050e-06: 252,
+    8.451039e-06: 252,
+    8.461029e-06: 252,
+    8.471018e-06: 252,
+    8.481008e-06: 252,
+    8.490997e-06: 252,
+    8.500986e-06: 252,
+    8.510976e-06: 252,
+    8.520965e-06: 252,
+    8.530955e-06: 252,
+    8.540944e-06: 252,
+    8.550934e-06: 252,
+    8.560923e-06: 252,
+    8.570912e-06: 252,
+    8.580902e-06: 252,
+    8.590891e-06: 252,
+    8.600881e-06: 252,
+    8.610870e-06: 252,
+    8.620859e-06: 252,
+    8.630849e-06: 252,
+    8.640838e-06: 252,
+    8.650828e-06: 252,
+    8.660817e-06: 252,
+    8.670806e-06: 252,
+    8.680796e-06: 252,
+    8.690785e-06: 252,
+    8.700775e-06: 252,
+    8.710764e-06: 252,
+    8.720753e-06: 252,
+    8.730743e-06: 252,
+    8.740732e-06: 252,
+    8.750722e-06: 252,
+    8.760711e-06: 252,
+    8.770701e-06: 252,
+    8.780690e-06: 252,
+    8.790679e-06: 252,
+    8.800669e-06: 252,
+    8.810658e-06: 252,
+    8.820648e-06: 252,
+    8.830637e-06: 252,
+    8.840626e-06: 252,
+    8.850616e-06: 252,
+    8.860605e-06: 252,
+    8.870595e-06: 252,
+    8.880584e-06: 252,
+    8.890573e-06: 252,
+    8.900563e-06: 252,
+    8.910552e-06: 252,
+    8.920542e-06: 252,
+    8.930531e-06: 252,
+    8.940520e-06: 252,
+    8.950510e-06: 252,
+    8.960499e-06: 252,
+    8.970489e-06: 252,
+    8.980478e-06: 252,
+    8.990467e-06: 252,
+    9.000457e-06: 252,
+    9.010446e-06: 252,
+    9.020436e-06: 252,
+    9.030425e-06: 252,
+    9.040415e-06: 252,
+    9.050404e-06: 252,
+    9.060393e-06: 252,
+    9.070383e-06: 252,
+    9.080372e-06: 252,
+    9.090362e-06: 252,
+    9.100351e-06: 252,
+    9.110340e-06: 252,
+    9.120330e-06: 252,
+    9.130319e-06: 252,
+    9.140309e-06: 252,
+    9.150298e-06: 252,
+    9.160287e-06: 252,
+    9.170277e-06: 252,
+    9.180266e-06: 252,
+    9.190256e-06: 252,
+    9.200245e-06: 252,
+    9.210234e-06: 252,
+    9.220224e-06: 252,
+    9.230213e-06: 252,
+    9.240203e-06: 252,
+    9.250192e-06: 252,
+    9.260182e-06: 252,
+    9.270171e-06: 252,
+    9.280160e-06: 252,
+    9.290150e-06: 252,
+    9.300139e-06: 252,
+    9.310129e-06: 252,
+    9.320118e-06: 252,
+    9.330107e-06: 252,
+    9.350086e-06: 252,
+    9.360076e-06: 252,
+    9.370065e-06: 252,
+    9.380054e-06: 252,
+    9.390044e-06: 252,
+    9.400033e-06: 252,
+    9.410023e-06: 252,
+    9.420012e-06: 252,
+    9.430001e-06: 252,
+    9.439991e-06: 252,
+    9.449980e-06: 252,
+    9.459970e-06: 252,
+    9.469959e-06: 252,
+    9.479949e-06: 252,
+    9.489938e-06: 252,
+    9.499927e-06: 252,
+    9.509917e-06: 252,
+    9.519906e-06: 252,
+    9.529896e-06: 252,
+    9.539885e-06: 252,
+    9.549874e-06: 252,
+    9.559864e-06: 252,
+    9.569853e-06: 252,
+    9.579843e-06: 252,
+    9.589832e-06: 252,
+    9.599821e-06: 252,
+    9.609811e-06: 252,
+    9.619800e-06: 252,
+    9.629790e-06: 252,
+    9.639779e-06: 252,
+    9.649768e-06: 252,
+    9.659758e-06: 252,
+    9.669747e-06: 252,
+    9.679737e-06: 252,
+    9.689726e-06: 252,
+    9.699715e-06: 252,
+    9.709705e-06: 252,
+    9.719694e-06: 252,
+    9.729684e-06: 252,
+    9.739673e-06: 252,
+    9.749663e-06: 252,
+    9.759652e-06: 252,
+    9.769641e-06: 252,
+    9.779631e-06: 252,
+    9.789620e-06: 252,
+    9.799610e-06: 252,
+    9.809599e-06: 252,
+    9.819588e-06: 252,
+    9.829578e-06: 252,
+    9.839567e-06: 252,
+    9.849557e-06: 252,
+    9.859546e-06: 252,
+    9.869535e-06: 252,
+    9.879525e-06: 252,
+    9.889514e-06: 252,
+    9.899504e-06: 252,
+    9.909493e-06: 252,
+    9.919482e-06: 252,
+    9.929472e-06: 252,
+    9.939461e-06: 252,
+    9.949451e-06: 252,
+    9.959440e-06: 252,
+    9.969430e-06: 252,
+    9.979419e-06: 252,
+    9.989408e-06: 252,
+    9.999398e-06: 252,
+    1.000939e-05: 252,
+    1.001938e-05: 252,
+    1.002937e-05: 252,
+    1.003936e-05: 252,
+    1.004934e-05: 252,
+    1.005933e-05: 252,
+    1.006932e-05: 252,
+    1.007931e-05: 252,
+    1.008930e-05: 252,
+    1.009929e-05: 252,
+    1.010928e-05: 252,
+    1.011927e-05: 252,
+    1.012926e-05: 252,
+    1.013925e-05: 252,
+    1.014924e-05: 252,
+    1.015923e-05: 252,
+    1.016922e-05: 252,
+    1.017921e-05: 252,
+    1.018920e-05: 252,
+    1.019919e-05: 252,
+    1.020918e-05: 252,
+    1.021916e-05: 252,
+    1.022915e-05: 252,
+    1.023914e-05: 252,
+    1.024913e-05: 252,
+    1.025912e-05: 252,
+    1.026911e-05: 252,
+    1.027910e-05: 252,
+    1.028909e-05: 252,
+    1.029908e-05: 252,
+    1.030907e-05: 252,
+    1.031906e-05: 252,
+    1.032905e-05: 252,
+    1.033904e-05: 252,
+    1.034903e-05: 252,
+    1.035902e-05: 252,
+    1.036901e-05: 252,
+    1.037900e-05: 252,
+    1.038898e-05: 252,
+    1.039897e-05: 252,
+    1.040896e-05: 252,
+    1.041895e-05: 252,
+    1.042894e-05: 252,
+    1.043893e-05: 252,
+    1.044892e-05: 252,
+    1.045891e-05: 252,
+    1.046890e-05: 252,
+    1.047889e-05: 252,
+    1.048888e-05: 252,
+    1.049887e-05: 252,
+    1.050886e-05: 252,
+    1.051885e-05: 252,
+    1.052884e-05: 252,
+    1.053883e-05: 252,
+    1.054882e-05: 252,
+    1.055880e-05: 252,
+    1.056879e-05: 252,
+    1.057878e-05: 252,
+    1.058877e-05: 252,
+    1.059876e-05: 252,
+    1.060875e-05: 252,
+    1.061874e-05: 252,
+    1.062873e-05: 252,
+    1.063872e-05: 252,
+    1.064871e-05: 252,
+    1.065870e-05: 252,
+    1.066869e-05: 252,
+    1.067868e-05: 252,
+    1.068867e-05: 252,
+    1.069866e-05: 252,
+    1.070865e-05: 252,
+    1.071864e-05: 252,
+    1.072862e-05: 252,
+    1.073861e-05: 252,
+    1.074860e-05: 252,
+    1.075859e-05: 252,
+    1.076858e-05: 252,
+    1.077857e-05: 252,
+    1.078856e-05: 252,
+    1.079855e-05: 252,
+    1.080854e-05: 252,
+    1.081853e-05: 252,
+    1.082852e-05: 252,
+    1.083851e-05: 252,
+    1.084850e-05: 252,
+    1.085849e-05: 252,
+    1.086848e-05: 252,
+    1.087847e-05: 252,
+    1.088846e-05: 252,
+    1.089844e-05: 252,
+    1.090843e-05: 252,
+    1.091842e-05: 252,
+    1.092841e-05: 252,
+    1.093840e-05: 252,
+    1.094839e-05: 252,
+    1.095838e-05: 252,
+    1.096837e-05: 252,
+    1.097836e-05: 252,
+    1.098835e-05: 252,
+    1.099834e-05: 252,
+    1.100833e-05: 252,
+    1.101832e-05: 252,
+    1.102831e-05: 252,
+    1.103830e-05: 252,
+    1.104829e-05: 252,
+    1.105828e-05: 252,
+    1.106826e-05: 252,
+    1.107825e-05: 252,
+    1.108824e-05: 252,
+    1.109823e-05: 252,
+    1.110822e-05: 252,
+    1.111821e-05: 252,
+    1.112820e-05: 252,
+    1.113819e-05: 252,
+    1.114818e-05: 252,
+    1.115817e-05: 252,
+    1.116816e-05: 252,
+    1.117815e-05: 252,
+    1.118814e-05: 252,
+    1.119813e-05: 252,
+    1.120812e-05: 252,
+    1.121811e-05: 252,
+    1.122809e-05: 252,
+    1.123808e-05: 252,
+    1.124807e-05: 252,
+    1.125806e-05: 252,
+    1.126805e-05: 252,
+    1.127804e-05: 252,
+    1.129802e-05: 252,
+    1.130801e-05: 252,
+    1.131800e-05: 252,
+    1.132799e-05: 252,
+    1.133798e-05: 252,
+    1.134797e-05: 252,
+    1.135796e-05: 252,
+    1.136795e-05: 252,
+    1.137794e-05: 252,
+    1.138793e-05: 252,
+    1.139791e-05: 252,
+    1.140790e-05: 252,
+    1.141789e-05: 252,
+    1.142788e-05: 252,
+    1.143787e-05: 252,
+    1.144786e-05: 252,
+    1.145785e-05: 252,
+    1.146784e-05: 252,
+    1.147783e-05: 252,
+    1.148782e-05: 252,
+    1.149781e-05: 252,
+    1.150780e-05: 252,
+    1.151779e-05: 252,
+    1.152778e-05: 252,
+    1.153777e-05: 252,
+    1.154776e-05: 252,
+    1.155775e-05: 252,
+    1.156773e-05: 252,
+    1.157772e-05: 252,
+    1.158771e-05: 252,
+    1.159770e-05: 252,
+    1.160769e-05: 252,
+    1.161768e-05: 252,
+    1.162767e-05: 252,
+    1.163766e-05: 252,
+    1.164765e-05: 252,
+    1.165764e-05: 252,
+    1.166763e-05: 252,
+    1.167762e-05: 252,
+    1.168761e-05: 252,
+    1.169760e-05: 252,
+    1.170759e-05: 252,
+    1.171758e-05: 252,
+    1.172757e-05: 252,
+    1.173755e-05: 252,
+    1.174754e-05: 252,
+    1.175753e-05: 252,
+    1.176752e-05: 252,
+    1.178750e-05: 252,
+    1.179749e-05: 252,
+    1.180748e-05: 252,
+    1.181747e-05: 252,
+    1.182746e-05: 252,
+    1.183745e-05: 252,
+    1.184744e-05: 252,
+    1.185743e-05: 252,
+    1.186742e-05: 252,
+    1.187741e-05: 252,
+    1.188740e-05: 252,
+    1.189739e-05: 252,
+    1.190737e-05: 252,
+    1.191736e-05: 252,
+    1.192735e-05: 253,
+    1.193734e-05: 253,
+    1.194733e-05: 253,
+    1.195732e-05: 253,
+    1.196731e-05: 253,
+    1.197730e-05: 253,
+    1.198729e-05: 253,
+    1.199728e-05: 253,
+    1.200727e-05: 253,
+    1.201726e-05: 253,
+    1.202725e-05: 253,
+    1.203724e-05: 253,
+    1.204723e-05: 253,
+    1.205722e-05: 253,
+    1.206721e-05: 253,
+    1.207719e-05: 253,
+    1.208718e-05: 253,
+    1.209717e-05: 253,
+    1.210716e-05: 253,
+    1.212714e-05: 253,
+    1.213713e-05: 253,
+    1.214712e-05: 253,
+    1.215711e-05: 253,
+    1.216710e-05: 253,
+    1.217709e-05: 253,
+    1.218708e-05: 253,
+    1.219707e-05: 253,
+    1.220706e-05: 253,
+    1.221705e-05: 253,
+    1.222704e-05: 253,
+    1.223703e-05: 253,
+    1.224701e-05: 253,
+    1.225700e-05: 253,
+    1.226699e-05: 253,
+    1.227698e-05: 253,
+    1.228697e-05: 253,
+    1.229696e-05: 253,
+    1.230695e-05: 253,
+    1.231694e-05: 253,
+    1.232693e-05: 253,
+    1.233692e-05: 253,
+    1.234691e-05: 253,
+    1.235690e-05: 253,
+    1.236689e-05: 253,
+    1.237688e-05: 253,
+    1.238687e-05: 253,
+    1.239686e-05: 253,
+    1.240685e-05: 253,
+    1.241683e-05: 253,
+    1.242682e-05: 253,
+    1.243681e-05: 253,
+    1.244680e-05: 253,
+    1.245679e-05: 253,
+    1.246678e-05: 253,
+    1.247677e-05: 253,
+    1.248676e-05: 253,
+    1.249675e-05: 253,
+    1.250674e-05: 253,
+    1.251673e-05: 253,
+    1.252672e-05: 253,
+    1.253671e-05: 253,
+    1.254670e-05: 253,
+    1.255669e-05: 253,
+    1.256668e-05: 253,
+    1.257667e-05: 253,
+    1.258665e-05: 253,
+    1.259664e-05: 253,
+    1.260663e-05: 253,
+    1.261662e-05: 253,
+    1.262661e-05: 253,
+    1.263660e-05: 253,
+    1.264659e-05: 253,
+    1.265658e-05: 253,
+    1.266657e-05: 253,
+    1.267656e-05: 253,
+    1.268655e-05: 253,
+    1.269654e-05: 253,
+    1.270653e-05: 253,
+    1.271652e-05: 253,
+    1.272651e-05: 253,
+    1.273650e-05: 253,
+    1.274649e-05: 253,
+    1.275647e-05: 253,
+    1.276646e-05: 253,
+    1.277645e-05: 253,
+    1.278644e-05: 253,
+    1.279643e-05: 253,
+    1.280642e-05: 253,
+    1.281641e-05: 253,
+    1.282640e-05: 253,
+    1.283639e-05: 253,
+    1.284638e-05: 253,
+    1.285637e-05: 253,
+    1.286636e-05: 253,
+    1.287635e-05: 253,
+    1.288634e-05: 253,
+    1.289633e-05: 253,
+    1.290632e-05: 253,
+    1.291630e-05: 253,
+    1.292629e-05: 253,
+    1.293628e-05: 253,
+    1.294627e-05: 253,
+    1.295626e-05: 253,
+    1.296625e-05: 253,
+    1.297624e-05: 253,
+    1.298623e-05: 253,
+    1.299622e-05: 253,
+    1.300621e-05: 253,
+    1.301620e-05: 253,
+    1.302619e-05: 253,
+    1.303618e-05: 253,
+    1.304617e-05: 253,
+    1.305616e-05: 253,
+    1.306615e-05: 253,
+    1.307614e-05: 253,
+    1.308612e-05: 253,
+    1.309611e-05: 253,
+    1.310610e-05: 253,
+    1.311609e-05: 253,
+    1.312608e-05: 253,
+    1.313607e-05: 253,
+    1.314606e-05: 253,
+    1.315605e-05: 253,
+    1.316604e-05: 253,
+    1.317603e-05: 253,
+    1.318602e-05: 253,
+    1.319601e-05: 253,
+    1.320600e-05: 253,
+    1.321599e-05: 253,
+    1.322598e-05: 253,
+    1.323597e-05: 253,
+    1.324596e-05: 253,
+    1.325594e-05: 253,
+    1.326593e-05: 253,
+    1.327592e-05: 253,
+    1.328591e-05: 253,
+    1.329590e-05: 253,
+    1.330589e-05: 253,
+    1.331588e-05: 253,
+    1.332587e-05: 253,
+    1.333586e-05: 253,
+    1.335584e-05: 253,
+    1.336583e-05: 253,
+    1.337582e-05: 253,
+    1.338581e-05: 253,
+    1.339580e-05: 253,
+    1.340579e-05: 253,
+    1.341578e-05: 253,
+    1.342576e-05: 253,
+    1.343575e-05: 253,
+    1.344574e-05: 253,
+    1.346572e-05: 253,
+    1.347571e-05: 253,
+    1.349569e-05: 253,
+    1.351567e-05: 253,
+    1.352566e-05: 253,
+    1.353565e-05: 253,
+    1.354564e-05: 253,
+    1.355563e-05: 253,
+    1.356562e-05: 253,
+    1.357561e-05: 253,
+    1.358560e-05: 253,
+    1.359558e-05: 253,
+    1.360557e-05: 253,
+    1.361556e-05: 253,
+    1.362555e-05: 253,
+    1.363554e-05: 253,
+    1.364553e-05: 253,
+    1.365552e-05: 253,
+    1.366551e-05: 253,
+    1.367550e-05: 253,
+    1.368549e-05: 253,
+    1.369548e-05: 253,
+    1.370547e-05: 253,
+    1.371546e-05: 253,
+    1.372545e-05: 253,
+    1.373544e-05: 253,
+    1.374543e-05: 253,
+    1.375542e-05: 253,
+    1.376540e-05: 253,
+    1.377539e-05: 253,
+    1.378538e-05: 253,
+    1.379537e-05: 253,
+    1.380536e-05: 253,
+    1.381535e-05: 253,
+    1.382534e-05: 253,
+    1.383533e-05: 253,
+    1.384532e-05: 253,
+    1.385531e-05: 253,
+    1.386530e-05: 253,
+    1.388528e-05: 253,
+    1.389527e-05: 253,
+    1.391525e-05: 253,
+    1.393522e-05: 253,
+    1.394521e-05: 253,
+    1.395520e-05: 253,
+    1.396519e-05: 253,
+    1.397518e-05: 253,
+    1.398517e-05: 253,
+    1.399516e-05: 253,
+    1.400515e-05: 253,
+    1.401514e-05: 253,
+    1.402513e-05: 253,
+    1.403512e-05: 253,
+    1.404511e-05: 253,
+    1.405510e-05: 253,
+    1.406509e-05: 253,
+    1.407508e-05: 253,
+    1.408507e-05: 253,
+    1.410504e-05: 253,
+    1.411503e-05: 253,
+    1.412502e-05: 253,
+    1.413501e-05: 253,
+    1.414500e-05: 253,
+    1.416498e-05: 253,
+    1.417497e-05: 253,
+    1.418496e-05: 253,
+    1.419495e-05: 253,
+    1.420494e-05: 253,
+    1.421493e-05: 253,
+    1.422492e-05: 253,
+    1.423491e-05: 253,
+    1.424490e-05: 253,
+    1.425489e-05: 253,
+    1.426488e-05: 253,
+    1.427486e-05: 253,
+    1.428485e-05: 253,
+    1.429484e-05: 253,
+    1.430483e-05: 253,
+    1.431482e-05: 253,
+    1.432481e-05: 253,
+    1.434479e-05: 253,
+    1.435478e-05: 253,
+    1.436477e-05: 253,
+    1.437476e-05: 253,
+    1.438475e-05: 253,
+    1.439474e-05: 253,
+    1.440473e-05: 253,
+    1.441472e-05: 253,
+    1.442471e-05: 253,
+    1.444468e-05: 253,
+    1.445467e-05: 253,
+    1.446466e-05: 253,
+    1.447465e-05: 253,
+    1.448464e-05: 253,
+    1.449463e-05: 253,
+    1.450462e-05: 253,
+    1.451461e-05: 253,
+    1.452460e-05: 253,
+    1.453459e-05: 253,
+    1.454458e-05: 253,
+    1.455457e-05: 253,
+    1.456456e-05: 253,
+    1.457455e-05: 253,
+    1.458454e-05: 253,
+    1.459453e-05: 253,
+    1.460451e-05: 253,
+    1.461450e-05: 253,
+    1.462449e-05: 253,
+    1.463448e-05: 253,
+    1.464447e-05: 253,
+    1.465446e-05: 253,
+    1.467444e-05: 253,
+    1.468443e-05: 253,
+    1.469442e-05: 253,
+    1.470441e-05: 253,
+    1.471440e-05: 253,
+    1.472439e-05: 253,
+    1.473438e-05: 253,
+    1.474437e-05: 253,
+    1.475436e-05: 253,
+    1.476435e-05: 253,
+    1.477433e-05: 253,
+    1.478432e-05: 253,
+    1.479431e-05: 253,
+    1.480430e-05: 253,
+    1.481429e-05: 253,
+    1.482428e-05: 253,
+    1.483427e-05: 253,
+    1.484426e-05: 253,
+    1.485425e-05: 253,
+    1.486424e-05: 253,
+    1.488422e-05: 253,
+    1.489421e-05: 253,
+    1.490420e-05: 253,
+    1.491419e-05: 253,
+    1.492418e-05: 253,
+    1.493417e-05: 253,
+    1.494415e-05: 253,
+    1.496413e-05: 253,
+    1.497412e-05: 253,
+    1.498411e-05: 253,
+    1.499410e-05: 253,
+    1.500409e-05: 253,
+    1.501408e-05: 253,
+    1.502407e-05: 253,
+    1.503406e-05: 253,
+    1.505404e-05: 253,
+    1.506403e-05: 253,
+    1.507402e-05: 253,
+    1.508401e-05: 253,
+    1.509400e-05: 253,
+    1.510399e-05: 253,
+    1.511397e-05: 253,
+    1.512396e-05: 253,
+    1.513395e-05: 253,
+    1.514394e-05: 253,
+    1.515393e-05: 253,
+    1.516392e-05: 253,
+    1.517391e-05: 253,
+    1.518390e-05: 253,
+    1.519389e-05: 253,
+    1.520388e-05: 253,
+    1.521387e-05: 253,
+    1.522386e-05: 253,
+    1.523385e-05: 253,
+    1.524384e-05: 253,
+    1.525383e-05: 253,
+    1.526382e-05: 253,
+    1.528379e-05: 253,
+    1.529378e-05: 253,
+    1.530377e-05: 253,
+    1.531376e-05: 253,
+    1.532375e-05: 253,
+    1.533374e-05: 253,
+    1.534373e-05: 253,
+    1.535372e-05: 253,
+    1.536371e-05: 253,
+    1.537370e-05: 253,
+    1.538369e-05: 253,
+    1.539368e-05: 253,
+    1.540367e-05: 253,
+    1.541366e-05: 253,
+    1.542365e-05: 253,
+    1.543364e-05: 253,
+    1.544363e-05: 253,
+    1.545361e-05: 253,
+    1.546360e-05: 253,
+    1.547359e-05: 253,
+    1.549357e-05: 253,
+    1.550356e-05: 253,
+    1.551355e-05: 253,
+    1.552354e-05: 253,
+    1.553353e-05: 253,
+    1.555351e-05: 253,
+    1.556350e-05: 253,
+    1.557349e-05: 253,
+    1.558348e-05: 253,
+    1.559347e-05: 253,
+    1.560346e-05: 253,
+    1.561345e-05: 253,
+    1.562343e-05: 253,
+    1.563342e-05: 253,
+    1.564341e-05: 253,
+    1.565340e-05: 253,
+    1.566339e-05: 253,
+    1.567338e-05: 253,
+    1.569336e-05: 253,
+    1.570335e-05: 253,
+    1.571334e-05: 253,
+    1.572333e-05: 253,
+    1.573332e-05: 253,
+    1.574331e-05: 253,
+    1.575330e-05: 253,
+    1.576329e-05: 253,
+    1.577328e-05: 253,
+    1.578327e-05: 253,
+    1.579325e-05: 253,
+    1.580324e-05: 253,
+    1.581323e-05: 253,
+    1.582322e-05: 253,
+    1.584320e-05: 253,
+    1.585319e-05: 253,
+    1.586318e-05: 253,
+    1.587317e-05: 253,
+    1.589315e-05: 253,
+    1.590314e-05: 253,
+    1.591313e-05: 253,
+    1.592312e-05: 253,
+    1.593311e-05: 253,
+    1.594310e-05: 253,
+    1.595309e-05: 253,
+    1.597306e-05: 253,
+    1.598305e-05: 253,
+    1.599304e-05: 253,
+    1.600303e-05: 253,
+    1.601302e-05: 253,
+    1.602301e-05: 253,
+    1.603300e-05: 253,
+    1.604299e-05: 253,
+    1.605298e-05: 253,
+    1.606297e-05: 253,
+    1.607296e-05: 253,
+    1.608295e-05: 253,
+    1.609294e-05: 253,
+    1.610293e-05: 253,
+    1.611292e-05: 253,
+    1.612291e-05: 253,
+    1.613289e-05: 253,
+    1.614288e-05: 253,
+    1.615287e-05: 253,
+    1.617285e-05: 253,
+    1.618284e-05: 253,
+    1.619283e-05: 253,
+    1.621281e-05: 253,
+    1.622280e-05: 253,
+    1.623279e-05: 253,
+    1.624278e-05: 253,
+    1.625277e-05: 253,
+    1.626276e-05: 253,
+    1.627275e-05: 253,
+    1.628274e-05: 253,
+    1.629272e-05: 253,
+    1.630271e-05: 253,
+    1.631270e-05: 253,
+    1.632269e-05: 253,
+    1.633268e-05: 253,
+    1.634267e-05: 253,
+    1.635266e-05: 253,
+    1.636265e-05: 253,
+    1.637264e-05: 253,
+    1.638263e-05: 253,
+    1.639262e-05: 253,
+    1.640261e-05: 253,
+    1.641260e-05: 253,
+    1.642259e-05: 253,
+    1.643258e-05: 253,
+    1.644257e-05: 253,
+    1.645256e-05: 253,
+    1.646254e-05: 253,
+    1.647253e-05: 253,
+    1.649251e-05: 253,
+    1.650250e-05: 253,
+    1.651249e-05: 253,
+    1.652248e-05: 253,
+    1.653247e-05: 253,
+    1.654246e-05: 253,
+    1.656244e-05: 253,
+    1.657243e-05: 253,
+    1.658242e-05: 253,
+    1.659241e-05: 253,
+    1.660240e-05: 253,
+    1.661239e-05: 253,
+    1.662238e-05: 253,
+    1.663236e-05: 253,
+    1.664235e-05: 253,
+    1.665234e-05: 253,
+    1.666233e-05: 253,
+    1.667232e-05: 253,
+    1.668231e-05: 253,
+    1.669230e-05: 253,
+    1.670229e-05: 253,
+    1.671228e-05: 253,
+    1.672227e-05: 253,
+    1.673226e-05: 253,
+    1.674225e-05: 253,
+    1.675224e-05: 253,
+    1.676223e-05: 253,
+    1.677222e-05: 253,
+    1.678221e-05: 253,
+    1.679220e-05: 253,
+    1.681217e-05: 253,
+    1.683215e-05: 253,
+    1.684214e-05: 253,
+    1.685213e-05: 253,
+    1.688210e-05: 253,
+    1.689209e-05: 253,
+    1.690208e-05: 253,
+    1.691207e-05: 253,
+    1.692206e-05: 253,
+    1.693205e-05: 253,
+    1.694204e-05: 253,
+    1.695203e-05: 253,
+    1.696202e-05: 253,
+    1.697200e-05: 253,
+    1.698199e-05: 253,
+    1.699198e-05: 253,
+    1.700197e-05: 253,
+    1.701196e-05: 253,
+    1.702195e-05: 253,
+    1.703194e-05: 253,
+    1.704193e-05: 253,
+    1.705192e-05: 253,
+    1.706191e-05: 253,
+    1.707190e-05: 253,
+    1.708189e-05: 253,
+    1.709188e-05: 253,
+    1.710187e-05: 253,
+    1.711186e-05: 253,
+    1.713184e-05: 253,
+    1.714182e-05: 253,
+    1.715181e-05: 253,
+    1.717179e-05: 253,
+    1.718178e-05: 253,
+    1.719177e-05: 253,
+    1.720176e-05: 253,
+    1.721175e-05: 253,
+    1.722174e-05: 253,
+    1.723173e-05: 253,
+    1.724172e-05: 253,
+    1.725171e-05: 253,
+    1.726170e-05: 253,
+    1.727169e-05: 253,
+    1.728168e-05: 253,
+    1.729167e-05: 253,
+    1.730166e-05: 253,
+    1.731164e-05: 253,
+    1.732163e-05: 253,
+    1.733162e-05: 253,
+    1.734161e-05: 253,
+    1.735160e-05: 253,
+    1.736159e-05: 253,
+    1.737158e-05: 253,
+    1.738157e-05: 253,
+    1.740155e-05: 253,
+    1.741154e-05: 253,
+    1.742153e-05: 253,
+    1.743152e-05: 253,
+    1.744151e-05: 253,
+    1.745150e-05: 253,
+    1.746149e-05: 253,
+    1.747148e-05: 253,
+    1.748146e-05: 253,
+    1.749145e-05: 253,
+    1.750144e-05: 253,
+    1.751143e-05: 253,
+    1.752142e-05: 253,
+    1.753141e-05: 253,
+    1.754140e-05: 253,
+    1.755139e-05: 253,
+    1.756138e-05: 253,
+    1.757137e-05: 253,
+    1.758136e-05: 253,
+    1.759135e-05: 253,
+    1.760134e-05: 253,
+    1.761133e-05: 253,
+    1.762132e-05: 253,
+    1.763131e-05: 253,
+    1.764130e-05: 253,
+    1.766127e-05: 253,
+    1.767126e-05: 253,
+    1.768125e-05: 253,
+    1.769124e-05: 253,
+    1.770123e-05: 253,
+    1.771122e-05: 253,
+    1.772121e-05: 253,
+    1.773120e-05: 253,
+    1.774119e-05: 253,
+    1.776117e-05: 253,
+    1.777116e-05: 253,
+    1.778115e-05: 253,
+    1.779114e-05: 253,
+    1.780113e-05: 253,
+    1.781112e-05: 253,
+    1.782110e-05: 253,
+    1.783109e-05: 253,
+    1.784108e-05: 253,
+    1.785107e-05: 253,
+    1.786106e-05: 253,
+    1.787105e-05: 253,
+    1.788104e-05: 253,
+    1.789103e-05: 253,
+    1.790102e-05: 253,
+    1.791101e-05: 253,
+    1.792100e-05: 253,
+    1.794098e-05: 253,
+    1.795097e-05: 253,
+    1.796096e-05: 253,
+    1.798093e-05: 253,
+    1.799092e-05: 253,
+    1.800091e-05: 253,
+    1.801090e-05: 253,
+    1.802089e-05: 253,
+    1.803088e-05: 253,
+    1.804087e-05: 253,
+    1.805086e-05: 253,
+    1.807084e-05: 253,
+    1.808083e-05: 253,
+    1.810081e-05: 253,
+    1.811080e-05: 253,
+    1.812079e-05: 253,
+    1.813078e-05: 253,
+    1.814077e-05: 253,
+    1.816074e-05: 253,
+    1.817073e-05: 253,
+    1.819071e-05: 253,
+    1.820070e-05: 253,
+    1.821069e-05: 253,
+    1.822068e-05: 253,
+    1.823067e-05: 253,
+    1.824066e-05: 253,
+    1.825065e-05: 253,
+    1.826064e-05: 253,
+    1.827063e-05: 253,
+    1.828062e-05: 253,
+    1.829061e-05: 253,
+    1.831059e-05: 253,
+    1.833056e-05: 253,
+    1.834055e-05: 253,
+    1.835054e-05: 253,
+    1.836053e-05: 253,
+    1.837052e-05: 253,
+    1.838051e-05: 253,
+    1.839050e-05: 253,
+    1.840049e-05: 253,
+    1.841048e-05: 253,
+    1.844045e-05: 253,
+    1.846043e-05: 253,
+    1.848041e-05: 253,
+    1.849039e-05: 253,
+    1.850038e-05: 253,
+    1.851037e-05: 253,
+    1.852036e-05: 253,
+    1.853035e-05: 253,
+    1.854034e-05: 253,
+    1.855033e-05: 253,
+    1.856032e-05: 253,
+    1.857031e-05: 253,
+    1.858030e-05: 253,
+    1.859029e-05: 253,
+    1.860028e-05: 253,
+    1.861027e-05: 253,
+    1.862026e-05: 253,
+    1.863025e-05: 253,
+    1.864024e-05: 253,
+    1.865023e-05: 253,
+    1.866021e-05: 253,
+    1.867020e-05: 253,
+    1.868019e-05: 253,
+    1.869018e-05: 253,
+    1.871016e-05: 253,
+    1.872015e-05: 253,
+    1.873014e-05: 253,
+    1.874013e-05: 253,
+    1.876011e-05: 253,
+    1.877010e-05: 253,
+    1.878009e-05: 253,
+    1.880007e-05: 253,
+    1.881006e-05: 253,
+    1.882005e-05: 253,
+    1.883003e-05: 253,
+    1.884002e-05: 253,
+    1.886000e-05: 253,
+    1.886999e-05: 253,
+    1.887998e-05: 253,
+    1.888997e-05: 253,
+    1.889996e-05: 253,
+    1.890995e-05: 253,
+    1.891994e-05: 253,
+    1.892993e-05: 253,
+    1.893992e-05: 253,
+    1.894991e-05: 253,
+    1.895990e-05: 253,
+    1.896989e-05: 253,
+    1.897988e-05: 253,
+    1.898987e-05: 253,
+    1.899985e-05: 253,
+    1.900984e-05: 253,
+    1.901983e-05: 253,
+    1.902982e-05: 253,
+    1.904980e-05: 253,
+    1.905979e-05: 253,
+    1.906978e-05: 253,
+    1.907977e-05: 253,
+    1.909975e-05: 253,
+    1.910974e-05: 253,
+    1.911973e-05: 253,
+    1.912972e-05: 253,
+    1.913971e-05: 253,
+    1.915969e-05: 253,
+    1.916967e-05: 253,
+    1.917966e-05: 253,
+    1.918965e-05: 253,
+    1.919964e-05: 253,
+    1.921962e-05: 253,
+    1.922961e-05: 253,
+    1.925958e-05: 253,
+    1.926957e-05: 253,
+    1.927956e-05: 253,
+    1.928955e-05: 253,
+    1.929954e-05: 253,
+    1.930953e-05: 253,
+    1.931952e-05: 253,
+    1.932951e-05: 253,
+    1.933949e-05: 253,
+    1.934948e-05: 253,
+    1.937945e-05: 253,
+    1.938944e-05: 253,
+    1.939943e-05: 253,
+    1.941941e-05: 253,
+    1.942940e-05: 253,
+    1.943939e-05: 253,
+    1.945937e-05: 253,
+    1.947935e-05: 253,
+    1.948934e-05: 253,
+    1.949933e-05: 253,
+    1.951930e-05: 253,
+    1.952929e-05: 253,
+    1.953928e-05: 253,
+    1.954927e-05: 253,
+    1.955926e-05: 253,
+    1.956925e-05: 253,
+    1.957924e-05: 253,
+    1.958923e-05: 253,
+    1.959922e-05: 253,
+    1.960921e-05: 253,
+    1.961920e-05: 253,
+    1.962919e-05: 253,
+    1.963918e-05: 253,
+    1.964917e-05: 253,
+    1.965916e-05: 253,
+    1.966915e-05: 253,
+    1.967913e-05: 253,
+    1.968912e-05: 253,
+    1.969911e-05: 253,
+    1.970910e-05: 253,
+    1.972908e-05: 253,
+    1.973907e-05: 253,
+    1.974906e-05: 253,
+    1.975905e-05: 253,
+    1.976904e-05: 253,
+    1.977903e-05: 253,
+    1.978902e-05: 253,
+    1.979901e-05: 253,
+    1.980900e-05: 253,
+    1.981899e-05: 253,
+    1.982898e-05: 253,
+    1.983896e-05: 253,
+    1.984895e-05: 253,
+    1.985894e-05: 253,
+    1.986893e-05: 253,
+    1.987892e-05: 253,
+    1.988891e-05: 253,
+    1.989890e-05: 253,
+    1.990889e-05: 253,
+    1.991888e-05: 253,
+    1.992887e-05: 253,
+    1.994885e-05: 253,
+    1.995884e-05: 253,
+    1.996883e-05: 253,
+    1.997882e-05: 253,
+    1.998881e-05: 253,
+    1.999880e-05: 253,
+    2.000878e-05: 253,
+    2.001877e-05: 253,
+    2.002876e-05: 253,
+    2.003875e-05: 253,
+    2.004874e-05: 253,
+    2.005873e-05: 253,
+    2.006872e-05: 253,
+    2.007871e-05: 253,
+    2.008870e-05: 253,
+    2.009869e-05: 253,
+    2.011867e-05: 253,
+    2.012866e-05: 253,
+    2.013865e-05: 253,
+    2.015863e-05: 253,
+    2.016862e-05: 253,
+    2.017860e-05: 253,
+    2.019858e-05: 253,
+    2.020857e-05: 253,
+    2.021856e-05: 253,
+    2.022855e-05: 253,
+    2.023854e-05: 253,
+    2.024853e-05: 253,
+    2.026851e-05: 253,
+    2.030847e-05: 253,
+    2.032845e-05: 253,
+    2.034842e-05: 253,
+    2.035841e-05: 253,
+    2.036840e-05: 253,
+    2.039837e-05: 253,
+    2.040836e-05: 253,
+    2.042834e-05: 253,
+    2.043833e-05: 253,
+    2.045831e-05: 253,
+    2.046830e-05: 253,
+    2.047829e-05: 253,
+    2.048828e-05: 253,
+    2.049827e-05: 253,
+    2.051824e-05: 253,
+    2.053822e-05: 253,
+    2.054821e-05: 253,
+    2.056819e-05: 253,
+    2.057818e-05: 253,
+    2.058817e-05: 253,
+    2.059816e-05: 253,
+    2.060815e-05: 253,
+    2.061814e-05: 253,
+    2.062813e-05: 253,
+    2.063812e-05: 253,
+    2.065810e-05: 253,
+    2.066809e-05: 253,
+    2.067808e-05: 253,
+    2.068806e-05: 253,
+    2.071803e-05: 253,
+    2.072802e-05: 253,
+    2.073801e-05: 253,
+    2.074800e-05: 253,
+    2.075799e-05: 253,
+    2.076798e-05: 253,
+    2.077797e-05: 253,
+    2.078796e-05: 253,
+    2.079795e-05: 253,
+    2.081793e-05: 253,
+    2.082792e-05: 253,
+    2.084790e-05: 253,
+    2.085788e-05: 253,
+    2.086787e-05: 253,
+    2.087786e-05: 253,
+    2.088785e-05: 253,
+    2.089784e-05: 253,
+    2.091782e-05: 253,
+    2.092781e-05: 253,
+    2.093780e-05: 253,
+    2.095778e-05: 253,
+    2.096777e-05: 253,
+    2.097776e-05: 253,
+    2.098775e-05: 253,
+    2.099774e-05: 253,
+    2.100773e-05: 253,
+    2.101772e-05: 253,
+    2.102770e-05: 253,
+    2.103769e-05: 253,
+    2.104768e-05: 253,
+    2.105767e-05: 253,
+    2.106766e-05: 253,
+    2.107765e-05: 253,
+    2.108764e-05: 253,
+    2.109763e-05: 253,
+    2.110762e-05: 253,
+    2.112760e-05: 253,
+    2.114758e-05: 253,
+    2.115757e-05: 253,
+    2.116756e-05: 253,
+    2.118754e-05: 253,
+    2.119752e-05: 253,
+    2.120751e-05: 253,
+    2.121750e-05: 253,
+    2.122749e-05: 253,
+    2.123748e-05: 253,
+    2.124747e-05: 253,
+    2.125746e-05: 253,
+    2.126745e-05: 253,
+    2.127744e-05: 253,
+    2.128743e-05: 253,
+    2.129742e-05: 253,
+    2.130741e-05: 253,
+    2.132739e-05: 253,
+    2.133738e-05: 253,
+    2.134737e-05: 253,
+    2.137733e-05: 253,
+    2.138732e-05: 253,
+    2.140730e-05: 253,
+    2.141729e-05: 253,
+    2.144726e-05: 253,
+    2.145725e-05: 253,
+    2.146724e-05: 253,
+    2.147723e-05: 253,
+    2.148722e-05: 253,
+    2.150720e-05: 253,
+    2.151719e-05: 253,
+    2.152717e-05: 253,
+    2.154715e-05: 253,
+    2.155714e-05: 253,
+    2.156713e-05: 253,
+    2.157712e-05: 253,
+    2.158711e-05: 253,
+    2.159710e-05: 253,
+    2.160709e-05: 253,
+    2.161708e-05: 253,
+    2.162707e-05: 253,
+    2.163706e-05: 253,
+    2.164705e-05: 253,
+    2.165704e-05: 253,
+    2.166703e-05: 253,
+    2.167702e-05: 253,
+    2.170698e-05: 253,
+    2.172696e-05: 253,
+    2.173695e-05: 253,
+    2.174694e-05: 253,
+    2.175693e-05: 253,
+    2.176692e-05: 253,
+    2.177691e-05: 253,
+    2.179689e-05: 253,
+    2.180688e-05: 253,
+    2.181687e-05: 253,
+    2.184684e-05: 253,
+    2.185683e-05: 253,
+    2.186681e-05: 253,
+    2.187680e-05: 253,
+    2.188679e-05: 253,
+    2.190677e-05: 253,
+    2.191676e-05: 253,
+    2.193674e-05: 253,
+    2.194673e-05: 253,
+    2.195672e-05: 253,
+    2.197670e-05: 253,
+    2.198669e-05: 253,
+    2.199668e-05: 253,
+    2.200667e-05: 253,
+    2.201666e-05: 253,
+    2.202665e-05: 253,
+    2.203663e-05: 253,
+    2.204662e-05: 253,
+    2.206660e-05: 253,
+    2.207659e-05: 253,
+    2.208658e-05: 253,
+    2.209657e-05: 253,
+    2.211655e-05: 253,
+    2.212654e-05: 253,
+    2.213653e-05: 253,
+    2.215651e-05: 253,
+    2.216650e-05: 253,
+    2.217649e-05: 253,
+    2.218648e-05: 253,
+    2.220645e-05: 253,
+    2.221644e-05: 253,
+    2.223642e-05: 253,
+    2.224641e-05: 253,
+    2.225640e-05: 253,
+    2.228637e-05: 253,
+    2.229636e-05: 253,
+    2.230635e-05: 253,
+    2.231634e-05: 253,
+    2.232633e-05: 253,
+    2.234631e-05: 253,
+    2.237627e-05: 253,
+    2.238626e-05: 253,
+    2.239625e-05: 253,
+    2.240624e-05: 253,
+    2.242622e-05: 253,
+    2.244620e-05: 253,
+    2.246618e-05: 253,
+    2.247617e-05: 253,
+    2.250614e-05: 253,
+    2.251613e-05: 253,
+    2.252612e-05: 253,
+    2.253611e-05: 253,
+    2.255608e-05: 253,
+    2.256607e-05: 253,
+    2.257606e-05: 253,
+    2.259604e-05: 253,
+    2.260603e-05: 253,
+    2.261602e-05: 253,
+    2.262601e-05: 253,
+    2.263600e-05: 253,
+    2.265598e-05: 253,
+    2.266597e-05: 253,
+    2.268595e-05: 253,
+    2.269594e-05: 253,
+    2.270593e-05: 253,
+    2.271591e-05: 253,
+    2.272590e-05: 253,
+    2.273589e-05: 253,
+    2.274588e-05: 253,
+    2.275587e-05: 253,
+    2.277585e-05: 253,
+    2.279583e-05: 253,
+    2.280582e-05: 253,
+    2.281581e-05: 253,
+    2.282580e-05: 253,
+    2.283579e-05: 253,
+    2.285577e-05: 253,
+    2.287575e-05: 253,
+    2.288573e-05: 253,
+    2.289572e-05: 253,
+    2.290571e-05: 253,
+    2.291570e-05: 253,
+    2.292569e-05: 253,
+    2.293568e-05: 253,
+    2.294567e-05: 253,
+    2.295566e-05: 253,
+    2.296565e-05: 253,
+    2.297564e-05: 253,
+    2.298563e-05: 253,
+    2.300561e-05: 253,
+    2.301560e-05: 253,
+    2.302559e-05: 253,
+    2.303558e-05: 253,
+    2.304557e-05: 253,
+    2.307553e-05: 253,
+    2.308552e-05: 253,
+    2.309551e-05: 253,
+    2.310550e-05: 253,
+    2.313547e-05: 253,
+    2.314546e-05: 253,
+    2.316544e-05: 253,
+    2.317543e-05: 253,
+    2.318542e-05: 253,
+    2.320540e-05: 253,
+    2.321538e-05: 253,
+    2.322537e-05: 253,
+    2.323536e-05: 253,
+    2.324535e-05: 253,
+    2.325534e-05: 253,
+    2.326533e-05: 253,
+    2.327532e-05: 253,
+    2.328531e-05: 253,
+    2.330529e-05: 253,
+    2.331528e-05: 253,
+    2.332527e-05: 253,
+    2.333526e-05: 253,
+    2.334525e-05: 253,
+    2.335524e-05: 253,
+    2.336523e-05: 253,
+    2.337522e-05: 253,
+    2.338520e-05: 253,
+    2.340518e-05: 253,
+    2.341517e-05: 253,
+    2.342516e-05: 253,
+    2.343515e-05: 253,
+    2.344514e-05: 253,
+    2.345513e-05: 253,
+    2.346512e-05: 253,
+    2.347511e-05: 253,
+    2.348510e-05: 253,
+    2.349509e-05: 253,
+    2.350508e-05: 253,
+    2.351507e-05: 253,
+    2.352506e-05: 253,
+    2.353505e-05: 253,
+    2.354504e-05: 253,
+    2.357500e-05: 253,
+    2.358499e-05: 253,
+    2.359498e-05: 253,
+    2.360497e-05: 253,
+    2.362495e-05: 253,
+    2.365492e-05: 253,
+    2.366491e-05: 253,
+    2.367490e-05: 253,
+    2.368489e-05: 253,
+    2.369488e-05: 253,
+    2.370487e-05: 253,
+    2.371486e-05: 253,
+    2.374482e-05: 253,
+    2.375481e-05: 253,
+    2.379477e-05: 253,
+    2.380476e-05: 253,
+    2.381475e-05: 254,
+    2.384472e-05: 254,
+    2.385471e-05: 254,
+    2.388468e-05: 254,
+    2.389466e-05: 254,
+    2.390465e-05: 254,
+    2.395460e-05: 254,
+    2.396459e-05: 254,
+    2.399456e-05: 254,
+    2.401454e-05: 254,
+    2.402453e-05: 254,
+    2.404451e-05: 254,
+    2.405450e-05: 254,
+    2.406448e-05: 254,
+    2.407447e-05: 254,
+    2.408446e-05: 254,
+    2.409445e-05: 254,
+    2.411443e-05: 254,
+    2.412442e-05: 254,
+    2.415439e-05: 254,
+    2.416438e-05: 254,
+    2.419435e-05: 254,
+    2.420434e-05: 254,
+    2.421433e-05: 254,
+    2.423430e-05: 254,
+    2.424429e-05: 254,
+    2.425428e-05: 254,
+    2.426427e-05: 254,
+    2.428425e-05: 254,
+    2.429424e-05: 254,
+    2.430423e-05: 254,
+    2.431422e-05: 254,
+    2.432421e-05: 254,
+    2.433420e-05: 254,
+    2.435418e-05: 254,
+    2.437416e-05: 254,
+    2.438415e-05: 254,
+    2.439414e-05: 254,
+    2.440412e-05: 254,
+    2.444408e-05: 254,
+    2.445407e-05: 254,
+    2.446406e-05: 254,
+    2.448404e-05: 254,
+    2.450402e-05: 254,
+    2.453399e-05: 254,
+    2.456396e-05: 254,
+    2.457394e-05: 254,
+    2.458393e-05: 254,
+    2.460391e-05: 254,
+    2.461390e-05: 254,
+    2.462389e-05: 254,
+    2.463388e-05: 254,
+    2.465386e-05: 254,
+    2.466385e-05: 254,
+    2.467384e-05: 254,
+    2.468383e-05: 254,
+    2.469382e-05: 254,
+    2.470381e-05: 254,
+    2.471380e-05: 254,
+    2.472379e-05: 254,
+    2.473378e-05: 254,
+    2.474376e-05: 254,
+    2.476374e-05: 254,
+    2.477373e-05: 254,
+    2.479371e-05: 254,
+    2.481369e-05: 254,
+    2.482368e-05: 254,
+    2.486364e-05: 254,
+    2.490359e-05: 254,
+    2.491358e-05: 254,
+    2.492357e-05: 254,
+    2.493356e-05: 254,
+    2.495354e-05: 254,
+    2.497352e-05: 254,
+    2.498351e-05: 254,
+    2.499350e-05: 254,
+    2.501348e-05: 254,
+    2.502347e-05: 254,
+    2.503346e-05: 254,
+    2.504345e-05: 254,
+    2.506343e-05: 254,
+    2.507341e-05: 254,
+    2.508340e-05: 254,
+    2.510338e-05: 254,
+    2.513335e-05: 254,
+    2.515333e-05: 254,
+    2.516332e-05: 254,
+    2.517331e-05: 254,
+    2.518330e-05: 254,
+    2.519329e-05: 254,
+    2.522326e-05: 254,
+    2.525322e-05: 254,
+    2.526321e-05: 254,
+    2.528319e-05: 254,
+    2.531316e-05: 254,
+    2.533314e-05: 254,
+    2.534313e-05: 254,
+    2.535312e-05: 254,
+    2.536311e-05: 254,
+    2.538309e-05: 254,
+    2.540307e-05: 254,
+    2.542304e-05: 254,
+    2.543303e-05: 254,
+    2.544302e-05: 254,
+    2.545301e-05: 254,
+    2.548298e-05: 254,
+    2.549297e-05: 254,
+    2.550296e-05: 254,
+    2.552294e-05: 254,
+    2.554292e-05: 254,
+    2.555291e-05: 254,
+    2.556290e-05: 254,
+    2.557289e-05: 254,
+    2.558287e-05: 254,
+    2.559286e-05: 254,
+    2.560285e-05: 254,
+    2.561284e-05: 254,
+    2.562283e-05: 254,
+    2.563282e-05: 254,
+    2.564281e-05: 254,
+    2.565280e-05: 254,
+    2.566279e-05: 254,
+    2.569276e-05: 254,
+    2.570275e-05: 254,
+    2.573272e-05: 254,
+    2.575269e-05: 254,
+    2.576268e-05: 254,
+    2.578266e-05: 254,
+    2.579265e-05: 254,
+    2.580264e-05: 254,
+    2.582262e-05: 254,
+    2.583261e-05: 254,
+    2.585259e-05: 254,
+    2.586258e-05: 254,
+    2.587257e-05: 254,
+    2.588256e-05: 254,
+    2.589255e-05: 254,
+    2.591253e-05: 254,
+    2.593250e-05: 254,
+    2.596247e-05: 254,
+    2.598245e-05: 254,
+    2.599244e-05: 254,
+    2.604239e-05: 254,
+    2.605238e-05: 254,
+    2.606237e-05: 254,
+    2.610232e-05: 254,
+    2.612230e-05: 254,
+    2.613229e-05: 254,
+    2.615227e-05: 254,
+    2.617225e-05: 254,
+    2.620222e-05: 254,
+    2.621221e-05: 254,
+    2.622220e-05: 254,
+    2.625217e-05: 254,
+    2.627214e-05: 254,
+    2.630211e-05: 254,
+    2.632209e-05: 254,
+    2.633208e-05: 254,
+    2.634207e-05: 254,
+    2.635206e-05: 254,
+    2.636205e-05: 254,
+    2.637204e-05: 254,
+    2.639202e-05: 254,
+    2.640201e-05: 254,
+    2.641200e-05: 254,
+    2.642199e-05: 254,
+    2.645195e-05: 254,
+    2.646194e-05: 254,
+    2.647193e-05: 254,
+    2.648192e-05: 254,
+    2.649191e-05: 254,
+    2.650190e-05: 254,
+    2.651189e-05: 254,
+    2.653187e-05: 254,
+    2.654186e-05: 254,
+    2.655185e-05: 254,
+    2.656184e-05: 254,
+    2.657183e-05: 254,
+    2.659180e-05: 254,
+    2.660179e-05: 254,
+    2.662177e-05: 254,
+    2.664175e-05: 254,
+    2.665174e-05: 254,
+    2.667172e-05: 254,
+    2.671168e-05: 254,
+    2.672167e-05: 254,
+    2.673166e-05: 254,
+    2.675164e-05: 254,
+    2.676162e-05: 254,
+    2.677161e-05: 254,
+    2.680158e-05: 254,
+    2.681157e-05: 254,
+    2.682156e-05: 254,
+    2.683155e-05: 254,
+    2.684154e-05: 254,
+    2.690148e-05: 254,
+    2.691147e-05: 254,
+    2.692146e-05: 254,
+    2.693144e-05: 254,
+    2.696141e-05: 254,
+    2.697140e-05: 254,
+    2.699138e-05: 254,
+    2.701136e-05: 254,
+    2.702135e-05: 254,
+    2.703134e-05: 254,
+    2.705132e-05: 254,
+    2.706131e-05: 254,
+    2.707130e-05: 254,
+    2.710126e-05: 254,
+    2.711125e-05: 254,
+    2.712124e-05: 254,
+    2.714122e-05: 254,
+    2.715121e-05: 254,
+    2.716120e-05: 254,
+    2.717119e-05: 254,
+    2.719117e-05: 254,
+    2.720116e-05: 254,
+    2.721115e-05: 254,
+    2.724112e-05: 254,
+    2.725111e-05: 254,
+    2.726110e-05: 254,
+    2.727108e-05: 254,
+    2.728107e-05: 254,
+    2.732103e-05: 254,
+    2.734101e-05: 254,
+    2.735100e-05: 254,
+    2.737098e-05: 254,
+    2.742093e-05: 254,
+    2.743092e-05: 254,
+    2.744090e-05: 254,
+    2.749085e-05: 254,
+    2.753081e-05: 254,
+    2.755079e-05: 254,
+    2.756078e-05: 254,
+    2.757077e-05: 254,
+    2.765068e-05: 254,
+    2.767066e-05: 254,
+    2.768065e-05: 254,
+    2.772061e-05: 254,
+    2.773060e-05: 254,
+    2.775058e-05: 254,
+    2.778054e-05: 254,
+    2.780052e-05: 254,
+    2.781051e-05: 254,
+    2.782050e-05: 254,
+    2.784048e-05: 254,
+    2.785047e-05: 254,
+    2.786046e-05: 254,
+    2.788044e-05: 254,
+    2.789043e-05: 254,
+    2.792040e-05: 254,
+    2.794038e-05: 254,
+    2.796035e-05: 254,
+    2.798033e-05: 254,
+    2.799032e-05: 254,
+    2.800031e-05: 254,
+    2.802029e-05: 254,
+    2.804027e-05: 254,
+    2.808023e-05: 254,
+    2.810021e-05: 254,
+    2.811020e-05: 254,
+    2.812018e-05: 254,
+    2.813017e-05: 254,
+    2.814016e-05: 254,
+    2.816014e-05: 254,
+    2.819011e-05: 254,
+    2.820010e-05: 254,
+    2.822008e-05: 254,
+    2.824006e-05: 254,
+    2.825005e-05: 254,
+    2.827003e-05: 254,
+    2.828001e-05: 254,
+    2.829000e-05: 254,
+    2.829999e-05: 254,
+    2.830998e-05: 254,
+    2.832996e-05: 254,
+    2.833995e-05: 254,
+    2.834994e-05: 254,
+    2.836992e-05: 254,
+    2.837991e-05: 254,
+    2.838990e-05: 254,
+    2.839989e-05: 254,
+    2.840988e-05: 254,
+    2.841987e-05: 254,
+    2.842986e-05: 254,
+    2.844983e-05: 254,
+    2.845982e-05: 254,
+    2.846981e-05: 254,
+    2.848979e-05: 254,
+    2.849978e-05: 254,
+    2.851976e-05: 254,
+    2.852975e-05: 254,
+    2.853974e-05: 254,
+    2.854973e-05: 254,
+    2.855972e-05: 254,
+    2.859968e-05: 254,
+    2.860967e-05: 254,
+    2.861965e-05: 254,
+    2.862964e-05: 254,
+    2.863963e-05: 254,
+    2.864962e-05: 254,
+    2.865961e-05: 254,
+    2.867959e-05: 254,
+    2.868958e-05: 254,
+    2.872954e-05: 254,
+    2.875951e-05: 254,
+    2.877949e-05: 254,
+    2.878947e-05: 254,
+    2.879946e-05: 254,
+    2.880945e-05: 254,
+    2.882943e-05: 254,
+    2.888937e-05: 254,
+    2.889936e-05: 254,
+    2.893932e-05: 254,
+    2.894931e-05: 254,
+    2.896928e-05: 254,
+    2.897927e-05: 254,
+    2.898926e-05: 254,
+    2.901923e-05: 254,
+    2.902922e-05: 254,
+    2.906918e-05: 254,
+    2.907917e-05: 254,
+    2.908916e-05: 254,
+    2.909915e-05: 254,
+    2.910914e-05: 254,
+    2.912911e-05: 254,
+    2.914909e-05: 254,
+    2.916907e-05: 254,
+    2.917906e-05: 254,
+    2.918905e-05: 254,
+    2.919904e-05: 254,
+    2.920903e-05: 254,
+    2.921902e-05: 254,
+    2.924899e-05: 254,
+    2.925898e-05: 254,
+    2.926897e-05: 254,
+    2.927896e-05: 254,
+    2.928895e-05: 254,
+    2.932890e-05: 254,
+    2.933889e-05: 254,
+    2.934888e-05: 254,
+    2.936886e-05: 254,
+    2.937885e-05: 254,
+    2.942880e-05: 254,
+    2.944878e-05: 254,
+    2.947874e-05: 254,
+    2.950871e-05: 254,
+    2.952869e-05: 254,
+    2.954867e-05: 254,
+    2.956865e-05: 254,
+    2.957864e-05: 254,
+    2.958863e-05: 254,
+    2.961860e-05: 254,
+    2.962859e-05: 254,
+    2.966854e-05: 254,
+    2.968852e-05: 254,
+    2.969851e-05: 254,
+    2.970850e-05: 254,
+    2.973847e-05: 254,
+    2.974846e-05: 254,
+    2.976844e-05: 254,
+    2.977843e-05: 254,
+    2.978842e-05: 254,
+    2.982837e-05: 254,
+    2.983836e-05: 254,
+    2.985834e-05: 254,
+    2.986833e-05: 254,
+    2.989830e-05: 254,
+    2.990829e-05: 254,
+    2.992827e-05: 254,
+    2.993826e-05: 254,
+    2.994825e-05: 254,
+    2.996822e-05: 254,
+    3.000818e-05: 254,
+    3.001817e-05: 254,
+    3.002816e-05: 254,
+    3.004814e-05: 254,
+    3.005813e-05: 254,
+    3.006812e-05: 254,
+    3.007811e-05: 254,
+    3.010808e-05: 254,
+    3.011807e-05: 254,
+    3.012806e-05: 254,
+    3.013804e-05: 254,
+    3.014803e-05: 254,
+    3.016801e-05: 254,
+    3.019798e-05: 254,
+    3.021796e-05: 254,
+    3.022795e-05: 254,
+    3.023794e-05: 254,
+    3.026791e-05: 254,
+    3.027790e-05: 254,
+    3.028789e-05: 254,
+    3.030786e-05: 254,
+    3.031785e-05: 254,
+    3.034782e-05: 254,
+    3.035781e-05: 254,
+    3.039777e-05: 254,
+    3.040776e-05: 254,
+    3.043773e-05: 254,
+    3.044772e-05: 254,
+    3.045771e-05: 254,
+    3.046770e-05: 254,
+    3.048767e-05: 254,
+    3.050765e-05: 254,
+    3.052763e-05: 254,
+    3.054761e-05: 254,
+    3.057758e-05: 254,
+    3.059756e-05: 254,
+    3.060755e-05: 254,
+    3.062753e-05: 254,
+    3.064750e-05: 254,
+    3.068746e-05: 254,
+    3.069745e-05: 254,
+    3.071743e-05: 254,
+    3.076738e-05: 254,
+    3.078736e-05: 254,
+    3.079735e-05: 254,
+    3.083730e-05: 254,
+    3.086727e-05: 254,
+    3.089724e-05: 254,
+    3.090723e-05: 254,
+    3.091722e-05: 254,
+    3.093720e-05: 254,
+    3.094719e-05: 254,
+    3.095718e-05: 254,
+    3.096717e-05: 254,
+    3.097716e-05: 254,
+    3.098714e-05: 254,
+    3.101711e-05: 254,
+    3.105707e-05: 254,
+    3.106706e-05: 254,
+    3.107705e-05: 254,
+    3.109703e-05: 254,
+    3.112700e-05: 254,
+    3.113699e-05: 254,
+    3.114698e-05: 254,
+    3.116695e-05: 254,
+    3.117694e-05: 254,
+    3.122689e-05: 254,
+    3.123688e-05: 254,
+    3.124687e-05: 254,
+    3.125686e-05: 254,
+    3.126685e-05: 254,
+    3.128683e-05: 254,
+    3.129682e-05: 254,
+    3.130681e-05: 254,
+    3.131680e-05: 254,
+    3.133677e-05: 254,
+    3.135675e-05: 254,
+    3.136674e-05: 254,
+    3.137673e-05: 254,
+    3.140670e-05: 254,
+    3.141669e-05: 254,
+    3.143667e-05: 254,
+    3.144666e-05: 254,
+    3.146664e-05: 254,
+    3.148662e-05: 254,
+    3.150659e-05: 254,
+    3.151658e-05: 254,
+    3.152657e-05: 254,
+    3.155654e-05: 254,
+    3.156653e-05: 254,
+    3.158651e-05: 254,
+    3.160649e-05: 254,
+    3.162647e-05: 254,
+    3.163646e-05: 254,
+    3.164645e-05: 254,
+    3.166642e-05: 254,
+    3.168640e-05: 254,
+    3.169639e-05: 254,
+    3.171637e-05: 254,
+    3.172636e-05: 254,
+    3.173635e-05: 254,
+    3.174634e-05: 254,
+    3.175633e-05: 254,
+    3.177631e-05: 254,
+    3.179629e-05: 254,
+    3.180628e-05: 254,
+    3.181627e-05: 254,
+    3.182625e-05: 254,
+    3.187620e-05: 254,
+    3.188619e-05: 254,
+    3.195612e-05: 254,
+    3.197610e-05: 254,
+    3.198609e-05: 254,
+    3.199607e-05: 254,
+    3.201605e-05: 254,
+    3.203603e-05: 254,
+    3.204602e-05: 254,
+    3.206600e-05: 254,
+    3.207599e-05: 254,
+    3.209597e-05: 254,
+    3.211595e-05: 254,
+    3.212594e-05: 254,
+    3.214592e-05: 254,
+    3.218587e-05: 254,
+    3.220585e-05: 254,
+    3.221584e-05: 254,
+    3.222583e-05: 254,
+    3.223582e-05: 254,
+    3.224581e-05: 254,
+    3.225580e-05: 254,
+    3.226579e-05: 254,
+    3.227578e-05: 254,
+    3.228577e-05: 254,
+    3.230575e-05: 254,
+    3.231574e-05: 254,
+    3.232573e-05: 254,
+    3.233571e-05: 254,
+    3.235569e-05: 254,
+    3.238566e-05: 254,
+    3.239565e-05: 254,
+    3.241563e-05: 254,
+    3.242562e-05: 254,
+    3.243561e-05: 254,
+    3.244560e-05: 254,
+    3.247557e-05: 254,
+    3.248556e-05: 254,
+    3.249555e-05: 254,
+    3.251552e-05: 254,
+    3.253550e-05: 254,
+    3.256547e-05: 254,
+    3.258545e-05: 254,
+    3.263540e-05: 254,
+    3.264539e-05: 254,
+    3.269533e-05: 254,
+    3.270532e-05: 254,
+    3.271531e-05: 254,
+    3.272530e-05: 254,
+    3.274528e-05: 254,
+    3.276526e-05: 254,
+    3.278524e-05: 254,
+    3.279523e-05: 254,
+    3.281521e-05: 254,
+    3.282520e-05: 254,
+    3.284517e-05: 254,
+    3.285516e-05: 254,
+    3.289512e-05: 254,
+    3.290511e-05: 254,
+    3.291510e-05: 254,
+    3.292509e-05: 254,
+    3.293508e-05: 254,
+    3.300501e-05: 254,
+    3.301499e-05: 254,
+    3.302498e-05: 254,
+    3.305495e-05: 254,
+    3.306494e-05: 254,
+    3.309491e-05: 254,
+    3.311489e-05: 254,
+    3.312488e-05: 254,
+    3.313487e-05: 254,
+    3.314486e-05: 254,
+    3.318481e-05: 254,
+    3.320479e-05: 254,
+    3.322477e-05: 254,
+    3.323476e-05: 254,
+    3.324475e-05: 254,
+    3.326473e-05: 254,
+    3.327472e-05: 254,
+    3.331468e-05: 254,
+    3.332467e-05: 254,
+    3.334465e-05: 254,
+    3.335463e-05: 254,
+    3.338460e-05: 254,
+    3.344454e-05: 254,
+    3.345453e-05: 254,
+    3.348450e-05: 254,
+    3.354443e-05: 254,
+    3.355442e-05: 254,
+    3.356441e-05: 254,
+    3.359438e-05: 254,
+    3.363434e-05: 254,
+    3.369427e-05: 254,
+    3.370426e-05: 254,
+    3.371425e-05: 254,
+    3.373423e-05: 254,
+    3.374422e-05: 254,
+    3.375421e-05: 254,
+    3.376420e-05: 254,
+    3.377419e-05: 254,
+    3.378418e-05: 254,
+    3.381415e-05: 254,
+    3.385410e-05: 254,
+    3.386409e-05: 254,
+    3.387408e-05: 254,
+    3.390405e-05: 254,
+    3.391404e-05: 254,
+    3.392403e-05: 254,
+    3.393402e-05: 254,
+    3.394401e-05: 254,
+    3.395400e-05: 254,
+    3.398397e-05: 254,
+    3.399396e-05: 254,
+    3.400395e-05: 254,
+    3.401394e-05: 254,
+    3.404390e-05: 254,
+    3.405389e-05: 254,
+    3.407387e-05: 254,
+    3.410384e-05: 254,
+    3.413381e-05: 254,
+    3.414380e-05: 254,
+    3.415379e-05: 254,
+    3.417377e-05: 254,
+    3.418376e-05: 254,
+    3.420373e-05: 254,
+    3.422371e-05: 254,
+    3.426367e-05: 254,
+    3.428365e-05: 254,
+    3.430363e-05: 254,
+    3.431362e-05: 254,
+    3.433360e-05: 254,
+    3.434359e-05: 254,
+    3.438354e-05: 254,
+    3.439353e-05: 254,
+    3.441351e-05: 254,
+    3.442350e-05: 254,
+    3.445347e-05: 254,
+    3.446346e-05: 254,
+    3.448344e-05: 254,
+    3.451341e-05: 254,
+    3.452340e-05: 254,
+    3.459332e-05: 254,
+    3.462329e-05: 254,
+    3.466325e-05: 254,
+    3.467324e-05: 254,
+    3.468323e-05: 254,
+    3.469322e-05: 254,
+    3.475315e-05: 254,
+    3.477313e-05: 254,
+    3.481309e-05: 254,
+    3.482308e-05: 254,
+    3.483307e-05: 254,
+    3.485305e-05: 254,
+    3.487302e-05: 254,
+    3.488301e-05: 254,
+    3.490299e-05: 254,
+    3.492297e-05: 254,
+    3.493296e-05: 254,
+    3.494295e-05: 254,
+    3.495294e-05: 254,
+    3.496293e-05: 254,
+    3.498291e-05: 254,
+    3.500289e-05: 254,
+    3.502287e-05: 254,
+    3.503286e-05: 254,
+    3.505283e-05: 254,
+    3.507281e-05: 254,
+    3.508280e-05: 254,
+    3.511277e-05: 254,
+    3.512276e-05: 254,
+    3.513275e-05: 254,
+    3.514274e-05: 254,
+    3.518270e-05: 254,
+    3.520267e-05: 254,
+    3.522265e-05: 254,
+    3.523264e-05: 254,
+    3.524263e-05: 254,
+    3.527260e-05: 254,
+    3.529258e-05: 254,
+    3.532255e-05: 254,
+    3.533254e-05: 254,
+    3.534253e-05: 254,
+    3.535252e-05: 254,
+    3.537249e-05: 254,
+    3.539247e-05: 254,
+    3.541245e-05: 254,
+    3.542244e-05: 254,
+    3.543243e-05: 254,
+    3.544242e-05: 254,
+    3.545241e-05: 254,
+    3.546240e-05: 254,
+    3.548238e-05: 254,
+    3.553233e-05: 254,
+    3.554231e-05: 254,
+    3.557228e-05: 254,
+    3.558227e-05: 254,
+    3.559226e-05: 254,
+    3.560225e-05: 254,
+    3.564221e-05: 254,
+    3.565220e-05: 254,
+    3.567218e-05: 254,
+    3.568217e-05: 254,
+    3.569216e-05: 254,
+    3.571213e-05: 254,
+    3.572212e-05: 254,
+    3.574210e-05: 254,
+    3.576208e-05: 254,
+    3.577207e-05: 254,
+    3.578206e-05: 254,
+    3.580204e-05: 254,
+    3.584200e-05: 254,
+    3.585199e-05: 254,
+    3.586198e-05: 254,
+    3.587197e-05: 254,
+    3.589194e-05: 254,
+    3.591192e-05: 254,
+    3.593190e-05: 254,
+    3.596187e-05: 254,
+    3.600183e-05: 254,
+    3.601182e-05: 254,
+    3.602181e-05: 254,
+    3.603180e-05: 254,
+    3.605177e-05: 254,
+    3.606176e-05: 254,
+    3.609173e-05: 254,
+    3.610172e-05: 254,
+    3.611171e-05: 254,
+    3.614168e-05: 254,
+    3.615167e-05: 254,
+    3.616166e-05: 254,
+    3.617165e-05: 254,
+    3.628153e-05: 254,
+    3.629152e-05: 254,
+    3.631150e-05: 254,
+    3.632149e-05: 254,
+    3.634147e-05: 254,
+    3.640140e-05: 254,
+    3.642138e-05: 254,
+    3.643137e-05: 254,
+    3.644136e-05: 254,
+    3.645135e-05: 254,
+    3.647133e-05: 254,
+    3.648132e-05: 254,
+    3.649131e-05: 254,
+    3.652128e-05: 254,
+    3.654126e-05: 254,
+    3.655125e-05: 254,
+    3.656123e-05: 254,
+    3.657122e-05: 254,
+    3.659120e-05: 254,
+    3.661118e-05: 254,
+    3.663116e-05: 254,
+    3.665114e-05: 254,
+    3.666113e-05: 254,
+    3.667112e-05: 254,
+    3.668111e-05: 254,
+    3.669110e-05: 254,
+    3.670109e-05: 254,
+    3.671108e-05: 254,
+    3.673105e-05: 254,
+    3.674104e-05: 254,
+    3.677101e-05: 254,
+    3.678100e-05: 254,
+    3.680098e-05: 254,
+    3.684094e-05: 254,
+    3.685093e-05: 254,
+    3.687091e-05: 254,
+    3.689088e-05: 254,
+    3.690087e-05: 254,
+    3.692085e-05: 254,
+    3.696081e-05: 254,
+    3.697080e-05: 254,
+    3.700077e-05: 254,
+    3.701076e-05: 254,
+    3.702075e-05: 254,
+    3.705072e-05: 254,
+    3.709067e-05: 254,
+    3.710066e-05: 254,
+    3.713063e-05: 254,
+    3.715061e-05: 254,
+    3.716060e-05: 254,
+    3.718058e-05: 254,
+    3.720056e-05: 254,
+    3.721055e-05: 254,
+    3.727048e-05: 254,
+    3.728047e-05: 254,
+    3.729046e-05: 254,
+    3.730045e-05: 254,
+    3.734041e-05: 254,
+    3.736039e-05: 254,
+    3.737038e-05: 254,
+    3.738037e-05: 254,
+    3.743031e-05: 254,
+    3.744030e-05: 254,
+    3.748026e-05: 254,
+    3.749025e-05: 254,
+    3.750024e-05: 254,
+    3.751023e-05: 254,
+    3.754020e-05: 254,
+    3.764009e-05: 254,
+    3.766007e-05: 254,
+    3.767006e-05: 254,
+    3.769004e-05: 254,
+    3.770003e-05: 254,
+    3.772001e-05: 254,
+    3.773000e-05: 254,
+    3.773998e-05: 254,
+    3.774997e-05: 254,
+    3.776995e-05: 254,
+    3.777994e-05: 254,
+    3.783988e-05: 254,
+    3.786985e-05: 254,
+    3.793977e-05: 254,
+    3.794976e-05: 254,
+    3.797973e-05: 254,
+    3.798972e-05: 254,
+    3.800970e-05: 254,
+    3.802968e-05: 254,
+    3.806964e-05: 254,
+    3.811958e-05: 254,
+    3.815954e-05: 254,
+    3.816953e-05: 254,
+    3.818951e-05: 254,
+    3.819950e-05: 254,
+    3.820949e-05: 254,
+    3.821948e-05: 254,
+    3.825943e-05: 254,
+    3.826942e-05: 254,
+    3.827941e-05: 254,
+    3.828940e-05: 254,
+    3.830938e-05: 254,
+    3.834934e-05: 254,
+    3.836932e-05: 254,
+    3.837931e-05: 254,
+    3.839929e-05: 254,
+    3.842925e-05: 254,
+    3.844923e-05: 254,
+    3.849918e-05: 254,
+    3.852915e-05: 254,
+    3.857909e-05: 254,
+    3.863903e-05: 254,
+    3.865901e-05: 254,
+    3.866900e-05: 254,
+    3.868898e-05: 254,
+    3.873893e-05: 254,
+    3.874891e-05: 254,
+    3.876889e-05: 254,
+    3.878887e-05: 254,
+    3.880885e-05: 254,
+    3.886879e-05: 254,
+    3.889876e-05: 254,
+    3.894870e-05: 254,
+    3.898866e-05: 254,
+    3.899865e-05: 254,
+    3.900864e-05: 254,
+    3.901863e-05: 254,
+    3.903861e-05: 254,
+    3.904860e-05: 254,
+    3.905859e-05: 254,
+    3.908855e-05: 254,
+    3.910853e-05: 254,
+    3.913850e-05: 254,
+    3.914849e-05: 254,
+    3.920843e-05: 254,
+    3.921842e-05: 254,
+    3.922841e-05: 254,
+    3.925837e-05: 254,
+    3.926836e-05: 254,
+    3.928834e-05: 254,
+    3.929833e-05: 254,
+    3.932830e-05: 254,
+    3.933829e-05: 254,
+    3.934828e-05: 254,
+    3.936826e-05: 254,
+    3.937825e-05: 254,
+    3.938824e-05: 254,
+    3.940822e-05: 254,
+    3.942819e-05: 254,
+    3.946815e-05: 254,
+    3.947814e-05: 254,
+    3.950811e-05: 254,
+    3.954807e-05: 254,
+    3.955806e-05: 254,
+    3.956805e-05: 254,
+    3.958803e-05: 254,
+    3.960800e-05: 254,
+    3.961799e-05: 254,
+    3.962798e-05: 254,
+    3.966794e-05: 254,
+    3.967793e-05: 254,
+    3.968792e-05: 254,
+    3.969791e-05: 254,
+    3.970790e-05: 254,
+    3.972788e-05: 254,
+    3.974786e-05: 254,
+    3.977782e-05: 254,
+    3.980779e-05: 254,
+    3.991768e-05: 254,
+    3.993765e-05: 254,
+    3.994764e-05: 254,
+    3.996762e-05: 254,
+    3.997761e-05: 254,
+    3.998760e-05: 254,
+    3.999759e-05: 254,
+    4.000758e-05: 254,
+    4.001757e-05: 254,
+    4.003755e-05: 254,
+    4.005753e-05: 254,
+    4.008750e-05: 254,
+    4.010747e-05: 254,
+    4.013744e-05: 254,
+    4.019738e-05: 254,
+    4.020737e-05: 254,
+    4.023734e-05: 254,
+    4.025732e-05: 254,
+    4.027729e-05: 254,
+    4.034722e-05: 254,
+    4.036720e-05: 254,
+    4.040716e-05: 254,
+    4.041715e-05: 254,
+    4.042714e-05: 254,
+    4.044711e-05: 254,
+    4.047708e-05: 254,
+    4.054701e-05: 254,
+    4.055700e-05: 254,
+    4.057698e-05: 254,
+    4.059696e-05: 254,
+    4.063691e-05: 254,
+    4.064690e-05: 254,
+    4.065689e-05: 254,
+    4.067687e-05: 254,
+    4.071683e-05: 254,
+    4.074680e-05: 254,
+    4.076678e-05: 254,
+    4.078675e-05: 254,
+    4.080673e-05: 254,
+    4.084669e-05: 254,
+    4.085668e-05: 254,
+    4.087666e-05: 254,
+    4.091662e-05: 254,
+    4.096656e-05: 254,
+    4.098654e-05: 254,
+    4.100652e-05: 254,
+    4.104648e-05: 254,
+    4.105647e-05: 254,
+    4.109643e-05: 254,
+    4.112639e-05: 254,
+    4.113638e-05: 254,
+    4.116635e-05: 254,
+    4.117634e-05: 254,
+    4.120631e-05: 254,
+    4.121630e-05: 254,
+    4.122629e-05: 254,
+    4.127624e-05: 254,
+    4.131619e-05: 254,
+    4.133617e-05: 254,
+    4.135615e-05: 254,
+    4.139611e-05: 254,
+    4.140610e-05: 254,
+    4.142608e-05: 254,
+    4.145604e-05: 254,
+    4.146603e-05: 254,
+    4.147602e-05: 254,
+    4.149600e-05: 254,
+    4.152597e-05: 254,
+    4.158591e-05: 254,
+    4.166582e-05: 254,
+    4.170578e-05: 254,
+    4.171577e-05: 254,
+    4.172576e-05: 254,
+    4.173575e-05: 254,
+    4.177571e-05: 254,
+    4.178570e-05: 254,
+    4.181566e-05: 254,
+    4.183564e-05: 254,
+    4.185562e-05: 254,
+    4.186561e-05: 254,
+    4.188559e-05: 254,
+    4.190557e-05: 254,
+    4.194553e-05: 254,
+    4.195551e-05: 254,
+    4.201545e-05: 254,
+    4.202544e-05: 254,
+    4.204542e-05: 254,
+    4.205541e-05: 254,
+    4.211535e-05: 254,
+    4.213532e-05: 254,
+    4.214531e-05: 254,
+    4.216529e-05: 254,
+    4.217528e-05: 254,
+    4.218527e-05: 254,
+    4.221524e-05: 254,
+    4.223522e-05: 254,
+    4.226519e-05: 254,
+    4.228517e-05: 254,
+    4.233511e-05: 254,
+    4.234510e-05: 254,
+    4.235509e-05: 254,
+    4.236508e-05: 254,
+    4.237507e-05: 254,
+    4.242502e-05: 254,
+    4.246497e-05: 254,
+    4.247496e-05: 254,
+    4.248495e-05: 254,
+    4.249494e-05: 254,
+    4.250493e-05: 254,
+    4.254489e-05: 254,
+    4.260483e-05: 254,
+    4.264478e-05: 254,
+    4.269473e-05: 254,
+    4.273469e-05: 254,
+    4.277465e-05: 254,
+    4.284457e-05: 254,
+    4.286455e-05: 254,
+    4.291450e-05: 254,
+    4.292449e-05: 254,
+    4.293448e-05: 254,
+    4.295446e-05: 254,
+    4.296445e-05: 254,
+    4.300440e-05: 254,
+    4.302438e-05: 254,
+    4.303437e-05: 254,
+    4.304436e-05: 254,
+    4.310430e-05: 254,
+    4.312428e-05: 254,
+    4.313427e-05: 254,
+    4.316423e-05: 254,
+    4.317422e-05: 254,
+    4.319420e-05: 254,
+    4.322417e-05: 254,
+    4.325414e-05: 254,
+    4.327412e-05: 254,
+    4.328411e-05: 254,
+    4.332406e-05: 254,
+    4.333405e-05: 254,
+    4.335403e-05: 254,
+    4.339399e-05: 254,
+    4.341397e-05: 254,
+    4.343395e-05: 254,
+    4.346392e-05: 254,
+    4.347391e-05: 254,
+    4.350387e-05: 254,
+    4.351386e-05: 254,
+    4.352385e-05: 254,
+    4.353384e-05: 254,
+    4.355382e-05: 254,
+    4.367369e-05: 254,
+    4.368368e-05: 254,
+    4.369367e-05: 254,
+    4.370366e-05: 254,
+    4.371365e-05: 254,
+    4.373363e-05: 254,
+    4.374362e-05: 254,
+    4.375361e-05: 254,
+    4.377359e-05: 254,
+    4.380356e-05: 254,
+    4.383352e-05: 254,
+    4.384351e-05: 254,
+    4.385350e-05: 254,
+    4.387348e-05: 254,
+    4.388347e-05: 254,
+    4.391344e-05: 254,
+    4.393342e-05: 254,
+    4.394341e-05: 254,
+    4.395340e-05: 254,
+    4.396339e-05: 254,
+    4.401333e-05: 254,
+    4.404330e-05: 254,
+    4.407327e-05: 254,
+    4.410324e-05: 254,
+    4.411323e-05: 254,
+    4.412322e-05: 254,
+    4.416317e-05: 254,
+    4.417316e-05: 254,
+    4.419314e-05: 254,
+    4.420313e-05: 254,
+    4.424309e-05: 254,
+    4.425308e-05: 254,
+    4.430303e-05: 254,
+    4.431302e-05: 254,
+    4.433299e-05: 254,
+    4.440292e-05: 254,
+    4.444288e-05: 254,
+    4.446286e-05: 254,
+    4.450281e-05: 254,
+    4.451280e-05: 254,
+    4.452279e-05: 254,
+    4.458273e-05: 254,
+    4.459272e-05: 254,
+    4.464267e-05: 254,
+    4.467263e-05: 254,
+    4.468262e-05: 254,
+    4.470260e-05: 254,
+    4.473257e-05: 254,
+    4.474256e-05: 254,
+    4.475255e-05: 254,
+    4.477253e-05: 254,
+    4.478252e-05: 254,
+    4.480250e-05: 254,
+    4.481249e-05: 254,
+    4.485244e-05: 254,
+    4.487242e-05: 254,
+    4.488241e-05: 254,
+    4.490239e-05: 254,
+    4.493236e-05: 254,
+    4.497232e-05: 254,
+    4.504224e-05: 254,
+    4.505223e-05: 254,
+    4.506222e-05: 254,
+    4.510218e-05: 254,
+    4.511217e-05: 254,
+    4.512216e-05: 254,
+    4.514214e-05: 254,
+    4.518209e-05: 254,
+    4.519208e-05: 254,
+    4.525202e-05: 254,
+    4.528199e-05: 254,
+    4.529198e-05: 254,
+    4.531196e-05: 254,
+    4.533194e-05: 254,
+    4.540186e-05: 254,
+    4.543183e-05: 254,
+    4.547179e-05: 254,
+    4.550175e-05: 254,
+    4.551174e-05: 254,
+    4.552173e-05: 254,
+    4.553172e-05: 254,
+    4.555170e-05: 254,
+    4.558167e-05: 254,
+    4.560165e-05: 254,
+    4.561164e-05: 254,
+    4.562163e-05: 254,
+    4.564161e-05: 254,
+    4.565160e-05: 254,
+    4.569155e-05: 254,
+    4.570154e-05: 254,
+    4.574150e-05: 254,
+    4.575149e-05: 254,
+    4.576148e-05: 254,
+    4.582142e-05: 254,
+    4.585138e-05: 254,
+    4.588135e-05: 254,
+    4.589134e-05: 254,
+    4.602120e-05: 254,
+    4.606116e-05: 254,
+    4.607115e-05: 254,
+    4.613109e-05: 254,
+    4.620101e-05: 254,
+    4.622099e-05: 254,
+    4.624097e-05: 254,
+    4.625096e-05: 254,
+    4.626095e-05: 254,
+    4.628093e-05: 254,
+    4.630091e-05: 254,
+    4.634087e-05: 254,
+    4.640080e-05: 254,
+    4.642078e-05: 254,
+    4.645075e-05: 254,
+    4.647073e-05: 254,
+    4.650070e-05: 254,
+    4.651069e-05: 254,
+    4.652067e-05: 254,
+    4.658061e-05: 254,
+    4.660059e-05: 254,
+    4.661058e-05: 254,
+    4.662057e-05: 254,
+    4.664055e-05: 254,
+    4.666053e-05: 254,
+    4.668051e-05: 254,
+    4.670048e-05: 254,
+    4.671047e-05: 254,
+    4.672046e-05: 254,
+    4.679039e-05: 254,
+    4.685033e-05: 254,
+    4.689028e-05: 254,
+    4.690027e-05: 254,
+    4.696021e-05: 254,
+    4.698019e-05: 254,
+    4.703013e-05: 254,
+    4.711005e-05: 254,
+    4.713003e-05: 254,
+    4.715001e-05: 254,
+    4.716999e-05: 254,
+    4.719995e-05: 254,
+    4.722992e-05: 254,
+    4.723991e-05: 254,
+    4.726988e-05: 254,
+    4.727987e-05: 254,
+    4.728986e-05: 254,
+    4.734980e-05: 254,
+    4.742971e-05: 254,
+    4.744969e-05: 254,
+    4.745968e-05: 254,
+    4.746967e-05: 254,
+    4.747966e-05: 254,
+    4.748965e-05: 254,
+    4.751962e-05: 254,
+    4.752960e-05: 254,
+    4.759953e-05: 254,
+    4.761951e-05: 254,
+    4.763949e-05: 254,
+    4.764948e-05: 254,
+    4.765947e-05: 254,
+    4.766946e-05: 254,
+    4.767945e-05: 254,
+    4.769942e-05: 254,
+    4.770941e-05: 254,
+    4.772939e-05: 254,
+    4.779932e-05: 254,
+    4.782929e-05: 254,
+    4.783928e-05: 254,
+    4.792918e-05: 254,
+    4.794916e-05: 254,
+    4.796914e-05: 254,
+    4.800910e-05: 254,
+    4.803906e-05: 254,
+    4.807902e-05: 254,
+    4.808901e-05: 254,
+    4.811898e-05: 254,
+    4.817892e-05: 254,
+    4.819890e-05: 254,
+    4.821887e-05: 254,
+    4.823885e-05: 254,
+    4.825883e-05: 254,
+    4.826882e-05: 254,
+    4.827881e-05: 254,
+    4.834874e-05: 254,
+    4.838869e-05: 254,
+    4.839868e-05: 254,
+    4.842865e-05: 254,
+    4.843864e-05: 254,
+    4.845862e-05: 254,
+    4.851856e-05: 254,
+    4.852855e-05: 254,
+    4.855851e-05: 254,
+    4.856850e-05: 254,
+    4.858848e-05: 254,
+    4.859847e-05: 254,
+    4.860846e-05: 254,
+    4.861845e-05: 254,
+    4.862844e-05: 254,
+    4.863843e-05: 254,
+    4.864842e-05: 254,
+    4.868838e-05: 254,
+    4.872833e-05: 254,
+    4.873832e-05: 254,
+    4.878827e-05: 254,
+    4.883822e-05: 254,
+    4.893811e-05: 254,
+    4.894810e-05: 254,
+    4.901803e-05: 254,
+    4.904799e-05: 254,
+    4.906797e-05: 254,
+    4.907796e-05: 254,
+    4.912791e-05: 254,
+    4.913790e-05: 254,
+    4.914789e-05: 254,
+    4.918785e-05: 254,
+    4.924778e-05: 254,
+    4.929773e-05: 254,
+    4.935767e-05: 254,
+    4.938763e-05: 254,
+    4.939762e-05: 254,
+    4.940761e-05: 254,
+    4.946755e-05: 254,
+    4.948753e-05: 254,
+    4.949752e-05: 254,
+    4.953748e-05: 254,
+    4.959741e-05: 254,
+    4.961739e-05: 254,
+    4.962738e-05: 254,
+    4.965735e-05: 254,
+    4.966734e-05: 254,
+    4.967733e-05: 254,
+    4.970730e-05: 254,
+    4.975724e-05: 254,
+    4.981718e-05: 254,
+    4.982717e-05: 254,
+    4.984715e-05: 254,
+    4.990708e-05: 254,
+    4.995703e-05: 254,
+    5.002696e-05: 254,
+    5.006691e-05: 254,
+    5.010687e-05: 254,
+    5.018679e-05: 254,
+    5.020677e-05: 254,
+    5.023673e-05: 254,
+    5.025671e-05: 254,
+    5.026670e-05: 254,
+    5.032664e-05: 254,
+    5.034662e-05: 254,
+    5.037659e-05: 254,
+    5.041654e-05: 254,
+    5.048647e-05: 254,
+    5.051644e-05: 254,
+    5.052643e-05: 254,
+    5.054641e-05: 254,
+    5.060634e-05: 254,
+    5.061633e-05: 254,
+    5.066628e-05: 254,
+    5.071623e-05: 254,
+    5.072622e-05: 254,
+    5.076617e-05: 254,
+    5.077616e-05: 254,
+    5.079614e-05: 254,
+    5.080613e-05: 254,
+    5.082611e-05: 254,
+    5.083610e-05: 254,
+    5.084609e-05: 254,
+    5.085608e-05: 254,
+    5.086607e-05: 254,
+    5.092600e-05: 254,
+    5.093599e-05: 254,
+    5.102590e-05: 254,
+    5.105587e-05: 254,
+    5.108583e-05: 254,
+    5.109582e-05: 254,
+    5.110581e-05: 254,
+    5.111580e-05: 254,
+    5.113578e-05: 254,
+    5.114577e-05: 254,
+    5.115576e-05: 254,
+    5.118573e-05: 254,
+    5.119572e-05: 254,
+    5.121570e-05: 254,
+    5.122569e-05: 254,
+    5.127563e-05: 254,
+    5.131559e-05: 254,
+    5.134556e-05: 254,
+    5.135555e-05: 254,
+    5.139551e-05: 254,
+    5.142547e-05: 254,
+    5.146543e-05: 254,
+    5.147542e-05: 254,
+    5.148541e-05: 254,
+    5.151538e-05: 254,
+    5.152537e-05: 254,
+    5.157532e-05: 254,
+    5.160528e-05: 254,
+    5.164524e-05: 254,
+    5.180507e-05: 254,
+    5.192494e-05: 254,
+    5.198488e-05: 254,
+    5.199487e-05: 254,
+    5.205481e-05: 254,
+    5.206480e-05: 254,
+    5.212473e-05: 254,
+    5.223462e-05: 254,
+    5.226458e-05: 254,
+    5.236448e-05: 254,
+    5.238446e-05: 254,
+    5.239445e-05: 254,
+    5.242441e-05: 254,
+    5.253430e-05: 254,
+    5.257426e-05: 254,
+    5.259423e-05: 254,
+    5.262420e-05: 254,
+    5.264418e-05: 254,
+    5.265417e-05: 254,
+    5.270412e-05: 254,
+    5.274408e-05: 254,
+    5.276405e-05: 254,
+    5.279402e-05: 254,
+    5.280401e-05: 254,
+    5.286395e-05: 254,
+    5.287394e-05: 254,
+    5.290391e-05: 254,
+    5.299381e-05: 254,
+    5.300380e-05: 254,
+    5.302378e-05: 254,
+    5.303377e-05: 254,
+    5.309371e-05: 254,
+    5.310369e-05: 254,
+    5.321358e-05: 254,
+    5.323356e-05: 254,
+    5.325354e-05: 254,
+    5.329349e-05: 254,
+    5.331347e-05: 254,
+    5.332346e-05: 254,
+    5.334344e-05: 254,
+    5.340338e-05: 254,
+    5.346331e-05: 254,
+    5.347330e-05: 254,
+    5.348329e-05: 254,
+    5.349328e-05: 254,
+    5.350327e-05: 254,
+    5.351326e-05: 254,
+    5.353324e-05: 254,
+    5.356321e-05: 254,
+    5.358319e-05: 254,
+    5.362314e-05: 254,
+    5.373303e-05: 254,
+    5.376300e-05: 254,
+    5.377299e-05: 254,
+    5.380295e-05: 254,
+    5.388287e-05: 254,
+    5.389286e-05: 254,
+    5.392283e-05: 254,
+    5.393282e-05: 254,
+    5.396278e-05: 254,
+    5.397277e-05: 254,
+    5.398276e-05: 254,
+    5.399275e-05: 254,
+    5.403271e-05: 254,
+    5.407267e-05: 254,
+    5.408266e-05: 254,
+    5.409265e-05: 254,
+    5.410264e-05: 254,
+    5.412261e-05: 254,
+    5.413260e-05: 254,
+    5.415258e-05: 254,
+    5.419254e-05: 254,
+    5.423250e-05: 254,
+    5.425248e-05: 254,
+    5.430242e-05: 254,
+    5.431241e-05: 254,
+    5.435237e-05: 254,
+    5.440232e-05: 254,
+    5.441231e-05: 254,
+    5.445226e-05: 254,
+    5.446225e-05: 254,
+    5.456215e-05: 254,
+    5.457214e-05: 254,
+    5.459212e-05: 254,
+    5.460211e-05: 254,
+    5.465205e-05: 254,
+    5.466204e-05: 254,
+    5.467203e-05: 254,
+    5.468202e-05: 254,
+    5.474196e-05: 254,
+    5.478192e-05: 254,
+    5.479190e-05: 254,
+    5.487182e-05: 254,
+    5.506162e-05: 254,
+    5.507161e-05: 254,
+    5.512156e-05: 254,
+    5.518149e-05: 254,
+    5.520147e-05: 254,
+    5.523144e-05: 254,
+    5.524143e-05: 254,
+    5.528139e-05: 254,
+    5.529138e-05: 254,
+    5.534132e-05: 254,
+    5.538128e-05: 254,
+    5.546120e-05: 254,
+    5.548117e-05: 254,
+    5.550115e-05: 254,
+    5.551114e-05: 254,
+    5.552113e-05: 254,
+    5.560105e-05: 254,
+    5.561104e-05: 254,
+    5.569095e-05: 254,
+    5.573091e-05: 254,
+    5.579085e-05: 254,
+    5.580083e-05: 254,
+    5.587076e-05: 254,
+    5.588075e-05: 254,
+    5.597065e-05: 254,
+    5.600062e-05: 254,
+    5.604058e-05: 254,
+    5.606056e-05: 254,
+    5.608054e-05: 254,
+    5.613049e-05: 254,
+    5.616045e-05: 254,
+    5.628033e-05: 254,
+    5.629032e-05: 254,
+    5.632028e-05: 254,
+    5.638022e-05: 254,
+    5.640020e-05: 254,
+    5.643017e-05: 254,
+    5.647013e-05: 254,
+    5.648011e-05: 254,
+    5.650009e-05: 254,
+    5.654005e-05: 254,
+    5.660998e-05: 254,
+    5.663995e-05: 254,
+    5.665992e-05: 254,
+    5.666991e-05: 254,
+    5.668989e-05: 254,
+    5.675982e-05: 254,
+    5.677980e-05: 254,
+    5.681975e-05: 254,
+    5.683973e-05: 254,
+    5.685971e-05: 254,
+    5.688968e-05: 254,
+    5.692964e-05: 254,
+    5.694962e-05: 254,
+    5.696960e-05: 254,
+    5.703952e-05: 254,
+    5.705950e-05: 254,
+    5.706949e-05: 254,
+    5.720934e-05: 254,
+    5.730924e-05: 254,
+    5.732921e-05: 254,
+    5.736917e-05: 254,
+    5.737916e-05: 254,
+    5.743910e-05: 254,
+    5.756896e-05: 254,
+    5.758894e-05: 254,
+    5.759893e-05: 254,
+    5.764888e-05: 254,
+    5.771880e-05: 254,
+    5.773878e-05: 254,
+    5.775876e-05: 254,
+    5.780871e-05: 254,
+    5.781870e-05: 254,
+    5.783867e-05: 254,
+    5.786864e-05: 254,
+    5.788862e-05: 254,
+    5.789861e-05: 254,
+    5.792858e-05: 254,
+    5.796854e-05: 254,
+    5.798852e-05: 254,
+    5.800849e-05: 254,
+    5.806843e-05: 254,
+    5.808841e-05: 254,
+    5.813836e-05: 254,
+    5.817831e-05: 254,
+    5.820828e-05: 254,
+    5.822826e-05: 254,
+    5.826822e-05: 254,
+    5.828820e-05: 254,
+    5.831817e-05: 254,
+    5.832816e-05: 254,
+    5.833814e-05: 254,
+    5.837810e-05: 254,
+    5.838809e-05: 254,
+    5.840807e-05: 254,
+    5.843804e-05: 254,
+    5.846801e-05: 254,
+    5.848799e-05: 254,
+    5.849798e-05: 254,
+    5.853793e-05: 254,
+    5.860786e-05: 254,
+    5.862784e-05: 254,
+    5.868777e-05: 254,
+    5.887757e-05: 254,
+    5.888756e-05: 254,
+    5.891753e-05: 254,
+    5.894750e-05: 254,
+    5.896748e-05: 254,
+    5.899745e-05: 254,
+    5.901742e-05: 254,
+    5.905738e-05: 254,
+    5.908735e-05: 254,
+    5.909734e-05: 254,
+    5.912731e-05: 254,
+    5.913730e-05: 254,
+    5.915728e-05: 254,
+    5.919723e-05: 254,
+    5.923719e-05: 254,
+    5.926716e-05: 254,
+    5.928714e-05: 254,
+    5.930712e-05: 254,
+    5.931711e-05: 254,
+    5.932710e-05: 254,
+    5.936705e-05: 254,
+    5.937704e-05: 254,
+    5.941700e-05: 254,
+    5.944697e-05: 254,
+    5.945696e-05: 254,
+    5.950691e-05: 254,
+    5.958682e-05: 254,
+    5.960680e-05: 254,
+    5.961679e-05: 254,
+    5.967673e-05: 254,
+    5.972667e-05: 254,
+    5.976663e-05: 254,
+    5.985653e-05: 254,
+    5.992646e-05: 254,
+    5.995643e-05: 254,
+    6.005632e-05: 254,
+    6.006631e-05: 254,
+    6.007630e-05: 254,
+    6.008629e-05: 254,
+    6.011626e-05: 254,
+    6.021615e-05: 254,
+    6.028608e-05: 254,
+    6.030606e-05: 254,
+    6.031605e-05: 254,
+    6.037598e-05: 254,
+    6.047588e-05: 254,
+    6.050585e-05: 254,
+    6.053581e-05: 254,
+    6.056578e-05: 254,
+    6.061573e-05: 254,
+    6.064570e-05: 254,
+    6.070563e-05: 254,
+    6.071562e-05: 254,
+    6.077556e-05: 254,
+    6.085548e-05: 254,
+    6.087545e-05: 254,
+    6.092540e-05: 254,
+    6.101531e-05: 254,
+    6.102530e-05: 254,
+    6.103528e-05: 254,
+    6.115516e-05: 254,
+    6.118513e-05: 254,
+    6.137492e-05: 254,
+    6.139490e-05: 254,
+    6.147482e-05: 254,
+    6.150479e-05: 254,
+    6.152477e-05: 254,
+    6.156472e-05: 254,
+    6.158470e-05: 254,
+    6.161467e-05: 254,
+    6.164464e-05: 254,
+    6.166462e-05: 254,
+    6.194432e-05: 254,
+    6.196430e-05: 254,
+    6.201425e-05: 254,
+    6.207418e-05: 254,
+    6.209416e-05: 254,
+    6.210415e-05: 254,
+    6.213412e-05: 254,
+    6.215410e-05: 254,
+    6.216409e-05: 254,
+    6.218407e-05: 254,
+    6.220405e-05: 254,
+    6.222402e-05: 254,
+    6.227397e-05: 254,
+    6.229395e-05: 254,
+    6.231393e-05: 254,
+    6.234390e-05: 254,
+    6.239384e-05: 254,
+    6.243380e-05: 254,
+    6.244379e-05: 254,
+    6.247376e-05: 254,
+    6.251372e-05: 254,
+    6.252371e-05: 254,
+    6.254369e-05: 254,
+    6.255367e-05: 254,
+    6.259363e-05: 254,
+    6.263359e-05: 254,
+    6.271351e-05: 254,
+    6.278343e-05: 254,
+    6.287334e-05: 254,
+    6.289331e-05: 254,
+    6.291329e-05: 254,
+    6.298322e-05: 254,
+    6.302318e-05: 254,
+    6.305315e-05: 254,
+    6.308311e-05: 254,
+    6.317302e-05: 254,
+    6.318301e-05: 254,
+    6.319300e-05: 254,
+    6.326292e-05: 254,
+    6.332286e-05: 254,
+    6.337281e-05: 254,
+    6.339279e-05: 254,
+    6.340277e-05: 254,
+    6.345272e-05: 254,
+    6.346271e-05: 254,
+    6.352265e-05: 254,
+    6.381234e-05: 254,
+    6.386229e-05: 254,
+    6.389226e-05: 254,
+    6.395219e-05: 254,
+    6.397217e-05: 254,
+    6.400214e-05: 254,
+    6.403211e-05: 254,
+    6.408205e-05: 254,
+    6.411202e-05: 254,
+    6.413200e-05: 254,
+    6.423190e-05: 254,
+    6.430182e-05: 254,
+    6.440172e-05: 254,
+    6.441170e-05: 254,
+    6.461149e-05: 254,
+    6.464146e-05: 254,
+    6.468142e-05: 254,
+    6.469141e-05: 254,
+    6.472138e-05: 254,
+    6.474136e-05: 254,
+    6.481128e-05: 254,
+    6.483126e-05: 254,
+    6.490119e-05: 254,
+    6.498110e-05: 254,
+    6.505103e-05: 254,
+    6.506102e-05: 254,
+    6.508100e-05: 254,
+    6.510097e-05: 254,
+    6.511096e-05: 254,
+    6.513094e-05: 254,
+    6.515092e-05: 254,
+    6.516091e-05: 254,
+    6.520087e-05: 254,
+    6.524083e-05: 254,
+    6.527079e-05: 254,
+    6.530076e-05: 254,
+    6.531075e-05: 254,
+    6.532074e-05: 254,
+    6.535071e-05: 254,
+    6.536070e-05: 254,
+    6.555050e-05: 254,
+    6.558047e-05: 254,
+    6.560044e-05: 254,
+    6.562042e-05: 254,
+    6.569035e-05: 254,
+    6.572032e-05: 254,
+    6.575029e-05: 254,
+    6.579024e-05: 254,
+    6.585018e-05: 254,
+    6.595007e-05: 254,
+    6.601001e-05: 254,
+    6.602999e-05: 254,
+    6.615985e-05: 254,
+    6.620980e-05: 254,
+    6.621979e-05: 254,
+    6.622978e-05: 254,
+    6.624976e-05: 254,
+    6.625975e-05: 254,
+    6.629970e-05: 254,
+    6.631968e-05: 254,
+    6.636963e-05: 254,
+    6.640959e-05: 254,
+    6.641958e-05: 254,
+    6.643955e-05: 254,
+    6.651947e-05: 254,
+    6.655943e-05: 254,
+    6.658940e-05: 254,
+    6.670927e-05: 254,
+    6.675922e-05: 254,
+    6.676921e-05: 254,
+    6.677919e-05: 254,
+    6.682914e-05: 254,
+    6.690906e-05: 254,
+    6.694901e-05: 254,
+    6.695900e-05: 254,
+    6.696899e-05: 254,
+    6.704891e-05: 254,
+    6.706889e-05: 254,
+    6.710885e-05: 254,
+    6.713881e-05: 254,
+    6.714880e-05: 254,
+    6.722872e-05: 254,
+    6.733860e-05: 254,
+    6.737856e-05: 254,
+    6.738855e-05: 254,
+    6.741852e-05: 254,
+    6.749843e-05: 254,
+    6.751841e-05: 254,
+    6.754838e-05: 254,
+    6.759833e-05: 254,
+    6.760832e-05: 254,
+    6.761830e-05: 254,
+    6.762829e-05: 254,
+    6.764827e-05: 254,
+    6.766825e-05: 254,
+    6.770821e-05: 254,
+    6.777814e-05: 254,
+    6.781809e-05: 254,
+    6.790800e-05: 254,
+    6.792798e-05: 254,
+    6.796793e-05: 254,
+    6.802787e-05: 254,
+    6.804785e-05: 254,
+    6.807782e-05: 254,
+    6.808781e-05: 254,
+    6.813775e-05: 254,
+    6.814774e-05: 254,
+    6.821767e-05: 254,
+    6.830757e-05: 254,
+    6.836751e-05: 254,
+    6.837750e-05: 254,
+    6.841746e-05: 254,
+    6.843744e-05: 254,
+    6.855731e-05: 254,
+    6.859727e-05: 254,
+    6.863722e-05: 254,
+    6.865720e-05: 254,
+    6.868717e-05: 254,
+    6.886698e-05: 254,
+    6.888696e-05: 254,
+    6.897686e-05: 254,
+    6.900683e-05: 254,
+    6.902681e-05: 254,
+    6.905678e-05: 254,
+    6.909674e-05: 254,
+    6.918664e-05: 254,
+    6.925657e-05: 254,
+    6.928654e-05: 254,
+    6.929653e-05: 254,
+    6.951629e-05: 254,
+    6.955625e-05: 254,
+    6.965614e-05: 254,
+    6.977602e-05: 254,
+    6.979600e-05: 254,
+    6.980599e-05: 254,
+    6.988590e-05: 254,
+    6.994584e-05: 254,
+    6.998579e-05: 254,
+    7.015561e-05: 254,
+    7.018558e-05: 254,
+    7.020556e-05: 254,
+    7.024552e-05: 254,
+    7.028548e-05: 254,
+    7.031545e-05: 254,
+    7.042533e-05: 254,
+    7.045530e-05: 254,
+    7.052522e-05: 254,
+    7.054520e-05: 254,
+    7.056518e-05: 254,
+    7.066507e-05: 254,
+    7.067506e-05: 254,
+    7.070503e-05: 254,
+    7.080493e-05: 254,
+    7.086486e-05: 254,
+    7.088484e-05: 254,
+    7.102469e-05: 254,
+    7.107464e-05: 254,
+    7.117453e-05: 254,
+    7.139430e-05: 254,
+    7.147422e-05: 254,
+    7.148421e-05: 254,
+    7.156412e-05: 254,
+    7.159409e-05: 254,
+    7.163405e-05: 254,
+    7.172395e-05: 254,
+    7.173394e-05: 254,
+    7.174393e-05: 254,
+    7.192374e-05: 254,
+    7.205360e-05: 254,
+    7.206359e-05: 254,
+    7.208357e-05: 254,
+    7.217348e-05: 254,
+    7.219345e-05: 254,
+    7.220344e-05: 254,
+    7.224340e-05: 254,
+    7.228336e-05: 254,
+    7.229335e-05: 254,
+    7.232332e-05: 254,
+    7.241322e-05: 254,
+    7.250313e-05: 254,
+    7.260302e-05: 254,
+    7.263299e-05: 254,
+    7.265297e-05: 254,
+    7.266296e-05: 254,
+    7.268294e-05: 254,
+    7.279282e-05: 254,
+    7.281280e-05: 254,
+    7.282279e-05: 254,
+    7.283278e-05: 254,
+    7.293267e-05: 254,
+    7.307252e-05: 254,
+    7.308251e-05: 254,
+    7.312247e-05: 254,
+    7.317242e-05: 254,
+    7.327231e-05: 254,
+    7.329229e-05: 254,
+    7.330228e-05: 254,
+    7.335223e-05: 254,
+    7.336221e-05: 254,
+    7.344213e-05: 254,
+    7.345212e-05: 254,
+    7.349208e-05: 254,
+    7.351206e-05: 254,
+    7.356200e-05: 254,
+    7.367189e-05: 254,
+    7.382173e-05: 254,
+    7.390164e-05: 254,
+    7.402152e-05: 254,
+    7.421131e-05: 254,
+    7.429123e-05: 254,
+    7.430122e-05: 254,
+    7.453098e-05: 254,
+    7.454096e-05: 254,
+    7.456094e-05: 254,
+    7.458092e-05: 254,
+    7.467083e-05: 254,
+    7.470080e-05: 254,
+    7.472077e-05: 254,
+    7.478071e-05: 254,
+    7.488060e-05: 254,
+    7.489059e-05: 254,
+    7.492056e-05: 254,
+    7.493055e-05: 254,
+    7.494054e-05: 254,
+    7.501047e-05: 254,
+    7.508039e-05: 254,
+    7.515032e-05: 254,
+    7.519028e-05: 254,
+    7.522024e-05: 254,
+    7.533013e-05: 254,
+    7.536010e-05: 254,
+    7.541004e-05: 254,
+    7.547997e-05: 254,
+    7.551993e-05: 254,
+    7.564979e-05: 254,
+    7.572970e-05: 254,
+    7.578964e-05: 254,
+    7.580962e-05: 254,
+    7.586956e-05: 254,
+    7.589952e-05: 254,
+    7.595946e-05: 254,
+    7.596945e-05: 254,
+    7.597944e-05: 254,
+    7.598943e-05: 254,
+    7.608932e-05: 254,
+    7.611929e-05: 254,
+    7.612928e-05: 254,
+    7.620920e-05: 254,
+    7.628911e-05: 254,
+    7.630909e-05: 254,
+    7.632907e-05: 254,
+    7.637902e-05: 254,
+    7.638901e-05: 254,
+    7.641897e-05: 254,
+    7.649889e-05: 254,
+    7.650888e-05: 254,
+    7.651887e-05: 254,
+    7.656881e-05: 254,
+    7.697838e-05: 254,
+    7.700835e-05: 254,
+    7.709825e-05: 254,
+    7.717817e-05: 254,
+    7.718816e-05: 254,
+    7.721813e-05: 254,
+    7.732801e-05: 254,
+    7.752780e-05: 254,
+    7.754778e-05: 254,
+    7.755777e-05: 254,
+    7.762769e-05: 254,
+    7.773758e-05: 254,
+    7.774757e-05: 254,
+    7.779751e-05: 254,
+    7.782748e-05: 254,
+    7.783747e-05: 254,
+    7.784746e-05: 254,
+    7.795734e-05: 254,
+    7.808720e-05: 254,
+    7.817711e-05: 254,
+    7.823705e-05: 254,
+    7.831696e-05: 254,
+    7.854672e-05: 254,
+    7.892632e-05: 254,
+    7.900623e-05: 254,
+    7.903620e-05: 254,
+    7.905618e-05: 254,
+    7.910612e-05: 254,
+    7.912610e-05: 254,
+    7.918604e-05: 254,
+    7.926596e-05: 254,
+    7.935586e-05: 254,
+    7.936585e-05: 254,
+    7.941580e-05: 254,
+    7.945575e-05: 254,
+    7.946574e-05: 254,
+    7.948572e-05: 254,
+    7.950570e-05: 254,
+    7.955565e-05: 254,
+    7.964555e-05: 254,
+    7.966553e-05: 254,
+    7.971548e-05: 254,
+    7.988530e-05: 254,
+    7.992526e-05: 254,
+    7.999518e-05: 254,
+    8.000517e-05: 254,
+    8.004513e-05: 254,
+    8.019497e-05: 254,
+    8.021495e-05: 254,
+    8.028487e-05: 254,
+    8.031484e-05: 254,
+    8.037478e-05: 254,
+    8.038477e-05: 254,
+    8.040475e-05: 254,
+    8.043472e-05: 254,
+    8.045469e-05: 254,
+    8.049465e-05: 254,
+    8.050464e-05: 254,
+    8.051463e-05: 254,
+    8.069444e-05: 254,
+    8.070443e-05: 254,
+    8.071442e-05: 254,
+    8.077436e-05: 254,
+    8.087425e-05: 254,
+    8.101410e-05: 254,
+    8.104407e-05: 254,
+    8.105406e-05: 254,
+    8.115395e-05: 254,
+    8.117393e-05: 254,
+    8.121389e-05: 254,
+    8.132377e-05: 254,
+    8.133376e-05: 254,
+    8.145364e-05: 254,
+    8.152356e-05: 254,
+    8.155353e-05: 254,
+    8.160348e-05: 254,
+    8.166341e-05: 254,
+    8.172335e-05: 254,
+    8.174333e-05: 255,
+    8.188318e-05: 255,
+    8.199306e-05: 255,
+    8.214290e-05: 255,
+    8.220284e-05: 255,
+    8.222282e-05: 255,
+    8.223281e-05: 255,
+    8.229275e-05: 255,
+    8.236267e-05: 255,
+    8.238265e-05: 255,
+    8.240263e-05: 255,
+    8.241262e-05: 255,
+    8.256246e-05: 255,
+    8.296204e-05: 255,
+    8.301198e-05: 255,
+    8.303196e-05: 255,
+    8.309190e-05: 255,
+    8.311188e-05: 255,
+    8.314185e-05: 255,
+    8.322176e-05: 255,
+    8.329169e-05: 255,
+    8.332165e-05: 255,
+    8.333164e-05: 255,
+    8.337160e-05: 255,
+    8.340157e-05: 255,
+    8.355141e-05: 255,
+    8.360136e-05: 255,
+    8.368127e-05: 255,
+    8.380115e-05: 255,
+    8.385109e-05: 255,
+    8.386108e-05: 255,
+    8.396098e-05: 255,
+    8.403090e-05: 255,
+    8.404089e-05: 255,
+    8.410083e-05: 255,
+    8.411082e-05: 255,
+    8.415078e-05: 255,
+    8.431061e-05: 255,
+    8.438053e-05: 255,
+    8.439052e-05: 255,
+    8.477012e-05: 255,
+    8.480009e-05: 255,
+    8.511975e-05: 255,
+    8.519966e-05: 255,
+    8.522963e-05: 255,
+    8.536948e-05: 255,
+    8.559924e-05: 255,
+    8.560923e-05: 255,
+    8.561922e-05: 255,
+    8.570912e-05: 255,
+    8.571911e-05: 255,
+    8.572910e-05: 255,
+    8.575907e-05: 255,
+    8.578904e-05: 255,
+    8.595886e-05: 255,
+    8.597884e-05: 255,
+    8.601880e-05: 255,
+    8.602878e-05: 255,
+    8.604876e-05: 255,
+    8.609871e-05: 255,
+    8.612868e-05: 255,
+    8.616864e-05: 255,
+    8.626853e-05: 255,
+    8.627852e-05: 255,
+    8.639839e-05: 255,
+    8.641837e-05: 255,
+    8.646832e-05: 255,
+    8.651827e-05: 255,
+    8.653824e-05: 255,
+    8.654823e-05: 255,
+    8.660817e-05: 255,
+    8.672804e-05: 255,
+    8.677799e-05: 255,
+    8.683793e-05: 255,
+    8.693782e-05: 255,
+    8.694781e-05: 255,
+    8.702773e-05: 255,
+    8.710764e-05: 255,
+    8.732741e-05: 255,
+    8.733740e-05: 255,
+    8.737735e-05: 255,
+    8.740732e-05: 255,
+    8.747725e-05: 255,
+    8.750722e-05: 255,
+    8.769702e-05: 255,
+    8.774696e-05: 255,
+    8.788681e-05: 255,
+    8.791678e-05: 255,
+    8.796673e-05: 255,
+    8.804665e-05: 255,
+    8.810658e-05: 255,
+    8.815653e-05: 255,
+    8.816652e-05: 255,
+    8.818650e-05: 255,
+    8.823644e-05: 255,
+    8.825642e-05: 255,
+    8.827640e-05: 255,
+    8.841625e-05: 255,
+    8.847619e-05: 255,
+    8.863602e-05: 255,
+    8.868597e-05: 255,
+    8.870595e-05: 255,
+    8.872592e-05: 255,
+    8.874590e-05: 255,
+    8.895568e-05: 255,
+    8.899564e-05: 255,
+    8.900563e-05: 255,
+    8.906556e-05: 255,
+    8.912550e-05: 255,
+    8.915547e-05: 255,
+    8.918544e-05: 255,
+    8.928533e-05: 255,
+    8.930531e-05: 255,
+    8.943517e-05: 255,
+    8.947513e-05: 255,
+    8.960499e-05: 255,
+    8.965494e-05: 255,
+    8.966493e-05: 255,
+    8.967492e-05: 255,
+    8.981477e-05: 255,
+    8.986472e-05: 255,
+    8.999458e-05: 255,
+    9.001456e-05: 255,
+    9.017439e-05: 255,
+    9.022434e-05: 255,
+    9.060393e-05: 255,
+    9.064389e-05: 255,
+    9.068385e-05: 255,
+    9.078374e-05: 255,
+    9.081371e-05: 255,
+    9.086366e-05: 255,
+    9.092359e-05: 255,
+    9.098353e-05: 255,
+    9.103348e-05: 255,
+    9.106345e-05: 255,
+    9.109341e-05: 255,
+    9.112338e-05: 255,
+    9.122328e-05: 255,
+    9.125325e-05: 255,
+    9.128321e-05: 255,
+    9.142307e-05: 255,
+    9.157291e-05: 255,
+    9.184262e-05: 255,
+    9.189257e-05: 255,
+    9.200245e-05: 255,
+    9.201244e-05: 255,
+    9.214230e-05: 255,
+    9.222222e-05: 255,
+    9.224220e-05: 255,
+    9.228215e-05: 255,
+    9.236207e-05: 255,
+    9.256186e-05: 255,
+    9.260182e-05: 255,
+    9.277164e-05: 255,
+    9.282158e-05: 255,
+    9.301138e-05: 255,
+    9.323115e-05: 255,
+    9.329108e-05: 255,
+    9.331106e-05: 255,
+    9.335102e-05: 255,
+    9.340097e-05: 255,
+    9.343094e-05: 255,
+    9.354082e-05: 255,
+    9.362073e-05: 255,
+    9.387047e-05: 255,
+    9.389045e-05: 255,
+    9.395039e-05: 255,
+    9.399034e-05: 255,
+    9.408025e-05: 255,
+    9.419013e-05: 255,
+    9.420012e-05: 255,
+    9.423009e-05: 255,
+    9.425007e-05: 255,
+    9.427005e-05: 255,
+    9.432998e-05: 255,
+    9.434996e-05: 255,
+    9.439991e-05: 255,
+    9.459970e-05: 255,
+    9.473955e-05: 255,
+    9.497929e-05: 255,
+    9.507919e-05: 255,
+    9.516909e-05: 255,
+    9.528897e-05: 255,
+    9.533891e-05: 255,
+    9.542882e-05: 255,
+    9.546878e-05: 255,
+    9.563860e-05: 255,
+    9.564858e-05: 255,
+    9.567855e-05: 255,
+    9.579843e-05: 255,
+    9.582839e-05: 255,
+    9.586835e-05: 255,
+    9.604816e-05: 255,
+    9.609811e-05: 255,
+    9.610810e-05: 255,
+    9.613807e-05: 255,
+    9.633785e-05: 255,
+    9.661756e-05: 255,
+    9.665752e-05: 255,
+    9.668748e-05: 255,
+    9.690725e-05: 255,
+    9.701713e-05: 255,
+    9.704710e-05: 255,
+    9.705709e-05: 255,
+    9.711703e-05: 255,
+    9.735677e-05: 255,
+    9.738674e-05: 255,
+    9.779631e-05: 255,
+    9.796613e-05: 255,
+    9.801607e-05: 255,
+    9.806602e-05: 255,
+    9.807601e-05: 255,
+    9.835571e-05: 255,
+    9.843563e-05: 255,
+    9.845561e-05: 255,
+    9.861544e-05: 255,
+    9.866539e-05: 255,
+    9.868536e-05: 255,
+    9.887516e-05: 255,
+    9.895508e-05: 255,
+    9.898505e-05: 255,
+    9.907495e-05: 255,
+    9.930471e-05: 255,
+    9.937463e-05: 255,
+    9.940460e-05: 255,
+    9.942458e-05: 255,
+    9.961438e-05: 255,
+    9.973425e-05: 255,
+    9.974424e-05: 255,
+    9.982416e-05: 255,
+    9.985413e-05: 255,
+    9.996401e-05: 255,
+    9.997400e-05: 255,
+    1.001838e-04: 255,
+    1.002537e-04: 255,
+    1.002637e-04: 255,
+    1.002837e-04: 255,
+    1.003336e-04: 255,
+    1.004235e-04: 255,
+    1.005534e-04: 255,
+    1.005734e-04: 255,
+    1.006033e-04: 255,
+    1.006233e-04: 255,
+    1.008031e-04: 255,
+    1.010129e-04: 255,
+    1.010329e-04: 255,
+    1.011627e-04: 255,
+    1.013126e-04: 255,
+    1.013825e-04: 255,
+    1.015124e-04: 255,
+    1.015823e-04: 255,
+    1.015923e-04: 255,
+    1.016123e-04: 255,
+    1.016722e-04: 255,
+    1.018620e-04: 255,
+    1.018720e-04: 255,
+    1.021717e-04: 255,
+    1.022816e-04: 255,
+    1.022915e-04: 255,
+    1.024614e-04: 255,
+    1.026611e-04: 255,
+    1.028909e-04: 255,
+    1.029109e-04: 255,
+    1.030407e-04: 255,
+    1.031107e-04: 255,
+    1.035802e-04: 255,
+    1.036201e-04: 255,
+    1.036801e-04: 255,
+    1.037200e-04: 255,
+    1.037800e-04: 255,
+    1.039698e-04: 255,
+    1.040097e-04: 255,
+    1.040297e-04: 255,
+    1.040597e-04: 255,
+    1.040896e-04: 255,
+    1.041995e-04: 255,
+    1.042395e-04: 255,
+    1.042595e-04: 255,
+    1.042994e-04: 255,
+    1.043094e-04: 255,
+    1.044792e-04: 255,
+    1.046191e-04: 255,
+    1.046490e-04: 255,
+    1.046790e-04: 255,
+    1.046890e-04: 255,
+    1.047489e-04: 255,
+    1.048488e-04: 255,
+    1.049687e-04: 255,
+    1.051185e-04: 255,
+    1.051585e-04: 255,
+    1.052184e-04: 255,
+    1.053383e-04: 255,
+    1.054382e-04: 255,
+    1.056480e-04: 255,
+    1.056979e-04: 255,
+    1.057479e-04: 255,
+    1.057679e-04: 255,
+    1.057778e-04: 255,
+    1.058478e-04: 255,
+    1.058578e-04: 255,
+    1.058877e-04: 255,
+    1.059876e-04: 255,
+    1.061674e-04: 255,
+    1.062374e-04: 255,
+    1.065470e-04: 255,
+    1.065570e-04: 255,
+    1.066469e-04: 255,
+    1.066569e-04: 255,
+    1.068867e-04: 255,
+    1.069066e-04: 255,
+    1.069366e-04: 255,
+    1.069866e-04: 255,
+    1.070065e-04: 255,
+    1.071364e-04: 255,
+    1.071764e-04: 255,
+    1.073362e-04: 255,
+    1.073462e-04: 255,
+    1.074461e-04: 255,
+    1.074760e-04: 255,
+    1.075260e-04: 255,
+    1.079156e-04: 255,
+    1.079755e-04: 255,
+    1.081353e-04: 255,
+    1.084051e-04: 255,
+    1.084350e-04: 255,
+    1.086348e-04: 255,
+    1.086448e-04: 255,
+    1.087047e-04: 255,
+    1.087647e-04: 255,
+    1.088246e-04: 255,
+    1.089145e-04: 255,
+    1.089545e-04: 255,
+    1.089944e-04: 255,
+    1.090244e-04: 255,
+    1.090444e-04: 255,
+    1.090943e-04: 255,
+    1.092342e-04: 255,
+    1.092841e-04: 255,
+    1.096637e-04: 255,
+    1.097836e-04: 255,
+    1.099035e-04: 255,
+    1.099934e-04: 255,
+    1.100233e-04: 255,
+    1.103630e-04: 255,
+    1.105328e-04: 255,
+    1.107825e-04: 255,
+    1.108525e-04: 255,
+    1.109224e-04: 255,
+    1.110123e-04: 255,
+    1.110622e-04: 255,
+    1.110822e-04: 255,
+    1.113120e-04: 255,
+    1.115018e-04: 255,
+    1.115717e-04: 255,
+    1.118214e-04: 255,
+    1.119713e-04: 255,
+    1.120112e-04: 255,
+    1.120612e-04: 255,
+    1.121511e-04: 255,
+    1.124008e-04: 255,
+    1.125007e-04: 255,
+    1.126805e-04: 255,
+    1.130202e-04: 255,
+    1.130901e-04: 255,
+    1.131700e-04: 255,
+    1.132399e-04: 255,
+    1.132799e-04: 255,
+    1.133398e-04: 255,
+    1.134098e-04: 255,
+    1.134297e-04: 255,
+    1.135896e-04: 255,
+    1.138093e-04: 255,
+    1.140291e-04: 255,
+    1.141290e-04: 255,
+    1.141989e-04: 255,
+    1.142089e-04: 255,
+    1.142289e-04: 255,
+    1.142888e-04: 255,
+    1.142988e-04: 255,
+    1.143488e-04: 255,
+    1.145685e-04: 255,
+    1.147383e-04: 255,
+    1.148083e-04: 255,
+    1.148183e-04: 255,
+    1.148682e-04: 255,
+    1.149281e-04: 255,
+    1.149581e-04: 255,
+    1.151379e-04: 255,
+    1.151479e-04: 255,
+    1.152878e-04: 255,
+    1.154376e-04: 255,
+    1.155475e-04: 255,
+    1.155575e-04: 255,
+    1.155974e-04: 255,
+    1.156973e-04: 255,
+    1.157073e-04: 255,
+    1.157473e-04: 255,
+    1.158172e-04: 255,
+    1.158572e-04: 255,
+    1.158671e-04: 255,
+    1.158971e-04: 255,
+    1.160170e-04: 255,
+    1.163566e-04: 255,
+    1.164066e-04: 255,
+    1.165165e-04: 255,
+    1.169860e-04: 255,
+    1.171558e-04: 255,
+    1.171857e-04: 255,
+    1.172157e-04: 255,
+    1.174355e-04: 255,
+    1.176253e-04: 255,
+    1.177152e-04: 255,
+    1.177252e-04: 255,
+    1.178151e-04: 255,
+    1.178251e-04: 255,
+    1.178451e-04: 255,
+    1.181048e-04: 255,
+    1.181547e-04: 255,
+    1.181747e-04: 255,
+    1.184644e-04: 255,
+    1.185044e-04: 255,
+    1.188839e-04: 255,
+    1.191836e-04: 255,
+    1.194234e-04: 255,
+    1.196232e-04: 255,
+    1.197231e-04: 255,
+    1.200227e-04: 255,
+    1.202125e-04: 255,
+    1.203724e-04: 255,
+    1.206021e-04: 255,
+    1.208519e-04: 255,
+    1.209318e-04: 255,
+    1.209418e-04: 255,
+    1.210716e-04: 255,
+    1.211815e-04: 255,
+    1.213413e-04: 255,
+    1.215811e-04: 255,
+    1.216310e-04: 255,
+    1.218009e-04: 255,
+    1.218708e-04: 255,
+    1.219907e-04: 255,
+    1.220706e-04: 255,
+    1.221205e-04: 255,
+    1.221904e-04: 255,
+    1.224102e-04: 255,
+    1.224602e-04: 255,
+    1.224901e-04: 255,
+    1.225001e-04: 255,
+    1.226699e-04: 255,
+    1.227299e-04: 255,
+    1.229097e-04: 255,
+    1.230296e-04: 255,
+    1.230695e-04: 255,
+    1.233192e-04: 255,
+    1.233792e-04: 255,
+    1.236189e-04: 255,
+    1.236489e-04: 255,
+    1.237088e-04: 255,
+    1.238986e-04: 255,
+    1.239386e-04: 255,
+    1.239785e-04: 255,
+    1.239985e-04: 255,
+    1.241883e-04: 255,
+    1.244081e-04: 255,
+    1.245280e-04: 255,
+    1.245679e-04: 255,
+    1.246678e-04: 255,
+    1.247877e-04: 255,
+    1.247977e-04: 255,
+    1.248077e-04: 255,
+    1.250274e-04: 255,
+    1.252472e-04: 255,
+    1.252872e-04: 255,
+    1.253871e-04: 255,
+    1.255868e-04: 255,
+    1.258166e-04: 255,
+    1.260364e-04: 255,
+    1.264060e-04: 255,
+    1.264759e-04: 255,
+    1.268655e-04: 255,
+    1.268755e-04: 255,
+    1.269854e-04: 255,
+    1.272950e-04: 255,
+    1.273450e-04: 255,
+    1.273650e-04: 255,
+    1.278444e-04: 255,
+    1.279044e-04: 255,
+    1.285837e-04: 255,
+    1.286436e-04: 255,
+    1.287435e-04: 255,
+    1.291031e-04: 255,
+    1.291231e-04: 255,
+    1.292530e-04: 255,
+    1.293828e-04: 255,
+    1.296026e-04: 255,
+    1.296825e-04: 255,
+    1.297125e-04: 255,
+    1.298423e-04: 255,
+    1.300022e-04: 255,
+    1.300921e-04: 255,
+    1.301820e-04: 255,
+    1.303118e-04: 255,
+    1.304817e-04: 255,
+    1.307813e-04: 255,
+    1.308912e-04: 255,
+    1.309012e-04: 255,
+    1.310111e-04: 255,
+    1.311509e-04: 255,
+    1.312608e-04: 255,
+    1.313907e-04: 255,
+    1.314207e-04: 255,
+    1.316604e-04: 255,
+    1.316704e-04: 255,
+    1.317203e-04: 255,
+    1.321699e-04: 255,
+    1.322198e-04: 255,
+    1.322598e-04: 255,
+    1.325095e-04: 255,
+    1.326194e-04: 255,
+    1.327293e-04: 255,
+    1.327592e-04: 255,
+    1.329490e-04: 255,
+    1.332088e-04: 255,
+    1.332287e-04: 255,
+    1.332987e-04: 255,
+    1.336183e-04: 255,
+    1.338880e-04: 255,
+    1.341078e-04: 255,
+    1.342876e-04: 255,
+    1.342976e-04: 255,
+    1.347471e-04: 255,
+    1.348970e-04: 255,
+    1.351267e-04: 255,
+    1.352266e-04: 255,
+    1.352466e-04: 255,
+    1.353165e-04: 255,
+    1.358560e-04: 255,
+    1.358659e-04: 255,
+    1.361556e-04: 255,
+    1.364154e-04: 255,
+    1.365552e-04: 255,
+    1.365952e-04: 255,
+    1.366052e-04: 255,
+    1.366151e-04: 255,
+    1.366951e-04: 255,
+    1.368649e-04: 255,
+    1.370047e-04: 255,
+    1.371746e-04: 255,
+    1.372844e-04: 255,
+    1.377040e-04: 255,
+    1.377639e-04: 255,
+    1.380736e-04: 255,
+    1.381335e-04: 255,
+    1.382234e-04: 255,
+    1.382634e-04: 255,
+    1.383034e-04: 255,
+    1.383133e-04: 255,
+    1.389027e-04: 255,
+    1.395920e-04: 255,
+    1.396319e-04: 255,
+    1.398517e-04: 255,
+    1.408507e-04: 255,
+    1.408906e-04: 255,
+    1.409406e-04: 255,
+    1.421593e-04: 255,
+    1.425688e-04: 255,
+    1.429085e-04: 255,
+    1.429384e-04: 255,
+    1.429984e-04: 255,
+    1.431982e-04: 255,
+    1.432981e-04: 255,
+    1.433580e-04: 255,
+    1.434279e-04: 255,
+    1.438874e-04: 255,
+    1.440573e-04: 255,
+    1.442670e-04: 255,
+    1.443370e-04: 255,
+    1.443769e-04: 255,
+    1.445567e-04: 255,
+    1.451261e-04: 255,
+    1.452660e-04: 255,
+    1.453958e-04: 255,
+    1.454258e-04: 255,
+    1.455956e-04: 255,
+    1.457255e-04: 255,
+    1.457455e-04: 255,
+    1.457654e-04: 255,
+    1.458653e-04: 255,
+    1.462150e-04: 255,
+    1.465446e-04: 255,
+    1.467644e-04: 255,
+    1.469142e-04: 255,
+    1.470840e-04: 255,
+    1.474037e-04: 255,
+    1.475835e-04: 255,
+    1.478932e-04: 255,
+    1.482228e-04: 255,
+    1.486424e-04: 255,
+    1.488821e-04: 255,
+    1.491618e-04: 255,
+    1.494016e-04: 255,
+    1.495414e-04: 255,
+    1.496214e-04: 255,
+    1.496613e-04: 255,
+    1.499210e-04: 255,
+    1.499510e-04: 255,
+    1.500309e-04: 255,
+    1.501308e-04: 255,
+    1.507302e-04: 255,
+    1.508800e-04: 255,
+    1.509000e-04: 255,
+    1.509799e-04: 255,
+    1.510898e-04: 255,
+    1.511997e-04: 255,
+    1.514694e-04: 255,
+    1.516492e-04: 255,
+    1.516692e-04: 255,
+    1.518890e-04: 255,
+    1.519888e-04: 255,
+    1.520488e-04: 255,
+    1.528180e-04: 255,
+    1.530777e-04: 255,
+    1.533274e-04: 255,
+    1.535872e-04: 255,
+    1.538968e-04: 255,
+    1.541266e-04: 255,
+    1.541865e-04: 255,
+    1.543563e-04: 255,
+    1.543863e-04: 255,
+    1.544462e-04: 255,
+    1.544962e-04: 255,
+    1.545162e-04: 255,
+    1.548558e-04: 255,
+    1.548658e-04: 255,
+    1.553852e-04: 255,
+    1.554652e-04: 255,
+    1.557049e-04: 255,
+    1.557149e-04: 255,
+    1.561644e-04: 255,
+    1.562543e-04: 255,
+    1.563143e-04: 255,
+    1.570435e-04: 255,
+    1.570535e-04: 255,
+    1.571634e-04: 255,
+    1.573532e-04: 255,
+    1.574531e-04: 255,
+    1.584120e-04: 255,
+    1.585619e-04: 255,
+    1.587417e-04: 255,
+    1.587916e-04: 255,
+    1.588815e-04: 255,
+    1.588915e-04: 255,
+    1.590414e-04: 255,
+    1.595109e-04: 255,
+    1.596108e-04: 255,
+    1.598006e-04: 255,
+    1.599104e-04: 255,
+    1.603600e-04: 255,
+    1.606297e-04: 255,
+    1.610892e-04: 255,
+    1.618284e-04: 255,
+    1.618584e-04: 255,
+    1.619982e-04: 255,
+    1.621681e-04: 255,
+    1.623778e-04: 255,
+    1.625576e-04: 255,
+    1.627474e-04: 255,
+    1.630271e-04: 255,
+    1.632669e-04: 255,
+    1.632869e-04: 255,
+    1.633168e-04: 255,
+    1.635466e-04: 255,
+    1.637064e-04: 255,
+    1.639562e-04: 255,
+    1.643757e-04: 255,
+    1.644656e-04: 255,
+    1.644756e-04: 255,
+    1.645256e-04: 255,
+    1.646554e-04: 255,
+    1.651349e-04: 255,
+    1.651549e-04: 255,
+    1.654745e-04: 255,
+    1.654845e-04: 255,
+    1.658242e-04: 255,
+    1.660439e-04: 255,
+    1.664835e-04: 255,
+    1.668131e-04: 255,
+    1.672127e-04: 255,
+    1.672926e-04: 255,
+    1.674724e-04: 255,
+    1.675124e-04: 255,
+    1.677421e-04: 255,
+    1.684514e-04: 255,
+    1.685113e-04: 255,
+    1.695502e-04: 255,
+    1.696202e-04: 255,
+    1.697300e-04: 255,
+    1.699998e-04: 255,
+    1.708788e-04: 255,
+    1.709587e-04: 255,
+    1.717879e-04: 255,
+    1.722973e-04: 255,
+    1.725770e-04: 255,
+    1.725970e-04: 255,
+    1.729067e-04: 255,
+    1.729666e-04: 255,
+    1.730465e-04: 255,
+    1.731864e-04: 255,
+    1.733162e-04: 255,
+    1.734461e-04: 255,
+    1.740055e-04: 255,
+    1.745849e-04: 255,
+    1.747148e-04: 255,
+    1.747547e-04: 255,
+    1.750044e-04: 255,
+    1.753940e-04: 255,
+    1.754939e-04: 255,
+    1.758835e-04: 255,
+    1.759434e-04: 255,
+    1.760334e-04: 255,
+    1.761532e-04: 255,
+    1.769524e-04: 255,
+    1.769823e-04: 255,
+    1.770922e-04: 255,
+    1.773719e-04: 255,
+    1.779313e-04: 255,
+    1.781611e-04: 255,
+    1.785906e-04: 255,
+    1.791301e-04: 255,
+    1.799092e-04: 255,
+    1.808882e-04: 255,
+    1.810680e-04: 255,
+    1.812978e-04: 255,
+    1.815275e-04: 255,
+    1.817873e-04: 255,
+    1.819771e-04: 255,
+    1.820070e-04: 255,
+    1.821968e-04: 255,
+    1.822967e-04: 255,
+    1.825664e-04: 255,
+    1.828661e-04: 255,
+    1.832557e-04: 255,
+    1.838051e-04: 255,
+    1.838650e-04: 255,
+    1.839949e-04: 255,
+    1.841248e-04: 255,
+    1.845743e-04: 255,
+    1.846342e-04: 255,
+    1.848340e-04: 255,
+    1.855632e-04: 255,
+    1.858829e-04: 255,
+    1.862026e-04: 255,
+    1.862425e-04: 255,
+    1.862725e-04: 255,
+    1.863224e-04: 255,
+    1.865522e-04: 255,
+    1.866121e-04: 255,
+    1.875811e-04: 255,
+    1.880606e-04: 255,
+    1.883803e-04: 255,
+    1.886700e-04: 255,
+    1.890196e-04: 255,
+    1.895590e-04: 255,
+    1.895790e-04: 255,
+    1.897188e-04: 255,
+    1.898487e-04: 255,
+    1.901983e-04: 255,
+    1.903981e-04: 255,
+    1.905080e-04: 255,
+    1.905580e-04: 255,
+    1.906379e-04: 255,
+    1.908876e-04: 255,
+    1.912472e-04: 255,
+    1.912972e-04: 255,
+    1.913072e-04: 255,
+    1.914071e-04: 255,
+    1.928755e-04: 255,
+    1.929854e-04: 255,
+    1.931452e-04: 255,
+    1.934249e-04: 255,
+    1.935847e-04: 255,
+    1.938045e-04: 255,
+    1.939943e-04: 255,
+    1.946336e-04: 255,
+    1.948634e-04: 255,
+    1.952730e-04: 255,
+    1.952829e-04: 255,
+    1.956326e-04: 255,
+    1.959323e-04: 255,
+    1.967314e-04: 255,
+    1.971210e-04: 255,
+    1.978902e-04: 255,
+    1.981299e-04: 255,
+    1.981399e-04: 255,
+    1.982398e-04: 255,
+    1.994285e-04: 255,
+    1.995984e-04: 255,
+    1.999880e-04: 255,
+    2.005174e-04: 255,
+    2.015563e-04: 255,
+    2.017860e-04: 255,
+    2.018859e-04: 255,
+    2.021257e-04: 255,
+    2.021457e-04: 255,
+    2.025253e-04: 255,
+    2.033244e-04: 255,
+    2.033344e-04: 255,
+    2.034243e-04: 255,
+    2.035442e-04: 255,
+    2.040536e-04: 255,
+    2.044932e-04: 255,
+    2.046630e-04: 255,
+    2.049627e-04: 255,
+    2.050426e-04: 255,
+    2.052124e-04: 255,
+    2.059317e-04: 255,
+    2.067708e-04: 255,
+    2.077897e-04: 255,
+    2.084490e-04: 255,
+    2.090084e-04: 255,
+    2.100373e-04: 255,
+    2.110762e-04: 255,
+    2.112160e-04: 255,
+    2.116356e-04: 255,
+    2.117155e-04: 255,
+    2.117555e-04: 255,
+    2.131140e-04: 255,
+    2.131840e-04: 255,
+    2.135136e-04: 255,
+    2.135736e-04: 255,
+    2.137134e-04: 255,
+    2.145525e-04: 255,
+    2.145825e-04: 255,
+    2.147523e-04: 255,
+    2.149021e-04: 255,
+    2.149621e-04: 255,
+    2.158112e-04: 255,
+    2.158212e-04: 255,
+    2.160210e-04: 255,
+    2.160809e-04: 255,
+    2.168001e-04: 255,
+    2.177092e-04: 255,
+    2.178890e-04: 255,
+    2.183385e-04: 255,
+    2.191177e-04: 255,
+    2.198669e-04: 255,
+    2.199967e-04: 255,
+    2.200966e-04: 255,
+    2.207459e-04: 255,
+    2.207559e-04: 255,
+    2.209557e-04: 255,
+    2.210157e-04: 255,
+    2.212254e-04: 255,
+    2.216450e-04: 255,
+    2.219147e-04: 255,
+    2.225440e-04: 255,
+    2.228737e-04: 255,
+    2.229136e-04: 255,
+    2.229736e-04: 255,
+    2.233432e-04: 255,
+    2.262501e-04: 255,
+    2.266497e-04: 255,
+    2.266697e-04: 255,
+    2.267696e-04: 255,
+    2.269893e-04: 255,
+    2.283978e-04: 255,
+    2.286675e-04: 255,
+    2.291071e-04: 255,
+    2.292170e-04: 255,
+    2.299961e-04: 255,
+    2.306155e-04: 255,
+    2.314546e-04: 255,
+    2.314746e-04: 255,
+    2.315045e-04: 255,
+    2.315345e-04: 255,
+    2.315545e-04: 255,
+    2.318841e-04: 255,
+    2.319341e-04: 255,
+    2.322238e-04: 255,
+    2.323736e-04: 255,
+    2.327932e-04: 255,
+    2.333626e-04: 255,
+    2.333825e-04: 255,
+    2.338421e-04: 255,
+    2.342816e-04: 255,
+    2.343415e-04: 255,
+    2.354004e-04: 255,
+    2.360897e-04: 255,
+    2.365092e-04: 255,
+    2.367290e-04: 255,
+    2.368689e-04: 255,
+    2.370087e-04: 255,
+    2.371186e-04: 255,
+    2.372185e-04: 255,
+    2.372385e-04: 255,
+    2.377180e-04: 255,
+    2.378778e-04: 255,
+    2.380376e-04: 255,
+    2.381974e-04: 255,
+    2.396359e-04: 255,
+    2.397658e-04: 255,
+    2.409845e-04: 255,
+    2.418735e-04: 255,
+    2.428525e-04: 255,
+    2.437116e-04: 255,
+    2.441811e-04: 255,
+    2.452400e-04: 255,
+    2.452799e-04: 255,
+    2.456895e-04: 255,
+    2.462289e-04: 255,
+    2.463688e-04: 255,
+    2.463888e-04: 255,
+    2.479171e-04: 255,
+    2.479771e-04: 255,
+    2.487463e-04: 255,
+    2.487862e-04: 255,
+    2.490160e-04: 255,
+    2.490459e-04: 255,
+    2.493356e-04: 255,
+    2.495554e-04: 255,
+    2.501548e-04: 255,
+    2.507441e-04: 255,
+    2.517631e-04: 255,
+    2.527021e-04: 255,
+    2.533813e-04: 255,
+    2.549896e-04: 255,
+    2.551095e-04: 255,
+    2.555490e-04: 255,
+    2.565680e-04: 255,
+    2.568577e-04: 255,
+    2.572073e-04: 255,
+    2.575369e-04: 255,
+    2.579465e-04: 255,
+    2.587656e-04: 255,
+    2.594149e-04: 255,
+    2.596247e-04: 255,
+    2.598045e-04: 255,
+    2.605437e-04: 255,
+    2.607036e-04: 255,
+    2.619123e-04: 255,
+    2.621620e-04: 255,
+    2.622619e-04: 255,
+    2.627714e-04: 255,
+    2.631510e-04: 255,
+    2.636804e-04: 255,
+    2.660979e-04: 255,
+    2.670868e-04: 255,
+    2.671667e-04: 255,
+    2.674564e-04: 255,
+    2.684354e-04: 255,
+    2.695842e-04: 255,
+    2.696341e-04: 255,
+    2.700437e-04: 255,
+    2.707929e-04: 255,
+    2.715521e-04: 255,
+    2.727408e-04: 255,
+    2.729606e-04: 255,
+    2.737198e-04: 255,
+    2.743791e-04: 255,
+    2.746588e-04: 255,
+    2.752182e-04: 255,
+    2.758176e-04: 255,
+    2.768065e-04: 255,
+    2.772360e-04: 255,
+    2.773659e-04: 255,
+    2.773959e-04: 255,
+    2.776956e-04: 255,
+    2.778354e-04: 255,
+    2.782550e-04: 255,
+    2.784348e-04: 255,
+    2.787345e-04: 255,
+    2.801030e-04: 255,
+    2.822807e-04: 255,
+    2.829100e-04: 255,
+    2.844484e-04: 255,
+    2.856971e-04: 255,
+    2.872055e-04: 255,
+    2.874352e-04: 255,
+    2.896229e-04: 255,
+    2.905719e-04: 255,
+    2.908017e-04: 255,
+    2.922102e-04: 255,
+    2.964657e-04: 255,
+    2.967454e-04: 255,
+    2.975046e-04: 255,
+    2.980340e-04: 255,
+    2.982837e-04: 255,
+    2.987832e-04: 255,
+    3.004614e-04: 255,
+    3.025892e-04: 255,
+    3.033184e-04: 255,
+    3.034682e-04: 255,
+    3.037779e-04: 255,
+    3.046670e-04: 255,
+    3.053263e-04: 255,
+    3.061154e-04: 255,
+    3.074141e-04: 255,
+    3.088725e-04: 255,
+    3.090923e-04: 255,
+    3.104908e-04: 255,
+    3.131080e-04: 255,
+    3.155454e-04: 255,
+    3.187121e-04: 255,
+    3.197809e-04: 255,
+    3.199408e-04: 255,
+    3.201006e-04: 255,
+    3.202604e-04: 255,
+    3.218587e-04: 255,
+    3.237467e-04: 255,
+    3.255948e-04: 255,
+    3.281920e-04: 255,
+    3.300600e-04: 255,
+    3.301000e-04: 255,
+    3.303597e-04: 255,
+    3.313387e-04: 255,
+    3.338460e-04: 255,
+    3.350448e-04: 255,
+    3.357540e-04: 255,
+    3.371625e-04: 255,
+    3.373523e-04: 255,
+    3.400694e-04: 255,
+    3.402792e-04: 255,
+    3.414180e-04: 255,
+    3.425568e-04: 255,
+    3.435258e-04: 255,
+    3.436456e-04: 255,
+    3.438854e-04: 255,
+    3.445147e-04: 255,
+    3.447245e-04: 255,
+    3.475315e-04: 255,
+    3.486803e-04: 255,
+    3.494095e-04: 255,
+    3.500289e-04: 255,
+    3.504085e-04: 255,
+    3.510678e-04: 255,
+    3.512176e-04: 255,
+    3.514074e-04: 255,
+    3.517371e-04: 255,
+    3.523764e-04: 255,
+    3.531456e-04: 255,
+    3.543543e-04: 255,
+    3.551634e-04: 255,
+    3.563422e-04: 255,
+    3.572013e-04: 255,
+    3.575509e-04: 255,
+    3.593390e-04: 255,
+    3.623558e-04: 255,
+    3.649031e-04: 255,
+    3.693184e-04: 255,
+    3.719656e-04: 255,
+    3.732742e-04: 255,
+    3.750124e-04: 255,
+    3.758415e-04: 255,
+    3.760213e-04: 255,
+    3.770502e-04: 255,
+    3.786585e-04: 255,
+    3.793578e-04: 255,
+    3.796475e-04: 255,
+    3.816453e-04: 255,
+    3.834334e-04: 255,
+    3.861805e-04: 255,
+    3.870596e-04: 255,
+    3.885081e-04: 255,
+    3.888677e-04: 255,
+    3.907057e-04: 255,
+    3.911852e-04: 255,
+    3.922341e-04: 255,
+    3.945417e-04: 255,
+    3.973187e-04: 255,
+    3.987372e-04: 255,
+    4.007551e-04: 255,
+    4.009449e-04: 255,
+    4.023134e-04: 255,
+    4.026331e-04: 255,
+    4.069585e-04: 255,
+    4.074180e-04: 255,
+    4.112639e-04: 255,
+    4.141009e-04: 255,
+    4.150299e-04: 255,
+    4.181966e-04: 255,
+    4.222423e-04: 255,
+    4.225720e-04: 255,
+    4.238606e-04: 255,
+    4.309930e-04: 255,
+    4.323816e-04: 255,
+    4.359078e-04: 255,
+    4.396638e-04: 255,
+    4.405129e-04: 255,
+    4.440492e-04: 255,
+    4.462668e-04: 255,
+    4.499529e-04: 255,
+    4.506921e-04: 255,
+    4.516911e-04: 255,
+    4.523803e-04: 255,
+    4.607615e-04: 255,
+    4.613109e-04: 255,
+    4.617904e-04: 255,
+    4.622499e-04: 255,
+    4.631389e-04: 255,
+    4.655863e-04: 255,
+    4.703912e-04: 255,
+    4.712204e-04: 255,
+    4.736578e-04: 255,
+    4.803906e-04: 255,
+    4.805005e-04: 255,
+    4.828680e-04: 255,
+    4.832276e-04: 255,
+    4.859947e-04: 255,
+    4.887118e-04: 255,
+    4.898606e-04: 255,
+    4.933269e-04: 255,
+    4.959941e-04: 255,
+    5.016581e-04: 255,
+    5.041355e-04: 255,
+    5.074320e-04: 255,
+    5.082311e-04: 255,
+    5.087206e-04: 255,
+    5.142448e-04: 255,
+    5.234350e-04: 255,
+    5.239644e-04: 255,
+    5.240344e-04: 255,
+    5.430842e-04: 255,
+    5.455216e-04: 255,
+    5.573191e-04: 255,
+    5.583979e-04: 255,
+    5.614847e-04: 255,
+    5.617144e-04: 255,
+    5.656802e-04: 255,
+    5.658201e-04: 255,
+    5.682275e-04: 255,
+    5.748605e-04: 255,
+    5.812637e-04: 255,
+    5.896848e-04: 255,
+    5.957184e-04: 255,
+    6.043392e-04: 255,
+    6.054780e-04: 255,
+    6.096836e-04: 255,
+    6.134396e-04: 255,
+    6.174553e-04: 255,
+    6.203223e-04: 255,
+    6.219006e-04: 255,
+    6.220205e-04: 255,
+    6.286534e-04: 255,
+    6.313106e-04: 255,
+    6.572232e-04: 255,
+    6.634366e-04: 255,
+    6.669329e-04: 255,
+    6.689907e-04: 255,
+    6.836451e-04: 255,
+    6.846241e-04: 255,
+    6.866819e-04: 255,
+    6.873312e-04: 255,
+    6.945136e-04: 255,
+    6.987791e-04: 255,
+    7.009168e-04: 255,
+    7.009468e-04: 255,
+    7.106765e-04: 255,
+    7.165902e-04: 255,
+    7.200066e-04: 255,
+    7.210555e-04: 255,
+    7.249414e-04: 255,
+    7.251511e-04: 255,
+    7.369986e-04: 255,
+    7.469380e-04: 255,
+    7.544401e-04: 255,
+    7.811518e-04: 255,
+    7.939682e-04: 255,
+    7.972747e-04: 255,
+    8.070942e-04: 255,
+    8.329368e-04: 255,
+    8.341955e-04: 255,
+    8.398695e-04: 255,
+    8.509477e-04: 255,
+    8.754018e-04: 255,
+    8.818150e-04: 255,
+    8.876888e-04: 255,
+    8.897366e-04: 255,
+    8.905558e-04: 255,
+    8.956504e-04: 255,
+    8.998259e-04: 255,
+    9.012844e-04: 255,
+    9.044610e-04: 255,
+    9.056797e-04: 255,
+    9.125724e-04: 255,
+    9.175771e-04: 255,
+    9.204441e-04: 255,
+    9.310029e-04: 255,
+    9.428603e-04: 255,
+    9.490537e-04: 255,
+    9.592329e-04: 255,
+    9.617802e-04: 255,
+    9.865440e-04: 255,
+    9.940061e-04: 255,
+    1.014095e-03: 255,
+    1.022186e-03: 255,
+    1.085060e-03: 255,
+    1.087307e-03: 255,
+    1.111192e-03: 255,
+    1.170139e-03: 255,
+    1.173346e-03: 255,
+    1.185743e-03: 255,
+    1.186462e-03: 255,
+    1.229566e-03: 255,
+    1.231444e-03: 255,
+    1.239765e-03: 255,
+    1.240265e-03: 255,
+    1.247527e-03: 255,
+    1.250734e-03: 255,
+    1.253111e-03: 255,
+    1.283769e-03: 255,
+    1.294128e-03: 255,
+    1.321359e-03: 255,
+    1.376680e-03: 255,
+    1.381905e-03: 255,
+    1.388807e-03: 255,
+    1.419895e-03: 255,
+    1.432771e-03: 255,
+    1.524643e-03: 255,
+    1.527440e-03: 255,
+    1.536841e-03: 255,
+    1.548168e-03: 255,
+    1.551875e-03: 255,
+    1.559486e-03: 255,
+    1.606557e-03: 255,
+    1.629332e-03: 255,
+    1.632969e-03: 255,
+    1.648412e-03: 255,
+    1.682136e-03: 255,
+    1.711865e-03: 255,
+    1.732343e-03: 255,
+    1.849169e-03: 255,
+    1.969072e-03: 255,
+    2.016502e-03: 255,
+    2.064081e-03: 255,
+    2.093121e-03: 255,
+    2.097206e-03: 255,
+    2.119333e-03: 255,
+    2.140540e-03: 255,
+    2.360707e-03: 255,
+    2.368559e-03: 255,
+    2.492168e-03: 255,
+    2.542964e-03: 255,
+    2.549277e-03: 255,
+    2.591682e-03: 255,
+    2.606426e-03: 255,
+    2.621690e-03: 255,
+    2.684384e-03: 255,
+    2.804047e-03: 255,
+    2.910934e-03: 255,
+    3.224901e-03: 255,
+    3.266676e-03: 255,
+    3.276206e-03: 255,
+    3.325034e-03: 255,
+    3.436816e-03: 255,
+    3.584120e-03: 255,
+    3.704622e-03: 255,
+    3.716400e-03: 255,
+    3.798812e-03: 255,
+    4.130970e-03: 255,
+    4.330159e-03: 255,
+    4.331397e-03: 255,
+    4.449243e-03: 255,
+    4.555889e-03: 255,
+    4.622868e-03: 255,
+    4.627494e-03: 255,
+    4.704502e-03: 255,
+    4.731913e-03: 255,
+    4.776715e-03: 255,
+    5.125346e-03: 255,
+    5.172396e-03: 255,
+    6.513594e-03: 255,
+    6.640759e-03: 255,
+    6.806573e-03: 255,
+    6.948582e-03: 255,
+    7.234300e-03: 255,
+    8.064519e-03: 255,
+    8.508209e-03: 255,
+    9.043641e-03: 255,
+    9.229964e-03: 255,
+    9.978090e-03: 255,
+    1.088405e-02: 255,
+    1.114201e-02: 255,
+    1.881300e-02: 255,
+    2.148607e-02: 255,
+    2.557634e-02: 255,
+    2.680036e-02: 255,
+    2.938674e-02: 255,
+    6.181373e-02: 255,
+}
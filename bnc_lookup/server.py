@@ -0,0 +1,328 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Persistent lookup daemon and client over a local Unix socket.
+
+Each CLI invocation pays for interpreter start-up and for importing the
+shards it touches. `bnc-lookup serve` keeps one process running with the
+tables loaded, and the CLI commands forward single-word lookups to it when
+it is available.
+
+Protocol (UTF-8, one request per line, fields separated by tabs):
+    exists<TAB>word[<TAB>fallback]
+    bucket<TAB>word[<TAB>fallback]
+    freq<TAB>word[<TAB>fallback]
+    expected<TAB>word<TAB>text_length[<TAB>rounded]
+
+Every request line gets exactly one response line, in request order, with
+the same text the CLI prints (e.g. 'True', '1', '6.181373e-02', 'None').
+Malformed requests get a line starting with 'ERR<TAB>'. Requests may be
+pipelined: a client can write any number of lines before reading, and the
+server answers everything it has received with a single write. Words
+cannot contain tabs or newlines: Client rejects them, since they would
+shift the fields or lines of every later request.
+
+The socket path is taken from the BNC_LOOKUP_SOCKET environment variable,
+defaulting to bnc-lookup-<uid>.sock in $XDG_RUNTIME_DIR, or, without it,
+to daemon.sock in a private (0700) bnc-lookup-<uid> directory of the
+system temporary directory. Setting BNC_LOOKUP_SOCKET to an empty string
+disables forwarding from the CLI.
+
+Another local user must not be able to answer in the daemon's place: the
+client only connects to a socket owned by the current user (and, where the
+platform reports it, served by a process of that user), and serve() only
+replaces a stale socket it owns.
+"""
+
+import os
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+
+import bnc_lookup as bnc
+from bnc_lookup.find_bnc import _get_hash_set
+from bnc_lookup.find_freq import _get_bucket_dict
+from bnc_lookup.find_rf import _get_rf_dict
+
+_RECV_SIZE = 65536
+
+# Requests a client sends before reading their responses
+_WINDOW = 1024
+
+
+def socket_path() -> str | None:
+    """Resolve the path of the daemon's Unix socket.
+
+    Returns:
+        Socket path, or None if Unix sockets are unavailable or forwarding
+        is disabled.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    path = os.environ.get('BNC_LOOKUP_SOCKET')
+    if path is None:
+        directory = os.environ.get('XDG_RUNTIME_DIR')
+        if directory:
+            path = os.path.join(directory, f'bnc-lookup-{os.getuid()}.sock')
+        else:
+            # The temporary directory is shared: keep the socket in a private one
+            path = os.path.join(tempfile.gettempdir(), f'bnc-lookup-{os.getuid()}', 'daemon.sock')
+    return path or None
+
+
+def _check_owner(path: str, private: bool = False) -> os.stat_result:
+    """Refuse a path another user could have created or replaced.
+
+    Args:
+        path: Socket or directory path (not followed if a symlink).
+        private: Also require that no other user has access to it.
+
+    Returns:
+        The path's stat result.
+
+    Raises:
+        PermissionError: If the path is owned by another user, or is
+            accessible to others when private is set.
+        OSError: If the path does not exist.
+    """
+    st = os.lstat(path)
+    if st.st_uid != os.getuid():
+        raise PermissionError(f'{path} is owned by another user')
+    if private and st.st_mode & 0o077:
+        raise PermissionError(f'{path} is accessible to other users (mode {stat.S_IMODE(st.st_mode):o})')
+    return st
+
+
+def _check_socket(path: str) -> None:
+    """Refuse to use a daemon socket that is not the current user's.
+
+    Args:
+        path: Socket path.
+
+    Raises:
+        PermissionError: If the path is not a socket owned by the current user.
+        OSError: If the path does not exist.
+    """
+    if not stat.S_ISSOCK(_check_owner(path).st_mode):
+        raise PermissionError(f'{path} is not a socket')
+
+
+def _check_peer(sock: socket.socket) -> None:
+    """Refuse a connection served by another user's process (Linux only).
+
+    Raises:
+        PermissionError: If the peer process runs as another user.
+    """
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return
+    credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    _, uid, _ = struct.unpack('3i', credentials)
+    if uid != os.getuid():
+        raise PermissionError('the lookup daemon runs as another user')
+
+
+def _check_fields(fields) -> None:
+    """Reject request fields that would break the line protocol.
+
+    Raises:
+        ValueError: If a field contains a tab or a newline.
+    """
+    for field in fields:
+        if '\t' in field or '\n' in field or '\r' in field:
+            raise ValueError(f'request fields cannot contain tabs or newlines: {field!r}')
+
+
+def _answer(line: str) -> str:
+    """Answer one request line.
+
+    Args:
+        line: Request without its trailing newline.
+
+    Returns:
+        Response text without a trailing newline.
+    """
+    fields = line.split('\t')
+    command, args = fields[0], fields[1:]
+    try:
+        if command == 'exists' and 1 <= len(args) <= 2:
+            return str(bnc.exists(*args))
+        if command == 'bucket' and 1 <= len(args) <= 2:
+            return str(bnc.bucket(*args))
+        if command == 'freq' and 1 <= len(args) <= 2:
+            result = bnc.relative_frequency(*args)
+            return 'None' if result is None else f'{result:.6e}'
+        if command == 'expected' and 2 <= len(args) <= 3:
+            rounded = len(args) == 3
+            if rounded and args[2] != 'rounded':
+                raise ValueError(f'expected rounded as the fourth field, not {args[2]!r}')
+            result = bnc.expected_count(args[0], int(args[1]), rounded=rounded)
+            if result is None or rounded:
+                return str(result)
+            return f'{result:.4f}'
+    except ValueError as e:
+        return f'ERR\t{e}'
+    return f'ERR\tunknown request: {command!r} with {len(args)} arguments'
+
+
+def _preload() -> None:
+    """Import every hash, bucket and relative-frequency shard."""
+    for i in range(256):
+        prefix = f'{i:02x}'
+        _get_hash_set(prefix)
+        _get_bucket_dict(prefix)
+        _get_rf_dict(prefix)
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    """Answer pipelined request lines on one connection."""
+
+    def handle(self):
+        pending = b''
+        while True:
+            chunk = self.request.recv(_RECV_SIZE)
+            if not chunk:
+                return
+            lines = (pending + chunk).split(b'\n')
+            pending = lines.pop()
+            if lines:
+                answers = [_answer(line.decode('utf-8', errors='replace')) for line in lines]
+                self.request.sendall(('\n'.join(answers) + '\n').encode())
+
+
+def serve(path: str | None = None, preload: bool = True) -> None:
+    """Run the lookup daemon until interrupted.
+
+    Args:
+        path: Socket path (defaults to socket_path()).
+        preload: Load every shard before accepting connections (default
+            True), so that no request pays for a cold import.
+
+    Raises:
+        RuntimeError: If Unix sockets are unavailable, no path is
+            configured, another daemon is already listening on path, or
+            path (or the private directory holding it by default) belongs
+            to another user.
+    """
+    path = path or socket_path()
+    if path is None:
+        raise RuntimeError('Unix sockets are unavailable or BNC_LOOKUP_SOCKET is empty')
+    directory = os.path.dirname(path)
+    try:
+        if directory == os.path.join(tempfile.gettempdir(), f'bnc-lookup-{os.getuid()}'):
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            _check_owner(directory, private=True)
+        if os.path.lexists(path):
+            _check_socket(path)
+    except PermissionError as e:
+        raise RuntimeError(f'refusing to serve on {path}: {e}') from e
+    if os.path.lexists(path):
+        try:
+            Client(path).close()
+        except OSError:
+            os.unlink(path)
+        else:
+            raise RuntimeError(f'a daemon is already listening on {path}')
+    if preload:
+        _preload()
+
+    # Bind with a restrictive umask, so the socket is never open to others
+    umask = os.umask(0o177)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(path, _Handler)
+    finally:
+        os.umask(umask)
+    server.daemon_threads = True
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+class Client:
+    """Connection to a running lookup daemon."""
+
+    def __init__(self, path: str | None = None, timeout: float = 1.0):
+        """Connect to the daemon.
+
+        Args:
+            path: Socket path (defaults to socket_path()).
+            timeout: Socket timeout in seconds (default 1.0).
+
+        Raises:
+            PermissionError: If the socket, or the daemon behind it,
+                belongs to another user.
+            OSError: If no daemon is listening.
+        """
+        path = path or socket_path()
+        if path is None:
+            raise FileNotFoundError('no lookup daemon socket configured')
+        _check_socket(path)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(path)
+            _check_peer(self._sock)
+        except OSError:
+            self._sock.close()
+            raise
+        self._buffer = b''
+
+    def request(self, *fields: str) -> str:
+        """Send one request and wait for its response.
+
+        Args:
+            *fields: Command followed by its arguments (e.g. 'bucket', 'the').
+
+        Returns:
+            Response line without the trailing newline.
+
+        Raises:
+            ValueError: If a field contains a tab or a newline.
+        """
+        _check_fields(fields)
+        return self.requests(['\t'.join(fields)])[0]
+
+    def requests(self, lines: list) -> list:
+        """Send many pipelined requests and collect their responses.
+
+        Args:
+            lines: Request lines without trailing newlines.
+
+        Returns:
+            Response lines aligned with the requests.
+
+        Raises:
+            ValueError: If a line contains a newline.
+        """
+        for line in lines:
+            if '\n' in line or '\r' in line:
+                raise ValueError(f'request lines cannot contain newlines: {line!r}')
+        responses = []
+        # Bounded windows keep both socket buffers from filling up at once
+        for start in range(0, len(lines), _WINDOW):
+            window = lines[start:start + _WINDOW]
+            self._sock.sendall(('\n'.join(window) + '\n').encode())
+            expected = len(responses) + len(window)
+            while len(responses) < expected:
+                chunk = self._sock.recv(_RECV_SIZE)
+                if not chunk:
+                    raise ConnectionError('lookup daemon closed the connection')
+                parts = (self._buffer + chunk).split(b'\n')
+                self._buffer = parts.pop()
+                responses.extend(part.decode() for part in parts)
+        return responses
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
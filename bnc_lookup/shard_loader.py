@@ -0,0 +1,145 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Once-only loading of shards and derived indexes into module caches.
+
+Every table module keeps its loaded shards in a module-level dict. A plain
+check-then-load-then-store on that dict lets several threads load the same
+shard at once: with the GIL this only duplicates work, but on free-threaded
+builds the duplicated imports and index builds run truly in parallel and
+can be expensive (the lemma and suggestion indexes take seconds).
+
+load_once() serializes loads per (cache, key) with a dedicated lock, while
+readers never take a lock: callers first try a plain dict read and only
+fall back to load_once() on a miss.
+
+    try:
+        return _cache[prefix]
+    except KeyError:
+        return load_once(_cache, prefix, import_table, module_name, attr)
+
+A value is stored in the cache only after it is fully loaded, so a reader
+never sees a partially initialized shard. If a load raises, nothing is
+stored and the next caller retries.
+
+import_table() reads tables from the active table archive (see
+bnc_lookup.archive) when there is one, and imports the generated module
+otherwise.
+
+A lexicon swap (see lexicon.py) replaces every cache while loads may be in
+flight. A load that overlapped a swap may have read tables of both
+versions, so its value is returned to its caller, whose call is retried,
+but not stored. The swap also drops the load locks of the caches it
+replaced (discard_locks()), so they do not accumulate across versions.
+"""
+
+import threading
+import time
+
+from bnc_lookup import archive, lexicon, metrics
+
+# (id(cache), key) -> lock serializing loads of that key
+_locks = {}
+
+_locks_guard = threading.Lock()
+
+
+def _lock_for(cache: dict, key) -> threading.Lock:
+    """Get (or create) the lock guarding loads of one cache key.
+
+    Args:
+        cache: The cache dict being filled.
+        key: The cache key being loaded.
+
+    Returns:
+        Lock shared by every thread loading this key into this cache.
+    """
+    lock_key = (id(cache), key)
+    lock = _locks.get(lock_key)
+    if lock is None:
+        with _locks_guard:
+            lock = _locks.setdefault(lock_key, threading.Lock())
+    return lock
+
+
+def discard_locks(caches) -> None:
+    """Drop the load locks of caches that are no longer in use.
+
+    Args:
+        caches: The cache dicts a lexicon swap replaced.
+    """
+    ids = {id(cache) for cache in caches}
+    with _locks_guard:
+        for lock_key in [lock_key for lock_key in _locks if lock_key[0] in ids]:
+            del _locks[lock_key]
+
+
+def load_once(cache: dict, key, load, *args):
+    """Load a value into a cache exactly once, even under concurrent callers.
+
+    Threads asking for the same key while it is loading wait for the first
+    load and then return its result; different keys load in parallel. A
+    value loaded while a lexicon swap happened is not stored.
+
+    Args:
+        cache: The cache dict to fill.
+        key: Cache key (e.g., a shard prefix or bucket number).
+        load: Function producing the value.
+        *args: Arguments passed to load.
+
+    Returns:
+        The cached value.
+    """
+    with _lock_for(cache, key):
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        version = lexicon.version
+        if metrics.enabled:
+            start = time.perf_counter()
+            value = load(*args)
+            metrics.record_load(_table_name(load, args), time.perf_counter() - start)
+        else:
+            value = load(*args)
+        if version == lexicon.version and not version & 1:
+            cache[key] = value
+        return value
+
+
+def _table_name(load, args: tuple) -> str:
+    """Name a load for the metrics report.
+
+    Args:
+        load: The load function.
+        args: Its arguments.
+
+    Returns:
+        The table package for shard imports (e.g., 'bnc_lookup.hs'),
+        otherwise the load function's qualified name.
+    """
+    if load is import_table:
+        return args[0].rsplit('.', 1)[0]
+    return f'{load.__module__}.{load.__qualname__}'
+
+
+def import_table(module_name: str, *names: str):
+    """Import a generated data module and read its table attributes.
+
+    Tables are read from the active archive instead when it has all of
+    them.
+
+    Args:
+        module_name: Dotted module name (e.g., 'bnc_lookup.hs.h_5d').
+        *names: Attribute names to read.
+
+    Returns:
+        The attribute value for a single name, or a tuple of values.
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed, or the active
+            archive is exclusive and lacks the tables.
+    """
+    values = archive.read_tables(archive.active, module_name, names)
+    if len(names) == 1:
+        return values[0]
+    return tuple(values)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Load test for the HTTP/JSON front-end (bnc-lookup http).
+
+Opens one keep-alive connection per client thread and sends POST /lookup
+requests of a fixed batch size, then reports throughput and client-side
+latency percentiles, followed by the server's own /stats.
+
+Usage:
+    bnc-lookup http &
+    python scripts/http_load_test.py --clients 8 --requests 200 --batch 500
+
+Tokens are read from --tokens FILE (whitespace-separated) or, by default,
+drawn from a list of common words with a Zipf-like skew plus 10% random
+non-words. Uses the standard library only.
+"""
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+
+# Frequent English words, most frequent first; the tail is drawn with a Zipf skew
+COMMON_WORDS = (
+    'the of and to a in that is was it for on with he be i by as at you are his had not this have from but which '
+    'she they or an were we their been has there can one if would her all my more when will who so no about up '
+    'what out said time people years some could them into only new other then than its also two first '
+    'like just do well any these may very over how made way back after year because good little down should '
+    'running cities walked children houses better quickly government tweeted happiness zebra'
+).split()
+
+
+def _default_tokens(n: int, seed: int) -> list:
+    """Draw tokens with a Zipf-like skew, replacing 10% with non-words.
+
+    Args:
+        n: Number of tokens.
+        seed: Random seed.
+
+    Returns:
+        List of tokens.
+    """
+    rng = random.Random(seed)
+    weights = [1 / (i + 1) for i in range(len(COMMON_WORDS))]
+    tokens = rng.choices(COMMON_WORDS, weights=weights, k=n)
+    for i in range(0, n, 10):
+        tokens[i] = f'xq{rng.randrange(10**6)}z'
+    return tokens
+
+
+def _client(host: str, port: int, bodies: list, latencies: list, errors: list) -> None:
+    """Send every body over one keep-alive connection.
+
+    Args:
+        host: Server host.
+        port: Server port.
+        bodies: Encoded request bodies.
+        latencies: Receives one latency in milliseconds per request.
+        errors: Receives error descriptions.
+    """
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    try:
+        for body in bodies:
+            start = time.perf_counter()
+            conn.request('POST', '/lookup', body=body, headers={'Content-Type': 'application/json'})
+            response = conn.getresponse()
+            response.read()
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status != 200:
+                errors.append(f'HTTP {response.status}')
+    except (OSError, http.client.HTTPException) as e:
+        errors.append(repr(e))
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--clients', type=int, default=4, help='concurrent keep-alive connections')
+    parser.add_argument('--requests', type=int, default=100, help='requests per client')
+    parser.add_argument('--batch', type=int, default=100, help='tokens per request')
+    parser.add_argument('--tokens', metavar='FILE', help='whitespace-separated tokens to draw from')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    total = args.clients * args.requests * args.batch
+    if args.tokens:
+        with open(args.tokens, encoding='utf-8') as f:
+            source = f.read().split()
+        rng = random.Random(args.seed)
+        tokens = [rng.choice(source) for _ in range(total)]
+    else:
+        tokens = _default_tokens(total, args.seed)
+
+    bodies = [json.dumps({'tokens': tokens[i:i + args.batch]}).encode() for i in range(0, total, args.batch)]
+    latencies, errors = [], []
+    threads = [
+        threading.Thread(target=_client, args=(args.host, args.port, bodies[c::args.clients], latencies, errors))
+        for c in range(args.clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    n = len(latencies)
+    print(f'requests     {n} ({len(errors)} errors)')
+    print(f'tokens       {n * args.batch}')
+    print(f'elapsed      {elapsed:.3f} s')
+    if n:
+        print(f'throughput   {n / elapsed:.1f} req/s, {n * args.batch / elapsed:.0f} tokens/s')
+        print(f'latency ms   p50 {latencies[n // 2]:.3f}  p99 {latencies[min(n - 1, n * 99 // 100)]:.3f}'
+              f'  max {latencies[-1]:.3f}')
+    for error in sorted(set(errors))[:5]:
+        print(f'error        {error}')
+
+    conn = http.client.HTTPConnection(args.host, args.port, timeout=30)
+    conn.request('GET', '/stats')
+    print('server stats', json.dumps(json.loads(conn.getresponse().read()), indent=2))
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
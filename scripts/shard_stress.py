@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Multi-threaded stress benchmark for shard loading and lookups.
+
+Each run starts from cold caches: every thread looks up a shuffled slice of
+words spread over all 256 shards, so threads race to load the same shards.
+The benchmark reports how long the cold phase took, how many shard imports
+happened (exactly one per shard is expected), and then the warm lookup
+throughput per thread count.
+
+On a free-threaded build (python3.13t with PYTHON_GIL=0) warm throughput
+should scale with the number of cores; with the GIL it stays roughly flat.
+
+Usage:
+    python scripts/shard_stress.py --threads 1 2 4 8 --lookups 200000
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+
+import bnc_lookup as bnc
+from bnc_lookup import find_bnc, find_freq, find_rf, shard_loader
+
+
+def _words(n: int, seed: int) -> list:
+    """Draw n words from every bucket, plus some non-words.
+
+    Args:
+        n: Number of words.
+        seed: Random seed.
+
+    Returns:
+        Shuffled list of words.
+    """
+    rng = random.Random(seed)
+    pool = [w for b in range(1, 101, 3) for w in bnc.sample(b, 200)]
+    words = [rng.choice(pool) for _ in range(n)]
+    for i in range(0, n, 10):
+        words[i] = f'xq{rng.randrange(10**6)}z'
+    return words
+
+
+def _reset() -> None:
+    """Drop every loaded shard so that the next lookups start cold."""
+    for module in (find_bnc, find_freq, find_rf):
+        module._cache.clear()
+    for name in list(sys.modules):
+        if name.startswith(('bnc_lookup.hs.', 'bnc_lookup.freq.', 'bnc_lookup.rf.')):
+            del sys.modules[name]
+
+
+def _run(threads: int, words: list) -> float:
+    """Look up every word once, split across threads.
+
+    Args:
+        threads: Number of threads.
+        words: Words to look up.
+
+    Returns:
+        Elapsed seconds.
+    """
+    slices = [words[i::threads] for i in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def work(chunk):
+        barrier.wait()
+        for word in chunk:
+            bnc.exists(word)
+            bnc.bucket(word)
+            bnc.relative_frequency(word)
+
+    workers = [threading.Thread(target=work, args=(chunk,)) for chunk in slices]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--lookups', type=int, default=100_000, help='words looked up per run')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'python {sys.version.split()[0]}, GIL {"enabled" if gil else "disabled"}')
+    words = _words(args.lookups, args.seed)
+
+    imports = []
+    original = shard_loader.import_table
+
+    def counting(module_name, *names):
+        imports.append(module_name)
+        return original(module_name, *names)
+
+    for module in (find_bnc, find_freq, find_rf):
+        module.import_table = counting
+
+    print(f'{"threads":>7} {"cold s":>8} {"imports":>8} {"dup":>4} {"warm lookups/s":>15} {"speedup":>8}')
+    base = None
+    for threads in args.threads:
+        _reset()
+        imports.clear()
+        cold = _run(threads, words)
+        duplicates = len(imports) - len(set(imports))
+        warm = _run(threads, words)
+        rate = 3 * len(words) / warm
+        base = base or rate
+        print(f'{threads:>7} {cold:>8.3f} {len(imports):>8} {duplicates:>4} {rate:>15,.0f} {rate / base:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Asyncio API: results match the synchronous API and cold loads are shared."""
+
+import asyncio
+import threading
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup import aio, find_freq
+
+WORDS = ['the', 'Cats', "don't", "it's", 'xyzabc123', '']
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestSingleWord:
+
+    @pytest.mark.parametrize('word', WORDS)
+    def test_matches_sync_api(self, word):
+        assert _run(aio.exists(word)) == bnc.exists(word)
+        assert _run(aio.bucket(word)) == bnc.bucket(word)
+        assert _run(aio.relative_frequency(word)) == bnc.relative_frequency(word)
+
+    def test_expected_count(self):
+        assert _run(aio.expected_count('the', 50000, rounded=True)) == bnc.expected_count('the', 50000, rounded=True)
+
+    def test_fallback_none(self):
+        assert _run(aio.bucket('cats', fallback='none')) == bnc.bucket('cats', fallback='none')
+
+    def test_invalid_fallback(self):
+        with pytest.raises(ValueError):
+            _run(aio.exists('the', fallback='stem'))
+
+    def test_answers_through_version_checked_functions(self, monkeypatch):
+        # The module-level functions are the ones retried across a lexicon swap
+        monkeypatch.setattr(bnc, 'bucket', lambda word, fallback: 42)
+        assert _run(aio.bucket('the')) == 42
+
+
+class TestBatch:
+
+    def test_small_batch_inline(self):
+        assert _run(aio.bucket_batch(WORDS)) == bnc.bucket_batch(WORDS)
+        assert _run(aio.exists_batch(WORDS)) == bnc.exists_batch(WORDS)
+
+    def test_large_batch_in_executor(self, monkeypatch):
+        monkeypatch.setattr(aio, 'INLINE_BATCH', 2)
+        callers = []
+        original = aio.FindBatch.relative_frequency
+
+        def spy(self, tokens):
+            callers.append(threading.current_thread().name)
+            return original(self, tokens)
+
+        monkeypatch.setattr(aio.FindBatch, 'relative_frequency', spy)
+        assert _run(aio.relative_frequency_batch(WORDS)) == bnc.relative_frequency_batch(WORDS)
+        assert callers[0].startswith('bnc-lookup')
+
+
+class TestColdLoads:
+
+    def test_concurrent_cold_loads_are_coalesced(self, monkeypatch):
+        monkeypatch.setattr(find_freq, '_cache', {})
+        loads = []
+        original = find_freq._get_bucket_dict
+
+        def counting(prefix):
+            loads.append((prefix, threading.current_thread().name))
+            return original(prefix)
+
+        monkeypatch.setattr(find_freq, '_get_bucket_dict', counting)
+
+        async def many():
+            return await asyncio.gather(*(aio.bucket('zebra', fallback='none') for _ in range(20)))
+
+        assert _run(many()) == [bnc.bucket('zebra')] * 20
+        prefix = find_freq._calculate_md5('zebra')[:2]
+        pool_loads = [name for p, name in loads if p == prefix and name.startswith('bnc-lookup')]
+        assert len(pool_loads) == 1
+        assert prefix in find_freq._cache
+
+    def test_warm_lookup_does_not_use_executor(self, monkeypatch):
+        _run(aio.bucket('the'))
+        monkeypatch.setattr(aio, '_start_load', lambda *a: pytest.fail('loaded a warm shard'))
+        assert _run(aio.bucket('the')) == 1
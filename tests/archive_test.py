@@ -0,0 +1,121 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for the single-file table archive."""
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup import archive, find_bnc
+from bnc_lookup.hs.h_8b import hashes_8b
+from bnc_lookup.shard_loader import import_table
+
+
+@pytest.fixture
+def small_archive(tmp_path):
+    path = str(tmp_path / 'tables.bnca')
+    archive.write_archive(path, [
+        ('hashes_8b', hashes_8b),
+        ('buckets_00', {'abc': 3}),
+        ('count_01', 2),
+        ('heads_01', ('of', 'the')),
+    ])
+    return path
+
+
+class TestArchive:
+
+    def test_round_trip(self, small_archive):
+        tables = archive.TableArchive(small_archive)
+        assert len(tables) == 4
+        assert 'hashes_8b' in tables and 'hashes_00' not in tables
+        assert tables.read('hashes_8b') == hashes_8b
+        assert tables.read('heads_01') == ('of', 'the')
+        with pytest.raises(KeyError):
+            tables.read('hashes_00')
+        tables.close()
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / 'other.bin'
+        path.write_bytes(b'PK\x03\x04' + bytes(32))
+        with pytest.raises(ValueError, match='not a version 2 table archive'):
+            archive.TableArchive(str(path))
+        path.write_bytes(b'BNC')
+        with pytest.raises(ValueError, match='not a table archive'):
+            archive.TableArchive(str(path))
+
+    def test_rejects_other_python_version(self, small_archive):
+        with open(small_archive, 'r+b') as f:
+            f.seek(7)
+            f.write(b'\x00\x00\r\n')
+        with pytest.raises(ValueError, match='another Python version'):
+            archive.TableArchive(small_archive)
+
+    def test_table_modules_cover_every_shard(self):
+        modules = dict(archive.table_modules())
+        assert len(modules) == 3 * 256 + 100
+        assert modules['bnc_lookup.freq.f_5d'] == ('buckets_5d',)
+        assert modules['bnc_lookup.bw.bw_07'] == ('count_07', 'heads_07', 'blocks_07')
+
+    def test_single_tables_keyed_by_module(self):
+        assert archive.table_key('bnc_lookup.freq.bounds', 'total') == 'bnc_lookup.freq.bounds.total'
+        assert archive.table_key('bnc_lookup.hs.h_8b', 'hashes_8b') == 'hashes_8b'
+
+
+class TestImportTable:
+
+    def test_reads_from_active_archive(self, small_archive, monkeypatch):
+        monkeypatch.setattr(archive, 'active', archive.TableArchive(small_archive))
+        assert import_table('bnc_lookup.freq.f_00', 'buckets_00') == {'abc': 3}
+
+    def test_falls_back_to_modules(self, small_archive, monkeypatch):
+        monkeypatch.setattr(archive, 'active', archive.TableArchive(small_archive))
+        # blocks_01 is missing, so the whole bucket comes from its module
+        count, heads, _ = import_table('bnc_lookup.bw.bw_01', 'count_01', 'heads_01', 'blocks_01')
+        assert count != 2 and heads != ('of', 'the')
+
+    def test_lookup_through_archive(self, small_archive, monkeypatch):
+        monkeypatch.setattr(archive, 'active', archive.TableArchive(small_archive))
+        monkeypatch.setattr(find_bnc, '_cache', {})
+        assert bnc.exists('of')  # md5 prefix 8b
+        assert set(find_bnc._cache) == {'8b'}
+
+
+class TestArchivePath:
+
+    def test_env_names_archive(self, monkeypatch):
+        monkeypatch.setenv('BNC_LOOKUP_ARCHIVE', '/data/tables.bnca')
+        assert archive.archive_path() == '/data/tables.bnca'
+
+    def test_empty_env_disables(self, monkeypatch):
+        monkeypatch.setenv('BNC_LOOKUP_ARCHIVE', '')
+        assert archive.archive_path() is None
+
+    def test_no_archive_unless_named(self, monkeypatch):
+        monkeypatch.delenv('BNC_LOOKUP_ARCHIVE', raising=False)
+        assert archive.archive_path() is None
+
+
+class TestUseArchive:
+
+    @pytest.fixture(autouse=True)
+    def restore(self, monkeypatch):
+        monkeypatch.setattr(archive, 'active', archive.active)
+        monkeypatch.setattr(archive, 'installed', archive.installed)
+
+    def test_previous_archive_closed(self, small_archive):
+        first = archive.use_archive(small_archive)
+        second = archive.use_archive(small_archive)
+        assert archive.active is second
+        with pytest.raises(ValueError, match='closed'):
+            first.read('count_01')
+        assert archive.use_archive(None) is None
+        assert archive.active is None
+        with pytest.raises(ValueError, match='closed'):
+            second.read('count_01')
+
+    def test_exclusive_archive_stays_active(self, small_archive, monkeypatch):
+        exclusive = archive.TableArchive(small_archive, exclusive=True)
+        monkeypatch.setattr(archive, 'active', exclusive)
+        archive.use_archive(small_archive)
+        archive.use_archive(None)
+        assert archive.active is exclusive and exclusive.read('count_01') == 2
@@ -0,0 +1,55 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Benchmark suite: result shape and JSON output."""
+
+import json
+import sys
+
+from bnc_lookup import bench
+
+
+class TestBenchmarks:
+
+    def test_warm(self):
+        result = bench.bench_warm(['the', 'of', 'zebra'], repeat=1, seed=0)
+        assert set(result) == {'exists', 'bucket', 'relative_frequency'}
+        assert all(v['hit_ns'] > 0 and v['miss_ns'] > 0 for v in result.values())
+
+    def test_fallback(self):
+        result = bench.bench_fallback(bench._sample_words(300, seed=0), repeat=1)
+        assert result['plural']['words'] >= 1
+        assert result['contraction']['words'] == len(bench.CONTRACTIONS)
+        assert result['plural']['bucket_ns'] > 0
+
+    def test_fallback_without_plurals(self):
+        assert bench.bench_fallback([], repeat=1)['plural'] == {
+            'words': 0, 'exists_ns': None, 'bucket_ns': None, 'relative_frequency_ns': None}
+
+    def test_batch(self):
+        result = bench.bench_batch(['the', 'of', 'and'], tokens=1000, seed=0)
+        assert result['tokens'] == 1000
+        assert result['distinct'] <= 3
+        assert result['exists_tokens_per_s'] > 0
+
+    def test_english(self):
+        result = bench.bench_english(['the', 'of', 'and', 'cat'], docs=1, tokens=300, seed=0)
+        assert result['docs'] == 3 and result['tokens'] == 300
+        assert result['sampled_docs_per_s'] > 0 and result['scan_docs_per_s'] > 0
+        assert 0 < result['mean_sampled'] <= 300
+
+    def test_sample_words_is_deterministic(self):
+        assert bench._sample_words(50, seed=1) == bench._sample_words(50, seed=1)
+
+    def test_peak_rss(self):
+        rss = bench.peak_rss_mb()
+        assert rss is None or rss > 0
+
+
+class TestMain:
+
+    def test_writes_json(self, monkeypatch, tmp_path):
+        output = tmp_path / 'bench.json'
+        monkeypatch.setattr(bench, 'run', lambda quick, seed: {'quick': quick, 'seed': seed})
+        monkeypatch.setattr(sys, 'argv', ['bnc-bench', '--quick', '--output', str(output)])
+        bench.main()
+        assert json.loads(output.read_text()) == {'quick': True, 'seed': 0}
@@ -610,6 +610,15 @@ def test_normalize_module_full_normalize():
     assert normalize('  DON\u2019T  ') == "don't"
 
 
+def test_normalize_module_ascii_fast_path():
+    """ASCII input normalizes exactly as the full Unicode pipeline does."""
+    from bnc_lookup.normalize import normalize, normalize_apostrophes, normalize_unicode_accents
+
+    for text in [chr(i) for i in range(128)] + ['DON`T', ' Hello, World! ', 'e\u0301', "it's"]:
+        assert normalize(text) == normalize_unicode_accents(normalize_apostrophes(text)).lower().strip()
+    assert normalize('DON`T') == "don't"
+
+
 def test_normalize_module_empty_string():
     """Normalize empty string should return empty string."""
     from bnc_lookup.normalize import normalize, normalize_apostrophes
@@ -1469,3 +1478,10 @@ def test_contraction_with_all_apostrophe_variants():
                 variant_word) == standard_bucket, f'bucket mismatch for {repr(variant_word)}'
             assert bnc.relative_frequency(
                 variant_word) == standard_rf, f'rf mismatch for {repr(variant_word)}'
+
+
+# Public API
+
+def test_all_lists_the_public_api():
+    assert all(hasattr(bnc, name) for name in bnc.__all__)
+    assert {'exists', 'suggest', 'memory_report', 'load_overlay', 'Lexicon', 'use_lexicon'} <= set(bnc.__all__)
@@ -0,0 +1,199 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for the table generator."""
+
+import gzip
+import hashlib
+import importlib.util
+import sys
+
+import pytest
+
+from bnc_lookup import build, front_coding
+from bnc_lookup.find_scores import percentile_code, zipf_code
+
+FIXTURE = '''100 !!WHOLE_CORPUS !!ANY 10
+40 the at0 10
+5 cat nn1 3
+2 cat vvb 1
+3 dog nn1 2
+1 zebra nn1 1
+1 aardvark nn1 1
+'''
+
+CONTRACTIONS = {'do': 30, "n't": 20, "don't": 1, 'it': 25, "'s": 15, "dog's": 2, "'ll": 10}
+
+
+@pytest.fixture
+def fixture_path(tmp_path):
+    path = tmp_path / 'all.num'
+    path.write_text(FIXTURE, encoding='utf-8')
+    return str(path)
+
+
+def _load(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestSource:
+
+    def test_read_frequency_list(self, fixture_path):
+        rows = list(build.read_frequency_list(fixture_path))
+        assert rows[0] == (100, '!!WHOLE_CORPUS')
+        assert rows[2] == (5, 'cat')
+        assert len(rows) == 7
+
+    def test_read_gzip(self, tmp_path):
+        path = tmp_path / 'all.num.gz'
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(FIXTURE)
+        assert list(build.read_frequency_list(str(path)))[1] == (40, 'the')
+
+    def test_malformed_line(self, tmp_path):
+        path = tmp_path / 'bad.num'
+        path.write_text('12 ok x 1\nnot-a-count word\n', encoding='utf-8')
+        with pytest.raises(ValueError, match='bad.num:2'):
+            list(build.read_frequency_list(str(path)))
+
+    def test_aggregate_sums_pos_rows(self, fixture_path):
+        counts, total = build.aggregate(build.read_frequency_list(fixture_path))
+        assert counts == {'the': 40, 'cat': 7, 'dog': 3, 'zebra': 1, 'aardvark': 1}
+        assert total == 100
+
+    def test_aggregate_merges_normalized_forms(self):
+        rows = [(100, build.TOTAL_MARKER), (3, 'cafe'), (2, 'Café'), (1, 'CAFÉ'), (4, '\u2014')]
+        counts, total = build.aggregate(rows)
+        assert counts == {'cafe': 6}
+
+    def test_aggregate_keeps_stored_forms(self):
+        counts, _ = build.aggregate([(2, 'Café'), (1, 'cafe')], stored_forms=True)
+        assert counts == {'Café': 2, 'cafe': 1}
+
+    def test_total_defaults_to_sum(self):
+        counts, total = build.aggregate([(3, 'a'), (2, 'b'), (1, 'a')])
+        assert counts == {'a': 4, 'b': 2}
+        assert total == 6
+
+
+class TestBuckets:
+
+    def test_equal_size_buckets(self):
+        counts = {f'w{i:03d}': 1000 - i for i in range(200)}
+        buckets = build.assign_buckets(counts)
+        assert buckets['w000'] == buckets['w001'] == 1
+        assert buckets['w002'] == 2
+        assert buckets['w199'] == 100
+
+    def test_ties_keep_input_order(self):
+        buckets = build.assign_buckets(dict.fromkeys([f't{i}' for i in range(300)], 1))
+        assert [buckets[f't{i}'] for i in (0, 2, 3, 299)] == [1, 1, 2, 100]
+
+
+class TestRender:
+
+    def test_quote(self):
+        assert build._quote("can't") == "'can\\'t'"
+        assert build._quote('a\\b') == "'a\\\\b'"
+        assert build._quote('x\xa6\x91') == "'x\\xa6\\x91'"
+        for text in ("can't", 'a\\b', 'x\xa6\x91', '"q"'):
+            assert eval(build._quote(text)) == text
+
+    def test_package_init_is_lazy(self):
+        source = build.render_package_init('hs')
+        assert 'from .h_' not in source
+        assert "import_module(f'{__name__}.h_{prefix}')" in source
+
+
+class TestContractions:
+
+    def test_resolve_contractions(self):
+        counts = CONTRACTIONS
+        buckets, frequencies = build.resolve_contractions(counts, build.assign_buckets(counts), 100)
+        # The split wins over the rarer direct entry; possessives keep their own entry
+        assert buckets["don't"][1] == 'contraction' and frequencies["don't"] == (0.2, 'contraction')
+        assert buckets["dog's"][1] == 'direct' and frequencies["dog's"] == (0.02, 'direct')
+        # 's forms of allowlisted stems are listed even when not in the corpus
+        assert frequencies["it's"] == (0.15, 'contraction')
+        assert "he's" not in buckets  # stem missing: nothing to resolve
+        assert buckets["n't"] == (buckets[None]["n't"], 'direct')
+        assert frequencies[None] == {"n't": 0.2, "'ll": 0.1, "'re": None, "'ve": None, "'m": None, "'d": None,
+                                     "'s": 0.15}
+
+    def test_render_round_trip(self):
+        counts = CONTRACTIONS
+        _, frequencies = build.resolve_contractions(counts, build.assign_buckets(counts), 100)
+        namespace = {}
+        exec(build.render_contractions('frequencies', 'relative frequency', frequencies, '.6e'), namespace)
+        assert namespace['frequencies']["don't"] == (0.2, 'contraction')
+        assert namespace['suffix_frequencies']["'s"] == 0.15
+        assert namespace['suffix_frequencies']["'d"] is None
+
+
+class TestBuild:
+
+    def test_writes_loadable_tables(self, fixture_path, tmp_path):
+        out = tmp_path / 'out'
+        written = build.build(build.read_frequency_list(fixture_path), str(out))
+        assert len(written) == 5 + 3 * 256 + 100 + 4
+
+        digest = hashlib.md5(b'cat').hexdigest()
+        prefix, suffix = digest[:2], digest[2:]
+        hashes = _load(out / 'hs' / f'h_{prefix}.py', 'fixture_h')
+        buckets = _load(out / 'freq' / f'f_{prefix}.py', 'fixture_f')
+        rf = _load(out / 'rf' / f'rf_{prefix}.py', 'fixture_rf')
+        assert suffix in getattr(hashes, f'hashes_{prefix}')
+        assert getattr(buckets, f'buckets_{prefix}')[suffix] == 21
+        assert getattr(rf, f'frequencies_{prefix}')[suffix] == 0.07
+
+        bounds = _load(out / 'freq' / 'bounds.py', 'fixture_bounds')
+        assert bounds.total == 100
+        assert bounds.max_counts[0] == 40 and bounds.max_counts[20] == 7 and bounds.max_counts[80] == 1
+        assert bounds.max_counts[99] == 0  # empty bucket
+
+        scores = _load(out / 'rf' / 'scores.py', 'fixture_scores')
+        assert scores.zipf_codes[0.07] == zipf_code(0.07)
+        # cat: 2 of 5 forms are rarer (count 1), none shares its count
+        assert scores.percentile_codes[0.07] == percentile_code(100 * 3.5 / 5)
+        assert scores.percentile_codes[0.4] == percentile_code(100 * 4.5 / 5)
+
+        words = _load(out / 'bw' / 'bw_01.py', 'fixture_bw')
+        assert words.count_01 == 1
+        sizes = _load(out / 'bw' / 'sizes.py', 'fixture_sizes').sizes
+        assert len(sizes) == 100 and sum(sizes) == 5
+        assert front_coding.decode(words.heads_01, words.blocks_01) == ('the',)
+
+    def test_tables_keyed_by_normalized_form(self, tmp_path):
+        out = tmp_path / 'out'
+        build.build([(100, build.TOTAL_MARKER), (60, 'the'), (30, 'Café'), (10, 'cafe')], str(out))
+        digest = hashlib.md5(b'cafe').hexdigest()
+        rf = _load(out / 'rf' / f'rf_{digest[:2]}.py', 'fixture_rf_cafe')
+        assert getattr(rf, f'frequencies_{digest[:2]}')[digest[2:]] == 0.4
+        words = _load(out / 'bw' / 'bw_51.py', 'fixture_bw_cafe')
+        assert front_coding.decode(words.heads_51, words.blocks_51) == ('cafe',)
+
+    def test_rebuild_is_a_no_op(self, fixture_path, tmp_path):
+        out = str(tmp_path / 'out')
+        build.build(build.read_frequency_list(fixture_path), out)
+        assert build.build(build.read_frequency_list(fixture_path), out) == []
+        assert build.check(build.read_frequency_list(fixture_path), out) == []
+
+    def test_check_reports_changes(self, fixture_path, tmp_path):
+        out = tmp_path / 'out'
+        build.build(build.read_frequency_list(fixture_path), str(out))
+        (out / 'bw' / 'bw_01.py').write_text('changed', encoding='utf-8')
+        (out / 'rf' / 'rf_00.py').unlink()
+        assert sorted(build.check(build.read_frequency_list(fixture_path), str(out))) == ['bw/bw_01.py', 'rf/rf_00.py']
+
+    def test_checked_in_tables_match_generator(self):
+        """Every generated module in the package is reproduced byte for byte."""
+        assert build.check(build.source_from_tables(), stored_forms=True) == []
+
+
+def test_main_requires_one_source(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['bnc-build'])
+    with pytest.raises(SystemExit) as excinfo:
+        build.main()
+    assert excinfo.value.code == 2
@@ -0,0 +1,93 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Lookups on UTF-8 byte tokens and buffers."""
+
+import mmap
+from array import array
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup.find_bytes import FindBytes, _normalize_bytes, token_offsets
+from bnc_lookup.normalize import normalize
+
+WORDS = ['the', 'The', '  THE ', 'cats', 'geese', 'running', "don't", 'DON’T', 'DON`T', "it's", "dog's",
+         "we'll", "zebra'll", 'café', 'Protégé', 'xyzabc123', '']
+
+
+class TestNormalize:
+
+    @pytest.mark.parametrize('word', WORDS + ['\tx\x1c', 'naïve'])
+    def test_matches_str_normalize(self, word):
+        assert _normalize_bytes(word.encode()) == normalize(word).encode()
+
+    def test_invalid_utf8(self):
+        assert _normalize_bytes(b'caf\xe9') is None
+
+
+class TestSingleTokens:
+
+    @pytest.mark.parametrize('fallback', ['none', 'plural', 'morph'])
+    def test_matches_str_api(self, fallback):
+        finder = FindBytes(fallback=fallback)
+        for word in WORDS:
+            token = word.encode()
+            assert finder.exists(token) == bnc.exists(word, fallback=fallback), word
+            assert finder.bucket(token) == bnc.bucket(word, fallback=fallback), word
+            assert finder.relative_frequency(token) == bnc.relative_frequency(word, fallback=fallback), word
+
+    def test_invalid_utf8_is_not_found(self):
+        assert bnc.exists_bytes(b'caf\xe9') is False
+        assert bnc.bucket_bytes(b'\xff') is None
+
+    def test_bytes_like(self):
+        assert bnc.exists_bytes(bytearray(b'cat')) is True
+        assert bnc.relative_frequency_bytes(memoryview(b'the')) == bnc.relative_frequency('the')
+
+    def test_invalid_fallback(self):
+        with pytest.raises(ValueError):
+            FindBytes(fallback='stem')
+
+
+class TestBuffers:
+
+    TEXT = 'The cats  sat\non the mat, DON’T xyzabc123 the\n'.encode()
+
+    def test_token_offsets(self):
+        offsets = token_offsets(self.TEXT)
+        assert offsets.typecode == 'q'
+        assert len(offsets) == len(self.TEXT.split()) + 1
+        assert offsets[-1] == len(self.TEXT)
+        assert token_offsets(b'  \n') == array('q')
+
+    def test_offsets_match_split(self):
+        expected = bnc.bucket_batch(self.TEXT.decode().split())
+        assert bnc.bucket_buffer(self.TEXT, token_offsets(self.TEXT)) == expected
+        assert bnc.bucket_buffer(self.TEXT) == expected
+
+    @pytest.mark.parametrize('wrap', [bytes, bytearray, memoryview])
+    def test_buffer_types(self, wrap):
+        buffer = wrap(self.TEXT)
+        expected = bnc.exists_batch(self.TEXT.decode().split())
+        assert bnc.exists_buffer(buffer, token_offsets(buffer)) == expected
+        assert bnc.exists_buffer(buffer) == expected
+
+    def test_mmap(self, tmp_path):
+        path = tmp_path / 'tokens.txt'
+        path.write_bytes(self.TEXT)
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            rfs = bnc.relative_frequency_buffer(mapped, token_offsets(mapped))
+        assert rfs == bnc.relative_frequency_batch(self.TEXT.decode().split())
+
+    def test_explicit_offsets(self):
+        # Spans may include separators, which are ignored like surrounding whitespace
+        assert FindBytes().bucket_buffer(b'zebra|the', [0, 5, 6, 9]) == [bnc.bucket('zebra'), None, 1]
+
+    def test_empty(self):
+        assert bnc.exists_buffer(b'', array('q')) == []
+        assert bnc.exists_buffer(b'') == []
+
+    @pytest.mark.parametrize('offsets', [[0, 4], [-1, 2]])
+    def test_offsets_outside_buffer(self, offsets):
+        with pytest.raises(ValueError):
+            bnc.exists_buffer(b'the', offsets)
@@ -0,0 +1,144 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Batch lookups and the streaming CLI mode."""
+
+import io
+import json
+import sys
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup import cli
+from bnc_lookup.find_batch import FindBatch
+
+WORDS = ['the', 'The', 'cats', "don't", 'xyzabc123', 'the', '']
+
+
+def _run(monkeypatch, capsys, entry, argv, stdin=''):
+    monkeypatch.setenv('BNC_LOOKUP_SOCKET', '')
+    monkeypatch.setattr(sys, 'argv', argv)
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(stdin))
+    try:
+        entry()
+        code = 0
+    except SystemExit as e:
+        code = e.code
+    out, err = capsys.readouterr()
+    return code, out, err
+
+
+class TestFindBatch:
+
+    def test_exists_matches_single_word_api(self):
+        assert FindBatch().exists(WORDS) == [bnc.exists(w) for w in WORDS]
+
+    def test_bucket_matches_single_word_api(self):
+        assert FindBatch().bucket(WORDS) == [bnc.bucket(w) for w in WORDS]
+
+    def test_rf_matches_single_word_api(self):
+        assert FindBatch().relative_frequency(WORDS) == [bnc.relative_frequency(w) for w in WORDS]
+
+    def test_fallback_none(self):
+        assert FindBatch(fallback='none').exists(['cats']) == [bnc.exists('cats', fallback='none')]
+
+    def test_memo_is_bounded(self, monkeypatch):
+        monkeypatch.setattr('bnc_lookup.find_batch.MAX_MEMO', 2)
+        batch = FindBatch()
+        assert batch.exists(['the', 'of', 'and', 'the']) == [True] * 4
+        assert len(batch._exists) <= 2
+
+    def test_invalid_fallback(self):
+        with pytest.raises(ValueError):
+            FindBatch(fallback='stem')
+
+
+class TestWindows:
+
+    def test_matches_list_api(self):
+        results = [r for _, window in FindBatch().windows(iter(WORDS * 3), 'bucket', size=4) for r in window]
+        assert results == FindBatch().bucket(WORDS * 3)
+
+    def test_windows_are_aligned(self):
+        windows = list(FindBatch().windows(iter(WORDS), size=3))
+        assert [len(tokens) for tokens, _ in windows] == [3, 3, 1]
+        assert all(len(tokens) == len(results) for tokens, results in windows)
+        assert [t for tokens, _ in windows for t in tokens] == WORDS
+
+    def test_consumes_lazily(self):
+        def tokens():
+            yield from ['the', 'of']
+            raise AssertionError('read past the first window')
+        assert next(FindBatch().windows(tokens(), size=2)) == (['the', 'of'], [True, True])
+
+    def test_empty(self):
+        assert list(FindBatch().windows([])) == []
+
+    @pytest.mark.parametrize('kwargs', [{'method': 'lemma'}, {'size': 0}])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            FindBatch().windows(['the'], **kwargs)
+
+    def test_top_level_functions(self):
+        assert bnc.exists_batch(['the', 'xyzabc123']) == [True, False]
+        assert bnc.bucket_batch(['the', 'xyzabc123']) == [1, None]
+        assert bnc.relative_frequency_batch(['xyzabc123']) == [None]
+
+
+class TestCliStreaming:
+
+    def test_exists_tsv(self, monkeypatch, capsys):
+        code, out, _ = _run(monkeypatch, capsys, cli.exists, ['bnc-exists', '--stdin'], 'the\n\nxyzabc123\n')
+        assert code == 0
+        assert out == 'the\tTrue\nxyzabc123\tFalse\n'
+
+    def test_bucket_jsonl(self, monkeypatch, capsys):
+        code, out, _ = _run(monkeypatch, capsys, cli.bucket,
+                            ['bnc-bucket', '--stdin', '--format', 'jsonl'], 'the\nxyzabc123\n')
+        assert code == 0
+        assert [json.loads(line) for line in out.splitlines()] == [
+            {'word': 'the', 'bucket': 1},
+            {'word': 'xyzabc123', 'bucket': None},
+        ]
+
+    def test_freq_tokenize(self, monkeypatch, capsys):
+        code, out, _ = _run(monkeypatch, capsys, cli.freq,
+                            ['bnc-freq', '--stdin', '--tokenize'], 'the cat\n  sat\n')
+        assert code == 0
+        lines = out.splitlines()
+        assert [line.split('\t')[0] for line in lines] == ['the', 'cat', 'sat']
+        assert lines[0] == f"the\t{bnc.relative_frequency('the'):.6e}"
+
+    def test_file_input(self, monkeypatch, capsys, tmp_path):
+        path = tmp_path / 'tokens.txt'
+        path.write_text('the\nxyzabc123\n', encoding='utf-8')
+        code, out, _ = _run(monkeypatch, capsys, cli.bucket, ['bnc-bucket', '--file', str(path)])
+        assert code == 0
+        assert out == 'the\t1\nxyzabc123\tNone\n'
+
+    def test_batches_across_boundary(self, monkeypatch, capsys):
+        monkeypatch.setattr(cli, 'BATCH_SIZE', 2)
+        code, out, _ = _run(monkeypatch, capsys, cli.exists, ['bnc-exists', '--stdin'], 'the\nof\nand\n')
+        assert code == 0
+        assert out.splitlines() == ['the\tTrue', 'of\tTrue', 'and\tTrue']
+
+    def test_single_word_unchanged(self, monkeypatch, capsys):
+        assert _run(monkeypatch, capsys, cli.exists, ['bnc-exists', 'the'])[:2] == (0, 'True\n')
+        assert _run(monkeypatch, capsys, cli.exists, ['bnc-exists', 'xyzabc123'])[:2] == (1, 'False\n')
+        assert _run(monkeypatch, capsys, cli.bucket, ['bnc-bucket', 'the'])[:2] == (0, '1\n')
+
+    def test_word_starting_with_dash(self, monkeypatch, capsys):
+        expected = f'{bnc.bucket("-ing")}\n'
+        assert _run(monkeypatch, capsys, cli.bucket, ['bnc-bucket', '-ing'])[:2] == (0, expected)
+        assert _run(monkeypatch, capsys, cli.bucket, ['bnc-bucket', '--', '-ing'])[:2] == (0, expected)
+        assert _run(monkeypatch, capsys, cli.bucket, ['bnc-bucket', '--fallback', 'none', '-ing'])[:2] == (0, expected)
+
+    def test_unknown_option_is_usage_error(self, monkeypatch, capsys):
+        code, _, err = _run(monkeypatch, capsys, cli.exists, ['bnc-exists', '--stdn'])
+        assert code == 2 and 'unrecognized' in err
+        assert _run(monkeypatch, capsys, cli.exists, ['bnc-exists', 'the', '-ing'])[0] == 2
+
+    def test_no_input_is_usage_error(self, monkeypatch, capsys):
+        code, out, err = _run(monkeypatch, capsys, cli.exists, ['bnc-exists'])
+        assert code == 2
+        assert 'usage' in err
@@ -0,0 +1,56 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Precomputed contraction tables (freq/contractions.py, rf/contractions.py)."""
+
+import pytest
+
+from bnc_lookup import find_freq, find_rf, overlay
+from bnc_lookup.find_bnc import S_CONTRACTION_STEMS
+from bnc_lookup.freq.contractions import buckets
+from bnc_lookup.rf.contractions import frequencies
+
+# Forces the generic three-lookup path without changing any result
+_UNRELATED_OVERLAY = {'0' * 32: (1, 1.0)}
+
+SAMPLE = ["don't", "can't", "it's", "let's", "we'll", "they're", "i've", "i'm", "he'd", "1980's",
+          "zebra'll", "cat'd", "dog's", "n't", "'s", "xqzv'll", "everyone's"]
+
+
+class TestTables:
+
+    def test_same_words_in_both_tables(self):
+        assert set(buckets) == set(frequencies)
+
+    def test_every_s_contraction_stem_is_listed(self):
+        assert all(f"{stem}'s" in buckets for stem in S_CONTRACTION_STEMS)
+
+    def test_table_matches_generic_resolution(self, monkeypatch):
+        words = sorted(buckets)[::7] + SAMPLE
+        fast = [(find_freq._resolve_bucket(w, 'none'), find_rf._resolve_rf(w, 'none')) for w in words]
+        monkeypatch.setattr(overlay, 'entries', _UNRELATED_OVERLAY)
+        slow = [(find_freq._resolve_bucket(w, 'none'), find_rf._resolve_rf(w, 'none')) for w in words]
+        assert fast == slow
+
+
+class TestProbes:
+
+    @pytest.fixture
+    def lookups(self, monkeypatch):
+        calls = []
+        for module, name in ((find_freq, '_lookup_bucket'), (find_rf, '_lookup_rf')):
+            original = getattr(module, name)
+            monkeypatch.setattr(module, name, lambda word, original=original: calls.append(word) or original(word))
+        return calls
+
+    def test_listed_contraction_hashes_nothing(self, lookups):
+        assert find_freq._resolve_bucket("don't", 'plural') == (1, 'contraction')
+        assert find_rf._resolve_rf("It’s", 'plural')[1] == 'contraction'
+        assert lookups == []
+
+    def test_unlisted_contraction_hashes_the_stem(self, lookups):
+        assert find_freq._resolve_bucket("zebra'll", 'none') == (find_freq._lookup_bucket('zebra'), 'contraction')
+        assert lookups == ['zebra', 'zebra']
+
+    def test_unlisted_possessive_is_a_miss(self, lookups):
+        assert find_freq._resolve_bucket("xqzv's", 'none') == (None, 'miss')
+        assert lookups == []
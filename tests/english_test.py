@@ -0,0 +1,79 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for the sequential-sampling English test."""
+
+import random
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup.find_english import FindEnglish, _sample_order
+
+ENGLISH = ('the cat sat on the mat and looked at the dog while it was raining outside, '
+           'so we stayed in the house all day. ') * 100
+
+JUNK = ' '.join(f'xq{i}zv' for i in range(2000))
+
+
+class TestSampleOrder:
+
+    @pytest.mark.parametrize('n', [0, 1, 2, 7, 100])
+    def test_visits_every_index_once(self, n):
+        assert sorted(_sample_order(n, random.Random(0))) == list(range(n))
+
+    def test_seeded(self):
+        assert list(_sample_order(50, random.Random(3))) == list(_sample_order(50, random.Random(3)))
+
+
+class TestLikeness:
+
+    def test_english_stops_early(self):
+        result = bnc.english_likeness(ENGLISH)
+        assert result['english'] is True
+        assert result['decided'] == 'sprt'
+        assert result['sampled'] < 100 < result['tokens']
+
+    def test_junk_stops_early(self):
+        result = bnc.english_likeness(JUNK)
+        assert result['english'] is False
+        assert result['decided'] == 'sprt'
+        assert result['rate'] == 0.0
+
+    def test_mixed_document(self):
+        rng = random.Random(1)
+        words = ENGLISH.split()
+        text = ' '.join(w if rng.random() < 0.4 else f'zzq{i}x' for i, w in enumerate(words))
+        assert bnc.english_likeness(text)['english'] is False
+
+    def test_short_text_decides_exactly(self):
+        result = FindEnglish().likeness('the cat sat')
+        assert result == {'english': True, 'rate': 1.0, 'sampled': 3, 'tokens': 3, 'decided': 'exhausted'}
+        assert FindEnglish().likeness('the xqzv zzqx')['english'] is False
+
+    @pytest.mark.parametrize('text', ['', '   ', '-- ... !!'])
+    def test_no_words(self, text):
+        result = bnc.english_likeness(text)
+        assert result['english'] is False and result['rate'] is None and result['sampled'] == 0
+
+    def test_punctuation_is_stripped(self):
+        assert FindEnglish().likeness('"Hello," she said.')['rate'] == 1.0
+
+    def test_deterministic(self):
+        finder = FindEnglish(threshold=0.5)
+        assert finder.likeness(ENGLISH, seed=7) == finder.likeness(ENGLISH, seed=7)
+
+    def test_threshold(self):
+        text = 'the cat sat xqzv zzqx'
+        assert FindEnglish(threshold=0.5).likeness(text)['english'] is True
+        assert FindEnglish(threshold=0.7).likeness(text)['english'] is False
+
+
+class TestParameters:
+
+    @pytest.mark.parametrize('kwargs', [
+        {'threshold': 0}, {'threshold': 1}, {'threshold': 0.98},
+        {'confidence': 0.5}, {'confidence': 1}, {'margin': 0}, {'fallback': 'stem'},
+    ])
+    def test_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            FindEnglish(**kwargs)
@@ -0,0 +1,70 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Prefix, suffix and glob search over the BNC word list."""
+
+import pytest
+
+import bnc_lookup as bnc
+
+
+class TestPrefix:
+
+    def test_prefix_matches(self):
+        results = bnc.prefix('inter')
+        assert results
+        assert all(w.startswith('inter') for w in results)
+
+    def test_prefix_frequency_order(self):
+        results = bnc.prefix('inter', k=None)
+        buckets = [bnc.bucket(w) for w in results[:200]]
+        assert buckets == sorted(buckets)
+
+    def test_prefix_k_limits_results(self):
+        assert len(bnc.prefix('inter', k=3)) == 3
+        assert bnc.prefix('inter', k=0) == []
+
+    def test_prefix_most_frequent_first(self):
+        assert bnc.prefix('th', k=1) == ['the']
+
+    def test_prefix_case_insensitive(self):
+        assert bnc.prefix('INTER', k=5) == bnc.prefix('inter', k=5)
+
+    def test_prefix_no_match(self):
+        assert bnc.prefix('xqzxqz') == []
+
+
+class TestSuffix:
+
+    def test_suffix_matches(self):
+        results = bnc.suffix('ness')
+        assert results
+        assert all(w.endswith('ness') for w in results)
+
+    def test_suffix_contains_common_word(self):
+        assert 'business' in bnc.suffix('ness', k=5)
+
+
+class TestGlob:
+
+    def test_glob_star(self):
+        results = bnc.glob('colo*r', k=None)
+        assert 'colour' in results
+        assert 'color' in results
+
+    def test_glob_question_mark(self):
+        results = bnc.glob('b?t', k=None)
+        assert 'but' in results
+        assert all(len(w) == 3 for w in results)
+
+    def test_glob_leading_wildcard(self):
+        results = bnc.glob('*ness', k=5)
+        assert results == bnc.suffix('ness', k=5)
+
+    def test_glob_character_class(self):
+        results = bnc.glob('[bc]at', k=None)
+        assert set(results) >= {'bat', 'cat'}
+        assert all(w in ('bat', 'cat') for w in results)
+
+    @pytest.mark.parametrize('pattern', ['the', 'computer'])
+    def test_glob_literal(self, pattern):
+        assert bnc.glob(pattern) == [pattern]
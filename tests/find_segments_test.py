@@ -0,0 +1,56 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Word segmentation of run-together text."""
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup.find_rf import _lookup_rf, _lookup_rf_batch
+from bnc_lookup.find_segments import FindSegments
+
+
+class TestSegment:
+
+    @pytest.mark.parametrize('text,expected', [
+        ('thequickbrownfox', ['the', 'quick', 'brown', 'fox']),
+        ('ilovenewyorkcity', ['i', 'love', 'new', 'york', 'city']),
+        ('itwasthebestoftimes', ['it', 'was', 'the', 'best', 'of', 'times']),
+    ])
+    def test_segments(self, text, expected):
+        assert bnc.segment(text) == expected
+
+    def test_single_word_not_split(self):
+        assert bnc.segment('nowhere') == ['nowhere']
+
+    def test_case_insensitive(self):
+        assert bnc.segment('TheQuickBrownFox') == ['the', 'quick', 'brown', 'fox']
+
+    def test_whitespace_is_a_boundary(self):
+        assert bnc.segment('thequick brownfox') == ['the', 'quick', 'brown', 'fox']
+
+    def test_empty_input(self):
+        assert bnc.segment('') == []
+        assert bnc.segment('   ') == []
+
+    def test_unknown_text_kept_whole(self):
+        assert bnc.segment('xqzvxqzv') == ['xqzvxqzv']
+
+    def test_concatenation_preserved(self):
+        text = 'wheninthecourseofhumanevents'
+        assert ''.join(bnc.segment(text)) == text
+
+    def test_max_word_length(self):
+        words = FindSegments(max_word_length=3).segment('xqzvxqzv')
+        assert all(len(w) <= 3 for w in words)
+        assert ''.join(words) == 'xqzvxqzv'
+
+    def test_invalid_max_word_length(self):
+        with pytest.raises(ValueError):
+            FindSegments(max_word_length=0)
+
+
+class TestBatchLookup:
+
+    def test_matches_single_lookup(self):
+        forms = ['the', 'xyzabc123', '', 'computer', 'the']
+        assert _lookup_rf_batch(forms) == [_lookup_rf(f) for f in forms]
@@ -0,0 +1,118 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Spelling suggestions from the symmetric delete index."""
+
+from array import array
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup import find_suggestions, index_cache
+from bnc_lookup.find_suggestions import FindSuggestions, _deletes, _edit_distance
+
+
+@pytest.fixture(scope='module')
+def full_index():
+    """The index over every bucket (takes several seconds to build)."""
+    return (*find_suggestions._build_index(100), find_suggestions._bucket_starts(100))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('BNC_LOOKUP_CACHE', str(tmp_path))
+    monkeypatch.setattr(find_suggestions, '_cache', {})
+
+
+class TestHelpers:
+
+    def test_deletes(self):
+        assert _deletes('abc', 1) == {'abc', 'bc', 'ac', 'ab'}
+        assert _deletes('ab', 2) == {'ab', 'a', 'b', ''}
+
+    @pytest.mark.parametrize('a,b,expected', [
+        ('the', 'the', 0),
+        ('teh', 'the', 1),
+        ('recieve', 'receive', 1),
+        ('kitten', 'sitting', 3),
+        ('', 'ab', 2),
+    ])
+    def test_edit_distance(self, a, b, expected):
+        assert _edit_distance(a, b, 3) == expected
+
+    def test_edit_distance_limit(self):
+        assert _edit_distance('kitten', 'sitting', 2) == 3
+
+
+class TestSuggest:
+
+    def test_transposition(self):
+        assert FindSuggestions(max_bucket=2).suggest('teh')[0] == 'the'
+
+    def test_missing_letter(self):
+        assert FindSuggestions(max_bucket=2).suggest('becuse')[0] == 'because'
+
+    def test_existing_word_first(self):
+        assert FindSuggestions(max_bucket=2).suggest('house')[0] == 'house'
+
+    def test_k_limits_results(self):
+        assert len(FindSuggestions(max_bucket=2).suggest('teh', k=2)) == 2
+
+    def test_max_distance_zero(self):
+        finder = FindSuggestions(max_bucket=1)
+        assert finder.suggest('the', max_distance=0) == ['the']
+        assert finder.suggest('teh', max_distance=0) == []
+
+    def test_results_within_distance(self):
+        for word in FindSuggestions(max_bucket=2).suggest('langauge', max_distance=2, k=10):
+            assert _edit_distance('langauge', word, 2) <= 2
+
+    def test_no_suggestions(self):
+        assert FindSuggestions(max_bucket=1).suggest('xqzxqzxqz') == []
+
+    def test_index_written_to_cache(self, tmp_path):
+        FindSuggestions(max_bucket=1).suggest('teh')
+        assert list(tmp_path.iterdir())
+
+    def test_cached_index_reloaded(self):
+        expected = FindSuggestions(max_bucket=1).suggest('teh')
+        find_suggestions._cache.clear()
+        assert FindSuggestions(max_bucket=1).suggest('teh') == expected
+
+    def test_empty_input(self):
+        assert bnc.suggest('') == []
+
+    @pytest.mark.parametrize('word', ['sint', 'cas', 'tho', 'house'])
+    def test_existing_word_first_in_full_index(self, word, full_index):
+        # These words sit in later buckets than k frequent words within distance 1
+        find_suggestions._cache[100] = full_index
+        assert bnc.suggest(word)[0] == word
+
+    def test_later_buckets_only_add_closer_words(self, full_index):
+        find_suggestions._cache[100] = full_index
+        suggestions = bnc.suggest('recieve', k=5)
+        assert suggestions[:2] == ['recieve', 'receive']
+        assert all(_edit_distance('recieve', word, 2) <= 2 for word in suggestions)
+
+    def test_invalid_max_distance(self):
+        with pytest.raises(ValueError):
+            bnc.suggest('teh', max_distance=3)
+
+    def test_invalid_max_bucket(self):
+        with pytest.raises(ValueError):
+            FindSuggestions(max_bucket=0)
+
+
+class TestIndexCache:
+
+    def test_round_trip(self):
+        arrays = (array('Q', [1, 2, 3]), array('I', [7]))
+        index_cache.save_arrays('roundtrip', arrays)
+        assert index_cache.load_arrays('roundtrip', ('Q', 'I')) == arrays
+
+    def test_missing_entry(self):
+        assert index_cache.load_arrays('missing', ('Q',)) is None
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setenv('BNC_LOOKUP_CACHE', '')
+        index_cache.save_arrays('disabled', (array('Q', [1]),))
+        assert index_cache.load_arrays('disabled', ('Q',)) is None
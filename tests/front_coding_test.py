@@ -0,0 +1,74 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Front-coded storage of the bucket word lists."""
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup import front_coding
+from bnc_lookup.find_words import FindWords, _get_bucket_blocks
+
+WORDS = ('a', 'ab', 'abc', 'abd', 'b', 'ba', 'bar', 'barn', 'c', "can't", 'cat', 'x' * 120, 'x' * 121)
+
+
+class TestCodec:
+
+    @pytest.mark.parametrize('words', [WORDS, WORDS[:1], (), tuple(f'w{i:04d}' for i in range(100))])
+    def test_round_trip(self, words):
+        heads, blocks = front_coding.encode(words)
+        assert front_coding.decode(heads, blocks) == words
+
+    def test_contains(self):
+        heads, blocks = front_coding.encode(WORDS)
+        for word in WORDS:
+            assert front_coding.contains(heads, blocks, word)
+        assert not front_coding.contains(heads, blocks, '')
+        assert not front_coding.contains(heads, blocks, 'abe')
+        assert not front_coding.contains(heads, blocks, 'zzz')
+
+    def test_tail_length_limited(self):
+        heads, blocks = front_coding.encode(('a', 'b' * front_coding.MAX_TAIL))
+        assert front_coding.decode(heads, blocks) == ('a', 'b' * front_coding.MAX_TAIL)
+        with pytest.raises(ValueError, match='too long'):
+            front_coding.encode(('a', 'b' * (front_coding.MAX_TAIL + 1)))
+
+    def test_bw_package_serves_decoded_words(self):
+        from bnc_lookup import bw
+        assert bw.words_07 == bnc.words(7)
+        with pytest.raises(AttributeError):
+            bw.words_xx
+
+    def test_prefix_words(self):
+        heads, blocks = front_coding.encode(WORDS)
+        assert front_coding.prefix_words(heads, blocks, 'ab') == ['ab', 'abc', 'abd']
+        assert front_coding.prefix_words(heads, blocks, 'ba') == ['ba', 'bar', 'barn']
+        assert front_coding.prefix_words(heads, blocks, 'q') == []
+
+
+class TestBucketStorage:
+
+    @pytest.mark.parametrize('bucket', [1, 50, 100])
+    def test_decoded_bucket_is_sorted(self, bucket):
+        words = bnc.words(bucket)
+        assert list(words) == sorted(words)
+
+    def test_heads_are_block_starts(self):
+        heads, _ = _get_bucket_blocks(1)
+        words = bnc.words(1)
+        assert heads == words[::front_coding.BLOCK_SIZE]
+
+    def test_contains_in_bucket(self):
+        finder = FindWords()
+        assert finder.contains(1, 'the')
+        assert finder.contains(1, 'THE')
+        assert not finder.contains(2, 'the')
+        assert not finder.contains(1, 'xyzabc123')
+
+    def test_contains_invalid_bucket(self):
+        with pytest.raises(ValueError):
+            FindWords().contains(0, 'the')
+
+    def test_every_word_in_bucket_is_contained(self):
+        finder = FindWords()
+        for word in bnc.words(37)[::50]:
+            assert finder.contains(37, word)
@@ -0,0 +1,93 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""HTTP/JSON front-end."""
+
+import http.client
+import json
+import threading
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup.http_server import LookupHTTPServer
+
+
+@pytest.fixture(scope='module')
+def server():
+    server = LookupHTTPServer(('127.0.0.1', 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def conn(server):
+    conn = http.client.HTTPConnection(*server.server_address, timeout=10)
+    yield conn
+    conn.close()
+
+
+def _call(conn, method, path, payload=None):
+    body = None if payload is None else (payload if isinstance(payload, bytes) else json.dumps(payload).encode())
+    conn.request(method, path, body=body)
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+class TestLookup:
+
+    def test_arrays_match_single_word_api(self, conn):
+        tokens = ['the', 'Cats', "don't", 'xyzabc123', 'the']
+        status, result = _call(conn, 'POST', '/lookup', {'tokens': tokens})
+        assert status == 200
+        assert result == {
+            'exists': [bnc.exists(t) for t in tokens],
+            'bucket': [bnc.bucket(t) for t in tokens],
+            'rf': [bnc.relative_frequency(t) for t in tokens],
+        }
+
+    def test_bare_array_and_fallback(self, conn):
+        assert _call(conn, 'POST', '/lookup', ['the'])[1]['bucket'] == [1]
+        result = _call(conn, 'POST', '/lookup', {'tokens': ['cats'], 'fallback': 'none'})[1]
+        assert result['exists'] == [bnc.exists('cats', fallback='none')]
+
+    def test_keep_alive(self, conn):
+        for _ in range(3):
+            assert _call(conn, 'POST', '/lookup', ['the'])[0] == 200
+
+    @pytest.mark.parametrize('payload', [b'not json', {'tokens': 'the'}, [1, 2], {'tokens': ['the'], 'fallback': 'stem'},
+                                         b'\xff\xfe', b'[' * 100000 + b']' * 100000])
+    def test_bad_request(self, conn, payload):
+        status, result = _call(conn, 'POST', '/lookup', payload)
+        assert status == 400
+        assert 'error' in result
+
+    @pytest.mark.parametrize('length', ['-1', 'abc', str(10 ** 12)])
+    def test_bad_content_length(self, conn, length):
+        conn.putrequest('POST', '/lookup')
+        conn.putheader('Content-Length', length)
+        conn.endheaders()
+        response = conn.getresponse()
+        assert response.status == 400
+        assert 'Content-Length' in json.loads(response.read())['error']
+
+
+class TestEndpoints:
+
+    def test_health(self, conn):
+        assert _call(conn, 'GET', '/health') == (200, {'status': 'ok'})
+
+    def test_stats_report_latency(self, conn):
+        _call(conn, 'POST', '/lookup', ['the'])
+        status, stats = _call(conn, 'GET', '/stats')
+        assert status == 200
+        lookup = stats['POST /lookup']
+        assert lookup['count'] >= 1
+        assert 0 <= lookup['p50_ms'] <= lookup['max_ms']
+
+    def test_unknown_path_and_method(self, conn):
+        assert _call(conn, 'GET', '/nowhere')[0] == 404
+        assert _call(conn, 'GET', '/lookup')[0] == 405
+        assert _call(conn, 'POST', '/stats', [])[0] == 405
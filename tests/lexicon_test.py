@@ -0,0 +1,230 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Lexicon versions swapped atomically in a running process."""
+
+from array import array
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup import (
+    archive,
+    build,
+    find_batch,
+    find_bnc,
+    find_lemma,
+    find_suggestions,
+    find_words,
+    index_cache,
+    lexicon,
+    shard_loader,
+)
+from bnc_lookup.find_batch import FindBatch
+from bnc_lookup.shard_loader import load_once
+
+# A different version: a tiny frequency list in all.num format
+SOURCE = '''100 !!WHOLE_CORPUS !!ANY 10
+40 the at0 10
+5 aardvark nn1 3
+3 kubernetes nn1 2
+'''
+
+WORDS = ['the', 'cats', 'tweeted', "don't", "it's", 'café', 'xyzabc123']
+
+
+@pytest.fixture(scope='module')
+def version_path(tmp_path_factory):
+    """A complete archive of the installed tables (takes a few seconds)."""
+    path = str(tmp_path_factory.mktemp('lexicon') / 'v2.bnca')
+    archive.write_archive(path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def restore(tmp_path, monkeypatch):
+    monkeypatch.setenv('BNC_LOOKUP_CACHE', str(tmp_path))
+    # Rebuilding these after a swap takes seconds
+    monkeypatch.setattr(find_suggestions, '_cache', {})
+    monkeypatch.setattr(find_lemma, '_cache', {})
+    yield
+    if lexicon.current.path is not None:
+        bnc.use_lexicon(bnc.Lexicon())
+
+
+def _answers():
+    return [(bnc.exists(w), bnc.bucket(w), bnc.relative_frequency(w), bnc.zipf(w), bnc.word_id(w))
+            for w in WORDS]
+
+
+class TestLexicon:
+
+    def test_swap_gives_same_answers(self, version_path):
+        expected = _answers()
+        words = bnc.words(7)
+        version = lexicon.version
+        previous = bnc.use_lexicon(bnc.Lexicon(version_path))
+        assert previous.path is None
+        assert lexicon.version == version + 2
+        assert archive.active.exclusive and archive.active.path == version_path
+        assert _answers() == expected
+        assert bnc.words(7) == words
+
+    def test_swap_to_other_version(self, tmp_path):
+        (tmp_path / 'all.num').write_text(SOURCE, encoding='utf-8')
+        build.build(build.read_frequency_list(str(tmp_path / 'all.num')), str(tmp_path / 'out'))
+        path = str(tmp_path / 'v3.bnca')
+        archive.write_archive(path, directory=str(tmp_path / 'out'))
+        bnc.use_lexicon(bnc.Lexicon(path))
+        assert bnc.exists('kubernetes') and bnc.exists('aardvarks')
+        assert not bnc.exists('cat')
+        assert bnc.relative_frequency('the') == 0.4
+        assert bnc.word_from_id(bnc.word_id('kubernetes')) == 'kubernetes'
+        bnc.use_lexicon(bnc.Lexicon())
+        assert bnc.exists('cat') and not bnc.exists('kubernetes')
+
+    def test_swap_replaces_caches(self, version_path):
+        bnc.exists('the')
+        old = find_bnc._cache
+        lex = bnc.Lexicon(version_path)
+        assert lex.warm() == len(list(archive.table_modules()))
+        bnc.use_lexicon(lex)
+        assert find_bnc._cache is not old and len(find_bnc._cache) == 256
+
+    def test_locks_of_replaced_caches_dropped(self, version_path):
+        bnc.exists('the')
+        old = id(find_bnc._cache)
+        assert any(cache == old for cache, _ in shard_loader._locks)
+        bnc.use_lexicon(bnc.Lexicon(version_path))
+        assert not any(cache == old for cache, _ in shard_loader._locks)
+
+    def test_derived_caches_rebuilt(self, version_path):
+        bnc.words(3)
+        bnc.use_lexicon(bnc.Lexicon(version_path))
+        assert 3 in find_words._cache
+
+    def test_installed_once(self, version_path):
+        lex = bnc.Lexicon(version_path)
+        bnc.use_lexicon(lex)
+        with pytest.raises(ValueError, match='installed before'):
+            bnc.use_lexicon(lex)
+        with pytest.raises(ValueError, match='installed before'):
+            bnc.use_lexicon(lexicon.current)
+
+    def test_load_in_background(self, version_path):
+        lex = bnc.load_lexicon(version_path).result(timeout=60)
+        assert lexicon.current is lex
+        assert bnc.exists('cats')
+
+    def test_lookups_during_swap(self, version_path):
+        expected = _answers()
+        future = bnc.load_lexicon(version_path)
+        while not future.done():
+            assert _answers() == expected
+        future.result()
+        assert _answers() == expected
+
+    def test_load_failure_keeps_version(self, tmp_path):
+        future = bnc.load_lexicon(str(tmp_path / 'missing.bnca'))
+        with pytest.raises(OSError):
+            future.result(timeout=60)
+        assert lexicon.current.path is None
+
+    def test_incomplete_archive_rejected(self, tmp_path):
+        path = str(tmp_path / 'partial.bnca')
+        archive.write_archive(path, [('hashes_8b', {})])
+        with pytest.raises(ValueError, match='bnc-build --archive'):
+            bnc.Lexicon(path)
+
+    def test_exclusive_archive_does_not_fall_back(self, tmp_path):
+        path = str(tmp_path / 'partial.bnca')
+        archive.write_archive(path, [('hashes_8b', {})])
+        source = archive.TableArchive(path, exclusive=True)
+        assert archive.read_tables(source, 'bnc_lookup.hs.h_8b', ('hashes_8b',)) == [{}]
+        with pytest.raises(ModuleNotFoundError):
+            archive.read_tables(source, 'bnc_lookup.hs.h_00', ('hashes_00',))
+
+    def test_index_cache_keyed_by_version(self, version_path, tmp_path):
+        lex = bnc.Lexicon(version_path)
+        bnc.use_lexicon(lex)
+        index_cache.load_or_build('probe', ('Q',), lambda: (array('Q', [1]),))
+        assert index_cache.load_arrays(f'probe-{lex.tag}', ('Q',)) is not None
+        assert index_cache.load_arrays('probe', ('Q',)) is None
+
+
+class TestConsistency:
+
+    def test_retried_when_swap_overlaps(self, monkeypatch):
+        calls = []
+
+        @lexicon.consistent
+        def lookup(word):
+            calls.append(word)
+            if len(calls) == 1:
+                monkeypatch.setattr(lexicon, 'version', lexicon.version + 2)
+            return len(calls)
+
+        assert lookup('the') == 2
+        assert calls == ['the', 'the']
+
+    def test_error_during_swap_retried(self, monkeypatch):
+        calls = []
+
+        @lexicon.consistent
+        def lookup():
+            calls.append(1)
+            if len(calls) == 1:
+                monkeypatch.setattr(lexicon, 'version', lexicon.version + 2)
+                raise KeyError('shard')
+            return 'ok'
+
+        assert lookup() == 'ok'
+
+    def test_error_without_swap_raised(self):
+        with pytest.raises(ValueError):
+            bnc.exists('cat', fallback='stem')
+
+    def test_token_iterators_read_once(self, monkeypatch):
+        calls = []
+
+        @lexicon.consistent_tokens
+        def lookup(tokens):
+            calls.append(list(tokens))
+            if len(calls) == 1:
+                monkeypatch.setattr(lexicon, 'version', lexicon.version + 2)
+            return calls[-1]
+
+        assert lookup(iter(['a', 'b'])) == ['a', 'b']
+        assert calls == [['a', 'b'], ['a', 'b']]
+
+    def test_load_across_swap_not_stored(self, monkeypatch):
+        cache = {}
+
+        def load():
+            monkeypatch.setattr(lexicon, 'version', lexicon.version + 2)
+            return 'value'
+
+        assert load_once(cache, 'k', load) == 'value'
+        assert cache == {}
+
+    def test_batch_memo_dropped_on_swap(self, version_path, monkeypatch):
+        finder = FindBatch()
+        assert finder.exists(['the']) == [True]
+        monkeypatch.setitem(finder._exists, 'the', False)
+        bnc.use_lexicon(bnc.Lexicon(version_path))
+        assert finder.exists(['the']) == [True]
+
+    def test_batch_retried_when_swap_overlaps(self, monkeypatch):
+        finder = FindBatch()
+        resolve = find_batch._resolve
+        calls = []
+
+        def swapping(tokens, memo, lookup):
+            calls.append(1)
+            if len(calls) == 1:
+                memo['the'] = False
+                monkeypatch.setattr(lexicon, 'version', lexicon.version + 2)
+            return resolve(tokens, memo, lookup)
+
+        monkeypatch.setattr(find_batch, '_resolve', swapping)
+        assert finder.exists(['the']) == [True]
+        assert len(calls) == 2
@@ -0,0 +1,80 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for the memory accounting report."""
+
+import sys
+
+import bnc_lookup as bnc
+from bnc_lookup import find_bnc, find_freq, find_words
+from bnc_lookup.memory import deep_size, memory_report
+
+
+class TestDeepSize:
+
+    def test_counts_keys_and_values(self):
+        key, value = 'k' * 40, 'v' * 40
+        d = {key: value}
+        assert deep_size(d) == sys.getsizeof(d) + sys.getsizeof(key) + sys.getsizeof(value)
+
+    def test_shared_objects_counted_once(self):
+        item = 'x' * 100
+        t = (item, item, item)
+        assert deep_size(t) == sys.getsizeof(t) + sys.getsizeof(item)
+
+    def test_seen_set_spans_calls(self):
+        item = 'y' * 100
+        seen = set()
+        deep_size((item,), seen)
+        assert deep_size([item], seen) == sys.getsizeof([item])
+
+    def test_nested_containers(self):
+        inner = frozenset({'a' * 20, 'b' * 20})
+        outer = (inner, [inner])
+        assert deep_size(outer) > deep_size(inner)
+
+
+class TestMemoryReport:
+
+    def test_lists_every_table(self):
+        tables = memory_report()['tables']
+        assert set(tables) == {'hs', 'freq', 'rf', 'bw', 'bw_counts', 'words', 'reversed', 'lemma', 'suggestions'}
+
+    def test_resident_shards_match_cache(self):
+        bnc.exists('hello')
+        bnc.bucket('hello')
+        tables = memory_report()['tables']
+        assert sorted(tables['hs']['resident']) == sorted(find_bnc._cache)
+        assert sorted(tables['freq']['resident']) == sorted(find_freq._cache)
+        prefix = find_bnc._calculate_md5('hello')[:2]
+        assert prefix in tables['hs']['resident']
+
+    def test_entries_and_bytes(self):
+        bnc.exists('hello')
+        hs = memory_report()['tables']['hs']
+        assert hs['entries'] == sum(len(s) for s in find_bnc._cache.values())
+        assert hs['bytes'] > hs['entries'] * 79  # at least the 30-char suffix strings
+
+    def test_projection_scales_to_all_shards(self):
+        bnc.exists('hello')
+        hs = memory_report()['tables']['hs']
+        assert hs['shards'] == 256
+        assert hs['projected_bytes'] == round(hs['bytes'] * 256 / len(hs['resident']))
+
+    def test_does_not_load_anything(self):
+        before = dict(find_words._count_cache)
+        memory_report()
+        assert find_words._count_cache == before
+
+    def test_empty_table(self, monkeypatch):
+        monkeypatch.setattr(find_words, '_count_cache', {})
+        counts = memory_report()['tables']['bw_counts']
+        assert counts == {'shards': 100, 'resident': [], 'entries': 0, 'bytes': 0, 'projected_bytes': None}
+
+    def test_totals(self):
+        bnc.words(1)
+        report = memory_report()
+        assert report['total_bytes'] == sum(t['bytes'] for t in report['tables'].values())
+        assert report['projected_total_bytes'] >= report['tables']['words']['projected_bytes']
+
+    def test_top_level_function(self):
+        assert bnc.memory_report is memory_report
@@ -0,0 +1,90 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Opt-in lookup metrics."""
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup import find_bnc, metrics
+from bnc_lookup.metrics import _bucket_index, _bucket_upper
+
+
+@pytest.fixture
+def recording():
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+class TestPaths:
+
+    def test_exists_paths(self, recording):
+        for word in ['the', 'The', 'abjurations', "we'll", 'xyzabc123']:
+            bnc.exists(word)
+        assert metrics.snapshot()['paths']['exists'] == {
+            'direct': 2, 'contraction': 1, 'morph': 0, 'plural': 1, 'miss': 1}
+
+    def test_bucket_and_rf_paths(self, recording):
+        bnc.bucket("it's")
+        bnc.relative_frequency('the')
+        bnc.expected_count('xyzabc123', 1000)
+        paths = metrics.snapshot()['paths']
+        assert paths['bucket']['contraction'] == 1
+        assert paths['relative_frequency']['direct'] == 1
+        assert paths['relative_frequency']['miss'] == 1
+
+    def test_results_unchanged(self, recording):
+        words = ['the', 'abjurations', "don't", 'xyzabc123']
+        enabled = [(bnc.exists(w), bnc.bucket(w), bnc.relative_frequency(w)) for w in words]
+        metrics.disable()
+        assert enabled == [(bnc.exists(w), bnc.bucket(w), bnc.relative_frequency(w)) for w in words]
+
+    def test_disabled_records_nothing(self):
+        metrics.reset()
+        bnc.exists('the')
+        assert metrics.snapshot() == {'enabled': False, 'paths': {}, 'loads': {}, 'latency': {}}
+
+
+class TestLoads:
+
+    def test_shard_load_recorded(self, recording, monkeypatch):
+        monkeypatch.setattr(find_bnc, '_cache', {})
+        bnc.exists('the')
+        loads = metrics.snapshot()['loads']['bnc_lookup.hs']
+        assert loads['count'] == 1
+        assert loads['max_ms'] >= 0
+
+    def test_warm_lookup_records_no_load(self, recording):
+        bnc.exists('the')
+        metrics.reset()
+        bnc.exists('the')
+        assert metrics.snapshot()['loads'] == {}
+
+
+class TestLatency:
+
+    def test_histogram_summary(self, recording):
+        for _ in range(100):
+            bnc.bucket('the')
+        latency = metrics.snapshot()['latency']['bucket']
+        assert latency['count'] == 100
+        assert latency['min_ns'] <= latency['p50_ns'] <= latency['p99_ns'] <= latency['max_ns']
+        assert sum(latency['buckets'].values()) == 100
+
+    def test_percentiles_on_known_values(self, recording):
+        for value in range(1, 1001):
+            metrics.record_latency('f', value)
+        latency = metrics.snapshot()['latency']['f']
+        assert latency['min_ns'] == 1
+        assert 500 <= latency['p50_ns'] <= 500 * 1.07
+        assert 990 <= latency['p99_ns'] <= 990 * 1.07
+        assert 1000 <= latency['max_ns'] <= 1000 * 1.07
+
+    @pytest.mark.parametrize('value', [0, 1, 31, 32, 33, 63, 64, 1000, 123_456_789])
+    def test_bucket_bounds(self, value):
+        index = _bucket_index(value)
+        assert value <= _bucket_upper(index)
+        assert index == 0 or _bucket_upper(index - 1) < value
+        assert _bucket_upper(index) - value <= value / 16
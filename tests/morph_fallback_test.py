@@ -0,0 +1,93 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Selectable inflection fallback: 'none', 'plural' and 'morph'."""
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup import find_lemma
+from bnc_lookup.find_lemma import _inflections, _is_cvc, _lookup_base
+
+
+@pytest.fixture(scope='module', autouse=True)
+def lemma_index(tmp_path_factory):
+    patch = pytest.MonkeyPatch()
+    patch.setenv('BNC_LOOKUP_CACHE', str(tmp_path_factory.mktemp('cache')))
+    patch.setattr(find_lemma, '_cache', {})
+    yield
+    patch.undo()
+
+
+class TestInflections:
+
+    @pytest.mark.parametrize('base,form', [
+        ('city', 'cities'),
+        ('box', 'boxes'),
+        ('church', 'churches'),
+        ('tweet', 'tweeted'),
+        ('carry', 'carried'),
+        ('bake', 'baked'),
+        ('bake', 'baking'),
+        ('lie', 'lying'),
+        ('stop', 'stopped'),
+        ('stop', 'stopping'),
+        ('chairman', 'chairmen'),
+        ('mouse', 'mice'),
+        ('knife', 'knives'),
+        ('analysis', 'analyses'),
+    ])
+    def test_generated(self, base, form):
+        assert form in _inflections(base)
+
+    @pytest.mark.parametrize('word,expected', [
+        ('stop', True), ('plan', True), ('visit', False), ('show', False), ('rain', False),
+    ])
+    def test_cvc(self, word, expected):
+        assert _is_cvc(word) is expected
+
+
+class TestMorphFallback:
+
+    def test_morph_resolves_inflection(self):
+        assert bnc.exists('tweeted') is False
+        assert bnc.exists('tweeted', fallback='morph') is True
+        assert _lookup_base('tweeted') == 'tweet'
+
+    def test_morph_bucket_and_rf_match_base(self):
+        assert bnc.bucket('tweeted', fallback='morph') == bnc.bucket('tweet')
+        assert bnc.relative_frequency('tweeted', fallback='morph') == bnc.relative_frequency('tweet')
+
+    def test_morph_expected_count(self):
+        assert bnc.expected_count('tweeted', 1000, fallback='morph') == bnc.expected_count('tweet', 1000)
+
+    def test_direct_hit_wins(self):
+        assert bnc.bucket('the', fallback='morph') == 1
+        assert bnc.bucket('mice', fallback='morph') == bnc.bucket('mice')
+
+    def test_morph_keeps_plural_rule(self):
+        assert bnc.exists('xyzs', fallback='morph') is True
+
+    def test_morph_unknown_word(self):
+        assert bnc.exists('xyzabc123', fallback='morph') is False
+        assert bnc.bucket('xyzabc123', fallback='morph') is None
+        assert bnc.relative_frequency('xyzabc123', fallback='morph') is None
+
+
+class TestFallbackModes:
+
+    def test_plural_is_default(self):
+        assert bnc.exists('xyzs') is True
+        assert bnc.exists('xyzs', fallback='plural') is True
+
+    def test_none_disables_plural(self):
+        assert bnc.exists('xyzs', fallback='none') is False
+        assert bnc.bucket('xyzs', fallback='none') is None
+        assert bnc.relative_frequency('xyzs', fallback='none') is None
+
+    def test_none_keeps_contractions(self):
+        assert bnc.bucket("don't", fallback='none') == 1
+
+    @pytest.mark.parametrize('func', [bnc.exists, bnc.bucket, bnc.relative_frequency])
+    def test_invalid_mode(self, func):
+        with pytest.raises(ValueError):
+            func('the', fallback='stem')
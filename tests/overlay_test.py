@@ -0,0 +1,169 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for domain lexicon overlays."""
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup import overlay
+from bnc_lookup.find_batch import FindBatch
+from bnc_lookup.freq.bounds import max_counts, total
+
+
+@pytest.fixture(autouse=True)
+def _clear():
+    yield
+    bnc.clear_overlay()
+
+
+@pytest.fixture
+def terms(tmp_path):
+    source = tmp_path / 'terms.txt'
+    source.write_text('# product terms\nkubernetes\t250\nGrafana 40\nservice mesh\n\nhello\t5000000\n',
+                      encoding='utf-8')
+    output = tmp_path / 'terms_overlay.py'
+    assert bnc.compile_overlay(source, output, tokens=10_000_000) == 4
+    return output
+
+
+class TestRebase:
+
+    def test_no_count_is_one_bnc_occurrence(self):
+        assert overlay.rebase(None) == (100, 1 / total)
+
+    def test_zero_count_is_one_bnc_occurrence(self):
+        assert overlay.rebase(0) == (100, 1 / total)
+        assert overlay.rebase(0, tokens=1000) == (100, 1 / total)
+
+    def test_bnc_scale_by_default(self):
+        assert overlay.rebase(max_counts[1]) == (2, max_counts[1] / total)
+        assert overlay.rebase(max_counts[1] + 1)[0] == 1
+
+    def test_rescales_to_bnc_corpus_size(self):
+        bucket, rf = overlay.rebase(50, tokens=1_000_000)
+        assert rf == 5e-05
+        assert bucket == overlay.rebase(5e-05 * total)[0]
+
+    def test_bucket_matches_bnc_words_of_same_frequency(self):
+        bucket, _ = overlay.rebase(bnc.relative_frequency('computer', fallback='none') * total)
+        assert abs(bucket - bnc.bucket('computer')) <= 1
+
+    def test_rarer_than_any_bnc_word(self):
+        assert overlay.rebase(0.1)[0] == 100
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match='negative'):
+            overlay.rebase(-1)
+        with pytest.raises(ValueError, match='negative'):
+            overlay.rebase(-1, tokens=1000)
+        with pytest.raises(ValueError):
+            overlay.rebase(5, tokens=0)
+
+
+class TestCompile:
+
+    def test_word_list_parsing(self, tmp_path):
+        source = tmp_path / 'words.txt'
+        source.write_text('alpha\t3\nbeta 7\ngamma delta\nepsilon 2.5\n', encoding='utf-8')
+        assert list(overlay._read_word_list(str(source))) == [
+            ('alpha', 3.0), ('beta', 7.0), ('gamma delta', None), ('epsilon', 2.5)]
+
+    def test_bad_tab_count(self, tmp_path):
+        source = tmp_path / 'words.txt'
+        source.write_text('alpha\tmany\n', encoding='utf-8')
+        with pytest.raises(ValueError, match='words.txt:1'):
+            bnc.compile_overlay(source, tmp_path / 'out.py')
+
+    def test_zero_count_floored_negative_rejected(self, tmp_path):
+        output = tmp_path / 'out.py'
+        bnc.compile_overlay([('zorbflux', 0)], output, tokens=1000)
+        bnc.load_overlay(output)
+        assert bnc.relative_frequency('zorbflux') == float(f'{1 / total:.6e}') > 0
+        assert bnc.bucket('zorbflux') == 100
+        with pytest.raises(ValueError, match='negative'):
+            bnc.compile_overlay([('zorbflux', -2)], output, tokens=1000)
+
+    def test_iterable_source_merges_counts(self, tmp_path):
+        output = tmp_path / 'out.py'
+        assert bnc.compile_overlay(['Zorbix', ('zorbix', 2), ('ZORBIX', 3), ''], output) == 1
+        bnc.load_overlay(output)
+        assert bnc.relative_frequency('zorbix') == pytest.approx(5 / total, rel=1e-6)
+
+    def test_output_is_deterministic(self, tmp_path):
+        first, second = tmp_path / 'a.py', tmp_path / 'b.py'
+        bnc.compile_overlay([('b', 1), ('a', 2)], first)
+        bnc.compile_overlay([('a', 2), ('b', 1)], second)
+        assert first.read_bytes() == second.read_bytes()
+
+
+class TestLookups:
+
+    def test_adds_missing_words(self, terms):
+        assert not bnc.exists('kubernetes')
+        assert bnc.bucket('kubernetes') is None
+        assert bnc.load_overlay(terms) == 4
+        assert bnc.exists('kubernetes')
+        assert bnc.exists('Kubernetes')
+        assert bnc.exists('service mesh')
+        assert bnc.bucket('kubernetes') == overlay.rebase(250, tokens=10_000_000)[0]
+        assert bnc.relative_frequency('kubernetes') == pytest.approx(2.5e-05)
+        assert bnc.expected_count('grafana', 1_000_000) == pytest.approx(4.0)
+
+    def test_fallbacks_apply_to_overlay_words(self, terms):
+        bnc.load_overlay(terms)
+        assert bnc.exists('grafanas')
+        assert bnc.bucket('grafanas') == bnc.bucket('grafana')
+        assert not bnc.exists('grafanas', fallback='none')
+
+    def test_overrides_bnc_word(self, terms):
+        before = bnc.relative_frequency('hello')
+        bnc.load_overlay(terms)
+        assert bnc.relative_frequency('hello') == pytest.approx(0.5)
+        assert bnc.bucket('hello') == 1
+        bnc.clear_overlay()
+        assert bnc.relative_frequency('hello') == before
+
+    def test_bnc_words_unaffected(self, terms):
+        bnc.load_overlay(terms)
+        assert bnc.bucket('the') == 1
+        assert bnc.exists('computer')
+        assert not bnc.exists('xyzabc123')
+
+    def test_clear(self, terms):
+        bnc.load_overlay(terms)
+        bnc.clear_overlay()
+        assert not bnc.exists('kubernetes')
+
+    def test_batch_memo_follows_overlay(self, terms):
+        batch = FindBatch()
+        assert batch.exists(['kubernetes', 'the']) == [False, True]
+        bnc.load_overlay(terms)
+        assert batch.exists(['kubernetes', 'the']) == [True, True]
+        assert bnc.bucket_batch(['grafana'])[0] is not None
+
+    def test_segmentation_sees_overlay(self, tmp_path):
+        output = tmp_path / 'out.py'
+        bnc.compile_overlay([('grafana', 1000), ('kubernetes', 1000)], output)
+        assert bnc.segment('grafanathe') != ['grafana', 'the']
+        bnc.load_overlay(output)
+        assert bnc.segment('grafanathe') == ['grafana', 'the']
+        assert bnc.segment('kubernetesgrafana') == ['kubernetes', 'grafana']
+
+
+class TestLoad:
+
+    def test_rejects_non_overlay(self, tmp_path):
+        path = tmp_path / 'other.py'
+        path.write_text('x = 1\n', encoding='utf-8')
+        with pytest.raises(ValueError):
+            bnc.load_overlay(path)
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(OSError):
+            bnc.load_overlay(tmp_path / 'missing.py')
+
+    def test_version_changes(self, terms):
+        before = overlay.version
+        bnc.load_overlay(terms)
+        bnc.clear_overlay()
+        assert overlay.version == before + 2
@@ -0,0 +1,58 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Multi-process corpus scoring."""
+
+from pathlib import Path
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup.parallel import _chunks, _read_lines, score_files
+
+TEXT = 'The cats sat on the mat\n\nxyzabc123 and\tthe dogs ran\r\nlast line without newline'
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    first = tmp_path / 'a.txt'
+    first.write_text(TEXT, encoding='utf-8')
+    second = tmp_path / 'b.txt'
+    second.write_text('of ' * 500 + '\nzebra python\n', encoding='utf-8')
+    empty = tmp_path / 'empty.txt'
+    empty.write_text('', encoding='utf-8')
+    return [str(first), str(empty), str(second)]
+
+
+def _flatten(results):
+    return [(path, token, b) for path, tokens, buckets in results for token, b in zip(tokens, buckets)]
+
+
+class TestChunking:
+
+    @pytest.mark.parametrize('chunk_bytes', [1, 3, 7, 16, 1000])
+    def test_ranges_cover_every_line_once(self, corpus, chunk_bytes):
+        path = corpus[0]
+        lines = [line for _, start, end in _chunks([path], chunk_bytes) for line in _read_lines(path, start, end)]
+        with open(path, 'rb') as f:
+            assert lines == f.readlines()
+
+
+class TestScoreFiles:
+
+    def test_matches_single_word_api(self, corpus):
+        expected = [(p, t, bnc.bucket(t)) for p in corpus for t in Path(p).read_text(encoding='utf-8').split()]
+        assert _flatten(score_files(corpus, workers=1)) == expected
+
+    def test_same_result_for_any_worker_count_and_chunk_size(self, corpus):
+        baseline = _flatten(score_files(corpus, workers=1))
+        assert _flatten(score_files(corpus, workers=2, chunk_bytes=64)) == baseline
+        assert _flatten(score_files(corpus, workers=3, chunk_bytes=5)) == baseline
+
+    def test_fallback_none(self, corpus):
+        results = _flatten(score_files(corpus[:1], workers=1, fallback='none'))
+        assert ('cats', bnc.bucket('cats', fallback='none')) in [(t, b) for _, t, b in results]
+
+    @pytest.mark.parametrize('kwargs', [{'workers': 0}, {'chunk_bytes': 0}, {'fallback': 'stem'}])
+    def test_invalid_arguments(self, corpus, kwargs):
+        with pytest.raises(ValueError):
+            score_files(corpus, **kwargs)
@@ -0,0 +1,142 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Zipf scores and frequency percentiles from one-byte codes."""
+
+import hashlib
+import math
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup.find_scores import PERCENTILE_VALUES, ZIPF_VALUES, FindScores, percentile_code, zipf_code
+from bnc_lookup.freq.bounds import total
+from bnc_lookup.rf.scores import percentile_codes, zipf_codes
+
+WORDS = ['the', 'The', 'cat', 'cats', 'xyzs', 'zebra', 'geese', 'tweeted', "don't", "we'll", "it's", 'café',
+         'xyzabc123', '']
+
+
+@pytest.fixture(autouse=True)
+def _clear():
+    yield
+    bnc.clear_overlay()
+
+
+class TestCodes:
+
+    def test_zipf_code_error_bound(self):
+        for count in (1, 2, 3, 10, 99, 1234, 56789, 6_187_267):
+            rf = count / total
+            assert abs(ZIPF_VALUES[zipf_code(rf)] - (math.log10(rf) + 9)) <= 1 / 64
+
+    def test_zipf_code_clamps(self):
+        assert zipf_code(1e-12) == 1
+        assert zipf_code(0.0) == 1
+        assert zipf_code(1.0) == 255
+
+    def test_percentile_code_error_bound(self):
+        for p in (0, 0.1, 12.34, 50, 99.9, 100):
+            assert abs(PERCENTILE_VALUES[percentile_code(p)] - p) <= 50 / 254
+
+    def test_code_zero_is_not_found(self):
+        assert ZIPF_VALUES[0] is None and PERCENTILE_VALUES[0] is None
+        assert len(ZIPF_VALUES) == len(PERCENTILE_VALUES) == 256
+
+    def test_tables_cover_same_frequencies(self):
+        assert zipf_codes.keys() == percentile_codes.keys()
+        assert all(1 <= code <= 255 for code in zipf_codes.values())
+
+    def test_percentile_codes_follow_frequency(self):
+        codes = [percentile_codes[rf] for rf in sorted(percentile_codes)]
+        assert codes == sorted(codes)
+        assert codes[-1] == 255
+
+
+class TestSingleWords:
+
+    @pytest.mark.parametrize('fallback', ['none', 'plural', 'morph'])
+    def test_zipf_matches_log10(self, fallback):
+        for word in WORDS:
+            rf = bnc.relative_frequency(word, fallback=fallback)
+            score = bnc.zipf(word, fallback=fallback)
+            if rf is None:
+                assert score is None, word
+            else:
+                assert abs(score - (math.log10(rf) + 9)) <= 1 / 64 + 1e-9, word
+
+    def test_known_values(self):
+        assert bnc.zipf('the') == 7.78125
+        assert bnc.percentile('the') == 100.0
+        assert bnc.percentile('zebra') < bnc.percentile('cat') < bnc.percentile('the')
+
+    def test_not_found(self):
+        assert bnc.zipf('xyzabc123') is None
+        assert bnc.percentile('xyzabc123') is None
+
+    def test_fallback(self):
+        assert bnc.zipf('xyzs', fallback='none') is None
+        assert bnc.zipf('xyzs') == bnc.zipf('xyz', fallback='none')
+        assert bnc.percentile('tweeted', fallback='morph') == bnc.percentile('tweet')
+
+    def test_invalid_fallback(self):
+        with pytest.raises(ValueError):
+            bnc.zipf('cat', fallback='stem')
+        with pytest.raises(ValueError):
+            FindScores(fallback='stem')
+
+
+class TestBatch:
+
+    def test_codes_match_single_words(self):
+        tokens = WORDS * 3
+        zipf = bnc.zipf_codes(iter(tokens))
+        percentile = bnc.percentile_codes(tokens)
+        assert isinstance(zipf, bytes) and len(zipf) == len(tokens)
+        assert [ZIPF_VALUES[c] for c in zipf] == [bnc.zipf(word) for word in tokens]
+        assert [PERCENTILE_VALUES[c] for c in percentile] == [bnc.percentile(word) for word in tokens]
+
+    def test_not_found_is_zero(self):
+        assert bnc.zipf_codes(['xyzabc123', 'the']) == bytes([0, zipf_codes[bnc.relative_frequency('the')]])
+
+    def test_empty(self):
+        assert bnc.zipf_codes([]) == b''
+
+
+class TestOverlay:
+
+    def test_overlay_frequency_encoded_on_the_fly(self, tmp_path):
+        source = tmp_path / 'terms.txt'
+        source.write_text('kubernetes\t250\n', encoding='utf-8')
+        output = tmp_path / 'terms_overlay.py'
+        bnc.compile_overlay(source, output, tokens=10_000_000)
+        bnc.load_overlay(output)
+        rf = bnc.relative_frequency('kubernetes')
+        assert rf not in zipf_codes
+        assert abs(bnc.zipf('kubernetes') - (math.log10(rf) + 9)) <= 1 / 64
+        # Percentile of the closest BNC frequency at or below it
+        below = max(f for f in percentile_codes if f <= rf)
+        assert bnc.percentile('kubernetes') == PERCENTILE_VALUES[percentile_codes[below]]
+
+    def test_overlay_word_with_count_zero(self, tmp_path):
+        output = tmp_path / 'zero_overlay.py'
+        bnc.compile_overlay([('zorbflux', 0)], output, tokens=1000)
+        bnc.load_overlay(output)
+        assert bnc.zipf('zorbflux') == ZIPF_VALUES[1]
+        assert bnc.zipf_codes(['zorbflux']) == b'\x01'
+        # Overlays compiled before zero counts were floored hold a frequency of 0.0
+        digest = hashlib.md5(b'zorbflux').hexdigest()
+        output.write_text(f"entries = {{'{digest}': (100, 0.0)}}\n", encoding='utf-8')
+        bnc.load_overlay(output)
+        assert bnc.zipf('zorbflux') == ZIPF_VALUES[1]
+        assert bnc.zipf_codes(['zorbflux']) == b'\x01'
+        assert bnc.percentile('zorbflux') == PERCENTILE_VALUES[1]
+
+    def test_batch_sees_overlay_changes(self, tmp_path):
+        finder = FindScores()
+        assert finder.zipf_codes(['kubernetes']) == b'\x00'
+        source = tmp_path / 'terms.txt'
+        source.write_text('kubernetes\t250\n', encoding='utf-8')
+        output = tmp_path / 'terms_overlay.py'
+        bnc.compile_overlay(source, output, tokens=10_000_000)
+        bnc.load_overlay(output)
+        assert finder.zipf_codes(['kubernetes']) != b'\x00'
@@ -0,0 +1,138 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Lookup daemon protocol and CLI forwarding."""
+
+import os
+import shutil
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup import cli, server
+from bnc_lookup.server import Client, _answer, _Handler, serve
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='requires Unix sockets')
+
+
+@pytest.fixture
+def daemon(monkeypatch):
+    # A short directory keeps the socket path under the AF_UNIX length limit
+    directory = tempfile.mkdtemp(prefix='bnc')
+    path = os.path.join(directory, 'bnc.sock')
+    server = socketserver.ThreadingUnixStreamServer(path, _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv('BNC_LOOKUP_SOCKET', path)
+    yield path
+    server.shutdown()
+    server.server_close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class TestAnswer:
+
+    def test_commands(self):
+        assert _answer('exists\tthe') == 'True'
+        assert _answer('exists\txyzabc123') == 'False'
+        assert _answer('bucket\tthe') == '1'
+        assert _answer('freq\tthe') == f"{bnc.relative_frequency('the'):.6e}"
+        assert _answer('expected\tthe\t50000') == f"{bnc.expected_count('the', 50000):.4f}"
+        assert _answer('expected\tthe\t50000\trounded') == str(bnc.expected_count('the', 50000, rounded=True))
+
+    def test_fallback_field(self):
+        assert _answer('bucket\tcats\tnone') == str(bnc.bucket('cats', fallback='none'))
+
+    @pytest.mark.parametrize('line', ['lemma\tthe', 'bucket', 'exists\tthe\tstem', 'expected\tthe\tmany',
+                                      'expected\tthe\t50000\tx'])
+    def test_errors(self, line):
+        assert _answer(line).startswith('ERR\t')
+
+
+class TestDaemon:
+
+    def test_request(self, daemon):
+        with Client(daemon) as client:
+            assert client.request('bucket', 'the') == '1'
+            assert client.request('exists', 'xyzabc123') == 'False'
+
+    def test_pipelined_requests_keep_order(self, daemon, monkeypatch):
+        monkeypatch.setattr('bnc_lookup.server._WINDOW', 3)
+        words = ['the', 'xyzabc123', 'of', 'cats', 'and'] * 4
+        with Client(daemon) as client:
+            responses = client.requests([f'bucket\t{w}' for w in words])
+        assert responses == [str(bnc.bucket(w)) for w in words]
+
+    def test_no_daemon(self, tmp_path):
+        with pytest.raises(OSError):
+            Client(str(tmp_path / 'missing.sock'))
+
+    def test_serve_refuses_running_daemon(self, daemon):
+        with pytest.raises(RuntimeError):
+            serve(daemon, preload=False)
+
+    @pytest.mark.parametrize('fields', [('bucket', 'the\tnone'), ('bucket', 'the\nof'), ('exists\tthe',)])
+    def test_fields_breaking_protocol_rejected(self, daemon, fields):
+        with Client(daemon) as client:
+            with pytest.raises(ValueError, match='tabs or newlines'):
+                client.request(*fields)
+            with pytest.raises(ValueError, match='newlines'):
+                client.requests(['bucket\tthe', 'bucket\tthe\nof'])
+            assert client.request('bucket', 'the') == '1'
+
+    def test_foreign_socket_refused(self, daemon, monkeypatch):
+        monkeypatch.setattr(os, 'getuid', lambda: os.geteuid() + 1)
+        with pytest.raises(PermissionError, match='another user'):
+            Client(daemon)
+        with pytest.raises(RuntimeError, match='another user'):
+            serve(daemon, preload=False)
+        assert os.path.exists(daemon)
+
+    def test_file_not_replaced(self, tmp_path):
+        path = tmp_path / 'bnc.sock'
+        path.write_text('not a socket')
+        with pytest.raises(PermissionError, match='not a socket'):
+            Client(str(path))
+        with pytest.raises(RuntimeError, match='not a socket'):
+            serve(str(path), preload=False)
+        assert path.read_text() == 'not a socket'
+
+    def test_default_path_private_directory(self, monkeypatch):
+        monkeypatch.delenv('BNC_LOOKUP_SOCKET', raising=False)
+        monkeypatch.delenv('XDG_RUNTIME_DIR', raising=False)
+        path = server.socket_path()
+        assert os.path.dirname(path) == os.path.join(tempfile.gettempdir(), f'bnc-lookup-{os.getuid()}')
+
+
+class TestCliForwarding:
+
+    def _run(self, monkeypatch, capsys, entry, argv):
+        monkeypatch.setattr(sys, 'argv', argv)
+        with pytest.raises(SystemExit) as e:
+            entry()
+        return e.value.code, capsys.readouterr().out
+
+    def test_forwarded(self, daemon, monkeypatch, capsys):
+        assert self._run(monkeypatch, capsys, cli.bucket, ['bnc-bucket', 'the']) == (0, '1\n')
+        assert self._run(monkeypatch, capsys, cli.exists, ['bnc-exists', 'xyzabc123']) == (1, 'False\n')
+
+    def test_answer_comes_from_daemon(self, daemon, monkeypatch, capsys):
+        monkeypatch.setattr('bnc_lookup.server._answer', lambda line: '42')
+        assert self._run(monkeypatch, capsys, cli.bucket, ['bnc-bucket', 'the']) == (0, '42\n')
+
+    def test_daemon_error_answers_in_process(self, daemon, monkeypatch, capsys):
+        monkeypatch.setattr('bnc_lookup.server._answer', lambda line: 'ERR\tboom')
+        assert self._run(monkeypatch, capsys, cli.exists, ['bnc-exists', 'the']) == (0, 'True\n')
+
+    def test_tab_in_word_answers_in_process(self, daemon, monkeypatch, capsys):
+        monkeypatch.setattr('bnc_lookup.server._answer', lambda line: '42')
+        assert self._run(monkeypatch, capsys, cli.bucket, ['bnc-bucket', 'the\tnone']) == (1, 'None\n')
+
+    def test_falls_back_without_daemon(self, monkeypatch, capsys, tmp_path):
+        monkeypatch.setenv('BNC_LOOKUP_SOCKET', str(tmp_path / 'missing.sock'))
+        assert self._run(monkeypatch, capsys, cli.exists, ['bnc-exists', 'the']) == (0, 'True\n')
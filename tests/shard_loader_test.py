@@ -0,0 +1,73 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Once-only shard loading under concurrent callers."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup import find_freq
+from bnc_lookup.shard_loader import import_table, load_once
+
+
+class TestLoadOnce:
+
+    def test_concurrent_callers_share_one_load(self):
+        cache, calls = {}, []
+
+        def load():
+            calls.append(1)
+            time.sleep(0.05)
+            return 'value'
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(lambda _: load_once(cache, 'k', load), range(16)))
+        assert results == ['value'] * 16
+        assert calls == [1]
+        assert cache == {'k': 'value'}
+
+    def test_different_keys_load_in_parallel(self):
+        cache, barrier = {}, threading.Barrier(2, timeout=5)
+
+        def load(key):
+            barrier.wait()  # Deadlocks (times out) if the two keys were serialized
+            return key
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            assert sorted(pool.map(lambda k: load_once(cache, k, load, k), ['a', 'b'])) == ['a', 'b']
+
+    def test_failed_load_is_retried(self):
+        cache = {}
+
+        def fail():
+            raise RuntimeError('boom')
+
+        with pytest.raises(RuntimeError):
+            load_once(cache, 'k', fail)
+        assert 'k' not in cache
+        assert load_once(cache, 'k', lambda: 1) == 1
+
+    def test_cached_value_is_not_reloaded(self):
+        cache = {'k': 'cached'}
+        assert load_once(cache, 'k', lambda: pytest.fail('reloaded')) == 'cached'
+
+    def test_import_table(self):
+        assert import_table('bnc_lookup.bw.bw_01', 'count_01') == len(bnc.words(1))
+        heads, blocks = import_table('bnc_lookup.bw.bw_01', 'heads_01', 'blocks_01')
+        assert len(heads) == len(blocks)
+
+
+class TestConcurrentLookups:
+
+    def test_racing_threads_import_each_shard_once(self, monkeypatch):
+        monkeypatch.setattr(find_freq, '_cache', {})
+        imports = []
+        monkeypatch.setattr(find_freq, 'import_table', lambda *a: imports.append(a[0]) or import_table(*a))
+        words = ['the', 'of', 'zebra', 'python', 'xyzabc123'] * 20
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(bnc.bucket, words))
+        assert results == [bnc.bucket(w) for w in words]
+        assert len(imports) == len(set(imports))
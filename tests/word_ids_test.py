@@ -0,0 +1,71 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Tests for dense integer word IDs."""
+
+from array import array
+
+import pytest
+
+import bnc_lookup as bnc
+from bnc_lookup import front_coding
+from bnc_lookup.find_word_ids import FindWordIds
+from bnc_lookup.find_words import _get_bucket_words
+
+
+class TestWordIds:
+
+    def test_range(self):
+        assert len(FindWordIds()) == 669_416
+        assert bnc.word_from_id(0) == _get_bucket_words(1)[0]
+        assert bnc.word_from_id(669_415) == _get_bucket_words(100)[-1]
+
+    def test_round_trip(self):
+        for i in range(0, 669_416, 4_999):
+            assert bnc.word_id(bnc.word_from_id(i), fallback='none') == i
+
+    def test_bucket_order(self):
+        assert bnc.word_id('the') < bnc.word_id('zebra') < bnc.word_id('zydeco')
+        assert bnc.word_from_id(bnc.word_id('zydeco')) == 'zydeco'
+
+    def test_out_of_range(self):
+        for i in (-1, 669_416):
+            with pytest.raises(ValueError, match='word_id must be 0-669415'):
+                bnc.word_from_id(i)
+
+
+class TestFallback:
+
+    def test_normalized(self):
+        assert bnc.word_id('The') == bnc.word_id(' the ') == bnc.word_id('the')
+
+    def test_plural(self):
+        assert bnc.word_id('zydecos') == bnc.word_id('zydeco')
+        assert bnc.word_id('zydecos', fallback='none') is None
+
+    def test_morph(self):
+        assert bnc.word_id('tweeted', fallback='none') is None
+        assert bnc.word_id('tweeted', fallback='morph') == bnc.word_id('tweet')
+
+    def test_split_contraction_has_no_id(self):
+        assert bnc.exists("we'll") and bnc.word_id("we'll") is None
+
+    def test_unknown_fallback(self):
+        with pytest.raises(ValueError):
+            bnc.word_id('the', fallback='stem')
+
+
+class TestBatch:
+
+    def test_word_ids(self):
+        ids = bnc.word_ids(['the', 'The', 'qzxv', 'tweeted'], fallback='morph')
+        assert isinstance(ids, array) and ids.typecode == 'i'
+        assert list(ids) == [bnc.word_id('the')] * 2 + [-1, bnc.word_id('tweet')]
+
+
+def test_front_coding_index():
+    words = tuple(sorted(f'w{i:03d}' for i in range(0, 100, 3)))
+    heads, blocks = front_coding.encode(words)
+    assert [front_coding.index(heads, blocks, w) for w in words] == list(range(len(words)))
+    assert front_coding.index(heads, blocks, 'w001') is None
+    assert front_coding.index(heads, blocks, 'a') is None
+    assert front_coding.index(heads, blocks, 'zzz') is None